@@ -9,24 +9,27 @@
 SCRIPTDIR="`realpath \"$0\"`"
 cd "`dirname \"${SCRIPTDIR}\"`"
 
-#  Generate bundle.
+#  Generate bundles.
 node bundle.js
 if [ "$?" != "0" ]; then
     exit 1
 fi
-npx javascript-obfuscator "dist/lc3.js" --compact true --identifier-names-generator mangled --string-array false --rename-globals true --output "dist/lc3.min.js"
-if [ "$?" != "0" ]; then
-    exit 1
-fi
 
-#  Generate ES5-compatible script.
-npx babel "dist/lc3.js" --out-file "dist/lc3.es5.js"
-if [ "$?" != "0" ]; then
-    exit 1
-fi
-npx javascript-obfuscator "dist/lc3.es5.js" --compact true --identifier-names-generator mangled --string-array false --rename-globals true --output "dist/lc3.es5.min.js"
-if [ "$?" != "0" ]; then
-    exit 1
-fi
+#  Generate minified and ES5-compatible scripts (of both the default and the 
+#  unrolled bundles).
+for BUNDLE in "lc3" "lc3-unrolled"; do
+    npx javascript-obfuscator "dist/${BUNDLE}.js" --compact true --identifier-names-generator mangled --string-array false --rename-globals true --output "dist/${BUNDLE}.min.js"
+    if [ "$?" != "0" ]; then
+        exit 1
+    fi
+    npx babel "dist/${BUNDLE}.js" --out-file "dist/${BUNDLE}.es5.js"
+    if [ "$?" != "0" ]; then
+        exit 1
+    fi
+    npx javascript-obfuscator "dist/${BUNDLE}.es5.js" --compact true --identifier-names-generator mangled --string-array false --rename-globals true --output "dist/${BUNDLE}.es5.min.js"
+    if [ "$?" != "0" ]; then
+        exit 1
+    fi
+done
 
 exit $?
\ No newline at end of file
@@ -20,24 +20,40 @@ const Path = require("path");
 const CONFIG_GLOBAL = "window";
 const CONFIG_NAMESPACE = "LC3";
 const CONFIG_OUTFILE = Path.join(__dirname, "dist", "lc3.js");
+const CONFIG_OUTFILE_UNROLLED = Path.join(__dirname, "dist", "lc3-unrolled.js");
 
 //
-//  Main.
+//  Private functions.
 //
-(function() {
-    //  Read template.
-    let template = FS.readFileSync(Path.join(__dirname, "template.txt"), {
-        "encoding": "utf-8"
-    });
 
-    //  Read module list.
-    let module_list = JSON.parse(FS.readFileSync(
-        Path.join(__dirname, "modules.json"), 
+/**
+ *  Read a module list.
+ * 
+ *  @param {String} name 
+ *    - The file name of the module list.
+ *  @returns {String[]}
+ *    - The module paths.
+ */
+function ReadModuleList(name) {
+    return JSON.parse(FS.readFileSync(
+        Path.join(__dirname, name), 
         {
             "encoding": "utf-8"
         }
     ));
+}
 
+/**
+ *  Generate a bundle.
+ * 
+ *  @param {String} template 
+ *    - The bundle template.
+ *  @param {String[]} module_list 
+ *    - The module paths.
+ *  @param {String} outfile 
+ *    - The output file path.
+ */
+function GenerateBundle(template, module_list, outfile) {
     //  Generate script.
     let module_root = Path.join(__dirname, "..");
     let module_generated = "{\n";
@@ -67,7 +83,30 @@ const CONFIG_OUTFILE = Path.join(__dirname, "dist", "lc3.js");
     output = output.replace("${BUILD_MODULE_DATA}", module_generated);
     
     //  Write output file.
-    FS.writeFileSync(CONFIG_OUTFILE, output, {
+    FS.writeFileSync(outfile, output, {
         "encoding": "utf-8"
     });
+}
+
+//
+//  Main.
+//
+(function() {
+    //  Read template.
+    let template = FS.readFileSync(Path.join(__dirname, "template.txt"), {
+        "encoding": "utf-8"
+    });
+
+    //  Read module lists (the unrolled kernels, see EnableUnrolledKernels() 
+    //  of the MDCT module, are only bundled by the unrolled bundle).
+    let module_list = ReadModuleList("modules.json");
+    let module_list_unrolled = ReadModuleList("modules-unrolled.json");
+
+    //  Generate bundles.
+    GenerateBundle(template, module_list, CONFIG_OUTFILE);
+    GenerateBundle(
+        template, 
+        module_list.concat(module_list_unrolled), 
+        CONFIG_OUTFILE_UNROLLED
+    );
 })();
\ No newline at end of file
@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+#
+#  Copyright 2021 - 2023 XiaoJSoft Studio. All rights reserved.
+#  Use of this source code is governed by a BSD-style license that can be
+#  found in the LICENSE.md file.
+#
+
+#
+#  Kernel metrics baseline (regression gate).
+#
+#  Usage:
+#    ./baseline.py compare [--tolerance T]
+#    ./baseline.py update
+#
+#  Note(s):
+#    [1] The metrics files (see the "metrics" module of the kernel IR) are
+#        written by the compilers (to the "metrics" folder) on each build,
+#        the baseline (BASELINE_PATH) is checked in.
+#    [2] "compare" compares the metrics of all kernels with the baseline, it
+#        fails (with exit code 1) if any metric of any kernel gets larger than
+#        its baseline value (by more than the tolerance, relative to the
+#        baseline value), or if the metrics file of any output file in the
+#        baseline doesn't exist. New and removed kernels are reported but
+#        don't fail the comparison.
+#    [3] "update" replaces the baseline with the current metrics, run it
+#        (and check in the baseline) after an intended change of the
+#        generated kernels.
+#
+
+import os
+import sys
+import json
+import glob
+import argparse
+
+
+#  File/folder settings.
+BASE_DIR = os.path.dirname(os.path.realpath(__file__))
+METRICS_DIR = os.path.join(BASE_DIR, "metrics")
+BASELINE_PATH = os.path.join(BASE_DIR, "metrics-baseline.json")
+
+#  Import the kernel IR modules.
+sys.path.insert(0, os.path.join(BASE_DIR, "kernel-ir"))
+from metrics import METRIC_KEYS
+
+
+def load_json(path):
+    fp = open(path, "r", encoding="utf-8")
+    data = json.loads(fp.read())
+    fp.close()
+    return data
+
+
+def load_current():
+    #  Load all metrics files, returns {output file: {kernel: metrics}}.
+    current = {}
+    for path in sorted(glob.glob(os.path.join(METRICS_DIR, "*.json"))):
+        data = load_json(path)
+        current[data["output"]] = data["kernels"]
+    return current
+
+
+def change_text(key, old, new):
+    if old == 0:
+        return "%s %d => %d" % (key, old, new)
+    return "%s %d => %d (%+.1f%%)" % (key, old, new, 100 * (new - old) / old)
+
+
+def compare(baseline, current, tolerance):
+    #  Compare the current metrics with the baseline, returns the count of
+    #  failures.
+    failures = 0
+    improved = 0
+    for output in sorted(set(baseline.keys()) | set(current.keys())):
+        lines = []
+        if output not in current:
+            lines.append("  Not generated (run \"build.py\" first).")
+            failures += 1
+        elif output not in baseline:
+            lines.append("  New output file (not in the baseline).")
+        else:
+            old_kernels = baseline[output]
+            new_kernels = current[output]
+            for name in sorted(set(old_kernels.keys()) | set(new_kernels.keys())):
+                if name not in new_kernels:
+                    lines.append("  %s: removed." % name)
+                    continue
+                if name not in old_kernels:
+                    lines.append("  %s: new (not in the baseline)." % name)
+                    continue
+                worse = []
+                better = []
+                for key in METRIC_KEYS:
+                    old = old_kernels[name].get(key, 0)
+                    new = new_kernels[name].get(key, 0)
+                    if new > old * (1 + tolerance):
+                        worse.append(change_text(key, old, new))
+                    elif new < old:
+                        better.append(change_text(key, old, new))
+                if len(worse) != 0:
+                    lines.append("  %s: REGRESSED, %s." % (name, ", ".join(worse + better)))
+                    failures += 1
+                elif len(better) != 0:
+                    lines.append("  %s: improved, %s." % (name, ", ".join(better)))
+                    improved += 1
+        if len(lines) != 0:
+            print(":: %s ::" % output)
+            for line in lines:
+                print(line)
+    if improved != 0:
+        print("%d kernel(s) improved, run \"baseline.py update\" to record the new baseline." % improved)
+    return failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare the kernel metrics with the baseline.")
+    parser.add_argument("command", choices=["compare", "update"], help="the command")
+    parser.add_argument("--tolerance", type=float, default=0.0, help="allowed relative increase of each metric")
+    args = parser.parse_args()
+    
+    current = load_current()
+    if args.command == "update":
+        if len(current) == 0:
+            print("No metrics file (run \"build.py\" first).")
+            return 1
+        fp = open(BASELINE_PATH, "w", encoding="utf-8")
+        fp.write(json.dumps(current, indent=4, sort_keys=True))
+        fp.close()
+        print("OK! %d kernel(s) of %d output file(s) recorded." % (
+            sum([len(kernels) for kernels in current.values()]),
+            len(current)
+        ))
+        return 0
+    
+    if not os.path.exists(BASELINE_PATH):
+        print("No baseline (run \"baseline.py update\" first).")
+        return 1
+    failures = compare(load_json(BASELINE_PATH), current, args.tolerance)
+    if failures != 0:
+        print("Failed! %d regression(s)." % failures)
+        return 1
+    print("OK!")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,297 @@
+#!/usr/bin/env python3
+#
+#  Copyright 2021 - 2023 XiaoJSoft Studio. All rights reserved.
+#  Use of this source code is governed by a BSD-style license that can be
+#  found in the LICENSE.md file.
+#
+
+#
+#  Build driver of all generated sources.
+#
+#  Usage:
+#    ./build.py [-j JOBS] [--force] [--list] [--check] [--verify]
+#
+#  Note(s):
+#    [1] All kernel compilers (one job per configuration file) and the error
+#        generator are run in parallel (each job is a child process, started
+#        by a thread pool), the prebuilt kernel registries are run after all
+#        compiler jobs of their generators.
+#    [2] Each job is keyed by a content hash of its inputs (the
+#        configuration, the header, the tuning file, the generator sources
+#        and other files read by the job, e.g. the window tables of the MDCT
+#        kernels), a job is skipped if its key and the contents of its
+#        outputs are unchanged since the last build (see CACHE_PATH), so an
+#        output that was modified (or deleted) manually is regenerated.
+#    [3] The "generate.sh" script of each generator still regenerates all
+#        its outputs (without the build cache).
+#    [4] The metrics file of each compiler output (see the "metrics" module
+#        of the kernel IR) is also an output of its compiler job, with
+#        "--check", the metrics are compared with the baseline (see
+#        "baseline.py") after a successful build.
+#    [5] With "--verify", all kernel compilers also verify the generated
+#        kernels numerically (NumPy is required), the flag is a part of the
+#        job key, so that the compiler jobs are rerun once with it.
+#    [6] "--check" implies "--verify", and also runs the unit tests of the
+#        kernel IR (the "test_*.py" files in the "kernel-ir" directory)
+#        before building.
+#
+
+import os
+import sys
+import json
+import glob
+import time
+import hashlib
+import argparse
+import subprocess
+import concurrent.futures
+
+
+#  File/folder settings.
+BASE_DIR = os.path.dirname(os.path.realpath(__file__))
+ROOT_DIR = os.path.realpath(os.path.join(BASE_DIR, ".."))
+KIR_DIR = os.path.join(BASE_DIR, "kernel-ir")
+CACHE_PATH = os.path.join(BASE_DIR, ".build-cache.json")
+METRICS_DIR = os.path.join(BASE_DIR, "metrics")
+BASELINE_SCRIPT_PATH = os.path.join(BASE_DIR, "baseline.py")
+
+#  Generators:
+#    (directory, extra source files, has a tuning file, has a registry)
+#
+#  Note(s):
+#    [1] The compiler, the header and all kernel IR modules are always the
+#        inputs of a compiler job, the extra source files are the modules
+#        imported from other generators.
+GENERATORS = [
+    ("fft-mx-generator", [], True, True),
+    ("mdct-generator", [os.path.join("fft-mx-generator", "compiler.py")], False, True),
+    ("idct2-generator", [], False, False),
+    ("fdct2-generator", [], False, False)
+]
+
+#  Error generator:
+#    (working directory, arguments, inputs, outputs)
+ERROR_GENERATOR = (
+    os.path.join(ROOT_DIR, "lc3"),
+    [os.path.join("scripts", "ecg", "generate.py"), "LC3", "error.template", "error.js"],
+    [
+        os.path.join(ROOT_DIR, "lc3", "scripts", "ecg", "generate.py"),
+        os.path.join(ROOT_DIR, "lc3", "scripts", "ecg", "header.txt"),
+        os.path.join(ROOT_DIR, "lc3", "error.template")
+    ],
+    [os.path.join(ROOT_DIR, "lc3", "error.js")]
+)
+
+
+def relpath(path):
+    #  Get the path relative to the project root (used in job names and the
+    #  build cache).
+    return os.path.relpath(os.path.realpath(path), ROOT_DIR)
+
+
+def file_digest(path):
+    #  Get the content hash of a file (None if the file doesn't exist).
+    if not os.path.exists(path):
+        return None
+    fp = open(path, "rb")
+    digest = hashlib.sha256(fp.read()).hexdigest()
+    fp.close()
+    return digest
+
+
+def job_key(job):
+    #  Get the content hash of all inputs of a job.
+    h = hashlib.sha256()
+    h.update(json.dumps(job["argv"]).encode("utf-8"))
+    for path in sorted(set([relpath(path) for path in job["inputs"]])):
+        h.update(path.encode("utf-8") + b"\x00")
+        h.update((file_digest(os.path.join(ROOT_DIR, path)) or "-").encode("ascii"))
+    return h.hexdigest()
+
+
+def config_inputs(gen_dir, config):
+    #  Get the other files read by a compiler job of a configuration (the
+    #  window tables of the MDCT kernels).
+    inputs = []
+    for window_config in config.get("windows", []):
+        inputs.append(os.path.join(gen_dir, window_config["table"]))
+    return inputs
+
+
+def config_outputs(gen_dir, config):
+    #  Get the files written by a compiler job of a configuration (the output,
+    #  the module of the WebAssembly kernels, the modules of the input-pruned
+    #  MDCT kernels and their metrics files).
+    output = os.path.join(gen_dir, config["output"])
+    outputs = [output]
+    if config.get("wasm", False):
+        outputs.append(os.path.splitext(output)[0] + "-wasm.js")
+    for window_config in config.get("windows", []):
+        for count in sorted(set(window_config.get("pruned", []))):
+            outputs.append("%s-%s-k%d.js" % (
+                os.path.splitext(output)[0],
+                os.path.splitext(os.path.basename(window_config["table"]))[0],
+                count
+            ))
+    return outputs + [
+        os.path.join(METRICS_DIR, os.path.splitext(os.path.basename(path))[0] + ".json") for path in outputs
+    ]
+
+
+def collect_jobs(verify=False):
+    #  Collect all jobs, returns (compiler jobs, registry jobs).
+    kir_sources = sorted(glob.glob(os.path.join(KIR_DIR, "*.py")))
+    compile_jobs = []
+    registry_jobs = []
+    for gen_name, extra_sources, has_tuning, has_registry in GENERATORS:
+        gen_dir = os.path.join(BASE_DIR, gen_name)
+        common_inputs = [
+            os.path.join(gen_dir, "compiler.py"),
+            os.path.join(gen_dir, "header.js")
+        ] + kir_sources + [os.path.join(BASE_DIR, path) for path in extra_sources]
+        if has_tuning:
+            common_inputs.append(os.path.join(gen_dir, "tuning.json"))
+        cfgfile_paths = sorted(glob.glob(os.path.join(gen_dir, "config-*.json")))
+        outputs = []
+        for cfgfile_path in cfgfile_paths:
+            fp = open(cfgfile_path, "r", encoding="utf-8")
+            config = json.loads(fp.read())
+            fp.close()
+            output = os.path.join(gen_dir, config["output"])
+            outputs.append(output)
+            compile_jobs.append({
+                "name": relpath(cfgfile_path),
+                "cwd": gen_dir,
+                "argv": [sys.executable, "compiler.py", os.path.basename(cfgfile_path)] + (["--verify"] if verify else []),
+                "inputs": [cfgfile_path] + common_inputs + config_inputs(gen_dir, config),
+                "outputs": config_outputs(gen_dir, config)
+            })
+        if has_registry:
+            registry_jobs.append({
+                "name": relpath(os.path.join(gen_dir, "registry.py")),
+                "cwd": gen_dir,
+                "argv": [sys.executable, "registry.py"],
+                "inputs": [
+                    os.path.join(gen_dir, "registry.py"),
+                    os.path.join(gen_dir, "header.js")
+                ] + cfgfile_paths,
+                "outputs": [os.path.join(ROOT_DIR, "lc3", "math", "%s-prebuilt.js" % gen_name[:-len("-generator")])]
+            })
+    
+    #  The error generator (if the error generator script exists).
+    cwd, args, inputs, outputs = ERROR_GENERATOR
+    if os.path.exists(inputs[0]):
+        compile_jobs.append({
+            "name": relpath(inputs[0]),
+            "cwd": cwd,
+            "argv": [sys.executable] + args,
+            "inputs": inputs,
+            "outputs": outputs
+        })
+    
+    return compile_jobs, registry_jobs
+
+
+def is_up_to_date(job, cache):
+    entry = cache.get(job["name"])
+    if entry is None or entry["key"] != job["key"]:
+        return False
+    for path in job["outputs"]:
+        if entry["outputs"].get(relpath(path)) != file_digest(path):
+            return False
+    return True
+
+
+def run_job(argv, cwd):
+    #  Run a job (in a worker thread, the job itself runs in a child process),
+    #  returns (exit code, output, elapsed time).
+    begin = time.time()
+    result = subprocess.run(argv, cwd=cwd, capture_output=True, text=True)
+    return result.returncode, result.stdout + result.stderr, time.time() - begin
+
+
+def run_jobs(pool, jobs, cache, force):
+    #  Run all jobs that are not up to date (in parallel), returns the count
+    #  of failed jobs.
+    futures = {}
+    for job in jobs:
+        job["key"] = job_key(job)
+        if not force and is_up_to_date(job, cache):
+            print(":: %s :: up to date." % job["name"])
+            continue
+        futures[pool.submit(run_job, job["argv"], job["cwd"])] = job
+    failures = 0
+    for future in concurrent.futures.as_completed(futures):
+        job = futures[future]
+        returncode, output, elapsed = future.result()
+        if returncode != 0:
+            print(":: %s :: failed (%.1fs)." % (job["name"], elapsed))
+            print(output.rstrip())
+            cache.pop(job["name"], None)
+            failures += 1
+            continue
+        print(":: %s :: done (%.1fs)." % (job["name"], elapsed))
+        cache[job["name"]] = {
+            "key": job["key"],
+            "outputs": dict([(relpath(path), file_digest(path)) for path in job["outputs"]])
+        }
+    return failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build all generated sources.")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count(), help="count of parallel jobs")
+    parser.add_argument("--force", action="store_true", help="rebuild all (ignore the build cache)")
+    parser.add_argument("--list", action="store_true", help="list all jobs (and their states) only")
+    parser.add_argument("--check", action="store_true", help="run the kernel IR unit tests, verify the kernels and compare the kernel metrics with the baseline")
+    parser.add_argument("--verify", action="store_true", help="verify the generated kernels numerically (NumPy is required)")
+    args = parser.parse_args()
+    if args.check:
+        args.verify = True
+    
+    #  Load the build cache.
+    if os.path.exists(CACHE_PATH):
+        fp = open(CACHE_PATH, "r", encoding="utf-8")
+        cache = json.loads(fp.read())
+        fp.close()
+    else:
+        cache = {}
+    
+    compile_jobs, registry_jobs = collect_jobs(args.verify)
+    if args.list:
+        for job in compile_jobs + registry_jobs:
+            job["key"] = job_key(job)
+            print("%s: %s." % (job["name"], "up to date" if is_up_to_date(job, cache) else "out of date"))
+        return 0
+    
+    #  Run the unit tests of the kernel IR.
+    if args.check:
+        if subprocess.run([sys.executable, "-m", "unittest", "discover", "-s", KIR_DIR, "-t", KIR_DIR, "-p", "test_*.py"]).returncode != 0:
+            print("Failed! The kernel IR unit tests failed.")
+            return 1
+    
+    #  Run all jobs (the registries run after all compilers).
+    begin = time.time()
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max(1, args.jobs)) as pool:
+        failures = run_jobs(pool, compile_jobs, cache, args.force)
+        if failures == 0:
+            failures = run_jobs(pool, registry_jobs, cache, args.force)
+    
+    #  Save the build cache.
+    fp = open(CACHE_PATH, "w", encoding="utf-8")
+    fp.write(json.dumps(cache, indent=4, sort_keys=True))
+    fp.close()
+    
+    if failures != 0:
+        print("Failed! %d job(s) failed." % failures)
+        return 1
+    print("OK! (%.1fs)" % (time.time() - begin))
+    
+    #  Compare the kernel metrics with the baseline.
+    if args.check:
+        return subprocess.run([sys.executable, BASELINE_SCRIPT_PATH, "compare"]).returncode
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
\ No newline at end of file
@@ -0,0 +1,156 @@
+//
+//  Copyright 2021 - 2023 XiaoJSoft Studio. All rights reserved.
+//  Use of this source code is governed by a BSD-style license that can be
+//  found in the LICENSE.md file.
+//
+
+//
+//  Kernel benchmark of the autotuning driver (see "autotune.py").
+//
+//  Usage:
+//    node autotune-bench.js [module] [N] [real] [rounds] [round time (ms)]
+//
+//  Note(s):
+//    [1] The kernel (the in-place transform, i.e. the exported function
+//        named "ApplyMixedRadix*_N" without any variant suffix) is called
+//        on random buffers, the buffers are refilled before each call so
+//        that the values never grow.
+//    [2] The buffers are plain arrays (of doubles), like the buffers that
+//        the codec passes to the kernels, since V8 optimizes the kernels
+//        for the element kind of the arrays they see (so a kernel may rank
+//        differently on typed arrays).
+//    [3] The result (the best time of all rounds, in nanoseconds per call)
+//        is printed as JSON.
+//
+
+//  Variant suffixes of the kernel function names.
+const VARIANT_SUFFIXES = [
+    "Permuted"
+];
+
+//
+//  Private functions.
+//
+
+/**
+ *  Find the (in-place) kernel function of a kernel module.
+ * 
+ *  @param {Object} mod 
+ *    - The kernel module.
+ *  @param {Number} N 
+ *    - The block size.
+ *  @returns {Function}
+ *    - The kernel function.
+ */
+function FindKernel(mod, N) {
+    let suffix = "_" + String(N);
+    for (let name of Object.keys(mod)) {
+        if (!name.startsWith("ApplyMixedRadix") || !name.endsWith(suffix)) {
+            continue;
+        }
+        let kind = name.substring(15, name.length - suffix.length);
+        if (VARIANT_SUFFIXES.some(function(variant) {
+            return kind.endsWith(variant);
+        })) {
+            continue;
+        }
+        return mod[name];
+    }
+    throw new Error("No kernel function.");
+}
+
+/**
+ *  Create a buffer filled with random values within [-1, 1).
+ * 
+ *  @param {Number} N 
+ *    - The buffer size.
+ *  @returns {Number[]}
+ *    - The buffer.
+ */
+function RandomBuffer(N) {
+    let buf = new Array(N);
+    for (let i = 0; i < N; ++i) {
+        buf[i] = 2 * Math.random() - 1;
+    }
+    return buf;
+}
+
+/**
+ *  Copy a buffer to another one (of the same size).
+ * 
+ *  @param {Number[]} src 
+ *    - The source buffer.
+ *  @param {Number[]} dst 
+ *    - The destination buffer.
+ */
+function CopyBuffer(src, dst) {
+    for (let i = 0; i < src.length; ++i) {
+        dst[i] = src[i];
+    }
+}
+
+//
+//  Main.
+//
+
+(function() {
+    let mod = require(process.argv[2]);
+    let N = parseInt(process.argv[3]);
+    let real = process.argv[4];
+    let rounds = parseInt(process.argv[5]);
+    let round_time = parseFloat(process.argv[6]);
+
+    //  Prepare the buffers (and the kernel call).
+    let kernel = FindKernel(mod, N);
+    let src_x = RandomBuffer(N), src_re = RandomBuffer(N),
+        src_im = RandomBuffer(N);
+    let x = RandomBuffer(N), re = RandomBuffer(N), im = RandomBuffer(N);
+    let call;
+    if (real == "r2c") {
+        call = function() {
+            CopyBuffer(src_x, x);
+            kernel(x, re, im);
+        };
+    } else if (real == "c2r") {
+        call = function() {
+            CopyBuffer(src_re, re);
+            CopyBuffer(src_im, im);
+            kernel(re, im, x);
+        };
+    } else {
+        call = function() {
+            CopyBuffer(src_re, re);
+            CopyBuffer(src_im, im);
+            kernel(re, im);
+        };
+    }
+
+    //  Warm up (let the optimizing compiler kick in).
+    let warmup_end = Date.now() + round_time;
+    while (Date.now() < warmup_end) {
+        for (let i = 0; i < 100; ++i) {
+            call();
+        }
+    }
+
+    //  Measure.
+    let best = Infinity;
+    for (let r = 0; r < rounds; ++r) {
+        let calls = 0;
+        let t_begin = process.hrtime.bigint();
+        let t_end = t_begin + BigInt(Math.round(round_time * 1e6));
+        let t_now = t_begin;
+        while (t_now < t_end) {
+            for (let i = 0; i < 100; ++i) {
+                call();
+            }
+            calls += 100;
+            t_now = process.hrtime.bigint();
+        }
+        best = Math.min(best, Number(t_now - t_begin) / calls);
+    }
+
+    console.log(JSON.stringify({
+        "ns": best
+    }));
+})();
\ No newline at end of file
@@ -0,0 +1,277 @@
+#!/usr/bin/env python3
+#
+#  Copyright 2021 - 2023 XiaoJSoft Studio. All rights reserved.
+#  Use of this source code is governed by a BSD-style license that can be
+#  found in the LICENSE.md file.
+#
+
+#
+#  Autotuning driver of the FFT compiler.
+#
+#  Usage:
+#    ./autotune.py [--rounds R] [--round-time MS] [--margin M] [--dry-run]
+#                  [config-*.json ...]
+#
+#  Note(s):
+#    [1] For each configuration (all configuration files by default), this
+#        script generates every variant of the tunable parameters (see
+#        TUNING_SPACE and TUNABLE_KEYS of the compiler), times the kernel of
+#        each variant in a local Node.js subprocess (see
+#        "autotune-bench.js") and records the parameters of the fastest
+#        variant in the tuning file ("tuning.json"), which is applied by
+#        the compiler in later builds.
+#    [2] The fastest variant is chosen only if it beats the current
+#        parameters (the configuration with the current tuning applied) by
+#        at least the margin, and is still faster when both are timed again
+#        (the best time of the current parameters and the worst time of the
+#        variant are compared), so that the timing noise doesn't flip the
+#        parameters (and the generated files) on every run.
+#    [3] Variants that the compiler rejects (e.g. "baseop" mode with kernel
+#        variants) are skipped.
+#    [4] The fastest variant differs between V8 versions, re-tune after
+#        upgrading Node.js (the Node.js version is recorded in the tuning
+#        file).
+#    [5] Configurations in "compact" mode are not tuned (the mode is chosen
+#        for the code size, not for the speed).
+#    [6] A tuned configuration is recorded even if its parameters are kept
+#        (with no parameter), so that the tuning file tells which
+#        configurations were tuned (and the time of each kernel).
+#
+
+import os
+import sys
+import json
+import glob
+import shutil
+import hashlib
+import argparse
+import itertools
+import subprocess
+import tempfile
+
+from compiler import ENGINE_BUDGETS, DEFAULT_ENGINE
+from metrics import metrics_path
+
+
+#  File/folder settings.
+BASE_DIR = os.path.dirname(os.path.realpath(__file__))
+COMPILER_PATH = os.path.join(BASE_DIR, "compiler.py")
+BENCH_PATH = os.path.join(BASE_DIR, "autotune-bench.js")
+TUNING_PATH = os.path.join(BASE_DIR, "tuning.json")
+BASEOP_PATH = os.path.join(BASE_DIR, "..", "..", "lc3", "math", "fft-mx-baseop.js")
+
+#  Name of the temporary configuration file (shall not match any tuned
+#  configuration file, so that the compiler never applies the tuning file
+#  to a variant).
+VARIANT_CFGFILE_NAME = "autotune-variant.json"
+
+#  The variant space (tunable option => candidate values), the "pfa" option
+#  is kept as configured.
+TUNING_SPACE = {
+    "mode": ["inline", "baseop"],
+    "plan": ["auto", "fixed"],
+    "budget": [1000, 2000, 4000],
+    "cmul": ["3mul", "4mul"]
+}
+
+#  Defaults of the tunable options (see the compiler), the default of the
+#  "budget" option depends on the "engine" option (see defaults_of()).
+TUNING_DEFAULTS = {
+    "mode": "baseop",
+    "plan": "fixed",
+    "pfa": False,
+    "cmul": "3mul"
+}
+
+#  Default benchmark settings.
+DEFAULT_ROUNDS = 5
+DEFAULT_ROUND_TIME = 200
+DEFAULT_MARGIN = 0.05
+
+
+def load_json(path):
+    fp = open(path, "r", encoding="utf-8")
+    data = json.loads(fp.read())
+    fp.close()
+    return data
+
+
+def node_version():
+    result = subprocess.run(["node", "--version"], capture_output=True, text=True, check=True)
+    return result.stdout.strip()
+
+
+def defaults_of(config):
+    #  Get the defaults of the tunable options of a configuration (the
+    #  default budget is the one of the target engine, see ENGINE_BUDGETS of
+    #  the compiler).
+    defaults = dict(TUNING_DEFAULTS)
+    engine = config.get("engine", DEFAULT_ENGINE)
+    if engine not in ENGINE_BUDGETS:
+        raise Exception("Unknown engine \"%s\"." % engine)
+    defaults["budget"] = ENGINE_BUDGETS[engine]
+    return defaults
+
+
+def current_params(config, entry):
+    #  Get the current parameters of a configuration (with the tuning entry
+    #  applied).
+    defaults = defaults_of(config)
+    params = {}
+    for key in defaults:
+        params[key] = config.get(key, defaults[key])
+    if entry is not None:
+        params.update(entry["params"])
+    return params
+
+
+def variants_of(params):
+    #  Get all variants (the current parameters first).
+    keys = list(TUNING_SPACE.keys())
+    variants = [params]
+    for values in itertools.product(*[TUNING_SPACE[key] for key in keys]):
+        variant = dict(params)
+        variant.update(dict(zip(keys, values)))
+        if variant not in variants:
+            variants.append(variant)
+    return variants
+
+
+def generate_variant(config, params, work_dir):
+    #  Generate the kernel of a variant, returns the module path (or None if
+    #  the variant is rejected by the compiler).
+    variant = dict(config)
+    variant.update(params)
+    variant["output"] = os.path.join(work_dir, "kernel.js")
+    cfgfile_path = os.path.join(work_dir, VARIANT_CFGFILE_NAME)
+    fp = open(cfgfile_path, "w", encoding="utf-8")
+    fp.write(json.dumps(variant))
+    fp.close()
+    result = subprocess.run([sys.executable, COMPILER_PATH, cfgfile_path], capture_output=True, text=True)
+    
+    #  Remove the metrics file of the variant (so that the baseline gate
+    #  doesn't pick it up).
+    if os.path.exists(metrics_path(variant["output"])):
+        os.remove(metrics_path(variant["output"]))
+    if result.returncode != 0:
+        return None
+    return variant["output"]
+
+
+def time_kernel(module_path, N, real, rounds, round_time):
+    #  Time the kernel in a Node.js subprocess (nanoseconds per call).
+    result = subprocess.run(
+        ["node", BENCH_PATH, module_path, str(N), real, str(rounds), str(round_time)],
+        capture_output=True,
+        text=True,
+        check=True
+    )
+    return json.loads(result.stdout)["ns"]
+
+
+def tune(cfgfile_path, entry, rounds, round_time, margin):
+    #  Tune a configuration, returns the new tuning entry (or None if the
+    #  configuration is not tuned).
+    config = load_json(cfgfile_path)
+    if config.get("mode", TUNING_DEFAULTS["mode"]) == "compact":
+        print("Skipped (compact mode).")
+        return None
+    N = config["N"]
+    real = config.get("real", "none")
+    baseline = current_params(config, entry)
+    
+    work_dir = tempfile.mkdtemp(prefix="fft-mx-autotune-")
+    try:
+        shutil.copy(BASEOP_PATH, os.path.join(work_dir, "fft-mx-baseop.js"))
+        modules = {}
+        results = []
+        for params in variants_of(baseline):
+            module_path = generate_variant(config, params, work_dir)
+            if module_path is None:
+                continue
+            fp = open(module_path, "rb")
+            digest = hashlib.sha256(fp.read()).hexdigest()
+            fp.close()
+            if digest not in modules:
+                modules[digest] = os.path.join(work_dir, "kernel-%s.js" % digest[:16])
+                os.replace(module_path, modules[digest])
+            ns = time_kernel(modules[digest], N, real, rounds, round_time)
+            results.append((ns, params, digest))
+            print("  %-60s %10.1f ns" % (json.dumps(params, sort_keys=True), ns))
+        if len(results) == 0:
+            raise Exception("No variant can be generated.")
+        
+        #  Confirm the winner by timing it (and the current parameters) again.
+        baseline_ns, _, baseline_digest = results[0]
+        best_ns, best_params, best_digest = min(results, key=lambda result: result[0])
+        if best_ns <= baseline_ns * (1 - margin) and best_digest != baseline_digest:
+            baseline_ns = min(baseline_ns, time_kernel(modules[baseline_digest], N, real, rounds, round_time))
+            best_ns = max(best_ns, time_kernel(modules[best_digest], N, real, rounds, round_time))
+    finally:
+        shutil.rmtree(work_dir)
+    
+    if best_ns > baseline_ns * (1 - margin) or best_digest == baseline_digest:
+        best_ns, best_params = baseline_ns, baseline
+        print("Kept: %s (%.1f ns)." % (json.dumps(best_params, sort_keys=True), best_ns))
+    else:
+        print("Best: %s (%.1f ns, %.1f%% faster)." % (
+            json.dumps(best_params, sort_keys=True),
+            best_ns,
+            100 * (1 - best_ns / baseline_ns)
+        ))
+    
+    #  Record only the parameters that differ from the configuration.
+    defaults = defaults_of(config)
+    params = {}
+    for key in best_params:
+        if best_params[key] != config.get(key, defaults[key]):
+            params[key] = best_params[key]
+    return {"params": params, "ns": round(best_ns, 1)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Autotune the FFT kernels.")
+    parser.add_argument("configs", nargs="*", help="configuration files (all by default)")
+    parser.add_argument("--rounds", type=int, default=DEFAULT_ROUNDS, help="timing rounds per variant")
+    parser.add_argument("--round-time", type=float, default=DEFAULT_ROUND_TIME, help="time per round (ms)")
+    parser.add_argument("--margin", type=float, default=DEFAULT_MARGIN, help="minimum speedup to change parameters")
+    parser.add_argument("--dry-run", action="store_true", help="don't write the tuning file")
+    args = parser.parse_args()
+    
+    #  Load the tuning file.
+    if os.path.exists(TUNING_PATH):
+        tuning = load_json(TUNING_PATH)
+    else:
+        tuning = {"node": None, "configs": {}}
+    version = node_version()
+    if tuning["node"] is not None and tuning["node"] != version:
+        print("The tuning file was recorded with Node.js %s, re-tuning with Node.js %s." % (tuning["node"], version))
+    
+    #  Tune all configurations.
+    cfgfile_paths = args.configs
+    if len(cfgfile_paths) == 0:
+        cfgfile_paths = sorted(glob.glob(os.path.join(BASE_DIR, "config-*.json")))
+    for cfgfile_path in cfgfile_paths:
+        cfgfile_name = os.path.basename(cfgfile_path)
+        print(":: %s ::" % cfgfile_name)
+        entry = tune(cfgfile_path, tuning["configs"].get(cfgfile_name), args.rounds, args.round_time, args.margin)
+        if entry is None:
+            tuning["configs"].pop(cfgfile_name, None)
+        else:
+            tuning["configs"][cfgfile_name] = entry
+        print("")
+    tuning["node"] = version
+    tuning["configs"] = dict(sorted(tuning["configs"].items()))
+    
+    #  Write the tuning file.
+    if args.dry_run:
+        print(json.dumps(tuning, indent=4))
+        return
+    fp = open(TUNING_PATH, "w", encoding="utf-8")
+    fp.write(json.dumps(tuning, indent=4))
+    fp.close()
+    print("OK!")
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
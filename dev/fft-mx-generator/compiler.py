@@ -9,74 +9,643 @@ import os
 import sys
 import math
 import json
+import textwrap
 
 
 #  File/folder settings.
 BASE_DIR = os.path.dirname(os.path.realpath(__file__))
 #OUT_DIR = os.path.join(BASE_DIR, "output")
 HDRFILE_PATH = os.path.join(BASE_DIR, "header.js")
+TUNING_PATH = os.path.join(BASE_DIR, "tuning.json")
 #CFGFILE_PATH = os.path.join(BASE_DIR, "config.json")
+KIR_DIR = os.path.join(BASE_DIR, "..", "kernel-ir")
 
-#  Maximum lines within single JS function.
-MAX_FUNCTION_LINES = 500
+#  Import the kernel IR modules.
+sys.path.insert(0, KIR_DIR)
+from ir import OP_LOAD, OP_STORE, OP_CALL, OP_COMMENT
+from ir import Program, render_js, constant_pool, render_pool_js
+from passes import PassManager
+from codelets import CMUL_ALGORITHMS, set_cmul_algorithm, unit_root, emit_rotate, emit_cmul_const, emit_fft__internal, is_prime, smallest_factor, rader_constants
+from wasm import lower_program, build_module, render_module_file, module_path, slot_width
+from precision import PRECISIONS, rewrite_precision, error_text
+from writer import SourceWriter
+from phases import PhaseReport
+from metrics import kernel_metrics, write_metrics
+from interp import DEFAULT_VECTORS, require_numpy, random_vectors, verify_program
+
+#  Options that can be tuned by the autotuning driver (see "autotune.py"),
+#  the tuned values are recorded in the tuning file (TUNING_PATH).
+TUNABLE_KEYS = ["mode", "plan", "pfa", "budget", "cmul"]
+
+#  Function size budgets (the maximum count of instructions within one JS
+#  function) of target engines.
+#
+#  Note(s):
+#    [1] A kernel is divided into parts (JS functions) only at the boundaries
+#        of its sub-transforms (operation groups), and no variable is live
+#        across two groups, so all values passed between two parts are kept
+#        in the arrays of the kernel (i.e. the transform buffers or the
+#        scratch buffers of the caller).
+#    [2] Each part is filled up to the budget, but it ends at the boundary
+#        of the largest sub-transform in its second half.
+#    [3] The "v8" budget was measured with Node.js 20 (FFT-240/480), parts
+#        of 1000 to 4000 instructions run slightly faster than the old fixed
+#        500-line cut, but the optimizing compiler gives up on functions of
+#        more than about 5500 instructions (7x to 10x slower), so the budget
+#        keeps a wide margin below that limit.
+#    [4] The budgets of other engines are not measured yet, they are kept at
+#        the old (conservative) limit.
+#    [5] The budget can be selected by the "engine" option or overridden by
+#        the "budget" option of the configuration.
+ENGINE_BUDGETS = {
+    "v8": 2000,
+    "spidermonkey": 500,
+    "javascriptcore": 500
+}
+DEFAULT_ENGINE = "v8"
+
+#  Function size budget (see ENGINE_BUDGETS).
+FUNCTION_BUDGET = ENGINE_BUDGETS[DEFAULT_ENGINE]
 
 #  JS generation settings.
 IO_REAL = "re"
 IO_IMAG = "im"
 
+#  Generation modes:
+#    "baseop" - Call the base operations (MXTr2/3/4/5, MXRot) of the
+#               "fft-mx-baseop" module.
+#    "inline"  - Emit all butterflies (with twiddle factors fused) as scalar
+#                local variable code.
+#    "compact" - Emit a small wrapper that calls the table-driven loop kernel
+#                (MXCompact) of the "fft-mx-baseop" module with generated
+#                index and twiddle tables (see note 1).
+#
+#  Note(s):
+#    [1] The unrolled modes are the fastest once optimized, but their code
+#        grows with N (tens of thousands of lines for large N), which costs
+#        bundle size and parse/compile time, and an unrolled kernel runs
+#        unoptimized for its first thousand (or more) calls. The compact
+#        mode keeps the code size constant (only the tables grow, linearly
+#        with N) and is optimized within about a hundred calls, so it is used
+#        for the complex FFT of all block sizes of the codec. The mode is
+#        selected per block size (by the "mode" option of each
+#        configuration).
+#    [2] The compact mode supports N = 2^a * 3^b * 5^c only, and supports no
+#        variant, real-data or single-precision kernel. Its WebAssembly
+#        kernel (see the "wasm" option) is lowered from an inline mode
+#        program (planned by the "plan" and "pfa" options), so the outputs
+#        of both kernels may differ in rounding.
+#    [3] The inline mode (with the "auto" plan and the "pfa" option) is used
+#        by the opt-in unrolled kernels of the codec block sizes (enabled by
+#        EnableUnrolledKernels() of the MDCT module), i.e. the paired
+#        real-input and the real-output inverse kernels of the LTPF
+#        correlation sizes (160 and 180, the "unrolled" option, see the
+#        registry generator), and the M / 2-point DFTs of the MDCT kernels
+#        (emitted by the MDCT compiler). No complex FFT of the codec block
+#        sizes is unrolled, since the codec doesn't call it per frame if the
+#        unrolled kernels are enabled (the LD-MDCT modules use the MDCT
+#        kernels, the LTPF module uses the real-data kernels).
+MODES = ["baseop", "inline", "compact"]
+
+#  Factorization plans:
+#    "fixed" - Always split N by the first radix (within [5, 4, 3, 2]) that
+#              divides N (or by the smallest prime factor of N).
+#    "auto"  - Enumerate all factorizations (and factor orders) and choose
+#              the cheapest one under the cost model.
+PLANS = ["fixed", "auto"]
+
+#  Plan node kinds (a plan is either a leaf DFT size or a tuple (kind, N2,
+#  plan2, plan1), where N = N1 * N2, the N2-point DFTs are performed first):
+#    "ct"    - Cooley-Tukey (twiddle factors between two stages).
+#    "pfa"   - Good-Thomas prime factor algorithm (N1 and N2 are coprime, CRT
+#              index mappings, no twiddle factor).
+#    "rader" - Rader's algorithm (N is a prime, N2 = N - 1, plan1 is None),
+#              the cyclic convolution is done by two (N - 1)-point DFTs
+#              (both planned by plan2).
+PLAN_KINDS = ["ct", "pfa", "rader"]
+
+#  Leaf DFT sizes (codelets) of each generation mode.
+#
+#  Note(s):
+#    [1] Primes up to RADER_LEAF_MAX are also leaves (7, 11 and 13 use the
+#        direct codelets, other primes use the Rader's algorithm codelet).
+#    [2] Leaves without base operation (i.e. 7, 11, 13 and other primes) are
+#        emitted as scalar code in "baseop" mode.
+LEAF_SIZES = {
+    "baseop": [2, 3, 4, 5],
+    "inline": [2, 3, 4, 5, 7, 8, 11, 13, 16]
+}
+
+#  The largest prime that can be a leaf (larger primes are planned by "rader"
+#  plan nodes, so that no operation group grows beyond the size that the JS
+#  engine is willing to optimize).
+RADER_LEAF_MAX = 31
+
+#  Cost model weights (per floating-point operation, per memory load/store,
+#  per non-trivial twiddle factor and per spilled register).
+COST_WEIGHTS = {
+    "flop": 1.0,
+    "memory": 1.0,
+    "twiddle": 1.0,
+    "spill": 4.0
+}
+
+#  Floating-point register count of the target (x86-64: XMM0-XMM15).
+COST_REGISTERS = 16
+
+#  Kernel variants (besides the in-place natural-order kernel):
+#    "permuted"   - In-place kernel that leaves the outputs in permuted order,
+#                   with an index table of the outputs.
+VARIANTS = ["permuted"]
+
+#  Transform directions:
+#    "forward" - X[k] = SUM(x[n] * e ^ (-2j * PI * n * k / N)).
+#    "inverse" - x[n] = SUM(X[k] * e ^ (2j * PI * n * k / N)) (optionally
+#                scaled by 1 / N, see the "scale" option).
+#
+#  Note(s):
+#    [1] The inverse transform is generated as the forward transform with the
+#        real and imaginary arrays swapped, i.e. IDFT(x) = swap(DFT(swap(x))),
+#        so it has exactly the same arithmetic cost.
+DIRECTIONS = ["forward", "inverse"]
+
+#  Real-data transform kinds:
+#    "none"   - Complex transform.
+#    "r2c"    - Real-input forward transform of N (even) real points (in
+#               `x`), done by a N / 2-point complex DFT of the even/odd
+#               points (packed as complex points) and an inline split step,
+#               the first N / 2 + 1 outputs are stored in natural order.
+#    "c2r"    - Real-output inverse transform (inverse of "r2c"), the first
+#               N / 2 + 1 inputs (of a conjugate-symmetric spectrum) are
+#               merged inline into N / 2 complex points, then a N / 2-point
+#               inverse DFT writes N real points (to `x`).
+#    "paired" - Forward transform of two real signals (one in the real array,
+#               the other in the imaginary array) by one N-point complex DFT
+#               and an inline split step.
+#
+#  Note(s):
+#    [1] "r2c" and "paired" require the "forward" direction, "c2r" requires
+#        the "inverse" direction.
+#    [2] Real-data transforms require inline mode and support no variant.
+REAL_KINDS = ["none", "r2c", "c2r", "paired"]
+
+#  Real-data JS generation settings.
+IO_SAMPLES = "x"
+
+#  WebAssembly kernel settings (see the "wasm" option), the kernel is exported
+#  as WASM_EXPORT, the real parts of the points are placed at slot 0 and the
+#  imaginary parts are placed at slot N of the linear memory.
+#
+#  Note(s):
+#    [1] One module is generated per lane count in WASM_LANES, the SIMD
+#        module (f64x2, 2 lanes) transforms two sets of points at once (lane
+#        k of each slot belongs to the k-th set).
+#    [2] The scalar module (1 lane) is not generated by default, since the
+#        points have to be copied from (and back to) the JS arrays of the
+#        caller, which costs more than the scalar module saves (measured
+#        with Node.js 20).
+#    [3] The WebAssembly kernel restores the natural order of the outputs
+#        inline.
+#    [4] The modules are written to a separate file (see module_path() of the
+#        "wasm" module of the kernel IR), which exports one constant (base64)
+#        per module.
+#    [5] The modules are not registered (see the registry generator) nor
+#        loaded by the codec, the option is kept for offline experiments.
+WASM_EXPORT = "transform"
+WASM_LANES = [2]
+
+#  Array type of the kernel parameters (documentation only), which depends on
+#  the "precision" option ("f64" => "Number[]", "f32" => "Float32Array").
+ARRAY_TYPES = {
+    "f64": "Number[]",
+    "f32": "Float32Array"
+}
+ARRAY_TYPE = ARRAY_TYPES["f64"]
+
 #  Debug switch (for development only).
 DEBUG = False
 
+#  Arithmetic cost of each base operation.
+BASEOP_ARITH = {
+    "MXTr2": {"add": 4},
+    "MXTr3": {"add": 12, "mul": 4},
+    "MXTr4": {"add": 16},
+    "MXTr5": {"add": 32, "mul": 12},
+    "MXRot": {"add": 2, "mul": 4},
+    "MXSwap": {},
+    "MXCshft": {},
+    "MXCompact": {}
+}
+
+#  Memory loads/stores of each base operation (the loads and the stores are
+#  half each, see baseop_memory()).
+BASEOP_MEMORY = {
+    "MXTr2": 8,
+    "MXTr3": 12,
+    "MXTr4": 16,
+    "MXTr5": 20,
+    "MXRot": 4
+}
+
 #  Output container.
 OUT_CSHFT = []
-OUT_OPCODE = []
+OUT_COMPACT = []
+OUT_PROGRAM = Program()
 OUT_BASEOPS = set()
+OUT_METRICS = {}
+OUT_WASM_METRICS = {}
+
+
+def baseop_memory(baseop, count=1):
+    #  Get the loads/stores of `count` calls of a base operation.
+    return {"load": BASEOP_MEMORY[baseop] // 2 * count, "store": BASEOP_MEMORY[baseop] // 2 * count}
+
+
+def emit_baseop(baseop, text):
+    OUT_BASEOPS.add(baseop)
+    OUT_PROGRAM.begin_group()
+    OUT_PROGRAM.call(text, arith=BASEOP_ARITH[baseop], memory=baseop_memory(baseop))
 
 
 def l2_dist(x1, y1, x2, y2):
     return math.sqrt(((x1 - x2) ** 2) + ((y1 - y2) ** 2))
 
 
-def emit(indexes, mem_addresses, depth=0):
+def is_trivial_twiddle(p, q):
+    #  Check whether e ^ (-2j * PI * p / q) is one of +/-1, +/-1j,
+    #  (+/-1 +/-1j) / sqrt(2) and the 3rd/6th/12th roots of unity.
+    q //= math.gcd(p, q)
+    return q in [1, 2, 4, 8, 3, 6, 12]
+
+
+def emit_twiddle_inline(prog, addr, p, q):
+    #  Multiply point at memory address `addr` with e ^ (-2j * PI * p / q) by
+    #  scalar code (sign/real-imaginary swaps, 2-multiply rotations, or
+    #  3-multiply rotations for the 3rd/6th/12th roots of unity).
+    prog.begin_group()
+    sym_re = prog.tmp()
+    sym_im = prog.tmp()
+    prog.load(sym_re, IO_REAL, addr)
+    prog.load(sym_im, IO_IMAG, addr)
+    emit_rotate(prog, [sym_re], [sym_im], 0, -2 * p, q)
+    prog.store(IO_REAL, addr, sym_re)
+    prog.store(IO_IMAG, addr, sym_im)
+
+
+def emit_twiddle(prog, symlist_re, symlist_im, k, twiddle):
+    #  Multiply symbol k with a twiddle factor (see emit_inline()).
+    if isinstance(twiddle, complex):
+        emit_cmul_const(prog, symlist_re, symlist_im, k, twiddle.real, twiddle.imag)
+    else:
+        p, q = twiddle
+        emit_rotate(prog, symlist_re, symlist_im, k, -2 * p, q)
+
+
+def emit_rader_dc(prog, addr_x0, addr_a0, B0, twiddle):
+    #  Compute the 0th output of Rader's algorithm (X_0 = x_0 + A_0) and the
+    #  0th bin of the convolution (C_0 = A_0 * B_0 + x_0, see emit_inline()).
+    prog.begin_group()
+    x0_re = prog.tmp()
+    x0_im = prog.tmp()
+    a0_re = prog.tmp()
+    a0_im = prog.tmp()
+    prog.load(x0_re, IO_REAL, addr_x0)
+    prog.load(x0_im, IO_IMAG, addr_x0)
+    prog.load(a0_re, IO_REAL, addr_a0)
+    prog.load(a0_im, IO_IMAG, addr_a0)
+    syms_re = [prog.tmp(), prog.tmp()]
+    syms_im = [prog.tmp(), prog.tmp()]
+    prog.add(syms_re[0], x0_re, a0_re)
+    prog.add(syms_im[0], x0_im, a0_im)
+    prog.mov(syms_re[1], a0_re)
+    prog.mov(syms_im[1], a0_im)
+    emit_cmul_const(prog, syms_re, syms_im, 1, B0.real, B0.imag)
+    prog.add(syms_re[1], syms_re[1], x0_re)
+    prog.add(syms_im[1], syms_im[1], x0_im)
+    if twiddle is not None:
+        emit_twiddle(prog, syms_re, syms_im, 0, twiddle)
+    prog.store(IO_REAL, addr_x0, syms_re[0])
+    prog.store(IO_IMAG, addr_x0, syms_im[0])
+    prog.store(IO_REAL, addr_a0, syms_re[1])
+    prog.store(IO_IMAG, addr_a0, syms_im[1])
+
+
+def rader_indexes(indexes, g):
+    #  Get the input (and output) indexes of the sub-DFTs of Rader's
+    #  algorithm, the q-th one is the index of x_(g^q).
+    N = len(indexes)
+    return [indexes[pow(g, q, N)] for q in range(0, N - 1)]
+
+
+def emit_scale_inline(prog, addr, scale):
+    #  Multiply point at memory address `addr` with real constant `scale`.
+    prog.begin_group()
+    sym_re = prog.tmp()
+    sym_im = prog.tmp()
+    prog.load(sym_re, IO_REAL, addr)
+    prog.load(sym_im, IO_IMAG, addr)
+    prog.mul(sym_re, scale, sym_re)
+    prog.mul(sym_im, scale, sym_im)
+    prog.store(IO_REAL, addr, sym_re)
+    prog.store(IO_IMAG, addr, sym_im)
+
+
+def emit_real_split(prog, mem_addresses, scale):
+    #  Split the M-point DFT Z of z[m] = x[2m] + 1j * x[2m + 1] into the first
+    #  M + 1 outputs of the N-point (N = 2M) DFT X of real points x[n] (all
+    #  outputs are scaled by `scale`):
+    #    X[k] = E[k] + e ^ (-2j * PI * k / N) * O[k],
+    #    X[M - k] = conj(E[k] - e ^ (-2j * PI * k / N) * O[k]),
+    #  where E[k] = (Z[k] + conj(Z[M - k])) / 2 and O[k] = (Z[k] -
+    #  conj(Z[M - k])) / 2j are the DFTs of the even and odd points.
+    #
+    #  Note(s):
+    #    [1] X[k] (0 <= k < M) is stored at the memory address of Z[k] and
+    #        X[M] is stored at memory address M.
+    M = len(mem_addresses)
+    N = 2 * M
+    
+    #  X[0] = E[0] + O[0], X[M] = E[0] - O[0] (both are real).
+    prog.begin_group()
+    z_re = prog.tmp()
+    z_im = prog.tmp()
+    prog.load(z_re, IO_REAL, mem_addresses[0])
+    prog.load(z_im, IO_IMAG, mem_addresses[0])
+    x_dc = prog.tmp()
+    x_ny = prog.tmp()
+    prog.add(x_dc, z_re, z_im)
+    prog.sub(x_ny, z_re, z_im)
+    if scale != 1:
+        prog.mul(x_dc, scale, x_dc)
+        prog.mul(x_ny, scale, x_ny)
+    prog.store(IO_REAL, mem_addresses[0], x_dc)
+    prog.store(IO_IMAG, mem_addresses[0], 0)
+    prog.store(IO_REAL, M, x_ny)
+    prog.store(IO_IMAG, M, 0)
+    
+    #  X[k] and X[M - k] (0 < k < M - k).
+    for k in range(1, (M + 1) // 2):
+        prog.begin_group()
+        a_re = prog.tmp()
+        a_im = prog.tmp()
+        c_re = prog.tmp()
+        c_im = prog.tmp()
+        prog.load(a_re, IO_REAL, mem_addresses[k])
+        prog.load(a_im, IO_IMAG, mem_addresses[k])
+        prog.load(c_re, IO_REAL, mem_addresses[M - k])
+        prog.load(c_im, IO_IMAG, mem_addresses[M - k])
+        
+        #  Symbol 0 is E[k], symbol 1 is e ^ (-2j * PI * k / N) * O[k].
+        syms_re = [prog.tmp(), prog.tmp()]
+        syms_im = [prog.tmp(), prog.tmp()]
+        prog.add(syms_re[0], a_re, c_re)
+        prog.sub(syms_im[0], a_im, c_im)
+        prog.sub(syms_re[1], a_re, c_re)
+        prog.add(syms_im[1], a_im, c_im)
+        emit_cmul_const(prog, syms_re, syms_im, 0, 0.5 * scale, 0)
+        w = 0.5 * scale * (-1j) * complex(*unit_root(-2 * k, N))
+        emit_cmul_const(prog, syms_re, syms_im, 1, w.real, w.imag)
+        
+        x_re = [prog.tmp(), prog.tmp()]
+        x_im = [prog.tmp(), prog.tmp()]
+        prog.add(x_re[0], syms_re[0], syms_re[1])
+        prog.add(x_im[0], syms_im[0], syms_im[1])
+        prog.sub(x_re[1], syms_re[0], syms_re[1])
+        prog.sub(x_im[1], syms_im[1], syms_im[0])
+        prog.store(IO_REAL, mem_addresses[k], x_re[0])
+        prog.store(IO_IMAG, mem_addresses[k], x_im[0])
+        prog.store(IO_REAL, mem_addresses[M - k], x_re[1])
+        prog.store(IO_IMAG, mem_addresses[M - k], x_im[1])
+    
+    #  X[M / 2] = conj(Z[M / 2]) (if M is even).
+    if M % 2 == 0:
+        k = M // 2
+        prog.begin_group()
+        syms_re = [prog.tmp()]
+        syms_im = [prog.tmp()]
+        prog.load(syms_re[0], IO_REAL, mem_addresses[k])
+        prog.load(syms_im[0], IO_IMAG, mem_addresses[k])
+        emit_cmul_const(prog, syms_re, syms_im, 0, scale, 0)
+        prog.neg(syms_im[0], syms_im[0])
+        prog.store(IO_REAL, mem_addresses[k], syms_re[0])
+        prog.store(IO_IMAG, mem_addresses[k], syms_im[0])
+
+
+def emit_real_merge(prog, M, scale):
+    #  Merge the first M + 1 points of a conjugate-symmetric N-point (N = 2M)
+    #  spectrum X[k] (in natural order) into M points (in place):
+    #    Y[k] = F[k] + 1j * e ^ (2j * PI * k / N) * G[k] (0 <= k < M),
+    #  where F[k] = X[k] + conj(X[M - k]) and G[k] = X[k] - conj(X[M - k]),
+    #  so that the M-point inverse DFT of Y (scaled by `scale`) is y[m] =
+    #  x[2m] + 1j * x[2m + 1], where x[n] is the N-point inverse DFT of X
+    #  (scaled by `scale`).
+    #
+    #  Note(s):
+    #    [1] The imaginary parts of X[0] and X[M] are ignored.
+    N = 2 * M
+    
+    #  Y[0] = (X[0] + X[M]) + 1j * (X[0] - X[M]).
+    prog.begin_group()
+    x_dc = prog.tmp()
+    x_ny = prog.tmp()
+    prog.load(x_dc, IO_REAL, 0)
+    prog.load(x_ny, IO_REAL, M)
+    syms_re = [prog.tmp()]
+    syms_im = [prog.tmp()]
+    prog.add(syms_re[0], x_dc, x_ny)
+    prog.sub(syms_im[0], x_dc, x_ny)
+    if scale != 1:
+        emit_cmul_const(prog, syms_re, syms_im, 0, scale, 0)
+    prog.store(IO_REAL, 0, syms_re[0])
+    prog.store(IO_IMAG, 0, syms_im[0])
+    
+    #  Y[k] and Y[M - k] (0 < k < M - k).
+    for k in range(1, (M + 1) // 2):
+        prog.begin_group()
+        a_re = prog.tmp()
+        a_im = prog.tmp()
+        c_re = prog.tmp()
+        c_im = prog.tmp()
+        prog.load(a_re, IO_REAL, k)
+        prog.load(a_im, IO_IMAG, k)
+        prog.load(c_re, IO_REAL, M - k)
+        prog.load(c_im, IO_IMAG, M - k)
+        
+        #  Symbol 0 is F[k], symbol 1 is e ^ (2j * PI * k / N) * G[k].
+        syms_re = [prog.tmp(), prog.tmp()]
+        syms_im = [prog.tmp(), prog.tmp()]
+        prog.add(syms_re[0], a_re, c_re)
+        prog.sub(syms_im[0], a_im, c_im)
+        prog.sub(syms_re[1], a_re, c_re)
+        prog.add(syms_im[1], a_im, c_im)
+        if scale != 1:
+            emit_cmul_const(prog, syms_re, syms_im, 0, scale, 0)
+        w = scale * complex(*unit_root(2 * k, N))
+        emit_cmul_const(prog, syms_re, syms_im, 1, w.real, w.imag)
+        
+        #  Y[k] = F[k] + 1j * D[k], Y[M - k] = conj(F[k]) + 1j * conj(D[k]).
+        y_re = [prog.tmp(), prog.tmp()]
+        y_im = [prog.tmp(), prog.tmp()]
+        prog.sub(y_re[0], syms_re[0], syms_im[1])
+        prog.add(y_im[0], syms_im[0], syms_re[1])
+        prog.add(y_re[1], syms_re[0], syms_im[1])
+        prog.sub(y_im[1], syms_re[1], syms_im[0])
+        prog.store(IO_REAL, k, y_re[0])
+        prog.store(IO_IMAG, k, y_im[0])
+        prog.store(IO_REAL, M - k, y_re[1])
+        prog.store(IO_IMAG, M - k, y_im[1])
+    
+    #  Y[M / 2] = 2 * conj(X[M / 2]) (if M is even).
+    if M % 2 == 0:
+        k = M // 2
+        prog.begin_group()
+        syms_re = [prog.tmp()]
+        syms_im = [prog.tmp()]
+        prog.load(syms_re[0], IO_REAL, k)
+        prog.load(syms_im[0], IO_IMAG, k)
+        emit_cmul_const(prog, syms_re, syms_im, 0, 2 * scale, 0)
+        prog.neg(syms_im[0], syms_im[0])
+        prog.store(IO_REAL, k, syms_re[0])
+        prog.store(IO_IMAG, k, syms_im[0])
+
+
+def emit_paired_split(prog, mem_addresses):
+    #  Split the N-point DFT Z of z[n] = x1[n] + 1j * x2[n] (x1[n] and x2[n]
+    #  are real) into the DFTs of x1[n] and x2[n]:
+    #    X1[k] = (Z[k] + conj(Z[N - k])) / 2,
+    #    conj(X2[k]) = X2[N - k] = (Z[N - k] - conj(Z[k])) / 2j.
+    #
+    #  Note(s):
+    #    [1] X1[k] (0 < k < N - k) is stored at the memory address of Z[k],
+    #        X2[N - k] is stored at the memory address of Z[N - k].
+    #    [2] Z[0] = X1[0] + 1j * X2[0] and Z[N / 2] = X1[N / 2] + 1j *
+    #        X2[N / 2] (if N is even) are left as-is.
+    N = len(mem_addresses)
+    for k in range(1, (N + 1) // 2):
+        prog.begin_group()
+        a_re = prog.tmp()
+        a_im = prog.tmp()
+        c_re = prog.tmp()
+        c_im = prog.tmp()
+        prog.load(a_re, IO_REAL, mem_addresses[k])
+        prog.load(a_im, IO_IMAG, mem_addresses[k])
+        prog.load(c_re, IO_REAL, mem_addresses[N - k])
+        prog.load(c_im, IO_IMAG, mem_addresses[N - k])
+        syms_re = [prog.tmp(), prog.tmp()]
+        syms_im = [prog.tmp(), prog.tmp()]
+        prog.add(syms_re[0], a_re, c_re)
+        prog.sub(syms_im[0], a_im, c_im)
+        prog.add(syms_re[1], a_im, c_im)
+        prog.sub(syms_im[1], a_re, c_re)
+        emit_cmul_const(prog, syms_re, syms_im, 0, 0.5, 0)
+        emit_cmul_const(prog, syms_re, syms_im, 1, 0.5, 0)
+        prog.store(IO_REAL, mem_addresses[k], syms_re[0])
+        prog.store(IO_IMAG, mem_addresses[k], syms_im[0])
+        prog.store(IO_REAL, mem_addresses[N - k], syms_re[1])
+        prog.store(IO_IMAG, mem_addresses[N - k], syms_im[1])
+
+
+def emit_inline_leaf(prog, addrs, twiddles):
+    #  Emit a leaf DFT (codelet) on the points at memory addresses `addrs`
+    #  (see emit_inline() for `twiddles`).
+    N = len(addrs)
+    
+    #  Load all points into local variables.
+    prog.begin_group()
+    syms_re = []
+    syms_im = []
+    for k in range(0, N):
+        sym_re = prog.tmp()
+        sym_im = prog.tmp()
+        prog.load(sym_re, IO_REAL, addrs[k])
+        prog.load(sym_im, IO_IMAG, addrs[k])
+        syms_re.append(sym_re)
+        syms_im.append(sym_im)
+    
+    #  N-point DFT (the k-th output is stored in symbol local_addrs[k]).
+    local_addrs = list(range(0, N))
+    emit_fft__internal(prog, syms_re, syms_im, local_addrs, list(range(0, N)), N)
+    
+    #  Apply twiddle factors.
+    for k in range(0, N):
+        if twiddles[k] is not None:
+            emit_twiddle(prog, syms_re, syms_im, local_addrs[k], twiddles[k])
+    
+    #  Store all points.
+    for k in range(0, N):
+        prog.store(IO_REAL, addrs[k], syms_re[local_addrs[k]])
+        prog.store(IO_IMAG, addrs[k], syms_im[local_addrs[k]])
+
+
+def emit(indexes, mem_addresses, plan, depth=0):
     N = len(indexes)
-    ONLY_RADIX_2 = False
     pfx = "    " * depth
-    if N == 2:
-        OUT_BASEOPS.add("MXTr2")
-        OUT_OPCODE.append("MXTr2(%s, %s, %d, %d);" % (IO_REAL, IO_IMAG, mem_addresses[indexes[0]], mem_addresses[indexes[1]]))
+    OUT_PROGRAM.mark_boundary(depth)
+    if plan == 2:
+        emit_baseop("MXTr2", "MXTr2(%s, %s, %d, %d);" % (IO_REAL, IO_IMAG, mem_addresses[indexes[0]], mem_addresses[indexes[1]]))
         if DEBUG:
             print(pfx + "DFT(2): ", indexes[0], indexes[1], "(mem:", mem_addresses[indexes[0]], mem_addresses[indexes[1]], ")")
-    elif N == 3 and not ONLY_RADIX_2:
-        OUT_BASEOPS.add("MXTr3")
-        OUT_OPCODE.append("MXTr3(%s, %s, %d, %d, %d);" % (IO_REAL, IO_IMAG, mem_addresses[indexes[0]], mem_addresses[indexes[1]], mem_addresses[indexes[2]]))
+    elif plan == 3:
+        emit_baseop("MXTr3", "MXTr3(%s, %s, %d, %d, %d);" % (IO_REAL, IO_IMAG, mem_addresses[indexes[0]], mem_addresses[indexes[1]], mem_addresses[indexes[2]]))
         if DEBUG:
             print("DFT(3): ", mem_addresses[indexes[0]], mem_addresses[indexes[1]], mem_addresses[indexes[2]])
-    elif N == 4 and not ONLY_RADIX_2:
-        OUT_BASEOPS.add("MXTr4")
-        OUT_OPCODE.append("MXTr4(%s, %s, %d, %d, %d, %d);" % (IO_REAL, IO_IMAG, mem_addresses[indexes[0]], mem_addresses[indexes[1]], mem_addresses[indexes[2]], mem_addresses[indexes[3]]))
+    elif plan == 4:
+        emit_baseop("MXTr4", "MXTr4(%s, %s, %d, %d, %d, %d);" % (IO_REAL, IO_IMAG, mem_addresses[indexes[0]], mem_addresses[indexes[1]], mem_addresses[indexes[2]], mem_addresses[indexes[3]]))
         if DEBUG:
             print("DFT(4): ", mem_addresses[indexes[0]], mem_addresses[indexes[1]], mem_addresses[indexes[2]], mem_addresses[indexes[3]])
-    elif N == 5 and not ONLY_RADIX_2:
-        OUT_BASEOPS.add("MXTr5")
-        OUT_OPCODE.append("MXTr5(%s, %s, %d, %d, %d, %d, %d);" % (IO_REAL, IO_IMAG, mem_addresses[indexes[0]], mem_addresses[indexes[1]], mem_addresses[indexes[2]], mem_addresses[indexes[3]], mem_addresses[indexes[4]]))
+    elif plan == 5:
+        emit_baseop("MXTr5", "MXTr5(%s, %s, %d, %d, %d, %d, %d);" % (IO_REAL, IO_IMAG, mem_addresses[indexes[0]], mem_addresses[indexes[1]], mem_addresses[indexes[2]], mem_addresses[indexes[3]], mem_addresses[indexes[4]]))
         if DEBUG:
             print("DFT(5): ", mem_addresses[indexes[0]], mem_addresses[indexes[1]], mem_addresses[indexes[2]], mem_addresses[indexes[3]], mem_addresses[indexes[4]])
+    elif isinstance(plan, int):
+        #  No base operation, use scalar code.
+        if DEBUG:
+            print(pfx + "DFT(%d): " % N, [mem_addresses[i] for i in indexes])
+        emit_inline_leaf(OUT_PROGRAM, [mem_addresses[i] for i in indexes], [None] * N)
+    elif plan[0] == "rader":
+        #  Rader's algorithm (see emit_inline()).
+        _, M, plan_sub, _ = plan
+        g, B = rader_constants(N)
+        sub_indexes = rader_indexes(indexes, g)
+        if DEBUG:
+            print(pfx + "Rader N, g=", N, g, indexes)
+        
+        #  A = DFT(a), C = A * B.
+        emit(sub_indexes, mem_addresses, plan_sub, depth + 1)
+        for k in range(1, M):
+            emit_baseop("MXRot", "MXRot(%s, %s, %d, %s, %s);" % (IO_REAL, IO_IMAG, mem_addresses[sub_indexes[k]], str(B[k].real), str(B[k].imag)))
+        emit_rader_dc(OUT_PROGRAM, mem_addresses[indexes[0]], mem_addresses[sub_indexes[0]], B[0], None)
+        
+        #  X_(g^m) = DFT(C)[m].
+        emit(sub_indexes, mem_addresses, plan_sub, depth + 1)
+    elif plan[0] == "pfa":
+        #  Divide N into coprime N1 and N2 (N = N1 * N2).
+        _, N2, plan2, plan1 = plan
+        N1 = N // N2
+        positions, crt = pfa_maps(N1, N2)
+        if DEBUG:
+            print(pfx + "PFA N1, N2=", N1, N2, indexes)
+        
+        #  Perform N2-point DFT.
+        for k1 in range(0, N1):
+            dft_indexes = [None] * N2
+            for k2 in range(0, N2):
+                dft_indexes[k2] = indexes[positions[k2][k1]]
+            emit(dft_indexes, mem_addresses, plan2, depth + 1)
+        
+        #  Perform N1-point DFT.
+        for k2 in range(0, N2):
+            dft_indexes = [None] * N1
+            for k1 in range(0, N1):
+                dft_indexes[k1] = indexes[positions[k2][k1]]
+            emit(dft_indexes, mem_addresses, plan1, depth + 1)
+        
+        #  shuffle
+        pfa_shuffle(indexes, mem_addresses, positions, crt)
     else:
         #  Divide N into N1 and N2 (N = N1 * N2).
-        N1 = 0
-        N2 = 0
-        if ONLY_RADIX_2:
-            if N % 2 == 0:
-                N2 = 2
-                N1 = N // N2
-        else:
-            for t in [5, 4, 3, 2]:
-                if (N % t) == 0:
-                    N2 = t
-                    N1 = N // N2
-                    break
-        if N1 == 0:
-            raise Exception("Bad radix.")
+        _, N2, plan2, plan1 = plan
+        N1 = N // N2
         if DEBUG:
             print(pfx + "N1, N2=", N1, N2, indexes)
         
@@ -87,9 +656,7 @@ def emit(indexes, mem_addresses, depth=0):
             for j in range(0, N2):
                 off = i * j
                 if TW_r[off] is None:
-                    rad = ((-2 * math.pi) / N) * off
-                    TW_r[off] = math.cos(rad)
-                    TW_i[off] = math.sin(rad)
+                    TW_r[off], TW_i[off] = unit_root(-2 * off, N)
         
         #  Perform N1-point DFT.
         for k1 in range(0, N1):
@@ -98,7 +665,7 @@ def emit(indexes, mem_addresses, depth=0):
             for k2 in range(0, N2):
                 i = indexes[N1 * k2 + k1]
                 dft_indexes[k2] = i
-            emit(dft_indexes, mem_addresses, depth + 1)
+            emit(dft_indexes, mem_addresses, plan2, depth + 1)
         
         #  Apply twiddle factors.
         for k2 in range(0, N2):
@@ -115,8 +682,10 @@ def emit(indexes, mem_addresses, depth=0):
                 if DEBUG:
                     print(pfx + "twiddle", i, N1 * k2, k1, tw_off)
                 
-                OUT_BASEOPS.add("MXRot")
-                OUT_OPCODE.append("MXRot(%s, %s, %d, %s, %s);" % (IO_REAL, IO_IMAG, mem_addresses[i], str(tw_re), str(tw_im)))
+                if is_trivial_twiddle(tw_off, N):
+                    emit_twiddle_inline(OUT_PROGRAM, mem_addresses[i], tw_off, N)
+                else:
+                    emit_baseop("MXRot", "MXRot(%s, %s, %d, %s, %s);" % (IO_REAL, IO_IMAG, mem_addresses[i], str(tw_re), str(tw_im)))
         
         #  Perform N2-point DFT.
         for k2 in range(0, N2):
@@ -125,7 +694,7 @@ def emit(indexes, mem_addresses, depth=0):
             for k1 in range(0, N1):
                 i = indexes[N1 * k2 + k1]
                 dft_indexes[k1] = i
-            emit(dft_indexes, mem_addresses, depth + 1)
+            emit(dft_indexes, mem_addresses, plan1, depth + 1)
         
         #  shuffle
         mem_reorder = [None] * N
@@ -134,36 +703,457 @@ def emit(indexes, mem_addresses, depth=0):
                 mem_reorder[N2 * k1 + k2] = mem_addresses[indexes[N1 * k2 + k1]]
         for i in range(0, N):
             mem_addresses[indexes[i]] = mem_reorder[i]
+
+
+def emit_inline(indexes, mem_addresses, twiddles, plan, depth=0):
+    #  Note(s):
+    #    [1] twiddles[k] is either None, (p, q), which means that the k-th
+    #        output of the DFT shall be multiplied by e ^ (-2j * PI * p / q),
+    #        or a complex constant that the k-th output shall be multiplied
+    #        by.
+    N = len(indexes)
+    pfx = "    " * depth
+    OUT_PROGRAM.mark_boundary(depth)
+    if isinstance(plan, int):
+        if DEBUG:
+            print(pfx + "DFT(%d): " % N, [mem_addresses[i] for i in indexes])
+        emit_inline_leaf(OUT_PROGRAM, [mem_addresses[i] for i in indexes], twiddles)
+    elif plan[0] == "rader":
+        #  Rader's algorithm:
+        #    X_(g^-m) = x_0 + SUM(a_q * b_(m-q)) (0 <= m < N - 1),
+        #  where a_q = x_(g^q), b_q = e ^ (-2j * PI * g^-q / N) and g is a
+        #  primitive root of N.
+        #
+        #  Note(s):
+        #    [1] The cyclic convolution is done by A = DFT(a), C = A * B
+        #        (B is the DFT of b, scaled by 1 / (N - 1)) and the inverse
+        #        DFT of C, which is DFT(C)[-m], so X_(g^m) = DFT(C)[m].
+        #    [2] x_0 is added to C_0 so that it is added to all outputs.
+        #    [3] The q-th output of both sub-DFTs is stored at the memory
+        #        address of x_(g^q), so no shuffle is needed.
+        _, M, plan_sub, _ = plan
+        g, B = rader_constants(N)
+        sub_indexes = rader_indexes(indexes, g)
+        if DEBUG:
+            print(pfx + "Rader N, g=", N, g, indexes)
+        
+        #  A = DFT(a), C = A * B (except the 0th bin).
+        emit_inline(sub_indexes, mem_addresses, [None] + B[1:], plan_sub, depth + 1)
+        emit_rader_dc(OUT_PROGRAM, mem_addresses[indexes[0]], mem_addresses[sub_indexes[0]], B[0], twiddles[0])
+        
+        #  X_(g^m) = DFT(C)[m].
+        sub_twiddles = [twiddles[pow(g, m, N)] for m in range(0, M)]
+        emit_inline(sub_indexes, mem_addresses, sub_twiddles, plan_sub, depth + 1)
+    elif plan[0] == "pfa":
+        #  Divide N into coprime N1 and N2 (N = N1 * N2).
+        _, N2, plan2, plan1 = plan
+        N1 = N // N2
+        positions, crt = pfa_maps(N1, N2)
+        if DEBUG:
+            print(pfx + "PFA N1, N2=", N1, N2, indexes)
+        
+        #  Perform N2-point DFT.
+        for k1 in range(0, N1):
+            dft_indexes = [None] * N2
+            for k2 in range(0, N2):
+                dft_indexes[k2] = indexes[positions[k2][k1]]
+            emit_inline(dft_indexes, mem_addresses, [None] * N2, plan2, depth + 1)
+        
+        #  Perform N1-point DFT (the k1-th output of the k2-th DFT is the
+        #  crt[k2][k1]-th output of this DFT).
+        for k2 in range(0, N2):
+            dft_indexes = [None] * N1
+            dft_twiddles = [None] * N1
+            for k1 in range(0, N1):
+                dft_indexes[k1] = indexes[positions[k2][k1]]
+                dft_twiddles[k1] = twiddles[crt[k2][k1]]
+            emit_inline(dft_indexes, mem_addresses, dft_twiddles, plan1, depth + 1)
         
+        #  shuffle
+        pfa_shuffle(indexes, mem_addresses, positions, crt)
+    else:
+        #  Divide N into N1 and N2 (N = N1 * N2).
+        _, N2, plan2, plan1 = plan
+        N1 = N // N2
+        if DEBUG:
+            print(pfx + "N1, N2=", N1, N2, indexes)
+        
+        #  Perform N1-point DFT (with twiddle factors applied to the outputs).
+        for k1 in range(0, N1):
+            dft_indexes = [None] * N2
+            dft_twiddles = [None] * N2
+            for k2 in range(0, N2):
+                dft_indexes[k2] = indexes[N1 * k2 + k1]
+                if (k1 * k2) % N != 0:
+                    dft_twiddles[k2] = (k1 * k2, N)
+            emit_inline(dft_indexes, mem_addresses, dft_twiddles, plan2, depth + 1)
+        
+        #  Perform N2-point DFT (the k-th output of this DFT is the k1-th
+        #  output of the k2-th sub-DFT, where k = N2 * k1 + k2).
+        for k2 in range(0, N2):
+            dft_indexes = [0] * N1
+            dft_twiddles = [None] * N1
+            for k1 in range(0, N1):
+                dft_indexes[k1] = indexes[N1 * k2 + k1]
+                dft_twiddles[k1] = twiddles[N2 * k1 + k2]
+            emit_inline(dft_indexes, mem_addresses, dft_twiddles, plan1, depth + 1)
+        
+        #  shuffle
+        mem_reorder = [None] * N
+        for k1 in range(0, N1):
+            for k2 in range(0, N2):
+                mem_reorder[N2 * k1 + k2] = mem_addresses[indexes[N1 * k2 + k1]]
+        for i in range(0, N):
+            mem_addresses[indexes[i]] = mem_reorder[i]
 
-def main():
-    #
-    #  Phase 1: Load and prepare.
+
+def pfa_maps(N1, N2):
+    #  Get the Good-Thomas index mappings of N = N1 * N2 (N1 and N2 shall be
+    #  coprime):
+    #    positions[n2][n1] = (N1 * n2 + N2 * n1) mod N (input mapping, the
+    #                        N2-point DFTs are performed over n2, then the
+    #                        N1-point DFTs over n1, both in place).
+    #    crt[k2][k1] = k, where k mod N2 = k2 and k mod N1 = k1 (output
+    #                  mapping).
+    N = N1 * N2
+    if math.gcd(N1, N2) != 1:
+        raise Exception("N1 and N2 are not coprime.")
+    positions = []
+    crt = []
+    for n2 in range(0, N2):
+        positions.append([(N1 * n2 + N2 * n1) % N for n1 in range(0, N1)])
+        crt.append([None] * N1)
+    for k in range(0, N):
+        crt[k % N2][k % N1] = k
+    return positions, crt
+
+
+def pfa_shuffle(indexes, mem_addresses, positions, crt):
+    #  The k-th output is stored at the position of the k1-th output of the
+    #  k2-th N1-point DFT (where k = crt[k2][k1]).
+    N = len(indexes)
+    mem_reorder = [None] * N
+    for k2 in range(0, len(positions)):
+        for k1 in range(0, len(positions[k2])):
+            mem_reorder[crt[k2][k1]] = mem_addresses[indexes[positions[k2][k1]]]
+    for i in range(0, N):
+        mem_addresses[indexes[i]] = mem_reorder[i]
+
+
+def plan_fixed(N, pfa=False):
+    #  Split N by the first radix (within [5, 4, 3, 2]) that divides N, or by
+    #  the smallest prime factor of N (use Good-Thomas algorithm if the radix
+    #  and N / radix are coprime and `pfa` is True).
+    if N <= 5:
+        return N
+    if is_prime(N):
+        if N <= RADER_LEAF_MAX:
+            return N
+        return ("rader", N - 1, plan_fixed(N - 1, pfa), None)
+    t = smallest_factor(N)
+    for radix in [5, 4, 3, 2]:
+        if (N % radix) == 0:
+            t = radix
+            break
+    if pfa and math.gcd(t, N // t) == 1:
+        return ("pfa", t, t, plan_fixed(N // t, pfa))
+    return ("ct", t, t, plan_fixed(N // t, pfa))
+
+
+def plan_text(plan):
+    if isinstance(plan, int):
+        return str(plan)
+    kind, N2, plan2, plan1 = plan
+    if kind == "rader":
+        return "rader(%s)" % plan_text(plan2)
+    texts = []
+    for sub in [plan2, plan1]:
+        if isinstance(sub, int):
+            texts.append(plan_text(sub))
+        else:
+            texts.append("(" + plan_text(sub) + ")")
+    if kind == "pfa":
+        return " * ".join(texts)
+    return " x ".join(texts)
+
+
+def cost_new(flop=0, memory=0, twiddle=0, spill=0):
+    return {"flop": flop, "memory": memory, "twiddle": twiddle, "spill": spill}
+
+
+def cost_add(cost, other, times=1):
+    for key in cost:
+        cost[key] += other[key] * times
+
+
+def cost_score(cost):
+    score = 0.0
+    for key in cost:
+        score += COST_WEIGHTS[key] * cost[key]
+    return score
+
+
+def cost_measure(prog):
+    #  Measure the cost of an optimized (scratch) program.
+    PassManager().run(prog)
+    arith = prog.count_arith()
+    memory = prog.count_memory()
+    return cost_new(
+        flop=arith["add"] + arith["mul"] + arith["neg"],
+        memory=memory["load"] + memory["store"],
+        spill=max(len(prog.variables()) - COST_REGISTERS, 0)
+    )
+
+
+def plan_auto(N, mode, pfa=False):
+    #  Find the cheapest factorization of N under the cost model.
     #
+    #  Note(s):
+    #    [1] A N-point DFT (N = N1 * N2) consists of N1 N2-point DFTs, N2
+    #        N1-point DFTs and the twiddle factors between them. The cost of
+    #        a sub-DFT only depends on its size, so the best plan of each size
+    #        is memoized.
+    #    [2] If `pfa` is True, Good-Thomas algorithm (without twiddle factor)
+    #        is also considered for coprime N1 and N2.
+    #    [3] Primes (larger than 5) are done by either a leaf codelet (if the
+    #        prime is within LEAF_SIZES or not larger than RADER_LEAF_MAX) or
+    #        a "rader" plan node.
+    leaf_sizes = LEAF_SIZES[mode]
+    best_plans = {}
+    leaf_costs = {}
+    twiddle_costs = {}
     
-    #  Parse the command-line arguments.
-    if len(sys.argv) != 2:
-        print("./compiler.py [config]")
-        sys.exit(1)
-    cfgfile_path = sys.argv[1]
+    def leaf_cost(r):
+        if r not in leaf_costs:
+            if mode == "inline" or ("MXTr%d" % r) not in BASEOP_ARITH:
+                prog = Program()
+                emit_inline_leaf(prog, list(range(0, r)), [None] * r)
+                leaf_costs[r] = cost_measure(prog)
+            else:
+                baseop = "MXTr%d" % r
+                arith = BASEOP_ARITH[baseop]
+                leaf_costs[r] = cost_new(
+                    flop=arith.get("add", 0) + arith.get("mul", 0),
+                    memory=BASEOP_MEMORY[baseop]
+                )
+        return leaf_costs[r]
     
-    #  Read the header file.
-    fp = open(HDRFILE_PATH, "r", encoding="utf-8")
-    hdr = fp.read().rstrip()
-    fp.close()
+    def twiddle_cost(p, q):
+        t = math.gcd(p, q)
+        p //= t
+        q //= t
+        if q == 1:
+            return cost_new()
+        if (p, q) not in twiddle_costs:
+            if mode == "inline":
+                #  Fused into the leaf DFT (no extra memory access).
+                prog = Program()
+                prog.load("x", IO_REAL, 0)
+                prog.load("y", IO_IMAG, 0)
+                emit_rotate(prog, ["x"], ["y"], 0, -2 * p, q)
+                prog.store(IO_REAL, 0, "x")
+                prog.store(IO_IMAG, 0, "y")
+                cost = cost_measure(prog)
+                cost["memory"] = 0
+            elif is_trivial_twiddle(p, q):
+                prog = Program()
+                emit_twiddle_inline(prog, 0, p, q)
+                cost = cost_measure(prog)
+            else:
+                arith = BASEOP_ARITH["MXRot"]
+                cost = cost_new(
+                    flop=arith["add"] + arith["mul"],
+                    memory=BASEOP_MEMORY["MXRot"]
+                )
+            if cost["flop"] != 0 and q > 2:
+                cost["twiddle"] = 1
+            twiddle_costs[(p, q)] = cost
+        return twiddle_costs[(p, q)]
     
-    #  Read the configuration file.
-    fp = open(cfgfile_path, "r", encoding="utf-8")
-    config = json.loads(fp.read())
-    fp.close()
+    def rader_cost(n, sub):
+        #  Two sub-DFTs, N - 2 constant multiplications and the 0th bin.
+        cost = cost_new()
+        cost_add(cost, sub[1], 2)
+        if mode == "inline":
+            prog = Program()
+            prog.load("x", IO_REAL, 0)
+            prog.load("y", IO_IMAG, 0)
+            emit_cmul_const(prog, ["x"], ["y"], 0, 0.6, 0.8)
+            prog.store(IO_REAL, 0, "x")
+            prog.store(IO_IMAG, 0, "y")
+            cmul = cost_measure(prog)
+            cmul["memory"] = 0
+        else:
+            arith = BASEOP_ARITH["MXRot"]
+            cmul = cost_new(
+                flop=arith["add"] + arith["mul"],
+                memory=BASEOP_MEMORY["MXRot"]
+            )
+        cmul["twiddle"] = 1
+        cost_add(cost, cmul, n - 2)
+        prog = Program()
+        emit_rader_dc(prog, 0, 1, complex(-1.0 / (n - 1), 0), None)
+        cost_add(cost, cost_measure(prog))
+        return cost
     
-    #  Get and check the N.
-    N = config["N"]
-    if not (isinstance(N, int) and N > 0):
-        raise Exception("Illegal point count.")
+    def search(n):
+        if n in best_plans:
+            return best_plans[n]
+        best = None
+        if n in leaf_sizes or (is_prime(n) and n <= RADER_LEAF_MAX):
+            best = (n, leaf_cost(n))
+        if is_prime(n) and n > 5 and n not in leaf_sizes:
+            sub = search(n - 1)
+            cost = rader_cost(n, sub)
+            if best is None or cost_score(cost) < cost_score(best[1]):
+                best = (("rader", n - 1, sub[0], None), cost)
+        for n2 in range(n - 1, 1, -1):
+            if n % n2 != 0:
+                continue
+            n1 = n // n2
+            sub2 = search(n2)
+            sub1 = search(n1)
+            if sub2 is None or sub1 is None:
+                continue
+            cost = cost_new()
+            cost_add(cost, sub2[1], n1)
+            cost_add(cost, sub1[1], n2)
+            if pfa and math.gcd(n1, n2) == 1:
+                kind = "pfa"
+            else:
+                kind = "ct"
+                for k1 in range(1, n1):
+                    for k2 in range(1, n2):
+                        cost_add(cost, twiddle_cost(k1 * k2, n))
+            if best is None or cost_score(cost) < cost_score(best[1]):
+                best = ((kind, n2, sub2[0], sub1[0]), cost)
+        best_plans[n] = best
+        return best
     
-    #  Get the output file path.
-    outfile_path = os.path.join(BASE_DIR, config["output"])
+    result = search(N)
+    if result is None:
+        raise Exception("Bad radix.")
+    return result
+
+
+def check_groups(groups):
+    #  Ensure that no variable is live across two groups.
+    var_group = {}
+    for group_id in range(0, len(groups)):
+        for opc in groups[group_id]:
+            if opc["nop"]:
+                continue
+            for var_in in opc["in"]:
+                if isinstance(var_in, str) and var_group[var_in] != group_id:
+                    raise Exception("Variable \"%s\" is live across groups." % var_in)
+            for var_out in opc["out"]:
+                var_group[var_out] = group_id
+
+
+def compact_radices(N):
+    #  Get the radix of each stage of the compact kernel (radix-4 stages
+    #  first, followed by the radix-2, 3 and 5 stages).
+    radices = []
+    rest = N
+    for radix in [4, 2, 3, 5]:
+        while rest % radix == 0:
+            radices.append(radix)
+            rest //= radix
+    if rest != 1:
+        raise Exception("Compact mode requires N = 2^a * 3^b * 5^c.")
+    return radices
+
+
+def compact_indexes(indexes, radices):
+    #  Get the input index of each point of the compact kernel (i.e. the
+    #  digit-reversed order), the last stage combines the sub-transforms of
+    #  indexes[k::p] (0 <= k < p, p is the radix of the last stage).
+    if len(radices) == 0:
+        return list(indexes)
+    p = radices[-1]
+    result = []
+    for k in range(0, p):
+        result += compact_indexes(indexes[k::p], radices[:-1])
+    return result
+
+
+def compact_twiddles(radices):
+    #  Get the twiddle factors of the compact kernel (see MXCompact() of the
+    #  "fft-mx-baseop" module), the factors are computed here (instead of by
+    #  the JS engine at runtime) so that all engines get the same tables.
+    twiddles = []
+    m = 1
+    for p in radices:
+        L = m * p
+        for j in range(0, m):
+            for k in range(1, p):
+                twiddles.extend(unit_root(-2 * j * k, L))
+        m = L
+    return twiddles
+
+
+def render_table_js(const_name, array_type, values, width=76):
+    #  Render a JavaScript constant declaration of a typed array table.
+    items = [str(value) for value in values]
+    lines = textwrap.wrap(", ".join(items), width - 4, break_on_hyphens=False)
+    return ["const %s = new %s([" % (const_name, array_type)] + ["    " + line for line in lines] + ["]);"]
+
+
+def emit_compact(N, radices, scale=None):
+    #  Emit the call of the table-driven loop kernel (MXCompact) and its
+    #  tables (into OUT_COMPACT), scale all outputs by `scale` if it is not
+    #  None.
+    OUT_COMPACT.extend(render_table_js("COMPACT_RADICES", "Int32Array", radices))
+    OUT_COMPACT.extend(render_table_js("COMPACT_INDEXES", "Int32Array", compact_indexes(list(range(0, N)), radices)))
+    OUT_COMPACT.extend(render_table_js("COMPACT_TWIDDLES", "Float64Array", compact_twiddles(radices)))
+    OUT_COMPACT.append("const COMPACT_SCRATCH_RE = new Float64Array(%d);" % N)
+    OUT_COMPACT.append("const COMPACT_SCRATCH_IM = new Float64Array(%d);" % N)
+    
+    #  Count the arithmetic operations and the array element accesses of all
+    #  stages (the rotations by the trivial twiddle factors of j = 0 are
+    #  skipped), each rotation also loads its twiddle factor (2 elements) and
+    #  each stage loads its radix. The gather step loads the index table and
+    #  the points (and stores them to the scratch buffers), the final step
+    #  copies the points back.
+    arith = {"add": 0, "mul": 0}
+    memory = {"load": 3 * N, "store": 2 * N}
+    m = 1
+    for p in radices:
+        L = m * p
+        rotations = (m - 1) * (p - 1) * (N // L)
+        for key, value in BASEOP_ARITH["MXTr%d" % p].items():
+            arith[key] += value * (N // p)
+        for key, value in BASEOP_ARITH["MXRot"].items():
+            arith[key] += value * rotations
+        for key, value in baseop_memory("MXTr%d" % p, N // p).items():
+            memory[key] += value
+        for key, value in baseop_memory("MXRot", rotations).items():
+            memory[key] += value
+        memory["load"] += 2 * rotations + 1
+        m = L
+    memory["load"] += 2 * N
+    memory["store"] += 2 * N
+    if scale is not None:
+        arith["mul"] += 2 * N
+        scale_arg = ", %s" % str(scale)
+    else:
+        scale_arg = ""
+    
+    OUT_BASEOPS.add("MXCompact")
+    OUT_PROGRAM.begin_group()
+    OUT_PROGRAM.call(
+        "MXCompact(%s, %s, COMPACT_RADICES, COMPACT_INDEXES, COMPACT_TWIDDLES, COMPACT_SCRATCH_RE, COMPACT_SCRATCH_IM%s);" % (IO_REAL, IO_IMAG, scale_arg),
+        arith=arith,
+        memory=memory
+    )
+
+
+def generate_dft(N, mode, plan, direction="forward", scale=None):
+    #  Emit the N-point DFT into a new program (OUT_PROGRAM), scale all
+    #  outputs by `scale` if it is not None (in compact mode, `plan` is the
+    #  radix list of compact_radices()).
+    global OUT_PROGRAM
+    OUT_PROGRAM = Program()
     
     #  Prepare DFT contexts.
     indexes = [0] * N
@@ -172,13 +1162,28 @@ def main():
         indexes[i] = i
         mem_addresses[i] = i
     
-    #
-    #  Phase 2: DFT.
-    #
-    
     #  Perform N-point DFT.
     if N > 1:
-        emit(indexes, mem_addresses)
+        if mode == "inline":
+            #  The scale factor is fused into the last stage (as twiddle
+            #  factors of the outputs).
+            if scale is not None:
+                twiddles = [complex(scale, 0)] * N
+            else:
+                twiddles = [None] * N
+            emit_inline(indexes, mem_addresses, twiddles, plan)
+        elif mode == "compact":
+            #  The outputs are stored in natural order (by the loop kernel).
+            emit_compact(N, plan, scale)
+        else:
+            emit(indexes, mem_addresses, plan)
+            if scale is not None:
+                for i in range(0, N):
+                    emit_scale_inline(OUT_PROGRAM, mem_addresses[i], scale)
+    
+    #  Swap the real and imaginary arrays for inverse transform.
+    if direction == "inverse":
+        rewrite_inverse(OUT_PROGRAM)
     
     #  DEBUG: Print memory address (DFT index) mapping.
     if DEBUG:
@@ -186,9 +1191,55 @@ def main():
             j = mem_addresses[i]
             print("out", "index=" + str(i), "storage_addr=" + str(j))
     
-    #  Restore DFT indexing.
+    return OUT_PROGRAM, mem_addresses
+
+
+def generate_real_dft(N, plan, real, scale=None):
+    #  Emit the N-point real-data transform (see REAL_KINDS) into a new
+    #  program (OUT_PROGRAM), scale all outputs by `scale` if it is not None.
+    #  Returns the program and the memory addresses of the outputs (None if
+    #  the outputs are written in natural order).
+    #
+    #  Note(s):
+    #    [1] `plan` is the plan of the complex DFT (N / 2 points for "r2c" and
+    #        "c2r", N points for "paired").
+    global OUT_PROGRAM
+    OUT_PROGRAM = Program()
+    if real == "paired":
+        mem_addresses = list(range(0, N))
+        if scale is not None:
+            twiddles = [complex(scale, 0)] * N
+        else:
+            twiddles = [None] * N
+        emit_inline(list(range(0, N)), mem_addresses, twiddles, plan)
+        OUT_PROGRAM.mark_boundary(0)
+        emit_paired_split(OUT_PROGRAM, mem_addresses)
+        return OUT_PROGRAM, mem_addresses
+    
+    M = N // 2
+    mem_addresses = list(range(0, M))
+    if scale is None:
+        scale = 1
+    if real == "r2c":
+        emit_inline(list(range(0, M)), mem_addresses, [None] * M, plan)
+        rewrite_real_input(OUT_PROGRAM)
+        OUT_PROGRAM.mark_boundary(0)
+        emit_real_split(OUT_PROGRAM, mem_addresses, scale)
+        return OUT_PROGRAM, mem_addresses
+    else:
+        emit_real_merge(OUT_PROGRAM, M, scale)
+        dft_ops_begin = len(OUT_PROGRAM.ops)
+        emit_inline(list(range(0, M)), mem_addresses, [None] * M, plan)
+        rewrite_inverse(OUT_PROGRAM, OUT_PROGRAM.ops[dft_ops_begin:])
+        rewrite_real_output(OUT_PROGRAM, mem_addresses)
+        return OUT_PROGRAM, None
+
+
+def generate_restore(mem_addresses):
+    #  Generate the JS lines that restore DFT indexing (in place).
+    N = len(mem_addresses)
+    lines = []
     visited = set()
-    cyc_id = 0
     for i in range(0, N):
         if i in visited:
             continue
@@ -208,153 +1259,840 @@ def main():
             continue
         elif len(cycle) == 2:
             OUT_BASEOPS.add("MXSwap")
-            OUT_OPCODE.append("MXSwap(%s, %s, %d, %d);" % (IO_REAL, IO_IMAG, cycle[0], cycle[1]))
+            lines.append("MXSwap(%s, %s, %d, %d);" % (IO_REAL, IO_IMAG, cycle[0], cycle[1]))
         else:
             if DEBUG:
                 print("cyc:", cycle)
             
-            cyc_name = "CSHFT_INDEXES_%d" % cyc_id
-            
+            #  Reuse the constant if the same cycle was generated before.
+            cyc_value = json.dumps(cycle)
+            cyc_name = None
+            for line in OUT_CSHFT:
+                if line.endswith(" = %s;" % cyc_value):
+                    cyc_name = line.split(" ")[1]
+            if cyc_name is None:
+                cyc_name = "CSHFT_INDEXES_%d" % len(OUT_CSHFT)
+                OUT_CSHFT.append("const %s = %s;" % (cyc_name, cyc_value))
             OUT_BASEOPS.add("MXCshft")
-            OUT_CSHFT.append("const %s = %s;" % (cyc_name, json.dumps(cycle)))
-            OUT_OPCODE.append("MXCshft(%s, %s, %s);" % (IO_REAL, IO_IMAG, cyc_name))
-            cyc_id += 1
+            lines.append("MXCshft(%s, %s, %s);" % (IO_REAL, IO_IMAG, cyc_name))
+    return lines
+
+
+def emit_restore_inline(prog, mem_addresses):
+    #  Emit the operations that restore DFT indexing (in place), each cycle
+    #  of the permutation is rotated through one complex temporary (in its
+    #  own operation group).
+    N = len(mem_addresses)
+    visited = set()
+    prog.mark_boundary(0)
+    for i in range(0, N):
+        if i in visited or mem_addresses[i] == i:
+            continue
+        cycle = [i]
+        visited.add(i)
+        while mem_addresses[cycle[-1]] != i:
+            cycle.append(mem_addresses[cycle[-1]])
+            visited.add(cycle[-1])
+        prog.begin_group()
+        sym_t_re = prog.tmp()
+        sym_t_im = prog.tmp()
+        prog.load(sym_t_re, IO_REAL, cycle[0])
+        prog.load(sym_t_im, IO_IMAG, cycle[0])
+        for j in range(0, len(cycle) - 1):
+            sym_re = prog.tmp()
+            sym_im = prog.tmp()
+            prog.load(sym_re, IO_REAL, cycle[j + 1])
+            prog.load(sym_im, IO_IMAG, cycle[j + 1])
+            prog.store(IO_REAL, cycle[j], sym_re)
+            prog.store(IO_IMAG, cycle[j], sym_im)
+        prog.store(IO_REAL, cycle[-1], sym_t_re)
+        prog.store(IO_IMAG, cycle[-1], sym_t_im)
+
+
+def rewrite_inverse(prog, ops=None):
+    #  Swap the real and imaginary arrays of all memory accesses and base
+    #  operation calls (IDFT(x) = swap(DFT(swap(x)))) of the program (or a
+    #  part of its operations).
+    if ops is None:
+        ops = prog.ops
+    swap = {IO_REAL: IO_IMAG, IO_IMAG: IO_REAL}
+    call_pfx = "(%s, %s, " % (IO_REAL, IO_IMAG)
+    for opc in ops:
+        if opc["op"] == OP_LOAD or opc["op"] == OP_STORE:
+            opc["arr"] = swap[opc["arr"]]
+        elif opc["op"] == OP_CALL:
+            if call_pfx not in opc["text"]:
+                raise Exception("Unexpected base operation call \"%s\"." % opc["text"])
+            opc["text"] = opc["text"].replace(call_pfx, "(%s, %s, " % (IO_IMAG, IO_REAL), 1)
+
+
+def rewrite_real_input(prog):
+    #  Redirect the first load of each memory address (i.e. the load before
+    #  any store to the address) to the real points, so that the m-th point
+    #  of the DFT is x[2m] + 1j * x[2m + 1].
+    stored = set()
+    for opc in prog.ops:
+        if opc["op"] == OP_LOAD:
+            if (opc["arr"], opc["idx"]) not in stored:
+                if opc["arr"] == IO_REAL:
+                    opc["idx"] = 2 * opc["idx"]
+                else:
+                    opc["idx"] = 2 * opc["idx"] + 1
+                opc["arr"] = IO_SAMPLES
+        elif opc["op"] == OP_STORE:
+            stored.add((opc["arr"], opc["idx"]))
+        elif opc["op"] == OP_CALL:
+            raise Exception("Real-data kernel can't contain base operation calls.")
+
+
+def rewrite_real_output(prog, mem_addresses):
+    #  Redirect the last store to each memory address to the real points, so
+    #  that the m-th output y[m] of the DFT is written to x[2m] (real part)
+    #  and x[2m + 1] (imaginary part).
+    M = len(mem_addresses)
+    out_indexes = [None] * M
+    for m in range(0, M):
+        out_indexes[mem_addresses[m]] = m
+    last_store = {}
+    for opc in prog.ops:
+        if opc["op"] == OP_STORE:
+            last_store[(opc["arr"], opc["idx"])] = opc
+        elif opc["op"] == OP_CALL:
+            raise Exception("Real-data kernel can't contain base operation calls.")
+    for (arr, idx), opc in last_store.items():
+        if arr == IO_REAL:
+            opc["idx"] = 2 * out_indexes[idx]
+        else:
+            opc["idx"] = 2 * out_indexes[idx] + 1
+        opc["arr"] = IO_SAMPLES
+
+
+def verify_dft(name, prog, mem_addresses, N, direction, scale, real, precision, count):
+    #  Verify the program of a kernel numerically (see the interp module),
+    #  returns True if passed.
+    #
+    #  Note(s):
+    #    [1] The k-th output of the (in-place) program is at index
+    #        mem_addresses[k] (natural order if `mem_addresses` is None).
+    #    [2] The expected outputs are computed by numpy.fft (in double
+    #        precision).
+    np = require_numpy()
+    if scale is None:
+        scale = 1
+    if real == "r2c":
+        M = N // 2
+        addrs = [mem_addresses[k] for k in range(0, M)] + [M]
+        inputs = {IO_SAMPLES: random_vectors(N, count)}
+        X = np.fft.rfft(inputs[IO_SAMPLES], axis=0) * scale
+        return verify_program(
+            name,
+            prog,
+            precision,
+            inputs,
+            lambda arrays: np.concatenate([arrays[IO_REAL][addrs], arrays[IO_IMAG][addrs]]),
+            np.concatenate([X.real, X.imag]),
+            count
+        )
+    if real == "c2r":
+        M = N // 2
+        inputs = {IO_REAL: random_vectors(M + 1, count, 1), IO_IMAG: random_vectors(M + 1, count, 2)}
+        x = np.fft.irfft(inputs[IO_REAL] + 1j * inputs[IO_IMAG], n=N, axis=0) * (N * scale)
+        return verify_program(
+            name,
+            prog,
+            precision,
+            inputs,
+            lambda arrays: arrays[IO_SAMPLES],
+            x,
+            count
+        )
+    
+    #  Get the expected outputs of the complex transform.
+    z_re = random_vectors(N, count, 1)
+    z_im = random_vectors(N, count, 2)
+    z = z_re + 1j * z_im
+    if real == "paired":
+        #  See emit_paired_split().
+        Z = np.fft.fft(z, axis=0)
+        X1 = np.fft.fft(z_re, axis=0)
+        X2 = np.fft.fft(z_im, axis=0)
+        for k in range(1, (N + 1) // 2):
+            Z[k] = X1[k]
+            Z[N - k] = X2[N - k]
+    elif direction == "inverse":
+        Z = np.fft.ifft(z, axis=0) * N
+    else:
+        Z = np.fft.fft(z, axis=0)
+    Z = Z * scale
+    
+    if mem_addresses is None:
+        addrs = list(range(0, N))
+    else:
+        addrs = mem_addresses
+    inputs = {IO_REAL: z_re, IO_IMAG: z_im}
+    outputs = lambda arrays: np.concatenate([arrays[IO_REAL][addrs], arrays[IO_IMAG][addrs]])
+    return verify_program(name, prog, precision, inputs, outputs, np.concatenate([Z.real, Z.imag]), count)
+
+
+def part_cuts(sizes, levels, budget):
+    #  Divide a sequence of operation groups (with instruction count sizes[i]
+    #  and boundary level levels[i], see Program.group_level()) into parts,
+    #  returns the (begin, end) group index ranges of all parts.
+    #
+    #  Note(s):
+    #    [1] Each part contains at most `budget` instructions (unless it has
+    #        only one group), it ends at the boundary of the largest
+    #        sub-transform (the lowest level) after at least half of the
+    #        budget is used (the latest one if there are several).
+    def rank(i):
+        return (float("inf") if levels[i] is None else levels[i], -i)
+    
+    count = len(sizes)
+    cuts = []
+    begin = 0
+    while begin < count:
+        end = begin
+        total = 0
+        while end < count and (end == begin or total + sizes[end] <= budget):
+            total += sizes[end]
+            end += 1
+        if end < count:
+            best = end
+            used = 0
+            for i in range(begin + 1, end):
+                used += sizes[i - 1]
+                if 2 * used >= budget and rank(i) < rank(best):
+                    best = i
+            end = best
+        cuts.append((begin, end))
+        begin = end
+    return cuts
+
+
+def apply_tuning(config, cfgfile_name):
+    #  Apply the tuned parameters of a configuration (recorded by the
+    #  autotuning driver, see "autotune.py") if the tuning file has an entry
+    #  of the configuration file, the tuned parameters override the options
+    #  of the configuration.
+    if not os.path.exists(TUNING_PATH):
+        return config
+    fp = open(TUNING_PATH, "r", encoding="utf-8")
+    tuning = json.loads(fp.read())
+    fp.close()
+    entry = tuning.get("configs", {}).get(cfgfile_name)
+    if entry is None or len(entry["params"]) == 0:
+        return config
+    config = dict(config)
+    for key, value in entry["params"].items():
+        if key not in TUNABLE_KEYS:
+            raise Exception("Parameter \"%s\" is not tunable." % key)
+        config[key] = value
+    print("Tuning: %s (Node.js %s)." % (
+        ", ".join(["%s=%s" % (key, json.dumps(value)) for key, value in entry["params"].items()]),
+        tuning.get("node", "unknown")
+    ))
+    return config
+
+
+def select_budget(config):
+    #  Get the function size budget selected by the "engine" and "budget"
+    #  options of a configuration.
+    engine = config.get("engine", DEFAULT_ENGINE)
+    if engine not in ENGINE_BUDGETS:
+        raise Exception("Unknown engine \"%s\"." % engine)
+    budget = config.get("budget", ENGINE_BUDGETS[engine])
+    if not (isinstance(budget, int) and budget > 0):
+        raise Exception("Illegal function size budget.")
+    return budget
+
+
+def split_parts(prog, offset=None, budget=None):
+    #  Divide all DFT opcodes into one or multiple parts (an operation group
+    #  is never divided, see part_cuts()), each part is described by (local
+    #  variables, JS lines, instruction count, constant magnitudes).
+    #
+    #  Note(s):
+    #    [1] If `offset` is not None, all array elements are indexed relative
+    #        to the index variable `offset`.
+    #    [2] The function size budget is FUNCTION_BUDGET if `budget` is None.
+    #    [3] Each part declares its own constant pool (see constant_pool() of
+    #        the IR module) as locals, so that each constant is materialized
+    #        once per part (instead of once per use).
+    if budget is None:
+        budget = FUNCTION_BUDGET
+    opc_groups = prog.groups()
+    check_groups(opc_groups)
+    sizes = [len([opc for opc in group if not opc["nop"] and opc["op"] != OP_COMMENT]) for group in opc_groups]
+    levels = [prog.group_level(group[0]["group"]) for group in opc_groups]
+    opc_parts = []
+    for begin, end in part_cuts(sizes, levels, budget):
+        part_ops = []
+        for group in opc_groups[begin:end]:
+            part_ops.extend(group)
+        pool = constant_pool(part_ops)
+        part_lines = render_pool_js(pool)
+        for group in opc_groups[begin:end]:
+            part_lines.extend(render_js(prog, debug=DEBUG, ops=group, offset=offset, pool=pool))
+        opc_parts.append((prog.variables(part_ops), part_lines, sum(sizes[begin:end]), set(constant_pool(part_ops, 1).keys())))
+    if len(opc_parts) == 0:
+        opc_parts.append(([], [], 0, set()))
+    return opc_parts
+
+
+def generate_function(func_name, params, comments, opc_parts, tail_lines=[], prog=None):
+    #  Generate the JS code of a kernel function (and its parts), returns
+    #  (private functions, public function) as source writers.
+    #
+    #  Note(s):
+    #    [1] `params` is a list of (name, description) or (name, description,
+    #        type), the type is ARRAY_TYPE if not specified.
+    #    [2] `comments` is a list of comment lines of the public function.
+    #    [3] `opc_parts` is a list of parts (see split_parts()), the
+    #        instruction count of each part and the count of distinct
+    #        constants are reported.
+    #    [4] The metrics of the kernel (see the metrics module) are recorded
+    #        to OUT_METRICS, `prog` is the program of the parts (None if the
+    #        kernel only calls other kernels).
+    private = SourceWriter()
+    public = SourceWriter()
+    param_names = ", ".join([param[0] for param in params])
+    param_docs = ""
+    for param in params:
+        if len(param) == 3:
+            name, desc, param_type = param
+        else:
+            name, desc = param
+            param_type = ARRAY_TYPE
+        param_docs += " *  @param {%s} %s \n" % (param_type, name)
+        param_docs += " *    - %s\n" % desc
+    
+    opc_part_count = len(opc_parts)
+    if opc_part_count > 1:
+        for opc_part_id in range(0, opc_part_count):
+            opc_part_num = opc_part_id + 1
+            private.write("/**\n")
+            private.write(" *  Part %d of %s().\n" % (opc_part_num, func_name))
+            private.write(" * \n")
+            private.write(param_docs)
+            private.write(" */\n")
+            private.write("function %s_Part%d(%s) {\n" % (func_name, opc_part_num, param_names))
+            defs, lines, _, _ = opc_parts[opc_part_id]
+            if len(defs) != 0:
+                private.write("    let " + (", ".join(defs)) + ";\n")
+            private.write_lines(lines, "    ")
+            private.write("}\n")
+            private.write("\n")
+    
+    public.write("/**\n")
+    for line in comments:
+        public.write((" *  %s" % line).rstrip(" ") + (" \n" if line == "" else "\n"))
+    public.write(" * \n")
+    public.write(param_docs)
+    public.write(" */\n")
+    public.write("function %s(%s) {\n" % (func_name, param_names))
+    if opc_part_count > 1:
+        for opc_part_id in range(0, opc_part_count):
+            opc_part_num = opc_part_id + 1
+            public.write("    %s_Part%d(%s);\n" % (func_name, opc_part_num, param_names))
+    else:
+        defs, lines, _, _ = opc_parts[0]
+        if len(defs) != 0:
+            public.write("    let " + (", ".join(defs)) + ";\n")
+        public.write_lines(lines, "    ")
+    public.write_lines(tail_lines, "    ")
+    public.write("}\n")
+    public.write("\n")
+    
+    part_sizes = [part[2] for part in opc_parts]
+    constants = set()
+    for part in opc_parts:
+        constants |= part[3]
+    print("%s: %d instruction(s) in %d part(s) (%s), %d distinct constant(s)." % (
+        func_name,
+        sum(part_sizes),
+        opc_part_count,
+        ", ".join(["%d" % size for size in part_sizes]),
+        len(constants)
+    ))
+    OUT_METRICS[func_name] = kernel_metrics(prog, private.size + public.size, opc_parts)
+    
+    return private, public
+
+
+def plan_dft(N, mode, plan_mode, pfa):
+    #  Plan the N-point DFT of an unrolled mode (by the factorization plan
+    #  `plan_mode`) and print the plan, returns None if N <= 1.
+    if N <= 1:
+        return None
+    if plan_mode == "auto":
+        plan, plan_cost = plan_auto(N, mode, pfa)
+        print("Plan: %s (flop=%d, memory=%d, twiddle=%d, spill=%d, score=%.1f)." % (
+            plan_text(plan),
+            plan_cost["flop"],
+            plan_cost["memory"],
+            plan_cost["twiddle"],
+            plan_cost["spill"],
+            cost_score(plan_cost)
+        ))
+    else:
+        plan = plan_fixed(N, pfa)
+        print("Plan: %s." % plan_text(plan))
+    return plan
+
+
+def main():
+    #
+    #  Phase 1: Load and prepare.
+    #
+    
+    report = PhaseReport()
+    report.begin("load")
+    
+    #  Parse the command-line arguments.
+    args = sys.argv[1:]
+    verify = ("--verify" in args)
+    if verify:
+        args.remove("--verify")
+    if len(args) != 1:
+        print("./compiler.py [config] [--verify]")
+        sys.exit(1)
+    cfgfile_path = args[0]
+    
+    #  Read the header file.
+    fp = open(HDRFILE_PATH, "r", encoding="utf-8")
+    hdr = fp.read().rstrip()
+    fp.close()
+    
+    #  Read the configuration file.
+    fp = open(cfgfile_path, "r", encoding="utf-8")
+    config = json.loads(fp.read())
+    fp.close()
+    config = apply_tuning(config, os.path.basename(cfgfile_path))
+    
+    #  Get and check the N.
+    N = config["N"]
+    if not (isinstance(N, int) and N > 0):
+        raise Exception("Illegal point count.")
+    
+    #  Get the output file path.
+    outfile_path = os.path.join(BASE_DIR, config["output"])
+    
+    #  Get the generation mode.
+    mode = config.get("mode", "baseop")
+    if mode not in MODES:
+        raise Exception("Unknown mode \"%s\"." % mode)
+    
+    #  Get the factorization plan.
+    plan_mode = config.get("plan", "fixed")
+    if plan_mode not in PLANS:
+        raise Exception("Unknown plan \"%s\"." % plan_mode)
+    plan_pfa = config.get("pfa", False)
+    
+    #  Get the kernel variants.
+    variants = config.get("variants", [])
+    for variant in variants:
+        if variant not in VARIANTS:
+            raise Exception("Unknown variant \"%s\"." % variant)
+    if "permuted" in variants and mode == "compact":
+        raise Exception("Permuted variant doesn't support compact mode.")
+    
+    #  Get the transform direction (and scaling).
+    direction = config.get("direction", "forward")
+    if direction not in DIRECTIONS:
+        raise Exception("Unknown direction \"%s\"." % direction)
+    scale = config.get("scale", False)
+    if scale:
+        scale_factor = 1.0 / N
+    else:
+        scale_factor = None
+    
+    #  Get the WebAssembly kernel switch.
+    use_wasm = config.get("wasm", False)
+    if use_wasm and mode == "baseop":
+        raise Exception("WebAssembly kernel doesn't support baseop mode.")
+    
+    #  Get the arithmetic precision.
+    global ARRAY_TYPE
+    precision = config.get("precision", "f64")
+    if precision not in PRECISIONS:
+        raise Exception("Unknown precision \"%s\"." % precision)
+    if precision != "f64":
+        if mode != "inline":
+            raise Exception("Precision \"%s\" requires inline mode." % precision)
+        if use_wasm:
+            raise Exception("WebAssembly kernel doesn't support precision \"%s\"." % precision)
+    ARRAY_TYPE = ARRAY_TYPES[precision]
+    
+    #  Get the function size budget.
+    global FUNCTION_BUDGET
+    FUNCTION_BUDGET = select_budget(config)
+    
+    #  Get the complex multiplication algorithm.
+    cmul = config.get("cmul", "3mul")
+    if cmul not in CMUL_ALGORITHMS:
+        raise Exception("Unknown complex multiplication algorithm \"%s\"." % cmul)
+    set_cmul_algorithm(cmul)
+    
+    #  Get the real-data transform kind.
+    real = config.get("real", "none")
+    if real not in REAL_KINDS:
+        raise Exception("Unknown real-data transform kind \"%s\"." % real)
+    if real != "none":
+        if mode != "inline":
+            raise Exception("Real-data transform requires inline mode.")
+        if len(variants) != 0 or use_wasm:
+            raise Exception("Real-data transform doesn't support any variant.")
+        if (real == "c2r") != (direction == "inverse"):
+            raise Exception("Real-data transform \"%s\" doesn't support direction \"%s\"." % (real, direction))
+        if real == "paired":
+            if N < 2:
+                raise Exception("Paired real-data transform requires at least 2 points.")
+        elif N < 4 or N % 2 != 0:
+            raise Exception("Real-data transform \"%s\" requires an even point count (at least 4)." % real)
+    
+    #
+    #  Phase 2: DFT.
+    #
+    
+    #  Plan the complex DFT (half-length for "r2c" and "c2r").
+    report.begin("plan")
+    if real == "r2c" or real == "c2r":
+        N_dft = N // 2
+    else:
+        N_dft = N
+    plan = None
+    wasm_plan = None
+    if mode == "compact":
+        plan = compact_radices(N_dft)
+        print("Radices: %s." % " x ".join(["%d" % radix for radix in plan]))
+        if use_wasm:
+            wasm_plan = plan_dft(N_dft, "inline", plan_mode, plan_pfa)
+    else:
+        plan = plan_dft(N_dft, mode, plan_mode, plan_pfa)
+        wasm_plan = plan
+    
+    #  Generate in-place DFT (or real-data transform).
+    report.begin("generate")
+    if real == "none":
+        prog, mem_addresses = generate_dft(N, mode, plan, direction, scale_factor)
+    else:
+        prog, mem_addresses = generate_real_dft(N, plan, real, scale_factor)
+    report.begin("optimize")
+    PassManager(config.get("passes")).run(prog)
+    rewrite_precision(prog, precision)
+    if mem_addresses is not None:
+        restore_lines = generate_restore(mem_addresses)
+    else:
+        restore_lines = []
+    arith = prog.count_arith()
+    
+    #  Generate WebAssembly DFT (scalar and SIMD).
+    wasm_modules = []
+    if use_wasm:
+        prog_wasm, mem_addresses_wasm = generate_dft(N, "inline", wasm_plan, direction, scale_factor)
+        emit_restore_inline(prog_wasm, mem_addresses_wasm)
+        PassManager(config.get("passes")).run(prog_wasm)
+        for lanes in WASM_LANES:
+            wasm_modules.append(build_module(
+                {WASM_EXPORT: lower_program(prog_wasm, {IO_REAL: 0, IO_IMAG: N}, lanes)},
+                2 * N * slot_width(lanes)
+            ))
     
     #
     #  Phase 3: Code generation.
     #
     
     #  Generate the header and module dependencies.
-    content  = hdr + "\n\n"
+    report.begin("codegen")
+    out = SourceWriter()
+    out.write(hdr + "\n\n")
     if len(OUT_BASEOPS) != 0:
-        content += "//\n"
-        content += "//  Imports.\n"
-        content += "//\n"
-        content += "\n"
-        content += "//  Imported modules.\n"
-        content += "const Lc3FftMxBaseOp = \n"
-        content += "    require(\"./fft-mx-baseop\");\n"
-        content += "\n"
+        out.write("//\n")
+        out.write("//  Imports.\n")
+        out.write("//\n")
+        out.write("\n")
+        out.write("//  Imported modules.\n")
+        out.write("const Lc3FftMxBaseOp = \n")
+        out.write("    require(\"./fft-mx-baseop\");\n")
+        out.write("\n")
         
-        content += "//  Imported functions.\n"
+        out.write("//  Imported functions.\n")
         
-        for baseop in ["MXTr2", "MXTr3", "MXTr4", "MXTr5", "MXRot", "MXSwap", "MXCshft"]:
+        for baseop in ["MXTr2", "MXTr3", "MXTr4", "MXTr5", "MXRot", "MXSwap", "MXCshft", "MXCompact"]:
             if baseop in OUT_BASEOPS:
-                content += "const %s = \n" % baseop
-                content += "    Lc3FftMxBaseOp.%s;\n" % baseop
+                out.write("const %s = \n" % baseop)
+                out.write("    Lc3FftMxBaseOp.%s;\n" % baseop)
             else:
-                content += "// const %s = \n" % baseop
-                content += "//     Lc3FftMxBaseOp.%s;\n" % baseop
-        content += "\n"
+                out.write("// const %s = \n" % baseop)
+                out.write("//     Lc3FftMxBaseOp.%s;\n" % baseop)
+        out.write("\n")
+    
+    #  Get the names (and descriptions) of the kernel.
+    if real == "r2c":
+        kind = "RFFT"
+        tfm_desc = "real-input FFT transform"
+    elif real == "c2r":
+        kind = "IRFFT"
+        tfm_desc = "real-output inverse FFT transform"
+    elif real == "paired":
+        kind = "PairedRFFT"
+        tfm_desc = "FFT transform of two real signals"
+    elif direction == "inverse":
+        kind = "IFFT"
+        tfm_desc = "inverse FFT transform"
+    else:
+        kind = "FFT"
+        tfm_desc = "FFT transform"
+    func_pfx = "ApplyMixedRadix%s_%d" % (kind, N)
+    func_pfx_perm = "ApplyMixedRadix%sPermuted_%d" % (kind, N)
+    indexes_name = "MIXED_RADIX_%s_OUTPUT_INDEXES_%d" % (kind, N)
+    wasm_names = []
+    for lanes in WASM_LANES:
+        if lanes == 1:
+            wasm_names.append("MIXED_RADIX_%s_WASM_%d" % (kind, N))
+        else:
+            wasm_names.append("MIXED_RADIX_%s_WASM_SIMD_%d" % (kind, N))
     
     #  Generate constants.
-    if len(OUT_CSHFT) != 0:
-        content += "//\n"
-        content += "//  Constants.\n"
-        content += "//\n"
-        content += "\n"
-        content += "//  Cyclic shift indexes.\n"
-        for line in OUT_CSHFT:
-            content += line + "\n"
-        content += "\n"
-    
-    #  Divide all DFT opcodes into one or multiple parts.
-    opc_parts = []
-    opc_cursor = 0
-    opc_count = len(OUT_OPCODE)
-    while opc_cursor < opc_count:
-        opc_pos1 = opc_cursor
-        opc_pos2 = opc_cursor + MAX_FUNCTION_LINES
-        if opc_pos2 > opc_count:
-            opc_pos2 = opc_count
-        opc_parts.append(OUT_OPCODE[opc_pos1:opc_pos2])
-        opc_cursor = opc_pos2
-    if len(opc_parts) == 0:
-        opc_parts.append([])
+    if len(OUT_CSHFT) != 0 or len(OUT_COMPACT) != 0 or "permuted" in variants:
+        out.write("//\n")
+        out.write("//  Constants.\n")
+        out.write("//\n")
+        out.write("\n")
+        if len(OUT_CSHFT) != 0:
+            out.write("//  Cyclic shift indexes.\n")
+            out.write_lines(OUT_CSHFT)
+            out.write("\n")
+        if len(OUT_COMPACT) != 0:
+            out.write("//  Tables (and scratch buffers) of the compact kernel (see MXCompact() of\n")
+            out.write("//  the \"fft-mx-baseop\" module).\n")
+            out.write_lines(OUT_COMPACT)
+            out.write("\n")
+        if "permuted" in variants:
+            out.write("//  Output indexes of %s() (the k-th output is stored at\n" % func_pfx_perm)
+            out.write("//  index %s[k]).\n" % indexes_name)
+            out.write("const %s = %s;\n" % (indexes_name, json.dumps(mem_addresses)))
+            out.write("\n")
     
-    #  Generate DFT function.
-    func_pfx = "ApplyMixedRadixFFT_%d" % N
-    opc_part_count = len(opc_parts)
-    if opc_part_count > 1:
-        content += "//\n"
-        content += "//  Private functions.\n"
-        content += "//\n"
-        content += "\n"
-        for opc_part_id in range(0, opc_part_count):
-            opc_part_num = opc_part_id + 1
-            content += "/**\n"
-            content += " *  Part %d of %s().\n" % (opc_part_num, func_pfx)
-            content += " * \n"
-            content += " *  @param {Number[]} %s \n" % IO_REAL
-            content += " *    - The real part of each point.\n"
-            content += " *  @param {Number[]} %s \n" % IO_IMAG
-            content += " *    - The imaginary part of each point.\n"
-            content += " */\n"
-            content += "function %s_Part%d(%s, %s) {\n" % (func_pfx, opc_part_num, IO_REAL, IO_IMAG)
-            for line in opc_parts[opc_part_id]:
-                content += "    %s\n" % line
-            content += "}\n"
-            content += "\n"
-        
-        content += "//\n"
-        content += "//  Public functions.\n"
-        content += "//\n"
-        content += "\n"
-        content += "/**\n"
-        content += " *  Apply in-place mixed-radix FFT transform (prebuilt for block size %d).\n" % N
-        content += " * \n"
-        content += " *  Note(s):\n"
-        content += " *    [1] The size of `%s` and `%s` will not be checked.\n" % (IO_REAL, IO_IMAG)
-        content += " * \n"
-        content += " *  @param {Number[]} %s \n" % IO_REAL
-        content += " *    - The real part of each point.\n"
-        content += " *  @param {Number[]} %s \n" % IO_IMAG
-        content += " *    - The imaginary part of each point.\n"
-        content += " */\n"
-        content += "function %s(%s, %s) {\n" % (func_pfx, IO_REAL, IO_IMAG)
-        for opc_part_id in range(0, opc_part_count):
-            opc_part_num = opc_part_id + 1
-            content += "    %s_Part%d(%s, %s);\n" % (func_pfx, opc_part_num, IO_REAL, IO_IMAG)
-        content += "}\n"
-        content += "\n"
+    #  Generate DFT functions.
+    def describe(summary, notes):
+        #  Get the comment lines (a wrapped summary and the notes).
+        lines = textwrap.wrap(summary, 72)
+        lines.append("")
+        lines.append("Note(s):")
+        if scale:
+            notes = notes + ["All outputs are scaled by 1 / %d." % N]
+        if mode == "compact":
+            notes = notes + ["The transform is done by the table-driven loop kernel (compact mode), which is smaller but slower than the unrolled kernels."]
+        if precision == "f32":
+            notes = notes + ["All arithmetic is done in single precision (by Math.fround()), the arrays should be Float32Arrays."]
+        for note_id in range(0, len(notes)):
+            note_pfx = "  [%d] " % (note_id + 1)
+            note_lines = textwrap.wrap(notes[note_id], 72 - len(note_pfx))
+            lines.append(note_pfx + note_lines[0])
+            for line in note_lines[1:]:
+                lines.append(" " * len(note_pfx) + line)
+        return lines
+    
+    params_inplace = [
+        (IO_REAL, "The real part of each point."),
+        (IO_IMAG, "The imaginary part of each point.")
+    ]
+    private = SourceWriter()
+    public = SourceWriter()
+    exports = []
+    if real == "r2c":
+        part_private, part_public = generate_function(
+            func_pfx,
+            [
+                (IO_SAMPLES, "The real points."),
+                (IO_REAL, "The real part of each output point."),
+                (IO_IMAG, "The imaginary part of each output point.")
+            ],
+            describe(
+                "Apply mixed-radix %s (prebuilt for block size %d)." % (tfm_desc, N),
+                [
+                    "The size of all arrays will not be checked.",
+                    "Only the first %d outputs are stored to `%s` and `%s` (the k-th output is the conjugate of the (%d - k)-th output)." % (N // 2 + 1, IO_REAL, IO_IMAG, N),
+                    "`%s` shall not be `%s` or `%s`." % (IO_SAMPLES, IO_REAL, IO_IMAG)
+                ]
+            ),
+            split_parts(prog),
+            restore_lines,
+            prog
+        )
+        private.write_from(part_private)
+        public.write_from(part_public)
+        exports.append(func_pfx)
+    elif real == "c2r":
+        part_private, part_public = generate_function(
+            func_pfx,
+            [
+                (IO_REAL, "The real part of each input point."),
+                (IO_IMAG, "The imaginary part of each input point."),
+                (IO_SAMPLES, "The real output points.")
+            ],
+            describe(
+                "Apply mixed-radix %s (prebuilt for block size %d)." % (tfm_desc, N),
+                [
+                    "The size of all arrays will not be checked.",
+                    "Only the first %d inputs are used (the k-th input is assumed to be the conjugate of the (%d - k)-th input), the imaginary parts of the 0th and the %d-th inputs are ignored." % (N // 2 + 1, N, N // 2),
+                    "`%s` and `%s` are used as scratch buffers, their contents would be destroyed." % (IO_REAL, IO_IMAG),
+                    "`%s` shall not be `%s` or `%s`." % (IO_SAMPLES, IO_REAL, IO_IMAG)
+                ]
+            ),
+            split_parts(prog),
+            prog=prog
+        )
+        private.write_from(part_private)
+        public.write_from(part_public)
+        exports.append(func_pfx)
+    elif real == "paired":
+        notes = [
+            "The size of `%s` and `%s` will not be checked." % (IO_REAL, IO_IMAG),
+            "The real signal x1[n] shall be stored in `%s`, the real signal x2[n] shall be stored in `%s`." % (IO_REAL, IO_IMAG),
+            "The k-th output of x1[n] (0 <= k <= %d) is stored at index k, the conjugate of the k-th output of x2[n] (0 < k < %d) is stored at index %d - k." % (N // 2, N - N // 2, N)
+        ]
+        if N % 2 == 0:
+            notes.append("The 0th (and the %d-th) output of x2[n] is stored in `%s[0]` (and `%s[%d]`)." % (N // 2, IO_IMAG, IO_IMAG, N // 2))
+        else:
+            notes.append("The 0th output of x2[n] is stored in `%s[0]`." % IO_IMAG)
+        part_private, part_public = generate_function(
+            func_pfx,
+            [
+                (IO_REAL, "The real part of each point."),
+                (IO_IMAG, "The imaginary part of each point.")
+            ],
+            describe(
+                "Apply in-place mixed-radix %s (prebuilt for block size %d)." % (tfm_desc, N),
+                notes
+            ),
+            split_parts(prog),
+            restore_lines,
+            prog
+        )
+        private.write_from(part_private)
+        public.write_from(part_public)
+        exports.append(func_pfx)
+    elif "permuted" in variants:
+        part_private, part_public = generate_function(
+            func_pfx_perm,
+            params_inplace,
+            describe(
+                "Apply in-place mixed-radix %s (prebuilt for block size %d), without restoring the natural order of the outputs." % (tfm_desc, N),
+                [
+                    "The size of `%s` and `%s` will not be checked." % (IO_REAL, IO_IMAG),
+                    "The k-th output is stored at index %s[k]." % indexes_name
+                ]
+            ),
+            split_parts(prog),
+            prog=prog
+        )
+        private.write_from(part_private)
+        perm_public = part_public
+        part_private, part_public = generate_function(
+            func_pfx,
+            params_inplace,
+            describe(
+                "Apply in-place mixed-radix %s (prebuilt for block size %d)." % (tfm_desc, N),
+                [
+                    "The size of `%s` and `%s` will not be checked." % (IO_REAL, IO_IMAG)
+                ]
+            ),
+            [([], ["%s(%s, %s);" % (func_pfx_perm, IO_REAL, IO_IMAG)], 1, set())],
+            restore_lines
+        )
+        public.write_from(part_public)
+        public.write_from(perm_public)
+        exports.append(func_pfx)
+        exports.append(func_pfx_perm)
+        exports.append(indexes_name)
     else:
-        content += "//\n"
-        content += "//  Public functions.\n"
-        content += "//\n"
-        content += "\n"
-        content += "/**\n"
-        content += " *  Apply in-place mixed-radix FFT transform (prebuilt for block size %d).\n" % N
-        content += " * \n"
-        content += " *  Note(s):\n"
-        content += " *    [1] The size of `%s` and `%s` will not be checked.\n" % (IO_REAL, IO_IMAG)
-        content += " * \n"
-        content += " *  @param {Number[]} %s \n" % IO_REAL
-        content += " *    - The real part of each point.\n"
-        content += " *  @param {Number[]} %s \n" % IO_IMAG
-        content += " *    - The imaginary part of each point.\n"
-        content += " */\n"
-        content += "function %s(%s, %s) {\n" % (func_pfx, IO_REAL, IO_IMAG)
-        for line in opc_parts[0]:
-            content += "    %s\n" % line
-        content += "}\n"
-        content += "\n"
+        part_private, part_public = generate_function(
+            func_pfx,
+            params_inplace,
+            describe(
+                "Apply in-place mixed-radix %s (prebuilt for block size %d)." % (tfm_desc, N),
+                [
+                    "The size of `%s` and `%s` will not be checked." % (IO_REAL, IO_IMAG)
+                ]
+            ),
+            split_parts(prog),
+            restore_lines,
+            prog
+        )
+        private.write_from(part_private)
+        public.write_from(part_public)
+        exports.append(func_pfx)
+    
+    #  Generate the WebAssembly module file.
+    if use_wasm:
+        out_wasm = SourceWriter()
+        out_wasm.write(render_module_file(hdr, [
+            "//  WebAssembly module(s) (base64) of in-place %s, the exported" % tfm_desc,
+            "//  function \"%s\" takes a byte offset, the real parts are stored at" % WASM_EXPORT,
+            "//  slot 0 to %d and the imaginary parts are stored at slot %d to %d of the" % (N - 1, N, 2 * N - 1),
+            "//  exported memory (a slot contains one Float64 in the scalar module, and",
+            "//  two Float64s (one per transform) in the SIMD module)."
+        ], list(zip(wasm_names, wasm_modules))))
+        for wasm_name, module in zip(wasm_names, wasm_modules):
+            OUT_WASM_METRICS[wasm_name] = kernel_metrics(prog_wasm, len(module))
+    if not private.is_empty():
+        out.write("//\n")
+        out.write("//  Private functions.\n")
+        out.write("//\n")
+        out.write("\n")
+        out.write_from(private)
+    out.write("//\n")
+    out.write("//  Public functions.\n")
+    out.write("//\n")
+    out.write("\n")
+    out.write_from(public)
     
     #  Generate module ending.
-    content += "//  Export public APIs.\n"
-    content += "module.exports = {\n"
-    content += "    \"%s\": %s\n" % (func_pfx, func_pfx)
-    content += "};"
+    out.write("//  Export public APIs.\n")
+    out.write("module.exports = {\n")
+    out.write(",\n".join(["    \"%s\": %s" % (name, name) for name in exports]) + "\n")
+    out.write("};")
+    
+    #  Verify all programs numerically.
+    if verify:
+        report.begin("verify")
+        if "permuted" in variants and real == "none":
+            main_name = func_pfx_perm
+        else:
+            main_name = func_pfx
+        checks = [(main_name, prog, mem_addresses, precision)]
+        if use_wasm:
+            checks.append(("%s (IR)" % ", ".join(wasm_names), prog_wasm, None, "f64"))
+        passed = True
+        for name, check_prog, check_addresses, check_precision in checks:
+            if not verify_dft(name, check_prog, check_addresses, N, direction, scale_factor, real, check_precision, DEFAULT_VECTORS):
+                passed = False
+        if not passed:
+            raise Exception("Numerical verification failed.")
     
     #  Write output file.
+    report.begin("write")
     if DEBUG:
-        print(content)
-    fp = open(outfile_path, "w", encoding="utf-8")
-    fp.write(content)
-    fp.close()
+        print(out.text())
+    out.save(outfile_path)
+    write_metrics(outfile_path, OUT_METRICS)
+    if use_wasm:
+        out_wasm.save(module_path(outfile_path))
+        write_metrics(module_path(outfile_path), OUT_WASM_METRICS)
     
-    print("OK!")
+    #  Analyze the error bound.
+    report.begin("analyze")
+    error_report = error_text(prog, precision)
+    report.end()
+    
+    for wasm_name, module in zip(wasm_names, wasm_modules):
+        print("%s: %d byte(s)." % (wasm_name, len(module)))
+    print(error_report)
+    report.print()
+    print("OK! Mul/Add=%d/%d." % (arith["mul"], arith["add"]))
 
 
 if __name__ == "__main__":
     main()
-
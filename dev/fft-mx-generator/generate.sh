@@ -19,4 +19,11 @@ for config_file in config-*.json; do
     echo ""
 done
 
+#  Generate the prebuilt kernel registry.
+echo ":: registry ::"
+./registry.py
+if [ "$?" != "0" ]; then
+    exit 1
+fi
+
 exit 0
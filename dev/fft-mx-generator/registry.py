@@ -0,0 +1,277 @@
+#!/usr/bin/env python3
+#
+#  Copyright 2021 - 2023 XiaoJSoft Studio. All rights reserved.
+#  Use of this source code is governed by a BSD-style license that can be
+#  found in the LICENSE.md file.
+#
+
+#
+#  Prebuilt kernel registry generator.
+#
+#  Note(s):
+#    [1] This script scans all configuration files (config-*.json) and
+#        generates a module that maps each block size to its prebuilt
+#        kernel, so that a newly configured block size is picked up by the
+#        FFT module (and the FFT transformers) without any manual change.
+#    [2] Kernels of different kinds (see KERNEL_KINDS) are registered
+#        separately, so at most one kernel of each kind is allowed per block
+#        size.
+#    [3] Single-precision kernels (see the "precision" option) are not
+#        registered, since the FFT module works on double-precision arrays.
+#    [4] Each kernel module is loaded (by require()) on the first lookup of
+#        its block size (instead of when the registry is loaded), so that
+#        only the kernels of the block sizes in use are parsed and compiled.
+#        The require() paths are static, so the browser bundle still
+#        resolves them.
+#    [5] The WebAssembly module of a kernel (see the "wasm" option of the
+#        compiler) is not registered, since the FFT module doesn't load it.
+#    [6] A kernel with the "unrolled" option set is an opt-in kernel, its
+#        lookup returns null unless the unrolled kernels are enabled (see
+#        EnableUnrolledKernels() of the MDCT module) or its module is not
+#        bundled. Its module is only bundled by the unrolled browser bundle
+#        (see "browser/modules-unrolled.json").
+#    [7] The complex inverse FFT kernels and the real-input FFT kernels are
+#        not registered (see KERNEL_KINDS), since the FFT module has no
+#        consumer of them (the LTPF module of the encoder transforms its real
+#        signals in pairs and uses the real-output inverse transform, both
+#        have their own kernel kinds).
+#
+
+import os
+import glob
+import json
+
+
+#  File/folder settings.
+BASE_DIR = os.path.dirname(os.path.realpath(__file__))
+HDRFILE_PATH = os.path.join(BASE_DIR, "header.js")
+OUTFILE_PATH = os.path.join(BASE_DIR, "..", "..", "lc3", "math", "fft-mx-prebuilt.js")
+BROWSER_MODULES_PATH = os.path.join(BASE_DIR, "..", "..", "browser", "modules.json")
+BROWSER_UNROLLED_MODULES_PATH = os.path.join(BASE_DIR, "..", "..", "browser", "modules-unrolled.json")
+
+
+def module_name_of(path):
+    #  Get the module name (e.g. "fft-mx-60") of a JS file.
+    return os.path.splitext(os.path.basename(path))[0]
+
+
+def module_var_of(module_name):
+    #  Get the module variable name (e.g. "Lc3FftMx160P" for "fft-mx-160-p")
+    #  of a kernel module.
+    return "Lc3" + "".join([part[0].upper() + part[1:] for part in module_name.split("-")])
+
+
+#  Kernel kinds, each one is registered with a descriptor name prefix (of the
+#  loader functions and the descriptor caches) and a lookup function:
+#    (direction, real) => (kind, descriptor prefix, lookup function, summary)
+#
+#  Note(s):
+#    [1] "kind" is the kernel kind used in symbol names (see the compiler),
+#        "real" is the real-data transform kind (see the compiler).
+KERNEL_KINDS = [
+    (("forward", "none"), ("FFT", "PrebuiltKernel", "FindPrebuiltMixedRadixFFT", "FFT")),
+    (("inverse", "c2r"), ("IRFFT", "PrebuiltRealInverseKernel", "FindPrebuiltMixedRadixIRFFT", "real-output inverse FFT")),
+    (("forward", "paired"), ("PairedRFFT", "PrebuiltPairedKernel", "FindPrebuiltMixedRadixPairedRFFT", "paired real-input FFT"))
+]
+
+
+def main():
+    #  Read the header file.
+    fp = open(HDRFILE_PATH, "r", encoding="utf-8")
+    hdr = fp.read().rstrip()
+    fp.close()
+    
+    #  Read all configuration files.
+    kernels = []
+    kinds = dict(KERNEL_KINDS)
+    for cfgfile_path in glob.glob(os.path.join(BASE_DIR, "config-*.json")):
+        fp = open(cfgfile_path, "r", encoding="utf-8")
+        config = json.loads(fp.read())
+        fp.close()
+        if config.get("precision", "f64") != "f64":
+            continue
+        outfile_path = os.path.realpath(os.path.join(BASE_DIR, config["output"]))
+        if os.path.dirname(outfile_path) != os.path.dirname(os.path.realpath(OUTFILE_PATH)):
+            raise Exception("Kernel \"%s\" is not within the registry directory." % config["output"])
+        kind_key = (config.get("direction", "forward"), config.get("real", "none"))
+        if kind_key not in kinds:
+            raise Exception("Kernel \"%s\" is of unknown kind." % config["output"])
+        if config.get("unrolled", False) and config.get("mode", "baseop") == "compact":
+            raise Exception("Kernel \"%s\" is opt-in (unrolled) but of compact mode." % config["output"])
+        kernels.append((
+            kind_key,
+            config["N"],
+            module_name_of(outfile_path),
+            config.get("variants", []),
+            bool(config.get("scale", False)),
+            bool(config.get("unrolled", False))
+        ))
+    kernels.sort(key=lambda kernel: ([key for key, _ in KERNEL_KINDS].index(kernel[0]), kernel[1]))
+    for i in range(1, len(kernels)):
+        if kernels[i][0:2] == kernels[i - 1][0:2]:
+            raise Exception("Duplicated block size %d (%s)." % (kernels[i][1], kinds[kernels[i][0]][3]))
+    
+    #  Generate the header (and the module dependencies of the opt-in
+    #  kernels).
+    content  = hdr + "\n\n"
+    if any([unrolled for _, _, _, _, _, unrolled in kernels]):
+        content += "//\n"
+        content += "//  Imports.\n"
+        content += "//\n"
+        content += "\n"
+        content += "//  Imported modules.\n"
+        content += "const Lc3Unrolled = \n"
+        content += "    require(\"./unrolled\");\n"
+        content += "\n"
+        content += "//  Imported functions.\n"
+        content += "const IsUnrolledKernelsEnabled = \n"
+        content += "    Lc3Unrolled.IsUnrolledKernelsEnabled;\n"
+        content += "\n"
+    
+    #  Generate the descriptor caches.
+    content += "//\n"
+    content += "//  Globals.\n"
+    content += "//\n"
+    content += "\n"
+    for kind_key, (_, desc_pfx, _, summary) in KERNEL_KINDS:
+        block_sizes = [N for kernel_key, N, _, _, _, _ in kernels if kernel_key == kind_key]
+        if len(block_sizes) == 0:
+            continue
+        content += "//  Prebuilt %s kernels (null if not loaded yet).\n" % summary
+        for N in block_sizes:
+            content += "let g_%s_%d = null;\n" % (desc_pfx, N)
+        content += "\n"
+    
+    #  Generate kernel loaders.
+    content += "//\n"
+    content += "//  Private functions.\n"
+    content += "//\n"
+    content += "\n"
+    for kind_key, N, module_name, variants, scale, unrolled in kernels:
+        kind, desc_pfx, _, summary = kinds[kind_key]
+        module_var = module_var_of(module_name)
+        fields = [("transform", "%s.ApplyMixedRadix%s_%d" % (module_var, kind, N))]
+        if kind_key[1] == "none":
+            if "permuted" in variants:
+                fields.append(("transformPermuted", "%s.ApplyMixedRadix%sPermuted_%d" % (module_var, kind, N)))
+                fields.append(("outputIndexes", "%s.MIXED_RADIX_%s_OUTPUT_INDEXES_%d" % (module_var, kind, N)))
+            else:
+                fields.append(("transformPermuted", "null"))
+                fields.append(("outputIndexes", "null"))
+        fields.append(("scaled", "true" if scale else "false"))
+        content += "/**\n"
+        content += " *  Load the prebuilt %s kernel (block size %d).\n" % (summary, N)
+        content += " * \n"
+        if unrolled:
+            content += " *  @returns {?Object}\n"
+            content += " *    - The kernel descriptor (null if the unrolled kernels are not\n"
+            content += " *      enabled or the kernel module is not bundled).\n"
+        else:
+            content += " *  @returns {Object}\n"
+            content += " *    - The kernel descriptor.\n"
+        content += " */\n"
+        content += "function Load%s_%d() {\n" % (desc_pfx, N)
+        if unrolled:
+            content += "    if (!IsUnrolledKernelsEnabled()) {\n"
+            content += "        return null;\n"
+            content += "    }\n"
+        content += "    if (g_%s_%d === null) {\n" % (desc_pfx, N)
+        if unrolled:
+            content += "        let %s = null;\n" % module_var
+            content += "        try {\n"
+            content += "            %s = require(\"./%s\");\n" % (module_var, module_name)
+            content += "        } catch (error) {\n"
+            content += "            //  Not bundled (see \"browser/modules-unrolled.json\").\n"
+            content += "            return null;\n"
+            content += "        }\n"
+        else:
+            content += "        const %s = \n" % module_var
+            content += "            require(\"./%s\");\n" % module_name
+        content += "        g_%s_%d = {\n" % (desc_pfx, N)
+        lines = ["            \"%s\": %s" % (key, expr) for key, expr in fields]
+        content += ",\n".join(lines) + "\n"
+        content += "        };\n"
+        content += "    }\n"
+        content += "    return g_%s_%d;\n" % (desc_pfx, N)
+        content += "}\n"
+        content += "\n"
+    
+    #  Generate lookup functions.
+    content += "//\n"
+    content += "//  Public functions.\n"
+    content += "//\n"
+    content += "\n"
+    exports = []
+    for kind_key, (kind, desc_pfx, lookup, summary) in KERNEL_KINDS:
+        content += "/**\n"
+        content += " *  Find the prebuilt mixed-radix %s kernel of specific block size.\n" % summary
+        content += " * \n"
+        content += " *  Note(s):\n"
+        content += " *    [1] The returned object contains following fields:\n"
+        content += " *          - \"transform\": The transform function.\n"
+        if kind_key[1] == "none":
+            content += " *          - \"transformPermuted\": The in-place transform function that\n"
+            content += " *            leaves the k-th output at index outputIndexes[k] (or null if\n"
+            content += " *            not prebuilt).\n"
+            content += " *          - \"outputIndexes\": The output indexes of transformPermuted (or\n"
+            content += " *            null if not prebuilt).\n"
+        content += " *          - \"scaled\": True if the outputs were scaled by 1 / N.\n"
+        content += " *    [2] The kernel module is loaded on the first lookup.\n"
+        content += " *    [3] The returned object shall not be modified.\n"
+        if any([unrolled for kernel_key, _, _, _, _, unrolled in kernels if kernel_key == kind_key]):
+            content += " *    [4] An unrolled kernel is only returned if the unrolled kernels\n"
+            content += " *        are enabled (see EnableUnrolledKernels() of the MDCT module).\n"
+        content += " * \n"
+        content += " *  @param {Number} N\n"
+        content += " *    - The block size.\n"
+        content += " *  @returns {?Object}\n"
+        content += " *    - The prebuilt kernel (null if not available).\n"
+        content += " */\n"
+        content += "function %s(N) {\n" % lookup
+        content += "    switch (N) {\n"
+        for kernel_key, N, _, _, _, _ in kernels:
+            if kernel_key == kind_key:
+                content += "    case %d:\n" % N
+                content += "        return Load%s_%d();\n" % (desc_pfx, N)
+        content += "    default:\n"
+        content += "        return null;\n"
+        content += "    }\n"
+        content += "}\n"
+        content += "\n"
+        exports.append(lookup)
+    
+    #  Generate module ending.
+    content += "//  Export public APIs.\n"
+    content += "module.exports = {\n"
+    content += ",\n".join(["    \"%s\": %s" % (name, name) for name in exports]) + "\n"
+    content += "};"
+    
+    #  Write output file.
+    fp = open(OUTFILE_PATH, "w", encoding="utf-8")
+    fp.write(content)
+    fp.close()
+    
+    #  Check whether all kernels (except the opt-in kernels) are bundled by the
+    #  default browser bundle and the opt-in kernels are bundled by the
+    #  unrolled browser bundle.
+    fp = open(BROWSER_MODULES_PATH, "r", encoding="utf-8")
+    browser_modules = json.loads(fp.read())
+    fp.close()
+    fp = open(BROWSER_UNROLLED_MODULES_PATH, "r", encoding="utf-8")
+    browser_unrolled_modules = json.loads(fp.read())
+    fp.close()
+    module_names = [(module_name_of(OUTFILE_PATH), False)]
+    for _, _, module_name, _, _, unrolled in kernels:
+        module_names.append((module_name, unrolled))
+    for module_name, unrolled in module_names:
+        if unrolled:
+            if ("lc3/math/%s" % module_name) not in browser_unrolled_modules:
+                print("Warning: Module \"lc3/math/%s\" is not listed in \"browser/modules-unrolled.json\"." % module_name)
+        elif ("lc3/math/%s" % module_name) not in browser_modules:
+            print("Warning: Module \"lc3/math/%s\" is not listed in \"browser/modules.json\"." % module_name)
+    
+    print("OK! %d kernel(s) registered." % len(kernels))
+
+
+if __name__ == "__main__":
+    main()
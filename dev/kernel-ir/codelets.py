@@ -0,0 +1,707 @@
+#
+#  Copyright 2021 - 2023 XiaoJSoft Studio. All rights reserved.
+#  Use of this source code is governed by a BSD-style license that can be
+#  found in the LICENSE.md file.
+#
+
+#
+#  Scalar transform building blocks (shared by all kernel compilers).
+#
+#  Note(s):
+#    [1] The symbols (variables) in `symlist_re` and `symlist_im` are updated
+#        in place, the SSA pass of the pass manager takes care of renaming.
+#
+
+import math
+from fractions import Fraction
+
+#  cos(45).
+COS_45 = math.sqrt(2) / 2.0
+
+#  Algorithms of the complex multiplication by a constant:
+#    "3mul" - 3 multiplications and 3 additions (the sum and the difference
+#             of the constant parts are precomputed).
+#    "4mul" - 4 multiplications and 2 additions.
+CMUL_ALGORITHMS = ["3mul", "4mul"]
+CMUL_ALGORITHM = "3mul"
+
+#  Odd prime sizes that use the direct (symmetric) codelet, larger primes use
+#  Rader's algorithm.
+PRIME_CODELET_SIZES = [7, 11, 13]
+
+
+def set_cmul_algorithm(algorithm):
+    #  Select the algorithm of the complex multiplication by a constant (see
+    #  CMUL_ALGORITHMS).
+    global CMUL_ALGORITHM
+    if algorithm not in CMUL_ALGORITHMS:
+        raise Exception("Unknown complex multiplication algorithm \"%s\"." % algorithm)
+    CMUL_ALGORITHM = algorithm
+
+
+def unit_root(p, q):
+    #  Get (cos(PI * p / q), sin(PI * p / q)).
+    #
+    #  Note(s):
+    #    [1] The angle is reduced (exactly) to [0, PI / 4] before evaluating,
+    #        so that values related by the symmetry of sine and cosine (e.g.
+    #        sin(x) and cos(PI / 2 - x)) are bit-identical up to sign, which
+    #        lets the constant pool (see constant_pool() of the IR module)
+    #        share them.
+    t = Fraction(p, q) % 2
+    sign_c, sign_s = 1.0, 1.0
+    if t >= 1:
+        #  e ^ (1j * PI * (1 + t)) = -e ^ (1j * PI * t).
+        t -= 1
+        sign_c, sign_s = -1.0, -1.0
+    if t > Fraction(1, 2):
+        #  cos(PI - x) = -cos(x), sin(PI - x) = sin(x).
+        t = 1 - t
+        sign_c = -sign_c
+    if t > Fraction(1, 4):
+        #  cos(PI / 2 - x) = sin(x), sin(PI / 2 - x) = cos(x).
+        rad = math.pi * float(Fraction(1, 2) - t)
+        return (sign_c * math.sin(rad), sign_s * math.cos(rad))
+    rad = math.pi * float(t)
+    return (sign_c * math.cos(rad), sign_s * math.sin(rad))
+
+
+def emit_rotate(prog, symlist_re, symlist_im, k, p, q, coeff=None):
+    #  Multiply symbol k by coeff * e ^ (1j * PI * p / q).
+    t = math.gcd(p, q)
+    p //= t;
+    q //= t;
+    q_mul_2 = q * 2
+    
+    p %= q_mul_2
+    
+    if q < 0:
+        #  Positive denominator is needed.
+        p = -p
+        q = -q
+    
+    sym0_r, sym0_i = symlist_re[k], symlist_im[k]
+    
+    if p == 0:
+        if coeff is not None:
+            prog.mul(sym0_r, coeff, sym0_r)
+            prog.mul(sym0_i, coeff, sym0_i)
+        
+        #  No need to rotate.
+        return
+    
+    if p == 1 and q == 1:
+        if coeff is not None:
+            prog.mul(sym0_r, -coeff, sym0_r)
+            prog.mul(sym0_i, -coeff, sym0_i)
+        else:
+            prog.neg(sym0_r, sym0_r)
+            prog.neg(sym0_i, sym0_i)
+        return
+    
+    if q == 2:
+        symtmp0 = prog.tmp()
+        if p == 1:
+            #  Multiply with 1j.
+            if coeff is not None:
+                prog.mul(symtmp0, coeff, sym0_r)
+                prog.mul(sym0_r, -coeff, sym0_i)
+            else:
+                prog.mov(symtmp0, sym0_r)
+                prog.neg(sym0_r, sym0_i)
+            prog.mov(sym0_i, symtmp0)
+            return
+        elif p == 3:
+            #  Multiply with -1j.
+            if coeff is not None:
+                prog.mul(symtmp0, -coeff, sym0_r)
+                prog.mul(sym0_r, coeff, sym0_i)
+            else:
+                prog.neg(symtmp0, sym0_r)
+                prog.mov(sym0_r, sym0_i)
+            prog.mov(sym0_i, symtmp0)
+            return
+        else:
+            raise Exception("Never reach.")
+    
+    if q == 4:
+        #  Multiply with (sign_c + 1j * sign_s) * cos(45):
+        #    RE = cos(45) * (sign_c * RE - sign_s * IM)
+        #    IM = cos(45) * (sign_s * RE + sign_c * IM)
+        if p == 1:
+            sign_c, sign_s = 1, 1
+        elif p == 3:
+            sign_c, sign_s = -1, 1
+        elif p == 5:
+            sign_c, sign_s = -1, -1
+        elif p == 7:
+            sign_c, sign_s = 1, -1
+        else:
+            raise Exception("Never reach.")
+        
+        cs = COS_45
+        if coeff is not None:
+            cs *= coeff
+        
+        symtmp0 = prog.tmp()
+        symtmp1 = prog.tmp()
+        
+        if sign_c == sign_s:
+            prog.sub(symtmp0, sym0_r, sym0_i)
+            prog.add(symtmp1, sym0_r, sym0_i)
+        else:
+            prog.add(symtmp0, sym0_r, sym0_i)
+            prog.sub(symtmp1, sym0_r, sym0_i)
+        prog.mul(sym0_r, sign_c * cs, symtmp0)
+        prog.mul(sym0_i, sign_s * cs, symtmp1)
+        
+        return
+    
+    #  Use fallback complex multiplication algorithm.
+    c, d = unit_root(p, q)
+    if coeff is not None:
+        c *= coeff
+        d *= coeff
+    emit_cmul_const(prog, symlist_re, symlist_im, k, c, d)
+
+
+def emit_cmul_const(prog, symlist_re, symlist_im, k, c, d):
+    #  Multiply symbol k by constant (c + 1j * d) (see CMUL_ALGORITHMS).
+    #
+    #  Reference(s):
+    #    [1] https://en.wikipedia.org/wiki/Multiplication_algorithm#Complex_multiplication_algorithm
+    sym0_r, sym0_i = symlist_re[k], symlist_im[k]
+    
+    if d == 0:
+        prog.mul(sym0_r, c, sym0_r)
+        prog.mul(sym0_i, c, sym0_i)
+        return
+    
+    symtmp0 = prog.tmp()
+    symtmp1 = prog.tmp()
+    symtmp2 = prog.tmp()
+    symtmp3 = prog.tmp()
+    
+    if CMUL_ALGORITHM == "4mul":
+        prog.mul(symtmp0, c, sym0_r)
+        prog.mul(symtmp1, d, sym0_i)
+        prog.mul(symtmp2, c, sym0_i)
+        prog.mul(symtmp3, d, sym0_r)
+        prog.sub(sym0_r, symtmp0, symtmp1)
+        prog.add(sym0_i, symtmp2, symtmp3)
+        return
+    
+    prog.add(symtmp3, sym0_r, sym0_i)
+    prog.mul(symtmp0, c, symtmp3)
+    prog.mul(symtmp1, sym0_r, d - c)
+    prog.mul(symtmp2, sym0_i, c + d)
+    prog.sub(sym0_r, symtmp0, symtmp2)
+    prog.add(sym0_i, symtmp0, symtmp1)
+
+
+def is_prime(n):
+    if n < 2:
+        return False
+    t = 2
+    while t * t <= n:
+        if n % t == 0:
+            return False
+        t += 1
+    return True
+
+
+def smallest_factor(n):
+    #  Get the smallest prime factor of n (n >= 2).
+    t = 2
+    while t * t <= n:
+        if n % t == 0:
+            return t
+        t += 1
+    return n
+
+
+def primitive_root(p):
+    #  Get the smallest primitive root modulo prime p.
+    phi = p - 1
+    factors = []
+    t = phi
+    while t > 1:
+        f = smallest_factor(t)
+        factors.append(f)
+        while t % f == 0:
+            t //= f
+    for g in range(2, p):
+        if all(pow(g, phi // f, p) != 1 for f in factors):
+            return g
+    raise Exception("Never reach.")
+
+
+def emit_dft_prime(prog, symlist_re, symlist_im, mem_addrs, indexes, N):
+    #  N-point DFT (N is an odd prime) that pairs the inputs symmetrically:
+    #    s_j = x_j + x_(N-j), d_j = x_j - x_(N-j) (1 <= j <= (N - 1) / 2),
+    #    X_k = x_0 + SUM(s_j * cos(2 * PI * j * k / N))
+    #          - 1j * SUM(d_j * sin(2 * PI * j * k / N)),
+    #    X_(N-k) = x_0 + SUM(s_j * cos(...)) + 1j * SUM(d_j * sin(...)).
+    H = (N - 1) // 2
+    syms_re = [symlist_re[mem_addrs[indexes[n]]] for n in range(0, N)]
+    syms_im = [symlist_im[mem_addrs[indexes[n]]] for n in range(0, N)]
+    
+    s_re = [None] * (H + 1)
+    s_im = [None] * (H + 1)
+    d_re = [None] * (H + 1)
+    d_im = [None] * (H + 1)
+    for j in range(1, H + 1):
+        s_re[j] = prog.tmp()
+        s_im[j] = prog.tmp()
+        d_re[j] = prog.tmp()
+        d_im[j] = prog.tmp()
+        prog.add(s_re[j], syms_re[j], syms_re[N - j])
+        prog.add(s_im[j], syms_im[j], syms_im[N - j])
+        prog.sub(d_re[j], syms_re[j], syms_re[N - j])
+        prog.sub(d_im[j], syms_im[j], syms_im[N - j])
+    
+    def weighted_sum(syms, coeffs, base):
+        #  base + SUM(coeffs[j] * syms[j]) (or SUM(...) if base is None).
+        acc = base
+        for j in range(1, H + 1):
+            symtmp0 = prog.tmp()
+            prog.mul(symtmp0, coeffs[j], syms[j])
+            if acc is None:
+                acc = symtmp0
+            else:
+                symtmp1 = prog.tmp()
+                prog.add(symtmp1, acc, symtmp0)
+                acc = symtmp1
+        return acc
+    
+    outs_re = [None] * N
+    outs_im = [None] * N
+    for k in range(1, H + 1):
+        coeffs_c = [None] * (H + 1)
+        coeffs_s = [None] * (H + 1)
+        for j in range(1, H + 1):
+            coeffs_c[j], coeffs_s[j] = unit_root(2 * ((j * k) % N), N)
+        a_re = weighted_sum(s_re, coeffs_c, syms_re[0])
+        a_im = weighted_sum(s_im, coeffs_c, syms_im[0])
+        b_re = weighted_sum(d_re, coeffs_s, None)
+        b_im = weighted_sum(d_im, coeffs_s, None)
+        outs_re[k] = prog.tmp()
+        outs_im[k] = prog.tmp()
+        outs_re[N - k] = prog.tmp()
+        outs_im[N - k] = prog.tmp()
+        prog.add(outs_re[k], a_re, b_im)
+        prog.sub(outs_im[k], a_im, b_re)
+        prog.sub(outs_re[N - k], a_re, b_im)
+        prog.add(outs_im[N - k], a_im, b_re)
+    
+    #  X_0 = x_0 + SUM(s_j).
+    outs_re[0] = syms_re[0]
+    outs_im[0] = syms_im[0]
+    for j in range(1, H + 1):
+        symtmp0 = prog.tmp()
+        symtmp1 = prog.tmp()
+        prog.add(symtmp0, outs_re[0], s_re[j])
+        prog.add(symtmp1, outs_im[0], s_im[j])
+        outs_re[0] = symtmp0
+        outs_im[0] = symtmp1
+    
+    for k in range(0, N):
+        prog.mov(syms_re[k], outs_re[k])
+        prog.mov(syms_im[k], outs_im[k])
+
+
+def rader_constants(N):
+    #  Get the constants of N-point Rader's algorithm (N is an odd prime),
+    #  returns (g, B), where g is a primitive root of N and B[k] is the k-th
+    #  bin of the (N - 1)-point DFT of b_q = e ^ (-2j * PI * g^-q / N), scaled
+    #  by 1 / (N - 1).
+    M = N - 1
+    g = primitive_root(N)
+    g_inv = pow(g, N - 2, N)
+    b = []
+    for q in range(0, M):
+        rad = -2 * math.pi * pow(g_inv, q, N) / N
+        b.append(complex(math.cos(rad), math.sin(rad)))
+    B = []
+    for k in range(0, M):
+        Bk = complex(0, 0)
+        for q in range(0, M):
+            rad = -2 * math.pi * ((q * k) % M) / M
+            Bk += b[q] * complex(math.cos(rad), math.sin(rad))
+        Bk /= M
+        if abs(Bk.imag) < 1e-15:
+            #  B[0] = -1 / (N - 1) is real.
+            Bk = complex(Bk.real, 0)
+        B.append(Bk)
+    return g, B
+
+
+def emit_dft_rader(prog, symlist_re, symlist_im, mem_addrs, indexes, N):
+    #  N-point DFT (N is a prime) by Rader's algorithm.
+    #
+    #  Note(s):
+    #    [1] With a primitive root g of N, X_(g^-m) = x_0 + SUM(a_q * b_(m-q))
+    #        (a cyclic convolution of length N - 1), where a_q = x_(g^q) and
+    #        b_q = e ^ (-2j * PI * g^-q / N).
+    #    [2] The convolution is done by two (N - 1)-point DFTs, the DFT of b
+    #        (scaled by 1 / (N - 1)) is precomputed (see rader_constants()).
+    #        The inverse DFT is done by the forward DFT with real and imaginary
+    #        parts swapped.
+    #    [3] x_0 is added to the 0th bin before the inverse DFT so that it is
+    #        added to all outputs.
+    #
+    #  Reference(s):
+    #    [1] https://en.wikipedia.org/wiki/Rader%27s_FFT_algorithm
+    M = N - 1
+    g, B = rader_constants(N)
+    g_inv = pow(g, N - 2, N)
+    syms_re = [symlist_re[mem_addrs[indexes[n]]] for n in range(0, N)]
+    syms_im = [symlist_im[mem_addrs[indexes[n]]] for n in range(0, N)]
+    
+    #  a_q = x_(g^q).
+    a_re = []
+    a_im = []
+    for q in range(0, M):
+        n = pow(g, q, N)
+        sym_re = prog.tmp()
+        sym_im = prog.tmp()
+        prog.mov(sym_re, syms_re[n])
+        prog.mov(sym_im, syms_im[n])
+        a_re.append(sym_re)
+        a_im.append(sym_im)
+    a_addrs = emit_fft(prog, a_re, a_im, M)
+    
+    #  X_0 = x_0 + A_0.
+    out0_re = prog.tmp()
+    out0_im = prog.tmp()
+    prog.add(out0_re, syms_re[0], a_re[a_addrs[0]])
+    prog.add(out0_im, syms_im[0], a_im[a_addrs[0]])
+    
+    #  C_k = A_k * B_k (+ x_0 if k = 0).
+    c_re = []
+    c_im = []
+    for k in range(0, M):
+        c_re.append(a_re[a_addrs[k]])
+        c_im.append(a_im[a_addrs[k]])
+        emit_cmul_const(prog, c_re, c_im, k, B[k].real, B[k].imag)
+    prog.add(c_re[0], c_re[0], syms_re[0])
+    prog.add(c_im[0], c_im[0], syms_im[0])
+    
+    #  Inverse DFT (swap real and imaginary parts).
+    c_addrs = emit_fft(prog, c_im, c_re, M)
+    
+    #  X_(g^-m) = c_m.
+    prog.mov(syms_re[0], out0_re)
+    prog.mov(syms_im[0], out0_im)
+    for m in range(0, M):
+        n = pow(g_inv, m, N)
+        prog.mov(syms_re[n], c_re[c_addrs[m]])
+        prog.mov(syms_im[n], c_im[c_addrs[m]])
+
+
+def emit_fft__internal(prog, symlist_re, symlist_im, mem_addrs, indexes, N):
+    if N == 1:
+        pass
+    elif N == 2:
+        addr0 = mem_addrs[indexes[0]]
+        addr1 = mem_addrs[indexes[1]]
+        
+        sym0_re, sym0_im = symlist_re[addr0], symlist_im[addr0]
+        sym1_re, sym1_im = symlist_re[addr1], symlist_im[addr1]
+        
+        symtmp1_re = prog.tmp()
+        symtmp1_im = prog.tmp()
+        
+        #let t1_r = __IN0_r - __IN1_r;
+        prog.sub(symtmp1_re, sym0_re, sym1_re)
+        #let t1_i = __IN0_i - __IN1_i;
+        prog.sub(symtmp1_im, sym0_im, sym1_im)
+        #__OUT0_r = __IN0_r + __IN1_r;
+        prog.add(sym0_re, sym0_re, sym1_re)
+        #__OUT0_i = __IN0_i + __IN1_i;
+        prog.add(sym0_im, sym0_im, sym1_im)
+        #__OUT1_r = t1_r;
+        prog.mov(sym1_re, symtmp1_re)
+        #__OUT1_i = t1_i;
+        prog.mov(sym1_im, symtmp1_im)
+    elif N == 3:
+        addr0 = mem_addrs[indexes[0]]
+        addr1 = mem_addrs[indexes[1]]
+        addr2 = mem_addrs[indexes[2]]
+        
+        sym0_re, sym0_im = symlist_re[addr0], symlist_im[addr0]
+        sym1_re, sym1_im = symlist_re[addr1], symlist_im[addr1]
+        sym2_re, sym2_im = symlist_re[addr2], symlist_im[addr2]
+        
+        symtmp1_re = prog.tmp()
+        symtmp1_im = prog.tmp()
+        symtmp2_re = prog.tmp()
+        symtmp2_im = prog.tmp()
+        symtmp3_re = prog.tmp()
+        symtmp3_im = prog.tmp()
+        symtmp4 = prog.tmp()
+        
+        #let t1_r = i1_r + i2_r;
+        prog.add(symtmp1_re, sym1_re, sym2_re)
+        #let t1_i = i1_i + i2_i;
+        prog.add(symtmp1_im, sym1_im, sym2_im)
+        #let t2_r = i0_r - 0.5 * t1_r;
+        prog.mul(symtmp4, 0.5, symtmp1_re)
+        prog.sub(symtmp2_re, sym0_re, symtmp4)
+        #let t2_i = i0_i - 0.5 * t1_i;
+        prog.mul(symtmp4, 0.5, symtmp1_im)
+        prog.sub(symtmp2_im, sym0_im, symtmp4)
+        #let t3_r = 0.8660254037844386 * (i1_r - i2_r);
+        prog.sub(symtmp4, sym1_re, sym2_re)
+        prog.mul(symtmp3_re, 0.8660254037844386, symtmp4)
+        #let t3_i = 0.8660254037844386 * (i1_i - i2_i);
+        prog.sub(symtmp4, sym1_im, sym2_im)
+        prog.mul(symtmp3_im, 0.8660254037844386, symtmp4)
+        #__OUT0_r = i0_r + t1_r;
+        prog.add(sym0_re, sym0_re, symtmp1_re)
+        #__OUT0_i = i0_i + t1_i;
+        prog.add(sym0_im, sym0_im, symtmp1_im)
+        #__OUT1_r = t2_r + t3_i;
+        prog.add(sym1_re, symtmp2_re, symtmp3_im)
+        #__OUT1_i = t2_i - t3_r;
+        prog.sub(sym1_im, symtmp2_im, symtmp3_re)
+        #__OUT2_r = t2_r - t3_i;
+        prog.sub(sym2_re, symtmp2_re, symtmp3_im)
+        #__OUT2_i = t2_i + t3_r;
+        prog.add(sym2_im, symtmp2_im, symtmp3_re)
+    elif N == 4:
+        addr0 = mem_addrs[indexes[0]]
+        addr1 = mem_addrs[indexes[1]]
+        addr2 = mem_addrs[indexes[2]]
+        addr3 = mem_addrs[indexes[3]]
+        
+        sym0_re, sym0_im = symlist_re[addr0], symlist_im[addr0]
+        sym1_re, sym1_im = symlist_re[addr1], symlist_im[addr1]
+        sym2_re, sym2_im = symlist_re[addr2], symlist_im[addr2]
+        sym3_re, sym3_im = symlist_re[addr3], symlist_im[addr3]
+        
+        symtmp1_re = prog.tmp()
+        symtmp1_im = prog.tmp()
+        symtmp2_re = prog.tmp()
+        symtmp2_im = prog.tmp()
+        symtmp3_re = prog.tmp()
+        symtmp3_im = prog.tmp()
+        symtmp4_re = prog.tmp()
+        symtmp4_im = prog.tmp()
+        
+        #let t1_r = i0_r + i2_r;
+        prog.add(symtmp1_re, sym0_re, sym2_re)
+        #let t1_i = i0_i + i2_i;
+        prog.add(symtmp1_im, sym0_im, sym2_im)
+        #let t2_r = i1_r + i3_r;
+        prog.add(symtmp2_re, sym1_re, sym3_re)
+        #let t2_i = i1_i + i3_i;
+        prog.add(symtmp2_im, sym1_im, sym3_im)
+        #let t3_r = i0_r - i2_r;
+        prog.sub(symtmp3_re, sym0_re, sym2_re)
+        #let t3_i = i0_i - i2_i;
+        prog.sub(symtmp3_im, sym0_im, sym2_im)
+        #let t4_r = i1_r - i3_r;
+        prog.sub(symtmp4_re, sym1_re, sym3_re)
+        #let t4_i = i1_i - i3_i;
+        prog.sub(symtmp4_im, sym1_im, sym3_im)
+        #__OUT0_r = t1_r + t2_r;
+        prog.add(sym0_re, symtmp1_re, symtmp2_re)
+        #__OUT0_i = t1_i + t2_i;
+        prog.add(sym0_im, symtmp1_im, symtmp2_im)
+        #__OUT1_r = t3_r + t4_i;
+        prog.add(sym1_re, symtmp3_re, symtmp4_im)
+        #__OUT1_i = t3_i - t4_r;
+        prog.sub(sym1_im, symtmp3_im, symtmp4_re)
+        #__OUT2_r = t1_r - t2_r;
+        prog.sub(sym2_re, symtmp1_re, symtmp2_re)
+        #__OUT2_i = t1_i - t2_i;
+        prog.sub(sym2_im, symtmp1_im, symtmp2_im)
+        #__OUT3_r = t3_r - t4_i;
+        prog.sub(sym3_re, symtmp3_re, symtmp4_im)
+        #__OUT3_i = t3_i + t4_r;
+        prog.add(sym3_im, symtmp3_im, symtmp4_re)
+    elif N == 5:
+        addr0 = mem_addrs[indexes[0]]
+        addr1 = mem_addrs[indexes[1]]
+        addr2 = mem_addrs[indexes[2]]
+        addr3 = mem_addrs[indexes[3]]
+        addr4 = mem_addrs[indexes[4]]
+        
+        sym0_re, sym0_im = symlist_re[addr0], symlist_im[addr0]
+        sym1_re, sym1_im = symlist_re[addr1], symlist_im[addr1]
+        sym2_re, sym2_im = symlist_re[addr2], symlist_im[addr2]
+        sym3_re, sym3_im = symlist_re[addr3], symlist_im[addr3]
+        sym4_re, sym4_im = symlist_re[addr4], symlist_im[addr4]
+        
+        symtmp1_re = prog.tmp()
+        symtmp1_im = prog.tmp()
+        symtmp2_re = prog.tmp()
+        symtmp2_im = prog.tmp()
+        symtmp3_re = prog.tmp()
+        symtmp3_im = prog.tmp()
+        symtmp4_re = prog.tmp()
+        symtmp4_im = prog.tmp()
+        symtmp5_re = prog.tmp()
+        symtmp5_im = prog.tmp()
+        symtmp6_re = prog.tmp()
+        symtmp6_im = prog.tmp()
+        symtmp7_re = prog.tmp()
+        symtmp7_im = prog.tmp()
+        symtmp8_re = prog.tmp()
+        symtmp8_im = prog.tmp()
+        symtmp9_re = prog.tmp()
+        symtmp9_im = prog.tmp()
+        symtmp10_re = prog.tmp()
+        symtmp10_im = prog.tmp()
+        symtmp11_re = prog.tmp()
+        symtmp11_im = prog.tmp()
+        symtmp12 = prog.tmp()
+        symtmp13 = prog.tmp()
+        
+        #let t1_r = i1_r + i4_r;
+        prog.add(symtmp1_re, sym1_re, sym4_re)
+        #let t1_i = i1_i + i4_i;
+        prog.add(symtmp1_im, sym1_im, sym4_im)
+        #let t2_r = i2_r + i3_r;
+        prog.add(symtmp2_re, sym2_re, sym3_re)
+        #let t2_i = i2_i + i3_i;
+        prog.add(symtmp2_im, sym2_im, sym3_im)
+        #let t3_r = i1_r - i4_r;
+        prog.sub(symtmp3_re, sym1_re, sym4_re)
+        #let t3_i = i1_i - i4_i;
+        prog.sub(symtmp3_im, sym1_im, sym4_im)
+        #let t4_r = i2_r - i3_r;
+        prog.sub(symtmp4_re, sym2_re, sym3_re)
+        #let t4_i = i2_i - i3_i;
+        prog.sub(symtmp4_im, sym2_im, sym3_im)
+        #let t5_r = t1_r + t2_r;
+        prog.add(symtmp5_re, symtmp1_re, symtmp2_re)
+        #let t5_i = t1_i + t2_i;
+        prog.add(symtmp5_im, symtmp1_im, symtmp2_im)
+        #let t6_r = 0.5590169943749475 * (t1_r - t2_r);
+        prog.sub(symtmp12, symtmp1_re, symtmp2_re)
+        prog.mul(symtmp6_re, 0.5590169943749475, symtmp12)
+        #let t6_i = 0.5590169943749475 * (t1_i - t2_i);
+        prog.sub(symtmp12, symtmp1_im, symtmp2_im)
+        prog.mul(symtmp6_im, 0.5590169943749475, symtmp12)
+        #let t7_r = i0_r - 0.25 * t5_r;
+        prog.mul(symtmp12, 0.25, symtmp5_re)
+        prog.sub(symtmp7_re, sym0_re, symtmp12)
+        #let t7_i = i0_i - 0.25 * t5_i;
+        prog.mul(symtmp12, 0.25, symtmp5_im)
+        prog.sub(symtmp7_im, sym0_im, symtmp12)
+        #let t8_r = t7_r + t6_r;
+        prog.add(symtmp8_re, symtmp7_re, symtmp6_re)
+        #let t8_i = t7_i + t6_i;
+        prog.add(symtmp8_im, symtmp7_im, symtmp6_im)
+        #let t9_r = t7_r - t6_r;
+        prog.sub(symtmp9_re, symtmp7_re, symtmp6_re)
+        #let t9_i = t7_i - t6_i;
+        prog.sub(symtmp9_im, symtmp7_im, symtmp6_im)
+        #let t10_r = 0.9510565162951535 * t3_r + 0.5877852522924731 * t4_r;
+        prog.mul(symtmp12, 0.9510565162951535, symtmp3_re)
+        prog.mul(symtmp13, 0.5877852522924731, symtmp4_re)
+        prog.add(symtmp10_re, symtmp12, symtmp13)
+        #let t10_i = 0.9510565162951535 * t3_i + 0.5877852522924731 * t4_i;
+        prog.mul(symtmp12, 0.9510565162951535, symtmp3_im)
+        prog.mul(symtmp13, 0.5877852522924731, symtmp4_im)
+        prog.add(symtmp10_im, symtmp12, symtmp13)
+        #let t11_r = 0.5877852522924731 * t3_r - 0.9510565162951535 * t4_r;
+        prog.mul(symtmp12, 0.5877852522924731, symtmp3_re)
+        prog.mul(symtmp13, 0.9510565162951535, symtmp4_re)
+        prog.sub(symtmp11_re, symtmp12, symtmp13)
+        #let t11_i = 0.5877852522924731 * t3_i - 0.9510565162951535 * t4_i;
+        prog.mul(symtmp12, 0.5877852522924731, symtmp3_im)
+        prog.mul(symtmp13, 0.9510565162951535, symtmp4_im)
+        prog.sub(symtmp11_im, symtmp12, symtmp13)
+        #__OUT0_r = i0_r + t5_r;
+        prog.add(sym0_re, sym0_re, symtmp5_re)
+        #__OUT0_i = i0_i + t5_i;
+        prog.add(sym0_im, sym0_im, symtmp5_im)
+        #__OUT1_r = t8_r + t10_i;
+        prog.add(sym1_re, symtmp8_re, symtmp10_im)
+        #__OUT1_i = t8_i - t10_r;
+        prog.sub(sym1_im, symtmp8_im, symtmp10_re)
+        #__OUT2_r = t9_r + t11_i;
+        prog.add(sym2_re, symtmp9_re, symtmp11_im)
+        #__OUT2_i = t9_i - t11_r;
+        prog.sub(sym2_im, symtmp9_im, symtmp11_re)
+        #__OUT3_r = t9_r - t11_i;
+        prog.sub(sym3_re, symtmp9_re, symtmp11_im)
+        #__OUT3_i = t9_i + t11_r;
+        prog.add(sym3_im, symtmp9_im, symtmp11_re)
+        #__OUT4_r = t8_r - t10_i;
+        prog.sub(sym4_re, symtmp8_re, symtmp10_im)
+        #__OUT4_i = t8_i + t10_r;
+        prog.add(sym4_im, symtmp8_im, symtmp10_re)
+    elif N in PRIME_CODELET_SIZES:
+        emit_dft_prime(prog, symlist_re, symlist_im, mem_addrs, indexes, N)
+    elif is_prime(N):
+        emit_dft_rader(prog, symlist_re, symlist_im, mem_addrs, indexes, N)
+    else:
+        #  Divide N into N1 and N2 (N = N1 * N2, N2 is the first radix within
+        #  [5, 4, 3, 2] that divides N, or the smallest prime factor of N).
+        N2 = smallest_factor(N)
+        for N2_test in [5, 4, 3, 2]:
+            if (N % N2_test) == 0:
+                N2 = N2_test
+                break
+        N1 = N // N2
+        
+        #  Perform N2-point DFT.
+        for n1 in range(0, N1):
+            dft_indexes = [None] * N2
+            for n2 in range(0, N2):
+                dft_indexes[n2] = indexes[N1 * n2 + n1]
+            emit_fft__internal(prog, symlist_re, symlist_im, mem_addrs, dft_indexes, N2)
+            
+            for n2 in range(0, N2):
+                emit_rotate(prog, symlist_re, symlist_im, mem_addrs[indexes[N1 * n2 + n1]], -2 * n1 * n2, N)
+        
+        #  Perform N1-point DFT.
+        for n2 in range(0, N2):
+            dft_indexes = [None] * N1
+            for n1 in range(0, N1):
+                dft_indexes[n1] = indexes[N1 * n2 + n1]
+            emit_fft__internal(prog, symlist_re, symlist_im, mem_addrs, dft_indexes, N1)
+        
+        #  Compute index re-order mapping.
+        reorder = [None] * N
+        for n1 in range(0, N1):
+            for n2 in range(0, N2):
+                reorder[N2 * n1 + n2] = N1 * n2 + n1
+        
+        #  Re-order the index.
+        visited = set()
+        for n in range(0, N):
+            if n in visited:
+                continue
+            visited.add(n)
+            cycle = [n]
+            n_cur = n
+            while True:
+                n_next = reorder[n_cur]
+                if n_next in visited:
+                    break
+                cycle.append(n_next)
+                n_cur = n_next
+                visited.add(n_next)
+            
+            if len(cycle) == 1:
+                continue
+            
+            mem_addr_first = mem_addrs[indexes[cycle[0]]]
+            for i in range(0, len(cycle) - 1):
+                mem_addrs[indexes[cycle[i]]] = mem_addrs[indexes[cycle[i + 1]]]
+            mem_addrs[indexes[cycle[len(cycle) - 1]]] = mem_addr_first
+
+
+def emit_fft(prog, symlist_re, symlist_im, N):
+    indexes = [0] * N
+    mem_addrs = [0] * N
+    for n in range(0, N):
+        indexes[n] = n
+        mem_addrs[n] = n
+    emit_fft__internal(prog, symlist_re, symlist_im, mem_addrs, indexes, N)
+    return mem_addrs
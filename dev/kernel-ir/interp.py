@@ -0,0 +1,176 @@
+#
+#  Copyright 2021 - 2023 XiaoJSoft Studio. All rights reserved.
+#  Use of this source code is governed by a BSD-style license that can be
+#  found in the LICENSE.md file.
+#
+
+#
+#  Vectorized interpreter of the kernel IR (numerical verification).
+#
+#  Note(s):
+#    [1] NumPy is required (it is only needed for the verification, the
+#        compilers don't import NumPy otherwise).
+#    [2] The program is run on many input vectors at once, each array is a
+#        NumPy array of shape (element count, vector count) and each
+#        variable holds one value per vector, so that each operation is
+#        interpreted once for all vectors.
+#    [3] The operations with the "fround" field are rounded to single
+#        precision (like Math.fround()).
+#    [4] The elements that are not initialized by the caller (e.g. the
+#        elements of scratch buffers) are NaN, so that a load before the
+#        first store is detected by the verification.
+#    [5] Base operation calls can't be interpreted.
+#
+
+import math
+
+from ir import OP_MOV, OP_ADD, OP_SUB, OP_MUL, OP_NEG, OP_LOAD, OP_STORE, OP_CALL
+from ir import is_const
+from precision import error_bound
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+#  Default count of the random input vectors.
+DEFAULT_VECTORS = 4096
+
+
+def require_numpy():
+    if numpy is None:
+        raise Exception("NumPy is required by the verification.")
+    return numpy
+
+
+def is_interpretable(prog):
+    #  Check whether the program can be interpreted (i.e. it contains no base
+    #  operation call).
+    for opc in prog.live_ops():
+        if opc["op"] == OP_CALL:
+            return False
+    return True
+
+
+def array_sizes(prog):
+    #  Get the size (the maximum element index plus one) of each array
+    #  accessed by the program.
+    sizes = {}
+    for opc in prog.live_ops():
+        if opc["op"] == OP_LOAD or opc["op"] == OP_STORE:
+            sizes[opc["arr"]] = max(sizes.get(opc["arr"], 0), opc["idx"] + 1)
+    return sizes
+
+
+def run_program(prog, inputs, count):
+    #  Run the program on `count` vectors, returns all arrays (name =>
+    #  NumPy array of shape (size, count)).
+    #
+    #  Note(s):
+    #    [1] `inputs` maps array names to the initial contents (NumPy arrays
+    #        of shape (size, count)), the arrays are not modified.
+    np = require_numpy()
+    if not is_interpretable(prog):
+        raise Exception("Base operation calls can't be interpreted.")
+    arrays = {}
+    for name, size in array_sizes(prog).items():
+        arrays[name] = np.full((size, count), math.nan)
+    for name, data in inputs.items():
+        if name not in arrays:
+            arrays[name] = np.array(data, dtype=np.float64)
+        else:
+            rows = min(len(data), len(arrays[name]))
+            arrays[name][:rows] = data[:rows]
+    values = {}
+    
+    def value_of(operand):
+        if is_const(operand):
+            return float(operand)
+        return values[operand]
+    
+    for opc in prog.live_ops():
+        kind = opc["op"]
+        if kind == OP_STORE:
+            arrays[opc["arr"]][opc["idx"]] = value_of(opc["in"][0])
+            continue
+        if kind == OP_LOAD:
+            #  Copy the row, so that later stores don't change the value.
+            result = arrays[opc["arr"]][opc["idx"]].copy()
+        else:
+            operands = [value_of(operand) for operand in opc["in"]]
+            if kind == OP_MOV:
+                result = operands[0]
+            elif kind == OP_ADD:
+                result = operands[0] + operands[1]
+            elif kind == OP_SUB:
+                result = operands[0] - operands[1]
+            elif kind == OP_MUL:
+                result = operands[0] * operands[1]
+            elif kind == OP_NEG:
+                result = -operands[0]
+            else:
+                raise Exception("Unknown operation.")
+        if opc.get("fround", False):
+            result = np.asarray(result, dtype=np.float32).astype(np.float64)
+        values[opc["out"][0]] = result
+    return arrays
+
+
+def random_vectors(size, count, seed=0):
+    #  Get `count` random vectors of `size` elements (uniformly distributed
+    #  within [-1, 1)), as a NumPy array of shape (size, count).
+    np = require_numpy()
+    return np.random.default_rng(seed).uniform(-1.0, 1.0, (size, count))
+
+
+def error_stats(actual, expected):
+    #  Get (the maximum absolute error, the RMS error) of the outputs.
+    np = require_numpy()
+    diff = np.abs(np.asarray(actual) - np.asarray(expected))
+    if diff.size == 0:
+        return (0.0, 0.0)
+    if np.isnan(diff).any():
+        return (math.inf, math.inf)
+    return (float(diff.max()), float(np.sqrt(np.mean(diff * diff))))
+
+
+def verify_text(name, stats, count, bound=None):
+    #  Get the text that describes the verification result of a kernel
+    #  (`bound` is the error bound of the kernel, None if not available),
+    #  returns (text, passed).
+    #
+    #  Note(s):
+    #    [1] The kernel fails if any output is NaN (e.g. uninitialized
+    #        scratch buffer elements are used) or the maximum error exceeds
+    #        twice the error bound (the reference is also rounded).
+    max_err, rms_err = stats
+    if max_err == math.inf:
+        return ("%s: FAILED (NaN outputs, %d vector(s))." % (name, count), False)
+    passed = (bound is None or max_err <= 2 * bound)
+    text = "%s: max error %.3g, RMS error %.3g (%d vector(s))" % (name, max_err, rms_err, count)
+    if bound is not None:
+        text += ", bound %.3g" % bound
+    if not passed:
+        return (text + ", FAILED.", False)
+    return (text + ".", True)
+
+
+def verify_program(name, prog, precision, inputs, outputs, expected, count):
+    #  Run the program (of kernel `name`) on the inputs (see run_program())
+    #  and compare its outputs (`outputs` gets the outputs from the arrays)
+    #  with the expected outputs, prints the result and returns True if
+    #  passed (or the program can't be interpreted).
+    #
+    #  Note(s):
+    #    [1] The error bound is got by error_bound() of the precision module,
+    #        which assumes that all inputs are within [-1, 1].
+    if not is_interpretable(prog):
+        print("%s: n/a (base operation calls can't be interpreted)." % name)
+        return True
+    arrays = run_program(prog, inputs, count)
+    bound = error_bound(prog, precision)
+    if bound is not None:
+        bound = bound[0]
+    text, passed = verify_text(name, error_stats(outputs(arrays), expected), count, bound)
+    print(text)
+    return passed
@@ -0,0 +1,306 @@
+#
+#  Copyright 2021 - 2023 XiaoJSoft Studio. All rights reserved.
+#  Use of this source code is governed by a BSD-style license that can be
+#  found in the LICENSE.md file.
+#
+
+#
+#  Kernel intermediate representation (IR).
+#
+#  A kernel is a straight-line list of operations. Each operation is a dict
+#  (similar to the opcode dicts used by the DCT compilers) with following
+#  fields:
+#
+#    "op"         - The operation kind (one of OP_*).
+#    "out"        - The list of variables written by the operation.
+#    "in"         - The list of operands read by the operation, each operand
+#                   is either a variable name (str) or a constant (int/float).
+#    "arr", "idx" - The array name and the (constant) element index accessed
+#                   by OP_LOAD and OP_STORE.
+#    "text"       - The verbatim text of OP_CALL and OP_COMMENT.
+#    "arith"      - The arithmetic cost of OP_CALL (add/mul/neg).
+#    "memory"     - The array element access cost of OP_CALL (load/store).
+#    "nop"        - True if the operation was eliminated by a pass.
+#    "mandatory"  - True if the operation has side effect (never eliminated).
+#    "group"      - The group ID of the operation (see Program.begin_group()).
+#    "fround"     - True if the result is rounded to single precision by
+#                   Math.fround() (see the precision module).
+#
+
+import math
+
+#  Operation kinds.
+OP_MOV = "mov"
+OP_ADD = "add"
+OP_SUB = "sub"
+OP_MUL = "mul"
+OP_NEG = "neg"
+OP_LOAD = "load"
+OP_STORE = "store"
+OP_CALL = "call"
+OP_COMMENT = "comment"
+
+#  Arithmetic operation kinds.
+ARITH_OPS = set([OP_ADD, OP_SUB, OP_MUL, OP_NEG])
+
+#  Name prefix of the constants in a constant pool (see constant_pool()).
+POOL_PREFIX = "C"
+
+
+def num_wrap(s):
+    s = str(s)
+    if s.startswith("-"):
+        return "(" + s + ")"
+    return s
+
+
+def is_const(operand):
+    return (isinstance(operand, int) or isinstance(operand, float)) and not isinstance(operand, bool)
+
+
+def is_var(operand):
+    return isinstance(operand, str)
+
+
+def operand_text(operand, pool=None):
+    if is_const(operand):
+        if pool is not None and abs(operand) in pool:
+            if math.copysign(1.0, operand) < 0:
+                return "(-%s)" % pool[abs(operand)]
+            return pool[abs(operand)]
+        return num_wrap(operand)
+    return operand
+
+
+class Program:
+    def __init__(self):
+        self.ops = []
+        self.tmp_next = 0
+        self.group = 0
+        self.group_levels = {}
+        self.level_pending = None
+    
+    def tmp(self):
+        #  Allocate a fresh (virtual) variable. Virtual variables are renamed
+        #  by the register allocator before code generation.
+        name = "v%d" % self.tmp_next
+        self.tmp_next += 1
+        return name
+    
+    def begin_group(self):
+        #  Start a new operation group. A code generator may place different
+        #  groups into different JS functions, so no variable shall be live
+        #  across the boundary of two groups.
+        self.group += 1
+        self.group_levels[self.group] = self.level_pending
+        self.level_pending = None
+        return self.group
+    
+    def mark_boundary(self, level):
+        #  Mark that a sub-transform (nested at depth `level`, 0 for the whole
+        #  transform) starts at the next group, so that a code generator can
+        #  prefer dividing the program at the boundaries of larger blocks.
+        if self.level_pending is None or level < self.level_pending:
+            self.level_pending = level
+    
+    def group_level(self, group):
+        #  Get the nesting depth of the sub-transform that starts at group
+        #  `group` (None if the group doesn't start a sub-transform).
+        return self.group_levels.get(group)
+    
+    def emit(self, op, var_out=[], var_in=[], arr=None, idx=None, text=None, mandatory=False, arith=None, memory=None):
+        opc = {
+            "op": op,
+            "out": list(var_out),
+            "in": list(var_in),
+            "arr": arr,
+            "idx": idx,
+            "text": text,
+            "arith": arith,
+            "memory": memory,
+            "nop": False,
+            "mandatory": mandatory,
+            "group": self.group
+        }
+        self.ops.append(opc)
+        return opc
+    
+    def mov(self, dst, a):
+        return self.emit(OP_MOV, var_out=[dst], var_in=[a])
+    
+    def add(self, dst, a, b):
+        return self.emit(OP_ADD, var_out=[dst], var_in=[a, b])
+    
+    def sub(self, dst, a, b):
+        return self.emit(OP_SUB, var_out=[dst], var_in=[a, b])
+    
+    def mul(self, dst, a, b):
+        return self.emit(OP_MUL, var_out=[dst], var_in=[a, b])
+    
+    def neg(self, dst, a):
+        return self.emit(OP_NEG, var_out=[dst], var_in=[a])
+    
+    def load(self, dst, arr, idx):
+        return self.emit(OP_LOAD, var_out=[dst], arr=arr, idx=idx)
+    
+    def store(self, arr, idx, src):
+        return self.emit(OP_STORE, var_in=[src], arr=arr, idx=idx, mandatory=True)
+    
+    def call(self, text, arith=None, memory=None):
+        return self.emit(OP_CALL, text=text, mandatory=True, arith=arith, memory=memory)
+    
+    def comment(self, text):
+        return self.emit(OP_COMMENT, text=text)
+    
+    def live_ops(self):
+        for opc in self.ops:
+            if opc["nop"] or opc["op"] == OP_COMMENT:
+                continue
+            yield opc
+    
+    def count_arith(self):
+        counts = {"add": 0, "mul": 0, "neg": 0}
+        for opc in self.live_ops():
+            kind = opc["op"]
+            if kind == OP_ADD or kind == OP_SUB:
+                counts["add"] += 1
+            elif kind == OP_MUL:
+                counts["mul"] += 1
+            elif kind == OP_NEG:
+                counts["neg"] += 1
+            elif kind == OP_CALL and opc["arith"] is not None:
+                for key in counts:
+                    counts[key] += opc["arith"].get(key, 0)
+        return counts
+    
+    def count_memory(self):
+        counts = {"load": 0, "store": 0}
+        for opc in self.live_ops():
+            if opc["op"] == OP_LOAD:
+                counts["load"] += 1
+            elif opc["op"] == OP_STORE:
+                counts["store"] += 1
+            elif opc["op"] == OP_CALL and opc["memory"] is not None:
+                for key in counts:
+                    counts[key] += opc["memory"].get(key, 0)
+        return counts
+    
+    def variables(self, ops=None):
+        #  Get all variables written by the program (or a part of its
+        #  operations).
+        if ops is None:
+            ops = self.ops
+        defs = set()
+        for opc in ops:
+            if opc["nop"] or opc["op"] == OP_COMMENT:
+                continue
+            for var_name in opc["out"]:
+                defs.add(var_name)
+        defs = list(defs)
+        defs.sort()
+        return defs
+    
+    def groups(self):
+        #  Get the operations of each group (in program order).
+        groups = []
+        for opc in self.ops:
+            if len(groups) == 0 or groups[-1][0]["group"] != opc["group"]:
+                groups.append([])
+            groups[-1].append(opc)
+        return groups
+
+
+def index_text(idx, offset=None):
+    #  Get the text of an element index (relative to the index variable
+    #  `offset` if it is not None).
+    if offset is None:
+        return "%d" % idx
+    if idx == 0:
+        return offset
+    return "%s + %d" % (offset, idx)
+
+
+def constant_pool(ops, min_uses=2):
+    #  Build the constant pool of a list of operations, returns a dict that
+    #  maps the magnitude of each pooled constant to its name.
+    #
+    #  Note(s):
+    #    [1] Constants are canonicalized up to sign (a negative constant is
+    #        rendered as the negation of the pooled magnitude), constants
+    #        related by the symmetry of sine and cosine share the same
+    #        magnitude if the code generator computes them symmetrically (see
+    #        unit_root() of the codelets module).
+    #    [2] Only the constants used at least `min_uses` times are pooled,
+    #        zeros are never pooled.
+    #    [3] The names are assigned in the order of first use.
+    uses = {}
+    for opc in ops:
+        if opc["nop"] or opc["op"] == OP_CALL or opc["op"] == OP_COMMENT:
+            continue
+        for operand in opc["in"]:
+            if is_const(operand) and operand != 0:
+                key = abs(operand)
+                uses[key] = uses.get(key, 0) + 1
+    pool = {}
+    for key in uses:
+        if uses[key] >= min_uses:
+            pool[key] = "%s%d" % (POOL_PREFIX, len(pool))
+    return pool
+
+
+def constant_count(ops):
+    #  Get the count of distinct constants (up to sign) of a list of
+    #  operations.
+    return len(constant_pool(ops, 1))
+
+
+def render_pool_js(pool):
+    #  Render the declarations of a constant pool (one line per constant).
+    return ["const %s = %s;" % (name, repr(float(key))) for key, name in pool.items()]
+
+
+def render_op_js(opc, offset=None, pool=None):
+    kind = opc["op"]
+    if kind == OP_CALL or kind == OP_COMMENT:
+        return opc["text"]
+    operands = [operand_text(operand, pool) for operand in opc["in"]]
+    if kind == OP_MOV:
+        expr = operands[0]
+    elif kind == OP_ADD:
+        expr = "%s + %s" % (operands[0], operands[1])
+    elif kind == OP_SUB:
+        expr = "%s - %s" % (operands[0], operands[1])
+    elif kind == OP_MUL:
+        expr = "%s * %s" % (operands[0], operands[1])
+    elif kind == OP_NEG:
+        expr = "-%s" % operands[0]
+    elif kind == OP_LOAD:
+        expr = "%s[%s]" % (opc["arr"], index_text(opc["idx"], offset))
+    elif kind == OP_STORE:
+        return "%s[%s] = %s;" % (opc["arr"], index_text(opc["idx"], offset), operands[0])
+    else:
+        raise Exception("Unknown operation.")
+    if opc.get("fround", False):
+        expr = "Math.fround(%s)" % expr
+    return "%s = %s;" % (opc["out"][0], expr)
+
+
+def render_js(prog, debug=False, ops=None, offset=None, pool=None):
+    #  Render the program (or a part of its operations) as JavaScript
+    #  statements (without indentation), all array elements are indexed
+    #  relative to the index variable `offset` if it is not None, the
+    #  constants in `pool` (see constant_pool()) are referred by name.
+    if ops is None:
+        ops = prog.ops
+    lines = []
+    for opc in ops:
+        if opc["op"] == OP_COMMENT:
+            if debug:
+                lines.append(opc["text"])
+            continue
+        if opc["nop"]:
+            if debug:
+                lines.append("// " + render_op_js(opc, offset))
+            continue
+        lines.append(render_op_js(opc, offset, pool))
+    return lines
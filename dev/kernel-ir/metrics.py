@@ -0,0 +1,88 @@
+#
+#  Copyright 2021 - 2023 XiaoJSoft Studio. All rights reserved.
+#  Use of this source code is governed by a BSD-style license that can be
+#  found in the LICENSE.md file.
+#
+
+#
+#  Static cost metrics of the generated kernels.
+#
+#  Note(s):
+#    [1] Each compiler writes one metrics file (JSON) per output file to
+#        METRICS_DIR, which maps the name of each kernel function to its
+#        metrics (see METRIC_KEYS), the metrics files are compared with the
+#        checked-in baseline by "baseline.py" (in the "dev" folder).
+#    [2] Metrics:
+#          "add", "mul", "neg" - The arithmetic operation counts (including the
+#                                cost of base operation calls).
+#          "load", "store"     - The array element access counts (including
+#                                the accesses of base operation calls and
+#                                the table loads of the compact kernels).
+#          "locals"            - The maximum count of local variables of one
+#                                function (part).
+#          "constants"         - The count of distinct constants (up to
+#                                sign).
+#          "parts"             - The count of functions that the kernel is
+#                                split into.
+#          "bytes"             - The size of the JS code (UTF-8 bytes) of the
+#                                kernel function (and its parts), or the
+#                                size of the WebAssembly module.
+#
+
+import os
+import json
+
+from ir import constant_pool
+
+#  Metrics folder.
+METRICS_DIR = os.path.join(os.path.dirname(os.path.realpath(__file__)), "..", "metrics")
+
+#  Metric keys (all of them are costs, the lower the better).
+METRIC_KEYS = ["add", "mul", "neg", "load", "store", "locals", "constants", "parts", "bytes"]
+
+
+def kernel_metrics(prog, code_bytes, parts=None):
+    #  Get the metrics of a kernel.
+    #
+    #  Note(s):
+    #    [1] `prog` is the program of the kernel (or None if the kernel only
+    #        calls other kernels).
+    #    [2] `parts` is the list of parts (see split_parts() of the FFT
+    #        compiler), the kernel is assumed to be one function if `parts` is
+    #        None.
+    metrics = dict([(key, 0) for key in METRIC_KEYS])
+    if prog is not None:
+        metrics.update(prog.count_arith())
+        metrics.update(prog.count_memory())
+    if parts is None:
+        if prog is not None:
+            metrics["locals"] = len(prog.variables())
+            metrics["constants"] = len(constant_pool(prog.ops, 1))
+        metrics["parts"] = 1
+    else:
+        constants = set()
+        for defs, _, _, part_constants in parts:
+            metrics["locals"] = max(metrics["locals"], len(defs))
+            constants |= part_constants
+        metrics["constants"] = len(constants)
+        metrics["parts"] = len(parts)
+    metrics["bytes"] = code_bytes
+    return metrics
+
+
+def metrics_path(outfile_path):
+    #  Get the path of the metrics file of an output file.
+    return os.path.join(METRICS_DIR, os.path.splitext(os.path.basename(outfile_path))[0] + ".json")
+
+
+def write_metrics(outfile_path, kernels):
+    #  Write the metrics file of an output file (`kernels` maps the name of
+    #  each kernel to its metrics).
+    if not os.path.exists(METRICS_DIR):
+        os.makedirs(METRICS_DIR)
+    fp = open(metrics_path(outfile_path), "w", encoding="utf-8")
+    fp.write(json.dumps({
+        "output": os.path.basename(outfile_path),
+        "kernels": kernels
+    }, indent=4))
+    fp.close()
@@ -0,0 +1,410 @@
+#
+#  Copyright 2021 - 2023 XiaoJSoft Studio. All rights reserved.
+#  Use of this source code is governed by a BSD-style license that can be
+#  found in the LICENSE.md file.
+#
+
+#
+#  Optimization passes and pass manager for the kernel IR.
+#
+#  Note(s):
+#    [1] All passes (except pass_ssa()) expect the program in SSA form (i.e.
+#        each variable is assigned exactly once), the pass manager converts
+#        the program before running any pass.
+#    [2] Each pass returns True if the program was changed.
+#    [3] Constant folding assumes that all inputs are finite (x * 0 => 0).
+#    [4] All passes run in (near) linear time of the program size, so that
+#        kernels with hundreds of thousands of operations can be optimized.
+#    [5] The cyclic garbage collector is paused while the pass manager runs
+#        (the IR contains no reference cycle, but the collector would scan
+#        all operations again and again as the passes allocate).
+#
+
+import gc
+import collections
+
+from ir import OP_MOV, OP_ADD, OP_SUB, OP_MUL, OP_NEG, OP_LOAD, OP_STORE, OP_CALL, OP_COMMENT, ARITH_OPS
+from ir import is_const, is_var
+
+#  Maximum pipeline iterations (the pipeline runs until no pass changes the
+#  program).
+MAX_ITERATIONS = 16
+
+
+def pass_ssa(prog):
+    version = {}
+    for opc in prog.ops:
+        if opc["op"] == OP_COMMENT:
+            continue
+        operands = []
+        for operand in opc["in"]:
+            if is_var(operand):
+                if operand not in version:
+                    raise Exception("Variable \"%s\" is used before assignment." % operand)
+                operand = "%s.%d" % (operand, version[operand])
+            operands.append(operand)
+        opc["in"] = operands
+        outs = []
+        for var_out in opc["out"]:
+            version[var_out] = version.get(var_out, -1) + 1
+            outs.append("%s.%d" % (var_out, version[var_out]))
+        opc["out"] = outs
+    return False
+
+
+def substitute(prog, subst):
+    #  Replace variables (in operands) by their substitutions.
+    def resolve(operand):
+        while is_var(operand) and operand in subst:
+            operand = subst[operand]
+        return operand
+    changed = False
+    for opc in prog.live_ops():
+        operands = []
+        for operand in opc["in"]:
+            replaced = resolve(operand)
+            if replaced is not operand:
+                changed = True
+            operands.append(replaced)
+        opc["in"] = operands
+    return changed
+
+
+def pass_copy_prop(prog):
+    subst = {}
+    for opc in prog.live_ops():
+        if opc["op"] == OP_MOV:
+            subst[opc["out"][0]] = opc["in"][0]
+            opc["nop"] = True
+    substitute(prog, subst)
+    return len(subst) != 0
+
+
+def rewrite(opc, kind, operands):
+    opc["op"] = kind
+    opc["in"] = operands
+
+
+def pass_const_fold(prog):
+    changed = False
+    defs = {}
+    for opc in prog.live_ops():
+        kind = opc["op"]
+        if kind in ARITH_OPS:
+            operands = opc["in"]
+            if all(is_const(operand) for operand in operands):
+                if kind == OP_ADD:
+                    value = operands[0] + operands[1]
+                elif kind == OP_SUB:
+                    value = operands[0] - operands[1]
+                elif kind == OP_MUL:
+                    value = operands[0] * operands[1]
+                else:
+                    value = -operands[0]
+                rewrite(opc, OP_MOV, [value])
+                changed = True
+            elif kind == OP_ADD:
+                a, b = operands
+                if is_const(a) and a == 0:
+                    rewrite(opc, OP_MOV, [b])
+                    changed = True
+                elif is_const(b) and b == 0:
+                    rewrite(opc, OP_MOV, [a])
+                    changed = True
+                elif is_var(b) and defs.get(b, {}).get("op") == OP_NEG:
+                    #  a + (-y) => a - y
+                    rewrite(opc, OP_SUB, [a, defs[b]["in"][0]])
+                    changed = True
+                elif is_var(a) and defs.get(a, {}).get("op") == OP_NEG:
+                    #  (-y) + b => b - y
+                    rewrite(opc, OP_SUB, [b, defs[a]["in"][0]])
+                    changed = True
+            elif kind == OP_SUB:
+                a, b = operands
+                if is_const(b) and b == 0:
+                    rewrite(opc, OP_MOV, [a])
+                    changed = True
+                elif is_const(a) and a == 0:
+                    rewrite(opc, OP_NEG, [b])
+                    changed = True
+                elif is_var(a) and a == b:
+                    rewrite(opc, OP_MOV, [0])
+                    changed = True
+                elif is_var(b) and defs.get(b, {}).get("op") == OP_NEG:
+                    #  a - (-y) => a + y
+                    rewrite(opc, OP_ADD, [a, defs[b]["in"][0]])
+                    changed = True
+            elif kind == OP_MUL:
+                a, b = operands
+                if is_const(b):
+                    a, b = b, a
+                if is_const(a):
+                    if a == 0:
+                        rewrite(opc, OP_MOV, [0])
+                        changed = True
+                    elif a == 1:
+                        rewrite(opc, OP_MOV, [b])
+                        changed = True
+                    elif a == -1:
+                        rewrite(opc, OP_NEG, [b])
+                        changed = True
+                    elif is_var(b) and defs.get(b, {}).get("op") == OP_NEG:
+                        #  c * (-y) => (-c) * y
+                        rewrite(opc, OP_MUL, [-a, defs[b]["in"][0]])
+                        changed = True
+            elif kind == OP_NEG:
+                a = operands[0]
+                if is_var(a) and defs.get(a, {}).get("op") == OP_NEG:
+                    #  -(-y) => y
+                    rewrite(opc, OP_MOV, [defs[a]["in"][0]])
+                    changed = True
+        for var_out in opc["out"]:
+            defs[var_out] = opc
+    return changed
+
+
+def pass_const_reassoc(prog):
+    #  c1 * (c2 * y) => (c1 * c2) * y
+    #
+    #  Note(s):
+    #    [1] This pass changes the rounding of the result, so it is not in
+    #        the default pipeline.
+    #    [2] The inner multiplication is eliminated (by the dead code
+    #        elimination pass) once all its users were rewritten.
+    changed = False
+    defs = {}
+    for opc in prog.live_ops():
+        if opc["op"] == OP_MUL:
+            a, b = opc["in"]
+            if is_const(b):
+                a, b = b, a
+            if is_const(a) and is_var(b):
+                inner = defs.get(b)
+                if inner is not None and inner["op"] == OP_MUL:
+                    c, y = inner["in"]
+                    if is_const(y):
+                        c, y = y, c
+                    if is_const(c) and is_var(y):
+                        rewrite(opc, OP_MUL, [a * c, y])
+                        changed = True
+        for var_out in opc["out"]:
+            defs[var_out] = opc
+    return changed
+
+
+def operand_key(operand):
+    if is_const(operand):
+        return ("c", operand)
+    return ("v", operand)
+
+
+def pass_cse(prog):
+    changed = False
+    values = {}
+    loads = {}
+    loads_at = {}
+    for opc in prog.live_ops():
+        kind = opc["op"]
+        if kind == OP_LOAD:
+            key = (opc["arr"], opc["idx"])
+            if key in loads:
+                rewrite(opc, OP_MOV, [loads[key]])
+                changed = True
+            else:
+                loads[key] = opc["out"][0]
+                loads_at.setdefault(opc["idx"], set()).add(key)
+        elif kind == OP_STORE:
+            #  Arrays may alias (e.g. in-place transformation), so a store
+            #  invalidates all loaded values with the same index.
+            for key in loads_at.pop(opc["idx"], ()):
+                del loads[key]
+        elif kind == OP_CALL:
+            loads.clear()
+            loads_at.clear()
+        elif kind in ARITH_OPS:
+            keys = [operand_key(operand) for operand in opc["in"]]
+            if kind == OP_ADD or kind == OP_MUL:
+                keys.sort()
+            key = (kind, tuple(keys))
+            if key in values:
+                rewrite(opc, OP_MOV, [values[key]])
+                changed = True
+            else:
+                values[key] = opc["out"][0]
+    return changed
+
+
+def pass_dce(prog):
+    changed = False
+    
+    #  Dead store elimination (a store is dead if the same element is stored
+    #  again before it is loaded).
+    pending = set()
+    pending_at = {}
+    for opc in reversed(prog.ops):
+        if opc["nop"] or opc["op"] == OP_COMMENT:
+            continue
+        kind = opc["op"]
+        if kind == OP_STORE:
+            key = (opc["arr"], opc["idx"])
+            if key in pending:
+                opc["nop"] = True
+                changed = True
+            else:
+                pending.add(key)
+                pending_at.setdefault(opc["idx"], set()).add(key)
+        elif kind == OP_LOAD:
+            pending -= pending_at.pop(opc["idx"], set())
+        elif kind == OP_CALL:
+            pending.clear()
+            pending_at.clear()
+    
+    #  Compute the in-degree of each line (one line <=> one vertex).
+    ops = prog.ops
+    line_count = len(ops)
+    last_assign = {}
+    vertexes = []
+    for i in range(0, line_count):
+        vertexes.append(set())
+    in_degree = [0] * line_count
+    for line_id in range(0, line_count):
+        line = ops[line_id]
+        if line["op"] == OP_COMMENT or line["nop"]:
+            continue
+        if line["mandatory"]:
+            in_degree[line_id] += 1          #  Do NOT optimize.
+        for var_in in line["in"]:
+            if not is_var(var_in):
+                continue
+            var_last_assign = last_assign[var_in]
+            vertexes[line_id].add(var_last_assign)
+            in_degree[var_last_assign] += 1
+        for var_out in line["out"]:
+            last_assign[var_out] = line_id
+    
+    #  BFS queue shall be filled with initial dead lines.
+    queue = collections.deque()
+    for line_id in range(0, line_count):
+        line = ops[line_id]
+        if line["op"] == OP_COMMENT or line["nop"]:
+            continue
+        if in_degree[line_id] == 0:
+            queue.append(line_id)
+    
+    #  BFS to detect all dead lines.
+    while len(queue) != 0:
+        front = queue.popleft()
+        ops[front]["nop"] = True
+        changed = True
+        for vertex in vertexes[front]:
+            in_degree[vertex] -= 1
+            if in_degree[vertex] == 0:
+                queue.append(vertex)
+    
+    return changed
+
+
+#  Registered passes.
+PASSES = {
+    "copy-prop": pass_copy_prop,
+    "const-fold": pass_const_fold,
+    "const-reassoc": pass_const_reassoc,
+    "cse": pass_cse,
+    "dce": pass_dce
+}
+
+#  Default pass pipeline.
+DEFAULT_PIPELINE = ["copy-prop", "const-fold", "cse", "copy-prop", "dce"]
+
+
+def register_pass(name, func):
+    if name in PASSES:
+        raise Exception("Pass \"%s\" is already registered." % name)
+    PASSES[name] = func
+
+
+class PassManager:
+    def __init__(self, pipeline=None):
+        if pipeline is None:
+            pipeline = DEFAULT_PIPELINE
+        self.pipeline = []
+        for name in pipeline:
+            if name not in PASSES:
+                raise Exception("No such pass \"%s\"." % name)
+            self.pipeline.append(name)
+    
+    def run(self, prog):
+        gc_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            pass_ssa(prog)
+            for iteration in range(0, MAX_ITERATIONS):
+                changed = False
+                for name in self.pipeline:
+                    if PASSES[name](prog):
+                        changed = True
+                if not changed:
+                    break
+            allocate_registers(prog)
+        finally:
+            if gc_enabled:
+                gc.enable()
+
+
+def allocate_registers(prog, prefix="t"):
+    #  Temporary variable set (the free variables are reused in the order
+    #  they were released).
+    tmpvar_used = set()
+    tmpvar_free = collections.deque()
+    tmpvar_nextid = [0]
+    
+    def tmpvar_alloc():
+        if len(tmpvar_free) != 0:
+            tmpvar = tmpvar_free.popleft()
+        else:
+            tmpvar = "%s%d" % (prefix, tmpvar_nextid[0])
+            tmpvar_nextid[0] += 1
+        tmpvar_used.add(tmpvar)
+        return tmpvar
+    
+    def tmpvar_release(tmpvar):
+        if tmpvar not in tmpvar_used:
+            raise Exception("No such variable.")
+        tmpvar_used.remove(tmpvar)
+        tmpvar_free.append(tmpvar)
+    
+    #  Find the last use of each variable.
+    ops = list(prog.live_ops())
+    last_use = {}
+    for line_id in range(0, len(ops)):
+        for var_in in ops[line_id]["in"]:
+            if is_var(var_in):
+                last_use[var_in] = line_id
+    
+    #  Assign registers (the operands of one line are always read before its
+    #  result is written, so the result may reuse the register of an operand
+    #  that dies at the same line).
+    assigned = {}
+    for line_id in range(0, len(ops)):
+        line = ops[line_id]
+        operands = []
+        dying = []
+        for var_in in line["in"]:
+            if is_var(var_in):
+                if var_in not in assigned:
+                    raise Exception("Variable \"%s\" is used before assignment." % var_in)
+                if last_use[var_in] == line_id and var_in not in dying:
+                    dying.append(var_in)
+                var_in = assigned[var_in]
+            operands.append(var_in)
+        line["in"] = operands
+        for var_in in dying:
+            tmpvar_release(assigned[var_in])
+        outs = []
+        for var_out in line["out"]:
+            reg = tmpvar_alloc()
+            assigned[var_out] = reg
+            outs.append(reg)
+            if var_out not in last_use:
+                tmpvar_release(reg)
+        line["out"] = outs
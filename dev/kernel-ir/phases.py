@@ -0,0 +1,73 @@
+#
+#  Copyright 2021 - 2023 XiaoJSoft Studio. All rights reserved.
+#  Use of this source code is governed by a BSD-style license that can be
+#  found in the LICENSE.md file.
+#
+
+#
+#  Phase timing and memory report of the code generators.
+#
+#  Note(s):
+#    [1] A phase lasts from its begin() call to the next begin() (or end())
+#        call, the report lists the elapsed time and the peak memory usage
+#        (the maximum resident set size of the process so far) at the end of
+#        each phase.
+#    [2] The peak memory usage is not available on platforms without the
+#        "resource" module (e.g. Windows).
+#
+
+import sys
+import time
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+
+def peak_memory():
+    #  Get the peak memory usage (in bytes, or None if not available).
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if sys.platform == "darwin":
+        return peak
+    return peak * 1024
+
+
+class PhaseReport:
+    def __init__(self):
+        self.phases = []
+        self.current = None
+        self.begin_time = None
+    
+    def begin(self, name):
+        #  End the current phase (if any) and begin a new phase.
+        self.end()
+        self.current = name
+        self.begin_time = time.perf_counter()
+    
+    def end(self):
+        #  End the current phase.
+        if self.current is None:
+            return
+        self.phases.append((self.current, time.perf_counter() - self.begin_time, peak_memory()))
+        self.current = None
+    
+    def lines(self):
+        #  Get the lines of the report.
+        self.end()
+        width = max([len(name) for name, _, _ in self.phases] + [5])
+        lines = []
+        for name, elapsed, peak in self.phases + [("total", sum([phase[1] for phase in self.phases]), peak_memory())]:
+            if peak is None:
+                peak_text = "n/a"
+            else:
+                peak_text = "%.1f MiB" % (peak / 1048576)
+            lines.append("  %s  %8.3fs  (peak memory: %s)" % (name.ljust(width), elapsed, peak_text))
+        return lines
+    
+    def print(self):
+        print("Phases:")
+        for line in self.lines():
+            print(line)
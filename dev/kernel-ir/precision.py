@@ -0,0 +1,120 @@
+#
+#  Copyright 2021 - 2023 XiaoJSoft Studio. All rights reserved.
+#  Use of this source code is governed by a BSD-style license that can be
+#  found in the LICENSE.md file.
+#
+
+#
+#  Arithmetic precision of the kernel IR (rewriting and error analysis).
+#
+#  Note(s):
+#    [1] In "f32" mode, all constants are rounded to single precision and the
+#        results of all loads, additions, subtractions and multiplications
+#        are rounded by Math.fround() (see the "fround" operation field), so
+#        that the kernel computes exactly in single precision (on
+#        Float32Array storage). Moves and negations are exact.
+#    [2] The error bound is a worst-case bound of the absolute error of each
+#        output, it assumes that all inputs are within [-input_bound,
+#        input_bound] and that each rounding (including the rounding of each
+#        constant) has a relative error of at most the unit roundoff of the
+#        precision.
+#
+
+import math
+import struct
+
+from ir import OP_MOV, OP_ADD, OP_SUB, OP_MUL, OP_NEG, OP_LOAD, OP_STORE
+from ir import is_const
+
+#  Operations whose results are rounded in "f32" mode.
+ROUNDED_OPS = set([OP_ADD, OP_SUB, OP_MUL, OP_LOAD])
+
+#  Precisions (=> the unit roundoff).
+PRECISIONS = {
+    "f64": 2.0 ** -53,
+    "f32": 2.0 ** -24
+}
+
+
+def round_f32(value):
+    #  Round a number to the nearest single-precision number.
+    return struct.unpack("<f", struct.pack("<f", value))[0]
+
+
+def rewrite_precision(prog, precision):
+    #  Rewrite the program to compute in specific precision (see note 1).
+    if precision not in PRECISIONS:
+        raise Exception("Unknown precision \"%s\"." % precision)
+    if precision == "f64":
+        return
+    for opc in prog.live_ops():
+        opc["in"] = [round_f32(operand) if is_const(operand) else operand for operand in opc["in"]]
+        if opc["op"] in ROUNDED_OPS:
+            opc["fround"] = True
+
+
+def error_bound(prog, precision, input_bound=1.0):
+    #  Get the error bound (see note 2) of the program, returns (the maximum
+    #  absolute error bound of all outputs, the maximum magnitude bound of
+    #  all outputs), or None if the program contains base operation calls.
+    #
+    #  Note(s):
+    #    [1] Each value is tracked as (magnitude bound, error bound), the
+    #        array elements are tracked separately (so that intermediate
+    #        values stored to the arrays are carried to later loads).
+    #    [2] The inputs are assumed to be exact in "f64" mode, and rounded
+    #        once (by the loads) in "f32" mode.
+    u = PRECISIONS[precision]
+    if precision == "f64":
+        input_error = 0.0
+    else:
+        input_error = u * input_bound
+    values = {}
+    memory = {}
+    
+    def bound_of(operand):
+        if is_const(operand):
+            return (abs(operand), u * abs(operand))
+        return values[operand]
+    
+    for opc in prog.live_ops():
+        kind = opc["op"]
+        operands = [bound_of(operand) for operand in opc["in"]]
+        if kind == OP_MOV or kind == OP_NEG:
+            result = operands[0]
+        elif kind == OP_ADD or kind == OP_SUB:
+            mag = operands[0][0] + operands[1][0]
+            result = (mag, operands[0][1] + operands[1][1] + u * mag)
+        elif kind == OP_MUL:
+            (mag_a, err_a), (mag_b, err_b) = operands
+            mag = mag_a * mag_b
+            result = (mag, mag_a * err_b + mag_b * err_a + err_a * err_b + u * mag)
+        elif kind == OP_LOAD:
+            result = memory.get((opc["arr"], opc["idx"]), (input_bound, input_error))
+        elif kind == OP_STORE:
+            memory[(opc["arr"], opc["idx"])] = operands[0]
+            continue
+        else:
+            return None
+        values[opc["out"][0]] = result
+    
+    if len(memory) == 0:
+        return (0.0, 0.0)
+    return (max([err for _, err in memory.values()]), max([mag for mag, _ in memory.values()]))
+
+
+def error_text(prog, precision, input_bound=1.0):
+    #  Get the text that describes the error bound of the program.
+    bound = error_bound(prog, precision, input_bound)
+    if bound is None:
+        return "Error bound (%s): n/a." % precision
+    err, mag = bound
+    if err == 0:
+        return "Error bound (%s): exact." % precision
+    return "Error bound (%s): |error| <= %.3g (|input| <= %g, |output| <= %g, %.1f bit(s) below the output bound)." % (
+        precision,
+        err,
+        input_bound,
+        mag,
+        math.log2(mag / err)
+    )
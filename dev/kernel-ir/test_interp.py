@@ -0,0 +1,173 @@
+#
+#  Copyright 2021 - 2023 XiaoJSoft Studio. All rights reserved.
+#  Use of this source code is governed by a BSD-style license that can be
+#  found in the LICENSE.md file.
+#
+
+#
+#  Unit tests of the interpreter (numerical verification).
+#
+#  Usage:
+#    python3 -m unittest discover dev/kernel-ir
+#
+#  Note(s):
+#    [1] All tests are skipped if NumPy is not available.
+#
+
+import io
+import math
+import unittest
+import contextlib
+
+from ir import Program
+from passes import PassManager
+from interp import numpy, is_interpretable, array_sizes, run_program, random_vectors, error_stats
+from interp import verify_text, verify_program
+
+
+def build_butterfly():
+    #  y[0] = x[0] + 0.5 * x[1], y[1] = x[0] - 0.5 * x[1] (through a scratch
+    #  buffer, z[0] = 0.5 * x[1]).
+    prog = Program()
+    x0 = prog.tmp()
+    x1 = prog.tmp()
+    h = prog.tmp()
+    z = prog.tmp()
+    y0 = prog.tmp()
+    y1 = prog.tmp()
+    prog.load(x0, "x", 0)
+    prog.load(x1, "x", 1)
+    prog.mul(h, x1, 0.5)
+    prog.store("z", 0, h)
+    prog.load(z, "z", 0)
+    prog.add(y0, x0, z)
+    prog.sub(y1, x0, z)
+    prog.store("y", 0, y0)
+    prog.store("y", 1, y1)
+    return prog
+
+
+def butterfly_reference(x):
+    return numpy.array([x[0] + 0.5 * x[1], x[0] - 0.5 * x[1]])
+
+
+@unittest.skipIf(numpy is None, "NumPy is not available.")
+class TestRunProgram(unittest.TestCase):
+    def test_array_sizes(self):
+        self.assertEqual(array_sizes(build_butterfly()), {"x": 2, "y": 2, "z": 1})
+    
+    def test_butterfly(self):
+        x = random_vectors(2, 64, seed=1)
+        arrays = run_program(build_butterfly(), {"x": x}, 64)
+        self.assertTrue(numpy.array_equal(arrays["y"], butterfly_reference(x)))
+        self.assertTrue(numpy.array_equal(arrays["z"][0], 0.5 * x[1]))
+    
+    def test_optimized(self):
+        prog = build_butterfly()
+        PassManager().run(prog)
+        x = random_vectors(2, 64, seed=2)
+        arrays = run_program(prog, {"x": x}, 64)
+        self.assertTrue(numpy.array_equal(arrays["y"], butterfly_reference(x)))
+    
+    def test_inputs_unmodified(self):
+        #  In-place program: x[0] = -x[0].
+        prog = Program()
+        a = prog.tmp()
+        b = prog.tmp()
+        prog.load(a, "x", 0)
+        prog.neg(b, a)
+        prog.store("x", 0, b)
+        x = random_vectors(1, 8)
+        saved = x.copy()
+        arrays = run_program(prog, {"x": x}, 8)
+        self.assertTrue(numpy.array_equal(x, saved))
+        self.assertTrue(numpy.array_equal(arrays["x"], -saved))
+    
+    def test_uninitialized(self):
+        #  Loads of uninitialized elements get NaN.
+        prog = Program()
+        a = prog.tmp()
+        prog.load(a, "s", 3)
+        prog.store("y", 0, a)
+        arrays = run_program(prog, {}, 4)
+        self.assertTrue(numpy.isnan(arrays["y"]).all())
+    
+    def test_fround(self):
+        prog = Program()
+        a = prog.tmp()
+        b = prog.tmp()
+        prog.load(a, "x", 0)
+        prog.mul(b, a, 1.0 / 3.0)["fround"] = True
+        prog.store("y", 0, b)
+        x = random_vectors(1, 16)
+        arrays = run_program(prog, {"x": x}, 16)
+        expected = (x[0] * (1.0 / 3.0)).astype(numpy.float32).astype(numpy.float64)
+        self.assertTrue(numpy.array_equal(arrays["y"][0], expected))
+    
+    def test_call(self):
+        prog = Program()
+        prog.call("Base(x, y);")
+        self.assertFalse(is_interpretable(prog))
+        with self.assertRaises(Exception):
+            run_program(prog, {}, 1)
+
+
+@unittest.skipIf(numpy is None, "NumPy is not available.")
+class TestRandomVectors(unittest.TestCase):
+    def test_deterministic(self):
+        a = random_vectors(16, 32, seed=7)
+        self.assertEqual(a.shape, (16, 32))
+        self.assertTrue(numpy.array_equal(a, random_vectors(16, 32, seed=7)))
+        self.assertFalse(numpy.array_equal(a, random_vectors(16, 32, seed=8)))
+        self.assertTrue(((a >= -1.0) & (a < 1.0)).all())
+
+
+@unittest.skipIf(numpy is None, "NumPy is not available.")
+class TestVerify(unittest.TestCase):
+    def test_error_stats(self):
+        self.assertEqual(error_stats([1.0, 2.0], [1.0, 2.0]), (0.0, 0.0))
+        self.assertEqual(error_stats([1.0, 2.5], [1.0, 2.0]), (0.5, math.sqrt(0.125)))
+        self.assertEqual(error_stats([math.nan], [0.0]), (math.inf, math.inf))
+    
+    def test_verify_text(self):
+        self.assertTrue(verify_text("K", (1e-16, 1e-17), 8, 1e-16)[1])
+        self.assertFalse(verify_text("K", (1e-15, 1e-16), 8, 1e-16)[1])
+        self.assertTrue(verify_text("K", (1.0, 1.0), 8)[1])
+        text, passed = verify_text("K", (math.inf, math.inf), 8)
+        self.assertFalse(passed)
+        self.assertIn("NaN", text)
+    
+    def verify(self, prog, expected, precision="f64"):
+        x = random_vectors(2, 256, seed=3)
+        with contextlib.redirect_stdout(io.StringIO()):
+            return verify_program("K", prog, precision, {"x": x}, lambda arrays: arrays["y"], expected(x), 256)
+    
+    def test_passed(self):
+        self.assertTrue(self.verify(build_butterfly(), butterfly_reference))
+        self.assertTrue(self.verify(build_butterfly(), butterfly_reference, "f32"))
+    
+    def test_failed(self):
+        def wrong(x):
+            return numpy.array([x[0] + 0.5 * x[1], x[0] + 0.5 * x[1]])
+        self.assertFalse(self.verify(build_butterfly(), wrong))
+    
+    def test_uninitialized(self):
+        #  The program loads the scratch buffer before storing it.
+        prog = Program()
+        a = prog.tmp()
+        b = prog.tmp()
+        prog.load(a, "z", 0)
+        prog.store("y", 0, a)
+        prog.load(b, "x", 1)
+        prog.store("y", 1, b)
+        prog.store("z", 0, b)
+        self.assertFalse(self.verify(prog, lambda x: numpy.array([x[1], x[1]])))
+    
+    def test_call(self):
+        prog = build_butterfly()
+        prog.call("Base(x, y);")
+        self.assertTrue(self.verify(prog, butterfly_reference))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,278 @@
+#
+#  Copyright 2021 - 2023 XiaoJSoft Studio. All rights reserved.
+#  Use of this source code is governed by a BSD-style license that can be
+#  found in the LICENSE.md file.
+#
+
+#
+#  Unit tests of the optimization passes (on hand-built programs).
+#
+#  Usage:
+#    python3 -m unittest discover dev/kernel-ir
+#
+#  Note(s):
+#    [1] Each test converts the program to SSA form (see pass_ssa()) before
+#        running a pass, like the pass manager does.
+#
+
+import unittest
+
+from ir import Program, OP_MOV, OP_ADD, OP_SUB, OP_MUL, OP_NEG, OP_LOAD, OP_STORE
+from passes import pass_ssa, pass_copy_prop, pass_const_fold, pass_const_reassoc, pass_cse, pass_dce
+from passes import PassManager, register_pass
+
+
+def live_kinds(prog):
+    #  Get the kinds of all live operations (in program order).
+    return [opc["op"] for opc in prog.live_ops()]
+
+
+class TestConstFold(unittest.TestCase):
+    def test_const_operands(self):
+        prog = Program()
+        a = prog.tmp()
+        b = prog.tmp()
+        c = prog.tmp()
+        add = prog.add(a, 2, 3)
+        mul = prog.mul(b, 1.5, 4)
+        neg = prog.neg(c, 7)
+        pass_ssa(prog)
+        self.assertTrue(pass_const_fold(prog))
+        self.assertEqual((add["op"], add["in"]), (OP_MOV, [5]))
+        self.assertEqual((mul["op"], mul["in"]), (OP_MOV, [6.0]))
+        self.assertEqual((neg["op"], neg["in"]), (OP_MOV, [-7]))
+    
+    def test_identities(self):
+        prog = Program()
+        x = prog.tmp()
+        prog.load(x, "x", 0)
+        ops = [
+            prog.mul(prog.tmp(), x, 0),
+            prog.mul(prog.tmp(), 1, x),
+            prog.mul(prog.tmp(), x, -1),
+            prog.add(prog.tmp(), 0, x),
+            prog.sub(prog.tmp(), x, 0),
+            prog.sub(prog.tmp(), 0, x),
+            prog.sub(prog.tmp(), x, x)
+        ]
+        pass_ssa(prog)
+        x = ops[0]["in"][0]
+        self.assertTrue(pass_const_fold(prog))
+        self.assertEqual([(opc["op"], opc["in"]) for opc in ops], [
+            (OP_MOV, [0]),
+            (OP_MOV, [x]),
+            (OP_NEG, [x]),
+            (OP_MOV, [x]),
+            (OP_MOV, [x]),
+            (OP_NEG, [x]),
+            (OP_MOV, [0])
+        ])
+    
+    def test_negations(self):
+        prog = Program()
+        x = prog.tmp()
+        y = prog.tmp()
+        ny = prog.tmp()
+        prog.load(x, "x", 0)
+        prog.load(y, "x", 1)
+        prog.neg(ny, y)
+        add = prog.add(prog.tmp(), x, ny)
+        sub = prog.sub(prog.tmp(), x, ny)
+        mul = prog.mul(prog.tmp(), 3, ny)
+        nn = prog.neg(prog.tmp(), ny)
+        pass_ssa(prog)
+        x, y = add["in"][0], prog.ops[2]["in"][0]
+        self.assertTrue(pass_const_fold(prog))
+        self.assertEqual((add["op"], add["in"]), (OP_SUB, [x, y]))
+        self.assertEqual((sub["op"], sub["in"]), (OP_ADD, [x, y]))
+        self.assertEqual((mul["op"], mul["in"]), (OP_MUL, [-3, y]))
+        self.assertEqual((nn["op"], nn["in"]), (OP_MOV, [y]))
+    
+    def test_unchanged(self):
+        prog = Program()
+        x = prog.tmp()
+        y = prog.tmp()
+        prog.load(x, "x", 0)
+        prog.mul(y, x, 0.5)
+        prog.store("y", 0, y)
+        pass_ssa(prog)
+        self.assertFalse(pass_const_fold(prog))
+    
+    def test_reassoc(self):
+        prog = Program()
+        x = prog.tmp()
+        y = prog.tmp()
+        z = prog.tmp()
+        prog.load(x, "x", 0)
+        prog.mul(y, x, 2)
+        outer = prog.mul(z, 3, y)
+        pass_ssa(prog)
+        self.assertTrue(pass_const_reassoc(prog))
+        self.assertEqual((outer["op"], outer["in"]), (OP_MUL, [6, prog.ops[0]["out"][0]]))
+
+
+class TestCopyProp(unittest.TestCase):
+    def test_chain(self):
+        prog = Program()
+        x = prog.tmp()
+        y = prog.tmp()
+        z = prog.tmp()
+        prog.load(x, "x", 0)
+        prog.mov(y, x)
+        prog.mov(z, y)
+        store = prog.store("y", 0, z)
+        pass_ssa(prog)
+        self.assertTrue(pass_copy_prop(prog))
+        self.assertEqual(store["in"], prog.ops[0]["out"])
+        self.assertEqual(live_kinds(prog), [OP_LOAD, OP_STORE])
+
+
+class TestCSE(unittest.TestCase):
+    def test_commutative(self):
+        prog = Program()
+        x = prog.tmp()
+        y = prog.tmp()
+        prog.load(x, "x", 0)
+        prog.load(y, "x", 1)
+        first = prog.add(prog.tmp(), x, y)
+        second = prog.add(prog.tmp(), y, x)
+        diff1 = prog.sub(prog.tmp(), x, y)
+        diff2 = prog.sub(prog.tmp(), y, x)
+        pass_ssa(prog)
+        self.assertTrue(pass_cse(prog))
+        self.assertEqual((second["op"], second["in"]), (OP_MOV, first["out"]))
+        self.assertEqual(diff1["op"], OP_SUB)
+        self.assertEqual(diff2["op"], OP_SUB)
+    
+    def test_loads(self):
+        prog = Program()
+        first = prog.load(prog.tmp(), "x", 0)
+        second = prog.load(prog.tmp(), "x", 0)
+        pass_ssa(prog)
+        self.assertTrue(pass_cse(prog))
+        self.assertEqual((second["op"], second["in"]), (OP_MOV, first["out"]))
+    
+    def test_store_invalidates(self):
+        #  Arrays may alias, a store to any array invalidates the loaded values
+        #  with the same index.
+        prog = Program()
+        x = prog.tmp()
+        prog.load(x, "x", 0)
+        prog.store("y", 0, x)
+        second = prog.load(prog.tmp(), "x", 0)
+        other = prog.load(prog.tmp(), "x", 1)
+        pass_ssa(prog)
+        self.assertFalse(pass_cse(prog))
+        self.assertEqual(second["op"], OP_LOAD)
+        self.assertEqual(other["op"], OP_LOAD)
+    
+    def test_call_invalidates(self):
+        prog = Program()
+        prog.load(prog.tmp(), "x", 0)
+        prog.call("Base(x, y);")
+        second = prog.load(prog.tmp(), "x", 0)
+        pass_ssa(prog)
+        self.assertFalse(pass_cse(prog))
+        self.assertEqual(second["op"], OP_LOAD)
+
+
+class TestDCE(unittest.TestCase):
+    def test_unused(self):
+        prog = Program()
+        x = prog.tmp()
+        y = prog.tmp()
+        z = prog.tmp()
+        prog.load(x, "x", 0)
+        prog.mul(y, x, 2)
+        prog.add(z, y, x)
+        prog.store("y", 0, y)
+        pass_ssa(prog)
+        self.assertTrue(pass_dce(prog))
+        self.assertEqual(live_kinds(prog), [OP_LOAD, OP_MUL, OP_STORE])
+        self.assertEqual(prog.count_arith(), {"add": 0, "mul": 1, "neg": 0})
+        self.assertFalse(pass_dce(prog))
+    
+    def test_dead_store(self):
+        prog = Program()
+        x = prog.tmp()
+        y = prog.tmp()
+        prog.load(x, "x", 0)
+        prog.neg(y, x)
+        first = prog.store("y", 0, y)
+        prog.store("y", 0, x)
+        pass_ssa(prog)
+        self.assertTrue(pass_dce(prog))
+        self.assertTrue(first["nop"])
+        self.assertEqual(live_kinds(prog), [OP_LOAD, OP_STORE])
+        self.assertEqual(prog.count_memory(), {"load": 1, "store": 1})
+    
+    def test_store_before_load(self):
+        #  The store is read by a later load, so it is not dead.
+        prog = Program()
+        x = prog.tmp()
+        prog.load(x, "x", 0)
+        prog.store("y", 0, x)
+        prog.load(prog.tmp(), "y", 0)
+        prog.store("y", 0, 1.0)
+        pass_ssa(prog)
+        pass_dce(prog)
+        self.assertEqual(prog.count_memory(), {"load": 1, "store": 2})
+    
+    def test_call_costs(self):
+        #  The costs of a call are counted, and the call is never eliminated.
+        prog = Program()
+        x = prog.tmp()
+        prog.load(x, "x", 0)
+        prog.call("F(x, y);", arith={"add": 4}, memory={"load": 8, "store": 6})
+        prog.store("y", 0, x)
+        pass_ssa(prog)
+        pass_dce(prog)
+        self.assertEqual(prog.count_arith(), {"add": 4, "mul": 0, "neg": 0})
+        self.assertEqual(prog.count_memory(), {"load": 9, "store": 7})
+
+
+class TestPassManager(unittest.TestCase):
+    def test_pipeline(self):
+        #  y[0] = (x[0] * 1 + 0) * x[1] + x[1] * x[0], y[1] = x[0] * 0.
+        prog = Program()
+        x0 = prog.tmp()
+        x1 = prog.tmp()
+        a = prog.tmp()
+        b = prog.tmp()
+        c = prog.tmp()
+        d = prog.tmp()
+        e = prog.tmp()
+        f = prog.tmp()
+        prog.load(x0, "x", 0)
+        prog.load(x1, "x", 1)
+        prog.mul(a, x0, 1)
+        prog.add(b, a, 0)
+        prog.mul(c, b, x1)
+        prog.mul(d, x1, x0)
+        prog.add(e, c, d)
+        prog.store("y", 0, e)
+        prog.mul(f, x0, 0)
+        prog.store("y", 1, f)
+        PassManager().run(prog)
+        self.assertEqual(live_kinds(prog), [OP_LOAD, OP_LOAD, OP_MUL, OP_ADD, OP_STORE, OP_STORE])
+        self.assertEqual(prog.count_arith(), {"add": 1, "mul": 1, "neg": 0})
+        stores = [opc for opc in prog.live_ops() if opc["op"] == OP_STORE]
+        self.assertEqual(stores[1]["in"], [0])
+    
+    def test_unknown_pass(self):
+        with self.assertRaises(Exception):
+            PassManager(["no-such-pass"])
+    
+    def test_register_twice(self):
+        with self.assertRaises(Exception):
+            register_pass("dce", pass_dce)
+    
+    def test_use_before_assignment(self):
+        prog = Program()
+        prog.store("y", 0, "v0")
+        with self.assertRaises(Exception):
+            pass_ssa(prog)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,256 @@
+#
+#  Copyright 2021 - 2023 XiaoJSoft Studio. All rights reserved.
+#  Use of this source code is governed by a BSD-style license that can be
+#  found in the LICENSE.md file.
+#
+
+#
+#  WebAssembly backend for the kernel IR.
+#
+#  Note(s):
+#    [1] The backend writes the binary format directly (no external toolchain
+#        is needed), each kernel is lowered to one exported function that
+#        takes a byte offset (i32) and returns nothing.
+#    [2] All arrays of a kernel live in the (exported) linear memory of the
+#        module, element i of an array placed at slot s is stored at byte
+#        offset (o + (s + i) * W), where o is the byte offset passed to the
+#        function and W is the slot width (8 bytes for scalar kernels, 16
+#        bytes for SIMD kernels).
+#    [3] A SIMD kernel (lanes = 2) runs the same operations on two independent
+#        data sets at once with f64x2 instructions, the k-th lane of a slot
+#        belongs to the k-th data set. The arithmetic is the same as the
+#        scalar kernel (lane by lane), so both kernels produce bit-identical
+#        outputs.
+#    [4] Base operation calls (OP_CALL) are not supported.
+#    [5] The modules of a kernel file are placed in a separate JavaScript
+#        module (see module_path()), so that the (large) base64 text is only
+#        parsed when a WebAssembly kernel is actually instantiated.
+#
+
+import os
+import struct
+import base64
+
+from ir import OP_MOV, OP_ADD, OP_SUB, OP_MUL, OP_NEG, OP_LOAD, OP_STORE, OP_CALL
+from ir import is_const
+
+#  Binary format settings.
+WASM_MAGIC = b"\x00asm"
+WASM_VERSION = b"\x01\x00\x00\x00"
+WASM_PAGE_SIZE = 65536
+
+#  Section IDs.
+SECTION_TYPE = 1
+SECTION_FUNCTION = 3
+SECTION_MEMORY = 5
+SECTION_EXPORT = 7
+SECTION_CODE = 10
+
+#  Value types.
+TYPE_I32 = 0x7F
+TYPE_F64 = 0x7C
+TYPE_V128 = 0x7B
+TYPE_FUNC = 0x60
+
+#  Export kinds.
+EXPORT_FUNC = 0x00
+EXPORT_MEMORY = 0x02
+
+#  Instructions.
+INSN_END = b"\x0b"
+INSN_LOCAL_GET = b"\x20"
+INSN_LOCAL_SET = b"\x21"
+INSN_F64_LOAD = b"\x2b"
+INSN_F64_STORE = b"\x39"
+INSN_F64_CONST = b"\x44"
+INSN_F64_NEG = b"\x9a"
+INSN_F64_ADD = b"\xa0"
+INSN_F64_SUB = b"\xa1"
+INSN_F64_MUL = b"\xa2"
+
+#  SIMD instructions (prefix 0xFD followed by the opcode in LEB128).
+INSN_V128_LOAD = b"\xfd\x00"
+INSN_V128_STORE = b"\xfd\x0b"
+INSN_V128_CONST = b"\xfd\x0c"
+INSN_F64X2_NEG = b"\xfd\xed\x01"
+INSN_F64X2_ADD = b"\xfd\xf0\x01"
+INSN_F64X2_SUB = b"\xfd\xf1\x01"
+INSN_F64X2_MUL = b"\xfd\xf2\x01"
+
+#  Instructions of each lane count:
+#    lanes => (value type, load, store, neg, add, sub, mul, alignment (log2))
+LANE_INSNS = {
+    1: (TYPE_F64, INSN_F64_LOAD, INSN_F64_STORE, INSN_F64_NEG, INSN_F64_ADD, INSN_F64_SUB, INSN_F64_MUL, 3),
+    2: (TYPE_V128, INSN_V128_LOAD, INSN_V128_STORE, INSN_F64X2_NEG, INSN_F64X2_ADD, INSN_F64X2_SUB, INSN_F64X2_MUL, 4)
+}
+
+
+def uleb(value):
+    #  Encode an unsigned integer in LEB128.
+    out = bytearray()
+    while True:
+        byte = value & 0x7F
+        value >>= 7
+        if value != 0:
+            out.append(byte | 0x80)
+        else:
+            out.append(byte)
+            return bytes(out)
+
+
+def vec(items):
+    #  Encode a vector (the item count and the concatenated items).
+    return uleb(len(items)) + b"".join(items)
+
+
+def name(text):
+    #  Encode a name (UTF-8).
+    raw = text.encode("utf-8")
+    return uleb(len(raw)) + raw
+
+
+def section(section_id, payload):
+    return bytes([section_id]) + uleb(len(payload)) + payload
+
+
+def slot_width(lanes):
+    #  Get the slot width (in bytes) of a kernel.
+    return 8 * lanes
+
+
+def lower_program(prog, arrays, lanes=1):
+    #  Lower the program to the body of a function that takes the byte offset
+    #  as parameter 0, each array is placed at the slot given by `arrays`
+    #  (array name => slot).
+    #
+    #  Note(s):
+    #    [1] The operations are emitted in program order, each variable is
+    #        mapped to one local (the engine does register allocation).
+    #    [2] Constants used more than once are pooled, each one is stored to
+    #        its own local once at the entry of the function (a local.get is
+    #        much shorter than a f64.const or v128.const instruction).
+    if lanes not in LANE_INSNS:
+        raise Exception("Unsupported lane count %d." % lanes)
+    value_type, insn_load, insn_store, insn_neg, insn_add, insn_sub, insn_mul, align = LANE_INSNS[lanes]
+    width = slot_width(lanes)
+    local_ids = {}
+    
+    def local_of(var_name):
+        if var_name not in local_ids:
+            local_ids[var_name] = len(local_ids) + 1
+        return uleb(local_ids[var_name])
+    
+    def push_const(raw):
+        if lanes == 1:
+            return INSN_F64_CONST + raw
+        return INSN_V128_CONST + raw * lanes
+    
+    def push(operand):
+        if is_const(operand):
+            raw = struct.pack("<d", float(operand))
+            if raw in pool:
+                return INSN_LOCAL_GET + local_of(pool[raw])
+            return push_const(raw)
+        return INSN_LOCAL_GET + local_of(operand)
+    
+    def memarg(arr, idx):
+        if arr not in arrays:
+            raise Exception("Array \"%s\" is not placed." % arr)
+        return uleb(align) + uleb((arrays[arr] + idx) * width)
+    
+    #  Build the constant pool (raw value => pseudo variable name).
+    uses = {}
+    for opc in prog.live_ops():
+        for operand in opc["in"]:
+            if is_const(operand):
+                raw = struct.pack("<d", float(operand))
+                uses[raw] = uses.get(raw, 0) + 1
+    pool = {}
+    for raw in uses:
+        if uses[raw] >= 2:
+            pool[raw] = "$const%d" % len(pool)
+    
+    code = bytearray()
+    for raw in pool:
+        code += push_const(raw) + INSN_LOCAL_SET + local_of(pool[raw])
+    for opc in prog.live_ops():
+        kind = opc["op"]
+        if kind == OP_MOV:
+            code += push(opc["in"][0])
+        elif kind == OP_ADD:
+            code += push(opc["in"][0]) + push(opc["in"][1]) + insn_add
+        elif kind == OP_SUB:
+            code += push(opc["in"][0]) + push(opc["in"][1]) + insn_sub
+        elif kind == OP_MUL:
+            code += push(opc["in"][0]) + push(opc["in"][1]) + insn_mul
+        elif kind == OP_NEG:
+            code += push(opc["in"][0]) + insn_neg
+        elif kind == OP_LOAD:
+            code += INSN_LOCAL_GET + uleb(0) + insn_load + memarg(opc["arr"], opc["idx"])
+        elif kind == OP_STORE:
+            code += INSN_LOCAL_GET + uleb(0) + push(opc["in"][0]) + insn_store + memarg(opc["arr"], opc["idx"])
+            continue
+        elif kind == OP_CALL:
+            raise Exception("Base operation call is not supported by the WebAssembly backend.")
+        else:
+            raise Exception("Unknown operation.")
+        code += INSN_LOCAL_SET + local_of(opc["out"][0])
+    code += INSN_END
+    
+    locals_decl = []
+    if len(local_ids) != 0:
+        locals_decl.append(uleb(len(local_ids)) + bytes([value_type]))
+    return vec(locals_decl) + bytes(code)
+
+
+def build_module(functions, memory_size):
+    #  Build a module that contains the lowered functions (export name =>
+    #  function body) and an exported memory ("memory") of at least
+    #  `memory_size` bytes.
+    names = list(functions.keys())
+    func_type = bytes([TYPE_FUNC]) + vec([bytes([TYPE_I32])]) + vec([])
+    pages = max(1, (memory_size + WASM_PAGE_SIZE - 1) // WASM_PAGE_SIZE)
+    exports = [name("memory") + bytes([EXPORT_MEMORY]) + uleb(0)]
+    for func_id in range(0, len(names)):
+        exports.append(name(names[func_id]) + bytes([EXPORT_FUNC]) + uleb(func_id))
+    bodies = [uleb(len(functions[func_name])) + functions[func_name] for func_name in names]
+    return (
+        WASM_MAGIC + WASM_VERSION +
+        section(SECTION_TYPE, vec([func_type])) +
+        section(SECTION_FUNCTION, vec([uleb(0) for _ in names])) +
+        section(SECTION_MEMORY, vec([b"\x00" + uleb(pages)])) +
+        section(SECTION_EXPORT, vec(exports)) +
+        section(SECTION_CODE, vec(bodies))
+    )
+
+
+def module_base64(module):
+    return base64.b64encode(module).decode("ascii")
+
+
+def render_module_js(const_name, module, width=72):
+    #  Render a JavaScript constant declaration that contains the module (in
+    #  base64), the text is split into string literals of `width` characters.
+    text = module_base64(module)
+    chunks = ["    \"%s\"" % text[i:i + width] for i in range(0, len(text), width)]
+    return ["const %s = [" % const_name] + [chunk + "," for chunk in chunks[:-1]] + chunks[-1:] + ["].join(\"\");"]
+
+
+def module_path(outfile_path):
+    #  Get the path of the JavaScript module that contains the WebAssembly
+    #  modules of an output file (e.g. "fft-mx-480-wasm.js" of
+    #  "fft-mx-480.js").
+    return os.path.splitext(outfile_path)[0] + "-wasm.js"
+
+
+def render_module_file(hdr, comments, modules):
+    #  Render a JavaScript module that exports WebAssembly modules (a list of
+    #  (constant name, module)), `comments` are the comment lines put before
+    #  the constants.
+    lines = [hdr, "", "//", "//  Constants.", "//", ""] + comments
+    for const_name, module in modules:
+        lines += render_module_js(const_name, module)
+    lines += ["", "//  Export public APIs.", "module.exports = {"]
+    lines.append(",\n".join(["    \"%s\": %s" % (const_name, const_name) for const_name, _ in modules]))
+    lines.append("};")
+    return "\n".join(lines)
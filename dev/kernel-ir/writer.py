@@ -0,0 +1,51 @@
+#
+#  Copyright 2021 - 2023 XiaoJSoft Studio. All rights reserved.
+#  Use of this source code is governed by a BSD-style license that can be
+#  found in the LICENSE.md file.
+#
+
+#
+#  Source writer of the code generators.
+#
+#  Note(s):
+#    [1] The generated source is kept as a list of text chunks (instead of
+#        one string extended by "+="), so that generating large kernels
+#        (with hundreds of thousands of lines) takes linear time, the chunks
+#        are streamed to the output file by save().
+#    [2] The size of the text is counted in UTF-8 bytes (see the "size"
+#        field).
+#
+
+class SourceWriter:
+    def __init__(self):
+        self.chunks = []
+        self.size = 0
+    
+    def write(self, text):
+        #  Append a text chunk.
+        self.chunks.append(text)
+        self.size += len(text.encode("utf-8"))
+    
+    def write_lines(self, lines, indent=""):
+        #  Append lines (each is indented by `indent` and terminated by a line
+        #  feed).
+        for line in lines:
+            self.write("%s%s\n" % (indent, line))
+    
+    def write_from(self, other):
+        #  Append all chunks of another writer.
+        self.chunks.extend(other.chunks)
+        self.size += other.size
+    
+    def is_empty(self):
+        return self.size == 0
+    
+    def text(self):
+        #  Get the whole text.
+        return "".join(self.chunks)
+    
+    def save(self, path):
+        #  Write all chunks to a file.
+        fp = open(path, "w", encoding="utf-8")
+        fp.writelines(self.chunks)
+        fp.close()
@@ -0,0 +1,655 @@
+#!/usr/bin/env python3
+#
+#  Copyright 2021 - 2023 XiaoJSoft Studio. All rights reserved.
+#  Use of this source code is governed by a BSD-style license that can be
+#  found in the LICENSE.md file.
+#
+
+#
+#  MDCT/IMDCT kernel compiler.
+#
+#  Definitions (N = 2M):
+#    MDCT:  X[k] = SUM(w[n] * x[n] * cos(PI / M * (n + 0.5 + M / 2) * (k + 0.5)))
+#           (0 <= k < M, 0 <= n < N),
+#    IMDCT: y[n] = w[n] * SUM(X[k] * cos(PI / M * (n + 0.5 + M / 2) * (k + 0.5)))
+#           (0 <= n < N, 0 <= k < M),
+#  where w[n] is the window (with all gains applied).
+#
+#  Algorithm:
+#    [1] Both transforms are done by a M-point DCT-IV:
+#          V[k] = SUM(v[n] * cos(PI / M * (n + 0.5) * (k + 0.5))).
+#        The MDCT folds the windowed input (a, b, c, d) (each part has M / 2
+#        points) into v = (-c_r - d, a - b_r) (r means reversed), and the
+#        IMDCT unfolds V into (V2, -V2_r, -V1_r, -V1), where V = (V1, V2).
+#    [2] The DCT-IV is done by a M / 2-point complex DFT:
+#          z[p] = (v[2p] + 1j * v[M - 1 - 2p]) * e ^ (-1j * PI * p / M),
+#          Z = DFT(z),
+#          V[2q] + 1j * (-V[M - 1 - 2q]) = Z[q] * e ^ (-1j * PI * (q + 0.25) / M).
+#    [3] The complex DFT is emitted by the mixed-radix FFT compiler (inline
+#        mode), the fold (or the input loads) and the pre-twiddle factors are
+#        fused into its first loads, the post-twiddle factors and the unfold
+#        (or the output stores) are fused into its last stores, so that the
+#        whole transform is one straight-line kernel.
+#    [4] A window table can also be baked into the kernel (so-called windowed
+#        kernel), the window (with the LD-MDCT gain applied) then becomes
+#        constant and the constant folding pass removes all operations that
+#        only touch zero window samples, the const-reassoc pass merges the
+#        window coefficients into the pre-twiddle factors.
+#    [5] Input-pruned windowed IMDCT kernels can also be generated, the input
+#        spectrum coefficients beyond the nonzero-bin count are then replaced
+#        by constant zeros, the zeros are propagated forward (through the
+#        butterflies of the DFT) by the constant folding pass.
+#
+#  Note(s):
+#    [1] The (unwindowed) MDCT and IMDCT kernels are only generated if no
+#        window table is configured, since the codec only uses the windowed
+#        kernels of the unit sizes that have a window.
+#    [2] Each input-pruned kernel is written to its own module (see
+#        pruned_path()), so that the decoder only loads the kernels of the
+#        nonzero-bin counts that actually occur.
+#
+
+import os
+import re
+import sys
+import math
+import json
+import importlib.util
+
+
+#  File/folder settings.
+BASE_DIR = os.path.dirname(os.path.realpath(__file__))
+HDRFILE_PATH = os.path.join(BASE_DIR, "header.js")
+KIR_DIR = os.path.join(BASE_DIR, "..", "kernel-ir")
+FFTMX_COMPILER_PATH = os.path.join(BASE_DIR, "..", "fft-mx-generator", "compiler.py")
+
+#  Import the kernel IR modules.
+sys.path.insert(0, KIR_DIR)
+from ir import OP_LOAD, OP_STORE, OP_CALL
+from codelets import unit_root
+from passes import PassManager
+from writer import SourceWriter
+from phases import PhaseReport
+from metrics import write_metrics
+from interp import DEFAULT_VECTORS, require_numpy, random_vectors, verify_program
+
+#  Import the mixed-radix FFT compiler.
+_fftmx_spec = importlib.util.spec_from_file_location("fftmx_compiler", FFTMX_COMPILER_PATH)
+fftmx = importlib.util.module_from_spec(_fftmx_spec)
+_fftmx_spec.loader.exec_module(fftmx)
+
+#  JS generation settings.
+IO_SIGNAL = "x"
+IO_WINDOW = "w"
+IO_SPECTRUM = "X"
+IO_OUTPUT = "y"
+
+#  Pass pipeline of windowed kernels.
+WINDOWED_PIPELINE = ["copy-prop", "const-fold", "const-reassoc", "cse", "copy-prop", "dce"]
+
+
+def load_window(path):
+    #  Load a window table (a JS module that exports one number array named
+    #  after the module, e.g. "W10_80" of "w10_80.js"), returns (name,
+    #  coefficients).
+    name = os.path.splitext(os.path.basename(path))[0].upper()
+    fp = open(path, "r", encoding="utf-8")
+    content = fp.read()
+    fp.close()
+    match = re.search(r"const\s+%s\s*=\s*\[([^\]]*)\];" % name, content)
+    if match is None:
+        raise Exception("No window table in \"%s\"." % path)
+    return name, [float(item) for item in match.group(1).split(",")]
+
+
+def pruned_path(outfile_path, window_path, count):
+    #  Get the output file path of an input-pruned kernel (e.g.
+    #  "mdct-480-w10_480-k80.js" of window table "w10_480.js" and nonzero-bin
+    #  count 80).
+    return "%s-%s-k%d.js" % (
+        os.path.splitext(outfile_path)[0],
+        os.path.splitext(os.path.basename(window_path))[0],
+        count
+    )
+
+
+def window_gain(M):
+    #  Get the LD-MDCT gain (sqrt(2 / M)) of both directions.
+    return math.sqrt(2 / M)
+
+
+def emit_window(prog, window, n):
+    #  Emit the n-th window coefficient (a constant if the window is baked).
+    if window is None:
+        sym_w = prog.tmp()
+        prog.load(sym_w, IO_WINDOW, n)
+        return sym_w
+    return window[n]
+
+
+def emit_linear2(prog, a, b, m00, m01, m10, m11):
+    #  Emit (m00 * a + m01 * b, m10 * a + m11 * b), returns the symbols of
+    #  both results.
+    #
+    #  Note(s):
+    #    [1] This is used for complex multiplications with constant (signs of
+    #        the operands are folded into the constants), multiplications by
+    #        zero and +/-1 are eliminated by the constant folding pass.
+    syms = []
+    for c0, c1 in [(m00, m01), (m10, m11)]:
+        t0 = prog.tmp()
+        t1 = prog.tmp()
+        sym = prog.tmp()
+        prog.mul(t0, c0, a)
+        prog.mul(t1, c1, b)
+        prog.add(sym, t0, t1)
+        syms.append(sym)
+    return syms[0], syms[1]
+
+
+def pre_twiddle(M, p):
+    return complex(*unit_root(-p, M))
+
+
+def post_twiddle(M, q):
+    return complex(*unit_root(-(4 * q + 1), 4 * M))
+
+
+def fold_terms(M, m):
+    #  Get the fold of v[m] (see the algorithm notes), returns (sign, terms),
+    #  where v[m] = sign * (terms[0][0] * u[terms[0][1]] + terms[1][0] *
+    #  u[terms[1][1]]) and u[n] = w[n] * x[n].
+    H = M // 2
+    if m < H:
+        return -1, [(1, 3 * H - 1 - m), (1, 3 * H + m)]
+    else:
+        return 1, [(1, m - H), (-1, 3 * H - 1 - m)]
+
+
+def unfold_terms(M, m):
+    #  Get the unfold of V[m] (see the algorithm notes), returns a list of
+    #  (sign, n), where y[n] = w[n] * sign * V[m].
+    H = M // 2
+    if m < H:
+        return [(-1, 3 * H - 1 - m), (-1, m + 3 * H)]
+    else:
+        return [(1, m - H), (-1, 3 * H - 1 - m)]
+
+
+def emit_mdct_input(prog, M, p, window=None):
+    #  Emit the p-th (pre-twiddled) point of the DFT (MDCT).
+    def emit_fold(m):
+        sign, terms = fold_terms(M, m)
+        syms = []
+        for _, n in terms:
+            sym_x = prog.tmp()
+            sym_u = prog.tmp()
+            prog.load(sym_x, IO_SIGNAL, n)
+            prog.mul(sym_u, emit_window(prog, window, n), sym_x)
+            syms.append(sym_u)
+        sym_v = prog.tmp()
+        if terms[1][0] > 0:
+            prog.add(sym_v, syms[0], syms[1])
+        else:
+            prog.sub(sym_v, syms[0], syms[1])
+        return sign, sym_v
+    
+    sign_a, sym_a = emit_fold(2 * p)
+    sign_b, sym_b = emit_fold(M - 1 - 2 * p)
+    tw = pre_twiddle(M, p)
+    return emit_linear2(
+        prog, sym_a, sym_b,
+        sign_a * tw.real, -sign_b * tw.imag,
+        sign_a * tw.imag, sign_b * tw.real
+    )
+
+
+def emit_mdct_output(prog, M, q, sym_re, sym_im):
+    #  Emit the q-th (post-twiddled) output of the DFT (MDCT).
+    tw = post_twiddle(M, q)
+    sym_x1, sym_x2 = emit_linear2(
+        prog, sym_re, sym_im,
+        tw.real, -tw.imag,
+        -tw.imag, -tw.real
+    )
+    prog.store(IO_SPECTRUM, 2 * q, sym_x1)
+    prog.store(IO_SPECTRUM, M - 1 - 2 * q, sym_x2)
+
+
+def emit_spectrum(prog, k, count):
+    #  Emit the k-th input spectrum coefficient (a constant zero if it is not
+    #  within the first `count` coefficients).
+    if count is not None and k >= count:
+        return 0
+    sym_x = prog.tmp()
+    prog.load(sym_x, IO_SPECTRUM, k)
+    return sym_x
+
+
+def emit_imdct_input(prog, M, p, count=None):
+    #  Emit the p-th (pre-twiddled) point of the DFT (IMDCT).
+    sym_a = emit_spectrum(prog, 2 * p, count)
+    sym_b = emit_spectrum(prog, M - 1 - 2 * p, count)
+    tw = pre_twiddle(M, p)
+    return emit_linear2(
+        prog, sym_a, sym_b,
+        tw.real, -tw.imag,
+        tw.imag, tw.real
+    )
+
+
+def emit_imdct_output(prog, M, q, sym_re, sym_im, window=None):
+    #  Emit the q-th (post-twiddled) output of the DFT (IMDCT).
+    tw = post_twiddle(M, q)
+    for m, c0, c1 in [
+        (2 * q, tw.real, -tw.imag),
+        (M - 1 - 2 * q, -tw.imag, -tw.real)
+    ]:
+        #  V[m] = c0 * Z_re + c1 * Z_im (the sign of the first unfolded
+        #  output is folded into the constants).
+        targets = unfold_terms(M, m)
+        sign = targets[0][0]
+        sym_v = prog.tmp()
+        sym_t0 = prog.tmp()
+        sym_t1 = prog.tmp()
+        prog.mul(sym_t0, sign * c0, sym_re)
+        prog.mul(sym_t1, sign * c1, sym_im)
+        prog.add(sym_v, sym_t0, sym_t1)
+        sym_vn = None
+        for target_sign, n in targets:
+            if target_sign == sign:
+                sym_src = sym_v
+            else:
+                if sym_vn is None:
+                    sym_vn = prog.tmp()
+                    prog.neg(sym_vn, sym_v)
+                sym_src = sym_vn
+            sym_y = prog.tmp()
+            prog.mul(sym_y, emit_window(prog, window, n), sym_src)
+            prog.store(IO_OUTPUT, n, sym_y)
+
+
+def rewrite_io(prog, mem_addresses, emit_input, emit_output):
+    #  Replace the first loads of each memory address by emit_input(prog, p)
+    #  (which emits the p-th point of the DFT and returns its symbols), and
+    #  replace the last stores to each memory address by emit_output(prog,
+    #  q, sym_re, sym_im) (which consumes the q-th output of the DFT).
+    #
+    #  Note(s):
+    #    [1] The new operations are placed in the same operation group as the
+    #        replaced loads (stores).
+    N = len(mem_addresses)
+    out_indexes = [None] * N
+    for k in range(0, N):
+        out_indexes[mem_addresses[k]] = k
+    last_store = {}
+    for opc in prog.ops:
+        if opc["op"] == OP_STORE:
+            last_store[(opc["arr"], opc["idx"])] = opc
+        elif opc["op"] == OP_CALL:
+            raise Exception("MDCT kernel can't contain base operation calls.")
+    
+    ops = prog.ops
+    group = prog.group
+    prog.ops = []
+    stored = set()
+    inputs = {}
+    outputs = {}
+    for opc in ops:
+        key = (opc["arr"], opc["idx"])
+        prog.group = opc["group"]
+        if opc["op"] == OP_LOAD and key not in stored:
+            addr = opc["idx"]
+            if addr not in inputs:
+                inputs[addr] = emit_input(prog, addr)
+            sym_re, sym_im = inputs[addr]
+            prog.mov(opc["out"][0], sym_re if opc["arr"] == fftmx.IO_REAL else sym_im)
+        elif opc["op"] == OP_STORE and last_store[key] is opc:
+            addr = opc["idx"]
+            output = outputs.setdefault(addr, {})
+            output[opc["arr"]] = opc["in"][0]
+            if len(output) == 2:
+                emit_output(prog, out_indexes[addr], output[fftmx.IO_REAL], output[fftmx.IO_IMAG])
+        else:
+            if opc["op"] == OP_STORE:
+                stored.add(key)
+            prog.ops.append(opc)
+    prog.group = group
+
+
+def generate_kernel(M, plan, direction, window=None, count=None):
+    #  Generate the MDCT (or IMDCT) program (with `window` baked if it is not
+    #  None, and only the first `count` input spectrum coefficients of the
+    #  IMDCT are nonzero if it is not None).
+    H = M // 2
+    prog, mem_addresses = fftmx.generate_dft(H, "inline", plan)
+    if direction == "forward":
+        rewrite_io(
+            prog,
+            mem_addresses,
+            lambda prog, p: emit_mdct_input(prog, M, p, window),
+            lambda prog, q, sym_re, sym_im: emit_mdct_output(prog, M, q, sym_re, sym_im)
+        )
+    else:
+        rewrite_io(
+            prog,
+            mem_addresses,
+            lambda prog, p: emit_imdct_input(prog, M, p, count),
+            lambda prog, q, sym_re, sym_im: emit_imdct_output(prog, M, q, sym_re, sym_im, window)
+        )
+    return prog
+
+
+def verify_mdct(name, prog, M, direction, window, count, vectors):
+    #  Verify the MDCT (or IMDCT) program numerically (see the interp module)
+    #  against the direct transform matrix (`window` and `count` are the
+    #  same as generate_kernel(), the window is random if it is not baked),
+    #  returns True if passed.
+    np = require_numpy()
+    N = 2 * M
+    n = np.arange(0, N)
+    k = np.arange(0, M)
+    
+    #  T[n][k] = cos(PI / M * (n + 0.5 + M / 2) * (k + 0.5))
+    #          = cos(PI / 4M * ((2n + 1 + M) * (2k + 1) mod 8M))
+    #  (the angle is reduced exactly, so that the reference is accurate).
+    T = np.cos(np.pi / (4 * M) * (np.outer(2 * n + 1 + M, 2 * k + 1) % (8 * M)))
+    inputs = {}
+    if window is None:
+        w = random_vectors(N, vectors, 1)
+        inputs[IO_WINDOW] = w
+    else:
+        w = np.array(window, dtype=np.float64).reshape(N, 1)
+    if direction == "forward":
+        x = random_vectors(N, vectors, 2)
+        inputs[IO_SIGNAL] = x
+        return verify_program(name, prog, "f64", inputs, lambda arrays: arrays[IO_SPECTRUM], T.T @ (w * x), vectors)
+    X = random_vectors(M, vectors, 3)
+    if count is not None:
+        X[count:] = 0.0
+    inputs[IO_SPECTRUM] = X
+    return verify_program(name, prog, "f64", inputs, lambda arrays: arrays[IO_OUTPUT], w * (T @ X), vectors)
+
+
+def generate_source(hdr, kernels, budget):
+    #  Generate the source of an output file that contains `kernels` (see
+    #  main()), returns a source writer.
+    out = SourceWriter()
+    out.write(hdr + "\n\n")
+    
+    #  Generate all kernel functions.
+    private = SourceWriter()
+    public = SourceWriter()
+    for func_name, prog, params, comments in kernels:
+        part_private, part_public = fftmx.generate_function(
+            func_name,
+            params,
+            comments,
+            fftmx.split_parts(prog, budget=budget),
+            prog=prog
+        )
+        private.write_from(part_private)
+        public.write_from(part_public)
+    if not private.is_empty():
+        out.write("//\n")
+        out.write("//  Private functions.\n")
+        out.write("//\n")
+        out.write("\n")
+        out.write_from(private)
+    out.write("//\n")
+    out.write("//  Public functions.\n")
+    out.write("//\n")
+    out.write("\n")
+    out.write_from(public)
+    
+    #  Generate module ending.
+    out.write("//  Export public APIs.\n")
+    out.write("module.exports = {\n")
+    out.write(",\n".join(["    \"%s\": %s" % (kernel[0], kernel[0]) for kernel in kernels]) + "\n")
+    out.write("};")
+    return out
+
+
+def main():
+    #
+    #  Phase 1: Load and prepare.
+    #
+    
+    report = PhaseReport()
+    report.begin("load")
+    
+    #  Parse the command-line arguments.
+    args = sys.argv[1:]
+    verify = ("--verify" in args)
+    if verify:
+        args.remove("--verify")
+    if len(args) != 1:
+        print("./compiler.py [config] [--verify]")
+        sys.exit(1)
+    cfgfile_path = args[0]
+    
+    #  Read the header file.
+    fp = open(HDRFILE_PATH, "r", encoding="utf-8")
+    hdr = fp.read().rstrip()
+    fp.close()
+    
+    #  Read the configuration file.
+    fp = open(cfgfile_path, "r", encoding="utf-8")
+    config = json.loads(fp.read())
+    fp.close()
+    
+    #  Get and check the M.
+    M = config["M"]
+    if not (isinstance(M, int) and M >= 4 and M % 2 == 0):
+        raise Exception("Illegal unit size (shall be an even number, at least 4).")
+    N = 2 * M
+    H = M // 2
+    
+    #  Get the output file path.
+    outfile_path = os.path.join(BASE_DIR, config["output"])
+    
+    #  Get the factorization plan (of the M / 2-point DFT).
+    plan_mode = config.get("plan", "fixed")
+    if plan_mode not in fftmx.PLANS:
+        raise Exception("Unknown plan \"%s\"." % plan_mode)
+    plan_pfa = config.get("pfa", False)
+    
+    #  Get the function size budget.
+    budget = fftmx.select_budget(config)
+    
+    #
+    #  Phase 2: MDCT and IMDCT.
+    #
+    
+    #  Plan the M / 2-point DFT.
+    report.begin("plan")
+    if plan_mode == "auto":
+        plan, plan_cost = fftmx.plan_auto(H, "inline", plan_pfa)
+        print("Plan: %s (flop=%d, memory=%d, twiddle=%d, spill=%d, score=%.1f)." % (
+            fftmx.plan_text(plan),
+            plan_cost["flop"],
+            plan_cost["memory"],
+            plan_cost["twiddle"],
+            plan_cost["spill"],
+            fftmx.cost_score(plan_cost)
+        ))
+    else:
+        plan = fftmx.plan_fixed(H, plan_pfa)
+        print("Plan: %s." % fftmx.plan_text(plan))
+    
+    #  Load the window tables (to be baked into windowed kernels)
+    #  (with the nonzero-bin counts of their input-pruned IMDCT kernels).
+    windows = []
+    for window_config in config.get("windows", []):
+        window_path = os.path.join(BASE_DIR, window_config["table"])
+        window_name, window = load_window(window_path)
+        if len(window) != N:
+            raise Exception("Window \"%s\" is not of %d points." % (window_name, N))
+        pruned = sorted(set(window_config.get("pruned", [])))
+        for count in pruned:
+            if not (isinstance(count, int) and count > 0 and count < M):
+                raise Exception("Illegal nonzero-bin count %s." % repr(count))
+        windows.append((window_name, window_path, window, pruned))
+    
+    #  Generate MDCT and IMDCT (or their windowed variants), each kernel is
+    #  described by (function name, program, parameters, comments), the
+    #  reference of each kernel (used by the verification) is described by
+    #  (direction, baked window, nonzero-bin count), the kernels of each
+    #  output file are described by (file path, kernels).
+    report.begin("generate")
+    kernels = []
+    references = {}
+    outputs = [(outfile_path, kernels)]
+    params_scratch = [
+        (fftmx.IO_REAL, "The scratch buffer (real part, %d points)." % H),
+        (fftmx.IO_IMAG, "The scratch buffer (imaginary part, %d points)." % H)
+    ]
+    if len(windows) == 0:
+        prog = generate_kernel(M, plan, "forward")
+        PassManager(config.get("passes")).run(prog)
+        references["ApplyMDCT_%d" % M] = ("forward", None, None)
+        kernels.append((
+            "ApplyMDCT_%d" % M,
+            prog,
+            [
+                (IO_SIGNAL, "The input block (%d points)." % N),
+                (IO_WINDOW, "The window sequence (%d points, with gain applied)." % N),
+                (IO_SPECTRUM, "The array that would contain the output block (%d points)." % M)
+            ] + params_scratch,
+            [
+                "Apply MDCT transform (prebuilt for unit size %d)." % M,
+                "",
+                "Note(s):",
+                "  [1] X[k] = SUM(w[n] * x[n] * cos(PI / %d * (n + %s) * (k + 0.5)))." % (M, repr(0.5 + H)),
+                "  [2] The size of all arrays will not be checked."
+            ]
+        ))
+        prog = generate_kernel(M, plan, "inverse")
+        PassManager(config.get("passes")).run(prog)
+        references["ApplyIMDCT_%d" % M] = ("inverse", None, None)
+        kernels.append((
+            "ApplyIMDCT_%d" % M,
+            prog,
+            [
+                (IO_SPECTRUM, "The input block (%d points)." % M),
+                (IO_WINDOW, "The window sequence (%d points, with gain applied)." % N),
+                (IO_OUTPUT, "The array that would contain the output block (%d points)." % N)
+            ] + params_scratch,
+            [
+                "Apply IMDCT transform (prebuilt for unit size %d)." % M,
+                "",
+                "Note(s):",
+                "  [1] y[n] = w[n] * SUM(X[k] * cos(PI / %d * (n + %s) * (k + 0.5)))." % (M, repr(0.5 + H)),
+                "  [2] The size of all arrays will not be checked."
+            ]
+        ))
+    gain = window_gain(M)
+    for window_name, window_path, window, pruned in windows:
+        window_forward = [gain * window[n] for n in range(0, N)]
+        prog = generate_kernel(M, plan, "forward", window_forward)
+        PassManager(config.get("passes", WINDOWED_PIPELINE)).run(prog)
+        references["ApplyWindowedMDCT_%s" % window_name] = ("forward", window_forward, None)
+        kernels.append((
+            "ApplyWindowedMDCT_%s" % window_name,
+            prog,
+            [
+                (IO_SIGNAL, "The input block (%d points)." % N),
+                (IO_SPECTRUM, "The array that would contain the output block (%d points)." % M)
+            ] + params_scratch,
+            [
+                "Apply LD-MDCT transform (prebuilt for window %s)." % window_name,
+                "",
+                "Note(s):",
+                "  [1] X[k] = SUM(w[n] * x[n] * cos(PI / %d * (n + %s) * (k + 0.5))), where" % (M, repr(0.5 + H)),
+                "      w[n] = sqrt(2 / %d) * %s[n]." % (M, window_name),
+                "  [2] The size of all arrays will not be checked."
+            ]
+        ))
+        window_inverse = [gain * window[N - 1 - n] for n in range(0, N)]
+        prog = generate_kernel(M, plan, "inverse", window_inverse)
+        PassManager(config.get("passes", WINDOWED_PIPELINE)).run(prog)
+        references["ApplyWindowedIMDCT_%s" % window_name] = ("inverse", window_inverse, None)
+        kernels.append((
+            "ApplyWindowedIMDCT_%s" % window_name,
+            prog,
+            [
+                (IO_SPECTRUM, "The input block (%d points)." % M),
+                (IO_OUTPUT, "The array that would contain the output block (%d points)." % N)
+            ] + params_scratch,
+            [
+                "Apply LD-IMDCT transform (prebuilt for window %s)." % window_name,
+                "",
+                "Note(s):",
+                "  [1] y[n] = w[n] * SUM(X[k] * cos(PI / %d * (n + %s) * (k + 0.5))), where" % (M, repr(0.5 + H)),
+                "      w[n] = sqrt(2 / %d) * %s[%d - n]." % (M, window_name, N - 1),
+                "  [2] The size of all arrays will not be checked."
+            ]
+        ))
+        for count in pruned:
+            prog = generate_kernel(M, plan, "inverse", window_inverse, count)
+            PassManager(config.get("passes", WINDOWED_PIPELINE)).run(prog)
+            references["ApplyWindowedIMDCT_%s_K%d" % (window_name, count)] = ("inverse", window_inverse, count)
+            outputs.append((pruned_path(outfile_path, window_path, count), [(
+                "ApplyWindowedIMDCT_%s_K%d" % (window_name, count),
+                prog,
+                [
+                    (IO_SPECTRUM, "The input block (%d points, only the first %d points are used)." % (M, count)),
+                    (IO_OUTPUT, "The array that would contain the output block (%d points)." % N)
+                ] + params_scratch,
+                [
+                    "Apply LD-IMDCT transform (prebuilt for window %s, input pruned)." % window_name,
+                    "",
+                    "Note(s):",
+                    "  [1] y[n] = w[n] * SUM(X[k] * cos(PI / %d * (n + %s) * (k + 0.5))), where" % (M, repr(0.5 + H)),
+                    "      w[n] = sqrt(2 / %d) * %s[%d - n]." % (M, window_name, N - 1),
+                    "  [2] X[k] shall be zero for all k >= %d (not checked)." % count,
+                    "  [3] The size of all arrays will not be checked."
+                ]
+            )]))
+    
+    #
+    #  Phase 3: Code generation.
+    #
+    
+    #  Generate the source of each output file.
+    report.begin("codegen")
+    sources = []
+    for output_path, output_kernels in outputs:
+        sources.append(generate_source(hdr, output_kernels, budget))
+    
+    #  Verify all kernels numerically.
+    if verify:
+        report.begin("verify")
+        failures = 0
+        for _, output_kernels in outputs:
+            for func_name, prog, _, _ in output_kernels:
+                direction, window, count = references[func_name]
+                if not verify_mdct(func_name, prog, M, direction, window, count, DEFAULT_VECTORS):
+                    failures += 1
+        if failures != 0:
+            raise Exception("Numerical verification failed.")
+    
+    #  Write output files.
+    report.begin("write")
+    for (output_path, output_kernels), out in zip(outputs, sources):
+        out.save(output_path)
+        write_metrics(output_path, dict([(kernel[0], fftmx.OUT_METRICS[kernel[0]]) for kernel in output_kernels]))
+    report.end()
+    
+    for _, output_kernels in outputs:
+        for func_name, prog, _, _ in output_kernels:
+            arith = prog.count_arith()
+            memory = prog.count_memory()
+            print("%s: Mul/Add=%d/%d, Load/Store=%d/%d." % (
+                func_name,
+                arith["mul"],
+                arith["add"],
+                memory["load"],
+                memory["store"]
+            ))
+    report.print()
+    print("OK!")
+
+
+if __name__ == "__main__":
+    main()
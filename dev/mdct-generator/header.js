@@ -0,0 +1,12 @@
+//
+//  Copyright 2021 - 2023 XiaoJSoft Studio. All rights reserved.
+//  Use of this source code is governed by a BSD-style license that can be
+//  found in the LICENSE.md file.
+//
+
+//
+//  Note(s):
+//    [1] This file is generated automatically by a MDCT compiler, which locates 
+//        at "./../../dev/mdct-generator/" directory.
+//        Do NOT modify this file manually.
+//
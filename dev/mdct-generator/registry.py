@@ -0,0 +1,327 @@
+#!/usr/bin/env python3
+#
+#  Copyright 2021 - 2023 XiaoJSoft Studio. All rights reserved.
+#  Use of this source code is governed by a BSD-style license that can be
+#  found in the LICENSE.md file.
+#
+
+#
+#  Prebuilt MDCT kernel registry generator.
+#
+#  Note(s):
+#    [1] This script scans all configuration files (config-*.json) and
+#        generates a module that maps each unit size to its prebuilt kernels,
+#        so that a newly configured unit size is picked up by the MDCT module
+#        without any manual change.
+#    [2] Windowed kernels (see the compiler) are registered by their window
+#        tables, so that the LD-MDCT modules can look them up by the window
+#        table they use.
+#    [3] Each kernel module is loaded (by require()) on the first lookup of
+#        its kernels (instead of when the registry is loaded), so that only
+#        the kernels in use are parsed and compiled. The require() paths are
+#        static, so the browser bundle still resolves them.
+#    [4] The unwindowed kernels are only registered for the unit sizes that
+#        have no window table (see the compiler), and each input-pruned
+#        kernel (in its own module) is loaded on the first call of its
+#        loader.
+#    [5] The kernel modules are only bundled by the unrolled browser bundle
+#        (see "browser/modules-unrolled.json"), the registry module itself is
+#        bundled by the default one (see "browser/modules.json"). The lookup
+#        of a kernel that is not bundled returns null (so that the codec
+#        falls back to the generic transforms), the input-pruned kernels are
+#        listed together with their windowed kernels and are not checked.
+#
+
+import os
+import glob
+import json
+
+
+#  File/folder settings.
+BASE_DIR = os.path.dirname(os.path.realpath(__file__))
+HDRFILE_PATH = os.path.join(BASE_DIR, "header.js")
+OUTFILE_PATH = os.path.join(BASE_DIR, "..", "..", "lc3", "math", "mdct-prebuilt.js")
+BROWSER_MODULES_PATH = os.path.join(BASE_DIR, "..", "..", "browser", "modules.json")
+BROWSER_UNROLLED_MODULES_PATH = os.path.join(BASE_DIR, "..", "..", "browser", "modules-unrolled.json")
+
+
+def module_name_of(path):
+    #  Get the module name (e.g. "mdct-60") of a JS file.
+    return os.path.splitext(os.path.basename(path))[0]
+
+
+def module_var_of(module_name):
+    #  Get the module variable name (e.g. "Lc3Mdct60" for "mdct-60") of a
+    #  kernel module.
+    return "Lc3" + "".join([part[0].upper() + part[1:] for part in module_name.split("-")])
+
+
+def generate_require(module_var, module_name):
+    #  Generate the statements (within a loader) that load a kernel module, or
+    #  return null from the loader if the module is not available (i.e. not
+    #  bundled by the browser build).
+    content  = "        let %s = null;\n" % module_var
+    content += "        try {\n"
+    content += "            %s = require(\"./%s\");\n" % (module_var, module_name)
+    content += "        } catch (error) {\n"
+    content += "            //  Not bundled (see \"browser/modules-unrolled.json\").\n"
+    content += "            return null;\n"
+    content += "        }\n"
+    return content
+
+
+def generate_loader(M, module_name):
+    #  Generate the loader of the (unwindowed) kernels of a kernel module.
+    module_var = module_var_of(module_name)
+    content  = "/**\n"
+    content += " *  Load the prebuilt MDCT kernels (unit size %d).\n" % M
+    content += " * \n"
+    content += " *  @returns {?Object}\n"
+    content += " *    - The kernel descriptor (null if the kernel module is not bundled).\n"
+    content += " */\n"
+    content += "function LoadPrebuiltKernel_%d() {\n" % M
+    content += "    if (g_PrebuiltKernel_%d === null) {\n" % M
+    content += generate_require(module_var, module_name)
+    content += "        g_PrebuiltKernel_%d = {\n" % M
+    content += "            \"forward\": %s.ApplyMDCT_%d,\n" % (module_var, M)
+    content += "            \"inverse\": %s.ApplyIMDCT_%d\n" % (module_var, M)
+    content += "        };\n"
+    content += "    }\n"
+    content += "    return g_PrebuiltKernel_%d;\n" % M
+    content += "}\n"
+    content += "\n"
+    return content
+
+
+def generate_windowed_loaders(module_name, windows):
+    #  Generate the loaders of the windowed kernels (and their input-pruned
+    #  kernels) of a kernel module.
+    module_var = module_var_of(module_name)
+    content = ""
+    for window_name, _, pruned in windows:
+        for count, pruned_module_name in pruned:
+            pruned_module_var = module_var_of(pruned_module_name)
+            content += "/**\n"
+            content += " *  Load the prebuilt input-pruned IMDCT kernel (window %s, nonzero-bin\n" % window_name
+            content += " *  count %d).\n" % count
+            content += " * \n"
+            content += " *  @returns {Function}\n"
+            content += " *    - The IMDCT function.\n"
+            content += " */\n"
+            content += "function LoadPrebuiltPrunedKernel_%s_K%d() {\n" % (window_name, count)
+            content += "    const %s = \n" % pruned_module_var
+            content += "        require(\"./%s\");\n" % pruned_module_name
+            content += "    return %s.ApplyWindowedIMDCT_%s_K%d;\n" % (pruned_module_var, window_name, count)
+            content += "}\n"
+            content += "\n"
+        content += "/**\n"
+        content += " *  Load the prebuilt windowed MDCT kernels (window %s).\n" % window_name
+        content += " * \n"
+        content += " *  @returns {?Object}\n"
+        content += " *    - The kernel descriptor (null if the kernel module is not bundled).\n"
+        content += " */\n"
+        content += "function LoadPrebuiltWindowedKernel_%s() {\n" % window_name
+        content += "    if (g_PrebuiltWindowedKernel_%s === null) {\n" % window_name
+        content += generate_require(module_var, module_name)
+        content += "        g_PrebuiltWindowedKernel_%s = {\n" % window_name
+        content += "            \"forward\": %s.ApplyWindowedMDCT_%s,\n" % (module_var, window_name)
+        content += "            \"inverse\": %s.ApplyWindowedIMDCT_%s,\n" % (module_var, window_name)
+        if len(pruned) != 0:
+            content += "            \"inversePruned\": [\n"
+            lines = []
+            for count, _ in pruned:
+                lines.append("                {\n")
+                lines[-1] += "                    \"count\": %d,\n" % count
+                lines[-1] += "                    \"loadInverse\": LoadPrebuiltPrunedKernel_%s_K%d\n" % (window_name, count)
+                lines[-1] += "                }"
+            content += ",\n".join(lines) + "\n"
+            content += "            ]\n"
+        else:
+            content += "            \"inversePruned\": []\n"
+        content += "        };\n"
+        content += "    }\n"
+        content += "    return g_PrebuiltWindowedKernel_%s;\n" % window_name
+        content += "}\n"
+        content += "\n"
+    return content
+
+
+def main():
+    #  Read the header file.
+    fp = open(HDRFILE_PATH, "r", encoding="utf-8")
+    hdr = fp.read().rstrip()
+    fp.close()
+    
+    #  Read all configuration files.
+    kernels = []
+    for cfgfile_path in glob.glob(os.path.join(BASE_DIR, "config-*.json")):
+        fp = open(cfgfile_path, "r", encoding="utf-8")
+        config = json.loads(fp.read())
+        fp.close()
+        outfile_path = os.path.realpath(os.path.join(BASE_DIR, config["output"]))
+        if os.path.dirname(outfile_path) != os.path.dirname(os.path.realpath(OUTFILE_PATH)):
+            raise Exception("Kernel \"%s\" is not within the registry directory." % config["output"])
+        windows = []
+        for window_config in config.get("windows", []):
+            window_path = os.path.realpath(os.path.join(BASE_DIR, window_config["table"]))
+            pruned = []
+            for count in sorted(set(window_config.get("pruned", []))):
+                pruned.append((count, "%s-%s-k%d" % (module_name_of(outfile_path), module_name_of(window_path), count)))
+            windows.append((
+                module_name_of(window_path).upper(),
+                os.path.relpath(os.path.splitext(window_path)[0], os.path.dirname(os.path.realpath(OUTFILE_PATH))),
+                pruned
+            ))
+        kernels.append((config["M"], module_name_of(outfile_path), windows))
+    kernels.sort()
+    for i in range(1, len(kernels)):
+        if kernels[i][0] == kernels[i - 1][0]:
+            raise Exception("Duplicated unit size %d." % kernels[i][0])
+    
+    #  Generate the header and module dependencies (the window tables only).
+    content  = hdr + "\n\n"
+    content += "//\n"
+    content += "//  Imports.\n"
+    content += "//\n"
+    content += "\n"
+    content += "//  Imported modules.\n"
+    for _, _, windows in kernels:
+        for window_name, window_module, _ in windows:
+            content += "const Lc3Tbl%s = \n" % window_name
+            content += "    require(\"./%s\");\n" % window_module.replace(os.sep, "/")
+    content += "\n"
+    
+    #  Generate the descriptor caches.
+    content += "//\n"
+    content += "//  Globals.\n"
+    content += "//\n"
+    content += "\n"
+    if any([len(windows) == 0 for _, _, windows in kernels]):
+        content += "//  Prebuilt MDCT kernels (null if not loaded yet).\n"
+        for M, _, windows in kernels:
+            if len(windows) == 0:
+                content += "let g_PrebuiltKernel_%d = null;\n" % M
+        content += "\n"
+    content += "//  Prebuilt windowed MDCT kernels (null if not loaded yet).\n"
+    for _, _, windows in kernels:
+        for window_name, _, _ in windows:
+            content += "let g_PrebuiltWindowedKernel_%s = null;\n" % window_name
+    content += "\n"
+    
+    #  Generate kernel loaders.
+    content += "//\n"
+    content += "//  Private functions.\n"
+    content += "//\n"
+    content += "\n"
+    for M, module_name, windows in kernels:
+        if len(windows) == 0:
+            content += generate_loader(M, module_name)
+        else:
+            content += generate_windowed_loaders(module_name, windows)
+    
+    #  Generate lookup functions.
+    content += "//\n"
+    content += "//  Public functions.\n"
+    content += "//\n"
+    content += "\n"
+    content += "/**\n"
+    content += " *  Find the prebuilt MDCT kernels of specific unit size.\n"
+    content += " * \n"
+    content += " *  Note(s):\n"
+    content += " *    [1] The returned object contains following fields:\n"
+    content += " *          - \"forward\": The MDCT function, which has signature\n"
+    content += " *            (x, w, X, re, im).\n"
+    content += " *          - \"inverse\": The IMDCT function, which has signature\n"
+    content += " *            (X, w, y, re, im).\n"
+    content += " *    [2] The kernel module is loaded on the first lookup.\n"
+    content += " *    [3] The returned object shall not be modified.\n"
+    content += " * \n"
+    content += " *  @param {Number} M\n"
+    content += " *    - The unit size.\n"
+    content += " *  @returns {?Object}\n"
+    content += " *    - The prebuilt kernels (null if not available).\n"
+    content += " */\n"
+    content += "function FindPrebuiltMDCT(M) {\n"
+    content += "    switch (M) {\n"
+    for M, _, windows in kernels:
+        if len(windows) == 0:
+            content += "    case %d:\n" % M
+            content += "        return LoadPrebuiltKernel_%d();\n" % M
+    content += "    default:\n"
+    content += "        return null;\n"
+    content += "    }\n"
+    content += "}\n"
+    content += "\n"
+    
+    content += "/**\n"
+    content += " *  Find the prebuilt windowed MDCT kernels of specific window table.\n"
+    content += " * \n"
+    content += " *  Note(s):\n"
+    content += " *    [1] The returned object contains following fields:\n"
+    content += " *          - \"forward\": The MDCT function (with window W and gain\n"
+    content += " *            sqrt(2 / M) baked), which has signature (x, X, re, im).\n"
+    content += " *          - \"inverse\": The IMDCT function (with flipped window W and\n"
+    content += " *            gain sqrt(2 / M) baked), which has signature (X, y, re, im).\n"
+    content += " *          - \"inversePruned\": The input-pruned IMDCT kernels (in\n"
+    content += " *            ascending order of \"count\"), each one is an object that\n"
+    content += " *            contains following fields:\n"
+    content += " *              - \"count\": The nonzero-bin count (X[k] shall be zero\n"
+    content += " *                for all k >= count).\n"
+    content += " *              - \"loadInverse\": The loader of the IMDCT function\n"
+    content += " *                (same signature as \"inverse\"), which loads the\n"
+    content += " *                kernel module on its first call.\n"
+    content += " *    [2] The window table is matched by identity (not by value).\n"
+    content += " *    [3] The kernel module is loaded on the first lookup.\n"
+    content += " *    [4] The returned object shall not be modified.\n"
+    content += " * \n"
+    content += " *  @param {Number[]} W\n"
+    content += " *    - The window table.\n"
+    content += " *  @returns {?Object}\n"
+    content += " *    - The prebuilt kernels (null if not available).\n"
+    content += " */\n"
+    content += "function FindPrebuiltWindowedMDCT(W) {\n"
+    for _, _, windows in kernels:
+        for window_name, _, _ in windows:
+            content += "    if (W === Lc3Tbl%s.%s) {\n" % (window_name, window_name)
+            content += "        return LoadPrebuiltWindowedKernel_%s();\n" % window_name
+            content += "    }\n"
+    content += "    return null;\n"
+    content += "}\n"
+    content += "\n"
+    
+    #  Generate module ending.
+    content += "//  Export public APIs.\n"
+    content += "module.exports = {\n"
+    content += "    \"FindPrebuiltMDCT\": FindPrebuiltMDCT,\n"
+    content += "    \"FindPrebuiltWindowedMDCT\": FindPrebuiltWindowedMDCT\n"
+    content += "};"
+    
+    #  Write output file.
+    fp = open(OUTFILE_PATH, "w", encoding="utf-8")
+    fp.write(content)
+    fp.close()
+    
+    #  Check whether the registry is bundled by the default browser bundle and
+    #  all kernels are bundled by the unrolled browser bundle.
+    fp = open(BROWSER_MODULES_PATH, "r", encoding="utf-8")
+    browser_modules = json.loads(fp.read())
+    fp.close()
+    fp = open(BROWSER_UNROLLED_MODULES_PATH, "r", encoding="utf-8")
+    browser_unrolled_modules = json.loads(fp.read())
+    fp.close()
+    if ("lc3/math/%s" % module_name_of(OUTFILE_PATH)) not in browser_modules:
+        print("Warning: Module \"lc3/math/%s\" is not listed in \"browser/modules.json\"." % module_name_of(OUTFILE_PATH))
+    module_names = []
+    for _, module_name, windows in kernels:
+        module_names.append(module_name)
+        for _, _, pruned in windows:
+            module_names += [pruned_module_name for _, pruned_module_name in pruned]
+    for module_name in module_names:
+        if ("lc3/math/%s" % module_name) not in browser_unrolled_modules:
+            print("Warning: Module \"lc3/math/%s\" is not listed in \"browser/modules-unrolled.json\"." % module_name)
+    
+    print("OK! %d kernel(s) registered." % len(kernels))
+
+
+if __name__ == "__main__":
+    main()
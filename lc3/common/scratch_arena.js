@@ -0,0 +1,118 @@
+//
+//  Copyright 2021 - 2023 XiaoJSoft Studio. All rights reserved.
+//  Use of this source code is governed by a BSD-style license that can be
+//  found in the LICENSE.md file.
+//
+
+//
+//  Imports.
+//
+
+//  Imported modules.
+const Lc3UInt = 
+    require("./uint");
+const Lc3Error = 
+    require("./../error");
+
+//  Imported classes.
+const LC3IllegalParameterError = 
+    Lc3Error.LC3IllegalParameterError;
+
+//  Imported functions.
+const IsUInt32 = 
+    Lc3UInt.IsUInt32;
+
+//
+//  Public classes.
+//
+
+/**
+ *  LC3 scratch arena.
+ * 
+ *  Note(s):
+ *    [1] The arena hands out scratch buffers as views (subarrays) of one
+ *        preallocated Float64Array, so that all scratch buffers of a codec
+ *        instance (e.g. the scratch buffers of the transform kernels) share
+ *        one heap object and can be passed to the kernels without copying.
+ *    [2] If the preallocated storage is exhausted, a new storage (of at
+ *        least the initial capacity) is allocated, the buffers allocated
+ *        before are not affected.
+ *    [3] Buffers are never released (until the arena itself is released),
+ *        the contents of a buffer are undefined between two uses.
+ * 
+ *  @constructor
+ *  @throws {LC3IllegalParameterError}
+ *    - Capacity is not an unsigned 32-bit integer.
+ *  @param {Number} [capacity] 
+ *    - The initial capacity (in elements).
+ */
+function LC3ScratchArena(capacity = 0) {
+    //  Check the capacity.
+    if (!IsUInt32(capacity)) {
+        throw new LC3IllegalParameterError(
+            "Capacity is not an unsigned 32-bit integer."
+        );
+    }
+
+    //
+    //  Members.
+    //
+
+    //  Current storage (and its cursor).
+    let storage = new Float64Array(capacity);
+    let cursor = 0;
+
+    //  Total allocated size.
+    let allocated = 0;
+
+    //
+    //  Public methods.
+    //
+
+    /**
+     *  Allocate a scratch buffer.
+     * 
+     *  @throws {LC3IllegalParameterError}
+     *    - Size is not an unsigned 32-bit integer.
+     *  @param {Number} size 
+     *    - The buffer size (in elements).
+     *  @returns {Float64Array}
+     *    - The scratch buffer.
+     */
+    this.allocate = function(size) {
+        //  Check the size.
+        if (!IsUInt32(size)) {
+            throw new LC3IllegalParameterError(
+                "Size is not an unsigned 32-bit integer."
+            );
+        }
+
+        //  Allocate a new storage if the current one is exhausted.
+        if (cursor + size > storage.length) {
+            storage = new Float64Array(Math.max(size, capacity));
+            cursor = 0;
+        }
+
+        //  Allocate the buffer.
+        let buf = storage.subarray(cursor, cursor + size);
+        cursor += size;
+        allocated += size;
+
+        return buf;
+    };
+
+    /**
+     *  Get the total size of all allocated scratch buffers.
+     * 
+     *  @returns {Number}
+     *    - The size (in elements).
+     */
+    this.getAllocatedSize = function() {
+        return allocated;
+    };
+}
+
+//  Export public APIs.
+module.exports = {
+    "LC3ScratchArena": LC3ScratchArena
+};
\ No newline at end of file
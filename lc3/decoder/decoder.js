@@ -869,8 +869,17 @@ tnsloop:
             plc.good(X_hat);
         }
 
+        //  Get the count of (leading) spectrum coefficients that may be 
+        //  nonzero (all quantized coefficients since `lastnz` are zero and 
+        //  both the noise filling and the TNS decoder stop at the bandwidth 
+        //  stop frequency, the concealed spectrum is never wider than NE).
+        let NZ = NE;
+        if (!bec.isMarked()) {
+            NZ = Math.max(lastnz, bw_stop_Nms[Pbw]);
+        }
+
         //  Low delay MDCT synthesis (3.4.8).
-        let x_hat = imdct.update(X_hat);
+        let x_hat = imdct.update(X_hat, NZ);
         // console.log("x_hat[]=" + x_hat.toString());
 
         //  Long Term Postfilter (3.4.9).
@@ -13,6 +13,8 @@ const Lc3Fs =
     require("./../common/fs");
 const Lc3Nms = 
     require("./../common/nms");
+const Lc3ScratchArena = 
+    require("./../common/scratch_arena");
 const Lc3TblNF = 
     require("./../tables/nf");
 const Lc3TblW = 
@@ -21,6 +23,8 @@ const Lc3TblZ =
     require("./../tables/z");
 const Lc3Mdct = 
     require("./../math/mdct");
+const Lc3MdctPrebuilt = 
+    require("./../math/mdct-prebuilt");
 
 //  Imported classes.
 const IMDCT = 
@@ -29,15 +33,25 @@ const LC3SampleRate =
     Lc3Fs.LC3SampleRate;
 const LC3FrameDuration = 
     Lc3Nms.LC3FrameDuration;
+const LC3ScratchArena = 
+    Lc3ScratchArena.LC3ScratchArena;
 
 //  Imported constants.
 const NF_TBL = 
     Lc3TblNF.NF_TBL;
+const W_TBL = 
+    Lc3TblW.W_TBL;
 const W_FLIPPED_TBL = 
     Lc3TblW.W_FLIPPED_TBL;
 const Z_TBL = 
     Lc3TblZ.Z_TBL;
 
+//  Imported functions.
+const FindPrebuiltWindowedMDCT = 
+    Lc3MdctPrebuilt.FindPrebuiltWindowedMDCT;
+const IsUnrolledKernelsEnabled = 
+    Lc3Mdct.IsUnrolledKernelsEnabled;
+
 //
 //  Public classes.
 //
@@ -50,8 +64,11 @@ const Z_TBL =
  *    - The frame duration.
  *  @param {InstanceType<typeof LC3SampleRate>} Fs 
  *    - The sample rate.
+ *  @param {?(InstanceType<typeof LC3ScratchArena>)} [arena] 
+ *    - The scratch arena that the scratch buffers are allocated from (NULL 
+ *      to allocate a private one).
  */
-function LC3MDCTSynthesizer(Nms, Fs) {
+function LC3MDCTSynthesizer(Nms, Fs, arena = null) {
     //
     //  Members.
     //
@@ -62,6 +79,7 @@ function LC3MDCTSynthesizer(Nms, Fs) {
 
     //  Table lookup.
     let NF = NF_TBL[index_Nms][index_Fs];
+    let W = W_TBL[index_Nms][index_Fs];
     let W_FLIPPED = W_FLIPPED_TBL[index_Nms][index_Fs];
     let Z = Z_TBL[index_Nms][index_Fs];
 
@@ -79,7 +97,45 @@ function LC3MDCTSynthesizer(Nms, Fs) {
 
     let t_hat = new Array(NFmul2);
 
-    let imdct = new IMDCT(NF, Math.sqrt(NFmul2), W_FLIPPED);
+    //  IMDCT (the prebuilt unrolled kernel with the window baked is preferred 
+    //  if enabled, see EnableUnrolledKernels() of the MDCT module).
+    let imdct = null;
+    let imdct_prebuilt = (
+        IsUnrolledKernelsEnabled() ? FindPrebuiltWindowedMDCT(W) : null
+    );
+    let imdct_prebuilt_s1 = null, imdct_prebuilt_s2 = null;
+
+    //  Nonzero-bin count to the (input-pruned, if available) IMDCT function 
+    //  (null if not loaded yet) and its loader.
+    let imdct_prebuilt_fn = null;
+    let imdct_prebuilt_ld = null;
+
+    if (imdct_prebuilt !== null) {
+        //  Scratch buffers (the arena is allocated here, so that it costs 
+        //  nothing unless the prebuilt kernels are used).
+        if (arena === null) {
+            arena = new LC3ScratchArena(NF);
+        }
+        imdct_prebuilt_s1 = arena.allocate(NF >>> 1);
+        imdct_prebuilt_s2 = arena.allocate(NF >>> 1);
+        imdct_prebuilt_fn = new Array(NF + 1);
+        imdct_prebuilt_ld = new Array(NF + 1);
+        let pruned = imdct_prebuilt.inversePruned;
+        for (let nz = 0, i = 0; nz <= NF; ++nz) {
+            while (i < pruned.length && pruned[i].count < nz) {
+                ++i;
+            }
+            if (i < pruned.length) {
+                imdct_prebuilt_fn[nz] = null;
+                imdct_prebuilt_ld[nz] = pruned[i].loadInverse;
+            } else {
+                imdct_prebuilt_fn[nz] = imdct_prebuilt.inverse;
+                imdct_prebuilt_ld[nz] = null;
+            }
+        }
+    } else {
+        imdct = new IMDCT(NF, Math.sqrt(NFmul2), W_FLIPPED);
+    }
 
     //
     //  Public methods.
@@ -88,17 +144,38 @@ function LC3MDCTSynthesizer(Nms, Fs) {
     /**
      *  Update with one frame.
      * 
+     *  Note(s):
+     *    [1] X_hat[k] shall be zero for all k >= NZ, an input-pruned IMDCT 
+     *        kernel may be used if NZ is less than the spectrum size (the 
+     *        kernel is loaded on its first use).
+     * 
      *  @param {Number[]} X_hat 
      *    - The spectrum coefficients.
+     *  @param {Number} [NZ]
+     *    - The count of (leading) spectrum coefficients that may be nonzero.
      *  @returns {Number[]}
      *    - The reconstructed time samples.
      */
-    this.update = function(X_hat) {
+    this.update = function(X_hat, NZ = NF) {
         //  Low delay MDCT synthesis (3.4.8).
 
         //  1. Generation of time domain aliasing buffer t_hat[n].
         //  2. Windowing of time-aliased buffer.
-        imdct.transform(X_hat, t_hat);
+        if (imdct_prebuilt !== null) {
+            let imdct_fn = imdct_prebuilt_fn[NZ];
+            if (imdct_fn === null) {
+                imdct_fn = imdct_prebuilt_ld[NZ]();
+                imdct_prebuilt_fn[NZ] = imdct_fn;
+            }
+            imdct_fn(
+                X_hat, 
+                t_hat, 
+                imdct_prebuilt_s1, 
+                imdct_prebuilt_s2
+            );
+        } else {
+            imdct.transform(X_hat, t_hat);
+        }
         // console.log("t_hat[]=" + t_hat.toString());
 
         //  3. Conduct overlap-add operation to get reconstructed time samples 
@@ -13,10 +13,14 @@ const Lc3Fs =
     require("./../common/fs");
 const Lc3Nms = 
     require("./../common/nms");
+const Lc3ScratchArena = 
+    require("./../common/scratch_arena");
 const Lc3SlideWin = 
     require("./../common/slide_window");
 const Lc3Mdct = 
     require("./../math/mdct");
+const Lc3MdctPrebuilt = 
+    require("./../math/mdct-prebuilt");
 const Lc3TblI = 
     require("./../tables/i");
 const Lc3TblNB = 
@@ -35,6 +39,8 @@ const LC3SampleRate =
     Lc3Fs.LC3SampleRate;
 const LC3FrameDuration = 
     Lc3Nms.LC3FrameDuration;
+const LC3ScratchArena = 
+    Lc3ScratchArena.LC3ScratchArena;
 const LC3SlideWindow = 
     Lc3SlideWin.LC3SlideWindow;
 const MDCT = 
@@ -54,6 +60,12 @@ const W_TBL =
 const Z_TBL = 
     Lc3TblZ.Z_TBL;
 
+//  Imported functions.
+const FindPrebuiltWindowedMDCT = 
+    Lc3MdctPrebuilt.FindPrebuiltWindowedMDCT;
+const IsUnrolledKernelsEnabled = 
+    Lc3Mdct.IsUnrolledKernelsEnabled;
+
 //
 //  Constants.
 //
@@ -73,8 +85,11 @@ const NN_thresh = 30;
  *    - The frame duration.
  *  @param {InstanceType<typeof LC3SampleRate>} Fs 
  *    - The sample rate.
+ *  @param {?(InstanceType<typeof LC3ScratchArena>)} [arena] 
+ *    - The scratch arena that the scratch buffers are allocated from (NULL 
+ *      to allocate a private one).
  */
-function LC3MDCTAnalyzer(Nms, Fs) {
+function LC3MDCTAnalyzer(Nms, Fs, arena = null) {
     //
     //  Members.
     //
@@ -92,8 +107,24 @@ function LC3MDCTAnalyzer(Nms, Fs) {
     let Ifs = I_TBL[index_Nms][index_Fs];
     let nn_idx = NNIDX_TBL[index_Nms][index_Fs];
 
-    //  MDCT.
-    let mdct = new MDCT(NF, Math.sqrt(2 / NF), W);
+    //  MDCT (the prebuilt unrolled kernel with the window baked is preferred 
+    //  if enabled, see EnableUnrolledKernels() of the MDCT module).
+    let mdct = null;
+    let mdct_prebuilt = (
+        IsUnrolledKernelsEnabled() ? FindPrebuiltWindowedMDCT(W) : null
+    );
+    let mdct_prebuilt_s1 = null, mdct_prebuilt_s2 = null;
+    if (mdct_prebuilt !== null) {
+        //  Scratch buffers (the arena is allocated here, so that it costs 
+        //  nothing unless the prebuilt kernel is used).
+        if (arena === null) {
+            arena = new LC3ScratchArena(NF);
+        }
+        mdct_prebuilt_s1 = arena.allocate(NF >>> 1);
+        mdct_prebuilt_s2 = arena.allocate(NF >>> 1);
+    } else {
+        mdct = new MDCT(NF, Math.sqrt(2 / NF), W);
+    }
 
     //  Time buffer.
     let TbufLen = NF_mul_2 - Z;
@@ -138,7 +169,16 @@ function LC3MDCTAnalyzer(Nms, Fs) {
         Tbuf.bulkGet(Twinbuf, 0, 0, TbufLen);
 
         //  Get spectral coefficients.
-        mdct.transform(Twinbuf, X);                                  //  Eq. 8
+        if (mdct_prebuilt !== null) {                                //  Eq. 8
+            mdct_prebuilt.forward(
+                Twinbuf, 
+                X, 
+                mdct_prebuilt_s1, 
+                mdct_prebuilt_s2
+            );
+        } else {
+            mdct.transform(Twinbuf, X);
+        }
 
         //  Do energy estimation.
         for (let b = 0; b < NB; ++b) {                              //  Eq. 10
@@ -190,6 +190,7 @@ function LC3LongTermPostfilter(Nms, Fs) {
     let R6p4_corrwin1_im = new Array(R6p4_corrfft_size);
     let R6p4_corrwin2_re = new Array(R6p4_corrfft_size);
     let R6p4_corrwin2_im = new Array(R6p4_corrfft_size);
+    let R6p4_corrout = new Array(R6p4_corrfft_size);
 
     let R12p8 = new Array(17 /*  = 2 * 8 + 1  */);
     let R12p8_buf1 = new Array(len12p8);
@@ -335,6 +336,10 @@ function LC3LongTermPostfilter(Nms, Fs) {
             //
             //  The description of the algorithm below can be found at:
             //    [1] ./../../dev/notes/eq86_r6.pdf
+            //  Both windows are real, so they are transformed by one FFT 
+            //  (the 1st window in the real part, the 2nd window in the 
+            //  imaginary part) and only a half of the (conjugate-symmetric) 
+            //  spectrum is multiplied.
             x6p4_win.bulkGet(
                 R6p4_corrwin1_re, 
                 0, 
@@ -342,43 +347,50 @@ function LC3LongTermPostfilter(Nms, Fs) {
                 len6p4
             );
             x6p4_win.bulkGet(
-                R6p4_corrwin2_re, 
+                R6p4_corrwin1_im, 
                 0, 
                 R6p4_corrfft_c2, 
                 len6p4
             );
             x6p4_win.bulkGet(
-                R6p4_corrwin2_re, 
+                R6p4_corrwin1_im, 
                 R6p4_corrfft_c1, 
                 R6p4_corrfft_c3, 
                 R6p4_corrfft_c0
             );
-            for (let n = 0; n < len6p4; ++n) {
-                R6p4_corrwin1_im[n] = 0;
-                R6p4_corrwin2_im[n] = 0;
-            }
             for (let n = len6p4; n < R6p4_corrfft_c1; ++n) {
                 R6p4_corrwin1_re[n] = 0;
                 R6p4_corrwin1_im[n] = 0;
-                R6p4_corrwin2_re[n] = 0;
-                R6p4_corrwin2_im[n] = 0;
             }
             for (let n = R6p4_corrfft_c1; n < R6p4_corrfft_size; ++n) {
                 R6p4_corrwin1_re[n] = 0;
-                R6p4_corrwin1_im[n] = 0;
-                R6p4_corrwin2_im[n] = 0;
             }
-            R6p4_corrfft.transform(R6p4_corrwin1_re, R6p4_corrwin1_im);
-            R6p4_corrfft.transform(R6p4_corrwin2_re, R6p4_corrwin2_im);
-            for (let k = 0; k < R6p4_corrfft_size; ++k) {
-                let a_re = R6p4_corrwin1_re[k], a_im = -R6p4_corrwin1_im[k];
-                let b_re = R6p4_corrwin2_re[k], b_im = R6p4_corrwin2_im[k];
-                R6p4_corrwin1_re[k] = (a_re * b_re - a_im * b_im) / R6p4_corrfft_size;
-                R6p4_corrwin1_im[k] = (a_re * b_im + a_im * b_re) / R6p4_corrfft_size;
+            R6p4_corrfft.transformPairedReal(R6p4_corrwin1_re, R6p4_corrwin1_im);
+            R6p4_corrwin2_re[0] = R6p4_corrwin1_re[0] * R6p4_corrwin1_im[0];
+            R6p4_corrwin2_im[0] = 0;
+            for (
+                let k1 = 1, k2 = R6p4_corrfft_size - 1; 
+                k1 <= k2; 
+                ++k1, --k2
+            ) {
+                if (k1 == k2) {
+                    R6p4_corrwin2_re[k1] = 
+                        R6p4_corrwin1_re[k1] * R6p4_corrwin1_im[k1];
+                    R6p4_corrwin2_im[k1] = 0;
+                    break;
+                }
+                let a_re = R6p4_corrwin1_re[k1], a_im = R6p4_corrwin1_im[k1];
+                let b_re = R6p4_corrwin1_re[k2], b_im = R6p4_corrwin1_im[k2];
+                R6p4_corrwin2_re[k1] = a_re * b_re - a_im * b_im;
+                R6p4_corrwin2_im[k1] = a_re * b_im + a_im * b_re;
             }
-            R6p4_corrfft.transform(R6p4_corrwin1_re, R6p4_corrwin1_im);
+            R6p4_corrfft.transformInverseReal(
+                R6p4_corrwin2_re, 
+                R6p4_corrwin2_im, 
+                R6p4_corrout
+            );
 
-            R6p4 = R6p4_corrwin1_re;
+            R6p4 = R6p4_corrout;
             // console.log("R6p4[]=" + R6p4.slice(0, KWIDTH).toString());
         }
 
@@ -32,7 +32,7 @@
  *    - The output vector.
  */
 function DCTIIForward_16(dct_in, dct_out = new Array(16)) {
-    let t0, t1, t10, t11, t12, t13, t14, t15, t16, t17, t18, t19, t2, t20, t21, t22, t23, t24, t3, t4, t5, t6, t7, t8, t9;
+    let t0, t1, t10, t11, t12, t13, t14, t15, t16, t17, t18, t19, t2, t3, t4, t5, t6, t7, t8, t9;
     t0 = dct_in[0];
     t1 = dct_in[2];
     t2 = dct_in[4];
@@ -53,181 +53,168 @@ function DCTIIForward_16(dct_in, dct_out = new Array(16)) {
     t17 = t1 + t9;
     t18 = t4 + t12;
     t19 = t5 + t13;
-    t20 = t0 - t8;
-    t21 = t1 - t9;
-    t22 = t4 - t12;
-    t23 = t5 - t13;
-    t0 = t16 + t18;
-    t1 = t17 + t19;
-    t4 = t20 + t23;
-    t5 = t21 - t22;
-    t8 = t16 - t18;
-    t9 = t17 - t19;
-    t12 = t20 - t23;
-    t13 = t21 + t22;
-    t16 = t2 + t10;
-    t17 = t3 + t11;
-    t18 = t6 + t14;
-    t19 = t7 + t15;
-    t20 = t2 - t10;
-    t21 = t3 - t11;
-    t22 = t6 - t14;
-    t23 = t7 - t15;
-    t2 = t16 + t18;
-    t3 = t17 + t19;
-    t6 = t20 + t23;
-    t7 = t21 - t22;
-    t10 = t16 - t18;
-    t11 = t17 - t19;
-    t14 = t20 - t23;
-    t15 = t21 + t22;
-    t16 = t6 + t7;
-    t17 = t7 - t6;
-    t6 = t16 * 0.7071067811865476;
-    t7 = t17 * 0.7071067811865476;
-    t18 = t10;
-    t10 = t11;
-    t11 = -t18;
-    t19 = t15 - t14;
-    t20 = -t14 - t15;
-    t14 = t19 * 0.7071067811865476;
-    t15 = t20 * 0.7071067811865476;
-    t21 = t0;
-    t22 = t1;
-    t23 = t2;
-    t16 = t3;
-    t0 = t21 + t23;
-    t1 = t22 + t16;
-    t2 = t21 - t23;
-    t3 = t22 - t16;
-    t17 = t4;
-    t18 = t5;
-    t19 = t6;
-    t20 = t7;
-    t4 = t17 + t19;
-    t5 = t18 + t20;
-    t6 = t17 - t19;
-    t7 = t18 - t20;
-    t21 = t8;
-    t22 = t9;
-    t23 = t10;
-    t16 = t11;
-    t8 = t21 + t23;
-    t9 = t22 + t16;
-    t10 = t21 - t23;
-    t11 = t22 - t16;
-    t17 = t12;
-    t18 = t13;
-    t19 = t14;
-    t20 = t15;
+    t0 = t0 - t8;
+    t8 = t1 - t9;
+    t1 = t4 - t12;
+    t9 = t5 - t13;
+    t4 = t16 + t18;
     t12 = t17 + t19;
-    t13 = t18 + t20;
-    t14 = t17 - t19;
-    t15 = t18 - t20;
-    t23 = t0 + t1;
-    t16 = t0 - t1;
-    t0 = t23;
-    t21 = t16;
-    t22 = 0;
-    t17 = t4 + t14;
-    t18 = t5 - t15;
-    t19 = t5 + t15;
-    t20 = t14 - t4;
-    t23 = 0.9238795325112865 * (t19 + t20);
-    t16 = t19 * (-1.306562964876377);
-    t24 = t20 * 0.5411961001461961;
-    t19 = t23 - t24;
-    t20 = t23 + t16;
-    t4 = t17 + t19;
-    t5 = t18 + t20;
-    t14 = t17 - t19;
-    t15 = t20 - t18;
-    t23 = t8 + t10;
-    t16 = t9 - t11;
-    t24 = t9 + t11;
-    t17 = t10 - t8;
-    t18 = t24 + t17;
-    t19 = t17 - t24;
-    t24 = t18 * 0.7071067811865476;
-    t17 = t19 * 0.7071067811865476;
-    t8 = t23 + t24;
-    t9 = t16 + t17;
-    t10 = t23 - t24;
-    t11 = t17 - t16;
-    t20 = t12 + t6;
-    t18 = t13 - t7;
-    t19 = t13 + t7;
-    t23 = t6 - t12;
-    t16 = 0.38268343236509 * (t19 + t23);
-    t24 = t19 * (-1.3065629648763766);
-    t17 = t23 * (-0.5411961001461967);
-    t19 = t16 - t17;
-    t23 = t16 + t24;
-    t12 = t20 + t19;
-    t13 = t18 + t23;
-    t6 = t20 - t19;
-    t7 = t23 - t18;
-    t16 = t2 + t2;
-    t24 = t3 + t3;
-    t17 = t2 - t2;
-    t20 = t24;
-    t24 = t17;
-    t17 = -t20;
-    t2 = t16 + t24;
-    t3 = t17;
-    t18 = 0.49759236333609846 * (t4 + t5);
-    t19 = t4 * (-0.5466009335008787);
-    t23 = t5 * 0.4485837931713182;
-    t4 = t18 - t23;
-    t5 = t18 + t19;
-    t20 = 0.49039264020161516 * (t8 + t9);
-    t16 = t8 * (-0.5879378012096795);
-    t24 = t9 * 0.3928474791935508;
-    t8 = t20 - t24;
-    t9 = t20 + t16;
-    t17 = 0.4784701678661044 * (t12 + t13);
-    t18 = t12 * (-0.6236125064933357);
-    t19 = t13 * 0.33332782923887316;
-    t12 = t17 - t19;
-    t13 = t17 + t18;
-    t23 = 0.46193976625564326 * (t2 + t3);
-    t20 = t2 * (-0.6532814824381885);
-    t16 = t3 * 0.27059805007309806;
-    t2 = t23 - t16;
-    t3 = t23 + t20;
-    t24 = 0.4409606321741774 * (t6 + t7);
-    t17 = t6 * (-0.6766590005871764);
-    t18 = t7 * 0.20526226376117845;
-    t6 = t24 - t18;
-    t7 = t24 + t17;
-    t19 = 0.4157348061512726 * (t10 + t11);
-    t23 = t10 * (-0.6935199226610738);
-    t20 = t11 * 0.13794968964147153;
-    t10 = t19 - t20;
-    t11 = t19 + t23;
-    t16 = 0.38650522668136833 * (t14 + t15);
-    t24 = t14 * (-0.7037018687631913);
-    t17 = t15 * 0.06930858459954536;
-    t14 = t16 - t17;
-    t15 = t16 + t24;
-    t18 = t21 + t22;
-    t21 = t18 * 0.7071067811865476;
-    dct_out[0] = t0;
-    dct_out[1] = t4;
-    dct_out[2] = t8;
-    dct_out[3] = t12;
-    dct_out[4] = t2;
-    dct_out[5] = t6;
-    dct_out[6] = t10;
-    dct_out[7] = t14;
-    dct_out[8] = t21;
-    dct_out[9] = -t15;
-    dct_out[10] = -t11;
-    dct_out[11] = -t7;
-    dct_out[12] = -t3;
-    dct_out[13] = -t13;
-    dct_out[14] = -t9;
-    dct_out[15] = -t5;
+    t5 = t0 + t9;
+    t13 = t8 - t1;
+    t16 = t16 - t18;
+    t18 = t17 - t19;
+    t17 = t0 - t9;
+    t19 = t8 + t1;
+    t0 = t2 + t10;
+    t9 = t3 + t11;
+    t8 = t6 + t14;
+    t1 = t7 + t15;
+    t2 = t2 - t10;
+    t10 = t3 - t11;
+    t3 = t6 - t14;
+    t11 = t7 - t15;
+    t6 = t0 + t8;
+    t14 = t9 + t1;
+    t7 = t2 + t11;
+    t15 = t10 - t3;
+    t0 = t0 - t8;
+    t8 = t9 - t1;
+    t9 = t2 - t11;
+    t1 = t10 + t3;
+    t2 = t7 + t15;
+    t11 = t7 - t15;
+    t10 = 0.7071067811865476 * t2;
+    t3 = (-0.7071067811865476) * t11;
+    t7 = t9 - t1;
+    t15 = t9 + t1;
+    t2 = (-0.7071067811865476) * t7;
+    t11 = (-0.7071067811865476) * t15;
+    t9 = t4 - t6;
+    t1 = t12 - t14;
+    t7 = t4 + t6;
+    t15 = t12 + t14;
+    t4 = t5 - t10;
+    t6 = t13 - t3;
+    t12 = t5 + t10;
+    t14 = t13 + t3;
+    t5 = t16 - t8;
+    t10 = t18 + t0;
+    t13 = t16 + t8;
+    t3 = t18 - t0;
+    t16 = t17 - t2;
+    t8 = t19 - t11;
+    t18 = t17 + t2;
+    t0 = t19 + t11;
+    t17 = t7 + t15;
+    t2 = t7 - t15;
+    t19 = t12 + t16;
+    t11 = t14 - t8;
+    t7 = t14 + t8;
+    t15 = t16 - t12;
+    t14 = t7 + t15;
+    t8 = 0.9238795325112867 * t14;
+    t16 = t7 * (-1.3065629648763766);
+    t12 = t15 * 0.5411961001461969;
+    t14 = t8 - t12;
+    t7 = t8 + t16;
+    t15 = t19 + t14;
+    t12 = t11 + t7;
+    t8 = t19 - t14;
+    t16 = t7 - t11;
+    t19 = t13 + t5;
+    t14 = t3 - t10;
+    t7 = t3 + t10;
+    t11 = t5 - t13;
+    t3 = t7 + t11;
+    t10 = t7 - t11;
+    t5 = 0.7071067811865476 * t3;
+    t13 = (-0.7071067811865476) * t10;
+    t7 = t19 + t5;
+    t11 = t14 + t13;
+    t3 = t19 - t5;
+    t10 = t13 - t14;
+    t19 = t18 + t4;
+    t5 = t0 - t6;
+    t13 = t0 + t6;
+    t14 = t4 - t18;
+    t0 = t13 + t14;
+    t6 = 0.3826834323650898 * t0;
+    t4 = t13 * (-1.3065629648763766);
+    t18 = t14 * (-0.5411961001461969);
+    t0 = t6 - t18;
+    t13 = t6 + t4;
+    t14 = t19 + t0;
+    t18 = t5 + t13;
+    t6 = t19 - t0;
+    t4 = t13 - t5;
+    t19 = t9 + t9;
+    t0 = t1 + t1;
+    t13 = t15 + t12;
+    t5 = 0.49759236333609846 * t13;
+    t9 = t15 * (-0.5466009335008788);
+    t1 = t12 * 0.44858379317131813;
+    t13 = t5 - t1;
+    t15 = t5 + t9;
+    t12 = t7 + t11;
+    t1 = 0.4903926402016152 * t12;
+    t5 = t7 * (-0.5879378012096793);
+    t9 = t11 * 0.3928474791935511;
+    t12 = t1 - t9;
+    t7 = t1 + t5;
+    t11 = t14 + t18;
+    t9 = 0.4784701678661044 * t11;
+    t1 = t14 * (-0.6236125064933355);
+    t5 = t18 * 0.3333278292388733;
+    t11 = t9 - t5;
+    t14 = t9 + t1;
+    t18 = t19 - t0;
+    t5 = 0.46193976625564337 * t18;
+    t9 = t19 * (-0.6532814824381883);
+    t1 = (-0.27059805007309845) * t0;
+    t18 = t5 - t1;
+    t19 = t5 + t9;
+    t0 = t6 + t4;
+    t1 = 0.4409606321741775 * t0;
+    t5 = t6 * (-0.6766590005871763);
+    t9 = t4 * 0.2052622637611787;
+    t0 = t1 - t9;
+    t6 = t1 + t5;
+    t4 = t3 + t10;
+    t9 = 0.4157348061512726 * t4;
+    t1 = t3 * (-0.6935199226610738);
+    t5 = t10 * 0.13794968964147153;
+    t4 = t9 - t5;
+    t3 = t9 + t1;
+    t10 = t8 + t16;
+    t5 = 0.3865052266813685 * t10;
+    t9 = t8 * (-0.7037018687631913);
+    t1 = t16 * 0.06930858459954575;
+    t10 = t5 - t1;
+    t8 = t5 + t9;
+    t16 = 0.7071067811865476 * t2;
+    dct_out[0] = t17;
+    dct_out[1] = t13;
+    dct_out[2] = t12;
+    dct_out[3] = t11;
+    dct_out[4] = t18;
+    dct_out[5] = t0;
+    dct_out[6] = t4;
+    dct_out[7] = t10;
+    dct_out[8] = t16;
+    t1 = -t8;
+    dct_out[9] = t1;
+    t5 = -t3;
+    dct_out[10] = t5;
+    t9 = -t6;
+    dct_out[11] = t9;
+    t2 = -t19;
+    dct_out[12] = t2;
+    t17 = -t14;
+    dct_out[13] = t17;
+    t13 = -t7;
+    dct_out[14] = t13;
+    t12 = -t15;
+    dct_out[15] = t12;
     return dct_out;
 }
 
@@ -0,0 +1,824 @@
+//
+//  Copyright 2021 - 2023 XiaoJSoft Studio. All rights reserved.
+//  Use of this source code is governed by a BSD-style license that can be
+//  found in the LICENSE.md file.
+//
+
+//
+//  Note(s):
+//    [1] This file is generated automatically by a FFT compiler, which locates 
+//        at "./../../dev/fft-mx-generator/" directory.
+//        Do NOT modify this file manually.
+//
+
+//
+//  Imports.
+//
+
+//  Imported modules.
+const Lc3FftMxBaseOp = 
+    require("./fft-mx-baseop");
+
+//  Imported functions.
+// const MXTr2 = 
+//     Lc3FftMxBaseOp.MXTr2;
+// const MXTr3 = 
+//     Lc3FftMxBaseOp.MXTr3;
+// const MXTr4 = 
+//     Lc3FftMxBaseOp.MXTr4;
+// const MXTr5 = 
+//     Lc3FftMxBaseOp.MXTr5;
+// const MXRot = 
+//     Lc3FftMxBaseOp.MXRot;
+// const MXSwap = 
+//     Lc3FftMxBaseOp.MXSwap;
+// const MXCshft = 
+//     Lc3FftMxBaseOp.MXCshft;
+const MXCompact = 
+    Lc3FftMxBaseOp.MXCompact;
+
+//
+//  Constants.
+//
+
+//  Tables (and scratch buffers) of the compact kernel (see MXCompact() of
+//  the "fft-mx-baseop" module).
+const COMPACT_RADICES = new Int32Array([
+    4, 4, 4, 4, 4
+]);
+const COMPACT_INDEXES = new Int32Array([
+    0, 256, 512, 768, 64, 320, 576, 832, 128, 384, 640, 896, 192, 448, 704,
+    960, 16, 272, 528, 784, 80, 336, 592, 848, 144, 400, 656, 912, 208, 464,
+    720, 976, 32, 288, 544, 800, 96, 352, 608, 864, 160, 416, 672, 928, 224,
+    480, 736, 992, 48, 304, 560, 816, 112, 368, 624, 880, 176, 432, 688,
+    944, 240, 496, 752, 1008, 4, 260, 516, 772, 68, 324, 580, 836, 132, 388,
+    644, 900, 196, 452, 708, 964, 20, 276, 532, 788, 84, 340, 596, 852, 148,
+    404, 660, 916, 212, 468, 724, 980, 36, 292, 548, 804, 100, 356, 612,
+    868, 164, 420, 676, 932, 228, 484, 740, 996, 52, 308, 564, 820, 116,
+    372, 628, 884, 180, 436, 692, 948, 244, 500, 756, 1012, 8, 264, 520,
+    776, 72, 328, 584, 840, 136, 392, 648, 904, 200, 456, 712, 968, 24, 280,
+    536, 792, 88, 344, 600, 856, 152, 408, 664, 920, 216, 472, 728, 984, 40,
+    296, 552, 808, 104, 360, 616, 872, 168, 424, 680, 936, 232, 488, 744,
+    1000, 56, 312, 568, 824, 120, 376, 632, 888, 184, 440, 696, 952, 248,
+    504, 760, 1016, 12, 268, 524, 780, 76, 332, 588, 844, 140, 396, 652,
+    908, 204, 460, 716, 972, 28, 284, 540, 796, 92, 348, 604, 860, 156, 412,
+    668, 924, 220, 476, 732, 988, 44, 300, 556, 812, 108, 364, 620, 876,
+    172, 428, 684, 940, 236, 492, 748, 1004, 60, 316, 572, 828, 124, 380,
+    636, 892, 188, 444, 700, 956, 252, 508, 764, 1020, 1, 257, 513, 769, 65,
+    321, 577, 833, 129, 385, 641, 897, 193, 449, 705, 961, 17, 273, 529,
+    785, 81, 337, 593, 849, 145, 401, 657, 913, 209, 465, 721, 977, 33, 289,
+    545, 801, 97, 353, 609, 865, 161, 417, 673, 929, 225, 481, 737, 993, 49,
+    305, 561, 817, 113, 369, 625, 881, 177, 433, 689, 945, 241, 497, 753,
+    1009, 5, 261, 517, 773, 69, 325, 581, 837, 133, 389, 645, 901, 197, 453,
+    709, 965, 21, 277, 533, 789, 85, 341, 597, 853, 149, 405, 661, 917, 213,
+    469, 725, 981, 37, 293, 549, 805, 101, 357, 613, 869, 165, 421, 677,
+    933, 229, 485, 741, 997, 53, 309, 565, 821, 117, 373, 629, 885, 181,
+    437, 693, 949, 245, 501, 757, 1013, 9, 265, 521, 777, 73, 329, 585, 841,
+    137, 393, 649, 905, 201, 457, 713, 969, 25, 281, 537, 793, 89, 345, 601,
+    857, 153, 409, 665, 921, 217, 473, 729, 985, 41, 297, 553, 809, 105,
+    361, 617, 873, 169, 425, 681, 937, 233, 489, 745, 1001, 57, 313, 569,
+    825, 121, 377, 633, 889, 185, 441, 697, 953, 249, 505, 761, 1017, 13,
+    269, 525, 781, 77, 333, 589, 845, 141, 397, 653, 909, 205, 461, 717,
+    973, 29, 285, 541, 797, 93, 349, 605, 861, 157, 413, 669, 925, 221, 477,
+    733, 989, 45, 301, 557, 813, 109, 365, 621, 877, 173, 429, 685, 941,
+    237, 493, 749, 1005, 61, 317, 573, 829, 125, 381, 637, 893, 189, 445,
+    701, 957, 253, 509, 765, 1021, 2, 258, 514, 770, 66, 322, 578, 834, 130,
+    386, 642, 898, 194, 450, 706, 962, 18, 274, 530, 786, 82, 338, 594, 850,
+    146, 402, 658, 914, 210, 466, 722, 978, 34, 290, 546, 802, 98, 354, 610,
+    866, 162, 418, 674, 930, 226, 482, 738, 994, 50, 306, 562, 818, 114,
+    370, 626, 882, 178, 434, 690, 946, 242, 498, 754, 1010, 6, 262, 518,
+    774, 70, 326, 582, 838, 134, 390, 646, 902, 198, 454, 710, 966, 22, 278,
+    534, 790, 86, 342, 598, 854, 150, 406, 662, 918, 214, 470, 726, 982, 38,
+    294, 550, 806, 102, 358, 614, 870, 166, 422, 678, 934, 230, 486, 742,
+    998, 54, 310, 566, 822, 118, 374, 630, 886, 182, 438, 694, 950, 246,
+    502, 758, 1014, 10, 266, 522, 778, 74, 330, 586, 842, 138, 394, 650,
+    906, 202, 458, 714, 970, 26, 282, 538, 794, 90, 346, 602, 858, 154, 410,
+    666, 922, 218, 474, 730, 986, 42, 298, 554, 810, 106, 362, 618, 874,
+    170, 426, 682, 938, 234, 490, 746, 1002, 58, 314, 570, 826, 122, 378,
+    634, 890, 186, 442, 698, 954, 250, 506, 762, 1018, 14, 270, 526, 782,
+    78, 334, 590, 846, 142, 398, 654, 910, 206, 462, 718, 974, 30, 286, 542,
+    798, 94, 350, 606, 862, 158, 414, 670, 926, 222, 478, 734, 990, 46, 302,
+    558, 814, 110, 366, 622, 878, 174, 430, 686, 942, 238, 494, 750, 1006,
+    62, 318, 574, 830, 126, 382, 638, 894, 190, 446, 702, 958, 254, 510,
+    766, 1022, 3, 259, 515, 771, 67, 323, 579, 835, 131, 387, 643, 899, 195,
+    451, 707, 963, 19, 275, 531, 787, 83, 339, 595, 851, 147, 403, 659, 915,
+    211, 467, 723, 979, 35, 291, 547, 803, 99, 355, 611, 867, 163, 419, 675,
+    931, 227, 483, 739, 995, 51, 307, 563, 819, 115, 371, 627, 883, 179,
+    435, 691, 947, 243, 499, 755, 1011, 7, 263, 519, 775, 71, 327, 583, 839,
+    135, 391, 647, 903, 199, 455, 711, 967, 23, 279, 535, 791, 87, 343, 599,
+    855, 151, 407, 663, 919, 215, 471, 727, 983, 39, 295, 551, 807, 103,
+    359, 615, 871, 167, 423, 679, 935, 231, 487, 743, 999, 55, 311, 567,
+    823, 119, 375, 631, 887, 183, 439, 695, 951, 247, 503, 759, 1015, 11,
+    267, 523, 779, 75, 331, 587, 843, 139, 395, 651, 907, 203, 459, 715,
+    971, 27, 283, 539, 795, 91, 347, 603, 859, 155, 411, 667, 923, 219, 475,
+    731, 987, 43, 299, 555, 811, 107, 363, 619, 875, 171, 427, 683, 939,
+    235, 491, 747, 1003, 59, 315, 571, 827, 123, 379, 635, 891, 187, 443,
+    699, 955, 251, 507, 763, 1019, 15, 271, 527, 783, 79, 335, 591, 847,
+    143, 399, 655, 911, 207, 463, 719, 975, 31, 287, 543, 799, 95, 351, 607,
+    863, 159, 415, 671, 927, 223, 479, 735, 991, 47, 303, 559, 815, 111,
+    367, 623, 879, 175, 431, 687, 943, 239, 495, 751, 1007, 63, 319, 575,
+    831, 127, 383, 639, 895, 191, 447, 703, 959, 255, 511, 767, 1023
+]);
+const COMPACT_TWIDDLES = new Float64Array([
+    1.0, 0.0, 1.0, 0.0, 1.0, 0.0, 1.0, 0.0, 1.0, 0.0, 1.0, 0.0,
+    0.9238795325112867, -0.3826834323650898, 0.7071067811865476,
+    -0.7071067811865475, 0.3826834323650898, -0.9238795325112867,
+    0.7071067811865476, -0.7071067811865475, -0.0, -1.0,
+    -0.7071067811865476, -0.7071067811865475, 0.3826834323650898,
+    -0.9238795325112867, -0.7071067811865476, -0.7071067811865475,
+    -0.9238795325112867, 0.3826834323650898, 1.0, 0.0, 1.0, 0.0, 1.0, 0.0,
+    0.9951847266721969, -0.0980171403295606, 0.9807852804032304,
+    -0.19509032201612825, 0.9569403357322088, -0.29028467725446233,
+    0.9807852804032304, -0.19509032201612825, 0.9238795325112867,
+    -0.3826834323650898, 0.8314696123025452, -0.5555702330196022,
+    0.9569403357322088, -0.29028467725446233, 0.8314696123025452,
+    -0.5555702330196022, 0.6343932841636455, -0.773010453362737,
+    0.9238795325112867, -0.3826834323650898, 0.7071067811865476,
+    -0.7071067811865475, 0.3826834323650898, -0.9238795325112867,
+    0.881921264348355, -0.47139673682599764, 0.5555702330196022,
+    -0.8314696123025452, 0.0980171403295606, -0.9951847266721969,
+    0.8314696123025452, -0.5555702330196022, 0.3826834323650898,
+    -0.9238795325112867, -0.19509032201612825, -0.9807852804032304,
+    0.773010453362737, -0.6343932841636455, 0.19509032201612825,
+    -0.9807852804032304, -0.47139673682599764, -0.881921264348355,
+    0.7071067811865476, -0.7071067811865475, -0.0, -1.0,
+    -0.7071067811865476, -0.7071067811865475, 0.6343932841636455,
+    -0.773010453362737, -0.19509032201612825, -0.9807852804032304,
+    -0.881921264348355, -0.47139673682599764, 0.5555702330196022,
+    -0.8314696123025452, -0.3826834323650898, -0.9238795325112867,
+    -0.9807852804032304, -0.19509032201612825, 0.47139673682599764,
+    -0.881921264348355, -0.5555702330196022, -0.8314696123025452,
+    -0.9951847266721969, 0.0980171403295606, 0.3826834323650898,
+    -0.9238795325112867, -0.7071067811865476, -0.7071067811865475,
+    -0.9238795325112867, 0.3826834323650898, 0.29028467725446233,
+    -0.9569403357322088, -0.8314696123025452, -0.5555702330196022,
+    -0.773010453362737, 0.6343932841636455, 0.19509032201612825,
+    -0.9807852804032304, -0.9238795325112867, -0.3826834323650898,
+    -0.5555702330196022, 0.8314696123025452, 0.0980171403295606,
+    -0.9951847266721969, -0.9807852804032304, -0.19509032201612825,
+    -0.29028467725446233, 0.9569403357322088, 1.0, 0.0, 1.0, 0.0, 1.0, 0.0,
+    0.9996988186962042, -0.024541228522912288, 0.9987954562051724,
+    -0.049067674327418015, 0.9972904566786902, -0.07356456359966743,
+    0.9987954562051724, -0.049067674327418015, 0.9951847266721969,
+    -0.0980171403295606, 0.989176509964781, -0.14673047445536175,
+    0.9972904566786902, -0.07356456359966743, 0.989176509964781,
+    -0.14673047445536175, 0.9757021300385286, -0.2191012401568698,
+    0.9951847266721969, -0.0980171403295606, 0.9807852804032304,
+    -0.19509032201612825, 0.9569403357322088, -0.29028467725446233,
+    0.99247953459871, -0.1224106751992162, 0.970031253194544,
+    -0.24298017990326387, 0.932992798834739, -0.3598950365349881,
+    0.989176509964781, -0.14673047445536175, 0.9569403357322088,
+    -0.29028467725446233, 0.9039892931234433, -0.4275550934302821,
+    0.9852776423889412, -0.17096188876030122, 0.9415440651830208,
+    -0.33688985339222005, 0.8700869911087115, -0.49289819222978404,
+    0.9807852804032304, -0.19509032201612825, 0.9238795325112867,
+    -0.3826834323650898, 0.8314696123025452, -0.5555702330196022,
+    0.9757021300385286, -0.2191012401568698, 0.9039892931234433,
+    -0.4275550934302821, 0.7883464276266063, -0.6152315905806268,
+    0.970031253194544, -0.24298017990326387, 0.881921264348355,
+    -0.47139673682599764, 0.7409511253549591, -0.6715589548470183,
+    0.9637760657954398, -0.26671275747489837, 0.8577286100002721,
+    -0.5141027441932217, 0.6895405447370668, -0.724247082951467,
+    0.9569403357322088, -0.29028467725446233, 0.8314696123025452,
+    -0.5555702330196022, 0.6343932841636455, -0.773010453362737,
+    0.9495281805930367, -0.3136817403988915, 0.8032075314806449,
+    -0.5956993044924334, 0.5758081914178453, -0.8175848131515837,
+    0.9415440651830208, -0.33688985339222005, 0.773010453362737,
+    -0.6343932841636455, 0.5141027441932217, -0.8577286100002721,
+    0.932992798834739, -0.3598950365349881, 0.7409511253549591,
+    -0.6715589548470183, 0.44961132965460654, -0.8932243011955153,
+    0.9238795325112867, -0.3826834323650898, 0.7071067811865476,
+    -0.7071067811865475, 0.3826834323650898, -0.9238795325112867,
+    0.9142097557035307, -0.40524131400498986, 0.6715589548470183,
+    -0.7409511253549591, 0.3136817403988915, -0.9495281805930367,
+    0.9039892931234433, -0.4275550934302821, 0.6343932841636455,
+    -0.773010453362737, 0.24298017990326387, -0.970031253194544,
+    0.8932243011955153, -0.44961132965460654, 0.5956993044924334,
+    -0.8032075314806449, 0.17096188876030122, -0.9852776423889412,
+    0.881921264348355, -0.47139673682599764, 0.5555702330196022,
+    -0.8314696123025452, 0.0980171403295606, -0.9951847266721969,
+    0.8700869911087115, -0.49289819222978404, 0.5141027441932217,
+    -0.8577286100002721, 0.024541228522912288, -0.9996988186962042,
+    0.8577286100002721, -0.5141027441932217, 0.47139673682599764,
+    -0.881921264348355, -0.049067674327418015, -0.9987954562051724,
+    0.8448535652497071, -0.5349976198870972, 0.4275550934302821,
+    -0.9039892931234433, -0.1224106751992162, -0.99247953459871,
+    0.8314696123025452, -0.5555702330196022, 0.3826834323650898,
+    -0.9238795325112867, -0.19509032201612825, -0.9807852804032304,
+    0.8175848131515837, -0.5758081914178453, 0.33688985339222005,
+    -0.9415440651830208, -0.26671275747489837, -0.9637760657954398,
+    0.8032075314806449, -0.5956993044924334, 0.29028467725446233,
+    -0.9569403357322088, -0.33688985339222005, -0.9415440651830208,
+    0.7883464276266063, -0.6152315905806268, 0.24298017990326387,
+    -0.970031253194544, -0.40524131400498986, -0.9142097557035307,
+    0.773010453362737, -0.6343932841636455, 0.19509032201612825,
+    -0.9807852804032304, -0.47139673682599764, -0.881921264348355,
+    0.7572088465064846, -0.6531728429537768, 0.14673047445536175,
+    -0.989176509964781, -0.5349976198870972, -0.8448535652497071,
+    0.7409511253549591, -0.6715589548470183, 0.0980171403295606,
+    -0.9951847266721969, -0.5956993044924334, -0.8032075314806449,
+    0.724247082951467, -0.6895405447370668, 0.049067674327418015,
+    -0.9987954562051724, -0.6531728429537768, -0.7572088465064846,
+    0.7071067811865476, -0.7071067811865475, -0.0, -1.0,
+    -0.7071067811865476, -0.7071067811865475, 0.6895405447370668,
+    -0.724247082951467, -0.049067674327418015, -0.9987954562051724,
+    -0.7572088465064846, -0.6531728429537768, 0.6715589548470183,
+    -0.7409511253549591, -0.0980171403295606, -0.9951847266721969,
+    -0.8032075314806449, -0.5956993044924334, 0.6531728429537768,
+    -0.7572088465064846, -0.14673047445536175, -0.989176509964781,
+    -0.8448535652497071, -0.5349976198870972, 0.6343932841636455,
+    -0.773010453362737, -0.19509032201612825, -0.9807852804032304,
+    -0.881921264348355, -0.47139673682599764, 0.6152315905806268,
+    -0.7883464276266063, -0.24298017990326387, -0.970031253194544,
+    -0.9142097557035307, -0.40524131400498986, 0.5956993044924334,
+    -0.8032075314806449, -0.29028467725446233, -0.9569403357322088,
+    -0.9415440651830208, -0.33688985339222005, 0.5758081914178453,
+    -0.8175848131515837, -0.33688985339222005, -0.9415440651830208,
+    -0.9637760657954398, -0.26671275747489837, 0.5555702330196022,
+    -0.8314696123025452, -0.3826834323650898, -0.9238795325112867,
+    -0.9807852804032304, -0.19509032201612825, 0.5349976198870972,
+    -0.8448535652497071, -0.4275550934302821, -0.9039892931234433,
+    -0.99247953459871, -0.1224106751992162, 0.5141027441932217,
+    -0.8577286100002721, -0.47139673682599764, -0.881921264348355,
+    -0.9987954562051724, -0.049067674327418015, 0.49289819222978404,
+    -0.8700869911087115, -0.5141027441932217, -0.8577286100002721,
+    -0.9996988186962042, 0.024541228522912288, 0.47139673682599764,
+    -0.881921264348355, -0.5555702330196022, -0.8314696123025452,
+    -0.9951847266721969, 0.0980171403295606, 0.44961132965460654,
+    -0.8932243011955153, -0.5956993044924334, -0.8032075314806449,
+    -0.9852776423889412, 0.17096188876030122, 0.4275550934302821,
+    -0.9039892931234433, -0.6343932841636455, -0.773010453362737,
+    -0.970031253194544, 0.24298017990326387, 0.40524131400498986,
+    -0.9142097557035307, -0.6715589548470183, -0.7409511253549591,
+    -0.9495281805930367, 0.3136817403988915, 0.3826834323650898,
+    -0.9238795325112867, -0.7071067811865476, -0.7071067811865475,
+    -0.9238795325112867, 0.3826834323650898, 0.3598950365349881,
+    -0.932992798834739, -0.7409511253549591, -0.6715589548470183,
+    -0.8932243011955153, 0.44961132965460654, 0.33688985339222005,
+    -0.9415440651830208, -0.773010453362737, -0.6343932841636455,
+    -0.8577286100002721, 0.5141027441932217, 0.3136817403988915,
+    -0.9495281805930367, -0.8032075314806449, -0.5956993044924334,
+    -0.8175848131515837, 0.5758081914178453, 0.29028467725446233,
+    -0.9569403357322088, -0.8314696123025452, -0.5555702330196022,
+    -0.773010453362737, 0.6343932841636455, 0.26671275747489837,
+    -0.9637760657954398, -0.8577286100002721, -0.5141027441932217,
+    -0.724247082951467, 0.6895405447370668, 0.24298017990326387,
+    -0.970031253194544, -0.881921264348355, -0.47139673682599764,
+    -0.6715589548470183, 0.7409511253549591, 0.2191012401568698,
+    -0.9757021300385286, -0.9039892931234433, -0.4275550934302821,
+    -0.6152315905806268, 0.7883464276266063, 0.19509032201612825,
+    -0.9807852804032304, -0.9238795325112867, -0.3826834323650898,
+    -0.5555702330196022, 0.8314696123025452, 0.17096188876030122,
+    -0.9852776423889412, -0.9415440651830208, -0.33688985339222005,
+    -0.49289819222978404, 0.8700869911087115, 0.14673047445536175,
+    -0.989176509964781, -0.9569403357322088, -0.29028467725446233,
+    -0.4275550934302821, 0.9039892931234433, 0.1224106751992162,
+    -0.99247953459871, -0.970031253194544, -0.24298017990326387,
+    -0.3598950365349881, 0.932992798834739, 0.0980171403295606,
+    -0.9951847266721969, -0.9807852804032304, -0.19509032201612825,
+    -0.29028467725446233, 0.9569403357322088, 0.07356456359966743,
+    -0.9972904566786902, -0.989176509964781, -0.14673047445536175,
+    -0.2191012401568698, 0.9757021300385286, 0.049067674327418015,
+    -0.9987954562051724, -0.9951847266721969, -0.0980171403295606,
+    -0.14673047445536175, 0.989176509964781, 0.024541228522912288,
+    -0.9996988186962042, -0.9987954562051724, -0.049067674327418015,
+    -0.07356456359966743, 0.9972904566786902, 1.0, 0.0, 1.0, 0.0, 1.0, 0.0,
+    0.9999811752826011, -0.006135884649154475, 0.9999247018391445,
+    -0.012271538285719925, 0.9998305817958234, -0.01840672990580482,
+    0.9999247018391445, -0.012271538285719925, 0.9996988186962042,
+    -0.024541228522912288, 0.9993223845883495, -0.03680722294135883,
+    0.9998305817958234, -0.01840672990580482, 0.9993223845883495,
+    -0.03680722294135883, 0.9984755805732948, -0.055195244349689934,
+    0.9996988186962042, -0.024541228522912288, 0.9987954562051724,
+    -0.049067674327418015, 0.9972904566786902, -0.07356456359966743,
+    0.9995294175010931, -0.030674803176636626, 0.9981181129001492,
+    -0.06132073630220858, 0.9957674144676598, -0.09190895649713272,
+    0.9993223845883495, -0.03680722294135883, 0.9972904566786902,
+    -0.07356456359966743, 0.9939069700023561, -0.11022220729388306,
+    0.9990777277526454, -0.04293825693494082, 0.996312612182778,
+    -0.0857973123444399, 0.9917097536690995, -0.12849811079379317,
+    0.9987954562051724, -0.049067674327418015, 0.9951847266721969,
+    -0.0980171403295606, 0.989176509964781, -0.14673047445536175,
+    0.9984755805732948, -0.055195244349689934, 0.9939069700023561,
+    -0.11022220729388306, 0.9863080972445987, -0.16491312048996992,
+    0.9981181129001492, -0.06132073630220858, 0.99247953459871,
+    -0.1224106751992162, 0.9831054874312163, -0.18303988795514095,
+    0.9977230666441916, -0.06744391956366405, 0.99090263542778,
+    -0.13458070850712617, 0.9795697656854405, -0.2011046348420919,
+    0.9972904566786902, -0.07356456359966743, 0.989176509964781,
+    -0.14673047445536175, 0.9757021300385286, -0.2191012401568698,
+    0.9968202992911657, -0.07968243797143013, 0.9873014181578584,
+    -0.15885814333386145, 0.9715038909862518, -0.2370236059943672,
+    0.996312612182778, -0.0857973123444399, 0.9852776423889412,
+    -0.17096188876030122, 0.9669764710448521, -0.25486565960451457,
+    0.9957674144676598, -0.09190895649713272, 0.9831054874312163,
+    -0.18303988795514095, 0.9621214042690416, -0.272621355449949,
+    0.9951847266721969, -0.0980171403295606, 0.9807852804032304,
+    -0.19509032201612825, 0.9569403357322088, -0.29028467725446233,
+    0.9945645707342554, -0.10412163387205459, 0.9783173707196277,
+    -0.20711137619221856, 0.9514350209690083, -0.30784964004153487,
+    0.9939069700023561, -0.11022220729388306, 0.9757021300385286,
+    -0.2191012401568698, 0.9456073253805213, -0.3253102921622629,
+    0.9932119492347945, -0.11631863091190475, 0.9729399522055602,
+    -0.2310581082806711, 0.9394592236021899, -0.3426607173119944,
+    0.99247953459871, -0.1224106751992162, 0.970031253194544,
+    -0.24298017990326387, 0.932992798834739, -0.3598950365349881,
+    0.9917097536690995, -0.12849811079379317, 0.9669764710448521,
+    -0.25486565960451457, 0.9262102421383114, -0.37700741021641826,
+    0.99090263542778, -0.13458070850712617, 0.9637760657954398,
+    -0.26671275747489837, 0.9191138516900578, -0.3939920400610481,
+    0.9900582102622971, -0.1406582393328492, 0.9604305194155658,
+    -0.27851968938505306, 0.9117060320054299, -0.4108431710579039,
+    0.989176509964781, -0.14673047445536175, 0.9569403357322088,
+    -0.29028467725446233, 0.9039892931234433, -0.4275550934302821,
+    0.9882575677307495, -0.15279718525844344, 0.9533060403541939,
+    -0.3020059493192281, 0.8959662497561852, -0.4441221445704292,
+    0.9873014181578584, -0.15885814333386145, 0.9495281805930367,
+    -0.3136817403988915, 0.8876396204028539, -0.46053871095824,
+    0.9863080972445987, -0.16491312048996992, 0.9456073253805213,
+    -0.3253102921622629, 0.8790122264286335, -0.4767992300633221,
+    0.9852776423889412, -0.17096188876030122, 0.9415440651830208,
+    -0.33688985339222005, 0.8700869911087115, -0.49289819222978404,
+    0.984210092386929, -0.17700422041214875, 0.937339011912575,
+    -0.34841868024943456, 0.8608669386377673, -0.508830142543107,
+    0.9831054874312163, -0.18303988795514095, 0.932992798834739,
+    -0.3598950365349881, 0.8513551931052652, -0.524589682678469,
+    0.9819638691095552, -0.1890686641498062, 0.9285060804732156,
+    -0.37131719395183754, 0.8415549774368984, -0.5401714727298929,
+    0.9807852804032304, -0.19509032201612825, 0.9238795325112867,
+    -0.3826834323650898, 0.8314696123025452, -0.5555702330196022,
+    0.9795697656854405, -0.2011046348420919, 0.9191138516900578,
+    -0.3939920400610481, 0.8211025149911046, -0.5707807458869673,
+    0.9783173707196277, -0.20711137619221856, 0.9142097557035307,
+    -0.40524131400498986, 0.8104571982525948, -0.5857978574564389,
+    0.9770281426577544, -0.21311031991609136, 0.9091679830905224,
+    -0.41642956009763715, 0.799537269107905, -0.600616479383869,
+    0.9757021300385286, -0.2191012401568698, 0.9039892931234433,
+    -0.4275550934302821, 0.7883464276266063, -0.6152315905806268,
+    0.9743393827855759, -0.22508391135979283, 0.8986744656939538,
+    -0.43861623853852766, 0.7768884656732324, -0.629638238914927,
+    0.9729399522055602, -0.2310581082806711, 0.8932243011955153,
+    -0.44961132965460654, 0.765167265622459, -0.6438315428897914,
+    0.9715038909862518, -0.2370236059943672, 0.8876396204028539,
+    -0.46053871095824, 0.7531867990436125, -0.6578066932970786,
+    0.970031253194544, -0.24298017990326387, 0.881921264348355,
+    -0.47139673682599764, 0.7409511253549591, -0.6715589548470183,
+    0.9685220942744174, -0.24892760574572015, 0.8760700941954066,
+    -0.4821837720791227, 0.7284643904482252, -0.6850836677727004,
+    0.9669764710448521, -0.25486565960451457, 0.8700869911087115,
+    -0.49289819222978404, 0.7157308252838186, -0.6983762494089729,
+    0.9653944416976894, -0.2607941179152755, 0.8639728561215868,
+    -0.5035383837257176, 0.7027547444572253, -0.7114321957452164,
+    0.9637760657954398, -0.26671275747489837, 0.8577286100002721,
+    -0.5141027441932217, 0.6895405447370668, -0.724247082951467,
+    0.9621214042690416, -0.272621355449949, 0.8513551931052652,
+    -0.524589682678469, 0.6760927035753159, -0.7368165688773699,
+    0.9604305194155658, -0.27851968938505306, 0.8448535652497071,
+    -0.5349976198870972, 0.6624157775901718, -0.7491363945234594,
+    0.9587034748958716, -0.2844075372112719, 0.8382247055548381,
+    -0.5453249884220465, 0.6485144010221124, -0.7612023854842618,
+    0.9569403357322088, -0.29028467725446233, 0.8314696123025452,
+    -0.5555702330196022, 0.6343932841636455, -0.773010453362737,
+    0.9551411683057708, -0.2961508882436238, 0.8245893027850253,
+    -0.5657318107836131, 0.6200572117632891, -0.7845565971555752,
+    0.9533060403541939, -0.3020059493192281, 0.8175848131515837,
+    -0.5758081914178453, 0.6055110414043255, -0.7958369046088836,
+    0.9514350209690083, -0.30784964004153487, 0.8104571982525948,
+    -0.5857978574564389, 0.5907597018588742, -0.8068475535437993,
+    0.9495281805930367, -0.3136817403988915, 0.8032075314806449,
+    -0.5956993044924334, 0.5758081914178453, -0.8175848131515837,
+    0.9475855910177411, -0.3195020308160157, 0.7958369046088836,
+    -0.6055110414043255, 0.560661576197336, -0.8280450452577558,
+    0.9456073253805213, -0.3253102921622629, 0.7883464276266063,
+    -0.6152315905806268, 0.5453249884220465, -0.8382247055548381,
+    0.9435934581619604, -0.33110630575987643, 0.7807372285720945,
+    -0.6248594881423863, 0.5298036246862946, -0.8481203448032972,
+    0.9415440651830208, -0.33688985339222005, 0.773010453362737,
+    -0.6343932841636455, 0.5141027441932217, -0.8577286100002721,
+    0.9394592236021899, -0.3426607173119944, 0.765167265622459,
+    -0.6438315428897914, 0.49822766697278187, -0.8670462455156926,
+    0.937339011912575, -0.34841868024943456, 0.7572088465064846,
+    -0.6531728429537768, 0.4821837720791227, -0.8760700941954066,
+    0.9351835099389476, -0.35416352542049034, 0.7491363945234594,
+    -0.6624157775901718, 0.4659764957679662, -0.8847970984309378,
+    0.932992798834739, -0.3598950365349881, 0.7409511253549591,
+    -0.6715589548470183, 0.44961132965460654, -0.8932243011955153,
+    0.9307669610789837, -0.36561299780477385, 0.7326542716724128,
+    -0.680600997795453, 0.43309381885315196, -0.901348847046022,
+    0.9285060804732156, -0.37131719395183754, 0.724247082951467,
+    -0.6895405447370668, 0.41642956009763715, -0.9091679830905224,
+    0.9262102421383114, -0.37700741021641826, 0.7157308252838186,
+    -0.6983762494089729, 0.3996241998456468, -0.9166790599210427,
+    0.9238795325112867, -0.3826834323650898, 0.7071067811865476,
+    -0.7071067811865475, 0.3826834323650898, -0.9238795325112867,
+    0.921514039342042, -0.38834504669882625, 0.6983762494089729,
+    -0.7157308252838186, 0.36561299780477385, -0.9307669610789837,
+    0.9191138516900578, -0.3939920400610481, 0.6895405447370668,
+    -0.724247082951467, 0.34841868024943456, -0.937339011912575,
+    0.9166790599210427, -0.3996241998456468, 0.680600997795453,
+    -0.7326542716724128, 0.33110630575987643, -0.9435934581619604,
+    0.9142097557035307, -0.40524131400498986, 0.6715589548470183,
+    -0.7409511253549591, 0.3136817403988915, -0.9495281805930367,
+    0.9117060320054299, -0.4108431710579039, 0.6624157775901718,
+    -0.7491363945234594, 0.2961508882436238, -0.9551411683057708,
+    0.9091679830905224, -0.41642956009763715, 0.6531728429537768,
+    -0.7572088465064846, 0.27851968938505306, -0.9604305194155658,
+    0.9065957045149153, -0.4220002707997997, 0.6438315428897914,
+    -0.765167265622459, 0.2607941179152755, -0.9653944416976894,
+    0.9039892931234433, -0.4275550934302821, 0.6343932841636455,
+    -0.773010453362737, 0.24298017990326387, -0.970031253194544,
+    0.901348847046022, -0.43309381885315196, 0.6248594881423863,
+    -0.7807372285720945, 0.22508391135979283, -0.9743393827855759,
+    0.8986744656939538, -0.43861623853852766, 0.6152315905806268,
+    -0.7883464276266063, 0.20711137619221856, -0.9783173707196277,
+    0.8959662497561852, -0.4441221445704292, 0.6055110414043255,
+    -0.7958369046088836, 0.1890686641498062, -0.9819638691095552,
+    0.8932243011955153, -0.44961132965460654, 0.5956993044924334,
+    -0.8032075314806449, 0.17096188876030122, -0.9852776423889412,
+    0.8904487232447579, -0.45508358712634384, 0.5857978574564389,
+    -0.8104571982525948, 0.15279718525844344, -0.9882575677307495,
+    0.8876396204028539, -0.46053871095824, 0.5758081914178453,
+    -0.8175848131515837, 0.13458070850712617, -0.99090263542778,
+    0.8847970984309378, -0.4659764957679662, 0.5657318107836131,
+    -0.8245893027850253, 0.11631863091190475, -0.9932119492347945,
+    0.881921264348355, -0.47139673682599764, 0.5555702330196022,
+    -0.8314696123025452, 0.0980171403295606, -0.9951847266721969,
+    0.8790122264286335, -0.4767992300633221, 0.5453249884220465,
+    -0.8382247055548381, 0.07968243797143013, -0.9968202992911657,
+    0.8760700941954066, -0.4821837720791227, 0.5349976198870972,
+    -0.8448535652497071, 0.06132073630220858, -0.9981181129001492,
+    0.8730949784182901, -0.487550160148436, 0.524589682678469,
+    -0.8513551931052652, 0.04293825693494082, -0.9990777277526454,
+    0.8700869911087115, -0.49289819222978404, 0.5141027441932217,
+    -0.8577286100002721, 0.024541228522912288, -0.9996988186962042,
+    0.8670462455156926, -0.49822766697278187, 0.5035383837257176,
+    -0.8639728561215868, 0.006135884649154475, -0.9999811752826011,
+    0.8639728561215868, -0.5035383837257176, 0.49289819222978404,
+    -0.8700869911087115, -0.012271538285719925, -0.9999247018391445,
+    0.8608669386377673, -0.508830142543107, 0.4821837720791227,
+    -0.8760700941954066, -0.030674803176636626, -0.9995294175010931,
+    0.8577286100002721, -0.5141027441932217, 0.47139673682599764,
+    -0.881921264348355, -0.049067674327418015, -0.9987954562051724,
+    0.8545579883654005, -0.5193559901655896, 0.46053871095824,
+    -0.8876396204028539, -0.06744391956366405, -0.9977230666441916,
+    0.8513551931052652, -0.524589682678469, 0.44961132965460654,
+    -0.8932243011955153, -0.0857973123444399, -0.996312612182778,
+    0.8481203448032972, -0.5298036246862946, 0.43861623853852766,
+    -0.8986744656939538, -0.10412163387205459, -0.9945645707342554,
+    0.8448535652497071, -0.5349976198870972, 0.4275550934302821,
+    -0.9039892931234433, -0.1224106751992162, -0.99247953459871,
+    0.8415549774368984, -0.5401714727298929, 0.41642956009763715,
+    -0.9091679830905224, -0.1406582393328492, -0.9900582102622971,
+    0.8382247055548381, -0.5453249884220465, 0.40524131400498986,
+    -0.9142097557035307, -0.15885814333386145, -0.9873014181578584,
+    0.83486287498638, -0.5504579729366048, 0.3939920400610481,
+    -0.9191138516900578, -0.17700422041214875, -0.984210092386929,
+    0.8314696123025452, -0.5555702330196022, 0.3826834323650898,
+    -0.9238795325112867, -0.19509032201612825, -0.9807852804032304,
+    0.8280450452577558, -0.560661576197336, 0.37131719395183754,
+    -0.9285060804732156, -0.21311031991609136, -0.9770281426577544,
+    0.8245893027850253, -0.5657318107836131, 0.3598950365349881,
+    -0.932992798834739, -0.2310581082806711, -0.9729399522055602,
+    0.8211025149911046, -0.5707807458869673, 0.34841868024943456,
+    -0.937339011912575, -0.24892760574572015, -0.9685220942744174,
+    0.8175848131515837, -0.5758081914178453, 0.33688985339222005,
+    -0.9415440651830208, -0.26671275747489837, -0.9637760657954398,
+    0.8140363297059484, -0.5808139580957645, 0.3253102921622629,
+    -0.9456073253805213, -0.2844075372112719, -0.9587034748958716,
+    0.8104571982525948, -0.5857978574564389, 0.3136817403988915,
+    -0.9495281805930367, -0.3020059493192281, -0.9533060403541939,
+    0.8068475535437993, -0.5907597018588742, 0.3020059493192281,
+    -0.9533060403541939, -0.3195020308160157, -0.9475855910177411,
+    0.8032075314806449, -0.5956993044924334, 0.29028467725446233,
+    -0.9569403357322088, -0.33688985339222005, -0.9415440651830208,
+    0.799537269107905, -0.600616479383869, 0.27851968938505306,
+    -0.9604305194155658, -0.35416352542049034, -0.9351835099389476,
+    0.7958369046088836, -0.6055110414043255, 0.26671275747489837,
+    -0.9637760657954398, -0.37131719395183754, -0.9285060804732156,
+    0.7921065773002124, -0.6103828062763095, 0.25486565960451457,
+    -0.9669764710448521, -0.38834504669882625, -0.921514039342042,
+    0.7883464276266063, -0.6152315905806268, 0.24298017990326387,
+    -0.970031253194544, -0.40524131400498986, -0.9142097557035307,
+    0.7845565971555752, -0.6200572117632891, 0.2310581082806711,
+    -0.9729399522055602, -0.4220002707997997, -0.9065957045149153,
+    0.7807372285720945, -0.6248594881423863, 0.2191012401568698,
+    -0.9757021300385286, -0.43861623853852766, -0.8986744656939538,
+    0.7768884656732324, -0.629638238914927, 0.20711137619221856,
+    -0.9783173707196277, -0.45508358712634384, -0.8904487232447579,
+    0.773010453362737, -0.6343932841636455, 0.19509032201612825,
+    -0.9807852804032304, -0.47139673682599764, -0.881921264348355,
+    0.7691033376455797, -0.6391244448637757, 0.18303988795514095,
+    -0.9831054874312163, -0.487550160148436, -0.8730949784182901,
+    0.765167265622459, -0.6438315428897914, 0.17096188876030122,
+    -0.9852776423889412, -0.5035383837257176, -0.8639728561215868,
+    0.7612023854842618, -0.6485144010221124, 0.15885814333386145,
+    -0.9873014181578584, -0.5193559901655896, -0.8545579883654005,
+    0.7572088465064846, -0.6531728429537768, 0.14673047445536175,
+    -0.989176509964781, -0.5349976198870972, -0.8448535652497071,
+    0.7531867990436125, -0.6578066932970786, 0.13458070850712617,
+    -0.99090263542778, -0.5504579729366048, -0.83486287498638,
+    0.7491363945234594, -0.6624157775901718, 0.1224106751992162,
+    -0.99247953459871, -0.5657318107836131, -0.8245893027850253,
+    0.7450577854414661, -0.6669999223036375, 0.11022220729388306,
+    -0.9939069700023561, -0.5808139580957645, -0.8140363297059484,
+    0.7409511253549591, -0.6715589548470183, 0.0980171403295606,
+    -0.9951847266721969, -0.5956993044924334, -0.8032075314806449,
+    0.7368165688773699, -0.6760927035753159, 0.0857973123444399,
+    -0.996312612182778, -0.6103828062763095, -0.7921065773002124,
+    0.7326542716724128, -0.680600997795453, 0.07356456359966743,
+    -0.9972904566786902, -0.6248594881423863, -0.7807372285720945,
+    0.7284643904482252, -0.6850836677727004, 0.06132073630220858,
+    -0.9981181129001492, -0.6391244448637757, -0.7691033376455797,
+    0.724247082951467, -0.6895405447370668, 0.049067674327418015,
+    -0.9987954562051724, -0.6531728429537768, -0.7572088465064846,
+    0.7200025079613817, -0.693971460889654, 0.03680722294135883,
+    -0.9993223845883495, -0.6669999223036375, -0.7450577854414661,
+    0.7157308252838186, -0.6983762494089729, 0.024541228522912288,
+    -0.9996988186962042, -0.680600997795453, -0.7326542716724128,
+    0.7114321957452164, -0.7027547444572253, 0.012271538285719925,
+    -0.9999247018391445, -0.693971460889654, -0.7200025079613817,
+    0.7071067811865476, -0.7071067811865475, -0.0, -1.0,
+    -0.7071067811865476, -0.7071067811865475, 0.7027547444572253,
+    -0.7114321957452164, -0.012271538285719925, -0.9999247018391445,
+    -0.7200025079613817, -0.693971460889654, 0.6983762494089729,
+    -0.7157308252838186, -0.024541228522912288, -0.9996988186962042,
+    -0.7326542716724128, -0.680600997795453, 0.693971460889654,
+    -0.7200025079613817, -0.03680722294135883, -0.9993223845883495,
+    -0.7450577854414661, -0.6669999223036375, 0.6895405447370668,
+    -0.724247082951467, -0.049067674327418015, -0.9987954562051724,
+    -0.7572088465064846, -0.6531728429537768, 0.6850836677727004,
+    -0.7284643904482252, -0.06132073630220858, -0.9981181129001492,
+    -0.7691033376455797, -0.6391244448637757, 0.680600997795453,
+    -0.7326542716724128, -0.07356456359966743, -0.9972904566786902,
+    -0.7807372285720945, -0.6248594881423863, 0.6760927035753159,
+    -0.7368165688773699, -0.0857973123444399, -0.996312612182778,
+    -0.7921065773002124, -0.6103828062763095, 0.6715589548470183,
+    -0.7409511253549591, -0.0980171403295606, -0.9951847266721969,
+    -0.8032075314806449, -0.5956993044924334, 0.6669999223036375,
+    -0.7450577854414661, -0.11022220729388306, -0.9939069700023561,
+    -0.8140363297059484, -0.5808139580957645, 0.6624157775901718,
+    -0.7491363945234594, -0.1224106751992162, -0.99247953459871,
+    -0.8245893027850253, -0.5657318107836131, 0.6578066932970786,
+    -0.7531867990436125, -0.13458070850712617, -0.99090263542778,
+    -0.83486287498638, -0.5504579729366048, 0.6531728429537768,
+    -0.7572088465064846, -0.14673047445536175, -0.989176509964781,
+    -0.8448535652497071, -0.5349976198870972, 0.6485144010221124,
+    -0.7612023854842618, -0.15885814333386145, -0.9873014181578584,
+    -0.8545579883654005, -0.5193559901655896, 0.6438315428897914,
+    -0.765167265622459, -0.17096188876030122, -0.9852776423889412,
+    -0.8639728561215868, -0.5035383837257176, 0.6391244448637757,
+    -0.7691033376455797, -0.18303988795514095, -0.9831054874312163,
+    -0.8730949784182901, -0.487550160148436, 0.6343932841636455,
+    -0.773010453362737, -0.19509032201612825, -0.9807852804032304,
+    -0.881921264348355, -0.47139673682599764, 0.629638238914927,
+    -0.7768884656732324, -0.20711137619221856, -0.9783173707196277,
+    -0.8904487232447579, -0.45508358712634384, 0.6248594881423863,
+    -0.7807372285720945, -0.2191012401568698, -0.9757021300385286,
+    -0.8986744656939538, -0.43861623853852766, 0.6200572117632891,
+    -0.7845565971555752, -0.2310581082806711, -0.9729399522055602,
+    -0.9065957045149153, -0.4220002707997997, 0.6152315905806268,
+    -0.7883464276266063, -0.24298017990326387, -0.970031253194544,
+    -0.9142097557035307, -0.40524131400498986, 0.6103828062763095,
+    -0.7921065773002124, -0.25486565960451457, -0.9669764710448521,
+    -0.921514039342042, -0.38834504669882625, 0.6055110414043255,
+    -0.7958369046088836, -0.26671275747489837, -0.9637760657954398,
+    -0.9285060804732156, -0.37131719395183754, 0.600616479383869,
+    -0.799537269107905, -0.27851968938505306, -0.9604305194155658,
+    -0.9351835099389476, -0.35416352542049034, 0.5956993044924334,
+    -0.8032075314806449, -0.29028467725446233, -0.9569403357322088,
+    -0.9415440651830208, -0.33688985339222005, 0.5907597018588742,
+    -0.8068475535437993, -0.3020059493192281, -0.9533060403541939,
+    -0.9475855910177411, -0.3195020308160157, 0.5857978574564389,
+    -0.8104571982525948, -0.3136817403988915, -0.9495281805930367,
+    -0.9533060403541939, -0.3020059493192281, 0.5808139580957645,
+    -0.8140363297059484, -0.3253102921622629, -0.9456073253805213,
+    -0.9587034748958716, -0.2844075372112719, 0.5758081914178453,
+    -0.8175848131515837, -0.33688985339222005, -0.9415440651830208,
+    -0.9637760657954398, -0.26671275747489837, 0.5707807458869673,
+    -0.8211025149911046, -0.34841868024943456, -0.937339011912575,
+    -0.9685220942744174, -0.24892760574572015, 0.5657318107836131,
+    -0.8245893027850253, -0.3598950365349881, -0.932992798834739,
+    -0.9729399522055602, -0.2310581082806711, 0.560661576197336,
+    -0.8280450452577558, -0.37131719395183754, -0.9285060804732156,
+    -0.9770281426577544, -0.21311031991609136, 0.5555702330196022,
+    -0.8314696123025452, -0.3826834323650898, -0.9238795325112867,
+    -0.9807852804032304, -0.19509032201612825, 0.5504579729366048,
+    -0.83486287498638, -0.3939920400610481, -0.9191138516900578,
+    -0.984210092386929, -0.17700422041214875, 0.5453249884220465,
+    -0.8382247055548381, -0.40524131400498986, -0.9142097557035307,
+    -0.9873014181578584, -0.15885814333386145, 0.5401714727298929,
+    -0.8415549774368984, -0.41642956009763715, -0.9091679830905224,
+    -0.9900582102622971, -0.1406582393328492, 0.5349976198870972,
+    -0.8448535652497071, -0.4275550934302821, -0.9039892931234433,
+    -0.99247953459871, -0.1224106751992162, 0.5298036246862946,
+    -0.8481203448032972, -0.43861623853852766, -0.8986744656939538,
+    -0.9945645707342554, -0.10412163387205459, 0.524589682678469,
+    -0.8513551931052652, -0.44961132965460654, -0.8932243011955153,
+    -0.996312612182778, -0.0857973123444399, 0.5193559901655896,
+    -0.8545579883654005, -0.46053871095824, -0.8876396204028539,
+    -0.9977230666441916, -0.06744391956366405, 0.5141027441932217,
+    -0.8577286100002721, -0.47139673682599764, -0.881921264348355,
+    -0.9987954562051724, -0.049067674327418015, 0.508830142543107,
+    -0.8608669386377673, -0.4821837720791227, -0.8760700941954066,
+    -0.9995294175010931, -0.030674803176636626, 0.5035383837257176,
+    -0.8639728561215868, -0.49289819222978404, -0.8700869911087115,
+    -0.9999247018391445, -0.012271538285719925, 0.49822766697278187,
+    -0.8670462455156926, -0.5035383837257176, -0.8639728561215868,
+    -0.9999811752826011, 0.006135884649154475, 0.49289819222978404,
+    -0.8700869911087115, -0.5141027441932217, -0.8577286100002721,
+    -0.9996988186962042, 0.024541228522912288, 0.487550160148436,
+    -0.8730949784182901, -0.524589682678469, -0.8513551931052652,
+    -0.9990777277526454, 0.04293825693494082, 0.4821837720791227,
+    -0.8760700941954066, -0.5349976198870972, -0.8448535652497071,
+    -0.9981181129001492, 0.06132073630220858, 0.4767992300633221,
+    -0.8790122264286335, -0.5453249884220465, -0.8382247055548381,
+    -0.9968202992911657, 0.07968243797143013, 0.47139673682599764,
+    -0.881921264348355, -0.5555702330196022, -0.8314696123025452,
+    -0.9951847266721969, 0.0980171403295606, 0.4659764957679662,
+    -0.8847970984309378, -0.5657318107836131, -0.8245893027850253,
+    -0.9932119492347945, 0.11631863091190475, 0.46053871095824,
+    -0.8876396204028539, -0.5758081914178453, -0.8175848131515837,
+    -0.99090263542778, 0.13458070850712617, 0.45508358712634384,
+    -0.8904487232447579, -0.5857978574564389, -0.8104571982525948,
+    -0.9882575677307495, 0.15279718525844344, 0.44961132965460654,
+    -0.8932243011955153, -0.5956993044924334, -0.8032075314806449,
+    -0.9852776423889412, 0.17096188876030122, 0.4441221445704292,
+    -0.8959662497561852, -0.6055110414043255, -0.7958369046088836,
+    -0.9819638691095552, 0.1890686641498062, 0.43861623853852766,
+    -0.8986744656939538, -0.6152315905806268, -0.7883464276266063,
+    -0.9783173707196277, 0.20711137619221856, 0.43309381885315196,
+    -0.901348847046022, -0.6248594881423863, -0.7807372285720945,
+    -0.9743393827855759, 0.22508391135979283, 0.4275550934302821,
+    -0.9039892931234433, -0.6343932841636455, -0.773010453362737,
+    -0.970031253194544, 0.24298017990326387, 0.4220002707997997,
+    -0.9065957045149153, -0.6438315428897914, -0.765167265622459,
+    -0.9653944416976894, 0.2607941179152755, 0.41642956009763715,
+    -0.9091679830905224, -0.6531728429537768, -0.7572088465064846,
+    -0.9604305194155658, 0.27851968938505306, 0.4108431710579039,
+    -0.9117060320054299, -0.6624157775901718, -0.7491363945234594,
+    -0.9551411683057708, 0.2961508882436238, 0.40524131400498986,
+    -0.9142097557035307, -0.6715589548470183, -0.7409511253549591,
+    -0.9495281805930367, 0.3136817403988915, 0.3996241998456468,
+    -0.9166790599210427, -0.680600997795453, -0.7326542716724128,
+    -0.9435934581619604, 0.33110630575987643, 0.3939920400610481,
+    -0.9191138516900578, -0.6895405447370668, -0.724247082951467,
+    -0.937339011912575, 0.34841868024943456, 0.38834504669882625,
+    -0.921514039342042, -0.6983762494089729, -0.7157308252838186,
+    -0.9307669610789837, 0.36561299780477385, 0.3826834323650898,
+    -0.9238795325112867, -0.7071067811865476, -0.7071067811865475,
+    -0.9238795325112867, 0.3826834323650898, 0.37700741021641826,
+    -0.9262102421383114, -0.7157308252838186, -0.6983762494089729,
+    -0.9166790599210427, 0.3996241998456468, 0.37131719395183754,
+    -0.9285060804732156, -0.724247082951467, -0.6895405447370668,
+    -0.9091679830905224, 0.41642956009763715, 0.36561299780477385,
+    -0.9307669610789837, -0.7326542716724128, -0.680600997795453,
+    -0.901348847046022, 0.43309381885315196, 0.3598950365349881,
+    -0.932992798834739, -0.7409511253549591, -0.6715589548470183,
+    -0.8932243011955153, 0.44961132965460654, 0.35416352542049034,
+    -0.9351835099389476, -0.7491363945234594, -0.6624157775901718,
+    -0.8847970984309378, 0.4659764957679662, 0.34841868024943456,
+    -0.937339011912575, -0.7572088465064846, -0.6531728429537768,
+    -0.8760700941954066, 0.4821837720791227, 0.3426607173119944,
+    -0.9394592236021899, -0.765167265622459, -0.6438315428897914,
+    -0.8670462455156926, 0.49822766697278187, 0.33688985339222005,
+    -0.9415440651830208, -0.773010453362737, -0.6343932841636455,
+    -0.8577286100002721, 0.5141027441932217, 0.33110630575987643,
+    -0.9435934581619604, -0.7807372285720945, -0.6248594881423863,
+    -0.8481203448032972, 0.5298036246862946, 0.3253102921622629,
+    -0.9456073253805213, -0.7883464276266063, -0.6152315905806268,
+    -0.8382247055548381, 0.5453249884220465, 0.3195020308160157,
+    -0.9475855910177411, -0.7958369046088836, -0.6055110414043255,
+    -0.8280450452577558, 0.560661576197336, 0.3136817403988915,
+    -0.9495281805930367, -0.8032075314806449, -0.5956993044924334,
+    -0.8175848131515837, 0.5758081914178453, 0.30784964004153487,
+    -0.9514350209690083, -0.8104571982525948, -0.5857978574564389,
+    -0.8068475535437993, 0.5907597018588742, 0.3020059493192281,
+    -0.9533060403541939, -0.8175848131515837, -0.5758081914178453,
+    -0.7958369046088836, 0.6055110414043255, 0.2961508882436238,
+    -0.9551411683057708, -0.8245893027850253, -0.5657318107836131,
+    -0.7845565971555752, 0.6200572117632891, 0.29028467725446233,
+    -0.9569403357322088, -0.8314696123025452, -0.5555702330196022,
+    -0.773010453362737, 0.6343932841636455, 0.2844075372112719,
+    -0.9587034748958716, -0.8382247055548381, -0.5453249884220465,
+    -0.7612023854842618, 0.6485144010221124, 0.27851968938505306,
+    -0.9604305194155658, -0.8448535652497071, -0.5349976198870972,
+    -0.7491363945234594, 0.6624157775901718, 0.272621355449949,
+    -0.9621214042690416, -0.8513551931052652, -0.524589682678469,
+    -0.7368165688773699, 0.6760927035753159, 0.26671275747489837,
+    -0.9637760657954398, -0.8577286100002721, -0.5141027441932217,
+    -0.724247082951467, 0.6895405447370668, 0.2607941179152755,
+    -0.9653944416976894, -0.8639728561215868, -0.5035383837257176,
+    -0.7114321957452164, 0.7027547444572253, 0.25486565960451457,
+    -0.9669764710448521, -0.8700869911087115, -0.49289819222978404,
+    -0.6983762494089729, 0.7157308252838186, 0.24892760574572015,
+    -0.9685220942744174, -0.8760700941954066, -0.4821837720791227,
+    -0.6850836677727004, 0.7284643904482252, 0.24298017990326387,
+    -0.970031253194544, -0.881921264348355, -0.47139673682599764,
+    -0.6715589548470183, 0.7409511253549591, 0.2370236059943672,
+    -0.9715038909862518, -0.8876396204028539, -0.46053871095824,
+    -0.6578066932970786, 0.7531867990436125, 0.2310581082806711,
+    -0.9729399522055602, -0.8932243011955153, -0.44961132965460654,
+    -0.6438315428897914, 0.765167265622459, 0.22508391135979283,
+    -0.9743393827855759, -0.8986744656939538, -0.43861623853852766,
+    -0.629638238914927, 0.7768884656732324, 0.2191012401568698,
+    -0.9757021300385286, -0.9039892931234433, -0.4275550934302821,
+    -0.6152315905806268, 0.7883464276266063, 0.21311031991609136,
+    -0.9770281426577544, -0.9091679830905224, -0.41642956009763715,
+    -0.600616479383869, 0.799537269107905, 0.20711137619221856,
+    -0.9783173707196277, -0.9142097557035307, -0.40524131400498986,
+    -0.5857978574564389, 0.8104571982525948, 0.2011046348420919,
+    -0.9795697656854405, -0.9191138516900578, -0.3939920400610481,
+    -0.5707807458869673, 0.8211025149911046, 0.19509032201612825,
+    -0.9807852804032304, -0.9238795325112867, -0.3826834323650898,
+    -0.5555702330196022, 0.8314696123025452, 0.1890686641498062,
+    -0.9819638691095552, -0.9285060804732156, -0.37131719395183754,
+    -0.5401714727298929, 0.8415549774368984, 0.18303988795514095,
+    -0.9831054874312163, -0.932992798834739, -0.3598950365349881,
+    -0.524589682678469, 0.8513551931052652, 0.17700422041214875,
+    -0.984210092386929, -0.937339011912575, -0.34841868024943456,
+    -0.508830142543107, 0.8608669386377673, 0.17096188876030122,
+    -0.9852776423889412, -0.9415440651830208, -0.33688985339222005,
+    -0.49289819222978404, 0.8700869911087115, 0.16491312048996992,
+    -0.9863080972445987, -0.9456073253805213, -0.3253102921622629,
+    -0.4767992300633221, 0.8790122264286335, 0.15885814333386145,
+    -0.9873014181578584, -0.9495281805930367, -0.3136817403988915,
+    -0.46053871095824, 0.8876396204028539, 0.15279718525844344,
+    -0.9882575677307495, -0.9533060403541939, -0.3020059493192281,
+    -0.4441221445704292, 0.8959662497561852, 0.14673047445536175,
+    -0.989176509964781, -0.9569403357322088, -0.29028467725446233,
+    -0.4275550934302821, 0.9039892931234433, 0.1406582393328492,
+    -0.9900582102622971, -0.9604305194155658, -0.27851968938505306,
+    -0.4108431710579039, 0.9117060320054299, 0.13458070850712617,
+    -0.99090263542778, -0.9637760657954398, -0.26671275747489837,
+    -0.3939920400610481, 0.9191138516900578, 0.12849811079379317,
+    -0.9917097536690995, -0.9669764710448521, -0.25486565960451457,
+    -0.37700741021641826, 0.9262102421383114, 0.1224106751992162,
+    -0.99247953459871, -0.970031253194544, -0.24298017990326387,
+    -0.3598950365349881, 0.932992798834739, 0.11631863091190475,
+    -0.9932119492347945, -0.9729399522055602, -0.2310581082806711,
+    -0.3426607173119944, 0.9394592236021899, 0.11022220729388306,
+    -0.9939069700023561, -0.9757021300385286, -0.2191012401568698,
+    -0.3253102921622629, 0.9456073253805213, 0.10412163387205459,
+    -0.9945645707342554, -0.9783173707196277, -0.20711137619221856,
+    -0.30784964004153487, 0.9514350209690083, 0.0980171403295606,
+    -0.9951847266721969, -0.9807852804032304, -0.19509032201612825,
+    -0.29028467725446233, 0.9569403357322088, 0.09190895649713272,
+    -0.9957674144676598, -0.9831054874312163, -0.18303988795514095,
+    -0.272621355449949, 0.9621214042690416, 0.0857973123444399,
+    -0.996312612182778, -0.9852776423889412, -0.17096188876030122,
+    -0.25486565960451457, 0.9669764710448521, 0.07968243797143013,
+    -0.9968202992911657, -0.9873014181578584, -0.15885814333386145,
+    -0.2370236059943672, 0.9715038909862518, 0.07356456359966743,
+    -0.9972904566786902, -0.989176509964781, -0.14673047445536175,
+    -0.2191012401568698, 0.9757021300385286, 0.06744391956366405,
+    -0.9977230666441916, -0.99090263542778, -0.13458070850712617,
+    -0.2011046348420919, 0.9795697656854405, 0.06132073630220858,
+    -0.9981181129001492, -0.99247953459871, -0.1224106751992162,
+    -0.18303988795514095, 0.9831054874312163, 0.055195244349689934,
+    -0.9984755805732948, -0.9939069700023561, -0.11022220729388306,
+    -0.16491312048996992, 0.9863080972445987, 0.049067674327418015,
+    -0.9987954562051724, -0.9951847266721969, -0.0980171403295606,
+    -0.14673047445536175, 0.989176509964781, 0.04293825693494082,
+    -0.9990777277526454, -0.996312612182778, -0.0857973123444399,
+    -0.12849811079379317, 0.9917097536690995, 0.03680722294135883,
+    -0.9993223845883495, -0.9972904566786902, -0.07356456359966743,
+    -0.11022220729388306, 0.9939069700023561, 0.030674803176636626,
+    -0.9995294175010931, -0.9981181129001492, -0.06132073630220858,
+    -0.09190895649713272, 0.9957674144676598, 0.024541228522912288,
+    -0.9996988186962042, -0.9987954562051724, -0.049067674327418015,
+    -0.07356456359966743, 0.9972904566786902, 0.01840672990580482,
+    -0.9998305817958234, -0.9993223845883495, -0.03680722294135883,
+    -0.055195244349689934, 0.9984755805732948, 0.012271538285719925,
+    -0.9999247018391445, -0.9996988186962042, -0.024541228522912288,
+    -0.03680722294135883, 0.9993223845883495, 0.006135884649154475,
+    -0.9999811752826011, -0.9999247018391445, -0.012271538285719925,
+    -0.01840672990580482, 0.9998305817958234
+]);
+const COMPACT_SCRATCH_RE = new Float64Array(1024);
+const COMPACT_SCRATCH_IM = new Float64Array(1024);
+
+//
+//  Public functions.
+//
+
+/**
+ *  Apply in-place mixed-radix FFT transform (prebuilt for block size 1024).
+ * 
+ *  Note(s):
+ *    [1] The size of `re` and `im` will not be checked.
+ *    [2] The transform is done by the table-driven loop kernel (compact
+ *        mode), which is smaller but slower than the unrolled kernels.
+ * 
+ *  @param {Number[]} re 
+ *    - The real part of each point.
+ *  @param {Number[]} im 
+ *    - The imaginary part of each point.
+ */
+function ApplyMixedRadixFFT_1024(re, im) {
+    MXCompact(re, im, COMPACT_RADICES, COMPACT_INDEXES, COMPACT_TWIDDLES, COMPACT_SCRATCH_RE, COMPACT_SCRATCH_IM);
+}
+
+//  Export public APIs.
+module.exports = {
+    "ApplyMixedRadixFFT_1024": ApplyMixedRadixFFT_1024
+};
\ No newline at end of file
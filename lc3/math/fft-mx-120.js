@@ -20,34 +20,116 @@ const Lc3FftMxBaseOp =
     require("./fft-mx-baseop");
 
 //  Imported functions.
-const MXTr2 = 
-    Lc3FftMxBaseOp.MXTr2;
-const MXTr3 = 
-    Lc3FftMxBaseOp.MXTr3;
-const MXTr4 = 
-    Lc3FftMxBaseOp.MXTr4;
-const MXTr5 = 
-    Lc3FftMxBaseOp.MXTr5;
-const MXRot = 
-    Lc3FftMxBaseOp.MXRot;
-const MXSwap = 
-    Lc3FftMxBaseOp.MXSwap;
-const MXCshft = 
-    Lc3FftMxBaseOp.MXCshft;
+// const MXTr2 = 
+//     Lc3FftMxBaseOp.MXTr2;
+// const MXTr3 = 
+//     Lc3FftMxBaseOp.MXTr3;
+// const MXTr4 = 
+//     Lc3FftMxBaseOp.MXTr4;
+// const MXTr5 = 
+//     Lc3FftMxBaseOp.MXTr5;
+// const MXRot = 
+//     Lc3FftMxBaseOp.MXRot;
+// const MXSwap = 
+//     Lc3FftMxBaseOp.MXSwap;
+// const MXCshft = 
+//     Lc3FftMxBaseOp.MXCshft;
+const MXCompact = 
+    Lc3FftMxBaseOp.MXCompact;
 
 //
 //  Constants.
 //
 
-//  Cyclic shift indexes.
-const CSHFT_INDEXES_0 = [1, 24, 98, 93, 87, 57, 70, 13, 84, 99, 117, 71, 37, 68, 79, 115, 23, 74, 109, 107, 59, 118, 95, 21, 26, 32, 62, 49, 106, 35, 20, 2, 48, 82, 51, 40, 4, 96, 45, 10, 12, 60];
-const CSHFT_INDEXES_1 = [3, 72, 61, 25, 8, 78, 91, 39, 116, 47, 58, 94, 111, 41, 28, 80];
-const CSHFT_INDEXES_2 = [5, 6, 30, 14, 108, 83, 75, 19, 114, 113, 89, 105, 11, 36, 44, 100];
-const CSHFT_INDEXES_3 = [7, 54, 112, 65];
-const CSHFT_INDEXES_4 = [9, 102, 53, 88, 81, 27, 56, 46, 34, 110, 17, 66, 31, 38, 92, 63, 73, 85];
-const CSHFT_INDEXES_5 = [15, 18, 90];
-const CSHFT_INDEXES_6 = [16, 42, 52, 64, 97, 69, 103, 77, 67, 55, 22, 50];
-const CSHFT_INDEXES_7 = [29, 104, 101];
+//  Tables (and scratch buffers) of the compact kernel (see MXCompact() of
+//  the "fft-mx-baseop" module).
+const COMPACT_RADICES = new Int32Array([
+    4, 2, 3, 5
+]);
+const COMPACT_INDEXES = new Int32Array([
+    0, 30, 60, 90, 15, 45, 75, 105, 5, 35, 65, 95, 20, 50, 80, 110, 10, 40,
+    70, 100, 25, 55, 85, 115, 1, 31, 61, 91, 16, 46, 76, 106, 6, 36, 66, 96,
+    21, 51, 81, 111, 11, 41, 71, 101, 26, 56, 86, 116, 2, 32, 62, 92, 17,
+    47, 77, 107, 7, 37, 67, 97, 22, 52, 82, 112, 12, 42, 72, 102, 27, 57,
+    87, 117, 3, 33, 63, 93, 18, 48, 78, 108, 8, 38, 68, 98, 23, 53, 83, 113,
+    13, 43, 73, 103, 28, 58, 88, 118, 4, 34, 64, 94, 19, 49, 79, 109, 9, 39,
+    69, 99, 24, 54, 84, 114, 14, 44, 74, 104, 29, 59, 89, 119
+]);
+const COMPACT_TWIDDLES = new Float64Array([
+    1.0, 0.0, 1.0, 0.0, 1.0, 0.0, 1.0, 0.0, 0.7071067811865476,
+    -0.7071067811865475, -0.0, -1.0, -0.7071067811865476,
+    -0.7071067811865475, 1.0, 0.0, 1.0, 0.0, 0.9659258262890683,
+    -0.25881904510252074, 0.8660254037844387, -0.49999999999999994,
+    0.8660254037844387, -0.49999999999999994, 0.49999999999999994,
+    -0.8660254037844387, 0.7071067811865476, -0.7071067811865475, -0.0,
+    -1.0, 0.49999999999999994, -0.8660254037844387, -0.49999999999999994,
+    -0.8660254037844387, 0.25881904510252074, -0.9659258262890683,
+    -0.8660254037844387, -0.49999999999999994, -0.0, -1.0, -1.0, -0.0,
+    -0.25881904510252074, -0.9659258262890683, -0.8660254037844387,
+    0.49999999999999994, 1.0, 0.0, 1.0, 0.0, 1.0, 0.0, 1.0, 0.0,
+    0.9986295347545738, -0.05233595624294383, 0.9945218953682733,
+    -0.10452846326765346, 0.9876883405951378, -0.15643446504023087,
+    0.9781476007338057, -0.20791169081775931, 0.9945218953682733,
+    -0.10452846326765346, 0.9781476007338057, -0.20791169081775931,
+    0.9510565162951535, -0.3090169943749474, 0.9135454576426009,
+    -0.40673664307580015, 0.9876883405951378, -0.15643446504023087,
+    0.9510565162951535, -0.3090169943749474, 0.8910065241883679,
+    -0.45399049973954675, 0.8090169943749475, -0.5877852522924731,
+    0.9781476007338057, -0.20791169081775931, 0.9135454576426009,
+    -0.40673664307580015, 0.8090169943749475, -0.5877852522924731,
+    0.6691306063588582, -0.7431448254773942, 0.9659258262890683,
+    -0.25881904510252074, 0.8660254037844387, -0.49999999999999994,
+    0.7071067811865476, -0.7071067811865475, 0.49999999999999994,
+    -0.8660254037844387, 0.9510565162951535, -0.3090169943749474,
+    0.8090169943749475, -0.5877852522924731, 0.5877852522924731,
+    -0.8090169943749475, 0.3090169943749474, -0.9510565162951535,
+    0.9335804264972017, -0.35836794954530027, 0.7431448254773942,
+    -0.6691306063588582, 0.45399049973954675, -0.8910065241883679,
+    0.10452846326765346, -0.9945218953682733, 0.9135454576426009,
+    -0.40673664307580015, 0.6691306063588582, -0.7431448254773942,
+    0.3090169943749474, -0.9510565162951535, -0.10452846326765346,
+    -0.9945218953682733, 0.8910065241883679, -0.45399049973954675,
+    0.5877852522924731, -0.8090169943749475, 0.15643446504023087,
+    -0.9876883405951378, -0.3090169943749474, -0.9510565162951535,
+    0.8660254037844387, -0.49999999999999994, 0.49999999999999994,
+    -0.8660254037844387, -0.0, -1.0, -0.49999999999999994,
+    -0.8660254037844387, 0.838670567945424, -0.544639035015027,
+    0.40673664307580015, -0.9135454576426009, -0.15643446504023087,
+    -0.9876883405951378, -0.6691306063588582, -0.7431448254773942,
+    0.8090169943749475, -0.5877852522924731, 0.3090169943749474,
+    -0.9510565162951535, -0.3090169943749474, -0.9510565162951535,
+    -0.8090169943749475, -0.5877852522924731, 0.7771459614569709,
+    -0.6293203910498375, 0.20791169081775931, -0.9781476007338057,
+    -0.45399049973954675, -0.8910065241883679, -0.9135454576426009,
+    -0.40673664307580015, 0.7431448254773942, -0.6691306063588582,
+    0.10452846326765346, -0.9945218953682733, -0.5877852522924731,
+    -0.8090169943749475, -0.9781476007338057, -0.20791169081775931,
+    0.7071067811865476, -0.7071067811865475, -0.0, -1.0,
+    -0.7071067811865476, -0.7071067811865475, -1.0, -0.0,
+    0.6691306063588582, -0.7431448254773942, -0.10452846326765346,
+    -0.9945218953682733, -0.8090169943749475, -0.5877852522924731,
+    -0.9781476007338057, 0.20791169081775931, 0.6293203910498375,
+    -0.7771459614569709, -0.20791169081775931, -0.9781476007338057,
+    -0.8910065241883679, -0.45399049973954675, -0.9135454576426009,
+    0.40673664307580015, 0.5877852522924731, -0.8090169943749475,
+    -0.3090169943749474, -0.9510565162951535, -0.9510565162951535,
+    -0.3090169943749474, -0.8090169943749475, 0.5877852522924731,
+    0.544639035015027, -0.838670567945424, -0.40673664307580015,
+    -0.9135454576426009, -0.9876883405951378, -0.15643446504023087,
+    -0.6691306063588582, 0.7431448254773942, 0.49999999999999994,
+    -0.8660254037844387, -0.49999999999999994, -0.8660254037844387, -1.0,
+    -0.0, -0.49999999999999994, 0.8660254037844387, 0.45399049973954675,
+    -0.8910065241883679, -0.5877852522924731, -0.8090169943749475,
+    -0.9876883405951378, 0.15643446504023087, -0.3090169943749474,
+    0.9510565162951535, 0.40673664307580015, -0.9135454576426009,
+    -0.6691306063588582, -0.7431448254773942, -0.9510565162951535,
+    0.3090169943749474, -0.10452846326765346, 0.9945218953682733,
+    0.35836794954530027, -0.9335804264972017, -0.7431448254773942,
+    -0.6691306063588582, -0.8910065241883679, 0.45399049973954675,
+    0.10452846326765346, 0.9945218953682733
+]);
+const COMPACT_SCRATCH_RE = new Float64Array(120);
+const COMPACT_SCRATCH_IM = new Float64Array(120);
 
 //
 //  Public functions.
@@ -58,6 +140,8 @@ const CSHFT_INDEXES_7 = [29, 104, 101];
  * 
  *  Note(s):
  *    [1] The size of `re` and `im` will not be checked.
+ *    [2] The transform is done by the table-driven loop kernel (compact
+ *        mode), which is smaller but slower than the unrolled kernels.
  * 
  *  @param {Number[]} re 
  *    - The real part of each point.
@@ -65,377 +149,7 @@ const CSHFT_INDEXES_7 = [29, 104, 101];
  *    - The imaginary part of each point.
  */
 function ApplyMixedRadixFFT_120(re, im) {
-    MXTr5(re, im, 0, 24, 48, 72, 96);
-    MXTr5(re, im, 1, 25, 49, 73, 97);
-    MXTr5(re, im, 2, 26, 50, 74, 98);
-    MXTr5(re, im, 3, 27, 51, 75, 99);
-    MXTr5(re, im, 4, 28, 52, 76, 100);
-    MXTr5(re, im, 5, 29, 53, 77, 101);
-    MXTr5(re, im, 6, 30, 54, 78, 102);
-    MXTr5(re, im, 7, 31, 55, 79, 103);
-    MXTr5(re, im, 8, 32, 56, 80, 104);
-    MXTr5(re, im, 9, 33, 57, 81, 105);
-    MXTr5(re, im, 10, 34, 58, 82, 106);
-    MXTr5(re, im, 11, 35, 59, 83, 107);
-    MXTr5(re, im, 12, 36, 60, 84, 108);
-    MXTr5(re, im, 13, 37, 61, 85, 109);
-    MXTr5(re, im, 14, 38, 62, 86, 110);
-    MXTr5(re, im, 15, 39, 63, 87, 111);
-    MXTr5(re, im, 16, 40, 64, 88, 112);
-    MXTr5(re, im, 17, 41, 65, 89, 113);
-    MXTr5(re, im, 18, 42, 66, 90, 114);
-    MXTr5(re, im, 19, 43, 67, 91, 115);
-    MXTr5(re, im, 20, 44, 68, 92, 116);
-    MXTr5(re, im, 21, 45, 69, 93, 117);
-    MXTr5(re, im, 22, 46, 70, 94, 118);
-    MXTr5(re, im, 23, 47, 71, 95, 119);
-    MXRot(re, im, 25, 0.9986295347545738, -0.05233595624294383);
-    MXRot(re, im, 26, 0.9945218953682733, -0.10452846326765346);
-    MXRot(re, im, 27, 0.9876883405951378, -0.15643446504023087);
-    MXRot(re, im, 28, 0.9781476007338057, -0.20791169081775931);
-    MXRot(re, im, 29, 0.9659258262890683, -0.25881904510252074);
-    MXRot(re, im, 30, 0.9510565162951535, -0.3090169943749474);
-    MXRot(re, im, 31, 0.9335804264972017, -0.3583679495453002);
-    MXRot(re, im, 32, 0.9135454576426009, -0.40673664307580015);
-    MXRot(re, im, 33, 0.8910065241883679, -0.45399049973954675);
-    MXRot(re, im, 34, 0.8660254037844387, -0.49999999999999994);
-    MXRot(re, im, 35, 0.838670567945424, -0.544639035015027);
-    MXRot(re, im, 36, 0.8090169943749475, -0.5877852522924731);
-    MXRot(re, im, 37, 0.7771459614569709, -0.6293203910498374);
-    MXRot(re, im, 38, 0.7431448254773944, -0.6691306063588581);
-    MXRot(re, im, 39, 0.7071067811865476, -0.7071067811865475);
-    MXRot(re, im, 40, 0.6691306063588582, -0.7431448254773941);
-    MXRot(re, im, 41, 0.6293203910498375, -0.7771459614569708);
-    MXRot(re, im, 42, 0.5877852522924731, -0.8090169943749475);
-    MXRot(re, im, 43, 0.5446390350150272, -0.8386705679454239);
-    MXRot(re, im, 44, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 45, 0.4539904997395468, -0.8910065241883678);
-    MXRot(re, im, 46, 0.4067366430758004, -0.9135454576426009);
-    MXRot(re, im, 47, 0.3583679495453004, -0.9335804264972017);
-    MXRot(re, im, 49, 0.9945218953682733, -0.10452846326765346);
-    MXRot(re, im, 50, 0.9781476007338057, -0.20791169081775931);
-    MXRot(re, im, 51, 0.9510565162951535, -0.3090169943749474);
-    MXRot(re, im, 52, 0.9135454576426009, -0.40673664307580015);
-    MXRot(re, im, 53, 0.8660254037844387, -0.49999999999999994);
-    MXRot(re, im, 54, 0.8090169943749475, -0.5877852522924731);
-    MXRot(re, im, 55, 0.7431448254773944, -0.6691306063588581);
-    MXRot(re, im, 56, 0.6691306063588582, -0.7431448254773941);
-    MXRot(re, im, 57, 0.5877852522924731, -0.8090169943749475);
-    MXRot(re, im, 58, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 59, 0.4067366430758004, -0.9135454576426009);
-    MXRot(re, im, 60, 0.30901699437494745, -0.9510565162951535);
-    MXRot(re, im, 61, 0.20791169081775945, -0.9781476007338056);
-    MXRot(re, im, 62, 0.10452846326765368, -0.9945218953682733);
-    MXRot(re, im, 63, 6.123233995736766e-17, -1.0);
-    MXRot(re, im, 64, -0.10452846326765333, -0.9945218953682734);
-    MXRot(re, im, 65, -0.20791169081775912, -0.9781476007338057);
-    MXRot(re, im, 66, -0.30901699437494734, -0.9510565162951536);
-    MXRot(re, im, 67, -0.40673664307580004, -0.913545457642601);
-    MXRot(re, im, 68, -0.4999999999999998, -0.8660254037844387);
-    MXRot(re, im, 69, -0.587785252292473, -0.8090169943749475);
-    MXRot(re, im, 70, -0.6691306063588579, -0.7431448254773945);
-    MXRot(re, im, 71, -0.743144825477394, -0.6691306063588583);
-    MXRot(re, im, 73, 0.9876883405951378, -0.15643446504023087);
-    MXRot(re, im, 74, 0.9510565162951535, -0.3090169943749474);
-    MXRot(re, im, 75, 0.8910065241883679, -0.45399049973954675);
-    MXRot(re, im, 76, 0.8090169943749475, -0.5877852522924731);
-    MXRot(re, im, 77, 0.7071067811865476, -0.7071067811865475);
-    MXRot(re, im, 78, 0.5877852522924731, -0.8090169943749475);
-    MXRot(re, im, 79, 0.4539904997395468, -0.8910065241883678);
-    MXRot(re, im, 80, 0.30901699437494745, -0.9510565162951535);
-    MXRot(re, im, 81, 0.15643446504023092, -0.9876883405951378);
-    MXRot(re, im, 82, 6.123233995736766e-17, -1.0);
-    MXRot(re, im, 83, -0.1564344650402308, -0.9876883405951378);
-    MXRot(re, im, 84, -0.30901699437494734, -0.9510565162951536);
-    MXRot(re, im, 85, -0.4539904997395467, -0.8910065241883679);
-    MXRot(re, im, 86, -0.587785252292473, -0.8090169943749475);
-    MXRot(re, im, 87, -0.7071067811865475, -0.7071067811865476);
-    MXRot(re, im, 88, -0.8090169943749473, -0.5877852522924732);
-    MXRot(re, im, 89, -0.8910065241883678, -0.45399049973954686);
-    MXRot(re, im, 90, -0.9510565162951535, -0.3090169943749475);
-    MXRot(re, im, 91, -0.9876883405951377, -0.15643446504023098);
-    MXRot(re, im, 92, -1.0, -1.2246467991473532e-16);
-    MXRot(re, im, 93, -0.9876883405951378, 0.15643446504023073);
-    MXRot(re, im, 94, -0.9510565162951536, 0.3090169943749473);
-    MXRot(re, im, 95, -0.8910065241883679, 0.4539904997395467);
-    MXRot(re, im, 97, 0.9781476007338057, -0.20791169081775931);
-    MXRot(re, im, 98, 0.9135454576426009, -0.40673664307580015);
-    MXRot(re, im, 99, 0.8090169943749475, -0.5877852522924731);
-    MXRot(re, im, 100, 0.6691306063588582, -0.7431448254773941);
-    MXRot(re, im, 101, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 102, 0.30901699437494745, -0.9510565162951535);
-    MXRot(re, im, 103, 0.10452846326765368, -0.9945218953682733);
-    MXRot(re, im, 104, -0.10452846326765333, -0.9945218953682734);
-    MXRot(re, im, 105, -0.30901699437494734, -0.9510565162951536);
-    MXRot(re, im, 106, -0.4999999999999998, -0.8660254037844387);
-    MXRot(re, im, 107, -0.6691306063588579, -0.7431448254773945);
-    MXRot(re, im, 108, -0.8090169943749473, -0.5877852522924732);
-    MXRot(re, im, 109, -0.9135454576426008, -0.40673664307580043);
-    MXRot(re, im, 110, -0.9781476007338056, -0.20791169081775973);
-    MXRot(re, im, 111, -1.0, -1.2246467991473532e-16);
-    MXRot(re, im, 112, -0.9781476007338057, 0.20791169081775907);
-    MXRot(re, im, 113, -0.9135454576426011, 0.4067366430757998);
-    MXRot(re, im, 114, -0.8090169943749476, 0.587785252292473);
-    MXRot(re, im, 115, -0.6691306063588585, 0.743144825477394);
-    MXRot(re, im, 116, -0.5000000000000004, 0.8660254037844384);
-    MXRot(re, im, 117, -0.30901699437494756, 0.9510565162951535);
-    MXRot(re, im, 118, -0.10452846326765423, 0.9945218953682733);
-    MXRot(re, im, 119, 0.10452846326765299, 0.9945218953682734);
-    MXTr4(re, im, 0, 6, 12, 18);
-    MXTr4(re, im, 1, 7, 13, 19);
-    MXTr4(re, im, 2, 8, 14, 20);
-    MXTr4(re, im, 3, 9, 15, 21);
-    MXTr4(re, im, 4, 10, 16, 22);
-    MXTr4(re, im, 5, 11, 17, 23);
-    MXRot(re, im, 7, 0.9659258262890683, -0.25881904510252074);
-    MXRot(re, im, 8, 0.8660254037844387, -0.49999999999999994);
-    MXRot(re, im, 9, 0.7071067811865476, -0.7071067811865475);
-    MXRot(re, im, 10, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 11, 0.25881904510252096, -0.9659258262890682);
-    MXRot(re, im, 13, 0.8660254037844387, -0.49999999999999994);
-    MXRot(re, im, 14, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 15, 6.123233995736766e-17, -1.0);
-    MXRot(re, im, 16, -0.4999999999999998, -0.8660254037844387);
-    MXRot(re, im, 17, -0.8660254037844385, -0.5000000000000003);
-    MXRot(re, im, 19, 0.7071067811865476, -0.7071067811865475);
-    MXRot(re, im, 20, 6.123233995736766e-17, -1.0);
-    MXRot(re, im, 21, -0.7071067811865475, -0.7071067811865476);
-    MXRot(re, im, 22, -1.0, -1.2246467991473532e-16);
-    MXRot(re, im, 23, -0.7071067811865479, 0.7071067811865471);
-    MXTr3(re, im, 0, 2, 4);
-    MXTr3(re, im, 1, 3, 5);
-    MXRot(re, im, 3, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 5, -0.4999999999999998, -0.8660254037844387);
-    MXTr2(re, im, 0, 1);
-    MXTr2(re, im, 2, 3);
-    MXTr2(re, im, 4, 5);
-    MXTr3(re, im, 6, 8, 10);
-    MXTr3(re, im, 7, 9, 11);
-    MXRot(re, im, 9, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 11, -0.4999999999999998, -0.8660254037844387);
-    MXTr2(re, im, 6, 7);
-    MXTr2(re, im, 8, 9);
-    MXTr2(re, im, 10, 11);
-    MXTr3(re, im, 12, 14, 16);
-    MXTr3(re, im, 13, 15, 17);
-    MXRot(re, im, 15, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 17, -0.4999999999999998, -0.8660254037844387);
-    MXTr2(re, im, 12, 13);
-    MXTr2(re, im, 14, 15);
-    MXTr2(re, im, 16, 17);
-    MXTr3(re, im, 18, 20, 22);
-    MXTr3(re, im, 19, 21, 23);
-    MXRot(re, im, 21, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 23, -0.4999999999999998, -0.8660254037844387);
-    MXTr2(re, im, 18, 19);
-    MXTr2(re, im, 20, 21);
-    MXTr2(re, im, 22, 23);
-    MXTr4(re, im, 24, 30, 36, 42);
-    MXTr4(re, im, 25, 31, 37, 43);
-    MXTr4(re, im, 26, 32, 38, 44);
-    MXTr4(re, im, 27, 33, 39, 45);
-    MXTr4(re, im, 28, 34, 40, 46);
-    MXTr4(re, im, 29, 35, 41, 47);
-    MXRot(re, im, 31, 0.9659258262890683, -0.25881904510252074);
-    MXRot(re, im, 32, 0.8660254037844387, -0.49999999999999994);
-    MXRot(re, im, 33, 0.7071067811865476, -0.7071067811865475);
-    MXRot(re, im, 34, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 35, 0.25881904510252096, -0.9659258262890682);
-    MXRot(re, im, 37, 0.8660254037844387, -0.49999999999999994);
-    MXRot(re, im, 38, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 39, 6.123233995736766e-17, -1.0);
-    MXRot(re, im, 40, -0.4999999999999998, -0.8660254037844387);
-    MXRot(re, im, 41, -0.8660254037844385, -0.5000000000000003);
-    MXRot(re, im, 43, 0.7071067811865476, -0.7071067811865475);
-    MXRot(re, im, 44, 6.123233995736766e-17, -1.0);
-    MXRot(re, im, 45, -0.7071067811865475, -0.7071067811865476);
-    MXRot(re, im, 46, -1.0, -1.2246467991473532e-16);
-    MXRot(re, im, 47, -0.7071067811865479, 0.7071067811865471);
-    MXTr3(re, im, 24, 26, 28);
-    MXTr3(re, im, 25, 27, 29);
-    MXRot(re, im, 27, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 29, -0.4999999999999998, -0.8660254037844387);
-    MXTr2(re, im, 24, 25);
-    MXTr2(re, im, 26, 27);
-    MXTr2(re, im, 28, 29);
-    MXTr3(re, im, 30, 32, 34);
-    MXTr3(re, im, 31, 33, 35);
-    MXRot(re, im, 33, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 35, -0.4999999999999998, -0.8660254037844387);
-    MXTr2(re, im, 30, 31);
-    MXTr2(re, im, 32, 33);
-    MXTr2(re, im, 34, 35);
-    MXTr3(re, im, 36, 38, 40);
-    MXTr3(re, im, 37, 39, 41);
-    MXRot(re, im, 39, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 41, -0.4999999999999998, -0.8660254037844387);
-    MXTr2(re, im, 36, 37);
-    MXTr2(re, im, 38, 39);
-    MXTr2(re, im, 40, 41);
-    MXTr3(re, im, 42, 44, 46);
-    MXTr3(re, im, 43, 45, 47);
-    MXRot(re, im, 45, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 47, -0.4999999999999998, -0.8660254037844387);
-    MXTr2(re, im, 42, 43);
-    MXTr2(re, im, 44, 45);
-    MXTr2(re, im, 46, 47);
-    MXTr4(re, im, 48, 54, 60, 66);
-    MXTr4(re, im, 49, 55, 61, 67);
-    MXTr4(re, im, 50, 56, 62, 68);
-    MXTr4(re, im, 51, 57, 63, 69);
-    MXTr4(re, im, 52, 58, 64, 70);
-    MXTr4(re, im, 53, 59, 65, 71);
-    MXRot(re, im, 55, 0.9659258262890683, -0.25881904510252074);
-    MXRot(re, im, 56, 0.8660254037844387, -0.49999999999999994);
-    MXRot(re, im, 57, 0.7071067811865476, -0.7071067811865475);
-    MXRot(re, im, 58, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 59, 0.25881904510252096, -0.9659258262890682);
-    MXRot(re, im, 61, 0.8660254037844387, -0.49999999999999994);
-    MXRot(re, im, 62, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 63, 6.123233995736766e-17, -1.0);
-    MXRot(re, im, 64, -0.4999999999999998, -0.8660254037844387);
-    MXRot(re, im, 65, -0.8660254037844385, -0.5000000000000003);
-    MXRot(re, im, 67, 0.7071067811865476, -0.7071067811865475);
-    MXRot(re, im, 68, 6.123233995736766e-17, -1.0);
-    MXRot(re, im, 69, -0.7071067811865475, -0.7071067811865476);
-    MXRot(re, im, 70, -1.0, -1.2246467991473532e-16);
-    MXRot(re, im, 71, -0.7071067811865479, 0.7071067811865471);
-    MXTr3(re, im, 48, 50, 52);
-    MXTr3(re, im, 49, 51, 53);
-    MXRot(re, im, 51, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 53, -0.4999999999999998, -0.8660254037844387);
-    MXTr2(re, im, 48, 49);
-    MXTr2(re, im, 50, 51);
-    MXTr2(re, im, 52, 53);
-    MXTr3(re, im, 54, 56, 58);
-    MXTr3(re, im, 55, 57, 59);
-    MXRot(re, im, 57, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 59, -0.4999999999999998, -0.8660254037844387);
-    MXTr2(re, im, 54, 55);
-    MXTr2(re, im, 56, 57);
-    MXTr2(re, im, 58, 59);
-    MXTr3(re, im, 60, 62, 64);
-    MXTr3(re, im, 61, 63, 65);
-    MXRot(re, im, 63, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 65, -0.4999999999999998, -0.8660254037844387);
-    MXTr2(re, im, 60, 61);
-    MXTr2(re, im, 62, 63);
-    MXTr2(re, im, 64, 65);
-    MXTr3(re, im, 66, 68, 70);
-    MXTr3(re, im, 67, 69, 71);
-    MXRot(re, im, 69, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 71, -0.4999999999999998, -0.8660254037844387);
-    MXTr2(re, im, 66, 67);
-    MXTr2(re, im, 68, 69);
-    MXTr2(re, im, 70, 71);
-    MXTr4(re, im, 72, 78, 84, 90);
-    MXTr4(re, im, 73, 79, 85, 91);
-    MXTr4(re, im, 74, 80, 86, 92);
-    MXTr4(re, im, 75, 81, 87, 93);
-    MXTr4(re, im, 76, 82, 88, 94);
-    MXTr4(re, im, 77, 83, 89, 95);
-    MXRot(re, im, 79, 0.9659258262890683, -0.25881904510252074);
-    MXRot(re, im, 80, 0.8660254037844387, -0.49999999999999994);
-    MXRot(re, im, 81, 0.7071067811865476, -0.7071067811865475);
-    MXRot(re, im, 82, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 83, 0.25881904510252096, -0.9659258262890682);
-    MXRot(re, im, 85, 0.8660254037844387, -0.49999999999999994);
-    MXRot(re, im, 86, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 87, 6.123233995736766e-17, -1.0);
-    MXRot(re, im, 88, -0.4999999999999998, -0.8660254037844387);
-    MXRot(re, im, 89, -0.8660254037844385, -0.5000000000000003);
-    MXRot(re, im, 91, 0.7071067811865476, -0.7071067811865475);
-    MXRot(re, im, 92, 6.123233995736766e-17, -1.0);
-    MXRot(re, im, 93, -0.7071067811865475, -0.7071067811865476);
-    MXRot(re, im, 94, -1.0, -1.2246467991473532e-16);
-    MXRot(re, im, 95, -0.7071067811865479, 0.7071067811865471);
-    MXTr3(re, im, 72, 74, 76);
-    MXTr3(re, im, 73, 75, 77);
-    MXRot(re, im, 75, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 77, -0.4999999999999998, -0.8660254037844387);
-    MXTr2(re, im, 72, 73);
-    MXTr2(re, im, 74, 75);
-    MXTr2(re, im, 76, 77);
-    MXTr3(re, im, 78, 80, 82);
-    MXTr3(re, im, 79, 81, 83);
-    MXRot(re, im, 81, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 83, -0.4999999999999998, -0.8660254037844387);
-    MXTr2(re, im, 78, 79);
-    MXTr2(re, im, 80, 81);
-    MXTr2(re, im, 82, 83);
-    MXTr3(re, im, 84, 86, 88);
-    MXTr3(re, im, 85, 87, 89);
-    MXRot(re, im, 87, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 89, -0.4999999999999998, -0.8660254037844387);
-    MXTr2(re, im, 84, 85);
-    MXTr2(re, im, 86, 87);
-    MXTr2(re, im, 88, 89);
-    MXTr3(re, im, 90, 92, 94);
-    MXTr3(re, im, 91, 93, 95);
-    MXRot(re, im, 93, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 95, -0.4999999999999998, -0.8660254037844387);
-    MXTr2(re, im, 90, 91);
-    MXTr2(re, im, 92, 93);
-    MXTr2(re, im, 94, 95);
-    MXTr4(re, im, 96, 102, 108, 114);
-    MXTr4(re, im, 97, 103, 109, 115);
-    MXTr4(re, im, 98, 104, 110, 116);
-    MXTr4(re, im, 99, 105, 111, 117);
-    MXTr4(re, im, 100, 106, 112, 118);
-    MXTr4(re, im, 101, 107, 113, 119);
-    MXRot(re, im, 103, 0.9659258262890683, -0.25881904510252074);
-    MXRot(re, im, 104, 0.8660254037844387, -0.49999999999999994);
-    MXRot(re, im, 105, 0.7071067811865476, -0.7071067811865475);
-    MXRot(re, im, 106, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 107, 0.25881904510252096, -0.9659258262890682);
-    MXRot(re, im, 109, 0.8660254037844387, -0.49999999999999994);
-    MXRot(re, im, 110, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 111, 6.123233995736766e-17, -1.0);
-    MXRot(re, im, 112, -0.4999999999999998, -0.8660254037844387);
-    MXRot(re, im, 113, -0.8660254037844385, -0.5000000000000003);
-    MXRot(re, im, 115, 0.7071067811865476, -0.7071067811865475);
-    MXRot(re, im, 116, 6.123233995736766e-17, -1.0);
-    MXRot(re, im, 117, -0.7071067811865475, -0.7071067811865476);
-    MXRot(re, im, 118, -1.0, -1.2246467991473532e-16);
-    MXRot(re, im, 119, -0.7071067811865479, 0.7071067811865471);
-    MXTr3(re, im, 96, 98, 100);
-    MXTr3(re, im, 97, 99, 101);
-    MXRot(re, im, 99, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 101, -0.4999999999999998, -0.8660254037844387);
-    MXTr2(re, im, 96, 97);
-    MXTr2(re, im, 98, 99);
-    MXTr2(re, im, 100, 101);
-    MXTr3(re, im, 102, 104, 106);
-    MXTr3(re, im, 103, 105, 107);
-    MXRot(re, im, 105, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 107, -0.4999999999999998, -0.8660254037844387);
-    MXTr2(re, im, 102, 103);
-    MXTr2(re, im, 104, 105);
-    MXTr2(re, im, 106, 107);
-    MXTr3(re, im, 108, 110, 112);
-    MXTr3(re, im, 109, 111, 113);
-    MXRot(re, im, 111, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 113, -0.4999999999999998, -0.8660254037844387);
-    MXTr2(re, im, 108, 109);
-    MXTr2(re, im, 110, 111);
-    MXTr2(re, im, 112, 113);
-    MXTr3(re, im, 114, 116, 118);
-    MXTr3(re, im, 115, 117, 119);
-    MXRot(re, im, 117, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 119, -0.4999999999999998, -0.8660254037844387);
-    MXTr2(re, im, 114, 115);
-    MXTr2(re, im, 116, 117);
-    MXTr2(re, im, 118, 119);
-    MXCshft(re, im, CSHFT_INDEXES_0);
-    MXCshft(re, im, CSHFT_INDEXES_1);
-    MXCshft(re, im, CSHFT_INDEXES_2);
-    MXCshft(re, im, CSHFT_INDEXES_3);
-    MXCshft(re, im, CSHFT_INDEXES_4);
-    MXCshft(re, im, CSHFT_INDEXES_5);
-    MXCshft(re, im, CSHFT_INDEXES_6);
-    MXCshft(re, im, CSHFT_INDEXES_7);
-    MXSwap(re, im, 33, 86);
-    MXSwap(re, im, 43, 76);
+    MXCompact(re, im, COMPACT_RADICES, COMPACT_INDEXES, COMPACT_TWIDDLES, COMPACT_SCRATCH_RE, COMPACT_SCRATCH_IM);
 }
 
 //  Export public APIs.
@@ -0,0 +1,4663 @@
+//
+//  Copyright 2021 - 2023 XiaoJSoft Studio. All rights reserved.
+//  Use of this source code is governed by a BSD-style license that can be
+//  found in the LICENSE.md file.
+//
+
+//
+//  Note(s):
+//    [1] This file is generated automatically by a FFT compiler, which locates 
+//        at "./../../dev/fft-mx-generator/" directory.
+//        Do NOT modify this file manually.
+//
+
+//
+//  Imports.
+//
+
+//  Imported modules.
+const Lc3FftMxBaseOp = 
+    require("./fft-mx-baseop");
+
+//  Imported functions.
+// const MXTr2 = 
+//     Lc3FftMxBaseOp.MXTr2;
+// const MXTr3 = 
+//     Lc3FftMxBaseOp.MXTr3;
+// const MXTr4 = 
+//     Lc3FftMxBaseOp.MXTr4;
+// const MXTr5 = 
+//     Lc3FftMxBaseOp.MXTr5;
+// const MXRot = 
+//     Lc3FftMxBaseOp.MXRot;
+// const MXSwap = 
+//     Lc3FftMxBaseOp.MXSwap;
+const MXCshft = 
+    Lc3FftMxBaseOp.MXCshft;
+// const MXCompact = 
+//     Lc3FftMxBaseOp.MXCompact;
+
+//
+//  Constants.
+//
+
+//  Cyclic shift indexes.
+const CSHFT_INDEXES_0 = [1, 32, 2, 64, 4, 8, 16];
+const CSHFT_INDEXES_1 = [3, 96, 6, 72, 20, 9, 48];
+const CSHFT_INDEXES_2 = [5, 40, 18, 65, 36, 10, 80];
+const CSHFT_INDEXES_3 = [7, 104, 22, 73, 52, 11, 112];
+const CSHFT_INDEXES_4 = [12, 24, 17, 33, 34, 66, 68];
+const CSHFT_INDEXES_5 = [13, 56, 19, 97, 38, 74, 84];
+const CSHFT_INDEXES_6 = [14, 88, 21, 41, 50, 67, 100];
+const CSHFT_INDEXES_7 = [15, 120, 23, 105, 54, 75, 116];
+const CSHFT_INDEXES_8 = [25, 49, 35, 98, 70, 76, 28];
+const CSHFT_INDEXES_9 = [26, 81, 37, 42, 82, 69, 44];
+const CSHFT_INDEXES_10 = [27, 113, 39, 106, 86, 77, 60];
+const CSHFT_INDEXES_11 = [29, 57, 51, 99, 102, 78, 92];
+const CSHFT_INDEXES_12 = [30, 89, 53, 43, 114, 71, 108];
+const CSHFT_INDEXES_13 = [31, 121, 55, 107, 118, 79, 124];
+const CSHFT_INDEXES_14 = [45, 58, 83, 101, 46, 90, 85];
+const CSHFT_INDEXES_15 = [47, 122, 87, 109, 62, 91, 117];
+const CSHFT_INDEXES_16 = [59, 115, 103, 110, 94, 93, 61];
+const CSHFT_INDEXES_17 = [63, 123, 119, 111, 126, 95, 125];
+
+//  Output indexes of ApplyMixedRadixFFTPermuted_128() (the k-th output is stored at
+//  index MIXED_RADIX_FFT_OUTPUT_INDEXES_128[k]).
+const MIXED_RADIX_FFT_OUTPUT_INDEXES_128 = [0, 32, 64, 96, 8, 40, 72, 104, 16, 48, 80, 112, 24, 56, 88, 120, 1, 33, 65, 97, 9, 41, 73, 105, 17, 49, 81, 113, 25, 57, 89, 121, 2, 34, 66, 98, 10, 42, 74, 106, 18, 50, 82, 114, 26, 58, 90, 122, 3, 35, 67, 99, 11, 43, 75, 107, 19, 51, 83, 115, 27, 59, 91, 123, 4, 36, 68, 100, 12, 44, 76, 108, 20, 52, 84, 116, 28, 60, 92, 124, 5, 37, 69, 101, 13, 45, 77, 109, 21, 53, 85, 117, 29, 61, 93, 125, 6, 38, 70, 102, 14, 46, 78, 110, 22, 54, 86, 118, 30, 62, 94, 126, 7, 39, 71, 103, 15, 47, 79, 111, 23, 55, 87, 119, 31, 63, 95, 127];
+
+//
+//  Private functions.
+//
+
+/**
+ *  Part 1 of ApplyMixedRadixFFTPermuted_128().
+ * 
+ *  @param {Number[]} re 
+ *    - The real part of each point.
+ *  @param {Number[]} im 
+ *    - The imaginary part of each point.
+ */
+function ApplyMixedRadixFFTPermuted_128_Part1(re, im) {
+    let t0, t1, t10, t11, t2, t3, t4, t5, t6, t7, t8, t9;
+    const C0 = 0.9238795325112867;
+    const C1 = 1.3065629648763766;
+    const C2 = 0.5411961001461969;
+    const C3 = 0.7071067811865476;
+    const C4 = 0.3826834323650898;
+    const C5 = 0.9807852804032304;
+    const C6 = 1.1758756024193586;
+    const C7 = 0.7856949583871022;
+    const C8 = 0.8314696123025452;
+    const C9 = 1.3870398453221475;
+    const C10 = 0.27589937928294306;
+    const C11 = 1.0478631305325905;
+    const C12 = 0.9497277818777544;
+    const C13 = 1.213011433097808;
+    const C14 = 0.72705107329128;
+    const C15 = 0.9039892931234433;
+    const C16 = 1.3315443865537255;
+    const C17 = 0.47643419969316125;
+    const C18 = 1.3989068359730783;
+    const C19 = 0.20750822698821159;
+    const C20 = 0.9951847266721969;
+    const C21 = 1.0932018670017576;
+    const C22 = 0.8971675863426363;
+    const C23 = 0.9569403357322088;
+    const C24 = 1.247225012986671;
+    const C25 = 0.6666556584777465;
+    const C26 = 0.881921264348355;
+    const C27 = 1.3533180011743526;
+    const C28 = 0.4105245275223574;
+    const C29 = 0.773010453362737;
+    const C30 = 1.4074037375263826;
+    const C31 = 0.1386171691990915;
+    const C32 = 0.989176509964781;
+    const C33 = 1.1359069844201428;
+    const C34 = 0.8424460355094192;
+    const C35 = 1.278433918575241;
+    const C36 = 0.6046542117908007;
+    const C37 = 1.371831354193494;
+    const C38 = 0.34362586580705046;
+    const C39 = 0.7409511253549591;
+    const C40 = 1.4125100802019774;
+    const C41 = 0.06939217050794078;
+    const C42 = 0.6343932841636455;
+    const C43 = 0.5555702330196022;
+    const C44 = 0.19509032201612825;
+    const C45 = 0.47139673682599764;
+    const C46 = 0.0980171403295606;
+    t0 = re[0];
+    t1 = im[0];
+    t2 = re[32];
+    t3 = im[32];
+    t4 = re[64];
+    t5 = im[64];
+    t6 = re[96];
+    t7 = im[96];
+    t8 = t0 + t4;
+    t9 = t1 + t5;
+    t10 = t2 + t6;
+    t11 = t3 + t7;
+    t0 = t0 - t4;
+    t4 = t1 - t5;
+    t1 = t2 - t6;
+    t5 = t3 - t7;
+    t2 = t8 + t10;
+    t6 = t9 + t11;
+    t3 = t0 + t5;
+    t7 = t4 - t1;
+    t8 = t8 - t10;
+    t10 = t9 - t11;
+    t9 = t0 - t5;
+    t11 = t4 + t1;
+    re[0] = t2;
+    im[0] = t6;
+    re[32] = t3;
+    im[32] = t7;
+    re[64] = t8;
+    im[64] = t10;
+    re[96] = t9;
+    im[96] = t11;
+    t0 = re[8];
+    t5 = im[8];
+    t4 = re[40];
+    t1 = im[40];
+    t2 = re[72];
+    t6 = im[72];
+    t3 = re[104];
+    t7 = im[104];
+    t8 = t0 + t2;
+    t10 = t5 + t6;
+    t9 = t4 + t3;
+    t11 = t1 + t7;
+    t0 = t0 - t2;
+    t2 = t5 - t6;
+    t5 = t4 - t3;
+    t6 = t1 - t7;
+    t4 = t8 + t9;
+    t3 = t10 + t11;
+    t1 = t0 + t6;
+    t7 = t2 - t5;
+    t8 = t8 - t9;
+    t9 = t10 - t11;
+    t10 = t0 - t6;
+    t11 = t2 + t5;
+    t0 = t1 + t7;
+    t6 = C0 * t0;
+    t2 = t1 * (-C1);
+    t5 = t7 * C2;
+    t0 = t6 - t5;
+    t1 = t6 + t2;
+    t7 = t8 + t9;
+    t5 = t8 - t9;
+    t6 = C3 * t7;
+    t2 = (-C3) * t5;
+    t8 = t10 + t11;
+    t9 = C4 * t8;
+    t7 = t10 * (-C1);
+    t5 = t11 * (-C2);
+    t8 = t9 - t5;
+    t10 = t9 + t7;
+    re[8] = t4;
+    im[8] = t3;
+    re[40] = t0;
+    im[40] = t1;
+    re[72] = t6;
+    im[72] = t2;
+    re[104] = t8;
+    im[104] = t10;
+    t11 = re[16];
+    t5 = im[16];
+    t9 = re[48];
+    t7 = im[48];
+    t4 = re[80];
+    t3 = im[80];
+    t0 = re[112];
+    t1 = im[112];
+    t6 = t11 + t4;
+    t2 = t5 + t3;
+    t8 = t9 + t0;
+    t10 = t7 + t1;
+    t11 = t11 - t4;
+    t4 = t5 - t3;
+    t5 = t9 - t0;
+    t3 = t7 - t1;
+    t9 = t6 + t8;
+    t0 = t2 + t10;
+    t7 = t11 + t3;
+    t1 = t4 - t5;
+    t6 = t6 - t8;
+    t8 = t2 - t10;
+    t2 = t11 - t3;
+    t10 = t4 + t5;
+    t11 = t7 + t1;
+    t3 = t7 - t1;
+    t4 = C3 * t11;
+    t5 = (-C3) * t3;
+    t7 = -t6;
+    t1 = t2 - t10;
+    t11 = t2 + t10;
+    t3 = (-C3) * t1;
+    t6 = (-C3) * t11;
+    re[16] = t9;
+    im[16] = t0;
+    re[48] = t4;
+    im[48] = t5;
+    re[80] = t8;
+    im[80] = t7;
+    re[112] = t3;
+    im[112] = t6;
+    t2 = re[24];
+    t10 = im[24];
+    t1 = re[56];
+    t11 = im[56];
+    t9 = re[88];
+    t0 = im[88];
+    t4 = re[120];
+    t5 = im[120];
+    t8 = t2 + t9;
+    t7 = t10 + t0;
+    t3 = t1 + t4;
+    t6 = t11 + t5;
+    t2 = t2 - t9;
+    t9 = t10 - t0;
+    t10 = t1 - t4;
+    t0 = t11 - t5;
+    t1 = t8 + t3;
+    t4 = t7 + t6;
+    t11 = t2 + t0;
+    t5 = t9 - t10;
+    t8 = t8 - t3;
+    t3 = t7 - t6;
+    t7 = t2 - t0;
+    t6 = t9 + t10;
+    t2 = t11 + t5;
+    t0 = C4 * t2;
+    t9 = t11 * (-C1);
+    t10 = t5 * (-C2);
+    t2 = t0 - t10;
+    t11 = t0 + t9;
+    t5 = t8 - t3;
+    t10 = t8 + t3;
+    t0 = (-C3) * t5;
+    t9 = (-C3) * t10;
+    t8 = t7 + t6;
+    t3 = (-C0) * t8;
+    t5 = t7 * C1;
+    t10 = t6 * (-C2);
+    t8 = t3 - t10;
+    t7 = t3 + t5;
+    re[24] = t1;
+    im[24] = t4;
+    re[56] = t2;
+    im[56] = t11;
+    re[88] = t0;
+    im[88] = t9;
+    re[120] = t8;
+    im[120] = t7;
+    t6 = re[0];
+    t10 = im[0];
+    t3 = re[8];
+    t5 = im[8];
+    t1 = re[16];
+    t4 = im[16];
+    t2 = re[24];
+    t11 = im[24];
+    t0 = t6 + t1;
+    t9 = t10 + t4;
+    t8 = t3 + t2;
+    t7 = t5 + t11;
+    t6 = t6 - t1;
+    t1 = t10 - t4;
+    t10 = t3 - t2;
+    t4 = t5 - t11;
+    t3 = t0 + t8;
+    t2 = t9 + t7;
+    t5 = t6 + t4;
+    t11 = t1 - t10;
+    t0 = t0 - t8;
+    t8 = t9 - t7;
+    t9 = t6 - t4;
+    t7 = t1 + t10;
+    re[0] = t3;
+    im[0] = t2;
+    re[8] = t5;
+    im[8] = t11;
+    re[16] = t0;
+    im[16] = t8;
+    re[24] = t9;
+    im[24] = t7;
+    t6 = re[32];
+    t4 = im[32];
+    t1 = re[40];
+    t10 = im[40];
+    t3 = re[48];
+    t2 = im[48];
+    t5 = re[56];
+    t11 = im[56];
+    t0 = t6 + t3;
+    t8 = t4 + t2;
+    t9 = t1 + t5;
+    t7 = t10 + t11;
+    t6 = t6 - t3;
+    t3 = t4 - t2;
+    t4 = t1 - t5;
+    t2 = t10 - t11;
+    t1 = t0 + t9;
+    t5 = t8 + t7;
+    t10 = t6 + t2;
+    t11 = t3 - t4;
+    t0 = t0 - t9;
+    t9 = t8 - t7;
+    t8 = t6 - t2;
+    t7 = t3 + t4;
+    re[32] = t1;
+    im[32] = t5;
+    re[40] = t10;
+    im[40] = t11;
+    re[48] = t0;
+    im[48] = t9;
+    re[56] = t8;
+    im[56] = t7;
+    t6 = re[64];
+    t2 = im[64];
+    t3 = re[72];
+    t4 = im[72];
+    t1 = re[80];
+    t5 = im[80];
+    t10 = re[88];
+    t11 = im[88];
+    t0 = t6 + t1;
+    t9 = t2 + t5;
+    t8 = t3 + t10;
+    t7 = t4 + t11;
+    t6 = t6 - t1;
+    t1 = t2 - t5;
+    t2 = t3 - t10;
+    t5 = t4 - t11;
+    t3 = t0 + t8;
+    t10 = t9 + t7;
+    t4 = t6 + t5;
+    t11 = t1 - t2;
+    t0 = t0 - t8;
+    t8 = t9 - t7;
+    t9 = t6 - t5;
+    t7 = t1 + t2;
+    re[64] = t3;
+    im[64] = t10;
+    re[72] = t4;
+    im[72] = t11;
+    re[80] = t0;
+    im[80] = t8;
+    re[88] = t9;
+    im[88] = t7;
+    t6 = re[96];
+    t5 = im[96];
+    t1 = re[104];
+    t2 = im[104];
+    t3 = re[112];
+    t10 = im[112];
+    t4 = re[120];
+    t11 = im[120];
+    t0 = t6 + t3;
+    t8 = t5 + t10;
+    t9 = t1 + t4;
+    t7 = t2 + t11;
+    t6 = t6 - t3;
+    t3 = t5 - t10;
+    t5 = t1 - t4;
+    t10 = t2 - t11;
+    t1 = t0 + t9;
+    t4 = t8 + t7;
+    t2 = t6 + t10;
+    t11 = t3 - t5;
+    t0 = t0 - t9;
+    t9 = t8 - t7;
+    t8 = t6 - t10;
+    t7 = t3 + t5;
+    re[96] = t1;
+    im[96] = t4;
+    re[104] = t2;
+    im[104] = t11;
+    re[112] = t0;
+    im[112] = t9;
+    re[120] = t8;
+    im[120] = t7;
+    t6 = re[1];
+    t10 = im[1];
+    t3 = re[33];
+    t5 = im[33];
+    t1 = re[65];
+    t4 = im[65];
+    t2 = re[97];
+    t11 = im[97];
+    t0 = t6 + t1;
+    t9 = t10 + t4;
+    t8 = t3 + t2;
+    t7 = t5 + t11;
+    t6 = t6 - t1;
+    t1 = t10 - t4;
+    t10 = t3 - t2;
+    t4 = t5 - t11;
+    t3 = t0 + t8;
+    t2 = t9 + t7;
+    t5 = t6 + t4;
+    t11 = t1 - t10;
+    t0 = t0 - t8;
+    t8 = t9 - t7;
+    t9 = t6 - t4;
+    t7 = t1 + t10;
+    re[1] = t3;
+    im[1] = t2;
+    re[33] = t5;
+    im[33] = t11;
+    re[65] = t0;
+    im[65] = t8;
+    re[97] = t9;
+    im[97] = t7;
+    t6 = re[9];
+    t4 = im[9];
+    t1 = re[41];
+    t10 = im[41];
+    t3 = re[73];
+    t2 = im[73];
+    t5 = re[105];
+    t11 = im[105];
+    t0 = t6 + t3;
+    t8 = t4 + t2;
+    t9 = t1 + t5;
+    t7 = t10 + t11;
+    t6 = t6 - t3;
+    t3 = t4 - t2;
+    t4 = t1 - t5;
+    t2 = t10 - t11;
+    t1 = t0 + t9;
+    t5 = t8 + t7;
+    t10 = t6 + t2;
+    t11 = t3 - t4;
+    t0 = t0 - t9;
+    t9 = t8 - t7;
+    t8 = t6 - t2;
+    t7 = t3 + t4;
+    t6 = t10 + t11;
+    t2 = C0 * t6;
+    t3 = t10 * (-C1);
+    t4 = t11 * C2;
+    t6 = t2 - t4;
+    t10 = t2 + t3;
+    t11 = t0 + t9;
+    t4 = t0 - t9;
+    t2 = C3 * t11;
+    t3 = (-C3) * t4;
+    t0 = t8 + t7;
+    t9 = C4 * t0;
+    t11 = t8 * (-C1);
+    t4 = t7 * (-C2);
+    t0 = t9 - t4;
+    t8 = t9 + t11;
+    re[9] = t1;
+    im[9] = t5;
+    re[41] = t6;
+    im[41] = t10;
+    re[73] = t2;
+    im[73] = t3;
+    re[105] = t0;
+    im[105] = t8;
+    t7 = re[17];
+    t4 = im[17];
+    t9 = re[49];
+    t11 = im[49];
+    t1 = re[81];
+    t5 = im[81];
+    t6 = re[113];
+    t10 = im[113];
+    t2 = t7 + t1;
+    t3 = t4 + t5;
+    t0 = t9 + t6;
+    t8 = t11 + t10;
+    t7 = t7 - t1;
+    t1 = t4 - t5;
+    t4 = t9 - t6;
+    t5 = t11 - t10;
+    t9 = t2 + t0;
+    t6 = t3 + t8;
+    t11 = t7 + t5;
+    t10 = t1 - t4;
+    t2 = t2 - t0;
+    t0 = t3 - t8;
+    t3 = t7 - t5;
+    t8 = t1 + t4;
+    t7 = t11 + t10;
+    t5 = t11 - t10;
+    t1 = C3 * t7;
+    t4 = (-C3) * t5;
+    t11 = -t2;
+    t10 = t3 - t8;
+    t7 = t3 + t8;
+    t5 = (-C3) * t10;
+    t2 = (-C3) * t7;
+    re[17] = t9;
+    im[17] = t6;
+    re[49] = t1;
+    im[49] = t4;
+    re[81] = t0;
+    im[81] = t11;
+    re[113] = t5;
+    im[113] = t2;
+    t3 = re[25];
+    t8 = im[25];
+    t10 = re[57];
+    t7 = im[57];
+    t9 = re[89];
+    t6 = im[89];
+    t1 = re[121];
+    t4 = im[121];
+    t0 = t3 + t9;
+    t11 = t8 + t6;
+    t5 = t10 + t1;
+    t2 = t7 + t4;
+    t3 = t3 - t9;
+    t9 = t8 - t6;
+    t8 = t10 - t1;
+    t6 = t7 - t4;
+    t10 = t0 + t5;
+    t1 = t11 + t2;
+    t7 = t3 + t6;
+    t4 = t9 - t8;
+    t0 = t0 - t5;
+    t5 = t11 - t2;
+    t11 = t3 - t6;
+    t2 = t9 + t8;
+    t3 = t7 + t4;
+    t6 = C4 * t3;
+    t9 = t7 * (-C1);
+    t8 = t4 * (-C2);
+    t3 = t6 - t8;
+    t7 = t6 + t9;
+    t4 = t0 - t5;
+    t8 = t0 + t5;
+    t6 = (-C3) * t4;
+    t9 = (-C3) * t8;
+    t0 = t11 + t2;
+    t5 = (-C0) * t0;
+    t4 = t11 * C1;
+    t8 = t2 * (-C2);
+    t0 = t5 - t8;
+    t11 = t5 + t4;
+    re[25] = t10;
+    im[25] = t1;
+    re[57] = t3;
+    im[57] = t7;
+    re[89] = t6;
+    im[89] = t9;
+    re[121] = t0;
+    im[121] = t11;
+    t2 = re[1];
+    t8 = im[1];
+    t5 = re[9];
+    t4 = im[9];
+    t10 = re[17];
+    t1 = im[17];
+    t3 = re[25];
+    t7 = im[25];
+    t6 = t2 + t10;
+    t9 = t8 + t1;
+    t0 = t5 + t3;
+    t11 = t4 + t7;
+    t2 = t2 - t10;
+    t10 = t8 - t1;
+    t8 = t5 - t3;
+    t1 = t4 - t7;
+    t5 = t6 + t0;
+    t3 = t9 + t11;
+    t4 = t2 + t1;
+    t7 = t10 - t8;
+    t6 = t6 - t0;
+    t0 = t9 - t11;
+    t9 = t2 - t1;
+    t11 = t10 + t8;
+    t2 = t4 + t7;
+    t1 = C5 * t2;
+    t10 = t4 * (-C6);
+    t8 = t7 * C7;
+    t2 = t1 - t8;
+    t4 = t1 + t10;
+    t7 = t6 + t0;
+    t8 = C0 * t7;
+    t1 = t6 * (-C1);
+    t10 = t0 * C2;
+    t7 = t8 - t10;
+    t6 = t8 + t1;
+    t0 = t9 + t11;
+    t10 = C8 * t0;
+    t8 = t9 * (-C9);
+    t1 = t11 * C10;
+    t0 = t10 - t1;
+    t9 = t10 + t8;
+    re[1] = t5;
+    im[1] = t3;
+    re[9] = t2;
+    im[9] = t4;
+    re[17] = t7;
+    im[17] = t6;
+    re[25] = t0;
+    im[25] = t9;
+    t11 = re[33];
+    t1 = im[33];
+    t10 = re[41];
+    t8 = im[41];
+    t5 = re[49];
+    t3 = im[49];
+    t2 = re[57];
+    t4 = im[57];
+    t7 = t11 + t5;
+    t6 = t1 + t3;
+    t0 = t10 + t2;
+    t9 = t8 + t4;
+    t11 = t11 - t5;
+    t5 = t1 - t3;
+    t1 = t10 - t2;
+    t3 = t8 - t4;
+    t10 = t7 + t0;
+    t2 = t6 + t9;
+    t8 = t11 + t3;
+    t4 = t5 - t1;
+    t7 = t7 - t0;
+    t0 = t6 - t9;
+    t6 = t11 - t3;
+    t9 = t5 + t1;
+    t11 = t10 + t2;
+    t3 = 0.9987954562051724 * t11;
+    t5 = t10 * (-C11);
+    t1 = t2 * C12;
+    t11 = t3 - t1;
+    t10 = t3 + t5;
+    t2 = t8 + t4;
+    t1 = 0.970031253194544 * t2;
+    t3 = t8 * (-C13);
+    t5 = t4 * C14;
+    t2 = t1 - t5;
+    t8 = t1 + t3;
+    t4 = t7 + t0;
+    t5 = C15 * t4;
+    t1 = t7 * (-C16);
+    t3 = t0 * C17;
+    t4 = t5 - t3;
+    t7 = t5 + t1;
+    t0 = t6 + t9;
+    t3 = 0.8032075314806449 * t0;
+    t5 = t6 * (-C18);
+    t1 = t9 * C19;
+    t0 = t3 - t1;
+    t6 = t3 + t5;
+    re[33] = t11;
+    im[33] = t10;
+    re[41] = t2;
+    im[41] = t8;
+    re[49] = t4;
+    im[49] = t7;
+    re[57] = t0;
+    im[57] = t6;
+    t9 = re[65];
+    t1 = im[65];
+    t3 = re[73];
+    t5 = im[73];
+    t11 = re[81];
+    t10 = im[81];
+    t2 = re[89];
+    t8 = im[89];
+    t4 = t9 + t11;
+    t7 = t1 + t10;
+    t0 = t3 + t2;
+    t6 = t5 + t8;
+    t9 = t9 - t11;
+    t11 = t1 - t10;
+    t1 = t3 - t2;
+    t10 = t5 - t8;
+    t3 = t4 + t0;
+    t2 = t7 + t6;
+    t5 = t9 + t10;
+    t8 = t11 - t1;
+    t4 = t4 - t0;
+    t0 = t7 - t6;
+    t7 = t9 - t10;
+    t6 = t11 + t1;
+    t9 = t3 + t2;
+    t10 = C20 * t9;
+    t11 = t3 * (-C21);
+    t1 = t2 * C22;
+    t9 = t10 - t1;
+    t3 = t10 + t11;
+    t2 = t5 + t8;
+    t1 = C23 * t2;
+    t10 = t5 * (-C24);
+    t11 = t8 * C25;
+    t2 = t1 - t11;
+    t5 = t1 + t10;
+    t8 = t4 + t0;
+    t11 = C26 * t8;
+    t1 = t4 * (-C27);
+    t10 = t0 * C28;
+    t8 = t11 - t10;
+    t4 = t11 + t1;
+    t0 = t7 + t6;
+    t10 = C29 * t0;
+    t11 = t7 * (-C30);
+    t1 = t6 * C31;
+    t0 = t10 - t1;
+    t7 = t10 + t11;
+    re[65] = t9;
+    im[65] = t3;
+    re[73] = t2;
+    im[73] = t5;
+    re[81] = t8;
+    im[81] = t4;
+    re[89] = t0;
+    im[89] = t7;
+    t6 = re[97];
+    t1 = im[97];
+    t10 = re[105];
+    t11 = im[105];
+    t9 = re[113];
+    t3 = im[113];
+    t2 = re[121];
+    t5 = im[121];
+    t8 = t6 + t9;
+    t4 = t1 + t3;
+    t0 = t10 + t2;
+    t7 = t11 + t5;
+    t6 = t6 - t9;
+    t9 = t1 - t3;
+    t1 = t10 - t2;
+    t3 = t11 - t5;
+    t10 = t8 + t0;
+    t2 = t4 + t7;
+    t11 = t6 + t3;
+    t5 = t9 - t1;
+    t8 = t8 - t0;
+    t0 = t4 - t7;
+    t4 = t6 - t3;
+    t7 = t9 + t1;
+    t6 = t10 + t2;
+    t3 = C32 * t6;
+    t9 = t10 * (-C33);
+    t1 = t2 * C34;
+    t6 = t3 - t1;
+    t10 = t3 + t9;
+    t2 = t11 + t5;
+    t1 = 0.9415440651830208 * t2;
+    t3 = t11 * (-C35);
+    t9 = t5 * C36;
+    t2 = t1 - t9;
+    t11 = t1 + t3;
+    t5 = t8 + t0;
+    t9 = 0.8577286100002721 * t5;
+    t1 = t8 * (-C37);
+    t3 = t0 * C38;
+    t5 = t9 - t3;
+    t8 = t9 + t1;
+    t0 = t4 + t7;
+    t3 = C39 * t0;
+    t9 = t4 * (-C40);
+    t1 = t7 * C41;
+    t0 = t3 - t1;
+    t4 = t3 + t9;
+    re[97] = t6;
+    im[97] = t10;
+    re[105] = t2;
+    im[105] = t11;
+    re[113] = t5;
+    im[113] = t8;
+    re[121] = t0;
+    im[121] = t4;
+    t7 = re[2];
+    t1 = im[2];
+    t3 = re[34];
+    t9 = im[34];
+    t6 = re[66];
+    t10 = im[66];
+    t2 = re[98];
+    t11 = im[98];
+    t5 = t7 + t6;
+    t8 = t1 + t10;
+    t0 = t3 + t2;
+    t4 = t9 + t11;
+    t7 = t7 - t6;
+    t6 = t1 - t10;
+    t1 = t3 - t2;
+    t10 = t9 - t11;
+    t3 = t5 + t0;
+    t2 = t8 + t4;
+    t9 = t7 + t10;
+    t11 = t6 - t1;
+    t5 = t5 - t0;
+    t0 = t8 - t4;
+    t8 = t7 - t10;
+    t4 = t6 + t1;
+    re[2] = t3;
+    im[2] = t2;
+    re[34] = t9;
+    im[34] = t11;
+    re[66] = t5;
+    im[66] = t0;
+    re[98] = t8;
+    im[98] = t4;
+    t7 = re[10];
+    t10 = im[10];
+    t6 = re[42];
+    t1 = im[42];
+    t3 = re[74];
+    t2 = im[74];
+    t9 = re[106];
+    t11 = im[106];
+    t5 = t7 + t3;
+    t0 = t10 + t2;
+    t8 = t6 + t9;
+    t4 = t1 + t11;
+    t7 = t7 - t3;
+    t3 = t10 - t2;
+    t10 = t6 - t9;
+    t2 = t1 - t11;
+    t6 = t5 + t8;
+    t9 = t0 + t4;
+    t1 = t7 + t2;
+    t11 = t3 - t10;
+    t5 = t5 - t8;
+    t8 = t0 - t4;
+    t0 = t7 - t2;
+    t4 = t3 + t10;
+    t7 = t1 + t11;
+    t2 = C0 * t7;
+    t3 = t1 * (-C1);
+    t10 = t11 * C2;
+    t7 = t2 - t10;
+    t1 = t2 + t3;
+    t11 = t5 + t8;
+    t10 = t5 - t8;
+    t2 = C3 * t11;
+    t3 = (-C3) * t10;
+    t5 = t0 + t4;
+    t8 = C4 * t5;
+    t11 = t0 * (-C1);
+    t10 = t4 * (-C2);
+    t5 = t8 - t10;
+    t0 = t8 + t11;
+    re[10] = t6;
+    im[10] = t9;
+    re[42] = t7;
+    im[42] = t1;
+    re[74] = t2;
+    im[74] = t3;
+    re[106] = t5;
+    im[106] = t0;
+    t4 = re[18];
+    t10 = im[18];
+    t8 = re[50];
+    t11 = im[50];
+    t6 = re[82];
+    t9 = im[82];
+    t7 = re[114];
+    t1 = im[114];
+    t2 = t4 + t6;
+    t3 = t10 + t9;
+    t5 = t8 + t7;
+    t0 = t11 + t1;
+    t4 = t4 - t6;
+    t6 = t10 - t9;
+    t10 = t8 - t7;
+    t9 = t11 - t1;
+    t8 = t2 + t5;
+    t7 = t3 + t0;
+    t11 = t4 + t9;
+    t1 = t6 - t10;
+    t2 = t2 - t5;
+    t5 = t3 - t0;
+    t3 = t4 - t9;
+    t0 = t6 + t10;
+    t4 = t11 + t1;
+    t9 = t11 - t1;
+    t6 = C3 * t4;
+    t10 = (-C3) * t9;
+    t11 = -t2;
+    t1 = t3 - t0;
+    t4 = t3 + t0;
+    t9 = (-C3) * t1;
+    t2 = (-C3) * t4;
+    re[18] = t8;
+    im[18] = t7;
+    re[50] = t6;
+    im[50] = t10;
+    re[82] = t5;
+    im[82] = t11;
+    re[114] = t9;
+    im[114] = t2;
+    t3 = re[26];
+    t0 = im[26];
+    t1 = re[58];
+    t4 = im[58];
+    t8 = re[90];
+    t7 = im[90];
+    t6 = re[122];
+    t10 = im[122];
+    t5 = t3 + t8;
+    t11 = t0 + t7;
+    t9 = t1 + t6;
+    t2 = t4 + t10;
+    t3 = t3 - t8;
+    t8 = t0 - t7;
+    t0 = t1 - t6;
+    t7 = t4 - t10;
+    t1 = t5 + t9;
+    t6 = t11 + t2;
+    t4 = t3 + t7;
+    t10 = t8 - t0;
+    t5 = t5 - t9;
+    t9 = t11 - t2;
+    t11 = t3 - t7;
+    t2 = t8 + t0;
+    t3 = t4 + t10;
+    t7 = C4 * t3;
+    t8 = t4 * (-C1);
+    t0 = t10 * (-C2);
+    t3 = t7 - t0;
+    t4 = t7 + t8;
+    t10 = t5 - t9;
+    t0 = t5 + t9;
+    t7 = (-C3) * t10;
+    t8 = (-C3) * t0;
+    t5 = t11 + t2;
+    t9 = (-C0) * t5;
+    t10 = t11 * C1;
+    t0 = t2 * (-C2);
+    t5 = t9 - t0;
+    t11 = t9 + t10;
+    re[26] = t1;
+    im[26] = t6;
+    re[58] = t3;
+    im[58] = t4;
+    re[90] = t7;
+    im[90] = t8;
+    re[122] = t5;
+    im[122] = t11;
+    t2 = re[2];
+    t0 = im[2];
+    t9 = re[10];
+    t10 = im[10];
+    t1 = re[18];
+    t6 = im[18];
+    t3 = re[26];
+    t4 = im[26];
+    t7 = t2 + t1;
+    t8 = t0 + t6;
+    t5 = t9 + t3;
+    t11 = t10 + t4;
+    t2 = t2 - t1;
+    t1 = t0 - t6;
+    t0 = t9 - t3;
+    t6 = t10 - t4;
+    t9 = t7 + t5;
+    t3 = t8 + t11;
+    t10 = t2 + t6;
+    t4 = t1 - t0;
+    t7 = t7 - t5;
+    t5 = t8 - t11;
+    t8 = t2 - t6;
+    t11 = t1 + t0;
+    t2 = t10 + t4;
+    t6 = C0 * t2;
+    t1 = t10 * (-C1);
+    t0 = t4 * C2;
+    t2 = t6 - t0;
+    t10 = t6 + t1;
+    t4 = t7 + t5;
+    t0 = t7 - t5;
+    t6 = C3 * t4;
+    t1 = (-C3) * t0;
+    t7 = t8 + t11;
+    t5 = C4 * t7;
+    t4 = t8 * (-C1);
+    t0 = t11 * (-C2);
+    t7 = t5 - t0;
+    t8 = t5 + t4;
+    re[2] = t9;
+    im[2] = t3;
+    re[10] = t2;
+    im[10] = t10;
+    re[18] = t6;
+    im[18] = t1;
+    re[26] = t7;
+    im[26] = t8;
+    t11 = re[34];
+    t0 = im[34];
+    t5 = re[42];
+    t4 = im[42];
+    t9 = re[50];
+    t3 = im[50];
+    t2 = re[58];
+    t10 = im[58];
+    t6 = t11 + t9;
+    t1 = t0 + t3;
+    t7 = t5 + t2;
+    t8 = t4 + t10;
+    t11 = t11 - t9;
+    t9 = t0 - t3;
+    t0 = t5 - t2;
+    t3 = t4 - t10;
+    t5 = t6 + t7;
+    t2 = t1 + t8;
+    t4 = t11 + t3;
+    t10 = t9 - t0;
+    t6 = t6 - t7;
+    t7 = t1 - t8;
+    t1 = t11 - t3;
+    t8 = t9 + t0;
+    t11 = t5 + t2;
+    t3 = C20 * t11;
+    t9 = t5 * (-C21);
+    t0 = t2 * C22;
+    t11 = t3 - t0;
+    t5 = t3 + t9;
+    t2 = t4 + t10;
+    t0 = C26 * t2;
+    t3 = t4 * (-C27);
+    t9 = t10 * C28;
+    t2 = t0 - t9;
+    t4 = t0 + t3;
+    t10 = t6 + t7;
+    t9 = C42 * t10;
+    t0 = t6 * (-C30);
+    t3 = t7 * (-C31);
+    t10 = t9 - t3;
+    t6 = t9 + t0;
+    t7 = t1 + t8;
+    t3 = 0.29028467725446233 * t7;
+    t9 = t1 * (-C24);
+    t0 = t8 * (-C25);
+    t7 = t3 - t0;
+    t1 = t3 + t9;
+    re[34] = t11;
+    im[34] = t5;
+    re[42] = t2;
+    im[42] = t4;
+    re[50] = t10;
+    im[50] = t6;
+    re[58] = t7;
+    im[58] = t1;
+    t8 = re[66];
+    t0 = im[66];
+    t3 = re[74];
+    t9 = im[74];
+    t11 = re[82];
+    t5 = im[82];
+    t2 = re[90];
+    t4 = im[90];
+    t10 = t8 + t11;
+    t6 = t0 + t5;
+    t7 = t3 + t2;
+    t1 = t9 + t4;
+    t8 = t8 - t11;
+    t11 = t0 - t5;
+    t0 = t3 - t2;
+    t5 = t9 - t4;
+    t3 = t10 + t7;
+    t2 = t6 + t1;
+    t9 = t8 + t5;
+    t4 = t11 - t0;
+    t10 = t10 - t7;
+    t7 = t6 - t1;
+    t6 = t8 - t5;
+    t1 = t11 + t0;
+    t8 = t3 + t2;
+    t5 = C5 * t8;
+    t11 = t3 * (-C6);
+    t0 = t2 * C7;
+    t8 = t5 - t0;
+    t3 = t5 + t11;
+    t2 = t9 + t4;
+    t0 = C8 * t2;
+    t5 = t9 * (-C9);
+    t11 = t4 * C10;
+    t2 = t0 - t11;
+    t9 = t0 + t5;
+    t4 = t10 + t7;
+    t11 = C43 * t4;
+    t0 = t10 * (-C9);
+    t5 = t7 * (-C10);
+    t4 = t11 - t5;
+    t10 = t11 + t0;
+    t7 = t6 + t1;
+    t5 = C44 * t7;
+    t11 = t6 * (-C6);
+    t0 = t1 * (-C7);
+    t7 = t5 - t0;
+    t6 = t5 + t11;
+    re[66] = t8;
+    im[66] = t3;
+    re[74] = t2;
+    im[74] = t9;
+    re[82] = t4;
+    im[82] = t10;
+    re[90] = t7;
+    im[90] = t6;
+    t1 = re[98];
+    t0 = im[98];
+    t5 = re[106];
+    t11 = im[106];
+    t8 = re[114];
+    t3 = im[114];
+    t2 = re[122];
+    t9 = im[122];
+    t4 = t1 + t8;
+    t10 = t0 + t3;
+    t7 = t5 + t2;
+    t6 = t11 + t9;
+    t1 = t1 - t8;
+    t8 = t0 - t3;
+    t0 = t5 - t2;
+    t3 = t11 - t9;
+    t5 = t4 + t7;
+    t2 = t10 + t6;
+    t11 = t1 + t3;
+    t9 = t8 - t0;
+    t4 = t4 - t7;
+    t7 = t10 - t6;
+    t10 = t1 - t3;
+    t6 = t8 + t0;
+    t1 = t5 + t2;
+    t3 = C23 * t1;
+    t8 = t5 * (-C24);
+    t0 = t2 * C25;
+    t1 = t3 - t0;
+    t5 = t3 + t8;
+    t2 = t11 + t9;
+    t0 = C29 * t2;
+    t3 = t11 * (-C30);
+    t8 = t9 * C31;
+    t2 = t0 - t8;
+    t11 = t0 + t3;
+    t9 = t4 + t7;
+    t8 = C45 * t9;
+    t0 = t4 * (-C27);
+    t3 = t7 * (-C28);
+    t9 = t8 - t3;
+    t4 = t8 + t0;
+    t7 = t10 + t6;
+    t3 = C46 * t7;
+    t8 = t10 * (-C21);
+    t0 = t6 * (-C22);
+    t7 = t3 - t0;
+    t10 = t3 + t8;
+    re[98] = t1;
+    im[98] = t5;
+    re[106] = t2;
+    im[106] = t11;
+    re[114] = t9;
+    im[114] = t4;
+    re[122] = t7;
+    im[122] = t10;
+    t6 = re[3];
+    t0 = im[3];
+    t3 = re[35];
+    t8 = im[35];
+    t1 = re[67];
+    t5 = im[67];
+    t2 = re[99];
+    t11 = im[99];
+    t9 = t6 + t1;
+    t4 = t0 + t5;
+    t7 = t3 + t2;
+    t10 = t8 + t11;
+    t6 = t6 - t1;
+    t1 = t0 - t5;
+    t0 = t3 - t2;
+    t5 = t8 - t11;
+    t3 = t9 + t7;
+    t2 = t4 + t10;
+    t8 = t6 + t5;
+    t11 = t1 - t0;
+    t9 = t9 - t7;
+    t7 = t4 - t10;
+    t4 = t6 - t5;
+    t10 = t1 + t0;
+    re[3] = t3;
+    im[3] = t2;
+    re[35] = t8;
+    im[35] = t11;
+    re[67] = t9;
+    im[67] = t7;
+    re[99] = t4;
+    im[99] = t10;
+    t6 = re[11];
+    t5 = im[11];
+    t1 = re[43];
+    t0 = im[43];
+    t3 = re[75];
+    t2 = im[75];
+    t8 = re[107];
+    t11 = im[107];
+    t9 = t6 + t3;
+    t7 = t5 + t2;
+    t4 = t1 + t8;
+    t10 = t0 + t11;
+    t6 = t6 - t3;
+    t3 = t5 - t2;
+    t5 = t1 - t8;
+    t2 = t0 - t11;
+    t1 = t9 + t4;
+    t8 = t7 + t10;
+    t0 = t6 + t2;
+    t11 = t3 - t5;
+    t9 = t9 - t4;
+    t4 = t7 - t10;
+    t7 = t6 - t2;
+    t10 = t3 + t5;
+    t6 = t0 + t11;
+    t2 = C0 * t6;
+    t3 = t0 * (-C1);
+    t5 = t11 * C2;
+    t6 = t2 - t5;
+    t0 = t2 + t3;
+    t11 = t9 + t4;
+    t5 = t9 - t4;
+    t2 = C3 * t11;
+    t3 = (-C3) * t5;
+    t9 = t7 + t10;
+    t4 = C4 * t9;
+    t11 = t7 * (-C1);
+    t5 = t10 * (-C2);
+    t9 = t4 - t5;
+    t7 = t4 + t11;
+    re[11] = t1;
+    im[11] = t8;
+    re[43] = t6;
+    im[43] = t0;
+    re[75] = t2;
+    im[75] = t3;
+    re[107] = t9;
+    im[107] = t7;
+    t10 = re[19];
+    t5 = im[19];
+    t4 = re[51];
+    t11 = im[51];
+    t1 = re[83];
+    t8 = im[83];
+    t6 = re[115];
+    t0 = im[115];
+    t2 = t10 + t1;
+    t3 = t5 + t8;
+    t9 = t4 + t6;
+    t7 = t11 + t0;
+    t10 = t10 - t1;
+    t1 = t5 - t8;
+    t5 = t4 - t6;
+    t8 = t11 - t0;
+    t4 = t2 + t9;
+    t6 = t3 + t7;
+    t11 = t10 + t8;
+    t0 = t1 - t5;
+    t2 = t2 - t9;
+    t9 = t3 - t7;
+    t3 = t10 - t8;
+    t7 = t1 + t5;
+    t10 = t11 + t0;
+    t8 = t11 - t0;
+    t1 = C3 * t10;
+    t5 = (-C3) * t8;
+    t11 = -t2;
+    t0 = t3 - t7;
+    t10 = t3 + t7;
+    t8 = (-C3) * t0;
+    t2 = (-C3) * t10;
+    re[19] = t4;
+    im[19] = t6;
+    re[51] = t1;
+    im[51] = t5;
+    re[83] = t9;
+    im[83] = t11;
+    re[115] = t8;
+    im[115] = t2;
+    t3 = re[27];
+    t7 = im[27];
+    t0 = re[59];
+    t10 = im[59];
+    t4 = re[91];
+    t6 = im[91];
+    t1 = re[123];
+    t5 = im[123];
+    t9 = t3 + t4;
+    t11 = t7 + t6;
+    t8 = t0 + t1;
+    t2 = t10 + t5;
+    t3 = t3 - t4;
+    t4 = t7 - t6;
+    t7 = t0 - t1;
+    t6 = t10 - t5;
+    t0 = t9 + t8;
+    t1 = t11 + t2;
+    t10 = t3 + t6;
+    t5 = t4 - t7;
+    t9 = t9 - t8;
+    t8 = t11 - t2;
+    t11 = t3 - t6;
+    t2 = t4 + t7;
+    t3 = t10 + t5;
+    t6 = C4 * t3;
+    t4 = t10 * (-C1);
+    t7 = t5 * (-C2);
+    t3 = t6 - t7;
+    t10 = t6 + t4;
+    t5 = t9 - t8;
+    t7 = t9 + t8;
+    t6 = (-C3) * t5;
+    t4 = (-C3) * t7;
+    t9 = t11 + t2;
+    t8 = (-C0) * t9;
+    t5 = t11 * C1;
+    t7 = t2 * (-C2);
+    t9 = t8 - t7;
+    t11 = t8 + t5;
+    re[27] = t0;
+    im[27] = t1;
+    re[59] = t3;
+    im[59] = t10;
+    re[91] = t6;
+    im[91] = t4;
+    re[123] = t9;
+    im[123] = t11;
+    t2 = re[3];
+    t7 = im[3];
+    t8 = re[11];
+    t5 = im[11];
+    t0 = re[19];
+    t1 = im[19];
+    t3 = re[27];
+    t10 = im[27];
+    t6 = t2 + t0;
+    t4 = t7 + t1;
+    t9 = t8 + t3;
+    t11 = t5 + t10;
+    t2 = t2 - t0;
+    t0 = t7 - t1;
+    t7 = t8 - t3;
+    t1 = t5 - t10;
+    t8 = t6 + t9;
+    t3 = t4 + t11;
+    t5 = t2 + t1;
+    t10 = t0 - t7;
+    t6 = t6 - t9;
+    t9 = t4 - t11;
+    t4 = t2 - t1;
+    t11 = t0 + t7;
+    t2 = t5 + t10;
+    t1 = C8 * t2;
+    t0 = t5 * (-C9);
+    t7 = t10 * C10;
+    t2 = t1 - t7;
+    t5 = t1 + t0;
+    t10 = t6 + t9;
+    t7 = C4 * t10;
+    t1 = t6 * (-C1);
+    t0 = t9 * (-C2);
+    t10 = t7 - t0;
+    t6 = t7 + t1;
+    t9 = t4 + t11;
+    t0 = (-C44) * t9;
+    t7 = t4 * (-C7);
+    t1 = t11 * (-C6);
+    t9 = t0 - t1;
+    t4 = t0 + t7;
+    re[3] = t8;
+    im[3] = t3;
+    re[11] = t2;
+    im[11] = t5;
+    re[19] = t10;
+    im[19] = t6;
+    re[27] = t9;
+    im[27] = t4;
+    t11 = re[35];
+    t1 = im[35];
+    t0 = re[43];
+    t7 = im[43];
+    t8 = re[51];
+    t3 = im[51];
+    t2 = re[59];
+    t5 = im[59];
+    t10 = t11 + t8;
+    t6 = t1 + t3;
+    t9 = t0 + t2;
+    t4 = t7 + t5;
+    t11 = t11 - t8;
+    t8 = t1 - t3;
+    t1 = t0 - t2;
+    t3 = t7 - t5;
+    t0 = t10 + t9;
+    t2 = t6 + t4;
+    t7 = t11 + t3;
+    t5 = t8 - t1;
+    t10 = t10 - t9;
+    t9 = t6 - t4;
+    t6 = t11 - t3;
+    t4 = t8 + t1;
+    t11 = t0 + t2;
+    t3 = C32 * t11;
+    t8 = t0 * (-C33);
+    t1 = t2 * C34;
+    t11 = t3 - t1;
+    t0 = t3 + t8;
+    t2 = t7 + t5;
+    t1 = C39 * t2;
+    t3 = t7 * (-C40);
+    t8 = t5 * C41;
+    t2 = t1 - t8;
+    t7 = t1 + t3;
+    t5 = t10 + t9;
+    t8 = 0.24298017990326387 * t5;
+    t1 = t10 * (-C13);
+    t3 = t9 * (-C14);
+    t5 = t8 - t3;
+    t10 = t8 + t1;
+    t9 = t6 + t4;
+    t3 = (-0.33688985339222005) * t9;
+    t8 = t6 * (-C36);
+    t1 = t4 * (-C35);
+    t9 = t3 - t1;
+    t6 = t3 + t8;
+    re[35] = t11;
+    im[35] = t0;
+    re[43] = t2;
+    im[43] = t7;
+    re[51] = t5;
+    im[51] = t10;
+    re[59] = t9;
+    im[59] = t6;
+    t4 = re[67];
+    t1 = im[67];
+    t3 = re[75];
+    t8 = im[75];
+    t11 = re[83];
+    t0 = im[83];
+    t2 = re[91];
+    t7 = im[91];
+    t5 = t4 + t11;
+    t10 = t1 + t0;
+    t9 = t3 + t2;
+    t6 = t8 + t7;
+    t4 = t4 - t11;
+    t11 = t1 - t0;
+    t1 = t3 - t2;
+    t0 = t8 - t7;
+    t3 = t5 + t9;
+    t2 = t10 + t6;
+    t8 = t4 + t0;
+    t7 = t11 - t1;
+    t5 = t5 - t9;
+    t9 = t10 - t6;
+    t10 = t4 - t0;
+    t6 = t11 + t1;
+    t4 = t3 + t2;
+    t0 = C23 * t4;
+    t11 = t3 * (-C24);
+    t1 = t2 * C25;
+    t4 = t0 - t1;
+    t3 = t0 + t11;
+    t2 = t8 + t7;
+    t1 = C42 * t2;
+    t0 = t8 * (-C30);
+    t11 = t7 * (-C31);
+    t2 = t1 - t11;
+    t8 = t1 + t0;
+    t7 = t5 + t9;
+    t11 = C46 * t7;
+    t1 = t5 * (-C21);
+    t0 = t9 * (-C22);
+    t7 = t11 - t0;
+    t5 = t11 + t1;
+    t9 = t10 + t6;
+    t0 = (-C45) * t9;
+    t11 = t10 * (-C28);
+    t1 = t6 * (-C27);
+    t9 = t0 - t1;
+    t10 = t0 + t11;
+    re[67] = t4;
+    im[67] = t3;
+    re[75] = t2;
+    im[75] = t8;
+    re[83] = t7;
+    im[83] = t5;
+    re[91] = t9;
+    im[91] = t10;
+    t6 = re[99];
+    t1 = im[99];
+    t0 = re[107];
+    t11 = im[107];
+    t4 = re[115];
+    t3 = im[115];
+    t2 = re[123];
+    t8 = im[123];
+    t7 = t6 + t4;
+    t5 = t1 + t3;
+    t9 = t0 + t2;
+    t10 = t11 + t8;
+    t6 = t6 - t4;
+    t4 = t1 - t3;
+    t1 = t0 - t2;
+    t3 = t11 - t8;
+    t0 = t7 + t9;
+    t2 = t5 + t10;
+    t11 = t6 + t3;
+    t8 = t4 - t1;
+    t7 = t7 - t9;
+    t9 = t5 - t10;
+    t5 = t6 - t3;
+    t10 = t4 + t1;
+    t6 = t0 + t2;
+    t3 = C15 * t6;
+    t4 = t0 * (-C16);
+    t1 = t2 * C17;
+    t6 = t3 - t1;
+    t0 = t3 + t4;
+    t2 = t11 + t8;
+    t1 = 0.5141027441932217 * t2;
+    t3 = t11 * (-C37);
+    t4 = t8 * (-C38);
+    t2 = t1 - t4;
+    t11 = t1 + t3;
+    t8 = t7 + t9;
+    t4 = (-0.049067674327418015) * t8;
+    t1 = t7 * (-C12);
+    t3 = t9 * (-C11);
+    t8 = t4 - t3;
+    t7 = t4 + t1;
+    t9 = t5 + t10;
+    t3 = (-0.5956993044924334) * t9;
+    t4 = t5 * (-C19);
+    t1 = t10 * (-C18);
+    t9 = t3 - t1;
+    t5 = t3 + t4;
+    re[99] = t6;
+    im[99] = t0;
+    re[107] = t2;
+    im[107] = t11;
+    re[115] = t8;
+    im[115] = t7;
+    re[123] = t9;
+    im[123] = t5;
+    t10 = re[4];
+    t1 = im[4];
+    t3 = re[36];
+    t4 = im[36];
+    t6 = re[68];
+    t0 = im[68];
+    t2 = re[100];
+    t11 = im[100];
+    t8 = t10 + t6;
+    t7 = t1 + t0;
+    t9 = t3 + t2;
+    t5 = t4 + t11;
+    t10 = t10 - t6;
+    t6 = t1 - t0;
+    t1 = t3 - t2;
+    t0 = t4 - t11;
+    t3 = t8 + t9;
+    t2 = t7 + t5;
+    t4 = t10 + t0;
+    t11 = t6 - t1;
+    t8 = t8 - t9;
+    t9 = t7 - t5;
+    t7 = t10 - t0;
+    t5 = t6 + t1;
+    re[4] = t3;
+    im[4] = t2;
+    re[36] = t4;
+    im[36] = t11;
+    re[68] = t8;
+    im[68] = t9;
+    re[100] = t7;
+    im[100] = t5;
+    t10 = re[12];
+    t0 = im[12];
+    t6 = re[44];
+    t1 = im[44];
+    t3 = re[76];
+    t2 = im[76];
+    t4 = re[108];
+    t11 = im[108];
+    t8 = t10 + t3;
+    t9 = t0 + t2;
+    t7 = t6 + t4;
+    t5 = t1 + t11;
+    t10 = t10 - t3;
+    t3 = t0 - t2;
+    t0 = t6 - t4;
+    t2 = t1 - t11;
+    t6 = t8 + t7;
+    t4 = t9 + t5;
+    t1 = t10 + t2;
+    t11 = t3 - t0;
+    t8 = t8 - t7;
+    t7 = t9 - t5;
+    t9 = t10 - t2;
+    t5 = t3 + t0;
+    t10 = t1 + t11;
+    t2 = C0 * t10;
+    t3 = t1 * (-C1);
+    t0 = t11 * C2;
+    t10 = t2 - t0;
+    t1 = t2 + t3;
+    t11 = t8 + t7;
+    t0 = t8 - t7;
+    t2 = C3 * t11;
+    t3 = (-C3) * t0;
+    t8 = t9 + t5;
+    t7 = C4 * t8;
+    t11 = t9 * (-C1);
+    t0 = t5 * (-C2);
+    t8 = t7 - t0;
+    t9 = t7 + t11;
+    re[12] = t6;
+    im[12] = t4;
+    re[44] = t10;
+    im[44] = t1;
+    re[76] = t2;
+    im[76] = t3;
+    re[108] = t8;
+    im[108] = t9;
+    t5 = re[20];
+    t0 = im[20];
+    t7 = re[52];
+    t11 = im[52];
+    t6 = re[84];
+    t4 = im[84];
+    t10 = re[116];
+    t1 = im[116];
+    t2 = t5 + t6;
+    t3 = t0 + t4;
+    t8 = t7 + t10;
+    t9 = t11 + t1;
+    t5 = t5 - t6;
+    t6 = t0 - t4;
+    t0 = t7 - t10;
+    t4 = t11 - t1;
+    t7 = t2 + t8;
+    t10 = t3 + t9;
+    t11 = t5 + t4;
+    t1 = t6 - t0;
+    t2 = t2 - t8;
+    t8 = t3 - t9;
+    t3 = t5 - t4;
+    t9 = t6 + t0;
+    t5 = t11 + t1;
+    t4 = t11 - t1;
+    t6 = C3 * t5;
+    t0 = (-C3) * t4;
+    t11 = -t2;
+    t1 = t3 - t9;
+    t5 = t3 + t9;
+    t4 = (-C3) * t1;
+    t2 = (-C3) * t5;
+    re[20] = t7;
+    im[20] = t10;
+    re[52] = t6;
+    im[52] = t0;
+    re[84] = t8;
+    im[84] = t11;
+    re[116] = t4;
+    im[116] = t2;
+    t3 = re[28];
+    t9 = im[28];
+    t1 = re[60];
+    t5 = im[60];
+    t7 = re[92];
+    t10 = im[92];
+    t6 = re[124];
+    t0 = im[124];
+    t8 = t3 + t7;
+    t11 = t9 + t10;
+    t4 = t1 + t6;
+    t2 = t5 + t0;
+    t3 = t3 - t7;
+    t7 = t9 - t10;
+    t9 = t1 - t6;
+    t10 = t5 - t0;
+    t1 = t8 + t4;
+    t6 = t11 + t2;
+    t5 = t3 + t10;
+    t0 = t7 - t9;
+    t8 = t8 - t4;
+    t4 = t11 - t2;
+    t11 = t3 - t10;
+    t2 = t7 + t9;
+    t3 = t5 + t0;
+    t10 = C4 * t3;
+    t7 = t5 * (-C1);
+    t9 = t0 * (-C2);
+    t3 = t10 - t9;
+    t5 = t10 + t7;
+    t0 = t8 - t4;
+    t9 = t8 + t4;
+    t10 = (-C3) * t0;
+    t7 = (-C3) * t9;
+    t8 = t11 + t2;
+    t4 = (-C0) * t8;
+    t0 = t11 * C1;
+    t9 = t2 * (-C2);
+    t8 = t4 - t9;
+    t11 = t4 + t0;
+    re[28] = t1;
+    im[28] = t6;
+    re[60] = t3;
+    im[60] = t5;
+    re[92] = t10;
+    im[92] = t7;
+    re[124] = t8;
+    im[124] = t11;
+    t2 = re[4];
+    t9 = im[4];
+    t4 = re[12];
+    t0 = im[12];
+    t1 = re[20];
+    t6 = im[20];
+    t3 = re[28];
+    t5 = im[28];
+    t10 = t2 + t1;
+    t7 = t9 + t6;
+    t8 = t4 + t3;
+    t11 = t0 + t5;
+    t2 = t2 - t1;
+    t1 = t9 - t6;
+    t9 = t4 - t3;
+    t6 = t0 - t5;
+    t4 = t10 + t8;
+    t3 = t7 + t11;
+    t0 = t2 + t6;
+    t5 = t1 - t9;
+    t10 = t10 - t8;
+    t8 = t7 - t11;
+    t7 = t2 - t6;
+    t11 = t1 + t9;
+    t2 = t0 + t5;
+    t6 = t0 - t5;
+    t1 = C3 * t2;
+    t9 = (-C3) * t6;
+    t0 = -t10;
+    t5 = t7 - t11;
+    t2 = t7 + t11;
+    t6 = (-C3) * t5;
+    t10 = (-C3) * t2;
+    re[4] = t4;
+    im[4] = t3;
+    re[12] = t1;
+    im[12] = t9;
+    re[20] = t8;
+    im[20] = t0;
+    re[28] = t6;
+    im[28] = t10;
+    t7 = re[36];
+    t11 = im[36];
+    t5 = re[44];
+    t2 = im[44];
+    t4 = re[52];
+    t3 = im[52];
+    t1 = re[60];
+    t9 = im[60];
+    t8 = t7 + t4;
+    t0 = t11 + t3;
+    t6 = t5 + t1;
+    t10 = t2 + t9;
+    t7 = t7 - t4;
+    t4 = t11 - t3;
+    t11 = t5 - t1;
+    t3 = t2 - t9;
+    t5 = t8 + t6;
+    t1 = t0 + t10;
+    t2 = t7 + t3;
+    t9 = t4 - t11;
+    t8 = t8 - t6;
+    t6 = t0 - t10;
+    t0 = t7 - t3;
+    t10 = t4 + t11;
+    t7 = t5 + t1;
+    t3 = C5 * t7;
+    t4 = t5 * (-C6);
+    t11 = t1 * C7;
+    t7 = t3 - t11;
+    t5 = t3 + t4;
+    t1 = t2 + t9;
+    t11 = C43 * t1;
+    t3 = t2 * (-C9);
+    t4 = t9 * (-C10);
+    t1 = t11 - t4;
+    t2 = t11 + t3;
+    t9 = t8 + t6;
+    t4 = (-C44) * t9;
+    t11 = t8 * (-C7);
+    t3 = t6 * (-C6);
+    t9 = t4 - t3;
+    t8 = t4 + t11;
+    t6 = t0 + t10;
+    t3 = (-C8) * t6;
+    t4 = t0 * C10;
+    t11 = t10 * (-C9);
+    t6 = t3 - t11;
+    t0 = t3 + t4;
+    re[36] = t7;
+    im[36] = t5;
+    re[44] = t1;
+    im[44] = t2;
+    re[52] = t9;
+    im[52] = t8;
+    re[60] = t6;
+    im[60] = t0;
+    t10 = re[68];
+    t11 = im[68];
+    t3 = re[76];
+    t4 = im[76];
+    t7 = re[84];
+    t5 = im[84];
+    t1 = re[92];
+    t2 = im[92];
+    t9 = t10 + t7;
+    t8 = t11 + t5;
+    t6 = t3 + t1;
+    t0 = t4 + t2;
+    t10 = t10 - t7;
+    t7 = t11 - t5;
+    t11 = t3 - t1;
+    t5 = t4 - t2;
+    t3 = t9 + t6;
+    t1 = t8 + t0;
+    t4 = t10 + t5;
+    t2 = t7 - t11;
+    t9 = t9 - t6;
+    t6 = t8 - t0;
+    t8 = t10 - t5;
+    t0 = t7 + t11;
+    t10 = t3 + t1;
+    t5 = C0 * t10;
+    t7 = t3 * (-C1);
+    t11 = t1 * C2;
+    t10 = t5 - t11;
+    t3 = t5 + t7;
+    t1 = t4 + t2;
+    t11 = C4 * t1;
+    t5 = t4 * (-C1);
+    t7 = t2 * (-C2);
+    t1 = t11 - t7;
+    t4 = t11 + t5;
+    t2 = t9 + t6;
+    t7 = (-C4) * t2;
+    t11 = t9 * (-C2);
+    t5 = t6 * (-C1);
+    t2 = t7 - t5;
+    t9 = t7 + t11;
+    t6 = t8 + t0;
+    t5 = (-C0) * t6;
+    t7 = t8 * C2;
+    t11 = t0 * (-C1);
+    t6 = t5 - t11;
+    t8 = t5 + t7;
+    re[68] = t10;
+    im[68] = t3;
+    re[76] = t1;
+    im[76] = t4;
+    re[84] = t2;
+    im[84] = t9;
+    re[92] = t6;
+    im[92] = t8;
+    t0 = re[100];
+    t11 = im[100];
+    t5 = re[108];
+    t7 = im[108];
+    t10 = re[116];
+    t3 = im[116];
+    t1 = re[124];
+    t4 = im[124];
+    t2 = t0 + t10;
+    t9 = t11 + t3;
+    t6 = t5 + t1;
+    t8 = t7 + t4;
+    t0 = t0 - t10;
+    t10 = t11 - t3;
+    t11 = t5 - t1;
+    t3 = t7 - t4;
+    t5 = t2 + t6;
+    t1 = t9 + t8;
+    t7 = t0 + t3;
+    t4 = t10 - t11;
+    t2 = t2 - t6;
+    t6 = t9 - t8;
+    t9 = t0 - t3;
+    t8 = t10 + t11;
+    t0 = t5 + t1;
+    t3 = C8 * t0;
+    t10 = t5 * (-C9);
+    t11 = t1 * C10;
+    t0 = t3 - t11;
+    t5 = t3 + t10;
+    t1 = t7 + t4;
+    t11 = C44 * t1;
+    t3 = t7 * (-C6);
+    t10 = t4 * (-C7);
+    t1 = t11 - t10;
+    t7 = t11 + t3;
+    t4 = t2 + t6;
+    t10 = (-C43) * t4;
+    t11 = t2 * (-C10);
+    t3 = t6 * (-C9);
+    t4 = t10 - t3;
+    t2 = t10 + t11;
+    t6 = t9 + t8;
+    t3 = (-C5) * t6;
+    t10 = t9 * C7;
+    t11 = t8 * (-C6);
+    t6 = t3 - t11;
+    t9 = t3 + t10;
+    re[100] = t0;
+    im[100] = t5;
+    re[108] = t1;
+    im[108] = t7;
+    re[116] = t4;
+    im[116] = t2;
+    re[124] = t6;
+    im[124] = t9;
+}
+
+/**
+ *  Part 2 of ApplyMixedRadixFFTPermuted_128().
+ * 
+ *  @param {Number[]} re 
+ *    - The real part of each point.
+ *  @param {Number[]} im 
+ *    - The imaginary part of each point.
+ */
+function ApplyMixedRadixFFTPermuted_128_Part2(re, im) {
+    let t0, t1, t10, t11, t12, t13, t14, t15, t16, t17, t18, t19, t2, t3, t4, t5, t6, t7, t8, t9;
+    const C0 = 0.9238795325112867;
+    const C1 = 1.3065629648763766;
+    const C2 = 0.5411961001461969;
+    const C3 = 0.7071067811865476;
+    const C4 = 0.3826834323650898;
+    const C5 = 0.5555702330196022;
+    const C6 = 1.3870398453221475;
+    const C7 = 0.27589937928294306;
+    const C8 = 0.9807852804032304;
+    const C9 = 0.7856949583871022;
+    const C10 = 1.1758756024193586;
+    const C11 = 1.213011433097808;
+    const C12 = 0.72705107329128;
+    const C13 = 1.278433918575241;
+    const C14 = 0.6046542117908007;
+    const C15 = 0.20750822698821159;
+    const C16 = 1.3989068359730783;
+    const C17 = 0.9987954562051724;
+    const C18 = 1.0478631305325905;
+    const C19 = 0.9497277818777544;
+    const C20 = 0.881921264348355;
+    const C21 = 1.3533180011743526;
+    const C22 = 0.4105245275223574;
+    const C23 = 0.0980171403295606;
+    const C24 = 1.0932018670017576;
+    const C25 = 0.8971675863426363;
+    const C26 = 0.773010453362737;
+    const C27 = 0.1386171691990915;
+    const C28 = 1.4074037375263826;
+    const C29 = 0.9569403357322088;
+    const C30 = 1.247225012986671;
+    const C31 = 0.6666556584777465;
+    const C32 = 0.7409511253549591;
+    const C33 = 1.4125100802019774;
+    const C34 = 0.06939217050794078;
+    const C35 = 0.14673047445536175;
+    const C36 = 0.8424460355094192;
+    const C37 = 1.1359069844201428;
+    const C38 = 0.47643419969316125;
+    const C39 = 1.3315443865537255;
+    const C40 = 1.371831354193494;
+    const C41 = 0.34362586580705046;
+    const C42 = 0.19509032201612825;
+    const C43 = 0.47139673682599764;
+    t8 = re[5];
+    t11 = im[5];
+    t3 = re[37];
+    t10 = im[37];
+    t0 = re[69];
+    t5 = im[69];
+    t1 = re[101];
+    t7 = im[101];
+    t4 = t8 + t0;
+    t2 = t11 + t5;
+    t6 = t3 + t1;
+    t9 = t10 + t7;
+    t8 = t8 - t0;
+    t0 = t11 - t5;
+    t11 = t3 - t1;
+    t5 = t10 - t7;
+    t3 = t4 + t6;
+    t1 = t2 + t9;
+    t10 = t8 + t5;
+    t7 = t0 - t11;
+    t4 = t4 - t6;
+    t6 = t2 - t9;
+    t2 = t8 - t5;
+    t9 = t0 + t11;
+    re[5] = t3;
+    im[5] = t1;
+    re[37] = t10;
+    im[37] = t7;
+    re[69] = t4;
+    im[69] = t6;
+    re[101] = t2;
+    im[101] = t9;
+    t8 = re[13];
+    t5 = im[13];
+    t0 = re[45];
+    t11 = im[45];
+    t3 = re[77];
+    t1 = im[77];
+    t10 = re[109];
+    t7 = im[109];
+    t4 = t8 + t3;
+    t6 = t5 + t1;
+    t2 = t0 + t10;
+    t9 = t11 + t7;
+    t8 = t8 - t3;
+    t3 = t5 - t1;
+    t5 = t0 - t10;
+    t1 = t11 - t7;
+    t0 = t4 + t2;
+    t10 = t6 + t9;
+    t11 = t8 + t1;
+    t7 = t3 - t5;
+    t4 = t4 - t2;
+    t2 = t6 - t9;
+    t6 = t8 - t1;
+    t9 = t3 + t5;
+    t8 = t11 + t7;
+    t1 = C0 * t8;
+    t3 = t11 * (-C1);
+    t5 = t7 * C2;
+    t8 = t1 - t5;
+    t11 = t1 + t3;
+    t7 = t4 + t2;
+    t5 = t4 - t2;
+    t1 = C3 * t7;
+    t3 = (-C3) * t5;
+    t4 = t6 + t9;
+    t2 = C4 * t4;
+    t7 = t6 * (-C1);
+    t5 = t9 * (-C2);
+    t4 = t2 - t5;
+    t6 = t2 + t7;
+    re[13] = t0;
+    im[13] = t10;
+    re[45] = t8;
+    im[45] = t11;
+    re[77] = t1;
+    im[77] = t3;
+    re[109] = t4;
+    im[109] = t6;
+    t9 = re[21];
+    t5 = im[21];
+    t2 = re[53];
+    t7 = im[53];
+    t0 = re[85];
+    t10 = im[85];
+    t8 = re[117];
+    t11 = im[117];
+    t1 = t9 + t0;
+    t3 = t5 + t10;
+    t4 = t2 + t8;
+    t6 = t7 + t11;
+    t9 = t9 - t0;
+    t0 = t5 - t10;
+    t5 = t2 - t8;
+    t10 = t7 - t11;
+    t2 = t1 + t4;
+    t8 = t3 + t6;
+    t7 = t9 + t10;
+    t11 = t0 - t5;
+    t1 = t1 - t4;
+    t4 = t3 - t6;
+    t3 = t9 - t10;
+    t6 = t0 + t5;
+    t9 = t7 + t11;
+    t10 = t7 - t11;
+    t0 = C3 * t9;
+    t5 = (-C3) * t10;
+    t7 = -t1;
+    t11 = t3 - t6;
+    t9 = t3 + t6;
+    t10 = (-C3) * t11;
+    t1 = (-C3) * t9;
+    re[21] = t2;
+    im[21] = t8;
+    re[53] = t0;
+    im[53] = t5;
+    re[85] = t4;
+    im[85] = t7;
+    re[117] = t10;
+    im[117] = t1;
+    t3 = re[29];
+    t6 = im[29];
+    t11 = re[61];
+    t9 = im[61];
+    t2 = re[93];
+    t8 = im[93];
+    t0 = re[125];
+    t5 = im[125];
+    t4 = t3 + t2;
+    t7 = t6 + t8;
+    t10 = t11 + t0;
+    t1 = t9 + t5;
+    t3 = t3 - t2;
+    t2 = t6 - t8;
+    t6 = t11 - t0;
+    t8 = t9 - t5;
+    t11 = t4 + t10;
+    t0 = t7 + t1;
+    t9 = t3 + t8;
+    t5 = t2 - t6;
+    t4 = t4 - t10;
+    t10 = t7 - t1;
+    t7 = t3 - t8;
+    t1 = t2 + t6;
+    t3 = t9 + t5;
+    t8 = C4 * t3;
+    t2 = t9 * (-C1);
+    t6 = t5 * (-C2);
+    t3 = t8 - t6;
+    t9 = t8 + t2;
+    t5 = t4 - t10;
+    t6 = t4 + t10;
+    t8 = (-C3) * t5;
+    t2 = (-C3) * t6;
+    t4 = t7 + t1;
+    t10 = (-C0) * t4;
+    t5 = t7 * C1;
+    t6 = t1 * (-C2);
+    t4 = t10 - t6;
+    t7 = t10 + t5;
+    re[29] = t11;
+    im[29] = t0;
+    re[61] = t3;
+    im[61] = t9;
+    re[93] = t8;
+    im[93] = t2;
+    re[125] = t4;
+    im[125] = t7;
+    t1 = re[5];
+    t6 = im[5];
+    t10 = re[13];
+    t5 = im[13];
+    t11 = re[21];
+    t0 = im[21];
+    t3 = re[29];
+    t9 = im[29];
+    t8 = t1 + t11;
+    t2 = t6 + t0;
+    t4 = t10 + t3;
+    t7 = t5 + t9;
+    t1 = t1 - t11;
+    t11 = t6 - t0;
+    t6 = t10 - t3;
+    t0 = t5 - t9;
+    t10 = t8 + t4;
+    t3 = t2 + t7;
+    t5 = t1 + t0;
+    t9 = t11 - t6;
+    t8 = t8 - t4;
+    t4 = t2 - t7;
+    t2 = t1 - t0;
+    t7 = t11 + t6;
+    t1 = t5 + t9;
+    t0 = C5 * t1;
+    t11 = t5 * (-C6);
+    t6 = t9 * (-C7);
+    t1 = t0 - t6;
+    t5 = t0 + t11;
+    t9 = t8 + t4;
+    t6 = (-C4) * t9;
+    t0 = t8 * (-C2);
+    t11 = t4 * (-C1);
+    t9 = t6 - t11;
+    t8 = t6 + t0;
+    t4 = t2 + t7;
+    t11 = (-C8) * t4;
+    t6 = t2 * C9;
+    t0 = t7 * (-C10);
+    t4 = t11 - t0;
+    t2 = t11 + t6;
+    re[5] = t10;
+    im[5] = t3;
+    re[13] = t1;
+    im[13] = t5;
+    re[21] = t9;
+    im[21] = t8;
+    re[29] = t4;
+    im[29] = t2;
+    t7 = re[37];
+    t0 = im[37];
+    t11 = re[45];
+    t6 = im[45];
+    t10 = re[53];
+    t3 = im[53];
+    t1 = re[61];
+    t5 = im[61];
+    t9 = t7 + t10;
+    t8 = t0 + t3;
+    t4 = t11 + t1;
+    t2 = t6 + t5;
+    t7 = t7 - t10;
+    t10 = t0 - t3;
+    t0 = t11 - t1;
+    t3 = t6 - t5;
+    t11 = t9 + t4;
+    t1 = t8 + t2;
+    t6 = t7 + t3;
+    t5 = t10 - t0;
+    t9 = t9 - t4;
+    t4 = t8 - t2;
+    t8 = t7 - t3;
+    t2 = t10 + t0;
+    t7 = t11 + t1;
+    t3 = 0.970031253194544 * t7;
+    t10 = t11 * (-C11);
+    t0 = t1 * C12;
+    t7 = t3 - t0;
+    t11 = t3 + t10;
+    t1 = t6 + t5;
+    t0 = 0.33688985339222005 * t1;
+    t3 = t6 * (-C13);
+    t10 = t5 * (-C14);
+    t1 = t0 - t10;
+    t6 = t0 + t3;
+    t5 = t9 + t4;
+    t10 = (-0.5956993044924334) * t5;
+    t0 = t9 * (-C15);
+    t3 = t4 * (-C16);
+    t5 = t10 - t3;
+    t9 = t10 + t0;
+    t4 = t8 + t2;
+    t3 = (-C17) * t4;
+    t10 = t8 * C18;
+    t0 = t2 * (-C19);
+    t4 = t3 - t0;
+    t8 = t3 + t10;
+    re[37] = t7;
+    im[37] = t11;
+    re[45] = t1;
+    im[45] = t6;
+    re[53] = t5;
+    im[53] = t9;
+    re[61] = t4;
+    im[61] = t8;
+    t2 = re[69];
+    t0 = im[69];
+    t3 = re[77];
+    t10 = im[77];
+    t7 = re[85];
+    t11 = im[85];
+    t1 = re[93];
+    t6 = im[93];
+    t5 = t2 + t7;
+    t9 = t0 + t11;
+    t4 = t3 + t1;
+    t8 = t10 + t6;
+    t2 = t2 - t7;
+    t7 = t0 - t11;
+    t0 = t3 - t1;
+    t11 = t10 - t6;
+    t3 = t5 + t4;
+    t1 = t9 + t8;
+    t10 = t2 + t11;
+    t6 = t7 - t0;
+    t5 = t5 - t4;
+    t4 = t9 - t8;
+    t9 = t2 - t11;
+    t8 = t7 + t0;
+    t2 = t3 + t1;
+    t11 = C20 * t2;
+    t7 = t3 * (-C21);
+    t0 = t1 * C22;
+    t2 = t11 - t0;
+    t3 = t11 + t7;
+    t1 = t10 + t6;
+    t0 = C23 * t1;
+    t11 = t10 * (-C24);
+    t7 = t6 * (-C25);
+    t1 = t0 - t7;
+    t10 = t0 + t11;
+    t6 = t5 + t4;
+    t7 = (-C26) * t6;
+    t0 = t5 * C27;
+    t11 = t4 * (-C28);
+    t6 = t7 - t11;
+    t5 = t7 + t0;
+    t4 = t9 + t8;
+    t11 = (-C29) * t4;
+    t7 = t9 * C30;
+    t0 = t8 * (-C31);
+    t4 = t11 - t0;
+    t9 = t11 + t7;
+    re[69] = t2;
+    im[69] = t3;
+    re[77] = t1;
+    im[77] = t10;
+    re[85] = t6;
+    im[85] = t5;
+    re[93] = t4;
+    im[93] = t9;
+    t8 = re[101];
+    t0 = im[101];
+    t11 = re[109];
+    t7 = im[109];
+    t2 = re[117];
+    t3 = im[117];
+    t1 = re[125];
+    t10 = im[125];
+    t6 = t8 + t2;
+    t5 = t0 + t3;
+    t4 = t11 + t1;
+    t9 = t7 + t10;
+    t8 = t8 - t2;
+    t2 = t0 - t3;
+    t0 = t11 - t1;
+    t3 = t7 - t10;
+    t11 = t6 + t4;
+    t1 = t5 + t9;
+    t7 = t8 + t3;
+    t10 = t2 - t0;
+    t6 = t6 - t4;
+    t4 = t5 - t9;
+    t5 = t8 - t3;
+    t9 = t2 + t0;
+    t8 = t11 + t1;
+    t3 = C32 * t8;
+    t2 = t11 * (-C33);
+    t0 = t1 * C34;
+    t8 = t3 - t0;
+    t11 = t3 + t2;
+    t1 = t7 + t10;
+    t0 = (-C35) * t1;
+    t3 = t7 * (-C36);
+    t2 = t10 * (-C37);
+    t1 = t0 - t2;
+    t7 = t0 + t3;
+    t10 = t6 + t4;
+    t2 = (-0.9039892931234433) * t10;
+    t0 = t6 * C38;
+    t3 = t4 * (-C39);
+    t10 = t2 - t3;
+    t6 = t2 + t0;
+    t4 = t5 + t9;
+    t3 = (-0.8577286100002721) * t4;
+    t2 = t5 * C40;
+    t0 = t9 * (-C41);
+    t4 = t3 - t0;
+    t5 = t3 + t2;
+    re[101] = t8;
+    im[101] = t11;
+    re[109] = t1;
+    im[109] = t7;
+    re[117] = t10;
+    im[117] = t6;
+    re[125] = t4;
+    im[125] = t5;
+    t9 = re[6];
+    t0 = im[6];
+    t3 = re[38];
+    t2 = im[38];
+    t8 = re[70];
+    t11 = im[70];
+    t1 = re[102];
+    t7 = im[102];
+    t10 = t9 + t8;
+    t6 = t0 + t11;
+    t4 = t3 + t1;
+    t5 = t2 + t7;
+    t9 = t9 - t8;
+    t8 = t0 - t11;
+    t0 = t3 - t1;
+    t11 = t2 - t7;
+    t3 = t10 + t4;
+    t1 = t6 + t5;
+    t2 = t9 + t11;
+    t7 = t8 - t0;
+    t10 = t10 - t4;
+    t4 = t6 - t5;
+    t6 = t9 - t11;
+    t5 = t8 + t0;
+    re[6] = t3;
+    im[6] = t1;
+    re[38] = t2;
+    im[38] = t7;
+    re[70] = t10;
+    im[70] = t4;
+    re[102] = t6;
+    im[102] = t5;
+    t9 = re[14];
+    t11 = im[14];
+    t8 = re[46];
+    t0 = im[46];
+    t3 = re[78];
+    t1 = im[78];
+    t2 = re[110];
+    t7 = im[110];
+    t10 = t9 + t3;
+    t4 = t11 + t1;
+    t6 = t8 + t2;
+    t5 = t0 + t7;
+    t9 = t9 - t3;
+    t3 = t11 - t1;
+    t11 = t8 - t2;
+    t1 = t0 - t7;
+    t8 = t10 + t6;
+    t2 = t4 + t5;
+    t0 = t9 + t1;
+    t7 = t3 - t11;
+    t10 = t10 - t6;
+    t6 = t4 - t5;
+    t4 = t9 - t1;
+    t5 = t3 + t11;
+    t9 = t0 + t7;
+    t1 = C0 * t9;
+    t3 = t0 * (-C1);
+    t11 = t7 * C2;
+    t9 = t1 - t11;
+    t0 = t1 + t3;
+    t7 = t10 + t6;
+    t11 = t10 - t6;
+    t1 = C3 * t7;
+    t3 = (-C3) * t11;
+    t10 = t4 + t5;
+    t6 = C4 * t10;
+    t7 = t4 * (-C1);
+    t11 = t5 * (-C2);
+    t10 = t6 - t11;
+    t4 = t6 + t7;
+    re[14] = t8;
+    im[14] = t2;
+    re[46] = t9;
+    im[46] = t0;
+    re[78] = t1;
+    im[78] = t3;
+    re[110] = t10;
+    im[110] = t4;
+    t5 = re[22];
+    t11 = im[22];
+    t6 = re[54];
+    t7 = im[54];
+    t8 = re[86];
+    t2 = im[86];
+    t9 = re[118];
+    t0 = im[118];
+    t1 = t5 + t8;
+    t3 = t11 + t2;
+    t10 = t6 + t9;
+    t4 = t7 + t0;
+    t5 = t5 - t8;
+    t8 = t11 - t2;
+    t11 = t6 - t9;
+    t2 = t7 - t0;
+    t6 = t1 + t10;
+    t9 = t3 + t4;
+    t7 = t5 + t2;
+    t0 = t8 - t11;
+    t1 = t1 - t10;
+    t10 = t3 - t4;
+    t3 = t5 - t2;
+    t4 = t8 + t11;
+    t5 = t7 + t0;
+    t2 = t7 - t0;
+    t8 = C3 * t5;
+    t11 = (-C3) * t2;
+    t7 = -t1;
+    t0 = t3 - t4;
+    t5 = t3 + t4;
+    t2 = (-C3) * t0;
+    t1 = (-C3) * t5;
+    re[22] = t6;
+    im[22] = t9;
+    re[54] = t8;
+    im[54] = t11;
+    re[86] = t10;
+    im[86] = t7;
+    re[118] = t2;
+    im[118] = t1;
+    t3 = re[30];
+    t4 = im[30];
+    t0 = re[62];
+    t5 = im[62];
+    t6 = re[94];
+    t9 = im[94];
+    t8 = re[126];
+    t11 = im[126];
+    t10 = t3 + t6;
+    t7 = t4 + t9;
+    t2 = t0 + t8;
+    t1 = t5 + t11;
+    t3 = t3 - t6;
+    t6 = t4 - t9;
+    t4 = t0 - t8;
+    t9 = t5 - t11;
+    t0 = t10 + t2;
+    t8 = t7 + t1;
+    t5 = t3 + t9;
+    t11 = t6 - t4;
+    t10 = t10 - t2;
+    t2 = t7 - t1;
+    t7 = t3 - t9;
+    t1 = t6 + t4;
+    t3 = t5 + t11;
+    t9 = C4 * t3;
+    t6 = t5 * (-C1);
+    t4 = t11 * (-C2);
+    t3 = t9 - t4;
+    t5 = t9 + t6;
+    t11 = t10 - t2;
+    t4 = t10 + t2;
+    t9 = (-C3) * t11;
+    t6 = (-C3) * t4;
+    t10 = t7 + t1;
+    t2 = (-C0) * t10;
+    t11 = t7 * C1;
+    t4 = t1 * (-C2);
+    t10 = t2 - t4;
+    t7 = t2 + t11;
+    re[30] = t0;
+    im[30] = t8;
+    re[62] = t3;
+    im[62] = t5;
+    re[94] = t9;
+    im[94] = t6;
+    re[126] = t10;
+    im[126] = t7;
+    t1 = re[6];
+    t4 = im[6];
+    t2 = re[14];
+    t11 = im[14];
+    t0 = re[22];
+    t8 = im[22];
+    t3 = re[30];
+    t5 = im[30];
+    t9 = t1 + t0;
+    t6 = t4 + t8;
+    t10 = t2 + t3;
+    t7 = t11 + t5;
+    t1 = t1 - t0;
+    t0 = t4 - t8;
+    t4 = t2 - t3;
+    t8 = t11 - t5;
+    t2 = t9 + t10;
+    t3 = t6 + t7;
+    t11 = t1 + t8;
+    t5 = t0 - t4;
+    t9 = t9 - t10;
+    t10 = t6 - t7;
+    t6 = t1 - t8;
+    t7 = t0 + t4;
+    t1 = t11 + t5;
+    t8 = C4 * t1;
+    t0 = t11 * (-C1);
+    t4 = t5 * (-C2);
+    t1 = t8 - t4;
+    t11 = t8 + t0;
+    t5 = t9 - t10;
+    t4 = t9 + t10;
+    t8 = (-C3) * t5;
+    t0 = (-C3) * t4;
+    t9 = t6 + t7;
+    t10 = (-C0) * t9;
+    t5 = t6 * C1;
+    t4 = t7 * (-C2);
+    t9 = t10 - t4;
+    t6 = t10 + t5;
+    re[6] = t2;
+    im[6] = t3;
+    re[14] = t1;
+    im[14] = t11;
+    re[22] = t8;
+    im[22] = t0;
+    re[30] = t9;
+    im[30] = t6;
+    t7 = re[38];
+    t4 = im[38];
+    t10 = re[46];
+    t5 = im[46];
+    t2 = re[54];
+    t3 = im[54];
+    t1 = re[62];
+    t11 = im[62];
+    t8 = t7 + t2;
+    t0 = t4 + t3;
+    t9 = t10 + t1;
+    t6 = t5 + t11;
+    t7 = t7 - t2;
+    t2 = t4 - t3;
+    t4 = t10 - t1;
+    t3 = t5 - t11;
+    t10 = t8 + t9;
+    t1 = t0 + t6;
+    t5 = t7 + t3;
+    t11 = t2 - t4;
+    t8 = t8 - t9;
+    t9 = t0 - t6;
+    t0 = t7 - t3;
+    t6 = t2 + t4;
+    t7 = t10 + t1;
+    t3 = C29 * t7;
+    t2 = t10 * (-C30);
+    t4 = t1 * C31;
+    t7 = t3 - t4;
+    t10 = t3 + t2;
+    t1 = t5 + t11;
+    t4 = C23 * t1;
+    t3 = t5 * (-C24);
+    t2 = t11 * (-C25);
+    t1 = t4 - t2;
+    t5 = t4 + t3;
+    t11 = t8 + t9;
+    t2 = (-C20) * t11;
+    t4 = t8 * C22;
+    t3 = t9 * (-C21);
+    t11 = t2 - t3;
+    t8 = t2 + t4;
+    t9 = t0 + t6;
+    t3 = (-C26) * t9;
+    t2 = t0 * C28;
+    t4 = t6 * (-C27);
+    t9 = t3 - t4;
+    t0 = t3 + t2;
+    re[38] = t7;
+    im[38] = t10;
+    re[46] = t1;
+    im[46] = t5;
+    re[54] = t11;
+    im[54] = t8;
+    re[62] = t9;
+    im[62] = t0;
+    t6 = re[70];
+    t4 = im[70];
+    t3 = re[78];
+    t2 = im[78];
+    t7 = re[86];
+    t10 = im[86];
+    t1 = re[94];
+    t5 = im[94];
+    t11 = t6 + t7;
+    t8 = t4 + t10;
+    t9 = t3 + t1;
+    t0 = t2 + t5;
+    t6 = t6 - t7;
+    t7 = t4 - t10;
+    t4 = t3 - t1;
+    t10 = t2 - t5;
+    t3 = t11 + t9;
+    t1 = t8 + t0;
+    t2 = t6 + t10;
+    t5 = t7 - t4;
+    t11 = t11 - t9;
+    t9 = t8 - t0;
+    t8 = t6 - t10;
+    t0 = t7 + t4;
+    t6 = t3 + t1;
+    t10 = 0.8314696123025452 * t6;
+    t7 = t3 * (-C6);
+    t4 = t1 * C7;
+    t6 = t10 - t4;
+    t3 = t10 + t7;
+    t1 = t2 + t5;
+    t4 = (-C42) * t1;
+    t10 = t2 * (-C9);
+    t7 = t5 * (-C10);
+    t1 = t4 - t7;
+    t2 = t4 + t10;
+    t5 = t11 + t9;
+    t7 = (-C8) * t5;
+    t4 = t11 * C9;
+    t10 = t9 * (-C10);
+    t5 = t7 - t10;
+    t11 = t7 + t4;
+    t9 = t8 + t0;
+    t10 = (-C5) * t9;
+    t7 = t8 * C6;
+    t4 = t0 * C7;
+    t9 = t10 - t4;
+    t8 = t10 + t7;
+    re[70] = t6;
+    im[70] = t3;
+    re[78] = t1;
+    im[78] = t2;
+    re[86] = t5;
+    im[86] = t11;
+    re[94] = t9;
+    im[94] = t8;
+    t0 = re[102];
+    t4 = im[102];
+    t10 = re[110];
+    t7 = im[110];
+    t6 = re[118];
+    t3 = im[118];
+    t1 = re[126];
+    t2 = im[126];
+    t5 = t0 + t6;
+    t11 = t4 + t3;
+    t9 = t10 + t1;
+    t8 = t7 + t2;
+    t0 = t0 - t6;
+    t6 = t4 - t3;
+    t4 = t10 - t1;
+    t3 = t7 - t2;
+    t10 = t5 + t9;
+    t1 = t11 + t8;
+    t7 = t0 + t3;
+    t2 = t6 - t4;
+    t5 = t5 - t9;
+    t9 = t11 - t8;
+    t11 = t0 - t3;
+    t8 = t6 + t4;
+    t0 = t10 + t1;
+    t3 = 0.6343932841636455 * t0;
+    t6 = t10 * (-C28);
+    t4 = t1 * (-C27);
+    t0 = t3 - t4;
+    t10 = t3 + t6;
+    t1 = t7 + t2;
+    t4 = (-C43) * t1;
+    t3 = t7 * (-C22);
+    t6 = t2 * (-C21);
+    t1 = t4 - t6;
+    t7 = t4 + t3;
+    t2 = t5 + t9;
+    t6 = (-0.9951847266721969) * t2;
+    t4 = t5 * C24;
+    t3 = t9 * (-C25);
+    t2 = t6 - t3;
+    t5 = t6 + t4;
+    t9 = t11 + t8;
+    t3 = (-0.29028467725446233) * t9;
+    t6 = t11 * C30;
+    t4 = t8 * C31;
+    t9 = t3 - t4;
+    t11 = t3 + t6;
+    re[102] = t0;
+    im[102] = t10;
+    re[110] = t1;
+    im[110] = t7;
+    re[118] = t2;
+    im[118] = t5;
+    re[126] = t9;
+    im[126] = t11;
+    t8 = re[7];
+    t4 = im[7];
+    t3 = re[39];
+    t6 = im[39];
+    t0 = re[71];
+    t10 = im[71];
+    t1 = re[103];
+    t7 = im[103];
+    t2 = t8 + t0;
+    t5 = t4 + t10;
+    t9 = t3 + t1;
+    t11 = t6 + t7;
+    t8 = t8 - t0;
+    t0 = t4 - t10;
+    t4 = t3 - t1;
+    t10 = t6 - t7;
+    t3 = t2 + t9;
+    t1 = t5 + t11;
+    t6 = t8 + t10;
+    t7 = t0 - t4;
+    t2 = t2 - t9;
+    t9 = t5 - t11;
+    t5 = t8 - t10;
+    t11 = t0 + t4;
+    re[7] = t3;
+    im[7] = t1;
+    re[39] = t6;
+    im[39] = t7;
+    re[71] = t2;
+    im[71] = t9;
+    re[103] = t5;
+    im[103] = t11;
+    t8 = re[15];
+    t10 = im[15];
+    t0 = re[47];
+    t4 = im[47];
+    t3 = re[79];
+    t1 = im[79];
+    t6 = re[111];
+    t7 = im[111];
+    t2 = t8 + t3;
+    t9 = t10 + t1;
+    t5 = t0 + t6;
+    t11 = t4 + t7;
+    t8 = t8 - t3;
+    t3 = t10 - t1;
+    t10 = t0 - t6;
+    t1 = t4 - t7;
+    t0 = t2 + t5;
+    t6 = t9 + t11;
+    t4 = t8 + t1;
+    t7 = t3 - t10;
+    t2 = t2 - t5;
+    t5 = t9 - t11;
+    t9 = t8 - t1;
+    t11 = t3 + t10;
+    t8 = t4 + t7;
+    t1 = C0 * t8;
+    t3 = t4 * (-C1);
+    t10 = t7 * C2;
+    t8 = t1 - t10;
+    t4 = t1 + t3;
+    t7 = t2 + t5;
+    t10 = t2 - t5;
+    t1 = C3 * t7;
+    t3 = (-C3) * t10;
+    t2 = t9 + t11;
+    t5 = C4 * t2;
+    t7 = t9 * (-C1);
+    t10 = t11 * (-C2);
+    t2 = t5 - t10;
+    t9 = t5 + t7;
+    re[15] = t0;
+    im[15] = t6;
+    re[47] = t8;
+    im[47] = t4;
+    re[79] = t1;
+    im[79] = t3;
+    re[111] = t2;
+    im[111] = t9;
+    t11 = re[23];
+    t10 = im[23];
+    t5 = re[55];
+    t7 = im[55];
+    t0 = re[87];
+    t6 = im[87];
+    t8 = re[119];
+    t4 = im[119];
+    t1 = t11 + t0;
+    t3 = t10 + t6;
+    t2 = t5 + t8;
+    t9 = t7 + t4;
+    t11 = t11 - t0;
+    t0 = t10 - t6;
+    t10 = t5 - t8;
+    t6 = t7 - t4;
+    t5 = t1 + t2;
+    t8 = t3 + t9;
+    t7 = t11 + t6;
+    t4 = t0 - t10;
+    t1 = t1 - t2;
+    t2 = t3 - t9;
+    t3 = t11 - t6;
+    t9 = t0 + t10;
+    t11 = t7 + t4;
+    t6 = t7 - t4;
+    t0 = C3 * t11;
+    t10 = (-C3) * t6;
+    t7 = -t1;
+    t4 = t3 - t9;
+    t11 = t3 + t9;
+    t6 = (-C3) * t4;
+    t1 = (-C3) * t11;
+    re[23] = t5;
+    im[23] = t8;
+    re[55] = t0;
+    im[55] = t10;
+    re[87] = t2;
+    im[87] = t7;
+    re[119] = t6;
+    im[119] = t1;
+    t3 = re[31];
+    t9 = im[31];
+    t4 = re[63];
+    t11 = im[63];
+    t5 = re[95];
+    t8 = im[95];
+    t0 = re[127];
+    t10 = im[127];
+    t2 = t3 + t5;
+    t7 = t9 + t8;
+    t6 = t4 + t0;
+    t1 = t11 + t10;
+    t3 = t3 - t5;
+    t5 = t9 - t8;
+    t9 = t4 - t0;
+    t8 = t11 - t10;
+    t4 = t2 + t6;
+    t0 = t7 + t1;
+    t11 = t3 + t8;
+    t10 = t5 - t9;
+    t2 = t2 - t6;
+    t6 = t7 - t1;
+    t7 = t3 - t8;
+    t1 = t5 + t9;
+    t3 = t11 + t10;
+    t8 = C4 * t3;
+    t5 = t11 * (-C1);
+    t9 = t10 * (-C2);
+    t3 = t8 - t9;
+    t11 = t8 + t5;
+    t10 = t2 - t6;
+    t9 = t2 + t6;
+    t8 = (-C3) * t10;
+    t5 = (-C3) * t9;
+    t2 = t7 + t1;
+    t6 = (-C0) * t2;
+    t10 = t7 * C1;
+    t9 = t1 * (-C2);
+    t2 = t6 - t9;
+    t7 = t6 + t10;
+    re[31] = t4;
+    im[31] = t0;
+    re[63] = t3;
+    im[63] = t11;
+    re[95] = t8;
+    im[95] = t5;
+    re[127] = t2;
+    im[127] = t7;
+    t1 = re[7];
+    t9 = im[7];
+    t6 = re[15];
+    t10 = im[15];
+    t4 = re[23];
+    t0 = im[23];
+    t3 = re[31];
+    t11 = im[31];
+    t8 = t1 + t4;
+    t5 = t9 + t0;
+    t2 = t6 + t3;
+    t7 = t10 + t11;
+    t1 = t1 - t4;
+    t4 = t9 - t0;
+    t9 = t6 - t3;
+    t0 = t10 - t11;
+    t6 = t8 + t2;
+    t3 = t5 + t7;
+    t10 = t1 + t0;
+    t11 = t4 - t9;
+    t8 = t8 - t2;
+    t2 = t5 - t7;
+    t5 = t1 - t0;
+    t7 = t4 + t9;
+    t1 = t10 + t11;
+    t0 = C42 * t1;
+    t4 = t10 * (-C10);
+    t9 = t11 * (-C9);
+    t1 = t0 - t9;
+    t10 = t0 + t4;
+    t11 = t8 + t2;
+    t9 = (-C0) * t11;
+    t0 = t8 * C2;
+    t4 = t2 * (-C1);
+    t11 = t9 - t4;
+    t8 = t9 + t0;
+    t2 = t5 + t7;
+    t4 = (-C5) * t2;
+    t9 = t5 * C6;
+    t0 = t7 * C7;
+    t2 = t4 - t0;
+    t5 = t4 + t9;
+    re[7] = t6;
+    im[7] = t3;
+    re[15] = t1;
+    im[15] = t10;
+    re[23] = t11;
+    im[23] = t8;
+    re[31] = t2;
+    im[31] = t5;
+    t7 = re[39];
+    t0 = im[39];
+    t4 = re[47];
+    t9 = im[47];
+    t6 = re[55];
+    t3 = im[55];
+    t1 = re[63];
+    t10 = im[63];
+    t11 = t7 + t6;
+    t8 = t0 + t3;
+    t2 = t4 + t1;
+    t5 = t9 + t10;
+    t7 = t7 - t6;
+    t6 = t0 - t3;
+    t0 = t4 - t1;
+    t3 = t9 - t10;
+    t4 = t11 + t2;
+    t1 = t8 + t5;
+    t9 = t7 + t3;
+    t10 = t6 - t0;
+    t11 = t11 - t2;
+    t2 = t8 - t5;
+    t8 = t7 - t3;
+    t5 = t6 + t0;
+    t7 = t4 + t1;
+    t3 = 0.9415440651830208 * t7;
+    t6 = t4 * (-C13);
+    t0 = t1 * C14;
+    t7 = t3 - t0;
+    t4 = t3 + t6;
+    t1 = t9 + t10;
+    t0 = (-C35) * t1;
+    t3 = t9 * (-C36);
+    t6 = t10 * (-C37);
+    t1 = t0 - t6;
+    t9 = t0 + t3;
+    t10 = t11 + t2;
+    t6 = (-C17) * t10;
+    t0 = t11 * C19;
+    t3 = t2 * (-C18);
+    t10 = t6 - t3;
+    t11 = t6 + t0;
+    t2 = t8 + t5;
+    t3 = (-0.24298017990326387) * t2;
+    t6 = t8 * C11;
+    t0 = t5 * C12;
+    t2 = t3 - t0;
+    t8 = t3 + t6;
+    re[39] = t7;
+    im[39] = t4;
+    re[47] = t1;
+    im[47] = t9;
+    re[55] = t10;
+    im[55] = t11;
+    re[63] = t2;
+    im[63] = t8;
+    t5 = re[71];
+    t0 = im[71];
+    t3 = re[79];
+    t6 = im[79];
+    t7 = re[87];
+    t4 = im[87];
+    t1 = re[95];
+    t9 = im[95];
+    t10 = t5 + t7;
+    t11 = t0 + t4;
+    t2 = t3 + t1;
+    t8 = t6 + t9;
+    t5 = t5 - t7;
+    t7 = t0 - t4;
+    t0 = t3 - t1;
+    t4 = t6 - t9;
+    t3 = t10 + t2;
+    t1 = t11 + t8;
+    t6 = t5 + t4;
+    t9 = t7 - t0;
+    t10 = t10 - t2;
+    t2 = t11 - t8;
+    t11 = t5 - t4;
+    t8 = t7 + t0;
+    t5 = t3 + t1;
+    t4 = C26 * t5;
+    t7 = t3 * (-C28);
+    t0 = t1 * C27;
+    t5 = t4 - t0;
+    t3 = t4 + t7;
+    t1 = t6 + t9;
+    t0 = (-C43) * t1;
+    t4 = t6 * (-C22);
+    t7 = t9 * (-C21);
+    t1 = t0 - t7;
+    t6 = t0 + t4;
+    t9 = t10 + t2;
+    t7 = (-C29) * t9;
+    t0 = t10 * C30;
+    t4 = t2 * (-C31);
+    t9 = t7 - t4;
+    t10 = t7 + t0;
+    t2 = t11 + t8;
+    t4 = C23 * t2;
+    t7 = t11 * C25;
+    t0 = t8 * C24;
+    t2 = t4 - t0;
+    t11 = t4 + t7;
+    re[71] = t5;
+    im[71] = t3;
+    re[79] = t1;
+    im[79] = t6;
+    re[87] = t9;
+    im[87] = t10;
+    re[95] = t2;
+    im[95] = t11;
+    t8 = re[103];
+    t0 = im[103];
+    t4 = re[111];
+    t7 = im[111];
+    t5 = re[119];
+    t3 = im[119];
+    t1 = re[127];
+    t6 = im[127];
+    t9 = t8 + t5;
+    t10 = t0 + t3;
+    t2 = t4 + t1;
+    t11 = t7 + t6;
+    t8 = t8 - t5;
+    t5 = t0 - t3;
+    t0 = t4 - t1;
+    t3 = t7 - t6;
+    t4 = t9 + t2;
+    t1 = t10 + t11;
+    t7 = t8 + t3;
+    t6 = t5 - t0;
+    t9 = t9 - t2;
+    t2 = t10 - t11;
+    t10 = t8 - t3;
+    t11 = t5 + t0;
+    t8 = t4 + t1;
+    t3 = 0.5141027441932217 * t8;
+    t5 = t4 * (-C40);
+    t0 = t1 * (-C41);
+    t8 = t3 - t0;
+    t4 = t3 + t5;
+    t1 = t7 + t6;
+    t0 = (-C32) * t1;
+    t3 = t7 * C34;
+    t5 = t6 * (-C33);
+    t1 = t0 - t5;
+    t7 = t0 + t3;
+    t6 = t9 + t2;
+    t5 = (-0.8032075314806449) * t6;
+    t0 = t9 * C16;
+    t3 = t2 * (-C15);
+    t6 = t5 - t3;
+    t9 = t5 + t0;
+    t2 = t10 + t11;
+    t3 = 0.4275550934302821 * t2;
+    t5 = t10 * C38;
+    t0 = t11 * C39;
+    t2 = t3 - t0;
+    t10 = t3 + t5;
+    re[103] = t8;
+    im[103] = t4;
+    re[111] = t1;
+    im[111] = t7;
+    re[119] = t6;
+    im[119] = t9;
+    re[127] = t2;
+    im[127] = t10;
+    t11 = re[0];
+    t0 = im[0];
+    t3 = re[1];
+    t5 = im[1];
+    t8 = re[2];
+    t4 = im[2];
+    t1 = re[3];
+    t7 = im[3];
+    t6 = re[4];
+    t9 = im[4];
+    t2 = re[5];
+    t10 = im[5];
+    t12 = re[6];
+    t13 = im[6];
+    t14 = re[7];
+    t15 = im[7];
+    t16 = t11 + t6;
+    t17 = t0 + t9;
+    t18 = t8 + t12;
+    t19 = t4 + t13;
+    t11 = t11 - t6;
+    t6 = t0 - t9;
+    t0 = t8 - t12;
+    t9 = t4 - t13;
+    t8 = t16 + t18;
+    t12 = t17 + t19;
+    t4 = t11 + t9;
+    t13 = t6 - t0;
+    t16 = t16 - t18;
+    t18 = t17 - t19;
+    t17 = t11 - t9;
+    t19 = t6 + t0;
+    t11 = t3 + t2;
+    t9 = t5 + t10;
+    t6 = t1 + t14;
+    t0 = t7 + t15;
+    t3 = t3 - t2;
+    t2 = t5 - t10;
+    t5 = t1 - t14;
+    t10 = t7 - t15;
+    t1 = t11 + t6;
+    t14 = t9 + t0;
+    t7 = t3 + t10;
+    t15 = t2 - t5;
+    t11 = t11 - t6;
+    t6 = t9 - t0;
+    t9 = t3 - t10;
+    t0 = t2 + t5;
+    t3 = t7 + t15;
+    t10 = t7 - t15;
+    t2 = C3 * t3;
+    t5 = (-C3) * t10;
+    t7 = t9 - t0;
+    t15 = t9 + t0;
+    t3 = (-C3) * t7;
+    t10 = (-C3) * t15;
+    t9 = t8 - t1;
+    t0 = t12 - t14;
+    t7 = t8 + t1;
+    t15 = t12 + t14;
+    t8 = t4 - t2;
+    t1 = t13 - t5;
+    t12 = t4 + t2;
+    t14 = t13 + t5;
+    t4 = t16 - t6;
+    t2 = t18 + t11;
+    t13 = t16 + t6;
+    t5 = t18 - t11;
+    t16 = t17 - t3;
+    t6 = t19 - t10;
+    t18 = t17 + t3;
+    t11 = t19 + t10;
+    re[0] = t7;
+    im[0] = t15;
+    re[1] = t12;
+    im[1] = t14;
+    re[2] = t13;
+    im[2] = t5;
+    re[3] = t18;
+    im[3] = t11;
+    re[4] = t9;
+    im[4] = t0;
+    re[5] = t8;
+    im[5] = t1;
+    re[6] = t4;
+    im[6] = t2;
+    re[7] = t16;
+    im[7] = t6;
+    t17 = re[32];
+    t3 = im[32];
+    t19 = re[33];
+    t10 = im[33];
+    t7 = re[34];
+    t15 = im[34];
+    t12 = re[35];
+    t14 = im[35];
+    t13 = re[36];
+    t5 = im[36];
+    t18 = re[37];
+    t11 = im[37];
+    t9 = re[38];
+    t0 = im[38];
+    t8 = re[39];
+    t1 = im[39];
+    t4 = t17 + t13;
+    t2 = t3 + t5;
+    t16 = t7 + t9;
+    t6 = t15 + t0;
+    t17 = t17 - t13;
+    t13 = t3 - t5;
+    t3 = t7 - t9;
+    t5 = t15 - t0;
+    t7 = t4 + t16;
+    t9 = t2 + t6;
+    t15 = t17 + t5;
+    t0 = t13 - t3;
+    t4 = t4 - t16;
+    t16 = t2 - t6;
+    t2 = t17 - t5;
+    t6 = t13 + t3;
+    t17 = t19 + t18;
+    t5 = t10 + t11;
+    t13 = t12 + t8;
+    t3 = t14 + t1;
+    t19 = t19 - t18;
+    t18 = t10 - t11;
+    t10 = t12 - t8;
+    t11 = t14 - t1;
+    t12 = t17 + t13;
+    t8 = t5 + t3;
+    t14 = t19 + t11;
+    t1 = t18 - t10;
+    t17 = t17 - t13;
+    t13 = t5 - t3;
+    t5 = t19 - t11;
+    t3 = t18 + t10;
+    t19 = t14 + t1;
+    t11 = t14 - t1;
+    t18 = C3 * t19;
+    t10 = (-C3) * t11;
+    t14 = t5 - t3;
+    t1 = t5 + t3;
+    t19 = (-C3) * t14;
+    t11 = (-C3) * t1;
+    t5 = t7 - t12;
+    t3 = t9 - t8;
+    t14 = t7 + t12;
+    t1 = t9 + t8;
+    t7 = t15 - t18;
+    t12 = t0 - t10;
+    t9 = t15 + t18;
+    t8 = t0 + t10;
+    t15 = t4 - t13;
+    t18 = t16 + t17;
+    t0 = t4 + t13;
+    t10 = t16 - t17;
+    t4 = t2 - t19;
+    t13 = t6 - t11;
+    t16 = t2 + t19;
+    t17 = t6 + t11;
+    re[32] = t14;
+    im[32] = t1;
+    re[33] = t9;
+    im[33] = t8;
+    re[34] = t0;
+    im[34] = t10;
+    re[35] = t16;
+    im[35] = t17;
+    re[36] = t5;
+    im[36] = t3;
+    re[37] = t7;
+    im[37] = t12;
+    re[38] = t15;
+    im[38] = t18;
+    re[39] = t4;
+    im[39] = t13;
+    t2 = re[64];
+    t19 = im[64];
+    t6 = re[65];
+    t11 = im[65];
+    t14 = re[66];
+    t1 = im[66];
+    t9 = re[67];
+    t8 = im[67];
+    t0 = re[68];
+    t10 = im[68];
+    t16 = re[69];
+    t17 = im[69];
+    t5 = re[70];
+    t3 = im[70];
+    t7 = re[71];
+    t12 = im[71];
+    t15 = t2 + t0;
+    t18 = t19 + t10;
+    t4 = t14 + t5;
+    t13 = t1 + t3;
+    t2 = t2 - t0;
+    t0 = t19 - t10;
+    t19 = t14 - t5;
+    t10 = t1 - t3;
+    t14 = t15 + t4;
+    t5 = t18 + t13;
+    t1 = t2 + t10;
+    t3 = t0 - t19;
+    t15 = t15 - t4;
+    t4 = t18 - t13;
+    t18 = t2 - t10;
+    t13 = t0 + t19;
+    t2 = t6 + t16;
+    t10 = t11 + t17;
+    t0 = t9 + t7;
+    t19 = t8 + t12;
+    t6 = t6 - t16;
+    t16 = t11 - t17;
+    t11 = t9 - t7;
+    t17 = t8 - t12;
+    t9 = t2 + t0;
+    t7 = t10 + t19;
+    t8 = t6 + t17;
+    t12 = t16 - t11;
+    t2 = t2 - t0;
+    t0 = t10 - t19;
+    t10 = t6 - t17;
+    t19 = t16 + t11;
+    t6 = t8 + t12;
+    t17 = t8 - t12;
+    t16 = C3 * t6;
+    t11 = (-C3) * t17;
+    t8 = t10 - t19;
+    t12 = t10 + t19;
+    t6 = (-C3) * t8;
+    t17 = (-C3) * t12;
+    t10 = t14 - t9;
+    t19 = t5 - t7;
+    t8 = t14 + t9;
+    t12 = t5 + t7;
+    t14 = t1 - t16;
+    t9 = t3 - t11;
+    t5 = t1 + t16;
+    t7 = t3 + t11;
+    t1 = t15 - t0;
+    t16 = t4 + t2;
+    t3 = t15 + t0;
+    t11 = t4 - t2;
+    t15 = t18 - t6;
+    t0 = t13 - t17;
+    t4 = t18 + t6;
+    t2 = t13 + t17;
+    re[64] = t8;
+    im[64] = t12;
+    re[65] = t5;
+    im[65] = t7;
+    re[66] = t3;
+    im[66] = t11;
+    re[67] = t4;
+    im[67] = t2;
+    re[68] = t10;
+    im[68] = t19;
+    re[69] = t14;
+    im[69] = t9;
+    re[70] = t1;
+    im[70] = t16;
+    re[71] = t15;
+    im[71] = t0;
+    t18 = re[96];
+    t6 = im[96];
+    t13 = re[97];
+    t17 = im[97];
+    t8 = re[98];
+    t12 = im[98];
+    t5 = re[99];
+    t7 = im[99];
+    t3 = re[100];
+    t11 = im[100];
+    t4 = re[101];
+    t2 = im[101];
+    t10 = re[102];
+    t19 = im[102];
+    t14 = re[103];
+    t9 = im[103];
+    t1 = t18 + t3;
+    t16 = t6 + t11;
+    t15 = t8 + t10;
+    t0 = t12 + t19;
+    t18 = t18 - t3;
+    t3 = t6 - t11;
+    t6 = t8 - t10;
+    t11 = t12 - t19;
+    t8 = t1 + t15;
+    t10 = t16 + t0;
+    t12 = t18 + t11;
+    t19 = t3 - t6;
+    t1 = t1 - t15;
+    t15 = t16 - t0;
+    t16 = t18 - t11;
+    t0 = t3 + t6;
+    t18 = t13 + t4;
+    t11 = t17 + t2;
+    t3 = t5 + t14;
+    t6 = t7 + t9;
+    t13 = t13 - t4;
+    t4 = t17 - t2;
+    t17 = t5 - t14;
+    t2 = t7 - t9;
+    t5 = t18 + t3;
+    t14 = t11 + t6;
+    t7 = t13 + t2;
+    t9 = t4 - t17;
+    t18 = t18 - t3;
+    t3 = t11 - t6;
+    t11 = t13 - t2;
+    t6 = t4 + t17;
+    t13 = t7 + t9;
+    t2 = t7 - t9;
+    t4 = C3 * t13;
+    t17 = (-C3) * t2;
+    t7 = t11 - t6;
+    t9 = t11 + t6;
+    t13 = (-C3) * t7;
+    t2 = (-C3) * t9;
+    t11 = t8 - t5;
+    t6 = t10 - t14;
+    t7 = t8 + t5;
+    t9 = t10 + t14;
+    t8 = t12 - t4;
+    t5 = t19 - t17;
+    t10 = t12 + t4;
+    t14 = t19 + t17;
+    t12 = t1 - t3;
+    t4 = t15 + t18;
+    t19 = t1 + t3;
+    t17 = t15 - t18;
+    t1 = t16 - t13;
+    t3 = t0 - t2;
+    t15 = t16 + t13;
+    t18 = t0 + t2;
+    re[96] = t7;
+    im[96] = t9;
+    re[97] = t10;
+    im[97] = t14;
+    re[98] = t19;
+    im[98] = t17;
+    re[99] = t15;
+    im[99] = t18;
+    re[100] = t11;
+    im[100] = t6;
+    re[101] = t8;
+    im[101] = t5;
+    re[102] = t12;
+    im[102] = t4;
+    re[103] = t1;
+    im[103] = t3;
+    t16 = re[8];
+    t13 = im[8];
+    t0 = re[9];
+    t2 = im[9];
+    t7 = re[10];
+    t9 = im[10];
+    t10 = re[11];
+    t14 = im[11];
+    t19 = re[12];
+    t17 = im[12];
+    t15 = re[13];
+    t18 = im[13];
+    t11 = re[14];
+    t6 = im[14];
+    t8 = re[15];
+    t5 = im[15];
+    t12 = t16 + t19;
+    t4 = t13 + t17;
+    t1 = t7 + t11;
+    t3 = t9 + t6;
+    t16 = t16 - t19;
+    t19 = t13 - t17;
+    t13 = t7 - t11;
+    t17 = t9 - t6;
+    t7 = t12 + t1;
+    t11 = t4 + t3;
+    t9 = t16 + t17;
+    t6 = t19 - t13;
+    t12 = t12 - t1;
+    t1 = t4 - t3;
+    t4 = t16 - t17;
+    t3 = t19 + t13;
+    t16 = t0 + t15;
+    t17 = t2 + t18;
+    t19 = t10 + t8;
+    t13 = t14 + t5;
+    t0 = t0 - t15;
+    t15 = t2 - t18;
+    t2 = t10 - t8;
+    t18 = t14 - t5;
+    t10 = t16 + t19;
+    t8 = t17 + t13;
+    t14 = t0 + t18;
+    t5 = t15 - t2;
+    t16 = t16 - t19;
+    t19 = t17 - t13;
+    t17 = t0 - t18;
+    t13 = t15 + t2;
+    t0 = t14 + t5;
+    t18 = t14 - t5;
+    t15 = C3 * t0;
+    t2 = (-C3) * t18;
+    t14 = t17 - t13;
+    t5 = t17 + t13;
+    t0 = (-C3) * t14;
+    t18 = (-C3) * t5;
+    t17 = t7 - t10;
+    t13 = t11 - t8;
+    t14 = t7 + t10;
+    t5 = t11 + t8;
+    t7 = t9 - t15;
+    t10 = t6 - t2;
+    t11 = t9 + t15;
+    t8 = t6 + t2;
+    t9 = t12 - t19;
+    t15 = t1 + t16;
+    t6 = t12 + t19;
+    t2 = t1 - t16;
+    t12 = t4 - t0;
+    t19 = t3 - t18;
+    t1 = t4 + t0;
+    t16 = t3 + t18;
+    re[8] = t14;
+    im[8] = t5;
+    re[9] = t11;
+    im[9] = t8;
+    re[10] = t6;
+    im[10] = t2;
+    re[11] = t1;
+    im[11] = t16;
+    re[12] = t17;
+    im[12] = t13;
+    re[13] = t7;
+    im[13] = t10;
+    re[14] = t9;
+    im[14] = t15;
+    re[15] = t12;
+    im[15] = t19;
+    t4 = re[40];
+    t0 = im[40];
+    t3 = re[41];
+    t18 = im[41];
+    t14 = re[42];
+    t5 = im[42];
+    t11 = re[43];
+    t8 = im[43];
+    t6 = re[44];
+    t2 = im[44];
+    t1 = re[45];
+    t16 = im[45];
+    t17 = re[46];
+    t13 = im[46];
+    t7 = re[47];
+    t10 = im[47];
+    t9 = t4 + t6;
+    t15 = t0 + t2;
+    t12 = t14 + t17;
+    t19 = t5 + t13;
+    t4 = t4 - t6;
+    t6 = t0 - t2;
+    t0 = t14 - t17;
+    t2 = t5 - t13;
+    t14 = t9 + t12;
+    t17 = t15 + t19;
+    t5 = t4 + t2;
+    t13 = t6 - t0;
+    t9 = t9 - t12;
+    t12 = t15 - t19;
+    t15 = t4 - t2;
+    t19 = t6 + t0;
+    t4 = t3 + t1;
+    t2 = t18 + t16;
+    t6 = t11 + t7;
+    t0 = t8 + t10;
+    t3 = t3 - t1;
+    t1 = t18 - t16;
+    t18 = t11 - t7;
+    t16 = t8 - t10;
+    t11 = t4 + t6;
+    t7 = t2 + t0;
+    t8 = t3 + t16;
+    t10 = t1 - t18;
+    t4 = t4 - t6;
+    t6 = t2 - t0;
+    t2 = t3 - t16;
+    t0 = t1 + t18;
+    t3 = t8 + t10;
+    t16 = t8 - t10;
+    t1 = C3 * t3;
+    t18 = (-C3) * t16;
+    t8 = t2 - t0;
+    t10 = t2 + t0;
+    t3 = (-C3) * t8;
+    t16 = (-C3) * t10;
+    t2 = t14 - t11;
+    t0 = t17 - t7;
+    t8 = t14 + t11;
+    t10 = t17 + t7;
+    t14 = t5 - t1;
+    t11 = t13 - t18;
+    t17 = t5 + t1;
+    t7 = t13 + t18;
+    t5 = t9 - t6;
+    t1 = t12 + t4;
+    t13 = t9 + t6;
+    t18 = t12 - t4;
+    t9 = t15 - t3;
+    t6 = t19 - t16;
+    t12 = t15 + t3;
+    t4 = t19 + t16;
+    re[40] = t8;
+    im[40] = t10;
+    re[41] = t17;
+    im[41] = t7;
+    re[42] = t13;
+    im[42] = t18;
+    re[43] = t12;
+    im[43] = t4;
+    re[44] = t2;
+    im[44] = t0;
+    re[45] = t14;
+    im[45] = t11;
+    re[46] = t5;
+    im[46] = t1;
+    re[47] = t9;
+    im[47] = t6;
+    t15 = re[72];
+    t3 = im[72];
+    t19 = re[73];
+    t16 = im[73];
+    t8 = re[74];
+    t10 = im[74];
+    t17 = re[75];
+    t7 = im[75];
+    t13 = re[76];
+    t18 = im[76];
+    t12 = re[77];
+    t4 = im[77];
+    t2 = re[78];
+    t0 = im[78];
+    t14 = re[79];
+    t11 = im[79];
+    t5 = t15 + t13;
+    t1 = t3 + t18;
+    t9 = t8 + t2;
+    t6 = t10 + t0;
+    t15 = t15 - t13;
+    t13 = t3 - t18;
+    t3 = t8 - t2;
+    t18 = t10 - t0;
+    t8 = t5 + t9;
+    t2 = t1 + t6;
+    t10 = t15 + t18;
+    t0 = t13 - t3;
+    t5 = t5 - t9;
+    t9 = t1 - t6;
+    t1 = t15 - t18;
+    t6 = t13 + t3;
+    t15 = t19 + t12;
+    t18 = t16 + t4;
+    t13 = t17 + t14;
+    t3 = t7 + t11;
+    t19 = t19 - t12;
+    t12 = t16 - t4;
+    t16 = t17 - t14;
+    t4 = t7 - t11;
+    t17 = t15 + t13;
+    t14 = t18 + t3;
+    t7 = t19 + t4;
+    t11 = t12 - t16;
+    t15 = t15 - t13;
+    t13 = t18 - t3;
+    t18 = t19 - t4;
+    t3 = t12 + t16;
+    t19 = t7 + t11;
+    t4 = t7 - t11;
+    t12 = C3 * t19;
+    t16 = (-C3) * t4;
+    t7 = t18 - t3;
+    t11 = t18 + t3;
+    t19 = (-C3) * t7;
+    t4 = (-C3) * t11;
+    t18 = t8 - t17;
+    t3 = t2 - t14;
+    t7 = t8 + t17;
+    t11 = t2 + t14;
+    t8 = t10 - t12;
+    t17 = t0 - t16;
+    t2 = t10 + t12;
+    t14 = t0 + t16;
+    t10 = t5 - t13;
+    t12 = t9 + t15;
+    t0 = t5 + t13;
+    t16 = t9 - t15;
+    t5 = t1 - t19;
+    t13 = t6 - t4;
+    t9 = t1 + t19;
+    t15 = t6 + t4;
+    re[72] = t7;
+    im[72] = t11;
+    re[73] = t2;
+    im[73] = t14;
+    re[74] = t0;
+    im[74] = t16;
+    re[75] = t9;
+    im[75] = t15;
+    re[76] = t18;
+    im[76] = t3;
+    re[77] = t8;
+    im[77] = t17;
+    re[78] = t10;
+    im[78] = t12;
+    re[79] = t5;
+    im[79] = t13;
+    t1 = re[104];
+    t19 = im[104];
+    t6 = re[105];
+    t4 = im[105];
+    t7 = re[106];
+    t11 = im[106];
+    t2 = re[107];
+    t14 = im[107];
+    t0 = re[108];
+    t16 = im[108];
+    t9 = re[109];
+    t15 = im[109];
+    t18 = re[110];
+    t3 = im[110];
+    t8 = re[111];
+    t17 = im[111];
+    t10 = t1 + t0;
+    t12 = t19 + t16;
+    t5 = t7 + t18;
+    t13 = t11 + t3;
+    t1 = t1 - t0;
+    t0 = t19 - t16;
+    t19 = t7 - t18;
+    t16 = t11 - t3;
+    t7 = t10 + t5;
+    t18 = t12 + t13;
+    t11 = t1 + t16;
+    t3 = t0 - t19;
+    t10 = t10 - t5;
+    t5 = t12 - t13;
+    t12 = t1 - t16;
+    t13 = t0 + t19;
+    t1 = t6 + t9;
+    t16 = t4 + t15;
+    t0 = t2 + t8;
+    t19 = t14 + t17;
+    t6 = t6 - t9;
+    t9 = t4 - t15;
+    t4 = t2 - t8;
+    t15 = t14 - t17;
+    t2 = t1 + t0;
+    t8 = t16 + t19;
+    t14 = t6 + t15;
+    t17 = t9 - t4;
+    t1 = t1 - t0;
+    t0 = t16 - t19;
+    t16 = t6 - t15;
+    t19 = t9 + t4;
+    t6 = t14 + t17;
+    t15 = t14 - t17;
+    t9 = C3 * t6;
+    t4 = (-C3) * t15;
+    t14 = t16 - t19;
+    t17 = t16 + t19;
+    t6 = (-C3) * t14;
+    t15 = (-C3) * t17;
+    t16 = t7 - t2;
+    t19 = t18 - t8;
+    t14 = t7 + t2;
+    t17 = t18 + t8;
+    t7 = t11 - t9;
+    t2 = t3 - t4;
+    t18 = t11 + t9;
+    t8 = t3 + t4;
+    t11 = t10 - t0;
+    t9 = t5 + t1;
+    t3 = t10 + t0;
+    t4 = t5 - t1;
+    t10 = t12 - t6;
+    t0 = t13 - t15;
+    t5 = t12 + t6;
+    t1 = t13 + t15;
+    re[104] = t14;
+    im[104] = t17;
+    re[105] = t18;
+    im[105] = t8;
+    re[106] = t3;
+    im[106] = t4;
+    re[107] = t5;
+    im[107] = t1;
+    re[108] = t16;
+    im[108] = t19;
+    re[109] = t7;
+    im[109] = t2;
+    re[110] = t11;
+    im[110] = t9;
+    re[111] = t10;
+    im[111] = t0;
+    t12 = re[16];
+    t6 = im[16];
+    t13 = re[17];
+    t15 = im[17];
+    t14 = re[18];
+    t17 = im[18];
+    t18 = re[19];
+    t8 = im[19];
+    t3 = re[20];
+    t4 = im[20];
+    t5 = re[21];
+    t1 = im[21];
+    t16 = re[22];
+    t19 = im[22];
+    t7 = re[23];
+    t2 = im[23];
+    t11 = t12 + t3;
+    t9 = t6 + t4;
+    t10 = t14 + t16;
+    t0 = t17 + t19;
+    t12 = t12 - t3;
+    t3 = t6 - t4;
+    t6 = t14 - t16;
+    t4 = t17 - t19;
+    t14 = t11 + t10;
+    t16 = t9 + t0;
+    t17 = t12 + t4;
+    t19 = t3 - t6;
+    t11 = t11 - t10;
+    t10 = t9 - t0;
+    t9 = t12 - t4;
+    t0 = t3 + t6;
+    t12 = t13 + t5;
+    t4 = t15 + t1;
+    t3 = t18 + t7;
+    t6 = t8 + t2;
+    t13 = t13 - t5;
+    t5 = t15 - t1;
+    t15 = t18 - t7;
+    t1 = t8 - t2;
+    t18 = t12 + t3;
+    t7 = t4 + t6;
+    t8 = t13 + t1;
+    t2 = t5 - t15;
+    t12 = t12 - t3;
+    t3 = t4 - t6;
+    t4 = t13 - t1;
+    t6 = t5 + t15;
+    t13 = t8 + t2;
+    t1 = t8 - t2;
+    t5 = C3 * t13;
+    t15 = (-C3) * t1;
+    t8 = t4 - t6;
+    t2 = t4 + t6;
+    t13 = (-C3) * t8;
+    t1 = (-C3) * t2;
+    t4 = t14 - t18;
+    t6 = t16 - t7;
+    t8 = t14 + t18;
+    t2 = t16 + t7;
+    t14 = t17 - t5;
+    t18 = t19 - t15;
+    t16 = t17 + t5;
+    t7 = t19 + t15;
+    t17 = t11 - t3;
+    t5 = t10 + t12;
+    t19 = t11 + t3;
+    t15 = t10 - t12;
+    t11 = t9 - t13;
+    t3 = t0 - t1;
+    t10 = t9 + t13;
+    t12 = t0 + t1;
+    re[16] = t8;
+    im[16] = t2;
+    re[17] = t16;
+    im[17] = t7;
+    re[18] = t19;
+    im[18] = t15;
+    re[19] = t10;
+    im[19] = t12;
+    re[20] = t4;
+    im[20] = t6;
+    re[21] = t14;
+    im[21] = t18;
+    re[22] = t17;
+    im[22] = t5;
+    re[23] = t11;
+    im[23] = t3;
+}
+
+/**
+ *  Part 3 of ApplyMixedRadixFFTPermuted_128().
+ * 
+ *  @param {Number[]} re 
+ *    - The real part of each point.
+ *  @param {Number[]} im 
+ *    - The imaginary part of each point.
+ */
+function ApplyMixedRadixFFTPermuted_128_Part3(re, im) {
+    let t0, t1, t10, t11, t12, t13, t14, t15, t16, t17, t18, t19, t2, t3, t4, t5, t6, t7, t8, t9;
+    const C0 = 0.7071067811865476;
+    t9 = re[48];
+    t13 = im[48];
+    t0 = re[49];
+    t1 = im[49];
+    t8 = re[50];
+    t2 = im[50];
+    t16 = re[51];
+    t7 = im[51];
+    t19 = re[52];
+    t15 = im[52];
+    t10 = re[53];
+    t12 = im[53];
+    t4 = re[54];
+    t6 = im[54];
+    t14 = re[55];
+    t18 = im[55];
+    t17 = t9 + t19;
+    t5 = t13 + t15;
+    t11 = t8 + t4;
+    t3 = t2 + t6;
+    t9 = t9 - t19;
+    t19 = t13 - t15;
+    t13 = t8 - t4;
+    t15 = t2 - t6;
+    t8 = t17 + t11;
+    t4 = t5 + t3;
+    t2 = t9 + t15;
+    t6 = t19 - t13;
+    t17 = t17 - t11;
+    t11 = t5 - t3;
+    t5 = t9 - t15;
+    t3 = t19 + t13;
+    t9 = t0 + t10;
+    t15 = t1 + t12;
+    t19 = t16 + t14;
+    t13 = t7 + t18;
+    t0 = t0 - t10;
+    t10 = t1 - t12;
+    t1 = t16 - t14;
+    t12 = t7 - t18;
+    t16 = t9 + t19;
+    t14 = t15 + t13;
+    t7 = t0 + t12;
+    t18 = t10 - t1;
+    t9 = t9 - t19;
+    t19 = t15 - t13;
+    t15 = t0 - t12;
+    t13 = t10 + t1;
+    t0 = t7 + t18;
+    t12 = t7 - t18;
+    t10 = C0 * t0;
+    t1 = (-C0) * t12;
+    t7 = t15 - t13;
+    t18 = t15 + t13;
+    t0 = (-C0) * t7;
+    t12 = (-C0) * t18;
+    t15 = t8 - t16;
+    t13 = t4 - t14;
+    t7 = t8 + t16;
+    t18 = t4 + t14;
+    t8 = t2 - t10;
+    t16 = t6 - t1;
+    t4 = t2 + t10;
+    t14 = t6 + t1;
+    t2 = t17 - t19;
+    t10 = t11 + t9;
+    t6 = t17 + t19;
+    t1 = t11 - t9;
+    t17 = t5 - t0;
+    t19 = t3 - t12;
+    t11 = t5 + t0;
+    t9 = t3 + t12;
+    re[48] = t7;
+    im[48] = t18;
+    re[49] = t4;
+    im[49] = t14;
+    re[50] = t6;
+    im[50] = t1;
+    re[51] = t11;
+    im[51] = t9;
+    re[52] = t15;
+    im[52] = t13;
+    re[53] = t8;
+    im[53] = t16;
+    re[54] = t2;
+    im[54] = t10;
+    re[55] = t17;
+    im[55] = t19;
+    t5 = re[80];
+    t0 = im[80];
+    t3 = re[81];
+    t12 = im[81];
+    t7 = re[82];
+    t18 = im[82];
+    t4 = re[83];
+    t14 = im[83];
+    t6 = re[84];
+    t1 = im[84];
+    t11 = re[85];
+    t9 = im[85];
+    t15 = re[86];
+    t13 = im[86];
+    t8 = re[87];
+    t16 = im[87];
+    t2 = t5 + t6;
+    t10 = t0 + t1;
+    t17 = t7 + t15;
+    t19 = t18 + t13;
+    t5 = t5 - t6;
+    t6 = t0 - t1;
+    t0 = t7 - t15;
+    t1 = t18 - t13;
+    t7 = t2 + t17;
+    t15 = t10 + t19;
+    t18 = t5 + t1;
+    t13 = t6 - t0;
+    t2 = t2 - t17;
+    t17 = t10 - t19;
+    t10 = t5 - t1;
+    t19 = t6 + t0;
+    t5 = t3 + t11;
+    t1 = t12 + t9;
+    t6 = t4 + t8;
+    t0 = t14 + t16;
+    t3 = t3 - t11;
+    t11 = t12 - t9;
+    t12 = t4 - t8;
+    t9 = t14 - t16;
+    t4 = t5 + t6;
+    t8 = t1 + t0;
+    t14 = t3 + t9;
+    t16 = t11 - t12;
+    t5 = t5 - t6;
+    t6 = t1 - t0;
+    t1 = t3 - t9;
+    t0 = t11 + t12;
+    t3 = t14 + t16;
+    t9 = t14 - t16;
+    t11 = C0 * t3;
+    t12 = (-C0) * t9;
+    t14 = t1 - t0;
+    t16 = t1 + t0;
+    t3 = (-C0) * t14;
+    t9 = (-C0) * t16;
+    t1 = t7 - t4;
+    t0 = t15 - t8;
+    t14 = t7 + t4;
+    t16 = t15 + t8;
+    t7 = t18 - t11;
+    t4 = t13 - t12;
+    t15 = t18 + t11;
+    t8 = t13 + t12;
+    t18 = t2 - t6;
+    t11 = t17 + t5;
+    t13 = t2 + t6;
+    t12 = t17 - t5;
+    t2 = t10 - t3;
+    t6 = t19 - t9;
+    t17 = t10 + t3;
+    t5 = t19 + t9;
+    re[80] = t14;
+    im[80] = t16;
+    re[81] = t15;
+    im[81] = t8;
+    re[82] = t13;
+    im[82] = t12;
+    re[83] = t17;
+    im[83] = t5;
+    re[84] = t1;
+    im[84] = t0;
+    re[85] = t7;
+    im[85] = t4;
+    re[86] = t18;
+    im[86] = t11;
+    re[87] = t2;
+    im[87] = t6;
+    t10 = re[112];
+    t3 = im[112];
+    t19 = re[113];
+    t9 = im[113];
+    t14 = re[114];
+    t16 = im[114];
+    t15 = re[115];
+    t8 = im[115];
+    t13 = re[116];
+    t12 = im[116];
+    t17 = re[117];
+    t5 = im[117];
+    t1 = re[118];
+    t0 = im[118];
+    t7 = re[119];
+    t4 = im[119];
+    t18 = t10 + t13;
+    t11 = t3 + t12;
+    t2 = t14 + t1;
+    t6 = t16 + t0;
+    t10 = t10 - t13;
+    t13 = t3 - t12;
+    t3 = t14 - t1;
+    t12 = t16 - t0;
+    t14 = t18 + t2;
+    t1 = t11 + t6;
+    t16 = t10 + t12;
+    t0 = t13 - t3;
+    t18 = t18 - t2;
+    t2 = t11 - t6;
+    t11 = t10 - t12;
+    t6 = t13 + t3;
+    t10 = t19 + t17;
+    t12 = t9 + t5;
+    t13 = t15 + t7;
+    t3 = t8 + t4;
+    t19 = t19 - t17;
+    t17 = t9 - t5;
+    t9 = t15 - t7;
+    t5 = t8 - t4;
+    t15 = t10 + t13;
+    t7 = t12 + t3;
+    t8 = t19 + t5;
+    t4 = t17 - t9;
+    t10 = t10 - t13;
+    t13 = t12 - t3;
+    t12 = t19 - t5;
+    t3 = t17 + t9;
+    t19 = t8 + t4;
+    t5 = t8 - t4;
+    t17 = C0 * t19;
+    t9 = (-C0) * t5;
+    t8 = t12 - t3;
+    t4 = t12 + t3;
+    t19 = (-C0) * t8;
+    t5 = (-C0) * t4;
+    t12 = t14 - t15;
+    t3 = t1 - t7;
+    t8 = t14 + t15;
+    t4 = t1 + t7;
+    t14 = t16 - t17;
+    t15 = t0 - t9;
+    t1 = t16 + t17;
+    t7 = t0 + t9;
+    t16 = t18 - t13;
+    t17 = t2 + t10;
+    t0 = t18 + t13;
+    t9 = t2 - t10;
+    t18 = t11 - t19;
+    t13 = t6 - t5;
+    t2 = t11 + t19;
+    t10 = t6 + t5;
+    re[112] = t8;
+    im[112] = t4;
+    re[113] = t1;
+    im[113] = t7;
+    re[114] = t0;
+    im[114] = t9;
+    re[115] = t2;
+    im[115] = t10;
+    re[116] = t12;
+    im[116] = t3;
+    re[117] = t14;
+    im[117] = t15;
+    re[118] = t16;
+    im[118] = t17;
+    re[119] = t18;
+    im[119] = t13;
+    t11 = re[24];
+    t19 = im[24];
+    t6 = re[25];
+    t5 = im[25];
+    t8 = re[26];
+    t4 = im[26];
+    t1 = re[27];
+    t7 = im[27];
+    t0 = re[28];
+    t9 = im[28];
+    t2 = re[29];
+    t10 = im[29];
+    t12 = re[30];
+    t3 = im[30];
+    t14 = re[31];
+    t15 = im[31];
+    t16 = t11 + t0;
+    t17 = t19 + t9;
+    t18 = t8 + t12;
+    t13 = t4 + t3;
+    t11 = t11 - t0;
+    t0 = t19 - t9;
+    t19 = t8 - t12;
+    t9 = t4 - t3;
+    t8 = t16 + t18;
+    t12 = t17 + t13;
+    t4 = t11 + t9;
+    t3 = t0 - t19;
+    t16 = t16 - t18;
+    t18 = t17 - t13;
+    t17 = t11 - t9;
+    t13 = t0 + t19;
+    t11 = t6 + t2;
+    t9 = t5 + t10;
+    t0 = t1 + t14;
+    t19 = t7 + t15;
+    t6 = t6 - t2;
+    t2 = t5 - t10;
+    t5 = t1 - t14;
+    t10 = t7 - t15;
+    t1 = t11 + t0;
+    t14 = t9 + t19;
+    t7 = t6 + t10;
+    t15 = t2 - t5;
+    t11 = t11 - t0;
+    t0 = t9 - t19;
+    t9 = t6 - t10;
+    t19 = t2 + t5;
+    t6 = t7 + t15;
+    t10 = t7 - t15;
+    t2 = C0 * t6;
+    t5 = (-C0) * t10;
+    t7 = t9 - t19;
+    t15 = t9 + t19;
+    t6 = (-C0) * t7;
+    t10 = (-C0) * t15;
+    t9 = t8 - t1;
+    t19 = t12 - t14;
+    t7 = t8 + t1;
+    t15 = t12 + t14;
+    t8 = t4 - t2;
+    t1 = t3 - t5;
+    t12 = t4 + t2;
+    t14 = t3 + t5;
+    t4 = t16 - t0;
+    t2 = t18 + t11;
+    t3 = t16 + t0;
+    t5 = t18 - t11;
+    t16 = t17 - t6;
+    t0 = t13 - t10;
+    t18 = t17 + t6;
+    t11 = t13 + t10;
+    re[24] = t7;
+    im[24] = t15;
+    re[25] = t12;
+    im[25] = t14;
+    re[26] = t3;
+    im[26] = t5;
+    re[27] = t18;
+    im[27] = t11;
+    re[28] = t9;
+    im[28] = t19;
+    re[29] = t8;
+    im[29] = t1;
+    re[30] = t4;
+    im[30] = t2;
+    re[31] = t16;
+    im[31] = t0;
+    t17 = re[56];
+    t6 = im[56];
+    t13 = re[57];
+    t10 = im[57];
+    t7 = re[58];
+    t15 = im[58];
+    t12 = re[59];
+    t14 = im[59];
+    t3 = re[60];
+    t5 = im[60];
+    t18 = re[61];
+    t11 = im[61];
+    t9 = re[62];
+    t19 = im[62];
+    t8 = re[63];
+    t1 = im[63];
+    t4 = t17 + t3;
+    t2 = t6 + t5;
+    t16 = t7 + t9;
+    t0 = t15 + t19;
+    t17 = t17 - t3;
+    t3 = t6 - t5;
+    t6 = t7 - t9;
+    t5 = t15 - t19;
+    t7 = t4 + t16;
+    t9 = t2 + t0;
+    t15 = t17 + t5;
+    t19 = t3 - t6;
+    t4 = t4 - t16;
+    t16 = t2 - t0;
+    t2 = t17 - t5;
+    t0 = t3 + t6;
+    t17 = t13 + t18;
+    t5 = t10 + t11;
+    t3 = t12 + t8;
+    t6 = t14 + t1;
+    t13 = t13 - t18;
+    t18 = t10 - t11;
+    t10 = t12 - t8;
+    t11 = t14 - t1;
+    t12 = t17 + t3;
+    t8 = t5 + t6;
+    t14 = t13 + t11;
+    t1 = t18 - t10;
+    t17 = t17 - t3;
+    t3 = t5 - t6;
+    t5 = t13 - t11;
+    t6 = t18 + t10;
+    t13 = t14 + t1;
+    t11 = t14 - t1;
+    t18 = C0 * t13;
+    t10 = (-C0) * t11;
+    t14 = t5 - t6;
+    t1 = t5 + t6;
+    t13 = (-C0) * t14;
+    t11 = (-C0) * t1;
+    t5 = t7 - t12;
+    t6 = t9 - t8;
+    t14 = t7 + t12;
+    t1 = t9 + t8;
+    t7 = t15 - t18;
+    t12 = t19 - t10;
+    t9 = t15 + t18;
+    t8 = t19 + t10;
+    t15 = t4 - t3;
+    t18 = t16 + t17;
+    t19 = t4 + t3;
+    t10 = t16 - t17;
+    t4 = t2 - t13;
+    t3 = t0 - t11;
+    t16 = t2 + t13;
+    t17 = t0 + t11;
+    re[56] = t14;
+    im[56] = t1;
+    re[57] = t9;
+    im[57] = t8;
+    re[58] = t19;
+    im[58] = t10;
+    re[59] = t16;
+    im[59] = t17;
+    re[60] = t5;
+    im[60] = t6;
+    re[61] = t7;
+    im[61] = t12;
+    re[62] = t15;
+    im[62] = t18;
+    re[63] = t4;
+    im[63] = t3;
+    t2 = re[88];
+    t13 = im[88];
+    t0 = re[89];
+    t11 = im[89];
+    t14 = re[90];
+    t1 = im[90];
+    t9 = re[91];
+    t8 = im[91];
+    t19 = re[92];
+    t10 = im[92];
+    t16 = re[93];
+    t17 = im[93];
+    t5 = re[94];
+    t6 = im[94];
+    t7 = re[95];
+    t12 = im[95];
+    t15 = t2 + t19;
+    t18 = t13 + t10;
+    t4 = t14 + t5;
+    t3 = t1 + t6;
+    t2 = t2 - t19;
+    t19 = t13 - t10;
+    t13 = t14 - t5;
+    t10 = t1 - t6;
+    t14 = t15 + t4;
+    t5 = t18 + t3;
+    t1 = t2 + t10;
+    t6 = t19 - t13;
+    t15 = t15 - t4;
+    t4 = t18 - t3;
+    t18 = t2 - t10;
+    t3 = t19 + t13;
+    t2 = t0 + t16;
+    t10 = t11 + t17;
+    t19 = t9 + t7;
+    t13 = t8 + t12;
+    t0 = t0 - t16;
+    t16 = t11 - t17;
+    t11 = t9 - t7;
+    t17 = t8 - t12;
+    t9 = t2 + t19;
+    t7 = t10 + t13;
+    t8 = t0 + t17;
+    t12 = t16 - t11;
+    t2 = t2 - t19;
+    t19 = t10 - t13;
+    t10 = t0 - t17;
+    t13 = t16 + t11;
+    t0 = t8 + t12;
+    t17 = t8 - t12;
+    t16 = C0 * t0;
+    t11 = (-C0) * t17;
+    t8 = t10 - t13;
+    t12 = t10 + t13;
+    t0 = (-C0) * t8;
+    t17 = (-C0) * t12;
+    t10 = t14 - t9;
+    t13 = t5 - t7;
+    t8 = t14 + t9;
+    t12 = t5 + t7;
+    t14 = t1 - t16;
+    t9 = t6 - t11;
+    t5 = t1 + t16;
+    t7 = t6 + t11;
+    t1 = t15 - t19;
+    t16 = t4 + t2;
+    t6 = t15 + t19;
+    t11 = t4 - t2;
+    t15 = t18 - t0;
+    t19 = t3 - t17;
+    t4 = t18 + t0;
+    t2 = t3 + t17;
+    re[88] = t8;
+    im[88] = t12;
+    re[89] = t5;
+    im[89] = t7;
+    re[90] = t6;
+    im[90] = t11;
+    re[91] = t4;
+    im[91] = t2;
+    re[92] = t10;
+    im[92] = t13;
+    re[93] = t14;
+    im[93] = t9;
+    re[94] = t1;
+    im[94] = t16;
+    re[95] = t15;
+    im[95] = t19;
+    t18 = re[120];
+    t0 = im[120];
+    t3 = re[121];
+    t17 = im[121];
+    t8 = re[122];
+    t12 = im[122];
+    t5 = re[123];
+    t7 = im[123];
+    t6 = re[124];
+    t11 = im[124];
+    t4 = re[125];
+    t2 = im[125];
+    t10 = re[126];
+    t13 = im[126];
+    t14 = re[127];
+    t9 = im[127];
+    t1 = t18 + t6;
+    t16 = t0 + t11;
+    t15 = t8 + t10;
+    t19 = t12 + t13;
+    t18 = t18 - t6;
+    t6 = t0 - t11;
+    t0 = t8 - t10;
+    t11 = t12 - t13;
+    t8 = t1 + t15;
+    t10 = t16 + t19;
+    t12 = t18 + t11;
+    t13 = t6 - t0;
+    t1 = t1 - t15;
+    t15 = t16 - t19;
+    t16 = t18 - t11;
+    t19 = t6 + t0;
+    t18 = t3 + t4;
+    t11 = t17 + t2;
+    t6 = t5 + t14;
+    t0 = t7 + t9;
+    t3 = t3 - t4;
+    t4 = t17 - t2;
+    t17 = t5 - t14;
+    t2 = t7 - t9;
+    t5 = t18 + t6;
+    t14 = t11 + t0;
+    t7 = t3 + t2;
+    t9 = t4 - t17;
+    t18 = t18 - t6;
+    t6 = t11 - t0;
+    t11 = t3 - t2;
+    t0 = t4 + t17;
+    t3 = t7 + t9;
+    t2 = t7 - t9;
+    t4 = C0 * t3;
+    t17 = (-C0) * t2;
+    t7 = t11 - t0;
+    t9 = t11 + t0;
+    t3 = (-C0) * t7;
+    t2 = (-C0) * t9;
+    t11 = t8 - t5;
+    t0 = t10 - t14;
+    t7 = t8 + t5;
+    t9 = t10 + t14;
+    t8 = t12 - t4;
+    t5 = t13 - t17;
+    t10 = t12 + t4;
+    t14 = t13 + t17;
+    t12 = t1 - t6;
+    t4 = t15 + t18;
+    t13 = t1 + t6;
+    t17 = t15 - t18;
+    t1 = t16 - t3;
+    t6 = t19 - t2;
+    t15 = t16 + t3;
+    t18 = t19 + t2;
+    re[120] = t7;
+    im[120] = t9;
+    re[121] = t10;
+    im[121] = t14;
+    re[122] = t13;
+    im[122] = t17;
+    re[123] = t15;
+    im[123] = t18;
+    re[124] = t11;
+    im[124] = t0;
+    re[125] = t8;
+    im[125] = t5;
+    re[126] = t12;
+    im[126] = t4;
+    re[127] = t1;
+    im[127] = t6;
+}
+
+//
+//  Public functions.
+//
+
+/**
+ *  Apply in-place mixed-radix FFT transform (prebuilt for block size 128).
+ * 
+ *  Note(s):
+ *    [1] The size of `re` and `im` will not be checked.
+ * 
+ *  @param {Number[]} re 
+ *    - The real part of each point.
+ *  @param {Number[]} im 
+ *    - The imaginary part of each point.
+ */
+function ApplyMixedRadixFFT_128(re, im) {
+    ApplyMixedRadixFFTPermuted_128(re, im);
+    MXCshft(re, im, CSHFT_INDEXES_0);
+    MXCshft(re, im, CSHFT_INDEXES_1);
+    MXCshft(re, im, CSHFT_INDEXES_2);
+    MXCshft(re, im, CSHFT_INDEXES_3);
+    MXCshft(re, im, CSHFT_INDEXES_4);
+    MXCshft(re, im, CSHFT_INDEXES_5);
+    MXCshft(re, im, CSHFT_INDEXES_6);
+    MXCshft(re, im, CSHFT_INDEXES_7);
+    MXCshft(re, im, CSHFT_INDEXES_8);
+    MXCshft(re, im, CSHFT_INDEXES_9);
+    MXCshft(re, im, CSHFT_INDEXES_10);
+    MXCshft(re, im, CSHFT_INDEXES_11);
+    MXCshft(re, im, CSHFT_INDEXES_12);
+    MXCshft(re, im, CSHFT_INDEXES_13);
+    MXCshft(re, im, CSHFT_INDEXES_14);
+    MXCshft(re, im, CSHFT_INDEXES_15);
+    MXCshft(re, im, CSHFT_INDEXES_16);
+    MXCshft(re, im, CSHFT_INDEXES_17);
+}
+
+/**
+ *  Apply in-place mixed-radix FFT transform (prebuilt for block size 128),
+ *  without restoring the natural order of the outputs.
+ * 
+ *  Note(s):
+ *    [1] The size of `re` and `im` will not be checked.
+ *    [2] The k-th output is stored at index
+ *        MIXED_RADIX_FFT_OUTPUT_INDEXES_128[k].
+ * 
+ *  @param {Number[]} re 
+ *    - The real part of each point.
+ *  @param {Number[]} im 
+ *    - The imaginary part of each point.
+ */
+function ApplyMixedRadixFFTPermuted_128(re, im) {
+    ApplyMixedRadixFFTPermuted_128_Part1(re, im);
+    ApplyMixedRadixFFTPermuted_128_Part2(re, im);
+    ApplyMixedRadixFFTPermuted_128_Part3(re, im);
+}
+
+//  Export public APIs.
+module.exports = {
+    "ApplyMixedRadixFFT_128": ApplyMixedRadixFFT_128,
+    "ApplyMixedRadixFFTPermuted_128": ApplyMixedRadixFFTPermuted_128,
+    "MIXED_RADIX_FFT_OUTPUT_INDEXES_128": MIXED_RADIX_FFT_OUTPUT_INDEXES_128
+};
\ No newline at end of file
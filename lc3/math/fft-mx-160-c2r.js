@@ -0,0 +1,3588 @@
+//
+//  Copyright 2021 - 2023 XiaoJSoft Studio. All rights reserved.
+//  Use of this source code is governed by a BSD-style license that can be
+//  found in the LICENSE.md file.
+//
+
+//
+//  Note(s):
+//    [1] This file is generated automatically by a FFT compiler, which locates 
+//        at "./../../dev/fft-mx-generator/" directory.
+//        Do NOT modify this file manually.
+//
+
+//
+//  Private functions.
+//
+
+/**
+ *  Part 1 of ApplyMixedRadixIRFFT_160().
+ * 
+ *  @param {Number[]} re 
+ *    - The real part of each input point.
+ *  @param {Number[]} im 
+ *    - The imaginary part of each input point.
+ *  @param {Number[]} x 
+ *    - The real output points.
+ */
+function ApplyMixedRadixIRFFT_160_Part1(re, im, x) {
+    let t0, t1, t10, t11, t12, t13, t14, t2, t3, t4, t5, t6, t7, t8, t9;
+    const C0 = 0.00625;
+    const C1 = 0.006245181476504519;
+    const C2 = 0.00024537384849417885;
+    const C3 = 0.00623073333583205;
+    const C4 = 0.0004903693482990309;
+    const C5 = 0.00620667785596829;
+    const C6 = 0.0007346087341114853;
+    const C7 = 0.006173052128719611;
+    const C8 = 0.000977715406501443;
+    const C9 = 0.0061299080025201905;
+    const C10 = 0.0012193145126008016;
+    const C11 = 0.0060773120024854785;
+    const C12 = 0.0014590335240994088;
+    const C13 = 0.006015345227835296;
+    const C14 = 0.0016965028116567142;
+    const C15 = 0.00594410322684471;
+    const C16 = 0.0019313562148434212;
+    const C17 = 0.005863695849515526;
+    const C18 = 0.002163231606734331;
+    const C19 = 0.005774247078195543;
+    const C20 = 0.0023917714522818114;
+    const C21 = 0.005675894836406758;
+    const C22 = 0.002616623359608926;
+    const C23 = 0.0055687907761773;
+    const C24 = 0.0028374406233721674;
+    const C25 = 0.005453100044204982;
+    const C26 = 0.0030538827593559682;
+    const C27 = 0.005329001027213076;
+    const C28 = 0.0032656160294746803;
+    const C29 = 0.005196685076890908;
+    const C30 = 0.0034723139563725136;
+    const C31 = 0.005056356214843422;
+    const C32 = 0.003673657826827957;
+    const C33 = 0.004908230818004657;
+    const C34 = 0.0038693371831864626;
+    const C35 = 0.004752537285000194;
+    const C36 = 0.004059050302063648;
+    const C37 = 0.004589515683973035;
+    const C38 = 0.004242504659580886;
+    const C39 = 0.004419417382415923;
+    const C40 = 0.004419417382415922;
+    const C41 = 0.0125;
+    const C42 = 0.5590169943749475;
+    const C43 = 0.25;
+    const C44 = 0.9510565162951535;
+    const C45 = 0.5877852522924731;
+    t0 = re[0];
+    t1 = re[80];
+    t2 = t0 + t1;
+    t0 = t0 - t1;
+    t1 = C0 * t2;
+    t2 = C0 * t0;
+    re[0] = t1;
+    im[0] = t2;
+    t0 = re[1];
+    t1 = im[1];
+    t2 = re[79];
+    t3 = im[79];
+    t4 = t0 + t2;
+    t5 = t1 - t3;
+    t0 = t0 - t2;
+    t2 = t1 + t3;
+    t1 = C0 * t4;
+    t3 = C0 * t5;
+    t4 = C1 * t0;
+    t5 = C2 * t2;
+    t2 = C1 * t2;
+    t0 = C2 * t0;
+    t4 = t4 - t5;
+    t5 = t2 + t0;
+    t2 = t1 - t5;
+    t0 = t3 + t4;
+    t1 = t1 + t5;
+    t5 = t4 - t3;
+    re[1] = t2;
+    im[1] = t0;
+    re[79] = t1;
+    im[79] = t5;
+    t4 = re[2];
+    t3 = im[2];
+    t2 = re[78];
+    t0 = im[78];
+    t1 = t4 + t2;
+    t5 = t3 - t0;
+    t4 = t4 - t2;
+    t2 = t3 + t0;
+    t3 = C0 * t1;
+    t0 = C0 * t5;
+    t1 = C3 * t4;
+    t5 = C4 * t2;
+    t2 = C3 * t2;
+    t4 = C4 * t4;
+    t1 = t1 - t5;
+    t5 = t2 + t4;
+    t2 = t3 - t5;
+    t4 = t0 + t1;
+    t3 = t3 + t5;
+    t5 = t1 - t0;
+    re[2] = t2;
+    im[2] = t4;
+    re[78] = t3;
+    im[78] = t5;
+    t1 = re[3];
+    t0 = im[3];
+    t2 = re[77];
+    t4 = im[77];
+    t3 = t1 + t2;
+    t5 = t0 - t4;
+    t1 = t1 - t2;
+    t2 = t0 + t4;
+    t0 = C0 * t3;
+    t4 = C0 * t5;
+    t3 = C5 * t1;
+    t5 = C6 * t2;
+    t2 = C5 * t2;
+    t1 = C6 * t1;
+    t3 = t3 - t5;
+    t5 = t2 + t1;
+    t2 = t0 - t5;
+    t1 = t4 + t3;
+    t0 = t0 + t5;
+    t5 = t3 - t4;
+    re[3] = t2;
+    im[3] = t1;
+    re[77] = t0;
+    im[77] = t5;
+    t3 = re[4];
+    t4 = im[4];
+    t2 = re[76];
+    t1 = im[76];
+    t0 = t3 + t2;
+    t5 = t4 - t1;
+    t3 = t3 - t2;
+    t2 = t4 + t1;
+    t4 = C0 * t0;
+    t1 = C0 * t5;
+    t0 = C7 * t3;
+    t5 = C8 * t2;
+    t2 = C7 * t2;
+    t3 = C8 * t3;
+    t0 = t0 - t5;
+    t5 = t2 + t3;
+    t2 = t4 - t5;
+    t3 = t1 + t0;
+    t4 = t4 + t5;
+    t5 = t0 - t1;
+    re[4] = t2;
+    im[4] = t3;
+    re[76] = t4;
+    im[76] = t5;
+    t0 = re[5];
+    t1 = im[5];
+    t2 = re[75];
+    t3 = im[75];
+    t4 = t0 + t2;
+    t5 = t1 - t3;
+    t0 = t0 - t2;
+    t2 = t1 + t3;
+    t1 = C0 * t4;
+    t3 = C0 * t5;
+    t4 = C9 * t0;
+    t5 = C10 * t2;
+    t2 = C9 * t2;
+    t0 = C10 * t0;
+    t4 = t4 - t5;
+    t5 = t2 + t0;
+    t2 = t1 - t5;
+    t0 = t3 + t4;
+    t1 = t1 + t5;
+    t5 = t4 - t3;
+    re[5] = t2;
+    im[5] = t0;
+    re[75] = t1;
+    im[75] = t5;
+    t4 = re[6];
+    t3 = im[6];
+    t2 = re[74];
+    t0 = im[74];
+    t1 = t4 + t2;
+    t5 = t3 - t0;
+    t4 = t4 - t2;
+    t2 = t3 + t0;
+    t3 = C0 * t1;
+    t0 = C0 * t5;
+    t1 = C11 * t4;
+    t5 = C12 * t2;
+    t2 = C11 * t2;
+    t4 = C12 * t4;
+    t1 = t1 - t5;
+    t5 = t2 + t4;
+    t2 = t3 - t5;
+    t4 = t0 + t1;
+    t3 = t3 + t5;
+    t5 = t1 - t0;
+    re[6] = t2;
+    im[6] = t4;
+    re[74] = t3;
+    im[74] = t5;
+    t1 = re[7];
+    t0 = im[7];
+    t2 = re[73];
+    t4 = im[73];
+    t3 = t1 + t2;
+    t5 = t0 - t4;
+    t1 = t1 - t2;
+    t2 = t0 + t4;
+    t0 = C0 * t3;
+    t4 = C0 * t5;
+    t3 = C13 * t1;
+    t5 = C14 * t2;
+    t2 = C13 * t2;
+    t1 = C14 * t1;
+    t3 = t3 - t5;
+    t5 = t2 + t1;
+    t2 = t0 - t5;
+    t1 = t4 + t3;
+    t0 = t0 + t5;
+    t5 = t3 - t4;
+    re[7] = t2;
+    im[7] = t1;
+    re[73] = t0;
+    im[73] = t5;
+    t3 = re[8];
+    t4 = im[8];
+    t2 = re[72];
+    t1 = im[72];
+    t0 = t3 + t2;
+    t5 = t4 - t1;
+    t3 = t3 - t2;
+    t2 = t4 + t1;
+    t4 = C0 * t0;
+    t1 = C0 * t5;
+    t0 = C15 * t3;
+    t5 = C16 * t2;
+    t2 = C15 * t2;
+    t3 = C16 * t3;
+    t0 = t0 - t5;
+    t5 = t2 + t3;
+    t2 = t4 - t5;
+    t3 = t1 + t0;
+    t4 = t4 + t5;
+    t5 = t0 - t1;
+    re[8] = t2;
+    im[8] = t3;
+    re[72] = t4;
+    im[72] = t5;
+    t0 = re[9];
+    t1 = im[9];
+    t2 = re[71];
+    t3 = im[71];
+    t4 = t0 + t2;
+    t5 = t1 - t3;
+    t0 = t0 - t2;
+    t2 = t1 + t3;
+    t1 = C0 * t4;
+    t3 = C0 * t5;
+    t4 = C17 * t0;
+    t5 = C18 * t2;
+    t2 = C17 * t2;
+    t0 = C18 * t0;
+    t4 = t4 - t5;
+    t5 = t2 + t0;
+    t2 = t1 - t5;
+    t0 = t3 + t4;
+    t1 = t1 + t5;
+    t5 = t4 - t3;
+    re[9] = t2;
+    im[9] = t0;
+    re[71] = t1;
+    im[71] = t5;
+    t4 = re[10];
+    t3 = im[10];
+    t2 = re[70];
+    t0 = im[70];
+    t1 = t4 + t2;
+    t5 = t3 - t0;
+    t4 = t4 - t2;
+    t2 = t3 + t0;
+    t3 = C0 * t1;
+    t0 = C0 * t5;
+    t1 = C19 * t4;
+    t5 = C20 * t2;
+    t2 = C19 * t2;
+    t4 = C20 * t4;
+    t1 = t1 - t5;
+    t5 = t2 + t4;
+    t2 = t3 - t5;
+    t4 = t0 + t1;
+    t3 = t3 + t5;
+    t5 = t1 - t0;
+    re[10] = t2;
+    im[10] = t4;
+    re[70] = t3;
+    im[70] = t5;
+    t1 = re[11];
+    t0 = im[11];
+    t2 = re[69];
+    t4 = im[69];
+    t3 = t1 + t2;
+    t5 = t0 - t4;
+    t1 = t1 - t2;
+    t2 = t0 + t4;
+    t0 = C0 * t3;
+    t4 = C0 * t5;
+    t3 = C21 * t1;
+    t5 = C22 * t2;
+    t2 = C21 * t2;
+    t1 = C22 * t1;
+    t3 = t3 - t5;
+    t5 = t2 + t1;
+    t2 = t0 - t5;
+    t1 = t4 + t3;
+    t0 = t0 + t5;
+    t5 = t3 - t4;
+    re[11] = t2;
+    im[11] = t1;
+    re[69] = t0;
+    im[69] = t5;
+    t3 = re[12];
+    t4 = im[12];
+    t2 = re[68];
+    t1 = im[68];
+    t0 = t3 + t2;
+    t5 = t4 - t1;
+    t3 = t3 - t2;
+    t2 = t4 + t1;
+    t4 = C0 * t0;
+    t1 = C0 * t5;
+    t0 = C23 * t3;
+    t5 = C24 * t2;
+    t2 = C23 * t2;
+    t3 = C24 * t3;
+    t0 = t0 - t5;
+    t5 = t2 + t3;
+    t2 = t4 - t5;
+    t3 = t1 + t0;
+    t4 = t4 + t5;
+    t5 = t0 - t1;
+    re[12] = t2;
+    im[12] = t3;
+    re[68] = t4;
+    im[68] = t5;
+    t0 = re[13];
+    t1 = im[13];
+    t2 = re[67];
+    t3 = im[67];
+    t4 = t0 + t2;
+    t5 = t1 - t3;
+    t0 = t0 - t2;
+    t2 = t1 + t3;
+    t1 = C0 * t4;
+    t3 = C0 * t5;
+    t4 = C25 * t0;
+    t5 = C26 * t2;
+    t2 = C25 * t2;
+    t0 = C26 * t0;
+    t4 = t4 - t5;
+    t5 = t2 + t0;
+    t2 = t1 - t5;
+    t0 = t3 + t4;
+    t1 = t1 + t5;
+    t5 = t4 - t3;
+    re[13] = t2;
+    im[13] = t0;
+    re[67] = t1;
+    im[67] = t5;
+    t4 = re[14];
+    t3 = im[14];
+    t2 = re[66];
+    t0 = im[66];
+    t1 = t4 + t2;
+    t5 = t3 - t0;
+    t4 = t4 - t2;
+    t2 = t3 + t0;
+    t3 = C0 * t1;
+    t0 = C0 * t5;
+    t1 = C27 * t4;
+    t5 = C28 * t2;
+    t2 = C27 * t2;
+    t4 = C28 * t4;
+    t1 = t1 - t5;
+    t5 = t2 + t4;
+    t2 = t3 - t5;
+    t4 = t0 + t1;
+    t3 = t3 + t5;
+    t5 = t1 - t0;
+    re[14] = t2;
+    im[14] = t4;
+    re[66] = t3;
+    im[66] = t5;
+    t1 = re[15];
+    t0 = im[15];
+    t2 = re[65];
+    t4 = im[65];
+    t3 = t1 + t2;
+    t5 = t0 - t4;
+    t1 = t1 - t2;
+    t2 = t0 + t4;
+    t0 = C0 * t3;
+    t4 = C0 * t5;
+    t3 = C29 * t1;
+    t5 = C30 * t2;
+    t2 = C29 * t2;
+    t1 = C30 * t1;
+    t3 = t3 - t5;
+    t5 = t2 + t1;
+    t2 = t0 - t5;
+    t1 = t4 + t3;
+    t0 = t0 + t5;
+    t5 = t3 - t4;
+    re[15] = t2;
+    im[15] = t1;
+    re[65] = t0;
+    im[65] = t5;
+    t3 = re[16];
+    t4 = im[16];
+    t2 = re[64];
+    t1 = im[64];
+    t0 = t3 + t2;
+    t5 = t4 - t1;
+    t3 = t3 - t2;
+    t2 = t4 + t1;
+    t4 = C0 * t0;
+    t1 = C0 * t5;
+    t0 = C31 * t3;
+    t5 = C32 * t2;
+    t2 = C31 * t2;
+    t3 = C32 * t3;
+    t0 = t0 - t5;
+    t5 = t2 + t3;
+    t2 = t4 - t5;
+    t3 = t1 + t0;
+    t4 = t4 + t5;
+    t5 = t0 - t1;
+    re[16] = t2;
+    im[16] = t3;
+    re[64] = t4;
+    im[64] = t5;
+    t0 = re[17];
+    t1 = im[17];
+    t2 = re[63];
+    t3 = im[63];
+    t4 = t0 + t2;
+    t5 = t1 - t3;
+    t0 = t0 - t2;
+    t2 = t1 + t3;
+    t1 = C0 * t4;
+    t3 = C0 * t5;
+    t4 = C33 * t0;
+    t5 = C34 * t2;
+    t2 = C33 * t2;
+    t0 = C34 * t0;
+    t4 = t4 - t5;
+    t5 = t2 + t0;
+    t2 = t1 - t5;
+    t0 = t3 + t4;
+    t1 = t1 + t5;
+    t5 = t4 - t3;
+    re[17] = t2;
+    im[17] = t0;
+    re[63] = t1;
+    im[63] = t5;
+    t4 = re[18];
+    t3 = im[18];
+    t2 = re[62];
+    t0 = im[62];
+    t1 = t4 + t2;
+    t5 = t3 - t0;
+    t4 = t4 - t2;
+    t2 = t3 + t0;
+    t3 = C0 * t1;
+    t0 = C0 * t5;
+    t1 = C35 * t4;
+    t5 = C36 * t2;
+    t2 = C35 * t2;
+    t4 = C36 * t4;
+    t1 = t1 - t5;
+    t5 = t2 + t4;
+    t2 = t3 - t5;
+    t4 = t0 + t1;
+    t3 = t3 + t5;
+    t5 = t1 - t0;
+    re[18] = t2;
+    im[18] = t4;
+    re[62] = t3;
+    im[62] = t5;
+    t1 = re[19];
+    t0 = im[19];
+    t2 = re[61];
+    t4 = im[61];
+    t3 = t1 + t2;
+    t5 = t0 - t4;
+    t1 = t1 - t2;
+    t2 = t0 + t4;
+    t0 = C0 * t3;
+    t4 = C0 * t5;
+    t3 = C37 * t1;
+    t5 = C38 * t2;
+    t2 = C37 * t2;
+    t1 = C38 * t1;
+    t3 = t3 - t5;
+    t5 = t2 + t1;
+    t2 = t0 - t5;
+    t1 = t4 + t3;
+    t0 = t0 + t5;
+    t5 = t3 - t4;
+    re[19] = t2;
+    im[19] = t1;
+    re[61] = t0;
+    im[61] = t5;
+    t3 = re[20];
+    t4 = im[20];
+    t2 = re[60];
+    t1 = im[60];
+    t0 = t3 + t2;
+    t5 = t4 - t1;
+    t3 = t3 - t2;
+    t2 = t4 + t1;
+    t4 = C0 * t0;
+    t1 = C0 * t5;
+    t0 = C39 * t3;
+    t5 = C40 * t2;
+    t2 = C39 * t2;
+    t3 = C40 * t3;
+    t0 = t0 - t5;
+    t5 = t2 + t3;
+    t2 = t4 - t5;
+    t3 = t1 + t0;
+    t4 = t4 + t5;
+    t5 = t0 - t1;
+    re[20] = t2;
+    im[20] = t3;
+    re[60] = t4;
+    im[60] = t5;
+    t0 = re[21];
+    t1 = im[21];
+    t2 = re[59];
+    t3 = im[59];
+    t4 = t0 + t2;
+    t5 = t1 - t3;
+    t0 = t0 - t2;
+    t2 = t1 + t3;
+    t1 = C0 * t4;
+    t3 = C0 * t5;
+    t4 = C38 * t0;
+    t5 = C37 * t2;
+    t2 = C38 * t2;
+    t0 = C37 * t0;
+    t4 = t4 - t5;
+    t5 = t2 + t0;
+    t2 = t1 - t5;
+    t0 = t3 + t4;
+    t1 = t1 + t5;
+    t5 = t4 - t3;
+    re[21] = t2;
+    im[21] = t0;
+    re[59] = t1;
+    im[59] = t5;
+    t4 = re[22];
+    t3 = im[22];
+    t2 = re[58];
+    t0 = im[58];
+    t1 = t4 + t2;
+    t5 = t3 - t0;
+    t4 = t4 - t2;
+    t2 = t3 + t0;
+    t3 = C0 * t1;
+    t0 = C0 * t5;
+    t1 = C36 * t4;
+    t5 = C35 * t2;
+    t2 = C36 * t2;
+    t4 = C35 * t4;
+    t1 = t1 - t5;
+    t5 = t2 + t4;
+    t2 = t3 - t5;
+    t4 = t0 + t1;
+    t3 = t3 + t5;
+    t5 = t1 - t0;
+    re[22] = t2;
+    im[22] = t4;
+    re[58] = t3;
+    im[58] = t5;
+    t1 = re[23];
+    t0 = im[23];
+    t2 = re[57];
+    t4 = im[57];
+    t3 = t1 + t2;
+    t5 = t0 - t4;
+    t1 = t1 - t2;
+    t2 = t0 + t4;
+    t0 = C0 * t3;
+    t4 = C0 * t5;
+    t3 = C34 * t1;
+    t5 = C33 * t2;
+    t2 = C34 * t2;
+    t1 = C33 * t1;
+    t3 = t3 - t5;
+    t5 = t2 + t1;
+    t2 = t0 - t5;
+    t1 = t4 + t3;
+    t0 = t0 + t5;
+    t5 = t3 - t4;
+    re[23] = t2;
+    im[23] = t1;
+    re[57] = t0;
+    im[57] = t5;
+    t3 = re[24];
+    t4 = im[24];
+    t2 = re[56];
+    t1 = im[56];
+    t0 = t3 + t2;
+    t5 = t4 - t1;
+    t3 = t3 - t2;
+    t2 = t4 + t1;
+    t4 = C0 * t0;
+    t1 = C0 * t5;
+    t0 = C32 * t3;
+    t5 = C31 * t2;
+    t2 = C32 * t2;
+    t3 = C31 * t3;
+    t0 = t0 - t5;
+    t5 = t2 + t3;
+    t2 = t4 - t5;
+    t3 = t1 + t0;
+    t4 = t4 + t5;
+    t5 = t0 - t1;
+    re[24] = t2;
+    im[24] = t3;
+    re[56] = t4;
+    im[56] = t5;
+    t0 = re[25];
+    t1 = im[25];
+    t2 = re[55];
+    t3 = im[55];
+    t4 = t0 + t2;
+    t5 = t1 - t3;
+    t0 = t0 - t2;
+    t2 = t1 + t3;
+    t1 = C0 * t4;
+    t3 = C0 * t5;
+    t4 = C30 * t0;
+    t5 = C29 * t2;
+    t2 = C30 * t2;
+    t0 = C29 * t0;
+    t4 = t4 - t5;
+    t5 = t2 + t0;
+    t2 = t1 - t5;
+    t0 = t3 + t4;
+    t1 = t1 + t5;
+    t5 = t4 - t3;
+    re[25] = t2;
+    im[25] = t0;
+    re[55] = t1;
+    im[55] = t5;
+    t4 = re[26];
+    t3 = im[26];
+    t2 = re[54];
+    t0 = im[54];
+    t1 = t4 + t2;
+    t5 = t3 - t0;
+    t4 = t4 - t2;
+    t2 = t3 + t0;
+    t3 = C0 * t1;
+    t0 = C0 * t5;
+    t1 = C28 * t4;
+    t5 = C27 * t2;
+    t2 = C28 * t2;
+    t4 = C27 * t4;
+    t1 = t1 - t5;
+    t5 = t2 + t4;
+    t2 = t3 - t5;
+    t4 = t0 + t1;
+    t3 = t3 + t5;
+    t5 = t1 - t0;
+    re[26] = t2;
+    im[26] = t4;
+    re[54] = t3;
+    im[54] = t5;
+    t1 = re[27];
+    t0 = im[27];
+    t2 = re[53];
+    t4 = im[53];
+    t3 = t1 + t2;
+    t5 = t0 - t4;
+    t1 = t1 - t2;
+    t2 = t0 + t4;
+    t0 = C0 * t3;
+    t4 = C0 * t5;
+    t3 = C26 * t1;
+    t5 = C25 * t2;
+    t2 = C26 * t2;
+    t1 = C25 * t1;
+    t3 = t3 - t5;
+    t5 = t2 + t1;
+    t2 = t0 - t5;
+    t1 = t4 + t3;
+    t0 = t0 + t5;
+    t5 = t3 - t4;
+    re[27] = t2;
+    im[27] = t1;
+    re[53] = t0;
+    im[53] = t5;
+    t3 = re[28];
+    t4 = im[28];
+    t2 = re[52];
+    t1 = im[52];
+    t0 = t3 + t2;
+    t5 = t4 - t1;
+    t3 = t3 - t2;
+    t2 = t4 + t1;
+    t4 = C0 * t0;
+    t1 = C0 * t5;
+    t0 = C24 * t3;
+    t5 = C23 * t2;
+    t2 = C24 * t2;
+    t3 = C23 * t3;
+    t0 = t0 - t5;
+    t5 = t2 + t3;
+    t2 = t4 - t5;
+    t3 = t1 + t0;
+    t4 = t4 + t5;
+    t5 = t0 - t1;
+    re[28] = t2;
+    im[28] = t3;
+    re[52] = t4;
+    im[52] = t5;
+    t0 = re[29];
+    t1 = im[29];
+    t2 = re[51];
+    t3 = im[51];
+    t4 = t0 + t2;
+    t5 = t1 - t3;
+    t0 = t0 - t2;
+    t2 = t1 + t3;
+    t1 = C0 * t4;
+    t3 = C0 * t5;
+    t4 = C22 * t0;
+    t5 = C21 * t2;
+    t2 = C22 * t2;
+    t0 = C21 * t0;
+    t4 = t4 - t5;
+    t5 = t2 + t0;
+    t2 = t1 - t5;
+    t0 = t3 + t4;
+    t1 = t1 + t5;
+    t5 = t4 - t3;
+    re[29] = t2;
+    im[29] = t0;
+    re[51] = t1;
+    im[51] = t5;
+    t4 = re[30];
+    t3 = im[30];
+    t2 = re[50];
+    t0 = im[50];
+    t1 = t4 + t2;
+    t5 = t3 - t0;
+    t4 = t4 - t2;
+    t2 = t3 + t0;
+    t3 = C0 * t1;
+    t0 = C0 * t5;
+    t1 = C20 * t4;
+    t5 = C19 * t2;
+    t2 = C20 * t2;
+    t4 = C19 * t4;
+    t1 = t1 - t5;
+    t5 = t2 + t4;
+    t2 = t3 - t5;
+    t4 = t0 + t1;
+    t3 = t3 + t5;
+    t5 = t1 - t0;
+    re[30] = t2;
+    im[30] = t4;
+    re[50] = t3;
+    im[50] = t5;
+    t1 = re[31];
+    t0 = im[31];
+    t2 = re[49];
+    t4 = im[49];
+    t3 = t1 + t2;
+    t5 = t0 - t4;
+    t1 = t1 - t2;
+    t2 = t0 + t4;
+    t0 = C0 * t3;
+    t4 = C0 * t5;
+    t3 = C18 * t1;
+    t5 = C17 * t2;
+    t2 = C18 * t2;
+    t1 = C17 * t1;
+    t3 = t3 - t5;
+    t5 = t2 + t1;
+    t2 = t0 - t5;
+    t1 = t4 + t3;
+    t0 = t0 + t5;
+    t5 = t3 - t4;
+    re[31] = t2;
+    im[31] = t1;
+    re[49] = t0;
+    im[49] = t5;
+    t3 = re[32];
+    t4 = im[32];
+    t2 = re[48];
+    t1 = im[48];
+    t0 = t3 + t2;
+    t5 = t4 - t1;
+    t3 = t3 - t2;
+    t2 = t4 + t1;
+    t4 = C0 * t0;
+    t1 = C0 * t5;
+    t0 = C16 * t3;
+    t5 = C15 * t2;
+    t2 = C16 * t2;
+    t3 = C15 * t3;
+    t0 = t0 - t5;
+    t5 = t2 + t3;
+    t2 = t4 - t5;
+    t3 = t1 + t0;
+    t4 = t4 + t5;
+    t5 = t0 - t1;
+    re[32] = t2;
+    im[32] = t3;
+    re[48] = t4;
+    im[48] = t5;
+    t0 = re[33];
+    t1 = im[33];
+    t2 = re[47];
+    t3 = im[47];
+    t4 = t0 + t2;
+    t5 = t1 - t3;
+    t0 = t0 - t2;
+    t2 = t1 + t3;
+    t1 = C0 * t4;
+    t3 = C0 * t5;
+    t4 = C14 * t0;
+    t5 = C13 * t2;
+    t2 = C14 * t2;
+    t0 = C13 * t0;
+    t4 = t4 - t5;
+    t5 = t2 + t0;
+    t2 = t1 - t5;
+    t0 = t3 + t4;
+    t1 = t1 + t5;
+    t5 = t4 - t3;
+    re[33] = t2;
+    im[33] = t0;
+    re[47] = t1;
+    im[47] = t5;
+    t4 = re[34];
+    t3 = im[34];
+    t2 = re[46];
+    t0 = im[46];
+    t1 = t4 + t2;
+    t5 = t3 - t0;
+    t4 = t4 - t2;
+    t2 = t3 + t0;
+    t3 = C0 * t1;
+    t0 = C0 * t5;
+    t1 = C12 * t4;
+    t5 = C11 * t2;
+    t2 = C12 * t2;
+    t4 = C11 * t4;
+    t1 = t1 - t5;
+    t5 = t2 + t4;
+    t2 = t3 - t5;
+    t4 = t0 + t1;
+    t3 = t3 + t5;
+    t5 = t1 - t0;
+    re[34] = t2;
+    im[34] = t4;
+    re[46] = t3;
+    im[46] = t5;
+    t1 = re[35];
+    t0 = im[35];
+    t2 = re[45];
+    t4 = im[45];
+    t3 = t1 + t2;
+    t5 = t0 - t4;
+    t1 = t1 - t2;
+    t2 = t0 + t4;
+    t0 = C0 * t3;
+    t4 = C0 * t5;
+    t3 = C10 * t1;
+    t5 = C9 * t2;
+    t2 = C10 * t2;
+    t1 = C9 * t1;
+    t3 = t3 - t5;
+    t5 = t2 + t1;
+    t2 = t0 - t5;
+    t1 = t4 + t3;
+    t0 = t0 + t5;
+    t5 = t3 - t4;
+    re[35] = t2;
+    im[35] = t1;
+    re[45] = t0;
+    im[45] = t5;
+    t3 = re[36];
+    t4 = im[36];
+    t2 = re[44];
+    t1 = im[44];
+    t0 = t3 + t2;
+    t5 = t4 - t1;
+    t3 = t3 - t2;
+    t2 = t4 + t1;
+    t4 = C0 * t0;
+    t1 = C0 * t5;
+    t0 = C8 * t3;
+    t5 = C7 * t2;
+    t2 = C8 * t2;
+    t3 = C7 * t3;
+    t0 = t0 - t5;
+    t5 = t2 + t3;
+    t2 = t4 - t5;
+    t3 = t1 + t0;
+    t4 = t4 + t5;
+    t5 = t0 - t1;
+    re[36] = t2;
+    im[36] = t3;
+    re[44] = t4;
+    im[44] = t5;
+    t0 = re[37];
+    t1 = im[37];
+    t2 = re[43];
+    t3 = im[43];
+    t4 = t0 + t2;
+    t5 = t1 - t3;
+    t0 = t0 - t2;
+    t2 = t1 + t3;
+    t1 = C0 * t4;
+    t3 = C0 * t5;
+    t4 = C6 * t0;
+    t5 = C5 * t2;
+    t2 = C6 * t2;
+    t0 = C5 * t0;
+    t4 = t4 - t5;
+    t5 = t2 + t0;
+    t2 = t1 - t5;
+    t0 = t3 + t4;
+    t1 = t1 + t5;
+    t5 = t4 - t3;
+    re[37] = t2;
+    im[37] = t0;
+    re[43] = t1;
+    im[43] = t5;
+    t4 = re[38];
+    t3 = im[38];
+    t2 = re[42];
+    t0 = im[42];
+    t1 = t4 + t2;
+    t5 = t3 - t0;
+    t4 = t4 - t2;
+    t2 = t3 + t0;
+    t3 = C0 * t1;
+    t0 = C0 * t5;
+    t1 = C4 * t4;
+    t5 = C3 * t2;
+    t2 = C4 * t2;
+    t4 = C3 * t4;
+    t1 = t1 - t5;
+    t5 = t2 + t4;
+    t2 = t3 - t5;
+    t4 = t0 + t1;
+    t3 = t3 + t5;
+    t5 = t1 - t0;
+    re[38] = t2;
+    im[38] = t4;
+    re[42] = t3;
+    im[42] = t5;
+    t1 = re[39];
+    t0 = im[39];
+    t2 = re[41];
+    t4 = im[41];
+    t3 = t1 + t2;
+    t5 = t0 - t4;
+    t1 = t1 - t2;
+    t2 = t0 + t4;
+    t0 = C0 * t3;
+    t4 = C0 * t5;
+    t3 = C2 * t1;
+    t5 = C1 * t2;
+    t2 = C2 * t2;
+    t1 = C1 * t1;
+    t3 = t3 - t5;
+    t5 = t2 + t1;
+    t2 = t0 - t5;
+    t1 = t4 + t3;
+    t0 = t0 + t5;
+    t5 = t3 - t4;
+    re[39] = t2;
+    im[39] = t1;
+    re[41] = t0;
+    im[41] = t5;
+    t3 = re[40];
+    t4 = im[40];
+    t2 = C41 * t3;
+    t1 = C41 * t4;
+    t0 = -t1;
+    re[40] = t2;
+    im[40] = t0;
+    t5 = im[0];
+    t3 = re[0];
+    t4 = im[16];
+    t1 = re[16];
+    t2 = im[32];
+    t0 = re[32];
+    t6 = im[48];
+    t7 = re[48];
+    t8 = im[64];
+    t9 = re[64];
+    t10 = t4 + t8;
+    t11 = t1 + t9;
+    t12 = t2 + t6;
+    t13 = t0 + t7;
+    t4 = t4 - t8;
+    t8 = t1 - t9;
+    t1 = t2 - t6;
+    t9 = t0 - t7;
+    t2 = t10 + t12;
+    t6 = t11 + t13;
+    t0 = t10 - t12;
+    t7 = C42 * t0;
+    t10 = t11 - t13;
+    t12 = C42 * t10;
+    t0 = C43 * t2;
+    t11 = t5 - t0;
+    t13 = C43 * t6;
+    t10 = t3 - t13;
+    t0 = t11 + t7;
+    t13 = t10 + t12;
+    t11 = t11 - t7;
+    t7 = t10 - t12;
+    t10 = C44 * t4;
+    t12 = C45 * t1;
+    t10 = t10 + t12;
+    t12 = C44 * t8;
+    t14 = C45 * t9;
+    t12 = t12 + t14;
+    t14 = C45 * t4;
+    t4 = C44 * t1;
+    t1 = t14 - t4;
+    t14 = C45 * t8;
+    t4 = C44 * t9;
+    t8 = t14 - t4;
+    t9 = t5 + t2;
+    t14 = t3 + t6;
+    t4 = t0 + t12;
+    t5 = t13 - t10;
+    t2 = t11 + t8;
+    t3 = t7 - t1;
+    t6 = t11 - t8;
+    t11 = t7 + t1;
+    t8 = t0 - t12;
+    t7 = t13 + t10;
+    im[0] = t9;
+    re[0] = t14;
+    im[16] = t4;
+    re[16] = t5;
+    im[32] = t2;
+    re[32] = t3;
+    im[48] = t6;
+    re[48] = t11;
+    im[64] = t8;
+    re[64] = t7;
+    t1 = im[5];
+    t0 = re[5];
+    t12 = im[21];
+    t13 = re[21];
+    t10 = im[37];
+    t9 = re[37];
+    t14 = im[53];
+    t4 = re[53];
+    t5 = im[69];
+    t2 = re[69];
+    t3 = t12 + t5;
+    t6 = t13 + t2;
+    t11 = t10 + t14;
+    t8 = t9 + t4;
+    t7 = t12 - t5;
+    t12 = t13 - t2;
+    t5 = t10 - t14;
+    t13 = t9 - t4;
+    t2 = t3 + t11;
+    t10 = t6 + t8;
+    t14 = t3 - t11;
+    t9 = C42 * t14;
+    t4 = t6 - t8;
+    t3 = C42 * t4;
+    t11 = C43 * t2;
+    t14 = t1 - t11;
+    t6 = C43 * t10;
+    t8 = t0 - t6;
+    t4 = t14 + t9;
+    t11 = t8 + t3;
+    t6 = t14 - t9;
+    t14 = t8 - t3;
+    t9 = C44 * t7;
+    t8 = C45 * t5;
+    t3 = t9 + t8;
+    t9 = C44 * t12;
+    t8 = C45 * t13;
+    t9 = t9 + t8;
+    t8 = C45 * t7;
+    t7 = C44 * t5;
+    t5 = t8 - t7;
+    t8 = C45 * t12;
+    t7 = C44 * t13;
+    t12 = t8 - t7;
+    t13 = t1 + t2;
+    t8 = t0 + t10;
+    t7 = t4 + t9;
+    t1 = t11 - t3;
+    t2 = t6 + t12;
+    t0 = t14 - t5;
+    t10 = t6 - t12;
+    t6 = t14 + t5;
+    t12 = t4 - t9;
+    t14 = t11 + t3;
+    im[5] = t13;
+    re[5] = t8;
+    im[21] = t7;
+    re[21] = t1;
+    im[37] = t2;
+    re[37] = t0;
+    im[53] = t10;
+    re[53] = t6;
+    im[69] = t12;
+    re[69] = t14;
+    t5 = im[10];
+    t4 = re[10];
+    t9 = im[26];
+    t11 = re[26];
+    t3 = im[42];
+    t13 = re[42];
+    t8 = im[58];
+    t7 = re[58];
+    t1 = im[74];
+    t2 = re[74];
+    t0 = t9 + t1;
+    t10 = t11 + t2;
+    t6 = t3 + t8;
+    t12 = t13 + t7;
+    t14 = t9 - t1;
+    t9 = t11 - t2;
+    t1 = t3 - t8;
+    t11 = t13 - t7;
+    t2 = t0 + t6;
+    t3 = t10 + t12;
+    t8 = t0 - t6;
+    t13 = C42 * t8;
+    t7 = t10 - t12;
+    t0 = C42 * t7;
+    t6 = C43 * t2;
+    t8 = t5 - t6;
+    t10 = C43 * t3;
+    t12 = t4 - t10;
+    t7 = t8 + t13;
+    t6 = t12 + t0;
+    t10 = t8 - t13;
+    t8 = t12 - t0;
+    t13 = C44 * t14;
+    t12 = C45 * t1;
+    t0 = t13 + t12;
+    t13 = C44 * t9;
+    t12 = C45 * t11;
+    t13 = t13 + t12;
+    t12 = C45 * t14;
+    t14 = C44 * t1;
+    t1 = t12 - t14;
+    t12 = C45 * t9;
+    t14 = C44 * t11;
+    t9 = t12 - t14;
+    t11 = t5 + t2;
+    t12 = t4 + t3;
+    t14 = t7 + t13;
+    t5 = t6 - t0;
+    t2 = t10 + t9;
+    t4 = t8 - t1;
+    t3 = t10 - t9;
+    t10 = t8 + t1;
+    t9 = t7 - t13;
+    t8 = t6 + t0;
+    im[10] = t11;
+    re[10] = t12;
+    im[26] = t14;
+    re[26] = t5;
+    im[42] = t2;
+    re[42] = t4;
+    im[58] = t3;
+    re[58] = t10;
+    im[74] = t9;
+    re[74] = t8;
+    t1 = im[15];
+    t7 = re[15];
+    t13 = im[31];
+    t6 = re[31];
+    t0 = im[47];
+    t11 = re[47];
+    t12 = im[63];
+    t14 = re[63];
+    t5 = im[79];
+    t2 = re[79];
+    t4 = t13 + t5;
+    t3 = t6 + t2;
+    t10 = t0 + t12;
+    t9 = t11 + t14;
+    t8 = t13 - t5;
+    t13 = t6 - t2;
+    t5 = t0 - t12;
+    t6 = t11 - t14;
+    t2 = t4 + t10;
+    t0 = t3 + t9;
+    t12 = t4 - t10;
+    t11 = C42 * t12;
+    t14 = t3 - t9;
+    t4 = C42 * t14;
+    t10 = C43 * t2;
+    t12 = t1 - t10;
+    t3 = C43 * t0;
+    t9 = t7 - t3;
+    t14 = t12 + t11;
+    t10 = t9 + t4;
+    t3 = t12 - t11;
+    t12 = t9 - t4;
+    t11 = C44 * t8;
+    t9 = C45 * t5;
+    t4 = t11 + t9;
+    t11 = C44 * t13;
+    t9 = C45 * t6;
+    t11 = t11 + t9;
+    t9 = C45 * t8;
+    t8 = C44 * t5;
+    t5 = t9 - t8;
+    t9 = C45 * t13;
+    t8 = C44 * t6;
+    t13 = t9 - t8;
+    t6 = t1 + t2;
+    t9 = t7 + t0;
+    t8 = t14 + t11;
+    t1 = t10 - t4;
+    t2 = t3 + t13;
+    t7 = t12 - t5;
+    t0 = t3 - t13;
+    t3 = t12 + t5;
+    t13 = t14 - t11;
+    t12 = t10 + t4;
+    im[15] = t6;
+    re[15] = t9;
+    im[31] = t8;
+    re[31] = t1;
+    im[47] = t2;
+    re[47] = t7;
+    im[63] = t0;
+    re[63] = t3;
+    im[79] = t13;
+    re[79] = t12;
+    t5 = im[20];
+    t14 = re[20];
+    t11 = im[36];
+    t10 = re[36];
+    t4 = im[52];
+    t6 = re[52];
+    t9 = im[68];
+    t8 = re[68];
+    t1 = im[4];
+    t2 = re[4];
+    t7 = t11 + t1;
+    t0 = t10 + t2;
+    t3 = t4 + t9;
+    t13 = t6 + t8;
+    t12 = t11 - t1;
+    t11 = t10 - t2;
+    t1 = t4 - t9;
+    t10 = t6 - t8;
+    t2 = t7 + t3;
+    t4 = t0 + t13;
+    t9 = t7 - t3;
+    t6 = C42 * t9;
+    t8 = t0 - t13;
+    t7 = C42 * t8;
+    t3 = C43 * t2;
+    t9 = t5 - t3;
+    t0 = C43 * t4;
+    t13 = t14 - t0;
+    t8 = t9 + t6;
+    t3 = t13 + t7;
+    t0 = t9 - t6;
+    t9 = t13 - t7;
+    t6 = C44 * t12;
+    t13 = C45 * t1;
+    t7 = t6 + t13;
+    t6 = C44 * t11;
+    t13 = C45 * t10;
+    t6 = t6 + t13;
+    t13 = C45 * t12;
+    t12 = C44 * t1;
+    t1 = t13 - t12;
+    t13 = C45 * t11;
+    t12 = C44 * t10;
+    t11 = t13 - t12;
+    t10 = t5 + t2;
+    t13 = t14 + t4;
+    t12 = t8 + t6;
+    t5 = t3 - t7;
+    t2 = t0 + t11;
+    t14 = t9 - t1;
+    t4 = t0 - t11;
+    t0 = t9 + t1;
+    t11 = t8 - t6;
+    t9 = t3 + t7;
+    im[20] = t10;
+    re[20] = t13;
+    im[36] = t12;
+    re[36] = t5;
+    im[52] = t2;
+    re[52] = t14;
+    im[68] = t4;
+    re[68] = t0;
+    im[4] = t11;
+    re[4] = t9;
+    t1 = im[25];
+    t8 = re[25];
+    t6 = im[41];
+    t3 = re[41];
+    t7 = im[57];
+    t10 = re[57];
+    t13 = im[73];
+    t12 = re[73];
+    t5 = im[9];
+    t2 = re[9];
+    t14 = t6 + t5;
+    t4 = t3 + t2;
+    t0 = t7 + t13;
+    t11 = t10 + t12;
+    t9 = t6 - t5;
+    t6 = t3 - t2;
+    t5 = t7 - t13;
+    t3 = t10 - t12;
+    t2 = t14 + t0;
+    t7 = t4 + t11;
+    t13 = t14 - t0;
+    t10 = C42 * t13;
+    t12 = t4 - t11;
+    t14 = C42 * t12;
+    t0 = C43 * t2;
+    t13 = t1 - t0;
+    t4 = C43 * t7;
+    t11 = t8 - t4;
+    t12 = t13 + t10;
+    t0 = t11 + t14;
+    t4 = t13 - t10;
+    t13 = t11 - t14;
+    t10 = C44 * t9;
+    t11 = C45 * t5;
+    t14 = t10 + t11;
+    t10 = C44 * t6;
+    t11 = C45 * t3;
+    t10 = t10 + t11;
+    t11 = C45 * t9;
+    t9 = C44 * t5;
+    t5 = t11 - t9;
+    t11 = C45 * t6;
+    t9 = C44 * t3;
+    t6 = t11 - t9;
+    t3 = t1 + t2;
+    t11 = t8 + t7;
+    t9 = t12 + t10;
+    t1 = t0 - t14;
+    t2 = t4 + t6;
+    t8 = t13 - t5;
+    t7 = t4 - t6;
+    t4 = t13 + t5;
+    t6 = t12 - t10;
+    t13 = t0 + t14;
+    im[25] = t3;
+    re[25] = t11;
+    im[41] = t9;
+    re[41] = t1;
+    im[57] = t2;
+    re[57] = t8;
+    im[73] = t7;
+    re[73] = t4;
+    im[9] = t6;
+    re[9] = t13;
+    t5 = im[30];
+    t12 = re[30];
+    t10 = im[46];
+    t0 = re[46];
+    t14 = im[62];
+    t3 = re[62];
+    t11 = im[78];
+    t9 = re[78];
+    t1 = im[14];
+    t2 = re[14];
+    t8 = t10 + t1;
+    t7 = t0 + t2;
+    t4 = t14 + t11;
+    t6 = t3 + t9;
+    t13 = t10 - t1;
+    t10 = t0 - t2;
+    t1 = t14 - t11;
+    t0 = t3 - t9;
+    t2 = t8 + t4;
+    t14 = t7 + t6;
+    t11 = t8 - t4;
+    t3 = C42 * t11;
+    t9 = t7 - t6;
+    t8 = C42 * t9;
+    t4 = C43 * t2;
+    t11 = t5 - t4;
+    t7 = C43 * t14;
+    t6 = t12 - t7;
+    t9 = t11 + t3;
+    t4 = t6 + t8;
+    t7 = t11 - t3;
+    t11 = t6 - t8;
+    t3 = C44 * t13;
+    t6 = C45 * t1;
+    t8 = t3 + t6;
+    t3 = C44 * t10;
+    t6 = C45 * t0;
+    t3 = t3 + t6;
+    t6 = C45 * t13;
+    t13 = C44 * t1;
+    t1 = t6 - t13;
+    t6 = C45 * t10;
+    t13 = C44 * t0;
+    t10 = t6 - t13;
+    t0 = t5 + t2;
+    t6 = t12 + t14;
+    t13 = t9 + t3;
+    t5 = t4 - t8;
+    t2 = t7 + t10;
+    t12 = t11 - t1;
+    t14 = t7 - t10;
+    t7 = t11 + t1;
+    t10 = t9 - t3;
+    t11 = t4 + t8;
+    im[30] = t0;
+    re[30] = t6;
+    im[46] = t13;
+    re[46] = t5;
+    im[62] = t2;
+    re[62] = t12;
+    im[78] = t14;
+    re[78] = t7;
+    im[14] = t10;
+    re[14] = t11;
+    t1 = im[35];
+    t9 = re[35];
+    t3 = im[51];
+    t4 = re[51];
+    t8 = im[67];
+    t0 = re[67];
+    t6 = im[3];
+    t13 = re[3];
+    t5 = im[19];
+    t2 = re[19];
+    t12 = t3 + t5;
+    t14 = t4 + t2;
+    t7 = t8 + t6;
+    t10 = t0 + t13;
+    t11 = t3 - t5;
+    t3 = t4 - t2;
+    t5 = t8 - t6;
+    t4 = t0 - t13;
+    t2 = t12 + t7;
+    t8 = t14 + t10;
+    t6 = t12 - t7;
+    t0 = C42 * t6;
+    t13 = t14 - t10;
+    t12 = C42 * t13;
+    t7 = C43 * t2;
+    t6 = t1 - t7;
+    t14 = C43 * t8;
+    t10 = t9 - t14;
+    t13 = t6 + t0;
+    t7 = t10 + t12;
+    t14 = t6 - t0;
+    t6 = t10 - t12;
+    t0 = C44 * t11;
+    t10 = C45 * t5;
+    t12 = t0 + t10;
+    t0 = C44 * t3;
+    t10 = C45 * t4;
+    t0 = t0 + t10;
+    t10 = C45 * t11;
+    t11 = C44 * t5;
+    t5 = t10 - t11;
+    t10 = C45 * t3;
+    t11 = C44 * t4;
+    t3 = t10 - t11;
+    t4 = t1 + t2;
+    t10 = t9 + t8;
+    t11 = t13 + t0;
+    t1 = t7 - t12;
+    t2 = t14 + t3;
+    t9 = t6 - t5;
+    t8 = t14 - t3;
+    t14 = t6 + t5;
+    t3 = t13 - t0;
+    t6 = t7 + t12;
+    im[35] = t4;
+    re[35] = t10;
+    im[51] = t11;
+    re[51] = t1;
+    im[67] = t2;
+    re[67] = t9;
+    im[3] = t8;
+    re[3] = t14;
+    im[19] = t3;
+    re[19] = t6;
+    t5 = im[40];
+    t13 = re[40];
+    t0 = im[56];
+    t7 = re[56];
+    t12 = im[72];
+    t4 = re[72];
+    t10 = im[8];
+    t11 = re[8];
+    t1 = im[24];
+    t2 = re[24];
+    t9 = t0 + t1;
+    t8 = t7 + t2;
+    t14 = t12 + t10;
+    t3 = t4 + t11;
+    t6 = t0 - t1;
+    t0 = t7 - t2;
+    t1 = t12 - t10;
+    t7 = t4 - t11;
+    t2 = t9 + t14;
+    t12 = t8 + t3;
+    t10 = t9 - t14;
+    t4 = C42 * t10;
+    t11 = t8 - t3;
+    t9 = C42 * t11;
+    t14 = C43 * t2;
+    t10 = t5 - t14;
+    t8 = C43 * t12;
+    t3 = t13 - t8;
+    t11 = t10 + t4;
+    t14 = t3 + t9;
+    t8 = t10 - t4;
+    t10 = t3 - t9;
+    t4 = C44 * t6;
+    t3 = C45 * t1;
+    t9 = t4 + t3;
+    t4 = C44 * t0;
+    t3 = C45 * t7;
+    t4 = t4 + t3;
+    t3 = C45 * t6;
+    t6 = C44 * t1;
+    t1 = t3 - t6;
+    t3 = C45 * t0;
+    t6 = C44 * t7;
+    t0 = t3 - t6;
+    t7 = t5 + t2;
+    t3 = t13 + t12;
+    t6 = t11 + t4;
+    t5 = t14 - t9;
+    t2 = t8 + t0;
+    t13 = t10 - t1;
+    t12 = t8 - t0;
+    t8 = t10 + t1;
+    t0 = t11 - t4;
+    t10 = t14 + t9;
+    im[40] = t7;
+    re[40] = t3;
+    im[56] = t6;
+    re[56] = t5;
+    im[72] = t2;
+    re[72] = t13;
+    im[8] = t12;
+    re[8] = t8;
+    im[24] = t0;
+    re[24] = t10;
+    t1 = im[45];
+    t11 = re[45];
+    t4 = im[61];
+    t14 = re[61];
+    t9 = im[77];
+    t7 = re[77];
+    t3 = im[13];
+    t6 = re[13];
+    t5 = im[29];
+    t2 = re[29];
+    t13 = t4 + t5;
+    t12 = t14 + t2;
+    t8 = t9 + t3;
+    t0 = t7 + t6;
+    t10 = t4 - t5;
+    t4 = t14 - t2;
+    t5 = t9 - t3;
+    t14 = t7 - t6;
+    t2 = t13 + t8;
+    t9 = t12 + t0;
+    t3 = t13 - t8;
+    t7 = C42 * t3;
+    t6 = t12 - t0;
+    t13 = C42 * t6;
+    t8 = C43 * t2;
+    t3 = t1 - t8;
+    t12 = C43 * t9;
+    t0 = t11 - t12;
+    t6 = t3 + t7;
+    t8 = t0 + t13;
+    t12 = t3 - t7;
+    t3 = t0 - t13;
+    t7 = C44 * t10;
+    t0 = C45 * t5;
+    t13 = t7 + t0;
+    t7 = C44 * t4;
+    t0 = C45 * t14;
+    t7 = t7 + t0;
+    t0 = C45 * t10;
+    t10 = C44 * t5;
+    t5 = t0 - t10;
+    t0 = C45 * t4;
+    t10 = C44 * t14;
+    t4 = t0 - t10;
+    t14 = t1 + t2;
+    t0 = t11 + t9;
+    t10 = t6 + t7;
+    t1 = t8 - t13;
+    t2 = t12 + t4;
+    t11 = t3 - t5;
+    t9 = t12 - t4;
+    t12 = t3 + t5;
+    t4 = t6 - t7;
+    t3 = t8 + t13;
+    im[45] = t14;
+    re[45] = t0;
+    im[61] = t10;
+    re[61] = t1;
+    im[77] = t2;
+    re[77] = t11;
+    im[13] = t9;
+    re[13] = t12;
+    im[29] = t4;
+    re[29] = t3;
+    t5 = im[50];
+    t6 = re[50];
+    t7 = im[66];
+    t8 = re[66];
+    t13 = im[2];
+    t14 = re[2];
+    t0 = im[18];
+    t10 = re[18];
+    t1 = im[34];
+    t2 = re[34];
+    t11 = t7 + t1;
+    t9 = t8 + t2;
+    t12 = t13 + t0;
+    t4 = t14 + t10;
+    t3 = t7 - t1;
+    t7 = t8 - t2;
+    t1 = t13 - t0;
+    t8 = t14 - t10;
+    t2 = t11 + t12;
+    t13 = t9 + t4;
+    t0 = t11 - t12;
+    t14 = C42 * t0;
+    t10 = t9 - t4;
+    t11 = C42 * t10;
+    t12 = C43 * t2;
+    t0 = t5 - t12;
+    t9 = C43 * t13;
+    t4 = t6 - t9;
+    t10 = t0 + t14;
+    t12 = t4 + t11;
+    t9 = t0 - t14;
+    t0 = t4 - t11;
+    t14 = C44 * t3;
+    t4 = C45 * t1;
+    t11 = t14 + t4;
+    t14 = C44 * t7;
+    t4 = C45 * t8;
+    t14 = t14 + t4;
+    t4 = C45 * t3;
+    t3 = C44 * t1;
+    t1 = t4 - t3;
+    t4 = C45 * t7;
+    t3 = C44 * t8;
+    t7 = t4 - t3;
+    t8 = t5 + t2;
+    t4 = t6 + t13;
+    t3 = t10 + t14;
+    t5 = t12 - t11;
+    t2 = t9 + t7;
+    t6 = t0 - t1;
+    t13 = t9 - t7;
+    t9 = t0 + t1;
+    t7 = t10 - t14;
+    t0 = t12 + t11;
+    im[50] = t8;
+    re[50] = t4;
+    im[66] = t3;
+    re[66] = t5;
+    im[2] = t2;
+    re[2] = t6;
+    im[18] = t13;
+    re[18] = t9;
+    im[34] = t7;
+    re[34] = t0;
+    t1 = im[55];
+    t10 = re[55];
+    t14 = im[71];
+    t12 = re[71];
+    t11 = im[7];
+    t8 = re[7];
+    t4 = im[23];
+    t3 = re[23];
+    t5 = im[39];
+    t2 = re[39];
+    t6 = t14 + t5;
+    t13 = t12 + t2;
+    t9 = t11 + t4;
+    t7 = t8 + t3;
+    t0 = t14 - t5;
+    t14 = t12 - t2;
+    t5 = t11 - t4;
+    t12 = t8 - t3;
+    t2 = t6 + t9;
+    t11 = t13 + t7;
+    t4 = t6 - t9;
+    t8 = C42 * t4;
+    t3 = t13 - t7;
+    t6 = C42 * t3;
+    t9 = C43 * t2;
+    t4 = t1 - t9;
+    t13 = C43 * t11;
+    t7 = t10 - t13;
+    t3 = t4 + t8;
+    t9 = t7 + t6;
+    t13 = t4 - t8;
+    t4 = t7 - t6;
+    t8 = C44 * t0;
+    t7 = C45 * t5;
+    t6 = t8 + t7;
+    t8 = C44 * t14;
+    t7 = C45 * t12;
+    t8 = t8 + t7;
+    t7 = C45 * t0;
+    t0 = C44 * t5;
+    t5 = t7 - t0;
+    t7 = C45 * t14;
+    t0 = C44 * t12;
+    t14 = t7 - t0;
+    t12 = t1 + t2;
+    t7 = t10 + t11;
+    t0 = t3 + t8;
+    t1 = t9 - t6;
+    t2 = t13 + t14;
+    t10 = t4 - t5;
+    t11 = t13 - t14;
+    t13 = t4 + t5;
+    t14 = t3 - t8;
+    t4 = t9 + t6;
+    im[55] = t12;
+    re[55] = t7;
+    im[71] = t0;
+    re[71] = t1;
+    im[7] = t2;
+    re[7] = t10;
+    im[23] = t11;
+    re[23] = t13;
+    im[39] = t14;
+    re[39] = t4;
+    t5 = im[60];
+    t3 = re[60];
+    t8 = im[76];
+    t9 = re[76];
+    t6 = im[12];
+    t12 = re[12];
+    t7 = im[28];
+    t0 = re[28];
+    t1 = im[44];
+    t2 = re[44];
+    t10 = t8 + t1;
+    t11 = t9 + t2;
+    t13 = t6 + t7;
+    t14 = t12 + t0;
+    t4 = t8 - t1;
+    t8 = t9 - t2;
+    t1 = t6 - t7;
+    t9 = t12 - t0;
+    t2 = t10 + t13;
+    t6 = t11 + t14;
+    t7 = t10 - t13;
+    t12 = C42 * t7;
+    t0 = t11 - t14;
+    t10 = C42 * t0;
+    t13 = C43 * t2;
+    t7 = t5 - t13;
+    t11 = C43 * t6;
+    t14 = t3 - t11;
+    t0 = t7 + t12;
+    t13 = t14 + t10;
+    t11 = t7 - t12;
+    t7 = t14 - t10;
+    t12 = C44 * t4;
+    t14 = C45 * t1;
+    t10 = t12 + t14;
+    t12 = C44 * t8;
+    t14 = C45 * t9;
+    t12 = t12 + t14;
+    t14 = C45 * t4;
+    t4 = C44 * t1;
+    t1 = t14 - t4;
+    t14 = C45 * t8;
+    t4 = C44 * t9;
+    t8 = t14 - t4;
+    t9 = t5 + t2;
+    t14 = t3 + t6;
+    t4 = t0 + t12;
+    t5 = t13 - t10;
+    t2 = t11 + t8;
+    t3 = t7 - t1;
+    t6 = t11 - t8;
+    t11 = t7 + t1;
+    t8 = t0 - t12;
+    t7 = t13 + t10;
+    im[60] = t9;
+    re[60] = t14;
+    im[76] = t4;
+    re[76] = t5;
+    im[12] = t2;
+    re[12] = t3;
+    im[28] = t6;
+    re[28] = t11;
+    im[44] = t8;
+    re[44] = t7;
+    t1 = im[65];
+    t0 = re[65];
+    t12 = im[1];
+    t13 = re[1];
+    t10 = im[17];
+    t9 = re[17];
+    t14 = im[33];
+    t4 = re[33];
+    t5 = im[49];
+    t2 = re[49];
+    t3 = t12 + t5;
+    t6 = t13 + t2;
+    t11 = t10 + t14;
+    t8 = t9 + t4;
+    t7 = t12 - t5;
+    t12 = t13 - t2;
+    t5 = t10 - t14;
+    t13 = t9 - t4;
+    t2 = t3 + t11;
+    t10 = t6 + t8;
+    t14 = t3 - t11;
+    t9 = C42 * t14;
+    t4 = t6 - t8;
+    t3 = C42 * t4;
+    t11 = C43 * t2;
+    t14 = t1 - t11;
+    t6 = C43 * t10;
+    t8 = t0 - t6;
+    t4 = t14 + t9;
+    t11 = t8 + t3;
+    t6 = t14 - t9;
+    t14 = t8 - t3;
+    t9 = C44 * t7;
+    t8 = C45 * t5;
+    t3 = t9 + t8;
+    t9 = C44 * t12;
+    t8 = C45 * t13;
+    t9 = t9 + t8;
+    t8 = C45 * t7;
+    t7 = C44 * t5;
+    t5 = t8 - t7;
+    t8 = C45 * t12;
+    t7 = C44 * t13;
+    t12 = t8 - t7;
+    t13 = t1 + t2;
+    t8 = t0 + t10;
+    t7 = t4 + t9;
+    t1 = t11 - t3;
+    t2 = t6 + t12;
+    t0 = t14 - t5;
+    t10 = t6 - t12;
+    t6 = t14 + t5;
+    t12 = t4 - t9;
+    t14 = t11 + t3;
+    im[65] = t13;
+    re[65] = t8;
+    im[1] = t7;
+    re[1] = t1;
+    im[17] = t2;
+    re[17] = t0;
+    im[33] = t10;
+    re[33] = t6;
+    im[49] = t12;
+    re[49] = t14;
+    t5 = im[70];
+    t4 = re[70];
+    t9 = im[6];
+    t11 = re[6];
+    t3 = im[22];
+    t13 = re[22];
+    t8 = im[38];
+    t7 = re[38];
+    t1 = im[54];
+    t2 = re[54];
+    t0 = t9 + t1;
+    t10 = t11 + t2;
+    t6 = t3 + t8;
+    t12 = t13 + t7;
+    t14 = t9 - t1;
+    t9 = t11 - t2;
+    t1 = t3 - t8;
+    t11 = t13 - t7;
+    t2 = t0 + t6;
+    t3 = t10 + t12;
+    t8 = t0 - t6;
+    t13 = C42 * t8;
+    t7 = t10 - t12;
+    t0 = C42 * t7;
+    t6 = C43 * t2;
+    t8 = t5 - t6;
+    t10 = C43 * t3;
+    t12 = t4 - t10;
+    t7 = t8 + t13;
+    t6 = t12 + t0;
+    t10 = t8 - t13;
+    t8 = t12 - t0;
+    t13 = C44 * t14;
+    t12 = C45 * t1;
+    t0 = t13 + t12;
+    t13 = C44 * t9;
+    t12 = C45 * t11;
+    t13 = t13 + t12;
+    t12 = C45 * t14;
+    t14 = C44 * t1;
+    t1 = t12 - t14;
+    t12 = C45 * t9;
+    t14 = C44 * t11;
+    t9 = t12 - t14;
+    t11 = t5 + t2;
+    t12 = t4 + t3;
+    t14 = t7 + t13;
+    t5 = t6 - t0;
+    t2 = t10 + t9;
+    t4 = t8 - t1;
+    t3 = t10 - t9;
+    t10 = t8 + t1;
+    t9 = t7 - t13;
+    t8 = t6 + t0;
+    im[70] = t11;
+    re[70] = t12;
+    im[6] = t14;
+    re[6] = t5;
+    im[22] = t2;
+    re[22] = t4;
+    im[38] = t3;
+    re[38] = t10;
+    im[54] = t9;
+    re[54] = t8;
+    t1 = im[75];
+    t7 = re[75];
+    t13 = im[11];
+    t6 = re[11];
+    t0 = im[27];
+    t11 = re[27];
+    t12 = im[43];
+    t14 = re[43];
+    t5 = im[59];
+    t2 = re[59];
+    t4 = t13 + t5;
+    t3 = t6 + t2;
+    t10 = t0 + t12;
+    t9 = t11 + t14;
+    t8 = t13 - t5;
+    t13 = t6 - t2;
+    t5 = t0 - t12;
+    t6 = t11 - t14;
+    t2 = t4 + t10;
+    t0 = t3 + t9;
+    t12 = t4 - t10;
+    t11 = C42 * t12;
+    t14 = t3 - t9;
+    t4 = C42 * t14;
+    t10 = C43 * t2;
+    t12 = t1 - t10;
+    t3 = C43 * t0;
+    t9 = t7 - t3;
+    t14 = t12 + t11;
+    t10 = t9 + t4;
+    t3 = t12 - t11;
+    t12 = t9 - t4;
+    t11 = C44 * t8;
+    t9 = C45 * t5;
+    t4 = t11 + t9;
+    t11 = C44 * t13;
+    t9 = C45 * t6;
+    t11 = t11 + t9;
+    t9 = C45 * t8;
+    t8 = C44 * t5;
+    t5 = t9 - t8;
+    t9 = C45 * t13;
+    t8 = C44 * t6;
+    t13 = t9 - t8;
+    t6 = t1 + t2;
+    t9 = t7 + t0;
+    t8 = t14 + t11;
+    t1 = t10 - t4;
+    t2 = t3 + t13;
+    t7 = t12 - t5;
+    t0 = t3 - t13;
+    t3 = t12 + t5;
+    t13 = t14 - t11;
+    t12 = t10 + t4;
+    im[75] = t6;
+    re[75] = t9;
+    im[11] = t8;
+    re[11] = t1;
+    im[27] = t2;
+    re[27] = t7;
+    im[43] = t0;
+    re[43] = t3;
+    im[59] = t13;
+    re[59] = t12;
+}
+
+/**
+ *  Part 2 of ApplyMixedRadixIRFFT_160().
+ * 
+ *  @param {Number[]} re 
+ *    - The real part of each input point.
+ *  @param {Number[]} im 
+ *    - The imaginary part of each input point.
+ *  @param {Number[]} x 
+ *    - The real output points.
+ */
+function ApplyMixedRadixIRFFT_160_Part2(re, im, x) {
+    let t0, t1, t10, t11, t12, t13, t14, t2, t3, t4, t5, t6, t7, t8, t9;
+    const C0 = 0.9238795325112867;
+    const C1 = 0.3826834323650898;
+    const C2 = 0.7071067811865476;
+    t5 = im[0];
+    t14 = re[0];
+    t11 = im[20];
+    t10 = re[20];
+    t4 = im[40];
+    t6 = re[40];
+    t9 = im[60];
+    t8 = re[60];
+    t1 = t5 + t4;
+    t2 = t14 + t6;
+    t7 = t11 + t9;
+    t0 = t10 + t8;
+    t3 = t5 - t4;
+    t13 = t14 - t6;
+    t12 = t11 - t9;
+    t5 = t10 - t8;
+    t4 = t1 + t7;
+    t14 = t2 + t0;
+    t6 = t3 + t5;
+    t11 = t13 - t12;
+    t9 = t1 - t7;
+    t10 = t2 - t0;
+    t8 = t3 - t5;
+    t1 = t13 + t12;
+    im[0] = t4;
+    re[0] = t14;
+    im[20] = t6;
+    re[20] = t11;
+    im[40] = t9;
+    re[40] = t10;
+    im[60] = t8;
+    re[60] = t1;
+    t7 = im[5];
+    t2 = re[5];
+    t0 = im[25];
+    t3 = re[25];
+    t5 = im[45];
+    t13 = re[45];
+    t12 = im[65];
+    t4 = re[65];
+    t14 = t7 + t5;
+    t6 = t2 + t13;
+    t11 = t0 + t12;
+    t9 = t3 + t4;
+    t10 = t7 - t5;
+    t8 = t2 - t13;
+    t1 = t0 - t12;
+    t7 = t3 - t4;
+    t5 = t14 + t11;
+    t2 = t6 + t9;
+    t13 = t10 + t7;
+    t0 = t8 - t1;
+    t12 = t14 - t11;
+    t3 = t6 - t9;
+    t4 = t10 - t7;
+    t14 = t8 + t1;
+    t11 = C0 * t13;
+    t6 = (-C1) * t0;
+    t9 = C0 * t0;
+    t10 = (-C1) * t13;
+    t7 = t11 - t6;
+    t8 = t9 + t10;
+    t1 = t12 + t3;
+    t0 = t12 - t3;
+    t13 = C2 * t1;
+    t11 = (-C2) * t0;
+    t6 = C1 * t4;
+    t9 = (-C0) * t14;
+    t10 = C1 * t14;
+    t12 = (-C0) * t4;
+    t3 = t6 - t9;
+    t1 = t10 + t12;
+    im[5] = t5;
+    re[5] = t2;
+    im[25] = t7;
+    re[25] = t8;
+    im[45] = t13;
+    re[45] = t11;
+    im[65] = t3;
+    re[65] = t1;
+    t0 = im[10];
+    t14 = re[10];
+    t4 = im[30];
+    t6 = re[30];
+    t9 = im[50];
+    t10 = re[50];
+    t12 = im[70];
+    t5 = re[70];
+    t2 = t0 + t9;
+    t7 = t14 + t10;
+    t8 = t4 + t12;
+    t13 = t6 + t5;
+    t11 = t0 - t9;
+    t3 = t14 - t10;
+    t1 = t4 - t12;
+    t0 = t6 - t5;
+    t9 = t2 + t8;
+    t14 = t7 + t13;
+    t10 = t11 + t0;
+    t4 = t3 - t1;
+    t12 = t2 - t8;
+    t6 = t7 - t13;
+    t5 = t11 - t0;
+    t2 = t3 + t1;
+    t8 = t10 + t4;
+    t7 = t10 - t4;
+    t13 = C2 * t8;
+    t11 = (-C2) * t7;
+    t0 = -t12;
+    t3 = t5 - t2;
+    t1 = t5 + t2;
+    t10 = (-C2) * t3;
+    t4 = (-C2) * t1;
+    im[10] = t9;
+    re[10] = t14;
+    im[30] = t13;
+    re[30] = t11;
+    im[50] = t6;
+    re[50] = t0;
+    im[70] = t10;
+    re[70] = t4;
+    t8 = im[15];
+    t7 = re[15];
+    t12 = im[35];
+    t5 = re[35];
+    t2 = im[55];
+    t3 = re[55];
+    t1 = im[75];
+    t9 = re[75];
+    t14 = t8 + t2;
+    t13 = t7 + t3;
+    t11 = t12 + t1;
+    t6 = t5 + t9;
+    t0 = t8 - t2;
+    t10 = t7 - t3;
+    t4 = t12 - t1;
+    t8 = t5 - t9;
+    t2 = t14 + t11;
+    t7 = t13 + t6;
+    t3 = t0 + t8;
+    t12 = t10 - t4;
+    t1 = t14 - t11;
+    t5 = t13 - t6;
+    t9 = t0 - t8;
+    t14 = t10 + t4;
+    t11 = C1 * t3;
+    t13 = (-C0) * t12;
+    t6 = C1 * t12;
+    t0 = (-C0) * t3;
+    t8 = t11 - t13;
+    t10 = t6 + t0;
+    t4 = t1 - t5;
+    t12 = t1 + t5;
+    t3 = (-C2) * t4;
+    t11 = (-C2) * t12;
+    t13 = (-C0) * t9;
+    t6 = C1 * t14;
+    t0 = (-C0) * t14;
+    t1 = C1 * t9;
+    t5 = t13 - t6;
+    t4 = t0 + t1;
+    im[15] = t2;
+    re[15] = t7;
+    im[35] = t8;
+    re[35] = t10;
+    im[55] = t3;
+    re[55] = t11;
+    im[75] = t5;
+    re[75] = t4;
+    t12 = im[0];
+    t14 = re[0];
+    t9 = im[5];
+    t13 = re[5];
+    t6 = im[10];
+    t0 = re[10];
+    t1 = im[15];
+    t2 = re[15];
+    t7 = t12 + t6;
+    t8 = t14 + t0;
+    t10 = t9 + t1;
+    t3 = t13 + t2;
+    t11 = t12 - t6;
+    t5 = t14 - t0;
+    t4 = t9 - t1;
+    t12 = t13 - t2;
+    t6 = t7 + t10;
+    t14 = t8 + t3;
+    t0 = t11 + t12;
+    t9 = t5 - t4;
+    t1 = t7 - t10;
+    t13 = t8 - t3;
+    t2 = t11 - t12;
+    t7 = t5 + t4;
+    x[1] = t6;
+    x[0] = t14;
+    x[41] = t0;
+    x[40] = t9;
+    x[81] = t1;
+    x[80] = t13;
+    x[121] = t2;
+    x[120] = t7;
+    t10 = im[20];
+    t8 = re[20];
+    t3 = im[25];
+    t11 = re[25];
+    t12 = im[30];
+    t5 = re[30];
+    t4 = im[35];
+    t6 = re[35];
+    t14 = t10 + t12;
+    t0 = t8 + t5;
+    t9 = t3 + t4;
+    t1 = t11 + t6;
+    t13 = t10 - t12;
+    t2 = t8 - t5;
+    t7 = t3 - t4;
+    t10 = t11 - t6;
+    t12 = t14 + t9;
+    t8 = t0 + t1;
+    t5 = t13 + t10;
+    t3 = t2 - t7;
+    t4 = t14 - t9;
+    t11 = t0 - t1;
+    t6 = t13 - t10;
+    t14 = t2 + t7;
+    x[131] = t12;
+    x[130] = t8;
+    x[11] = t5;
+    x[10] = t3;
+    x[51] = t4;
+    x[50] = t11;
+    x[91] = t6;
+    x[90] = t14;
+    t9 = im[40];
+    t0 = re[40];
+    t1 = im[45];
+    t13 = re[45];
+    t10 = im[50];
+    t2 = re[50];
+    t7 = im[55];
+    t12 = re[55];
+    t8 = t9 + t10;
+    t5 = t0 + t2;
+    t3 = t1 + t7;
+    t4 = t13 + t12;
+    t11 = t9 - t10;
+    t6 = t0 - t2;
+    t14 = t1 - t7;
+    t9 = t13 - t12;
+    t10 = t8 + t3;
+    t0 = t5 + t4;
+    t2 = t11 + t9;
+    t1 = t6 - t14;
+    t7 = t8 - t3;
+    t13 = t5 - t4;
+    t12 = t11 - t9;
+    t8 = t6 + t14;
+    x[101] = t10;
+    x[100] = t0;
+    x[141] = t2;
+    x[140] = t1;
+    x[21] = t7;
+    x[20] = t13;
+    x[61] = t12;
+    x[60] = t8;
+    t3 = im[60];
+    t5 = re[60];
+    t4 = im[65];
+    t11 = re[65];
+    t9 = im[70];
+    t6 = re[70];
+    t14 = im[75];
+    t10 = re[75];
+    t0 = t3 + t9;
+    t2 = t5 + t6;
+    t1 = t4 + t14;
+    t7 = t11 + t10;
+    t13 = t3 - t9;
+    t12 = t5 - t6;
+    t8 = t4 - t14;
+    t3 = t11 - t10;
+    t9 = t0 + t1;
+    t5 = t2 + t7;
+    t6 = t13 + t3;
+    t4 = t12 - t8;
+    t14 = t0 - t1;
+    t11 = t2 - t7;
+    t10 = t13 - t3;
+    t0 = t12 + t8;
+    x[71] = t9;
+    x[70] = t5;
+    x[111] = t6;
+    x[110] = t4;
+    x[151] = t14;
+    x[150] = t11;
+    x[31] = t10;
+    x[30] = t0;
+    t1 = im[16];
+    t2 = re[16];
+    t7 = im[36];
+    t13 = re[36];
+    t3 = im[56];
+    t12 = re[56];
+    t8 = im[76];
+    t9 = re[76];
+    t5 = t1 + t3;
+    t6 = t2 + t12;
+    t4 = t7 + t8;
+    t14 = t13 + t9;
+    t11 = t1 - t3;
+    t10 = t2 - t12;
+    t0 = t7 - t8;
+    t1 = t13 - t9;
+    t3 = t5 + t4;
+    t2 = t6 + t14;
+    t12 = t11 + t1;
+    t7 = t10 - t0;
+    t8 = t5 - t4;
+    t13 = t6 - t14;
+    t9 = t11 - t1;
+    t5 = t10 + t0;
+    im[16] = t3;
+    re[16] = t2;
+    im[36] = t12;
+    re[36] = t7;
+    im[56] = t8;
+    re[56] = t13;
+    im[76] = t9;
+    re[76] = t5;
+    t4 = im[21];
+    t6 = re[21];
+    t14 = im[41];
+    t11 = re[41];
+    t1 = im[61];
+    t10 = re[61];
+    t0 = im[1];
+    t3 = re[1];
+    t2 = t4 + t1;
+    t12 = t6 + t10;
+    t7 = t14 + t0;
+    t8 = t11 + t3;
+    t13 = t4 - t1;
+    t9 = t6 - t10;
+    t5 = t14 - t0;
+    t4 = t11 - t3;
+    t1 = t2 + t7;
+    t6 = t12 + t8;
+    t10 = t13 + t4;
+    t14 = t9 - t5;
+    t0 = t2 - t7;
+    t11 = t12 - t8;
+    t3 = t13 - t4;
+    t2 = t9 + t5;
+    t7 = C0 * t10;
+    t12 = (-C1) * t14;
+    t8 = C0 * t14;
+    t13 = (-C1) * t10;
+    t4 = t7 - t12;
+    t9 = t8 + t13;
+    t5 = t0 + t11;
+    t14 = t0 - t11;
+    t10 = C2 * t5;
+    t7 = (-C2) * t14;
+    t12 = C1 * t3;
+    t8 = (-C0) * t2;
+    t13 = C1 * t2;
+    t0 = (-C0) * t3;
+    t11 = t12 - t8;
+    t5 = t13 + t0;
+    im[21] = t1;
+    re[21] = t6;
+    im[41] = t4;
+    re[41] = t9;
+    im[61] = t10;
+    re[61] = t7;
+    im[1] = t11;
+    re[1] = t5;
+    t14 = im[26];
+    t2 = re[26];
+    t3 = im[46];
+    t12 = re[46];
+    t8 = im[66];
+    t13 = re[66];
+    t0 = im[6];
+    t1 = re[6];
+    t6 = t14 + t8;
+    t4 = t2 + t13;
+    t9 = t3 + t0;
+    t10 = t12 + t1;
+    t7 = t14 - t8;
+    t11 = t2 - t13;
+    t5 = t3 - t0;
+    t14 = t12 - t1;
+    t8 = t6 + t9;
+    t2 = t4 + t10;
+    t13 = t7 + t14;
+    t3 = t11 - t5;
+    t0 = t6 - t9;
+    t12 = t4 - t10;
+    t1 = t7 - t14;
+    t6 = t11 + t5;
+    t9 = t13 + t3;
+    t4 = t13 - t3;
+    t10 = C2 * t9;
+    t7 = (-C2) * t4;
+    t14 = -t0;
+    t11 = t1 - t6;
+    t5 = t1 + t6;
+    t13 = (-C2) * t11;
+    t3 = (-C2) * t5;
+    im[26] = t8;
+    re[26] = t2;
+    im[46] = t10;
+    re[46] = t7;
+    im[66] = t12;
+    re[66] = t14;
+    im[6] = t13;
+    re[6] = t3;
+    t9 = im[31];
+    t4 = re[31];
+    t0 = im[51];
+    t1 = re[51];
+    t6 = im[71];
+    t11 = re[71];
+    t5 = im[11];
+    t8 = re[11];
+    t2 = t9 + t6;
+    t10 = t4 + t11;
+    t7 = t0 + t5;
+    t12 = t1 + t8;
+    t14 = t9 - t6;
+    t13 = t4 - t11;
+    t3 = t0 - t5;
+    t9 = t1 - t8;
+    t6 = t2 + t7;
+    t4 = t10 + t12;
+    t11 = t14 + t9;
+    t0 = t13 - t3;
+    t5 = t2 - t7;
+    t1 = t10 - t12;
+    t8 = t14 - t9;
+    t2 = t13 + t3;
+    t7 = C1 * t11;
+    t10 = (-C0) * t0;
+    t12 = C1 * t0;
+    t14 = (-C0) * t11;
+    t9 = t7 - t10;
+    t13 = t12 + t14;
+    t3 = t5 - t1;
+    t0 = t5 + t1;
+    t11 = (-C2) * t3;
+    t7 = (-C2) * t0;
+    t10 = (-C0) * t8;
+    t12 = C1 * t2;
+    t14 = (-C0) * t2;
+    t5 = C1 * t8;
+    t1 = t10 - t12;
+    t3 = t14 + t5;
+    im[31] = t6;
+    re[31] = t4;
+    im[51] = t9;
+    re[51] = t13;
+    im[71] = t11;
+    re[71] = t7;
+    im[11] = t1;
+    re[11] = t3;
+    t0 = im[16];
+    t2 = re[16];
+    t8 = im[21];
+    t10 = re[21];
+    t12 = im[26];
+    t14 = re[26];
+    t5 = im[31];
+    t6 = re[31];
+    t4 = t0 + t12;
+    t9 = t2 + t14;
+    t13 = t8 + t5;
+    t11 = t10 + t6;
+    t7 = t0 - t12;
+    t1 = t2 - t14;
+    t3 = t8 - t5;
+    t0 = t10 - t6;
+    t12 = t4 + t13;
+    t2 = t9 + t11;
+    t14 = t7 + t0;
+    t8 = t1 - t3;
+    t5 = t4 - t13;
+    t10 = t9 - t11;
+    t6 = t7 - t0;
+    t4 = t1 + t3;
+    x[33] = t12;
+    x[32] = t2;
+    x[73] = t14;
+    x[72] = t8;
+    x[113] = t5;
+    x[112] = t10;
+    x[153] = t6;
+    x[152] = t4;
+    t13 = im[36];
+    t9 = re[36];
+    t11 = im[41];
+    t7 = re[41];
+    t0 = im[46];
+    t1 = re[46];
+    t3 = im[51];
+    t12 = re[51];
+    t2 = t13 + t0;
+    t14 = t9 + t1;
+    t8 = t11 + t3;
+    t5 = t7 + t12;
+    t10 = t13 - t0;
+    t6 = t9 - t1;
+    t4 = t11 - t3;
+    t13 = t7 - t12;
+    t0 = t2 + t8;
+    t9 = t14 + t5;
+    t1 = t10 + t13;
+    t11 = t6 - t4;
+    t3 = t2 - t8;
+    t7 = t14 - t5;
+    t12 = t10 - t13;
+    t2 = t6 + t4;
+    x[3] = t0;
+    x[2] = t9;
+    x[43] = t1;
+    x[42] = t11;
+    x[83] = t3;
+    x[82] = t7;
+    x[123] = t12;
+    x[122] = t2;
+    t8 = im[56];
+    t14 = re[56];
+    t5 = im[61];
+    t10 = re[61];
+    t13 = im[66];
+    t6 = re[66];
+    t4 = im[71];
+    t0 = re[71];
+    t9 = t8 + t13;
+    t1 = t14 + t6;
+    t11 = t5 + t4;
+    t3 = t10 + t0;
+    t7 = t8 - t13;
+    t12 = t14 - t6;
+    t2 = t5 - t4;
+    t8 = t10 - t0;
+    t13 = t9 + t11;
+    t14 = t1 + t3;
+    t6 = t7 + t8;
+    t5 = t12 - t2;
+    t4 = t9 - t11;
+    t10 = t1 - t3;
+    t0 = t7 - t8;
+    t9 = t12 + t2;
+    x[133] = t13;
+    x[132] = t14;
+    x[13] = t6;
+    x[12] = t5;
+    x[53] = t4;
+    x[52] = t10;
+    x[93] = t0;
+    x[92] = t9;
+    t11 = im[76];
+    t1 = re[76];
+    t3 = im[1];
+    t7 = re[1];
+    t8 = im[6];
+    t12 = re[6];
+    t2 = im[11];
+    t13 = re[11];
+    t14 = t11 + t8;
+    t6 = t1 + t12;
+    t5 = t3 + t2;
+    t4 = t7 + t13;
+    t10 = t11 - t8;
+    t0 = t1 - t12;
+    t9 = t3 - t2;
+    t11 = t7 - t13;
+    t8 = t14 + t5;
+    t1 = t6 + t4;
+    t12 = t10 + t11;
+    t3 = t0 - t9;
+    t2 = t14 - t5;
+    t7 = t6 - t4;
+    t13 = t10 - t11;
+    t14 = t0 + t9;
+    x[103] = t8;
+    x[102] = t1;
+    x[143] = t12;
+    x[142] = t3;
+    x[23] = t2;
+    x[22] = t7;
+    x[63] = t13;
+    x[62] = t14;
+    t5 = im[32];
+    t6 = re[32];
+    t4 = im[52];
+    t10 = re[52];
+    t11 = im[72];
+    t0 = re[72];
+    t9 = im[12];
+    t8 = re[12];
+    t1 = t5 + t11;
+    t12 = t6 + t0;
+    t3 = t4 + t9;
+    t2 = t10 + t8;
+    t7 = t5 - t11;
+    t13 = t6 - t0;
+    t14 = t4 - t9;
+    t5 = t10 - t8;
+    t11 = t1 + t3;
+    t6 = t12 + t2;
+    t0 = t7 + t5;
+    t4 = t13 - t14;
+    t9 = t1 - t3;
+    t10 = t12 - t2;
+    t8 = t7 - t5;
+    t1 = t13 + t14;
+    im[32] = t11;
+    re[32] = t6;
+    im[52] = t0;
+    re[52] = t4;
+    im[72] = t9;
+    re[72] = t10;
+    im[12] = t8;
+    re[12] = t1;
+    t3 = im[37];
+    t12 = re[37];
+    t2 = im[57];
+    t7 = re[57];
+    t5 = im[77];
+    t13 = re[77];
+    t14 = im[17];
+    t11 = re[17];
+    t6 = t3 + t5;
+    t0 = t12 + t13;
+    t4 = t2 + t14;
+    t9 = t7 + t11;
+    t10 = t3 - t5;
+    t8 = t12 - t13;
+    t1 = t2 - t14;
+    t3 = t7 - t11;
+    t5 = t6 + t4;
+    t12 = t0 + t9;
+    t13 = t10 + t3;
+    t2 = t8 - t1;
+    t14 = t6 - t4;
+    t7 = t0 - t9;
+    t11 = t10 - t3;
+    t6 = t8 + t1;
+    t4 = C0 * t13;
+    t0 = (-C1) * t2;
+    t9 = C0 * t2;
+    t10 = (-C1) * t13;
+    t3 = t4 - t0;
+    t8 = t9 + t10;
+    t1 = t14 + t7;
+    t2 = t14 - t7;
+    t13 = C2 * t1;
+    t4 = (-C2) * t2;
+    t0 = C1 * t11;
+    t9 = (-C0) * t6;
+    t10 = C1 * t6;
+    t14 = (-C0) * t11;
+    t7 = t0 - t9;
+    t1 = t10 + t14;
+    im[37] = t5;
+    re[37] = t12;
+    im[57] = t3;
+    re[57] = t8;
+    im[77] = t13;
+    re[77] = t4;
+    im[17] = t7;
+    re[17] = t1;
+    t2 = im[42];
+    t6 = re[42];
+    t11 = im[62];
+    t0 = re[62];
+    t9 = im[2];
+    t10 = re[2];
+    t14 = im[22];
+    t5 = re[22];
+    t12 = t2 + t9;
+    t3 = t6 + t10;
+    t8 = t11 + t14;
+    t13 = t0 + t5;
+    t4 = t2 - t9;
+    t7 = t6 - t10;
+    t1 = t11 - t14;
+    t2 = t0 - t5;
+    t9 = t12 + t8;
+    t6 = t3 + t13;
+    t10 = t4 + t2;
+    t11 = t7 - t1;
+    t14 = t12 - t8;
+    t0 = t3 - t13;
+    t5 = t4 - t2;
+    t12 = t7 + t1;
+    t8 = t10 + t11;
+    t3 = t10 - t11;
+    t13 = C2 * t8;
+    t4 = (-C2) * t3;
+    t2 = -t14;
+    t7 = t5 - t12;
+    t1 = t5 + t12;
+    t10 = (-C2) * t7;
+    t11 = (-C2) * t1;
+    im[42] = t9;
+    re[42] = t6;
+    im[62] = t13;
+    re[62] = t4;
+    im[2] = t0;
+    re[2] = t2;
+    im[22] = t10;
+    re[22] = t11;
+    t8 = im[47];
+    t3 = re[47];
+    t14 = im[67];
+    t5 = re[67];
+    t12 = im[7];
+    t7 = re[7];
+    t1 = im[27];
+    t9 = re[27];
+    t6 = t8 + t12;
+    t13 = t3 + t7;
+    t4 = t14 + t1;
+    t0 = t5 + t9;
+    t2 = t8 - t12;
+    t10 = t3 - t7;
+    t11 = t14 - t1;
+    t8 = t5 - t9;
+    t12 = t6 + t4;
+    t3 = t13 + t0;
+    t7 = t2 + t8;
+    t14 = t10 - t11;
+    t1 = t6 - t4;
+    t5 = t13 - t0;
+    t9 = t2 - t8;
+    t6 = t10 + t11;
+    t4 = C1 * t7;
+    t13 = (-C0) * t14;
+    t0 = C1 * t14;
+    t2 = (-C0) * t7;
+    t8 = t4 - t13;
+    t10 = t0 + t2;
+    t11 = t1 - t5;
+    t14 = t1 + t5;
+    t7 = (-C2) * t11;
+    t4 = (-C2) * t14;
+    t13 = (-C0) * t9;
+    t0 = C1 * t6;
+    t2 = (-C0) * t6;
+    t1 = C1 * t9;
+    t5 = t13 - t0;
+    t11 = t2 + t1;
+    im[47] = t12;
+    re[47] = t3;
+    im[67] = t8;
+    re[67] = t10;
+    im[7] = t7;
+    re[7] = t4;
+    im[27] = t5;
+    re[27] = t11;
+    t14 = im[32];
+    t6 = re[32];
+    t9 = im[37];
+    t13 = re[37];
+    t0 = im[42];
+    t2 = re[42];
+    t1 = im[47];
+    t12 = re[47];
+    t3 = t14 + t0;
+    t8 = t6 + t2;
+    t10 = t9 + t1;
+    t7 = t13 + t12;
+    t4 = t14 - t0;
+    t5 = t6 - t2;
+    t11 = t9 - t1;
+    t14 = t13 - t12;
+    t0 = t3 + t10;
+    t6 = t8 + t7;
+    t2 = t4 + t14;
+    t9 = t5 - t11;
+    t1 = t3 - t10;
+    t13 = t8 - t7;
+    t12 = t4 - t14;
+    t3 = t5 + t11;
+    x[65] = t0;
+    x[64] = t6;
+    x[105] = t2;
+    x[104] = t9;
+    x[145] = t1;
+    x[144] = t13;
+    x[25] = t12;
+    x[24] = t3;
+    t10 = im[52];
+    t8 = re[52];
+    t7 = im[57];
+    t4 = re[57];
+    t14 = im[62];
+    t5 = re[62];
+    t11 = im[67];
+    t0 = re[67];
+    t6 = t10 + t14;
+    t2 = t8 + t5;
+    t9 = t7 + t11;
+    t1 = t4 + t0;
+    t13 = t10 - t14;
+    t12 = t8 - t5;
+    t3 = t7 - t11;
+    t10 = t4 - t0;
+    t14 = t6 + t9;
+    t8 = t2 + t1;
+    t5 = t13 + t10;
+    t7 = t12 - t3;
+    t11 = t6 - t9;
+    t4 = t2 - t1;
+    t0 = t13 - t10;
+    t6 = t12 + t3;
+    x[35] = t14;
+    x[34] = t8;
+    x[75] = t5;
+    x[74] = t7;
+    x[115] = t11;
+    x[114] = t4;
+    x[155] = t0;
+    x[154] = t6;
+    t9 = im[72];
+    t2 = re[72];
+    t1 = im[77];
+    t13 = re[77];
+    t10 = im[2];
+    t12 = re[2];
+    t3 = im[7];
+    t14 = re[7];
+    t8 = t9 + t10;
+    t5 = t2 + t12;
+    t7 = t1 + t3;
+    t11 = t13 + t14;
+    t4 = t9 - t10;
+    t0 = t2 - t12;
+    t6 = t1 - t3;
+    t9 = t13 - t14;
+    t10 = t8 + t7;
+    t2 = t5 + t11;
+    t12 = t4 + t9;
+    t1 = t0 - t6;
+    t3 = t8 - t7;
+    t13 = t5 - t11;
+    t14 = t4 - t9;
+    t8 = t0 + t6;
+    x[5] = t10;
+    x[4] = t2;
+    x[45] = t12;
+    x[44] = t1;
+    x[85] = t3;
+    x[84] = t13;
+    x[125] = t14;
+    x[124] = t8;
+    t7 = im[12];
+    t5 = re[12];
+    t11 = im[17];
+    t4 = re[17];
+    t9 = im[22];
+    t0 = re[22];
+    t6 = im[27];
+    t10 = re[27];
+    t2 = t7 + t9;
+    t12 = t5 + t0;
+    t1 = t11 + t6;
+    t3 = t4 + t10;
+    t13 = t7 - t9;
+    t14 = t5 - t0;
+    t8 = t11 - t6;
+    t7 = t4 - t10;
+    t9 = t2 + t1;
+    t5 = t12 + t3;
+    t0 = t13 + t7;
+    t11 = t14 - t8;
+    t6 = t2 - t1;
+    t4 = t12 - t3;
+    t10 = t13 - t7;
+    t2 = t14 + t8;
+    x[135] = t9;
+    x[134] = t5;
+    x[15] = t0;
+    x[14] = t11;
+    x[55] = t6;
+    x[54] = t4;
+    x[95] = t10;
+    x[94] = t2;
+    t1 = im[48];
+    t12 = re[48];
+    t3 = im[68];
+    t13 = re[68];
+    t7 = im[8];
+    t14 = re[8];
+    t8 = im[28];
+    t9 = re[28];
+    t5 = t1 + t7;
+    t0 = t12 + t14;
+    t11 = t3 + t8;
+    t6 = t13 + t9;
+    t4 = t1 - t7;
+    t10 = t12 - t14;
+    t2 = t3 - t8;
+    t1 = t13 - t9;
+    t7 = t5 + t11;
+    t12 = t0 + t6;
+    t14 = t4 + t1;
+    t3 = t10 - t2;
+    t8 = t5 - t11;
+    t13 = t0 - t6;
+    t9 = t4 - t1;
+    t5 = t10 + t2;
+    im[48] = t7;
+    re[48] = t12;
+    im[68] = t14;
+    re[68] = t3;
+    im[8] = t8;
+    re[8] = t13;
+    im[28] = t9;
+    re[28] = t5;
+    t11 = im[53];
+    t0 = re[53];
+    t6 = im[73];
+    t4 = re[73];
+    t1 = im[13];
+    t10 = re[13];
+    t2 = im[33];
+    t7 = re[33];
+    t12 = t11 + t1;
+    t14 = t0 + t10;
+    t3 = t6 + t2;
+    t8 = t4 + t7;
+    t13 = t11 - t1;
+    t9 = t0 - t10;
+    t5 = t6 - t2;
+    t11 = t4 - t7;
+    t1 = t12 + t3;
+    t0 = t14 + t8;
+    t10 = t13 + t11;
+    t6 = t9 - t5;
+    t2 = t12 - t3;
+    t4 = t14 - t8;
+    t7 = t13 - t11;
+    t12 = t9 + t5;
+    t3 = C0 * t10;
+    t14 = (-C1) * t6;
+    t8 = C0 * t6;
+    t13 = (-C1) * t10;
+    t11 = t3 - t14;
+    t9 = t8 + t13;
+    t5 = t2 + t4;
+    t6 = t2 - t4;
+    t10 = C2 * t5;
+    t3 = (-C2) * t6;
+    t14 = C1 * t7;
+    t8 = (-C0) * t12;
+    t13 = C1 * t12;
+    t2 = (-C0) * t7;
+    t4 = t14 - t8;
+    t5 = t13 + t2;
+    im[53] = t1;
+    re[53] = t0;
+    im[73] = t11;
+    re[73] = t9;
+    im[13] = t10;
+    re[13] = t3;
+    im[33] = t4;
+    re[33] = t5;
+    t6 = im[58];
+    t12 = re[58];
+    t7 = im[78];
+    t14 = re[78];
+    t8 = im[18];
+    t13 = re[18];
+    t2 = im[38];
+    t1 = re[38];
+    t0 = t6 + t8;
+    t11 = t12 + t13;
+    t9 = t7 + t2;
+    t10 = t14 + t1;
+    t3 = t6 - t8;
+    t4 = t12 - t13;
+    t5 = t7 - t2;
+    t6 = t14 - t1;
+    t8 = t0 + t9;
+    t12 = t11 + t10;
+    t13 = t3 + t6;
+    t7 = t4 - t5;
+    t2 = t0 - t9;
+    t14 = t11 - t10;
+    t1 = t3 - t6;
+    t0 = t4 + t5;
+    t9 = t13 + t7;
+    t11 = t13 - t7;
+    t10 = C2 * t9;
+    t3 = (-C2) * t11;
+    t6 = -t2;
+    t4 = t1 - t0;
+    t5 = t1 + t0;
+    t13 = (-C2) * t4;
+    t7 = (-C2) * t5;
+    im[58] = t8;
+    re[58] = t12;
+    im[78] = t10;
+    re[78] = t3;
+    im[18] = t14;
+    re[18] = t6;
+    im[38] = t13;
+    re[38] = t7;
+    t9 = im[63];
+    t11 = re[63];
+    t2 = im[3];
+    t1 = re[3];
+    t0 = im[23];
+    t4 = re[23];
+    t5 = im[43];
+    t8 = re[43];
+    t12 = t9 + t0;
+    t10 = t11 + t4;
+    t3 = t2 + t5;
+    t14 = t1 + t8;
+    t6 = t9 - t0;
+    t13 = t11 - t4;
+    t7 = t2 - t5;
+    t9 = t1 - t8;
+    t0 = t12 + t3;
+    t11 = t10 + t14;
+    t4 = t6 + t9;
+    t2 = t13 - t7;
+    t5 = t12 - t3;
+    t1 = t10 - t14;
+    t8 = t6 - t9;
+    t12 = t13 + t7;
+    t3 = C1 * t4;
+    t10 = (-C0) * t2;
+    t14 = C1 * t2;
+    t6 = (-C0) * t4;
+    t9 = t3 - t10;
+    t13 = t14 + t6;
+    t7 = t5 - t1;
+    t2 = t5 + t1;
+    t4 = (-C2) * t7;
+    t3 = (-C2) * t2;
+    t10 = (-C0) * t8;
+    t14 = C1 * t12;
+    t6 = (-C0) * t12;
+    t5 = C1 * t8;
+    t1 = t10 - t14;
+    t7 = t6 + t5;
+    im[63] = t0;
+    re[63] = t11;
+    im[3] = t9;
+    re[3] = t13;
+    im[23] = t4;
+    re[23] = t3;
+    im[43] = t1;
+    re[43] = t7;
+    t2 = im[48];
+    t12 = re[48];
+    t8 = im[53];
+    t10 = re[53];
+    t14 = im[58];
+    t6 = re[58];
+    t5 = im[63];
+    t0 = re[63];
+    t11 = t2 + t14;
+    t9 = t12 + t6;
+    t13 = t8 + t5;
+    t4 = t10 + t0;
+    t3 = t2 - t14;
+    t1 = t12 - t6;
+    t7 = t8 - t5;
+    t2 = t10 - t0;
+    t14 = t11 + t13;
+    t12 = t9 + t4;
+    t6 = t3 + t2;
+    t8 = t1 - t7;
+    t5 = t11 - t13;
+    t10 = t9 - t4;
+    t0 = t3 - t2;
+    t11 = t1 + t7;
+    x[97] = t14;
+    x[96] = t12;
+    x[137] = t6;
+    x[136] = t8;
+    x[17] = t5;
+    x[16] = t10;
+    x[57] = t0;
+    x[56] = t11;
+    t13 = im[68];
+    t9 = re[68];
+    t4 = im[73];
+    t3 = re[73];
+    t2 = im[78];
+    t1 = re[78];
+    t7 = im[3];
+    t14 = re[3];
+    t12 = t13 + t2;
+    t6 = t9 + t1;
+    t8 = t4 + t7;
+    t5 = t3 + t14;
+    t10 = t13 - t2;
+    t0 = t9 - t1;
+    t11 = t4 - t7;
+    t13 = t3 - t14;
+    t2 = t12 + t8;
+    t9 = t6 + t5;
+    t1 = t10 + t13;
+    t4 = t0 - t11;
+    t7 = t12 - t8;
+    t3 = t6 - t5;
+    t14 = t10 - t13;
+    t12 = t0 + t11;
+    x[67] = t2;
+    x[66] = t9;
+    x[107] = t1;
+    x[106] = t4;
+    x[147] = t7;
+    x[146] = t3;
+    x[27] = t14;
+    x[26] = t12;
+    t8 = im[8];
+    t6 = re[8];
+    t5 = im[13];
+    t10 = re[13];
+    t13 = im[18];
+    t0 = re[18];
+    t11 = im[23];
+    t2 = re[23];
+    t9 = t8 + t13;
+    t1 = t6 + t0;
+    t4 = t5 + t11;
+    t7 = t10 + t2;
+    t3 = t8 - t13;
+    t14 = t6 - t0;
+    t12 = t5 - t11;
+    t8 = t10 - t2;
+    t13 = t9 + t4;
+    t6 = t1 + t7;
+    t0 = t3 + t8;
+    t5 = t14 - t12;
+    t11 = t9 - t4;
+    t10 = t1 - t7;
+    t2 = t3 - t8;
+    t9 = t14 + t12;
+    x[37] = t13;
+    x[36] = t6;
+    x[77] = t0;
+    x[76] = t5;
+    x[117] = t11;
+    x[116] = t10;
+    x[157] = t2;
+    x[156] = t9;
+    t4 = im[28];
+    t1 = re[28];
+    t7 = im[33];
+    t3 = re[33];
+    t8 = im[38];
+    t14 = re[38];
+    t12 = im[43];
+    t13 = re[43];
+    t6 = t4 + t8;
+    t0 = t1 + t14;
+    t5 = t7 + t12;
+    t11 = t3 + t13;
+    t10 = t4 - t8;
+    t2 = t1 - t14;
+    t9 = t7 - t12;
+    t4 = t3 - t13;
+    t8 = t6 + t5;
+    t1 = t0 + t11;
+    t14 = t10 + t4;
+    t7 = t2 - t9;
+    t12 = t6 - t5;
+    t3 = t0 - t11;
+    t13 = t10 - t4;
+    t6 = t2 + t9;
+    x[7] = t8;
+    x[6] = t1;
+    x[47] = t14;
+    x[46] = t7;
+    x[87] = t12;
+    x[86] = t3;
+    x[127] = t13;
+    x[126] = t6;
+    t5 = im[64];
+    t0 = re[64];
+    t11 = im[4];
+    t10 = re[4];
+    t4 = im[24];
+    t2 = re[24];
+    t9 = im[44];
+    t8 = re[44];
+    t1 = t5 + t4;
+    t14 = t0 + t2;
+    t7 = t11 + t9;
+    t12 = t10 + t8;
+    t3 = t5 - t4;
+    t13 = t0 - t2;
+    t6 = t11 - t9;
+    t5 = t10 - t8;
+    t4 = t1 + t7;
+    t0 = t14 + t12;
+    t2 = t3 + t5;
+    t11 = t13 - t6;
+    t9 = t1 - t7;
+    t10 = t14 - t12;
+    t8 = t3 - t5;
+    t1 = t13 + t6;
+    im[64] = t4;
+    re[64] = t0;
+    im[4] = t2;
+    re[4] = t11;
+    im[24] = t9;
+    re[24] = t10;
+    im[44] = t8;
+    re[44] = t1;
+    t7 = im[69];
+    t14 = re[69];
+    t12 = im[9];
+    t3 = re[9];
+    t5 = im[29];
+    t13 = re[29];
+    t6 = im[49];
+    t4 = re[49];
+    t0 = t7 + t5;
+    t2 = t14 + t13;
+    t11 = t12 + t6;
+    t9 = t3 + t4;
+    t10 = t7 - t5;
+    t8 = t14 - t13;
+    t1 = t12 - t6;
+    t7 = t3 - t4;
+    t5 = t0 + t11;
+    t14 = t2 + t9;
+    t13 = t10 + t7;
+    t12 = t8 - t1;
+    t6 = t0 - t11;
+    t3 = t2 - t9;
+    t4 = t10 - t7;
+    t0 = t8 + t1;
+    t11 = C0 * t13;
+    t2 = (-C1) * t12;
+    t9 = C0 * t12;
+    t10 = (-C1) * t13;
+    t7 = t11 - t2;
+    t8 = t9 + t10;
+    t1 = t6 + t3;
+    t12 = t6 - t3;
+    t13 = C2 * t1;
+    t11 = (-C2) * t12;
+    t2 = C1 * t4;
+    t9 = (-C0) * t0;
+    t10 = C1 * t0;
+    t6 = (-C0) * t4;
+    t3 = t2 - t9;
+    t1 = t10 + t6;
+    im[69] = t5;
+    re[69] = t14;
+    im[9] = t7;
+    re[9] = t8;
+    im[29] = t13;
+    re[29] = t11;
+    im[49] = t3;
+    re[49] = t1;
+    t12 = im[74];
+    t0 = re[74];
+    t4 = im[14];
+    t2 = re[14];
+    t9 = im[34];
+    t10 = re[34];
+    t6 = im[54];
+    t5 = re[54];
+    t14 = t12 + t9;
+    t7 = t0 + t10;
+    t8 = t4 + t6;
+    t13 = t2 + t5;
+    t11 = t12 - t9;
+    t3 = t0 - t10;
+    t1 = t4 - t6;
+    t12 = t2 - t5;
+    t9 = t14 + t8;
+    t0 = t7 + t13;
+    t10 = t11 + t12;
+    t4 = t3 - t1;
+    t6 = t14 - t8;
+    t2 = t7 - t13;
+    t5 = t11 - t12;
+    t14 = t3 + t1;
+    t8 = t10 + t4;
+    t7 = t10 - t4;
+    t13 = C2 * t8;
+    t11 = (-C2) * t7;
+    t12 = -t6;
+    t3 = t5 - t14;
+    t1 = t5 + t14;
+    t10 = (-C2) * t3;
+    t4 = (-C2) * t1;
+    im[74] = t9;
+    re[74] = t0;
+    im[14] = t13;
+    re[14] = t11;
+    im[34] = t2;
+    re[34] = t12;
+    im[54] = t10;
+    re[54] = t4;
+    t8 = im[79];
+    t7 = re[79];
+    t6 = im[19];
+    t5 = re[19];
+    t14 = im[39];
+    t3 = re[39];
+    t1 = im[59];
+    t9 = re[59];
+    t0 = t8 + t14;
+    t13 = t7 + t3;
+    t11 = t6 + t1;
+    t2 = t5 + t9;
+    t12 = t8 - t14;
+    t10 = t7 - t3;
+    t4 = t6 - t1;
+    t8 = t5 - t9;
+    t14 = t0 + t11;
+    t7 = t13 + t2;
+    t3 = t12 + t8;
+    t6 = t10 - t4;
+    t1 = t0 - t11;
+    t5 = t13 - t2;
+    t9 = t12 - t8;
+    t0 = t10 + t4;
+    t11 = C1 * t3;
+    t13 = (-C0) * t6;
+    t2 = C1 * t6;
+    t12 = (-C0) * t3;
+    t8 = t11 - t13;
+    t10 = t2 + t12;
+    t4 = t1 - t5;
+    t6 = t1 + t5;
+    t3 = (-C2) * t4;
+    t11 = (-C2) * t6;
+    t13 = (-C0) * t9;
+    t2 = C1 * t0;
+    t12 = (-C0) * t0;
+    t1 = C1 * t9;
+    t5 = t13 - t2;
+    t4 = t12 + t1;
+    im[79] = t14;
+    re[79] = t7;
+    im[19] = t8;
+    re[19] = t10;
+    im[39] = t3;
+    re[39] = t11;
+    im[59] = t5;
+    re[59] = t4;
+    t6 = im[64];
+    t0 = re[64];
+    t9 = im[69];
+    t13 = re[69];
+    t2 = im[74];
+    t12 = re[74];
+    t1 = im[79];
+    t14 = re[79];
+    t7 = t6 + t2;
+    t8 = t0 + t12;
+    t10 = t9 + t1;
+    t3 = t13 + t14;
+    t11 = t6 - t2;
+    t5 = t0 - t12;
+    t4 = t9 - t1;
+    t6 = t13 - t14;
+    t2 = t7 + t10;
+    t0 = t8 + t3;
+    t12 = t11 + t6;
+    t9 = t5 - t4;
+    t1 = t7 - t10;
+    t13 = t8 - t3;
+    t14 = t11 - t6;
+    t7 = t5 + t4;
+    x[129] = t2;
+    x[128] = t0;
+    x[9] = t12;
+    x[8] = t9;
+    x[49] = t1;
+    x[48] = t13;
+    x[89] = t14;
+    x[88] = t7;
+    t10 = im[4];
+    t8 = re[4];
+    t3 = im[9];
+    t11 = re[9];
+    t6 = im[14];
+    t5 = re[14];
+    t4 = im[19];
+    t2 = re[19];
+    t0 = t10 + t6;
+    t12 = t8 + t5;
+    t9 = t3 + t4;
+    t1 = t11 + t2;
+    t13 = t10 - t6;
+    t14 = t8 - t5;
+    t7 = t3 - t4;
+    t10 = t11 - t2;
+    t6 = t0 + t9;
+    t8 = t12 + t1;
+    t5 = t13 + t10;
+    t3 = t14 - t7;
+    t4 = t0 - t9;
+    t11 = t12 - t1;
+    t2 = t13 - t10;
+    t0 = t14 + t7;
+    x[99] = t6;
+    x[98] = t8;
+    x[139] = t5;
+    x[138] = t3;
+    x[19] = t4;
+    x[18] = t11;
+    x[59] = t2;
+    x[58] = t0;
+    t9 = im[24];
+    t12 = re[24];
+    t1 = im[29];
+    t13 = re[29];
+    t10 = im[34];
+    t14 = re[34];
+    t7 = im[39];
+    t6 = re[39];
+    t8 = t9 + t10;
+    t5 = t12 + t14;
+    t3 = t1 + t7;
+    t4 = t13 + t6;
+    t11 = t9 - t10;
+    t2 = t12 - t14;
+    t0 = t1 - t7;
+    t9 = t13 - t6;
+    t10 = t8 + t3;
+    t12 = t5 + t4;
+    t14 = t11 + t9;
+    t1 = t2 - t0;
+    t7 = t8 - t3;
+    t13 = t5 - t4;
+    t6 = t11 - t9;
+    t8 = t2 + t0;
+    x[69] = t10;
+    x[68] = t12;
+    x[109] = t14;
+    x[108] = t1;
+    x[149] = t7;
+    x[148] = t13;
+    x[29] = t6;
+    x[28] = t8;
+    t3 = im[44];
+    t5 = re[44];
+    t4 = im[49];
+    t11 = re[49];
+    t9 = im[54];
+    t2 = re[54];
+    t0 = im[59];
+    t10 = re[59];
+    t12 = t3 + t9;
+    t14 = t5 + t2;
+    t1 = t4 + t0;
+    t7 = t11 + t10;
+    t13 = t3 - t9;
+    t6 = t5 - t2;
+    t8 = t4 - t0;
+    t3 = t11 - t10;
+    t9 = t12 + t1;
+    t5 = t14 + t7;
+    t2 = t13 + t3;
+    t4 = t6 - t8;
+    t0 = t12 - t1;
+    t11 = t14 - t7;
+    t10 = t13 - t3;
+    t12 = t6 + t8;
+    x[39] = t9;
+    x[38] = t5;
+    x[79] = t2;
+    x[78] = t4;
+    x[119] = t0;
+    x[118] = t11;
+    x[159] = t10;
+    x[158] = t12;
+}
+
+//
+//  Public functions.
+//
+
+/**
+ *  Apply mixed-radix real-output inverse FFT transform (prebuilt for block
+ *  size 160).
+ * 
+ *  Note(s):
+ *    [1] The size of all arrays will not be checked.
+ *    [2] Only the first 81 inputs are used (the k-th input is assumed to be
+ *        the conjugate of the (160 - k)-th input), the imaginary parts of
+ *        the 0th and the 80-th inputs are ignored.
+ *    [3] `re` and `im` are used as scratch buffers, their contents would be
+ *        destroyed.
+ *    [4] `x` shall not be `re` or `im`.
+ *    [5] All outputs are scaled by 1 / 160.
+ * 
+ *  @param {Number[]} re 
+ *    - The real part of each input point.
+ *  @param {Number[]} im 
+ *    - The imaginary part of each input point.
+ *  @param {Number[]} x 
+ *    - The real output points.
+ */
+function ApplyMixedRadixIRFFT_160(re, im, x) {
+    ApplyMixedRadixIRFFT_160_Part1(re, im, x);
+    ApplyMixedRadixIRFFT_160_Part2(re, im, x);
+}
+
+//  Export public APIs.
+module.exports = {
+    "ApplyMixedRadixIRFFT_160": ApplyMixedRadixIRFFT_160
+};
\ No newline at end of file
@@ -0,0 +1,7740 @@
+//
+//  Copyright 2021 - 2023 XiaoJSoft Studio. All rights reserved.
+//  Use of this source code is governed by a BSD-style license that can be
+//  found in the LICENSE.md file.
+//
+
+//
+//  Note(s):
+//    [1] This file is generated automatically by a FFT compiler, which locates 
+//        at "./../../dev/fft-mx-generator/" directory.
+//        Do NOT modify this file manually.
+//
+
+//
+//  Imports.
+//
+
+//  Imported modules.
+const Lc3FftMxBaseOp = 
+    require("./fft-mx-baseop");
+
+//  Imported functions.
+// const MXTr2 = 
+//     Lc3FftMxBaseOp.MXTr2;
+// const MXTr3 = 
+//     Lc3FftMxBaseOp.MXTr3;
+// const MXTr4 = 
+//     Lc3FftMxBaseOp.MXTr4;
+// const MXTr5 = 
+//     Lc3FftMxBaseOp.MXTr5;
+// const MXRot = 
+//     Lc3FftMxBaseOp.MXRot;
+const MXSwap = 
+    Lc3FftMxBaseOp.MXSwap;
+const MXCshft = 
+    Lc3FftMxBaseOp.MXCshft;
+// const MXCompact = 
+//     Lc3FftMxBaseOp.MXCompact;
+
+//
+//  Constants.
+//
+
+//  Cyclic shift indexes.
+const CSHFT_INDEXES_0 = [1, 72, 84, 143, 86, 127, 59, 113, 141, 102, 154, 73, 156, 67, 24, 153];
+const CSHFT_INDEXES_1 = [2, 144, 133, 146, 117, 119, 103, 66, 112, 69, 18, 21, 87, 39, 98, 16, 37, 114, 53, 151, 7, 34, 48, 101, 82, 149, 23, 71];
+const CSHFT_INDEXES_2 = [3, 56, 57, 129, 8, 116, 47, 54, 63, 91, 17, 109, 38, 26, 137, 124];
+const CSHFT_INDEXES_3 = [4, 138, 36, 42];
+const CSHFT_INDEXES_4 = [5, 50, 85, 55, 135, 130, 80];
+const CSHFT_INDEXES_5 = [6, 122, 9, 28, 131, 152, 89, 33, 136, 52, 79, 118, 31, 27, 49, 13];
+const CSHFT_INDEXES_6 = [11, 12, 94, 83, 61, 107, 44, 158, 51, 157, 139, 108, 126, 147, 29, 43, 76, 62, 19, 93];
+const CSHFT_INDEXES_7 = [14, 78, 46, 142];
+const CSHFT_INDEXES_8 = [15, 150, 95, 155, 145, 45, 70, 90, 105, 60, 35, 120, 25, 65, 40, 20];
+const CSHFT_INDEXES_9 = [22, 159, 123, 81, 77, 134, 58, 41, 92, 99, 88, 121, 97, 104, 148, 111];
+const CSHFT_INDEXES_10 = [30, 115, 125, 75, 140];
+const CSHFT_INDEXES_11 = [32, 64, 128, 96];
+const CSHFT_INDEXES_12 = [68, 106, 132, 74];
+
+//
+//  Private functions.
+//
+
+/**
+ *  Part 1 of ApplyMixedRadixPairedRFFT_160().
+ * 
+ *  @param {Number[]} re 
+ *    - The real part of each point.
+ *  @param {Number[]} im 
+ *    - The imaginary part of each point.
+ */
+function ApplyMixedRadixPairedRFFT_160_Part1(re, im) {
+    let t0, t1, t10, t11, t12, t13, t14, t2, t3, t4, t5, t6, t7, t8, t9;
+    const C0 = 0.5590169943749475;
+    const C1 = 0.25;
+    const C2 = 0.9510565162951535;
+    const C3 = 0.5877852522924731;
+    const C4 = 0.9807852804032304;
+    const C5 = 1.1758756024193586;
+    const C6 = 0.7856949583871022;
+    const C7 = 0.9238795325112867;
+    const C8 = 1.3065629648763766;
+    const C9 = 0.5411961001461969;
+    const C10 = 0.8314696123025452;
+    const C11 = 1.3870398453221475;
+    const C12 = 0.27589937928294306;
+    const C13 = 0.7071067811865476;
+    const C14 = 0.3826834323650898;
+    const C15 = 0.19509032201612825;
+    const C16 = 0.5555702330196022;
+    t0 = re[0];
+    t1 = im[0];
+    t2 = re[32];
+    t3 = im[32];
+    t4 = re[64];
+    t5 = im[64];
+    t6 = re[96];
+    t7 = im[96];
+    t8 = re[128];
+    t9 = im[128];
+    t10 = t2 + t8;
+    t11 = t3 + t9;
+    t12 = t4 + t6;
+    t13 = t5 + t7;
+    t2 = t2 - t8;
+    t8 = t3 - t9;
+    t3 = t4 - t6;
+    t9 = t5 - t7;
+    t4 = t10 + t12;
+    t6 = t11 + t13;
+    t5 = t10 - t12;
+    t7 = C0 * t5;
+    t10 = t11 - t13;
+    t12 = C0 * t10;
+    t5 = C1 * t4;
+    t11 = t0 - t5;
+    t13 = C1 * t6;
+    t10 = t1 - t13;
+    t5 = t11 + t7;
+    t13 = t10 + t12;
+    t11 = t11 - t7;
+    t7 = t10 - t12;
+    t10 = C2 * t2;
+    t12 = C3 * t3;
+    t10 = t10 + t12;
+    t12 = C2 * t8;
+    t14 = C3 * t9;
+    t12 = t12 + t14;
+    t14 = C3 * t2;
+    t2 = C2 * t3;
+    t3 = t14 - t2;
+    t14 = C3 * t8;
+    t2 = C2 * t9;
+    t8 = t14 - t2;
+    t9 = t0 + t4;
+    t14 = t1 + t6;
+    t2 = t5 + t12;
+    t0 = t13 - t10;
+    t4 = t11 + t8;
+    t1 = t7 - t3;
+    t6 = t11 - t8;
+    t11 = t7 + t3;
+    t8 = t5 - t12;
+    t7 = t13 + t10;
+    re[0] = t9;
+    im[0] = t14;
+    re[32] = t2;
+    im[32] = t0;
+    re[64] = t4;
+    im[64] = t1;
+    re[96] = t6;
+    im[96] = t11;
+    re[128] = t8;
+    im[128] = t7;
+    t3 = re[5];
+    t5 = im[5];
+    t12 = re[37];
+    t13 = im[37];
+    t10 = re[69];
+    t9 = im[69];
+    t14 = re[101];
+    t2 = im[101];
+    t0 = re[133];
+    t4 = im[133];
+    t1 = t12 + t0;
+    t6 = t13 + t4;
+    t11 = t10 + t14;
+    t8 = t9 + t2;
+    t7 = t12 - t0;
+    t12 = t13 - t4;
+    t0 = t10 - t14;
+    t13 = t9 - t2;
+    t4 = t1 + t11;
+    t10 = t6 + t8;
+    t14 = t1 - t11;
+    t9 = C0 * t14;
+    t2 = t6 - t8;
+    t1 = C0 * t2;
+    t11 = C1 * t4;
+    t14 = t3 - t11;
+    t6 = C1 * t10;
+    t8 = t5 - t6;
+    t2 = t14 + t9;
+    t11 = t8 + t1;
+    t6 = t14 - t9;
+    t14 = t8 - t1;
+    t9 = C2 * t7;
+    t8 = C3 * t0;
+    t1 = t9 + t8;
+    t9 = C2 * t12;
+    t8 = C3 * t13;
+    t9 = t9 + t8;
+    t8 = C3 * t7;
+    t7 = C2 * t0;
+    t0 = t8 - t7;
+    t8 = C3 * t12;
+    t7 = C2 * t13;
+    t12 = t8 - t7;
+    t13 = t3 + t4;
+    t8 = t5 + t10;
+    t7 = t2 + t9;
+    t3 = t11 - t1;
+    t4 = t6 + t12;
+    t5 = t14 - t0;
+    t10 = t6 - t12;
+    t6 = t14 + t0;
+    t12 = t2 - t9;
+    t14 = t11 + t1;
+    re[5] = t13;
+    im[5] = t8;
+    re[37] = t7;
+    im[37] = t3;
+    re[69] = t4;
+    im[69] = t5;
+    re[101] = t10;
+    im[101] = t6;
+    re[133] = t12;
+    im[133] = t14;
+    t0 = re[10];
+    t2 = im[10];
+    t9 = re[42];
+    t11 = im[42];
+    t1 = re[74];
+    t13 = im[74];
+    t8 = re[106];
+    t7 = im[106];
+    t3 = re[138];
+    t4 = im[138];
+    t5 = t9 + t3;
+    t10 = t11 + t4;
+    t6 = t1 + t8;
+    t12 = t13 + t7;
+    t14 = t9 - t3;
+    t9 = t11 - t4;
+    t3 = t1 - t8;
+    t11 = t13 - t7;
+    t4 = t5 + t6;
+    t1 = t10 + t12;
+    t8 = t5 - t6;
+    t13 = C0 * t8;
+    t7 = t10 - t12;
+    t5 = C0 * t7;
+    t6 = C1 * t4;
+    t8 = t0 - t6;
+    t10 = C1 * t1;
+    t12 = t2 - t10;
+    t7 = t8 + t13;
+    t6 = t12 + t5;
+    t10 = t8 - t13;
+    t8 = t12 - t5;
+    t13 = C2 * t14;
+    t12 = C3 * t3;
+    t5 = t13 + t12;
+    t13 = C2 * t9;
+    t12 = C3 * t11;
+    t13 = t13 + t12;
+    t12 = C3 * t14;
+    t14 = C2 * t3;
+    t3 = t12 - t14;
+    t12 = C3 * t9;
+    t14 = C2 * t11;
+    t9 = t12 - t14;
+    t11 = t0 + t4;
+    t12 = t2 + t1;
+    t14 = t7 + t13;
+    t0 = t6 - t5;
+    t4 = t10 + t9;
+    t2 = t8 - t3;
+    t1 = t10 - t9;
+    t10 = t8 + t3;
+    t9 = t7 - t13;
+    t8 = t6 + t5;
+    re[10] = t11;
+    im[10] = t12;
+    re[42] = t14;
+    im[42] = t0;
+    re[74] = t4;
+    im[74] = t2;
+    re[106] = t1;
+    im[106] = t10;
+    re[138] = t9;
+    im[138] = t8;
+    t3 = re[15];
+    t7 = im[15];
+    t13 = re[47];
+    t6 = im[47];
+    t5 = re[79];
+    t11 = im[79];
+    t12 = re[111];
+    t14 = im[111];
+    t0 = re[143];
+    t4 = im[143];
+    t2 = t13 + t0;
+    t1 = t6 + t4;
+    t10 = t5 + t12;
+    t9 = t11 + t14;
+    t8 = t13 - t0;
+    t13 = t6 - t4;
+    t0 = t5 - t12;
+    t6 = t11 - t14;
+    t4 = t2 + t10;
+    t5 = t1 + t9;
+    t12 = t2 - t10;
+    t11 = C0 * t12;
+    t14 = t1 - t9;
+    t2 = C0 * t14;
+    t10 = C1 * t4;
+    t12 = t3 - t10;
+    t1 = C1 * t5;
+    t9 = t7 - t1;
+    t14 = t12 + t11;
+    t10 = t9 + t2;
+    t1 = t12 - t11;
+    t12 = t9 - t2;
+    t11 = C2 * t8;
+    t9 = C3 * t0;
+    t2 = t11 + t9;
+    t11 = C2 * t13;
+    t9 = C3 * t6;
+    t11 = t11 + t9;
+    t9 = C3 * t8;
+    t8 = C2 * t0;
+    t0 = t9 - t8;
+    t9 = C3 * t13;
+    t8 = C2 * t6;
+    t13 = t9 - t8;
+    t6 = t3 + t4;
+    t9 = t7 + t5;
+    t8 = t14 + t11;
+    t3 = t10 - t2;
+    t4 = t1 + t13;
+    t7 = t12 - t0;
+    t5 = t1 - t13;
+    t1 = t12 + t0;
+    t13 = t14 - t11;
+    t12 = t10 + t2;
+    re[15] = t6;
+    im[15] = t9;
+    re[47] = t8;
+    im[47] = t3;
+    re[79] = t4;
+    im[79] = t7;
+    re[111] = t5;
+    im[111] = t1;
+    re[143] = t13;
+    im[143] = t12;
+    t0 = re[20];
+    t14 = im[20];
+    t11 = re[52];
+    t10 = im[52];
+    t2 = re[84];
+    t6 = im[84];
+    t9 = re[116];
+    t8 = im[116];
+    t3 = re[148];
+    t4 = im[148];
+    t7 = t11 + t3;
+    t5 = t10 + t4;
+    t1 = t2 + t9;
+    t13 = t6 + t8;
+    t12 = t11 - t3;
+    t11 = t10 - t4;
+    t3 = t2 - t9;
+    t10 = t6 - t8;
+    t4 = t7 + t1;
+    t2 = t5 + t13;
+    t9 = t7 - t1;
+    t6 = C0 * t9;
+    t8 = t5 - t13;
+    t7 = C0 * t8;
+    t1 = C1 * t4;
+    t9 = t0 - t1;
+    t5 = C1 * t2;
+    t13 = t14 - t5;
+    t8 = t9 + t6;
+    t1 = t13 + t7;
+    t5 = t9 - t6;
+    t9 = t13 - t7;
+    t6 = C2 * t12;
+    t13 = C3 * t3;
+    t7 = t6 + t13;
+    t6 = C2 * t11;
+    t13 = C3 * t10;
+    t6 = t6 + t13;
+    t13 = C3 * t12;
+    t12 = C2 * t3;
+    t3 = t13 - t12;
+    t13 = C3 * t11;
+    t12 = C2 * t10;
+    t11 = t13 - t12;
+    t10 = t0 + t4;
+    t13 = t14 + t2;
+    t12 = t8 + t6;
+    t0 = t1 - t7;
+    t4 = t5 + t11;
+    t14 = t9 - t3;
+    t2 = t5 - t11;
+    t5 = t9 + t3;
+    t11 = t8 - t6;
+    t9 = t1 + t7;
+    re[20] = t10;
+    im[20] = t13;
+    re[52] = t12;
+    im[52] = t0;
+    re[84] = t4;
+    im[84] = t14;
+    re[116] = t2;
+    im[116] = t5;
+    re[148] = t11;
+    im[148] = t9;
+    t3 = re[25];
+    t8 = im[25];
+    t6 = re[57];
+    t1 = im[57];
+    t7 = re[89];
+    t10 = im[89];
+    t13 = re[121];
+    t12 = im[121];
+    t0 = re[153];
+    t4 = im[153];
+    t14 = t6 + t0;
+    t2 = t1 + t4;
+    t5 = t7 + t13;
+    t11 = t10 + t12;
+    t9 = t6 - t0;
+    t6 = t1 - t4;
+    t0 = t7 - t13;
+    t1 = t10 - t12;
+    t4 = t14 + t5;
+    t7 = t2 + t11;
+    t13 = t14 - t5;
+    t10 = C0 * t13;
+    t12 = t2 - t11;
+    t14 = C0 * t12;
+    t5 = C1 * t4;
+    t13 = t3 - t5;
+    t2 = C1 * t7;
+    t11 = t8 - t2;
+    t12 = t13 + t10;
+    t5 = t11 + t14;
+    t2 = t13 - t10;
+    t13 = t11 - t14;
+    t10 = C2 * t9;
+    t11 = C3 * t0;
+    t14 = t10 + t11;
+    t10 = C2 * t6;
+    t11 = C3 * t1;
+    t10 = t10 + t11;
+    t11 = C3 * t9;
+    t9 = C2 * t0;
+    t0 = t11 - t9;
+    t11 = C3 * t6;
+    t9 = C2 * t1;
+    t6 = t11 - t9;
+    t1 = t3 + t4;
+    t11 = t8 + t7;
+    t9 = t12 + t10;
+    t3 = t5 - t14;
+    t4 = t2 + t6;
+    t8 = t13 - t0;
+    t7 = t2 - t6;
+    t2 = t13 + t0;
+    t6 = t12 - t10;
+    t13 = t5 + t14;
+    re[25] = t1;
+    im[25] = t11;
+    re[57] = t9;
+    im[57] = t3;
+    re[89] = t4;
+    im[89] = t8;
+    re[121] = t7;
+    im[121] = t2;
+    re[153] = t6;
+    im[153] = t13;
+    t0 = re[30];
+    t12 = im[30];
+    t10 = re[62];
+    t5 = im[62];
+    t14 = re[94];
+    t1 = im[94];
+    t11 = re[126];
+    t9 = im[126];
+    t3 = re[158];
+    t4 = im[158];
+    t8 = t10 + t3;
+    t7 = t5 + t4;
+    t2 = t14 + t11;
+    t6 = t1 + t9;
+    t13 = t10 - t3;
+    t10 = t5 - t4;
+    t3 = t14 - t11;
+    t5 = t1 - t9;
+    t4 = t8 + t2;
+    t14 = t7 + t6;
+    t11 = t8 - t2;
+    t1 = C0 * t11;
+    t9 = t7 - t6;
+    t8 = C0 * t9;
+    t2 = C1 * t4;
+    t11 = t0 - t2;
+    t7 = C1 * t14;
+    t6 = t12 - t7;
+    t9 = t11 + t1;
+    t2 = t6 + t8;
+    t7 = t11 - t1;
+    t11 = t6 - t8;
+    t1 = C2 * t13;
+    t6 = C3 * t3;
+    t8 = t1 + t6;
+    t1 = C2 * t10;
+    t6 = C3 * t5;
+    t1 = t1 + t6;
+    t6 = C3 * t13;
+    t13 = C2 * t3;
+    t3 = t6 - t13;
+    t6 = C3 * t10;
+    t13 = C2 * t5;
+    t10 = t6 - t13;
+    t5 = t0 + t4;
+    t6 = t12 + t14;
+    t13 = t9 + t1;
+    t0 = t2 - t8;
+    t4 = t7 + t10;
+    t12 = t11 - t3;
+    t14 = t7 - t10;
+    t7 = t11 + t3;
+    t10 = t9 - t1;
+    t11 = t2 + t8;
+    re[30] = t5;
+    im[30] = t6;
+    re[62] = t13;
+    im[62] = t0;
+    re[94] = t4;
+    im[94] = t12;
+    re[126] = t14;
+    im[126] = t7;
+    re[158] = t10;
+    im[158] = t11;
+    t3 = re[35];
+    t9 = im[35];
+    t1 = re[67];
+    t2 = im[67];
+    t8 = re[99];
+    t5 = im[99];
+    t6 = re[131];
+    t13 = im[131];
+    t0 = re[3];
+    t4 = im[3];
+    t12 = t1 + t0;
+    t14 = t2 + t4;
+    t7 = t8 + t6;
+    t10 = t5 + t13;
+    t11 = t1 - t0;
+    t1 = t2 - t4;
+    t0 = t8 - t6;
+    t2 = t5 - t13;
+    t4 = t12 + t7;
+    t8 = t14 + t10;
+    t6 = t12 - t7;
+    t5 = C0 * t6;
+    t13 = t14 - t10;
+    t12 = C0 * t13;
+    t7 = C1 * t4;
+    t6 = t3 - t7;
+    t14 = C1 * t8;
+    t10 = t9 - t14;
+    t13 = t6 + t5;
+    t7 = t10 + t12;
+    t14 = t6 - t5;
+    t6 = t10 - t12;
+    t5 = C2 * t11;
+    t10 = C3 * t0;
+    t12 = t5 + t10;
+    t5 = C2 * t1;
+    t10 = C3 * t2;
+    t5 = t5 + t10;
+    t10 = C3 * t11;
+    t11 = C2 * t0;
+    t0 = t10 - t11;
+    t10 = C3 * t1;
+    t11 = C2 * t2;
+    t1 = t10 - t11;
+    t2 = t3 + t4;
+    t10 = t9 + t8;
+    t11 = t13 + t5;
+    t3 = t7 - t12;
+    t4 = t14 + t1;
+    t9 = t6 - t0;
+    t8 = t14 - t1;
+    t14 = t6 + t0;
+    t1 = t13 - t5;
+    t6 = t7 + t12;
+    re[35] = t2;
+    im[35] = t10;
+    re[67] = t11;
+    im[67] = t3;
+    re[99] = t4;
+    im[99] = t9;
+    re[131] = t8;
+    im[131] = t14;
+    re[3] = t1;
+    im[3] = t6;
+    t0 = re[40];
+    t13 = im[40];
+    t5 = re[72];
+    t7 = im[72];
+    t12 = re[104];
+    t2 = im[104];
+    t10 = re[136];
+    t11 = im[136];
+    t3 = re[8];
+    t4 = im[8];
+    t9 = t5 + t3;
+    t8 = t7 + t4;
+    t14 = t12 + t10;
+    t1 = t2 + t11;
+    t6 = t5 - t3;
+    t5 = t7 - t4;
+    t3 = t12 - t10;
+    t7 = t2 - t11;
+    t4 = t9 + t14;
+    t12 = t8 + t1;
+    t10 = t9 - t14;
+    t2 = C0 * t10;
+    t11 = t8 - t1;
+    t9 = C0 * t11;
+    t14 = C1 * t4;
+    t10 = t0 - t14;
+    t8 = C1 * t12;
+    t1 = t13 - t8;
+    t11 = t10 + t2;
+    t14 = t1 + t9;
+    t8 = t10 - t2;
+    t10 = t1 - t9;
+    t2 = C2 * t6;
+    t1 = C3 * t3;
+    t9 = t2 + t1;
+    t2 = C2 * t5;
+    t1 = C3 * t7;
+    t2 = t2 + t1;
+    t1 = C3 * t6;
+    t6 = C2 * t3;
+    t3 = t1 - t6;
+    t1 = C3 * t5;
+    t6 = C2 * t7;
+    t5 = t1 - t6;
+    t7 = t0 + t4;
+    t1 = t13 + t12;
+    t6 = t11 + t2;
+    t0 = t14 - t9;
+    t4 = t8 + t5;
+    t13 = t10 - t3;
+    t12 = t8 - t5;
+    t8 = t10 + t3;
+    t5 = t11 - t2;
+    t10 = t14 + t9;
+    re[40] = t7;
+    im[40] = t1;
+    re[72] = t6;
+    im[72] = t0;
+    re[104] = t4;
+    im[104] = t13;
+    re[136] = t12;
+    im[136] = t8;
+    re[8] = t5;
+    im[8] = t10;
+    t3 = re[45];
+    t11 = im[45];
+    t2 = re[77];
+    t14 = im[77];
+    t9 = re[109];
+    t7 = im[109];
+    t1 = re[141];
+    t6 = im[141];
+    t0 = re[13];
+    t4 = im[13];
+    t13 = t2 + t0;
+    t12 = t14 + t4;
+    t8 = t9 + t1;
+    t5 = t7 + t6;
+    t10 = t2 - t0;
+    t2 = t14 - t4;
+    t0 = t9 - t1;
+    t14 = t7 - t6;
+    t4 = t13 + t8;
+    t9 = t12 + t5;
+    t1 = t13 - t8;
+    t7 = C0 * t1;
+    t6 = t12 - t5;
+    t13 = C0 * t6;
+    t8 = C1 * t4;
+    t1 = t3 - t8;
+    t12 = C1 * t9;
+    t5 = t11 - t12;
+    t6 = t1 + t7;
+    t8 = t5 + t13;
+    t12 = t1 - t7;
+    t1 = t5 - t13;
+    t7 = C2 * t10;
+    t5 = C3 * t0;
+    t13 = t7 + t5;
+    t7 = C2 * t2;
+    t5 = C3 * t14;
+    t7 = t7 + t5;
+    t5 = C3 * t10;
+    t10 = C2 * t0;
+    t0 = t5 - t10;
+    t5 = C3 * t2;
+    t10 = C2 * t14;
+    t2 = t5 - t10;
+    t14 = t3 + t4;
+    t5 = t11 + t9;
+    t10 = t6 + t7;
+    t3 = t8 - t13;
+    t4 = t12 + t2;
+    t11 = t1 - t0;
+    t9 = t12 - t2;
+    t12 = t1 + t0;
+    t2 = t6 - t7;
+    t1 = t8 + t13;
+    re[45] = t14;
+    im[45] = t5;
+    re[77] = t10;
+    im[77] = t3;
+    re[109] = t4;
+    im[109] = t11;
+    re[141] = t9;
+    im[141] = t12;
+    re[13] = t2;
+    im[13] = t1;
+    t0 = re[50];
+    t6 = im[50];
+    t7 = re[82];
+    t8 = im[82];
+    t13 = re[114];
+    t14 = im[114];
+    t5 = re[146];
+    t10 = im[146];
+    t3 = re[18];
+    t4 = im[18];
+    t11 = t7 + t3;
+    t9 = t8 + t4;
+    t12 = t13 + t5;
+    t2 = t14 + t10;
+    t1 = t7 - t3;
+    t7 = t8 - t4;
+    t3 = t13 - t5;
+    t8 = t14 - t10;
+    t4 = t11 + t12;
+    t13 = t9 + t2;
+    t5 = t11 - t12;
+    t14 = C0 * t5;
+    t10 = t9 - t2;
+    t11 = C0 * t10;
+    t12 = C1 * t4;
+    t5 = t0 - t12;
+    t9 = C1 * t13;
+    t2 = t6 - t9;
+    t10 = t5 + t14;
+    t12 = t2 + t11;
+    t9 = t5 - t14;
+    t5 = t2 - t11;
+    t14 = C2 * t1;
+    t2 = C3 * t3;
+    t11 = t14 + t2;
+    t14 = C2 * t7;
+    t2 = C3 * t8;
+    t14 = t14 + t2;
+    t2 = C3 * t1;
+    t1 = C2 * t3;
+    t3 = t2 - t1;
+    t2 = C3 * t7;
+    t1 = C2 * t8;
+    t7 = t2 - t1;
+    t8 = t0 + t4;
+    t2 = t6 + t13;
+    t1 = t10 + t14;
+    t0 = t12 - t11;
+    t4 = t9 + t7;
+    t6 = t5 - t3;
+    t13 = t9 - t7;
+    t9 = t5 + t3;
+    t7 = t10 - t14;
+    t5 = t12 + t11;
+    re[50] = t8;
+    im[50] = t2;
+    re[82] = t1;
+    im[82] = t0;
+    re[114] = t4;
+    im[114] = t6;
+    re[146] = t13;
+    im[146] = t9;
+    re[18] = t7;
+    im[18] = t5;
+    t3 = re[55];
+    t10 = im[55];
+    t14 = re[87];
+    t12 = im[87];
+    t11 = re[119];
+    t8 = im[119];
+    t2 = re[151];
+    t1 = im[151];
+    t0 = re[23];
+    t4 = im[23];
+    t6 = t14 + t0;
+    t13 = t12 + t4;
+    t9 = t11 + t2;
+    t7 = t8 + t1;
+    t5 = t14 - t0;
+    t14 = t12 - t4;
+    t0 = t11 - t2;
+    t12 = t8 - t1;
+    t4 = t6 + t9;
+    t11 = t13 + t7;
+    t2 = t6 - t9;
+    t8 = C0 * t2;
+    t1 = t13 - t7;
+    t6 = C0 * t1;
+    t9 = C1 * t4;
+    t2 = t3 - t9;
+    t13 = C1 * t11;
+    t7 = t10 - t13;
+    t1 = t2 + t8;
+    t9 = t7 + t6;
+    t13 = t2 - t8;
+    t2 = t7 - t6;
+    t8 = C2 * t5;
+    t7 = C3 * t0;
+    t6 = t8 + t7;
+    t8 = C2 * t14;
+    t7 = C3 * t12;
+    t8 = t8 + t7;
+    t7 = C3 * t5;
+    t5 = C2 * t0;
+    t0 = t7 - t5;
+    t7 = C3 * t14;
+    t5 = C2 * t12;
+    t14 = t7 - t5;
+    t12 = t3 + t4;
+    t7 = t10 + t11;
+    t5 = t1 + t8;
+    t3 = t9 - t6;
+    t4 = t13 + t14;
+    t10 = t2 - t0;
+    t11 = t13 - t14;
+    t13 = t2 + t0;
+    t14 = t1 - t8;
+    t2 = t9 + t6;
+    re[55] = t12;
+    im[55] = t7;
+    re[87] = t5;
+    im[87] = t3;
+    re[119] = t4;
+    im[119] = t10;
+    re[151] = t11;
+    im[151] = t13;
+    re[23] = t14;
+    im[23] = t2;
+    t0 = re[60];
+    t1 = im[60];
+    t8 = re[92];
+    t9 = im[92];
+    t6 = re[124];
+    t12 = im[124];
+    t7 = re[156];
+    t5 = im[156];
+    t3 = re[28];
+    t4 = im[28];
+    t10 = t8 + t3;
+    t11 = t9 + t4;
+    t13 = t6 + t7;
+    t14 = t12 + t5;
+    t2 = t8 - t3;
+    t8 = t9 - t4;
+    t3 = t6 - t7;
+    t9 = t12 - t5;
+    t4 = t10 + t13;
+    t6 = t11 + t14;
+    t7 = t10 - t13;
+    t12 = C0 * t7;
+    t5 = t11 - t14;
+    t10 = C0 * t5;
+    t13 = C1 * t4;
+    t7 = t0 - t13;
+    t11 = C1 * t6;
+    t14 = t1 - t11;
+    t5 = t7 + t12;
+    t13 = t14 + t10;
+    t11 = t7 - t12;
+    t7 = t14 - t10;
+    t12 = C2 * t2;
+    t14 = C3 * t3;
+    t10 = t12 + t14;
+    t12 = C2 * t8;
+    t14 = C3 * t9;
+    t12 = t12 + t14;
+    t14 = C3 * t2;
+    t2 = C2 * t3;
+    t3 = t14 - t2;
+    t14 = C3 * t8;
+    t2 = C2 * t9;
+    t8 = t14 - t2;
+    t9 = t0 + t4;
+    t14 = t1 + t6;
+    t2 = t5 + t12;
+    t0 = t13 - t10;
+    t4 = t11 + t8;
+    t1 = t7 - t3;
+    t6 = t11 - t8;
+    t11 = t7 + t3;
+    t8 = t5 - t12;
+    t7 = t13 + t10;
+    re[60] = t9;
+    im[60] = t14;
+    re[92] = t2;
+    im[92] = t0;
+    re[124] = t4;
+    im[124] = t1;
+    re[156] = t6;
+    im[156] = t11;
+    re[28] = t8;
+    im[28] = t7;
+    t3 = re[65];
+    t5 = im[65];
+    t12 = re[97];
+    t13 = im[97];
+    t10 = re[129];
+    t9 = im[129];
+    t14 = re[1];
+    t2 = im[1];
+    t0 = re[33];
+    t4 = im[33];
+    t1 = t12 + t0;
+    t6 = t13 + t4;
+    t11 = t10 + t14;
+    t8 = t9 + t2;
+    t7 = t12 - t0;
+    t12 = t13 - t4;
+    t0 = t10 - t14;
+    t13 = t9 - t2;
+    t4 = t1 + t11;
+    t10 = t6 + t8;
+    t14 = t1 - t11;
+    t9 = C0 * t14;
+    t2 = t6 - t8;
+    t1 = C0 * t2;
+    t11 = C1 * t4;
+    t14 = t3 - t11;
+    t6 = C1 * t10;
+    t8 = t5 - t6;
+    t2 = t14 + t9;
+    t11 = t8 + t1;
+    t6 = t14 - t9;
+    t14 = t8 - t1;
+    t9 = C2 * t7;
+    t8 = C3 * t0;
+    t1 = t9 + t8;
+    t9 = C2 * t12;
+    t8 = C3 * t13;
+    t9 = t9 + t8;
+    t8 = C3 * t7;
+    t7 = C2 * t0;
+    t0 = t8 - t7;
+    t8 = C3 * t12;
+    t7 = C2 * t13;
+    t12 = t8 - t7;
+    t13 = t3 + t4;
+    t8 = t5 + t10;
+    t7 = t2 + t9;
+    t3 = t11 - t1;
+    t4 = t6 + t12;
+    t5 = t14 - t0;
+    t10 = t6 - t12;
+    t6 = t14 + t0;
+    t12 = t2 - t9;
+    t14 = t11 + t1;
+    re[65] = t13;
+    im[65] = t8;
+    re[97] = t7;
+    im[97] = t3;
+    re[129] = t4;
+    im[129] = t5;
+    re[1] = t10;
+    im[1] = t6;
+    re[33] = t12;
+    im[33] = t14;
+    t0 = re[70];
+    t2 = im[70];
+    t9 = re[102];
+    t11 = im[102];
+    t1 = re[134];
+    t13 = im[134];
+    t8 = re[6];
+    t7 = im[6];
+    t3 = re[38];
+    t4 = im[38];
+    t5 = t9 + t3;
+    t10 = t11 + t4;
+    t6 = t1 + t8;
+    t12 = t13 + t7;
+    t14 = t9 - t3;
+    t9 = t11 - t4;
+    t3 = t1 - t8;
+    t11 = t13 - t7;
+    t4 = t5 + t6;
+    t1 = t10 + t12;
+    t8 = t5 - t6;
+    t13 = C0 * t8;
+    t7 = t10 - t12;
+    t5 = C0 * t7;
+    t6 = C1 * t4;
+    t8 = t0 - t6;
+    t10 = C1 * t1;
+    t12 = t2 - t10;
+    t7 = t8 + t13;
+    t6 = t12 + t5;
+    t10 = t8 - t13;
+    t8 = t12 - t5;
+    t13 = C2 * t14;
+    t12 = C3 * t3;
+    t5 = t13 + t12;
+    t13 = C2 * t9;
+    t12 = C3 * t11;
+    t13 = t13 + t12;
+    t12 = C3 * t14;
+    t14 = C2 * t3;
+    t3 = t12 - t14;
+    t12 = C3 * t9;
+    t14 = C2 * t11;
+    t9 = t12 - t14;
+    t11 = t0 + t4;
+    t12 = t2 + t1;
+    t14 = t7 + t13;
+    t0 = t6 - t5;
+    t4 = t10 + t9;
+    t2 = t8 - t3;
+    t1 = t10 - t9;
+    t10 = t8 + t3;
+    t9 = t7 - t13;
+    t8 = t6 + t5;
+    re[70] = t11;
+    im[70] = t12;
+    re[102] = t14;
+    im[102] = t0;
+    re[134] = t4;
+    im[134] = t2;
+    re[6] = t1;
+    im[6] = t10;
+    re[38] = t9;
+    im[38] = t8;
+    t3 = re[75];
+    t7 = im[75];
+    t13 = re[107];
+    t6 = im[107];
+    t5 = re[139];
+    t11 = im[139];
+    t12 = re[11];
+    t14 = im[11];
+    t0 = re[43];
+    t4 = im[43];
+    t2 = t13 + t0;
+    t1 = t6 + t4;
+    t10 = t5 + t12;
+    t9 = t11 + t14;
+    t8 = t13 - t0;
+    t13 = t6 - t4;
+    t0 = t5 - t12;
+    t6 = t11 - t14;
+    t4 = t2 + t10;
+    t5 = t1 + t9;
+    t12 = t2 - t10;
+    t11 = C0 * t12;
+    t14 = t1 - t9;
+    t2 = C0 * t14;
+    t10 = C1 * t4;
+    t12 = t3 - t10;
+    t1 = C1 * t5;
+    t9 = t7 - t1;
+    t14 = t12 + t11;
+    t10 = t9 + t2;
+    t1 = t12 - t11;
+    t12 = t9 - t2;
+    t11 = C2 * t8;
+    t9 = C3 * t0;
+    t2 = t11 + t9;
+    t11 = C2 * t13;
+    t9 = C3 * t6;
+    t11 = t11 + t9;
+    t9 = C3 * t8;
+    t8 = C2 * t0;
+    t0 = t9 - t8;
+    t9 = C3 * t13;
+    t8 = C2 * t6;
+    t13 = t9 - t8;
+    t6 = t3 + t4;
+    t9 = t7 + t5;
+    t8 = t14 + t11;
+    t3 = t10 - t2;
+    t4 = t1 + t13;
+    t7 = t12 - t0;
+    t5 = t1 - t13;
+    t1 = t12 + t0;
+    t13 = t14 - t11;
+    t12 = t10 + t2;
+    re[75] = t6;
+    im[75] = t9;
+    re[107] = t8;
+    im[107] = t3;
+    re[139] = t4;
+    im[139] = t7;
+    re[11] = t5;
+    im[11] = t1;
+    re[43] = t13;
+    im[43] = t12;
+    t0 = re[80];
+    t14 = im[80];
+    t11 = re[112];
+    t10 = im[112];
+    t2 = re[144];
+    t6 = im[144];
+    t9 = re[16];
+    t8 = im[16];
+    t3 = re[48];
+    t4 = im[48];
+    t7 = t11 + t3;
+    t5 = t10 + t4;
+    t1 = t2 + t9;
+    t13 = t6 + t8;
+    t12 = t11 - t3;
+    t11 = t10 - t4;
+    t3 = t2 - t9;
+    t10 = t6 - t8;
+    t4 = t7 + t1;
+    t2 = t5 + t13;
+    t9 = t7 - t1;
+    t6 = C0 * t9;
+    t8 = t5 - t13;
+    t7 = C0 * t8;
+    t1 = C1 * t4;
+    t9 = t0 - t1;
+    t5 = C1 * t2;
+    t13 = t14 - t5;
+    t8 = t9 + t6;
+    t1 = t13 + t7;
+    t5 = t9 - t6;
+    t9 = t13 - t7;
+    t6 = C2 * t12;
+    t13 = C3 * t3;
+    t7 = t6 + t13;
+    t6 = C2 * t11;
+    t13 = C3 * t10;
+    t6 = t6 + t13;
+    t13 = C3 * t12;
+    t12 = C2 * t3;
+    t3 = t13 - t12;
+    t13 = C3 * t11;
+    t12 = C2 * t10;
+    t11 = t13 - t12;
+    t10 = t0 + t4;
+    t13 = t14 + t2;
+    t12 = t8 + t6;
+    t0 = t1 - t7;
+    t4 = t5 + t11;
+    t14 = t9 - t3;
+    t2 = t5 - t11;
+    t5 = t9 + t3;
+    t11 = t8 - t6;
+    t9 = t1 + t7;
+    re[80] = t10;
+    im[80] = t13;
+    re[112] = t12;
+    im[112] = t0;
+    re[144] = t4;
+    im[144] = t14;
+    re[16] = t2;
+    im[16] = t5;
+    re[48] = t11;
+    im[48] = t9;
+    t3 = re[85];
+    t8 = im[85];
+    t6 = re[117];
+    t1 = im[117];
+    t7 = re[149];
+    t10 = im[149];
+    t13 = re[21];
+    t12 = im[21];
+    t0 = re[53];
+    t4 = im[53];
+    t14 = t6 + t0;
+    t2 = t1 + t4;
+    t5 = t7 + t13;
+    t11 = t10 + t12;
+    t9 = t6 - t0;
+    t6 = t1 - t4;
+    t0 = t7 - t13;
+    t1 = t10 - t12;
+    t4 = t14 + t5;
+    t7 = t2 + t11;
+    t13 = t14 - t5;
+    t10 = C0 * t13;
+    t12 = t2 - t11;
+    t14 = C0 * t12;
+    t5 = C1 * t4;
+    t13 = t3 - t5;
+    t2 = C1 * t7;
+    t11 = t8 - t2;
+    t12 = t13 + t10;
+    t5 = t11 + t14;
+    t2 = t13 - t10;
+    t13 = t11 - t14;
+    t10 = C2 * t9;
+    t11 = C3 * t0;
+    t14 = t10 + t11;
+    t10 = C2 * t6;
+    t11 = C3 * t1;
+    t10 = t10 + t11;
+    t11 = C3 * t9;
+    t9 = C2 * t0;
+    t0 = t11 - t9;
+    t11 = C3 * t6;
+    t9 = C2 * t1;
+    t6 = t11 - t9;
+    t1 = t3 + t4;
+    t11 = t8 + t7;
+    t9 = t12 + t10;
+    t3 = t5 - t14;
+    t4 = t2 + t6;
+    t8 = t13 - t0;
+    t7 = t2 - t6;
+    t2 = t13 + t0;
+    t6 = t12 - t10;
+    t13 = t5 + t14;
+    re[85] = t1;
+    im[85] = t11;
+    re[117] = t9;
+    im[117] = t3;
+    re[149] = t4;
+    im[149] = t8;
+    re[21] = t7;
+    im[21] = t2;
+    re[53] = t6;
+    im[53] = t13;
+    t0 = re[90];
+    t12 = im[90];
+    t10 = re[122];
+    t5 = im[122];
+    t14 = re[154];
+    t1 = im[154];
+    t11 = re[26];
+    t9 = im[26];
+    t3 = re[58];
+    t4 = im[58];
+    t8 = t10 + t3;
+    t7 = t5 + t4;
+    t2 = t14 + t11;
+    t6 = t1 + t9;
+    t13 = t10 - t3;
+    t10 = t5 - t4;
+    t3 = t14 - t11;
+    t5 = t1 - t9;
+    t4 = t8 + t2;
+    t14 = t7 + t6;
+    t11 = t8 - t2;
+    t1 = C0 * t11;
+    t9 = t7 - t6;
+    t8 = C0 * t9;
+    t2 = C1 * t4;
+    t11 = t0 - t2;
+    t7 = C1 * t14;
+    t6 = t12 - t7;
+    t9 = t11 + t1;
+    t2 = t6 + t8;
+    t7 = t11 - t1;
+    t11 = t6 - t8;
+    t1 = C2 * t13;
+    t6 = C3 * t3;
+    t8 = t1 + t6;
+    t1 = C2 * t10;
+    t6 = C3 * t5;
+    t1 = t1 + t6;
+    t6 = C3 * t13;
+    t13 = C2 * t3;
+    t3 = t6 - t13;
+    t6 = C3 * t10;
+    t13 = C2 * t5;
+    t10 = t6 - t13;
+    t5 = t0 + t4;
+    t6 = t12 + t14;
+    t13 = t9 + t1;
+    t0 = t2 - t8;
+    t4 = t7 + t10;
+    t12 = t11 - t3;
+    t14 = t7 - t10;
+    t7 = t11 + t3;
+    t10 = t9 - t1;
+    t11 = t2 + t8;
+    re[90] = t5;
+    im[90] = t6;
+    re[122] = t13;
+    im[122] = t0;
+    re[154] = t4;
+    im[154] = t12;
+    re[26] = t14;
+    im[26] = t7;
+    re[58] = t10;
+    im[58] = t11;
+    t3 = re[95];
+    t9 = im[95];
+    t1 = re[127];
+    t2 = im[127];
+    t8 = re[159];
+    t5 = im[159];
+    t6 = re[31];
+    t13 = im[31];
+    t0 = re[63];
+    t4 = im[63];
+    t12 = t1 + t0;
+    t14 = t2 + t4;
+    t7 = t8 + t6;
+    t10 = t5 + t13;
+    t11 = t1 - t0;
+    t1 = t2 - t4;
+    t0 = t8 - t6;
+    t2 = t5 - t13;
+    t4 = t12 + t7;
+    t8 = t14 + t10;
+    t6 = t12 - t7;
+    t5 = C0 * t6;
+    t13 = t14 - t10;
+    t12 = C0 * t13;
+    t7 = C1 * t4;
+    t6 = t3 - t7;
+    t14 = C1 * t8;
+    t10 = t9 - t14;
+    t13 = t6 + t5;
+    t7 = t10 + t12;
+    t14 = t6 - t5;
+    t6 = t10 - t12;
+    t5 = C2 * t11;
+    t10 = C3 * t0;
+    t12 = t5 + t10;
+    t5 = C2 * t1;
+    t10 = C3 * t2;
+    t5 = t5 + t10;
+    t10 = C3 * t11;
+    t11 = C2 * t0;
+    t0 = t10 - t11;
+    t10 = C3 * t1;
+    t11 = C2 * t2;
+    t1 = t10 - t11;
+    t2 = t3 + t4;
+    t10 = t9 + t8;
+    t11 = t13 + t5;
+    t3 = t7 - t12;
+    t4 = t14 + t1;
+    t9 = t6 - t0;
+    t8 = t14 - t1;
+    t14 = t6 + t0;
+    t1 = t13 - t5;
+    t6 = t7 + t12;
+    re[95] = t2;
+    im[95] = t10;
+    re[127] = t11;
+    im[127] = t3;
+    re[159] = t4;
+    im[159] = t9;
+    re[31] = t8;
+    im[31] = t14;
+    re[63] = t1;
+    im[63] = t6;
+    t0 = re[100];
+    t13 = im[100];
+    t5 = re[132];
+    t7 = im[132];
+    t12 = re[4];
+    t2 = im[4];
+    t10 = re[36];
+    t11 = im[36];
+    t3 = re[68];
+    t4 = im[68];
+    t9 = t5 + t3;
+    t8 = t7 + t4;
+    t14 = t12 + t10;
+    t1 = t2 + t11;
+    t6 = t5 - t3;
+    t5 = t7 - t4;
+    t3 = t12 - t10;
+    t7 = t2 - t11;
+    t4 = t9 + t14;
+    t12 = t8 + t1;
+    t10 = t9 - t14;
+    t2 = C0 * t10;
+    t11 = t8 - t1;
+    t9 = C0 * t11;
+    t14 = C1 * t4;
+    t10 = t0 - t14;
+    t8 = C1 * t12;
+    t1 = t13 - t8;
+    t11 = t10 + t2;
+    t14 = t1 + t9;
+    t8 = t10 - t2;
+    t10 = t1 - t9;
+    t2 = C2 * t6;
+    t1 = C3 * t3;
+    t9 = t2 + t1;
+    t2 = C2 * t5;
+    t1 = C3 * t7;
+    t2 = t2 + t1;
+    t1 = C3 * t6;
+    t6 = C2 * t3;
+    t3 = t1 - t6;
+    t1 = C3 * t5;
+    t6 = C2 * t7;
+    t5 = t1 - t6;
+    t7 = t0 + t4;
+    t1 = t13 + t12;
+    t6 = t11 + t2;
+    t0 = t14 - t9;
+    t4 = t8 + t5;
+    t13 = t10 - t3;
+    t12 = t8 - t5;
+    t8 = t10 + t3;
+    t5 = t11 - t2;
+    t10 = t14 + t9;
+    re[100] = t7;
+    im[100] = t1;
+    re[132] = t6;
+    im[132] = t0;
+    re[4] = t4;
+    im[4] = t13;
+    re[36] = t12;
+    im[36] = t8;
+    re[68] = t5;
+    im[68] = t10;
+    t3 = re[105];
+    t11 = im[105];
+    t2 = re[137];
+    t14 = im[137];
+    t9 = re[9];
+    t7 = im[9];
+    t1 = re[41];
+    t6 = im[41];
+    t0 = re[73];
+    t4 = im[73];
+    t13 = t2 + t0;
+    t12 = t14 + t4;
+    t8 = t9 + t1;
+    t5 = t7 + t6;
+    t10 = t2 - t0;
+    t2 = t14 - t4;
+    t0 = t9 - t1;
+    t14 = t7 - t6;
+    t4 = t13 + t8;
+    t9 = t12 + t5;
+    t1 = t13 - t8;
+    t7 = C0 * t1;
+    t6 = t12 - t5;
+    t13 = C0 * t6;
+    t8 = C1 * t4;
+    t1 = t3 - t8;
+    t12 = C1 * t9;
+    t5 = t11 - t12;
+    t6 = t1 + t7;
+    t8 = t5 + t13;
+    t12 = t1 - t7;
+    t1 = t5 - t13;
+    t7 = C2 * t10;
+    t5 = C3 * t0;
+    t13 = t7 + t5;
+    t7 = C2 * t2;
+    t5 = C3 * t14;
+    t7 = t7 + t5;
+    t5 = C3 * t10;
+    t10 = C2 * t0;
+    t0 = t5 - t10;
+    t5 = C3 * t2;
+    t10 = C2 * t14;
+    t2 = t5 - t10;
+    t14 = t3 + t4;
+    t5 = t11 + t9;
+    t10 = t6 + t7;
+    t3 = t8 - t13;
+    t4 = t12 + t2;
+    t11 = t1 - t0;
+    t9 = t12 - t2;
+    t12 = t1 + t0;
+    t2 = t6 - t7;
+    t1 = t8 + t13;
+    re[105] = t14;
+    im[105] = t5;
+    re[137] = t10;
+    im[137] = t3;
+    re[9] = t4;
+    im[9] = t11;
+    re[41] = t9;
+    im[41] = t12;
+    re[73] = t2;
+    im[73] = t1;
+    t0 = re[110];
+    t6 = im[110];
+    t7 = re[142];
+    t8 = im[142];
+    t13 = re[14];
+    t14 = im[14];
+    t5 = re[46];
+    t10 = im[46];
+    t3 = re[78];
+    t4 = im[78];
+    t11 = t7 + t3;
+    t9 = t8 + t4;
+    t12 = t13 + t5;
+    t2 = t14 + t10;
+    t1 = t7 - t3;
+    t7 = t8 - t4;
+    t3 = t13 - t5;
+    t8 = t14 - t10;
+    t4 = t11 + t12;
+    t13 = t9 + t2;
+    t5 = t11 - t12;
+    t14 = C0 * t5;
+    t10 = t9 - t2;
+    t11 = C0 * t10;
+    t12 = C1 * t4;
+    t5 = t0 - t12;
+    t9 = C1 * t13;
+    t2 = t6 - t9;
+    t10 = t5 + t14;
+    t12 = t2 + t11;
+    t9 = t5 - t14;
+    t5 = t2 - t11;
+    t14 = C2 * t1;
+    t2 = C3 * t3;
+    t11 = t14 + t2;
+    t14 = C2 * t7;
+    t2 = C3 * t8;
+    t14 = t14 + t2;
+    t2 = C3 * t1;
+    t1 = C2 * t3;
+    t3 = t2 - t1;
+    t2 = C3 * t7;
+    t1 = C2 * t8;
+    t7 = t2 - t1;
+    t8 = t0 + t4;
+    t2 = t6 + t13;
+    t1 = t10 + t14;
+    t0 = t12 - t11;
+    t4 = t9 + t7;
+    t6 = t5 - t3;
+    t13 = t9 - t7;
+    t9 = t5 + t3;
+    t7 = t10 - t14;
+    t5 = t12 + t11;
+    re[110] = t8;
+    im[110] = t2;
+    re[142] = t1;
+    im[142] = t0;
+    re[14] = t4;
+    im[14] = t6;
+    re[46] = t13;
+    im[46] = t9;
+    re[78] = t7;
+    im[78] = t5;
+    t3 = re[115];
+    t10 = im[115];
+    t14 = re[147];
+    t12 = im[147];
+    t11 = re[19];
+    t8 = im[19];
+    t2 = re[51];
+    t1 = im[51];
+    t0 = re[83];
+    t4 = im[83];
+    t6 = t14 + t0;
+    t13 = t12 + t4;
+    t9 = t11 + t2;
+    t7 = t8 + t1;
+    t5 = t14 - t0;
+    t14 = t12 - t4;
+    t0 = t11 - t2;
+    t12 = t8 - t1;
+    t4 = t6 + t9;
+    t11 = t13 + t7;
+    t2 = t6 - t9;
+    t8 = C0 * t2;
+    t1 = t13 - t7;
+    t6 = C0 * t1;
+    t9 = C1 * t4;
+    t2 = t3 - t9;
+    t13 = C1 * t11;
+    t7 = t10 - t13;
+    t1 = t2 + t8;
+    t9 = t7 + t6;
+    t13 = t2 - t8;
+    t2 = t7 - t6;
+    t8 = C2 * t5;
+    t7 = C3 * t0;
+    t6 = t8 + t7;
+    t8 = C2 * t14;
+    t7 = C3 * t12;
+    t8 = t8 + t7;
+    t7 = C3 * t5;
+    t5 = C2 * t0;
+    t0 = t7 - t5;
+    t7 = C3 * t14;
+    t5 = C2 * t12;
+    t14 = t7 - t5;
+    t12 = t3 + t4;
+    t7 = t10 + t11;
+    t5 = t1 + t8;
+    t3 = t9 - t6;
+    t4 = t13 + t14;
+    t10 = t2 - t0;
+    t11 = t13 - t14;
+    t13 = t2 + t0;
+    t14 = t1 - t8;
+    t2 = t9 + t6;
+    re[115] = t12;
+    im[115] = t7;
+    re[147] = t5;
+    im[147] = t3;
+    re[19] = t4;
+    im[19] = t10;
+    re[51] = t11;
+    im[51] = t13;
+    re[83] = t14;
+    im[83] = t2;
+    t0 = re[120];
+    t1 = im[120];
+    t8 = re[152];
+    t9 = im[152];
+    t6 = re[24];
+    t12 = im[24];
+    t7 = re[56];
+    t5 = im[56];
+    t3 = re[88];
+    t4 = im[88];
+    t10 = t8 + t3;
+    t11 = t9 + t4;
+    t13 = t6 + t7;
+    t14 = t12 + t5;
+    t2 = t8 - t3;
+    t8 = t9 - t4;
+    t3 = t6 - t7;
+    t9 = t12 - t5;
+    t4 = t10 + t13;
+    t6 = t11 + t14;
+    t7 = t10 - t13;
+    t12 = C0 * t7;
+    t5 = t11 - t14;
+    t10 = C0 * t5;
+    t13 = C1 * t4;
+    t7 = t0 - t13;
+    t11 = C1 * t6;
+    t14 = t1 - t11;
+    t5 = t7 + t12;
+    t13 = t14 + t10;
+    t11 = t7 - t12;
+    t7 = t14 - t10;
+    t12 = C2 * t2;
+    t14 = C3 * t3;
+    t10 = t12 + t14;
+    t12 = C2 * t8;
+    t14 = C3 * t9;
+    t12 = t12 + t14;
+    t14 = C3 * t2;
+    t2 = C2 * t3;
+    t3 = t14 - t2;
+    t14 = C3 * t8;
+    t2 = C2 * t9;
+    t8 = t14 - t2;
+    t9 = t0 + t4;
+    t14 = t1 + t6;
+    t2 = t5 + t12;
+    t0 = t13 - t10;
+    t4 = t11 + t8;
+    t1 = t7 - t3;
+    t6 = t11 - t8;
+    t11 = t7 + t3;
+    t8 = t5 - t12;
+    t7 = t13 + t10;
+    re[120] = t9;
+    im[120] = t14;
+    re[152] = t2;
+    im[152] = t0;
+    re[24] = t4;
+    im[24] = t1;
+    re[56] = t6;
+    im[56] = t11;
+    re[88] = t8;
+    im[88] = t7;
+    t3 = re[125];
+    t5 = im[125];
+    t12 = re[157];
+    t13 = im[157];
+    t10 = re[29];
+    t9 = im[29];
+    t14 = re[61];
+    t2 = im[61];
+    t0 = re[93];
+    t4 = im[93];
+    t1 = t12 + t0;
+    t6 = t13 + t4;
+    t11 = t10 + t14;
+    t8 = t9 + t2;
+    t7 = t12 - t0;
+    t12 = t13 - t4;
+    t0 = t10 - t14;
+    t13 = t9 - t2;
+    t4 = t1 + t11;
+    t10 = t6 + t8;
+    t14 = t1 - t11;
+    t9 = C0 * t14;
+    t2 = t6 - t8;
+    t1 = C0 * t2;
+    t11 = C1 * t4;
+    t14 = t3 - t11;
+    t6 = C1 * t10;
+    t8 = t5 - t6;
+    t2 = t14 + t9;
+    t11 = t8 + t1;
+    t6 = t14 - t9;
+    t14 = t8 - t1;
+    t9 = C2 * t7;
+    t8 = C3 * t0;
+    t1 = t9 + t8;
+    t9 = C2 * t12;
+    t8 = C3 * t13;
+    t9 = t9 + t8;
+    t8 = C3 * t7;
+    t7 = C2 * t0;
+    t0 = t8 - t7;
+    t8 = C3 * t12;
+    t7 = C2 * t13;
+    t12 = t8 - t7;
+    t13 = t3 + t4;
+    t8 = t5 + t10;
+    t7 = t2 + t9;
+    t3 = t11 - t1;
+    t4 = t6 + t12;
+    t5 = t14 - t0;
+    t10 = t6 - t12;
+    t6 = t14 + t0;
+    t12 = t2 - t9;
+    t14 = t11 + t1;
+    re[125] = t13;
+    im[125] = t8;
+    re[157] = t7;
+    im[157] = t3;
+    re[29] = t4;
+    im[29] = t5;
+    re[61] = t10;
+    im[61] = t6;
+    re[93] = t12;
+    im[93] = t14;
+    t0 = re[130];
+    t2 = im[130];
+    t9 = re[2];
+    t11 = im[2];
+    t1 = re[34];
+    t13 = im[34];
+    t8 = re[66];
+    t7 = im[66];
+    t3 = re[98];
+    t4 = im[98];
+    t5 = t9 + t3;
+    t10 = t11 + t4;
+    t6 = t1 + t8;
+    t12 = t13 + t7;
+    t14 = t9 - t3;
+    t9 = t11 - t4;
+    t3 = t1 - t8;
+    t11 = t13 - t7;
+    t4 = t5 + t6;
+    t1 = t10 + t12;
+    t8 = t5 - t6;
+    t13 = C0 * t8;
+    t7 = t10 - t12;
+    t5 = C0 * t7;
+    t6 = C1 * t4;
+    t8 = t0 - t6;
+    t10 = C1 * t1;
+    t12 = t2 - t10;
+    t7 = t8 + t13;
+    t6 = t12 + t5;
+    t10 = t8 - t13;
+    t8 = t12 - t5;
+    t13 = C2 * t14;
+    t12 = C3 * t3;
+    t5 = t13 + t12;
+    t13 = C2 * t9;
+    t12 = C3 * t11;
+    t13 = t13 + t12;
+    t12 = C3 * t14;
+    t14 = C2 * t3;
+    t3 = t12 - t14;
+    t12 = C3 * t9;
+    t14 = C2 * t11;
+    t9 = t12 - t14;
+    t11 = t0 + t4;
+    t12 = t2 + t1;
+    t14 = t7 + t13;
+    t0 = t6 - t5;
+    t4 = t10 + t9;
+    t2 = t8 - t3;
+    t1 = t10 - t9;
+    t10 = t8 + t3;
+    t9 = t7 - t13;
+    t8 = t6 + t5;
+    re[130] = t11;
+    im[130] = t12;
+    re[2] = t14;
+    im[2] = t0;
+    re[34] = t4;
+    im[34] = t2;
+    re[66] = t1;
+    im[66] = t10;
+    re[98] = t9;
+    im[98] = t8;
+    t3 = re[135];
+    t7 = im[135];
+    t13 = re[7];
+    t6 = im[7];
+    t5 = re[39];
+    t11 = im[39];
+    t12 = re[71];
+    t14 = im[71];
+    t0 = re[103];
+    t4 = im[103];
+    t2 = t13 + t0;
+    t1 = t6 + t4;
+    t10 = t5 + t12;
+    t9 = t11 + t14;
+    t8 = t13 - t0;
+    t13 = t6 - t4;
+    t0 = t5 - t12;
+    t6 = t11 - t14;
+    t4 = t2 + t10;
+    t5 = t1 + t9;
+    t12 = t2 - t10;
+    t11 = C0 * t12;
+    t14 = t1 - t9;
+    t2 = C0 * t14;
+    t10 = C1 * t4;
+    t12 = t3 - t10;
+    t1 = C1 * t5;
+    t9 = t7 - t1;
+    t14 = t12 + t11;
+    t10 = t9 + t2;
+    t1 = t12 - t11;
+    t12 = t9 - t2;
+    t11 = C2 * t8;
+    t9 = C3 * t0;
+    t2 = t11 + t9;
+    t11 = C2 * t13;
+    t9 = C3 * t6;
+    t11 = t11 + t9;
+    t9 = C3 * t8;
+    t8 = C2 * t0;
+    t0 = t9 - t8;
+    t9 = C3 * t13;
+    t8 = C2 * t6;
+    t13 = t9 - t8;
+    t6 = t3 + t4;
+    t9 = t7 + t5;
+    t8 = t14 + t11;
+    t3 = t10 - t2;
+    t4 = t1 + t13;
+    t7 = t12 - t0;
+    t5 = t1 - t13;
+    t1 = t12 + t0;
+    t13 = t14 - t11;
+    t12 = t10 + t2;
+    re[135] = t6;
+    im[135] = t9;
+    re[7] = t8;
+    im[7] = t3;
+    re[39] = t4;
+    im[39] = t7;
+    re[71] = t5;
+    im[71] = t1;
+    re[103] = t13;
+    im[103] = t12;
+    t0 = re[140];
+    t14 = im[140];
+    t11 = re[12];
+    t10 = im[12];
+    t2 = re[44];
+    t6 = im[44];
+    t9 = re[76];
+    t8 = im[76];
+    t3 = re[108];
+    t4 = im[108];
+    t7 = t11 + t3;
+    t5 = t10 + t4;
+    t1 = t2 + t9;
+    t13 = t6 + t8;
+    t12 = t11 - t3;
+    t11 = t10 - t4;
+    t3 = t2 - t9;
+    t10 = t6 - t8;
+    t4 = t7 + t1;
+    t2 = t5 + t13;
+    t9 = t7 - t1;
+    t6 = C0 * t9;
+    t8 = t5 - t13;
+    t7 = C0 * t8;
+    t1 = C1 * t4;
+    t9 = t0 - t1;
+    t5 = C1 * t2;
+    t13 = t14 - t5;
+    t8 = t9 + t6;
+    t1 = t13 + t7;
+    t5 = t9 - t6;
+    t9 = t13 - t7;
+    t6 = C2 * t12;
+    t13 = C3 * t3;
+    t7 = t6 + t13;
+    t6 = C2 * t11;
+    t13 = C3 * t10;
+    t6 = t6 + t13;
+    t13 = C3 * t12;
+    t12 = C2 * t3;
+    t3 = t13 - t12;
+    t13 = C3 * t11;
+    t12 = C2 * t10;
+    t11 = t13 - t12;
+    t10 = t0 + t4;
+    t13 = t14 + t2;
+    t12 = t8 + t6;
+    t0 = t1 - t7;
+    t4 = t5 + t11;
+    t14 = t9 - t3;
+    t2 = t5 - t11;
+    t5 = t9 + t3;
+    t11 = t8 - t6;
+    t9 = t1 + t7;
+    re[140] = t10;
+    im[140] = t13;
+    re[12] = t12;
+    im[12] = t0;
+    re[44] = t4;
+    im[44] = t14;
+    re[76] = t2;
+    im[76] = t5;
+    re[108] = t11;
+    im[108] = t9;
+    t3 = re[145];
+    t8 = im[145];
+    t6 = re[17];
+    t1 = im[17];
+    t7 = re[49];
+    t10 = im[49];
+    t13 = re[81];
+    t12 = im[81];
+    t0 = re[113];
+    t4 = im[113];
+    t14 = t6 + t0;
+    t2 = t1 + t4;
+    t5 = t7 + t13;
+    t11 = t10 + t12;
+    t9 = t6 - t0;
+    t6 = t1 - t4;
+    t0 = t7 - t13;
+    t1 = t10 - t12;
+    t4 = t14 + t5;
+    t7 = t2 + t11;
+    t13 = t14 - t5;
+    t10 = C0 * t13;
+    t12 = t2 - t11;
+    t14 = C0 * t12;
+    t5 = C1 * t4;
+    t13 = t3 - t5;
+    t2 = C1 * t7;
+    t11 = t8 - t2;
+    t12 = t13 + t10;
+    t5 = t11 + t14;
+    t2 = t13 - t10;
+    t13 = t11 - t14;
+    t10 = C2 * t9;
+    t11 = C3 * t0;
+    t14 = t10 + t11;
+    t10 = C2 * t6;
+    t11 = C3 * t1;
+    t10 = t10 + t11;
+    t11 = C3 * t9;
+    t9 = C2 * t0;
+    t0 = t11 - t9;
+    t11 = C3 * t6;
+    t9 = C2 * t1;
+    t6 = t11 - t9;
+    t1 = t3 + t4;
+    t11 = t8 + t7;
+    t9 = t12 + t10;
+    t3 = t5 - t14;
+    t4 = t2 + t6;
+    t8 = t13 - t0;
+    t7 = t2 - t6;
+    t2 = t13 + t0;
+    t6 = t12 - t10;
+    t13 = t5 + t14;
+    re[145] = t1;
+    im[145] = t11;
+    re[17] = t9;
+    im[17] = t3;
+    re[49] = t4;
+    im[49] = t8;
+    re[81] = t7;
+    im[81] = t2;
+    re[113] = t6;
+    im[113] = t13;
+    t0 = re[150];
+    t12 = im[150];
+    t10 = re[22];
+    t5 = im[22];
+    t14 = re[54];
+    t1 = im[54];
+    t11 = re[86];
+    t9 = im[86];
+    t3 = re[118];
+    t4 = im[118];
+    t8 = t10 + t3;
+    t7 = t5 + t4;
+    t2 = t14 + t11;
+    t6 = t1 + t9;
+    t13 = t10 - t3;
+    t10 = t5 - t4;
+    t3 = t14 - t11;
+    t5 = t1 - t9;
+    t4 = t8 + t2;
+    t14 = t7 + t6;
+    t11 = t8 - t2;
+    t1 = C0 * t11;
+    t9 = t7 - t6;
+    t8 = C0 * t9;
+    t2 = C1 * t4;
+    t11 = t0 - t2;
+    t7 = C1 * t14;
+    t6 = t12 - t7;
+    t9 = t11 + t1;
+    t2 = t6 + t8;
+    t7 = t11 - t1;
+    t11 = t6 - t8;
+    t1 = C2 * t13;
+    t6 = C3 * t3;
+    t8 = t1 + t6;
+    t1 = C2 * t10;
+    t6 = C3 * t5;
+    t1 = t1 + t6;
+    t6 = C3 * t13;
+    t13 = C2 * t3;
+    t3 = t6 - t13;
+    t6 = C3 * t10;
+    t13 = C2 * t5;
+    t10 = t6 - t13;
+    t5 = t0 + t4;
+    t6 = t12 + t14;
+    t13 = t9 + t1;
+    t0 = t2 - t8;
+    t4 = t7 + t10;
+    t12 = t11 - t3;
+    t14 = t7 - t10;
+    t7 = t11 + t3;
+    t10 = t9 - t1;
+    t11 = t2 + t8;
+    re[150] = t5;
+    im[150] = t6;
+    re[22] = t13;
+    im[22] = t0;
+    re[54] = t4;
+    im[54] = t12;
+    re[86] = t14;
+    im[86] = t7;
+    re[118] = t10;
+    im[118] = t11;
+    t3 = re[155];
+    t9 = im[155];
+    t1 = re[27];
+    t2 = im[27];
+    t8 = re[59];
+    t5 = im[59];
+    t6 = re[91];
+    t13 = im[91];
+    t0 = re[123];
+    t4 = im[123];
+    t12 = t1 + t0;
+    t14 = t2 + t4;
+    t7 = t8 + t6;
+    t10 = t5 + t13;
+    t11 = t1 - t0;
+    t1 = t2 - t4;
+    t0 = t8 - t6;
+    t2 = t5 - t13;
+    t4 = t12 + t7;
+    t8 = t14 + t10;
+    t6 = t12 - t7;
+    t5 = C0 * t6;
+    t13 = t14 - t10;
+    t12 = C0 * t13;
+    t7 = C1 * t4;
+    t6 = t3 - t7;
+    t14 = C1 * t8;
+    t10 = t9 - t14;
+    t13 = t6 + t5;
+    t7 = t10 + t12;
+    t14 = t6 - t5;
+    t6 = t10 - t12;
+    t5 = C2 * t11;
+    t10 = C3 * t0;
+    t12 = t5 + t10;
+    t5 = C2 * t1;
+    t10 = C3 * t2;
+    t5 = t5 + t10;
+    t10 = C3 * t11;
+    t11 = C2 * t0;
+    t0 = t10 - t11;
+    t10 = C3 * t1;
+    t11 = C2 * t2;
+    t1 = t10 - t11;
+    t2 = t3 + t4;
+    t10 = t9 + t8;
+    t11 = t13 + t5;
+    t3 = t7 - t12;
+    t4 = t14 + t1;
+    t9 = t6 - t0;
+    t8 = t14 - t1;
+    t14 = t6 + t0;
+    t1 = t13 - t5;
+    t6 = t7 + t12;
+    re[155] = t2;
+    im[155] = t10;
+    re[27] = t11;
+    im[27] = t3;
+    re[59] = t4;
+    im[59] = t9;
+    re[91] = t8;
+    im[91] = t14;
+    re[123] = t1;
+    im[123] = t6;
+    t0 = re[0];
+    t13 = im[0];
+    t5 = re[40];
+    t7 = im[40];
+    t12 = re[80];
+    t2 = im[80];
+    t10 = re[120];
+    t11 = im[120];
+    t3 = t0 + t12;
+    t4 = t13 + t2;
+    t9 = t5 + t10;
+    t8 = t7 + t11;
+    t14 = t0 - t12;
+    t1 = t13 - t2;
+    t6 = t5 - t10;
+    t0 = t7 - t11;
+    t12 = t3 + t9;
+    t13 = t4 + t8;
+    t2 = t14 + t0;
+    t5 = t1 - t6;
+    t10 = t3 - t9;
+    t7 = t4 - t8;
+    t11 = t14 - t0;
+    t3 = t1 + t6;
+    re[0] = t12;
+    im[0] = t13;
+    re[40] = t2;
+    im[40] = t5;
+    re[80] = t10;
+    im[80] = t7;
+    re[120] = t11;
+    im[120] = t3;
+    t9 = re[5];
+    t4 = im[5];
+    t8 = re[45];
+    t14 = im[45];
+    t0 = re[85];
+    t1 = im[85];
+    t6 = re[125];
+    t12 = im[125];
+    t13 = t9 + t0;
+    t2 = t4 + t1;
+    t5 = t8 + t6;
+    t10 = t14 + t12;
+    t7 = t9 - t0;
+    t11 = t4 - t1;
+    t3 = t8 - t6;
+    t9 = t14 - t12;
+    t0 = t13 + t5;
+    t4 = t2 + t10;
+    t1 = t7 + t9;
+    t8 = t11 - t3;
+    t6 = t13 - t5;
+    t14 = t2 - t10;
+    t12 = t7 - t9;
+    t13 = t11 + t3;
+    t5 = t1 + t8;
+    t2 = C4 * t5;
+    t10 = t1 * (-C5);
+    t7 = t8 * C6;
+    t9 = t2 - t7;
+    t11 = t2 + t10;
+    t3 = t6 + t14;
+    t5 = C7 * t3;
+    t1 = t6 * (-C8);
+    t8 = t14 * C9;
+    t7 = t5 - t8;
+    t2 = t5 + t1;
+    t10 = t12 + t13;
+    t3 = C10 * t10;
+    t6 = t12 * (-C11);
+    t14 = t13 * C12;
+    t8 = t3 - t14;
+    t5 = t3 + t6;
+    re[5] = t0;
+    im[5] = t4;
+    re[45] = t9;
+    im[45] = t11;
+    re[85] = t7;
+    im[85] = t2;
+    re[125] = t8;
+    im[125] = t5;
+    t1 = re[10];
+    t10 = im[10];
+    t12 = re[50];
+    t13 = im[50];
+    t14 = re[90];
+    t3 = im[90];
+    t6 = re[130];
+    t0 = im[130];
+    t4 = t1 + t14;
+    t9 = t10 + t3;
+    t11 = t12 + t6;
+    t7 = t13 + t0;
+    t2 = t1 - t14;
+    t8 = t10 - t3;
+    t5 = t12 - t6;
+    t1 = t13 - t0;
+    t14 = t4 + t11;
+    t10 = t9 + t7;
+    t3 = t2 + t1;
+    t12 = t8 - t5;
+    t6 = t4 - t11;
+    t13 = t9 - t7;
+    t0 = t2 - t1;
+    t4 = t8 + t5;
+    t11 = t3 + t12;
+    t9 = C7 * t11;
+    t7 = t3 * (-C8);
+    t2 = t12 * C9;
+    t1 = t9 - t2;
+    t8 = t9 + t7;
+    t5 = t6 + t13;
+    t11 = t6 - t13;
+    t3 = C13 * t5;
+    t12 = (-C13) * t11;
+    t2 = t0 + t4;
+    t9 = C14 * t2;
+    t7 = t0 * (-C8);
+    t6 = t4 * (-C9);
+    t13 = t9 - t6;
+    t5 = t9 + t7;
+    re[10] = t14;
+    im[10] = t10;
+    re[50] = t1;
+    im[50] = t8;
+    re[90] = t3;
+    im[90] = t12;
+    re[130] = t13;
+    im[130] = t5;
+    t11 = re[15];
+    t2 = im[15];
+    t0 = re[55];
+    t4 = im[55];
+    t6 = re[95];
+    t9 = im[95];
+    t7 = re[135];
+    t14 = im[135];
+    t10 = t11 + t6;
+    t1 = t2 + t9;
+    t8 = t0 + t7;
+    t3 = t4 + t14;
+    t12 = t11 - t6;
+    t13 = t2 - t9;
+    t5 = t0 - t7;
+    t11 = t4 - t14;
+    t6 = t10 + t8;
+    t2 = t1 + t3;
+    t9 = t12 + t11;
+    t0 = t13 - t5;
+    t7 = t10 - t8;
+    t4 = t1 - t3;
+    t14 = t12 - t11;
+    t10 = t13 + t5;
+    t8 = t9 + t0;
+    t1 = C10 * t8;
+    t3 = t9 * (-C11);
+    t12 = t0 * C12;
+    t11 = t1 - t12;
+    t13 = t1 + t3;
+    t5 = t7 + t4;
+    t8 = C14 * t5;
+    t9 = t7 * (-C8);
+    t0 = t4 * (-C9);
+    t12 = t8 - t0;
+    t1 = t8 + t9;
+    t3 = t14 + t10;
+    t5 = (-C15) * t3;
+    t7 = t14 * (-C6);
+    t4 = t10 * (-C5);
+    t0 = t5 - t4;
+    t8 = t5 + t7;
+    re[15] = t6;
+    im[15] = t2;
+    re[55] = t11;
+    im[55] = t13;
+    re[95] = t12;
+    im[95] = t1;
+    re[135] = t0;
+    im[135] = t8;
+    t9 = re[20];
+    t3 = im[20];
+    t14 = re[60];
+    t10 = im[60];
+    t4 = re[100];
+    t5 = im[100];
+    t7 = re[140];
+    t6 = im[140];
+    t2 = t9 + t4;
+    t11 = t3 + t5;
+    t13 = t14 + t7;
+    t12 = t10 + t6;
+    t1 = t9 - t4;
+    t0 = t3 - t5;
+    t8 = t14 - t7;
+    t9 = t10 - t6;
+    t4 = t2 + t13;
+    t3 = t11 + t12;
+    t5 = t1 + t9;
+    t14 = t0 - t8;
+    t7 = t2 - t13;
+    t10 = t11 - t12;
+    t6 = t1 - t9;
+    t2 = t0 + t8;
+    t13 = t5 + t14;
+    t11 = t5 - t14;
+    t12 = C13 * t13;
+    t1 = (-C13) * t11;
+    t9 = -t7;
+    t0 = t6 - t2;
+    t8 = t6 + t2;
+    t5 = (-C13) * t0;
+    t14 = (-C13) * t8;
+    re[20] = t4;
+    im[20] = t3;
+    re[60] = t12;
+    im[60] = t1;
+    re[100] = t10;
+    im[100] = t9;
+    re[140] = t5;
+    im[140] = t14;
+    t13 = re[25];
+    t11 = im[25];
+    t7 = re[65];
+    t6 = im[65];
+    t2 = re[105];
+    t0 = im[105];
+    t8 = re[145];
+    t4 = im[145];
+    t3 = t13 + t2;
+    t12 = t11 + t0;
+    t1 = t7 + t8;
+    t10 = t6 + t4;
+    t9 = t13 - t2;
+    t5 = t11 - t0;
+    t14 = t7 - t8;
+    t13 = t6 - t4;
+    t2 = t3 + t1;
+    t11 = t12 + t10;
+    t0 = t9 + t13;
+    t7 = t5 - t14;
+    t8 = t3 - t1;
+    t6 = t12 - t10;
+    t4 = t9 - t13;
+    t3 = t5 + t14;
+    t1 = t0 + t7;
+    t12 = C16 * t1;
+    t10 = t0 * (-C11);
+    t9 = t7 * (-C12);
+    t13 = t12 - t9;
+    t5 = t12 + t10;
+    t14 = t8 + t6;
+    t1 = (-C14) * t14;
+    t0 = t8 * (-C9);
+    t7 = t6 * (-C8);
+    t9 = t1 - t7;
+    t12 = t1 + t0;
+    t10 = t4 + t3;
+    t14 = (-C4) * t10;
+    t8 = t4 * C6;
+    t6 = t3 * (-C5);
+    t7 = t14 - t6;
+    t1 = t14 + t8;
+    re[25] = t2;
+    im[25] = t11;
+    re[65] = t13;
+    im[65] = t5;
+    re[105] = t9;
+    im[105] = t12;
+    re[145] = t7;
+    im[145] = t1;
+    t0 = re[30];
+    t10 = im[30];
+    t4 = re[70];
+    t3 = im[70];
+    t6 = re[110];
+    t14 = im[110];
+    t8 = re[150];
+    t2 = im[150];
+    t11 = t0 + t6;
+    t13 = t10 + t14;
+    t5 = t4 + t8;
+    t9 = t3 + t2;
+    t12 = t0 - t6;
+    t7 = t10 - t14;
+    t1 = t4 - t8;
+    t0 = t3 - t2;
+    t6 = t11 + t5;
+    t10 = t13 + t9;
+    t14 = t12 + t0;
+    t4 = t7 - t1;
+    t8 = t11 - t5;
+    t3 = t13 - t9;
+    t2 = t12 - t0;
+    t11 = t7 + t1;
+    t5 = t14 + t4;
+    t13 = C14 * t5;
+    t9 = t14 * (-C8);
+    t12 = t4 * (-C9);
+    t0 = t13 - t12;
+    t7 = t13 + t9;
+    t1 = t8 - t3;
+    t5 = t8 + t3;
+    t14 = (-C13) * t1;
+    t4 = (-C13) * t5;
+    t12 = t2 + t11;
+    t13 = (-C7) * t12;
+    t9 = t2 * C8;
+    t8 = t11 * (-C9);
+    t3 = t13 - t8;
+    t1 = t13 + t9;
+    re[30] = t6;
+    im[30] = t10;
+    re[70] = t0;
+    im[70] = t7;
+    re[110] = t14;
+    im[110] = t4;
+    re[150] = t3;
+    im[150] = t1;
+    t5 = re[35];
+    t12 = im[35];
+    t2 = re[75];
+    t11 = im[75];
+    t8 = re[115];
+    t13 = im[115];
+    t9 = re[155];
+    t6 = im[155];
+    t10 = t5 + t8;
+    t0 = t12 + t13;
+    t7 = t2 + t9;
+    t14 = t11 + t6;
+    t4 = t5 - t8;
+    t3 = t12 - t13;
+    t1 = t2 - t9;
+    t5 = t11 - t6;
+    t8 = t10 + t7;
+    t12 = t0 + t14;
+    t13 = t4 + t5;
+    t2 = t3 - t1;
+    t9 = t10 - t7;
+    t11 = t0 - t14;
+    t6 = t4 - t5;
+    t10 = t3 + t1;
+    t7 = t13 + t2;
+    t0 = C15 * t7;
+    t14 = t13 * (-C5);
+    t4 = t2 * (-C6);
+    t5 = t0 - t4;
+    t3 = t0 + t14;
+    t1 = t9 + t11;
+    t7 = (-C7) * t1;
+    t13 = t9 * C9;
+    t2 = t11 * (-C8);
+    t4 = t7 - t2;
+    t0 = t7 + t13;
+    t14 = t6 + t10;
+    t1 = (-C16) * t14;
+    t9 = t6 * C11;
+    t11 = t10 * C12;
+    t2 = t1 - t11;
+    t7 = t1 + t9;
+    re[35] = t8;
+    im[35] = t12;
+    re[75] = t5;
+    im[75] = t3;
+    re[115] = t4;
+    im[115] = t0;
+    re[155] = t2;
+    im[155] = t7;
+    t13 = re[0];
+    t14 = im[0];
+    t6 = re[10];
+    t10 = im[10];
+    t11 = re[20];
+    t1 = im[20];
+    t9 = re[30];
+    t8 = im[30];
+    t12 = t13 + t11;
+    t5 = t14 + t1;
+    t3 = t6 + t9;
+    t4 = t10 + t8;
+    t0 = t13 - t11;
+    t2 = t14 - t1;
+    t7 = t6 - t9;
+    t13 = t10 - t8;
+    t11 = t12 + t3;
+    t14 = t5 + t4;
+    t1 = t0 + t13;
+    t6 = t2 - t7;
+    t9 = t12 - t3;
+    t10 = t5 - t4;
+    t8 = t0 - t13;
+    t12 = t2 + t7;
+    re[0] = t11;
+    im[0] = t14;
+    re[10] = t1;
+    im[10] = t6;
+    re[20] = t9;
+    im[20] = t10;
+    re[30] = t8;
+    im[30] = t12;
+    t3 = re[5];
+    t5 = im[5];
+    t4 = re[15];
+    t0 = im[15];
+    t13 = re[25];
+    t2 = im[25];
+    t7 = re[35];
+    t11 = im[35];
+    t14 = t3 + t13;
+    t1 = t5 + t2;
+    t6 = t4 + t7;
+    t9 = t0 + t11;
+    t10 = t3 - t13;
+    t8 = t5 - t2;
+    t12 = t4 - t7;
+    t3 = t0 - t11;
+    t13 = t14 + t6;
+    t5 = t1 + t9;
+    t2 = t10 + t3;
+    t4 = t8 - t12;
+    t7 = t14 - t6;
+    t0 = t1 - t9;
+    t11 = t10 - t3;
+    t14 = t8 + t12;
+    t6 = t2 + t4;
+    t1 = t2 - t4;
+    t9 = C13 * t6;
+    t10 = (-C13) * t1;
+    t3 = -t7;
+    t8 = t11 - t14;
+    t12 = t11 + t14;
+    t2 = (-C13) * t8;
+    t4 = (-C13) * t12;
+    re[5] = t13;
+    im[5] = t5;
+    re[15] = t9;
+    im[15] = t10;
+    re[25] = t0;
+    im[25] = t3;
+    re[35] = t2;
+    im[35] = t4;
+    t6 = re[0];
+    t1 = im[0];
+    t7 = re[5];
+    t11 = im[5];
+    t14 = t6 - t7;
+    t8 = t1 - t11;
+    t12 = t6 + t7;
+    t13 = t1 + t11;
+    re[0] = t12;
+    im[0] = t13;
+    re[5] = t14;
+    im[5] = t8;
+    t5 = re[10];
+    t9 = im[10];
+    t10 = re[15];
+    t0 = im[15];
+    t3 = t5 - t10;
+    t2 = t9 - t0;
+    t4 = t5 + t10;
+    t6 = t9 + t0;
+    re[10] = t4;
+    im[10] = t6;
+    re[15] = t3;
+    im[15] = t2;
+    t7 = re[20];
+    t1 = im[20];
+    t11 = re[25];
+    t12 = im[25];
+    t13 = t7 - t11;
+    t14 = t1 - t12;
+    t8 = t7 + t11;
+    t5 = t1 + t12;
+    re[20] = t8;
+    im[20] = t5;
+    re[25] = t13;
+    im[25] = t14;
+    t10 = re[30];
+    t9 = im[30];
+    t0 = re[35];
+    t4 = im[35];
+    t6 = t10 - t0;
+    t3 = t9 - t4;
+    t2 = t10 + t0;
+    t7 = t9 + t4;
+    re[30] = t2;
+    im[30] = t7;
+    re[35] = t6;
+    im[35] = t3;
+    t11 = re[40];
+    t1 = im[40];
+    t12 = re[50];
+    t8 = im[50];
+    t5 = re[60];
+    t13 = im[60];
+    t14 = re[70];
+    t10 = im[70];
+    t0 = t11 + t5;
+    t9 = t1 + t13;
+    t4 = t12 + t14;
+    t2 = t8 + t10;
+    t7 = t11 - t5;
+    t6 = t1 - t13;
+    t3 = t12 - t14;
+    t11 = t8 - t10;
+    t5 = t0 + t4;
+    t1 = t9 + t2;
+    t13 = t7 + t11;
+    t12 = t6 - t3;
+    t14 = t0 - t4;
+    t8 = t9 - t2;
+    t10 = t7 - t11;
+    t0 = t6 + t3;
+    re[40] = t5;
+    im[40] = t1;
+    re[50] = t13;
+    im[50] = t12;
+    re[60] = t14;
+    im[60] = t8;
+    re[70] = t10;
+    im[70] = t0;
+    t4 = re[45];
+    t9 = im[45];
+    t2 = re[55];
+    t7 = im[55];
+    t11 = re[65];
+    t6 = im[65];
+    t3 = re[75];
+    t5 = im[75];
+    t1 = t4 + t11;
+    t13 = t9 + t6;
+    t12 = t2 + t3;
+    t14 = t7 + t5;
+    t8 = t4 - t11;
+    t10 = t9 - t6;
+    t0 = t2 - t3;
+    t4 = t7 - t5;
+    t11 = t1 + t12;
+    t9 = t13 + t14;
+    t6 = t8 + t4;
+    t2 = t10 - t0;
+    t3 = t1 - t12;
+    t7 = t13 - t14;
+    t5 = t8 - t4;
+    t1 = t10 + t0;
+    t12 = t6 + t2;
+    t13 = t6 - t2;
+    t14 = C13 * t12;
+    t8 = (-C13) * t13;
+    t4 = -t3;
+    t10 = t5 - t1;
+    t0 = t5 + t1;
+    t6 = (-C13) * t10;
+    t2 = (-C13) * t0;
+    re[45] = t11;
+    im[45] = t9;
+    re[55] = t14;
+    im[55] = t8;
+    re[65] = t7;
+    im[65] = t4;
+    re[75] = t6;
+    im[75] = t2;
+    t12 = re[40];
+    t13 = im[40];
+    t3 = re[45];
+    t5 = im[45];
+    t1 = t12 - t3;
+    t10 = t13 - t5;
+    t0 = t12 + t3;
+    t11 = t13 + t5;
+    re[40] = t0;
+    im[40] = t11;
+    re[45] = t1;
+    im[45] = t10;
+    t9 = re[50];
+    t14 = im[50];
+    t8 = re[55];
+    t7 = im[55];
+    t4 = t9 - t8;
+    t6 = t14 - t7;
+    t2 = t9 + t8;
+    t12 = t14 + t7;
+    re[50] = t2;
+    im[50] = t12;
+    re[55] = t4;
+    im[55] = t6;
+    t3 = re[60];
+    t13 = im[60];
+    t5 = re[65];
+    t0 = im[65];
+    t11 = t3 - t5;
+    t1 = t13 - t0;
+    t10 = t3 + t5;
+    t9 = t13 + t0;
+    re[60] = t10;
+    im[60] = t9;
+    re[65] = t11;
+    im[65] = t1;
+    t8 = re[70];
+    t14 = im[70];
+    t7 = re[75];
+    t2 = im[75];
+    t12 = t8 - t7;
+    t4 = t14 - t2;
+    t6 = t8 + t7;
+    t3 = t14 + t2;
+    re[70] = t6;
+    im[70] = t3;
+    re[75] = t12;
+    im[75] = t4;
+    t5 = re[80];
+    t13 = im[80];
+    t0 = re[90];
+    t10 = im[90];
+    t9 = re[100];
+    t11 = im[100];
+    t1 = re[110];
+    t8 = im[110];
+    t7 = t5 + t9;
+    t14 = t13 + t11;
+    t2 = t0 + t1;
+    t6 = t10 + t8;
+    t3 = t5 - t9;
+    t12 = t13 - t11;
+    t4 = t0 - t1;
+    t5 = t10 - t8;
+    t9 = t7 + t2;
+    t13 = t14 + t6;
+    t11 = t3 + t5;
+    t0 = t12 - t4;
+    t1 = t7 - t2;
+    t10 = t14 - t6;
+    t8 = t3 - t5;
+    t7 = t12 + t4;
+    re[80] = t9;
+    im[80] = t13;
+    re[90] = t11;
+    im[90] = t0;
+    re[100] = t1;
+    im[100] = t10;
+    re[110] = t8;
+    im[110] = t7;
+    t2 = re[85];
+    t14 = im[85];
+    t6 = re[95];
+    t3 = im[95];
+    t5 = re[105];
+    t12 = im[105];
+    t4 = re[115];
+    t9 = im[115];
+    t13 = t2 + t5;
+    t11 = t14 + t12;
+    t0 = t6 + t4;
+    t1 = t3 + t9;
+    t10 = t2 - t5;
+    t8 = t14 - t12;
+    t7 = t6 - t4;
+    t2 = t3 - t9;
+    t5 = t13 + t0;
+    t14 = t11 + t1;
+    t12 = t10 + t2;
+    t6 = t8 - t7;
+    t4 = t13 - t0;
+    t3 = t11 - t1;
+    t9 = t10 - t2;
+    t13 = t8 + t7;
+    t0 = t12 + t6;
+    t11 = t12 - t6;
+    t1 = C13 * t0;
+    t10 = (-C13) * t11;
+    t2 = -t4;
+    t8 = t9 - t13;
+    t7 = t9 + t13;
+    t12 = (-C13) * t8;
+    t6 = (-C13) * t7;
+    re[85] = t5;
+    im[85] = t14;
+    re[95] = t1;
+    im[95] = t10;
+    re[105] = t3;
+    im[105] = t2;
+    re[115] = t12;
+    im[115] = t6;
+    t0 = re[80];
+    t11 = im[80];
+    t4 = re[85];
+    t9 = im[85];
+    t13 = t0 - t4;
+    t8 = t11 - t9;
+    t7 = t0 + t4;
+    t5 = t11 + t9;
+    re[80] = t7;
+    im[80] = t5;
+    re[85] = t13;
+    im[85] = t8;
+    t14 = re[90];
+    t1 = im[90];
+    t10 = re[95];
+    t3 = im[95];
+    t2 = t14 - t10;
+    t12 = t1 - t3;
+    t6 = t14 + t10;
+    t0 = t1 + t3;
+    re[90] = t6;
+    im[90] = t0;
+    re[95] = t2;
+    im[95] = t12;
+    t4 = re[100];
+    t11 = im[100];
+    t9 = re[105];
+    t7 = im[105];
+    t5 = t4 - t9;
+    t13 = t11 - t7;
+    t8 = t4 + t9;
+    t14 = t11 + t7;
+    re[100] = t8;
+    im[100] = t14;
+    re[105] = t5;
+    im[105] = t13;
+    t10 = re[110];
+    t1 = im[110];
+    t3 = re[115];
+    t6 = im[115];
+    t0 = t10 - t3;
+    t2 = t1 - t6;
+    t12 = t10 + t3;
+    t4 = t1 + t6;
+    re[110] = t12;
+    im[110] = t4;
+    re[115] = t0;
+    im[115] = t2;
+    t9 = re[120];
+    t11 = im[120];
+    t7 = re[130];
+    t8 = im[130];
+    t14 = re[140];
+    t5 = im[140];
+    t13 = re[150];
+    t10 = im[150];
+    t3 = t9 + t14;
+    t1 = t11 + t5;
+    t6 = t7 + t13;
+    t12 = t8 + t10;
+    t4 = t9 - t14;
+    t0 = t11 - t5;
+    t2 = t7 - t13;
+    t9 = t8 - t10;
+    t14 = t3 + t6;
+    t11 = t1 + t12;
+    t5 = t4 + t9;
+    t7 = t0 - t2;
+    t13 = t3 - t6;
+    t8 = t1 - t12;
+    t10 = t4 - t9;
+    t3 = t0 + t2;
+    re[120] = t14;
+    im[120] = t11;
+    re[130] = t5;
+    im[130] = t7;
+    re[140] = t13;
+    im[140] = t8;
+    re[150] = t10;
+    im[150] = t3;
+    t6 = re[125];
+    t1 = im[125];
+    t12 = re[135];
+    t4 = im[135];
+    t9 = re[145];
+    t0 = im[145];
+    t2 = re[155];
+    t14 = im[155];
+    t11 = t6 + t9;
+    t5 = t1 + t0;
+    t7 = t12 + t2;
+    t13 = t4 + t14;
+    t8 = t6 - t9;
+    t10 = t1 - t0;
+    t3 = t12 - t2;
+    t6 = t4 - t14;
+    t9 = t11 + t7;
+    t1 = t5 + t13;
+    t0 = t8 + t6;
+    t12 = t10 - t3;
+    t2 = t11 - t7;
+    t4 = t5 - t13;
+    t14 = t8 - t6;
+    t11 = t10 + t3;
+    t7 = t0 + t12;
+    t5 = t0 - t12;
+    t13 = C13 * t7;
+    t8 = (-C13) * t5;
+    t6 = -t2;
+    t10 = t14 - t11;
+    t3 = t14 + t11;
+    t0 = (-C13) * t10;
+    t12 = (-C13) * t3;
+    re[125] = t9;
+    im[125] = t1;
+    re[135] = t13;
+    im[135] = t8;
+    re[145] = t4;
+    im[145] = t6;
+    re[155] = t0;
+    im[155] = t12;
+    t7 = re[120];
+    t5 = im[120];
+    t2 = re[125];
+    t14 = im[125];
+    t11 = t7 - t2;
+    t10 = t5 - t14;
+    t3 = t7 + t2;
+    t9 = t5 + t14;
+    re[120] = t3;
+    im[120] = t9;
+    re[125] = t11;
+    im[125] = t10;
+    t1 = re[130];
+    t13 = im[130];
+    t8 = re[135];
+    t4 = im[135];
+    t6 = t1 - t8;
+    t0 = t13 - t4;
+    t12 = t1 + t8;
+    t7 = t13 + t4;
+    re[130] = t12;
+    im[130] = t7;
+    re[135] = t6;
+    im[135] = t0;
+    t2 = re[140];
+    t5 = im[140];
+    t14 = re[145];
+    t3 = im[145];
+    t9 = t2 - t14;
+    t11 = t5 - t3;
+    t10 = t2 + t14;
+    t1 = t5 + t3;
+    re[140] = t10;
+    im[140] = t1;
+    re[145] = t9;
+    im[145] = t11;
+    t8 = re[150];
+    t13 = im[150];
+    t4 = re[155];
+    t12 = im[155];
+    t7 = t8 - t4;
+    t6 = t13 - t12;
+    t0 = t8 + t4;
+    t2 = t13 + t12;
+    re[150] = t0;
+    im[150] = t2;
+    re[155] = t7;
+    im[155] = t6;
+    t14 = re[32];
+    t5 = im[32];
+    t3 = re[72];
+    t10 = im[72];
+    t1 = re[112];
+    t9 = im[112];
+    t11 = re[152];
+    t8 = im[152];
+    t4 = t14 + t1;
+    t13 = t5 + t9;
+    t12 = t3 + t11;
+    t0 = t10 + t8;
+    t2 = t14 - t1;
+    t7 = t5 - t9;
+    t6 = t3 - t11;
+    t14 = t10 - t8;
+    t1 = t4 + t12;
+    t5 = t13 + t0;
+    t9 = t2 + t14;
+    t3 = t7 - t6;
+    t11 = t4 - t12;
+    t10 = t13 - t0;
+    t8 = t2 - t14;
+    t4 = t7 + t6;
+    re[32] = t1;
+    im[32] = t5;
+    re[72] = t9;
+    im[72] = t3;
+    re[112] = t11;
+    im[112] = t10;
+    re[152] = t8;
+    im[152] = t4;
+    t12 = re[37];
+    t13 = im[37];
+    t0 = re[77];
+    t2 = im[77];
+    t14 = re[117];
+    t7 = im[117];
+    t6 = re[157];
+    t1 = im[157];
+    t5 = t12 + t14;
+    t9 = t13 + t7;
+    t3 = t0 + t6;
+    t11 = t2 + t1;
+    t10 = t12 - t14;
+    t8 = t13 - t7;
+    t4 = t0 - t6;
+    t12 = t2 - t1;
+    t14 = t5 + t3;
+    t13 = t9 + t11;
+    t7 = t10 + t12;
+    t0 = t8 - t4;
+    t6 = t5 - t3;
+    t2 = t9 - t11;
+    t1 = t10 - t12;
+    t5 = t8 + t4;
+    t3 = t7 + t0;
+    t9 = C4 * t3;
+    t11 = t7 * (-C5);
+    t10 = t0 * C6;
+    t12 = t9 - t10;
+    t8 = t9 + t11;
+    t4 = t6 + t2;
+    t3 = C7 * t4;
+    t7 = t6 * (-C8);
+    t0 = t2 * C9;
+    t10 = t3 - t0;
+    t9 = t3 + t7;
+    t11 = t1 + t5;
+    t4 = C10 * t11;
+    t6 = t1 * (-C11);
+    t2 = t5 * C12;
+    t0 = t4 - t2;
+    t3 = t4 + t6;
+    re[37] = t14;
+    im[37] = t13;
+    re[77] = t12;
+    im[77] = t8;
+    re[117] = t10;
+    im[117] = t9;
+    re[157] = t0;
+    im[157] = t3;
+    t7 = re[42];
+    t11 = im[42];
+    t1 = re[82];
+    t5 = im[82];
+    t2 = re[122];
+    t4 = im[122];
+    t6 = re[2];
+    t14 = im[2];
+    t13 = t7 + t2;
+    t12 = t11 + t4;
+    t8 = t1 + t6;
+    t10 = t5 + t14;
+    t9 = t7 - t2;
+    t0 = t11 - t4;
+    t3 = t1 - t6;
+    t7 = t5 - t14;
+    t2 = t13 + t8;
+    t11 = t12 + t10;
+    t4 = t9 + t7;
+    t1 = t0 - t3;
+    t6 = t13 - t8;
+    t5 = t12 - t10;
+    t14 = t9 - t7;
+    t13 = t0 + t3;
+    t8 = t4 + t1;
+    t12 = C7 * t8;
+    t10 = t4 * (-C8);
+    t9 = t1 * C9;
+    t7 = t12 - t9;
+    t0 = t12 + t10;
+    t3 = t6 + t5;
+    t8 = t6 - t5;
+    t4 = C13 * t3;
+    t1 = (-C13) * t8;
+    t9 = t14 + t13;
+    t12 = C14 * t9;
+    t10 = t14 * (-C8);
+    t6 = t13 * (-C9);
+    t5 = t12 - t6;
+    t3 = t12 + t10;
+    re[42] = t2;
+    im[42] = t11;
+    re[82] = t7;
+    im[82] = t0;
+    re[122] = t4;
+    im[122] = t1;
+    re[2] = t5;
+    im[2] = t3;
+    t8 = re[47];
+    t9 = im[47];
+    t14 = re[87];
+    t13 = im[87];
+    t6 = re[127];
+    t12 = im[127];
+    t10 = re[7];
+    t2 = im[7];
+    t11 = t8 + t6;
+    t7 = t9 + t12;
+    t0 = t14 + t10;
+    t4 = t13 + t2;
+    t1 = t8 - t6;
+    t5 = t9 - t12;
+    t3 = t14 - t10;
+    t8 = t13 - t2;
+    t6 = t11 + t0;
+    t9 = t7 + t4;
+    t12 = t1 + t8;
+    t14 = t5 - t3;
+    t10 = t11 - t0;
+    t13 = t7 - t4;
+    t2 = t1 - t8;
+    t11 = t5 + t3;
+    t0 = t12 + t14;
+    t7 = C10 * t0;
+    t4 = t12 * (-C11);
+    t1 = t14 * C12;
+    t8 = t7 - t1;
+    t5 = t7 + t4;
+    t3 = t10 + t13;
+    t0 = C14 * t3;
+    t12 = t10 * (-C8);
+    t14 = t13 * (-C9);
+    t1 = t0 - t14;
+    t7 = t0 + t12;
+    t4 = t2 + t11;
+    t3 = (-C15) * t4;
+    t10 = t2 * (-C6);
+    t13 = t11 * (-C5);
+    t14 = t3 - t13;
+    t0 = t3 + t10;
+    re[47] = t6;
+    im[47] = t9;
+    re[87] = t8;
+    im[87] = t5;
+    re[127] = t1;
+    im[127] = t7;
+    re[7] = t14;
+    im[7] = t0;
+    t12 = re[52];
+    t4 = im[52];
+    t2 = re[92];
+    t11 = im[92];
+    t13 = re[132];
+    t3 = im[132];
+    t10 = re[12];
+    t6 = im[12];
+    t9 = t12 + t13;
+    t8 = t4 + t3;
+    t5 = t2 + t10;
+    t1 = t11 + t6;
+    t7 = t12 - t13;
+    t14 = t4 - t3;
+    t0 = t2 - t10;
+    t12 = t11 - t6;
+    t13 = t9 + t5;
+    t4 = t8 + t1;
+    t3 = t7 + t12;
+    t2 = t14 - t0;
+    t10 = t9 - t5;
+    t11 = t8 - t1;
+    t6 = t7 - t12;
+    t9 = t14 + t0;
+    t5 = t3 + t2;
+    t8 = t3 - t2;
+    t1 = C13 * t5;
+    t7 = (-C13) * t8;
+    t12 = -t10;
+    t14 = t6 - t9;
+    t0 = t6 + t9;
+    t3 = (-C13) * t14;
+    t2 = (-C13) * t0;
+    re[52] = t13;
+    im[52] = t4;
+    re[92] = t1;
+    im[92] = t7;
+    re[132] = t11;
+    im[132] = t12;
+    re[12] = t3;
+    im[12] = t2;
+    t5 = re[57];
+    t8 = im[57];
+    t10 = re[97];
+    t6 = im[97];
+    t9 = re[137];
+    t14 = im[137];
+    t0 = re[17];
+    t13 = im[17];
+    t4 = t5 + t9;
+    t1 = t8 + t14;
+    t7 = t10 + t0;
+    t11 = t6 + t13;
+    t12 = t5 - t9;
+    t3 = t8 - t14;
+    t2 = t10 - t0;
+    t5 = t6 - t13;
+    t9 = t4 + t7;
+    t8 = t1 + t11;
+    t14 = t12 + t5;
+    t10 = t3 - t2;
+    t0 = t4 - t7;
+    t6 = t1 - t11;
+    t13 = t12 - t5;
+    t4 = t3 + t2;
+    t7 = t14 + t10;
+    t1 = C16 * t7;
+    t11 = t14 * (-C11);
+    t12 = t10 * (-C12);
+    t5 = t1 - t12;
+    t3 = t1 + t11;
+    t2 = t0 + t6;
+    t7 = (-C14) * t2;
+    t14 = t0 * (-C9);
+    t10 = t6 * (-C8);
+    t12 = t7 - t10;
+    t1 = t7 + t14;
+    t11 = t13 + t4;
+    t2 = (-C4) * t11;
+    t0 = t13 * C6;
+    t6 = t4 * (-C5);
+    t10 = t2 - t6;
+    t7 = t2 + t0;
+    re[57] = t9;
+    im[57] = t8;
+    re[97] = t5;
+    im[97] = t3;
+    re[137] = t12;
+    im[137] = t1;
+    re[17] = t10;
+    im[17] = t7;
+    t14 = re[62];
+    t11 = im[62];
+    t13 = re[102];
+    t4 = im[102];
+    t6 = re[142];
+    t2 = im[142];
+    t0 = re[22];
+    t9 = im[22];
+    t8 = t14 + t6;
+    t5 = t11 + t2;
+    t3 = t13 + t0;
+    t12 = t4 + t9;
+    t1 = t14 - t6;
+    t10 = t11 - t2;
+    t7 = t13 - t0;
+    t14 = t4 - t9;
+    t6 = t8 + t3;
+    t11 = t5 + t12;
+    t2 = t1 + t14;
+    t13 = t10 - t7;
+    t0 = t8 - t3;
+    t4 = t5 - t12;
+    t9 = t1 - t14;
+    t8 = t10 + t7;
+    t3 = t2 + t13;
+    t5 = C14 * t3;
+    t12 = t2 * (-C8);
+    t1 = t13 * (-C9);
+    t14 = t5 - t1;
+    t10 = t5 + t12;
+    t7 = t0 - t4;
+    t3 = t0 + t4;
+    t2 = (-C13) * t7;
+    t13 = (-C13) * t3;
+    t1 = t9 + t8;
+    t5 = (-C7) * t1;
+    t12 = t9 * C8;
+    t0 = t8 * (-C9);
+    t4 = t5 - t0;
+    t7 = t5 + t12;
+    re[62] = t6;
+    im[62] = t11;
+    re[102] = t14;
+    im[102] = t10;
+    re[142] = t2;
+    im[142] = t13;
+    re[22] = t4;
+    im[22] = t7;
+    t3 = re[67];
+    t1 = im[67];
+    t9 = re[107];
+    t8 = im[107];
+    t0 = re[147];
+    t5 = im[147];
+    t12 = re[27];
+    t6 = im[27];
+    t11 = t3 + t0;
+    t14 = t1 + t5;
+    t10 = t9 + t12;
+    t2 = t8 + t6;
+    t13 = t3 - t0;
+    t4 = t1 - t5;
+    t7 = t9 - t12;
+    t3 = t8 - t6;
+    t0 = t11 + t10;
+    t1 = t14 + t2;
+    t5 = t13 + t3;
+    t9 = t4 - t7;
+    t12 = t11 - t10;
+    t8 = t14 - t2;
+    t6 = t13 - t3;
+    t11 = t4 + t7;
+    t10 = t5 + t9;
+    t14 = C15 * t10;
+    t2 = t5 * (-C5);
+    t13 = t9 * (-C6);
+    t3 = t14 - t13;
+    t4 = t14 + t2;
+    t7 = t12 + t8;
+    t10 = (-C7) * t7;
+    t5 = t12 * C9;
+    t9 = t8 * (-C8);
+    t13 = t10 - t9;
+    t14 = t10 + t5;
+    t2 = t6 + t11;
+    t7 = (-C16) * t2;
+    t12 = t6 * C11;
+    t8 = t11 * C12;
+    t9 = t7 - t8;
+    t10 = t7 + t12;
+    re[67] = t0;
+    im[67] = t1;
+    re[107] = t3;
+    im[107] = t4;
+    re[147] = t13;
+    im[147] = t14;
+    re[27] = t9;
+    im[27] = t10;
+    t5 = re[32];
+    t2 = im[32];
+    t6 = re[42];
+    t11 = im[42];
+    t8 = re[52];
+    t7 = im[52];
+    t12 = re[62];
+    t0 = im[62];
+    t1 = t5 + t8;
+    t3 = t2 + t7;
+    t4 = t6 + t12;
+    t13 = t11 + t0;
+    t14 = t5 - t8;
+    t9 = t2 - t7;
+    t10 = t6 - t12;
+    t5 = t11 - t0;
+    t8 = t1 + t4;
+    t2 = t3 + t13;
+    t7 = t14 + t5;
+    t6 = t9 - t10;
+    t12 = t1 - t4;
+    t11 = t3 - t13;
+    t0 = t14 - t5;
+    t1 = t9 + t10;
+    re[32] = t8;
+    im[32] = t2;
+    re[42] = t7;
+    im[42] = t6;
+    re[52] = t12;
+    im[52] = t11;
+    re[62] = t0;
+    im[62] = t1;
+    t4 = re[37];
+    t3 = im[37];
+    t13 = re[47];
+    t14 = im[47];
+    t5 = re[57];
+    t9 = im[57];
+    t10 = re[67];
+    t8 = im[67];
+    t2 = t4 + t5;
+    t7 = t3 + t9;
+    t6 = t13 + t10;
+    t12 = t14 + t8;
+    t11 = t4 - t5;
+    t0 = t3 - t9;
+    t1 = t13 - t10;
+    t4 = t14 - t8;
+    t5 = t2 + t6;
+    t3 = t7 + t12;
+    t9 = t11 + t4;
+    t13 = t0 - t1;
+    t10 = t2 - t6;
+    t14 = t7 - t12;
+    t8 = t11 - t4;
+    t2 = t0 + t1;
+    t6 = t9 + t13;
+    t7 = t9 - t13;
+    t12 = C13 * t6;
+    t11 = (-C13) * t7;
+    t4 = -t10;
+    t0 = t8 - t2;
+    t1 = t8 + t2;
+    t9 = (-C13) * t0;
+    t13 = (-C13) * t1;
+    re[37] = t5;
+    im[37] = t3;
+    re[47] = t12;
+    im[47] = t11;
+    re[57] = t14;
+    im[57] = t4;
+    re[67] = t9;
+    im[67] = t13;
+    t6 = re[32];
+    t7 = im[32];
+    t10 = re[37];
+    t8 = im[37];
+    t2 = t6 - t10;
+    t0 = t7 - t8;
+    t1 = t6 + t10;
+    t5 = t7 + t8;
+    re[32] = t1;
+    im[32] = t5;
+    re[37] = t2;
+    im[37] = t0;
+    t3 = re[42];
+    t12 = im[42];
+    t11 = re[47];
+    t14 = im[47];
+    t4 = t3 - t11;
+    t9 = t12 - t14;
+    t13 = t3 + t11;
+    t6 = t12 + t14;
+    re[42] = t13;
+    im[42] = t6;
+    re[47] = t4;
+    im[47] = t9;
+    t10 = re[52];
+    t7 = im[52];
+    t8 = re[57];
+    t1 = im[57];
+    t5 = t10 - t8;
+    t2 = t7 - t1;
+    t0 = t10 + t8;
+    t3 = t7 + t1;
+    re[52] = t0;
+    im[52] = t3;
+    re[57] = t5;
+    im[57] = t2;
+    t11 = re[62];
+    t12 = im[62];
+    t14 = re[67];
+    t13 = im[67];
+    t6 = t11 - t14;
+    t4 = t12 - t13;
+    t9 = t11 + t14;
+    t10 = t12 + t13;
+    re[62] = t9;
+    im[62] = t10;
+    re[67] = t6;
+    im[67] = t4;
+    t8 = re[72];
+    t7 = im[72];
+    t1 = re[82];
+    t0 = im[82];
+    t3 = re[92];
+    t5 = im[92];
+    t2 = re[102];
+    t11 = im[102];
+    t14 = t8 + t3;
+    t12 = t7 + t5;
+    t13 = t1 + t2;
+    t9 = t0 + t11;
+    t10 = t8 - t3;
+    t6 = t7 - t5;
+    t4 = t1 - t2;
+    t8 = t0 - t11;
+    t3 = t14 + t13;
+    t7 = t12 + t9;
+    t5 = t10 + t8;
+    t1 = t6 - t4;
+    t2 = t14 - t13;
+    t0 = t12 - t9;
+    t11 = t10 - t8;
+    t14 = t6 + t4;
+    re[72] = t3;
+    im[72] = t7;
+    re[82] = t5;
+    im[82] = t1;
+    re[92] = t2;
+    im[92] = t0;
+    re[102] = t11;
+    im[102] = t14;
+    t13 = re[77];
+    t12 = im[77];
+    t9 = re[87];
+    t10 = im[87];
+    t8 = re[97];
+    t6 = im[97];
+    t4 = re[107];
+    t3 = im[107];
+    t7 = t13 + t8;
+    t5 = t12 + t6;
+    t1 = t9 + t4;
+    t2 = t10 + t3;
+    t0 = t13 - t8;
+    t11 = t12 - t6;
+    t14 = t9 - t4;
+    t13 = t10 - t3;
+    t8 = t7 + t1;
+    t12 = t5 + t2;
+    t6 = t0 + t13;
+    t9 = t11 - t14;
+    t4 = t7 - t1;
+    t10 = t5 - t2;
+    t3 = t0 - t13;
+    t7 = t11 + t14;
+    t1 = t6 + t9;
+    t5 = t6 - t9;
+    t2 = C13 * t1;
+    t0 = (-C13) * t5;
+    t13 = -t4;
+    t11 = t3 - t7;
+    t14 = t3 + t7;
+    t6 = (-C13) * t11;
+    t9 = (-C13) * t14;
+    re[77] = t8;
+    im[77] = t12;
+    re[87] = t2;
+    im[87] = t0;
+    re[97] = t10;
+    im[97] = t13;
+    re[107] = t6;
+    im[107] = t9;
+    t1 = re[72];
+    t5 = im[72];
+    t4 = re[77];
+    t3 = im[77];
+    t7 = t1 - t4;
+    t11 = t5 - t3;
+    t14 = t1 + t4;
+    t8 = t5 + t3;
+    re[72] = t14;
+    im[72] = t8;
+    re[77] = t7;
+    im[77] = t11;
+    t12 = re[82];
+    t2 = im[82];
+    t0 = re[87];
+    t10 = im[87];
+    t13 = t12 - t0;
+    t6 = t2 - t10;
+    t9 = t12 + t0;
+    t1 = t2 + t10;
+    re[82] = t9;
+    im[82] = t1;
+    re[87] = t13;
+    im[87] = t6;
+    t4 = re[92];
+    t5 = im[92];
+    t3 = re[97];
+    t14 = im[97];
+    t8 = t4 - t3;
+    t7 = t5 - t14;
+    t11 = t4 + t3;
+    t12 = t5 + t14;
+    re[92] = t11;
+    im[92] = t12;
+    re[97] = t8;
+    im[97] = t7;
+    t0 = re[102];
+    t2 = im[102];
+    t10 = re[107];
+    t9 = im[107];
+    t1 = t0 - t10;
+    t13 = t2 - t9;
+    t6 = t0 + t10;
+    t4 = t2 + t9;
+    re[102] = t6;
+    im[102] = t4;
+    re[107] = t1;
+    im[107] = t13;
+    t3 = re[112];
+    t5 = im[112];
+    t14 = re[122];
+    t11 = im[122];
+    t12 = re[132];
+    t8 = im[132];
+    t7 = re[142];
+    t0 = im[142];
+    t10 = t3 + t12;
+    t2 = t5 + t8;
+    t9 = t14 + t7;
+    t6 = t11 + t0;
+    t4 = t3 - t12;
+    t1 = t5 - t8;
+    t13 = t14 - t7;
+    t3 = t11 - t0;
+    t12 = t10 + t9;
+    t5 = t2 + t6;
+    t8 = t4 + t3;
+    t14 = t1 - t13;
+    t7 = t10 - t9;
+    t11 = t2 - t6;
+    t0 = t4 - t3;
+    t10 = t1 + t13;
+    re[112] = t12;
+    im[112] = t5;
+    re[122] = t8;
+    im[122] = t14;
+    re[132] = t7;
+    im[132] = t11;
+    re[142] = t0;
+    im[142] = t10;
+    t9 = re[117];
+    t2 = im[117];
+    t6 = re[127];
+    t4 = im[127];
+    t3 = re[137];
+    t1 = im[137];
+    t13 = re[147];
+    t12 = im[147];
+    t5 = t9 + t3;
+    t8 = t2 + t1;
+    t14 = t6 + t13;
+    t7 = t4 + t12;
+    t11 = t9 - t3;
+    t0 = t2 - t1;
+    t10 = t6 - t13;
+    t9 = t4 - t12;
+    t3 = t5 + t14;
+    t2 = t8 + t7;
+    t1 = t11 + t9;
+    t6 = t0 - t10;
+    t13 = t5 - t14;
+    t4 = t8 - t7;
+    t12 = t11 - t9;
+    t5 = t0 + t10;
+    t14 = t1 + t6;
+    t8 = t1 - t6;
+    t7 = C13 * t14;
+    t11 = (-C13) * t8;
+    t9 = -t13;
+    t0 = t12 - t5;
+    t10 = t12 + t5;
+    t1 = (-C13) * t0;
+    t6 = (-C13) * t10;
+    re[117] = t3;
+    im[117] = t2;
+    re[127] = t7;
+    im[127] = t11;
+    re[137] = t4;
+    im[137] = t9;
+    re[147] = t1;
+    im[147] = t6;
+    t14 = re[112];
+    t8 = im[112];
+    t13 = re[117];
+    t12 = im[117];
+    t5 = t14 - t13;
+    t0 = t8 - t12;
+    t10 = t14 + t13;
+    t3 = t8 + t12;
+    re[112] = t10;
+    im[112] = t3;
+    re[117] = t5;
+    im[117] = t0;
+    t2 = re[122];
+    t7 = im[122];
+    t11 = re[127];
+    t4 = im[127];
+    t9 = t2 - t11;
+    t1 = t7 - t4;
+    t6 = t2 + t11;
+    t14 = t7 + t4;
+    re[122] = t6;
+    im[122] = t14;
+    re[127] = t9;
+    im[127] = t1;
+    t13 = re[132];
+    t8 = im[132];
+    t12 = re[137];
+    t10 = im[137];
+    t3 = t13 - t12;
+    t5 = t8 - t10;
+    t0 = t13 + t12;
+    t2 = t8 + t10;
+    re[132] = t0;
+    im[132] = t2;
+    re[137] = t3;
+    im[137] = t5;
+    t11 = re[142];
+    t7 = im[142];
+    t4 = re[147];
+    t6 = im[147];
+    t14 = t11 - t4;
+    t9 = t7 - t6;
+    t1 = t11 + t4;
+    t13 = t7 + t6;
+    re[142] = t1;
+    im[142] = t13;
+    re[147] = t14;
+    im[147] = t9;
+    t12 = re[152];
+    t8 = im[152];
+    t10 = re[2];
+    t0 = im[2];
+    t2 = re[12];
+    t3 = im[12];
+    t5 = re[22];
+    t11 = im[22];
+    t4 = t12 + t2;
+    t7 = t8 + t3;
+    t6 = t10 + t5;
+    t1 = t0 + t11;
+    t13 = t12 - t2;
+    t14 = t8 - t3;
+    t9 = t10 - t5;
+    t12 = t0 - t11;
+    t2 = t4 + t6;
+    t8 = t7 + t1;
+    t3 = t13 + t12;
+    t10 = t14 - t9;
+    t5 = t4 - t6;
+    t0 = t7 - t1;
+    t11 = t13 - t12;
+    t4 = t14 + t9;
+    re[152] = t2;
+    im[152] = t8;
+    re[2] = t3;
+    im[2] = t10;
+    re[12] = t5;
+    im[12] = t0;
+    re[22] = t11;
+    im[22] = t4;
+    t6 = re[157];
+    t7 = im[157];
+    t1 = re[7];
+    t13 = im[7];
+    t12 = re[17];
+    t14 = im[17];
+    t9 = re[27];
+    t2 = im[27];
+    t8 = t6 + t12;
+    t3 = t7 + t14;
+    t10 = t1 + t9;
+    t5 = t13 + t2;
+    t0 = t6 - t12;
+    t11 = t7 - t14;
+    t4 = t1 - t9;
+    t6 = t13 - t2;
+    t12 = t8 + t10;
+    t7 = t3 + t5;
+    t14 = t0 + t6;
+    t1 = t11 - t4;
+    t9 = t8 - t10;
+    t13 = t3 - t5;
+    t2 = t0 - t6;
+    t8 = t11 + t4;
+    t10 = t14 + t1;
+    t3 = t14 - t1;
+    t5 = C13 * t10;
+    t0 = (-C13) * t3;
+    t6 = -t9;
+    t11 = t2 - t8;
+    t4 = t2 + t8;
+    t14 = (-C13) * t11;
+    t1 = (-C13) * t4;
+    re[157] = t12;
+    im[157] = t7;
+    re[7] = t5;
+    im[7] = t0;
+    re[17] = t13;
+    im[17] = t6;
+    re[27] = t14;
+    im[27] = t1;
+    t10 = re[152];
+    t3 = im[152];
+    t9 = re[157];
+    t2 = im[157];
+    t8 = t10 - t9;
+    t11 = t3 - t2;
+    t4 = t10 + t9;
+    t12 = t3 + t2;
+    re[152] = t4;
+    im[152] = t12;
+    re[157] = t8;
+    im[157] = t11;
+    t7 = re[2];
+    t5 = im[2];
+    t0 = re[7];
+    t13 = im[7];
+    t6 = t7 - t0;
+    t14 = t5 - t13;
+    t1 = t7 + t0;
+    t10 = t5 + t13;
+    re[2] = t1;
+    im[2] = t10;
+    re[7] = t6;
+    im[7] = t14;
+    t9 = re[12];
+    t3 = im[12];
+    t2 = re[17];
+    t4 = im[17];
+    t12 = t9 - t2;
+    t8 = t3 - t4;
+    t11 = t9 + t2;
+    t7 = t3 + t4;
+    re[12] = t11;
+    im[12] = t7;
+    re[17] = t12;
+    im[17] = t8;
+    t0 = re[22];
+    t5 = im[22];
+    t13 = re[27];
+    t1 = im[27];
+    t10 = t0 - t13;
+    t6 = t5 - t1;
+    t14 = t0 + t13;
+    t9 = t5 + t1;
+    re[22] = t14;
+    im[22] = t9;
+    re[27] = t10;
+    im[27] = t6;
+}
+
+/**
+ *  Part 2 of ApplyMixedRadixPairedRFFT_160().
+ * 
+ *  @param {Number[]} re 
+ *    - The real part of each point.
+ *  @param {Number[]} im 
+ *    - The imaginary part of each point.
+ */
+function ApplyMixedRadixPairedRFFT_160_Part2(re, im) {
+    let t0, t1, t10, t11, t12, t13, t14, t2, t3, t4, t5, t6, t7, t8, t9;
+    const C0 = 0.9807852804032304;
+    const C1 = 1.1758756024193586;
+    const C2 = 0.7856949583871022;
+    const C3 = 0.9238795325112867;
+    const C4 = 1.3065629648763766;
+    const C5 = 0.5411961001461969;
+    const C6 = 0.8314696123025452;
+    const C7 = 1.3870398453221475;
+    const C8 = 0.27589937928294306;
+    const C9 = 0.7071067811865476;
+    const C10 = 0.3826834323650898;
+    const C11 = 0.19509032201612825;
+    const C12 = 0.5555702330196022;
+    const C13 = 0.5;
+    t2 = re[64];
+    t3 = im[64];
+    t4 = re[104];
+    t11 = im[104];
+    t7 = re[144];
+    t12 = im[144];
+    t8 = re[24];
+    t0 = im[24];
+    t13 = t2 + t7;
+    t5 = t3 + t12;
+    t1 = t4 + t8;
+    t14 = t11 + t0;
+    t9 = t2 - t7;
+    t10 = t3 - t12;
+    t6 = t4 - t8;
+    t2 = t11 - t0;
+    t7 = t13 + t1;
+    t3 = t5 + t14;
+    t12 = t9 + t2;
+    t4 = t10 - t6;
+    t8 = t13 - t1;
+    t11 = t5 - t14;
+    t0 = t9 - t2;
+    t13 = t10 + t6;
+    re[64] = t7;
+    im[64] = t3;
+    re[104] = t12;
+    im[104] = t4;
+    re[144] = t8;
+    im[144] = t11;
+    re[24] = t0;
+    im[24] = t13;
+    t1 = re[69];
+    t5 = im[69];
+    t14 = re[109];
+    t9 = im[109];
+    t2 = re[149];
+    t10 = im[149];
+    t6 = re[29];
+    t7 = im[29];
+    t3 = t1 + t2;
+    t12 = t5 + t10;
+    t4 = t14 + t6;
+    t8 = t9 + t7;
+    t11 = t1 - t2;
+    t0 = t5 - t10;
+    t13 = t14 - t6;
+    t1 = t9 - t7;
+    t2 = t3 + t4;
+    t5 = t12 + t8;
+    t10 = t11 + t1;
+    t14 = t0 - t13;
+    t6 = t3 - t4;
+    t9 = t12 - t8;
+    t7 = t11 - t1;
+    t3 = t0 + t13;
+    t4 = t10 + t14;
+    t12 = C0 * t4;
+    t8 = t10 * (-C1);
+    t11 = t14 * C2;
+    t1 = t12 - t11;
+    t0 = t12 + t8;
+    t13 = t6 + t9;
+    t4 = C3 * t13;
+    t10 = t6 * (-C4);
+    t14 = t9 * C5;
+    t11 = t4 - t14;
+    t12 = t4 + t10;
+    t8 = t7 + t3;
+    t13 = C6 * t8;
+    t6 = t7 * (-C7);
+    t9 = t3 * C8;
+    t14 = t13 - t9;
+    t4 = t13 + t6;
+    re[69] = t2;
+    im[69] = t5;
+    re[109] = t1;
+    im[109] = t0;
+    re[149] = t11;
+    im[149] = t12;
+    re[29] = t14;
+    im[29] = t4;
+    t10 = re[74];
+    t8 = im[74];
+    t7 = re[114];
+    t3 = im[114];
+    t9 = re[154];
+    t13 = im[154];
+    t6 = re[34];
+    t2 = im[34];
+    t5 = t10 + t9;
+    t1 = t8 + t13;
+    t0 = t7 + t6;
+    t11 = t3 + t2;
+    t12 = t10 - t9;
+    t14 = t8 - t13;
+    t4 = t7 - t6;
+    t10 = t3 - t2;
+    t9 = t5 + t0;
+    t8 = t1 + t11;
+    t13 = t12 + t10;
+    t7 = t14 - t4;
+    t6 = t5 - t0;
+    t3 = t1 - t11;
+    t2 = t12 - t10;
+    t5 = t14 + t4;
+    t0 = t13 + t7;
+    t1 = C3 * t0;
+    t11 = t13 * (-C4);
+    t12 = t7 * C5;
+    t10 = t1 - t12;
+    t14 = t1 + t11;
+    t4 = t6 + t3;
+    t0 = t6 - t3;
+    t13 = C9 * t4;
+    t7 = (-C9) * t0;
+    t12 = t2 + t5;
+    t1 = C10 * t12;
+    t11 = t2 * (-C4);
+    t6 = t5 * (-C5);
+    t3 = t1 - t6;
+    t4 = t1 + t11;
+    re[74] = t9;
+    im[74] = t8;
+    re[114] = t10;
+    im[114] = t14;
+    re[154] = t13;
+    im[154] = t7;
+    re[34] = t3;
+    im[34] = t4;
+    t0 = re[79];
+    t12 = im[79];
+    t2 = re[119];
+    t5 = im[119];
+    t6 = re[159];
+    t1 = im[159];
+    t11 = re[39];
+    t9 = im[39];
+    t8 = t0 + t6;
+    t10 = t12 + t1;
+    t14 = t2 + t11;
+    t13 = t5 + t9;
+    t7 = t0 - t6;
+    t3 = t12 - t1;
+    t4 = t2 - t11;
+    t0 = t5 - t9;
+    t6 = t8 + t14;
+    t12 = t10 + t13;
+    t1 = t7 + t0;
+    t2 = t3 - t4;
+    t11 = t8 - t14;
+    t5 = t10 - t13;
+    t9 = t7 - t0;
+    t8 = t3 + t4;
+    t14 = t1 + t2;
+    t10 = C6 * t14;
+    t13 = t1 * (-C7);
+    t7 = t2 * C8;
+    t0 = t10 - t7;
+    t3 = t10 + t13;
+    t4 = t11 + t5;
+    t14 = C10 * t4;
+    t1 = t11 * (-C4);
+    t2 = t5 * (-C5);
+    t7 = t14 - t2;
+    t10 = t14 + t1;
+    t13 = t9 + t8;
+    t4 = (-C11) * t13;
+    t11 = t9 * (-C2);
+    t5 = t8 * (-C1);
+    t2 = t4 - t5;
+    t14 = t4 + t11;
+    re[79] = t6;
+    im[79] = t12;
+    re[119] = t0;
+    im[119] = t3;
+    re[159] = t7;
+    im[159] = t10;
+    re[39] = t2;
+    im[39] = t14;
+    t1 = re[84];
+    t13 = im[84];
+    t9 = re[124];
+    t8 = im[124];
+    t5 = re[4];
+    t4 = im[4];
+    t11 = re[44];
+    t6 = im[44];
+    t12 = t1 + t5;
+    t0 = t13 + t4;
+    t3 = t9 + t11;
+    t7 = t8 + t6;
+    t10 = t1 - t5;
+    t2 = t13 - t4;
+    t14 = t9 - t11;
+    t1 = t8 - t6;
+    t5 = t12 + t3;
+    t13 = t0 + t7;
+    t4 = t10 + t1;
+    t9 = t2 - t14;
+    t11 = t12 - t3;
+    t8 = t0 - t7;
+    t6 = t10 - t1;
+    t12 = t2 + t14;
+    t3 = t4 + t9;
+    t0 = t4 - t9;
+    t7 = C9 * t3;
+    t10 = (-C9) * t0;
+    t1 = -t11;
+    t2 = t6 - t12;
+    t14 = t6 + t12;
+    t4 = (-C9) * t2;
+    t9 = (-C9) * t14;
+    re[84] = t5;
+    im[84] = t13;
+    re[124] = t7;
+    im[124] = t10;
+    re[4] = t8;
+    im[4] = t1;
+    re[44] = t4;
+    im[44] = t9;
+    t3 = re[89];
+    t0 = im[89];
+    t11 = re[129];
+    t6 = im[129];
+    t12 = re[9];
+    t2 = im[9];
+    t14 = re[49];
+    t5 = im[49];
+    t13 = t3 + t12;
+    t7 = t0 + t2;
+    t10 = t11 + t14;
+    t8 = t6 + t5;
+    t1 = t3 - t12;
+    t4 = t0 - t2;
+    t9 = t11 - t14;
+    t3 = t6 - t5;
+    t12 = t13 + t10;
+    t0 = t7 + t8;
+    t2 = t1 + t3;
+    t11 = t4 - t9;
+    t14 = t13 - t10;
+    t6 = t7 - t8;
+    t5 = t1 - t3;
+    t13 = t4 + t9;
+    t10 = t2 + t11;
+    t7 = C12 * t10;
+    t8 = t2 * (-C7);
+    t1 = t11 * (-C8);
+    t3 = t7 - t1;
+    t4 = t7 + t8;
+    t9 = t14 + t6;
+    t10 = (-C10) * t9;
+    t2 = t14 * (-C5);
+    t11 = t6 * (-C4);
+    t1 = t10 - t11;
+    t7 = t10 + t2;
+    t8 = t5 + t13;
+    t9 = (-C0) * t8;
+    t14 = t5 * C2;
+    t6 = t13 * (-C1);
+    t11 = t9 - t6;
+    t10 = t9 + t14;
+    re[89] = t12;
+    im[89] = t0;
+    re[129] = t3;
+    im[129] = t4;
+    re[9] = t1;
+    im[9] = t7;
+    re[49] = t11;
+    im[49] = t10;
+    t2 = re[94];
+    t8 = im[94];
+    t5 = re[134];
+    t13 = im[134];
+    t6 = re[14];
+    t9 = im[14];
+    t14 = re[54];
+    t12 = im[54];
+    t0 = t2 + t6;
+    t3 = t8 + t9;
+    t4 = t5 + t14;
+    t1 = t13 + t12;
+    t7 = t2 - t6;
+    t11 = t8 - t9;
+    t10 = t5 - t14;
+    t2 = t13 - t12;
+    t6 = t0 + t4;
+    t8 = t3 + t1;
+    t9 = t7 + t2;
+    t5 = t11 - t10;
+    t14 = t0 - t4;
+    t13 = t3 - t1;
+    t12 = t7 - t2;
+    t0 = t11 + t10;
+    t4 = t9 + t5;
+    t3 = C10 * t4;
+    t1 = t9 * (-C4);
+    t7 = t5 * (-C5);
+    t2 = t3 - t7;
+    t11 = t3 + t1;
+    t10 = t14 - t13;
+    t4 = t14 + t13;
+    t9 = (-C9) * t10;
+    t5 = (-C9) * t4;
+    t7 = t12 + t0;
+    t3 = (-C3) * t7;
+    t1 = t12 * C4;
+    t14 = t0 * (-C5);
+    t13 = t3 - t14;
+    t10 = t3 + t1;
+    re[94] = t6;
+    im[94] = t8;
+    re[134] = t2;
+    im[134] = t11;
+    re[14] = t9;
+    im[14] = t5;
+    re[54] = t13;
+    im[54] = t10;
+    t4 = re[99];
+    t7 = im[99];
+    t12 = re[139];
+    t0 = im[139];
+    t14 = re[19];
+    t3 = im[19];
+    t1 = re[59];
+    t6 = im[59];
+    t8 = t4 + t14;
+    t2 = t7 + t3;
+    t11 = t12 + t1;
+    t9 = t0 + t6;
+    t5 = t4 - t14;
+    t13 = t7 - t3;
+    t10 = t12 - t1;
+    t4 = t0 - t6;
+    t14 = t8 + t11;
+    t7 = t2 + t9;
+    t3 = t5 + t4;
+    t12 = t13 - t10;
+    t1 = t8 - t11;
+    t0 = t2 - t9;
+    t6 = t5 - t4;
+    t8 = t13 + t10;
+    t11 = t3 + t12;
+    t2 = C11 * t11;
+    t9 = t3 * (-C1);
+    t5 = t12 * (-C2);
+    t4 = t2 - t5;
+    t13 = t2 + t9;
+    t10 = t1 + t0;
+    t11 = (-C3) * t10;
+    t3 = t1 * C5;
+    t12 = t0 * (-C4);
+    t5 = t11 - t12;
+    t2 = t11 + t3;
+    t9 = t6 + t8;
+    t10 = (-C12) * t9;
+    t1 = t6 * C7;
+    t0 = t8 * C8;
+    t12 = t10 - t0;
+    t11 = t10 + t1;
+    re[99] = t14;
+    im[99] = t7;
+    re[139] = t4;
+    im[139] = t13;
+    re[19] = t5;
+    im[19] = t2;
+    re[59] = t12;
+    im[59] = t11;
+    t3 = re[64];
+    t9 = im[64];
+    t6 = re[74];
+    t8 = im[74];
+    t0 = re[84];
+    t10 = im[84];
+    t1 = re[94];
+    t14 = im[94];
+    t7 = t3 + t0;
+    t4 = t9 + t10;
+    t13 = t6 + t1;
+    t5 = t8 + t14;
+    t2 = t3 - t0;
+    t12 = t9 - t10;
+    t11 = t6 - t1;
+    t3 = t8 - t14;
+    t0 = t7 + t13;
+    t9 = t4 + t5;
+    t10 = t2 + t3;
+    t6 = t12 - t11;
+    t1 = t7 - t13;
+    t8 = t4 - t5;
+    t14 = t2 - t3;
+    t7 = t12 + t11;
+    re[64] = t0;
+    im[64] = t9;
+    re[74] = t10;
+    im[74] = t6;
+    re[84] = t1;
+    im[84] = t8;
+    re[94] = t14;
+    im[94] = t7;
+    t13 = re[69];
+    t4 = im[69];
+    t5 = re[79];
+    t2 = im[79];
+    t3 = re[89];
+    t12 = im[89];
+    t11 = re[99];
+    t0 = im[99];
+    t9 = t13 + t3;
+    t10 = t4 + t12;
+    t6 = t5 + t11;
+    t1 = t2 + t0;
+    t8 = t13 - t3;
+    t14 = t4 - t12;
+    t7 = t5 - t11;
+    t13 = t2 - t0;
+    t3 = t9 + t6;
+    t4 = t10 + t1;
+    t12 = t8 + t13;
+    t5 = t14 - t7;
+    t11 = t9 - t6;
+    t2 = t10 - t1;
+    t0 = t8 - t13;
+    t9 = t14 + t7;
+    t6 = t12 + t5;
+    t10 = t12 - t5;
+    t1 = C9 * t6;
+    t8 = (-C9) * t10;
+    t13 = -t11;
+    t14 = t0 - t9;
+    t7 = t0 + t9;
+    t12 = (-C9) * t14;
+    t5 = (-C9) * t7;
+    re[69] = t3;
+    im[69] = t4;
+    re[79] = t1;
+    im[79] = t8;
+    re[89] = t2;
+    im[89] = t13;
+    re[99] = t12;
+    im[99] = t5;
+    t6 = re[64];
+    t10 = im[64];
+    t11 = re[69];
+    t0 = im[69];
+    t9 = t6 - t11;
+    t14 = t10 - t0;
+    t7 = t6 + t11;
+    t3 = t10 + t0;
+    re[64] = t7;
+    im[64] = t3;
+    re[69] = t9;
+    im[69] = t14;
+    t4 = re[74];
+    t1 = im[74];
+    t8 = re[79];
+    t2 = im[79];
+    t13 = t4 - t8;
+    t12 = t1 - t2;
+    t5 = t4 + t8;
+    t6 = t1 + t2;
+    re[74] = t5;
+    im[74] = t6;
+    re[79] = t13;
+    im[79] = t12;
+    t11 = re[84];
+    t10 = im[84];
+    t0 = re[89];
+    t7 = im[89];
+    t3 = t11 - t0;
+    t9 = t10 - t7;
+    t14 = t11 + t0;
+    t4 = t10 + t7;
+    re[84] = t14;
+    im[84] = t4;
+    re[89] = t3;
+    im[89] = t9;
+    t8 = re[94];
+    t1 = im[94];
+    t2 = re[99];
+    t5 = im[99];
+    t6 = t8 - t2;
+    t13 = t1 - t5;
+    t12 = t8 + t2;
+    t11 = t1 + t5;
+    re[94] = t12;
+    im[94] = t11;
+    re[99] = t6;
+    im[99] = t13;
+    t0 = re[104];
+    t10 = im[104];
+    t7 = re[114];
+    t14 = im[114];
+    t4 = re[124];
+    t3 = im[124];
+    t9 = re[134];
+    t8 = im[134];
+    t2 = t0 + t4;
+    t1 = t10 + t3;
+    t5 = t7 + t9;
+    t12 = t14 + t8;
+    t11 = t0 - t4;
+    t6 = t10 - t3;
+    t13 = t7 - t9;
+    t0 = t14 - t8;
+    t4 = t2 + t5;
+    t10 = t1 + t12;
+    t3 = t11 + t0;
+    t7 = t6 - t13;
+    t9 = t2 - t5;
+    t14 = t1 - t12;
+    t8 = t11 - t0;
+    t2 = t6 + t13;
+    re[104] = t4;
+    im[104] = t10;
+    re[114] = t3;
+    im[114] = t7;
+    re[124] = t9;
+    im[124] = t14;
+    re[134] = t8;
+    im[134] = t2;
+    t5 = re[109];
+    t1 = im[109];
+    t12 = re[119];
+    t11 = im[119];
+    t0 = re[129];
+    t6 = im[129];
+    t13 = re[139];
+    t4 = im[139];
+    t10 = t5 + t0;
+    t3 = t1 + t6;
+    t7 = t12 + t13;
+    t9 = t11 + t4;
+    t14 = t5 - t0;
+    t8 = t1 - t6;
+    t2 = t12 - t13;
+    t5 = t11 - t4;
+    t0 = t10 + t7;
+    t1 = t3 + t9;
+    t6 = t14 + t5;
+    t12 = t8 - t2;
+    t13 = t10 - t7;
+    t11 = t3 - t9;
+    t4 = t14 - t5;
+    t10 = t8 + t2;
+    t7 = t6 + t12;
+    t3 = t6 - t12;
+    t9 = C9 * t7;
+    t14 = (-C9) * t3;
+    t5 = -t13;
+    t8 = t4 - t10;
+    t2 = t4 + t10;
+    t6 = (-C9) * t8;
+    t12 = (-C9) * t2;
+    re[109] = t0;
+    im[109] = t1;
+    re[119] = t9;
+    im[119] = t14;
+    re[129] = t11;
+    im[129] = t5;
+    re[139] = t6;
+    im[139] = t12;
+    t7 = re[104];
+    t3 = im[104];
+    t13 = re[109];
+    t4 = im[109];
+    t10 = t7 - t13;
+    t8 = t3 - t4;
+    t2 = t7 + t13;
+    t0 = t3 + t4;
+    re[104] = t2;
+    im[104] = t0;
+    re[109] = t10;
+    im[109] = t8;
+    t1 = re[114];
+    t9 = im[114];
+    t14 = re[119];
+    t11 = im[119];
+    t5 = t1 - t14;
+    t6 = t9 - t11;
+    t12 = t1 + t14;
+    t7 = t9 + t11;
+    re[114] = t12;
+    im[114] = t7;
+    re[119] = t5;
+    im[119] = t6;
+    t13 = re[124];
+    t3 = im[124];
+    t4 = re[129];
+    t2 = im[129];
+    t0 = t13 - t4;
+    t10 = t3 - t2;
+    t8 = t13 + t4;
+    t1 = t3 + t2;
+    re[124] = t8;
+    im[124] = t1;
+    re[129] = t0;
+    im[129] = t10;
+    t14 = re[134];
+    t9 = im[134];
+    t11 = re[139];
+    t12 = im[139];
+    t7 = t14 - t11;
+    t5 = t9 - t12;
+    t6 = t14 + t11;
+    t13 = t9 + t12;
+    re[134] = t6;
+    im[134] = t13;
+    re[139] = t7;
+    im[139] = t5;
+    t4 = re[144];
+    t3 = im[144];
+    t2 = re[154];
+    t8 = im[154];
+    t1 = re[4];
+    t0 = im[4];
+    t10 = re[14];
+    t14 = im[14];
+    t11 = t4 + t1;
+    t9 = t3 + t0;
+    t12 = t2 + t10;
+    t6 = t8 + t14;
+    t13 = t4 - t1;
+    t7 = t3 - t0;
+    t5 = t2 - t10;
+    t4 = t8 - t14;
+    t1 = t11 + t12;
+    t3 = t9 + t6;
+    t0 = t13 + t4;
+    t2 = t7 - t5;
+    t10 = t11 - t12;
+    t8 = t9 - t6;
+    t14 = t13 - t4;
+    t11 = t7 + t5;
+    re[144] = t1;
+    im[144] = t3;
+    re[154] = t0;
+    im[154] = t2;
+    re[4] = t10;
+    im[4] = t8;
+    re[14] = t14;
+    im[14] = t11;
+    t12 = re[149];
+    t9 = im[149];
+    t6 = re[159];
+    t13 = im[159];
+    t4 = re[9];
+    t7 = im[9];
+    t5 = re[19];
+    t1 = im[19];
+    t3 = t12 + t4;
+    t0 = t9 + t7;
+    t2 = t6 + t5;
+    t10 = t13 + t1;
+    t8 = t12 - t4;
+    t14 = t9 - t7;
+    t11 = t6 - t5;
+    t12 = t13 - t1;
+    t4 = t3 + t2;
+    t9 = t0 + t10;
+    t7 = t8 + t12;
+    t6 = t14 - t11;
+    t5 = t3 - t2;
+    t13 = t0 - t10;
+    t1 = t8 - t12;
+    t3 = t14 + t11;
+    t2 = t7 + t6;
+    t0 = t7 - t6;
+    t10 = C9 * t2;
+    t8 = (-C9) * t0;
+    t12 = -t5;
+    t14 = t1 - t3;
+    t11 = t1 + t3;
+    t7 = (-C9) * t14;
+    t6 = (-C9) * t11;
+    re[149] = t4;
+    im[149] = t9;
+    re[159] = t10;
+    im[159] = t8;
+    re[9] = t13;
+    im[9] = t12;
+    re[19] = t7;
+    im[19] = t6;
+    t2 = re[144];
+    t0 = im[144];
+    t5 = re[149];
+    t1 = im[149];
+    t3 = t2 - t5;
+    t14 = t0 - t1;
+    t11 = t2 + t5;
+    t4 = t0 + t1;
+    re[144] = t11;
+    im[144] = t4;
+    re[149] = t3;
+    im[149] = t14;
+    t9 = re[154];
+    t10 = im[154];
+    t8 = re[159];
+    t13 = im[159];
+    t12 = t9 - t8;
+    t7 = t10 - t13;
+    t6 = t9 + t8;
+    t2 = t10 + t13;
+    re[154] = t6;
+    im[154] = t2;
+    re[159] = t12;
+    im[159] = t7;
+    t5 = re[4];
+    t0 = im[4];
+    t1 = re[9];
+    t11 = im[9];
+    t4 = t5 - t1;
+    t3 = t0 - t11;
+    t14 = t5 + t1;
+    t9 = t0 + t11;
+    re[4] = t14;
+    im[4] = t9;
+    re[9] = t4;
+    im[9] = t3;
+    t8 = re[14];
+    t10 = im[14];
+    t13 = re[19];
+    t6 = im[19];
+    t2 = t8 - t13;
+    t12 = t10 - t6;
+    t7 = t8 + t13;
+    t5 = t10 + t6;
+    re[14] = t7;
+    im[14] = t5;
+    re[19] = t2;
+    im[19] = t12;
+    t1 = re[24];
+    t0 = im[24];
+    t11 = re[34];
+    t14 = im[34];
+    t9 = re[44];
+    t4 = im[44];
+    t3 = re[54];
+    t8 = im[54];
+    t13 = t1 + t9;
+    t10 = t0 + t4;
+    t6 = t11 + t3;
+    t7 = t14 + t8;
+    t5 = t1 - t9;
+    t2 = t0 - t4;
+    t12 = t11 - t3;
+    t1 = t14 - t8;
+    t9 = t13 + t6;
+    t0 = t10 + t7;
+    t4 = t5 + t1;
+    t11 = t2 - t12;
+    t3 = t13 - t6;
+    t14 = t10 - t7;
+    t8 = t5 - t1;
+    t13 = t2 + t12;
+    re[24] = t9;
+    im[24] = t0;
+    re[34] = t4;
+    im[34] = t11;
+    re[44] = t3;
+    im[44] = t14;
+    re[54] = t8;
+    im[54] = t13;
+    t6 = re[29];
+    t10 = im[29];
+    t7 = re[39];
+    t5 = im[39];
+    t1 = re[49];
+    t2 = im[49];
+    t12 = re[59];
+    t9 = im[59];
+    t0 = t6 + t1;
+    t4 = t10 + t2;
+    t11 = t7 + t12;
+    t3 = t5 + t9;
+    t14 = t6 - t1;
+    t8 = t10 - t2;
+    t13 = t7 - t12;
+    t6 = t5 - t9;
+    t1 = t0 + t11;
+    t10 = t4 + t3;
+    t2 = t14 + t6;
+    t7 = t8 - t13;
+    t12 = t0 - t11;
+    t5 = t4 - t3;
+    t9 = t14 - t6;
+    t0 = t8 + t13;
+    t11 = t2 + t7;
+    t4 = t2 - t7;
+    t3 = C9 * t11;
+    t14 = (-C9) * t4;
+    t6 = -t12;
+    t8 = t9 - t0;
+    t13 = t9 + t0;
+    t2 = (-C9) * t8;
+    t7 = (-C9) * t13;
+    re[29] = t1;
+    im[29] = t10;
+    re[39] = t3;
+    im[39] = t14;
+    re[49] = t5;
+    im[49] = t6;
+    re[59] = t2;
+    im[59] = t7;
+    t11 = re[24];
+    t4 = im[24];
+    t12 = re[29];
+    t9 = im[29];
+    t0 = t11 - t12;
+    t8 = t4 - t9;
+    t13 = t11 + t12;
+    t1 = t4 + t9;
+    re[24] = t13;
+    im[24] = t1;
+    re[29] = t0;
+    im[29] = t8;
+    t10 = re[34];
+    t3 = im[34];
+    t14 = re[39];
+    t5 = im[39];
+    t6 = t10 - t14;
+    t2 = t3 - t5;
+    t7 = t10 + t14;
+    t11 = t3 + t5;
+    re[34] = t7;
+    im[34] = t11;
+    re[39] = t6;
+    im[39] = t2;
+    t12 = re[44];
+    t4 = im[44];
+    t9 = re[49];
+    t13 = im[49];
+    t1 = t12 - t9;
+    t0 = t4 - t13;
+    t8 = t12 + t9;
+    t10 = t4 + t13;
+    re[44] = t8;
+    im[44] = t10;
+    re[49] = t1;
+    im[49] = t0;
+    t14 = re[54];
+    t3 = im[54];
+    t5 = re[59];
+    t7 = im[59];
+    t11 = t14 - t5;
+    t6 = t3 - t7;
+    t2 = t14 + t5;
+    t12 = t3 + t7;
+    re[54] = t2;
+    im[54] = t12;
+    re[59] = t11;
+    im[59] = t6;
+    t9 = re[96];
+    t4 = im[96];
+    t13 = re[136];
+    t8 = im[136];
+    t10 = re[16];
+    t1 = im[16];
+    t0 = re[56];
+    t14 = im[56];
+    t5 = t9 + t10;
+    t3 = t4 + t1;
+    t7 = t13 + t0;
+    t2 = t8 + t14;
+    t12 = t9 - t10;
+    t11 = t4 - t1;
+    t6 = t13 - t0;
+    t9 = t8 - t14;
+    t10 = t5 + t7;
+    t4 = t3 + t2;
+    t1 = t12 + t9;
+    t13 = t11 - t6;
+    t0 = t5 - t7;
+    t8 = t3 - t2;
+    t14 = t12 - t9;
+    t5 = t11 + t6;
+    re[96] = t10;
+    im[96] = t4;
+    re[136] = t1;
+    im[136] = t13;
+    re[16] = t0;
+    im[16] = t8;
+    re[56] = t14;
+    im[56] = t5;
+    t7 = re[101];
+    t3 = im[101];
+    t2 = re[141];
+    t12 = im[141];
+    t9 = re[21];
+    t11 = im[21];
+    t6 = re[61];
+    t10 = im[61];
+    t4 = t7 + t9;
+    t1 = t3 + t11;
+    t13 = t2 + t6;
+    t0 = t12 + t10;
+    t8 = t7 - t9;
+    t14 = t3 - t11;
+    t5 = t2 - t6;
+    t7 = t12 - t10;
+    t9 = t4 + t13;
+    t3 = t1 + t0;
+    t11 = t8 + t7;
+    t2 = t14 - t5;
+    t6 = t4 - t13;
+    t12 = t1 - t0;
+    t10 = t8 - t7;
+    t4 = t14 + t5;
+    t13 = t11 + t2;
+    t1 = C0 * t13;
+    t0 = t11 * (-C1);
+    t8 = t2 * C2;
+    t7 = t1 - t8;
+    t14 = t1 + t0;
+    t5 = t6 + t12;
+    t13 = C3 * t5;
+    t11 = t6 * (-C4);
+    t2 = t12 * C5;
+    t8 = t13 - t2;
+    t1 = t13 + t11;
+    t0 = t10 + t4;
+    t5 = C6 * t0;
+    t6 = t10 * (-C7);
+    t12 = t4 * C8;
+    t2 = t5 - t12;
+    t13 = t5 + t6;
+    re[101] = t9;
+    im[101] = t3;
+    re[141] = t7;
+    im[141] = t14;
+    re[21] = t8;
+    im[21] = t1;
+    re[61] = t2;
+    im[61] = t13;
+    t11 = re[106];
+    t0 = im[106];
+    t10 = re[146];
+    t4 = im[146];
+    t12 = re[26];
+    t5 = im[26];
+    t6 = re[66];
+    t9 = im[66];
+    t3 = t11 + t12;
+    t7 = t0 + t5;
+    t14 = t10 + t6;
+    t8 = t4 + t9;
+    t1 = t11 - t12;
+    t2 = t0 - t5;
+    t13 = t10 - t6;
+    t11 = t4 - t9;
+    t12 = t3 + t14;
+    t0 = t7 + t8;
+    t5 = t1 + t11;
+    t10 = t2 - t13;
+    t6 = t3 - t14;
+    t4 = t7 - t8;
+    t9 = t1 - t11;
+    t3 = t2 + t13;
+    t14 = t5 + t10;
+    t7 = C3 * t14;
+    t8 = t5 * (-C4);
+    t1 = t10 * C5;
+    t11 = t7 - t1;
+    t2 = t7 + t8;
+    t13 = t6 + t4;
+    t14 = t6 - t4;
+    t5 = C9 * t13;
+    t10 = (-C9) * t14;
+    t1 = t9 + t3;
+    t7 = C10 * t1;
+    t8 = t9 * (-C4);
+    t6 = t3 * (-C5);
+    t4 = t7 - t6;
+    t13 = t7 + t8;
+    re[106] = t12;
+    im[106] = t0;
+    re[146] = t11;
+    im[146] = t2;
+    re[26] = t5;
+    im[26] = t10;
+    re[66] = t4;
+    im[66] = t13;
+    t14 = re[111];
+    t1 = im[111];
+    t9 = re[151];
+    t3 = im[151];
+    t6 = re[31];
+    t7 = im[31];
+    t8 = re[71];
+    t12 = im[71];
+    t0 = t14 + t6;
+    t11 = t1 + t7;
+    t2 = t9 + t8;
+    t5 = t3 + t12;
+    t10 = t14 - t6;
+    t4 = t1 - t7;
+    t13 = t9 - t8;
+    t14 = t3 - t12;
+    t6 = t0 + t2;
+    t1 = t11 + t5;
+    t7 = t10 + t14;
+    t9 = t4 - t13;
+    t8 = t0 - t2;
+    t3 = t11 - t5;
+    t12 = t10 - t14;
+    t0 = t4 + t13;
+    t2 = t7 + t9;
+    t11 = C6 * t2;
+    t5 = t7 * (-C7);
+    t10 = t9 * C8;
+    t14 = t11 - t10;
+    t4 = t11 + t5;
+    t13 = t8 + t3;
+    t2 = C10 * t13;
+    t7 = t8 * (-C4);
+    t9 = t3 * (-C5);
+    t10 = t2 - t9;
+    t11 = t2 + t7;
+    t5 = t12 + t0;
+    t13 = (-C11) * t5;
+    t8 = t12 * (-C2);
+    t3 = t0 * (-C1);
+    t9 = t13 - t3;
+    t2 = t13 + t8;
+    re[111] = t6;
+    im[111] = t1;
+    re[151] = t14;
+    im[151] = t4;
+    re[31] = t10;
+    im[31] = t11;
+    re[71] = t9;
+    im[71] = t2;
+    t7 = re[116];
+    t5 = im[116];
+    t12 = re[156];
+    t0 = im[156];
+    t3 = re[36];
+    t13 = im[36];
+    t8 = re[76];
+    t6 = im[76];
+    t1 = t7 + t3;
+    t14 = t5 + t13;
+    t4 = t12 + t8;
+    t10 = t0 + t6;
+    t11 = t7 - t3;
+    t9 = t5 - t13;
+    t2 = t12 - t8;
+    t7 = t0 - t6;
+    t3 = t1 + t4;
+    t5 = t14 + t10;
+    t13 = t11 + t7;
+    t12 = t9 - t2;
+    t8 = t1 - t4;
+    t0 = t14 - t10;
+    t6 = t11 - t7;
+    t1 = t9 + t2;
+    t4 = t13 + t12;
+    t14 = t13 - t12;
+    t10 = C9 * t4;
+    t11 = (-C9) * t14;
+    t7 = -t8;
+    t9 = t6 - t1;
+    t2 = t6 + t1;
+    t13 = (-C9) * t9;
+    t12 = (-C9) * t2;
+    re[116] = t3;
+    im[116] = t5;
+    re[156] = t10;
+    im[156] = t11;
+    re[36] = t0;
+    im[36] = t7;
+    re[76] = t13;
+    im[76] = t12;
+    t4 = re[121];
+    t14 = im[121];
+    t8 = re[1];
+    t6 = im[1];
+    t1 = re[41];
+    t9 = im[41];
+    t2 = re[81];
+    t3 = im[81];
+    t5 = t4 + t1;
+    t10 = t14 + t9;
+    t11 = t8 + t2;
+    t0 = t6 + t3;
+    t7 = t4 - t1;
+    t13 = t14 - t9;
+    t12 = t8 - t2;
+    t4 = t6 - t3;
+    t1 = t5 + t11;
+    t14 = t10 + t0;
+    t9 = t7 + t4;
+    t8 = t13 - t12;
+    t2 = t5 - t11;
+    t6 = t10 - t0;
+    t3 = t7 - t4;
+    t5 = t13 + t12;
+    t11 = t9 + t8;
+    t10 = C12 * t11;
+    t0 = t9 * (-C7);
+    t7 = t8 * (-C8);
+    t4 = t10 - t7;
+    t13 = t10 + t0;
+    t12 = t2 + t6;
+    t11 = (-C10) * t12;
+    t9 = t2 * (-C5);
+    t8 = t6 * (-C4);
+    t7 = t11 - t8;
+    t10 = t11 + t9;
+    t0 = t3 + t5;
+    t12 = (-C0) * t0;
+    t2 = t3 * C2;
+    t6 = t5 * (-C1);
+    t8 = t12 - t6;
+    t11 = t12 + t2;
+    re[121] = t1;
+    im[121] = t14;
+    re[1] = t4;
+    im[1] = t13;
+    re[41] = t7;
+    im[41] = t10;
+    re[81] = t8;
+    im[81] = t11;
+    t9 = re[126];
+    t0 = im[126];
+    t3 = re[6];
+    t5 = im[6];
+    t6 = re[46];
+    t12 = im[46];
+    t2 = re[86];
+    t1 = im[86];
+    t14 = t9 + t6;
+    t4 = t0 + t12;
+    t13 = t3 + t2;
+    t7 = t5 + t1;
+    t10 = t9 - t6;
+    t8 = t0 - t12;
+    t11 = t3 - t2;
+    t9 = t5 - t1;
+    t6 = t14 + t13;
+    t0 = t4 + t7;
+    t12 = t10 + t9;
+    t3 = t8 - t11;
+    t2 = t14 - t13;
+    t5 = t4 - t7;
+    t1 = t10 - t9;
+    t14 = t8 + t11;
+    t13 = t12 + t3;
+    t4 = C10 * t13;
+    t7 = t12 * (-C4);
+    t10 = t3 * (-C5);
+    t9 = t4 - t10;
+    t8 = t4 + t7;
+    t11 = t2 - t5;
+    t13 = t2 + t5;
+    t12 = (-C9) * t11;
+    t3 = (-C9) * t13;
+    t10 = t1 + t14;
+    t4 = (-C3) * t10;
+    t7 = t1 * C4;
+    t2 = t14 * (-C5);
+    t5 = t4 - t2;
+    t11 = t4 + t7;
+    re[126] = t6;
+    im[126] = t0;
+    re[6] = t9;
+    im[6] = t8;
+    re[46] = t12;
+    im[46] = t3;
+    re[86] = t5;
+    im[86] = t11;
+    t13 = re[131];
+    t10 = im[131];
+    t1 = re[11];
+    t14 = im[11];
+    t2 = re[51];
+    t4 = im[51];
+    t7 = re[91];
+    t6 = im[91];
+    t0 = t13 + t2;
+    t9 = t10 + t4;
+    t8 = t1 + t7;
+    t12 = t14 + t6;
+    t3 = t13 - t2;
+    t5 = t10 - t4;
+    t11 = t1 - t7;
+    t13 = t14 - t6;
+    t2 = t0 + t8;
+    t10 = t9 + t12;
+    t4 = t3 + t13;
+    t1 = t5 - t11;
+    t7 = t0 - t8;
+    t14 = t9 - t12;
+    t6 = t3 - t13;
+    t0 = t5 + t11;
+    t8 = t4 + t1;
+    t9 = C11 * t8;
+    t12 = t4 * (-C1);
+    t3 = t1 * (-C2);
+    t13 = t9 - t3;
+    t5 = t9 + t12;
+    t11 = t7 + t14;
+    t8 = (-C3) * t11;
+    t4 = t7 * C5;
+    t1 = t14 * (-C4);
+    t3 = t8 - t1;
+    t9 = t8 + t4;
+    t12 = t6 + t0;
+    t11 = (-C12) * t12;
+    t7 = t6 * C7;
+    t14 = t0 * C8;
+    t1 = t11 - t14;
+    t8 = t11 + t7;
+    re[131] = t2;
+    im[131] = t10;
+    re[11] = t13;
+    im[11] = t5;
+    re[51] = t3;
+    im[51] = t9;
+    re[91] = t1;
+    im[91] = t8;
+    t4 = re[96];
+    t12 = im[96];
+    t6 = re[106];
+    t0 = im[106];
+    t14 = re[116];
+    t11 = im[116];
+    t7 = re[126];
+    t2 = im[126];
+    t10 = t4 + t14;
+    t13 = t12 + t11;
+    t5 = t6 + t7;
+    t3 = t0 + t2;
+    t9 = t4 - t14;
+    t1 = t12 - t11;
+    t8 = t6 - t7;
+    t4 = t0 - t2;
+    t14 = t10 + t5;
+    t12 = t13 + t3;
+    t11 = t9 + t4;
+    t6 = t1 - t8;
+    t7 = t10 - t5;
+    t0 = t13 - t3;
+    t2 = t9 - t4;
+    t10 = t1 + t8;
+    re[96] = t14;
+    im[96] = t12;
+    re[106] = t11;
+    im[106] = t6;
+    re[116] = t7;
+    im[116] = t0;
+    re[126] = t2;
+    im[126] = t10;
+    t5 = re[101];
+    t13 = im[101];
+    t3 = re[111];
+    t9 = im[111];
+    t4 = re[121];
+    t1 = im[121];
+    t8 = re[131];
+    t14 = im[131];
+    t12 = t5 + t4;
+    t11 = t13 + t1;
+    t6 = t3 + t8;
+    t7 = t9 + t14;
+    t0 = t5 - t4;
+    t2 = t13 - t1;
+    t10 = t3 - t8;
+    t5 = t9 - t14;
+    t4 = t12 + t6;
+    t13 = t11 + t7;
+    t1 = t0 + t5;
+    t3 = t2 - t10;
+    t8 = t12 - t6;
+    t9 = t11 - t7;
+    t14 = t0 - t5;
+    t12 = t2 + t10;
+    t6 = t1 + t3;
+    t11 = t1 - t3;
+    t7 = C9 * t6;
+    t0 = (-C9) * t11;
+    t5 = -t8;
+    t2 = t14 - t12;
+    t10 = t14 + t12;
+    t1 = (-C9) * t2;
+    t3 = (-C9) * t10;
+    re[101] = t4;
+    im[101] = t13;
+    re[111] = t7;
+    im[111] = t0;
+    re[121] = t9;
+    im[121] = t5;
+    re[131] = t1;
+    im[131] = t3;
+    t6 = re[96];
+    t11 = im[96];
+    t8 = re[101];
+    t14 = im[101];
+    t12 = t6 - t8;
+    t2 = t11 - t14;
+    t10 = t6 + t8;
+    t4 = t11 + t14;
+    re[96] = t10;
+    im[96] = t4;
+    re[101] = t12;
+    im[101] = t2;
+    t13 = re[106];
+    t7 = im[106];
+    t0 = re[111];
+    t9 = im[111];
+    t5 = t13 - t0;
+    t1 = t7 - t9;
+    t3 = t13 + t0;
+    t6 = t7 + t9;
+    re[106] = t3;
+    im[106] = t6;
+    re[111] = t5;
+    im[111] = t1;
+    t8 = re[116];
+    t11 = im[116];
+    t14 = re[121];
+    t10 = im[121];
+    t4 = t8 - t14;
+    t12 = t11 - t10;
+    t2 = t8 + t14;
+    t13 = t11 + t10;
+    re[116] = t2;
+    im[116] = t13;
+    re[121] = t4;
+    im[121] = t12;
+    t0 = re[126];
+    t7 = im[126];
+    t9 = re[131];
+    t3 = im[131];
+    t6 = t0 - t9;
+    t5 = t7 - t3;
+    t1 = t0 + t9;
+    t8 = t7 + t3;
+    re[126] = t1;
+    im[126] = t8;
+    re[131] = t6;
+    im[131] = t5;
+    t14 = re[136];
+    t11 = im[136];
+    t10 = re[146];
+    t2 = im[146];
+    t13 = re[156];
+    t4 = im[156];
+    t12 = re[6];
+    t0 = im[6];
+    t9 = t14 + t13;
+    t7 = t11 + t4;
+    t3 = t10 + t12;
+    t1 = t2 + t0;
+    t8 = t14 - t13;
+    t6 = t11 - t4;
+    t5 = t10 - t12;
+    t14 = t2 - t0;
+    t13 = t9 + t3;
+    t11 = t7 + t1;
+    t4 = t8 + t14;
+    t10 = t6 - t5;
+    t12 = t9 - t3;
+    t2 = t7 - t1;
+    t0 = t8 - t14;
+    t9 = t6 + t5;
+    re[136] = t13;
+    im[136] = t11;
+    re[146] = t4;
+    im[146] = t10;
+    re[156] = t12;
+    im[156] = t2;
+    re[6] = t0;
+    im[6] = t9;
+    t3 = re[141];
+    t7 = im[141];
+    t1 = re[151];
+    t8 = im[151];
+    t14 = re[1];
+    t6 = im[1];
+    t5 = re[11];
+    t13 = im[11];
+    t11 = t3 + t14;
+    t4 = t7 + t6;
+    t10 = t1 + t5;
+    t12 = t8 + t13;
+    t2 = t3 - t14;
+    t0 = t7 - t6;
+    t9 = t1 - t5;
+    t3 = t8 - t13;
+    t14 = t11 + t10;
+    t7 = t4 + t12;
+    t6 = t2 + t3;
+    t1 = t0 - t9;
+    t5 = t11 - t10;
+    t8 = t4 - t12;
+    t13 = t2 - t3;
+    t11 = t0 + t9;
+    t10 = t6 + t1;
+    t4 = t6 - t1;
+    t12 = C9 * t10;
+    t2 = (-C9) * t4;
+    t3 = -t5;
+    t0 = t13 - t11;
+    t9 = t13 + t11;
+    t6 = (-C9) * t0;
+    t1 = (-C9) * t9;
+    re[141] = t14;
+    im[141] = t7;
+    re[151] = t12;
+    im[151] = t2;
+    re[1] = t8;
+    im[1] = t3;
+    re[11] = t6;
+    im[11] = t1;
+    t10 = re[136];
+    t4 = im[136];
+    t5 = re[141];
+    t13 = im[141];
+    t11 = t10 - t5;
+    t0 = t4 - t13;
+    t9 = t10 + t5;
+    t14 = t4 + t13;
+    re[136] = t9;
+    im[136] = t14;
+    re[141] = t11;
+    im[141] = t0;
+    t7 = re[146];
+    t12 = im[146];
+    t2 = re[151];
+    t8 = im[151];
+    t3 = t7 - t2;
+    t6 = t12 - t8;
+    t1 = t7 + t2;
+    t10 = t12 + t8;
+    re[146] = t1;
+    im[146] = t10;
+    re[151] = t3;
+    im[151] = t6;
+    t5 = re[156];
+    t4 = im[156];
+    t13 = re[1];
+    t9 = im[1];
+    t14 = t5 - t13;
+    t11 = t4 - t9;
+    t0 = t5 + t13;
+    t7 = t4 + t9;
+    re[156] = t0;
+    im[156] = t7;
+    re[1] = t14;
+    im[1] = t11;
+    t2 = re[6];
+    t12 = im[6];
+    t8 = re[11];
+    t1 = im[11];
+    t10 = t2 - t8;
+    t3 = t12 - t1;
+    t6 = t2 + t8;
+    t5 = t12 + t1;
+    re[6] = t6;
+    im[6] = t5;
+    re[11] = t10;
+    im[11] = t3;
+    t13 = re[16];
+    t4 = im[16];
+    t9 = re[26];
+    t0 = im[26];
+    t7 = re[36];
+    t14 = im[36];
+    t11 = re[46];
+    t2 = im[46];
+    t8 = t13 + t7;
+    t12 = t4 + t14;
+    t1 = t9 + t11;
+    t6 = t0 + t2;
+    t5 = t13 - t7;
+    t10 = t4 - t14;
+    t3 = t9 - t11;
+    t13 = t0 - t2;
+    t7 = t8 + t1;
+    t4 = t12 + t6;
+    t14 = t5 + t13;
+    t9 = t10 - t3;
+    t11 = t8 - t1;
+    t0 = t12 - t6;
+    t2 = t5 - t13;
+    t8 = t10 + t3;
+    re[16] = t7;
+    im[16] = t4;
+    re[26] = t14;
+    im[26] = t9;
+    re[36] = t11;
+    im[36] = t0;
+    re[46] = t2;
+    im[46] = t8;
+    t1 = re[21];
+    t12 = im[21];
+    t6 = re[31];
+    t5 = im[31];
+    t13 = re[41];
+    t10 = im[41];
+    t3 = re[51];
+    t7 = im[51];
+    t4 = t1 + t13;
+    t14 = t12 + t10;
+    t9 = t6 + t3;
+    t11 = t5 + t7;
+    t0 = t1 - t13;
+    t2 = t12 - t10;
+    t8 = t6 - t3;
+    t1 = t5 - t7;
+    t13 = t4 + t9;
+    t12 = t14 + t11;
+    t10 = t0 + t1;
+    t6 = t2 - t8;
+    t3 = t4 - t9;
+    t5 = t14 - t11;
+    t7 = t0 - t1;
+    t4 = t2 + t8;
+    t9 = t10 + t6;
+    t14 = t10 - t6;
+    t11 = C9 * t9;
+    t0 = (-C9) * t14;
+    t1 = -t3;
+    t2 = t7 - t4;
+    t8 = t7 + t4;
+    t10 = (-C9) * t2;
+    t6 = (-C9) * t8;
+    re[21] = t13;
+    im[21] = t12;
+    re[31] = t11;
+    im[31] = t0;
+    re[41] = t5;
+    im[41] = t1;
+    re[51] = t10;
+    im[51] = t6;
+    t9 = re[16];
+    t14 = im[16];
+    t3 = re[21];
+    t7 = im[21];
+    t4 = t9 - t3;
+    t2 = t14 - t7;
+    t8 = t9 + t3;
+    t13 = t14 + t7;
+    re[16] = t8;
+    im[16] = t13;
+    re[21] = t4;
+    im[21] = t2;
+    t12 = re[26];
+    t11 = im[26];
+    t0 = re[31];
+    t5 = im[31];
+    t1 = t12 - t0;
+    t10 = t11 - t5;
+    t6 = t12 + t0;
+    t9 = t11 + t5;
+    re[26] = t6;
+    im[26] = t9;
+    re[31] = t1;
+    im[31] = t10;
+    t3 = re[36];
+    t14 = im[36];
+    t7 = re[41];
+    t8 = im[41];
+    t13 = t3 - t7;
+    t4 = t14 - t8;
+    t2 = t3 + t7;
+    t12 = t14 + t8;
+    re[36] = t2;
+    im[36] = t12;
+    re[41] = t13;
+    im[41] = t4;
+    t0 = re[46];
+    t11 = im[46];
+    t5 = re[51];
+    t6 = im[51];
+    t9 = t0 - t5;
+    t1 = t11 - t6;
+    t10 = t0 + t5;
+    t3 = t11 + t6;
+    re[46] = t10;
+    im[46] = t3;
+    re[51] = t9;
+    im[51] = t1;
+    t7 = re[56];
+    t14 = im[56];
+    t8 = re[66];
+    t2 = im[66];
+    t12 = re[76];
+    t13 = im[76];
+    t4 = re[86];
+    t0 = im[86];
+    t5 = t7 + t12;
+    t11 = t14 + t13;
+    t6 = t8 + t4;
+    t10 = t2 + t0;
+    t3 = t7 - t12;
+    t9 = t14 - t13;
+    t1 = t8 - t4;
+    t7 = t2 - t0;
+    t12 = t5 + t6;
+    t14 = t11 + t10;
+    t13 = t3 + t7;
+    t8 = t9 - t1;
+    t4 = t5 - t6;
+    t2 = t11 - t10;
+    t0 = t3 - t7;
+    t5 = t9 + t1;
+    re[56] = t12;
+    im[56] = t14;
+    re[66] = t13;
+    im[66] = t8;
+    re[76] = t4;
+    im[76] = t2;
+    re[86] = t0;
+    im[86] = t5;
+    t6 = re[61];
+    t11 = im[61];
+    t10 = re[71];
+    t3 = im[71];
+    t7 = re[81];
+    t9 = im[81];
+    t1 = re[91];
+    t12 = im[91];
+    t14 = t6 + t7;
+    t13 = t11 + t9;
+    t8 = t10 + t1;
+    t4 = t3 + t12;
+    t2 = t6 - t7;
+    t0 = t11 - t9;
+    t5 = t10 - t1;
+    t6 = t3 - t12;
+    t7 = t14 + t8;
+    t11 = t13 + t4;
+    t9 = t2 + t6;
+    t10 = t0 - t5;
+    t1 = t14 - t8;
+    t3 = t13 - t4;
+    t12 = t2 - t6;
+    t14 = t0 + t5;
+    t8 = t9 + t10;
+    t13 = t9 - t10;
+    t4 = C9 * t8;
+    t2 = (-C9) * t13;
+    t6 = -t1;
+    t0 = t12 - t14;
+    t5 = t12 + t14;
+    t9 = (-C9) * t0;
+    t10 = (-C9) * t5;
+    re[61] = t7;
+    im[61] = t11;
+    re[71] = t4;
+    im[71] = t2;
+    re[81] = t3;
+    im[81] = t6;
+    re[91] = t9;
+    im[91] = t10;
+    t8 = re[56];
+    t13 = im[56];
+    t1 = re[61];
+    t12 = im[61];
+    t14 = t8 - t1;
+    t0 = t13 - t12;
+    t5 = t8 + t1;
+    t7 = t13 + t12;
+    re[56] = t5;
+    im[56] = t7;
+    re[61] = t14;
+    im[61] = t0;
+    t11 = re[66];
+    t4 = im[66];
+    t2 = re[71];
+    t3 = im[71];
+    t6 = t11 - t2;
+    t9 = t4 - t3;
+    t10 = t11 + t2;
+    t8 = t4 + t3;
+    re[66] = t10;
+    im[66] = t8;
+    re[71] = t6;
+    im[71] = t9;
+    t1 = re[76];
+    t13 = im[76];
+    t12 = re[81];
+    t5 = im[81];
+    t7 = t1 - t12;
+    t14 = t13 - t5;
+    t0 = t1 + t12;
+    t11 = t13 + t5;
+    re[76] = t0;
+    im[76] = t11;
+    re[81] = t7;
+    im[81] = t14;
+    t2 = re[86];
+    t4 = im[86];
+    t3 = re[91];
+    t10 = im[91];
+    t8 = t2 - t3;
+    t6 = t4 - t10;
+    t9 = t2 + t3;
+    t1 = t4 + t10;
+    re[86] = t9;
+    im[86] = t1;
+    re[91] = t8;
+    im[91] = t6;
+    t12 = re[128];
+    t13 = im[128];
+    t5 = re[8];
+    t0 = im[8];
+    t11 = re[48];
+    t7 = im[48];
+    t14 = re[88];
+    t2 = im[88];
+    t3 = t12 + t11;
+    t4 = t13 + t7;
+    t10 = t5 + t14;
+    t9 = t0 + t2;
+    t1 = t12 - t11;
+    t8 = t13 - t7;
+    t6 = t5 - t14;
+    t12 = t0 - t2;
+    t11 = t3 + t10;
+    t13 = t4 + t9;
+    t7 = t1 + t12;
+    t5 = t8 - t6;
+    t14 = t3 - t10;
+    t0 = t4 - t9;
+    t2 = t1 - t12;
+    t3 = t8 + t6;
+    re[128] = t11;
+    im[128] = t13;
+    re[8] = t7;
+    im[8] = t5;
+    re[48] = t14;
+    im[48] = t0;
+    re[88] = t2;
+    im[88] = t3;
+    t10 = re[133];
+    t4 = im[133];
+    t9 = re[13];
+    t1 = im[13];
+    t12 = re[53];
+    t8 = im[53];
+    t6 = re[93];
+    t11 = im[93];
+    t13 = t10 + t12;
+    t7 = t4 + t8;
+    t5 = t9 + t6;
+    t14 = t1 + t11;
+    t0 = t10 - t12;
+    t2 = t4 - t8;
+    t3 = t9 - t6;
+    t10 = t1 - t11;
+    t12 = t13 + t5;
+    t4 = t7 + t14;
+    t8 = t0 + t10;
+    t9 = t2 - t3;
+    t6 = t13 - t5;
+    t1 = t7 - t14;
+    t11 = t0 - t10;
+    t13 = t2 + t3;
+    t5 = t8 + t9;
+    t7 = C0 * t5;
+    t14 = t8 * (-C1);
+    t0 = t9 * C2;
+    t10 = t7 - t0;
+    t2 = t7 + t14;
+    t3 = t6 + t1;
+    t5 = C3 * t3;
+    t8 = t6 * (-C4);
+    t9 = t1 * C5;
+    t0 = t5 - t9;
+    t7 = t5 + t8;
+    t14 = t11 + t13;
+    t3 = C6 * t14;
+    t6 = t11 * (-C7);
+    t1 = t13 * C8;
+    t9 = t3 - t1;
+    t5 = t3 + t6;
+    re[133] = t12;
+    im[133] = t4;
+    re[13] = t10;
+    im[13] = t2;
+    re[53] = t0;
+    im[53] = t7;
+    re[93] = t9;
+    im[93] = t5;
+    t8 = re[138];
+    t14 = im[138];
+    t11 = re[18];
+    t13 = im[18];
+    t1 = re[58];
+    t3 = im[58];
+    t6 = re[98];
+    t12 = im[98];
+    t4 = t8 + t1;
+    t10 = t14 + t3;
+    t2 = t11 + t6;
+    t0 = t13 + t12;
+    t7 = t8 - t1;
+    t9 = t14 - t3;
+    t5 = t11 - t6;
+    t8 = t13 - t12;
+    t1 = t4 + t2;
+    t14 = t10 + t0;
+    t3 = t7 + t8;
+    t11 = t9 - t5;
+    t6 = t4 - t2;
+    t13 = t10 - t0;
+    t12 = t7 - t8;
+    t4 = t9 + t5;
+    t2 = t3 + t11;
+    t10 = C3 * t2;
+    t0 = t3 * (-C4);
+    t7 = t11 * C5;
+    t8 = t10 - t7;
+    t9 = t10 + t0;
+    t5 = t6 + t13;
+    t2 = t6 - t13;
+    t3 = C9 * t5;
+    t11 = (-C9) * t2;
+    t7 = t12 + t4;
+    t10 = C10 * t7;
+    t0 = t12 * (-C4);
+    t6 = t4 * (-C5);
+    t13 = t10 - t6;
+    t5 = t10 + t0;
+    re[138] = t1;
+    im[138] = t14;
+    re[18] = t8;
+    im[18] = t9;
+    re[58] = t3;
+    im[58] = t11;
+    re[98] = t13;
+    im[98] = t5;
+    t2 = re[143];
+    t7 = im[143];
+    t12 = re[23];
+    t4 = im[23];
+    t6 = re[63];
+    t10 = im[63];
+    t0 = re[103];
+    t1 = im[103];
+    t14 = t2 + t6;
+    t8 = t7 + t10;
+    t9 = t12 + t0;
+    t3 = t4 + t1;
+    t11 = t2 - t6;
+    t13 = t7 - t10;
+    t5 = t12 - t0;
+    t2 = t4 - t1;
+    t6 = t14 + t9;
+    t7 = t8 + t3;
+    t10 = t11 + t2;
+    t12 = t13 - t5;
+    t0 = t14 - t9;
+    t4 = t8 - t3;
+    t1 = t11 - t2;
+    t14 = t13 + t5;
+    t9 = t10 + t12;
+    t8 = C6 * t9;
+    t3 = t10 * (-C7);
+    t11 = t12 * C8;
+    t2 = t8 - t11;
+    t13 = t8 + t3;
+    t5 = t0 + t4;
+    t9 = C10 * t5;
+    t10 = t0 * (-C4);
+    t12 = t4 * (-C5);
+    t11 = t9 - t12;
+    t8 = t9 + t10;
+    t3 = t1 + t14;
+    t5 = (-C11) * t3;
+    t0 = t1 * (-C2);
+    t4 = t14 * (-C1);
+    t12 = t5 - t4;
+    t9 = t5 + t0;
+    re[143] = t6;
+    im[143] = t7;
+    re[23] = t2;
+    im[23] = t13;
+    re[63] = t11;
+    im[63] = t8;
+    re[103] = t12;
+    im[103] = t9;
+    t10 = re[148];
+    t3 = im[148];
+    t1 = re[28];
+    t14 = im[28];
+    t4 = re[68];
+    t5 = im[68];
+    t0 = re[108];
+    t6 = im[108];
+    t7 = t10 + t4;
+    t2 = t3 + t5;
+    t13 = t1 + t0;
+    t11 = t14 + t6;
+    t8 = t10 - t4;
+    t12 = t3 - t5;
+    t9 = t1 - t0;
+    t10 = t14 - t6;
+    t4 = t7 + t13;
+    t3 = t2 + t11;
+    t5 = t8 + t10;
+    t1 = t12 - t9;
+    t0 = t7 - t13;
+    t14 = t2 - t11;
+    t6 = t8 - t10;
+    t7 = t12 + t9;
+    t13 = t5 + t1;
+    t2 = t5 - t1;
+    t11 = C9 * t13;
+    t8 = (-C9) * t2;
+    t10 = -t0;
+    t12 = t6 - t7;
+    t9 = t6 + t7;
+    t5 = (-C9) * t12;
+    t1 = (-C9) * t9;
+    re[148] = t4;
+    im[148] = t3;
+    re[28] = t11;
+    im[28] = t8;
+    re[68] = t14;
+    im[68] = t10;
+    re[108] = t5;
+    im[108] = t1;
+    t13 = re[153];
+    t2 = im[153];
+    t0 = re[33];
+    t6 = im[33];
+    t7 = re[73];
+    t12 = im[73];
+    t9 = re[113];
+    t4 = im[113];
+    t3 = t13 + t7;
+    t11 = t2 + t12;
+    t8 = t0 + t9;
+    t14 = t6 + t4;
+    t10 = t13 - t7;
+    t5 = t2 - t12;
+    t1 = t0 - t9;
+    t13 = t6 - t4;
+    t7 = t3 + t8;
+    t2 = t11 + t14;
+    t12 = t10 + t13;
+    t0 = t5 - t1;
+    t9 = t3 - t8;
+    t6 = t11 - t14;
+    t4 = t10 - t13;
+    t3 = t5 + t1;
+    t8 = t12 + t0;
+    t11 = C12 * t8;
+    t14 = t12 * (-C7);
+    t10 = t0 * (-C8);
+    t13 = t11 - t10;
+    t5 = t11 + t14;
+    t1 = t9 + t6;
+    t8 = (-C10) * t1;
+    t12 = t9 * (-C5);
+    t0 = t6 * (-C4);
+    t10 = t8 - t0;
+    t11 = t8 + t12;
+    t14 = t4 + t3;
+    t1 = (-C0) * t14;
+    t9 = t4 * C2;
+    t6 = t3 * (-C1);
+    t0 = t1 - t6;
+    t8 = t1 + t9;
+    re[153] = t7;
+    im[153] = t2;
+    re[33] = t13;
+    im[33] = t5;
+    re[73] = t10;
+    im[73] = t11;
+    re[113] = t0;
+    im[113] = t8;
+    t12 = re[158];
+    t14 = im[158];
+    t4 = re[38];
+    t3 = im[38];
+    t6 = re[78];
+    t1 = im[78];
+    t9 = re[118];
+    t7 = im[118];
+    t2 = t12 + t6;
+    t13 = t14 + t1;
+    t5 = t4 + t9;
+    t10 = t3 + t7;
+    t11 = t12 - t6;
+    t0 = t14 - t1;
+    t8 = t4 - t9;
+    t12 = t3 - t7;
+    t6 = t2 + t5;
+    t14 = t13 + t10;
+    t1 = t11 + t12;
+    t4 = t0 - t8;
+    t9 = t2 - t5;
+    t3 = t13 - t10;
+    t7 = t11 - t12;
+    t2 = t0 + t8;
+    t5 = t1 + t4;
+    t13 = C10 * t5;
+    t10 = t1 * (-C4);
+    t11 = t4 * (-C5);
+    t12 = t13 - t11;
+    t0 = t13 + t10;
+    t8 = t9 - t3;
+    t5 = t9 + t3;
+    t1 = (-C9) * t8;
+    t4 = (-C9) * t5;
+    t11 = t7 + t2;
+    t13 = (-C3) * t11;
+    t10 = t7 * C4;
+    t9 = t2 * (-C5);
+    t3 = t13 - t9;
+    t8 = t13 + t10;
+    re[158] = t6;
+    im[158] = t14;
+    re[38] = t12;
+    im[38] = t0;
+    re[78] = t1;
+    im[78] = t4;
+    re[118] = t3;
+    im[118] = t8;
+    t5 = re[3];
+    t11 = im[3];
+    t7 = re[43];
+    t2 = im[43];
+    t9 = re[83];
+    t13 = im[83];
+    t10 = re[123];
+    t6 = im[123];
+    t14 = t5 + t9;
+    t12 = t11 + t13;
+    t0 = t7 + t10;
+    t1 = t2 + t6;
+    t4 = t5 - t9;
+    t3 = t11 - t13;
+    t8 = t7 - t10;
+    t5 = t2 - t6;
+    t9 = t14 + t0;
+    t11 = t12 + t1;
+    t13 = t4 + t5;
+    t7 = t3 - t8;
+    t10 = t14 - t0;
+    t2 = t12 - t1;
+    t6 = t4 - t5;
+    t14 = t3 + t8;
+    t0 = t13 + t7;
+    t12 = C11 * t0;
+    t1 = t13 * (-C1);
+    t4 = t7 * (-C2);
+    t5 = t12 - t4;
+    t3 = t12 + t1;
+    t8 = t10 + t2;
+    t0 = (-C3) * t8;
+    t13 = t10 * C5;
+    t7 = t2 * (-C4);
+    t4 = t0 - t7;
+    t12 = t0 + t13;
+    t1 = t6 + t14;
+    t8 = (-C12) * t1;
+    t10 = t6 * C7;
+    t2 = t14 * C8;
+    t7 = t8 - t2;
+    t0 = t8 + t10;
+    re[3] = t9;
+    im[3] = t11;
+    re[43] = t5;
+    im[43] = t3;
+    re[83] = t4;
+    im[83] = t12;
+    re[123] = t7;
+    im[123] = t0;
+    t13 = re[128];
+    t1 = im[128];
+    t6 = re[138];
+    t14 = im[138];
+    t2 = re[148];
+    t8 = im[148];
+    t10 = re[158];
+    t9 = im[158];
+    t11 = t13 + t2;
+    t5 = t1 + t8;
+    t3 = t6 + t10;
+    t4 = t14 + t9;
+    t12 = t13 - t2;
+    t7 = t1 - t8;
+    t0 = t6 - t10;
+    t13 = t14 - t9;
+    t2 = t11 + t3;
+    t1 = t5 + t4;
+    t8 = t12 + t13;
+    t6 = t7 - t0;
+    t10 = t11 - t3;
+    t14 = t5 - t4;
+    t9 = t12 - t13;
+    t11 = t7 + t0;
+    re[128] = t2;
+    im[128] = t1;
+    re[138] = t8;
+    im[138] = t6;
+    re[148] = t10;
+    im[148] = t14;
+    re[158] = t9;
+    im[158] = t11;
+    t3 = re[133];
+    t5 = im[133];
+    t4 = re[143];
+    t12 = im[143];
+    t13 = re[153];
+    t7 = im[153];
+    t0 = re[3];
+    t2 = im[3];
+    t1 = t3 + t13;
+    t8 = t5 + t7;
+    t6 = t4 + t0;
+    t10 = t12 + t2;
+    t14 = t3 - t13;
+    t9 = t5 - t7;
+    t11 = t4 - t0;
+    t3 = t12 - t2;
+    t13 = t1 + t6;
+    t5 = t8 + t10;
+    t7 = t14 + t3;
+    t4 = t9 - t11;
+    t0 = t1 - t6;
+    t12 = t8 - t10;
+    t2 = t14 - t3;
+    t1 = t9 + t11;
+    t6 = t7 + t4;
+    t8 = t7 - t4;
+    t10 = C9 * t6;
+    t14 = (-C9) * t8;
+    t3 = -t0;
+    t9 = t2 - t1;
+    t11 = t2 + t1;
+    t7 = (-C9) * t9;
+    t4 = (-C9) * t11;
+    re[133] = t13;
+    im[133] = t5;
+    re[143] = t10;
+    im[143] = t14;
+    re[153] = t12;
+    im[153] = t3;
+    re[3] = t7;
+    im[3] = t4;
+    t6 = re[128];
+    t8 = im[128];
+    t0 = re[133];
+    t2 = im[133];
+    t1 = t6 - t0;
+    t9 = t8 - t2;
+    t11 = t6 + t0;
+    t13 = t8 + t2;
+    re[128] = t11;
+    im[128] = t13;
+    re[133] = t1;
+    im[133] = t9;
+    t5 = re[138];
+    t10 = im[138];
+    t14 = re[143];
+    t12 = im[143];
+    t3 = t5 - t14;
+    t7 = t10 - t12;
+    t4 = t5 + t14;
+    t6 = t10 + t12;
+    re[138] = t4;
+    im[138] = t6;
+    re[143] = t3;
+    im[143] = t7;
+    t0 = re[148];
+    t8 = im[148];
+    t2 = re[153];
+    t11 = im[153];
+    t13 = t0 - t2;
+    t1 = t8 - t11;
+    t9 = t0 + t2;
+    t5 = t8 + t11;
+    re[148] = t9;
+    im[148] = t5;
+    re[153] = t13;
+    im[153] = t1;
+    t14 = re[158];
+    t10 = im[158];
+    t12 = re[3];
+    t4 = im[3];
+    t6 = t14 - t12;
+    t3 = t10 - t4;
+    t7 = t14 + t12;
+    t0 = t10 + t4;
+    re[158] = t7;
+    im[158] = t0;
+    re[3] = t6;
+    im[3] = t3;
+    t2 = re[8];
+    t8 = im[8];
+    t11 = re[18];
+    t9 = im[18];
+    t5 = re[28];
+    t13 = im[28];
+    t1 = re[38];
+    t14 = im[38];
+    t12 = t2 + t5;
+    t10 = t8 + t13;
+    t4 = t11 + t1;
+    t7 = t9 + t14;
+    t0 = t2 - t5;
+    t6 = t8 - t13;
+    t3 = t11 - t1;
+    t2 = t9 - t14;
+    t5 = t12 + t4;
+    t8 = t10 + t7;
+    t13 = t0 + t2;
+    t11 = t6 - t3;
+    t1 = t12 - t4;
+    t9 = t10 - t7;
+    t14 = t0 - t2;
+    t12 = t6 + t3;
+    re[8] = t5;
+    im[8] = t8;
+    re[18] = t13;
+    im[18] = t11;
+    re[28] = t1;
+    im[28] = t9;
+    re[38] = t14;
+    im[38] = t12;
+    t4 = re[13];
+    t10 = im[13];
+    t7 = re[23];
+    t0 = im[23];
+    t2 = re[33];
+    t6 = im[33];
+    t3 = re[43];
+    t5 = im[43];
+    t8 = t4 + t2;
+    t13 = t10 + t6;
+    t11 = t7 + t3;
+    t1 = t0 + t5;
+    t9 = t4 - t2;
+    t14 = t10 - t6;
+    t12 = t7 - t3;
+    t4 = t0 - t5;
+    t2 = t8 + t11;
+    t10 = t13 + t1;
+    t6 = t9 + t4;
+    t7 = t14 - t12;
+    t3 = t8 - t11;
+    t0 = t13 - t1;
+    t5 = t9 - t4;
+    t8 = t14 + t12;
+    t11 = t6 + t7;
+    t13 = t6 - t7;
+    t1 = C9 * t11;
+    t9 = (-C9) * t13;
+    t4 = -t3;
+    t14 = t5 - t8;
+    t12 = t5 + t8;
+    t6 = (-C9) * t14;
+    t7 = (-C9) * t12;
+    re[13] = t2;
+    im[13] = t10;
+    re[23] = t1;
+    im[23] = t9;
+    re[33] = t0;
+    im[33] = t4;
+    re[43] = t6;
+    im[43] = t7;
+    t11 = re[8];
+    t13 = im[8];
+    t3 = re[13];
+    t5 = im[13];
+    t8 = t11 - t3;
+    t14 = t13 - t5;
+    t12 = t11 + t3;
+    t2 = t13 + t5;
+    re[8] = t12;
+    im[8] = t2;
+    re[13] = t8;
+    im[13] = t14;
+    t10 = re[18];
+    t1 = im[18];
+    t9 = re[23];
+    t0 = im[23];
+    t4 = t10 - t9;
+    t6 = t1 - t0;
+    t7 = t10 + t9;
+    t11 = t1 + t0;
+    re[18] = t7;
+    im[18] = t11;
+    re[23] = t4;
+    im[23] = t6;
+    t3 = re[28];
+    t13 = im[28];
+    t5 = re[33];
+    t12 = im[33];
+    t2 = t3 - t5;
+    t8 = t13 - t12;
+    t14 = t3 + t5;
+    t10 = t13 + t12;
+    re[28] = t14;
+    im[28] = t10;
+    re[33] = t2;
+    im[33] = t8;
+    t9 = re[38];
+    t1 = im[38];
+    t0 = re[43];
+    t7 = im[43];
+    t11 = t9 - t0;
+    t4 = t1 - t7;
+    t6 = t9 + t0;
+    t3 = t1 + t7;
+    re[38] = t6;
+    im[38] = t3;
+    re[43] = t11;
+    im[43] = t4;
+    t5 = re[48];
+    t13 = im[48];
+    t12 = re[58];
+    t14 = im[58];
+    t10 = re[68];
+    t2 = im[68];
+    t8 = re[78];
+    t9 = im[78];
+    t0 = t5 + t10;
+    t1 = t13 + t2;
+    t7 = t12 + t8;
+    t6 = t14 + t9;
+    t3 = t5 - t10;
+    t11 = t13 - t2;
+    t4 = t12 - t8;
+    t5 = t14 - t9;
+    t10 = t0 + t7;
+    t13 = t1 + t6;
+    t2 = t3 + t5;
+    t12 = t11 - t4;
+    t8 = t0 - t7;
+    t14 = t1 - t6;
+    t9 = t3 - t5;
+    t0 = t11 + t4;
+    re[48] = t10;
+    im[48] = t13;
+    re[58] = t2;
+    im[58] = t12;
+    re[68] = t8;
+    im[68] = t14;
+    re[78] = t9;
+    im[78] = t0;
+    t7 = re[53];
+    t1 = im[53];
+    t6 = re[63];
+    t3 = im[63];
+    t5 = re[73];
+    t11 = im[73];
+    t4 = re[83];
+    t10 = im[83];
+    t13 = t7 + t5;
+    t2 = t1 + t11;
+    t12 = t6 + t4;
+    t8 = t3 + t10;
+    t14 = t7 - t5;
+    t9 = t1 - t11;
+    t0 = t6 - t4;
+    t7 = t3 - t10;
+    t5 = t13 + t12;
+    t1 = t2 + t8;
+    t11 = t14 + t7;
+    t6 = t9 - t0;
+    t4 = t13 - t12;
+    t3 = t2 - t8;
+    t10 = t14 - t7;
+    t13 = t9 + t0;
+    t12 = t11 + t6;
+    t2 = t11 - t6;
+    t8 = C9 * t12;
+    t14 = (-C9) * t2;
+    t7 = -t4;
+    t9 = t10 - t13;
+    t0 = t10 + t13;
+    t11 = (-C9) * t9;
+    t6 = (-C9) * t0;
+    re[53] = t5;
+    im[53] = t1;
+    re[63] = t8;
+    im[63] = t14;
+    re[73] = t3;
+    im[73] = t7;
+    re[83] = t11;
+    im[83] = t6;
+    t12 = re[48];
+    t2 = im[48];
+    t4 = re[53];
+    t10 = im[53];
+    t13 = t12 - t4;
+    t9 = t2 - t10;
+    t0 = t12 + t4;
+    t5 = t2 + t10;
+    re[48] = t0;
+    im[48] = t5;
+    re[53] = t13;
+    im[53] = t9;
+    t1 = re[58];
+    t8 = im[58];
+    t14 = re[63];
+    t3 = im[63];
+    t7 = t1 - t14;
+    t11 = t8 - t3;
+    t6 = t1 + t14;
+    t12 = t8 + t3;
+    re[58] = t6;
+    im[58] = t12;
+    re[63] = t7;
+    im[63] = t11;
+    t4 = re[68];
+    t2 = im[68];
+    t10 = re[73];
+    t0 = im[73];
+    t5 = t4 - t10;
+    t13 = t2 - t0;
+    t9 = t4 + t10;
+    t1 = t2 + t0;
+    re[68] = t9;
+    im[68] = t1;
+    re[73] = t5;
+    im[73] = t13;
+    t14 = re[78];
+    t8 = im[78];
+    t3 = re[83];
+    t6 = im[83];
+    t12 = t14 - t3;
+    t7 = t8 - t6;
+    t11 = t14 + t3;
+    t4 = t8 + t6;
+    re[78] = t11;
+    im[78] = t4;
+    re[83] = t12;
+    im[83] = t7;
+    t10 = re[88];
+    t2 = im[88];
+    t0 = re[98];
+    t9 = im[98];
+    t1 = re[108];
+    t5 = im[108];
+    t13 = re[118];
+    t14 = im[118];
+    t3 = t10 + t1;
+    t8 = t2 + t5;
+    t6 = t0 + t13;
+    t11 = t9 + t14;
+    t4 = t10 - t1;
+    t12 = t2 - t5;
+    t7 = t0 - t13;
+    t10 = t9 - t14;
+    t1 = t3 + t6;
+    t2 = t8 + t11;
+    t5 = t4 + t10;
+    t0 = t12 - t7;
+    t13 = t3 - t6;
+    t9 = t8 - t11;
+    t14 = t4 - t10;
+    t3 = t12 + t7;
+    re[88] = t1;
+    im[88] = t2;
+    re[98] = t5;
+    im[98] = t0;
+    re[108] = t13;
+    im[108] = t9;
+    re[118] = t14;
+    im[118] = t3;
+    t6 = re[93];
+    t8 = im[93];
+    t11 = re[103];
+    t4 = im[103];
+    t10 = re[113];
+    t12 = im[113];
+    t7 = re[123];
+    t1 = im[123];
+    t2 = t6 + t10;
+    t5 = t8 + t12;
+    t0 = t11 + t7;
+    t13 = t4 + t1;
+    t9 = t6 - t10;
+    t14 = t8 - t12;
+    t3 = t11 - t7;
+    t6 = t4 - t1;
+    t10 = t2 + t0;
+    t8 = t5 + t13;
+    t12 = t9 + t6;
+    t11 = t14 - t3;
+    t7 = t2 - t0;
+    t4 = t5 - t13;
+    t1 = t9 - t6;
+    t2 = t14 + t3;
+    t0 = t12 + t11;
+    t5 = t12 - t11;
+    t13 = C9 * t0;
+    t9 = (-C9) * t5;
+    t6 = -t7;
+    t14 = t1 - t2;
+    t3 = t1 + t2;
+    t12 = (-C9) * t14;
+    t11 = (-C9) * t3;
+    re[93] = t10;
+    im[93] = t8;
+    re[103] = t13;
+    im[103] = t9;
+    re[113] = t4;
+    im[113] = t6;
+    re[123] = t12;
+    im[123] = t11;
+    t0 = re[88];
+    t5 = im[88];
+    t7 = re[93];
+    t1 = im[93];
+    t2 = t0 - t7;
+    t14 = t5 - t1;
+    t3 = t0 + t7;
+    t10 = t5 + t1;
+    re[88] = t3;
+    im[88] = t10;
+    re[93] = t2;
+    im[93] = t14;
+    t8 = re[98];
+    t13 = im[98];
+    t9 = re[103];
+    t4 = im[103];
+    t6 = t8 - t9;
+    t12 = t13 - t4;
+    t11 = t8 + t9;
+    t0 = t13 + t4;
+    re[98] = t11;
+    im[98] = t0;
+    re[103] = t6;
+    im[103] = t12;
+    t7 = re[108];
+    t5 = im[108];
+    t1 = re[113];
+    t3 = im[113];
+    t10 = t7 - t1;
+    t2 = t5 - t3;
+    t14 = t7 + t1;
+    t8 = t5 + t3;
+    re[108] = t14;
+    im[108] = t8;
+    re[113] = t10;
+    im[113] = t2;
+    t9 = re[118];
+    t13 = im[118];
+    t4 = re[123];
+    t11 = im[123];
+    t0 = t9 - t4;
+    t6 = t13 - t11;
+    t12 = t9 + t4;
+    t7 = t13 + t11;
+    re[118] = t12;
+    im[118] = t7;
+    re[123] = t0;
+    im[123] = t6;
+    t1 = re[72];
+    t5 = im[72];
+    t3 = re[123];
+    t14 = im[123];
+    t8 = t1 + t3;
+    t10 = t5 - t14;
+    t2 = t5 + t14;
+    t9 = t1 - t3;
+    t4 = C13 * t8;
+    t13 = C13 * t10;
+    t11 = C13 * t2;
+    t12 = C13 * t9;
+    re[72] = t4;
+    im[72] = t13;
+    re[123] = t11;
+    im[123] = t12;
+    t7 = re[144];
+    t0 = im[144];
+    t6 = re[51];
+    t5 = im[51];
+    t14 = t7 + t6;
+    t1 = t0 - t5;
+    t3 = t0 + t5;
+    t8 = t7 - t6;
+    t10 = C13 * t14;
+    t2 = C13 * t1;
+    t9 = C13 * t3;
+    t4 = C13 * t8;
+    re[144] = t10;
+    im[144] = t2;
+    re[51] = t9;
+    im[51] = t4;
+    t13 = re[56];
+    t11 = im[56];
+    t12 = re[139];
+    t0 = im[139];
+    t5 = t13 + t12;
+    t7 = t11 - t0;
+    t6 = t11 + t0;
+    t14 = t13 - t12;
+    t1 = C13 * t5;
+    t3 = C13 * t7;
+    t8 = C13 * t6;
+    t10 = C13 * t14;
+    re[56] = t1;
+    im[56] = t3;
+    re[139] = t8;
+    im[139] = t10;
+    t2 = re[138];
+    t9 = im[138];
+    t4 = re[67];
+    t11 = im[67];
+    t0 = t2 + t4;
+    t13 = t9 - t11;
+    t12 = t9 + t11;
+    t5 = t2 - t4;
+    t7 = C13 * t0;
+    t6 = C13 * t13;
+    t14 = C13 * t12;
+    t1 = C13 * t5;
+    re[138] = t7;
+    im[138] = t6;
+    re[67] = t14;
+    im[67] = t1;
+    t3 = re[50];
+    t8 = im[50];
+    t10 = re[145];
+    t9 = im[145];
+    t11 = t3 + t10;
+    t2 = t8 - t9;
+    t4 = t8 + t9;
+    t0 = t3 - t10;
+    t13 = C13 * t11;
+    t12 = C13 * t2;
+    t5 = C13 * t4;
+    t7 = C13 * t0;
+    re[50] = t13;
+    im[50] = t12;
+    re[145] = t5;
+    im[145] = t7;
+    t6 = re[122];
+    t14 = im[122];
+    t1 = re[73];
+    t8 = im[73];
+    t9 = t6 + t1;
+    t3 = t14 - t8;
+    t10 = t14 + t8;
+    t11 = t6 - t1;
+    t2 = C13 * t9;
+    t4 = C13 * t3;
+    t0 = C13 * t10;
+    t13 = C13 * t11;
+    re[122] = t2;
+    im[122] = t4;
+    re[73] = t0;
+    im[73] = t13;
+    t12 = re[34];
+    t5 = im[34];
+    t7 = re[1];
+    t14 = im[1];
+    t8 = t12 + t7;
+    t6 = t5 - t14;
+    t1 = t5 + t14;
+    t9 = t12 - t7;
+    t3 = C13 * t8;
+    t10 = C13 * t6;
+    t11 = C13 * t1;
+    t2 = C13 * t9;
+    re[34] = t3;
+    im[34] = t10;
+    re[1] = t11;
+    im[1] = t2;
+    t4 = re[116];
+    t0 = im[116];
+    t13 = re[89];
+    t5 = im[89];
+    t14 = t4 + t13;
+    t12 = t0 - t5;
+    t7 = t0 + t5;
+    t8 = t4 - t13;
+    t6 = C13 * t14;
+    t1 = C13 * t12;
+    t9 = C13 * t7;
+    t3 = C13 * t8;
+    re[116] = t6;
+    im[116] = t1;
+    re[89] = t9;
+    im[89] = t3;
+    t10 = re[28];
+    t11 = im[28];
+    t2 = re[7];
+    t0 = im[7];
+    t5 = t10 + t2;
+    t4 = t11 - t0;
+    t13 = t11 + t0;
+    t14 = t10 - t2;
+    t12 = C13 * t5;
+    t7 = C13 * t4;
+    t8 = C13 * t13;
+    t6 = C13 * t14;
+    re[28] = t12;
+    im[28] = t7;
+    re[7] = t8;
+    im[7] = t6;
+    t1 = re[100];
+    t9 = im[100];
+    t3 = re[95];
+    t11 = im[95];
+    t0 = t1 + t3;
+    t10 = t9 - t11;
+    t2 = t9 + t11;
+    t5 = t1 - t3;
+    t4 = C13 * t0;
+    t13 = C13 * t10;
+    t14 = C13 * t2;
+    t12 = C13 * t5;
+    re[100] = t4;
+    im[100] = t13;
+    re[95] = t14;
+    im[95] = t12;
+    t7 = re[12];
+    t8 = im[12];
+    t6 = re[23];
+    t9 = im[23];
+    t11 = t7 + t6;
+    t1 = t8 - t9;
+    t3 = t8 + t9;
+    t0 = t7 - t6;
+    t10 = C13 * t11;
+    t2 = C13 * t1;
+    t5 = C13 * t3;
+    t4 = C13 * t0;
+    re[12] = t10;
+    im[12] = t2;
+    re[23] = t5;
+    im[23] = t4;
+    t13 = re[94];
+    t14 = im[94];
+    t12 = re[111];
+    t8 = im[111];
+    t9 = t13 + t12;
+    t7 = t14 - t8;
+    t6 = t14 + t8;
+    t11 = t13 - t12;
+    t1 = C13 * t9;
+    t3 = C13 * t7;
+    t0 = C13 * t6;
+    t10 = C13 * t11;
+    re[94] = t1;
+    im[94] = t3;
+    re[111] = t0;
+    im[111] = t10;
+    t2 = re[6];
+    t5 = im[6];
+    t4 = re[29];
+    t14 = im[29];
+    t8 = t2 + t4;
+    t13 = t5 - t14;
+    t12 = t5 + t14;
+    t9 = t2 - t4;
+    t7 = C13 * t8;
+    t6 = C13 * t13;
+    t11 = C13 * t12;
+    t1 = C13 * t9;
+    re[6] = t7;
+    im[6] = t6;
+    re[29] = t11;
+    im[29] = t1;
+    t3 = re[78];
+    t0 = im[78];
+    t10 = re[117];
+    t5 = im[117];
+    t14 = t3 + t10;
+    t2 = t0 - t5;
+    t4 = t0 + t5;
+    t8 = t3 - t10;
+    t13 = C13 * t14;
+    t12 = C13 * t2;
+    t9 = C13 * t4;
+    t7 = C13 * t8;
+    re[78] = t13;
+    im[78] = t12;
+    re[117] = t9;
+    im[117] = t7;
+    t6 = re[150];
+    t11 = im[150];
+    t1 = re[45];
+    t0 = im[45];
+    t5 = t6 + t1;
+    t3 = t11 - t0;
+    t10 = t11 + t0;
+    t14 = t6 - t1;
+    t2 = C13 * t5;
+    t4 = C13 * t3;
+    t8 = C13 * t10;
+    t13 = C13 * t14;
+    re[150] = t2;
+    im[150] = t4;
+    re[45] = t8;
+    im[45] = t13;
+    t12 = re[37];
+    t9 = im[37];
+    t7 = re[133];
+    t11 = im[133];
+    t0 = t12 + t7;
+    t6 = t9 - t11;
+    t1 = t9 + t11;
+    t5 = t12 - t7;
+    t3 = C13 * t0;
+    t10 = C13 * t6;
+    t14 = C13 * t1;
+    t2 = C13 * t5;
+    re[37] = t3;
+    im[37] = t10;
+    re[133] = t14;
+    im[133] = t2;
+    t4 = re[109];
+    t8 = im[109];
+    t13 = re[86];
+    t9 = im[86];
+    t11 = t4 + t13;
+    t12 = t8 - t9;
+    t7 = t8 + t9;
+    t0 = t4 - t13;
+    t6 = C13 * t11;
+    t1 = C13 * t12;
+    t5 = C13 * t7;
+    t3 = C13 * t0;
+    re[109] = t6;
+    im[109] = t1;
+    re[86] = t5;
+    im[86] = t3;
+    t10 = re[21];
+    t14 = im[21];
+    t2 = re[14];
+    t8 = im[14];
+    t9 = t10 + t2;
+    t4 = t14 - t8;
+    t13 = t14 + t8;
+    t11 = t10 - t2;
+    t12 = C13 * t9;
+    t7 = C13 * t4;
+    t0 = C13 * t13;
+    t6 = C13 * t11;
+    re[21] = t12;
+    im[21] = t7;
+    re[14] = t0;
+    im[14] = t6;
+    t1 = re[93];
+    t5 = im[93];
+    t3 = re[102];
+    t14 = im[102];
+    t8 = t1 + t3;
+    t10 = t5 - t14;
+    t2 = t5 + t14;
+    t9 = t1 - t3;
+    t4 = C13 * t8;
+    t13 = C13 * t10;
+    t11 = C13 * t2;
+    t12 = C13 * t9;
+    re[93] = t4;
+    im[93] = t13;
+    re[102] = t11;
+    im[102] = t12;
+    t7 = re[15];
+    t0 = im[15];
+    t6 = re[30];
+    t5 = im[30];
+    t14 = t7 + t6;
+    t1 = t0 - t5;
+    t3 = t0 + t5;
+    t8 = t7 - t6;
+    t10 = C13 * t14;
+    t2 = C13 * t1;
+    t9 = C13 * t3;
+    t4 = C13 * t8;
+    re[15] = t10;
+    im[15] = t2;
+    re[30] = t9;
+    im[30] = t4;
+    t13 = re[87];
+    t11 = im[87];
+    t12 = re[108];
+    t0 = im[108];
+    t5 = t13 + t12;
+    t7 = t11 - t0;
+    t6 = t11 + t0;
+    t14 = t13 - t12;
+    t1 = C13 * t5;
+    t3 = C13 * t7;
+    t8 = C13 * t6;
+    t10 = C13 * t14;
+    re[87] = t1;
+    im[87] = t3;
+    re[108] = t8;
+    im[108] = t10;
+    t2 = re[159];
+    t9 = im[159];
+    t4 = re[36];
+    t11 = im[36];
+    t0 = t2 + t4;
+    t13 = t9 - t11;
+    t12 = t9 + t11;
+    t5 = t2 - t4;
+    t7 = C13 * t0;
+    t6 = C13 * t13;
+    t14 = C13 * t12;
+    t1 = C13 * t5;
+    re[159] = t7;
+    im[159] = t6;
+    re[36] = t14;
+    im[36] = t1;
+    t3 = re[71];
+    t8 = im[71];
+    t10 = re[124];
+    t9 = im[124];
+    t11 = t3 + t10;
+    t2 = t8 - t9;
+    t4 = t8 + t9;
+    t0 = t3 - t10;
+    t13 = C13 * t11;
+    t12 = C13 * t2;
+    t5 = C13 * t4;
+    t7 = C13 * t0;
+    re[71] = t13;
+    im[71] = t12;
+    re[124] = t5;
+    im[124] = t7;
+    t6 = re[153];
+    t14 = im[153];
+    t1 = re[52];
+    t8 = im[52];
+    t9 = t6 + t1;
+    t3 = t14 - t8;
+    t10 = t14 + t8;
+    t11 = t6 - t1;
+    t2 = C13 * t9;
+    t4 = C13 * t3;
+    t0 = C13 * t10;
+    t13 = C13 * t11;
+    re[153] = t2;
+    im[153] = t4;
+    re[52] = t0;
+    im[52] = t13;
+    t12 = re[65];
+    t5 = im[65];
+    t7 = re[130];
+    t14 = im[130];
+    t8 = t12 + t7;
+    t6 = t5 - t14;
+    t1 = t5 + t14;
+    t9 = t12 - t7;
+    t3 = C13 * t8;
+    t10 = C13 * t6;
+    t11 = C13 * t1;
+    t2 = C13 * t9;
+    re[65] = t3;
+    im[65] = t10;
+    re[130] = t11;
+    im[130] = t2;
+    t4 = re[137];
+    t0 = im[137];
+    t13 = re[58];
+    t5 = im[58];
+    t14 = t4 + t13;
+    t12 = t0 - t5;
+    t7 = t0 + t5;
+    t8 = t4 - t13;
+    t6 = C13 * t14;
+    t1 = C13 * t12;
+    t9 = C13 * t7;
+    t3 = C13 * t8;
+    re[137] = t6;
+    im[137] = t1;
+    re[58] = t9;
+    im[58] = t3;
+    t10 = re[49];
+    t11 = im[49];
+    t2 = re[146];
+    t0 = im[146];
+    t5 = t10 + t2;
+    t4 = t11 - t0;
+    t13 = t11 + t0;
+    t14 = t10 - t2;
+    t12 = C13 * t5;
+    t7 = C13 * t4;
+    t8 = C13 * t13;
+    t6 = C13 * t14;
+    re[49] = t12;
+    im[49] = t7;
+    re[146] = t8;
+    im[146] = t6;
+    t1 = re[131];
+    t9 = im[131];
+    t3 = re[74];
+    t11 = im[74];
+    t0 = t1 + t3;
+    t10 = t9 - t11;
+    t2 = t9 + t11;
+    t5 = t1 - t3;
+    t4 = C13 * t0;
+    t13 = C13 * t10;
+    t14 = C13 * t2;
+    t12 = C13 * t5;
+    re[131] = t4;
+    im[131] = t13;
+    re[74] = t14;
+    im[74] = t12;
+    t7 = re[43];
+    t8 = im[43];
+    t6 = re[152];
+    t9 = im[152];
+    t11 = t7 + t6;
+    t1 = t8 - t9;
+    t3 = t8 + t9;
+    t0 = t7 - t6;
+    t10 = C13 * t11;
+    t2 = C13 * t1;
+    t5 = C13 * t3;
+    t4 = C13 * t0;
+    re[43] = t10;
+    im[43] = t2;
+    re[152] = t5;
+    im[152] = t4;
+    t13 = re[115];
+    t14 = im[115];
+    t12 = re[80];
+    t8 = im[80];
+    t9 = t13 + t12;
+    t7 = t14 - t8;
+    t6 = t14 + t8;
+    t11 = t13 - t12;
+    t1 = C13 * t9;
+    t3 = C13 * t7;
+    t0 = C13 * t6;
+    t10 = C13 * t11;
+    re[115] = t1;
+    im[115] = t3;
+    re[80] = t0;
+    im[80] = t10;
+    t2 = re[27];
+    t5 = im[27];
+    t4 = re[8];
+    t14 = im[8];
+    t8 = t2 + t4;
+    t13 = t5 - t14;
+    t12 = t5 + t14;
+    t9 = t2 - t4;
+    t7 = C13 * t8;
+    t6 = C13 * t13;
+    t11 = C13 * t12;
+    t1 = C13 * t9;
+    re[27] = t7;
+    im[27] = t6;
+    re[8] = t11;
+    im[8] = t1;
+    t3 = re[64];
+    t0 = im[64];
+    t10 = re[96];
+    t5 = im[96];
+    t14 = t3 + t10;
+    t2 = t0 - t5;
+    t4 = t0 + t5;
+    t8 = t3 - t10;
+    t13 = C13 * t14;
+    t12 = C13 * t2;
+    t9 = C13 * t4;
+    t7 = C13 * t8;
+    re[64] = t13;
+    im[64] = t12;
+    re[96] = t9;
+    im[96] = t7;
+    t6 = re[136];
+    t11 = im[136];
+    t1 = re[59];
+    t0 = im[59];
+    t5 = t6 + t1;
+    t3 = t11 - t0;
+    t10 = t11 + t0;
+    t14 = t6 - t1;
+    t2 = C13 * t5;
+    t4 = C13 * t3;
+    t8 = C13 * t10;
+    t13 = C13 * t14;
+    re[136] = t2;
+    im[136] = t4;
+    re[59] = t8;
+    im[59] = t13;
+    t12 = re[48];
+    t9 = im[48];
+    t7 = re[147];
+    t11 = im[147];
+    t0 = t12 + t7;
+    t6 = t9 - t11;
+    t1 = t9 + t11;
+    t5 = t12 - t7;
+    t3 = C13 * t0;
+    t10 = C13 * t6;
+    t14 = C13 * t1;
+    t2 = C13 * t5;
+    re[48] = t3;
+    im[48] = t10;
+    re[147] = t14;
+    im[147] = t2;
+    t4 = re[120];
+    t8 = im[120];
+    t13 = re[75];
+    t9 = im[75];
+    t11 = t4 + t13;
+    t12 = t8 - t9;
+    t7 = t8 + t9;
+    t0 = t4 - t13;
+    t6 = C13 * t11;
+    t1 = C13 * t12;
+    t5 = C13 * t7;
+    t3 = C13 * t0;
+    re[120] = t6;
+    im[120] = t1;
+    re[75] = t5;
+    im[75] = t3;
+    t10 = re[42];
+    t14 = im[42];
+    t2 = re[3];
+    t8 = im[3];
+    t9 = t10 + t2;
+    t4 = t14 - t8;
+    t13 = t14 + t8;
+    t11 = t10 - t2;
+    t12 = C13 * t9;
+    t7 = C13 * t4;
+    t0 = C13 * t13;
+    t6 = C13 * t11;
+    re[42] = t12;
+    im[42] = t7;
+    re[3] = t0;
+    im[3] = t6;
+    t1 = re[114];
+    t5 = im[114];
+    t3 = re[81];
+    t14 = im[81];
+    t8 = t1 + t3;
+    t10 = t5 - t14;
+    t2 = t5 + t14;
+    t9 = t1 - t3;
+    t4 = C13 * t8;
+    t13 = C13 * t10;
+    t11 = C13 * t2;
+    t12 = C13 * t9;
+    re[114] = t4;
+    im[114] = t13;
+    re[81] = t11;
+    im[81] = t12;
+    t7 = re[26];
+    t0 = im[26];
+    t6 = re[9];
+    t5 = im[9];
+    t14 = t7 + t6;
+    t1 = t0 - t5;
+    t3 = t0 + t5;
+    t8 = t7 - t6;
+    t10 = C13 * t14;
+    t2 = C13 * t1;
+    t9 = C13 * t3;
+    t4 = C13 * t8;
+    re[26] = t10;
+    im[26] = t2;
+    re[9] = t9;
+    im[9] = t4;
+    t13 = re[98];
+    t11 = im[98];
+    t12 = re[97];
+    t0 = im[97];
+    t5 = t13 + t12;
+    t7 = t11 - t0;
+    t6 = t11 + t0;
+    t14 = t13 - t12;
+    t1 = C13 * t5;
+    t3 = C13 * t7;
+    t8 = C13 * t6;
+    t10 = C13 * t14;
+    re[98] = t1;
+    im[98] = t3;
+    re[97] = t8;
+    im[97] = t10;
+    t2 = re[20];
+    t9 = im[20];
+    t4 = re[25];
+    t11 = im[25];
+    t0 = t2 + t4;
+    t13 = t9 - t11;
+    t12 = t9 + t11;
+    t5 = t2 - t4;
+    t7 = C13 * t0;
+    t6 = C13 * t13;
+    t14 = C13 * t12;
+    t1 = C13 * t5;
+    re[20] = t7;
+    im[20] = t6;
+    re[25] = t14;
+    im[25] = t1;
+    t3 = re[92];
+    t8 = im[92];
+    t10 = re[103];
+    t9 = im[103];
+    t11 = t3 + t10;
+    t2 = t8 - t9;
+    t4 = t8 + t9;
+    t0 = t3 - t10;
+    t13 = C13 * t11;
+    t12 = C13 * t2;
+    t5 = C13 * t4;
+    t7 = C13 * t0;
+    re[92] = t13;
+    im[92] = t12;
+    re[103] = t5;
+    im[103] = t7;
+    t6 = re[4];
+    t14 = im[4];
+    t1 = re[31];
+    t8 = im[31];
+    t9 = t6 + t1;
+    t3 = t14 - t8;
+    t10 = t14 + t8;
+    t11 = t6 - t1;
+    t2 = C13 * t9;
+    t4 = C13 * t3;
+    t0 = C13 * t10;
+    t13 = C13 * t11;
+    re[4] = t2;
+    im[4] = t4;
+    re[31] = t0;
+    im[31] = t13;
+    t12 = re[76];
+    t5 = im[76];
+    t7 = re[119];
+    t14 = im[119];
+    t8 = t12 + t7;
+    t6 = t5 - t14;
+    t1 = t5 + t14;
+    t9 = t12 - t7;
+    t3 = C13 * t8;
+    t10 = C13 * t6;
+    t11 = C13 * t1;
+    t2 = C13 * t9;
+    re[76] = t3;
+    im[76] = t10;
+    re[119] = t11;
+    im[119] = t2;
+    t4 = re[158];
+    t0 = im[158];
+    t13 = re[47];
+    t5 = im[47];
+    t14 = t4 + t13;
+    t12 = t0 - t5;
+    t7 = t0 + t5;
+    t8 = t4 - t13;
+    t6 = C13 * t14;
+    t1 = C13 * t12;
+    t9 = C13 * t7;
+    t3 = C13 * t8;
+    re[158] = t6;
+    im[158] = t1;
+    re[47] = t9;
+    im[47] = t3;
+    t10 = re[70];
+    t11 = im[70];
+    t2 = re[125];
+    t0 = im[125];
+    t5 = t10 + t2;
+    t4 = t11 - t0;
+    t13 = t11 + t0;
+    t14 = t10 - t2;
+    t12 = C13 * t5;
+    t7 = C13 * t4;
+    t8 = C13 * t13;
+    t6 = C13 * t14;
+    re[70] = t12;
+    im[70] = t7;
+    re[125] = t8;
+    im[125] = t6;
+    t1 = re[142];
+    t9 = im[142];
+    t3 = re[53];
+    t11 = im[53];
+    t0 = t1 + t3;
+    t10 = t9 - t11;
+    t2 = t9 + t11;
+    t5 = t1 - t3;
+    t4 = C13 * t0;
+    t13 = C13 * t10;
+    t14 = C13 * t2;
+    t12 = C13 * t5;
+    re[142] = t4;
+    im[142] = t13;
+    re[53] = t14;
+    im[53] = t12;
+    t7 = re[54];
+    t8 = im[54];
+    t6 = re[141];
+    t9 = im[141];
+    t11 = t7 + t6;
+    t1 = t8 - t9;
+    t3 = t8 + t9;
+    t0 = t7 - t6;
+    t10 = C13 * t11;
+    t2 = C13 * t1;
+    t5 = C13 * t3;
+    t4 = C13 * t0;
+    re[54] = t10;
+    im[54] = t2;
+    re[141] = t5;
+    im[141] = t4;
+    t13 = re[101];
+    t14 = im[101];
+    t12 = re[69];
+    t8 = im[69];
+    t9 = t13 + t12;
+    t7 = t14 - t8;
+    t6 = t14 + t8;
+    t11 = t13 - t12;
+    t1 = C13 * t9;
+    t3 = C13 * t7;
+    t0 = C13 * t6;
+    t10 = C13 * t11;
+    re[101] = t1;
+    im[101] = t3;
+    re[69] = t0;
+    im[69] = t10;
+    t2 = re[13];
+    t5 = im[13];
+    t4 = re[22];
+    t14 = im[22];
+    t8 = t2 + t4;
+    t13 = t5 - t14;
+    t12 = t5 + t14;
+    t9 = t2 - t4;
+    t7 = C13 * t8;
+    t6 = C13 * t13;
+    t11 = C13 * t12;
+    t1 = C13 * t9;
+    re[13] = t7;
+    im[13] = t6;
+    re[22] = t11;
+    im[22] = t1;
+    t3 = re[85];
+    t0 = im[85];
+    t10 = re[110];
+    t5 = im[110];
+    t14 = t3 + t10;
+    t2 = t0 - t5;
+    t4 = t0 + t5;
+    t8 = t3 - t10;
+    t13 = C13 * t14;
+    t12 = C13 * t2;
+    t9 = C13 * t4;
+    t7 = C13 * t8;
+    re[85] = t13;
+    im[85] = t12;
+    re[110] = t9;
+    im[110] = t7;
+    t6 = re[157];
+    t11 = im[157];
+    t1 = re[38];
+    t0 = im[38];
+    t5 = t6 + t1;
+    t3 = t11 - t0;
+    t10 = t11 + t0;
+    t14 = t6 - t1;
+    t2 = C13 * t5;
+    t4 = C13 * t3;
+    t8 = C13 * t10;
+    t13 = C13 * t14;
+    re[157] = t2;
+    im[157] = t4;
+    re[38] = t8;
+    im[38] = t13;
+    t12 = re[79];
+    t9 = im[79];
+    t7 = re[126];
+    t11 = im[126];
+    t0 = t12 + t7;
+    t6 = t9 - t11;
+    t1 = t9 + t11;
+    t5 = t12 - t7;
+    t3 = C13 * t0;
+    t10 = C13 * t6;
+    t14 = C13 * t1;
+    t2 = C13 * t5;
+    re[79] = t3;
+    im[79] = t10;
+    re[126] = t14;
+    im[126] = t2;
+    t4 = re[151];
+    t8 = im[151];
+    t13 = re[44];
+    t9 = im[44];
+    t11 = t4 + t13;
+    t12 = t8 - t9;
+    t7 = t8 + t9;
+    t0 = t4 - t13;
+    t6 = C13 * t11;
+    t1 = C13 * t12;
+    t5 = C13 * t7;
+    t3 = C13 * t0;
+    re[151] = t6;
+    im[151] = t1;
+    re[44] = t5;
+    im[44] = t3;
+    t10 = re[63];
+    t14 = im[63];
+    t2 = re[132];
+    t8 = im[132];
+    t9 = t10 + t2;
+    t4 = t14 - t8;
+    t13 = t14 + t8;
+    t11 = t10 - t2;
+    t12 = C13 * t9;
+    t7 = C13 * t4;
+    t0 = C13 * t13;
+    t6 = C13 * t11;
+    re[63] = t12;
+    im[63] = t7;
+    re[132] = t0;
+    im[132] = t6;
+    t1 = re[135];
+    t5 = im[135];
+    t3 = re[60];
+    t14 = im[60];
+    t8 = t1 + t3;
+    t10 = t5 - t14;
+    t2 = t5 + t14;
+    t9 = t1 - t3;
+    t4 = C13 * t8;
+    t13 = C13 * t10;
+    t11 = C13 * t2;
+    t12 = C13 * t9;
+    re[135] = t4;
+    im[135] = t13;
+    re[60] = t11;
+    im[60] = t12;
+    t7 = re[57];
+    t0 = im[57];
+    t6 = re[148];
+    t5 = im[148];
+    t14 = t7 + t6;
+    t1 = t0 - t5;
+    t3 = t0 + t5;
+    t8 = t7 - t6;
+    t10 = C13 * t14;
+    t2 = C13 * t1;
+    t9 = C13 * t3;
+    t4 = C13 * t8;
+    re[57] = t10;
+    im[57] = t2;
+    re[148] = t9;
+    im[148] = t4;
+    t13 = re[129];
+    t11 = im[129];
+    t12 = re[66];
+    t0 = im[66];
+    t5 = t13 + t12;
+    t7 = t11 - t0;
+    t6 = t11 + t0;
+    t14 = t13 - t12;
+    t1 = C13 * t5;
+    t3 = C13 * t7;
+    t8 = C13 * t6;
+    t10 = C13 * t14;
+    re[129] = t1;
+    im[129] = t3;
+    re[66] = t8;
+    im[66] = t10;
+    t2 = re[41];
+    t9 = im[41];
+    t4 = re[154];
+    t11 = im[154];
+    t0 = t2 + t4;
+    t13 = t9 - t11;
+    t12 = t9 + t11;
+    t5 = t2 - t4;
+    t7 = C13 * t0;
+    t6 = C13 * t13;
+    t14 = C13 * t12;
+    t1 = C13 * t5;
+    re[41] = t7;
+    im[41] = t6;
+    re[154] = t14;
+    im[154] = t1;
+    t3 = re[113];
+    t8 = im[113];
+    t10 = re[82];
+    t9 = im[82];
+    t11 = t3 + t10;
+    t2 = t8 - t9;
+    t4 = t8 + t9;
+    t0 = t3 - t10;
+    t13 = C13 * t11;
+    t12 = C13 * t2;
+    t5 = C13 * t4;
+    t7 = C13 * t0;
+    re[113] = t13;
+    im[113] = t12;
+    re[82] = t5;
+    im[82] = t7;
+    t6 = re[35];
+    t14 = im[35];
+    t1 = re[10];
+    t8 = im[10];
+    t9 = t6 + t1;
+    t3 = t14 - t8;
+    t10 = t14 + t8;
+    t11 = t6 - t1;
+    t2 = C13 * t9;
+    t4 = C13 * t3;
+    t0 = C13 * t10;
+    t13 = C13 * t11;
+    re[35] = t2;
+    im[35] = t4;
+    re[10] = t0;
+    im[10] = t13;
+    t12 = re[107];
+    t5 = im[107];
+    t7 = re[88];
+    t14 = im[88];
+    t8 = t12 + t7;
+    t6 = t5 - t14;
+    t1 = t5 + t14;
+    t9 = t12 - t7;
+    t3 = C13 * t8;
+    t10 = C13 * t6;
+    t11 = C13 * t1;
+    t2 = C13 * t9;
+    re[107] = t3;
+    im[107] = t10;
+    re[88] = t11;
+    im[88] = t2;
+    t4 = re[19];
+    t0 = im[19];
+    t13 = re[16];
+    t5 = im[16];
+    t14 = t4 + t13;
+    t12 = t0 - t5;
+    t7 = t0 + t5;
+    t8 = t4 - t13;
+    t6 = C13 * t14;
+    t1 = C13 * t12;
+    t9 = C13 * t7;
+    t3 = C13 * t8;
+    re[19] = t6;
+    im[19] = t1;
+    re[16] = t9;
+    im[16] = t3;
+    t10 = re[91];
+    t11 = im[91];
+    t2 = re[104];
+    t0 = im[104];
+    t5 = t10 + t2;
+    t4 = t11 - t0;
+    t13 = t11 + t0;
+    t14 = t10 - t2;
+    t12 = C13 * t5;
+    t7 = C13 * t4;
+    t8 = C13 * t13;
+    t6 = C13 * t14;
+    re[91] = t12;
+    im[91] = t7;
+    re[104] = t8;
+    im[104] = t6;
+    t1 = re[128];
+    t9 = im[128];
+    t3 = re[32];
+    t11 = im[32];
+    t0 = t1 + t3;
+    t10 = t9 - t11;
+    t2 = t9 + t11;
+    t5 = t1 - t3;
+    t4 = C13 * t0;
+    t13 = C13 * t10;
+    t14 = C13 * t2;
+    t12 = C13 * t5;
+    re[128] = t4;
+    im[128] = t13;
+    re[32] = t14;
+    im[32] = t12;
+    t7 = re[40];
+    t8 = im[40];
+    t6 = re[155];
+    t9 = im[155];
+    t11 = t7 + t6;
+    t1 = t8 - t9;
+    t3 = t8 + t9;
+    t0 = t7 - t6;
+    t10 = C13 * t11;
+    t2 = C13 * t1;
+    t5 = C13 * t3;
+    t4 = C13 * t0;
+    re[40] = t10;
+    im[40] = t2;
+    re[155] = t5;
+    im[155] = t4;
+    t13 = re[112];
+    t14 = im[112];
+    t12 = re[83];
+    t8 = im[83];
+    t9 = t13 + t12;
+    t7 = t14 - t8;
+    t6 = t14 + t8;
+    t11 = t13 - t12;
+    t1 = C13 * t9;
+    t3 = C13 * t7;
+    t0 = C13 * t6;
+    t10 = C13 * t11;
+    re[112] = t1;
+    im[112] = t3;
+    re[83] = t0;
+    im[83] = t10;
+    t2 = re[24];
+    t5 = im[24];
+    t4 = re[11];
+    t14 = im[11];
+    t8 = t2 + t4;
+    t13 = t5 - t14;
+    t12 = t5 + t14;
+    t9 = t2 - t4;
+    t7 = C13 * t8;
+    t6 = C13 * t13;
+    t11 = C13 * t12;
+    t1 = C13 * t9;
+    re[24] = t7;
+    im[24] = t6;
+    re[11] = t11;
+    im[11] = t1;
+    t3 = re[106];
+    t0 = im[106];
+    t10 = re[99];
+    t5 = im[99];
+    t14 = t3 + t10;
+    t2 = t0 - t5;
+    t4 = t0 + t5;
+    t8 = t3 - t10;
+    t13 = C13 * t14;
+    t12 = C13 * t2;
+    t9 = C13 * t4;
+    t7 = C13 * t8;
+    re[106] = t13;
+    im[106] = t12;
+    re[99] = t9;
+    im[99] = t7;
+    t6 = re[18];
+    t11 = im[18];
+    t1 = re[17];
+    t0 = im[17];
+    t5 = t6 + t1;
+    t3 = t11 - t0;
+    t10 = t11 + t0;
+    t14 = t6 - t1;
+    t2 = C13 * t5;
+    t4 = C13 * t3;
+    t8 = C13 * t10;
+    t13 = C13 * t14;
+    re[18] = t2;
+    im[18] = t4;
+    re[17] = t8;
+    im[17] = t13;
+    t12 = re[90];
+    t9 = im[90];
+    t7 = re[105];
+    t11 = im[105];
+    t0 = t12 + t7;
+    t6 = t9 - t11;
+    t1 = t9 + t11;
+    t5 = t12 - t7;
+    t3 = C13 * t0;
+    t10 = C13 * t6;
+    t14 = C13 * t1;
+    t2 = C13 * t5;
+    re[90] = t3;
+    im[90] = t10;
+    re[105] = t14;
+    im[105] = t2;
+    t4 = re[2];
+    t8 = im[2];
+    t13 = re[33];
+    t9 = im[33];
+    t11 = t4 + t13;
+    t12 = t8 - t9;
+    t7 = t8 + t9;
+    t0 = t4 - t13;
+    t6 = C13 * t11;
+    t1 = C13 * t12;
+    t5 = C13 * t7;
+    t3 = C13 * t0;
+    re[2] = t6;
+    im[2] = t1;
+    re[33] = t5;
+    im[33] = t3;
+    t10 = re[84];
+    t14 = im[84];
+    t2 = re[121];
+    t8 = im[121];
+    t9 = t10 + t2;
+    t4 = t14 - t8;
+    t13 = t14 + t8;
+    t11 = t10 - t2;
+    t12 = C13 * t9;
+    t7 = C13 * t4;
+    t0 = C13 * t13;
+    t6 = C13 * t11;
+    re[84] = t12;
+    im[84] = t7;
+    re[121] = t0;
+    im[121] = t6;
+    t1 = re[156];
+    t5 = im[156];
+    t3 = re[39];
+    t14 = im[39];
+    t8 = t1 + t3;
+    t10 = t5 - t14;
+    t2 = t5 + t14;
+    t9 = t1 - t3;
+    t4 = C13 * t8;
+    t13 = C13 * t10;
+    t11 = C13 * t2;
+    t12 = C13 * t9;
+    re[156] = t4;
+    im[156] = t13;
+    re[39] = t11;
+    im[39] = t12;
+    t7 = re[68];
+    t0 = im[68];
+    t6 = re[127];
+    t5 = im[127];
+    t14 = t7 + t6;
+    t1 = t0 - t5;
+    t3 = t0 + t5;
+    t8 = t7 - t6;
+    t10 = C13 * t14;
+    t2 = C13 * t1;
+    t9 = C13 * t3;
+    t4 = C13 * t8;
+    re[68] = t10;
+    im[68] = t2;
+    re[127] = t9;
+    im[127] = t4;
+    t13 = re[140];
+    t11 = im[140];
+    t12 = re[55];
+    t0 = im[55];
+    t5 = t13 + t12;
+    t7 = t11 - t0;
+    t6 = t11 + t0;
+    t14 = t13 - t12;
+    t1 = C13 * t5;
+    t3 = C13 * t7;
+    t8 = C13 * t6;
+    t10 = C13 * t14;
+    re[140] = t1;
+    im[140] = t3;
+    re[55] = t8;
+    im[55] = t10;
+    t2 = re[62];
+    t9 = im[62];
+    t4 = re[143];
+    t11 = im[143];
+    t0 = t2 + t4;
+    t13 = t9 - t11;
+    t12 = t9 + t11;
+    t5 = t2 - t4;
+    t7 = C13 * t0;
+    t6 = C13 * t13;
+    t14 = C13 * t12;
+    t1 = C13 * t5;
+    re[62] = t7;
+    im[62] = t6;
+    re[143] = t14;
+    im[143] = t1;
+    t3 = re[134];
+    t8 = im[134];
+    t10 = re[61];
+    t9 = im[61];
+    t11 = t3 + t10;
+    t2 = t8 - t9;
+    t4 = t8 + t9;
+    t0 = t3 - t10;
+    t13 = C13 * t11;
+    t12 = C13 * t2;
+    t5 = C13 * t4;
+    t7 = C13 * t0;
+    re[134] = t13;
+    im[134] = t12;
+    re[61] = t5;
+    im[61] = t7;
+    t6 = re[46];
+    t14 = im[46];
+    t1 = re[149];
+    t8 = im[149];
+    t9 = t6 + t1;
+    t3 = t14 - t8;
+    t10 = t14 + t8;
+    t11 = t6 - t1;
+    t2 = C13 * t9;
+    t4 = C13 * t3;
+    t0 = C13 * t10;
+    t13 = C13 * t11;
+    re[46] = t2;
+    im[46] = t4;
+    re[149] = t0;
+    im[149] = t13;
+    t12 = re[118];
+    t5 = im[118];
+    t7 = re[77];
+    t14 = im[77];
+    t8 = t12 + t7;
+    t6 = t5 - t14;
+    t1 = t5 + t14;
+    t9 = t12 - t7;
+    t3 = C13 * t8;
+    t10 = C13 * t6;
+    t11 = C13 * t1;
+    t2 = C13 * t9;
+    re[118] = t3;
+    im[118] = t10;
+    re[77] = t11;
+    im[77] = t2;
+}
+
+//
+//  Public functions.
+//
+
+/**
+ *  Apply in-place mixed-radix FFT transform of two real signals (prebuilt
+ *  for block size 160).
+ * 
+ *  Note(s):
+ *    [1] The size of `re` and `im` will not be checked.
+ *    [2] The real signal x1[n] shall be stored in `re`, the real signal
+ *        x2[n] shall be stored in `im`.
+ *    [3] The k-th output of x1[n] (0 <= k <= 80) is stored at index k, the
+ *        conjugate of the k-th output of x2[n] (0 < k < 80) is stored at
+ *        index 160 - k.
+ *    [4] The 0th (and the 80-th) output of x2[n] is stored in `im[0]` (and
+ *        `im[80]`).
+ * 
+ *  @param {Number[]} re 
+ *    - The real part of each point.
+ *  @param {Number[]} im 
+ *    - The imaginary part of each point.
+ */
+function ApplyMixedRadixPairedRFFT_160(re, im) {
+    ApplyMixedRadixPairedRFFT_160_Part1(re, im);
+    ApplyMixedRadixPairedRFFT_160_Part2(re, im);
+    MXCshft(re, im, CSHFT_INDEXES_0);
+    MXCshft(re, im, CSHFT_INDEXES_1);
+    MXCshft(re, im, CSHFT_INDEXES_2);
+    MXCshft(re, im, CSHFT_INDEXES_3);
+    MXCshft(re, im, CSHFT_INDEXES_4);
+    MXCshft(re, im, CSHFT_INDEXES_5);
+    MXSwap(re, im, 10, 100);
+    MXCshft(re, im, CSHFT_INDEXES_6);
+    MXCshft(re, im, CSHFT_INDEXES_7);
+    MXCshft(re, im, CSHFT_INDEXES_8);
+    MXCshft(re, im, CSHFT_INDEXES_9);
+    MXCshft(re, im, CSHFT_INDEXES_10);
+    MXCshft(re, im, CSHFT_INDEXES_11);
+    MXCshft(re, im, CSHFT_INDEXES_12);
+}
+
+//  Export public APIs.
+module.exports = {
+    "ApplyMixedRadixPairedRFFT_160": ApplyMixedRadixPairedRFFT_160
+};
\ No newline at end of file
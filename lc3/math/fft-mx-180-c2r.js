@@ -0,0 +1,4868 @@
+//
+//  Copyright 2021 - 2023 XiaoJSoft Studio. All rights reserved.
+//  Use of this source code is governed by a BSD-style license that can be
+//  found in the LICENSE.md file.
+//
+
+//
+//  Note(s):
+//    [1] This file is generated automatically by a FFT compiler, which locates 
+//        at "./../../dev/fft-mx-generator/" directory.
+//        Do NOT modify this file manually.
+//
+
+//
+//  Private functions.
+//
+
+/**
+ *  Part 1 of ApplyMixedRadixIRFFT_180().
+ * 
+ *  @param {Number[]} re 
+ *    - The real part of each input point.
+ *  @param {Number[]} im 
+ *    - The imaginary part of each input point.
+ *  @param {Number[]} x 
+ *    - The real output points.
+ */
+function ApplyMixedRadixIRFFT_180_Part1(re, im, x) {
+    let t0, t1, t2, t3, t4, t5;
+    const C0 = 0.005555555555555556;
+    const C1 = 0.005358285168425527;
+    const C2 = 0.0057460573540088706;
+    const C3 = 0.005154486536198328;
+    const C4 = 0.0059295584666886085;
+    const C5 = 0.004944407956114555;
+    const C6 = 0.006105835325755149;
+    const C7 = 0.004728305376563917;
+    const C8 = 0.006274673165009089;
+    const C9 = 0.004506442085251543;
+    const C10 = 0.006435866281550769;
+    const C11 = 0.00427908838842248;
+    const C12 = 0.006589218286397584;
+    const C13 = 0.004046521281535161;
+    const C14 = 0.00673454234375369;
+    const C15 = 0.00380902411178511;
+    const C16 = 0.006871661398640656;
+    const C17 = 0.0035668862328900337;
+    const C18 = 0.007000408392611672;
+    const C19 = 0.003320402652556888;
+    const C20 = 0.00712062646728654;
+    const C21 = 0.0030698736730604193;
+    const C22 = 0.007232169155459442;
+    const C23 = 0.002815604525371115;
+    const C24 = 0.007334900559546672;
+    const C25 = 0.0025579049972782753;
+    const C26 = 0.0074286955171569136;
+    const C27 = 0.0022970890559613124;
+    const C28 = 0.007513439753582322;
+    const C29 = 0.0020334744654691046;
+    const C30 = 0.0075890300210246595;
+    const C31 = 0.0017673823995734503;
+    const C32 = 0.0076553742243868385;
+    const C33 = 0.001499137050468305;
+    const C34 = 0.007712391533476603;
+    const C35 = 0.0012290652337915244;
+    const C36 = 0.007760012481485671;
+    const C37 = 0.0009574959904503533;
+    const C38 = 0.007798179049624335;
+    const C39 = 0.0006847601857357709;
+    const C40 = 0.007826844737808428;
+    const C41 = 0.0004111901062140884;
+    const C42 = 0.007845974621312514;
+    const C43 = 0.00013711905488696585;
+    const C44 = 0.007855545393320269;
+    const C45 = 0.011111111111111112;
+    t0 = re[0];
+    t1 = re[90];
+    t2 = t0 + t1;
+    t0 = t0 - t1;
+    t1 = C0 * t2;
+    t2 = C0 * t0;
+    re[0] = t1;
+    im[0] = t2;
+    t0 = re[1];
+    t1 = im[1];
+    t2 = re[89];
+    t3 = im[89];
+    t4 = t0 + t2;
+    t5 = t1 - t3;
+    t0 = t0 - t2;
+    t2 = t1 + t3;
+    t1 = C0 * t4;
+    t3 = C0 * t5;
+    t4 = t0 + t2;
+    t5 = 0.005552171261217199 * t4;
+    t4 = t0 * (-C1);
+    t0 = t2 * C2;
+    t2 = t5 - t0;
+    t0 = t5 + t4;
+    t5 = t1 - t0;
+    t4 = t3 + t2;
+    t1 = t1 + t0;
+    t0 = t2 - t3;
+    re[1] = t5;
+    im[1] = t4;
+    re[89] = t1;
+    im[89] = t0;
+    t2 = re[2];
+    t3 = im[2];
+    t5 = re[88];
+    t4 = im[88];
+    t1 = t2 + t5;
+    t0 = t3 - t4;
+    t2 = t2 - t5;
+    t5 = t3 + t4;
+    t3 = C0 * t1;
+    t4 = C0 * t0;
+    t1 = t2 + t5;
+    t0 = 0.005542022501443468 * t1;
+    t1 = t2 * (-C3);
+    t2 = t5 * C4;
+    t5 = t0 - t2;
+    t2 = t0 + t1;
+    t0 = t3 - t2;
+    t1 = t4 + t5;
+    t3 = t3 + t2;
+    t2 = t5 - t4;
+    re[2] = t0;
+    im[2] = t1;
+    re[88] = t3;
+    im[88] = t2;
+    t5 = re[3];
+    t4 = im[3];
+    t0 = re[87];
+    t1 = im[87];
+    t3 = t5 + t0;
+    t2 = t4 - t1;
+    t5 = t5 - t0;
+    t0 = t4 + t1;
+    t4 = C0 * t3;
+    t1 = C0 * t2;
+    t3 = t5 + t0;
+    t2 = 0.005525121640934852 * t3;
+    t3 = t5 * (-C5);
+    t5 = t0 * C6;
+    t0 = t2 - t5;
+    t5 = t2 + t3;
+    t2 = t4 - t5;
+    t3 = t1 + t0;
+    t4 = t4 + t5;
+    t5 = t0 - t1;
+    re[3] = t2;
+    im[3] = t3;
+    re[87] = t4;
+    im[87] = t5;
+    t0 = re[4];
+    t1 = im[4];
+    t2 = re[86];
+    t3 = im[86];
+    t4 = t0 + t2;
+    t5 = t1 - t3;
+    t0 = t0 - t2;
+    t2 = t1 + t3;
+    t1 = C0 * t4;
+    t3 = C0 * t5;
+    t4 = t0 + t2;
+    t5 = 0.005501489270786503 * t4;
+    t4 = t0 * (-C7);
+    t0 = t2 * C8;
+    t2 = t5 - t0;
+    t0 = t5 + t4;
+    t5 = t1 - t0;
+    t4 = t3 + t2;
+    t1 = t1 + t0;
+    t0 = t2 - t3;
+    re[4] = t5;
+    im[4] = t4;
+    re[86] = t1;
+    im[86] = t0;
+    t2 = re[5];
+    t3 = im[5];
+    t5 = re[85];
+    t4 = im[85];
+    t1 = t2 + t5;
+    t0 = t3 - t4;
+    t2 = t2 - t5;
+    t5 = t3 + t4;
+    t3 = C0 * t1;
+    t4 = C0 * t0;
+    t1 = t2 + t5;
+    t0 = 0.005471154183401156 * t1;
+    t1 = t2 * (-C9);
+    t2 = t5 * C10;
+    t5 = t0 - t2;
+    t2 = t0 + t1;
+    t0 = t3 - t2;
+    t1 = t4 + t5;
+    t3 = t3 + t2;
+    t2 = t5 - t4;
+    re[5] = t0;
+    im[5] = t1;
+    re[85] = t3;
+    im[85] = t2;
+    t5 = re[6];
+    t4 = im[6];
+    t0 = re[84];
+    t1 = im[84];
+    t3 = t5 + t0;
+    t2 = t4 - t1;
+    t5 = t5 - t0;
+    t0 = t4 + t1;
+    t4 = C0 * t3;
+    t1 = C0 * t2;
+    t3 = t5 + t0;
+    t2 = 0.005434153337410032 * t3;
+    t3 = t5 * (-C11);
+    t5 = t0 * C12;
+    t0 = t2 - t5;
+    t5 = t2 + t3;
+    t2 = t4 - t5;
+    t3 = t1 + t0;
+    t4 = t4 + t5;
+    t5 = t0 - t1;
+    re[6] = t2;
+    im[6] = t3;
+    re[84] = t4;
+    im[84] = t5;
+    t0 = re[7];
+    t1 = im[7];
+    t2 = re[83];
+    t3 = im[83];
+    t4 = t0 + t2;
+    t5 = t1 - t3;
+    t0 = t0 - t2;
+    t2 = t1 + t3;
+    t1 = C0 * t4;
+    t3 = C0 * t5;
+    t4 = t0 + t2;
+    t5 = 0.005390531812644425 * t4;
+    t4 = t0 * (-C13);
+    t0 = t2 * C14;
+    t2 = t5 - t0;
+    t0 = t5 + t4;
+    t5 = t1 - t0;
+    t4 = t3 + t2;
+    t1 = t1 + t0;
+    t0 = t2 - t3;
+    re[7] = t5;
+    im[7] = t4;
+    re[83] = t1;
+    im[83] = t0;
+    t2 = re[8];
+    t3 = im[8];
+    t5 = re[82];
+    t4 = im[82];
+    t1 = t2 + t5;
+    t0 = t3 - t4;
+    t2 = t2 - t5;
+    t5 = t3 + t4;
+    t3 = C0 * t1;
+    t4 = C0 * t0;
+    t1 = t2 + t5;
+    t0 = 0.005340342755212883 * t1;
+    t1 = t2 * (-C15);
+    t2 = t5 * C16;
+    t5 = t0 - t2;
+    t2 = t0 + t1;
+    t0 = t3 - t2;
+    t1 = t4 + t5;
+    t3 = t3 + t2;
+    t2 = t5 - t4;
+    re[8] = t0;
+    im[8] = t1;
+    re[82] = t3;
+    im[82] = t2;
+    t5 = re[9];
+    t4 = im[9];
+    t0 = re[81];
+    t1 = im[81];
+    t3 = t5 + t0;
+    t2 = t4 - t1;
+    t5 = t5 - t0;
+    t0 = t4 + t1;
+    t4 = C0 * t3;
+    t1 = C0 * t2;
+    t3 = t5 + t0;
+    t2 = 0.005283647312750853 * t3;
+    t3 = t5 * (-C17);
+    t5 = t0 * C18;
+    t0 = t2 - t5;
+    t5 = t2 + t3;
+    t2 = t4 - t5;
+    t3 = t1 + t0;
+    t4 = t4 + t5;
+    t5 = t0 - t1;
+    re[9] = t2;
+    im[9] = t3;
+    re[81] = t4;
+    im[81] = t5;
+    t0 = re[10];
+    t1 = im[10];
+    t2 = re[80];
+    t3 = im[80];
+    t4 = t0 + t2;
+    t5 = t1 - t3;
+    t0 = t0 - t2;
+    t2 = t1 + t3;
+    t1 = C0 * t4;
+    t3 = C0 * t5;
+    t4 = t0 + t2;
+    t5 = 0.005220514559921714 * t4;
+    t4 = t0 * (-C19);
+    t0 = t2 * C20;
+    t2 = t5 - t0;
+    t0 = t5 + t4;
+    t5 = t1 - t0;
+    t4 = t3 + t2;
+    t1 = t1 + t0;
+    t0 = t2 - t3;
+    re[10] = t5;
+    im[10] = t4;
+    re[80] = t1;
+    im[80] = t0;
+    t2 = re[11];
+    t3 = im[11];
+    t5 = re[79];
+    t4 = im[79];
+    t1 = t2 + t5;
+    t0 = t3 - t4;
+    t2 = t2 - t5;
+    t5 = t3 + t4;
+    t3 = C0 * t1;
+    t4 = C0 * t0;
+    t1 = t2 + t5;
+    t0 = 0.005151021414259931 * t1;
+    t1 = t2 * (-C21);
+    t2 = t5 * C22;
+    t5 = t0 - t2;
+    t2 = t0 + t1;
+    t0 = t3 - t2;
+    t1 = t4 + t5;
+    t3 = t3 + t2;
+    t2 = t5 - t4;
+    re[11] = t0;
+    im[11] = t1;
+    re[79] = t3;
+    im[79] = t2;
+    t5 = re[12];
+    t4 = im[12];
+    t0 = re[78];
+    t1 = im[78];
+    t3 = t5 + t0;
+    t2 = t4 - t1;
+    t5 = t5 - t0;
+    t0 = t4 + t1;
+    t4 = C0 * t3;
+    t1 = C0 * t2;
+    t3 = t5 + t0;
+    t2 = 0.0050752525424588935 * t3;
+    t3 = t5 * (-C23);
+    t5 = t0 * C24;
+    t0 = t2 - t5;
+    t5 = t2 + t3;
+    t2 = t4 - t5;
+    t3 = t1 + t0;
+    t4 = t4 + t5;
+    t5 = t0 - t1;
+    re[12] = t2;
+    im[12] = t3;
+    re[78] = t4;
+    im[78] = t5;
+    t0 = re[13];
+    t1 = im[13];
+    t2 = re[77];
+    t3 = im[77];
+    t4 = t0 + t2;
+    t5 = t1 - t3;
+    t0 = t0 - t2;
+    t2 = t1 + t3;
+    t1 = C0 * t4;
+    t3 = C0 * t5;
+    t4 = t0 + t2;
+    t5 = 0.0049933002572175944 * t4;
+    t4 = t0 * (-C25);
+    t0 = t2 * C26;
+    t2 = t5 - t0;
+    t0 = t5 + t4;
+    t5 = t1 - t0;
+    t4 = t3 + t2;
+    t1 = t1 + t0;
+    t0 = t2 - t3;
+    re[13] = t5;
+    im[13] = t4;
+    re[77] = t1;
+    im[77] = t0;
+    t2 = re[14];
+    t3 = im[14];
+    t5 = re[76];
+    t4 = im[76];
+    t1 = t2 + t5;
+    t0 = t3 - t4;
+    t2 = t2 - t5;
+    t5 = t3 + t4;
+    t3 = C0 * t1;
+    t4 = C0 * t0;
+    t1 = t2 + t5;
+    t0 = 0.004905264404771817 * t1;
+    t1 = t2 * (-C27);
+    t2 = t5 * C28;
+    t5 = t0 - t2;
+    t2 = t0 + t1;
+    t0 = t3 - t2;
+    t1 = t4 + t5;
+    t3 = t3 + t2;
+    t2 = t5 - t4;
+    re[14] = t0;
+    im[14] = t1;
+    re[76] = t3;
+    im[76] = t2;
+    t5 = re[15];
+    t4 = im[15];
+    t0 = re[75];
+    t1 = im[75];
+    t3 = t5 + t0;
+    t2 = t4 - t1;
+    t5 = t5 - t0;
+    t0 = t4 + t1;
+    t4 = C0 * t3;
+    t1 = C0 * t2;
+    t3 = t5 + t0;
+    t2 = 0.004811252243246882 * t3;
+    t3 = t5 * (-C29);
+    t5 = t0 * C30;
+    t0 = t2 - t5;
+    t5 = t2 + t3;
+    t2 = t4 - t5;
+    t3 = t1 + t0;
+    t4 = t4 + t5;
+    t5 = t0 - t1;
+    re[15] = t2;
+    im[15] = t3;
+    re[75] = t4;
+    im[75] = t5;
+    t0 = re[16];
+    t1 = im[16];
+    t2 = re[74];
+    t3 = im[74];
+    t4 = t0 + t2;
+    t5 = t1 - t3;
+    t0 = t0 - t2;
+    t2 = t1 + t3;
+    t1 = C0 * t4;
+    t3 = C0 * t5;
+    t4 = t0 + t2;
+    t5 = 0.004711378311980144 * t4;
+    t4 = t0 * (-C31);
+    t0 = t2 * C32;
+    t2 = t5 - t0;
+    t0 = t5 + t4;
+    t5 = t1 - t0;
+    t4 = t3 + t2;
+    t1 = t1 + t0;
+    t0 = t2 - t3;
+    re[16] = t5;
+    im[16] = t4;
+    re[74] = t1;
+    im[74] = t0;
+    t2 = re[17];
+    t3 = im[17];
+    t5 = re[73];
+    t4 = im[73];
+    t1 = t2 + t5;
+    t0 = t3 - t4;
+    t2 = t2 - t5;
+    t5 = t3 + t4;
+    t3 = C0 * t1;
+    t4 = C0 * t0;
+    t1 = t2 + t5;
+    t0 = 0.004605764291972454 * t1;
+    t1 = t2 * (-C33);
+    t2 = t5 * C34;
+    t5 = t0 - t2;
+    t2 = t0 + t1;
+    t0 = t3 - t2;
+    t1 = t4 + t5;
+    t3 = t3 + t2;
+    t2 = t5 - t4;
+    re[17] = t0;
+    im[17] = t1;
+    re[73] = t3;
+    im[73] = t2;
+    t5 = re[18];
+    t4 = im[18];
+    t0 = re[72];
+    t1 = im[72];
+    t3 = t5 + t0;
+    t2 = t4 - t1;
+    t5 = t5 - t0;
+    t0 = t4 + t1;
+    t4 = C0 * t3;
+    t1 = C0 * t2;
+    t3 = t5 + t0;
+    t2 = 0.0044945388576385975 * t3;
+    t3 = t5 * (-C35);
+    t5 = t0 * C36;
+    t0 = t2 - t5;
+    t5 = t2 + t3;
+    t2 = t4 - t5;
+    t3 = t1 + t0;
+    t4 = t4 + t5;
+    t5 = t0 - t1;
+    re[18] = t2;
+    im[18] = t3;
+    re[72] = t4;
+    im[72] = t5;
+    t0 = re[19];
+    t1 = im[19];
+    t2 = re[71];
+    t3 = im[71];
+    t4 = t0 + t2;
+    t5 = t1 - t3;
+    t0 = t0 - t2;
+    t2 = t1 + t3;
+    t1 = C0 * t4;
+    t3 = C0 * t5;
+    t4 = t0 + t2;
+    t5 = 0.004377837520037344 * t4;
+    t4 = t0 * (-C37);
+    t0 = t2 * C38;
+    t2 = t5 - t0;
+    t0 = t5 + t4;
+    t5 = t1 - t0;
+    t4 = t3 + t2;
+    t1 = t1 + t0;
+    t0 = t2 - t3;
+    re[19] = t5;
+    im[19] = t4;
+    re[71] = t1;
+    im[71] = t0;
+    t2 = re[20];
+    t3 = im[20];
+    t5 = re[70];
+    t4 = im[70];
+    t1 = t2 + t5;
+    t0 = t3 - t4;
+    t2 = t2 - t5;
+    t5 = t3 + t4;
+    t3 = C0 * t1;
+    t4 = C0 * t0;
+    t1 = t2 + t5;
+    t0 = 0.0042558024617721 * t1;
+    t1 = t2 * (-C39);
+    t2 = t5 * C40;
+    t5 = t0 - t2;
+    t2 = t0 + t1;
+    t0 = t3 - t2;
+    t1 = t4 + t5;
+    t3 = t3 + t2;
+    t2 = t5 - t4;
+    re[20] = t0;
+    im[20] = t1;
+    re[70] = t3;
+    im[70] = t2;
+    t5 = re[21];
+    t4 = im[21];
+    t0 = re[69];
+    t1 = im[69];
+    t3 = t5 + t0;
+    t2 = t4 - t1;
+    t5 = t5 - t0;
+    t0 = t4 + t1;
+    t4 = C0 * t3;
+    t1 = C0 * t2;
+    t3 = t5 + t0;
+    t2 = 0.004128582363763301 * t3;
+    t3 = t5 * (-C41);
+    t5 = t0 * C42;
+    t0 = t2 - t5;
+    t5 = t2 + t3;
+    t2 = t4 - t5;
+    t3 = t1 + t0;
+    t4 = t4 + t5;
+    t5 = t0 - t1;
+    re[21] = t2;
+    im[21] = t3;
+    re[69] = t4;
+    im[69] = t5;
+    t0 = re[22];
+    t1 = im[22];
+    t2 = re[68];
+    t3 = im[68];
+    t4 = t0 + t2;
+    t5 = t1 - t3;
+    t0 = t0 - t2;
+    t2 = t1 + t3;
+    t1 = C0 * t4;
+    t3 = C0 * t5;
+    t4 = t0 + t2;
+    t5 = 0.003996332224103618 * t4;
+    t4 = t0 * (-C43);
+    t0 = t2 * C44;
+    t2 = t5 - t0;
+    t0 = t5 + t4;
+    t5 = t1 - t0;
+    t4 = t3 + t2;
+    t1 = t1 + t0;
+    t0 = t2 - t3;
+    re[22] = t5;
+    im[22] = t4;
+    re[68] = t1;
+    im[68] = t0;
+    t2 = re[23];
+    t3 = im[23];
+    t5 = re[67];
+    t4 = im[67];
+    t1 = t2 + t5;
+    t0 = t3 - t4;
+    t2 = t2 - t5;
+    t5 = t3 + t4;
+    t3 = C0 * t1;
+    t4 = C0 * t0;
+    t1 = t2 + t5;
+    t0 = 0.0038592131692166518 * t1;
+    t1 = t2 * C43;
+    t2 = t5 * C44;
+    t5 = t0 - t2;
+    t2 = t0 + t1;
+    t0 = t3 - t2;
+    t1 = t4 + t5;
+    t3 = t3 + t2;
+    t2 = t5 - t4;
+    re[23] = t0;
+    im[23] = t1;
+    re[67] = t3;
+    im[67] = t2;
+    t5 = re[24];
+    t4 = im[24];
+    t0 = re[66];
+    t1 = im[66];
+    t3 = t5 + t0;
+    t2 = t4 - t1;
+    t5 = t5 - t0;
+    t0 = t4 + t1;
+    t4 = C0 * t3;
+    t1 = C0 * t2;
+    t3 = t5 + t0;
+    t2 = 0.0037173922575492128 * t3;
+    t3 = t5 * C41;
+    t5 = t0 * C42;
+    t0 = t2 - t5;
+    t5 = t2 + t3;
+    t2 = t4 - t5;
+    t3 = t1 + t0;
+    t4 = t4 + t5;
+    t5 = t0 - t1;
+    re[24] = t2;
+    im[24] = t3;
+    re[66] = t4;
+    im[66] = t5;
+    t0 = re[25];
+    t1 = im[25];
+    t2 = re[65];
+    t3 = im[65];
+    t4 = t0 + t2;
+    t5 = t1 - t3;
+    t0 = t0 - t2;
+    t2 = t1 + t3;
+    t1 = C0 * t4;
+    t3 = C0 * t5;
+    t4 = t0 + t2;
+    t5 = 0.003571042276036329 * t4;
+    t4 = t0 * C39;
+    t0 = t2 * C40;
+    t2 = t5 - t0;
+    t0 = t5 + t4;
+    t5 = t1 - t0;
+    t4 = t3 + t2;
+    t1 = t1 + t0;
+    t0 = t2 - t3;
+    re[25] = t5;
+    im[25] = t4;
+    re[65] = t1;
+    im[65] = t0;
+    t2 = re[26];
+    t3 = im[26];
+    t5 = re[64];
+    t4 = im[64];
+    t1 = t2 + t5;
+    t0 = t3 - t4;
+    t2 = t2 - t5;
+    t5 = t3 + t4;
+    t3 = C0 * t1;
+    t4 = C0 * t0;
+    t1 = t2 + t5;
+    t0 = 0.0034203415295869905 * t1;
+    t1 = t2 * C37;
+    t2 = t5 * C38;
+    t5 = t0 - t2;
+    t2 = t0 + t1;
+    t0 = t3 - t2;
+    t1 = t4 + t5;
+    t3 = t3 + t2;
+    t2 = t5 - t4;
+    re[26] = t0;
+    im[26] = t1;
+    re[64] = t3;
+    im[64] = t2;
+    t5 = re[27];
+    t4 = im[27];
+    t0 = re[63];
+    t1 = im[63];
+    t3 = t5 + t0;
+    t2 = t4 - t1;
+    t5 = t5 - t0;
+    t0 = t4 + t1;
+    t4 = C0 * t3;
+    t1 = C0 * t2;
+    t3 = t5 + t0;
+    t2 = 0.003265473623847073 * t3;
+    t3 = t5 * C35;
+    t5 = t0 * C36;
+    t0 = t2 - t5;
+    t5 = t2 + t3;
+    t2 = t4 - t5;
+    t3 = t1 + t0;
+    t4 = t4 + t5;
+    t5 = t0 - t1;
+    re[27] = t2;
+    im[27] = t3;
+    re[63] = t4;
+    im[63] = t5;
+    t0 = re[28];
+    t1 = im[28];
+    t2 = re[62];
+    t3 = im[62];
+    t4 = t0 + t2;
+    t5 = t1 - t3;
+    t0 = t0 - t2;
+    t2 = t1 + t3;
+    t1 = C0 * t4;
+    t3 = C0 * t5;
+    t4 = t0 + t2;
+    t5 = 0.003106627241504149 * t4;
+    t4 = t0 * C33;
+    t0 = t2 * C34;
+    t2 = t5 - t0;
+    t0 = t5 + t4;
+    t5 = t1 - t0;
+    t4 = t3 + t2;
+    t1 = t1 + t0;
+    t0 = t2 - t3;
+    re[28] = t5;
+    im[28] = t4;
+    re[62] = t1;
+    im[62] = t0;
+    t2 = re[29];
+    t3 = im[29];
+    t5 = re[61];
+    t4 = im[61];
+    t1 = t2 + t5;
+    t0 = t3 - t4;
+    t2 = t2 - t5;
+    t5 = t3 + t4;
+    t3 = C0 * t1;
+    t4 = C0 * t0;
+    t1 = t2 + t5;
+    t0 = 0.002943995912406694 * t1;
+    t1 = t2 * C31;
+    t2 = t5 * C32;
+    t5 = t0 - t2;
+    t2 = t0 + t1;
+    t0 = t3 - t2;
+    t1 = t4 + t5;
+    t3 = t3 + t2;
+    t2 = t5 - t4;
+    re[29] = t0;
+    im[29] = t1;
+    re[61] = t3;
+    im[61] = t2;
+    t5 = re[30];
+    t4 = im[30];
+    t0 = re[60];
+    t1 = im[60];
+    t3 = t5 + t0;
+    t2 = t4 - t1;
+    t5 = t5 - t0;
+    t0 = t4 + t1;
+    t4 = C0 * t3;
+    t1 = C0 * t2;
+    t3 = t5 + t0;
+    t2 = 0.0027777777777777775 * t3;
+    t3 = t5 * C29;
+    t5 = t0 * C30;
+    t0 = t2 - t5;
+    t5 = t2 + t3;
+    t2 = t4 - t5;
+    t3 = t1 + t0;
+    t4 = t4 + t5;
+    t5 = t0 - t1;
+    re[30] = t2;
+    im[30] = t3;
+    re[60] = t4;
+    im[60] = t5;
+    t0 = re[31];
+    t1 = im[31];
+    t2 = re[59];
+    t3 = im[59];
+    t4 = t0 + t2;
+    t5 = t1 - t3;
+    t0 = t0 - t2;
+    t2 = t1 + t3;
+    t1 = C0 * t4;
+    t3 = C0 * t5;
+    t4 = t0 + t2;
+    t5 = 0.0026081753488105047 * t4;
+    t4 = t0 * C27;
+    t0 = t2 * C28;
+    t2 = t5 - t0;
+    t0 = t5 + t4;
+    t5 = t1 - t0;
+    t4 = t3 + t2;
+    t1 = t1 + t0;
+    t0 = t2 - t3;
+    re[31] = t5;
+    im[31] = t4;
+    re[59] = t1;
+    im[59] = t0;
+    t2 = re[32];
+    t3 = im[32];
+    t5 = re[58];
+    t4 = im[58];
+    t1 = t2 + t5;
+    t0 = t3 - t4;
+    t2 = t2 - t5;
+    t5 = t3 + t4;
+    t3 = C0 * t1;
+    t4 = C0 * t0;
+    t1 = t2 + t5;
+    t0 = 0.002435395259939319 * t1;
+    t1 = t2 * C25;
+    t2 = t5 * C26;
+    t5 = t0 - t2;
+    t2 = t0 + t1;
+    t0 = t3 - t2;
+    t1 = t4 + t5;
+    t3 = t3 + t2;
+    t2 = t5 - t4;
+    re[32] = t0;
+    im[32] = t1;
+    re[58] = t3;
+    im[58] = t2;
+    t5 = re[33];
+    t4 = im[33];
+    t0 = re[57];
+    t1 = im[57];
+    t3 = t5 + t0;
+    t2 = t4 - t1;
+    t5 = t5 - t0;
+    t0 = t4 + t1;
+    t4 = C0 * t3;
+    t1 = C0 * t2;
+    t3 = t5 + t0;
+    t2 = 0.0022596480170877786 * t3;
+    t3 = t5 * C23;
+    t5 = t0 * C24;
+    t0 = t2 - t5;
+    t5 = t2 + t3;
+    t2 = t4 - t5;
+    t3 = t1 + t0;
+    t4 = t4 + t5;
+    t5 = t0 - t1;
+    re[33] = t2;
+    im[33] = t3;
+    re[57] = t4;
+    im[57] = t5;
+    t0 = re[34];
+    t1 = im[34];
+    t2 = re[56];
+    t3 = im[56];
+    t4 = t0 + t2;
+    t5 = t1 - t3;
+    t0 = t0 - t2;
+    t2 = t1 + t3;
+    t1 = C0 * t4;
+    t3 = C0 * t5;
+    t4 = t0 + t2;
+    t5 = 0.0020811477411995113 * t4;
+    t4 = t0 * C21;
+    t0 = t2 * C22;
+    t2 = t5 - t0;
+    t0 = t5 + t4;
+    t5 = t1 - t0;
+    t4 = t3 + t2;
+    t1 = t1 + t0;
+    t0 = t2 - t3;
+    re[34] = t5;
+    im[34] = t4;
+    re[56] = t1;
+    im[56] = t0;
+    t2 = re[35];
+    t3 = im[35];
+    t5 = re[55];
+    t4 = im[55];
+    t1 = t2 + t5;
+    t0 = t3 - t4;
+    t2 = t2 - t5;
+    t5 = t3 + t4;
+    t3 = C0 * t1;
+    t4 = C0 * t0;
+    t1 = t2 + t5;
+    t0 = 0.0019001119073648262 * t1;
+    t1 = t2 * C19;
+    t2 = t5 * C20;
+    t5 = t0 - t2;
+    t2 = t0 + t1;
+    t0 = t3 - t2;
+    t1 = t4 + t5;
+    t3 = t3 + t2;
+    t2 = t5 - t4;
+    re[35] = t0;
+    im[35] = t1;
+    re[55] = t3;
+    im[55] = t2;
+    t5 = re[36];
+    t4 = im[36];
+    t0 = re[54];
+    t1 = im[54];
+    t3 = t5 + t0;
+    t2 = t4 - t1;
+    t5 = t5 - t0;
+    t0 = t4 + t1;
+    t4 = C0 * t3;
+    t1 = C0 * t2;
+    t3 = t5 + t0;
+    t2 = 0.001716761079860819 * t3;
+    t3 = t5 * C17;
+    t5 = t0 * C18;
+    t0 = t2 - t5;
+    t5 = t2 + t3;
+    t2 = t4 - t5;
+    t3 = t1 + t0;
+    t4 = t4 + t5;
+    t5 = t0 - t1;
+    re[36] = t2;
+    im[36] = t3;
+    re[54] = t4;
+    im[54] = t5;
+    t0 = re[37];
+    t1 = im[37];
+    t2 = re[53];
+    t3 = im[53];
+    t4 = t0 + t2;
+    t5 = t1 - t3;
+    t0 = t0 - t2;
+    t2 = t1 + t3;
+    t1 = C0 * t4;
+    t3 = C0 * t5;
+    t4 = t0 + t2;
+    t5 = 0.0015313186434277731 * t4;
+    t4 = t0 * C15;
+    t0 = t2 * C16;
+    t2 = t5 - t0;
+    t0 = t5 + t4;
+    t5 = t1 - t0;
+    t4 = t3 + t2;
+    t1 = t1 + t0;
+    t0 = t2 - t3;
+    re[37] = t5;
+    im[37] = t4;
+    re[53] = t1;
+    im[53] = t0;
+    t2 = re[38];
+    t3 = im[38];
+    t5 = re[52];
+    t4 = im[52];
+    t1 = t2 + t5;
+    t0 = t3 - t4;
+    t2 = t2 - t5;
+    t5 = t3 + t4;
+    t3 = C0 * t1;
+    t4 = C0 * t0;
+    t1 = t2 + t5;
+    t0 = 0.0013440105311092652 * t1;
+    t1 = t2 * C13;
+    t2 = t5 * C14;
+    t5 = t0 - t2;
+    t2 = t0 + t1;
+    t0 = t3 - t2;
+    t1 = t4 + t5;
+    t3 = t3 + t2;
+    t2 = t5 - t4;
+    re[38] = t0;
+    im[38] = t1;
+    re[52] = t3;
+    im[52] = t2;
+    t5 = re[39];
+    t4 = im[39];
+    t0 = re[51];
+    t1 = im[51];
+    t3 = t5 + t0;
+    t2 = t4 - t1;
+    t5 = t5 - t0;
+    t0 = t4 + t1;
+    t4 = C0 * t3;
+    t1 = C0 * t2;
+    t3 = t5 + t0;
+    t2 = 0.0011550649489875519 * t3;
+    t3 = t5 * C11;
+    t5 = t0 * C12;
+    t0 = t2 - t5;
+    t5 = t2 + t3;
+    t2 = t4 - t5;
+    t3 = t1 + t0;
+    t4 = t4 + t5;
+    t5 = t0 - t1;
+    re[39] = t2;
+    im[39] = t3;
+    re[51] = t4;
+    im[51] = t5;
+    t0 = re[40];
+    t1 = im[40];
+    t2 = re[50];
+    t3 = im[50];
+    t4 = t0 + t2;
+    t5 = t1 - t3;
+    t0 = t0 - t2;
+    t2 = t1 + t3;
+    t1 = C0 * t4;
+    t3 = C0 * t5;
+    t4 = t0 + t2;
+    t5 = 0.000964712098149613 * t4;
+    t4 = t0 * C9;
+    t0 = t2 * C10;
+    t2 = t5 - t0;
+    t0 = t5 + t4;
+    t5 = t1 - t0;
+    t4 = t3 + t2;
+    t1 = t1 + t0;
+    t0 = t2 - t3;
+    re[40] = t5;
+    im[40] = t4;
+    re[50] = t1;
+    im[50] = t0;
+    t2 = re[41];
+    t3 = im[41];
+    t5 = re[49];
+    t4 = im[49];
+    t1 = t2 + t5;
+    t0 = t3 - t4;
+    t2 = t2 - t5;
+    t5 = t3 + t4;
+    t3 = C0 * t1;
+    t4 = C0 * t0;
+    t1 = t2 + t5;
+    t0 = 0.0007731838942225858 * t1;
+    t1 = t2 * C7;
+    t2 = t5 * C8;
+    t5 = t0 - t2;
+    t2 = t0 + t1;
+    t0 = t3 - t2;
+    t1 = t4 + t5;
+    t3 = t3 + t2;
+    t2 = t5 - t4;
+    re[41] = t0;
+    im[41] = t1;
+    re[49] = t3;
+    im[49] = t2;
+    t5 = re[42];
+    t4 = im[42];
+    t0 = re[48];
+    t1 = im[48];
+    t3 = t5 + t0;
+    t2 = t4 - t1;
+    t5 = t5 - t0;
+    t0 = t4 + t1;
+    t4 = C0 * t3;
+    t1 = C0 * t2;
+    t3 = t5 + t0;
+    t2 = 0.000580713684820297 * t3;
+    t3 = t5 * C5;
+    t5 = t0 * C6;
+    t0 = t2 - t5;
+    t5 = t2 + t3;
+    t2 = t4 - t5;
+    t3 = t1 + t0;
+    t4 = t4 + t5;
+    t5 = t0 - t1;
+    re[42] = t2;
+    im[42] = t3;
+    re[48] = t4;
+    im[48] = t5;
+    t0 = re[43];
+    t1 = im[43];
+    t2 = re[47];
+    t3 = im[47];
+    t4 = t0 + t2;
+    t5 = t1 - t3;
+    t0 = t0 - t2;
+    t2 = t1 + t3;
+    t1 = C0 * t4;
+    t3 = C0 * t5;
+    t4 = t0 + t2;
+    t5 = 0.0003875359652451406 * t4;
+    t4 = t0 * C3;
+    t0 = t2 * C4;
+    t2 = t5 - t0;
+    t0 = t5 + t4;
+    t5 = t1 - t0;
+    t4 = t3 + t2;
+    t1 = t1 + t0;
+    t0 = t2 - t3;
+    re[43] = t5;
+    im[43] = t4;
+    re[47] = t1;
+    im[47] = t0;
+    t2 = re[44];
+    t3 = im[44];
+    t5 = re[46];
+    t4 = im[46];
+    t1 = t2 + t5;
+    t0 = t3 - t4;
+    t2 = t2 - t5;
+    t5 = t3 + t4;
+    t3 = C0 * t1;
+    t4 = C0 * t0;
+    t1 = t2 + t5;
+    t0 = 0.00019388609279167207 * t1;
+    t1 = t2 * C1;
+    t2 = t5 * C2;
+    t5 = t0 - t2;
+    t2 = t0 + t1;
+    t0 = t3 - t2;
+    t1 = t4 + t5;
+    t3 = t3 + t2;
+    t2 = t5 - t4;
+    re[44] = t0;
+    im[44] = t1;
+    re[46] = t3;
+    im[46] = t2;
+    t5 = re[45];
+    t4 = im[45];
+    t0 = C45 * t5;
+    t1 = C45 * t4;
+    t3 = -t1;
+    re[45] = t0;
+    im[45] = t3;
+}
+
+/**
+ *  Part 2 of ApplyMixedRadixIRFFT_180().
+ * 
+ *  @param {Number[]} re 
+ *    - The real part of each input point.
+ *  @param {Number[]} im 
+ *    - The imaginary part of each input point.
+ *  @param {Number[]} x 
+ *    - The real output points.
+ */
+function ApplyMixedRadixIRFFT_180_Part2(re, im, x) {
+    let t0, t1, t10, t11, t12, t13, t14, t2, t3, t4, t5, t6, t7, t8, t9;
+    const C0 = 0.5;
+    const C1 = 0.8660254037844386;
+    const C2 = 0.766044443118978;
+    const C3 = 1.4088320528055172;
+    const C4 = 0.12325683343243876;
+    const C5 = 0.17364817766693033;
+    const C6 = 1.1584559306791384;
+    const C7 = 0.8111595753452777;
+    const C8 = 0.9396926207859084;
+    const C9 = 0.5976724774602398;
+    const C10 = 1.281712764111577;
+    const C11 = 0.5590169943749475;
+    const C12 = 0.25;
+    const C13 = 0.9510565162951535;
+    const C14 = 0.5877852522924731;
+    t2 = im[0];
+    t5 = re[0];
+    t4 = im[30];
+    t1 = re[30];
+    t0 = im[60];
+    t3 = re[60];
+    t6 = t4 + t0;
+    t7 = t1 + t3;
+    t8 = C0 * t6;
+    t8 = t2 - t8;
+    t9 = C0 * t7;
+    t9 = t5 - t9;
+    t4 = t4 - t0;
+    t0 = C1 * t4;
+    t4 = t1 - t3;
+    t1 = C1 * t4;
+    t3 = t2 + t6;
+    t4 = t5 + t7;
+    t2 = t8 + t1;
+    t6 = t9 - t0;
+    t5 = t8 - t1;
+    t7 = t9 + t0;
+    im[0] = t3;
+    re[0] = t4;
+    im[30] = t2;
+    re[30] = t6;
+    im[60] = t5;
+    re[60] = t7;
+    t8 = im[10];
+    t1 = re[10];
+    t9 = im[40];
+    t0 = re[40];
+    t3 = im[70];
+    t4 = re[70];
+    t2 = t9 + t3;
+    t6 = t0 + t4;
+    t5 = C0 * t2;
+    t7 = t8 - t5;
+    t5 = C0 * t6;
+    t5 = t1 - t5;
+    t9 = t9 - t3;
+    t3 = C1 * t9;
+    t9 = t0 - t4;
+    t0 = C1 * t9;
+    t4 = t8 + t2;
+    t9 = t1 + t6;
+    t8 = t7 + t0;
+    t2 = t5 - t3;
+    t1 = t7 - t0;
+    t6 = t5 + t3;
+    t7 = t8 + t2;
+    t0 = C2 * t7;
+    t5 = t8 * (-C3);
+    t3 = t2 * C4;
+    t7 = t0 - t3;
+    t8 = t0 + t5;
+    t2 = t1 + t6;
+    t3 = C5 * t2;
+    t0 = t1 * (-C6);
+    t5 = t6 * (-C7);
+    t2 = t3 - t5;
+    t1 = t3 + t0;
+    im[10] = t4;
+    re[10] = t9;
+    im[40] = t7;
+    re[40] = t8;
+    im[70] = t2;
+    re[70] = t1;
+    t6 = im[20];
+    t5 = re[20];
+    t3 = im[50];
+    t0 = re[50];
+    t4 = im[80];
+    t9 = re[80];
+    t7 = t3 + t4;
+    t8 = t0 + t9;
+    t2 = C0 * t7;
+    t1 = t6 - t2;
+    t2 = C0 * t8;
+    t2 = t5 - t2;
+    t3 = t3 - t4;
+    t4 = C1 * t3;
+    t3 = t0 - t9;
+    t0 = C1 * t3;
+    t9 = t6 + t7;
+    t3 = t5 + t8;
+    t6 = t1 + t0;
+    t7 = t2 - t4;
+    t5 = t1 - t0;
+    t8 = t2 + t4;
+    t1 = t6 + t7;
+    t0 = C5 * t1;
+    t2 = t6 * (-C6);
+    t4 = t7 * (-C7);
+    t1 = t0 - t4;
+    t6 = t0 + t2;
+    t7 = t5 + t8;
+    t4 = (-C8) * t7;
+    t0 = t5 * C9;
+    t2 = t8 * (-C10);
+    t7 = t4 - t2;
+    t5 = t4 + t0;
+    im[20] = t9;
+    re[20] = t3;
+    im[50] = t1;
+    re[50] = t6;
+    im[80] = t7;
+    re[80] = t5;
+    t8 = im[0];
+    t2 = re[0];
+    t4 = im[10];
+    t0 = re[10];
+    t9 = im[20];
+    t3 = re[20];
+    t1 = t4 + t9;
+    t6 = t0 + t3;
+    t7 = C0 * t1;
+    t5 = t8 - t7;
+    t7 = C0 * t6;
+    t7 = t2 - t7;
+    t4 = t4 - t9;
+    t9 = C1 * t4;
+    t4 = t0 - t3;
+    t0 = C1 * t4;
+    t3 = t8 + t1;
+    t4 = t2 + t6;
+    t8 = t5 + t0;
+    t1 = t7 - t9;
+    t2 = t5 - t0;
+    t6 = t7 + t9;
+    im[0] = t3;
+    re[0] = t4;
+    im[10] = t8;
+    re[10] = t1;
+    im[20] = t2;
+    re[20] = t6;
+    t5 = im[30];
+    t0 = re[30];
+    t7 = im[40];
+    t9 = re[40];
+    t3 = im[50];
+    t4 = re[50];
+    t8 = t7 + t3;
+    t1 = t9 + t4;
+    t2 = C0 * t8;
+    t6 = t5 - t2;
+    t2 = C0 * t1;
+    t2 = t0 - t2;
+    t7 = t7 - t3;
+    t3 = C1 * t7;
+    t7 = t9 - t4;
+    t9 = C1 * t7;
+    t4 = t5 + t8;
+    t7 = t0 + t1;
+    t5 = t6 + t9;
+    t8 = t2 - t3;
+    t0 = t6 - t9;
+    t1 = t2 + t3;
+    im[30] = t4;
+    re[30] = t7;
+    im[40] = t5;
+    re[40] = t8;
+    im[50] = t0;
+    re[50] = t1;
+    t6 = im[60];
+    t9 = re[60];
+    t2 = im[70];
+    t3 = re[70];
+    t4 = im[80];
+    t7 = re[80];
+    t5 = t2 + t4;
+    t8 = t3 + t7;
+    t0 = C0 * t5;
+    t1 = t6 - t0;
+    t0 = C0 * t8;
+    t0 = t9 - t0;
+    t2 = t2 - t4;
+    t4 = C1 * t2;
+    t2 = t3 - t7;
+    t3 = C1 * t2;
+    t7 = t6 + t5;
+    t2 = t9 + t8;
+    t6 = t1 + t3;
+    t5 = t0 - t4;
+    t9 = t1 - t3;
+    t8 = t0 + t4;
+    im[60] = t7;
+    re[60] = t2;
+    im[70] = t6;
+    re[70] = t5;
+    im[80] = t9;
+    re[80] = t8;
+    t1 = im[18];
+    t3 = re[18];
+    t0 = im[48];
+    t4 = re[48];
+    t7 = im[78];
+    t2 = re[78];
+    t6 = t0 + t7;
+    t5 = t4 + t2;
+    t9 = C0 * t6;
+    t8 = t1 - t9;
+    t9 = C0 * t5;
+    t9 = t3 - t9;
+    t0 = t0 - t7;
+    t7 = C1 * t0;
+    t0 = t4 - t2;
+    t4 = C1 * t0;
+    t2 = t1 + t6;
+    t0 = t3 + t5;
+    t1 = t8 + t4;
+    t6 = t9 - t7;
+    t3 = t8 - t4;
+    t5 = t9 + t7;
+    im[18] = t2;
+    re[18] = t0;
+    im[48] = t1;
+    re[48] = t6;
+    im[78] = t3;
+    re[78] = t5;
+    t8 = im[28];
+    t4 = re[28];
+    t9 = im[58];
+    t7 = re[58];
+    t2 = im[88];
+    t0 = re[88];
+    t1 = t9 + t2;
+    t6 = t7 + t0;
+    t3 = C0 * t1;
+    t5 = t8 - t3;
+    t3 = C0 * t6;
+    t3 = t4 - t3;
+    t9 = t9 - t2;
+    t2 = C1 * t9;
+    t9 = t7 - t0;
+    t7 = C1 * t9;
+    t0 = t8 + t1;
+    t9 = t4 + t6;
+    t8 = t5 + t7;
+    t1 = t3 - t2;
+    t4 = t5 - t7;
+    t6 = t3 + t2;
+    t5 = t8 + t1;
+    t7 = C2 * t5;
+    t3 = t8 * (-C3);
+    t2 = t1 * C4;
+    t5 = t7 - t2;
+    t8 = t7 + t3;
+    t1 = t4 + t6;
+    t2 = C5 * t1;
+    t7 = t4 * (-C6);
+    t3 = t6 * (-C7);
+    t1 = t2 - t3;
+    t4 = t2 + t7;
+    im[28] = t0;
+    re[28] = t9;
+    im[58] = t5;
+    re[58] = t8;
+    im[88] = t1;
+    re[88] = t4;
+    t6 = im[38];
+    t3 = re[38];
+    t2 = im[68];
+    t7 = re[68];
+    t0 = im[8];
+    t9 = re[8];
+    t5 = t2 + t0;
+    t8 = t7 + t9;
+    t1 = C0 * t5;
+    t4 = t6 - t1;
+    t1 = C0 * t8;
+    t1 = t3 - t1;
+    t2 = t2 - t0;
+    t0 = C1 * t2;
+    t2 = t7 - t9;
+    t7 = C1 * t2;
+    t9 = t6 + t5;
+    t2 = t3 + t8;
+    t6 = t4 + t7;
+    t5 = t1 - t0;
+    t3 = t4 - t7;
+    t8 = t1 + t0;
+    t4 = t6 + t5;
+    t7 = C5 * t4;
+    t1 = t6 * (-C6);
+    t0 = t5 * (-C7);
+    t4 = t7 - t0;
+    t6 = t7 + t1;
+    t5 = t3 + t8;
+    t0 = (-C8) * t5;
+    t7 = t3 * C9;
+    t1 = t8 * (-C10);
+    t5 = t0 - t1;
+    t3 = t0 + t7;
+    im[38] = t9;
+    re[38] = t2;
+    im[68] = t4;
+    re[68] = t6;
+    im[8] = t5;
+    re[8] = t3;
+    t8 = im[18];
+    t1 = re[18];
+    t0 = im[28];
+    t7 = re[28];
+    t9 = im[38];
+    t2 = re[38];
+    t4 = t0 + t9;
+    t6 = t7 + t2;
+    t5 = C0 * t4;
+    t3 = t8 - t5;
+    t5 = C0 * t6;
+    t5 = t1 - t5;
+    t0 = t0 - t9;
+    t9 = C1 * t0;
+    t0 = t7 - t2;
+    t7 = C1 * t0;
+    t2 = t8 + t4;
+    t0 = t1 + t6;
+    t8 = t3 + t7;
+    t4 = t5 - t9;
+    t1 = t3 - t7;
+    t6 = t5 + t9;
+    im[18] = t2;
+    re[18] = t0;
+    im[28] = t8;
+    re[28] = t4;
+    im[38] = t1;
+    re[38] = t6;
+    t3 = im[48];
+    t7 = re[48];
+    t5 = im[58];
+    t9 = re[58];
+    t2 = im[68];
+    t0 = re[68];
+    t8 = t5 + t2;
+    t4 = t9 + t0;
+    t1 = C0 * t8;
+    t6 = t3 - t1;
+    t1 = C0 * t4;
+    t1 = t7 - t1;
+    t5 = t5 - t2;
+    t2 = C1 * t5;
+    t5 = t9 - t0;
+    t9 = C1 * t5;
+    t0 = t3 + t8;
+    t5 = t7 + t4;
+    t3 = t6 + t9;
+    t8 = t1 - t2;
+    t7 = t6 - t9;
+    t4 = t1 + t2;
+    im[48] = t0;
+    re[48] = t5;
+    im[58] = t3;
+    re[58] = t8;
+    im[68] = t7;
+    re[68] = t4;
+    t6 = im[78];
+    t9 = re[78];
+    t1 = im[88];
+    t2 = re[88];
+    t0 = im[8];
+    t5 = re[8];
+    t3 = t1 + t0;
+    t8 = t2 + t5;
+    t7 = C0 * t3;
+    t4 = t6 - t7;
+    t7 = C0 * t8;
+    t7 = t9 - t7;
+    t1 = t1 - t0;
+    t0 = C1 * t1;
+    t1 = t2 - t5;
+    t2 = C1 * t1;
+    t5 = t6 + t3;
+    t1 = t9 + t8;
+    t6 = t4 + t2;
+    t3 = t7 - t0;
+    t9 = t4 - t2;
+    t8 = t7 + t0;
+    im[78] = t5;
+    re[78] = t1;
+    im[88] = t6;
+    re[88] = t3;
+    im[8] = t9;
+    re[8] = t8;
+    t4 = im[36];
+    t2 = re[36];
+    t7 = im[66];
+    t0 = re[66];
+    t5 = im[6];
+    t1 = re[6];
+    t6 = t7 + t5;
+    t3 = t0 + t1;
+    t9 = C0 * t6;
+    t8 = t4 - t9;
+    t9 = C0 * t3;
+    t9 = t2 - t9;
+    t7 = t7 - t5;
+    t5 = C1 * t7;
+    t7 = t0 - t1;
+    t0 = C1 * t7;
+    t1 = t4 + t6;
+    t7 = t2 + t3;
+    t4 = t8 + t0;
+    t6 = t9 - t5;
+    t2 = t8 - t0;
+    t3 = t9 + t5;
+    im[36] = t1;
+    re[36] = t7;
+    im[66] = t4;
+    re[66] = t6;
+    im[6] = t2;
+    re[6] = t3;
+    t8 = im[46];
+    t0 = re[46];
+    t9 = im[76];
+    t5 = re[76];
+    t1 = im[16];
+    t7 = re[16];
+    t4 = t9 + t1;
+    t6 = t5 + t7;
+    t2 = C0 * t4;
+    t3 = t8 - t2;
+    t2 = C0 * t6;
+    t2 = t0 - t2;
+    t9 = t9 - t1;
+    t1 = C1 * t9;
+    t9 = t5 - t7;
+    t5 = C1 * t9;
+    t7 = t8 + t4;
+    t9 = t0 + t6;
+    t8 = t3 + t5;
+    t4 = t2 - t1;
+    t0 = t3 - t5;
+    t6 = t2 + t1;
+    t3 = t8 + t4;
+    t5 = C2 * t3;
+    t2 = t8 * (-C3);
+    t1 = t4 * C4;
+    t3 = t5 - t1;
+    t8 = t5 + t2;
+    t4 = t0 + t6;
+    t1 = C5 * t4;
+    t5 = t0 * (-C6);
+    t2 = t6 * (-C7);
+    t4 = t1 - t2;
+    t0 = t1 + t5;
+    im[46] = t7;
+    re[46] = t9;
+    im[76] = t3;
+    re[76] = t8;
+    im[16] = t4;
+    re[16] = t0;
+    t6 = im[56];
+    t2 = re[56];
+    t1 = im[86];
+    t5 = re[86];
+    t7 = im[26];
+    t9 = re[26];
+    t3 = t1 + t7;
+    t8 = t5 + t9;
+    t4 = C0 * t3;
+    t0 = t6 - t4;
+    t4 = C0 * t8;
+    t4 = t2 - t4;
+    t1 = t1 - t7;
+    t7 = C1 * t1;
+    t1 = t5 - t9;
+    t5 = C1 * t1;
+    t9 = t6 + t3;
+    t1 = t2 + t8;
+    t6 = t0 + t5;
+    t3 = t4 - t7;
+    t2 = t0 - t5;
+    t8 = t4 + t7;
+    t0 = t6 + t3;
+    t5 = C5 * t0;
+    t4 = t6 * (-C6);
+    t7 = t3 * (-C7);
+    t0 = t5 - t7;
+    t6 = t5 + t4;
+    t3 = t2 + t8;
+    t7 = (-C8) * t3;
+    t5 = t2 * C9;
+    t4 = t8 * (-C10);
+    t3 = t7 - t4;
+    t2 = t7 + t5;
+    im[56] = t9;
+    re[56] = t1;
+    im[86] = t0;
+    re[86] = t6;
+    im[26] = t3;
+    re[26] = t2;
+    t8 = im[36];
+    t4 = re[36];
+    t7 = im[46];
+    t5 = re[46];
+    t9 = im[56];
+    t1 = re[56];
+    t0 = t7 + t9;
+    t6 = t5 + t1;
+    t3 = C0 * t0;
+    t2 = t8 - t3;
+    t3 = C0 * t6;
+    t3 = t4 - t3;
+    t7 = t7 - t9;
+    t9 = C1 * t7;
+    t7 = t5 - t1;
+    t5 = C1 * t7;
+    t1 = t8 + t0;
+    t7 = t4 + t6;
+    t8 = t2 + t5;
+    t0 = t3 - t9;
+    t4 = t2 - t5;
+    t6 = t3 + t9;
+    im[36] = t1;
+    re[36] = t7;
+    im[46] = t8;
+    re[46] = t0;
+    im[56] = t4;
+    re[56] = t6;
+    t2 = im[66];
+    t5 = re[66];
+    t3 = im[76];
+    t9 = re[76];
+    t1 = im[86];
+    t7 = re[86];
+    t8 = t3 + t1;
+    t0 = t9 + t7;
+    t4 = C0 * t8;
+    t6 = t2 - t4;
+    t4 = C0 * t0;
+    t4 = t5 - t4;
+    t3 = t3 - t1;
+    t1 = C1 * t3;
+    t3 = t9 - t7;
+    t9 = C1 * t3;
+    t7 = t2 + t8;
+    t3 = t5 + t0;
+    t2 = t6 + t9;
+    t8 = t4 - t1;
+    t5 = t6 - t9;
+    t0 = t4 + t1;
+    im[66] = t7;
+    re[66] = t3;
+    im[76] = t2;
+    re[76] = t8;
+    im[86] = t5;
+    re[86] = t0;
+    t6 = im[6];
+    t9 = re[6];
+    t4 = im[16];
+    t1 = re[16];
+    t7 = im[26];
+    t3 = re[26];
+    t2 = t4 + t7;
+    t8 = t1 + t3;
+    t5 = C0 * t2;
+    t0 = t6 - t5;
+    t5 = C0 * t8;
+    t5 = t9 - t5;
+    t4 = t4 - t7;
+    t7 = C1 * t4;
+    t4 = t1 - t3;
+    t1 = C1 * t4;
+    t3 = t6 + t2;
+    t4 = t9 + t8;
+    t6 = t0 + t1;
+    t2 = t5 - t7;
+    t9 = t0 - t1;
+    t8 = t5 + t7;
+    im[6] = t3;
+    re[6] = t4;
+    im[16] = t6;
+    re[16] = t2;
+    im[26] = t9;
+    re[26] = t8;
+    t0 = im[54];
+    t1 = re[54];
+    t5 = im[84];
+    t7 = re[84];
+    t3 = im[24];
+    t4 = re[24];
+    t6 = t5 + t3;
+    t2 = t7 + t4;
+    t9 = C0 * t6;
+    t8 = t0 - t9;
+    t9 = C0 * t2;
+    t9 = t1 - t9;
+    t5 = t5 - t3;
+    t3 = C1 * t5;
+    t5 = t7 - t4;
+    t7 = C1 * t5;
+    t4 = t0 + t6;
+    t5 = t1 + t2;
+    t0 = t8 + t7;
+    t6 = t9 - t3;
+    t1 = t8 - t7;
+    t2 = t9 + t3;
+    im[54] = t4;
+    re[54] = t5;
+    im[84] = t0;
+    re[84] = t6;
+    im[24] = t1;
+    re[24] = t2;
+    t8 = im[64];
+    t7 = re[64];
+    t9 = im[4];
+    t3 = re[4];
+    t4 = im[34];
+    t5 = re[34];
+    t0 = t9 + t4;
+    t6 = t3 + t5;
+    t1 = C0 * t0;
+    t2 = t8 - t1;
+    t1 = C0 * t6;
+    t1 = t7 - t1;
+    t9 = t9 - t4;
+    t4 = C1 * t9;
+    t9 = t3 - t5;
+    t3 = C1 * t9;
+    t5 = t8 + t0;
+    t9 = t7 + t6;
+    t8 = t2 + t3;
+    t0 = t1 - t4;
+    t7 = t2 - t3;
+    t6 = t1 + t4;
+    t2 = t8 + t0;
+    t3 = C2 * t2;
+    t1 = t8 * (-C3);
+    t4 = t0 * C4;
+    t2 = t3 - t4;
+    t8 = t3 + t1;
+    t0 = t7 + t6;
+    t4 = C5 * t0;
+    t3 = t7 * (-C6);
+    t1 = t6 * (-C7);
+    t0 = t4 - t1;
+    t7 = t4 + t3;
+    im[64] = t5;
+    re[64] = t9;
+    im[4] = t2;
+    re[4] = t8;
+    im[34] = t0;
+    re[34] = t7;
+    t6 = im[74];
+    t1 = re[74];
+    t4 = im[14];
+    t3 = re[14];
+    t5 = im[44];
+    t9 = re[44];
+    t2 = t4 + t5;
+    t8 = t3 + t9;
+    t0 = C0 * t2;
+    t7 = t6 - t0;
+    t0 = C0 * t8;
+    t0 = t1 - t0;
+    t4 = t4 - t5;
+    t5 = C1 * t4;
+    t4 = t3 - t9;
+    t3 = C1 * t4;
+    t9 = t6 + t2;
+    t4 = t1 + t8;
+    t6 = t7 + t3;
+    t2 = t0 - t5;
+    t1 = t7 - t3;
+    t8 = t0 + t5;
+    t7 = t6 + t2;
+    t3 = C5 * t7;
+    t0 = t6 * (-C6);
+    t5 = t2 * (-C7);
+    t7 = t3 - t5;
+    t6 = t3 + t0;
+    t2 = t1 + t8;
+    t5 = (-C8) * t2;
+    t3 = t1 * C9;
+    t0 = t8 * (-C10);
+    t2 = t5 - t0;
+    t1 = t5 + t3;
+    im[74] = t9;
+    re[74] = t4;
+    im[14] = t7;
+    re[14] = t6;
+    im[44] = t2;
+    re[44] = t1;
+    t8 = im[54];
+    t0 = re[54];
+    t5 = im[64];
+    t3 = re[64];
+    t9 = im[74];
+    t4 = re[74];
+    t7 = t5 + t9;
+    t6 = t3 + t4;
+    t2 = C0 * t7;
+    t1 = t8 - t2;
+    t2 = C0 * t6;
+    t2 = t0 - t2;
+    t5 = t5 - t9;
+    t9 = C1 * t5;
+    t5 = t3 - t4;
+    t3 = C1 * t5;
+    t4 = t8 + t7;
+    t5 = t0 + t6;
+    t8 = t1 + t3;
+    t7 = t2 - t9;
+    t0 = t1 - t3;
+    t6 = t2 + t9;
+    im[54] = t4;
+    re[54] = t5;
+    im[64] = t8;
+    re[64] = t7;
+    im[74] = t0;
+    re[74] = t6;
+    t1 = im[84];
+    t3 = re[84];
+    t2 = im[4];
+    t9 = re[4];
+    t4 = im[14];
+    t5 = re[14];
+    t8 = t2 + t4;
+    t7 = t9 + t5;
+    t0 = C0 * t8;
+    t6 = t1 - t0;
+    t0 = C0 * t7;
+    t0 = t3 - t0;
+    t2 = t2 - t4;
+    t4 = C1 * t2;
+    t2 = t9 - t5;
+    t9 = C1 * t2;
+    t5 = t1 + t8;
+    t2 = t3 + t7;
+    t1 = t6 + t9;
+    t8 = t0 - t4;
+    t3 = t6 - t9;
+    t7 = t0 + t4;
+    im[84] = t5;
+    re[84] = t2;
+    im[4] = t1;
+    re[4] = t8;
+    im[14] = t3;
+    re[14] = t7;
+    t6 = im[24];
+    t9 = re[24];
+    t0 = im[34];
+    t4 = re[34];
+    t5 = im[44];
+    t2 = re[44];
+    t1 = t0 + t5;
+    t8 = t4 + t2;
+    t3 = C0 * t1;
+    t7 = t6 - t3;
+    t3 = C0 * t8;
+    t3 = t9 - t3;
+    t0 = t0 - t5;
+    t5 = C1 * t0;
+    t0 = t4 - t2;
+    t4 = C1 * t0;
+    t2 = t6 + t1;
+    t0 = t9 + t8;
+    t6 = t7 + t4;
+    t1 = t3 - t5;
+    t9 = t7 - t4;
+    t8 = t3 + t5;
+    im[24] = t2;
+    re[24] = t0;
+    im[34] = t6;
+    re[34] = t1;
+    im[44] = t9;
+    re[44] = t8;
+    t7 = im[72];
+    t4 = re[72];
+    t3 = im[12];
+    t5 = re[12];
+    t2 = im[42];
+    t0 = re[42];
+    t6 = t3 + t2;
+    t1 = t5 + t0;
+    t9 = C0 * t6;
+    t8 = t7 - t9;
+    t9 = C0 * t1;
+    t9 = t4 - t9;
+    t3 = t3 - t2;
+    t2 = C1 * t3;
+    t3 = t5 - t0;
+    t5 = C1 * t3;
+    t0 = t7 + t6;
+    t3 = t4 + t1;
+    t7 = t8 + t5;
+    t6 = t9 - t2;
+    t4 = t8 - t5;
+    t1 = t9 + t2;
+    im[72] = t0;
+    re[72] = t3;
+    im[12] = t7;
+    re[12] = t6;
+    im[42] = t4;
+    re[42] = t1;
+    t8 = im[82];
+    t5 = re[82];
+    t9 = im[22];
+    t2 = re[22];
+    t0 = im[52];
+    t3 = re[52];
+    t7 = t9 + t0;
+    t6 = t2 + t3;
+    t4 = C0 * t7;
+    t1 = t8 - t4;
+    t4 = C0 * t6;
+    t4 = t5 - t4;
+    t9 = t9 - t0;
+    t0 = C1 * t9;
+    t9 = t2 - t3;
+    t2 = C1 * t9;
+    t3 = t8 + t7;
+    t9 = t5 + t6;
+    t8 = t1 + t2;
+    t7 = t4 - t0;
+    t5 = t1 - t2;
+    t6 = t4 + t0;
+    t1 = t8 + t7;
+    t2 = C2 * t1;
+    t4 = t8 * (-C3);
+    t0 = t7 * C4;
+    t1 = t2 - t0;
+    t8 = t2 + t4;
+    t7 = t5 + t6;
+    t0 = C5 * t7;
+    t2 = t5 * (-C6);
+    t4 = t6 * (-C7);
+    t7 = t0 - t4;
+    t5 = t0 + t2;
+    im[82] = t3;
+    re[82] = t9;
+    im[22] = t1;
+    re[22] = t8;
+    im[52] = t7;
+    re[52] = t5;
+    t6 = im[2];
+    t4 = re[2];
+    t0 = im[32];
+    t2 = re[32];
+    t3 = im[62];
+    t9 = re[62];
+    t1 = t0 + t3;
+    t8 = t2 + t9;
+    t7 = C0 * t1;
+    t5 = t6 - t7;
+    t7 = C0 * t8;
+    t7 = t4 - t7;
+    t0 = t0 - t3;
+    t3 = C1 * t0;
+    t0 = t2 - t9;
+    t2 = C1 * t0;
+    t9 = t6 + t1;
+    t0 = t4 + t8;
+    t6 = t5 + t2;
+    t1 = t7 - t3;
+    t4 = t5 - t2;
+    t8 = t7 + t3;
+    t5 = t6 + t1;
+    t2 = C5 * t5;
+    t7 = t6 * (-C6);
+    t3 = t1 * (-C7);
+    t5 = t2 - t3;
+    t6 = t2 + t7;
+    t1 = t4 + t8;
+    t3 = (-C8) * t1;
+    t2 = t4 * C9;
+    t7 = t8 * (-C10);
+    t1 = t3 - t7;
+    t4 = t3 + t2;
+    im[2] = t9;
+    re[2] = t0;
+    im[32] = t5;
+    re[32] = t6;
+    im[62] = t1;
+    re[62] = t4;
+    t8 = im[72];
+    t7 = re[72];
+    t3 = im[82];
+    t2 = re[82];
+    t9 = im[2];
+    t0 = re[2];
+    t5 = t3 + t9;
+    t6 = t2 + t0;
+    t1 = C0 * t5;
+    t4 = t8 - t1;
+    t1 = C0 * t6;
+    t1 = t7 - t1;
+    t3 = t3 - t9;
+    t9 = C1 * t3;
+    t3 = t2 - t0;
+    t2 = C1 * t3;
+    t0 = t8 + t5;
+    t3 = t7 + t6;
+    t8 = t4 + t2;
+    t5 = t1 - t9;
+    t7 = t4 - t2;
+    t6 = t1 + t9;
+    im[72] = t0;
+    re[72] = t3;
+    im[82] = t8;
+    re[82] = t5;
+    im[2] = t7;
+    re[2] = t6;
+    t4 = im[12];
+    t2 = re[12];
+    t1 = im[22];
+    t9 = re[22];
+    t0 = im[32];
+    t3 = re[32];
+    t8 = t1 + t0;
+    t5 = t9 + t3;
+    t7 = C0 * t8;
+    t6 = t4 - t7;
+    t7 = C0 * t5;
+    t7 = t2 - t7;
+    t1 = t1 - t0;
+    t0 = C1 * t1;
+    t1 = t9 - t3;
+    t9 = C1 * t1;
+    t3 = t4 + t8;
+    t1 = t2 + t5;
+    t4 = t6 + t9;
+    t8 = t7 - t0;
+    t2 = t6 - t9;
+    t5 = t7 + t0;
+    im[12] = t3;
+    re[12] = t1;
+    im[22] = t4;
+    re[22] = t8;
+    im[32] = t2;
+    re[32] = t5;
+    t6 = im[42];
+    t9 = re[42];
+    t7 = im[52];
+    t0 = re[52];
+    t3 = im[62];
+    t1 = re[62];
+    t4 = t7 + t3;
+    t8 = t0 + t1;
+    t2 = C0 * t4;
+    t5 = t6 - t2;
+    t2 = C0 * t8;
+    t2 = t9 - t2;
+    t7 = t7 - t3;
+    t3 = C1 * t7;
+    t7 = t0 - t1;
+    t0 = C1 * t7;
+    t1 = t6 + t4;
+    t7 = t9 + t8;
+    t6 = t5 + t0;
+    t4 = t2 - t3;
+    t9 = t5 - t0;
+    t8 = t2 + t3;
+    im[42] = t1;
+    re[42] = t7;
+    im[52] = t6;
+    re[52] = t4;
+    im[62] = t9;
+    re[62] = t8;
+    t5 = im[0];
+    t0 = re[0];
+    t2 = im[18];
+    t3 = re[18];
+    t1 = im[36];
+    t7 = re[36];
+    t6 = im[54];
+    t4 = re[54];
+    t9 = im[72];
+    t8 = re[72];
+    t10 = t2 + t9;
+    t11 = t3 + t8;
+    t12 = t1 + t6;
+    t13 = t7 + t4;
+    t2 = t2 - t9;
+    t9 = t3 - t8;
+    t3 = t1 - t6;
+    t8 = t7 - t4;
+    t1 = t10 + t12;
+    t6 = t11 + t13;
+    t7 = t10 - t12;
+    t4 = C11 * t7;
+    t10 = t11 - t13;
+    t12 = C11 * t10;
+    t7 = C12 * t1;
+    t11 = t5 - t7;
+    t13 = C12 * t6;
+    t10 = t0 - t13;
+    t7 = t11 + t4;
+    t13 = t10 + t12;
+    t11 = t11 - t4;
+    t4 = t10 - t12;
+    t10 = C13 * t2;
+    t12 = C14 * t3;
+    t10 = t10 + t12;
+    t12 = C13 * t9;
+    t14 = C14 * t8;
+    t12 = t12 + t14;
+    t14 = C14 * t2;
+    t2 = C13 * t3;
+    t3 = t14 - t2;
+    t14 = C14 * t9;
+    t2 = C13 * t8;
+    t9 = t14 - t2;
+    t8 = t5 + t1;
+    t14 = t0 + t6;
+    t2 = t7 + t12;
+    t5 = t13 - t10;
+    t1 = t11 + t9;
+    t0 = t4 - t3;
+    t6 = t11 - t9;
+    t11 = t4 + t3;
+    t9 = t7 - t12;
+    t4 = t13 + t10;
+    im[0] = t8;
+    re[0] = t14;
+    im[18] = t2;
+    re[18] = t5;
+    im[36] = t1;
+    re[36] = t0;
+    im[54] = t6;
+    re[54] = t11;
+    im[72] = t9;
+    re[72] = t4;
+    t3 = im[30];
+    t7 = re[30];
+    t12 = im[48];
+    t13 = re[48];
+    t10 = im[66];
+    t8 = re[66];
+    t14 = im[84];
+    t2 = re[84];
+    t5 = im[12];
+    t1 = re[12];
+    t0 = t12 + t5;
+    t6 = t13 + t1;
+    t11 = t10 + t14;
+    t9 = t8 + t2;
+    t4 = t12 - t5;
+    t12 = t13 - t1;
+    t5 = t10 - t14;
+    t13 = t8 - t2;
+    t1 = t0 + t11;
+    t10 = t6 + t9;
+    t14 = t0 - t11;
+    t8 = C11 * t14;
+    t2 = t6 - t9;
+    t0 = C11 * t2;
+    t11 = C12 * t1;
+    t14 = t3 - t11;
+    t6 = C12 * t10;
+    t9 = t7 - t6;
+    t2 = t14 + t8;
+    t11 = t9 + t0;
+    t6 = t14 - t8;
+    t14 = t9 - t0;
+    t8 = C13 * t4;
+    t9 = C14 * t5;
+    t0 = t8 + t9;
+    t8 = C13 * t12;
+    t9 = C14 * t13;
+    t8 = t8 + t9;
+    t9 = C14 * t4;
+    t4 = C13 * t5;
+    t5 = t9 - t4;
+    t9 = C14 * t12;
+    t4 = C13 * t13;
+    t12 = t9 - t4;
+    t13 = t3 + t1;
+    t9 = t7 + t10;
+    t4 = t2 + t8;
+    t3 = t11 - t0;
+    t1 = t6 + t12;
+    t7 = t14 - t5;
+    t10 = t6 - t12;
+    t6 = t14 + t5;
+    t12 = t2 - t8;
+    t14 = t11 + t0;
+    im[30] = t13;
+    re[30] = t9;
+    im[48] = t4;
+    re[48] = t3;
+    im[66] = t1;
+    re[66] = t7;
+    im[84] = t10;
+    re[84] = t6;
+    im[12] = t12;
+    re[12] = t14;
+    t5 = im[60];
+    t2 = re[60];
+    t8 = im[78];
+    t11 = re[78];
+    t0 = im[6];
+    t13 = re[6];
+    t9 = im[24];
+    t4 = re[24];
+    t3 = im[42];
+    t1 = re[42];
+    t7 = t8 + t3;
+    t10 = t11 + t1;
+    t6 = t0 + t9;
+    t12 = t13 + t4;
+    t14 = t8 - t3;
+    t8 = t11 - t1;
+    t3 = t0 - t9;
+    t11 = t13 - t4;
+    t1 = t7 + t6;
+    t0 = t10 + t12;
+    t9 = t7 - t6;
+    t13 = C11 * t9;
+    t4 = t10 - t12;
+    t7 = C11 * t4;
+    t6 = C12 * t1;
+    t9 = t5 - t6;
+    t10 = C12 * t0;
+    t12 = t2 - t10;
+    t4 = t9 + t13;
+    t6 = t12 + t7;
+    t10 = t9 - t13;
+    t9 = t12 - t7;
+    t13 = C13 * t14;
+    t12 = C14 * t3;
+    t7 = t13 + t12;
+    t13 = C13 * t8;
+    t12 = C14 * t11;
+    t13 = t13 + t12;
+    t12 = C14 * t14;
+    t14 = C13 * t3;
+    t3 = t12 - t14;
+    t12 = C14 * t8;
+    t14 = C13 * t11;
+    t8 = t12 - t14;
+    t11 = t5 + t1;
+    t12 = t2 + t0;
+    t14 = t4 + t13;
+    t5 = t6 - t7;
+    t1 = t10 + t8;
+    t2 = t9 - t3;
+    t0 = t10 - t8;
+    t10 = t9 + t3;
+    t8 = t4 - t13;
+    t9 = t6 + t7;
+    im[60] = t11;
+    re[60] = t12;
+    im[78] = t14;
+    re[78] = t5;
+    im[6] = t1;
+    re[6] = t2;
+    im[24] = t0;
+    re[24] = t10;
+    im[42] = t8;
+    re[42] = t9;
+    t3 = im[10];
+    t4 = re[10];
+    t13 = im[28];
+    t6 = re[28];
+    t7 = im[46];
+    t11 = re[46];
+    t12 = im[64];
+    t14 = re[64];
+    t5 = im[82];
+    t1 = re[82];
+    t2 = t13 + t5;
+    t0 = t6 + t1;
+    t10 = t7 + t12;
+    t8 = t11 + t14;
+    t9 = t13 - t5;
+    t13 = t6 - t1;
+    t5 = t7 - t12;
+    t6 = t11 - t14;
+    t1 = t2 + t10;
+    t7 = t0 + t8;
+    t12 = t2 - t10;
+    t11 = C11 * t12;
+    t14 = t0 - t8;
+    t2 = C11 * t14;
+    t10 = C12 * t1;
+    t12 = t3 - t10;
+    t0 = C12 * t7;
+    t8 = t4 - t0;
+    t14 = t12 + t11;
+    t10 = t8 + t2;
+    t0 = t12 - t11;
+    t12 = t8 - t2;
+    t11 = C13 * t9;
+    t8 = C14 * t5;
+    t2 = t11 + t8;
+    t11 = C13 * t13;
+    t8 = C14 * t6;
+    t11 = t11 + t8;
+    t8 = C14 * t9;
+    t9 = C13 * t5;
+    t5 = t8 - t9;
+    t8 = C14 * t13;
+    t9 = C13 * t6;
+    t13 = t8 - t9;
+    t6 = t3 + t1;
+    t8 = t4 + t7;
+    t9 = t14 + t11;
+    t3 = t10 - t2;
+    t1 = t0 + t13;
+    t4 = t12 - t5;
+    t7 = t0 - t13;
+    t0 = t12 + t5;
+    t13 = t14 - t11;
+    t12 = t10 + t2;
+    im[10] = t6;
+    re[10] = t8;
+    im[28] = t9;
+    re[28] = t3;
+    im[46] = t1;
+    re[46] = t4;
+    im[64] = t7;
+    re[64] = t0;
+    im[82] = t13;
+    re[82] = t12;
+    t5 = im[40];
+    t14 = re[40];
+    t11 = im[58];
+    t10 = re[58];
+    t2 = im[76];
+    t6 = re[76];
+    t8 = im[4];
+    t9 = re[4];
+    t3 = im[22];
+    t1 = re[22];
+    t4 = t11 + t3;
+    t7 = t10 + t1;
+    t0 = t2 + t8;
+    t13 = t6 + t9;
+    t12 = t11 - t3;
+    t11 = t10 - t1;
+    t3 = t2 - t8;
+    t10 = t6 - t9;
+    t1 = t4 + t0;
+    t2 = t7 + t13;
+    t8 = t4 - t0;
+    t6 = C11 * t8;
+    t9 = t7 - t13;
+    t4 = C11 * t9;
+    t0 = C12 * t1;
+    t8 = t5 - t0;
+    t7 = C12 * t2;
+    t13 = t14 - t7;
+    t9 = t8 + t6;
+    t0 = t13 + t4;
+    t7 = t8 - t6;
+    t8 = t13 - t4;
+    t6 = C13 * t12;
+    t13 = C14 * t3;
+    t4 = t6 + t13;
+    t6 = C13 * t11;
+    t13 = C14 * t10;
+    t6 = t6 + t13;
+    t13 = C14 * t12;
+    t12 = C13 * t3;
+    t3 = t13 - t12;
+    t13 = C14 * t11;
+    t12 = C13 * t10;
+    t11 = t13 - t12;
+    t10 = t5 + t1;
+    t13 = t14 + t2;
+    t12 = t9 + t6;
+    t5 = t0 - t4;
+    t1 = t7 + t11;
+    t14 = t8 - t3;
+    t2 = t7 - t11;
+    t7 = t8 + t3;
+    t11 = t9 - t6;
+    t8 = t0 + t4;
+    im[40] = t10;
+    re[40] = t13;
+    im[58] = t12;
+    re[58] = t5;
+    im[76] = t1;
+    re[76] = t14;
+    im[4] = t2;
+    re[4] = t7;
+    im[22] = t11;
+    re[22] = t8;
+    t3 = im[70];
+    t9 = re[70];
+    t6 = im[88];
+    t0 = re[88];
+    t4 = im[16];
+    t10 = re[16];
+    t13 = im[34];
+    t12 = re[34];
+    t5 = im[52];
+    t1 = re[52];
+    t14 = t6 + t5;
+    t2 = t0 + t1;
+    t7 = t4 + t13;
+    t11 = t10 + t12;
+    t8 = t6 - t5;
+    t6 = t0 - t1;
+    t5 = t4 - t13;
+    t0 = t10 - t12;
+    t1 = t14 + t7;
+    t4 = t2 + t11;
+    t13 = t14 - t7;
+    t10 = C11 * t13;
+    t12 = t2 - t11;
+    t14 = C11 * t12;
+    t7 = C12 * t1;
+    t13 = t3 - t7;
+    t2 = C12 * t4;
+    t11 = t9 - t2;
+    t12 = t13 + t10;
+    t7 = t11 + t14;
+    t2 = t13 - t10;
+    t13 = t11 - t14;
+    t10 = C13 * t8;
+    t11 = C14 * t5;
+    t14 = t10 + t11;
+    t10 = C13 * t6;
+    t11 = C14 * t0;
+    t10 = t10 + t11;
+    t11 = C14 * t8;
+    t8 = C13 * t5;
+    t5 = t11 - t8;
+    t11 = C14 * t6;
+    t8 = C13 * t0;
+    t6 = t11 - t8;
+    t0 = t3 + t1;
+    t11 = t9 + t4;
+    t8 = t12 + t10;
+    t3 = t7 - t14;
+    t1 = t2 + t6;
+    t9 = t13 - t5;
+    t4 = t2 - t6;
+    t2 = t13 + t5;
+    t6 = t12 - t10;
+    t13 = t7 + t14;
+    im[70] = t0;
+    re[70] = t11;
+    im[88] = t8;
+    re[88] = t3;
+    im[16] = t1;
+    re[16] = t9;
+    im[34] = t4;
+    re[34] = t2;
+    im[52] = t6;
+    re[52] = t13;
+    t5 = im[20];
+    t12 = re[20];
+    t10 = im[38];
+    t7 = re[38];
+    t14 = im[56];
+    t0 = re[56];
+    t11 = im[74];
+    t8 = re[74];
+    t3 = im[2];
+    t1 = re[2];
+    t9 = t10 + t3;
+    t4 = t7 + t1;
+    t2 = t14 + t11;
+    t6 = t0 + t8;
+    t13 = t10 - t3;
+    t10 = t7 - t1;
+    t3 = t14 - t11;
+    t7 = t0 - t8;
+    t1 = t9 + t2;
+    t14 = t4 + t6;
+    t11 = t9 - t2;
+    t0 = C11 * t11;
+    t8 = t4 - t6;
+    t9 = C11 * t8;
+    t2 = C12 * t1;
+    t11 = t5 - t2;
+    t4 = C12 * t14;
+    t6 = t12 - t4;
+    t8 = t11 + t0;
+    t2 = t6 + t9;
+    t4 = t11 - t0;
+    t11 = t6 - t9;
+    t0 = C13 * t13;
+    t6 = C14 * t3;
+    t9 = t0 + t6;
+    t0 = C13 * t10;
+    t6 = C14 * t7;
+    t0 = t0 + t6;
+    t6 = C14 * t13;
+    t13 = C13 * t3;
+    t3 = t6 - t13;
+    t6 = C14 * t10;
+    t13 = C13 * t7;
+    t10 = t6 - t13;
+    t7 = t5 + t1;
+    t6 = t12 + t14;
+    t13 = t8 + t0;
+    t5 = t2 - t9;
+    t1 = t4 + t10;
+    t12 = t11 - t3;
+    t14 = t4 - t10;
+    t4 = t11 + t3;
+    t10 = t8 - t0;
+    t11 = t2 + t9;
+    im[20] = t7;
+    re[20] = t6;
+    im[38] = t13;
+    re[38] = t5;
+    im[56] = t1;
+    re[56] = t12;
+    im[74] = t14;
+    re[74] = t4;
+    im[2] = t10;
+    re[2] = t11;
+    t3 = im[50];
+    t8 = re[50];
+    t0 = im[68];
+    t2 = re[68];
+    t9 = im[86];
+    t7 = re[86];
+    t6 = im[14];
+    t13 = re[14];
+    t5 = im[32];
+    t1 = re[32];
+    t12 = t0 + t5;
+    t14 = t2 + t1;
+    t4 = t9 + t6;
+    t10 = t7 + t13;
+    t11 = t0 - t5;
+    t0 = t2 - t1;
+    t5 = t9 - t6;
+    t2 = t7 - t13;
+    t1 = t12 + t4;
+    t9 = t14 + t10;
+    t6 = t12 - t4;
+    t7 = C11 * t6;
+    t13 = t14 - t10;
+    t12 = C11 * t13;
+    t4 = C12 * t1;
+    t6 = t3 - t4;
+    t14 = C12 * t9;
+    t10 = t8 - t14;
+    t13 = t6 + t7;
+    t4 = t10 + t12;
+    t14 = t6 - t7;
+    t6 = t10 - t12;
+    t7 = C13 * t11;
+    t10 = C14 * t5;
+    t12 = t7 + t10;
+    t7 = C13 * t0;
+    t10 = C14 * t2;
+    t7 = t7 + t10;
+    t10 = C14 * t11;
+    t11 = C13 * t5;
+    t5 = t10 - t11;
+    t10 = C14 * t0;
+    t11 = C13 * t2;
+    t0 = t10 - t11;
+    t2 = t3 + t1;
+    t10 = t8 + t9;
+    t11 = t13 + t7;
+    t3 = t4 - t12;
+    t1 = t14 + t0;
+    t8 = t6 - t5;
+    t9 = t14 - t0;
+    t14 = t6 + t5;
+    t0 = t13 - t7;
+    t6 = t4 + t12;
+    im[50] = t2;
+    re[50] = t10;
+    im[68] = t11;
+    re[68] = t3;
+    im[86] = t1;
+    re[86] = t8;
+    im[14] = t9;
+    re[14] = t14;
+    im[32] = t0;
+    re[32] = t6;
+    t5 = im[80];
+    t13 = re[80];
+    t7 = im[8];
+    t4 = re[8];
+    t12 = im[26];
+    t2 = re[26];
+    t10 = im[44];
+    t11 = re[44];
+    t3 = im[62];
+    t1 = re[62];
+    t8 = t7 + t3;
+    t9 = t4 + t1;
+    t14 = t12 + t10;
+    t0 = t2 + t11;
+    t6 = t7 - t3;
+    t7 = t4 - t1;
+    t3 = t12 - t10;
+    t4 = t2 - t11;
+    t1 = t8 + t14;
+    t12 = t9 + t0;
+    t10 = t8 - t14;
+    t2 = C11 * t10;
+    t11 = t9 - t0;
+    t8 = C11 * t11;
+    t14 = C12 * t1;
+    t10 = t5 - t14;
+    t9 = C12 * t12;
+    t0 = t13 - t9;
+    t11 = t10 + t2;
+    t14 = t0 + t8;
+    t9 = t10 - t2;
+    t10 = t0 - t8;
+    t2 = C13 * t6;
+    t0 = C14 * t3;
+    t8 = t2 + t0;
+    t2 = C13 * t7;
+    t0 = C14 * t4;
+    t2 = t2 + t0;
+    t0 = C14 * t6;
+    t6 = C13 * t3;
+    t3 = t0 - t6;
+    t0 = C14 * t7;
+    t6 = C13 * t4;
+    t7 = t0 - t6;
+    t4 = t5 + t1;
+    t0 = t13 + t12;
+    t6 = t11 + t2;
+    t5 = t14 - t8;
+    t1 = t9 + t7;
+    t13 = t10 - t3;
+    t12 = t9 - t7;
+    t9 = t10 + t3;
+    t7 = t11 - t2;
+    t10 = t14 + t8;
+    im[80] = t4;
+    re[80] = t0;
+    im[8] = t6;
+    re[8] = t5;
+    im[26] = t1;
+    re[26] = t13;
+    im[44] = t12;
+    re[44] = t9;
+    im[62] = t7;
+    re[62] = t10;
+}
+
+/**
+ *  Part 3 of ApplyMixedRadixIRFFT_180().
+ * 
+ *  @param {Number[]} re 
+ *    - The real part of each input point.
+ *  @param {Number[]} im 
+ *    - The imaginary part of each input point.
+ *  @param {Number[]} x 
+ *    - The real output points.
+ */
+function ApplyMixedRadixIRFFT_180_Part3(re, im, x) {
+    let t0, t1, t10, t11, t12, t13, t14, t2, t3, t4, t5, t6, t7, t8, t9;
+    const C0 = 0.5;
+    const C1 = 0.8660254037844386;
+    const C2 = 0.766044443118978;
+    const C3 = 1.4088320528055172;
+    const C4 = 0.12325683343243876;
+    const C5 = 0.17364817766693033;
+    const C6 = 1.1584559306791384;
+    const C7 = 0.8111595753452777;
+    const C8 = 0.9396926207859084;
+    const C9 = 0.5976724774602398;
+    const C10 = 1.281712764111577;
+    const C11 = 0.5590169943749475;
+    const C12 = 0.25;
+    const C13 = 0.9510565162951535;
+    const C14 = 0.5877852522924731;
+    t3 = im[45];
+    t11 = re[45];
+    t2 = im[75];
+    t14 = re[75];
+    t8 = im[15];
+    t4 = re[15];
+    t0 = t2 + t8;
+    t6 = t14 + t4;
+    t5 = C0 * t0;
+    t1 = t3 - t5;
+    t13 = C0 * t6;
+    t12 = t11 - t13;
+    t9 = t2 - t8;
+    t7 = C1 * t9;
+    t10 = t14 - t4;
+    t5 = C1 * t10;
+    t13 = t3 + t0;
+    t2 = t11 + t6;
+    t8 = t1 + t5;
+    t9 = t12 - t7;
+    t14 = t1 - t5;
+    t4 = t12 + t7;
+    im[45] = t13;
+    re[45] = t2;
+    im[75] = t8;
+    re[75] = t9;
+    im[15] = t14;
+    re[15] = t4;
+    t10 = im[55];
+    t3 = re[55];
+    t0 = im[85];
+    t11 = re[85];
+    t6 = im[25];
+    t1 = re[25];
+    t5 = t0 + t6;
+    t12 = t11 + t1;
+    t7 = C0 * t5;
+    t13 = t10 - t7;
+    t2 = C0 * t12;
+    t8 = t3 - t2;
+    t9 = t0 - t6;
+    t14 = C1 * t9;
+    t4 = t11 - t1;
+    t7 = C1 * t4;
+    t2 = t10 + t5;
+    t0 = t3 + t12;
+    t6 = t13 + t7;
+    t9 = t8 - t14;
+    t11 = t13 - t7;
+    t1 = t8 + t14;
+    t4 = t6 + t9;
+    t10 = C2 * t4;
+    t5 = t6 * (-C3);
+    t3 = t9 * C4;
+    t12 = t10 - t3;
+    t13 = t10 + t5;
+    t7 = t11 + t1;
+    t8 = C5 * t7;
+    t14 = t11 * (-C6);
+    t4 = t1 * (-C7);
+    t6 = t8 - t4;
+    t9 = t8 + t14;
+    im[55] = t2;
+    re[55] = t0;
+    im[85] = t12;
+    re[85] = t13;
+    im[25] = t6;
+    re[25] = t9;
+    t3 = im[65];
+    t10 = re[65];
+    t5 = im[5];
+    t7 = re[5];
+    t11 = im[35];
+    t1 = re[35];
+    t4 = t5 + t11;
+    t8 = t7 + t1;
+    t14 = C0 * t4;
+    t2 = t3 - t14;
+    t0 = C0 * t8;
+    t12 = t10 - t0;
+    t13 = t5 - t11;
+    t6 = C1 * t13;
+    t9 = t7 - t1;
+    t14 = C1 * t9;
+    t0 = t3 + t4;
+    t5 = t10 + t8;
+    t11 = t2 + t14;
+    t13 = t12 - t6;
+    t7 = t2 - t14;
+    t1 = t12 + t6;
+    t9 = t11 + t13;
+    t3 = C5 * t9;
+    t4 = t11 * (-C6);
+    t10 = t13 * (-C7);
+    t8 = t3 - t10;
+    t2 = t3 + t4;
+    t14 = t7 + t1;
+    t12 = (-C8) * t14;
+    t6 = t7 * C9;
+    t9 = t1 * (-C10);
+    t11 = t12 - t9;
+    t13 = t12 + t6;
+    im[65] = t0;
+    re[65] = t5;
+    im[5] = t8;
+    re[5] = t2;
+    im[35] = t11;
+    re[35] = t13;
+    t10 = im[45];
+    t3 = re[45];
+    t4 = im[55];
+    t14 = re[55];
+    t7 = im[65];
+    t1 = re[65];
+    t9 = t4 + t7;
+    t12 = t14 + t1;
+    t6 = C0 * t9;
+    t0 = t10 - t6;
+    t5 = C0 * t12;
+    t8 = t3 - t5;
+    t2 = t4 - t7;
+    t11 = C1 * t2;
+    t13 = t14 - t1;
+    t6 = C1 * t13;
+    t5 = t10 + t9;
+    t4 = t3 + t12;
+    t7 = t0 + t6;
+    t2 = t8 - t11;
+    t14 = t0 - t6;
+    t1 = t8 + t11;
+    im[45] = t5;
+    re[45] = t4;
+    im[55] = t7;
+    re[55] = t2;
+    im[65] = t14;
+    re[65] = t1;
+    t13 = im[75];
+    t10 = re[75];
+    t9 = im[85];
+    t3 = re[85];
+    t12 = im[5];
+    t0 = re[5];
+    t6 = t9 + t12;
+    t8 = t3 + t0;
+    t11 = C0 * t6;
+    t5 = t13 - t11;
+    t4 = C0 * t8;
+    t7 = t10 - t4;
+    t2 = t9 - t12;
+    t14 = C1 * t2;
+    t1 = t3 - t0;
+    t11 = C1 * t1;
+    t4 = t13 + t6;
+    t9 = t10 + t8;
+    t12 = t5 + t11;
+    t2 = t7 - t14;
+    t3 = t5 - t11;
+    t0 = t7 + t14;
+    im[75] = t4;
+    re[75] = t9;
+    im[85] = t12;
+    re[85] = t2;
+    im[5] = t3;
+    re[5] = t0;
+    t1 = im[15];
+    t13 = re[15];
+    t6 = im[25];
+    t10 = re[25];
+    t8 = im[35];
+    t5 = re[35];
+    t11 = t6 + t8;
+    t7 = t10 + t5;
+    t14 = C0 * t11;
+    t4 = t1 - t14;
+    t9 = C0 * t7;
+    t12 = t13 - t9;
+    t2 = t6 - t8;
+    t3 = C1 * t2;
+    t0 = t10 - t5;
+    t14 = C1 * t0;
+    t9 = t1 + t11;
+    t6 = t13 + t7;
+    t8 = t4 + t14;
+    t2 = t12 - t3;
+    t10 = t4 - t14;
+    t5 = t12 + t3;
+    im[15] = t9;
+    re[15] = t6;
+    im[25] = t8;
+    re[25] = t2;
+    im[35] = t10;
+    re[35] = t5;
+    t0 = im[63];
+    t1 = re[63];
+    t11 = im[3];
+    t13 = re[3];
+    t7 = im[33];
+    t4 = re[33];
+    t14 = t11 + t7;
+    t12 = t13 + t4;
+    t3 = C0 * t14;
+    t9 = t0 - t3;
+    t6 = C0 * t12;
+    t8 = t1 - t6;
+    t2 = t11 - t7;
+    t10 = C1 * t2;
+    t5 = t13 - t4;
+    t3 = C1 * t5;
+    t6 = t0 + t14;
+    t11 = t1 + t12;
+    t7 = t9 + t3;
+    t2 = t8 - t10;
+    t13 = t9 - t3;
+    t4 = t8 + t10;
+    im[63] = t6;
+    re[63] = t11;
+    im[3] = t7;
+    re[3] = t2;
+    im[33] = t13;
+    re[33] = t4;
+    t5 = im[73];
+    t0 = re[73];
+    t14 = im[13];
+    t1 = re[13];
+    t12 = im[43];
+    t9 = re[43];
+    t3 = t14 + t12;
+    t8 = t1 + t9;
+    t10 = C0 * t3;
+    t6 = t5 - t10;
+    t11 = C0 * t8;
+    t7 = t0 - t11;
+    t2 = t14 - t12;
+    t13 = C1 * t2;
+    t4 = t1 - t9;
+    t10 = C1 * t4;
+    t11 = t5 + t3;
+    t14 = t0 + t8;
+    t12 = t6 + t10;
+    t2 = t7 - t13;
+    t1 = t6 - t10;
+    t9 = t7 + t13;
+    t4 = t12 + t2;
+    t5 = C2 * t4;
+    t3 = t12 * (-C3);
+    t0 = t2 * C4;
+    t8 = t5 - t0;
+    t6 = t5 + t3;
+    t10 = t1 + t9;
+    t7 = C5 * t10;
+    t13 = t1 * (-C6);
+    t4 = t9 * (-C7);
+    t12 = t7 - t4;
+    t2 = t7 + t13;
+    im[73] = t11;
+    re[73] = t14;
+    im[13] = t8;
+    re[13] = t6;
+    im[43] = t12;
+    re[43] = t2;
+    t0 = im[83];
+    t5 = re[83];
+    t3 = im[23];
+    t10 = re[23];
+    t1 = im[53];
+    t9 = re[53];
+    t4 = t3 + t1;
+    t7 = t10 + t9;
+    t13 = C0 * t4;
+    t11 = t0 - t13;
+    t14 = C0 * t7;
+    t8 = t5 - t14;
+    t6 = t3 - t1;
+    t12 = C1 * t6;
+    t2 = t10 - t9;
+    t13 = C1 * t2;
+    t14 = t0 + t4;
+    t3 = t5 + t7;
+    t1 = t11 + t13;
+    t6 = t8 - t12;
+    t10 = t11 - t13;
+    t9 = t8 + t12;
+    t2 = t1 + t6;
+    t0 = C5 * t2;
+    t4 = t1 * (-C6);
+    t5 = t6 * (-C7);
+    t7 = t0 - t5;
+    t11 = t0 + t4;
+    t13 = t10 + t9;
+    t8 = (-C8) * t13;
+    t12 = t10 * C9;
+    t2 = t9 * (-C10);
+    t1 = t8 - t2;
+    t6 = t8 + t12;
+    im[83] = t14;
+    re[83] = t3;
+    im[23] = t7;
+    re[23] = t11;
+    im[53] = t1;
+    re[53] = t6;
+    t5 = im[63];
+    t0 = re[63];
+    t4 = im[73];
+    t13 = re[73];
+    t10 = im[83];
+    t9 = re[83];
+    t2 = t4 + t10;
+    t8 = t13 + t9;
+    t12 = C0 * t2;
+    t14 = t5 - t12;
+    t3 = C0 * t8;
+    t7 = t0 - t3;
+    t11 = t4 - t10;
+    t1 = C1 * t11;
+    t6 = t13 - t9;
+    t12 = C1 * t6;
+    t3 = t5 + t2;
+    t4 = t0 + t8;
+    t10 = t14 + t12;
+    t11 = t7 - t1;
+    t13 = t14 - t12;
+    t9 = t7 + t1;
+    im[63] = t3;
+    re[63] = t4;
+    im[73] = t10;
+    re[73] = t11;
+    im[83] = t13;
+    re[83] = t9;
+    t6 = im[3];
+    t5 = re[3];
+    t2 = im[13];
+    t0 = re[13];
+    t8 = im[23];
+    t14 = re[23];
+    t12 = t2 + t8;
+    t7 = t0 + t14;
+    t1 = C0 * t12;
+    t3 = t6 - t1;
+    t4 = C0 * t7;
+    t10 = t5 - t4;
+    t11 = t2 - t8;
+    t13 = C1 * t11;
+    t9 = t0 - t14;
+    t1 = C1 * t9;
+    t4 = t6 + t12;
+    t2 = t5 + t7;
+    t8 = t3 + t1;
+    t11 = t10 - t13;
+    t0 = t3 - t1;
+    t14 = t10 + t13;
+    im[3] = t4;
+    re[3] = t2;
+    im[13] = t8;
+    re[13] = t11;
+    im[23] = t0;
+    re[23] = t14;
+    t9 = im[33];
+    t6 = re[33];
+    t12 = im[43];
+    t5 = re[43];
+    t7 = im[53];
+    t3 = re[53];
+    t1 = t12 + t7;
+    t10 = t5 + t3;
+    t13 = C0 * t1;
+    t4 = t9 - t13;
+    t2 = C0 * t10;
+    t8 = t6 - t2;
+    t11 = t12 - t7;
+    t0 = C1 * t11;
+    t14 = t5 - t3;
+    t13 = C1 * t14;
+    t2 = t9 + t1;
+    t12 = t6 + t10;
+    t7 = t4 + t13;
+    t11 = t8 - t0;
+    t5 = t4 - t13;
+    t3 = t8 + t0;
+    im[33] = t2;
+    re[33] = t12;
+    im[43] = t7;
+    re[43] = t11;
+    im[53] = t5;
+    re[53] = t3;
+    t14 = im[81];
+    t9 = re[81];
+    t1 = im[21];
+    t6 = re[21];
+    t10 = im[51];
+    t4 = re[51];
+    t13 = t1 + t10;
+    t8 = t6 + t4;
+    t0 = C0 * t13;
+    t2 = t14 - t0;
+    t12 = C0 * t8;
+    t7 = t9 - t12;
+    t11 = t1 - t10;
+    t5 = C1 * t11;
+    t3 = t6 - t4;
+    t0 = C1 * t3;
+    t12 = t14 + t13;
+    t1 = t9 + t8;
+    t10 = t2 + t0;
+    t11 = t7 - t5;
+    t6 = t2 - t0;
+    t4 = t7 + t5;
+    im[81] = t12;
+    re[81] = t1;
+    im[21] = t10;
+    re[21] = t11;
+    im[51] = t6;
+    re[51] = t4;
+    t3 = im[1];
+    t14 = re[1];
+    t13 = im[31];
+    t9 = re[31];
+    t8 = im[61];
+    t2 = re[61];
+    t0 = t13 + t8;
+    t7 = t9 + t2;
+    t5 = C0 * t0;
+    t12 = t3 - t5;
+    t1 = C0 * t7;
+    t10 = t14 - t1;
+    t11 = t13 - t8;
+    t6 = C1 * t11;
+    t4 = t9 - t2;
+    t5 = C1 * t4;
+    t1 = t3 + t0;
+    t13 = t14 + t7;
+    t8 = t12 + t5;
+    t11 = t10 - t6;
+    t9 = t12 - t5;
+    t2 = t10 + t6;
+    t4 = t8 + t11;
+    t3 = C2 * t4;
+    t0 = t8 * (-C3);
+    t14 = t11 * C4;
+    t7 = t3 - t14;
+    t12 = t3 + t0;
+    t5 = t9 + t2;
+    t10 = C5 * t5;
+    t6 = t9 * (-C6);
+    t4 = t2 * (-C7);
+    t8 = t10 - t4;
+    t11 = t10 + t6;
+    im[1] = t1;
+    re[1] = t13;
+    im[31] = t7;
+    re[31] = t12;
+    im[61] = t8;
+    re[61] = t11;
+    t14 = im[11];
+    t3 = re[11];
+    t0 = im[41];
+    t5 = re[41];
+    t9 = im[71];
+    t2 = re[71];
+    t4 = t0 + t9;
+    t10 = t5 + t2;
+    t6 = C0 * t4;
+    t1 = t14 - t6;
+    t13 = C0 * t10;
+    t7 = t3 - t13;
+    t12 = t0 - t9;
+    t8 = C1 * t12;
+    t11 = t5 - t2;
+    t6 = C1 * t11;
+    t13 = t14 + t4;
+    t0 = t3 + t10;
+    t9 = t1 + t6;
+    t12 = t7 - t8;
+    t5 = t1 - t6;
+    t2 = t7 + t8;
+    t11 = t9 + t12;
+    t14 = C5 * t11;
+    t4 = t9 * (-C6);
+    t3 = t12 * (-C7);
+    t10 = t14 - t3;
+    t1 = t14 + t4;
+    t6 = t5 + t2;
+    t7 = (-C8) * t6;
+    t8 = t5 * C9;
+    t11 = t2 * (-C10);
+    t9 = t7 - t11;
+    t12 = t7 + t8;
+    im[11] = t13;
+    re[11] = t0;
+    im[41] = t10;
+    re[41] = t1;
+    im[71] = t9;
+    re[71] = t12;
+    t3 = im[81];
+    t14 = re[81];
+    t4 = im[1];
+    t6 = re[1];
+    t5 = im[11];
+    t2 = re[11];
+    t11 = t4 + t5;
+    t7 = t6 + t2;
+    t8 = C0 * t11;
+    t13 = t3 - t8;
+    t0 = C0 * t7;
+    t10 = t14 - t0;
+    t1 = t4 - t5;
+    t9 = C1 * t1;
+    t12 = t6 - t2;
+    t8 = C1 * t12;
+    t0 = t3 + t11;
+    t4 = t14 + t7;
+    t5 = t13 + t8;
+    t1 = t10 - t9;
+    t6 = t13 - t8;
+    t2 = t10 + t9;
+    im[81] = t0;
+    re[81] = t4;
+    im[1] = t5;
+    re[1] = t1;
+    im[11] = t6;
+    re[11] = t2;
+    t12 = im[21];
+    t3 = re[21];
+    t11 = im[31];
+    t14 = re[31];
+    t7 = im[41];
+    t13 = re[41];
+    t8 = t11 + t7;
+    t10 = t14 + t13;
+    t9 = C0 * t8;
+    t0 = t12 - t9;
+    t4 = C0 * t10;
+    t5 = t3 - t4;
+    t1 = t11 - t7;
+    t6 = C1 * t1;
+    t2 = t14 - t13;
+    t9 = C1 * t2;
+    t4 = t12 + t8;
+    t11 = t3 + t10;
+    t7 = t0 + t9;
+    t1 = t5 - t6;
+    t14 = t0 - t9;
+    t13 = t5 + t6;
+    im[21] = t4;
+    re[21] = t11;
+    im[31] = t7;
+    re[31] = t1;
+    im[41] = t14;
+    re[41] = t13;
+    t2 = im[51];
+    t12 = re[51];
+    t8 = im[61];
+    t3 = re[61];
+    t10 = im[71];
+    t0 = re[71];
+    t9 = t8 + t10;
+    t5 = t3 + t0;
+    t6 = C0 * t9;
+    t4 = t2 - t6;
+    t11 = C0 * t5;
+    t7 = t12 - t11;
+    t1 = t8 - t10;
+    t14 = C1 * t1;
+    t13 = t3 - t0;
+    t6 = C1 * t13;
+    t11 = t2 + t9;
+    t8 = t12 + t5;
+    t10 = t4 + t6;
+    t1 = t7 - t14;
+    t3 = t4 - t6;
+    t0 = t7 + t14;
+    im[51] = t11;
+    re[51] = t8;
+    im[61] = t10;
+    re[61] = t1;
+    im[71] = t3;
+    re[71] = t0;
+    t13 = im[9];
+    t2 = re[9];
+    t9 = im[39];
+    t12 = re[39];
+    t5 = im[69];
+    t4 = re[69];
+    t6 = t9 + t5;
+    t7 = t12 + t4;
+    t14 = C0 * t6;
+    t11 = t13 - t14;
+    t8 = C0 * t7;
+    t10 = t2 - t8;
+    t1 = t9 - t5;
+    t3 = C1 * t1;
+    t0 = t12 - t4;
+    t14 = C1 * t0;
+    t8 = t13 + t6;
+    t9 = t2 + t7;
+    t5 = t11 + t14;
+    t1 = t10 - t3;
+    t12 = t11 - t14;
+    t4 = t10 + t3;
+    im[9] = t8;
+    re[9] = t9;
+    im[39] = t5;
+    re[39] = t1;
+    im[69] = t12;
+    re[69] = t4;
+    t0 = im[19];
+    t13 = re[19];
+    t6 = im[49];
+    t2 = re[49];
+    t7 = im[79];
+    t11 = re[79];
+    t14 = t6 + t7;
+    t10 = t2 + t11;
+    t3 = C0 * t14;
+    t8 = t0 - t3;
+    t9 = C0 * t10;
+    t5 = t13 - t9;
+    t1 = t6 - t7;
+    t12 = C1 * t1;
+    t4 = t2 - t11;
+    t3 = C1 * t4;
+    t9 = t0 + t14;
+    t6 = t13 + t10;
+    t7 = t8 + t3;
+    t1 = t5 - t12;
+    t2 = t8 - t3;
+    t11 = t5 + t12;
+    t4 = t7 + t1;
+    t0 = C2 * t4;
+    t14 = t7 * (-C3);
+    t13 = t1 * C4;
+    t10 = t0 - t13;
+    t8 = t0 + t14;
+    t3 = t2 + t11;
+    t5 = C5 * t3;
+    t12 = t2 * (-C6);
+    t4 = t11 * (-C7);
+    t7 = t5 - t4;
+    t1 = t5 + t12;
+    im[19] = t9;
+    re[19] = t6;
+    im[49] = t10;
+    re[49] = t8;
+    im[79] = t7;
+    re[79] = t1;
+    t13 = im[29];
+    t0 = re[29];
+    t14 = im[59];
+    t3 = re[59];
+    t2 = im[89];
+    t11 = re[89];
+    t4 = t14 + t2;
+    t5 = t3 + t11;
+    t12 = C0 * t4;
+    t9 = t13 - t12;
+    t6 = C0 * t5;
+    t10 = t0 - t6;
+    t8 = t14 - t2;
+    t7 = C1 * t8;
+    t1 = t3 - t11;
+    t12 = C1 * t1;
+    t6 = t13 + t4;
+    t14 = t0 + t5;
+    t2 = t9 + t12;
+    t8 = t10 - t7;
+    t3 = t9 - t12;
+    t11 = t10 + t7;
+    t1 = t2 + t8;
+    t13 = C5 * t1;
+    t4 = t2 * (-C6);
+    t0 = t8 * (-C7);
+    t5 = t13 - t0;
+    t9 = t13 + t4;
+    t12 = t3 + t11;
+    t10 = (-C8) * t12;
+    t7 = t3 * C9;
+    t1 = t11 * (-C10);
+    t2 = t10 - t1;
+    t8 = t10 + t7;
+    im[29] = t6;
+    re[29] = t14;
+    im[59] = t5;
+    re[59] = t9;
+    im[89] = t2;
+    re[89] = t8;
+    t0 = im[9];
+    t13 = re[9];
+    t4 = im[19];
+    t12 = re[19];
+    t3 = im[29];
+    t11 = re[29];
+    t1 = t4 + t3;
+    t10 = t12 + t11;
+    t7 = C0 * t1;
+    t6 = t0 - t7;
+    t14 = C0 * t10;
+    t5 = t13 - t14;
+    t9 = t4 - t3;
+    t2 = C1 * t9;
+    t8 = t12 - t11;
+    t7 = C1 * t8;
+    t14 = t0 + t1;
+    t4 = t13 + t10;
+    t3 = t6 + t7;
+    t9 = t5 - t2;
+    t12 = t6 - t7;
+    t11 = t5 + t2;
+    im[9] = t14;
+    re[9] = t4;
+    im[19] = t3;
+    re[19] = t9;
+    im[29] = t12;
+    re[29] = t11;
+    t8 = im[39];
+    t0 = re[39];
+    t1 = im[49];
+    t13 = re[49];
+    t10 = im[59];
+    t6 = re[59];
+    t7 = t1 + t10;
+    t5 = t13 + t6;
+    t2 = C0 * t7;
+    t14 = t8 - t2;
+    t4 = C0 * t5;
+    t3 = t0 - t4;
+    t9 = t1 - t10;
+    t12 = C1 * t9;
+    t11 = t13 - t6;
+    t2 = C1 * t11;
+    t4 = t8 + t7;
+    t1 = t0 + t5;
+    t10 = t14 + t2;
+    t9 = t3 - t12;
+    t13 = t14 - t2;
+    t6 = t3 + t12;
+    im[39] = t4;
+    re[39] = t1;
+    im[49] = t10;
+    re[49] = t9;
+    im[59] = t13;
+    re[59] = t6;
+    t11 = im[69];
+    t8 = re[69];
+    t7 = im[79];
+    t0 = re[79];
+    t5 = im[89];
+    t14 = re[89];
+    t2 = t7 + t5;
+    t3 = t0 + t14;
+    t12 = C0 * t2;
+    t4 = t11 - t12;
+    t1 = C0 * t3;
+    t10 = t8 - t1;
+    t9 = t7 - t5;
+    t13 = C1 * t9;
+    t6 = t0 - t14;
+    t12 = C1 * t6;
+    t1 = t11 + t2;
+    t7 = t8 + t3;
+    t5 = t4 + t12;
+    t9 = t10 - t13;
+    t0 = t4 - t12;
+    t14 = t10 + t13;
+    im[69] = t1;
+    re[69] = t7;
+    im[79] = t5;
+    re[79] = t9;
+    im[89] = t0;
+    re[89] = t14;
+    t6 = im[27];
+    t11 = re[27];
+    t2 = im[57];
+    t8 = re[57];
+    t3 = im[87];
+    t4 = re[87];
+    t12 = t2 + t3;
+    t10 = t8 + t4;
+    t13 = C0 * t12;
+    t1 = t6 - t13;
+    t7 = C0 * t10;
+    t5 = t11 - t7;
+    t9 = t2 - t3;
+    t0 = C1 * t9;
+    t14 = t8 - t4;
+    t13 = C1 * t14;
+    t7 = t6 + t12;
+    t2 = t11 + t10;
+    t3 = t1 + t13;
+    t9 = t5 - t0;
+    t8 = t1 - t13;
+    t4 = t5 + t0;
+    im[27] = t7;
+    re[27] = t2;
+    im[57] = t3;
+    re[57] = t9;
+    im[87] = t8;
+    re[87] = t4;
+    t14 = im[37];
+    t6 = re[37];
+    t12 = im[67];
+    t11 = re[67];
+    t10 = im[7];
+    t1 = re[7];
+    t13 = t12 + t10;
+    t5 = t11 + t1;
+    t0 = C0 * t13;
+    t7 = t14 - t0;
+    t2 = C0 * t5;
+    t3 = t6 - t2;
+    t9 = t12 - t10;
+    t8 = C1 * t9;
+    t4 = t11 - t1;
+    t0 = C1 * t4;
+    t2 = t14 + t13;
+    t12 = t6 + t5;
+    t10 = t7 + t0;
+    t9 = t3 - t8;
+    t11 = t7 - t0;
+    t1 = t3 + t8;
+    t4 = t10 + t9;
+    t14 = C2 * t4;
+    t13 = t10 * (-C3);
+    t6 = t9 * C4;
+    t5 = t14 - t6;
+    t7 = t14 + t13;
+    t0 = t11 + t1;
+    t3 = C5 * t0;
+    t8 = t11 * (-C6);
+    t4 = t1 * (-C7);
+    t10 = t3 - t4;
+    t9 = t3 + t8;
+    im[37] = t2;
+    re[37] = t12;
+    im[67] = t5;
+    re[67] = t7;
+    im[7] = t10;
+    re[7] = t9;
+    t6 = im[47];
+    t14 = re[47];
+    t13 = im[77];
+    t0 = re[77];
+    t11 = im[17];
+    t1 = re[17];
+    t4 = t13 + t11;
+    t3 = t0 + t1;
+    t8 = C0 * t4;
+    t2 = t6 - t8;
+    t12 = C0 * t3;
+    t5 = t14 - t12;
+    t7 = t13 - t11;
+    t10 = C1 * t7;
+    t9 = t0 - t1;
+    t8 = C1 * t9;
+    t12 = t6 + t4;
+    t13 = t14 + t3;
+    t11 = t2 + t8;
+    t7 = t5 - t10;
+    t0 = t2 - t8;
+    t1 = t5 + t10;
+    t9 = t11 + t7;
+    t6 = C5 * t9;
+    t4 = t11 * (-C6);
+    t14 = t7 * (-C7);
+    t3 = t6 - t14;
+    t2 = t6 + t4;
+    t8 = t0 + t1;
+    t5 = (-C8) * t8;
+    t10 = t0 * C9;
+    t9 = t1 * (-C10);
+    t11 = t5 - t9;
+    t7 = t5 + t10;
+    im[47] = t12;
+    re[47] = t13;
+    im[77] = t3;
+    re[77] = t2;
+    im[17] = t11;
+    re[17] = t7;
+    t14 = im[27];
+    t6 = re[27];
+    t4 = im[37];
+    t8 = re[37];
+    t0 = im[47];
+    t1 = re[47];
+    t9 = t4 + t0;
+    t5 = t8 + t1;
+    t10 = C0 * t9;
+    t12 = t14 - t10;
+    t13 = C0 * t5;
+    t3 = t6 - t13;
+    t2 = t4 - t0;
+    t11 = C1 * t2;
+    t7 = t8 - t1;
+    t10 = C1 * t7;
+    t13 = t14 + t9;
+    t4 = t6 + t5;
+    t0 = t12 + t10;
+    t2 = t3 - t11;
+    t8 = t12 - t10;
+    t1 = t3 + t11;
+    im[27] = t13;
+    re[27] = t4;
+    im[37] = t0;
+    re[37] = t2;
+    im[47] = t8;
+    re[47] = t1;
+    t7 = im[57];
+    t14 = re[57];
+    t9 = im[67];
+    t6 = re[67];
+    t5 = im[77];
+    t12 = re[77];
+    t10 = t9 + t5;
+    t3 = t6 + t12;
+    t11 = C0 * t10;
+    t13 = t7 - t11;
+    t4 = C0 * t3;
+    t0 = t14 - t4;
+    t2 = t9 - t5;
+    t8 = C1 * t2;
+    t1 = t6 - t12;
+    t11 = C1 * t1;
+    t4 = t7 + t10;
+    t9 = t14 + t3;
+    t5 = t13 + t11;
+    t2 = t0 - t8;
+    t6 = t13 - t11;
+    t12 = t0 + t8;
+    im[57] = t4;
+    re[57] = t9;
+    im[67] = t5;
+    re[67] = t2;
+    im[77] = t6;
+    re[77] = t12;
+    t1 = im[87];
+    t7 = re[87];
+    t10 = im[7];
+    t14 = re[7];
+    t3 = im[17];
+    t13 = re[17];
+    t11 = t10 + t3;
+    t0 = t14 + t13;
+    t8 = C0 * t11;
+    t4 = t1 - t8;
+    t9 = C0 * t0;
+    t5 = t7 - t9;
+    t2 = t10 - t3;
+    t6 = C1 * t2;
+    t12 = t14 - t13;
+    t8 = C1 * t12;
+    t9 = t1 + t11;
+    t10 = t7 + t0;
+    t3 = t4 + t8;
+    t2 = t5 - t6;
+    t14 = t4 - t8;
+    t13 = t5 + t6;
+    im[87] = t9;
+    re[87] = t10;
+    im[7] = t3;
+    re[7] = t2;
+    im[17] = t14;
+    re[17] = t13;
+    t12 = im[45];
+    t1 = re[45];
+    t11 = im[63];
+    t7 = re[63];
+    t0 = im[81];
+    t4 = re[81];
+    t8 = im[9];
+    t5 = re[9];
+    t6 = im[27];
+    t9 = re[27];
+    t10 = t11 + t6;
+    t3 = t7 + t9;
+    t2 = t0 + t8;
+    t14 = t4 + t5;
+    t13 = t11 - t6;
+    t11 = t7 - t9;
+    t6 = t0 - t8;
+    t7 = t4 - t5;
+    t9 = t10 + t2;
+    t0 = t3 + t14;
+    t8 = t10 - t2;
+    t4 = C11 * t8;
+    t5 = t3 - t14;
+    t10 = C11 * t5;
+    t2 = C12 * t9;
+    t8 = t12 - t2;
+    t3 = C12 * t0;
+    t14 = t1 - t3;
+    t5 = t8 + t4;
+    t2 = t14 + t10;
+    t3 = t8 - t4;
+    t8 = t14 - t10;
+    t4 = C13 * t13;
+    t14 = C14 * t6;
+    t10 = t4 + t14;
+    t4 = C13 * t11;
+    t14 = C14 * t7;
+    t4 = t4 + t14;
+    t14 = C14 * t13;
+    t13 = C13 * t6;
+    t6 = t14 - t13;
+    t14 = C14 * t11;
+    t13 = C13 * t7;
+    t11 = t14 - t13;
+    t7 = t12 + t9;
+    t14 = t1 + t0;
+    t13 = t5 + t4;
+    t12 = t2 - t10;
+    t9 = t3 + t11;
+    t1 = t8 - t6;
+    t0 = t3 - t11;
+    t3 = t8 + t6;
+    t11 = t5 - t4;
+    t8 = t2 + t10;
+    im[45] = t7;
+    re[45] = t14;
+    im[63] = t13;
+    re[63] = t12;
+    im[81] = t9;
+    re[81] = t1;
+    im[9] = t0;
+    re[9] = t3;
+    im[27] = t11;
+    re[27] = t8;
+    t6 = im[75];
+    t5 = re[75];
+    t4 = im[3];
+    t2 = re[3];
+    t10 = im[21];
+    t7 = re[21];
+    t14 = im[39];
+    t13 = re[39];
+    t12 = im[57];
+    t9 = re[57];
+    t1 = t4 + t12;
+    t0 = t2 + t9;
+    t3 = t10 + t14;
+    t11 = t7 + t13;
+    t8 = t4 - t12;
+    t4 = t2 - t9;
+    t12 = t10 - t14;
+    t2 = t7 - t13;
+    t9 = t1 + t3;
+    t10 = t0 + t11;
+    t14 = t1 - t3;
+    t7 = C11 * t14;
+    t13 = t0 - t11;
+    t1 = C11 * t13;
+    t3 = C12 * t9;
+    t14 = t6 - t3;
+    t0 = C12 * t10;
+    t11 = t5 - t0;
+    t13 = t14 + t7;
+    t3 = t11 + t1;
+    t0 = t14 - t7;
+    t14 = t11 - t1;
+    t7 = C13 * t8;
+    t11 = C14 * t12;
+    t1 = t7 + t11;
+    t7 = C13 * t4;
+    t11 = C14 * t2;
+    t7 = t7 + t11;
+    t11 = C14 * t8;
+    t8 = C13 * t12;
+    t12 = t11 - t8;
+    t11 = C14 * t4;
+    t8 = C13 * t2;
+    t4 = t11 - t8;
+    t2 = t6 + t9;
+    t11 = t5 + t10;
+    t8 = t13 + t7;
+    t6 = t3 - t1;
+    t9 = t0 + t4;
+    t5 = t14 - t12;
+    t10 = t0 - t4;
+    t0 = t14 + t12;
+    t4 = t13 - t7;
+    t14 = t3 + t1;
+    im[75] = t2;
+    re[75] = t11;
+    im[3] = t8;
+    re[3] = t6;
+    im[21] = t9;
+    re[21] = t5;
+    im[39] = t10;
+    re[39] = t0;
+    im[57] = t4;
+    re[57] = t14;
+    t12 = im[15];
+    t13 = re[15];
+    t7 = im[33];
+    t3 = re[33];
+    t1 = im[51];
+    t2 = re[51];
+    t11 = im[69];
+    t8 = re[69];
+    t6 = im[87];
+    t9 = re[87];
+    t5 = t7 + t6;
+    t10 = t3 + t9;
+    t0 = t1 + t11;
+    t4 = t2 + t8;
+    t14 = t7 - t6;
+    t7 = t3 - t9;
+    t6 = t1 - t11;
+    t3 = t2 - t8;
+    t9 = t5 + t0;
+    t1 = t10 + t4;
+    t11 = t5 - t0;
+    t2 = C11 * t11;
+    t8 = t10 - t4;
+    t5 = C11 * t8;
+    t0 = C12 * t9;
+    t11 = t12 - t0;
+    t10 = C12 * t1;
+    t4 = t13 - t10;
+    t8 = t11 + t2;
+    t0 = t4 + t5;
+    t10 = t11 - t2;
+    t11 = t4 - t5;
+    t2 = C13 * t14;
+    t4 = C14 * t6;
+    t5 = t2 + t4;
+    t2 = C13 * t7;
+    t4 = C14 * t3;
+    t2 = t2 + t4;
+    t4 = C14 * t14;
+    t14 = C13 * t6;
+    t6 = t4 - t14;
+    t4 = C14 * t7;
+    t14 = C13 * t3;
+    t7 = t4 - t14;
+    t3 = t12 + t9;
+    t4 = t13 + t1;
+    t14 = t8 + t2;
+    t12 = t0 - t5;
+    t9 = t10 + t7;
+    t13 = t11 - t6;
+    t1 = t10 - t7;
+    t10 = t11 + t6;
+    t7 = t8 - t2;
+    t11 = t0 + t5;
+    im[15] = t3;
+    re[15] = t4;
+    im[33] = t14;
+    re[33] = t12;
+    im[51] = t9;
+    re[51] = t13;
+    im[69] = t1;
+    re[69] = t10;
+    im[87] = t7;
+    re[87] = t11;
+    t6 = im[55];
+    t8 = re[55];
+    t2 = im[73];
+    t0 = re[73];
+    t5 = im[1];
+    t3 = re[1];
+    t4 = im[19];
+    t14 = re[19];
+    t12 = im[37];
+    t9 = re[37];
+    t13 = t2 + t12;
+    t1 = t0 + t9;
+    t10 = t5 + t4;
+    t7 = t3 + t14;
+    t11 = t2 - t12;
+    t2 = t0 - t9;
+    t12 = t5 - t4;
+    t0 = t3 - t14;
+    t9 = t13 + t10;
+    t5 = t1 + t7;
+    t4 = t13 - t10;
+    t3 = C11 * t4;
+    t14 = t1 - t7;
+    t13 = C11 * t14;
+    t10 = C12 * t9;
+    t4 = t6 - t10;
+    t1 = C12 * t5;
+    t7 = t8 - t1;
+    t14 = t4 + t3;
+    t10 = t7 + t13;
+    t1 = t4 - t3;
+    t4 = t7 - t13;
+    t3 = C13 * t11;
+    t7 = C14 * t12;
+    t13 = t3 + t7;
+    t3 = C13 * t2;
+    t7 = C14 * t0;
+    t3 = t3 + t7;
+    t7 = C14 * t11;
+    t11 = C13 * t12;
+    t12 = t7 - t11;
+    t7 = C14 * t2;
+    t11 = C13 * t0;
+    t2 = t7 - t11;
+    t0 = t6 + t9;
+    t7 = t8 + t5;
+    t11 = t14 + t3;
+    t6 = t10 - t13;
+    t9 = t1 + t2;
+    t8 = t4 - t12;
+    t5 = t1 - t2;
+    t1 = t4 + t12;
+    t2 = t14 - t3;
+    t4 = t10 + t13;
+    im[55] = t0;
+    re[55] = t7;
+    im[73] = t11;
+    re[73] = t6;
+    im[1] = t9;
+    re[1] = t8;
+    im[19] = t5;
+    re[19] = t1;
+    im[37] = t2;
+    re[37] = t4;
+    t12 = im[85];
+    t14 = re[85];
+    t3 = im[13];
+    t10 = re[13];
+    t13 = im[31];
+    t0 = re[31];
+    t7 = im[49];
+    t11 = re[49];
+    t6 = im[67];
+    t9 = re[67];
+    t8 = t3 + t6;
+    t5 = t10 + t9;
+    t1 = t13 + t7;
+    t2 = t0 + t11;
+    t4 = t3 - t6;
+    t3 = t10 - t9;
+    t6 = t13 - t7;
+    t10 = t0 - t11;
+    t9 = t8 + t1;
+    t13 = t5 + t2;
+    t7 = t8 - t1;
+    t0 = C11 * t7;
+    t11 = t5 - t2;
+    t8 = C11 * t11;
+    t1 = C12 * t9;
+    t7 = t12 - t1;
+    t5 = C12 * t13;
+    t2 = t14 - t5;
+    t11 = t7 + t0;
+    t1 = t2 + t8;
+    t5 = t7 - t0;
+    t7 = t2 - t8;
+    t0 = C13 * t4;
+    t2 = C14 * t6;
+    t8 = t0 + t2;
+    t0 = C13 * t3;
+    t2 = C14 * t10;
+    t0 = t0 + t2;
+    t2 = C14 * t4;
+    t4 = C13 * t6;
+    t6 = t2 - t4;
+    t2 = C14 * t3;
+    t4 = C13 * t10;
+    t3 = t2 - t4;
+    t10 = t12 + t9;
+    t2 = t14 + t13;
+    t4 = t11 + t0;
+    t12 = t1 - t8;
+    t9 = t5 + t3;
+    t14 = t7 - t6;
+    t13 = t5 - t3;
+    t5 = t7 + t6;
+    t3 = t11 - t0;
+    t7 = t1 + t8;
+    im[85] = t10;
+    re[85] = t2;
+    im[13] = t4;
+    re[13] = t12;
+    im[31] = t9;
+    re[31] = t14;
+    im[49] = t13;
+    re[49] = t5;
+    im[67] = t3;
+    re[67] = t7;
+    t6 = im[25];
+    t11 = re[25];
+    t0 = im[43];
+    t1 = re[43];
+    t8 = im[61];
+    t10 = re[61];
+    t2 = im[79];
+    t4 = re[79];
+    t12 = im[7];
+    t9 = re[7];
+    t14 = t0 + t12;
+    t13 = t1 + t9;
+    t5 = t8 + t2;
+    t3 = t10 + t4;
+    t7 = t0 - t12;
+    t0 = t1 - t9;
+    t12 = t8 - t2;
+    t1 = t10 - t4;
+    t9 = t14 + t5;
+    t8 = t13 + t3;
+    t2 = t14 - t5;
+    t10 = C11 * t2;
+    t4 = t13 - t3;
+    t14 = C11 * t4;
+    t5 = C12 * t9;
+    t2 = t6 - t5;
+    t13 = C12 * t8;
+    t3 = t11 - t13;
+    t4 = t2 + t10;
+    t5 = t3 + t14;
+    t13 = t2 - t10;
+    t2 = t3 - t14;
+    t10 = C13 * t7;
+    t3 = C14 * t12;
+    t14 = t10 + t3;
+    t10 = C13 * t0;
+    t3 = C14 * t1;
+    t10 = t10 + t3;
+    t3 = C14 * t7;
+    t7 = C13 * t12;
+    t12 = t3 - t7;
+    t3 = C14 * t0;
+    t7 = C13 * t1;
+    t0 = t3 - t7;
+    t1 = t6 + t9;
+    t3 = t11 + t8;
+    t7 = t4 + t10;
+    t6 = t5 - t14;
+    t9 = t13 + t0;
+    t11 = t2 - t12;
+    t8 = t13 - t0;
+    t13 = t2 + t12;
+    t0 = t4 - t10;
+    t2 = t5 + t14;
+    im[25] = t1;
+    re[25] = t3;
+    im[43] = t7;
+    re[43] = t6;
+    im[61] = t9;
+    re[61] = t11;
+    im[79] = t8;
+    re[79] = t13;
+    im[7] = t0;
+    re[7] = t2;
+    t12 = im[65];
+    t4 = re[65];
+    t10 = im[83];
+    t5 = re[83];
+    t14 = im[11];
+    t1 = re[11];
+    t3 = im[29];
+    t7 = re[29];
+    t6 = im[47];
+    t9 = re[47];
+    t11 = t10 + t6;
+    t8 = t5 + t9;
+    t13 = t14 + t3;
+    t0 = t1 + t7;
+    t2 = t10 - t6;
+    t10 = t5 - t9;
+    t6 = t14 - t3;
+    t5 = t1 - t7;
+    t9 = t11 + t13;
+    t14 = t8 + t0;
+    t3 = t11 - t13;
+    t1 = C11 * t3;
+    t7 = t8 - t0;
+    t11 = C11 * t7;
+    t13 = C12 * t9;
+    t3 = t12 - t13;
+    t8 = C12 * t14;
+    t0 = t4 - t8;
+    t7 = t3 + t1;
+    t13 = t0 + t11;
+    t8 = t3 - t1;
+    t3 = t0 - t11;
+    t1 = C13 * t2;
+    t0 = C14 * t6;
+    t11 = t1 + t0;
+    t1 = C13 * t10;
+    t0 = C14 * t5;
+    t1 = t1 + t0;
+    t0 = C14 * t2;
+    t2 = C13 * t6;
+    t6 = t0 - t2;
+    t0 = C14 * t10;
+    t2 = C13 * t5;
+    t10 = t0 - t2;
+    t5 = t12 + t9;
+    t0 = t4 + t14;
+    t2 = t7 + t1;
+    t12 = t13 - t11;
+    t9 = t8 + t10;
+    t4 = t3 - t6;
+    t14 = t8 - t10;
+    t8 = t3 + t6;
+    t10 = t7 - t1;
+    t3 = t13 + t11;
+    im[65] = t5;
+    re[65] = t0;
+    im[83] = t2;
+    re[83] = t12;
+    im[11] = t9;
+    re[11] = t4;
+    im[29] = t14;
+    re[29] = t8;
+    im[47] = t10;
+    re[47] = t3;
+    t6 = im[5];
+    t7 = re[5];
+    t1 = im[23];
+    t13 = re[23];
+    t11 = im[41];
+    t5 = re[41];
+    t0 = im[59];
+    t2 = re[59];
+    t12 = im[77];
+    t9 = re[77];
+    t4 = t1 + t12;
+    t14 = t13 + t9;
+    t8 = t11 + t0;
+    t10 = t5 + t2;
+    t3 = t1 - t12;
+    t1 = t13 - t9;
+    t12 = t11 - t0;
+    t13 = t5 - t2;
+    t9 = t4 + t8;
+    t11 = t14 + t10;
+    t0 = t4 - t8;
+    t5 = C11 * t0;
+    t2 = t14 - t10;
+    t4 = C11 * t2;
+    t8 = C12 * t9;
+    t0 = t6 - t8;
+    t14 = C12 * t11;
+    t10 = t7 - t14;
+    t2 = t0 + t5;
+    t8 = t10 + t4;
+    t14 = t0 - t5;
+    t0 = t10 - t4;
+    t5 = C13 * t3;
+    t10 = C14 * t12;
+    t4 = t5 + t10;
+    t5 = C13 * t1;
+    t10 = C14 * t13;
+    t5 = t5 + t10;
+    t10 = C14 * t3;
+    t3 = C13 * t12;
+    t12 = t10 - t3;
+    t10 = C14 * t1;
+    t3 = C13 * t13;
+    t1 = t10 - t3;
+    t13 = t6 + t9;
+    t10 = t7 + t11;
+    t3 = t2 + t5;
+    t6 = t8 - t4;
+    t9 = t14 + t1;
+    t7 = t0 - t12;
+    t11 = t14 - t1;
+    t14 = t0 + t12;
+    t1 = t2 - t5;
+    t0 = t8 + t4;
+    im[5] = t13;
+    re[5] = t10;
+    im[23] = t3;
+    re[23] = t6;
+    im[41] = t9;
+    re[41] = t7;
+    im[59] = t11;
+    re[59] = t14;
+    im[77] = t1;
+    re[77] = t0;
+    t12 = im[35];
+    t2 = re[35];
+    t5 = im[53];
+    t8 = re[53];
+    t4 = im[71];
+    t13 = re[71];
+    t10 = im[89];
+    t3 = re[89];
+    t6 = im[17];
+    t9 = re[17];
+    t7 = t5 + t6;
+    t11 = t8 + t9;
+    t14 = t4 + t10;
+    t1 = t13 + t3;
+    t0 = t5 - t6;
+    t5 = t8 - t9;
+    t6 = t4 - t10;
+    t8 = t13 - t3;
+    t9 = t7 + t14;
+    t4 = t11 + t1;
+    t10 = t7 - t14;
+    t13 = C11 * t10;
+    t3 = t11 - t1;
+    t7 = C11 * t3;
+    t14 = C12 * t9;
+    t10 = t12 - t14;
+    t11 = C12 * t4;
+    t1 = t2 - t11;
+    t3 = t10 + t13;
+    t14 = t1 + t7;
+    t11 = t10 - t13;
+    t10 = t1 - t7;
+    t13 = C13 * t0;
+    t1 = C14 * t6;
+    t7 = t13 + t1;
+    t13 = C13 * t5;
+    t1 = C14 * t8;
+    t13 = t13 + t1;
+    t1 = C14 * t0;
+    t0 = C13 * t6;
+    t6 = t1 - t0;
+    t1 = C14 * t5;
+    t0 = C13 * t8;
+    t5 = t1 - t0;
+    t8 = t12 + t9;
+    t1 = t2 + t4;
+    t0 = t3 + t13;
+    t12 = t14 - t7;
+    t9 = t11 + t5;
+    t2 = t10 - t6;
+    t4 = t11 - t5;
+    t11 = t10 + t6;
+    t5 = t3 - t13;
+    t10 = t14 + t7;
+    im[35] = t8;
+    re[35] = t1;
+    im[53] = t0;
+    re[53] = t12;
+    im[71] = t9;
+    re[71] = t2;
+    im[89] = t4;
+    re[89] = t11;
+    im[17] = t5;
+    re[17] = t10;
+    t6 = im[0];
+    t3 = re[0];
+    t13 = im[45];
+    t14 = re[45];
+    t7 = t6 - t13;
+    t8 = t3 - t14;
+    t1 = t6 + t13;
+    t0 = t3 + t14;
+    x[1] = t1;
+    x[0] = t0;
+    x[91] = t7;
+    x[90] = t8;
+    t12 = im[48];
+    t9 = re[48];
+    t2 = im[3];
+    t4 = re[3];
+    t11 = t12 - t2;
+    t5 = t9 - t4;
+    t10 = t12 + t2;
+    t6 = t9 + t4;
+    x[93] = t10;
+    x[92] = t6;
+    x[3] = t11;
+    x[2] = t5;
+    t13 = im[6];
+    t3 = re[6];
+    t14 = im[51];
+    t1 = re[51];
+    t0 = t13 - t14;
+    t7 = t3 - t1;
+    t8 = t13 + t14;
+    t12 = t3 + t1;
+    x[5] = t8;
+    x[4] = t12;
+    x[95] = t0;
+    x[94] = t7;
+    t2 = im[64];
+    t9 = re[64];
+    t4 = im[19];
+    t10 = re[19];
+    t6 = t2 - t4;
+    t11 = t9 - t10;
+    t5 = t2 + t4;
+    t13 = t9 + t10;
+    x[97] = t5;
+    x[96] = t13;
+    x[7] = t6;
+    x[6] = t11;
+    t14 = im[22];
+    t3 = re[22];
+    t1 = im[67];
+    t8 = re[67];
+    t12 = t14 - t1;
+    t0 = t3 - t8;
+    t7 = t14 + t1;
+    t2 = t3 + t8;
+    x[9] = t7;
+    x[8] = t2;
+    x[99] = t12;
+    x[98] = t0;
+    t4 = im[70];
+    t9 = re[70];
+    t10 = im[25];
+    t5 = re[25];
+    t13 = t4 - t10;
+    t6 = t9 - t5;
+    t11 = t4 + t10;
+    t14 = t9 + t5;
+    x[101] = t11;
+    x[100] = t14;
+    x[11] = t13;
+    x[10] = t6;
+    t1 = im[38];
+    t3 = re[38];
+    t8 = im[83];
+    t7 = re[83];
+    t2 = t1 - t8;
+    t12 = t3 - t7;
+    t0 = t1 + t8;
+    t4 = t3 + t7;
+    x[13] = t0;
+    x[12] = t4;
+    x[103] = t2;
+    x[102] = t12;
+    t10 = im[86];
+    t9 = re[86];
+    t5 = im[41];
+    t11 = re[41];
+    t14 = t10 - t5;
+    t13 = t9 - t11;
+    t6 = t10 + t5;
+    t1 = t9 + t11;
+    x[105] = t6;
+    x[104] = t1;
+    x[15] = t14;
+    x[14] = t13;
+    t8 = im[44];
+    t3 = re[44];
+    t7 = im[89];
+    t0 = re[89];
+    t4 = t8 - t7;
+    t2 = t3 - t0;
+    t12 = t8 + t7;
+    t10 = t3 + t0;
+    x[17] = t12;
+    x[16] = t10;
+    x[107] = t4;
+    x[106] = t2;
+    t5 = im[72];
+    t9 = re[72];
+    t11 = im[27];
+    t6 = re[27];
+    t1 = t5 - t11;
+    t14 = t9 - t6;
+    t13 = t5 + t11;
+    t8 = t9 + t6;
+    x[109] = t13;
+    x[108] = t8;
+    x[19] = t1;
+    x[18] = t14;
+    t7 = im[30];
+    t3 = re[30];
+    t0 = im[75];
+    t12 = re[75];
+    t10 = t7 - t0;
+    t4 = t3 - t12;
+    t2 = t7 + t0;
+    t5 = t3 + t12;
+    x[21] = t2;
+    x[20] = t5;
+    x[111] = t10;
+    x[110] = t4;
+    t11 = im[78];
+    t9 = re[78];
+    t6 = im[33];
+    t13 = re[33];
+    t8 = t11 - t6;
+    t1 = t9 - t13;
+    t14 = t11 + t6;
+    t7 = t9 + t13;
+    x[113] = t14;
+    x[112] = t7;
+    x[23] = t8;
+    x[22] = t1;
+    t0 = im[46];
+    t3 = re[46];
+    t12 = im[1];
+    t2 = re[1];
+    t5 = t0 - t12;
+    t10 = t3 - t2;
+    t4 = t0 + t12;
+    t11 = t3 + t2;
+    x[25] = t4;
+    x[24] = t11;
+    x[115] = t5;
+    x[114] = t10;
+    t6 = im[4];
+    t9 = re[4];
+    t13 = im[49];
+    t14 = re[49];
+    t7 = t6 - t13;
+    t8 = t9 - t14;
+    t1 = t6 + t13;
+    t0 = t9 + t14;
+    x[117] = t1;
+    x[116] = t0;
+    x[27] = t7;
+    x[26] = t8;
+    t12 = im[52];
+    t3 = re[52];
+    t2 = im[7];
+    t4 = re[7];
+    t11 = t12 - t2;
+    t5 = t3 - t4;
+    t10 = t12 + t2;
+    t6 = t3 + t4;
+    x[29] = t10;
+    x[28] = t6;
+    x[119] = t11;
+    x[118] = t5;
+    t13 = im[20];
+    t9 = re[20];
+    t14 = im[65];
+    t1 = re[65];
+    t0 = t13 - t14;
+    t7 = t9 - t1;
+    t8 = t13 + t14;
+    t12 = t9 + t1;
+    x[121] = t8;
+    x[120] = t12;
+    x[31] = t0;
+    x[30] = t7;
+    t2 = im[68];
+    t3 = re[68];
+    t4 = im[23];
+    t10 = re[23];
+    t6 = t2 - t4;
+    t11 = t3 - t10;
+    t5 = t2 + t4;
+    t13 = t3 + t10;
+    x[33] = t5;
+    x[32] = t13;
+    x[123] = t6;
+    x[122] = t11;
+    t14 = im[26];
+    t9 = re[26];
+    t1 = im[71];
+    t8 = re[71];
+    t12 = t14 - t1;
+    t0 = t9 - t8;
+    t7 = t14 + t1;
+    t2 = t9 + t8;
+    x[125] = t7;
+    x[124] = t2;
+    x[35] = t12;
+    x[34] = t0;
+    t4 = im[54];
+    t3 = re[54];
+    t10 = im[9];
+    t5 = re[9];
+    t13 = t4 - t10;
+    t6 = t3 - t5;
+    t11 = t4 + t10;
+    t14 = t3 + t5;
+    x[37] = t11;
+    x[36] = t14;
+    x[127] = t13;
+    x[126] = t6;
+    t1 = im[12];
+    t9 = re[12];
+    t8 = im[57];
+    t7 = re[57];
+    t2 = t1 - t8;
+    t12 = t9 - t7;
+    t0 = t1 + t8;
+    t4 = t9 + t7;
+    x[129] = t0;
+    x[128] = t4;
+    x[39] = t2;
+    x[38] = t12;
+    t10 = im[60];
+    t3 = re[60];
+    t5 = im[15];
+    t11 = re[15];
+    t14 = t10 - t5;
+    t13 = t3 - t11;
+    t6 = t10 + t5;
+    t1 = t3 + t11;
+    x[41] = t6;
+    x[40] = t1;
+    x[131] = t14;
+    x[130] = t13;
+    t8 = im[28];
+    t9 = re[28];
+    t7 = im[73];
+    t0 = re[73];
+    t4 = t8 - t7;
+    t2 = t9 - t0;
+    t12 = t8 + t7;
+    t10 = t9 + t0;
+    x[133] = t12;
+    x[132] = t10;
+    x[43] = t4;
+    x[42] = t2;
+    t5 = im[76];
+    t3 = re[76];
+    t11 = im[31];
+    t6 = re[31];
+    t1 = t5 - t11;
+    t14 = t3 - t6;
+    t13 = t5 + t11;
+    t8 = t3 + t6;
+    x[45] = t13;
+    x[44] = t8;
+    x[135] = t1;
+    x[134] = t14;
+    t7 = im[34];
+    t9 = re[34];
+    t0 = im[79];
+    t12 = re[79];
+    t10 = t7 - t0;
+    t4 = t9 - t12;
+    t2 = t7 + t0;
+    t5 = t9 + t12;
+    x[137] = t2;
+    x[136] = t5;
+    x[47] = t10;
+    x[46] = t4;
+    t11 = im[2];
+    t3 = re[2];
+    t6 = im[47];
+    t13 = re[47];
+    t8 = t11 - t6;
+    t1 = t3 - t13;
+    t14 = t11 + t6;
+    t7 = t3 + t13;
+    x[49] = t14;
+    x[48] = t7;
+    x[139] = t8;
+    x[138] = t1;
+    t0 = im[50];
+    t9 = re[50];
+    t12 = im[5];
+    t2 = re[5];
+    t5 = t0 - t12;
+    t10 = t9 - t2;
+    t4 = t0 + t12;
+    t11 = t9 + t2;
+    x[141] = t4;
+    x[140] = t11;
+    x[51] = t5;
+    x[50] = t10;
+    t6 = im[8];
+    t3 = re[8];
+    t13 = im[53];
+    t14 = re[53];
+    t7 = t6 - t13;
+    t8 = t3 - t14;
+    t1 = t6 + t13;
+    t0 = t3 + t14;
+    x[53] = t1;
+    x[52] = t0;
+    x[143] = t7;
+    x[142] = t8;
+    t12 = im[36];
+    t9 = re[36];
+    t2 = im[81];
+    t4 = re[81];
+    t11 = t12 - t2;
+    t5 = t9 - t4;
+    t10 = t12 + t2;
+    t6 = t9 + t4;
+    x[145] = t10;
+    x[144] = t6;
+    x[55] = t11;
+    x[54] = t5;
+    t13 = im[84];
+    t3 = re[84];
+    t14 = im[39];
+    t1 = re[39];
+    t0 = t13 - t14;
+    t7 = t3 - t1;
+    t8 = t13 + t14;
+    t12 = t3 + t1;
+    x[57] = t8;
+    x[56] = t12;
+    x[147] = t0;
+    x[146] = t7;
+    t2 = im[42];
+    t9 = re[42];
+    t4 = im[87];
+    t10 = re[87];
+    t6 = t2 - t4;
+    t11 = t9 - t10;
+    t5 = t2 + t4;
+    t13 = t9 + t10;
+    x[149] = t5;
+    x[148] = t13;
+    x[59] = t6;
+    x[58] = t11;
+    t14 = im[10];
+    t3 = re[10];
+    t1 = im[55];
+    t8 = re[55];
+    t12 = t14 - t1;
+    t0 = t3 - t8;
+    t7 = t14 + t1;
+    t2 = t3 + t8;
+    x[61] = t7;
+    x[60] = t2;
+    x[151] = t12;
+    x[150] = t0;
+    t4 = im[58];
+    t9 = re[58];
+    t10 = im[13];
+    t5 = re[13];
+    t13 = t4 - t10;
+    t6 = t9 - t5;
+    t11 = t4 + t10;
+    t14 = t9 + t5;
+    x[153] = t11;
+    x[152] = t14;
+    x[63] = t13;
+    x[62] = t6;
+    t1 = im[16];
+    t3 = re[16];
+    t8 = im[61];
+    t7 = re[61];
+    t2 = t1 - t8;
+    t12 = t3 - t7;
+    t0 = t1 + t8;
+    t4 = t3 + t7;
+    x[65] = t0;
+    x[64] = t4;
+    x[155] = t2;
+    x[154] = t12;
+    t10 = im[74];
+    t9 = re[74];
+    t5 = im[29];
+    t11 = re[29];
+    t14 = t10 - t5;
+    t13 = t9 - t11;
+    t6 = t10 + t5;
+    t1 = t9 + t11;
+    x[157] = t6;
+    x[156] = t1;
+    x[67] = t14;
+    x[66] = t13;
+    t8 = im[32];
+    t3 = re[32];
+    t7 = im[77];
+    t0 = re[77];
+    t4 = t8 - t7;
+    t2 = t3 - t0;
+    t12 = t8 + t7;
+    t10 = t3 + t0;
+    x[69] = t12;
+    x[68] = t10;
+    x[159] = t4;
+    x[158] = t2;
+    t5 = im[80];
+    t9 = re[80];
+    t11 = im[35];
+    t6 = re[35];
+    t1 = t5 - t11;
+    t14 = t9 - t6;
+    t13 = t5 + t11;
+    t8 = t9 + t6;
+    x[161] = t13;
+    x[160] = t8;
+    x[71] = t1;
+    x[70] = t14;
+    t7 = im[18];
+    t3 = re[18];
+    t0 = im[63];
+    t12 = re[63];
+    t10 = t7 - t0;
+    t4 = t3 - t12;
+    t2 = t7 + t0;
+    t5 = t3 + t12;
+    x[73] = t2;
+    x[72] = t5;
+    x[163] = t10;
+    x[162] = t4;
+    t11 = im[66];
+    t9 = re[66];
+    t6 = im[21];
+    t13 = re[21];
+    t8 = t11 - t6;
+    t1 = t9 - t13;
+    t14 = t11 + t6;
+    t7 = t9 + t13;
+    x[165] = t14;
+    x[164] = t7;
+    x[75] = t8;
+    x[74] = t1;
+}
+
+/**
+ *  Part 4 of ApplyMixedRadixIRFFT_180().
+ * 
+ *  @param {Number[]} re 
+ *    - The real part of each input point.
+ *  @param {Number[]} im 
+ *    - The imaginary part of each input point.
+ *  @param {Number[]} x 
+ *    - The real output points.
+ */
+function ApplyMixedRadixIRFFT_180_Part4(re, im, x) {
+    let t0, t1, t10, t11, t12, t13, t14, t2, t3, t4, t5, t6, t7, t8, t9;
+    t0 = im[24];
+    t3 = re[24];
+    t12 = im[69];
+    t2 = re[69];
+    t5 = t0 - t12;
+    t10 = t3 - t2;
+    t4 = t0 + t12;
+    t11 = t3 + t2;
+    x[77] = t4;
+    x[76] = t11;
+    x[167] = t5;
+    x[166] = t10;
+    t6 = im[82];
+    t9 = re[82];
+    t13 = im[37];
+    t14 = re[37];
+    t7 = t6 - t13;
+    t8 = t9 - t14;
+    t1 = t6 + t13;
+    t0 = t9 + t14;
+    x[169] = t1;
+    x[168] = t0;
+    x[79] = t7;
+    x[78] = t8;
+    t12 = im[40];
+    t3 = re[40];
+    t2 = im[85];
+    t4 = re[85];
+    t11 = t12 - t2;
+    t5 = t3 - t4;
+    t10 = t12 + t2;
+    t6 = t3 + t4;
+    x[81] = t10;
+    x[80] = t6;
+    x[171] = t11;
+    x[170] = t5;
+    t13 = im[88];
+    t9 = re[88];
+    t14 = im[43];
+    t1 = re[43];
+    t0 = t13 - t14;
+    t7 = t9 - t1;
+    t8 = t13 + t14;
+    t12 = t9 + t1;
+    x[173] = t8;
+    x[172] = t12;
+    x[83] = t0;
+    x[82] = t7;
+    t2 = im[56];
+    t3 = re[56];
+    t4 = im[11];
+    t10 = re[11];
+    t6 = t2 - t4;
+    t11 = t3 - t10;
+    t5 = t2 + t4;
+    t13 = t3 + t10;
+    x[85] = t5;
+    x[84] = t13;
+    x[175] = t6;
+    x[174] = t11;
+    t14 = im[14];
+    t9 = re[14];
+    t1 = im[59];
+    t8 = re[59];
+    t12 = t14 - t1;
+    t0 = t9 - t8;
+    t7 = t14 + t1;
+    t2 = t9 + t8;
+    x[177] = t7;
+    x[176] = t2;
+    x[87] = t12;
+    x[86] = t0;
+    t4 = im[62];
+    t3 = re[62];
+    t10 = im[17];
+    t5 = re[17];
+    t13 = t4 - t10;
+    t6 = t3 - t5;
+    t11 = t4 + t10;
+    t14 = t3 + t5;
+    x[89] = t11;
+    x[88] = t14;
+    x[179] = t13;
+    x[178] = t6;
+}
+
+//
+//  Public functions.
+//
+
+/**
+ *  Apply mixed-radix real-output inverse FFT transform (prebuilt for block
+ *  size 180).
+ * 
+ *  Note(s):
+ *    [1] The size of all arrays will not be checked.
+ *    [2] Only the first 91 inputs are used (the k-th input is assumed to be
+ *        the conjugate of the (180 - k)-th input), the imaginary parts of
+ *        the 0th and the 90-th inputs are ignored.
+ *    [3] `re` and `im` are used as scratch buffers, their contents would be
+ *        destroyed.
+ *    [4] `x` shall not be `re` or `im`.
+ *    [5] All outputs are scaled by 1 / 180.
+ * 
+ *  @param {Number[]} re 
+ *    - The real part of each input point.
+ *  @param {Number[]} im 
+ *    - The imaginary part of each input point.
+ *  @param {Number[]} x 
+ *    - The real output points.
+ */
+function ApplyMixedRadixIRFFT_180(re, im, x) {
+    ApplyMixedRadixIRFFT_180_Part1(re, im, x);
+    ApplyMixedRadixIRFFT_180_Part2(re, im, x);
+    ApplyMixedRadixIRFFT_180_Part3(re, im, x);
+    ApplyMixedRadixIRFFT_180_Part4(re, im, x);
+}
+
+//  Export public APIs.
+module.exports = {
+    "ApplyMixedRadixIRFFT_180": ApplyMixedRadixIRFFT_180
+};
\ No newline at end of file
@@ -0,0 +1,9287 @@
+//
+//  Copyright 2021 - 2023 XiaoJSoft Studio. All rights reserved.
+//  Use of this source code is governed by a BSD-style license that can be
+//  found in the LICENSE.md file.
+//
+
+//
+//  Note(s):
+//    [1] This file is generated automatically by a FFT compiler, which locates 
+//        at "./../../dev/fft-mx-generator/" directory.
+//        Do NOT modify this file manually.
+//
+
+//
+//  Imports.
+//
+
+//  Imported modules.
+const Lc3FftMxBaseOp = 
+    require("./fft-mx-baseop");
+
+//  Imported functions.
+// const MXTr2 = 
+//     Lc3FftMxBaseOp.MXTr2;
+// const MXTr3 = 
+//     Lc3FftMxBaseOp.MXTr3;
+// const MXTr4 = 
+//     Lc3FftMxBaseOp.MXTr4;
+// const MXTr5 = 
+//     Lc3FftMxBaseOp.MXTr5;
+// const MXRot = 
+//     Lc3FftMxBaseOp.MXRot;
+const MXSwap = 
+    Lc3FftMxBaseOp.MXSwap;
+const MXCshft = 
+    Lc3FftMxBaseOp.MXCshft;
+// const MXCompact = 
+//     Lc3FftMxBaseOp.MXCompact;
+
+//
+//  Constants.
+//
+
+//  Cyclic shift indexes.
+const CSHFT_INDEXES_0 = [1, 141, 121, 161, 61];
+const CSHFT_INDEXES_1 = [4, 44, 124, 64, 24];
+const CSHFT_INDEXES_2 = [6, 166, 26, 106, 46];
+const CSHFT_INDEXES_3 = [7, 127, 87, 67, 107];
+const CSHFT_INDEXES_4 = [8, 88, 28, 168, 148];
+const CSHFT_INDEXES_5 = [10, 150, 130, 170, 70];
+const CSHFT_INDEXES_6 = [13, 53, 133, 73, 33];
+const CSHFT_INDEXES_7 = [15, 175, 35, 115, 55];
+const CSHFT_INDEXES_8 = [16, 136, 96, 76, 116];
+const CSHFT_INDEXES_9 = [17, 97, 37, 177, 157];
+const CSHFT_INDEXES_10 = [19, 159, 139, 179, 79];
+const CSHFT_INDEXES_11 = [22, 62, 142, 82, 42];
+const CSHFT_INDEXES_12 = [25, 145, 105, 85, 125];
+const CSHFT_INDEXES_13 = [31, 71, 151, 91, 51];
+const CSHFT_INDEXES_14 = [34, 154, 114, 94, 134];
+const CSHFT_INDEXES_15 = [40, 80, 160, 100, 60];
+const CSHFT_INDEXES_16 = [43, 163, 123, 103, 143];
+const CSHFT_INDEXES_17 = [49, 89, 169, 109, 69];
+const CSHFT_INDEXES_18 = [52, 172, 132, 112, 152];
+const CSHFT_INDEXES_19 = [58, 98, 178, 118, 78];
+
+//
+//  Private functions.
+//
+
+/**
+ *  Part 1 of ApplyMixedRadixPairedRFFT_180().
+ * 
+ *  @param {Number[]} re 
+ *    - The real part of each point.
+ *  @param {Number[]} im 
+ *    - The imaginary part of each point.
+ */
+function ApplyMixedRadixPairedRFFT_180_Part1(re, im) {
+    let t0, t1, t10, t11, t12, t13, t14, t2, t3, t4, t5, t6, t7, t8, t9;
+    const C0 = 0.5;
+    const C1 = 0.8660254037844386;
+    const C2 = 0.766044443118978;
+    const C3 = 1.4088320528055172;
+    const C4 = 0.12325683343243876;
+    const C5 = 0.17364817766693033;
+    const C6 = 1.1584559306791384;
+    const C7 = 0.8111595753452777;
+    const C8 = 0.9396926207859084;
+    const C9 = 0.5976724774602398;
+    const C10 = 1.281712764111577;
+    const C11 = 0.5590169943749475;
+    const C12 = 0.25;
+    const C13 = 0.9510565162951535;
+    const C14 = 0.5877852522924731;
+    t0 = re[0];
+    t1 = im[0];
+    t2 = re[60];
+    t3 = im[60];
+    t4 = re[120];
+    t5 = im[120];
+    t6 = t2 + t4;
+    t7 = t3 + t5;
+    t8 = C0 * t6;
+    t8 = t0 - t8;
+    t9 = C0 * t7;
+    t9 = t1 - t9;
+    t2 = t2 - t4;
+    t4 = C1 * t2;
+    t2 = t3 - t5;
+    t3 = C1 * t2;
+    t5 = t0 + t6;
+    t2 = t1 + t7;
+    t0 = t8 + t3;
+    t6 = t9 - t4;
+    t1 = t8 - t3;
+    t7 = t9 + t4;
+    re[0] = t5;
+    im[0] = t2;
+    re[60] = t0;
+    im[60] = t6;
+    re[120] = t1;
+    im[120] = t7;
+    t8 = re[20];
+    t3 = im[20];
+    t9 = re[80];
+    t4 = im[80];
+    t5 = re[140];
+    t2 = im[140];
+    t0 = t9 + t5;
+    t6 = t4 + t2;
+    t1 = C0 * t0;
+    t7 = t8 - t1;
+    t1 = C0 * t6;
+    t1 = t3 - t1;
+    t9 = t9 - t5;
+    t5 = C1 * t9;
+    t9 = t4 - t2;
+    t4 = C1 * t9;
+    t2 = t8 + t0;
+    t9 = t3 + t6;
+    t8 = t7 + t4;
+    t0 = t1 - t5;
+    t3 = t7 - t4;
+    t6 = t1 + t5;
+    t7 = t8 + t0;
+    t4 = C2 * t7;
+    t1 = t8 * (-C3);
+    t5 = t0 * C4;
+    t7 = t4 - t5;
+    t8 = t4 + t1;
+    t0 = t3 + t6;
+    t5 = C5 * t0;
+    t4 = t3 * (-C6);
+    t1 = t6 * (-C7);
+    t0 = t5 - t1;
+    t3 = t5 + t4;
+    re[20] = t2;
+    im[20] = t9;
+    re[80] = t7;
+    im[80] = t8;
+    re[140] = t0;
+    im[140] = t3;
+    t6 = re[40];
+    t1 = im[40];
+    t5 = re[100];
+    t4 = im[100];
+    t2 = re[160];
+    t9 = im[160];
+    t7 = t5 + t2;
+    t8 = t4 + t9;
+    t0 = C0 * t7;
+    t3 = t6 - t0;
+    t0 = C0 * t8;
+    t0 = t1 - t0;
+    t5 = t5 - t2;
+    t2 = C1 * t5;
+    t5 = t4 - t9;
+    t4 = C1 * t5;
+    t9 = t6 + t7;
+    t5 = t1 + t8;
+    t6 = t3 + t4;
+    t7 = t0 - t2;
+    t1 = t3 - t4;
+    t8 = t0 + t2;
+    t3 = t6 + t7;
+    t4 = C5 * t3;
+    t0 = t6 * (-C6);
+    t2 = t7 * (-C7);
+    t3 = t4 - t2;
+    t6 = t4 + t0;
+    t7 = t1 + t8;
+    t2 = (-C8) * t7;
+    t4 = t1 * C9;
+    t0 = t8 * (-C10);
+    t7 = t2 - t0;
+    t1 = t2 + t4;
+    re[40] = t9;
+    im[40] = t5;
+    re[100] = t3;
+    im[100] = t6;
+    re[160] = t7;
+    im[160] = t1;
+    t8 = re[0];
+    t0 = im[0];
+    t2 = re[20];
+    t4 = im[20];
+    t9 = re[40];
+    t5 = im[40];
+    t3 = t2 + t9;
+    t6 = t4 + t5;
+    t7 = C0 * t3;
+    t1 = t8 - t7;
+    t7 = C0 * t6;
+    t7 = t0 - t7;
+    t2 = t2 - t9;
+    t9 = C1 * t2;
+    t2 = t4 - t5;
+    t4 = C1 * t2;
+    t5 = t8 + t3;
+    t2 = t0 + t6;
+    t8 = t1 + t4;
+    t3 = t7 - t9;
+    t0 = t1 - t4;
+    t6 = t7 + t9;
+    re[0] = t5;
+    im[0] = t2;
+    re[20] = t8;
+    im[20] = t3;
+    re[40] = t0;
+    im[40] = t6;
+    t1 = re[60];
+    t4 = im[60];
+    t7 = re[80];
+    t9 = im[80];
+    t5 = re[100];
+    t2 = im[100];
+    t8 = t7 + t5;
+    t3 = t9 + t2;
+    t0 = C0 * t8;
+    t6 = t1 - t0;
+    t0 = C0 * t3;
+    t0 = t4 - t0;
+    t7 = t7 - t5;
+    t5 = C1 * t7;
+    t7 = t9 - t2;
+    t9 = C1 * t7;
+    t2 = t1 + t8;
+    t7 = t4 + t3;
+    t1 = t6 + t9;
+    t8 = t0 - t5;
+    t4 = t6 - t9;
+    t3 = t0 + t5;
+    re[60] = t2;
+    im[60] = t7;
+    re[80] = t1;
+    im[80] = t8;
+    re[100] = t4;
+    im[100] = t3;
+    t6 = re[120];
+    t9 = im[120];
+    t0 = re[140];
+    t5 = im[140];
+    t2 = re[160];
+    t7 = im[160];
+    t1 = t0 + t2;
+    t8 = t5 + t7;
+    t4 = C0 * t1;
+    t3 = t6 - t4;
+    t4 = C0 * t8;
+    t4 = t9 - t4;
+    t0 = t0 - t2;
+    t2 = C1 * t0;
+    t0 = t5 - t7;
+    t5 = C1 * t0;
+    t7 = t6 + t1;
+    t0 = t9 + t8;
+    t6 = t3 + t5;
+    t1 = t4 - t2;
+    t9 = t3 - t5;
+    t8 = t4 + t2;
+    re[120] = t7;
+    im[120] = t0;
+    re[140] = t6;
+    im[140] = t1;
+    re[160] = t9;
+    im[160] = t8;
+    t3 = re[36];
+    t5 = im[36];
+    t4 = re[96];
+    t2 = im[96];
+    t7 = re[156];
+    t0 = im[156];
+    t6 = t4 + t7;
+    t1 = t2 + t0;
+    t9 = C0 * t6;
+    t8 = t3 - t9;
+    t9 = C0 * t1;
+    t9 = t5 - t9;
+    t4 = t4 - t7;
+    t7 = C1 * t4;
+    t4 = t2 - t0;
+    t2 = C1 * t4;
+    t0 = t3 + t6;
+    t4 = t5 + t1;
+    t3 = t8 + t2;
+    t6 = t9 - t7;
+    t5 = t8 - t2;
+    t1 = t9 + t7;
+    re[36] = t0;
+    im[36] = t4;
+    re[96] = t3;
+    im[96] = t6;
+    re[156] = t5;
+    im[156] = t1;
+    t8 = re[56];
+    t2 = im[56];
+    t9 = re[116];
+    t7 = im[116];
+    t0 = re[176];
+    t4 = im[176];
+    t3 = t9 + t0;
+    t6 = t7 + t4;
+    t5 = C0 * t3;
+    t1 = t8 - t5;
+    t5 = C0 * t6;
+    t5 = t2 - t5;
+    t9 = t9 - t0;
+    t0 = C1 * t9;
+    t9 = t7 - t4;
+    t7 = C1 * t9;
+    t4 = t8 + t3;
+    t9 = t2 + t6;
+    t8 = t1 + t7;
+    t3 = t5 - t0;
+    t2 = t1 - t7;
+    t6 = t5 + t0;
+    t1 = t8 + t3;
+    t7 = C2 * t1;
+    t5 = t8 * (-C3);
+    t0 = t3 * C4;
+    t1 = t7 - t0;
+    t8 = t7 + t5;
+    t3 = t2 + t6;
+    t0 = C5 * t3;
+    t7 = t2 * (-C6);
+    t5 = t6 * (-C7);
+    t3 = t0 - t5;
+    t2 = t0 + t7;
+    re[56] = t4;
+    im[56] = t9;
+    re[116] = t1;
+    im[116] = t8;
+    re[176] = t3;
+    im[176] = t2;
+    t6 = re[76];
+    t5 = im[76];
+    t0 = re[136];
+    t7 = im[136];
+    t4 = re[16];
+    t9 = im[16];
+    t1 = t0 + t4;
+    t8 = t7 + t9;
+    t3 = C0 * t1;
+    t2 = t6 - t3;
+    t3 = C0 * t8;
+    t3 = t5 - t3;
+    t0 = t0 - t4;
+    t4 = C1 * t0;
+    t0 = t7 - t9;
+    t7 = C1 * t0;
+    t9 = t6 + t1;
+    t0 = t5 + t8;
+    t6 = t2 + t7;
+    t1 = t3 - t4;
+    t5 = t2 - t7;
+    t8 = t3 + t4;
+    t2 = t6 + t1;
+    t7 = C5 * t2;
+    t3 = t6 * (-C6);
+    t4 = t1 * (-C7);
+    t2 = t7 - t4;
+    t6 = t7 + t3;
+    t1 = t5 + t8;
+    t4 = (-C8) * t1;
+    t7 = t5 * C9;
+    t3 = t8 * (-C10);
+    t1 = t4 - t3;
+    t5 = t4 + t7;
+    re[76] = t9;
+    im[76] = t0;
+    re[136] = t2;
+    im[136] = t6;
+    re[16] = t1;
+    im[16] = t5;
+    t8 = re[36];
+    t3 = im[36];
+    t4 = re[56];
+    t7 = im[56];
+    t9 = re[76];
+    t0 = im[76];
+    t2 = t4 + t9;
+    t6 = t7 + t0;
+    t1 = C0 * t2;
+    t5 = t8 - t1;
+    t1 = C0 * t6;
+    t1 = t3 - t1;
+    t4 = t4 - t9;
+    t9 = C1 * t4;
+    t4 = t7 - t0;
+    t7 = C1 * t4;
+    t0 = t8 + t2;
+    t4 = t3 + t6;
+    t8 = t5 + t7;
+    t2 = t1 - t9;
+    t3 = t5 - t7;
+    t6 = t1 + t9;
+    re[36] = t0;
+    im[36] = t4;
+    re[56] = t8;
+    im[56] = t2;
+    re[76] = t3;
+    im[76] = t6;
+    t5 = re[96];
+    t7 = im[96];
+    t1 = re[116];
+    t9 = im[116];
+    t0 = re[136];
+    t4 = im[136];
+    t8 = t1 + t0;
+    t2 = t9 + t4;
+    t3 = C0 * t8;
+    t6 = t5 - t3;
+    t3 = C0 * t2;
+    t3 = t7 - t3;
+    t1 = t1 - t0;
+    t0 = C1 * t1;
+    t1 = t9 - t4;
+    t9 = C1 * t1;
+    t4 = t5 + t8;
+    t1 = t7 + t2;
+    t5 = t6 + t9;
+    t8 = t3 - t0;
+    t7 = t6 - t9;
+    t2 = t3 + t0;
+    re[96] = t4;
+    im[96] = t1;
+    re[116] = t5;
+    im[116] = t8;
+    re[136] = t7;
+    im[136] = t2;
+    t6 = re[156];
+    t9 = im[156];
+    t3 = re[176];
+    t0 = im[176];
+    t4 = re[16];
+    t1 = im[16];
+    t5 = t3 + t4;
+    t8 = t0 + t1;
+    t7 = C0 * t5;
+    t2 = t6 - t7;
+    t7 = C0 * t8;
+    t7 = t9 - t7;
+    t3 = t3 - t4;
+    t4 = C1 * t3;
+    t3 = t0 - t1;
+    t0 = C1 * t3;
+    t1 = t6 + t5;
+    t3 = t9 + t8;
+    t6 = t2 + t0;
+    t5 = t7 - t4;
+    t9 = t2 - t0;
+    t8 = t7 + t4;
+    re[156] = t1;
+    im[156] = t3;
+    re[176] = t6;
+    im[176] = t5;
+    re[16] = t9;
+    im[16] = t8;
+    t2 = re[72];
+    t0 = im[72];
+    t7 = re[132];
+    t4 = im[132];
+    t1 = re[12];
+    t3 = im[12];
+    t6 = t7 + t1;
+    t5 = t4 + t3;
+    t9 = C0 * t6;
+    t8 = t2 - t9;
+    t9 = C0 * t5;
+    t9 = t0 - t9;
+    t7 = t7 - t1;
+    t1 = C1 * t7;
+    t7 = t4 - t3;
+    t4 = C1 * t7;
+    t3 = t2 + t6;
+    t7 = t0 + t5;
+    t2 = t8 + t4;
+    t6 = t9 - t1;
+    t0 = t8 - t4;
+    t5 = t9 + t1;
+    re[72] = t3;
+    im[72] = t7;
+    re[132] = t2;
+    im[132] = t6;
+    re[12] = t0;
+    im[12] = t5;
+    t8 = re[92];
+    t4 = im[92];
+    t9 = re[152];
+    t1 = im[152];
+    t3 = re[32];
+    t7 = im[32];
+    t2 = t9 + t3;
+    t6 = t1 + t7;
+    t0 = C0 * t2;
+    t5 = t8 - t0;
+    t0 = C0 * t6;
+    t0 = t4 - t0;
+    t9 = t9 - t3;
+    t3 = C1 * t9;
+    t9 = t1 - t7;
+    t1 = C1 * t9;
+    t7 = t8 + t2;
+    t9 = t4 + t6;
+    t8 = t5 + t1;
+    t2 = t0 - t3;
+    t4 = t5 - t1;
+    t6 = t0 + t3;
+    t5 = t8 + t2;
+    t1 = C2 * t5;
+    t0 = t8 * (-C3);
+    t3 = t2 * C4;
+    t5 = t1 - t3;
+    t8 = t1 + t0;
+    t2 = t4 + t6;
+    t3 = C5 * t2;
+    t1 = t4 * (-C6);
+    t0 = t6 * (-C7);
+    t2 = t3 - t0;
+    t4 = t3 + t1;
+    re[92] = t7;
+    im[92] = t9;
+    re[152] = t5;
+    im[152] = t8;
+    re[32] = t2;
+    im[32] = t4;
+    t6 = re[112];
+    t0 = im[112];
+    t3 = re[172];
+    t1 = im[172];
+    t7 = re[52];
+    t9 = im[52];
+    t5 = t3 + t7;
+    t8 = t1 + t9;
+    t2 = C0 * t5;
+    t4 = t6 - t2;
+    t2 = C0 * t8;
+    t2 = t0 - t2;
+    t3 = t3 - t7;
+    t7 = C1 * t3;
+    t3 = t1 - t9;
+    t1 = C1 * t3;
+    t9 = t6 + t5;
+    t3 = t0 + t8;
+    t6 = t4 + t1;
+    t5 = t2 - t7;
+    t0 = t4 - t1;
+    t8 = t2 + t7;
+    t4 = t6 + t5;
+    t1 = C5 * t4;
+    t2 = t6 * (-C6);
+    t7 = t5 * (-C7);
+    t4 = t1 - t7;
+    t6 = t1 + t2;
+    t5 = t0 + t8;
+    t7 = (-C8) * t5;
+    t1 = t0 * C9;
+    t2 = t8 * (-C10);
+    t5 = t7 - t2;
+    t0 = t7 + t1;
+    re[112] = t9;
+    im[112] = t3;
+    re[172] = t4;
+    im[172] = t6;
+    re[52] = t5;
+    im[52] = t0;
+    t8 = re[72];
+    t2 = im[72];
+    t7 = re[92];
+    t1 = im[92];
+    t9 = re[112];
+    t3 = im[112];
+    t4 = t7 + t9;
+    t6 = t1 + t3;
+    t5 = C0 * t4;
+    t0 = t8 - t5;
+    t5 = C0 * t6;
+    t5 = t2 - t5;
+    t7 = t7 - t9;
+    t9 = C1 * t7;
+    t7 = t1 - t3;
+    t1 = C1 * t7;
+    t3 = t8 + t4;
+    t7 = t2 + t6;
+    t8 = t0 + t1;
+    t4 = t5 - t9;
+    t2 = t0 - t1;
+    t6 = t5 + t9;
+    re[72] = t3;
+    im[72] = t7;
+    re[92] = t8;
+    im[92] = t4;
+    re[112] = t2;
+    im[112] = t6;
+    t0 = re[132];
+    t1 = im[132];
+    t5 = re[152];
+    t9 = im[152];
+    t3 = re[172];
+    t7 = im[172];
+    t8 = t5 + t3;
+    t4 = t9 + t7;
+    t2 = C0 * t8;
+    t6 = t0 - t2;
+    t2 = C0 * t4;
+    t2 = t1 - t2;
+    t5 = t5 - t3;
+    t3 = C1 * t5;
+    t5 = t9 - t7;
+    t9 = C1 * t5;
+    t7 = t0 + t8;
+    t5 = t1 + t4;
+    t0 = t6 + t9;
+    t8 = t2 - t3;
+    t1 = t6 - t9;
+    t4 = t2 + t3;
+    re[132] = t7;
+    im[132] = t5;
+    re[152] = t0;
+    im[152] = t8;
+    re[172] = t1;
+    im[172] = t4;
+    t6 = re[12];
+    t9 = im[12];
+    t2 = re[32];
+    t3 = im[32];
+    t7 = re[52];
+    t5 = im[52];
+    t0 = t2 + t7;
+    t8 = t3 + t5;
+    t1 = C0 * t0;
+    t4 = t6 - t1;
+    t1 = C0 * t8;
+    t1 = t9 - t1;
+    t2 = t2 - t7;
+    t7 = C1 * t2;
+    t2 = t3 - t5;
+    t3 = C1 * t2;
+    t5 = t6 + t0;
+    t2 = t9 + t8;
+    t6 = t4 + t3;
+    t0 = t1 - t7;
+    t9 = t4 - t3;
+    t8 = t1 + t7;
+    re[12] = t5;
+    im[12] = t2;
+    re[32] = t6;
+    im[32] = t0;
+    re[52] = t9;
+    im[52] = t8;
+    t4 = re[108];
+    t3 = im[108];
+    t1 = re[168];
+    t7 = im[168];
+    t5 = re[48];
+    t2 = im[48];
+    t6 = t1 + t5;
+    t0 = t7 + t2;
+    t9 = C0 * t6;
+    t8 = t4 - t9;
+    t9 = C0 * t0;
+    t9 = t3 - t9;
+    t1 = t1 - t5;
+    t5 = C1 * t1;
+    t1 = t7 - t2;
+    t7 = C1 * t1;
+    t2 = t4 + t6;
+    t1 = t3 + t0;
+    t4 = t8 + t7;
+    t6 = t9 - t5;
+    t3 = t8 - t7;
+    t0 = t9 + t5;
+    re[108] = t2;
+    im[108] = t1;
+    re[168] = t4;
+    im[168] = t6;
+    re[48] = t3;
+    im[48] = t0;
+    t8 = re[128];
+    t7 = im[128];
+    t9 = re[8];
+    t5 = im[8];
+    t2 = re[68];
+    t1 = im[68];
+    t4 = t9 + t2;
+    t6 = t5 + t1;
+    t3 = C0 * t4;
+    t0 = t8 - t3;
+    t3 = C0 * t6;
+    t3 = t7 - t3;
+    t9 = t9 - t2;
+    t2 = C1 * t9;
+    t9 = t5 - t1;
+    t5 = C1 * t9;
+    t1 = t8 + t4;
+    t9 = t7 + t6;
+    t8 = t0 + t5;
+    t4 = t3 - t2;
+    t7 = t0 - t5;
+    t6 = t3 + t2;
+    t0 = t8 + t4;
+    t5 = C2 * t0;
+    t3 = t8 * (-C3);
+    t2 = t4 * C4;
+    t0 = t5 - t2;
+    t8 = t5 + t3;
+    t4 = t7 + t6;
+    t2 = C5 * t4;
+    t5 = t7 * (-C6);
+    t3 = t6 * (-C7);
+    t4 = t2 - t3;
+    t7 = t2 + t5;
+    re[128] = t1;
+    im[128] = t9;
+    re[8] = t0;
+    im[8] = t8;
+    re[68] = t4;
+    im[68] = t7;
+    t6 = re[148];
+    t3 = im[148];
+    t2 = re[28];
+    t5 = im[28];
+    t1 = re[88];
+    t9 = im[88];
+    t0 = t2 + t1;
+    t8 = t5 + t9;
+    t4 = C0 * t0;
+    t7 = t6 - t4;
+    t4 = C0 * t8;
+    t4 = t3 - t4;
+    t2 = t2 - t1;
+    t1 = C1 * t2;
+    t2 = t5 - t9;
+    t5 = C1 * t2;
+    t9 = t6 + t0;
+    t2 = t3 + t8;
+    t6 = t7 + t5;
+    t0 = t4 - t1;
+    t3 = t7 - t5;
+    t8 = t4 + t1;
+    t7 = t6 + t0;
+    t5 = C5 * t7;
+    t4 = t6 * (-C6);
+    t1 = t0 * (-C7);
+    t7 = t5 - t1;
+    t6 = t5 + t4;
+    t0 = t3 + t8;
+    t1 = (-C8) * t0;
+    t5 = t3 * C9;
+    t4 = t8 * (-C10);
+    t0 = t1 - t4;
+    t3 = t1 + t5;
+    re[148] = t9;
+    im[148] = t2;
+    re[28] = t7;
+    im[28] = t6;
+    re[88] = t0;
+    im[88] = t3;
+    t8 = re[108];
+    t4 = im[108];
+    t1 = re[128];
+    t5 = im[128];
+    t9 = re[148];
+    t2 = im[148];
+    t7 = t1 + t9;
+    t6 = t5 + t2;
+    t0 = C0 * t7;
+    t3 = t8 - t0;
+    t0 = C0 * t6;
+    t0 = t4 - t0;
+    t1 = t1 - t9;
+    t9 = C1 * t1;
+    t1 = t5 - t2;
+    t5 = C1 * t1;
+    t2 = t8 + t7;
+    t1 = t4 + t6;
+    t8 = t3 + t5;
+    t7 = t0 - t9;
+    t4 = t3 - t5;
+    t6 = t0 + t9;
+    re[108] = t2;
+    im[108] = t1;
+    re[128] = t8;
+    im[128] = t7;
+    re[148] = t4;
+    im[148] = t6;
+    t3 = re[168];
+    t5 = im[168];
+    t0 = re[8];
+    t9 = im[8];
+    t2 = re[28];
+    t1 = im[28];
+    t8 = t0 + t2;
+    t7 = t9 + t1;
+    t4 = C0 * t8;
+    t6 = t3 - t4;
+    t4 = C0 * t7;
+    t4 = t5 - t4;
+    t0 = t0 - t2;
+    t2 = C1 * t0;
+    t0 = t9 - t1;
+    t9 = C1 * t0;
+    t1 = t3 + t8;
+    t0 = t5 + t7;
+    t3 = t6 + t9;
+    t8 = t4 - t2;
+    t5 = t6 - t9;
+    t7 = t4 + t2;
+    re[168] = t1;
+    im[168] = t0;
+    re[8] = t3;
+    im[8] = t8;
+    re[28] = t5;
+    im[28] = t7;
+    t6 = re[48];
+    t9 = im[48];
+    t4 = re[68];
+    t2 = im[68];
+    t1 = re[88];
+    t0 = im[88];
+    t3 = t4 + t1;
+    t8 = t2 + t0;
+    t5 = C0 * t3;
+    t7 = t6 - t5;
+    t5 = C0 * t8;
+    t5 = t9 - t5;
+    t4 = t4 - t1;
+    t1 = C1 * t4;
+    t4 = t2 - t0;
+    t2 = C1 * t4;
+    t0 = t6 + t3;
+    t4 = t9 + t8;
+    t6 = t7 + t2;
+    t3 = t5 - t1;
+    t9 = t7 - t2;
+    t8 = t5 + t1;
+    re[48] = t0;
+    im[48] = t4;
+    re[68] = t6;
+    im[68] = t3;
+    re[88] = t9;
+    im[88] = t8;
+    t7 = re[144];
+    t2 = im[144];
+    t5 = re[24];
+    t1 = im[24];
+    t0 = re[84];
+    t4 = im[84];
+    t6 = t5 + t0;
+    t3 = t1 + t4;
+    t9 = C0 * t6;
+    t8 = t7 - t9;
+    t9 = C0 * t3;
+    t9 = t2 - t9;
+    t5 = t5 - t0;
+    t0 = C1 * t5;
+    t5 = t1 - t4;
+    t1 = C1 * t5;
+    t4 = t7 + t6;
+    t5 = t2 + t3;
+    t7 = t8 + t1;
+    t6 = t9 - t0;
+    t2 = t8 - t1;
+    t3 = t9 + t0;
+    re[144] = t4;
+    im[144] = t5;
+    re[24] = t7;
+    im[24] = t6;
+    re[84] = t2;
+    im[84] = t3;
+    t8 = re[164];
+    t1 = im[164];
+    t9 = re[44];
+    t0 = im[44];
+    t4 = re[104];
+    t5 = im[104];
+    t7 = t9 + t4;
+    t6 = t0 + t5;
+    t2 = C0 * t7;
+    t3 = t8 - t2;
+    t2 = C0 * t6;
+    t2 = t1 - t2;
+    t9 = t9 - t4;
+    t4 = C1 * t9;
+    t9 = t0 - t5;
+    t0 = C1 * t9;
+    t5 = t8 + t7;
+    t9 = t1 + t6;
+    t8 = t3 + t0;
+    t7 = t2 - t4;
+    t1 = t3 - t0;
+    t6 = t2 + t4;
+    t3 = t8 + t7;
+    t0 = C2 * t3;
+    t2 = t8 * (-C3);
+    t4 = t7 * C4;
+    t3 = t0 - t4;
+    t8 = t0 + t2;
+    t7 = t1 + t6;
+    t4 = C5 * t7;
+    t0 = t1 * (-C6);
+    t2 = t6 * (-C7);
+    t7 = t4 - t2;
+    t1 = t4 + t0;
+    re[164] = t5;
+    im[164] = t9;
+    re[44] = t3;
+    im[44] = t8;
+    re[104] = t7;
+    im[104] = t1;
+    t6 = re[4];
+    t2 = im[4];
+    t4 = re[64];
+    t0 = im[64];
+    t5 = re[124];
+    t9 = im[124];
+    t3 = t4 + t5;
+    t8 = t0 + t9;
+    t7 = C0 * t3;
+    t1 = t6 - t7;
+    t7 = C0 * t8;
+    t7 = t2 - t7;
+    t4 = t4 - t5;
+    t5 = C1 * t4;
+    t4 = t0 - t9;
+    t0 = C1 * t4;
+    t9 = t6 + t3;
+    t4 = t2 + t8;
+    t6 = t1 + t0;
+    t3 = t7 - t5;
+    t2 = t1 - t0;
+    t8 = t7 + t5;
+    t1 = t6 + t3;
+    t0 = C5 * t1;
+    t7 = t6 * (-C6);
+    t5 = t3 * (-C7);
+    t1 = t0 - t5;
+    t6 = t0 + t7;
+    t3 = t2 + t8;
+    t5 = (-C8) * t3;
+    t0 = t2 * C9;
+    t7 = t8 * (-C10);
+    t3 = t5 - t7;
+    t2 = t5 + t0;
+    re[4] = t9;
+    im[4] = t4;
+    re[64] = t1;
+    im[64] = t6;
+    re[124] = t3;
+    im[124] = t2;
+    t8 = re[144];
+    t7 = im[144];
+    t5 = re[164];
+    t0 = im[164];
+    t9 = re[4];
+    t4 = im[4];
+    t1 = t5 + t9;
+    t6 = t0 + t4;
+    t3 = C0 * t1;
+    t2 = t8 - t3;
+    t3 = C0 * t6;
+    t3 = t7 - t3;
+    t5 = t5 - t9;
+    t9 = C1 * t5;
+    t5 = t0 - t4;
+    t0 = C1 * t5;
+    t4 = t8 + t1;
+    t5 = t7 + t6;
+    t8 = t2 + t0;
+    t1 = t3 - t9;
+    t7 = t2 - t0;
+    t6 = t3 + t9;
+    re[144] = t4;
+    im[144] = t5;
+    re[164] = t8;
+    im[164] = t1;
+    re[4] = t7;
+    im[4] = t6;
+    t2 = re[24];
+    t0 = im[24];
+    t3 = re[44];
+    t9 = im[44];
+    t4 = re[64];
+    t5 = im[64];
+    t8 = t3 + t4;
+    t1 = t9 + t5;
+    t7 = C0 * t8;
+    t6 = t2 - t7;
+    t7 = C0 * t1;
+    t7 = t0 - t7;
+    t3 = t3 - t4;
+    t4 = C1 * t3;
+    t3 = t9 - t5;
+    t9 = C1 * t3;
+    t5 = t2 + t8;
+    t3 = t0 + t1;
+    t2 = t6 + t9;
+    t8 = t7 - t4;
+    t0 = t6 - t9;
+    t1 = t7 + t4;
+    re[24] = t5;
+    im[24] = t3;
+    re[44] = t2;
+    im[44] = t8;
+    re[64] = t0;
+    im[64] = t1;
+    t6 = re[84];
+    t9 = im[84];
+    t7 = re[104];
+    t4 = im[104];
+    t5 = re[124];
+    t3 = im[124];
+    t2 = t7 + t5;
+    t8 = t4 + t3;
+    t0 = C0 * t2;
+    t1 = t6 - t0;
+    t0 = C0 * t8;
+    t0 = t9 - t0;
+    t7 = t7 - t5;
+    t5 = C1 * t7;
+    t7 = t4 - t3;
+    t4 = C1 * t7;
+    t3 = t6 + t2;
+    t7 = t9 + t8;
+    t6 = t1 + t4;
+    t2 = t0 - t5;
+    t9 = t1 - t4;
+    t8 = t0 + t5;
+    re[84] = t3;
+    im[84] = t7;
+    re[104] = t6;
+    im[104] = t2;
+    re[124] = t9;
+    im[124] = t8;
+    t1 = re[0];
+    t4 = im[0];
+    t0 = re[36];
+    t5 = im[36];
+    t3 = re[72];
+    t7 = im[72];
+    t6 = re[108];
+    t2 = im[108];
+    t9 = re[144];
+    t8 = im[144];
+    t10 = t0 + t9;
+    t11 = t5 + t8;
+    t12 = t3 + t6;
+    t13 = t7 + t2;
+    t0 = t0 - t9;
+    t9 = t5 - t8;
+    t5 = t3 - t6;
+    t8 = t7 - t2;
+    t3 = t10 + t12;
+    t6 = t11 + t13;
+    t7 = t10 - t12;
+    t2 = C11 * t7;
+    t10 = t11 - t13;
+    t12 = C11 * t10;
+    t7 = C12 * t3;
+    t11 = t1 - t7;
+    t13 = C12 * t6;
+    t10 = t4 - t13;
+    t7 = t11 + t2;
+    t13 = t10 + t12;
+    t11 = t11 - t2;
+    t2 = t10 - t12;
+    t10 = C13 * t0;
+    t12 = C14 * t5;
+    t10 = t10 + t12;
+    t12 = C13 * t9;
+    t14 = C14 * t8;
+    t12 = t12 + t14;
+    t14 = C14 * t0;
+    t0 = C13 * t5;
+    t5 = t14 - t0;
+    t14 = C14 * t9;
+    t0 = C13 * t8;
+    t9 = t14 - t0;
+    t8 = t1 + t3;
+    t14 = t4 + t6;
+    t0 = t7 + t12;
+    t1 = t13 - t10;
+    t3 = t11 + t9;
+    t4 = t2 - t5;
+    t6 = t11 - t9;
+    t11 = t2 + t5;
+    t9 = t7 - t12;
+    t2 = t13 + t10;
+    re[0] = t8;
+    im[0] = t14;
+    re[36] = t0;
+    im[36] = t1;
+    re[72] = t3;
+    im[72] = t4;
+    re[108] = t6;
+    im[108] = t11;
+    re[144] = t9;
+    im[144] = t2;
+    t5 = re[60];
+    t7 = im[60];
+    t12 = re[96];
+    t13 = im[96];
+    t10 = re[132];
+    t8 = im[132];
+    t14 = re[168];
+    t0 = im[168];
+    t1 = re[24];
+    t3 = im[24];
+    t4 = t12 + t1;
+    t6 = t13 + t3;
+    t11 = t10 + t14;
+    t9 = t8 + t0;
+    t2 = t12 - t1;
+    t12 = t13 - t3;
+    t1 = t10 - t14;
+    t13 = t8 - t0;
+    t3 = t4 + t11;
+    t10 = t6 + t9;
+    t14 = t4 - t11;
+    t8 = C11 * t14;
+    t0 = t6 - t9;
+    t4 = C11 * t0;
+    t11 = C12 * t3;
+    t14 = t5 - t11;
+    t6 = C12 * t10;
+    t9 = t7 - t6;
+    t0 = t14 + t8;
+    t11 = t9 + t4;
+    t6 = t14 - t8;
+    t14 = t9 - t4;
+    t8 = C13 * t2;
+    t9 = C14 * t1;
+    t4 = t8 + t9;
+    t8 = C13 * t12;
+    t9 = C14 * t13;
+    t8 = t8 + t9;
+    t9 = C14 * t2;
+    t2 = C13 * t1;
+    t1 = t9 - t2;
+    t9 = C14 * t12;
+    t2 = C13 * t13;
+    t12 = t9 - t2;
+    t13 = t5 + t3;
+    t9 = t7 + t10;
+    t2 = t0 + t8;
+    t5 = t11 - t4;
+    t3 = t6 + t12;
+    t7 = t14 - t1;
+    t10 = t6 - t12;
+    t6 = t14 + t1;
+    t12 = t0 - t8;
+    t14 = t11 + t4;
+    re[60] = t13;
+    im[60] = t9;
+    re[96] = t2;
+    im[96] = t5;
+    re[132] = t3;
+    im[132] = t7;
+    re[168] = t10;
+    im[168] = t6;
+    re[24] = t12;
+    im[24] = t14;
+    t1 = re[120];
+    t0 = im[120];
+    t8 = re[156];
+    t11 = im[156];
+    t4 = re[12];
+    t13 = im[12];
+    t9 = re[48];
+    t2 = im[48];
+    t5 = re[84];
+    t3 = im[84];
+    t7 = t8 + t5;
+    t10 = t11 + t3;
+    t6 = t4 + t9;
+    t12 = t13 + t2;
+    t14 = t8 - t5;
+    t8 = t11 - t3;
+    t5 = t4 - t9;
+    t11 = t13 - t2;
+    t3 = t7 + t6;
+    t4 = t10 + t12;
+    t9 = t7 - t6;
+    t13 = C11 * t9;
+    t2 = t10 - t12;
+    t7 = C11 * t2;
+    t6 = C12 * t3;
+    t9 = t1 - t6;
+    t10 = C12 * t4;
+    t12 = t0 - t10;
+    t2 = t9 + t13;
+    t6 = t12 + t7;
+    t10 = t9 - t13;
+    t9 = t12 - t7;
+    t13 = C13 * t14;
+    t12 = C14 * t5;
+    t7 = t13 + t12;
+    t13 = C13 * t8;
+    t12 = C14 * t11;
+    t13 = t13 + t12;
+    t12 = C14 * t14;
+    t14 = C13 * t5;
+    t5 = t12 - t14;
+    t12 = C14 * t8;
+    t14 = C13 * t11;
+    t8 = t12 - t14;
+    t11 = t1 + t3;
+    t12 = t0 + t4;
+    t14 = t2 + t13;
+    t1 = t6 - t7;
+    t3 = t10 + t8;
+    t0 = t9 - t5;
+    t4 = t10 - t8;
+    t10 = t9 + t5;
+    t8 = t2 - t13;
+    t9 = t6 + t7;
+    re[120] = t11;
+    im[120] = t12;
+    re[156] = t14;
+    im[156] = t1;
+    re[12] = t3;
+    im[12] = t0;
+    re[48] = t4;
+    im[48] = t10;
+    re[84] = t8;
+    im[84] = t9;
+    t5 = re[20];
+    t2 = im[20];
+    t13 = re[56];
+    t6 = im[56];
+    t7 = re[92];
+    t11 = im[92];
+    t12 = re[128];
+    t14 = im[128];
+    t1 = re[164];
+    t3 = im[164];
+    t0 = t13 + t1;
+    t4 = t6 + t3;
+    t10 = t7 + t12;
+    t8 = t11 + t14;
+    t9 = t13 - t1;
+    t13 = t6 - t3;
+    t1 = t7 - t12;
+    t6 = t11 - t14;
+    t3 = t0 + t10;
+    t7 = t4 + t8;
+    t12 = t0 - t10;
+    t11 = C11 * t12;
+    t14 = t4 - t8;
+    t0 = C11 * t14;
+    t10 = C12 * t3;
+    t12 = t5 - t10;
+    t4 = C12 * t7;
+    t8 = t2 - t4;
+    t14 = t12 + t11;
+    t10 = t8 + t0;
+    t4 = t12 - t11;
+    t12 = t8 - t0;
+    t11 = C13 * t9;
+    t8 = C14 * t1;
+    t0 = t11 + t8;
+    t11 = C13 * t13;
+    t8 = C14 * t6;
+    t11 = t11 + t8;
+    t8 = C14 * t9;
+    t9 = C13 * t1;
+    t1 = t8 - t9;
+    t8 = C14 * t13;
+    t9 = C13 * t6;
+    t13 = t8 - t9;
+    t6 = t5 + t3;
+    t8 = t2 + t7;
+    t9 = t14 + t11;
+    t5 = t10 - t0;
+    t3 = t4 + t13;
+    t2 = t12 - t1;
+    t7 = t4 - t13;
+    t4 = t12 + t1;
+    t13 = t14 - t11;
+    t12 = t10 + t0;
+    re[20] = t6;
+    im[20] = t8;
+    re[56] = t9;
+    im[56] = t5;
+    re[92] = t3;
+    im[92] = t2;
+    re[128] = t7;
+    im[128] = t4;
+    re[164] = t13;
+    im[164] = t12;
+    t1 = re[80];
+    t14 = im[80];
+    t11 = re[116];
+    t10 = im[116];
+    t0 = re[152];
+    t6 = im[152];
+    t8 = re[8];
+    t9 = im[8];
+    t5 = re[44];
+    t3 = im[44];
+    t2 = t11 + t5;
+    t7 = t10 + t3;
+    t4 = t0 + t8;
+    t13 = t6 + t9;
+    t12 = t11 - t5;
+    t11 = t10 - t3;
+    t5 = t0 - t8;
+    t10 = t6 - t9;
+    t3 = t2 + t4;
+    t0 = t7 + t13;
+    t8 = t2 - t4;
+    t6 = C11 * t8;
+    t9 = t7 - t13;
+    t2 = C11 * t9;
+    t4 = C12 * t3;
+    t8 = t1 - t4;
+    t7 = C12 * t0;
+    t13 = t14 - t7;
+    t9 = t8 + t6;
+    t4 = t13 + t2;
+    t7 = t8 - t6;
+    t8 = t13 - t2;
+    t6 = C13 * t12;
+    t13 = C14 * t5;
+    t2 = t6 + t13;
+    t6 = C13 * t11;
+    t13 = C14 * t10;
+    t6 = t6 + t13;
+    t13 = C14 * t12;
+    t12 = C13 * t5;
+    t5 = t13 - t12;
+    t13 = C14 * t11;
+    t12 = C13 * t10;
+    t11 = t13 - t12;
+    t10 = t1 + t3;
+    t13 = t14 + t0;
+    t12 = t9 + t6;
+    t1 = t4 - t2;
+    t3 = t7 + t11;
+    t14 = t8 - t5;
+    t0 = t7 - t11;
+    t7 = t8 + t5;
+    t11 = t9 - t6;
+    t8 = t4 + t2;
+    re[80] = t10;
+    im[80] = t13;
+    re[116] = t12;
+    im[116] = t1;
+    re[152] = t3;
+    im[152] = t14;
+    re[8] = t0;
+    im[8] = t7;
+    re[44] = t11;
+    im[44] = t8;
+    t5 = re[140];
+    t9 = im[140];
+    t6 = re[176];
+    t4 = im[176];
+    t2 = re[32];
+    t10 = im[32];
+    t13 = re[68];
+    t12 = im[68];
+    t1 = re[104];
+    t3 = im[104];
+    t14 = t6 + t1;
+    t0 = t4 + t3;
+    t7 = t2 + t13;
+    t11 = t10 + t12;
+    t8 = t6 - t1;
+    t6 = t4 - t3;
+    t1 = t2 - t13;
+    t4 = t10 - t12;
+    t3 = t14 + t7;
+    t2 = t0 + t11;
+    t13 = t14 - t7;
+    t10 = C11 * t13;
+    t12 = t0 - t11;
+    t14 = C11 * t12;
+    t7 = C12 * t3;
+    t13 = t5 - t7;
+    t0 = C12 * t2;
+    t11 = t9 - t0;
+    t12 = t13 + t10;
+    t7 = t11 + t14;
+    t0 = t13 - t10;
+    t13 = t11 - t14;
+    t10 = C13 * t8;
+    t11 = C14 * t1;
+    t14 = t10 + t11;
+    t10 = C13 * t6;
+    t11 = C14 * t4;
+    t10 = t10 + t11;
+    t11 = C14 * t8;
+    t8 = C13 * t1;
+    t1 = t11 - t8;
+    t11 = C14 * t6;
+    t8 = C13 * t4;
+    t6 = t11 - t8;
+    t4 = t5 + t3;
+    t11 = t9 + t2;
+    t8 = t12 + t10;
+    t5 = t7 - t14;
+    t3 = t0 + t6;
+    t9 = t13 - t1;
+    t2 = t0 - t6;
+    t0 = t13 + t1;
+    t6 = t12 - t10;
+    t13 = t7 + t14;
+    re[140] = t4;
+    im[140] = t11;
+    re[176] = t8;
+    im[176] = t5;
+    re[32] = t3;
+    im[32] = t9;
+    re[68] = t2;
+    im[68] = t0;
+    re[104] = t6;
+    im[104] = t13;
+    t1 = re[40];
+    t12 = im[40];
+    t10 = re[76];
+    t7 = im[76];
+    t14 = re[112];
+    t4 = im[112];
+    t11 = re[148];
+    t8 = im[148];
+    t5 = re[4];
+    t3 = im[4];
+    t9 = t10 + t5;
+    t2 = t7 + t3;
+    t0 = t14 + t11;
+    t6 = t4 + t8;
+    t13 = t10 - t5;
+    t10 = t7 - t3;
+    t5 = t14 - t11;
+    t7 = t4 - t8;
+    t3 = t9 + t0;
+    t14 = t2 + t6;
+    t11 = t9 - t0;
+    t4 = C11 * t11;
+    t8 = t2 - t6;
+    t9 = C11 * t8;
+    t0 = C12 * t3;
+    t11 = t1 - t0;
+    t2 = C12 * t14;
+    t6 = t12 - t2;
+    t8 = t11 + t4;
+    t0 = t6 + t9;
+    t2 = t11 - t4;
+    t11 = t6 - t9;
+    t4 = C13 * t13;
+    t6 = C14 * t5;
+    t9 = t4 + t6;
+    t4 = C13 * t10;
+    t6 = C14 * t7;
+    t4 = t4 + t6;
+    t6 = C14 * t13;
+    t13 = C13 * t5;
+    t5 = t6 - t13;
+    t6 = C14 * t10;
+    t13 = C13 * t7;
+    t10 = t6 - t13;
+    t7 = t1 + t3;
+    t6 = t12 + t14;
+    t13 = t8 + t4;
+    t1 = t0 - t9;
+    t3 = t2 + t10;
+    t12 = t11 - t5;
+    t14 = t2 - t10;
+    t2 = t11 + t5;
+    t10 = t8 - t4;
+    t11 = t0 + t9;
+    re[40] = t7;
+    im[40] = t6;
+    re[76] = t13;
+    im[76] = t1;
+    re[112] = t3;
+    im[112] = t12;
+    re[148] = t14;
+    im[148] = t2;
+    re[4] = t10;
+    im[4] = t11;
+    t5 = re[100];
+    t8 = im[100];
+    t4 = re[136];
+    t0 = im[136];
+    t9 = re[172];
+    t7 = im[172];
+    t6 = re[28];
+    t13 = im[28];
+    t1 = re[64];
+    t3 = im[64];
+    t12 = t4 + t1;
+    t14 = t0 + t3;
+    t2 = t9 + t6;
+    t10 = t7 + t13;
+    t11 = t4 - t1;
+    t4 = t0 - t3;
+    t1 = t9 - t6;
+    t0 = t7 - t13;
+    t3 = t12 + t2;
+    t9 = t14 + t10;
+    t6 = t12 - t2;
+    t7 = C11 * t6;
+    t13 = t14 - t10;
+    t12 = C11 * t13;
+    t2 = C12 * t3;
+    t6 = t5 - t2;
+    t14 = C12 * t9;
+    t10 = t8 - t14;
+    t13 = t6 + t7;
+    t2 = t10 + t12;
+    t14 = t6 - t7;
+    t6 = t10 - t12;
+    t7 = C13 * t11;
+    t10 = C14 * t1;
+    t12 = t7 + t10;
+    t7 = C13 * t4;
+    t10 = C14 * t0;
+    t7 = t7 + t10;
+    t10 = C14 * t11;
+    t11 = C13 * t1;
+    t1 = t10 - t11;
+    t10 = C14 * t4;
+    t11 = C13 * t0;
+    t4 = t10 - t11;
+    t0 = t5 + t3;
+    t10 = t8 + t9;
+    t11 = t13 + t7;
+    t5 = t2 - t12;
+    t3 = t14 + t4;
+    t8 = t6 - t1;
+    t9 = t14 - t4;
+    t14 = t6 + t1;
+    t4 = t13 - t7;
+    t6 = t2 + t12;
+    re[100] = t0;
+    im[100] = t10;
+    re[136] = t11;
+    im[136] = t5;
+    re[172] = t3;
+    im[172] = t8;
+    re[28] = t9;
+    im[28] = t14;
+    re[64] = t4;
+    im[64] = t6;
+    t1 = re[160];
+    t13 = im[160];
+    t7 = re[16];
+    t2 = im[16];
+    t12 = re[52];
+    t0 = im[52];
+    t10 = re[88];
+    t11 = im[88];
+    t5 = re[124];
+    t3 = im[124];
+    t8 = t7 + t5;
+    t9 = t2 + t3;
+    t14 = t12 + t10;
+    t4 = t0 + t11;
+    t6 = t7 - t5;
+    t7 = t2 - t3;
+    t5 = t12 - t10;
+    t2 = t0 - t11;
+    t3 = t8 + t14;
+    t12 = t9 + t4;
+    t10 = t8 - t14;
+    t0 = C11 * t10;
+    t11 = t9 - t4;
+    t8 = C11 * t11;
+    t14 = C12 * t3;
+    t10 = t1 - t14;
+    t9 = C12 * t12;
+    t4 = t13 - t9;
+    t11 = t10 + t0;
+    t14 = t4 + t8;
+    t9 = t10 - t0;
+    t10 = t4 - t8;
+    t0 = C13 * t6;
+    t4 = C14 * t5;
+    t8 = t0 + t4;
+    t0 = C13 * t7;
+    t4 = C14 * t2;
+    t0 = t0 + t4;
+    t4 = C14 * t6;
+    t6 = C13 * t5;
+    t5 = t4 - t6;
+    t4 = C14 * t7;
+    t6 = C13 * t2;
+    t7 = t4 - t6;
+    t2 = t1 + t3;
+    t4 = t13 + t12;
+    t6 = t11 + t0;
+    t1 = t14 - t8;
+    t3 = t9 + t7;
+    t13 = t10 - t5;
+    t12 = t9 - t7;
+    t9 = t10 + t5;
+    t7 = t11 - t0;
+    t10 = t14 + t8;
+    re[160] = t2;
+    im[160] = t4;
+    re[16] = t6;
+    im[16] = t1;
+    re[52] = t3;
+    im[52] = t13;
+    re[88] = t12;
+    im[88] = t9;
+    re[124] = t7;
+    im[124] = t10;
+}
+
+/**
+ *  Part 2 of ApplyMixedRadixPairedRFFT_180().
+ * 
+ *  @param {Number[]} re 
+ *    - The real part of each point.
+ *  @param {Number[]} im 
+ *    - The imaginary part of each point.
+ */
+function ApplyMixedRadixPairedRFFT_180_Part2(re, im) {
+    let t0, t1, t10, t11, t12, t13, t14, t2, t3, t4, t5, t6, t7, t8, t9;
+    const C0 = 0.5;
+    const C1 = 0.8660254037844386;
+    const C2 = 0.766044443118978;
+    const C3 = 1.4088320528055172;
+    const C4 = 0.12325683343243876;
+    const C5 = 0.17364817766693033;
+    const C6 = 1.1584559306791384;
+    const C7 = 0.8111595753452777;
+    const C8 = 0.9396926207859084;
+    const C9 = 0.5976724774602398;
+    const C10 = 1.281712764111577;
+    const C11 = 0.5590169943749475;
+    const C12 = 0.25;
+    const C13 = 0.9510565162951535;
+    const C14 = 0.5877852522924731;
+    t5 = re[45];
+    t11 = im[45];
+    t0 = re[105];
+    t14 = im[105];
+    t8 = re[165];
+    t2 = im[165];
+    t4 = t0 + t8;
+    t6 = t14 + t2;
+    t1 = C0 * t4;
+    t3 = t5 - t1;
+    t13 = C0 * t6;
+    t12 = t11 - t13;
+    t9 = t0 - t8;
+    t7 = C1 * t9;
+    t10 = t14 - t2;
+    t1 = C1 * t10;
+    t13 = t5 + t4;
+    t0 = t11 + t6;
+    t8 = t3 + t1;
+    t9 = t12 - t7;
+    t14 = t3 - t1;
+    t2 = t12 + t7;
+    re[45] = t13;
+    im[45] = t0;
+    re[105] = t8;
+    im[105] = t9;
+    re[165] = t14;
+    im[165] = t2;
+    t10 = re[65];
+    t5 = im[65];
+    t4 = re[125];
+    t11 = im[125];
+    t6 = re[5];
+    t3 = im[5];
+    t1 = t4 + t6;
+    t12 = t11 + t3;
+    t7 = C0 * t1;
+    t13 = t10 - t7;
+    t0 = C0 * t12;
+    t8 = t5 - t0;
+    t9 = t4 - t6;
+    t14 = C1 * t9;
+    t2 = t11 - t3;
+    t7 = C1 * t2;
+    t0 = t10 + t1;
+    t4 = t5 + t12;
+    t6 = t13 + t7;
+    t9 = t8 - t14;
+    t11 = t13 - t7;
+    t3 = t8 + t14;
+    t2 = t6 + t9;
+    t10 = C2 * t2;
+    t1 = t6 * (-C3);
+    t5 = t9 * C4;
+    t12 = t10 - t5;
+    t13 = t10 + t1;
+    t7 = t11 + t3;
+    t8 = C5 * t7;
+    t14 = t11 * (-C6);
+    t2 = t3 * (-C7);
+    t6 = t8 - t2;
+    t9 = t8 + t14;
+    re[65] = t0;
+    im[65] = t4;
+    re[125] = t12;
+    im[125] = t13;
+    re[5] = t6;
+    im[5] = t9;
+    t5 = re[85];
+    t10 = im[85];
+    t1 = re[145];
+    t7 = im[145];
+    t11 = re[25];
+    t3 = im[25];
+    t2 = t1 + t11;
+    t8 = t7 + t3;
+    t14 = C0 * t2;
+    t0 = t5 - t14;
+    t4 = C0 * t8;
+    t12 = t10 - t4;
+    t13 = t1 - t11;
+    t6 = C1 * t13;
+    t9 = t7 - t3;
+    t14 = C1 * t9;
+    t4 = t5 + t2;
+    t1 = t10 + t8;
+    t11 = t0 + t14;
+    t13 = t12 - t6;
+    t7 = t0 - t14;
+    t3 = t12 + t6;
+    t9 = t11 + t13;
+    t5 = C5 * t9;
+    t2 = t11 * (-C6);
+    t10 = t13 * (-C7);
+    t8 = t5 - t10;
+    t0 = t5 + t2;
+    t14 = t7 + t3;
+    t12 = (-C8) * t14;
+    t6 = t7 * C9;
+    t9 = t3 * (-C10);
+    t11 = t12 - t9;
+    t13 = t12 + t6;
+    re[85] = t4;
+    im[85] = t1;
+    re[145] = t8;
+    im[145] = t0;
+    re[25] = t11;
+    im[25] = t13;
+    t10 = re[45];
+    t5 = im[45];
+    t2 = re[65];
+    t14 = im[65];
+    t7 = re[85];
+    t3 = im[85];
+    t9 = t2 + t7;
+    t12 = t14 + t3;
+    t6 = C0 * t9;
+    t4 = t10 - t6;
+    t1 = C0 * t12;
+    t8 = t5 - t1;
+    t0 = t2 - t7;
+    t11 = C1 * t0;
+    t13 = t14 - t3;
+    t6 = C1 * t13;
+    t1 = t10 + t9;
+    t2 = t5 + t12;
+    t7 = t4 + t6;
+    t0 = t8 - t11;
+    t14 = t4 - t6;
+    t3 = t8 + t11;
+    re[45] = t1;
+    im[45] = t2;
+    re[65] = t7;
+    im[65] = t0;
+    re[85] = t14;
+    im[85] = t3;
+    t13 = re[105];
+    t10 = im[105];
+    t9 = re[125];
+    t5 = im[125];
+    t12 = re[145];
+    t4 = im[145];
+    t6 = t9 + t12;
+    t8 = t5 + t4;
+    t11 = C0 * t6;
+    t1 = t13 - t11;
+    t2 = C0 * t8;
+    t7 = t10 - t2;
+    t0 = t9 - t12;
+    t14 = C1 * t0;
+    t3 = t5 - t4;
+    t11 = C1 * t3;
+    t2 = t13 + t6;
+    t9 = t10 + t8;
+    t12 = t1 + t11;
+    t0 = t7 - t14;
+    t5 = t1 - t11;
+    t4 = t7 + t14;
+    re[105] = t2;
+    im[105] = t9;
+    re[125] = t12;
+    im[125] = t0;
+    re[145] = t5;
+    im[145] = t4;
+    t3 = re[165];
+    t13 = im[165];
+    t6 = re[5];
+    t10 = im[5];
+    t8 = re[25];
+    t1 = im[25];
+    t11 = t6 + t8;
+    t7 = t10 + t1;
+    t14 = C0 * t11;
+    t2 = t3 - t14;
+    t9 = C0 * t7;
+    t12 = t13 - t9;
+    t0 = t6 - t8;
+    t5 = C1 * t0;
+    t4 = t10 - t1;
+    t14 = C1 * t4;
+    t9 = t3 + t11;
+    t6 = t13 + t7;
+    t8 = t2 + t14;
+    t0 = t12 - t5;
+    t10 = t2 - t14;
+    t1 = t12 + t5;
+    re[165] = t9;
+    im[165] = t6;
+    re[5] = t8;
+    im[5] = t0;
+    re[25] = t10;
+    im[25] = t1;
+    t4 = re[81];
+    t3 = im[81];
+    t11 = re[141];
+    t13 = im[141];
+    t7 = re[21];
+    t2 = im[21];
+    t14 = t11 + t7;
+    t12 = t13 + t2;
+    t5 = C0 * t14;
+    t9 = t4 - t5;
+    t6 = C0 * t12;
+    t8 = t3 - t6;
+    t0 = t11 - t7;
+    t10 = C1 * t0;
+    t1 = t13 - t2;
+    t5 = C1 * t1;
+    t6 = t4 + t14;
+    t11 = t3 + t12;
+    t7 = t9 + t5;
+    t0 = t8 - t10;
+    t13 = t9 - t5;
+    t2 = t8 + t10;
+    re[81] = t6;
+    im[81] = t11;
+    re[141] = t7;
+    im[141] = t0;
+    re[21] = t13;
+    im[21] = t2;
+    t1 = re[101];
+    t4 = im[101];
+    t14 = re[161];
+    t3 = im[161];
+    t12 = re[41];
+    t9 = im[41];
+    t5 = t14 + t12;
+    t8 = t3 + t9;
+    t10 = C0 * t5;
+    t6 = t1 - t10;
+    t11 = C0 * t8;
+    t7 = t4 - t11;
+    t0 = t14 - t12;
+    t13 = C1 * t0;
+    t2 = t3 - t9;
+    t10 = C1 * t2;
+    t11 = t1 + t5;
+    t14 = t4 + t8;
+    t12 = t6 + t10;
+    t0 = t7 - t13;
+    t3 = t6 - t10;
+    t9 = t7 + t13;
+    t2 = t12 + t0;
+    t1 = C2 * t2;
+    t5 = t12 * (-C3);
+    t4 = t0 * C4;
+    t8 = t1 - t4;
+    t6 = t1 + t5;
+    t10 = t3 + t9;
+    t7 = C5 * t10;
+    t13 = t3 * (-C6);
+    t2 = t9 * (-C7);
+    t12 = t7 - t2;
+    t0 = t7 + t13;
+    re[101] = t11;
+    im[101] = t14;
+    re[161] = t8;
+    im[161] = t6;
+    re[41] = t12;
+    im[41] = t0;
+    t4 = re[121];
+    t1 = im[121];
+    t5 = re[1];
+    t10 = im[1];
+    t3 = re[61];
+    t9 = im[61];
+    t2 = t5 + t3;
+    t7 = t10 + t9;
+    t13 = C0 * t2;
+    t11 = t4 - t13;
+    t14 = C0 * t7;
+    t8 = t1 - t14;
+    t6 = t5 - t3;
+    t12 = C1 * t6;
+    t0 = t10 - t9;
+    t13 = C1 * t0;
+    t14 = t4 + t2;
+    t5 = t1 + t7;
+    t3 = t11 + t13;
+    t6 = t8 - t12;
+    t10 = t11 - t13;
+    t9 = t8 + t12;
+    t0 = t3 + t6;
+    t4 = C5 * t0;
+    t2 = t3 * (-C6);
+    t1 = t6 * (-C7);
+    t7 = t4 - t1;
+    t11 = t4 + t2;
+    t13 = t10 + t9;
+    t8 = (-C8) * t13;
+    t12 = t10 * C9;
+    t0 = t9 * (-C10);
+    t3 = t8 - t0;
+    t6 = t8 + t12;
+    re[121] = t14;
+    im[121] = t5;
+    re[1] = t7;
+    im[1] = t11;
+    re[61] = t3;
+    im[61] = t6;
+    t1 = re[81];
+    t4 = im[81];
+    t2 = re[101];
+    t13 = im[101];
+    t10 = re[121];
+    t9 = im[121];
+    t0 = t2 + t10;
+    t8 = t13 + t9;
+    t12 = C0 * t0;
+    t14 = t1 - t12;
+    t5 = C0 * t8;
+    t7 = t4 - t5;
+    t11 = t2 - t10;
+    t3 = C1 * t11;
+    t6 = t13 - t9;
+    t12 = C1 * t6;
+    t5 = t1 + t0;
+    t2 = t4 + t8;
+    t10 = t14 + t12;
+    t11 = t7 - t3;
+    t13 = t14 - t12;
+    t9 = t7 + t3;
+    re[81] = t5;
+    im[81] = t2;
+    re[101] = t10;
+    im[101] = t11;
+    re[121] = t13;
+    im[121] = t9;
+    t6 = re[141];
+    t1 = im[141];
+    t0 = re[161];
+    t4 = im[161];
+    t8 = re[1];
+    t14 = im[1];
+    t12 = t0 + t8;
+    t7 = t4 + t14;
+    t3 = C0 * t12;
+    t5 = t6 - t3;
+    t2 = C0 * t7;
+    t10 = t1 - t2;
+    t11 = t0 - t8;
+    t13 = C1 * t11;
+    t9 = t4 - t14;
+    t3 = C1 * t9;
+    t2 = t6 + t12;
+    t0 = t1 + t7;
+    t8 = t5 + t3;
+    t11 = t10 - t13;
+    t4 = t5 - t3;
+    t14 = t10 + t13;
+    re[141] = t2;
+    im[141] = t0;
+    re[161] = t8;
+    im[161] = t11;
+    re[1] = t4;
+    im[1] = t14;
+    t9 = re[21];
+    t6 = im[21];
+    t12 = re[41];
+    t1 = im[41];
+    t7 = re[61];
+    t5 = im[61];
+    t3 = t12 + t7;
+    t10 = t1 + t5;
+    t13 = C0 * t3;
+    t2 = t9 - t13;
+    t0 = C0 * t10;
+    t8 = t6 - t0;
+    t11 = t12 - t7;
+    t4 = C1 * t11;
+    t14 = t1 - t5;
+    t13 = C1 * t14;
+    t0 = t9 + t3;
+    t12 = t6 + t10;
+    t7 = t2 + t13;
+    t11 = t8 - t4;
+    t1 = t2 - t13;
+    t5 = t8 + t4;
+    re[21] = t0;
+    im[21] = t12;
+    re[41] = t7;
+    im[41] = t11;
+    re[61] = t1;
+    im[61] = t5;
+    t14 = re[117];
+    t9 = im[117];
+    t3 = re[177];
+    t6 = im[177];
+    t10 = re[57];
+    t2 = im[57];
+    t13 = t3 + t10;
+    t8 = t6 + t2;
+    t4 = C0 * t13;
+    t0 = t14 - t4;
+    t12 = C0 * t8;
+    t7 = t9 - t12;
+    t11 = t3 - t10;
+    t1 = C1 * t11;
+    t5 = t6 - t2;
+    t4 = C1 * t5;
+    t12 = t14 + t13;
+    t3 = t9 + t8;
+    t10 = t0 + t4;
+    t11 = t7 - t1;
+    t6 = t0 - t4;
+    t2 = t7 + t1;
+    re[117] = t12;
+    im[117] = t3;
+    re[177] = t10;
+    im[177] = t11;
+    re[57] = t6;
+    im[57] = t2;
+    t5 = re[137];
+    t14 = im[137];
+    t13 = re[17];
+    t9 = im[17];
+    t8 = re[77];
+    t0 = im[77];
+    t4 = t13 + t8;
+    t7 = t9 + t0;
+    t1 = C0 * t4;
+    t12 = t5 - t1;
+    t3 = C0 * t7;
+    t10 = t14 - t3;
+    t11 = t13 - t8;
+    t6 = C1 * t11;
+    t2 = t9 - t0;
+    t1 = C1 * t2;
+    t3 = t5 + t4;
+    t13 = t14 + t7;
+    t8 = t12 + t1;
+    t11 = t10 - t6;
+    t9 = t12 - t1;
+    t0 = t10 + t6;
+    t2 = t8 + t11;
+    t5 = C2 * t2;
+    t4 = t8 * (-C3);
+    t14 = t11 * C4;
+    t7 = t5 - t14;
+    t12 = t5 + t4;
+    t1 = t9 + t0;
+    t10 = C5 * t1;
+    t6 = t9 * (-C6);
+    t2 = t0 * (-C7);
+    t8 = t10 - t2;
+    t11 = t10 + t6;
+    re[137] = t3;
+    im[137] = t13;
+    re[17] = t7;
+    im[17] = t12;
+    re[77] = t8;
+    im[77] = t11;
+    t14 = re[157];
+    t5 = im[157];
+    t4 = re[37];
+    t1 = im[37];
+    t9 = re[97];
+    t0 = im[97];
+    t2 = t4 + t9;
+    t10 = t1 + t0;
+    t6 = C0 * t2;
+    t3 = t14 - t6;
+    t13 = C0 * t10;
+    t7 = t5 - t13;
+    t12 = t4 - t9;
+    t8 = C1 * t12;
+    t11 = t1 - t0;
+    t6 = C1 * t11;
+    t13 = t14 + t2;
+    t4 = t5 + t10;
+    t9 = t3 + t6;
+    t12 = t7 - t8;
+    t1 = t3 - t6;
+    t0 = t7 + t8;
+    t11 = t9 + t12;
+    t14 = C5 * t11;
+    t2 = t9 * (-C6);
+    t5 = t12 * (-C7);
+    t10 = t14 - t5;
+    t3 = t14 + t2;
+    t6 = t1 + t0;
+    t7 = (-C8) * t6;
+    t8 = t1 * C9;
+    t11 = t0 * (-C10);
+    t9 = t7 - t11;
+    t12 = t7 + t8;
+    re[157] = t13;
+    im[157] = t4;
+    re[37] = t10;
+    im[37] = t3;
+    re[97] = t9;
+    im[97] = t12;
+    t5 = re[117];
+    t14 = im[117];
+    t2 = re[137];
+    t6 = im[137];
+    t1 = re[157];
+    t0 = im[157];
+    t11 = t2 + t1;
+    t7 = t6 + t0;
+    t8 = C0 * t11;
+    t13 = t5 - t8;
+    t4 = C0 * t7;
+    t10 = t14 - t4;
+    t3 = t2 - t1;
+    t9 = C1 * t3;
+    t12 = t6 - t0;
+    t8 = C1 * t12;
+    t4 = t5 + t11;
+    t2 = t14 + t7;
+    t1 = t13 + t8;
+    t3 = t10 - t9;
+    t6 = t13 - t8;
+    t0 = t10 + t9;
+    re[117] = t4;
+    im[117] = t2;
+    re[137] = t1;
+    im[137] = t3;
+    re[157] = t6;
+    im[157] = t0;
+    t12 = re[177];
+    t5 = im[177];
+    t11 = re[17];
+    t14 = im[17];
+    t7 = re[37];
+    t13 = im[37];
+    t8 = t11 + t7;
+    t10 = t14 + t13;
+    t9 = C0 * t8;
+    t4 = t12 - t9;
+    t2 = C0 * t10;
+    t1 = t5 - t2;
+    t3 = t11 - t7;
+    t6 = C1 * t3;
+    t0 = t14 - t13;
+    t9 = C1 * t0;
+    t2 = t12 + t8;
+    t11 = t5 + t10;
+    t7 = t4 + t9;
+    t3 = t1 - t6;
+    t14 = t4 - t9;
+    t13 = t1 + t6;
+    re[177] = t2;
+    im[177] = t11;
+    re[17] = t7;
+    im[17] = t3;
+    re[37] = t14;
+    im[37] = t13;
+    t0 = re[57];
+    t12 = im[57];
+    t8 = re[77];
+    t5 = im[77];
+    t10 = re[97];
+    t4 = im[97];
+    t9 = t8 + t10;
+    t1 = t5 + t4;
+    t6 = C0 * t9;
+    t2 = t0 - t6;
+    t11 = C0 * t1;
+    t7 = t12 - t11;
+    t3 = t8 - t10;
+    t14 = C1 * t3;
+    t13 = t5 - t4;
+    t6 = C1 * t13;
+    t11 = t0 + t9;
+    t8 = t12 + t1;
+    t10 = t2 + t6;
+    t3 = t7 - t14;
+    t5 = t2 - t6;
+    t4 = t7 + t14;
+    re[57] = t11;
+    im[57] = t8;
+    re[77] = t10;
+    im[77] = t3;
+    re[97] = t5;
+    im[97] = t4;
+    t13 = re[153];
+    t0 = im[153];
+    t9 = re[33];
+    t12 = im[33];
+    t1 = re[93];
+    t2 = im[93];
+    t6 = t9 + t1;
+    t7 = t12 + t2;
+    t14 = C0 * t6;
+    t11 = t13 - t14;
+    t8 = C0 * t7;
+    t10 = t0 - t8;
+    t3 = t9 - t1;
+    t5 = C1 * t3;
+    t4 = t12 - t2;
+    t14 = C1 * t4;
+    t8 = t13 + t6;
+    t9 = t0 + t7;
+    t1 = t11 + t14;
+    t3 = t10 - t5;
+    t12 = t11 - t14;
+    t2 = t10 + t5;
+    re[153] = t8;
+    im[153] = t9;
+    re[33] = t1;
+    im[33] = t3;
+    re[93] = t12;
+    im[93] = t2;
+    t4 = re[173];
+    t13 = im[173];
+    t6 = re[53];
+    t0 = im[53];
+    t7 = re[113];
+    t11 = im[113];
+    t14 = t6 + t7;
+    t10 = t0 + t11;
+    t5 = C0 * t14;
+    t8 = t4 - t5;
+    t9 = C0 * t10;
+    t1 = t13 - t9;
+    t3 = t6 - t7;
+    t12 = C1 * t3;
+    t2 = t0 - t11;
+    t5 = C1 * t2;
+    t9 = t4 + t14;
+    t6 = t13 + t10;
+    t7 = t8 + t5;
+    t3 = t1 - t12;
+    t0 = t8 - t5;
+    t11 = t1 + t12;
+    t2 = t7 + t3;
+    t4 = C2 * t2;
+    t14 = t7 * (-C3);
+    t13 = t3 * C4;
+    t10 = t4 - t13;
+    t8 = t4 + t14;
+    t5 = t0 + t11;
+    t1 = C5 * t5;
+    t12 = t0 * (-C6);
+    t2 = t11 * (-C7);
+    t7 = t1 - t2;
+    t3 = t1 + t12;
+    re[173] = t9;
+    im[173] = t6;
+    re[53] = t10;
+    im[53] = t8;
+    re[113] = t7;
+    im[113] = t3;
+    t13 = re[13];
+    t4 = im[13];
+    t14 = re[73];
+    t5 = im[73];
+    t0 = re[133];
+    t11 = im[133];
+    t2 = t14 + t0;
+    t1 = t5 + t11;
+    t12 = C0 * t2;
+    t9 = t13 - t12;
+    t6 = C0 * t1;
+    t10 = t4 - t6;
+    t8 = t14 - t0;
+    t7 = C1 * t8;
+    t3 = t5 - t11;
+    t12 = C1 * t3;
+    t6 = t13 + t2;
+    t14 = t4 + t1;
+    t0 = t9 + t12;
+    t8 = t10 - t7;
+    t5 = t9 - t12;
+    t11 = t10 + t7;
+    t3 = t0 + t8;
+    t13 = C5 * t3;
+    t2 = t0 * (-C6);
+    t4 = t8 * (-C7);
+    t1 = t13 - t4;
+    t9 = t13 + t2;
+    t12 = t5 + t11;
+    t10 = (-C8) * t12;
+    t7 = t5 * C9;
+    t3 = t11 * (-C10);
+    t0 = t10 - t3;
+    t8 = t10 + t7;
+    re[13] = t6;
+    im[13] = t14;
+    re[73] = t1;
+    im[73] = t9;
+    re[133] = t0;
+    im[133] = t8;
+    t4 = re[153];
+    t13 = im[153];
+    t2 = re[173];
+    t12 = im[173];
+    t5 = re[13];
+    t11 = im[13];
+    t3 = t2 + t5;
+    t10 = t12 + t11;
+    t7 = C0 * t3;
+    t6 = t4 - t7;
+    t14 = C0 * t10;
+    t1 = t13 - t14;
+    t9 = t2 - t5;
+    t0 = C1 * t9;
+    t8 = t12 - t11;
+    t7 = C1 * t8;
+    t14 = t4 + t3;
+    t2 = t13 + t10;
+    t5 = t6 + t7;
+    t9 = t1 - t0;
+    t12 = t6 - t7;
+    t11 = t1 + t0;
+    re[153] = t14;
+    im[153] = t2;
+    re[173] = t5;
+    im[173] = t9;
+    re[13] = t12;
+    im[13] = t11;
+    t8 = re[33];
+    t4 = im[33];
+    t3 = re[53];
+    t13 = im[53];
+    t10 = re[73];
+    t6 = im[73];
+    t7 = t3 + t10;
+    t1 = t13 + t6;
+    t0 = C0 * t7;
+    t14 = t8 - t0;
+    t2 = C0 * t1;
+    t5 = t4 - t2;
+    t9 = t3 - t10;
+    t12 = C1 * t9;
+    t11 = t13 - t6;
+    t0 = C1 * t11;
+    t2 = t8 + t7;
+    t3 = t4 + t1;
+    t10 = t14 + t0;
+    t9 = t5 - t12;
+    t13 = t14 - t0;
+    t6 = t5 + t12;
+    re[33] = t2;
+    im[33] = t3;
+    re[53] = t10;
+    im[53] = t9;
+    re[73] = t13;
+    im[73] = t6;
+    t11 = re[93];
+    t8 = im[93];
+    t7 = re[113];
+    t4 = im[113];
+    t1 = re[133];
+    t14 = im[133];
+    t0 = t7 + t1;
+    t5 = t4 + t14;
+    t12 = C0 * t0;
+    t2 = t11 - t12;
+    t3 = C0 * t5;
+    t10 = t8 - t3;
+    t9 = t7 - t1;
+    t13 = C1 * t9;
+    t6 = t4 - t14;
+    t12 = C1 * t6;
+    t3 = t11 + t0;
+    t7 = t8 + t5;
+    t1 = t2 + t12;
+    t9 = t10 - t13;
+    t4 = t2 - t12;
+    t14 = t10 + t13;
+    re[93] = t3;
+    im[93] = t7;
+    re[113] = t1;
+    im[113] = t9;
+    re[133] = t4;
+    im[133] = t14;
+    t6 = re[9];
+    t11 = im[9];
+    t0 = re[69];
+    t8 = im[69];
+    t5 = re[129];
+    t2 = im[129];
+    t12 = t0 + t5;
+    t10 = t8 + t2;
+    t13 = C0 * t12;
+    t3 = t6 - t13;
+    t7 = C0 * t10;
+    t1 = t11 - t7;
+    t9 = t0 - t5;
+    t4 = C1 * t9;
+    t14 = t8 - t2;
+    t13 = C1 * t14;
+    t7 = t6 + t12;
+    t0 = t11 + t10;
+    t5 = t3 + t13;
+    t9 = t1 - t4;
+    t8 = t3 - t13;
+    t2 = t1 + t4;
+    re[9] = t7;
+    im[9] = t0;
+    re[69] = t5;
+    im[69] = t9;
+    re[129] = t8;
+    im[129] = t2;
+    t14 = re[29];
+    t6 = im[29];
+    t12 = re[89];
+    t11 = im[89];
+    t10 = re[149];
+    t3 = im[149];
+    t13 = t12 + t10;
+    t1 = t11 + t3;
+    t4 = C0 * t13;
+    t7 = t14 - t4;
+    t0 = C0 * t1;
+    t5 = t6 - t0;
+    t9 = t12 - t10;
+    t8 = C1 * t9;
+    t2 = t11 - t3;
+    t4 = C1 * t2;
+    t0 = t14 + t13;
+    t12 = t6 + t1;
+    t10 = t7 + t4;
+    t9 = t5 - t8;
+    t11 = t7 - t4;
+    t3 = t5 + t8;
+    t2 = t10 + t9;
+    t14 = C2 * t2;
+    t13 = t10 * (-C3);
+    t6 = t9 * C4;
+    t1 = t14 - t6;
+    t7 = t14 + t13;
+    t4 = t11 + t3;
+    t5 = C5 * t4;
+    t8 = t11 * (-C6);
+    t2 = t3 * (-C7);
+    t10 = t5 - t2;
+    t9 = t5 + t8;
+    re[29] = t0;
+    im[29] = t12;
+    re[89] = t1;
+    im[89] = t7;
+    re[149] = t10;
+    im[149] = t9;
+    t6 = re[49];
+    t14 = im[49];
+    t13 = re[109];
+    t4 = im[109];
+    t11 = re[169];
+    t3 = im[169];
+    t2 = t13 + t11;
+    t5 = t4 + t3;
+    t8 = C0 * t2;
+    t0 = t6 - t8;
+    t12 = C0 * t5;
+    t1 = t14 - t12;
+    t7 = t13 - t11;
+    t10 = C1 * t7;
+    t9 = t4 - t3;
+    t8 = C1 * t9;
+    t12 = t6 + t2;
+    t13 = t14 + t5;
+    t11 = t0 + t8;
+    t7 = t1 - t10;
+    t4 = t0 - t8;
+    t3 = t1 + t10;
+    t9 = t11 + t7;
+    t6 = C5 * t9;
+    t2 = t11 * (-C6);
+    t14 = t7 * (-C7);
+    t5 = t6 - t14;
+    t0 = t6 + t2;
+    t8 = t4 + t3;
+    t1 = (-C8) * t8;
+    t10 = t4 * C9;
+    t9 = t3 * (-C10);
+    t11 = t1 - t9;
+    t7 = t1 + t10;
+    re[49] = t12;
+    im[49] = t13;
+    re[109] = t5;
+    im[109] = t0;
+    re[169] = t11;
+    im[169] = t7;
+    t14 = re[9];
+    t6 = im[9];
+    t2 = re[29];
+    t8 = im[29];
+    t4 = re[49];
+    t3 = im[49];
+    t9 = t2 + t4;
+    t1 = t8 + t3;
+    t10 = C0 * t9;
+    t12 = t14 - t10;
+    t13 = C0 * t1;
+    t5 = t6 - t13;
+    t0 = t2 - t4;
+    t11 = C1 * t0;
+    t7 = t8 - t3;
+    t10 = C1 * t7;
+    t13 = t14 + t9;
+    t2 = t6 + t1;
+    t4 = t12 + t10;
+    t0 = t5 - t11;
+    t8 = t12 - t10;
+    t3 = t5 + t11;
+    re[9] = t13;
+    im[9] = t2;
+    re[29] = t4;
+    im[29] = t0;
+    re[49] = t8;
+    im[49] = t3;
+    t7 = re[69];
+    t14 = im[69];
+    t9 = re[89];
+    t6 = im[89];
+    t1 = re[109];
+    t12 = im[109];
+    t10 = t9 + t1;
+    t5 = t6 + t12;
+    t11 = C0 * t10;
+    t13 = t7 - t11;
+    t2 = C0 * t5;
+    t4 = t14 - t2;
+    t0 = t9 - t1;
+    t8 = C1 * t0;
+    t3 = t6 - t12;
+    t11 = C1 * t3;
+    t2 = t7 + t10;
+    t9 = t14 + t5;
+    t1 = t13 + t11;
+    t0 = t4 - t8;
+    t6 = t13 - t11;
+    t12 = t4 + t8;
+    re[69] = t2;
+    im[69] = t9;
+    re[89] = t1;
+    im[89] = t0;
+    re[109] = t6;
+    im[109] = t12;
+    t3 = re[129];
+    t7 = im[129];
+    t10 = re[149];
+    t14 = im[149];
+    t5 = re[169];
+    t13 = im[169];
+    t11 = t10 + t5;
+    t4 = t14 + t13;
+    t8 = C0 * t11;
+    t2 = t3 - t8;
+    t9 = C0 * t4;
+    t1 = t7 - t9;
+    t0 = t10 - t5;
+    t6 = C1 * t0;
+    t12 = t14 - t13;
+    t8 = C1 * t12;
+    t9 = t3 + t11;
+    t10 = t7 + t4;
+    t5 = t2 + t8;
+    t0 = t1 - t6;
+    t14 = t2 - t8;
+    t13 = t1 + t6;
+    re[129] = t9;
+    im[129] = t10;
+    re[149] = t5;
+    im[149] = t0;
+    re[169] = t14;
+    im[169] = t13;
+    t12 = re[45];
+    t3 = im[45];
+    t11 = re[81];
+    t7 = im[81];
+    t4 = re[117];
+    t2 = im[117];
+    t8 = re[153];
+    t1 = im[153];
+    t6 = re[9];
+    t9 = im[9];
+    t10 = t11 + t6;
+    t5 = t7 + t9;
+    t0 = t4 + t8;
+    t14 = t2 + t1;
+    t13 = t11 - t6;
+    t11 = t7 - t9;
+    t6 = t4 - t8;
+    t7 = t2 - t1;
+    t9 = t10 + t0;
+    t4 = t5 + t14;
+    t8 = t10 - t0;
+    t2 = C11 * t8;
+    t1 = t5 - t14;
+    t10 = C11 * t1;
+    t0 = C12 * t9;
+    t8 = t12 - t0;
+    t5 = C12 * t4;
+    t14 = t3 - t5;
+    t1 = t8 + t2;
+    t0 = t14 + t10;
+    t5 = t8 - t2;
+    t8 = t14 - t10;
+    t2 = C13 * t13;
+    t14 = C14 * t6;
+    t10 = t2 + t14;
+    t2 = C13 * t11;
+    t14 = C14 * t7;
+    t2 = t2 + t14;
+    t14 = C14 * t13;
+    t13 = C13 * t6;
+    t6 = t14 - t13;
+    t14 = C14 * t11;
+    t13 = C13 * t7;
+    t11 = t14 - t13;
+    t7 = t12 + t9;
+    t14 = t3 + t4;
+    t13 = t1 + t2;
+    t12 = t0 - t10;
+    t9 = t5 + t11;
+    t3 = t8 - t6;
+    t4 = t5 - t11;
+    t5 = t8 + t6;
+    t11 = t1 - t2;
+    t8 = t0 + t10;
+    re[45] = t7;
+    im[45] = t14;
+    re[81] = t13;
+    im[81] = t12;
+    re[117] = t9;
+    im[117] = t3;
+    re[153] = t4;
+    im[153] = t5;
+    re[9] = t11;
+    im[9] = t8;
+    t6 = re[105];
+    t1 = im[105];
+    t2 = re[141];
+    t0 = im[141];
+    t10 = re[177];
+    t7 = im[177];
+    t14 = re[33];
+    t13 = im[33];
+    t12 = re[69];
+    t9 = im[69];
+    t3 = t2 + t12;
+    t4 = t0 + t9;
+    t5 = t10 + t14;
+    t11 = t7 + t13;
+    t8 = t2 - t12;
+    t2 = t0 - t9;
+    t12 = t10 - t14;
+    t0 = t7 - t13;
+    t9 = t3 + t5;
+    t10 = t4 + t11;
+    t14 = t3 - t5;
+    t7 = C11 * t14;
+    t13 = t4 - t11;
+    t3 = C11 * t13;
+    t5 = C12 * t9;
+    t14 = t6 - t5;
+    t4 = C12 * t10;
+    t11 = t1 - t4;
+    t13 = t14 + t7;
+    t5 = t11 + t3;
+    t4 = t14 - t7;
+    t14 = t11 - t3;
+    t7 = C13 * t8;
+    t11 = C14 * t12;
+    t3 = t7 + t11;
+    t7 = C13 * t2;
+    t11 = C14 * t0;
+    t7 = t7 + t11;
+    t11 = C14 * t8;
+    t8 = C13 * t12;
+    t12 = t11 - t8;
+    t11 = C14 * t2;
+    t8 = C13 * t0;
+    t2 = t11 - t8;
+    t0 = t6 + t9;
+    t11 = t1 + t10;
+    t8 = t13 + t7;
+    t6 = t5 - t3;
+    t9 = t4 + t2;
+    t1 = t14 - t12;
+    t10 = t4 - t2;
+    t4 = t14 + t12;
+    t2 = t13 - t7;
+    t14 = t5 + t3;
+    re[105] = t0;
+    im[105] = t11;
+    re[141] = t8;
+    im[141] = t6;
+    re[177] = t9;
+    im[177] = t1;
+    re[33] = t10;
+    im[33] = t4;
+    re[69] = t2;
+    im[69] = t14;
+    t12 = re[165];
+    t13 = im[165];
+    t7 = re[21];
+    t5 = im[21];
+    t3 = re[57];
+    t0 = im[57];
+    t11 = re[93];
+    t8 = im[93];
+    t6 = re[129];
+    t9 = im[129];
+    t1 = t7 + t6;
+    t10 = t5 + t9;
+    t4 = t3 + t11;
+    t2 = t0 + t8;
+    t14 = t7 - t6;
+    t7 = t5 - t9;
+    t6 = t3 - t11;
+    t5 = t0 - t8;
+    t9 = t1 + t4;
+    t3 = t10 + t2;
+    t11 = t1 - t4;
+    t0 = C11 * t11;
+    t8 = t10 - t2;
+    t1 = C11 * t8;
+    t4 = C12 * t9;
+    t11 = t12 - t4;
+    t10 = C12 * t3;
+    t2 = t13 - t10;
+    t8 = t11 + t0;
+    t4 = t2 + t1;
+    t10 = t11 - t0;
+    t11 = t2 - t1;
+    t0 = C13 * t14;
+    t2 = C14 * t6;
+    t1 = t0 + t2;
+    t0 = C13 * t7;
+    t2 = C14 * t5;
+    t0 = t0 + t2;
+    t2 = C14 * t14;
+    t14 = C13 * t6;
+    t6 = t2 - t14;
+    t2 = C14 * t7;
+    t14 = C13 * t5;
+    t7 = t2 - t14;
+    t5 = t12 + t9;
+    t2 = t13 + t3;
+    t14 = t8 + t0;
+    t12 = t4 - t1;
+    t9 = t10 + t7;
+    t13 = t11 - t6;
+    t3 = t10 - t7;
+    t10 = t11 + t6;
+    t7 = t8 - t0;
+    t11 = t4 + t1;
+    re[165] = t5;
+    im[165] = t2;
+    re[21] = t14;
+    im[21] = t12;
+    re[57] = t9;
+    im[57] = t13;
+    re[93] = t3;
+    im[93] = t10;
+    re[129] = t7;
+    im[129] = t11;
+    t6 = re[65];
+    t8 = im[65];
+    t0 = re[101];
+    t4 = im[101];
+    t1 = re[137];
+    t5 = im[137];
+    t2 = re[173];
+    t14 = im[173];
+    t12 = re[29];
+    t9 = im[29];
+    t13 = t0 + t12;
+    t3 = t4 + t9;
+    t10 = t1 + t2;
+    t7 = t5 + t14;
+    t11 = t0 - t12;
+    t0 = t4 - t9;
+    t12 = t1 - t2;
+    t4 = t5 - t14;
+    t9 = t13 + t10;
+    t1 = t3 + t7;
+    t2 = t13 - t10;
+    t5 = C11 * t2;
+    t14 = t3 - t7;
+    t13 = C11 * t14;
+    t10 = C12 * t9;
+    t2 = t6 - t10;
+    t3 = C12 * t1;
+    t7 = t8 - t3;
+    t14 = t2 + t5;
+    t10 = t7 + t13;
+    t3 = t2 - t5;
+    t2 = t7 - t13;
+    t5 = C13 * t11;
+    t7 = C14 * t12;
+    t13 = t5 + t7;
+    t5 = C13 * t0;
+    t7 = C14 * t4;
+    t5 = t5 + t7;
+    t7 = C14 * t11;
+    t11 = C13 * t12;
+    t12 = t7 - t11;
+    t7 = C14 * t0;
+    t11 = C13 * t4;
+    t0 = t7 - t11;
+    t4 = t6 + t9;
+    t7 = t8 + t1;
+    t11 = t14 + t5;
+    t6 = t10 - t13;
+    t9 = t3 + t0;
+    t8 = t2 - t12;
+    t1 = t3 - t0;
+    t3 = t2 + t12;
+    t0 = t14 - t5;
+    t2 = t10 + t13;
+    re[65] = t4;
+    im[65] = t7;
+    re[101] = t11;
+    im[101] = t6;
+    re[137] = t9;
+    im[137] = t8;
+    re[173] = t1;
+    im[173] = t3;
+    re[29] = t0;
+    im[29] = t2;
+    t12 = re[125];
+    t14 = im[125];
+    t5 = re[161];
+    t10 = im[161];
+    t13 = re[17];
+    t4 = im[17];
+    t7 = re[53];
+    t11 = im[53];
+    t6 = re[89];
+    t9 = im[89];
+    t8 = t5 + t6;
+    t1 = t10 + t9;
+    t3 = t13 + t7;
+    t0 = t4 + t11;
+    t2 = t5 - t6;
+    t5 = t10 - t9;
+    t6 = t13 - t7;
+    t10 = t4 - t11;
+    t9 = t8 + t3;
+    t13 = t1 + t0;
+    t7 = t8 - t3;
+    t4 = C11 * t7;
+    t11 = t1 - t0;
+    t8 = C11 * t11;
+    t3 = C12 * t9;
+    t7 = t12 - t3;
+    t1 = C12 * t13;
+    t0 = t14 - t1;
+    t11 = t7 + t4;
+    t3 = t0 + t8;
+    t1 = t7 - t4;
+    t7 = t0 - t8;
+    t4 = C13 * t2;
+    t0 = C14 * t6;
+    t8 = t4 + t0;
+    t4 = C13 * t5;
+    t0 = C14 * t10;
+    t4 = t4 + t0;
+    t0 = C14 * t2;
+    t2 = C13 * t6;
+    t6 = t0 - t2;
+    t0 = C14 * t5;
+    t2 = C13 * t10;
+    t5 = t0 - t2;
+    t10 = t12 + t9;
+    t0 = t14 + t13;
+    t2 = t11 + t4;
+    t12 = t3 - t8;
+    t9 = t1 + t5;
+    t14 = t7 - t6;
+    t13 = t1 - t5;
+    t1 = t7 + t6;
+    t5 = t11 - t4;
+    t7 = t3 + t8;
+    re[125] = t10;
+    im[125] = t0;
+    re[161] = t2;
+    im[161] = t12;
+    re[17] = t9;
+    im[17] = t14;
+    re[53] = t13;
+    im[53] = t1;
+    re[89] = t5;
+    im[89] = t7;
+    t6 = re[5];
+    t11 = im[5];
+    t4 = re[41];
+    t3 = im[41];
+    t8 = re[77];
+    t10 = im[77];
+    t0 = re[113];
+    t2 = im[113];
+    t12 = re[149];
+    t9 = im[149];
+    t14 = t4 + t12;
+    t13 = t3 + t9;
+    t1 = t8 + t0;
+    t5 = t10 + t2;
+    t7 = t4 - t12;
+    t4 = t3 - t9;
+    t12 = t8 - t0;
+    t3 = t10 - t2;
+    t9 = t14 + t1;
+    t8 = t13 + t5;
+    t0 = t14 - t1;
+    t10 = C11 * t0;
+    t2 = t13 - t5;
+    t14 = C11 * t2;
+    t1 = C12 * t9;
+    t0 = t6 - t1;
+    t13 = C12 * t8;
+    t5 = t11 - t13;
+    t2 = t0 + t10;
+    t1 = t5 + t14;
+    t13 = t0 - t10;
+    t0 = t5 - t14;
+    t10 = C13 * t7;
+    t5 = C14 * t12;
+    t14 = t10 + t5;
+    t10 = C13 * t4;
+    t5 = C14 * t3;
+    t10 = t10 + t5;
+    t5 = C14 * t7;
+    t7 = C13 * t12;
+    t12 = t5 - t7;
+    t5 = C14 * t4;
+    t7 = C13 * t3;
+    t4 = t5 - t7;
+    t3 = t6 + t9;
+    t5 = t11 + t8;
+    t7 = t2 + t10;
+    t6 = t1 - t14;
+    t9 = t13 + t4;
+    t11 = t0 - t12;
+    t8 = t13 - t4;
+    t13 = t0 + t12;
+    t4 = t2 - t10;
+    t0 = t1 + t14;
+    re[5] = t3;
+    im[5] = t5;
+    re[41] = t7;
+    im[41] = t6;
+    re[77] = t9;
+    im[77] = t11;
+    re[113] = t8;
+    im[113] = t13;
+    re[149] = t4;
+    im[149] = t0;
+    t12 = re[85];
+    t2 = im[85];
+    t10 = re[121];
+    t1 = im[121];
+    t14 = re[157];
+    t3 = im[157];
+    t5 = re[13];
+    t7 = im[13];
+    t6 = re[49];
+    t9 = im[49];
+    t11 = t10 + t6;
+    t8 = t1 + t9;
+    t13 = t14 + t5;
+    t4 = t3 + t7;
+    t0 = t10 - t6;
+    t10 = t1 - t9;
+    t6 = t14 - t5;
+    t1 = t3 - t7;
+    t9 = t11 + t13;
+    t14 = t8 + t4;
+    t5 = t11 - t13;
+    t3 = C11 * t5;
+    t7 = t8 - t4;
+    t11 = C11 * t7;
+    t13 = C12 * t9;
+    t5 = t12 - t13;
+    t8 = C12 * t14;
+    t4 = t2 - t8;
+    t7 = t5 + t3;
+    t13 = t4 + t11;
+    t8 = t5 - t3;
+    t5 = t4 - t11;
+    t3 = C13 * t0;
+    t4 = C14 * t6;
+    t11 = t3 + t4;
+    t3 = C13 * t10;
+    t4 = C14 * t1;
+    t3 = t3 + t4;
+    t4 = C14 * t0;
+    t0 = C13 * t6;
+    t6 = t4 - t0;
+    t4 = C14 * t10;
+    t0 = C13 * t1;
+    t10 = t4 - t0;
+    t1 = t12 + t9;
+    t4 = t2 + t14;
+    t0 = t7 + t3;
+    t12 = t13 - t11;
+    t9 = t8 + t10;
+    t2 = t5 - t6;
+    t14 = t8 - t10;
+    t8 = t5 + t6;
+    t10 = t7 - t3;
+    t5 = t13 + t11;
+    re[85] = t1;
+    im[85] = t4;
+    re[121] = t0;
+    im[121] = t12;
+    re[157] = t9;
+    im[157] = t2;
+    re[13] = t14;
+    im[13] = t8;
+    re[49] = t10;
+    im[49] = t5;
+    t6 = re[145];
+    t7 = im[145];
+    t3 = re[1];
+    t13 = im[1];
+    t11 = re[37];
+    t1 = im[37];
+    t4 = re[73];
+    t0 = im[73];
+    t12 = re[109];
+    t9 = im[109];
+    t2 = t3 + t12;
+    t14 = t13 + t9;
+    t8 = t11 + t4;
+    t10 = t1 + t0;
+    t5 = t3 - t12;
+    t3 = t13 - t9;
+    t12 = t11 - t4;
+    t13 = t1 - t0;
+    t9 = t2 + t8;
+    t11 = t14 + t10;
+    t4 = t2 - t8;
+    t1 = C11 * t4;
+    t0 = t14 - t10;
+    t2 = C11 * t0;
+    t8 = C12 * t9;
+    t4 = t6 - t8;
+    t14 = C12 * t11;
+    t10 = t7 - t14;
+    t0 = t4 + t1;
+    t8 = t10 + t2;
+    t14 = t4 - t1;
+    t4 = t10 - t2;
+    t1 = C13 * t5;
+    t10 = C14 * t12;
+    t2 = t1 + t10;
+    t1 = C13 * t3;
+    t10 = C14 * t13;
+    t1 = t1 + t10;
+    t10 = C14 * t5;
+    t5 = C13 * t12;
+    t12 = t10 - t5;
+    t10 = C14 * t3;
+    t5 = C13 * t13;
+    t3 = t10 - t5;
+    t13 = t6 + t9;
+    t10 = t7 + t11;
+    t5 = t0 + t1;
+    t6 = t8 - t2;
+    t9 = t14 + t3;
+    t7 = t4 - t12;
+    t11 = t14 - t3;
+    t14 = t4 + t12;
+    t3 = t0 - t1;
+    t4 = t8 + t2;
+    re[145] = t13;
+    im[145] = t10;
+    re[1] = t5;
+    im[1] = t6;
+    re[37] = t9;
+    im[37] = t7;
+    re[73] = t11;
+    im[73] = t14;
+    re[109] = t3;
+    im[109] = t4;
+    t12 = re[25];
+    t0 = im[25];
+    t1 = re[61];
+    t8 = im[61];
+    t2 = re[97];
+    t13 = im[97];
+    t10 = re[133];
+    t5 = im[133];
+    t6 = re[169];
+    t9 = im[169];
+    t7 = t1 + t6;
+    t11 = t8 + t9;
+    t14 = t2 + t10;
+    t3 = t13 + t5;
+    t4 = t1 - t6;
+    t1 = t8 - t9;
+    t6 = t2 - t10;
+    t8 = t13 - t5;
+    t9 = t7 + t14;
+    t2 = t11 + t3;
+    t10 = t7 - t14;
+    t13 = C11 * t10;
+    t5 = t11 - t3;
+    t7 = C11 * t5;
+    t14 = C12 * t9;
+    t10 = t12 - t14;
+    t11 = C12 * t2;
+    t3 = t0 - t11;
+    t5 = t10 + t13;
+    t14 = t3 + t7;
+    t11 = t10 - t13;
+    t10 = t3 - t7;
+    t13 = C13 * t4;
+    t3 = C14 * t6;
+    t7 = t13 + t3;
+    t13 = C13 * t1;
+    t3 = C14 * t8;
+    t13 = t13 + t3;
+    t3 = C14 * t4;
+    t4 = C13 * t6;
+    t6 = t3 - t4;
+    t3 = C14 * t1;
+    t4 = C13 * t8;
+    t1 = t3 - t4;
+    t8 = t12 + t9;
+    t3 = t0 + t2;
+    t4 = t5 + t13;
+    t12 = t14 - t7;
+    t9 = t11 + t1;
+    t0 = t10 - t6;
+    t2 = t11 - t1;
+    t11 = t10 + t6;
+    t1 = t5 - t13;
+    t10 = t14 + t7;
+    re[25] = t8;
+    im[25] = t3;
+    re[61] = t4;
+    im[61] = t12;
+    re[97] = t9;
+    im[97] = t0;
+    re[133] = t2;
+    im[133] = t11;
+    re[169] = t1;
+    im[169] = t10;
+}
+
+/**
+ *  Part 3 of ApplyMixedRadixPairedRFFT_180().
+ * 
+ *  @param {Number[]} re 
+ *    - The real part of each point.
+ *  @param {Number[]} im 
+ *    - The imaginary part of each point.
+ */
+function ApplyMixedRadixPairedRFFT_180_Part3(re, im) {
+    let t0, t1, t10, t11, t12, t13, t14, t2, t3, t4, t5, t6, t7, t8, t9;
+    const C0 = 0.5;
+    const C1 = 0.8660254037844386;
+    const C2 = 0.766044443118978;
+    const C3 = 1.4088320528055172;
+    const C4 = 0.12325683343243876;
+    const C5 = 0.17364817766693033;
+    const C6 = 1.1584559306791384;
+    const C7 = 0.8111595753452777;
+    const C8 = 0.9396926207859084;
+    const C9 = 0.5976724774602398;
+    const C10 = 1.281712764111577;
+    const C11 = 0.5590169943749475;
+    const C12 = 0.25;
+    const C13 = 0.9510565162951535;
+    const C14 = 0.5877852522924731;
+    t6 = re[90];
+    t5 = im[90];
+    t13 = re[150];
+    t14 = im[150];
+    t7 = re[30];
+    t8 = im[30];
+    t3 = t13 + t7;
+    t4 = t14 + t8;
+    t12 = C0 * t3;
+    t9 = t6 - t12;
+    t0 = C0 * t4;
+    t2 = t5 - t0;
+    t11 = t13 - t7;
+    t1 = C1 * t11;
+    t10 = t14 - t8;
+    t12 = C1 * t10;
+    t0 = t6 + t3;
+    t13 = t5 + t4;
+    t7 = t9 + t12;
+    t11 = t2 - t1;
+    t14 = t9 - t12;
+    t8 = t2 + t1;
+    re[90] = t0;
+    im[90] = t13;
+    re[150] = t7;
+    im[150] = t11;
+    re[30] = t14;
+    im[30] = t8;
+    t10 = re[110];
+    t6 = im[110];
+    t3 = re[170];
+    t5 = im[170];
+    t4 = re[50];
+    t9 = im[50];
+    t12 = t3 + t4;
+    t2 = t5 + t9;
+    t1 = C0 * t12;
+    t0 = t10 - t1;
+    t13 = C0 * t2;
+    t7 = t6 - t13;
+    t11 = t3 - t4;
+    t14 = C1 * t11;
+    t8 = t5 - t9;
+    t1 = C1 * t8;
+    t13 = t10 + t12;
+    t3 = t6 + t2;
+    t4 = t0 + t1;
+    t11 = t7 - t14;
+    t5 = t0 - t1;
+    t9 = t7 + t14;
+    t8 = t4 + t11;
+    t10 = C2 * t8;
+    t12 = t4 * (-C3);
+    t6 = t11 * C4;
+    t2 = t10 - t6;
+    t0 = t10 + t12;
+    t1 = t5 + t9;
+    t7 = C5 * t1;
+    t14 = t5 * (-C6);
+    t8 = t9 * (-C7);
+    t4 = t7 - t8;
+    t11 = t7 + t14;
+    re[110] = t13;
+    im[110] = t3;
+    re[170] = t2;
+    im[170] = t0;
+    re[50] = t4;
+    im[50] = t11;
+    t6 = re[130];
+    t10 = im[130];
+    t12 = re[10];
+    t1 = im[10];
+    t5 = re[70];
+    t9 = im[70];
+    t8 = t12 + t5;
+    t7 = t1 + t9;
+    t14 = C0 * t8;
+    t13 = t6 - t14;
+    t3 = C0 * t7;
+    t2 = t10 - t3;
+    t0 = t12 - t5;
+    t4 = C1 * t0;
+    t11 = t1 - t9;
+    t14 = C1 * t11;
+    t3 = t6 + t8;
+    t12 = t10 + t7;
+    t5 = t13 + t14;
+    t0 = t2 - t4;
+    t1 = t13 - t14;
+    t9 = t2 + t4;
+    t11 = t5 + t0;
+    t6 = C5 * t11;
+    t8 = t5 * (-C6);
+    t10 = t0 * (-C7);
+    t7 = t6 - t10;
+    t13 = t6 + t8;
+    t14 = t1 + t9;
+    t2 = (-C8) * t14;
+    t4 = t1 * C9;
+    t11 = t9 * (-C10);
+    t5 = t2 - t11;
+    t0 = t2 + t4;
+    re[130] = t3;
+    im[130] = t12;
+    re[10] = t7;
+    im[10] = t13;
+    re[70] = t5;
+    im[70] = t0;
+    t10 = re[90];
+    t6 = im[90];
+    t8 = re[110];
+    t14 = im[110];
+    t1 = re[130];
+    t9 = im[130];
+    t11 = t8 + t1;
+    t2 = t14 + t9;
+    t4 = C0 * t11;
+    t3 = t10 - t4;
+    t12 = C0 * t2;
+    t7 = t6 - t12;
+    t13 = t8 - t1;
+    t5 = C1 * t13;
+    t0 = t14 - t9;
+    t4 = C1 * t0;
+    t12 = t10 + t11;
+    t8 = t6 + t2;
+    t1 = t3 + t4;
+    t13 = t7 - t5;
+    t14 = t3 - t4;
+    t9 = t7 + t5;
+    re[90] = t12;
+    im[90] = t8;
+    re[110] = t1;
+    im[110] = t13;
+    re[130] = t14;
+    im[130] = t9;
+    t0 = re[150];
+    t10 = im[150];
+    t11 = re[170];
+    t6 = im[170];
+    t2 = re[10];
+    t3 = im[10];
+    t4 = t11 + t2;
+    t7 = t6 + t3;
+    t5 = C0 * t4;
+    t12 = t0 - t5;
+    t8 = C0 * t7;
+    t1 = t10 - t8;
+    t13 = t11 - t2;
+    t14 = C1 * t13;
+    t9 = t6 - t3;
+    t5 = C1 * t9;
+    t8 = t0 + t4;
+    t11 = t10 + t7;
+    t2 = t12 + t5;
+    t13 = t1 - t14;
+    t6 = t12 - t5;
+    t3 = t1 + t14;
+    re[150] = t8;
+    im[150] = t11;
+    re[170] = t2;
+    im[170] = t13;
+    re[10] = t6;
+    im[10] = t3;
+    t9 = re[30];
+    t0 = im[30];
+    t4 = re[50];
+    t10 = im[50];
+    t7 = re[70];
+    t12 = im[70];
+    t5 = t4 + t7;
+    t1 = t10 + t12;
+    t14 = C0 * t5;
+    t8 = t9 - t14;
+    t11 = C0 * t1;
+    t2 = t0 - t11;
+    t13 = t4 - t7;
+    t6 = C1 * t13;
+    t3 = t10 - t12;
+    t14 = C1 * t3;
+    t11 = t9 + t5;
+    t4 = t0 + t1;
+    t7 = t8 + t14;
+    t13 = t2 - t6;
+    t10 = t8 - t14;
+    t12 = t2 + t6;
+    re[30] = t11;
+    im[30] = t4;
+    re[50] = t7;
+    im[50] = t13;
+    re[70] = t10;
+    im[70] = t12;
+    t3 = re[126];
+    t9 = im[126];
+    t5 = re[6];
+    t0 = im[6];
+    t1 = re[66];
+    t8 = im[66];
+    t14 = t5 + t1;
+    t2 = t0 + t8;
+    t6 = C0 * t14;
+    t11 = t3 - t6;
+    t4 = C0 * t2;
+    t7 = t9 - t4;
+    t13 = t5 - t1;
+    t10 = C1 * t13;
+    t12 = t0 - t8;
+    t6 = C1 * t12;
+    t4 = t3 + t14;
+    t5 = t9 + t2;
+    t1 = t11 + t6;
+    t13 = t7 - t10;
+    t0 = t11 - t6;
+    t8 = t7 + t10;
+    re[126] = t4;
+    im[126] = t5;
+    re[6] = t1;
+    im[6] = t13;
+    re[66] = t0;
+    im[66] = t8;
+    t12 = re[146];
+    t3 = im[146];
+    t14 = re[26];
+    t9 = im[26];
+    t2 = re[86];
+    t11 = im[86];
+    t6 = t14 + t2;
+    t7 = t9 + t11;
+    t10 = C0 * t6;
+    t4 = t12 - t10;
+    t5 = C0 * t7;
+    t1 = t3 - t5;
+    t13 = t14 - t2;
+    t0 = C1 * t13;
+    t8 = t9 - t11;
+    t10 = C1 * t8;
+    t5 = t12 + t6;
+    t14 = t3 + t7;
+    t2 = t4 + t10;
+    t13 = t1 - t0;
+    t9 = t4 - t10;
+    t11 = t1 + t0;
+    t8 = t2 + t13;
+    t12 = C2 * t8;
+    t6 = t2 * (-C3);
+    t3 = t13 * C4;
+    t7 = t12 - t3;
+    t4 = t12 + t6;
+    t10 = t9 + t11;
+    t1 = C5 * t10;
+    t0 = t9 * (-C6);
+    t8 = t11 * (-C7);
+    t2 = t1 - t8;
+    t13 = t1 + t0;
+    re[146] = t5;
+    im[146] = t14;
+    re[26] = t7;
+    im[26] = t4;
+    re[86] = t2;
+    im[86] = t13;
+    t3 = re[166];
+    t12 = im[166];
+    t6 = re[46];
+    t10 = im[46];
+    t9 = re[106];
+    t11 = im[106];
+    t8 = t6 + t9;
+    t1 = t10 + t11;
+    t0 = C0 * t8;
+    t5 = t3 - t0;
+    t14 = C0 * t1;
+    t7 = t12 - t14;
+    t4 = t6 - t9;
+    t2 = C1 * t4;
+    t13 = t10 - t11;
+    t0 = C1 * t13;
+    t14 = t3 + t8;
+    t6 = t12 + t1;
+    t9 = t5 + t0;
+    t4 = t7 - t2;
+    t10 = t5 - t0;
+    t11 = t7 + t2;
+    t13 = t9 + t4;
+    t3 = C5 * t13;
+    t8 = t9 * (-C6);
+    t12 = t4 * (-C7);
+    t1 = t3 - t12;
+    t5 = t3 + t8;
+    t0 = t10 + t11;
+    t7 = (-C8) * t0;
+    t2 = t10 * C9;
+    t13 = t11 * (-C10);
+    t9 = t7 - t13;
+    t4 = t7 + t2;
+    re[166] = t14;
+    im[166] = t6;
+    re[46] = t1;
+    im[46] = t5;
+    re[106] = t9;
+    im[106] = t4;
+    t12 = re[126];
+    t3 = im[126];
+    t8 = re[146];
+    t0 = im[146];
+    t10 = re[166];
+    t11 = im[166];
+    t13 = t8 + t10;
+    t7 = t0 + t11;
+    t2 = C0 * t13;
+    t14 = t12 - t2;
+    t6 = C0 * t7;
+    t1 = t3 - t6;
+    t5 = t8 - t10;
+    t9 = C1 * t5;
+    t4 = t0 - t11;
+    t2 = C1 * t4;
+    t6 = t12 + t13;
+    t8 = t3 + t7;
+    t10 = t14 + t2;
+    t5 = t1 - t9;
+    t0 = t14 - t2;
+    t11 = t1 + t9;
+    re[126] = t6;
+    im[126] = t8;
+    re[146] = t10;
+    im[146] = t5;
+    re[166] = t0;
+    im[166] = t11;
+    t4 = re[6];
+    t12 = im[6];
+    t13 = re[26];
+    t3 = im[26];
+    t7 = re[46];
+    t14 = im[46];
+    t2 = t13 + t7;
+    t1 = t3 + t14;
+    t9 = C0 * t2;
+    t6 = t4 - t9;
+    t8 = C0 * t1;
+    t10 = t12 - t8;
+    t5 = t13 - t7;
+    t0 = C1 * t5;
+    t11 = t3 - t14;
+    t9 = C1 * t11;
+    t8 = t4 + t2;
+    t13 = t12 + t1;
+    t7 = t6 + t9;
+    t5 = t10 - t0;
+    t3 = t6 - t9;
+    t14 = t10 + t0;
+    re[6] = t8;
+    im[6] = t13;
+    re[26] = t7;
+    im[26] = t5;
+    re[46] = t3;
+    im[46] = t14;
+    t11 = re[66];
+    t4 = im[66];
+    t2 = re[86];
+    t12 = im[86];
+    t1 = re[106];
+    t6 = im[106];
+    t9 = t2 + t1;
+    t10 = t12 + t6;
+    t0 = C0 * t9;
+    t8 = t11 - t0;
+    t13 = C0 * t10;
+    t7 = t4 - t13;
+    t5 = t2 - t1;
+    t3 = C1 * t5;
+    t14 = t12 - t6;
+    t0 = C1 * t14;
+    t13 = t11 + t9;
+    t2 = t4 + t10;
+    t1 = t8 + t0;
+    t5 = t7 - t3;
+    t12 = t8 - t0;
+    t6 = t7 + t3;
+    re[66] = t13;
+    im[66] = t2;
+    re[86] = t1;
+    im[86] = t5;
+    re[106] = t12;
+    im[106] = t6;
+    t14 = re[162];
+    t11 = im[162];
+    t9 = re[42];
+    t4 = im[42];
+    t10 = re[102];
+    t8 = im[102];
+    t0 = t9 + t10;
+    t7 = t4 + t8;
+    t3 = C0 * t0;
+    t13 = t14 - t3;
+    t2 = C0 * t7;
+    t1 = t11 - t2;
+    t5 = t9 - t10;
+    t12 = C1 * t5;
+    t6 = t4 - t8;
+    t3 = C1 * t6;
+    t2 = t14 + t0;
+    t9 = t11 + t7;
+    t10 = t13 + t3;
+    t5 = t1 - t12;
+    t4 = t13 - t3;
+    t8 = t1 + t12;
+    re[162] = t2;
+    im[162] = t9;
+    re[42] = t10;
+    im[42] = t5;
+    re[102] = t4;
+    im[102] = t8;
+    t6 = re[2];
+    t14 = im[2];
+    t0 = re[62];
+    t11 = im[62];
+    t7 = re[122];
+    t13 = im[122];
+    t3 = t0 + t7;
+    t1 = t11 + t13;
+    t12 = C0 * t3;
+    t2 = t6 - t12;
+    t9 = C0 * t1;
+    t10 = t14 - t9;
+    t5 = t0 - t7;
+    t4 = C1 * t5;
+    t8 = t11 - t13;
+    t12 = C1 * t8;
+    t9 = t6 + t3;
+    t0 = t14 + t1;
+    t7 = t2 + t12;
+    t5 = t10 - t4;
+    t11 = t2 - t12;
+    t13 = t10 + t4;
+    t8 = t7 + t5;
+    t6 = C2 * t8;
+    t3 = t7 * (-C3);
+    t14 = t5 * C4;
+    t1 = t6 - t14;
+    t2 = t6 + t3;
+    t12 = t11 + t13;
+    t10 = C5 * t12;
+    t4 = t11 * (-C6);
+    t8 = t13 * (-C7);
+    t7 = t10 - t8;
+    t5 = t10 + t4;
+    re[2] = t9;
+    im[2] = t0;
+    re[62] = t1;
+    im[62] = t2;
+    re[122] = t7;
+    im[122] = t5;
+    t14 = re[22];
+    t6 = im[22];
+    t3 = re[82];
+    t12 = im[82];
+    t11 = re[142];
+    t13 = im[142];
+    t8 = t3 + t11;
+    t10 = t12 + t13;
+    t4 = C0 * t8;
+    t9 = t14 - t4;
+    t0 = C0 * t10;
+    t1 = t6 - t0;
+    t2 = t3 - t11;
+    t7 = C1 * t2;
+    t5 = t12 - t13;
+    t4 = C1 * t5;
+    t0 = t14 + t8;
+    t3 = t6 + t10;
+    t11 = t9 + t4;
+    t2 = t1 - t7;
+    t12 = t9 - t4;
+    t13 = t1 + t7;
+    t5 = t11 + t2;
+    t14 = C5 * t5;
+    t8 = t11 * (-C6);
+    t6 = t2 * (-C7);
+    t10 = t14 - t6;
+    t9 = t14 + t8;
+    t4 = t12 + t13;
+    t1 = (-C8) * t4;
+    t7 = t12 * C9;
+    t5 = t13 * (-C10);
+    t11 = t1 - t5;
+    t2 = t1 + t7;
+    re[22] = t0;
+    im[22] = t3;
+    re[82] = t10;
+    im[82] = t9;
+    re[142] = t11;
+    im[142] = t2;
+    t6 = re[162];
+    t14 = im[162];
+    t8 = re[2];
+    t4 = im[2];
+    t12 = re[22];
+    t13 = im[22];
+    t5 = t8 + t12;
+    t1 = t4 + t13;
+    t7 = C0 * t5;
+    t0 = t6 - t7;
+    t3 = C0 * t1;
+    t10 = t14 - t3;
+    t9 = t8 - t12;
+    t11 = C1 * t9;
+    t2 = t4 - t13;
+    t7 = C1 * t2;
+    t3 = t6 + t5;
+    t8 = t14 + t1;
+    t12 = t0 + t7;
+    t9 = t10 - t11;
+    t4 = t0 - t7;
+    t13 = t10 + t11;
+    re[162] = t3;
+    im[162] = t8;
+    re[2] = t12;
+    im[2] = t9;
+    re[22] = t4;
+    im[22] = t13;
+    t2 = re[42];
+    t6 = im[42];
+    t5 = re[62];
+    t14 = im[62];
+    t1 = re[82];
+    t0 = im[82];
+    t7 = t5 + t1;
+    t10 = t14 + t0;
+    t11 = C0 * t7;
+    t3 = t2 - t11;
+    t8 = C0 * t10;
+    t12 = t6 - t8;
+    t9 = t5 - t1;
+    t4 = C1 * t9;
+    t13 = t14 - t0;
+    t11 = C1 * t13;
+    t8 = t2 + t7;
+    t5 = t6 + t10;
+    t1 = t3 + t11;
+    t9 = t12 - t4;
+    t14 = t3 - t11;
+    t0 = t12 + t4;
+    re[42] = t8;
+    im[42] = t5;
+    re[62] = t1;
+    im[62] = t9;
+    re[82] = t14;
+    im[82] = t0;
+    t13 = re[102];
+    t2 = im[102];
+    t7 = re[122];
+    t6 = im[122];
+    t10 = re[142];
+    t3 = im[142];
+    t11 = t7 + t10;
+    t12 = t6 + t3;
+    t4 = C0 * t11;
+    t8 = t13 - t4;
+    t5 = C0 * t12;
+    t1 = t2 - t5;
+    t9 = t7 - t10;
+    t14 = C1 * t9;
+    t0 = t6 - t3;
+    t4 = C1 * t0;
+    t5 = t13 + t11;
+    t7 = t2 + t12;
+    t10 = t8 + t4;
+    t9 = t1 - t14;
+    t6 = t8 - t4;
+    t3 = t1 + t14;
+    re[102] = t5;
+    im[102] = t7;
+    re[122] = t10;
+    im[122] = t9;
+    re[142] = t6;
+    im[142] = t3;
+    t0 = re[18];
+    t13 = im[18];
+    t11 = re[78];
+    t2 = im[78];
+    t12 = re[138];
+    t8 = im[138];
+    t4 = t11 + t12;
+    t1 = t2 + t8;
+    t14 = C0 * t4;
+    t5 = t0 - t14;
+    t7 = C0 * t1;
+    t10 = t13 - t7;
+    t9 = t11 - t12;
+    t6 = C1 * t9;
+    t3 = t2 - t8;
+    t14 = C1 * t3;
+    t7 = t0 + t4;
+    t11 = t13 + t1;
+    t12 = t5 + t14;
+    t9 = t10 - t6;
+    t2 = t5 - t14;
+    t8 = t10 + t6;
+    re[18] = t7;
+    im[18] = t11;
+    re[78] = t12;
+    im[78] = t9;
+    re[138] = t2;
+    im[138] = t8;
+    t3 = re[38];
+    t0 = im[38];
+    t4 = re[98];
+    t13 = im[98];
+    t1 = re[158];
+    t5 = im[158];
+    t14 = t4 + t1;
+    t10 = t13 + t5;
+    t6 = C0 * t14;
+    t7 = t3 - t6;
+    t11 = C0 * t10;
+    t12 = t0 - t11;
+    t9 = t4 - t1;
+    t2 = C1 * t9;
+    t8 = t13 - t5;
+    t6 = C1 * t8;
+    t11 = t3 + t14;
+    t4 = t0 + t10;
+    t1 = t7 + t6;
+    t9 = t12 - t2;
+    t13 = t7 - t6;
+    t5 = t12 + t2;
+    t8 = t1 + t9;
+    t3 = C2 * t8;
+    t14 = t1 * (-C3);
+    t0 = t9 * C4;
+    t10 = t3 - t0;
+    t7 = t3 + t14;
+    t6 = t13 + t5;
+    t12 = C5 * t6;
+    t2 = t13 * (-C6);
+    t8 = t5 * (-C7);
+    t1 = t12 - t8;
+    t9 = t12 + t2;
+    re[38] = t11;
+    im[38] = t4;
+    re[98] = t10;
+    im[98] = t7;
+    re[158] = t1;
+    im[158] = t9;
+    t0 = re[58];
+    t3 = im[58];
+    t14 = re[118];
+    t6 = im[118];
+    t13 = re[178];
+    t5 = im[178];
+    t8 = t14 + t13;
+    t12 = t6 + t5;
+    t2 = C0 * t8;
+    t11 = t0 - t2;
+    t4 = C0 * t12;
+    t10 = t3 - t4;
+    t7 = t14 - t13;
+    t1 = C1 * t7;
+    t9 = t6 - t5;
+    t2 = C1 * t9;
+    t4 = t0 + t8;
+    t14 = t3 + t12;
+    t13 = t11 + t2;
+    t7 = t10 - t1;
+    t6 = t11 - t2;
+    t5 = t10 + t1;
+    t9 = t13 + t7;
+    t0 = C5 * t9;
+    t8 = t13 * (-C6);
+    t3 = t7 * (-C7);
+    t12 = t0 - t3;
+    t11 = t0 + t8;
+    t2 = t6 + t5;
+    t10 = (-C8) * t2;
+    t1 = t6 * C9;
+    t9 = t5 * (-C10);
+    t13 = t10 - t9;
+    t7 = t10 + t1;
+    re[58] = t4;
+    im[58] = t14;
+    re[118] = t12;
+    im[118] = t11;
+    re[178] = t13;
+    im[178] = t7;
+    t3 = re[18];
+    t0 = im[18];
+    t8 = re[38];
+    t2 = im[38];
+    t6 = re[58];
+    t5 = im[58];
+    t9 = t8 + t6;
+    t10 = t2 + t5;
+    t1 = C0 * t9;
+    t4 = t3 - t1;
+    t14 = C0 * t10;
+    t12 = t0 - t14;
+    t11 = t8 - t6;
+    t13 = C1 * t11;
+    t7 = t2 - t5;
+    t1 = C1 * t7;
+    t14 = t3 + t9;
+    t8 = t0 + t10;
+    t6 = t4 + t1;
+    t11 = t12 - t13;
+    t2 = t4 - t1;
+    t5 = t12 + t13;
+    re[18] = t14;
+    im[18] = t8;
+    re[38] = t6;
+    im[38] = t11;
+    re[58] = t2;
+    im[58] = t5;
+    t7 = re[78];
+    t3 = im[78];
+    t9 = re[98];
+    t0 = im[98];
+    t10 = re[118];
+    t4 = im[118];
+    t1 = t9 + t10;
+    t12 = t0 + t4;
+    t13 = C0 * t1;
+    t14 = t7 - t13;
+    t8 = C0 * t12;
+    t6 = t3 - t8;
+    t11 = t9 - t10;
+    t2 = C1 * t11;
+    t5 = t0 - t4;
+    t13 = C1 * t5;
+    t8 = t7 + t1;
+    t9 = t3 + t12;
+    t10 = t14 + t13;
+    t11 = t6 - t2;
+    t0 = t14 - t13;
+    t4 = t6 + t2;
+    re[78] = t8;
+    im[78] = t9;
+    re[98] = t10;
+    im[98] = t11;
+    re[118] = t0;
+    im[118] = t4;
+    t5 = re[138];
+    t7 = im[138];
+    t1 = re[158];
+    t3 = im[158];
+    t12 = re[178];
+    t14 = im[178];
+    t13 = t1 + t12;
+    t6 = t3 + t14;
+    t2 = C0 * t13;
+    t8 = t5 - t2;
+    t9 = C0 * t6;
+    t10 = t7 - t9;
+    t11 = t1 - t12;
+    t0 = C1 * t11;
+    t4 = t3 - t14;
+    t2 = C1 * t4;
+    t9 = t5 + t13;
+    t1 = t7 + t6;
+    t12 = t8 + t2;
+    t11 = t10 - t0;
+    t3 = t8 - t2;
+    t14 = t10 + t0;
+    re[138] = t9;
+    im[138] = t1;
+    re[158] = t12;
+    im[158] = t11;
+    re[178] = t3;
+    im[178] = t14;
+    t4 = re[54];
+    t5 = im[54];
+    t13 = re[114];
+    t7 = im[114];
+    t6 = re[174];
+    t8 = im[174];
+    t2 = t13 + t6;
+    t10 = t7 + t8;
+    t0 = C0 * t2;
+    t9 = t4 - t0;
+    t1 = C0 * t10;
+    t12 = t5 - t1;
+    t11 = t13 - t6;
+    t3 = C1 * t11;
+    t14 = t7 - t8;
+    t0 = C1 * t14;
+    t1 = t4 + t2;
+    t13 = t5 + t10;
+    t6 = t9 + t0;
+    t11 = t12 - t3;
+    t7 = t9 - t0;
+    t8 = t12 + t3;
+    re[54] = t1;
+    im[54] = t13;
+    re[114] = t6;
+    im[114] = t11;
+    re[174] = t7;
+    im[174] = t8;
+    t14 = re[74];
+    t4 = im[74];
+    t2 = re[134];
+    t5 = im[134];
+    t10 = re[14];
+    t9 = im[14];
+    t0 = t2 + t10;
+    t12 = t5 + t9;
+    t3 = C0 * t0;
+    t1 = t14 - t3;
+    t13 = C0 * t12;
+    t6 = t4 - t13;
+    t11 = t2 - t10;
+    t7 = C1 * t11;
+    t8 = t5 - t9;
+    t3 = C1 * t8;
+    t13 = t14 + t0;
+    t2 = t4 + t12;
+    t10 = t1 + t3;
+    t11 = t6 - t7;
+    t5 = t1 - t3;
+    t9 = t6 + t7;
+    t8 = t10 + t11;
+    t14 = C2 * t8;
+    t0 = t10 * (-C3);
+    t4 = t11 * C4;
+    t12 = t14 - t4;
+    t1 = t14 + t0;
+    t3 = t5 + t9;
+    t6 = C5 * t3;
+    t7 = t5 * (-C6);
+    t8 = t9 * (-C7);
+    t10 = t6 - t8;
+    t11 = t6 + t7;
+    re[74] = t13;
+    im[74] = t2;
+    re[134] = t12;
+    im[134] = t1;
+    re[14] = t10;
+    im[14] = t11;
+    t4 = re[94];
+    t14 = im[94];
+    t0 = re[154];
+    t3 = im[154];
+    t5 = re[34];
+    t9 = im[34];
+    t8 = t0 + t5;
+    t6 = t3 + t9;
+    t7 = C0 * t8;
+    t13 = t4 - t7;
+    t2 = C0 * t6;
+    t12 = t14 - t2;
+    t1 = t0 - t5;
+    t10 = C1 * t1;
+    t11 = t3 - t9;
+    t7 = C1 * t11;
+    t2 = t4 + t8;
+    t0 = t14 + t6;
+    t5 = t13 + t7;
+    t1 = t12 - t10;
+    t3 = t13 - t7;
+    t9 = t12 + t10;
+    t11 = t5 + t1;
+    t4 = C5 * t11;
+    t8 = t5 * (-C6);
+    t14 = t1 * (-C7);
+    t6 = t4 - t14;
+    t13 = t4 + t8;
+    t7 = t3 + t9;
+    t12 = (-C8) * t7;
+    t10 = t3 * C9;
+    t11 = t9 * (-C10);
+    t5 = t12 - t11;
+    t1 = t12 + t10;
+    re[94] = t2;
+    im[94] = t0;
+    re[154] = t6;
+    im[154] = t13;
+    re[34] = t5;
+    im[34] = t1;
+    t14 = re[54];
+    t4 = im[54];
+    t8 = re[74];
+    t7 = im[74];
+    t3 = re[94];
+    t9 = im[94];
+    t11 = t8 + t3;
+    t12 = t7 + t9;
+    t10 = C0 * t11;
+    t2 = t14 - t10;
+    t0 = C0 * t12;
+    t6 = t4 - t0;
+    t13 = t8 - t3;
+    t5 = C1 * t13;
+    t1 = t7 - t9;
+    t10 = C1 * t1;
+    t0 = t14 + t11;
+    t8 = t4 + t12;
+    t3 = t2 + t10;
+    t13 = t6 - t5;
+    t7 = t2 - t10;
+    t9 = t6 + t5;
+    re[54] = t0;
+    im[54] = t8;
+    re[74] = t3;
+    im[74] = t13;
+    re[94] = t7;
+    im[94] = t9;
+    t1 = re[114];
+    t14 = im[114];
+    t11 = re[134];
+    t4 = im[134];
+    t12 = re[154];
+    t2 = im[154];
+    t10 = t11 + t12;
+    t6 = t4 + t2;
+    t5 = C0 * t10;
+    t0 = t1 - t5;
+    t8 = C0 * t6;
+    t3 = t14 - t8;
+    t13 = t11 - t12;
+    t7 = C1 * t13;
+    t9 = t4 - t2;
+    t5 = C1 * t9;
+    t8 = t1 + t10;
+    t11 = t14 + t6;
+    t12 = t0 + t5;
+    t13 = t3 - t7;
+    t4 = t0 - t5;
+    t2 = t3 + t7;
+    re[114] = t8;
+    im[114] = t11;
+    re[134] = t12;
+    im[134] = t13;
+    re[154] = t4;
+    im[154] = t2;
+    t9 = re[174];
+    t1 = im[174];
+    t10 = re[14];
+    t14 = im[14];
+    t6 = re[34];
+    t0 = im[34];
+    t5 = t10 + t6;
+    t3 = t14 + t0;
+    t7 = C0 * t5;
+    t8 = t9 - t7;
+    t11 = C0 * t3;
+    t12 = t1 - t11;
+    t13 = t10 - t6;
+    t4 = C1 * t13;
+    t2 = t14 - t0;
+    t7 = C1 * t2;
+    t11 = t9 + t5;
+    t10 = t1 + t3;
+    t6 = t8 + t7;
+    t13 = t12 - t4;
+    t14 = t8 - t7;
+    t0 = t12 + t4;
+    re[174] = t11;
+    im[174] = t10;
+    re[14] = t6;
+    im[14] = t13;
+    re[34] = t14;
+    im[34] = t0;
+    t2 = re[90];
+    t9 = im[90];
+    t5 = re[126];
+    t1 = im[126];
+    t3 = re[162];
+    t8 = im[162];
+    t7 = re[18];
+    t12 = im[18];
+    t4 = re[54];
+    t11 = im[54];
+    t10 = t5 + t4;
+    t6 = t1 + t11;
+    t13 = t3 + t7;
+    t14 = t8 + t12;
+    t0 = t5 - t4;
+    t5 = t1 - t11;
+    t4 = t3 - t7;
+    t1 = t8 - t12;
+    t11 = t10 + t13;
+    t3 = t6 + t14;
+    t7 = t10 - t13;
+    t8 = C11 * t7;
+    t12 = t6 - t14;
+    t10 = C11 * t12;
+    t13 = C12 * t11;
+    t7 = t2 - t13;
+    t6 = C12 * t3;
+    t14 = t9 - t6;
+    t12 = t7 + t8;
+    t13 = t14 + t10;
+    t6 = t7 - t8;
+    t7 = t14 - t10;
+    t8 = C13 * t0;
+    t14 = C14 * t4;
+    t10 = t8 + t14;
+    t8 = C13 * t5;
+    t14 = C14 * t1;
+    t8 = t8 + t14;
+    t14 = C14 * t0;
+    t0 = C13 * t4;
+    t4 = t14 - t0;
+    t14 = C14 * t5;
+    t0 = C13 * t1;
+    t5 = t14 - t0;
+    t1 = t2 + t11;
+    t14 = t9 + t3;
+    t0 = t12 + t8;
+    t2 = t13 - t10;
+    t11 = t6 + t5;
+    t9 = t7 - t4;
+    t3 = t6 - t5;
+    t6 = t7 + t4;
+    t5 = t12 - t8;
+    t7 = t13 + t10;
+    re[90] = t1;
+    im[90] = t14;
+    re[126] = t0;
+    im[126] = t2;
+    re[162] = t11;
+    im[162] = t9;
+    re[18] = t3;
+    im[18] = t6;
+    re[54] = t5;
+    im[54] = t7;
+    t4 = re[150];
+    t12 = im[150];
+    t8 = re[6];
+    t13 = im[6];
+    t10 = re[42];
+    t1 = im[42];
+    t14 = re[78];
+    t0 = im[78];
+    t2 = re[114];
+    t11 = im[114];
+    t9 = t8 + t2;
+    t3 = t13 + t11;
+    t6 = t10 + t14;
+    t5 = t1 + t0;
+    t7 = t8 - t2;
+    t8 = t13 - t11;
+    t2 = t10 - t14;
+    t13 = t1 - t0;
+    t11 = t9 + t6;
+    t10 = t3 + t5;
+    t14 = t9 - t6;
+    t1 = C11 * t14;
+    t0 = t3 - t5;
+    t9 = C11 * t0;
+    t6 = C12 * t11;
+    t14 = t4 - t6;
+    t3 = C12 * t10;
+    t5 = t12 - t3;
+    t0 = t14 + t1;
+    t6 = t5 + t9;
+    t3 = t14 - t1;
+    t14 = t5 - t9;
+    t1 = C13 * t7;
+    t5 = C14 * t2;
+    t9 = t1 + t5;
+    t1 = C13 * t8;
+    t5 = C14 * t13;
+    t1 = t1 + t5;
+    t5 = C14 * t7;
+    t7 = C13 * t2;
+    t2 = t5 - t7;
+    t5 = C14 * t8;
+    t7 = C13 * t13;
+    t8 = t5 - t7;
+    t13 = t4 + t11;
+    t5 = t12 + t10;
+    t7 = t0 + t1;
+    t4 = t6 - t9;
+    t11 = t3 + t8;
+    t12 = t14 - t2;
+    t10 = t3 - t8;
+    t3 = t14 + t2;
+    t8 = t0 - t1;
+    t14 = t6 + t9;
+    re[150] = t13;
+    im[150] = t5;
+    re[6] = t7;
+    im[6] = t4;
+    re[42] = t11;
+    im[42] = t12;
+    re[78] = t10;
+    im[78] = t3;
+    re[114] = t8;
+    im[114] = t14;
+    t2 = re[30];
+    t0 = im[30];
+    t1 = re[66];
+    t6 = im[66];
+    t9 = re[102];
+    t13 = im[102];
+    t5 = re[138];
+    t7 = im[138];
+    t4 = re[174];
+    t11 = im[174];
+    t12 = t1 + t4;
+    t10 = t6 + t11;
+    t3 = t9 + t5;
+    t8 = t13 + t7;
+    t14 = t1 - t4;
+    t1 = t6 - t11;
+    t4 = t9 - t5;
+    t6 = t13 - t7;
+    t11 = t12 + t3;
+    t9 = t10 + t8;
+    t5 = t12 - t3;
+    t13 = C11 * t5;
+    t7 = t10 - t8;
+    t12 = C11 * t7;
+    t3 = C12 * t11;
+    t5 = t2 - t3;
+    t10 = C12 * t9;
+    t8 = t0 - t10;
+    t7 = t5 + t13;
+    t3 = t8 + t12;
+    t10 = t5 - t13;
+    t5 = t8 - t12;
+    t13 = C13 * t14;
+    t8 = C14 * t4;
+    t12 = t13 + t8;
+    t13 = C13 * t1;
+    t8 = C14 * t6;
+    t13 = t13 + t8;
+    t8 = C14 * t14;
+    t14 = C13 * t4;
+    t4 = t8 - t14;
+    t8 = C14 * t1;
+    t14 = C13 * t6;
+    t1 = t8 - t14;
+    t6 = t2 + t11;
+    t8 = t0 + t9;
+    t14 = t7 + t13;
+    t2 = t3 - t12;
+    t11 = t10 + t1;
+    t0 = t5 - t4;
+    t9 = t10 - t1;
+    t10 = t5 + t4;
+    t1 = t7 - t13;
+    t5 = t3 + t12;
+    re[30] = t6;
+    im[30] = t8;
+    re[66] = t14;
+    im[66] = t2;
+    re[102] = t11;
+    im[102] = t0;
+    re[138] = t9;
+    im[138] = t10;
+    re[174] = t1;
+    im[174] = t5;
+    t4 = re[110];
+    t7 = im[110];
+    t13 = re[146];
+    t3 = im[146];
+    t12 = re[2];
+    t6 = im[2];
+    t8 = re[38];
+    t14 = im[38];
+    t2 = re[74];
+    t11 = im[74];
+    t0 = t13 + t2;
+    t9 = t3 + t11;
+    t10 = t12 + t8;
+    t1 = t6 + t14;
+    t5 = t13 - t2;
+    t13 = t3 - t11;
+    t2 = t12 - t8;
+    t3 = t6 - t14;
+    t11 = t0 + t10;
+    t12 = t9 + t1;
+    t8 = t0 - t10;
+    t6 = C11 * t8;
+    t14 = t9 - t1;
+    t0 = C11 * t14;
+    t10 = C12 * t11;
+    t8 = t4 - t10;
+    t9 = C12 * t12;
+    t1 = t7 - t9;
+    t14 = t8 + t6;
+    t10 = t1 + t0;
+    t9 = t8 - t6;
+    t8 = t1 - t0;
+    t6 = C13 * t5;
+    t1 = C14 * t2;
+    t0 = t6 + t1;
+    t6 = C13 * t13;
+    t1 = C14 * t3;
+    t6 = t6 + t1;
+    t1 = C14 * t5;
+    t5 = C13 * t2;
+    t2 = t1 - t5;
+    t1 = C14 * t13;
+    t5 = C13 * t3;
+    t13 = t1 - t5;
+    t3 = t4 + t11;
+    t1 = t7 + t12;
+    t5 = t14 + t6;
+    t4 = t10 - t0;
+    t11 = t9 + t13;
+    t7 = t8 - t2;
+    t12 = t9 - t13;
+    t9 = t8 + t2;
+    t13 = t14 - t6;
+    t8 = t10 + t0;
+    re[110] = t3;
+    im[110] = t1;
+    re[146] = t5;
+    im[146] = t4;
+    re[2] = t11;
+    im[2] = t7;
+    re[38] = t12;
+    im[38] = t9;
+    re[74] = t13;
+    im[74] = t8;
+    t2 = re[170];
+    t14 = im[170];
+    t6 = re[26];
+    t10 = im[26];
+    t0 = re[62];
+    t3 = im[62];
+    t1 = re[98];
+    t5 = im[98];
+    t4 = re[134];
+    t11 = im[134];
+    t7 = t6 + t4;
+    t12 = t10 + t11;
+    t9 = t0 + t1;
+    t13 = t3 + t5;
+    t8 = t6 - t4;
+    t6 = t10 - t11;
+    t4 = t0 - t1;
+    t10 = t3 - t5;
+    t11 = t7 + t9;
+    t0 = t12 + t13;
+    t1 = t7 - t9;
+    t3 = C11 * t1;
+    t5 = t12 - t13;
+    t7 = C11 * t5;
+    t9 = C12 * t11;
+    t1 = t2 - t9;
+    t12 = C12 * t0;
+    t13 = t14 - t12;
+    t5 = t1 + t3;
+    t9 = t13 + t7;
+    t12 = t1 - t3;
+    t1 = t13 - t7;
+    t3 = C13 * t8;
+    t13 = C14 * t4;
+    t7 = t3 + t13;
+    t3 = C13 * t6;
+    t13 = C14 * t10;
+    t3 = t3 + t13;
+    t13 = C14 * t8;
+    t8 = C13 * t4;
+    t4 = t13 - t8;
+    t13 = C14 * t6;
+    t8 = C13 * t10;
+    t6 = t13 - t8;
+    t10 = t2 + t11;
+    t13 = t14 + t0;
+    t8 = t5 + t3;
+    t2 = t9 - t7;
+    t11 = t12 + t6;
+    t14 = t1 - t4;
+    t0 = t12 - t6;
+    t12 = t1 + t4;
+    t6 = t5 - t3;
+    t1 = t9 + t7;
+    re[170] = t10;
+    im[170] = t13;
+    re[26] = t8;
+    im[26] = t2;
+    re[62] = t11;
+    im[62] = t14;
+    re[98] = t0;
+    im[98] = t12;
+    re[134] = t6;
+    im[134] = t1;
+    t4 = re[50];
+    t5 = im[50];
+    t3 = re[86];
+    t9 = im[86];
+    t7 = re[122];
+    t10 = im[122];
+    t13 = re[158];
+    t8 = im[158];
+    t2 = re[14];
+    t11 = im[14];
+    t14 = t3 + t2;
+    t0 = t9 + t11;
+    t12 = t7 + t13;
+    t6 = t10 + t8;
+    t1 = t3 - t2;
+    t3 = t9 - t11;
+    t2 = t7 - t13;
+    t9 = t10 - t8;
+    t11 = t14 + t12;
+    t7 = t0 + t6;
+    t13 = t14 - t12;
+    t10 = C11 * t13;
+    t8 = t0 - t6;
+    t14 = C11 * t8;
+    t12 = C12 * t11;
+    t13 = t4 - t12;
+    t0 = C12 * t7;
+    t6 = t5 - t0;
+    t8 = t13 + t10;
+    t12 = t6 + t14;
+    t0 = t13 - t10;
+    t13 = t6 - t14;
+    t10 = C13 * t1;
+    t6 = C14 * t2;
+    t14 = t10 + t6;
+    t10 = C13 * t3;
+    t6 = C14 * t9;
+    t10 = t10 + t6;
+    t6 = C14 * t1;
+    t1 = C13 * t2;
+    t2 = t6 - t1;
+    t6 = C14 * t3;
+    t1 = C13 * t9;
+    t3 = t6 - t1;
+    t9 = t4 + t11;
+    t6 = t5 + t7;
+    t1 = t8 + t10;
+    t4 = t12 - t14;
+    t11 = t0 + t3;
+    t5 = t13 - t2;
+    t7 = t0 - t3;
+    t0 = t13 + t2;
+    t3 = t8 - t10;
+    t13 = t12 + t14;
+    re[50] = t9;
+    im[50] = t6;
+    re[86] = t1;
+    im[86] = t4;
+    re[122] = t11;
+    im[122] = t5;
+    re[158] = t7;
+    im[158] = t0;
+    re[14] = t3;
+    im[14] = t13;
+    t2 = re[130];
+    t8 = im[130];
+    t10 = re[166];
+    t12 = im[166];
+    t14 = re[22];
+    t9 = im[22];
+    t6 = re[58];
+    t1 = im[58];
+    t4 = re[94];
+    t11 = im[94];
+    t5 = t10 + t4;
+    t7 = t12 + t11;
+    t0 = t14 + t6;
+    t3 = t9 + t1;
+    t13 = t10 - t4;
+    t10 = t12 - t11;
+    t4 = t14 - t6;
+    t12 = t9 - t1;
+    t11 = t5 + t0;
+    t14 = t7 + t3;
+    t6 = t5 - t0;
+    t9 = C11 * t6;
+    t1 = t7 - t3;
+    t5 = C11 * t1;
+    t0 = C12 * t11;
+    t6 = t2 - t0;
+    t7 = C12 * t14;
+    t3 = t8 - t7;
+    t1 = t6 + t9;
+    t0 = t3 + t5;
+    t7 = t6 - t9;
+    t6 = t3 - t5;
+    t9 = C13 * t13;
+    t3 = C14 * t4;
+    t5 = t9 + t3;
+    t9 = C13 * t10;
+    t3 = C14 * t12;
+    t9 = t9 + t3;
+    t3 = C14 * t13;
+    t13 = C13 * t4;
+    t4 = t3 - t13;
+    t3 = C14 * t10;
+    t13 = C13 * t12;
+    t10 = t3 - t13;
+    t12 = t2 + t11;
+    t3 = t8 + t14;
+    t13 = t1 + t9;
+    t2 = t0 - t5;
+    t11 = t7 + t10;
+    t8 = t6 - t4;
+    t14 = t7 - t10;
+    t7 = t6 + t4;
+    t10 = t1 - t9;
+    t6 = t0 + t5;
+    re[130] = t12;
+    im[130] = t3;
+    re[166] = t13;
+    im[166] = t2;
+    re[22] = t11;
+    im[22] = t8;
+    re[58] = t14;
+    im[58] = t7;
+    re[94] = t10;
+    im[94] = t6;
+    t4 = re[10];
+    t1 = im[10];
+    t9 = re[46];
+    t0 = im[46];
+    t5 = re[82];
+    t12 = im[82];
+    t3 = re[118];
+    t13 = im[118];
+    t2 = re[154];
+    t11 = im[154];
+    t8 = t9 + t2;
+    t14 = t0 + t11;
+    t7 = t5 + t3;
+    t10 = t12 + t13;
+    t6 = t9 - t2;
+    t9 = t0 - t11;
+    t2 = t5 - t3;
+    t0 = t12 - t13;
+    t11 = t8 + t7;
+    t5 = t14 + t10;
+    t3 = t8 - t7;
+    t12 = C11 * t3;
+    t13 = t14 - t10;
+    t8 = C11 * t13;
+    t7 = C12 * t11;
+    t3 = t4 - t7;
+    t14 = C12 * t5;
+    t10 = t1 - t14;
+    t13 = t3 + t12;
+    t7 = t10 + t8;
+    t14 = t3 - t12;
+    t3 = t10 - t8;
+    t12 = C13 * t6;
+    t10 = C14 * t2;
+    t8 = t12 + t10;
+    t12 = C13 * t9;
+    t10 = C14 * t0;
+    t12 = t12 + t10;
+    t10 = C14 * t6;
+    t6 = C13 * t2;
+    t2 = t10 - t6;
+    t10 = C14 * t9;
+    t6 = C13 * t0;
+    t9 = t10 - t6;
+    t0 = t4 + t11;
+    t10 = t1 + t5;
+    t6 = t13 + t12;
+    t4 = t7 - t8;
+    t11 = t14 + t9;
+    t1 = t3 - t2;
+    t5 = t14 - t9;
+    t14 = t3 + t2;
+    t9 = t13 - t12;
+    t3 = t7 + t8;
+    re[10] = t0;
+    im[10] = t10;
+    re[46] = t6;
+    im[46] = t4;
+    re[82] = t11;
+    im[82] = t1;
+    re[118] = t5;
+    im[118] = t14;
+    re[154] = t9;
+    im[154] = t3;
+    t2 = re[70];
+    t13 = im[70];
+    t12 = re[106];
+    t7 = im[106];
+    t8 = re[142];
+    t0 = im[142];
+    t10 = re[178];
+    t6 = im[178];
+    t4 = re[34];
+    t11 = im[34];
+    t1 = t12 + t4;
+    t5 = t7 + t11;
+    t14 = t8 + t10;
+    t9 = t0 + t6;
+    t3 = t12 - t4;
+    t12 = t7 - t11;
+    t4 = t8 - t10;
+    t7 = t0 - t6;
+    t11 = t1 + t14;
+    t8 = t5 + t9;
+    t10 = t1 - t14;
+    t0 = C11 * t10;
+    t6 = t5 - t9;
+    t1 = C11 * t6;
+    t14 = C12 * t11;
+    t10 = t2 - t14;
+    t5 = C12 * t8;
+    t9 = t13 - t5;
+    t6 = t10 + t0;
+    t14 = t9 + t1;
+    t5 = t10 - t0;
+    t10 = t9 - t1;
+    t0 = C13 * t3;
+    t9 = C14 * t4;
+    t1 = t0 + t9;
+    t0 = C13 * t12;
+    t9 = C14 * t7;
+    t0 = t0 + t9;
+    t9 = C14 * t3;
+    t3 = C13 * t4;
+    t4 = t9 - t3;
+    t9 = C14 * t12;
+    t3 = C13 * t7;
+    t12 = t9 - t3;
+    t7 = t2 + t11;
+    t9 = t13 + t8;
+    t3 = t6 + t0;
+    t2 = t14 - t1;
+    t11 = t5 + t12;
+    t13 = t10 - t4;
+    t8 = t5 - t12;
+    t5 = t10 + t4;
+    t12 = t6 - t0;
+    t10 = t14 + t1;
+    re[70] = t7;
+    im[70] = t9;
+    re[106] = t3;
+    im[106] = t2;
+    re[142] = t11;
+    im[142] = t13;
+    re[178] = t8;
+    im[178] = t5;
+    re[34] = t12;
+    im[34] = t10;
+}
+
+/**
+ *  Part 4 of ApplyMixedRadixPairedRFFT_180().
+ * 
+ *  @param {Number[]} re 
+ *    - The real part of each point.
+ *  @param {Number[]} im 
+ *    - The imaginary part of each point.
+ */
+function ApplyMixedRadixPairedRFFT_180_Part4(re, im) {
+    let t0, t1, t10, t11, t12, t13, t14, t2, t3, t4, t5, t6, t7, t8, t9;
+    const C0 = 0.5;
+    const C1 = 0.8660254037844386;
+    const C2 = 0.766044443118978;
+    const C3 = 1.4088320528055172;
+    const C4 = 0.12325683343243876;
+    const C5 = 0.17364817766693033;
+    const C6 = 1.1584559306791384;
+    const C7 = 0.8111595753452777;
+    const C8 = 0.9396926207859084;
+    const C9 = 0.5976724774602398;
+    const C10 = 1.281712764111577;
+    const C11 = 0.5590169943749475;
+    const C12 = 0.25;
+    const C13 = 0.9510565162951535;
+    const C14 = 0.5877852522924731;
+    t4 = re[135];
+    t6 = im[135];
+    t0 = re[15];
+    t14 = im[15];
+    t1 = re[75];
+    t7 = im[75];
+    t9 = t0 + t1;
+    t3 = t14 + t7;
+    t2 = C0 * t9;
+    t11 = t4 - t2;
+    t13 = C0 * t3;
+    t8 = t6 - t13;
+    t5 = t0 - t1;
+    t12 = C1 * t5;
+    t10 = t14 - t7;
+    t2 = C1 * t10;
+    t13 = t4 + t9;
+    t0 = t6 + t3;
+    t1 = t11 + t2;
+    t5 = t8 - t12;
+    t14 = t11 - t2;
+    t7 = t8 + t12;
+    re[135] = t13;
+    im[135] = t0;
+    re[15] = t1;
+    im[15] = t5;
+    re[75] = t14;
+    im[75] = t7;
+    t10 = re[155];
+    t4 = im[155];
+    t9 = re[35];
+    t6 = im[35];
+    t3 = re[95];
+    t11 = im[95];
+    t2 = t9 + t3;
+    t8 = t6 + t11;
+    t12 = C0 * t2;
+    t13 = t10 - t12;
+    t0 = C0 * t8;
+    t1 = t4 - t0;
+    t5 = t9 - t3;
+    t14 = C1 * t5;
+    t7 = t6 - t11;
+    t12 = C1 * t7;
+    t0 = t10 + t2;
+    t9 = t4 + t8;
+    t3 = t13 + t12;
+    t5 = t1 - t14;
+    t6 = t13 - t12;
+    t11 = t1 + t14;
+    t7 = t3 + t5;
+    t10 = C2 * t7;
+    t2 = t3 * (-C3);
+    t4 = t5 * C4;
+    t8 = t10 - t4;
+    t13 = t10 + t2;
+    t12 = t6 + t11;
+    t1 = C5 * t12;
+    t14 = t6 * (-C6);
+    t7 = t11 * (-C7);
+    t3 = t1 - t7;
+    t5 = t1 + t14;
+    re[155] = t0;
+    im[155] = t9;
+    re[35] = t8;
+    im[35] = t13;
+    re[95] = t3;
+    im[95] = t5;
+    t4 = re[175];
+    t10 = im[175];
+    t2 = re[55];
+    t12 = im[55];
+    t6 = re[115];
+    t11 = im[115];
+    t7 = t2 + t6;
+    t1 = t12 + t11;
+    t14 = C0 * t7;
+    t0 = t4 - t14;
+    t9 = C0 * t1;
+    t8 = t10 - t9;
+    t13 = t2 - t6;
+    t3 = C1 * t13;
+    t5 = t12 - t11;
+    t14 = C1 * t5;
+    t9 = t4 + t7;
+    t2 = t10 + t1;
+    t6 = t0 + t14;
+    t13 = t8 - t3;
+    t12 = t0 - t14;
+    t11 = t8 + t3;
+    t5 = t6 + t13;
+    t4 = C5 * t5;
+    t7 = t6 * (-C6);
+    t10 = t13 * (-C7);
+    t1 = t4 - t10;
+    t0 = t4 + t7;
+    t14 = t12 + t11;
+    t8 = (-C8) * t14;
+    t3 = t12 * C9;
+    t5 = t11 * (-C10);
+    t6 = t8 - t5;
+    t13 = t8 + t3;
+    re[175] = t9;
+    im[175] = t2;
+    re[55] = t1;
+    im[55] = t0;
+    re[115] = t6;
+    im[115] = t13;
+    t10 = re[135];
+    t4 = im[135];
+    t7 = re[155];
+    t14 = im[155];
+    t12 = re[175];
+    t11 = im[175];
+    t5 = t7 + t12;
+    t8 = t14 + t11;
+    t3 = C0 * t5;
+    t9 = t10 - t3;
+    t2 = C0 * t8;
+    t1 = t4 - t2;
+    t0 = t7 - t12;
+    t6 = C1 * t0;
+    t13 = t14 - t11;
+    t3 = C1 * t13;
+    t2 = t10 + t5;
+    t7 = t4 + t8;
+    t12 = t9 + t3;
+    t0 = t1 - t6;
+    t14 = t9 - t3;
+    t11 = t1 + t6;
+    re[135] = t2;
+    im[135] = t7;
+    re[155] = t12;
+    im[155] = t0;
+    re[175] = t14;
+    im[175] = t11;
+    t13 = re[15];
+    t10 = im[15];
+    t5 = re[35];
+    t4 = im[35];
+    t8 = re[55];
+    t9 = im[55];
+    t3 = t5 + t8;
+    t1 = t4 + t9;
+    t6 = C0 * t3;
+    t2 = t13 - t6;
+    t7 = C0 * t1;
+    t12 = t10 - t7;
+    t0 = t5 - t8;
+    t14 = C1 * t0;
+    t11 = t4 - t9;
+    t6 = C1 * t11;
+    t7 = t13 + t3;
+    t5 = t10 + t1;
+    t8 = t2 + t6;
+    t0 = t12 - t14;
+    t4 = t2 - t6;
+    t9 = t12 + t14;
+    re[15] = t7;
+    im[15] = t5;
+    re[35] = t8;
+    im[35] = t0;
+    re[55] = t4;
+    im[55] = t9;
+    t11 = re[75];
+    t13 = im[75];
+    t3 = re[95];
+    t10 = im[95];
+    t1 = re[115];
+    t2 = im[115];
+    t6 = t3 + t1;
+    t12 = t10 + t2;
+    t14 = C0 * t6;
+    t7 = t11 - t14;
+    t5 = C0 * t12;
+    t8 = t13 - t5;
+    t0 = t3 - t1;
+    t4 = C1 * t0;
+    t9 = t10 - t2;
+    t14 = C1 * t9;
+    t5 = t11 + t6;
+    t3 = t13 + t12;
+    t1 = t7 + t14;
+    t0 = t8 - t4;
+    t10 = t7 - t14;
+    t2 = t8 + t4;
+    re[75] = t5;
+    im[75] = t3;
+    re[95] = t1;
+    im[95] = t0;
+    re[115] = t10;
+    im[115] = t2;
+    t9 = re[171];
+    t11 = im[171];
+    t6 = re[51];
+    t13 = im[51];
+    t12 = re[111];
+    t7 = im[111];
+    t14 = t6 + t12;
+    t8 = t13 + t7;
+    t4 = C0 * t14;
+    t5 = t9 - t4;
+    t3 = C0 * t8;
+    t1 = t11 - t3;
+    t0 = t6 - t12;
+    t10 = C1 * t0;
+    t2 = t13 - t7;
+    t4 = C1 * t2;
+    t3 = t9 + t14;
+    t6 = t11 + t8;
+    t12 = t5 + t4;
+    t0 = t1 - t10;
+    t13 = t5 - t4;
+    t7 = t1 + t10;
+    re[171] = t3;
+    im[171] = t6;
+    re[51] = t12;
+    im[51] = t0;
+    re[111] = t13;
+    im[111] = t7;
+    t2 = re[11];
+    t9 = im[11];
+    t14 = re[71];
+    t11 = im[71];
+    t8 = re[131];
+    t5 = im[131];
+    t4 = t14 + t8;
+    t1 = t11 + t5;
+    t10 = C0 * t4;
+    t3 = t2 - t10;
+    t6 = C0 * t1;
+    t12 = t9 - t6;
+    t0 = t14 - t8;
+    t13 = C1 * t0;
+    t7 = t11 - t5;
+    t10 = C1 * t7;
+    t6 = t2 + t4;
+    t14 = t9 + t1;
+    t8 = t3 + t10;
+    t0 = t12 - t13;
+    t11 = t3 - t10;
+    t5 = t12 + t13;
+    t7 = t8 + t0;
+    t2 = C2 * t7;
+    t4 = t8 * (-C3);
+    t9 = t0 * C4;
+    t1 = t2 - t9;
+    t3 = t2 + t4;
+    t10 = t11 + t5;
+    t12 = C5 * t10;
+    t13 = t11 * (-C6);
+    t7 = t5 * (-C7);
+    t8 = t12 - t7;
+    t0 = t12 + t13;
+    re[11] = t6;
+    im[11] = t14;
+    re[71] = t1;
+    im[71] = t3;
+    re[131] = t8;
+    im[131] = t0;
+    t9 = re[31];
+    t2 = im[31];
+    t4 = re[91];
+    t10 = im[91];
+    t11 = re[151];
+    t5 = im[151];
+    t7 = t4 + t11;
+    t12 = t10 + t5;
+    t13 = C0 * t7;
+    t6 = t9 - t13;
+    t14 = C0 * t12;
+    t1 = t2 - t14;
+    t3 = t4 - t11;
+    t8 = C1 * t3;
+    t0 = t10 - t5;
+    t13 = C1 * t0;
+    t14 = t9 + t7;
+    t4 = t2 + t12;
+    t11 = t6 + t13;
+    t3 = t1 - t8;
+    t10 = t6 - t13;
+    t5 = t1 + t8;
+    t0 = t11 + t3;
+    t9 = C5 * t0;
+    t7 = t11 * (-C6);
+    t2 = t3 * (-C7);
+    t12 = t9 - t2;
+    t6 = t9 + t7;
+    t13 = t10 + t5;
+    t1 = (-C8) * t13;
+    t8 = t10 * C9;
+    t0 = t5 * (-C10);
+    t11 = t1 - t0;
+    t3 = t1 + t8;
+    re[31] = t14;
+    im[31] = t4;
+    re[91] = t12;
+    im[91] = t6;
+    re[151] = t11;
+    im[151] = t3;
+    t2 = re[171];
+    t9 = im[171];
+    t7 = re[11];
+    t13 = im[11];
+    t10 = re[31];
+    t5 = im[31];
+    t0 = t7 + t10;
+    t1 = t13 + t5;
+    t8 = C0 * t0;
+    t14 = t2 - t8;
+    t4 = C0 * t1;
+    t12 = t9 - t4;
+    t6 = t7 - t10;
+    t11 = C1 * t6;
+    t3 = t13 - t5;
+    t8 = C1 * t3;
+    t4 = t2 + t0;
+    t7 = t9 + t1;
+    t10 = t14 + t8;
+    t6 = t12 - t11;
+    t13 = t14 - t8;
+    t5 = t12 + t11;
+    re[171] = t4;
+    im[171] = t7;
+    re[11] = t10;
+    im[11] = t6;
+    re[31] = t13;
+    im[31] = t5;
+    t3 = re[51];
+    t2 = im[51];
+    t0 = re[71];
+    t9 = im[71];
+    t1 = re[91];
+    t14 = im[91];
+    t8 = t0 + t1;
+    t12 = t9 + t14;
+    t11 = C0 * t8;
+    t4 = t3 - t11;
+    t7 = C0 * t12;
+    t10 = t2 - t7;
+    t6 = t0 - t1;
+    t13 = C1 * t6;
+    t5 = t9 - t14;
+    t11 = C1 * t5;
+    t7 = t3 + t8;
+    t0 = t2 + t12;
+    t1 = t4 + t11;
+    t6 = t10 - t13;
+    t9 = t4 - t11;
+    t14 = t10 + t13;
+    re[51] = t7;
+    im[51] = t0;
+    re[71] = t1;
+    im[71] = t6;
+    re[91] = t9;
+    im[91] = t14;
+    t5 = re[111];
+    t3 = im[111];
+    t8 = re[131];
+    t2 = im[131];
+    t12 = re[151];
+    t4 = im[151];
+    t11 = t8 + t12;
+    t10 = t2 + t4;
+    t13 = C0 * t11;
+    t7 = t5 - t13;
+    t0 = C0 * t10;
+    t1 = t3 - t0;
+    t6 = t8 - t12;
+    t9 = C1 * t6;
+    t14 = t2 - t4;
+    t13 = C1 * t14;
+    t0 = t5 + t11;
+    t8 = t3 + t10;
+    t12 = t7 + t13;
+    t6 = t1 - t9;
+    t2 = t7 - t13;
+    t4 = t1 + t9;
+    re[111] = t0;
+    im[111] = t8;
+    re[131] = t12;
+    im[131] = t6;
+    re[151] = t2;
+    im[151] = t4;
+    t14 = re[27];
+    t5 = im[27];
+    t11 = re[87];
+    t3 = im[87];
+    t10 = re[147];
+    t7 = im[147];
+    t13 = t11 + t10;
+    t1 = t3 + t7;
+    t9 = C0 * t13;
+    t0 = t14 - t9;
+    t8 = C0 * t1;
+    t12 = t5 - t8;
+    t6 = t11 - t10;
+    t2 = C1 * t6;
+    t4 = t3 - t7;
+    t9 = C1 * t4;
+    t8 = t14 + t13;
+    t11 = t5 + t1;
+    t10 = t0 + t9;
+    t6 = t12 - t2;
+    t3 = t0 - t9;
+    t7 = t12 + t2;
+    re[27] = t8;
+    im[27] = t11;
+    re[87] = t10;
+    im[87] = t6;
+    re[147] = t3;
+    im[147] = t7;
+    t4 = re[47];
+    t14 = im[47];
+    t13 = re[107];
+    t5 = im[107];
+    t1 = re[167];
+    t0 = im[167];
+    t9 = t13 + t1;
+    t12 = t5 + t0;
+    t2 = C0 * t9;
+    t8 = t4 - t2;
+    t11 = C0 * t12;
+    t10 = t14 - t11;
+    t6 = t13 - t1;
+    t3 = C1 * t6;
+    t7 = t5 - t0;
+    t2 = C1 * t7;
+    t11 = t4 + t9;
+    t13 = t14 + t12;
+    t1 = t8 + t2;
+    t6 = t10 - t3;
+    t5 = t8 - t2;
+    t0 = t10 + t3;
+    t7 = t1 + t6;
+    t4 = C2 * t7;
+    t9 = t1 * (-C3);
+    t14 = t6 * C4;
+    t12 = t4 - t14;
+    t8 = t4 + t9;
+    t2 = t5 + t0;
+    t10 = C5 * t2;
+    t3 = t5 * (-C6);
+    t7 = t0 * (-C7);
+    t1 = t10 - t7;
+    t6 = t10 + t3;
+    re[47] = t11;
+    im[47] = t13;
+    re[107] = t12;
+    im[107] = t8;
+    re[167] = t1;
+    im[167] = t6;
+    t14 = re[67];
+    t4 = im[67];
+    t9 = re[127];
+    t2 = im[127];
+    t5 = re[7];
+    t0 = im[7];
+    t7 = t9 + t5;
+    t10 = t2 + t0;
+    t3 = C0 * t7;
+    t11 = t14 - t3;
+    t13 = C0 * t10;
+    t12 = t4 - t13;
+    t8 = t9 - t5;
+    t1 = C1 * t8;
+    t6 = t2 - t0;
+    t3 = C1 * t6;
+    t13 = t14 + t7;
+    t9 = t4 + t10;
+    t5 = t11 + t3;
+    t8 = t12 - t1;
+    t2 = t11 - t3;
+    t0 = t12 + t1;
+    t6 = t5 + t8;
+    t14 = C5 * t6;
+    t7 = t5 * (-C6);
+    t4 = t8 * (-C7);
+    t10 = t14 - t4;
+    t11 = t14 + t7;
+    t3 = t2 + t0;
+    t12 = (-C8) * t3;
+    t1 = t2 * C9;
+    t6 = t0 * (-C10);
+    t5 = t12 - t6;
+    t8 = t12 + t1;
+    re[67] = t13;
+    im[67] = t9;
+    re[127] = t10;
+    im[127] = t11;
+    re[7] = t5;
+    im[7] = t8;
+    t4 = re[27];
+    t14 = im[27];
+    t7 = re[47];
+    t3 = im[47];
+    t2 = re[67];
+    t0 = im[67];
+    t6 = t7 + t2;
+    t12 = t3 + t0;
+    t1 = C0 * t6;
+    t13 = t4 - t1;
+    t9 = C0 * t12;
+    t10 = t14 - t9;
+    t11 = t7 - t2;
+    t5 = C1 * t11;
+    t8 = t3 - t0;
+    t1 = C1 * t8;
+    t9 = t4 + t6;
+    t7 = t14 + t12;
+    t2 = t13 + t1;
+    t11 = t10 - t5;
+    t3 = t13 - t1;
+    t0 = t10 + t5;
+    re[27] = t9;
+    im[27] = t7;
+    re[47] = t2;
+    im[47] = t11;
+    re[67] = t3;
+    im[67] = t0;
+    t8 = re[87];
+    t4 = im[87];
+    t6 = re[107];
+    t14 = im[107];
+    t12 = re[127];
+    t13 = im[127];
+    t1 = t6 + t12;
+    t10 = t14 + t13;
+    t5 = C0 * t1;
+    t9 = t8 - t5;
+    t7 = C0 * t10;
+    t2 = t4 - t7;
+    t11 = t6 - t12;
+    t3 = C1 * t11;
+    t0 = t14 - t13;
+    t5 = C1 * t0;
+    t7 = t8 + t1;
+    t6 = t4 + t10;
+    t12 = t9 + t5;
+    t11 = t2 - t3;
+    t14 = t9 - t5;
+    t13 = t2 + t3;
+    re[87] = t7;
+    im[87] = t6;
+    re[107] = t12;
+    im[107] = t11;
+    re[127] = t14;
+    im[127] = t13;
+    t0 = re[147];
+    t8 = im[147];
+    t1 = re[167];
+    t4 = im[167];
+    t10 = re[7];
+    t9 = im[7];
+    t5 = t1 + t10;
+    t2 = t4 + t9;
+    t3 = C0 * t5;
+    t7 = t0 - t3;
+    t6 = C0 * t2;
+    t12 = t8 - t6;
+    t11 = t1 - t10;
+    t14 = C1 * t11;
+    t13 = t4 - t9;
+    t3 = C1 * t13;
+    t6 = t0 + t5;
+    t1 = t8 + t2;
+    t10 = t7 + t3;
+    t11 = t12 - t14;
+    t4 = t7 - t3;
+    t9 = t12 + t14;
+    re[147] = t6;
+    im[147] = t1;
+    re[167] = t10;
+    im[167] = t11;
+    re[7] = t4;
+    im[7] = t9;
+    t13 = re[63];
+    t0 = im[63];
+    t5 = re[123];
+    t8 = im[123];
+    t2 = re[3];
+    t7 = im[3];
+    t3 = t5 + t2;
+    t12 = t8 + t7;
+    t14 = C0 * t3;
+    t6 = t13 - t14;
+    t1 = C0 * t12;
+    t10 = t0 - t1;
+    t11 = t5 - t2;
+    t4 = C1 * t11;
+    t9 = t8 - t7;
+    t14 = C1 * t9;
+    t1 = t13 + t3;
+    t5 = t0 + t12;
+    t2 = t6 + t14;
+    t11 = t10 - t4;
+    t8 = t6 - t14;
+    t7 = t10 + t4;
+    re[63] = t1;
+    im[63] = t5;
+    re[123] = t2;
+    im[123] = t11;
+    re[3] = t8;
+    im[3] = t7;
+    t9 = re[83];
+    t13 = im[83];
+    t3 = re[143];
+    t0 = im[143];
+    t12 = re[23];
+    t6 = im[23];
+    t14 = t3 + t12;
+    t10 = t0 + t6;
+    t4 = C0 * t14;
+    t1 = t9 - t4;
+    t5 = C0 * t10;
+    t2 = t13 - t5;
+    t11 = t3 - t12;
+    t8 = C1 * t11;
+    t7 = t0 - t6;
+    t4 = C1 * t7;
+    t5 = t9 + t14;
+    t3 = t13 + t10;
+    t12 = t1 + t4;
+    t11 = t2 - t8;
+    t0 = t1 - t4;
+    t6 = t2 + t8;
+    t7 = t12 + t11;
+    t9 = C2 * t7;
+    t14 = t12 * (-C3);
+    t13 = t11 * C4;
+    t10 = t9 - t13;
+    t1 = t9 + t14;
+    t4 = t0 + t6;
+    t2 = C5 * t4;
+    t8 = t0 * (-C6);
+    t7 = t6 * (-C7);
+    t12 = t2 - t7;
+    t11 = t2 + t8;
+    re[83] = t5;
+    im[83] = t3;
+    re[143] = t10;
+    im[143] = t1;
+    re[23] = t12;
+    im[23] = t11;
+    t13 = re[103];
+    t9 = im[103];
+    t14 = re[163];
+    t4 = im[163];
+    t0 = re[43];
+    t6 = im[43];
+    t7 = t14 + t0;
+    t2 = t4 + t6;
+    t8 = C0 * t7;
+    t5 = t13 - t8;
+    t3 = C0 * t2;
+    t10 = t9 - t3;
+    t1 = t14 - t0;
+    t12 = C1 * t1;
+    t11 = t4 - t6;
+    t8 = C1 * t11;
+    t3 = t13 + t7;
+    t14 = t9 + t2;
+    t0 = t5 + t8;
+    t1 = t10 - t12;
+    t4 = t5 - t8;
+    t6 = t10 + t12;
+    t11 = t0 + t1;
+    t13 = C5 * t11;
+    t7 = t0 * (-C6);
+    t9 = t1 * (-C7);
+    t2 = t13 - t9;
+    t5 = t13 + t7;
+    t8 = t4 + t6;
+    t10 = (-C8) * t8;
+    t12 = t4 * C9;
+    t11 = t6 * (-C10);
+    t0 = t10 - t11;
+    t1 = t10 + t12;
+    re[103] = t3;
+    im[103] = t14;
+    re[163] = t2;
+    im[163] = t5;
+    re[43] = t0;
+    im[43] = t1;
+    t9 = re[63];
+    t13 = im[63];
+    t7 = re[83];
+    t8 = im[83];
+    t4 = re[103];
+    t6 = im[103];
+    t11 = t7 + t4;
+    t10 = t8 + t6;
+    t12 = C0 * t11;
+    t3 = t9 - t12;
+    t14 = C0 * t10;
+    t2 = t13 - t14;
+    t5 = t7 - t4;
+    t0 = C1 * t5;
+    t1 = t8 - t6;
+    t12 = C1 * t1;
+    t14 = t9 + t11;
+    t7 = t13 + t10;
+    t4 = t3 + t12;
+    t5 = t2 - t0;
+    t8 = t3 - t12;
+    t6 = t2 + t0;
+    re[63] = t14;
+    im[63] = t7;
+    re[83] = t4;
+    im[83] = t5;
+    re[103] = t8;
+    im[103] = t6;
+    t1 = re[123];
+    t9 = im[123];
+    t11 = re[143];
+    t13 = im[143];
+    t10 = re[163];
+    t3 = im[163];
+    t12 = t11 + t10;
+    t2 = t13 + t3;
+    t0 = C0 * t12;
+    t14 = t1 - t0;
+    t7 = C0 * t2;
+    t4 = t9 - t7;
+    t5 = t11 - t10;
+    t8 = C1 * t5;
+    t6 = t13 - t3;
+    t0 = C1 * t6;
+    t7 = t1 + t12;
+    t11 = t9 + t2;
+    t10 = t14 + t0;
+    t5 = t4 - t8;
+    t13 = t14 - t0;
+    t3 = t4 + t8;
+    re[123] = t7;
+    im[123] = t11;
+    re[143] = t10;
+    im[143] = t5;
+    re[163] = t13;
+    im[163] = t3;
+    t6 = re[3];
+    t1 = im[3];
+    t12 = re[23];
+    t9 = im[23];
+    t2 = re[43];
+    t14 = im[43];
+    t0 = t12 + t2;
+    t4 = t9 + t14;
+    t8 = C0 * t0;
+    t7 = t6 - t8;
+    t11 = C0 * t4;
+    t10 = t1 - t11;
+    t5 = t12 - t2;
+    t13 = C1 * t5;
+    t3 = t9 - t14;
+    t8 = C1 * t3;
+    t11 = t6 + t0;
+    t12 = t1 + t4;
+    t2 = t7 + t8;
+    t5 = t10 - t13;
+    t9 = t7 - t8;
+    t14 = t10 + t13;
+    re[3] = t11;
+    im[3] = t12;
+    re[23] = t2;
+    im[23] = t5;
+    re[43] = t9;
+    im[43] = t14;
+    t3 = re[99];
+    t6 = im[99];
+    t0 = re[159];
+    t1 = im[159];
+    t4 = re[39];
+    t7 = im[39];
+    t8 = t0 + t4;
+    t10 = t1 + t7;
+    t13 = C0 * t8;
+    t11 = t3 - t13;
+    t12 = C0 * t10;
+    t2 = t6 - t12;
+    t5 = t0 - t4;
+    t9 = C1 * t5;
+    t14 = t1 - t7;
+    t13 = C1 * t14;
+    t12 = t3 + t8;
+    t0 = t6 + t10;
+    t4 = t11 + t13;
+    t5 = t2 - t9;
+    t1 = t11 - t13;
+    t7 = t2 + t9;
+    re[99] = t12;
+    im[99] = t0;
+    re[159] = t4;
+    im[159] = t5;
+    re[39] = t1;
+    im[39] = t7;
+    t14 = re[119];
+    t3 = im[119];
+    t8 = re[179];
+    t6 = im[179];
+    t10 = re[59];
+    t11 = im[59];
+    t13 = t8 + t10;
+    t2 = t6 + t11;
+    t9 = C0 * t13;
+    t12 = t14 - t9;
+    t0 = C0 * t2;
+    t4 = t3 - t0;
+    t5 = t8 - t10;
+    t1 = C1 * t5;
+    t7 = t6 - t11;
+    t9 = C1 * t7;
+    t0 = t14 + t13;
+    t8 = t3 + t2;
+    t10 = t12 + t9;
+    t5 = t4 - t1;
+    t6 = t12 - t9;
+    t11 = t4 + t1;
+    t7 = t10 + t5;
+    t14 = C2 * t7;
+    t13 = t10 * (-C3);
+    t3 = t5 * C4;
+    t2 = t14 - t3;
+    t12 = t14 + t13;
+    t9 = t6 + t11;
+    t4 = C5 * t9;
+    t1 = t6 * (-C6);
+    t7 = t11 * (-C7);
+    t10 = t4 - t7;
+    t5 = t4 + t1;
+    re[119] = t0;
+    im[119] = t8;
+    re[179] = t2;
+    im[179] = t12;
+    re[59] = t10;
+    im[59] = t5;
+    t3 = re[139];
+    t14 = im[139];
+    t13 = re[19];
+    t9 = im[19];
+    t6 = re[79];
+    t11 = im[79];
+    t7 = t13 + t6;
+    t4 = t9 + t11;
+    t1 = C0 * t7;
+    t0 = t3 - t1;
+    t8 = C0 * t4;
+    t2 = t14 - t8;
+    t12 = t13 - t6;
+    t10 = C1 * t12;
+    t5 = t9 - t11;
+    t1 = C1 * t5;
+    t8 = t3 + t7;
+    t13 = t14 + t4;
+    t6 = t0 + t1;
+    t12 = t2 - t10;
+    t9 = t0 - t1;
+    t11 = t2 + t10;
+    t5 = t6 + t12;
+    t3 = C5 * t5;
+    t7 = t6 * (-C6);
+    t14 = t12 * (-C7);
+    t4 = t3 - t14;
+    t0 = t3 + t7;
+    t1 = t9 + t11;
+    t2 = (-C8) * t1;
+    t10 = t9 * C9;
+    t5 = t11 * (-C10);
+    t6 = t2 - t5;
+    t12 = t2 + t10;
+    re[139] = t8;
+    im[139] = t13;
+    re[19] = t4;
+    im[19] = t0;
+    re[79] = t6;
+    im[79] = t12;
+    t14 = re[99];
+    t3 = im[99];
+    t7 = re[119];
+    t1 = im[119];
+    t9 = re[139];
+    t11 = im[139];
+    t5 = t7 + t9;
+    t2 = t1 + t11;
+    t10 = C0 * t5;
+    t8 = t14 - t10;
+    t13 = C0 * t2;
+    t4 = t3 - t13;
+    t0 = t7 - t9;
+    t6 = C1 * t0;
+    t12 = t1 - t11;
+    t10 = C1 * t12;
+    t13 = t14 + t5;
+    t7 = t3 + t2;
+    t9 = t8 + t10;
+    t0 = t4 - t6;
+    t1 = t8 - t10;
+    t11 = t4 + t6;
+    re[99] = t13;
+    im[99] = t7;
+    re[119] = t9;
+    im[119] = t0;
+    re[139] = t1;
+    im[139] = t11;
+    t12 = re[159];
+    t14 = im[159];
+    t5 = re[179];
+    t3 = im[179];
+    t2 = re[19];
+    t8 = im[19];
+    t10 = t5 + t2;
+    t4 = t3 + t8;
+    t6 = C0 * t10;
+    t13 = t12 - t6;
+    t7 = C0 * t4;
+    t9 = t14 - t7;
+    t0 = t5 - t2;
+    t1 = C1 * t0;
+    t11 = t3 - t8;
+    t6 = C1 * t11;
+    t7 = t12 + t10;
+    t5 = t14 + t4;
+    t2 = t13 + t6;
+    t0 = t9 - t1;
+    t3 = t13 - t6;
+    t8 = t9 + t1;
+    re[159] = t7;
+    im[159] = t5;
+    re[179] = t2;
+    im[179] = t0;
+    re[19] = t3;
+    im[19] = t8;
+    t11 = re[39];
+    t12 = im[39];
+    t10 = re[59];
+    t14 = im[59];
+    t4 = re[79];
+    t13 = im[79];
+    t6 = t10 + t4;
+    t9 = t14 + t13;
+    t1 = C0 * t6;
+    t7 = t11 - t1;
+    t5 = C0 * t9;
+    t2 = t12 - t5;
+    t0 = t10 - t4;
+    t3 = C1 * t0;
+    t8 = t14 - t13;
+    t1 = C1 * t8;
+    t5 = t11 + t6;
+    t10 = t12 + t9;
+    t4 = t7 + t1;
+    t0 = t2 - t3;
+    t14 = t7 - t1;
+    t13 = t2 + t3;
+    re[39] = t5;
+    im[39] = t10;
+    re[59] = t4;
+    im[59] = t0;
+    re[79] = t14;
+    im[79] = t13;
+    t8 = re[135];
+    t11 = im[135];
+    t6 = re[171];
+    t12 = im[171];
+    t9 = re[27];
+    t7 = im[27];
+    t1 = re[63];
+    t2 = im[63];
+    t3 = re[99];
+    t5 = im[99];
+    t10 = t6 + t3;
+    t4 = t12 + t5;
+    t0 = t9 + t1;
+    t14 = t7 + t2;
+    t13 = t6 - t3;
+    t6 = t12 - t5;
+    t3 = t9 - t1;
+    t12 = t7 - t2;
+    t5 = t10 + t0;
+    t9 = t4 + t14;
+    t1 = t10 - t0;
+    t7 = C11 * t1;
+    t2 = t4 - t14;
+    t10 = C11 * t2;
+    t0 = C12 * t5;
+    t1 = t8 - t0;
+    t4 = C12 * t9;
+    t14 = t11 - t4;
+    t2 = t1 + t7;
+    t0 = t14 + t10;
+    t4 = t1 - t7;
+    t1 = t14 - t10;
+    t7 = C13 * t13;
+    t14 = C14 * t3;
+    t10 = t7 + t14;
+    t7 = C13 * t6;
+    t14 = C14 * t12;
+    t7 = t7 + t14;
+    t14 = C14 * t13;
+    t13 = C13 * t3;
+    t3 = t14 - t13;
+    t14 = C14 * t6;
+    t13 = C13 * t12;
+    t6 = t14 - t13;
+    t12 = t8 + t5;
+    t14 = t11 + t9;
+    t13 = t2 + t7;
+    t8 = t0 - t10;
+    t5 = t4 + t6;
+    t11 = t1 - t3;
+    t9 = t4 - t6;
+    t4 = t1 + t3;
+    t6 = t2 - t7;
+    t1 = t0 + t10;
+    re[135] = t12;
+    im[135] = t14;
+    re[171] = t13;
+    im[171] = t8;
+    re[27] = t5;
+    im[27] = t11;
+    re[63] = t9;
+    im[63] = t4;
+    re[99] = t6;
+    im[99] = t1;
+    t3 = re[15];
+    t2 = im[15];
+    t7 = re[51];
+    t0 = im[51];
+    t10 = re[87];
+    t12 = im[87];
+    t14 = re[123];
+    t13 = im[123];
+    t8 = re[159];
+    t5 = im[159];
+    t11 = t7 + t8;
+    t9 = t0 + t5;
+    t4 = t10 + t14;
+    t6 = t12 + t13;
+    t1 = t7 - t8;
+    t7 = t0 - t5;
+    t8 = t10 - t14;
+    t0 = t12 - t13;
+    t5 = t11 + t4;
+    t10 = t9 + t6;
+    t14 = t11 - t4;
+    t12 = C11 * t14;
+    t13 = t9 - t6;
+    t11 = C11 * t13;
+    t4 = C12 * t5;
+    t14 = t3 - t4;
+    t9 = C12 * t10;
+    t6 = t2 - t9;
+    t13 = t14 + t12;
+    t4 = t6 + t11;
+    t9 = t14 - t12;
+    t14 = t6 - t11;
+    t12 = C13 * t1;
+    t6 = C14 * t8;
+    t11 = t12 + t6;
+    t12 = C13 * t7;
+    t6 = C14 * t0;
+    t12 = t12 + t6;
+    t6 = C14 * t1;
+    t1 = C13 * t8;
+    t8 = t6 - t1;
+    t6 = C14 * t7;
+    t1 = C13 * t0;
+    t7 = t6 - t1;
+    t0 = t3 + t5;
+    t6 = t2 + t10;
+    t1 = t13 + t12;
+    t3 = t4 - t11;
+    t5 = t9 + t7;
+    t2 = t14 - t8;
+    t10 = t9 - t7;
+    t9 = t14 + t8;
+    t7 = t13 - t12;
+    t14 = t4 + t11;
+    re[15] = t0;
+    im[15] = t6;
+    re[51] = t1;
+    im[51] = t3;
+    re[87] = t5;
+    im[87] = t2;
+    re[123] = t10;
+    im[123] = t9;
+    re[159] = t7;
+    im[159] = t14;
+    t8 = re[75];
+    t13 = im[75];
+    t12 = re[111];
+    t4 = im[111];
+    t11 = re[147];
+    t0 = im[147];
+    t6 = re[3];
+    t1 = im[3];
+    t3 = re[39];
+    t5 = im[39];
+    t2 = t12 + t3;
+    t10 = t4 + t5;
+    t9 = t11 + t6;
+    t7 = t0 + t1;
+    t14 = t12 - t3;
+    t12 = t4 - t5;
+    t3 = t11 - t6;
+    t4 = t0 - t1;
+    t5 = t2 + t9;
+    t11 = t10 + t7;
+    t6 = t2 - t9;
+    t0 = C11 * t6;
+    t1 = t10 - t7;
+    t2 = C11 * t1;
+    t9 = C12 * t5;
+    t6 = t8 - t9;
+    t10 = C12 * t11;
+    t7 = t13 - t10;
+    t1 = t6 + t0;
+    t9 = t7 + t2;
+    t10 = t6 - t0;
+    t6 = t7 - t2;
+    t0 = C13 * t14;
+    t7 = C14 * t3;
+    t2 = t0 + t7;
+    t0 = C13 * t12;
+    t7 = C14 * t4;
+    t0 = t0 + t7;
+    t7 = C14 * t14;
+    t14 = C13 * t3;
+    t3 = t7 - t14;
+    t7 = C14 * t12;
+    t14 = C13 * t4;
+    t12 = t7 - t14;
+    t4 = t8 + t5;
+    t7 = t13 + t11;
+    t14 = t1 + t0;
+    t8 = t9 - t2;
+    t5 = t10 + t12;
+    t13 = t6 - t3;
+    t11 = t10 - t12;
+    t10 = t6 + t3;
+    t12 = t1 - t0;
+    t6 = t9 + t2;
+    re[75] = t4;
+    im[75] = t7;
+    re[111] = t14;
+    im[111] = t8;
+    re[147] = t5;
+    im[147] = t13;
+    re[3] = t11;
+    im[3] = t10;
+    re[39] = t12;
+    im[39] = t6;
+    t3 = re[155];
+    t1 = im[155];
+    t0 = re[11];
+    t9 = im[11];
+    t2 = re[47];
+    t4 = im[47];
+    t7 = re[83];
+    t14 = im[83];
+    t8 = re[119];
+    t5 = im[119];
+    t13 = t0 + t8;
+    t11 = t9 + t5;
+    t10 = t2 + t7;
+    t12 = t4 + t14;
+    t6 = t0 - t8;
+    t0 = t9 - t5;
+    t8 = t2 - t7;
+    t9 = t4 - t14;
+    t5 = t13 + t10;
+    t2 = t11 + t12;
+    t7 = t13 - t10;
+    t4 = C11 * t7;
+    t14 = t11 - t12;
+    t13 = C11 * t14;
+    t10 = C12 * t5;
+    t7 = t3 - t10;
+    t11 = C12 * t2;
+    t12 = t1 - t11;
+    t14 = t7 + t4;
+    t10 = t12 + t13;
+    t11 = t7 - t4;
+    t7 = t12 - t13;
+    t4 = C13 * t6;
+    t12 = C14 * t8;
+    t13 = t4 + t12;
+    t4 = C13 * t0;
+    t12 = C14 * t9;
+    t4 = t4 + t12;
+    t12 = C14 * t6;
+    t6 = C13 * t8;
+    t8 = t12 - t6;
+    t12 = C14 * t0;
+    t6 = C13 * t9;
+    t0 = t12 - t6;
+    t9 = t3 + t5;
+    t12 = t1 + t2;
+    t6 = t14 + t4;
+    t3 = t10 - t13;
+    t5 = t11 + t0;
+    t1 = t7 - t8;
+    t2 = t11 - t0;
+    t11 = t7 + t8;
+    t0 = t14 - t4;
+    t7 = t10 + t13;
+    re[155] = t9;
+    im[155] = t12;
+    re[11] = t6;
+    im[11] = t3;
+    re[47] = t5;
+    im[47] = t1;
+    re[83] = t2;
+    im[83] = t11;
+    re[119] = t0;
+    im[119] = t7;
+    t8 = re[35];
+    t14 = im[35];
+    t4 = re[71];
+    t10 = im[71];
+    t13 = re[107];
+    t9 = im[107];
+    t12 = re[143];
+    t6 = im[143];
+    t3 = re[179];
+    t5 = im[179];
+    t1 = t4 + t3;
+    t2 = t10 + t5;
+    t11 = t13 + t12;
+    t0 = t9 + t6;
+    t7 = t4 - t3;
+    t4 = t10 - t5;
+    t3 = t13 - t12;
+    t10 = t9 - t6;
+    t5 = t1 + t11;
+    t13 = t2 + t0;
+    t12 = t1 - t11;
+    t9 = C11 * t12;
+    t6 = t2 - t0;
+    t1 = C11 * t6;
+    t11 = C12 * t5;
+    t12 = t8 - t11;
+    t2 = C12 * t13;
+    t0 = t14 - t2;
+    t6 = t12 + t9;
+    t11 = t0 + t1;
+    t2 = t12 - t9;
+    t12 = t0 - t1;
+    t9 = C13 * t7;
+    t0 = C14 * t3;
+    t1 = t9 + t0;
+    t9 = C13 * t4;
+    t0 = C14 * t10;
+    t9 = t9 + t0;
+    t0 = C14 * t7;
+    t7 = C13 * t3;
+    t3 = t0 - t7;
+    t0 = C14 * t4;
+    t7 = C13 * t10;
+    t4 = t0 - t7;
+    t10 = t8 + t5;
+    t0 = t14 + t13;
+    t7 = t6 + t9;
+    t8 = t11 - t1;
+    t5 = t2 + t4;
+    t14 = t12 - t3;
+    t13 = t2 - t4;
+    t2 = t12 + t3;
+    t4 = t6 - t9;
+    t12 = t11 + t1;
+    re[35] = t10;
+    im[35] = t0;
+    re[71] = t7;
+    im[71] = t8;
+    re[107] = t5;
+    im[107] = t14;
+    re[143] = t13;
+    im[143] = t2;
+    re[179] = t4;
+    im[179] = t12;
+    t3 = re[95];
+    t6 = im[95];
+    t9 = re[131];
+    t11 = im[131];
+    t1 = re[167];
+    t10 = im[167];
+    t0 = re[23];
+    t7 = im[23];
+    t8 = re[59];
+    t5 = im[59];
+    t14 = t9 + t8;
+    t13 = t11 + t5;
+    t2 = t1 + t0;
+    t4 = t10 + t7;
+    t12 = t9 - t8;
+    t9 = t11 - t5;
+    t8 = t1 - t0;
+    t11 = t10 - t7;
+    t5 = t14 + t2;
+    t1 = t13 + t4;
+    t0 = t14 - t2;
+    t10 = C11 * t0;
+    t7 = t13 - t4;
+    t14 = C11 * t7;
+    t2 = C12 * t5;
+    t0 = t3 - t2;
+    t13 = C12 * t1;
+    t4 = t6 - t13;
+    t7 = t0 + t10;
+    t2 = t4 + t14;
+    t13 = t0 - t10;
+    t0 = t4 - t14;
+    t10 = C13 * t12;
+    t4 = C14 * t8;
+    t14 = t10 + t4;
+    t10 = C13 * t9;
+    t4 = C14 * t11;
+    t10 = t10 + t4;
+    t4 = C14 * t12;
+    t12 = C13 * t8;
+    t8 = t4 - t12;
+    t4 = C14 * t9;
+    t12 = C13 * t11;
+    t9 = t4 - t12;
+    t11 = t3 + t5;
+    t4 = t6 + t1;
+    t12 = t7 + t10;
+    t3 = t2 - t14;
+    t5 = t13 + t9;
+    t6 = t0 - t8;
+    t1 = t13 - t9;
+    t13 = t0 + t8;
+    t9 = t7 - t10;
+    t0 = t2 + t14;
+    re[95] = t11;
+    im[95] = t4;
+    re[131] = t12;
+    im[131] = t3;
+    re[167] = t5;
+    im[167] = t6;
+    re[23] = t1;
+    im[23] = t13;
+    re[59] = t9;
+    im[59] = t0;
+    t8 = re[175];
+    t7 = im[175];
+    t10 = re[31];
+    t2 = im[31];
+    t14 = re[67];
+    t11 = im[67];
+    t4 = re[103];
+    t12 = im[103];
+    t3 = re[139];
+    t5 = im[139];
+    t6 = t10 + t3;
+    t1 = t2 + t5;
+    t13 = t14 + t4;
+    t9 = t11 + t12;
+    t0 = t10 - t3;
+    t10 = t2 - t5;
+    t3 = t14 - t4;
+    t2 = t11 - t12;
+    t5 = t6 + t13;
+    t14 = t1 + t9;
+    t4 = t6 - t13;
+    t11 = C11 * t4;
+    t12 = t1 - t9;
+    t6 = C11 * t12;
+    t13 = C12 * t5;
+    t4 = t8 - t13;
+    t1 = C12 * t14;
+    t9 = t7 - t1;
+    t12 = t4 + t11;
+    t13 = t9 + t6;
+    t1 = t4 - t11;
+    t4 = t9 - t6;
+    t11 = C13 * t0;
+    t9 = C14 * t3;
+    t6 = t11 + t9;
+    t11 = C13 * t10;
+    t9 = C14 * t2;
+    t11 = t11 + t9;
+    t9 = C14 * t0;
+    t0 = C13 * t3;
+    t3 = t9 - t0;
+    t9 = C14 * t10;
+    t0 = C13 * t2;
+    t10 = t9 - t0;
+    t2 = t8 + t5;
+    t9 = t7 + t14;
+    t0 = t12 + t11;
+    t8 = t13 - t6;
+    t5 = t1 + t10;
+    t7 = t4 - t3;
+    t14 = t1 - t10;
+    t1 = t4 + t3;
+    t10 = t12 - t11;
+    t4 = t13 + t6;
+    re[175] = t2;
+    im[175] = t9;
+    re[31] = t0;
+    im[31] = t8;
+    re[67] = t5;
+    im[67] = t7;
+    re[103] = t14;
+    im[103] = t1;
+    re[139] = t10;
+    im[139] = t4;
+    t3 = re[55];
+    t12 = im[55];
+    t11 = re[91];
+    t13 = im[91];
+    t6 = re[127];
+    t2 = im[127];
+    t9 = re[163];
+    t0 = im[163];
+    t8 = re[19];
+    t5 = im[19];
+    t7 = t11 + t8;
+    t14 = t13 + t5;
+    t1 = t6 + t9;
+    t10 = t2 + t0;
+    t4 = t11 - t8;
+    t11 = t13 - t5;
+    t8 = t6 - t9;
+    t13 = t2 - t0;
+    t5 = t7 + t1;
+    t6 = t14 + t10;
+    t9 = t7 - t1;
+    t2 = C11 * t9;
+    t0 = t14 - t10;
+    t7 = C11 * t0;
+    t1 = C12 * t5;
+    t9 = t3 - t1;
+    t14 = C12 * t6;
+    t10 = t12 - t14;
+    t0 = t9 + t2;
+    t1 = t10 + t7;
+    t14 = t9 - t2;
+    t9 = t10 - t7;
+    t2 = C13 * t4;
+    t10 = C14 * t8;
+    t7 = t2 + t10;
+    t2 = C13 * t11;
+    t10 = C14 * t13;
+    t2 = t2 + t10;
+    t10 = C14 * t4;
+    t4 = C13 * t8;
+    t8 = t10 - t4;
+    t10 = C14 * t11;
+    t4 = C13 * t13;
+    t11 = t10 - t4;
+    t13 = t3 + t5;
+    t10 = t12 + t6;
+    t4 = t0 + t2;
+    t3 = t1 - t7;
+    t5 = t14 + t11;
+    t12 = t9 - t8;
+    t6 = t14 - t11;
+    t14 = t9 + t8;
+    t11 = t0 - t2;
+    t9 = t1 + t7;
+    re[55] = t13;
+    im[55] = t10;
+    re[91] = t4;
+    im[91] = t3;
+    re[127] = t5;
+    im[127] = t12;
+    re[163] = t6;
+    im[163] = t14;
+    re[19] = t11;
+    im[19] = t9;
+    t8 = re[115];
+    t0 = im[115];
+    t2 = re[151];
+    t1 = im[151];
+    t7 = re[7];
+    t13 = im[7];
+    t10 = re[43];
+    t4 = im[43];
+    t3 = re[79];
+    t5 = im[79];
+    t12 = t2 + t3;
+    t6 = t1 + t5;
+    t14 = t7 + t10;
+    t11 = t13 + t4;
+    t9 = t2 - t3;
+    t2 = t1 - t5;
+    t3 = t7 - t10;
+    t1 = t13 - t4;
+    t5 = t12 + t14;
+    t7 = t6 + t11;
+    t10 = t12 - t14;
+    t13 = C11 * t10;
+    t4 = t6 - t11;
+    t12 = C11 * t4;
+    t14 = C12 * t5;
+    t10 = t8 - t14;
+    t6 = C12 * t7;
+    t11 = t0 - t6;
+    t4 = t10 + t13;
+    t14 = t11 + t12;
+    t6 = t10 - t13;
+    t10 = t11 - t12;
+    t13 = C13 * t9;
+    t11 = C14 * t3;
+    t12 = t13 + t11;
+    t13 = C13 * t2;
+    t11 = C14 * t1;
+    t13 = t13 + t11;
+    t11 = C14 * t9;
+    t9 = C13 * t3;
+    t3 = t11 - t9;
+    t11 = C14 * t2;
+    t9 = C13 * t1;
+    t2 = t11 - t9;
+    t1 = t8 + t5;
+    t11 = t0 + t7;
+    t9 = t4 + t13;
+    t8 = t14 - t12;
+    t5 = t6 + t2;
+    t0 = t10 - t3;
+    t7 = t6 - t2;
+    t6 = t10 + t3;
+    t2 = t4 - t13;
+    t10 = t14 + t12;
+    re[115] = t1;
+    im[115] = t11;
+    re[151] = t9;
+    im[151] = t8;
+    re[7] = t5;
+    im[7] = t0;
+    re[43] = t7;
+    im[43] = t6;
+    re[79] = t2;
+    im[79] = t10;
+    t3 = re[0];
+    t4 = im[0];
+    t13 = re[45];
+    t14 = im[45];
+    t12 = re[90];
+    t1 = im[90];
+    t11 = re[135];
+    t9 = im[135];
+    t8 = t3 + t12;
+    t5 = t4 + t1;
+    t0 = t13 + t11;
+    t7 = t14 + t9;
+    t6 = t3 - t12;
+    t2 = t4 - t1;
+    t10 = t13 - t11;
+    t3 = t14 - t9;
+    t12 = t8 + t0;
+    t4 = t5 + t7;
+    t1 = t6 + t3;
+    t13 = t2 - t10;
+    t11 = t8 - t0;
+    t14 = t5 - t7;
+    t9 = t6 - t3;
+    t8 = t2 + t10;
+    re[0] = t12;
+    im[0] = t4;
+    re[45] = t1;
+    im[45] = t13;
+    re[90] = t11;
+    im[90] = t14;
+    re[135] = t9;
+    im[135] = t8;
+    t0 = re[96];
+    t5 = im[96];
+    t7 = re[141];
+    t6 = im[141];
+    t3 = re[6];
+    t2 = im[6];
+    t10 = re[51];
+    t12 = im[51];
+    t4 = t0 + t3;
+    t1 = t5 + t2;
+    t13 = t7 + t10;
+    t11 = t6 + t12;
+    t14 = t0 - t3;
+    t9 = t5 - t2;
+    t8 = t7 - t10;
+    t0 = t6 - t12;
+    t3 = t4 + t13;
+    t5 = t1 + t11;
+    t2 = t14 + t0;
+    t7 = t9 - t8;
+    t10 = t4 - t13;
+    t6 = t1 - t11;
+    t12 = t14 - t0;
+    t4 = t9 + t8;
+    re[96] = t3;
+    im[96] = t5;
+    re[141] = t2;
+    im[141] = t7;
+    re[6] = t10;
+    im[6] = t6;
+    re[51] = t12;
+    im[51] = t4;
+    t13 = re[12];
+    t1 = im[12];
+    t11 = re[57];
+    t14 = im[57];
+    t0 = re[102];
+    t9 = im[102];
+    t8 = re[147];
+    t3 = im[147];
+    t5 = t13 + t0;
+    t2 = t1 + t9;
+    t7 = t11 + t8;
+    t10 = t14 + t3;
+    t6 = t13 - t0;
+    t12 = t1 - t9;
+    t4 = t11 - t8;
+    t13 = t14 - t3;
+    t0 = t5 + t7;
+    t1 = t2 + t10;
+    t9 = t6 + t13;
+    t11 = t12 - t4;
+    t8 = t5 - t7;
+    t14 = t2 - t10;
+    t3 = t6 - t13;
+    t5 = t12 + t4;
+    re[12] = t0;
+    im[12] = t1;
+    re[57] = t9;
+    im[57] = t11;
+    re[102] = t8;
+    im[102] = t14;
+    re[147] = t3;
+    im[147] = t5;
+    t7 = re[128];
+    t2 = im[128];
+    t10 = re[173];
+    t6 = im[173];
+    t13 = re[38];
+    t12 = im[38];
+    t4 = re[83];
+    t0 = im[83];
+    t1 = t7 + t13;
+    t9 = t2 + t12;
+    t11 = t10 + t4;
+    t8 = t6 + t0;
+    t14 = t7 - t13;
+    t3 = t2 - t12;
+    t5 = t10 - t4;
+    t7 = t6 - t0;
+    t13 = t1 + t11;
+    t2 = t9 + t8;
+    t12 = t14 + t7;
+    t10 = t3 - t5;
+    t4 = t1 - t11;
+    t6 = t9 - t8;
+    t0 = t14 - t7;
+    t1 = t3 + t5;
+    re[128] = t13;
+    im[128] = t2;
+    re[173] = t12;
+    im[173] = t10;
+    re[38] = t4;
+    im[38] = t6;
+    re[83] = t0;
+    im[83] = t1;
+    t11 = re[44];
+    t9 = im[44];
+    t8 = re[89];
+    t14 = im[89];
+    t7 = re[134];
+    t3 = im[134];
+    t5 = re[179];
+    t13 = im[179];
+    t2 = t11 + t7;
+    t12 = t9 + t3;
+    t10 = t8 + t5;
+    t4 = t14 + t13;
+    t6 = t11 - t7;
+    t0 = t9 - t3;
+    t1 = t8 - t5;
+    t11 = t14 - t13;
+    t7 = t2 + t10;
+    t9 = t12 + t4;
+    t3 = t6 + t11;
+    t8 = t0 - t1;
+    t5 = t2 - t10;
+    t14 = t12 - t4;
+    t13 = t6 - t11;
+    t2 = t0 + t1;
+    re[44] = t7;
+    im[44] = t9;
+    re[89] = t3;
+    im[89] = t8;
+    re[134] = t5;
+    im[134] = t14;
+    re[179] = t13;
+    im[179] = t2;
+    t10 = re[140];
+    t12 = im[140];
+    t4 = re[5];
+    t6 = im[5];
+    t11 = re[50];
+    t0 = im[50];
+    t1 = re[95];
+    t7 = im[95];
+    t9 = t10 + t11;
+    t3 = t12 + t0;
+    t8 = t4 + t1;
+    t5 = t6 + t7;
+    t14 = t10 - t11;
+    t13 = t12 - t0;
+    t2 = t4 - t1;
+    t10 = t6 - t7;
+    t11 = t9 + t8;
+    t12 = t3 + t5;
+    t0 = t14 + t10;
+    t4 = t13 - t2;
+    t1 = t9 - t8;
+    t6 = t3 - t5;
+    t7 = t14 - t10;
+    t9 = t13 + t2;
+    re[140] = t11;
+    im[140] = t12;
+    re[5] = t0;
+    im[5] = t4;
+    re[50] = t1;
+    im[50] = t6;
+    re[95] = t7;
+    im[95] = t9;
+    t8 = re[76];
+    t3 = im[76];
+    t5 = re[121];
+    t14 = im[121];
+    t10 = re[166];
+    t13 = im[166];
+    t2 = re[31];
+    t11 = im[31];
+    t12 = t8 + t10;
+    t0 = t3 + t13;
+    t4 = t5 + t2;
+    t1 = t14 + t11;
+    t6 = t8 - t10;
+    t7 = t3 - t13;
+    t9 = t5 - t2;
+    t8 = t14 - t11;
+    t10 = t12 + t4;
+    t3 = t0 + t1;
+    t13 = t6 + t8;
+    t5 = t7 - t9;
+    t2 = t12 - t4;
+    t14 = t0 - t1;
+    t11 = t6 - t8;
+    t12 = t7 + t9;
+    re[76] = t10;
+    im[76] = t3;
+    re[121] = t13;
+    im[121] = t5;
+    re[166] = t2;
+    im[166] = t14;
+    re[31] = t11;
+    im[31] = t12;
+    t4 = re[172];
+    t0 = im[172];
+    t1 = re[37];
+    t6 = im[37];
+    t8 = re[82];
+    t7 = im[82];
+    t9 = re[127];
+    t10 = im[127];
+    t3 = t4 + t8;
+    t13 = t0 + t7;
+    t5 = t1 + t9;
+    t2 = t6 + t10;
+    t14 = t4 - t8;
+    t11 = t0 - t7;
+    t12 = t1 - t9;
+    t4 = t6 - t10;
+    t8 = t3 + t5;
+    t0 = t13 + t2;
+    t7 = t14 + t4;
+    t1 = t11 - t12;
+    t9 = t3 - t5;
+    t6 = t13 - t2;
+    t10 = t14 - t4;
+    t3 = t11 + t12;
+    re[172] = t8;
+    im[172] = t0;
+    re[37] = t7;
+    im[37] = t1;
+    re[82] = t9;
+    im[82] = t6;
+    re[127] = t10;
+    im[127] = t3;
+    t5 = re[88];
+    t13 = im[88];
+    t2 = re[133];
+    t14 = im[133];
+    t4 = re[178];
+    t11 = im[178];
+    t12 = re[43];
+    t8 = im[43];
+    t0 = t5 + t4;
+    t7 = t13 + t11;
+    t1 = t2 + t12;
+    t9 = t14 + t8;
+    t6 = t5 - t4;
+    t10 = t13 - t11;
+    t3 = t2 - t12;
+    t5 = t14 - t8;
+    t4 = t0 + t1;
+    t13 = t7 + t9;
+    t11 = t6 + t5;
+    t2 = t10 - t3;
+    t12 = t0 - t1;
+    t14 = t7 - t9;
+    t8 = t6 - t5;
+    t0 = t10 + t3;
+    re[88] = t4;
+    im[88] = t13;
+    re[133] = t11;
+    im[133] = t2;
+    re[178] = t12;
+    im[178] = t14;
+    re[43] = t8;
+    im[43] = t0;
+    t1 = re[144];
+    t7 = im[144];
+    t9 = re[9];
+    t6 = im[9];
+    t5 = re[54];
+    t10 = im[54];
+    t3 = re[99];
+    t4 = im[99];
+    t13 = t1 + t5;
+    t11 = t7 + t10;
+    t2 = t9 + t3;
+    t12 = t6 + t4;
+    t14 = t1 - t5;
+    t8 = t7 - t10;
+    t0 = t9 - t3;
+    t1 = t6 - t4;
+    t5 = t13 + t2;
+    t7 = t11 + t12;
+    t10 = t14 + t1;
+    t9 = t8 - t0;
+    t3 = t13 - t2;
+    t6 = t11 - t12;
+    t4 = t14 - t1;
+    t13 = t8 + t0;
+    re[144] = t5;
+    im[144] = t7;
+    re[9] = t10;
+    im[9] = t9;
+    re[54] = t3;
+    im[54] = t6;
+    re[99] = t4;
+    im[99] = t13;
+    t2 = re[60];
+    t11 = im[60];
+    t12 = re[105];
+    t14 = im[105];
+    t1 = re[150];
+    t8 = im[150];
+    t0 = re[15];
+    t5 = im[15];
+    t7 = t2 + t1;
+    t10 = t11 + t8;
+    t9 = t12 + t0;
+    t3 = t14 + t5;
+    t6 = t2 - t1;
+    t4 = t11 - t8;
+    t13 = t12 - t0;
+    t2 = t14 - t5;
+    t1 = t7 + t9;
+    t11 = t10 + t3;
+    t8 = t6 + t2;
+    t12 = t4 - t13;
+    t0 = t7 - t9;
+    t14 = t10 - t3;
+    t5 = t6 - t2;
+    t7 = t4 + t13;
+    re[60] = t1;
+    im[60] = t11;
+    re[105] = t8;
+    im[105] = t12;
+    re[150] = t0;
+    im[150] = t14;
+    re[15] = t5;
+    im[15] = t7;
+    t9 = re[156];
+    t10 = im[156];
+    t3 = re[21];
+    t6 = im[21];
+    t2 = re[66];
+    t4 = im[66];
+    t13 = re[111];
+    t1 = im[111];
+    t11 = t9 + t2;
+    t8 = t10 + t4;
+    t12 = t3 + t13;
+    t0 = t6 + t1;
+    t14 = t9 - t2;
+    t5 = t10 - t4;
+    t7 = t3 - t13;
+    t9 = t6 - t1;
+    t2 = t11 + t12;
+    t10 = t8 + t0;
+    t4 = t14 + t9;
+    t3 = t5 - t7;
+    t13 = t11 - t12;
+    t6 = t8 - t0;
+    t1 = t14 - t9;
+    t11 = t5 + t7;
+    re[156] = t2;
+    im[156] = t10;
+    re[21] = t4;
+    im[21] = t3;
+    re[66] = t13;
+    im[66] = t6;
+    re[111] = t1;
+    im[111] = t11;
+    t12 = re[92];
+    t8 = im[92];
+    t0 = re[137];
+    t14 = im[137];
+    t9 = re[2];
+    t5 = im[2];
+    t7 = re[47];
+    t2 = im[47];
+    t10 = t12 + t9;
+    t4 = t8 + t5;
+    t3 = t0 + t7;
+    t13 = t14 + t2;
+    t6 = t12 - t9;
+    t1 = t8 - t5;
+    t11 = t0 - t7;
+    t12 = t14 - t2;
+    t9 = t10 + t3;
+    t8 = t4 + t13;
+    t5 = t6 + t12;
+    t0 = t1 - t11;
+    t7 = t10 - t3;
+    t14 = t4 - t13;
+    t2 = t6 - t12;
+    t10 = t1 + t11;
+    re[92] = t9;
+    im[92] = t8;
+    re[137] = t5;
+    im[137] = t0;
+    re[2] = t7;
+    im[2] = t14;
+    re[47] = t2;
+    im[47] = t10;
+    t3 = re[8];
+    t4 = im[8];
+    t13 = re[53];
+    t6 = im[53];
+    t12 = re[98];
+    t1 = im[98];
+    t11 = re[143];
+    t9 = im[143];
+    t8 = t3 + t12;
+    t5 = t4 + t1;
+    t0 = t13 + t11;
+    t7 = t6 + t9;
+    t14 = t3 - t12;
+    t2 = t4 - t1;
+    t10 = t13 - t11;
+    t3 = t6 - t9;
+    t12 = t8 + t0;
+    t4 = t5 + t7;
+    t1 = t14 + t3;
+    t13 = t2 - t10;
+    t11 = t8 - t0;
+    t6 = t5 - t7;
+    t9 = t14 - t3;
+    t8 = t2 + t10;
+    re[8] = t12;
+    im[8] = t4;
+    re[53] = t1;
+    im[53] = t13;
+    re[98] = t11;
+    im[98] = t6;
+    re[143] = t9;
+    im[143] = t8;
+}
+
+/**
+ *  Part 5 of ApplyMixedRadixPairedRFFT_180().
+ * 
+ *  @param {Number[]} re 
+ *    - The real part of each point.
+ *  @param {Number[]} im 
+ *    - The imaginary part of each point.
+ */
+function ApplyMixedRadixPairedRFFT_180_Part5(re, im) {
+    let t0, t1, t10, t11, t12, t13, t14, t2, t3, t4, t5, t6, t7, t8, t9;
+    const C0 = 0.5;
+    t0 = re[104];
+    t5 = im[104];
+    t7 = re[149];
+    t14 = im[149];
+    t3 = re[14];
+    t2 = im[14];
+    t10 = re[59];
+    t12 = im[59];
+    t4 = t0 + t3;
+    t1 = t5 + t2;
+    t13 = t7 + t10;
+    t11 = t14 + t12;
+    t6 = t0 - t3;
+    t9 = t5 - t2;
+    t8 = t7 - t10;
+    t0 = t14 - t12;
+    t3 = t4 + t13;
+    t5 = t1 + t11;
+    t2 = t6 + t0;
+    t7 = t9 - t8;
+    t10 = t4 - t13;
+    t14 = t1 - t11;
+    t12 = t6 - t0;
+    t4 = t9 + t8;
+    re[104] = t3;
+    im[104] = t5;
+    re[149] = t2;
+    im[149] = t7;
+    re[14] = t10;
+    im[14] = t14;
+    re[59] = t12;
+    im[59] = t4;
+    t13 = re[40];
+    t1 = im[40];
+    t11 = re[85];
+    t6 = im[85];
+    t0 = re[130];
+    t9 = im[130];
+    t8 = re[175];
+    t3 = im[175];
+    t5 = t13 + t0;
+    t2 = t1 + t9;
+    t7 = t11 + t8;
+    t10 = t6 + t3;
+    t14 = t13 - t0;
+    t12 = t1 - t9;
+    t4 = t11 - t8;
+    t13 = t6 - t3;
+    t0 = t5 + t7;
+    t1 = t2 + t10;
+    t9 = t14 + t13;
+    t11 = t12 - t4;
+    t8 = t5 - t7;
+    t6 = t2 - t10;
+    t3 = t14 - t13;
+    t5 = t12 + t4;
+    re[40] = t0;
+    im[40] = t1;
+    re[85] = t9;
+    im[85] = t11;
+    re[130] = t8;
+    im[130] = t6;
+    re[175] = t3;
+    im[175] = t5;
+    t7 = re[136];
+    t2 = im[136];
+    t10 = re[1];
+    t14 = im[1];
+    t13 = re[46];
+    t12 = im[46];
+    t4 = re[91];
+    t0 = im[91];
+    t1 = t7 + t13;
+    t9 = t2 + t12;
+    t11 = t10 + t4;
+    t8 = t14 + t0;
+    t6 = t7 - t13;
+    t3 = t2 - t12;
+    t5 = t10 - t4;
+    t7 = t14 - t0;
+    t13 = t1 + t11;
+    t2 = t9 + t8;
+    t12 = t6 + t7;
+    t10 = t3 - t5;
+    t4 = t1 - t11;
+    t14 = t9 - t8;
+    t0 = t6 - t7;
+    t1 = t3 + t5;
+    re[136] = t13;
+    im[136] = t2;
+    re[1] = t12;
+    im[1] = t10;
+    re[46] = t4;
+    im[46] = t14;
+    re[91] = t0;
+    im[91] = t1;
+    t11 = re[52];
+    t9 = im[52];
+    t8 = re[97];
+    t6 = im[97];
+    t7 = re[142];
+    t3 = im[142];
+    t5 = re[7];
+    t13 = im[7];
+    t2 = t11 + t7;
+    t12 = t9 + t3;
+    t10 = t8 + t5;
+    t4 = t6 + t13;
+    t14 = t11 - t7;
+    t0 = t9 - t3;
+    t1 = t8 - t5;
+    t11 = t6 - t13;
+    t7 = t2 + t10;
+    t9 = t12 + t4;
+    t3 = t14 + t11;
+    t8 = t0 - t1;
+    t5 = t2 - t10;
+    t6 = t12 - t4;
+    t13 = t14 - t11;
+    t2 = t0 + t1;
+    re[52] = t7;
+    im[52] = t9;
+    re[97] = t3;
+    im[97] = t8;
+    re[142] = t5;
+    im[142] = t6;
+    re[7] = t13;
+    im[7] = t2;
+    t10 = re[108];
+    t12 = im[108];
+    t4 = re[153];
+    t14 = im[153];
+    t11 = re[18];
+    t0 = im[18];
+    t1 = re[63];
+    t7 = im[63];
+    t9 = t10 + t11;
+    t3 = t12 + t0;
+    t8 = t4 + t1;
+    t5 = t14 + t7;
+    t6 = t10 - t11;
+    t13 = t12 - t0;
+    t2 = t4 - t1;
+    t10 = t14 - t7;
+    t11 = t9 + t8;
+    t12 = t3 + t5;
+    t0 = t6 + t10;
+    t4 = t13 - t2;
+    t1 = t9 - t8;
+    t14 = t3 - t5;
+    t7 = t6 - t10;
+    t9 = t13 + t2;
+    re[108] = t11;
+    im[108] = t12;
+    re[153] = t0;
+    im[153] = t4;
+    re[18] = t1;
+    im[18] = t14;
+    re[63] = t7;
+    im[63] = t9;
+    t8 = re[24];
+    t3 = im[24];
+    t5 = re[69];
+    t6 = im[69];
+    t10 = re[114];
+    t13 = im[114];
+    t2 = re[159];
+    t11 = im[159];
+    t12 = t8 + t10;
+    t0 = t3 + t13;
+    t4 = t5 + t2;
+    t1 = t6 + t11;
+    t14 = t8 - t10;
+    t7 = t3 - t13;
+    t9 = t5 - t2;
+    t8 = t6 - t11;
+    t10 = t12 + t4;
+    t3 = t0 + t1;
+    t13 = t14 + t8;
+    t5 = t7 - t9;
+    t2 = t12 - t4;
+    t6 = t0 - t1;
+    t11 = t14 - t8;
+    t12 = t7 + t9;
+    re[24] = t10;
+    im[24] = t3;
+    re[69] = t13;
+    im[69] = t5;
+    re[114] = t2;
+    im[114] = t6;
+    re[159] = t11;
+    im[159] = t12;
+    t4 = re[120];
+    t0 = im[120];
+    t1 = re[165];
+    t14 = im[165];
+    t8 = re[30];
+    t7 = im[30];
+    t9 = re[75];
+    t10 = im[75];
+    t3 = t4 + t8;
+    t13 = t0 + t7;
+    t5 = t1 + t9;
+    t2 = t14 + t10;
+    t6 = t4 - t8;
+    t11 = t0 - t7;
+    t12 = t1 - t9;
+    t4 = t14 - t10;
+    t8 = t3 + t5;
+    t0 = t13 + t2;
+    t7 = t6 + t4;
+    t1 = t11 - t12;
+    t9 = t3 - t5;
+    t14 = t13 - t2;
+    t10 = t6 - t4;
+    t3 = t11 + t12;
+    re[120] = t8;
+    im[120] = t0;
+    re[165] = t7;
+    im[165] = t1;
+    re[30] = t9;
+    im[30] = t14;
+    re[75] = t10;
+    im[75] = t3;
+    t5 = re[56];
+    t13 = im[56];
+    t2 = re[101];
+    t6 = im[101];
+    t4 = re[146];
+    t11 = im[146];
+    t12 = re[11];
+    t8 = im[11];
+    t0 = t5 + t4;
+    t7 = t13 + t11;
+    t1 = t2 + t12;
+    t9 = t6 + t8;
+    t14 = t5 - t4;
+    t10 = t13 - t11;
+    t3 = t2 - t12;
+    t5 = t6 - t8;
+    t4 = t0 + t1;
+    t13 = t7 + t9;
+    t11 = t14 + t5;
+    t2 = t10 - t3;
+    t12 = t0 - t1;
+    t6 = t7 - t9;
+    t8 = t14 - t5;
+    t0 = t10 + t3;
+    re[56] = t4;
+    im[56] = t13;
+    re[101] = t11;
+    im[101] = t2;
+    re[146] = t12;
+    im[146] = t6;
+    re[11] = t8;
+    im[11] = t0;
+    t1 = re[152];
+    t7 = im[152];
+    t9 = re[17];
+    t14 = im[17];
+    t5 = re[62];
+    t10 = im[62];
+    t3 = re[107];
+    t4 = im[107];
+    t13 = t1 + t5;
+    t11 = t7 + t10;
+    t2 = t9 + t3;
+    t12 = t14 + t4;
+    t6 = t1 - t5;
+    t8 = t7 - t10;
+    t0 = t9 - t3;
+    t1 = t14 - t4;
+    t5 = t13 + t2;
+    t7 = t11 + t12;
+    t10 = t6 + t1;
+    t9 = t8 - t0;
+    t3 = t13 - t2;
+    t14 = t11 - t12;
+    t4 = t6 - t1;
+    t13 = t8 + t0;
+    re[152] = t5;
+    im[152] = t7;
+    re[17] = t10;
+    im[17] = t9;
+    re[62] = t3;
+    im[62] = t14;
+    re[107] = t4;
+    im[107] = t13;
+    t2 = re[68];
+    t11 = im[68];
+    t12 = re[113];
+    t6 = im[113];
+    t1 = re[158];
+    t8 = im[158];
+    t0 = re[23];
+    t5 = im[23];
+    t7 = t2 + t1;
+    t10 = t11 + t8;
+    t9 = t12 + t0;
+    t3 = t6 + t5;
+    t14 = t2 - t1;
+    t4 = t11 - t8;
+    t13 = t12 - t0;
+    t2 = t6 - t5;
+    t1 = t7 + t9;
+    t11 = t10 + t3;
+    t8 = t14 + t2;
+    t12 = t4 - t13;
+    t0 = t7 - t9;
+    t6 = t10 - t3;
+    t5 = t14 - t2;
+    t7 = t4 + t13;
+    re[68] = t1;
+    im[68] = t11;
+    re[113] = t8;
+    im[113] = t12;
+    re[158] = t0;
+    im[158] = t6;
+    re[23] = t5;
+    im[23] = t7;
+    t9 = re[4];
+    t10 = im[4];
+    t3 = re[49];
+    t14 = im[49];
+    t2 = re[94];
+    t4 = im[94];
+    t13 = re[139];
+    t1 = im[139];
+    t11 = t9 + t2;
+    t8 = t10 + t4;
+    t12 = t3 + t13;
+    t0 = t14 + t1;
+    t6 = t9 - t2;
+    t5 = t10 - t4;
+    t7 = t3 - t13;
+    t9 = t14 - t1;
+    t2 = t11 + t12;
+    t10 = t8 + t0;
+    t4 = t6 + t9;
+    t3 = t5 - t7;
+    t13 = t11 - t12;
+    t14 = t8 - t0;
+    t1 = t6 - t9;
+    t11 = t5 + t7;
+    re[4] = t2;
+    im[4] = t10;
+    re[49] = t4;
+    im[49] = t3;
+    re[94] = t13;
+    im[94] = t14;
+    re[139] = t1;
+    im[139] = t11;
+    t12 = re[100];
+    t8 = im[100];
+    t0 = re[145];
+    t6 = im[145];
+    t9 = re[10];
+    t5 = im[10];
+    t7 = re[55];
+    t2 = im[55];
+    t10 = t12 + t9;
+    t4 = t8 + t5;
+    t3 = t0 + t7;
+    t13 = t6 + t2;
+    t14 = t12 - t9;
+    t1 = t8 - t5;
+    t11 = t0 - t7;
+    t12 = t6 - t2;
+    t9 = t10 + t3;
+    t8 = t4 + t13;
+    t5 = t14 + t12;
+    t0 = t1 - t11;
+    t7 = t10 - t3;
+    t6 = t4 - t13;
+    t2 = t14 - t12;
+    t10 = t1 + t11;
+    re[100] = t9;
+    im[100] = t8;
+    re[145] = t5;
+    im[145] = t0;
+    re[10] = t7;
+    im[10] = t6;
+    re[55] = t2;
+    im[55] = t10;
+    t3 = re[16];
+    t4 = im[16];
+    t13 = re[61];
+    t14 = im[61];
+    t12 = re[106];
+    t1 = im[106];
+    t11 = re[151];
+    t9 = im[151];
+    t8 = t3 + t12;
+    t5 = t4 + t1;
+    t0 = t13 + t11;
+    t7 = t14 + t9;
+    t6 = t3 - t12;
+    t2 = t4 - t1;
+    t10 = t13 - t11;
+    t3 = t14 - t9;
+    t12 = t8 + t0;
+    t4 = t5 + t7;
+    t1 = t6 + t3;
+    t13 = t2 - t10;
+    t11 = t8 - t0;
+    t14 = t5 - t7;
+    t9 = t6 - t3;
+    t8 = t2 + t10;
+    re[16] = t12;
+    im[16] = t4;
+    re[61] = t1;
+    im[61] = t13;
+    re[106] = t11;
+    im[106] = t14;
+    re[151] = t9;
+    im[151] = t8;
+    t0 = re[72];
+    t5 = im[72];
+    t7 = re[117];
+    t6 = im[117];
+    t3 = re[162];
+    t2 = im[162];
+    t10 = re[27];
+    t12 = im[27];
+    t4 = t0 + t3;
+    t1 = t5 + t2;
+    t13 = t7 + t10;
+    t11 = t6 + t12;
+    t14 = t0 - t3;
+    t9 = t5 - t2;
+    t8 = t7 - t10;
+    t0 = t6 - t12;
+    t3 = t4 + t13;
+    t5 = t1 + t11;
+    t2 = t14 + t0;
+    t7 = t9 - t8;
+    t10 = t4 - t13;
+    t6 = t1 - t11;
+    t12 = t14 - t0;
+    t4 = t9 + t8;
+    re[72] = t3;
+    im[72] = t5;
+    re[117] = t2;
+    im[117] = t7;
+    re[162] = t10;
+    im[162] = t6;
+    re[27] = t12;
+    im[27] = t4;
+    t13 = re[168];
+    t1 = im[168];
+    t11 = re[33];
+    t14 = im[33];
+    t0 = re[78];
+    t9 = im[78];
+    t8 = re[123];
+    t3 = im[123];
+    t5 = t13 + t0;
+    t2 = t1 + t9;
+    t7 = t11 + t8;
+    t10 = t14 + t3;
+    t6 = t13 - t0;
+    t12 = t1 - t9;
+    t4 = t11 - t8;
+    t13 = t14 - t3;
+    t0 = t5 + t7;
+    t1 = t2 + t10;
+    t9 = t6 + t13;
+    t11 = t12 - t4;
+    t8 = t5 - t7;
+    t14 = t2 - t10;
+    t3 = t6 - t13;
+    t5 = t12 + t4;
+    re[168] = t0;
+    im[168] = t1;
+    re[33] = t9;
+    im[33] = t11;
+    re[78] = t8;
+    im[78] = t14;
+    re[123] = t3;
+    im[123] = t5;
+    t7 = re[84];
+    t2 = im[84];
+    t10 = re[129];
+    t6 = im[129];
+    t13 = re[174];
+    t12 = im[174];
+    t4 = re[39];
+    t0 = im[39];
+    t1 = t7 + t13;
+    t9 = t2 + t12;
+    t11 = t10 + t4;
+    t8 = t6 + t0;
+    t14 = t7 - t13;
+    t3 = t2 - t12;
+    t5 = t10 - t4;
+    t7 = t6 - t0;
+    t13 = t1 + t11;
+    t2 = t9 + t8;
+    t12 = t14 + t7;
+    t10 = t3 - t5;
+    t4 = t1 - t11;
+    t6 = t9 - t8;
+    t0 = t14 - t7;
+    t1 = t3 + t5;
+    re[84] = t13;
+    im[84] = t2;
+    re[129] = t12;
+    im[129] = t10;
+    re[174] = t4;
+    im[174] = t6;
+    re[39] = t0;
+    im[39] = t1;
+    t11 = re[20];
+    t9 = im[20];
+    t8 = re[65];
+    t14 = im[65];
+    t7 = re[110];
+    t3 = im[110];
+    t5 = re[155];
+    t13 = im[155];
+    t2 = t11 + t7;
+    t12 = t9 + t3;
+    t10 = t8 + t5;
+    t4 = t14 + t13;
+    t6 = t11 - t7;
+    t0 = t9 - t3;
+    t1 = t8 - t5;
+    t11 = t14 - t13;
+    t7 = t2 + t10;
+    t9 = t12 + t4;
+    t3 = t6 + t11;
+    t8 = t0 - t1;
+    t5 = t2 - t10;
+    t14 = t12 - t4;
+    t13 = t6 - t11;
+    t2 = t0 + t1;
+    re[20] = t7;
+    im[20] = t9;
+    re[65] = t3;
+    im[65] = t8;
+    re[110] = t5;
+    im[110] = t14;
+    re[155] = t13;
+    im[155] = t2;
+    t10 = re[116];
+    t12 = im[116];
+    t4 = re[161];
+    t6 = im[161];
+    t11 = re[26];
+    t0 = im[26];
+    t1 = re[71];
+    t7 = im[71];
+    t9 = t10 + t11;
+    t3 = t12 + t0;
+    t8 = t4 + t1;
+    t5 = t6 + t7;
+    t14 = t10 - t11;
+    t13 = t12 - t0;
+    t2 = t4 - t1;
+    t10 = t6 - t7;
+    t11 = t9 + t8;
+    t12 = t3 + t5;
+    t0 = t14 + t10;
+    t4 = t13 - t2;
+    t1 = t9 - t8;
+    t6 = t3 - t5;
+    t7 = t14 - t10;
+    t9 = t13 + t2;
+    re[116] = t11;
+    im[116] = t12;
+    re[161] = t0;
+    im[161] = t4;
+    re[26] = t1;
+    im[26] = t6;
+    re[71] = t7;
+    im[71] = t9;
+    t8 = re[32];
+    t3 = im[32];
+    t5 = re[77];
+    t14 = im[77];
+    t10 = re[122];
+    t13 = im[122];
+    t2 = re[167];
+    t11 = im[167];
+    t12 = t8 + t10;
+    t0 = t3 + t13;
+    t4 = t5 + t2;
+    t1 = t14 + t11;
+    t6 = t8 - t10;
+    t7 = t3 - t13;
+    t9 = t5 - t2;
+    t8 = t14 - t11;
+    t10 = t12 + t4;
+    t3 = t0 + t1;
+    t13 = t6 + t8;
+    t5 = t7 - t9;
+    t2 = t12 - t4;
+    t14 = t0 - t1;
+    t11 = t6 - t8;
+    t12 = t7 + t9;
+    re[32] = t10;
+    im[32] = t3;
+    re[77] = t13;
+    im[77] = t5;
+    re[122] = t2;
+    im[122] = t14;
+    re[167] = t11;
+    im[167] = t12;
+    t4 = re[148];
+    t0 = im[148];
+    t1 = re[13];
+    t6 = im[13];
+    t8 = re[58];
+    t7 = im[58];
+    t9 = re[103];
+    t10 = im[103];
+    t3 = t4 + t8;
+    t13 = t0 + t7;
+    t5 = t1 + t9;
+    t2 = t6 + t10;
+    t14 = t4 - t8;
+    t11 = t0 - t7;
+    t12 = t1 - t9;
+    t4 = t6 - t10;
+    t8 = t3 + t5;
+    t0 = t13 + t2;
+    t7 = t14 + t4;
+    t1 = t11 - t12;
+    t9 = t3 - t5;
+    t6 = t13 - t2;
+    t10 = t14 - t4;
+    t3 = t11 + t12;
+    re[148] = t8;
+    im[148] = t0;
+    re[13] = t7;
+    im[13] = t1;
+    re[58] = t9;
+    im[58] = t6;
+    re[103] = t10;
+    im[103] = t3;
+    t5 = re[64];
+    t13 = im[64];
+    t2 = re[109];
+    t14 = im[109];
+    t4 = re[154];
+    t11 = im[154];
+    t12 = re[19];
+    t8 = im[19];
+    t0 = t5 + t4;
+    t7 = t13 + t11;
+    t1 = t2 + t12;
+    t9 = t14 + t8;
+    t6 = t5 - t4;
+    t10 = t13 - t11;
+    t3 = t2 - t12;
+    t5 = t14 - t8;
+    t4 = t0 + t1;
+    t13 = t7 + t9;
+    t11 = t6 + t5;
+    t2 = t10 - t3;
+    t12 = t0 - t1;
+    t14 = t7 - t9;
+    t8 = t6 - t5;
+    t0 = t10 + t3;
+    re[64] = t4;
+    im[64] = t13;
+    re[109] = t11;
+    im[109] = t2;
+    re[154] = t12;
+    im[154] = t14;
+    re[19] = t8;
+    im[19] = t0;
+    t1 = re[160];
+    t7 = im[160];
+    t9 = re[25];
+    t6 = im[25];
+    t5 = re[70];
+    t10 = im[70];
+    t3 = re[115];
+    t4 = im[115];
+    t13 = t1 + t5;
+    t11 = t7 + t10;
+    t2 = t9 + t3;
+    t12 = t6 + t4;
+    t14 = t1 - t5;
+    t8 = t7 - t10;
+    t0 = t9 - t3;
+    t1 = t6 - t4;
+    t5 = t13 + t2;
+    t7 = t11 + t12;
+    t10 = t14 + t1;
+    t9 = t8 - t0;
+    t3 = t13 - t2;
+    t6 = t11 - t12;
+    t4 = t14 - t1;
+    t13 = t8 + t0;
+    re[160] = t5;
+    im[160] = t7;
+    re[25] = t10;
+    im[25] = t9;
+    re[70] = t3;
+    im[70] = t6;
+    re[115] = t4;
+    im[115] = t13;
+    t2 = re[36];
+    t11 = im[36];
+    t12 = re[81];
+    t14 = im[81];
+    t1 = re[126];
+    t8 = im[126];
+    t0 = re[171];
+    t5 = im[171];
+    t7 = t2 + t1;
+    t10 = t11 + t8;
+    t9 = t12 + t0;
+    t3 = t14 + t5;
+    t6 = t2 - t1;
+    t4 = t11 - t8;
+    t13 = t12 - t0;
+    t2 = t14 - t5;
+    t1 = t7 + t9;
+    t11 = t10 + t3;
+    t8 = t6 + t2;
+    t12 = t4 - t13;
+    t0 = t7 - t9;
+    t14 = t10 - t3;
+    t5 = t6 - t2;
+    t7 = t4 + t13;
+    re[36] = t1;
+    im[36] = t11;
+    re[81] = t8;
+    im[81] = t12;
+    re[126] = t0;
+    im[126] = t14;
+    re[171] = t5;
+    im[171] = t7;
+    t9 = re[132];
+    t10 = im[132];
+    t3 = re[177];
+    t6 = im[177];
+    t2 = re[42];
+    t4 = im[42];
+    t13 = re[87];
+    t1 = im[87];
+    t11 = t9 + t2;
+    t8 = t10 + t4;
+    t12 = t3 + t13;
+    t0 = t6 + t1;
+    t14 = t9 - t2;
+    t5 = t10 - t4;
+    t7 = t3 - t13;
+    t9 = t6 - t1;
+    t2 = t11 + t12;
+    t10 = t8 + t0;
+    t4 = t14 + t9;
+    t3 = t5 - t7;
+    t13 = t11 - t12;
+    t6 = t8 - t0;
+    t1 = t14 - t9;
+    t11 = t5 + t7;
+    re[132] = t2;
+    im[132] = t10;
+    re[177] = t4;
+    im[177] = t3;
+    re[42] = t13;
+    im[42] = t6;
+    re[87] = t1;
+    im[87] = t11;
+    t12 = re[48];
+    t8 = im[48];
+    t0 = re[93];
+    t14 = im[93];
+    t9 = re[138];
+    t5 = im[138];
+    t7 = re[3];
+    t2 = im[3];
+    t10 = t12 + t9;
+    t4 = t8 + t5;
+    t3 = t0 + t7;
+    t13 = t14 + t2;
+    t6 = t12 - t9;
+    t1 = t8 - t5;
+    t11 = t0 - t7;
+    t12 = t14 - t2;
+    t9 = t10 + t3;
+    t8 = t4 + t13;
+    t5 = t6 + t12;
+    t0 = t1 - t11;
+    t7 = t10 - t3;
+    t14 = t4 - t13;
+    t2 = t6 - t12;
+    t10 = t1 + t11;
+    re[48] = t9;
+    im[48] = t8;
+    re[93] = t5;
+    im[93] = t0;
+    re[138] = t7;
+    im[138] = t14;
+    re[3] = t2;
+    im[3] = t10;
+    t3 = re[164];
+    t4 = im[164];
+    t13 = re[29];
+    t6 = im[29];
+    t12 = re[74];
+    t1 = im[74];
+    t11 = re[119];
+    t9 = im[119];
+    t8 = t3 + t12;
+    t5 = t4 + t1;
+    t0 = t13 + t11;
+    t7 = t6 + t9;
+    t14 = t3 - t12;
+    t2 = t4 - t1;
+    t10 = t13 - t11;
+    t3 = t6 - t9;
+    t12 = t8 + t0;
+    t4 = t5 + t7;
+    t1 = t14 + t3;
+    t13 = t2 - t10;
+    t11 = t8 - t0;
+    t6 = t5 - t7;
+    t9 = t14 - t3;
+    t8 = t2 + t10;
+    re[164] = t12;
+    im[164] = t4;
+    re[29] = t1;
+    im[29] = t13;
+    re[74] = t11;
+    im[74] = t6;
+    re[119] = t9;
+    im[119] = t8;
+    t0 = re[80];
+    t5 = im[80];
+    t7 = re[125];
+    t14 = im[125];
+    t3 = re[170];
+    t2 = im[170];
+    t10 = re[35];
+    t12 = im[35];
+    t4 = t0 + t3;
+    t1 = t5 + t2;
+    t13 = t7 + t10;
+    t11 = t14 + t12;
+    t6 = t0 - t3;
+    t9 = t5 - t2;
+    t8 = t7 - t10;
+    t0 = t14 - t12;
+    t3 = t4 + t13;
+    t5 = t1 + t11;
+    t2 = t6 + t0;
+    t7 = t9 - t8;
+    t10 = t4 - t13;
+    t14 = t1 - t11;
+    t12 = t6 - t0;
+    t4 = t9 + t8;
+    re[80] = t3;
+    im[80] = t5;
+    re[125] = t2;
+    im[125] = t7;
+    re[170] = t10;
+    im[170] = t14;
+    re[35] = t12;
+    im[35] = t4;
+    t13 = re[176];
+    t1 = im[176];
+    t11 = re[41];
+    t6 = im[41];
+    t0 = re[86];
+    t9 = im[86];
+    t8 = re[131];
+    t3 = im[131];
+    t5 = t13 + t0;
+    t2 = t1 + t9;
+    t7 = t11 + t8;
+    t10 = t6 + t3;
+    t14 = t13 - t0;
+    t12 = t1 - t9;
+    t4 = t11 - t8;
+    t13 = t6 - t3;
+    t0 = t5 + t7;
+    t1 = t2 + t10;
+    t9 = t14 + t13;
+    t11 = t12 - t4;
+    t8 = t5 - t7;
+    t6 = t2 - t10;
+    t3 = t14 - t13;
+    t5 = t12 + t4;
+    re[176] = t0;
+    im[176] = t1;
+    re[41] = t9;
+    im[41] = t11;
+    re[86] = t8;
+    im[86] = t6;
+    re[131] = t3;
+    im[131] = t5;
+    t7 = re[112];
+    t2 = im[112];
+    t10 = re[157];
+    t14 = im[157];
+    t13 = re[22];
+    t12 = im[22];
+    t4 = re[67];
+    t0 = im[67];
+    t1 = t7 + t13;
+    t9 = t2 + t12;
+    t11 = t10 + t4;
+    t8 = t14 + t0;
+    t6 = t7 - t13;
+    t3 = t2 - t12;
+    t5 = t10 - t4;
+    t7 = t14 - t0;
+    t13 = t1 + t11;
+    t2 = t9 + t8;
+    t12 = t6 + t7;
+    t10 = t3 - t5;
+    t4 = t1 - t11;
+    t14 = t9 - t8;
+    t0 = t6 - t7;
+    t1 = t3 + t5;
+    re[112] = t13;
+    im[112] = t2;
+    re[157] = t12;
+    im[157] = t10;
+    re[22] = t4;
+    im[22] = t14;
+    re[67] = t0;
+    im[67] = t1;
+    t11 = re[28];
+    t9 = im[28];
+    t8 = re[73];
+    t6 = im[73];
+    t7 = re[118];
+    t3 = im[118];
+    t5 = re[163];
+    t13 = im[163];
+    t2 = t11 + t7;
+    t12 = t9 + t3;
+    t10 = t8 + t5;
+    t4 = t6 + t13;
+    t14 = t11 - t7;
+    t0 = t9 - t3;
+    t1 = t8 - t5;
+    t11 = t6 - t13;
+    t7 = t2 + t10;
+    t9 = t12 + t4;
+    t3 = t14 + t11;
+    t8 = t0 - t1;
+    t5 = t2 - t10;
+    t6 = t12 - t4;
+    t13 = t14 - t11;
+    t2 = t0 + t1;
+    re[28] = t7;
+    im[28] = t9;
+    re[73] = t3;
+    im[73] = t8;
+    re[118] = t5;
+    im[118] = t6;
+    re[163] = t13;
+    im[163] = t2;
+    t10 = re[124];
+    t12 = im[124];
+    t4 = re[169];
+    t14 = im[169];
+    t11 = re[34];
+    t0 = im[34];
+    t1 = re[79];
+    t7 = im[79];
+    t9 = t10 + t11;
+    t3 = t12 + t0;
+    t8 = t4 + t1;
+    t5 = t14 + t7;
+    t6 = t10 - t11;
+    t13 = t12 - t0;
+    t2 = t4 - t1;
+    t10 = t14 - t7;
+    t11 = t9 + t8;
+    t12 = t3 + t5;
+    t0 = t6 + t10;
+    t4 = t13 - t2;
+    t1 = t9 - t8;
+    t14 = t3 - t5;
+    t7 = t6 - t10;
+    t9 = t13 + t2;
+    re[124] = t11;
+    im[124] = t12;
+    re[169] = t0;
+    im[169] = t4;
+    re[34] = t1;
+    im[34] = t14;
+    re[79] = t7;
+    im[79] = t9;
+    t8 = re[141];
+    t3 = im[141];
+    t5 = re[79];
+    t6 = im[79];
+    t10 = t8 + t5;
+    t13 = t3 - t6;
+    t2 = t3 + t6;
+    t11 = t8 - t5;
+    t12 = C0 * t10;
+    t0 = C0 * t13;
+    t4 = C0 * t2;
+    t1 = C0 * t11;
+    re[141] = t12;
+    im[141] = t0;
+    re[79] = t4;
+    im[79] = t1;
+    t14 = re[102];
+    t7 = im[102];
+    t9 = re[118];
+    t3 = im[118];
+    t6 = t14 + t9;
+    t8 = t7 - t3;
+    t5 = t7 + t3;
+    t10 = t14 - t9;
+    t13 = C0 * t6;
+    t2 = C0 * t8;
+    t11 = C0 * t5;
+    t12 = C0 * t10;
+    re[102] = t13;
+    im[102] = t2;
+    re[118] = t11;
+    im[118] = t12;
+    t0 = re[83];
+    t4 = im[83];
+    t1 = re[157];
+    t7 = im[157];
+    t3 = t0 + t1;
+    t14 = t4 - t7;
+    t9 = t4 + t7;
+    t6 = t0 - t1;
+    t8 = C0 * t3;
+    t5 = C0 * t14;
+    t10 = C0 * t9;
+    t13 = C0 * t6;
+    re[83] = t8;
+    im[83] = t5;
+    re[157] = t10;
+    im[157] = t13;
+    t2 = re[44];
+    t11 = im[44];
+    t12 = re[176];
+    t4 = im[176];
+    t7 = t2 + t12;
+    t0 = t11 - t4;
+    t1 = t11 + t4;
+    t3 = t2 - t12;
+    t14 = C0 * t7;
+    t9 = C0 * t0;
+    t6 = C0 * t1;
+    t8 = C0 * t3;
+    re[44] = t14;
+    im[44] = t9;
+    re[176] = t6;
+    im[176] = t8;
+    t5 = re[5];
+    t10 = im[5];
+    t13 = re[35];
+    t11 = im[35];
+    t4 = t5 + t13;
+    t2 = t10 - t11;
+    t12 = t10 + t11;
+    t7 = t5 - t13;
+    t0 = C0 * t4;
+    t1 = C0 * t2;
+    t3 = C0 * t12;
+    t14 = C0 * t7;
+    re[5] = t0;
+    im[5] = t1;
+    re[35] = t3;
+    im[35] = t14;
+    t9 = re[166];
+    t6 = im[166];
+    t8 = re[74];
+    t10 = im[74];
+    t11 = t9 + t8;
+    t5 = t6 - t10;
+    t13 = t6 + t10;
+    t4 = t9 - t8;
+    t2 = C0 * t11;
+    t12 = C0 * t5;
+    t7 = C0 * t13;
+    t0 = C0 * t4;
+    re[166] = t2;
+    im[166] = t12;
+    re[74] = t7;
+    im[74] = t0;
+    t1 = re[127];
+    t3 = im[127];
+    t14 = re[93];
+    t6 = im[93];
+    t10 = t1 + t14;
+    t9 = t3 - t6;
+    t8 = t3 + t6;
+    t11 = t1 - t14;
+    t5 = C0 * t10;
+    t13 = C0 * t9;
+    t4 = C0 * t8;
+    t2 = C0 * t11;
+    re[127] = t5;
+    im[127] = t13;
+    re[93] = t4;
+    im[93] = t2;
+    t12 = re[88];
+    t7 = im[88];
+    t0 = re[132];
+    t3 = im[132];
+    t6 = t12 + t0;
+    t1 = t7 - t3;
+    t14 = t7 + t3;
+    t10 = t12 - t0;
+    t9 = C0 * t6;
+    t8 = C0 * t1;
+    t11 = C0 * t14;
+    t5 = C0 * t10;
+    re[88] = t9;
+    im[88] = t8;
+    re[132] = t11;
+    im[132] = t5;
+    t13 = re[9];
+    t4 = im[9];
+    t2 = re[171];
+    t7 = im[171];
+    t3 = t13 + t2;
+    t12 = t4 - t7;
+    t0 = t4 + t7;
+    t6 = t13 - t2;
+    t1 = C0 * t3;
+    t14 = C0 * t12;
+    t10 = C0 * t0;
+    t9 = C0 * t6;
+    re[9] = t1;
+    im[9] = t14;
+    re[171] = t10;
+    im[171] = t9;
+    t8 = re[150];
+    t11 = im[150];
+    t5 = re[70];
+    t4 = im[70];
+    t7 = t8 + t5;
+    t13 = t11 - t4;
+    t2 = t11 + t4;
+    t3 = t8 - t5;
+    t12 = C0 * t7;
+    t0 = C0 * t13;
+    t6 = C0 * t2;
+    t1 = C0 * t3;
+    re[150] = t12;
+    im[150] = t0;
+    re[70] = t6;
+    im[70] = t1;
+    t14 = re[111];
+    t10 = im[111];
+    t9 = re[109];
+    t11 = im[109];
+    t4 = t14 + t9;
+    t8 = t10 - t11;
+    t5 = t10 + t11;
+    t7 = t14 - t9;
+    t13 = C0 * t4;
+    t2 = C0 * t8;
+    t3 = C0 * t5;
+    t12 = C0 * t7;
+    re[111] = t13;
+    im[111] = t2;
+    re[109] = t3;
+    im[109] = t12;
+    t0 = re[92];
+    t6 = im[92];
+    t1 = re[148];
+    t10 = im[148];
+    t11 = t0 + t1;
+    t14 = t6 - t10;
+    t9 = t6 + t10;
+    t4 = t0 - t1;
+    t8 = C0 * t11;
+    t5 = C0 * t14;
+    t7 = C0 * t9;
+    t13 = C0 * t4;
+    re[92] = t8;
+    im[92] = t5;
+    re[148] = t7;
+    im[148] = t13;
+    t2 = re[53];
+    t3 = im[53];
+    t12 = re[167];
+    t6 = im[167];
+    t10 = t2 + t12;
+    t0 = t3 - t6;
+    t1 = t3 + t6;
+    t11 = t2 - t12;
+    t14 = C0 * t10;
+    t9 = C0 * t0;
+    t4 = C0 * t1;
+    t8 = C0 * t11;
+    re[53] = t14;
+    im[53] = t9;
+    re[167] = t4;
+    im[167] = t8;
+    t5 = re[14];
+    t7 = im[14];
+    t13 = re[26];
+    t3 = im[26];
+    t6 = t5 + t13;
+    t2 = t7 - t3;
+    t12 = t7 + t3;
+    t10 = t5 - t13;
+    t0 = C0 * t6;
+    t1 = C0 * t2;
+    t11 = C0 * t12;
+    t14 = C0 * t10;
+    re[14] = t0;
+    im[14] = t1;
+    re[26] = t11;
+    im[26] = t14;
+    t9 = re[175];
+    t4 = im[175];
+    t8 = re[65];
+    t7 = im[65];
+    t3 = t9 + t8;
+    t5 = t4 - t7;
+    t13 = t4 + t7;
+    t6 = t9 - t8;
+    t2 = C0 * t3;
+    t12 = C0 * t5;
+    t10 = C0 * t13;
+    t0 = C0 * t6;
+    re[175] = t2;
+    im[175] = t12;
+    re[65] = t10;
+    im[65] = t0;
+    t1 = re[136];
+    t11 = im[136];
+    t14 = re[84];
+    t4 = im[84];
+    t7 = t1 + t14;
+    t9 = t11 - t4;
+    t8 = t11 + t4;
+    t3 = t1 - t14;
+    t5 = C0 * t7;
+    t13 = C0 * t9;
+    t6 = C0 * t8;
+    t2 = C0 * t3;
+    re[136] = t5;
+    im[136] = t13;
+    re[84] = t6;
+    im[84] = t2;
+    t12 = re[97];
+    t10 = im[97];
+    t0 = re[123];
+    t11 = im[123];
+    t4 = t12 + t0;
+    t1 = t10 - t11;
+    t14 = t10 + t11;
+    t7 = t12 - t0;
+    t9 = C0 * t4;
+    t8 = C0 * t1;
+    t3 = C0 * t14;
+    t5 = C0 * t7;
+    re[97] = t9;
+    im[97] = t8;
+    re[123] = t3;
+    im[123] = t5;
+    t13 = re[18];
+    t6 = im[18];
+    t2 = re[162];
+    t10 = im[162];
+    t11 = t13 + t2;
+    t12 = t6 - t10;
+    t0 = t6 + t10;
+    t4 = t13 - t2;
+    t1 = C0 * t11;
+    t14 = C0 * t12;
+    t7 = C0 * t0;
+    t9 = C0 * t4;
+    re[18] = t1;
+    im[18] = t14;
+    re[162] = t7;
+    im[162] = t9;
+    t8 = re[159];
+    t3 = im[159];
+    t5 = re[61];
+    t6 = im[61];
+    t10 = t8 + t5;
+    t13 = t3 - t6;
+    t2 = t3 + t6;
+    t11 = t8 - t5;
+    t12 = C0 * t10;
+    t0 = C0 * t13;
+    t4 = C0 * t2;
+    t1 = C0 * t11;
+    re[159] = t12;
+    im[159] = t0;
+    re[61] = t4;
+    im[61] = t1;
+    t14 = re[120];
+    t7 = im[120];
+    t9 = re[100];
+    t3 = im[100];
+    t6 = t14 + t9;
+    t8 = t7 - t3;
+    t5 = t7 + t3;
+    t10 = t14 - t9;
+    t13 = C0 * t6;
+    t2 = C0 * t8;
+    t11 = C0 * t5;
+    t12 = C0 * t10;
+    re[120] = t13;
+    im[120] = t2;
+    re[100] = t11;
+    im[100] = t12;
+    t0 = re[101];
+    t4 = im[101];
+    t1 = re[139];
+    t7 = im[139];
+    t3 = t0 + t1;
+    t14 = t4 - t7;
+    t9 = t4 + t7;
+    t6 = t0 - t1;
+    t8 = C0 * t3;
+    t5 = C0 * t14;
+    t10 = C0 * t9;
+    t13 = C0 * t6;
+    re[101] = t8;
+    im[101] = t5;
+    re[139] = t10;
+    im[139] = t13;
+    t2 = re[62];
+    t11 = im[62];
+    t12 = re[158];
+    t4 = im[158];
+    t7 = t2 + t12;
+    t0 = t11 - t4;
+    t1 = t11 + t4;
+    t3 = t2 - t12;
+    t14 = C0 * t7;
+    t9 = C0 * t0;
+    t6 = C0 * t1;
+    t8 = C0 * t3;
+    re[62] = t14;
+    im[62] = t9;
+    re[158] = t6;
+    im[158] = t8;
+    t5 = re[23];
+    t10 = im[23];
+    t13 = re[17];
+    t11 = im[17];
+    t4 = t5 + t13;
+    t2 = t10 - t11;
+    t12 = t10 + t11;
+    t7 = t5 - t13;
+    t0 = C0 * t4;
+    t1 = C0 * t2;
+    t3 = C0 * t12;
+    t14 = C0 * t7;
+    re[23] = t0;
+    im[23] = t1;
+    re[17] = t3;
+    im[17] = t14;
+    t9 = re[4];
+    t6 = im[4];
+    t8 = re[56];
+    t10 = im[56];
+    t11 = t9 + t8;
+    t5 = t6 - t10;
+    t13 = t6 + t10;
+    t4 = t9 - t8;
+    t2 = C0 * t11;
+    t12 = C0 * t5;
+    t7 = C0 * t13;
+    t0 = C0 * t4;
+    re[4] = t2;
+    im[4] = t12;
+    re[56] = t7;
+    im[56] = t0;
+    t1 = re[145];
+    t3 = im[145];
+    t14 = re[75];
+    t6 = im[75];
+    t10 = t1 + t14;
+    t9 = t3 - t6;
+    t8 = t3 + t6;
+    t11 = t1 - t14;
+    t5 = C0 * t10;
+    t13 = C0 * t9;
+    t4 = C0 * t8;
+    t2 = C0 * t11;
+    re[145] = t5;
+    im[145] = t13;
+    re[75] = t4;
+    im[75] = t2;
+    t12 = re[106];
+    t7 = im[106];
+    t0 = re[114];
+    t3 = im[114];
+    t6 = t12 + t0;
+    t1 = t7 - t3;
+    t14 = t7 + t3;
+    t10 = t12 - t0;
+    t9 = C0 * t6;
+    t8 = C0 * t1;
+    t11 = C0 * t14;
+    t5 = C0 * t10;
+    re[106] = t9;
+    im[106] = t8;
+    re[114] = t11;
+    im[114] = t5;
+    t13 = re[27];
+    t4 = im[27];
+    t2 = re[153];
+    t7 = im[153];
+    t3 = t13 + t2;
+    t12 = t4 - t7;
+    t0 = t4 + t7;
+    t6 = t13 - t2;
+    t1 = C0 * t3;
+    t14 = C0 * t12;
+    t10 = C0 * t0;
+    t9 = C0 * t6;
+    re[27] = t1;
+    im[27] = t14;
+    re[153] = t10;
+    im[153] = t9;
+    t8 = re[168];
+    t11 = im[168];
+    t5 = re[52];
+    t4 = im[52];
+    t7 = t8 + t5;
+    t13 = t11 - t4;
+    t2 = t11 + t4;
+    t3 = t8 - t5;
+    t12 = C0 * t7;
+    t0 = C0 * t13;
+    t6 = C0 * t2;
+    t1 = C0 * t3;
+    re[168] = t12;
+    im[168] = t0;
+    re[52] = t6;
+    im[52] = t1;
+    t14 = re[129];
+    t10 = im[129];
+    t9 = re[91];
+    t11 = im[91];
+    t4 = t14 + t9;
+    t8 = t10 - t11;
+    t5 = t10 + t11;
+    t7 = t14 - t9;
+    t13 = C0 * t4;
+    t2 = C0 * t8;
+    t3 = C0 * t5;
+    t12 = C0 * t7;
+    re[129] = t13;
+    im[129] = t2;
+    re[91] = t3;
+    im[91] = t12;
+    t0 = re[110];
+    t6 = im[110];
+    t1 = re[130];
+    t10 = im[130];
+    t11 = t0 + t1;
+    t14 = t6 - t10;
+    t9 = t6 + t10;
+    t4 = t0 - t1;
+    t8 = C0 * t11;
+    t5 = C0 * t14;
+    t7 = C0 * t9;
+    t13 = C0 * t4;
+    re[110] = t8;
+    im[110] = t5;
+    re[130] = t7;
+    im[130] = t13;
+    t2 = re[71];
+    t3 = im[71];
+    t12 = re[149];
+    t6 = im[149];
+    t10 = t2 + t12;
+    t0 = t3 - t6;
+    t1 = t3 + t6;
+    t11 = t2 - t12;
+    t14 = C0 * t10;
+    t9 = C0 * t0;
+    t4 = C0 * t1;
+    t8 = C0 * t11;
+    re[71] = t14;
+    im[71] = t9;
+    re[149] = t4;
+    im[149] = t8;
+    t5 = re[32];
+    t7 = im[32];
+    t13 = re[8];
+    t3 = im[8];
+    t6 = t5 + t13;
+    t2 = t7 - t3;
+    t12 = t7 + t3;
+    t10 = t5 - t13;
+    t0 = C0 * t6;
+    t1 = C0 * t2;
+    t11 = C0 * t12;
+    t14 = C0 * t10;
+    re[32] = t0;
+    im[32] = t1;
+    re[8] = t11;
+    im[8] = t14;
+    t9 = re[13];
+    t4 = im[13];
+    t8 = re[47];
+    t7 = im[47];
+    t3 = t9 + t8;
+    t5 = t4 - t7;
+    t13 = t4 + t7;
+    t6 = t9 - t8;
+    t2 = C0 * t3;
+    t12 = C0 * t5;
+    t10 = C0 * t13;
+    t0 = C0 * t6;
+    re[13] = t2;
+    im[13] = t12;
+    re[47] = t10;
+    im[47] = t0;
+    t1 = re[154];
+    t11 = im[154];
+    t14 = re[66];
+    t4 = im[66];
+    t7 = t1 + t14;
+    t9 = t11 - t4;
+    t8 = t11 + t4;
+    t3 = t1 - t14;
+    t5 = C0 * t7;
+    t13 = C0 * t9;
+    t6 = C0 * t8;
+    t2 = C0 * t3;
+    re[154] = t5;
+    im[154] = t13;
+    re[66] = t6;
+    im[66] = t2;
+    t12 = re[115];
+    t10 = im[115];
+    t0 = re[105];
+    t11 = im[105];
+    t4 = t12 + t0;
+    t1 = t10 - t11;
+    t14 = t10 + t11;
+    t7 = t12 - t0;
+    t9 = C0 * t4;
+    t8 = C0 * t1;
+    t3 = C0 * t14;
+    t5 = C0 * t7;
+    re[115] = t9;
+    im[115] = t8;
+    re[105] = t3;
+    im[105] = t5;
+    t13 = re[36];
+    t6 = im[36];
+    t2 = re[144];
+    t10 = im[144];
+    t11 = t13 + t2;
+    t12 = t6 - t10;
+    t0 = t6 + t10;
+    t4 = t13 - t2;
+    t1 = C0 * t11;
+    t14 = C0 * t12;
+    t7 = C0 * t0;
+    t9 = C0 * t4;
+    re[36] = t1;
+    im[36] = t14;
+    re[144] = t7;
+    im[144] = t9;
+    t8 = re[177];
+    t3 = im[177];
+    t5 = re[43];
+    t6 = im[43];
+    t10 = t8 + t5;
+    t13 = t3 - t6;
+    t2 = t3 + t6;
+    t11 = t8 - t5;
+    t12 = C0 * t10;
+    t0 = C0 * t13;
+    t4 = C0 * t2;
+    t1 = C0 * t11;
+    re[177] = t12;
+    im[177] = t0;
+    re[43] = t4;
+    im[43] = t1;
+    t14 = re[138];
+    t7 = im[138];
+    t9 = re[82];
+    t3 = im[82];
+    t6 = t14 + t9;
+    t8 = t7 - t3;
+    t5 = t7 + t3;
+    t10 = t14 - t9;
+    t13 = C0 * t6;
+    t2 = C0 * t8;
+    t11 = C0 * t5;
+    t12 = C0 * t10;
+    re[138] = t13;
+    im[138] = t2;
+    re[82] = t11;
+    im[82] = t12;
+    t0 = re[119];
+    t4 = im[119];
+    t1 = re[121];
+    t7 = im[121];
+    t3 = t0 + t1;
+    t14 = t4 - t7;
+    t9 = t4 + t7;
+    t6 = t0 - t1;
+    t8 = C0 * t3;
+    t5 = C0 * t14;
+    t10 = C0 * t9;
+    t13 = C0 * t6;
+    re[119] = t8;
+    im[119] = t5;
+    re[121] = t10;
+    im[121] = t13;
+    t2 = re[80];
+    t11 = im[80];
+    t12 = re[140];
+    t4 = im[140];
+    t7 = t2 + t12;
+    t0 = t11 - t4;
+    t1 = t11 + t4;
+    t3 = t2 - t12;
+    t14 = C0 * t7;
+    t9 = C0 * t0;
+    t6 = C0 * t1;
+    t8 = C0 * t3;
+    re[80] = t14;
+    im[80] = t9;
+    re[140] = t6;
+    im[140] = t8;
+    t5 = re[41];
+    t10 = im[41];
+    t13 = re[179];
+    t11 = im[179];
+    t4 = t5 + t13;
+    t2 = t10 - t11;
+    t12 = t10 + t11;
+    t7 = t5 - t13;
+    t0 = C0 * t4;
+    t1 = C0 * t2;
+    t3 = C0 * t12;
+    t14 = C0 * t7;
+    re[41] = t0;
+    im[41] = t1;
+    re[179] = t3;
+    im[179] = t14;
+    t9 = re[22];
+    t6 = im[22];
+    t8 = re[38];
+    t10 = im[38];
+    t11 = t9 + t8;
+    t5 = t6 - t10;
+    t13 = t6 + t10;
+    t4 = t9 - t8;
+    t2 = C0 * t11;
+    t12 = C0 * t5;
+    t7 = C0 * t13;
+    t0 = C0 * t4;
+    re[22] = t2;
+    im[22] = t12;
+    re[38] = t7;
+    im[38] = t0;
+    t1 = re[163];
+    t3 = im[163];
+    t14 = re[57];
+    t6 = im[57];
+    t10 = t1 + t14;
+    t9 = t3 - t6;
+    t8 = t3 + t6;
+    t11 = t1 - t14;
+    t5 = C0 * t10;
+    t13 = C0 * t9;
+    t4 = C0 * t8;
+    t2 = C0 * t11;
+    re[163] = t5;
+    im[163] = t13;
+    re[57] = t4;
+    im[57] = t2;
+    t12 = re[124];
+    t7 = im[124];
+    t0 = re[96];
+    t3 = im[96];
+    t6 = t12 + t0;
+    t1 = t7 - t3;
+    t14 = t7 + t3;
+    t10 = t12 - t0;
+    t9 = C0 * t6;
+    t8 = C0 * t1;
+    t11 = C0 * t14;
+    t5 = C0 * t10;
+    re[124] = t9;
+    im[124] = t8;
+    re[96] = t11;
+    im[96] = t5;
+    t13 = re[45];
+    t4 = im[45];
+    t2 = re[135];
+    t7 = im[135];
+    t3 = t13 + t2;
+    t12 = t4 - t7;
+    t0 = t4 + t7;
+    t6 = t13 - t2;
+    t1 = C0 * t3;
+    t14 = C0 * t12;
+    t10 = C0 * t0;
+    t9 = C0 * t6;
+    re[45] = t1;
+    im[45] = t14;
+    re[135] = t10;
+    im[135] = t9;
+    t8 = re[6];
+    t11 = im[6];
+    t5 = re[34];
+    t4 = im[34];
+    t7 = t8 + t5;
+    t13 = t11 - t4;
+    t2 = t11 + t4;
+    t3 = t8 - t5;
+    t12 = C0 * t7;
+    t0 = C0 * t13;
+    t6 = C0 * t2;
+    t1 = C0 * t3;
+    re[6] = t12;
+    im[6] = t0;
+    re[34] = t6;
+    im[34] = t1;
+    t14 = re[147];
+    t10 = im[147];
+    t9 = re[73];
+    t11 = im[73];
+    t4 = t14 + t9;
+    t8 = t10 - t11;
+    t5 = t10 + t11;
+    t7 = t14 - t9;
+    t13 = C0 * t4;
+    t2 = C0 * t8;
+    t3 = C0 * t5;
+    t12 = C0 * t7;
+    re[147] = t13;
+    im[147] = t2;
+    re[73] = t3;
+    im[73] = t12;
+    t0 = re[128];
+    t6 = im[128];
+    t1 = re[112];
+    t10 = im[112];
+    t11 = t0 + t1;
+    t14 = t6 - t10;
+    t9 = t6 + t10;
+    t4 = t0 - t1;
+    t8 = C0 * t11;
+    t5 = C0 * t14;
+    t7 = C0 * t9;
+    t13 = C0 * t4;
+    re[128] = t8;
+    im[128] = t5;
+    re[112] = t7;
+    im[112] = t13;
+    t2 = re[89];
+    t3 = im[89];
+    t12 = re[131];
+    t6 = im[131];
+    t10 = t2 + t12;
+    t0 = t3 - t6;
+    t1 = t3 + t6;
+    t11 = t2 - t12;
+    t14 = C0 * t10;
+    t9 = C0 * t0;
+    t4 = C0 * t1;
+    t8 = C0 * t11;
+    re[89] = t14;
+    im[89] = t9;
+    re[131] = t4;
+    im[131] = t8;
+    t5 = re[50];
+    t7 = im[50];
+    t13 = re[170];
+    t3 = im[170];
+    t6 = t5 + t13;
+    t2 = t7 - t3;
+    t12 = t7 + t3;
+    t10 = t5 - t13;
+    t0 = C0 * t6;
+    t1 = C0 * t2;
+    t11 = C0 * t12;
+    t14 = C0 * t10;
+    re[50] = t0;
+    im[50] = t1;
+    re[170] = t11;
+    im[170] = t14;
+    t9 = re[31];
+    t4 = im[31];
+    t8 = re[29];
+    t7 = im[29];
+    t3 = t9 + t8;
+    t5 = t4 - t7;
+    t13 = t4 + t7;
+    t6 = t9 - t8;
+    t2 = C0 * t3;
+    t12 = C0 * t5;
+    t10 = C0 * t13;
+    t0 = C0 * t6;
+    re[31] = t2;
+    im[31] = t12;
+    re[29] = t10;
+    im[29] = t0;
+    t1 = re[172];
+    t11 = im[172];
+    t14 = re[48];
+    t4 = im[48];
+    t7 = t1 + t14;
+    t9 = t11 - t4;
+    t8 = t11 + t4;
+    t3 = t1 - t14;
+    t5 = C0 * t7;
+    t13 = C0 * t9;
+    t6 = C0 * t8;
+    t2 = C0 * t3;
+    re[172] = t5;
+    im[172] = t13;
+    re[48] = t6;
+    im[48] = t2;
+    t12 = re[133];
+    t10 = im[133];
+    t0 = re[87];
+    t11 = im[87];
+    t4 = t12 + t0;
+    t1 = t10 - t11;
+    t14 = t10 + t11;
+    t7 = t12 - t0;
+    t9 = C0 * t4;
+    t8 = C0 * t1;
+    t3 = C0 * t14;
+    t5 = C0 * t7;
+    re[133] = t9;
+    im[133] = t8;
+    re[87] = t3;
+    im[87] = t5;
+    t13 = re[54];
+    t6 = im[54];
+    t2 = re[126];
+    t10 = im[126];
+    t11 = t13 + t2;
+    t12 = t6 - t10;
+    t0 = t6 + t10;
+    t4 = t13 - t2;
+    t1 = C0 * t11;
+    t14 = C0 * t12;
+    t7 = C0 * t0;
+    t9 = C0 * t4;
+    re[54] = t1;
+    im[54] = t14;
+    re[126] = t7;
+    im[126] = t9;
+    t8 = re[15];
+    t3 = im[15];
+    t5 = re[25];
+    t6 = im[25];
+    t10 = t8 + t5;
+    t13 = t3 - t6;
+    t2 = t3 + t6;
+    t11 = t8 - t5;
+    t12 = C0 * t10;
+    t0 = C0 * t13;
+    t4 = C0 * t2;
+    t1 = C0 * t11;
+    re[15] = t12;
+    im[15] = t0;
+    re[25] = t4;
+    im[25] = t1;
+    t14 = re[156];
+    t7 = im[156];
+    t9 = re[64];
+    t3 = im[64];
+    t6 = t14 + t9;
+    t8 = t7 - t3;
+    t5 = t7 + t3;
+    t10 = t14 - t9;
+    t13 = C0 * t6;
+    t2 = C0 * t8;
+    t11 = C0 * t5;
+    t12 = C0 * t10;
+    re[156] = t13;
+    im[156] = t2;
+    re[64] = t11;
+    im[64] = t12;
+    t0 = re[137];
+    t4 = im[137];
+    t1 = re[103];
+    t7 = im[103];
+    t3 = t0 + t1;
+    t14 = t4 - t7;
+    t9 = t4 + t7;
+    t6 = t0 - t1;
+    t8 = C0 * t3;
+    t5 = C0 * t14;
+    t10 = C0 * t9;
+    t13 = C0 * t6;
+    re[137] = t8;
+    im[137] = t5;
+    re[103] = t10;
+    im[103] = t13;
+    t2 = re[98];
+    t11 = im[98];
+    t12 = re[122];
+    t4 = im[122];
+    t7 = t2 + t12;
+    t0 = t11 - t4;
+    t1 = t11 + t4;
+    t3 = t2 - t12;
+    t14 = C0 * t7;
+    t9 = C0 * t0;
+    t6 = C0 * t1;
+    t8 = C0 * t3;
+    re[98] = t14;
+    im[98] = t9;
+    re[122] = t6;
+    im[122] = t8;
+    t5 = re[59];
+    t10 = im[59];
+    t13 = re[161];
+    t11 = im[161];
+    t4 = t5 + t13;
+    t2 = t10 - t11;
+    t12 = t10 + t11;
+    t7 = t5 - t13;
+    t0 = C0 * t4;
+    t1 = C0 * t2;
+    t3 = C0 * t12;
+    t14 = C0 * t7;
+    re[59] = t0;
+    im[59] = t1;
+    re[161] = t3;
+    im[161] = t14;
+    t9 = re[40];
+    t6 = im[40];
+    t8 = re[20];
+    t10 = im[20];
+    t11 = t9 + t8;
+    t5 = t6 - t10;
+    t13 = t6 + t10;
+    t4 = t9 - t8;
+    t2 = C0 * t11;
+    t12 = C0 * t5;
+    t7 = C0 * t13;
+    t0 = C0 * t4;
+    re[40] = t2;
+    im[40] = t12;
+    re[20] = t7;
+    im[20] = t0;
+    t1 = re[1];
+    t3 = im[1];
+    t14 = re[39];
+    t6 = im[39];
+    t10 = t1 + t14;
+    t9 = t3 - t6;
+    t8 = t3 + t6;
+    t11 = t1 - t14;
+    t5 = C0 * t10;
+    t13 = C0 * t9;
+    t4 = C0 * t8;
+    t2 = C0 * t11;
+    re[1] = t5;
+    im[1] = t13;
+    re[39] = t4;
+    im[39] = t2;
+    t12 = re[142];
+    t7 = im[142];
+    t0 = re[78];
+    t3 = im[78];
+    t6 = t12 + t0;
+    t1 = t7 - t3;
+    t14 = t7 + t3;
+    t10 = t12 - t0;
+    t9 = C0 * t6;
+    t8 = C0 * t1;
+    t11 = C0 * t14;
+    t5 = C0 * t10;
+    re[142] = t9;
+    im[142] = t8;
+    re[78] = t11;
+    im[78] = t5;
+    t13 = re[63];
+    t4 = im[63];
+    t2 = re[117];
+    t7 = im[117];
+    t3 = t13 + t2;
+    t12 = t4 - t7;
+    t0 = t4 + t7;
+    t6 = t13 - t2;
+    t1 = C0 * t3;
+    t14 = C0 * t12;
+    t10 = C0 * t0;
+    t9 = C0 * t6;
+    re[63] = t1;
+    im[63] = t14;
+    re[117] = t10;
+    im[117] = t9;
+}
+
+/**
+ *  Part 6 of ApplyMixedRadixPairedRFFT_180().
+ * 
+ *  @param {Number[]} re 
+ *    - The real part of each point.
+ *  @param {Number[]} im 
+ *    - The imaginary part of each point.
+ */
+function ApplyMixedRadixPairedRFFT_180_Part6(re, im) {
+    let t0, t1, t10, t11, t12, t13, t14, t2, t3, t4, t5, t6, t7, t8, t9;
+    const C0 = 0.5;
+    t8 = re[24];
+    t11 = im[24];
+    t5 = re[16];
+    t4 = im[16];
+    t7 = t8 + t5;
+    t13 = t11 - t4;
+    t2 = t11 + t4;
+    t3 = t8 - t5;
+    t12 = C0 * t7;
+    t0 = C0 * t13;
+    t6 = C0 * t2;
+    t1 = C0 * t3;
+    re[24] = t12;
+    im[24] = t0;
+    re[16] = t6;
+    im[16] = t1;
+    t14 = re[165];
+    t10 = im[165];
+    t9 = re[55];
+    t11 = im[55];
+    t4 = t14 + t9;
+    t8 = t10 - t11;
+    t5 = t10 + t11;
+    t7 = t14 - t9;
+    t13 = C0 * t4;
+    t2 = C0 * t8;
+    t3 = C0 * t5;
+    t12 = C0 * t7;
+    re[165] = t13;
+    im[165] = t2;
+    re[55] = t3;
+    im[55] = t12;
+    t0 = re[146];
+    t6 = im[146];
+    t1 = re[94];
+    t10 = im[94];
+    t11 = t0 + t1;
+    t14 = t6 - t10;
+    t9 = t6 + t10;
+    t4 = t0 - t1;
+    t8 = C0 * t11;
+    t5 = C0 * t14;
+    t7 = C0 * t9;
+    t13 = C0 * t4;
+    re[146] = t8;
+    im[146] = t5;
+    re[94] = t7;
+    im[94] = t13;
+    t2 = re[107];
+    t3 = im[107];
+    t12 = re[113];
+    t6 = im[113];
+    t10 = t2 + t12;
+    t0 = t3 - t6;
+    t1 = t3 + t6;
+    t11 = t2 - t12;
+    t14 = C0 * t10;
+    t9 = C0 * t0;
+    t4 = C0 * t1;
+    t8 = C0 * t11;
+    re[107] = t14;
+    im[107] = t9;
+    re[113] = t4;
+    im[113] = t8;
+    t5 = re[68];
+    t7 = im[68];
+    t13 = re[152];
+    t3 = im[152];
+    t6 = t5 + t13;
+    t2 = t7 - t3;
+    t12 = t7 + t3;
+    t10 = t5 - t13;
+    t0 = C0 * t6;
+    t1 = C0 * t2;
+    t11 = C0 * t12;
+    t14 = C0 * t10;
+    re[68] = t0;
+    im[68] = t1;
+    re[152] = t11;
+    im[152] = t14;
+    t9 = re[49];
+    t4 = im[49];
+    t8 = re[11];
+    t7 = im[11];
+    t3 = t9 + t8;
+    t5 = t4 - t7;
+    t13 = t4 + t7;
+    t6 = t9 - t8;
+    t2 = C0 * t3;
+    t12 = C0 * t5;
+    t10 = C0 * t13;
+    t0 = C0 * t6;
+    re[49] = t2;
+    im[49] = t12;
+    re[11] = t10;
+    im[11] = t0;
+    t1 = re[10];
+    t11 = im[10];
+    t14 = re[30];
+    t4 = im[30];
+    t7 = t1 + t14;
+    t9 = t11 - t4;
+    t8 = t11 + t4;
+    t3 = t1 - t14;
+    t5 = C0 * t7;
+    t13 = C0 * t9;
+    t6 = C0 * t8;
+    t2 = C0 * t3;
+    re[10] = t5;
+    im[10] = t13;
+    re[30] = t6;
+    im[30] = t2;
+    t12 = re[151];
+    t10 = im[151];
+    t0 = re[69];
+    t11 = im[69];
+    t4 = t12 + t0;
+    t1 = t10 - t11;
+    t14 = t10 + t11;
+    t7 = t12 - t0;
+    t9 = C0 * t4;
+    t8 = C0 * t1;
+    t3 = C0 * t14;
+    t5 = C0 * t7;
+    re[151] = t9;
+    im[151] = t8;
+    re[69] = t3;
+    im[69] = t5;
+    t13 = re[72];
+    t6 = im[72];
+    t2 = re[108];
+    t10 = im[108];
+    t11 = t13 + t2;
+    t12 = t6 - t10;
+    t0 = t6 + t10;
+    t4 = t13 - t2;
+    t1 = C0 * t11;
+    t14 = C0 * t12;
+    t7 = C0 * t0;
+    t9 = C0 * t4;
+    re[72] = t1;
+    im[72] = t14;
+    re[108] = t7;
+    im[108] = t9;
+    t8 = re[33];
+    t3 = im[33];
+    t5 = re[7];
+    t6 = im[7];
+    t10 = t8 + t5;
+    t13 = t3 - t6;
+    t2 = t3 + t6;
+    t11 = t8 - t5;
+    t12 = C0 * t10;
+    t0 = C0 * t13;
+    t4 = C0 * t2;
+    t1 = C0 * t11;
+    re[33] = t12;
+    im[33] = t0;
+    re[7] = t4;
+    im[7] = t1;
+    t14 = re[174];
+    t7 = im[174];
+    t9 = re[46];
+    t3 = im[46];
+    t6 = t14 + t9;
+    t8 = t7 - t3;
+    t5 = t7 + t3;
+    t10 = t14 - t9;
+    t13 = C0 * t6;
+    t2 = C0 * t8;
+    t11 = C0 * t5;
+    t12 = C0 * t10;
+    re[174] = t13;
+    im[174] = t2;
+    re[46] = t11;
+    im[46] = t12;
+    t0 = re[155];
+    t4 = im[155];
+    t1 = re[85];
+    t7 = im[85];
+    t3 = t0 + t1;
+    t14 = t4 - t7;
+    t9 = t4 + t7;
+    t6 = t0 - t1;
+    t8 = C0 * t3;
+    t5 = C0 * t14;
+    t10 = C0 * t9;
+    t13 = C0 * t6;
+    re[155] = t8;
+    im[155] = t5;
+    re[85] = t10;
+    im[85] = t13;
+    t2 = re[116];
+    t11 = im[116];
+    t12 = re[104];
+    t4 = im[104];
+    t7 = t2 + t12;
+    t0 = t11 - t4;
+    t1 = t11 + t4;
+    t3 = t2 - t12;
+    t14 = C0 * t7;
+    t9 = C0 * t0;
+    t6 = C0 * t1;
+    t8 = C0 * t3;
+    re[116] = t14;
+    im[116] = t9;
+    re[104] = t6;
+    im[104] = t8;
+    t5 = re[77];
+    t10 = im[77];
+    t13 = re[143];
+    t11 = im[143];
+    t4 = t5 + t13;
+    t2 = t10 - t11;
+    t12 = t10 + t11;
+    t7 = t5 - t13;
+    t0 = C0 * t4;
+    t1 = C0 * t2;
+    t3 = C0 * t12;
+    t14 = C0 * t7;
+    re[77] = t0;
+    im[77] = t1;
+    re[143] = t3;
+    im[143] = t14;
+    t9 = re[58];
+    t6 = im[58];
+    t8 = re[2];
+    t10 = im[2];
+    t11 = t9 + t8;
+    t5 = t6 - t10;
+    t13 = t6 + t10;
+    t4 = t9 - t8;
+    t2 = C0 * t11;
+    t12 = C0 * t5;
+    t7 = C0 * t13;
+    t0 = C0 * t4;
+    re[58] = t2;
+    im[58] = t12;
+    re[2] = t7;
+    im[2] = t0;
+    t1 = re[19];
+    t3 = im[19];
+    t14 = re[21];
+    t6 = im[21];
+    t10 = t1 + t14;
+    t9 = t3 - t6;
+    t8 = t3 + t6;
+    t11 = t1 - t14;
+    t5 = C0 * t10;
+    t13 = C0 * t9;
+    t4 = C0 * t8;
+    t2 = C0 * t11;
+    re[19] = t5;
+    im[19] = t13;
+    re[21] = t4;
+    im[21] = t2;
+    t12 = re[160];
+    t7 = im[160];
+    t0 = re[60];
+    t3 = im[60];
+    t6 = t12 + t0;
+    t1 = t7 - t3;
+    t14 = t7 + t3;
+    t10 = t12 - t0;
+    t9 = C0 * t6;
+    t8 = C0 * t1;
+    t11 = C0 * t14;
+    t5 = C0 * t10;
+    re[160] = t9;
+    im[160] = t8;
+    re[60] = t11;
+    im[60] = t5;
+    t13 = re[81];
+    t4 = im[81];
+    t2 = re[99];
+    t7 = im[99];
+    t3 = t13 + t2;
+    t12 = t4 - t7;
+    t0 = t4 + t7;
+    t6 = t13 - t2;
+    t1 = C0 * t3;
+    t14 = C0 * t12;
+    t10 = C0 * t0;
+    t9 = C0 * t6;
+    re[81] = t1;
+    im[81] = t14;
+    re[99] = t10;
+    im[99] = t9;
+    t8 = re[42];
+    t11 = im[42];
+    t5 = re[178];
+    t4 = im[178];
+    t7 = t8 + t5;
+    t13 = t11 - t4;
+    t2 = t11 + t4;
+    t3 = t8 - t5;
+    t12 = C0 * t7;
+    t0 = C0 * t13;
+    t6 = C0 * t2;
+    t1 = C0 * t3;
+    re[42] = t12;
+    im[42] = t0;
+    re[178] = t6;
+    im[178] = t1;
+    t14 = re[3];
+    t10 = im[3];
+    t9 = re[37];
+    t11 = im[37];
+    t4 = t14 + t9;
+    t8 = t10 - t11;
+    t5 = t10 + t11;
+    t7 = t14 - t9;
+    t13 = C0 * t4;
+    t2 = C0 * t8;
+    t3 = C0 * t5;
+    t12 = C0 * t7;
+    re[3] = t13;
+    im[3] = t2;
+    re[37] = t3;
+    im[37] = t12;
+    t0 = re[164];
+    t6 = im[164];
+    t1 = re[76];
+    t10 = im[76];
+    t11 = t0 + t1;
+    t14 = t6 - t10;
+    t9 = t6 + t10;
+    t4 = t0 - t1;
+    t8 = C0 * t11;
+    t5 = C0 * t14;
+    t7 = C0 * t9;
+    t13 = C0 * t4;
+    re[164] = t8;
+    im[164] = t5;
+    re[76] = t7;
+    im[76] = t13;
+    t2 = re[125];
+    t3 = im[125];
+    t12 = re[95];
+    t6 = im[95];
+    t10 = t2 + t12;
+    t0 = t3 - t6;
+    t1 = t3 + t6;
+    t11 = t2 - t12;
+    t14 = C0 * t10;
+    t9 = C0 * t0;
+    t4 = C0 * t1;
+    t8 = C0 * t11;
+    re[125] = t14;
+    im[125] = t9;
+    re[95] = t4;
+    im[95] = t8;
+    t5 = re[86];
+    t7 = im[86];
+    t13 = re[134];
+    t3 = im[134];
+    t6 = t5 + t13;
+    t2 = t7 - t3;
+    t12 = t7 + t3;
+    t10 = t5 - t13;
+    t0 = C0 * t6;
+    t1 = C0 * t2;
+    t11 = C0 * t12;
+    t14 = C0 * t10;
+    re[86] = t0;
+    im[86] = t1;
+    re[134] = t11;
+    im[134] = t14;
+    t9 = re[67];
+    t4 = im[67];
+    t8 = re[173];
+    t7 = im[173];
+    t3 = t9 + t8;
+    t5 = t4 - t7;
+    t13 = t4 + t7;
+    t6 = t9 - t8;
+    t2 = C0 * t3;
+    t12 = C0 * t5;
+    t10 = C0 * t13;
+    t0 = C0 * t6;
+    re[67] = t2;
+    im[67] = t12;
+    re[173] = t10;
+    im[173] = t0;
+    t1 = re[28];
+    t11 = im[28];
+    t14 = re[12];
+    t4 = im[12];
+    t7 = t1 + t14;
+    t9 = t11 - t4;
+    t8 = t11 + t4;
+    t3 = t1 - t14;
+    t5 = C0 * t7;
+    t13 = C0 * t9;
+    t6 = C0 * t8;
+    t2 = C0 * t3;
+    re[28] = t5;
+    im[28] = t13;
+    re[12] = t6;
+    im[12] = t2;
+    t12 = re[169];
+    t10 = im[169];
+    t0 = re[51];
+    t11 = im[51];
+    t4 = t12 + t0;
+    t1 = t10 - t11;
+    t14 = t10 + t11;
+    t7 = t12 - t0;
+    t9 = C0 * t4;
+    t8 = C0 * t1;
+    t3 = C0 * t14;
+    t5 = C0 * t7;
+    re[169] = t9;
+    im[169] = t8;
+    re[51] = t3;
+    im[51] = t5;
+}
+
+//
+//  Public functions.
+//
+
+/**
+ *  Apply in-place mixed-radix FFT transform of two real signals (prebuilt
+ *  for block size 180).
+ * 
+ *  Note(s):
+ *    [1] The size of `re` and `im` will not be checked.
+ *    [2] The real signal x1[n] shall be stored in `re`, the real signal
+ *        x2[n] shall be stored in `im`.
+ *    [3] The k-th output of x1[n] (0 <= k <= 90) is stored at index k, the
+ *        conjugate of the k-th output of x2[n] (0 < k < 90) is stored at
+ *        index 180 - k.
+ *    [4] The 0th (and the 90-th) output of x2[n] is stored in `im[0]` (and
+ *        `im[90]`).
+ * 
+ *  @param {Number[]} re 
+ *    - The real part of each point.
+ *  @param {Number[]} im 
+ *    - The imaginary part of each point.
+ */
+function ApplyMixedRadixPairedRFFT_180(re, im) {
+    ApplyMixedRadixPairedRFFT_180_Part1(re, im);
+    ApplyMixedRadixPairedRFFT_180_Part2(re, im);
+    ApplyMixedRadixPairedRFFT_180_Part3(re, im);
+    ApplyMixedRadixPairedRFFT_180_Part4(re, im);
+    ApplyMixedRadixPairedRFFT_180_Part5(re, im);
+    ApplyMixedRadixPairedRFFT_180_Part6(re, im);
+    MXCshft(re, im, CSHFT_INDEXES_0);
+    MXSwap(re, im, 2, 102);
+    MXSwap(re, im, 3, 83);
+    MXCshft(re, im, CSHFT_INDEXES_1);
+    MXCshft(re, im, CSHFT_INDEXES_2);
+    MXCshft(re, im, CSHFT_INDEXES_3);
+    MXCshft(re, im, CSHFT_INDEXES_4);
+    MXCshft(re, im, CSHFT_INDEXES_5);
+    MXSwap(re, im, 11, 111);
+    MXSwap(re, im, 12, 92);
+    MXCshft(re, im, CSHFT_INDEXES_6);
+    MXCshft(re, im, CSHFT_INDEXES_7);
+    MXCshft(re, im, CSHFT_INDEXES_8);
+    MXCshft(re, im, CSHFT_INDEXES_9);
+    MXCshft(re, im, CSHFT_INDEXES_10);
+    MXSwap(re, im, 20, 120);
+    MXSwap(re, im, 21, 101);
+    MXCshft(re, im, CSHFT_INDEXES_11);
+    MXCshft(re, im, CSHFT_INDEXES_12);
+    MXSwap(re, im, 29, 129);
+    MXSwap(re, im, 30, 110);
+    MXCshft(re, im, CSHFT_INDEXES_13);
+    MXCshft(re, im, CSHFT_INDEXES_14);
+    MXSwap(re, im, 38, 138);
+    MXSwap(re, im, 39, 119);
+    MXCshft(re, im, CSHFT_INDEXES_15);
+    MXCshft(re, im, CSHFT_INDEXES_16);
+    MXSwap(re, im, 47, 147);
+    MXSwap(re, im, 48, 128);
+    MXCshft(re, im, CSHFT_INDEXES_17);
+    MXCshft(re, im, CSHFT_INDEXES_18);
+    MXSwap(re, im, 56, 156);
+    MXSwap(re, im, 57, 137);
+    MXCshft(re, im, CSHFT_INDEXES_19);
+    MXSwap(re, im, 65, 165);
+    MXSwap(re, im, 66, 146);
+    MXSwap(re, im, 74, 174);
+    MXSwap(re, im, 75, 155);
+    MXSwap(re, im, 84, 164);
+    MXSwap(re, im, 93, 173);
+}
+
+//  Export public APIs.
+module.exports = {
+    "ApplyMixedRadixPairedRFFT_180": ApplyMixedRadixPairedRFFT_180
+};
\ No newline at end of file
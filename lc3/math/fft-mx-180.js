@@ -22,607 +22,159 @@ const Lc3FftMxBaseOp =
 //  Imported functions.
 // const MXTr2 = 
 //     Lc3FftMxBaseOp.MXTr2;
-const MXTr3 = 
-    Lc3FftMxBaseOp.MXTr3;
-const MXTr4 = 
-    Lc3FftMxBaseOp.MXTr4;
-const MXTr5 = 
-    Lc3FftMxBaseOp.MXTr5;
-const MXRot = 
-    Lc3FftMxBaseOp.MXRot;
+// const MXTr3 = 
+//     Lc3FftMxBaseOp.MXTr3;
+// const MXTr4 = 
+//     Lc3FftMxBaseOp.MXTr4;
+// const MXTr5 = 
+//     Lc3FftMxBaseOp.MXTr5;
+// const MXRot = 
+//     Lc3FftMxBaseOp.MXRot;
 // const MXSwap = 
 //     Lc3FftMxBaseOp.MXSwap;
-const MXCshft = 
-    Lc3FftMxBaseOp.MXCshft;
+// const MXCshft = 
+//     Lc3FftMxBaseOp.MXCshft;
+const MXCompact = 
+    Lc3FftMxBaseOp.MXCompact;
 
 //
 //  Constants.
 //
 
-//  Cyclic shift indexes.
-const CSHFT_INDEXES_0 = [1, 36, 66, 46, 51, 60];
-const CSHFT_INDEXES_1 = [2, 72, 91, 58, 141, 41, 42, 78, 136, 65, 10, 18, 135, 29, 156, 68, 118, 142, 77, 100, 7, 81, 40, 6, 45, 15, 27, 84, 148, 122, 74, 163, 116, 70, 19, 171, 62, 73, 127, 83, 112, 97, 103, 115, 34, 165, 17, 99, 175, 35, 30, 21, 39, 174, 170, 26, 48, 123, 110, 25, 12, 90, 22, 75, 28, 120];
-const CSHFT_INDEXES_2 = [3, 108, 124, 146, 50, 24, 147, 86, 49, 159, 176, 71, 55, 33, 129, 155, 32, 93, 130, 20];
-const CSHFT_INDEXES_3 = [4, 144, 149, 158, 140, 5, 9, 153, 131, 56, 69, 154, 167, 89, 157, 104, 151, 59, 177, 107, 88, 121, 38, 138, 137, 101, 43, 114, 169, 161, 44, 150, 23, 111, 61, 37, 102, 79, 172, 98, 139, 173, 134, 164, 152, 95, 31, 57, 105, 16, 63, 109, 160, 8, 117, 106, 52, 96, 67, 82, 76, 64, 145, 14, 162, 80];
-const CSHFT_INDEXES_4 = [11, 54, 168, 125];
-const CSHFT_INDEXES_5 = [13, 126, 47, 87, 85];
-const CSHFT_INDEXES_6 = [53, 132, 92, 94, 166];
-const CSHFT_INDEXES_7 = [113, 133, 128, 119, 178, 143];
-
-//
-//  Private functions.
-//
-
-/**
- *  Part 1 of ApplyMixedRadixFFT_180().
- * 
- *  @param {Number[]} re 
- *    - The real part of each point.
- *  @param {Number[]} im 
- *    - The imaginary part of each point.
- */
-function ApplyMixedRadixFFT_180_Part1(re, im) {
-    MXTr5(re, im, 0, 36, 72, 108, 144);
-    MXTr5(re, im, 1, 37, 73, 109, 145);
-    MXTr5(re, im, 2, 38, 74, 110, 146);
-    MXTr5(re, im, 3, 39, 75, 111, 147);
-    MXTr5(re, im, 4, 40, 76, 112, 148);
-    MXTr5(re, im, 5, 41, 77, 113, 149);
-    MXTr5(re, im, 6, 42, 78, 114, 150);
-    MXTr5(re, im, 7, 43, 79, 115, 151);
-    MXTr5(re, im, 8, 44, 80, 116, 152);
-    MXTr5(re, im, 9, 45, 81, 117, 153);
-    MXTr5(re, im, 10, 46, 82, 118, 154);
-    MXTr5(re, im, 11, 47, 83, 119, 155);
-    MXTr5(re, im, 12, 48, 84, 120, 156);
-    MXTr5(re, im, 13, 49, 85, 121, 157);
-    MXTr5(re, im, 14, 50, 86, 122, 158);
-    MXTr5(re, im, 15, 51, 87, 123, 159);
-    MXTr5(re, im, 16, 52, 88, 124, 160);
-    MXTr5(re, im, 17, 53, 89, 125, 161);
-    MXTr5(re, im, 18, 54, 90, 126, 162);
-    MXTr5(re, im, 19, 55, 91, 127, 163);
-    MXTr5(re, im, 20, 56, 92, 128, 164);
-    MXTr5(re, im, 21, 57, 93, 129, 165);
-    MXTr5(re, im, 22, 58, 94, 130, 166);
-    MXTr5(re, im, 23, 59, 95, 131, 167);
-    MXTr5(re, im, 24, 60, 96, 132, 168);
-    MXTr5(re, im, 25, 61, 97, 133, 169);
-    MXTr5(re, im, 26, 62, 98, 134, 170);
-    MXTr5(re, im, 27, 63, 99, 135, 171);
-    MXTr5(re, im, 28, 64, 100, 136, 172);
-    MXTr5(re, im, 29, 65, 101, 137, 173);
-    MXTr5(re, im, 30, 66, 102, 138, 174);
-    MXTr5(re, im, 31, 67, 103, 139, 175);
-    MXTr5(re, im, 32, 68, 104, 140, 176);
-    MXTr5(re, im, 33, 69, 105, 141, 177);
-    MXTr5(re, im, 34, 70, 106, 142, 178);
-    MXTr5(re, im, 35, 71, 107, 143, 179);
-    MXRot(re, im, 37, 0.9993908270190958, -0.03489949670250097);
-    MXRot(re, im, 38, 0.9975640502598242, -0.0697564737441253);
-    MXRot(re, im, 39, 0.9945218953682733, -0.10452846326765347);
-    MXRot(re, im, 40, 0.9902680687415704, -0.13917310096006544);
-    MXRot(re, im, 41, 0.984807753012208, -0.17364817766693033);
-    MXRot(re, im, 42, 0.9781476007338057, -0.20791169081775934);
-    MXRot(re, im, 43, 0.9702957262759965, -0.24192189559966773);
-    MXRot(re, im, 44, 0.9612616959383189, -0.27563735581699916);
-    MXRot(re, im, 45, 0.9510565162951535, -0.3090169943749474);
-    MXRot(re, im, 46, 0.9396926207859084, -0.3420201433256687);
-    MXRot(re, im, 47, 0.9271838545667874, -0.374606593415912);
-    MXRot(re, im, 48, 0.9135454576426009, -0.4067366430758002);
-    MXRot(re, im, 49, 0.898794046299167, -0.4383711467890774);
-    MXRot(re, im, 50, 0.882947592858927, -0.4694715627858908);
-    MXRot(re, im, 51, 0.8660254037844387, -0.49999999999999994);
-    MXRot(re, im, 52, 0.848048096156426, -0.5299192642332049);
-    MXRot(re, im, 53, 0.8290375725550416, -0.5591929034707469);
-    MXRot(re, im, 54, 0.8090169943749475, -0.5877852522924731);
-    MXRot(re, im, 55, 0.7880107536067219, -0.6156614753256583);
-    MXRot(re, im, 56, 0.766044443118978, -0.6427876096865393);
-    MXRot(re, im, 57, 0.7431448254773942, -0.6691306063588582);
-    MXRot(re, im, 58, 0.7193398003386512, -0.6946583704589973);
-    MXRot(re, im, 59, 0.6946583704589973, -0.7193398003386511);
-    MXRot(re, im, 60, 0.6691306063588582, -0.7431448254773942);
-    MXRot(re, im, 61, 0.6427876096865394, -0.766044443118978);
-    MXRot(re, im, 62, 0.6156614753256583, -0.788010753606722);
-    MXRot(re, im, 63, 0.5877852522924731, -0.8090169943749475);
-    MXRot(re, im, 64, 0.5591929034707468, -0.8290375725550417);
-    MXRot(re, im, 65, 0.5299192642332049, -0.848048096156426);
-    MXRot(re, im, 66, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 67, 0.46947156278589086, -0.8829475928589269);
-    MXRot(re, im, 68, 0.43837114678907746, -0.898794046299167);
-    MXRot(re, im, 69, 0.4067366430758002, -0.9135454576426009);
-    MXRot(re, im, 70, 0.37460659341591196, -0.9271838545667874);
-    MXRot(re, im, 71, 0.3420201433256688, -0.9396926207859083);
-    MXRot(re, im, 73, 0.9975640502598242, -0.0697564737441253);
-    MXRot(re, im, 74, 0.9902680687415704, -0.13917310096006544);
-    MXRot(re, im, 75, 0.9781476007338057, -0.20791169081775934);
-    MXRot(re, im, 76, 0.9612616959383189, -0.27563735581699916);
-    MXRot(re, im, 77, 0.9396926207859084, -0.3420201433256687);
-    MXRot(re, im, 78, 0.9135454576426009, -0.4067366430758002);
-    MXRot(re, im, 79, 0.882947592858927, -0.4694715627858908);
-    MXRot(re, im, 80, 0.848048096156426, -0.5299192642332049);
-    MXRot(re, im, 81, 0.8090169943749475, -0.5877852522924731);
-    MXRot(re, im, 82, 0.766044443118978, -0.6427876096865393);
-    MXRot(re, im, 83, 0.7193398003386512, -0.6946583704589973);
-    MXRot(re, im, 84, 0.6691306063588582, -0.7431448254773942);
-    MXRot(re, im, 85, 0.6156614753256583, -0.788010753606722);
-    MXRot(re, im, 86, 0.5591929034707468, -0.8290375725550417);
-    MXRot(re, im, 87, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 88, 0.43837114678907746, -0.898794046299167);
-    MXRot(re, im, 89, 0.37460659341591196, -0.9271838545667874);
-    MXRot(re, im, 90, 0.30901699437494745, -0.9510565162951535);
-    MXRot(re, im, 91, 0.24192189559966767, -0.9702957262759965);
-    MXRot(re, im, 92, 0.17364817766693041, -0.984807753012208);
-    MXRot(re, im, 93, 0.10452846326765346, -0.9945218953682733);
-    MXRot(re, im, 94, 0.03489949670250108, -0.9993908270190958);
-    MXRot(re, im, 95, -0.034899496702500955, -0.9993908270190958);
-    MXRot(re, im, 96, -0.10452846326765355, -0.9945218953682733);
-    MXRot(re, im, 97, -0.1736481776669303, -0.984807753012208);
-    MXRot(re, im, 98, -0.24192189559966779, -0.9702957262759965);
-    MXRot(re, im, 99, -0.30901699437494734, -0.9510565162951536);
-    MXRot(re, im, 100, -0.37460659341591207, -0.9271838545667874);
-    MXRot(re, im, 101, -0.4383711467890775, -0.8987940462991669);
-    MXRot(re, im, 102, -0.4999999999999998, -0.8660254037844387);
-    MXRot(re, im, 103, -0.5591929034707467, -0.8290375725550417);
-    MXRot(re, im, 104, -0.6156614753256583, -0.788010753606722);
-    MXRot(re, im, 105, -0.6691306063588582, -0.7431448254773942);
-    MXRot(re, im, 106, -0.7193398003386512, -0.6946583704589971);
-    MXRot(re, im, 107, -0.7660444431189779, -0.6427876096865395);
-    MXRot(re, im, 109, 0.9945218953682733, -0.10452846326765347);
-    MXRot(re, im, 110, 0.9781476007338057, -0.20791169081775934);
-    MXRot(re, im, 111, 0.9510565162951535, -0.3090169943749474);
-    MXRot(re, im, 112, 0.9135454576426009, -0.4067366430758002);
-    MXRot(re, im, 113, 0.8660254037844387, -0.49999999999999994);
-    MXRot(re, im, 114, 0.8090169943749475, -0.5877852522924731);
-    MXRot(re, im, 115, 0.7431448254773942, -0.6691306063588582);
-    MXRot(re, im, 116, 0.6691306063588582, -0.7431448254773942);
-    MXRot(re, im, 117, 0.5877852522924731, -0.8090169943749475);
-    MXRot(re, im, 118, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 119, 0.4067366430758002, -0.9135454576426009);
-    MXRot(re, im, 120, 0.30901699437494745, -0.9510565162951535);
-    MXRot(re, im, 121, 0.20791169081775945, -0.9781476007338056);
-    MXRot(re, im, 122, 0.10452846326765346, -0.9945218953682733);
-    MXRot(re, im, 123, 6.123233995736766e-17, -1.0);
-    MXRot(re, im, 124, -0.10452846326765355, -0.9945218953682733);
-    MXRot(re, im, 125, -0.20791169081775934, -0.9781476007338057);
-    MXRot(re, im, 126, -0.30901699437494734, -0.9510565162951536);
-    MXRot(re, im, 127, -0.40673664307580026, -0.9135454576426009);
-    MXRot(re, im, 128, -0.4999999999999998, -0.8660254037844387);
-    MXRot(re, im, 129, -0.587785252292473, -0.8090169943749475);
-    MXRot(re, im, 130, -0.6691306063588582, -0.7431448254773942);
-    MXRot(re, im, 131, -0.743144825477394, -0.6691306063588583);
-    MXRot(re, im, 132, -0.8090169943749473, -0.5877852522924732);
-    MXRot(re, im, 133, -0.8660254037844387, -0.49999999999999994);
-    MXRot(re, im, 134, -0.9135454576426008, -0.40673664307580043);
-    MXRot(re, im, 135, -0.9510565162951535, -0.3090169943749475);
-    MXRot(re, im, 136, -0.9781476007338057, -0.20791169081775931);
-    MXRot(re, im, 137, -0.9945218953682733, -0.10452846326765373);
-    MXRot(re, im, 138, -1.0, -1.2246467991473532e-16);
-    MXRot(re, im, 139, -0.9945218953682733, 0.1045284632676535);
-    MXRot(re, im, 140, -0.9781476007338056, 0.2079116908177595);
-    MXRot(re, im, 141, -0.9510565162951536, 0.3090169943749473);
-    MXRot(re, im, 142, -0.9135454576426009, 0.4067366430758002);
-    MXRot(re, im, 143, -0.8660254037844386, 0.5000000000000001);
-    MXRot(re, im, 145, 0.9902680687415704, -0.13917310096006544);
-    MXRot(re, im, 146, 0.9612616959383189, -0.27563735581699916);
-    MXRot(re, im, 147, 0.9135454576426009, -0.4067366430758002);
-    MXRot(re, im, 148, 0.848048096156426, -0.5299192642332049);
-    MXRot(re, im, 149, 0.766044443118978, -0.6427876096865393);
-    MXRot(re, im, 150, 0.6691306063588582, -0.7431448254773942);
-    MXRot(re, im, 151, 0.5591929034707468, -0.8290375725550417);
-    MXRot(re, im, 152, 0.43837114678907746, -0.898794046299167);
-    MXRot(re, im, 153, 0.30901699437494745, -0.9510565162951535);
-    MXRot(re, im, 154, 0.17364817766693041, -0.984807753012208);
-    MXRot(re, im, 155, 0.03489949670250108, -0.9993908270190958);
-    MXRot(re, im, 156, -0.10452846326765355, -0.9945218953682733);
-    MXRot(re, im, 157, -0.24192189559966779, -0.9702957262759965);
-    MXRot(re, im, 158, -0.37460659341591207, -0.9271838545667874);
-    MXRot(re, im, 159, -0.4999999999999998, -0.8660254037844387);
-    MXRot(re, im, 160, -0.6156614753256583, -0.788010753606722);
-    MXRot(re, im, 161, -0.7193398003386512, -0.6946583704589971);
-    MXRot(re, im, 162, -0.8090169943749473, -0.5877852522924732);
-    MXRot(re, im, 163, -0.882947592858927, -0.4694715627858907);
-    MXRot(re, im, 164, -0.9396926207859083, -0.3420201433256689);
-    MXRot(re, im, 165, -0.9781476007338057, -0.20791169081775931);
-    MXRot(re, im, 166, -0.9975640502598242, -0.06975647374412552);
-    MXRot(re, im, 167, -0.9975640502598242, 0.06975647374412527);
-    MXRot(re, im, 168, -0.9781476007338056, 0.2079116908177595);
-    MXRot(re, im, 169, -0.9396926207859084, 0.34202014332566866);
-    MXRot(re, im, 170, -0.8829475928589269, 0.46947156278589086);
-    MXRot(re, im, 171, -0.8090169943749476, 0.587785252292473);
-    MXRot(re, im, 172, -0.7193398003386511, 0.6946583704589974);
-    MXRot(re, im, 173, -0.6156614753256581, 0.7880107536067221);
-    MXRot(re, im, 174, -0.5000000000000004, 0.8660254037844384);
-    MXRot(re, im, 175, -0.3746065934159123, 0.9271838545667873);
-    MXRot(re, im, 176, -0.24192189559966779, 0.9702957262759965);
-    MXRot(re, im, 177, -0.10452846326765336, 0.9945218953682734);
-    MXRot(re, im, 178, 0.03489949670250128, 0.9993908270190958);
-    MXRot(re, im, 179, 0.17364817766692997, 0.9848077530122081);
-    MXTr4(re, im, 0, 9, 18, 27);
-    MXTr4(re, im, 1, 10, 19, 28);
-    MXTr4(re, im, 2, 11, 20, 29);
-    MXTr4(re, im, 3, 12, 21, 30);
-    MXTr4(re, im, 4, 13, 22, 31);
-    MXTr4(re, im, 5, 14, 23, 32);
-    MXTr4(re, im, 6, 15, 24, 33);
-    MXTr4(re, im, 7, 16, 25, 34);
-    MXTr4(re, im, 8, 17, 26, 35);
-    MXRot(re, im, 10, 0.984807753012208, -0.17364817766693033);
-    MXRot(re, im, 11, 0.9396926207859084, -0.3420201433256687);
-    MXRot(re, im, 12, 0.8660254037844387, -0.49999999999999994);
-    MXRot(re, im, 13, 0.766044443118978, -0.6427876096865393);
-    MXRot(re, im, 14, 0.6427876096865394, -0.766044443118978);
-    MXRot(re, im, 15, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 16, 0.3420201433256688, -0.9396926207859083);
-    MXRot(re, im, 17, 0.17364817766693041, -0.984807753012208);
-    MXRot(re, im, 19, 0.9396926207859084, -0.3420201433256687);
-    MXRot(re, im, 20, 0.766044443118978, -0.6427876096865393);
-    MXRot(re, im, 21, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 22, 0.17364817766693041, -0.984807753012208);
-    MXRot(re, im, 23, -0.1736481776669303, -0.984807753012208);
-    MXRot(re, im, 24, -0.4999999999999998, -0.8660254037844387);
-    MXRot(re, im, 25, -0.7660444431189779, -0.6427876096865395);
-    MXRot(re, im, 26, -0.9396926207859083, -0.3420201433256689);
-    MXRot(re, im, 28, 0.8660254037844387, -0.49999999999999994);
-    MXRot(re, im, 29, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 30, 6.123233995736766e-17, -1.0);
-    MXRot(re, im, 31, -0.4999999999999998, -0.8660254037844387);
-    MXRot(re, im, 32, -0.8660254037844387, -0.49999999999999994);
-    MXRot(re, im, 33, -1.0, -1.2246467991473532e-16);
-    MXRot(re, im, 34, -0.8660254037844388, 0.4999999999999997);
-    MXRot(re, im, 35, -0.5000000000000004, 0.8660254037844384);
-    MXTr3(re, im, 0, 3, 6);
-    MXTr3(re, im, 1, 4, 7);
-    MXTr3(re, im, 2, 5, 8);
-    MXRot(re, im, 4, 0.766044443118978, -0.6427876096865393);
-    MXRot(re, im, 5, 0.17364817766693041, -0.984807753012208);
-    MXRot(re, im, 7, 0.17364817766693041, -0.984807753012208);
-    MXRot(re, im, 8, -0.9396926207859083, -0.3420201433256689);
-    MXTr3(re, im, 0, 1, 2);
-    MXTr3(re, im, 3, 4, 5);
-    MXTr3(re, im, 6, 7, 8);
-    MXTr3(re, im, 9, 12, 15);
-    MXTr3(re, im, 10, 13, 16);
-    MXTr3(re, im, 11, 14, 17);
-    MXRot(re, im, 13, 0.766044443118978, -0.6427876096865393);
-    MXRot(re, im, 14, 0.17364817766693041, -0.984807753012208);
-    MXRot(re, im, 16, 0.17364817766693041, -0.984807753012208);
-    MXRot(re, im, 17, -0.9396926207859083, -0.3420201433256689);
-    MXTr3(re, im, 9, 10, 11);
-    MXTr3(re, im, 12, 13, 14);
-    MXTr3(re, im, 15, 16, 17);
-    MXTr3(re, im, 18, 21, 24);
-    MXTr3(re, im, 19, 22, 25);
-    MXTr3(re, im, 20, 23, 26);
-    MXRot(re, im, 22, 0.766044443118978, -0.6427876096865393);
-    MXRot(re, im, 23, 0.17364817766693041, -0.984807753012208);
-    MXRot(re, im, 25, 0.17364817766693041, -0.984807753012208);
-    MXRot(re, im, 26, -0.9396926207859083, -0.3420201433256689);
-    MXTr3(re, im, 18, 19, 20);
-    MXTr3(re, im, 21, 22, 23);
-    MXTr3(re, im, 24, 25, 26);
-    MXTr3(re, im, 27, 30, 33);
-    MXTr3(re, im, 28, 31, 34);
-    MXTr3(re, im, 29, 32, 35);
-    MXRot(re, im, 31, 0.766044443118978, -0.6427876096865393);
-    MXRot(re, im, 32, 0.17364817766693041, -0.984807753012208);
-    MXRot(re, im, 34, 0.17364817766693041, -0.984807753012208);
-    MXRot(re, im, 35, -0.9396926207859083, -0.3420201433256689);
-    MXTr3(re, im, 27, 28, 29);
-    MXTr3(re, im, 30, 31, 32);
-    MXTr3(re, im, 33, 34, 35);
-    MXTr4(re, im, 36, 45, 54, 63);
-    MXTr4(re, im, 37, 46, 55, 64);
-    MXTr4(re, im, 38, 47, 56, 65);
-    MXTr4(re, im, 39, 48, 57, 66);
-    MXTr4(re, im, 40, 49, 58, 67);
-    MXTr4(re, im, 41, 50, 59, 68);
-    MXTr4(re, im, 42, 51, 60, 69);
-    MXTr4(re, im, 43, 52, 61, 70);
-    MXTr4(re, im, 44, 53, 62, 71);
-    MXRot(re, im, 46, 0.984807753012208, -0.17364817766693033);
-    MXRot(re, im, 47, 0.9396926207859084, -0.3420201433256687);
-    MXRot(re, im, 48, 0.8660254037844387, -0.49999999999999994);
-    MXRot(re, im, 49, 0.766044443118978, -0.6427876096865393);
-    MXRot(re, im, 50, 0.6427876096865394, -0.766044443118978);
-    MXRot(re, im, 51, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 52, 0.3420201433256688, -0.9396926207859083);
-    MXRot(re, im, 53, 0.17364817766693041, -0.984807753012208);
-    MXRot(re, im, 55, 0.9396926207859084, -0.3420201433256687);
-    MXRot(re, im, 56, 0.766044443118978, -0.6427876096865393);
-    MXRot(re, im, 57, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 58, 0.17364817766693041, -0.984807753012208);
-    MXRot(re, im, 59, -0.1736481776669303, -0.984807753012208);
-    MXRot(re, im, 60, -0.4999999999999998, -0.8660254037844387);
-    MXRot(re, im, 61, -0.7660444431189779, -0.6427876096865395);
-    MXRot(re, im, 62, -0.9396926207859083, -0.3420201433256689);
-    MXRot(re, im, 64, 0.8660254037844387, -0.49999999999999994);
-    MXRot(re, im, 65, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 66, 6.123233995736766e-17, -1.0);
-    MXRot(re, im, 67, -0.4999999999999998, -0.8660254037844387);
-    MXRot(re, im, 68, -0.8660254037844387, -0.49999999999999994);
-    MXRot(re, im, 69, -1.0, -1.2246467991473532e-16);
-    MXRot(re, im, 70, -0.8660254037844388, 0.4999999999999997);
-    MXRot(re, im, 71, -0.5000000000000004, 0.8660254037844384);
-    MXTr3(re, im, 36, 39, 42);
-    MXTr3(re, im, 37, 40, 43);
-    MXTr3(re, im, 38, 41, 44);
-    MXRot(re, im, 40, 0.766044443118978, -0.6427876096865393);
-    MXRot(re, im, 41, 0.17364817766693041, -0.984807753012208);
-    MXRot(re, im, 43, 0.17364817766693041, -0.984807753012208);
-    MXRot(re, im, 44, -0.9396926207859083, -0.3420201433256689);
-    MXTr3(re, im, 36, 37, 38);
-    MXTr3(re, im, 39, 40, 41);
-    MXTr3(re, im, 42, 43, 44);
-    MXTr3(re, im, 45, 48, 51);
-    MXTr3(re, im, 46, 49, 52);
-    MXTr3(re, im, 47, 50, 53);
-    MXRot(re, im, 49, 0.766044443118978, -0.6427876096865393);
-    MXRot(re, im, 50, 0.17364817766693041, -0.984807753012208);
-    MXRot(re, im, 52, 0.17364817766693041, -0.984807753012208);
-    MXRot(re, im, 53, -0.9396926207859083, -0.3420201433256689);
-    MXTr3(re, im, 45, 46, 47);
-    MXTr3(re, im, 48, 49, 50);
-    MXTr3(re, im, 51, 52, 53);
-    MXTr3(re, im, 54, 57, 60);
-    MXTr3(re, im, 55, 58, 61);
-    MXTr3(re, im, 56, 59, 62);
-    MXRot(re, im, 58, 0.766044443118978, -0.6427876096865393);
-    MXRot(re, im, 59, 0.17364817766693041, -0.984807753012208);
-    MXRot(re, im, 61, 0.17364817766693041, -0.984807753012208);
-    MXRot(re, im, 62, -0.9396926207859083, -0.3420201433256689);
-    MXTr3(re, im, 54, 55, 56);
-    MXTr3(re, im, 57, 58, 59);
-    MXTr3(re, im, 60, 61, 62);
-    MXTr3(re, im, 63, 66, 69);
-    MXTr3(re, im, 64, 67, 70);
-    MXTr3(re, im, 65, 68, 71);
-    MXRot(re, im, 67, 0.766044443118978, -0.6427876096865393);
-    MXRot(re, im, 68, 0.17364817766693041, -0.984807753012208);
-    MXRot(re, im, 70, 0.17364817766693041, -0.984807753012208);
-    MXRot(re, im, 71, -0.9396926207859083, -0.3420201433256689);
-    MXTr3(re, im, 63, 64, 65);
-    MXTr3(re, im, 66, 67, 68);
-    MXTr3(re, im, 69, 70, 71);
-    MXTr4(re, im, 72, 81, 90, 99);
-    MXTr4(re, im, 73, 82, 91, 100);
-    MXTr4(re, im, 74, 83, 92, 101);
-    MXTr4(re, im, 75, 84, 93, 102);
-    MXTr4(re, im, 76, 85, 94, 103);
-    MXTr4(re, im, 77, 86, 95, 104);
-    MXTr4(re, im, 78, 87, 96, 105);
-    MXTr4(re, im, 79, 88, 97, 106);
-    MXTr4(re, im, 80, 89, 98, 107);
-    MXRot(re, im, 82, 0.984807753012208, -0.17364817766693033);
-    MXRot(re, im, 83, 0.9396926207859084, -0.3420201433256687);
-    MXRot(re, im, 84, 0.8660254037844387, -0.49999999999999994);
-    MXRot(re, im, 85, 0.766044443118978, -0.6427876096865393);
-    MXRot(re, im, 86, 0.6427876096865394, -0.766044443118978);
-    MXRot(re, im, 87, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 88, 0.3420201433256688, -0.9396926207859083);
-    MXRot(re, im, 89, 0.17364817766693041, -0.984807753012208);
-    MXRot(re, im, 91, 0.9396926207859084, -0.3420201433256687);
-    MXRot(re, im, 92, 0.766044443118978, -0.6427876096865393);
-    MXRot(re, im, 93, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 94, 0.17364817766693041, -0.984807753012208);
-    MXRot(re, im, 95, -0.1736481776669303, -0.984807753012208);
-    MXRot(re, im, 96, -0.4999999999999998, -0.8660254037844387);
-    MXRot(re, im, 97, -0.7660444431189779, -0.6427876096865395);
-    MXRot(re, im, 98, -0.9396926207859083, -0.3420201433256689);
-    MXRot(re, im, 100, 0.8660254037844387, -0.49999999999999994);
-    MXRot(re, im, 101, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 102, 6.123233995736766e-17, -1.0);
-    MXRot(re, im, 103, -0.4999999999999998, -0.8660254037844387);
-    MXRot(re, im, 104, -0.8660254037844387, -0.49999999999999994);
-    MXRot(re, im, 105, -1.0, -1.2246467991473532e-16);
-    MXRot(re, im, 106, -0.8660254037844388, 0.4999999999999997);
-    MXRot(re, im, 107, -0.5000000000000004, 0.8660254037844384);
-    MXTr3(re, im, 72, 75, 78);
-    MXTr3(re, im, 73, 76, 79);
-    MXTr3(re, im, 74, 77, 80);
-    MXRot(re, im, 76, 0.766044443118978, -0.6427876096865393);
-    MXRot(re, im, 77, 0.17364817766693041, -0.984807753012208);
-    MXRot(re, im, 79, 0.17364817766693041, -0.984807753012208);
-    MXRot(re, im, 80, -0.9396926207859083, -0.3420201433256689);
-    MXTr3(re, im, 72, 73, 74);
-    MXTr3(re, im, 75, 76, 77);
-    MXTr3(re, im, 78, 79, 80);
-    MXTr3(re, im, 81, 84, 87);
-    MXTr3(re, im, 82, 85, 88);
-    MXTr3(re, im, 83, 86, 89);
-    MXRot(re, im, 85, 0.766044443118978, -0.6427876096865393);
-    MXRot(re, im, 86, 0.17364817766693041, -0.984807753012208);
-    MXRot(re, im, 88, 0.17364817766693041, -0.984807753012208);
-    MXRot(re, im, 89, -0.9396926207859083, -0.3420201433256689);
-    MXTr3(re, im, 81, 82, 83);
-    MXTr3(re, im, 84, 85, 86);
-    MXTr3(re, im, 87, 88, 89);
-    MXTr3(re, im, 90, 93, 96);
-    MXTr3(re, im, 91, 94, 97);
-    MXTr3(re, im, 92, 95, 98);
-    MXRot(re, im, 94, 0.766044443118978, -0.6427876096865393);
-    MXRot(re, im, 95, 0.17364817766693041, -0.984807753012208);
-    MXRot(re, im, 97, 0.17364817766693041, -0.984807753012208);
-    MXRot(re, im, 98, -0.9396926207859083, -0.3420201433256689);
-    MXTr3(re, im, 90, 91, 92);
-    MXTr3(re, im, 93, 94, 95);
-    MXTr3(re, im, 96, 97, 98);
-    MXTr3(re, im, 99, 102, 105);
-    MXTr3(re, im, 100, 103, 106);
-    MXTr3(re, im, 101, 104, 107);
-    MXRot(re, im, 103, 0.766044443118978, -0.6427876096865393);
-    MXRot(re, im, 104, 0.17364817766693041, -0.984807753012208);
-    MXRot(re, im, 106, 0.17364817766693041, -0.984807753012208);
-    MXRot(re, im, 107, -0.9396926207859083, -0.3420201433256689);
-    MXTr3(re, im, 99, 100, 101);
-    MXTr3(re, im, 102, 103, 104);
-    MXTr3(re, im, 105, 106, 107);
-    MXTr4(re, im, 108, 117, 126, 135);
-    MXTr4(re, im, 109, 118, 127, 136);
-    MXTr4(re, im, 110, 119, 128, 137);
-    MXTr4(re, im, 111, 120, 129, 138);
-    MXTr4(re, im, 112, 121, 130, 139);
-    MXTr4(re, im, 113, 122, 131, 140);
-    MXTr4(re, im, 114, 123, 132, 141);
-    MXTr4(re, im, 115, 124, 133, 142);
-    MXTr4(re, im, 116, 125, 134, 143);
-    MXRot(re, im, 118, 0.984807753012208, -0.17364817766693033);
-    MXRot(re, im, 119, 0.9396926207859084, -0.3420201433256687);
-    MXRot(re, im, 120, 0.8660254037844387, -0.49999999999999994);
-    MXRot(re, im, 121, 0.766044443118978, -0.6427876096865393);
-    MXRot(re, im, 122, 0.6427876096865394, -0.766044443118978);
-    MXRot(re, im, 123, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 124, 0.3420201433256688, -0.9396926207859083);
-    MXRot(re, im, 125, 0.17364817766693041, -0.984807753012208);
-    MXRot(re, im, 127, 0.9396926207859084, -0.3420201433256687);
-    MXRot(re, im, 128, 0.766044443118978, -0.6427876096865393);
-    MXRot(re, im, 129, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 130, 0.17364817766693041, -0.984807753012208);
-    MXRot(re, im, 131, -0.1736481776669303, -0.984807753012208);
-    MXRot(re, im, 132, -0.4999999999999998, -0.8660254037844387);
-    MXRot(re, im, 133, -0.7660444431189779, -0.6427876096865395);
-    MXRot(re, im, 134, -0.9396926207859083, -0.3420201433256689);
-    MXRot(re, im, 136, 0.8660254037844387, -0.49999999999999994);
-    MXRot(re, im, 137, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 138, 6.123233995736766e-17, -1.0);
-    MXRot(re, im, 139, -0.4999999999999998, -0.8660254037844387);
-    MXRot(re, im, 140, -0.8660254037844387, -0.49999999999999994);
-    MXRot(re, im, 141, -1.0, -1.2246467991473532e-16);
-    MXRot(re, im, 142, -0.8660254037844388, 0.4999999999999997);
-    MXRot(re, im, 143, -0.5000000000000004, 0.8660254037844384);
-    MXTr3(re, im, 108, 111, 114);
-    MXTr3(re, im, 109, 112, 115);
-    MXTr3(re, im, 110, 113, 116);
-    MXRot(re, im, 112, 0.766044443118978, -0.6427876096865393);
-    MXRot(re, im, 113, 0.17364817766693041, -0.984807753012208);
-    MXRot(re, im, 115, 0.17364817766693041, -0.984807753012208);
-    MXRot(re, im, 116, -0.9396926207859083, -0.3420201433256689);
-    MXTr3(re, im, 108, 109, 110);
-    MXTr3(re, im, 111, 112, 113);
-    MXTr3(re, im, 114, 115, 116);
-    MXTr3(re, im, 117, 120, 123);
-    MXTr3(re, im, 118, 121, 124);
-    MXTr3(re, im, 119, 122, 125);
-    MXRot(re, im, 121, 0.766044443118978, -0.6427876096865393);
-    MXRot(re, im, 122, 0.17364817766693041, -0.984807753012208);
-    MXRot(re, im, 124, 0.17364817766693041, -0.984807753012208);
-    MXRot(re, im, 125, -0.9396926207859083, -0.3420201433256689);
-    MXTr3(re, im, 117, 118, 119);
-    MXTr3(re, im, 120, 121, 122);
-    MXTr3(re, im, 123, 124, 125);
-    MXTr3(re, im, 126, 129, 132);
-    MXTr3(re, im, 127, 130, 133);
-    MXTr3(re, im, 128, 131, 134);
-    MXRot(re, im, 130, 0.766044443118978, -0.6427876096865393);
-    MXRot(re, im, 131, 0.17364817766693041, -0.984807753012208);
-    MXRot(re, im, 133, 0.17364817766693041, -0.984807753012208);
-    MXRot(re, im, 134, -0.9396926207859083, -0.3420201433256689);
-    MXTr3(re, im, 126, 127, 128);
-    MXTr3(re, im, 129, 130, 131);
-    MXTr3(re, im, 132, 133, 134);
-    MXTr3(re, im, 135, 138, 141);
-    MXTr3(re, im, 136, 139, 142);
-    MXTr3(re, im, 137, 140, 143);
-    MXRot(re, im, 139, 0.766044443118978, -0.6427876096865393);
-    MXRot(re, im, 140, 0.17364817766693041, -0.984807753012208);
-    MXRot(re, im, 142, 0.17364817766693041, -0.984807753012208);
-    MXRot(re, im, 143, -0.9396926207859083, -0.3420201433256689);
-    MXTr3(re, im, 135, 136, 137);
-    MXTr3(re, im, 138, 139, 140);
-    MXTr3(re, im, 141, 142, 143);
-    MXTr4(re, im, 144, 153, 162, 171);
-    MXTr4(re, im, 145, 154, 163, 172);
-    MXTr4(re, im, 146, 155, 164, 173);
-    MXTr4(re, im, 147, 156, 165, 174);
-    MXTr4(re, im, 148, 157, 166, 175);
-    MXTr4(re, im, 149, 158, 167, 176);
-    MXTr4(re, im, 150, 159, 168, 177);
-    MXTr4(re, im, 151, 160, 169, 178);
-    MXTr4(re, im, 152, 161, 170, 179);
-    MXRot(re, im, 154, 0.984807753012208, -0.17364817766693033);
-    MXRot(re, im, 155, 0.9396926207859084, -0.3420201433256687);
-    MXRot(re, im, 156, 0.8660254037844387, -0.49999999999999994);
-    MXRot(re, im, 157, 0.766044443118978, -0.6427876096865393);
-    MXRot(re, im, 158, 0.6427876096865394, -0.766044443118978);
-    MXRot(re, im, 159, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 160, 0.3420201433256688, -0.9396926207859083);
-    MXRot(re, im, 161, 0.17364817766693041, -0.984807753012208);
-    MXRot(re, im, 163, 0.9396926207859084, -0.3420201433256687);
-    MXRot(re, im, 164, 0.766044443118978, -0.6427876096865393);
-    MXRot(re, im, 165, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 166, 0.17364817766693041, -0.984807753012208);
-    MXRot(re, im, 167, -0.1736481776669303, -0.984807753012208);
-    MXRot(re, im, 168, -0.4999999999999998, -0.8660254037844387);
-    MXRot(re, im, 169, -0.7660444431189779, -0.6427876096865395);
-    MXRot(re, im, 170, -0.9396926207859083, -0.3420201433256689);
-    MXRot(re, im, 172, 0.8660254037844387, -0.49999999999999994);
-    MXRot(re, im, 173, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 174, 6.123233995736766e-17, -1.0);
-    MXRot(re, im, 175, -0.4999999999999998, -0.8660254037844387);
-    MXRot(re, im, 176, -0.8660254037844387, -0.49999999999999994);
-    MXRot(re, im, 177, -1.0, -1.2246467991473532e-16);
-    MXRot(re, im, 178, -0.8660254037844388, 0.4999999999999997);
-}
-
-/**
- *  Part 2 of ApplyMixedRadixFFT_180().
- * 
- *  @param {Number[]} re 
- *    - The real part of each point.
- *  @param {Number[]} im 
- *    - The imaginary part of each point.
- */
-function ApplyMixedRadixFFT_180_Part2(re, im) {
-    MXRot(re, im, 179, -0.5000000000000004, 0.8660254037844384);
-    MXTr3(re, im, 144, 147, 150);
-    MXTr3(re, im, 145, 148, 151);
-    MXTr3(re, im, 146, 149, 152);
-    MXRot(re, im, 148, 0.766044443118978, -0.6427876096865393);
-    MXRot(re, im, 149, 0.17364817766693041, -0.984807753012208);
-    MXRot(re, im, 151, 0.17364817766693041, -0.984807753012208);
-    MXRot(re, im, 152, -0.9396926207859083, -0.3420201433256689);
-    MXTr3(re, im, 144, 145, 146);
-    MXTr3(re, im, 147, 148, 149);
-    MXTr3(re, im, 150, 151, 152);
-    MXTr3(re, im, 153, 156, 159);
-    MXTr3(re, im, 154, 157, 160);
-    MXTr3(re, im, 155, 158, 161);
-    MXRot(re, im, 157, 0.766044443118978, -0.6427876096865393);
-    MXRot(re, im, 158, 0.17364817766693041, -0.984807753012208);
-    MXRot(re, im, 160, 0.17364817766693041, -0.984807753012208);
-    MXRot(re, im, 161, -0.9396926207859083, -0.3420201433256689);
-    MXTr3(re, im, 153, 154, 155);
-    MXTr3(re, im, 156, 157, 158);
-    MXTr3(re, im, 159, 160, 161);
-    MXTr3(re, im, 162, 165, 168);
-    MXTr3(re, im, 163, 166, 169);
-    MXTr3(re, im, 164, 167, 170);
-    MXRot(re, im, 166, 0.766044443118978, -0.6427876096865393);
-    MXRot(re, im, 167, 0.17364817766693041, -0.984807753012208);
-    MXRot(re, im, 169, 0.17364817766693041, -0.984807753012208);
-    MXRot(re, im, 170, -0.9396926207859083, -0.3420201433256689);
-    MXTr3(re, im, 162, 163, 164);
-    MXTr3(re, im, 165, 166, 167);
-    MXTr3(re, im, 168, 169, 170);
-    MXTr3(re, im, 171, 174, 177);
-    MXTr3(re, im, 172, 175, 178);
-    MXTr3(re, im, 173, 176, 179);
-    MXRot(re, im, 175, 0.766044443118978, -0.6427876096865393);
-    MXRot(re, im, 176, 0.17364817766693041, -0.984807753012208);
-    MXRot(re, im, 178, 0.17364817766693041, -0.984807753012208);
-    MXRot(re, im, 179, -0.9396926207859083, -0.3420201433256689);
-    MXTr3(re, im, 171, 172, 173);
-    MXTr3(re, im, 174, 175, 176);
-    MXTr3(re, im, 177, 178, 179);
-    MXCshft(re, im, CSHFT_INDEXES_0);
-    MXCshft(re, im, CSHFT_INDEXES_1);
-    MXCshft(re, im, CSHFT_INDEXES_2);
-    MXCshft(re, im, CSHFT_INDEXES_3);
-    MXCshft(re, im, CSHFT_INDEXES_4);
-    MXCshft(re, im, CSHFT_INDEXES_5);
-    MXCshft(re, im, CSHFT_INDEXES_6);
-    MXCshft(re, im, CSHFT_INDEXES_7);
-}
+//  Tables (and scratch buffers) of the compact kernel (see MXCompact() of
+//  the "fft-mx-baseop" module).
+const COMPACT_RADICES = new Int32Array([
+    4, 3, 3, 5
+]);
+const COMPACT_INDEXES = new Int32Array([
+    0, 45, 90, 135, 15, 60, 105, 150, 30, 75, 120, 165, 5, 50, 95, 140, 20,
+    65, 110, 155, 35, 80, 125, 170, 10, 55, 100, 145, 25, 70, 115, 160, 40,
+    85, 130, 175, 1, 46, 91, 136, 16, 61, 106, 151, 31, 76, 121, 166, 6, 51,
+    96, 141, 21, 66, 111, 156, 36, 81, 126, 171, 11, 56, 101, 146, 26, 71,
+    116, 161, 41, 86, 131, 176, 2, 47, 92, 137, 17, 62, 107, 152, 32, 77,
+    122, 167, 7, 52, 97, 142, 22, 67, 112, 157, 37, 82, 127, 172, 12, 57,
+    102, 147, 27, 72, 117, 162, 42, 87, 132, 177, 3, 48, 93, 138, 18, 63,
+    108, 153, 33, 78, 123, 168, 8, 53, 98, 143, 23, 68, 113, 158, 38, 83,
+    128, 173, 13, 58, 103, 148, 28, 73, 118, 163, 43, 88, 133, 178, 4, 49,
+    94, 139, 19, 64, 109, 154, 34, 79, 124, 169, 9, 54, 99, 144, 24, 69,
+    114, 159, 39, 84, 129, 174, 14, 59, 104, 149, 29, 74, 119, 164, 44, 89,
+    134, 179
+]);
+const COMPACT_TWIDDLES = new Float64Array([
+    1.0, 0.0, 1.0, 0.0, 1.0, 0.0, 1.0, 0.0, 1.0, 0.0, 0.8660254037844387,
+    -0.49999999999999994, 0.49999999999999994, -0.8660254037844387,
+    0.49999999999999994, -0.8660254037844387, -0.49999999999999994,
+    -0.8660254037844387, -0.0, -1.0, -1.0, -0.0, 1.0, 0.0, 1.0, 0.0,
+    0.984807753012208, -0.17364817766693033, 0.9396926207859084,
+    -0.3420201433256687, 0.9396926207859084, -0.3420201433256687,
+    0.766044443118978, -0.6427876096865393, 0.8660254037844387,
+    -0.49999999999999994, 0.49999999999999994, -0.8660254037844387,
+    0.766044443118978, -0.6427876096865393, 0.17364817766693033,
+    -0.984807753012208, 0.6427876096865393, -0.766044443118978,
+    -0.17364817766693033, -0.984807753012208, 0.49999999999999994,
+    -0.8660254037844387, -0.49999999999999994, -0.8660254037844387,
+    0.3420201433256687, -0.9396926207859084, -0.766044443118978,
+    -0.6427876096865393, 0.17364817766693033, -0.984807753012208,
+    -0.9396926207859084, -0.3420201433256687, -0.0, -1.0, -1.0, -0.0,
+    -0.17364817766693033, -0.984807753012208, -0.9396926207859084,
+    0.3420201433256687, -0.3420201433256687, -0.9396926207859084,
+    -0.766044443118978, 0.6427876096865393, 1.0, 0.0, 1.0, 0.0, 1.0, 0.0,
+    1.0, 0.0, 0.9993908270190958, -0.03489949670250097, 0.9975640502598242,
+    -0.0697564737441253, 0.9945218953682733, -0.10452846326765346,
+    0.9902680687415704, -0.13917310096006544, 0.9975640502598242,
+    -0.0697564737441253, 0.9902680687415704, -0.13917310096006544,
+    0.9781476007338057, -0.20791169081775931, 0.9612616959383189,
+    -0.27563735581699916, 0.9945218953682733, -0.10452846326765346,
+    0.9781476007338057, -0.20791169081775931, 0.9510565162951535,
+    -0.3090169943749474, 0.9135454576426009, -0.40673664307580015,
+    0.9902680687415704, -0.13917310096006544, 0.9612616959383189,
+    -0.27563735581699916, 0.9135454576426009, -0.40673664307580015,
+    0.848048096156426, -0.5299192642332049, 0.984807753012208,
+    -0.17364817766693033, 0.9396926207859084, -0.3420201433256687,
+    0.8660254037844387, -0.49999999999999994, 0.766044443118978,
+    -0.6427876096865393, 0.9781476007338057, -0.20791169081775931,
+    0.9135454576426009, -0.40673664307580015, 0.8090169943749475,
+    -0.5877852522924731, 0.6691306063588582, -0.7431448254773942,
+    0.9702957262759965, -0.24192189559966773, 0.882947592858927,
+    -0.4694715627858908, 0.7431448254773942, -0.6691306063588582,
+    0.5591929034707468, -0.8290375725550417, 0.9612616959383189,
+    -0.27563735581699916, 0.848048096156426, -0.5299192642332049,
+    0.6691306063588582, -0.7431448254773942, 0.4383711467890774,
+    -0.898794046299167, 0.9510565162951535, -0.3090169943749474,
+    0.8090169943749475, -0.5877852522924731, 0.5877852522924731,
+    -0.8090169943749475, 0.3090169943749474, -0.9510565162951535,
+    0.9396926207859084, -0.3420201433256687, 0.766044443118978,
+    -0.6427876096865393, 0.49999999999999994, -0.8660254037844387,
+    0.17364817766693033, -0.984807753012208, 0.9271838545667874,
+    -0.374606593415912, 0.7193398003386512, -0.6946583704589973,
+    0.40673664307580015, -0.9135454576426009, 0.03489949670250097,
+    -0.9993908270190958, 0.9135454576426009, -0.40673664307580015,
+    0.6691306063588582, -0.7431448254773942, 0.3090169943749474,
+    -0.9510565162951535, -0.10452846326765346, -0.9945218953682733,
+    0.898794046299167, -0.4383711467890774, 0.6156614753256583,
+    -0.7880107536067219, 0.20791169081775931, -0.9781476007338057,
+    -0.24192189559966773, -0.9702957262759965, 0.882947592858927,
+    -0.4694715627858908, 0.5591929034707468, -0.8290375725550417,
+    0.10452846326765346, -0.9945218953682733, -0.374606593415912,
+    -0.9271838545667874, 0.8660254037844387, -0.49999999999999994,
+    0.49999999999999994, -0.8660254037844387, -0.0, -1.0,
+    -0.49999999999999994, -0.8660254037844387, 0.848048096156426,
+    -0.5299192642332049, 0.4383711467890774, -0.898794046299167,
+    -0.10452846326765346, -0.9945218953682733, -0.6156614753256583,
+    -0.7880107536067219, 0.8290375725550417, -0.5591929034707468,
+    0.374606593415912, -0.9271838545667874, -0.20791169081775931,
+    -0.9781476007338057, -0.7193398003386512, -0.6946583704589973,
+    0.8090169943749475, -0.5877852522924731, 0.3090169943749474,
+    -0.9510565162951535, -0.3090169943749474, -0.9510565162951535,
+    -0.8090169943749475, -0.5877852522924731, 0.7880107536067219,
+    -0.6156614753256583, 0.24192189559966773, -0.9702957262759965,
+    -0.40673664307580015, -0.9135454576426009, -0.882947592858927,
+    -0.4694715627858908, 0.766044443118978, -0.6427876096865393,
+    0.17364817766693033, -0.984807753012208, -0.49999999999999994,
+    -0.8660254037844387, -0.9396926207859084, -0.3420201433256687,
+    0.7431448254773942, -0.6691306063588582, 0.10452846326765346,
+    -0.9945218953682733, -0.5877852522924731, -0.8090169943749475,
+    -0.9781476007338057, -0.20791169081775931, 0.7193398003386512,
+    -0.6946583704589973, 0.03489949670250097, -0.9993908270190958,
+    -0.6691306063588582, -0.7431448254773942, -0.9975640502598242,
+    -0.0697564737441253, 0.6946583704589973, -0.7193398003386512,
+    -0.03489949670250097, -0.9993908270190958, -0.7431448254773942,
+    -0.6691306063588582, -0.9975640502598242, 0.0697564737441253,
+    0.6691306063588582, -0.7431448254773942, -0.10452846326765346,
+    -0.9945218953682733, -0.8090169943749475, -0.5877852522924731,
+    -0.9781476007338057, 0.20791169081775931, 0.6427876096865393,
+    -0.766044443118978, -0.17364817766693033, -0.984807753012208,
+    -0.8660254037844387, -0.49999999999999994, -0.9396926207859084,
+    0.3420201433256687, 0.6156614753256583, -0.7880107536067219,
+    -0.24192189559966773, -0.9702957262759965, -0.9135454576426009,
+    -0.40673664307580015, -0.882947592858927, 0.4694715627858908,
+    0.5877852522924731, -0.8090169943749475, -0.3090169943749474,
+    -0.9510565162951535, -0.9510565162951535, -0.3090169943749474,
+    -0.8090169943749475, 0.5877852522924731, 0.5591929034707468,
+    -0.8290375725550417, -0.374606593415912, -0.9271838545667874,
+    -0.9781476007338057, -0.20791169081775931, -0.7193398003386512,
+    0.6946583704589973, 0.5299192642332049, -0.848048096156426,
+    -0.4383711467890774, -0.898794046299167, -0.9945218953682733,
+    -0.10452846326765346, -0.6156614753256583, 0.7880107536067219,
+    0.49999999999999994, -0.8660254037844387, -0.49999999999999994,
+    -0.8660254037844387, -1.0, -0.0, -0.49999999999999994,
+    0.8660254037844387, 0.4694715627858908, -0.882947592858927,
+    -0.5591929034707468, -0.8290375725550417, -0.9945218953682733,
+    0.10452846326765346, -0.374606593415912, 0.9271838545667874,
+    0.4383711467890774, -0.898794046299167, -0.6156614753256583,
+    -0.7880107536067219, -0.9781476007338057, 0.20791169081775931,
+    -0.24192189559966773, 0.9702957262759965, 0.40673664307580015,
+    -0.9135454576426009, -0.6691306063588582, -0.7431448254773942,
+    -0.9510565162951535, 0.3090169943749474, -0.10452846326765346,
+    0.9945218953682733, 0.374606593415912, -0.9271838545667874,
+    -0.7193398003386512, -0.6946583704589973, -0.9135454576426009,
+    0.40673664307580015, 0.03489949670250097, 0.9993908270190958,
+    0.3420201433256687, -0.9396926207859084, -0.766044443118978,
+    -0.6427876096865393, -0.8660254037844387, 0.49999999999999994,
+    0.17364817766693033, 0.984807753012208
+]);
+const COMPACT_SCRATCH_RE = new Float64Array(180);
+const COMPACT_SCRATCH_IM = new Float64Array(180);
 
 //
 //  Public functions.
@@ -633,6 +185,8 @@ function ApplyMixedRadixFFT_180_Part2(re, im) {
  * 
  *  Note(s):
  *    [1] The size of `re` and `im` will not be checked.
+ *    [2] The transform is done by the table-driven loop kernel (compact
+ *        mode), which is smaller but slower than the unrolled kernels.
  * 
  *  @param {Number[]} re 
  *    - The real part of each point.
@@ -640,8 +194,7 @@ function ApplyMixedRadixFFT_180_Part2(re, im) {
  *    - The imaginary part of each point.
  */
 function ApplyMixedRadixFFT_180(re, im) {
-    ApplyMixedRadixFFT_180_Part1(re, im);
-    ApplyMixedRadixFFT_180_Part2(re, im);
+    MXCompact(re, im, COMPACT_RADICES, COMPACT_INDEXES, COMPACT_TWIDDLES, COMPACT_SCRATCH_RE, COMPACT_SCRATCH_IM);
 }
 
 //  Export public APIs.
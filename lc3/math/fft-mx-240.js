@@ -22,783 +22,201 @@ const Lc3FftMxBaseOp =
 //  Imported functions.
 // const MXTr2 = 
 //     Lc3FftMxBaseOp.MXTr2;
-const MXTr3 = 
-    Lc3FftMxBaseOp.MXTr3;
-const MXTr4 = 
-    Lc3FftMxBaseOp.MXTr4;
-const MXTr5 = 
-    Lc3FftMxBaseOp.MXTr5;
-const MXRot = 
-    Lc3FftMxBaseOp.MXRot;
+// const MXTr3 = 
+//     Lc3FftMxBaseOp.MXTr3;
+// const MXTr4 = 
+//     Lc3FftMxBaseOp.MXTr4;
+// const MXTr5 = 
+//     Lc3FftMxBaseOp.MXTr5;
+// const MXRot = 
+//     Lc3FftMxBaseOp.MXRot;
 // const MXSwap = 
 //     Lc3FftMxBaseOp.MXSwap;
-const MXCshft = 
-    Lc3FftMxBaseOp.MXCshft;
+// const MXCshft = 
+//     Lc3FftMxBaseOp.MXCshft;
+const MXCompact = 
+    Lc3FftMxBaseOp.MXCompact;
 
 //
 //  Constants.
 //
 
-//  Cyclic shift indexes.
-const CSHFT_INDEXES_0 = [1, 48, 162, 98, 181, 53, 174, 218, 188, 161, 50, 30, 27, 111, 76, 93, 169, 206, 68, 165, 14, 216, 92, 121, 55, 42, 102, 100, 4, 192, 125, 19, 228, 167, 110, 28, 159, 238, 191, 77, 141, 58, 186, 65, 21, 51, 78, 189, 209, 212, 128, 163, 146, 70, 33, 171, 74, 225, 23, 147, 118, 184, 197, 137, 139, 235, 47, 114, 220, 11, 72, 129, 211, 80];
-const CSHFT_INDEXES_1 = [2, 96, 85, 13, 168, 158, 190, 29, 207, 116, 88, 157, 142, 106, 64, 201, 56, 90, 25, 15, 36, 87, 109, 208, 164, 194, 221, 59, 234, 227, 119, 232, 131, 79, 237, 143, 154, 226, 71, 81, 49, 210, 32, 123, 151, 82, 97, 133, 175, 38, 183, 149, 214, 224, 203, 152, 130, 31, 75, 45, 18, 180, 5, 12, 120, 7, 108, 160];
-const CSHFT_INDEXES_2 = [3, 144, 202, 104, 196, 89, 205, 20];
-const CSHFT_INDEXES_3 = [6, 60, 9, 204, 200, 8, 156, 94, 217, 140, 10, 24, 195, 41, 54, 222, 107, 112, 124, 199, 233, 179, 230, 35, 39, 231, 83, 145, 22, 99, 229, 215, 44, 198, 185, 17, 132, 127, 115, 40];
-const CSHFT_INDEXES_4 = [16, 84, 193, 173, 170, 26, 63, 153, 178, 182, 101, 52, 126, 67, 117, 136, 91, 73, 177, 134, 223, 155, 46, 66, 69, 213, 176, 86, 61, 57, 138, 187, 113, 172, 122, 103, 148, 166, 62, 105];
-const CSHFT_INDEXES_5 = [34, 219, 236, 95, 37, 135, 43, 150];
-
-//
-//  Private functions.
-//
-
-/**
- *  Part 1 of ApplyMixedRadixFFT_240().
- * 
- *  @param {Number[]} re 
- *    - The real part of each point.
- *  @param {Number[]} im 
- *    - The imaginary part of each point.
- */
-function ApplyMixedRadixFFT_240_Part1(re, im) {
-    MXTr5(re, im, 0, 48, 96, 144, 192);
-    MXTr5(re, im, 1, 49, 97, 145, 193);
-    MXTr5(re, im, 2, 50, 98, 146, 194);
-    MXTr5(re, im, 3, 51, 99, 147, 195);
-    MXTr5(re, im, 4, 52, 100, 148, 196);
-    MXTr5(re, im, 5, 53, 101, 149, 197);
-    MXTr5(re, im, 6, 54, 102, 150, 198);
-    MXTr5(re, im, 7, 55, 103, 151, 199);
-    MXTr5(re, im, 8, 56, 104, 152, 200);
-    MXTr5(re, im, 9, 57, 105, 153, 201);
-    MXTr5(re, im, 10, 58, 106, 154, 202);
-    MXTr5(re, im, 11, 59, 107, 155, 203);
-    MXTr5(re, im, 12, 60, 108, 156, 204);
-    MXTr5(re, im, 13, 61, 109, 157, 205);
-    MXTr5(re, im, 14, 62, 110, 158, 206);
-    MXTr5(re, im, 15, 63, 111, 159, 207);
-    MXTr5(re, im, 16, 64, 112, 160, 208);
-    MXTr5(re, im, 17, 65, 113, 161, 209);
-    MXTr5(re, im, 18, 66, 114, 162, 210);
-    MXTr5(re, im, 19, 67, 115, 163, 211);
-    MXTr5(re, im, 20, 68, 116, 164, 212);
-    MXTr5(re, im, 21, 69, 117, 165, 213);
-    MXTr5(re, im, 22, 70, 118, 166, 214);
-    MXTr5(re, im, 23, 71, 119, 167, 215);
-    MXTr5(re, im, 24, 72, 120, 168, 216);
-    MXTr5(re, im, 25, 73, 121, 169, 217);
-    MXTr5(re, im, 26, 74, 122, 170, 218);
-    MXTr5(re, im, 27, 75, 123, 171, 219);
-    MXTr5(re, im, 28, 76, 124, 172, 220);
-    MXTr5(re, im, 29, 77, 125, 173, 221);
-    MXTr5(re, im, 30, 78, 126, 174, 222);
-    MXTr5(re, im, 31, 79, 127, 175, 223);
-    MXTr5(re, im, 32, 80, 128, 176, 224);
-    MXTr5(re, im, 33, 81, 129, 177, 225);
-    MXTr5(re, im, 34, 82, 130, 178, 226);
-    MXTr5(re, im, 35, 83, 131, 179, 227);
-    MXTr5(re, im, 36, 84, 132, 180, 228);
-    MXTr5(re, im, 37, 85, 133, 181, 229);
-    MXTr5(re, im, 38, 86, 134, 182, 230);
-    MXTr5(re, im, 39, 87, 135, 183, 231);
-    MXTr5(re, im, 40, 88, 136, 184, 232);
-    MXTr5(re, im, 41, 89, 137, 185, 233);
-    MXTr5(re, im, 42, 90, 138, 186, 234);
-    MXTr5(re, im, 43, 91, 139, 187, 235);
-    MXTr5(re, im, 44, 92, 140, 188, 236);
-    MXTr5(re, im, 45, 93, 141, 189, 237);
-    MXTr5(re, im, 46, 94, 142, 190, 238);
-    MXTr5(re, im, 47, 95, 143, 191, 239);
-    MXRot(re, im, 49, 0.9996573249755573, -0.02617694830787315);
-    MXRot(re, im, 50, 0.9986295347545738, -0.05233595624294383);
-    MXRot(re, im, 51, 0.996917333733128, -0.07845909572784494);
-    MXRot(re, im, 52, 0.9945218953682733, -0.10452846326765346);
-    MXRot(re, im, 53, 0.9914448613738104, -0.13052619222005157);
-    MXRot(re, im, 54, 0.9876883405951378, -0.15643446504023087);
-    MXRot(re, im, 55, 0.9832549075639546, -0.18223552549214744);
-    MXRot(re, im, 56, 0.9781476007338057, -0.20791169081775931);
-    MXRot(re, im, 57, 0.9723699203976766, -0.2334453638559054);
-    MXRot(re, im, 58, 0.9659258262890683, -0.25881904510252074);
-    MXRot(re, im, 59, 0.958819734868193, -0.2840153447039226);
-    MXRot(re, im, 60, 0.9510565162951535, -0.3090169943749474);
-    MXRot(re, im, 61, 0.9426414910921784, -0.3338068592337709);
-    MXRot(re, im, 62, 0.9335804264972017, -0.3583679495453002);
-    MXRot(re, im, 63, 0.9238795325112867, -0.3826834323650898);
-    MXRot(re, im, 64, 0.9135454576426009, -0.40673664307580015);
-    MXRot(re, im, 65, 0.9025852843498606, -0.4305110968082951);
-    MXRot(re, im, 66, 0.8910065241883679, -0.45399049973954675);
-    MXRot(re, im, 67, 0.8788171126619654, -0.4771587602596084);
-    MXRot(re, im, 68, 0.8660254037844387, -0.49999999999999994);
-    MXRot(re, im, 69, 0.8526401643540922, -0.5224985647159488);
-    MXRot(re, im, 70, 0.838670567945424, -0.544639035015027);
-    MXRot(re, im, 71, 0.8241261886220157, -0.5664062369248328);
-    MXRot(re, im, 72, 0.8090169943749475, -0.5877852522924731);
-    MXRot(re, im, 73, 0.7933533402912353, -0.6087614290087205);
-    MXRot(re, im, 74, 0.7771459614569709, -0.6293203910498374);
-    MXRot(re, im, 75, 0.7604059656000309, -0.6494480483301837);
-    MXRot(re, im, 76, 0.7431448254773944, -0.6691306063588581);
-    MXRot(re, im, 77, 0.7253743710122876, -0.6883545756937539);
-    MXRot(re, im, 78, 0.7071067811865476, -0.7071067811865475);
-    MXRot(re, im, 79, 0.688354575693754, -0.7253743710122875);
-    MXRot(re, im, 80, 0.6691306063588582, -0.7431448254773941);
-    MXRot(re, im, 81, 0.6494480483301837, -0.7604059656000309);
-    MXRot(re, im, 82, 0.6293203910498375, -0.7771459614569708);
-    MXRot(re, im, 83, 0.6087614290087207, -0.7933533402912352);
-    MXRot(re, im, 84, 0.5877852522924731, -0.8090169943749475);
-    MXRot(re, im, 85, 0.5664062369248329, -0.8241261886220156);
-    MXRot(re, im, 86, 0.5446390350150272, -0.8386705679454239);
-    MXRot(re, im, 87, 0.5224985647159489, -0.8526401643540922);
-    MXRot(re, im, 88, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 89, 0.47715876025960857, -0.8788171126619653);
-    MXRot(re, im, 90, 0.4539904997395468, -0.8910065241883678);
-    MXRot(re, im, 91, 0.43051109680829525, -0.9025852843498605);
-    MXRot(re, im, 92, 0.4067366430758004, -0.9135454576426009);
-    MXRot(re, im, 93, 0.38268343236508984, -0.9238795325112867);
-    MXRot(re, im, 94, 0.3583679495453004, -0.9335804264972017);
-    MXRot(re, im, 95, 0.3338068592337711, -0.9426414910921783);
-    MXRot(re, im, 97, 0.9986295347545738, -0.05233595624294383);
-    MXRot(re, im, 98, 0.9945218953682733, -0.10452846326765346);
-    MXRot(re, im, 99, 0.9876883405951378, -0.15643446504023087);
-    MXRot(re, im, 100, 0.9781476007338057, -0.20791169081775931);
-    MXRot(re, im, 101, 0.9659258262890683, -0.25881904510252074);
-    MXRot(re, im, 102, 0.9510565162951535, -0.3090169943749474);
-    MXRot(re, im, 103, 0.9335804264972017, -0.3583679495453002);
-    MXRot(re, im, 104, 0.9135454576426009, -0.40673664307580015);
-    MXRot(re, im, 105, 0.8910065241883679, -0.45399049973954675);
-    MXRot(re, im, 106, 0.8660254037844387, -0.49999999999999994);
-    MXRot(re, im, 107, 0.838670567945424, -0.544639035015027);
-    MXRot(re, im, 108, 0.8090169943749475, -0.5877852522924731);
-    MXRot(re, im, 109, 0.7771459614569709, -0.6293203910498374);
-    MXRot(re, im, 110, 0.7431448254773944, -0.6691306063588581);
-    MXRot(re, im, 111, 0.7071067811865476, -0.7071067811865475);
-    MXRot(re, im, 112, 0.6691306063588582, -0.7431448254773941);
-    MXRot(re, im, 113, 0.6293203910498375, -0.7771459614569708);
-    MXRot(re, im, 114, 0.5877852522924731, -0.8090169943749475);
-    MXRot(re, im, 115, 0.5446390350150272, -0.8386705679454239);
-    MXRot(re, im, 116, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 117, 0.4539904997395468, -0.8910065241883678);
-    MXRot(re, im, 118, 0.4067366430758004, -0.9135454576426009);
-    MXRot(re, im, 119, 0.3583679495453004, -0.9335804264972017);
-    MXRot(re, im, 120, 0.30901699437494745, -0.9510565162951535);
-    MXRot(re, im, 121, 0.25881904510252096, -0.9659258262890682);
-    MXRot(re, im, 122, 0.20791169081775945, -0.9781476007338056);
-    MXRot(re, im, 123, 0.15643446504023092, -0.9876883405951378);
-    MXRot(re, im, 124, 0.10452846326765368, -0.9945218953682733);
-    MXRot(re, im, 125, 0.052335956242943966, -0.9986295347545738);
-    MXRot(re, im, 126, 6.123233995736766e-17, -1.0);
-    MXRot(re, im, 127, -0.05233595624294362, -0.9986295347545738);
-    MXRot(re, im, 128, -0.10452846326765333, -0.9945218953682734);
-    MXRot(re, im, 129, -0.1564344650402308, -0.9876883405951378);
-    MXRot(re, im, 130, -0.20791169081775912, -0.9781476007338057);
-    MXRot(re, im, 131, -0.25881904510252063, -0.9659258262890683);
-    MXRot(re, im, 132, -0.30901699437494734, -0.9510565162951536);
-    MXRot(re, im, 133, -0.35836794954530005, -0.9335804264972019);
-    MXRot(re, im, 134, -0.40673664307580004, -0.913545457642601);
-    MXRot(re, im, 135, -0.4539904997395467, -0.8910065241883679);
-    MXRot(re, im, 136, -0.4999999999999998, -0.8660254037844387);
-    MXRot(re, im, 137, -0.5446390350150268, -0.8386705679454243);
-    MXRot(re, im, 138, -0.587785252292473, -0.8090169943749475);
-    MXRot(re, im, 139, -0.6293203910498373, -0.777145961456971);
-    MXRot(re, im, 140, -0.6691306063588579, -0.7431448254773945);
-    MXRot(re, im, 141, -0.7071067811865475, -0.7071067811865476);
-    MXRot(re, im, 142, -0.743144825477394, -0.6691306063588583);
-    MXRot(re, im, 143, -0.7771459614569707, -0.6293203910498377);
-    MXRot(re, im, 145, 0.996917333733128, -0.07845909572784494);
-    MXRot(re, im, 146, 0.9876883405951378, -0.15643446504023087);
-    MXRot(re, im, 147, 0.9723699203976766, -0.2334453638559054);
-    MXRot(re, im, 148, 0.9510565162951535, -0.3090169943749474);
-    MXRot(re, im, 149, 0.9238795325112867, -0.3826834323650898);
-    MXRot(re, im, 150, 0.8910065241883679, -0.45399049973954675);
-    MXRot(re, im, 151, 0.8526401643540922, -0.5224985647159488);
-    MXRot(re, im, 152, 0.8090169943749475, -0.5877852522924731);
-    MXRot(re, im, 153, 0.7604059656000309, -0.6494480483301837);
-    MXRot(re, im, 154, 0.7071067811865476, -0.7071067811865475);
-    MXRot(re, im, 155, 0.6494480483301837, -0.7604059656000309);
-    MXRot(re, im, 156, 0.5877852522924731, -0.8090169943749475);
-    MXRot(re, im, 157, 0.5224985647159489, -0.8526401643540922);
-    MXRot(re, im, 158, 0.4539904997395468, -0.8910065241883678);
-    MXRot(re, im, 159, 0.38268343236508984, -0.9238795325112867);
-    MXRot(re, im, 160, 0.30901699437494745, -0.9510565162951535);
-    MXRot(re, im, 161, 0.23344536385590547, -0.9723699203976766);
-    MXRot(re, im, 162, 0.15643446504023092, -0.9876883405951378);
-    MXRot(re, im, 163, 0.078459095727845, -0.996917333733128);
-    MXRot(re, im, 164, 6.123233995736766e-17, -1.0);
-    MXRot(re, im, 165, -0.07845909572784487, -0.996917333733128);
-    MXRot(re, im, 166, -0.1564344650402308, -0.9876883405951378);
-    MXRot(re, im, 167, -0.23344536385590534, -0.9723699203976767);
-    MXRot(re, im, 168, -0.30901699437494734, -0.9510565162951536);
-    MXRot(re, im, 169, -0.3826834323650897, -0.9238795325112867);
-    MXRot(re, im, 170, -0.4539904997395467, -0.8910065241883679);
-    MXRot(re, im, 171, -0.5224985647159488, -0.8526401643540923);
-    MXRot(re, im, 172, -0.587785252292473, -0.8090169943749475);
-    MXRot(re, im, 173, -0.6494480483301835, -0.760405965600031);
-    MXRot(re, im, 174, -0.7071067811865475, -0.7071067811865476);
-    MXRot(re, im, 175, -0.7604059656000309, -0.6494480483301838);
-    MXRot(re, im, 176, -0.8090169943749473, -0.5877852522924732);
-    MXRot(re, im, 177, -0.8526401643540922, -0.5224985647159489);
-    MXRot(re, im, 178, -0.8910065241883678, -0.45399049973954686);
-    MXRot(re, im, 179, -0.9238795325112867, -0.3826834323650899);
-    MXRot(re, im, 180, -0.9510565162951535, -0.3090169943749475);
-    MXRot(re, im, 181, -0.9723699203976766, -0.23344536385590553);
-    MXRot(re, im, 182, -0.9876883405951377, -0.15643446504023098);
-    MXRot(re, im, 183, -0.996917333733128, -0.07845909572784507);
-    MXRot(re, im, 184, -1.0, -1.2246467991473532e-16);
-    MXRot(re, im, 185, -0.996917333733128, 0.07845909572784482);
-    MXRot(re, im, 186, -0.9876883405951378, 0.15643446504023073);
-    MXRot(re, im, 187, -0.9723699203976767, 0.23344536385590528);
-    MXRot(re, im, 188, -0.9510565162951536, 0.3090169943749473);
-    MXRot(re, im, 189, -0.9238795325112868, 0.38268343236508967);
-    MXRot(re, im, 190, -0.8910065241883679, 0.4539904997395467);
-    MXRot(re, im, 191, -0.8526401643540923, 0.5224985647159487);
-    MXRot(re, im, 193, 0.9945218953682733, -0.10452846326765346);
-    MXRot(re, im, 194, 0.9781476007338057, -0.20791169081775931);
-    MXRot(re, im, 195, 0.9510565162951535, -0.3090169943749474);
-    MXRot(re, im, 196, 0.9135454576426009, -0.40673664307580015);
-    MXRot(re, im, 197, 0.8660254037844387, -0.49999999999999994);
-    MXRot(re, im, 198, 0.8090169943749475, -0.5877852522924731);
-    MXRot(re, im, 199, 0.7431448254773944, -0.6691306063588581);
-    MXRot(re, im, 200, 0.6691306063588582, -0.7431448254773941);
-    MXRot(re, im, 201, 0.5877852522924731, -0.8090169943749475);
-    MXRot(re, im, 202, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 203, 0.4067366430758004, -0.9135454576426009);
-    MXRot(re, im, 204, 0.30901699437494745, -0.9510565162951535);
-    MXRot(re, im, 205, 0.20791169081775945, -0.9781476007338056);
-    MXRot(re, im, 206, 0.10452846326765368, -0.9945218953682733);
-    MXRot(re, im, 207, 6.123233995736766e-17, -1.0);
-    MXRot(re, im, 208, -0.10452846326765333, -0.9945218953682734);
-    MXRot(re, im, 209, -0.20791169081775912, -0.9781476007338057);
-    MXRot(re, im, 210, -0.30901699437494734, -0.9510565162951536);
-    MXRot(re, im, 211, -0.40673664307580004, -0.913545457642601);
-    MXRot(re, im, 212, -0.4999999999999998, -0.8660254037844387);
-    MXRot(re, im, 213, -0.587785252292473, -0.8090169943749475);
-    MXRot(re, im, 214, -0.6691306063588579, -0.7431448254773945);
-    MXRot(re, im, 215, -0.743144825477394, -0.6691306063588583);
-    MXRot(re, im, 216, -0.8090169943749473, -0.5877852522924732);
-    MXRot(re, im, 217, -0.8660254037844385, -0.5000000000000003);
-    MXRot(re, im, 218, -0.9135454576426008, -0.40673664307580043);
-    MXRot(re, im, 219, -0.9510565162951535, -0.3090169943749475);
-    MXRot(re, im, 220, -0.9781476007338056, -0.20791169081775973);
-    MXRot(re, im, 221, -0.9945218953682733, -0.10452846326765373);
-    MXRot(re, im, 222, -1.0, -1.2246467991473532e-16);
-    MXRot(re, im, 223, -0.9945218953682734, 0.10452846326765305);
-    MXRot(re, im, 224, -0.9781476007338057, 0.20791169081775907);
-    MXRot(re, im, 225, -0.9510565162951536, 0.3090169943749473);
-    MXRot(re, im, 226, -0.9135454576426011, 0.4067366430757998);
-    MXRot(re, im, 227, -0.8660254037844388, 0.4999999999999997);
-    MXRot(re, im, 228, -0.8090169943749476, 0.587785252292473);
-    MXRot(re, im, 229, -0.7431448254773946, 0.6691306063588579);
-    MXRot(re, im, 230, -0.6691306063588585, 0.743144825477394);
-    MXRot(re, im, 231, -0.5877852522924732, 0.8090169943749473);
-    MXRot(re, im, 232, -0.5000000000000004, 0.8660254037844384);
-    MXRot(re, im, 233, -0.4067366430758009, 0.9135454576426005);
-    MXRot(re, im, 234, -0.30901699437494756, 0.9510565162951535);
-    MXRot(re, im, 235, -0.2079116908177598, 0.9781476007338056);
-    MXRot(re, im, 236, -0.10452846326765423, 0.9945218953682733);
-    MXRot(re, im, 237, -1.8369701987210297e-16, 1.0);
-    MXRot(re, im, 238, 0.10452846326765299, 0.9945218953682734);
-    MXRot(re, im, 239, 0.20791169081775857, 0.9781476007338058);
-    MXTr4(re, im, 0, 12, 24, 36);
-    MXTr4(re, im, 1, 13, 25, 37);
-    MXTr4(re, im, 2, 14, 26, 38);
-    MXTr4(re, im, 3, 15, 27, 39);
-    MXTr4(re, im, 4, 16, 28, 40);
-    MXTr4(re, im, 5, 17, 29, 41);
-    MXTr4(re, im, 6, 18, 30, 42);
-    MXTr4(re, im, 7, 19, 31, 43);
-    MXTr4(re, im, 8, 20, 32, 44);
-    MXTr4(re, im, 9, 21, 33, 45);
-    MXTr4(re, im, 10, 22, 34, 46);
-    MXTr4(re, im, 11, 23, 35, 47);
-    MXRot(re, im, 13, 0.9914448613738104, -0.13052619222005157);
-    MXRot(re, im, 14, 0.9659258262890683, -0.25881904510252074);
-    MXRot(re, im, 15, 0.9238795325112867, -0.3826834323650898);
-    MXRot(re, im, 16, 0.8660254037844387, -0.49999999999999994);
-    MXRot(re, im, 17, 0.7933533402912353, -0.6087614290087205);
-    MXRot(re, im, 18, 0.7071067811865476, -0.7071067811865475);
-    MXRot(re, im, 19, 0.6087614290087207, -0.7933533402912352);
-    MXRot(re, im, 20, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 21, 0.38268343236508984, -0.9238795325112867);
-    MXRot(re, im, 22, 0.25881904510252096, -0.9659258262890682);
-    MXRot(re, im, 23, 0.1305261922200517, -0.9914448613738104);
-    MXRot(re, im, 25, 0.9659258262890683, -0.25881904510252074);
-    MXRot(re, im, 26, 0.8660254037844387, -0.49999999999999994);
-    MXRot(re, im, 27, 0.7071067811865476, -0.7071067811865475);
-    MXRot(re, im, 28, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 29, 0.25881904510252096, -0.9659258262890682);
-    MXRot(re, im, 30, 6.123233995736766e-17, -1.0);
-    MXRot(re, im, 31, -0.25881904510252063, -0.9659258262890683);
-    MXRot(re, im, 32, -0.4999999999999998, -0.8660254037844387);
-    MXRot(re, im, 33, -0.7071067811865475, -0.7071067811865476);
-    MXRot(re, im, 34, -0.8660254037844385, -0.5000000000000003);
-    MXRot(re, im, 35, -0.9659258262890682, -0.258819045102521);
-    MXRot(re, im, 37, 0.9238795325112867, -0.3826834323650898);
-    MXRot(re, im, 38, 0.7071067811865476, -0.7071067811865475);
-    MXRot(re, im, 39, 0.38268343236508984, -0.9238795325112867);
-    MXRot(re, im, 40, 6.123233995736766e-17, -1.0);
-    MXRot(re, im, 41, -0.3826834323650895, -0.9238795325112868);
-    MXRot(re, im, 42, -0.7071067811865475, -0.7071067811865476);
-    MXRot(re, im, 43, -0.9238795325112867, -0.3826834323650899);
-    MXRot(re, im, 44, -1.0, -1.2246467991473532e-16);
-    MXRot(re, im, 45, -0.923879532511287, 0.3826834323650892);
-    MXRot(re, im, 46, -0.7071067811865479, 0.7071067811865471);
-    MXRot(re, im, 47, -0.38268343236509034, 0.9238795325112865);
-    MXTr4(re, im, 0, 3, 6, 9);
-    MXTr4(re, im, 1, 4, 7, 10);
-    MXTr4(re, im, 2, 5, 8, 11);
-    MXRot(re, im, 4, 0.8660254037844387, -0.49999999999999994);
-    MXRot(re, im, 5, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 7, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 8, -0.4999999999999998, -0.8660254037844387);
-    MXRot(re, im, 10, 6.123233995736766e-17, -1.0);
-    MXRot(re, im, 11, -1.0, -1.2246467991473532e-16);
-    MXTr3(re, im, 0, 1, 2);
-    MXTr3(re, im, 3, 4, 5);
-    MXTr3(re, im, 6, 7, 8);
-    MXTr3(re, im, 9, 10, 11);
-    MXTr4(re, im, 12, 15, 18, 21);
-    MXTr4(re, im, 13, 16, 19, 22);
-    MXTr4(re, im, 14, 17, 20, 23);
-    MXRot(re, im, 16, 0.8660254037844387, -0.49999999999999994);
-    MXRot(re, im, 17, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 19, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 20, -0.4999999999999998, -0.8660254037844387);
-    MXRot(re, im, 22, 6.123233995736766e-17, -1.0);
-    MXRot(re, im, 23, -1.0, -1.2246467991473532e-16);
-    MXTr3(re, im, 12, 13, 14);
-    MXTr3(re, im, 15, 16, 17);
-    MXTr3(re, im, 18, 19, 20);
-    MXTr3(re, im, 21, 22, 23);
-    MXTr4(re, im, 24, 27, 30, 33);
-    MXTr4(re, im, 25, 28, 31, 34);
-    MXTr4(re, im, 26, 29, 32, 35);
-    MXRot(re, im, 28, 0.8660254037844387, -0.49999999999999994);
-    MXRot(re, im, 29, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 31, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 32, -0.4999999999999998, -0.8660254037844387);
-    MXRot(re, im, 34, 6.123233995736766e-17, -1.0);
-    MXRot(re, im, 35, -1.0, -1.2246467991473532e-16);
-    MXTr3(re, im, 24, 25, 26);
-    MXTr3(re, im, 27, 28, 29);
-    MXTr3(re, im, 30, 31, 32);
-    MXTr3(re, im, 33, 34, 35);
-    MXTr4(re, im, 36, 39, 42, 45);
-    MXTr4(re, im, 37, 40, 43, 46);
-    MXTr4(re, im, 38, 41, 44, 47);
-    MXRot(re, im, 40, 0.8660254037844387, -0.49999999999999994);
-    MXRot(re, im, 41, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 43, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 44, -0.4999999999999998, -0.8660254037844387);
-    MXRot(re, im, 46, 6.123233995736766e-17, -1.0);
-    MXRot(re, im, 47, -1.0, -1.2246467991473532e-16);
-    MXTr3(re, im, 36, 37, 38);
-    MXTr3(re, im, 39, 40, 41);
-    MXTr3(re, im, 42, 43, 44);
-    MXTr3(re, im, 45, 46, 47);
-    MXTr4(re, im, 48, 60, 72, 84);
-    MXTr4(re, im, 49, 61, 73, 85);
-    MXTr4(re, im, 50, 62, 74, 86);
-    MXTr4(re, im, 51, 63, 75, 87);
-    MXTr4(re, im, 52, 64, 76, 88);
-    MXTr4(re, im, 53, 65, 77, 89);
-    MXTr4(re, im, 54, 66, 78, 90);
-    MXTr4(re, im, 55, 67, 79, 91);
-    MXTr4(re, im, 56, 68, 80, 92);
-    MXTr4(re, im, 57, 69, 81, 93);
-    MXTr4(re, im, 58, 70, 82, 94);
-    MXTr4(re, im, 59, 71, 83, 95);
-    MXRot(re, im, 61, 0.9914448613738104, -0.13052619222005157);
-    MXRot(re, im, 62, 0.9659258262890683, -0.25881904510252074);
-    MXRot(re, im, 63, 0.9238795325112867, -0.3826834323650898);
-    MXRot(re, im, 64, 0.8660254037844387, -0.49999999999999994);
-    MXRot(re, im, 65, 0.7933533402912353, -0.6087614290087205);
-    MXRot(re, im, 66, 0.7071067811865476, -0.7071067811865475);
-    MXRot(re, im, 67, 0.6087614290087207, -0.7933533402912352);
-    MXRot(re, im, 68, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 69, 0.38268343236508984, -0.9238795325112867);
-    MXRot(re, im, 70, 0.25881904510252096, -0.9659258262890682);
-    MXRot(re, im, 71, 0.1305261922200517, -0.9914448613738104);
-    MXRot(re, im, 73, 0.9659258262890683, -0.25881904510252074);
-    MXRot(re, im, 74, 0.8660254037844387, -0.49999999999999994);
-    MXRot(re, im, 75, 0.7071067811865476, -0.7071067811865475);
-    MXRot(re, im, 76, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 77, 0.25881904510252096, -0.9659258262890682);
-    MXRot(re, im, 78, 6.123233995736766e-17, -1.0);
-    MXRot(re, im, 79, -0.25881904510252063, -0.9659258262890683);
-    MXRot(re, im, 80, -0.4999999999999998, -0.8660254037844387);
-    MXRot(re, im, 81, -0.7071067811865475, -0.7071067811865476);
-    MXRot(re, im, 82, -0.8660254037844385, -0.5000000000000003);
-    MXRot(re, im, 83, -0.9659258262890682, -0.258819045102521);
-    MXRot(re, im, 85, 0.9238795325112867, -0.3826834323650898);
-    MXRot(re, im, 86, 0.7071067811865476, -0.7071067811865475);
-    MXRot(re, im, 87, 0.38268343236508984, -0.9238795325112867);
-    MXRot(re, im, 88, 6.123233995736766e-17, -1.0);
-    MXRot(re, im, 89, -0.3826834323650895, -0.9238795325112868);
-    MXRot(re, im, 90, -0.7071067811865475, -0.7071067811865476);
-    MXRot(re, im, 91, -0.9238795325112867, -0.3826834323650899);
-    MXRot(re, im, 92, -1.0, -1.2246467991473532e-16);
-    MXRot(re, im, 93, -0.923879532511287, 0.3826834323650892);
-    MXRot(re, im, 94, -0.7071067811865479, 0.7071067811865471);
-    MXRot(re, im, 95, -0.38268343236509034, 0.9238795325112865);
-    MXTr4(re, im, 48, 51, 54, 57);
-    MXTr4(re, im, 49, 52, 55, 58);
-    MXTr4(re, im, 50, 53, 56, 59);
-    MXRot(re, im, 52, 0.8660254037844387, -0.49999999999999994);
-    MXRot(re, im, 53, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 55, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 56, -0.4999999999999998, -0.8660254037844387);
-    MXRot(re, im, 58, 6.123233995736766e-17, -1.0);
-    MXRot(re, im, 59, -1.0, -1.2246467991473532e-16);
-    MXTr3(re, im, 48, 49, 50);
-    MXTr3(re, im, 51, 52, 53);
-    MXTr3(re, im, 54, 55, 56);
-    MXTr3(re, im, 57, 58, 59);
-    MXTr4(re, im, 60, 63, 66, 69);
-    MXTr4(re, im, 61, 64, 67, 70);
-    MXTr4(re, im, 62, 65, 68, 71);
-    MXRot(re, im, 64, 0.8660254037844387, -0.49999999999999994);
-    MXRot(re, im, 65, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 67, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 68, -0.4999999999999998, -0.8660254037844387);
-    MXRot(re, im, 70, 6.123233995736766e-17, -1.0);
-    MXRot(re, im, 71, -1.0, -1.2246467991473532e-16);
-    MXTr3(re, im, 60, 61, 62);
-    MXTr3(re, im, 63, 64, 65);
-    MXTr3(re, im, 66, 67, 68);
-    MXTr3(re, im, 69, 70, 71);
-    MXTr4(re, im, 72, 75, 78, 81);
-    MXTr4(re, im, 73, 76, 79, 82);
-    MXTr4(re, im, 74, 77, 80, 83);
-    MXRot(re, im, 76, 0.8660254037844387, -0.49999999999999994);
-    MXRot(re, im, 77, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 79, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 80, -0.4999999999999998, -0.8660254037844387);
-    MXRot(re, im, 82, 6.123233995736766e-17, -1.0);
-    MXRot(re, im, 83, -1.0, -1.2246467991473532e-16);
-    MXTr3(re, im, 72, 73, 74);
-    MXTr3(re, im, 75, 76, 77);
-    MXTr3(re, im, 78, 79, 80);
-    MXTr3(re, im, 81, 82, 83);
-    MXTr4(re, im, 84, 87, 90, 93);
-    MXTr4(re, im, 85, 88, 91, 94);
-    MXTr4(re, im, 86, 89, 92, 95);
-    MXRot(re, im, 88, 0.8660254037844387, -0.49999999999999994);
-    MXRot(re, im, 89, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 91, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 92, -0.4999999999999998, -0.8660254037844387);
-    MXRot(re, im, 94, 6.123233995736766e-17, -1.0);
-    MXRot(re, im, 95, -1.0, -1.2246467991473532e-16);
-    MXTr3(re, im, 84, 85, 86);
-    MXTr3(re, im, 87, 88, 89);
-    MXTr3(re, im, 90, 91, 92);
-    MXTr3(re, im, 93, 94, 95);
-    MXTr4(re, im, 96, 108, 120, 132);
-    MXTr4(re, im, 97, 109, 121, 133);
-    MXTr4(re, im, 98, 110, 122, 134);
-    MXTr4(re, im, 99, 111, 123, 135);
-    MXTr4(re, im, 100, 112, 124, 136);
-    MXTr4(re, im, 101, 113, 125, 137);
-    MXTr4(re, im, 102, 114, 126, 138);
-    MXTr4(re, im, 103, 115, 127, 139);
-    MXTr4(re, im, 104, 116, 128, 140);
-    MXTr4(re, im, 105, 117, 129, 141);
-    MXTr4(re, im, 106, 118, 130, 142);
-    MXTr4(re, im, 107, 119, 131, 143);
-    MXRot(re, im, 109, 0.9914448613738104, -0.13052619222005157);
-    MXRot(re, im, 110, 0.9659258262890683, -0.25881904510252074);
-    MXRot(re, im, 111, 0.9238795325112867, -0.3826834323650898);
-    MXRot(re, im, 112, 0.8660254037844387, -0.49999999999999994);
-    MXRot(re, im, 113, 0.7933533402912353, -0.6087614290087205);
-    MXRot(re, im, 114, 0.7071067811865476, -0.7071067811865475);
-    MXRot(re, im, 115, 0.6087614290087207, -0.7933533402912352);
-    MXRot(re, im, 116, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 117, 0.38268343236508984, -0.9238795325112867);
-    MXRot(re, im, 118, 0.25881904510252096, -0.9659258262890682);
-    MXRot(re, im, 119, 0.1305261922200517, -0.9914448613738104);
-    MXRot(re, im, 121, 0.9659258262890683, -0.25881904510252074);
-    MXRot(re, im, 122, 0.8660254037844387, -0.49999999999999994);
-    MXRot(re, im, 123, 0.7071067811865476, -0.7071067811865475);
-    MXRot(re, im, 124, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 125, 0.25881904510252096, -0.9659258262890682);
-    MXRot(re, im, 126, 6.123233995736766e-17, -1.0);
-    MXRot(re, im, 127, -0.25881904510252063, -0.9659258262890683);
-    MXRot(re, im, 128, -0.4999999999999998, -0.8660254037844387);
-    MXRot(re, im, 129, -0.7071067811865475, -0.7071067811865476);
-    MXRot(re, im, 130, -0.8660254037844385, -0.5000000000000003);
-    MXRot(re, im, 131, -0.9659258262890682, -0.258819045102521);
-    MXRot(re, im, 133, 0.9238795325112867, -0.3826834323650898);
-    MXRot(re, im, 134, 0.7071067811865476, -0.7071067811865475);
-    MXRot(re, im, 135, 0.38268343236508984, -0.9238795325112867);
-    MXRot(re, im, 136, 6.123233995736766e-17, -1.0);
-    MXRot(re, im, 137, -0.3826834323650895, -0.9238795325112868);
-    MXRot(re, im, 138, -0.7071067811865475, -0.7071067811865476);
-    MXRot(re, im, 139, -0.9238795325112867, -0.3826834323650899);
-    MXRot(re, im, 140, -1.0, -1.2246467991473532e-16);
-    MXRot(re, im, 141, -0.923879532511287, 0.3826834323650892);
-    MXRot(re, im, 142, -0.7071067811865479, 0.7071067811865471);
-    MXRot(re, im, 143, -0.38268343236509034, 0.9238795325112865);
-    MXTr4(re, im, 96, 99, 102, 105);
-    MXTr4(re, im, 97, 100, 103, 106);
-    MXTr4(re, im, 98, 101, 104, 107);
-    MXRot(re, im, 100, 0.8660254037844387, -0.49999999999999994);
-    MXRot(re, im, 101, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 103, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 104, -0.4999999999999998, -0.8660254037844387);
-    MXRot(re, im, 106, 6.123233995736766e-17, -1.0);
-    MXRot(re, im, 107, -1.0, -1.2246467991473532e-16);
-    MXTr3(re, im, 96, 97, 98);
-    MXTr3(re, im, 99, 100, 101);
-    MXTr3(re, im, 102, 103, 104);
-    MXTr3(re, im, 105, 106, 107);
-    MXTr4(re, im, 108, 111, 114, 117);
-    MXTr4(re, im, 109, 112, 115, 118);
-    MXTr4(re, im, 110, 113, 116, 119);
-    MXRot(re, im, 112, 0.8660254037844387, -0.49999999999999994);
-    MXRot(re, im, 113, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 115, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 116, -0.4999999999999998, -0.8660254037844387);
-    MXRot(re, im, 118, 6.123233995736766e-17, -1.0);
-    MXRot(re, im, 119, -1.0, -1.2246467991473532e-16);
-    MXTr3(re, im, 108, 109, 110);
-    MXTr3(re, im, 111, 112, 113);
-    MXTr3(re, im, 114, 115, 116);
-}
-
-/**
- *  Part 2 of ApplyMixedRadixFFT_240().
- * 
- *  @param {Number[]} re 
- *    - The real part of each point.
- *  @param {Number[]} im 
- *    - The imaginary part of each point.
- */
-function ApplyMixedRadixFFT_240_Part2(re, im) {
-    MXTr3(re, im, 117, 118, 119);
-    MXTr4(re, im, 120, 123, 126, 129);
-    MXTr4(re, im, 121, 124, 127, 130);
-    MXTr4(re, im, 122, 125, 128, 131);
-    MXRot(re, im, 124, 0.8660254037844387, -0.49999999999999994);
-    MXRot(re, im, 125, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 127, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 128, -0.4999999999999998, -0.8660254037844387);
-    MXRot(re, im, 130, 6.123233995736766e-17, -1.0);
-    MXRot(re, im, 131, -1.0, -1.2246467991473532e-16);
-    MXTr3(re, im, 120, 121, 122);
-    MXTr3(re, im, 123, 124, 125);
-    MXTr3(re, im, 126, 127, 128);
-    MXTr3(re, im, 129, 130, 131);
-    MXTr4(re, im, 132, 135, 138, 141);
-    MXTr4(re, im, 133, 136, 139, 142);
-    MXTr4(re, im, 134, 137, 140, 143);
-    MXRot(re, im, 136, 0.8660254037844387, -0.49999999999999994);
-    MXRot(re, im, 137, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 139, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 140, -0.4999999999999998, -0.8660254037844387);
-    MXRot(re, im, 142, 6.123233995736766e-17, -1.0);
-    MXRot(re, im, 143, -1.0, -1.2246467991473532e-16);
-    MXTr3(re, im, 132, 133, 134);
-    MXTr3(re, im, 135, 136, 137);
-    MXTr3(re, im, 138, 139, 140);
-    MXTr3(re, im, 141, 142, 143);
-    MXTr4(re, im, 144, 156, 168, 180);
-    MXTr4(re, im, 145, 157, 169, 181);
-    MXTr4(re, im, 146, 158, 170, 182);
-    MXTr4(re, im, 147, 159, 171, 183);
-    MXTr4(re, im, 148, 160, 172, 184);
-    MXTr4(re, im, 149, 161, 173, 185);
-    MXTr4(re, im, 150, 162, 174, 186);
-    MXTr4(re, im, 151, 163, 175, 187);
-    MXTr4(re, im, 152, 164, 176, 188);
-    MXTr4(re, im, 153, 165, 177, 189);
-    MXTr4(re, im, 154, 166, 178, 190);
-    MXTr4(re, im, 155, 167, 179, 191);
-    MXRot(re, im, 157, 0.9914448613738104, -0.13052619222005157);
-    MXRot(re, im, 158, 0.9659258262890683, -0.25881904510252074);
-    MXRot(re, im, 159, 0.9238795325112867, -0.3826834323650898);
-    MXRot(re, im, 160, 0.8660254037844387, -0.49999999999999994);
-    MXRot(re, im, 161, 0.7933533402912353, -0.6087614290087205);
-    MXRot(re, im, 162, 0.7071067811865476, -0.7071067811865475);
-    MXRot(re, im, 163, 0.6087614290087207, -0.7933533402912352);
-    MXRot(re, im, 164, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 165, 0.38268343236508984, -0.9238795325112867);
-    MXRot(re, im, 166, 0.25881904510252096, -0.9659258262890682);
-    MXRot(re, im, 167, 0.1305261922200517, -0.9914448613738104);
-    MXRot(re, im, 169, 0.9659258262890683, -0.25881904510252074);
-    MXRot(re, im, 170, 0.8660254037844387, -0.49999999999999994);
-    MXRot(re, im, 171, 0.7071067811865476, -0.7071067811865475);
-    MXRot(re, im, 172, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 173, 0.25881904510252096, -0.9659258262890682);
-    MXRot(re, im, 174, 6.123233995736766e-17, -1.0);
-    MXRot(re, im, 175, -0.25881904510252063, -0.9659258262890683);
-    MXRot(re, im, 176, -0.4999999999999998, -0.8660254037844387);
-    MXRot(re, im, 177, -0.7071067811865475, -0.7071067811865476);
-    MXRot(re, im, 178, -0.8660254037844385, -0.5000000000000003);
-    MXRot(re, im, 179, -0.9659258262890682, -0.258819045102521);
-    MXRot(re, im, 181, 0.9238795325112867, -0.3826834323650898);
-    MXRot(re, im, 182, 0.7071067811865476, -0.7071067811865475);
-    MXRot(re, im, 183, 0.38268343236508984, -0.9238795325112867);
-    MXRot(re, im, 184, 6.123233995736766e-17, -1.0);
-    MXRot(re, im, 185, -0.3826834323650895, -0.9238795325112868);
-    MXRot(re, im, 186, -0.7071067811865475, -0.7071067811865476);
-    MXRot(re, im, 187, -0.9238795325112867, -0.3826834323650899);
-    MXRot(re, im, 188, -1.0, -1.2246467991473532e-16);
-    MXRot(re, im, 189, -0.923879532511287, 0.3826834323650892);
-    MXRot(re, im, 190, -0.7071067811865479, 0.7071067811865471);
-    MXRot(re, im, 191, -0.38268343236509034, 0.9238795325112865);
-    MXTr4(re, im, 144, 147, 150, 153);
-    MXTr4(re, im, 145, 148, 151, 154);
-    MXTr4(re, im, 146, 149, 152, 155);
-    MXRot(re, im, 148, 0.8660254037844387, -0.49999999999999994);
-    MXRot(re, im, 149, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 151, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 152, -0.4999999999999998, -0.8660254037844387);
-    MXRot(re, im, 154, 6.123233995736766e-17, -1.0);
-    MXRot(re, im, 155, -1.0, -1.2246467991473532e-16);
-    MXTr3(re, im, 144, 145, 146);
-    MXTr3(re, im, 147, 148, 149);
-    MXTr3(re, im, 150, 151, 152);
-    MXTr3(re, im, 153, 154, 155);
-    MXTr4(re, im, 156, 159, 162, 165);
-    MXTr4(re, im, 157, 160, 163, 166);
-    MXTr4(re, im, 158, 161, 164, 167);
-    MXRot(re, im, 160, 0.8660254037844387, -0.49999999999999994);
-    MXRot(re, im, 161, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 163, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 164, -0.4999999999999998, -0.8660254037844387);
-    MXRot(re, im, 166, 6.123233995736766e-17, -1.0);
-    MXRot(re, im, 167, -1.0, -1.2246467991473532e-16);
-    MXTr3(re, im, 156, 157, 158);
-    MXTr3(re, im, 159, 160, 161);
-    MXTr3(re, im, 162, 163, 164);
-    MXTr3(re, im, 165, 166, 167);
-    MXTr4(re, im, 168, 171, 174, 177);
-    MXTr4(re, im, 169, 172, 175, 178);
-    MXTr4(re, im, 170, 173, 176, 179);
-    MXRot(re, im, 172, 0.8660254037844387, -0.49999999999999994);
-    MXRot(re, im, 173, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 175, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 176, -0.4999999999999998, -0.8660254037844387);
-    MXRot(re, im, 178, 6.123233995736766e-17, -1.0);
-    MXRot(re, im, 179, -1.0, -1.2246467991473532e-16);
-    MXTr3(re, im, 168, 169, 170);
-    MXTr3(re, im, 171, 172, 173);
-    MXTr3(re, im, 174, 175, 176);
-    MXTr3(re, im, 177, 178, 179);
-    MXTr4(re, im, 180, 183, 186, 189);
-    MXTr4(re, im, 181, 184, 187, 190);
-    MXTr4(re, im, 182, 185, 188, 191);
-    MXRot(re, im, 184, 0.8660254037844387, -0.49999999999999994);
-    MXRot(re, im, 185, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 187, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 188, -0.4999999999999998, -0.8660254037844387);
-    MXRot(re, im, 190, 6.123233995736766e-17, -1.0);
-    MXRot(re, im, 191, -1.0, -1.2246467991473532e-16);
-    MXTr3(re, im, 180, 181, 182);
-    MXTr3(re, im, 183, 184, 185);
-    MXTr3(re, im, 186, 187, 188);
-    MXTr3(re, im, 189, 190, 191);
-    MXTr4(re, im, 192, 204, 216, 228);
-    MXTr4(re, im, 193, 205, 217, 229);
-    MXTr4(re, im, 194, 206, 218, 230);
-    MXTr4(re, im, 195, 207, 219, 231);
-    MXTr4(re, im, 196, 208, 220, 232);
-    MXTr4(re, im, 197, 209, 221, 233);
-    MXTr4(re, im, 198, 210, 222, 234);
-    MXTr4(re, im, 199, 211, 223, 235);
-    MXTr4(re, im, 200, 212, 224, 236);
-    MXTr4(re, im, 201, 213, 225, 237);
-    MXTr4(re, im, 202, 214, 226, 238);
-    MXTr4(re, im, 203, 215, 227, 239);
-    MXRot(re, im, 205, 0.9914448613738104, -0.13052619222005157);
-    MXRot(re, im, 206, 0.9659258262890683, -0.25881904510252074);
-    MXRot(re, im, 207, 0.9238795325112867, -0.3826834323650898);
-    MXRot(re, im, 208, 0.8660254037844387, -0.49999999999999994);
-    MXRot(re, im, 209, 0.7933533402912353, -0.6087614290087205);
-    MXRot(re, im, 210, 0.7071067811865476, -0.7071067811865475);
-    MXRot(re, im, 211, 0.6087614290087207, -0.7933533402912352);
-    MXRot(re, im, 212, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 213, 0.38268343236508984, -0.9238795325112867);
-    MXRot(re, im, 214, 0.25881904510252096, -0.9659258262890682);
-    MXRot(re, im, 215, 0.1305261922200517, -0.9914448613738104);
-    MXRot(re, im, 217, 0.9659258262890683, -0.25881904510252074);
-    MXRot(re, im, 218, 0.8660254037844387, -0.49999999999999994);
-    MXRot(re, im, 219, 0.7071067811865476, -0.7071067811865475);
-    MXRot(re, im, 220, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 221, 0.25881904510252096, -0.9659258262890682);
-    MXRot(re, im, 222, 6.123233995736766e-17, -1.0);
-    MXRot(re, im, 223, -0.25881904510252063, -0.9659258262890683);
-    MXRot(re, im, 224, -0.4999999999999998, -0.8660254037844387);
-    MXRot(re, im, 225, -0.7071067811865475, -0.7071067811865476);
-    MXRot(re, im, 226, -0.8660254037844385, -0.5000000000000003);
-    MXRot(re, im, 227, -0.9659258262890682, -0.258819045102521);
-    MXRot(re, im, 229, 0.9238795325112867, -0.3826834323650898);
-    MXRot(re, im, 230, 0.7071067811865476, -0.7071067811865475);
-    MXRot(re, im, 231, 0.38268343236508984, -0.9238795325112867);
-    MXRot(re, im, 232, 6.123233995736766e-17, -1.0);
-    MXRot(re, im, 233, -0.3826834323650895, -0.9238795325112868);
-    MXRot(re, im, 234, -0.7071067811865475, -0.7071067811865476);
-    MXRot(re, im, 235, -0.9238795325112867, -0.3826834323650899);
-    MXRot(re, im, 236, -1.0, -1.2246467991473532e-16);
-    MXRot(re, im, 237, -0.923879532511287, 0.3826834323650892);
-    MXRot(re, im, 238, -0.7071067811865479, 0.7071067811865471);
-    MXRot(re, im, 239, -0.38268343236509034, 0.9238795325112865);
-    MXTr4(re, im, 192, 195, 198, 201);
-    MXTr4(re, im, 193, 196, 199, 202);
-    MXTr4(re, im, 194, 197, 200, 203);
-    MXRot(re, im, 196, 0.8660254037844387, -0.49999999999999994);
-    MXRot(re, im, 197, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 199, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 200, -0.4999999999999998, -0.8660254037844387);
-    MXRot(re, im, 202, 6.123233995736766e-17, -1.0);
-    MXRot(re, im, 203, -1.0, -1.2246467991473532e-16);
-    MXTr3(re, im, 192, 193, 194);
-    MXTr3(re, im, 195, 196, 197);
-    MXTr3(re, im, 198, 199, 200);
-    MXTr3(re, im, 201, 202, 203);
-    MXTr4(re, im, 204, 207, 210, 213);
-    MXTr4(re, im, 205, 208, 211, 214);
-    MXTr4(re, im, 206, 209, 212, 215);
-    MXRot(re, im, 208, 0.8660254037844387, -0.49999999999999994);
-    MXRot(re, im, 209, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 211, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 212, -0.4999999999999998, -0.8660254037844387);
-    MXRot(re, im, 214, 6.123233995736766e-17, -1.0);
-    MXRot(re, im, 215, -1.0, -1.2246467991473532e-16);
-    MXTr3(re, im, 204, 205, 206);
-    MXTr3(re, im, 207, 208, 209);
-    MXTr3(re, im, 210, 211, 212);
-    MXTr3(re, im, 213, 214, 215);
-    MXTr4(re, im, 216, 219, 222, 225);
-    MXTr4(re, im, 217, 220, 223, 226);
-    MXTr4(re, im, 218, 221, 224, 227);
-    MXRot(re, im, 220, 0.8660254037844387, -0.49999999999999994);
-    MXRot(re, im, 221, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 223, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 224, -0.4999999999999998, -0.8660254037844387);
-    MXRot(re, im, 226, 6.123233995736766e-17, -1.0);
-    MXRot(re, im, 227, -1.0, -1.2246467991473532e-16);
-    MXTr3(re, im, 216, 217, 218);
-    MXTr3(re, im, 219, 220, 221);
-    MXTr3(re, im, 222, 223, 224);
-    MXTr3(re, im, 225, 226, 227);
-    MXTr4(re, im, 228, 231, 234, 237);
-    MXTr4(re, im, 229, 232, 235, 238);
-    MXTr4(re, im, 230, 233, 236, 239);
-    MXRot(re, im, 232, 0.8660254037844387, -0.49999999999999994);
-    MXRot(re, im, 233, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 235, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 236, -0.4999999999999998, -0.8660254037844387);
-    MXRot(re, im, 238, 6.123233995736766e-17, -1.0);
-    MXRot(re, im, 239, -1.0, -1.2246467991473532e-16);
-    MXTr3(re, im, 228, 229, 230);
-    MXTr3(re, im, 231, 232, 233);
-    MXTr3(re, im, 234, 235, 236);
-    MXTr3(re, im, 237, 238, 239);
-    MXCshft(re, im, CSHFT_INDEXES_0);
-    MXCshft(re, im, CSHFT_INDEXES_1);
-    MXCshft(re, im, CSHFT_INDEXES_2);
-    MXCshft(re, im, CSHFT_INDEXES_3);
-    MXCshft(re, im, CSHFT_INDEXES_4);
-    MXCshft(re, im, CSHFT_INDEXES_5);
-}
+//  Tables (and scratch buffers) of the compact kernel (see MXCompact() of
+//  the "fft-mx-baseop" module).
+const COMPACT_RADICES = new Int32Array([
+    4, 4, 3, 5
+]);
+const COMPACT_INDEXES = new Int32Array([
+    0, 60, 120, 180, 15, 75, 135, 195, 30, 90, 150, 210, 45, 105, 165, 225,
+    5, 65, 125, 185, 20, 80, 140, 200, 35, 95, 155, 215, 50, 110, 170, 230,
+    10, 70, 130, 190, 25, 85, 145, 205, 40, 100, 160, 220, 55, 115, 175,
+    235, 1, 61, 121, 181, 16, 76, 136, 196, 31, 91, 151, 211, 46, 106, 166,
+    226, 6, 66, 126, 186, 21, 81, 141, 201, 36, 96, 156, 216, 51, 111, 171,
+    231, 11, 71, 131, 191, 26, 86, 146, 206, 41, 101, 161, 221, 56, 116,
+    176, 236, 2, 62, 122, 182, 17, 77, 137, 197, 32, 92, 152, 212, 47, 107,
+    167, 227, 7, 67, 127, 187, 22, 82, 142, 202, 37, 97, 157, 217, 52, 112,
+    172, 232, 12, 72, 132, 192, 27, 87, 147, 207, 42, 102, 162, 222, 57,
+    117, 177, 237, 3, 63, 123, 183, 18, 78, 138, 198, 33, 93, 153, 213, 48,
+    108, 168, 228, 8, 68, 128, 188, 23, 83, 143, 203, 38, 98, 158, 218, 53,
+    113, 173, 233, 13, 73, 133, 193, 28, 88, 148, 208, 43, 103, 163, 223,
+    58, 118, 178, 238, 4, 64, 124, 184, 19, 79, 139, 199, 34, 94, 154, 214,
+    49, 109, 169, 229, 9, 69, 129, 189, 24, 84, 144, 204, 39, 99, 159, 219,
+    54, 114, 174, 234, 14, 74, 134, 194, 29, 89, 149, 209, 44, 104, 164,
+    224, 59, 119, 179, 239
+]);
+const COMPACT_TWIDDLES = new Float64Array([
+    1.0, 0.0, 1.0, 0.0, 1.0, 0.0, 1.0, 0.0, 1.0, 0.0, 1.0, 0.0,
+    0.9238795325112867, -0.3826834323650898, 0.7071067811865476,
+    -0.7071067811865475, 0.3826834323650898, -0.9238795325112867,
+    0.7071067811865476, -0.7071067811865475, -0.0, -1.0,
+    -0.7071067811865476, -0.7071067811865475, 0.3826834323650898,
+    -0.9238795325112867, -0.7071067811865476, -0.7071067811865475,
+    -0.9238795325112867, 0.3826834323650898, 1.0, 0.0, 1.0, 0.0,
+    0.9914448613738104, -0.13052619222005157, 0.9659258262890683,
+    -0.25881904510252074, 0.9659258262890683, -0.25881904510252074,
+    0.8660254037844387, -0.49999999999999994, 0.9238795325112867,
+    -0.3826834323650898, 0.7071067811865476, -0.7071067811865475,
+    0.8660254037844387, -0.49999999999999994, 0.49999999999999994,
+    -0.8660254037844387, 0.7933533402912352, -0.6087614290087207,
+    0.25881904510252074, -0.9659258262890683, 0.7071067811865476,
+    -0.7071067811865475, -0.0, -1.0, 0.6087614290087207,
+    -0.7933533402912352, -0.25881904510252074, -0.9659258262890683,
+    0.49999999999999994, -0.8660254037844387, -0.49999999999999994,
+    -0.8660254037844387, 0.3826834323650898, -0.9238795325112867,
+    -0.7071067811865476, -0.7071067811865475, 0.25881904510252074,
+    -0.9659258262890683, -0.8660254037844387, -0.49999999999999994,
+    0.13052619222005157, -0.9914448613738104, -0.9659258262890683,
+    -0.25881904510252074, -0.0, -1.0, -1.0, -0.0, -0.13052619222005157,
+    -0.9914448613738104, -0.9659258262890683, 0.25881904510252074,
+    -0.25881904510252074, -0.9659258262890683, -0.8660254037844387,
+    0.49999999999999994, -0.3826834323650898, -0.9238795325112867,
+    -0.7071067811865476, 0.7071067811865475, 1.0, 0.0, 1.0, 0.0, 1.0, 0.0,
+    1.0, 0.0, 0.9996573249755573, -0.02617694830787315, 0.9986295347545738,
+    -0.05233595624294383, 0.996917333733128, -0.07845909572784494,
+    0.9945218953682733, -0.10452846326765346, 0.9986295347545738,
+    -0.05233595624294383, 0.9945218953682733, -0.10452846326765346,
+    0.9876883405951378, -0.15643446504023087, 0.9781476007338057,
+    -0.20791169081775931, 0.996917333733128, -0.07845909572784494,
+    0.9876883405951378, -0.15643446504023087, 0.9723699203976766,
+    -0.2334453638559054, 0.9510565162951535, -0.3090169943749474,
+    0.9945218953682733, -0.10452846326765346, 0.9781476007338057,
+    -0.20791169081775931, 0.9510565162951535, -0.3090169943749474,
+    0.9135454576426009, -0.40673664307580015, 0.9914448613738104,
+    -0.13052619222005157, 0.9659258262890683, -0.25881904510252074,
+    0.9238795325112867, -0.3826834323650898, 0.8660254037844387,
+    -0.49999999999999994, 0.9876883405951378, -0.15643446504023087,
+    0.9510565162951535, -0.3090169943749474, 0.8910065241883679,
+    -0.45399049973954675, 0.8090169943749475, -0.5877852522924731,
+    0.9832549075639546, -0.18223552549214747, 0.9335804264972017,
+    -0.35836794954530027, 0.8526401643540922, -0.5224985647159488,
+    0.7431448254773942, -0.6691306063588582, 0.9781476007338057,
+    -0.20791169081775931, 0.9135454576426009, -0.40673664307580015,
+    0.8090169943749475, -0.5877852522924731, 0.6691306063588582,
+    -0.7431448254773942, 0.9723699203976766, -0.2334453638559054,
+    0.8910065241883679, -0.45399049973954675, 0.7604059656000309,
+    -0.6494480483301837, 0.5877852522924731, -0.8090169943749475,
+    0.9659258262890683, -0.25881904510252074, 0.8660254037844387,
+    -0.49999999999999994, 0.7071067811865476, -0.7071067811865475,
+    0.49999999999999994, -0.8660254037844387, 0.958819734868193,
+    -0.2840153447039226, 0.838670567945424, -0.544639035015027,
+    0.6494480483301837, -0.7604059656000309, 0.40673664307580015,
+    -0.9135454576426009, 0.9510565162951535, -0.3090169943749474,
+    0.8090169943749475, -0.5877852522924731, 0.5877852522924731,
+    -0.8090169943749475, 0.3090169943749474, -0.9510565162951535,
+    0.9426414910921784, -0.33380685923377096, 0.7771459614569709,
+    -0.6293203910498375, 0.5224985647159488, -0.8526401643540922,
+    0.20791169081775931, -0.9781476007338057, 0.9335804264972017,
+    -0.35836794954530027, 0.7431448254773942, -0.6691306063588582,
+    0.45399049973954675, -0.8910065241883679, 0.10452846326765346,
+    -0.9945218953682733, 0.9238795325112867, -0.3826834323650898,
+    0.7071067811865476, -0.7071067811865475, 0.3826834323650898,
+    -0.9238795325112867, -0.0, -1.0, 0.9135454576426009,
+    -0.40673664307580015, 0.6691306063588582, -0.7431448254773942,
+    0.3090169943749474, -0.9510565162951535, -0.10452846326765346,
+    -0.9945218953682733, 0.9025852843498606, -0.4305110968082951,
+    0.6293203910498375, -0.7771459614569709, 0.2334453638559054,
+    -0.9723699203976766, -0.20791169081775931, -0.9781476007338057,
+    0.8910065241883679, -0.45399049973954675, 0.5877852522924731,
+    -0.8090169943749475, 0.15643446504023087, -0.9876883405951378,
+    -0.3090169943749474, -0.9510565162951535, 0.8788171126619654,
+    -0.4771587602596084, 0.544639035015027, -0.838670567945424,
+    0.07845909572784494, -0.996917333733128, -0.40673664307580015,
+    -0.9135454576426009, 0.8660254037844387, -0.49999999999999994,
+    0.49999999999999994, -0.8660254037844387, -0.0, -1.0,
+    -0.49999999999999994, -0.8660254037844387, 0.8526401643540922,
+    -0.5224985647159488, 0.45399049973954675, -0.8910065241883679,
+    -0.07845909572784494, -0.996917333733128, -0.5877852522924731,
+    -0.8090169943749475, 0.838670567945424, -0.544639035015027,
+    0.40673664307580015, -0.9135454576426009, -0.15643446504023087,
+    -0.9876883405951378, -0.6691306063588582, -0.7431448254773942,
+    0.8241261886220156, -0.5664062369248328, 0.35836794954530027,
+    -0.9335804264972017, -0.2334453638559054, -0.9723699203976766,
+    -0.7431448254773942, -0.6691306063588582, 0.8090169943749475,
+    -0.5877852522924731, 0.3090169943749474, -0.9510565162951535,
+    -0.3090169943749474, -0.9510565162951535, -0.8090169943749475,
+    -0.5877852522924731, 0.7933533402912352, -0.6087614290087207,
+    0.25881904510252074, -0.9659258262890683, -0.3826834323650898,
+    -0.9238795325112867, -0.8660254037844387, -0.49999999999999994,
+    0.7771459614569709, -0.6293203910498375, 0.20791169081775931,
+    -0.9781476007338057, -0.45399049973954675, -0.8910065241883679,
+    -0.9135454576426009, -0.40673664307580015, 0.7604059656000309,
+    -0.6494480483301837, 0.15643446504023087, -0.9876883405951378,
+    -0.5224985647159488, -0.8526401643540922, -0.9510565162951535,
+    -0.3090169943749474, 0.7431448254773942, -0.6691306063588582,
+    0.10452846326765346, -0.9945218953682733, -0.5877852522924731,
+    -0.8090169943749475, -0.9781476007338057, -0.20791169081775931,
+    0.7253743710122876, -0.6883545756937539, 0.05233595624294383,
+    -0.9986295347545738, -0.6494480483301837, -0.7604059656000309,
+    -0.9945218953682733, -0.10452846326765346, 0.7071067811865476,
+    -0.7071067811865475, -0.0, -1.0, -0.7071067811865476,
+    -0.7071067811865475, -1.0, -0.0, 0.6883545756937539,
+    -0.7253743710122876, -0.05233595624294383, -0.9986295347545738,
+    -0.7604059656000309, -0.6494480483301837, -0.9945218953682733,
+    0.10452846326765346, 0.6691306063588582, -0.7431448254773942,
+    -0.10452846326765346, -0.9945218953682733, -0.8090169943749475,
+    -0.5877852522924731, -0.9781476007338057, 0.20791169081775931,
+    0.6494480483301837, -0.7604059656000309, -0.15643446504023087,
+    -0.9876883405951378, -0.8526401643540922, -0.5224985647159488,
+    -0.9510565162951535, 0.3090169943749474, 0.6293203910498375,
+    -0.7771459614569709, -0.20791169081775931, -0.9781476007338057,
+    -0.8910065241883679, -0.45399049973954675, -0.9135454576426009,
+    0.40673664307580015, 0.6087614290087207, -0.7933533402912352,
+    -0.25881904510252074, -0.9659258262890683, -0.9238795325112867,
+    -0.3826834323650898, -0.8660254037844387, 0.49999999999999994,
+    0.5877852522924731, -0.8090169943749475, -0.3090169943749474,
+    -0.9510565162951535, -0.9510565162951535, -0.3090169943749474,
+    -0.8090169943749475, 0.5877852522924731, 0.5664062369248328,
+    -0.8241261886220156, -0.35836794954530027, -0.9335804264972017,
+    -0.9723699203976766, -0.2334453638559054, -0.7431448254773942,
+    0.6691306063588582, 0.544639035015027, -0.838670567945424,
+    -0.40673664307580015, -0.9135454576426009, -0.9876883405951378,
+    -0.15643446504023087, -0.6691306063588582, 0.7431448254773942,
+    0.5224985647159488, -0.8526401643540922, -0.45399049973954675,
+    -0.8910065241883679, -0.996917333733128, -0.07845909572784494,
+    -0.5877852522924731, 0.8090169943749475, 0.49999999999999994,
+    -0.8660254037844387, -0.49999999999999994, -0.8660254037844387, -1.0,
+    -0.0, -0.49999999999999994, 0.8660254037844387, 0.4771587602596084,
+    -0.8788171126619654, -0.544639035015027, -0.838670567945424,
+    -0.996917333733128, 0.07845909572784494, -0.40673664307580015,
+    0.9135454576426009, 0.45399049973954675, -0.8910065241883679,
+    -0.5877852522924731, -0.8090169943749475, -0.9876883405951378,
+    0.15643446504023087, -0.3090169943749474, 0.9510565162951535,
+    0.4305110968082951, -0.9025852843498606, -0.6293203910498375,
+    -0.7771459614569709, -0.9723699203976766, 0.2334453638559054,
+    -0.20791169081775931, 0.9781476007338057, 0.40673664307580015,
+    -0.9135454576426009, -0.6691306063588582, -0.7431448254773942,
+    -0.9510565162951535, 0.3090169943749474, -0.10452846326765346,
+    0.9945218953682733, 0.3826834323650898, -0.9238795325112867,
+    -0.7071067811865476, -0.7071067811865475, -0.9238795325112867,
+    0.3826834323650898, 0.0, 1.0, 0.35836794954530027, -0.9335804264972017,
+    -0.7431448254773942, -0.6691306063588582, -0.8910065241883679,
+    0.45399049973954675, 0.10452846326765346, 0.9945218953682733,
+    0.33380685923377096, -0.9426414910921784, -0.7771459614569709,
+    -0.6293203910498375, -0.8526401643540922, 0.5224985647159488,
+    0.20791169081775931, 0.9781476007338057
+]);
+const COMPACT_SCRATCH_RE = new Float64Array(240);
+const COMPACT_SCRATCH_IM = new Float64Array(240);
 
 //
 //  Public functions.
@@ -809,6 +227,8 @@ function ApplyMixedRadixFFT_240_Part2(re, im) {
  * 
  *  Note(s):
  *    [1] The size of `re` and `im` will not be checked.
+ *    [2] The transform is done by the table-driven loop kernel (compact
+ *        mode), which is smaller but slower than the unrolled kernels.
  * 
  *  @param {Number[]} re 
  *    - The real part of each point.
@@ -816,8 +236,7 @@ function ApplyMixedRadixFFT_240_Part2(re, im) {
  *    - The imaginary part of each point.
  */
 function ApplyMixedRadixFFT_240(re, im) {
-    ApplyMixedRadixFFT_240_Part1(re, im);
-    ApplyMixedRadixFFT_240_Part2(re, im);
+    MXCompact(re, im, COMPACT_RADICES, COMPACT_INDEXES, COMPACT_TWIDDLES, COMPACT_SCRATCH_RE, COMPACT_SCRATCH_IM);
 }
 
 //  Export public APIs.
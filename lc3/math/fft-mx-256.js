@@ -0,0 +1,260 @@
+//
+//  Copyright 2021 - 2023 XiaoJSoft Studio. All rights reserved.
+//  Use of this source code is governed by a BSD-style license that can be
+//  found in the LICENSE.md file.
+//
+
+//
+//  Note(s):
+//    [1] This file is generated automatically by a FFT compiler, which locates 
+//        at "./../../dev/fft-mx-generator/" directory.
+//        Do NOT modify this file manually.
+//
+
+//
+//  Imports.
+//
+
+//  Imported modules.
+const Lc3FftMxBaseOp = 
+    require("./fft-mx-baseop");
+
+//  Imported functions.
+// const MXTr2 = 
+//     Lc3FftMxBaseOp.MXTr2;
+// const MXTr3 = 
+//     Lc3FftMxBaseOp.MXTr3;
+// const MXTr4 = 
+//     Lc3FftMxBaseOp.MXTr4;
+// const MXTr5 = 
+//     Lc3FftMxBaseOp.MXTr5;
+// const MXRot = 
+//     Lc3FftMxBaseOp.MXRot;
+// const MXSwap = 
+//     Lc3FftMxBaseOp.MXSwap;
+// const MXCshft = 
+//     Lc3FftMxBaseOp.MXCshft;
+const MXCompact = 
+    Lc3FftMxBaseOp.MXCompact;
+
+//
+//  Constants.
+//
+
+//  Tables (and scratch buffers) of the compact kernel (see MXCompact() of
+//  the "fft-mx-baseop" module).
+const COMPACT_RADICES = new Int32Array([
+    4, 4, 4, 4
+]);
+const COMPACT_INDEXES = new Int32Array([
+    0, 64, 128, 192, 16, 80, 144, 208, 32, 96, 160, 224, 48, 112, 176, 240,
+    4, 68, 132, 196, 20, 84, 148, 212, 36, 100, 164, 228, 52, 116, 180, 244,
+    8, 72, 136, 200, 24, 88, 152, 216, 40, 104, 168, 232, 56, 120, 184, 248,
+    12, 76, 140, 204, 28, 92, 156, 220, 44, 108, 172, 236, 60, 124, 188,
+    252, 1, 65, 129, 193, 17, 81, 145, 209, 33, 97, 161, 225, 49, 113, 177,
+    241, 5, 69, 133, 197, 21, 85, 149, 213, 37, 101, 165, 229, 53, 117, 181,
+    245, 9, 73, 137, 201, 25, 89, 153, 217, 41, 105, 169, 233, 57, 121, 185,
+    249, 13, 77, 141, 205, 29, 93, 157, 221, 45, 109, 173, 237, 61, 125,
+    189, 253, 2, 66, 130, 194, 18, 82, 146, 210, 34, 98, 162, 226, 50, 114,
+    178, 242, 6, 70, 134, 198, 22, 86, 150, 214, 38, 102, 166, 230, 54, 118,
+    182, 246, 10, 74, 138, 202, 26, 90, 154, 218, 42, 106, 170, 234, 58,
+    122, 186, 250, 14, 78, 142, 206, 30, 94, 158, 222, 46, 110, 174, 238,
+    62, 126, 190, 254, 3, 67, 131, 195, 19, 83, 147, 211, 35, 99, 163, 227,
+    51, 115, 179, 243, 7, 71, 135, 199, 23, 87, 151, 215, 39, 103, 167, 231,
+    55, 119, 183, 247, 11, 75, 139, 203, 27, 91, 155, 219, 43, 107, 171,
+    235, 59, 123, 187, 251, 15, 79, 143, 207, 31, 95, 159, 223, 47, 111,
+    175, 239, 63, 127, 191, 255
+]);
+const COMPACT_TWIDDLES = new Float64Array([
+    1.0, 0.0, 1.0, 0.0, 1.0, 0.0, 1.0, 0.0, 1.0, 0.0, 1.0, 0.0,
+    0.9238795325112867, -0.3826834323650898, 0.7071067811865476,
+    -0.7071067811865475, 0.3826834323650898, -0.9238795325112867,
+    0.7071067811865476, -0.7071067811865475, -0.0, -1.0,
+    -0.7071067811865476, -0.7071067811865475, 0.3826834323650898,
+    -0.9238795325112867, -0.7071067811865476, -0.7071067811865475,
+    -0.9238795325112867, 0.3826834323650898, 1.0, 0.0, 1.0, 0.0, 1.0, 0.0,
+    0.9951847266721969, -0.0980171403295606, 0.9807852804032304,
+    -0.19509032201612825, 0.9569403357322088, -0.29028467725446233,
+    0.9807852804032304, -0.19509032201612825, 0.9238795325112867,
+    -0.3826834323650898, 0.8314696123025452, -0.5555702330196022,
+    0.9569403357322088, -0.29028467725446233, 0.8314696123025452,
+    -0.5555702330196022, 0.6343932841636455, -0.773010453362737,
+    0.9238795325112867, -0.3826834323650898, 0.7071067811865476,
+    -0.7071067811865475, 0.3826834323650898, -0.9238795325112867,
+    0.881921264348355, -0.47139673682599764, 0.5555702330196022,
+    -0.8314696123025452, 0.0980171403295606, -0.9951847266721969,
+    0.8314696123025452, -0.5555702330196022, 0.3826834323650898,
+    -0.9238795325112867, -0.19509032201612825, -0.9807852804032304,
+    0.773010453362737, -0.6343932841636455, 0.19509032201612825,
+    -0.9807852804032304, -0.47139673682599764, -0.881921264348355,
+    0.7071067811865476, -0.7071067811865475, -0.0, -1.0,
+    -0.7071067811865476, -0.7071067811865475, 0.6343932841636455,
+    -0.773010453362737, -0.19509032201612825, -0.9807852804032304,
+    -0.881921264348355, -0.47139673682599764, 0.5555702330196022,
+    -0.8314696123025452, -0.3826834323650898, -0.9238795325112867,
+    -0.9807852804032304, -0.19509032201612825, 0.47139673682599764,
+    -0.881921264348355, -0.5555702330196022, -0.8314696123025452,
+    -0.9951847266721969, 0.0980171403295606, 0.3826834323650898,
+    -0.9238795325112867, -0.7071067811865476, -0.7071067811865475,
+    -0.9238795325112867, 0.3826834323650898, 0.29028467725446233,
+    -0.9569403357322088, -0.8314696123025452, -0.5555702330196022,
+    -0.773010453362737, 0.6343932841636455, 0.19509032201612825,
+    -0.9807852804032304, -0.9238795325112867, -0.3826834323650898,
+    -0.5555702330196022, 0.8314696123025452, 0.0980171403295606,
+    -0.9951847266721969, -0.9807852804032304, -0.19509032201612825,
+    -0.29028467725446233, 0.9569403357322088, 1.0, 0.0, 1.0, 0.0, 1.0, 0.0,
+    0.9996988186962042, -0.024541228522912288, 0.9987954562051724,
+    -0.049067674327418015, 0.9972904566786902, -0.07356456359966743,
+    0.9987954562051724, -0.049067674327418015, 0.9951847266721969,
+    -0.0980171403295606, 0.989176509964781, -0.14673047445536175,
+    0.9972904566786902, -0.07356456359966743, 0.989176509964781,
+    -0.14673047445536175, 0.9757021300385286, -0.2191012401568698,
+    0.9951847266721969, -0.0980171403295606, 0.9807852804032304,
+    -0.19509032201612825, 0.9569403357322088, -0.29028467725446233,
+    0.99247953459871, -0.1224106751992162, 0.970031253194544,
+    -0.24298017990326387, 0.932992798834739, -0.3598950365349881,
+    0.989176509964781, -0.14673047445536175, 0.9569403357322088,
+    -0.29028467725446233, 0.9039892931234433, -0.4275550934302821,
+    0.9852776423889412, -0.17096188876030122, 0.9415440651830208,
+    -0.33688985339222005, 0.8700869911087115, -0.49289819222978404,
+    0.9807852804032304, -0.19509032201612825, 0.9238795325112867,
+    -0.3826834323650898, 0.8314696123025452, -0.5555702330196022,
+    0.9757021300385286, -0.2191012401568698, 0.9039892931234433,
+    -0.4275550934302821, 0.7883464276266063, -0.6152315905806268,
+    0.970031253194544, -0.24298017990326387, 0.881921264348355,
+    -0.47139673682599764, 0.7409511253549591, -0.6715589548470183,
+    0.9637760657954398, -0.26671275747489837, 0.8577286100002721,
+    -0.5141027441932217, 0.6895405447370668, -0.724247082951467,
+    0.9569403357322088, -0.29028467725446233, 0.8314696123025452,
+    -0.5555702330196022, 0.6343932841636455, -0.773010453362737,
+    0.9495281805930367, -0.3136817403988915, 0.8032075314806449,
+    -0.5956993044924334, 0.5758081914178453, -0.8175848131515837,
+    0.9415440651830208, -0.33688985339222005, 0.773010453362737,
+    -0.6343932841636455, 0.5141027441932217, -0.8577286100002721,
+    0.932992798834739, -0.3598950365349881, 0.7409511253549591,
+    -0.6715589548470183, 0.44961132965460654, -0.8932243011955153,
+    0.9238795325112867, -0.3826834323650898, 0.7071067811865476,
+    -0.7071067811865475, 0.3826834323650898, -0.9238795325112867,
+    0.9142097557035307, -0.40524131400498986, 0.6715589548470183,
+    -0.7409511253549591, 0.3136817403988915, -0.9495281805930367,
+    0.9039892931234433, -0.4275550934302821, 0.6343932841636455,
+    -0.773010453362737, 0.24298017990326387, -0.970031253194544,
+    0.8932243011955153, -0.44961132965460654, 0.5956993044924334,
+    -0.8032075314806449, 0.17096188876030122, -0.9852776423889412,
+    0.881921264348355, -0.47139673682599764, 0.5555702330196022,
+    -0.8314696123025452, 0.0980171403295606, -0.9951847266721969,
+    0.8700869911087115, -0.49289819222978404, 0.5141027441932217,
+    -0.8577286100002721, 0.024541228522912288, -0.9996988186962042,
+    0.8577286100002721, -0.5141027441932217, 0.47139673682599764,
+    -0.881921264348355, -0.049067674327418015, -0.9987954562051724,
+    0.8448535652497071, -0.5349976198870972, 0.4275550934302821,
+    -0.9039892931234433, -0.1224106751992162, -0.99247953459871,
+    0.8314696123025452, -0.5555702330196022, 0.3826834323650898,
+    -0.9238795325112867, -0.19509032201612825, -0.9807852804032304,
+    0.8175848131515837, -0.5758081914178453, 0.33688985339222005,
+    -0.9415440651830208, -0.26671275747489837, -0.9637760657954398,
+    0.8032075314806449, -0.5956993044924334, 0.29028467725446233,
+    -0.9569403357322088, -0.33688985339222005, -0.9415440651830208,
+    0.7883464276266063, -0.6152315905806268, 0.24298017990326387,
+    -0.970031253194544, -0.40524131400498986, -0.9142097557035307,
+    0.773010453362737, -0.6343932841636455, 0.19509032201612825,
+    -0.9807852804032304, -0.47139673682599764, -0.881921264348355,
+    0.7572088465064846, -0.6531728429537768, 0.14673047445536175,
+    -0.989176509964781, -0.5349976198870972, -0.8448535652497071,
+    0.7409511253549591, -0.6715589548470183, 0.0980171403295606,
+    -0.9951847266721969, -0.5956993044924334, -0.8032075314806449,
+    0.724247082951467, -0.6895405447370668, 0.049067674327418015,
+    -0.9987954562051724, -0.6531728429537768, -0.7572088465064846,
+    0.7071067811865476, -0.7071067811865475, -0.0, -1.0,
+    -0.7071067811865476, -0.7071067811865475, 0.6895405447370668,
+    -0.724247082951467, -0.049067674327418015, -0.9987954562051724,
+    -0.7572088465064846, -0.6531728429537768, 0.6715589548470183,
+    -0.7409511253549591, -0.0980171403295606, -0.9951847266721969,
+    -0.8032075314806449, -0.5956993044924334, 0.6531728429537768,
+    -0.7572088465064846, -0.14673047445536175, -0.989176509964781,
+    -0.8448535652497071, -0.5349976198870972, 0.6343932841636455,
+    -0.773010453362737, -0.19509032201612825, -0.9807852804032304,
+    -0.881921264348355, -0.47139673682599764, 0.6152315905806268,
+    -0.7883464276266063, -0.24298017990326387, -0.970031253194544,
+    -0.9142097557035307, -0.40524131400498986, 0.5956993044924334,
+    -0.8032075314806449, -0.29028467725446233, -0.9569403357322088,
+    -0.9415440651830208, -0.33688985339222005, 0.5758081914178453,
+    -0.8175848131515837, -0.33688985339222005, -0.9415440651830208,
+    -0.9637760657954398, -0.26671275747489837, 0.5555702330196022,
+    -0.8314696123025452, -0.3826834323650898, -0.9238795325112867,
+    -0.9807852804032304, -0.19509032201612825, 0.5349976198870972,
+    -0.8448535652497071, -0.4275550934302821, -0.9039892931234433,
+    -0.99247953459871, -0.1224106751992162, 0.5141027441932217,
+    -0.8577286100002721, -0.47139673682599764, -0.881921264348355,
+    -0.9987954562051724, -0.049067674327418015, 0.49289819222978404,
+    -0.8700869911087115, -0.5141027441932217, -0.8577286100002721,
+    -0.9996988186962042, 0.024541228522912288, 0.47139673682599764,
+    -0.881921264348355, -0.5555702330196022, -0.8314696123025452,
+    -0.9951847266721969, 0.0980171403295606, 0.44961132965460654,
+    -0.8932243011955153, -0.5956993044924334, -0.8032075314806449,
+    -0.9852776423889412, 0.17096188876030122, 0.4275550934302821,
+    -0.9039892931234433, -0.6343932841636455, -0.773010453362737,
+    -0.970031253194544, 0.24298017990326387, 0.40524131400498986,
+    -0.9142097557035307, -0.6715589548470183, -0.7409511253549591,
+    -0.9495281805930367, 0.3136817403988915, 0.3826834323650898,
+    -0.9238795325112867, -0.7071067811865476, -0.7071067811865475,
+    -0.9238795325112867, 0.3826834323650898, 0.3598950365349881,
+    -0.932992798834739, -0.7409511253549591, -0.6715589548470183,
+    -0.8932243011955153, 0.44961132965460654, 0.33688985339222005,
+    -0.9415440651830208, -0.773010453362737, -0.6343932841636455,
+    -0.8577286100002721, 0.5141027441932217, 0.3136817403988915,
+    -0.9495281805930367, -0.8032075314806449, -0.5956993044924334,
+    -0.8175848131515837, 0.5758081914178453, 0.29028467725446233,
+    -0.9569403357322088, -0.8314696123025452, -0.5555702330196022,
+    -0.773010453362737, 0.6343932841636455, 0.26671275747489837,
+    -0.9637760657954398, -0.8577286100002721, -0.5141027441932217,
+    -0.724247082951467, 0.6895405447370668, 0.24298017990326387,
+    -0.970031253194544, -0.881921264348355, -0.47139673682599764,
+    -0.6715589548470183, 0.7409511253549591, 0.2191012401568698,
+    -0.9757021300385286, -0.9039892931234433, -0.4275550934302821,
+    -0.6152315905806268, 0.7883464276266063, 0.19509032201612825,
+    -0.9807852804032304, -0.9238795325112867, -0.3826834323650898,
+    -0.5555702330196022, 0.8314696123025452, 0.17096188876030122,
+    -0.9852776423889412, -0.9415440651830208, -0.33688985339222005,
+    -0.49289819222978404, 0.8700869911087115, 0.14673047445536175,
+    -0.989176509964781, -0.9569403357322088, -0.29028467725446233,
+    -0.4275550934302821, 0.9039892931234433, 0.1224106751992162,
+    -0.99247953459871, -0.970031253194544, -0.24298017990326387,
+    -0.3598950365349881, 0.932992798834739, 0.0980171403295606,
+    -0.9951847266721969, -0.9807852804032304, -0.19509032201612825,
+    -0.29028467725446233, 0.9569403357322088, 0.07356456359966743,
+    -0.9972904566786902, -0.989176509964781, -0.14673047445536175,
+    -0.2191012401568698, 0.9757021300385286, 0.049067674327418015,
+    -0.9987954562051724, -0.9951847266721969, -0.0980171403295606,
+    -0.14673047445536175, 0.989176509964781, 0.024541228522912288,
+    -0.9996988186962042, -0.9987954562051724, -0.049067674327418015,
+    -0.07356456359966743, 0.9972904566786902
+]);
+const COMPACT_SCRATCH_RE = new Float64Array(256);
+const COMPACT_SCRATCH_IM = new Float64Array(256);
+
+//
+//  Public functions.
+//
+
+/**
+ *  Apply in-place mixed-radix FFT transform (prebuilt for block size 256).
+ * 
+ *  Note(s):
+ *    [1] The size of `re` and `im` will not be checked.
+ *    [2] The transform is done by the table-driven loop kernel (compact
+ *        mode), which is smaller but slower than the unrolled kernels.
+ * 
+ *  @param {Number[]} re 
+ *    - The real part of each point.
+ *  @param {Number[]} im 
+ *    - The imaginary part of each point.
+ */
+function ApplyMixedRadixFFT_256(re, im) {
+    MXCompact(re, im, COMPACT_RADICES, COMPACT_INDEXES, COMPACT_TWIDDLES, COMPACT_SCRATCH_RE, COMPACT_SCRATCH_IM);
+}
+
+//  Export public APIs.
+module.exports = {
+    "ApplyMixedRadixFFT_256": ApplyMixedRadixFFT_256
+};
\ No newline at end of file
@@ -24,1025 +24,259 @@ const Lc3FftMxBaseOp =
 //     Lc3FftMxBaseOp.MXTr2;
 // const MXTr3 = 
 //     Lc3FftMxBaseOp.MXTr3;
-const MXTr4 = 
-    Lc3FftMxBaseOp.MXTr4;
-const MXTr5 = 
-    Lc3FftMxBaseOp.MXTr5;
-const MXRot = 
-    Lc3FftMxBaseOp.MXRot;
+// const MXTr4 = 
+//     Lc3FftMxBaseOp.MXTr4;
+// const MXTr5 = 
+//     Lc3FftMxBaseOp.MXTr5;
+// const MXRot = 
+//     Lc3FftMxBaseOp.MXRot;
 // const MXSwap = 
 //     Lc3FftMxBaseOp.MXSwap;
-const MXCshft = 
-    Lc3FftMxBaseOp.MXCshft;
+// const MXCshft = 
+//     Lc3FftMxBaseOp.MXCshft;
+const MXCompact = 
+    Lc3FftMxBaseOp.MXCompact;
 
 //
 //  Constants.
 //
 
-//  Cyclic shift indexes.
-const CSHFT_INDEXES_0 = [1, 64, 268, 215, 58, 248, 211, 106, 85, 17, 176, 114, 293, 235, 62, 140, 13, 224, 270, 39, 308, 223, 206, 90, 33, 228, 222, 142, 141, 77, 188, 214, 298, 251, 99, 305, 31, 100, 5, 16, 112, 165, 18, 240, 3, 192, 166, 82, 129, 281, 75, 60, 12, 160, 2, 128, 217, 186, 86, 81, 65, 28, 212, 170, 34, 292, 171, 98, 241, 67, 156, 125, 25, 20, 4, 256, 115, 53, 232, 174, 290, 43, 200, 10, 32, 164, 258, 243, 195, 54, 296, 123, 201, 74, 300, 15, 48, 216, 122, 137, 185, 22, 132, 169, 274, 295, 59, 312, 175, 50, 40, 8, 208, 218, 250, 35, 52, 168, 210, 42, 136, 121, 73, 236, 126, 89, 273, 231, 110, 37, 180, 6, 80];
-const CSHFT_INDEXES_1 = [7, 144, 269, 279, 311, 111, 101, 69, 284, 267, 151, 109, 277, 183, 198, 246, 83, 193, 230, 46, 88, 209, 282, 139, 313, 239, 318, 255, 51, 104, 261, 71, 108, 213, 234, 302, 143, 205, 26, 84, 257, 179, 306, 95, 49, 280, 11, 96, 113, 229, 286, 91, 97, 177, 178, 242, 131, 105, 21, 68, 220, 14, 288, 219, 314, 303, 207, 154, 301, 79, 316, 127, 153, 237, 190, 38, 244, 259, 307, 159, 317, 191, 102, 133, 233, 238, 254, 291, 107, 149, 285, 27, 148, 221, 78, 252, 163, 194, 294, 299, 315, 63, 204, 266, 87, 145, 29, 276, 119, 309, 287, 155, 61, 76, 124, 265, 23, 196, 118, 245, 19, 304, 271, 103, 197, 182, 134, 297, 187, 150, 45, 24, 260];
-const CSHFT_INDEXES_2 = [9, 272, 167, 146, 93, 225, 30, 36, 116, 117, 181, 70, 44, 264, 263, 199, 310, 47, 152, 173, 226, 94, 289, 283, 203, 202, 138, 249, 275, 55, 56, 120];
-const CSHFT_INDEXES_3 = [41, 72, 172, 162, 130];
-const CSHFT_INDEXES_4 = [57, 184, 262, 135];
-const CSHFT_INDEXES_5 = [66, 92, 161];
-const CSHFT_INDEXES_6 = [147, 157, 189, 278, 247];
-const CSHFT_INDEXES_7 = [158, 253, 227];
-
-//
-//  Private functions.
-//
-
-/**
- *  Part 1 of ApplyMixedRadixFFT_320().
- * 
- *  @param {Number[]} re 
- *    - The real part of each point.
- *  @param {Number[]} im 
- *    - The imaginary part of each point.
- */
-function ApplyMixedRadixFFT_320_Part1(re, im) {
-    MXTr5(re, im, 0, 64, 128, 192, 256);
-    MXTr5(re, im, 1, 65, 129, 193, 257);
-    MXTr5(re, im, 2, 66, 130, 194, 258);
-    MXTr5(re, im, 3, 67, 131, 195, 259);
-    MXTr5(re, im, 4, 68, 132, 196, 260);
-    MXTr5(re, im, 5, 69, 133, 197, 261);
-    MXTr5(re, im, 6, 70, 134, 198, 262);
-    MXTr5(re, im, 7, 71, 135, 199, 263);
-    MXTr5(re, im, 8, 72, 136, 200, 264);
-    MXTr5(re, im, 9, 73, 137, 201, 265);
-    MXTr5(re, im, 10, 74, 138, 202, 266);
-    MXTr5(re, im, 11, 75, 139, 203, 267);
-    MXTr5(re, im, 12, 76, 140, 204, 268);
-    MXTr5(re, im, 13, 77, 141, 205, 269);
-    MXTr5(re, im, 14, 78, 142, 206, 270);
-    MXTr5(re, im, 15, 79, 143, 207, 271);
-    MXTr5(re, im, 16, 80, 144, 208, 272);
-    MXTr5(re, im, 17, 81, 145, 209, 273);
-    MXTr5(re, im, 18, 82, 146, 210, 274);
-    MXTr5(re, im, 19, 83, 147, 211, 275);
-    MXTr5(re, im, 20, 84, 148, 212, 276);
-    MXTr5(re, im, 21, 85, 149, 213, 277);
-    MXTr5(re, im, 22, 86, 150, 214, 278);
-    MXTr5(re, im, 23, 87, 151, 215, 279);
-    MXTr5(re, im, 24, 88, 152, 216, 280);
-    MXTr5(re, im, 25, 89, 153, 217, 281);
-    MXTr5(re, im, 26, 90, 154, 218, 282);
-    MXTr5(re, im, 27, 91, 155, 219, 283);
-    MXTr5(re, im, 28, 92, 156, 220, 284);
-    MXTr5(re, im, 29, 93, 157, 221, 285);
-    MXTr5(re, im, 30, 94, 158, 222, 286);
-    MXTr5(re, im, 31, 95, 159, 223, 287);
-    MXTr5(re, im, 32, 96, 160, 224, 288);
-    MXTr5(re, im, 33, 97, 161, 225, 289);
-    MXTr5(re, im, 34, 98, 162, 226, 290);
-    MXTr5(re, im, 35, 99, 163, 227, 291);
-    MXTr5(re, im, 36, 100, 164, 228, 292);
-    MXTr5(re, im, 37, 101, 165, 229, 293);
-    MXTr5(re, im, 38, 102, 166, 230, 294);
-    MXTr5(re, im, 39, 103, 167, 231, 295);
-    MXTr5(re, im, 40, 104, 168, 232, 296);
-    MXTr5(re, im, 41, 105, 169, 233, 297);
-    MXTr5(re, im, 42, 106, 170, 234, 298);
-    MXTr5(re, im, 43, 107, 171, 235, 299);
-    MXTr5(re, im, 44, 108, 172, 236, 300);
-    MXTr5(re, im, 45, 109, 173, 237, 301);
-    MXTr5(re, im, 46, 110, 174, 238, 302);
-    MXTr5(re, im, 47, 111, 175, 239, 303);
-    MXTr5(re, im, 48, 112, 176, 240, 304);
-    MXTr5(re, im, 49, 113, 177, 241, 305);
-    MXTr5(re, im, 50, 114, 178, 242, 306);
-    MXTr5(re, im, 51, 115, 179, 243, 307);
-    MXTr5(re, im, 52, 116, 180, 244, 308);
-    MXTr5(re, im, 53, 117, 181, 245, 309);
-    MXTr5(re, im, 54, 118, 182, 246, 310);
-    MXTr5(re, im, 55, 119, 183, 247, 311);
-    MXTr5(re, im, 56, 120, 184, 248, 312);
-    MXTr5(re, im, 57, 121, 185, 249, 313);
-    MXTr5(re, im, 58, 122, 186, 250, 314);
-    MXTr5(re, im, 59, 123, 187, 251, 315);
-    MXTr5(re, im, 60, 124, 188, 252, 316);
-    MXTr5(re, im, 61, 125, 189, 253, 317);
-    MXTr5(re, im, 62, 126, 190, 254, 318);
-    MXTr5(re, im, 63, 127, 191, 255, 319);
-    MXRot(re, im, 65, 0.9998072404820648, -0.0196336924606283);
-    MXRot(re, im, 66, 0.9992290362407229, -0.03925981575906861);
-    MXRot(re, im, 67, 0.9982656101847159, -0.05887080365118903);
-    MXRot(re, im, 68, 0.996917333733128, -0.07845909572784494);
-    MXRot(re, im, 69, 0.9951847266721969, -0.0980171403295606);
-    MXRot(re, im, 70, 0.9930684569549263, -0.11753739745783764);
-    MXRot(re, im, 71, 0.9905693404435773, -0.13701234168196802);
-    MXRot(re, im, 72, 0.9876883405951378, -0.15643446504023087);
-    MXRot(re, im, 73, 0.9844265680898916, -0.1757962799343545);
-    MXRot(re, im, 74, 0.9807852804032304, -0.19509032201612825);
-    MXRot(re, im, 75, 0.9767658813208724, -0.21430915306505074);
-    MXRot(re, im, 76, 0.9723699203976766, -0.2334453638559054);
-    MXRot(re, im, 77, 0.9675990923602598, -0.25249157701515795);
-    MXRot(re, im, 78, 0.9624552364536473, -0.27144044986507426);
-    MXRot(re, im, 79, 0.9569403357322088, -0.29028467725446233);
-    MXRot(re, im, 80, 0.9510565162951535, -0.3090169943749474);
-    MXRot(re, im, 81, 0.944806046466878, -0.3276301795616935);
-    MXRot(re, im, 82, 0.9381913359224842, -0.34611705707749296);
-    MXRot(re, im, 83, 0.9312149347588036, -0.36447049987914965);
-    MXRot(re, im, 84, 0.9238795325112867, -0.3826834323650898);
-    MXRot(re, im, 85, 0.916187957117136, -0.40074883310314097);
-    MXRot(re, im, 86, 0.9081431738250813, -0.4186597375374281);
-    MXRot(re, im, 87, 0.8997482840522215, -0.4364092406733421);
-    MXRot(re, im, 88, 0.8910065241883679, -0.45399049973954675);
-    MXRot(re, im, 89, 0.881921264348355, -0.47139673682599764);
-    MXRot(re, im, 90, 0.8724960070727972, -0.4886212414969549);
-    MXRot(re, im, 91, 0.8627343859777918, -0.5056573733779846);
-    MXRot(re, im, 92, 0.8526401643540922, -0.5224985647159488);
-    MXRot(re, im, 93, 0.8422172337162865, -0.5391383229110002);
-    MXRot(re, im, 94, 0.8314696123025452, -0.5555702330196022);
-    MXRot(re, im, 95, 0.8204014435255136, -0.5717879602276122);
-    MXRot(re, im, 96, 0.8090169943749475, -0.5877852522924731);
-    MXRot(re, im, 97, 0.7973206537727071, -0.6035559419535714);
-    MXRot(re, im, 98, 0.785316930880745, -0.619093949309834);
-    MXRot(re, im, 99, 0.773010453362737, -0.6343932841636455);
-    MXRot(re, im, 100, 0.7604059656000309, -0.6494480483301837);
-    MXRot(re, im, 101, 0.7475083268625968, -0.6642524379112817);
-    MXRot(re, im, 102, 0.7343225094356856, -0.6788007455329417);
-    MXRot(re, im, 103, 0.7208535967029188, -0.6930873625456359);
-    MXRot(re, im, 104, 0.7071067811865476, -0.7071067811865475);
-    MXRot(re, im, 105, 0.6930873625456359, -0.7208535967029188);
-    MXRot(re, im, 106, 0.6788007455329418, -0.7343225094356856);
-    MXRot(re, im, 107, 0.6642524379112817, -0.7475083268625967);
-    MXRot(re, im, 108, 0.6494480483301837, -0.7604059656000309);
-    MXRot(re, im, 109, 0.6343932841636455, -0.773010453362737);
-    MXRot(re, im, 110, 0.619093949309834, -0.785316930880745);
-    MXRot(re, im, 111, 0.6035559419535714, -0.7973206537727071);
-    MXRot(re, im, 112, 0.5877852522924731, -0.8090169943749475);
-    MXRot(re, im, 113, 0.5717879602276122, -0.8204014435255136);
-    MXRot(re, im, 114, 0.5555702330196023, -0.8314696123025452);
-    MXRot(re, im, 115, 0.5391383229110004, -0.8422172337162864);
-    MXRot(re, im, 116, 0.5224985647159489, -0.8526401643540922);
-    MXRot(re, im, 117, 0.5056573733779846, -0.8627343859777918);
-    MXRot(re, im, 118, 0.48862124149695496, -0.8724960070727971);
-    MXRot(re, im, 119, 0.4713967368259978, -0.8819212643483549);
-    MXRot(re, im, 120, 0.4539904997395468, -0.8910065241883678);
-    MXRot(re, im, 121, 0.436409240673342, -0.8997482840522215);
-    MXRot(re, im, 122, 0.41865973753742813, -0.9081431738250813);
-    MXRot(re, im, 123, 0.4007488331031411, -0.9161879571171359);
-    MXRot(re, im, 124, 0.38268343236508984, -0.9238795325112867);
-    MXRot(re, im, 125, 0.3644704998791496, -0.9312149347588036);
-    MXRot(re, im, 126, 0.346117057077493, -0.9381913359224842);
-    MXRot(re, im, 127, 0.32763017956169366, -0.9448060464668779);
-    MXRot(re, im, 129, 0.9992290362407229, -0.03925981575906861);
-    MXRot(re, im, 130, 0.996917333733128, -0.07845909572784494);
-    MXRot(re, im, 131, 0.9930684569549263, -0.11753739745783764);
-    MXRot(re, im, 132, 0.9876883405951378, -0.15643446504023087);
-    MXRot(re, im, 133, 0.9807852804032304, -0.19509032201612825);
-    MXRot(re, im, 134, 0.9723699203976766, -0.2334453638559054);
-    MXRot(re, im, 135, 0.9624552364536473, -0.27144044986507426);
-    MXRot(re, im, 136, 0.9510565162951535, -0.3090169943749474);
-    MXRot(re, im, 137, 0.9381913359224842, -0.34611705707749296);
-    MXRot(re, im, 138, 0.9238795325112867, -0.3826834323650898);
-    MXRot(re, im, 139, 0.9081431738250813, -0.4186597375374281);
-    MXRot(re, im, 140, 0.8910065241883679, -0.45399049973954675);
-    MXRot(re, im, 141, 0.8724960070727972, -0.4886212414969549);
-    MXRot(re, im, 142, 0.8526401643540922, -0.5224985647159488);
-    MXRot(re, im, 143, 0.8314696123025452, -0.5555702330196022);
-    MXRot(re, im, 144, 0.8090169943749475, -0.5877852522924731);
-    MXRot(re, im, 145, 0.785316930880745, -0.619093949309834);
-    MXRot(re, im, 146, 0.7604059656000309, -0.6494480483301837);
-    MXRot(re, im, 147, 0.7343225094356856, -0.6788007455329417);
-    MXRot(re, im, 148, 0.7071067811865476, -0.7071067811865475);
-    MXRot(re, im, 149, 0.6788007455329418, -0.7343225094356856);
-    MXRot(re, im, 150, 0.6494480483301837, -0.7604059656000309);
-    MXRot(re, im, 151, 0.619093949309834, -0.785316930880745);
-    MXRot(re, im, 152, 0.5877852522924731, -0.8090169943749475);
-    MXRot(re, im, 153, 0.5555702330196023, -0.8314696123025452);
-    MXRot(re, im, 154, 0.5224985647159489, -0.8526401643540922);
-    MXRot(re, im, 155, 0.48862124149695496, -0.8724960070727971);
-    MXRot(re, im, 156, 0.4539904997395468, -0.8910065241883678);
-    MXRot(re, im, 157, 0.41865973753742813, -0.9081431738250813);
-    MXRot(re, im, 158, 0.38268343236508984, -0.9238795325112867);
-    MXRot(re, im, 159, 0.346117057077493, -0.9381913359224842);
-    MXRot(re, im, 160, 0.30901699437494745, -0.9510565162951535);
-    MXRot(re, im, 161, 0.2714404498650743, -0.9624552364536473);
-    MXRot(re, im, 162, 0.23344536385590547, -0.9723699203976766);
-    MXRot(re, im, 163, 0.19509032201612833, -0.9807852804032304);
-    MXRot(re, im, 164, 0.15643446504023092, -0.9876883405951378);
-    MXRot(re, im, 165, 0.1175373974578377, -0.9930684569549263);
-    MXRot(re, im, 166, 0.078459095727845, -0.996917333733128);
-    MXRot(re, im, 167, 0.039259815759068666, -0.9992290362407229);
-    MXRot(re, im, 168, 6.123233995736766e-17, -1.0);
-    MXRot(re, im, 169, -0.03925981575906855, -0.9992290362407229);
-    MXRot(re, im, 170, -0.07845909572784487, -0.996917333733128);
-    MXRot(re, im, 171, -0.11753739745783758, -0.9930684569549263);
-    MXRot(re, im, 172, -0.1564344650402308, -0.9876883405951378);
-    MXRot(re, im, 173, -0.1950903220161282, -0.9807852804032304);
-    MXRot(re, im, 174, -0.23344536385590534, -0.9723699203976767);
-    MXRot(re, im, 175, -0.2714404498650742, -0.9624552364536473);
-    MXRot(re, im, 176, -0.30901699437494734, -0.9510565162951536);
-    MXRot(re, im, 177, -0.3461170570774929, -0.9381913359224842);
-    MXRot(re, im, 178, -0.3826834323650897, -0.9238795325112867);
-    MXRot(re, im, 179, -0.4186597375374278, -0.9081431738250815);
-    MXRot(re, im, 180, -0.4539904997395467, -0.8910065241883679);
-    MXRot(re, im, 181, -0.48862124149695507, -0.8724960070727971);
-    MXRot(re, im, 182, -0.5224985647159488, -0.8526401643540923);
-    MXRot(re, im, 183, -0.555570233019602, -0.8314696123025455);
-    MXRot(re, im, 184, -0.587785252292473, -0.8090169943749475);
-    MXRot(re, im, 185, -0.6190939493098341, -0.7853169308807448);
-    MXRot(re, im, 186, -0.6494480483301835, -0.760405965600031);
-    MXRot(re, im, 187, -0.6788007455329416, -0.7343225094356858);
-    MXRot(re, im, 188, -0.7071067811865475, -0.7071067811865476);
-    MXRot(re, im, 189, -0.7343225094356857, -0.6788007455329417);
-    MXRot(re, im, 190, -0.7604059656000309, -0.6494480483301838);
-    MXRot(re, im, 191, -0.7853169308807447, -0.6190939493098342);
-    MXRot(re, im, 193, 0.9982656101847159, -0.05887080365118903);
-    MXRot(re, im, 194, 0.9930684569549263, -0.11753739745783764);
-    MXRot(re, im, 195, 0.9844265680898916, -0.1757962799343545);
-    MXRot(re, im, 196, 0.9723699203976766, -0.2334453638559054);
-    MXRot(re, im, 197, 0.9569403357322088, -0.29028467725446233);
-    MXRot(re, im, 198, 0.9381913359224842, -0.34611705707749296);
-    MXRot(re, im, 199, 0.916187957117136, -0.40074883310314097);
-    MXRot(re, im, 200, 0.8910065241883679, -0.45399049973954675);
-    MXRot(re, im, 201, 0.8627343859777918, -0.5056573733779846);
-    MXRot(re, im, 202, 0.8314696123025452, -0.5555702330196022);
-    MXRot(re, im, 203, 0.7973206537727071, -0.6035559419535714);
-    MXRot(re, im, 204, 0.7604059656000309, -0.6494480483301837);
-    MXRot(re, im, 205, 0.7208535967029188, -0.6930873625456359);
-    MXRot(re, im, 206, 0.6788007455329418, -0.7343225094356856);
-    MXRot(re, im, 207, 0.6343932841636455, -0.773010453362737);
-    MXRot(re, im, 208, 0.5877852522924731, -0.8090169943749475);
-    MXRot(re, im, 209, 0.5391383229110004, -0.8422172337162864);
-    MXRot(re, im, 210, 0.48862124149695496, -0.8724960070727971);
-    MXRot(re, im, 211, 0.436409240673342, -0.8997482840522215);
-    MXRot(re, im, 212, 0.38268343236508984, -0.9238795325112867);
-    MXRot(re, im, 213, 0.32763017956169366, -0.9448060464668779);
-    MXRot(re, im, 214, 0.2714404498650743, -0.9624552364536473);
-    MXRot(re, im, 215, 0.2143091530650507, -0.9767658813208725);
-    MXRot(re, im, 216, 0.15643446504023092, -0.9876883405951378);
-    MXRot(re, im, 217, 0.09801714032956077, -0.9951847266721968);
-    MXRot(re, im, 218, 0.039259815759068666, -0.9992290362407229);
-    MXRot(re, im, 219, -0.019633692460628353, -0.9998072404820648);
-    MXRot(re, im, 220, -0.07845909572784487, -0.996917333733128);
-    MXRot(re, im, 221, -0.13701234168196785, -0.9905693404435773);
-    MXRot(re, im, 222, -0.1950903220161282, -0.9807852804032304);
-    MXRot(re, im, 223, -0.252491577015158, -0.9675990923602598);
-    MXRot(re, im, 224, -0.30901699437494734, -0.9510565162951536);
-    MXRot(re, im, 225, -0.3644704998791495, -0.9312149347588037);
-    MXRot(re, im, 226, -0.4186597375374278, -0.9081431738250815);
-    MXRot(re, im, 227, -0.4713967368259977, -0.881921264348355);
-    MXRot(re, im, 228, -0.5224985647159488, -0.8526401643540923);
-    MXRot(re, im, 229, -0.5717879602276121, -0.8204014435255137);
-    MXRot(re, im, 230, -0.6190939493098341, -0.7853169308807448);
-    MXRot(re, im, 231, -0.6642524379112817, -0.7475083268625967);
-    MXRot(re, im, 232, -0.7071067811865475, -0.7071067811865476);
-    MXRot(re, im, 233, -0.7475083268625966, -0.6642524379112819);
-    MXRot(re, im, 234, -0.7853169308807447, -0.6190939493098342);
-    MXRot(re, im, 235, -0.8204014435255136, -0.5717879602276122);
-    MXRot(re, im, 236, -0.8526401643540922, -0.5224985647159489);
-    MXRot(re, im, 237, -0.8819212643483549, -0.47139673682599786);
-    MXRot(re, im, 238, -0.9081431738250814, -0.41865973753742797);
-    MXRot(re, im, 239, -0.9312149347588036, -0.36447049987914965);
-    MXRot(re, im, 240, -0.9510565162951535, -0.3090169943749475);
-    MXRot(re, im, 241, -0.9675990923602598, -0.2524915770151582);
-    MXRot(re, im, 242, -0.9807852804032304, -0.1950903220161286);
-    MXRot(re, im, 243, -0.9905693404435773, -0.13701234168196805);
-    MXRot(re, im, 244, -0.996917333733128, -0.07845909572784507);
-    MXRot(re, im, 245, -0.9998072404820648, -0.019633692460628533);
-    MXRot(re, im, 246, -0.9992290362407229, 0.03925981575906871);
-    MXRot(re, im, 247, -0.9951847266721969, 0.09801714032956059);
-    MXRot(re, im, 248, -0.9876883405951378, 0.15643446504023073);
-    MXRot(re, im, 249, -0.9767658813208725, 0.21430915306505052);
-    MXRot(re, im, 250, -0.9624552364536474, 0.27144044986507393);
-    MXRot(re, im, 251, -0.944806046466878, 0.3276301795616935);
-    MXRot(re, im, 252, -0.9238795325112868, 0.38268343236508967);
-    MXRot(re, im, 253, -0.8997482840522215, 0.43640924067334186);
-    MXRot(re, im, 254, -0.8724960070727971, 0.488621241496955);
-    MXRot(re, im, 255, -0.8422172337162865, 0.5391383229110002);
-    MXRot(re, im, 257, 0.996917333733128, -0.07845909572784494);
-    MXRot(re, im, 258, 0.9876883405951378, -0.15643446504023087);
-    MXRot(re, im, 259, 0.9723699203976766, -0.2334453638559054);
-    MXRot(re, im, 260, 0.9510565162951535, -0.3090169943749474);
-    MXRot(re, im, 261, 0.9238795325112867, -0.3826834323650898);
-    MXRot(re, im, 262, 0.8910065241883679, -0.45399049973954675);
-    MXRot(re, im, 263, 0.8526401643540922, -0.5224985647159488);
-    MXRot(re, im, 264, 0.8090169943749475, -0.5877852522924731);
-    MXRot(re, im, 265, 0.7604059656000309, -0.6494480483301837);
-    MXRot(re, im, 266, 0.7071067811865476, -0.7071067811865475);
-    MXRot(re, im, 267, 0.6494480483301837, -0.7604059656000309);
-    MXRot(re, im, 268, 0.5877852522924731, -0.8090169943749475);
-    MXRot(re, im, 269, 0.5224985647159489, -0.8526401643540922);
-    MXRot(re, im, 270, 0.4539904997395468, -0.8910065241883678);
-    MXRot(re, im, 271, 0.38268343236508984, -0.9238795325112867);
-    MXRot(re, im, 272, 0.30901699437494745, -0.9510565162951535);
-    MXRot(re, im, 273, 0.23344536385590547, -0.9723699203976766);
-    MXRot(re, im, 274, 0.15643446504023092, -0.9876883405951378);
-    MXRot(re, im, 275, 0.078459095727845, -0.996917333733128);
-    MXRot(re, im, 276, 6.123233995736766e-17, -1.0);
-    MXRot(re, im, 277, -0.07845909572784487, -0.996917333733128);
-    MXRot(re, im, 278, -0.1564344650402308, -0.9876883405951378);
-    MXRot(re, im, 279, -0.23344536385590534, -0.9723699203976767);
-    MXRot(re, im, 280, -0.30901699437494734, -0.9510565162951536);
-    MXRot(re, im, 281, -0.3826834323650897, -0.9238795325112867);
-    MXRot(re, im, 282, -0.4539904997395467, -0.8910065241883679);
-    MXRot(re, im, 283, -0.5224985647159488, -0.8526401643540923);
-    MXRot(re, im, 284, -0.587785252292473, -0.8090169943749475);
-    MXRot(re, im, 285, -0.6494480483301835, -0.760405965600031);
-    MXRot(re, im, 286, -0.7071067811865475, -0.7071067811865476);
-    MXRot(re, im, 287, -0.7604059656000309, -0.6494480483301838);
-    MXRot(re, im, 288, -0.8090169943749473, -0.5877852522924732);
-    MXRot(re, im, 289, -0.8526401643540922, -0.5224985647159489);
-    MXRot(re, im, 290, -0.8910065241883678, -0.45399049973954686);
-    MXRot(re, im, 291, -0.9238795325112867, -0.3826834323650899);
-    MXRot(re, im, 292, -0.9510565162951535, -0.3090169943749475);
-    MXRot(re, im, 293, -0.9723699203976766, -0.23344536385590553);
-    MXRot(re, im, 294, -0.9876883405951377, -0.15643446504023098);
-    MXRot(re, im, 295, -0.996917333733128, -0.07845909572784507);
-    MXRot(re, im, 296, -1.0, -1.2246467991473532e-16);
-    MXRot(re, im, 297, -0.996917333733128, 0.07845909572784482);
-    MXRot(re, im, 298, -0.9876883405951378, 0.15643446504023073);
-    MXRot(re, im, 299, -0.9723699203976767, 0.23344536385590528);
-    MXRot(re, im, 300, -0.9510565162951536, 0.3090169943749473);
-    MXRot(re, im, 301, -0.9238795325112868, 0.38268343236508967);
-    MXRot(re, im, 302, -0.8910065241883679, 0.4539904997395467);
-    MXRot(re, im, 303, -0.8526401643540923, 0.5224985647159487);
-    MXRot(re, im, 304, -0.8090169943749476, 0.587785252292473);
-    MXRot(re, im, 305, -0.760405965600031, 0.6494480483301835);
-    MXRot(re, im, 306, -0.7071067811865477, 0.7071067811865475);
-    MXRot(re, im, 307, -0.6494480483301841, 0.7604059656000306);
-    MXRot(re, im, 308, -0.5877852522924732, 0.8090169943749473);
-    MXRot(re, im, 309, -0.5224985647159486, 0.8526401643540924);
-    MXRot(re, im, 310, -0.4539904997395469, 0.8910065241883678);
-    MXRot(re, im, 311, -0.38268343236509034, 0.9238795325112865);
-    MXRot(re, im, 312, -0.30901699437494756, 0.9510565162951535);
-    MXRot(re, im, 313, -0.23344536385590514, 0.9723699203976767);
-    MXRot(re, im, 314, -0.15643446504023104, 0.9876883405951377);
-    MXRot(re, im, 315, -0.07845909572784557, 0.996917333733128);
-    MXRot(re, im, 316, -1.8369701987210297e-16, 1.0);
-    MXRot(re, im, 317, 0.07845909572784521, 0.996917333733128);
-    MXRot(re, im, 318, 0.15643446504023067, 0.9876883405951378);
-    MXRot(re, im, 319, 0.23344536385590478, 0.9723699203976768);
-    MXTr4(re, im, 0, 16, 32, 48);
-    MXTr4(re, im, 1, 17, 33, 49);
-    MXTr4(re, im, 2, 18, 34, 50);
-    MXTr4(re, im, 3, 19, 35, 51);
-    MXTr4(re, im, 4, 20, 36, 52);
-    MXTr4(re, im, 5, 21, 37, 53);
-    MXTr4(re, im, 6, 22, 38, 54);
-    MXTr4(re, im, 7, 23, 39, 55);
-    MXTr4(re, im, 8, 24, 40, 56);
-    MXTr4(re, im, 9, 25, 41, 57);
-    MXTr4(re, im, 10, 26, 42, 58);
-    MXTr4(re, im, 11, 27, 43, 59);
-    MXTr4(re, im, 12, 28, 44, 60);
-    MXTr4(re, im, 13, 29, 45, 61);
-    MXTr4(re, im, 14, 30, 46, 62);
-    MXTr4(re, im, 15, 31, 47, 63);
-    MXRot(re, im, 17, 0.9951847266721969, -0.0980171403295606);
-    MXRot(re, im, 18, 0.9807852804032304, -0.19509032201612825);
-    MXRot(re, im, 19, 0.9569403357322088, -0.29028467725446233);
-    MXRot(re, im, 20, 0.9238795325112867, -0.3826834323650898);
-    MXRot(re, im, 21, 0.881921264348355, -0.47139673682599764);
-    MXRot(re, im, 22, 0.8314696123025452, -0.5555702330196022);
-    MXRot(re, im, 23, 0.773010453362737, -0.6343932841636455);
-    MXRot(re, im, 24, 0.7071067811865476, -0.7071067811865475);
-    MXRot(re, im, 25, 0.6343932841636455, -0.773010453362737);
-    MXRot(re, im, 26, 0.5555702330196023, -0.8314696123025452);
-    MXRot(re, im, 27, 0.4713967368259978, -0.8819212643483549);
-    MXRot(re, im, 28, 0.38268343236508984, -0.9238795325112867);
-    MXRot(re, im, 29, 0.29028467725446233, -0.9569403357322089);
-    MXRot(re, im, 30, 0.19509032201612833, -0.9807852804032304);
-    MXRot(re, im, 31, 0.09801714032956077, -0.9951847266721968);
-    MXRot(re, im, 33, 0.9807852804032304, -0.19509032201612825);
-    MXRot(re, im, 34, 0.9238795325112867, -0.3826834323650898);
-    MXRot(re, im, 35, 0.8314696123025452, -0.5555702330196022);
-    MXRot(re, im, 36, 0.7071067811865476, -0.7071067811865475);
-    MXRot(re, im, 37, 0.5555702330196023, -0.8314696123025452);
-    MXRot(re, im, 38, 0.38268343236508984, -0.9238795325112867);
-    MXRot(re, im, 39, 0.19509032201612833, -0.9807852804032304);
-    MXRot(re, im, 40, 6.123233995736766e-17, -1.0);
-    MXRot(re, im, 41, -0.1950903220161282, -0.9807852804032304);
-    MXRot(re, im, 42, -0.3826834323650897, -0.9238795325112867);
-    MXRot(re, im, 43, -0.555570233019602, -0.8314696123025455);
-    MXRot(re, im, 44, -0.7071067811865475, -0.7071067811865476);
-    MXRot(re, im, 45, -0.8314696123025453, -0.5555702330196022);
-    MXRot(re, im, 46, -0.9238795325112867, -0.3826834323650899);
-    MXRot(re, im, 47, -0.9807852804032304, -0.1950903220161286);
-    MXRot(re, im, 49, 0.9569403357322088, -0.29028467725446233);
-    MXRot(re, im, 50, 0.8314696123025452, -0.5555702330196022);
-    MXRot(re, im, 51, 0.6343932841636455, -0.773010453362737);
-    MXRot(re, im, 52, 0.38268343236508984, -0.9238795325112867);
-    MXRot(re, im, 53, 0.09801714032956077, -0.9951847266721968);
-    MXRot(re, im, 54, -0.1950903220161282, -0.9807852804032304);
-    MXRot(re, im, 55, -0.4713967368259977, -0.881921264348355);
-    MXRot(re, im, 56, -0.7071067811865475, -0.7071067811865476);
-    MXRot(re, im, 57, -0.8819212643483549, -0.47139673682599786);
-    MXRot(re, im, 58, -0.9807852804032304, -0.1950903220161286);
-    MXRot(re, im, 59, -0.9951847266721969, 0.09801714032956059);
-    MXRot(re, im, 60, -0.9238795325112868, 0.38268343236508967);
-    MXRot(re, im, 61, -0.7730104533627371, 0.6343932841636453);
-    MXRot(re, im, 62, -0.5555702330196022, 0.8314696123025452);
-    MXRot(re, im, 63, -0.29028467725446244, 0.9569403357322088);
-    MXTr4(re, im, 0, 4, 8, 12);
-    MXTr4(re, im, 1, 5, 9, 13);
-    MXTr4(re, im, 2, 6, 10, 14);
-    MXTr4(re, im, 3, 7, 11, 15);
-    MXRot(re, im, 5, 0.9238795325112867, -0.3826834323650898);
-    MXRot(re, im, 6, 0.7071067811865476, -0.7071067811865475);
-    MXRot(re, im, 7, 0.38268343236508984, -0.9238795325112867);
-    MXRot(re, im, 9, 0.7071067811865476, -0.7071067811865475);
-    MXRot(re, im, 10, 6.123233995736766e-17, -1.0);
-    MXRot(re, im, 11, -0.7071067811865475, -0.7071067811865476);
-    MXRot(re, im, 13, 0.38268343236508984, -0.9238795325112867);
-    MXRot(re, im, 14, -0.7071067811865475, -0.7071067811865476);
-    MXRot(re, im, 15, -0.9238795325112868, 0.38268343236508967);
-    MXTr4(re, im, 0, 1, 2, 3);
-    MXTr4(re, im, 4, 5, 6, 7);
-    MXTr4(re, im, 8, 9, 10, 11);
-    MXTr4(re, im, 12, 13, 14, 15);
-    MXTr4(re, im, 16, 20, 24, 28);
-    MXTr4(re, im, 17, 21, 25, 29);
-    MXTr4(re, im, 18, 22, 26, 30);
-    MXTr4(re, im, 19, 23, 27, 31);
-    MXRot(re, im, 21, 0.9238795325112867, -0.3826834323650898);
-    MXRot(re, im, 22, 0.7071067811865476, -0.7071067811865475);
-    MXRot(re, im, 23, 0.38268343236508984, -0.9238795325112867);
-    MXRot(re, im, 25, 0.7071067811865476, -0.7071067811865475);
-    MXRot(re, im, 26, 6.123233995736766e-17, -1.0);
-    MXRot(re, im, 27, -0.7071067811865475, -0.7071067811865476);
-    MXRot(re, im, 29, 0.38268343236508984, -0.9238795325112867);
-    MXRot(re, im, 30, -0.7071067811865475, -0.7071067811865476);
-    MXRot(re, im, 31, -0.9238795325112868, 0.38268343236508967);
-    MXTr4(re, im, 16, 17, 18, 19);
-    MXTr4(re, im, 20, 21, 22, 23);
-    MXTr4(re, im, 24, 25, 26, 27);
-    MXTr4(re, im, 28, 29, 30, 31);
-    MXTr4(re, im, 32, 36, 40, 44);
-    MXTr4(re, im, 33, 37, 41, 45);
-    MXTr4(re, im, 34, 38, 42, 46);
-    MXTr4(re, im, 35, 39, 43, 47);
-    MXRot(re, im, 37, 0.9238795325112867, -0.3826834323650898);
-    MXRot(re, im, 38, 0.7071067811865476, -0.7071067811865475);
-    MXRot(re, im, 39, 0.38268343236508984, -0.9238795325112867);
-    MXRot(re, im, 41, 0.7071067811865476, -0.7071067811865475);
-    MXRot(re, im, 42, 6.123233995736766e-17, -1.0);
-    MXRot(re, im, 43, -0.7071067811865475, -0.7071067811865476);
-    MXRot(re, im, 45, 0.38268343236508984, -0.9238795325112867);
-    MXRot(re, im, 46, -0.7071067811865475, -0.7071067811865476);
-    MXRot(re, im, 47, -0.9238795325112868, 0.38268343236508967);
-    MXTr4(re, im, 32, 33, 34, 35);
-    MXTr4(re, im, 36, 37, 38, 39);
-    MXTr4(re, im, 40, 41, 42, 43);
-    MXTr4(re, im, 44, 45, 46, 47);
-    MXTr4(re, im, 48, 52, 56, 60);
-    MXTr4(re, im, 49, 53, 57, 61);
-    MXTr4(re, im, 50, 54, 58, 62);
-    MXTr4(re, im, 51, 55, 59, 63);
-    MXRot(re, im, 53, 0.9238795325112867, -0.3826834323650898);
-    MXRot(re, im, 54, 0.7071067811865476, -0.7071067811865475);
-    MXRot(re, im, 55, 0.38268343236508984, -0.9238795325112867);
-    MXRot(re, im, 57, 0.7071067811865476, -0.7071067811865475);
-    MXRot(re, im, 58, 6.123233995736766e-17, -1.0);
-    MXRot(re, im, 59, -0.7071067811865475, -0.7071067811865476);
-    MXRot(re, im, 61, 0.38268343236508984, -0.9238795325112867);
-    MXRot(re, im, 62, -0.7071067811865475, -0.7071067811865476);
-    MXRot(re, im, 63, -0.9238795325112868, 0.38268343236508967);
-    MXTr4(re, im, 48, 49, 50, 51);
-    MXTr4(re, im, 52, 53, 54, 55);
-    MXTr4(re, im, 56, 57, 58, 59);
-    MXTr4(re, im, 60, 61, 62, 63);
-    MXTr4(re, im, 64, 80, 96, 112);
-    MXTr4(re, im, 65, 81, 97, 113);
-    MXTr4(re, im, 66, 82, 98, 114);
-    MXTr4(re, im, 67, 83, 99, 115);
-    MXTr4(re, im, 68, 84, 100, 116);
-    MXTr4(re, im, 69, 85, 101, 117);
-    MXTr4(re, im, 70, 86, 102, 118);
-    MXTr4(re, im, 71, 87, 103, 119);
-    MXTr4(re, im, 72, 88, 104, 120);
-    MXTr4(re, im, 73, 89, 105, 121);
-    MXTr4(re, im, 74, 90, 106, 122);
-    MXTr4(re, im, 75, 91, 107, 123);
-    MXTr4(re, im, 76, 92, 108, 124);
-    MXTr4(re, im, 77, 93, 109, 125);
-    MXTr4(re, im, 78, 94, 110, 126);
-    MXTr4(re, im, 79, 95, 111, 127);
-    MXRot(re, im, 81, 0.9951847266721969, -0.0980171403295606);
-    MXRot(re, im, 82, 0.9807852804032304, -0.19509032201612825);
-    MXRot(re, im, 83, 0.9569403357322088, -0.29028467725446233);
-    MXRot(re, im, 84, 0.9238795325112867, -0.3826834323650898);
-    MXRot(re, im, 85, 0.881921264348355, -0.47139673682599764);
-    MXRot(re, im, 86, 0.8314696123025452, -0.5555702330196022);
-    MXRot(re, im, 87, 0.773010453362737, -0.6343932841636455);
-    MXRot(re, im, 88, 0.7071067811865476, -0.7071067811865475);
-    MXRot(re, im, 89, 0.6343932841636455, -0.773010453362737);
-    MXRot(re, im, 90, 0.5555702330196023, -0.8314696123025452);
-    MXRot(re, im, 91, 0.4713967368259978, -0.8819212643483549);
-    MXRot(re, im, 92, 0.38268343236508984, -0.9238795325112867);
-    MXRot(re, im, 93, 0.29028467725446233, -0.9569403357322089);
-    MXRot(re, im, 94, 0.19509032201612833, -0.9807852804032304);
-    MXRot(re, im, 95, 0.09801714032956077, -0.9951847266721968);
-    MXRot(re, im, 97, 0.9807852804032304, -0.19509032201612825);
-    MXRot(re, im, 98, 0.9238795325112867, -0.3826834323650898);
-    MXRot(re, im, 99, 0.8314696123025452, -0.5555702330196022);
-    MXRot(re, im, 100, 0.7071067811865476, -0.7071067811865475);
-    MXRot(re, im, 101, 0.5555702330196023, -0.8314696123025452);
-    MXRot(re, im, 102, 0.38268343236508984, -0.9238795325112867);
-    MXRot(re, im, 103, 0.19509032201612833, -0.9807852804032304);
-    MXRot(re, im, 104, 6.123233995736766e-17, -1.0);
-    MXRot(re, im, 105, -0.1950903220161282, -0.9807852804032304);
-    MXRot(re, im, 106, -0.3826834323650897, -0.9238795325112867);
-    MXRot(re, im, 107, -0.555570233019602, -0.8314696123025455);
-    MXRot(re, im, 108, -0.7071067811865475, -0.7071067811865476);
-    MXRot(re, im, 109, -0.8314696123025453, -0.5555702330196022);
-    MXRot(re, im, 110, -0.9238795325112867, -0.3826834323650899);
-    MXRot(re, im, 111, -0.9807852804032304, -0.1950903220161286);
-    MXRot(re, im, 113, 0.9569403357322088, -0.29028467725446233);
-    MXRot(re, im, 114, 0.8314696123025452, -0.5555702330196022);
-    MXRot(re, im, 115, 0.6343932841636455, -0.773010453362737);
-    MXRot(re, im, 116, 0.38268343236508984, -0.9238795325112867);
-    MXRot(re, im, 117, 0.09801714032956077, -0.9951847266721968);
-    MXRot(re, im, 118, -0.1950903220161282, -0.9807852804032304);
-    MXRot(re, im, 119, -0.4713967368259977, -0.881921264348355);
-    MXRot(re, im, 120, -0.7071067811865475, -0.7071067811865476);
-    MXRot(re, im, 121, -0.8819212643483549, -0.47139673682599786);
-}
-
-/**
- *  Part 2 of ApplyMixedRadixFFT_320().
- * 
- *  @param {Number[]} re 
- *    - The real part of each point.
- *  @param {Number[]} im 
- *    - The imaginary part of each point.
- */
-function ApplyMixedRadixFFT_320_Part2(re, im) {
-    MXRot(re, im, 122, -0.9807852804032304, -0.1950903220161286);
-    MXRot(re, im, 123, -0.9951847266721969, 0.09801714032956059);
-    MXRot(re, im, 124, -0.9238795325112868, 0.38268343236508967);
-    MXRot(re, im, 125, -0.7730104533627371, 0.6343932841636453);
-    MXRot(re, im, 126, -0.5555702330196022, 0.8314696123025452);
-    MXRot(re, im, 127, -0.29028467725446244, 0.9569403357322088);
-    MXTr4(re, im, 64, 68, 72, 76);
-    MXTr4(re, im, 65, 69, 73, 77);
-    MXTr4(re, im, 66, 70, 74, 78);
-    MXTr4(re, im, 67, 71, 75, 79);
-    MXRot(re, im, 69, 0.9238795325112867, -0.3826834323650898);
-    MXRot(re, im, 70, 0.7071067811865476, -0.7071067811865475);
-    MXRot(re, im, 71, 0.38268343236508984, -0.9238795325112867);
-    MXRot(re, im, 73, 0.7071067811865476, -0.7071067811865475);
-    MXRot(re, im, 74, 6.123233995736766e-17, -1.0);
-    MXRot(re, im, 75, -0.7071067811865475, -0.7071067811865476);
-    MXRot(re, im, 77, 0.38268343236508984, -0.9238795325112867);
-    MXRot(re, im, 78, -0.7071067811865475, -0.7071067811865476);
-    MXRot(re, im, 79, -0.9238795325112868, 0.38268343236508967);
-    MXTr4(re, im, 64, 65, 66, 67);
-    MXTr4(re, im, 68, 69, 70, 71);
-    MXTr4(re, im, 72, 73, 74, 75);
-    MXTr4(re, im, 76, 77, 78, 79);
-    MXTr4(re, im, 80, 84, 88, 92);
-    MXTr4(re, im, 81, 85, 89, 93);
-    MXTr4(re, im, 82, 86, 90, 94);
-    MXTr4(re, im, 83, 87, 91, 95);
-    MXRot(re, im, 85, 0.9238795325112867, -0.3826834323650898);
-    MXRot(re, im, 86, 0.7071067811865476, -0.7071067811865475);
-    MXRot(re, im, 87, 0.38268343236508984, -0.9238795325112867);
-    MXRot(re, im, 89, 0.7071067811865476, -0.7071067811865475);
-    MXRot(re, im, 90, 6.123233995736766e-17, -1.0);
-    MXRot(re, im, 91, -0.7071067811865475, -0.7071067811865476);
-    MXRot(re, im, 93, 0.38268343236508984, -0.9238795325112867);
-    MXRot(re, im, 94, -0.7071067811865475, -0.7071067811865476);
-    MXRot(re, im, 95, -0.9238795325112868, 0.38268343236508967);
-    MXTr4(re, im, 80, 81, 82, 83);
-    MXTr4(re, im, 84, 85, 86, 87);
-    MXTr4(re, im, 88, 89, 90, 91);
-    MXTr4(re, im, 92, 93, 94, 95);
-    MXTr4(re, im, 96, 100, 104, 108);
-    MXTr4(re, im, 97, 101, 105, 109);
-    MXTr4(re, im, 98, 102, 106, 110);
-    MXTr4(re, im, 99, 103, 107, 111);
-    MXRot(re, im, 101, 0.9238795325112867, -0.3826834323650898);
-    MXRot(re, im, 102, 0.7071067811865476, -0.7071067811865475);
-    MXRot(re, im, 103, 0.38268343236508984, -0.9238795325112867);
-    MXRot(re, im, 105, 0.7071067811865476, -0.7071067811865475);
-    MXRot(re, im, 106, 6.123233995736766e-17, -1.0);
-    MXRot(re, im, 107, -0.7071067811865475, -0.7071067811865476);
-    MXRot(re, im, 109, 0.38268343236508984, -0.9238795325112867);
-    MXRot(re, im, 110, -0.7071067811865475, -0.7071067811865476);
-    MXRot(re, im, 111, -0.9238795325112868, 0.38268343236508967);
-    MXTr4(re, im, 96, 97, 98, 99);
-    MXTr4(re, im, 100, 101, 102, 103);
-    MXTr4(re, im, 104, 105, 106, 107);
-    MXTr4(re, im, 108, 109, 110, 111);
-    MXTr4(re, im, 112, 116, 120, 124);
-    MXTr4(re, im, 113, 117, 121, 125);
-    MXTr4(re, im, 114, 118, 122, 126);
-    MXTr4(re, im, 115, 119, 123, 127);
-    MXRot(re, im, 117, 0.9238795325112867, -0.3826834323650898);
-    MXRot(re, im, 118, 0.7071067811865476, -0.7071067811865475);
-    MXRot(re, im, 119, 0.38268343236508984, -0.9238795325112867);
-    MXRot(re, im, 121, 0.7071067811865476, -0.7071067811865475);
-    MXRot(re, im, 122, 6.123233995736766e-17, -1.0);
-    MXRot(re, im, 123, -0.7071067811865475, -0.7071067811865476);
-    MXRot(re, im, 125, 0.38268343236508984, -0.9238795325112867);
-    MXRot(re, im, 126, -0.7071067811865475, -0.7071067811865476);
-    MXRot(re, im, 127, -0.9238795325112868, 0.38268343236508967);
-    MXTr4(re, im, 112, 113, 114, 115);
-    MXTr4(re, im, 116, 117, 118, 119);
-    MXTr4(re, im, 120, 121, 122, 123);
-    MXTr4(re, im, 124, 125, 126, 127);
-    MXTr4(re, im, 128, 144, 160, 176);
-    MXTr4(re, im, 129, 145, 161, 177);
-    MXTr4(re, im, 130, 146, 162, 178);
-    MXTr4(re, im, 131, 147, 163, 179);
-    MXTr4(re, im, 132, 148, 164, 180);
-    MXTr4(re, im, 133, 149, 165, 181);
-    MXTr4(re, im, 134, 150, 166, 182);
-    MXTr4(re, im, 135, 151, 167, 183);
-    MXTr4(re, im, 136, 152, 168, 184);
-    MXTr4(re, im, 137, 153, 169, 185);
-    MXTr4(re, im, 138, 154, 170, 186);
-    MXTr4(re, im, 139, 155, 171, 187);
-    MXTr4(re, im, 140, 156, 172, 188);
-    MXTr4(re, im, 141, 157, 173, 189);
-    MXTr4(re, im, 142, 158, 174, 190);
-    MXTr4(re, im, 143, 159, 175, 191);
-    MXRot(re, im, 145, 0.9951847266721969, -0.0980171403295606);
-    MXRot(re, im, 146, 0.9807852804032304, -0.19509032201612825);
-    MXRot(re, im, 147, 0.9569403357322088, -0.29028467725446233);
-    MXRot(re, im, 148, 0.9238795325112867, -0.3826834323650898);
-    MXRot(re, im, 149, 0.881921264348355, -0.47139673682599764);
-    MXRot(re, im, 150, 0.8314696123025452, -0.5555702330196022);
-    MXRot(re, im, 151, 0.773010453362737, -0.6343932841636455);
-    MXRot(re, im, 152, 0.7071067811865476, -0.7071067811865475);
-    MXRot(re, im, 153, 0.6343932841636455, -0.773010453362737);
-    MXRot(re, im, 154, 0.5555702330196023, -0.8314696123025452);
-    MXRot(re, im, 155, 0.4713967368259978, -0.8819212643483549);
-    MXRot(re, im, 156, 0.38268343236508984, -0.9238795325112867);
-    MXRot(re, im, 157, 0.29028467725446233, -0.9569403357322089);
-    MXRot(re, im, 158, 0.19509032201612833, -0.9807852804032304);
-    MXRot(re, im, 159, 0.09801714032956077, -0.9951847266721968);
-    MXRot(re, im, 161, 0.9807852804032304, -0.19509032201612825);
-    MXRot(re, im, 162, 0.9238795325112867, -0.3826834323650898);
-    MXRot(re, im, 163, 0.8314696123025452, -0.5555702330196022);
-    MXRot(re, im, 164, 0.7071067811865476, -0.7071067811865475);
-    MXRot(re, im, 165, 0.5555702330196023, -0.8314696123025452);
-    MXRot(re, im, 166, 0.38268343236508984, -0.9238795325112867);
-    MXRot(re, im, 167, 0.19509032201612833, -0.9807852804032304);
-    MXRot(re, im, 168, 6.123233995736766e-17, -1.0);
-    MXRot(re, im, 169, -0.1950903220161282, -0.9807852804032304);
-    MXRot(re, im, 170, -0.3826834323650897, -0.9238795325112867);
-    MXRot(re, im, 171, -0.555570233019602, -0.8314696123025455);
-    MXRot(re, im, 172, -0.7071067811865475, -0.7071067811865476);
-    MXRot(re, im, 173, -0.8314696123025453, -0.5555702330196022);
-    MXRot(re, im, 174, -0.9238795325112867, -0.3826834323650899);
-    MXRot(re, im, 175, -0.9807852804032304, -0.1950903220161286);
-    MXRot(re, im, 177, 0.9569403357322088, -0.29028467725446233);
-    MXRot(re, im, 178, 0.8314696123025452, -0.5555702330196022);
-    MXRot(re, im, 179, 0.6343932841636455, -0.773010453362737);
-    MXRot(re, im, 180, 0.38268343236508984, -0.9238795325112867);
-    MXRot(re, im, 181, 0.09801714032956077, -0.9951847266721968);
-    MXRot(re, im, 182, -0.1950903220161282, -0.9807852804032304);
-    MXRot(re, im, 183, -0.4713967368259977, -0.881921264348355);
-    MXRot(re, im, 184, -0.7071067811865475, -0.7071067811865476);
-    MXRot(re, im, 185, -0.8819212643483549, -0.47139673682599786);
-    MXRot(re, im, 186, -0.9807852804032304, -0.1950903220161286);
-    MXRot(re, im, 187, -0.9951847266721969, 0.09801714032956059);
-    MXRot(re, im, 188, -0.9238795325112868, 0.38268343236508967);
-    MXRot(re, im, 189, -0.7730104533627371, 0.6343932841636453);
-    MXRot(re, im, 190, -0.5555702330196022, 0.8314696123025452);
-    MXRot(re, im, 191, -0.29028467725446244, 0.9569403357322088);
-    MXTr4(re, im, 128, 132, 136, 140);
-    MXTr4(re, im, 129, 133, 137, 141);
-    MXTr4(re, im, 130, 134, 138, 142);
-    MXTr4(re, im, 131, 135, 139, 143);
-    MXRot(re, im, 133, 0.9238795325112867, -0.3826834323650898);
-    MXRot(re, im, 134, 0.7071067811865476, -0.7071067811865475);
-    MXRot(re, im, 135, 0.38268343236508984, -0.9238795325112867);
-    MXRot(re, im, 137, 0.7071067811865476, -0.7071067811865475);
-    MXRot(re, im, 138, 6.123233995736766e-17, -1.0);
-    MXRot(re, im, 139, -0.7071067811865475, -0.7071067811865476);
-    MXRot(re, im, 141, 0.38268343236508984, -0.9238795325112867);
-    MXRot(re, im, 142, -0.7071067811865475, -0.7071067811865476);
-    MXRot(re, im, 143, -0.9238795325112868, 0.38268343236508967);
-    MXTr4(re, im, 128, 129, 130, 131);
-    MXTr4(re, im, 132, 133, 134, 135);
-    MXTr4(re, im, 136, 137, 138, 139);
-    MXTr4(re, im, 140, 141, 142, 143);
-    MXTr4(re, im, 144, 148, 152, 156);
-    MXTr4(re, im, 145, 149, 153, 157);
-    MXTr4(re, im, 146, 150, 154, 158);
-    MXTr4(re, im, 147, 151, 155, 159);
-    MXRot(re, im, 149, 0.9238795325112867, -0.3826834323650898);
-    MXRot(re, im, 150, 0.7071067811865476, -0.7071067811865475);
-    MXRot(re, im, 151, 0.38268343236508984, -0.9238795325112867);
-    MXRot(re, im, 153, 0.7071067811865476, -0.7071067811865475);
-    MXRot(re, im, 154, 6.123233995736766e-17, -1.0);
-    MXRot(re, im, 155, -0.7071067811865475, -0.7071067811865476);
-    MXRot(re, im, 157, 0.38268343236508984, -0.9238795325112867);
-    MXRot(re, im, 158, -0.7071067811865475, -0.7071067811865476);
-    MXRot(re, im, 159, -0.9238795325112868, 0.38268343236508967);
-    MXTr4(re, im, 144, 145, 146, 147);
-    MXTr4(re, im, 148, 149, 150, 151);
-    MXTr4(re, im, 152, 153, 154, 155);
-    MXTr4(re, im, 156, 157, 158, 159);
-    MXTr4(re, im, 160, 164, 168, 172);
-    MXTr4(re, im, 161, 165, 169, 173);
-    MXTr4(re, im, 162, 166, 170, 174);
-    MXTr4(re, im, 163, 167, 171, 175);
-    MXRot(re, im, 165, 0.9238795325112867, -0.3826834323650898);
-    MXRot(re, im, 166, 0.7071067811865476, -0.7071067811865475);
-    MXRot(re, im, 167, 0.38268343236508984, -0.9238795325112867);
-    MXRot(re, im, 169, 0.7071067811865476, -0.7071067811865475);
-    MXRot(re, im, 170, 6.123233995736766e-17, -1.0);
-    MXRot(re, im, 171, -0.7071067811865475, -0.7071067811865476);
-    MXRot(re, im, 173, 0.38268343236508984, -0.9238795325112867);
-    MXRot(re, im, 174, -0.7071067811865475, -0.7071067811865476);
-    MXRot(re, im, 175, -0.9238795325112868, 0.38268343236508967);
-    MXTr4(re, im, 160, 161, 162, 163);
-    MXTr4(re, im, 164, 165, 166, 167);
-    MXTr4(re, im, 168, 169, 170, 171);
-    MXTr4(re, im, 172, 173, 174, 175);
-    MXTr4(re, im, 176, 180, 184, 188);
-    MXTr4(re, im, 177, 181, 185, 189);
-    MXTr4(re, im, 178, 182, 186, 190);
-    MXTr4(re, im, 179, 183, 187, 191);
-    MXRot(re, im, 181, 0.9238795325112867, -0.3826834323650898);
-    MXRot(re, im, 182, 0.7071067811865476, -0.7071067811865475);
-    MXRot(re, im, 183, 0.38268343236508984, -0.9238795325112867);
-    MXRot(re, im, 185, 0.7071067811865476, -0.7071067811865475);
-    MXRot(re, im, 186, 6.123233995736766e-17, -1.0);
-    MXRot(re, im, 187, -0.7071067811865475, -0.7071067811865476);
-    MXRot(re, im, 189, 0.38268343236508984, -0.9238795325112867);
-    MXRot(re, im, 190, -0.7071067811865475, -0.7071067811865476);
-    MXRot(re, im, 191, -0.9238795325112868, 0.38268343236508967);
-    MXTr4(re, im, 176, 177, 178, 179);
-    MXTr4(re, im, 180, 181, 182, 183);
-    MXTr4(re, im, 184, 185, 186, 187);
-    MXTr4(re, im, 188, 189, 190, 191);
-    MXTr4(re, im, 192, 208, 224, 240);
-    MXTr4(re, im, 193, 209, 225, 241);
-    MXTr4(re, im, 194, 210, 226, 242);
-    MXTr4(re, im, 195, 211, 227, 243);
-    MXTr4(re, im, 196, 212, 228, 244);
-    MXTr4(re, im, 197, 213, 229, 245);
-    MXTr4(re, im, 198, 214, 230, 246);
-    MXTr4(re, im, 199, 215, 231, 247);
-    MXTr4(re, im, 200, 216, 232, 248);
-    MXTr4(re, im, 201, 217, 233, 249);
-    MXTr4(re, im, 202, 218, 234, 250);
-    MXTr4(re, im, 203, 219, 235, 251);
-    MXTr4(re, im, 204, 220, 236, 252);
-    MXTr4(re, im, 205, 221, 237, 253);
-    MXTr4(re, im, 206, 222, 238, 254);
-    MXTr4(re, im, 207, 223, 239, 255);
-    MXRot(re, im, 209, 0.9951847266721969, -0.0980171403295606);
-    MXRot(re, im, 210, 0.9807852804032304, -0.19509032201612825);
-    MXRot(re, im, 211, 0.9569403357322088, -0.29028467725446233);
-    MXRot(re, im, 212, 0.9238795325112867, -0.3826834323650898);
-    MXRot(re, im, 213, 0.881921264348355, -0.47139673682599764);
-    MXRot(re, im, 214, 0.8314696123025452, -0.5555702330196022);
-    MXRot(re, im, 215, 0.773010453362737, -0.6343932841636455);
-    MXRot(re, im, 216, 0.7071067811865476, -0.7071067811865475);
-    MXRot(re, im, 217, 0.6343932841636455, -0.773010453362737);
-    MXRot(re, im, 218, 0.5555702330196023, -0.8314696123025452);
-    MXRot(re, im, 219, 0.4713967368259978, -0.8819212643483549);
-    MXRot(re, im, 220, 0.38268343236508984, -0.9238795325112867);
-    MXRot(re, im, 221, 0.29028467725446233, -0.9569403357322089);
-    MXRot(re, im, 222, 0.19509032201612833, -0.9807852804032304);
-    MXRot(re, im, 223, 0.09801714032956077, -0.9951847266721968);
-    MXRot(re, im, 225, 0.9807852804032304, -0.19509032201612825);
-    MXRot(re, im, 226, 0.9238795325112867, -0.3826834323650898);
-    MXRot(re, im, 227, 0.8314696123025452, -0.5555702330196022);
-    MXRot(re, im, 228, 0.7071067811865476, -0.7071067811865475);
-    MXRot(re, im, 229, 0.5555702330196023, -0.8314696123025452);
-    MXRot(re, im, 230, 0.38268343236508984, -0.9238795325112867);
-    MXRot(re, im, 231, 0.19509032201612833, -0.9807852804032304);
-    MXRot(re, im, 232, 6.123233995736766e-17, -1.0);
-    MXRot(re, im, 233, -0.1950903220161282, -0.9807852804032304);
-    MXRot(re, im, 234, -0.3826834323650897, -0.9238795325112867);
-    MXRot(re, im, 235, -0.555570233019602, -0.8314696123025455);
-    MXRot(re, im, 236, -0.7071067811865475, -0.7071067811865476);
-    MXRot(re, im, 237, -0.8314696123025453, -0.5555702330196022);
-    MXRot(re, im, 238, -0.9238795325112867, -0.3826834323650899);
-    MXRot(re, im, 239, -0.9807852804032304, -0.1950903220161286);
-    MXRot(re, im, 241, 0.9569403357322088, -0.29028467725446233);
-    MXRot(re, im, 242, 0.8314696123025452, -0.5555702330196022);
-    MXRot(re, im, 243, 0.6343932841636455, -0.773010453362737);
-    MXRot(re, im, 244, 0.38268343236508984, -0.9238795325112867);
-    MXRot(re, im, 245, 0.09801714032956077, -0.9951847266721968);
-    MXRot(re, im, 246, -0.1950903220161282, -0.9807852804032304);
-    MXRot(re, im, 247, -0.4713967368259977, -0.881921264348355);
-    MXRot(re, im, 248, -0.7071067811865475, -0.7071067811865476);
-    MXRot(re, im, 249, -0.8819212643483549, -0.47139673682599786);
-    MXRot(re, im, 250, -0.9807852804032304, -0.1950903220161286);
-    MXRot(re, im, 251, -0.9951847266721969, 0.09801714032956059);
-    MXRot(re, im, 252, -0.9238795325112868, 0.38268343236508967);
-    MXRot(re, im, 253, -0.7730104533627371, 0.6343932841636453);
-    MXRot(re, im, 254, -0.5555702330196022, 0.8314696123025452);
-    MXRot(re, im, 255, -0.29028467725446244, 0.9569403357322088);
-    MXTr4(re, im, 192, 196, 200, 204);
-    MXTr4(re, im, 193, 197, 201, 205);
-    MXTr4(re, im, 194, 198, 202, 206);
-    MXTr4(re, im, 195, 199, 203, 207);
-    MXRot(re, im, 197, 0.9238795325112867, -0.3826834323650898);
-    MXRot(re, im, 198, 0.7071067811865476, -0.7071067811865475);
-    MXRot(re, im, 199, 0.38268343236508984, -0.9238795325112867);
-    MXRot(re, im, 201, 0.7071067811865476, -0.7071067811865475);
-    MXRot(re, im, 202, 6.123233995736766e-17, -1.0);
-    MXRot(re, im, 203, -0.7071067811865475, -0.7071067811865476);
-    MXRot(re, im, 205, 0.38268343236508984, -0.9238795325112867);
-    MXRot(re, im, 206, -0.7071067811865475, -0.7071067811865476);
-    MXRot(re, im, 207, -0.9238795325112868, 0.38268343236508967);
-    MXTr4(re, im, 192, 193, 194, 195);
-    MXTr4(re, im, 196, 197, 198, 199);
-    MXTr4(re, im, 200, 201, 202, 203);
-    MXTr4(re, im, 204, 205, 206, 207);
-    MXTr4(re, im, 208, 212, 216, 220);
-    MXTr4(re, im, 209, 213, 217, 221);
-    MXTr4(re, im, 210, 214, 218, 222);
-    MXTr4(re, im, 211, 215, 219, 223);
-    MXRot(re, im, 213, 0.9238795325112867, -0.3826834323650898);
-    MXRot(re, im, 214, 0.7071067811865476, -0.7071067811865475);
-    MXRot(re, im, 215, 0.38268343236508984, -0.9238795325112867);
-    MXRot(re, im, 217, 0.7071067811865476, -0.7071067811865475);
-    MXRot(re, im, 218, 6.123233995736766e-17, -1.0);
-    MXRot(re, im, 219, -0.7071067811865475, -0.7071067811865476);
-    MXRot(re, im, 221, 0.38268343236508984, -0.9238795325112867);
-    MXRot(re, im, 222, -0.7071067811865475, -0.7071067811865476);
-    MXRot(re, im, 223, -0.9238795325112868, 0.38268343236508967);
-    MXTr4(re, im, 208, 209, 210, 211);
-    MXTr4(re, im, 212, 213, 214, 215);
-    MXTr4(re, im, 216, 217, 218, 219);
-    MXTr4(re, im, 220, 221, 222, 223);
-    MXTr4(re, im, 224, 228, 232, 236);
-    MXTr4(re, im, 225, 229, 233, 237);
-    MXTr4(re, im, 226, 230, 234, 238);
-    MXTr4(re, im, 227, 231, 235, 239);
-    MXRot(re, im, 229, 0.9238795325112867, -0.3826834323650898);
-    MXRot(re, im, 230, 0.7071067811865476, -0.7071067811865475);
-    MXRot(re, im, 231, 0.38268343236508984, -0.9238795325112867);
-    MXRot(re, im, 233, 0.7071067811865476, -0.7071067811865475);
-    MXRot(re, im, 234, 6.123233995736766e-17, -1.0);
-    MXRot(re, im, 235, -0.7071067811865475, -0.7071067811865476);
-    MXRot(re, im, 237, 0.38268343236508984, -0.9238795325112867);
-    MXRot(re, im, 238, -0.7071067811865475, -0.7071067811865476);
-    MXRot(re, im, 239, -0.9238795325112868, 0.38268343236508967);
-    MXTr4(re, im, 224, 225, 226, 227);
-    MXTr4(re, im, 228, 229, 230, 231);
-    MXTr4(re, im, 232, 233, 234, 235);
-    MXTr4(re, im, 236, 237, 238, 239);
-    MXTr4(re, im, 240, 244, 248, 252);
-    MXTr4(re, im, 241, 245, 249, 253);
-    MXTr4(re, im, 242, 246, 250, 254);
-    MXTr4(re, im, 243, 247, 251, 255);
-    MXRot(re, im, 245, 0.9238795325112867, -0.3826834323650898);
-    MXRot(re, im, 246, 0.7071067811865476, -0.7071067811865475);
-    MXRot(re, im, 247, 0.38268343236508984, -0.9238795325112867);
-    MXRot(re, im, 249, 0.7071067811865476, -0.7071067811865475);
-    MXRot(re, im, 250, 6.123233995736766e-17, -1.0);
-    MXRot(re, im, 251, -0.7071067811865475, -0.7071067811865476);
-    MXRot(re, im, 253, 0.38268343236508984, -0.9238795325112867);
-    MXRot(re, im, 254, -0.7071067811865475, -0.7071067811865476);
-    MXRot(re, im, 255, -0.9238795325112868, 0.38268343236508967);
-    MXTr4(re, im, 240, 241, 242, 243);
-    MXTr4(re, im, 244, 245, 246, 247);
-    MXTr4(re, im, 248, 249, 250, 251);
-    MXTr4(re, im, 252, 253, 254, 255);
-    MXTr4(re, im, 256, 272, 288, 304);
-    MXTr4(re, im, 257, 273, 289, 305);
-    MXTr4(re, im, 258, 274, 290, 306);
-    MXTr4(re, im, 259, 275, 291, 307);
-    MXTr4(re, im, 260, 276, 292, 308);
-    MXTr4(re, im, 261, 277, 293, 309);
-    MXTr4(re, im, 262, 278, 294, 310);
-    MXTr4(re, im, 263, 279, 295, 311);
-    MXTr4(re, im, 264, 280, 296, 312);
-    MXTr4(re, im, 265, 281, 297, 313);
-    MXTr4(re, im, 266, 282, 298, 314);
-    MXTr4(re, im, 267, 283, 299, 315);
-    MXTr4(re, im, 268, 284, 300, 316);
-    MXTr4(re, im, 269, 285, 301, 317);
-    MXTr4(re, im, 270, 286, 302, 318);
-    MXTr4(re, im, 271, 287, 303, 319);
-    MXRot(re, im, 273, 0.9951847266721969, -0.0980171403295606);
-    MXRot(re, im, 274, 0.9807852804032304, -0.19509032201612825);
-    MXRot(re, im, 275, 0.9569403357322088, -0.29028467725446233);
-    MXRot(re, im, 276, 0.9238795325112867, -0.3826834323650898);
-    MXRot(re, im, 277, 0.881921264348355, -0.47139673682599764);
-    MXRot(re, im, 278, 0.8314696123025452, -0.5555702330196022);
-    MXRot(re, im, 279, 0.773010453362737, -0.6343932841636455);
-    MXRot(re, im, 280, 0.7071067811865476, -0.7071067811865475);
-    MXRot(re, im, 281, 0.6343932841636455, -0.773010453362737);
-    MXRot(re, im, 282, 0.5555702330196023, -0.8314696123025452);
-    MXRot(re, im, 283, 0.4713967368259978, -0.8819212643483549);
-    MXRot(re, im, 284, 0.38268343236508984, -0.9238795325112867);
-    MXRot(re, im, 285, 0.29028467725446233, -0.9569403357322089);
-    MXRot(re, im, 286, 0.19509032201612833, -0.9807852804032304);
-    MXRot(re, im, 287, 0.09801714032956077, -0.9951847266721968);
-    MXRot(re, im, 289, 0.9807852804032304, -0.19509032201612825);
-    MXRot(re, im, 290, 0.9238795325112867, -0.3826834323650898);
-    MXRot(re, im, 291, 0.8314696123025452, -0.5555702330196022);
-    MXRot(re, im, 292, 0.7071067811865476, -0.7071067811865475);
-    MXRot(re, im, 293, 0.5555702330196023, -0.8314696123025452);
-    MXRot(re, im, 294, 0.38268343236508984, -0.9238795325112867);
-    MXRot(re, im, 295, 0.19509032201612833, -0.9807852804032304);
-    MXRot(re, im, 296, 6.123233995736766e-17, -1.0);
-    MXRot(re, im, 297, -0.1950903220161282, -0.9807852804032304);
-    MXRot(re, im, 298, -0.3826834323650897, -0.9238795325112867);
-    MXRot(re, im, 299, -0.555570233019602, -0.8314696123025455);
-    MXRot(re, im, 300, -0.7071067811865475, -0.7071067811865476);
-    MXRot(re, im, 301, -0.8314696123025453, -0.5555702330196022);
-    MXRot(re, im, 302, -0.9238795325112867, -0.3826834323650899);
-    MXRot(re, im, 303, -0.9807852804032304, -0.1950903220161286);
-    MXRot(re, im, 305, 0.9569403357322088, -0.29028467725446233);
-    MXRot(re, im, 306, 0.8314696123025452, -0.5555702330196022);
-    MXRot(re, im, 307, 0.6343932841636455, -0.773010453362737);
-    MXRot(re, im, 308, 0.38268343236508984, -0.9238795325112867);
-    MXRot(re, im, 309, 0.09801714032956077, -0.9951847266721968);
-    MXRot(re, im, 310, -0.1950903220161282, -0.9807852804032304);
-    MXRot(re, im, 311, -0.4713967368259977, -0.881921264348355);
-    MXRot(re, im, 312, -0.7071067811865475, -0.7071067811865476);
-    MXRot(re, im, 313, -0.8819212643483549, -0.47139673682599786);
-    MXRot(re, im, 314, -0.9807852804032304, -0.1950903220161286);
-    MXRot(re, im, 315, -0.9951847266721969, 0.09801714032956059);
-    MXRot(re, im, 316, -0.9238795325112868, 0.38268343236508967);
-    MXRot(re, im, 317, -0.7730104533627371, 0.6343932841636453);
-    MXRot(re, im, 318, -0.5555702330196022, 0.8314696123025452);
-    MXRot(re, im, 319, -0.29028467725446244, 0.9569403357322088);
-    MXTr4(re, im, 256, 260, 264, 268);
-    MXTr4(re, im, 257, 261, 265, 269);
-    MXTr4(re, im, 258, 262, 266, 270);
-    MXTr4(re, im, 259, 263, 267, 271);
-    MXRot(re, im, 261, 0.9238795325112867, -0.3826834323650898);
-    MXRot(re, im, 262, 0.7071067811865476, -0.7071067811865475);
-    MXRot(re, im, 263, 0.38268343236508984, -0.9238795325112867);
-    MXRot(re, im, 265, 0.7071067811865476, -0.7071067811865475);
-    MXRot(re, im, 266, 6.123233995736766e-17, -1.0);
-    MXRot(re, im, 267, -0.7071067811865475, -0.7071067811865476);
-    MXRot(re, im, 269, 0.38268343236508984, -0.9238795325112867);
-    MXRot(re, im, 270, -0.7071067811865475, -0.7071067811865476);
-    MXRot(re, im, 271, -0.9238795325112868, 0.38268343236508967);
-    MXTr4(re, im, 256, 257, 258, 259);
-    MXTr4(re, im, 260, 261, 262, 263);
-    MXTr4(re, im, 264, 265, 266, 267);
-    MXTr4(re, im, 268, 269, 270, 271);
-    MXTr4(re, im, 272, 276, 280, 284);
-    MXTr4(re, im, 273, 277, 281, 285);
-    MXTr4(re, im, 274, 278, 282, 286);
-    MXTr4(re, im, 275, 279, 283, 287);
-    MXRot(re, im, 277, 0.9238795325112867, -0.3826834323650898);
-    MXRot(re, im, 278, 0.7071067811865476, -0.7071067811865475);
-    MXRot(re, im, 279, 0.38268343236508984, -0.9238795325112867);
-    MXRot(re, im, 281, 0.7071067811865476, -0.7071067811865475);
-    MXRot(re, im, 282, 6.123233995736766e-17, -1.0);
-    MXRot(re, im, 283, -0.7071067811865475, -0.7071067811865476);
-    MXRot(re, im, 285, 0.38268343236508984, -0.9238795325112867);
-    MXRot(re, im, 286, -0.7071067811865475, -0.7071067811865476);
-    MXRot(re, im, 287, -0.9238795325112868, 0.38268343236508967);
-    MXTr4(re, im, 272, 273, 274, 275);
-    MXTr4(re, im, 276, 277, 278, 279);
-    MXTr4(re, im, 280, 281, 282, 283);
-    MXTr4(re, im, 284, 285, 286, 287);
-    MXTr4(re, im, 288, 292, 296, 300);
-    MXTr4(re, im, 289, 293, 297, 301);
-    MXTr4(re, im, 290, 294, 298, 302);
-    MXTr4(re, im, 291, 295, 299, 303);
-    MXRot(re, im, 293, 0.9238795325112867, -0.3826834323650898);
-    MXRot(re, im, 294, 0.7071067811865476, -0.7071067811865475);
-    MXRot(re, im, 295, 0.38268343236508984, -0.9238795325112867);
-    MXRot(re, im, 297, 0.7071067811865476, -0.7071067811865475);
-    MXRot(re, im, 298, 6.123233995736766e-17, -1.0);
-    MXRot(re, im, 299, -0.7071067811865475, -0.7071067811865476);
-    MXRot(re, im, 301, 0.38268343236508984, -0.9238795325112867);
-    MXRot(re, im, 302, -0.7071067811865475, -0.7071067811865476);
-    MXRot(re, im, 303, -0.9238795325112868, 0.38268343236508967);
-    MXTr4(re, im, 288, 289, 290, 291);
-    MXTr4(re, im, 292, 293, 294, 295);
-    MXTr4(re, im, 296, 297, 298, 299);
-    MXTr4(re, im, 300, 301, 302, 303);
-    MXTr4(re, im, 304, 308, 312, 316);
-    MXTr4(re, im, 305, 309, 313, 317);
-    MXTr4(re, im, 306, 310, 314, 318);
-    MXTr4(re, im, 307, 311, 315, 319);
-    MXRot(re, im, 309, 0.9238795325112867, -0.3826834323650898);
-    MXRot(re, im, 310, 0.7071067811865476, -0.7071067811865475);
-    MXRot(re, im, 311, 0.38268343236508984, -0.9238795325112867);
-    MXRot(re, im, 313, 0.7071067811865476, -0.7071067811865475);
-    MXRot(re, im, 314, 6.123233995736766e-17, -1.0);
-    MXRot(re, im, 315, -0.7071067811865475, -0.7071067811865476);
-    MXRot(re, im, 317, 0.38268343236508984, -0.9238795325112867);
-    MXRot(re, im, 318, -0.7071067811865475, -0.7071067811865476);
-    MXRot(re, im, 319, -0.9238795325112868, 0.38268343236508967);
-    MXTr4(re, im, 304, 305, 306, 307);
-    MXTr4(re, im, 308, 309, 310, 311);
-    MXTr4(re, im, 312, 313, 314, 315);
-    MXTr4(re, im, 316, 317, 318, 319);
-    MXCshft(re, im, CSHFT_INDEXES_0);
-    MXCshft(re, im, CSHFT_INDEXES_1);
-    MXCshft(re, im, CSHFT_INDEXES_2);
-    MXCshft(re, im, CSHFT_INDEXES_3);
-    MXCshft(re, im, CSHFT_INDEXES_4);
-    MXCshft(re, im, CSHFT_INDEXES_5);
-    MXCshft(re, im, CSHFT_INDEXES_6);
-    MXCshft(re, im, CSHFT_INDEXES_7);
-}
+//  Tables (and scratch buffers) of the compact kernel (see MXCompact() of
+//  the "fft-mx-baseop" module).
+const COMPACT_RADICES = new Int32Array([
+    4, 4, 4, 5
+]);
+const COMPACT_INDEXES = new Int32Array([
+    0, 80, 160, 240, 20, 100, 180, 260, 40, 120, 200, 280, 60, 140, 220,
+    300, 5, 85, 165, 245, 25, 105, 185, 265, 45, 125, 205, 285, 65, 145,
+    225, 305, 10, 90, 170, 250, 30, 110, 190, 270, 50, 130, 210, 290, 70,
+    150, 230, 310, 15, 95, 175, 255, 35, 115, 195, 275, 55, 135, 215, 295,
+    75, 155, 235, 315, 1, 81, 161, 241, 21, 101, 181, 261, 41, 121, 201,
+    281, 61, 141, 221, 301, 6, 86, 166, 246, 26, 106, 186, 266, 46, 126,
+    206, 286, 66, 146, 226, 306, 11, 91, 171, 251, 31, 111, 191, 271, 51,
+    131, 211, 291, 71, 151, 231, 311, 16, 96, 176, 256, 36, 116, 196, 276,
+    56, 136, 216, 296, 76, 156, 236, 316, 2, 82, 162, 242, 22, 102, 182,
+    262, 42, 122, 202, 282, 62, 142, 222, 302, 7, 87, 167, 247, 27, 107,
+    187, 267, 47, 127, 207, 287, 67, 147, 227, 307, 12, 92, 172, 252, 32,
+    112, 192, 272, 52, 132, 212, 292, 72, 152, 232, 312, 17, 97, 177, 257,
+    37, 117, 197, 277, 57, 137, 217, 297, 77, 157, 237, 317, 3, 83, 163,
+    243, 23, 103, 183, 263, 43, 123, 203, 283, 63, 143, 223, 303, 8, 88,
+    168, 248, 28, 108, 188, 268, 48, 128, 208, 288, 68, 148, 228, 308, 13,
+    93, 173, 253, 33, 113, 193, 273, 53, 133, 213, 293, 73, 153, 233, 313,
+    18, 98, 178, 258, 38, 118, 198, 278, 58, 138, 218, 298, 78, 158, 238,
+    318, 4, 84, 164, 244, 24, 104, 184, 264, 44, 124, 204, 284, 64, 144,
+    224, 304, 9, 89, 169, 249, 29, 109, 189, 269, 49, 129, 209, 289, 69,
+    149, 229, 309, 14, 94, 174, 254, 34, 114, 194, 274, 54, 134, 214, 294,
+    74, 154, 234, 314, 19, 99, 179, 259, 39, 119, 199, 279, 59, 139, 219,
+    299, 79, 159, 239, 319
+]);
+const COMPACT_TWIDDLES = new Float64Array([
+    1.0, 0.0, 1.0, 0.0, 1.0, 0.0, 1.0, 0.0, 1.0, 0.0, 1.0, 0.0,
+    0.9238795325112867, -0.3826834323650898, 0.7071067811865476,
+    -0.7071067811865475, 0.3826834323650898, -0.9238795325112867,
+    0.7071067811865476, -0.7071067811865475, -0.0, -1.0,
+    -0.7071067811865476, -0.7071067811865475, 0.3826834323650898,
+    -0.9238795325112867, -0.7071067811865476, -0.7071067811865475,
+    -0.9238795325112867, 0.3826834323650898, 1.0, 0.0, 1.0, 0.0, 1.0, 0.0,
+    0.9951847266721969, -0.0980171403295606, 0.9807852804032304,
+    -0.19509032201612825, 0.9569403357322088, -0.29028467725446233,
+    0.9807852804032304, -0.19509032201612825, 0.9238795325112867,
+    -0.3826834323650898, 0.8314696123025452, -0.5555702330196022,
+    0.9569403357322088, -0.29028467725446233, 0.8314696123025452,
+    -0.5555702330196022, 0.6343932841636455, -0.773010453362737,
+    0.9238795325112867, -0.3826834323650898, 0.7071067811865476,
+    -0.7071067811865475, 0.3826834323650898, -0.9238795325112867,
+    0.881921264348355, -0.47139673682599764, 0.5555702330196022,
+    -0.8314696123025452, 0.0980171403295606, -0.9951847266721969,
+    0.8314696123025452, -0.5555702330196022, 0.3826834323650898,
+    -0.9238795325112867, -0.19509032201612825, -0.9807852804032304,
+    0.773010453362737, -0.6343932841636455, 0.19509032201612825,
+    -0.9807852804032304, -0.47139673682599764, -0.881921264348355,
+    0.7071067811865476, -0.7071067811865475, -0.0, -1.0,
+    -0.7071067811865476, -0.7071067811865475, 0.6343932841636455,
+    -0.773010453362737, -0.19509032201612825, -0.9807852804032304,
+    -0.881921264348355, -0.47139673682599764, 0.5555702330196022,
+    -0.8314696123025452, -0.3826834323650898, -0.9238795325112867,
+    -0.9807852804032304, -0.19509032201612825, 0.47139673682599764,
+    -0.881921264348355, -0.5555702330196022, -0.8314696123025452,
+    -0.9951847266721969, 0.0980171403295606, 0.3826834323650898,
+    -0.9238795325112867, -0.7071067811865476, -0.7071067811865475,
+    -0.9238795325112867, 0.3826834323650898, 0.29028467725446233,
+    -0.9569403357322088, -0.8314696123025452, -0.5555702330196022,
+    -0.773010453362737, 0.6343932841636455, 0.19509032201612825,
+    -0.9807852804032304, -0.9238795325112867, -0.3826834323650898,
+    -0.5555702330196022, 0.8314696123025452, 0.0980171403295606,
+    -0.9951847266721969, -0.9807852804032304, -0.19509032201612825,
+    -0.29028467725446233, 0.9569403357322088, 1.0, 0.0, 1.0, 0.0, 1.0, 0.0,
+    1.0, 0.0, 0.9998072404820648, -0.0196336924606283, 0.9992290362407229,
+    -0.03925981575906861, 0.9982656101847159, -0.05887080365118903,
+    0.996917333733128, -0.07845909572784494, 0.9992290362407229,
+    -0.03925981575906861, 0.996917333733128, -0.07845909572784494,
+    0.9930684569549263, -0.11753739745783764, 0.9876883405951378,
+    -0.15643446504023087, 0.9982656101847159, -0.05887080365118903,
+    0.9930684569549263, -0.11753739745783764, 0.9844265680898916,
+    -0.1757962799343545, 0.9723699203976766, -0.2334453638559054,
+    0.996917333733128, -0.07845909572784494, 0.9876883405951378,
+    -0.15643446504023087, 0.9723699203976766, -0.2334453638559054,
+    0.9510565162951535, -0.3090169943749474, 0.9951847266721969,
+    -0.0980171403295606, 0.9807852804032304, -0.19509032201612825,
+    0.9569403357322088, -0.29028467725446233, 0.9238795325112867,
+    -0.3826834323650898, 0.9930684569549263, -0.11753739745783764,
+    0.9723699203976766, -0.2334453638559054, 0.9381913359224842,
+    -0.34611705707749296, 0.8910065241883679, -0.45399049973954675,
+    0.9905693404435773, -0.13701234168196802, 0.9624552364536473,
+    -0.27144044986507426, 0.916187957117136, -0.40074883310314097,
+    0.8526401643540922, -0.5224985647159488, 0.9876883405951378,
+    -0.15643446504023087, 0.9510565162951535, -0.3090169943749474,
+    0.8910065241883679, -0.45399049973954675, 0.8090169943749475,
+    -0.5877852522924731, 0.9844265680898916, -0.1757962799343545,
+    0.9381913359224842, -0.34611705707749296, 0.8627343859777918,
+    -0.5056573733779846, 0.7604059656000309, -0.6494480483301837,
+    0.9807852804032304, -0.19509032201612825, 0.9238795325112867,
+    -0.3826834323650898, 0.8314696123025452, -0.5555702330196022,
+    0.7071067811865476, -0.7071067811865475, 0.9767658813208724,
+    -0.21430915306505077, 0.9081431738250813, -0.41865973753742813,
+    0.7973206537727071, -0.6035559419535714, 0.6494480483301837,
+    -0.7604059656000309, 0.9723699203976766, -0.2334453638559054,
+    0.8910065241883679, -0.45399049973954675, 0.7604059656000309,
+    -0.6494480483301837, 0.5877852522924731, -0.8090169943749475,
+    0.9675990923602598, -0.25249157701515795, 0.8724960070727972,
+    -0.4886212414969549, 0.7208535967029188, -0.6930873625456359,
+    0.5224985647159488, -0.8526401643540922, 0.9624552364536473,
+    -0.27144044986507426, 0.8526401643540922, -0.5224985647159488,
+    0.6788007455329417, -0.7343225094356856, 0.45399049973954675,
+    -0.8910065241883679, 0.9569403357322088, -0.29028467725446233,
+    0.8314696123025452, -0.5555702330196022, 0.6343932841636455,
+    -0.773010453362737, 0.3826834323650898, -0.9238795325112867,
+    0.9510565162951535, -0.3090169943749474, 0.8090169943749475,
+    -0.5877852522924731, 0.5877852522924731, -0.8090169943749475,
+    0.3090169943749474, -0.9510565162951535, 0.944806046466878,
+    -0.3276301795616935, 0.785316930880745, -0.619093949309834,
+    0.5391383229110002, -0.8422172337162865, 0.2334453638559054,
+    -0.9723699203976766, 0.9381913359224842, -0.34611705707749296,
+    0.7604059656000309, -0.6494480483301837, 0.4886212414969549,
+    -0.8724960070727972, 0.15643446504023087, -0.9876883405951378,
+    0.9312149347588036, -0.36447049987914965, 0.7343225094356856,
+    -0.6788007455329417, 0.436409240673342, -0.8997482840522215,
+    0.07845909572784494, -0.996917333733128, 0.9238795325112867,
+    -0.3826834323650898, 0.7071067811865476, -0.7071067811865475,
+    0.3826834323650898, -0.9238795325112867, -0.0, -1.0, 0.916187957117136,
+    -0.40074883310314097, 0.6788007455329417, -0.7343225094356856,
+    0.3276301795616935, -0.944806046466878, -0.07845909572784494,
+    -0.996917333733128, 0.9081431738250813, -0.41865973753742813,
+    0.6494480483301837, -0.7604059656000309, 0.27144044986507426,
+    -0.9624552364536473, -0.15643446504023087, -0.9876883405951378,
+    0.8997482840522215, -0.436409240673342, 0.619093949309834,
+    -0.785316930880745, 0.21430915306505077, -0.9767658813208724,
+    -0.2334453638559054, -0.9723699203976766, 0.8910065241883679,
+    -0.45399049973954675, 0.5877852522924731, -0.8090169943749475,
+    0.15643446504023087, -0.9876883405951378, -0.3090169943749474,
+    -0.9510565162951535, 0.881921264348355, -0.47139673682599764,
+    0.5555702330196022, -0.8314696123025452, 0.0980171403295606,
+    -0.9951847266721969, -0.3826834323650898, -0.9238795325112867,
+    0.8724960070727972, -0.4886212414969549, 0.5224985647159488,
+    -0.8526401643540922, 0.03925981575906861, -0.9992290362407229,
+    -0.45399049973954675, -0.8910065241883679, 0.8627343859777918,
+    -0.5056573733779846, 0.4886212414969549, -0.8724960070727972,
+    -0.0196336924606283, -0.9998072404820648, -0.5224985647159488,
+    -0.8526401643540922, 0.8526401643540922, -0.5224985647159488,
+    0.45399049973954675, -0.8910065241883679, -0.07845909572784494,
+    -0.996917333733128, -0.5877852522924731, -0.8090169943749475,
+    0.8422172337162865, -0.5391383229110002, 0.41865973753742813,
+    -0.9081431738250813, -0.13701234168196802, -0.9905693404435773,
+    -0.6494480483301837, -0.7604059656000309, 0.8314696123025452,
+    -0.5555702330196022, 0.3826834323650898, -0.9238795325112867,
+    -0.19509032201612825, -0.9807852804032304, -0.7071067811865476,
+    -0.7071067811865475, 0.8204014435255136, -0.5717879602276122,
+    0.34611705707749296, -0.9381913359224842, -0.25249157701515795,
+    -0.9675990923602598, -0.7604059656000309, -0.6494480483301837,
+    0.8090169943749475, -0.5877852522924731, 0.3090169943749474,
+    -0.9510565162951535, -0.3090169943749474, -0.9510565162951535,
+    -0.8090169943749475, -0.5877852522924731, 0.7973206537727071,
+    -0.6035559419535714, 0.27144044986507426, -0.9624552364536473,
+    -0.36447049987914965, -0.9312149347588036, -0.8526401643540922,
+    -0.5224985647159488, 0.785316930880745, -0.619093949309834,
+    0.2334453638559054, -0.9723699203976766, -0.41865973753742813,
+    -0.9081431738250813, -0.8910065241883679, -0.45399049973954675,
+    0.773010453362737, -0.6343932841636455, 0.19509032201612825,
+    -0.9807852804032304, -0.47139673682599764, -0.881921264348355,
+    -0.9238795325112867, -0.3826834323650898, 0.7604059656000309,
+    -0.6494480483301837, 0.15643446504023087, -0.9876883405951378,
+    -0.5224985647159488, -0.8526401643540922, -0.9510565162951535,
+    -0.3090169943749474, 0.7475083268625968, -0.6642524379112817,
+    0.11753739745783764, -0.9930684569549263, -0.5717879602276122,
+    -0.8204014435255136, -0.9723699203976766, -0.2334453638559054,
+    0.7343225094356856, -0.6788007455329417, 0.07845909572784494,
+    -0.996917333733128, -0.619093949309834, -0.785316930880745,
+    -0.9876883405951378, -0.15643446504023087, 0.7208535967029188,
+    -0.6930873625456359, 0.03925981575906861, -0.9992290362407229,
+    -0.6642524379112817, -0.7475083268625968, -0.996917333733128,
+    -0.07845909572784494, 0.7071067811865476, -0.7071067811865475, -0.0,
+    -1.0, -0.7071067811865476, -0.7071067811865475, -1.0, -0.0,
+    0.6930873625456359, -0.7208535967029188, -0.03925981575906861,
+    -0.9992290362407229, -0.7475083268625968, -0.6642524379112817,
+    -0.996917333733128, 0.07845909572784494, 0.6788007455329417,
+    -0.7343225094356856, -0.07845909572784494, -0.996917333733128,
+    -0.785316930880745, -0.619093949309834, -0.9876883405951378,
+    0.15643446504023087, 0.6642524379112817, -0.7475083268625968,
+    -0.11753739745783764, -0.9930684569549263, -0.8204014435255136,
+    -0.5717879602276122, -0.9723699203976766, 0.2334453638559054,
+    0.6494480483301837, -0.7604059656000309, -0.15643446504023087,
+    -0.9876883405951378, -0.8526401643540922, -0.5224985647159488,
+    -0.9510565162951535, 0.3090169943749474, 0.6343932841636455,
+    -0.773010453362737, -0.19509032201612825, -0.9807852804032304,
+    -0.881921264348355, -0.47139673682599764, -0.9238795325112867,
+    0.3826834323650898, 0.619093949309834, -0.785316930880745,
+    -0.2334453638559054, -0.9723699203976766, -0.9081431738250813,
+    -0.41865973753742813, -0.8910065241883679, 0.45399049973954675,
+    0.6035559419535714, -0.7973206537727071, -0.27144044986507426,
+    -0.9624552364536473, -0.9312149347588036, -0.36447049987914965,
+    -0.8526401643540922, 0.5224985647159488, 0.5877852522924731,
+    -0.8090169943749475, -0.3090169943749474, -0.9510565162951535,
+    -0.9510565162951535, -0.3090169943749474, -0.8090169943749475,
+    0.5877852522924731, 0.5717879602276122, -0.8204014435255136,
+    -0.34611705707749296, -0.9381913359224842, -0.9675990923602598,
+    -0.25249157701515795, -0.7604059656000309, 0.6494480483301837,
+    0.5555702330196022, -0.8314696123025452, -0.3826834323650898,
+    -0.9238795325112867, -0.9807852804032304, -0.19509032201612825,
+    -0.7071067811865476, 0.7071067811865475, 0.5391383229110002,
+    -0.8422172337162865, -0.41865973753742813, -0.9081431738250813,
+    -0.9905693404435773, -0.13701234168196802, -0.6494480483301837,
+    0.7604059656000309, 0.5224985647159488, -0.8526401643540922,
+    -0.45399049973954675, -0.8910065241883679, -0.996917333733128,
+    -0.07845909572784494, -0.5877852522924731, 0.8090169943749475,
+    0.5056573733779846, -0.8627343859777918, -0.4886212414969549,
+    -0.8724960070727972, -0.9998072404820648, -0.0196336924606283,
+    -0.5224985647159488, 0.8526401643540922, 0.4886212414969549,
+    -0.8724960070727972, -0.5224985647159488, -0.8526401643540922,
+    -0.9992290362407229, 0.03925981575906861, -0.45399049973954675,
+    0.8910065241883679, 0.47139673682599764, -0.881921264348355,
+    -0.5555702330196022, -0.8314696123025452, -0.9951847266721969,
+    0.0980171403295606, -0.3826834323650898, 0.9238795325112867,
+    0.45399049973954675, -0.8910065241883679, -0.5877852522924731,
+    -0.8090169943749475, -0.9876883405951378, 0.15643446504023087,
+    -0.3090169943749474, 0.9510565162951535, 0.436409240673342,
+    -0.8997482840522215, -0.619093949309834, -0.785316930880745,
+    -0.9767658813208724, 0.21430915306505077, -0.2334453638559054,
+    0.9723699203976766, 0.41865973753742813, -0.9081431738250813,
+    -0.6494480483301837, -0.7604059656000309, -0.9624552364536473,
+    0.27144044986507426, -0.15643446504023087, 0.9876883405951378,
+    0.40074883310314097, -0.916187957117136, -0.6788007455329417,
+    -0.7343225094356856, -0.944806046466878, 0.3276301795616935,
+    -0.07845909572784494, 0.996917333733128, 0.3826834323650898,
+    -0.9238795325112867, -0.7071067811865476, -0.7071067811865475,
+    -0.9238795325112867, 0.3826834323650898, 0.0, 1.0, 0.36447049987914965,
+    -0.9312149347588036, -0.7343225094356856, -0.6788007455329417,
+    -0.8997482840522215, 0.436409240673342, 0.07845909572784494,
+    0.996917333733128, 0.34611705707749296, -0.9381913359224842,
+    -0.7604059656000309, -0.6494480483301837, -0.8724960070727972,
+    0.4886212414969549, 0.15643446504023087, 0.9876883405951378,
+    0.3276301795616935, -0.944806046466878, -0.785316930880745,
+    -0.619093949309834, -0.8422172337162865, 0.5391383229110002,
+    0.2334453638559054, 0.9723699203976766
+]);
+const COMPACT_SCRATCH_RE = new Float64Array(320);
+const COMPACT_SCRATCH_IM = new Float64Array(320);
 
 //
 //  Public functions.
@@ -1053,6 +287,8 @@ function ApplyMixedRadixFFT_320_Part2(re, im) {
  * 
  *  Note(s):
  *    [1] The size of `re` and `im` will not be checked.
+ *    [2] The transform is done by the table-driven loop kernel (compact
+ *        mode), which is smaller but slower than the unrolled kernels.
  * 
  *  @param {Number[]} re 
  *    - The real part of each point.
@@ -1060,8 +296,7 @@ function ApplyMixedRadixFFT_320_Part2(re, im) {
  *    - The imaginary part of each point.
  */
 function ApplyMixedRadixFFT_320(re, im) {
-    ApplyMixedRadixFFT_320_Part1(re, im);
-    ApplyMixedRadixFFT_320_Part2(re, im);
+    MXCompact(re, im, COMPACT_RADICES, COMPACT_INDEXES, COMPACT_TWIDDLES, COMPACT_SCRATCH_RE, COMPACT_SCRATCH_IM);
 }
 
 //  Export public APIs.
@@ -20,1518 +20,290 @@ const Lc3FftMxBaseOp =
     require("./fft-mx-baseop");
 
 //  Imported functions.
-const MXTr2 = 
-    Lc3FftMxBaseOp.MXTr2;
-const MXTr3 = 
-    Lc3FftMxBaseOp.MXTr3;
-const MXTr4 = 
-    Lc3FftMxBaseOp.MXTr4;
-const MXTr5 = 
-    Lc3FftMxBaseOp.MXTr5;
-const MXRot = 
-    Lc3FftMxBaseOp.MXRot;
-const MXSwap = 
-    Lc3FftMxBaseOp.MXSwap;
-const MXCshft = 
-    Lc3FftMxBaseOp.MXCshft;
+// const MXTr2 = 
+//     Lc3FftMxBaseOp.MXTr2;
+// const MXTr3 = 
+//     Lc3FftMxBaseOp.MXTr3;
+// const MXTr4 = 
+//     Lc3FftMxBaseOp.MXTr4;
+// const MXTr5 = 
+//     Lc3FftMxBaseOp.MXTr5;
+// const MXRot = 
+//     Lc3FftMxBaseOp.MXRot;
+// const MXSwap = 
+//     Lc3FftMxBaseOp.MXSwap;
+// const MXCshft = 
+//     Lc3FftMxBaseOp.MXCshft;
+const MXCompact = 
+    Lc3FftMxBaseOp.MXCompact;
 
 //
 //  Constants.
 //
 
-//  Cyclic shift indexes.
-const CSHFT_INDEXES_0 = [1, 72, 182, 145, 28, 240, 3, 216, 133, 256, 129, 310, 41, 84, 296, 141, 82, 152, 190, 37, 204, 295, 69, 308, 239, 355, 71, 110, 50, 48, 246, 93, 260, 9, 306, 95, 62, 146, 100, 14, 324, 299, 357, 215, 61, 74, 326, 101, 86, 98, 278, 279, 351, 125, 22, 150, 46, 102, 158, 280, 15, 54, 336, 137, 202, 151, 118, 284, 303, 221, 85, 26, 96, 134, 328, 245, 21, 78, 272, 189, 307, 167, 178, 286, 105, 32, 186, 91, 116, 140, 10, 36, 132, 184, 289, 321, 83, 224, 301, 77, 200, 7, 162, 160, 16, 126, 94, 332, 191, 109, 320, 11, 108, 248, 237, 211, 115, 68, 236, 139, 346, 107, 176, 142, 154, 334, 335, 65, 20, 6, 90, 44, 300, 5, 18, 270, 45, 30, 42, 156, 136, 130, 40, 12, 180];
-const CSHFT_INDEXES_1 = [2, 144, 298, 285, 33, 258, 273, 261, 81, 80, 8, 234, 337, 209, 313, 257, 201, 79, 344, 305, 23, 222, 157, 208, 241, 75, 56, 138, 274, 333, 263, 225, 31, 114, 338, 281, 87, 170, 52, 192, 181, 73, 254, 327, 173, 268, 243, 219, 349, 323, 227, 175, 70, 38, 276, 135, 58, 282, 159, 352, 197, 199, 343, 233, 265, 27, 168, 250, 39, 348, 251, 111, 122, 148, 244, 291, 123, 220, 13, 252, 183, 217, 205, 25, 24, 294, 339, 353, 269, 315, 59, 354, 341, 89, 314, 329, 317, 203, 223, 229, 319, 347, 179, 358, 287, 177, 214, 331, 119, 356, 143, 226, 103, 230, 49, 318, 275, 63, 218, 277, 207, 169, 322, 155, 64, 290, 51, 120, 4, 288, 249, 309, 311, 113, 266, 99, 350, 53, 264, 297, 213, 259, 345, 35, 60];
-const CSHFT_INDEXES_2 = [17, 198, 271, 117, 212, 187, 163, 232, 193, 253, 255, 57, 210, 43, 228, 247, 165, 34, 330, 47, 174, 340];
-const CSHFT_INDEXES_3 = [19, 342, 161, 88, 242, 147, 172, 196, 127, 166, 106, 104, 302, 149, 316, 131, 112, 194, 325, 29, 312, 185];
-const CSHFT_INDEXES_4 = [55, 66, 92, 188, 235, 67, 164, 304, 293, 267, 171, 124, 292, 195];
-const CSHFT_INDEXES_5 = [76, 128, 238, 283, 231, 121];
-
-//
-//  Private functions.
-//
-
-/**
- *  Part 1 of ApplyMixedRadixFFT_360().
- * 
- *  @param {Number[]} re 
- *    - The real part of each point.
- *  @param {Number[]} im 
- *    - The imaginary part of each point.
- */
-function ApplyMixedRadixFFT_360_Part1(re, im) {
-    MXTr5(re, im, 0, 72, 144, 216, 288);
-    MXTr5(re, im, 1, 73, 145, 217, 289);
-    MXTr5(re, im, 2, 74, 146, 218, 290);
-    MXTr5(re, im, 3, 75, 147, 219, 291);
-    MXTr5(re, im, 4, 76, 148, 220, 292);
-    MXTr5(re, im, 5, 77, 149, 221, 293);
-    MXTr5(re, im, 6, 78, 150, 222, 294);
-    MXTr5(re, im, 7, 79, 151, 223, 295);
-    MXTr5(re, im, 8, 80, 152, 224, 296);
-    MXTr5(re, im, 9, 81, 153, 225, 297);
-    MXTr5(re, im, 10, 82, 154, 226, 298);
-    MXTr5(re, im, 11, 83, 155, 227, 299);
-    MXTr5(re, im, 12, 84, 156, 228, 300);
-    MXTr5(re, im, 13, 85, 157, 229, 301);
-    MXTr5(re, im, 14, 86, 158, 230, 302);
-    MXTr5(re, im, 15, 87, 159, 231, 303);
-    MXTr5(re, im, 16, 88, 160, 232, 304);
-    MXTr5(re, im, 17, 89, 161, 233, 305);
-    MXTr5(re, im, 18, 90, 162, 234, 306);
-    MXTr5(re, im, 19, 91, 163, 235, 307);
-    MXTr5(re, im, 20, 92, 164, 236, 308);
-    MXTr5(re, im, 21, 93, 165, 237, 309);
-    MXTr5(re, im, 22, 94, 166, 238, 310);
-    MXTr5(re, im, 23, 95, 167, 239, 311);
-    MXTr5(re, im, 24, 96, 168, 240, 312);
-    MXTr5(re, im, 25, 97, 169, 241, 313);
-    MXTr5(re, im, 26, 98, 170, 242, 314);
-    MXTr5(re, im, 27, 99, 171, 243, 315);
-    MXTr5(re, im, 28, 100, 172, 244, 316);
-    MXTr5(re, im, 29, 101, 173, 245, 317);
-    MXTr5(re, im, 30, 102, 174, 246, 318);
-    MXTr5(re, im, 31, 103, 175, 247, 319);
-    MXTr5(re, im, 32, 104, 176, 248, 320);
-    MXTr5(re, im, 33, 105, 177, 249, 321);
-    MXTr5(re, im, 34, 106, 178, 250, 322);
-    MXTr5(re, im, 35, 107, 179, 251, 323);
-    MXTr5(re, im, 36, 108, 180, 252, 324);
-    MXTr5(re, im, 37, 109, 181, 253, 325);
-    MXTr5(re, im, 38, 110, 182, 254, 326);
-    MXTr5(re, im, 39, 111, 183, 255, 327);
-    MXTr5(re, im, 40, 112, 184, 256, 328);
-    MXTr5(re, im, 41, 113, 185, 257, 329);
-    MXTr5(re, im, 42, 114, 186, 258, 330);
-    MXTr5(re, im, 43, 115, 187, 259, 331);
-    MXTr5(re, im, 44, 116, 188, 260, 332);
-    MXTr5(re, im, 45, 117, 189, 261, 333);
-    MXTr5(re, im, 46, 118, 190, 262, 334);
-    MXTr5(re, im, 47, 119, 191, 263, 335);
-    MXTr5(re, im, 48, 120, 192, 264, 336);
-    MXTr5(re, im, 49, 121, 193, 265, 337);
-    MXTr5(re, im, 50, 122, 194, 266, 338);
-    MXTr5(re, im, 51, 123, 195, 267, 339);
-    MXTr5(re, im, 52, 124, 196, 268, 340);
-    MXTr5(re, im, 53, 125, 197, 269, 341);
-    MXTr5(re, im, 54, 126, 198, 270, 342);
-    MXTr5(re, im, 55, 127, 199, 271, 343);
-    MXTr5(re, im, 56, 128, 200, 272, 344);
-    MXTr5(re, im, 57, 129, 201, 273, 345);
-    MXTr5(re, im, 58, 130, 202, 274, 346);
-    MXTr5(re, im, 59, 131, 203, 275, 347);
-    MXTr5(re, im, 60, 132, 204, 276, 348);
-    MXTr5(re, im, 61, 133, 205, 277, 349);
-    MXTr5(re, im, 62, 134, 206, 278, 350);
-    MXTr5(re, im, 63, 135, 207, 279, 351);
-    MXTr5(re, im, 64, 136, 208, 280, 352);
-    MXTr5(re, im, 65, 137, 209, 281, 353);
-    MXTr5(re, im, 66, 138, 210, 282, 354);
-    MXTr5(re, im, 67, 139, 211, 283, 355);
-    MXTr5(re, im, 68, 140, 212, 284, 356);
-    MXTr5(re, im, 69, 141, 213, 285, 357);
-    MXTr5(re, im, 70, 142, 214, 286, 358);
-    MXTr5(re, im, 71, 143, 215, 287, 359);
-    MXRot(re, im, 73, 0.9998476951563913, -0.01745240643728351);
-    MXRot(re, im, 74, 0.9993908270190958, -0.03489949670250097);
-    MXRot(re, im, 75, 0.9986295347545738, -0.052335956242943835);
-    MXRot(re, im, 76, 0.9975640502598242, -0.0697564737441253);
-    MXRot(re, im, 77, 0.9961946980917455, -0.08715574274765817);
-    MXRot(re, im, 78, 0.9945218953682733, -0.10452846326765347);
-    MXRot(re, im, 79, 0.992546151641322, -0.12186934340514748);
-    MXRot(re, im, 80, 0.9902680687415704, -0.13917310096006544);
-    MXRot(re, im, 81, 0.9876883405951378, -0.15643446504023087);
-    MXRot(re, im, 82, 0.984807753012208, -0.17364817766693033);
-    MXRot(re, im, 83, 0.981627183447664, -0.1908089953765448);
-    MXRot(re, im, 84, 0.9781476007338057, -0.20791169081775934);
-    MXRot(re, im, 85, 0.9743700647852352, -0.224951054343865);
-    MXRot(re, im, 86, 0.9702957262759965, -0.24192189559966773);
-    MXRot(re, im, 87, 0.9659258262890683, -0.25881904510252074);
-    MXRot(re, im, 88, 0.9612616959383189, -0.27563735581699916);
-    MXRot(re, im, 89, 0.9563047559630354, -0.29237170472273677);
-    MXRot(re, im, 90, 0.9510565162951535, -0.3090169943749474);
-    MXRot(re, im, 91, 0.9455185755993168, -0.3255681544571567);
-    MXRot(re, im, 92, 0.9396926207859084, -0.3420201433256687);
-    MXRot(re, im, 93, 0.9335804264972017, -0.35836794954530027);
-    MXRot(re, im, 94, 0.9271838545667874, -0.374606593415912);
-    MXRot(re, im, 95, 0.9205048534524404, -0.39073112848927377);
-    MXRot(re, im, 96, 0.9135454576426009, -0.4067366430758002);
-    MXRot(re, im, 97, 0.9063077870366499, -0.42261826174069944);
-    MXRot(re, im, 98, 0.898794046299167, -0.4383711467890774);
-    MXRot(re, im, 99, 0.8910065241883679, -0.45399049973954675);
-    MXRot(re, im, 100, 0.882947592858927, -0.4694715627858908);
-    MXRot(re, im, 101, 0.8746197071393957, -0.48480962024633706);
-    MXRot(re, im, 102, 0.8660254037844387, -0.49999999999999994);
-    MXRot(re, im, 103, 0.8571673007021123, -0.5150380749100542);
-    MXRot(re, im, 104, 0.848048096156426, -0.5299192642332049);
-    MXRot(re, im, 105, 0.838670567945424, -0.5446390350150271);
-    MXRot(re, im, 106, 0.8290375725550416, -0.5591929034707469);
-    MXRot(re, im, 107, 0.8191520442889918, -0.573576436351046);
-    MXRot(re, im, 108, 0.8090169943749475, -0.5877852522924731);
-    MXRot(re, im, 109, 0.7986355100472928, -0.6018150231520483);
-    MXRot(re, im, 110, 0.7880107536067219, -0.6156614753256583);
-    MXRot(re, im, 111, 0.7771459614569709, -0.6293203910498374);
-    MXRot(re, im, 112, 0.766044443118978, -0.6427876096865393);
-    MXRot(re, im, 113, 0.754709580222772, -0.6560590289905073);
-    MXRot(re, im, 114, 0.7431448254773942, -0.6691306063588582);
-    MXRot(re, im, 115, 0.7313537016191705, -0.6819983600624985);
-    MXRot(re, im, 116, 0.7193398003386512, -0.6946583704589973);
-    MXRot(re, im, 117, 0.7071067811865476, -0.7071067811865475);
-    MXRot(re, im, 118, 0.6946583704589973, -0.7193398003386511);
-    MXRot(re, im, 119, 0.6819983600624985, -0.7313537016191705);
-    MXRot(re, im, 120, 0.6691306063588582, -0.7431448254773942);
-    MXRot(re, im, 121, 0.6560590289905073, -0.754709580222772);
-    MXRot(re, im, 122, 0.6427876096865394, -0.766044443118978);
-    MXRot(re, im, 123, 0.6293203910498375, -0.7771459614569709);
-    MXRot(re, im, 124, 0.6156614753256583, -0.788010753606722);
-    MXRot(re, im, 125, 0.6018150231520484, -0.7986355100472928);
-    MXRot(re, im, 126, 0.5877852522924731, -0.8090169943749475);
-    MXRot(re, im, 127, 0.5735764363510462, -0.8191520442889918);
-    MXRot(re, im, 128, 0.5591929034707468, -0.8290375725550417);
-    MXRot(re, im, 129, 0.5446390350150271, -0.838670567945424);
-    MXRot(re, im, 130, 0.5299192642332049, -0.848048096156426);
-    MXRot(re, im, 131, 0.5150380749100542, -0.8571673007021123);
-    MXRot(re, im, 132, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 133, 0.4848096202463371, -0.8746197071393957);
-    MXRot(re, im, 134, 0.46947156278589086, -0.8829475928589269);
-    MXRot(re, im, 135, 0.4539904997395468, -0.8910065241883678);
-    MXRot(re, im, 136, 0.43837114678907746, -0.898794046299167);
-    MXRot(re, im, 137, 0.42261826174069944, -0.9063077870366499);
-    MXRot(re, im, 138, 0.4067366430758002, -0.9135454576426009);
-    MXRot(re, im, 139, 0.3907311284892737, -0.9205048534524404);
-    MXRot(re, im, 140, 0.37460659341591196, -0.9271838545667874);
-    MXRot(re, im, 141, 0.3583679495453004, -0.9335804264972017);
-    MXRot(re, im, 142, 0.3420201433256688, -0.9396926207859083);
-    MXRot(re, im, 143, 0.32556815445715676, -0.9455185755993167);
-    MXRot(re, im, 145, 0.9993908270190958, -0.03489949670250097);
-    MXRot(re, im, 146, 0.9975640502598242, -0.0697564737441253);
-    MXRot(re, im, 147, 0.9945218953682733, -0.10452846326765347);
-    MXRot(re, im, 148, 0.9902680687415704, -0.13917310096006544);
-    MXRot(re, im, 149, 0.984807753012208, -0.17364817766693033);
-    MXRot(re, im, 150, 0.9781476007338057, -0.20791169081775934);
-    MXRot(re, im, 151, 0.9702957262759965, -0.24192189559966773);
-    MXRot(re, im, 152, 0.9612616959383189, -0.27563735581699916);
-    MXRot(re, im, 153, 0.9510565162951535, -0.3090169943749474);
-    MXRot(re, im, 154, 0.9396926207859084, -0.3420201433256687);
-    MXRot(re, im, 155, 0.9271838545667874, -0.374606593415912);
-    MXRot(re, im, 156, 0.9135454576426009, -0.4067366430758002);
-    MXRot(re, im, 157, 0.898794046299167, -0.4383711467890774);
-    MXRot(re, im, 158, 0.882947592858927, -0.4694715627858908);
-    MXRot(re, im, 159, 0.8660254037844387, -0.49999999999999994);
-    MXRot(re, im, 160, 0.848048096156426, -0.5299192642332049);
-    MXRot(re, im, 161, 0.8290375725550416, -0.5591929034707469);
-    MXRot(re, im, 162, 0.8090169943749475, -0.5877852522924731);
-    MXRot(re, im, 163, 0.7880107536067219, -0.6156614753256583);
-    MXRot(re, im, 164, 0.766044443118978, -0.6427876096865393);
-    MXRot(re, im, 165, 0.7431448254773942, -0.6691306063588582);
-    MXRot(re, im, 166, 0.7193398003386512, -0.6946583704589973);
-    MXRot(re, im, 167, 0.6946583704589973, -0.7193398003386511);
-    MXRot(re, im, 168, 0.6691306063588582, -0.7431448254773942);
-    MXRot(re, im, 169, 0.6427876096865394, -0.766044443118978);
-    MXRot(re, im, 170, 0.6156614753256583, -0.788010753606722);
-    MXRot(re, im, 171, 0.5877852522924731, -0.8090169943749475);
-    MXRot(re, im, 172, 0.5591929034707468, -0.8290375725550417);
-    MXRot(re, im, 173, 0.5299192642332049, -0.848048096156426);
-    MXRot(re, im, 174, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 175, 0.46947156278589086, -0.8829475928589269);
-    MXRot(re, im, 176, 0.43837114678907746, -0.898794046299167);
-    MXRot(re, im, 177, 0.4067366430758002, -0.9135454576426009);
-    MXRot(re, im, 178, 0.37460659341591196, -0.9271838545667874);
-    MXRot(re, im, 179, 0.3420201433256688, -0.9396926207859083);
-    MXRot(re, im, 180, 0.30901699437494745, -0.9510565162951535);
-    MXRot(re, im, 181, 0.27563735581699916, -0.9612616959383189);
-    MXRot(re, im, 182, 0.24192189559966767, -0.9702957262759965);
-    MXRot(re, im, 183, 0.20791169081775945, -0.9781476007338056);
-    MXRot(re, im, 184, 0.17364817766693041, -0.984807753012208);
-    MXRot(re, im, 185, 0.13917310096006547, -0.9902680687415704);
-    MXRot(re, im, 186, 0.10452846326765346, -0.9945218953682733);
-    MXRot(re, im, 187, 0.06975647374412523, -0.9975640502598242);
-    MXRot(re, im, 188, 0.03489949670250108, -0.9993908270190958);
-    MXRot(re, im, 189, 6.123233995736766e-17, -1.0);
-    MXRot(re, im, 190, -0.034899496702500955, -0.9993908270190958);
-    MXRot(re, im, 191, -0.06975647374412533, -0.9975640502598242);
-    MXRot(re, im, 192, -0.10452846326765355, -0.9945218953682733);
-    MXRot(re, im, 193, -0.13917310096006535, -0.9902680687415704);
-    MXRot(re, im, 194, -0.1736481776669303, -0.984807753012208);
-    MXRot(re, im, 195, -0.20791169081775934, -0.9781476007338057);
-    MXRot(re, im, 196, -0.24192189559966779, -0.9702957262759965);
-    MXRot(re, im, 197, -0.27563735581699905, -0.9612616959383189);
-    MXRot(re, im, 198, -0.30901699437494734, -0.9510565162951536);
-    MXRot(re, im, 199, -0.3420201433256687, -0.9396926207859084);
-    MXRot(re, im, 200, -0.37460659341591207, -0.9271838545667874);
-    MXRot(re, im, 201, -0.40673664307580026, -0.9135454576426009);
-    MXRot(re, im, 202, -0.4383711467890775, -0.8987940462991669);
-    MXRot(re, im, 203, -0.4694715627858909, -0.8829475928589269);
-    MXRot(re, im, 204, -0.4999999999999998, -0.8660254037844387);
-    MXRot(re, im, 205, -0.5299192642332048, -0.8480480961564261);
-    MXRot(re, im, 206, -0.5591929034707467, -0.8290375725550417);
-    MXRot(re, im, 207, -0.587785252292473, -0.8090169943749475);
-    MXRot(re, im, 208, -0.6156614753256583, -0.788010753606722);
-    MXRot(re, im, 209, -0.6427876096865394, -0.766044443118978);
-    MXRot(re, im, 210, -0.6691306063588582, -0.7431448254773942);
-    MXRot(re, im, 211, -0.6946583704589974, -0.7193398003386511);
-    MXRot(re, im, 212, -0.7193398003386512, -0.6946583704589971);
-    MXRot(re, im, 213, -0.743144825477394, -0.6691306063588583);
-    MXRot(re, im, 214, -0.7660444431189779, -0.6427876096865395);
-    MXRot(re, im, 215, -0.7880107536067219, -0.6156614753256584);
-    MXRot(re, im, 217, 0.9986295347545738, -0.052335956242943835);
-    MXRot(re, im, 218, 0.9945218953682733, -0.10452846326765347);
-    MXRot(re, im, 219, 0.9876883405951378, -0.15643446504023087);
-    MXRot(re, im, 220, 0.9781476007338057, -0.20791169081775934);
-    MXRot(re, im, 221, 0.9659258262890683, -0.25881904510252074);
-    MXRot(re, im, 222, 0.9510565162951535, -0.3090169943749474);
-    MXRot(re, im, 223, 0.9335804264972017, -0.35836794954530027);
-    MXRot(re, im, 224, 0.9135454576426009, -0.4067366430758002);
-    MXRot(re, im, 225, 0.8910065241883679, -0.45399049973954675);
-    MXRot(re, im, 226, 0.8660254037844387, -0.49999999999999994);
-    MXRot(re, im, 227, 0.838670567945424, -0.5446390350150271);
-    MXRot(re, im, 228, 0.8090169943749475, -0.5877852522924731);
-    MXRot(re, im, 229, 0.7771459614569709, -0.6293203910498374);
-    MXRot(re, im, 230, 0.7431448254773942, -0.6691306063588582);
-    MXRot(re, im, 231, 0.7071067811865476, -0.7071067811865475);
-    MXRot(re, im, 232, 0.6691306063588582, -0.7431448254773942);
-    MXRot(re, im, 233, 0.6293203910498375, -0.7771459614569709);
-    MXRot(re, im, 234, 0.5877852522924731, -0.8090169943749475);
-    MXRot(re, im, 235, 0.5446390350150271, -0.838670567945424);
-    MXRot(re, im, 236, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 237, 0.4539904997395468, -0.8910065241883678);
-    MXRot(re, im, 238, 0.4067366430758002, -0.9135454576426009);
-    MXRot(re, im, 239, 0.3583679495453004, -0.9335804264972017);
-    MXRot(re, im, 240, 0.30901699437494745, -0.9510565162951535);
-    MXRot(re, im, 241, 0.25881904510252074, -0.9659258262890683);
-    MXRot(re, im, 242, 0.20791169081775945, -0.9781476007338056);
-    MXRot(re, im, 243, 0.15643446504023092, -0.9876883405951378);
-    MXRot(re, im, 244, 0.10452846326765346, -0.9945218953682733);
-    MXRot(re, im, 245, 0.052335956242943966, -0.9986295347545738);
-    MXRot(re, im, 246, 6.123233995736766e-17, -1.0);
-    MXRot(re, im, 247, -0.05233595624294384, -0.9986295347545738);
-    MXRot(re, im, 248, -0.10452846326765355, -0.9945218953682733);
-    MXRot(re, im, 249, -0.1564344650402308, -0.9876883405951378);
-    MXRot(re, im, 250, -0.20791169081775934, -0.9781476007338057);
-    MXRot(re, im, 251, -0.25881904510252085, -0.9659258262890683);
-    MXRot(re, im, 252, -0.30901699437494734, -0.9510565162951536);
-    MXRot(re, im, 253, -0.35836794954530027, -0.9335804264972017);
-    MXRot(re, im, 254, -0.40673664307580026, -0.9135454576426009);
-    MXRot(re, im, 255, -0.4539904997395467, -0.8910065241883679);
-    MXRot(re, im, 256, -0.4999999999999998, -0.8660254037844387);
-    MXRot(re, im, 257, -0.5446390350150271, -0.8386705679454239);
-    MXRot(re, im, 258, -0.587785252292473, -0.8090169943749475);
-    MXRot(re, im, 259, -0.6293203910498373, -0.777145961456971);
-    MXRot(re, im, 260, -0.6691306063588582, -0.7431448254773942);
-    MXRot(re, im, 261, -0.7071067811865475, -0.7071067811865476);
-    MXRot(re, im, 262, -0.743144825477394, -0.6691306063588583);
-    MXRot(re, im, 263, -0.7771459614569709, -0.6293203910498374);
-    MXRot(re, im, 264, -0.8090169943749473, -0.5877852522924732);
-    MXRot(re, im, 265, -0.8386705679454239, -0.5446390350150273);
-    MXRot(re, im, 266, -0.8660254037844387, -0.49999999999999994);
-    MXRot(re, im, 267, -0.8910065241883678, -0.45399049973954686);
-    MXRot(re, im, 268, -0.9135454576426008, -0.40673664307580043);
-    MXRot(re, im, 269, -0.9335804264972017, -0.3583679495453002);
-    MXRot(re, im, 270, -0.9510565162951535, -0.3090169943749475);
-    MXRot(re, im, 271, -0.9659258262890682, -0.258819045102521);
-    MXRot(re, im, 272, -0.9781476007338057, -0.20791169081775931);
-    MXRot(re, im, 273, -0.9876883405951377, -0.15643446504023098);
-    MXRot(re, im, 274, -0.9945218953682733, -0.10452846326765373);
-    MXRot(re, im, 275, -0.9986295347545738, -0.05233595624294381);
-    MXRot(re, im, 276, -1.0, -1.2246467991473532e-16);
-    MXRot(re, im, 277, -0.9986295347545738, 0.052335956242943564);
-    MXRot(re, im, 278, -0.9945218953682733, 0.1045284632676535);
-    MXRot(re, im, 279, -0.9876883405951378, 0.15643446504023073);
-    MXRot(re, im, 280, -0.9781476007338056, 0.2079116908177595);
-    MXRot(re, im, 281, -0.9659258262890683, 0.2588190451025208);
-    MXRot(re, im, 282, -0.9510565162951536, 0.3090169943749473);
-    MXRot(re, im, 283, -0.9335804264972017, 0.35836794954530043);
-    MXRot(re, im, 284, -0.9135454576426009, 0.4067366430758002);
-    MXRot(re, im, 285, -0.8910065241883679, 0.4539904997395467);
-    MXRot(re, im, 286, -0.8660254037844386, 0.5000000000000001);
-    MXRot(re, im, 287, -0.838670567945424, 0.5446390350150271);
-    MXRot(re, im, 289, 0.9975640502598242, -0.0697564737441253);
-    MXRot(re, im, 290, 0.9902680687415704, -0.13917310096006544);
-    MXRot(re, im, 291, 0.9781476007338057, -0.20791169081775934);
-    MXRot(re, im, 292, 0.9612616959383189, -0.27563735581699916);
-    MXRot(re, im, 293, 0.9396926207859084, -0.3420201433256687);
-    MXRot(re, im, 294, 0.9135454576426009, -0.4067366430758002);
-    MXRot(re, im, 295, 0.882947592858927, -0.4694715627858908);
-    MXRot(re, im, 296, 0.848048096156426, -0.5299192642332049);
-    MXRot(re, im, 297, 0.8090169943749475, -0.5877852522924731);
-    MXRot(re, im, 298, 0.766044443118978, -0.6427876096865393);
-    MXRot(re, im, 299, 0.7193398003386512, -0.6946583704589973);
-    MXRot(re, im, 300, 0.6691306063588582, -0.7431448254773942);
-    MXRot(re, im, 301, 0.6156614753256583, -0.788010753606722);
-    MXRot(re, im, 302, 0.5591929034707468, -0.8290375725550417);
-    MXRot(re, im, 303, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 304, 0.43837114678907746, -0.898794046299167);
-    MXRot(re, im, 305, 0.37460659341591196, -0.9271838545667874);
-    MXRot(re, im, 306, 0.30901699437494745, -0.9510565162951535);
-    MXRot(re, im, 307, 0.24192189559966767, -0.9702957262759965);
-    MXRot(re, im, 308, 0.17364817766693041, -0.984807753012208);
-    MXRot(re, im, 309, 0.10452846326765346, -0.9945218953682733);
-    MXRot(re, im, 310, 0.03489949670250108, -0.9993908270190958);
-    MXRot(re, im, 311, -0.034899496702500955, -0.9993908270190958);
-    MXRot(re, im, 312, -0.10452846326765355, -0.9945218953682733);
-    MXRot(re, im, 313, -0.1736481776669303, -0.984807753012208);
-    MXRot(re, im, 314, -0.24192189559966779, -0.9702957262759965);
-    MXRot(re, im, 315, -0.30901699437494734, -0.9510565162951536);
-    MXRot(re, im, 316, -0.37460659341591207, -0.9271838545667874);
-    MXRot(re, im, 317, -0.4383711467890775, -0.8987940462991669);
-    MXRot(re, im, 318, -0.4999999999999998, -0.8660254037844387);
-    MXRot(re, im, 319, -0.5591929034707467, -0.8290375725550417);
-    MXRot(re, im, 320, -0.6156614753256583, -0.788010753606722);
-    MXRot(re, im, 321, -0.6691306063588582, -0.7431448254773942);
-    MXRot(re, im, 322, -0.7193398003386512, -0.6946583704589971);
-    MXRot(re, im, 323, -0.7660444431189779, -0.6427876096865395);
-    MXRot(re, im, 324, -0.8090169943749473, -0.5877852522924732);
-    MXRot(re, im, 325, -0.848048096156426, -0.5299192642332049);
-    MXRot(re, im, 326, -0.882947592858927, -0.4694715627858907);
-    MXRot(re, im, 327, -0.9135454576426008, -0.40673664307580043);
-    MXRot(re, im, 328, -0.9396926207859083, -0.3420201433256689);
-    MXRot(re, im, 329, -0.9612616959383189, -0.2756373558169992);
-    MXRot(re, im, 330, -0.9781476007338057, -0.20791169081775931);
-    MXRot(re, im, 331, -0.9902680687415704, -0.13917310096006533);
-    MXRot(re, im, 332, -0.9975640502598242, -0.06975647374412552);
-    MXRot(re, im, 333, -1.0, -1.2246467991473532e-16);
-    MXRot(re, im, 334, -0.9975640502598242, 0.06975647374412527);
-    MXRot(re, im, 335, -0.9902680687415703, 0.13917310096006552);
-    MXRot(re, im, 336, -0.9781476007338056, 0.2079116908177595);
-    MXRot(re, im, 337, -0.9612616959383189, 0.275637355816999);
-    MXRot(re, im, 338, -0.9396926207859084, 0.34202014332566866);
-    MXRot(re, im, 339, -0.9135454576426009, 0.4067366430758002);
-    MXRot(re, im, 340, -0.8829475928589269, 0.46947156278589086);
-    MXRot(re, im, 341, -0.8480480961564261, 0.5299192642332048);
-    MXRot(re, im, 342, -0.8090169943749476, 0.587785252292473);
-    MXRot(re, im, 343, -0.766044443118978, 0.6427876096865393);
-    MXRot(re, im, 344, -0.7193398003386511, 0.6946583704589974);
-    MXRot(re, im, 345, -0.6691306063588581, 0.7431448254773944);
-    MXRot(re, im, 346, -0.6156614753256581, 0.7880107536067221);
-    MXRot(re, im, 347, -0.5591929034707466, 0.8290375725550418);
-    MXRot(re, im, 348, -0.5000000000000004, 0.8660254037844384);
-    MXRot(re, im, 349, -0.43837114678907774, 0.8987940462991668);
-    MXRot(re, im, 350, -0.3746065934159123, 0.9271838545667873);
-    MXRot(re, im, 351, -0.30901699437494756, 0.9510565162951535);
-    MXRot(re, im, 352, -0.24192189559966779, 0.9702957262759965);
-    MXRot(re, im, 353, -0.17364817766693033, 0.984807753012208);
-    MXRot(re, im, 354, -0.10452846326765336, 0.9945218953682734);
-    MXRot(re, im, 355, -0.03489949670250076, 0.9993908270190958);
-    MXRot(re, im, 356, 0.03489949670250128, 0.9993908270190958);
-    MXRot(re, im, 357, 0.10452846326765299, 0.9945218953682734);
-    MXRot(re, im, 358, 0.17364817766692997, 0.9848077530122081);
-    MXRot(re, im, 359, 0.24192189559966745, 0.9702957262759966);
-    MXTr4(re, im, 0, 18, 36, 54);
-    MXTr4(re, im, 1, 19, 37, 55);
-    MXTr4(re, im, 2, 20, 38, 56);
-    MXTr4(re, im, 3, 21, 39, 57);
-    MXTr4(re, im, 4, 22, 40, 58);
-    MXTr4(re, im, 5, 23, 41, 59);
-    MXTr4(re, im, 6, 24, 42, 60);
-    MXTr4(re, im, 7, 25, 43, 61);
-    MXTr4(re, im, 8, 26, 44, 62);
-    MXTr4(re, im, 9, 27, 45, 63);
-    MXTr4(re, im, 10, 28, 46, 64);
-    MXTr4(re, im, 11, 29, 47, 65);
-    MXTr4(re, im, 12, 30, 48, 66);
-    MXTr4(re, im, 13, 31, 49, 67);
-    MXTr4(re, im, 14, 32, 50, 68);
-    MXTr4(re, im, 15, 33, 51, 69);
-    MXTr4(re, im, 16, 34, 52, 70);
-    MXTr4(re, im, 17, 35, 53, 71);
-    MXRot(re, im, 19, 0.9961946980917455, -0.08715574274765817);
-    MXRot(re, im, 20, 0.984807753012208, -0.17364817766693033);
-    MXRot(re, im, 21, 0.9659258262890683, -0.25881904510252074);
-    MXRot(re, im, 22, 0.9396926207859084, -0.3420201433256687);
-    MXRot(re, im, 23, 0.9063077870366499, -0.42261826174069944);
-    MXRot(re, im, 24, 0.8660254037844387, -0.49999999999999994);
-    MXRot(re, im, 25, 0.8191520442889918, -0.573576436351046);
-    MXRot(re, im, 26, 0.766044443118978, -0.6427876096865393);
-    MXRot(re, im, 27, 0.7071067811865476, -0.7071067811865475);
-    MXRot(re, im, 28, 0.6427876096865394, -0.766044443118978);
-    MXRot(re, im, 29, 0.5735764363510462, -0.8191520442889918);
-    MXRot(re, im, 30, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 31, 0.42261826174069944, -0.9063077870366499);
-    MXRot(re, im, 32, 0.3420201433256688, -0.9396926207859083);
-    MXRot(re, im, 33, 0.25881904510252074, -0.9659258262890683);
-    MXRot(re, im, 34, 0.17364817766693041, -0.984807753012208);
-    MXRot(re, im, 35, 0.08715574274765836, -0.9961946980917455);
-    MXRot(re, im, 37, 0.984807753012208, -0.17364817766693033);
-    MXRot(re, im, 38, 0.9396926207859084, -0.3420201433256687);
-    MXRot(re, im, 39, 0.8660254037844387, -0.49999999999999994);
-    MXRot(re, im, 40, 0.766044443118978, -0.6427876096865393);
-    MXRot(re, im, 41, 0.6427876096865394, -0.766044443118978);
-    MXRot(re, im, 42, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 43, 0.3420201433256688, -0.9396926207859083);
-    MXRot(re, im, 44, 0.17364817766693041, -0.984807753012208);
-    MXRot(re, im, 45, 6.123233995736766e-17, -1.0);
-    MXRot(re, im, 46, -0.1736481776669303, -0.984807753012208);
-    MXRot(re, im, 47, -0.3420201433256687, -0.9396926207859084);
-    MXRot(re, im, 48, -0.4999999999999998, -0.8660254037844387);
-    MXRot(re, im, 49, -0.6427876096865394, -0.766044443118978);
-    MXRot(re, im, 50, -0.7660444431189779, -0.6427876096865395);
-    MXRot(re, im, 51, -0.8660254037844387, -0.49999999999999994);
-    MXRot(re, im, 52, -0.9396926207859083, -0.3420201433256689);
-    MXRot(re, im, 53, -0.984807753012208, -0.1736481776669307);
-    MXRot(re, im, 55, 0.9659258262890683, -0.25881904510252074);
-    MXRot(re, im, 56, 0.8660254037844387, -0.49999999999999994);
-    MXRot(re, im, 57, 0.7071067811865476, -0.7071067811865475);
-    MXRot(re, im, 58, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 59, 0.25881904510252074, -0.9659258262890683);
-    MXRot(re, im, 60, 6.123233995736766e-17, -1.0);
-    MXRot(re, im, 61, -0.25881904510252063, -0.9659258262890683);
-    MXRot(re, im, 62, -0.4999999999999998, -0.8660254037844387);
-    MXRot(re, im, 63, -0.7071067811865475, -0.7071067811865476);
-    MXRot(re, im, 64, -0.8660254037844387, -0.49999999999999994);
-    MXRot(re, im, 65, -0.9659258262890682, -0.258819045102521);
-    MXRot(re, im, 66, -1.0, -1.2246467991473532e-16);
-    MXRot(re, im, 67, -0.9659258262890683, 0.2588190451025208);
-    MXRot(re, im, 68, -0.8660254037844388, 0.4999999999999997);
-    MXRot(re, im, 69, -0.7071067811865477, 0.7071067811865475);
-    MXRot(re, im, 70, -0.5000000000000004, 0.8660254037844384);
-    MXRot(re, im, 71, -0.25881904510252063, 0.9659258262890683);
-    MXTr3(re, im, 0, 6, 12);
-    MXTr3(re, im, 1, 7, 13);
-    MXTr3(re, im, 2, 8, 14);
-    MXTr3(re, im, 3, 9, 15);
-    MXTr3(re, im, 4, 10, 16);
-    MXTr3(re, im, 5, 11, 17);
-    MXRot(re, im, 7, 0.9396926207859084, -0.3420201433256687);
-    MXRot(re, im, 8, 0.766044443118978, -0.6427876096865393);
-    MXRot(re, im, 9, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 10, 0.17364817766693041, -0.984807753012208);
-    MXRot(re, im, 11, -0.1736481776669303, -0.984807753012208);
-    MXRot(re, im, 13, 0.766044443118978, -0.6427876096865393);
-    MXRot(re, im, 14, 0.17364817766693041, -0.984807753012208);
-    MXRot(re, im, 15, -0.4999999999999998, -0.8660254037844387);
-    MXRot(re, im, 16, -0.9396926207859083, -0.3420201433256689);
-    MXRot(re, im, 17, -0.9396926207859084, 0.34202014332566866);
-    MXTr3(re, im, 0, 2, 4);
-    MXTr3(re, im, 1, 3, 5);
-    MXRot(re, im, 3, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 5, -0.4999999999999998, -0.8660254037844387);
-    MXTr2(re, im, 0, 1);
-    MXTr2(re, im, 2, 3);
-    MXTr2(re, im, 4, 5);
-    MXTr3(re, im, 6, 8, 10);
-    MXTr3(re, im, 7, 9, 11);
-    MXRot(re, im, 9, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 11, -0.4999999999999998, -0.8660254037844387);
-    MXTr2(re, im, 6, 7);
-    MXTr2(re, im, 8, 9);
-    MXTr2(re, im, 10, 11);
-    MXTr3(re, im, 12, 14, 16);
-    MXTr3(re, im, 13, 15, 17);
-    MXRot(re, im, 15, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 17, -0.4999999999999998, -0.8660254037844387);
-    MXTr2(re, im, 12, 13);
-    MXTr2(re, im, 14, 15);
-    MXTr2(re, im, 16, 17);
-    MXTr3(re, im, 18, 24, 30);
-    MXTr3(re, im, 19, 25, 31);
-    MXTr3(re, im, 20, 26, 32);
-    MXTr3(re, im, 21, 27, 33);
-    MXTr3(re, im, 22, 28, 34);
-    MXTr3(re, im, 23, 29, 35);
-    MXRot(re, im, 25, 0.9396926207859084, -0.3420201433256687);
-    MXRot(re, im, 26, 0.766044443118978, -0.6427876096865393);
-    MXRot(re, im, 27, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 28, 0.17364817766693041, -0.984807753012208);
-    MXRot(re, im, 29, -0.1736481776669303, -0.984807753012208);
-    MXRot(re, im, 31, 0.766044443118978, -0.6427876096865393);
-    MXRot(re, im, 32, 0.17364817766693041, -0.984807753012208);
-    MXRot(re, im, 33, -0.4999999999999998, -0.8660254037844387);
-    MXRot(re, im, 34, -0.9396926207859083, -0.3420201433256689);
-    MXRot(re, im, 35, -0.9396926207859084, 0.34202014332566866);
-    MXTr3(re, im, 18, 20, 22);
-    MXTr3(re, im, 19, 21, 23);
-    MXRot(re, im, 21, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 23, -0.4999999999999998, -0.8660254037844387);
-    MXTr2(re, im, 18, 19);
-    MXTr2(re, im, 20, 21);
-    MXTr2(re, im, 22, 23);
-    MXTr3(re, im, 24, 26, 28);
-    MXTr3(re, im, 25, 27, 29);
-    MXRot(re, im, 27, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 29, -0.4999999999999998, -0.8660254037844387);
-    MXTr2(re, im, 24, 25);
-    MXTr2(re, im, 26, 27);
-    MXTr2(re, im, 28, 29);
-    MXTr3(re, im, 30, 32, 34);
-    MXTr3(re, im, 31, 33, 35);
-    MXRot(re, im, 33, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 35, -0.4999999999999998, -0.8660254037844387);
-    MXTr2(re, im, 30, 31);
-    MXTr2(re, im, 32, 33);
-    MXTr2(re, im, 34, 35);
-    MXTr3(re, im, 36, 42, 48);
-}
-
-/**
- *  Part 2 of ApplyMixedRadixFFT_360().
- * 
- *  @param {Number[]} re 
- *    - The real part of each point.
- *  @param {Number[]} im 
- *    - The imaginary part of each point.
- */
-function ApplyMixedRadixFFT_360_Part2(re, im) {
-    MXTr3(re, im, 37, 43, 49);
-    MXTr3(re, im, 38, 44, 50);
-    MXTr3(re, im, 39, 45, 51);
-    MXTr3(re, im, 40, 46, 52);
-    MXTr3(re, im, 41, 47, 53);
-    MXRot(re, im, 43, 0.9396926207859084, -0.3420201433256687);
-    MXRot(re, im, 44, 0.766044443118978, -0.6427876096865393);
-    MXRot(re, im, 45, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 46, 0.17364817766693041, -0.984807753012208);
-    MXRot(re, im, 47, -0.1736481776669303, -0.984807753012208);
-    MXRot(re, im, 49, 0.766044443118978, -0.6427876096865393);
-    MXRot(re, im, 50, 0.17364817766693041, -0.984807753012208);
-    MXRot(re, im, 51, -0.4999999999999998, -0.8660254037844387);
-    MXRot(re, im, 52, -0.9396926207859083, -0.3420201433256689);
-    MXRot(re, im, 53, -0.9396926207859084, 0.34202014332566866);
-    MXTr3(re, im, 36, 38, 40);
-    MXTr3(re, im, 37, 39, 41);
-    MXRot(re, im, 39, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 41, -0.4999999999999998, -0.8660254037844387);
-    MXTr2(re, im, 36, 37);
-    MXTr2(re, im, 38, 39);
-    MXTr2(re, im, 40, 41);
-    MXTr3(re, im, 42, 44, 46);
-    MXTr3(re, im, 43, 45, 47);
-    MXRot(re, im, 45, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 47, -0.4999999999999998, -0.8660254037844387);
-    MXTr2(re, im, 42, 43);
-    MXTr2(re, im, 44, 45);
-    MXTr2(re, im, 46, 47);
-    MXTr3(re, im, 48, 50, 52);
-    MXTr3(re, im, 49, 51, 53);
-    MXRot(re, im, 51, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 53, -0.4999999999999998, -0.8660254037844387);
-    MXTr2(re, im, 48, 49);
-    MXTr2(re, im, 50, 51);
-    MXTr2(re, im, 52, 53);
-    MXTr3(re, im, 54, 60, 66);
-    MXTr3(re, im, 55, 61, 67);
-    MXTr3(re, im, 56, 62, 68);
-    MXTr3(re, im, 57, 63, 69);
-    MXTr3(re, im, 58, 64, 70);
-    MXTr3(re, im, 59, 65, 71);
-    MXRot(re, im, 61, 0.9396926207859084, -0.3420201433256687);
-    MXRot(re, im, 62, 0.766044443118978, -0.6427876096865393);
-    MXRot(re, im, 63, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 64, 0.17364817766693041, -0.984807753012208);
-    MXRot(re, im, 65, -0.1736481776669303, -0.984807753012208);
-    MXRot(re, im, 67, 0.766044443118978, -0.6427876096865393);
-    MXRot(re, im, 68, 0.17364817766693041, -0.984807753012208);
-    MXRot(re, im, 69, -0.4999999999999998, -0.8660254037844387);
-    MXRot(re, im, 70, -0.9396926207859083, -0.3420201433256689);
-    MXRot(re, im, 71, -0.9396926207859084, 0.34202014332566866);
-    MXTr3(re, im, 54, 56, 58);
-    MXTr3(re, im, 55, 57, 59);
-    MXRot(re, im, 57, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 59, -0.4999999999999998, -0.8660254037844387);
-    MXTr2(re, im, 54, 55);
-    MXTr2(re, im, 56, 57);
-    MXTr2(re, im, 58, 59);
-    MXTr3(re, im, 60, 62, 64);
-    MXTr3(re, im, 61, 63, 65);
-    MXRot(re, im, 63, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 65, -0.4999999999999998, -0.8660254037844387);
-    MXTr2(re, im, 60, 61);
-    MXTr2(re, im, 62, 63);
-    MXTr2(re, im, 64, 65);
-    MXTr3(re, im, 66, 68, 70);
-    MXTr3(re, im, 67, 69, 71);
-    MXRot(re, im, 69, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 71, -0.4999999999999998, -0.8660254037844387);
-    MXTr2(re, im, 66, 67);
-    MXTr2(re, im, 68, 69);
-    MXTr2(re, im, 70, 71);
-    MXTr4(re, im, 72, 90, 108, 126);
-    MXTr4(re, im, 73, 91, 109, 127);
-    MXTr4(re, im, 74, 92, 110, 128);
-    MXTr4(re, im, 75, 93, 111, 129);
-    MXTr4(re, im, 76, 94, 112, 130);
-    MXTr4(re, im, 77, 95, 113, 131);
-    MXTr4(re, im, 78, 96, 114, 132);
-    MXTr4(re, im, 79, 97, 115, 133);
-    MXTr4(re, im, 80, 98, 116, 134);
-    MXTr4(re, im, 81, 99, 117, 135);
-    MXTr4(re, im, 82, 100, 118, 136);
-    MXTr4(re, im, 83, 101, 119, 137);
-    MXTr4(re, im, 84, 102, 120, 138);
-    MXTr4(re, im, 85, 103, 121, 139);
-    MXTr4(re, im, 86, 104, 122, 140);
-    MXTr4(re, im, 87, 105, 123, 141);
-    MXTr4(re, im, 88, 106, 124, 142);
-    MXTr4(re, im, 89, 107, 125, 143);
-    MXRot(re, im, 91, 0.9961946980917455, -0.08715574274765817);
-    MXRot(re, im, 92, 0.984807753012208, -0.17364817766693033);
-    MXRot(re, im, 93, 0.9659258262890683, -0.25881904510252074);
-    MXRot(re, im, 94, 0.9396926207859084, -0.3420201433256687);
-    MXRot(re, im, 95, 0.9063077870366499, -0.42261826174069944);
-    MXRot(re, im, 96, 0.8660254037844387, -0.49999999999999994);
-    MXRot(re, im, 97, 0.8191520442889918, -0.573576436351046);
-    MXRot(re, im, 98, 0.766044443118978, -0.6427876096865393);
-    MXRot(re, im, 99, 0.7071067811865476, -0.7071067811865475);
-    MXRot(re, im, 100, 0.6427876096865394, -0.766044443118978);
-    MXRot(re, im, 101, 0.5735764363510462, -0.8191520442889918);
-    MXRot(re, im, 102, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 103, 0.42261826174069944, -0.9063077870366499);
-    MXRot(re, im, 104, 0.3420201433256688, -0.9396926207859083);
-    MXRot(re, im, 105, 0.25881904510252074, -0.9659258262890683);
-    MXRot(re, im, 106, 0.17364817766693041, -0.984807753012208);
-    MXRot(re, im, 107, 0.08715574274765836, -0.9961946980917455);
-    MXRot(re, im, 109, 0.984807753012208, -0.17364817766693033);
-    MXRot(re, im, 110, 0.9396926207859084, -0.3420201433256687);
-    MXRot(re, im, 111, 0.8660254037844387, -0.49999999999999994);
-    MXRot(re, im, 112, 0.766044443118978, -0.6427876096865393);
-    MXRot(re, im, 113, 0.6427876096865394, -0.766044443118978);
-    MXRot(re, im, 114, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 115, 0.3420201433256688, -0.9396926207859083);
-    MXRot(re, im, 116, 0.17364817766693041, -0.984807753012208);
-    MXRot(re, im, 117, 6.123233995736766e-17, -1.0);
-    MXRot(re, im, 118, -0.1736481776669303, -0.984807753012208);
-    MXRot(re, im, 119, -0.3420201433256687, -0.9396926207859084);
-    MXRot(re, im, 120, -0.4999999999999998, -0.8660254037844387);
-    MXRot(re, im, 121, -0.6427876096865394, -0.766044443118978);
-    MXRot(re, im, 122, -0.7660444431189779, -0.6427876096865395);
-    MXRot(re, im, 123, -0.8660254037844387, -0.49999999999999994);
-    MXRot(re, im, 124, -0.9396926207859083, -0.3420201433256689);
-    MXRot(re, im, 125, -0.984807753012208, -0.1736481776669307);
-    MXRot(re, im, 127, 0.9659258262890683, -0.25881904510252074);
-    MXRot(re, im, 128, 0.8660254037844387, -0.49999999999999994);
-    MXRot(re, im, 129, 0.7071067811865476, -0.7071067811865475);
-    MXRot(re, im, 130, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 131, 0.25881904510252074, -0.9659258262890683);
-    MXRot(re, im, 132, 6.123233995736766e-17, -1.0);
-    MXRot(re, im, 133, -0.25881904510252063, -0.9659258262890683);
-    MXRot(re, im, 134, -0.4999999999999998, -0.8660254037844387);
-    MXRot(re, im, 135, -0.7071067811865475, -0.7071067811865476);
-    MXRot(re, im, 136, -0.8660254037844387, -0.49999999999999994);
-    MXRot(re, im, 137, -0.9659258262890682, -0.258819045102521);
-    MXRot(re, im, 138, -1.0, -1.2246467991473532e-16);
-    MXRot(re, im, 139, -0.9659258262890683, 0.2588190451025208);
-    MXRot(re, im, 140, -0.8660254037844388, 0.4999999999999997);
-    MXRot(re, im, 141, -0.7071067811865477, 0.7071067811865475);
-    MXRot(re, im, 142, -0.5000000000000004, 0.8660254037844384);
-    MXRot(re, im, 143, -0.25881904510252063, 0.9659258262890683);
-    MXTr3(re, im, 72, 78, 84);
-    MXTr3(re, im, 73, 79, 85);
-    MXTr3(re, im, 74, 80, 86);
-    MXTr3(re, im, 75, 81, 87);
-    MXTr3(re, im, 76, 82, 88);
-    MXTr3(re, im, 77, 83, 89);
-    MXRot(re, im, 79, 0.9396926207859084, -0.3420201433256687);
-    MXRot(re, im, 80, 0.766044443118978, -0.6427876096865393);
-    MXRot(re, im, 81, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 82, 0.17364817766693041, -0.984807753012208);
-    MXRot(re, im, 83, -0.1736481776669303, -0.984807753012208);
-    MXRot(re, im, 85, 0.766044443118978, -0.6427876096865393);
-    MXRot(re, im, 86, 0.17364817766693041, -0.984807753012208);
-    MXRot(re, im, 87, -0.4999999999999998, -0.8660254037844387);
-    MXRot(re, im, 88, -0.9396926207859083, -0.3420201433256689);
-    MXRot(re, im, 89, -0.9396926207859084, 0.34202014332566866);
-    MXTr3(re, im, 72, 74, 76);
-    MXTr3(re, im, 73, 75, 77);
-    MXRot(re, im, 75, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 77, -0.4999999999999998, -0.8660254037844387);
-    MXTr2(re, im, 72, 73);
-    MXTr2(re, im, 74, 75);
-    MXTr2(re, im, 76, 77);
-    MXTr3(re, im, 78, 80, 82);
-    MXTr3(re, im, 79, 81, 83);
-    MXRot(re, im, 81, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 83, -0.4999999999999998, -0.8660254037844387);
-    MXTr2(re, im, 78, 79);
-    MXTr2(re, im, 80, 81);
-    MXTr2(re, im, 82, 83);
-    MXTr3(re, im, 84, 86, 88);
-    MXTr3(re, im, 85, 87, 89);
-    MXRot(re, im, 87, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 89, -0.4999999999999998, -0.8660254037844387);
-    MXTr2(re, im, 84, 85);
-    MXTr2(re, im, 86, 87);
-    MXTr2(re, im, 88, 89);
-    MXTr3(re, im, 90, 96, 102);
-    MXTr3(re, im, 91, 97, 103);
-    MXTr3(re, im, 92, 98, 104);
-    MXTr3(re, im, 93, 99, 105);
-    MXTr3(re, im, 94, 100, 106);
-    MXTr3(re, im, 95, 101, 107);
-    MXRot(re, im, 97, 0.9396926207859084, -0.3420201433256687);
-    MXRot(re, im, 98, 0.766044443118978, -0.6427876096865393);
-    MXRot(re, im, 99, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 100, 0.17364817766693041, -0.984807753012208);
-    MXRot(re, im, 101, -0.1736481776669303, -0.984807753012208);
-    MXRot(re, im, 103, 0.766044443118978, -0.6427876096865393);
-    MXRot(re, im, 104, 0.17364817766693041, -0.984807753012208);
-    MXRot(re, im, 105, -0.4999999999999998, -0.8660254037844387);
-    MXRot(re, im, 106, -0.9396926207859083, -0.3420201433256689);
-    MXRot(re, im, 107, -0.9396926207859084, 0.34202014332566866);
-    MXTr3(re, im, 90, 92, 94);
-    MXTr3(re, im, 91, 93, 95);
-    MXRot(re, im, 93, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 95, -0.4999999999999998, -0.8660254037844387);
-    MXTr2(re, im, 90, 91);
-    MXTr2(re, im, 92, 93);
-    MXTr2(re, im, 94, 95);
-    MXTr3(re, im, 96, 98, 100);
-    MXTr3(re, im, 97, 99, 101);
-    MXRot(re, im, 99, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 101, -0.4999999999999998, -0.8660254037844387);
-    MXTr2(re, im, 96, 97);
-    MXTr2(re, im, 98, 99);
-    MXTr2(re, im, 100, 101);
-    MXTr3(re, im, 102, 104, 106);
-    MXTr3(re, im, 103, 105, 107);
-    MXRot(re, im, 105, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 107, -0.4999999999999998, -0.8660254037844387);
-    MXTr2(re, im, 102, 103);
-    MXTr2(re, im, 104, 105);
-    MXTr2(re, im, 106, 107);
-    MXTr3(re, im, 108, 114, 120);
-    MXTr3(re, im, 109, 115, 121);
-    MXTr3(re, im, 110, 116, 122);
-    MXTr3(re, im, 111, 117, 123);
-    MXTr3(re, im, 112, 118, 124);
-    MXTr3(re, im, 113, 119, 125);
-    MXRot(re, im, 115, 0.9396926207859084, -0.3420201433256687);
-    MXRot(re, im, 116, 0.766044443118978, -0.6427876096865393);
-    MXRot(re, im, 117, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 118, 0.17364817766693041, -0.984807753012208);
-    MXRot(re, im, 119, -0.1736481776669303, -0.984807753012208);
-    MXRot(re, im, 121, 0.766044443118978, -0.6427876096865393);
-    MXRot(re, im, 122, 0.17364817766693041, -0.984807753012208);
-    MXRot(re, im, 123, -0.4999999999999998, -0.8660254037844387);
-    MXRot(re, im, 124, -0.9396926207859083, -0.3420201433256689);
-    MXRot(re, im, 125, -0.9396926207859084, 0.34202014332566866);
-    MXTr3(re, im, 108, 110, 112);
-    MXTr3(re, im, 109, 111, 113);
-    MXRot(re, im, 111, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 113, -0.4999999999999998, -0.8660254037844387);
-    MXTr2(re, im, 108, 109);
-    MXTr2(re, im, 110, 111);
-    MXTr2(re, im, 112, 113);
-    MXTr3(re, im, 114, 116, 118);
-    MXTr3(re, im, 115, 117, 119);
-    MXRot(re, im, 117, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 119, -0.4999999999999998, -0.8660254037844387);
-    MXTr2(re, im, 114, 115);
-    MXTr2(re, im, 116, 117);
-    MXTr2(re, im, 118, 119);
-    MXTr3(re, im, 120, 122, 124);
-    MXTr3(re, im, 121, 123, 125);
-    MXRot(re, im, 123, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 125, -0.4999999999999998, -0.8660254037844387);
-    MXTr2(re, im, 120, 121);
-    MXTr2(re, im, 122, 123);
-    MXTr2(re, im, 124, 125);
-    MXTr3(re, im, 126, 132, 138);
-    MXTr3(re, im, 127, 133, 139);
-    MXTr3(re, im, 128, 134, 140);
-    MXTr3(re, im, 129, 135, 141);
-    MXTr3(re, im, 130, 136, 142);
-    MXTr3(re, im, 131, 137, 143);
-    MXRot(re, im, 133, 0.9396926207859084, -0.3420201433256687);
-    MXRot(re, im, 134, 0.766044443118978, -0.6427876096865393);
-    MXRot(re, im, 135, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 136, 0.17364817766693041, -0.984807753012208);
-    MXRot(re, im, 137, -0.1736481776669303, -0.984807753012208);
-    MXRot(re, im, 139, 0.766044443118978, -0.6427876096865393);
-    MXRot(re, im, 140, 0.17364817766693041, -0.984807753012208);
-    MXRot(re, im, 141, -0.4999999999999998, -0.8660254037844387);
-    MXRot(re, im, 142, -0.9396926207859083, -0.3420201433256689);
-    MXRot(re, im, 143, -0.9396926207859084, 0.34202014332566866);
-    MXTr3(re, im, 126, 128, 130);
-    MXTr3(re, im, 127, 129, 131);
-    MXRot(re, im, 129, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 131, -0.4999999999999998, -0.8660254037844387);
-    MXTr2(re, im, 126, 127);
-    MXTr2(re, im, 128, 129);
-    MXTr2(re, im, 130, 131);
-    MXTr3(re, im, 132, 134, 136);
-    MXTr3(re, im, 133, 135, 137);
-    MXRot(re, im, 135, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 137, -0.4999999999999998, -0.8660254037844387);
-    MXTr2(re, im, 132, 133);
-    MXTr2(re, im, 134, 135);
-    MXTr2(re, im, 136, 137);
-    MXTr3(re, im, 138, 140, 142);
-    MXTr3(re, im, 139, 141, 143);
-    MXRot(re, im, 141, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 143, -0.4999999999999998, -0.8660254037844387);
-    MXTr2(re, im, 138, 139);
-    MXTr2(re, im, 140, 141);
-    MXTr2(re, im, 142, 143);
-    MXTr4(re, im, 144, 162, 180, 198);
-    MXTr4(re, im, 145, 163, 181, 199);
-    MXTr4(re, im, 146, 164, 182, 200);
-    MXTr4(re, im, 147, 165, 183, 201);
-    MXTr4(re, im, 148, 166, 184, 202);
-    MXTr4(re, im, 149, 167, 185, 203);
-    MXTr4(re, im, 150, 168, 186, 204);
-    MXTr4(re, im, 151, 169, 187, 205);
-    MXTr4(re, im, 152, 170, 188, 206);
-    MXTr4(re, im, 153, 171, 189, 207);
-    MXTr4(re, im, 154, 172, 190, 208);
-    MXTr4(re, im, 155, 173, 191, 209);
-    MXTr4(re, im, 156, 174, 192, 210);
-    MXTr4(re, im, 157, 175, 193, 211);
-    MXTr4(re, im, 158, 176, 194, 212);
-    MXTr4(re, im, 159, 177, 195, 213);
-    MXTr4(re, im, 160, 178, 196, 214);
-    MXTr4(re, im, 161, 179, 197, 215);
-    MXRot(re, im, 163, 0.9961946980917455, -0.08715574274765817);
-    MXRot(re, im, 164, 0.984807753012208, -0.17364817766693033);
-    MXRot(re, im, 165, 0.9659258262890683, -0.25881904510252074);
-    MXRot(re, im, 166, 0.9396926207859084, -0.3420201433256687);
-    MXRot(re, im, 167, 0.9063077870366499, -0.42261826174069944);
-    MXRot(re, im, 168, 0.8660254037844387, -0.49999999999999994);
-    MXRot(re, im, 169, 0.8191520442889918, -0.573576436351046);
-    MXRot(re, im, 170, 0.766044443118978, -0.6427876096865393);
-    MXRot(re, im, 171, 0.7071067811865476, -0.7071067811865475);
-    MXRot(re, im, 172, 0.6427876096865394, -0.766044443118978);
-    MXRot(re, im, 173, 0.5735764363510462, -0.8191520442889918);
-    MXRot(re, im, 174, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 175, 0.42261826174069944, -0.9063077870366499);
-    MXRot(re, im, 176, 0.3420201433256688, -0.9396926207859083);
-    MXRot(re, im, 177, 0.25881904510252074, -0.9659258262890683);
-    MXRot(re, im, 178, 0.17364817766693041, -0.984807753012208);
-    MXRot(re, im, 179, 0.08715574274765836, -0.9961946980917455);
-    MXRot(re, im, 181, 0.984807753012208, -0.17364817766693033);
-    MXRot(re, im, 182, 0.9396926207859084, -0.3420201433256687);
-    MXRot(re, im, 183, 0.8660254037844387, -0.49999999999999994);
-    MXRot(re, im, 184, 0.766044443118978, -0.6427876096865393);
-    MXRot(re, im, 185, 0.6427876096865394, -0.766044443118978);
-    MXRot(re, im, 186, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 187, 0.3420201433256688, -0.9396926207859083);
-    MXRot(re, im, 188, 0.17364817766693041, -0.984807753012208);
-    MXRot(re, im, 189, 6.123233995736766e-17, -1.0);
-    MXRot(re, im, 190, -0.1736481776669303, -0.984807753012208);
-    MXRot(re, im, 191, -0.3420201433256687, -0.9396926207859084);
-    MXRot(re, im, 192, -0.4999999999999998, -0.8660254037844387);
-    MXRot(re, im, 193, -0.6427876096865394, -0.766044443118978);
-    MXRot(re, im, 194, -0.7660444431189779, -0.6427876096865395);
-    MXRot(re, im, 195, -0.8660254037844387, -0.49999999999999994);
-    MXRot(re, im, 196, -0.9396926207859083, -0.3420201433256689);
-    MXRot(re, im, 197, -0.984807753012208, -0.1736481776669307);
-    MXRot(re, im, 199, 0.9659258262890683, -0.25881904510252074);
-    MXRot(re, im, 200, 0.8660254037844387, -0.49999999999999994);
-    MXRot(re, im, 201, 0.7071067811865476, -0.7071067811865475);
-    MXRot(re, im, 202, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 203, 0.25881904510252074, -0.9659258262890683);
-    MXRot(re, im, 204, 6.123233995736766e-17, -1.0);
-    MXRot(re, im, 205, -0.25881904510252063, -0.9659258262890683);
-    MXRot(re, im, 206, -0.4999999999999998, -0.8660254037844387);
-    MXRot(re, im, 207, -0.7071067811865475, -0.7071067811865476);
-    MXRot(re, im, 208, -0.8660254037844387, -0.49999999999999994);
-    MXRot(re, im, 209, -0.9659258262890682, -0.258819045102521);
-    MXRot(re, im, 210, -1.0, -1.2246467991473532e-16);
-    MXRot(re, im, 211, -0.9659258262890683, 0.2588190451025208);
-    MXRot(re, im, 212, -0.8660254037844388, 0.4999999999999997);
-    MXRot(re, im, 213, -0.7071067811865477, 0.7071067811865475);
-    MXRot(re, im, 214, -0.5000000000000004, 0.8660254037844384);
-    MXRot(re, im, 215, -0.25881904510252063, 0.9659258262890683);
-    MXTr3(re, im, 144, 150, 156);
-    MXTr3(re, im, 145, 151, 157);
-    MXTr3(re, im, 146, 152, 158);
-    MXTr3(re, im, 147, 153, 159);
-    MXTr3(re, im, 148, 154, 160);
-    MXTr3(re, im, 149, 155, 161);
-    MXRot(re, im, 151, 0.9396926207859084, -0.3420201433256687);
-    MXRot(re, im, 152, 0.766044443118978, -0.6427876096865393);
-    MXRot(re, im, 153, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 154, 0.17364817766693041, -0.984807753012208);
-    MXRot(re, im, 155, -0.1736481776669303, -0.984807753012208);
-    MXRot(re, im, 157, 0.766044443118978, -0.6427876096865393);
-    MXRot(re, im, 158, 0.17364817766693041, -0.984807753012208);
-    MXRot(re, im, 159, -0.4999999999999998, -0.8660254037844387);
-    MXRot(re, im, 160, -0.9396926207859083, -0.3420201433256689);
-    MXRot(re, im, 161, -0.9396926207859084, 0.34202014332566866);
-    MXTr3(re, im, 144, 146, 148);
-    MXTr3(re, im, 145, 147, 149);
-    MXRot(re, im, 147, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 149, -0.4999999999999998, -0.8660254037844387);
-    MXTr2(re, im, 144, 145);
-    MXTr2(re, im, 146, 147);
-    MXTr2(re, im, 148, 149);
-    MXTr3(re, im, 150, 152, 154);
-    MXTr3(re, im, 151, 153, 155);
-    MXRot(re, im, 153, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 155, -0.4999999999999998, -0.8660254037844387);
-    MXTr2(re, im, 150, 151);
-    MXTr2(re, im, 152, 153);
-    MXTr2(re, im, 154, 155);
-    MXTr3(re, im, 156, 158, 160);
-    MXTr3(re, im, 157, 159, 161);
-    MXRot(re, im, 159, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 161, -0.4999999999999998, -0.8660254037844387);
-    MXTr2(re, im, 156, 157);
-    MXTr2(re, im, 158, 159);
-    MXTr2(re, im, 160, 161);
-    MXTr3(re, im, 162, 168, 174);
-    MXTr3(re, im, 163, 169, 175);
-    MXTr3(re, im, 164, 170, 176);
-    MXTr3(re, im, 165, 171, 177);
-    MXTr3(re, im, 166, 172, 178);
-    MXTr3(re, im, 167, 173, 179);
-    MXRot(re, im, 169, 0.9396926207859084, -0.3420201433256687);
-    MXRot(re, im, 170, 0.766044443118978, -0.6427876096865393);
-    MXRot(re, im, 171, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 172, 0.17364817766693041, -0.984807753012208);
-    MXRot(re, im, 173, -0.1736481776669303, -0.984807753012208);
-    MXRot(re, im, 175, 0.766044443118978, -0.6427876096865393);
-    MXRot(re, im, 176, 0.17364817766693041, -0.984807753012208);
-    MXRot(re, im, 177, -0.4999999999999998, -0.8660254037844387);
-    MXRot(re, im, 178, -0.9396926207859083, -0.3420201433256689);
-    MXRot(re, im, 179, -0.9396926207859084, 0.34202014332566866);
-    MXTr3(re, im, 162, 164, 166);
-    MXTr3(re, im, 163, 165, 167);
-    MXRot(re, im, 165, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 167, -0.4999999999999998, -0.8660254037844387);
-    MXTr2(re, im, 162, 163);
-    MXTr2(re, im, 164, 165);
-    MXTr2(re, im, 166, 167);
-    MXTr3(re, im, 168, 170, 172);
-    MXTr3(re, im, 169, 171, 173);
-    MXRot(re, im, 171, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 173, -0.4999999999999998, -0.8660254037844387);
-    MXTr2(re, im, 168, 169);
-    MXTr2(re, im, 170, 171);
-    MXTr2(re, im, 172, 173);
-    MXTr3(re, im, 174, 176, 178);
-    MXTr3(re, im, 175, 177, 179);
-    MXRot(re, im, 177, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 179, -0.4999999999999998, -0.8660254037844387);
-    MXTr2(re, im, 174, 175);
-    MXTr2(re, im, 176, 177);
-    MXTr2(re, im, 178, 179);
-    MXTr3(re, im, 180, 186, 192);
-    MXTr3(re, im, 181, 187, 193);
-    MXTr3(re, im, 182, 188, 194);
-    MXTr3(re, im, 183, 189, 195);
-    MXTr3(re, im, 184, 190, 196);
-    MXTr3(re, im, 185, 191, 197);
-    MXRot(re, im, 187, 0.9396926207859084, -0.3420201433256687);
-    MXRot(re, im, 188, 0.766044443118978, -0.6427876096865393);
-    MXRot(re, im, 189, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 190, 0.17364817766693041, -0.984807753012208);
-    MXRot(re, im, 191, -0.1736481776669303, -0.984807753012208);
-    MXRot(re, im, 193, 0.766044443118978, -0.6427876096865393);
-    MXRot(re, im, 194, 0.17364817766693041, -0.984807753012208);
-    MXRot(re, im, 195, -0.4999999999999998, -0.8660254037844387);
-    MXRot(re, im, 196, -0.9396926207859083, -0.3420201433256689);
-    MXRot(re, im, 197, -0.9396926207859084, 0.34202014332566866);
-    MXTr3(re, im, 180, 182, 184);
-    MXTr3(re, im, 181, 183, 185);
-    MXRot(re, im, 183, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 185, -0.4999999999999998, -0.8660254037844387);
-    MXTr2(re, im, 180, 181);
-    MXTr2(re, im, 182, 183);
-    MXTr2(re, im, 184, 185);
-    MXTr3(re, im, 186, 188, 190);
-    MXTr3(re, im, 187, 189, 191);
-    MXRot(re, im, 189, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 191, -0.4999999999999998, -0.8660254037844387);
-    MXTr2(re, im, 186, 187);
-    MXTr2(re, im, 188, 189);
-    MXTr2(re, im, 190, 191);
-    MXTr3(re, im, 192, 194, 196);
-    MXTr3(re, im, 193, 195, 197);
-    MXRot(re, im, 195, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 197, -0.4999999999999998, -0.8660254037844387);
-    MXTr2(re, im, 192, 193);
-    MXTr2(re, im, 194, 195);
-    MXTr2(re, im, 196, 197);
-    MXTr3(re, im, 198, 204, 210);
-    MXTr3(re, im, 199, 205, 211);
-    MXTr3(re, im, 200, 206, 212);
-    MXTr3(re, im, 201, 207, 213);
-    MXTr3(re, im, 202, 208, 214);
-    MXTr3(re, im, 203, 209, 215);
-    MXRot(re, im, 205, 0.9396926207859084, -0.3420201433256687);
-    MXRot(re, im, 206, 0.766044443118978, -0.6427876096865393);
-    MXRot(re, im, 207, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 208, 0.17364817766693041, -0.984807753012208);
-    MXRot(re, im, 209, -0.1736481776669303, -0.984807753012208);
-    MXRot(re, im, 211, 0.766044443118978, -0.6427876096865393);
-    MXRot(re, im, 212, 0.17364817766693041, -0.984807753012208);
-    MXRot(re, im, 213, -0.4999999999999998, -0.8660254037844387);
-    MXRot(re, im, 214, -0.9396926207859083, -0.3420201433256689);
-    MXRot(re, im, 215, -0.9396926207859084, 0.34202014332566866);
-    MXTr3(re, im, 198, 200, 202);
-    MXTr3(re, im, 199, 201, 203);
-    MXRot(re, im, 201, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 203, -0.4999999999999998, -0.8660254037844387);
-    MXTr2(re, im, 198, 199);
-    MXTr2(re, im, 200, 201);
-    MXTr2(re, im, 202, 203);
-    MXTr3(re, im, 204, 206, 208);
-    MXTr3(re, im, 205, 207, 209);
-    MXRot(re, im, 207, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 209, -0.4999999999999998, -0.8660254037844387);
-    MXTr2(re, im, 204, 205);
-    MXTr2(re, im, 206, 207);
-    MXTr2(re, im, 208, 209);
-}
-
-/**
- *  Part 3 of ApplyMixedRadixFFT_360().
- * 
- *  @param {Number[]} re 
- *    - The real part of each point.
- *  @param {Number[]} im 
- *    - The imaginary part of each point.
- */
-function ApplyMixedRadixFFT_360_Part3(re, im) {
-    MXTr3(re, im, 210, 212, 214);
-    MXTr3(re, im, 211, 213, 215);
-    MXRot(re, im, 213, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 215, -0.4999999999999998, -0.8660254037844387);
-    MXTr2(re, im, 210, 211);
-    MXTr2(re, im, 212, 213);
-    MXTr2(re, im, 214, 215);
-    MXTr4(re, im, 216, 234, 252, 270);
-    MXTr4(re, im, 217, 235, 253, 271);
-    MXTr4(re, im, 218, 236, 254, 272);
-    MXTr4(re, im, 219, 237, 255, 273);
-    MXTr4(re, im, 220, 238, 256, 274);
-    MXTr4(re, im, 221, 239, 257, 275);
-    MXTr4(re, im, 222, 240, 258, 276);
-    MXTr4(re, im, 223, 241, 259, 277);
-    MXTr4(re, im, 224, 242, 260, 278);
-    MXTr4(re, im, 225, 243, 261, 279);
-    MXTr4(re, im, 226, 244, 262, 280);
-    MXTr4(re, im, 227, 245, 263, 281);
-    MXTr4(re, im, 228, 246, 264, 282);
-    MXTr4(re, im, 229, 247, 265, 283);
-    MXTr4(re, im, 230, 248, 266, 284);
-    MXTr4(re, im, 231, 249, 267, 285);
-    MXTr4(re, im, 232, 250, 268, 286);
-    MXTr4(re, im, 233, 251, 269, 287);
-    MXRot(re, im, 235, 0.9961946980917455, -0.08715574274765817);
-    MXRot(re, im, 236, 0.984807753012208, -0.17364817766693033);
-    MXRot(re, im, 237, 0.9659258262890683, -0.25881904510252074);
-    MXRot(re, im, 238, 0.9396926207859084, -0.3420201433256687);
-    MXRot(re, im, 239, 0.9063077870366499, -0.42261826174069944);
-    MXRot(re, im, 240, 0.8660254037844387, -0.49999999999999994);
-    MXRot(re, im, 241, 0.8191520442889918, -0.573576436351046);
-    MXRot(re, im, 242, 0.766044443118978, -0.6427876096865393);
-    MXRot(re, im, 243, 0.7071067811865476, -0.7071067811865475);
-    MXRot(re, im, 244, 0.6427876096865394, -0.766044443118978);
-    MXRot(re, im, 245, 0.5735764363510462, -0.8191520442889918);
-    MXRot(re, im, 246, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 247, 0.42261826174069944, -0.9063077870366499);
-    MXRot(re, im, 248, 0.3420201433256688, -0.9396926207859083);
-    MXRot(re, im, 249, 0.25881904510252074, -0.9659258262890683);
-    MXRot(re, im, 250, 0.17364817766693041, -0.984807753012208);
-    MXRot(re, im, 251, 0.08715574274765836, -0.9961946980917455);
-    MXRot(re, im, 253, 0.984807753012208, -0.17364817766693033);
-    MXRot(re, im, 254, 0.9396926207859084, -0.3420201433256687);
-    MXRot(re, im, 255, 0.8660254037844387, -0.49999999999999994);
-    MXRot(re, im, 256, 0.766044443118978, -0.6427876096865393);
-    MXRot(re, im, 257, 0.6427876096865394, -0.766044443118978);
-    MXRot(re, im, 258, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 259, 0.3420201433256688, -0.9396926207859083);
-    MXRot(re, im, 260, 0.17364817766693041, -0.984807753012208);
-    MXRot(re, im, 261, 6.123233995736766e-17, -1.0);
-    MXRot(re, im, 262, -0.1736481776669303, -0.984807753012208);
-    MXRot(re, im, 263, -0.3420201433256687, -0.9396926207859084);
-    MXRot(re, im, 264, -0.4999999999999998, -0.8660254037844387);
-    MXRot(re, im, 265, -0.6427876096865394, -0.766044443118978);
-    MXRot(re, im, 266, -0.7660444431189779, -0.6427876096865395);
-    MXRot(re, im, 267, -0.8660254037844387, -0.49999999999999994);
-    MXRot(re, im, 268, -0.9396926207859083, -0.3420201433256689);
-    MXRot(re, im, 269, -0.984807753012208, -0.1736481776669307);
-    MXRot(re, im, 271, 0.9659258262890683, -0.25881904510252074);
-    MXRot(re, im, 272, 0.8660254037844387, -0.49999999999999994);
-    MXRot(re, im, 273, 0.7071067811865476, -0.7071067811865475);
-    MXRot(re, im, 274, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 275, 0.25881904510252074, -0.9659258262890683);
-    MXRot(re, im, 276, 6.123233995736766e-17, -1.0);
-    MXRot(re, im, 277, -0.25881904510252063, -0.9659258262890683);
-    MXRot(re, im, 278, -0.4999999999999998, -0.8660254037844387);
-    MXRot(re, im, 279, -0.7071067811865475, -0.7071067811865476);
-    MXRot(re, im, 280, -0.8660254037844387, -0.49999999999999994);
-    MXRot(re, im, 281, -0.9659258262890682, -0.258819045102521);
-    MXRot(re, im, 282, -1.0, -1.2246467991473532e-16);
-    MXRot(re, im, 283, -0.9659258262890683, 0.2588190451025208);
-    MXRot(re, im, 284, -0.8660254037844388, 0.4999999999999997);
-    MXRot(re, im, 285, -0.7071067811865477, 0.7071067811865475);
-    MXRot(re, im, 286, -0.5000000000000004, 0.8660254037844384);
-    MXRot(re, im, 287, -0.25881904510252063, 0.9659258262890683);
-    MXTr3(re, im, 216, 222, 228);
-    MXTr3(re, im, 217, 223, 229);
-    MXTr3(re, im, 218, 224, 230);
-    MXTr3(re, im, 219, 225, 231);
-    MXTr3(re, im, 220, 226, 232);
-    MXTr3(re, im, 221, 227, 233);
-    MXRot(re, im, 223, 0.9396926207859084, -0.3420201433256687);
-    MXRot(re, im, 224, 0.766044443118978, -0.6427876096865393);
-    MXRot(re, im, 225, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 226, 0.17364817766693041, -0.984807753012208);
-    MXRot(re, im, 227, -0.1736481776669303, -0.984807753012208);
-    MXRot(re, im, 229, 0.766044443118978, -0.6427876096865393);
-    MXRot(re, im, 230, 0.17364817766693041, -0.984807753012208);
-    MXRot(re, im, 231, -0.4999999999999998, -0.8660254037844387);
-    MXRot(re, im, 232, -0.9396926207859083, -0.3420201433256689);
-    MXRot(re, im, 233, -0.9396926207859084, 0.34202014332566866);
-    MXTr3(re, im, 216, 218, 220);
-    MXTr3(re, im, 217, 219, 221);
-    MXRot(re, im, 219, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 221, -0.4999999999999998, -0.8660254037844387);
-    MXTr2(re, im, 216, 217);
-    MXTr2(re, im, 218, 219);
-    MXTr2(re, im, 220, 221);
-    MXTr3(re, im, 222, 224, 226);
-    MXTr3(re, im, 223, 225, 227);
-    MXRot(re, im, 225, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 227, -0.4999999999999998, -0.8660254037844387);
-    MXTr2(re, im, 222, 223);
-    MXTr2(re, im, 224, 225);
-    MXTr2(re, im, 226, 227);
-    MXTr3(re, im, 228, 230, 232);
-    MXTr3(re, im, 229, 231, 233);
-    MXRot(re, im, 231, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 233, -0.4999999999999998, -0.8660254037844387);
-    MXTr2(re, im, 228, 229);
-    MXTr2(re, im, 230, 231);
-    MXTr2(re, im, 232, 233);
-    MXTr3(re, im, 234, 240, 246);
-    MXTr3(re, im, 235, 241, 247);
-    MXTr3(re, im, 236, 242, 248);
-    MXTr3(re, im, 237, 243, 249);
-    MXTr3(re, im, 238, 244, 250);
-    MXTr3(re, im, 239, 245, 251);
-    MXRot(re, im, 241, 0.9396926207859084, -0.3420201433256687);
-    MXRot(re, im, 242, 0.766044443118978, -0.6427876096865393);
-    MXRot(re, im, 243, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 244, 0.17364817766693041, -0.984807753012208);
-    MXRot(re, im, 245, -0.1736481776669303, -0.984807753012208);
-    MXRot(re, im, 247, 0.766044443118978, -0.6427876096865393);
-    MXRot(re, im, 248, 0.17364817766693041, -0.984807753012208);
-    MXRot(re, im, 249, -0.4999999999999998, -0.8660254037844387);
-    MXRot(re, im, 250, -0.9396926207859083, -0.3420201433256689);
-    MXRot(re, im, 251, -0.9396926207859084, 0.34202014332566866);
-    MXTr3(re, im, 234, 236, 238);
-    MXTr3(re, im, 235, 237, 239);
-    MXRot(re, im, 237, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 239, -0.4999999999999998, -0.8660254037844387);
-    MXTr2(re, im, 234, 235);
-    MXTr2(re, im, 236, 237);
-    MXTr2(re, im, 238, 239);
-    MXTr3(re, im, 240, 242, 244);
-    MXTr3(re, im, 241, 243, 245);
-    MXRot(re, im, 243, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 245, -0.4999999999999998, -0.8660254037844387);
-    MXTr2(re, im, 240, 241);
-    MXTr2(re, im, 242, 243);
-    MXTr2(re, im, 244, 245);
-    MXTr3(re, im, 246, 248, 250);
-    MXTr3(re, im, 247, 249, 251);
-    MXRot(re, im, 249, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 251, -0.4999999999999998, -0.8660254037844387);
-    MXTr2(re, im, 246, 247);
-    MXTr2(re, im, 248, 249);
-    MXTr2(re, im, 250, 251);
-    MXTr3(re, im, 252, 258, 264);
-    MXTr3(re, im, 253, 259, 265);
-    MXTr3(re, im, 254, 260, 266);
-    MXTr3(re, im, 255, 261, 267);
-    MXTr3(re, im, 256, 262, 268);
-    MXTr3(re, im, 257, 263, 269);
-    MXRot(re, im, 259, 0.9396926207859084, -0.3420201433256687);
-    MXRot(re, im, 260, 0.766044443118978, -0.6427876096865393);
-    MXRot(re, im, 261, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 262, 0.17364817766693041, -0.984807753012208);
-    MXRot(re, im, 263, -0.1736481776669303, -0.984807753012208);
-    MXRot(re, im, 265, 0.766044443118978, -0.6427876096865393);
-    MXRot(re, im, 266, 0.17364817766693041, -0.984807753012208);
-    MXRot(re, im, 267, -0.4999999999999998, -0.8660254037844387);
-    MXRot(re, im, 268, -0.9396926207859083, -0.3420201433256689);
-    MXRot(re, im, 269, -0.9396926207859084, 0.34202014332566866);
-    MXTr3(re, im, 252, 254, 256);
-    MXTr3(re, im, 253, 255, 257);
-    MXRot(re, im, 255, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 257, -0.4999999999999998, -0.8660254037844387);
-    MXTr2(re, im, 252, 253);
-    MXTr2(re, im, 254, 255);
-    MXTr2(re, im, 256, 257);
-    MXTr3(re, im, 258, 260, 262);
-    MXTr3(re, im, 259, 261, 263);
-    MXRot(re, im, 261, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 263, -0.4999999999999998, -0.8660254037844387);
-    MXTr2(re, im, 258, 259);
-    MXTr2(re, im, 260, 261);
-    MXTr2(re, im, 262, 263);
-    MXTr3(re, im, 264, 266, 268);
-    MXTr3(re, im, 265, 267, 269);
-    MXRot(re, im, 267, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 269, -0.4999999999999998, -0.8660254037844387);
-    MXTr2(re, im, 264, 265);
-    MXTr2(re, im, 266, 267);
-    MXTr2(re, im, 268, 269);
-    MXTr3(re, im, 270, 276, 282);
-    MXTr3(re, im, 271, 277, 283);
-    MXTr3(re, im, 272, 278, 284);
-    MXTr3(re, im, 273, 279, 285);
-    MXTr3(re, im, 274, 280, 286);
-    MXTr3(re, im, 275, 281, 287);
-    MXRot(re, im, 277, 0.9396926207859084, -0.3420201433256687);
-    MXRot(re, im, 278, 0.766044443118978, -0.6427876096865393);
-    MXRot(re, im, 279, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 280, 0.17364817766693041, -0.984807753012208);
-    MXRot(re, im, 281, -0.1736481776669303, -0.984807753012208);
-    MXRot(re, im, 283, 0.766044443118978, -0.6427876096865393);
-    MXRot(re, im, 284, 0.17364817766693041, -0.984807753012208);
-    MXRot(re, im, 285, -0.4999999999999998, -0.8660254037844387);
-    MXRot(re, im, 286, -0.9396926207859083, -0.3420201433256689);
-    MXRot(re, im, 287, -0.9396926207859084, 0.34202014332566866);
-    MXTr3(re, im, 270, 272, 274);
-    MXTr3(re, im, 271, 273, 275);
-    MXRot(re, im, 273, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 275, -0.4999999999999998, -0.8660254037844387);
-    MXTr2(re, im, 270, 271);
-    MXTr2(re, im, 272, 273);
-    MXTr2(re, im, 274, 275);
-    MXTr3(re, im, 276, 278, 280);
-    MXTr3(re, im, 277, 279, 281);
-    MXRot(re, im, 279, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 281, -0.4999999999999998, -0.8660254037844387);
-    MXTr2(re, im, 276, 277);
-    MXTr2(re, im, 278, 279);
-    MXTr2(re, im, 280, 281);
-    MXTr3(re, im, 282, 284, 286);
-    MXTr3(re, im, 283, 285, 287);
-    MXRot(re, im, 285, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 287, -0.4999999999999998, -0.8660254037844387);
-    MXTr2(re, im, 282, 283);
-    MXTr2(re, im, 284, 285);
-    MXTr2(re, im, 286, 287);
-    MXTr4(re, im, 288, 306, 324, 342);
-    MXTr4(re, im, 289, 307, 325, 343);
-    MXTr4(re, im, 290, 308, 326, 344);
-    MXTr4(re, im, 291, 309, 327, 345);
-    MXTr4(re, im, 292, 310, 328, 346);
-    MXTr4(re, im, 293, 311, 329, 347);
-    MXTr4(re, im, 294, 312, 330, 348);
-    MXTr4(re, im, 295, 313, 331, 349);
-    MXTr4(re, im, 296, 314, 332, 350);
-    MXTr4(re, im, 297, 315, 333, 351);
-    MXTr4(re, im, 298, 316, 334, 352);
-    MXTr4(re, im, 299, 317, 335, 353);
-    MXTr4(re, im, 300, 318, 336, 354);
-    MXTr4(re, im, 301, 319, 337, 355);
-    MXTr4(re, im, 302, 320, 338, 356);
-    MXTr4(re, im, 303, 321, 339, 357);
-    MXTr4(re, im, 304, 322, 340, 358);
-    MXTr4(re, im, 305, 323, 341, 359);
-    MXRot(re, im, 307, 0.9961946980917455, -0.08715574274765817);
-    MXRot(re, im, 308, 0.984807753012208, -0.17364817766693033);
-    MXRot(re, im, 309, 0.9659258262890683, -0.25881904510252074);
-    MXRot(re, im, 310, 0.9396926207859084, -0.3420201433256687);
-    MXRot(re, im, 311, 0.9063077870366499, -0.42261826174069944);
-    MXRot(re, im, 312, 0.8660254037844387, -0.49999999999999994);
-    MXRot(re, im, 313, 0.8191520442889918, -0.573576436351046);
-    MXRot(re, im, 314, 0.766044443118978, -0.6427876096865393);
-    MXRot(re, im, 315, 0.7071067811865476, -0.7071067811865475);
-    MXRot(re, im, 316, 0.6427876096865394, -0.766044443118978);
-    MXRot(re, im, 317, 0.5735764363510462, -0.8191520442889918);
-    MXRot(re, im, 318, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 319, 0.42261826174069944, -0.9063077870366499);
-    MXRot(re, im, 320, 0.3420201433256688, -0.9396926207859083);
-    MXRot(re, im, 321, 0.25881904510252074, -0.9659258262890683);
-    MXRot(re, im, 322, 0.17364817766693041, -0.984807753012208);
-    MXRot(re, im, 323, 0.08715574274765836, -0.9961946980917455);
-    MXRot(re, im, 325, 0.984807753012208, -0.17364817766693033);
-    MXRot(re, im, 326, 0.9396926207859084, -0.3420201433256687);
-    MXRot(re, im, 327, 0.8660254037844387, -0.49999999999999994);
-    MXRot(re, im, 328, 0.766044443118978, -0.6427876096865393);
-    MXRot(re, im, 329, 0.6427876096865394, -0.766044443118978);
-    MXRot(re, im, 330, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 331, 0.3420201433256688, -0.9396926207859083);
-    MXRot(re, im, 332, 0.17364817766693041, -0.984807753012208);
-    MXRot(re, im, 333, 6.123233995736766e-17, -1.0);
-    MXRot(re, im, 334, -0.1736481776669303, -0.984807753012208);
-    MXRot(re, im, 335, -0.3420201433256687, -0.9396926207859084);
-    MXRot(re, im, 336, -0.4999999999999998, -0.8660254037844387);
-    MXRot(re, im, 337, -0.6427876096865394, -0.766044443118978);
-    MXRot(re, im, 338, -0.7660444431189779, -0.6427876096865395);
-    MXRot(re, im, 339, -0.8660254037844387, -0.49999999999999994);
-    MXRot(re, im, 340, -0.9396926207859083, -0.3420201433256689);
-    MXRot(re, im, 341, -0.984807753012208, -0.1736481776669307);
-    MXRot(re, im, 343, 0.9659258262890683, -0.25881904510252074);
-    MXRot(re, im, 344, 0.8660254037844387, -0.49999999999999994);
-    MXRot(re, im, 345, 0.7071067811865476, -0.7071067811865475);
-    MXRot(re, im, 346, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 347, 0.25881904510252074, -0.9659258262890683);
-    MXRot(re, im, 348, 6.123233995736766e-17, -1.0);
-    MXRot(re, im, 349, -0.25881904510252063, -0.9659258262890683);
-    MXRot(re, im, 350, -0.4999999999999998, -0.8660254037844387);
-    MXRot(re, im, 351, -0.7071067811865475, -0.7071067811865476);
-    MXRot(re, im, 352, -0.8660254037844387, -0.49999999999999994);
-    MXRot(re, im, 353, -0.9659258262890682, -0.258819045102521);
-    MXRot(re, im, 354, -1.0, -1.2246467991473532e-16);
-    MXRot(re, im, 355, -0.9659258262890683, 0.2588190451025208);
-    MXRot(re, im, 356, -0.8660254037844388, 0.4999999999999997);
-    MXRot(re, im, 357, -0.7071067811865477, 0.7071067811865475);
-    MXRot(re, im, 358, -0.5000000000000004, 0.8660254037844384);
-    MXRot(re, im, 359, -0.25881904510252063, 0.9659258262890683);
-    MXTr3(re, im, 288, 294, 300);
-    MXTr3(re, im, 289, 295, 301);
-    MXTr3(re, im, 290, 296, 302);
-    MXTr3(re, im, 291, 297, 303);
-    MXTr3(re, im, 292, 298, 304);
-    MXTr3(re, im, 293, 299, 305);
-    MXRot(re, im, 295, 0.9396926207859084, -0.3420201433256687);
-    MXRot(re, im, 296, 0.766044443118978, -0.6427876096865393);
-    MXRot(re, im, 297, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 298, 0.17364817766693041, -0.984807753012208);
-    MXRot(re, im, 299, -0.1736481776669303, -0.984807753012208);
-    MXRot(re, im, 301, 0.766044443118978, -0.6427876096865393);
-    MXRot(re, im, 302, 0.17364817766693041, -0.984807753012208);
-    MXRot(re, im, 303, -0.4999999999999998, -0.8660254037844387);
-    MXRot(re, im, 304, -0.9396926207859083, -0.3420201433256689);
-    MXRot(re, im, 305, -0.9396926207859084, 0.34202014332566866);
-    MXTr3(re, im, 288, 290, 292);
-    MXTr3(re, im, 289, 291, 293);
-    MXRot(re, im, 291, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 293, -0.4999999999999998, -0.8660254037844387);
-    MXTr2(re, im, 288, 289);
-    MXTr2(re, im, 290, 291);
-    MXTr2(re, im, 292, 293);
-    MXTr3(re, im, 294, 296, 298);
-    MXTr3(re, im, 295, 297, 299);
-    MXRot(re, im, 297, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 299, -0.4999999999999998, -0.8660254037844387);
-    MXTr2(re, im, 294, 295);
-    MXTr2(re, im, 296, 297);
-    MXTr2(re, im, 298, 299);
-    MXTr3(re, im, 300, 302, 304);
-    MXTr3(re, im, 301, 303, 305);
-    MXRot(re, im, 303, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 305, -0.4999999999999998, -0.8660254037844387);
-    MXTr2(re, im, 300, 301);
-    MXTr2(re, im, 302, 303);
-    MXTr2(re, im, 304, 305);
-    MXTr3(re, im, 306, 312, 318);
-    MXTr3(re, im, 307, 313, 319);
-    MXTr3(re, im, 308, 314, 320);
-    MXTr3(re, im, 309, 315, 321);
-    MXTr3(re, im, 310, 316, 322);
-    MXTr3(re, im, 311, 317, 323);
-    MXRot(re, im, 313, 0.9396926207859084, -0.3420201433256687);
-    MXRot(re, im, 314, 0.766044443118978, -0.6427876096865393);
-    MXRot(re, im, 315, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 316, 0.17364817766693041, -0.984807753012208);
-    MXRot(re, im, 317, -0.1736481776669303, -0.984807753012208);
-    MXRot(re, im, 319, 0.766044443118978, -0.6427876096865393);
-    MXRot(re, im, 320, 0.17364817766693041, -0.984807753012208);
-    MXRot(re, im, 321, -0.4999999999999998, -0.8660254037844387);
-    MXRot(re, im, 322, -0.9396926207859083, -0.3420201433256689);
-    MXRot(re, im, 323, -0.9396926207859084, 0.34202014332566866);
-    MXTr3(re, im, 306, 308, 310);
-    MXTr3(re, im, 307, 309, 311);
-    MXRot(re, im, 309, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 311, -0.4999999999999998, -0.8660254037844387);
-    MXTr2(re, im, 306, 307);
-    MXTr2(re, im, 308, 309);
-    MXTr2(re, im, 310, 311);
-    MXTr3(re, im, 312, 314, 316);
-    MXTr3(re, im, 313, 315, 317);
-    MXRot(re, im, 315, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 317, -0.4999999999999998, -0.8660254037844387);
-    MXTr2(re, im, 312, 313);
-    MXTr2(re, im, 314, 315);
-    MXTr2(re, im, 316, 317);
-    MXTr3(re, im, 318, 320, 322);
-    MXTr3(re, im, 319, 321, 323);
-    MXRot(re, im, 321, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 323, -0.4999999999999998, -0.8660254037844387);
-    MXTr2(re, im, 318, 319);
-    MXTr2(re, im, 320, 321);
-    MXTr2(re, im, 322, 323);
-    MXTr3(re, im, 324, 330, 336);
-    MXTr3(re, im, 325, 331, 337);
-    MXTr3(re, im, 326, 332, 338);
-    MXTr3(re, im, 327, 333, 339);
-    MXTr3(re, im, 328, 334, 340);
-    MXTr3(re, im, 329, 335, 341);
-    MXRot(re, im, 331, 0.9396926207859084, -0.3420201433256687);
-    MXRot(re, im, 332, 0.766044443118978, -0.6427876096865393);
-    MXRot(re, im, 333, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 334, 0.17364817766693041, -0.984807753012208);
-    MXRot(re, im, 335, -0.1736481776669303, -0.984807753012208);
-    MXRot(re, im, 337, 0.766044443118978, -0.6427876096865393);
-    MXRot(re, im, 338, 0.17364817766693041, -0.984807753012208);
-    MXRot(re, im, 339, -0.4999999999999998, -0.8660254037844387);
-    MXRot(re, im, 340, -0.9396926207859083, -0.3420201433256689);
-    MXRot(re, im, 341, -0.9396926207859084, 0.34202014332566866);
-    MXTr3(re, im, 324, 326, 328);
-    MXTr3(re, im, 325, 327, 329);
-    MXRot(re, im, 327, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 329, -0.4999999999999998, -0.8660254037844387);
-    MXTr2(re, im, 324, 325);
-    MXTr2(re, im, 326, 327);
-    MXTr2(re, im, 328, 329);
-    MXTr3(re, im, 330, 332, 334);
-    MXTr3(re, im, 331, 333, 335);
-    MXRot(re, im, 333, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 335, -0.4999999999999998, -0.8660254037844387);
-    MXTr2(re, im, 330, 331);
-    MXTr2(re, im, 332, 333);
-    MXTr2(re, im, 334, 335);
-    MXTr3(re, im, 336, 338, 340);
-    MXTr3(re, im, 337, 339, 341);
-    MXRot(re, im, 339, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 341, -0.4999999999999998, -0.8660254037844387);
-    MXTr2(re, im, 336, 337);
-    MXTr2(re, im, 338, 339);
-    MXTr2(re, im, 340, 341);
-    MXTr3(re, im, 342, 348, 354);
-    MXTr3(re, im, 343, 349, 355);
-    MXTr3(re, im, 344, 350, 356);
-    MXTr3(re, im, 345, 351, 357);
-    MXTr3(re, im, 346, 352, 358);
-    MXTr3(re, im, 347, 353, 359);
-    MXRot(re, im, 349, 0.9396926207859084, -0.3420201433256687);
-    MXRot(re, im, 350, 0.766044443118978, -0.6427876096865393);
-    MXRot(re, im, 351, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 352, 0.17364817766693041, -0.984807753012208);
-    MXRot(re, im, 353, -0.1736481776669303, -0.984807753012208);
-    MXRot(re, im, 355, 0.766044443118978, -0.6427876096865393);
-    MXRot(re, im, 356, 0.17364817766693041, -0.984807753012208);
-    MXRot(re, im, 357, -0.4999999999999998, -0.8660254037844387);
-    MXRot(re, im, 358, -0.9396926207859083, -0.3420201433256689);
-    MXRot(re, im, 359, -0.9396926207859084, 0.34202014332566866);
-    MXTr3(re, im, 342, 344, 346);
-    MXTr3(re, im, 343, 345, 347);
-    MXRot(re, im, 345, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 347, -0.4999999999999998, -0.8660254037844387);
-    MXTr2(re, im, 342, 343);
-    MXTr2(re, im, 344, 345);
-    MXTr2(re, im, 346, 347);
-    MXTr3(re, im, 348, 350, 352);
-    MXTr3(re, im, 349, 351, 353);
-    MXRot(re, im, 351, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 353, -0.4999999999999998, -0.8660254037844387);
-    MXTr2(re, im, 348, 349);
-    MXTr2(re, im, 350, 351);
-    MXTr2(re, im, 352, 353);
-    MXTr3(re, im, 354, 356, 358);
-    MXTr3(re, im, 355, 357, 359);
-    MXRot(re, im, 357, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 359, -0.4999999999999998, -0.8660254037844387);
-    MXTr2(re, im, 354, 355);
-    MXTr2(re, im, 356, 357);
-    MXTr2(re, im, 358, 359);
-    MXCshft(re, im, CSHFT_INDEXES_0);
-    MXCshft(re, im, CSHFT_INDEXES_1);
-    MXCshft(re, im, CSHFT_INDEXES_2);
-    MXCshft(re, im, CSHFT_INDEXES_3);
-    MXCshft(re, im, CSHFT_INDEXES_4);
-    MXCshft(re, im, CSHFT_INDEXES_5);
-    MXSwap(re, im, 97, 206);
-    MXSwap(re, im, 153, 262);
-}
+//  Tables (and scratch buffers) of the compact kernel (see MXCompact() of
+//  the "fft-mx-baseop" module).
+const COMPACT_RADICES = new Int32Array([
+    4, 2, 3, 3, 5
+]);
+const COMPACT_INDEXES = new Int32Array([
+    0, 90, 180, 270, 45, 135, 225, 315, 15, 105, 195, 285, 60, 150, 240,
+    330, 30, 120, 210, 300, 75, 165, 255, 345, 5, 95, 185, 275, 50, 140,
+    230, 320, 20, 110, 200, 290, 65, 155, 245, 335, 35, 125, 215, 305, 80,
+    170, 260, 350, 10, 100, 190, 280, 55, 145, 235, 325, 25, 115, 205, 295,
+    70, 160, 250, 340, 40, 130, 220, 310, 85, 175, 265, 355, 1, 91, 181,
+    271, 46, 136, 226, 316, 16, 106, 196, 286, 61, 151, 241, 331, 31, 121,
+    211, 301, 76, 166, 256, 346, 6, 96, 186, 276, 51, 141, 231, 321, 21,
+    111, 201, 291, 66, 156, 246, 336, 36, 126, 216, 306, 81, 171, 261, 351,
+    11, 101, 191, 281, 56, 146, 236, 326, 26, 116, 206, 296, 71, 161, 251,
+    341, 41, 131, 221, 311, 86, 176, 266, 356, 2, 92, 182, 272, 47, 137,
+    227, 317, 17, 107, 197, 287, 62, 152, 242, 332, 32, 122, 212, 302, 77,
+    167, 257, 347, 7, 97, 187, 277, 52, 142, 232, 322, 22, 112, 202, 292,
+    67, 157, 247, 337, 37, 127, 217, 307, 82, 172, 262, 352, 12, 102, 192,
+    282, 57, 147, 237, 327, 27, 117, 207, 297, 72, 162, 252, 342, 42, 132,
+    222, 312, 87, 177, 267, 357, 3, 93, 183, 273, 48, 138, 228, 318, 18,
+    108, 198, 288, 63, 153, 243, 333, 33, 123, 213, 303, 78, 168, 258, 348,
+    8, 98, 188, 278, 53, 143, 233, 323, 23, 113, 203, 293, 68, 158, 248,
+    338, 38, 128, 218, 308, 83, 173, 263, 353, 13, 103, 193, 283, 58, 148,
+    238, 328, 28, 118, 208, 298, 73, 163, 253, 343, 43, 133, 223, 313, 88,
+    178, 268, 358, 4, 94, 184, 274, 49, 139, 229, 319, 19, 109, 199, 289,
+    64, 154, 244, 334, 34, 124, 214, 304, 79, 169, 259, 349, 9, 99, 189,
+    279, 54, 144, 234, 324, 24, 114, 204, 294, 69, 159, 249, 339, 39, 129,
+    219, 309, 84, 174, 264, 354, 14, 104, 194, 284, 59, 149, 239, 329, 29,
+    119, 209, 299, 74, 164, 254, 344, 44, 134, 224, 314, 89, 179, 269, 359
+]);
+const COMPACT_TWIDDLES = new Float64Array([
+    1.0, 0.0, 1.0, 0.0, 1.0, 0.0, 1.0, 0.0, 0.7071067811865476,
+    -0.7071067811865475, -0.0, -1.0, -0.7071067811865476,
+    -0.7071067811865475, 1.0, 0.0, 1.0, 0.0, 0.9659258262890683,
+    -0.25881904510252074, 0.8660254037844387, -0.49999999999999994,
+    0.8660254037844387, -0.49999999999999994, 0.49999999999999994,
+    -0.8660254037844387, 0.7071067811865476, -0.7071067811865475, -0.0,
+    -1.0, 0.49999999999999994, -0.8660254037844387, -0.49999999999999994,
+    -0.8660254037844387, 0.25881904510252074, -0.9659258262890683,
+    -0.8660254037844387, -0.49999999999999994, -0.0, -1.0, -1.0, -0.0,
+    -0.25881904510252074, -0.9659258262890683, -0.8660254037844387,
+    0.49999999999999994, 1.0, 0.0, 1.0, 0.0, 0.9961946980917455,
+    -0.08715574274765817, 0.984807753012208, -0.17364817766693033,
+    0.984807753012208, -0.17364817766693033, 0.9396926207859084,
+    -0.3420201433256687, 0.9659258262890683, -0.25881904510252074,
+    0.8660254037844387, -0.49999999999999994, 0.9396926207859084,
+    -0.3420201433256687, 0.766044443118978, -0.6427876096865393,
+    0.9063077870366499, -0.42261826174069944, 0.6427876096865393,
+    -0.766044443118978, 0.8660254037844387, -0.49999999999999994,
+    0.49999999999999994, -0.8660254037844387, 0.8191520442889918,
+    -0.573576436351046, 0.3420201433256687, -0.9396926207859084,
+    0.766044443118978, -0.6427876096865393, 0.17364817766693033,
+    -0.984807753012208, 0.7071067811865476, -0.7071067811865475, -0.0, -1.0,
+    0.6427876096865393, -0.766044443118978, -0.17364817766693033,
+    -0.984807753012208, 0.573576436351046, -0.8191520442889918,
+    -0.3420201433256687, -0.9396926207859084, 0.49999999999999994,
+    -0.8660254037844387, -0.49999999999999994, -0.8660254037844387,
+    0.42261826174069944, -0.9063077870366499, -0.6427876096865393,
+    -0.766044443118978, 0.3420201433256687, -0.9396926207859084,
+    -0.766044443118978, -0.6427876096865393, 0.25881904510252074,
+    -0.9659258262890683, -0.8660254037844387, -0.49999999999999994,
+    0.17364817766693033, -0.984807753012208, -0.9396926207859084,
+    -0.3420201433256687, 0.08715574274765817, -0.9961946980917455,
+    -0.984807753012208, -0.17364817766693033, -0.0, -1.0, -1.0, -0.0,
+    -0.08715574274765817, -0.9961946980917455, -0.984807753012208,
+    0.17364817766693033, -0.17364817766693033, -0.984807753012208,
+    -0.9396926207859084, 0.3420201433256687, -0.25881904510252074,
+    -0.9659258262890683, -0.8660254037844387, 0.49999999999999994,
+    -0.3420201433256687, -0.9396926207859084, -0.766044443118978,
+    0.6427876096865393, -0.42261826174069944, -0.9063077870366499,
+    -0.6427876096865393, 0.766044443118978, 1.0, 0.0, 1.0, 0.0, 1.0, 0.0,
+    1.0, 0.0, 0.9998476951563913, -0.01745240643728351, 0.9993908270190958,
+    -0.03489949670250097, 0.9986295347545738, -0.05233595624294383,
+    0.9975640502598242, -0.0697564737441253, 0.9993908270190958,
+    -0.03489949670250097, 0.9975640502598242, -0.0697564737441253,
+    0.9945218953682733, -0.10452846326765346, 0.9902680687415704,
+    -0.13917310096006544, 0.9986295347545738, -0.05233595624294383,
+    0.9945218953682733, -0.10452846326765346, 0.9876883405951378,
+    -0.15643446504023087, 0.9781476007338057, -0.20791169081775931,
+    0.9975640502598242, -0.0697564737441253, 0.9902680687415704,
+    -0.13917310096006544, 0.9781476007338057, -0.20791169081775931,
+    0.9612616959383189, -0.27563735581699916, 0.9961946980917455,
+    -0.08715574274765817, 0.984807753012208, -0.17364817766693033,
+    0.9659258262890683, -0.25881904510252074, 0.9396926207859084,
+    -0.3420201433256687, 0.9945218953682733, -0.10452846326765346,
+    0.9781476007338057, -0.20791169081775931, 0.9510565162951535,
+    -0.3090169943749474, 0.9135454576426009, -0.40673664307580015,
+    0.992546151641322, -0.12186934340514748, 0.9702957262759965,
+    -0.24192189559966773, 0.9335804264972017, -0.35836794954530027,
+    0.882947592858927, -0.4694715627858908, 0.9902680687415704,
+    -0.13917310096006544, 0.9612616959383189, -0.27563735581699916,
+    0.9135454576426009, -0.40673664307580015, 0.848048096156426,
+    -0.5299192642332049, 0.9876883405951378, -0.15643446504023087,
+    0.9510565162951535, -0.3090169943749474, 0.8910065241883679,
+    -0.45399049973954675, 0.8090169943749475, -0.5877852522924731,
+    0.984807753012208, -0.17364817766693033, 0.9396926207859084,
+    -0.3420201433256687, 0.8660254037844387, -0.49999999999999994,
+    0.766044443118978, -0.6427876096865393, 0.981627183447664,
+    -0.1908089953765448, 0.9271838545667874, -0.374606593415912,
+    0.838670567945424, -0.544639035015027, 0.7193398003386512,
+    -0.6946583704589973, 0.9781476007338057, -0.20791169081775931,
+    0.9135454576426009, -0.40673664307580015, 0.8090169943749475,
+    -0.5877852522924731, 0.6691306063588582, -0.7431448254773942,
+    0.9743700647852352, -0.22495105434386498, 0.898794046299167,
+    -0.4383711467890774, 0.7771459614569709, -0.6293203910498375,
+    0.6156614753256583, -0.7880107536067219, 0.9702957262759965,
+    -0.24192189559966773, 0.882947592858927, -0.4694715627858908,
+    0.7431448254773942, -0.6691306063588582, 0.5591929034707468,
+    -0.8290375725550417, 0.9659258262890683, -0.25881904510252074,
+    0.8660254037844387, -0.49999999999999994, 0.7071067811865476,
+    -0.7071067811865475, 0.49999999999999994, -0.8660254037844387,
+    0.9612616959383189, -0.27563735581699916, 0.848048096156426,
+    -0.5299192642332049, 0.6691306063588582, -0.7431448254773942,
+    0.4383711467890774, -0.898794046299167, 0.9563047559630355,
+    -0.2923717047227367, 0.8290375725550417, -0.5591929034707468,
+    0.6293203910498375, -0.7771459614569709, 0.374606593415912,
+    -0.9271838545667874, 0.9510565162951535, -0.3090169943749474,
+    0.8090169943749475, -0.5877852522924731, 0.5877852522924731,
+    -0.8090169943749475, 0.3090169943749474, -0.9510565162951535,
+    0.9455185755993168, -0.3255681544571567, 0.7880107536067219,
+    -0.6156614753256583, 0.544639035015027, -0.838670567945424,
+    0.24192189559966773, -0.9702957262759965, 0.9396926207859084,
+    -0.3420201433256687, 0.766044443118978, -0.6427876096865393,
+    0.49999999999999994, -0.8660254037844387, 0.17364817766693033,
+    -0.984807753012208, 0.9335804264972017, -0.35836794954530027,
+    0.7431448254773942, -0.6691306063588582, 0.45399049973954675,
+    -0.8910065241883679, 0.10452846326765346, -0.9945218953682733,
+    0.9271838545667874, -0.374606593415912, 0.7193398003386512,
+    -0.6946583704589973, 0.40673664307580015, -0.9135454576426009,
+    0.03489949670250097, -0.9993908270190958, 0.9205048534524404,
+    -0.3907311284892737, 0.6946583704589973, -0.7193398003386512,
+    0.35836794954530027, -0.9335804264972017, -0.03489949670250097,
+    -0.9993908270190958, 0.9135454576426009, -0.40673664307580015,
+    0.6691306063588582, -0.7431448254773942, 0.3090169943749474,
+    -0.9510565162951535, -0.10452846326765346, -0.9945218953682733,
+    0.9063077870366499, -0.42261826174069944, 0.6427876096865393,
+    -0.766044443118978, 0.25881904510252074, -0.9659258262890683,
+    -0.17364817766693033, -0.984807753012208, 0.898794046299167,
+    -0.4383711467890774, 0.6156614753256583, -0.7880107536067219,
+    0.20791169081775931, -0.9781476007338057, -0.24192189559966773,
+    -0.9702957262759965, 0.8910065241883679, -0.45399049973954675,
+    0.5877852522924731, -0.8090169943749475, 0.15643446504023087,
+    -0.9876883405951378, -0.3090169943749474, -0.9510565162951535,
+    0.882947592858927, -0.4694715627858908, 0.5591929034707468,
+    -0.8290375725550417, 0.10452846326765346, -0.9945218953682733,
+    -0.374606593415912, -0.9271838545667874, 0.8746197071393957,
+    -0.48480962024633706, 0.5299192642332049, -0.848048096156426,
+    0.05233595624294383, -0.9986295347545738, -0.4383711467890774,
+    -0.898794046299167, 0.8660254037844387, -0.49999999999999994,
+    0.49999999999999994, -0.8660254037844387, -0.0, -1.0,
+    -0.49999999999999994, -0.8660254037844387, 0.8571673007021123,
+    -0.5150380749100542, 0.4694715627858908, -0.882947592858927,
+    -0.05233595624294383, -0.9986295347545738, -0.5591929034707468,
+    -0.8290375725550417, 0.848048096156426, -0.5299192642332049,
+    0.4383711467890774, -0.898794046299167, -0.10452846326765346,
+    -0.9945218953682733, -0.6156614753256583, -0.7880107536067219,
+    0.838670567945424, -0.544639035015027, 0.40673664307580015,
+    -0.9135454576426009, -0.15643446504023087, -0.9876883405951378,
+    -0.6691306063588582, -0.7431448254773942, 0.8290375725550417,
+    -0.5591929034707468, 0.374606593415912, -0.9271838545667874,
+    -0.20791169081775931, -0.9781476007338057, -0.7193398003386512,
+    -0.6946583704589973, 0.8191520442889918, -0.573576436351046,
+    0.3420201433256687, -0.9396926207859084, -0.25881904510252074,
+    -0.9659258262890683, -0.766044443118978, -0.6427876096865393,
+    0.8090169943749475, -0.5877852522924731, 0.3090169943749474,
+    -0.9510565162951535, -0.3090169943749474, -0.9510565162951535,
+    -0.8090169943749475, -0.5877852522924731, 0.7986355100472928,
+    -0.6018150231520483, 0.27563735581699916, -0.9612616959383189,
+    -0.35836794954530027, -0.9335804264972017, -0.848048096156426,
+    -0.5299192642332049, 0.7880107536067219, -0.6156614753256583,
+    0.24192189559966773, -0.9702957262759965, -0.40673664307580015,
+    -0.9135454576426009, -0.882947592858927, -0.4694715627858908,
+    0.7771459614569709, -0.6293203910498375, 0.20791169081775931,
+    -0.9781476007338057, -0.45399049973954675, -0.8910065241883679,
+    -0.9135454576426009, -0.40673664307580015, 0.766044443118978,
+    -0.6427876096865393, 0.17364817766693033, -0.984807753012208,
+    -0.49999999999999994, -0.8660254037844387, -0.9396926207859084,
+    -0.3420201433256687, 0.754709580222772, -0.6560590289905073,
+    0.13917310096006544, -0.9902680687415704, -0.544639035015027,
+    -0.838670567945424, -0.9612616959383189, -0.27563735581699916,
+    0.7431448254773942, -0.6691306063588582, 0.10452846326765346,
+    -0.9945218953682733, -0.5877852522924731, -0.8090169943749475,
+    -0.9781476007338057, -0.20791169081775931, 0.7313537016191705,
+    -0.6819983600624985, 0.0697564737441253, -0.9975640502598242,
+    -0.6293203910498375, -0.7771459614569709, -0.9902680687415704,
+    -0.13917310096006544, 0.7193398003386512, -0.6946583704589973,
+    0.03489949670250097, -0.9993908270190958, -0.6691306063588582,
+    -0.7431448254773942, -0.9975640502598242, -0.0697564737441253,
+    0.7071067811865476, -0.7071067811865475, -0.0, -1.0,
+    -0.7071067811865476, -0.7071067811865475, -1.0, -0.0,
+    0.6946583704589973, -0.7193398003386512, -0.03489949670250097,
+    -0.9993908270190958, -0.7431448254773942, -0.6691306063588582,
+    -0.9975640502598242, 0.0697564737441253, 0.6819983600624985,
+    -0.7313537016191705, -0.0697564737441253, -0.9975640502598242,
+    -0.7771459614569709, -0.6293203910498375, -0.9902680687415704,
+    0.13917310096006544, 0.6691306063588582, -0.7431448254773942,
+    -0.10452846326765346, -0.9945218953682733, -0.8090169943749475,
+    -0.5877852522924731, -0.9781476007338057, 0.20791169081775931,
+    0.6560590289905073, -0.754709580222772, -0.13917310096006544,
+    -0.9902680687415704, -0.838670567945424, -0.544639035015027,
+    -0.9612616959383189, 0.27563735581699916, 0.6427876096865393,
+    -0.766044443118978, -0.17364817766693033, -0.984807753012208,
+    -0.8660254037844387, -0.49999999999999994, -0.9396926207859084,
+    0.3420201433256687, 0.6293203910498375, -0.7771459614569709,
+    -0.20791169081775931, -0.9781476007338057, -0.8910065241883679,
+    -0.45399049973954675, -0.9135454576426009, 0.40673664307580015,
+    0.6156614753256583, -0.7880107536067219, -0.24192189559966773,
+    -0.9702957262759965, -0.9135454576426009, -0.40673664307580015,
+    -0.882947592858927, 0.4694715627858908, 0.6018150231520483,
+    -0.7986355100472928, -0.27563735581699916, -0.9612616959383189,
+    -0.9335804264972017, -0.35836794954530027, -0.848048096156426,
+    0.5299192642332049, 0.5877852522924731, -0.8090169943749475,
+    -0.3090169943749474, -0.9510565162951535, -0.9510565162951535,
+    -0.3090169943749474, -0.8090169943749475, 0.5877852522924731,
+    0.573576436351046, -0.8191520442889918, -0.3420201433256687,
+    -0.9396926207859084, -0.9659258262890683, -0.25881904510252074,
+    -0.766044443118978, 0.6427876096865393, 0.5591929034707468,
+    -0.8290375725550417, -0.374606593415912, -0.9271838545667874,
+    -0.9781476007338057, -0.20791169081775931, -0.7193398003386512,
+    0.6946583704589973, 0.544639035015027, -0.838670567945424,
+    -0.40673664307580015, -0.9135454576426009, -0.9876883405951378,
+    -0.15643446504023087, -0.6691306063588582, 0.7431448254773942,
+    0.5299192642332049, -0.848048096156426, -0.4383711467890774,
+    -0.898794046299167, -0.9945218953682733, -0.10452846326765346,
+    -0.6156614753256583, 0.7880107536067219, 0.5150380749100542,
+    -0.8571673007021123, -0.4694715627858908, -0.882947592858927,
+    -0.9986295347545738, -0.05233595624294383, -0.5591929034707468,
+    0.8290375725550417, 0.49999999999999994, -0.8660254037844387,
+    -0.49999999999999994, -0.8660254037844387, -1.0, -0.0,
+    -0.49999999999999994, 0.8660254037844387, 0.48480962024633706,
+    -0.8746197071393957, -0.5299192642332049, -0.848048096156426,
+    -0.9986295347545738, 0.05233595624294383, -0.4383711467890774,
+    0.898794046299167, 0.4694715627858908, -0.882947592858927,
+    -0.5591929034707468, -0.8290375725550417, -0.9945218953682733,
+    0.10452846326765346, -0.374606593415912, 0.9271838545667874,
+    0.45399049973954675, -0.8910065241883679, -0.5877852522924731,
+    -0.8090169943749475, -0.9876883405951378, 0.15643446504023087,
+    -0.3090169943749474, 0.9510565162951535, 0.4383711467890774,
+    -0.898794046299167, -0.6156614753256583, -0.7880107536067219,
+    -0.9781476007338057, 0.20791169081775931, -0.24192189559966773,
+    0.9702957262759965, 0.42261826174069944, -0.9063077870366499,
+    -0.6427876096865393, -0.766044443118978, -0.9659258262890683,
+    0.25881904510252074, -0.17364817766693033, 0.984807753012208,
+    0.40673664307580015, -0.9135454576426009, -0.6691306063588582,
+    -0.7431448254773942, -0.9510565162951535, 0.3090169943749474,
+    -0.10452846326765346, 0.9945218953682733, 0.3907311284892737,
+    -0.9205048534524404, -0.6946583704589973, -0.7193398003386512,
+    -0.9335804264972017, 0.35836794954530027, -0.03489949670250097,
+    0.9993908270190958, 0.374606593415912, -0.9271838545667874,
+    -0.7193398003386512, -0.6946583704589973, -0.9135454576426009,
+    0.40673664307580015, 0.03489949670250097, 0.9993908270190958,
+    0.35836794954530027, -0.9335804264972017, -0.7431448254773942,
+    -0.6691306063588582, -0.8910065241883679, 0.45399049973954675,
+    0.10452846326765346, 0.9945218953682733, 0.3420201433256687,
+    -0.9396926207859084, -0.766044443118978, -0.6427876096865393,
+    -0.8660254037844387, 0.49999999999999994, 0.17364817766693033,
+    0.984807753012208, 0.3255681544571567, -0.9455185755993168,
+    -0.7880107536067219, -0.6156614753256583, -0.838670567945424,
+    0.544639035015027, 0.24192189559966773, 0.9702957262759965
+]);
+const COMPACT_SCRATCH_RE = new Float64Array(360);
+const COMPACT_SCRATCH_IM = new Float64Array(360);
 
 //
 //  Public functions.
@@ -1542,6 +314,8 @@ function ApplyMixedRadixFFT_360_Part3(re, im) {
  * 
  *  Note(s):
  *    [1] The size of `re` and `im` will not be checked.
+ *    [2] The transform is done by the table-driven loop kernel (compact
+ *        mode), which is smaller but slower than the unrolled kernels.
  * 
  *  @param {Number[]} re 
  *    - The real part of each point.
@@ -1549,9 +323,7 @@ function ApplyMixedRadixFFT_360_Part3(re, im) {
  *    - The imaginary part of each point.
  */
 function ApplyMixedRadixFFT_360(re, im) {
-    ApplyMixedRadixFFT_360_Part1(re, im);
-    ApplyMixedRadixFFT_360_Part2(re, im);
-    ApplyMixedRadixFFT_360_Part3(re, im);
+    MXCompact(re, im, COMPACT_RADICES, COMPACT_INDEXES, COMPACT_TWIDDLES, COMPACT_SCRATCH_RE, COMPACT_SCRATCH_IM);
 }
 
 //  Export public APIs.
@@ -20,2011 +20,377 @@ const Lc3FftMxBaseOp =
     require("./fft-mx-baseop");
 
 //  Imported functions.
-const MXTr2 = 
-    Lc3FftMxBaseOp.MXTr2;
-const MXTr3 = 
-    Lc3FftMxBaseOp.MXTr3;
-const MXTr4 = 
-    Lc3FftMxBaseOp.MXTr4;
-const MXTr5 = 
-    Lc3FftMxBaseOp.MXTr5;
-const MXRot = 
-    Lc3FftMxBaseOp.MXRot;
+// const MXTr2 = 
+//     Lc3FftMxBaseOp.MXTr2;
+// const MXTr3 = 
+//     Lc3FftMxBaseOp.MXTr3;
+// const MXTr4 = 
+//     Lc3FftMxBaseOp.MXTr4;
+// const MXTr5 = 
+//     Lc3FftMxBaseOp.MXTr5;
+// const MXRot = 
+//     Lc3FftMxBaseOp.MXRot;
 // const MXSwap = 
 //     Lc3FftMxBaseOp.MXSwap;
-const MXCshft = 
-    Lc3FftMxBaseOp.MXCshft;
+// const MXCshft = 
+//     Lc3FftMxBaseOp.MXCshft;
+const MXCompact = 
+    Lc3FftMxBaseOp.MXCompact;
 
 //
 //  Constants.
 //
 
-//  Cyclic shift indexes.
-const CSHFT_INDEXES_0 = [1, 96, 170, 52, 252, 241, 97, 266, 127, 230, 70, 66, 138, 374, 447, 233, 358, 369, 423, 299, 469, 431, 155, 92, 242, 193, 346, 129, 422, 203, 304, 403, 293, 349, 417, 269, 415, 77, 282, 205, 40, 12, 240];
-const CSHFT_INDEXES_1 = [2, 192, 250, 49, 420, 11, 144, 404, 389, 429, 419, 461, 119, 464, 407, 221, 118, 368, 327, 219, 472, 263, 295, 85, 26, 126, 134, 446, 137, 278, 367, 231, 166, 124, 398, 381, 117, 272, 247, 217, 280, 13, 336, 171, 148, 332, 243, 289, 421, 107, 224, 406, 125, 38, 366, 135, 86, 122, 206, 136, 182, 202, 208, 328, 315, 91, 146, 140, 20, 6, 120, 14, 432, 251, 145, 44, 396, 189, 418, 365, 39, 462, 215, 88, 314, 451, 161, 100, 8, 312, 259, 457, 281, 109, 416, 173, 340, 9, 408, 317, 283, 301, 115, 80];
-const CSHFT_INDEXES_2 = [3, 288, 325, 27, 222, 214, 448, 329, 411, 149, 428, 323, 291, 157, 284, 397, 285, 37, 270, 55, 84, 386, 141, 116, 176, 172, 244, 385, 45, 36, 174, 436, 179, 460, 23, 294, 445, 41, 108, 320];
-const CSHFT_INDEXES_3 = [4, 384, 405, 29, 414, 437, 275, 79, 474, 455, 89, 410, 53, 348, 321, 99, 458, 377, 279, 463, 311, 163, 292, 253, 337, 267, 223, 310, 67, 234, 454, 449, 425, 35, 78, 378, 375, 87, 218, 376, 183, 298, 373, 351, 153, 356, 177, 268, 319, 475, 95, 74, 450, 65, 42, 204, 400, 5, 24, 390, 69, 426, 131, 158, 380, 21, 102, 200, 16, 168, 316, 187, 226, 142, 212, 256, 169, 412, 245, 25, 30, 54, 444, 401, 101, 104, 392, 261, 103, 296, 181, 106, 128, 326, 123, 302, 211, 160];
-const CSHFT_INDEXES_4 = [7, 216, 184, 394, 453, 353, 345, 33, 342, 201, 112, 248, 313, 355, 81, 98, 362, 207, 232, 262, 199, 466, 143, 308, 331, 147, 236, 190, 58, 372, 255, 73, 354, 441, 113, 344, 393, 357, 273, 343, 297, 277, 271, 151, 164, 388, 333, 339, 459, 473, 359, 465, 47, 228, 334, 435, 83, 290, 61, 114, 440, 17, 264, 391, 165, 28, 318, 379, 471, 167, 220, 22, 198, 370, 63, 306, 139, 470, 71, 162, 196, 178, 364, 399, 477, 287, 229, 430, 59, 468, 335, 75, 90, 50, 60, 18, 360, 15, 72, 258, 361, 111, 152, 260];
-const CSHFT_INDEXES_5 = [10, 48, 324, 387, 237, 286, 133, 350, 57, 276, 175, 76, 186, 130, 62, 210, 64, 402, 197, 274, 439, 467, 239, 478, 383, 309, 427, 227, 238, 382, 213, 352, 249, 409, 413, 341, 105, 32, 246, 121, 110, 56, 180];
-const CSHFT_INDEXES_6 = [19, 456, 185, 34, 438, 371, 159, 476, 191, 154, 452, 257, 265, 31, 150, 68, 330, 51, 156, 188, 322, 195, 82, 194, 442, 209, 424, 395, 93, 338, 363, 303, 307, 235, 94, 434, 443, 305, 43, 300];
-const CSHFT_INDEXES_7 = [46, 132, 254, 433, 347, 225];
-
-//
-//  Private functions.
-//
-
-/**
- *  Part 1 of ApplyMixedRadixFFT_480().
- * 
- *  @param {Number[]} re 
- *    - The real part of each point.
- *  @param {Number[]} im 
- *    - The imaginary part of each point.
- */
-function ApplyMixedRadixFFT_480_Part1(re, im) {
-    MXTr5(re, im, 0, 96, 192, 288, 384);
-    MXTr5(re, im, 1, 97, 193, 289, 385);
-    MXTr5(re, im, 2, 98, 194, 290, 386);
-    MXTr5(re, im, 3, 99, 195, 291, 387);
-    MXTr5(re, im, 4, 100, 196, 292, 388);
-    MXTr5(re, im, 5, 101, 197, 293, 389);
-    MXTr5(re, im, 6, 102, 198, 294, 390);
-    MXTr5(re, im, 7, 103, 199, 295, 391);
-    MXTr5(re, im, 8, 104, 200, 296, 392);
-    MXTr5(re, im, 9, 105, 201, 297, 393);
-    MXTr5(re, im, 10, 106, 202, 298, 394);
-    MXTr5(re, im, 11, 107, 203, 299, 395);
-    MXTr5(re, im, 12, 108, 204, 300, 396);
-    MXTr5(re, im, 13, 109, 205, 301, 397);
-    MXTr5(re, im, 14, 110, 206, 302, 398);
-    MXTr5(re, im, 15, 111, 207, 303, 399);
-    MXTr5(re, im, 16, 112, 208, 304, 400);
-    MXTr5(re, im, 17, 113, 209, 305, 401);
-    MXTr5(re, im, 18, 114, 210, 306, 402);
-    MXTr5(re, im, 19, 115, 211, 307, 403);
-    MXTr5(re, im, 20, 116, 212, 308, 404);
-    MXTr5(re, im, 21, 117, 213, 309, 405);
-    MXTr5(re, im, 22, 118, 214, 310, 406);
-    MXTr5(re, im, 23, 119, 215, 311, 407);
-    MXTr5(re, im, 24, 120, 216, 312, 408);
-    MXTr5(re, im, 25, 121, 217, 313, 409);
-    MXTr5(re, im, 26, 122, 218, 314, 410);
-    MXTr5(re, im, 27, 123, 219, 315, 411);
-    MXTr5(re, im, 28, 124, 220, 316, 412);
-    MXTr5(re, im, 29, 125, 221, 317, 413);
-    MXTr5(re, im, 30, 126, 222, 318, 414);
-    MXTr5(re, im, 31, 127, 223, 319, 415);
-    MXTr5(re, im, 32, 128, 224, 320, 416);
-    MXTr5(re, im, 33, 129, 225, 321, 417);
-    MXTr5(re, im, 34, 130, 226, 322, 418);
-    MXTr5(re, im, 35, 131, 227, 323, 419);
-    MXTr5(re, im, 36, 132, 228, 324, 420);
-    MXTr5(re, im, 37, 133, 229, 325, 421);
-    MXTr5(re, im, 38, 134, 230, 326, 422);
-    MXTr5(re, im, 39, 135, 231, 327, 423);
-    MXTr5(re, im, 40, 136, 232, 328, 424);
-    MXTr5(re, im, 41, 137, 233, 329, 425);
-    MXTr5(re, im, 42, 138, 234, 330, 426);
-    MXTr5(re, im, 43, 139, 235, 331, 427);
-    MXTr5(re, im, 44, 140, 236, 332, 428);
-    MXTr5(re, im, 45, 141, 237, 333, 429);
-    MXTr5(re, im, 46, 142, 238, 334, 430);
-    MXTr5(re, im, 47, 143, 239, 335, 431);
-    MXTr5(re, im, 48, 144, 240, 336, 432);
-    MXTr5(re, im, 49, 145, 241, 337, 433);
-    MXTr5(re, im, 50, 146, 242, 338, 434);
-    MXTr5(re, im, 51, 147, 243, 339, 435);
-    MXTr5(re, im, 52, 148, 244, 340, 436);
-    MXTr5(re, im, 53, 149, 245, 341, 437);
-    MXTr5(re, im, 54, 150, 246, 342, 438);
-    MXTr5(re, im, 55, 151, 247, 343, 439);
-    MXTr5(re, im, 56, 152, 248, 344, 440);
-    MXTr5(re, im, 57, 153, 249, 345, 441);
-    MXTr5(re, im, 58, 154, 250, 346, 442);
-    MXTr5(re, im, 59, 155, 251, 347, 443);
-    MXTr5(re, im, 60, 156, 252, 348, 444);
-    MXTr5(re, im, 61, 157, 253, 349, 445);
-    MXTr5(re, im, 62, 158, 254, 350, 446);
-    MXTr5(re, im, 63, 159, 255, 351, 447);
-    MXTr5(re, im, 64, 160, 256, 352, 448);
-    MXTr5(re, im, 65, 161, 257, 353, 449);
-    MXTr5(re, im, 66, 162, 258, 354, 450);
-    MXTr5(re, im, 67, 163, 259, 355, 451);
-    MXTr5(re, im, 68, 164, 260, 356, 452);
-    MXTr5(re, im, 69, 165, 261, 357, 453);
-    MXTr5(re, im, 70, 166, 262, 358, 454);
-    MXTr5(re, im, 71, 167, 263, 359, 455);
-    MXTr5(re, im, 72, 168, 264, 360, 456);
-    MXTr5(re, im, 73, 169, 265, 361, 457);
-    MXTr5(re, im, 74, 170, 266, 362, 458);
-    MXTr5(re, im, 75, 171, 267, 363, 459);
-    MXTr5(re, im, 76, 172, 268, 364, 460);
-    MXTr5(re, im, 77, 173, 269, 365, 461);
-    MXTr5(re, im, 78, 174, 270, 366, 462);
-    MXTr5(re, im, 79, 175, 271, 367, 463);
-    MXTr5(re, im, 80, 176, 272, 368, 464);
-    MXTr5(re, im, 81, 177, 273, 369, 465);
-    MXTr5(re, im, 82, 178, 274, 370, 466);
-    MXTr5(re, im, 83, 179, 275, 371, 467);
-    MXTr5(re, im, 84, 180, 276, 372, 468);
-    MXTr5(re, im, 85, 181, 277, 373, 469);
-    MXTr5(re, im, 86, 182, 278, 374, 470);
-    MXTr5(re, im, 87, 183, 279, 375, 471);
-    MXTr5(re, im, 88, 184, 280, 376, 472);
-    MXTr5(re, im, 89, 185, 281, 377, 473);
-    MXTr5(re, im, 90, 186, 282, 378, 474);
-    MXTr5(re, im, 91, 187, 283, 379, 475);
-    MXTr5(re, im, 92, 188, 284, 380, 476);
-    MXTr5(re, im, 93, 189, 285, 381, 477);
-    MXTr5(re, im, 94, 190, 286, 382, 478);
-    MXTr5(re, im, 95, 191, 287, 383, 479);
-    MXRot(re, im, 97, 0.999914327574007, -0.01308959557134444);
-    MXRot(re, im, 98, 0.9996573249755573, -0.02617694830787315);
-    MXRot(re, im, 99, 0.9992290362407229, -0.03925981575906861);
-    MXRot(re, im, 100, 0.9986295347545738, -0.05233595624294383);
-    MXRot(re, im, 101, 0.9978589232386035, -0.06540312923014306);
-    MXRot(re, im, 102, 0.996917333733128, -0.07845909572784494);
-    MXRot(re, im, 103, 0.9958049275746618, -0.09150161866340237);
-    MXRot(re, im, 104, 0.9945218953682733, -0.10452846326765346);
-    MXRot(re, im, 105, 0.9930684569549263, -0.11753739745783764);
-    MXRot(re, im, 106, 0.9914448613738104, -0.13052619222005157);
-    MXRot(re, im, 107, 0.9896513868196702, -0.1434926219911793);
-    MXRot(re, im, 108, 0.9876883405951378, -0.15643446504023087);
-    MXRot(re, im, 109, 0.9855560590580777, -0.16934950384902459);
-    MXRot(re, im, 110, 0.9832549075639546, -0.18223552549214744);
-    MXRot(re, im, 111, 0.9807852804032304, -0.19509032201612825);
-    MXRot(re, im, 112, 0.9781476007338057, -0.20791169081775931);
-    MXRot(re, im, 113, 0.9753423205085127, -0.22069743502150108);
-    MXRot(re, im, 114, 0.9723699203976766, -0.2334453638559054);
-    MXRot(re, im, 115, 0.9692309097067544, -0.24615329302899303);
-    MXRot(re, im, 116, 0.9659258262890683, -0.25881904510252074);
-    MXRot(re, im, 117, 0.9624552364536473, -0.27144044986507426);
-    MXRot(re, im, 118, 0.958819734868193, -0.2840153447039226);
-    MXRot(re, im, 119, 0.9550199444571866, -0.29654157497557093);
-    MXRot(re, im, 120, 0.9510565162951535, -0.3090169943749474);
-    MXRot(re, im, 121, 0.9469301294951057, -0.32143946530316153);
-    MXRot(re, im, 122, 0.9426414910921784, -0.3338068592337709);
-    MXRot(re, im, 123, 0.9381913359224842, -0.34611705707749296);
-    MXRot(re, im, 124, 0.9335804264972017, -0.3583679495453002);
-    MXRot(re, im, 125, 0.9288095528719242, -0.3705574375098362);
-    MXRot(re, im, 126, 0.9238795325112867, -0.3826834323650898);
-    MXRot(re, im, 127, 0.9187912101488983, -0.3947438563842672);
-    MXRot(re, im, 128, 0.9135454576426009, -0.40673664307580015);
-    MXRot(re, im, 129, 0.9081431738250813, -0.4186597375374281);
-    MXRot(re, im, 130, 0.9025852843498606, -0.4305110968082951);
-    MXRot(re, im, 131, 0.8968727415326884, -0.44228869021900125);
-    MXRot(re, im, 132, 0.8910065241883679, -0.45399049973954675);
-    MXRot(re, im, 133, 0.8849876374630419, -0.46561452032511136);
-    MXRot(re, im, 134, 0.8788171126619654, -0.4771587602596084);
-    MXRot(re, im, 135, 0.8724960070727972, -0.4886212414969549);
-    MXRot(re, im, 136, 0.8660254037844387, -0.49999999999999994);
-    MXRot(re, im, 137, 0.8594064115014527, -0.511293086077052);
-    MXRot(re, im, 138, 0.8526401643540922, -0.5224985647159488);
-    MXRot(re, im, 139, 0.8457278217039733, -0.5336145159156115);
-    MXRot(re, im, 140, 0.838670567945424, -0.544639035015027);
-    MXRot(re, im, 141, 0.8314696123025452, -0.5555702330196022);
-    MXRot(re, im, 142, 0.8241261886220157, -0.5664062369248328);
-    MXRot(re, im, 143, 0.816641555161679, -0.5771451900372335);
-    MXRot(re, im, 144, 0.8090169943749475, -0.5877852522924731);
-    MXRot(re, im, 145, 0.8012538126910607, -0.598324600570659);
-    MXRot(re, im, 146, 0.7933533402912353, -0.6087614290087205);
-    MXRot(re, im, 147, 0.785316930880745, -0.619093949309834);
-    MXRot(re, im, 148, 0.7771459614569709, -0.6293203910498374);
-    MXRot(re, im, 149, 0.7688418320734596, -0.6394390019805847);
-    MXRot(re, im, 150, 0.7604059656000309, -0.6494480483301837);
-    MXRot(re, im, 151, 0.7518398074789774, -0.6593458151000688);
-    MXRot(re, im, 152, 0.7431448254773944, -0.6691306063588581);
-    MXRot(re, im, 153, 0.7343225094356856, -0.6788007455329417);
-    MXRot(re, im, 154, 0.7253743710122876, -0.6883545756937539);
-    MXRot(re, im, 155, 0.7163019434246544, -0.6977904598416801);
-    MXRot(re, im, 156, 0.7071067811865476, -0.7071067811865475);
-    MXRot(re, im, 157, 0.6977904598416802, -0.7163019434246543);
-    MXRot(re, im, 158, 0.688354575693754, -0.7253743710122875);
-    MXRot(re, im, 159, 0.6788007455329418, -0.7343225094356856);
-    MXRot(re, im, 160, 0.6691306063588582, -0.7431448254773941);
-    MXRot(re, im, 161, 0.659345815100069, -0.7518398074789773);
-    MXRot(re, im, 162, 0.6494480483301837, -0.7604059656000309);
-    MXRot(re, im, 163, 0.6394390019805848, -0.7688418320734595);
-    MXRot(re, im, 164, 0.6293203910498375, -0.7771459614569708);
-    MXRot(re, im, 165, 0.619093949309834, -0.785316930880745);
-    MXRot(re, im, 166, 0.6087614290087207, -0.7933533402912352);
-    MXRot(re, im, 167, 0.5983246005706592, -0.8012538126910606);
-    MXRot(re, im, 168, 0.5877852522924731, -0.8090169943749475);
-    MXRot(re, im, 169, 0.5771451900372337, -0.8166415551616789);
-    MXRot(re, im, 170, 0.5664062369248329, -0.8241261886220156);
-    MXRot(re, im, 171, 0.5555702330196023, -0.8314696123025452);
-    MXRot(re, im, 172, 0.5446390350150272, -0.8386705679454239);
-    MXRot(re, im, 173, 0.5336145159156116, -0.8457278217039732);
-    MXRot(re, im, 174, 0.5224985647159489, -0.8526401643540922);
-    MXRot(re, im, 175, 0.5112930860770523, -0.8594064115014526);
-    MXRot(re, im, 176, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 177, 0.48862124149695496, -0.8724960070727971);
-    MXRot(re, im, 178, 0.47715876025960857, -0.8788171126619653);
-    MXRot(re, im, 179, 0.4656145203251115, -0.8849876374630418);
-    MXRot(re, im, 180, 0.4539904997395468, -0.8910065241883678);
-    MXRot(re, im, 181, 0.44228869021900147, -0.8968727415326883);
-    MXRot(re, im, 182, 0.43051109680829525, -0.9025852843498605);
-    MXRot(re, im, 183, 0.41865973753742813, -0.9081431738250813);
-    MXRot(re, im, 184, 0.4067366430758004, -0.9135454576426009);
-    MXRot(re, im, 185, 0.39474385638426734, -0.9187912101488982);
-    MXRot(re, im, 186, 0.38268343236508984, -0.9238795325112867);
-    MXRot(re, im, 187, 0.3705574375098364, -0.9288095528719241);
-    MXRot(re, im, 188, 0.3583679495453004, -0.9335804264972017);
-    MXRot(re, im, 189, 0.346117057077493, -0.9381913359224842);
-    MXRot(re, im, 190, 0.3338068592337711, -0.9426414910921783);
-    MXRot(re, im, 191, 0.3214394653031617, -0.9469301294951056);
-    MXRot(re, im, 193, 0.9996573249755573, -0.02617694830787315);
-    MXRot(re, im, 194, 0.9986295347545738, -0.05233595624294383);
-    MXRot(re, im, 195, 0.996917333733128, -0.07845909572784494);
-    MXRot(re, im, 196, 0.9945218953682733, -0.10452846326765346);
-    MXRot(re, im, 197, 0.9914448613738104, -0.13052619222005157);
-    MXRot(re, im, 198, 0.9876883405951378, -0.15643446504023087);
-    MXRot(re, im, 199, 0.9832549075639546, -0.18223552549214744);
-    MXRot(re, im, 200, 0.9781476007338057, -0.20791169081775931);
-    MXRot(re, im, 201, 0.9723699203976766, -0.2334453638559054);
-    MXRot(re, im, 202, 0.9659258262890683, -0.25881904510252074);
-    MXRot(re, im, 203, 0.958819734868193, -0.2840153447039226);
-    MXRot(re, im, 204, 0.9510565162951535, -0.3090169943749474);
-    MXRot(re, im, 205, 0.9426414910921784, -0.3338068592337709);
-    MXRot(re, im, 206, 0.9335804264972017, -0.3583679495453002);
-    MXRot(re, im, 207, 0.9238795325112867, -0.3826834323650898);
-    MXRot(re, im, 208, 0.9135454576426009, -0.40673664307580015);
-    MXRot(re, im, 209, 0.9025852843498606, -0.4305110968082951);
-    MXRot(re, im, 210, 0.8910065241883679, -0.45399049973954675);
-    MXRot(re, im, 211, 0.8788171126619654, -0.4771587602596084);
-    MXRot(re, im, 212, 0.8660254037844387, -0.49999999999999994);
-    MXRot(re, im, 213, 0.8526401643540922, -0.5224985647159488);
-    MXRot(re, im, 214, 0.838670567945424, -0.544639035015027);
-    MXRot(re, im, 215, 0.8241261886220157, -0.5664062369248328);
-    MXRot(re, im, 216, 0.8090169943749475, -0.5877852522924731);
-    MXRot(re, im, 217, 0.7933533402912353, -0.6087614290087205);
-    MXRot(re, im, 218, 0.7771459614569709, -0.6293203910498374);
-    MXRot(re, im, 219, 0.7604059656000309, -0.6494480483301837);
-    MXRot(re, im, 220, 0.7431448254773944, -0.6691306063588581);
-    MXRot(re, im, 221, 0.7253743710122876, -0.6883545756937539);
-    MXRot(re, im, 222, 0.7071067811865476, -0.7071067811865475);
-    MXRot(re, im, 223, 0.688354575693754, -0.7253743710122875);
-    MXRot(re, im, 224, 0.6691306063588582, -0.7431448254773941);
-    MXRot(re, im, 225, 0.6494480483301837, -0.7604059656000309);
-    MXRot(re, im, 226, 0.6293203910498375, -0.7771459614569708);
-    MXRot(re, im, 227, 0.6087614290087207, -0.7933533402912352);
-    MXRot(re, im, 228, 0.5877852522924731, -0.8090169943749475);
-    MXRot(re, im, 229, 0.5664062369248329, -0.8241261886220156);
-    MXRot(re, im, 230, 0.5446390350150272, -0.8386705679454239);
-    MXRot(re, im, 231, 0.5224985647159489, -0.8526401643540922);
-    MXRot(re, im, 232, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 233, 0.47715876025960857, -0.8788171126619653);
-    MXRot(re, im, 234, 0.4539904997395468, -0.8910065241883678);
-    MXRot(re, im, 235, 0.43051109680829525, -0.9025852843498605);
-    MXRot(re, im, 236, 0.4067366430758004, -0.9135454576426009);
-    MXRot(re, im, 237, 0.38268343236508984, -0.9238795325112867);
-    MXRot(re, im, 238, 0.3583679495453004, -0.9335804264972017);
-    MXRot(re, im, 239, 0.3338068592337711, -0.9426414910921783);
-    MXRot(re, im, 240, 0.30901699437494745, -0.9510565162951535);
-    MXRot(re, im, 241, 0.28401534470392276, -0.958819734868193);
-    MXRot(re, im, 242, 0.25881904510252096, -0.9659258262890682);
-    MXRot(re, im, 243, 0.23344536385590547, -0.9723699203976766);
-    MXRot(re, im, 244, 0.20791169081775945, -0.9781476007338056);
-    MXRot(re, im, 245, 0.18223552549214767, -0.9832549075639545);
-    MXRot(re, im, 246, 0.15643446504023092, -0.9876883405951378);
-    MXRot(re, im, 247, 0.1305261922200517, -0.9914448613738104);
-    MXRot(re, im, 248, 0.10452846326765368, -0.9945218953682733);
-    MXRot(re, im, 249, 0.078459095727845, -0.996917333733128);
-    MXRot(re, im, 250, 0.052335956242943966, -0.9986295347545738);
-    MXRot(re, im, 251, 0.02617694830787336, -0.9996573249755573);
-    MXRot(re, im, 252, 6.123233995736766e-17, -1.0);
-    MXRot(re, im, 253, -0.026176948307873017, -0.9996573249755573);
-    MXRot(re, im, 254, -0.05233595624294362, -0.9986295347545738);
-    MXRot(re, im, 255, -0.07845909572784487, -0.996917333733128);
-    MXRot(re, im, 256, -0.10452846326765333, -0.9945218953682734);
-    MXRot(re, im, 257, -0.13052619222005138, -0.9914448613738105);
-    MXRot(re, im, 258, -0.1564344650402308, -0.9876883405951378);
-    MXRot(re, im, 259, -0.1822355254921473, -0.9832549075639546);
-    MXRot(re, im, 260, -0.20791169081775912, -0.9781476007338057);
-    MXRot(re, im, 261, -0.23344536385590534, -0.9723699203976767);
-    MXRot(re, im, 262, -0.25881904510252063, -0.9659258262890683);
-    MXRot(re, im, 263, -0.2840153447039224, -0.9588197348681932);
-    MXRot(re, im, 264, -0.30901699437494734, -0.9510565162951536);
-    MXRot(re, im, 265, -0.3338068592337708, -0.9426414910921784);
-    MXRot(re, im, 266, -0.35836794954530005, -0.9335804264972019);
-    MXRot(re, im, 267, -0.3826834323650897, -0.9238795325112867);
-    MXRot(re, im, 268, -0.40673664307580004, -0.913545457642601);
-    MXRot(re, im, 269, -0.4305110968082949, -0.9025852843498607);
-    MXRot(re, im, 270, -0.4539904997395467, -0.8910065241883679);
-    MXRot(re, im, 271, -0.4771587602596081, -0.8788171126619656);
-    MXRot(re, im, 272, -0.4999999999999998, -0.8660254037844387);
-    MXRot(re, im, 273, -0.5224985647159488, -0.8526401643540923);
-    MXRot(re, im, 274, -0.5446390350150268, -0.8386705679454243);
-    MXRot(re, im, 275, -0.5664062369248326, -0.8241261886220158);
-    MXRot(re, im, 276, -0.587785252292473, -0.8090169943749475);
-    MXRot(re, im, 277, -0.6087614290087203, -0.7933533402912354);
-    MXRot(re, im, 278, -0.6293203910498373, -0.777145961456971);
-    MXRot(re, im, 279, -0.6494480483301835, -0.760405965600031);
-    MXRot(re, im, 280, -0.6691306063588579, -0.7431448254773945);
-    MXRot(re, im, 281, -0.6883545756937538, -0.7253743710122879);
-    MXRot(re, im, 282, -0.7071067811865475, -0.7071067811865476);
-    MXRot(re, im, 283, -0.7253743710122874, -0.6883545756937542);
-    MXRot(re, im, 284, -0.743144825477394, -0.6691306063588583);
-    MXRot(re, im, 285, -0.7604059656000309, -0.6494480483301838);
-    MXRot(re, im, 286, -0.7771459614569707, -0.6293203910498377);
-    MXRot(re, im, 287, -0.793353340291235, -0.6087614290087209);
-    MXRot(re, im, 289, 0.9992290362407229, -0.03925981575906861);
-    MXRot(re, im, 290, 0.996917333733128, -0.07845909572784494);
-    MXRot(re, im, 291, 0.9930684569549263, -0.11753739745783764);
-    MXRot(re, im, 292, 0.9876883405951378, -0.15643446504023087);
-    MXRot(re, im, 293, 0.9807852804032304, -0.19509032201612825);
-    MXRot(re, im, 294, 0.9723699203976766, -0.2334453638559054);
-    MXRot(re, im, 295, 0.9624552364536473, -0.27144044986507426);
-    MXRot(re, im, 296, 0.9510565162951535, -0.3090169943749474);
-    MXRot(re, im, 297, 0.9381913359224842, -0.34611705707749296);
-    MXRot(re, im, 298, 0.9238795325112867, -0.3826834323650898);
-    MXRot(re, im, 299, 0.9081431738250813, -0.4186597375374281);
-    MXRot(re, im, 300, 0.8910065241883679, -0.45399049973954675);
-    MXRot(re, im, 301, 0.8724960070727972, -0.4886212414969549);
-    MXRot(re, im, 302, 0.8526401643540922, -0.5224985647159488);
-    MXRot(re, im, 303, 0.8314696123025452, -0.5555702330196022);
-    MXRot(re, im, 304, 0.8090169943749475, -0.5877852522924731);
-    MXRot(re, im, 305, 0.785316930880745, -0.619093949309834);
-    MXRot(re, im, 306, 0.7604059656000309, -0.6494480483301837);
-    MXRot(re, im, 307, 0.7343225094356856, -0.6788007455329417);
-    MXRot(re, im, 308, 0.7071067811865476, -0.7071067811865475);
-    MXRot(re, im, 309, 0.6788007455329418, -0.7343225094356856);
-    MXRot(re, im, 310, 0.6494480483301837, -0.7604059656000309);
-    MXRot(re, im, 311, 0.619093949309834, -0.785316930880745);
-    MXRot(re, im, 312, 0.5877852522924731, -0.8090169943749475);
-    MXRot(re, im, 313, 0.5555702330196023, -0.8314696123025452);
-    MXRot(re, im, 314, 0.5224985647159489, -0.8526401643540922);
-    MXRot(re, im, 315, 0.48862124149695496, -0.8724960070727971);
-    MXRot(re, im, 316, 0.4539904997395468, -0.8910065241883678);
-    MXRot(re, im, 317, 0.41865973753742813, -0.9081431738250813);
-    MXRot(re, im, 318, 0.38268343236508984, -0.9238795325112867);
-    MXRot(re, im, 319, 0.346117057077493, -0.9381913359224842);
-    MXRot(re, im, 320, 0.30901699437494745, -0.9510565162951535);
-    MXRot(re, im, 321, 0.2714404498650743, -0.9624552364536473);
-    MXRot(re, im, 322, 0.23344536385590547, -0.9723699203976766);
-    MXRot(re, im, 323, 0.19509032201612833, -0.9807852804032304);
-    MXRot(re, im, 324, 0.15643446504023092, -0.9876883405951378);
-    MXRot(re, im, 325, 0.1175373974578377, -0.9930684569549263);
-    MXRot(re, im, 326, 0.078459095727845, -0.996917333733128);
-    MXRot(re, im, 327, 0.039259815759068666, -0.9992290362407229);
-    MXRot(re, im, 328, 6.123233995736766e-17, -1.0);
-    MXRot(re, im, 329, -0.03925981575906855, -0.9992290362407229);
-    MXRot(re, im, 330, -0.07845909572784487, -0.996917333733128);
-    MXRot(re, im, 331, -0.11753739745783758, -0.9930684569549263);
-    MXRot(re, im, 332, -0.1564344650402308, -0.9876883405951378);
-    MXRot(re, im, 333, -0.1950903220161282, -0.9807852804032304);
-    MXRot(re, im, 334, -0.23344536385590534, -0.9723699203976767);
-    MXRot(re, im, 335, -0.2714404498650742, -0.9624552364536473);
-    MXRot(re, im, 336, -0.30901699437494734, -0.9510565162951536);
-    MXRot(re, im, 337, -0.3461170570774929, -0.9381913359224842);
-    MXRot(re, im, 338, -0.3826834323650897, -0.9238795325112867);
-    MXRot(re, im, 339, -0.4186597375374278, -0.9081431738250815);
-    MXRot(re, im, 340, -0.4539904997395467, -0.8910065241883679);
-    MXRot(re, im, 341, -0.4886212414969547, -0.8724960070727973);
-    MXRot(re, im, 342, -0.5224985647159488, -0.8526401643540923);
-    MXRot(re, im, 343, -0.555570233019602, -0.8314696123025455);
-    MXRot(re, im, 344, -0.587785252292473, -0.8090169943749475);
-    MXRot(re, im, 345, -0.6190939493098337, -0.7853169308807452);
-    MXRot(re, im, 346, -0.6494480483301835, -0.760405965600031);
-    MXRot(re, im, 347, -0.6788007455329416, -0.7343225094356858);
-    MXRot(re, im, 348, -0.7071067811865475, -0.7071067811865476);
-    MXRot(re, im, 349, -0.7343225094356853, -0.678800745532942);
-    MXRot(re, im, 350, -0.7604059656000309, -0.6494480483301838);
-    MXRot(re, im, 351, -0.7853169308807447, -0.6190939493098342);
-    MXRot(re, im, 352, -0.8090169943749473, -0.5877852522924732);
-    MXRot(re, im, 353, -0.831469612302545, -0.5555702330196025);
-    MXRot(re, im, 354, -0.8526401643540922, -0.5224985647159489);
-    MXRot(re, im, 355, -0.872496007072797, -0.48862124149695524);
-    MXRot(re, im, 356, -0.8910065241883678, -0.45399049973954686);
-    MXRot(re, im, 357, -0.9081431738250811, -0.4186597375374284);
-    MXRot(re, im, 358, -0.9238795325112867, -0.3826834323650899);
-    MXRot(re, im, 359, -0.938191335922484, -0.3461170570774933);
-    MXRot(re, im, 360, -0.9510565162951535, -0.3090169943749475);
-    MXRot(re, im, 361, -0.9624552364536472, -0.2714404498650746);
-    MXRot(re, im, 362, -0.9723699203976766, -0.23344536385590553);
-    MXRot(re, im, 363, -0.9807852804032304, -0.1950903220161286);
-    MXRot(re, im, 364, -0.9876883405951377, -0.15643446504023098);
-    MXRot(re, im, 365, -0.9930684569549263, -0.11753739745783798);
-    MXRot(re, im, 366, -0.996917333733128, -0.07845909572784507);
-    MXRot(re, im, 367, -0.9992290362407229, -0.03925981575906895);
-    MXRot(re, im, 368, -1.0, -1.2246467991473532e-16);
-    MXRot(re, im, 369, -0.9992290362407229, 0.03925981575906826);
-    MXRot(re, im, 370, -0.996917333733128, 0.07845909572784482);
-    MXRot(re, im, 371, -0.9930684569549263, 0.1175373974578373);
-    MXRot(re, im, 372, -0.9876883405951378, 0.15643446504023073);
-    MXRot(re, im, 373, -0.9807852804032305, 0.19509032201612792);
-    MXRot(re, im, 374, -0.9723699203976767, 0.23344536385590528);
-    MXRot(re, im, 375, -0.9624552364536474, 0.27144044986507393);
-    MXRot(re, im, 376, -0.9510565162951536, 0.3090169943749473);
-    MXRot(re, im, 377, -0.9381913359224843, 0.34611705707749263);
-    MXRot(re, im, 378, -0.9238795325112868, 0.38268343236508967);
-    MXRot(re, im, 379, -0.9081431738250815, 0.41865973753742775);
-    MXRot(re, im, 380, -0.8910065241883679, 0.4539904997395467);
-    MXRot(re, im, 381, -0.8724960070727973, 0.48862124149695463);
-    MXRot(re, im, 382, -0.8526401643540923, 0.5224985647159487);
-    MXRot(re, im, 383, -0.8314696123025455, 0.555570233019602);
-    MXRot(re, im, 385, 0.9986295347545738, -0.05233595624294383);
-    MXRot(re, im, 386, 0.9945218953682733, -0.10452846326765346);
-    MXRot(re, im, 387, 0.9876883405951378, -0.15643446504023087);
-    MXRot(re, im, 388, 0.9781476007338057, -0.20791169081775931);
-    MXRot(re, im, 389, 0.9659258262890683, -0.25881904510252074);
-    MXRot(re, im, 390, 0.9510565162951535, -0.3090169943749474);
-    MXRot(re, im, 391, 0.9335804264972017, -0.3583679495453002);
-    MXRot(re, im, 392, 0.9135454576426009, -0.40673664307580015);
-    MXRot(re, im, 393, 0.8910065241883679, -0.45399049973954675);
-    MXRot(re, im, 394, 0.8660254037844387, -0.49999999999999994);
-    MXRot(re, im, 395, 0.838670567945424, -0.544639035015027);
-    MXRot(re, im, 396, 0.8090169943749475, -0.5877852522924731);
-    MXRot(re, im, 397, 0.7771459614569709, -0.6293203910498374);
-    MXRot(re, im, 398, 0.7431448254773944, -0.6691306063588581);
-    MXRot(re, im, 399, 0.7071067811865476, -0.7071067811865475);
-    MXRot(re, im, 400, 0.6691306063588582, -0.7431448254773941);
-    MXRot(re, im, 401, 0.6293203910498375, -0.7771459614569708);
-    MXRot(re, im, 402, 0.5877852522924731, -0.8090169943749475);
-    MXRot(re, im, 403, 0.5446390350150272, -0.8386705679454239);
-    MXRot(re, im, 404, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 405, 0.4539904997395468, -0.8910065241883678);
-    MXRot(re, im, 406, 0.4067366430758004, -0.9135454576426009);
-    MXRot(re, im, 407, 0.3583679495453004, -0.9335804264972017);
-    MXRot(re, im, 408, 0.30901699437494745, -0.9510565162951535);
-    MXRot(re, im, 409, 0.25881904510252096, -0.9659258262890682);
-    MXRot(re, im, 410, 0.20791169081775945, -0.9781476007338056);
-    MXRot(re, im, 411, 0.15643446504023092, -0.9876883405951378);
-    MXRot(re, im, 412, 0.10452846326765368, -0.9945218953682733);
-    MXRot(re, im, 413, 0.052335956242943966, -0.9986295347545738);
-    MXRot(re, im, 414, 6.123233995736766e-17, -1.0);
-    MXRot(re, im, 415, -0.05233595624294362, -0.9986295347545738);
-    MXRot(re, im, 416, -0.10452846326765333, -0.9945218953682734);
-    MXRot(re, im, 417, -0.1564344650402308, -0.9876883405951378);
-    MXRot(re, im, 418, -0.20791169081775912, -0.9781476007338057);
-    MXRot(re, im, 419, -0.25881904510252063, -0.9659258262890683);
-    MXRot(re, im, 420, -0.30901699437494734, -0.9510565162951536);
-    MXRot(re, im, 421, -0.35836794954530005, -0.9335804264972019);
-    MXRot(re, im, 422, -0.40673664307580004, -0.913545457642601);
-    MXRot(re, im, 423, -0.4539904997395467, -0.8910065241883679);
-    MXRot(re, im, 424, -0.4999999999999998, -0.8660254037844387);
-    MXRot(re, im, 425, -0.5446390350150268, -0.8386705679454243);
-    MXRot(re, im, 426, -0.587785252292473, -0.8090169943749475);
-    MXRot(re, im, 427, -0.6293203910498373, -0.777145961456971);
-    MXRot(re, im, 428, -0.6691306063588579, -0.7431448254773945);
-    MXRot(re, im, 429, -0.7071067811865475, -0.7071067811865476);
-    MXRot(re, im, 430, -0.743144825477394, -0.6691306063588583);
-    MXRot(re, im, 431, -0.7771459614569707, -0.6293203910498377);
-    MXRot(re, im, 432, -0.8090169943749473, -0.5877852522924732);
-    MXRot(re, im, 433, -0.8386705679454239, -0.5446390350150273);
-    MXRot(re, im, 434, -0.8660254037844385, -0.5000000000000003);
-    MXRot(re, im, 435, -0.8910065241883678, -0.45399049973954686);
-    MXRot(re, im, 436, -0.9135454576426008, -0.40673664307580043);
-    MXRot(re, im, 437, -0.9335804264972016, -0.35836794954530066);
-    MXRot(re, im, 438, -0.9510565162951535, -0.3090169943749475);
-    MXRot(re, im, 439, -0.9659258262890682, -0.258819045102521);
-    MXRot(re, im, 440, -0.9781476007338056, -0.20791169081775973);
-    MXRot(re, im, 441, -0.9876883405951377, -0.15643446504023098);
-    MXRot(re, im, 442, -0.9945218953682733, -0.10452846326765373);
-    MXRot(re, im, 443, -0.9986295347545738, -0.05233595624294425);
-    MXRot(re, im, 444, -1.0, -1.2246467991473532e-16);
-    MXRot(re, im, 445, -0.9986295347545738, 0.052335956242943564);
-    MXRot(re, im, 446, -0.9945218953682734, 0.10452846326765305);
-    MXRot(re, im, 447, -0.9876883405951378, 0.15643446504023073);
-    MXRot(re, im, 448, -0.9781476007338057, 0.20791169081775907);
-    MXRot(re, im, 449, -0.9659258262890684, 0.25881904510252035);
-    MXRot(re, im, 450, -0.9510565162951536, 0.3090169943749473);
-    MXRot(re, im, 451, -0.9335804264972019, 0.3583679495453);
-    MXRot(re, im, 452, -0.9135454576426011, 0.4067366430757998);
-    MXRot(re, im, 453, -0.8910065241883679, 0.4539904997395467);
-    MXRot(re, im, 454, -0.8660254037844388, 0.4999999999999997);
-    MXRot(re, im, 455, -0.8386705679454243, 0.5446390350150268);
-    MXRot(re, im, 456, -0.8090169943749476, 0.587785252292473);
-    MXRot(re, im, 457, -0.777145961456971, 0.6293203910498372);
-    MXRot(re, im, 458, -0.7431448254773946, 0.6691306063588579);
-    MXRot(re, im, 459, -0.7071067811865477, 0.7071067811865475);
-    MXRot(re, im, 460, -0.6691306063588585, 0.743144825477394);
-    MXRot(re, im, 461, -0.6293203910498378, 0.7771459614569706);
-    MXRot(re, im, 462, -0.5877852522924732, 0.8090169943749473);
-    MXRot(re, im, 463, -0.5446390350150278, 0.8386705679454236);
-    MXRot(re, im, 464, -0.5000000000000004, 0.8660254037844384);
-    MXRot(re, im, 465, -0.4539904997395469, 0.8910065241883678);
-    MXRot(re, im, 466, -0.4067366430758009, 0.9135454576426005);
-    MXRot(re, im, 467, -0.3583679495453007, 0.9335804264972016);
-    MXRot(re, im, 468, -0.30901699437494756, 0.9510565162951535);
-    MXRot(re, im, 469, -0.2588190451025215, 0.9659258262890681);
-    MXRot(re, im, 470, -0.2079116908177598, 0.9781476007338056);
-    MXRot(re, im, 471, -0.15643446504023104, 0.9876883405951377);
-    MXRot(re, im, 472, -0.10452846326765423, 0.9945218953682733);
-    MXRot(re, im, 473, -0.052335956242944306, 0.9986295347545738);
-    MXRot(re, im, 474, -1.8369701987210297e-16, 1.0);
-    MXRot(re, im, 475, 0.05233595624294306, 0.9986295347545739);
-    MXRot(re, im, 476, 0.10452846326765299, 0.9945218953682734);
-    MXRot(re, im, 477, 0.15643446504023067, 0.9876883405951378);
-    MXRot(re, im, 478, 0.20791169081775857, 0.9781476007338058);
-    MXRot(re, im, 479, 0.2588190451025203, 0.9659258262890684);
-    MXTr4(re, im, 0, 24, 48, 72);
-    MXTr4(re, im, 1, 25, 49, 73);
-    MXTr4(re, im, 2, 26, 50, 74);
-    MXTr4(re, im, 3, 27, 51, 75);
-    MXTr4(re, im, 4, 28, 52, 76);
-    MXTr4(re, im, 5, 29, 53, 77);
-    MXTr4(re, im, 6, 30, 54, 78);
-    MXTr4(re, im, 7, 31, 55, 79);
-    MXTr4(re, im, 8, 32, 56, 80);
-    MXTr4(re, im, 9, 33, 57, 81);
-    MXTr4(re, im, 10, 34, 58, 82);
-    MXTr4(re, im, 11, 35, 59, 83);
-    MXTr4(re, im, 12, 36, 60, 84);
-    MXTr4(re, im, 13, 37, 61, 85);
-    MXTr4(re, im, 14, 38, 62, 86);
-    MXTr4(re, im, 15, 39, 63, 87);
-    MXTr4(re, im, 16, 40, 64, 88);
-    MXTr4(re, im, 17, 41, 65, 89);
-    MXTr4(re, im, 18, 42, 66, 90);
-    MXTr4(re, im, 19, 43, 67, 91);
-    MXTr4(re, im, 20, 44, 68, 92);
-    MXTr4(re, im, 21, 45, 69, 93);
-    MXTr4(re, im, 22, 46, 70, 94);
-    MXTr4(re, im, 23, 47, 71, 95);
-}
-
-/**
- *  Part 2 of ApplyMixedRadixFFT_480().
- * 
- *  @param {Number[]} re 
- *    - The real part of each point.
- *  @param {Number[]} im 
- *    - The imaginary part of each point.
- */
-function ApplyMixedRadixFFT_480_Part2(re, im) {
-    MXRot(re, im, 25, 0.9978589232386035, -0.06540312923014306);
-    MXRot(re, im, 26, 0.9914448613738104, -0.13052619222005157);
-    MXRot(re, im, 27, 0.9807852804032304, -0.19509032201612825);
-    MXRot(re, im, 28, 0.9659258262890683, -0.25881904510252074);
-    MXRot(re, im, 29, 0.9469301294951057, -0.32143946530316153);
-    MXRot(re, im, 30, 0.9238795325112867, -0.3826834323650898);
-    MXRot(re, im, 31, 0.8968727415326884, -0.44228869021900125);
-    MXRot(re, im, 32, 0.8660254037844387, -0.49999999999999994);
-    MXRot(re, im, 33, 0.8314696123025452, -0.5555702330196022);
-    MXRot(re, im, 34, 0.7933533402912353, -0.6087614290087205);
-    MXRot(re, im, 35, 0.7518398074789774, -0.6593458151000688);
-    MXRot(re, im, 36, 0.7071067811865476, -0.7071067811865475);
-    MXRot(re, im, 37, 0.659345815100069, -0.7518398074789773);
-    MXRot(re, im, 38, 0.6087614290087207, -0.7933533402912352);
-    MXRot(re, im, 39, 0.5555702330196024, -0.8314696123025451);
-    MXRot(re, im, 40, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 41, 0.44228869021900147, -0.8968727415326883);
-    MXRot(re, im, 42, 0.38268343236508984, -0.9238795325112867);
-    MXRot(re, im, 43, 0.3214394653031617, -0.9469301294951056);
-    MXRot(re, im, 44, 0.25881904510252096, -0.9659258262890682);
-    MXRot(re, im, 45, 0.19509032201612833, -0.9807852804032304);
-    MXRot(re, im, 46, 0.1305261922200517, -0.9914448613738104);
-    MXRot(re, im, 47, 0.06540312923014327, -0.9978589232386035);
-    MXRot(re, im, 49, 0.9914448613738104, -0.13052619222005157);
-    MXRot(re, im, 50, 0.9659258262890683, -0.25881904510252074);
-    MXRot(re, im, 51, 0.9238795325112867, -0.3826834323650898);
-    MXRot(re, im, 52, 0.8660254037844387, -0.49999999999999994);
-    MXRot(re, im, 53, 0.7933533402912353, -0.6087614290087205);
-    MXRot(re, im, 54, 0.7071067811865476, -0.7071067811865475);
-    MXRot(re, im, 55, 0.6087614290087207, -0.7933533402912352);
-    MXRot(re, im, 56, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 57, 0.38268343236508984, -0.9238795325112867);
-    MXRot(re, im, 58, 0.25881904510252096, -0.9659258262890682);
-    MXRot(re, im, 59, 0.1305261922200517, -0.9914448613738104);
-    MXRot(re, im, 60, 6.123233995736766e-17, -1.0);
-    MXRot(re, im, 61, -0.13052619222005138, -0.9914448613738105);
-    MXRot(re, im, 62, -0.25881904510252063, -0.9659258262890683);
-    MXRot(re, im, 63, -0.3826834323650895, -0.9238795325112868);
-    MXRot(re, im, 64, -0.4999999999999998, -0.8660254037844387);
-    MXRot(re, im, 65, -0.6087614290087203, -0.7933533402912354);
-    MXRot(re, im, 66, -0.7071067811865475, -0.7071067811865476);
-    MXRot(re, im, 67, -0.793353340291235, -0.6087614290087209);
-    MXRot(re, im, 68, -0.8660254037844385, -0.5000000000000003);
-    MXRot(re, im, 69, -0.9238795325112867, -0.3826834323650899);
-    MXRot(re, im, 70, -0.9659258262890682, -0.258819045102521);
-    MXRot(re, im, 71, -0.9914448613738104, -0.130526192220052);
-    MXRot(re, im, 73, 0.9807852804032304, -0.19509032201612825);
-    MXRot(re, im, 74, 0.9238795325112867, -0.3826834323650898);
-    MXRot(re, im, 75, 0.8314696123025452, -0.5555702330196022);
-    MXRot(re, im, 76, 0.7071067811865476, -0.7071067811865475);
-    MXRot(re, im, 77, 0.5555702330196024, -0.8314696123025451);
-    MXRot(re, im, 78, 0.38268343236508984, -0.9238795325112867);
-    MXRot(re, im, 79, 0.19509032201612833, -0.9807852804032304);
-    MXRot(re, im, 80, 6.123233995736766e-17, -1.0);
-    MXRot(re, im, 81, -0.19509032201612797, -0.9807852804032305);
-    MXRot(re, im, 82, -0.3826834323650895, -0.9238795325112868);
-    MXRot(re, im, 83, -0.555570233019602, -0.8314696123025455);
-    MXRot(re, im, 84, -0.7071067811865475, -0.7071067811865476);
-    MXRot(re, im, 85, -0.831469612302545, -0.5555702330196025);
-    MXRot(re, im, 86, -0.9238795325112867, -0.3826834323650899);
-    MXRot(re, im, 87, -0.9807852804032304, -0.1950903220161286);
-    MXRot(re, im, 88, -1.0, -1.2246467991473532e-16);
-    MXRot(re, im, 89, -0.9807852804032305, 0.19509032201612792);
-    MXRot(re, im, 90, -0.923879532511287, 0.3826834323650892);
-    MXRot(re, im, 91, -0.8314696123025455, 0.555570233019602);
-    MXRot(re, im, 92, -0.7071067811865479, 0.7071067811865471);
-    MXRot(re, im, 93, -0.555570233019603, 0.8314696123025448);
-    MXRot(re, im, 94, -0.38268343236509034, 0.9238795325112865);
-    MXRot(re, im, 95, -0.19509032201612866, 0.9807852804032303);
-    MXTr4(re, im, 0, 6, 12, 18);
-    MXTr4(re, im, 1, 7, 13, 19);
-    MXTr4(re, im, 2, 8, 14, 20);
-    MXTr4(re, im, 3, 9, 15, 21);
-    MXTr4(re, im, 4, 10, 16, 22);
-    MXTr4(re, im, 5, 11, 17, 23);
-    MXRot(re, im, 7, 0.9659258262890683, -0.25881904510252074);
-    MXRot(re, im, 8, 0.8660254037844387, -0.49999999999999994);
-    MXRot(re, im, 9, 0.7071067811865476, -0.7071067811865475);
-    MXRot(re, im, 10, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 11, 0.25881904510252096, -0.9659258262890682);
-    MXRot(re, im, 13, 0.8660254037844387, -0.49999999999999994);
-    MXRot(re, im, 14, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 15, 6.123233995736766e-17, -1.0);
-    MXRot(re, im, 16, -0.4999999999999998, -0.8660254037844387);
-    MXRot(re, im, 17, -0.8660254037844385, -0.5000000000000003);
-    MXRot(re, im, 19, 0.7071067811865476, -0.7071067811865475);
-    MXRot(re, im, 20, 6.123233995736766e-17, -1.0);
-    MXRot(re, im, 21, -0.7071067811865475, -0.7071067811865476);
-    MXRot(re, im, 22, -1.0, -1.2246467991473532e-16);
-    MXRot(re, im, 23, -0.7071067811865479, 0.7071067811865471);
-    MXTr3(re, im, 0, 2, 4);
-    MXTr3(re, im, 1, 3, 5);
-    MXRot(re, im, 3, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 5, -0.4999999999999998, -0.8660254037844387);
-    MXTr2(re, im, 0, 1);
-    MXTr2(re, im, 2, 3);
-    MXTr2(re, im, 4, 5);
-    MXTr3(re, im, 6, 8, 10);
-    MXTr3(re, im, 7, 9, 11);
-    MXRot(re, im, 9, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 11, -0.4999999999999998, -0.8660254037844387);
-    MXTr2(re, im, 6, 7);
-    MXTr2(re, im, 8, 9);
-    MXTr2(re, im, 10, 11);
-    MXTr3(re, im, 12, 14, 16);
-    MXTr3(re, im, 13, 15, 17);
-    MXRot(re, im, 15, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 17, -0.4999999999999998, -0.8660254037844387);
-    MXTr2(re, im, 12, 13);
-    MXTr2(re, im, 14, 15);
-    MXTr2(re, im, 16, 17);
-    MXTr3(re, im, 18, 20, 22);
-    MXTr3(re, im, 19, 21, 23);
-    MXRot(re, im, 21, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 23, -0.4999999999999998, -0.8660254037844387);
-    MXTr2(re, im, 18, 19);
-    MXTr2(re, im, 20, 21);
-    MXTr2(re, im, 22, 23);
-    MXTr4(re, im, 24, 30, 36, 42);
-    MXTr4(re, im, 25, 31, 37, 43);
-    MXTr4(re, im, 26, 32, 38, 44);
-    MXTr4(re, im, 27, 33, 39, 45);
-    MXTr4(re, im, 28, 34, 40, 46);
-    MXTr4(re, im, 29, 35, 41, 47);
-    MXRot(re, im, 31, 0.9659258262890683, -0.25881904510252074);
-    MXRot(re, im, 32, 0.8660254037844387, -0.49999999999999994);
-    MXRot(re, im, 33, 0.7071067811865476, -0.7071067811865475);
-    MXRot(re, im, 34, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 35, 0.25881904510252096, -0.9659258262890682);
-    MXRot(re, im, 37, 0.8660254037844387, -0.49999999999999994);
-    MXRot(re, im, 38, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 39, 6.123233995736766e-17, -1.0);
-    MXRot(re, im, 40, -0.4999999999999998, -0.8660254037844387);
-    MXRot(re, im, 41, -0.8660254037844385, -0.5000000000000003);
-    MXRot(re, im, 43, 0.7071067811865476, -0.7071067811865475);
-    MXRot(re, im, 44, 6.123233995736766e-17, -1.0);
-    MXRot(re, im, 45, -0.7071067811865475, -0.7071067811865476);
-    MXRot(re, im, 46, -1.0, -1.2246467991473532e-16);
-    MXRot(re, im, 47, -0.7071067811865479, 0.7071067811865471);
-    MXTr3(re, im, 24, 26, 28);
-    MXTr3(re, im, 25, 27, 29);
-    MXRot(re, im, 27, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 29, -0.4999999999999998, -0.8660254037844387);
-    MXTr2(re, im, 24, 25);
-    MXTr2(re, im, 26, 27);
-    MXTr2(re, im, 28, 29);
-    MXTr3(re, im, 30, 32, 34);
-    MXTr3(re, im, 31, 33, 35);
-    MXRot(re, im, 33, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 35, -0.4999999999999998, -0.8660254037844387);
-    MXTr2(re, im, 30, 31);
-    MXTr2(re, im, 32, 33);
-    MXTr2(re, im, 34, 35);
-    MXTr3(re, im, 36, 38, 40);
-    MXTr3(re, im, 37, 39, 41);
-    MXRot(re, im, 39, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 41, -0.4999999999999998, -0.8660254037844387);
-    MXTr2(re, im, 36, 37);
-    MXTr2(re, im, 38, 39);
-    MXTr2(re, im, 40, 41);
-    MXTr3(re, im, 42, 44, 46);
-    MXTr3(re, im, 43, 45, 47);
-    MXRot(re, im, 45, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 47, -0.4999999999999998, -0.8660254037844387);
-    MXTr2(re, im, 42, 43);
-    MXTr2(re, im, 44, 45);
-    MXTr2(re, im, 46, 47);
-    MXTr4(re, im, 48, 54, 60, 66);
-    MXTr4(re, im, 49, 55, 61, 67);
-    MXTr4(re, im, 50, 56, 62, 68);
-    MXTr4(re, im, 51, 57, 63, 69);
-    MXTr4(re, im, 52, 58, 64, 70);
-    MXTr4(re, im, 53, 59, 65, 71);
-    MXRot(re, im, 55, 0.9659258262890683, -0.25881904510252074);
-    MXRot(re, im, 56, 0.8660254037844387, -0.49999999999999994);
-    MXRot(re, im, 57, 0.7071067811865476, -0.7071067811865475);
-    MXRot(re, im, 58, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 59, 0.25881904510252096, -0.9659258262890682);
-    MXRot(re, im, 61, 0.8660254037844387, -0.49999999999999994);
-    MXRot(re, im, 62, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 63, 6.123233995736766e-17, -1.0);
-    MXRot(re, im, 64, -0.4999999999999998, -0.8660254037844387);
-    MXRot(re, im, 65, -0.8660254037844385, -0.5000000000000003);
-    MXRot(re, im, 67, 0.7071067811865476, -0.7071067811865475);
-    MXRot(re, im, 68, 6.123233995736766e-17, -1.0);
-    MXRot(re, im, 69, -0.7071067811865475, -0.7071067811865476);
-    MXRot(re, im, 70, -1.0, -1.2246467991473532e-16);
-    MXRot(re, im, 71, -0.7071067811865479, 0.7071067811865471);
-    MXTr3(re, im, 48, 50, 52);
-    MXTr3(re, im, 49, 51, 53);
-    MXRot(re, im, 51, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 53, -0.4999999999999998, -0.8660254037844387);
-    MXTr2(re, im, 48, 49);
-    MXTr2(re, im, 50, 51);
-    MXTr2(re, im, 52, 53);
-    MXTr3(re, im, 54, 56, 58);
-    MXTr3(re, im, 55, 57, 59);
-    MXRot(re, im, 57, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 59, -0.4999999999999998, -0.8660254037844387);
-    MXTr2(re, im, 54, 55);
-    MXTr2(re, im, 56, 57);
-    MXTr2(re, im, 58, 59);
-    MXTr3(re, im, 60, 62, 64);
-    MXTr3(re, im, 61, 63, 65);
-    MXRot(re, im, 63, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 65, -0.4999999999999998, -0.8660254037844387);
-    MXTr2(re, im, 60, 61);
-    MXTr2(re, im, 62, 63);
-    MXTr2(re, im, 64, 65);
-    MXTr3(re, im, 66, 68, 70);
-    MXTr3(re, im, 67, 69, 71);
-    MXRot(re, im, 69, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 71, -0.4999999999999998, -0.8660254037844387);
-    MXTr2(re, im, 66, 67);
-    MXTr2(re, im, 68, 69);
-    MXTr2(re, im, 70, 71);
-    MXTr4(re, im, 72, 78, 84, 90);
-    MXTr4(re, im, 73, 79, 85, 91);
-    MXTr4(re, im, 74, 80, 86, 92);
-    MXTr4(re, im, 75, 81, 87, 93);
-    MXTr4(re, im, 76, 82, 88, 94);
-    MXTr4(re, im, 77, 83, 89, 95);
-    MXRot(re, im, 79, 0.9659258262890683, -0.25881904510252074);
-    MXRot(re, im, 80, 0.8660254037844387, -0.49999999999999994);
-    MXRot(re, im, 81, 0.7071067811865476, -0.7071067811865475);
-    MXRot(re, im, 82, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 83, 0.25881904510252096, -0.9659258262890682);
-    MXRot(re, im, 85, 0.8660254037844387, -0.49999999999999994);
-    MXRot(re, im, 86, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 87, 6.123233995736766e-17, -1.0);
-    MXRot(re, im, 88, -0.4999999999999998, -0.8660254037844387);
-    MXRot(re, im, 89, -0.8660254037844385, -0.5000000000000003);
-    MXRot(re, im, 91, 0.7071067811865476, -0.7071067811865475);
-    MXRot(re, im, 92, 6.123233995736766e-17, -1.0);
-    MXRot(re, im, 93, -0.7071067811865475, -0.7071067811865476);
-    MXRot(re, im, 94, -1.0, -1.2246467991473532e-16);
-    MXRot(re, im, 95, -0.7071067811865479, 0.7071067811865471);
-    MXTr3(re, im, 72, 74, 76);
-    MXTr3(re, im, 73, 75, 77);
-    MXRot(re, im, 75, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 77, -0.4999999999999998, -0.8660254037844387);
-    MXTr2(re, im, 72, 73);
-    MXTr2(re, im, 74, 75);
-    MXTr2(re, im, 76, 77);
-    MXTr3(re, im, 78, 80, 82);
-    MXTr3(re, im, 79, 81, 83);
-    MXRot(re, im, 81, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 83, -0.4999999999999998, -0.8660254037844387);
-    MXTr2(re, im, 78, 79);
-    MXTr2(re, im, 80, 81);
-    MXTr2(re, im, 82, 83);
-    MXTr3(re, im, 84, 86, 88);
-    MXTr3(re, im, 85, 87, 89);
-    MXRot(re, im, 87, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 89, -0.4999999999999998, -0.8660254037844387);
-    MXTr2(re, im, 84, 85);
-    MXTr2(re, im, 86, 87);
-    MXTr2(re, im, 88, 89);
-    MXTr3(re, im, 90, 92, 94);
-    MXTr3(re, im, 91, 93, 95);
-    MXRot(re, im, 93, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 95, -0.4999999999999998, -0.8660254037844387);
-    MXTr2(re, im, 90, 91);
-    MXTr2(re, im, 92, 93);
-    MXTr2(re, im, 94, 95);
-    MXTr4(re, im, 96, 120, 144, 168);
-    MXTr4(re, im, 97, 121, 145, 169);
-    MXTr4(re, im, 98, 122, 146, 170);
-    MXTr4(re, im, 99, 123, 147, 171);
-    MXTr4(re, im, 100, 124, 148, 172);
-    MXTr4(re, im, 101, 125, 149, 173);
-    MXTr4(re, im, 102, 126, 150, 174);
-    MXTr4(re, im, 103, 127, 151, 175);
-    MXTr4(re, im, 104, 128, 152, 176);
-    MXTr4(re, im, 105, 129, 153, 177);
-    MXTr4(re, im, 106, 130, 154, 178);
-    MXTr4(re, im, 107, 131, 155, 179);
-    MXTr4(re, im, 108, 132, 156, 180);
-    MXTr4(re, im, 109, 133, 157, 181);
-    MXTr4(re, im, 110, 134, 158, 182);
-    MXTr4(re, im, 111, 135, 159, 183);
-    MXTr4(re, im, 112, 136, 160, 184);
-    MXTr4(re, im, 113, 137, 161, 185);
-    MXTr4(re, im, 114, 138, 162, 186);
-    MXTr4(re, im, 115, 139, 163, 187);
-    MXTr4(re, im, 116, 140, 164, 188);
-    MXTr4(re, im, 117, 141, 165, 189);
-    MXTr4(re, im, 118, 142, 166, 190);
-    MXTr4(re, im, 119, 143, 167, 191);
-    MXRot(re, im, 121, 0.9978589232386035, -0.06540312923014306);
-    MXRot(re, im, 122, 0.9914448613738104, -0.13052619222005157);
-    MXRot(re, im, 123, 0.9807852804032304, -0.19509032201612825);
-    MXRot(re, im, 124, 0.9659258262890683, -0.25881904510252074);
-    MXRot(re, im, 125, 0.9469301294951057, -0.32143946530316153);
-    MXRot(re, im, 126, 0.9238795325112867, -0.3826834323650898);
-    MXRot(re, im, 127, 0.8968727415326884, -0.44228869021900125);
-    MXRot(re, im, 128, 0.8660254037844387, -0.49999999999999994);
-    MXRot(re, im, 129, 0.8314696123025452, -0.5555702330196022);
-    MXRot(re, im, 130, 0.7933533402912353, -0.6087614290087205);
-    MXRot(re, im, 131, 0.7518398074789774, -0.6593458151000688);
-    MXRot(re, im, 132, 0.7071067811865476, -0.7071067811865475);
-    MXRot(re, im, 133, 0.659345815100069, -0.7518398074789773);
-    MXRot(re, im, 134, 0.6087614290087207, -0.7933533402912352);
-    MXRot(re, im, 135, 0.5555702330196024, -0.8314696123025451);
-    MXRot(re, im, 136, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 137, 0.44228869021900147, -0.8968727415326883);
-    MXRot(re, im, 138, 0.38268343236508984, -0.9238795325112867);
-    MXRot(re, im, 139, 0.3214394653031617, -0.9469301294951056);
-    MXRot(re, im, 140, 0.25881904510252096, -0.9659258262890682);
-    MXRot(re, im, 141, 0.19509032201612833, -0.9807852804032304);
-    MXRot(re, im, 142, 0.1305261922200517, -0.9914448613738104);
-    MXRot(re, im, 143, 0.06540312923014327, -0.9978589232386035);
-    MXRot(re, im, 145, 0.9914448613738104, -0.13052619222005157);
-    MXRot(re, im, 146, 0.9659258262890683, -0.25881904510252074);
-    MXRot(re, im, 147, 0.9238795325112867, -0.3826834323650898);
-    MXRot(re, im, 148, 0.8660254037844387, -0.49999999999999994);
-    MXRot(re, im, 149, 0.7933533402912353, -0.6087614290087205);
-    MXRot(re, im, 150, 0.7071067811865476, -0.7071067811865475);
-    MXRot(re, im, 151, 0.6087614290087207, -0.7933533402912352);
-    MXRot(re, im, 152, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 153, 0.38268343236508984, -0.9238795325112867);
-    MXRot(re, im, 154, 0.25881904510252096, -0.9659258262890682);
-    MXRot(re, im, 155, 0.1305261922200517, -0.9914448613738104);
-    MXRot(re, im, 156, 6.123233995736766e-17, -1.0);
-    MXRot(re, im, 157, -0.13052619222005138, -0.9914448613738105);
-    MXRot(re, im, 158, -0.25881904510252063, -0.9659258262890683);
-    MXRot(re, im, 159, -0.3826834323650895, -0.9238795325112868);
-    MXRot(re, im, 160, -0.4999999999999998, -0.8660254037844387);
-    MXRot(re, im, 161, -0.6087614290087203, -0.7933533402912354);
-    MXRot(re, im, 162, -0.7071067811865475, -0.7071067811865476);
-    MXRot(re, im, 163, -0.793353340291235, -0.6087614290087209);
-    MXRot(re, im, 164, -0.8660254037844385, -0.5000000000000003);
-    MXRot(re, im, 165, -0.9238795325112867, -0.3826834323650899);
-    MXRot(re, im, 166, -0.9659258262890682, -0.258819045102521);
-    MXRot(re, im, 167, -0.9914448613738104, -0.130526192220052);
-    MXRot(re, im, 169, 0.9807852804032304, -0.19509032201612825);
-    MXRot(re, im, 170, 0.9238795325112867, -0.3826834323650898);
-    MXRot(re, im, 171, 0.8314696123025452, -0.5555702330196022);
-    MXRot(re, im, 172, 0.7071067811865476, -0.7071067811865475);
-    MXRot(re, im, 173, 0.5555702330196024, -0.8314696123025451);
-    MXRot(re, im, 174, 0.38268343236508984, -0.9238795325112867);
-    MXRot(re, im, 175, 0.19509032201612833, -0.9807852804032304);
-    MXRot(re, im, 176, 6.123233995736766e-17, -1.0);
-    MXRot(re, im, 177, -0.19509032201612797, -0.9807852804032305);
-    MXRot(re, im, 178, -0.3826834323650895, -0.9238795325112868);
-    MXRot(re, im, 179, -0.555570233019602, -0.8314696123025455);
-    MXRot(re, im, 180, -0.7071067811865475, -0.7071067811865476);
-    MXRot(re, im, 181, -0.831469612302545, -0.5555702330196025);
-    MXRot(re, im, 182, -0.9238795325112867, -0.3826834323650899);
-    MXRot(re, im, 183, -0.9807852804032304, -0.1950903220161286);
-    MXRot(re, im, 184, -1.0, -1.2246467991473532e-16);
-    MXRot(re, im, 185, -0.9807852804032305, 0.19509032201612792);
-    MXRot(re, im, 186, -0.923879532511287, 0.3826834323650892);
-    MXRot(re, im, 187, -0.8314696123025455, 0.555570233019602);
-    MXRot(re, im, 188, -0.7071067811865479, 0.7071067811865471);
-    MXRot(re, im, 189, -0.555570233019603, 0.8314696123025448);
-    MXRot(re, im, 190, -0.38268343236509034, 0.9238795325112865);
-    MXRot(re, im, 191, -0.19509032201612866, 0.9807852804032303);
-    MXTr4(re, im, 96, 102, 108, 114);
-    MXTr4(re, im, 97, 103, 109, 115);
-    MXTr4(re, im, 98, 104, 110, 116);
-    MXTr4(re, im, 99, 105, 111, 117);
-    MXTr4(re, im, 100, 106, 112, 118);
-    MXTr4(re, im, 101, 107, 113, 119);
-    MXRot(re, im, 103, 0.9659258262890683, -0.25881904510252074);
-    MXRot(re, im, 104, 0.8660254037844387, -0.49999999999999994);
-    MXRot(re, im, 105, 0.7071067811865476, -0.7071067811865475);
-    MXRot(re, im, 106, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 107, 0.25881904510252096, -0.9659258262890682);
-    MXRot(re, im, 109, 0.8660254037844387, -0.49999999999999994);
-    MXRot(re, im, 110, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 111, 6.123233995736766e-17, -1.0);
-    MXRot(re, im, 112, -0.4999999999999998, -0.8660254037844387);
-    MXRot(re, im, 113, -0.8660254037844385, -0.5000000000000003);
-    MXRot(re, im, 115, 0.7071067811865476, -0.7071067811865475);
-    MXRot(re, im, 116, 6.123233995736766e-17, -1.0);
-    MXRot(re, im, 117, -0.7071067811865475, -0.7071067811865476);
-    MXRot(re, im, 118, -1.0, -1.2246467991473532e-16);
-    MXRot(re, im, 119, -0.7071067811865479, 0.7071067811865471);
-    MXTr3(re, im, 96, 98, 100);
-    MXTr3(re, im, 97, 99, 101);
-    MXRot(re, im, 99, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 101, -0.4999999999999998, -0.8660254037844387);
-    MXTr2(re, im, 96, 97);
-    MXTr2(re, im, 98, 99);
-    MXTr2(re, im, 100, 101);
-    MXTr3(re, im, 102, 104, 106);
-    MXTr3(re, im, 103, 105, 107);
-    MXRot(re, im, 105, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 107, -0.4999999999999998, -0.8660254037844387);
-    MXTr2(re, im, 102, 103);
-    MXTr2(re, im, 104, 105);
-    MXTr2(re, im, 106, 107);
-    MXTr3(re, im, 108, 110, 112);
-    MXTr3(re, im, 109, 111, 113);
-    MXRot(re, im, 111, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 113, -0.4999999999999998, -0.8660254037844387);
-    MXTr2(re, im, 108, 109);
-    MXTr2(re, im, 110, 111);
-    MXTr2(re, im, 112, 113);
-    MXTr3(re, im, 114, 116, 118);
-    MXTr3(re, im, 115, 117, 119);
-    MXRot(re, im, 117, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 119, -0.4999999999999998, -0.8660254037844387);
-    MXTr2(re, im, 114, 115);
-    MXTr2(re, im, 116, 117);
-    MXTr2(re, im, 118, 119);
-    MXTr4(re, im, 120, 126, 132, 138);
-    MXTr4(re, im, 121, 127, 133, 139);
-    MXTr4(re, im, 122, 128, 134, 140);
-    MXTr4(re, im, 123, 129, 135, 141);
-    MXTr4(re, im, 124, 130, 136, 142);
-    MXTr4(re, im, 125, 131, 137, 143);
-    MXRot(re, im, 127, 0.9659258262890683, -0.25881904510252074);
-    MXRot(re, im, 128, 0.8660254037844387, -0.49999999999999994);
-    MXRot(re, im, 129, 0.7071067811865476, -0.7071067811865475);
-    MXRot(re, im, 130, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 131, 0.25881904510252096, -0.9659258262890682);
-    MXRot(re, im, 133, 0.8660254037844387, -0.49999999999999994);
-    MXRot(re, im, 134, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 135, 6.123233995736766e-17, -1.0);
-    MXRot(re, im, 136, -0.4999999999999998, -0.8660254037844387);
-    MXRot(re, im, 137, -0.8660254037844385, -0.5000000000000003);
-    MXRot(re, im, 139, 0.7071067811865476, -0.7071067811865475);
-    MXRot(re, im, 140, 6.123233995736766e-17, -1.0);
-    MXRot(re, im, 141, -0.7071067811865475, -0.7071067811865476);
-    MXRot(re, im, 142, -1.0, -1.2246467991473532e-16);
-    MXRot(re, im, 143, -0.7071067811865479, 0.7071067811865471);
-    MXTr3(re, im, 120, 122, 124);
-    MXTr3(re, im, 121, 123, 125);
-    MXRot(re, im, 123, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 125, -0.4999999999999998, -0.8660254037844387);
-    MXTr2(re, im, 120, 121);
-    MXTr2(re, im, 122, 123);
-    MXTr2(re, im, 124, 125);
-    MXTr3(re, im, 126, 128, 130);
-    MXTr3(re, im, 127, 129, 131);
-    MXRot(re, im, 129, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 131, -0.4999999999999998, -0.8660254037844387);
-    MXTr2(re, im, 126, 127);
-    MXTr2(re, im, 128, 129);
-    MXTr2(re, im, 130, 131);
-    MXTr3(re, im, 132, 134, 136);
-    MXTr3(re, im, 133, 135, 137);
-    MXRot(re, im, 135, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 137, -0.4999999999999998, -0.8660254037844387);
-    MXTr2(re, im, 132, 133);
-    MXTr2(re, im, 134, 135);
-    MXTr2(re, im, 136, 137);
-    MXTr3(re, im, 138, 140, 142);
-    MXTr3(re, im, 139, 141, 143);
-    MXRot(re, im, 141, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 143, -0.4999999999999998, -0.8660254037844387);
-    MXTr2(re, im, 138, 139);
-    MXTr2(re, im, 140, 141);
-    MXTr2(re, im, 142, 143);
-    MXTr4(re, im, 144, 150, 156, 162);
-    MXTr4(re, im, 145, 151, 157, 163);
-    MXTr4(re, im, 146, 152, 158, 164);
-    MXTr4(re, im, 147, 153, 159, 165);
-    MXTr4(re, im, 148, 154, 160, 166);
-    MXTr4(re, im, 149, 155, 161, 167);
-    MXRot(re, im, 151, 0.9659258262890683, -0.25881904510252074);
-    MXRot(re, im, 152, 0.8660254037844387, -0.49999999999999994);
-    MXRot(re, im, 153, 0.7071067811865476, -0.7071067811865475);
-    MXRot(re, im, 154, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 155, 0.25881904510252096, -0.9659258262890682);
-    MXRot(re, im, 157, 0.8660254037844387, -0.49999999999999994);
-    MXRot(re, im, 158, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 159, 6.123233995736766e-17, -1.0);
-    MXRot(re, im, 160, -0.4999999999999998, -0.8660254037844387);
-    MXRot(re, im, 161, -0.8660254037844385, -0.5000000000000003);
-    MXRot(re, im, 163, 0.7071067811865476, -0.7071067811865475);
-    MXRot(re, im, 164, 6.123233995736766e-17, -1.0);
-    MXRot(re, im, 165, -0.7071067811865475, -0.7071067811865476);
-    MXRot(re, im, 166, -1.0, -1.2246467991473532e-16);
-    MXRot(re, im, 167, -0.7071067811865479, 0.7071067811865471);
-    MXTr3(re, im, 144, 146, 148);
-    MXTr3(re, im, 145, 147, 149);
-    MXRot(re, im, 147, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 149, -0.4999999999999998, -0.8660254037844387);
-    MXTr2(re, im, 144, 145);
-    MXTr2(re, im, 146, 147);
-    MXTr2(re, im, 148, 149);
-    MXTr3(re, im, 150, 152, 154);
-    MXTr3(re, im, 151, 153, 155);
-    MXRot(re, im, 153, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 155, -0.4999999999999998, -0.8660254037844387);
-    MXTr2(re, im, 150, 151);
-    MXTr2(re, im, 152, 153);
-    MXTr2(re, im, 154, 155);
-    MXTr3(re, im, 156, 158, 160);
-    MXTr3(re, im, 157, 159, 161);
-    MXRot(re, im, 159, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 161, -0.4999999999999998, -0.8660254037844387);
-    MXTr2(re, im, 156, 157);
-    MXTr2(re, im, 158, 159);
-    MXTr2(re, im, 160, 161);
-    MXTr3(re, im, 162, 164, 166);
-    MXTr3(re, im, 163, 165, 167);
-}
-
-/**
- *  Part 3 of ApplyMixedRadixFFT_480().
- * 
- *  @param {Number[]} re 
- *    - The real part of each point.
- *  @param {Number[]} im 
- *    - The imaginary part of each point.
- */
-function ApplyMixedRadixFFT_480_Part3(re, im) {
-    MXRot(re, im, 165, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 167, -0.4999999999999998, -0.8660254037844387);
-    MXTr2(re, im, 162, 163);
-    MXTr2(re, im, 164, 165);
-    MXTr2(re, im, 166, 167);
-    MXTr4(re, im, 168, 174, 180, 186);
-    MXTr4(re, im, 169, 175, 181, 187);
-    MXTr4(re, im, 170, 176, 182, 188);
-    MXTr4(re, im, 171, 177, 183, 189);
-    MXTr4(re, im, 172, 178, 184, 190);
-    MXTr4(re, im, 173, 179, 185, 191);
-    MXRot(re, im, 175, 0.9659258262890683, -0.25881904510252074);
-    MXRot(re, im, 176, 0.8660254037844387, -0.49999999999999994);
-    MXRot(re, im, 177, 0.7071067811865476, -0.7071067811865475);
-    MXRot(re, im, 178, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 179, 0.25881904510252096, -0.9659258262890682);
-    MXRot(re, im, 181, 0.8660254037844387, -0.49999999999999994);
-    MXRot(re, im, 182, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 183, 6.123233995736766e-17, -1.0);
-    MXRot(re, im, 184, -0.4999999999999998, -0.8660254037844387);
-    MXRot(re, im, 185, -0.8660254037844385, -0.5000000000000003);
-    MXRot(re, im, 187, 0.7071067811865476, -0.7071067811865475);
-    MXRot(re, im, 188, 6.123233995736766e-17, -1.0);
-    MXRot(re, im, 189, -0.7071067811865475, -0.7071067811865476);
-    MXRot(re, im, 190, -1.0, -1.2246467991473532e-16);
-    MXRot(re, im, 191, -0.7071067811865479, 0.7071067811865471);
-    MXTr3(re, im, 168, 170, 172);
-    MXTr3(re, im, 169, 171, 173);
-    MXRot(re, im, 171, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 173, -0.4999999999999998, -0.8660254037844387);
-    MXTr2(re, im, 168, 169);
-    MXTr2(re, im, 170, 171);
-    MXTr2(re, im, 172, 173);
-    MXTr3(re, im, 174, 176, 178);
-    MXTr3(re, im, 175, 177, 179);
-    MXRot(re, im, 177, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 179, -0.4999999999999998, -0.8660254037844387);
-    MXTr2(re, im, 174, 175);
-    MXTr2(re, im, 176, 177);
-    MXTr2(re, im, 178, 179);
-    MXTr3(re, im, 180, 182, 184);
-    MXTr3(re, im, 181, 183, 185);
-    MXRot(re, im, 183, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 185, -0.4999999999999998, -0.8660254037844387);
-    MXTr2(re, im, 180, 181);
-    MXTr2(re, im, 182, 183);
-    MXTr2(re, im, 184, 185);
-    MXTr3(re, im, 186, 188, 190);
-    MXTr3(re, im, 187, 189, 191);
-    MXRot(re, im, 189, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 191, -0.4999999999999998, -0.8660254037844387);
-    MXTr2(re, im, 186, 187);
-    MXTr2(re, im, 188, 189);
-    MXTr2(re, im, 190, 191);
-    MXTr4(re, im, 192, 216, 240, 264);
-    MXTr4(re, im, 193, 217, 241, 265);
-    MXTr4(re, im, 194, 218, 242, 266);
-    MXTr4(re, im, 195, 219, 243, 267);
-    MXTr4(re, im, 196, 220, 244, 268);
-    MXTr4(re, im, 197, 221, 245, 269);
-    MXTr4(re, im, 198, 222, 246, 270);
-    MXTr4(re, im, 199, 223, 247, 271);
-    MXTr4(re, im, 200, 224, 248, 272);
-    MXTr4(re, im, 201, 225, 249, 273);
-    MXTr4(re, im, 202, 226, 250, 274);
-    MXTr4(re, im, 203, 227, 251, 275);
-    MXTr4(re, im, 204, 228, 252, 276);
-    MXTr4(re, im, 205, 229, 253, 277);
-    MXTr4(re, im, 206, 230, 254, 278);
-    MXTr4(re, im, 207, 231, 255, 279);
-    MXTr4(re, im, 208, 232, 256, 280);
-    MXTr4(re, im, 209, 233, 257, 281);
-    MXTr4(re, im, 210, 234, 258, 282);
-    MXTr4(re, im, 211, 235, 259, 283);
-    MXTr4(re, im, 212, 236, 260, 284);
-    MXTr4(re, im, 213, 237, 261, 285);
-    MXTr4(re, im, 214, 238, 262, 286);
-    MXTr4(re, im, 215, 239, 263, 287);
-    MXRot(re, im, 217, 0.9978589232386035, -0.06540312923014306);
-    MXRot(re, im, 218, 0.9914448613738104, -0.13052619222005157);
-    MXRot(re, im, 219, 0.9807852804032304, -0.19509032201612825);
-    MXRot(re, im, 220, 0.9659258262890683, -0.25881904510252074);
-    MXRot(re, im, 221, 0.9469301294951057, -0.32143946530316153);
-    MXRot(re, im, 222, 0.9238795325112867, -0.3826834323650898);
-    MXRot(re, im, 223, 0.8968727415326884, -0.44228869021900125);
-    MXRot(re, im, 224, 0.8660254037844387, -0.49999999999999994);
-    MXRot(re, im, 225, 0.8314696123025452, -0.5555702330196022);
-    MXRot(re, im, 226, 0.7933533402912353, -0.6087614290087205);
-    MXRot(re, im, 227, 0.7518398074789774, -0.6593458151000688);
-    MXRot(re, im, 228, 0.7071067811865476, -0.7071067811865475);
-    MXRot(re, im, 229, 0.659345815100069, -0.7518398074789773);
-    MXRot(re, im, 230, 0.6087614290087207, -0.7933533402912352);
-    MXRot(re, im, 231, 0.5555702330196024, -0.8314696123025451);
-    MXRot(re, im, 232, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 233, 0.44228869021900147, -0.8968727415326883);
-    MXRot(re, im, 234, 0.38268343236508984, -0.9238795325112867);
-    MXRot(re, im, 235, 0.3214394653031617, -0.9469301294951056);
-    MXRot(re, im, 236, 0.25881904510252096, -0.9659258262890682);
-    MXRot(re, im, 237, 0.19509032201612833, -0.9807852804032304);
-    MXRot(re, im, 238, 0.1305261922200517, -0.9914448613738104);
-    MXRot(re, im, 239, 0.06540312923014327, -0.9978589232386035);
-    MXRot(re, im, 241, 0.9914448613738104, -0.13052619222005157);
-    MXRot(re, im, 242, 0.9659258262890683, -0.25881904510252074);
-    MXRot(re, im, 243, 0.9238795325112867, -0.3826834323650898);
-    MXRot(re, im, 244, 0.8660254037844387, -0.49999999999999994);
-    MXRot(re, im, 245, 0.7933533402912353, -0.6087614290087205);
-    MXRot(re, im, 246, 0.7071067811865476, -0.7071067811865475);
-    MXRot(re, im, 247, 0.6087614290087207, -0.7933533402912352);
-    MXRot(re, im, 248, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 249, 0.38268343236508984, -0.9238795325112867);
-    MXRot(re, im, 250, 0.25881904510252096, -0.9659258262890682);
-    MXRot(re, im, 251, 0.1305261922200517, -0.9914448613738104);
-    MXRot(re, im, 252, 6.123233995736766e-17, -1.0);
-    MXRot(re, im, 253, -0.13052619222005138, -0.9914448613738105);
-    MXRot(re, im, 254, -0.25881904510252063, -0.9659258262890683);
-    MXRot(re, im, 255, -0.3826834323650895, -0.9238795325112868);
-    MXRot(re, im, 256, -0.4999999999999998, -0.8660254037844387);
-    MXRot(re, im, 257, -0.6087614290087203, -0.7933533402912354);
-    MXRot(re, im, 258, -0.7071067811865475, -0.7071067811865476);
-    MXRot(re, im, 259, -0.793353340291235, -0.6087614290087209);
-    MXRot(re, im, 260, -0.8660254037844385, -0.5000000000000003);
-    MXRot(re, im, 261, -0.9238795325112867, -0.3826834323650899);
-    MXRot(re, im, 262, -0.9659258262890682, -0.258819045102521);
-    MXRot(re, im, 263, -0.9914448613738104, -0.130526192220052);
-    MXRot(re, im, 265, 0.9807852804032304, -0.19509032201612825);
-    MXRot(re, im, 266, 0.9238795325112867, -0.3826834323650898);
-    MXRot(re, im, 267, 0.8314696123025452, -0.5555702330196022);
-    MXRot(re, im, 268, 0.7071067811865476, -0.7071067811865475);
-    MXRot(re, im, 269, 0.5555702330196024, -0.8314696123025451);
-    MXRot(re, im, 270, 0.38268343236508984, -0.9238795325112867);
-    MXRot(re, im, 271, 0.19509032201612833, -0.9807852804032304);
-    MXRot(re, im, 272, 6.123233995736766e-17, -1.0);
-    MXRot(re, im, 273, -0.19509032201612797, -0.9807852804032305);
-    MXRot(re, im, 274, -0.3826834323650895, -0.9238795325112868);
-    MXRot(re, im, 275, -0.555570233019602, -0.8314696123025455);
-    MXRot(re, im, 276, -0.7071067811865475, -0.7071067811865476);
-    MXRot(re, im, 277, -0.831469612302545, -0.5555702330196025);
-    MXRot(re, im, 278, -0.9238795325112867, -0.3826834323650899);
-    MXRot(re, im, 279, -0.9807852804032304, -0.1950903220161286);
-    MXRot(re, im, 280, -1.0, -1.2246467991473532e-16);
-    MXRot(re, im, 281, -0.9807852804032305, 0.19509032201612792);
-    MXRot(re, im, 282, -0.923879532511287, 0.3826834323650892);
-    MXRot(re, im, 283, -0.8314696123025455, 0.555570233019602);
-    MXRot(re, im, 284, -0.7071067811865479, 0.7071067811865471);
-    MXRot(re, im, 285, -0.555570233019603, 0.8314696123025448);
-    MXRot(re, im, 286, -0.38268343236509034, 0.9238795325112865);
-    MXRot(re, im, 287, -0.19509032201612866, 0.9807852804032303);
-    MXTr4(re, im, 192, 198, 204, 210);
-    MXTr4(re, im, 193, 199, 205, 211);
-    MXTr4(re, im, 194, 200, 206, 212);
-    MXTr4(re, im, 195, 201, 207, 213);
-    MXTr4(re, im, 196, 202, 208, 214);
-    MXTr4(re, im, 197, 203, 209, 215);
-    MXRot(re, im, 199, 0.9659258262890683, -0.25881904510252074);
-    MXRot(re, im, 200, 0.8660254037844387, -0.49999999999999994);
-    MXRot(re, im, 201, 0.7071067811865476, -0.7071067811865475);
-    MXRot(re, im, 202, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 203, 0.25881904510252096, -0.9659258262890682);
-    MXRot(re, im, 205, 0.8660254037844387, -0.49999999999999994);
-    MXRot(re, im, 206, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 207, 6.123233995736766e-17, -1.0);
-    MXRot(re, im, 208, -0.4999999999999998, -0.8660254037844387);
-    MXRot(re, im, 209, -0.8660254037844385, -0.5000000000000003);
-    MXRot(re, im, 211, 0.7071067811865476, -0.7071067811865475);
-    MXRot(re, im, 212, 6.123233995736766e-17, -1.0);
-    MXRot(re, im, 213, -0.7071067811865475, -0.7071067811865476);
-    MXRot(re, im, 214, -1.0, -1.2246467991473532e-16);
-    MXRot(re, im, 215, -0.7071067811865479, 0.7071067811865471);
-    MXTr3(re, im, 192, 194, 196);
-    MXTr3(re, im, 193, 195, 197);
-    MXRot(re, im, 195, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 197, -0.4999999999999998, -0.8660254037844387);
-    MXTr2(re, im, 192, 193);
-    MXTr2(re, im, 194, 195);
-    MXTr2(re, im, 196, 197);
-    MXTr3(re, im, 198, 200, 202);
-    MXTr3(re, im, 199, 201, 203);
-    MXRot(re, im, 201, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 203, -0.4999999999999998, -0.8660254037844387);
-    MXTr2(re, im, 198, 199);
-    MXTr2(re, im, 200, 201);
-    MXTr2(re, im, 202, 203);
-    MXTr3(re, im, 204, 206, 208);
-    MXTr3(re, im, 205, 207, 209);
-    MXRot(re, im, 207, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 209, -0.4999999999999998, -0.8660254037844387);
-    MXTr2(re, im, 204, 205);
-    MXTr2(re, im, 206, 207);
-    MXTr2(re, im, 208, 209);
-    MXTr3(re, im, 210, 212, 214);
-    MXTr3(re, im, 211, 213, 215);
-    MXRot(re, im, 213, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 215, -0.4999999999999998, -0.8660254037844387);
-    MXTr2(re, im, 210, 211);
-    MXTr2(re, im, 212, 213);
-    MXTr2(re, im, 214, 215);
-    MXTr4(re, im, 216, 222, 228, 234);
-    MXTr4(re, im, 217, 223, 229, 235);
-    MXTr4(re, im, 218, 224, 230, 236);
-    MXTr4(re, im, 219, 225, 231, 237);
-    MXTr4(re, im, 220, 226, 232, 238);
-    MXTr4(re, im, 221, 227, 233, 239);
-    MXRot(re, im, 223, 0.9659258262890683, -0.25881904510252074);
-    MXRot(re, im, 224, 0.8660254037844387, -0.49999999999999994);
-    MXRot(re, im, 225, 0.7071067811865476, -0.7071067811865475);
-    MXRot(re, im, 226, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 227, 0.25881904510252096, -0.9659258262890682);
-    MXRot(re, im, 229, 0.8660254037844387, -0.49999999999999994);
-    MXRot(re, im, 230, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 231, 6.123233995736766e-17, -1.0);
-    MXRot(re, im, 232, -0.4999999999999998, -0.8660254037844387);
-    MXRot(re, im, 233, -0.8660254037844385, -0.5000000000000003);
-    MXRot(re, im, 235, 0.7071067811865476, -0.7071067811865475);
-    MXRot(re, im, 236, 6.123233995736766e-17, -1.0);
-    MXRot(re, im, 237, -0.7071067811865475, -0.7071067811865476);
-    MXRot(re, im, 238, -1.0, -1.2246467991473532e-16);
-    MXRot(re, im, 239, -0.7071067811865479, 0.7071067811865471);
-    MXTr3(re, im, 216, 218, 220);
-    MXTr3(re, im, 217, 219, 221);
-    MXRot(re, im, 219, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 221, -0.4999999999999998, -0.8660254037844387);
-    MXTr2(re, im, 216, 217);
-    MXTr2(re, im, 218, 219);
-    MXTr2(re, im, 220, 221);
-    MXTr3(re, im, 222, 224, 226);
-    MXTr3(re, im, 223, 225, 227);
-    MXRot(re, im, 225, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 227, -0.4999999999999998, -0.8660254037844387);
-    MXTr2(re, im, 222, 223);
-    MXTr2(re, im, 224, 225);
-    MXTr2(re, im, 226, 227);
-    MXTr3(re, im, 228, 230, 232);
-    MXTr3(re, im, 229, 231, 233);
-    MXRot(re, im, 231, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 233, -0.4999999999999998, -0.8660254037844387);
-    MXTr2(re, im, 228, 229);
-    MXTr2(re, im, 230, 231);
-    MXTr2(re, im, 232, 233);
-    MXTr3(re, im, 234, 236, 238);
-    MXTr3(re, im, 235, 237, 239);
-    MXRot(re, im, 237, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 239, -0.4999999999999998, -0.8660254037844387);
-    MXTr2(re, im, 234, 235);
-    MXTr2(re, im, 236, 237);
-    MXTr2(re, im, 238, 239);
-    MXTr4(re, im, 240, 246, 252, 258);
-    MXTr4(re, im, 241, 247, 253, 259);
-    MXTr4(re, im, 242, 248, 254, 260);
-    MXTr4(re, im, 243, 249, 255, 261);
-    MXTr4(re, im, 244, 250, 256, 262);
-    MXTr4(re, im, 245, 251, 257, 263);
-    MXRot(re, im, 247, 0.9659258262890683, -0.25881904510252074);
-    MXRot(re, im, 248, 0.8660254037844387, -0.49999999999999994);
-    MXRot(re, im, 249, 0.7071067811865476, -0.7071067811865475);
-    MXRot(re, im, 250, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 251, 0.25881904510252096, -0.9659258262890682);
-    MXRot(re, im, 253, 0.8660254037844387, -0.49999999999999994);
-    MXRot(re, im, 254, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 255, 6.123233995736766e-17, -1.0);
-    MXRot(re, im, 256, -0.4999999999999998, -0.8660254037844387);
-    MXRot(re, im, 257, -0.8660254037844385, -0.5000000000000003);
-    MXRot(re, im, 259, 0.7071067811865476, -0.7071067811865475);
-    MXRot(re, im, 260, 6.123233995736766e-17, -1.0);
-    MXRot(re, im, 261, -0.7071067811865475, -0.7071067811865476);
-    MXRot(re, im, 262, -1.0, -1.2246467991473532e-16);
-    MXRot(re, im, 263, -0.7071067811865479, 0.7071067811865471);
-    MXTr3(re, im, 240, 242, 244);
-    MXTr3(re, im, 241, 243, 245);
-    MXRot(re, im, 243, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 245, -0.4999999999999998, -0.8660254037844387);
-    MXTr2(re, im, 240, 241);
-    MXTr2(re, im, 242, 243);
-    MXTr2(re, im, 244, 245);
-    MXTr3(re, im, 246, 248, 250);
-    MXTr3(re, im, 247, 249, 251);
-    MXRot(re, im, 249, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 251, -0.4999999999999998, -0.8660254037844387);
-    MXTr2(re, im, 246, 247);
-    MXTr2(re, im, 248, 249);
-    MXTr2(re, im, 250, 251);
-    MXTr3(re, im, 252, 254, 256);
-    MXTr3(re, im, 253, 255, 257);
-    MXRot(re, im, 255, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 257, -0.4999999999999998, -0.8660254037844387);
-    MXTr2(re, im, 252, 253);
-    MXTr2(re, im, 254, 255);
-    MXTr2(re, im, 256, 257);
-    MXTr3(re, im, 258, 260, 262);
-    MXTr3(re, im, 259, 261, 263);
-    MXRot(re, im, 261, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 263, -0.4999999999999998, -0.8660254037844387);
-    MXTr2(re, im, 258, 259);
-    MXTr2(re, im, 260, 261);
-    MXTr2(re, im, 262, 263);
-    MXTr4(re, im, 264, 270, 276, 282);
-    MXTr4(re, im, 265, 271, 277, 283);
-    MXTr4(re, im, 266, 272, 278, 284);
-    MXTr4(re, im, 267, 273, 279, 285);
-    MXTr4(re, im, 268, 274, 280, 286);
-    MXTr4(re, im, 269, 275, 281, 287);
-    MXRot(re, im, 271, 0.9659258262890683, -0.25881904510252074);
-    MXRot(re, im, 272, 0.8660254037844387, -0.49999999999999994);
-    MXRot(re, im, 273, 0.7071067811865476, -0.7071067811865475);
-    MXRot(re, im, 274, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 275, 0.25881904510252096, -0.9659258262890682);
-    MXRot(re, im, 277, 0.8660254037844387, -0.49999999999999994);
-    MXRot(re, im, 278, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 279, 6.123233995736766e-17, -1.0);
-    MXRot(re, im, 280, -0.4999999999999998, -0.8660254037844387);
-    MXRot(re, im, 281, -0.8660254037844385, -0.5000000000000003);
-    MXRot(re, im, 283, 0.7071067811865476, -0.7071067811865475);
-    MXRot(re, im, 284, 6.123233995736766e-17, -1.0);
-    MXRot(re, im, 285, -0.7071067811865475, -0.7071067811865476);
-    MXRot(re, im, 286, -1.0, -1.2246467991473532e-16);
-    MXRot(re, im, 287, -0.7071067811865479, 0.7071067811865471);
-    MXTr3(re, im, 264, 266, 268);
-    MXTr3(re, im, 265, 267, 269);
-    MXRot(re, im, 267, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 269, -0.4999999999999998, -0.8660254037844387);
-    MXTr2(re, im, 264, 265);
-    MXTr2(re, im, 266, 267);
-    MXTr2(re, im, 268, 269);
-    MXTr3(re, im, 270, 272, 274);
-    MXTr3(re, im, 271, 273, 275);
-    MXRot(re, im, 273, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 275, -0.4999999999999998, -0.8660254037844387);
-    MXTr2(re, im, 270, 271);
-    MXTr2(re, im, 272, 273);
-    MXTr2(re, im, 274, 275);
-    MXTr3(re, im, 276, 278, 280);
-    MXTr3(re, im, 277, 279, 281);
-    MXRot(re, im, 279, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 281, -0.4999999999999998, -0.8660254037844387);
-    MXTr2(re, im, 276, 277);
-    MXTr2(re, im, 278, 279);
-    MXTr2(re, im, 280, 281);
-    MXTr3(re, im, 282, 284, 286);
-    MXTr3(re, im, 283, 285, 287);
-    MXRot(re, im, 285, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 287, -0.4999999999999998, -0.8660254037844387);
-    MXTr2(re, im, 282, 283);
-    MXTr2(re, im, 284, 285);
-    MXTr2(re, im, 286, 287);
-    MXTr4(re, im, 288, 312, 336, 360);
-    MXTr4(re, im, 289, 313, 337, 361);
-    MXTr4(re, im, 290, 314, 338, 362);
-    MXTr4(re, im, 291, 315, 339, 363);
-    MXTr4(re, im, 292, 316, 340, 364);
-    MXTr4(re, im, 293, 317, 341, 365);
-    MXTr4(re, im, 294, 318, 342, 366);
-    MXTr4(re, im, 295, 319, 343, 367);
-    MXTr4(re, im, 296, 320, 344, 368);
-    MXTr4(re, im, 297, 321, 345, 369);
-    MXTr4(re, im, 298, 322, 346, 370);
-    MXTr4(re, im, 299, 323, 347, 371);
-    MXTr4(re, im, 300, 324, 348, 372);
-    MXTr4(re, im, 301, 325, 349, 373);
-    MXTr4(re, im, 302, 326, 350, 374);
-    MXTr4(re, im, 303, 327, 351, 375);
-    MXTr4(re, im, 304, 328, 352, 376);
-    MXTr4(re, im, 305, 329, 353, 377);
-    MXTr4(re, im, 306, 330, 354, 378);
-    MXTr4(re, im, 307, 331, 355, 379);
-    MXTr4(re, im, 308, 332, 356, 380);
-    MXTr4(re, im, 309, 333, 357, 381);
-    MXTr4(re, im, 310, 334, 358, 382);
-    MXTr4(re, im, 311, 335, 359, 383);
-    MXRot(re, im, 313, 0.9978589232386035, -0.06540312923014306);
-    MXRot(re, im, 314, 0.9914448613738104, -0.13052619222005157);
-    MXRot(re, im, 315, 0.9807852804032304, -0.19509032201612825);
-    MXRot(re, im, 316, 0.9659258262890683, -0.25881904510252074);
-    MXRot(re, im, 317, 0.9469301294951057, -0.32143946530316153);
-    MXRot(re, im, 318, 0.9238795325112867, -0.3826834323650898);
-    MXRot(re, im, 319, 0.8968727415326884, -0.44228869021900125);
-    MXRot(re, im, 320, 0.8660254037844387, -0.49999999999999994);
-    MXRot(re, im, 321, 0.8314696123025452, -0.5555702330196022);
-    MXRot(re, im, 322, 0.7933533402912353, -0.6087614290087205);
-    MXRot(re, im, 323, 0.7518398074789774, -0.6593458151000688);
-    MXRot(re, im, 324, 0.7071067811865476, -0.7071067811865475);
-    MXRot(re, im, 325, 0.659345815100069, -0.7518398074789773);
-    MXRot(re, im, 326, 0.6087614290087207, -0.7933533402912352);
-    MXRot(re, im, 327, 0.5555702330196024, -0.8314696123025451);
-    MXRot(re, im, 328, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 329, 0.44228869021900147, -0.8968727415326883);
-    MXRot(re, im, 330, 0.38268343236508984, -0.9238795325112867);
-    MXRot(re, im, 331, 0.3214394653031617, -0.9469301294951056);
-    MXRot(re, im, 332, 0.25881904510252096, -0.9659258262890682);
-    MXRot(re, im, 333, 0.19509032201612833, -0.9807852804032304);
-    MXRot(re, im, 334, 0.1305261922200517, -0.9914448613738104);
-    MXRot(re, im, 335, 0.06540312923014327, -0.9978589232386035);
-    MXRot(re, im, 337, 0.9914448613738104, -0.13052619222005157);
-    MXRot(re, im, 338, 0.9659258262890683, -0.25881904510252074);
-    MXRot(re, im, 339, 0.9238795325112867, -0.3826834323650898);
-    MXRot(re, im, 340, 0.8660254037844387, -0.49999999999999994);
-    MXRot(re, im, 341, 0.7933533402912353, -0.6087614290087205);
-    MXRot(re, im, 342, 0.7071067811865476, -0.7071067811865475);
-    MXRot(re, im, 343, 0.6087614290087207, -0.7933533402912352);
-    MXRot(re, im, 344, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 345, 0.38268343236508984, -0.9238795325112867);
-    MXRot(re, im, 346, 0.25881904510252096, -0.9659258262890682);
-    MXRot(re, im, 347, 0.1305261922200517, -0.9914448613738104);
-    MXRot(re, im, 348, 6.123233995736766e-17, -1.0);
-    MXRot(re, im, 349, -0.13052619222005138, -0.9914448613738105);
-    MXRot(re, im, 350, -0.25881904510252063, -0.9659258262890683);
-    MXRot(re, im, 351, -0.3826834323650895, -0.9238795325112868);
-    MXRot(re, im, 352, -0.4999999999999998, -0.8660254037844387);
-    MXRot(re, im, 353, -0.6087614290087203, -0.7933533402912354);
-    MXRot(re, im, 354, -0.7071067811865475, -0.7071067811865476);
-    MXRot(re, im, 355, -0.793353340291235, -0.6087614290087209);
-    MXRot(re, im, 356, -0.8660254037844385, -0.5000000000000003);
-    MXRot(re, im, 357, -0.9238795325112867, -0.3826834323650899);
-    MXRot(re, im, 358, -0.9659258262890682, -0.258819045102521);
-    MXRot(re, im, 359, -0.9914448613738104, -0.130526192220052);
-    MXRot(re, im, 361, 0.9807852804032304, -0.19509032201612825);
-    MXRot(re, im, 362, 0.9238795325112867, -0.3826834323650898);
-    MXRot(re, im, 363, 0.8314696123025452, -0.5555702330196022);
-    MXRot(re, im, 364, 0.7071067811865476, -0.7071067811865475);
-    MXRot(re, im, 365, 0.5555702330196024, -0.8314696123025451);
-    MXRot(re, im, 366, 0.38268343236508984, -0.9238795325112867);
-    MXRot(re, im, 367, 0.19509032201612833, -0.9807852804032304);
-    MXRot(re, im, 368, 6.123233995736766e-17, -1.0);
-    MXRot(re, im, 369, -0.19509032201612797, -0.9807852804032305);
-    MXRot(re, im, 370, -0.3826834323650895, -0.9238795325112868);
-    MXRot(re, im, 371, -0.555570233019602, -0.8314696123025455);
-    MXRot(re, im, 372, -0.7071067811865475, -0.7071067811865476);
-    MXRot(re, im, 373, -0.831469612302545, -0.5555702330196025);
-    MXRot(re, im, 374, -0.9238795325112867, -0.3826834323650899);
-    MXRot(re, im, 375, -0.9807852804032304, -0.1950903220161286);
-    MXRot(re, im, 376, -1.0, -1.2246467991473532e-16);
-    MXRot(re, im, 377, -0.9807852804032305, 0.19509032201612792);
-    MXRot(re, im, 378, -0.923879532511287, 0.3826834323650892);
-    MXRot(re, im, 379, -0.8314696123025455, 0.555570233019602);
-    MXRot(re, im, 380, -0.7071067811865479, 0.7071067811865471);
-    MXRot(re, im, 381, -0.555570233019603, 0.8314696123025448);
-    MXRot(re, im, 382, -0.38268343236509034, 0.9238795325112865);
-    MXRot(re, im, 383, -0.19509032201612866, 0.9807852804032303);
-    MXTr4(re, im, 288, 294, 300, 306);
-    MXTr4(re, im, 289, 295, 301, 307);
-    MXTr4(re, im, 290, 296, 302, 308);
-    MXTr4(re, im, 291, 297, 303, 309);
-    MXTr4(re, im, 292, 298, 304, 310);
-    MXTr4(re, im, 293, 299, 305, 311);
-    MXRot(re, im, 295, 0.9659258262890683, -0.25881904510252074);
-    MXRot(re, im, 296, 0.8660254037844387, -0.49999999999999994);
-    MXRot(re, im, 297, 0.7071067811865476, -0.7071067811865475);
-    MXRot(re, im, 298, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 299, 0.25881904510252096, -0.9659258262890682);
-    MXRot(re, im, 301, 0.8660254037844387, -0.49999999999999994);
-    MXRot(re, im, 302, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 303, 6.123233995736766e-17, -1.0);
-    MXRot(re, im, 304, -0.4999999999999998, -0.8660254037844387);
-    MXRot(re, im, 305, -0.8660254037844385, -0.5000000000000003);
-    MXRot(re, im, 307, 0.7071067811865476, -0.7071067811865475);
-    MXRot(re, im, 308, 6.123233995736766e-17, -1.0);
-    MXRot(re, im, 309, -0.7071067811865475, -0.7071067811865476);
-    MXRot(re, im, 310, -1.0, -1.2246467991473532e-16);
-    MXRot(re, im, 311, -0.7071067811865479, 0.7071067811865471);
-    MXTr3(re, im, 288, 290, 292);
-    MXTr3(re, im, 289, 291, 293);
-    MXRot(re, im, 291, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 293, -0.4999999999999998, -0.8660254037844387);
-    MXTr2(re, im, 288, 289);
-    MXTr2(re, im, 290, 291);
-    MXTr2(re, im, 292, 293);
-    MXTr3(re, im, 294, 296, 298);
-    MXTr3(re, im, 295, 297, 299);
-    MXRot(re, im, 297, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 299, -0.4999999999999998, -0.8660254037844387);
-    MXTr2(re, im, 294, 295);
-    MXTr2(re, im, 296, 297);
-    MXTr2(re, im, 298, 299);
-    MXTr3(re, im, 300, 302, 304);
-    MXTr3(re, im, 301, 303, 305);
-    MXRot(re, im, 303, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 305, -0.4999999999999998, -0.8660254037844387);
-    MXTr2(re, im, 300, 301);
-    MXTr2(re, im, 302, 303);
-    MXTr2(re, im, 304, 305);
-    MXTr3(re, im, 306, 308, 310);
-    MXTr3(re, im, 307, 309, 311);
-    MXRot(re, im, 309, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 311, -0.4999999999999998, -0.8660254037844387);
-    MXTr2(re, im, 306, 307);
-    MXTr2(re, im, 308, 309);
-    MXTr2(re, im, 310, 311);
-    MXTr4(re, im, 312, 318, 324, 330);
-    MXTr4(re, im, 313, 319, 325, 331);
-    MXTr4(re, im, 314, 320, 326, 332);
-    MXTr4(re, im, 315, 321, 327, 333);
-    MXTr4(re, im, 316, 322, 328, 334);
-    MXTr4(re, im, 317, 323, 329, 335);
-    MXRot(re, im, 319, 0.9659258262890683, -0.25881904510252074);
-    MXRot(re, im, 320, 0.8660254037844387, -0.49999999999999994);
-    MXRot(re, im, 321, 0.7071067811865476, -0.7071067811865475);
-    MXRot(re, im, 322, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 323, 0.25881904510252096, -0.9659258262890682);
-    MXRot(re, im, 325, 0.8660254037844387, -0.49999999999999994);
-    MXRot(re, im, 326, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 327, 6.123233995736766e-17, -1.0);
-    MXRot(re, im, 328, -0.4999999999999998, -0.8660254037844387);
-}
-
-/**
- *  Part 4 of ApplyMixedRadixFFT_480().
- * 
- *  @param {Number[]} re 
- *    - The real part of each point.
- *  @param {Number[]} im 
- *    - The imaginary part of each point.
- */
-function ApplyMixedRadixFFT_480_Part4(re, im) {
-    MXRot(re, im, 329, -0.8660254037844385, -0.5000000000000003);
-    MXRot(re, im, 331, 0.7071067811865476, -0.7071067811865475);
-    MXRot(re, im, 332, 6.123233995736766e-17, -1.0);
-    MXRot(re, im, 333, -0.7071067811865475, -0.7071067811865476);
-    MXRot(re, im, 334, -1.0, -1.2246467991473532e-16);
-    MXRot(re, im, 335, -0.7071067811865479, 0.7071067811865471);
-    MXTr3(re, im, 312, 314, 316);
-    MXTr3(re, im, 313, 315, 317);
-    MXRot(re, im, 315, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 317, -0.4999999999999998, -0.8660254037844387);
-    MXTr2(re, im, 312, 313);
-    MXTr2(re, im, 314, 315);
-    MXTr2(re, im, 316, 317);
-    MXTr3(re, im, 318, 320, 322);
-    MXTr3(re, im, 319, 321, 323);
-    MXRot(re, im, 321, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 323, -0.4999999999999998, -0.8660254037844387);
-    MXTr2(re, im, 318, 319);
-    MXTr2(re, im, 320, 321);
-    MXTr2(re, im, 322, 323);
-    MXTr3(re, im, 324, 326, 328);
-    MXTr3(re, im, 325, 327, 329);
-    MXRot(re, im, 327, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 329, -0.4999999999999998, -0.8660254037844387);
-    MXTr2(re, im, 324, 325);
-    MXTr2(re, im, 326, 327);
-    MXTr2(re, im, 328, 329);
-    MXTr3(re, im, 330, 332, 334);
-    MXTr3(re, im, 331, 333, 335);
-    MXRot(re, im, 333, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 335, -0.4999999999999998, -0.8660254037844387);
-    MXTr2(re, im, 330, 331);
-    MXTr2(re, im, 332, 333);
-    MXTr2(re, im, 334, 335);
-    MXTr4(re, im, 336, 342, 348, 354);
-    MXTr4(re, im, 337, 343, 349, 355);
-    MXTr4(re, im, 338, 344, 350, 356);
-    MXTr4(re, im, 339, 345, 351, 357);
-    MXTr4(re, im, 340, 346, 352, 358);
-    MXTr4(re, im, 341, 347, 353, 359);
-    MXRot(re, im, 343, 0.9659258262890683, -0.25881904510252074);
-    MXRot(re, im, 344, 0.8660254037844387, -0.49999999999999994);
-    MXRot(re, im, 345, 0.7071067811865476, -0.7071067811865475);
-    MXRot(re, im, 346, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 347, 0.25881904510252096, -0.9659258262890682);
-    MXRot(re, im, 349, 0.8660254037844387, -0.49999999999999994);
-    MXRot(re, im, 350, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 351, 6.123233995736766e-17, -1.0);
-    MXRot(re, im, 352, -0.4999999999999998, -0.8660254037844387);
-    MXRot(re, im, 353, -0.8660254037844385, -0.5000000000000003);
-    MXRot(re, im, 355, 0.7071067811865476, -0.7071067811865475);
-    MXRot(re, im, 356, 6.123233995736766e-17, -1.0);
-    MXRot(re, im, 357, -0.7071067811865475, -0.7071067811865476);
-    MXRot(re, im, 358, -1.0, -1.2246467991473532e-16);
-    MXRot(re, im, 359, -0.7071067811865479, 0.7071067811865471);
-    MXTr3(re, im, 336, 338, 340);
-    MXTr3(re, im, 337, 339, 341);
-    MXRot(re, im, 339, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 341, -0.4999999999999998, -0.8660254037844387);
-    MXTr2(re, im, 336, 337);
-    MXTr2(re, im, 338, 339);
-    MXTr2(re, im, 340, 341);
-    MXTr3(re, im, 342, 344, 346);
-    MXTr3(re, im, 343, 345, 347);
-    MXRot(re, im, 345, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 347, -0.4999999999999998, -0.8660254037844387);
-    MXTr2(re, im, 342, 343);
-    MXTr2(re, im, 344, 345);
-    MXTr2(re, im, 346, 347);
-    MXTr3(re, im, 348, 350, 352);
-    MXTr3(re, im, 349, 351, 353);
-    MXRot(re, im, 351, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 353, -0.4999999999999998, -0.8660254037844387);
-    MXTr2(re, im, 348, 349);
-    MXTr2(re, im, 350, 351);
-    MXTr2(re, im, 352, 353);
-    MXTr3(re, im, 354, 356, 358);
-    MXTr3(re, im, 355, 357, 359);
-    MXRot(re, im, 357, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 359, -0.4999999999999998, -0.8660254037844387);
-    MXTr2(re, im, 354, 355);
-    MXTr2(re, im, 356, 357);
-    MXTr2(re, im, 358, 359);
-    MXTr4(re, im, 360, 366, 372, 378);
-    MXTr4(re, im, 361, 367, 373, 379);
-    MXTr4(re, im, 362, 368, 374, 380);
-    MXTr4(re, im, 363, 369, 375, 381);
-    MXTr4(re, im, 364, 370, 376, 382);
-    MXTr4(re, im, 365, 371, 377, 383);
-    MXRot(re, im, 367, 0.9659258262890683, -0.25881904510252074);
-    MXRot(re, im, 368, 0.8660254037844387, -0.49999999999999994);
-    MXRot(re, im, 369, 0.7071067811865476, -0.7071067811865475);
-    MXRot(re, im, 370, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 371, 0.25881904510252096, -0.9659258262890682);
-    MXRot(re, im, 373, 0.8660254037844387, -0.49999999999999994);
-    MXRot(re, im, 374, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 375, 6.123233995736766e-17, -1.0);
-    MXRot(re, im, 376, -0.4999999999999998, -0.8660254037844387);
-    MXRot(re, im, 377, -0.8660254037844385, -0.5000000000000003);
-    MXRot(re, im, 379, 0.7071067811865476, -0.7071067811865475);
-    MXRot(re, im, 380, 6.123233995736766e-17, -1.0);
-    MXRot(re, im, 381, -0.7071067811865475, -0.7071067811865476);
-    MXRot(re, im, 382, -1.0, -1.2246467991473532e-16);
-    MXRot(re, im, 383, -0.7071067811865479, 0.7071067811865471);
-    MXTr3(re, im, 360, 362, 364);
-    MXTr3(re, im, 361, 363, 365);
-    MXRot(re, im, 363, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 365, -0.4999999999999998, -0.8660254037844387);
-    MXTr2(re, im, 360, 361);
-    MXTr2(re, im, 362, 363);
-    MXTr2(re, im, 364, 365);
-    MXTr3(re, im, 366, 368, 370);
-    MXTr3(re, im, 367, 369, 371);
-    MXRot(re, im, 369, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 371, -0.4999999999999998, -0.8660254037844387);
-    MXTr2(re, im, 366, 367);
-    MXTr2(re, im, 368, 369);
-    MXTr2(re, im, 370, 371);
-    MXTr3(re, im, 372, 374, 376);
-    MXTr3(re, im, 373, 375, 377);
-    MXRot(re, im, 375, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 377, -0.4999999999999998, -0.8660254037844387);
-    MXTr2(re, im, 372, 373);
-    MXTr2(re, im, 374, 375);
-    MXTr2(re, im, 376, 377);
-    MXTr3(re, im, 378, 380, 382);
-    MXTr3(re, im, 379, 381, 383);
-    MXRot(re, im, 381, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 383, -0.4999999999999998, -0.8660254037844387);
-    MXTr2(re, im, 378, 379);
-    MXTr2(re, im, 380, 381);
-    MXTr2(re, im, 382, 383);
-    MXTr4(re, im, 384, 408, 432, 456);
-    MXTr4(re, im, 385, 409, 433, 457);
-    MXTr4(re, im, 386, 410, 434, 458);
-    MXTr4(re, im, 387, 411, 435, 459);
-    MXTr4(re, im, 388, 412, 436, 460);
-    MXTr4(re, im, 389, 413, 437, 461);
-    MXTr4(re, im, 390, 414, 438, 462);
-    MXTr4(re, im, 391, 415, 439, 463);
-    MXTr4(re, im, 392, 416, 440, 464);
-    MXTr4(re, im, 393, 417, 441, 465);
-    MXTr4(re, im, 394, 418, 442, 466);
-    MXTr4(re, im, 395, 419, 443, 467);
-    MXTr4(re, im, 396, 420, 444, 468);
-    MXTr4(re, im, 397, 421, 445, 469);
-    MXTr4(re, im, 398, 422, 446, 470);
-    MXTr4(re, im, 399, 423, 447, 471);
-    MXTr4(re, im, 400, 424, 448, 472);
-    MXTr4(re, im, 401, 425, 449, 473);
-    MXTr4(re, im, 402, 426, 450, 474);
-    MXTr4(re, im, 403, 427, 451, 475);
-    MXTr4(re, im, 404, 428, 452, 476);
-    MXTr4(re, im, 405, 429, 453, 477);
-    MXTr4(re, im, 406, 430, 454, 478);
-    MXTr4(re, im, 407, 431, 455, 479);
-    MXRot(re, im, 409, 0.9978589232386035, -0.06540312923014306);
-    MXRot(re, im, 410, 0.9914448613738104, -0.13052619222005157);
-    MXRot(re, im, 411, 0.9807852804032304, -0.19509032201612825);
-    MXRot(re, im, 412, 0.9659258262890683, -0.25881904510252074);
-    MXRot(re, im, 413, 0.9469301294951057, -0.32143946530316153);
-    MXRot(re, im, 414, 0.9238795325112867, -0.3826834323650898);
-    MXRot(re, im, 415, 0.8968727415326884, -0.44228869021900125);
-    MXRot(re, im, 416, 0.8660254037844387, -0.49999999999999994);
-    MXRot(re, im, 417, 0.8314696123025452, -0.5555702330196022);
-    MXRot(re, im, 418, 0.7933533402912353, -0.6087614290087205);
-    MXRot(re, im, 419, 0.7518398074789774, -0.6593458151000688);
-    MXRot(re, im, 420, 0.7071067811865476, -0.7071067811865475);
-    MXRot(re, im, 421, 0.659345815100069, -0.7518398074789773);
-    MXRot(re, im, 422, 0.6087614290087207, -0.7933533402912352);
-    MXRot(re, im, 423, 0.5555702330196024, -0.8314696123025451);
-    MXRot(re, im, 424, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 425, 0.44228869021900147, -0.8968727415326883);
-    MXRot(re, im, 426, 0.38268343236508984, -0.9238795325112867);
-    MXRot(re, im, 427, 0.3214394653031617, -0.9469301294951056);
-    MXRot(re, im, 428, 0.25881904510252096, -0.9659258262890682);
-    MXRot(re, im, 429, 0.19509032201612833, -0.9807852804032304);
-    MXRot(re, im, 430, 0.1305261922200517, -0.9914448613738104);
-    MXRot(re, im, 431, 0.06540312923014327, -0.9978589232386035);
-    MXRot(re, im, 433, 0.9914448613738104, -0.13052619222005157);
-    MXRot(re, im, 434, 0.9659258262890683, -0.25881904510252074);
-    MXRot(re, im, 435, 0.9238795325112867, -0.3826834323650898);
-    MXRot(re, im, 436, 0.8660254037844387, -0.49999999999999994);
-    MXRot(re, im, 437, 0.7933533402912353, -0.6087614290087205);
-    MXRot(re, im, 438, 0.7071067811865476, -0.7071067811865475);
-    MXRot(re, im, 439, 0.6087614290087207, -0.7933533402912352);
-    MXRot(re, im, 440, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 441, 0.38268343236508984, -0.9238795325112867);
-    MXRot(re, im, 442, 0.25881904510252096, -0.9659258262890682);
-    MXRot(re, im, 443, 0.1305261922200517, -0.9914448613738104);
-    MXRot(re, im, 444, 6.123233995736766e-17, -1.0);
-    MXRot(re, im, 445, -0.13052619222005138, -0.9914448613738105);
-    MXRot(re, im, 446, -0.25881904510252063, -0.9659258262890683);
-    MXRot(re, im, 447, -0.3826834323650895, -0.9238795325112868);
-    MXRot(re, im, 448, -0.4999999999999998, -0.8660254037844387);
-    MXRot(re, im, 449, -0.6087614290087203, -0.7933533402912354);
-    MXRot(re, im, 450, -0.7071067811865475, -0.7071067811865476);
-    MXRot(re, im, 451, -0.793353340291235, -0.6087614290087209);
-    MXRot(re, im, 452, -0.8660254037844385, -0.5000000000000003);
-    MXRot(re, im, 453, -0.9238795325112867, -0.3826834323650899);
-    MXRot(re, im, 454, -0.9659258262890682, -0.258819045102521);
-    MXRot(re, im, 455, -0.9914448613738104, -0.130526192220052);
-    MXRot(re, im, 457, 0.9807852804032304, -0.19509032201612825);
-    MXRot(re, im, 458, 0.9238795325112867, -0.3826834323650898);
-    MXRot(re, im, 459, 0.8314696123025452, -0.5555702330196022);
-    MXRot(re, im, 460, 0.7071067811865476, -0.7071067811865475);
-    MXRot(re, im, 461, 0.5555702330196024, -0.8314696123025451);
-    MXRot(re, im, 462, 0.38268343236508984, -0.9238795325112867);
-    MXRot(re, im, 463, 0.19509032201612833, -0.9807852804032304);
-    MXRot(re, im, 464, 6.123233995736766e-17, -1.0);
-    MXRot(re, im, 465, -0.19509032201612797, -0.9807852804032305);
-    MXRot(re, im, 466, -0.3826834323650895, -0.9238795325112868);
-    MXRot(re, im, 467, -0.555570233019602, -0.8314696123025455);
-    MXRot(re, im, 468, -0.7071067811865475, -0.7071067811865476);
-    MXRot(re, im, 469, -0.831469612302545, -0.5555702330196025);
-    MXRot(re, im, 470, -0.9238795325112867, -0.3826834323650899);
-    MXRot(re, im, 471, -0.9807852804032304, -0.1950903220161286);
-    MXRot(re, im, 472, -1.0, -1.2246467991473532e-16);
-    MXRot(re, im, 473, -0.9807852804032305, 0.19509032201612792);
-    MXRot(re, im, 474, -0.923879532511287, 0.3826834323650892);
-    MXRot(re, im, 475, -0.8314696123025455, 0.555570233019602);
-    MXRot(re, im, 476, -0.7071067811865479, 0.7071067811865471);
-    MXRot(re, im, 477, -0.555570233019603, 0.8314696123025448);
-    MXRot(re, im, 478, -0.38268343236509034, 0.9238795325112865);
-    MXRot(re, im, 479, -0.19509032201612866, 0.9807852804032303);
-    MXTr4(re, im, 384, 390, 396, 402);
-    MXTr4(re, im, 385, 391, 397, 403);
-    MXTr4(re, im, 386, 392, 398, 404);
-    MXTr4(re, im, 387, 393, 399, 405);
-    MXTr4(re, im, 388, 394, 400, 406);
-    MXTr4(re, im, 389, 395, 401, 407);
-    MXRot(re, im, 391, 0.9659258262890683, -0.25881904510252074);
-    MXRot(re, im, 392, 0.8660254037844387, -0.49999999999999994);
-    MXRot(re, im, 393, 0.7071067811865476, -0.7071067811865475);
-    MXRot(re, im, 394, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 395, 0.25881904510252096, -0.9659258262890682);
-    MXRot(re, im, 397, 0.8660254037844387, -0.49999999999999994);
-    MXRot(re, im, 398, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 399, 6.123233995736766e-17, -1.0);
-    MXRot(re, im, 400, -0.4999999999999998, -0.8660254037844387);
-    MXRot(re, im, 401, -0.8660254037844385, -0.5000000000000003);
-    MXRot(re, im, 403, 0.7071067811865476, -0.7071067811865475);
-    MXRot(re, im, 404, 6.123233995736766e-17, -1.0);
-    MXRot(re, im, 405, -0.7071067811865475, -0.7071067811865476);
-    MXRot(re, im, 406, -1.0, -1.2246467991473532e-16);
-    MXRot(re, im, 407, -0.7071067811865479, 0.7071067811865471);
-    MXTr3(re, im, 384, 386, 388);
-    MXTr3(re, im, 385, 387, 389);
-    MXRot(re, im, 387, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 389, -0.4999999999999998, -0.8660254037844387);
-    MXTr2(re, im, 384, 385);
-    MXTr2(re, im, 386, 387);
-    MXTr2(re, im, 388, 389);
-    MXTr3(re, im, 390, 392, 394);
-    MXTr3(re, im, 391, 393, 395);
-    MXRot(re, im, 393, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 395, -0.4999999999999998, -0.8660254037844387);
-    MXTr2(re, im, 390, 391);
-    MXTr2(re, im, 392, 393);
-    MXTr2(re, im, 394, 395);
-    MXTr3(re, im, 396, 398, 400);
-    MXTr3(re, im, 397, 399, 401);
-    MXRot(re, im, 399, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 401, -0.4999999999999998, -0.8660254037844387);
-    MXTr2(re, im, 396, 397);
-    MXTr2(re, im, 398, 399);
-    MXTr2(re, im, 400, 401);
-    MXTr3(re, im, 402, 404, 406);
-    MXTr3(re, im, 403, 405, 407);
-    MXRot(re, im, 405, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 407, -0.4999999999999998, -0.8660254037844387);
-    MXTr2(re, im, 402, 403);
-    MXTr2(re, im, 404, 405);
-    MXTr2(re, im, 406, 407);
-    MXTr4(re, im, 408, 414, 420, 426);
-    MXTr4(re, im, 409, 415, 421, 427);
-    MXTr4(re, im, 410, 416, 422, 428);
-    MXTr4(re, im, 411, 417, 423, 429);
-    MXTr4(re, im, 412, 418, 424, 430);
-    MXTr4(re, im, 413, 419, 425, 431);
-    MXRot(re, im, 415, 0.9659258262890683, -0.25881904510252074);
-    MXRot(re, im, 416, 0.8660254037844387, -0.49999999999999994);
-    MXRot(re, im, 417, 0.7071067811865476, -0.7071067811865475);
-    MXRot(re, im, 418, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 419, 0.25881904510252096, -0.9659258262890682);
-    MXRot(re, im, 421, 0.8660254037844387, -0.49999999999999994);
-    MXRot(re, im, 422, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 423, 6.123233995736766e-17, -1.0);
-    MXRot(re, im, 424, -0.4999999999999998, -0.8660254037844387);
-    MXRot(re, im, 425, -0.8660254037844385, -0.5000000000000003);
-    MXRot(re, im, 427, 0.7071067811865476, -0.7071067811865475);
-    MXRot(re, im, 428, 6.123233995736766e-17, -1.0);
-    MXRot(re, im, 429, -0.7071067811865475, -0.7071067811865476);
-    MXRot(re, im, 430, -1.0, -1.2246467991473532e-16);
-    MXRot(re, im, 431, -0.7071067811865479, 0.7071067811865471);
-    MXTr3(re, im, 408, 410, 412);
-    MXTr3(re, im, 409, 411, 413);
-    MXRot(re, im, 411, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 413, -0.4999999999999998, -0.8660254037844387);
-    MXTr2(re, im, 408, 409);
-    MXTr2(re, im, 410, 411);
-    MXTr2(re, im, 412, 413);
-    MXTr3(re, im, 414, 416, 418);
-    MXTr3(re, im, 415, 417, 419);
-    MXRot(re, im, 417, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 419, -0.4999999999999998, -0.8660254037844387);
-    MXTr2(re, im, 414, 415);
-    MXTr2(re, im, 416, 417);
-    MXTr2(re, im, 418, 419);
-    MXTr3(re, im, 420, 422, 424);
-    MXTr3(re, im, 421, 423, 425);
-    MXRot(re, im, 423, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 425, -0.4999999999999998, -0.8660254037844387);
-    MXTr2(re, im, 420, 421);
-    MXTr2(re, im, 422, 423);
-    MXTr2(re, im, 424, 425);
-    MXTr3(re, im, 426, 428, 430);
-    MXTr3(re, im, 427, 429, 431);
-    MXRot(re, im, 429, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 431, -0.4999999999999998, -0.8660254037844387);
-    MXTr2(re, im, 426, 427);
-    MXTr2(re, im, 428, 429);
-    MXTr2(re, im, 430, 431);
-    MXTr4(re, im, 432, 438, 444, 450);
-    MXTr4(re, im, 433, 439, 445, 451);
-    MXTr4(re, im, 434, 440, 446, 452);
-    MXTr4(re, im, 435, 441, 447, 453);
-    MXTr4(re, im, 436, 442, 448, 454);
-    MXTr4(re, im, 437, 443, 449, 455);
-    MXRot(re, im, 439, 0.9659258262890683, -0.25881904510252074);
-    MXRot(re, im, 440, 0.8660254037844387, -0.49999999999999994);
-    MXRot(re, im, 441, 0.7071067811865476, -0.7071067811865475);
-    MXRot(re, im, 442, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 443, 0.25881904510252096, -0.9659258262890682);
-    MXRot(re, im, 445, 0.8660254037844387, -0.49999999999999994);
-    MXRot(re, im, 446, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 447, 6.123233995736766e-17, -1.0);
-    MXRot(re, im, 448, -0.4999999999999998, -0.8660254037844387);
-    MXRot(re, im, 449, -0.8660254037844385, -0.5000000000000003);
-    MXRot(re, im, 451, 0.7071067811865476, -0.7071067811865475);
-    MXRot(re, im, 452, 6.123233995736766e-17, -1.0);
-    MXRot(re, im, 453, -0.7071067811865475, -0.7071067811865476);
-    MXRot(re, im, 454, -1.0, -1.2246467991473532e-16);
-    MXRot(re, im, 455, -0.7071067811865479, 0.7071067811865471);
-    MXTr3(re, im, 432, 434, 436);
-    MXTr3(re, im, 433, 435, 437);
-    MXRot(re, im, 435, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 437, -0.4999999999999998, -0.8660254037844387);
-    MXTr2(re, im, 432, 433);
-    MXTr2(re, im, 434, 435);
-    MXTr2(re, im, 436, 437);
-    MXTr3(re, im, 438, 440, 442);
-    MXTr3(re, im, 439, 441, 443);
-    MXRot(re, im, 441, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 443, -0.4999999999999998, -0.8660254037844387);
-    MXTr2(re, im, 438, 439);
-    MXTr2(re, im, 440, 441);
-    MXTr2(re, im, 442, 443);
-    MXTr3(re, im, 444, 446, 448);
-    MXTr3(re, im, 445, 447, 449);
-    MXRot(re, im, 447, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 449, -0.4999999999999998, -0.8660254037844387);
-    MXTr2(re, im, 444, 445);
-    MXTr2(re, im, 446, 447);
-    MXTr2(re, im, 448, 449);
-    MXTr3(re, im, 450, 452, 454);
-    MXTr3(re, im, 451, 453, 455);
-    MXRot(re, im, 453, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 455, -0.4999999999999998, -0.8660254037844387);
-    MXTr2(re, im, 450, 451);
-    MXTr2(re, im, 452, 453);
-    MXTr2(re, im, 454, 455);
-    MXTr4(re, im, 456, 462, 468, 474);
-    MXTr4(re, im, 457, 463, 469, 475);
-    MXTr4(re, im, 458, 464, 470, 476);
-    MXTr4(re, im, 459, 465, 471, 477);
-    MXTr4(re, im, 460, 466, 472, 478);
-    MXTr4(re, im, 461, 467, 473, 479);
-    MXRot(re, im, 463, 0.9659258262890683, -0.25881904510252074);
-    MXRot(re, im, 464, 0.8660254037844387, -0.49999999999999994);
-    MXRot(re, im, 465, 0.7071067811865476, -0.7071067811865475);
-    MXRot(re, im, 466, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 467, 0.25881904510252096, -0.9659258262890682);
-    MXRot(re, im, 469, 0.8660254037844387, -0.49999999999999994);
-    MXRot(re, im, 470, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 471, 6.123233995736766e-17, -1.0);
-    MXRot(re, im, 472, -0.4999999999999998, -0.8660254037844387);
-    MXRot(re, im, 473, -0.8660254037844385, -0.5000000000000003);
-    MXRot(re, im, 475, 0.7071067811865476, -0.7071067811865475);
-    MXRot(re, im, 476, 6.123233995736766e-17, -1.0);
-    MXRot(re, im, 477, -0.7071067811865475, -0.7071067811865476);
-    MXRot(re, im, 478, -1.0, -1.2246467991473532e-16);
-    MXRot(re, im, 479, -0.7071067811865479, 0.7071067811865471);
-    MXTr3(re, im, 456, 458, 460);
-    MXTr3(re, im, 457, 459, 461);
-    MXRot(re, im, 459, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 461, -0.4999999999999998, -0.8660254037844387);
-    MXTr2(re, im, 456, 457);
-    MXTr2(re, im, 458, 459);
-    MXTr2(re, im, 460, 461);
-    MXTr3(re, im, 462, 464, 466);
-    MXTr3(re, im, 463, 465, 467);
-    MXRot(re, im, 465, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 467, -0.4999999999999998, -0.8660254037844387);
-    MXTr2(re, im, 462, 463);
-    MXTr2(re, im, 464, 465);
-    MXTr2(re, im, 466, 467);
-    MXTr3(re, im, 468, 470, 472);
-    MXTr3(re, im, 469, 471, 473);
-    MXRot(re, im, 471, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 473, -0.4999999999999998, -0.8660254037844387);
-    MXTr2(re, im, 468, 469);
-    MXTr2(re, im, 470, 471);
-    MXTr2(re, im, 472, 473);
-    MXTr3(re, im, 474, 476, 478);
-    MXTr3(re, im, 475, 477, 479);
-    MXRot(re, im, 477, 0.5000000000000001, -0.8660254037844386);
-    MXRot(re, im, 479, -0.4999999999999998, -0.8660254037844387);
-    MXTr2(re, im, 474, 475);
-    MXTr2(re, im, 476, 477);
-    MXTr2(re, im, 478, 479);
-    MXCshft(re, im, CSHFT_INDEXES_0);
-    MXCshft(re, im, CSHFT_INDEXES_1);
-    MXCshft(re, im, CSHFT_INDEXES_2);
-    MXCshft(re, im, CSHFT_INDEXES_3);
-    MXCshft(re, im, CSHFT_INDEXES_4);
-    MXCshft(re, im, CSHFT_INDEXES_5);
-    MXCshft(re, im, CSHFT_INDEXES_6);
-    MXCshft(re, im, CSHFT_INDEXES_7);
-}
+//  Tables (and scratch buffers) of the compact kernel (see MXCompact() of
+//  the "fft-mx-baseop" module).
+const COMPACT_RADICES = new Int32Array([
+    4, 4, 2, 3, 5
+]);
+const COMPACT_INDEXES = new Int32Array([
+    0, 120, 240, 360, 30, 150, 270, 390, 60, 180, 300, 420, 90, 210, 330,
+    450, 15, 135, 255, 375, 45, 165, 285, 405, 75, 195, 315, 435, 105, 225,
+    345, 465, 5, 125, 245, 365, 35, 155, 275, 395, 65, 185, 305, 425, 95,
+    215, 335, 455, 20, 140, 260, 380, 50, 170, 290, 410, 80, 200, 320, 440,
+    110, 230, 350, 470, 10, 130, 250, 370, 40, 160, 280, 400, 70, 190, 310,
+    430, 100, 220, 340, 460, 25, 145, 265, 385, 55, 175, 295, 415, 85, 205,
+    325, 445, 115, 235, 355, 475, 1, 121, 241, 361, 31, 151, 271, 391, 61,
+    181, 301, 421, 91, 211, 331, 451, 16, 136, 256, 376, 46, 166, 286, 406,
+    76, 196, 316, 436, 106, 226, 346, 466, 6, 126, 246, 366, 36, 156, 276,
+    396, 66, 186, 306, 426, 96, 216, 336, 456, 21, 141, 261, 381, 51, 171,
+    291, 411, 81, 201, 321, 441, 111, 231, 351, 471, 11, 131, 251, 371, 41,
+    161, 281, 401, 71, 191, 311, 431, 101, 221, 341, 461, 26, 146, 266, 386,
+    56, 176, 296, 416, 86, 206, 326, 446, 116, 236, 356, 476, 2, 122, 242,
+    362, 32, 152, 272, 392, 62, 182, 302, 422, 92, 212, 332, 452, 17, 137,
+    257, 377, 47, 167, 287, 407, 77, 197, 317, 437, 107, 227, 347, 467, 7,
+    127, 247, 367, 37, 157, 277, 397, 67, 187, 307, 427, 97, 217, 337, 457,
+    22, 142, 262, 382, 52, 172, 292, 412, 82, 202, 322, 442, 112, 232, 352,
+    472, 12, 132, 252, 372, 42, 162, 282, 402, 72, 192, 312, 432, 102, 222,
+    342, 462, 27, 147, 267, 387, 57, 177, 297, 417, 87, 207, 327, 447, 117,
+    237, 357, 477, 3, 123, 243, 363, 33, 153, 273, 393, 63, 183, 303, 423,
+    93, 213, 333, 453, 18, 138, 258, 378, 48, 168, 288, 408, 78, 198, 318,
+    438, 108, 228, 348, 468, 8, 128, 248, 368, 38, 158, 278, 398, 68, 188,
+    308, 428, 98, 218, 338, 458, 23, 143, 263, 383, 53, 173, 293, 413, 83,
+    203, 323, 443, 113, 233, 353, 473, 13, 133, 253, 373, 43, 163, 283, 403,
+    73, 193, 313, 433, 103, 223, 343, 463, 28, 148, 268, 388, 58, 178, 298,
+    418, 88, 208, 328, 448, 118, 238, 358, 478, 4, 124, 244, 364, 34, 154,
+    274, 394, 64, 184, 304, 424, 94, 214, 334, 454, 19, 139, 259, 379, 49,
+    169, 289, 409, 79, 199, 319, 439, 109, 229, 349, 469, 9, 129, 249, 369,
+    39, 159, 279, 399, 69, 189, 309, 429, 99, 219, 339, 459, 24, 144, 264,
+    384, 54, 174, 294, 414, 84, 204, 324, 444, 114, 234, 354, 474, 14, 134,
+    254, 374, 44, 164, 284, 404, 74, 194, 314, 434, 104, 224, 344, 464, 29,
+    149, 269, 389, 59, 179, 299, 419, 89, 209, 329, 449, 119, 239, 359, 479
+]);
+const COMPACT_TWIDDLES = new Float64Array([
+    1.0, 0.0, 1.0, 0.0, 1.0, 0.0, 1.0, 0.0, 1.0, 0.0, 1.0, 0.0,
+    0.9238795325112867, -0.3826834323650898, 0.7071067811865476,
+    -0.7071067811865475, 0.3826834323650898, -0.9238795325112867,
+    0.7071067811865476, -0.7071067811865475, -0.0, -1.0,
+    -0.7071067811865476, -0.7071067811865475, 0.3826834323650898,
+    -0.9238795325112867, -0.7071067811865476, -0.7071067811865475,
+    -0.9238795325112867, 0.3826834323650898, 1.0, 0.0, 0.9807852804032304,
+    -0.19509032201612825, 0.9238795325112867, -0.3826834323650898,
+    0.8314696123025452, -0.5555702330196022, 0.7071067811865476,
+    -0.7071067811865475, 0.5555702330196022, -0.8314696123025452,
+    0.3826834323650898, -0.9238795325112867, 0.19509032201612825,
+    -0.9807852804032304, -0.0, -1.0, -0.19509032201612825,
+    -0.9807852804032304, -0.3826834323650898, -0.9238795325112867,
+    -0.5555702330196022, -0.8314696123025452, -0.7071067811865476,
+    -0.7071067811865475, -0.8314696123025452, -0.5555702330196022,
+    -0.9238795325112867, -0.3826834323650898, -0.9807852804032304,
+    -0.19509032201612825, 1.0, 0.0, 1.0, 0.0, 0.9978589232386035,
+    -0.06540312923014306, 0.9914448613738104, -0.13052619222005157,
+    0.9914448613738104, -0.13052619222005157, 0.9659258262890683,
+    -0.25881904510252074, 0.9807852804032304, -0.19509032201612825,
+    0.9238795325112867, -0.3826834323650898, 0.9659258262890683,
+    -0.25881904510252074, 0.8660254037844387, -0.49999999999999994,
+    0.9469301294951057, -0.3214394653031616, 0.7933533402912352,
+    -0.6087614290087207, 0.9238795325112867, -0.3826834323650898,
+    0.7071067811865476, -0.7071067811865475, 0.8968727415326883,
+    -0.4422886902190013, 0.6087614290087207, -0.7933533402912352,
+    0.8660254037844387, -0.49999999999999994, 0.49999999999999994,
+    -0.8660254037844387, 0.8314696123025452, -0.5555702330196022,
+    0.3826834323650898, -0.9238795325112867, 0.7933533402912352,
+    -0.6087614290087207, 0.25881904510252074, -0.9659258262890683,
+    0.7518398074789774, -0.6593458151000688, 0.13052619222005157,
+    -0.9914448613738104, 0.7071067811865476, -0.7071067811865475, -0.0,
+    -1.0, 0.6593458151000688, -0.7518398074789774, -0.13052619222005157,
+    -0.9914448613738104, 0.6087614290087207, -0.7933533402912352,
+    -0.25881904510252074, -0.9659258262890683, 0.5555702330196022,
+    -0.8314696123025452, -0.3826834323650898, -0.9238795325112867,
+    0.49999999999999994, -0.8660254037844387, -0.49999999999999994,
+    -0.8660254037844387, 0.4422886902190013, -0.8968727415326883,
+    -0.6087614290087207, -0.7933533402912352, 0.3826834323650898,
+    -0.9238795325112867, -0.7071067811865476, -0.7071067811865475,
+    0.3214394653031616, -0.9469301294951057, -0.7933533402912352,
+    -0.6087614290087207, 0.25881904510252074, -0.9659258262890683,
+    -0.8660254037844387, -0.49999999999999994, 0.19509032201612825,
+    -0.9807852804032304, -0.9238795325112867, -0.3826834323650898,
+    0.13052619222005157, -0.9914448613738104, -0.9659258262890683,
+    -0.25881904510252074, 0.06540312923014306, -0.9978589232386035,
+    -0.9914448613738104, -0.13052619222005157, -0.0, -1.0, -1.0, -0.0,
+    -0.06540312923014306, -0.9978589232386035, -0.9914448613738104,
+    0.13052619222005157, -0.13052619222005157, -0.9914448613738104,
+    -0.9659258262890683, 0.25881904510252074, -0.19509032201612825,
+    -0.9807852804032304, -0.9238795325112867, 0.3826834323650898,
+    -0.25881904510252074, -0.9659258262890683, -0.8660254037844387,
+    0.49999999999999994, -0.3214394653031616, -0.9469301294951057,
+    -0.7933533402912352, 0.6087614290087207, -0.3826834323650898,
+    -0.9238795325112867, -0.7071067811865476, 0.7071067811865475,
+    -0.4422886902190013, -0.8968727415326883, -0.6087614290087207,
+    0.7933533402912352, 1.0, 0.0, 1.0, 0.0, 1.0, 0.0, 1.0, 0.0,
+    0.999914327574007, -0.01308959557134444, 0.9996573249755573,
+    -0.02617694830787315, 0.9992290362407229, -0.03925981575906861,
+    0.9986295347545738, -0.05233595624294383, 0.9996573249755573,
+    -0.02617694830787315, 0.9986295347545738, -0.05233595624294383,
+    0.996917333733128, -0.07845909572784494, 0.9945218953682733,
+    -0.10452846326765346, 0.9992290362407229, -0.03925981575906861,
+    0.996917333733128, -0.07845909572784494, 0.9930684569549263,
+    -0.11753739745783764, 0.9876883405951378, -0.15643446504023087,
+    0.9986295347545738, -0.05233595624294383, 0.9945218953682733,
+    -0.10452846326765346, 0.9876883405951378, -0.15643446504023087,
+    0.9781476007338057, -0.20791169081775931, 0.9978589232386035,
+    -0.06540312923014306, 0.9914448613738104, -0.13052619222005157,
+    0.9807852804032304, -0.19509032201612825, 0.9659258262890683,
+    -0.25881904510252074, 0.996917333733128, -0.07845909572784494,
+    0.9876883405951378, -0.15643446504023087, 0.9723699203976766,
+    -0.2334453638559054, 0.9510565162951535, -0.3090169943749474,
+    0.9958049275746618, -0.09150161866340238, 0.9832549075639546,
+    -0.18223552549214747, 0.9624552364536473, -0.27144044986507426,
+    0.9335804264972017, -0.35836794954530027, 0.9945218953682733,
+    -0.10452846326765346, 0.9781476007338057, -0.20791169081775931,
+    0.9510565162951535, -0.3090169943749474, 0.9135454576426009,
+    -0.40673664307580015, 0.9930684569549263, -0.11753739745783764,
+    0.9723699203976766, -0.2334453638559054, 0.9381913359224842,
+    -0.34611705707749296, 0.8910065241883679, -0.45399049973954675,
+    0.9914448613738104, -0.13052619222005157, 0.9659258262890683,
+    -0.25881904510252074, 0.9238795325112867, -0.3826834323650898,
+    0.8660254037844387, -0.49999999999999994, 0.9896513868196702,
+    -0.1434926219911793, 0.958819734868193, -0.2840153447039226,
+    0.9081431738250813, -0.41865973753742813, 0.838670567945424,
+    -0.544639035015027, 0.9876883405951378, -0.15643446504023087,
+    0.9510565162951535, -0.3090169943749474, 0.8910065241883679,
+    -0.45399049973954675, 0.8090169943749475, -0.5877852522924731,
+    0.9855560590580777, -0.1693495038490246, 0.9426414910921784,
+    -0.33380685923377096, 0.8724960070727972, -0.4886212414969549,
+    0.7771459614569709, -0.6293203910498375, 0.9832549075639546,
+    -0.18223552549214747, 0.9335804264972017, -0.35836794954530027,
+    0.8526401643540922, -0.5224985647159488, 0.7431448254773942,
+    -0.6691306063588582, 0.9807852804032304, -0.19509032201612825,
+    0.9238795325112867, -0.3826834323650898, 0.8314696123025452,
+    -0.5555702330196022, 0.7071067811865476, -0.7071067811865475,
+    0.9781476007338057, -0.20791169081775931, 0.9135454576426009,
+    -0.40673664307580015, 0.8090169943749475, -0.5877852522924731,
+    0.6691306063588582, -0.7431448254773942, 0.9753423205085127,
+    -0.22069743502150108, 0.9025852843498606, -0.4305110968082951,
+    0.785316930880745, -0.619093949309834, 0.6293203910498375,
+    -0.7771459614569709, 0.9723699203976766, -0.2334453638559054,
+    0.8910065241883679, -0.45399049973954675, 0.7604059656000309,
+    -0.6494480483301837, 0.5877852522924731, -0.8090169943749475,
+    0.9692309097067544, -0.24615329302899303, 0.8788171126619654,
+    -0.4771587602596084, 0.7343225094356856, -0.6788007455329417,
+    0.544639035015027, -0.838670567945424, 0.9659258262890683,
+    -0.25881904510252074, 0.8660254037844387, -0.49999999999999994,
+    0.7071067811865476, -0.7071067811865475, 0.49999999999999994,
+    -0.8660254037844387, 0.9624552364536473, -0.27144044986507426,
+    0.8526401643540922, -0.5224985647159488, 0.6788007455329417,
+    -0.7343225094356856, 0.45399049973954675, -0.8910065241883679,
+    0.958819734868193, -0.2840153447039226, 0.838670567945424,
+    -0.544639035015027, 0.6494480483301837, -0.7604059656000309,
+    0.40673664307580015, -0.9135454576426009, 0.9550199444571866,
+    -0.296541574975571, 0.8241261886220156, -0.5664062369248328,
+    0.619093949309834, -0.785316930880745, 0.35836794954530027,
+    -0.9335804264972017, 0.9510565162951535, -0.3090169943749474,
+    0.8090169943749475, -0.5877852522924731, 0.5877852522924731,
+    -0.8090169943749475, 0.3090169943749474, -0.9510565162951535,
+    0.9469301294951057, -0.3214394653031616, 0.7933533402912352,
+    -0.6087614290087207, 0.5555702330196022, -0.8314696123025452,
+    0.25881904510252074, -0.9659258262890683, 0.9426414910921784,
+    -0.33380685923377096, 0.7771459614569709, -0.6293203910498375,
+    0.5224985647159488, -0.8526401643540922, 0.20791169081775931,
+    -0.9781476007338057, 0.9381913359224842, -0.34611705707749296,
+    0.7604059656000309, -0.6494480483301837, 0.4886212414969549,
+    -0.8724960070727972, 0.15643446504023087, -0.9876883405951378,
+    0.9335804264972017, -0.35836794954530027, 0.7431448254773942,
+    -0.6691306063588582, 0.45399049973954675, -0.8910065241883679,
+    0.10452846326765346, -0.9945218953682733, 0.9288095528719242,
+    -0.3705574375098362, 0.7253743710122876, -0.6883545756937539,
+    0.41865973753742813, -0.9081431738250813, 0.05233595624294383,
+    -0.9986295347545738, 0.9238795325112867, -0.3826834323650898,
+    0.7071067811865476, -0.7071067811865475, 0.3826834323650898,
+    -0.9238795325112867, -0.0, -1.0, 0.9187912101488983,
+    -0.39474385638426723, 0.6883545756937539, -0.7253743710122876,
+    0.34611705707749296, -0.9381913359224842, -0.05233595624294383,
+    -0.9986295347545738, 0.9135454576426009, -0.40673664307580015,
+    0.6691306063588582, -0.7431448254773942, 0.3090169943749474,
+    -0.9510565162951535, -0.10452846326765346, -0.9945218953682733,
+    0.9081431738250813, -0.41865973753742813, 0.6494480483301837,
+    -0.7604059656000309, 0.27144044986507426, -0.9624552364536473,
+    -0.15643446504023087, -0.9876883405951378, 0.9025852843498606,
+    -0.4305110968082951, 0.6293203910498375, -0.7771459614569709,
+    0.2334453638559054, -0.9723699203976766, -0.20791169081775931,
+    -0.9781476007338057, 0.8968727415326883, -0.4422886902190013,
+    0.6087614290087207, -0.7933533402912352, 0.19509032201612825,
+    -0.9807852804032304, -0.25881904510252074, -0.9659258262890683,
+    0.8910065241883679, -0.45399049973954675, 0.5877852522924731,
+    -0.8090169943749475, 0.15643446504023087, -0.9876883405951378,
+    -0.3090169943749474, -0.9510565162951535, 0.8849876374630419,
+    -0.4656145203251114, 0.5664062369248328, -0.8241261886220156,
+    0.11753739745783764, -0.9930684569549263, -0.35836794954530027,
+    -0.9335804264972017, 0.8788171126619654, -0.4771587602596084,
+    0.544639035015027, -0.838670567945424, 0.07845909572784494,
+    -0.996917333733128, -0.40673664307580015, -0.9135454576426009,
+    0.8724960070727972, -0.4886212414969549, 0.5224985647159488,
+    -0.8526401643540922, 0.03925981575906861, -0.9992290362407229,
+    -0.45399049973954675, -0.8910065241883679, 0.8660254037844387,
+    -0.49999999999999994, 0.49999999999999994, -0.8660254037844387, -0.0,
+    -1.0, -0.49999999999999994, -0.8660254037844387, 0.8594064115014527,
+    -0.5112930860770522, 0.4771587602596084, -0.8788171126619654,
+    -0.03925981575906861, -0.9992290362407229, -0.544639035015027,
+    -0.838670567945424, 0.8526401643540922, -0.5224985647159488,
+    0.45399049973954675, -0.8910065241883679, -0.07845909572784494,
+    -0.996917333733128, -0.5877852522924731, -0.8090169943749475,
+    0.8457278217039733, -0.5336145159156115, 0.4305110968082951,
+    -0.9025852843498606, -0.11753739745783764, -0.9930684569549263,
+    -0.6293203910498375, -0.7771459614569709, 0.838670567945424,
+    -0.544639035015027, 0.40673664307580015, -0.9135454576426009,
+    -0.15643446504023087, -0.9876883405951378, -0.6691306063588582,
+    -0.7431448254773942, 0.8314696123025452, -0.5555702330196022,
+    0.3826834323650898, -0.9238795325112867, -0.19509032201612825,
+    -0.9807852804032304, -0.7071067811865476, -0.7071067811865475,
+    0.8241261886220156, -0.5664062369248328, 0.35836794954530027,
+    -0.9335804264972017, -0.2334453638559054, -0.9723699203976766,
+    -0.7431448254773942, -0.6691306063588582, 0.8166415551616789,
+    -0.5771451900372336, 0.33380685923377096, -0.9426414910921784,
+    -0.27144044986507426, -0.9624552364536473, -0.7771459614569709,
+    -0.6293203910498375, 0.8090169943749475, -0.5877852522924731,
+    0.3090169943749474, -0.9510565162951535, -0.3090169943749474,
+    -0.9510565162951535, -0.8090169943749475, -0.5877852522924731,
+    0.8012538126910607, -0.598324600570659, 0.2840153447039226,
+    -0.958819734868193, -0.34611705707749296, -0.9381913359224842,
+    -0.838670567945424, -0.544639035015027, 0.7933533402912352,
+    -0.6087614290087207, 0.25881904510252074, -0.9659258262890683,
+    -0.3826834323650898, -0.9238795325112867, -0.8660254037844387,
+    -0.49999999999999994, 0.785316930880745, -0.619093949309834,
+    0.2334453638559054, -0.9723699203976766, -0.41865973753742813,
+    -0.9081431738250813, -0.8910065241883679, -0.45399049973954675,
+    0.7771459614569709, -0.6293203910498375, 0.20791169081775931,
+    -0.9781476007338057, -0.45399049973954675, -0.8910065241883679,
+    -0.9135454576426009, -0.40673664307580015, 0.7688418320734596,
+    -0.6394390019805847, 0.18223552549214747, -0.9832549075639546,
+    -0.4886212414969549, -0.8724960070727972, -0.9335804264972017,
+    -0.35836794954530027, 0.7604059656000309, -0.6494480483301837,
+    0.15643446504023087, -0.9876883405951378, -0.5224985647159488,
+    -0.8526401643540922, -0.9510565162951535, -0.3090169943749474,
+    0.7518398074789774, -0.6593458151000688, 0.13052619222005157,
+    -0.9914448613738104, -0.5555702330196022, -0.8314696123025452,
+    -0.9659258262890683, -0.25881904510252074, 0.7431448254773942,
+    -0.6691306063588582, 0.10452846326765346, -0.9945218953682733,
+    -0.5877852522924731, -0.8090169943749475, -0.9781476007338057,
+    -0.20791169081775931, 0.7343225094356856, -0.6788007455329417,
+    0.07845909572784494, -0.996917333733128, -0.619093949309834,
+    -0.785316930880745, -0.9876883405951378, -0.15643446504023087,
+    0.7253743710122876, -0.6883545756937539, 0.05233595624294383,
+    -0.9986295347545738, -0.6494480483301837, -0.7604059656000309,
+    -0.9945218953682733, -0.10452846326765346, 0.7163019434246544,
+    -0.6977904598416801, 0.02617694830787315, -0.9996573249755573,
+    -0.6788007455329417, -0.7343225094356856, -0.9986295347545738,
+    -0.05233595624294383, 0.7071067811865476, -0.7071067811865475, -0.0,
+    -1.0, -0.7071067811865476, -0.7071067811865475, -1.0, -0.0,
+    0.6977904598416801, -0.7163019434246544, -0.02617694830787315,
+    -0.9996573249755573, -0.7343225094356856, -0.6788007455329417,
+    -0.9986295347545738, 0.05233595624294383, 0.6883545756937539,
+    -0.7253743710122876, -0.05233595624294383, -0.9986295347545738,
+    -0.7604059656000309, -0.6494480483301837, -0.9945218953682733,
+    0.10452846326765346, 0.6788007455329417, -0.7343225094356856,
+    -0.07845909572784494, -0.996917333733128, -0.785316930880745,
+    -0.619093949309834, -0.9876883405951378, 0.15643446504023087,
+    0.6691306063588582, -0.7431448254773942, -0.10452846326765346,
+    -0.9945218953682733, -0.8090169943749475, -0.5877852522924731,
+    -0.9781476007338057, 0.20791169081775931, 0.6593458151000688,
+    -0.7518398074789774, -0.13052619222005157, -0.9914448613738104,
+    -0.8314696123025452, -0.5555702330196022, -0.9659258262890683,
+    0.25881904510252074, 0.6494480483301837, -0.7604059656000309,
+    -0.15643446504023087, -0.9876883405951378, -0.8526401643540922,
+    -0.5224985647159488, -0.9510565162951535, 0.3090169943749474,
+    0.6394390019805847, -0.7688418320734596, -0.18223552549214747,
+    -0.9832549075639546, -0.8724960070727972, -0.4886212414969549,
+    -0.9335804264972017, 0.35836794954530027, 0.6293203910498375,
+    -0.7771459614569709, -0.20791169081775931, -0.9781476007338057,
+    -0.8910065241883679, -0.45399049973954675, -0.9135454576426009,
+    0.40673664307580015, 0.619093949309834, -0.785316930880745,
+    -0.2334453638559054, -0.9723699203976766, -0.9081431738250813,
+    -0.41865973753742813, -0.8910065241883679, 0.45399049973954675,
+    0.6087614290087207, -0.7933533402912352, -0.25881904510252074,
+    -0.9659258262890683, -0.9238795325112867, -0.3826834323650898,
+    -0.8660254037844387, 0.49999999999999994, 0.598324600570659,
+    -0.8012538126910607, -0.2840153447039226, -0.958819734868193,
+    -0.9381913359224842, -0.34611705707749296, -0.838670567945424,
+    0.544639035015027, 0.5877852522924731, -0.8090169943749475,
+    -0.3090169943749474, -0.9510565162951535, -0.9510565162951535,
+    -0.3090169943749474, -0.8090169943749475, 0.5877852522924731,
+    0.5771451900372336, -0.8166415551616789, -0.33380685923377096,
+    -0.9426414910921784, -0.9624552364536473, -0.27144044986507426,
+    -0.7771459614569709, 0.6293203910498375, 0.5664062369248328,
+    -0.8241261886220156, -0.35836794954530027, -0.9335804264972017,
+    -0.9723699203976766, -0.2334453638559054, -0.7431448254773942,
+    0.6691306063588582, 0.5555702330196022, -0.8314696123025452,
+    -0.3826834323650898, -0.9238795325112867, -0.9807852804032304,
+    -0.19509032201612825, -0.7071067811865476, 0.7071067811865475,
+    0.544639035015027, -0.838670567945424, -0.40673664307580015,
+    -0.9135454576426009, -0.9876883405951378, -0.15643446504023087,
+    -0.6691306063588582, 0.7431448254773942, 0.5336145159156115,
+    -0.8457278217039733, -0.4305110968082951, -0.9025852843498606,
+    -0.9930684569549263, -0.11753739745783764, -0.6293203910498375,
+    0.7771459614569709, 0.5224985647159488, -0.8526401643540922,
+    -0.45399049973954675, -0.8910065241883679, -0.996917333733128,
+    -0.07845909572784494, -0.5877852522924731, 0.8090169943749475,
+    0.5112930860770522, -0.8594064115014527, -0.4771587602596084,
+    -0.8788171126619654, -0.9992290362407229, -0.03925981575906861,
+    -0.544639035015027, 0.838670567945424, 0.49999999999999994,
+    -0.8660254037844387, -0.49999999999999994, -0.8660254037844387, -1.0,
+    -0.0, -0.49999999999999994, 0.8660254037844387, 0.4886212414969549,
+    -0.8724960070727972, -0.5224985647159488, -0.8526401643540922,
+    -0.9992290362407229, 0.03925981575906861, -0.45399049973954675,
+    0.8910065241883679, 0.4771587602596084, -0.8788171126619654,
+    -0.544639035015027, -0.838670567945424, -0.996917333733128,
+    0.07845909572784494, -0.40673664307580015, 0.9135454576426009,
+    0.4656145203251114, -0.8849876374630419, -0.5664062369248328,
+    -0.8241261886220156, -0.9930684569549263, 0.11753739745783764,
+    -0.35836794954530027, 0.9335804264972017, 0.45399049973954675,
+    -0.8910065241883679, -0.5877852522924731, -0.8090169943749475,
+    -0.9876883405951378, 0.15643446504023087, -0.3090169943749474,
+    0.9510565162951535, 0.4422886902190013, -0.8968727415326883,
+    -0.6087614290087207, -0.7933533402912352, -0.9807852804032304,
+    0.19509032201612825, -0.25881904510252074, 0.9659258262890683,
+    0.4305110968082951, -0.9025852843498606, -0.6293203910498375,
+    -0.7771459614569709, -0.9723699203976766, 0.2334453638559054,
+    -0.20791169081775931, 0.9781476007338057, 0.41865973753742813,
+    -0.9081431738250813, -0.6494480483301837, -0.7604059656000309,
+    -0.9624552364536473, 0.27144044986507426, -0.15643446504023087,
+    0.9876883405951378, 0.40673664307580015, -0.9135454576426009,
+    -0.6691306063588582, -0.7431448254773942, -0.9510565162951535,
+    0.3090169943749474, -0.10452846326765346, 0.9945218953682733,
+    0.39474385638426723, -0.9187912101488983, -0.6883545756937539,
+    -0.7253743710122876, -0.9381913359224842, 0.34611705707749296,
+    -0.05233595624294383, 0.9986295347545738, 0.3826834323650898,
+    -0.9238795325112867, -0.7071067811865476, -0.7071067811865475,
+    -0.9238795325112867, 0.3826834323650898, 0.0, 1.0, 0.3705574375098362,
+    -0.9288095528719242, -0.7253743710122876, -0.6883545756937539,
+    -0.9081431738250813, 0.41865973753742813, 0.05233595624294383,
+    0.9986295347545738, 0.35836794954530027, -0.9335804264972017,
+    -0.7431448254773942, -0.6691306063588582, -0.8910065241883679,
+    0.45399049973954675, 0.10452846326765346, 0.9945218953682733,
+    0.34611705707749296, -0.9381913359224842, -0.7604059656000309,
+    -0.6494480483301837, -0.8724960070727972, 0.4886212414969549,
+    0.15643446504023087, 0.9876883405951378, 0.33380685923377096,
+    -0.9426414910921784, -0.7771459614569709, -0.6293203910498375,
+    -0.8526401643540922, 0.5224985647159488, 0.20791169081775931,
+    0.9781476007338057, 0.3214394653031616, -0.9469301294951057,
+    -0.7933533402912352, -0.6087614290087207, -0.8314696123025452,
+    0.5555702330196022, 0.25881904510252074, 0.9659258262890683
+]);
+const COMPACT_SCRATCH_RE = new Float64Array(480);
+const COMPACT_SCRATCH_IM = new Float64Array(480);
 
 //
 //  Public functions.
@@ -2035,6 +401,8 @@ function ApplyMixedRadixFFT_480_Part4(re, im) {
  * 
  *  Note(s):
  *    [1] The size of `re` and `im` will not be checked.
+ *    [2] The transform is done by the table-driven loop kernel (compact
+ *        mode), which is smaller but slower than the unrolled kernels.
  * 
  *  @param {Number[]} re 
  *    - The real part of each point.
@@ -2042,10 +410,7 @@ function ApplyMixedRadixFFT_480_Part4(re, im) {
  *    - The imaginary part of each point.
  */
 function ApplyMixedRadixFFT_480(re, im) {
-    ApplyMixedRadixFFT_480_Part1(re, im);
-    ApplyMixedRadixFFT_480_Part2(re, im);
-    ApplyMixedRadixFFT_480_Part3(re, im);
-    ApplyMixedRadixFFT_480_Part4(re, im);
+    MXCompact(re, im, COMPACT_RADICES, COMPACT_INDEXES, COMPACT_TWIDDLES, COMPACT_SCRATCH_RE, COMPACT_SCRATCH_IM);
 }
 
 //  Export public APIs.
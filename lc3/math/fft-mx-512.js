@@ -0,0 +1,448 @@
+//
+//  Copyright 2021 - 2023 XiaoJSoft Studio. All rights reserved.
+//  Use of this source code is governed by a BSD-style license that can be
+//  found in the LICENSE.md file.
+//
+
+//
+//  Note(s):
+//    [1] This file is generated automatically by a FFT compiler, which locates 
+//        at "./../../dev/fft-mx-generator/" directory.
+//        Do NOT modify this file manually.
+//
+
+//
+//  Imports.
+//
+
+//  Imported modules.
+const Lc3FftMxBaseOp = 
+    require("./fft-mx-baseop");
+
+//  Imported functions.
+// const MXTr2 = 
+//     Lc3FftMxBaseOp.MXTr2;
+// const MXTr3 = 
+//     Lc3FftMxBaseOp.MXTr3;
+// const MXTr4 = 
+//     Lc3FftMxBaseOp.MXTr4;
+// const MXTr5 = 
+//     Lc3FftMxBaseOp.MXTr5;
+// const MXRot = 
+//     Lc3FftMxBaseOp.MXRot;
+// const MXSwap = 
+//     Lc3FftMxBaseOp.MXSwap;
+// const MXCshft = 
+//     Lc3FftMxBaseOp.MXCshft;
+const MXCompact = 
+    Lc3FftMxBaseOp.MXCompact;
+
+//
+//  Constants.
+//
+
+//  Tables (and scratch buffers) of the compact kernel (see MXCompact() of
+//  the "fft-mx-baseop" module).
+const COMPACT_RADICES = new Int32Array([
+    4, 4, 4, 4, 2
+]);
+const COMPACT_INDEXES = new Int32Array([
+    0, 128, 256, 384, 32, 160, 288, 416, 64, 192, 320, 448, 96, 224, 352,
+    480, 8, 136, 264, 392, 40, 168, 296, 424, 72, 200, 328, 456, 104, 232,
+    360, 488, 16, 144, 272, 400, 48, 176, 304, 432, 80, 208, 336, 464, 112,
+    240, 368, 496, 24, 152, 280, 408, 56, 184, 312, 440, 88, 216, 344, 472,
+    120, 248, 376, 504, 2, 130, 258, 386, 34, 162, 290, 418, 66, 194, 322,
+    450, 98, 226, 354, 482, 10, 138, 266, 394, 42, 170, 298, 426, 74, 202,
+    330, 458, 106, 234, 362, 490, 18, 146, 274, 402, 50, 178, 306, 434, 82,
+    210, 338, 466, 114, 242, 370, 498, 26, 154, 282, 410, 58, 186, 314, 442,
+    90, 218, 346, 474, 122, 250, 378, 506, 4, 132, 260, 388, 36, 164, 292,
+    420, 68, 196, 324, 452, 100, 228, 356, 484, 12, 140, 268, 396, 44, 172,
+    300, 428, 76, 204, 332, 460, 108, 236, 364, 492, 20, 148, 276, 404, 52,
+    180, 308, 436, 84, 212, 340, 468, 116, 244, 372, 500, 28, 156, 284, 412,
+    60, 188, 316, 444, 92, 220, 348, 476, 124, 252, 380, 508, 6, 134, 262,
+    390, 38, 166, 294, 422, 70, 198, 326, 454, 102, 230, 358, 486, 14, 142,
+    270, 398, 46, 174, 302, 430, 78, 206, 334, 462, 110, 238, 366, 494, 22,
+    150, 278, 406, 54, 182, 310, 438, 86, 214, 342, 470, 118, 246, 374, 502,
+    30, 158, 286, 414, 62, 190, 318, 446, 94, 222, 350, 478, 126, 254, 382,
+    510, 1, 129, 257, 385, 33, 161, 289, 417, 65, 193, 321, 449, 97, 225,
+    353, 481, 9, 137, 265, 393, 41, 169, 297, 425, 73, 201, 329, 457, 105,
+    233, 361, 489, 17, 145, 273, 401, 49, 177, 305, 433, 81, 209, 337, 465,
+    113, 241, 369, 497, 25, 153, 281, 409, 57, 185, 313, 441, 89, 217, 345,
+    473, 121, 249, 377, 505, 3, 131, 259, 387, 35, 163, 291, 419, 67, 195,
+    323, 451, 99, 227, 355, 483, 11, 139, 267, 395, 43, 171, 299, 427, 75,
+    203, 331, 459, 107, 235, 363, 491, 19, 147, 275, 403, 51, 179, 307, 435,
+    83, 211, 339, 467, 115, 243, 371, 499, 27, 155, 283, 411, 59, 187, 315,
+    443, 91, 219, 347, 475, 123, 251, 379, 507, 5, 133, 261, 389, 37, 165,
+    293, 421, 69, 197, 325, 453, 101, 229, 357, 485, 13, 141, 269, 397, 45,
+    173, 301, 429, 77, 205, 333, 461, 109, 237, 365, 493, 21, 149, 277, 405,
+    53, 181, 309, 437, 85, 213, 341, 469, 117, 245, 373, 501, 29, 157, 285,
+    413, 61, 189, 317, 445, 93, 221, 349, 477, 125, 253, 381, 509, 7, 135,
+    263, 391, 39, 167, 295, 423, 71, 199, 327, 455, 103, 231, 359, 487, 15,
+    143, 271, 399, 47, 175, 303, 431, 79, 207, 335, 463, 111, 239, 367, 495,
+    23, 151, 279, 407, 55, 183, 311, 439, 87, 215, 343, 471, 119, 247, 375,
+    503, 31, 159, 287, 415, 63, 191, 319, 447, 95, 223, 351, 479, 127, 255,
+    383, 511
+]);
+const COMPACT_TWIDDLES = new Float64Array([
+    1.0, 0.0, 1.0, 0.0, 1.0, 0.0, 1.0, 0.0, 1.0, 0.0, 1.0, 0.0,
+    0.9238795325112867, -0.3826834323650898, 0.7071067811865476,
+    -0.7071067811865475, 0.3826834323650898, -0.9238795325112867,
+    0.7071067811865476, -0.7071067811865475, -0.0, -1.0,
+    -0.7071067811865476, -0.7071067811865475, 0.3826834323650898,
+    -0.9238795325112867, -0.7071067811865476, -0.7071067811865475,
+    -0.9238795325112867, 0.3826834323650898, 1.0, 0.0, 1.0, 0.0, 1.0, 0.0,
+    0.9951847266721969, -0.0980171403295606, 0.9807852804032304,
+    -0.19509032201612825, 0.9569403357322088, -0.29028467725446233,
+    0.9807852804032304, -0.19509032201612825, 0.9238795325112867,
+    -0.3826834323650898, 0.8314696123025452, -0.5555702330196022,
+    0.9569403357322088, -0.29028467725446233, 0.8314696123025452,
+    -0.5555702330196022, 0.6343932841636455, -0.773010453362737,
+    0.9238795325112867, -0.3826834323650898, 0.7071067811865476,
+    -0.7071067811865475, 0.3826834323650898, -0.9238795325112867,
+    0.881921264348355, -0.47139673682599764, 0.5555702330196022,
+    -0.8314696123025452, 0.0980171403295606, -0.9951847266721969,
+    0.8314696123025452, -0.5555702330196022, 0.3826834323650898,
+    -0.9238795325112867, -0.19509032201612825, -0.9807852804032304,
+    0.773010453362737, -0.6343932841636455, 0.19509032201612825,
+    -0.9807852804032304, -0.47139673682599764, -0.881921264348355,
+    0.7071067811865476, -0.7071067811865475, -0.0, -1.0,
+    -0.7071067811865476, -0.7071067811865475, 0.6343932841636455,
+    -0.773010453362737, -0.19509032201612825, -0.9807852804032304,
+    -0.881921264348355, -0.47139673682599764, 0.5555702330196022,
+    -0.8314696123025452, -0.3826834323650898, -0.9238795325112867,
+    -0.9807852804032304, -0.19509032201612825, 0.47139673682599764,
+    -0.881921264348355, -0.5555702330196022, -0.8314696123025452,
+    -0.9951847266721969, 0.0980171403295606, 0.3826834323650898,
+    -0.9238795325112867, -0.7071067811865476, -0.7071067811865475,
+    -0.9238795325112867, 0.3826834323650898, 0.29028467725446233,
+    -0.9569403357322088, -0.8314696123025452, -0.5555702330196022,
+    -0.773010453362737, 0.6343932841636455, 0.19509032201612825,
+    -0.9807852804032304, -0.9238795325112867, -0.3826834323650898,
+    -0.5555702330196022, 0.8314696123025452, 0.0980171403295606,
+    -0.9951847266721969, -0.9807852804032304, -0.19509032201612825,
+    -0.29028467725446233, 0.9569403357322088, 1.0, 0.0, 1.0, 0.0, 1.0, 0.0,
+    0.9996988186962042, -0.024541228522912288, 0.9987954562051724,
+    -0.049067674327418015, 0.9972904566786902, -0.07356456359966743,
+    0.9987954562051724, -0.049067674327418015, 0.9951847266721969,
+    -0.0980171403295606, 0.989176509964781, -0.14673047445536175,
+    0.9972904566786902, -0.07356456359966743, 0.989176509964781,
+    -0.14673047445536175, 0.9757021300385286, -0.2191012401568698,
+    0.9951847266721969, -0.0980171403295606, 0.9807852804032304,
+    -0.19509032201612825, 0.9569403357322088, -0.29028467725446233,
+    0.99247953459871, -0.1224106751992162, 0.970031253194544,
+    -0.24298017990326387, 0.932992798834739, -0.3598950365349881,
+    0.989176509964781, -0.14673047445536175, 0.9569403357322088,
+    -0.29028467725446233, 0.9039892931234433, -0.4275550934302821,
+    0.9852776423889412, -0.17096188876030122, 0.9415440651830208,
+    -0.33688985339222005, 0.8700869911087115, -0.49289819222978404,
+    0.9807852804032304, -0.19509032201612825, 0.9238795325112867,
+    -0.3826834323650898, 0.8314696123025452, -0.5555702330196022,
+    0.9757021300385286, -0.2191012401568698, 0.9039892931234433,
+    -0.4275550934302821, 0.7883464276266063, -0.6152315905806268,
+    0.970031253194544, -0.24298017990326387, 0.881921264348355,
+    -0.47139673682599764, 0.7409511253549591, -0.6715589548470183,
+    0.9637760657954398, -0.26671275747489837, 0.8577286100002721,
+    -0.5141027441932217, 0.6895405447370668, -0.724247082951467,
+    0.9569403357322088, -0.29028467725446233, 0.8314696123025452,
+    -0.5555702330196022, 0.6343932841636455, -0.773010453362737,
+    0.9495281805930367, -0.3136817403988915, 0.8032075314806449,
+    -0.5956993044924334, 0.5758081914178453, -0.8175848131515837,
+    0.9415440651830208, -0.33688985339222005, 0.773010453362737,
+    -0.6343932841636455, 0.5141027441932217, -0.8577286100002721,
+    0.932992798834739, -0.3598950365349881, 0.7409511253549591,
+    -0.6715589548470183, 0.44961132965460654, -0.8932243011955153,
+    0.9238795325112867, -0.3826834323650898, 0.7071067811865476,
+    -0.7071067811865475, 0.3826834323650898, -0.9238795325112867,
+    0.9142097557035307, -0.40524131400498986, 0.6715589548470183,
+    -0.7409511253549591, 0.3136817403988915, -0.9495281805930367,
+    0.9039892931234433, -0.4275550934302821, 0.6343932841636455,
+    -0.773010453362737, 0.24298017990326387, -0.970031253194544,
+    0.8932243011955153, -0.44961132965460654, 0.5956993044924334,
+    -0.8032075314806449, 0.17096188876030122, -0.9852776423889412,
+    0.881921264348355, -0.47139673682599764, 0.5555702330196022,
+    -0.8314696123025452, 0.0980171403295606, -0.9951847266721969,
+    0.8700869911087115, -0.49289819222978404, 0.5141027441932217,
+    -0.8577286100002721, 0.024541228522912288, -0.9996988186962042,
+    0.8577286100002721, -0.5141027441932217, 0.47139673682599764,
+    -0.881921264348355, -0.049067674327418015, -0.9987954562051724,
+    0.8448535652497071, -0.5349976198870972, 0.4275550934302821,
+    -0.9039892931234433, -0.1224106751992162, -0.99247953459871,
+    0.8314696123025452, -0.5555702330196022, 0.3826834323650898,
+    -0.9238795325112867, -0.19509032201612825, -0.9807852804032304,
+    0.8175848131515837, -0.5758081914178453, 0.33688985339222005,
+    -0.9415440651830208, -0.26671275747489837, -0.9637760657954398,
+    0.8032075314806449, -0.5956993044924334, 0.29028467725446233,
+    -0.9569403357322088, -0.33688985339222005, -0.9415440651830208,
+    0.7883464276266063, -0.6152315905806268, 0.24298017990326387,
+    -0.970031253194544, -0.40524131400498986, -0.9142097557035307,
+    0.773010453362737, -0.6343932841636455, 0.19509032201612825,
+    -0.9807852804032304, -0.47139673682599764, -0.881921264348355,
+    0.7572088465064846, -0.6531728429537768, 0.14673047445536175,
+    -0.989176509964781, -0.5349976198870972, -0.8448535652497071,
+    0.7409511253549591, -0.6715589548470183, 0.0980171403295606,
+    -0.9951847266721969, -0.5956993044924334, -0.8032075314806449,
+    0.724247082951467, -0.6895405447370668, 0.049067674327418015,
+    -0.9987954562051724, -0.6531728429537768, -0.7572088465064846,
+    0.7071067811865476, -0.7071067811865475, -0.0, -1.0,
+    -0.7071067811865476, -0.7071067811865475, 0.6895405447370668,
+    -0.724247082951467, -0.049067674327418015, -0.9987954562051724,
+    -0.7572088465064846, -0.6531728429537768, 0.6715589548470183,
+    -0.7409511253549591, -0.0980171403295606, -0.9951847266721969,
+    -0.8032075314806449, -0.5956993044924334, 0.6531728429537768,
+    -0.7572088465064846, -0.14673047445536175, -0.989176509964781,
+    -0.8448535652497071, -0.5349976198870972, 0.6343932841636455,
+    -0.773010453362737, -0.19509032201612825, -0.9807852804032304,
+    -0.881921264348355, -0.47139673682599764, 0.6152315905806268,
+    -0.7883464276266063, -0.24298017990326387, -0.970031253194544,
+    -0.9142097557035307, -0.40524131400498986, 0.5956993044924334,
+    -0.8032075314806449, -0.29028467725446233, -0.9569403357322088,
+    -0.9415440651830208, -0.33688985339222005, 0.5758081914178453,
+    -0.8175848131515837, -0.33688985339222005, -0.9415440651830208,
+    -0.9637760657954398, -0.26671275747489837, 0.5555702330196022,
+    -0.8314696123025452, -0.3826834323650898, -0.9238795325112867,
+    -0.9807852804032304, -0.19509032201612825, 0.5349976198870972,
+    -0.8448535652497071, -0.4275550934302821, -0.9039892931234433,
+    -0.99247953459871, -0.1224106751992162, 0.5141027441932217,
+    -0.8577286100002721, -0.47139673682599764, -0.881921264348355,
+    -0.9987954562051724, -0.049067674327418015, 0.49289819222978404,
+    -0.8700869911087115, -0.5141027441932217, -0.8577286100002721,
+    -0.9996988186962042, 0.024541228522912288, 0.47139673682599764,
+    -0.881921264348355, -0.5555702330196022, -0.8314696123025452,
+    -0.9951847266721969, 0.0980171403295606, 0.44961132965460654,
+    -0.8932243011955153, -0.5956993044924334, -0.8032075314806449,
+    -0.9852776423889412, 0.17096188876030122, 0.4275550934302821,
+    -0.9039892931234433, -0.6343932841636455, -0.773010453362737,
+    -0.970031253194544, 0.24298017990326387, 0.40524131400498986,
+    -0.9142097557035307, -0.6715589548470183, -0.7409511253549591,
+    -0.9495281805930367, 0.3136817403988915, 0.3826834323650898,
+    -0.9238795325112867, -0.7071067811865476, -0.7071067811865475,
+    -0.9238795325112867, 0.3826834323650898, 0.3598950365349881,
+    -0.932992798834739, -0.7409511253549591, -0.6715589548470183,
+    -0.8932243011955153, 0.44961132965460654, 0.33688985339222005,
+    -0.9415440651830208, -0.773010453362737, -0.6343932841636455,
+    -0.8577286100002721, 0.5141027441932217, 0.3136817403988915,
+    -0.9495281805930367, -0.8032075314806449, -0.5956993044924334,
+    -0.8175848131515837, 0.5758081914178453, 0.29028467725446233,
+    -0.9569403357322088, -0.8314696123025452, -0.5555702330196022,
+    -0.773010453362737, 0.6343932841636455, 0.26671275747489837,
+    -0.9637760657954398, -0.8577286100002721, -0.5141027441932217,
+    -0.724247082951467, 0.6895405447370668, 0.24298017990326387,
+    -0.970031253194544, -0.881921264348355, -0.47139673682599764,
+    -0.6715589548470183, 0.7409511253549591, 0.2191012401568698,
+    -0.9757021300385286, -0.9039892931234433, -0.4275550934302821,
+    -0.6152315905806268, 0.7883464276266063, 0.19509032201612825,
+    -0.9807852804032304, -0.9238795325112867, -0.3826834323650898,
+    -0.5555702330196022, 0.8314696123025452, 0.17096188876030122,
+    -0.9852776423889412, -0.9415440651830208, -0.33688985339222005,
+    -0.49289819222978404, 0.8700869911087115, 0.14673047445536175,
+    -0.989176509964781, -0.9569403357322088, -0.29028467725446233,
+    -0.4275550934302821, 0.9039892931234433, 0.1224106751992162,
+    -0.99247953459871, -0.970031253194544, -0.24298017990326387,
+    -0.3598950365349881, 0.932992798834739, 0.0980171403295606,
+    -0.9951847266721969, -0.9807852804032304, -0.19509032201612825,
+    -0.29028467725446233, 0.9569403357322088, 0.07356456359966743,
+    -0.9972904566786902, -0.989176509964781, -0.14673047445536175,
+    -0.2191012401568698, 0.9757021300385286, 0.049067674327418015,
+    -0.9987954562051724, -0.9951847266721969, -0.0980171403295606,
+    -0.14673047445536175, 0.989176509964781, 0.024541228522912288,
+    -0.9996988186962042, -0.9987954562051724, -0.049067674327418015,
+    -0.07356456359966743, 0.9972904566786902, 1.0, 0.0, 0.9999247018391445,
+    -0.012271538285719925, 0.9996988186962042, -0.024541228522912288,
+    0.9993223845883495, -0.03680722294135883, 0.9987954562051724,
+    -0.049067674327418015, 0.9981181129001492, -0.06132073630220858,
+    0.9972904566786902, -0.07356456359966743, 0.996312612182778,
+    -0.0857973123444399, 0.9951847266721969, -0.0980171403295606,
+    0.9939069700023561, -0.11022220729388306, 0.99247953459871,
+    -0.1224106751992162, 0.99090263542778, -0.13458070850712617,
+    0.989176509964781, -0.14673047445536175, 0.9873014181578584,
+    -0.15885814333386145, 0.9852776423889412, -0.17096188876030122,
+    0.9831054874312163, -0.18303988795514095, 0.9807852804032304,
+    -0.19509032201612825, 0.9783173707196277, -0.20711137619221856,
+    0.9757021300385286, -0.2191012401568698, 0.9729399522055602,
+    -0.2310581082806711, 0.970031253194544, -0.24298017990326387,
+    0.9669764710448521, -0.25486565960451457, 0.9637760657954398,
+    -0.26671275747489837, 0.9604305194155658, -0.27851968938505306,
+    0.9569403357322088, -0.29028467725446233, 0.9533060403541939,
+    -0.3020059493192281, 0.9495281805930367, -0.3136817403988915,
+    0.9456073253805213, -0.3253102921622629, 0.9415440651830208,
+    -0.33688985339222005, 0.937339011912575, -0.34841868024943456,
+    0.932992798834739, -0.3598950365349881, 0.9285060804732156,
+    -0.37131719395183754, 0.9238795325112867, -0.3826834323650898,
+    0.9191138516900578, -0.3939920400610481, 0.9142097557035307,
+    -0.40524131400498986, 0.9091679830905224, -0.41642956009763715,
+    0.9039892931234433, -0.4275550934302821, 0.8986744656939538,
+    -0.43861623853852766, 0.8932243011955153, -0.44961132965460654,
+    0.8876396204028539, -0.46053871095824, 0.881921264348355,
+    -0.47139673682599764, 0.8760700941954066, -0.4821837720791227,
+    0.8700869911087115, -0.49289819222978404, 0.8639728561215868,
+    -0.5035383837257176, 0.8577286100002721, -0.5141027441932217,
+    0.8513551931052652, -0.524589682678469, 0.8448535652497071,
+    -0.5349976198870972, 0.8382247055548381, -0.5453249884220465,
+    0.8314696123025452, -0.5555702330196022, 0.8245893027850253,
+    -0.5657318107836131, 0.8175848131515837, -0.5758081914178453,
+    0.8104571982525948, -0.5857978574564389, 0.8032075314806449,
+    -0.5956993044924334, 0.7958369046088836, -0.6055110414043255,
+    0.7883464276266063, -0.6152315905806268, 0.7807372285720945,
+    -0.6248594881423863, 0.773010453362737, -0.6343932841636455,
+    0.765167265622459, -0.6438315428897914, 0.7572088465064846,
+    -0.6531728429537768, 0.7491363945234594, -0.6624157775901718,
+    0.7409511253549591, -0.6715589548470183, 0.7326542716724128,
+    -0.680600997795453, 0.724247082951467, -0.6895405447370668,
+    0.7157308252838186, -0.6983762494089729, 0.7071067811865476,
+    -0.7071067811865475, 0.6983762494089729, -0.7157308252838186,
+    0.6895405447370668, -0.724247082951467, 0.680600997795453,
+    -0.7326542716724128, 0.6715589548470183, -0.7409511253549591,
+    0.6624157775901718, -0.7491363945234594, 0.6531728429537768,
+    -0.7572088465064846, 0.6438315428897914, -0.765167265622459,
+    0.6343932841636455, -0.773010453362737, 0.6248594881423863,
+    -0.7807372285720945, 0.6152315905806268, -0.7883464276266063,
+    0.6055110414043255, -0.7958369046088836, 0.5956993044924334,
+    -0.8032075314806449, 0.5857978574564389, -0.8104571982525948,
+    0.5758081914178453, -0.8175848131515837, 0.5657318107836131,
+    -0.8245893027850253, 0.5555702330196022, -0.8314696123025452,
+    0.5453249884220465, -0.8382247055548381, 0.5349976198870972,
+    -0.8448535652497071, 0.524589682678469, -0.8513551931052652,
+    0.5141027441932217, -0.8577286100002721, 0.5035383837257176,
+    -0.8639728561215868, 0.49289819222978404, -0.8700869911087115,
+    0.4821837720791227, -0.8760700941954066, 0.47139673682599764,
+    -0.881921264348355, 0.46053871095824, -0.8876396204028539,
+    0.44961132965460654, -0.8932243011955153, 0.43861623853852766,
+    -0.8986744656939538, 0.4275550934302821, -0.9039892931234433,
+    0.41642956009763715, -0.9091679830905224, 0.40524131400498986,
+    -0.9142097557035307, 0.3939920400610481, -0.9191138516900578,
+    0.3826834323650898, -0.9238795325112867, 0.37131719395183754,
+    -0.9285060804732156, 0.3598950365349881, -0.932992798834739,
+    0.34841868024943456, -0.937339011912575, 0.33688985339222005,
+    -0.9415440651830208, 0.3253102921622629, -0.9456073253805213,
+    0.3136817403988915, -0.9495281805930367, 0.3020059493192281,
+    -0.9533060403541939, 0.29028467725446233, -0.9569403357322088,
+    0.27851968938505306, -0.9604305194155658, 0.26671275747489837,
+    -0.9637760657954398, 0.25486565960451457, -0.9669764710448521,
+    0.24298017990326387, -0.970031253194544, 0.2310581082806711,
+    -0.9729399522055602, 0.2191012401568698, -0.9757021300385286,
+    0.20711137619221856, -0.9783173707196277, 0.19509032201612825,
+    -0.9807852804032304, 0.18303988795514095, -0.9831054874312163,
+    0.17096188876030122, -0.9852776423889412, 0.15885814333386145,
+    -0.9873014181578584, 0.14673047445536175, -0.989176509964781,
+    0.13458070850712617, -0.99090263542778, 0.1224106751992162,
+    -0.99247953459871, 0.11022220729388306, -0.9939069700023561,
+    0.0980171403295606, -0.9951847266721969, 0.0857973123444399,
+    -0.996312612182778, 0.07356456359966743, -0.9972904566786902,
+    0.06132073630220858, -0.9981181129001492, 0.049067674327418015,
+    -0.9987954562051724, 0.03680722294135883, -0.9993223845883495,
+    0.024541228522912288, -0.9996988186962042, 0.012271538285719925,
+    -0.9999247018391445, -0.0, -1.0, -0.012271538285719925,
+    -0.9999247018391445, -0.024541228522912288, -0.9996988186962042,
+    -0.03680722294135883, -0.9993223845883495, -0.049067674327418015,
+    -0.9987954562051724, -0.06132073630220858, -0.9981181129001492,
+    -0.07356456359966743, -0.9972904566786902, -0.0857973123444399,
+    -0.996312612182778, -0.0980171403295606, -0.9951847266721969,
+    -0.11022220729388306, -0.9939069700023561, -0.1224106751992162,
+    -0.99247953459871, -0.13458070850712617, -0.99090263542778,
+    -0.14673047445536175, -0.989176509964781, -0.15885814333386145,
+    -0.9873014181578584, -0.17096188876030122, -0.9852776423889412,
+    -0.18303988795514095, -0.9831054874312163, -0.19509032201612825,
+    -0.9807852804032304, -0.20711137619221856, -0.9783173707196277,
+    -0.2191012401568698, -0.9757021300385286, -0.2310581082806711,
+    -0.9729399522055602, -0.24298017990326387, -0.970031253194544,
+    -0.25486565960451457, -0.9669764710448521, -0.26671275747489837,
+    -0.9637760657954398, -0.27851968938505306, -0.9604305194155658,
+    -0.29028467725446233, -0.9569403357322088, -0.3020059493192281,
+    -0.9533060403541939, -0.3136817403988915, -0.9495281805930367,
+    -0.3253102921622629, -0.9456073253805213, -0.33688985339222005,
+    -0.9415440651830208, -0.34841868024943456, -0.937339011912575,
+    -0.3598950365349881, -0.932992798834739, -0.37131719395183754,
+    -0.9285060804732156, -0.3826834323650898, -0.9238795325112867,
+    -0.3939920400610481, -0.9191138516900578, -0.40524131400498986,
+    -0.9142097557035307, -0.41642956009763715, -0.9091679830905224,
+    -0.4275550934302821, -0.9039892931234433, -0.43861623853852766,
+    -0.8986744656939538, -0.44961132965460654, -0.8932243011955153,
+    -0.46053871095824, -0.8876396204028539, -0.47139673682599764,
+    -0.881921264348355, -0.4821837720791227, -0.8760700941954066,
+    -0.49289819222978404, -0.8700869911087115, -0.5035383837257176,
+    -0.8639728561215868, -0.5141027441932217, -0.8577286100002721,
+    -0.524589682678469, -0.8513551931052652, -0.5349976198870972,
+    -0.8448535652497071, -0.5453249884220465, -0.8382247055548381,
+    -0.5555702330196022, -0.8314696123025452, -0.5657318107836131,
+    -0.8245893027850253, -0.5758081914178453, -0.8175848131515837,
+    -0.5857978574564389, -0.8104571982525948, -0.5956993044924334,
+    -0.8032075314806449, -0.6055110414043255, -0.7958369046088836,
+    -0.6152315905806268, -0.7883464276266063, -0.6248594881423863,
+    -0.7807372285720945, -0.6343932841636455, -0.773010453362737,
+    -0.6438315428897914, -0.765167265622459, -0.6531728429537768,
+    -0.7572088465064846, -0.6624157775901718, -0.7491363945234594,
+    -0.6715589548470183, -0.7409511253549591, -0.680600997795453,
+    -0.7326542716724128, -0.6895405447370668, -0.724247082951467,
+    -0.6983762494089729, -0.7157308252838186, -0.7071067811865476,
+    -0.7071067811865475, -0.7157308252838186, -0.6983762494089729,
+    -0.724247082951467, -0.6895405447370668, -0.7326542716724128,
+    -0.680600997795453, -0.7409511253549591, -0.6715589548470183,
+    -0.7491363945234594, -0.6624157775901718, -0.7572088465064846,
+    -0.6531728429537768, -0.765167265622459, -0.6438315428897914,
+    -0.773010453362737, -0.6343932841636455, -0.7807372285720945,
+    -0.6248594881423863, -0.7883464276266063, -0.6152315905806268,
+    -0.7958369046088836, -0.6055110414043255, -0.8032075314806449,
+    -0.5956993044924334, -0.8104571982525948, -0.5857978574564389,
+    -0.8175848131515837, -0.5758081914178453, -0.8245893027850253,
+    -0.5657318107836131, -0.8314696123025452, -0.5555702330196022,
+    -0.8382247055548381, -0.5453249884220465, -0.8448535652497071,
+    -0.5349976198870972, -0.8513551931052652, -0.524589682678469,
+    -0.8577286100002721, -0.5141027441932217, -0.8639728561215868,
+    -0.5035383837257176, -0.8700869911087115, -0.49289819222978404,
+    -0.8760700941954066, -0.4821837720791227, -0.881921264348355,
+    -0.47139673682599764, -0.8876396204028539, -0.46053871095824,
+    -0.8932243011955153, -0.44961132965460654, -0.8986744656939538,
+    -0.43861623853852766, -0.9039892931234433, -0.4275550934302821,
+    -0.9091679830905224, -0.41642956009763715, -0.9142097557035307,
+    -0.40524131400498986, -0.9191138516900578, -0.3939920400610481,
+    -0.9238795325112867, -0.3826834323650898, -0.9285060804732156,
+    -0.37131719395183754, -0.932992798834739, -0.3598950365349881,
+    -0.937339011912575, -0.34841868024943456, -0.9415440651830208,
+    -0.33688985339222005, -0.9456073253805213, -0.3253102921622629,
+    -0.9495281805930367, -0.3136817403988915, -0.9533060403541939,
+    -0.3020059493192281, -0.9569403357322088, -0.29028467725446233,
+    -0.9604305194155658, -0.27851968938505306, -0.9637760657954398,
+    -0.26671275747489837, -0.9669764710448521, -0.25486565960451457,
+    -0.970031253194544, -0.24298017990326387, -0.9729399522055602,
+    -0.2310581082806711, -0.9757021300385286, -0.2191012401568698,
+    -0.9783173707196277, -0.20711137619221856, -0.9807852804032304,
+    -0.19509032201612825, -0.9831054874312163, -0.18303988795514095,
+    -0.9852776423889412, -0.17096188876030122, -0.9873014181578584,
+    -0.15885814333386145, -0.989176509964781, -0.14673047445536175,
+    -0.99090263542778, -0.13458070850712617, -0.99247953459871,
+    -0.1224106751992162, -0.9939069700023561, -0.11022220729388306,
+    -0.9951847266721969, -0.0980171403295606, -0.996312612182778,
+    -0.0857973123444399, -0.9972904566786902, -0.07356456359966743,
+    -0.9981181129001492, -0.06132073630220858, -0.9987954562051724,
+    -0.049067674327418015, -0.9993223845883495, -0.03680722294135883,
+    -0.9996988186962042, -0.024541228522912288, -0.9999247018391445,
+    -0.012271538285719925
+]);
+const COMPACT_SCRATCH_RE = new Float64Array(512);
+const COMPACT_SCRATCH_IM = new Float64Array(512);
+
+//
+//  Public functions.
+//
+
+/**
+ *  Apply in-place mixed-radix FFT transform (prebuilt for block size 512).
+ * 
+ *  Note(s):
+ *    [1] The size of `re` and `im` will not be checked.
+ *    [2] The transform is done by the table-driven loop kernel (compact
+ *        mode), which is smaller but slower than the unrolled kernels.
+ * 
+ *  @param {Number[]} re 
+ *    - The real part of each point.
+ *  @param {Number[]} im 
+ *    - The imaginary part of each point.
+ */
+function ApplyMixedRadixFFT_512(re, im) {
+    MXCompact(re, im, COMPACT_RADICES, COMPACT_INDEXES, COMPACT_TWIDDLES, COMPACT_SCRATCH_RE, COMPACT_SCRATCH_IM);
+}
+
+//  Export public APIs.
+module.exports = {
+    "ApplyMixedRadixFFT_512": ApplyMixedRadixFFT_512
+};
\ No newline at end of file
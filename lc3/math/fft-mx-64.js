@@ -0,0 +1,2086 @@
+//
+//  Copyright 2021 - 2023 XiaoJSoft Studio. All rights reserved.
+//  Use of this source code is governed by a BSD-style license that can be
+//  found in the LICENSE.md file.
+//
+
+//
+//  Note(s):
+//    [1] This file is generated automatically by a FFT compiler, which locates 
+//        at "./../../dev/fft-mx-generator/" directory.
+//        Do NOT modify this file manually.
+//
+
+//
+//  Imports.
+//
+
+//  Imported modules.
+const Lc3FftMxBaseOp = 
+    require("./fft-mx-baseop");
+
+//  Imported functions.
+// const MXTr2 = 
+//     Lc3FftMxBaseOp.MXTr2;
+// const MXTr3 = 
+//     Lc3FftMxBaseOp.MXTr3;
+// const MXTr4 = 
+//     Lc3FftMxBaseOp.MXTr4;
+// const MXTr5 = 
+//     Lc3FftMxBaseOp.MXTr5;
+// const MXRot = 
+//     Lc3FftMxBaseOp.MXRot;
+const MXSwap = 
+    Lc3FftMxBaseOp.MXSwap;
+// const MXCshft = 
+//     Lc3FftMxBaseOp.MXCshft;
+// const MXCompact = 
+//     Lc3FftMxBaseOp.MXCompact;
+
+//
+//  Constants.
+//
+
+//  Output indexes of ApplyMixedRadixFFTPermuted_64() (the k-th output is stored at
+//  index MIXED_RADIX_FFT_OUTPUT_INDEXES_64[k]).
+const MIXED_RADIX_FFT_OUTPUT_INDEXES_64 = [0, 16, 32, 48, 4, 20, 36, 52, 8, 24, 40, 56, 12, 28, 44, 60, 1, 17, 33, 49, 5, 21, 37, 53, 9, 25, 41, 57, 13, 29, 45, 61, 2, 18, 34, 50, 6, 22, 38, 54, 10, 26, 42, 58, 14, 30, 46, 62, 3, 19, 35, 51, 7, 23, 39, 55, 11, 27, 43, 59, 15, 31, 47, 63];
+
+//
+//  Public functions.
+//
+
+/**
+ *  Apply in-place mixed-radix FFT transform (prebuilt for block size 64).
+ * 
+ *  Note(s):
+ *    [1] The size of `re` and `im` will not be checked.
+ * 
+ *  @param {Number[]} re 
+ *    - The real part of each point.
+ *  @param {Number[]} im 
+ *    - The imaginary part of each point.
+ */
+function ApplyMixedRadixFFT_64(re, im) {
+    ApplyMixedRadixFFTPermuted_64(re, im);
+    MXSwap(re, im, 1, 16);
+    MXSwap(re, im, 2, 32);
+    MXSwap(re, im, 3, 48);
+    MXSwap(re, im, 5, 20);
+    MXSwap(re, im, 6, 36);
+    MXSwap(re, im, 7, 52);
+    MXSwap(re, im, 9, 24);
+    MXSwap(re, im, 10, 40);
+    MXSwap(re, im, 11, 56);
+    MXSwap(re, im, 13, 28);
+    MXSwap(re, im, 14, 44);
+    MXSwap(re, im, 15, 60);
+    MXSwap(re, im, 18, 33);
+    MXSwap(re, im, 19, 49);
+    MXSwap(re, im, 22, 37);
+    MXSwap(re, im, 23, 53);
+    MXSwap(re, im, 26, 41);
+    MXSwap(re, im, 27, 57);
+    MXSwap(re, im, 30, 45);
+    MXSwap(re, im, 31, 61);
+    MXSwap(re, im, 35, 50);
+    MXSwap(re, im, 39, 54);
+    MXSwap(re, im, 43, 58);
+    MXSwap(re, im, 47, 62);
+}
+
+/**
+ *  Apply in-place mixed-radix FFT transform (prebuilt for block size 64),
+ *  without restoring the natural order of the outputs.
+ * 
+ *  Note(s):
+ *    [1] The size of `re` and `im` will not be checked.
+ *    [2] The k-th output is stored at index
+ *        MIXED_RADIX_FFT_OUTPUT_INDEXES_64[k].
+ * 
+ *  @param {Number[]} re 
+ *    - The real part of each point.
+ *  @param {Number[]} im 
+ *    - The imaginary part of each point.
+ */
+function ApplyMixedRadixFFTPermuted_64(re, im) {
+    let t0, t1, t10, t11, t2, t3, t4, t5, t6, t7, t8, t9;
+    const C0 = 0.9951847266721969;
+    const C1 = 0.0980171403295606;
+    const C2 = 0.9807852804032304;
+    const C3 = 0.19509032201612825;
+    const C4 = 0.9569403357322088;
+    const C5 = 0.29028467725446233;
+    const C6 = 0.9238795325112867;
+    const C7 = 0.3826834323650898;
+    const C8 = 0.8314696123025452;
+    const C9 = 0.5555702330196022;
+    const C10 = 0.6343932841636455;
+    const C11 = 0.773010453362737;
+    const C12 = 0.7071067811865476;
+    const C13 = 0.881921264348355;
+    const C14 = 0.47139673682599764;
+    t0 = re[0];
+    t1 = im[0];
+    t2 = re[16];
+    t3 = im[16];
+    t4 = re[32];
+    t5 = im[32];
+    t6 = re[48];
+    t7 = im[48];
+    t8 = t0 + t4;
+    t9 = t1 + t5;
+    t10 = t2 + t6;
+    t11 = t3 + t7;
+    t0 = t0 - t4;
+    t4 = t1 - t5;
+    t1 = t2 - t6;
+    t5 = t3 - t7;
+    t2 = t8 + t10;
+    t6 = t9 + t11;
+    t3 = t0 + t5;
+    t7 = t4 - t1;
+    t8 = t8 - t10;
+    t10 = t9 - t11;
+    t9 = t0 - t5;
+    t11 = t4 + t1;
+    re[0] = t2;
+    im[0] = t6;
+    re[16] = t3;
+    im[16] = t7;
+    re[32] = t8;
+    im[32] = t10;
+    re[48] = t9;
+    im[48] = t11;
+    t0 = re[1];
+    t5 = im[1];
+    t4 = re[17];
+    t1 = im[17];
+    t2 = re[33];
+    t6 = im[33];
+    t3 = re[49];
+    t7 = im[49];
+    t8 = t0 + t2;
+    t10 = t5 + t6;
+    t9 = t4 + t3;
+    t11 = t1 + t7;
+    t0 = t0 - t2;
+    t2 = t5 - t6;
+    t5 = t4 - t3;
+    t6 = t1 - t7;
+    t4 = t8 + t9;
+    t3 = t10 + t11;
+    t1 = t0 + t6;
+    t7 = t2 - t5;
+    t8 = t8 - t9;
+    t9 = t10 - t11;
+    t10 = t0 - t6;
+    t11 = t2 + t5;
+    t0 = C0 * t1;
+    t6 = (-C1) * t7;
+    t2 = C0 * t7;
+    t5 = (-C1) * t1;
+    t7 = t0 - t6;
+    t1 = t2 + t5;
+    t0 = C2 * t8;
+    t6 = (-C3) * t9;
+    t2 = C2 * t9;
+    t5 = (-C3) * t8;
+    t9 = t0 - t6;
+    t8 = t2 + t5;
+    t0 = C4 * t10;
+    t6 = (-C5) * t11;
+    t2 = C4 * t11;
+    t5 = (-C5) * t10;
+    t11 = t0 - t6;
+    t10 = t2 + t5;
+    re[1] = t4;
+    im[1] = t3;
+    re[17] = t7;
+    im[17] = t1;
+    re[33] = t9;
+    im[33] = t8;
+    re[49] = t11;
+    im[49] = t10;
+    t0 = re[2];
+    t6 = im[2];
+    t2 = re[18];
+    t5 = im[18];
+    t4 = re[34];
+    t3 = im[34];
+    t7 = re[50];
+    t1 = im[50];
+    t9 = t0 + t4;
+    t8 = t6 + t3;
+    t11 = t2 + t7;
+    t10 = t5 + t1;
+    t0 = t0 - t4;
+    t4 = t6 - t3;
+    t6 = t2 - t7;
+    t3 = t5 - t1;
+    t2 = t9 + t11;
+    t7 = t8 + t10;
+    t5 = t0 + t3;
+    t1 = t4 - t6;
+    t9 = t9 - t11;
+    t11 = t8 - t10;
+    t8 = t0 - t3;
+    t10 = t4 + t6;
+    t0 = C2 * t5;
+    t3 = (-C3) * t1;
+    t4 = C2 * t1;
+    t6 = (-C3) * t5;
+    t1 = t0 - t3;
+    t5 = t4 + t6;
+    t0 = C6 * t9;
+    t3 = (-C7) * t11;
+    t4 = C6 * t11;
+    t6 = (-C7) * t9;
+    t11 = t0 - t3;
+    t9 = t4 + t6;
+    t0 = C8 * t8;
+    t3 = (-C9) * t10;
+    t4 = C8 * t10;
+    t6 = (-C9) * t8;
+    t10 = t0 - t3;
+    t8 = t4 + t6;
+    re[2] = t2;
+    im[2] = t7;
+    re[18] = t1;
+    im[18] = t5;
+    re[34] = t11;
+    im[34] = t9;
+    re[50] = t10;
+    im[50] = t8;
+    t0 = re[3];
+    t3 = im[3];
+    t4 = re[19];
+    t6 = im[19];
+    t2 = re[35];
+    t7 = im[35];
+    t1 = re[51];
+    t5 = im[51];
+    t11 = t0 + t2;
+    t9 = t3 + t7;
+    t10 = t4 + t1;
+    t8 = t6 + t5;
+    t0 = t0 - t2;
+    t2 = t3 - t7;
+    t3 = t4 - t1;
+    t7 = t6 - t5;
+    t4 = t11 + t10;
+    t1 = t9 + t8;
+    t6 = t0 + t7;
+    t5 = t2 - t3;
+    t11 = t11 - t10;
+    t10 = t9 - t8;
+    t9 = t0 - t7;
+    t8 = t2 + t3;
+    t0 = C4 * t6;
+    t7 = (-C5) * t5;
+    t2 = C4 * t5;
+    t3 = (-C5) * t6;
+    t5 = t0 - t7;
+    t6 = t2 + t3;
+    t0 = C8 * t11;
+    t7 = (-C9) * t10;
+    t2 = C8 * t10;
+    t3 = (-C9) * t11;
+    t10 = t0 - t7;
+    t11 = t2 + t3;
+    t0 = C10 * t9;
+    t7 = (-C11) * t8;
+    t2 = C10 * t8;
+    t3 = (-C11) * t9;
+    t8 = t0 - t7;
+    t9 = t2 + t3;
+    re[3] = t4;
+    im[3] = t1;
+    re[19] = t5;
+    im[19] = t6;
+    re[35] = t10;
+    im[35] = t11;
+    re[51] = t8;
+    im[51] = t9;
+    t0 = re[4];
+    t7 = im[4];
+    t2 = re[20];
+    t3 = im[20];
+    t4 = re[36];
+    t1 = im[36];
+    t5 = re[52];
+    t6 = im[52];
+    t10 = t0 + t4;
+    t11 = t7 + t1;
+    t8 = t2 + t5;
+    t9 = t3 + t6;
+    t0 = t0 - t4;
+    t4 = t7 - t1;
+    t7 = t2 - t5;
+    t1 = t3 - t6;
+    t2 = t10 + t8;
+    t5 = t11 + t9;
+    t3 = t0 + t1;
+    t6 = t4 - t7;
+    t10 = t10 - t8;
+    t8 = t11 - t9;
+    t11 = t0 - t1;
+    t9 = t4 + t7;
+    t0 = C6 * t3;
+    t1 = (-C7) * t6;
+    t4 = C6 * t6;
+    t7 = (-C7) * t3;
+    t6 = t0 - t1;
+    t3 = t4 + t7;
+    t0 = t10 + t8;
+    t1 = t10 - t8;
+    t4 = C12 * t0;
+    t7 = (-C12) * t1;
+    t10 = C7 * t11;
+    t8 = (-C6) * t9;
+    t0 = C7 * t9;
+    t1 = (-C6) * t11;
+    t9 = t10 - t8;
+    t11 = t0 + t1;
+    re[4] = t2;
+    im[4] = t5;
+    re[20] = t6;
+    im[20] = t3;
+    re[36] = t4;
+    im[36] = t7;
+    re[52] = t9;
+    im[52] = t11;
+    t10 = re[5];
+    t8 = im[5];
+    t0 = re[21];
+    t1 = im[21];
+    t2 = re[37];
+    t5 = im[37];
+    t6 = re[53];
+    t3 = im[53];
+    t4 = t10 + t2;
+    t7 = t8 + t5;
+    t9 = t0 + t6;
+    t11 = t1 + t3;
+    t10 = t10 - t2;
+    t2 = t8 - t5;
+    t8 = t0 - t6;
+    t5 = t1 - t3;
+    t0 = t4 + t9;
+    t6 = t7 + t11;
+    t1 = t10 + t5;
+    t3 = t2 - t8;
+    t4 = t4 - t9;
+    t9 = t7 - t11;
+    t7 = t10 - t5;
+    t11 = t2 + t8;
+    t10 = C13 * t1;
+    t5 = (-C14) * t3;
+    t2 = C13 * t3;
+    t8 = (-C14) * t1;
+    t3 = t10 - t5;
+    t1 = t2 + t8;
+    t10 = C9 * t4;
+    t5 = (-C8) * t9;
+    t2 = C9 * t9;
+    t8 = (-C8) * t4;
+    t9 = t10 - t5;
+    t4 = t2 + t8;
+    t10 = C1 * t7;
+    t5 = (-C0) * t11;
+    t2 = C1 * t11;
+    t8 = (-C0) * t7;
+    t11 = t10 - t5;
+    t7 = t2 + t8;
+    re[5] = t0;
+    im[5] = t6;
+    re[21] = t3;
+    im[21] = t1;
+    re[37] = t9;
+    im[37] = t4;
+    re[53] = t11;
+    im[53] = t7;
+    t10 = re[6];
+    t5 = im[6];
+    t2 = re[22];
+    t8 = im[22];
+    t0 = re[38];
+    t6 = im[38];
+    t3 = re[54];
+    t1 = im[54];
+    t9 = t10 + t0;
+    t4 = t5 + t6;
+    t11 = t2 + t3;
+    t7 = t8 + t1;
+    t10 = t10 - t0;
+    t0 = t5 - t6;
+    t5 = t2 - t3;
+    t6 = t8 - t1;
+    t2 = t9 + t11;
+    t3 = t4 + t7;
+    t8 = t10 + t6;
+    t1 = t0 - t5;
+    t9 = t9 - t11;
+    t11 = t4 - t7;
+    t4 = t10 - t6;
+    t7 = t0 + t5;
+    t10 = C8 * t8;
+    t6 = (-C9) * t1;
+    t0 = C8 * t1;
+    t5 = (-C9) * t8;
+    t1 = t10 - t6;
+    t8 = t0 + t5;
+    t10 = C7 * t9;
+    t6 = (-C6) * t11;
+    t0 = C7 * t11;
+    t5 = (-C6) * t9;
+    t11 = t10 - t6;
+    t9 = t0 + t5;
+    t10 = (-C3) * t4;
+    t6 = (-C2) * t7;
+    t0 = (-C3) * t7;
+    t5 = (-C2) * t4;
+    t7 = t10 - t6;
+    t4 = t0 + t5;
+    re[6] = t2;
+    im[6] = t3;
+    re[22] = t1;
+    im[22] = t8;
+    re[38] = t11;
+    im[38] = t9;
+    re[54] = t7;
+    im[54] = t4;
+    t10 = re[7];
+    t6 = im[7];
+    t0 = re[23];
+    t5 = im[23];
+    t2 = re[39];
+    t3 = im[39];
+    t1 = re[55];
+    t8 = im[55];
+    t11 = t10 + t2;
+    t9 = t6 + t3;
+    t7 = t0 + t1;
+    t4 = t5 + t8;
+    t10 = t10 - t2;
+    t2 = t6 - t3;
+    t6 = t0 - t1;
+    t3 = t5 - t8;
+    t0 = t11 + t7;
+    t1 = t9 + t4;
+    t5 = t10 + t3;
+    t8 = t2 - t6;
+    t11 = t11 - t7;
+    t7 = t9 - t4;
+    t9 = t10 - t3;
+    t4 = t2 + t6;
+    t10 = C11 * t5;
+    t3 = (-C10) * t8;
+    t2 = C11 * t8;
+    t6 = (-C10) * t5;
+    t8 = t10 - t3;
+    t5 = t2 + t6;
+    t10 = C3 * t11;
+    t3 = (-C2) * t7;
+    t2 = C3 * t7;
+    t6 = (-C2) * t11;
+    t7 = t10 - t3;
+    t11 = t2 + t6;
+    t10 = (-C14) * t9;
+    t3 = (-C13) * t4;
+    t2 = (-C14) * t4;
+    t6 = (-C13) * t9;
+    t4 = t10 - t3;
+    t9 = t2 + t6;
+    re[7] = t0;
+    im[7] = t1;
+    re[23] = t8;
+    im[23] = t5;
+    re[39] = t7;
+    im[39] = t11;
+    re[55] = t4;
+    im[55] = t9;
+    t10 = re[8];
+    t3 = im[8];
+    t2 = re[24];
+    t6 = im[24];
+    t0 = re[40];
+    t1 = im[40];
+    t8 = re[56];
+    t5 = im[56];
+    t7 = t10 + t0;
+    t11 = t3 + t1;
+    t4 = t2 + t8;
+    t9 = t6 + t5;
+    t10 = t10 - t0;
+    t0 = t3 - t1;
+    t3 = t2 - t8;
+    t1 = t6 - t5;
+    t2 = t7 + t4;
+    t8 = t11 + t9;
+    t6 = t10 + t1;
+    t5 = t0 - t3;
+    t7 = t7 - t4;
+    t4 = t11 - t9;
+    t11 = t10 - t1;
+    t9 = t0 + t3;
+    t10 = t6 + t5;
+    t1 = t6 - t5;
+    t0 = C12 * t10;
+    t3 = (-C12) * t1;
+    t6 = -t7;
+    t5 = t11 - t9;
+    t10 = t11 + t9;
+    t1 = (-C12) * t5;
+    t7 = (-C12) * t10;
+    re[8] = t2;
+    im[8] = t8;
+    re[24] = t0;
+    im[24] = t3;
+    re[40] = t4;
+    im[40] = t6;
+    re[56] = t1;
+    im[56] = t7;
+    t11 = re[9];
+    t9 = im[9];
+    t5 = re[25];
+    t10 = im[25];
+    t2 = re[41];
+    t8 = im[41];
+    t0 = re[57];
+    t3 = im[57];
+    t4 = t11 + t2;
+    t6 = t9 + t8;
+    t1 = t5 + t0;
+    t7 = t10 + t3;
+    t11 = t11 - t2;
+    t2 = t9 - t8;
+    t9 = t5 - t0;
+    t8 = t10 - t3;
+    t5 = t4 + t1;
+    t0 = t6 + t7;
+    t10 = t11 + t8;
+    t3 = t2 - t9;
+    t4 = t4 - t1;
+    t1 = t6 - t7;
+    t6 = t11 - t8;
+    t7 = t2 + t9;
+    t11 = C10 * t10;
+    t8 = (-C11) * t3;
+    t2 = C10 * t3;
+    t9 = (-C11) * t10;
+    t3 = t11 - t8;
+    t10 = t2 + t9;
+    t11 = (-C3) * t4;
+    t8 = (-C2) * t1;
+    t2 = (-C3) * t1;
+    t9 = (-C2) * t4;
+    t1 = t11 - t8;
+    t4 = t2 + t9;
+    t11 = (-C13) * t6;
+    t8 = (-C14) * t7;
+    t2 = (-C13) * t7;
+    t9 = (-C14) * t6;
+    t7 = t11 - t8;
+    t6 = t2 + t9;
+    re[9] = t5;
+    im[9] = t0;
+    re[25] = t3;
+    im[25] = t10;
+    re[41] = t1;
+    im[41] = t4;
+    re[57] = t7;
+    im[57] = t6;
+    t11 = re[10];
+    t8 = im[10];
+    t2 = re[26];
+    t9 = im[26];
+    t5 = re[42];
+    t0 = im[42];
+    t3 = re[58];
+    t10 = im[58];
+    t1 = t11 + t5;
+    t4 = t8 + t0;
+    t7 = t2 + t3;
+    t6 = t9 + t10;
+    t11 = t11 - t5;
+    t5 = t8 - t0;
+    t8 = t2 - t3;
+    t0 = t9 - t10;
+    t2 = t1 + t7;
+    t3 = t4 + t6;
+    t9 = t11 + t0;
+    t10 = t5 - t8;
+    t1 = t1 - t7;
+    t7 = t4 - t6;
+    t4 = t11 - t0;
+    t6 = t5 + t8;
+    t11 = C9 * t9;
+    t0 = (-C8) * t10;
+    t5 = C9 * t10;
+    t8 = (-C8) * t9;
+    t10 = t11 - t0;
+    t9 = t5 + t8;
+    t11 = (-C7) * t1;
+    t0 = (-C6) * t7;
+    t5 = (-C7) * t7;
+    t8 = (-C6) * t1;
+    t7 = t11 - t0;
+    t1 = t5 + t8;
+    t11 = (-C2) * t4;
+    t0 = (-C3) * t6;
+    t5 = (-C2) * t6;
+    t8 = (-C3) * t4;
+    t6 = t11 - t0;
+    t4 = t5 + t8;
+    re[10] = t2;
+    im[10] = t3;
+    re[26] = t10;
+    im[26] = t9;
+    re[42] = t7;
+    im[42] = t1;
+    re[58] = t6;
+    im[58] = t4;
+    t11 = re[11];
+    t0 = im[11];
+    t5 = re[27];
+    t8 = im[27];
+    t2 = re[43];
+    t3 = im[43];
+    t10 = re[59];
+    t9 = im[59];
+    t7 = t11 + t2;
+    t1 = t0 + t3;
+    t6 = t5 + t10;
+    t4 = t8 + t9;
+    t11 = t11 - t2;
+    t2 = t0 - t3;
+    t0 = t5 - t10;
+    t3 = t8 - t9;
+    t5 = t7 + t6;
+    t10 = t1 + t4;
+    t8 = t11 + t3;
+    t9 = t2 - t0;
+    t7 = t7 - t6;
+    t6 = t1 - t4;
+    t1 = t11 - t3;
+    t4 = t2 + t0;
+    t11 = C14 * t8;
+    t3 = (-C13) * t9;
+    t2 = C14 * t9;
+    t0 = (-C13) * t8;
+    t9 = t11 - t3;
+    t8 = t2 + t0;
+    t11 = (-C9) * t7;
+    t3 = (-C8) * t6;
+    t2 = (-C9) * t6;
+    t0 = (-C8) * t7;
+    t6 = t11 - t3;
+    t7 = t2 + t0;
+    t11 = (-C0) * t1;
+    t3 = C1 * t4;
+    t2 = (-C0) * t4;
+    t0 = C1 * t1;
+    t4 = t11 - t3;
+    t1 = t2 + t0;
+    re[11] = t5;
+    im[11] = t10;
+    re[27] = t9;
+    im[27] = t8;
+    re[43] = t6;
+    im[43] = t7;
+    re[59] = t4;
+    im[59] = t1;
+    t11 = re[12];
+    t3 = im[12];
+    t2 = re[28];
+    t0 = im[28];
+    t5 = re[44];
+    t10 = im[44];
+    t9 = re[60];
+    t8 = im[60];
+    t6 = t11 + t5;
+    t7 = t3 + t10;
+    t4 = t2 + t9;
+    t1 = t0 + t8;
+    t11 = t11 - t5;
+    t5 = t3 - t10;
+    t3 = t2 - t9;
+    t10 = t0 - t8;
+    t2 = t6 + t4;
+    t9 = t7 + t1;
+    t0 = t11 + t10;
+    t8 = t5 - t3;
+    t6 = t6 - t4;
+    t4 = t7 - t1;
+    t7 = t11 - t10;
+    t1 = t5 + t3;
+    t11 = C7 * t0;
+    t10 = (-C6) * t8;
+    t5 = C7 * t8;
+    t3 = (-C6) * t0;
+    t8 = t11 - t10;
+    t0 = t5 + t3;
+    t11 = t6 - t4;
+    t10 = t6 + t4;
+    t5 = (-C12) * t11;
+    t3 = (-C12) * t10;
+    t6 = (-C6) * t7;
+    t4 = C7 * t1;
+    t11 = (-C6) * t1;
+    t10 = C7 * t7;
+    t1 = t6 - t4;
+    t7 = t11 + t10;
+    re[12] = t2;
+    im[12] = t9;
+    re[28] = t8;
+    im[28] = t0;
+    re[44] = t5;
+    im[44] = t3;
+    re[60] = t1;
+    im[60] = t7;
+    t6 = re[13];
+    t4 = im[13];
+    t11 = re[29];
+    t10 = im[29];
+    t2 = re[45];
+    t9 = im[45];
+    t8 = re[61];
+    t0 = im[61];
+    t5 = t6 + t2;
+    t3 = t4 + t9;
+    t1 = t11 + t8;
+    t7 = t10 + t0;
+    t6 = t6 - t2;
+    t2 = t4 - t9;
+    t4 = t11 - t8;
+    t9 = t10 - t0;
+    t11 = t5 + t1;
+    t8 = t3 + t7;
+    t10 = t6 + t9;
+    t0 = t2 - t4;
+    t5 = t5 - t1;
+    t1 = t3 - t7;
+    t3 = t6 - t9;
+    t7 = t2 + t4;
+    t6 = C5 * t10;
+    t9 = (-C4) * t0;
+    t2 = C5 * t0;
+    t4 = (-C4) * t10;
+    t0 = t6 - t9;
+    t10 = t2 + t4;
+    t6 = (-C8) * t5;
+    t9 = (-C9) * t1;
+    t2 = (-C8) * t1;
+    t4 = (-C9) * t5;
+    t1 = t6 - t9;
+    t5 = t2 + t4;
+    t6 = (-C11) * t3;
+    t9 = C10 * t7;
+    t2 = (-C11) * t7;
+    t4 = C10 * t3;
+    t7 = t6 - t9;
+    t3 = t2 + t4;
+    re[13] = t11;
+    im[13] = t8;
+    re[29] = t0;
+    im[29] = t10;
+    re[45] = t1;
+    im[45] = t5;
+    re[61] = t7;
+    im[61] = t3;
+    t6 = re[14];
+    t9 = im[14];
+    t2 = re[30];
+    t4 = im[30];
+    t11 = re[46];
+    t8 = im[46];
+    t0 = re[62];
+    t10 = im[62];
+    t1 = t6 + t11;
+    t5 = t9 + t8;
+    t7 = t2 + t0;
+    t3 = t4 + t10;
+    t6 = t6 - t11;
+    t11 = t9 - t8;
+    t9 = t2 - t0;
+    t8 = t4 - t10;
+    t2 = t1 + t7;
+    t0 = t5 + t3;
+    t4 = t6 + t8;
+    t10 = t11 - t9;
+    t1 = t1 - t7;
+    t7 = t5 - t3;
+    t5 = t6 - t8;
+    t3 = t11 + t9;
+    t6 = C3 * t4;
+    t8 = (-C2) * t10;
+    t11 = C3 * t10;
+    t9 = (-C2) * t4;
+    t10 = t6 - t8;
+    t4 = t11 + t9;
+    t6 = (-C6) * t1;
+    t8 = (-C7) * t7;
+    t11 = (-C6) * t7;
+    t9 = (-C7) * t1;
+    t7 = t6 - t8;
+    t1 = t11 + t9;
+    t6 = (-C9) * t5;
+    t8 = C8 * t3;
+    t11 = (-C9) * t3;
+    t9 = C8 * t5;
+    t3 = t6 - t8;
+    t5 = t11 + t9;
+    re[14] = t2;
+    im[14] = t0;
+    re[30] = t10;
+    im[30] = t4;
+    re[46] = t7;
+    im[46] = t1;
+    re[62] = t3;
+    im[62] = t5;
+    t6 = re[15];
+    t8 = im[15];
+    t11 = re[31];
+    t9 = im[31];
+    t2 = re[47];
+    t0 = im[47];
+    t10 = re[63];
+    t4 = im[63];
+    t7 = t6 + t2;
+    t1 = t8 + t0;
+    t3 = t11 + t10;
+    t5 = t9 + t4;
+    t6 = t6 - t2;
+    t2 = t8 - t0;
+    t8 = t11 - t10;
+    t0 = t9 - t4;
+    t11 = t7 + t3;
+    t10 = t1 + t5;
+    t9 = t6 + t0;
+    t4 = t2 - t8;
+    t7 = t7 - t3;
+    t3 = t1 - t5;
+    t1 = t6 - t0;
+    t5 = t2 + t8;
+    t6 = C1 * t9;
+    t0 = (-C0) * t4;
+    t2 = C1 * t4;
+    t8 = (-C0) * t9;
+    t4 = t6 - t0;
+    t9 = t2 + t8;
+    t6 = (-C2) * t7;
+    t0 = (-C3) * t3;
+    t2 = (-C2) * t3;
+    t8 = (-C3) * t7;
+    t3 = t6 - t0;
+    t7 = t2 + t8;
+    t6 = (-C5) * t1;
+    t0 = C4 * t5;
+    t2 = (-C5) * t5;
+    t8 = C4 * t1;
+    t5 = t6 - t0;
+    t1 = t2 + t8;
+    re[15] = t11;
+    im[15] = t10;
+    re[31] = t4;
+    im[31] = t9;
+    re[47] = t3;
+    im[47] = t7;
+    re[63] = t5;
+    im[63] = t1;
+    t6 = re[0];
+    t0 = im[0];
+    t2 = re[4];
+    t8 = im[4];
+    t11 = re[8];
+    t10 = im[8];
+    t4 = re[12];
+    t9 = im[12];
+    t3 = t6 + t11;
+    t7 = t0 + t10;
+    t5 = t2 + t4;
+    t1 = t8 + t9;
+    t6 = t6 - t11;
+    t11 = t0 - t10;
+    t0 = t2 - t4;
+    t10 = t8 - t9;
+    t2 = t3 + t5;
+    t4 = t7 + t1;
+    t8 = t6 + t10;
+    t9 = t11 - t0;
+    t3 = t3 - t5;
+    t5 = t7 - t1;
+    t7 = t6 - t10;
+    t1 = t11 + t0;
+    re[0] = t2;
+    im[0] = t4;
+    re[4] = t8;
+    im[4] = t9;
+    re[8] = t3;
+    im[8] = t5;
+    re[12] = t7;
+    im[12] = t1;
+    t6 = re[1];
+    t10 = im[1];
+    t11 = re[5];
+    t0 = im[5];
+    t2 = re[9];
+    t4 = im[9];
+    t8 = re[13];
+    t9 = im[13];
+    t3 = t6 + t2;
+    t5 = t10 + t4;
+    t7 = t11 + t8;
+    t1 = t0 + t9;
+    t6 = t6 - t2;
+    t2 = t10 - t4;
+    t10 = t11 - t8;
+    t4 = t0 - t9;
+    t11 = t3 + t7;
+    t8 = t5 + t1;
+    t0 = t6 + t4;
+    t9 = t2 - t10;
+    t3 = t3 - t7;
+    t7 = t5 - t1;
+    t5 = t6 - t4;
+    t1 = t2 + t10;
+    t6 = C6 * t0;
+    t4 = (-C7) * t9;
+    t2 = C6 * t9;
+    t10 = (-C7) * t0;
+    t9 = t6 - t4;
+    t0 = t2 + t10;
+    t6 = t3 + t7;
+    t4 = t3 - t7;
+    t2 = C12 * t6;
+    t10 = (-C12) * t4;
+    t3 = C7 * t5;
+    t7 = (-C6) * t1;
+    t6 = C7 * t1;
+    t4 = (-C6) * t5;
+    t1 = t3 - t7;
+    t5 = t6 + t4;
+    re[1] = t11;
+    im[1] = t8;
+    re[5] = t9;
+    im[5] = t0;
+    re[9] = t2;
+    im[9] = t10;
+    re[13] = t1;
+    im[13] = t5;
+    t3 = re[2];
+    t7 = im[2];
+    t6 = re[6];
+    t4 = im[6];
+    t11 = re[10];
+    t8 = im[10];
+    t9 = re[14];
+    t0 = im[14];
+    t2 = t3 + t11;
+    t10 = t7 + t8;
+    t1 = t6 + t9;
+    t5 = t4 + t0;
+    t3 = t3 - t11;
+    t11 = t7 - t8;
+    t7 = t6 - t9;
+    t8 = t4 - t0;
+    t6 = t2 + t1;
+    t9 = t10 + t5;
+    t4 = t3 + t8;
+    t0 = t11 - t7;
+    t2 = t2 - t1;
+    t1 = t10 - t5;
+    t10 = t3 - t8;
+    t5 = t11 + t7;
+    t3 = t4 + t0;
+    t8 = t4 - t0;
+    t11 = C12 * t3;
+    t7 = (-C12) * t8;
+    t4 = -t2;
+    t0 = t10 - t5;
+    t3 = t10 + t5;
+    t8 = (-C12) * t0;
+    t2 = (-C12) * t3;
+    re[2] = t6;
+    im[2] = t9;
+    re[6] = t11;
+    im[6] = t7;
+    re[10] = t1;
+    im[10] = t4;
+    re[14] = t8;
+    im[14] = t2;
+    t10 = re[3];
+    t5 = im[3];
+    t0 = re[7];
+    t3 = im[7];
+    t6 = re[11];
+    t9 = im[11];
+    t11 = re[15];
+    t7 = im[15];
+    t1 = t10 + t6;
+    t4 = t5 + t9;
+    t8 = t0 + t11;
+    t2 = t3 + t7;
+    t10 = t10 - t6;
+    t6 = t5 - t9;
+    t5 = t0 - t11;
+    t9 = t3 - t7;
+    t0 = t1 + t8;
+    t11 = t4 + t2;
+    t3 = t10 + t9;
+    t7 = t6 - t5;
+    t1 = t1 - t8;
+    t8 = t4 - t2;
+    t4 = t10 - t9;
+    t2 = t6 + t5;
+    t10 = C7 * t3;
+    t9 = (-C6) * t7;
+    t6 = C7 * t7;
+    t5 = (-C6) * t3;
+    t7 = t10 - t9;
+    t3 = t6 + t5;
+    t10 = t1 - t8;
+    t9 = t1 + t8;
+    t6 = (-C12) * t10;
+    t5 = (-C12) * t9;
+    t1 = (-C6) * t4;
+    t8 = C7 * t2;
+    t10 = (-C6) * t2;
+    t9 = C7 * t4;
+    t2 = t1 - t8;
+    t4 = t10 + t9;
+    re[3] = t0;
+    im[3] = t11;
+    re[7] = t7;
+    im[7] = t3;
+    re[11] = t6;
+    im[11] = t5;
+    re[15] = t2;
+    im[15] = t4;
+    t1 = re[0];
+    t8 = im[0];
+    t10 = re[1];
+    t9 = im[1];
+    t0 = re[2];
+    t11 = im[2];
+    t7 = re[3];
+    t3 = im[3];
+    t6 = t1 + t0;
+    t5 = t8 + t11;
+    t2 = t10 + t7;
+    t4 = t9 + t3;
+    t1 = t1 - t0;
+    t0 = t8 - t11;
+    t8 = t10 - t7;
+    t11 = t9 - t3;
+    t10 = t6 + t2;
+    t7 = t5 + t4;
+    t9 = t1 + t11;
+    t3 = t0 - t8;
+    t6 = t6 - t2;
+    t2 = t5 - t4;
+    t5 = t1 - t11;
+    t4 = t0 + t8;
+    re[0] = t10;
+    im[0] = t7;
+    re[1] = t9;
+    im[1] = t3;
+    re[2] = t6;
+    im[2] = t2;
+    re[3] = t5;
+    im[3] = t4;
+    t1 = re[4];
+    t11 = im[4];
+    t0 = re[5];
+    t8 = im[5];
+    t10 = re[6];
+    t7 = im[6];
+    t9 = re[7];
+    t3 = im[7];
+    t6 = t1 + t10;
+    t2 = t11 + t7;
+    t5 = t0 + t9;
+    t4 = t8 + t3;
+    t1 = t1 - t10;
+    t10 = t11 - t7;
+    t11 = t0 - t9;
+    t7 = t8 - t3;
+    t0 = t6 + t5;
+    t9 = t2 + t4;
+    t8 = t1 + t7;
+    t3 = t10 - t11;
+    t6 = t6 - t5;
+    t5 = t2 - t4;
+    t2 = t1 - t7;
+    t4 = t10 + t11;
+    re[4] = t0;
+    im[4] = t9;
+    re[5] = t8;
+    im[5] = t3;
+    re[6] = t6;
+    im[6] = t5;
+    re[7] = t2;
+    im[7] = t4;
+    t1 = re[8];
+    t7 = im[8];
+    t10 = re[9];
+    t11 = im[9];
+    t0 = re[10];
+    t9 = im[10];
+    t8 = re[11];
+    t3 = im[11];
+    t6 = t1 + t0;
+    t5 = t7 + t9;
+    t2 = t10 + t8;
+    t4 = t11 + t3;
+    t1 = t1 - t0;
+    t0 = t7 - t9;
+    t7 = t10 - t8;
+    t9 = t11 - t3;
+    t10 = t6 + t2;
+    t8 = t5 + t4;
+    t11 = t1 + t9;
+    t3 = t0 - t7;
+    t6 = t6 - t2;
+    t2 = t5 - t4;
+    t5 = t1 - t9;
+    t4 = t0 + t7;
+    re[8] = t10;
+    im[8] = t8;
+    re[9] = t11;
+    im[9] = t3;
+    re[10] = t6;
+    im[10] = t2;
+    re[11] = t5;
+    im[11] = t4;
+    t1 = re[12];
+    t9 = im[12];
+    t0 = re[13];
+    t7 = im[13];
+    t10 = re[14];
+    t8 = im[14];
+    t11 = re[15];
+    t3 = im[15];
+    t6 = t1 + t10;
+    t2 = t9 + t8;
+    t5 = t0 + t11;
+    t4 = t7 + t3;
+    t1 = t1 - t10;
+    t10 = t9 - t8;
+    t9 = t0 - t11;
+    t8 = t7 - t3;
+    t0 = t6 + t5;
+    t11 = t2 + t4;
+    t7 = t1 + t8;
+    t3 = t10 - t9;
+    t6 = t6 - t5;
+    t5 = t2 - t4;
+    t2 = t1 - t8;
+    t4 = t10 + t9;
+    re[12] = t0;
+    im[12] = t11;
+    re[13] = t7;
+    im[13] = t3;
+    re[14] = t6;
+    im[14] = t5;
+    re[15] = t2;
+    im[15] = t4;
+    t1 = re[16];
+    t8 = im[16];
+    t10 = re[20];
+    t9 = im[20];
+    t0 = re[24];
+    t11 = im[24];
+    t7 = re[28];
+    t3 = im[28];
+    t6 = t1 + t0;
+    t5 = t8 + t11;
+    t2 = t10 + t7;
+    t4 = t9 + t3;
+    t1 = t1 - t0;
+    t0 = t8 - t11;
+    t8 = t10 - t7;
+    t11 = t9 - t3;
+    t10 = t6 + t2;
+    t7 = t5 + t4;
+    t9 = t1 + t11;
+    t3 = t0 - t8;
+    t6 = t6 - t2;
+    t2 = t5 - t4;
+    t5 = t1 - t11;
+    t4 = t0 + t8;
+    re[16] = t10;
+    im[16] = t7;
+    re[20] = t9;
+    im[20] = t3;
+    re[24] = t6;
+    im[24] = t2;
+    re[28] = t5;
+    im[28] = t4;
+    t1 = re[17];
+    t11 = im[17];
+    t0 = re[21];
+    t8 = im[21];
+    t10 = re[25];
+    t7 = im[25];
+    t9 = re[29];
+    t3 = im[29];
+    t6 = t1 + t10;
+    t2 = t11 + t7;
+    t5 = t0 + t9;
+    t4 = t8 + t3;
+    t1 = t1 - t10;
+    t10 = t11 - t7;
+    t11 = t0 - t9;
+    t7 = t8 - t3;
+    t0 = t6 + t5;
+    t9 = t2 + t4;
+    t8 = t1 + t7;
+    t3 = t10 - t11;
+    t6 = t6 - t5;
+    t5 = t2 - t4;
+    t2 = t1 - t7;
+    t4 = t10 + t11;
+    t1 = C6 * t8;
+    t7 = (-C7) * t3;
+    t10 = C6 * t3;
+    t11 = (-C7) * t8;
+    t3 = t1 - t7;
+    t8 = t10 + t11;
+    t1 = t6 + t5;
+    t7 = t6 - t5;
+    t10 = C12 * t1;
+    t11 = (-C12) * t7;
+    t6 = C7 * t2;
+    t5 = (-C6) * t4;
+    t1 = C7 * t4;
+    t7 = (-C6) * t2;
+    t4 = t6 - t5;
+    t2 = t1 + t7;
+    re[17] = t0;
+    im[17] = t9;
+    re[21] = t3;
+    im[21] = t8;
+    re[25] = t10;
+    im[25] = t11;
+    re[29] = t4;
+    im[29] = t2;
+    t6 = re[18];
+    t5 = im[18];
+    t1 = re[22];
+    t7 = im[22];
+    t0 = re[26];
+    t9 = im[26];
+    t3 = re[30];
+    t8 = im[30];
+    t10 = t6 + t0;
+    t11 = t5 + t9;
+    t4 = t1 + t3;
+    t2 = t7 + t8;
+    t6 = t6 - t0;
+    t0 = t5 - t9;
+    t5 = t1 - t3;
+    t9 = t7 - t8;
+    t1 = t10 + t4;
+    t3 = t11 + t2;
+    t7 = t6 + t9;
+    t8 = t0 - t5;
+    t10 = t10 - t4;
+    t4 = t11 - t2;
+    t11 = t6 - t9;
+    t2 = t0 + t5;
+    t6 = t7 + t8;
+    t9 = t7 - t8;
+    t0 = C12 * t6;
+    t5 = (-C12) * t9;
+    t7 = -t10;
+    t8 = t11 - t2;
+    t6 = t11 + t2;
+    t9 = (-C12) * t8;
+    t10 = (-C12) * t6;
+    re[18] = t1;
+    im[18] = t3;
+    re[22] = t0;
+    im[22] = t5;
+    re[26] = t4;
+    im[26] = t7;
+    re[30] = t9;
+    im[30] = t10;
+    t11 = re[19];
+    t2 = im[19];
+    t8 = re[23];
+    t6 = im[23];
+    t1 = re[27];
+    t3 = im[27];
+    t0 = re[31];
+    t5 = im[31];
+    t4 = t11 + t1;
+    t7 = t2 + t3;
+    t9 = t8 + t0;
+    t10 = t6 + t5;
+    t11 = t11 - t1;
+    t1 = t2 - t3;
+    t2 = t8 - t0;
+    t3 = t6 - t5;
+    t8 = t4 + t9;
+    t0 = t7 + t10;
+    t6 = t11 + t3;
+    t5 = t1 - t2;
+    t4 = t4 - t9;
+    t9 = t7 - t10;
+    t7 = t11 - t3;
+    t10 = t1 + t2;
+    t11 = C7 * t6;
+    t3 = (-C6) * t5;
+    t1 = C7 * t5;
+    t2 = (-C6) * t6;
+    t5 = t11 - t3;
+    t6 = t1 + t2;
+    t11 = t4 - t9;
+    t3 = t4 + t9;
+    t1 = (-C12) * t11;
+    t2 = (-C12) * t3;
+    t4 = (-C6) * t7;
+    t9 = C7 * t10;
+    t11 = (-C6) * t10;
+    t3 = C7 * t7;
+    t10 = t4 - t9;
+    t7 = t11 + t3;
+    re[19] = t8;
+    im[19] = t0;
+    re[23] = t5;
+    im[23] = t6;
+    re[27] = t1;
+    im[27] = t2;
+    re[31] = t10;
+    im[31] = t7;
+    t4 = re[16];
+    t9 = im[16];
+    t11 = re[17];
+    t3 = im[17];
+    t8 = re[18];
+    t0 = im[18];
+    t5 = re[19];
+    t6 = im[19];
+    t1 = t4 + t8;
+    t2 = t9 + t0;
+    t10 = t11 + t5;
+    t7 = t3 + t6;
+    t4 = t4 - t8;
+    t8 = t9 - t0;
+    t9 = t11 - t5;
+    t0 = t3 - t6;
+    t11 = t1 + t10;
+    t5 = t2 + t7;
+    t3 = t4 + t0;
+    t6 = t8 - t9;
+    t1 = t1 - t10;
+    t10 = t2 - t7;
+    t2 = t4 - t0;
+    t7 = t8 + t9;
+    re[16] = t11;
+    im[16] = t5;
+    re[17] = t3;
+    im[17] = t6;
+    re[18] = t1;
+    im[18] = t10;
+    re[19] = t2;
+    im[19] = t7;
+    t4 = re[20];
+    t0 = im[20];
+    t8 = re[21];
+    t9 = im[21];
+    t11 = re[22];
+    t5 = im[22];
+    t3 = re[23];
+    t6 = im[23];
+    t1 = t4 + t11;
+    t10 = t0 + t5;
+    t2 = t8 + t3;
+    t7 = t9 + t6;
+    t4 = t4 - t11;
+    t11 = t0 - t5;
+    t0 = t8 - t3;
+    t5 = t9 - t6;
+    t8 = t1 + t2;
+    t3 = t10 + t7;
+    t9 = t4 + t5;
+    t6 = t11 - t0;
+    t1 = t1 - t2;
+    t2 = t10 - t7;
+    t10 = t4 - t5;
+    t7 = t11 + t0;
+    re[20] = t8;
+    im[20] = t3;
+    re[21] = t9;
+    im[21] = t6;
+    re[22] = t1;
+    im[22] = t2;
+    re[23] = t10;
+    im[23] = t7;
+    t4 = re[24];
+    t5 = im[24];
+    t11 = re[25];
+    t0 = im[25];
+    t8 = re[26];
+    t3 = im[26];
+    t9 = re[27];
+    t6 = im[27];
+    t1 = t4 + t8;
+    t2 = t5 + t3;
+    t10 = t11 + t9;
+    t7 = t0 + t6;
+    t4 = t4 - t8;
+    t8 = t5 - t3;
+    t5 = t11 - t9;
+    t3 = t0 - t6;
+    t11 = t1 + t10;
+    t9 = t2 + t7;
+    t0 = t4 + t3;
+    t6 = t8 - t5;
+    t1 = t1 - t10;
+    t10 = t2 - t7;
+    t2 = t4 - t3;
+    t7 = t8 + t5;
+    re[24] = t11;
+    im[24] = t9;
+    re[25] = t0;
+    im[25] = t6;
+    re[26] = t1;
+    im[26] = t10;
+    re[27] = t2;
+    im[27] = t7;
+    t4 = re[28];
+    t3 = im[28];
+    t8 = re[29];
+    t5 = im[29];
+    t11 = re[30];
+    t9 = im[30];
+    t0 = re[31];
+    t6 = im[31];
+    t1 = t4 + t11;
+    t10 = t3 + t9;
+    t2 = t8 + t0;
+    t7 = t5 + t6;
+    t4 = t4 - t11;
+    t11 = t3 - t9;
+    t3 = t8 - t0;
+    t9 = t5 - t6;
+    t8 = t1 + t2;
+    t0 = t10 + t7;
+    t5 = t4 + t9;
+    t6 = t11 - t3;
+    t1 = t1 - t2;
+    t2 = t10 - t7;
+    t10 = t4 - t9;
+    t7 = t11 + t3;
+    re[28] = t8;
+    im[28] = t0;
+    re[29] = t5;
+    im[29] = t6;
+    re[30] = t1;
+    im[30] = t2;
+    re[31] = t10;
+    im[31] = t7;
+    t4 = re[32];
+    t9 = im[32];
+    t11 = re[36];
+    t3 = im[36];
+    t8 = re[40];
+    t0 = im[40];
+    t5 = re[44];
+    t6 = im[44];
+    t1 = t4 + t8;
+    t2 = t9 + t0;
+    t10 = t11 + t5;
+    t7 = t3 + t6;
+    t4 = t4 - t8;
+    t8 = t9 - t0;
+    t9 = t11 - t5;
+    t0 = t3 - t6;
+    t11 = t1 + t10;
+    t5 = t2 + t7;
+    t3 = t4 + t0;
+    t6 = t8 - t9;
+    t1 = t1 - t10;
+    t10 = t2 - t7;
+    t2 = t4 - t0;
+    t7 = t8 + t9;
+    re[32] = t11;
+    im[32] = t5;
+    re[36] = t3;
+    im[36] = t6;
+    re[40] = t1;
+    im[40] = t10;
+    re[44] = t2;
+    im[44] = t7;
+    t4 = re[33];
+    t0 = im[33];
+    t8 = re[37];
+    t9 = im[37];
+    t11 = re[41];
+    t5 = im[41];
+    t3 = re[45];
+    t6 = im[45];
+    t1 = t4 + t11;
+    t10 = t0 + t5;
+    t2 = t8 + t3;
+    t7 = t9 + t6;
+    t4 = t4 - t11;
+    t11 = t0 - t5;
+    t0 = t8 - t3;
+    t5 = t9 - t6;
+    t8 = t1 + t2;
+    t3 = t10 + t7;
+    t9 = t4 + t5;
+    t6 = t11 - t0;
+    t1 = t1 - t2;
+    t2 = t10 - t7;
+    t10 = t4 - t5;
+    t7 = t11 + t0;
+    t4 = C6 * t9;
+    t5 = (-C7) * t6;
+    t11 = C6 * t6;
+    t0 = (-C7) * t9;
+    t6 = t4 - t5;
+    t9 = t11 + t0;
+    t4 = t1 + t2;
+    t5 = t1 - t2;
+    t11 = C12 * t4;
+    t0 = (-C12) * t5;
+    t1 = C7 * t10;
+    t2 = (-C6) * t7;
+    t4 = C7 * t7;
+    t5 = (-C6) * t10;
+    t7 = t1 - t2;
+    t10 = t4 + t5;
+    re[33] = t8;
+    im[33] = t3;
+    re[37] = t6;
+    im[37] = t9;
+    re[41] = t11;
+    im[41] = t0;
+    re[45] = t7;
+    im[45] = t10;
+    t1 = re[34];
+    t2 = im[34];
+    t4 = re[38];
+    t5 = im[38];
+    t8 = re[42];
+    t3 = im[42];
+    t6 = re[46];
+    t9 = im[46];
+    t11 = t1 + t8;
+    t0 = t2 + t3;
+    t7 = t4 + t6;
+    t10 = t5 + t9;
+    t1 = t1 - t8;
+    t8 = t2 - t3;
+    t2 = t4 - t6;
+    t3 = t5 - t9;
+    t4 = t11 + t7;
+    t6 = t0 + t10;
+    t5 = t1 + t3;
+    t9 = t8 - t2;
+    t11 = t11 - t7;
+    t7 = t0 - t10;
+    t0 = t1 - t3;
+    t10 = t8 + t2;
+    t1 = t5 + t9;
+    t3 = t5 - t9;
+    t8 = C12 * t1;
+    t2 = (-C12) * t3;
+    t5 = -t11;
+    t9 = t0 - t10;
+    t1 = t0 + t10;
+    t3 = (-C12) * t9;
+    t11 = (-C12) * t1;
+    re[34] = t4;
+    im[34] = t6;
+    re[38] = t8;
+    im[38] = t2;
+    re[42] = t7;
+    im[42] = t5;
+    re[46] = t3;
+    im[46] = t11;
+    t0 = re[35];
+    t10 = im[35];
+    t9 = re[39];
+    t1 = im[39];
+    t4 = re[43];
+    t6 = im[43];
+    t8 = re[47];
+    t2 = im[47];
+    t7 = t0 + t4;
+    t5 = t10 + t6;
+    t3 = t9 + t8;
+    t11 = t1 + t2;
+    t0 = t0 - t4;
+    t4 = t10 - t6;
+    t10 = t9 - t8;
+    t6 = t1 - t2;
+    t9 = t7 + t3;
+    t8 = t5 + t11;
+    t1 = t0 + t6;
+    t2 = t4 - t10;
+    t7 = t7 - t3;
+    t3 = t5 - t11;
+    t5 = t0 - t6;
+    t11 = t4 + t10;
+    t0 = C7 * t1;
+    t6 = (-C6) * t2;
+    t4 = C7 * t2;
+    t10 = (-C6) * t1;
+    t2 = t0 - t6;
+    t1 = t4 + t10;
+    t0 = t7 - t3;
+    t6 = t7 + t3;
+    t4 = (-C12) * t0;
+    t10 = (-C12) * t6;
+    t7 = (-C6) * t5;
+    t3 = C7 * t11;
+    t0 = (-C6) * t11;
+    t6 = C7 * t5;
+    t11 = t7 - t3;
+    t5 = t0 + t6;
+    re[35] = t9;
+    im[35] = t8;
+    re[39] = t2;
+    im[39] = t1;
+    re[43] = t4;
+    im[43] = t10;
+    re[47] = t11;
+    im[47] = t5;
+    t7 = re[32];
+    t3 = im[32];
+    t0 = re[33];
+    t6 = im[33];
+    t9 = re[34];
+    t8 = im[34];
+    t2 = re[35];
+    t1 = im[35];
+    t4 = t7 + t9;
+    t10 = t3 + t8;
+    t11 = t0 + t2;
+    t5 = t6 + t1;
+    t7 = t7 - t9;
+    t9 = t3 - t8;
+    t3 = t0 - t2;
+    t8 = t6 - t1;
+    t0 = t4 + t11;
+    t2 = t10 + t5;
+    t6 = t7 + t8;
+    t1 = t9 - t3;
+    t4 = t4 - t11;
+    t11 = t10 - t5;
+    t10 = t7 - t8;
+    t5 = t9 + t3;
+    re[32] = t0;
+    im[32] = t2;
+    re[33] = t6;
+    im[33] = t1;
+    re[34] = t4;
+    im[34] = t11;
+    re[35] = t10;
+    im[35] = t5;
+    t7 = re[36];
+    t8 = im[36];
+    t9 = re[37];
+    t3 = im[37];
+    t0 = re[38];
+    t2 = im[38];
+    t6 = re[39];
+    t1 = im[39];
+    t4 = t7 + t0;
+    t11 = t8 + t2;
+    t10 = t9 + t6;
+    t5 = t3 + t1;
+    t7 = t7 - t0;
+    t0 = t8 - t2;
+    t8 = t9 - t6;
+    t2 = t3 - t1;
+    t9 = t4 + t10;
+    t6 = t11 + t5;
+    t3 = t7 + t2;
+    t1 = t0 - t8;
+    t4 = t4 - t10;
+    t10 = t11 - t5;
+    t11 = t7 - t2;
+    t5 = t0 + t8;
+    re[36] = t9;
+    im[36] = t6;
+    re[37] = t3;
+    im[37] = t1;
+    re[38] = t4;
+    im[38] = t10;
+    re[39] = t11;
+    im[39] = t5;
+    t7 = re[40];
+    t2 = im[40];
+    t0 = re[41];
+    t8 = im[41];
+    t9 = re[42];
+    t6 = im[42];
+    t3 = re[43];
+    t1 = im[43];
+    t4 = t7 + t9;
+    t10 = t2 + t6;
+    t11 = t0 + t3;
+    t5 = t8 + t1;
+    t7 = t7 - t9;
+    t9 = t2 - t6;
+    t2 = t0 - t3;
+    t6 = t8 - t1;
+    t0 = t4 + t11;
+    t3 = t10 + t5;
+    t8 = t7 + t6;
+    t1 = t9 - t2;
+    t4 = t4 - t11;
+    t11 = t10 - t5;
+    t10 = t7 - t6;
+    t5 = t9 + t2;
+    re[40] = t0;
+    im[40] = t3;
+    re[41] = t8;
+    im[41] = t1;
+    re[42] = t4;
+    im[42] = t11;
+    re[43] = t10;
+    im[43] = t5;
+    t7 = re[44];
+    t6 = im[44];
+    t9 = re[45];
+    t2 = im[45];
+    t0 = re[46];
+    t3 = im[46];
+    t8 = re[47];
+    t1 = im[47];
+    t4 = t7 + t0;
+    t11 = t6 + t3;
+    t10 = t9 + t8;
+    t5 = t2 + t1;
+    t7 = t7 - t0;
+    t0 = t6 - t3;
+    t6 = t9 - t8;
+    t3 = t2 - t1;
+    t9 = t4 + t10;
+    t8 = t11 + t5;
+    t2 = t7 + t3;
+    t1 = t0 - t6;
+    t4 = t4 - t10;
+    t10 = t11 - t5;
+    t11 = t7 - t3;
+    t5 = t0 + t6;
+    re[44] = t9;
+    im[44] = t8;
+    re[45] = t2;
+    im[45] = t1;
+    re[46] = t4;
+    im[46] = t10;
+    re[47] = t11;
+    im[47] = t5;
+    t7 = re[48];
+    t3 = im[48];
+    t0 = re[52];
+    t6 = im[52];
+    t9 = re[56];
+    t8 = im[56];
+    t2 = re[60];
+    t1 = im[60];
+    t4 = t7 + t9;
+    t10 = t3 + t8;
+    t11 = t0 + t2;
+    t5 = t6 + t1;
+    t7 = t7 - t9;
+    t9 = t3 - t8;
+    t3 = t0 - t2;
+    t8 = t6 - t1;
+    t0 = t4 + t11;
+    t2 = t10 + t5;
+    t6 = t7 + t8;
+    t1 = t9 - t3;
+    t4 = t4 - t11;
+    t11 = t10 - t5;
+    t10 = t7 - t8;
+    t5 = t9 + t3;
+    re[48] = t0;
+    im[48] = t2;
+    re[52] = t6;
+    im[52] = t1;
+    re[56] = t4;
+    im[56] = t11;
+    re[60] = t10;
+    im[60] = t5;
+    t7 = re[49];
+    t8 = im[49];
+    t9 = re[53];
+    t3 = im[53];
+    t0 = re[57];
+    t2 = im[57];
+    t6 = re[61];
+    t1 = im[61];
+    t4 = t7 + t0;
+    t11 = t8 + t2;
+    t10 = t9 + t6;
+    t5 = t3 + t1;
+    t7 = t7 - t0;
+    t0 = t8 - t2;
+    t8 = t9 - t6;
+    t2 = t3 - t1;
+    t9 = t4 + t10;
+    t6 = t11 + t5;
+    t3 = t7 + t2;
+    t1 = t0 - t8;
+    t4 = t4 - t10;
+    t10 = t11 - t5;
+    t11 = t7 - t2;
+    t5 = t0 + t8;
+    t7 = C6 * t3;
+    t2 = (-C7) * t1;
+    t0 = C6 * t1;
+    t8 = (-C7) * t3;
+    t1 = t7 - t2;
+    t3 = t0 + t8;
+    t7 = t4 + t10;
+    t2 = t4 - t10;
+    t0 = C12 * t7;
+    t8 = (-C12) * t2;
+    t4 = C7 * t11;
+    t10 = (-C6) * t5;
+    t7 = C7 * t5;
+    t2 = (-C6) * t11;
+    t5 = t4 - t10;
+    t11 = t7 + t2;
+    re[49] = t9;
+    im[49] = t6;
+    re[53] = t1;
+    im[53] = t3;
+    re[57] = t0;
+    im[57] = t8;
+    re[61] = t5;
+    im[61] = t11;
+    t4 = re[50];
+    t10 = im[50];
+    t7 = re[54];
+    t2 = im[54];
+    t9 = re[58];
+    t6 = im[58];
+    t1 = re[62];
+    t3 = im[62];
+    t0 = t4 + t9;
+    t8 = t10 + t6;
+    t5 = t7 + t1;
+    t11 = t2 + t3;
+    t4 = t4 - t9;
+    t9 = t10 - t6;
+    t10 = t7 - t1;
+    t6 = t2 - t3;
+    t7 = t0 + t5;
+    t1 = t8 + t11;
+    t2 = t4 + t6;
+    t3 = t9 - t10;
+    t0 = t0 - t5;
+    t5 = t8 - t11;
+    t8 = t4 - t6;
+    t11 = t9 + t10;
+    t4 = t2 + t3;
+    t6 = t2 - t3;
+    t9 = C12 * t4;
+    t10 = (-C12) * t6;
+    t2 = -t0;
+    t3 = t8 - t11;
+    t4 = t8 + t11;
+    t6 = (-C12) * t3;
+    t0 = (-C12) * t4;
+    re[50] = t7;
+    im[50] = t1;
+    re[54] = t9;
+    im[54] = t10;
+    re[58] = t5;
+    im[58] = t2;
+    re[62] = t6;
+    im[62] = t0;
+    t8 = re[51];
+    t11 = im[51];
+    t3 = re[55];
+    t4 = im[55];
+    t7 = re[59];
+    t1 = im[59];
+    t9 = re[63];
+    t10 = im[63];
+    t5 = t8 + t7;
+    t2 = t11 + t1;
+    t6 = t3 + t9;
+    t0 = t4 + t10;
+    t8 = t8 - t7;
+    t7 = t11 - t1;
+    t11 = t3 - t9;
+    t1 = t4 - t10;
+    t3 = t5 + t6;
+    t9 = t2 + t0;
+    t4 = t8 + t1;
+    t10 = t7 - t11;
+    t5 = t5 - t6;
+    t6 = t2 - t0;
+    t2 = t8 - t1;
+    t0 = t7 + t11;
+    t8 = C7 * t4;
+    t1 = (-C6) * t10;
+    t7 = C7 * t10;
+    t11 = (-C6) * t4;
+    t10 = t8 - t1;
+    t4 = t7 + t11;
+    t8 = t5 - t6;
+    t1 = t5 + t6;
+    t7 = (-C12) * t8;
+    t11 = (-C12) * t1;
+    t5 = (-C6) * t2;
+    t6 = C7 * t0;
+    t8 = (-C6) * t0;
+    t1 = C7 * t2;
+    t0 = t5 - t6;
+    t2 = t8 + t1;
+    re[51] = t3;
+    im[51] = t9;
+    re[55] = t10;
+    im[55] = t4;
+    re[59] = t7;
+    im[59] = t11;
+    re[63] = t0;
+    im[63] = t2;
+    t5 = re[48];
+    t6 = im[48];
+    t8 = re[49];
+    t1 = im[49];
+    t3 = re[50];
+    t9 = im[50];
+    t10 = re[51];
+    t4 = im[51];
+    t7 = t5 + t3;
+    t11 = t6 + t9;
+    t0 = t8 + t10;
+    t2 = t1 + t4;
+    t5 = t5 - t3;
+    t3 = t6 - t9;
+    t6 = t8 - t10;
+    t9 = t1 - t4;
+    t8 = t7 + t0;
+    t10 = t11 + t2;
+    t1 = t5 + t9;
+    t4 = t3 - t6;
+    t7 = t7 - t0;
+    t0 = t11 - t2;
+    t11 = t5 - t9;
+    t2 = t3 + t6;
+    re[48] = t8;
+    im[48] = t10;
+    re[49] = t1;
+    im[49] = t4;
+    re[50] = t7;
+    im[50] = t0;
+    re[51] = t11;
+    im[51] = t2;
+    t5 = re[52];
+    t9 = im[52];
+    t3 = re[53];
+    t6 = im[53];
+    t8 = re[54];
+    t10 = im[54];
+    t1 = re[55];
+    t4 = im[55];
+    t7 = t5 + t8;
+    t0 = t9 + t10;
+    t11 = t3 + t1;
+    t2 = t6 + t4;
+    t5 = t5 - t8;
+    t8 = t9 - t10;
+    t9 = t3 - t1;
+    t10 = t6 - t4;
+    t3 = t7 + t11;
+    t1 = t0 + t2;
+    t6 = t5 + t10;
+    t4 = t8 - t9;
+    t7 = t7 - t11;
+    t11 = t0 - t2;
+    t0 = t5 - t10;
+    t2 = t8 + t9;
+    re[52] = t3;
+    im[52] = t1;
+    re[53] = t6;
+    im[53] = t4;
+    re[54] = t7;
+    im[54] = t11;
+    re[55] = t0;
+    im[55] = t2;
+    t5 = re[56];
+    t10 = im[56];
+    t8 = re[57];
+    t9 = im[57];
+    t3 = re[58];
+    t1 = im[58];
+    t6 = re[59];
+    t4 = im[59];
+    t7 = t5 + t3;
+    t11 = t10 + t1;
+    t0 = t8 + t6;
+    t2 = t9 + t4;
+    t5 = t5 - t3;
+    t3 = t10 - t1;
+    t10 = t8 - t6;
+    t1 = t9 - t4;
+    t8 = t7 + t0;
+    t6 = t11 + t2;
+    t9 = t5 + t1;
+    t4 = t3 - t10;
+    t7 = t7 - t0;
+    t0 = t11 - t2;
+    t11 = t5 - t1;
+    t2 = t3 + t10;
+    re[56] = t8;
+    im[56] = t6;
+    re[57] = t9;
+    im[57] = t4;
+    re[58] = t7;
+    im[58] = t0;
+    re[59] = t11;
+    im[59] = t2;
+    t5 = re[60];
+    t1 = im[60];
+    t3 = re[61];
+    t10 = im[61];
+    t8 = re[62];
+    t6 = im[62];
+    t9 = re[63];
+    t4 = im[63];
+    t7 = t5 + t8;
+    t0 = t1 + t6;
+    t11 = t3 + t9;
+    t2 = t10 + t4;
+    t5 = t5 - t8;
+    t8 = t1 - t6;
+    t1 = t3 - t9;
+    t6 = t10 - t4;
+    t3 = t7 + t11;
+    t9 = t0 + t2;
+    t10 = t5 + t6;
+    t4 = t8 - t1;
+    t7 = t7 - t11;
+    t11 = t0 - t2;
+    t0 = t5 - t6;
+    t2 = t8 + t1;
+    re[60] = t3;
+    im[60] = t9;
+    re[61] = t10;
+    im[61] = t4;
+    re[62] = t7;
+    im[62] = t11;
+    re[63] = t0;
+    im[63] = t2;
+}
+
+//  Export public APIs.
+module.exports = {
+    "ApplyMixedRadixFFT_64": ApplyMixedRadixFFT_64,
+    "ApplyMixedRadixFFTPermuted_64": ApplyMixedRadixFFTPermuted_64,
+    "MIXED_RADIX_FFT_OUTPUT_INDEXES_64": MIXED_RADIX_FFT_OUTPUT_INDEXES_64
+};
\ No newline at end of file
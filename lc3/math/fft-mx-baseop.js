@@ -285,6 +285,94 @@ function MXCshft(re, im, idxes) {
     im[i_last] = i0;
 }
 
+/**
+ *  Apply in-place table-driven mixed-radix FFT transform (used by the 
+ *  kernels generated in compact mode).
+ * 
+ *  Note(s):
+ *    [1] The size of all arrays will not be checked.
+ *    [2] The points are gathered (in digit-reversed order) into the scratch 
+ *        buffers, then each stage combines the sub-transforms of the 
+ *        previous stages by (radices[s])-point butterflies, finally the 
+ *        outputs are copied back (in natural order).
+ *    [3] The twiddle factors of stage s (let m be the product of all 
+ *        previous radices) are stored in (j, k) order (0 <= j < m, 
+ *        1 <= k < radices[s]), each one is stored as the real part followed 
+ *        by the imaginary part.
+ * 
+ *  @param {Number[]} re 
+ *    - The real part array.
+ *  @param {Number[]} im 
+ *    - The imaginary part array.
+ *  @param {Int32Array} radices
+ *    - The radix (2, 3, 4 or 5) of each stage.
+ *  @param {Int32Array} indexes
+ *    - The input index of each point (in digit-reversed order).
+ *  @param {Float64Array} twiddles
+ *    - The twiddle factors.
+ *  @param {Float64Array} s_re
+ *    - The real part scratch buffer.
+ *  @param {Float64Array} s_im
+ *    - The imaginary part scratch buffer.
+ *  @param {Number} [scale]
+ *    - The scale factor of all outputs.
+ */
+function MXCompact(re, im, radices, indexes, twiddles, s_re, s_im, scale = 1) {
+    let N = indexes.length;
+
+    //  Gather the points.
+    for (let i = 0; i < N; ++i) {
+        let idx = indexes[i];
+        s_re[i] = re[idx];
+        s_im[i] = im[idx];
+    }
+
+    //  Apply all stages.
+    for (let s = 0, m = 1, t = 0; s < radices.length; ++s) {
+        let p = radices[s];
+        let L = m * p;
+        for (let j = 0; j < m; ++j) {
+            let t_j = t + 2 * (p - 1) * j;
+            for (let i0 = j; i0 < N; i0 += L) {
+                if (j != 0) {
+                    for (let k = 1, i_k = i0 + m, t_k = t_j; k < p; ++k, i_k += m, t_k += 2) {
+                        MXRot(s_re, s_im, i_k, twiddles[t_k], twiddles[t_k + 1]);
+                    }
+                }
+                switch (p) {
+                case 2:
+                    MXTr2(s_re, s_im, i0, i0 + m);
+                    break;
+                case 3:
+                    MXTr3(s_re, s_im, i0, i0 + m, i0 + 2 * m);
+                    break;
+                case 4:
+                    MXTr4(s_re, s_im, i0, i0 + m, i0 + 2 * m, i0 + 3 * m);
+                    break;
+                default:
+                    MXTr5(s_re, s_im, i0, i0 + m, i0 + 2 * m, i0 + 3 * m, i0 + 4 * m);
+                    break;
+                }
+            }
+        }
+        t += 2 * (p - 1) * m;
+        m = L;
+    }
+
+    //  Copy the outputs back (and scale).
+    if (scale == 1) {
+        for (let i = 0; i < N; ++i) {
+            re[i] = s_re[i];
+            im[i] = s_im[i];
+        }
+    } else {
+        for (let i = 0; i < N; ++i) {
+            re[i] = s_re[i] * scale;
+            im[i] = s_im[i] * scale;
+        }
+    }
+}
+
 //  Exported public APIs.
 module.exports = {
     "MXTr2": MXTr2,
@@ -293,5 +381,6 @@ module.exports = {
     "MXTr5": MXTr5,
     "MXRot": MXRot,
     "MXSwap": MXSwap,
-    "MXCshft": MXCshft
+    "MXCshft": MXCshft,
+    "MXCompact": MXCompact
 };
\ No newline at end of file
@@ -0,0 +1,566 @@
+//
+//  Copyright 2021 - 2023 XiaoJSoft Studio. All rights reserved.
+//  Use of this source code is governed by a BSD-style license that can be
+//  found in the LICENSE.md file.
+//
+
+//
+//  Note(s):
+//    [1] This file is generated automatically by a FFT compiler, which locates 
+//        at "./../../dev/fft-mx-generator/" directory.
+//        Do NOT modify this file manually.
+//
+
+//
+//  Imports.
+//
+
+//  Imported modules.
+const Lc3Unrolled = 
+    require("./unrolled");
+
+//  Imported functions.
+const IsUnrolledKernelsEnabled = 
+    Lc3Unrolled.IsUnrolledKernelsEnabled;
+
+//
+//  Globals.
+//
+
+//  Prebuilt FFT kernels (null if not loaded yet).
+let g_PrebuiltKernel_60 = null;
+let g_PrebuiltKernel_64 = null;
+let g_PrebuiltKernel_80 = null;
+let g_PrebuiltKernel_120 = null;
+let g_PrebuiltKernel_128 = null;
+let g_PrebuiltKernel_160 = null;
+let g_PrebuiltKernel_180 = null;
+let g_PrebuiltKernel_240 = null;
+let g_PrebuiltKernel_256 = null;
+let g_PrebuiltKernel_320 = null;
+let g_PrebuiltKernel_360 = null;
+let g_PrebuiltKernel_480 = null;
+let g_PrebuiltKernel_512 = null;
+let g_PrebuiltKernel_1024 = null;
+
+//  Prebuilt real-output inverse FFT kernels (null if not loaded yet).
+let g_PrebuiltRealInverseKernel_160 = null;
+let g_PrebuiltRealInverseKernel_180 = null;
+
+//  Prebuilt paired real-input FFT kernels (null if not loaded yet).
+let g_PrebuiltPairedKernel_160 = null;
+let g_PrebuiltPairedKernel_180 = null;
+
+//
+//  Private functions.
+//
+
+/**
+ *  Load the prebuilt FFT kernel (block size 60).
+ * 
+ *  @returns {Object}
+ *    - The kernel descriptor.
+ */
+function LoadPrebuiltKernel_60() {
+    if (g_PrebuiltKernel_60 === null) {
+        const Lc3FftMx60 = 
+            require("./fft-mx-60");
+        g_PrebuiltKernel_60 = {
+            "transform": Lc3FftMx60.ApplyMixedRadixFFT_60,
+            "transformPermuted": null,
+            "outputIndexes": null,
+            "scaled": false
+        };
+    }
+    return g_PrebuiltKernel_60;
+}
+
+/**
+ *  Load the prebuilt FFT kernel (block size 64).
+ * 
+ *  @returns {Object}
+ *    - The kernel descriptor.
+ */
+function LoadPrebuiltKernel_64() {
+    if (g_PrebuiltKernel_64 === null) {
+        const Lc3FftMx64 = 
+            require("./fft-mx-64");
+        g_PrebuiltKernel_64 = {
+            "transform": Lc3FftMx64.ApplyMixedRadixFFT_64,
+            "transformPermuted": Lc3FftMx64.ApplyMixedRadixFFTPermuted_64,
+            "outputIndexes": Lc3FftMx64.MIXED_RADIX_FFT_OUTPUT_INDEXES_64,
+            "scaled": false
+        };
+    }
+    return g_PrebuiltKernel_64;
+}
+
+/**
+ *  Load the prebuilt FFT kernel (block size 80).
+ * 
+ *  @returns {Object}
+ *    - The kernel descriptor.
+ */
+function LoadPrebuiltKernel_80() {
+    if (g_PrebuiltKernel_80 === null) {
+        const Lc3FftMx80 = 
+            require("./fft-mx-80");
+        g_PrebuiltKernel_80 = {
+            "transform": Lc3FftMx80.ApplyMixedRadixFFT_80,
+            "transformPermuted": null,
+            "outputIndexes": null,
+            "scaled": false
+        };
+    }
+    return g_PrebuiltKernel_80;
+}
+
+/**
+ *  Load the prebuilt FFT kernel (block size 120).
+ * 
+ *  @returns {Object}
+ *    - The kernel descriptor.
+ */
+function LoadPrebuiltKernel_120() {
+    if (g_PrebuiltKernel_120 === null) {
+        const Lc3FftMx120 = 
+            require("./fft-mx-120");
+        g_PrebuiltKernel_120 = {
+            "transform": Lc3FftMx120.ApplyMixedRadixFFT_120,
+            "transformPermuted": null,
+            "outputIndexes": null,
+            "scaled": false
+        };
+    }
+    return g_PrebuiltKernel_120;
+}
+
+/**
+ *  Load the prebuilt FFT kernel (block size 128).
+ * 
+ *  @returns {Object}
+ *    - The kernel descriptor.
+ */
+function LoadPrebuiltKernel_128() {
+    if (g_PrebuiltKernel_128 === null) {
+        const Lc3FftMx128 = 
+            require("./fft-mx-128");
+        g_PrebuiltKernel_128 = {
+            "transform": Lc3FftMx128.ApplyMixedRadixFFT_128,
+            "transformPermuted": Lc3FftMx128.ApplyMixedRadixFFTPermuted_128,
+            "outputIndexes": Lc3FftMx128.MIXED_RADIX_FFT_OUTPUT_INDEXES_128,
+            "scaled": false
+        };
+    }
+    return g_PrebuiltKernel_128;
+}
+
+/**
+ *  Load the prebuilt FFT kernel (block size 160).
+ * 
+ *  @returns {Object}
+ *    - The kernel descriptor.
+ */
+function LoadPrebuiltKernel_160() {
+    if (g_PrebuiltKernel_160 === null) {
+        const Lc3FftMx160 = 
+            require("./fft-mx-160");
+        g_PrebuiltKernel_160 = {
+            "transform": Lc3FftMx160.ApplyMixedRadixFFT_160,
+            "transformPermuted": null,
+            "outputIndexes": null,
+            "scaled": false
+        };
+    }
+    return g_PrebuiltKernel_160;
+}
+
+/**
+ *  Load the prebuilt FFT kernel (block size 180).
+ * 
+ *  @returns {Object}
+ *    - The kernel descriptor.
+ */
+function LoadPrebuiltKernel_180() {
+    if (g_PrebuiltKernel_180 === null) {
+        const Lc3FftMx180 = 
+            require("./fft-mx-180");
+        g_PrebuiltKernel_180 = {
+            "transform": Lc3FftMx180.ApplyMixedRadixFFT_180,
+            "transformPermuted": null,
+            "outputIndexes": null,
+            "scaled": false
+        };
+    }
+    return g_PrebuiltKernel_180;
+}
+
+/**
+ *  Load the prebuilt FFT kernel (block size 240).
+ * 
+ *  @returns {Object}
+ *    - The kernel descriptor.
+ */
+function LoadPrebuiltKernel_240() {
+    if (g_PrebuiltKernel_240 === null) {
+        const Lc3FftMx240 = 
+            require("./fft-mx-240");
+        g_PrebuiltKernel_240 = {
+            "transform": Lc3FftMx240.ApplyMixedRadixFFT_240,
+            "transformPermuted": null,
+            "outputIndexes": null,
+            "scaled": false
+        };
+    }
+    return g_PrebuiltKernel_240;
+}
+
+/**
+ *  Load the prebuilt FFT kernel (block size 256).
+ * 
+ *  @returns {Object}
+ *    - The kernel descriptor.
+ */
+function LoadPrebuiltKernel_256() {
+    if (g_PrebuiltKernel_256 === null) {
+        const Lc3FftMx256 = 
+            require("./fft-mx-256");
+        g_PrebuiltKernel_256 = {
+            "transform": Lc3FftMx256.ApplyMixedRadixFFT_256,
+            "transformPermuted": null,
+            "outputIndexes": null,
+            "scaled": false
+        };
+    }
+    return g_PrebuiltKernel_256;
+}
+
+/**
+ *  Load the prebuilt FFT kernel (block size 320).
+ * 
+ *  @returns {Object}
+ *    - The kernel descriptor.
+ */
+function LoadPrebuiltKernel_320() {
+    if (g_PrebuiltKernel_320 === null) {
+        const Lc3FftMx320 = 
+            require("./fft-mx-320");
+        g_PrebuiltKernel_320 = {
+            "transform": Lc3FftMx320.ApplyMixedRadixFFT_320,
+            "transformPermuted": null,
+            "outputIndexes": null,
+            "scaled": false
+        };
+    }
+    return g_PrebuiltKernel_320;
+}
+
+/**
+ *  Load the prebuilt FFT kernel (block size 360).
+ * 
+ *  @returns {Object}
+ *    - The kernel descriptor.
+ */
+function LoadPrebuiltKernel_360() {
+    if (g_PrebuiltKernel_360 === null) {
+        const Lc3FftMx360 = 
+            require("./fft-mx-360");
+        g_PrebuiltKernel_360 = {
+            "transform": Lc3FftMx360.ApplyMixedRadixFFT_360,
+            "transformPermuted": null,
+            "outputIndexes": null,
+            "scaled": false
+        };
+    }
+    return g_PrebuiltKernel_360;
+}
+
+/**
+ *  Load the prebuilt FFT kernel (block size 480).
+ * 
+ *  @returns {Object}
+ *    - The kernel descriptor.
+ */
+function LoadPrebuiltKernel_480() {
+    if (g_PrebuiltKernel_480 === null) {
+        const Lc3FftMx480 = 
+            require("./fft-mx-480");
+        g_PrebuiltKernel_480 = {
+            "transform": Lc3FftMx480.ApplyMixedRadixFFT_480,
+            "transformPermuted": null,
+            "outputIndexes": null,
+            "scaled": false
+        };
+    }
+    return g_PrebuiltKernel_480;
+}
+
+/**
+ *  Load the prebuilt FFT kernel (block size 512).
+ * 
+ *  @returns {Object}
+ *    - The kernel descriptor.
+ */
+function LoadPrebuiltKernel_512() {
+    if (g_PrebuiltKernel_512 === null) {
+        const Lc3FftMx512 = 
+            require("./fft-mx-512");
+        g_PrebuiltKernel_512 = {
+            "transform": Lc3FftMx512.ApplyMixedRadixFFT_512,
+            "transformPermuted": null,
+            "outputIndexes": null,
+            "scaled": false
+        };
+    }
+    return g_PrebuiltKernel_512;
+}
+
+/**
+ *  Load the prebuilt FFT kernel (block size 1024).
+ * 
+ *  @returns {Object}
+ *    - The kernel descriptor.
+ */
+function LoadPrebuiltKernel_1024() {
+    if (g_PrebuiltKernel_1024 === null) {
+        const Lc3FftMx1024 = 
+            require("./fft-mx-1024");
+        g_PrebuiltKernel_1024 = {
+            "transform": Lc3FftMx1024.ApplyMixedRadixFFT_1024,
+            "transformPermuted": null,
+            "outputIndexes": null,
+            "scaled": false
+        };
+    }
+    return g_PrebuiltKernel_1024;
+}
+
+/**
+ *  Load the prebuilt real-output inverse FFT kernel (block size 160).
+ * 
+ *  @returns {?Object}
+ *    - The kernel descriptor (null if the unrolled kernels are not
+ *      enabled or the kernel module is not bundled).
+ */
+function LoadPrebuiltRealInverseKernel_160() {
+    if (!IsUnrolledKernelsEnabled()) {
+        return null;
+    }
+    if (g_PrebuiltRealInverseKernel_160 === null) {
+        let Lc3FftMx160C2r = null;
+        try {
+            Lc3FftMx160C2r = require("./fft-mx-160-c2r");
+        } catch (error) {
+            //  Not bundled (see "browser/modules-unrolled.json").
+            return null;
+        }
+        g_PrebuiltRealInverseKernel_160 = {
+            "transform": Lc3FftMx160C2r.ApplyMixedRadixIRFFT_160,
+            "scaled": true
+        };
+    }
+    return g_PrebuiltRealInverseKernel_160;
+}
+
+/**
+ *  Load the prebuilt real-output inverse FFT kernel (block size 180).
+ * 
+ *  @returns {?Object}
+ *    - The kernel descriptor (null if the unrolled kernels are not
+ *      enabled or the kernel module is not bundled).
+ */
+function LoadPrebuiltRealInverseKernel_180() {
+    if (!IsUnrolledKernelsEnabled()) {
+        return null;
+    }
+    if (g_PrebuiltRealInverseKernel_180 === null) {
+        let Lc3FftMx180C2r = null;
+        try {
+            Lc3FftMx180C2r = require("./fft-mx-180-c2r");
+        } catch (error) {
+            //  Not bundled (see "browser/modules-unrolled.json").
+            return null;
+        }
+        g_PrebuiltRealInverseKernel_180 = {
+            "transform": Lc3FftMx180C2r.ApplyMixedRadixIRFFT_180,
+            "scaled": true
+        };
+    }
+    return g_PrebuiltRealInverseKernel_180;
+}
+
+/**
+ *  Load the prebuilt paired real-input FFT kernel (block size 160).
+ * 
+ *  @returns {?Object}
+ *    - The kernel descriptor (null if the unrolled kernels are not
+ *      enabled or the kernel module is not bundled).
+ */
+function LoadPrebuiltPairedKernel_160() {
+    if (!IsUnrolledKernelsEnabled()) {
+        return null;
+    }
+    if (g_PrebuiltPairedKernel_160 === null) {
+        let Lc3FftMx160Paired = null;
+        try {
+            Lc3FftMx160Paired = require("./fft-mx-160-paired");
+        } catch (error) {
+            //  Not bundled (see "browser/modules-unrolled.json").
+            return null;
+        }
+        g_PrebuiltPairedKernel_160 = {
+            "transform": Lc3FftMx160Paired.ApplyMixedRadixPairedRFFT_160,
+            "scaled": false
+        };
+    }
+    return g_PrebuiltPairedKernel_160;
+}
+
+/**
+ *  Load the prebuilt paired real-input FFT kernel (block size 180).
+ * 
+ *  @returns {?Object}
+ *    - The kernel descriptor (null if the unrolled kernels are not
+ *      enabled or the kernel module is not bundled).
+ */
+function LoadPrebuiltPairedKernel_180() {
+    if (!IsUnrolledKernelsEnabled()) {
+        return null;
+    }
+    if (g_PrebuiltPairedKernel_180 === null) {
+        let Lc3FftMx180Paired = null;
+        try {
+            Lc3FftMx180Paired = require("./fft-mx-180-paired");
+        } catch (error) {
+            //  Not bundled (see "browser/modules-unrolled.json").
+            return null;
+        }
+        g_PrebuiltPairedKernel_180 = {
+            "transform": Lc3FftMx180Paired.ApplyMixedRadixPairedRFFT_180,
+            "scaled": false
+        };
+    }
+    return g_PrebuiltPairedKernel_180;
+}
+
+//
+//  Public functions.
+//
+
+/**
+ *  Find the prebuilt mixed-radix FFT kernel of specific block size.
+ * 
+ *  Note(s):
+ *    [1] The returned object contains following fields:
+ *          - "transform": The transform function.
+ *          - "transformPermuted": The in-place transform function that
+ *            leaves the k-th output at index outputIndexes[k] (or null if
+ *            not prebuilt).
+ *          - "outputIndexes": The output indexes of transformPermuted (or
+ *            null if not prebuilt).
+ *          - "scaled": True if the outputs were scaled by 1 / N.
+ *    [2] The kernel module is loaded on the first lookup.
+ *    [3] The returned object shall not be modified.
+ * 
+ *  @param {Number} N
+ *    - The block size.
+ *  @returns {?Object}
+ *    - The prebuilt kernel (null if not available).
+ */
+function FindPrebuiltMixedRadixFFT(N) {
+    switch (N) {
+    case 60:
+        return LoadPrebuiltKernel_60();
+    case 64:
+        return LoadPrebuiltKernel_64();
+    case 80:
+        return LoadPrebuiltKernel_80();
+    case 120:
+        return LoadPrebuiltKernel_120();
+    case 128:
+        return LoadPrebuiltKernel_128();
+    case 160:
+        return LoadPrebuiltKernel_160();
+    case 180:
+        return LoadPrebuiltKernel_180();
+    case 240:
+        return LoadPrebuiltKernel_240();
+    case 256:
+        return LoadPrebuiltKernel_256();
+    case 320:
+        return LoadPrebuiltKernel_320();
+    case 360:
+        return LoadPrebuiltKernel_360();
+    case 480:
+        return LoadPrebuiltKernel_480();
+    case 512:
+        return LoadPrebuiltKernel_512();
+    case 1024:
+        return LoadPrebuiltKernel_1024();
+    default:
+        return null;
+    }
+}
+
+/**
+ *  Find the prebuilt mixed-radix real-output inverse FFT kernel of specific block size.
+ * 
+ *  Note(s):
+ *    [1] The returned object contains following fields:
+ *          - "transform": The transform function.
+ *          - "scaled": True if the outputs were scaled by 1 / N.
+ *    [2] The kernel module is loaded on the first lookup.
+ *    [3] The returned object shall not be modified.
+ *    [4] An unrolled kernel is only returned if the unrolled kernels
+ *        are enabled (see EnableUnrolledKernels() of the MDCT module).
+ * 
+ *  @param {Number} N
+ *    - The block size.
+ *  @returns {?Object}
+ *    - The prebuilt kernel (null if not available).
+ */
+function FindPrebuiltMixedRadixIRFFT(N) {
+    switch (N) {
+    case 160:
+        return LoadPrebuiltRealInverseKernel_160();
+    case 180:
+        return LoadPrebuiltRealInverseKernel_180();
+    default:
+        return null;
+    }
+}
+
+/**
+ *  Find the prebuilt mixed-radix paired real-input FFT kernel of specific block size.
+ * 
+ *  Note(s):
+ *    [1] The returned object contains following fields:
+ *          - "transform": The transform function.
+ *          - "scaled": True if the outputs were scaled by 1 / N.
+ *    [2] The kernel module is loaded on the first lookup.
+ *    [3] The returned object shall not be modified.
+ *    [4] An unrolled kernel is only returned if the unrolled kernels
+ *        are enabled (see EnableUnrolledKernels() of the MDCT module).
+ * 
+ *  @param {Number} N
+ *    - The block size.
+ *  @returns {?Object}
+ *    - The prebuilt kernel (null if not available).
+ */
+function FindPrebuiltMixedRadixPairedRFFT(N) {
+    switch (N) {
+    case 160:
+        return LoadPrebuiltPairedKernel_160();
+    case 180:
+        return LoadPrebuiltPairedKernel_180();
+    default:
+        return null;
+    }
+}
+
+//  Export public APIs.
+module.exports = {
+    "FindPrebuiltMixedRadixFFT": FindPrebuiltMixedRadixFFT,
+    "FindPrebuiltMixedRadixIRFFT": FindPrebuiltMixedRadixIRFFT,
+    "FindPrebuiltMixedRadixPairedRFFT": FindPrebuiltMixedRadixPairedRFFT
+};
\ No newline at end of file
@@ -9,6 +9,8 @@
 //
 
 //  Imported modules.
+const Lc3FftMxPrebuilt = 
+    require("./fft-mx-prebuilt");
 const Lc3FftTfmCore = 
     require("./fft-tfm-core");
 const Lc3FftTfmCooleyTukey = 
@@ -29,6 +31,8 @@ const LC3IllegalParameterError =
     Lc3Error.LC3IllegalParameterError;
 
 //  Imported functions.
+const FindPrebuiltMixedRadixFFT = 
+    Lc3FftMxPrebuilt.FindPrebuiltMixedRadixFFT;
 const IsUInt32 = 
     Lc3UInt.IsUInt32;
 const Inherits = 
@@ -83,8 +87,20 @@ function FFTBluesteinTransformer(N) {
     let PiDivN = Math.PI / N;
     let MsN = M - N;
 
-    //  FFT transformer (for block size `M`).
-    let fft = new FFTCooleyTukeyTransformer(log2M);
+    //  FFT transform function (for block size `M`, use the prebuilt kernel 
+    //  if available).
+    let fft_transform = null;
+    {
+        let prebuilt = FindPrebuiltMixedRadixFFT(M);
+        if (prebuilt !== null) {
+            fft_transform = prebuilt.transform;
+        } else {
+            let fft = new FFTCooleyTukeyTransformer(log2M);
+            fft_transform = function(y_re, y_im) {
+                fft.transform(y_re, y_im);
+            };
+        }
+    }
 
     //  FFT of the chirp sequence.
     let B_RE = new Array(M);
@@ -116,7 +132,7 @@ function FFTBluesteinTransformer(N) {
     }
 
     //  B[n] = FFT{b[n]}.
-    fft.transform(B_RE, B_IM);
+    fft_transform(B_RE, B_IM);
 
     //  A[n].
     let A_RE = new Array(M);
@@ -160,7 +176,7 @@ function FFTBluesteinTransformer(N) {
         }
 
         //  Let A[n] = FFT{a[n]}.
-        fft.transform(A_RE, A_IM);
+        fft_transform(A_RE, A_IM);
 
         //  Let a[n] = IFFT{A[n] * B[n]} (for 0 <= n < M).
         //
@@ -181,7 +197,7 @@ function FFTBluesteinTransformer(N) {
         }
 
         //  Do step [2].
-        fft.transform(A_RE, A_IM);
+        fft_transform(A_RE, A_IM);
 
         //  Do step [3] and generate sequence X[n] = A[n] * (TW[n] ^ -1)
         //  (for 0 <= n < N only).
@@ -9,24 +9,8 @@
 //
 
 //  Imported modules.
-const Lc3FftMx60 = 
-    require("./fft-mx-60");
-const Lc3FftMx80 = 
-    require("./fft-mx-80");
-const Lc3FftMx120 = 
-    require("./fft-mx-120");
-const Lc3FftMx160 = 
-    require("./fft-mx-160");
-const Lc3FftMx180 = 
-    require("./fft-mx-180");
-const Lc3FftMx240 = 
-    require("./fft-mx-240");
-const Lc3FftMx320 = 
-    require("./fft-mx-320");
-const Lc3FftMx360 = 
-    require("./fft-mx-360");
-const Lc3FftMx480 = 
-    require("./fft-mx-480");
+const Lc3FftMxPrebuilt = 
+    require("./fft-mx-prebuilt");
 const Lc3FftTfmCore = 
     require("./fft-tfm-core");
 const Lc3FftTfmBluestein = 
@@ -51,24 +35,12 @@ const LC3IllegalParameterError =
 //  Imported functions.
 const IsUInt32 = 
     Lc3UInt.IsUInt32;
-const ApplyMixedRadixFFT_60 = 
-    Lc3FftMx60.ApplyMixedRadixFFT_60;
-const ApplyMixedRadixFFT_80 = 
-    Lc3FftMx80.ApplyMixedRadixFFT_80;
-const ApplyMixedRadixFFT_120 = 
-    Lc3FftMx120.ApplyMixedRadixFFT_120;
-const ApplyMixedRadixFFT_160 = 
-    Lc3FftMx160.ApplyMixedRadixFFT_160;
-const ApplyMixedRadixFFT_180 = 
-    Lc3FftMx180.ApplyMixedRadixFFT_180;
-const ApplyMixedRadixFFT_240 = 
-    Lc3FftMx240.ApplyMixedRadixFFT_240;
-const ApplyMixedRadixFFT_320 = 
-    Lc3FftMx320.ApplyMixedRadixFFT_320;
-const ApplyMixedRadixFFT_360 = 
-    Lc3FftMx360.ApplyMixedRadixFFT_360;
-const ApplyMixedRadixFFT_480 = 
-    Lc3FftMx480.ApplyMixedRadixFFT_480;
+const FindPrebuiltMixedRadixFFT = 
+    Lc3FftMxPrebuilt.FindPrebuiltMixedRadixFFT;
+const FindPrebuiltMixedRadixIRFFT = 
+    Lc3FftMxPrebuilt.FindPrebuiltMixedRadixIRFFT;
+const FindPrebuiltMixedRadixPairedRFFT = 
+    Lc3FftMxPrebuilt.FindPrebuiltMixedRadixPairedRFFT;
 
 //
 //  Globals.
@@ -88,6 +60,11 @@ let g_CustomTransformerFactory = null;
 /**
  *  FFT transformer (for both forward and reverse direction).
  * 
+ *  Note(s):
+ *    [1] The prebuilt unrolled real-data kernels are used only if they were 
+ *        enabled (by EnableUnrolledKernels() of the MDCT module) when the 
+ *        transformer was created.
+ * 
  *  @constructor
  *  @throws {LC3IllegalParameterError}
  *    - Block size is not an unsigned 32-bit integer, or
@@ -110,29 +87,21 @@ function FFT(N) {
 
     //  FFT transformer.
     let mx_func = null;
+    let mx_perm_func = null;
+    let mx_perm_indexes = null;
+    let mx_real_inv_func = null;
+    let mx_real_inv_scaled = false;
+    let mx_paired_func = null;
     let transformer = null;
     if (g_CustomTransformerFactory !== null) {
         transformer = g_CustomTransformerFactory.create(N);
     } else {
-        //  Try prebuilt mixed-radix Cooley-Tukey FFT algorithm.
-        if (N == 60) {
-            mx_func = ApplyMixedRadixFFT_60;
-        } else if (N == 80) {
-            mx_func = ApplyMixedRadixFFT_80;
-        } else if (N == 120) {
-            mx_func = ApplyMixedRadixFFT_120;
-        } else if (N == 160) {
-            mx_func = ApplyMixedRadixFFT_160;
-        } else if (N == 180) {
-            mx_func = ApplyMixedRadixFFT_180;
-        } else if (N == 240) {
-            mx_func = ApplyMixedRadixFFT_240;
-        } else if (N == 320) {
-            mx_func = ApplyMixedRadixFFT_320;
-        } else if (N == 360) {
-            mx_func = ApplyMixedRadixFFT_360;
-        } else if (N == 480) {
-            mx_func = ApplyMixedRadixFFT_480;
+        //  Try prebuilt mixed-radix FFT kernels.
+        let prebuilt = FindPrebuiltMixedRadixFFT(N);
+        if (prebuilt !== null) {
+            mx_func = prebuilt.transform;
+            mx_perm_func = prebuilt.transformPermuted;
+            mx_perm_indexes = prebuilt.outputIndexes;
         } else {
             //  Fallback to other algorithms.
 
@@ -148,8 +117,24 @@ function FFT(N) {
                 transformer = new FFTBluesteinTransformer(N);
             }
         }
+
+        //  Try prebuilt mixed-radix real-data FFT kernels (the unrolled ones 
+        //  are only returned if enabled, see EnableUnrolledKernels() of the 
+        //  MDCT module).
+        let prebuilt_real_inv = FindPrebuiltMixedRadixIRFFT(N);
+        if (prebuilt_real_inv !== null) {
+            mx_real_inv_func = prebuilt_real_inv.transform;
+            mx_real_inv_scaled = prebuilt_real_inv.scaled;
+        }
+        let prebuilt_paired = FindPrebuiltMixedRadixPairedRFFT(N);
+        if (prebuilt_paired !== null && !prebuilt_paired.scaled) {
+            mx_paired_func = prebuilt_paired.transform;
+        }
     }
 
+    //  Scale factor of the inverse transform.
+    let inv_scale = 1 / N;
+
     //
     //  Public methods.
     //
@@ -177,6 +162,219 @@ function FFT(N) {
         }
         transformer.transform(x_re, x_im);
     };
+
+    /**
+     *  Apply transform without restoring the natural order of the outputs 
+     *  (the k-th output is stored at index R[k], where R is the array 
+     *  returned by getPermutedOutputIndexes()).
+     *  
+     *  @throws {LC3IllegalParameterError}
+     *    - Incorrect block size.
+     *  @param {Number[]} x_re 
+     *    - The real part of each point.
+     *  @param {Number[]} x_im 
+     *    - The imaginary part of each point.
+     */
+    this.transformPermuted = function(x_re, x_im) {
+        //  Check the block size.
+        if (x_re.length != N || x_im.length != N) {
+            throw new LC3IllegalParameterError("Incorrect block size.");
+        }
+
+        //  Apply transform.
+        if (mx_perm_func !== null) {
+            mx_perm_func.call(this, x_re, x_im);
+            return;
+        }
+        this.transform(x_re, x_im);
+    };
+
+    /**
+     *  Apply inverse transform (scaled by 1 / N, so that it reverses 
+     *  transform()).
+     * 
+     *  Note(s):
+     *    [1] The inverse transform is computed by the forward transform with 
+     *        the real and imaginary parts swapped (i.e. IDFT(x) = 
+     *        swap(DFT(swap(x))) / N).
+     *  
+     *  @throws {LC3IllegalParameterError}
+     *    - Incorrect block size.
+     *  @param {Number[]} x_re 
+     *    - The real part of each point.
+     *  @param {Number[]} x_im 
+     *    - The imaginary part of each point.
+     */
+    this.transformInverse = function(x_re, x_im) {
+        //  Check the block size.
+        if (x_re.length != N || x_im.length != N) {
+            throw new LC3IllegalParameterError("Incorrect block size.");
+        }
+
+        //  Apply transform.
+        this.transform(x_im, x_re);
+
+        //  Scale.
+        for (let k = 0; k < N; ++k) {
+            x_re[k] *= inv_scale;
+            x_im[k] *= inv_scale;
+        }
+    };
+
+    /**
+     *  Apply transform on real points.
+     * 
+     *  Note(s):
+     *    [1] Only the first (floor(N / 2) + 1) outputs are guaranteed to be 
+     *        stored to `y_re` and `y_im` (the k-th output is the conjugate 
+     *        of the (N - k)-th output).
+     *    [2] `x` shall not be `y_re` or `y_im`.
+     *  
+     *  @throws {LC3IllegalParameterError}
+     *    - Incorrect block size.
+     *  @param {Number[]} x 
+     *    - The real points.
+     *  @param {Number[]} y_re 
+     *    - The array that would contain the real part of each output.
+     *  @param {Number[]} y_im 
+     *    - The array that would contain the imaginary part of each output.
+     */
+    this.transformReal = function(x, y_re, y_im) {
+        //  Check the block size.
+        if (x.length != N || y_re.length != N || y_im.length != N) {
+            throw new LC3IllegalParameterError("Incorrect block size.");
+        }
+
+        //  Apply transform.
+        for (let n = 0; n < N; ++n) {
+            y_re[n] = x[n];
+            y_im[n] = 0;
+        }
+        this.transform(y_re, y_im);
+    };
+
+    /**
+     *  Apply inverse transform (scaled by 1 / N) on a conjugate-symmetric 
+     *  spectrum, which has real outputs.
+     * 
+     *  Note(s):
+     *    [1] Only the first (floor(N / 2) + 1) inputs are used (the k-th 
+     *        input is assumed to be the conjugate of the (N - k)-th input), 
+     *        the imaginary parts of the 0th input (and the (N / 2)-th input 
+     *        if N is even) are ignored.
+     *    [2] `x_re` and `x_im` are used as scratch buffers, their contents 
+     *        would be destroyed.
+     *    [3] `y` shall not be `x_re` or `x_im`.
+     *  
+     *  @throws {LC3IllegalParameterError}
+     *    - Incorrect block size.
+     *  @param {Number[]} x_re 
+     *    - The real part of each point.
+     *  @param {Number[]} x_im 
+     *    - The imaginary part of each point.
+     *  @param {Number[]} y 
+     *    - The array that would contain the (real) outputs.
+     */
+    this.transformInverseReal = function(x_re, x_im, y) {
+        //  Check the block size.
+        if (x_re.length != N || x_im.length != N || y.length != N) {
+            throw new LC3IllegalParameterError("Incorrect block size.");
+        }
+
+        //  Apply transform.
+        if (mx_real_inv_func !== null) {
+            mx_real_inv_func.call(this, x_re, x_im, y);
+            if (!mx_real_inv_scaled) {
+                for (let n = 0; n < N; ++n) {
+                    y[n] *= inv_scale;
+                }
+            }
+            return;
+        }
+        x_im[0] = 0;
+        for (let k1 = 1, k2 = N - 1; k1 <= k2; ++k1, --k2) {
+            if (k1 == k2) {
+                x_im[k1] = 0;
+            } else {
+                x_re[k2] = x_re[k1];
+                x_im[k2] = -x_im[k1];
+            }
+        }
+        this.transformInverse(x_re, x_im);
+        for (let n = 0; n < N; ++n) {
+            y[n] = x_re[n];
+        }
+    };
+
+    /**
+     *  Apply transform on two real signals at once (one in the real part, 
+     *  the other in the imaginary part).
+     * 
+     *  Note(s):
+     *    [1] The k-th output of the first signal (0 <= k <= N / 2) is stored 
+     *        at index k.
+     *    [2] The conjugate of the k-th output of the second signal 
+     *        (0 < k < N / 2) is stored at index N - k.
+     *    [3] The 0th output of the second signal (and the (N / 2)-th output 
+     *        if N is even) is stored at the imaginary part of index 0 (and 
+     *        index N / 2), the imaginary part of the same output of the 
+     *        first signal is always zero.
+     *  
+     *  @throws {LC3IllegalParameterError}
+     *    - Incorrect block size.
+     *  @param {Number[]} x_re 
+     *    - The first signal.
+     *  @param {Number[]} x_im 
+     *    - The second signal.
+     */
+    this.transformPairedReal = function(x_re, x_im) {
+        //  Check the block size.
+        if (x_re.length != N || x_im.length != N) {
+            throw new LC3IllegalParameterError("Incorrect block size.");
+        }
+
+        //  Apply transform.
+        if (mx_paired_func !== null) {
+            mx_paired_func.call(this, x_re, x_im);
+            return;
+        }
+        this.transform(x_re, x_im);
+
+        //  Split the outputs:
+        //    X1[k] = (Z[k] + conj(Z[N - k])) / 2,
+        //    X2[N - k] = (Z[N - k] - conj(Z[k])) / 2j.
+        for (let k1 = 1, k2 = N - 1; k1 < k2; ++k1, --k2) {
+            let a_re = x_re[k1], a_im = x_im[k1];
+            let c_re = x_re[k2], c_im = x_im[k2];
+            x_re[k1] = 0.5 * (a_re + c_re);
+            x_im[k1] = 0.5 * (a_im - c_im);
+            x_re[k2] = 0.5 * (a_im + c_im);
+            x_im[k2] = 0.5 * (a_re - c_re);
+        }
+    };
+
+    /**
+     *  Get the output indexes of transformPermuted().
+     * 
+     *  Note(s):
+     *    [1] The returned array shall not be modified.
+     * 
+     *  @returns {Number[]}
+     *    - The output indexes.
+     */
+    this.getPermutedOutputIndexes = function() {
+        return mx_perm_indexes;
+    };
+
+    //
+    //  Initialization.
+    //
+    if (mx_perm_indexes === null) {
+        mx_perm_indexes = new Array(N);
+        for (let k = 0; k < N; ++k) {
+            mx_perm_indexes[k] = k;
+        }
+    }
 }
 
 //
@@ -0,0 +1,2821 @@
+//
+//  Copyright 2021 - 2023 XiaoJSoft Studio. All rights reserved.
+//  Use of this source code is governed by a BSD-style license that can be
+//  found in the LICENSE.md file.
+//
+
+//
+//  Note(s):
+//    [1] This file is generated automatically by a MDCT compiler, which locates 
+//        at "./../../dev/mdct-generator/" directory.
+//        Do NOT modify this file manually.
+//
+
+//
+//  Private functions.
+//
+
+/**
+ *  Part 1 of ApplyWindowedIMDCT_W75_120_K60().
+ * 
+ *  @param {Number[]} X 
+ *    - The input block (120 points, only the first 60 points are used).
+ *  @param {Number[]} y 
+ *    - The array that would contain the output block (240 points).
+ *  @param {Number[]} re 
+ *    - The scratch buffer (real part, 60 points).
+ *  @param {Number[]} im 
+ *    - The scratch buffer (imaginary part, 60 points).
+ */
+function ApplyWindowedIMDCT_W75_120_K60_Part1(X, y, re, im) {
+    let t0, t1, t10, t11, t12, t13, t14, t2, t3, t4, t5, t6, t7, t8, t9;
+    const C0 = 0.9510565162951535;
+    const C1 = 0.3090169943749474;
+    const C2 = 0.8090169943749475;
+    const C3 = 0.5877852522924731;
+    const C4 = 0.5590169943749475;
+    const C5 = 0.25;
+    const C6 = 0.9238795325112867;
+    const C7 = 0.3826834323650898;
+    const C8 = 0.7604059656000309;
+    const C9 = 0.6494480483301837;
+    const C10 = 0.8526401643540922;
+    const C11 = 0.5224985647159488;
+    const C12 = 0.9723699203976766;
+    const C13 = 0.2334453638559054;
+    const C14 = 0.996917333733128;
+    const C15 = 0.07845909572784494;
+    const C16 = 0.8910065241883679;
+    const C17 = 0.45399049973954675;
+    const C18 = 0.9876883405951378;
+    const C19 = 0.15643446504023087;
+    const C20 = 0.8660254037844387;
+    const C21 = 0.49999999999999994;
+    const C22 = 0.7431448254773942;
+    const C23 = 0.6691306063588582;
+    const C24 = 0.9135454576426009;
+    const C25 = 0.40673664307580015;
+    const C26 = 0.9945218953682733;
+    const C27 = 0.10452846326765346;
+    const C28 = 0.9781476007338057;
+    const C29 = 0.20791169081775931;
+    const C30 = 0.7933533402912352;
+    const C31 = 0.6087614290087207;
+    const C32 = 0.9426414910921784;
+    const C33 = 0.33380685923377096;
+    const C34 = 0.9996573249755573;
+    const C35 = 0.02617694830787315;
+    const C36 = 0.958819734868193;
+    const C37 = 0.2840153447039226;
+    const C38 = 0.8241261886220156;
+    const C39 = 0.5664062369248328;
+    const C40 = 0.9659258262890683;
+    const C41 = 0.25881904510252074;
+    const C42 = 0.9986295347545738;
+    const C43 = 0.05233595624294383;
+    const C44 = 0.9335804264972017;
+    const C45 = 0.35836794954530027;
+    const C46 = 0.7771459614569709;
+    const C47 = 0.6293203910498375;
+    const C48 = 0.838670567945424;
+    const C49 = 0.544639035015027;
+    const C50 = 0.9914448613738104;
+    const C51 = 0.13052619222005157;
+    const C52 = 0.9025852843498606;
+    const C53 = 0.4305110968082951;
+    const C54 = 0.7253743710122876;
+    const C55 = 0.6883545756937539;
+    const C56 = 0.8788171126619654;
+    const C57 = 0.4771587602596084;
+    const C58 = 0.9832549075639546;
+    const C59 = 0.18223552549214747;
+    const C60 = 0.5;
+    const C61 = 0.8660254037844386;
+    const C62 = 0.9999785816641292;
+    const C63 = 0.006544937967351858;
+    const C64 = 0.4943212082861446;
+    const C65 = 0.8692793239451436;
+    const C66 = 0.8627343859777918;
+    const C67 = 0.5056573733779846;
+    const C68 = 0.8492021815265789;
+    const C69 = 0.528067850650368;
+    const C70 = 0.9994645874763657;
+    const C71 = 0.03271908282177614;
+    const C72 = 0.47139673682599764;
+    const C73 = 0.881921264348355;
+    const C74 = 0.44814919358922256;
+    const C75 = 0.8939587799699321;
+    const C76 = 0.8350879763187431;
+    const C77 = 0.5501164165954934;
+    const C78 = 0.9982656101847159;
+    const C79 = 0.05887080365118903;
+    const C80 = 0.9963824715083254;
+    const C81 = 0.08498217737244167;
+    const C82 = 0.4245945112807131;
+    const C83 = 0.9053836208979552;
+    const C84 = 0.8204014435255136;
+    const C85 = 0.5717879602276122;
+    const C86 = 0.8051526485628582;
+    const C87 = 0.5930676289532372;
+    const C88 = 0.9938164620563781;
+    const C89 = 0.11103530855427768;
+    const C90 = 0.40074883310314097;
+    const C91 = 0.916187957117136;
+    const C92 = 0.3766285016932107;
+    const C93 = 0.9263643838751181;
+    const C94 = 0.78935204219315;
+    const C95 = 0.6139408387503664;
+    const C96 = 0.9905693404435773;
+    const C97 = 0.13701234168196802;
+    const C98 = 0.986643332084879;
+    const C99 = 0.16289547339458874;
+    const C100 = 0.3522500479212335;
+    const C101 = 0.9359059267573258;
+    const C102 = 0.773010453362737;
+    const C103 = 0.6343932841636455;
+    const C104 = 0.7561390817803227;
+    const C105 = 0.6544109481086103;
+    const C106 = 0.9820411276703039;
+    const C107 = 0.18866696468655522;
+    const C108 = 0.3276301795616935;
+    const C109 = 0.944806046466878;
+    const C110 = 0.3027857698425746;
+    const C111 = 0.953058643306297;
+    const C112 = 0.7387494902412463;
+    const C113 = 0.6739801114782978;
+    const C114 = 0.9767658813208724;
+    const C115 = 0.21430915306505077;
+    const C116 = 0.9708212084269281;
+    const C117 = 0.23980446465501654;
+    const C118 = 0.2777338458812922;
+    const C119 = 0.9606580613579353;
+    const C120 = 0.7208535967029188;
+    const C121 = 0.6930873625456359;
+    const C122 = 0.7024636661168517;
+    const C123 = 0.7117196061551713;
+    const C124 = 0.9642111831703293;
+    const C125 = 0.265135426243408;
+    const C126 = 0.25249157701515795;
+    const C127 = 0.9675990923602598;
+    t0 = X[0];
+    t1 = X[24];
+    t2 = C0 * t1;
+    t1 = (-C1) * t1;
+    t3 = X[48];
+    t4 = C2 * t3;
+    t3 = (-C3) * t3;
+    t5 = X[47];
+    t6 = C2 * t5;
+    t5 = C3 * t5;
+    t7 = X[23];
+    t8 = C0 * t7;
+    t7 = C1 * t7;
+    t9 = t2 + t8;
+    t10 = t1 + t7;
+    t11 = t4 + t6;
+    t12 = t3 + t5;
+    t2 = t2 - t8;
+    t8 = t1 - t7;
+    t1 = t4 - t6;
+    t7 = t3 - t5;
+    t4 = t9 + t11;
+    t6 = t10 + t12;
+    t3 = t9 - t11;
+    t5 = C4 * t3;
+    t9 = t10 - t12;
+    t11 = C4 * t9;
+    t3 = C5 * t4;
+    t10 = t0 - t3;
+    t12 = C5 * t6;
+    t9 = -t12;
+    t3 = t10 + t5;
+    t12 = t11 - t12;
+    t10 = t10 - t5;
+    t5 = t9 - t11;
+    t9 = C0 * t2;
+    t11 = C3 * t1;
+    t9 = t9 + t11;
+    t11 = C0 * t8;
+    t13 = C3 * t7;
+    t11 = t11 + t13;
+    t13 = C3 * t2;
+    t2 = C0 * t1;
+    t1 = t13 - t2;
+    t13 = C3 * t8;
+    t2 = C0 * t7;
+    t8 = t13 - t2;
+    t7 = t0 + t4;
+    t13 = t3 + t11;
+    t2 = t12 - t9;
+    t0 = t10 + t8;
+    t4 = t5 - t1;
+    t10 = t10 - t8;
+    t8 = t5 + t1;
+    t5 = t3 - t11;
+    t1 = t12 + t9;
+    re[0] = t7;
+    im[0] = t6;
+    re[12] = t13;
+    im[12] = t2;
+    re[24] = t0;
+    im[24] = t4;
+    re[36] = t10;
+    im[36] = t8;
+    re[48] = t5;
+    im[48] = t1;
+    t3 = X[30];
+    t11 = C6 * t3;
+    t12 = (-C7) * t3;
+    t9 = X[54];
+    t7 = C8 * t9;
+    t6 = (-C9) * t9;
+    t13 = X[41];
+    t2 = C10 * t13;
+    t0 = C11 * t13;
+    t4 = X[17];
+    t10 = C12 * t4;
+    t8 = C13 * t4;
+    t5 = X[6];
+    t1 = C14 * t5;
+    t3 = (-C15) * t5;
+    t9 = t7 + t1;
+    t13 = t6 + t3;
+    t4 = t2 + t10;
+    t5 = t0 + t8;
+    t7 = t7 - t1;
+    t1 = t6 - t3;
+    t6 = t2 - t10;
+    t3 = t0 - t8;
+    t2 = t9 + t4;
+    t10 = t13 + t5;
+    t0 = t9 - t4;
+    t8 = C4 * t0;
+    t9 = t13 - t5;
+    t4 = C4 * t9;
+    t0 = C5 * t2;
+    t13 = t11 - t0;
+    t5 = C5 * t10;
+    t9 = t12 - t5;
+    t0 = t13 + t8;
+    t5 = t9 + t4;
+    t13 = t13 - t8;
+    t8 = t9 - t4;
+    t9 = C0 * t7;
+    t4 = C3 * t6;
+    t9 = t9 + t4;
+    t4 = C0 * t1;
+    t14 = C3 * t3;
+    t4 = t4 + t14;
+    t14 = C3 * t7;
+    t7 = C0 * t6;
+    t6 = t14 - t7;
+    t14 = C3 * t1;
+    t7 = C0 * t3;
+    t1 = t14 - t7;
+    t3 = t11 + t2;
+    t14 = t12 + t10;
+    t7 = t0 + t4;
+    t11 = t5 - t9;
+    t2 = t13 + t1;
+    t12 = t8 - t6;
+    t10 = t13 - t1;
+    t13 = t8 + t6;
+    t1 = t0 - t4;
+    t8 = t5 + t9;
+    re[15] = t3;
+    im[15] = t14;
+    re[27] = t7;
+    im[27] = t11;
+    re[39] = t2;
+    im[39] = t12;
+    re[51] = t10;
+    im[51] = t13;
+    re[3] = t1;
+    im[3] = t8;
+    t6 = X[59];
+    t0 = 0.7071067811865475 * t6;
+    t4 = 0.7071067811865476 * t6;
+    t5 = X[35];
+    t9 = C16 * t5;
+    t3 = C17 * t5;
+    t14 = X[11];
+    t7 = C18 * t14;
+    t11 = C19 * t14;
+    t2 = X[12];
+    t12 = C18 * t2;
+    t10 = (-C19) * t2;
+    t13 = X[36];
+    t1 = C16 * t13;
+    t8 = (-C17) * t13;
+    t6 = t9 + t1;
+    t5 = t3 + t8;
+    t14 = t7 + t12;
+    t2 = t11 + t10;
+    t13 = t9 - t1;
+    t9 = t3 - t8;
+    t1 = t7 - t12;
+    t3 = t11 - t10;
+    t8 = t6 + t14;
+    t7 = t5 + t2;
+    t12 = t6 - t14;
+    t11 = C4 * t12;
+    t10 = t5 - t2;
+    t6 = C4 * t10;
+    t14 = C5 * t8;
+    t12 = t0 - t14;
+    t5 = C5 * t7;
+    t2 = t4 - t5;
+    t10 = t12 + t11;
+    t14 = t2 + t6;
+    t5 = t12 - t11;
+    t12 = t2 - t6;
+    t11 = C0 * t13;
+    t2 = C3 * t1;
+    t6 = t11 + t2;
+    t11 = C0 * t9;
+    t2 = C3 * t3;
+    t11 = t11 + t2;
+    t2 = C3 * t13;
+    t13 = C0 * t1;
+    t1 = t2 - t13;
+    t2 = C3 * t9;
+    t13 = C0 * t3;
+    t9 = t2 - t13;
+    t3 = t0 + t8;
+    t2 = t4 + t7;
+    t13 = t10 + t11;
+    t0 = t14 - t6;
+    t8 = t5 + t9;
+    t4 = t12 - t1;
+    t7 = t5 - t9;
+    t5 = t12 + t1;
+    t9 = t10 - t11;
+    t12 = t14 + t6;
+    re[30] = t3;
+    im[30] = t2;
+    re[42] = t13;
+    im[42] = t0;
+    re[54] = t8;
+    im[54] = t4;
+    re[6] = t7;
+    im[6] = t5;
+    re[18] = t9;
+    im[18] = t12;
+    t1 = X[29];
+    t10 = C6 * t1;
+    t11 = C7 * t1;
+    t14 = X[5];
+    t6 = C14 * t14;
+    t3 = C15 * t14;
+    t2 = X[18];
+    t13 = C12 * t2;
+    t0 = (-C13) * t2;
+    t8 = X[42];
+    t4 = C10 * t8;
+    t7 = (-C11) * t8;
+    t5 = X[53];
+    t9 = C8 * t5;
+    t12 = C9 * t5;
+    t1 = t6 + t9;
+    t14 = t3 + t12;
+    t2 = t13 + t4;
+    t8 = t0 + t7;
+    t5 = t6 - t9;
+    t6 = t3 - t12;
+    t9 = t13 - t4;
+    t3 = t0 - t7;
+    t12 = t1 + t2;
+    t13 = t14 + t8;
+    t4 = t1 - t2;
+    t0 = C4 * t4;
+    t7 = t14 - t8;
+    t1 = C4 * t7;
+    t2 = C5 * t12;
+    t4 = t10 - t2;
+    t14 = C5 * t13;
+    t8 = t11 - t14;
+    t7 = t4 + t0;
+    t2 = t8 + t1;
+    t14 = t4 - t0;
+    t4 = t8 - t1;
+    t0 = C0 * t5;
+    t8 = C3 * t9;
+    t1 = t0 + t8;
+    t0 = C0 * t6;
+    t8 = C3 * t3;
+    t0 = t0 + t8;
+    t8 = C3 * t5;
+    t5 = C0 * t9;
+    t9 = t8 - t5;
+    t8 = C3 * t6;
+    t5 = C0 * t3;
+    t6 = t8 - t5;
+    t3 = t10 + t12;
+    t8 = t11 + t13;
+    t5 = t7 + t0;
+    t10 = t2 - t1;
+    t12 = t14 + t6;
+    t11 = t4 - t9;
+    t13 = t14 - t6;
+    t14 = t4 + t9;
+    t6 = t7 - t0;
+    t4 = t2 + t1;
+    re[45] = t3;
+    im[45] = t8;
+    re[57] = t5;
+    im[57] = t10;
+    re[9] = t12;
+    im[9] = t11;
+    re[21] = t13;
+    im[21] = t14;
+    re[33] = t6;
+    im[33] = t4;
+    t9 = re[0];
+    t7 = im[0];
+    t0 = re[15];
+    t2 = im[15];
+    t1 = re[30];
+    t3 = im[30];
+    t8 = re[45];
+    t5 = im[45];
+    t10 = t9 + t1;
+    t12 = t7 + t3;
+    t11 = t0 + t8;
+    t13 = t2 + t5;
+    t14 = t9 - t1;
+    t6 = t7 - t3;
+    t4 = t0 - t8;
+    t9 = t2 - t5;
+    t1 = t10 + t11;
+    t7 = t12 + t13;
+    t3 = t14 + t9;
+    t0 = t6 - t4;
+    t8 = t10 - t11;
+    t2 = t12 - t13;
+    t5 = t14 - t9;
+    t10 = t6 + t4;
+    re[0] = t1;
+    im[0] = t7;
+    re[15] = t3;
+    im[15] = t0;
+    re[30] = t8;
+    im[30] = t2;
+    re[45] = t5;
+    im[45] = t10;
+    t11 = re[12];
+    t12 = im[12];
+    t13 = re[27];
+    t14 = im[27];
+    t9 = re[42];
+    t6 = im[42];
+    t4 = re[57];
+    t1 = im[57];
+    t7 = t11 + t9;
+    t3 = t12 + t6;
+    t0 = t13 + t4;
+    t8 = t14 + t1;
+    t2 = t11 - t9;
+    t5 = t12 - t6;
+    t10 = t13 - t4;
+    t11 = t14 - t1;
+    t9 = t7 + t0;
+    t12 = t3 + t8;
+    t6 = t2 + t11;
+    t13 = t5 - t10;
+    t4 = t7 - t0;
+    t14 = t3 - t8;
+    t1 = t2 - t11;
+    t7 = t5 + t10;
+    re[12] = t9;
+    im[12] = t12;
+    re[27] = t6;
+    im[27] = t13;
+    re[42] = t4;
+    im[42] = t14;
+    re[57] = t1;
+    im[57] = t7;
+    t0 = re[24];
+    t3 = im[24];
+    t8 = re[39];
+    t2 = im[39];
+    t11 = re[54];
+    t5 = im[54];
+    t10 = re[9];
+    t9 = im[9];
+    t12 = t0 + t11;
+    t6 = t3 + t5;
+    t13 = t8 + t10;
+    t4 = t2 + t9;
+    t14 = t0 - t11;
+    t1 = t3 - t5;
+    t7 = t8 - t10;
+    t0 = t2 - t9;
+    t11 = t12 + t13;
+    t3 = t6 + t4;
+    t5 = t14 + t0;
+    t8 = t1 - t7;
+    t10 = t12 - t13;
+    t2 = t6 - t4;
+    t9 = t14 - t0;
+    t12 = t1 + t7;
+    re[24] = t11;
+    im[24] = t3;
+    re[39] = t5;
+    im[39] = t8;
+    re[54] = t10;
+    im[54] = t2;
+    re[9] = t9;
+    im[9] = t12;
+    t13 = re[36];
+    t6 = im[36];
+    t4 = re[51];
+    t14 = im[51];
+    t0 = re[6];
+    t1 = im[6];
+    t7 = re[21];
+    t11 = im[21];
+    t3 = t13 + t0;
+    t5 = t6 + t1;
+    t8 = t4 + t7;
+    t10 = t14 + t11;
+    t2 = t13 - t0;
+    t9 = t6 - t1;
+    t12 = t4 - t7;
+    t13 = t14 - t11;
+    t0 = t3 + t8;
+    t6 = t5 + t10;
+    t1 = t2 + t13;
+    t4 = t9 - t12;
+    t7 = t3 - t8;
+    t14 = t5 - t10;
+    t11 = t2 - t13;
+    t3 = t9 + t12;
+    re[36] = t0;
+    im[36] = t6;
+    re[51] = t1;
+    im[51] = t4;
+    re[6] = t7;
+    im[6] = t14;
+    re[21] = t11;
+    im[21] = t3;
+    t8 = re[48];
+    t5 = im[48];
+    t10 = re[3];
+    t2 = im[3];
+    t13 = re[18];
+    t9 = im[18];
+    t12 = re[33];
+    t0 = im[33];
+    t6 = t8 + t13;
+    t1 = t5 + t9;
+    t4 = t10 + t12;
+    t7 = t2 + t0;
+    t14 = t8 - t13;
+    t11 = t5 - t9;
+    t3 = t10 - t12;
+    t8 = t2 - t0;
+    t13 = t6 + t4;
+    t5 = t1 + t7;
+    t9 = t14 + t8;
+    t10 = t11 - t3;
+    t12 = t6 - t4;
+    t2 = t1 - t7;
+    t0 = t14 - t8;
+    t6 = t11 + t3;
+    re[48] = t13;
+    im[48] = t5;
+    re[3] = t9;
+    im[3] = t10;
+    re[18] = t12;
+    im[18] = t2;
+    re[33] = t0;
+    im[33] = t6;
+    t4 = X[40];
+    t1 = C20 * t4;
+    t7 = (-C21) * t4;
+    t14 = X[55];
+    t8 = C22 * t14;
+    t11 = C23 * t14;
+    t3 = X[31];
+    t13 = C24 * t3;
+    t5 = C25 * t3;
+    t9 = X[7];
+    t10 = C26 * t9;
+    t12 = C27 * t9;
+    t2 = X[16];
+    t0 = C28 * t2;
+    t6 = (-C29) * t2;
+    t4 = t8 + t0;
+    t14 = t11 + t6;
+    t3 = t13 + t10;
+    t9 = t5 + t12;
+    t2 = t8 - t0;
+    t8 = t11 - t6;
+    t0 = t13 - t10;
+    t11 = t5 - t12;
+    t6 = t4 + t3;
+    t13 = t14 + t9;
+    t10 = t4 - t3;
+    t5 = C4 * t10;
+    t12 = t14 - t9;
+    t4 = C4 * t12;
+    t3 = C5 * t6;
+    t10 = t1 - t3;
+    t14 = C5 * t13;
+    t9 = t7 - t14;
+    t12 = t10 + t5;
+    t3 = t9 + t4;
+    t14 = t10 - t5;
+    t10 = t9 - t4;
+    t5 = C0 * t2;
+    t9 = C3 * t0;
+    t4 = t5 + t9;
+    t5 = C0 * t8;
+    t9 = C3 * t11;
+    t5 = t5 + t9;
+    t9 = C3 * t2;
+    t2 = C0 * t0;
+    t0 = t9 - t2;
+    t9 = C3 * t8;
+    t2 = C0 * t11;
+    t8 = t9 - t2;
+    t11 = t1 + t6;
+    t9 = t7 + t13;
+    t2 = t12 + t5;
+    t1 = t3 - t4;
+    t6 = t14 + t8;
+    t7 = t10 - t0;
+    t13 = t14 - t8;
+    t14 = t10 + t0;
+    t8 = t12 - t5;
+    t10 = t3 + t4;
+    re[20] = t11;
+    im[20] = t9;
+    re[32] = t2;
+    im[32] = t1;
+    re[44] = t6;
+    im[44] = t7;
+    re[56] = t13;
+    im[56] = t14;
+    re[8] = t8;
+    im[8] = t10;
+    t0 = X[49];
+    t12 = C30 * t0;
+    t5 = C31 * t0;
+    t3 = X[25];
+    t4 = C32 * t3;
+    t11 = C33 * t3;
+    t9 = X[1];
+    t2 = C34 * t9;
+    t1 = C35 * t9;
+    t6 = X[22];
+    t7 = C36 * t6;
+    t13 = (-C37) * t6;
+    t14 = X[46];
+    t8 = C38 * t14;
+    t10 = (-C39) * t14;
+    t0 = t4 + t8;
+    t3 = t11 + t10;
+    t9 = t2 + t7;
+    t6 = t1 + t13;
+    t14 = t4 - t8;
+    t4 = t11 - t10;
+    t8 = t2 - t7;
+    t11 = t1 - t13;
+    t10 = t0 + t9;
+    t2 = t3 + t6;
+    t7 = t0 - t9;
+    t1 = C4 * t7;
+    t13 = t3 - t6;
+    t0 = C4 * t13;
+    t9 = C5 * t10;
+    t7 = t12 - t9;
+    t3 = C5 * t2;
+    t6 = t5 - t3;
+    t13 = t7 + t1;
+    t9 = t6 + t0;
+    t3 = t7 - t1;
+    t7 = t6 - t0;
+    t1 = C0 * t14;
+    t6 = C3 * t8;
+    t0 = t1 + t6;
+    t1 = C0 * t4;
+    t6 = C3 * t11;
+    t1 = t1 + t6;
+    t6 = C3 * t14;
+    t14 = C0 * t8;
+    t8 = t6 - t14;
+    t6 = C3 * t4;
+    t14 = C0 * t11;
+    t4 = t6 - t14;
+    t11 = t12 + t10;
+    t6 = t5 + t2;
+    t14 = t13 + t1;
+    t12 = t9 - t0;
+    t10 = t3 + t4;
+    t5 = t7 - t8;
+    t2 = t3 - t4;
+    t3 = t7 + t8;
+    t4 = t13 - t1;
+    t7 = t9 + t0;
+    re[35] = t11;
+    im[35] = t6;
+    re[47] = t14;
+    im[47] = t12;
+    re[59] = t10;
+    im[59] = t5;
+    re[11] = t2;
+    im[11] = t3;
+    re[23] = t4;
+    im[23] = t7;
+    t8 = X[19];
+    t13 = C40 * t8;
+    t1 = C41 * t8;
+    t9 = X[4];
+    t0 = C42 * t9;
+    t11 = (-C43) * t9;
+    t6 = X[28];
+    t14 = C44 * t6;
+    t12 = (-C45) * t6;
+    t10 = X[52];
+    t5 = C46 * t10;
+    t2 = (-C47) * t10;
+    t3 = X[43];
+    t4 = C48 * t3;
+    t7 = C49 * t3;
+    t8 = t0 + t4;
+    t9 = t11 + t7;
+    t6 = t14 + t5;
+    t10 = t12 + t2;
+    t3 = t0 - t4;
+    t0 = t11 - t7;
+    t4 = t14 - t5;
+    t11 = t12 - t2;
+    t7 = t8 + t6;
+    t14 = t9 + t10;
+    t5 = t8 - t6;
+    t12 = C4 * t5;
+    t2 = t9 - t10;
+    t8 = C4 * t2;
+    t6 = C5 * t7;
+    t5 = t13 - t6;
+    t9 = C5 * t14;
+    t10 = t1 - t9;
+    t2 = t5 + t12;
+    t6 = t10 + t8;
+    t9 = t5 - t12;
+    t5 = t10 - t8;
+    t12 = C0 * t3;
+    t10 = C3 * t4;
+    t8 = t12 + t10;
+    t12 = C0 * t0;
+    t10 = C3 * t11;
+    t12 = t12 + t10;
+    t10 = C3 * t3;
+    t3 = C0 * t4;
+    t4 = t10 - t3;
+    t10 = C3 * t0;
+    t3 = C0 * t11;
+    t0 = t10 - t3;
+    t11 = t13 + t7;
+    t10 = t1 + t14;
+    t3 = t2 + t12;
+    t13 = t6 - t8;
+    t7 = t9 + t0;
+    t1 = t5 - t4;
+    t14 = t9 - t0;
+    t9 = t5 + t4;
+    t0 = t2 - t12;
+    t5 = t6 + t8;
+    re[50] = t11;
+    im[50] = t10;
+    re[2] = t3;
+    im[2] = t13;
+    re[14] = t7;
+    im[14] = t1;
+    re[26] = t14;
+    im[26] = t9;
+    re[38] = t0;
+    im[38] = t5;
+    t4 = X[10];
+    t2 = C50 * t4;
+    t12 = (-C51) * t4;
+    t6 = X[34];
+    t8 = C52 * t6;
+    t11 = (-C53) * t6;
+    t10 = X[58];
+    t3 = C54 * t10;
+    t13 = (-C55) * t10;
+    t7 = X[37];
+    t1 = C56 * t7;
+    t14 = C57 * t7;
+    t9 = X[13];
+    t0 = C58 * t9;
+    t5 = C59 * t9;
+    t4 = t8 + t0;
+    t6 = t11 + t5;
+    t10 = t3 + t1;
+    t7 = t13 + t14;
+    t9 = t8 - t0;
+    t8 = t11 - t5;
+    t0 = t3 - t1;
+    t11 = t13 - t14;
+    t5 = t4 + t10;
+    t3 = t6 + t7;
+    t1 = t4 - t10;
+    t13 = C4 * t1;
+    t14 = t6 - t7;
+    t4 = C4 * t14;
+    t10 = C5 * t5;
+    t1 = t2 - t10;
+    t6 = C5 * t3;
+    t7 = t12 - t6;
+    t14 = t1 + t13;
+    t10 = t7 + t4;
+    t6 = t1 - t13;
+    t1 = t7 - t4;
+    t13 = C0 * t9;
+    t7 = C3 * t0;
+    t4 = t13 + t7;
+    t13 = C0 * t8;
+    t7 = C3 * t11;
+    t13 = t13 + t7;
+    t7 = C3 * t9;
+    t9 = C0 * t0;
+    t0 = t7 - t9;
+    t7 = C3 * t8;
+    t9 = C0 * t11;
+    t8 = t7 - t9;
+    t11 = t2 + t5;
+    t7 = t12 + t3;
+    t9 = t14 + t13;
+    t2 = t10 - t4;
+    t5 = t6 + t8;
+    t12 = t1 - t0;
+    t3 = t6 - t8;
+    t6 = t1 + t0;
+    t8 = t14 - t13;
+    t1 = t10 + t4;
+    re[5] = t11;
+    im[5] = t7;
+    re[17] = t9;
+    im[17] = t2;
+    re[29] = t5;
+    im[29] = t12;
+    re[41] = t3;
+    im[41] = t6;
+    re[53] = t8;
+    im[53] = t1;
+    t0 = re[20];
+    t14 = im[20];
+    t13 = re[35];
+    t10 = im[35];
+    t4 = re[50];
+    t11 = im[50];
+    t7 = re[5];
+    t9 = im[5];
+    t2 = t0 + t4;
+    t5 = t14 + t11;
+    t12 = t13 + t7;
+    t3 = t10 + t9;
+    t6 = t0 - t4;
+    t8 = t14 - t11;
+    t1 = t13 - t7;
+    t0 = t10 - t9;
+    t4 = t2 + t12;
+    t14 = t5 + t3;
+    t11 = t6 + t0;
+    t13 = t8 - t1;
+    t7 = t2 - t12;
+    t10 = t5 - t3;
+    t9 = t6 - t0;
+    t2 = t8 + t1;
+    re[20] = t4;
+    im[20] = t14;
+    re[35] = t11;
+    im[35] = t13;
+    re[50] = t7;
+    im[50] = t10;
+    re[5] = t9;
+    im[5] = t2;
+    t12 = re[32];
+    t5 = im[32];
+    t3 = re[47];
+    t6 = im[47];
+    t0 = re[2];
+    t8 = im[2];
+    t1 = re[17];
+    t4 = im[17];
+    t14 = t12 + t0;
+    t11 = t5 + t8;
+    t13 = t3 + t1;
+    t7 = t6 + t4;
+    t10 = t12 - t0;
+    t9 = t5 - t8;
+    t2 = t3 - t1;
+    t12 = t6 - t4;
+    t0 = t14 + t13;
+    t5 = t11 + t7;
+    t8 = t10 + t12;
+    t3 = t9 - t2;
+    t1 = t14 - t13;
+    t6 = t11 - t7;
+    t4 = t10 - t12;
+    t14 = t9 + t2;
+    re[32] = t0;
+    im[32] = t5;
+    re[47] = t8;
+    im[47] = t3;
+    re[2] = t1;
+    im[2] = t6;
+    re[17] = t4;
+    im[17] = t14;
+    t13 = re[44];
+    t11 = im[44];
+    t7 = re[59];
+    t10 = im[59];
+    t12 = re[14];
+    t9 = im[14];
+    t2 = re[29];
+    t0 = im[29];
+    t5 = t13 + t12;
+    t8 = t11 + t9;
+    t3 = t7 + t2;
+    t1 = t10 + t0;
+    t6 = t13 - t12;
+    t4 = t11 - t9;
+    t14 = t7 - t2;
+    t13 = t10 - t0;
+    t12 = t5 + t3;
+    t11 = t8 + t1;
+    t9 = t6 + t13;
+    t7 = t4 - t14;
+    t2 = t5 - t3;
+    t10 = t8 - t1;
+    t0 = t6 - t13;
+    t5 = t4 + t14;
+    re[44] = t12;
+    im[44] = t11;
+    re[59] = t9;
+    im[59] = t7;
+    re[14] = t2;
+    im[14] = t10;
+    re[29] = t0;
+    im[29] = t5;
+    t3 = re[56];
+    t8 = im[56];
+    t1 = re[11];
+    t6 = im[11];
+    t13 = re[26];
+    t4 = im[26];
+    t14 = re[41];
+    t12 = im[41];
+    t11 = t3 + t13;
+    t9 = t8 + t4;
+    t7 = t1 + t14;
+    t2 = t6 + t12;
+    t10 = t3 - t13;
+    t0 = t8 - t4;
+    t5 = t1 - t14;
+    t3 = t6 - t12;
+    t13 = t11 + t7;
+    t8 = t9 + t2;
+    t4 = t10 + t3;
+    t1 = t0 - t5;
+    t14 = t11 - t7;
+    t6 = t9 - t2;
+    t12 = t10 - t3;
+    t11 = t0 + t5;
+    re[56] = t13;
+    im[56] = t8;
+    re[11] = t4;
+    im[11] = t1;
+    re[26] = t14;
+    im[26] = t6;
+    re[41] = t12;
+    im[41] = t11;
+    t7 = re[8];
+    t9 = im[8];
+    t2 = re[23];
+    t10 = im[23];
+    t3 = re[38];
+    t0 = im[38];
+    t5 = re[53];
+    t13 = im[53];
+    t8 = t7 + t3;
+    t4 = t9 + t0;
+    t1 = t2 + t5;
+    t14 = t10 + t13;
+    t6 = t7 - t3;
+    t12 = t9 - t0;
+    t11 = t2 - t5;
+    t7 = t10 - t13;
+    t3 = t8 + t1;
+    t9 = t4 + t14;
+    t0 = t6 + t7;
+    t2 = t12 - t11;
+    t5 = t8 - t1;
+    t10 = t4 - t14;
+    t13 = t6 - t7;
+    t8 = t12 + t11;
+    re[8] = t3;
+    im[8] = t9;
+    re[23] = t0;
+    im[23] = t2;
+    re[38] = t5;
+    im[38] = t10;
+    re[53] = t13;
+    im[53] = t8;
+    t1 = X[39];
+    t4 = C20 * t1;
+    t14 = C21 * t1;
+    t6 = X[15];
+    t7 = C28 * t6;
+    t12 = C29 * t6;
+    t11 = X[8];
+    t3 = C26 * t11;
+    t9 = (-C27) * t11;
+    t0 = X[32];
+    t2 = C24 * t0;
+    t5 = (-C25) * t0;
+    t10 = X[56];
+    t13 = C22 * t10;
+    t8 = (-C23) * t10;
+    t1 = t7 + t13;
+    t6 = t12 + t8;
+    t11 = t3 + t2;
+    t0 = t9 + t5;
+    t10 = t7 - t13;
+    t7 = t12 - t8;
+    t13 = t3 - t2;
+    t12 = t9 - t5;
+    t8 = t1 + t11;
+    t3 = t6 + t0;
+    t2 = t1 - t11;
+    t9 = C4 * t2;
+    t5 = t6 - t0;
+    t1 = C4 * t5;
+    t11 = C5 * t8;
+    t2 = t4 - t11;
+    t6 = C5 * t3;
+    t0 = t14 - t6;
+    t5 = t2 + t9;
+    t11 = t0 + t1;
+    t6 = t2 - t9;
+    t2 = t0 - t1;
+    t9 = C0 * t10;
+    t0 = C3 * t13;
+    t1 = t9 + t0;
+    t9 = C0 * t7;
+    t0 = C3 * t12;
+    t9 = t9 + t0;
+    t0 = C3 * t10;
+    t10 = C0 * t13;
+    t13 = t0 - t10;
+    t0 = C3 * t7;
+    t10 = C0 * t12;
+    t7 = t0 - t10;
+    t12 = t4 + t8;
+    t0 = t14 + t3;
+    t10 = t5 + t9;
+    t4 = t11 - t1;
+    t8 = t6 + t7;
+    t14 = t2 - t13;
+    t3 = t6 - t7;
+    t6 = t2 + t13;
+    t7 = t5 - t9;
+    t2 = t11 + t1;
+    re[40] = t12;
+    im[40] = t0;
+    re[52] = t10;
+    im[52] = t4;
+    re[4] = t8;
+    im[4] = t14;
+    re[16] = t3;
+    im[16] = t6;
+    re[28] = t7;
+    im[28] = t2;
+    t13 = X[9];
+    t5 = C50 * t13;
+    t9 = C51 * t13;
+    t11 = X[14];
+    t1 = C58 * t11;
+    t12 = (-C59) * t11;
+    t0 = X[38];
+    t10 = C56 * t0;
+    t4 = (-C57) * t0;
+    t8 = X[57];
+    t14 = C54 * t8;
+    t3 = C55 * t8;
+    t6 = X[33];
+    t7 = C52 * t6;
+    t2 = C53 * t6;
+    t13 = t1 + t7;
+    t11 = t12 + t2;
+    t0 = t10 + t14;
+    t8 = t4 + t3;
+    t6 = t1 - t7;
+    t1 = t12 - t2;
+    t7 = t10 - t14;
+    t12 = t4 - t3;
+    t2 = t13 + t0;
+    t10 = t11 + t8;
+    t14 = t13 - t0;
+    t4 = C4 * t14;
+    t3 = t11 - t8;
+    t13 = C4 * t3;
+    t0 = C5 * t2;
+    t14 = t5 - t0;
+    t11 = C5 * t10;
+    t8 = t9 - t11;
+    t3 = t14 + t4;
+    t0 = t8 + t13;
+    t11 = t14 - t4;
+    t14 = t8 - t13;
+    t4 = C0 * t6;
+    t8 = C3 * t7;
+    t13 = t4 + t8;
+    t4 = C0 * t1;
+    t8 = C3 * t12;
+    t4 = t4 + t8;
+    t8 = C3 * t6;
+    t6 = C0 * t7;
+    t7 = t8 - t6;
+    t8 = C3 * t1;
+    t6 = C0 * t12;
+    t1 = t8 - t6;
+    t12 = t5 + t2;
+    t8 = t9 + t10;
+    t6 = t3 + t4;
+    t5 = t0 - t13;
+    t2 = t11 + t1;
+    t9 = t14 - t7;
+    t10 = t11 - t1;
+    t11 = t14 + t7;
+    t1 = t3 - t4;
+    t14 = t0 + t13;
+    re[55] = t12;
+    im[55] = t8;
+    re[7] = t6;
+    im[7] = t5;
+    re[19] = t2;
+    im[19] = t9;
+    re[31] = t10;
+    im[31] = t11;
+    re[43] = t1;
+    im[43] = t14;
+    t7 = X[20];
+    t3 = C40 * t7;
+    t4 = (-C41) * t7;
+    t0 = X[44];
+    t13 = C48 * t0;
+    t12 = (-C49) * t0;
+    t8 = X[51];
+    t6 = C46 * t8;
+    t5 = C47 * t8;
+    t2 = X[27];
+    t9 = C44 * t2;
+    t10 = C45 * t2;
+    t11 = X[3];
+    t1 = C42 * t11;
+    t14 = C43 * t11;
+    t7 = t13 + t1;
+    t0 = t12 + t14;
+    t8 = t6 + t9;
+    t2 = t5 + t10;
+    t11 = t13 - t1;
+    t13 = t12 - t14;
+    t1 = t6 - t9;
+    t12 = t5 - t10;
+    t14 = t7 + t8;
+    t6 = t0 + t2;
+    t9 = t7 - t8;
+    t5 = C4 * t9;
+    t10 = t0 - t2;
+    t7 = C4 * t10;
+    t8 = C5 * t14;
+    t9 = t3 - t8;
+    t0 = C5 * t6;
+    t2 = t4 - t0;
+    t10 = t9 + t5;
+    t8 = t2 + t7;
+    t0 = t9 - t5;
+    t9 = t2 - t7;
+    t5 = C0 * t11;
+    t2 = C3 * t1;
+    t7 = t5 + t2;
+    t5 = C0 * t13;
+    t2 = C3 * t12;
+    t5 = t5 + t2;
+    t2 = C3 * t11;
+    t11 = C0 * t1;
+    t1 = t2 - t11;
+    t2 = C3 * t13;
+    t11 = C0 * t12;
+    t13 = t2 - t11;
+    t12 = t3 + t14;
+    t2 = t4 + t6;
+    t11 = t10 + t5;
+    t3 = t8 - t7;
+    t14 = t0 + t13;
+    t4 = t9 - t1;
+    t6 = t0 - t13;
+    t0 = t9 + t1;
+    t13 = t10 - t5;
+    t9 = t8 + t7;
+    re[10] = t12;
+    im[10] = t2;
+    re[22] = t11;
+    im[22] = t3;
+    re[34] = t14;
+    im[34] = t4;
+    re[46] = t6;
+    im[46] = t0;
+    re[58] = t13;
+    im[58] = t9;
+    t1 = X[50];
+    t10 = C30 * t1;
+    t5 = (-C31) * t1;
+    t8 = X[45];
+    t7 = C38 * t8;
+    t12 = C39 * t8;
+    t2 = X[21];
+    t11 = C36 * t2;
+    t3 = C37 * t2;
+    t14 = X[2];
+    t4 = C34 * t14;
+    t6 = (-C35) * t14;
+    t0 = X[26];
+    t13 = C32 * t0;
+    t9 = (-C33) * t0;
+    t1 = t7 + t13;
+    t8 = t12 + t9;
+    t2 = t11 + t4;
+    t14 = t3 + t6;
+    t0 = t7 - t13;
+    t7 = t12 - t9;
+    t13 = t11 - t4;
+    t12 = t3 - t6;
+    t9 = t1 + t2;
+    t11 = t8 + t14;
+    t4 = t1 - t2;
+    t3 = C4 * t4;
+    t6 = t8 - t14;
+    t1 = C4 * t6;
+    t2 = C5 * t9;
+    t4 = t10 - t2;
+    t8 = C5 * t11;
+    t14 = t5 - t8;
+    t6 = t4 + t3;
+    t2 = t14 + t1;
+    t8 = t4 - t3;
+    t4 = t14 - t1;
+    t3 = C0 * t0;
+    t14 = C3 * t13;
+    t1 = t3 + t14;
+    t3 = C0 * t7;
+    t14 = C3 * t12;
+    t3 = t3 + t14;
+    t14 = C3 * t0;
+    t0 = C0 * t13;
+    t13 = t14 - t0;
+    t14 = C3 * t7;
+    t0 = C0 * t12;
+    t7 = t14 - t0;
+    t12 = t10 + t9;
+    t14 = t5 + t11;
+    t0 = t6 + t3;
+    t10 = t2 - t1;
+    t9 = t8 + t7;
+    t5 = t4 - t13;
+    t11 = t8 - t7;
+    t8 = t4 + t13;
+    t7 = t6 - t3;
+    t4 = t2 + t1;
+    re[25] = t12;
+    im[25] = t14;
+    re[37] = t0;
+    im[37] = t10;
+    re[49] = t9;
+    im[49] = t5;
+    re[1] = t11;
+    im[1] = t8;
+    re[13] = t7;
+    im[13] = t4;
+    t13 = re[40];
+    t6 = im[40];
+    t3 = re[55];
+    t2 = im[55];
+    t1 = re[10];
+    t12 = im[10];
+    t14 = re[25];
+    t0 = im[25];
+    t10 = t13 + t1;
+    t9 = t6 + t12;
+    t5 = t3 + t14;
+    t11 = t2 + t0;
+    t8 = t13 - t1;
+    t7 = t6 - t12;
+    t4 = t3 - t14;
+    t13 = t2 - t0;
+    t1 = t10 + t5;
+    t6 = t9 + t11;
+    t12 = t8 + t13;
+    t3 = t7 - t4;
+    t14 = t10 - t5;
+    t2 = t9 - t11;
+    t0 = t8 - t13;
+    t10 = t7 + t4;
+    re[40] = t1;
+    im[40] = t6;
+    re[55] = t12;
+    im[55] = t3;
+    re[10] = t14;
+    im[10] = t2;
+    re[25] = t0;
+    im[25] = t10;
+    t5 = re[52];
+    t9 = im[52];
+    t11 = re[7];
+    t8 = im[7];
+    t13 = re[22];
+    t7 = im[22];
+    t4 = re[37];
+    t1 = im[37];
+    t6 = t5 + t13;
+    t12 = t9 + t7;
+    t3 = t11 + t4;
+    t14 = t8 + t1;
+    t2 = t5 - t13;
+    t0 = t9 - t7;
+    t10 = t11 - t4;
+    t5 = t8 - t1;
+    t13 = t6 + t3;
+    t9 = t12 + t14;
+    t7 = t2 + t5;
+    t11 = t0 - t10;
+    t4 = t6 - t3;
+    t8 = t12 - t14;
+    t1 = t2 - t5;
+    t6 = t0 + t10;
+    re[52] = t13;
+    im[52] = t9;
+    re[7] = t7;
+    im[7] = t11;
+    re[22] = t4;
+    im[22] = t8;
+    re[37] = t1;
+    im[37] = t6;
+    t3 = re[4];
+    t12 = im[4];
+    t14 = re[19];
+    t2 = im[19];
+    t5 = re[34];
+    t0 = im[34];
+    t10 = re[49];
+    t13 = im[49];
+    t9 = t3 + t5;
+    t7 = t12 + t0;
+    t11 = t14 + t10;
+    t4 = t2 + t13;
+    t8 = t3 - t5;
+    t1 = t12 - t0;
+    t6 = t14 - t10;
+    t3 = t2 - t13;
+    t5 = t9 + t11;
+    t12 = t7 + t4;
+    t0 = t8 + t3;
+    t14 = t1 - t6;
+    t10 = t9 - t11;
+    t2 = t7 - t4;
+    t13 = t8 - t3;
+    t9 = t1 + t6;
+    re[4] = t5;
+    im[4] = t12;
+    re[19] = t0;
+    im[19] = t14;
+    re[34] = t10;
+    im[34] = t2;
+    re[49] = t13;
+    im[49] = t9;
+    t11 = re[16];
+    t7 = im[16];
+    t4 = re[31];
+    t8 = im[31];
+    t3 = re[46];
+    t1 = im[46];
+    t6 = re[1];
+    t5 = im[1];
+    t12 = t11 + t3;
+    t0 = t7 + t1;
+    t14 = t4 + t6;
+    t10 = t8 + t5;
+    t2 = t11 - t3;
+    t13 = t7 - t1;
+    t9 = t4 - t6;
+    t11 = t8 - t5;
+    t3 = t12 + t14;
+    t7 = t0 + t10;
+    t1 = t2 + t11;
+    t4 = t13 - t9;
+    t6 = t12 - t14;
+    t8 = t0 - t10;
+    t5 = t2 - t11;
+    t12 = t13 + t9;
+    re[16] = t3;
+    im[16] = t7;
+    re[31] = t1;
+    im[31] = t4;
+    re[46] = t6;
+    im[46] = t8;
+    re[1] = t5;
+    im[1] = t12;
+    t14 = re[28];
+    t0 = im[28];
+    t10 = re[43];
+    t2 = im[43];
+    t11 = re[58];
+    t13 = im[58];
+    t9 = re[13];
+    t3 = im[13];
+    t7 = t14 + t11;
+    t1 = t0 + t13;
+    t4 = t10 + t9;
+    t6 = t2 + t3;
+    t8 = t14 - t11;
+    t5 = t0 - t13;
+    t12 = t10 - t9;
+    t14 = t2 - t3;
+    t11 = t7 + t4;
+    t0 = t1 + t6;
+    t13 = t8 + t14;
+    t10 = t5 - t12;
+    t9 = t7 - t4;
+    t2 = t1 - t6;
+    t3 = t8 - t14;
+    t7 = t5 + t12;
+    re[28] = t11;
+    im[28] = t0;
+    re[43] = t13;
+    im[43] = t10;
+    re[58] = t9;
+    im[58] = t2;
+    re[13] = t3;
+    im[13] = t7;
+    t4 = re[0];
+    t1 = im[0];
+    t6 = re[20];
+    t8 = im[20];
+    t14 = re[40];
+    t5 = im[40];
+    t12 = t6 + t14;
+    t11 = t8 + t5;
+    t0 = C60 * t12;
+    t13 = t4 - t0;
+    t10 = C60 * t11;
+    t9 = t1 - t10;
+    t2 = t6 - t14;
+    t3 = C61 * t2;
+    t7 = t8 - t5;
+    t0 = C61 * t7;
+    t10 = t4 + t12;
+    t6 = t1 + t11;
+    t14 = t13 + t0;
+    t2 = t9 - t3;
+    t8 = t13 - t0;
+    t5 = t9 + t3;
+    t7 = (-C62) * t10;
+    t4 = (-C63) * t6;
+    t12 = t7 + t4;
+    t1 = 0.12620200671712 * t12;
+    y[179] = t1;
+    t11 = 0.12459782471033913 * t12;
+    y[180] = t11;
+    t13 = C63 * t10;
+    t0 = (-C62) * t6;
+    t9 = t13 + t0;
+    t3 = 0.06490876847639243 * t9;
+    y[59] = t3;
+    t7 = (-0.06797970597338741) * t9;
+    y[60] = t7;
+    t4 = C64 * t14;
+    t1 = C65 * t2;
+    t12 = t4 + t1;
+    y[20] = 0;
+    t11 = (-0.1295686646576704) * t12;
+    y[99] = t11;
+    t10 = (-C65) * t14;
+    t6 = C64 * t2;
+    t13 = t10 + t6;
+    t0 = 0.12863192432137183 * t13;
+    y[140] = t0;
+    t3 = 0.021754981570668463 * t13;
+    y[219] = t3;
+    t9 = (-C66) * t8;
+    t7 = (-C67) * t5;
+    t4 = t9 + t7;
+    t1 = 0.12841755868299887 * t4;
+    y[139] = t1;
+    t12 = 0.01971225071410094 * t4;
+    y[220] = t12;
+    t11 = C67 * t8;
+    t14 = (-C66) * t5;
+    t2 = t11 + t14;
+    y[19] = 0;
+    t10 = (-0.12978495182118074) * t2;
+    y[100] = t10;
+    t6 = re[27];
+    t0 = im[27];
+    t13 = re[47];
+    t3 = im[47];
+    t9 = re[7];
+    t7 = im[7];
+    t1 = t13 + t9;
+    t4 = t3 + t7;
+    t12 = C60 * t1;
+    t8 = t6 - t12;
+    t5 = C60 * t4;
+    t11 = t0 - t5;
+    t14 = t13 - t9;
+    t2 = C61 * t14;
+    t10 = t3 - t7;
+    t12 = C61 * t10;
+    t5 = t6 + t1;
+    t13 = t0 + t4;
+    t9 = t8 + t12;
+    t14 = t11 - t2;
+    t3 = t8 - t12;
+    t7 = t11 + t2;
+    t10 = (-C68) * t5;
+    t6 = (-C69) * t13;
+    t1 = t10 + t6;
+    t0 = 0.12808820336608326 * t1;
+    y[137] = t0;
+    t4 = 0.01593336020836991 * t1;
+    y[222] = t4;
+    t8 = C69 * t5;
+    t12 = (-C68) * t13;
+    t11 = t8 + t12;
+    y[17] = 0;
+    t2 = (-0.13011867001547664) * t11;
+    y[102] = t2;
+    t10 = (-C70) * t9;
+    t6 = (-C71) * t14;
+    t0 = t10 + t6;
+    t1 = 0.12907968222318938 * t0;
+    y[177] = t1;
+    t4 = 0.12106472436196737 * t0;
+    y[182] = t4;
+    t5 = C71 * t9;
+    t13 = (-C70) * t14;
+    t8 = t5 + t13;
+    t12 = 0.05872448364572954 * t8;
+    y[57] = t12;
+    t11 = (-0.07404111225089935) * t8;
+    y[62] = t11;
+    t2 = C72 * t3;
+    t10 = C73 * t7;
+    t6 = t2 + t10;
+    y[22] = 0;
+    t1 = (-0.1290330442355771) * t6;
+    y[97] = t1;
+    t0 = (-C73) * t3;
+    t4 = C72 * t7;
+    t9 = t0 + t4;
+    t14 = 0.1291658796814725 * t9;
+    y[142] = t14;
+    t5 = 0.026131072792527615 * t9;
+    y[217] = t5;
+    t13 = re[54];
+    t12 = im[54];
+    t8 = re[14];
+    t11 = im[14];
+    t2 = re[34];
+    t10 = im[34];
+    t6 = t8 + t2;
+    t1 = t11 + t10;
+    t3 = C60 * t6;
+    t7 = t13 - t3;
+    t0 = C60 * t1;
+    t4 = t12 - t0;
+    t14 = t8 - t2;
+    t9 = C61 * t14;
+    t5 = t11 - t10;
+    t3 = C61 * t5;
+    t0 = t13 + t6;
+    t8 = t12 + t1;
+    t2 = t7 + t3;
+    t14 = t4 - t9;
+    t11 = t7 - t3;
+    t10 = t4 + t9;
+    t5 = C74 * t0;
+    t13 = C75 * t8;
+    t6 = t5 + t13;
+    y[24] = 0;
+    t12 = (-0.12835772813882737) * t6;
+    y[95] = t12;
+    t1 = (-C75) * t0;
+    t7 = C74 * t8;
+    t3 = t1 + t7;
+    t4 = 0.12984544762774675 * t3;
+    y[144] = t4;
+    t9 = 0.0308764483656392 * t3;
+    y[215] = t9;
+    t5 = (-C76) * t2;
+    t13 = (-C77) * t14;
+    t6 = t5 + t13;
+    t12 = 0.12788347061217586 * t6;
+    y[135] = t12;
+    t0 = 0.012572306868533882 * t6;
+    y[224] = t0;
+    t8 = C77 * t2;
+    t1 = (-C76) * t14;
+    t7 = t8 + t1;
+    y[15] = 0;
+    t4 = (-0.13032698117187178) * t7;
+    y[104] = t4;
+    t3 = (-C78) * t11;
+    t9 = (-C79) * t10;
+    t5 = t3 + t9;
+    t13 = 0.13151131774241775 * t5;
+    y[175] = t13;
+    t12 = 0.11710982065184652 * t5;
+    y[184] = t12;
+    t6 = C79 * t11;
+    t0 = (-C78) * t10;
+    t2 = t6 + t0;
+    t14 = 0.05254269484584441 * t2;
+    y[55] = t14;
+    t8 = (-0.07994293781845482) * t2;
+    y[64] = t8;
+    t1 = re[21];
+    t7 = im[21];
+    t4 = re[41];
+    t3 = im[41];
+    t9 = re[1];
+    t13 = im[1];
+    t5 = t4 + t9;
+    t12 = t3 + t13;
+    t11 = C60 * t5;
+    t10 = t1 - t11;
+    t6 = C60 * t12;
+    t0 = t7 - t6;
+    t14 = t4 - t9;
+    t2 = C61 * t14;
+    t8 = t3 - t13;
+    t11 = C61 * t8;
+    t6 = t1 + t5;
+    t4 = t7 + t12;
+    t9 = t10 + t11;
+    t14 = t0 - t2;
+    t3 = t10 - t11;
+    t13 = t0 + t2;
+    t8 = (-C80) * t6;
+    t1 = (-C81) * t4;
+    t5 = t8 + t1;
+    t7 = 0.1335004207756719 * t5;
+    y[173] = t7;
+    t12 = 0.11275555822546786 * t5;
+    y[186] = t12;
+    t10 = C81 * t6;
+    t11 = (-C80) * t4;
+    t0 = t10 + t11;
+    t2 = 0.04643450102705312 * t0;
+    y[53] = t2;
+    t8 = (-0.08562458841720233) * t0;
+    y[66] = t8;
+    t1 = C82 * t9;
+    t7 = C83 * t14;
+    t5 = t1 + t7;
+    y[26] = 0;
+    t12 = (-0.1275421331596694) * t5;
+    y[93] = t12;
+    t6 = (-C83) * t9;
+    t4 = C82 * t14;
+    t10 = t6 + t4;
+    t11 = 0.13067577163541516 * t10;
+    y[146] = t11;
+    t2 = 0.03595400675377978 * t10;
+    y[213] = t2;
+    t0 = (-C84) * t3;
+    t8 = (-C85) * t13;
+    t1 = t0 + t8;
+    t7 = 0.1277921467134663 * t1;
+    y[133] = t7;
+    t5 = 0.009636125497564936 * t1;
+    y[226] = t5;
+    t12 = C85 * t3;
+    t9 = (-C84) * t13;
+    t14 = t12 + t9;
+    y[13] = 0;
+    t6 = (-0.1304201165353018) * t14;
+    y[106] = t6;
+    t4 = re[48];
+    t11 = im[48];
+    t10 = re[8];
+    t2 = im[8];
+    t0 = re[28];
+    t8 = im[28];
+    t7 = t10 + t0;
+    t1 = t2 + t8;
+    t5 = C60 * t7;
+    t3 = t4 - t5;
+    t13 = C60 * t1;
+    t12 = t11 - t13;
+    t9 = t10 - t0;
+    t14 = C61 * t9;
+    t6 = t2 - t8;
+    t5 = C61 * t6;
+    t13 = t4 + t7;
+    t10 = t11 + t1;
+    t0 = t3 + t5;
+    t9 = t12 - t14;
+    t2 = t3 - t5;
+    t8 = t12 + t14;
+    t6 = (-C86) * t13;
+    t4 = (-C87) * t10;
+    t7 = t6 + t4;
+    t11 = 0.12780158235745 * t7;
+    y[131] = t11;
+    t1 = 0.007124344309620235 * t7;
+    y[228] = t1;
+    t3 = C87 * t13;
+    t5 = (-C86) * t10;
+    t12 = t3 + t5;
+    y[11] = 0;
+    t14 = (-0.13041048756385062) * t12;
+    y[108] = t14;
+    t6 = (-C88) * t0;
+    t4 = (-C89) * t9;
+    t11 = t6 + t4;
+    t7 = 0.13505200965384395 * t11;
+    y[171] = t7;
+    t1 = 0.10803002167053968 * t11;
+    y[188] = t1;
+    t13 = C89 * t0;
+    t10 = (-C88) * t9;
+    t3 = t13 + t10;
+    t5 = 0.04047221355336257 * t3;
+    y[51] = t5;
+    t12 = (-0.09103494713595524) * t3;
+    y[68] = t12;
+    t14 = C90 * t2;
+    t6 = C91 * t8;
+    t4 = t14 + t6;
+    t7 = 0.0005194330611931187 * t4;
+    y[28] = t7;
+    t11 = (-0.12650337940031647) * t4;
+    y[91] = t11;
+    t1 = (-C91) * t2;
+    t0 = C90 * t8;
+    t9 = t1 + t0;
+    t13 = 0.13157910079007984 * t9;
+    y[148] = t13;
+    t10 = 0.04132536003272668 * t9;
+    y[211] = t10;
+    t5 = re[15];
+    t3 = im[15];
+    t12 = re[35];
+    t14 = im[35];
+    t6 = re[55];
+    t7 = im[55];
+    t4 = t12 + t6;
+    t11 = t14 + t7;
+    t2 = C60 * t4;
+    t8 = t5 - t2;
+    t1 = C60 * t11;
+    t0 = t3 - t1;
+    t13 = t12 - t6;
+    t9 = C61 * t13;
+    t10 = t14 - t7;
+    t2 = C61 * t10;
+    t1 = t5 + t4;
+    t12 = t3 + t11;
+    t6 = t8 + t2;
+    t13 = t0 - t9;
+    t14 = t8 - t2;
+    t7 = t0 + t9;
+    t10 = C92 * t1;
+    t5 = C93 * t12;
+    t4 = t10 + t5;
+    t3 = 0.0013584973701853671 * t4;
+    y[30] = t3;
+    t11 = (-0.1252497637194936) * t4;
+    y[89] = t11;
+    t8 = (-C93) * t1;
+    t2 = C92 * t12;
+    t0 = t8 + t2;
+    t9 = 0.13255823420311855 * t0;
+    y[150] = t9;
+    t10 = 0.046948308515362296 * t0;
+    y[209] = t10;
+    t5 = (-C94) * t6;
+    t3 = (-C95) * t13;
+    t4 = t5 + t3;
+    t11 = 0.1278982472932104 * t4;
+    y[129] = t11;
+    t1 = 0.005029930242549008 * t4;
+    y[230] = t1;
+    t12 = C95 * t6;
+    t8 = (-C94) * t13;
+    t2 = t12 + t8;
+    y[9] = 0;
+    t9 = (-0.13031192388788446) * t2;
+    y[110] = t9;
+    t0 = (-C96) * t14;
+    t10 = (-C97) * t7;
+    t5 = t0 + t10;
+    t3 = 0.1361822132041467 * t5;
+    y[169] = t3;
+    t11 = 0.10296430973177248 * t5;
+    y[190] = t11;
+    t4 = C97 * t14;
+    t1 = (-C96) * t7;
+    t6 = t4 + t1;
+    t13 = 0.034730279097660105 * t6;
+    y[49] = t13;
+    t12 = (-0.09612626454352326) * t6;
+    y[70] = t12;
+    t8 = re[42];
+    t2 = im[42];
+    t9 = re[2];
+    t0 = im[2];
+    t10 = re[22];
+    t3 = im[22];
+    t5 = t9 + t10;
+    t11 = t0 + t3;
+    t14 = C60 * t5;
+    t7 = t8 - t14;
+    t4 = C60 * t11;
+    t1 = t2 - t4;
+    t13 = t9 - t10;
+    t6 = C61 * t13;
+    t12 = t0 - t3;
+    t14 = C61 * t12;
+    t4 = t8 + t5;
+    t9 = t2 + t11;
+    t10 = t7 + t14;
+    t13 = t1 - t6;
+    t0 = t7 - t14;
+    t3 = t1 + t6;
+    t12 = (-C98) * t4;
+    t8 = (-C99) * t9;
+    t5 = t12 + t8;
+    t2 = 0.13691436857179223 * t5;
+    y[167] = t2;
+    t11 = 0.09759487977024296 * t5;
+    y[192] = t11;
+    t7 = C99 * t4;
+    t14 = (-C98) * t9;
+    t1 = t7 + t14;
+    t6 = 0.02927826085377822 * t1;
+    y[47] = t6;
+    t12 = (-0.1008605485516984) * t1;
+    y[72] = t12;
+    t8 = C100 * t10;
+    t2 = C101 * t13;
+    t5 = t8 + t2;
+    t11 = 0.002671013396397365 * t5;
+    y[32] = t11;
+    t4 = (-0.12373220432951987) * t5;
+    y[87] = t4;
+    t9 = (-C101) * t10;
+    t7 = C100 * t13;
+    t14 = t9 + t7;
+    t6 = 0.13356018733626082 * t14;
+    y[152] = t6;
+    t1 = 0.0527778247303557 * t14;
+    y[207] = t1;
+    t12 = (-C102) * t0;
+    t8 = (-C103) * t3;
+    t2 = t12 + t8;
+    t11 = 0.12806787176544185 * t2;
+    y[127] = t11;
+    t5 = 0.003342172812925513 * t2;
+    y[232] = t5;
+    t4 = C103 * t0;
+    t10 = (-C102) * t3;
+    t13 = t4 + t10;
+    y[7] = 0;
+    t9 = (-0.13013932719356736) * t13;
+    y[112] = t9;
+    t7 = re[9];
+    t6 = im[9];
+    t14 = re[29];
+    t1 = im[29];
+    t12 = re[49];
+    t8 = im[49];
+    t11 = t14 + t12;
+    t2 = t1 + t8;
+    t5 = C60 * t11;
+    t0 = t7 - t5;
+    t3 = C60 * t2;
+    t4 = t6 - t3;
+    t10 = t14 - t12;
+    t13 = C61 * t10;
+    t9 = t1 - t8;
+    t5 = C61 * t9;
+    t3 = t7 + t11;
+    t14 = t6 + t2;
+    t12 = t0 + t5;
+    t10 = t4 - t13;
+    t1 = t0 - t5;
+    t8 = t4 + t13;
+    t9 = (-C104) * t3;
+    t7 = (-C105) * t14;
+    t11 = t9 + t7;
+    t6 = 0.12829580943122418 * t11;
+    y[125] = t6;
+    t2 = 0.0020440999515884475 * t11;
+    y[234] = t2;
+    t0 = C105 * t3;
+    t5 = (-C104) * t14;
+    t4 = t0 + t5;
+    y[5] = 0;
+    t13 = (-0.12990811422879092) * t4;
+    y[114] = t13;
+    t9 = (-C106) * t12;
+    t7 = (-C107) * t10;
+    t6 = t9 + t7;
+    t11 = 0.13727636491149103 * t6;
+    y[165] = t11;
+    t2 = 0.09196785996907547 * t6;
+    y[194] = t2;
+    t3 = C107 * t12;
+    t14 = (-C106) * t10;
+    t0 = t3 + t14;
+    t5 = 0.024181661331159763 * t0;
+    y[45] = t5;
+    t4 = (-0.10520915987872281) * t0;
+    y[74] = t4;
+    t13 = C108 * t1;
+    t9 = C109 * t8;
+    t7 = t13 + t9;
+    t11 = 0.004514182839126034 * t7;
+    y[34] = t11;
+    t6 = (-0.12191121776397795) * t7;
+    y[85] = t6;
+    t2 = (-C109) * t1;
+    t12 = C108 * t8;
+    t10 = t2 + t12;
+    t3 = 0.13453560390917557 * t10;
+    y[154] = t3;
+    t14 = 0.05876309643192008 * t10;
+    y[205] = t14;
+    t5 = re[36];
+    t0 = im[36];
+    t4 = re[56];
+    t13 = im[56];
+    t9 = re[16];
+    t11 = im[16];
+    t7 = t4 + t9;
+    t6 = t13 + t11;
+    t1 = C60 * t7;
+    t8 = t5 - t1;
+    t2 = C60 * t6;
+    t12 = t0 - t2;
+    t3 = t4 - t9;
+    t10 = C61 * t3;
+    t14 = t13 - t11;
+    t1 = C61 * t14;
+    t2 = t5 + t7;
+    t4 = t0 + t6;
+    t9 = t8 + t1;
+    t3 = t12 - t10;
+    t13 = t8 - t1;
+    t11 = t12 + t10;
+    t14 = C110 * t2;
+    t5 = C111 * t4;
+    t7 = t14 + t5;
+    t0 = 0.006909966644492878 * t7;
+    y[36] = t0;
+    t6 = (-0.11975012852205472) * t7;
+    y[83] = t6;
+    t8 = (-C111) * t2;
+    t1 = C110 * t4;
+    t12 = t8 + t1;
+    t10 = 0.1354366507592513 * t12;
+    y[156] = t10;
+    t14 = 0.06484985452235424 * t12;
+    y[203] = t14;
+    t5 = (-C112) * t9;
+    t0 = (-C113) * t3;
+    t7 = t5 + t0;
+    t6 = 0.12856697855379723 * t7;
+    y[123] = t6;
+    t2 = 0.0011081398757414565 * t7;
+    y[236] = t2;
+    t4 = C113 * t9;
+    t8 = (-C112) * t3;
+    t1 = t4 + t8;
+    y[3] = 0;
+    t10 = (-0.1296341164282142) * t1;
+    y[116] = t10;
+    t12 = (-C114) * t13;
+    t14 = (-C115) * t11;
+    t5 = t12 + t14;
+    t0 = 0.13730582157802826 * t5;
+    y[163] = t0;
+    t6 = 0.0861321005071867 * t5;
+    y[196] = t6;
+    t7 = C115 * t13;
+    t2 = (-C114) * t11;
+    t9 = t7 + t2;
+    t3 = 0.019495614692840772 * t9;
+    y[43] = t3;
+    t4 = (-0.10915391824065103) * t9;
+    y[76] = t4;
+    t8 = re[3];
+    t1 = im[3];
+    t10 = re[23];
+    t12 = im[23];
+    t14 = re[43];
+    t0 = im[43];
+    t5 = t10 + t14;
+    t6 = t12 + t0;
+    t13 = C60 * t5;
+    t11 = t8 - t13;
+    t7 = C60 * t6;
+    t2 = t1 - t7;
+    t3 = t10 - t14;
+    t9 = C61 * t3;
+    t4 = t12 - t0;
+    t13 = C61 * t4;
+    t7 = t8 + t5;
+    t10 = t1 + t6;
+    t14 = t11 + t13;
+    t3 = t2 - t9;
+    t12 = t11 - t13;
+    t0 = t2 + t9;
+    t4 = (-C116) * t7;
+    t8 = (-C117) * t10;
+    t5 = t4 + t8;
+    t1 = 0.13704680139628003 * t5;
+    y[161] = t1;
+    t6 = 0.0801410936903822 * t5;
+    y[198] = t6;
+    t11 = C117 * t7;
+    t13 = (-C116) * t10;
+    t2 = t11 + t13;
+    t9 = 0.015266611259952238 * t2;
+    y[41] = t9;
+    t4 = (-0.11268547376522257) * t2;
+    y[78] = t4;
+    t8 = C118 * t14;
+    t1 = C119 * t3;
+    t5 = t8 + t1;
+    t6 = 0.009855836165055538 * t5;
+    y[38] = t6;
+    t7 = (-0.1172192652084256) * t5;
+    y[81] = t7;
+    t10 = (-C119) * t14;
+    t11 = C118 * t3;
+    t13 = t10 + t11;
+    t9 = 0.13621541368085294 * t13;
+    y[158] = t9;
+    t2 = 0.07098291339458514 * t13;
+    y[201] = t2;
+    t4 = (-C120) * t12;
+    t8 = (-C121) * t0;
+    t1 = t4 + t8;
+    t6 = 0.12886614548209754 * t1;
+    y[121] = t6;
+    t5 = 0.0004918875004744597 * t1;
+    y[238] = t5;
+    t7 = C121 * t12;
+    t14 = (-C120) * t0;
+    t3 = t7 + t14;
+    y[1] = 0;
+    t10 = (-0.12933316663050223) * t3;
+    y[118] = t10;
+    t11 = re[30];
+    t9 = im[30];
+    t13 = re[50];
+    t2 = im[50];
+    t4 = re[10];
+    t8 = im[10];
+    t6 = t13 + t4;
+    t1 = t2 + t8;
+    t5 = C60 * t6;
+    t12 = t11 - t5;
+    t0 = C60 * t1;
+    t7 = t9 - t0;
+    t14 = t13 - t4;
+    t3 = C61 * t14;
+    t10 = t2 - t8;
+    t5 = C61 * t10;
+    t0 = t11 + t6;
+    t13 = t9 + t1;
+    t4 = t12 + t5;
+    t14 = t7 - t3;
+    t2 = t12 - t5;
+    t8 = t7 + t3;
+    t10 = C122 * t0;
+    t11 = C123 * t13;
+    t6 = t10 + t11;
+    y[0] = 0;
+    t9 = (-0.12917766111079845) * t6;
+    y[119] = t9;
+    t1 = (-C123) * t0;
+    t12 = C122 * t13;
+    t5 = t1 + t12;
+    t7 = 0.12902127599578772 * t5;
+    y[120] = t7;
+    t3 = 0.00028508368687010457 * t5;
+    y[239] = t3;
+    t10 = (-C124) * t4;
+    t11 = (-C125) * t14;
+    t6 = t10 + t11;
+    t9 = 0.13654315883131996 * t6;
+    y[159] = t9;
+    t0 = 0.07404845715883025 * t6;
+    y[200] = t0;
+    t13 = C125 * t4;
+    t1 = (-C124) * t14;
+    t12 = t13 + t1;
+    t7 = 0.011530095541814405 * t12;
+    y[39] = t7;
+    t5 = (-0.11580866457349219) * t12;
+    y[80] = t5;
+    t3 = C126 * t2;
+    t10 = C127 * t8;
+    t11 = t3 + t10;
+    t9 = 0.013334776417074718 * t11;
+    y[40] = t9;
+    t6 = (-0.11429836914374931) * t11;
+    y[79] = t6;
+    t0 = (-C127) * t2;
+    t4 = C126 * t8;
+    t14 = t0 + t4;
+    t13 = 0.1368217981907019 * t14;
+    y[160] = t13;
+    t1 = 0.07710352524829175 * t14;
+    y[199] = t1;
+}
+
+/**
+ *  Part 2 of ApplyWindowedIMDCT_W75_120_K60().
+ * 
+ *  @param {Number[]} X 
+ *    - The input block (120 points, only the first 60 points are used).
+ *  @param {Number[]} y 
+ *    - The array that would contain the output block (240 points).
+ *  @param {Number[]} re 
+ *    - The scratch buffer (real part, 60 points).
+ *  @param {Number[]} im 
+ *    - The scratch buffer (imaginary part, 60 points).
+ */
+function ApplyWindowedIMDCT_W75_120_K60_Part2(X, y, re, im) {
+    let t0, t1, t10, t11, t12, t13, t14, t2, t3, t4, t5, t6, t7, t8, t9;
+    const C0 = 0.5;
+    const C1 = 0.8660254037844386;
+    const C2 = 0.22707626303437323;
+    const C3 = 0.9738769792773336;
+    const C4 = 0.6835923020228712;
+    const C5 = 0.7298640726978356;
+    const C6 = 0.9569403357322088;
+    const C7 = 0.29028467725446233;
+    const C8 = 0.949013649188214;
+    const C9 = 0.31523498164776964;
+    const C10 = 0.20150532232561713;
+    const C11 = 0.9794874195590514;
+    const C12 = 0.6642524379112817;
+    const C13 = 0.7475083268625968;
+    const C14 = 0.6444573283588975;
+    const C15 = 0.7646402761590003;
+    const C16 = 0.9404365560933549;
+    const C17 = 0.3399692397309942;
+    const C18 = 0.1757962799343545;
+    const C19 = 0.9844265680898916;
+    const C20 = 0.149966755554045;
+    const C21 = 0.9886910398241674;
+    const C22 = 0.6242205399450176;
+    const C23 = 0.7812481792047586;
+    const C24 = 0.9312149347588036;
+    const C25 = 0.36447049987914965;
+    const C26 = 0.9213551052231925;
+    const C27 = 0.38872197015239557;
+    const C28 = 0.12403445145048532;
+    const C29 = 0.992277912105967;
+    const C30 = 0.6035559419535714;
+    const C31 = 0.7973206537727071;
+    const C32 = 0.5824776968678022;
+    const C33 = 0.8128466845916152;
+    const C34 = 0.9108638249211758;
+    const C35 = 0.41270702980439467;
+    const C36 = 0.0980171403295606;
+    const C37 = 0.9951847266721969;
+    const C38 = 0.07193265315671939;
+    const C39 = 0.9974094913373519;
+    const C40 = 0.5610002506640098;
+    const C41 = 0.8278156308955021;
+    const C42 = 0.8997482840522215;
+    const C43 = 0.436409240673342;
+    const C44 = 0.8880161006528073;
+    const C45 = 0.45981235844785984;
+    const C46 = 0.04579886693652077;
+    const C47 = 0.9989506813588601;
+    const C48 = 0.5391383229110002;
+    const C49 = 0.8422172337162865;
+    const C50 = 0.5169068966820275;
+    const C51 = 0.8560416229147715;
+    const C52 = 0.8756753153753997;
+    const C53 = 0.4829003438000374;
+    const C54 = 0.0196336924606283;
+    const C55 = 0.9998072404820648;
+    t7 = re[57];
+    t12 = im[57];
+    t5 = re[17];
+    t3 = im[17];
+    t10 = re[37];
+    t9 = im[37];
+    t11 = t5 + t10;
+    t6 = t3 + t9;
+    t2 = C0 * t11;
+    t8 = t7 - t2;
+    t0 = C0 * t6;
+    t4 = t12 - t0;
+    t13 = t5 - t10;
+    t14 = C1 * t13;
+    t1 = t3 - t9;
+    t2 = C1 * t1;
+    t0 = t7 + t11;
+    t5 = t12 + t6;
+    t10 = t8 + t2;
+    t13 = t4 - t14;
+    t3 = t8 - t2;
+    t9 = t4 + t14;
+    t1 = C2 * t0;
+    t7 = C3 * t5;
+    t11 = t1 + t7;
+    t12 = 0.01732151035597601 * t11;
+    y[42] = t12;
+    t6 = (-0.11097127741230771) * t11;
+    y[77] = t6;
+    t8 = (-C3) * t0;
+    t2 = C2 * t5;
+    t4 = t8 + t2;
+    t14 = 0.13720967307681287 * t4;
+    y[162] = t14;
+    t1 = 0.08315290886343998 * t4;
+    y[197] = t1;
+    t7 = C4 * t10;
+    t12 = C5 * t13;
+    t11 = t7 + t12;
+    y[2] = 0;
+    t6 = (-0.12948604267359684) * t11;
+    y[117] = t6;
+    t0 = (-C5) * t10;
+    t5 = C4 * t13;
+    t8 = t0 + t5;
+    t2 = 0.12871400131270763 * t8;
+    y[122] = t2;
+    t14 = 0.00076369095933275 * t8;
+    y[237] = t14;
+    t4 = (-C6) * t3;
+    t1 = (-C7) * t9;
+    t7 = t4 + t1;
+    t12 = 0.13584358060175267 * t7;
+    y[157] = t12;
+    t11 = 0.06791417225431495 * t7;
+    y[202] = t11;
+    t6 = C7 * t3;
+    t10 = (-C6) * t9;
+    t13 = t6 + t10;
+    t0 = 0.008315002078298335 * t13;
+    y[37] = t0;
+    t5 = (-0.11853309602042676) * t13;
+    y[82] = t5;
+    t2 = re[24];
+    t8 = im[24];
+    t14 = re[44];
+    t4 = im[44];
+    t1 = re[4];
+    t12 = im[4];
+    t7 = t14 + t1;
+    t11 = t4 + t12;
+    t3 = C0 * t7;
+    t9 = t2 - t3;
+    t6 = C0 * t11;
+    t10 = t8 - t6;
+    t0 = t14 - t1;
+    t13 = C1 * t0;
+    t5 = t4 - t12;
+    t3 = C1 * t5;
+    t6 = t2 + t7;
+    t14 = t8 + t11;
+    t1 = t9 + t3;
+    t0 = t10 - t13;
+    t4 = t9 - t3;
+    t12 = t10 + t13;
+    t5 = (-C8) * t6;
+    t2 = (-C9) * t14;
+    t7 = t5 + t2;
+    t8 = 0.134999108138462 * t7;
+    y[155] = t8;
+    t11 = 0.06179688238318953 * t7;
+    y[204] = t11;
+    t9 = C9 * t6;
+    t3 = (-C8) * t14;
+    t10 = t9 + t3;
+    t13 = 0.005642736022192477 * t10;
+    y[35] = t13;
+    t5 = (-0.12087459982066931) * t10;
+    y[84] = t5;
+    t2 = C10 * t1;
+    t8 = C11 * t0;
+    t7 = t2 + t8;
+    t11 = 0.021784194384711957 * t7;
+    y[44] = t11;
+    t6 = (-0.10723257358114603) * t7;
+    y[75] = t6;
+    t14 = (-C11) * t1;
+    t9 = C10 * t0;
+    t3 = t14 + t9;
+    t13 = 0.13733025315079586 * t3;
+    y[164] = t13;
+    t10 = 0.08907330500678516 * t3;
+    y[195] = t10;
+    t5 = C12 * t4;
+    t2 = C13 * t12;
+    t8 = t5 + t2;
+    y[4] = 0;
+    t11 = (-0.12977552370364087) * t8;
+    y[115] = t11;
+    t7 = (-C13) * t4;
+    t6 = C12 * t12;
+    t1 = t7 + t6;
+    t0 = 0.12842688814515704 * t1;
+    y[124] = t0;
+    t14 = 0.0015331814262077778 * t1;
+    y[235] = t14;
+    t9 = re[51];
+    t13 = im[51];
+    t3 = re[11];
+    t10 = im[11];
+    t5 = re[31];
+    t2 = im[31];
+    t8 = t3 + t5;
+    t11 = t10 + t2;
+    t4 = C0 * t8;
+    t12 = t9 - t4;
+    t7 = C0 * t11;
+    t6 = t13 - t7;
+    t0 = t3 - t5;
+    t1 = C1 * t0;
+    t14 = t10 - t2;
+    t4 = C1 * t14;
+    t7 = t9 + t8;
+    t3 = t13 + t11;
+    t5 = t12 + t4;
+    t0 = t6 - t1;
+    t10 = t12 - t4;
+    t2 = t6 + t1;
+    t14 = C14 * t7;
+    t9 = C15 * t3;
+    t8 = t14 + t9;
+    y[6] = 0;
+    t13 = (-0.13003011032490908) * t8;
+    y[113] = t13;
+    t11 = (-C15) * t7;
+    t12 = C14 * t3;
+    t4 = t11 + t12;
+    t6 = 0.12817544048083407 * t4;
+    y[126] = t6;
+    t1 = 0.002645488415955432 * t4;
+    y[233] = t1;
+    t14 = (-C16) * t5;
+    t9 = (-C17) * t0;
+    t8 = t14 + t9;
+    t13 = 0.13405440880677835 * t8;
+    y[153] = t13;
+    t7 = 0.055754312275673956 * t8;
+    y[206] = t7;
+    t3 = C17 * t5;
+    t11 = (-C16) * t0;
+    t12 = t3 + t11;
+    t6 = 0.0035242164097109706 * t12;
+    y[33] = t6;
+    t4 = (-0.12286187788252573) * t12;
+    y[86] = t4;
+    t1 = C18 * t10;
+    t14 = C19 * t2;
+    t9 = t1 + t14;
+    t13 = 0.02668198545912109 * t9;
+    y[46] = t13;
+    t8 = (-0.10308453537650168) * t9;
+    y[73] = t8;
+    t7 = (-C19) * t10;
+    t5 = C18 * t2;
+    t0 = t7 + t5;
+    t3 = 0.13713932162371242 * t0;
+    y[166] = t3;
+    t11 = 0.09481016392552134 * t0;
+    y[193] = t11;
+    t6 = re[18];
+    t12 = im[18];
+    t4 = re[38];
+    t1 = im[38];
+    t14 = re[58];
+    t13 = im[58];
+    t9 = t4 + t14;
+    t8 = t1 + t13;
+    t10 = C0 * t9;
+    t2 = t6 - t10;
+    t7 = C0 * t8;
+    t5 = t12 - t7;
+    t3 = t4 - t14;
+    t0 = C1 * t3;
+    t11 = t1 - t13;
+    t10 = C1 * t11;
+    t7 = t6 + t9;
+    t4 = t12 + t8;
+    t14 = t2 + t10;
+    t3 = t5 - t0;
+    t1 = t2 - t10;
+    t13 = t5 + t0;
+    t11 = C20 * t7;
+    t6 = C21 * t4;
+    t9 = t11 + t6;
+    t12 = 0.03196300182962468 * t9;
+    y[48] = t12;
+    t8 = (-0.09854054368740502) * t9;
+    y[71] = t8;
+    t2 = (-C21) * t7;
+    t10 = C20 * t4;
+    t5 = t2 + t10;
+    t0 = 0.136596534411342 * t5;
+    y[168] = t0;
+    t11 = 0.10031504290644871 * t5;
+    y[191] = t11;
+    t6 = C22 * t14;
+    t12 = C23 * t3;
+    t9 = t6 + t12;
+    y[8] = 0;
+    t8 = (-0.13023397290569816) * t9;
+    y[111] = t8;
+    t7 = (-C23) * t14;
+    t4 = C22 * t3;
+    t2 = t7 + t4;
+    t10 = 0.127974800236916 * t2;
+    y[128] = t10;
+    t0 = 0.004136551410626626 * t2;
+    y[231] = t0;
+    t5 = (-C24) * t1;
+    t11 = (-C25) * t13;
+    t6 = t5 + t11;
+    t12 = 0.1330591826828481 * t6;
+    y[151] = t12;
+    t9 = 0.049840479635363234 * t6;
+    y[208] = t9;
+    t8 = C25 * t1;
+    t14 = (-C24) * t13;
+    t3 = t8 + t14;
+    t7 = 0.0019510169774324456 * t3;
+    y[31] = t7;
+    t4 = (-0.12452674599864776) * t3;
+    y[88] = t4;
+    t10 = re[45];
+    t2 = im[45];
+    t0 = re[5];
+    t5 = im[5];
+    t11 = re[25];
+    t12 = im[25];
+    t6 = t0 + t11;
+    t9 = t5 + t12;
+    t1 = C0 * t6;
+    t13 = t10 - t1;
+    t8 = C0 * t9;
+    t14 = t2 - t8;
+    t7 = t0 - t11;
+    t3 = C1 * t7;
+    t4 = t5 - t12;
+    t1 = C1 * t4;
+    t8 = t10 + t6;
+    t0 = t2 + t9;
+    t11 = t13 + t1;
+    t7 = t14 - t3;
+    t5 = t13 - t1;
+    t12 = t14 + t3;
+    t4 = (-C26) * t8;
+    t10 = (-C27) * t0;
+    t6 = t4 + t10;
+    t2 = 0.132062998027614 * t6;
+    y[149] = t2;
+    t9 = 0.04410793846784834 * t6;
+    y[210] = t9;
+    t13 = C27 * t8;
+    t1 = (-C26) * t0;
+    t14 = t13 + t1;
+    t3 = 0.000885037777122633 * t14;
+    y[29] = t3;
+    t4 = (-0.12590679996053722) * t14;
+    y[90] = t4;
+    t10 = C28 * t11;
+    t2 = C29 * t7;
+    t6 = t10 + t2;
+    t9 = 0.03756930245760549 * t6;
+    y[50] = t9;
+    t8 = (-0.0936228253848627) * t6;
+    y[69] = t8;
+    t0 = (-C29) * t11;
+    t13 = C28 * t7;
+    t1 = t0 + t13;
+    t3 = 0.13566875398048714 * t1;
+    y[170] = t3;
+    t14 = 0.10553761563829522 * t1;
+    y[189] = t14;
+    t4 = C30 * t5;
+    t10 = C31 * t12;
+    t2 = t4 + t10;
+    y[10] = 0;
+    t9 = (-0.13037145630985233) * t2;
+    y[109] = t9;
+    t6 = (-C31) * t5;
+    t8 = C30 * t12;
+    t11 = t6 + t8;
+    t7 = 0.1278398442298228 * t11;
+    y[130] = t7;
+    t0 = 0.006025615493498079 * t11;
+    y[229] = t0;
+    t13 = re[12];
+    t3 = im[12];
+    t1 = re[32];
+    t14 = im[32];
+    t4 = re[52];
+    t10 = im[52];
+    t2 = t1 + t4;
+    t9 = t14 + t10;
+    t5 = C0 * t2;
+    t12 = t13 - t5;
+    t6 = C0 * t9;
+    t8 = t3 - t6;
+    t7 = t1 - t4;
+    t11 = C1 * t7;
+    t0 = t14 - t10;
+    t5 = C1 * t0;
+    t6 = t13 + t2;
+    t1 = t3 + t9;
+    t4 = t12 + t5;
+    t7 = t8 - t11;
+    t14 = t12 - t5;
+    t10 = t8 + t11;
+    t0 = C32 * t6;
+    t13 = C33 * t1;
+    t2 = t0 + t13;
+    y[12] = 0;
+    t3 = (-0.1304273641267012) * t2;
+    y[107] = t3;
+    t9 = (-C33) * t6;
+    t12 = C32 * t1;
+    t5 = t9 + t12;
+    t8 = 0.1277850455559015 * t5;
+    y[132] = t8;
+    t11 = 0.008327409735314555 * t5;
+    y[227] = t11;
+    t0 = (-C34) * t4;
+    t13 = (-C35) * t7;
+    t2 = t0 + t13;
+    t3 = 0.13114862579928324 * t2;
+    y[147] = t3;
+    t6 = 0.0386056955153734 * t2;
+    y[212] = t6;
+    t1 = C35 * t4;
+    t9 = (-C34) * t7;
+    t12 = t1 + t9;
+    y[27] = 0;
+    t8 = (-0.1270822821443376) * t12;
+    y[92] = t8;
+    t5 = C36 * t14;
+    t11 = C37 * t10;
+    t0 = t5 + t11;
+    t13 = 0.043430098972763266 * t0;
+    y[52] = t13;
+    t3 = (-0.0883673493295678) * t0;
+    y[67] = t3;
+    t2 = (-C37) * t14;
+    t6 = C36 * t10;
+    t4 = t2 + t6;
+    t7 = 0.13432951598517828 * t4;
+    y[172] = t7;
+    t1 = 0.110437772783816 * t4;
+    y[187] = t1;
+    t9 = re[39];
+    t12 = im[39];
+    t8 = re[59];
+    t5 = im[59];
+    t11 = re[19];
+    t13 = im[19];
+    t0 = t8 + t11;
+    t3 = t5 + t13;
+    t14 = C0 * t0;
+    t10 = t9 - t14;
+    t2 = C0 * t3;
+    t6 = t12 - t2;
+    t7 = t8 - t11;
+    t4 = C1 * t7;
+    t1 = t5 - t13;
+    t14 = C1 * t1;
+    t2 = t9 + t0;
+    t8 = t12 + t3;
+    t11 = t10 + t14;
+    t7 = t6 - t4;
+    t5 = t10 - t14;
+    t13 = t6 + t4;
+    t1 = C38 * t2;
+    t9 = C39 * t8;
+    t0 = t1 + t9;
+    t12 = 0.04947530060490178 * t0;
+    y[54] = t12;
+    t3 = (-0.08281434546962085) * t0;
+    y[65] = t3;
+    t10 = (-C39) * t2;
+    t14 = C38 * t8;
+    t6 = t10 + t14;
+    t4 = 0.13256118850403636 * t6;
+    y[174] = t4;
+    t1 = 0.11498057690358454 * t6;
+    y[185] = t1;
+    t9 = C40 * t11;
+    t12 = C41 * t7;
+    t0 = t9 + t12;
+    y[14] = 0;
+    t3 = (-0.1303872644748) * t0;
+    y[105] = t3;
+    t2 = (-C41) * t11;
+    t8 = C40 * t7;
+    t10 = t2 + t8;
+    t14 = 0.12782434491435965 * t10;
+    y[134] = t14;
+    t4 = 0.011050914571142288 * t10;
+    y[225] = t4;
+    t6 = (-C42) * t5;
+    t1 = (-C43) * t13;
+    t9 = t6 + t1;
+    t12 = 0.13024140576603055 * t9;
+    y[145] = t12;
+    t0 = 0.03337558481131762 * t9;
+    y[214] = t0;
+    t3 = C43 * t5;
+    t11 = (-C42) * t13;
+    t7 = t3 + t11;
+    y[25] = 0;
+    t2 = (-0.12796749673147076) * t7;
+    y[94] = t2;
+    t8 = re[6];
+    t14 = im[6];
+    t10 = re[26];
+    t4 = im[26];
+    t6 = re[46];
+    t1 = im[46];
+    t12 = t10 + t6;
+    t9 = t4 + t1;
+    t0 = C0 * t12;
+    t5 = t8 - t0;
+    t13 = C0 * t9;
+    t3 = t14 - t13;
+    t11 = t10 - t6;
+    t7 = C1 * t11;
+    t2 = t4 - t1;
+    t0 = C1 * t2;
+    t13 = t8 + t12;
+    t10 = t14 + t9;
+    t6 = t5 + t0;
+    t11 = t3 - t7;
+    t4 = t5 - t0;
+    t1 = t3 + t7;
+    t2 = (-C44) * t13;
+    t8 = (-C45) * t10;
+    t12 = t2 + t8;
+    t14 = 0.12948708125496394 * t12;
+    y[143] = t14;
+    t9 = 0.028460019760872708 * t12;
+    y[216] = t9;
+    t5 = C45 * t13;
+    t0 = (-C44) * t10;
+    t3 = t5 + t0;
+    y[23] = 0;
+    t7 = (-0.12871296893200876) * t3;
+    y[96] = t7;
+    t2 = C46 * t6;
+    t8 = C47 * t11;
+    t14 = t2 + t8;
+    t12 = 0.055628708463325655 * t14;
+    y[56] = t12;
+    t9 = (-0.07701545284553844) * t14;
+    y[63] = t9;
+    t13 = (-C47) * t6;
+    t10 = C46 * t11;
+    t5 = t13 + t10;
+    t0 = 0.13035180369321933 * t5;
+    y[176] = t0;
+    t3 = 0.11913926566118321 * t5;
+    y[183] = t3;
+    t7 = C48 * t4;
+    t2 = C49 * t1;
+    t8 = t7 + t2;
+    y[16] = 0;
+    t12 = (-0.13023790615363698) * t8;
+    y[103] = t12;
+    t14 = (-C49) * t4;
+    t9 = C48 * t1;
+    t6 = t14 + t9;
+    t11 = 0.12797093533587375 * t6;
+    y[136] = t11;
+    t13 = 0.014200113027426714 * t6;
+    y[223] = t13;
+    t10 = re[33];
+    t0 = im[33];
+    t5 = re[53];
+    t3 = im[53];
+    t7 = re[13];
+    t2 = im[13];
+    t8 = t5 + t7;
+    t12 = t3 + t2;
+    t4 = C0 * t8;
+    t1 = t10 - t4;
+    t14 = C0 * t12;
+    t9 = t0 - t14;
+    t11 = t5 - t7;
+    t6 = C1 * t11;
+    t13 = t3 - t2;
+    t4 = C1 * t13;
+    t14 = t10 + t8;
+    t5 = t0 + t12;
+    t7 = t1 + t4;
+    t11 = t9 - t6;
+    t3 = t1 - t4;
+    t2 = t9 + t6;
+    t13 = C50 * t14;
+    t10 = C51 * t5;
+    t8 = t13 + t10;
+    y[18] = 0;
+    t0 = (-0.1299681237772433) * t8;
+    y[101] = t0;
+    t12 = (-C51) * t14;
+    t1 = C50 * t5;
+    t4 = t12 + t1;
+    t9 = 0.12823657203232558 * t4;
+    y[138] = t9;
+    t6 = 0.017771243024118102 * t4;
+    y[221] = t6;
+    t13 = (-C52) * t7;
+    t10 = (-C53) * t11;
+    t8 = t13 + t10;
+    t0 = 0.12888116724457874 * t8;
+    y[141] = t0;
+    t14 = 0.02389541705548433 * t8;
+    y[218] = t14;
+    t5 = C53 * t7;
+    t12 = (-C52) * t11;
+    t1 = t5 + t12;
+    y[21] = 0;
+    t9 = (-0.12931809218516938) * t1;
+    y[98] = t9;
+    t4 = C54 * t3;
+    t6 = C55 * t2;
+    t13 = t4 + t6;
+    t10 = 0.06182067494882439 * t13;
+    y[58] = t10;
+    t0 = (-0.07102713875108795) * t13;
+    y[61] = t0;
+    t8 = (-C55) * t3;
+    t14 = C54 * t2;
+    t7 = t8 + t14;
+    t11 = 0.12769564445023865 * t7;
+    y[178] = t11;
+    t5 = 0.1228846242244815 * t7;
+    y[181] = t5;
+}
+
+//
+//  Public functions.
+//
+
+/**
+ *  Apply LD-IMDCT transform (prebuilt for window W75_120, input pruned).
+ * 
+ *  Note(s):
+ *    [1] y[n] = w[n] * SUM(X[k] * cos(PI / 120 * (n + 60.5) * (k + 0.5))), where
+ *        w[n] = sqrt(2 / 120) * W75_120[239 - n].
+ *    [2] X[k] shall be zero for all k >= 60 (not checked).
+ *    [3] The size of all arrays will not be checked.
+ * 
+ *  @param {Number[]} X 
+ *    - The input block (120 points, only the first 60 points are used).
+ *  @param {Number[]} y 
+ *    - The array that would contain the output block (240 points).
+ *  @param {Number[]} re 
+ *    - The scratch buffer (real part, 60 points).
+ *  @param {Number[]} im 
+ *    - The scratch buffer (imaginary part, 60 points).
+ */
+function ApplyWindowedIMDCT_W75_120_K60(X, y, re, im) {
+    ApplyWindowedIMDCT_W75_120_K60_Part1(X, y, re, im);
+    ApplyWindowedIMDCT_W75_120_K60_Part2(X, y, re, im);
+}
+
+//  Export public APIs.
+module.exports = {
+    "ApplyWindowedIMDCT_W75_120_K60": ApplyWindowedIMDCT_W75_120_K60
+};
\ No newline at end of file
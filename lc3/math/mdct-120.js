@@ -0,0 +1,6247 @@
+//
+//  Copyright 2021 - 2023 XiaoJSoft Studio. All rights reserved.
+//  Use of this source code is governed by a BSD-style license that can be
+//  found in the LICENSE.md file.
+//
+
+//
+//  Note(s):
+//    [1] This file is generated automatically by a MDCT compiler, which locates 
+//        at "./../../dev/mdct-generator/" directory.
+//        Do NOT modify this file manually.
+//
+
+//
+//  Private functions.
+//
+
+/**
+ *  Part 1 of ApplyWindowedMDCT_W75_120().
+ * 
+ *  @param {Number[]} x 
+ *    - The input block (240 points).
+ *  @param {Number[]} X 
+ *    - The array that would contain the output block (120 points).
+ *  @param {Number[]} re 
+ *    - The scratch buffer (real part, 60 points).
+ *  @param {Number[]} im 
+ *    - The scratch buffer (imaginary part, 60 points).
+ */
+function ApplyWindowedMDCT_W75_120_Part1(x, X, re, im) {
+    let t0, t1, t10, t11, t12, t13, t14, t2, t3, t4, t5, t6, t7, t8, t9;
+    const C0 = 0.9510565162951535;
+    const C1 = 0.3090169943749474;
+    const C2 = 0.5877852522924731;
+    const C3 = 0.8090169943749475;
+    const C4 = 0.5590169943749475;
+    const C5 = 0.25;
+    const C6 = 0.9238795325112867;
+    const C7 = 0.3826834323650898;
+    const C8 = 0.6494480483301837;
+    const C9 = 0.7604059656000309;
+    const C10 = 0.5224985647159488;
+    const C11 = 0.8526401643540922;
+    const C12 = 0.2334453638559054;
+    const C13 = 0.9723699203976766;
+    const C14 = 0.996917333733128;
+    const C15 = 0.07845909572784494;
+    const C16 = 0.45399049973954675;
+    const C17 = 0.8910065241883679;
+    const C18 = 0.15643446504023087;
+    const C19 = 0.9876883405951378;
+    const C20 = 0.49999999999999994;
+    const C21 = 0.8660254037844387;
+    const C22 = 0.6691306063588582;
+    const C23 = 0.7431448254773942;
+    const C24 = 0.40673664307580015;
+    const C25 = 0.9135454576426009;
+    const C26 = 0.10452846326765346;
+    const C27 = 0.9945218953682733;
+    const C28 = 0.9781476007338057;
+    const C29 = 0.20791169081775931;
+    const C30 = 0.6087614290087207;
+    const C31 = 0.7933533402912352;
+    const C32 = 0.33380685923377096;
+    const C33 = 0.9426414910921784;
+    const C34 = 0.02617694830787315;
+    const C35 = 0.9996573249755573;
+    const C36 = 0.958819734868193;
+    const C37 = 0.2840153447039226;
+    const C38 = 0.5664062369248328;
+    const C39 = 0.8241261886220156;
+    const C40 = 0.25881904510252074;
+    const C41 = 0.9659258262890683;
+    const C42 = 0.9986295347545738;
+    const C43 = 0.05233595624294383;
+    const C44 = 0.9335804264972017;
+    const C45 = 0.35836794954530027;
+    const C46 = 0.6293203910498375;
+    const C47 = 0.7771459614569709;
+    const C48 = 0.544639035015027;
+    const C49 = 0.838670567945424;
+    const C50 = 0.9914448613738104;
+    const C51 = 0.13052619222005157;
+    const C52 = 0.4305110968082951;
+    const C53 = 0.9025852843498606;
+    const C54 = 0.6883545756937539;
+    const C55 = 0.7253743710122876;
+    const C56 = 0.4771587602596084;
+    const C57 = 0.8788171126619654;
+    const C58 = 0.18223552549214747;
+    const C59 = 0.9832549075639546;
+    t0 = x[179];
+    t0 = 0.06797970597338741 * t0;
+    t1 = x[180];
+    t1 = 0.06490876847639243 * t1;
+    t0 = t0 + t1;
+    t1 = x[59];
+    t1 = 0.12459782471033913 * t1;
+    t2 = x[60];
+    t2 = 0.12620200671712 * t2;
+    t1 = t1 - t2;
+    t2 = -t0;
+    t3 = x[155];
+    t3 = 0.12087459982066931 * t3;
+    t4 = x[204];
+    t4 = 0.005642736022192477 * t4;
+    t3 = t3 + t4;
+    t4 = x[35];
+    t4 = 0.06179688238318953 * t4;
+    t5 = x[84];
+    t5 = 0.134999108138462 * t5;
+    t4 = t4 - t5;
+    t5 = (-C0) * t3;
+    t6 = C1 * t4;
+    t5 = t5 + t6;
+    t6 = C1 * t3;
+    t3 = C0 * t4;
+    t4 = t6 + t3;
+    t6 = x[131];
+    t3 = x[11];
+    t3 = 0.007124344309620235 * t3;
+    t7 = x[108];
+    t7 = 0.12780158235745 * t7;
+    t3 = t3 - t7;
+    t7 = (-0.1055043006838779) * t6;
+    t8 = C2 * t3;
+    t7 = t7 + t8;
+    t8 = 0.07665336133430237 * t6;
+    t6 = C3 * t3;
+    t3 = t8 + t6;
+    t8 = x[12];
+    t6 = 0.008327409735314555 * t8;
+    t8 = x[107];
+    t8 = 0.1277850455559015 * t8;
+    t6 = t6 - t8;
+    t8 = x[132];
+    t9 = C2 * t6;
+    t10 = (-0.10551795411003065) * t8;
+    t9 = t9 + t10;
+    t10 = (-C3) * t6;
+    t6 = (-0.07666328112905532) * t8;
+    t8 = t10 + t6;
+    t10 = x[36];
+    t6 = 0.06484985452235424 * t10;
+    t10 = x[83];
+    t10 = 0.1354366507592513 * t10;
+    t6 = t6 - t10;
+    t10 = x[156];
+    t10 = 0.11975012852205472 * t10;
+    t11 = x[203];
+    t11 = 0.006909966644492878 * t11;
+    t10 = t10 + t11;
+    t11 = C1 * t6;
+    t12 = (-C0) * t10;
+    t11 = t11 + t12;
+    t12 = (-C0) * t6;
+    t6 = (-C1) * t10;
+    t10 = t12 + t6;
+    t12 = t5 + t11;
+    t6 = t4 + t10;
+    t13 = t7 + t9;
+    t14 = t3 + t8;
+    t5 = t5 - t11;
+    t11 = t4 - t10;
+    t4 = t7 - t9;
+    t10 = t3 - t8;
+    t7 = t12 + t13;
+    t9 = t6 + t14;
+    t3 = t12 - t13;
+    t8 = C4 * t3;
+    t12 = t6 - t14;
+    t13 = C4 * t12;
+    t3 = C5 * t7;
+    t6 = t2 - t3;
+    t14 = C5 * t9;
+    t12 = t1 - t14;
+    t2 = t6 + t8;
+    t3 = t12 + t13;
+    t14 = t6 - t8;
+    t6 = t12 - t13;
+    t8 = C0 * t5;
+    t12 = C2 * t4;
+    t13 = t8 + t12;
+    t8 = C0 * t11;
+    t12 = C2 * t10;
+    t8 = t8 + t12;
+    t12 = C2 * t5;
+    t5 = C0 * t4;
+    t4 = t12 - t5;
+    t12 = C2 * t11;
+    t5 = C0 * t10;
+    t11 = t12 - t5;
+    t10 = t7 - t0;
+    t12 = t1 + t9;
+    t5 = t2 + t8;
+    t7 = t3 - t13;
+    t0 = t14 + t11;
+    t1 = t6 - t4;
+    t9 = t14 - t11;
+    t14 = t6 + t4;
+    t11 = t2 - t8;
+    t6 = t3 + t13;
+    re[0] = t10;
+    im[0] = t12;
+    re[12] = t5;
+    im[12] = t7;
+    re[24] = t0;
+    im[24] = t1;
+    re[36] = t9;
+    im[36] = t14;
+    re[48] = t11;
+    im[48] = t6;
+    t4 = x[149];
+    t2 = 0.12590679996053722 * t4;
+    t8 = x[210];
+    t3 = 0.000885037777122633 * t8;
+    t13 = t2 + t3;
+    t10 = x[29];
+    t12 = 0.04410793846784834 * t10;
+    t5 = x[90];
+    t7 = 0.132062998027614 * t5;
+    t0 = t12 - t7;
+    t1 = (-C6) * t13;
+    t9 = C7 * t0;
+    t14 = t1 + t9;
+    t11 = C7 * t13;
+    t6 = C6 * t0;
+    t4 = t11 + t6;
+    t8 = x[125];
+    t2 = x[5];
+    t3 = 0.0020440999515884475 * t2;
+    t10 = x[114];
+    t5 = 0.12829580943122418 * t10;
+    t12 = t3 - t5;
+    t7 = (-0.09878290503942287) * t8;
+    t1 = C8 * t12;
+    t9 = t7 + t1;
+    t13 = 0.08436857124814283 * t8;
+    t0 = C9 * t12;
+    t11 = t13 + t0;
+    t6 = x[18];
+    t2 = 0.017771243024118102 * t6;
+    t10 = x[101];
+    t3 = 0.12823657203232558 * t10;
+    t5 = t2 - t3;
+    t7 = x[138];
+    t1 = C10 * t5;
+    t8 = (-0.11081604241822171) * t7;
+    t12 = t1 + t8;
+    t13 = (-C11) * t5;
+    t0 = (-0.06790815813243439) * t7;
+    t6 = t13 + t0;
+    t10 = x[42];
+    t2 = 0.08315290886343998 * t10;
+    t3 = x[77];
+    t1 = 0.13720967307681287 * t3;
+    t8 = t2 - t1;
+    t5 = x[162];
+    t7 = 0.11097127741230771 * t5;
+    t13 = x[197];
+    t0 = 0.01732151035597601 * t13;
+    t10 = t7 + t0;
+    t3 = C12 * t8;
+    t2 = (-C13) * t10;
+    t1 = t3 + t2;
+    t5 = (-C13) * t8;
+    t13 = (-C12) * t10;
+    t7 = t5 + t13;
+    t0 = x[173];
+    t3 = 0.08562458841720233 * t0;
+    t2 = x[186];
+    t8 = 0.04643450102705312 * t2;
+    t10 = t3 + t8;
+    t5 = x[53];
+    t13 = 0.11275555822546786 * t5;
+    t0 = x[66];
+    t2 = 0.1335004207756719 * t0;
+    t3 = t13 - t2;
+    t8 = (-C14) * t10;
+    t5 = C15 * t3;
+    t0 = t8 + t5;
+    t13 = C15 * t10;
+    t2 = C14 * t3;
+    t8 = t13 + t2;
+    t5 = t9 + t0;
+    t10 = t11 + t8;
+    t3 = t12 + t1;
+    t13 = t6 + t7;
+    t2 = t9 - t0;
+    t9 = t11 - t8;
+    t0 = t12 - t1;
+    t11 = t6 - t7;
+    t8 = t5 + t3;
+    t12 = t10 + t13;
+    t1 = t5 - t3;
+    t6 = C4 * t1;
+    t7 = t10 - t13;
+    t5 = C4 * t7;
+    t3 = C5 * t8;
+    t1 = t14 - t3;
+    t10 = C5 * t12;
+    t13 = t4 - t10;
+    t7 = t1 + t6;
+    t3 = t13 + t5;
+    t10 = t1 - t6;
+    t1 = t13 - t5;
+    t6 = C0 * t2;
+    t13 = C2 * t0;
+    t5 = t6 + t13;
+    t6 = C0 * t9;
+    t13 = C2 * t11;
+    t6 = t6 + t13;
+    t13 = C2 * t2;
+    t2 = C0 * t0;
+    t0 = t13 - t2;
+    t13 = C2 * t9;
+    t2 = C0 * t11;
+    t9 = t13 - t2;
+    t11 = t14 + t8;
+    t13 = t4 + t12;
+    t2 = t7 + t6;
+    t14 = t3 - t5;
+    t8 = t10 + t9;
+    t4 = t1 - t0;
+    t12 = t10 - t9;
+    t10 = t1 + t0;
+    t9 = t7 - t6;
+    t1 = t3 + t5;
+    re[15] = t11;
+    im[15] = t13;
+    re[27] = t2;
+    im[27] = t14;
+    re[39] = t8;
+    im[39] = t4;
+    re[51] = t12;
+    im[51] = t10;
+    re[3] = t9;
+    im[3] = t1;
+    t0 = x[0];
+    t7 = 0.00028508368687010457 * t0;
+    t6 = x[119];
+    t3 = 0.12902127599578772 * t6;
+    t5 = t7 - t3;
+    t11 = x[120];
+    t13 = 0.7071067811865476 * t5;
+    t2 = (-0.09134240014926334) * t11;
+    t14 = t13 + t2;
+    t8 = (-0.7071067811865475) * t5;
+    t4 = (-0.09134240014926336) * t11;
+    t12 = t8 + t4;
+    t10 = x[24];
+    t9 = 0.0308764483656392 * t10;
+    t1 = x[95];
+    t0 = 0.12984544762774675 * t1;
+    t6 = t9 - t0;
+    t7 = x[144];
+    t3 = C16 * t6;
+    t13 = (-0.11436757320169204) * t7;
+    t2 = t3 + t13;
+    t5 = (-C17) * t6;
+    t11 = (-0.05827318914317912) * t7;
+    t8 = t5 + t11;
+    t4 = x[48];
+    t10 = 0.10031504290644871 * t4;
+    t1 = x[71];
+    t9 = 0.136596534411342 * t1;
+    t0 = t10 - t9;
+    t3 = x[168];
+    t13 = 0.09854054368740502 * t3;
+    t6 = x[191];
+    t7 = 0.03196300182962468 * t6;
+    t5 = t13 + t7;
+    t11 = C18 * t0;
+    t4 = (-C19) * t5;
+    t1 = t11 + t4;
+    t10 = (-C19) * t0;
+    t9 = (-C18) * t5;
+    t3 = t10 + t9;
+    t6 = x[167];
+    t13 = 0.1008605485516984 * t6;
+    t7 = x[192];
+    t11 = 0.02927826085377822 * t7;
+    t4 = t13 + t11;
+    t0 = x[47];
+    t5 = 0.09759487977024296 * t0;
+    t10 = x[72];
+    t9 = 0.13691436857179223 * t10;
+    t6 = t5 - t9;
+    t7 = (-C19) * t4;
+    t13 = C18 * t6;
+    t11 = t7 + t13;
+    t0 = C18 * t4;
+    t10 = C19 * t6;
+    t5 = t0 + t10;
+    t9 = x[143];
+    t7 = x[23];
+    t13 = 0.028460019760872708 * t7;
+    t4 = x[96];
+    t6 = 0.12948708125496394 * t4;
+    t0 = t13 - t6;
+    t10 = (-0.1146840950660745) * t9;
+    t7 = C16 * t0;
+    t4 = t10 + t7;
+    t13 = 0.058434465088403414 * t9;
+    t6 = C17 * t0;
+    t10 = t13 + t6;
+    t7 = t2 + t4;
+    t9 = t8 + t10;
+    t0 = t1 + t11;
+    t13 = t3 + t5;
+    t6 = t2 - t4;
+    t2 = t8 - t10;
+    t4 = t1 - t11;
+    t8 = t3 - t5;
+    t10 = t7 + t0;
+    t1 = t9 + t13;
+    t11 = t7 - t0;
+    t3 = C4 * t11;
+    t5 = t9 - t13;
+    t7 = C4 * t5;
+    t0 = C5 * t10;
+    t11 = t14 - t0;
+    t9 = C5 * t1;
+    t13 = t12 - t9;
+    t5 = t11 + t3;
+    t0 = t13 + t7;
+    t9 = t11 - t3;
+    t11 = t13 - t7;
+    t3 = C0 * t6;
+    t13 = C2 * t4;
+    t7 = t3 + t13;
+    t3 = C0 * t2;
+    t13 = C2 * t8;
+    t3 = t3 + t13;
+    t13 = C2 * t6;
+    t6 = C0 * t4;
+    t4 = t13 - t6;
+    t13 = C2 * t2;
+    t6 = C0 * t8;
+    t2 = t13 - t6;
+    t8 = t14 + t10;
+    t13 = t12 + t1;
+    t6 = t5 + t3;
+    t14 = t0 - t7;
+    t10 = t9 + t2;
+    t12 = t11 - t4;
+    t1 = t9 - t2;
+    t9 = t11 + t4;
+    t2 = t5 - t3;
+    t11 = t0 + t7;
+    re[30] = t8;
+    im[30] = t13;
+    re[42] = t6;
+    im[42] = t14;
+    re[54] = t10;
+    im[54] = t12;
+    re[6] = t1;
+    im[6] = t9;
+    re[18] = t2;
+    im[18] = t11;
+    t4 = x[30];
+    t5 = 0.046948308515362296 * t4;
+    t3 = x[89];
+    t0 = 0.13255823420311855 * t3;
+    t7 = t5 - t0;
+    t8 = x[150];
+    t13 = 0.1252497637194936 * t8;
+    t6 = x[209];
+    t14 = 0.0013584973701853671 * t6;
+    t10 = t13 + t14;
+    t12 = C7 * t7;
+    t1 = (-C6) * t10;
+    t9 = t12 + t1;
+    t2 = (-C6) * t7;
+    t11 = (-C7) * t10;
+    t4 = t2 + t11;
+    t3 = x[54];
+    t5 = 0.11498057690358454 * t3;
+    t0 = x[65];
+    t8 = 0.13256118850403636 * t0;
+    t6 = t5 - t8;
+    t13 = x[174];
+    t14 = 0.08281434546962085 * t13;
+    t12 = x[185];
+    t1 = 0.04947530060490178 * t12;
+    t7 = t14 + t1;
+    t10 = C15 * t6;
+    t2 = (-C14) * t7;
+    t11 = t10 + t2;
+    t3 = (-C14) * t6;
+    t0 = (-C15) * t7;
+    t5 = t3 + t0;
+    t8 = x[161];
+    t13 = 0.11268547376522257 * t8;
+    t12 = x[198];
+    t14 = 0.015266611259952238 * t12;
+    t1 = t13 + t14;
+    t10 = x[41];
+    t2 = 0.0801410936903822 * t10;
+    t6 = x[78];
+    t7 = 0.13704680139628003 * t6;
+    t3 = t2 - t7;
+    t0 = (-C13) * t1;
+    t8 = C12 * t3;
+    t12 = t0 + t8;
+    t13 = C12 * t1;
+    t14 = C13 * t3;
+    t10 = t13 + t14;
+    t6 = x[137];
+    t2 = x[17];
+    t7 = 0.01593336020836991 * t2;
+    t0 = x[102];
+    t8 = 0.12808820336608326 * t0;
+    t1 = t7 - t8;
+    t3 = (-0.11094440418753189) * t6;
+    t13 = C10 * t1;
+    t14 = t3 + t13;
+    t2 = 0.06798681832583471 * t6;
+    t0 = C11 * t1;
+    t7 = t2 + t0;
+    t8 = x[6];
+    t3 = 0.002645488415955432 * t8;
+    t13 = x[113];
+    t6 = 0.12817544048083407 * t13;
+    t1 = t3 - t6;
+    t2 = x[126];
+    t0 = C8 * t1;
+    t8 = (-0.09887567159869104) * t2;
+    t13 = t0 + t8;
+    t3 = (-C9) * t1;
+    t6 = (-0.08444780137467066) * t2;
+    t0 = t3 + t6;
+    t8 = t11 + t13;
+    t1 = t5 + t0;
+    t2 = t12 + t14;
+    t3 = t10 + t7;
+    t6 = t11 - t13;
+    t11 = t5 - t0;
+    t13 = t12 - t14;
+    t5 = t10 - t7;
+    t0 = t8 + t2;
+    t12 = t1 + t3;
+    t14 = t8 - t2;
+    t10 = C4 * t14;
+    t7 = t1 - t3;
+    t8 = C4 * t7;
+    t2 = C5 * t0;
+    t14 = t9 - t2;
+    t1 = C5 * t12;
+    t3 = t4 - t1;
+    t7 = t14 + t10;
+    t2 = t3 + t8;
+    t1 = t14 - t10;
+    t14 = t3 - t8;
+    t10 = C0 * t6;
+    t3 = C2 * t13;
+    t8 = t10 + t3;
+    t10 = C0 * t11;
+    t3 = C2 * t5;
+    t10 = t10 + t3;
+    t3 = C2 * t6;
+    t6 = C0 * t13;
+    t13 = t3 - t6;
+    t3 = C2 * t11;
+    t6 = C0 * t5;
+    t11 = t3 - t6;
+    t5 = t9 + t0;
+    t3 = t4 + t12;
+    t6 = t7 + t10;
+    t9 = t2 - t8;
+    t0 = t1 + t11;
+    t4 = t14 - t13;
+    t12 = t1 - t11;
+    t1 = t14 + t13;
+    t11 = t7 - t10;
+    t14 = t2 + t8;
+    re[45] = t5;
+    im[45] = t3;
+    re[57] = t6;
+    im[57] = t9;
+    re[9] = t0;
+    im[9] = t4;
+    re[21] = t12;
+    im[21] = t1;
+    re[33] = t11;
+    im[33] = t14;
+    t13 = re[0];
+    t7 = im[0];
+    t10 = re[15];
+    t2 = im[15];
+    t8 = re[30];
+    t5 = im[30];
+    t3 = re[45];
+    t6 = im[45];
+    t9 = t13 + t8;
+    t0 = t7 + t5;
+    t4 = t10 + t3;
+    t12 = t2 + t6;
+    t1 = t13 - t8;
+    t11 = t7 - t5;
+    t14 = t10 - t3;
+    t13 = t2 - t6;
+    t8 = t9 + t4;
+    t7 = t0 + t12;
+    t5 = t1 + t13;
+    t10 = t11 - t14;
+    t3 = t9 - t4;
+    t2 = t0 - t12;
+    t6 = t1 - t13;
+    t9 = t11 + t14;
+    re[0] = t8;
+    im[0] = t7;
+    re[15] = t5;
+    im[15] = t10;
+    re[30] = t3;
+    im[30] = t2;
+    re[45] = t6;
+    im[45] = t9;
+    t4 = re[12];
+    t0 = im[12];
+    t12 = re[27];
+    t1 = im[27];
+    t13 = re[42];
+    t11 = im[42];
+    t14 = re[57];
+    t8 = im[57];
+    t7 = t4 + t13;
+    t5 = t0 + t11;
+    t10 = t12 + t14;
+    t3 = t1 + t8;
+    t2 = t4 - t13;
+    t6 = t0 - t11;
+    t9 = t12 - t14;
+    t4 = t1 - t8;
+    t13 = t7 + t10;
+    t0 = t5 + t3;
+    t11 = t2 + t4;
+    t12 = t6 - t9;
+    t14 = t7 - t10;
+    t1 = t5 - t3;
+    t8 = t2 - t4;
+    t7 = t6 + t9;
+    re[12] = t13;
+    im[12] = t0;
+    re[27] = t11;
+    im[27] = t12;
+    re[42] = t14;
+    im[42] = t1;
+    re[57] = t8;
+    im[57] = t7;
+    t10 = re[24];
+    t5 = im[24];
+    t3 = re[39];
+    t2 = im[39];
+    t4 = re[54];
+    t6 = im[54];
+    t9 = re[9];
+    t13 = im[9];
+    t0 = t10 + t4;
+    t11 = t5 + t6;
+    t12 = t3 + t9;
+    t14 = t2 + t13;
+    t1 = t10 - t4;
+    t8 = t5 - t6;
+    t7 = t3 - t9;
+    t10 = t2 - t13;
+    t4 = t0 + t12;
+    t5 = t11 + t14;
+    t6 = t1 + t10;
+    t3 = t8 - t7;
+    t9 = t0 - t12;
+    t2 = t11 - t14;
+    t13 = t1 - t10;
+    t0 = t8 + t7;
+    re[24] = t4;
+    im[24] = t5;
+    re[39] = t6;
+    im[39] = t3;
+    re[54] = t9;
+    im[54] = t2;
+    re[9] = t13;
+    im[9] = t0;
+    t12 = re[36];
+    t11 = im[36];
+    t14 = re[51];
+    t1 = im[51];
+    t10 = re[6];
+    t8 = im[6];
+    t7 = re[21];
+    t4 = im[21];
+    t5 = t12 + t10;
+    t6 = t11 + t8;
+    t3 = t14 + t7;
+    t9 = t1 + t4;
+    t2 = t12 - t10;
+    t13 = t11 - t8;
+    t0 = t14 - t7;
+    t12 = t1 - t4;
+    t10 = t5 + t3;
+    t11 = t6 + t9;
+    t8 = t2 + t12;
+    t14 = t13 - t0;
+    t7 = t5 - t3;
+    t1 = t6 - t9;
+    t4 = t2 - t12;
+    t5 = t13 + t0;
+    re[36] = t10;
+    im[36] = t11;
+    re[51] = t8;
+    im[51] = t14;
+    re[6] = t7;
+    im[6] = t1;
+    re[21] = t4;
+    im[21] = t5;
+    t3 = re[48];
+    t6 = im[48];
+    t9 = re[3];
+    t2 = im[3];
+    t12 = re[18];
+    t13 = im[18];
+    t0 = re[33];
+    t10 = im[33];
+    t11 = t3 + t12;
+    t8 = t6 + t13;
+    t14 = t9 + t0;
+    t7 = t2 + t10;
+    t1 = t3 - t12;
+    t4 = t6 - t13;
+    t5 = t9 - t0;
+    t3 = t2 - t10;
+    t12 = t11 + t14;
+    t6 = t8 + t7;
+    t13 = t1 + t3;
+    t9 = t4 - t5;
+    t0 = t11 - t14;
+    t2 = t8 - t7;
+    t10 = t1 - t3;
+    t11 = t4 + t5;
+    re[48] = t12;
+    im[48] = t6;
+    re[3] = t13;
+    im[3] = t9;
+    re[18] = t0;
+    im[18] = t2;
+    re[33] = t10;
+    im[33] = t11;
+    t14 = x[139];
+    t8 = x[19];
+    t7 = 0.01971225071410094 * t8;
+    t1 = x[100];
+    t3 = 0.12841755868299887 * t1;
+    t4 = t7 - t3;
+    t5 = (-0.11239706530608198) * t14;
+    t12 = C20 * t4;
+    t6 = t5 + t12;
+    t13 = 0.06489247591059036 * t14;
+    t9 = C21 * t4;
+    t0 = t13 + t9;
+    t2 = x[4];
+    t10 = 0.0015331814262077778 * t2;
+    t11 = x[115];
+    t8 = 0.12842688814515704 * t11;
+    t1 = t10 - t8;
+    t7 = x[124];
+    t3 = C22 * t1;
+    t5 = (-0.09644200891397964) * t7;
+    t12 = t3 + t5;
+    t14 = (-C23) * t1;
+    t4 = (-0.08683677486635559) * t7;
+    t13 = t14 + t4;
+    t9 = x[28];
+    t2 = 0.04132536003272668 * t9;
+    t11 = x[91];
+    t10 = 0.13157910079007984 * t11;
+    t8 = t2 - t10;
+    t3 = x[148];
+    t5 = 0.12650337940031647 * t3;
+    t1 = x[211];
+    t7 = 0.0005194330611931187 * t1;
+    t14 = t5 + t7;
+    t4 = C24 * t8;
+    t9 = (-C25) * t14;
+    t11 = t4 + t9;
+    t2 = (-C25) * t8;
+    t10 = (-C24) * t14;
+    t3 = t2 + t10;
+    t1 = x[52];
+    t5 = 0.110437772783816 * t1;
+    t7 = x[67];
+    t4 = 0.13432951598517828 * t7;
+    t9 = t5 - t4;
+    t8 = x[172];
+    t14 = 0.0883673493295678 * t8;
+    t2 = x[187];
+    t10 = 0.043430098972763266 * t2;
+    t1 = t14 + t10;
+    t7 = C26 * t9;
+    t5 = (-C27) * t1;
+    t4 = t7 + t5;
+    t8 = (-C27) * t9;
+    t2 = (-C26) * t1;
+    t14 = t8 + t2;
+    t10 = x[163];
+    t7 = 0.10915391824065103 * t10;
+    t5 = x[196];
+    t9 = 0.019495614692840772 * t5;
+    t1 = t7 + t9;
+    t8 = x[43];
+    t2 = 0.0861321005071867 * t8;
+    t10 = x[76];
+    t5 = 0.13730582157802826 * t10;
+    t7 = t2 - t5;
+    t9 = (-C28) * t1;
+    t8 = C29 * t7;
+    t10 = t9 + t8;
+    t2 = C29 * t1;
+    t5 = C28 * t7;
+    t9 = t2 + t5;
+    t8 = t12 + t10;
+    t1 = t13 + t9;
+    t7 = t11 + t4;
+    t2 = t3 + t14;
+    t5 = t12 - t10;
+    t12 = t13 - t9;
+    t10 = t11 - t4;
+    t13 = t3 - t14;
+    t9 = t8 + t7;
+    t11 = t1 + t2;
+    t4 = t8 - t7;
+    t3 = C4 * t4;
+    t14 = t1 - t2;
+    t8 = C4 * t14;
+    t7 = C5 * t9;
+    t4 = t6 - t7;
+    t1 = C5 * t11;
+    t2 = t0 - t1;
+    t14 = t4 + t3;
+    t7 = t2 + t8;
+    t1 = t4 - t3;
+    t4 = t2 - t8;
+    t3 = C0 * t5;
+    t2 = C2 * t10;
+    t8 = t3 + t2;
+    t3 = C0 * t12;
+    t2 = C2 * t13;
+    t3 = t3 + t2;
+    t2 = C2 * t5;
+    t5 = C0 * t10;
+    t10 = t2 - t5;
+    t2 = C2 * t12;
+    t5 = C0 * t13;
+    t12 = t2 - t5;
+    t13 = t6 + t9;
+    t2 = t0 + t11;
+    t5 = t14 + t3;
+    t6 = t7 - t8;
+    t9 = t1 + t12;
+    t0 = t4 - t10;
+    t11 = t1 - t12;
+    t1 = t4 + t10;
+    t12 = t14 - t3;
+    t4 = t7 + t8;
+    re[20] = t13;
+    im[20] = t2;
+    re[32] = t5;
+    im[32] = t6;
+    re[44] = t9;
+    im[44] = t0;
+    re[56] = t11;
+    im[56] = t1;
+    re[8] = t12;
+    im[8] = t4;
+    t10 = x[10];
+    t14 = 0.006025615493498079 * t10;
+    t3 = x[109];
+    t7 = 0.1278398442298228 * t3;
+    t8 = t14 - t7;
+    t13 = x[130];
+    t2 = C30 * t8;
+    t5 = (-0.10343063034205417) * t13;
+    t6 = t2 + t5;
+    t9 = (-C31) * t8;
+    t0 = (-0.0793651140451337) * t13;
+    t11 = t9 + t0;
+    t1 = x[34];
+    t12 = 0.05876309643192008 * t1;
+    t4 = x[85];
+    t10 = 0.13453560390917557 * t4;
+    t3 = t12 - t10;
+    t14 = x[154];
+    t7 = 0.12191121776397795 * t14;
+    t2 = x[205];
+    t5 = 0.004514182839126034 * t2;
+    t8 = t7 + t5;
+    t13 = C32 * t3;
+    t9 = (-C33) * t8;
+    t0 = t13 + t9;
+    t1 = (-C33) * t3;
+    t4 = (-C32) * t8;
+    t12 = t1 + t4;
+    t10 = x[58];
+    t14 = 0.1228846242244815 * t10;
+    t2 = x[61];
+    t7 = 0.12769564445023865 * t2;
+    t5 = t14 - t7;
+    t13 = x[178];
+    t9 = 0.07102713875108795 * t13;
+    t3 = x[181];
+    t8 = 0.06182067494882439 * t3;
+    t1 = t9 + t8;
+    t4 = C34 * t5;
+    t10 = (-C35) * t1;
+    t2 = t4 + t10;
+    t14 = (-C35) * t5;
+    t7 = (-C34) * t1;
+    t13 = t14 + t7;
+    t3 = x[157];
+    t9 = 0.11853309602042676 * t3;
+    t8 = x[202];
+    t4 = 0.008315002078298335 * t8;
+    t10 = t9 + t4;
+    t5 = x[37];
+    t1 = 0.06791417225431495 * t5;
+    t14 = x[82];
+    t7 = 0.13584358060175267 * t14;
+    t3 = t1 - t7;
+    t8 = (-C36) * t10;
+    t9 = C37 * t3;
+    t4 = t8 + t9;
+    t5 = C37 * t10;
+    t14 = C36 * t3;
+    t1 = t5 + t14;
+    t7 = x[133];
+    t8 = x[13];
+    t9 = 0.009636125497564936 * t8;
+    t10 = x[106];
+    t3 = 0.1277921467134663 * t10;
+    t5 = t9 - t3;
+    t14 = (-0.10748263355987739) * t7;
+    t8 = C38 * t5;
+    t10 = t14 + t8;
+    t9 = 0.07387076742605846 * t7;
+    t3 = C39 * t5;
+    t14 = t9 + t3;
+    t8 = t0 + t10;
+    t7 = t12 + t14;
+    t5 = t2 + t4;
+    t9 = t13 + t1;
+    t3 = t0 - t10;
+    t0 = t12 - t14;
+    t10 = t2 - t4;
+    t12 = t13 - t1;
+    t14 = t8 + t5;
+    t2 = t7 + t9;
+    t4 = t8 - t5;
+    t13 = C4 * t4;
+    t1 = t7 - t9;
+    t8 = C4 * t1;
+    t5 = C5 * t14;
+    t4 = t6 - t5;
+    t7 = C5 * t2;
+    t9 = t11 - t7;
+    t1 = t4 + t13;
+    t5 = t9 + t8;
+    t7 = t4 - t13;
+    t4 = t9 - t8;
+    t13 = C0 * t3;
+    t9 = C2 * t10;
+    t8 = t13 + t9;
+    t13 = C0 * t0;
+    t9 = C2 * t12;
+    t13 = t13 + t9;
+    t9 = C2 * t3;
+    t3 = C0 * t10;
+    t10 = t9 - t3;
+    t9 = C2 * t0;
+    t3 = C0 * t12;
+    t0 = t9 - t3;
+    t12 = t6 + t14;
+    t9 = t11 + t2;
+    t3 = t1 + t13;
+    t6 = t5 - t8;
+    t14 = t7 + t0;
+    t11 = t4 - t10;
+    t2 = t7 - t0;
+    t7 = t4 + t10;
+    t0 = t1 - t13;
+    t4 = t5 + t8;
+    re[35] = t12;
+    im[35] = t9;
+    re[47] = t3;
+    im[47] = t6;
+    re[59] = t14;
+    im[59] = t11;
+    re[11] = t2;
+    im[11] = t7;
+    re[23] = t0;
+    im[23] = t4;
+    t10 = x[40];
+    t1 = 0.07710352524829175 * t10;
+    t13 = x[79];
+    t5 = 0.1368217981907019 * t13;
+    t8 = t1 - t5;
+    t12 = x[160];
+    t9 = 0.11429836914374931 * t12;
+    t3 = x[199];
+    t6 = 0.013334776417074718 * t3;
+    t14 = t9 + t6;
+    t11 = C40 * t8;
+    t2 = (-C41) * t14;
+    t7 = t11 + t2;
+    t0 = (-C41) * t8;
+    t4 = (-C40) * t14;
+    t10 = t0 + t4;
+    t13 = x[175];
+    t1 = 0.07994293781845482 * t13;
+    t5 = x[184];
+    t12 = 0.05254269484584441 * t5;
+    t3 = t1 + t12;
+    t9 = x[55];
+    t6 = 0.11710982065184652 * t9;
+    t11 = x[64];
+    t2 = 0.13151131774241775 * t11;
+    t8 = t6 - t2;
+    t14 = (-C42) * t3;
+    t0 = C43 * t8;
+    t4 = t14 + t0;
+    t13 = C43 * t3;
+    t5 = C42 * t8;
+    t1 = t13 + t5;
+    t12 = x[151];
+    t9 = 0.12452674599864776 * t12;
+    t11 = x[208];
+    t6 = 0.0019510169774324456 * t11;
+    t2 = t9 + t6;
+    t14 = x[31];
+    t0 = 0.049840479635363234 * t14;
+    t3 = x[88];
+    t8 = 0.1330591826828481 * t3;
+    t13 = t0 - t8;
+    t5 = (-C44) * t2;
+    t12 = C45 * t13;
+    t11 = t5 + t12;
+    t9 = C45 * t2;
+    t6 = C44 * t13;
+    t14 = t9 + t6;
+    t3 = x[127];
+    t0 = x[7];
+    t8 = 0.003342172812925513 * t0;
+    t5 = x[112];
+    t12 = 0.12806787176544185 * t5;
+    t2 = t8 - t12;
+    t13 = (-0.10113725255520822) * t3;
+    t9 = C46 * t2;
+    t6 = t13 + t9;
+    t0 = 0.08189933228041855 * t3;
+    t5 = C47 * t2;
+    t8 = t0 + t5;
+    t12 = x[16];
+    t13 = 0.014200113027426714 * t12;
+    t9 = x[103];
+    t3 = 0.12797093533587375 * t9;
+    t2 = t13 - t3;
+    t0 = x[136];
+    t5 = C48 * t2;
+    t12 = (-0.10922669872189356) * t0;
+    t9 = t5 + t12;
+    t13 = (-C49) * t2;
+    t3 = (-0.07093264752989449) * t0;
+    t5 = t13 + t3;
+    t12 = t4 + t9;
+    t2 = t1 + t5;
+    t0 = t11 + t6;
+    t13 = t14 + t8;
+    t3 = t4 - t9;
+    t4 = t1 - t5;
+    t9 = t11 - t6;
+    t1 = t14 - t8;
+    t5 = t12 + t0;
+    t11 = t2 + t13;
+    t6 = t12 - t0;
+    t14 = C4 * t6;
+    t8 = t2 - t13;
+    t12 = C4 * t8;
+    t0 = C5 * t5;
+    t6 = t7 - t0;
+    t2 = C5 * t11;
+    t13 = t10 - t2;
+    t8 = t6 + t14;
+    t0 = t13 + t12;
+    t2 = t6 - t14;
+    t6 = t13 - t12;
+    t14 = C0 * t3;
+    t13 = C2 * t9;
+    t12 = t14 + t13;
+    t14 = C0 * t4;
+    t13 = C2 * t1;
+    t14 = t14 + t13;
+    t13 = C2 * t3;
+    t3 = C0 * t9;
+    t9 = t13 - t3;
+    t13 = C2 * t4;
+    t3 = C0 * t1;
+    t4 = t13 - t3;
+    t1 = t7 + t5;
+    t13 = t10 + t11;
+    t3 = t8 + t14;
+    t7 = t0 - t12;
+    t5 = t2 + t4;
+    t10 = t6 - t9;
+    t11 = t2 - t4;
+    t2 = t6 + t9;
+    t4 = t8 - t14;
+    t6 = t0 + t12;
+    re[50] = t1;
+    im[50] = t13;
+    re[2] = t3;
+    im[2] = t7;
+    re[14] = t5;
+    im[14] = t10;
+    re[26] = t11;
+    im[26] = t2;
+    re[38] = t4;
+    im[38] = t6;
+    t9 = x[169];
+    t8 = 0.09612626454352326 * t9;
+    t14 = x[190];
+    t0 = 0.034730279097660105 * t14;
+    t12 = t8 + t0;
+    t1 = x[49];
+    t13 = 0.10296430973177248 * t1;
+    t3 = x[70];
+    t7 = 0.1361822132041467 * t3;
+    t5 = t13 - t7;
+    t10 = (-C50) * t12;
+    t11 = C51 * t5;
+    t2 = t10 + t11;
+    t4 = C51 * t12;
+    t6 = C50 * t5;
+    t9 = t4 + t6;
+    t14 = x[145];
+    t8 = x[25];
+    t0 = 0.03337558481131762 * t8;
+    t1 = x[94];
+    t3 = 0.13024140576603055 * t1;
+    t13 = t0 - t3;
+    t7 = (-0.1155015794249144) * t14;
+    t10 = C52 * t13;
+    t11 = t7 + t10;
+    t12 = 0.05509142737367739 * t14;
+    t5 = C53 * t13;
+    t4 = t12 + t5;
+    t6 = x[121];
+    t8 = x[1];
+    t1 = 0.0004918875004744597 * t8;
+    t0 = x[118];
+    t3 = 0.12886614548209754 * t0;
+    t7 = t1 - t3;
+    t10 = (-0.09381496439562795) * t6;
+    t14 = C54 * t7;
+    t13 = t10 + t14;
+    t12 = 0.08902707703906894 * t6;
+    t5 = C55 * t7;
+    t8 = t12 + t5;
+    t0 = x[22];
+    t1 = 0.026131072792527615 * t0;
+    t3 = x[97];
+    t10 = 0.1291658796814725 * t3;
+    t14 = t1 - t10;
+    t6 = x[142];
+    t7 = C56 * t14;
+    t12 = (-0.11339644737309353) * t6;
+    t5 = t7 + t12;
+    t0 = (-C57) * t14;
+    t3 = (-0.061569247419971176) * t6;
+    t1 = t0 + t3;
+    t10 = x[46];
+    t7 = 0.09481016392552134 * t10;
+    t12 = x[73];
+    t14 = 0.13713932162371242 * t12;
+    t6 = t7 - t14;
+    t0 = x[166];
+    t3 = 0.10308453537650168 * t0;
+    t10 = x[193];
+    t12 = 0.02668198545912109 * t10;
+    t7 = t3 + t12;
+    t14 = C58 * t6;
+    t0 = (-C59) * t7;
+    t10 = t14 + t0;
+    t3 = (-C59) * t6;
+    t12 = (-C58) * t7;
+    t14 = t3 + t12;
+    t0 = t11 + t10;
+    t6 = t4 + t14;
+    t7 = t13 + t5;
+    t3 = t8 + t1;
+    t12 = t11 - t10;
+    t11 = t4 - t14;
+    t10 = t13 - t5;
+    t4 = t8 - t1;
+    t14 = t0 + t7;
+    t13 = t6 + t3;
+    t5 = t0 - t7;
+    t8 = C4 * t5;
+    t1 = t6 - t3;
+    t0 = C4 * t1;
+    t7 = C5 * t14;
+    t5 = t2 - t7;
+    t6 = C5 * t13;
+    t3 = t9 - t6;
+    t1 = t5 + t8;
+    t7 = t3 + t0;
+    t6 = t5 - t8;
+    t5 = t3 - t0;
+    t8 = C0 * t12;
+    t3 = C2 * t10;
+    t0 = t8 + t3;
+    t8 = C0 * t11;
+    t3 = C2 * t4;
+    t8 = t8 + t3;
+    t3 = C2 * t12;
+    t12 = C0 * t10;
+    t10 = t3 - t12;
+    t3 = C2 * t11;
+    t12 = C0 * t4;
+    t11 = t3 - t12;
+    t4 = t2 + t14;
+    t3 = t9 + t13;
+    t12 = t1 + t8;
+    t2 = t7 - t0;
+    t14 = t6 + t11;
+    t9 = t5 - t10;
+    t13 = t6 - t11;
+    t6 = t5 + t10;
+    t11 = t1 - t8;
+    t5 = t7 + t0;
+    re[5] = t4;
+    im[5] = t3;
+    re[17] = t12;
+    im[17] = t2;
+    re[29] = t14;
+    im[29] = t9;
+    re[41] = t13;
+    im[41] = t6;
+    re[53] = t11;
+    im[53] = t5;
+    t10 = re[20];
+    t1 = im[20];
+    t8 = re[35];
+    t7 = im[35];
+    t0 = re[50];
+    t4 = im[50];
+    t3 = re[5];
+    t12 = im[5];
+    t2 = t10 + t0;
+    t14 = t1 + t4;
+    t9 = t8 + t3;
+    t13 = t7 + t12;
+    t6 = t10 - t0;
+    t11 = t1 - t4;
+    t5 = t8 - t3;
+    t10 = t7 - t12;
+    t0 = t2 + t9;
+    t1 = t14 + t13;
+    t4 = t6 + t10;
+    t8 = t11 - t5;
+    t3 = t2 - t9;
+    t7 = t14 - t13;
+    t12 = t6 - t10;
+    t2 = t11 + t5;
+    re[20] = t0;
+    im[20] = t1;
+    re[35] = t4;
+    im[35] = t8;
+    re[50] = t3;
+    im[50] = t7;
+    re[5] = t12;
+    im[5] = t2;
+    t9 = re[32];
+    t14 = im[32];
+    t13 = re[47];
+    t6 = im[47];
+    t10 = re[2];
+    t11 = im[2];
+    t5 = re[17];
+    t0 = im[17];
+    t1 = t9 + t10;
+    t4 = t14 + t11;
+    t8 = t13 + t5;
+    t3 = t6 + t0;
+    t7 = t9 - t10;
+    t12 = t14 - t11;
+    t2 = t13 - t5;
+    t9 = t6 - t0;
+    t10 = t1 + t8;
+    t14 = t4 + t3;
+    t11 = t7 + t9;
+    t13 = t12 - t2;
+    t5 = t1 - t8;
+    t6 = t4 - t3;
+    t0 = t7 - t9;
+    t1 = t12 + t2;
+    re[32] = t10;
+    im[32] = t14;
+    re[47] = t11;
+    im[47] = t13;
+    re[2] = t5;
+    im[2] = t6;
+    re[17] = t0;
+    im[17] = t1;
+    t8 = re[44];
+    t4 = im[44];
+    t3 = re[59];
+    t7 = im[59];
+    t9 = re[14];
+    t12 = im[14];
+    t2 = re[29];
+    t10 = im[29];
+    t14 = t8 + t9;
+    t11 = t4 + t12;
+    t13 = t3 + t2;
+    t5 = t7 + t10;
+    t6 = t8 - t9;
+    t0 = t4 - t12;
+    t1 = t3 - t2;
+    t8 = t7 - t10;
+    t9 = t14 + t13;
+    t4 = t11 + t5;
+    t12 = t6 + t8;
+    t3 = t0 - t1;
+    t2 = t14 - t13;
+    t7 = t11 - t5;
+    t10 = t6 - t8;
+    t14 = t0 + t1;
+    re[44] = t9;
+    im[44] = t4;
+    re[59] = t12;
+    im[59] = t3;
+    re[14] = t2;
+    im[14] = t7;
+    re[29] = t10;
+    im[29] = t14;
+    t13 = re[56];
+    t11 = im[56];
+    t5 = re[11];
+    t6 = im[11];
+    t8 = re[26];
+    t0 = im[26];
+    t1 = re[41];
+    t9 = im[41];
+    t4 = t13 + t8;
+    t12 = t11 + t0;
+    t3 = t5 + t1;
+    t2 = t6 + t9;
+    t7 = t13 - t8;
+    t10 = t11 - t0;
+    t14 = t5 - t1;
+    t13 = t6 - t9;
+    t8 = t4 + t3;
+    t11 = t12 + t2;
+    t0 = t7 + t13;
+    t5 = t10 - t14;
+    t1 = t4 - t3;
+    t6 = t12 - t2;
+    t9 = t7 - t13;
+    t4 = t10 + t14;
+    re[56] = t8;
+    im[56] = t11;
+    re[11] = t0;
+    im[11] = t5;
+    re[26] = t1;
+    im[26] = t6;
+    re[41] = t9;
+    im[41] = t4;
+    t3 = re[8];
+    t12 = im[8];
+    t2 = re[23];
+    t7 = im[23];
+    t13 = re[38];
+    t10 = im[38];
+    t14 = re[53];
+    t8 = im[53];
+    t11 = t3 + t13;
+    t0 = t12 + t10;
+    t5 = t2 + t14;
+    t1 = t7 + t8;
+    t6 = t3 - t13;
+    t9 = t12 - t10;
+    t4 = t2 - t14;
+    t3 = t7 - t8;
+    t13 = t11 + t5;
+    t12 = t0 + t1;
+    t10 = t6 + t3;
+    t2 = t9 - t4;
+    t14 = t11 - t5;
+    t7 = t0 - t1;
+    t8 = t6 - t3;
+    t11 = t9 + t4;
+    re[8] = t13;
+    im[8] = t12;
+    re[23] = t10;
+    im[23] = t2;
+    re[38] = t14;
+    im[38] = t7;
+    re[53] = t8;
+    im[53] = t11;
+    t5 = x[20];
+    t0 = 0.021754981570668463 * t5;
+    t1 = x[99];
+    t6 = 0.12863192432137183 * t1;
+    t3 = t0 - t6;
+    t9 = x[140];
+    t4 = C20 * t3;
+    t13 = (-0.11220975512796953) * t9;
+    t12 = t4 + t13;
+    t10 = (-C21) * t3;
+    t2 = (-0.06478433232883518) * t9;
+    t14 = t10 + t2;
+    t7 = x[44];
+    t8 = 0.08907330500678516 * t7;
+    t11 = x[75];
+    t5 = 0.13733025315079586 * t11;
+    t1 = t8 - t5;
+    t0 = x[164];
+    t6 = 0.10723257358114603 * t0;
+    t4 = x[195];
+    t13 = 0.021784194384711957 * t4;
+    t3 = t6 + t13;
+    t9 = C29 * t1;
+    t10 = (-C28) * t3;
+    t2 = t9 + t10;
+    t7 = (-C28) * t1;
+    t11 = (-C29) * t3;
+    t8 = t7 + t11;
+    t5 = x[171];
+    t0 = 0.09103494713595524 * t5;
+    t4 = x[188];
+    t6 = 0.04047221355336257 * t4;
+    t13 = t0 + t6;
+    t9 = x[51];
+    t10 = 0.10803002167053968 * t9;
+    t1 = x[68];
+    t3 = 0.13505200965384395 * t1;
+    t7 = t10 - t3;
+    t11 = (-C27) * t13;
+    t5 = C26 * t7;
+    t4 = t11 + t5;
+    t0 = C26 * t13;
+    t6 = C27 * t7;
+    t9 = t0 + t6;
+    t1 = x[147];
+    t10 = x[27];
+    t3 = 0.0386056955153734 * t10;
+    t11 = x[92];
+    t5 = 0.13114862579928324 * t11;
+    t13 = t3 - t5;
+    t7 = (-0.11609544159981501) * t1;
+    t0 = C24 * t13;
+    t6 = t7 + t0;
+    t10 = 0.051689020833799566 * t1;
+    t11 = C25 * t13;
+    t3 = t10 + t11;
+    t5 = x[123];
+    t7 = x[3];
+    t0 = 0.0011081398757414565 * t7;
+    t1 = x[116];
+    t13 = 0.12856697855379723 * t1;
+    t10 = t0 - t13;
+    t11 = (-0.09633692282896146) * t5;
+    t7 = C22 * t10;
+    t1 = t11 + t7;
+    t0 = 0.0867421549304058 * t5;
+    t13 = C23 * t10;
+    t11 = t0 + t13;
+    t7 = t2 + t1;
+    t5 = t8 + t11;
+    t10 = t4 + t6;
+    t0 = t9 + t3;
+    t13 = t2 - t1;
+    t2 = t8 - t11;
+    t1 = t4 - t6;
+    t8 = t9 - t3;
+    t11 = t7 + t10;
+    t4 = t5 + t0;
+    t6 = t7 - t10;
+    t9 = C4 * t6;
+    t3 = t5 - t0;
+    t7 = C4 * t3;
+    t10 = C5 * t11;
+    t6 = t12 - t10;
+    t5 = C5 * t4;
+    t0 = t14 - t5;
+    t3 = t6 + t9;
+    t10 = t0 + t7;
+    t5 = t6 - t9;
+    t6 = t0 - t7;
+    t9 = C0 * t13;
+    t0 = C2 * t1;
+    t7 = t9 + t0;
+    t9 = C0 * t2;
+    t0 = C2 * t8;
+    t9 = t9 + t0;
+    t0 = C2 * t13;
+    t13 = C0 * t1;
+    t1 = t0 - t13;
+    t0 = C2 * t2;
+    t13 = C0 * t8;
+    t2 = t0 - t13;
+    t8 = t12 + t11;
+    t0 = t14 + t4;
+    t13 = t3 + t9;
+    t12 = t10 - t7;
+    t11 = t5 + t2;
+    t14 = t6 - t1;
+    t4 = t5 - t2;
+    t5 = t6 + t1;
+    t2 = t3 - t9;
+    t6 = t10 + t7;
+    re[40] = t8;
+    im[40] = t0;
+    re[52] = t13;
+    im[52] = t12;
+    re[4] = t11;
+    im[4] = t14;
+    re[16] = t4;
+    im[16] = t5;
+    re[28] = t2;
+    im[28] = t6;
+    t1 = x[50];
+    t3 = 0.10553761563829522 * t1;
+    t9 = x[69];
+    t10 = 0.13566875398048714 * t9;
+    t7 = t3 - t10;
+    t8 = x[170];
+    t0 = 0.0936228253848627 * t8;
+    t13 = x[189];
+    t12 = 0.03756930245760549 * t13;
+    t11 = t0 + t12;
+    t14 = C51 * t7;
+    t4 = (-C50) * t11;
+    t5 = t14 + t4;
+    t2 = (-C50) * t7;
+    t6 = (-C51) * t11;
+    t1 = t2 + t6;
+    t9 = x[165];
+    t3 = 0.10520915987872281 * t9;
+    t10 = x[194];
+    t8 = 0.024181661331159763 * t10;
+    t13 = t3 + t8;
+    t0 = x[45];
+    t12 = 0.09196785996907547 * t0;
+    t14 = x[74];
+    t4 = 0.13727636491149103 * t14;
+    t7 = t12 - t4;
+    t11 = (-C59) * t13;
+    t2 = C58 * t7;
+    t6 = t11 + t2;
+    t9 = C58 * t13;
+    t10 = C59 * t7;
+    t3 = t9 + t10;
+    t8 = x[141];
+    t0 = x[21];
+    t14 = 0.02389541705548433 * t0;
+    t12 = x[98];
+    t4 = 0.12888116724457874 * t12;
+    t11 = t14 - t4;
+    t2 = (-0.11364695238912442) * t8;
+    t13 = C56 * t11;
+    t7 = t2 + t13;
+    t9 = 0.06170526054621318 * t8;
+    t10 = C57 * t11;
+    t0 = t9 + t10;
+    t12 = x[2];
+    t14 = 0.00076369095933275 * t12;
+    t4 = x[117];
+    t2 = 0.12871400131270763 * t4;
+    t13 = t14 - t2;
+    t8 = x[122];
+    t11 = C54 * t13;
+    t9 = (-0.09392585675923054) * t8;
+    t10 = t11 + t9;
+    t12 = (-C55) * t13;
+    t4 = (-0.08913230996284706) * t8;
+    t14 = t12 + t4;
+    t2 = x[26];
+    t11 = 0.03595400675377978 * t2;
+    t9 = x[93];
+    t13 = 0.13067577163541516 * t9;
+    t8 = t11 - t13;
+    t12 = x[146];
+    t4 = C52 * t8;
+    t2 = (-0.11511765252450798) * t12;
+    t9 = t4 + t2;
+    t11 = (-C53) * t8;
+    t13 = (-0.054908303635838894) * t12;
+    t4 = t11 + t13;
+    t2 = t6 + t9;
+    t8 = t3 + t4;
+    t12 = t7 + t10;
+    t11 = t0 + t14;
+    t13 = t6 - t9;
+    t6 = t3 - t4;
+    t9 = t7 - t10;
+    t3 = t0 - t14;
+    t4 = t2 + t12;
+    t7 = t8 + t11;
+    t10 = t2 - t12;
+    t0 = C4 * t10;
+    t14 = t8 - t11;
+    t2 = C4 * t14;
+    t12 = C5 * t4;
+    t10 = t5 - t12;
+    t8 = C5 * t7;
+    t11 = t1 - t8;
+    t14 = t10 + t0;
+    t12 = t11 + t2;
+    t8 = t10 - t0;
+    t10 = t11 - t2;
+    t0 = C0 * t13;
+    t11 = C2 * t9;
+    t2 = t0 + t11;
+    t0 = C0 * t6;
+    t11 = C2 * t3;
+    t0 = t0 + t11;
+    t11 = C2 * t13;
+    t13 = C0 * t9;
+    t9 = t11 - t13;
+    t11 = C2 * t6;
+    t13 = C0 * t3;
+    t6 = t11 - t13;
+    t3 = t5 + t4;
+    t11 = t1 + t7;
+    t13 = t14 + t0;
+    t5 = t12 - t2;
+    t4 = t8 + t6;
+    t1 = t10 - t9;
+    t7 = t8 - t6;
+    t8 = t10 + t9;
+    t6 = t14 - t0;
+    t10 = t12 + t2;
+    re[55] = t3;
+    im[55] = t11;
+    re[7] = t13;
+    im[7] = t5;
+    re[19] = t4;
+    im[19] = t1;
+    re[31] = t7;
+    im[31] = t8;
+    re[43] = t6;
+    im[43] = t10;
+    t9 = x[159];
+    t14 = 0.11580866457349219 * t9;
+    t0 = x[200];
+    t12 = 0.011530095541814405 * t0;
+    t2 = t14 + t12;
+    t3 = x[39];
+    t11 = 0.07404845715883025 * t3;
+    t13 = x[80];
+    t5 = 0.13654315883131996 * t13;
+    t4 = t11 - t5;
+    t1 = (-C41) * t2;
+    t7 = C40 * t4;
+    t8 = t1 + t7;
+    t6 = C40 * t2;
+    t10 = C41 * t4;
+    t9 = t6 + t10;
+    t0 = x[135];
+    t14 = x[15];
+    t12 = 0.012572306868533882 * t14;
+    t3 = x[104];
+    t13 = 0.12788347061217586 * t3;
+    t11 = t12 - t13;
+    t5 = (-0.10930140331802629) * t0;
+    t1 = C48 * t11;
+    t7 = t5 + t1;
+    t2 = 0.07098116126186983 * t0;
+    t4 = C49 * t11;
+    t6 = t2 + t4;
+    t10 = x[8];
+    t14 = 0.004136551410626626 * t10;
+    t3 = x[111];
+    t12 = 0.127974800236916 * t3;
+    t13 = t14 - t12;
+    t5 = x[128];
+    t1 = C46 * t13;
+    t0 = (-0.1012108060881599) * t5;
+    t11 = t1 + t0;
+    t2 = (-C47) * t13;
+    t4 = (-0.08195889475698791) * t5;
+    t10 = t2 + t4;
+    t3 = x[32];
+    t14 = 0.0527778247303557 * t3;
+    t12 = x[87];
+    t1 = 0.13356018733626082 * t12;
+    t0 = t14 - t1;
+    t13 = x[152];
+    t5 = 0.12373220432951987 * t13;
+    t2 = x[207];
+    t4 = 0.002671013396397365 * t2;
+    t3 = t5 + t4;
+    t12 = C45 * t0;
+    t14 = (-C44) * t3;
+    t1 = t12 + t14;
+    t13 = (-C44) * t0;
+    t2 = (-C45) * t3;
+    t5 = t13 + t2;
+    t4 = x[56];
+    t12 = 0.11913926566118321 * t4;
+    t14 = x[63];
+    t0 = 0.13035180369321933 * t14;
+    t3 = t12 - t0;
+    t13 = x[176];
+    t2 = 0.07701545284553844 * t13;
+    t4 = x[183];
+    t14 = 0.055628708463325655 * t4;
+    t12 = t2 + t14;
+    t0 = C43 * t3;
+    t13 = (-C42) * t12;
+    t4 = t0 + t13;
+    t2 = (-C42) * t3;
+    t14 = (-C43) * t12;
+    t0 = t2 + t14;
+    t13 = t7 + t4;
+    t3 = t6 + t0;
+    t12 = t11 + t1;
+    t2 = t10 + t5;
+    t14 = t7 - t4;
+    t7 = t6 - t0;
+    t4 = t11 - t1;
+    t6 = t10 - t5;
+    t0 = t13 + t12;
+    t11 = t3 + t2;
+    t1 = t13 - t12;
+    t10 = C4 * t1;
+    t5 = t3 - t2;
+    t13 = C4 * t5;
+    t12 = C5 * t0;
+    t1 = t8 - t12;
+    t3 = C5 * t11;
+    t2 = t9 - t3;
+    t5 = t1 + t10;
+    t12 = t2 + t13;
+    t3 = t1 - t10;
+    t1 = t2 - t13;
+    t10 = C0 * t14;
+    t2 = C2 * t4;
+    t13 = t10 + t2;
+    t10 = C0 * t7;
+    t2 = C2 * t6;
+    t10 = t10 + t2;
+    t2 = C2 * t14;
+    t14 = C0 * t4;
+    t4 = t2 - t14;
+    t2 = C2 * t7;
+    t14 = C0 * t6;
+    t7 = t2 - t14;
+    t6 = t8 + t0;
+    t2 = t9 + t11;
+    t14 = t5 + t10;
+    t8 = t12 - t13;
+    t0 = t3 + t7;
+    t9 = t1 - t4;
+    t11 = t3 - t7;
+    t3 = t1 + t4;
+    t7 = t5 - t10;
+    t1 = t12 + t13;
+    re[10] = t6;
+    im[10] = t2;
+    re[22] = t14;
+    im[22] = t8;
+    re[34] = t0;
+    im[34] = t9;
+    re[46] = t11;
+    im[46] = t3;
+    re[58] = t7;
+    im[58] = t1;
+    t4 = x[129];
+    t5 = x[9];
+    t10 = 0.005029930242549008 * t5;
+    t12 = x[110];
+    t13 = 0.1278982472932104 * t12;
+    t6 = t10 - t13;
+    t2 = (-0.10338340009623033) * t4;
+    t14 = C30 * t6;
+    t8 = t2 + t14;
+    t0 = 0.07932887300286419 * t4;
+    t9 = C31 * t6;
+    t11 = t0 + t9;
+    t3 = x[14];
+    t7 = 0.011050914571142288 * t3;
+    t1 = x[105];
+    t5 = 0.12782434491435965 * t1;
+    t12 = t7 - t5;
+    t10 = x[134];
+    t13 = C38 * t12;
+    t2 = (-0.10745555931646766) * t10;
+    t14 = t13 + t2;
+    t4 = (-C39) * t12;
+    t6 = (-0.07385215981409442) * t10;
+    t0 = t4 + t6;
+    t9 = x[38];
+    t3 = 0.07098291339458514 * t9;
+    t1 = x[81];
+    t7 = 0.13621541368085294 * t1;
+    t5 = t3 - t7;
+    t13 = x[158];
+    t2 = 0.1172192652084256 * t13;
+    t12 = x[201];
+    t10 = 0.009855836165055538 * t12;
+    t4 = t2 + t10;
+    t6 = C37 * t5;
+    t9 = (-C36) * t4;
+    t1 = t6 + t9;
+    t3 = (-C36) * t5;
+    t7 = (-C37) * t4;
+    t13 = t3 + t7;
+    t12 = x[177];
+    t2 = 0.07404111225089935 * t12;
+    t10 = x[182];
+    t6 = 0.05872448364572954 * t10;
+    t9 = t2 + t6;
+    t5 = x[57];
+    t4 = 0.12106472436196737 * t5;
+    t3 = x[62];
+    t7 = 0.12907968222318938 * t3;
+    t12 = t4 - t7;
+    t10 = (-C35) * t9;
+    t2 = C34 * t12;
+    t6 = t10 + t2;
+    t5 = C34 * t9;
+    t3 = C35 * t12;
+    t4 = t5 + t3;
+    t7 = x[153];
+    t10 = 0.12286187788252573 * t7;
+    t2 = x[206];
+    t9 = 0.0035242164097109706 * t2;
+    t12 = t10 + t9;
+    t5 = x[33];
+    t3 = 0.055754312275673956 * t5;
+    t7 = x[86];
+    t2 = 0.13405440880677835 * t7;
+    t10 = t3 - t2;
+    t9 = (-C33) * t12;
+    t5 = C32 * t10;
+    t7 = t9 + t5;
+    t3 = C32 * t12;
+    t2 = C33 * t10;
+    t9 = t3 + t2;
+    t5 = t14 + t7;
+    t12 = t0 + t9;
+    t10 = t1 + t6;
+    t3 = t13 + t4;
+    t2 = t14 - t7;
+    t14 = t0 - t9;
+    t7 = t1 - t6;
+    t0 = t13 - t4;
+    t9 = t5 + t10;
+    t1 = t12 + t3;
+    t6 = t5 - t10;
+    t13 = C4 * t6;
+    t4 = t12 - t3;
+    t5 = C4 * t4;
+    t10 = C5 * t9;
+    t6 = t8 - t10;
+    t12 = C5 * t1;
+    t3 = t11 - t12;
+    t4 = t6 + t13;
+    t10 = t3 + t5;
+    t12 = t6 - t13;
+    t6 = t3 - t5;
+    t13 = C0 * t2;
+    t3 = C2 * t7;
+    t5 = t13 + t3;
+    t13 = C0 * t14;
+    t3 = C2 * t0;
+    t13 = t13 + t3;
+    t3 = C2 * t2;
+    t2 = C0 * t7;
+    t7 = t3 - t2;
+    t3 = C2 * t14;
+    t2 = C0 * t0;
+    t14 = t3 - t2;
+    t0 = t8 + t9;
+    t3 = t11 + t1;
+    t2 = t4 + t13;
+    t8 = t10 - t5;
+    t9 = t12 + t14;
+    t11 = t6 - t7;
+    t1 = t12 - t14;
+    t12 = t6 + t7;
+    t14 = t4 - t13;
+    t6 = t10 + t5;
+    re[25] = t0;
+    im[25] = t3;
+    re[37] = t2;
+    im[37] = t8;
+    re[49] = t9;
+    im[49] = t11;
+    re[1] = t1;
+    im[1] = t12;
+    re[13] = t14;
+    im[13] = t6;
+    t7 = re[40];
+    t4 = im[40];
+    t13 = re[55];
+    t10 = im[55];
+    t5 = re[10];
+    t0 = im[10];
+    t3 = re[25];
+    t2 = im[25];
+    t8 = t7 + t5;
+    t9 = t4 + t0;
+    t11 = t13 + t3;
+    t1 = t10 + t2;
+    t12 = t7 - t5;
+    t14 = t4 - t0;
+    t6 = t13 - t3;
+    t7 = t10 - t2;
+    t5 = t8 + t11;
+    t4 = t9 + t1;
+    t0 = t12 + t7;
+    t13 = t14 - t6;
+    t3 = t8 - t11;
+    t10 = t9 - t1;
+    t2 = t12 - t7;
+    t8 = t14 + t6;
+    re[40] = t5;
+    im[40] = t4;
+    re[55] = t0;
+    im[55] = t13;
+    re[10] = t3;
+    im[10] = t10;
+    re[25] = t2;
+    im[25] = t8;
+    t11 = re[52];
+    t9 = im[52];
+    t1 = re[7];
+    t12 = im[7];
+    t7 = re[22];
+    t14 = im[22];
+    t6 = re[37];
+    t5 = im[37];
+    t4 = t11 + t7;
+    t0 = t9 + t14;
+    t13 = t1 + t6;
+    t3 = t12 + t5;
+    t10 = t11 - t7;
+    t2 = t9 - t14;
+    t8 = t1 - t6;
+    t11 = t12 - t5;
+    t7 = t4 + t13;
+    t9 = t0 + t3;
+    t14 = t10 + t11;
+    t1 = t2 - t8;
+    t6 = t4 - t13;
+    t12 = t0 - t3;
+    t5 = t10 - t11;
+    t4 = t2 + t8;
+    re[52] = t7;
+    im[52] = t9;
+    re[7] = t14;
+    im[7] = t1;
+    re[22] = t6;
+    im[22] = t12;
+    re[37] = t5;
+    im[37] = t4;
+    t13 = re[4];
+    t0 = im[4];
+    t3 = re[19];
+    t10 = im[19];
+    t11 = re[34];
+    t2 = im[34];
+    t8 = re[49];
+    t7 = im[49];
+    t9 = t13 + t11;
+    t14 = t0 + t2;
+    t1 = t3 + t8;
+    t6 = t10 + t7;
+    t12 = t13 - t11;
+    t5 = t0 - t2;
+    t4 = t3 - t8;
+    t13 = t10 - t7;
+    t11 = t9 + t1;
+    t0 = t14 + t6;
+    t2 = t12 + t13;
+    t3 = t5 - t4;
+    t8 = t9 - t1;
+    t10 = t14 - t6;
+    t7 = t12 - t13;
+    t9 = t5 + t4;
+    re[4] = t11;
+    im[4] = t0;
+    re[19] = t2;
+    im[19] = t3;
+    re[34] = t8;
+    im[34] = t10;
+    re[49] = t7;
+    im[49] = t9;
+    t1 = re[16];
+    t14 = im[16];
+    t6 = re[31];
+    t12 = im[31];
+    t13 = re[46];
+    t5 = im[46];
+    t4 = re[1];
+    t11 = im[1];
+    t0 = t1 + t13;
+    t2 = t14 + t5;
+    t3 = t6 + t4;
+    t8 = t12 + t11;
+    t10 = t1 - t13;
+    t7 = t14 - t5;
+    t9 = t6 - t4;
+    t1 = t12 - t11;
+    t13 = t0 + t3;
+    t14 = t2 + t8;
+    t5 = t10 + t1;
+    t6 = t7 - t9;
+    t4 = t0 - t3;
+    t12 = t2 - t8;
+    t11 = t10 - t1;
+    t0 = t7 + t9;
+    re[16] = t13;
+    im[16] = t14;
+    re[31] = t5;
+    im[31] = t6;
+    re[46] = t4;
+    im[46] = t12;
+    re[1] = t11;
+    im[1] = t0;
+    t3 = re[28];
+    t2 = im[28];
+    t8 = re[43];
+    t10 = im[43];
+    t1 = re[58];
+    t7 = im[58];
+    t9 = re[13];
+    t13 = im[13];
+    t14 = t3 + t1;
+    t5 = t2 + t7;
+    t6 = t8 + t9;
+    t4 = t10 + t13;
+    t12 = t3 - t1;
+    t11 = t2 - t7;
+    t0 = t8 - t9;
+    t3 = t10 - t13;
+    t1 = t14 + t6;
+    t2 = t5 + t4;
+    t7 = t12 + t3;
+    t8 = t11 - t0;
+    t9 = t14 - t6;
+    t10 = t5 - t4;
+    t13 = t12 - t3;
+    t14 = t11 + t0;
+    re[28] = t1;
+    im[28] = t2;
+    re[43] = t7;
+    im[43] = t8;
+    re[58] = t9;
+    im[58] = t10;
+    re[13] = t13;
+    im[13] = t14;
+}
+
+/**
+ *  Part 2 of ApplyWindowedMDCT_W75_120().
+ * 
+ *  @param {Number[]} x 
+ *    - The input block (240 points).
+ *  @param {Number[]} X 
+ *    - The array that would contain the output block (120 points).
+ *  @param {Number[]} re 
+ *    - The scratch buffer (real part, 60 points).
+ *  @param {Number[]} im 
+ *    - The scratch buffer (imaginary part, 60 points).
+ */
+function ApplyWindowedMDCT_W75_120_Part2(x, X, re, im) {
+    let t0, t1, t10, t11, t12, t13, t14, t2, t3, t4, t5, t6, t7, t8, t9;
+    const C0 = 0.5;
+    const C1 = 0.8660254037844386;
+    const C2 = 0.9999785816641292;
+    const C3 = 0.006544937967351858;
+    const C4 = 0.4943212082861446;
+    const C5 = 0.8692793239451436;
+    const C6 = 0.8627343859777918;
+    const C7 = 0.5056573733779846;
+    const C8 = 0.8492021815265789;
+    const C9 = 0.528067850650368;
+    const C10 = 0.9994645874763657;
+    const C11 = 0.03271908282177614;
+    const C12 = 0.47139673682599764;
+    const C13 = 0.881921264348355;
+    const C14 = 0.44814919358922256;
+    const C15 = 0.8939587799699321;
+    const C16 = 0.8350879763187431;
+    const C17 = 0.5501164165954934;
+    const C18 = 0.9982656101847159;
+    const C19 = 0.05887080365118903;
+    const C20 = 0.9963824715083254;
+    const C21 = 0.08498217737244167;
+    const C22 = 0.4245945112807131;
+    const C23 = 0.9053836208979552;
+    const C24 = 0.8204014435255136;
+    const C25 = 0.5717879602276122;
+    const C26 = 0.8051526485628582;
+    const C27 = 0.5930676289532372;
+    const C28 = 0.9938164620563781;
+    const C29 = 0.11103530855427768;
+    const C30 = 0.40074883310314097;
+    const C31 = 0.916187957117136;
+    const C32 = 0.3766285016932107;
+    const C33 = 0.9263643838751181;
+    const C34 = 0.78935204219315;
+    const C35 = 0.6139408387503664;
+    const C36 = 0.9905693404435773;
+    const C37 = 0.13701234168196802;
+    const C38 = 0.986643332084879;
+    const C39 = 0.16289547339458874;
+    const C40 = 0.3522500479212335;
+    const C41 = 0.9359059267573258;
+    const C42 = 0.773010453362737;
+    const C43 = 0.6343932841636455;
+    const C44 = 0.7561390817803227;
+    const C45 = 0.6544109481086103;
+    const C46 = 0.9820411276703039;
+    const C47 = 0.18866696468655522;
+    const C48 = 0.3276301795616935;
+    const C49 = 0.944806046466878;
+    const C50 = 0.3027857698425746;
+    const C51 = 0.953058643306297;
+    const C52 = 0.7387494902412463;
+    const C53 = 0.6739801114782978;
+    const C54 = 0.9767658813208724;
+    const C55 = 0.21430915306505077;
+    const C56 = 0.9708212084269281;
+    const C57 = 0.23980446465501654;
+    const C58 = 0.2777338458812922;
+    const C59 = 0.9606580613579353;
+    const C60 = 0.7208535967029188;
+    const C61 = 0.6930873625456359;
+    const C62 = 0.7024636661168517;
+    const C63 = 0.7117196061551713;
+    const C64 = 0.9642111831703293;
+    const C65 = 0.265135426243408;
+    const C66 = 0.25249157701515795;
+    const C67 = 0.9675990923602598;
+    const C68 = 0.22707626303437323;
+    const C69 = 0.9738769792773336;
+    const C70 = 0.6835923020228712;
+    const C71 = 0.7298640726978356;
+    const C72 = 0.9569403357322088;
+    const C73 = 0.29028467725446233;
+    const C74 = 0.949013649188214;
+    const C75 = 0.31523498164776964;
+    const C76 = 0.20150532232561713;
+    const C77 = 0.9794874195590514;
+    const C78 = 0.6642524379112817;
+    const C79 = 0.7475083268625968;
+    const C80 = 0.6444573283588975;
+    const C81 = 0.7646402761590003;
+    const C82 = 0.9404365560933549;
+    const C83 = 0.3399692397309942;
+    const C84 = 0.1757962799343545;
+    const C85 = 0.9844265680898916;
+    const C86 = 0.149966755554045;
+    const C87 = 0.9886910398241674;
+    const C88 = 0.6242205399450176;
+    const C89 = 0.7812481792047586;
+    const C90 = 0.9312149347588036;
+    const C91 = 0.36447049987914965;
+    const C92 = 0.9213551052231925;
+    const C93 = 0.38872197015239557;
+    const C94 = 0.12403445145048532;
+    const C95 = 0.992277912105967;
+    const C96 = 0.6035559419535714;
+    const C97 = 0.7973206537727071;
+    const C98 = 0.5824776968678022;
+    const C99 = 0.8128466845916152;
+    const C100 = 0.9108638249211758;
+    const C101 = 0.41270702980439467;
+    const C102 = 0.0980171403295606;
+    const C103 = 0.9951847266721969;
+    const C104 = 0.07193265315671939;
+    const C105 = 0.9974094913373519;
+    const C106 = 0.5610002506640098;
+    const C107 = 0.8278156308955021;
+    const C108 = 0.8997482840522215;
+    const C109 = 0.436409240673342;
+    const C110 = 0.8880161006528073;
+    const C111 = 0.45981235844785984;
+    const C112 = 0.04579886693652077;
+    const C113 = 0.9989506813588601;
+    const C114 = 0.5391383229110002;
+    const C115 = 0.8422172337162865;
+    const C116 = 0.5169068966820275;
+    const C117 = 0.8560416229147715;
+    const C118 = 0.8756753153753997;
+    const C119 = 0.4829003438000374;
+    const C120 = 0.0196336924606283;
+    const C121 = 0.9998072404820648;
+    t6 = re[0];
+    t5 = im[0];
+    t4 = re[20];
+    t12 = im[20];
+    t3 = re[40];
+    t11 = im[40];
+    t0 = t4 + t3;
+    t1 = t12 + t11;
+    t2 = C0 * t0;
+    t7 = t6 - t2;
+    t8 = C0 * t1;
+    t9 = t5 - t8;
+    t10 = t4 - t3;
+    t13 = C1 * t10;
+    t14 = t12 - t11;
+    t2 = C1 * t14;
+    t8 = t6 + t0;
+    t4 = t5 + t1;
+    t3 = t7 + t2;
+    t10 = t9 - t13;
+    t12 = t7 - t2;
+    t11 = t9 + t13;
+    t14 = C2 * t8;
+    t6 = C3 * t4;
+    t0 = t14 + t6;
+    t5 = C3 * t8;
+    t1 = (-C2) * t4;
+    t7 = t5 + t1;
+    X[0] = t0;
+    X[119] = t7;
+    t2 = C4 * t3;
+    t9 = C5 * t10;
+    t13 = t2 + t9;
+    t14 = C5 * t3;
+    t6 = (-C4) * t10;
+    t8 = t14 + t6;
+    X[80] = t13;
+    X[39] = t8;
+    t4 = C6 * t12;
+    t5 = C7 * t11;
+    t1 = t4 + t5;
+    t0 = C7 * t12;
+    t7 = (-C6) * t11;
+    t2 = t0 + t7;
+    X[40] = t1;
+    X[79] = t2;
+    t9 = re[27];
+    t3 = im[27];
+    t10 = re[47];
+    t14 = im[47];
+    t6 = re[7];
+    t13 = im[7];
+    t8 = t10 + t6;
+    t4 = t14 + t13;
+    t5 = C0 * t8;
+    t12 = t9 - t5;
+    t11 = C0 * t4;
+    t0 = t3 - t11;
+    t7 = t10 - t6;
+    t1 = C1 * t7;
+    t2 = t14 - t13;
+    t5 = C1 * t2;
+    t11 = t9 + t8;
+    t10 = t3 + t4;
+    t6 = t12 + t5;
+    t7 = t0 - t1;
+    t14 = t12 - t5;
+    t13 = t0 + t1;
+    t2 = C8 * t11;
+    t9 = C9 * t10;
+    t8 = t2 + t9;
+    t3 = C9 * t11;
+    t4 = (-C8) * t10;
+    t12 = t3 + t4;
+    X[42] = t8;
+    X[77] = t12;
+    t5 = C10 * t6;
+    t0 = C11 * t7;
+    t1 = t5 + t0;
+    t2 = C11 * t6;
+    t9 = (-C10) * t7;
+    t11 = t2 + t9;
+    X[2] = t1;
+    X[117] = t11;
+    t10 = C12 * t14;
+    t3 = C13 * t13;
+    t4 = t10 + t3;
+    t8 = C13 * t14;
+    t12 = (-C12) * t13;
+    t5 = t8 + t12;
+    X[82] = t4;
+    X[37] = t5;
+    t0 = re[54];
+    t6 = im[54];
+    t7 = re[14];
+    t2 = im[14];
+    t9 = re[34];
+    t1 = im[34];
+    t11 = t7 + t9;
+    t10 = t2 + t1;
+    t3 = C0 * t11;
+    t14 = t0 - t3;
+    t13 = C0 * t10;
+    t8 = t6 - t13;
+    t12 = t7 - t9;
+    t4 = C1 * t12;
+    t5 = t2 - t1;
+    t3 = C1 * t5;
+    t13 = t0 + t11;
+    t7 = t6 + t10;
+    t9 = t14 + t3;
+    t12 = t8 - t4;
+    t2 = t14 - t3;
+    t1 = t8 + t4;
+    t5 = C14 * t13;
+    t0 = C15 * t7;
+    t11 = t5 + t0;
+    t6 = C15 * t13;
+    t10 = (-C14) * t7;
+    t14 = t6 + t10;
+    X[84] = t11;
+    X[35] = t14;
+    t3 = C16 * t9;
+    t8 = C17 * t12;
+    t4 = t3 + t8;
+    t5 = C17 * t9;
+    t0 = (-C16) * t12;
+    t13 = t5 + t0;
+    X[44] = t4;
+    X[75] = t13;
+    t7 = C18 * t2;
+    t6 = C19 * t1;
+    t10 = t7 + t6;
+    t11 = C19 * t2;
+    t14 = (-C18) * t1;
+    t3 = t11 + t14;
+    X[4] = t10;
+    X[115] = t3;
+    t8 = re[21];
+    t9 = im[21];
+    t12 = re[41];
+    t5 = im[41];
+    t0 = re[1];
+    t4 = im[1];
+    t13 = t12 + t0;
+    t7 = t5 + t4;
+    t6 = C0 * t13;
+    t2 = t8 - t6;
+    t1 = C0 * t7;
+    t11 = t9 - t1;
+    t14 = t12 - t0;
+    t10 = C1 * t14;
+    t3 = t5 - t4;
+    t6 = C1 * t3;
+    t1 = t8 + t13;
+    t12 = t9 + t7;
+    t0 = t2 + t6;
+    t14 = t11 - t10;
+    t5 = t2 - t6;
+    t4 = t11 + t10;
+    t3 = C20 * t1;
+    t8 = C21 * t12;
+    t13 = t3 + t8;
+    t9 = C21 * t1;
+    t7 = (-C20) * t12;
+    t2 = t9 + t7;
+    X[6] = t13;
+    X[113] = t2;
+    t6 = C22 * t0;
+    t11 = C23 * t14;
+    t10 = t6 + t11;
+    t3 = C23 * t0;
+    t8 = (-C22) * t14;
+    t1 = t3 + t8;
+    X[86] = t10;
+    X[33] = t1;
+    t12 = C24 * t5;
+    t9 = C25 * t4;
+    t7 = t12 + t9;
+    t13 = C25 * t5;
+    t2 = (-C24) * t4;
+    t6 = t13 + t2;
+    X[46] = t7;
+    X[73] = t6;
+    t11 = re[48];
+    t0 = im[48];
+    t14 = re[8];
+    t3 = im[8];
+    t8 = re[28];
+    t10 = im[28];
+    t1 = t14 + t8;
+    t12 = t3 + t10;
+    t9 = C0 * t1;
+    t5 = t11 - t9;
+    t4 = C0 * t12;
+    t13 = t0 - t4;
+    t2 = t14 - t8;
+    t7 = C1 * t2;
+    t6 = t3 - t10;
+    t9 = C1 * t6;
+    t4 = t11 + t1;
+    t14 = t0 + t12;
+    t8 = t5 + t9;
+    t2 = t13 - t7;
+    t3 = t5 - t9;
+    t10 = t13 + t7;
+    t6 = C26 * t4;
+    t11 = C27 * t14;
+    t1 = t6 + t11;
+    t0 = C27 * t4;
+    t12 = (-C26) * t14;
+    t5 = t0 + t12;
+    X[48] = t1;
+    X[71] = t5;
+    t9 = C28 * t8;
+    t13 = C29 * t2;
+    t7 = t9 + t13;
+    t6 = C29 * t8;
+    t11 = (-C28) * t2;
+    t4 = t6 + t11;
+    X[8] = t7;
+    X[111] = t4;
+    t14 = C30 * t3;
+    t0 = C31 * t10;
+    t12 = t14 + t0;
+    t1 = C31 * t3;
+    t5 = (-C30) * t10;
+    t9 = t1 + t5;
+    X[88] = t12;
+    X[31] = t9;
+    t13 = re[15];
+    t8 = im[15];
+    t2 = re[35];
+    t6 = im[35];
+    t11 = re[55];
+    t7 = im[55];
+    t4 = t2 + t11;
+    t14 = t6 + t7;
+    t0 = C0 * t4;
+    t3 = t13 - t0;
+    t10 = C0 * t14;
+    t1 = t8 - t10;
+    t5 = t2 - t11;
+    t12 = C1 * t5;
+    t9 = t6 - t7;
+    t0 = C1 * t9;
+    t10 = t13 + t4;
+    t2 = t8 + t14;
+    t11 = t3 + t0;
+    t5 = t1 - t12;
+    t6 = t3 - t0;
+    t7 = t1 + t12;
+    t9 = C32 * t10;
+    t13 = C33 * t2;
+    t4 = t9 + t13;
+    t8 = C33 * t10;
+    t14 = (-C32) * t2;
+    t3 = t8 + t14;
+    X[90] = t4;
+    X[29] = t3;
+    t0 = C34 * t11;
+    t1 = C35 * t5;
+    t12 = t0 + t1;
+    t9 = C35 * t11;
+    t13 = (-C34) * t5;
+    t10 = t9 + t13;
+    X[50] = t12;
+    X[69] = t10;
+    t2 = C36 * t6;
+    t8 = C37 * t7;
+    t14 = t2 + t8;
+    t4 = C37 * t6;
+    t3 = (-C36) * t7;
+    t0 = t4 + t3;
+    X[10] = t14;
+    X[109] = t0;
+    t1 = re[42];
+    t11 = im[42];
+    t5 = re[2];
+    t9 = im[2];
+    t13 = re[22];
+    t12 = im[22];
+    t10 = t5 + t13;
+    t2 = t9 + t12;
+    t8 = C0 * t10;
+    t6 = t1 - t8;
+    t7 = C0 * t2;
+    t4 = t11 - t7;
+    t3 = t5 - t13;
+    t14 = C1 * t3;
+    t0 = t9 - t12;
+    t8 = C1 * t0;
+    t7 = t1 + t10;
+    t5 = t11 + t2;
+    t13 = t6 + t8;
+    t3 = t4 - t14;
+    t9 = t6 - t8;
+    t12 = t4 + t14;
+    t0 = C38 * t7;
+    t1 = C39 * t5;
+    t10 = t0 + t1;
+    t11 = C39 * t7;
+    t2 = (-C38) * t5;
+    t6 = t11 + t2;
+    X[12] = t10;
+    X[107] = t6;
+    t8 = C40 * t13;
+    t4 = C41 * t3;
+    t14 = t8 + t4;
+    t0 = C41 * t13;
+    t1 = (-C40) * t3;
+    t7 = t0 + t1;
+    X[92] = t14;
+    X[27] = t7;
+    t5 = C42 * t9;
+    t11 = C43 * t12;
+    t2 = t5 + t11;
+    t10 = C43 * t9;
+    t6 = (-C42) * t12;
+    t8 = t10 + t6;
+    X[52] = t2;
+    X[67] = t8;
+    t4 = re[9];
+    t13 = im[9];
+    t3 = re[29];
+    t0 = im[29];
+    t1 = re[49];
+    t14 = im[49];
+    t7 = t3 + t1;
+    t5 = t0 + t14;
+    t11 = C0 * t7;
+    t9 = t4 - t11;
+    t12 = C0 * t5;
+    t10 = t13 - t12;
+    t6 = t3 - t1;
+    t2 = C1 * t6;
+    t8 = t0 - t14;
+    t11 = C1 * t8;
+    t12 = t4 + t7;
+    t3 = t13 + t5;
+    t1 = t9 + t11;
+    t6 = t10 - t2;
+    t0 = t9 - t11;
+    t14 = t10 + t2;
+    t8 = C44 * t12;
+    t4 = C45 * t3;
+    t7 = t8 + t4;
+    t13 = C45 * t12;
+    t5 = (-C44) * t3;
+    t9 = t13 + t5;
+    X[54] = t7;
+    X[65] = t9;
+    t11 = C46 * t1;
+    t10 = C47 * t6;
+    t2 = t11 + t10;
+    t8 = C47 * t1;
+    t4 = (-C46) * t6;
+    t12 = t8 + t4;
+    X[14] = t2;
+    X[105] = t12;
+    t3 = C48 * t0;
+    t13 = C49 * t14;
+    t5 = t3 + t13;
+    t7 = C49 * t0;
+    t9 = (-C48) * t14;
+    t11 = t7 + t9;
+    X[94] = t5;
+    X[25] = t11;
+    t10 = re[36];
+    t1 = im[36];
+    t6 = re[56];
+    t8 = im[56];
+    t4 = re[16];
+    t2 = im[16];
+    t12 = t6 + t4;
+    t3 = t8 + t2;
+    t13 = C0 * t12;
+    t0 = t10 - t13;
+    t14 = C0 * t3;
+    t7 = t1 - t14;
+    t9 = t6 - t4;
+    t5 = C1 * t9;
+    t11 = t8 - t2;
+    t13 = C1 * t11;
+    t14 = t10 + t12;
+    t6 = t1 + t3;
+    t4 = t0 + t13;
+    t9 = t7 - t5;
+    t8 = t0 - t13;
+    t2 = t7 + t5;
+    t11 = C50 * t14;
+    t10 = C51 * t6;
+    t12 = t11 + t10;
+    t1 = C51 * t14;
+    t3 = (-C50) * t6;
+    t0 = t1 + t3;
+    X[96] = t12;
+    X[23] = t0;
+    t13 = C52 * t4;
+    t7 = C53 * t9;
+    t5 = t13 + t7;
+    t11 = C53 * t4;
+    t10 = (-C52) * t9;
+    t14 = t11 + t10;
+    X[56] = t5;
+    X[63] = t14;
+    t6 = C54 * t8;
+    t1 = C55 * t2;
+    t3 = t6 + t1;
+    t12 = C55 * t8;
+    t0 = (-C54) * t2;
+    t13 = t12 + t0;
+    X[16] = t3;
+    X[103] = t13;
+    t7 = re[3];
+    t4 = im[3];
+    t9 = re[23];
+    t11 = im[23];
+    t10 = re[43];
+    t5 = im[43];
+    t14 = t9 + t10;
+    t6 = t11 + t5;
+    t1 = C0 * t14;
+    t8 = t7 - t1;
+    t2 = C0 * t6;
+    t12 = t4 - t2;
+    t0 = t9 - t10;
+    t3 = C1 * t0;
+    t13 = t11 - t5;
+    t1 = C1 * t13;
+    t2 = t7 + t14;
+    t9 = t4 + t6;
+    t10 = t8 + t1;
+    t0 = t12 - t3;
+    t11 = t8 - t1;
+    t5 = t12 + t3;
+    t13 = C56 * t2;
+    t7 = C57 * t9;
+    t14 = t13 + t7;
+    t4 = C57 * t2;
+    t6 = (-C56) * t9;
+    t8 = t4 + t6;
+    X[18] = t14;
+    X[101] = t8;
+    t1 = C58 * t10;
+    t12 = C59 * t0;
+    t3 = t1 + t12;
+    t13 = C59 * t10;
+    t7 = (-C58) * t0;
+    t2 = t13 + t7;
+    X[98] = t3;
+    X[21] = t2;
+    t9 = C60 * t11;
+    t4 = C61 * t5;
+    t6 = t9 + t4;
+    t14 = C61 * t11;
+    t8 = (-C60) * t5;
+    t1 = t14 + t8;
+    X[58] = t6;
+    X[61] = t1;
+    t12 = re[30];
+    t10 = im[30];
+    t0 = re[50];
+    t13 = im[50];
+    t7 = re[10];
+    t3 = im[10];
+    t2 = t0 + t7;
+    t9 = t13 + t3;
+    t4 = C0 * t2;
+    t11 = t12 - t4;
+    t5 = C0 * t9;
+    t14 = t10 - t5;
+    t8 = t0 - t7;
+    t6 = C1 * t8;
+    t1 = t13 - t3;
+    t4 = C1 * t1;
+    t5 = t12 + t2;
+    t0 = t10 + t9;
+    t7 = t11 + t4;
+    t8 = t14 - t6;
+    t13 = t11 - t4;
+    t3 = t14 + t6;
+    t1 = C62 * t5;
+    t12 = C63 * t0;
+    t2 = t1 + t12;
+    t10 = C63 * t5;
+    t9 = (-C62) * t0;
+    t11 = t10 + t9;
+    X[60] = t2;
+    X[59] = t11;
+    t4 = C64 * t7;
+    t14 = C65 * t8;
+    t6 = t4 + t14;
+    t1 = C65 * t7;
+    t12 = (-C64) * t8;
+    t5 = t1 + t12;
+    X[20] = t6;
+    X[99] = t5;
+    t0 = C66 * t13;
+    t10 = C67 * t3;
+    t9 = t0 + t10;
+    t2 = C67 * t13;
+    t11 = (-C66) * t3;
+    t4 = t2 + t11;
+    X[100] = t9;
+    X[19] = t4;
+    t14 = re[57];
+    t7 = im[57];
+    t8 = re[17];
+    t1 = im[17];
+    t12 = re[37];
+    t6 = im[37];
+    t5 = t8 + t12;
+    t0 = t1 + t6;
+    t10 = C0 * t5;
+    t13 = t14 - t10;
+    t3 = C0 * t0;
+    t2 = t7 - t3;
+    t11 = t8 - t12;
+    t9 = C1 * t11;
+    t4 = t1 - t6;
+    t10 = C1 * t4;
+    t3 = t14 + t5;
+    t8 = t7 + t0;
+    t12 = t13 + t10;
+    t11 = t2 - t9;
+    t1 = t13 - t10;
+    t6 = t2 + t9;
+    t4 = C68 * t3;
+    t14 = C69 * t8;
+    t5 = t4 + t14;
+    t7 = C69 * t3;
+    t0 = (-C68) * t8;
+    t13 = t7 + t0;
+    X[102] = t5;
+    X[17] = t13;
+    t10 = C70 * t12;
+    t2 = C71 * t11;
+    t9 = t10 + t2;
+    t4 = C71 * t12;
+    t14 = (-C70) * t11;
+    t3 = t4 + t14;
+    X[62] = t9;
+    X[57] = t3;
+    t8 = C72 * t1;
+    t7 = C73 * t6;
+    t0 = t8 + t7;
+    t5 = C73 * t1;
+    t13 = (-C72) * t6;
+    t10 = t5 + t13;
+    X[22] = t0;
+    X[97] = t10;
+    t2 = re[24];
+    t12 = im[24];
+    t11 = re[44];
+    t4 = im[44];
+    t14 = re[4];
+    t9 = im[4];
+    t3 = t11 + t14;
+    t8 = t4 + t9;
+    t7 = C0 * t3;
+    t1 = t2 - t7;
+    t6 = C0 * t8;
+    t5 = t12 - t6;
+    t13 = t11 - t14;
+    t0 = C1 * t13;
+    t10 = t4 - t9;
+    t7 = C1 * t10;
+    t6 = t2 + t3;
+    t11 = t12 + t8;
+    t14 = t1 + t7;
+    t13 = t5 - t0;
+    t4 = t1 - t7;
+    t9 = t5 + t0;
+    t10 = C74 * t6;
+    t2 = C75 * t11;
+    t3 = t10 + t2;
+    t12 = C75 * t6;
+    t8 = (-C74) * t11;
+    t1 = t12 + t8;
+    X[24] = t3;
+    X[95] = t1;
+    t7 = C76 * t14;
+    t5 = C77 * t13;
+    t0 = t7 + t5;
+    t10 = C77 * t14;
+    t2 = (-C76) * t13;
+    t6 = t10 + t2;
+    X[104] = t0;
+    X[15] = t6;
+    t11 = C78 * t4;
+    t12 = C79 * t9;
+    t8 = t11 + t12;
+    t3 = C79 * t4;
+    t1 = (-C78) * t9;
+    t7 = t3 + t1;
+    X[64] = t8;
+    X[55] = t7;
+    t5 = re[51];
+    t14 = im[51];
+    t13 = re[11];
+    t10 = im[11];
+    t2 = re[31];
+    t0 = im[31];
+    t6 = t13 + t2;
+    t11 = t10 + t0;
+    t12 = C0 * t6;
+    t4 = t5 - t12;
+    t9 = C0 * t11;
+    t3 = t14 - t9;
+    t1 = t13 - t2;
+    t8 = C1 * t1;
+    t7 = t10 - t0;
+    t12 = C1 * t7;
+    t9 = t5 + t6;
+    t13 = t14 + t11;
+    t2 = t4 + t12;
+    t1 = t3 - t8;
+    t10 = t4 - t12;
+    t0 = t3 + t8;
+    t7 = C80 * t9;
+    t5 = C81 * t13;
+    t6 = t7 + t5;
+    t14 = C81 * t9;
+    t11 = (-C80) * t13;
+    t4 = t14 + t11;
+    X[66] = t6;
+    X[53] = t4;
+    t12 = C82 * t2;
+    t3 = C83 * t1;
+    t8 = t12 + t3;
+    t7 = C83 * t2;
+    t5 = (-C82) * t1;
+    t9 = t7 + t5;
+    X[26] = t8;
+    X[93] = t9;
+    t13 = C84 * t10;
+    t14 = C85 * t0;
+    t11 = t13 + t14;
+    t6 = C85 * t10;
+    t4 = (-C84) * t0;
+    t12 = t6 + t4;
+    X[106] = t11;
+    X[13] = t12;
+    t3 = re[18];
+    t2 = im[18];
+    t1 = re[38];
+    t7 = im[38];
+    t5 = re[58];
+    t8 = im[58];
+    t9 = t1 + t5;
+    t13 = t7 + t8;
+    t14 = C0 * t9;
+    t10 = t3 - t14;
+    t0 = C0 * t13;
+    t6 = t2 - t0;
+    t4 = t1 - t5;
+    t11 = C1 * t4;
+    t12 = t7 - t8;
+    t14 = C1 * t12;
+    t0 = t3 + t9;
+    t1 = t2 + t13;
+    t5 = t10 + t14;
+    t4 = t6 - t11;
+    t7 = t10 - t14;
+    t8 = t6 + t11;
+    t12 = C86 * t0;
+    t3 = C87 * t1;
+    t9 = t12 + t3;
+    t2 = C87 * t0;
+    t13 = (-C86) * t1;
+    t10 = t2 + t13;
+    X[108] = t9;
+    X[11] = t10;
+    t14 = C88 * t5;
+    t6 = C89 * t4;
+    t11 = t14 + t6;
+    t12 = C89 * t5;
+    t3 = (-C88) * t4;
+    t0 = t12 + t3;
+    X[68] = t11;
+    X[51] = t0;
+    t1 = C90 * t7;
+    t2 = C91 * t8;
+    t13 = t1 + t2;
+    t9 = C91 * t7;
+    t10 = (-C90) * t8;
+    t14 = t9 + t10;
+    X[28] = t13;
+    X[91] = t14;
+    t6 = re[45];
+    t5 = im[45];
+    t4 = re[5];
+    t12 = im[5];
+    t3 = re[25];
+    t11 = im[25];
+    t0 = t4 + t3;
+    t1 = t12 + t11;
+    t2 = C0 * t0;
+    t7 = t6 - t2;
+    t8 = C0 * t1;
+    t9 = t5 - t8;
+    t10 = t4 - t3;
+    t13 = C1 * t10;
+    t14 = t12 - t11;
+    t2 = C1 * t14;
+    t8 = t6 + t0;
+    t4 = t5 + t1;
+    t3 = t7 + t2;
+    t10 = t9 - t13;
+    t12 = t7 - t2;
+    t11 = t9 + t13;
+    t14 = C92 * t8;
+    t6 = C93 * t4;
+    t0 = t14 + t6;
+    t5 = C93 * t8;
+    t1 = (-C92) * t4;
+    t7 = t5 + t1;
+    X[30] = t0;
+    X[89] = t7;
+    t2 = C94 * t3;
+    t9 = C95 * t10;
+    t13 = t2 + t9;
+    t14 = C95 * t3;
+    t6 = (-C94) * t10;
+    t8 = t14 + t6;
+    X[110] = t13;
+    X[9] = t8;
+    t4 = C96 * t12;
+    t5 = C97 * t11;
+    t1 = t4 + t5;
+    t0 = C97 * t12;
+    t7 = (-C96) * t11;
+    t2 = t0 + t7;
+    X[70] = t1;
+    X[49] = t2;
+    t9 = re[12];
+    t3 = im[12];
+    t10 = re[32];
+    t14 = im[32];
+    t6 = re[52];
+    t13 = im[52];
+    t8 = t10 + t6;
+    t4 = t14 + t13;
+    t5 = C0 * t8;
+    t12 = t9 - t5;
+    t11 = C0 * t4;
+    t0 = t3 - t11;
+    t7 = t10 - t6;
+    t1 = C1 * t7;
+    t2 = t14 - t13;
+    t5 = C1 * t2;
+    t11 = t9 + t8;
+    t10 = t3 + t4;
+    t6 = t12 + t5;
+    t7 = t0 - t1;
+    t14 = t12 - t5;
+    t13 = t0 + t1;
+    t2 = C98 * t11;
+    t9 = C99 * t10;
+    t8 = t2 + t9;
+    t3 = C99 * t11;
+    t4 = (-C98) * t10;
+    t12 = t3 + t4;
+    X[72] = t8;
+    X[47] = t12;
+    t5 = C100 * t6;
+    t0 = C101 * t7;
+    t1 = t5 + t0;
+    t2 = C101 * t6;
+    t9 = (-C100) * t7;
+    t11 = t2 + t9;
+    X[32] = t1;
+    X[87] = t11;
+    t10 = C102 * t14;
+    t3 = C103 * t13;
+    t4 = t10 + t3;
+    t8 = C103 * t14;
+    t12 = (-C102) * t13;
+    t5 = t8 + t12;
+    X[112] = t4;
+    X[7] = t5;
+    t0 = re[39];
+    t6 = im[39];
+    t7 = re[59];
+    t2 = im[59];
+    t9 = re[19];
+    t1 = im[19];
+    t11 = t7 + t9;
+    t10 = t2 + t1;
+    t3 = C0 * t11;
+    t14 = t0 - t3;
+    t13 = C0 * t10;
+    t8 = t6 - t13;
+    t12 = t7 - t9;
+    t4 = C1 * t12;
+    t5 = t2 - t1;
+    t3 = C1 * t5;
+    t13 = t0 + t11;
+    t7 = t6 + t10;
+    t9 = t14 + t3;
+    t12 = t8 - t4;
+    t2 = t14 - t3;
+    t1 = t8 + t4;
+    t5 = C104 * t13;
+    t0 = C105 * t7;
+    t11 = t5 + t0;
+    t6 = C105 * t13;
+    t10 = (-C104) * t7;
+    t14 = t6 + t10;
+    X[114] = t11;
+    X[5] = t14;
+    t3 = C106 * t9;
+    t8 = C107 * t12;
+    t4 = t3 + t8;
+    t5 = C107 * t9;
+    t0 = (-C106) * t12;
+    t13 = t5 + t0;
+    X[74] = t4;
+    X[45] = t13;
+    t7 = C108 * t2;
+    t6 = C109 * t1;
+    t10 = t7 + t6;
+    t11 = C109 * t2;
+    t14 = (-C108) * t1;
+    t3 = t11 + t14;
+    X[34] = t10;
+    X[85] = t3;
+    t8 = re[6];
+    t9 = im[6];
+    t12 = re[26];
+    t5 = im[26];
+    t0 = re[46];
+    t4 = im[46];
+    t13 = t12 + t0;
+    t7 = t5 + t4;
+    t6 = C0 * t13;
+    t2 = t8 - t6;
+    t1 = C0 * t7;
+    t11 = t9 - t1;
+    t14 = t12 - t0;
+    t10 = C1 * t14;
+    t3 = t5 - t4;
+    t6 = C1 * t3;
+    t1 = t8 + t13;
+    t12 = t9 + t7;
+    t0 = t2 + t6;
+    t14 = t11 - t10;
+    t5 = t2 - t6;
+    t4 = t11 + t10;
+    t3 = C110 * t1;
+    t8 = C111 * t12;
+    t13 = t3 + t8;
+    t9 = C111 * t1;
+    t7 = (-C110) * t12;
+    t2 = t9 + t7;
+    X[36] = t13;
+    X[83] = t2;
+    t6 = C112 * t0;
+    t11 = C113 * t14;
+    t10 = t6 + t11;
+    t3 = C113 * t0;
+    t8 = (-C112) * t14;
+    t1 = t3 + t8;
+    X[116] = t10;
+    X[3] = t1;
+    t12 = C114 * t5;
+    t9 = C115 * t4;
+    t7 = t12 + t9;
+    t13 = C115 * t5;
+    t2 = (-C114) * t4;
+    t6 = t13 + t2;
+    X[76] = t7;
+    X[43] = t6;
+    t11 = re[33];
+    t0 = im[33];
+    t14 = re[53];
+    t3 = im[53];
+    t8 = re[13];
+    t10 = im[13];
+    t1 = t14 + t8;
+    t12 = t3 + t10;
+    t9 = C0 * t1;
+    t5 = t11 - t9;
+    t4 = C0 * t12;
+    t13 = t0 - t4;
+    t2 = t14 - t8;
+    t7 = C1 * t2;
+    t6 = t3 - t10;
+    t9 = C1 * t6;
+    t4 = t11 + t1;
+    t14 = t0 + t12;
+    t8 = t5 + t9;
+    t2 = t13 - t7;
+    t3 = t5 - t9;
+    t10 = t13 + t7;
+    t6 = C116 * t4;
+    t11 = C117 * t14;
+    t1 = t6 + t11;
+    t0 = C117 * t4;
+    t12 = (-C116) * t14;
+    t5 = t0 + t12;
+    X[78] = t1;
+    X[41] = t5;
+    t9 = C118 * t8;
+    t13 = C119 * t2;
+    t7 = t9 + t13;
+    t6 = C119 * t8;
+    t11 = (-C118) * t2;
+    t4 = t6 + t11;
+    X[38] = t7;
+    X[81] = t4;
+    t14 = C120 * t3;
+    t0 = C121 * t10;
+    t12 = t14 + t0;
+    t1 = C121 * t3;
+    t5 = (-C120) * t10;
+    t9 = t1 + t5;
+    X[118] = t12;
+    X[1] = t9;
+}
+
+/**
+ *  Part 1 of ApplyWindowedIMDCT_W75_120().
+ * 
+ *  @param {Number[]} X 
+ *    - The input block (120 points).
+ *  @param {Number[]} y 
+ *    - The array that would contain the output block (240 points).
+ *  @param {Number[]} re 
+ *    - The scratch buffer (real part, 60 points).
+ *  @param {Number[]} im 
+ *    - The scratch buffer (imaginary part, 60 points).
+ */
+function ApplyWindowedIMDCT_W75_120_Part1(X, y, re, im) {
+    let t0, t1, t10, t11, t12, t13, t14, t2, t3, t4, t5, t6, t7, t8, t9;
+    const C0 = 0.9510565162951535;
+    const C1 = 0.3090169943749474;
+    const C2 = 0.8090169943749475;
+    const C3 = 0.5877852522924731;
+    const C4 = 0.5590169943749475;
+    const C5 = 0.25;
+    const C6 = 0.9238795325112867;
+    const C7 = 0.3826834323650898;
+    const C8 = 0.7604059656000309;
+    const C9 = 0.6494480483301837;
+    const C10 = 0.5224985647159488;
+    const C11 = 0.8526401643540922;
+    const C12 = 0.2334453638559054;
+    const C13 = 0.9723699203976766;
+    const C14 = 0.996917333733128;
+    const C15 = 0.07845909572784494;
+    const C16 = 0.7071067811865476;
+    const C17 = 0.7071067811865475;
+    const C18 = 0.45399049973954675;
+    const C19 = 0.8910065241883679;
+    const C20 = 0.15643446504023087;
+    const C21 = 0.9876883405951378;
+    const C22 = 0.8660254037844387;
+    const C23 = 0.49999999999999994;
+    const C24 = 0.6691306063588582;
+    const C25 = 0.7431448254773942;
+    const C26 = 0.40673664307580015;
+    const C27 = 0.9135454576426009;
+    const C28 = 0.10452846326765346;
+    const C29 = 0.9945218953682733;
+    const C30 = 0.9781476007338057;
+    const C31 = 0.20791169081775931;
+    const C32 = 0.6087614290087207;
+    const C33 = 0.7933533402912352;
+    const C34 = 0.33380685923377096;
+    const C35 = 0.9426414910921784;
+    const C36 = 0.02617694830787315;
+    const C37 = 0.9996573249755573;
+    const C38 = 0.958819734868193;
+    const C39 = 0.2840153447039226;
+    const C40 = 0.8241261886220156;
+    const C41 = 0.5664062369248328;
+    const C42 = 0.25881904510252074;
+    const C43 = 0.9659258262890683;
+    const C44 = 0.9986295347545738;
+    const C45 = 0.05233595624294383;
+    const C46 = 0.9335804264972017;
+    const C47 = 0.35836794954530027;
+    const C48 = 0.7771459614569709;
+    const C49 = 0.6293203910498375;
+    const C50 = 0.544639035015027;
+    const C51 = 0.838670567945424;
+    const C52 = 0.9914448613738104;
+    const C53 = 0.13052619222005157;
+    const C54 = 0.9025852843498606;
+    const C55 = 0.4305110968082951;
+    const C56 = 0.7253743710122876;
+    const C57 = 0.6883545756937539;
+    const C58 = 0.4771587602596084;
+    const C59 = 0.8788171126619654;
+    const C60 = 0.18223552549214747;
+    const C61 = 0.9832549075639546;
+    const C62 = 0.5;
+    const C63 = 0.8660254037844386;
+    const C64 = 0.9999785816641292;
+    const C65 = 0.006544937967351858;
+    const C66 = 0.4943212082861446;
+    const C67 = 0.8692793239451436;
+    const C68 = 0.8627343859777918;
+    const C69 = 0.5056573733779846;
+    const C70 = 0.8492021815265789;
+    const C71 = 0.528067850650368;
+    const C72 = 0.9994645874763657;
+    const C73 = 0.03271908282177614;
+    const C74 = 0.47139673682599764;
+    const C75 = 0.881921264348355;
+    const C76 = 0.44814919358922256;
+    const C77 = 0.8939587799699321;
+    const C78 = 0.8350879763187431;
+    const C79 = 0.5501164165954934;
+    const C80 = 0.9982656101847159;
+    const C81 = 0.05887080365118903;
+    const C82 = 0.9963824715083254;
+    const C83 = 0.08498217737244167;
+    const C84 = 0.4245945112807131;
+    const C85 = 0.9053836208979552;
+    const C86 = 0.8204014435255136;
+    const C87 = 0.5717879602276122;
+    const C88 = 0.8051526485628582;
+    const C89 = 0.5930676289532372;
+    const C90 = 0.9938164620563781;
+    const C91 = 0.11103530855427768;
+    const C92 = 0.40074883310314097;
+    const C93 = 0.916187957117136;
+    const C94 = 0.3766285016932107;
+    const C95 = 0.9263643838751181;
+    const C96 = 0.78935204219315;
+    const C97 = 0.6139408387503664;
+    const C98 = 0.9905693404435773;
+    const C99 = 0.13701234168196802;
+    t0 = X[0];
+    t1 = X[119];
+    t2 = X[24];
+    t3 = X[95];
+    t4 = C0 * t2;
+    t5 = C1 * t3;
+    t4 = t4 + t5;
+    t5 = (-C1) * t2;
+    t2 = C0 * t3;
+    t3 = t5 + t2;
+    t5 = X[48];
+    t2 = X[71];
+    t6 = C2 * t5;
+    t7 = C3 * t2;
+    t6 = t6 + t7;
+    t7 = (-C3) * t5;
+    t5 = C2 * t2;
+    t2 = t7 + t5;
+    t7 = X[72];
+    t5 = X[47];
+    t8 = C3 * t7;
+    t9 = C2 * t5;
+    t8 = t8 + t9;
+    t9 = (-C2) * t7;
+    t7 = C3 * t5;
+    t5 = t9 + t7;
+    t9 = X[96];
+    t7 = X[23];
+    t10 = C1 * t9;
+    t11 = C0 * t7;
+    t10 = t10 + t11;
+    t11 = (-C0) * t9;
+    t9 = C1 * t7;
+    t7 = t11 + t9;
+    t11 = t4 + t10;
+    t9 = t3 + t7;
+    t12 = t6 + t8;
+    t13 = t2 + t5;
+    t4 = t4 - t10;
+    t10 = t3 - t7;
+    t3 = t6 - t8;
+    t7 = t2 - t5;
+    t6 = t11 + t12;
+    t8 = t9 + t13;
+    t2 = t11 - t12;
+    t5 = C4 * t2;
+    t11 = t9 - t13;
+    t12 = C4 * t11;
+    t2 = C5 * t6;
+    t9 = t0 - t2;
+    t13 = C5 * t8;
+    t11 = t1 - t13;
+    t2 = t9 + t5;
+    t13 = t11 + t12;
+    t9 = t9 - t5;
+    t5 = t11 - t12;
+    t11 = C0 * t4;
+    t12 = C3 * t3;
+    t11 = t11 + t12;
+    t12 = C0 * t10;
+    t14 = C3 * t7;
+    t12 = t12 + t14;
+    t14 = C3 * t4;
+    t4 = C0 * t3;
+    t3 = t14 - t4;
+    t14 = C3 * t10;
+    t4 = C0 * t7;
+    t10 = t14 - t4;
+    t7 = t0 + t6;
+    t14 = t1 + t8;
+    t4 = t2 + t12;
+    t0 = t13 - t11;
+    t6 = t9 + t10;
+    t1 = t5 - t3;
+    t8 = t9 - t10;
+    t9 = t5 + t3;
+    t10 = t2 - t12;
+    t5 = t13 + t11;
+    re[0] = t7;
+    im[0] = t14;
+    re[12] = t4;
+    im[12] = t0;
+    re[24] = t6;
+    im[24] = t1;
+    re[36] = t8;
+    im[36] = t9;
+    re[48] = t10;
+    im[48] = t5;
+    t3 = X[30];
+    t2 = X[89];
+    t12 = C6 * t3;
+    t13 = C7 * t2;
+    t11 = t12 + t13;
+    t7 = (-C7) * t3;
+    t14 = C6 * t2;
+    t4 = t7 + t14;
+    t0 = X[54];
+    t6 = X[65];
+    t1 = C8 * t0;
+    t8 = C9 * t6;
+    t9 = t1 + t8;
+    t10 = (-C9) * t0;
+    t5 = C8 * t6;
+    t12 = t10 + t5;
+    t13 = X[78];
+    t3 = X[41];
+    t2 = C10 * t13;
+    t7 = C11 * t3;
+    t14 = t2 + t7;
+    t1 = (-C11) * t13;
+    t8 = C10 * t3;
+    t0 = t1 + t8;
+    t6 = X[102];
+    t10 = X[17];
+    t5 = C12 * t6;
+    t2 = C13 * t10;
+    t7 = t5 + t2;
+    t13 = (-C13) * t6;
+    t3 = C12 * t10;
+    t1 = t13 + t3;
+    t8 = X[6];
+    t5 = X[113];
+    t2 = C14 * t8;
+    t6 = C15 * t5;
+    t10 = t2 + t6;
+    t13 = (-C15) * t8;
+    t3 = C14 * t5;
+    t2 = t13 + t3;
+    t6 = t9 + t10;
+    t8 = t12 + t2;
+    t5 = t14 + t7;
+    t13 = t0 + t1;
+    t3 = t9 - t10;
+    t9 = t12 - t2;
+    t10 = t14 - t7;
+    t12 = t0 - t1;
+    t2 = t6 + t5;
+    t14 = t8 + t13;
+    t7 = t6 - t5;
+    t0 = C4 * t7;
+    t1 = t8 - t13;
+    t6 = C4 * t1;
+    t5 = C5 * t2;
+    t7 = t11 - t5;
+    t8 = C5 * t14;
+    t13 = t4 - t8;
+    t1 = t7 + t0;
+    t5 = t13 + t6;
+    t8 = t7 - t0;
+    t7 = t13 - t6;
+    t0 = C0 * t3;
+    t13 = C3 * t10;
+    t6 = t0 + t13;
+    t0 = C0 * t9;
+    t13 = C3 * t12;
+    t0 = t0 + t13;
+    t13 = C3 * t3;
+    t3 = C0 * t10;
+    t10 = t13 - t3;
+    t13 = C3 * t9;
+    t3 = C0 * t12;
+    t9 = t13 - t3;
+    t12 = t11 + t2;
+    t13 = t4 + t14;
+    t3 = t1 + t0;
+    t11 = t5 - t6;
+    t2 = t8 + t9;
+    t4 = t7 - t10;
+    t14 = t8 - t9;
+    t8 = t7 + t10;
+    t9 = t1 - t0;
+    t7 = t5 + t6;
+    re[15] = t12;
+    im[15] = t13;
+    re[27] = t3;
+    im[27] = t11;
+    re[39] = t2;
+    im[39] = t4;
+    re[51] = t14;
+    im[51] = t8;
+    re[3] = t9;
+    im[3] = t7;
+    t10 = X[60];
+    t1 = X[59];
+    t0 = C16 * t10;
+    t5 = C17 * t1;
+    t6 = t0 + t5;
+    t12 = (-C17) * t10;
+    t13 = C16 * t1;
+    t3 = t12 + t13;
+    t11 = X[84];
+    t2 = X[35];
+    t4 = C18 * t11;
+    t14 = C19 * t2;
+    t8 = t4 + t14;
+    t9 = (-C19) * t11;
+    t7 = C18 * t2;
+    t0 = t9 + t7;
+    t5 = X[108];
+    t10 = X[11];
+    t1 = C20 * t5;
+    t12 = C21 * t10;
+    t13 = t1 + t12;
+    t4 = (-C21) * t5;
+    t14 = C20 * t10;
+    t11 = t4 + t14;
+    t2 = X[12];
+    t9 = X[107];
+    t7 = C21 * t2;
+    t1 = C20 * t9;
+    t12 = t7 + t1;
+    t5 = (-C20) * t2;
+    t10 = C21 * t9;
+    t4 = t5 + t10;
+    t14 = X[36];
+    t7 = X[83];
+    t1 = C19 * t14;
+    t2 = C18 * t7;
+    t9 = t1 + t2;
+    t5 = (-C18) * t14;
+    t10 = C19 * t7;
+    t1 = t5 + t10;
+    t2 = t8 + t9;
+    t14 = t0 + t1;
+    t7 = t13 + t12;
+    t5 = t11 + t4;
+    t10 = t8 - t9;
+    t8 = t0 - t1;
+    t9 = t13 - t12;
+    t0 = t11 - t4;
+    t1 = t2 + t7;
+    t13 = t14 + t5;
+    t12 = t2 - t7;
+    t11 = C4 * t12;
+    t4 = t14 - t5;
+    t2 = C4 * t4;
+    t7 = C5 * t1;
+    t12 = t6 - t7;
+    t14 = C5 * t13;
+    t5 = t3 - t14;
+    t4 = t12 + t11;
+    t7 = t5 + t2;
+    t14 = t12 - t11;
+    t12 = t5 - t2;
+    t11 = C0 * t10;
+    t5 = C3 * t9;
+    t2 = t11 + t5;
+    t11 = C0 * t8;
+    t5 = C3 * t0;
+    t11 = t11 + t5;
+    t5 = C3 * t10;
+    t10 = C0 * t9;
+    t9 = t5 - t10;
+    t5 = C3 * t8;
+    t10 = C0 * t0;
+    t8 = t5 - t10;
+    t0 = t6 + t1;
+    t5 = t3 + t13;
+    t10 = t4 + t11;
+    t6 = t7 - t2;
+    t1 = t14 + t8;
+    t3 = t12 - t9;
+    t13 = t14 - t8;
+    t14 = t12 + t9;
+    t8 = t4 - t11;
+    t12 = t7 + t2;
+    re[30] = t0;
+    im[30] = t5;
+    re[42] = t10;
+    im[42] = t6;
+    re[54] = t1;
+    im[54] = t3;
+    re[6] = t13;
+    im[6] = t14;
+    re[18] = t8;
+    im[18] = t12;
+    t9 = X[90];
+    t4 = X[29];
+    t11 = C7 * t9;
+    t7 = C6 * t4;
+    t2 = t11 + t7;
+    t0 = (-C6) * t9;
+    t5 = C7 * t4;
+    t10 = t0 + t5;
+    t6 = X[114];
+    t1 = X[5];
+    t3 = C15 * t6;
+    t13 = C14 * t1;
+    t14 = t3 + t13;
+    t8 = (-C14) * t6;
+    t12 = C15 * t1;
+    t11 = t8 + t12;
+    t7 = X[18];
+    t9 = X[101];
+    t4 = C13 * t7;
+    t0 = C12 * t9;
+    t5 = t4 + t0;
+    t3 = (-C12) * t7;
+    t13 = C13 * t9;
+    t6 = t3 + t13;
+    t1 = X[42];
+    t8 = X[77];
+    t12 = C11 * t1;
+    t4 = C10 * t8;
+    t0 = t12 + t4;
+    t7 = (-C10) * t1;
+    t9 = C11 * t8;
+    t3 = t7 + t9;
+    t13 = X[66];
+    t12 = X[53];
+    t4 = C9 * t13;
+    t1 = C8 * t12;
+    t8 = t4 + t1;
+    t7 = (-C8) * t13;
+    t9 = C9 * t12;
+    t4 = t7 + t9;
+    t1 = t14 + t8;
+    t13 = t11 + t4;
+    t12 = t5 + t0;
+    t7 = t6 + t3;
+    t9 = t14 - t8;
+    t14 = t11 - t4;
+    t8 = t5 - t0;
+    t11 = t6 - t3;
+    t4 = t1 + t12;
+    t5 = t13 + t7;
+    t0 = t1 - t12;
+    t6 = C4 * t0;
+    t3 = t13 - t7;
+    t1 = C4 * t3;
+    t12 = C5 * t4;
+    t0 = t2 - t12;
+    t13 = C5 * t5;
+    t7 = t10 - t13;
+    t3 = t0 + t6;
+    t12 = t7 + t1;
+    t13 = t0 - t6;
+    t0 = t7 - t1;
+    t6 = C0 * t9;
+    t7 = C3 * t8;
+    t1 = t6 + t7;
+    t6 = C0 * t14;
+    t7 = C3 * t11;
+    t6 = t6 + t7;
+    t7 = C3 * t9;
+    t9 = C0 * t8;
+    t8 = t7 - t9;
+    t7 = C3 * t14;
+    t9 = C0 * t11;
+    t14 = t7 - t9;
+    t11 = t2 + t4;
+    t7 = t10 + t5;
+    t9 = t3 + t6;
+    t2 = t12 - t1;
+    t4 = t13 + t14;
+    t10 = t0 - t8;
+    t5 = t13 - t14;
+    t13 = t0 + t8;
+    t14 = t3 - t6;
+    t0 = t12 + t1;
+    re[45] = t11;
+    im[45] = t7;
+    re[57] = t9;
+    im[57] = t2;
+    re[9] = t4;
+    im[9] = t10;
+    re[21] = t5;
+    im[21] = t13;
+    re[33] = t14;
+    im[33] = t0;
+    t8 = re[0];
+    t3 = im[0];
+    t6 = re[15];
+    t12 = im[15];
+    t1 = re[30];
+    t11 = im[30];
+    t7 = re[45];
+    t9 = im[45];
+    t2 = t8 + t1;
+    t4 = t3 + t11;
+    t10 = t6 + t7;
+    t5 = t12 + t9;
+    t13 = t8 - t1;
+    t14 = t3 - t11;
+    t0 = t6 - t7;
+    t8 = t12 - t9;
+    t1 = t2 + t10;
+    t3 = t4 + t5;
+    t11 = t13 + t8;
+    t6 = t14 - t0;
+    t7 = t2 - t10;
+    t12 = t4 - t5;
+    t9 = t13 - t8;
+    t2 = t14 + t0;
+    re[0] = t1;
+    im[0] = t3;
+    re[15] = t11;
+    im[15] = t6;
+    re[30] = t7;
+    im[30] = t12;
+    re[45] = t9;
+    im[45] = t2;
+    t10 = re[12];
+    t4 = im[12];
+    t5 = re[27];
+    t13 = im[27];
+    t8 = re[42];
+    t14 = im[42];
+    t0 = re[57];
+    t1 = im[57];
+    t3 = t10 + t8;
+    t11 = t4 + t14;
+    t6 = t5 + t0;
+    t7 = t13 + t1;
+    t12 = t10 - t8;
+    t9 = t4 - t14;
+    t2 = t5 - t0;
+    t10 = t13 - t1;
+    t8 = t3 + t6;
+    t4 = t11 + t7;
+    t14 = t12 + t10;
+    t5 = t9 - t2;
+    t0 = t3 - t6;
+    t13 = t11 - t7;
+    t1 = t12 - t10;
+    t3 = t9 + t2;
+    re[12] = t8;
+    im[12] = t4;
+    re[27] = t14;
+    im[27] = t5;
+    re[42] = t0;
+    im[42] = t13;
+    re[57] = t1;
+    im[57] = t3;
+    t6 = re[24];
+    t11 = im[24];
+    t7 = re[39];
+    t12 = im[39];
+    t10 = re[54];
+    t9 = im[54];
+    t2 = re[9];
+    t8 = im[9];
+    t4 = t6 + t10;
+    t14 = t11 + t9;
+    t5 = t7 + t2;
+    t0 = t12 + t8;
+    t13 = t6 - t10;
+    t1 = t11 - t9;
+    t3 = t7 - t2;
+    t6 = t12 - t8;
+    t10 = t4 + t5;
+    t11 = t14 + t0;
+    t9 = t13 + t6;
+    t7 = t1 - t3;
+    t2 = t4 - t5;
+    t12 = t14 - t0;
+    t8 = t13 - t6;
+    t4 = t1 + t3;
+    re[24] = t10;
+    im[24] = t11;
+    re[39] = t9;
+    im[39] = t7;
+    re[54] = t2;
+    im[54] = t12;
+    re[9] = t8;
+    im[9] = t4;
+    t5 = re[36];
+    t14 = im[36];
+    t0 = re[51];
+    t13 = im[51];
+    t6 = re[6];
+    t1 = im[6];
+    t3 = re[21];
+    t10 = im[21];
+    t11 = t5 + t6;
+    t9 = t14 + t1;
+    t7 = t0 + t3;
+    t2 = t13 + t10;
+    t12 = t5 - t6;
+    t8 = t14 - t1;
+    t4 = t0 - t3;
+    t5 = t13 - t10;
+    t6 = t11 + t7;
+    t14 = t9 + t2;
+    t1 = t12 + t5;
+    t0 = t8 - t4;
+    t3 = t11 - t7;
+    t13 = t9 - t2;
+    t10 = t12 - t5;
+    t11 = t8 + t4;
+    re[36] = t6;
+    im[36] = t14;
+    re[51] = t1;
+    im[51] = t0;
+    re[6] = t3;
+    im[6] = t13;
+    re[21] = t10;
+    im[21] = t11;
+    t7 = re[48];
+    t9 = im[48];
+    t2 = re[3];
+    t12 = im[3];
+    t5 = re[18];
+    t8 = im[18];
+    t4 = re[33];
+    t6 = im[33];
+    t14 = t7 + t5;
+    t1 = t9 + t8;
+    t0 = t2 + t4;
+    t3 = t12 + t6;
+    t13 = t7 - t5;
+    t10 = t9 - t8;
+    t11 = t2 - t4;
+    t7 = t12 - t6;
+    t5 = t14 + t0;
+    t9 = t1 + t3;
+    t8 = t13 + t7;
+    t2 = t10 - t11;
+    t4 = t14 - t0;
+    t12 = t1 - t3;
+    t6 = t13 - t7;
+    t14 = t10 + t11;
+    re[48] = t5;
+    im[48] = t9;
+    re[3] = t8;
+    im[3] = t2;
+    re[18] = t4;
+    im[18] = t12;
+    re[33] = t6;
+    im[33] = t14;
+    t0 = X[40];
+    t1 = X[79];
+    t3 = C22 * t0;
+    t13 = C23 * t1;
+    t7 = t3 + t13;
+    t10 = (-C23) * t0;
+    t11 = C22 * t1;
+    t5 = t10 + t11;
+    t9 = X[64];
+    t8 = X[55];
+    t2 = C24 * t9;
+    t4 = C25 * t8;
+    t12 = t2 + t4;
+    t6 = (-C25) * t9;
+    t14 = C24 * t8;
+    t3 = t6 + t14;
+    t13 = X[88];
+    t0 = X[31];
+    t1 = C26 * t13;
+    t10 = C27 * t0;
+    t11 = t1 + t10;
+    t2 = (-C27) * t13;
+    t4 = C26 * t0;
+    t9 = t2 + t4;
+    t8 = X[112];
+    t6 = X[7];
+    t14 = C28 * t8;
+    t1 = C29 * t6;
+    t10 = t14 + t1;
+    t13 = (-C29) * t8;
+    t0 = C28 * t6;
+    t2 = t13 + t0;
+    t4 = X[16];
+    t14 = X[103];
+    t1 = C30 * t4;
+    t8 = C31 * t14;
+    t6 = t1 + t8;
+    t13 = (-C31) * t4;
+    t0 = C30 * t14;
+    t1 = t13 + t0;
+    t8 = t12 + t6;
+    t4 = t3 + t1;
+    t14 = t11 + t10;
+    t13 = t9 + t2;
+    t0 = t12 - t6;
+    t12 = t3 - t1;
+    t6 = t11 - t10;
+    t3 = t9 - t2;
+    t1 = t8 + t14;
+    t11 = t4 + t13;
+    t10 = t8 - t14;
+    t9 = C4 * t10;
+    t2 = t4 - t13;
+    t8 = C4 * t2;
+    t14 = C5 * t1;
+    t10 = t7 - t14;
+    t4 = C5 * t11;
+    t13 = t5 - t4;
+    t2 = t10 + t9;
+    t14 = t13 + t8;
+    t4 = t10 - t9;
+    t10 = t13 - t8;
+    t9 = C0 * t0;
+    t13 = C3 * t6;
+    t8 = t9 + t13;
+    t9 = C0 * t12;
+    t13 = C3 * t3;
+    t9 = t9 + t13;
+    t13 = C3 * t0;
+    t0 = C0 * t6;
+    t6 = t13 - t0;
+    t13 = C3 * t12;
+    t0 = C0 * t3;
+    t12 = t13 - t0;
+    t3 = t7 + t1;
+    t13 = t5 + t11;
+    t0 = t2 + t9;
+    t7 = t14 - t8;
+    t1 = t4 + t12;
+    t5 = t10 - t6;
+    t11 = t4 - t12;
+    t4 = t10 + t6;
+    t12 = t2 - t9;
+    t10 = t14 + t8;
+    re[20] = t3;
+    im[20] = t13;
+    re[32] = t0;
+    im[32] = t7;
+    re[44] = t1;
+    im[44] = t5;
+    re[56] = t11;
+    im[56] = t4;
+    re[8] = t12;
+    im[8] = t10;
+    t6 = X[70];
+    t2 = X[49];
+    t9 = C32 * t6;
+    t14 = C33 * t2;
+    t8 = t9 + t14;
+    t3 = (-C33) * t6;
+    t13 = C32 * t2;
+    t0 = t3 + t13;
+    t7 = X[94];
+    t1 = X[25];
+    t5 = C34 * t7;
+    t11 = C35 * t1;
+    t4 = t5 + t11;
+    t12 = (-C35) * t7;
+    t10 = C34 * t1;
+    t9 = t12 + t10;
+    t14 = X[118];
+    t6 = X[1];
+    t2 = C36 * t14;
+    t3 = C37 * t6;
+    t13 = t2 + t3;
+    t5 = (-C37) * t14;
+    t11 = C36 * t6;
+    t7 = t5 + t11;
+    t1 = X[22];
+    t12 = X[97];
+    t10 = C38 * t1;
+    t2 = C39 * t12;
+    t3 = t10 + t2;
+    t14 = (-C39) * t1;
+    t6 = C38 * t12;
+    t5 = t14 + t6;
+    t11 = X[46];
+    t10 = X[73];
+    t2 = C40 * t11;
+    t1 = C41 * t10;
+    t12 = t2 + t1;
+    t14 = (-C41) * t11;
+    t6 = C40 * t10;
+    t2 = t14 + t6;
+    t1 = t4 + t12;
+    t11 = t9 + t2;
+    t10 = t13 + t3;
+    t14 = t7 + t5;
+    t6 = t4 - t12;
+    t4 = t9 - t2;
+    t12 = t13 - t3;
+    t9 = t7 - t5;
+    t2 = t1 + t10;
+    t13 = t11 + t14;
+    t3 = t1 - t10;
+    t7 = C4 * t3;
+    t5 = t11 - t14;
+    t1 = C4 * t5;
+    t10 = C5 * t2;
+    t3 = t8 - t10;
+    t11 = C5 * t13;
+    t14 = t0 - t11;
+    t5 = t3 + t7;
+    t10 = t14 + t1;
+    t11 = t3 - t7;
+    t3 = t14 - t1;
+    t7 = C0 * t6;
+    t14 = C3 * t12;
+    t1 = t7 + t14;
+    t7 = C0 * t4;
+    t14 = C3 * t9;
+    t7 = t7 + t14;
+    t14 = C3 * t6;
+    t6 = C0 * t12;
+    t12 = t14 - t6;
+    t14 = C3 * t4;
+    t6 = C0 * t9;
+    t4 = t14 - t6;
+    t9 = t8 + t2;
+    t14 = t0 + t13;
+    t6 = t5 + t7;
+    t8 = t10 - t1;
+    t2 = t11 + t4;
+    t0 = t3 - t12;
+    t13 = t11 - t4;
+    t11 = t3 + t12;
+    t4 = t5 - t7;
+    t3 = t10 + t1;
+    re[35] = t9;
+    im[35] = t14;
+    re[47] = t6;
+    im[47] = t8;
+    re[59] = t2;
+    im[59] = t0;
+    re[11] = t13;
+    im[11] = t11;
+    re[23] = t4;
+    im[23] = t3;
+    t12 = X[100];
+    t5 = X[19];
+    t7 = C42 * t12;
+    t10 = C43 * t5;
+    t1 = t7 + t10;
+    t9 = (-C43) * t12;
+    t14 = C42 * t5;
+    t6 = t9 + t14;
+    t8 = X[4];
+    t2 = X[115];
+    t0 = C44 * t8;
+    t13 = C45 * t2;
+    t11 = t0 + t13;
+    t4 = (-C45) * t8;
+    t3 = C44 * t2;
+    t7 = t4 + t3;
+    t10 = X[28];
+    t12 = X[91];
+    t5 = C46 * t10;
+    t9 = C47 * t12;
+    t14 = t5 + t9;
+    t0 = (-C47) * t10;
+    t13 = C46 * t12;
+    t8 = t0 + t13;
+    t2 = X[52];
+    t4 = X[67];
+    t3 = C48 * t2;
+    t5 = C49 * t4;
+    t9 = t3 + t5;
+    t10 = (-C49) * t2;
+    t12 = C48 * t4;
+    t0 = t10 + t12;
+    t13 = X[76];
+    t3 = X[43];
+    t5 = C50 * t13;
+    t2 = C51 * t3;
+    t4 = t5 + t2;
+    t10 = (-C51) * t13;
+    t12 = C50 * t3;
+    t5 = t10 + t12;
+    t2 = t11 + t4;
+    t13 = t7 + t5;
+    t3 = t14 + t9;
+    t10 = t8 + t0;
+    t12 = t11 - t4;
+    t11 = t7 - t5;
+    t4 = t14 - t9;
+    t7 = t8 - t0;
+    t5 = t2 + t3;
+    t14 = t13 + t10;
+    t9 = t2 - t3;
+    t8 = C4 * t9;
+    t0 = t13 - t10;
+    t2 = C4 * t0;
+    t3 = C5 * t5;
+    t9 = t1 - t3;
+    t13 = C5 * t14;
+    t10 = t6 - t13;
+    t0 = t9 + t8;
+    t3 = t10 + t2;
+    t13 = t9 - t8;
+    t9 = t10 - t2;
+    t8 = C0 * t12;
+    t10 = C3 * t4;
+    t2 = t8 + t10;
+    t8 = C0 * t11;
+    t10 = C3 * t7;
+    t8 = t8 + t10;
+    t10 = C3 * t12;
+    t12 = C0 * t4;
+    t4 = t10 - t12;
+    t10 = C3 * t11;
+    t12 = C0 * t7;
+    t11 = t10 - t12;
+    t7 = t1 + t5;
+    t10 = t6 + t14;
+    t12 = t0 + t8;
+    t1 = t3 - t2;
+    t5 = t13 + t11;
+    t6 = t9 - t4;
+    t14 = t13 - t11;
+    t13 = t9 + t4;
+    t11 = t0 - t8;
+    t9 = t3 + t2;
+    re[50] = t7;
+    im[50] = t10;
+    re[2] = t12;
+    im[2] = t1;
+    re[14] = t5;
+    im[14] = t6;
+    re[26] = t14;
+    im[26] = t13;
+    re[38] = t11;
+    im[38] = t9;
+    t4 = X[10];
+    t0 = X[109];
+    t8 = C52 * t4;
+    t3 = C53 * t0;
+    t2 = t8 + t3;
+    t7 = (-C53) * t4;
+    t10 = C52 * t0;
+    t12 = t7 + t10;
+    t1 = X[34];
+    t5 = X[85];
+    t6 = C54 * t1;
+    t14 = C55 * t5;
+    t13 = t6 + t14;
+    t11 = (-C55) * t1;
+    t9 = C54 * t5;
+    t8 = t11 + t9;
+    t3 = X[58];
+    t4 = X[61];
+    t0 = C56 * t3;
+    t7 = C57 * t4;
+    t10 = t0 + t7;
+    t6 = (-C57) * t3;
+    t14 = C56 * t4;
+    t1 = t6 + t14;
+    t5 = X[82];
+    t11 = X[37];
+    t9 = C58 * t5;
+    t0 = C59 * t11;
+    t7 = t9 + t0;
+    t3 = (-C59) * t5;
+    t4 = C58 * t11;
+    t6 = t3 + t4;
+    t14 = X[106];
+    t9 = X[13];
+    t0 = C60 * t14;
+    t5 = C61 * t9;
+    t11 = t0 + t5;
+    t3 = (-C61) * t14;
+    t4 = C60 * t9;
+    t0 = t3 + t4;
+    t5 = t13 + t11;
+    t14 = t8 + t0;
+    t9 = t10 + t7;
+    t3 = t1 + t6;
+    t4 = t13 - t11;
+    t13 = t8 - t0;
+    t11 = t10 - t7;
+    t8 = t1 - t6;
+    t0 = t5 + t9;
+    t10 = t14 + t3;
+    t7 = t5 - t9;
+    t1 = C4 * t7;
+    t6 = t14 - t3;
+    t5 = C4 * t6;
+    t9 = C5 * t0;
+    t7 = t2 - t9;
+    t14 = C5 * t10;
+    t3 = t12 - t14;
+    t6 = t7 + t1;
+    t9 = t3 + t5;
+    t14 = t7 - t1;
+    t7 = t3 - t5;
+    t1 = C0 * t4;
+    t3 = C3 * t11;
+    t5 = t1 + t3;
+    t1 = C0 * t13;
+    t3 = C3 * t8;
+    t1 = t1 + t3;
+    t3 = C3 * t4;
+    t4 = C0 * t11;
+    t11 = t3 - t4;
+    t3 = C3 * t13;
+    t4 = C0 * t8;
+    t13 = t3 - t4;
+    t8 = t2 + t0;
+    t3 = t12 + t10;
+    t4 = t6 + t1;
+    t2 = t9 - t5;
+    t0 = t14 + t13;
+    t12 = t7 - t11;
+    t10 = t14 - t13;
+    t14 = t7 + t11;
+    t13 = t6 - t1;
+    t7 = t9 + t5;
+    re[5] = t8;
+    im[5] = t3;
+    re[17] = t4;
+    im[17] = t2;
+    re[29] = t0;
+    im[29] = t12;
+    re[41] = t10;
+    im[41] = t14;
+    re[53] = t13;
+    im[53] = t7;
+    t11 = re[20];
+    t6 = im[20];
+    t1 = re[35];
+    t9 = im[35];
+    t5 = re[50];
+    t8 = im[50];
+    t3 = re[5];
+    t4 = im[5];
+    t2 = t11 + t5;
+    t0 = t6 + t8;
+    t12 = t1 + t3;
+    t10 = t9 + t4;
+    t14 = t11 - t5;
+    t13 = t6 - t8;
+    t7 = t1 - t3;
+    t11 = t9 - t4;
+    t5 = t2 + t12;
+    t6 = t0 + t10;
+    t8 = t14 + t11;
+    t1 = t13 - t7;
+    t3 = t2 - t12;
+    t9 = t0 - t10;
+    t4 = t14 - t11;
+    t2 = t13 + t7;
+    re[20] = t5;
+    im[20] = t6;
+    re[35] = t8;
+    im[35] = t1;
+    re[50] = t3;
+    im[50] = t9;
+    re[5] = t4;
+    im[5] = t2;
+    t12 = re[32];
+    t0 = im[32];
+    t10 = re[47];
+    t14 = im[47];
+    t11 = re[2];
+    t13 = im[2];
+    t7 = re[17];
+    t5 = im[17];
+    t6 = t12 + t11;
+    t8 = t0 + t13;
+    t1 = t10 + t7;
+    t3 = t14 + t5;
+    t9 = t12 - t11;
+    t4 = t0 - t13;
+    t2 = t10 - t7;
+    t12 = t14 - t5;
+    t11 = t6 + t1;
+    t0 = t8 + t3;
+    t13 = t9 + t12;
+    t10 = t4 - t2;
+    t7 = t6 - t1;
+    t14 = t8 - t3;
+    t5 = t9 - t12;
+    t6 = t4 + t2;
+    re[32] = t11;
+    im[32] = t0;
+    re[47] = t13;
+    im[47] = t10;
+    re[2] = t7;
+    im[2] = t14;
+    re[17] = t5;
+    im[17] = t6;
+    t1 = re[44];
+    t8 = im[44];
+    t3 = re[59];
+    t9 = im[59];
+    t12 = re[14];
+    t4 = im[14];
+    t2 = re[29];
+    t11 = im[29];
+    t0 = t1 + t12;
+    t13 = t8 + t4;
+    t10 = t3 + t2;
+    t7 = t9 + t11;
+    t14 = t1 - t12;
+    t5 = t8 - t4;
+    t6 = t3 - t2;
+    t1 = t9 - t11;
+    t12 = t0 + t10;
+    t8 = t13 + t7;
+    t4 = t14 + t1;
+    t3 = t5 - t6;
+    t2 = t0 - t10;
+    t9 = t13 - t7;
+    t11 = t14 - t1;
+    t0 = t5 + t6;
+    re[44] = t12;
+    im[44] = t8;
+    re[59] = t4;
+    im[59] = t3;
+    re[14] = t2;
+    im[14] = t9;
+    re[29] = t11;
+    im[29] = t0;
+    t10 = re[56];
+    t13 = im[56];
+    t7 = re[11];
+    t14 = im[11];
+    t1 = re[26];
+    t5 = im[26];
+    t6 = re[41];
+    t12 = im[41];
+    t8 = t10 + t1;
+    t4 = t13 + t5;
+    t3 = t7 + t6;
+    t2 = t14 + t12;
+    t9 = t10 - t1;
+    t11 = t13 - t5;
+    t0 = t7 - t6;
+    t10 = t14 - t12;
+    t1 = t8 + t3;
+    t13 = t4 + t2;
+    t5 = t9 + t10;
+    t7 = t11 - t0;
+    t6 = t8 - t3;
+    t14 = t4 - t2;
+    t12 = t9 - t10;
+    t8 = t11 + t0;
+    re[56] = t1;
+    im[56] = t13;
+    re[11] = t5;
+    im[11] = t7;
+    re[26] = t6;
+    im[26] = t14;
+    re[41] = t12;
+    im[41] = t8;
+    t3 = re[8];
+    t4 = im[8];
+    t2 = re[23];
+    t9 = im[23];
+    t10 = re[38];
+    t11 = im[38];
+    t0 = re[53];
+    t1 = im[53];
+    t13 = t3 + t10;
+    t5 = t4 + t11;
+    t7 = t2 + t0;
+    t6 = t9 + t1;
+    t14 = t3 - t10;
+    t12 = t4 - t11;
+    t8 = t2 - t0;
+    t3 = t9 - t1;
+    t10 = t13 + t7;
+    t4 = t5 + t6;
+    t11 = t14 + t3;
+    t2 = t12 - t8;
+    t0 = t13 - t7;
+    t9 = t5 - t6;
+    t1 = t14 - t3;
+    t13 = t12 + t8;
+    re[8] = t10;
+    im[8] = t4;
+    re[23] = t11;
+    im[23] = t2;
+    re[38] = t0;
+    im[38] = t9;
+    re[53] = t1;
+    im[53] = t13;
+    t7 = X[80];
+    t5 = X[39];
+    t6 = C23 * t7;
+    t14 = C22 * t5;
+    t3 = t6 + t14;
+    t12 = (-C22) * t7;
+    t8 = C23 * t5;
+    t10 = t12 + t8;
+    t4 = X[104];
+    t11 = X[15];
+    t2 = C31 * t4;
+    t0 = C30 * t11;
+    t9 = t2 + t0;
+    t1 = (-C30) * t4;
+    t13 = C31 * t11;
+    t6 = t1 + t13;
+    t14 = X[8];
+    t7 = X[111];
+    t5 = C29 * t14;
+    t12 = C28 * t7;
+    t8 = t5 + t12;
+    t2 = (-C28) * t14;
+    t0 = C29 * t7;
+    t4 = t2 + t0;
+    t11 = X[32];
+    t1 = X[87];
+    t13 = C27 * t11;
+    t5 = C26 * t1;
+    t12 = t13 + t5;
+    t14 = (-C26) * t11;
+    t7 = C27 * t1;
+    t2 = t14 + t7;
+    t0 = X[56];
+    t13 = X[63];
+    t5 = C25 * t0;
+    t11 = C24 * t13;
+    t1 = t5 + t11;
+    t14 = (-C24) * t0;
+    t7 = C25 * t13;
+    t5 = t14 + t7;
+    t11 = t9 + t1;
+    t0 = t6 + t5;
+    t13 = t8 + t12;
+    t14 = t4 + t2;
+    t7 = t9 - t1;
+    t9 = t6 - t5;
+    t1 = t8 - t12;
+    t6 = t4 - t2;
+    t5 = t11 + t13;
+    t8 = t0 + t14;
+    t12 = t11 - t13;
+    t4 = C4 * t12;
+    t2 = t0 - t14;
+    t11 = C4 * t2;
+    t13 = C5 * t5;
+    t12 = t3 - t13;
+    t0 = C5 * t8;
+    t14 = t10 - t0;
+    t2 = t12 + t4;
+    t13 = t14 + t11;
+    t0 = t12 - t4;
+    t12 = t14 - t11;
+    t4 = C0 * t7;
+    t14 = C3 * t1;
+    t11 = t4 + t14;
+    t4 = C0 * t9;
+    t14 = C3 * t6;
+    t4 = t4 + t14;
+    t14 = C3 * t7;
+    t7 = C0 * t1;
+    t1 = t14 - t7;
+    t14 = C3 * t9;
+    t7 = C0 * t6;
+    t9 = t14 - t7;
+    t6 = t3 + t5;
+    t14 = t10 + t8;
+    t7 = t2 + t4;
+    t3 = t13 - t11;
+    t5 = t0 + t9;
+    t10 = t12 - t1;
+    t8 = t0 - t9;
+    t0 = t12 + t1;
+    t9 = t2 - t4;
+    t12 = t13 + t11;
+    re[40] = t6;
+    im[40] = t14;
+    re[52] = t7;
+    im[52] = t3;
+    re[4] = t5;
+    im[4] = t10;
+    re[16] = t8;
+    im[16] = t0;
+    re[28] = t9;
+    im[28] = t12;
+    t1 = X[110];
+    t2 = X[9];
+    t4 = C53 * t1;
+    t13 = C52 * t2;
+    t11 = t4 + t13;
+    t6 = (-C52) * t1;
+    t14 = C53 * t2;
+    t7 = t6 + t14;
+    t3 = X[14];
+    t5 = X[105];
+    t10 = C61 * t3;
+    t8 = C60 * t5;
+    t0 = t10 + t8;
+    t9 = (-C60) * t3;
+    t12 = C61 * t5;
+    t4 = t9 + t12;
+    t13 = X[38];
+    t1 = X[81];
+    t2 = C59 * t13;
+    t6 = C58 * t1;
+    t14 = t2 + t6;
+    t10 = (-C58) * t13;
+    t8 = C59 * t1;
+    t3 = t10 + t8;
+    t5 = X[62];
+    t9 = X[57];
+    t12 = C57 * t5;
+    t2 = C56 * t9;
+    t6 = t12 + t2;
+    t13 = (-C56) * t5;
+    t1 = C57 * t9;
+    t10 = t13 + t1;
+    t8 = X[86];
+    t12 = X[33];
+    t2 = C55 * t8;
+    t5 = C54 * t12;
+    t9 = t2 + t5;
+    t13 = (-C54) * t8;
+    t1 = C55 * t12;
+    t2 = t13 + t1;
+    t5 = t0 + t9;
+    t8 = t4 + t2;
+    t12 = t14 + t6;
+    t13 = t3 + t10;
+    t1 = t0 - t9;
+    t0 = t4 - t2;
+    t9 = t14 - t6;
+    t4 = t3 - t10;
+    t2 = t5 + t12;
+    t14 = t8 + t13;
+    t6 = t5 - t12;
+    t3 = C4 * t6;
+    t10 = t8 - t13;
+    t5 = C4 * t10;
+    t12 = C5 * t2;
+    t6 = t11 - t12;
+    t8 = C5 * t14;
+    t13 = t7 - t8;
+    t10 = t6 + t3;
+    t12 = t13 + t5;
+    t8 = t6 - t3;
+    t6 = t13 - t5;
+    t3 = C0 * t1;
+    t13 = C3 * t9;
+    t5 = t3 + t13;
+    t3 = C0 * t0;
+    t13 = C3 * t4;
+    t3 = t3 + t13;
+    t13 = C3 * t1;
+    t1 = C0 * t9;
+    t9 = t13 - t1;
+    t13 = C3 * t0;
+    t1 = C0 * t4;
+    t0 = t13 - t1;
+    t4 = t11 + t2;
+    t13 = t7 + t14;
+    t1 = t10 + t3;
+    t11 = t12 - t5;
+    t2 = t8 + t0;
+    t7 = t6 - t9;
+    t14 = t8 - t0;
+    t8 = t6 + t9;
+    t0 = t10 - t3;
+    t6 = t12 + t5;
+    re[55] = t4;
+    im[55] = t13;
+    re[7] = t1;
+    im[7] = t11;
+    re[19] = t2;
+    im[19] = t7;
+    re[31] = t14;
+    im[31] = t8;
+    re[43] = t0;
+    im[43] = t6;
+    t9 = X[20];
+    t10 = X[99];
+    t3 = C43 * t9;
+    t12 = C42 * t10;
+    t5 = t3 + t12;
+    t4 = (-C42) * t9;
+    t13 = C43 * t10;
+    t1 = t4 + t13;
+    t11 = X[44];
+    t2 = X[75];
+    t7 = C51 * t11;
+    t14 = C50 * t2;
+    t8 = t7 + t14;
+    t0 = (-C50) * t11;
+    t6 = C51 * t2;
+    t3 = t0 + t6;
+    t12 = X[68];
+    t9 = X[51];
+    t10 = C49 * t12;
+    t4 = C48 * t9;
+    t13 = t10 + t4;
+    t7 = (-C48) * t12;
+    t14 = C49 * t9;
+    t11 = t7 + t14;
+    t2 = X[92];
+    t0 = X[27];
+    t6 = C47 * t2;
+    t10 = C46 * t0;
+    t4 = t6 + t10;
+    t12 = (-C46) * t2;
+    t9 = C47 * t0;
+    t7 = t12 + t9;
+    t14 = X[116];
+    t6 = X[3];
+    t10 = C45 * t14;
+    t2 = C44 * t6;
+    t0 = t10 + t2;
+    t12 = (-C44) * t14;
+    t9 = C45 * t6;
+    t10 = t12 + t9;
+    t2 = t8 + t0;
+    t14 = t3 + t10;
+    t6 = t13 + t4;
+    t12 = t11 + t7;
+    t9 = t8 - t0;
+    t8 = t3 - t10;
+    t0 = t13 - t4;
+    t3 = t11 - t7;
+    t10 = t2 + t6;
+    t13 = t14 + t12;
+    t4 = t2 - t6;
+    t11 = C4 * t4;
+    t7 = t14 - t12;
+    t2 = C4 * t7;
+    t6 = C5 * t10;
+    t4 = t5 - t6;
+    t14 = C5 * t13;
+    t12 = t1 - t14;
+    t7 = t4 + t11;
+    t6 = t12 + t2;
+    t14 = t4 - t11;
+    t4 = t12 - t2;
+    t11 = C0 * t9;
+    t12 = C3 * t0;
+    t2 = t11 + t12;
+    t11 = C0 * t8;
+    t12 = C3 * t3;
+    t11 = t11 + t12;
+    t12 = C3 * t9;
+    t9 = C0 * t0;
+    t0 = t12 - t9;
+    t12 = C3 * t8;
+    t9 = C0 * t3;
+    t8 = t12 - t9;
+    t3 = t5 + t10;
+    t12 = t1 + t13;
+    t9 = t7 + t11;
+    t5 = t6 - t2;
+    t10 = t14 + t8;
+    t1 = t4 - t0;
+    t13 = t14 - t8;
+    t14 = t4 + t0;
+    t8 = t7 - t11;
+    t4 = t6 + t2;
+    re[10] = t3;
+    im[10] = t12;
+    re[22] = t9;
+    im[22] = t5;
+    re[34] = t10;
+    im[34] = t1;
+    re[46] = t13;
+    im[46] = t14;
+    re[58] = t8;
+    im[58] = t4;
+    t0 = X[50];
+    t7 = X[69];
+    t11 = C33 * t0;
+    t6 = C32 * t7;
+    t2 = t11 + t6;
+    t3 = (-C32) * t0;
+    t12 = C33 * t7;
+    t9 = t3 + t12;
+    t5 = X[74];
+    t10 = X[45];
+    t1 = C41 * t5;
+    t13 = C40 * t10;
+    t14 = t1 + t13;
+    t8 = (-C40) * t5;
+    t4 = C41 * t10;
+    t11 = t8 + t4;
+    t6 = X[98];
+    t0 = X[21];
+    t7 = C39 * t6;
+    t3 = C38 * t0;
+    t12 = t7 + t3;
+    t1 = (-C38) * t6;
+    t13 = C39 * t0;
+    t5 = t1 + t13;
+    t10 = X[2];
+    t8 = X[117];
+    t4 = C37 * t10;
+    t7 = C36 * t8;
+    t3 = t4 + t7;
+    t6 = (-C36) * t10;
+    t0 = C37 * t8;
+    t1 = t6 + t0;
+    t13 = X[26];
+    t4 = X[93];
+    t7 = C35 * t13;
+    t10 = C34 * t4;
+    t8 = t7 + t10;
+    t6 = (-C34) * t13;
+    t0 = C35 * t4;
+    t7 = t6 + t0;
+    t10 = t14 + t8;
+    t13 = t11 + t7;
+    t4 = t12 + t3;
+    t6 = t5 + t1;
+    t0 = t14 - t8;
+    t14 = t11 - t7;
+    t8 = t12 - t3;
+    t11 = t5 - t1;
+    t7 = t10 + t4;
+    t12 = t13 + t6;
+    t3 = t10 - t4;
+    t5 = C4 * t3;
+    t1 = t13 - t6;
+    t10 = C4 * t1;
+    t4 = C5 * t7;
+    t3 = t2 - t4;
+    t13 = C5 * t12;
+    t6 = t9 - t13;
+    t1 = t3 + t5;
+    t4 = t6 + t10;
+    t13 = t3 - t5;
+    t3 = t6 - t10;
+    t5 = C0 * t0;
+    t6 = C3 * t8;
+    t10 = t5 + t6;
+    t5 = C0 * t14;
+    t6 = C3 * t11;
+    t5 = t5 + t6;
+    t6 = C3 * t0;
+    t0 = C0 * t8;
+    t8 = t6 - t0;
+    t6 = C3 * t14;
+    t0 = C0 * t11;
+    t14 = t6 - t0;
+    t11 = t2 + t7;
+    t6 = t9 + t12;
+    t0 = t1 + t5;
+    t2 = t4 - t10;
+    t7 = t13 + t14;
+    t9 = t3 - t8;
+    t12 = t13 - t14;
+    t13 = t3 + t8;
+    t14 = t1 - t5;
+    t3 = t4 + t10;
+    re[25] = t11;
+    im[25] = t6;
+    re[37] = t0;
+    im[37] = t2;
+    re[49] = t7;
+    im[49] = t9;
+    re[1] = t12;
+    im[1] = t13;
+    re[13] = t14;
+    im[13] = t3;
+    t8 = re[40];
+    t1 = im[40];
+    t5 = re[55];
+    t4 = im[55];
+    t10 = re[10];
+    t11 = im[10];
+    t6 = re[25];
+    t0 = im[25];
+    t2 = t8 + t10;
+    t7 = t1 + t11;
+    t9 = t5 + t6;
+    t12 = t4 + t0;
+    t13 = t8 - t10;
+    t14 = t1 - t11;
+    t3 = t5 - t6;
+    t8 = t4 - t0;
+    t10 = t2 + t9;
+    t1 = t7 + t12;
+    t11 = t13 + t8;
+    t5 = t14 - t3;
+    t6 = t2 - t9;
+    t4 = t7 - t12;
+    t0 = t13 - t8;
+    t2 = t14 + t3;
+    re[40] = t10;
+    im[40] = t1;
+    re[55] = t11;
+    im[55] = t5;
+    re[10] = t6;
+    im[10] = t4;
+    re[25] = t0;
+    im[25] = t2;
+    t9 = re[52];
+    t7 = im[52];
+    t12 = re[7];
+    t13 = im[7];
+    t8 = re[22];
+    t14 = im[22];
+    t3 = re[37];
+    t10 = im[37];
+    t1 = t9 + t8;
+    t11 = t7 + t14;
+    t5 = t12 + t3;
+    t6 = t13 + t10;
+    t4 = t9 - t8;
+    t0 = t7 - t14;
+    t2 = t12 - t3;
+    t9 = t13 - t10;
+    t8 = t1 + t5;
+    t7 = t11 + t6;
+    t14 = t4 + t9;
+    t12 = t0 - t2;
+    t3 = t1 - t5;
+    t13 = t11 - t6;
+    t10 = t4 - t9;
+    t1 = t0 + t2;
+    re[52] = t8;
+    im[52] = t7;
+    re[7] = t14;
+    im[7] = t12;
+    re[22] = t3;
+    im[22] = t13;
+    re[37] = t10;
+    im[37] = t1;
+    t5 = re[4];
+    t11 = im[4];
+    t6 = re[19];
+    t4 = im[19];
+    t9 = re[34];
+    t0 = im[34];
+    t2 = re[49];
+    t8 = im[49];
+    t7 = t5 + t9;
+    t14 = t11 + t0;
+    t12 = t6 + t2;
+    t3 = t4 + t8;
+    t13 = t5 - t9;
+    t10 = t11 - t0;
+    t1 = t6 - t2;
+    t5 = t4 - t8;
+    t9 = t7 + t12;
+    t11 = t14 + t3;
+    t0 = t13 + t5;
+    t6 = t10 - t1;
+    t2 = t7 - t12;
+    t4 = t14 - t3;
+    t8 = t13 - t5;
+    t7 = t10 + t1;
+    re[4] = t9;
+    im[4] = t11;
+    re[19] = t0;
+    im[19] = t6;
+    re[34] = t2;
+    im[34] = t4;
+    re[49] = t8;
+    im[49] = t7;
+    t12 = re[16];
+    t14 = im[16];
+    t3 = re[31];
+    t13 = im[31];
+    t5 = re[46];
+    t10 = im[46];
+    t1 = re[1];
+    t9 = im[1];
+    t11 = t12 + t5;
+    t0 = t14 + t10;
+    t6 = t3 + t1;
+    t2 = t13 + t9;
+    t4 = t12 - t5;
+    t8 = t14 - t10;
+    t7 = t3 - t1;
+    t12 = t13 - t9;
+    t5 = t11 + t6;
+    t14 = t0 + t2;
+    t10 = t4 + t12;
+    t3 = t8 - t7;
+    t1 = t11 - t6;
+    t13 = t0 - t2;
+    t9 = t4 - t12;
+    t11 = t8 + t7;
+    re[16] = t5;
+    im[16] = t14;
+    re[31] = t10;
+    im[31] = t3;
+    re[46] = t1;
+    im[46] = t13;
+    re[1] = t9;
+    im[1] = t11;
+    t6 = re[28];
+    t0 = im[28];
+    t2 = re[43];
+    t4 = im[43];
+    t12 = re[58];
+    t8 = im[58];
+    t7 = re[13];
+    t5 = im[13];
+    t14 = t6 + t12;
+    t10 = t0 + t8;
+    t3 = t2 + t7;
+    t1 = t4 + t5;
+    t13 = t6 - t12;
+    t9 = t0 - t8;
+    t11 = t2 - t7;
+    t6 = t4 - t5;
+    t12 = t14 + t3;
+    t0 = t10 + t1;
+    t8 = t13 + t6;
+    t2 = t9 - t11;
+    t7 = t14 - t3;
+    t4 = t10 - t1;
+    t5 = t13 - t6;
+    t14 = t9 + t11;
+    re[28] = t12;
+    im[28] = t0;
+    re[43] = t8;
+    im[43] = t2;
+    re[58] = t7;
+    im[58] = t4;
+    re[13] = t5;
+    im[13] = t14;
+    t3 = re[0];
+    t10 = im[0];
+    t1 = re[20];
+    t13 = im[20];
+    t6 = re[40];
+    t9 = im[40];
+    t11 = t1 + t6;
+    t12 = t13 + t9;
+    t0 = C62 * t11;
+    t8 = t3 - t0;
+    t2 = C62 * t12;
+    t7 = t10 - t2;
+    t4 = t1 - t6;
+    t5 = C63 * t4;
+    t14 = t13 - t9;
+    t0 = C63 * t14;
+    t2 = t3 + t11;
+    t1 = t10 + t12;
+    t6 = t8 + t0;
+    t4 = t7 - t5;
+    t13 = t8 - t0;
+    t9 = t7 + t5;
+    t14 = (-C64) * t2;
+    t3 = (-C65) * t1;
+    t11 = t14 + t3;
+    t10 = 0.12620200671712 * t11;
+    y[179] = t10;
+    t12 = 0.12459782471033913 * t11;
+    y[180] = t12;
+    t8 = C65 * t2;
+    t0 = (-C64) * t1;
+    t7 = t8 + t0;
+    t5 = 0.06490876847639243 * t7;
+    y[59] = t5;
+    t14 = (-0.06797970597338741) * t7;
+    y[60] = t14;
+    t3 = C66 * t6;
+    t10 = C67 * t4;
+    t11 = t3 + t10;
+    y[20] = 0;
+    t12 = (-0.1295686646576704) * t11;
+    y[99] = t12;
+    t2 = (-C67) * t6;
+    t1 = C66 * t4;
+    t8 = t2 + t1;
+    t0 = 0.12863192432137183 * t8;
+    y[140] = t0;
+    t5 = 0.021754981570668463 * t8;
+    y[219] = t5;
+    t7 = (-C68) * t13;
+    t14 = (-C69) * t9;
+    t3 = t7 + t14;
+    t10 = 0.12841755868299887 * t3;
+    y[139] = t10;
+    t11 = 0.01971225071410094 * t3;
+    y[220] = t11;
+    t12 = C69 * t13;
+    t6 = (-C68) * t9;
+    t4 = t12 + t6;
+    y[19] = 0;
+    t2 = (-0.12978495182118074) * t4;
+    y[100] = t2;
+    t1 = re[27];
+    t0 = im[27];
+    t8 = re[47];
+    t5 = im[47];
+    t7 = re[7];
+    t14 = im[7];
+    t10 = t8 + t7;
+    t3 = t5 + t14;
+    t11 = C62 * t10;
+    t13 = t1 - t11;
+    t9 = C62 * t3;
+    t12 = t0 - t9;
+    t6 = t8 - t7;
+    t4 = C63 * t6;
+    t2 = t5 - t14;
+    t11 = C63 * t2;
+    t9 = t1 + t10;
+    t8 = t0 + t3;
+    t7 = t13 + t11;
+    t6 = t12 - t4;
+    t5 = t13 - t11;
+    t14 = t12 + t4;
+    t2 = (-C70) * t9;
+    t1 = (-C71) * t8;
+    t10 = t2 + t1;
+    t0 = 0.12808820336608326 * t10;
+    y[137] = t0;
+    t3 = 0.01593336020836991 * t10;
+    y[222] = t3;
+    t13 = C71 * t9;
+    t11 = (-C70) * t8;
+    t12 = t13 + t11;
+    y[17] = 0;
+    t4 = (-0.13011867001547664) * t12;
+    y[102] = t4;
+    t2 = (-C72) * t7;
+    t1 = (-C73) * t6;
+    t0 = t2 + t1;
+    t10 = 0.12907968222318938 * t0;
+    y[177] = t10;
+    t3 = 0.12106472436196737 * t0;
+    y[182] = t3;
+    t9 = C73 * t7;
+    t8 = (-C72) * t6;
+    t13 = t9 + t8;
+    t11 = 0.05872448364572954 * t13;
+    y[57] = t11;
+    t12 = (-0.07404111225089935) * t13;
+    y[62] = t12;
+    t4 = C74 * t5;
+    t2 = C75 * t14;
+    t1 = t4 + t2;
+    y[22] = 0;
+    t10 = (-0.1290330442355771) * t1;
+    y[97] = t10;
+    t0 = (-C75) * t5;
+    t3 = C74 * t14;
+    t7 = t0 + t3;
+    t6 = 0.1291658796814725 * t7;
+    y[142] = t6;
+    t9 = 0.026131072792527615 * t7;
+    y[217] = t9;
+    t8 = re[54];
+    t11 = im[54];
+    t13 = re[14];
+    t12 = im[14];
+    t4 = re[34];
+    t2 = im[34];
+    t1 = t13 + t4;
+    t10 = t12 + t2;
+    t5 = C62 * t1;
+    t14 = t8 - t5;
+    t0 = C62 * t10;
+    t3 = t11 - t0;
+    t6 = t13 - t4;
+    t7 = C63 * t6;
+    t9 = t12 - t2;
+    t5 = C63 * t9;
+    t0 = t8 + t1;
+    t13 = t11 + t10;
+    t4 = t14 + t5;
+    t6 = t3 - t7;
+    t12 = t14 - t5;
+    t2 = t3 + t7;
+    t9 = C76 * t0;
+    t8 = C77 * t13;
+    t1 = t9 + t8;
+    y[24] = 0;
+    t11 = (-0.12835772813882737) * t1;
+    y[95] = t11;
+    t10 = (-C77) * t0;
+    t14 = C76 * t13;
+    t5 = t10 + t14;
+    t3 = 0.12984544762774675 * t5;
+    y[144] = t3;
+    t7 = 0.0308764483656392 * t5;
+    y[215] = t7;
+    t9 = (-C78) * t4;
+    t8 = (-C79) * t6;
+    t1 = t9 + t8;
+    t11 = 0.12788347061217586 * t1;
+    y[135] = t11;
+    t0 = 0.012572306868533882 * t1;
+    y[224] = t0;
+    t13 = C79 * t4;
+    t10 = (-C78) * t6;
+    t14 = t13 + t10;
+    y[15] = 0;
+    t3 = (-0.13032698117187178) * t14;
+    y[104] = t3;
+    t5 = (-C80) * t12;
+    t7 = (-C81) * t2;
+    t9 = t5 + t7;
+    t8 = 0.13151131774241775 * t9;
+    y[175] = t8;
+    t11 = 0.11710982065184652 * t9;
+    y[184] = t11;
+    t1 = C81 * t12;
+    t0 = (-C80) * t2;
+    t4 = t1 + t0;
+    t6 = 0.05254269484584441 * t4;
+    y[55] = t6;
+    t13 = (-0.07994293781845482) * t4;
+    y[64] = t13;
+    t10 = re[21];
+    t14 = im[21];
+    t3 = re[41];
+    t5 = im[41];
+    t7 = re[1];
+    t8 = im[1];
+    t9 = t3 + t7;
+    t11 = t5 + t8;
+    t12 = C62 * t9;
+    t2 = t10 - t12;
+    t1 = C62 * t11;
+    t0 = t14 - t1;
+    t6 = t3 - t7;
+    t4 = C63 * t6;
+    t13 = t5 - t8;
+    t12 = C63 * t13;
+    t1 = t10 + t9;
+    t3 = t14 + t11;
+    t7 = t2 + t12;
+    t6 = t0 - t4;
+    t5 = t2 - t12;
+    t8 = t0 + t4;
+    t13 = (-C82) * t1;
+    t10 = (-C83) * t3;
+    t9 = t13 + t10;
+    t14 = 0.1335004207756719 * t9;
+    y[173] = t14;
+    t11 = 0.11275555822546786 * t9;
+    y[186] = t11;
+    t2 = C83 * t1;
+    t12 = (-C82) * t3;
+    t0 = t2 + t12;
+    t4 = 0.04643450102705312 * t0;
+    y[53] = t4;
+    t13 = (-0.08562458841720233) * t0;
+    y[66] = t13;
+    t10 = C84 * t7;
+    t14 = C85 * t6;
+    t9 = t10 + t14;
+    y[26] = 0;
+    t11 = (-0.1275421331596694) * t9;
+    y[93] = t11;
+    t1 = (-C85) * t7;
+    t3 = C84 * t6;
+    t2 = t1 + t3;
+    t12 = 0.13067577163541516 * t2;
+    y[146] = t12;
+    t4 = 0.03595400675377978 * t2;
+    y[213] = t4;
+    t0 = (-C86) * t5;
+    t13 = (-C87) * t8;
+    t10 = t0 + t13;
+    t14 = 0.1277921467134663 * t10;
+    y[133] = t14;
+    t9 = 0.009636125497564936 * t10;
+    y[226] = t9;
+    t11 = C87 * t5;
+    t7 = (-C86) * t8;
+    t6 = t11 + t7;
+    y[13] = 0;
+    t1 = (-0.1304201165353018) * t6;
+    y[106] = t1;
+    t3 = re[48];
+    t12 = im[48];
+    t2 = re[8];
+    t4 = im[8];
+    t0 = re[28];
+    t13 = im[28];
+    t14 = t2 + t0;
+    t10 = t4 + t13;
+    t9 = C62 * t14;
+    t5 = t3 - t9;
+    t8 = C62 * t10;
+    t11 = t12 - t8;
+    t7 = t2 - t0;
+    t6 = C63 * t7;
+    t1 = t4 - t13;
+    t9 = C63 * t1;
+    t8 = t3 + t14;
+    t2 = t12 + t10;
+    t0 = t5 + t9;
+    t7 = t11 - t6;
+    t4 = t5 - t9;
+    t13 = t11 + t6;
+    t1 = (-C88) * t8;
+    t3 = (-C89) * t2;
+    t14 = t1 + t3;
+    t12 = 0.12780158235745 * t14;
+    y[131] = t12;
+    t10 = 0.007124344309620235 * t14;
+    y[228] = t10;
+    t5 = C89 * t8;
+    t9 = (-C88) * t2;
+    t11 = t5 + t9;
+    y[11] = 0;
+    t6 = (-0.13041048756385062) * t11;
+    y[108] = t6;
+    t1 = (-C90) * t0;
+    t3 = (-C91) * t7;
+    t12 = t1 + t3;
+    t14 = 0.13505200965384395 * t12;
+    y[171] = t14;
+    t10 = 0.10803002167053968 * t12;
+    y[188] = t10;
+    t8 = C91 * t0;
+    t2 = (-C90) * t7;
+    t5 = t8 + t2;
+    t9 = 0.04047221355336257 * t5;
+    y[51] = t9;
+    t11 = (-0.09103494713595524) * t5;
+    y[68] = t11;
+    t6 = C92 * t4;
+    t1 = C93 * t13;
+    t3 = t6 + t1;
+    t14 = 0.0005194330611931187 * t3;
+    y[28] = t14;
+    t12 = (-0.12650337940031647) * t3;
+    y[91] = t12;
+    t10 = (-C93) * t4;
+    t0 = C92 * t13;
+    t7 = t10 + t0;
+    t8 = 0.13157910079007984 * t7;
+    y[148] = t8;
+    t2 = 0.04132536003272668 * t7;
+    y[211] = t2;
+    t9 = re[15];
+    t5 = im[15];
+    t11 = re[35];
+    t6 = im[35];
+    t1 = re[55];
+    t14 = im[55];
+    t3 = t11 + t1;
+    t12 = t6 + t14;
+    t4 = C62 * t3;
+    t13 = t9 - t4;
+    t10 = C62 * t12;
+    t0 = t5 - t10;
+    t8 = t11 - t1;
+    t7 = C63 * t8;
+    t2 = t6 - t14;
+    t4 = C63 * t2;
+    t10 = t9 + t3;
+    t11 = t5 + t12;
+    t1 = t13 + t4;
+    t8 = t0 - t7;
+    t6 = t13 - t4;
+    t14 = t0 + t7;
+    t2 = C94 * t10;
+    t9 = C95 * t11;
+    t3 = t2 + t9;
+    t5 = 0.0013584973701853671 * t3;
+    y[30] = t5;
+    t12 = (-0.1252497637194936) * t3;
+    y[89] = t12;
+    t13 = (-C95) * t10;
+    t4 = C94 * t11;
+    t0 = t13 + t4;
+    t7 = 0.13255823420311855 * t0;
+    y[150] = t7;
+    t2 = 0.046948308515362296 * t0;
+    y[209] = t2;
+    t9 = (-C96) * t1;
+    t5 = (-C97) * t8;
+    t3 = t9 + t5;
+    t12 = 0.1278982472932104 * t3;
+    y[129] = t12;
+    t10 = 0.005029930242549008 * t3;
+    y[230] = t10;
+    t11 = C97 * t1;
+    t13 = (-C96) * t8;
+    t4 = t11 + t13;
+    y[9] = 0;
+    t7 = (-0.13031192388788446) * t4;
+    y[110] = t7;
+    t0 = (-C98) * t6;
+    t2 = (-C99) * t14;
+    t9 = t0 + t2;
+    t5 = 0.1361822132041467 * t9;
+    y[169] = t5;
+    t12 = 0.10296430973177248 * t9;
+    y[190] = t12;
+    t3 = C99 * t6;
+    t10 = (-C98) * t14;
+    t1 = t3 + t10;
+    t8 = 0.034730279097660105 * t1;
+    y[49] = t8;
+    t11 = (-0.09612626454352326) * t1;
+    y[70] = t11;
+}
+
+/**
+ *  Part 2 of ApplyWindowedIMDCT_W75_120().
+ * 
+ *  @param {Number[]} X 
+ *    - The input block (120 points).
+ *  @param {Number[]} y 
+ *    - The array that would contain the output block (240 points).
+ *  @param {Number[]} re 
+ *    - The scratch buffer (real part, 60 points).
+ *  @param {Number[]} im 
+ *    - The scratch buffer (imaginary part, 60 points).
+ */
+function ApplyWindowedIMDCT_W75_120_Part2(X, y, re, im) {
+    let t0, t1, t10, t11, t12, t13, t14, t2, t3, t4, t5, t6, t7, t8, t9;
+    const C0 = 0.5;
+    const C1 = 0.8660254037844386;
+    const C2 = 0.986643332084879;
+    const C3 = 0.16289547339458874;
+    const C4 = 0.3522500479212335;
+    const C5 = 0.9359059267573258;
+    const C6 = 0.773010453362737;
+    const C7 = 0.6343932841636455;
+    const C8 = 0.7561390817803227;
+    const C9 = 0.6544109481086103;
+    const C10 = 0.9820411276703039;
+    const C11 = 0.18866696468655522;
+    const C12 = 0.3276301795616935;
+    const C13 = 0.944806046466878;
+    const C14 = 0.3027857698425746;
+    const C15 = 0.953058643306297;
+    const C16 = 0.7387494902412463;
+    const C17 = 0.6739801114782978;
+    const C18 = 0.9767658813208724;
+    const C19 = 0.21430915306505077;
+    const C20 = 0.9708212084269281;
+    const C21 = 0.23980446465501654;
+    const C22 = 0.2777338458812922;
+    const C23 = 0.9606580613579353;
+    const C24 = 0.7208535967029188;
+    const C25 = 0.6930873625456359;
+    const C26 = 0.7024636661168517;
+    const C27 = 0.7117196061551713;
+    const C28 = 0.9642111831703293;
+    const C29 = 0.265135426243408;
+    const C30 = 0.25249157701515795;
+    const C31 = 0.9675990923602598;
+    const C32 = 0.22707626303437323;
+    const C33 = 0.9738769792773336;
+    const C34 = 0.6835923020228712;
+    const C35 = 0.7298640726978356;
+    const C36 = 0.9569403357322088;
+    const C37 = 0.29028467725446233;
+    const C38 = 0.949013649188214;
+    const C39 = 0.31523498164776964;
+    const C40 = 0.20150532232561713;
+    const C41 = 0.9794874195590514;
+    const C42 = 0.6642524379112817;
+    const C43 = 0.7475083268625968;
+    const C44 = 0.6444573283588975;
+    const C45 = 0.7646402761590003;
+    const C46 = 0.9404365560933549;
+    const C47 = 0.3399692397309942;
+    const C48 = 0.1757962799343545;
+    const C49 = 0.9844265680898916;
+    const C50 = 0.149966755554045;
+    const C51 = 0.9886910398241674;
+    const C52 = 0.6242205399450176;
+    const C53 = 0.7812481792047586;
+    const C54 = 0.9312149347588036;
+    const C55 = 0.36447049987914965;
+    const C56 = 0.9213551052231925;
+    const C57 = 0.38872197015239557;
+    const C58 = 0.12403445145048532;
+    const C59 = 0.992277912105967;
+    const C60 = 0.6035559419535714;
+    const C61 = 0.7973206537727071;
+    const C62 = 0.5824776968678022;
+    const C63 = 0.8128466845916152;
+    const C64 = 0.9108638249211758;
+    const C65 = 0.41270702980439467;
+    const C66 = 0.0980171403295606;
+    const C67 = 0.9951847266721969;
+    const C68 = 0.07193265315671939;
+    const C69 = 0.9974094913373519;
+    const C70 = 0.5610002506640098;
+    const C71 = 0.8278156308955021;
+    const C72 = 0.8997482840522215;
+    const C73 = 0.436409240673342;
+    const C74 = 0.8880161006528073;
+    const C75 = 0.45981235844785984;
+    const C76 = 0.04579886693652077;
+    const C77 = 0.9989506813588601;
+    const C78 = 0.5391383229110002;
+    const C79 = 0.8422172337162865;
+    const C80 = 0.5169068966820275;
+    const C81 = 0.8560416229147715;
+    const C82 = 0.8756753153753997;
+    const C83 = 0.4829003438000374;
+    const C84 = 0.0196336924606283;
+    const C85 = 0.9998072404820648;
+    t13 = re[42];
+    t4 = im[42];
+    t7 = re[2];
+    t0 = im[2];
+    t2 = re[22];
+    t5 = im[22];
+    t9 = t7 + t2;
+    t12 = t0 + t5;
+    t6 = C0 * t9;
+    t14 = t13 - t6;
+    t3 = C0 * t12;
+    t10 = t4 - t3;
+    t8 = t7 - t2;
+    t1 = C1 * t8;
+    t11 = t0 - t5;
+    t6 = C1 * t11;
+    t3 = t13 + t9;
+    t7 = t4 + t12;
+    t2 = t14 + t6;
+    t8 = t10 - t1;
+    t0 = t14 - t6;
+    t5 = t10 + t1;
+    t11 = (-C2) * t3;
+    t13 = (-C3) * t7;
+    t9 = t11 + t13;
+    t4 = 0.13691436857179223 * t9;
+    y[167] = t4;
+    t12 = 0.09759487977024296 * t9;
+    y[192] = t12;
+    t14 = C3 * t3;
+    t6 = (-C2) * t7;
+    t10 = t14 + t6;
+    t1 = 0.02927826085377822 * t10;
+    y[47] = t1;
+    t11 = (-0.1008605485516984) * t10;
+    y[72] = t11;
+    t13 = C4 * t2;
+    t4 = C5 * t8;
+    t9 = t13 + t4;
+    t12 = 0.002671013396397365 * t9;
+    y[32] = t12;
+    t3 = (-0.12373220432951987) * t9;
+    y[87] = t3;
+    t7 = (-C5) * t2;
+    t14 = C4 * t8;
+    t6 = t7 + t14;
+    t1 = 0.13356018733626082 * t6;
+    y[152] = t1;
+    t10 = 0.0527778247303557 * t6;
+    y[207] = t10;
+    t11 = (-C6) * t0;
+    t13 = (-C7) * t5;
+    t4 = t11 + t13;
+    t12 = 0.12806787176544185 * t4;
+    y[127] = t12;
+    t9 = 0.003342172812925513 * t4;
+    y[232] = t9;
+    t3 = C7 * t0;
+    t2 = (-C6) * t5;
+    t8 = t3 + t2;
+    y[7] = 0;
+    t7 = (-0.13013932719356736) * t8;
+    y[112] = t7;
+    t14 = re[9];
+    t1 = im[9];
+    t6 = re[29];
+    t10 = im[29];
+    t11 = re[49];
+    t13 = im[49];
+    t12 = t6 + t11;
+    t4 = t10 + t13;
+    t9 = C0 * t12;
+    t0 = t14 - t9;
+    t5 = C0 * t4;
+    t3 = t1 - t5;
+    t2 = t6 - t11;
+    t8 = C1 * t2;
+    t7 = t10 - t13;
+    t9 = C1 * t7;
+    t5 = t14 + t12;
+    t6 = t1 + t4;
+    t11 = t0 + t9;
+    t2 = t3 - t8;
+    t10 = t0 - t9;
+    t13 = t3 + t8;
+    t7 = (-C8) * t5;
+    t14 = (-C9) * t6;
+    t12 = t7 + t14;
+    t1 = 0.12829580943122418 * t12;
+    y[125] = t1;
+    t4 = 0.0020440999515884475 * t12;
+    y[234] = t4;
+    t0 = C9 * t5;
+    t9 = (-C8) * t6;
+    t3 = t0 + t9;
+    y[5] = 0;
+    t8 = (-0.12990811422879092) * t3;
+    y[114] = t8;
+    t7 = (-C10) * t11;
+    t14 = (-C11) * t2;
+    t1 = t7 + t14;
+    t12 = 0.13727636491149103 * t1;
+    y[165] = t12;
+    t4 = 0.09196785996907547 * t1;
+    y[194] = t4;
+    t5 = C11 * t11;
+    t6 = (-C10) * t2;
+    t0 = t5 + t6;
+    t9 = 0.024181661331159763 * t0;
+    y[45] = t9;
+    t3 = (-0.10520915987872281) * t0;
+    y[74] = t3;
+    t8 = C12 * t10;
+    t7 = C13 * t13;
+    t14 = t8 + t7;
+    t12 = 0.004514182839126034 * t14;
+    y[34] = t12;
+    t1 = (-0.12191121776397795) * t14;
+    y[85] = t1;
+    t4 = (-C13) * t10;
+    t11 = C12 * t13;
+    t2 = t4 + t11;
+    t5 = 0.13453560390917557 * t2;
+    y[154] = t5;
+    t6 = 0.05876309643192008 * t2;
+    y[205] = t6;
+    t9 = re[36];
+    t0 = im[36];
+    t3 = re[56];
+    t8 = im[56];
+    t7 = re[16];
+    t12 = im[16];
+    t14 = t3 + t7;
+    t1 = t8 + t12;
+    t10 = C0 * t14;
+    t13 = t9 - t10;
+    t4 = C0 * t1;
+    t11 = t0 - t4;
+    t5 = t3 - t7;
+    t2 = C1 * t5;
+    t6 = t8 - t12;
+    t10 = C1 * t6;
+    t4 = t9 + t14;
+    t3 = t0 + t1;
+    t7 = t13 + t10;
+    t5 = t11 - t2;
+    t8 = t13 - t10;
+    t12 = t11 + t2;
+    t6 = C14 * t4;
+    t9 = C15 * t3;
+    t14 = t6 + t9;
+    t0 = 0.006909966644492878 * t14;
+    y[36] = t0;
+    t1 = (-0.11975012852205472) * t14;
+    y[83] = t1;
+    t13 = (-C15) * t4;
+    t10 = C14 * t3;
+    t11 = t13 + t10;
+    t2 = 0.1354366507592513 * t11;
+    y[156] = t2;
+    t6 = 0.06484985452235424 * t11;
+    y[203] = t6;
+    t9 = (-C16) * t7;
+    t0 = (-C17) * t5;
+    t14 = t9 + t0;
+    t1 = 0.12856697855379723 * t14;
+    y[123] = t1;
+    t4 = 0.0011081398757414565 * t14;
+    y[236] = t4;
+    t3 = C17 * t7;
+    t13 = (-C16) * t5;
+    t10 = t3 + t13;
+    y[3] = 0;
+    t2 = (-0.1296341164282142) * t10;
+    y[116] = t2;
+    t11 = (-C18) * t8;
+    t6 = (-C19) * t12;
+    t9 = t11 + t6;
+    t0 = 0.13730582157802826 * t9;
+    y[163] = t0;
+    t1 = 0.0861321005071867 * t9;
+    y[196] = t1;
+    t14 = C19 * t8;
+    t4 = (-C18) * t12;
+    t7 = t14 + t4;
+    t5 = 0.019495614692840772 * t7;
+    y[43] = t5;
+    t3 = (-0.10915391824065103) * t7;
+    y[76] = t3;
+    t13 = re[3];
+    t10 = im[3];
+    t2 = re[23];
+    t11 = im[23];
+    t6 = re[43];
+    t0 = im[43];
+    t9 = t2 + t6;
+    t1 = t11 + t0;
+    t8 = C0 * t9;
+    t12 = t13 - t8;
+    t14 = C0 * t1;
+    t4 = t10 - t14;
+    t5 = t2 - t6;
+    t7 = C1 * t5;
+    t3 = t11 - t0;
+    t8 = C1 * t3;
+    t14 = t13 + t9;
+    t2 = t10 + t1;
+    t6 = t12 + t8;
+    t5 = t4 - t7;
+    t11 = t12 - t8;
+    t0 = t4 + t7;
+    t3 = (-C20) * t14;
+    t13 = (-C21) * t2;
+    t9 = t3 + t13;
+    t10 = 0.13704680139628003 * t9;
+    y[161] = t10;
+    t1 = 0.0801410936903822 * t9;
+    y[198] = t1;
+    t12 = C21 * t14;
+    t8 = (-C20) * t2;
+    t4 = t12 + t8;
+    t7 = 0.015266611259952238 * t4;
+    y[41] = t7;
+    t3 = (-0.11268547376522257) * t4;
+    y[78] = t3;
+    t13 = C22 * t6;
+    t10 = C23 * t5;
+    t9 = t13 + t10;
+    t1 = 0.009855836165055538 * t9;
+    y[38] = t1;
+    t14 = (-0.1172192652084256) * t9;
+    y[81] = t14;
+    t2 = (-C23) * t6;
+    t12 = C22 * t5;
+    t8 = t2 + t12;
+    t7 = 0.13621541368085294 * t8;
+    y[158] = t7;
+    t4 = 0.07098291339458514 * t8;
+    y[201] = t4;
+    t3 = (-C24) * t11;
+    t13 = (-C25) * t0;
+    t10 = t3 + t13;
+    t1 = 0.12886614548209754 * t10;
+    y[121] = t1;
+    t9 = 0.0004918875004744597 * t10;
+    y[238] = t9;
+    t14 = C25 * t11;
+    t6 = (-C24) * t0;
+    t5 = t14 + t6;
+    y[1] = 0;
+    t2 = (-0.12933316663050223) * t5;
+    y[118] = t2;
+    t12 = re[30];
+    t7 = im[30];
+    t8 = re[50];
+    t4 = im[50];
+    t3 = re[10];
+    t13 = im[10];
+    t1 = t8 + t3;
+    t10 = t4 + t13;
+    t9 = C0 * t1;
+    t11 = t12 - t9;
+    t0 = C0 * t10;
+    t14 = t7 - t0;
+    t6 = t8 - t3;
+    t5 = C1 * t6;
+    t2 = t4 - t13;
+    t9 = C1 * t2;
+    t0 = t12 + t1;
+    t8 = t7 + t10;
+    t3 = t11 + t9;
+    t6 = t14 - t5;
+    t4 = t11 - t9;
+    t13 = t14 + t5;
+    t2 = C26 * t0;
+    t12 = C27 * t8;
+    t1 = t2 + t12;
+    y[0] = 0;
+    t7 = (-0.12917766111079845) * t1;
+    y[119] = t7;
+    t10 = (-C27) * t0;
+    t11 = C26 * t8;
+    t9 = t10 + t11;
+    t14 = 0.12902127599578772 * t9;
+    y[120] = t14;
+    t5 = 0.00028508368687010457 * t9;
+    y[239] = t5;
+    t2 = (-C28) * t3;
+    t12 = (-C29) * t6;
+    t1 = t2 + t12;
+    t7 = 0.13654315883131996 * t1;
+    y[159] = t7;
+    t0 = 0.07404845715883025 * t1;
+    y[200] = t0;
+    t8 = C29 * t3;
+    t10 = (-C28) * t6;
+    t11 = t8 + t10;
+    t14 = 0.011530095541814405 * t11;
+    y[39] = t14;
+    t9 = (-0.11580866457349219) * t11;
+    y[80] = t9;
+    t5 = C30 * t4;
+    t2 = C31 * t13;
+    t12 = t5 + t2;
+    t7 = 0.013334776417074718 * t12;
+    y[40] = t7;
+    t1 = (-0.11429836914374931) * t12;
+    y[79] = t1;
+    t0 = (-C31) * t4;
+    t3 = C30 * t13;
+    t6 = t0 + t3;
+    t8 = 0.1368217981907019 * t6;
+    y[160] = t8;
+    t10 = 0.07710352524829175 * t6;
+    y[199] = t10;
+    t14 = re[57];
+    t11 = im[57];
+    t9 = re[17];
+    t5 = im[17];
+    t2 = re[37];
+    t7 = im[37];
+    t12 = t9 + t2;
+    t1 = t5 + t7;
+    t4 = C0 * t12;
+    t13 = t14 - t4;
+    t0 = C0 * t1;
+    t3 = t11 - t0;
+    t8 = t9 - t2;
+    t6 = C1 * t8;
+    t10 = t5 - t7;
+    t4 = C1 * t10;
+    t0 = t14 + t12;
+    t9 = t11 + t1;
+    t2 = t13 + t4;
+    t8 = t3 - t6;
+    t5 = t13 - t4;
+    t7 = t3 + t6;
+    t10 = C32 * t0;
+    t14 = C33 * t9;
+    t12 = t10 + t14;
+    t11 = 0.01732151035597601 * t12;
+    y[42] = t11;
+    t1 = (-0.11097127741230771) * t12;
+    y[77] = t1;
+    t13 = (-C33) * t0;
+    t4 = C32 * t9;
+    t3 = t13 + t4;
+    t6 = 0.13720967307681287 * t3;
+    y[162] = t6;
+    t10 = 0.08315290886343998 * t3;
+    y[197] = t10;
+    t14 = C34 * t2;
+    t11 = C35 * t8;
+    t12 = t14 + t11;
+    y[2] = 0;
+    t1 = (-0.12948604267359684) * t12;
+    y[117] = t1;
+    t0 = (-C35) * t2;
+    t9 = C34 * t8;
+    t13 = t0 + t9;
+    t4 = 0.12871400131270763 * t13;
+    y[122] = t4;
+    t6 = 0.00076369095933275 * t13;
+    y[237] = t6;
+    t3 = (-C36) * t5;
+    t10 = (-C37) * t7;
+    t14 = t3 + t10;
+    t11 = 0.13584358060175267 * t14;
+    y[157] = t11;
+    t12 = 0.06791417225431495 * t14;
+    y[202] = t12;
+    t1 = C37 * t5;
+    t2 = (-C36) * t7;
+    t8 = t1 + t2;
+    t0 = 0.008315002078298335 * t8;
+    y[37] = t0;
+    t9 = (-0.11853309602042676) * t8;
+    y[82] = t9;
+    t4 = re[24];
+    t13 = im[24];
+    t6 = re[44];
+    t3 = im[44];
+    t10 = re[4];
+    t11 = im[4];
+    t14 = t6 + t10;
+    t12 = t3 + t11;
+    t5 = C0 * t14;
+    t7 = t4 - t5;
+    t1 = C0 * t12;
+    t2 = t13 - t1;
+    t0 = t6 - t10;
+    t8 = C1 * t0;
+    t9 = t3 - t11;
+    t5 = C1 * t9;
+    t1 = t4 + t14;
+    t6 = t13 + t12;
+    t10 = t7 + t5;
+    t0 = t2 - t8;
+    t3 = t7 - t5;
+    t11 = t2 + t8;
+    t9 = (-C38) * t1;
+    t4 = (-C39) * t6;
+    t14 = t9 + t4;
+    t13 = 0.134999108138462 * t14;
+    y[155] = t13;
+    t12 = 0.06179688238318953 * t14;
+    y[204] = t12;
+    t7 = C39 * t1;
+    t5 = (-C38) * t6;
+    t2 = t7 + t5;
+    t8 = 0.005642736022192477 * t2;
+    y[35] = t8;
+    t9 = (-0.12087459982066931) * t2;
+    y[84] = t9;
+    t4 = C40 * t10;
+    t13 = C41 * t0;
+    t14 = t4 + t13;
+    t12 = 0.021784194384711957 * t14;
+    y[44] = t12;
+    t1 = (-0.10723257358114603) * t14;
+    y[75] = t1;
+    t6 = (-C41) * t10;
+    t7 = C40 * t0;
+    t5 = t6 + t7;
+    t8 = 0.13733025315079586 * t5;
+    y[164] = t8;
+    t2 = 0.08907330500678516 * t5;
+    y[195] = t2;
+    t9 = C42 * t3;
+    t4 = C43 * t11;
+    t13 = t9 + t4;
+    y[4] = 0;
+    t12 = (-0.12977552370364087) * t13;
+    y[115] = t12;
+    t14 = (-C43) * t3;
+    t1 = C42 * t11;
+    t10 = t14 + t1;
+    t0 = 0.12842688814515704 * t10;
+    y[124] = t0;
+    t6 = 0.0015331814262077778 * t10;
+    y[235] = t6;
+    t7 = re[51];
+    t8 = im[51];
+    t5 = re[11];
+    t2 = im[11];
+    t9 = re[31];
+    t4 = im[31];
+    t13 = t5 + t9;
+    t12 = t2 + t4;
+    t3 = C0 * t13;
+    t11 = t7 - t3;
+    t14 = C0 * t12;
+    t1 = t8 - t14;
+    t0 = t5 - t9;
+    t10 = C1 * t0;
+    t6 = t2 - t4;
+    t3 = C1 * t6;
+    t14 = t7 + t13;
+    t5 = t8 + t12;
+    t9 = t11 + t3;
+    t0 = t1 - t10;
+    t2 = t11 - t3;
+    t4 = t1 + t10;
+    t6 = C44 * t14;
+    t7 = C45 * t5;
+    t13 = t6 + t7;
+    y[6] = 0;
+    t8 = (-0.13003011032490908) * t13;
+    y[113] = t8;
+    t12 = (-C45) * t14;
+    t11 = C44 * t5;
+    t3 = t12 + t11;
+    t1 = 0.12817544048083407 * t3;
+    y[126] = t1;
+    t10 = 0.002645488415955432 * t3;
+    y[233] = t10;
+    t6 = (-C46) * t9;
+    t7 = (-C47) * t0;
+    t13 = t6 + t7;
+    t8 = 0.13405440880677835 * t13;
+    y[153] = t8;
+    t14 = 0.055754312275673956 * t13;
+    y[206] = t14;
+    t5 = C47 * t9;
+    t12 = (-C46) * t0;
+    t11 = t5 + t12;
+    t1 = 0.0035242164097109706 * t11;
+    y[33] = t1;
+    t3 = (-0.12286187788252573) * t11;
+    y[86] = t3;
+    t10 = C48 * t2;
+    t6 = C49 * t4;
+    t7 = t10 + t6;
+    t8 = 0.02668198545912109 * t7;
+    y[46] = t8;
+    t13 = (-0.10308453537650168) * t7;
+    y[73] = t13;
+    t14 = (-C49) * t2;
+    t9 = C48 * t4;
+    t0 = t14 + t9;
+    t5 = 0.13713932162371242 * t0;
+    y[166] = t5;
+    t12 = 0.09481016392552134 * t0;
+    y[193] = t12;
+    t1 = re[18];
+    t11 = im[18];
+    t3 = re[38];
+    t10 = im[38];
+    t6 = re[58];
+    t8 = im[58];
+    t7 = t3 + t6;
+    t13 = t10 + t8;
+    t2 = C0 * t7;
+    t4 = t1 - t2;
+    t14 = C0 * t13;
+    t9 = t11 - t14;
+    t5 = t3 - t6;
+    t0 = C1 * t5;
+    t12 = t10 - t8;
+    t2 = C1 * t12;
+    t14 = t1 + t7;
+    t3 = t11 + t13;
+    t6 = t4 + t2;
+    t5 = t9 - t0;
+    t10 = t4 - t2;
+    t8 = t9 + t0;
+    t12 = C50 * t14;
+    t1 = C51 * t3;
+    t7 = t12 + t1;
+    t11 = 0.03196300182962468 * t7;
+    y[48] = t11;
+    t13 = (-0.09854054368740502) * t7;
+    y[71] = t13;
+    t4 = (-C51) * t14;
+    t2 = C50 * t3;
+    t9 = t4 + t2;
+    t0 = 0.136596534411342 * t9;
+    y[168] = t0;
+    t12 = 0.10031504290644871 * t9;
+    y[191] = t12;
+    t1 = C52 * t6;
+    t11 = C53 * t5;
+    t7 = t1 + t11;
+    y[8] = 0;
+    t13 = (-0.13023397290569816) * t7;
+    y[111] = t13;
+    t14 = (-C53) * t6;
+    t3 = C52 * t5;
+    t4 = t14 + t3;
+    t2 = 0.127974800236916 * t4;
+    y[128] = t2;
+    t0 = 0.004136551410626626 * t4;
+    y[231] = t0;
+    t9 = (-C54) * t10;
+    t12 = (-C55) * t8;
+    t1 = t9 + t12;
+    t11 = 0.1330591826828481 * t1;
+    y[151] = t11;
+    t7 = 0.049840479635363234 * t1;
+    y[208] = t7;
+    t13 = C55 * t10;
+    t6 = (-C54) * t8;
+    t5 = t13 + t6;
+    t14 = 0.0019510169774324456 * t5;
+    y[31] = t14;
+    t3 = (-0.12452674599864776) * t5;
+    y[88] = t3;
+    t2 = re[45];
+    t4 = im[45];
+    t0 = re[5];
+    t9 = im[5];
+    t12 = re[25];
+    t11 = im[25];
+    t1 = t0 + t12;
+    t7 = t9 + t11;
+    t10 = C0 * t1;
+    t8 = t2 - t10;
+    t13 = C0 * t7;
+    t6 = t4 - t13;
+    t14 = t0 - t12;
+    t5 = C1 * t14;
+    t3 = t9 - t11;
+    t10 = C1 * t3;
+    t13 = t2 + t1;
+    t0 = t4 + t7;
+    t12 = t8 + t10;
+    t14 = t6 - t5;
+    t9 = t8 - t10;
+    t11 = t6 + t5;
+    t3 = (-C56) * t13;
+    t2 = (-C57) * t0;
+    t1 = t3 + t2;
+    t4 = 0.132062998027614 * t1;
+    y[149] = t4;
+    t7 = 0.04410793846784834 * t1;
+    y[210] = t7;
+    t8 = C57 * t13;
+    t10 = (-C56) * t0;
+    t6 = t8 + t10;
+    t5 = 0.000885037777122633 * t6;
+    y[29] = t5;
+    t3 = (-0.12590679996053722) * t6;
+    y[90] = t3;
+    t2 = C58 * t12;
+    t4 = C59 * t14;
+    t1 = t2 + t4;
+    t7 = 0.03756930245760549 * t1;
+    y[50] = t7;
+    t13 = (-0.0936228253848627) * t1;
+    y[69] = t13;
+    t0 = (-C59) * t12;
+    t8 = C58 * t14;
+    t10 = t0 + t8;
+    t5 = 0.13566875398048714 * t10;
+    y[170] = t5;
+    t6 = 0.10553761563829522 * t10;
+    y[189] = t6;
+    t3 = C60 * t9;
+    t2 = C61 * t11;
+    t4 = t3 + t2;
+    y[10] = 0;
+    t7 = (-0.13037145630985233) * t4;
+    y[109] = t7;
+    t1 = (-C61) * t9;
+    t13 = C60 * t11;
+    t12 = t1 + t13;
+    t14 = 0.1278398442298228 * t12;
+    y[130] = t14;
+    t0 = 0.006025615493498079 * t12;
+    y[229] = t0;
+    t8 = re[12];
+    t5 = im[12];
+    t10 = re[32];
+    t6 = im[32];
+    t3 = re[52];
+    t2 = im[52];
+    t4 = t10 + t3;
+    t7 = t6 + t2;
+    t9 = C0 * t4;
+    t11 = t8 - t9;
+    t1 = C0 * t7;
+    t13 = t5 - t1;
+    t14 = t10 - t3;
+    t12 = C1 * t14;
+    t0 = t6 - t2;
+    t9 = C1 * t0;
+    t1 = t8 + t4;
+    t10 = t5 + t7;
+    t3 = t11 + t9;
+    t14 = t13 - t12;
+    t6 = t11 - t9;
+    t2 = t13 + t12;
+    t0 = C62 * t1;
+    t8 = C63 * t10;
+    t4 = t0 + t8;
+    y[12] = 0;
+    t5 = (-0.1304273641267012) * t4;
+    y[107] = t5;
+    t7 = (-C63) * t1;
+    t11 = C62 * t10;
+    t9 = t7 + t11;
+    t13 = 0.1277850455559015 * t9;
+    y[132] = t13;
+    t12 = 0.008327409735314555 * t9;
+    y[227] = t12;
+    t0 = (-C64) * t3;
+    t8 = (-C65) * t14;
+    t4 = t0 + t8;
+    t5 = 0.13114862579928324 * t4;
+    y[147] = t5;
+    t1 = 0.0386056955153734 * t4;
+    y[212] = t1;
+    t10 = C65 * t3;
+    t7 = (-C64) * t14;
+    t11 = t10 + t7;
+    y[27] = 0;
+    t13 = (-0.1270822821443376) * t11;
+    y[92] = t13;
+    t9 = C66 * t6;
+    t12 = C67 * t2;
+    t0 = t9 + t12;
+    t8 = 0.043430098972763266 * t0;
+    y[52] = t8;
+    t5 = (-0.0883673493295678) * t0;
+    y[67] = t5;
+    t4 = (-C67) * t6;
+    t1 = C66 * t2;
+    t3 = t4 + t1;
+    t14 = 0.13432951598517828 * t3;
+    y[172] = t14;
+    t10 = 0.110437772783816 * t3;
+    y[187] = t10;
+    t7 = re[39];
+    t11 = im[39];
+    t13 = re[59];
+    t9 = im[59];
+    t12 = re[19];
+    t8 = im[19];
+    t0 = t13 + t12;
+    t5 = t9 + t8;
+    t6 = C0 * t0;
+    t2 = t7 - t6;
+    t4 = C0 * t5;
+    t1 = t11 - t4;
+    t14 = t13 - t12;
+    t3 = C1 * t14;
+    t10 = t9 - t8;
+    t6 = C1 * t10;
+    t4 = t7 + t0;
+    t13 = t11 + t5;
+    t12 = t2 + t6;
+    t14 = t1 - t3;
+    t9 = t2 - t6;
+    t8 = t1 + t3;
+    t10 = C68 * t4;
+    t7 = C69 * t13;
+    t0 = t10 + t7;
+    t11 = 0.04947530060490178 * t0;
+    y[54] = t11;
+    t5 = (-0.08281434546962085) * t0;
+    y[65] = t5;
+    t2 = (-C69) * t4;
+    t6 = C68 * t13;
+    t1 = t2 + t6;
+    t3 = 0.13256118850403636 * t1;
+    y[174] = t3;
+    t10 = 0.11498057690358454 * t1;
+    y[185] = t10;
+    t7 = C70 * t12;
+    t11 = C71 * t14;
+    t0 = t7 + t11;
+    y[14] = 0;
+    t5 = (-0.1303872644748) * t0;
+    y[105] = t5;
+    t4 = (-C71) * t12;
+    t13 = C70 * t14;
+    t2 = t4 + t13;
+    t6 = 0.12782434491435965 * t2;
+    y[134] = t6;
+    t3 = 0.011050914571142288 * t2;
+    y[225] = t3;
+    t1 = (-C72) * t9;
+    t10 = (-C73) * t8;
+    t7 = t1 + t10;
+    t11 = 0.13024140576603055 * t7;
+    y[145] = t11;
+    t0 = 0.03337558481131762 * t7;
+    y[214] = t0;
+    t5 = C73 * t9;
+    t12 = (-C72) * t8;
+    t14 = t5 + t12;
+    y[25] = 0;
+    t4 = (-0.12796749673147076) * t14;
+    y[94] = t4;
+    t13 = re[6];
+    t6 = im[6];
+    t2 = re[26];
+    t3 = im[26];
+    t1 = re[46];
+    t10 = im[46];
+    t11 = t2 + t1;
+    t7 = t3 + t10;
+    t0 = C0 * t11;
+    t9 = t13 - t0;
+    t8 = C0 * t7;
+    t5 = t6 - t8;
+    t12 = t2 - t1;
+    t14 = C1 * t12;
+    t4 = t3 - t10;
+    t0 = C1 * t4;
+    t8 = t13 + t11;
+    t2 = t6 + t7;
+    t1 = t9 + t0;
+    t12 = t5 - t14;
+    t3 = t9 - t0;
+    t10 = t5 + t14;
+    t4 = (-C74) * t8;
+    t13 = (-C75) * t2;
+    t11 = t4 + t13;
+    t6 = 0.12948708125496394 * t11;
+    y[143] = t6;
+    t7 = 0.028460019760872708 * t11;
+    y[216] = t7;
+    t9 = C75 * t8;
+    t0 = (-C74) * t2;
+    t5 = t9 + t0;
+    y[23] = 0;
+    t14 = (-0.12871296893200876) * t5;
+    y[96] = t14;
+    t4 = C76 * t1;
+    t13 = C77 * t12;
+    t6 = t4 + t13;
+    t11 = 0.055628708463325655 * t6;
+    y[56] = t11;
+    t7 = (-0.07701545284553844) * t6;
+    y[63] = t7;
+    t8 = (-C77) * t1;
+    t2 = C76 * t12;
+    t9 = t8 + t2;
+    t0 = 0.13035180369321933 * t9;
+    y[176] = t0;
+    t5 = 0.11913926566118321 * t9;
+    y[183] = t5;
+    t14 = C78 * t3;
+    t4 = C79 * t10;
+    t13 = t14 + t4;
+    y[16] = 0;
+    t11 = (-0.13023790615363698) * t13;
+    y[103] = t11;
+    t6 = (-C79) * t3;
+    t7 = C78 * t10;
+    t1 = t6 + t7;
+    t12 = 0.12797093533587375 * t1;
+    y[136] = t12;
+    t8 = 0.014200113027426714 * t1;
+    y[223] = t8;
+    t2 = re[33];
+    t0 = im[33];
+    t9 = re[53];
+    t5 = im[53];
+    t14 = re[13];
+    t4 = im[13];
+    t13 = t9 + t14;
+    t11 = t5 + t4;
+    t3 = C0 * t13;
+    t10 = t2 - t3;
+    t6 = C0 * t11;
+    t7 = t0 - t6;
+    t12 = t9 - t14;
+    t1 = C1 * t12;
+    t8 = t5 - t4;
+    t3 = C1 * t8;
+    t6 = t2 + t13;
+    t9 = t0 + t11;
+    t14 = t10 + t3;
+    t12 = t7 - t1;
+    t5 = t10 - t3;
+    t4 = t7 + t1;
+    t8 = C80 * t6;
+    t2 = C81 * t9;
+    t13 = t8 + t2;
+    y[18] = 0;
+    t0 = (-0.1299681237772433) * t13;
+    y[101] = t0;
+    t11 = (-C81) * t6;
+    t10 = C80 * t9;
+    t3 = t11 + t10;
+    t7 = 0.12823657203232558 * t3;
+    y[138] = t7;
+    t1 = 0.017771243024118102 * t3;
+    y[221] = t1;
+    t8 = (-C82) * t14;
+    t2 = (-C83) * t12;
+    t13 = t8 + t2;
+    t0 = 0.12888116724457874 * t13;
+    y[141] = t0;
+    t6 = 0.02389541705548433 * t13;
+    y[218] = t6;
+    t9 = C83 * t14;
+    t11 = (-C82) * t12;
+    t10 = t9 + t11;
+    y[21] = 0;
+    t7 = (-0.12931809218516938) * t10;
+    y[98] = t7;
+    t3 = C84 * t5;
+    t1 = C85 * t4;
+    t8 = t3 + t1;
+    t2 = 0.06182067494882439 * t8;
+    y[58] = t2;
+    t0 = (-0.07102713875108795) * t8;
+    y[61] = t0;
+    t13 = (-C85) * t5;
+    t6 = C84 * t4;
+    t14 = t13 + t6;
+    t12 = 0.12769564445023865 * t14;
+    y[178] = t12;
+    t9 = 0.1228846242244815 * t14;
+    y[181] = t9;
+}
+
+//
+//  Public functions.
+//
+
+/**
+ *  Apply LD-MDCT transform (prebuilt for window W75_120).
+ * 
+ *  Note(s):
+ *    [1] X[k] = SUM(w[n] * x[n] * cos(PI / 120 * (n + 60.5) * (k + 0.5))), where
+ *        w[n] = sqrt(2 / 120) * W75_120[n].
+ *    [2] The size of all arrays will not be checked.
+ * 
+ *  @param {Number[]} x 
+ *    - The input block (240 points).
+ *  @param {Number[]} X 
+ *    - The array that would contain the output block (120 points).
+ *  @param {Number[]} re 
+ *    - The scratch buffer (real part, 60 points).
+ *  @param {Number[]} im 
+ *    - The scratch buffer (imaginary part, 60 points).
+ */
+function ApplyWindowedMDCT_W75_120(x, X, re, im) {
+    ApplyWindowedMDCT_W75_120_Part1(x, X, re, im);
+    ApplyWindowedMDCT_W75_120_Part2(x, X, re, im);
+}
+
+/**
+ *  Apply LD-IMDCT transform (prebuilt for window W75_120).
+ * 
+ *  Note(s):
+ *    [1] y[n] = w[n] * SUM(X[k] * cos(PI / 120 * (n + 60.5) * (k + 0.5))), where
+ *        w[n] = sqrt(2 / 120) * W75_120[239 - n].
+ *    [2] The size of all arrays will not be checked.
+ * 
+ *  @param {Number[]} X 
+ *    - The input block (120 points).
+ *  @param {Number[]} y 
+ *    - The array that would contain the output block (240 points).
+ *  @param {Number[]} re 
+ *    - The scratch buffer (real part, 60 points).
+ *  @param {Number[]} im 
+ *    - The scratch buffer (imaginary part, 60 points).
+ */
+function ApplyWindowedIMDCT_W75_120(X, y, re, im) {
+    ApplyWindowedIMDCT_W75_120_Part1(X, y, re, im);
+    ApplyWindowedIMDCT_W75_120_Part2(X, y, re, im);
+}
+
+//  Export public APIs.
+module.exports = {
+    "ApplyWindowedMDCT_W75_120": ApplyWindowedMDCT_W75_120,
+    "ApplyWindowedIMDCT_W75_120": ApplyWindowedIMDCT_W75_120
+};
\ No newline at end of file
@@ -0,0 +1,3813 @@
+//
+//  Copyright 2021 - 2023 XiaoJSoft Studio. All rights reserved.
+//  Use of this source code is governed by a BSD-style license that can be
+//  found in the LICENSE.md file.
+//
+
+//
+//  Note(s):
+//    [1] This file is generated automatically by a MDCT compiler, which locates 
+//        at "./../../dev/mdct-generator/" directory.
+//        Do NOT modify this file manually.
+//
+
+//
+//  Private functions.
+//
+
+/**
+ *  Part 1 of ApplyWindowedIMDCT_W10_160_K80().
+ * 
+ *  @param {Number[]} X 
+ *    - The input block (160 points, only the first 80 points are used).
+ *  @param {Number[]} y 
+ *    - The array that would contain the output block (320 points).
+ *  @param {Number[]} re 
+ *    - The scratch buffer (real part, 80 points).
+ *  @param {Number[]} im 
+ *    - The scratch buffer (imaginary part, 80 points).
+ */
+function ApplyWindowedIMDCT_W10_160_K80_Part1(X, y, re, im) {
+    let t0, t1, t10, t11, t12, t13, t14, t2, t3, t4, t5, t6, t7, t8, t9;
+    const C0 = 0.9238795325112867;
+    const C1 = 0.3826834323650898;
+    const C2 = 0.7071067811865476;
+    const C3 = 0.9951847266721969;
+    const C4 = 0.0980171403295606;
+    const C5 = 0.881921264348355;
+    const C6 = 0.47139673682599764;
+    const C7 = 0.773010453362737;
+    const C8 = 0.6343932841636455;
+    const C9 = 0.9569403357322088;
+    const C10 = 0.29028467725446233;
+    const C11 = 1.3065629648763766;
+    const C12 = 0.5411961001461969;
+    const C13 = 0.9807852804032304;
+    const C14 = 0.19509032201612825;
+    const C15 = 0.8314696123025452;
+    const C16 = 0.5555702330196022;
+    const C17 = 0.9510565162951535;
+    const C18 = 0.3090169943749474;
+    const C19 = 0.7604059656000309;
+    const C20 = 0.6494480483301837;
+    const C21 = 0.8910065241883679;
+    const C22 = 0.45399049973954675;
+    const C23 = 0.996917333733128;
+    const C24 = 0.07845909572784494;
+    const C25 = 0.916187957117136;
+    const C26 = 0.40074883310314097;
+    const C27 = 0.7208535967029188;
+    const C28 = 0.6930873625456359;
+    const C29 = 0.9312149347588036;
+    const C30 = 0.36447049987914965;
+    const C31 = 0.9998072404820648;
+    const C32 = 0.0196336924606283;
+    const C33 = 0.8724960070727972;
+    const C34 = 0.4886212414969549;
+    const C35 = 0.785316930880745;
+    const C36 = 0.619093949309834;
+    const C37 = 0.9624552364536473;
+    const C38 = 0.27144044986507426;
+    const C39 = 0.9930684569549263;
+    const C40 = 0.11753739745783764;
+    const C41 = 0.8204014435255136;
+    const C42 = 0.5717879602276122;
+    const C43 = 0.8422172337162865;
+    const C44 = 0.5391383229110002;
+    const C45 = 0.9844265680898916;
+    const C46 = 0.1757962799343545;
+    const C47 = 0.9767658813208724;
+    const C48 = 0.21430915306505077;
+    const C49 = 0.8090169943749475;
+    const C50 = 0.5877852522924731;
+    const C51 = 0.8526401643540922;
+    const C52 = 0.5224985647159488;
+    const C53 = 0.9876883405951378;
+    const C54 = 0.15643446504023087;
+    const C55 = 0.9723699203976766;
+    const C56 = 0.2334453638559054;
+    const C57 = 0.7475083268625968;
+    const C58 = 0.6642524379112817;
+    const C59 = 0.8997482840522215;
+    const C60 = 0.436409240673342;
+    const C61 = 0.9982656101847159;
+    const C62 = 0.05887080365118903;
+    const C63 = 0.944806046466878;
+    const C64 = 0.3276301795616935;
+    const C65 = 0.7343225094356856;
+    const C66 = 0.6788007455329417;
+    const C67 = 0.9381913359224842;
+    const C68 = 0.34611705707749296;
+    const C69 = 0.9992290362407229;
+    const C70 = 0.03925981575906861;
+    const C71 = 0.9081431738250813;
+    const C72 = 0.41865973753742813;
+    const C73 = 0.7973206537727071;
+    const C74 = 0.6035559419535714;
+    const C75 = 0.9675990923602598;
+    const C76 = 0.25249157701515795;
+    const C77 = 0.9905693404435773;
+    const C78 = 0.13701234168196802;
+    const C79 = 0.8627343859777918;
+    const C80 = 0.5056573733779846;
+    const C81 = 0.5590169943749475;
+    const C82 = 0.25;
+    const C83 = 0.9999879521672569;
+    const C84 = 0.00490871880799799;
+    const C85 = 0.9495281805930367;
+    const C86 = 0.3136817403988915;
+    const C87 = 0.806121974950521;
+    const C88 = 0.5917494076903429;
+    const C89 = 0.5838069338177863;
+    const C90 = 0.8118925199965048;
+    const C91 = 0.3043448023808773;
+    const C92 = 0.9525619356575953;
+    const C93 = 0.2855838289290823;
+    const C94 = 0.9583537325300114;
+    const C95 = 0.9996988186962042;
+    const C96 = 0.024541228522912288;
+    const C97 = 0.9431864191771733;
+    const C98 = 0.33226401953829077;
+    const C99 = 0.7943483613828815;
+    const C100 = 0.607462493301711;
+    const C101 = 0.5677539514259605;
+    const C102 = 0.8231983057806959;
+    const C103 = 0.5514820890781694;
+    const C104 = 0.8341867329477124;
+    const C105 = 0.26671275747489837;
+    const C106 = 0.9637760657954398;
+    const C107 = 0.9990242823004072;
+    const C108 = 0.04416427712706736;
+    const C109 = 0.9364810414423427;
+    const C110 = 0.35071820457322317;
+    const C111 = 0.7822685114008164;
+    const C112 = 0.6229413905583339;
+    t0 = X[0];
+    t1 = X[40];
+    t2 = C0 * t1;
+    t1 = (-C1) * t1;
+    t3 = X[79];
+    t4 = 0.7071067811865475 * t3;
+    t3 = C2 * t3;
+    t5 = X[39];
+    t6 = C0 * t5;
+    t5 = C1 * t5;
+    t7 = t0 + t4;
+    t8 = t2 + t6;
+    t9 = t1 + t5;
+    t0 = t0 - t4;
+    t4 = -t3;
+    t2 = t2 - t6;
+    t6 = t1 - t5;
+    t1 = t7 + t8;
+    t5 = t3 + t9;
+    t10 = t0 + t6;
+    t4 = t4 - t2;
+    t7 = t7 - t8;
+    t8 = t3 - t9;
+    t9 = t0 - t6;
+    t0 = t2 - t3;
+    re[0] = t1;
+    im[0] = t5;
+    re[20] = t10;
+    im[20] = t4;
+    re[40] = t7;
+    im[40] = t8;
+    re[60] = t9;
+    im[60] = t0;
+    t6 = X[10];
+    t2 = C3 * t6;
+    t3 = (-C4) * t6;
+    t1 = X[50];
+    t5 = C5 * t1;
+    t10 = (-C6) * t1;
+    t4 = X[69];
+    t7 = C7 * t4;
+    t8 = C8 * t4;
+    t9 = X[29];
+    t0 = C9 * t9;
+    t6 = C10 * t9;
+    t1 = t2 + t7;
+    t4 = t3 + t8;
+    t9 = t5 + t0;
+    t11 = t10 + t6;
+    t2 = t2 - t7;
+    t7 = t3 - t8;
+    t3 = t5 - t0;
+    t8 = t10 - t6;
+    t5 = t1 + t9;
+    t0 = t4 + t11;
+    t10 = t2 + t8;
+    t6 = t7 - t3;
+    t1 = t1 - t9;
+    t9 = t4 - t11;
+    t4 = t2 - t8;
+    t11 = t7 + t3;
+    t2 = t10 + t6;
+    t8 = C0 * t2;
+    t7 = t10 * (-C11);
+    t3 = t6 * C12;
+    t2 = t8 - t3;
+    t10 = t8 + t7;
+    t6 = t1 + t9;
+    t3 = t1 - t9;
+    t8 = C2 * t6;
+    t7 = (-C2) * t3;
+    t1 = t4 + t11;
+    t9 = C1 * t1;
+    t6 = t4 * (-C11);
+    t3 = t11 * (-C12);
+    t1 = t9 - t3;
+    t4 = t9 + t6;
+    re[5] = t5;
+    im[5] = t0;
+    re[25] = t2;
+    im[25] = t10;
+    re[45] = t8;
+    im[45] = t7;
+    re[65] = t1;
+    im[65] = t4;
+    t11 = X[20];
+    t3 = C13 * t11;
+    t9 = (-C14) * t11;
+    t6 = X[60];
+    t5 = C15 * t6;
+    t0 = (-C16) * t6;
+    t2 = X[59];
+    t10 = C15 * t2;
+    t8 = C16 * t2;
+    t7 = X[19];
+    t1 = C13 * t7;
+    t4 = C14 * t7;
+    t11 = t3 + t10;
+    t6 = t9 + t8;
+    t2 = t5 + t1;
+    t7 = t0 + t4;
+    t3 = t3 - t10;
+    t10 = t9 - t8;
+    t9 = t5 - t1;
+    t8 = t0 - t4;
+    t5 = t11 + t2;
+    t1 = t6 + t7;
+    t0 = t3 + t8;
+    t4 = t10 - t9;
+    t11 = t11 - t2;
+    t2 = t6 - t7;
+    t6 = t3 - t8;
+    t7 = t10 + t9;
+    t3 = t0 + t4;
+    t8 = t0 - t4;
+    t10 = C2 * t3;
+    t9 = (-C2) * t8;
+    t0 = -t11;
+    t4 = t6 - t7;
+    t3 = t6 + t7;
+    t8 = (-C2) * t4;
+    t11 = (-C2) * t3;
+    re[10] = t5;
+    im[10] = t1;
+    re[30] = t10;
+    im[30] = t9;
+    re[50] = t2;
+    im[50] = t0;
+    re[70] = t8;
+    im[70] = t11;
+    t6 = X[30];
+    t7 = C9 * t6;
+    t4 = (-C10) * t6;
+    t3 = X[70];
+    t5 = C7 * t3;
+    t1 = (-C8) * t3;
+    t10 = X[49];
+    t9 = C5 * t10;
+    t2 = C6 * t10;
+    t0 = X[9];
+    t8 = C3 * t0;
+    t11 = C4 * t0;
+    t6 = t7 + t9;
+    t3 = t4 + t2;
+    t10 = t5 + t8;
+    t0 = t1 + t11;
+    t7 = t7 - t9;
+    t9 = t4 - t2;
+    t4 = t5 - t8;
+    t2 = t1 - t11;
+    t5 = t6 + t10;
+    t8 = t3 + t0;
+    t1 = t7 + t2;
+    t11 = t9 - t4;
+    t6 = t6 - t10;
+    t10 = t3 - t0;
+    t3 = t7 - t2;
+    t0 = t9 + t4;
+    t7 = t1 + t11;
+    t2 = C1 * t7;
+    t9 = t1 * (-C11);
+    t4 = t11 * (-C12);
+    t7 = t2 - t4;
+    t1 = t2 + t9;
+    t11 = t6 - t10;
+    t4 = t6 + t10;
+    t2 = (-C2) * t11;
+    t9 = (-C2) * t4;
+    t6 = t3 + t0;
+    t10 = (-C0) * t6;
+    t11 = t3 * C11;
+    t4 = t0 * (-C12);
+    t6 = t10 - t4;
+    t3 = t10 + t11;
+    re[15] = t5;
+    im[15] = t8;
+    re[35] = t7;
+    im[35] = t1;
+    re[55] = t2;
+    im[55] = t9;
+    re[75] = t6;
+    im[75] = t3;
+    t0 = re[0];
+    t4 = im[0];
+    t10 = re[5];
+    t11 = im[5];
+    t5 = re[10];
+    t8 = im[10];
+    t7 = re[15];
+    t1 = im[15];
+    t2 = t0 + t5;
+    t9 = t4 + t8;
+    t6 = t10 + t7;
+    t3 = t11 + t1;
+    t0 = t0 - t5;
+    t5 = t4 - t8;
+    t4 = t10 - t7;
+    t8 = t11 - t1;
+    t10 = t2 + t6;
+    t7 = t9 + t3;
+    t11 = t0 + t8;
+    t1 = t5 - t4;
+    t2 = t2 - t6;
+    t6 = t9 - t3;
+    t9 = t0 - t8;
+    t3 = t5 + t4;
+    re[0] = t10;
+    im[0] = t7;
+    re[5] = t11;
+    im[5] = t1;
+    re[10] = t2;
+    im[10] = t6;
+    re[15] = t9;
+    im[15] = t3;
+    t0 = re[20];
+    t8 = im[20];
+    t5 = re[25];
+    t4 = im[25];
+    t10 = re[30];
+    t7 = im[30];
+    t11 = re[35];
+    t1 = im[35];
+    t2 = t0 + t10;
+    t6 = t8 + t7;
+    t9 = t5 + t11;
+    t3 = t4 + t1;
+    t0 = t0 - t10;
+    t10 = t8 - t7;
+    t8 = t5 - t11;
+    t7 = t4 - t1;
+    t5 = t2 + t9;
+    t11 = t6 + t3;
+    t4 = t0 + t7;
+    t1 = t10 - t8;
+    t2 = t2 - t9;
+    t9 = t6 - t3;
+    t6 = t0 - t7;
+    t3 = t10 + t8;
+    re[20] = t5;
+    im[20] = t11;
+    re[25] = t4;
+    im[25] = t1;
+    re[30] = t2;
+    im[30] = t9;
+    re[35] = t6;
+    im[35] = t3;
+    t0 = re[40];
+    t7 = im[40];
+    t10 = re[45];
+    t8 = im[45];
+    t5 = re[50];
+    t11 = im[50];
+    t4 = re[55];
+    t1 = im[55];
+    t2 = t0 + t5;
+    t9 = t7 + t11;
+    t6 = t10 + t4;
+    t3 = t8 + t1;
+    t0 = t0 - t5;
+    t5 = t7 - t11;
+    t7 = t10 - t4;
+    t11 = t8 - t1;
+    t10 = t2 + t6;
+    t4 = t9 + t3;
+    t8 = t0 + t11;
+    t1 = t5 - t7;
+    t2 = t2 - t6;
+    t6 = t9 - t3;
+    t9 = t0 - t11;
+    t3 = t5 + t7;
+    re[40] = t10;
+    im[40] = t4;
+    re[45] = t8;
+    im[45] = t1;
+    re[50] = t2;
+    im[50] = t6;
+    re[55] = t9;
+    im[55] = t3;
+    t0 = re[60];
+    t11 = im[60];
+    t5 = re[65];
+    t7 = im[65];
+    t10 = re[70];
+    t4 = im[70];
+    t8 = re[75];
+    t1 = im[75];
+    t2 = t0 + t10;
+    t6 = t11 + t4;
+    t9 = t5 + t8;
+    t3 = t7 + t1;
+    t0 = t0 - t10;
+    t10 = t11 - t4;
+    t11 = t5 - t8;
+    t4 = t7 - t1;
+    t5 = t2 + t9;
+    t8 = t6 + t3;
+    t7 = t0 + t4;
+    t1 = t10 - t11;
+    t2 = t2 - t9;
+    t9 = t6 - t3;
+    t6 = t0 - t4;
+    t3 = t10 + t11;
+    re[60] = t5;
+    im[60] = t8;
+    re[65] = t7;
+    im[65] = t1;
+    re[70] = t2;
+    im[70] = t9;
+    re[75] = t6;
+    im[75] = t3;
+    t0 = X[32];
+    t4 = C17 * t0;
+    t10 = (-C18) * t0;
+    t11 = X[72];
+    t5 = C19 * t11;
+    t8 = (-C20) * t11;
+    t7 = X[47];
+    t1 = C21 * t7;
+    t2 = C22 * t7;
+    t9 = X[7];
+    t6 = C23 * t9;
+    t3 = C24 * t9;
+    t0 = t4 + t1;
+    t11 = t10 + t2;
+    t7 = t5 + t6;
+    t9 = t8 + t3;
+    t4 = t4 - t1;
+    t1 = t10 - t2;
+    t10 = t5 - t6;
+    t2 = t8 - t3;
+    t5 = t0 + t7;
+    t6 = t11 + t9;
+    t8 = t4 + t2;
+    t3 = t1 - t10;
+    t0 = t0 - t7;
+    t7 = t11 - t9;
+    t11 = t4 - t2;
+    t9 = t1 + t10;
+    re[16] = t5;
+    im[16] = t6;
+    re[36] = t8;
+    im[36] = t3;
+    re[56] = t0;
+    im[56] = t7;
+    re[76] = t11;
+    im[76] = t9;
+    t4 = X[42];
+    t2 = C25 * t4;
+    t1 = (-C26) * t4;
+    t10 = X[77];
+    t5 = C27 * t10;
+    t6 = C28 * t10;
+    t8 = X[37];
+    t3 = C29 * t8;
+    t0 = C30 * t8;
+    t7 = X[2];
+    t11 = C31 * t7;
+    t9 = (-C32) * t7;
+    t4 = t2 + t3;
+    t10 = t1 + t0;
+    t8 = t5 + t11;
+    t7 = t6 + t9;
+    t2 = t2 - t3;
+    t3 = t1 - t0;
+    t1 = t5 - t11;
+    t0 = t6 - t9;
+    t5 = t4 + t8;
+    t11 = t10 + t7;
+    t6 = t2 + t0;
+    t9 = t3 - t1;
+    t4 = t4 - t8;
+    t8 = t10 - t7;
+    t10 = t2 - t0;
+    t7 = t3 + t1;
+    t2 = t6 + t9;
+    t0 = C0 * t2;
+    t3 = t6 * (-C11);
+    t1 = t9 * C12;
+    t2 = t0 - t1;
+    t6 = t0 + t3;
+    t9 = t4 + t8;
+    t1 = t4 - t8;
+    t0 = C2 * t9;
+    t3 = (-C2) * t1;
+    t4 = t10 + t7;
+    t8 = C1 * t4;
+    t9 = t10 * (-C11);
+    t1 = t7 * (-C12);
+    t4 = t8 - t1;
+    t10 = t8 + t9;
+    re[21] = t5;
+    im[21] = t11;
+    re[41] = t2;
+    im[41] = t6;
+    re[61] = t0;
+    im[61] = t3;
+    re[1] = t4;
+    im[1] = t10;
+    t7 = X[52];
+    t1 = C33 * t7;
+    t8 = (-C34) * t7;
+    t9 = X[67];
+    t5 = C35 * t9;
+    t11 = C36 * t9;
+    t2 = X[27];
+    t6 = C37 * t2;
+    t0 = C38 * t2;
+    t3 = X[12];
+    t4 = C39 * t3;
+    t10 = (-C40) * t3;
+    t7 = t1 + t6;
+    t9 = t8 + t0;
+    t2 = t5 + t4;
+    t3 = t11 + t10;
+    t1 = t1 - t6;
+    t6 = t8 - t0;
+    t8 = t5 - t4;
+    t0 = t11 - t10;
+    t5 = t7 + t2;
+    t4 = t9 + t3;
+    t11 = t1 + t0;
+    t10 = t6 - t8;
+    t7 = t7 - t2;
+    t2 = t9 - t3;
+    t9 = t1 - t0;
+    t3 = t6 + t8;
+    t1 = t11 + t10;
+    t0 = t11 - t10;
+    t6 = C2 * t1;
+    t8 = (-C2) * t0;
+    t11 = -t7;
+    t10 = t9 - t3;
+    t1 = t9 + t3;
+    t0 = (-C2) * t10;
+    t7 = (-C2) * t1;
+    re[26] = t5;
+    im[26] = t4;
+    re[46] = t6;
+    im[46] = t8;
+    re[66] = t2;
+    im[66] = t11;
+    re[6] = t0;
+    im[6] = t7;
+    t9 = X[62];
+    t3 = C41 * t9;
+    t10 = (-C42) * t9;
+    t1 = X[57];
+    t5 = C43 * t1;
+    t4 = C44 * t1;
+    t6 = X[17];
+    t8 = C45 * t6;
+    t2 = C46 * t6;
+    t11 = X[22];
+    t0 = C47 * t11;
+    t7 = (-C48) * t11;
+    t9 = t3 + t8;
+    t1 = t10 + t2;
+    t6 = t5 + t0;
+    t11 = t4 + t7;
+    t3 = t3 - t8;
+    t8 = t10 - t2;
+    t10 = t5 - t0;
+    t2 = t4 - t7;
+    t5 = t9 + t6;
+    t0 = t1 + t11;
+    t4 = t3 + t2;
+    t7 = t8 - t10;
+    t9 = t9 - t6;
+    t6 = t1 - t11;
+    t1 = t3 - t2;
+    t11 = t8 + t10;
+    t3 = t4 + t7;
+    t2 = C1 * t3;
+    t8 = t4 * (-C11);
+    t10 = t7 * (-C12);
+    t3 = t2 - t10;
+    t4 = t2 + t8;
+    t7 = t9 - t6;
+    t10 = t9 + t6;
+    t2 = (-C2) * t7;
+    t8 = (-C2) * t10;
+    t9 = t1 + t11;
+    t6 = (-C0) * t9;
+    t7 = t1 * C11;
+    t10 = t11 * (-C12);
+    t9 = t6 - t10;
+    t1 = t6 + t7;
+    re[31] = t5;
+    im[31] = t0;
+    re[51] = t3;
+    im[51] = t4;
+    re[71] = t2;
+    im[71] = t8;
+    re[11] = t9;
+    im[11] = t1;
+    t11 = re[16];
+    t10 = im[16];
+    t6 = re[21];
+    t7 = im[21];
+    t5 = re[26];
+    t0 = im[26];
+    t3 = re[31];
+    t4 = im[31];
+    t2 = t11 + t5;
+    t8 = t10 + t0;
+    t9 = t6 + t3;
+    t1 = t7 + t4;
+    t11 = t11 - t5;
+    t5 = t10 - t0;
+    t10 = t6 - t3;
+    t0 = t7 - t4;
+    t6 = t2 + t9;
+    t3 = t8 + t1;
+    t7 = t11 + t0;
+    t4 = t5 - t10;
+    t2 = t2 - t9;
+    t9 = t8 - t1;
+    t8 = t11 - t0;
+    t1 = t5 + t10;
+    re[16] = t6;
+    im[16] = t3;
+    re[21] = t7;
+    im[21] = t4;
+    re[26] = t2;
+    im[26] = t9;
+    re[31] = t8;
+    im[31] = t1;
+    t11 = re[36];
+    t0 = im[36];
+    t5 = re[41];
+    t10 = im[41];
+    t6 = re[46];
+    t3 = im[46];
+    t7 = re[51];
+    t4 = im[51];
+    t2 = t11 + t6;
+    t9 = t0 + t3;
+    t8 = t5 + t7;
+    t1 = t10 + t4;
+    t11 = t11 - t6;
+    t6 = t0 - t3;
+    t0 = t5 - t7;
+    t3 = t10 - t4;
+    t5 = t2 + t8;
+    t7 = t9 + t1;
+    t10 = t11 + t3;
+    t4 = t6 - t0;
+    t2 = t2 - t8;
+    t8 = t9 - t1;
+    t9 = t11 - t3;
+    t1 = t6 + t0;
+    re[36] = t5;
+    im[36] = t7;
+    re[41] = t10;
+    im[41] = t4;
+    re[46] = t2;
+    im[46] = t8;
+    re[51] = t9;
+    im[51] = t1;
+    t11 = re[56];
+    t3 = im[56];
+    t6 = re[61];
+    t0 = im[61];
+    t5 = re[66];
+    t7 = im[66];
+    t10 = re[71];
+    t4 = im[71];
+    t2 = t11 + t5;
+    t8 = t3 + t7;
+    t9 = t6 + t10;
+    t1 = t0 + t4;
+    t11 = t11 - t5;
+    t5 = t3 - t7;
+    t3 = t6 - t10;
+    t7 = t0 - t4;
+    t6 = t2 + t9;
+    t10 = t8 + t1;
+    t0 = t11 + t7;
+    t4 = t5 - t3;
+    t2 = t2 - t9;
+    t9 = t8 - t1;
+    t8 = t11 - t7;
+    t1 = t5 + t3;
+    re[56] = t6;
+    im[56] = t10;
+    re[61] = t0;
+    im[61] = t4;
+    re[66] = t2;
+    im[66] = t9;
+    re[71] = t8;
+    im[71] = t1;
+    t11 = re[76];
+    t7 = im[76];
+    t5 = re[1];
+    t3 = im[1];
+    t6 = re[6];
+    t10 = im[6];
+    t0 = re[11];
+    t4 = im[11];
+    t2 = t11 + t6;
+    t9 = t7 + t10;
+    t8 = t5 + t0;
+    t1 = t3 + t4;
+    t11 = t11 - t6;
+    t6 = t7 - t10;
+    t7 = t5 - t0;
+    t10 = t3 - t4;
+    t5 = t2 + t8;
+    t0 = t9 + t1;
+    t3 = t11 + t10;
+    t4 = t6 - t7;
+    t2 = t2 - t8;
+    t8 = t9 - t1;
+    t9 = t11 - t10;
+    t1 = t6 + t7;
+    re[76] = t5;
+    im[76] = t0;
+    re[1] = t3;
+    im[1] = t4;
+    re[6] = t2;
+    im[6] = t8;
+    re[11] = t9;
+    im[11] = t1;
+    t11 = X[64];
+    t10 = C49 * t11;
+    t6 = (-C50) * t11;
+    t7 = X[55];
+    t5 = C51 * t7;
+    t0 = C52 * t7;
+    t3 = X[15];
+    t4 = C53 * t3;
+    t2 = C54 * t3;
+    t8 = X[24];
+    t9 = C55 * t8;
+    t1 = (-C56) * t8;
+    t11 = t10 + t4;
+    t7 = t6 + t2;
+    t3 = t5 + t9;
+    t8 = t0 + t1;
+    t10 = t10 - t4;
+    t4 = t6 - t2;
+    t6 = t5 - t9;
+    t2 = t0 - t1;
+    t5 = t11 + t3;
+    t9 = t7 + t8;
+    t0 = t10 + t2;
+    t1 = t4 - t6;
+    t11 = t11 - t3;
+    t3 = t7 - t8;
+    t7 = t10 - t2;
+    t8 = t4 + t6;
+    re[32] = t5;
+    im[32] = t9;
+    re[52] = t0;
+    im[52] = t1;
+    re[72] = t11;
+    im[72] = t3;
+    re[12] = t7;
+    im[12] = t8;
+    t10 = X[74];
+    t2 = C57 * t10;
+    t4 = (-C58) * t10;
+    t6 = X[45];
+    t5 = C59 * t6;
+    t9 = C60 * t6;
+    t0 = X[5];
+    t1 = C61 * t0;
+    t11 = C62 * t0;
+    t3 = X[34];
+    t7 = C63 * t3;
+    t8 = (-C64) * t3;
+    t10 = t2 + t1;
+    t6 = t4 + t11;
+    t0 = t5 + t7;
+    t3 = t9 + t8;
+    t2 = t2 - t1;
+    t1 = t4 - t11;
+    t4 = t5 - t7;
+    t11 = t9 - t8;
+    t5 = t10 + t0;
+    t7 = t6 + t3;
+    t9 = t2 + t11;
+    t8 = t1 - t4;
+    t10 = t10 - t0;
+    t0 = t6 - t3;
+    t6 = t2 - t11;
+    t3 = t1 + t4;
+    t2 = t9 + t8;
+    t11 = C0 * t2;
+    t1 = t9 * (-C11);
+    t4 = t8 * C12;
+    t2 = t11 - t4;
+    t9 = t11 + t1;
+    t8 = t10 + t0;
+    t4 = t10 - t0;
+    t11 = C2 * t8;
+    t1 = (-C2) * t4;
+    t10 = t6 + t3;
+    t0 = C1 * t10;
+    t8 = t6 * (-C11);
+    t4 = t3 * (-C12);
+    t10 = t0 - t4;
+    t6 = t0 + t8;
+    re[37] = t5;
+    im[37] = t7;
+    re[57] = t2;
+    im[57] = t9;
+    re[77] = t11;
+    im[77] = t1;
+    re[17] = t10;
+    im[17] = t6;
+    t3 = X[75];
+    t4 = C65 * t3;
+    t0 = C66 * t3;
+    t8 = X[35];
+    t5 = C67 * t8;
+    t7 = C68 * t8;
+    t2 = X[4];
+    t9 = C69 * t2;
+    t11 = (-C70) * t2;
+    t1 = X[44];
+    t10 = C71 * t1;
+    t6 = (-C72) * t1;
+    t3 = t4 + t9;
+    t8 = t0 + t11;
+    t2 = t5 + t10;
+    t1 = t7 + t6;
+    t4 = t4 - t9;
+    t9 = t0 - t11;
+    t0 = t5 - t10;
+    t11 = t7 - t6;
+    t5 = t3 + t2;
+    t10 = t8 + t1;
+    t7 = t4 + t11;
+    t6 = t9 - t0;
+    t3 = t3 - t2;
+    t2 = t8 - t1;
+    t8 = t4 - t11;
+    t1 = t9 + t0;
+    t4 = t7 + t6;
+    t11 = t7 - t6;
+    t9 = C2 * t4;
+    t0 = (-C2) * t11;
+    t7 = -t3;
+    t6 = t8 - t1;
+    t4 = t8 + t1;
+    t11 = (-C2) * t6;
+    t3 = (-C2) * t4;
+    re[42] = t5;
+    im[42] = t10;
+    re[62] = t9;
+    im[62] = t0;
+    re[2] = t2;
+    im[2] = t7;
+    re[22] = t11;
+    im[22] = t3;
+    t8 = X[65];
+    t1 = C73 * t8;
+    t6 = C74 * t8;
+    t4 = X[25];
+    t5 = C75 * t4;
+    t10 = C76 * t4;
+    t9 = X[14];
+    t0 = C77 * t9;
+    t2 = (-C78) * t9;
+    t7 = X[54];
+    t11 = C79 * t7;
+    t3 = (-C80) * t7;
+    t8 = t1 + t0;
+    t4 = t6 + t2;
+    t9 = t5 + t11;
+    t7 = t10 + t3;
+    t1 = t1 - t0;
+    t0 = t6 - t2;
+    t6 = t5 - t11;
+    t2 = t10 - t3;
+    t5 = t8 + t9;
+    t11 = t4 + t7;
+    t10 = t1 + t2;
+    t3 = t0 - t6;
+    t8 = t8 - t9;
+    t9 = t4 - t7;
+    t4 = t1 - t2;
+    t7 = t0 + t6;
+    t1 = t10 + t3;
+    t2 = C1 * t1;
+    t0 = t10 * (-C11);
+    t6 = t3 * (-C12);
+    t1 = t2 - t6;
+    t10 = t2 + t0;
+    t3 = t8 - t9;
+    t6 = t8 + t9;
+    t2 = (-C2) * t3;
+    t0 = (-C2) * t6;
+    t8 = t4 + t7;
+    t9 = (-C0) * t8;
+    t3 = t4 * C11;
+    t6 = t7 * (-C12);
+    t8 = t9 - t6;
+    t4 = t9 + t3;
+    re[47] = t5;
+    im[47] = t11;
+    re[67] = t1;
+    im[67] = t10;
+    re[7] = t2;
+    im[7] = t0;
+    re[27] = t8;
+    im[27] = t4;
+    t7 = re[32];
+    t6 = im[32];
+    t9 = re[37];
+    t3 = im[37];
+    t5 = re[42];
+    t11 = im[42];
+    t1 = re[47];
+    t10 = im[47];
+    t2 = t7 + t5;
+    t0 = t6 + t11;
+    t8 = t9 + t1;
+    t4 = t3 + t10;
+    t7 = t7 - t5;
+    t5 = t6 - t11;
+    t6 = t9 - t1;
+    t11 = t3 - t10;
+    t9 = t2 + t8;
+    t1 = t0 + t4;
+    t3 = t7 + t11;
+    t10 = t5 - t6;
+    t2 = t2 - t8;
+    t8 = t0 - t4;
+    t0 = t7 - t11;
+    t4 = t5 + t6;
+    re[32] = t9;
+    im[32] = t1;
+    re[37] = t3;
+    im[37] = t10;
+    re[42] = t2;
+    im[42] = t8;
+    re[47] = t0;
+    im[47] = t4;
+    t7 = re[52];
+    t11 = im[52];
+    t5 = re[57];
+    t6 = im[57];
+    t9 = re[62];
+    t1 = im[62];
+    t3 = re[67];
+    t10 = im[67];
+    t2 = t7 + t9;
+    t8 = t11 + t1;
+    t0 = t5 + t3;
+    t4 = t6 + t10;
+    t7 = t7 - t9;
+    t9 = t11 - t1;
+    t11 = t5 - t3;
+    t1 = t6 - t10;
+    t5 = t2 + t0;
+    t3 = t8 + t4;
+    t6 = t7 + t1;
+    t10 = t9 - t11;
+    t2 = t2 - t0;
+    t0 = t8 - t4;
+    t8 = t7 - t1;
+    t4 = t9 + t11;
+    re[52] = t5;
+    im[52] = t3;
+    re[57] = t6;
+    im[57] = t10;
+    re[62] = t2;
+    im[62] = t0;
+    re[67] = t8;
+    im[67] = t4;
+    t7 = re[72];
+    t1 = im[72];
+    t9 = re[77];
+    t11 = im[77];
+    t5 = re[2];
+    t3 = im[2];
+    t6 = re[7];
+    t10 = im[7];
+    t2 = t7 + t5;
+    t0 = t1 + t3;
+    t8 = t9 + t6;
+    t4 = t11 + t10;
+    t7 = t7 - t5;
+    t5 = t1 - t3;
+    t1 = t9 - t6;
+    t3 = t11 - t10;
+    t9 = t2 + t8;
+    t6 = t0 + t4;
+    t11 = t7 + t3;
+    t10 = t5 - t1;
+    t2 = t2 - t8;
+    t8 = t0 - t4;
+    t0 = t7 - t3;
+    t4 = t5 + t1;
+    re[72] = t9;
+    im[72] = t6;
+    re[77] = t11;
+    im[77] = t10;
+    re[2] = t2;
+    im[2] = t8;
+    re[7] = t0;
+    im[7] = t4;
+    t7 = re[12];
+    t3 = im[12];
+    t5 = re[17];
+    t1 = im[17];
+    t9 = re[22];
+    t6 = im[22];
+    t11 = re[27];
+    t10 = im[27];
+    t2 = t7 + t9;
+    t8 = t3 + t6;
+    t0 = t5 + t11;
+    t4 = t1 + t10;
+    t7 = t7 - t9;
+    t9 = t3 - t6;
+    t3 = t5 - t11;
+    t6 = t1 - t10;
+    t5 = t2 + t0;
+    t11 = t8 + t4;
+    t1 = t7 + t6;
+    t10 = t9 - t3;
+    t2 = t2 - t0;
+    t0 = t8 - t4;
+    t8 = t7 - t6;
+    t4 = t9 + t3;
+    re[12] = t5;
+    im[12] = t11;
+    re[17] = t1;
+    im[17] = t10;
+    re[22] = t2;
+    im[22] = t0;
+    re[27] = t8;
+    im[27] = t4;
+    t7 = X[63];
+    t6 = C49 * t7;
+    t9 = C50 * t7;
+    t3 = X[23];
+    t5 = C55 * t3;
+    t11 = C56 * t3;
+    t1 = X[16];
+    t10 = C53 * t1;
+    t2 = (-C54) * t1;
+    t0 = X[56];
+    t8 = C51 * t0;
+    t4 = (-C52) * t0;
+    t7 = t6 + t10;
+    t3 = t9 + t2;
+    t1 = t5 + t8;
+    t0 = t11 + t4;
+    t6 = t6 - t10;
+    t10 = t9 - t2;
+    t9 = t5 - t8;
+    t2 = t11 - t4;
+    t5 = t7 + t1;
+    t8 = t3 + t0;
+    t11 = t6 + t2;
+    t4 = t10 - t9;
+    t7 = t7 - t1;
+    t1 = t3 - t0;
+    t3 = t6 - t2;
+    t0 = t10 + t9;
+    re[48] = t5;
+    im[48] = t8;
+    re[68] = t11;
+    im[68] = t4;
+    re[8] = t7;
+    im[8] = t1;
+    re[28] = t3;
+    im[28] = t0;
+    t6 = X[53];
+    t2 = C79 * t6;
+    t10 = C80 * t6;
+    t9 = X[13];
+    t5 = C77 * t9;
+    t8 = C78 * t9;
+    t11 = X[26];
+    t4 = C75 * t11;
+    t7 = (-C76) * t11;
+    t1 = X[66];
+    t3 = C73 * t1;
+    t0 = (-C74) * t1;
+    t6 = t2 + t4;
+    t9 = t10 + t7;
+    t11 = t5 + t3;
+    t1 = t8 + t0;
+    t2 = t2 - t4;
+    t4 = t10 - t7;
+    t10 = t5 - t3;
+    t7 = t8 - t0;
+    t5 = t6 + t11;
+    t3 = t9 + t1;
+    t8 = t2 + t7;
+    t0 = t4 - t10;
+    t6 = t6 - t11;
+    t11 = t9 - t1;
+    t9 = t2 - t7;
+    t1 = t4 + t10;
+    t2 = t8 + t0;
+    t7 = C0 * t2;
+    t4 = t8 * (-C11);
+    t10 = t0 * C12;
+    t2 = t7 - t10;
+    t8 = t7 + t4;
+    t0 = t6 + t11;
+    t10 = t6 - t11;
+    t7 = C2 * t0;
+    t4 = (-C2) * t10;
+    t6 = t9 + t1;
+    t11 = C1 * t6;
+    t0 = t9 * (-C11);
+    t10 = t1 * (-C12);
+    t6 = t11 - t10;
+    t9 = t11 + t0;
+    re[53] = t5;
+    im[53] = t3;
+    re[73] = t2;
+    im[73] = t8;
+    re[13] = t7;
+    im[13] = t4;
+    re[33] = t6;
+    im[33] = t9;
+    t1 = X[43];
+    t10 = C71 * t1;
+    t11 = C72 * t1;
+    t0 = X[3];
+    t5 = C69 * t0;
+    t3 = C70 * t0;
+    t2 = X[36];
+    t8 = C67 * t2;
+    t7 = (-C68) * t2;
+    t4 = X[76];
+    t6 = C65 * t4;
+    t9 = (-C66) * t4;
+    t1 = t10 + t8;
+    t0 = t11 + t7;
+    t2 = t5 + t6;
+    t4 = t3 + t9;
+    t10 = t10 - t8;
+    t8 = t11 - t7;
+    t11 = t5 - t6;
+    t7 = t3 - t9;
+    t5 = t1 + t2;
+    t6 = t0 + t4;
+    t3 = t10 + t7;
+    t9 = t8 - t11;
+    t1 = t1 - t2;
+    t2 = t0 - t4;
+    t0 = t10 - t7;
+    t4 = t8 + t11;
+    t10 = t3 + t9;
+    t7 = t3 - t9;
+    t8 = C2 * t10;
+    t11 = (-C2) * t7;
+    t3 = -t1;
+    t9 = t0 - t4;
+    t10 = t0 + t4;
+    t7 = (-C2) * t9;
+    t1 = (-C2) * t10;
+    re[58] = t5;
+    im[58] = t6;
+    re[78] = t8;
+    im[78] = t11;
+    re[18] = t2;
+    im[18] = t3;
+    re[38] = t7;
+    im[38] = t1;
+    t0 = X[33];
+    t4 = C63 * t0;
+    t9 = C64 * t0;
+    t10 = X[6];
+    t5 = C61 * t10;
+    t6 = (-C62) * t10;
+    t8 = X[46];
+    t11 = C59 * t8;
+    t2 = (-C60) * t8;
+    t3 = X[73];
+    t7 = C57 * t3;
+    t1 = C58 * t3;
+    t0 = t4 + t11;
+    t10 = t9 + t2;
+    t8 = t5 + t7;
+    t3 = t6 + t1;
+    t4 = t4 - t11;
+    t11 = t9 - t2;
+    t9 = t5 - t7;
+    t2 = t6 - t1;
+    t5 = t0 + t8;
+    t7 = t10 + t3;
+    t6 = t4 + t2;
+    t1 = t11 - t9;
+    t0 = t0 - t8;
+    t8 = t10 - t3;
+    t10 = t4 - t2;
+    t3 = t11 + t9;
+    t4 = t6 + t1;
+    t2 = C1 * t4;
+    t11 = t6 * (-C11);
+    t9 = t1 * (-C12);
+    t4 = t2 - t9;
+    t6 = t2 + t11;
+    t1 = t0 - t8;
+    t9 = t0 + t8;
+    t2 = (-C2) * t1;
+    t11 = (-C2) * t9;
+    t0 = t10 + t3;
+    t8 = (-C0) * t0;
+    t1 = t10 * C11;
+    t9 = t3 * (-C12);
+    t0 = t8 - t9;
+    t10 = t8 + t1;
+    re[63] = t5;
+    im[63] = t7;
+    re[3] = t4;
+    im[3] = t6;
+    re[23] = t2;
+    im[23] = t11;
+    re[43] = t0;
+    im[43] = t10;
+    t3 = re[48];
+    t9 = im[48];
+    t8 = re[53];
+    t1 = im[53];
+    t5 = re[58];
+    t7 = im[58];
+    t4 = re[63];
+    t6 = im[63];
+    t2 = t3 + t5;
+    t11 = t9 + t7;
+    t0 = t8 + t4;
+    t10 = t1 + t6;
+    t3 = t3 - t5;
+    t5 = t9 - t7;
+    t9 = t8 - t4;
+    t7 = t1 - t6;
+    t8 = t2 + t0;
+    t4 = t11 + t10;
+    t1 = t3 + t7;
+    t6 = t5 - t9;
+    t2 = t2 - t0;
+    t0 = t11 - t10;
+    t11 = t3 - t7;
+    t10 = t5 + t9;
+    re[48] = t8;
+    im[48] = t4;
+    re[53] = t1;
+    im[53] = t6;
+    re[58] = t2;
+    im[58] = t0;
+    re[63] = t11;
+    im[63] = t10;
+    t3 = re[68];
+    t7 = im[68];
+    t5 = re[73];
+    t9 = im[73];
+    t8 = re[78];
+    t4 = im[78];
+    t1 = re[3];
+    t6 = im[3];
+    t2 = t3 + t8;
+    t0 = t7 + t4;
+    t11 = t5 + t1;
+    t10 = t9 + t6;
+    t3 = t3 - t8;
+    t8 = t7 - t4;
+    t7 = t5 - t1;
+    t4 = t9 - t6;
+    t5 = t2 + t11;
+    t1 = t0 + t10;
+    t9 = t3 + t4;
+    t6 = t8 - t7;
+    t2 = t2 - t11;
+    t11 = t0 - t10;
+    t0 = t3 - t4;
+    t10 = t8 + t7;
+    re[68] = t5;
+    im[68] = t1;
+    re[73] = t9;
+    im[73] = t6;
+    re[78] = t2;
+    im[78] = t11;
+    re[3] = t0;
+    im[3] = t10;
+    t3 = re[8];
+    t4 = im[8];
+    t8 = re[13];
+    t7 = im[13];
+    t5 = re[18];
+    t1 = im[18];
+    t9 = re[23];
+    t6 = im[23];
+    t2 = t3 + t5;
+    t11 = t4 + t1;
+    t0 = t8 + t9;
+    t10 = t7 + t6;
+    t3 = t3 - t5;
+    t5 = t4 - t1;
+    t4 = t8 - t9;
+    t1 = t7 - t6;
+    t8 = t2 + t0;
+    t9 = t11 + t10;
+    t7 = t3 + t1;
+    t6 = t5 - t4;
+    t2 = t2 - t0;
+    t0 = t11 - t10;
+    t11 = t3 - t1;
+    t10 = t5 + t4;
+    re[8] = t8;
+    im[8] = t9;
+    re[13] = t7;
+    im[13] = t6;
+    re[18] = t2;
+    im[18] = t0;
+    re[23] = t11;
+    im[23] = t10;
+    t3 = re[28];
+    t1 = im[28];
+    t5 = re[33];
+    t4 = im[33];
+    t8 = re[38];
+    t9 = im[38];
+    t7 = re[43];
+    t6 = im[43];
+    t2 = t3 + t8;
+    t0 = t1 + t9;
+    t11 = t5 + t7;
+    t10 = t4 + t6;
+    t3 = t3 - t8;
+    t8 = t1 - t9;
+    t1 = t5 - t7;
+    t9 = t4 - t6;
+    t5 = t2 + t11;
+    t7 = t0 + t10;
+    t4 = t3 + t9;
+    t6 = t8 - t1;
+    t2 = t2 - t11;
+    t11 = t0 - t10;
+    t0 = t3 - t9;
+    t10 = t8 + t1;
+    re[28] = t5;
+    im[28] = t7;
+    re[33] = t4;
+    im[33] = t6;
+    re[38] = t2;
+    im[38] = t11;
+    re[43] = t0;
+    im[43] = t10;
+    t3 = X[31];
+    t9 = C17 * t3;
+    t8 = C18 * t3;
+    t1 = X[8];
+    t5 = C23 * t1;
+    t7 = (-C24) * t1;
+    t4 = X[48];
+    t6 = C21 * t4;
+    t2 = (-C22) * t4;
+    t11 = X[71];
+    t0 = C19 * t11;
+    t10 = C20 * t11;
+    t3 = t9 + t6;
+    t1 = t8 + t2;
+    t4 = t5 + t0;
+    t11 = t7 + t10;
+    t9 = t9 - t6;
+    t6 = t8 - t2;
+    t8 = t5 - t0;
+    t2 = t7 - t10;
+    t5 = t3 + t4;
+    t0 = t1 + t11;
+    t7 = t9 + t2;
+    t10 = t6 - t8;
+    t3 = t3 - t4;
+    t4 = t1 - t11;
+    t1 = t9 - t2;
+    t11 = t6 + t8;
+    re[64] = t5;
+    im[64] = t0;
+    re[4] = t7;
+    im[4] = t10;
+    re[24] = t3;
+    im[24] = t4;
+    re[44] = t1;
+    im[44] = t11;
+    t9 = X[21];
+    t2 = C47 * t9;
+    t6 = C48 * t9;
+    t8 = X[18];
+    t5 = C45 * t8;
+    t0 = (-C46) * t8;
+    t7 = X[58];
+    t10 = C43 * t7;
+    t3 = (-C44) * t7;
+    t4 = X[61];
+    t1 = C41 * t4;
+    t11 = C42 * t4;
+    t9 = t2 + t10;
+    t8 = t6 + t3;
+    t7 = t5 + t1;
+    t4 = t0 + t11;
+    t2 = t2 - t10;
+    t10 = t6 - t3;
+    t6 = t5 - t1;
+    t3 = t0 - t11;
+    t5 = t9 + t7;
+    t1 = t8 + t4;
+    t0 = t2 + t3;
+    t11 = t10 - t6;
+    t9 = t9 - t7;
+    t7 = t8 - t4;
+    t8 = t2 - t3;
+    t4 = t10 + t6;
+    t2 = t0 + t11;
+    t3 = C0 * t2;
+    t10 = t0 * (-C11);
+    t6 = t11 * C12;
+    t2 = t3 - t6;
+    t0 = t3 + t10;
+    t11 = t9 + t7;
+    t6 = t9 - t7;
+    t3 = C2 * t11;
+    t10 = (-C2) * t6;
+    t9 = t8 + t4;
+    t7 = C1 * t9;
+    t11 = t8 * (-C11);
+    t6 = t4 * (-C12);
+    t9 = t7 - t6;
+    t8 = t7 + t11;
+    re[69] = t5;
+    im[69] = t1;
+    re[9] = t2;
+    im[9] = t0;
+    re[29] = t3;
+    im[29] = t10;
+    re[49] = t9;
+    im[49] = t8;
+    t4 = X[11];
+    t6 = C39 * t4;
+    t7 = C40 * t4;
+    t11 = X[28];
+    t5 = C37 * t11;
+    t1 = (-C38) * t11;
+    t2 = X[68];
+    t0 = C35 * t2;
+    t3 = (-C36) * t2;
+    t10 = X[51];
+    t9 = C33 * t10;
+    t8 = C34 * t10;
+    t4 = t6 + t0;
+    t11 = t7 + t3;
+    t2 = t5 + t9;
+    t10 = t1 + t8;
+    t6 = t6 - t0;
+    t0 = t7 - t3;
+    t7 = t5 - t9;
+    t3 = t1 - t8;
+    t5 = t4 + t2;
+    t9 = t11 + t10;
+    t1 = t6 + t3;
+    t8 = t0 - t7;
+    t4 = t4 - t2;
+    t2 = t11 - t10;
+    t11 = t6 - t3;
+    t10 = t0 + t7;
+    t6 = t1 + t8;
+    t3 = t1 - t8;
+    t0 = C2 * t6;
+    t7 = (-C2) * t3;
+    t1 = -t4;
+    t8 = t11 - t10;
+    t6 = t11 + t10;
+    t3 = (-C2) * t8;
+    t4 = (-C2) * t6;
+    re[74] = t5;
+    im[74] = t9;
+    re[14] = t0;
+    im[14] = t7;
+    re[34] = t2;
+    im[34] = t1;
+    re[54] = t3;
+    im[54] = t4;
+    t11 = X[1];
+    t10 = C31 * t11;
+    t8 = C32 * t11;
+    t6 = X[38];
+    t5 = C29 * t6;
+    t9 = (-C30) * t6;
+    t0 = X[78];
+    t7 = C27 * t0;
+    t2 = (-C28) * t0;
+    t1 = X[41];
+    t3 = C25 * t1;
+    t4 = C26 * t1;
+    t11 = t10 + t7;
+    t6 = t8 + t2;
+    t0 = t5 + t3;
+    t1 = t9 + t4;
+    t10 = t10 - t7;
+    t7 = t8 - t2;
+    t8 = t5 - t3;
+    t2 = t9 - t4;
+    t5 = t11 + t0;
+    t3 = t6 + t1;
+    t9 = t10 + t2;
+    t4 = t7 - t8;
+    t11 = t11 - t0;
+    t0 = t6 - t1;
+    t6 = t10 - t2;
+    t1 = t7 + t8;
+    t10 = t9 + t4;
+    t2 = C1 * t10;
+    t7 = t9 * (-C11);
+    t8 = t4 * (-C12);
+    t10 = t2 - t8;
+    t9 = t2 + t7;
+    t4 = t11 - t0;
+    t8 = t11 + t0;
+    t2 = (-C2) * t4;
+    t7 = (-C2) * t8;
+    t11 = t6 + t1;
+    t0 = (-C0) * t11;
+    t4 = t6 * C11;
+    t8 = t1 * (-C12);
+    t11 = t0 - t8;
+    t6 = t0 + t4;
+    re[79] = t5;
+    im[79] = t3;
+    re[19] = t10;
+    im[19] = t9;
+    re[39] = t2;
+    im[39] = t7;
+    re[59] = t11;
+    im[59] = t6;
+    t1 = re[64];
+    t8 = im[64];
+    t0 = re[69];
+    t4 = im[69];
+    t5 = re[74];
+    t3 = im[74];
+    t10 = re[79];
+    t9 = im[79];
+    t2 = t1 + t5;
+    t7 = t8 + t3;
+    t11 = t0 + t10;
+    t6 = t4 + t9;
+    t1 = t1 - t5;
+    t5 = t8 - t3;
+    t8 = t0 - t10;
+    t3 = t4 - t9;
+    t0 = t2 + t11;
+    t10 = t7 + t6;
+    t4 = t1 + t3;
+    t9 = t5 - t8;
+    t2 = t2 - t11;
+    t11 = t7 - t6;
+    t7 = t1 - t3;
+    t6 = t5 + t8;
+    re[64] = t0;
+    im[64] = t10;
+    re[69] = t4;
+    im[69] = t9;
+    re[74] = t2;
+    im[74] = t11;
+    re[79] = t7;
+    im[79] = t6;
+    t1 = re[4];
+    t3 = im[4];
+    t5 = re[9];
+    t8 = im[9];
+    t0 = re[14];
+    t10 = im[14];
+    t4 = re[19];
+    t9 = im[19];
+    t2 = t1 + t0;
+    t11 = t3 + t10;
+    t7 = t5 + t4;
+    t6 = t8 + t9;
+    t1 = t1 - t0;
+    t0 = t3 - t10;
+    t3 = t5 - t4;
+    t10 = t8 - t9;
+    t5 = t2 + t7;
+    t4 = t11 + t6;
+    t8 = t1 + t10;
+    t9 = t0 - t3;
+    t2 = t2 - t7;
+    t7 = t11 - t6;
+    t11 = t1 - t10;
+    t6 = t0 + t3;
+    re[4] = t5;
+    im[4] = t4;
+    re[9] = t8;
+    im[9] = t9;
+    re[14] = t2;
+    im[14] = t7;
+    re[19] = t11;
+    im[19] = t6;
+    t1 = re[24];
+    t10 = im[24];
+    t0 = re[29];
+    t3 = im[29];
+    t5 = re[34];
+    t4 = im[34];
+    t8 = re[39];
+    t9 = im[39];
+    t2 = t1 + t5;
+    t7 = t10 + t4;
+    t11 = t0 + t8;
+    t6 = t3 + t9;
+    t1 = t1 - t5;
+    t5 = t10 - t4;
+    t10 = t0 - t8;
+    t4 = t3 - t9;
+    t0 = t2 + t11;
+    t8 = t7 + t6;
+    t3 = t1 + t4;
+    t9 = t5 - t10;
+    t2 = t2 - t11;
+    t11 = t7 - t6;
+    t7 = t1 - t4;
+    t6 = t5 + t10;
+    re[24] = t0;
+    im[24] = t8;
+    re[29] = t3;
+    im[29] = t9;
+    re[34] = t2;
+    im[34] = t11;
+    re[39] = t7;
+    im[39] = t6;
+    t1 = re[44];
+    t4 = im[44];
+    t5 = re[49];
+    t10 = im[49];
+    t0 = re[54];
+    t8 = im[54];
+    t3 = re[59];
+    t9 = im[59];
+    t2 = t1 + t0;
+    t11 = t4 + t8;
+    t7 = t5 + t3;
+    t6 = t10 + t9;
+    t1 = t1 - t0;
+    t0 = t4 - t8;
+    t4 = t5 - t3;
+    t8 = t10 - t9;
+    t5 = t2 + t7;
+    t3 = t11 + t6;
+    t10 = t1 + t8;
+    t9 = t0 - t4;
+    t2 = t2 - t7;
+    t7 = t11 - t6;
+    t11 = t1 - t8;
+    t6 = t0 + t4;
+    re[44] = t5;
+    im[44] = t3;
+    re[49] = t10;
+    im[49] = t9;
+    re[54] = t2;
+    im[54] = t7;
+    re[59] = t11;
+    im[59] = t6;
+    t1 = re[0];
+    t8 = im[0];
+    t0 = re[16];
+    t4 = im[16];
+    t5 = re[32];
+    t3 = im[32];
+    t10 = re[48];
+    t9 = im[48];
+    t2 = re[64];
+    t7 = im[64];
+    t11 = t0 + t2;
+    t6 = t4 + t7;
+    t12 = t5 + t10;
+    t13 = t3 + t9;
+    t0 = t0 - t2;
+    t2 = t4 - t7;
+    t4 = t5 - t10;
+    t7 = t3 - t9;
+    t5 = t11 + t12;
+    t10 = t6 + t13;
+    t3 = t11 - t12;
+    t9 = C81 * t3;
+    t11 = t6 - t13;
+    t12 = C81 * t11;
+    t3 = C82 * t5;
+    t6 = t1 - t3;
+    t13 = C82 * t10;
+    t11 = t8 - t13;
+    t3 = t6 + t9;
+    t13 = t11 + t12;
+    t6 = t6 - t9;
+    t9 = t11 - t12;
+    t11 = C17 * t0;
+    t12 = C50 * t4;
+    t11 = t11 + t12;
+    t12 = C17 * t2;
+    t14 = C50 * t7;
+    t12 = t12 + t14;
+    t14 = C50 * t0;
+    t0 = C17 * t4;
+    t4 = t14 - t0;
+    t14 = C50 * t2;
+    t0 = C17 * t7;
+    t2 = t14 - t0;
+    t7 = t1 + t5;
+    t14 = t8 + t10;
+    t0 = t3 + t12;
+    t1 = t13 - t11;
+    t5 = t6 + t2;
+    t8 = t9 - t4;
+    t10 = t6 - t2;
+    t6 = t9 + t4;
+    t2 = t3 - t12;
+    t9 = t13 + t11;
+    t4 = (-C83) * t7;
+    t3 = (-C84) * t14;
+    t12 = t4 + t3;
+    t13 = 0.09919868040847561 * t12;
+    y[239] = t13;
+    t11 = 0.09637574106663695 * t12;
+    y[240] = t11;
+    t4 = C84 * t7;
+    t3 = (-C83) * t14;
+    t13 = t4 + t3;
+    t12 = 0.061622714636375496 * t13;
+    y[79] = t12;
+    t11 = (-0.06614065009095606) * t13;
+    y[80] = t11;
+    t7 = (-C85) * t0;
+    t14 = (-C86) * t1;
+    t4 = t7 + t14;
+    t3 = 0.11062374303997037 * t4;
+    y[207] = t3;
+    t12 = (-0.0038847049945580823) * t4;
+    y[272] = t12;
+    t13 = C86 * t0;
+    t11 = (-C85) * t1;
+    t7 = t13 + t11;
+    y[47] = 0;
+    t14 = (-0.11299563417849212) * t7;
+    y[112] = t14;
+    t3 = (-C87) * t5;
+    t4 = (-C88) * t8;
+    t12 = t3 + t4;
+    t0 = 0.11074551322394617 * t12;
+    y[175] = t0;
+    t1 = (-0.004435316851490209) * t12;
+    y[304] = t1;
+    t13 = C88 * t5;
+    t11 = (-C87) * t8;
+    t7 = t13 + t11;
+    y[15] = 0;
+    t14 = (-0.11287138987493683) * t7;
+    y[144] = t14;
+    t3 = C89 * t10;
+    t4 = C90 * t6;
+    t0 = t3 + t4;
+    y[16] = 0;
+    t12 = (-0.11288868495258626) * t0;
+    y[143] = t12;
+    t1 = (-C90) * t10;
+    t5 = C89 * t6;
+    t8 = t1 + t5;
+    t13 = 0.11072854649028864 * t8;
+    y[176] = t13;
+    t11 = (-0.005000628436747556) * t8;
+    y[303] = t11;
+    t7 = C91 * t2;
+    t14 = C92 * t9;
+    t3 = t7 + t14;
+    y[48] = 0;
+    t4 = (-0.11291369101590942) * t3;
+    y[111] = t4;
+    t0 = (-C92) * t2;
+    t12 = C91 * t9;
+    t10 = t0 + t12;
+    t6 = 0.11070402435289058 * t10;
+    y[208] = t6;
+    t1 = (-0.0024726234067729007) * t10;
+    y[271] = t1;
+    t5 = re[20];
+    t13 = im[20];
+    t8 = re[36];
+    t11 = im[36];
+    t7 = re[52];
+    t14 = im[52];
+    t3 = re[68];
+    t4 = im[68];
+    t2 = re[4];
+    t9 = im[4];
+    t0 = t8 + t2;
+    t12 = t11 + t9;
+    t6 = t7 + t3;
+    t10 = t14 + t4;
+    t1 = t8 - t2;
+    t8 = t11 - t9;
+    t2 = t7 - t3;
+    t11 = t14 - t4;
+    t9 = t0 + t6;
+    t7 = t12 + t10;
+    t3 = t0 - t6;
+    t14 = C81 * t3;
+    t4 = t12 - t10;
+    t0 = C81 * t4;
+    t6 = C82 * t9;
+    t3 = t5 - t6;
+    t12 = C82 * t7;
+    t10 = t13 - t12;
+    t4 = t3 + t14;
+    t6 = t10 + t0;
+    t12 = t3 - t14;
+    t3 = t10 - t0;
+    t14 = C17 * t1;
+    t10 = C50 * t2;
+    t0 = t14 + t10;
+    t14 = C17 * t8;
+    t10 = C50 * t11;
+    t14 = t14 + t10;
+    t10 = C50 * t1;
+    t1 = C17 * t2;
+    t2 = t10 - t1;
+    t10 = C50 * t8;
+    t1 = C17 * t11;
+    t8 = t10 - t1;
+    t11 = t5 + t9;
+    t10 = t13 + t7;
+    t1 = t4 + t14;
+    t5 = t6 - t0;
+    t9 = t12 + t8;
+    t13 = t3 - t2;
+    t7 = t12 - t8;
+    t12 = t3 + t2;
+    t8 = t4 - t14;
+    t3 = t6 + t0;
+    t2 = C93 * t11;
+    t4 = C94 * t10;
+    t14 = t2 + t4;
+    y[50] = 0;
+    t6 = (-0.11270166185002709) * t14;
+    y[109] = t6;
+    t0 = (-C94) * t11;
+    t2 = C93 * t10;
+    t4 = t0 + t2;
+    t14 = 0.11091229530079016 * t4;
+    y[210] = t14;
+    t6 = 0.000751061428239977 * t4;
+    y[269] = t6;
+    t11 = (-C95) * t1;
+    t10 = (-C96) * t5;
+    t0 = t11 + t10;
+    t2 = 0.10415562708923899 * t0;
+    y[237] = t2;
+    t14 = 0.09010724756863295 * t0;
+    y[242] = t14;
+    t4 = C96 * t1;
+    t6 = (-C95) * t5;
+    t11 = t4 + t6;
+    t10 = 0.052335362309534304 * t11;
+    y[77] = t10;
+    t2 = (-0.07473628424426193) * t11;
+    y[82] = t2;
+    t0 = (-C97) * t9;
+    t14 = (-C98) * t13;
+    t1 = t0 + t14;
+    t5 = 0.11050400323230107 * t1;
+    y[205] = t5;
+    t4 = (-0.006334395575339451) * t1;
+    y[274] = t4;
+    t6 = C98 * t9;
+    t10 = (-C97) * t13;
+    t11 = t6 + t10;
+    y[45] = 0;
+    t2 = (-0.11311807386491286) * t11;
+    y[114] = t2;
+    t0 = (-C99) * t7;
+    t14 = (-C100) * t12;
+    t5 = t0 + t14;
+    t1 = 0.11079540841354191 * t5;
+    y[173] = t1;
+    t4 = (-0.003377427216706282) * t5;
+    y[306] = t4;
+    t9 = C100 * t7;
+    t13 = (-C99) * t12;
+    t6 = t9 + t13;
+    y[13] = 0;
+    t10 = (-0.11282055979561871) * t6;
+    y[146] = t10;
+    t11 = C101 * t8;
+    t2 = C102 * t3;
+    t0 = t11 + t2;
+    y[18] = 0;
+    t14 = (-0.11291103050200026) * t0;
+    y[141] = t14;
+    t1 = (-C102) * t8;
+    t5 = C101 * t3;
+    t4 = t1 + t5;
+    t7 = 0.11070663286328401 * t4;
+    y[178] = t7;
+    t12 = (-0.006178630133566774) * t4;
+    y[301] = t12;
+    t9 = re[40];
+    t13 = im[40];
+    t6 = re[56];
+    t10 = im[56];
+    t11 = re[72];
+    t2 = im[72];
+    t0 = re[8];
+    t14 = im[8];
+    t8 = re[24];
+    t3 = im[24];
+    t1 = t6 + t8;
+    t5 = t10 + t3;
+    t7 = t11 + t0;
+    t4 = t2 + t14;
+    t12 = t6 - t8;
+    t6 = t10 - t3;
+    t8 = t11 - t0;
+    t10 = t2 - t14;
+    t3 = t1 + t7;
+    t11 = t5 + t4;
+    t0 = t1 - t7;
+    t2 = C81 * t0;
+    t14 = t5 - t4;
+    t1 = C81 * t14;
+    t7 = C82 * t3;
+    t0 = t9 - t7;
+    t5 = C82 * t11;
+    t4 = t13 - t5;
+    t14 = t0 + t2;
+    t7 = t4 + t1;
+    t5 = t0 - t2;
+    t0 = t4 - t1;
+    t2 = C17 * t12;
+    t4 = C50 * t8;
+    t1 = t2 + t4;
+    t2 = C17 * t6;
+    t4 = C50 * t10;
+    t2 = t2 + t4;
+    t4 = C50 * t12;
+    t12 = C17 * t8;
+    t8 = t4 - t12;
+    t4 = C50 * t6;
+    t12 = C17 * t10;
+    t6 = t4 - t12;
+    t10 = t9 + t3;
+    t4 = t13 + t11;
+    t12 = t14 + t2;
+    t9 = t7 - t1;
+    t3 = t5 + t6;
+    t13 = t0 - t8;
+    t11 = t5 - t6;
+    t5 = t0 + t8;
+    t6 = t14 - t2;
+    t0 = t7 + t1;
+    t8 = C103 * t10;
+    t14 = C104 * t4;
+    t2 = t8 + t14;
+    y[20] = 0;
+    t7 = (-0.11292343307449516) * t2;
+    y[139] = t7;
+    t1 = (-C104) * t10;
+    t8 = C103 * t4;
+    t14 = t1 + t8;
+    t2 = 0.11069447376572232 * t14;
+    y[180] = t2;
+    t7 = (-0.007380099337164804) * t14;
+    y[299] = t7;
+    t10 = C105 * t12;
+    t4 = C106 * t9;
+    t1 = t10 + t4;
+    y[52] = 0;
+    t8 = (-0.11241496409707726) * t1;
+    y[107] = t8;
+    t2 = (-C106) * t12;
+    t14 = C105 * t9;
+    t7 = t2 + t14;
+    t10 = 0.11119516071904345 * t7;
+    y[212] = t10;
+    t4 = 0.00453933702315795 * t7;
+    y[267] = t4;
+    t1 = (-C107) * t3;
+    t8 = (-C108) * t13;
+    t12 = t1 + t8;
+    t9 = 0.10814034736032908 * t12;
+    y[235] = t9;
+    t2 = 0.08312519782022552 * t12;
+    y[244] = t2;
+    t14 = C108 * t3;
+    t10 = (-C107) * t13;
+    t7 = t14 + t10;
+    t4 = 0.04299033363724483 * t7;
+    y[75] = t4;
+    t1 = (-0.08254476918132375) * t7;
+    y[84] = t1;
+    t8 = (-C109) * t11;
+    t9 = (-C110) * t5;
+    t12 = t8 + t9;
+    t2 = 0.11043152040769377 * t12;
+    y[203] = t2;
+    t3 = (-0.008316815136059702) * t12;
+    y[276] = t3;
+    t13 = C110 * t11;
+    t14 = (-C109) * t5;
+    t10 = t13 + t14;
+    y[43] = 0;
+    t4 = (-0.11319232003554955) * t10;
+    y[116] = t4;
+    t7 = (-C111) * t6;
+    t1 = (-C112) * t0;
+    t8 = t7 + t1;
+    t9 = 0.11087081251499475 * t8;
+    y[171] = t9;
+    t2 = (-0.0024457786478307856) * t8;
+    y[308] = t2;
+    t12 = C112 * t6;
+    t3 = (-C111) * t0;
+    t11 = t12 + t3;
+    y[11] = 0;
+    t5 = (-0.11274382965588384) * t11;
+    y[148] = t5;
+}
+
+/**
+ *  Part 2 of ApplyWindowedIMDCT_W10_160_K80().
+ * 
+ *  @param {Number[]} X 
+ *    - The input block (160 points, only the first 80 points are used).
+ *  @param {Number[]} y 
+ *    - The array that would contain the output block (320 points).
+ *  @param {Number[]} re 
+ *    - The scratch buffer (real part, 80 points).
+ *  @param {Number[]} im 
+ *    - The scratch buffer (imaginary part, 80 points).
+ */
+function ApplyWindowedIMDCT_W10_160_K80_Part2(X, y, re, im) {
+    let t0, t1, t10, t11, t12, t13, t14, t2, t3, t4, t5, t6, t7, t8, t9;
+    const C0 = 0.5590169943749475;
+    const C1 = 0.25;
+    const C2 = 0.9510565162951535;
+    const C3 = 0.5877852522924731;
+    const C4 = 0.7698870820164444;
+    const C5 = 0.6381801320506653;
+    const C6 = 0.5349976198870972;
+    const C7 = 0.8448535652497071;
+    const C8 = 0.2477388631755984;
+    const C9 = 0.968826845041188;
+    const C10 = 0.9979646030264866;
+    const C11 = 0.0637702995616845;
+    const C12 = 0.9294146324393044;
+    const C13 = 0.36903718106406647;
+    const C14 = 0.9219899164032446;
+    const C15 = 0.38721388669666557;
+    const C16 = 0.7572088465064846;
+    const C17 = 0.6531728429537768;
+    const C18 = 0.5183068989294132;
+    const C19 = 0.8551946904197751;
+    const C20 = 0.22866946082861941;
+    const C21 = 0.9735041230957107;
+    const C22 = 0.9965201894009746;
+    const C23 = 0.08335173733189745;
+    const C24 = 0.9946915982728195;
+    const C25 = 0.1029010414206961;
+    const C26 = 0.9142097557035307;
+    const C27 = 0.40524131400498986;
+    const C28 = 0.744238692572067;
+    const C29 = 0.6679137432922161;
+    const C30 = 0.501416360795769;
+    const C31 = 0.8652061217573113;
+    const C32 = 0.20951190205156878;
+    const C33 = 0.9778060967792817;
+    const C34 = 0.1902735724480359;
+    const C35 = 0.9817311075991542;
+    const C36 = 0.99247953459871;
+    const C37 = 0.1224106751992162;
+    const C38 = 0.9060771497402148;
+    const C39 = 0.42311251307264414;
+    const C40 = 0.7309816204544317;
+    const C41 = 0.6823971501682968;
+    const C42 = 0.4843325171101413;
+    const C43 = 0.8748839996649582;
+    const C44 = 0.4670619540194766;
+    const C45 = 0.8842245931365562;
+    const C46 = 0.17096188876030122;
+    const C47 = 0.9852776423889412;
+    const C48 = 0.989884851171301;
+    const C49 = 0.14187311733225325;
+    const C50 = 0.8975952337877069;
+    const C51 = 0.44082059421219394;
+    const C52 = 0.71744274100724;
+    const C53 = 0.6966174799529641;
+    const C54 = 0.7036272737262429;
+    const C55 = 0.7105692504383896;
+    const C56 = 0.44961132965460654;
+    const C57 = 0.8932243011955153;
+    const C58 = 0.15158429601004111;
+    const C59 = 0.98844433389197;
+    const C60 = 0.9869085482904458;
+    const C61 = 0.16128086467788047;
+    const C62 = 0.8887672777860675;
+    const C63 = 0.45835873062127125;
+    const C64 = 0.8795966850803829;
+    const C65 = 0.4757201610144368;
+    const C66 = 0.6895405447370668;
+    const C67 = 0.724247082951467;
+    const C68 = 0.43198737156341177;
+    const C69 = 0.9018796542830616;
+    const C70 = 0.13214826462813015;
+    const C71 = 0.9912299612883853;
+    const C72 = 0.9835517733775615;
+    const C73 = 0.18062643518005275;
+    const C74 = 0.9798158205332763;
+    const C75 = 0.1999023707530817;
+    const C76 = 0.8700869911087115;
+    const C77 = 0.49289819222978404;
+    const C78 = 0.6751879847418903;
+    const C79 = 0.737645704427393;
+    const C80 = 0.4141968741172237;
+    const C81 = 0.9101873155958178;
+    const C82 = 0.1126612875746478;
+    const C83 = 0.9936334506657989;
+    const C84 = 0.0931308774501998;
+    const C85 = 0.9956538754333033;
+    const C86 = 0.9757021300385286;
+    const C87 = 0.2191012401568698;
+    const C88 = 0.8602418620391045;
+    const C89 = 0.5098862018092806;
+    const C90 = 0.660575126925805;
+    const C91 = 0.7507599494425343;
+    const C92 = 0.3962466958914656;
+    const C93 = 0.9181440823722039;
+    const C94 = 0.3781437570215405;
+    const C95 = 0.925746887127164;
+    const C96 = 0.07356456359966743;
+    const C97 = 0.9972904566786902;
+    const C98 = 0.9712122877993118;
+    const C99 = 0.2382156418617946;
+    const C100 = 0.8500650933562288;
+    const C101 = 0.5266776405518521;
+    const C102 = 0.6457076048236673;
+    const C103 = 0.7635847622057964;
+    const C104 = 0.6305911501482637;
+    const C105 = 0.7761151985077279;
+    const C106 = 0.3598950365349881;
+    const C107 = 0.932992798834739;
+    const C108 = 0.05396988920950189;
+    const C109 = 0.9985425634687357;
+    const C110 = 0.9663480247352773;
+    const C111 = 0.2572382069021396;
+    const C112 = 0.8395606083981357;
+    const C113 = 0.5432660350382235;
+    const C114 = 0.8287324568437381;
+    const C115 = 0.559644990126546;
+    const C116 = 0.6152315905806268;
+    const C117 = 0.7883464276266063;
+    const C118 = 0.34150756966093626;
+    const C119 = 0.9398790240580331;
+    const C120 = 0.034354408399682276;
+    const C121 = 0.9994097130924373;
+    const C122 = 0.9611112161124317;
+    const C123 = 0.27616160171697074;
+    const C124 = 0.9555038808201862;
+    const C125 = 0.2949785309773635;
+    const C126 = 0.8175848131515837;
+    const C127 = 0.5758081914178453;
+    const C128 = 0.5996348475233523;
+    const C129 = 0.8002737341907743;
+    const C130 = 0.3229884451178864;
+    const C131 = 0.9464029080261377;
+    const C132 = 0.014725683311458524;
+    const C133 = 0.999891571247108;
+    t13 = re[60];
+    t14 = im[60];
+    t10 = re[76];
+    t4 = im[76];
+    t7 = re[12];
+    t1 = im[12];
+    t9 = re[28];
+    t8 = im[28];
+    t2 = re[44];
+    t6 = im[44];
+    t0 = t10 + t2;
+    t12 = t4 + t6;
+    t3 = t7 + t9;
+    t11 = t1 + t8;
+    t5 = t10 - t2;
+    t10 = t4 - t6;
+    t2 = t7 - t9;
+    t4 = t1 - t8;
+    t6 = t0 + t3;
+    t7 = t12 + t11;
+    t9 = t0 - t3;
+    t1 = C0 * t9;
+    t8 = t12 - t11;
+    t0 = C0 * t8;
+    t3 = C1 * t6;
+    t9 = t13 - t3;
+    t12 = C1 * t7;
+    t11 = t14 - t12;
+    t8 = t9 + t1;
+    t3 = t11 + t0;
+    t12 = t9 - t1;
+    t9 = t11 - t0;
+    t1 = C2 * t5;
+    t11 = C3 * t2;
+    t0 = t1 + t11;
+    t1 = C2 * t10;
+    t11 = C3 * t4;
+    t1 = t1 + t11;
+    t11 = C3 * t5;
+    t5 = C2 * t2;
+    t2 = t11 - t5;
+    t11 = C3 * t10;
+    t5 = C2 * t4;
+    t10 = t11 - t5;
+    t4 = t13 + t6;
+    t11 = t14 + t7;
+    t5 = t8 + t1;
+    t13 = t3 - t0;
+    t6 = t12 + t10;
+    t14 = t9 - t2;
+    t7 = t12 - t10;
+    t12 = t9 + t2;
+    t10 = t8 - t1;
+    t9 = t3 + t0;
+    t2 = (-C4) * t4;
+    t8 = (-C5) * t11;
+    t1 = t2 + t8;
+    t3 = 0.11097479267929677 * t1;
+    y[169] = t3;
+    t0 = (-0.0016653431095281137) * t1;
+    y[310] = t0;
+    t2 = C5 * t4;
+    t8 = (-C4) * t11;
+    t3 = t2 + t8;
+    y[9] = 0;
+    t1 = (-0.11263819195520765) * t3;
+    y[150] = t1;
+    t0 = C6 * t5;
+    t4 = C7 * t13;
+    t11 = t0 + t4;
+    y[22] = 0;
+    t2 = (-0.11293334718913527) * t11;
+    y[137] = t2;
+    t8 = (-C7) * t5;
+    t3 = C6 * t13;
+    t1 = t8 + t3;
+    t0 = 0.11068475619575513 * t1;
+    y[182] = t0;
+    t4 = (-0.008554277310528689) * t1;
+    y[297] = t4;
+    t11 = C8 * t6;
+    t2 = C9 * t14;
+    t5 = t11 + t2;
+    y[54] = 0;
+    t13 = (-0.11203805793071749) * t5;
+    y[105] = t13;
+    t8 = (-C9) * t6;
+    t3 = C8 * t14;
+    t0 = t8 + t3;
+    t1 = 0.11156923130290064 * t0;
+    y[214] = t1;
+    t4 = 0.008925661328443739 * t0;
+    y[265] = t4;
+    t11 = (-C10) * t7;
+    t2 = (-C11) * t12;
+    t5 = t11 + t2;
+    t13 = 0.11113880795092732 * t5;
+    y[233] = t13;
+    t6 = 0.07559758432646857 * t5;
+    y[246] = t6;
+    t14 = C11 * t7;
+    t8 = (-C10) * t12;
+    t3 = t14 + t8;
+    t1 = 0.0339435639090872 * t3;
+    y[73] = t1;
+    t0 = (-0.08938325638176887) * t3;
+    y[86] = t0;
+    t4 = (-C12) * t10;
+    t11 = (-C13) * t9;
+    t2 = t4 + t11;
+    t13 = 0.11039836343485919 * t2;
+    y[201] = t13;
+    t5 = (-0.009868114567417723) * t2;
+    y[278] = t5;
+    t6 = C13 * t10;
+    t7 = (-C12) * t9;
+    t12 = t6 + t7;
+    y[41] = 0;
+    t14 = (-0.11322631614349661) * t12;
+    y[118] = t14;
+    t8 = re[5];
+    t1 = im[5];
+    t3 = re[21];
+    t0 = im[21];
+    t4 = re[37];
+    t11 = im[37];
+    t13 = re[53];
+    t2 = im[53];
+    t5 = re[69];
+    t10 = im[69];
+    t9 = t3 + t5;
+    t6 = t0 + t10;
+    t7 = t4 + t13;
+    t12 = t11 + t2;
+    t14 = t3 - t5;
+    t3 = t0 - t10;
+    t5 = t4 - t13;
+    t0 = t11 - t2;
+    t10 = t9 + t7;
+    t4 = t6 + t12;
+    t13 = t9 - t7;
+    t11 = C0 * t13;
+    t2 = t6 - t12;
+    t9 = C0 * t2;
+    t7 = C1 * t10;
+    t13 = t8 - t7;
+    t6 = C1 * t4;
+    t12 = t1 - t6;
+    t2 = t13 + t11;
+    t7 = t12 + t9;
+    t6 = t13 - t11;
+    t13 = t12 - t9;
+    t11 = C2 * t14;
+    t12 = C3 * t5;
+    t9 = t11 + t12;
+    t11 = C2 * t3;
+    t12 = C3 * t0;
+    t11 = t11 + t12;
+    t12 = C3 * t14;
+    t14 = C2 * t5;
+    t5 = t12 - t14;
+    t12 = C3 * t3;
+    t14 = C2 * t0;
+    t3 = t12 - t14;
+    t0 = t8 + t10;
+    t12 = t1 + t4;
+    t14 = t2 + t11;
+    t8 = t7 - t9;
+    t10 = t6 + t3;
+    t1 = t13 - t5;
+    t4 = t6 - t3;
+    t6 = t13 + t5;
+    t3 = t2 - t11;
+    t13 = t7 + t9;
+    t5 = (-C14) * t0;
+    t2 = (-C15) * t12;
+    t11 = t5 + t2;
+    t7 = 0.1103968791240002 * t11;
+    y[199] = t7;
+    t9 = (-0.011020477312608395) * t11;
+    y[280] = t9;
+    t5 = C15 * t0;
+    t2 = (-C14) * t12;
+    t7 = t5 + t2;
+    y[39] = 0;
+    t11 = (-0.11322783849677243) * t7;
+    y[120] = t11;
+    t9 = (-C16) * t14;
+    t0 = (-C17) * t8;
+    t12 = t9 + t0;
+    t5 = 0.11110787961912116 * t12;
+    y[167] = t5;
+    t2 = (-0.0010489932501280576) * t12;
+    y[312] = t2;
+    t7 = C17 * t14;
+    t11 = (-C16) * t8;
+    t9 = t7 + t11;
+    y[7] = 0;
+    t0 = (-0.11250327198080023) * t9;
+    y[152] = t0;
+    t5 = C18 * t10;
+    t12 = C19 * t1;
+    t2 = t5 + t12;
+    y[24] = 0;
+    t14 = (-0.11294726822480333) * t2;
+    y[135] = t14;
+    t8 = (-C19) * t10;
+    t7 = C18 * t1;
+    t11 = t8 + t7;
+    t9 = 0.11067111402040077 * t11;
+    y[184] = t9;
+    t0 = (-0.009649905136779869) * t11;
+    y[295] = t0;
+    t5 = C20 * t4;
+    t12 = C21 * t6;
+    t2 = t5 + t12;
+    y[56] = 0;
+    t14 = (-0.11155296145740505) * t2;
+    y[103] = t14;
+    t10 = (-C21) * t4;
+    t1 = C20 * t6;
+    t8 = t10 + t1;
+    t7 = 0.11205439852686436 * t8;
+    y[216] = t7;
+    t9 = 0.013932619668397829 * t8;
+    y[263] = t9;
+    t11 = (-C22) * t3;
+    t0 = (-C23) * t13;
+    t5 = t11 + t0;
+    t12 = 0.1131905915283136 * t5;
+    y[231] = t12;
+    t2 = 0.06770907553871774 * t5;
+    y[248] = t2;
+    t14 = C23 * t3;
+    t4 = (-C22) * t13;
+    t6 = t14 + t4;
+    t10 = 0.025550251517770402 * t6;
+    y[71] = t10;
+    t1 = (-0.09514939311237743) * t6;
+    y[88] = t1;
+    t7 = re[25];
+    t8 = im[25];
+    t9 = re[41];
+    t11 = im[41];
+    t0 = re[57];
+    t12 = im[57];
+    t5 = re[73];
+    t2 = im[73];
+    t3 = re[9];
+    t13 = im[9];
+    t14 = t9 + t3;
+    t4 = t11 + t13;
+    t10 = t0 + t5;
+    t6 = t12 + t2;
+    t1 = t9 - t3;
+    t9 = t11 - t13;
+    t3 = t0 - t5;
+    t11 = t12 - t2;
+    t13 = t14 + t10;
+    t0 = t4 + t6;
+    t5 = t14 - t10;
+    t12 = C0 * t5;
+    t2 = t4 - t6;
+    t14 = C0 * t2;
+    t10 = C1 * t13;
+    t5 = t7 - t10;
+    t4 = C1 * t0;
+    t6 = t8 - t4;
+    t2 = t5 + t12;
+    t10 = t6 + t14;
+    t4 = t5 - t12;
+    t5 = t6 - t14;
+    t12 = C2 * t1;
+    t6 = C3 * t3;
+    t14 = t12 + t6;
+    t12 = C2 * t9;
+    t6 = C3 * t11;
+    t12 = t12 + t6;
+    t6 = C3 * t1;
+    t1 = C2 * t3;
+    t3 = t6 - t1;
+    t6 = C3 * t9;
+    t1 = C2 * t11;
+    t9 = t6 - t1;
+    t11 = t7 + t13;
+    t6 = t8 + t0;
+    t1 = t2 + t12;
+    t7 = t10 - t14;
+    t13 = t4 + t9;
+    t8 = t5 - t3;
+    t0 = t4 - t9;
+    t4 = t5 + t3;
+    t9 = t2 - t12;
+    t5 = t10 + t14;
+    t3 = (-C24) * t11;
+    t2 = (-C25) * t6;
+    t12 = t3 + t2;
+    t10 = 0.11438816391982388 * t12;
+    y[229] = t10;
+    t14 = 0.059650767254369894 * t12;
+    y[250] = t14;
+    t3 = C25 * t11;
+    t2 = (-C24) * t6;
+    t10 = t3 + t2;
+    t12 = 0.01813155316277703 * t10;
+    y[69] = t12;
+    t14 = (-0.09982185700900215) * t10;
+    y[90] = t14;
+    t11 = (-C26) * t1;
+    t6 = (-C27) * t7;
+    t3 = t11 + t6;
+    t2 = 0.11041928664604037 * t3;
+    y[197] = t2;
+    t12 = (-0.01180210664863542) * t3;
+    y[282] = t12;
+    t10 = C27 * t1;
+    t14 = (-C26) * t7;
+    t11 = t10 + t14;
+    y[37] = 0;
+    t6 = (-0.11320486103184091) * t11;
+    y[122] = t6;
+    t2 = (-C28) * t13;
+    t3 = (-C29) * t8;
+    t12 = t2 + t3;
+    t1 = 0.11126804657147886 * t12;
+    y[165] = t1;
+    t7 = (-0.0005953093527673472) * t12;
+    y[314] = t7;
+    t10 = C29 * t13;
+    t14 = (-C28) * t8;
+    t11 = t10 + t14;
+    y[5] = 0;
+    t6 = (-0.11234132695921792) * t11;
+    y[154] = t6;
+    t2 = C30 * t0;
+    t3 = C31 * t4;
+    t1 = t2 + t3;
+    y[26] = 0;
+    t12 = (-0.11296956092814121) * t1;
+    y[133] = t12;
+    t7 = (-C31) * t0;
+    t13 = C30 * t4;
+    t8 = t7 + t13;
+    t10 = 0.11064927487813397 * t8;
+    y[186] = t10;
+    t14 = (-0.010616155070436837) * t8;
+    y[293] = t14;
+    t11 = C32 * t9;
+    t6 = C33 * t5;
+    t2 = t11 + t6;
+    y[58] = 0;
+    t3 = (-0.11094095955847565) * t2;
+    y[101] = t3;
+    t1 = (-C33) * t9;
+    t12 = C32 * t5;
+    t0 = t1 + t12;
+    t4 = 0.11267254267267626 * t0;
+    y[218] = t4;
+    t7 = 0.019566348347520503 * t0;
+    y[261] = t7;
+    t13 = re[45];
+    t10 = im[45];
+    t8 = re[61];
+    t14 = im[61];
+    t11 = re[77];
+    t6 = im[77];
+    t2 = re[13];
+    t3 = im[13];
+    t9 = re[29];
+    t5 = im[29];
+    t1 = t8 + t9;
+    t12 = t14 + t5;
+    t4 = t11 + t2;
+    t0 = t6 + t3;
+    t7 = t8 - t9;
+    t8 = t14 - t5;
+    t9 = t11 - t2;
+    t14 = t6 - t3;
+    t5 = t1 + t4;
+    t11 = t12 + t0;
+    t2 = t1 - t4;
+    t6 = C0 * t2;
+    t3 = t12 - t0;
+    t1 = C0 * t3;
+    t4 = C1 * t5;
+    t2 = t13 - t4;
+    t12 = C1 * t11;
+    t0 = t10 - t12;
+    t3 = t2 + t6;
+    t4 = t0 + t1;
+    t12 = t2 - t6;
+    t2 = t0 - t1;
+    t6 = C2 * t7;
+    t0 = C3 * t9;
+    t1 = t6 + t0;
+    t6 = C2 * t8;
+    t0 = C3 * t14;
+    t6 = t6 + t0;
+    t0 = C3 * t7;
+    t7 = C2 * t9;
+    t9 = t0 - t7;
+    t0 = C3 * t8;
+    t7 = C2 * t14;
+    t8 = t0 - t7;
+    t14 = t13 + t5;
+    t0 = t10 + t11;
+    t7 = t3 + t6;
+    t13 = t4 - t1;
+    t5 = t12 + t8;
+    t10 = t2 - t9;
+    t11 = t12 - t8;
+    t12 = t2 + t9;
+    t8 = t3 - t6;
+    t2 = t4 + t1;
+    t9 = C34 * t14;
+    t3 = C35 * t0;
+    t6 = t9 + t3;
+    t4 = 0.0007555813326898759 * t6;
+    y[60] = t4;
+    t1 = (-0.11009685922530492) * t6;
+    y[99] = t1;
+    t9 = (-C35) * t14;
+    t3 = C34 * t0;
+    t4 = t9 + t3;
+    t6 = 0.11335924894760097 * t4;
+    y[220] = t6;
+    t1 = 0.025811551828905523 * t4;
+    y[259] = t1;
+    t14 = (-C36) * t7;
+    t0 = (-C37) * t13;
+    t9 = t14 + t0;
+    t3 = 0.11486653517215203 * t9;
+    y[227] = t3;
+    t6 = 0.05160761537146343 * t9;
+    y[252] = t6;
+    t4 = C37 * t7;
+    t1 = (-C36) * t13;
+    t14 = t4 + t1;
+    t0 = 0.01193881895517893 * t14;
+    y[67] = t0;
+    t3 = (-0.10345803506270192) * t14;
+    y[92] = t3;
+    t9 = (-C38) * t5;
+    t6 = (-C39) * t10;
+    t7 = t9 + t6;
+    t13 = 0.11045771058109824 * t7;
+    y[195] = t13;
+    t4 = (-0.01223824317580326) * t7;
+    y[284] = t4;
+    t1 = C39 * t5;
+    t0 = (-C38) * t10;
+    t14 = t1 + t0;
+    y[35] = 0;
+    t3 = (-0.11316548147014575) * t14;
+    y[124] = t3;
+    t9 = (-C40) * t11;
+    t6 = (-C41) * t12;
+    t13 = t9 + t6;
+    t7 = 0.11145078582284168 * t13;
+    y[163] = t7;
+    t4 = (-0.00029036538053302913) * t13;
+    y[316] = t4;
+    t5 = C41 * t11;
+    t10 = (-C40) * t12;
+    t1 = t5 + t10;
+    y[3] = 0;
+    t0 = (-0.11215712754030802) * t1;
+    y[156] = t0;
+    t14 = C42 * t8;
+    t3 = C43 * t2;
+    t9 = t14 + t3;
+    y[28] = 0;
+    t6 = (-0.11300208339074622) * t9;
+    y[131] = t6;
+    t7 = (-C43) * t8;
+    t13 = C42 * t2;
+    t4 = t7 + t13;
+    t11 = 0.11061742956345909 * t4;
+    y[188] = t11;
+    t12 = (-0.011406212765305677) * t4;
+    y[291] = t12;
+    t5 = re[65];
+    t10 = im[65];
+    t1 = re[1];
+    t0 = im[1];
+    t14 = re[17];
+    t3 = im[17];
+    t9 = re[33];
+    t6 = im[33];
+    t8 = re[49];
+    t2 = im[49];
+    t7 = t1 + t8;
+    t13 = t0 + t2;
+    t11 = t14 + t9;
+    t4 = t3 + t6;
+    t12 = t1 - t8;
+    t1 = t0 - t2;
+    t8 = t14 - t9;
+    t0 = t3 - t6;
+    t2 = t7 + t11;
+    t14 = t13 + t4;
+    t9 = t7 - t11;
+    t3 = C0 * t9;
+    t6 = t13 - t4;
+    t7 = C0 * t6;
+    t11 = C1 * t2;
+    t9 = t5 - t11;
+    t13 = C1 * t14;
+    t4 = t10 - t13;
+    t6 = t9 + t3;
+    t11 = t4 + t7;
+    t13 = t9 - t3;
+    t9 = t4 - t7;
+    t3 = C2 * t12;
+    t4 = C3 * t8;
+    t7 = t3 + t4;
+    t3 = C2 * t1;
+    t4 = C3 * t0;
+    t3 = t3 + t4;
+    t4 = C3 * t12;
+    t12 = C2 * t8;
+    t8 = t4 - t12;
+    t4 = C3 * t1;
+    t12 = C2 * t0;
+    t1 = t4 - t12;
+    t0 = t5 + t2;
+    t4 = t10 + t14;
+    t12 = t6 + t3;
+    t5 = t11 - t7;
+    t2 = t13 + t1;
+    t10 = t9 - t8;
+    t14 = t13 - t1;
+    t13 = t9 + t8;
+    t1 = t6 - t3;
+    t9 = t11 + t7;
+    t8 = C44 * t0;
+    t6 = C45 * t4;
+    t3 = t8 + t6;
+    y[30] = 0;
+    t11 = (-0.11304408052070636) * t3;
+    y[129] = t11;
+    t7 = (-C45) * t0;
+    t8 = C44 * t4;
+    t6 = t7 + t8;
+    t3 = 0.11057633396124945 * t6;
+    y[190] = t3;
+    t11 = (-0.011978418421403958) * t6;
+    y[289] = t11;
+    t0 = C46 * t12;
+    t4 = C47 * t5;
+    t7 = t0 + t4;
+    t8 = 0.0024407325566721005 * t7;
+    y[62] = t8;
+    t3 = (-0.1089119239146507) * t7;
+    y[97] = t3;
+    t6 = (-C47) * t12;
+    t11 = C46 * t5;
+    t0 = t6 + t11;
+    t4 = 0.1140404886851624 * t0;
+    y[222] = t4;
+    t8 = 0.032625849527973955 * t0;
+    y[257] = t8;
+    t7 = (-C48) * t2;
+    t3 = (-C49) * t10;
+    t12 = t7 + t3;
+    t5 = 0.11479287347018707 * t12;
+    y[225] = t5;
+    t6 = 0.04375031221246988 * t12;
+    y[254] = t6;
+    t11 = C49 * t2;
+    t4 = (-C48) * t10;
+    t0 = t11 + t4;
+    t8 = 0.007116496653311107 * t0;
+    y[65] = t8;
+    t7 = (-0.1061795099390396) * t0;
+    y[94] = t7;
+    t3 = (-C50) * t14;
+    t5 = (-C51) * t13;
+    t12 = t3 + t5;
+    t6 = 0.11050463693014653 * t12;
+    y[193] = t6;
+    t2 = (-0.012353140490374916) * t12;
+    y[286] = t2;
+    t10 = C51 * t14;
+    t11 = (-C50) * t13;
+    t4 = t10 + t11;
+    y[33] = 0;
+    t8 = (-0.11311742518010033) * t4;
+    y[126] = t8;
+    t0 = (-C52) * t1;
+    t7 = (-C53) * t9;
+    t3 = t0 + t7;
+    t5 = 0.1116492613513416 * t3;
+    y[161] = t5;
+    t6 = (-0.0001089766368577447) * t3;
+    y[318] = t6;
+    t12 = C53 * t1;
+    t2 = (-C52) * t9;
+    t14 = t12 + t2;
+    y[1] = 0;
+    t13 = (-0.11195774919338328) * t14;
+    y[158] = t13;
+    t10 = re[10];
+    t11 = im[10];
+    t4 = re[26];
+    t8 = im[26];
+    t0 = re[42];
+    t7 = im[42];
+    t5 = re[58];
+    t3 = im[58];
+    t6 = re[74];
+    t1 = im[74];
+    t9 = t4 + t6;
+    t12 = t8 + t1;
+    t2 = t0 + t5;
+    t14 = t7 + t3;
+    t13 = t4 - t6;
+    t4 = t8 - t1;
+    t6 = t0 - t5;
+    t8 = t7 - t3;
+    t1 = t9 + t2;
+    t0 = t12 + t14;
+    t5 = t9 - t2;
+    t7 = C0 * t5;
+    t3 = t12 - t14;
+    t9 = C0 * t3;
+    t2 = C1 * t1;
+    t5 = t10 - t2;
+    t12 = C1 * t0;
+    t14 = t11 - t12;
+    t3 = t5 + t7;
+    t2 = t14 + t9;
+    t12 = t5 - t7;
+    t5 = t14 - t9;
+    t7 = C2 * t13;
+    t14 = C3 * t6;
+    t9 = t7 + t14;
+    t7 = C2 * t4;
+    t14 = C3 * t8;
+    t7 = t7 + t14;
+    t14 = C3 * t13;
+    t13 = C2 * t6;
+    t6 = t14 - t13;
+    t14 = C3 * t4;
+    t13 = C2 * t8;
+    t4 = t14 - t13;
+    t8 = t10 + t1;
+    t14 = t11 + t0;
+    t13 = t3 + t7;
+    t10 = t2 - t9;
+    t1 = t12 + t4;
+    t11 = t5 - t6;
+    t0 = t12 - t4;
+    t12 = t5 + t6;
+    t4 = t3 - t7;
+    t5 = t2 + t9;
+    t6 = C54 * t8;
+    t3 = C55 * t14;
+    t7 = t6 + t3;
+    y[0] = 0;
+    t2 = (-0.11185504702302304) * t7;
+    y[159] = t2;
+    t9 = (-C55) * t8;
+    t6 = C54 * t14;
+    t3 = t9 + t6;
+    t7 = 0.11175177457506354 * t3;
+    y[160] = t7;
+    t2 = (-5.165203830021529e-05) * t3;
+    y[319] = t2;
+    t8 = C56 * t13;
+    t14 = C57 * t10;
+    t9 = t8 + t14;
+    y[32] = 0;
+    t6 = (-0.1130924009614444) * t9;
+    y[127] = t6;
+    t7 = (-C57) * t13;
+    t3 = C56 * t10;
+    t2 = t7 + t3;
+    t8 = 0.11052908854823514 * t2;
+    y[192] = t8;
+    t14 = (-0.01229803461763309) * t2;
+    y[287] = t14;
+    t9 = C58 * t1;
+    t6 = C59 * t11;
+    t13 = t9 + t6;
+    t10 = 0.005228528894598489 * t13;
+    y[64] = t10;
+    t7 = (-0.10724785486810427) * t13;
+    y[95] = t7;
+    t3 = (-C59) * t1;
+    t8 = C58 * t11;
+    t2 = t3 + t8;
+    t14 = 0.11460539079791128 * t2;
+    y[224] = t14;
+    t9 = 0.03993813265887571 * t2;
+    y[255] = t9;
+    t6 = (-C60) * t0;
+    t10 = (-C61) * t12;
+    t13 = t6 + t10;
+    t7 = 0.11434765455550672 * t13;
+    y[223] = t7;
+    t1 = 0.03622537124595676 * t13;
+    y[256] = t1;
+    t11 = C61 * t0;
+    t3 = (-C60) * t12;
+    t8 = t11 + t3;
+    t14 = 0.0036761770928009766 * t8;
+    y[63] = t14;
+    t2 = (-0.108151139331365) * t8;
+    y[96] = t2;
+    t9 = (-C62) * t4;
+    t6 = (-C63) * t5;
+    t10 = t9 + t6;
+    t7 = 0.11055324425243726 * t10;
+    y[191] = t7;
+    t13 = (-0.012171925741771757) * t10;
+    y[288] = t13;
+    t1 = C63 * t4;
+    t0 = (-C62) * t5;
+    t12 = t1 + t0;
+    y[31] = 0;
+    t11 = (-0.11306769045562794) * t12;
+    y[128] = t11;
+    t3 = re[30];
+    t14 = im[30];
+    t8 = re[46];
+    t2 = im[46];
+    t9 = re[62];
+    t6 = im[62];
+    t7 = re[78];
+    t10 = im[78];
+    t13 = re[14];
+    t4 = im[14];
+    t5 = t8 + t13;
+    t1 = t2 + t4;
+    t0 = t9 + t7;
+    t12 = t6 + t10;
+    t11 = t8 - t13;
+    t8 = t2 - t4;
+    t13 = t9 - t7;
+    t2 = t6 - t10;
+    t4 = t5 + t0;
+    t9 = t1 + t12;
+    t7 = t5 - t0;
+    t6 = C0 * t7;
+    t10 = t1 - t12;
+    t5 = C0 * t10;
+    t0 = C1 * t4;
+    t7 = t3 - t0;
+    t1 = C1 * t9;
+    t12 = t14 - t1;
+    t10 = t7 + t6;
+    t0 = t12 + t5;
+    t1 = t7 - t6;
+    t7 = t12 - t5;
+    t6 = C2 * t11;
+    t12 = C3 * t13;
+    t5 = t6 + t12;
+    t6 = C2 * t8;
+    t12 = C3 * t2;
+    t6 = t6 + t12;
+    t12 = C3 * t11;
+    t11 = C2 * t13;
+    t13 = t12 - t11;
+    t12 = C3 * t8;
+    t11 = C2 * t2;
+    t8 = t12 - t11;
+    t2 = t3 + t4;
+    t12 = t14 + t9;
+    t11 = t10 + t6;
+    t3 = t0 - t5;
+    t4 = t1 + t8;
+    t14 = t7 - t13;
+    t9 = t1 - t8;
+    t1 = t7 + t13;
+    t8 = t10 - t6;
+    t7 = t0 + t5;
+    t13 = (-C64) * t2;
+    t10 = (-C65) * t12;
+    t6 = t13 + t10;
+    t0 = 0.11059791963266878 * t6;
+    y[189] = t0;
+    t5 = (-0.011721902414949017) * t6;
+    y[290] = t5;
+    t13 = C65 * t2;
+    t10 = (-C64) * t12;
+    t0 = t13 + t10;
+    y[29] = 0;
+    t6 = (-0.11302201742597437) * t0;
+    y[130] = t6;
+    t5 = C66 * t11;
+    t2 = C67 * t3;
+    t12 = t5 + t2;
+    y[2] = 0;
+    t13 = (-0.11205885530668312) * t12;
+    y[157] = t13;
+    t10 = (-C67) * t11;
+    t0 = C66 * t3;
+    t6 = t10 + t0;
+    t5 = 0.11154852479788367 * t6;
+    y[162] = t5;
+    t2 = (-0.0001860937495776424) * t6;
+    y[317] = t2;
+    t12 = C68 * t4;
+    t13 = C69 * t14;
+    t11 = t12 + t13;
+    y[34] = 0;
+    t3 = (-0.11314211896669611) * t11;
+    y[125] = t3;
+    t10 = (-C69) * t4;
+    t0 = C68 * t14;
+    t5 = t10 + t0;
+    t6 = 0.1104805187861068 * t5;
+    y[194] = t6;
+    t2 = (-0.01233443984786758) * t5;
+    y[285] = t2;
+    t12 = C70 * t9;
+    t13 = C71 * t1;
+    t11 = t12 + t13;
+    t3 = 0.009352418308382831 * t11;
+    y[66] = t3;
+    t4 = (-0.10492339967141712) * t11;
+    y[93] = t4;
+    t14 = (-C71) * t9;
+    t10 = C70 * t1;
+    t0 = t14 + t10;
+    t6 = 0.11488758850671385 * t0;
+    y[226] = t6;
+    t5 = 0.04764581941606944 * t0;
+    y[253] = t5;
+    t2 = (-C72) * t8;
+    t12 = (-C73) * t7;
+    t13 = t2 + t12;
+    t3 = 0.11370366529486921 * t13;
+    y[221] = t3;
+    t11 = 0.02915122830740091 * t13;
+    y[258] = t11;
+    t4 = C73 * t8;
+    t9 = (-C72) * t7;
+    t1 = t4 + t9;
+    t14 = 0.0014941198559818211 * t1;
+    y[61] = t14;
+    t10 = (-0.10955182964996066) * t1;
+    y[98] = t10;
+    t6 = re[50];
+    t0 = im[50];
+    t5 = re[66];
+    t2 = im[66];
+    t12 = re[2];
+    t3 = im[2];
+    t13 = re[18];
+    t11 = im[18];
+    t8 = re[34];
+    t7 = im[34];
+    t4 = t5 + t8;
+    t9 = t2 + t7;
+    t14 = t12 + t13;
+    t1 = t3 + t11;
+    t10 = t5 - t8;
+    t5 = t2 - t7;
+    t8 = t12 - t13;
+    t2 = t3 - t11;
+    t7 = t4 + t14;
+    t12 = t9 + t1;
+    t13 = t4 - t14;
+    t3 = C0 * t13;
+    t11 = t9 - t1;
+    t4 = C0 * t11;
+    t14 = C1 * t7;
+    t13 = t6 - t14;
+    t9 = C1 * t12;
+    t1 = t0 - t9;
+    t11 = t13 + t3;
+    t14 = t1 + t4;
+    t9 = t13 - t3;
+    t13 = t1 - t4;
+    t3 = C2 * t10;
+    t1 = C3 * t8;
+    t4 = t3 + t1;
+    t3 = C2 * t5;
+    t1 = C3 * t2;
+    t3 = t3 + t1;
+    t1 = C3 * t10;
+    t10 = C2 * t8;
+    t8 = t1 - t10;
+    t1 = C3 * t5;
+    t10 = C2 * t2;
+    t5 = t1 - t10;
+    t2 = t6 + t7;
+    t1 = t0 + t12;
+    t10 = t11 + t3;
+    t6 = t14 - t4;
+    t7 = t9 + t5;
+    t0 = t13 - t8;
+    t12 = t9 - t5;
+    t9 = t13 + t8;
+    t5 = t11 - t3;
+    t13 = t14 + t4;
+    t8 = (-C74) * t2;
+    t11 = (-C75) * t1;
+    t3 = t8 + t11;
+    t14 = 0.1130382528407792 * t3;
+    y[219] = t14;
+    t4 = 0.022614471868246694 * t3;
+    y[260] = t4;
+    t8 = C75 * t2;
+    t11 = (-C74) * t1;
+    t14 = t8 + t11;
+    y[59] = 0;
+    t3 = (-0.11058203471710555) * t14;
+    y[100] = t3;
+    t4 = (-C76) * t10;
+    t2 = (-C77) * t6;
+    t1 = t4 + t2;
+    t8 = 0.11063464351695831 * t1;
+    y[187] = t8;
+    t11 = (-0.011035818916886387) * t1;
+    y[292] = t11;
+    t14 = C77 * t10;
+    t3 = (-C76) * t6;
+    t4 = t14 + t3;
+    y[27] = 0;
+    t2 = (-0.11298450108065812) * t4;
+    y[132] = t2;
+    t8 = C78 * t7;
+    t1 = C79 * t0;
+    t11 = t8 + t1;
+    y[4] = 0;
+    t10 = (-0.11225163518783692) * t11;
+    y[155] = t10;
+    t6 = (-C79) * t7;
+    t14 = C78 * t0;
+    t3 = t6 + t14;
+    t4 = 0.11135695243176677 * t3;
+    y[164] = t4;
+    t2 = (-0.0004255556183502251) * t3;
+    y[315] = t2;
+    t8 = C80 * t12;
+    t1 = C81 * t9;
+    t11 = t8 + t1;
+    y[36] = 0;
+    t10 = (-0.11318674554225053) * t11;
+    y[123] = t10;
+    t7 = (-C81) * t12;
+    t0 = C80 * t9;
+    t6 = t7 + t0;
+    t14 = 0.1104369592050332 * t6;
+    y[196] = t14;
+    t4 = (-0.01206173407961596) * t6;
+    y[283] = t4;
+    t3 = C82 * t5;
+    t2 = C83 * t13;
+    t8 = t3 + t2;
+    t1 = 0.014870022449247523 * t8;
+    y[68] = t1;
+    t11 = (-0.10176330597413) * t8;
+    y[91] = t11;
+    t10 = (-C83) * t5;
+    t12 = C82 * t13;
+    t9 = t10 + t12;
+    t7 = 0.11470720717048688 * t9;
+    y[228] = t7;
+    t0 = 0.05561628316934244 * t9;
+    y[251] = t0;
+    t14 = re[70];
+    t6 = im[70];
+    t4 = re[6];
+    t3 = im[6];
+    t2 = re[22];
+    t1 = im[22];
+    t8 = re[38];
+    t11 = im[38];
+    t5 = re[54];
+    t13 = im[54];
+    t10 = t4 + t5;
+    t12 = t3 + t13;
+    t7 = t2 + t8;
+    t9 = t1 + t11;
+    t0 = t4 - t5;
+    t4 = t3 - t13;
+    t5 = t2 - t8;
+    t3 = t1 - t11;
+    t13 = t10 + t7;
+    t2 = t12 + t9;
+    t8 = t10 - t7;
+    t1 = C0 * t8;
+    t11 = t12 - t9;
+    t10 = C0 * t11;
+    t7 = C1 * t13;
+    t8 = t14 - t7;
+    t12 = C1 * t2;
+    t9 = t6 - t12;
+    t11 = t8 + t1;
+    t7 = t9 + t10;
+    t12 = t8 - t1;
+    t8 = t9 - t10;
+    t1 = C2 * t0;
+    t9 = C3 * t5;
+    t10 = t1 + t9;
+    t1 = C2 * t4;
+    t9 = C3 * t3;
+    t1 = t1 + t9;
+    t9 = C3 * t0;
+    t0 = C2 * t5;
+    t5 = t9 - t0;
+    t9 = C3 * t4;
+    t0 = C2 * t3;
+    t4 = t9 - t0;
+    t3 = t14 + t13;
+    t9 = t6 + t2;
+    t0 = t11 + t1;
+    t14 = t7 - t10;
+    t13 = t12 + t4;
+    t6 = t8 - t5;
+    t2 = t12 - t4;
+    t12 = t8 + t5;
+    t4 = t11 - t1;
+    t8 = t7 + t10;
+    t5 = C84 * t3;
+    t11 = C85 * t9;
+    t1 = t5 + t11;
+    t7 = 0.021701284641749745 * t1;
+    y[70] = t7;
+    t10 = (-0.09762044271285876) * t1;
+    y[89] = t10;
+    t5 = (-C85) * t3;
+    t11 = C84 * t9;
+    t7 = t5 + t11;
+    t1 = 0.11388864301218943 * t7;
+    y[230] = t1;
+    t10 = 0.06368932862731685 * t7;
+    y[249] = t10;
+    t3 = (-C86) * t0;
+    t9 = (-C87) * t14;
+    t5 = t3 + t9;
+    t11 = 0.11234550604833171 * t5;
+    y[217] = t11;
+    t1 = 0.016671591989872066 * t5;
+    y[262] = t1;
+    t7 = C87 * t0;
+    t10 = (-C86) * t14;
+    t3 = t7 + t10;
+    y[57] = 0;
+    t9 = (-0.11126390756228761) * t3;
+    y[102] = t9;
+    t11 = (-C88) * t13;
+    t5 = (-C89) * t6;
+    t1 = t11 + t5;
+    t0 = 0.11066142996104605 * t1;
+    y[185] = t0;
+    t14 = (-0.010152208455441044) * t1;
+    y[294] = t14;
+    t7 = C89 * t13;
+    t10 = (-C88) * t6;
+    t3 = t7 + t10;
+    y[25] = 0;
+    t9 = (-0.11295715231946778) * t3;
+    y[134] = t9;
+    t11 = C90 * t2;
+    t5 = C91 * t12;
+    t0 = t11 + t5;
+    y[6] = 0;
+    t1 = (-0.11242546940951972) * t0;
+    y[153] = t1;
+    t14 = (-C91) * t2;
+    t13 = C90 * t12;
+    t6 = t14 + t13;
+    t7 = 0.11118477036967173 * t6;
+    y[166] = t7;
+    t10 = (-0.0008022883639918069) * t6;
+    y[313] = t10;
+    t3 = C92 * t4;
+    t9 = C93 * t8;
+    t11 = t3 + t9;
+    y[38] = 0;
+    t5 = (-0.11321893897230066) * t11;
+    y[121] = t5;
+    t0 = (-C93) * t4;
+    t1 = C92 * t8;
+    t2 = t0 + t1;
+    t12 = 0.11040555682170945 * t2;
+    y[198] = t12;
+    t14 = (-0.01145593708480445) * t2;
+    y[281] = t14;
+    t13 = re[15];
+    t7 = im[15];
+    t6 = re[31];
+    t10 = im[31];
+    t3 = re[47];
+    t9 = im[47];
+    t11 = re[63];
+    t5 = im[63];
+    t4 = re[79];
+    t8 = im[79];
+    t0 = t6 + t4;
+    t1 = t10 + t8;
+    t12 = t3 + t11;
+    t2 = t9 + t5;
+    t14 = t6 - t4;
+    t6 = t10 - t8;
+    t4 = t3 - t11;
+    t10 = t9 - t5;
+    t8 = t0 + t12;
+    t3 = t1 + t2;
+    t11 = t0 - t12;
+    t9 = C0 * t11;
+    t5 = t1 - t2;
+    t0 = C0 * t5;
+    t12 = C1 * t8;
+    t11 = t13 - t12;
+    t1 = C1 * t3;
+    t2 = t7 - t1;
+    t5 = t11 + t9;
+    t12 = t2 + t0;
+    t1 = t11 - t9;
+    t11 = t2 - t0;
+    t9 = C2 * t14;
+    t2 = C3 * t4;
+    t0 = t9 + t2;
+    t9 = C2 * t6;
+    t2 = C3 * t10;
+    t9 = t9 + t2;
+    t2 = C3 * t14;
+    t14 = C2 * t4;
+    t4 = t2 - t14;
+    t2 = C3 * t6;
+    t14 = C2 * t10;
+    t6 = t2 - t14;
+    t10 = t13 + t8;
+    t2 = t7 + t3;
+    t14 = t5 + t9;
+    t13 = t12 - t0;
+    t8 = t1 + t6;
+    t7 = t11 - t4;
+    t3 = t1 - t6;
+    t1 = t11 + t4;
+    t6 = t5 - t9;
+    t11 = t12 + t0;
+    t4 = C94 * t10;
+    t5 = C95 * t2;
+    t9 = t4 + t5;
+    y[40] = 0;
+    t12 = (-0.11323067239466955) * t9;
+    y[119] = t12;
+    t0 = (-C95) * t10;
+    t4 = C94 * t2;
+    t5 = t0 + t4;
+    t9 = 0.11039411614929569 * t5;
+    y[200] = t9;
+    t12 = (-0.010492396715068457) * t5;
+    y[279] = t12;
+    t10 = C96 * t14;
+    t2 = C97 * t13;
+    t0 = t10 + t2;
+    t4 = 0.029643940889860314 * t0;
+    y[72] = t4;
+    t9 = (-0.09240371932400153) * t0;
+    y[87] = t9;
+    t5 = (-C97) * t14;
+    t12 = C96 * t13;
+    t10 = t5 + t12;
+    t2 = 0.11227828538840914 * t10;
+    y[232] = t2;
+    t4 = 0.07168644812391273 * t10;
+    y[247] = t4;
+    t0 = (-C98) * t8;
+    t9 = (-C99) * t7;
+    t14 = t0 + t9;
+    t13 = 0.11179661430082742 * t14;
+    y[215] = t13;
+    t5 = 0.011350651572530776 * t14;
+    y[264] = t5;
+    t12 = C99 * t8;
+    t2 = (-C98) * t7;
+    t10 = t12 + t2;
+    y[55] = 0;
+    t4 = (-0.11181018386088534) * t10;
+    y[104] = t4;
+    t0 = (-C100) * t3;
+    t9 = (-C101) * t1;
+    t13 = t0 + t9;
+    t14 = 0.1106787773094936 * t13;
+    y[183] = t14;
+    t5 = (-0.009115290867001715) * t13;
+    y[296] = t5;
+    t8 = C101 * t3;
+    t7 = (-C100) * t1;
+    t12 = t8 + t7;
+    y[23] = 0;
+    t2 = (-0.11293944786764282) * t12;
+    y[136] = t2;
+    t10 = C102 * t6;
+    t4 = C103 * t11;
+    t0 = t10 + t4;
+    y[8] = 0;
+    t9 = (-0.11257434708384861) * t0;
+    y[151] = t9;
+    t14 = (-C103) * t6;
+    t13 = C102 * t11;
+    t5 = t14 + t13;
+    t3 = 0.11103773038709819 * t5;
+    y[168] = t3;
+    t1 = (-0.0013363528219741984) * t5;
+    y[311] = t1;
+    t8 = re[35];
+    t7 = im[35];
+    t12 = re[51];
+    t2 = im[51];
+    t10 = re[67];
+    t4 = im[67];
+    t0 = re[3];
+    t9 = im[3];
+    t6 = re[19];
+    t11 = im[19];
+    t14 = t12 + t6;
+    t13 = t2 + t11;
+    t3 = t10 + t0;
+    t5 = t4 + t9;
+    t1 = t12 - t6;
+    t12 = t2 - t11;
+    t6 = t10 - t0;
+    t2 = t4 - t9;
+    t11 = t14 + t3;
+    t10 = t13 + t5;
+    t0 = t14 - t3;
+    t4 = C0 * t0;
+    t9 = t13 - t5;
+    t14 = C0 * t9;
+    t3 = C1 * t11;
+    t0 = t8 - t3;
+    t13 = C1 * t10;
+    t5 = t7 - t13;
+    t9 = t0 + t4;
+    t3 = t5 + t14;
+    t13 = t0 - t4;
+    t0 = t5 - t14;
+    t4 = C2 * t1;
+    t5 = C3 * t6;
+    t14 = t4 + t5;
+    t4 = C2 * t12;
+    t5 = C3 * t2;
+    t4 = t4 + t5;
+    t5 = C3 * t1;
+    t1 = C2 * t6;
+    t6 = t5 - t1;
+    t5 = C3 * t12;
+    t1 = C2 * t2;
+    t12 = t5 - t1;
+    t2 = t8 + t11;
+    t5 = t7 + t10;
+    t1 = t9 + t4;
+    t8 = t3 - t14;
+    t11 = t13 + t12;
+    t7 = t0 - t6;
+    t10 = t13 - t12;
+    t13 = t0 + t6;
+    t12 = t9 - t4;
+    t0 = t3 + t14;
+    t6 = C104 * t2;
+    t9 = C105 * t5;
+    t4 = t6 + t9;
+    y[10] = 0;
+    t3 = (-0.11269474498682608) * t4;
+    y[149] = t3;
+    t14 = (-C105) * t2;
+    t6 = C104 * t5;
+    t9 = t14 + t6;
+    t4 = 0.11091910276261092 * t9;
+    y[170] = t4;
+    t3 = (-0.0020355669173363036) * t9;
+    y[309] = t3;
+    t2 = C106 * t1;
+    t5 = C107 * t8;
+    t14 = t2 + t5;
+    y[42] = 0;
+    t6 = (-0.11321389983506888) * t14;
+    y[117] = t6;
+    t4 = (-C107) * t1;
+    t9 = C106 * t8;
+    t3 = t4 + t9;
+    t2 = 0.11041047095992741 * t3;
+    y[202] = t2;
+    t5 = (-0.009144168244333128) * t3;
+    y[277] = t5;
+    t14 = C108 * t11;
+    t6 = C109 * t7;
+    t1 = t14 + t6;
+    t8 = 0.03840702414922375 * t1;
+    y[74] = t8;
+    t4 = (-0.08609343893725221) * t1;
+    y[85] = t4;
+    t9 = (-C109) * t11;
+    t2 = C108 * t7;
+    t3 = t9 + t2;
+    t5 = 0.10976184087525823 * t3;
+    y[234] = t5;
+    t14 = 0.07941843250116053 * t3;
+    y[245] = t14;
+    t6 = (-C110) * t10;
+    t8 = (-C111) * t13;
+    t1 = t6 + t8;
+    t4 = 0.11136963947658277 * t1;
+    y[213] = t4;
+    t11 = 0.006655923646798118 * t1;
+    y[266] = t11;
+    t7 = C111 * t10;
+    t9 = (-C110) * t13;
+    t2 = t7 + t9;
+    y[53] = 0;
+    t5 = (-0.11223884766753088) * t2;
+    y[106] = t5;
+    t3 = (-C112) * t12;
+    t14 = (-C113) * t0;
+    t6 = t3 + t14;
+    t8 = 0.11068977020554269 * t6;
+    y[181] = t8;
+    t4 = (-0.007973780692501398) * t6;
+    y[298] = t4;
+    t1 = C113 * t12;
+    t11 = (-C112) * t0;
+    t10 = t1 + t11;
+    y[21] = 0;
+    t13 = (-0.11292823155011004) * t10;
+    y[138] = t13;
+    t7 = re[55];
+    t9 = im[55];
+    t2 = re[71];
+    t5 = im[71];
+    t3 = re[7];
+    t14 = im[7];
+    t8 = re[23];
+    t6 = im[23];
+    t4 = re[39];
+    t12 = im[39];
+    t0 = t2 + t4;
+    t1 = t5 + t12;
+    t11 = t3 + t8;
+    t10 = t14 + t6;
+    t13 = t2 - t4;
+    t2 = t5 - t12;
+    t4 = t3 - t8;
+    t5 = t14 - t6;
+    t12 = t0 + t11;
+    t3 = t1 + t10;
+    t8 = t0 - t11;
+    t14 = C0 * t8;
+    t6 = t1 - t10;
+    t0 = C0 * t6;
+    t11 = C1 * t12;
+    t8 = t7 - t11;
+    t1 = C1 * t3;
+    t10 = t9 - t1;
+    t6 = t8 + t14;
+    t11 = t10 + t0;
+    t1 = t8 - t14;
+    t8 = t10 - t0;
+    t14 = C2 * t13;
+    t10 = C3 * t4;
+    t0 = t14 + t10;
+    t14 = C2 * t2;
+    t10 = C3 * t5;
+    t14 = t14 + t10;
+    t10 = C3 * t13;
+    t13 = C2 * t4;
+    t4 = t10 - t13;
+    t10 = C3 * t2;
+    t13 = C2 * t5;
+    t2 = t10 - t13;
+    t5 = t7 + t12;
+    t10 = t9 + t3;
+    t13 = t6 + t14;
+    t7 = t11 - t0;
+    t12 = t1 + t2;
+    t9 = t8 - t4;
+    t3 = t1 - t2;
+    t1 = t8 + t4;
+    t2 = t6 - t14;
+    t8 = t11 + t0;
+    t4 = (-C114) * t5;
+    t6 = (-C115) * t10;
+    t14 = t4 + t6;
+    t11 = 0.11069982990167095 * t14;
+    y[179] = t11;
+    t0 = (-0.00677944196717133) * t14;
+    y[300] = t0;
+    t4 = C115 * t5;
+    t6 = (-C114) * t10;
+    t11 = t4 + t6;
+    y[19] = 0;
+    t14 = (-0.11291796935101998) * t11;
+    y[140] = t14;
+    t0 = C116 * t13;
+    t5 = C117 * t7;
+    t10 = t0 + t5;
+    y[12] = 0;
+    t4 = (-0.11278570463175508) * t10;
+    y[147] = t4;
+    t6 = (-C117) * t13;
+    t11 = C116 * t7;
+    t14 = t6 + t11;
+    t0 = 0.11082964849856157 * t14;
+    y[172] = t0;
+    t5 = (-0.0028939996046675) * t14;
+    y[307] = t5;
+    t10 = C118 * t12;
+    t4 = C119 * t9;
+    t13 = t10 + t4;
+    y[44] = 0;
+    t7 = (-0.11316074359050755) * t13;
+    y[115] = t7;
+    t6 = (-C119) * t12;
+    t11 = C118 * t9;
+    t0 = t6 + t11;
+    t14 = 0.11046233528858285 * t0;
+    y[204] = t14;
+    t5 = (-0.007381472594023432) * t0;
+    y[275] = t5;
+    t10 = C120 * t3;
+    t4 = C121 * t1;
+    t13 = t10 + t4;
+    t7 = 0.04764807034464822 * t13;
+    y[76] = t7;
+    t12 = (-0.0787522384296202) * t13;
+    y[83] = t12;
+    t9 = (-C121) * t3;
+    t6 = C120 * t1;
+    t11 = t9 + t6;
+    t14 = 0.10627159994209234 * t11;
+    y[236] = t14;
+    t0 = 0.08669550714611719 * t11;
+    y[243] = t0;
+    t5 = (-C122) * t2;
+    t10 = (-C123) * t8;
+    t4 = t5 + t10;
+    t7 = 0.11104348913524584 * t4;
+    y[211] = t7;
+    t13 = 0.0025721960202326173 * t4;
+    y[268] = t13;
+    t12 = C123 * t2;
+    t3 = (-C122) * t8;
+    t1 = t12 + t3;
+    y[51] = 0;
+    t9 = (-0.11256850894495554) * t1;
+    y[108] = t9;
+    t6 = re[75];
+    t14 = im[75];
+    t11 = re[11];
+    t0 = im[11];
+    t5 = re[27];
+    t10 = im[27];
+    t7 = re[43];
+    t4 = im[43];
+    t13 = re[59];
+    t2 = im[59];
+    t8 = t11 + t13;
+    t12 = t0 + t2;
+    t3 = t5 + t7;
+    t1 = t10 + t4;
+    t9 = t11 - t13;
+    t11 = t0 - t2;
+    t13 = t5 - t7;
+    t0 = t10 - t4;
+    t2 = t8 + t3;
+    t5 = t12 + t1;
+    t7 = t8 - t3;
+    t10 = C0 * t7;
+    t4 = t12 - t1;
+    t8 = C0 * t4;
+    t3 = C1 * t2;
+    t7 = t6 - t3;
+    t12 = C1 * t5;
+    t1 = t14 - t12;
+    t4 = t7 + t10;
+    t3 = t1 + t8;
+    t12 = t7 - t10;
+    t7 = t1 - t8;
+    t10 = C2 * t9;
+    t1 = C3 * t13;
+    t8 = t10 + t1;
+    t10 = C2 * t11;
+    t1 = C3 * t0;
+    t10 = t10 + t1;
+    t1 = C3 * t9;
+    t9 = C2 * t13;
+    t13 = t1 - t9;
+    t1 = C3 * t11;
+    t9 = C2 * t0;
+    t11 = t1 - t9;
+    t0 = t6 + t2;
+    t1 = t14 + t5;
+    t9 = t4 + t10;
+    t6 = t3 - t8;
+    t2 = t12 + t11;
+    t14 = t7 - t13;
+    t5 = t12 - t11;
+    t12 = t7 + t13;
+    t11 = t4 - t10;
+    t7 = t3 + t8;
+    t13 = (-C124) * t0;
+    t4 = (-C125) * t1;
+    t10 = t13 + t4;
+    t3 = 0.11079974707998154 * t10;
+    y[209] = t3;
+    t8 = (-0.0009291338389342098) * t10;
+    y[270] = t8;
+    t13 = C125 * t0;
+    t4 = (-C124) * t1;
+    t3 = t13 + t4;
+    y[49] = 0;
+    t10 = (-0.11281614199874296) * t3;
+    y[110] = t10;
+    t8 = (-C126) * t9;
+    t0 = (-C127) * t6;
+    t1 = t8 + t0;
+    t13 = 0.1107159369533963 * t1;
+    y[177] = t13;
+    t4 = (-0.005583714262614551) * t1;
+    y[302] = t4;
+    t3 = C127 * t9;
+    t10 = (-C126) * t6;
+    t8 = t3 + t10;
+    y[17] = 0;
+    t0 = (-0.11290154194568777) * t8;
+    y[142] = t0;
+    t13 = C128 * t2;
+    t1 = C129 * t14;
+    t4 = t13 + t1;
+    y[14] = 0;
+    t9 = (-0.1128489577131372) * t4;
+    y[145] = t9;
+    t6 = (-C129) * t2;
+    t3 = C128 * t14;
+    t10 = t6 + t3;
+    t8 = 0.11076752726219304 * t10;
+    y[174] = t8;
+    t0 = (-0.0038925446683325056) * t10;
+    y[305] = t0;
+    t13 = C130 * t5;
+    t1 = C131 * t12;
+    t4 = t13 + t1;
+    y[46] = 0;
+    t9 = (-0.11306341881413566) * t4;
+    y[113] = t9;
+    t2 = (-C131) * t5;
+    t14 = C130 * t12;
+    t6 = t2 + t14;
+    t3 = 0.1105574210571917 * t6;
+    y[206] = t3;
+    t8 = (-0.005170299986352561) * t6;
+    y[273] = t8;
+    t10 = C132 * t11;
+    t0 = C133 * t7;
+    t13 = t10 + t0;
+    t1 = 0.057007607494891754 * t13;
+    y[78] = t1;
+    t4 = (-0.07052284850968048) * t13;
+    y[81] = t4;
+    t9 = (-C133) * t11;
+    t5 = C132 * t7;
+    t12 = t9 + t5;
+    t2 = 0.1017954643269173 * t12;
+    y[238] = t2;
+    t14 = 0.09334006677577329 * t12;
+    y[241] = t14;
+}
+
+//
+//  Public functions.
+//
+
+/**
+ *  Apply LD-IMDCT transform (prebuilt for window W10_160, input pruned).
+ * 
+ *  Note(s):
+ *    [1] y[n] = w[n] * SUM(X[k] * cos(PI / 160 * (n + 80.5) * (k + 0.5))), where
+ *        w[n] = sqrt(2 / 160) * W10_160[319 - n].
+ *    [2] X[k] shall be zero for all k >= 80 (not checked).
+ *    [3] The size of all arrays will not be checked.
+ * 
+ *  @param {Number[]} X 
+ *    - The input block (160 points, only the first 80 points are used).
+ *  @param {Number[]} y 
+ *    - The array that would contain the output block (320 points).
+ *  @param {Number[]} re 
+ *    - The scratch buffer (real part, 80 points).
+ *  @param {Number[]} im 
+ *    - The scratch buffer (imaginary part, 80 points).
+ */
+function ApplyWindowedIMDCT_W10_160_K80(X, y, re, im) {
+    ApplyWindowedIMDCT_W10_160_K80_Part1(X, y, re, im);
+    ApplyWindowedIMDCT_W10_160_K80_Part2(X, y, re, im);
+}
+
+//  Export public APIs.
+module.exports = {
+    "ApplyWindowedIMDCT_W10_160_K80": ApplyWindowedIMDCT_W10_160_K80
+};
\ No newline at end of file
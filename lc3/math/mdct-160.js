@@ -0,0 +1,8361 @@
+//
+//  Copyright 2021 - 2023 XiaoJSoft Studio. All rights reserved.
+//  Use of this source code is governed by a BSD-style license that can be
+//  found in the LICENSE.md file.
+//
+
+//
+//  Note(s):
+//    [1] This file is generated automatically by a MDCT compiler, which locates 
+//        at "./../../dev/mdct-generator/" directory.
+//        Do NOT modify this file manually.
+//
+
+//
+//  Private functions.
+//
+
+/**
+ *  Part 1 of ApplyWindowedMDCT_W10_160().
+ * 
+ *  @param {Number[]} x 
+ *    - The input block (320 points).
+ *  @param {Number[]} X 
+ *    - The array that would contain the output block (160 points).
+ *  @param {Number[]} re 
+ *    - The scratch buffer (real part, 80 points).
+ *  @param {Number[]} im 
+ *    - The scratch buffer (imaginary part, 80 points).
+ */
+function ApplyWindowedMDCT_W10_160_Part1(x, X, re, im) {
+    let t0, t1, t10, t11, t2, t3, t4, t5, t6, t7, t8, t9;
+    const C0 = 0.3826834323650898;
+    const C1 = 0.9238795325112867;
+    const C2 = 0.7071067811865476;
+    const C3 = 0.9951847266721969;
+    const C4 = 0.0980171403295606;
+    const C5 = 0.47139673682599764;
+    const C6 = 0.881921264348355;
+    const C7 = 0.6343932841636455;
+    const C8 = 0.773010453362737;
+    const C9 = 0.29028467725446233;
+    const C10 = 0.9569403357322088;
+    const C11 = 1.3065629648763766;
+    const C12 = 0.5411961001461969;
+    const C13 = 0.19509032201612825;
+    const C14 = 0.9807852804032304;
+    const C15 = 0.5555702330196022;
+    const C16 = 0.8314696123025452;
+    const C17 = 0.07845909572784494;
+    const C18 = 0.996917333733128;
+    const C19 = 0.9998072404820648;
+    const C20 = 0.0196336924606283;
+    const C21 = 0.9930684569549263;
+    const C22 = 0.11753739745783764;
+    const C23 = 0.1757962799343545;
+    const C24 = 0.9844265680898916;
+    const C25 = 0.5877852522924731;
+    const C26 = 0.8090169943749475;
+    const C27 = 0.5224985647159488;
+    const C28 = 0.8526401643540922;
+    const C29 = 0.15643446504023087;
+    const C30 = 0.9876883405951378;
+    const C31 = 0.2334453638559054;
+    const C32 = 0.9723699203976766;
+    const C33 = 0.6642524379112817;
+    const C34 = 0.7475083268625968;
+    const C35 = 0.436409240673342;
+    const C36 = 0.8997482840522215;
+    const C37 = 0.05887080365118903;
+    const C38 = 0.9982656101847159;
+    const C39 = 0.3276301795616935;
+    const C40 = 0.944806046466878;
+    const C41 = 0.6788007455329417;
+    const C42 = 0.7343225094356856;
+    const C43 = 0.34611705707749296;
+    const C44 = 0.9381913359224842;
+    const C45 = 0.9992290362407229;
+    const C46 = 0.03925981575906861;
+    const C47 = 0.41865973753742813;
+    const C48 = 0.9081431738250813;
+    const C49 = 0.6035559419535714;
+    const C50 = 0.7973206537727071;
+    const C51 = 0.25249157701515795;
+    const C52 = 0.9675990923602598;
+    const C53 = 0.9905693404435773;
+    const C54 = 0.13701234168196802;
+    const C55 = 0.5056573733779846;
+    const C56 = 0.8627343859777918;
+    t0 = x[239];
+    t0 = 0.06614065009095606 * t0;
+    t1 = x[240];
+    t1 = 0.061622714636375496 * t1;
+    t0 = t0 + t1;
+    t1 = x[79];
+    t1 = 0.09637574106663695 * t1;
+    t2 = x[80];
+    t2 = 0.09919868040847561 * t2;
+    t1 = t1 - t2;
+    t2 = -t0;
+    t3 = x[199];
+    t4 = x[39];
+    t4 = (-0.011020477312608395) * t4;
+    t5 = x[120];
+    t5 = 0.1103968791240002 * t5;
+    t4 = t4 - t5;
+    t5 = (-0.10460888249766158) * t3;
+    t6 = C0 * t4;
+    t5 = t5 + t6;
+    t6 = 0.043330417875224916 * t3;
+    t3 = C1 * t4;
+    t4 = t6 + t3;
+    t6 = x[0];
+    t3 = (-5.165203830021529e-05) * t6;
+    t6 = x[159];
+    t6 = 0.11175177457506354 * t6;
+    t3 = t3 - t6;
+    t6 = x[160];
+    t7 = C2 * t3;
+    t8 = (-0.07909346225991973) * t6;
+    t7 = t7 + t8;
+    t8 = (-0.7071067811865475) * t3;
+    t3 = (-0.07909346225991974) * t6;
+    t6 = t8 + t3;
+    t8 = x[40];
+    t3 = (-0.010492396715068457) * t8;
+    t8 = x[119];
+    t8 = 0.11039411614929569 * t8;
+    t3 = t3 - t8;
+    t8 = x[200];
+    t9 = C0 * t3;
+    t10 = (-0.10461150067792596) * t8;
+    t9 = t9 + t10;
+    t10 = (-C1) * t3;
+    t3 = (-0.04333150236099916) * t8;
+    t8 = t10 + t3;
+    t10 = t7 - t0;
+    t3 = t1 + t6;
+    t0 = t5 + t9;
+    t11 = t4 + t8;
+    t2 = t2 - t7;
+    t7 = t1 - t6;
+    t1 = t5 - t9;
+    t6 = t4 - t8;
+    t5 = t10 + t0;
+    t9 = t3 + t11;
+    t4 = t2 + t6;
+    t8 = t7 - t1;
+    t10 = t10 - t0;
+    t0 = t3 - t11;
+    t3 = t2 - t6;
+    t11 = t7 + t1;
+    re[0] = t5;
+    im[0] = t9;
+    re[20] = t4;
+    im[20] = t8;
+    re[40] = t10;
+    im[40] = t0;
+    re[60] = t3;
+    im[60] = t11;
+    t2 = x[229];
+    t6 = 0.09982185700900215 * t2;
+    t7 = x[250];
+    t1 = 0.01813155316277703 * t7;
+    t5 = t6 + t1;
+    t9 = x[69];
+    t4 = 0.059650767254369894 * t9;
+    t8 = x[90];
+    t10 = 0.11438816391982388 * t8;
+    t0 = t4 - t10;
+    t3 = (-C3) * t5;
+    t11 = C4 * t0;
+    t2 = t3 + t11;
+    t7 = C4 * t5;
+    t6 = C3 * t0;
+    t1 = t7 + t6;
+    t9 = x[189];
+    t8 = x[29];
+    t4 = (-0.011721902414949017) * t8;
+    t10 = x[130];
+    t3 = 0.11059791963266878 * t10;
+    t11 = t4 - t3;
+    t5 = (-0.09967652050751713) * t9;
+    t0 = C5 * t11;
+    t7 = t5 + t0;
+    t6 = 0.05327821020409536 * t9;
+    t8 = C6 * t11;
+    t10 = t6 + t8;
+    t4 = x[10];
+    t3 = (-0.0020355669173363036) * t4;
+    t5 = x[149];
+    t0 = 0.11091910276261092 * t5;
+    t9 = t3 - t0;
+    t11 = x[170];
+    t6 = C7 * t9;
+    t8 = (-0.08711421591386447) * t11;
+    t4 = t6 + t8;
+    t5 = (-C8) * t9;
+    t3 = (-0.07149278938017711) * t11;
+    t0 = t5 + t3;
+    t6 = x[50];
+    t8 = 0.000751061428239977 * t6;
+    t9 = x[109];
+    t11 = 0.11091229530079016 * t9;
+    t5 = t8 - t11;
+    t3 = x[210];
+    t6 = C9 * t5;
+    t9 = (-0.1078487661283428) * t3;
+    t8 = t6 + t9;
+    t11 = (-C10) * t5;
+    t6 = (-0.03271556553617666) * t3;
+    t9 = t11 + t6;
+    t5 = t2 + t4;
+    t3 = t1 + t0;
+    t11 = t7 + t8;
+    t6 = t10 + t9;
+    t2 = t2 - t4;
+    t4 = t1 - t0;
+    t1 = t7 - t8;
+    t0 = t10 - t9;
+    t7 = t5 + t11;
+    t8 = t3 + t6;
+    t10 = t2 + t0;
+    t9 = t4 - t1;
+    t5 = t5 - t11;
+    t11 = t3 - t6;
+    t3 = t2 - t0;
+    t6 = t4 + t1;
+    t2 = t10 + t9;
+    t0 = C1 * t2;
+    t4 = t10 * (-C11);
+    t1 = t9 * C12;
+    t2 = t0 - t1;
+    t10 = t0 + t4;
+    t9 = t5 + t11;
+    t1 = t5 - t11;
+    t0 = C2 * t9;
+    t4 = (-C2) * t1;
+    t5 = t3 + t6;
+    t11 = C0 * t5;
+    t9 = t3 * (-C11);
+    t1 = t6 * (-C12);
+    t5 = t11 - t1;
+    t3 = t11 + t9;
+    re[5] = t7;
+    im[5] = t8;
+    re[25] = t2;
+    im[25] = t10;
+    re[45] = t0;
+    im[45] = t4;
+    re[65] = t5;
+    im[65] = t3;
+    t6 = x[219];
+    t1 = x[59];
+    t11 = 0.022614471868246694 * t1;
+    t9 = x[100];
+    t7 = 0.1130382528407792 * t9;
+    t8 = t11 - t7;
+    t2 = (-0.10845723192757613) * t6;
+    t10 = C13 * t8;
+    t0 = t2 + t10;
+    t4 = 0.021573484762158795 * t6;
+    t5 = C14 * t8;
+    t3 = t4 + t5;
+    t1 = x[179];
+    t9 = x[19];
+    t11 = (-0.00677944196717133) * t9;
+    t7 = x[140];
+    t2 = 0.11069982990167095 * t7;
+    t10 = t11 - t2;
+    t6 = (-0.09388786019828327) * t1;
+    t8 = C15 * t10;
+    t4 = t6 + t8;
+    t5 = 0.06273386254444648 * t1;
+    t9 = C16 * t10;
+    t7 = t5 + t9;
+    t11 = x[20];
+    t2 = (-0.007380099337164804) * t11;
+    t6 = x[139];
+    t8 = 0.11069447376572232 * t6;
+    t1 = t2 - t8;
+    t10 = x[180];
+    t5 = C15 * t1;
+    t9 = (-0.0938924031183229) * t10;
+    t11 = t5 + t9;
+    t6 = (-C16) * t1;
+    t2 = (-0.06273689802657073) * t10;
+    t8 = t6 + t2;
+    t5 = x[60];
+    t9 = 0.025811551828905523 * t5;
+    t1 = x[99];
+    t10 = 0.11335924894760097 * t1;
+    t6 = t9 - t10;
+    t2 = x[220];
+    t5 = 0.11009685922530492 * t2;
+    t1 = x[259];
+    t9 = 0.0007555813326898759 * t1;
+    t10 = t5 + t9;
+    t2 = C13 * t6;
+    t1 = (-C14) * t10;
+    t5 = t2 + t1;
+    t9 = (-C14) * t6;
+    t2 = (-C13) * t10;
+    t1 = t9 + t2;
+    t6 = t0 + t11;
+    t10 = t3 + t8;
+    t9 = t4 + t5;
+    t2 = t7 + t1;
+    t0 = t0 - t11;
+    t11 = t3 - t8;
+    t3 = t4 - t5;
+    t8 = t7 - t1;
+    t4 = t6 + t9;
+    t5 = t10 + t2;
+    t7 = t0 + t8;
+    t1 = t11 - t3;
+    t6 = t6 - t9;
+    t9 = t10 - t2;
+    t10 = t0 - t8;
+    t2 = t11 + t3;
+    t0 = t7 + t1;
+    t8 = t7 - t1;
+    t11 = C2 * t0;
+    t3 = (-C2) * t8;
+    t7 = -t6;
+    t1 = t10 - t2;
+    t0 = t10 + t2;
+    t8 = (-C2) * t1;
+    t6 = (-C2) * t0;
+    re[10] = t4;
+    im[10] = t5;
+    re[30] = t11;
+    im[30] = t3;
+    re[50] = t9;
+    im[50] = t7;
+    re[70] = t8;
+    im[70] = t6;
+    t10 = x[209];
+    t2 = x[49];
+    t1 = (-0.0009291338389342098) * t2;
+    t0 = x[110];
+    t4 = 0.11079974707998154 * t0;
+    t5 = t1 - t4;
+    t11 = (-0.10795831680028962) * t10;
+    t3 = C9 * t5;
+    t9 = t11 + t3;
+    t7 = 0.032748797369198696 * t10;
+    t8 = C10 * t5;
+    t6 = t7 + t8;
+    t2 = x[169];
+    t0 = x[9];
+    t1 = (-0.0016653431095281137) * t0;
+    t4 = x[150];
+    t11 = 0.11097479267929677 * t4;
+    t3 = t1 - t11;
+    t10 = (-0.08707049982925406) * t2;
+    t5 = C7 * t3;
+    t7 = t10 + t5;
+    t8 = 0.07145691251671929 * t2;
+    t0 = C8 * t3;
+    t4 = t8 + t0;
+    t1 = x[30];
+    t11 = (-0.011978418421403958) * t1;
+    t10 = x[129];
+    t5 = 0.11057633396124945 * t10;
+    t2 = t11 - t5;
+    t3 = x[190];
+    t8 = C5 * t2;
+    t0 = (-0.0996959784199186) * t3;
+    t1 = t8 + t0;
+    t10 = (-C6) * t2;
+    t11 = (-0.0532886106749563) * t3;
+    t5 = t10 + t11;
+    t8 = x[70];
+    t0 = 0.06368932862731685 * t8;
+    t2 = x[89];
+    t3 = 0.11388864301218943 * t2;
+    t10 = t0 - t3;
+    t11 = x[230];
+    t8 = 0.09762044271285876 * t11;
+    t2 = x[249];
+    t0 = 0.021701284641749745 * t2;
+    t3 = t8 + t0;
+    t11 = C4 * t10;
+    t2 = (-C3) * t3;
+    t8 = t11 + t2;
+    t0 = (-C3) * t10;
+    t11 = (-C4) * t3;
+    t2 = t0 + t11;
+    t10 = t9 + t1;
+    t3 = t6 + t5;
+    t0 = t7 + t8;
+    t11 = t4 + t2;
+    t9 = t9 - t1;
+    t1 = t6 - t5;
+    t6 = t7 - t8;
+    t5 = t4 - t2;
+    t7 = t10 + t0;
+    t8 = t3 + t11;
+    t4 = t9 + t5;
+    t2 = t1 - t6;
+    t10 = t10 - t0;
+    t0 = t3 - t11;
+    t3 = t9 - t5;
+    t11 = t1 + t6;
+    t9 = t4 + t2;
+    t5 = C0 * t9;
+    t1 = t4 * (-C11);
+    t6 = t2 * (-C12);
+    t9 = t5 - t6;
+    t4 = t5 + t1;
+    t2 = t10 - t0;
+    t6 = t10 + t0;
+    t5 = (-C2) * t2;
+    t1 = (-C2) * t6;
+    t10 = t3 + t11;
+    t0 = (-C1) * t10;
+    t2 = t3 * C11;
+    t6 = t11 * (-C12);
+    t10 = t0 - t6;
+    t3 = t0 + t2;
+    re[15] = t7;
+    im[15] = t8;
+    re[35] = t9;
+    im[35] = t4;
+    re[55] = t5;
+    im[55] = t1;
+    re[75] = t10;
+    im[75] = t3;
+    t11 = re[0];
+    t6 = im[0];
+    t0 = re[5];
+    t2 = im[5];
+    t7 = re[10];
+    t8 = im[10];
+    t9 = re[15];
+    t4 = im[15];
+    t5 = t11 + t7;
+    t1 = t6 + t8;
+    t10 = t0 + t9;
+    t3 = t2 + t4;
+    t11 = t11 - t7;
+    t7 = t6 - t8;
+    t6 = t0 - t9;
+    t8 = t2 - t4;
+    t0 = t5 + t10;
+    t9 = t1 + t3;
+    t2 = t11 + t8;
+    t4 = t7 - t6;
+    t5 = t5 - t10;
+    t10 = t1 - t3;
+    t1 = t11 - t8;
+    t3 = t7 + t6;
+    re[0] = t0;
+    im[0] = t9;
+    re[5] = t2;
+    im[5] = t4;
+    re[10] = t5;
+    im[10] = t10;
+    re[15] = t1;
+    im[15] = t3;
+    t11 = re[20];
+    t8 = im[20];
+    t7 = re[25];
+    t6 = im[25];
+    t0 = re[30];
+    t9 = im[30];
+    t2 = re[35];
+    t4 = im[35];
+    t5 = t11 + t0;
+    t10 = t8 + t9;
+    t1 = t7 + t2;
+    t3 = t6 + t4;
+    t11 = t11 - t0;
+    t0 = t8 - t9;
+    t8 = t7 - t2;
+    t9 = t6 - t4;
+    t7 = t5 + t1;
+    t2 = t10 + t3;
+    t6 = t11 + t9;
+    t4 = t0 - t8;
+    t5 = t5 - t1;
+    t1 = t10 - t3;
+    t10 = t11 - t9;
+    t3 = t0 + t8;
+    re[20] = t7;
+    im[20] = t2;
+    re[25] = t6;
+    im[25] = t4;
+    re[30] = t5;
+    im[30] = t1;
+    re[35] = t10;
+    im[35] = t3;
+    t11 = re[40];
+    t9 = im[40];
+    t0 = re[45];
+    t8 = im[45];
+    t7 = re[50];
+    t2 = im[50];
+    t6 = re[55];
+    t4 = im[55];
+    t5 = t11 + t7;
+    t1 = t9 + t2;
+    t10 = t0 + t6;
+    t3 = t8 + t4;
+    t11 = t11 - t7;
+    t7 = t9 - t2;
+    t9 = t0 - t6;
+    t2 = t8 - t4;
+    t0 = t5 + t10;
+    t6 = t1 + t3;
+    t8 = t11 + t2;
+    t4 = t7 - t9;
+    t5 = t5 - t10;
+    t10 = t1 - t3;
+    t1 = t11 - t2;
+    t3 = t7 + t9;
+    re[40] = t0;
+    im[40] = t6;
+    re[45] = t8;
+    im[45] = t4;
+    re[50] = t5;
+    im[50] = t10;
+    re[55] = t1;
+    im[55] = t3;
+    t11 = re[60];
+    t2 = im[60];
+    t7 = re[65];
+    t9 = im[65];
+    t0 = re[70];
+    t6 = im[70];
+    t8 = re[75];
+    t4 = im[75];
+    t5 = t11 + t0;
+    t10 = t2 + t6;
+    t1 = t7 + t8;
+    t3 = t9 + t4;
+    t11 = t11 - t0;
+    t0 = t2 - t6;
+    t2 = t7 - t8;
+    t6 = t9 - t4;
+    t7 = t5 + t1;
+    t8 = t10 + t3;
+    t9 = t11 + t6;
+    t4 = t0 - t2;
+    t5 = t5 - t1;
+    t1 = t10 - t3;
+    t10 = t11 - t6;
+    t3 = t0 + t2;
+    re[60] = t7;
+    im[60] = t8;
+    re[65] = t9;
+    im[65] = t4;
+    re[70] = t5;
+    im[70] = t1;
+    re[75] = t10;
+    im[75] = t3;
+    t11 = x[207];
+    t6 = x[47];
+    t0 = (-0.0038847049945580823) * t6;
+    t2 = x[112];
+    t7 = 0.11062374303997037 * t2;
+    t8 = t0 - t7;
+    t9 = (-0.1074652341983583) * t11;
+    t4 = 0.3090169943749474 * t8;
+    t5 = t9 + t4;
+    t1 = 0.034917571251328716 * t11;
+    t10 = 0.9510565162951535 * t8;
+    t3 = t1 + t10;
+    t6 = x[167];
+    t2 = x[7];
+    t0 = (-0.0010489932501280576) * t2;
+    t7 = x[152];
+    t9 = 0.11110787961912116 * t7;
+    t4 = t0 - t9;
+    t11 = (-0.08554815916372331) * t6;
+    t8 = 0.6494480483301837 * t4;
+    t1 = t11 + t8;
+    t10 = 0.07306503041869054 * t6;
+    t2 = 0.7604059656000309 * t4;
+    t7 = t10 + t2;
+    t0 = x[32];
+    t9 = (-0.01229803461763309) * t0;
+    t11 = x[127];
+    t8 = 0.11052908854823514 * t11;
+    t6 = t9 - t8;
+    t4 = x[192];
+    t10 = 0.45399049973954675 * t6;
+    t2 = (-0.10076606709277382) * t4;
+    t0 = t10 + t2;
+    t11 = (-0.8910065241883679) * t6;
+    t9 = (-0.051342875629231344) * t4;
+    t8 = t11 + t9;
+    t10 = x[72];
+    t2 = 0.07168644812391273 * t10;
+    t6 = x[87];
+    t4 = 0.11227828538840914 * t6;
+    t11 = t2 - t4;
+    t9 = x[232];
+    t10 = 0.09240371932400153 * t9;
+    t6 = x[247];
+    t2 = 0.029643940889860314 * t6;
+    t4 = t10 + t2;
+    t9 = C17 * t11;
+    t6 = (-C18) * t4;
+    t10 = t9 + t6;
+    t2 = (-C18) * t11;
+    t9 = (-C17) * t4;
+    t6 = t2 + t9;
+    t11 = t5 + t0;
+    t4 = t3 + t8;
+    t2 = t1 + t10;
+    t9 = t7 + t6;
+    t5 = t5 - t0;
+    t0 = t3 - t8;
+    t3 = t1 - t10;
+    t8 = t7 - t6;
+    t1 = t11 + t2;
+    t10 = t4 + t9;
+    t7 = t5 + t8;
+    t6 = t0 - t3;
+    t11 = t11 - t2;
+    t2 = t4 - t9;
+    t4 = t5 - t8;
+    t9 = t0 + t3;
+    re[16] = t1;
+    im[16] = t10;
+    re[36] = t7;
+    im[36] = t6;
+    re[56] = t11;
+    im[56] = t2;
+    re[76] = t4;
+    im[76] = t9;
+    t5 = x[197];
+    t8 = x[37];
+    t0 = (-0.01180210664863542) * t8;
+    t3 = x[122];
+    t1 = 0.11041928664604037 * t3;
+    t10 = t0 - t1;
+    t7 = (-0.10371693036449159) * t5;
+    t6 = 0.40074883310314097 * t10;
+    t11 = t7 + t6;
+    t2 = 0.04536671596011348 * t5;
+    t4 = 0.916187957117136 * t10;
+    t9 = t2 + t4;
+    t8 = x[2];
+    t3 = (-0.0001860937495776424) * t8;
+    t0 = x[157];
+    t1 = 0.11154852479788367 * t0;
+    t7 = t3 - t1;
+    t6 = x[162];
+    t5 = 0.6930873625456359 * t7;
+    t10 = (-0.08077802889023449) * t6;
+    t2 = t5 + t10;
+    t4 = (-0.7208535967029188) * t7;
+    t8 = (-0.07766657647439204) * t6;
+    t0 = t4 + t8;
+    t3 = x[42];
+    t1 = (-0.009144168244333128) * t3;
+    t5 = x[117];
+    t10 = 0.11041047095992741 * t5;
+    t7 = t1 - t10;
+    t6 = x[202];
+    t4 = 0.36447049987914965 * t7;
+    t8 = (-0.10542647434870339) * t6;
+    t3 = t4 + t8;
+    t5 = (-0.9312149347588036) * t7;
+    t1 = (-0.04126312666615553) * t6;
+    t10 = t5 + t1;
+    t4 = x[237];
+    t8 = 0.07473628424426193 * t4;
+    t7 = x[242];
+    t6 = 0.052335362309534304 * t7;
+    t5 = t8 + t6;
+    t1 = x[77];
+    t4 = 0.09010724756863295 * t1;
+    t7 = x[82];
+    t8 = 0.10415562708923899 * t7;
+    t6 = t4 - t8;
+    t1 = (-C19) * t5;
+    t7 = C20 * t6;
+    t4 = t1 + t7;
+    t8 = C20 * t5;
+    t1 = C19 * t6;
+    t7 = t8 + t1;
+    t5 = t11 + t3;
+    t6 = t9 + t10;
+    t8 = t2 + t4;
+    t1 = t0 + t7;
+    t11 = t11 - t3;
+    t3 = t9 - t10;
+    t9 = t2 - t4;
+    t10 = t0 - t7;
+    t2 = t5 + t8;
+    t4 = t6 + t1;
+    t0 = t11 + t10;
+    t7 = t3 - t9;
+    t5 = t5 - t8;
+    t8 = t6 - t1;
+    t6 = t11 - t10;
+    t1 = t3 + t9;
+    t11 = t0 + t7;
+    t10 = C1 * t11;
+    t3 = t0 * (-C11);
+    t9 = t7 * C12;
+    t11 = t10 - t9;
+    t0 = t10 + t3;
+    t7 = t5 + t8;
+    t9 = t5 - t8;
+    t10 = C2 * t7;
+    t3 = (-C2) * t9;
+    t5 = t6 + t1;
+    t8 = C0 * t5;
+    t7 = t6 * (-C11);
+    t9 = t1 * (-C12);
+    t5 = t8 - t9;
+    t6 = t8 + t7;
+    re[21] = t2;
+    im[21] = t4;
+    re[41] = t11;
+    im[41] = t0;
+    re[61] = t10;
+    im[61] = t3;
+    re[1] = t5;
+    im[1] = t6;
+    t1 = x[187];
+    t9 = x[27];
+    t8 = (-0.011035818916886387) * t9;
+    t7 = x[132];
+    t2 = 0.11063464351695831 * t7;
+    t4 = t8 - t2;
+    t11 = (-0.09857852605398634) * t1;
+    t0 = 0.4886212414969549 * t4;
+    t10 = t11 + t0;
+    t3 = 0.055206627187945216 * t1;
+    t5 = 0.8724960070727972 * t4;
+    t6 = t3 + t5;
+    t9 = x[12];
+    t7 = (-0.0028939996046675) * t9;
+    t8 = x[147];
+    t2 = 0.11082964849856157 * t8;
+    t11 = t7 - t2;
+    t0 = x[172];
+    t1 = 0.619093949309834 * t11;
+    t4 = (-0.08857252340863211) * t0;
+    t3 = t1 + t4;
+    t5 = (-0.785316930880745) * t11;
+    t9 = (-0.06982494730616569) * t0;
+    t8 = t5 + t9;
+    t7 = x[52];
+    t2 = 0.00453933702315795 * t7;
+    t1 = x[107];
+    t4 = 0.11119516071904345 * t1;
+    t11 = t2 - t4;
+    t0 = x[212];
+    t5 = 0.27144044986507426 * t11;
+    t9 = (-0.10819437085098076) * t0;
+    t7 = t5 + t9;
+    t1 = (-0.9624552364536473) * t11;
+    t2 = (-0.030513968426076822) * t0;
+    t4 = t1 + t2;
+    t5 = x[227];
+    t9 = 0.10345803506270192 * t5;
+    t11 = x[252];
+    t0 = 0.01193881895517893 * t11;
+    t1 = t9 + t0;
+    t2 = x[67];
+    t5 = 0.05160761537146343 * t2;
+    t11 = x[92];
+    t9 = 0.11486653517215203 * t11;
+    t0 = t5 - t9;
+    t2 = (-C21) * t1;
+    t11 = C22 * t0;
+    t5 = t2 + t11;
+    t9 = C22 * t1;
+    t2 = C21 * t0;
+    t11 = t9 + t2;
+    t1 = t10 + t7;
+    t0 = t6 + t4;
+    t9 = t3 + t5;
+    t2 = t8 + t11;
+    t10 = t10 - t7;
+    t7 = t6 - t4;
+    t6 = t3 - t5;
+    t4 = t8 - t11;
+    t3 = t1 + t9;
+    t5 = t0 + t2;
+    t8 = t10 + t4;
+    t11 = t7 - t6;
+    t1 = t1 - t9;
+    t9 = t0 - t2;
+    t0 = t10 - t4;
+    t2 = t7 + t6;
+    t10 = t8 + t11;
+    t4 = t8 - t11;
+    t7 = C2 * t10;
+    t6 = (-C2) * t4;
+    t8 = -t1;
+    t11 = t0 - t2;
+    t10 = t0 + t2;
+    t4 = (-C2) * t11;
+    t1 = (-C2) * t10;
+    re[26] = t3;
+    im[26] = t5;
+    re[46] = t7;
+    im[46] = t6;
+    re[66] = t9;
+    im[66] = t8;
+    re[6] = t4;
+    im[6] = t1;
+    t0 = x[177];
+    t2 = x[17];
+    t11 = (-0.005583714262614551) * t2;
+    t10 = x[142];
+    t3 = 0.1107159369533963 * t10;
+    t5 = t11 - t3;
+    t7 = (-0.09262458798849857) * t0;
+    t6 = 0.5717879602276122 * t5;
+    t9 = t7 + t6;
+    t8 = 0.06455574237567702 * t0;
+    t4 = 0.8204014435255136 * t5;
+    t1 = t8 + t4;
+    t2 = x[22];
+    t10 = (-0.008554277310528689) * t2;
+    t11 = x[137];
+    t3 = 0.11068475619575513 * t11;
+    t7 = t10 - t3;
+    t6 = x[182];
+    t0 = 0.5391383229110002 * t7;
+    t5 = (-0.09511441126395447) * t6;
+    t8 = t0 + t5;
+    t4 = (-0.8422172337162865) * t7;
+    t2 = (-0.0608866954042761) * t6;
+    t11 = t4 + t2;
+    t10 = x[62];
+    t3 = 0.032625849527973955 * t10;
+    t0 = x[97];
+    t5 = 0.1140404886851624 * t0;
+    t7 = t3 - t5;
+    t6 = x[222];
+    t4 = 0.1089119239146507 * t6;
+    t2 = x[257];
+    t10 = 0.0024407325566721005 * t2;
+    t0 = t4 + t10;
+    t3 = C23 * t7;
+    t5 = (-C24) * t0;
+    t6 = t3 + t5;
+    t2 = (-C24) * t7;
+    t4 = (-C23) * t0;
+    t10 = t2 + t4;
+    t3 = x[217];
+    t5 = x[57];
+    t7 = 0.016671591989872066 * t5;
+    t0 = x[102];
+    t2 = 0.11234550604833171 * t0;
+    t4 = t7 - t2;
+    t5 = (-0.10867878872928194) * t3;
+    t0 = 0.21430915306505077 * t4;
+    t7 = t5 + t0;
+    t2 = 0.023844873796381956 * t3;
+    t5 = 0.9767658813208724 * t4;
+    t0 = t2 + t5;
+    t3 = t9 + t6;
+    t4 = t1 + t10;
+    t2 = t8 + t7;
+    t5 = t11 + t0;
+    t9 = t9 - t6;
+    t6 = t1 - t10;
+    t1 = t8 - t7;
+    t10 = t11 - t0;
+    t8 = t3 + t2;
+    t7 = t4 + t5;
+    t11 = t9 + t10;
+    t0 = t6 - t1;
+    t3 = t3 - t2;
+    t2 = t4 - t5;
+    t4 = t9 - t10;
+    t5 = t6 + t1;
+    t9 = t11 + t0;
+    t10 = C0 * t9;
+    t6 = t11 * (-C11);
+    t1 = t0 * (-C12);
+    t9 = t10 - t1;
+    t11 = t10 + t6;
+    t0 = t3 - t2;
+    t1 = t3 + t2;
+    t10 = (-C2) * t0;
+    t6 = (-C2) * t1;
+    t3 = t4 + t5;
+    t2 = (-C1) * t3;
+    t0 = t4 * C11;
+    t1 = t5 * (-C12);
+    t3 = t2 - t1;
+    t4 = t2 + t0;
+    re[31] = t8;
+    im[31] = t7;
+    re[51] = t9;
+    im[51] = t11;
+    re[71] = t10;
+    im[71] = t6;
+    re[11] = t3;
+    im[11] = t4;
+    t5 = re[16];
+    t1 = im[16];
+    t2 = re[21];
+    t0 = im[21];
+    t8 = re[26];
+    t7 = im[26];
+    t9 = re[31];
+    t11 = im[31];
+    t10 = t5 + t8;
+    t6 = t1 + t7;
+    t3 = t2 + t9;
+    t4 = t0 + t11;
+    t5 = t5 - t8;
+    t8 = t1 - t7;
+    t1 = t2 - t9;
+    t7 = t0 - t11;
+    t2 = t10 + t3;
+    t9 = t6 + t4;
+    t0 = t5 + t7;
+    t11 = t8 - t1;
+    t10 = t10 - t3;
+    t3 = t6 - t4;
+    t6 = t5 - t7;
+    t4 = t8 + t1;
+    re[16] = t2;
+    im[16] = t9;
+    re[21] = t0;
+    im[21] = t11;
+    re[26] = t10;
+    im[26] = t3;
+    re[31] = t6;
+    im[31] = t4;
+    t5 = re[36];
+    t7 = im[36];
+    t8 = re[41];
+    t1 = im[41];
+    t2 = re[46];
+    t9 = im[46];
+    t0 = re[51];
+    t11 = im[51];
+    t10 = t5 + t2;
+    t3 = t7 + t9;
+    t6 = t8 + t0;
+    t4 = t1 + t11;
+    t5 = t5 - t2;
+    t2 = t7 - t9;
+    t7 = t8 - t0;
+    t9 = t1 - t11;
+    t8 = t10 + t6;
+    t0 = t3 + t4;
+    t1 = t5 + t9;
+    t11 = t2 - t7;
+    t10 = t10 - t6;
+    t6 = t3 - t4;
+    t3 = t5 - t9;
+    t4 = t2 + t7;
+    re[36] = t8;
+    im[36] = t0;
+    re[41] = t1;
+    im[41] = t11;
+    re[46] = t10;
+    im[46] = t6;
+    re[51] = t3;
+    im[51] = t4;
+    t5 = re[56];
+    t9 = im[56];
+    t2 = re[61];
+    t7 = im[61];
+    t8 = re[66];
+    t0 = im[66];
+    t1 = re[71];
+    t11 = im[71];
+    t10 = t5 + t8;
+    t6 = t9 + t0;
+    t3 = t2 + t1;
+    t4 = t7 + t11;
+    t5 = t5 - t8;
+    t8 = t9 - t0;
+    t9 = t2 - t1;
+    t0 = t7 - t11;
+    t2 = t10 + t3;
+    t1 = t6 + t4;
+    t7 = t5 + t0;
+    t11 = t8 - t9;
+    t10 = t10 - t3;
+    t3 = t6 - t4;
+    t6 = t5 - t0;
+    t4 = t8 + t9;
+    re[56] = t2;
+    im[56] = t1;
+    re[61] = t7;
+    im[61] = t11;
+    re[66] = t10;
+    im[66] = t3;
+    re[71] = t6;
+    im[71] = t4;
+    t5 = re[76];
+    t0 = im[76];
+    t8 = re[1];
+    t9 = im[1];
+    t2 = re[6];
+    t1 = im[6];
+    t7 = re[11];
+    t11 = im[11];
+    t10 = t5 + t2;
+    t3 = t0 + t1;
+    t6 = t8 + t7;
+    t4 = t9 + t11;
+    t5 = t5 - t2;
+    t2 = t0 - t1;
+    t0 = t8 - t7;
+    t1 = t9 - t11;
+    t8 = t10 + t6;
+    t7 = t3 + t4;
+    t9 = t5 + t1;
+    t11 = t2 - t0;
+    t10 = t10 - t6;
+    t6 = t3 - t4;
+    t3 = t5 - t1;
+    t4 = t2 + t0;
+    re[76] = t8;
+    im[76] = t7;
+    re[1] = t9;
+    im[1] = t11;
+    re[6] = t10;
+    im[6] = t6;
+    re[11] = t3;
+    im[11] = t4;
+    t5 = x[175];
+    t1 = x[15];
+    t2 = (-0.004435316851490209) * t1;
+    t0 = x[144];
+    t8 = 0.11074551322394617 * t0;
+    t7 = t2 - t8;
+    t9 = (-0.09131487258754427) * t5;
+    t11 = C25 * t7;
+    t10 = t9 + t11;
+    t6 = 0.06634413837424184 * t5;
+    t3 = C26 * t7;
+    t4 = t6 + t3;
+    t1 = x[24];
+    t0 = (-0.009649905136779869) * t1;
+    t2 = x[135];
+    t8 = 0.11067111402040077 * t2;
+    t9 = t0 - t8;
+    t11 = x[184];
+    t5 = C27 * t9;
+    t7 = (-0.09630337734254205) * t11;
+    t6 = t5 + t7;
+    t3 = (-C28) * t9;
+    t1 = (-0.05901478553604703) * t11;
+    t2 = t3 + t1;
+    t0 = x[64];
+    t8 = 0.03993813265887571 * t0;
+    t5 = x[95];
+    t7 = 0.11460539079791128 * t5;
+    t9 = t8 - t7;
+    t11 = x[224];
+    t3 = 0.10724785486810427 * t11;
+    t1 = x[255];
+    t0 = 0.005228528894598489 * t1;
+    t5 = t3 + t0;
+    t8 = C29 * t9;
+    t7 = (-C30) * t5;
+    t11 = t8 + t7;
+    t1 = (-C30) * t9;
+    t3 = (-C29) * t5;
+    t0 = t1 + t3;
+    t8 = x[215];
+    t7 = x[55];
+    t9 = 0.011350651572530776 * t7;
+    t5 = x[104];
+    t1 = 0.11179661430082742 * t5;
+    t3 = t9 - t1;
+    t7 = (-0.10872085958045866) * t8;
+    t5 = C31 * t3;
+    t9 = t7 + t5;
+    t1 = 0.02610156905420006 * t8;
+    t7 = C32 * t3;
+    t5 = t1 + t7;
+    t8 = t10 + t11;
+    t3 = t4 + t0;
+    t1 = t6 + t9;
+    t7 = t2 + t5;
+    t10 = t10 - t11;
+    t11 = t4 - t0;
+    t4 = t6 - t9;
+    t0 = t2 - t5;
+    t6 = t8 + t1;
+    t9 = t3 + t7;
+    t2 = t10 + t0;
+    t5 = t11 - t4;
+    t8 = t8 - t1;
+    t1 = t3 - t7;
+    t3 = t10 - t0;
+    t7 = t11 + t4;
+    re[32] = t6;
+    im[32] = t9;
+    re[52] = t2;
+    im[52] = t5;
+    re[72] = t8;
+    im[72] = t1;
+    re[12] = t3;
+    im[12] = t7;
+    t10 = x[165];
+    t0 = x[5];
+    t11 = (-0.0005953093527673472) * t0;
+    t4 = x[154];
+    t6 = 0.11126804657147886 * t4;
+    t9 = t11 - t6;
+    t2 = (-0.08397607735280893) * t10;
+    t5 = C33 * t9;
+    t8 = t2 + t5;
+    t1 = 0.0746230003108489 * t10;
+    t3 = C34 * t9;
+    t7 = t1 + t3;
+    t0 = x[34];
+    t4 = (-0.01233443984786758) * t0;
+    t11 = x[125];
+    t6 = 0.1104805187861068 * t11;
+    t2 = t4 - t6;
+    t5 = x[194];
+    t10 = C35 * t2;
+    t9 = (-0.10179942739431713) * t5;
+    t1 = t10 + t9;
+    t3 = (-C36) * t2;
+    t0 = (-0.04937626622642878) * t5;
+    t11 = t3 + t0;
+    t4 = x[74];
+    t6 = 0.07941843250116053 * t4;
+    t10 = x[85];
+    t9 = 0.10976184087525823 * t10;
+    t2 = t6 - t9;
+    t5 = x[234];
+    t3 = 0.08609343893725221 * t5;
+    t0 = x[245];
+    t4 = 0.03840702414922375 * t0;
+    t10 = t3 + t4;
+    t6 = C37 * t2;
+    t9 = (-C38) * t10;
+    t5 = t6 + t9;
+    t0 = (-C38) * t2;
+    t3 = (-C37) * t10;
+    t4 = t0 + t3;
+    t6 = x[205];
+    t9 = x[45];
+    t2 = (-0.006334395575339451) * t9;
+    t10 = x[114];
+    t0 = 0.11050400323230107 * t10;
+    t3 = t2 - t0;
+    t9 = (-0.1068746401522566) * t6;
+    t10 = C39 * t3;
+    t2 = t9 + t10;
+    t0 = 0.03706089485203431 * t6;
+    t9 = C40 * t3;
+    t10 = t0 + t9;
+    t6 = t8 + t5;
+    t3 = t7 + t4;
+    t0 = t1 + t2;
+    t9 = t11 + t10;
+    t8 = t8 - t5;
+    t5 = t7 - t4;
+    t7 = t1 - t2;
+    t4 = t11 - t10;
+    t1 = t6 + t0;
+    t2 = t3 + t9;
+    t11 = t8 + t4;
+    t10 = t5 - t7;
+    t6 = t6 - t0;
+    t0 = t3 - t9;
+    t3 = t8 - t4;
+    t9 = t5 + t7;
+    t8 = t11 + t10;
+    t4 = C1 * t8;
+    t5 = t11 * (-C11);
+    t7 = t10 * C12;
+    t8 = t4 - t7;
+    t11 = t4 + t5;
+    t10 = t6 + t0;
+    t7 = t6 - t0;
+    t4 = C2 * t10;
+    t5 = (-C2) * t7;
+    t6 = t3 + t9;
+    t0 = C0 * t6;
+    t10 = t3 * (-C11);
+    t7 = t9 * (-C12);
+    t6 = t0 - t7;
+    t3 = t0 + t10;
+    re[37] = t1;
+    im[37] = t2;
+    re[57] = t8;
+    im[57] = t11;
+    re[77] = t4;
+    im[77] = t5;
+    re[17] = t6;
+    im[17] = t3;
+    t9 = x[4];
+    t7 = (-0.0004255556183502251) * t9;
+    t0 = x[155];
+    t10 = 0.11135695243176677 * t0;
+    t1 = t7 - t10;
+    t2 = x[164];
+    t8 = C41 * t1;
+    t11 = (-0.08242890243939151) * t2;
+    t4 = t8 + t11;
+    t5 = (-C42) * t1;
+    t6 = (-0.07619649365279549) * t2;
+    t3 = t5 + t6;
+    t9 = x[44];
+    t0 = (-0.007381472594023432) * t9;
+    t7 = x[115];
+    t10 = 0.11046233528858285 * t7;
+    t8 = t0 - t10;
+    t11 = x[204];
+    t1 = C43 * t8;
+    t2 = (-0.10616642920315997) * t11;
+    t5 = t1 + t2;
+    t6 = (-C44) * t8;
+    t9 = (-0.03916686354824725) * t11;
+    t7 = t6 + t9;
+    t0 = x[235];
+    t10 = 0.08254476918132375 * t0;
+    t1 = x[244];
+    t2 = 0.04299033363724483 * t1;
+    t8 = t10 + t2;
+    t11 = x[75];
+    t6 = 0.08312519782022552 * t11;
+    t9 = x[84];
+    t0 = 0.10814034736032908 * t9;
+    t1 = t6 - t0;
+    t10 = (-C45) * t8;
+    t2 = C46 * t1;
+    t11 = t10 + t2;
+    t9 = C46 * t8;
+    t6 = C45 * t1;
+    t0 = t9 + t6;
+    t10 = x[195];
+    t2 = x[35];
+    t8 = (-0.01223824317580326) * t2;
+    t1 = x[124];
+    t9 = 0.11045771058109824 * t1;
+    t6 = t8 - t9;
+    t2 = (-0.10277045950974159) * t10;
+    t1 = C47 * t6;
+    t8 = t2 + t1;
+    t9 = 0.04737783077058791 * t10;
+    t2 = C48 * t6;
+    t1 = t9 + t2;
+    t10 = t4 + t11;
+    t6 = t3 + t0;
+    t9 = t5 + t8;
+    t2 = t7 + t1;
+    t4 = t4 - t11;
+    t11 = t3 - t0;
+    t3 = t5 - t8;
+    t0 = t7 - t1;
+    t5 = t10 + t9;
+    t8 = t6 + t2;
+    t7 = t4 + t0;
+    t1 = t11 - t3;
+    t10 = t10 - t9;
+    t9 = t6 - t2;
+    t6 = t4 - t0;
+    t2 = t11 + t3;
+    t4 = t7 + t1;
+    t0 = t7 - t1;
+    t11 = C2 * t4;
+    t3 = (-C2) * t0;
+    t7 = -t10;
+    t1 = t6 - t2;
+    t4 = t6 + t2;
+    t0 = (-C2) * t1;
+    t10 = (-C2) * t4;
+    re[42] = t5;
+    im[42] = t8;
+    re[62] = t11;
+    im[62] = t3;
+    re[2] = t9;
+    im[2] = t7;
+    re[22] = t0;
+    im[22] = t10;
+    t6 = x[14];
+    t2 = (-0.0038925446683325056) * t6;
+    t1 = x[145];
+    t4 = 0.11076752726219304 * t1;
+    t5 = t2 - t4;
+    t8 = x[174];
+    t11 = C49 * t5;
+    t3 = (-0.08997680474140714) * t8;
+    t9 = t11 + t3;
+    t7 = (-C50) * t5;
+    t0 = (-0.06811065897103127) * t8;
+    t10 = t7 + t0;
+    t6 = x[54];
+    t1 = 0.008925661328443739 * t6;
+    t2 = x[105];
+    t4 = 0.11156923130290064 * t2;
+    t11 = t1 - t4;
+    t3 = x[214];
+    t5 = C51 * t11;
+    t8 = (-0.10840792316356844) * t3;
+    t7 = t5 + t8;
+    t0 = (-C52) * t11;
+    t6 = (-0.02828866593264248) * t3;
+    t2 = t0 + t6;
+    t1 = x[225];
+    t4 = 0.1061795099390396 * t1;
+    t5 = x[254];
+    t8 = 0.007116496653311107 * t5;
+    t11 = t4 + t8;
+    t3 = x[65];
+    t0 = 0.04375031221246988 * t3;
+    t6 = x[94];
+    t1 = 0.11479287347018707 * t6;
+    t5 = t0 - t1;
+    t4 = (-C53) * t11;
+    t8 = C54 * t5;
+    t3 = t4 + t8;
+    t6 = C54 * t11;
+    t0 = C53 * t5;
+    t1 = t6 + t0;
+    t4 = x[185];
+    t8 = x[25];
+    t11 = (-0.010152208455441044) * t8;
+    t5 = x[134];
+    t6 = 0.11066142996104605 * t5;
+    t0 = t11 - t6;
+    t8 = (-0.09745201944813593) * t4;
+    t5 = C55 * t0;
+    t11 = t8 + t5;
+    t6 = 0.05711761694611899 * t4;
+    t8 = C56 * t0;
+    t5 = t6 + t8;
+    t4 = t9 + t3;
+    t0 = t10 + t1;
+    t6 = t7 + t11;
+    t8 = t2 + t5;
+    t9 = t9 - t3;
+    t3 = t10 - t1;
+    t10 = t7 - t11;
+    t1 = t2 - t5;
+    t7 = t4 + t6;
+    t11 = t0 + t8;
+    t2 = t9 + t1;
+    t5 = t3 - t10;
+    t4 = t4 - t6;
+    t6 = t0 - t8;
+    t0 = t9 - t1;
+    t8 = t3 + t10;
+    t9 = t2 + t5;
+    t1 = C0 * t9;
+    t3 = t2 * (-C11);
+    t10 = t5 * (-C12);
+    t9 = t1 - t10;
+    t2 = t1 + t3;
+    t5 = t4 - t6;
+    t10 = t4 + t6;
+    t1 = (-C2) * t5;
+    t3 = (-C2) * t10;
+    t4 = t0 + t8;
+    t6 = (-C1) * t4;
+    t5 = t0 * C11;
+    t10 = t8 * (-C12);
+    t4 = t6 - t10;
+    t0 = t6 + t5;
+    re[47] = t7;
+    im[47] = t11;
+    re[67] = t9;
+    im[67] = t2;
+    re[7] = t1;
+    im[7] = t3;
+    re[27] = t4;
+    im[27] = t0;
+    t8 = re[32];
+    t10 = im[32];
+    t6 = re[37];
+    t5 = im[37];
+    t7 = re[42];
+    t11 = im[42];
+    t9 = re[47];
+    t2 = im[47];
+    t1 = t8 + t7;
+    t3 = t10 + t11;
+    t4 = t6 + t9;
+    t0 = t5 + t2;
+    t8 = t8 - t7;
+    t7 = t10 - t11;
+    t10 = t6 - t9;
+    t11 = t5 - t2;
+    t6 = t1 + t4;
+    t9 = t3 + t0;
+    t5 = t8 + t11;
+    t2 = t7 - t10;
+    t1 = t1 - t4;
+    t4 = t3 - t0;
+    t3 = t8 - t11;
+    t0 = t7 + t10;
+    re[32] = t6;
+    im[32] = t9;
+    re[37] = t5;
+    im[37] = t2;
+    re[42] = t1;
+    im[42] = t4;
+    re[47] = t3;
+    im[47] = t0;
+    t8 = re[52];
+    t11 = im[52];
+    t7 = re[57];
+    t10 = im[57];
+    t6 = re[62];
+    t9 = im[62];
+    t5 = re[67];
+    t2 = im[67];
+    t1 = t8 + t6;
+    t4 = t11 + t9;
+    t3 = t7 + t5;
+    t0 = t10 + t2;
+    t8 = t8 - t6;
+    t6 = t11 - t9;
+    t11 = t7 - t5;
+    t9 = t10 - t2;
+    t7 = t1 + t3;
+    t5 = t4 + t0;
+    t10 = t8 + t9;
+    t2 = t6 - t11;
+    t1 = t1 - t3;
+    t3 = t4 - t0;
+    t4 = t8 - t9;
+    t0 = t6 + t11;
+    re[52] = t7;
+    im[52] = t5;
+    re[57] = t10;
+    im[57] = t2;
+    re[62] = t1;
+    im[62] = t3;
+    re[67] = t4;
+    im[67] = t0;
+    t8 = re[72];
+    t9 = im[72];
+    t6 = re[77];
+    t11 = im[77];
+    t7 = re[2];
+    t5 = im[2];
+    t10 = re[7];
+    t2 = im[7];
+    t1 = t8 + t7;
+    t3 = t9 + t5;
+    t4 = t6 + t10;
+    t0 = t11 + t2;
+    t8 = t8 - t7;
+    t7 = t9 - t5;
+    t9 = t6 - t10;
+    t5 = t11 - t2;
+    t6 = t1 + t4;
+    t10 = t3 + t0;
+    t11 = t8 + t5;
+    t2 = t7 - t9;
+    t1 = t1 - t4;
+    t4 = t3 - t0;
+    t3 = t8 - t5;
+    t0 = t7 + t9;
+    re[72] = t6;
+    im[72] = t10;
+    re[77] = t11;
+    im[77] = t2;
+    re[2] = t1;
+    im[2] = t4;
+    re[7] = t3;
+    im[7] = t0;
+    t8 = re[12];
+    t5 = im[12];
+    t7 = re[17];
+    t9 = im[17];
+    t6 = re[22];
+    t10 = im[22];
+    t11 = re[27];
+    t2 = im[27];
+    t1 = t8 + t6;
+    t4 = t5 + t10;
+    t3 = t7 + t11;
+    t0 = t9 + t2;
+    t8 = t8 - t6;
+    t6 = t5 - t10;
+    t5 = t7 - t11;
+    t10 = t9 - t2;
+    t7 = t1 + t3;
+    t11 = t4 + t0;
+    t9 = t8 + t10;
+    t2 = t6 - t5;
+    t1 = t1 - t3;
+    t3 = t4 - t0;
+    t4 = t8 - t10;
+    t0 = t6 + t5;
+    re[12] = t7;
+    im[12] = t11;
+    re[17] = t9;
+    im[17] = t2;
+    re[22] = t1;
+    im[22] = t3;
+    re[27] = t4;
+    im[27] = t0;
+    t8 = x[16];
+    t10 = (-0.005000628436747556) * t8;
+    t6 = x[143];
+    t5 = 0.11072854649028864 * t6;
+    t7 = t10 - t5;
+    t11 = x[176];
+    t9 = C25 * t7;
+    t2 = (-0.09132886459928169) * t11;
+    t1 = t9 + t2;
+    t3 = (-C26) * t7;
+    t4 = (-0.06635430416582143) * t11;
+    t0 = t3 + t4;
+    t8 = x[56];
+    t6 = 0.013932619668397829 * t8;
+    t10 = x[103];
+    t5 = 0.11205439852686436 * t10;
+    t9 = t6 - t5;
+    t2 = x[216];
+    t7 = C31 * t9;
+    t11 = (-0.10847074425246203) * t2;
+    t3 = t7 + t11;
+    t4 = (-C32) * t9;
+    t8 = (-0.026041521676627714) * t2;
+    t10 = t4 + t8;
+    t6 = x[223];
+    t5 = 0.108151139331365 * t6;
+    t7 = x[256];
+    t11 = 0.0036761770928009766 * t7;
+    t9 = t5 + t11;
+    t2 = x[63];
+    t4 = 0.03622537124595676 * t2;
+    t8 = x[96];
+    t6 = 0.11434765455550672 * t8;
+    t7 = t4 - t6;
+    t5 = (-C30) * t9;
+    t11 = C29 * t7;
+    t2 = t5 + t11;
+    t8 = C29 * t9;
+    t4 = C30 * t7;
+    t6 = t8 + t4;
+    t5 = x[183];
+    t11 = x[23];
+    t9 = (-0.009115290867001715) * t11;
+    t7 = x[136];
+    t8 = 0.1106787773094936 * t7;
+    t4 = t9 - t8;
+    t11 = (-0.0962967093919274) * t5;
+    t7 = C27 * t4;
+    t9 = t11 + t7;
+    t8 = 0.05901069941065509 * t5;
+    t11 = C28 * t4;
+    t7 = t8 + t11;
+    t5 = t1 + t2;
+    t4 = t0 + t6;
+    t8 = t3 + t9;
+    t11 = t10 + t7;
+    t1 = t1 - t2;
+    t2 = t0 - t6;
+    t0 = t3 - t9;
+    t6 = t10 - t7;
+    t3 = t5 + t8;
+    t9 = t4 + t11;
+    t10 = t1 + t6;
+    t7 = t2 - t0;
+    t5 = t5 - t8;
+    t8 = t4 - t11;
+    t4 = t1 - t6;
+    t11 = t2 + t0;
+    re[48] = t3;
+    im[48] = t9;
+    re[68] = t10;
+    im[68] = t7;
+    re[8] = t5;
+    im[8] = t8;
+    re[28] = t4;
+    im[28] = t11;
+    t1 = x[26];
+    t6 = (-0.010616155070436837) * t1;
+    t2 = x[133];
+    t0 = 0.11064927487813397 * t2;
+    t3 = t6 - t0;
+    t9 = x[186];
+    t10 = C55 * t3;
+    t7 = (-0.09746272478152065) * t9;
+    t5 = t10 + t7;
+    t8 = (-C56) * t3;
+    t4 = (-0.05712389145058808) * t9;
+    t11 = t8 + t4;
+    t1 = x[66];
+    t2 = 0.04764581941606944 * t1;
+    t6 = x[93];
+    t0 = 0.11488758850671385 * t6;
+    t10 = t2 - t0;
+    t7 = x[226];
+    t3 = 0.10492339967141712 * t7;
+    t9 = x[253];
+    t8 = 0.009352418308382831 * t9;
+    t4 = t3 + t8;
+    t1 = C54 * t10;
+    t6 = (-C53) * t4;
+    t2 = t1 + t6;
+    t0 = (-C53) * t10;
+    t7 = (-C54) * t4;
+    t9 = t0 + t7;
+    t3 = x[213];
+    t8 = x[53];
+    t1 = 0.006655923646798118 * t8;
+    t6 = x[106];
+    t10 = 0.11136963947658277 * t6;
+    t4 = t1 - t10;
+    t0 = (-0.10860220713066433) * t3;
+    t7 = C51 * t4;
+    t8 = t0 + t7;
+    t6 = 0.028339363649938956 * t3;
+    t1 = C52 * t4;
+    t10 = t6 + t1;
+    t0 = x[173];
+    t7 = x[13];
+    t3 = (-0.003377427216706282) * t7;
+    t4 = x[146];
+    t6 = 0.11079540841354191 * t4;
+    t1 = t3 - t6;
+    t7 = (-0.0899541624952455) * t0;
+    t4 = C49 * t1;
+    t3 = t7 + t4;
+    t6 = 0.06809351923917388 * t0;
+    t7 = C50 * t1;
+    t4 = t6 + t7;
+    t0 = t5 + t8;
+    t1 = t11 + t10;
+    t6 = t2 + t3;
+    t7 = t9 + t4;
+    t5 = t5 - t8;
+    t8 = t11 - t10;
+    t11 = t2 - t3;
+    t10 = t9 - t4;
+    t2 = t0 + t6;
+    t3 = t1 + t7;
+    t9 = t5 + t10;
+    t4 = t8 - t11;
+    t0 = t0 - t6;
+    t6 = t1 - t7;
+    t1 = t5 - t10;
+    t7 = t8 + t11;
+    t5 = t9 + t4;
+    t10 = C1 * t5;
+    t8 = t9 * (-C11);
+    t11 = t4 * C12;
+    t5 = t10 - t11;
+    t9 = t10 + t8;
+    t4 = t0 + t6;
+    t11 = t0 - t6;
+    t10 = C2 * t4;
+    t8 = (-C2) * t11;
+    t0 = t1 + t7;
+    t6 = C0 * t0;
+    t4 = t1 * (-C11);
+    t11 = t7 * (-C12);
+    t0 = t6 - t11;
+    t1 = t6 + t4;
+    re[53] = t2;
+    im[53] = t3;
+    re[73] = t5;
+    im[73] = t9;
+    re[13] = t10;
+    im[13] = t8;
+    re[33] = t0;
+    im[33] = t1;
+    t7 = x[36];
+    t11 = (-0.01206173407961596) * t7;
+    t6 = x[123];
+    t4 = 0.1104369592050332 * t6;
+    t2 = t11 - t4;
+    t3 = x[196];
+    t5 = C47 * t2;
+    t9 = (-0.10278977033167126) * t3;
+    t10 = t5 + t9;
+    t8 = (-C48) * t2;
+    t0 = (-0.04738673318143427) * t3;
+    t1 = t8 + t0;
+    t7 = x[76];
+    t6 = 0.08669550714611719 * t7;
+    t11 = x[83];
+    t4 = 0.10627159994209234 * t11;
+    t5 = t6 - t4;
+    t9 = x[236];
+    t2 = 0.0787522384296202 * t9;
+    t3 = x[243];
+    t8 = 0.04764807034464822 * t3;
+    t0 = t2 + t8;
+    t7 = C46 * t5;
+    t11 = (-C45) * t0;
+    t6 = t7 + t11;
+    t4 = (-C45) * t5;
+    t9 = (-C46) * t0;
+    t3 = t4 + t9;
+    t2 = x[203];
+    t8 = x[43];
+    t7 = (-0.008316815136059702) * t8;
+    t11 = x[116];
+    t5 = 0.11043152040769377 * t11;
+    t0 = t7 - t5;
+    t4 = (-0.1061960539503176) * t2;
+    t9 = C43 * t0;
+    t8 = t4 + t9;
+    t11 = 0.03917779269447815 * t2;
+    t7 = C44 * t0;
+    t5 = t11 + t7;
+    t4 = x[163];
+    t9 = x[3];
+    t2 = (-0.00029036538053302913) * t9;
+    t0 = x[156];
+    t11 = 0.11145078582284168 * t0;
+    t7 = t2 - t11;
+    t9 = (-0.08235950334649722) * t4;
+    t0 = C41 * t7;
+    t2 = t9 + t0;
+    t11 = 0.07613234179119431 * t4;
+    t9 = C42 * t7;
+    t0 = t11 + t9;
+    t4 = t10 + t8;
+    t7 = t1 + t5;
+    t11 = t6 + t2;
+    t9 = t3 + t0;
+    t10 = t10 - t8;
+    t8 = t1 - t5;
+    t1 = t6 - t2;
+    t5 = t3 - t0;
+    t6 = t4 + t11;
+    t2 = t7 + t9;
+    t3 = t10 + t5;
+    t0 = t8 - t1;
+    t4 = t4 - t11;
+    t11 = t7 - t9;
+    t7 = t10 - t5;
+    t9 = t8 + t1;
+    t10 = t3 + t0;
+    t5 = t3 - t0;
+    t8 = C2 * t10;
+    t1 = (-C2) * t5;
+    t3 = -t4;
+    t0 = t7 - t9;
+    t10 = t7 + t9;
+    t5 = (-C2) * t0;
+    t4 = (-C2) * t10;
+    re[58] = t6;
+    im[58] = t2;
+    re[78] = t8;
+    im[78] = t1;
+    re[18] = t11;
+    im[18] = t3;
+    re[38] = t5;
+    im[38] = t4;
+    t7 = x[46];
+    t9 = (-0.005170299986352561) * t7;
+    t0 = x[113];
+    t10 = 0.1105574210571917 * t0;
+    t6 = t9 - t10;
+    t2 = x[206];
+    t8 = C39 * t6;
+    t1 = (-0.10682300172981235) * t2;
+    t11 = t8 + t1;
+    t3 = (-C40) * t6;
+    t5 = (-0.03704298820793422) * t2;
+    t4 = t3 + t5;
+    t7 = x[233];
+    t0 = 0.08938325638176887 * t7;
+    t9 = x[246];
+    t10 = 0.0339435639090872 * t9;
+    t8 = t0 + t10;
+    t1 = x[73];
+    t6 = 0.07559758432646857 * t1;
+    t2 = x[86];
+    t3 = 0.11113880795092732 * t2;
+    t5 = t6 - t3;
+    t7 = (-C38) * t8;
+    t9 = C37 * t5;
+    t0 = t7 + t9;
+    t10 = C37 * t8;
+    t1 = C38 * t5;
+    t2 = t10 + t1;
+    t6 = x[193];
+    t3 = x[33];
+    t7 = (-0.012353140490374916) * t3;
+    t9 = x[126];
+    t8 = 0.11050463693014653 * t9;
+    t5 = t7 - t8;
+    t10 = (-0.10177720920220083) * t6;
+    t1 = C35 * t5;
+    t3 = t10 + t1;
+    t9 = 0.049365489629771164 * t6;
+    t7 = C36 * t5;
+    t8 = t9 + t7;
+    t10 = x[6];
+    t1 = (-0.0008022883639918069) * t10;
+    t6 = x[153];
+    t5 = 0.11118477036967173 * t6;
+    t9 = t1 - t5;
+    t7 = x[166];
+    t10 = C33 * t9;
+    t6 = (-0.08403897453505214) * t7;
+    t1 = t10 + t6;
+    t5 = (-C34) * t9;
+    t10 = (-0.0746788921385937) * t7;
+    t6 = t5 + t10;
+    t9 = t11 + t3;
+    t7 = t4 + t8;
+    t5 = t0 + t1;
+    t10 = t2 + t6;
+    t11 = t11 - t3;
+    t3 = t4 - t8;
+    t4 = t0 - t1;
+    t8 = t2 - t6;
+    t0 = t9 + t5;
+    t1 = t7 + t10;
+    t2 = t11 + t8;
+    t6 = t3 - t4;
+    t9 = t9 - t5;
+    t5 = t7 - t10;
+    t7 = t11 - t8;
+    t10 = t3 + t4;
+    t11 = t2 + t6;
+    t8 = C0 * t11;
+    t3 = t2 * (-C11);
+    t4 = t6 * (-C12);
+    t11 = t8 - t4;
+    t2 = t8 + t3;
+    t6 = t9 - t5;
+    t4 = t9 + t5;
+    t8 = (-C2) * t6;
+    t3 = (-C2) * t4;
+    t9 = t7 + t10;
+    t5 = (-C1) * t9;
+    t6 = t7 * C11;
+    t4 = t10 * (-C12);
+    t9 = t5 - t4;
+    t7 = t5 + t6;
+    re[63] = t0;
+    im[63] = t1;
+    re[3] = t11;
+    im[3] = t2;
+    re[23] = t8;
+    im[23] = t3;
+    re[43] = t9;
+    im[43] = t7;
+    t10 = re[48];
+    t4 = im[48];
+    t5 = re[53];
+    t6 = im[53];
+    t0 = re[58];
+    t1 = im[58];
+    t11 = re[63];
+    t2 = im[63];
+    t8 = t10 + t0;
+    t3 = t4 + t1;
+    t9 = t5 + t11;
+    t7 = t6 + t2;
+    t10 = t10 - t0;
+    t0 = t4 - t1;
+    t4 = t5 - t11;
+    t1 = t6 - t2;
+    t5 = t8 + t9;
+    t11 = t3 + t7;
+    t6 = t10 + t1;
+    t2 = t0 - t4;
+    t8 = t8 - t9;
+    t9 = t3 - t7;
+    t3 = t10 - t1;
+    t7 = t0 + t4;
+    re[48] = t5;
+    im[48] = t11;
+    re[53] = t6;
+    im[53] = t2;
+    re[58] = t8;
+    im[58] = t9;
+    re[63] = t3;
+    im[63] = t7;
+    t10 = re[68];
+    t1 = im[68];
+    t0 = re[73];
+    t4 = im[73];
+    t5 = re[78];
+    t11 = im[78];
+    t6 = re[3];
+    t2 = im[3];
+    t8 = t10 + t5;
+    t9 = t1 + t11;
+    t3 = t0 + t6;
+    t7 = t4 + t2;
+    t10 = t10 - t5;
+    t5 = t1 - t11;
+    t1 = t0 - t6;
+    t11 = t4 - t2;
+    t0 = t8 + t3;
+    t6 = t9 + t7;
+    t4 = t10 + t11;
+    t2 = t5 - t1;
+    t8 = t8 - t3;
+    t3 = t9 - t7;
+    t9 = t10 - t11;
+    t7 = t5 + t1;
+    re[68] = t0;
+    im[68] = t6;
+    re[73] = t4;
+    im[73] = t2;
+    re[78] = t8;
+    im[78] = t3;
+    re[3] = t9;
+    im[3] = t7;
+    t10 = re[8];
+    t11 = im[8];
+    t5 = re[13];
+    t1 = im[13];
+    t0 = re[18];
+    t6 = im[18];
+    t4 = re[23];
+    t2 = im[23];
+    t8 = t10 + t0;
+    t3 = t11 + t6;
+    t9 = t5 + t4;
+    t7 = t1 + t2;
+    t10 = t10 - t0;
+    t0 = t11 - t6;
+    t11 = t5 - t4;
+    t6 = t1 - t2;
+    t5 = t8 + t9;
+    t4 = t3 + t7;
+    t1 = t10 + t6;
+    t2 = t0 - t11;
+    t8 = t8 - t9;
+    t9 = t3 - t7;
+    t3 = t10 - t6;
+    t7 = t0 + t11;
+    re[8] = t5;
+    im[8] = t4;
+    re[13] = t1;
+    im[13] = t2;
+    re[18] = t8;
+    im[18] = t9;
+    re[23] = t3;
+    im[23] = t7;
+    t10 = re[28];
+    t6 = im[28];
+    t0 = re[33];
+    t11 = im[33];
+    t5 = re[38];
+    t4 = im[38];
+    t1 = re[43];
+    t2 = im[43];
+    t8 = t10 + t5;
+    t9 = t6 + t4;
+    t3 = t0 + t1;
+    t7 = t11 + t2;
+    t10 = t10 - t5;
+    t5 = t6 - t4;
+    t6 = t0 - t1;
+    t4 = t11 - t2;
+    t0 = t8 + t3;
+    t1 = t9 + t7;
+    t11 = t10 + t4;
+    t2 = t5 - t6;
+    t8 = t8 - t3;
+    t3 = t9 - t7;
+    t9 = t10 - t4;
+    t7 = t5 + t6;
+    re[28] = t0;
+    im[28] = t1;
+    re[33] = t11;
+    im[33] = t2;
+    re[38] = t8;
+    im[38] = t3;
+    re[43] = t9;
+    im[43] = t7;
+}
+
+/**
+ *  Part 2 of ApplyWindowedMDCT_W10_160().
+ * 
+ *  @param {Number[]} x 
+ *    - The input block (320 points).
+ *  @param {Number[]} X 
+ *    - The array that would contain the output block (160 points).
+ *  @param {Number[]} re 
+ *    - The scratch buffer (real part, 80 points).
+ *  @param {Number[]} im 
+ *    - The scratch buffer (imaginary part, 80 points).
+ */
+function ApplyWindowedMDCT_W10_160_Part2(x, X, re, im) {
+    let t0, t1, t10, t11, t12, t13, t14, t2, t3, t4, t5, t6, t7, t8, t9;
+    const C0 = 0.9510565162951535;
+    const C1 = 0.996917333733128;
+    const C2 = 0.07845909572784494;
+    const C3 = 0.9844265680898916;
+    const C4 = 0.1757962799343545;
+    const C5 = 0.9238795325112867;
+    const C6 = 1.3065629648763766;
+    const C7 = 0.5411961001461969;
+    const C8 = 0.7071067811865476;
+    const C9 = 0.3826834323650898;
+    const C10 = 0.11753739745783764;
+    const C11 = 0.9930684569549263;
+    const C12 = 0.0196336924606283;
+    const C13 = 0.9998072404820648;
+    const C14 = 0.5590169943749475;
+    const C15 = 0.25;
+    const C16 = 0.5877852522924731;
+    const C17 = 0.9999879521672569;
+    const C18 = 0.00490871880799799;
+    const C19 = 0.9495281805930367;
+    const C20 = 0.3136817403988915;
+    const C21 = 0.806121974950521;
+    const C22 = 0.5917494076903429;
+    const C23 = 0.5838069338177863;
+    const C24 = 0.8118925199965048;
+    const C25 = 0.3043448023808773;
+    const C26 = 0.9525619356575953;
+    const C27 = 0.2855838289290823;
+    const C28 = 0.9583537325300114;
+    const C29 = 0.9996988186962042;
+    const C30 = 0.024541228522912288;
+    const C31 = 0.9431864191771733;
+    const C32 = 0.33226401953829077;
+    const C33 = 0.7943483613828815;
+    const C34 = 0.607462493301711;
+    const C35 = 0.5677539514259605;
+    const C36 = 0.8231983057806959;
+    const C37 = 0.5514820890781694;
+    const C38 = 0.8341867329477124;
+    const C39 = 0.26671275747489837;
+    const C40 = 0.9637760657954398;
+    const C41 = 0.9990242823004072;
+    const C42 = 0.04416427712706736;
+    const C43 = 0.9364810414423427;
+    const C44 = 0.35071820457322317;
+    const C45 = 0.7822685114008164;
+    const C46 = 0.6229413905583339;
+    const C47 = 0.7698870820164444;
+    const C48 = 0.6381801320506653;
+    const C49 = 0.5349976198870972;
+    const C50 = 0.8448535652497071;
+    const C51 = 0.2477388631755984;
+    const C52 = 0.968826845041188;
+    const C53 = 0.9979646030264866;
+    const C54 = 0.0637702995616845;
+    const C55 = 0.9294146324393044;
+    const C56 = 0.36903718106406647;
+    const C57 = 0.9219899164032446;
+    const C58 = 0.38721388669666557;
+    const C59 = 0.7572088465064846;
+    const C60 = 0.6531728429537768;
+    const C61 = 0.5183068989294132;
+    const C62 = 0.8551946904197751;
+    const C63 = 0.22866946082861941;
+    const C64 = 0.9735041230957107;
+    const C65 = 0.9965201894009746;
+    const C66 = 0.08335173733189745;
+    const C67 = 0.9946915982728195;
+    const C68 = 0.1029010414206961;
+    const C69 = 0.9142097557035307;
+    const C70 = 0.40524131400498986;
+    const C71 = 0.744238692572067;
+    const C72 = 0.6679137432922161;
+    const C73 = 0.501416360795769;
+    const C74 = 0.8652061217573113;
+    const C75 = 0.20951190205156878;
+    const C76 = 0.9778060967792817;
+    const C77 = 0.1902735724480359;
+    const C78 = 0.9817311075991542;
+    const C79 = 0.99247953459871;
+    const C80 = 0.1224106751992162;
+    const C81 = 0.9060771497402148;
+    const C82 = 0.42311251307264414;
+    const C83 = 0.7309816204544317;
+    const C84 = 0.6823971501682968;
+    const C85 = 0.4843325171101413;
+    const C86 = 0.8748839996649582;
+    const C87 = 0.4670619540194766;
+    const C88 = 0.8842245931365562;
+    const C89 = 0.17096188876030122;
+    const C90 = 0.9852776423889412;
+    const C91 = 0.989884851171301;
+    const C92 = 0.14187311733225325;
+    const C93 = 0.8975952337877069;
+    const C94 = 0.44082059421219394;
+    const C95 = 0.71744274100724;
+    const C96 = 0.6966174799529641;
+    const C97 = 0.7036272737262429;
+    const C98 = 0.7105692504383896;
+    const C99 = 0.44961132965460654;
+    const C100 = 0.8932243011955153;
+    const C101 = 0.15158429601004111;
+    const C102 = 0.98844433389197;
+    const C103 = 0.9869085482904458;
+    const C104 = 0.16128086467788047;
+    const C105 = 0.8887672777860675;
+    const C106 = 0.45835873062127125;
+    const C107 = 0.8795966850803829;
+    const C108 = 0.4757201610144368;
+    const C109 = 0.6895405447370668;
+    const C110 = 0.724247082951467;
+    const C111 = 0.43198737156341177;
+    const C112 = 0.9018796542830616;
+    const C113 = 0.13214826462813015;
+    const C114 = 0.9912299612883853;
+    const C115 = 0.9835517733775615;
+    const C116 = 0.18062643518005275;
+    const C117 = 0.9798158205332763;
+    const C118 = 0.1999023707530817;
+    const C119 = 0.8700869911087115;
+    const C120 = 0.49289819222978404;
+    const C121 = 0.6751879847418903;
+    const C122 = 0.737645704427393;
+    const C123 = 0.4141968741172237;
+    const C124 = 0.9101873155958178;
+    const C125 = 0.1126612875746478;
+    const C126 = 0.9936334506657989;
+    const C127 = 0.0931308774501998;
+    const C128 = 0.9956538754333033;
+    const C129 = 0.9757021300385286;
+    const C130 = 0.2191012401568698;
+    const C131 = 0.8602418620391045;
+    const C132 = 0.5098862018092806;
+    const C133 = 0.660575126925805;
+    const C134 = 0.7507599494425343;
+    const C135 = 0.3962466958914656;
+    const C136 = 0.9181440823722039;
+    const C137 = 0.3781437570215405;
+    const C138 = 0.925746887127164;
+    const C139 = 0.07356456359966743;
+    const C140 = 0.9972904566786902;
+    const C141 = 0.9712122877993118;
+    const C142 = 0.2382156418617946;
+    const C143 = 0.8500650933562288;
+    const C144 = 0.5266776405518521;
+    const C145 = 0.6457076048236673;
+    const C146 = 0.7635847622057964;
+    const C147 = 0.6305911501482637;
+    const C148 = 0.7761151985077279;
+    const C149 = 0.3598950365349881;
+    const C150 = 0.932992798834739;
+    const C151 = 0.05396988920950189;
+    const C152 = 0.9985425634687357;
+    const C153 = 0.9663480247352773;
+    const C154 = 0.2572382069021396;
+    const C155 = 0.8395606083981357;
+    const C156 = 0.5432660350382235;
+    const C157 = 0.8287324568437381;
+    const C158 = 0.559644990126546;
+    const C159 = 0.6152315905806268;
+    const C160 = 0.7883464276266063;
+    const C161 = 0.34150756966093626;
+    const C162 = 0.9398790240580331;
+    const C163 = 0.034354408399682276;
+    const C164 = 0.9994097130924373;
+    const C165 = 0.9611112161124317;
+    const C166 = 0.27616160171697074;
+    const C167 = 0.9555038808201862;
+    const C168 = 0.2949785309773635;
+    const C169 = 0.8175848131515837;
+    const C170 = 0.5758081914178453;
+    const C171 = 0.5996348475233523;
+    const C172 = 0.8002737341907743;
+    const C173 = 0.3229884451178864;
+    const C174 = 0.9464029080261377;
+    const C175 = 0.014725683311458524;
+    const C176 = 0.999891571247108;
+    t10 = x[48];
+    t4 = (-0.0024726234067729007) * t10;
+    t5 = x[111];
+    t6 = 0.11070402435289058 * t5;
+    t0 = t4 - t6;
+    t1 = x[208];
+    t11 = 0.3090169943749474 * t0;
+    t2 = (-0.1073873016196182) * t1;
+    t8 = t11 + t2;
+    t3 = (-C0) * t0;
+    t9 = (-0.03489224942151783) * t1;
+    t7 = t3 + t9;
+    t10 = x[231];
+    t5 = 0.09514939311237743 * t10;
+    t4 = x[248];
+    t6 = 0.025550251517770402 * t4;
+    t11 = t5 + t6;
+    t2 = x[71];
+    t0 = 0.06770907553871774 * t2;
+    t1 = x[88];
+    t3 = 0.1131905915283136 * t1;
+    t9 = t0 - t3;
+    t10 = (-C1) * t11;
+    t4 = C2 * t9;
+    t5 = t10 + t4;
+    t6 = C2 * t11;
+    t2 = C1 * t9;
+    t1 = t6 + t2;
+    t0 = x[191];
+    t3 = x[31];
+    t10 = (-0.012171925741771757) * t3;
+    t4 = x[128];
+    t11 = 0.11055324425243726 * t4;
+    t9 = t10 - t11;
+    t6 = (-0.10074404987087535) * t0;
+    t2 = 0.45399049973954675 * t9;
+    t3 = t6 + t2;
+    t4 = 0.051331657294346904 * t0;
+    t10 = 0.8910065241883679 * t9;
+    t11 = t4 + t10;
+    t6 = x[8];
+    t2 = (-0.0013363528219741984) * t6;
+    t0 = x[151];
+    t9 = 0.11103773038709819 * t0;
+    t4 = t2 - t9;
+    t10 = x[168];
+    t6 = 0.6494480483301837 * t4;
+    t0 = (-0.08560220509608693) * t10;
+    t2 = t6 + t0;
+    t9 = (-0.7604059656000309) * t4;
+    t6 = (-0.07311119000565018) * t10;
+    t0 = t9 + t6;
+    t4 = t8 + t3;
+    t10 = t7 + t11;
+    t9 = t5 + t2;
+    t6 = t1 + t0;
+    t8 = t8 - t3;
+    t3 = t7 - t11;
+    t7 = t5 - t2;
+    t11 = t1 - t0;
+    t5 = t4 + t9;
+    t2 = t10 + t6;
+    t1 = t8 + t11;
+    t0 = t3 - t7;
+    t4 = t4 - t9;
+    t9 = t10 - t6;
+    t10 = t8 - t11;
+    t6 = t3 + t7;
+    re[64] = t5;
+    im[64] = t2;
+    re[4] = t1;
+    im[4] = t0;
+    re[24] = t4;
+    im[24] = t9;
+    re[44] = t10;
+    im[44] = t6;
+    t8 = x[58];
+    t11 = 0.019566348347520503 * t8;
+    t3 = x[101];
+    t7 = 0.11267254267267626 * t3;
+    t5 = t11 - t7;
+    t2 = x[218];
+    t1 = 0.21430915306505077 * t5;
+    t0 = (-0.10836334413771773) * t2;
+    t4 = t1 + t0;
+    t9 = (-0.9767658813208724) * t5;
+    t10 = (-0.023775663083200966) * t2;
+    t6 = t9 + t10;
+    t8 = x[221];
+    t3 = 0.10955182964996066 * t8;
+    t11 = x[258];
+    t7 = 0.0014941198559818211 * t11;
+    t1 = t3 + t7;
+    t0 = x[61];
+    t5 = 0.02915122830740091 * t0;
+    t2 = x[98];
+    t9 = 0.11370366529486921 * t2;
+    t10 = t5 - t9;
+    t8 = (-C3) * t1;
+    t11 = C4 * t10;
+    t3 = t8 + t11;
+    t7 = C4 * t1;
+    t0 = C3 * t10;
+    t2 = t7 + t0;
+    t5 = x[181];
+    t9 = x[21];
+    t8 = (-0.007973780692501398) * t9;
+    t11 = x[138];
+    t1 = 0.11068977020554269 * t11;
+    t10 = t8 - t1;
+    t7 = (-0.09511010278460595) * t5;
+    t0 = 0.5391383229110002 * t10;
+    t9 = t7 + t0;
+    t11 = 0.060883937367231425 * t5;
+    t8 = 0.8422172337162865 * t10;
+    t1 = t11 + t8;
+    t7 = x[18];
+    t0 = (-0.006178630133566774) * t7;
+    t5 = x[141];
+    t10 = 0.11070663286328401 * t5;
+    t11 = t0 - t10;
+    t8 = x[178];
+    t7 = 0.5717879602276122 * t11;
+    t5 = (-0.09263237241379431) * t8;
+    t0 = t7 + t5;
+    t10 = (-0.8204014435255136) * t11;
+    t7 = (-0.06456116781793643) * t8;
+    t5 = t10 + t7;
+    t11 = t4 + t9;
+    t8 = t6 + t1;
+    t10 = t3 + t0;
+    t7 = t2 + t5;
+    t4 = t4 - t9;
+    t9 = t6 - t1;
+    t6 = t3 - t0;
+    t1 = t2 - t5;
+    t3 = t11 + t10;
+    t0 = t8 + t7;
+    t2 = t4 + t1;
+    t5 = t9 - t6;
+    t11 = t11 - t10;
+    t10 = t8 - t7;
+    t8 = t4 - t1;
+    t7 = t9 + t6;
+    t4 = t2 + t5;
+    t1 = C5 * t4;
+    t9 = t2 * (-C6);
+    t6 = t5 * C7;
+    t4 = t1 - t6;
+    t2 = t1 + t9;
+    t5 = t11 + t10;
+    t6 = t11 - t10;
+    t1 = C8 * t5;
+    t9 = (-C8) * t6;
+    t11 = t8 + t7;
+    t10 = C9 * t11;
+    t5 = t8 * (-C6);
+    t6 = t7 * (-C7);
+    t11 = t10 - t6;
+    t8 = t10 + t5;
+    re[69] = t3;
+    im[69] = t0;
+    re[9] = t4;
+    im[9] = t2;
+    re[29] = t1;
+    im[29] = t9;
+    re[49] = t11;
+    im[49] = t8;
+    t7 = x[68];
+    t6 = 0.05561628316934244 * t7;
+    t10 = x[91];
+    t5 = 0.11470720717048688 * t10;
+    t3 = t6 - t5;
+    t0 = x[228];
+    t4 = 0.10176330597413 * t0;
+    t2 = x[251];
+    t1 = 0.014870022449247523 * t2;
+    t9 = t4 + t1;
+    t11 = C10 * t3;
+    t8 = (-C11) * t9;
+    t7 = t11 + t8;
+    t10 = (-C11) * t3;
+    t6 = (-C10) * t9;
+    t5 = t10 + t6;
+    t0 = x[211];
+    t2 = x[51];
+    t4 = 0.0025721960202326173 * t2;
+    t1 = x[108];
+    t11 = 0.11104348913524584 * t1;
+    t8 = t4 - t11;
+    t3 = (-0.1083421508938517) * t0;
+    t9 = 0.27144044986507426 * t8;
+    t10 = t3 + t9;
+    t6 = 0.03055564670865937 * t0;
+    t2 = 0.9624552364536473 * t8;
+    t1 = t6 + t2;
+    t4 = x[171];
+    t11 = x[11];
+    t3 = (-0.0024457786478307856) * t11;
+    t9 = x[148];
+    t0 = 0.11087081251499475 * t9;
+    t8 = t3 - t0;
+    t6 = (-0.08853963828110022) * t4;
+    t2 = 0.619093949309834 * t8;
+    t11 = t6 + t2;
+    t9 = 0.0697990227619763 * t4;
+    t3 = 0.785316930880745 * t8;
+    t0 = t9 + t3;
+    t6 = x[28];
+    t2 = (-0.011406212765305677) * t6;
+    t4 = x[131];
+    t8 = 0.11061742956345909 * t4;
+    t9 = t2 - t8;
+    t3 = x[188];
+    t6 = 0.4886212414969549 * t9;
+    t4 = (-0.09859386654933333) * t3;
+    t2 = t6 + t4;
+    t8 = (-0.8724960070727972) * t9;
+    t6 = (-0.05521521827812884) * t3;
+    t4 = t8 + t6;
+    t9 = t7 + t11;
+    t3 = t5 + t0;
+    t8 = t10 + t2;
+    t6 = t1 + t4;
+    t7 = t7 - t11;
+    t11 = t5 - t0;
+    t5 = t10 - t2;
+    t0 = t1 - t4;
+    t10 = t9 + t8;
+    t2 = t3 + t6;
+    t1 = t7 + t0;
+    t4 = t11 - t5;
+    t9 = t9 - t8;
+    t8 = t3 - t6;
+    t3 = t7 - t0;
+    t6 = t11 + t5;
+    t7 = t1 + t4;
+    t0 = t1 - t4;
+    t11 = C8 * t7;
+    t5 = (-C8) * t0;
+    t1 = -t9;
+    t4 = t3 - t6;
+    t7 = t3 + t6;
+    t0 = (-C8) * t4;
+    t9 = (-C8) * t7;
+    re[74] = t10;
+    im[74] = t2;
+    re[14] = t11;
+    im[14] = t5;
+    re[34] = t8;
+    im[34] = t1;
+    re[54] = t0;
+    im[54] = t9;
+    t3 = x[78];
+    t6 = 0.09334006677577329 * t3;
+    t4 = x[81];
+    t7 = 0.1017954643269173 * t4;
+    t10 = t6 - t7;
+    t2 = x[238];
+    t11 = 0.07052284850968048 * t2;
+    t5 = x[241];
+    t8 = 0.057007607494891754 * t5;
+    t1 = t11 + t8;
+    t0 = C12 * t10;
+    t9 = (-C13) * t1;
+    t3 = t0 + t9;
+    t4 = (-C13) * t10;
+    t6 = (-C12) * t1;
+    t7 = t4 + t6;
+    t2 = x[201];
+    t5 = x[41];
+    t11 = (-0.009868114567417723) * t5;
+    t8 = x[118];
+    t0 = 0.11039836343485919 * t8;
+    t9 = t11 - t0;
+    t10 = (-0.10543803660054586) * t2;
+    t1 = 0.36447049987914965 * t9;
+    t4 = t10 + t1;
+    t6 = 0.04126765204429484 * t2;
+    t5 = 0.9312149347588036 * t9;
+    t8 = t6 + t5;
+    t11 = x[161];
+    t0 = x[1];
+    t10 = (-0.0001089766368577447) * t0;
+    t1 = x[158];
+    t2 = 0.1116492613513416 * t1;
+    t9 = t10 - t2;
+    t6 = (-0.08070514618481364) * t11;
+    t5 = 0.6930873625456359 * t9;
+    t0 = t6 + t5;
+    t1 = 0.07759650110498781 * t11;
+    t10 = 0.7208535967029188 * t9;
+    t2 = t1 + t10;
+    t6 = x[38];
+    t5 = (-0.01145593708480445) * t6;
+    t11 = x[121];
+    t9 = 0.11040555682170945 * t11;
+    t1 = t5 - t9;
+    t10 = x[198];
+    t6 = 0.40074883310314097 * t1;
+    t11 = (-0.10372982840400183) * t10;
+    t5 = t6 + t11;
+    t9 = (-0.916187957117136) * t1;
+    t6 = (-0.04537235767832522) * t10;
+    t11 = t9 + t6;
+    t1 = t3 + t0;
+    t10 = t7 + t2;
+    t9 = t4 + t5;
+    t6 = t8 + t11;
+    t3 = t3 - t0;
+    t0 = t7 - t2;
+    t7 = t4 - t5;
+    t2 = t8 - t11;
+    t4 = t1 + t9;
+    t5 = t10 + t6;
+    t8 = t3 + t2;
+    t11 = t0 - t7;
+    t1 = t1 - t9;
+    t9 = t10 - t6;
+    t10 = t3 - t2;
+    t6 = t0 + t7;
+    t3 = t8 + t11;
+    t2 = C9 * t3;
+    t0 = t8 * (-C6);
+    t7 = t11 * (-C7);
+    t3 = t2 - t7;
+    t8 = t2 + t0;
+    t11 = t1 - t9;
+    t7 = t1 + t9;
+    t2 = (-C8) * t11;
+    t0 = (-C8) * t7;
+    t1 = t10 + t6;
+    t9 = (-C5) * t1;
+    t11 = t10 * C6;
+    t7 = t6 * (-C7);
+    t1 = t9 - t7;
+    t10 = t9 + t11;
+    re[79] = t4;
+    im[79] = t5;
+    re[19] = t3;
+    im[19] = t8;
+    re[39] = t2;
+    im[39] = t0;
+    re[59] = t1;
+    im[59] = t10;
+    t6 = re[64];
+    t7 = im[64];
+    t9 = re[69];
+    t11 = im[69];
+    t4 = re[74];
+    t5 = im[74];
+    t3 = re[79];
+    t8 = im[79];
+    t2 = t6 + t4;
+    t0 = t7 + t5;
+    t1 = t9 + t3;
+    t10 = t11 + t8;
+    t6 = t6 - t4;
+    t4 = t7 - t5;
+    t7 = t9 - t3;
+    t5 = t11 - t8;
+    t9 = t2 + t1;
+    t3 = t0 + t10;
+    t11 = t6 + t5;
+    t8 = t4 - t7;
+    t2 = t2 - t1;
+    t1 = t0 - t10;
+    t0 = t6 - t5;
+    t10 = t4 + t7;
+    re[64] = t9;
+    im[64] = t3;
+    re[69] = t11;
+    im[69] = t8;
+    re[74] = t2;
+    im[74] = t1;
+    re[79] = t0;
+    im[79] = t10;
+    t6 = re[4];
+    t5 = im[4];
+    t4 = re[9];
+    t7 = im[9];
+    t9 = re[14];
+    t3 = im[14];
+    t11 = re[19];
+    t8 = im[19];
+    t2 = t6 + t9;
+    t1 = t5 + t3;
+    t0 = t4 + t11;
+    t10 = t7 + t8;
+    t6 = t6 - t9;
+    t9 = t5 - t3;
+    t5 = t4 - t11;
+    t3 = t7 - t8;
+    t4 = t2 + t0;
+    t11 = t1 + t10;
+    t7 = t6 + t3;
+    t8 = t9 - t5;
+    t2 = t2 - t0;
+    t0 = t1 - t10;
+    t1 = t6 - t3;
+    t10 = t9 + t5;
+    re[4] = t4;
+    im[4] = t11;
+    re[9] = t7;
+    im[9] = t8;
+    re[14] = t2;
+    im[14] = t0;
+    re[19] = t1;
+    im[19] = t10;
+    t6 = re[24];
+    t3 = im[24];
+    t9 = re[29];
+    t5 = im[29];
+    t4 = re[34];
+    t11 = im[34];
+    t7 = re[39];
+    t8 = im[39];
+    t2 = t6 + t4;
+    t0 = t3 + t11;
+    t1 = t9 + t7;
+    t10 = t5 + t8;
+    t6 = t6 - t4;
+    t4 = t3 - t11;
+    t3 = t9 - t7;
+    t11 = t5 - t8;
+    t9 = t2 + t1;
+    t7 = t0 + t10;
+    t5 = t6 + t11;
+    t8 = t4 - t3;
+    t2 = t2 - t1;
+    t1 = t0 - t10;
+    t0 = t6 - t11;
+    t10 = t4 + t3;
+    re[24] = t9;
+    im[24] = t7;
+    re[29] = t5;
+    im[29] = t8;
+    re[34] = t2;
+    im[34] = t1;
+    re[39] = t0;
+    im[39] = t10;
+    t6 = re[44];
+    t11 = im[44];
+    t4 = re[49];
+    t3 = im[49];
+    t9 = re[54];
+    t7 = im[54];
+    t5 = re[59];
+    t8 = im[59];
+    t2 = t6 + t9;
+    t1 = t11 + t7;
+    t0 = t4 + t5;
+    t10 = t3 + t8;
+    t6 = t6 - t9;
+    t9 = t11 - t7;
+    t11 = t4 - t5;
+    t7 = t3 - t8;
+    t4 = t2 + t0;
+    t5 = t1 + t10;
+    t3 = t6 + t7;
+    t8 = t9 - t11;
+    t2 = t2 - t0;
+    t0 = t1 - t10;
+    t1 = t6 - t7;
+    t10 = t9 + t11;
+    re[44] = t4;
+    im[44] = t5;
+    re[49] = t3;
+    im[49] = t8;
+    re[54] = t2;
+    im[54] = t0;
+    re[59] = t1;
+    im[59] = t10;
+    t6 = re[0];
+    t7 = im[0];
+    t9 = re[16];
+    t11 = im[16];
+    t4 = re[32];
+    t5 = im[32];
+    t3 = re[48];
+    t8 = im[48];
+    t2 = re[64];
+    t0 = im[64];
+    t1 = t9 + t2;
+    t10 = t11 + t0;
+    t12 = t4 + t3;
+    t13 = t5 + t8;
+    t9 = t9 - t2;
+    t2 = t11 - t0;
+    t11 = t4 - t3;
+    t0 = t5 - t8;
+    t4 = t1 + t12;
+    t3 = t10 + t13;
+    t5 = t1 - t12;
+    t8 = C14 * t5;
+    t1 = t10 - t13;
+    t12 = C14 * t1;
+    t5 = C15 * t4;
+    t10 = t6 - t5;
+    t13 = C15 * t3;
+    t1 = t7 - t13;
+    t5 = t10 + t8;
+    t13 = t1 + t12;
+    t10 = t10 - t8;
+    t8 = t1 - t12;
+    t1 = C0 * t9;
+    t12 = C16 * t11;
+    t1 = t1 + t12;
+    t12 = C0 * t2;
+    t14 = C16 * t0;
+    t12 = t12 + t14;
+    t14 = C16 * t9;
+    t9 = C0 * t11;
+    t11 = t14 - t9;
+    t14 = C16 * t2;
+    t9 = C0 * t0;
+    t2 = t14 - t9;
+    t0 = t6 + t4;
+    t14 = t7 + t3;
+    t9 = t5 + t12;
+    t6 = t13 - t1;
+    t4 = t10 + t2;
+    t7 = t8 - t11;
+    t3 = t10 - t2;
+    t10 = t8 + t11;
+    t2 = t5 - t12;
+    t8 = t13 + t1;
+    t11 = C17 * t0;
+    t5 = C18 * t14;
+    t12 = t11 + t5;
+    t13 = C18 * t0;
+    t1 = (-C17) * t14;
+    t11 = t13 + t1;
+    X[0] = t12;
+    X[159] = t11;
+    t5 = C19 * t9;
+    t0 = C20 * t6;
+    t14 = t5 + t0;
+    t13 = C20 * t9;
+    t1 = (-C19) * t6;
+    t12 = t13 + t1;
+    X[32] = t14;
+    X[127] = t12;
+    t11 = C21 * t4;
+    t5 = C22 * t7;
+    t0 = t11 + t5;
+    t9 = C22 * t4;
+    t6 = (-C21) * t7;
+    t13 = t9 + t6;
+    X[64] = t0;
+    X[95] = t13;
+    t1 = C23 * t3;
+    t14 = C24 * t10;
+    t12 = t1 + t14;
+    t11 = C24 * t3;
+    t5 = (-C23) * t10;
+    t4 = t11 + t5;
+    X[96] = t12;
+    X[63] = t4;
+    t7 = C25 * t2;
+    t9 = C26 * t8;
+    t6 = t7 + t9;
+    t0 = C26 * t2;
+    t13 = (-C25) * t8;
+    t1 = t0 + t13;
+    X[128] = t6;
+    X[31] = t1;
+    t14 = re[20];
+    t3 = im[20];
+    t10 = re[36];
+    t11 = im[36];
+    t5 = re[52];
+    t12 = im[52];
+    t4 = re[68];
+    t7 = im[68];
+    t9 = re[4];
+    t2 = im[4];
+    t8 = t10 + t9;
+    t0 = t11 + t2;
+    t13 = t5 + t4;
+    t6 = t12 + t7;
+    t1 = t10 - t9;
+    t10 = t11 - t2;
+    t9 = t5 - t4;
+    t11 = t12 - t7;
+    t2 = t8 + t13;
+    t5 = t0 + t6;
+    t4 = t8 - t13;
+    t12 = C14 * t4;
+    t7 = t0 - t6;
+    t8 = C14 * t7;
+    t13 = C15 * t2;
+    t4 = t14 - t13;
+    t0 = C15 * t5;
+    t6 = t3 - t0;
+    t7 = t4 + t12;
+    t13 = t6 + t8;
+    t0 = t4 - t12;
+    t4 = t6 - t8;
+    t12 = C0 * t1;
+    t6 = C16 * t9;
+    t8 = t12 + t6;
+    t12 = C0 * t10;
+    t6 = C16 * t11;
+    t12 = t12 + t6;
+    t6 = C16 * t1;
+    t1 = C0 * t9;
+    t9 = t6 - t1;
+    t6 = C16 * t10;
+    t1 = C0 * t11;
+    t10 = t6 - t1;
+    t11 = t14 + t2;
+    t6 = t3 + t5;
+    t1 = t7 + t12;
+    t14 = t13 - t8;
+    t2 = t0 + t10;
+    t3 = t4 - t9;
+    t5 = t0 - t10;
+    t0 = t4 + t9;
+    t10 = t7 - t12;
+    t4 = t13 + t8;
+    t9 = C27 * t11;
+    t7 = C28 * t6;
+    t12 = t9 + t7;
+    t13 = C28 * t11;
+    t8 = (-C27) * t6;
+    t9 = t13 + t8;
+    X[130] = t12;
+    X[29] = t9;
+    t7 = C29 * t1;
+    t11 = C30 * t14;
+    t6 = t7 + t11;
+    t13 = C30 * t1;
+    t8 = (-C29) * t14;
+    t12 = t13 + t8;
+    X[2] = t6;
+    X[157] = t12;
+    t9 = C31 * t2;
+    t7 = C32 * t3;
+    t11 = t9 + t7;
+    t1 = C32 * t2;
+    t14 = (-C31) * t3;
+    t13 = t1 + t14;
+    X[34] = t11;
+    X[125] = t13;
+    t8 = C33 * t5;
+    t6 = C34 * t0;
+    t12 = t8 + t6;
+    t9 = C34 * t5;
+    t7 = (-C33) * t0;
+    t2 = t9 + t7;
+    X[66] = t12;
+    X[93] = t2;
+    t3 = C35 * t10;
+    t1 = C36 * t4;
+    t14 = t3 + t1;
+    t11 = C36 * t10;
+    t13 = (-C35) * t4;
+    t8 = t11 + t13;
+    X[98] = t14;
+    X[61] = t8;
+    t6 = re[40];
+    t5 = im[40];
+    t0 = re[56];
+    t9 = im[56];
+    t7 = re[72];
+    t12 = im[72];
+    t2 = re[8];
+    t3 = im[8];
+    t1 = re[24];
+    t10 = im[24];
+    t4 = t0 + t1;
+    t11 = t9 + t10;
+    t13 = t7 + t2;
+    t14 = t12 + t3;
+    t8 = t0 - t1;
+    t0 = t9 - t10;
+    t1 = t7 - t2;
+    t9 = t12 - t3;
+    t10 = t4 + t13;
+    t7 = t11 + t14;
+    t2 = t4 - t13;
+    t12 = C14 * t2;
+    t3 = t11 - t14;
+    t4 = C14 * t3;
+    t13 = C15 * t10;
+    t2 = t6 - t13;
+    t11 = C15 * t7;
+    t14 = t5 - t11;
+    t3 = t2 + t12;
+    t13 = t14 + t4;
+    t11 = t2 - t12;
+    t2 = t14 - t4;
+    t12 = C0 * t8;
+    t14 = C16 * t1;
+    t4 = t12 + t14;
+    t12 = C0 * t0;
+    t14 = C16 * t9;
+    t12 = t12 + t14;
+    t14 = C16 * t8;
+    t8 = C0 * t1;
+    t1 = t14 - t8;
+    t14 = C16 * t0;
+    t8 = C0 * t9;
+    t0 = t14 - t8;
+    t9 = t6 + t10;
+    t14 = t5 + t7;
+    t8 = t3 + t12;
+    t6 = t13 - t4;
+    t10 = t11 + t0;
+    t5 = t2 - t1;
+    t7 = t11 - t0;
+    t11 = t2 + t1;
+    t0 = t3 - t12;
+    t2 = t13 + t4;
+    t1 = C37 * t9;
+    t3 = C38 * t14;
+    t12 = t1 + t3;
+    t13 = C38 * t9;
+    t4 = (-C37) * t14;
+    t1 = t13 + t4;
+    X[100] = t12;
+    X[59] = t1;
+    t3 = C39 * t8;
+    t9 = C40 * t6;
+    t14 = t3 + t9;
+    t13 = C40 * t8;
+    t4 = (-C39) * t6;
+    t12 = t13 + t4;
+    X[132] = t14;
+    X[27] = t12;
+    t1 = C41 * t10;
+    t3 = C42 * t5;
+    t9 = t1 + t3;
+    t8 = C42 * t10;
+    t6 = (-C41) * t5;
+    t13 = t8 + t6;
+    X[4] = t9;
+    X[155] = t13;
+    t4 = C43 * t7;
+    t14 = C44 * t11;
+    t12 = t4 + t14;
+    t1 = C44 * t7;
+    t3 = (-C43) * t11;
+    t10 = t1 + t3;
+    X[36] = t12;
+    X[123] = t10;
+    t5 = C45 * t0;
+    t8 = C46 * t2;
+    t6 = t5 + t8;
+    t9 = C46 * t0;
+    t13 = (-C45) * t2;
+    t4 = t9 + t13;
+    X[68] = t6;
+    X[91] = t4;
+    t14 = re[60];
+    t7 = im[60];
+    t11 = re[76];
+    t1 = im[76];
+    t3 = re[12];
+    t12 = im[12];
+    t10 = re[28];
+    t5 = im[28];
+    t8 = re[44];
+    t0 = im[44];
+    t2 = t11 + t8;
+    t9 = t1 + t0;
+    t13 = t3 + t10;
+    t6 = t12 + t5;
+    t4 = t11 - t8;
+    t11 = t1 - t0;
+    t8 = t3 - t10;
+    t1 = t12 - t5;
+    t0 = t2 + t13;
+    t3 = t9 + t6;
+    t10 = t2 - t13;
+    t12 = C14 * t10;
+    t5 = t9 - t6;
+    t2 = C14 * t5;
+    t13 = C15 * t0;
+    t10 = t14 - t13;
+    t9 = C15 * t3;
+    t6 = t7 - t9;
+    t5 = t10 + t12;
+    t13 = t6 + t2;
+    t9 = t10 - t12;
+    t10 = t6 - t2;
+    t12 = C0 * t4;
+    t6 = C16 * t8;
+    t2 = t12 + t6;
+    t12 = C0 * t11;
+    t6 = C16 * t1;
+    t12 = t12 + t6;
+    t6 = C16 * t4;
+    t4 = C0 * t8;
+    t8 = t6 - t4;
+    t6 = C16 * t11;
+    t4 = C0 * t1;
+    t11 = t6 - t4;
+    t1 = t14 + t0;
+    t6 = t7 + t3;
+    t4 = t5 + t12;
+    t14 = t13 - t2;
+    t0 = t9 + t11;
+    t7 = t10 - t8;
+    t3 = t9 - t11;
+    t9 = t10 + t8;
+    t11 = t5 - t12;
+    t10 = t13 + t2;
+    t8 = C47 * t1;
+    t5 = C48 * t6;
+    t12 = t8 + t5;
+    t13 = C48 * t1;
+    t2 = (-C47) * t6;
+    t8 = t13 + t2;
+    X[70] = t12;
+    X[89] = t8;
+    t5 = C49 * t4;
+    t1 = C50 * t14;
+    t6 = t5 + t1;
+    t13 = C50 * t4;
+    t2 = (-C49) * t14;
+    t12 = t13 + t2;
+    X[102] = t6;
+    X[57] = t12;
+    t8 = C51 * t0;
+    t5 = C52 * t7;
+    t1 = t8 + t5;
+    t4 = C52 * t0;
+    t14 = (-C51) * t7;
+    t13 = t4 + t14;
+    X[134] = t1;
+    X[25] = t13;
+    t2 = C53 * t3;
+    t6 = C54 * t9;
+    t12 = t2 + t6;
+    t8 = C54 * t3;
+    t5 = (-C53) * t9;
+    t0 = t8 + t5;
+    X[6] = t12;
+    X[153] = t0;
+    t7 = C55 * t11;
+    t4 = C56 * t10;
+    t14 = t7 + t4;
+    t1 = C56 * t11;
+    t13 = (-C55) * t10;
+    t2 = t1 + t13;
+    X[38] = t14;
+    X[121] = t2;
+    t6 = re[5];
+    t3 = im[5];
+    t9 = re[21];
+    t8 = im[21];
+    t5 = re[37];
+    t12 = im[37];
+    t0 = re[53];
+    t7 = im[53];
+    t4 = re[69];
+    t11 = im[69];
+    t10 = t9 + t4;
+    t1 = t8 + t11;
+    t13 = t5 + t0;
+    t14 = t12 + t7;
+    t2 = t9 - t4;
+    t9 = t8 - t11;
+    t4 = t5 - t0;
+    t8 = t12 - t7;
+    t11 = t10 + t13;
+    t5 = t1 + t14;
+    t0 = t10 - t13;
+    t12 = C14 * t0;
+    t7 = t1 - t14;
+    t10 = C14 * t7;
+    t13 = C15 * t11;
+    t0 = t6 - t13;
+    t1 = C15 * t5;
+    t14 = t3 - t1;
+    t7 = t0 + t12;
+    t13 = t14 + t10;
+    t1 = t0 - t12;
+    t0 = t14 - t10;
+    t12 = C0 * t2;
+    t14 = C16 * t4;
+    t10 = t12 + t14;
+    t12 = C0 * t9;
+    t14 = C16 * t8;
+    t12 = t12 + t14;
+    t14 = C16 * t2;
+    t2 = C0 * t4;
+    t4 = t14 - t2;
+    t14 = C16 * t9;
+    t2 = C0 * t8;
+    t9 = t14 - t2;
+    t8 = t6 + t11;
+    t14 = t3 + t5;
+    t2 = t7 + t12;
+    t6 = t13 - t10;
+    t11 = t1 + t9;
+    t3 = t0 - t4;
+    t5 = t1 - t9;
+    t1 = t0 + t4;
+    t9 = t7 - t12;
+    t0 = t13 + t10;
+    t4 = C57 * t8;
+    t7 = C58 * t14;
+    t12 = t4 + t7;
+    t13 = C58 * t8;
+    t10 = (-C57) * t14;
+    t4 = t13 + t10;
+    X[40] = t12;
+    X[119] = t4;
+    t7 = C59 * t2;
+    t8 = C60 * t6;
+    t14 = t7 + t8;
+    t13 = C60 * t2;
+    t10 = (-C59) * t6;
+    t12 = t13 + t10;
+    X[72] = t14;
+    X[87] = t12;
+    t4 = C61 * t11;
+    t7 = C62 * t3;
+    t8 = t4 + t7;
+    t2 = C62 * t11;
+    t6 = (-C61) * t3;
+    t13 = t2 + t6;
+    X[104] = t8;
+    X[55] = t13;
+    t10 = C63 * t5;
+    t14 = C64 * t1;
+    t12 = t10 + t14;
+    t4 = C64 * t5;
+    t7 = (-C63) * t1;
+    t11 = t4 + t7;
+    X[136] = t12;
+    X[23] = t11;
+    t3 = C65 * t9;
+    t2 = C66 * t0;
+    t6 = t3 + t2;
+    t8 = C66 * t9;
+    t13 = (-C65) * t0;
+    t10 = t8 + t13;
+    X[8] = t6;
+    X[151] = t10;
+    t14 = re[25];
+    t5 = im[25];
+    t1 = re[41];
+    t4 = im[41];
+    t7 = re[57];
+    t12 = im[57];
+    t11 = re[73];
+    t3 = im[73];
+    t2 = re[9];
+    t9 = im[9];
+    t0 = t1 + t2;
+    t8 = t4 + t9;
+    t13 = t7 + t11;
+    t6 = t12 + t3;
+    t10 = t1 - t2;
+    t1 = t4 - t9;
+    t2 = t7 - t11;
+    t4 = t12 - t3;
+    t9 = t0 + t13;
+    t7 = t8 + t6;
+    t11 = t0 - t13;
+    t12 = C14 * t11;
+    t3 = t8 - t6;
+    t0 = C14 * t3;
+    t13 = C15 * t9;
+    t11 = t14 - t13;
+    t8 = C15 * t7;
+    t6 = t5 - t8;
+    t3 = t11 + t12;
+    t13 = t6 + t0;
+    t8 = t11 - t12;
+    t11 = t6 - t0;
+    t12 = C0 * t10;
+    t6 = C16 * t2;
+    t0 = t12 + t6;
+    t12 = C0 * t1;
+    t6 = C16 * t4;
+    t12 = t12 + t6;
+    t6 = C16 * t10;
+    t10 = C0 * t2;
+    t2 = t6 - t10;
+    t6 = C16 * t1;
+    t10 = C0 * t4;
+    t1 = t6 - t10;
+    t4 = t14 + t9;
+    t6 = t5 + t7;
+    t10 = t3 + t12;
+    t14 = t13 - t0;
+    t9 = t8 + t1;
+    t5 = t11 - t2;
+    t7 = t8 - t1;
+    t8 = t11 + t2;
+    t1 = t3 - t12;
+    t11 = t13 + t0;
+    t2 = C67 * t4;
+    t3 = C68 * t6;
+    t12 = t2 + t3;
+    t13 = C68 * t4;
+    t0 = (-C67) * t6;
+    t2 = t13 + t0;
+    X[10] = t12;
+    X[149] = t2;
+    t3 = C69 * t10;
+    t4 = C70 * t14;
+    t6 = t3 + t4;
+    t13 = C70 * t10;
+    t0 = (-C69) * t14;
+    t12 = t13 + t0;
+    X[42] = t6;
+    X[117] = t12;
+    t2 = C71 * t9;
+    t3 = C72 * t5;
+    t4 = t2 + t3;
+    t10 = C72 * t9;
+    t14 = (-C71) * t5;
+    t13 = t10 + t14;
+    X[74] = t4;
+    X[85] = t13;
+    t0 = C73 * t7;
+    t6 = C74 * t8;
+    t12 = t0 + t6;
+    t2 = C74 * t7;
+    t3 = (-C73) * t8;
+    t9 = t2 + t3;
+    X[106] = t12;
+    X[53] = t9;
+    t5 = C75 * t1;
+    t10 = C76 * t11;
+    t14 = t5 + t10;
+    t4 = C76 * t1;
+    t13 = (-C75) * t11;
+    t0 = t4 + t13;
+    X[138] = t14;
+    X[21] = t0;
+    t6 = re[45];
+    t7 = im[45];
+    t8 = re[61];
+    t2 = im[61];
+    t3 = re[77];
+    t12 = im[77];
+    t9 = re[13];
+    t5 = im[13];
+    t10 = re[29];
+    t1 = im[29];
+    t11 = t8 + t10;
+    t4 = t2 + t1;
+    t13 = t3 + t9;
+    t14 = t12 + t5;
+    t0 = t8 - t10;
+    t8 = t2 - t1;
+    t10 = t3 - t9;
+    t2 = t12 - t5;
+    t1 = t11 + t13;
+    t3 = t4 + t14;
+    t9 = t11 - t13;
+    t12 = C14 * t9;
+    t5 = t4 - t14;
+    t11 = C14 * t5;
+    t13 = C15 * t1;
+    t9 = t6 - t13;
+    t4 = C15 * t3;
+    t14 = t7 - t4;
+    t5 = t9 + t12;
+    t13 = t14 + t11;
+    t4 = t9 - t12;
+    t9 = t14 - t11;
+    t12 = C0 * t0;
+    t14 = C16 * t10;
+    t11 = t12 + t14;
+    t12 = C0 * t8;
+    t14 = C16 * t2;
+    t12 = t12 + t14;
+    t14 = C16 * t0;
+    t0 = C0 * t10;
+    t10 = t14 - t0;
+    t14 = C16 * t8;
+    t0 = C0 * t2;
+    t8 = t14 - t0;
+    t2 = t6 + t1;
+    t14 = t7 + t3;
+    t0 = t5 + t12;
+    t6 = t13 - t11;
+    t1 = t4 + t8;
+    t7 = t9 - t10;
+    t3 = t4 - t8;
+    t4 = t9 + t10;
+    t8 = t5 - t12;
+    t9 = t13 + t11;
+    t10 = C77 * t2;
+    t5 = C78 * t14;
+    t12 = t10 + t5;
+    t13 = C78 * t2;
+    t11 = (-C77) * t14;
+    t10 = t13 + t11;
+    X[140] = t12;
+    X[19] = t10;
+    t5 = C79 * t0;
+    t2 = C80 * t6;
+    t14 = t5 + t2;
+    t13 = C80 * t0;
+    t11 = (-C79) * t6;
+    t12 = t13 + t11;
+    X[12] = t14;
+    X[147] = t12;
+    t10 = C81 * t1;
+    t5 = C82 * t7;
+    t2 = t10 + t5;
+    t0 = C82 * t1;
+    t6 = (-C81) * t7;
+    t13 = t0 + t6;
+    X[44] = t2;
+    X[115] = t13;
+    t11 = C83 * t3;
+    t14 = C84 * t4;
+    t12 = t11 + t14;
+    t10 = C84 * t3;
+    t5 = (-C83) * t4;
+    t1 = t10 + t5;
+    X[76] = t12;
+    X[83] = t1;
+    t7 = C85 * t8;
+    t0 = C86 * t9;
+    t6 = t7 + t0;
+    t2 = C86 * t8;
+    t13 = (-C85) * t9;
+    t11 = t2 + t13;
+    X[108] = t6;
+    X[51] = t11;
+    t14 = re[65];
+    t3 = im[65];
+    t4 = re[1];
+    t10 = im[1];
+    t5 = re[17];
+    t12 = im[17];
+    t1 = re[33];
+    t7 = im[33];
+    t0 = re[49];
+    t8 = im[49];
+    t9 = t4 + t0;
+    t2 = t10 + t8;
+    t13 = t5 + t1;
+    t6 = t12 + t7;
+    t11 = t4 - t0;
+    t4 = t10 - t8;
+    t0 = t5 - t1;
+    t10 = t12 - t7;
+    t8 = t9 + t13;
+    t5 = t2 + t6;
+    t1 = t9 - t13;
+    t12 = C14 * t1;
+    t7 = t2 - t6;
+    t9 = C14 * t7;
+    t13 = C15 * t8;
+    t1 = t14 - t13;
+    t2 = C15 * t5;
+    t6 = t3 - t2;
+    t7 = t1 + t12;
+    t13 = t6 + t9;
+    t2 = t1 - t12;
+    t1 = t6 - t9;
+    t12 = C0 * t11;
+    t6 = C16 * t0;
+    t9 = t12 + t6;
+    t12 = C0 * t4;
+    t6 = C16 * t10;
+    t12 = t12 + t6;
+    t6 = C16 * t11;
+    t11 = C0 * t0;
+    t0 = t6 - t11;
+    t6 = C16 * t4;
+    t11 = C0 * t10;
+    t4 = t6 - t11;
+    t10 = t14 + t8;
+    t6 = t3 + t5;
+    t11 = t7 + t12;
+    t14 = t13 - t9;
+    t8 = t2 + t4;
+    t3 = t1 - t0;
+    t5 = t2 - t4;
+    t2 = t1 + t0;
+    t4 = t7 - t12;
+    t1 = t13 + t9;
+    t0 = C87 * t10;
+    t7 = C88 * t6;
+    t12 = t0 + t7;
+    t13 = C88 * t10;
+    t9 = (-C87) * t6;
+    t0 = t13 + t9;
+    X[110] = t12;
+    X[49] = t0;
+    t7 = C89 * t11;
+    t10 = C90 * t14;
+    t6 = t7 + t10;
+    t13 = C90 * t11;
+    t9 = (-C89) * t14;
+    t12 = t13 + t9;
+    X[142] = t6;
+    X[17] = t12;
+    t0 = C91 * t8;
+    t7 = C92 * t3;
+    t10 = t0 + t7;
+    t11 = C92 * t8;
+    t14 = (-C91) * t3;
+    t13 = t11 + t14;
+    X[14] = t10;
+    X[145] = t13;
+    t9 = C93 * t5;
+    t6 = C94 * t2;
+    t12 = t9 + t6;
+    t0 = C94 * t5;
+    t7 = (-C93) * t2;
+    t8 = t0 + t7;
+    X[46] = t12;
+    X[113] = t8;
+    t3 = C95 * t4;
+    t11 = C96 * t1;
+    t14 = t3 + t11;
+    t10 = C96 * t4;
+    t13 = (-C95) * t1;
+    t9 = t10 + t13;
+    X[78] = t14;
+    X[81] = t9;
+    t6 = re[10];
+    t5 = im[10];
+    t2 = re[26];
+    t0 = im[26];
+    t7 = re[42];
+    t12 = im[42];
+    t8 = re[58];
+    t3 = im[58];
+    t11 = re[74];
+    t4 = im[74];
+    t1 = t2 + t11;
+    t10 = t0 + t4;
+    t13 = t7 + t8;
+    t14 = t12 + t3;
+    t9 = t2 - t11;
+    t2 = t0 - t4;
+    t11 = t7 - t8;
+    t0 = t12 - t3;
+    t4 = t1 + t13;
+    t7 = t10 + t14;
+    t8 = t1 - t13;
+    t12 = C14 * t8;
+    t3 = t10 - t14;
+    t1 = C14 * t3;
+    t13 = C15 * t4;
+    t8 = t6 - t13;
+    t10 = C15 * t7;
+    t14 = t5 - t10;
+    t3 = t8 + t12;
+    t13 = t14 + t1;
+    t10 = t8 - t12;
+    t8 = t14 - t1;
+    t12 = C0 * t9;
+    t14 = C16 * t11;
+    t1 = t12 + t14;
+    t12 = C0 * t2;
+    t14 = C16 * t0;
+    t12 = t12 + t14;
+    t14 = C16 * t9;
+    t9 = C0 * t11;
+    t11 = t14 - t9;
+    t14 = C16 * t2;
+    t9 = C0 * t0;
+    t2 = t14 - t9;
+    t0 = t6 + t4;
+    t14 = t5 + t7;
+    t9 = t3 + t12;
+    t6 = t13 - t1;
+    t4 = t10 + t2;
+    t5 = t8 - t11;
+    t7 = t10 - t2;
+    t10 = t8 + t11;
+    t2 = t3 - t12;
+    t8 = t13 + t1;
+    t11 = C97 * t0;
+    t3 = C98 * t14;
+    t12 = t11 + t3;
+    t13 = C98 * t0;
+    t1 = (-C97) * t14;
+    t11 = t13 + t1;
+    X[80] = t12;
+    X[79] = t11;
+    t3 = C99 * t9;
+    t0 = C100 * t6;
+    t14 = t3 + t0;
+    t13 = C100 * t9;
+    t1 = (-C99) * t6;
+    t12 = t13 + t1;
+    X[112] = t14;
+    X[47] = t12;
+    t11 = C101 * t4;
+    t3 = C102 * t5;
+    t0 = t11 + t3;
+    t9 = C102 * t4;
+    t6 = (-C101) * t5;
+    t13 = t9 + t6;
+    X[144] = t0;
+    X[15] = t13;
+    t1 = C103 * t7;
+    t14 = C104 * t10;
+    t12 = t1 + t14;
+    t11 = C104 * t7;
+    t3 = (-C103) * t10;
+    t4 = t11 + t3;
+    X[16] = t12;
+    X[143] = t4;
+    t5 = C105 * t2;
+    t9 = C106 * t8;
+    t6 = t5 + t9;
+    t0 = C106 * t2;
+    t13 = (-C105) * t8;
+    t1 = t0 + t13;
+    X[48] = t6;
+    X[111] = t1;
+    t14 = re[30];
+    t7 = im[30];
+    t10 = re[46];
+    t11 = im[46];
+    t3 = re[62];
+    t12 = im[62];
+    t4 = re[78];
+    t5 = im[78];
+    t9 = re[14];
+    t2 = im[14];
+    t8 = t10 + t9;
+    t0 = t11 + t2;
+    t13 = t3 + t4;
+    t6 = t12 + t5;
+    t1 = t10 - t9;
+    t10 = t11 - t2;
+    t9 = t3 - t4;
+    t11 = t12 - t5;
+    t2 = t8 + t13;
+    t3 = t0 + t6;
+    t4 = t8 - t13;
+    t12 = C14 * t4;
+    t5 = t0 - t6;
+    t8 = C14 * t5;
+    t13 = C15 * t2;
+    t4 = t14 - t13;
+    t0 = C15 * t3;
+    t6 = t7 - t0;
+    t5 = t4 + t12;
+    t13 = t6 + t8;
+    t0 = t4 - t12;
+    t4 = t6 - t8;
+    t12 = C0 * t1;
+    t6 = C16 * t9;
+    t8 = t12 + t6;
+    t12 = C0 * t10;
+    t6 = C16 * t11;
+    t12 = t12 + t6;
+    t6 = C16 * t1;
+    t1 = C0 * t9;
+    t9 = t6 - t1;
+    t6 = C16 * t10;
+    t1 = C0 * t11;
+    t10 = t6 - t1;
+    t11 = t14 + t2;
+    t6 = t7 + t3;
+    t1 = t5 + t12;
+    t14 = t13 - t8;
+    t2 = t0 + t10;
+    t7 = t4 - t9;
+    t3 = t0 - t10;
+    t0 = t4 + t9;
+    t10 = t5 - t12;
+    t4 = t13 + t8;
+    t9 = C107 * t11;
+    t5 = C108 * t6;
+    t12 = t9 + t5;
+    t13 = C108 * t11;
+    t8 = (-C107) * t6;
+    t9 = t13 + t8;
+    X[50] = t12;
+    X[109] = t9;
+    t5 = C109 * t1;
+    t11 = C110 * t14;
+    t6 = t5 + t11;
+    t13 = C110 * t1;
+    t8 = (-C109) * t14;
+    t12 = t13 + t8;
+    X[82] = t6;
+    X[77] = t12;
+    t9 = C111 * t2;
+    t5 = C112 * t7;
+    t11 = t9 + t5;
+    t1 = C112 * t2;
+    t14 = (-C111) * t7;
+    t13 = t1 + t14;
+    X[114] = t11;
+    X[45] = t13;
+    t8 = C113 * t3;
+    t6 = C114 * t0;
+    t12 = t8 + t6;
+    t9 = C114 * t3;
+    t5 = (-C113) * t0;
+    t2 = t9 + t5;
+    X[146] = t12;
+    X[13] = t2;
+    t7 = C115 * t10;
+    t1 = C116 * t4;
+    t14 = t7 + t1;
+    t11 = C116 * t10;
+    t13 = (-C115) * t4;
+    t8 = t11 + t13;
+    X[18] = t14;
+    X[141] = t8;
+    t6 = re[50];
+    t3 = im[50];
+    t0 = re[66];
+    t9 = im[66];
+    t5 = re[2];
+    t12 = im[2];
+    t2 = re[18];
+    t7 = im[18];
+    t1 = re[34];
+    t10 = im[34];
+    t4 = t0 + t1;
+    t11 = t9 + t10;
+    t13 = t5 + t2;
+    t14 = t12 + t7;
+    t8 = t0 - t1;
+    t0 = t9 - t10;
+    t1 = t5 - t2;
+    t9 = t12 - t7;
+    t10 = t4 + t13;
+    t5 = t11 + t14;
+    t2 = t4 - t13;
+    t12 = C14 * t2;
+    t7 = t11 - t14;
+    t4 = C14 * t7;
+    t13 = C15 * t10;
+    t2 = t6 - t13;
+    t11 = C15 * t5;
+    t14 = t3 - t11;
+    t7 = t2 + t12;
+    t13 = t14 + t4;
+    t11 = t2 - t12;
+    t2 = t14 - t4;
+    t12 = C0 * t8;
+    t14 = C16 * t1;
+    t4 = t12 + t14;
+    t12 = C0 * t0;
+    t14 = C16 * t9;
+    t12 = t12 + t14;
+    t14 = C16 * t8;
+    t8 = C0 * t1;
+    t1 = t14 - t8;
+    t14 = C16 * t0;
+    t8 = C0 * t9;
+    t0 = t14 - t8;
+    t9 = t6 + t10;
+    t14 = t3 + t5;
+    t8 = t7 + t12;
+    t6 = t13 - t4;
+    t10 = t11 + t0;
+    t3 = t2 - t1;
+    t5 = t11 - t0;
+    t11 = t2 + t1;
+    t0 = t7 - t12;
+    t2 = t13 + t4;
+    t1 = C117 * t9;
+    t7 = C118 * t14;
+    t12 = t1 + t7;
+    t13 = C118 * t9;
+    t4 = (-C117) * t14;
+    t1 = t13 + t4;
+    X[20] = t12;
+    X[139] = t1;
+    t7 = C119 * t8;
+    t9 = C120 * t6;
+    t14 = t7 + t9;
+    t13 = C120 * t8;
+    t4 = (-C119) * t6;
+    t12 = t13 + t4;
+    X[52] = t14;
+    X[107] = t12;
+    t1 = C121 * t10;
+    t7 = C122 * t3;
+    t9 = t1 + t7;
+    t8 = C122 * t10;
+    t6 = (-C121) * t3;
+    t13 = t8 + t6;
+    X[84] = t9;
+    X[75] = t13;
+    t4 = C123 * t5;
+    t14 = C124 * t11;
+    t12 = t4 + t14;
+    t1 = C124 * t5;
+    t7 = (-C123) * t11;
+    t10 = t1 + t7;
+    X[116] = t12;
+    X[43] = t10;
+    t3 = C125 * t0;
+    t8 = C126 * t2;
+    t6 = t3 + t8;
+    t9 = C126 * t0;
+    t13 = (-C125) * t2;
+    t4 = t9 + t13;
+    X[148] = t6;
+    X[11] = t4;
+    t14 = re[70];
+    t5 = im[70];
+    t11 = re[6];
+    t1 = im[6];
+    t7 = re[22];
+    t12 = im[22];
+    t10 = re[38];
+    t3 = im[38];
+    t8 = re[54];
+    t0 = im[54];
+    t2 = t11 + t8;
+    t9 = t1 + t0;
+    t13 = t7 + t10;
+    t6 = t12 + t3;
+    t4 = t11 - t8;
+    t11 = t1 - t0;
+    t8 = t7 - t10;
+    t1 = t12 - t3;
+    t0 = t2 + t13;
+    t7 = t9 + t6;
+    t10 = t2 - t13;
+    t12 = C14 * t10;
+    t3 = t9 - t6;
+    t2 = C14 * t3;
+    t13 = C15 * t0;
+    t10 = t14 - t13;
+    t9 = C15 * t7;
+    t6 = t5 - t9;
+    t3 = t10 + t12;
+    t13 = t6 + t2;
+    t9 = t10 - t12;
+    t10 = t6 - t2;
+    t12 = C0 * t4;
+    t6 = C16 * t8;
+    t2 = t12 + t6;
+    t12 = C0 * t11;
+    t6 = C16 * t1;
+    t12 = t12 + t6;
+    t6 = C16 * t4;
+    t4 = C0 * t8;
+    t8 = t6 - t4;
+    t6 = C16 * t11;
+    t4 = C0 * t1;
+    t11 = t6 - t4;
+    t1 = t14 + t0;
+    t6 = t5 + t7;
+    t4 = t3 + t12;
+    t14 = t13 - t2;
+    t0 = t9 + t11;
+    t5 = t10 - t8;
+    t7 = t9 - t11;
+    t9 = t10 + t8;
+    t11 = t3 - t12;
+    t10 = t13 + t2;
+    t8 = C127 * t1;
+    t3 = C128 * t6;
+    t12 = t8 + t3;
+    t13 = C128 * t1;
+    t2 = (-C127) * t6;
+    t8 = t13 + t2;
+    X[150] = t12;
+    X[9] = t8;
+    t3 = C129 * t4;
+    t1 = C130 * t14;
+    t6 = t3 + t1;
+    t13 = C130 * t4;
+    t2 = (-C129) * t14;
+    t12 = t13 + t2;
+    X[22] = t6;
+    X[137] = t12;
+    t8 = C131 * t0;
+    t3 = C132 * t5;
+    t1 = t8 + t3;
+    t4 = C132 * t0;
+    t14 = (-C131) * t5;
+    t13 = t4 + t14;
+    X[54] = t1;
+    X[105] = t13;
+    t2 = C133 * t7;
+    t6 = C134 * t9;
+    t12 = t2 + t6;
+    t8 = C134 * t7;
+    t3 = (-C133) * t9;
+    t0 = t8 + t3;
+    X[86] = t12;
+    X[73] = t0;
+    t5 = C135 * t11;
+    t4 = C136 * t10;
+    t14 = t5 + t4;
+    t1 = C136 * t11;
+    t13 = (-C135) * t10;
+    t2 = t1 + t13;
+    X[118] = t14;
+    X[41] = t2;
+    t6 = re[15];
+    t7 = im[15];
+    t9 = re[31];
+    t8 = im[31];
+    t3 = re[47];
+    t12 = im[47];
+    t0 = re[63];
+    t5 = im[63];
+    t4 = re[79];
+    t11 = im[79];
+    t10 = t9 + t4;
+    t1 = t8 + t11;
+    t13 = t3 + t0;
+    t14 = t12 + t5;
+    t2 = t9 - t4;
+    t9 = t8 - t11;
+    t4 = t3 - t0;
+    t8 = t12 - t5;
+    t11 = t10 + t13;
+    t3 = t1 + t14;
+    t0 = t10 - t13;
+    t12 = C14 * t0;
+    t5 = t1 - t14;
+    t10 = C14 * t5;
+    t13 = C15 * t11;
+    t0 = t6 - t13;
+    t1 = C15 * t3;
+    t14 = t7 - t1;
+    t5 = t0 + t12;
+    t13 = t14 + t10;
+    t1 = t0 - t12;
+    t0 = t14 - t10;
+    t12 = C0 * t2;
+    t14 = C16 * t4;
+    t10 = t12 + t14;
+    t12 = C0 * t9;
+    t14 = C16 * t8;
+    t12 = t12 + t14;
+    t14 = C16 * t2;
+    t2 = C0 * t4;
+    t4 = t14 - t2;
+    t14 = C16 * t9;
+    t2 = C0 * t8;
+    t9 = t14 - t2;
+    t8 = t6 + t11;
+    t14 = t7 + t3;
+    t2 = t5 + t12;
+    t6 = t13 - t10;
+    t11 = t1 + t9;
+    t7 = t0 - t4;
+    t3 = t1 - t9;
+    t1 = t0 + t4;
+    t9 = t5 - t12;
+    t0 = t13 + t10;
+    t4 = C137 * t8;
+    t5 = C138 * t14;
+    t12 = t4 + t5;
+    t13 = C138 * t8;
+    t10 = (-C137) * t14;
+    t4 = t13 + t10;
+    X[120] = t12;
+    X[39] = t4;
+    t5 = C139 * t2;
+    t8 = C140 * t6;
+    t14 = t5 + t8;
+    t13 = C140 * t2;
+    t10 = (-C139) * t6;
+    t12 = t13 + t10;
+    X[152] = t14;
+    X[7] = t12;
+    t4 = C141 * t11;
+    t5 = C142 * t7;
+    t8 = t4 + t5;
+    t2 = C142 * t11;
+    t6 = (-C141) * t7;
+    t13 = t2 + t6;
+    X[24] = t8;
+    X[135] = t13;
+    t10 = C143 * t3;
+    t14 = C144 * t1;
+    t12 = t10 + t14;
+    t4 = C144 * t3;
+    t5 = (-C143) * t1;
+    t11 = t4 + t5;
+    X[56] = t12;
+    X[103] = t11;
+    t7 = C145 * t9;
+    t2 = C146 * t0;
+    t6 = t7 + t2;
+    t8 = C146 * t9;
+    t13 = (-C145) * t0;
+    t10 = t8 + t13;
+    X[88] = t6;
+    X[71] = t10;
+    t14 = re[35];
+    t3 = im[35];
+    t1 = re[51];
+    t4 = im[51];
+    t5 = re[67];
+    t12 = im[67];
+    t11 = re[3];
+    t7 = im[3];
+    t2 = re[19];
+    t9 = im[19];
+    t0 = t1 + t2;
+    t8 = t4 + t9;
+    t13 = t5 + t11;
+    t6 = t12 + t7;
+    t10 = t1 - t2;
+    t1 = t4 - t9;
+    t2 = t5 - t11;
+    t4 = t12 - t7;
+    t9 = t0 + t13;
+    t5 = t8 + t6;
+    t11 = t0 - t13;
+    t12 = C14 * t11;
+    t7 = t8 - t6;
+    t0 = C14 * t7;
+    t13 = C15 * t9;
+    t11 = t14 - t13;
+    t8 = C15 * t5;
+    t6 = t3 - t8;
+    t7 = t11 + t12;
+    t13 = t6 + t0;
+    t8 = t11 - t12;
+    t11 = t6 - t0;
+    t12 = C0 * t10;
+    t6 = C16 * t2;
+    t0 = t12 + t6;
+    t12 = C0 * t1;
+    t6 = C16 * t4;
+    t12 = t12 + t6;
+    t6 = C16 * t10;
+    t10 = C0 * t2;
+    t2 = t6 - t10;
+    t6 = C16 * t1;
+    t10 = C0 * t4;
+    t1 = t6 - t10;
+    t4 = t14 + t9;
+    t6 = t3 + t5;
+    t10 = t7 + t12;
+    t14 = t13 - t0;
+    t9 = t8 + t1;
+    t3 = t11 - t2;
+    t5 = t8 - t1;
+    t8 = t11 + t2;
+    t1 = t7 - t12;
+    t11 = t13 + t0;
+    t2 = C147 * t4;
+    t7 = C148 * t6;
+    t12 = t2 + t7;
+    t13 = C148 * t4;
+    t0 = (-C147) * t6;
+    t2 = t13 + t0;
+    X[90] = t12;
+    X[69] = t2;
+    t7 = C149 * t10;
+    t4 = C150 * t14;
+    t6 = t7 + t4;
+    t13 = C150 * t10;
+    t0 = (-C149) * t14;
+    t12 = t13 + t0;
+    X[122] = t6;
+    X[37] = t12;
+    t2 = C151 * t9;
+    t7 = C152 * t3;
+    t4 = t2 + t7;
+    t10 = C152 * t9;
+    t14 = (-C151) * t3;
+    t13 = t10 + t14;
+    X[154] = t4;
+    X[5] = t13;
+    t0 = C153 * t5;
+    t6 = C154 * t8;
+    t12 = t0 + t6;
+    t2 = C154 * t5;
+    t7 = (-C153) * t8;
+    t9 = t2 + t7;
+    X[26] = t12;
+    X[133] = t9;
+    t3 = C155 * t1;
+    t10 = C156 * t11;
+    t14 = t3 + t10;
+    t4 = C156 * t1;
+    t13 = (-C155) * t11;
+    t0 = t4 + t13;
+    X[58] = t14;
+    X[101] = t0;
+    t6 = re[55];
+    t5 = im[55];
+    t8 = re[71];
+    t2 = im[71];
+    t7 = re[7];
+    t12 = im[7];
+    t9 = re[23];
+    t3 = im[23];
+    t10 = re[39];
+    t1 = im[39];
+    t11 = t8 + t10;
+    t4 = t2 + t1;
+    t13 = t7 + t9;
+    t14 = t12 + t3;
+    t0 = t8 - t10;
+    t8 = t2 - t1;
+    t10 = t7 - t9;
+    t2 = t12 - t3;
+    t1 = t11 + t13;
+    t7 = t4 + t14;
+    t9 = t11 - t13;
+    t12 = C14 * t9;
+    t3 = t4 - t14;
+    t11 = C14 * t3;
+    t13 = C15 * t1;
+    t9 = t6 - t13;
+    t4 = C15 * t7;
+    t14 = t5 - t4;
+    t3 = t9 + t12;
+    t13 = t14 + t11;
+    t4 = t9 - t12;
+    t9 = t14 - t11;
+    t12 = C0 * t0;
+    t14 = C16 * t10;
+    t11 = t12 + t14;
+    t12 = C0 * t8;
+    t14 = C16 * t2;
+    t12 = t12 + t14;
+    t14 = C16 * t0;
+    t0 = C0 * t10;
+    t10 = t14 - t0;
+    t14 = C16 * t8;
+    t0 = C0 * t2;
+    t8 = t14 - t0;
+    t2 = t6 + t1;
+    t14 = t5 + t7;
+    t0 = t3 + t12;
+    t6 = t13 - t11;
+    t1 = t4 + t8;
+    t5 = t9 - t10;
+    t7 = t4 - t8;
+    t4 = t9 + t10;
+    t8 = t3 - t12;
+    t9 = t13 + t11;
+    t10 = C157 * t2;
+    t3 = C158 * t14;
+    t12 = t10 + t3;
+    t13 = C158 * t2;
+    t11 = (-C157) * t14;
+    t10 = t13 + t11;
+    X[60] = t12;
+    X[99] = t10;
+    t3 = C159 * t0;
+    t2 = C160 * t6;
+    t14 = t3 + t2;
+    t13 = C160 * t0;
+    t11 = (-C159) * t6;
+    t12 = t13 + t11;
+    X[92] = t14;
+    X[67] = t12;
+    t10 = C161 * t1;
+    t3 = C162 * t5;
+    t2 = t10 + t3;
+    t0 = C162 * t1;
+    t6 = (-C161) * t5;
+    t13 = t0 + t6;
+    X[124] = t2;
+    X[35] = t13;
+    t11 = C163 * t7;
+    t14 = C164 * t4;
+    t12 = t11 + t14;
+    t10 = C164 * t7;
+    t3 = (-C163) * t4;
+    t1 = t10 + t3;
+    X[156] = t12;
+    X[3] = t1;
+    t5 = C165 * t8;
+    t0 = C166 * t9;
+    t6 = t5 + t0;
+    t2 = C166 * t8;
+    t13 = (-C165) * t9;
+    t11 = t2 + t13;
+    X[28] = t6;
+    X[131] = t11;
+    t14 = re[75];
+    t7 = im[75];
+    t4 = re[11];
+    t10 = im[11];
+    t3 = re[27];
+    t12 = im[27];
+    t1 = re[43];
+    t5 = im[43];
+    t0 = re[59];
+    t8 = im[59];
+    t9 = t4 + t0;
+    t2 = t10 + t8;
+    t13 = t3 + t1;
+    t6 = t12 + t5;
+    t11 = t4 - t0;
+    t4 = t10 - t8;
+    t0 = t3 - t1;
+    t10 = t12 - t5;
+    t8 = t9 + t13;
+    t3 = t2 + t6;
+    t1 = t9 - t13;
+    t12 = C14 * t1;
+    t5 = t2 - t6;
+    t9 = C14 * t5;
+    t13 = C15 * t8;
+    t1 = t14 - t13;
+    t2 = C15 * t3;
+    t6 = t7 - t2;
+    t5 = t1 + t12;
+    t13 = t6 + t9;
+    t2 = t1 - t12;
+    t1 = t6 - t9;
+    t12 = C0 * t11;
+    t6 = C16 * t0;
+    t9 = t12 + t6;
+    t12 = C0 * t4;
+    t6 = C16 * t10;
+    t12 = t12 + t6;
+    t6 = C16 * t11;
+    t11 = C0 * t0;
+    t0 = t6 - t11;
+    t6 = C16 * t4;
+    t11 = C0 * t10;
+    t4 = t6 - t11;
+    t10 = t14 + t8;
+    t6 = t7 + t3;
+    t11 = t5 + t12;
+    t14 = t13 - t9;
+    t8 = t2 + t4;
+    t7 = t1 - t0;
+    t3 = t2 - t4;
+    t2 = t1 + t0;
+    t4 = t5 - t12;
+    t1 = t13 + t9;
+    t0 = C167 * t10;
+    t5 = C168 * t6;
+    t12 = t0 + t5;
+    t13 = C168 * t10;
+    t9 = (-C167) * t6;
+    t0 = t13 + t9;
+    X[30] = t12;
+    X[129] = t0;
+    t5 = C169 * t11;
+    t10 = C170 * t14;
+    t6 = t5 + t10;
+    t13 = C170 * t11;
+    t9 = (-C169) * t14;
+    t12 = t13 + t9;
+    X[62] = t6;
+    X[97] = t12;
+    t0 = C171 * t8;
+    t5 = C172 * t7;
+    t10 = t0 + t5;
+    t11 = C172 * t8;
+    t14 = (-C171) * t7;
+    t13 = t11 + t14;
+    X[94] = t10;
+    X[65] = t13;
+    t9 = C173 * t3;
+    t6 = C174 * t2;
+    t12 = t9 + t6;
+    t0 = C174 * t3;
+    t5 = (-C173) * t2;
+    t8 = t0 + t5;
+    X[126] = t12;
+    X[33] = t8;
+    t7 = C175 * t4;
+    t11 = C176 * t1;
+    t14 = t7 + t11;
+    t10 = C176 * t4;
+    t13 = (-C175) * t1;
+    t9 = t10 + t13;
+    X[158] = t14;
+    X[1] = t9;
+}
+
+/**
+ *  Part 1 of ApplyWindowedIMDCT_W10_160().
+ * 
+ *  @param {Number[]} X 
+ *    - The input block (160 points).
+ *  @param {Number[]} y 
+ *    - The array that would contain the output block (320 points).
+ *  @param {Number[]} re 
+ *    - The scratch buffer (real part, 80 points).
+ *  @param {Number[]} im 
+ *    - The scratch buffer (imaginary part, 80 points).
+ */
+function ApplyWindowedIMDCT_W10_160_Part1(X, y, re, im) {
+    let t0, t1, t10, t11, t2, t3, t4, t5, t6, t7, t8, t9;
+    const C0 = 0.9238795325112867;
+    const C1 = 0.3826834323650898;
+    const C2 = 0.7071067811865476;
+    const C3 = 0.7071067811865475;
+    const C4 = 0.9951847266721969;
+    const C5 = 0.0980171403295606;
+    const C6 = 0.881921264348355;
+    const C7 = 0.47139673682599764;
+    const C8 = 0.6343932841636455;
+    const C9 = 0.773010453362737;
+    const C10 = 0.29028467725446233;
+    const C11 = 0.9569403357322088;
+    const C12 = 1.3065629648763766;
+    const C13 = 0.5411961001461969;
+    const C14 = 0.9807852804032304;
+    const C15 = 0.19509032201612825;
+    const C16 = 0.8314696123025452;
+    const C17 = 0.5555702330196022;
+    const C18 = 0.9510565162951535;
+    const C19 = 0.3090169943749474;
+    const C20 = 0.7604059656000309;
+    const C21 = 0.6494480483301837;
+    const C22 = 0.45399049973954675;
+    const C23 = 0.8910065241883679;
+    const C24 = 0.07845909572784494;
+    const C25 = 0.996917333733128;
+    const C26 = 0.916187957117136;
+    const C27 = 0.40074883310314097;
+    const C28 = 0.6930873625456359;
+    const C29 = 0.7208535967029188;
+    const C30 = 0.36447049987914965;
+    const C31 = 0.9312149347588036;
+    const C32 = 0.9998072404820648;
+    const C33 = 0.0196336924606283;
+    const C34 = 0.8724960070727972;
+    const C35 = 0.4886212414969549;
+    const C36 = 0.619093949309834;
+    const C37 = 0.785316930880745;
+    const C38 = 0.27144044986507426;
+    const C39 = 0.9624552364536473;
+    const C40 = 0.9930684569549263;
+    const C41 = 0.11753739745783764;
+    const C42 = 0.8204014435255136;
+    const C43 = 0.5717879602276122;
+    const C44 = 0.5391383229110002;
+    const C45 = 0.8422172337162865;
+    const C46 = 0.1757962799343545;
+    const C47 = 0.9844265680898916;
+    const C48 = 0.9767658813208724;
+    const C49 = 0.21430915306505077;
+    const C50 = 0.8090169943749475;
+    const C51 = 0.5877852522924731;
+    const C52 = 0.5224985647159488;
+    const C53 = 0.8526401643540922;
+    const C54 = 0.15643446504023087;
+    const C55 = 0.9876883405951378;
+    const C56 = 0.9723699203976766;
+    const C57 = 0.2334453638559054;
+    const C58 = 0.7475083268625968;
+    const C59 = 0.6642524379112817;
+    const C60 = 0.436409240673342;
+    const C61 = 0.8997482840522215;
+    const C62 = 0.05887080365118903;
+    const C63 = 0.9982656101847159;
+    const C64 = 0.944806046466878;
+    const C65 = 0.3276301795616935;
+    const C66 = 0.6788007455329417;
+    const C67 = 0.7343225094356856;
+    const C68 = 0.34611705707749296;
+    const C69 = 0.9381913359224842;
+    const C70 = 0.9992290362407229;
+    const C71 = 0.03925981575906861;
+    const C72 = 0.9081431738250813;
+    const C73 = 0.41865973753742813;
+    const C74 = 0.6035559419535714;
+    const C75 = 0.7973206537727071;
+    const C76 = 0.25249157701515795;
+    const C77 = 0.9675990923602598;
+    const C78 = 0.9905693404435773;
+    const C79 = 0.13701234168196802;
+    const C80 = 0.8627343859777918;
+    const C81 = 0.5056573733779846;
+    t0 = X[0];
+    t1 = X[159];
+    t2 = X[40];
+    t3 = X[119];
+    t4 = C0 * t2;
+    t5 = C1 * t3;
+    t4 = t4 + t5;
+    t5 = (-C1) * t2;
+    t2 = C0 * t3;
+    t3 = t5 + t2;
+    t5 = X[80];
+    t2 = X[79];
+    t6 = C2 * t5;
+    t7 = C3 * t2;
+    t6 = t6 + t7;
+    t7 = (-C3) * t5;
+    t5 = C2 * t2;
+    t2 = t7 + t5;
+    t7 = X[120];
+    t5 = X[39];
+    t8 = C1 * t7;
+    t9 = C0 * t5;
+    t8 = t8 + t9;
+    t9 = (-C0) * t7;
+    t7 = C1 * t5;
+    t5 = t9 + t7;
+    t9 = t0 + t6;
+    t7 = t1 + t2;
+    t10 = t4 + t8;
+    t11 = t3 + t5;
+    t0 = t0 - t6;
+    t6 = t1 - t2;
+    t1 = t4 - t8;
+    t2 = t3 - t5;
+    t4 = t9 + t10;
+    t8 = t7 + t11;
+    t3 = t0 + t2;
+    t5 = t6 - t1;
+    t9 = t9 - t10;
+    t10 = t7 - t11;
+    t7 = t0 - t2;
+    t11 = t6 + t1;
+    re[0] = t4;
+    im[0] = t8;
+    re[20] = t3;
+    im[20] = t5;
+    re[40] = t9;
+    im[40] = t10;
+    re[60] = t7;
+    im[60] = t11;
+    t0 = X[10];
+    t2 = X[149];
+    t6 = C4 * t0;
+    t1 = C5 * t2;
+    t4 = t6 + t1;
+    t8 = (-C5) * t0;
+    t3 = C4 * t2;
+    t5 = t8 + t3;
+    t9 = X[50];
+    t10 = X[109];
+    t7 = C6 * t9;
+    t11 = C7 * t10;
+    t6 = t7 + t11;
+    t1 = (-C7) * t9;
+    t0 = C6 * t10;
+    t2 = t1 + t0;
+    t8 = X[90];
+    t3 = X[69];
+    t7 = C8 * t8;
+    t11 = C9 * t3;
+    t9 = t7 + t11;
+    t10 = (-C9) * t8;
+    t1 = C8 * t3;
+    t0 = t10 + t1;
+    t7 = X[130];
+    t11 = X[29];
+    t8 = C10 * t7;
+    t3 = C11 * t11;
+    t10 = t8 + t3;
+    t1 = (-C11) * t7;
+    t8 = C10 * t11;
+    t3 = t1 + t8;
+    t7 = t4 + t9;
+    t11 = t5 + t0;
+    t1 = t6 + t10;
+    t8 = t2 + t3;
+    t4 = t4 - t9;
+    t9 = t5 - t0;
+    t5 = t6 - t10;
+    t0 = t2 - t3;
+    t6 = t7 + t1;
+    t10 = t11 + t8;
+    t2 = t4 + t0;
+    t3 = t9 - t5;
+    t7 = t7 - t1;
+    t1 = t11 - t8;
+    t11 = t4 - t0;
+    t8 = t9 + t5;
+    t4 = t2 + t3;
+    t0 = C0 * t4;
+    t9 = t2 * (-C12);
+    t5 = t3 * C13;
+    t4 = t0 - t5;
+    t2 = t0 + t9;
+    t3 = t7 + t1;
+    t5 = t7 - t1;
+    t0 = C2 * t3;
+    t9 = (-C2) * t5;
+    t7 = t11 + t8;
+    t1 = C1 * t7;
+    t3 = t11 * (-C12);
+    t5 = t8 * (-C13);
+    t7 = t1 - t5;
+    t11 = t1 + t3;
+    re[5] = t6;
+    im[5] = t10;
+    re[25] = t4;
+    im[25] = t2;
+    re[45] = t0;
+    im[45] = t9;
+    re[65] = t7;
+    im[65] = t11;
+    t8 = X[20];
+    t5 = X[139];
+    t1 = C14 * t8;
+    t3 = C15 * t5;
+    t6 = t1 + t3;
+    t10 = (-C15) * t8;
+    t4 = C14 * t5;
+    t2 = t10 + t4;
+    t0 = X[60];
+    t9 = X[99];
+    t7 = C16 * t0;
+    t11 = C17 * t9;
+    t1 = t7 + t11;
+    t3 = (-C17) * t0;
+    t8 = C16 * t9;
+    t5 = t3 + t8;
+    t10 = X[100];
+    t4 = X[59];
+    t7 = C17 * t10;
+    t11 = C16 * t4;
+    t0 = t7 + t11;
+    t9 = (-C16) * t10;
+    t3 = C17 * t4;
+    t8 = t9 + t3;
+    t7 = X[140];
+    t11 = X[19];
+    t10 = C15 * t7;
+    t4 = C14 * t11;
+    t9 = t10 + t4;
+    t3 = (-C14) * t7;
+    t10 = C15 * t11;
+    t4 = t3 + t10;
+    t7 = t6 + t0;
+    t11 = t2 + t8;
+    t3 = t1 + t9;
+    t10 = t5 + t4;
+    t6 = t6 - t0;
+    t0 = t2 - t8;
+    t2 = t1 - t9;
+    t8 = t5 - t4;
+    t1 = t7 + t3;
+    t9 = t11 + t10;
+    t5 = t6 + t8;
+    t4 = t0 - t2;
+    t7 = t7 - t3;
+    t3 = t11 - t10;
+    t11 = t6 - t8;
+    t10 = t0 + t2;
+    t6 = t5 + t4;
+    t8 = t5 - t4;
+    t0 = C2 * t6;
+    t2 = (-C2) * t8;
+    t5 = -t7;
+    t4 = t11 - t10;
+    t6 = t11 + t10;
+    t8 = (-C2) * t4;
+    t7 = (-C2) * t6;
+    re[10] = t1;
+    im[10] = t9;
+    re[30] = t0;
+    im[30] = t2;
+    re[50] = t3;
+    im[50] = t5;
+    re[70] = t8;
+    im[70] = t7;
+    t11 = X[30];
+    t10 = X[129];
+    t4 = C11 * t11;
+    t6 = C10 * t10;
+    t1 = t4 + t6;
+    t9 = (-C10) * t11;
+    t0 = C11 * t10;
+    t2 = t9 + t0;
+    t3 = X[70];
+    t5 = X[89];
+    t8 = C9 * t3;
+    t7 = C8 * t5;
+    t4 = t8 + t7;
+    t6 = (-C8) * t3;
+    t11 = C9 * t5;
+    t10 = t6 + t11;
+    t9 = X[110];
+    t0 = X[49];
+    t8 = C7 * t9;
+    t7 = C6 * t0;
+    t3 = t8 + t7;
+    t5 = (-C6) * t9;
+    t6 = C7 * t0;
+    t11 = t5 + t6;
+    t8 = X[150];
+    t7 = X[9];
+    t9 = C5 * t8;
+    t0 = C4 * t7;
+    t5 = t9 + t0;
+    t6 = (-C4) * t8;
+    t9 = C5 * t7;
+    t0 = t6 + t9;
+    t8 = t1 + t3;
+    t7 = t2 + t11;
+    t6 = t4 + t5;
+    t9 = t10 + t0;
+    t1 = t1 - t3;
+    t3 = t2 - t11;
+    t2 = t4 - t5;
+    t11 = t10 - t0;
+    t4 = t8 + t6;
+    t5 = t7 + t9;
+    t10 = t1 + t11;
+    t0 = t3 - t2;
+    t8 = t8 - t6;
+    t6 = t7 - t9;
+    t7 = t1 - t11;
+    t9 = t3 + t2;
+    t1 = t10 + t0;
+    t11 = C1 * t1;
+    t3 = t10 * (-C12);
+    t2 = t0 * (-C13);
+    t1 = t11 - t2;
+    t10 = t11 + t3;
+    t0 = t8 - t6;
+    t2 = t8 + t6;
+    t11 = (-C2) * t0;
+    t3 = (-C2) * t2;
+    t8 = t7 + t9;
+    t6 = (-C0) * t8;
+    t0 = t7 * C12;
+    t2 = t9 * (-C13);
+    t8 = t6 - t2;
+    t7 = t6 + t0;
+    re[15] = t4;
+    im[15] = t5;
+    re[35] = t1;
+    im[35] = t10;
+    re[55] = t11;
+    im[55] = t3;
+    re[75] = t8;
+    im[75] = t7;
+    t9 = re[0];
+    t2 = im[0];
+    t6 = re[5];
+    t0 = im[5];
+    t4 = re[10];
+    t5 = im[10];
+    t1 = re[15];
+    t10 = im[15];
+    t11 = t9 + t4;
+    t3 = t2 + t5;
+    t8 = t6 + t1;
+    t7 = t0 + t10;
+    t9 = t9 - t4;
+    t4 = t2 - t5;
+    t2 = t6 - t1;
+    t5 = t0 - t10;
+    t6 = t11 + t8;
+    t1 = t3 + t7;
+    t0 = t9 + t5;
+    t10 = t4 - t2;
+    t11 = t11 - t8;
+    t8 = t3 - t7;
+    t3 = t9 - t5;
+    t7 = t4 + t2;
+    re[0] = t6;
+    im[0] = t1;
+    re[5] = t0;
+    im[5] = t10;
+    re[10] = t11;
+    im[10] = t8;
+    re[15] = t3;
+    im[15] = t7;
+    t9 = re[20];
+    t5 = im[20];
+    t4 = re[25];
+    t2 = im[25];
+    t6 = re[30];
+    t1 = im[30];
+    t0 = re[35];
+    t10 = im[35];
+    t11 = t9 + t6;
+    t8 = t5 + t1;
+    t3 = t4 + t0;
+    t7 = t2 + t10;
+    t9 = t9 - t6;
+    t6 = t5 - t1;
+    t5 = t4 - t0;
+    t1 = t2 - t10;
+    t4 = t11 + t3;
+    t0 = t8 + t7;
+    t2 = t9 + t1;
+    t10 = t6 - t5;
+    t11 = t11 - t3;
+    t3 = t8 - t7;
+    t8 = t9 - t1;
+    t7 = t6 + t5;
+    re[20] = t4;
+    im[20] = t0;
+    re[25] = t2;
+    im[25] = t10;
+    re[30] = t11;
+    im[30] = t3;
+    re[35] = t8;
+    im[35] = t7;
+    t9 = re[40];
+    t1 = im[40];
+    t6 = re[45];
+    t5 = im[45];
+    t4 = re[50];
+    t0 = im[50];
+    t2 = re[55];
+    t10 = im[55];
+    t11 = t9 + t4;
+    t3 = t1 + t0;
+    t8 = t6 + t2;
+    t7 = t5 + t10;
+    t9 = t9 - t4;
+    t4 = t1 - t0;
+    t1 = t6 - t2;
+    t0 = t5 - t10;
+    t6 = t11 + t8;
+    t2 = t3 + t7;
+    t5 = t9 + t0;
+    t10 = t4 - t1;
+    t11 = t11 - t8;
+    t8 = t3 - t7;
+    t3 = t9 - t0;
+    t7 = t4 + t1;
+    re[40] = t6;
+    im[40] = t2;
+    re[45] = t5;
+    im[45] = t10;
+    re[50] = t11;
+    im[50] = t8;
+    re[55] = t3;
+    im[55] = t7;
+    t9 = re[60];
+    t0 = im[60];
+    t4 = re[65];
+    t1 = im[65];
+    t6 = re[70];
+    t2 = im[70];
+    t5 = re[75];
+    t10 = im[75];
+    t11 = t9 + t6;
+    t8 = t0 + t2;
+    t3 = t4 + t5;
+    t7 = t1 + t10;
+    t9 = t9 - t6;
+    t6 = t0 - t2;
+    t0 = t4 - t5;
+    t2 = t1 - t10;
+    t4 = t11 + t3;
+    t5 = t8 + t7;
+    t1 = t9 + t2;
+    t10 = t6 - t0;
+    t11 = t11 - t3;
+    t3 = t8 - t7;
+    t8 = t9 - t2;
+    t7 = t6 + t0;
+    re[60] = t4;
+    im[60] = t5;
+    re[65] = t1;
+    im[65] = t10;
+    re[70] = t11;
+    im[70] = t3;
+    re[75] = t8;
+    im[75] = t7;
+    t9 = X[32];
+    t2 = X[127];
+    t6 = C18 * t9;
+    t0 = C19 * t2;
+    t4 = t6 + t0;
+    t5 = (-C19) * t9;
+    t1 = C18 * t2;
+    t10 = t5 + t1;
+    t11 = X[72];
+    t3 = X[87];
+    t8 = C20 * t11;
+    t7 = C21 * t3;
+    t6 = t8 + t7;
+    t0 = (-C21) * t11;
+    t9 = C20 * t3;
+    t2 = t0 + t9;
+    t5 = X[112];
+    t1 = X[47];
+    t8 = C22 * t5;
+    t7 = C23 * t1;
+    t11 = t8 + t7;
+    t3 = (-C23) * t5;
+    t0 = C22 * t1;
+    t9 = t3 + t0;
+    t8 = X[152];
+    t7 = X[7];
+    t5 = C24 * t8;
+    t1 = C25 * t7;
+    t3 = t5 + t1;
+    t0 = (-C25) * t8;
+    t5 = C24 * t7;
+    t1 = t0 + t5;
+    t8 = t4 + t11;
+    t7 = t10 + t9;
+    t0 = t6 + t3;
+    t5 = t2 + t1;
+    t4 = t4 - t11;
+    t11 = t10 - t9;
+    t10 = t6 - t3;
+    t9 = t2 - t1;
+    t6 = t8 + t0;
+    t3 = t7 + t5;
+    t2 = t4 + t9;
+    t1 = t11 - t10;
+    t8 = t8 - t0;
+    t0 = t7 - t5;
+    t7 = t4 - t9;
+    t5 = t11 + t10;
+    re[16] = t6;
+    im[16] = t3;
+    re[36] = t2;
+    im[36] = t1;
+    re[56] = t8;
+    im[56] = t0;
+    re[76] = t7;
+    im[76] = t5;
+    t4 = X[42];
+    t9 = X[117];
+    t11 = C26 * t4;
+    t10 = C27 * t9;
+    t6 = t11 + t10;
+    t3 = (-C27) * t4;
+    t2 = C26 * t9;
+    t1 = t3 + t2;
+    t8 = X[82];
+    t0 = X[77];
+    t7 = C28 * t8;
+    t5 = C29 * t0;
+    t11 = t7 + t5;
+    t10 = (-C29) * t8;
+    t4 = C28 * t0;
+    t9 = t10 + t4;
+    t3 = X[122];
+    t2 = X[37];
+    t7 = C30 * t3;
+    t5 = C31 * t2;
+    t8 = t7 + t5;
+    t0 = (-C31) * t3;
+    t10 = C30 * t2;
+    t4 = t0 + t10;
+    t7 = X[2];
+    t5 = X[157];
+    t3 = C32 * t7;
+    t2 = C33 * t5;
+    t0 = t3 + t2;
+    t10 = (-C33) * t7;
+    t3 = C32 * t5;
+    t2 = t10 + t3;
+    t7 = t6 + t8;
+    t5 = t1 + t4;
+    t10 = t11 + t0;
+    t3 = t9 + t2;
+    t6 = t6 - t8;
+    t8 = t1 - t4;
+    t1 = t11 - t0;
+    t4 = t9 - t2;
+    t11 = t7 + t10;
+    t0 = t5 + t3;
+    t9 = t6 + t4;
+    t2 = t8 - t1;
+    t7 = t7 - t10;
+    t10 = t5 - t3;
+    t5 = t6 - t4;
+    t3 = t8 + t1;
+    t6 = t9 + t2;
+    t4 = C0 * t6;
+    t8 = t9 * (-C12);
+    t1 = t2 * C13;
+    t6 = t4 - t1;
+    t9 = t4 + t8;
+    t2 = t7 + t10;
+    t1 = t7 - t10;
+    t4 = C2 * t2;
+    t8 = (-C2) * t1;
+    t7 = t5 + t3;
+    t10 = C1 * t7;
+    t2 = t5 * (-C12);
+    t1 = t3 * (-C13);
+    t7 = t10 - t1;
+    t5 = t10 + t2;
+    re[21] = t11;
+    im[21] = t0;
+    re[41] = t6;
+    im[41] = t9;
+    re[61] = t4;
+    im[61] = t8;
+    re[1] = t7;
+    im[1] = t5;
+    t3 = X[52];
+    t1 = X[107];
+    t10 = C34 * t3;
+    t2 = C35 * t1;
+    t11 = t10 + t2;
+    t0 = (-C35) * t3;
+    t6 = C34 * t1;
+    t9 = t0 + t6;
+    t4 = X[92];
+    t8 = X[67];
+    t7 = C36 * t4;
+    t5 = C37 * t8;
+    t10 = t7 + t5;
+    t2 = (-C37) * t4;
+    t3 = C36 * t8;
+    t1 = t2 + t3;
+    t0 = X[132];
+    t6 = X[27];
+    t7 = C38 * t0;
+    t5 = C39 * t6;
+    t4 = t7 + t5;
+    t8 = (-C39) * t0;
+    t2 = C38 * t6;
+    t3 = t8 + t2;
+    t7 = X[12];
+    t5 = X[147];
+    t0 = C40 * t7;
+    t6 = C41 * t5;
+    t8 = t0 + t6;
+    t2 = (-C41) * t7;
+    t0 = C40 * t5;
+    t6 = t2 + t0;
+    t7 = t11 + t4;
+    t5 = t9 + t3;
+    t2 = t10 + t8;
+    t0 = t1 + t6;
+    t11 = t11 - t4;
+    t4 = t9 - t3;
+    t9 = t10 - t8;
+    t3 = t1 - t6;
+    t10 = t7 + t2;
+    t8 = t5 + t0;
+    t1 = t11 + t3;
+    t6 = t4 - t9;
+    t7 = t7 - t2;
+    t2 = t5 - t0;
+    t5 = t11 - t3;
+    t0 = t4 + t9;
+    t11 = t1 + t6;
+    t3 = t1 - t6;
+    t4 = C2 * t11;
+    t9 = (-C2) * t3;
+    t1 = -t7;
+    t6 = t5 - t0;
+    t11 = t5 + t0;
+    t3 = (-C2) * t6;
+    t7 = (-C2) * t11;
+    re[26] = t10;
+    im[26] = t8;
+    re[46] = t4;
+    im[46] = t9;
+    re[66] = t2;
+    im[66] = t1;
+    re[6] = t3;
+    im[6] = t7;
+    t5 = X[62];
+    t0 = X[97];
+    t6 = C42 * t5;
+    t11 = C43 * t0;
+    t10 = t6 + t11;
+    t8 = (-C43) * t5;
+    t4 = C42 * t0;
+    t9 = t8 + t4;
+    t2 = X[102];
+    t1 = X[57];
+    t3 = C44 * t2;
+    t7 = C45 * t1;
+    t6 = t3 + t7;
+    t11 = (-C45) * t2;
+    t5 = C44 * t1;
+    t0 = t11 + t5;
+    t8 = X[142];
+    t4 = X[17];
+    t3 = C46 * t8;
+    t7 = C47 * t4;
+    t2 = t3 + t7;
+    t1 = (-C47) * t8;
+    t11 = C46 * t4;
+    t5 = t1 + t11;
+    t3 = X[22];
+    t7 = X[137];
+    t8 = C48 * t3;
+    t4 = C49 * t7;
+    t1 = t8 + t4;
+    t11 = (-C49) * t3;
+    t8 = C48 * t7;
+    t4 = t11 + t8;
+    t3 = t10 + t2;
+    t7 = t9 + t5;
+    t11 = t6 + t1;
+    t8 = t0 + t4;
+    t10 = t10 - t2;
+    t2 = t9 - t5;
+    t9 = t6 - t1;
+    t5 = t0 - t4;
+    t6 = t3 + t11;
+    t1 = t7 + t8;
+    t0 = t10 + t5;
+    t4 = t2 - t9;
+    t3 = t3 - t11;
+    t11 = t7 - t8;
+    t7 = t10 - t5;
+    t8 = t2 + t9;
+    t10 = t0 + t4;
+    t5 = C1 * t10;
+    t2 = t0 * (-C12);
+    t9 = t4 * (-C13);
+    t10 = t5 - t9;
+    t0 = t5 + t2;
+    t4 = t3 - t11;
+    t9 = t3 + t11;
+    t5 = (-C2) * t4;
+    t2 = (-C2) * t9;
+    t3 = t7 + t8;
+    t11 = (-C0) * t3;
+    t4 = t7 * C12;
+    t9 = t8 * (-C13);
+    t3 = t11 - t9;
+    t7 = t11 + t4;
+    re[31] = t6;
+    im[31] = t1;
+    re[51] = t10;
+    im[51] = t0;
+    re[71] = t5;
+    im[71] = t2;
+    re[11] = t3;
+    im[11] = t7;
+    t8 = re[16];
+    t9 = im[16];
+    t11 = re[21];
+    t4 = im[21];
+    t6 = re[26];
+    t1 = im[26];
+    t10 = re[31];
+    t0 = im[31];
+    t5 = t8 + t6;
+    t2 = t9 + t1;
+    t3 = t11 + t10;
+    t7 = t4 + t0;
+    t8 = t8 - t6;
+    t6 = t9 - t1;
+    t9 = t11 - t10;
+    t1 = t4 - t0;
+    t11 = t5 + t3;
+    t10 = t2 + t7;
+    t4 = t8 + t1;
+    t0 = t6 - t9;
+    t5 = t5 - t3;
+    t3 = t2 - t7;
+    t2 = t8 - t1;
+    t7 = t6 + t9;
+    re[16] = t11;
+    im[16] = t10;
+    re[21] = t4;
+    im[21] = t0;
+    re[26] = t5;
+    im[26] = t3;
+    re[31] = t2;
+    im[31] = t7;
+    t8 = re[36];
+    t1 = im[36];
+    t6 = re[41];
+    t9 = im[41];
+    t11 = re[46];
+    t10 = im[46];
+    t4 = re[51];
+    t0 = im[51];
+    t5 = t8 + t11;
+    t3 = t1 + t10;
+    t2 = t6 + t4;
+    t7 = t9 + t0;
+    t8 = t8 - t11;
+    t11 = t1 - t10;
+    t1 = t6 - t4;
+    t10 = t9 - t0;
+    t6 = t5 + t2;
+    t4 = t3 + t7;
+    t9 = t8 + t10;
+    t0 = t11 - t1;
+    t5 = t5 - t2;
+    t2 = t3 - t7;
+    t3 = t8 - t10;
+    t7 = t11 + t1;
+    re[36] = t6;
+    im[36] = t4;
+    re[41] = t9;
+    im[41] = t0;
+    re[46] = t5;
+    im[46] = t2;
+    re[51] = t3;
+    im[51] = t7;
+    t8 = re[56];
+    t10 = im[56];
+    t11 = re[61];
+    t1 = im[61];
+    t6 = re[66];
+    t4 = im[66];
+    t9 = re[71];
+    t0 = im[71];
+    t5 = t8 + t6;
+    t2 = t10 + t4;
+    t3 = t11 + t9;
+    t7 = t1 + t0;
+    t8 = t8 - t6;
+    t6 = t10 - t4;
+    t10 = t11 - t9;
+    t4 = t1 - t0;
+    t11 = t5 + t3;
+    t9 = t2 + t7;
+    t1 = t8 + t4;
+    t0 = t6 - t10;
+    t5 = t5 - t3;
+    t3 = t2 - t7;
+    t2 = t8 - t4;
+    t7 = t6 + t10;
+    re[56] = t11;
+    im[56] = t9;
+    re[61] = t1;
+    im[61] = t0;
+    re[66] = t5;
+    im[66] = t3;
+    re[71] = t2;
+    im[71] = t7;
+    t8 = re[76];
+    t4 = im[76];
+    t6 = re[1];
+    t10 = im[1];
+    t11 = re[6];
+    t9 = im[6];
+    t1 = re[11];
+    t0 = im[11];
+    t5 = t8 + t11;
+    t3 = t4 + t9;
+    t2 = t6 + t1;
+    t7 = t10 + t0;
+    t8 = t8 - t11;
+    t11 = t4 - t9;
+    t4 = t6 - t1;
+    t9 = t10 - t0;
+    t6 = t5 + t2;
+    t1 = t3 + t7;
+    t10 = t8 + t9;
+    t0 = t11 - t4;
+    t5 = t5 - t2;
+    t2 = t3 - t7;
+    t3 = t8 - t9;
+    t7 = t11 + t4;
+    re[76] = t6;
+    im[76] = t1;
+    re[1] = t10;
+    im[1] = t0;
+    re[6] = t5;
+    im[6] = t2;
+    re[11] = t3;
+    im[11] = t7;
+    t8 = X[64];
+    t9 = X[95];
+    t11 = C50 * t8;
+    t4 = C51 * t9;
+    t6 = t11 + t4;
+    t1 = (-C51) * t8;
+    t10 = C50 * t9;
+    t0 = t1 + t10;
+    t5 = X[104];
+    t2 = X[55];
+    t3 = C52 * t5;
+    t7 = C53 * t2;
+    t11 = t3 + t7;
+    t4 = (-C53) * t5;
+    t8 = C52 * t2;
+    t9 = t4 + t8;
+    t1 = X[144];
+    t10 = X[15];
+    t3 = C54 * t1;
+    t7 = C55 * t10;
+    t5 = t3 + t7;
+    t2 = (-C55) * t1;
+    t4 = C54 * t10;
+    t8 = t2 + t4;
+    t3 = X[24];
+    t7 = X[135];
+    t1 = C56 * t3;
+    t10 = C57 * t7;
+    t2 = t1 + t10;
+    t4 = (-C57) * t3;
+    t1 = C56 * t7;
+    t10 = t4 + t1;
+    t3 = t6 + t5;
+    t7 = t0 + t8;
+    t4 = t11 + t2;
+    t1 = t9 + t10;
+    t6 = t6 - t5;
+    t5 = t0 - t8;
+    t0 = t11 - t2;
+    t8 = t9 - t10;
+    t11 = t3 + t4;
+    t2 = t7 + t1;
+    t9 = t6 + t8;
+    t10 = t5 - t0;
+    t3 = t3 - t4;
+    t4 = t7 - t1;
+    t7 = t6 - t8;
+    t1 = t5 + t0;
+    re[32] = t11;
+    im[32] = t2;
+    re[52] = t9;
+    im[52] = t10;
+    re[72] = t3;
+    im[72] = t4;
+    re[12] = t7;
+    im[12] = t1;
+    t6 = X[74];
+    t8 = X[85];
+    t5 = C58 * t6;
+    t0 = C59 * t8;
+    t11 = t5 + t0;
+    t2 = (-C59) * t6;
+    t9 = C58 * t8;
+    t10 = t2 + t9;
+    t3 = X[114];
+    t4 = X[45];
+    t7 = C60 * t3;
+    t1 = C61 * t4;
+    t5 = t7 + t1;
+    t0 = (-C61) * t3;
+    t6 = C60 * t4;
+    t8 = t0 + t6;
+    t2 = X[154];
+    t9 = X[5];
+    t7 = C62 * t2;
+    t1 = C63 * t9;
+    t3 = t7 + t1;
+    t4 = (-C63) * t2;
+    t0 = C62 * t9;
+    t6 = t4 + t0;
+    t7 = X[34];
+    t1 = X[125];
+    t2 = C64 * t7;
+    t9 = C65 * t1;
+    t4 = t2 + t9;
+    t0 = (-C65) * t7;
+    t2 = C64 * t1;
+    t9 = t0 + t2;
+    t7 = t11 + t3;
+    t1 = t10 + t6;
+    t0 = t5 + t4;
+    t2 = t8 + t9;
+    t11 = t11 - t3;
+    t3 = t10 - t6;
+    t10 = t5 - t4;
+    t6 = t8 - t9;
+    t5 = t7 + t0;
+    t4 = t1 + t2;
+    t8 = t11 + t6;
+    t9 = t3 - t10;
+    t7 = t7 - t0;
+    t0 = t1 - t2;
+    t1 = t11 - t6;
+    t2 = t3 + t10;
+    t11 = t8 + t9;
+    t6 = C0 * t11;
+    t3 = t8 * (-C12);
+    t10 = t9 * C13;
+    t11 = t6 - t10;
+    t8 = t6 + t3;
+    t9 = t7 + t0;
+    t10 = t7 - t0;
+    t6 = C2 * t9;
+    t3 = (-C2) * t10;
+    t7 = t1 + t2;
+    t0 = C1 * t7;
+    t9 = t1 * (-C12);
+    t10 = t2 * (-C13);
+    t7 = t0 - t10;
+    t1 = t0 + t9;
+    re[37] = t5;
+    im[37] = t4;
+    re[57] = t11;
+    im[57] = t8;
+    re[77] = t6;
+    im[77] = t3;
+    re[17] = t7;
+    im[17] = t1;
+    t2 = X[84];
+    t10 = X[75];
+    t0 = C66 * t2;
+    t9 = C67 * t10;
+    t5 = t0 + t9;
+    t4 = (-C67) * t2;
+    t11 = C66 * t10;
+    t8 = t4 + t11;
+    t6 = X[124];
+    t3 = X[35];
+    t7 = C68 * t6;
+    t1 = C69 * t3;
+    t0 = t7 + t1;
+    t9 = (-C69) * t6;
+    t2 = C68 * t3;
+    t10 = t9 + t2;
+    t4 = X[4];
+    t11 = X[155];
+    t7 = C70 * t4;
+    t1 = C71 * t11;
+    t6 = t7 + t1;
+    t3 = (-C71) * t4;
+    t9 = C70 * t11;
+    t2 = t3 + t9;
+    t7 = X[44];
+    t1 = X[115];
+    t4 = C72 * t7;
+    t11 = C73 * t1;
+    t3 = t4 + t11;
+    t9 = (-C73) * t7;
+    t4 = C72 * t1;
+    t11 = t9 + t4;
+    t7 = t5 + t6;
+    t1 = t8 + t2;
+    t9 = t0 + t3;
+    t4 = t10 + t11;
+    t5 = t5 - t6;
+    t6 = t8 - t2;
+    t8 = t0 - t3;
+    t2 = t10 - t11;
+    t0 = t7 + t9;
+    t3 = t1 + t4;
+    t10 = t5 + t2;
+    t11 = t6 - t8;
+    t7 = t7 - t9;
+    t9 = t1 - t4;
+    t1 = t5 - t2;
+    t4 = t6 + t8;
+    t5 = t10 + t11;
+    t2 = t10 - t11;
+    t6 = C2 * t5;
+    t8 = (-C2) * t2;
+    t10 = -t7;
+    t11 = t1 - t4;
+    t5 = t1 + t4;
+    t2 = (-C2) * t11;
+    t7 = (-C2) * t5;
+    re[42] = t0;
+    im[42] = t3;
+    re[62] = t6;
+    im[62] = t8;
+    re[2] = t9;
+    im[2] = t10;
+    re[22] = t2;
+    im[22] = t7;
+    t1 = X[94];
+    t4 = X[65];
+    t11 = C74 * t1;
+    t5 = C75 * t4;
+    t0 = t11 + t5;
+    t3 = (-C75) * t1;
+    t6 = C74 * t4;
+    t8 = t3 + t6;
+    t9 = X[134];
+    t10 = X[25];
+    t2 = C76 * t9;
+    t7 = C77 * t10;
+    t11 = t2 + t7;
+    t5 = (-C77) * t9;
+    t1 = C76 * t10;
+    t4 = t5 + t1;
+    t3 = X[14];
+    t6 = X[145];
+    t2 = C78 * t3;
+    t7 = C79 * t6;
+    t9 = t2 + t7;
+    t10 = (-C79) * t3;
+    t5 = C78 * t6;
+    t1 = t10 + t5;
+    t2 = X[54];
+    t7 = X[105];
+    t3 = C80 * t2;
+    t6 = C81 * t7;
+    t10 = t3 + t6;
+    t5 = (-C81) * t2;
+    t3 = C80 * t7;
+    t6 = t5 + t3;
+    t2 = t0 + t9;
+    t7 = t8 + t1;
+    t5 = t11 + t10;
+    t3 = t4 + t6;
+    t0 = t0 - t9;
+    t9 = t8 - t1;
+    t8 = t11 - t10;
+    t1 = t4 - t6;
+    t11 = t2 + t5;
+    t10 = t7 + t3;
+    t4 = t0 + t1;
+    t6 = t9 - t8;
+    t2 = t2 - t5;
+    t5 = t7 - t3;
+    t7 = t0 - t1;
+    t3 = t9 + t8;
+    t0 = t4 + t6;
+    t1 = C1 * t0;
+    t9 = t4 * (-C12);
+    t8 = t6 * (-C13);
+    t0 = t1 - t8;
+    t4 = t1 + t9;
+    t6 = t2 - t5;
+    t8 = t2 + t5;
+    t1 = (-C2) * t6;
+    t9 = (-C2) * t8;
+    t2 = t7 + t3;
+    t5 = (-C0) * t2;
+    t6 = t7 * C12;
+    t8 = t3 * (-C13);
+    t2 = t5 - t8;
+    t7 = t5 + t6;
+    re[47] = t11;
+    im[47] = t10;
+    re[67] = t0;
+    im[67] = t4;
+    re[7] = t1;
+    im[7] = t9;
+    re[27] = t2;
+    im[27] = t7;
+    t3 = re[32];
+    t8 = im[32];
+    t5 = re[37];
+    t6 = im[37];
+    t11 = re[42];
+    t10 = im[42];
+    t0 = re[47];
+    t4 = im[47];
+    t1 = t3 + t11;
+    t9 = t8 + t10;
+    t2 = t5 + t0;
+    t7 = t6 + t4;
+    t3 = t3 - t11;
+    t11 = t8 - t10;
+    t8 = t5 - t0;
+    t10 = t6 - t4;
+    t5 = t1 + t2;
+    t0 = t9 + t7;
+    t6 = t3 + t10;
+    t4 = t11 - t8;
+    t1 = t1 - t2;
+    t2 = t9 - t7;
+    t9 = t3 - t10;
+    t7 = t11 + t8;
+    re[32] = t5;
+    im[32] = t0;
+    re[37] = t6;
+    im[37] = t4;
+    re[42] = t1;
+    im[42] = t2;
+    re[47] = t9;
+    im[47] = t7;
+    t3 = re[52];
+    t10 = im[52];
+    t11 = re[57];
+    t8 = im[57];
+    t5 = re[62];
+    t0 = im[62];
+    t6 = re[67];
+    t4 = im[67];
+    t1 = t3 + t5;
+    t2 = t10 + t0;
+    t9 = t11 + t6;
+    t7 = t8 + t4;
+    t3 = t3 - t5;
+    t5 = t10 - t0;
+    t10 = t11 - t6;
+    t0 = t8 - t4;
+    t11 = t1 + t9;
+    t6 = t2 + t7;
+    t8 = t3 + t0;
+    t4 = t5 - t10;
+    t1 = t1 - t9;
+    t9 = t2 - t7;
+    t2 = t3 - t0;
+    t7 = t5 + t10;
+    re[52] = t11;
+    im[52] = t6;
+    re[57] = t8;
+    im[57] = t4;
+    re[62] = t1;
+    im[62] = t9;
+    re[67] = t2;
+    im[67] = t7;
+    t3 = re[72];
+    t0 = im[72];
+    t5 = re[77];
+    t10 = im[77];
+    t11 = re[2];
+    t6 = im[2];
+    t8 = re[7];
+    t4 = im[7];
+    t1 = t3 + t11;
+    t9 = t0 + t6;
+    t2 = t5 + t8;
+    t7 = t10 + t4;
+    t3 = t3 - t11;
+    t11 = t0 - t6;
+    t0 = t5 - t8;
+    t6 = t10 - t4;
+    t5 = t1 + t2;
+    t8 = t9 + t7;
+    t10 = t3 + t6;
+    t4 = t11 - t0;
+    t1 = t1 - t2;
+    t2 = t9 - t7;
+    t9 = t3 - t6;
+    t7 = t11 + t0;
+    re[72] = t5;
+    im[72] = t8;
+    re[77] = t10;
+    im[77] = t4;
+    re[2] = t1;
+    im[2] = t2;
+    re[7] = t9;
+    im[7] = t7;
+    t3 = re[12];
+    t6 = im[12];
+    t11 = re[17];
+    t0 = im[17];
+    t5 = re[22];
+    t8 = im[22];
+    t10 = re[27];
+    t4 = im[27];
+    t1 = t3 + t5;
+    t2 = t6 + t8;
+    t9 = t11 + t10;
+    t7 = t0 + t4;
+    t3 = t3 - t5;
+    t5 = t6 - t8;
+    t6 = t11 - t10;
+    t8 = t0 - t4;
+    t11 = t1 + t9;
+    t10 = t2 + t7;
+    t0 = t3 + t8;
+    t4 = t5 - t6;
+    t1 = t1 - t9;
+    t9 = t2 - t7;
+    t2 = t3 - t8;
+    t7 = t5 + t6;
+    re[12] = t11;
+    im[12] = t10;
+    re[17] = t0;
+    im[17] = t4;
+    re[22] = t1;
+    im[22] = t9;
+    re[27] = t2;
+    im[27] = t7;
+    t3 = X[96];
+    t8 = X[63];
+    t5 = C51 * t3;
+    t6 = C50 * t8;
+    t11 = t5 + t6;
+    t10 = (-C50) * t3;
+    t0 = C51 * t8;
+    t4 = t10 + t0;
+    t1 = X[136];
+    t9 = X[23];
+    t2 = C57 * t1;
+    t7 = C56 * t9;
+    t5 = t2 + t7;
+    t6 = (-C56) * t1;
+    t3 = C57 * t9;
+    t8 = t6 + t3;
+    t10 = X[16];
+    t0 = X[143];
+    t2 = C55 * t10;
+    t7 = C54 * t0;
+    t1 = t2 + t7;
+    t9 = (-C54) * t10;
+    t6 = C55 * t0;
+    t3 = t9 + t6;
+    t2 = X[56];
+    t7 = X[103];
+    t10 = C53 * t2;
+    t0 = C52 * t7;
+    t9 = t10 + t0;
+    t6 = (-C52) * t2;
+    t10 = C53 * t7;
+    t0 = t6 + t10;
+    t2 = t11 + t1;
+    t7 = t4 + t3;
+    t6 = t5 + t9;
+    t10 = t8 + t0;
+    t11 = t11 - t1;
+    t1 = t4 - t3;
+    t4 = t5 - t9;
+    t3 = t8 - t0;
+    t5 = t2 + t6;
+    t9 = t7 + t10;
+    t8 = t11 + t3;
+    t0 = t1 - t4;
+    t2 = t2 - t6;
+    t6 = t7 - t10;
+    t7 = t11 - t3;
+    t10 = t1 + t4;
+    re[48] = t5;
+    im[48] = t9;
+    re[68] = t8;
+    im[68] = t0;
+    re[8] = t2;
+    im[8] = t6;
+    re[28] = t7;
+    im[28] = t10;
+    t11 = X[106];
+    t3 = X[53];
+    t1 = C81 * t11;
+    t4 = C80 * t3;
+    t5 = t1 + t4;
+    t9 = (-C80) * t11;
+    t8 = C81 * t3;
+    t0 = t9 + t8;
+    t2 = X[146];
+    t6 = X[13];
+    t7 = C79 * t2;
+    t10 = C78 * t6;
+    t1 = t7 + t10;
+    t4 = (-C78) * t2;
+    t11 = C79 * t6;
+    t3 = t4 + t11;
+    t9 = X[26];
+    t8 = X[133];
+    t7 = C77 * t9;
+    t10 = C76 * t8;
+    t2 = t7 + t10;
+    t6 = (-C76) * t9;
+    t4 = C77 * t8;
+    t11 = t6 + t4;
+    t7 = X[66];
+    t10 = X[93];
+    t9 = C75 * t7;
+    t8 = C74 * t10;
+    t6 = t9 + t8;
+    t4 = (-C74) * t7;
+    t9 = C75 * t10;
+    t8 = t4 + t9;
+    t7 = t5 + t2;
+    t10 = t0 + t11;
+    t4 = t1 + t6;
+    t9 = t3 + t8;
+    t5 = t5 - t2;
+    t2 = t0 - t11;
+    t0 = t1 - t6;
+    t11 = t3 - t8;
+    t1 = t7 + t4;
+    t6 = t10 + t9;
+    t3 = t5 + t11;
+    t8 = t2 - t0;
+    t7 = t7 - t4;
+    t4 = t10 - t9;
+    t10 = t5 - t11;
+    t9 = t2 + t0;
+    t5 = t3 + t8;
+    t11 = C0 * t5;
+    t2 = t3 * (-C12);
+    t0 = t8 * C13;
+    t5 = t11 - t0;
+    t3 = t11 + t2;
+    t8 = t7 + t4;
+    t0 = t7 - t4;
+    t11 = C2 * t8;
+    t2 = (-C2) * t0;
+    t7 = t10 + t9;
+    t4 = C1 * t7;
+    t8 = t10 * (-C12);
+    t0 = t9 * (-C13);
+    t7 = t4 - t0;
+    t10 = t4 + t8;
+    re[53] = t1;
+    im[53] = t6;
+    re[73] = t5;
+    im[73] = t3;
+    re[13] = t11;
+    im[13] = t2;
+    re[33] = t7;
+    im[33] = t10;
+    t9 = X[116];
+    t0 = X[43];
+    t4 = C73 * t9;
+    t8 = C72 * t0;
+    t1 = t4 + t8;
+    t6 = (-C72) * t9;
+    t5 = C73 * t0;
+    t3 = t6 + t5;
+    t11 = X[156];
+    t2 = X[3];
+    t7 = C71 * t11;
+    t10 = C70 * t2;
+    t4 = t7 + t10;
+    t8 = (-C70) * t11;
+    t9 = C71 * t2;
+    t0 = t8 + t9;
+    t6 = X[36];
+    t5 = X[123];
+    t7 = C69 * t6;
+    t10 = C68 * t5;
+    t11 = t7 + t10;
+    t2 = (-C68) * t6;
+    t8 = C69 * t5;
+    t9 = t2 + t8;
+    t7 = X[76];
+    t10 = X[83];
+    t6 = C67 * t7;
+    t5 = C66 * t10;
+    t2 = t6 + t5;
+    t8 = (-C66) * t7;
+    t6 = C67 * t10;
+    t5 = t8 + t6;
+    t7 = t1 + t11;
+    t10 = t3 + t9;
+    t8 = t4 + t2;
+    t6 = t0 + t5;
+    t1 = t1 - t11;
+    t11 = t3 - t9;
+    t3 = t4 - t2;
+    t9 = t0 - t5;
+    t4 = t7 + t8;
+    t2 = t10 + t6;
+    t0 = t1 + t9;
+    t5 = t11 - t3;
+    t7 = t7 - t8;
+    t8 = t10 - t6;
+    t10 = t1 - t9;
+    t6 = t11 + t3;
+    t1 = t0 + t5;
+    t9 = t0 - t5;
+    t11 = C2 * t1;
+    t3 = (-C2) * t9;
+    t0 = -t7;
+    t5 = t10 - t6;
+    t1 = t10 + t6;
+    t9 = (-C2) * t5;
+    t7 = (-C2) * t1;
+    re[58] = t4;
+    im[58] = t2;
+    re[78] = t11;
+    im[78] = t3;
+    re[18] = t8;
+    im[18] = t0;
+    re[38] = t9;
+    im[38] = t7;
+    t10 = X[126];
+    t6 = X[33];
+    t5 = C65 * t10;
+    t1 = C64 * t6;
+    t4 = t5 + t1;
+    t2 = (-C64) * t10;
+    t11 = C65 * t6;
+    t3 = t2 + t11;
+    t8 = X[6];
+    t0 = X[153];
+    t9 = C63 * t8;
+    t7 = C62 * t0;
+    t5 = t9 + t7;
+    t1 = (-C62) * t8;
+    t10 = C63 * t0;
+    t6 = t1 + t10;
+    t2 = X[46];
+    t11 = X[113];
+    t9 = C61 * t2;
+    t7 = C60 * t11;
+    t8 = t9 + t7;
+    t0 = (-C60) * t2;
+    t1 = C61 * t11;
+    t10 = t0 + t1;
+    t9 = X[86];
+    t7 = X[73];
+    t2 = C59 * t9;
+    t11 = C58 * t7;
+    t0 = t2 + t11;
+    t1 = (-C58) * t9;
+    t2 = C59 * t7;
+    t11 = t1 + t2;
+    t9 = t4 + t8;
+    t7 = t3 + t10;
+    t1 = t5 + t0;
+    t2 = t6 + t11;
+    t4 = t4 - t8;
+    t8 = t3 - t10;
+    t3 = t5 - t0;
+    t10 = t6 - t11;
+    t5 = t9 + t1;
+    t0 = t7 + t2;
+    t6 = t4 + t10;
+    t11 = t8 - t3;
+    t9 = t9 - t1;
+    t1 = t7 - t2;
+    t7 = t4 - t10;
+    t2 = t8 + t3;
+    t4 = t6 + t11;
+    t10 = C1 * t4;
+    t8 = t6 * (-C12);
+    t3 = t11 * (-C13);
+    t4 = t10 - t3;
+    t6 = t10 + t8;
+    t11 = t9 - t1;
+    t3 = t9 + t1;
+    t10 = (-C2) * t11;
+    t8 = (-C2) * t3;
+    t9 = t7 + t2;
+    t1 = (-C0) * t9;
+    t11 = t7 * C12;
+    t3 = t2 * (-C13);
+    t9 = t1 - t3;
+    t7 = t1 + t11;
+    re[63] = t5;
+    im[63] = t0;
+    re[3] = t4;
+    im[3] = t6;
+    re[23] = t10;
+    im[23] = t8;
+    re[43] = t9;
+    im[43] = t7;
+    t2 = re[48];
+    t3 = im[48];
+    t1 = re[53];
+    t11 = im[53];
+    t5 = re[58];
+    t0 = im[58];
+    t4 = re[63];
+    t6 = im[63];
+    t10 = t2 + t5;
+    t8 = t3 + t0;
+    t9 = t1 + t4;
+    t7 = t11 + t6;
+    t2 = t2 - t5;
+    t5 = t3 - t0;
+    t3 = t1 - t4;
+    t0 = t11 - t6;
+    t1 = t10 + t9;
+    t4 = t8 + t7;
+    t11 = t2 + t0;
+    t6 = t5 - t3;
+    t10 = t10 - t9;
+    t9 = t8 - t7;
+    t8 = t2 - t0;
+    t7 = t5 + t3;
+    re[48] = t1;
+    im[48] = t4;
+    re[53] = t11;
+    im[53] = t6;
+    re[58] = t10;
+    im[58] = t9;
+    re[63] = t8;
+    im[63] = t7;
+    t2 = re[68];
+    t0 = im[68];
+    t5 = re[73];
+    t3 = im[73];
+    t1 = re[78];
+    t4 = im[78];
+    t11 = re[3];
+    t6 = im[3];
+    t10 = t2 + t1;
+    t9 = t0 + t4;
+    t8 = t5 + t11;
+    t7 = t3 + t6;
+    t2 = t2 - t1;
+    t1 = t0 - t4;
+    t0 = t5 - t11;
+    t4 = t3 - t6;
+    t5 = t10 + t8;
+    t11 = t9 + t7;
+    t3 = t2 + t4;
+    t6 = t1 - t0;
+    t10 = t10 - t8;
+    t8 = t9 - t7;
+    t9 = t2 - t4;
+    t7 = t1 + t0;
+    re[68] = t5;
+    im[68] = t11;
+    re[73] = t3;
+    im[73] = t6;
+    re[78] = t10;
+    im[78] = t8;
+    re[3] = t9;
+    im[3] = t7;
+    t2 = re[8];
+    t4 = im[8];
+    t1 = re[13];
+    t0 = im[13];
+    t5 = re[18];
+    t11 = im[18];
+    t3 = re[23];
+    t6 = im[23];
+    t10 = t2 + t5;
+    t8 = t4 + t11;
+    t9 = t1 + t3;
+    t7 = t0 + t6;
+    t2 = t2 - t5;
+    t5 = t4 - t11;
+    t4 = t1 - t3;
+    t11 = t0 - t6;
+    t1 = t10 + t9;
+    t3 = t8 + t7;
+    t0 = t2 + t11;
+    t6 = t5 - t4;
+    t10 = t10 - t9;
+    t9 = t8 - t7;
+    t8 = t2 - t11;
+    t7 = t5 + t4;
+    re[8] = t1;
+    im[8] = t3;
+    re[13] = t0;
+    im[13] = t6;
+    re[18] = t10;
+    im[18] = t9;
+    re[23] = t8;
+    im[23] = t7;
+    t2 = re[28];
+    t11 = im[28];
+    t5 = re[33];
+    t4 = im[33];
+    t1 = re[38];
+    t3 = im[38];
+    t0 = re[43];
+    t6 = im[43];
+    t10 = t2 + t1;
+    t9 = t11 + t3;
+    t8 = t5 + t0;
+    t7 = t4 + t6;
+    t2 = t2 - t1;
+    t1 = t11 - t3;
+    t11 = t5 - t0;
+    t3 = t4 - t6;
+    t5 = t10 + t8;
+    t0 = t9 + t7;
+    t4 = t2 + t3;
+    t6 = t1 - t11;
+    t10 = t10 - t8;
+    t8 = t9 - t7;
+    t9 = t2 - t3;
+    t7 = t1 + t11;
+    re[28] = t5;
+    im[28] = t0;
+    re[33] = t4;
+    im[33] = t6;
+    re[38] = t10;
+    im[38] = t8;
+    re[43] = t9;
+    im[43] = t7;
+    t2 = X[128];
+    t3 = X[31];
+    t1 = C19 * t2;
+    t11 = C18 * t3;
+    t5 = t1 + t11;
+    t0 = (-C18) * t2;
+    t4 = C19 * t3;
+    t6 = t0 + t4;
+    t10 = X[8];
+    t8 = X[151];
+    t9 = C25 * t10;
+    t7 = C24 * t8;
+    t1 = t9 + t7;
+    t11 = (-C24) * t10;
+    t2 = C25 * t8;
+    t3 = t11 + t2;
+    t0 = X[48];
+    t4 = X[111];
+    t9 = C23 * t0;
+    t7 = C22 * t4;
+    t10 = t9 + t7;
+    t8 = (-C22) * t0;
+    t11 = C23 * t4;
+    t2 = t8 + t11;
+    t9 = X[88];
+    t7 = X[71];
+    t0 = C21 * t9;
+    t4 = C20 * t7;
+    t8 = t0 + t4;
+    t11 = (-C20) * t9;
+    t0 = C21 * t7;
+    t4 = t11 + t0;
+    t9 = t5 + t10;
+    t7 = t6 + t2;
+    t11 = t1 + t8;
+    t0 = t3 + t4;
+    t5 = t5 - t10;
+    t10 = t6 - t2;
+    t6 = t1 - t8;
+    t2 = t3 - t4;
+    t1 = t9 + t11;
+    t8 = t7 + t0;
+    t3 = t5 + t2;
+    t4 = t10 - t6;
+    t9 = t9 - t11;
+    t11 = t7 - t0;
+    t7 = t5 - t2;
+    t0 = t10 + t6;
+    re[64] = t1;
+    im[64] = t8;
+    re[4] = t3;
+    im[4] = t4;
+    re[24] = t9;
+    im[24] = t11;
+    re[44] = t7;
+    im[44] = t0;
+    t5 = X[138];
+    t2 = X[21];
+    t10 = C49 * t5;
+    t6 = C48 * t2;
+    t1 = t10 + t6;
+    t8 = (-C48) * t5;
+    t3 = C49 * t2;
+    t4 = t8 + t3;
+    t9 = X[18];
+    t11 = X[141];
+    t7 = C47 * t9;
+    t0 = C46 * t11;
+    t10 = t7 + t0;
+    t6 = (-C46) * t9;
+    t5 = C47 * t11;
+    t2 = t6 + t5;
+    t8 = X[58];
+    t3 = X[101];
+    t7 = C45 * t8;
+    t0 = C44 * t3;
+    t9 = t7 + t0;
+    t11 = (-C44) * t8;
+    t6 = C45 * t3;
+    t5 = t11 + t6;
+    t7 = X[98];
+    t0 = X[61];
+    t8 = C43 * t7;
+    t3 = C42 * t0;
+    t11 = t8 + t3;
+    t6 = (-C42) * t7;
+    t8 = C43 * t0;
+    t3 = t6 + t8;
+    t7 = t1 + t9;
+    t0 = t4 + t5;
+    t6 = t10 + t11;
+    t8 = t2 + t3;
+    t1 = t1 - t9;
+    t9 = t4 - t5;
+    t4 = t10 - t11;
+    t5 = t2 - t3;
+    t10 = t7 + t6;
+    t11 = t0 + t8;
+    t2 = t1 + t5;
+    t3 = t9 - t4;
+    t7 = t7 - t6;
+    t6 = t0 - t8;
+    t0 = t1 - t5;
+    t8 = t9 + t4;
+    t1 = t2 + t3;
+    t5 = C0 * t1;
+    t9 = t2 * (-C12);
+    t4 = t3 * C13;
+    t1 = t5 - t4;
+    t2 = t5 + t9;
+    t3 = t7 + t6;
+    t4 = t7 - t6;
+    t5 = C2 * t3;
+    t9 = (-C2) * t4;
+    t7 = t0 + t8;
+    t6 = C1 * t7;
+    t3 = t0 * (-C12);
+    t4 = t8 * (-C13);
+    t7 = t6 - t4;
+    t0 = t6 + t3;
+    re[69] = t10;
+    im[69] = t11;
+    re[9] = t1;
+    im[9] = t2;
+    re[29] = t5;
+    im[29] = t9;
+    re[49] = t7;
+    im[49] = t0;
+    t8 = X[148];
+    t4 = X[11];
+    t6 = C41 * t8;
+    t3 = C40 * t4;
+    t10 = t6 + t3;
+    t11 = (-C40) * t8;
+    t1 = C41 * t4;
+    t2 = t11 + t1;
+    t5 = X[28];
+    t9 = X[131];
+    t7 = C39 * t5;
+    t0 = C38 * t9;
+    t6 = t7 + t0;
+    t3 = (-C38) * t5;
+    t8 = C39 * t9;
+    t4 = t3 + t8;
+    t11 = X[68];
+    t1 = X[91];
+    t7 = C37 * t11;
+    t0 = C36 * t1;
+    t5 = t7 + t0;
+    t9 = (-C36) * t11;
+    t3 = C37 * t1;
+    t8 = t9 + t3;
+    t7 = X[108];
+    t0 = X[51];
+    t11 = C35 * t7;
+    t1 = C34 * t0;
+    t9 = t11 + t1;
+    t3 = (-C34) * t7;
+    t11 = C35 * t0;
+    t1 = t3 + t11;
+    t7 = t10 + t5;
+    t0 = t2 + t8;
+    t3 = t6 + t9;
+    t11 = t4 + t1;
+    t10 = t10 - t5;
+    t5 = t2 - t8;
+    t2 = t6 - t9;
+    t8 = t4 - t1;
+    t6 = t7 + t3;
+    t9 = t0 + t11;
+    t4 = t10 + t8;
+    t1 = t5 - t2;
+    t7 = t7 - t3;
+    t3 = t0 - t11;
+    t0 = t10 - t8;
+    t11 = t5 + t2;
+    t10 = t4 + t1;
+    t8 = t4 - t1;
+    t5 = C2 * t10;
+    t2 = (-C2) * t8;
+    t4 = -t7;
+    t1 = t0 - t11;
+    t10 = t0 + t11;
+    t8 = (-C2) * t1;
+    t7 = (-C2) * t10;
+    re[74] = t6;
+    im[74] = t9;
+    re[14] = t5;
+    im[14] = t2;
+    re[34] = t3;
+    im[34] = t4;
+    re[54] = t8;
+    im[54] = t7;
+    t0 = X[158];
+    t11 = X[1];
+    t1 = C33 * t0;
+    t10 = C32 * t11;
+    t6 = t1 + t10;
+    t9 = (-C32) * t0;
+    t5 = C33 * t11;
+    t2 = t9 + t5;
+    t3 = X[38];
+    t4 = X[121];
+    t8 = C31 * t3;
+    t7 = C30 * t4;
+    t1 = t8 + t7;
+    t10 = (-C30) * t3;
+    t0 = C31 * t4;
+    t11 = t10 + t0;
+    t9 = X[78];
+    t5 = X[81];
+    t8 = C29 * t9;
+    t7 = C28 * t5;
+    t3 = t8 + t7;
+    t4 = (-C28) * t9;
+    t10 = C29 * t5;
+    t0 = t4 + t10;
+    t8 = X[118];
+    t7 = X[41];
+    t9 = C27 * t8;
+    t5 = C26 * t7;
+    t4 = t9 + t5;
+    t10 = (-C26) * t8;
+    t9 = C27 * t7;
+    t5 = t10 + t9;
+    t8 = t6 + t3;
+    t7 = t2 + t0;
+    t10 = t1 + t4;
+    t9 = t11 + t5;
+    t6 = t6 - t3;
+    t3 = t2 - t0;
+    t2 = t1 - t4;
+    t0 = t11 - t5;
+    t1 = t8 + t10;
+    t4 = t7 + t9;
+    t11 = t6 + t0;
+    t5 = t3 - t2;
+    t8 = t8 - t10;
+    t10 = t7 - t9;
+    t7 = t6 - t0;
+    t9 = t3 + t2;
+    t6 = t11 + t5;
+    t0 = C1 * t6;
+    t3 = t11 * (-C12);
+    t2 = t5 * (-C13);
+    t6 = t0 - t2;
+    t11 = t0 + t3;
+    t5 = t8 - t10;
+    t2 = t8 + t10;
+    t0 = (-C2) * t5;
+    t3 = (-C2) * t2;
+    t8 = t7 + t9;
+    t10 = (-C0) * t8;
+    t5 = t7 * C12;
+    t2 = t9 * (-C13);
+    t8 = t10 - t2;
+    t7 = t10 + t5;
+    re[79] = t1;
+    im[79] = t4;
+    re[19] = t6;
+    im[19] = t11;
+    re[39] = t0;
+    im[39] = t3;
+    re[59] = t8;
+    im[59] = t7;
+    t9 = re[64];
+    t2 = im[64];
+    t10 = re[69];
+    t5 = im[69];
+    t1 = re[74];
+    t4 = im[74];
+    t6 = re[79];
+    t11 = im[79];
+    t0 = t9 + t1;
+    t3 = t2 + t4;
+    t8 = t10 + t6;
+    t7 = t5 + t11;
+    t9 = t9 - t1;
+    t1 = t2 - t4;
+    t2 = t10 - t6;
+    t4 = t5 - t11;
+    t10 = t0 + t8;
+    t6 = t3 + t7;
+    t5 = t9 + t4;
+    t11 = t1 - t2;
+    t0 = t0 - t8;
+    t8 = t3 - t7;
+    t3 = t9 - t4;
+    t7 = t1 + t2;
+    re[64] = t10;
+    im[64] = t6;
+    re[69] = t5;
+    im[69] = t11;
+    re[74] = t0;
+    im[74] = t8;
+    re[79] = t3;
+    im[79] = t7;
+    t9 = re[4];
+    t4 = im[4];
+    t1 = re[9];
+    t2 = im[9];
+    t10 = re[14];
+    t6 = im[14];
+    t5 = re[19];
+    t11 = im[19];
+    t0 = t9 + t10;
+    t8 = t4 + t6;
+    t3 = t1 + t5;
+    t7 = t2 + t11;
+    t9 = t9 - t10;
+    t10 = t4 - t6;
+    t4 = t1 - t5;
+    t6 = t2 - t11;
+    t1 = t0 + t3;
+    t5 = t8 + t7;
+    t2 = t9 + t6;
+    t11 = t10 - t4;
+    t0 = t0 - t3;
+    t3 = t8 - t7;
+    t8 = t9 - t6;
+    t7 = t10 + t4;
+    re[4] = t1;
+    im[4] = t5;
+    re[9] = t2;
+    im[9] = t11;
+    re[14] = t0;
+    im[14] = t3;
+    re[19] = t8;
+    im[19] = t7;
+    t9 = re[24];
+    t6 = im[24];
+    t10 = re[29];
+    t4 = im[29];
+    t1 = re[34];
+    t5 = im[34];
+    t2 = re[39];
+    t11 = im[39];
+    t0 = t9 + t1;
+    t3 = t6 + t5;
+    t8 = t10 + t2;
+    t7 = t4 + t11;
+    t9 = t9 - t1;
+    t1 = t6 - t5;
+    t6 = t10 - t2;
+    t5 = t4 - t11;
+    t10 = t0 + t8;
+    t2 = t3 + t7;
+    t4 = t9 + t5;
+    t11 = t1 - t6;
+    t0 = t0 - t8;
+    t8 = t3 - t7;
+    t3 = t9 - t5;
+    t7 = t1 + t6;
+    re[24] = t10;
+    im[24] = t2;
+    re[29] = t4;
+    im[29] = t11;
+    re[34] = t0;
+    im[34] = t8;
+    re[39] = t3;
+    im[39] = t7;
+    t9 = re[44];
+    t5 = im[44];
+    t1 = re[49];
+    t6 = im[49];
+    t10 = re[54];
+    t2 = im[54];
+    t4 = re[59];
+    t11 = im[59];
+    t0 = t9 + t10;
+    t8 = t5 + t2;
+    t3 = t1 + t4;
+    t7 = t6 + t11;
+    t9 = t9 - t10;
+    t10 = t5 - t2;
+    t5 = t1 - t4;
+    t2 = t6 - t11;
+    t1 = t0 + t3;
+    t4 = t8 + t7;
+    t6 = t9 + t2;
+    t11 = t10 - t5;
+    t0 = t0 - t3;
+    t3 = t8 - t7;
+    t8 = t9 - t2;
+    t7 = t10 + t5;
+    re[44] = t1;
+    im[44] = t4;
+    re[49] = t6;
+    im[49] = t11;
+    re[54] = t0;
+    im[54] = t3;
+    re[59] = t8;
+    im[59] = t7;
+}
+
+/**
+ *  Part 2 of ApplyWindowedIMDCT_W10_160().
+ * 
+ *  @param {Number[]} X 
+ *    - The input block (160 points).
+ *  @param {Number[]} y 
+ *    - The array that would contain the output block (320 points).
+ *  @param {Number[]} re 
+ *    - The scratch buffer (real part, 80 points).
+ *  @param {Number[]} im 
+ *    - The scratch buffer (imaginary part, 80 points).
+ */
+function ApplyWindowedIMDCT_W10_160_Part2(X, y, re, im) {
+    let t0, t1, t10, t11, t12, t13, t14, t2, t3, t4, t5, t6, t7, t8, t9;
+    const C0 = 0.5590169943749475;
+    const C1 = 0.25;
+    const C2 = 0.9510565162951535;
+    const C3 = 0.5877852522924731;
+    const C4 = 0.9999879521672569;
+    const C5 = 0.00490871880799799;
+    const C6 = 0.9495281805930367;
+    const C7 = 0.3136817403988915;
+    const C8 = 0.806121974950521;
+    const C9 = 0.5917494076903429;
+    const C10 = 0.5838069338177863;
+    const C11 = 0.8118925199965048;
+    const C12 = 0.3043448023808773;
+    const C13 = 0.9525619356575953;
+    const C14 = 0.2855838289290823;
+    const C15 = 0.9583537325300114;
+    const C16 = 0.9996988186962042;
+    const C17 = 0.024541228522912288;
+    const C18 = 0.9431864191771733;
+    const C19 = 0.33226401953829077;
+    const C20 = 0.7943483613828815;
+    const C21 = 0.607462493301711;
+    const C22 = 0.5677539514259605;
+    const C23 = 0.8231983057806959;
+    const C24 = 0.5514820890781694;
+    const C25 = 0.8341867329477124;
+    const C26 = 0.26671275747489837;
+    const C27 = 0.9637760657954398;
+    const C28 = 0.9990242823004072;
+    const C29 = 0.04416427712706736;
+    const C30 = 0.9364810414423427;
+    const C31 = 0.35071820457322317;
+    const C32 = 0.7822685114008164;
+    const C33 = 0.6229413905583339;
+    const C34 = 0.7698870820164444;
+    const C35 = 0.6381801320506653;
+    const C36 = 0.5349976198870972;
+    const C37 = 0.8448535652497071;
+    const C38 = 0.2477388631755984;
+    const C39 = 0.968826845041188;
+    const C40 = 0.9979646030264866;
+    const C41 = 0.0637702995616845;
+    const C42 = 0.9294146324393044;
+    const C43 = 0.36903718106406647;
+    const C44 = 0.9219899164032446;
+    const C45 = 0.38721388669666557;
+    const C46 = 0.7572088465064846;
+    const C47 = 0.6531728429537768;
+    const C48 = 0.5183068989294132;
+    const C49 = 0.8551946904197751;
+    const C50 = 0.22866946082861941;
+    const C51 = 0.9735041230957107;
+    const C52 = 0.9965201894009746;
+    const C53 = 0.08335173733189745;
+    const C54 = 0.9946915982728195;
+    const C55 = 0.1029010414206961;
+    const C56 = 0.9142097557035307;
+    const C57 = 0.40524131400498986;
+    const C58 = 0.744238692572067;
+    const C59 = 0.6679137432922161;
+    const C60 = 0.501416360795769;
+    const C61 = 0.8652061217573113;
+    const C62 = 0.20951190205156878;
+    const C63 = 0.9778060967792817;
+    const C64 = 0.1902735724480359;
+    const C65 = 0.9817311075991542;
+    const C66 = 0.99247953459871;
+    const C67 = 0.1224106751992162;
+    const C68 = 0.9060771497402148;
+    const C69 = 0.42311251307264414;
+    const C70 = 0.7309816204544317;
+    const C71 = 0.6823971501682968;
+    const C72 = 0.4843325171101413;
+    const C73 = 0.8748839996649582;
+    const C74 = 0.4670619540194766;
+    const C75 = 0.8842245931365562;
+    const C76 = 0.17096188876030122;
+    const C77 = 0.9852776423889412;
+    const C78 = 0.989884851171301;
+    const C79 = 0.14187311733225325;
+    const C80 = 0.8975952337877069;
+    const C81 = 0.44082059421219394;
+    const C82 = 0.71744274100724;
+    const C83 = 0.6966174799529641;
+    const C84 = 0.7036272737262429;
+    const C85 = 0.7105692504383896;
+    const C86 = 0.44961132965460654;
+    const C87 = 0.8932243011955153;
+    const C88 = 0.15158429601004111;
+    const C89 = 0.98844433389197;
+    const C90 = 0.9869085482904458;
+    const C91 = 0.16128086467788047;
+    const C92 = 0.8887672777860675;
+    const C93 = 0.45835873062127125;
+    const C94 = 0.8795966850803829;
+    const C95 = 0.4757201610144368;
+    const C96 = 0.6895405447370668;
+    const C97 = 0.724247082951467;
+    const C98 = 0.43198737156341177;
+    const C99 = 0.9018796542830616;
+    const C100 = 0.13214826462813015;
+    const C101 = 0.9912299612883853;
+    const C102 = 0.9835517733775615;
+    const C103 = 0.18062643518005275;
+    const C104 = 0.9798158205332763;
+    const C105 = 0.1999023707530817;
+    const C106 = 0.8700869911087115;
+    const C107 = 0.49289819222978404;
+    const C108 = 0.6751879847418903;
+    const C109 = 0.737645704427393;
+    const C110 = 0.4141968741172237;
+    const C111 = 0.9101873155958178;
+    const C112 = 0.1126612875746478;
+    const C113 = 0.9936334506657989;
+    const C114 = 0.0931308774501998;
+    const C115 = 0.9956538754333033;
+    const C116 = 0.9757021300385286;
+    const C117 = 0.2191012401568698;
+    const C118 = 0.8602418620391045;
+    const C119 = 0.5098862018092806;
+    const C120 = 0.660575126925805;
+    const C121 = 0.7507599494425343;
+    const C122 = 0.3962466958914656;
+    const C123 = 0.9181440823722039;
+    const C124 = 0.3781437570215405;
+    const C125 = 0.925746887127164;
+    const C126 = 0.07356456359966743;
+    const C127 = 0.9972904566786902;
+    const C128 = 0.9712122877993118;
+    const C129 = 0.2382156418617946;
+    const C130 = 0.8500650933562288;
+    const C131 = 0.5266776405518521;
+    const C132 = 0.6457076048236673;
+    const C133 = 0.7635847622057964;
+    const C134 = 0.6305911501482637;
+    const C135 = 0.7761151985077279;
+    const C136 = 0.3598950365349881;
+    const C137 = 0.932992798834739;
+    const C138 = 0.05396988920950189;
+    const C139 = 0.9985425634687357;
+    const C140 = 0.9663480247352773;
+    const C141 = 0.2572382069021396;
+    const C142 = 0.8395606083981357;
+    const C143 = 0.5432660350382235;
+    const C144 = 0.8287324568437381;
+    const C145 = 0.559644990126546;
+    const C146 = 0.6152315905806268;
+    const C147 = 0.7883464276266063;
+    const C148 = 0.34150756966093626;
+    const C149 = 0.9398790240580331;
+    const C150 = 0.034354408399682276;
+    const C151 = 0.9994097130924373;
+    const C152 = 0.9611112161124317;
+    const C153 = 0.27616160171697074;
+    const C154 = 0.9555038808201862;
+    const C155 = 0.2949785309773635;
+    const C156 = 0.8175848131515837;
+    const C157 = 0.5758081914178453;
+    const C158 = 0.5996348475233523;
+    const C159 = 0.8002737341907743;
+    const C160 = 0.3229884451178864;
+    const C161 = 0.9464029080261377;
+    const C162 = 0.014725683311458524;
+    const C163 = 0.999891571247108;
+    t9 = re[0];
+    t2 = im[0];
+    t10 = re[16];
+    t5 = im[16];
+    t1 = re[32];
+    t4 = im[32];
+    t6 = re[48];
+    t11 = im[48];
+    t0 = re[64];
+    t3 = im[64];
+    t8 = t10 + t0;
+    t7 = t5 + t3;
+    t12 = t1 + t6;
+    t13 = t4 + t11;
+    t10 = t10 - t0;
+    t0 = t5 - t3;
+    t5 = t1 - t6;
+    t3 = t4 - t11;
+    t1 = t8 + t12;
+    t6 = t7 + t13;
+    t4 = t8 - t12;
+    t11 = C0 * t4;
+    t8 = t7 - t13;
+    t12 = C0 * t8;
+    t4 = C1 * t1;
+    t7 = t9 - t4;
+    t13 = C1 * t6;
+    t8 = t2 - t13;
+    t4 = t7 + t11;
+    t13 = t8 + t12;
+    t7 = t7 - t11;
+    t11 = t8 - t12;
+    t8 = C2 * t10;
+    t12 = C3 * t5;
+    t8 = t8 + t12;
+    t12 = C2 * t0;
+    t14 = C3 * t3;
+    t12 = t12 + t14;
+    t14 = C3 * t10;
+    t10 = C2 * t5;
+    t5 = t14 - t10;
+    t14 = C3 * t0;
+    t10 = C2 * t3;
+    t0 = t14 - t10;
+    t3 = t9 + t1;
+    t14 = t2 + t6;
+    t10 = t4 + t12;
+    t9 = t13 - t8;
+    t1 = t7 + t0;
+    t2 = t11 - t5;
+    t6 = t7 - t0;
+    t7 = t11 + t5;
+    t0 = t4 - t12;
+    t11 = t13 + t8;
+    t5 = (-C4) * t3;
+    t4 = (-C5) * t14;
+    t12 = t5 + t4;
+    t13 = 0.09919868040847561 * t12;
+    y[239] = t13;
+    t8 = 0.09637574106663695 * t12;
+    y[240] = t8;
+    t5 = C5 * t3;
+    t4 = (-C4) * t14;
+    t13 = t5 + t4;
+    t12 = 0.061622714636375496 * t13;
+    y[79] = t12;
+    t8 = (-0.06614065009095606) * t13;
+    y[80] = t8;
+    t3 = (-C6) * t10;
+    t14 = (-C7) * t9;
+    t5 = t3 + t14;
+    t4 = 0.11062374303997037 * t5;
+    y[207] = t4;
+    t12 = (-0.0038847049945580823) * t5;
+    y[272] = t12;
+    t13 = C7 * t10;
+    t8 = (-C6) * t9;
+    t3 = t13 + t8;
+    y[47] = 0;
+    t14 = (-0.11299563417849212) * t3;
+    y[112] = t14;
+    t4 = (-C8) * t1;
+    t5 = (-C9) * t2;
+    t12 = t4 + t5;
+    t10 = 0.11074551322394617 * t12;
+    y[175] = t10;
+    t9 = (-0.004435316851490209) * t12;
+    y[304] = t9;
+    t13 = C9 * t1;
+    t8 = (-C8) * t2;
+    t3 = t13 + t8;
+    y[15] = 0;
+    t14 = (-0.11287138987493683) * t3;
+    y[144] = t14;
+    t4 = C10 * t6;
+    t5 = C11 * t7;
+    t10 = t4 + t5;
+    y[16] = 0;
+    t12 = (-0.11288868495258626) * t10;
+    y[143] = t12;
+    t9 = (-C11) * t6;
+    t1 = C10 * t7;
+    t2 = t9 + t1;
+    t13 = 0.11072854649028864 * t2;
+    y[176] = t13;
+    t8 = (-0.005000628436747556) * t2;
+    y[303] = t8;
+    t3 = C12 * t0;
+    t14 = C13 * t11;
+    t4 = t3 + t14;
+    y[48] = 0;
+    t5 = (-0.11291369101590942) * t4;
+    y[111] = t5;
+    t10 = (-C13) * t0;
+    t12 = C12 * t11;
+    t6 = t10 + t12;
+    t7 = 0.11070402435289058 * t6;
+    y[208] = t7;
+    t9 = (-0.0024726234067729007) * t6;
+    y[271] = t9;
+    t1 = re[20];
+    t13 = im[20];
+    t2 = re[36];
+    t8 = im[36];
+    t3 = re[52];
+    t14 = im[52];
+    t4 = re[68];
+    t5 = im[68];
+    t0 = re[4];
+    t11 = im[4];
+    t10 = t2 + t0;
+    t12 = t8 + t11;
+    t7 = t3 + t4;
+    t6 = t14 + t5;
+    t9 = t2 - t0;
+    t2 = t8 - t11;
+    t0 = t3 - t4;
+    t8 = t14 - t5;
+    t11 = t10 + t7;
+    t3 = t12 + t6;
+    t4 = t10 - t7;
+    t14 = C0 * t4;
+    t5 = t12 - t6;
+    t10 = C0 * t5;
+    t7 = C1 * t11;
+    t4 = t1 - t7;
+    t12 = C1 * t3;
+    t6 = t13 - t12;
+    t5 = t4 + t14;
+    t7 = t6 + t10;
+    t12 = t4 - t14;
+    t4 = t6 - t10;
+    t14 = C2 * t9;
+    t6 = C3 * t0;
+    t10 = t14 + t6;
+    t14 = C2 * t2;
+    t6 = C3 * t8;
+    t14 = t14 + t6;
+    t6 = C3 * t9;
+    t9 = C2 * t0;
+    t0 = t6 - t9;
+    t6 = C3 * t2;
+    t9 = C2 * t8;
+    t2 = t6 - t9;
+    t8 = t1 + t11;
+    t6 = t13 + t3;
+    t9 = t5 + t14;
+    t1 = t7 - t10;
+    t11 = t12 + t2;
+    t13 = t4 - t0;
+    t3 = t12 - t2;
+    t12 = t4 + t0;
+    t2 = t5 - t14;
+    t4 = t7 + t10;
+    t0 = C14 * t8;
+    t5 = C15 * t6;
+    t14 = t0 + t5;
+    y[50] = 0;
+    t7 = (-0.11270166185002709) * t14;
+    y[109] = t7;
+    t10 = (-C15) * t8;
+    t0 = C14 * t6;
+    t5 = t10 + t0;
+    t14 = 0.11091229530079016 * t5;
+    y[210] = t14;
+    t7 = 0.000751061428239977 * t5;
+    y[269] = t7;
+    t8 = (-C16) * t9;
+    t6 = (-C17) * t1;
+    t10 = t8 + t6;
+    t0 = 0.10415562708923899 * t10;
+    y[237] = t0;
+    t14 = 0.09010724756863295 * t10;
+    y[242] = t14;
+    t5 = C17 * t9;
+    t7 = (-C16) * t1;
+    t8 = t5 + t7;
+    t6 = 0.052335362309534304 * t8;
+    y[77] = t6;
+    t0 = (-0.07473628424426193) * t8;
+    y[82] = t0;
+    t10 = (-C18) * t11;
+    t14 = (-C19) * t13;
+    t9 = t10 + t14;
+    t1 = 0.11050400323230107 * t9;
+    y[205] = t1;
+    t5 = (-0.006334395575339451) * t9;
+    y[274] = t5;
+    t7 = C19 * t11;
+    t6 = (-C18) * t13;
+    t8 = t7 + t6;
+    y[45] = 0;
+    t0 = (-0.11311807386491286) * t8;
+    y[114] = t0;
+    t10 = (-C20) * t3;
+    t14 = (-C21) * t12;
+    t1 = t10 + t14;
+    t9 = 0.11079540841354191 * t1;
+    y[173] = t9;
+    t5 = (-0.003377427216706282) * t1;
+    y[306] = t5;
+    t11 = C21 * t3;
+    t13 = (-C20) * t12;
+    t7 = t11 + t13;
+    y[13] = 0;
+    t6 = (-0.11282055979561871) * t7;
+    y[146] = t6;
+    t8 = C22 * t2;
+    t0 = C23 * t4;
+    t10 = t8 + t0;
+    y[18] = 0;
+    t14 = (-0.11291103050200026) * t10;
+    y[141] = t14;
+    t9 = (-C23) * t2;
+    t1 = C22 * t4;
+    t5 = t9 + t1;
+    t3 = 0.11070663286328401 * t5;
+    y[178] = t3;
+    t12 = (-0.006178630133566774) * t5;
+    y[301] = t12;
+    t11 = re[40];
+    t13 = im[40];
+    t7 = re[56];
+    t6 = im[56];
+    t8 = re[72];
+    t0 = im[72];
+    t10 = re[8];
+    t14 = im[8];
+    t2 = re[24];
+    t4 = im[24];
+    t9 = t7 + t2;
+    t1 = t6 + t4;
+    t3 = t8 + t10;
+    t5 = t0 + t14;
+    t12 = t7 - t2;
+    t7 = t6 - t4;
+    t2 = t8 - t10;
+    t6 = t0 - t14;
+    t4 = t9 + t3;
+    t8 = t1 + t5;
+    t10 = t9 - t3;
+    t0 = C0 * t10;
+    t14 = t1 - t5;
+    t9 = C0 * t14;
+    t3 = C1 * t4;
+    t10 = t11 - t3;
+    t1 = C1 * t8;
+    t5 = t13 - t1;
+    t14 = t10 + t0;
+    t3 = t5 + t9;
+    t1 = t10 - t0;
+    t10 = t5 - t9;
+    t0 = C2 * t12;
+    t5 = C3 * t2;
+    t9 = t0 + t5;
+    t0 = C2 * t7;
+    t5 = C3 * t6;
+    t0 = t0 + t5;
+    t5 = C3 * t12;
+    t12 = C2 * t2;
+    t2 = t5 - t12;
+    t5 = C3 * t7;
+    t12 = C2 * t6;
+    t7 = t5 - t12;
+    t6 = t11 + t4;
+    t5 = t13 + t8;
+    t12 = t14 + t0;
+    t11 = t3 - t9;
+    t4 = t1 + t7;
+    t13 = t10 - t2;
+    t8 = t1 - t7;
+    t1 = t10 + t2;
+    t7 = t14 - t0;
+    t10 = t3 + t9;
+    t2 = C24 * t6;
+    t14 = C25 * t5;
+    t0 = t2 + t14;
+    y[20] = 0;
+    t3 = (-0.11292343307449516) * t0;
+    y[139] = t3;
+    t9 = (-C25) * t6;
+    t2 = C24 * t5;
+    t14 = t9 + t2;
+    t0 = 0.11069447376572232 * t14;
+    y[180] = t0;
+    t3 = (-0.007380099337164804) * t14;
+    y[299] = t3;
+    t6 = C26 * t12;
+    t5 = C27 * t11;
+    t9 = t6 + t5;
+    y[52] = 0;
+    t2 = (-0.11241496409707726) * t9;
+    y[107] = t2;
+    t0 = (-C27) * t12;
+    t14 = C26 * t11;
+    t3 = t0 + t14;
+    t6 = 0.11119516071904345 * t3;
+    y[212] = t6;
+    t5 = 0.00453933702315795 * t3;
+    y[267] = t5;
+    t9 = (-C28) * t4;
+    t2 = (-C29) * t13;
+    t12 = t9 + t2;
+    t11 = 0.10814034736032908 * t12;
+    y[235] = t11;
+    t0 = 0.08312519782022552 * t12;
+    y[244] = t0;
+    t14 = C29 * t4;
+    t6 = (-C28) * t13;
+    t3 = t14 + t6;
+    t5 = 0.04299033363724483 * t3;
+    y[75] = t5;
+    t9 = (-0.08254476918132375) * t3;
+    y[84] = t9;
+    t2 = (-C30) * t8;
+    t11 = (-C31) * t1;
+    t12 = t2 + t11;
+    t0 = 0.11043152040769377 * t12;
+    y[203] = t0;
+    t4 = (-0.008316815136059702) * t12;
+    y[276] = t4;
+    t13 = C31 * t8;
+    t14 = (-C30) * t1;
+    t6 = t13 + t14;
+    y[43] = 0;
+    t5 = (-0.11319232003554955) * t6;
+    y[116] = t5;
+    t3 = (-C32) * t7;
+    t9 = (-C33) * t10;
+    t2 = t3 + t9;
+    t11 = 0.11087081251499475 * t2;
+    y[171] = t11;
+    t0 = (-0.0024457786478307856) * t2;
+    y[308] = t0;
+    t12 = C33 * t7;
+    t4 = (-C32) * t10;
+    t8 = t12 + t4;
+    y[11] = 0;
+    t1 = (-0.11274382965588384) * t8;
+    y[148] = t1;
+    t13 = re[60];
+    t14 = im[60];
+    t6 = re[76];
+    t5 = im[76];
+    t3 = re[12];
+    t9 = im[12];
+    t11 = re[28];
+    t2 = im[28];
+    t0 = re[44];
+    t7 = im[44];
+    t10 = t6 + t0;
+    t12 = t5 + t7;
+    t4 = t3 + t11;
+    t8 = t9 + t2;
+    t1 = t6 - t0;
+    t6 = t5 - t7;
+    t0 = t3 - t11;
+    t5 = t9 - t2;
+    t7 = t10 + t4;
+    t3 = t12 + t8;
+    t11 = t10 - t4;
+    t9 = C0 * t11;
+    t2 = t12 - t8;
+    t10 = C0 * t2;
+    t4 = C1 * t7;
+    t11 = t13 - t4;
+    t12 = C1 * t3;
+    t8 = t14 - t12;
+    t2 = t11 + t9;
+    t4 = t8 + t10;
+    t12 = t11 - t9;
+    t11 = t8 - t10;
+    t9 = C2 * t1;
+    t8 = C3 * t0;
+    t10 = t9 + t8;
+    t9 = C2 * t6;
+    t8 = C3 * t5;
+    t9 = t9 + t8;
+    t8 = C3 * t1;
+    t1 = C2 * t0;
+    t0 = t8 - t1;
+    t8 = C3 * t6;
+    t1 = C2 * t5;
+    t6 = t8 - t1;
+    t5 = t13 + t7;
+    t8 = t14 + t3;
+    t1 = t2 + t9;
+    t13 = t4 - t10;
+    t7 = t12 + t6;
+    t14 = t11 - t0;
+    t3 = t12 - t6;
+    t12 = t11 + t0;
+    t6 = t2 - t9;
+    t11 = t4 + t10;
+    t0 = (-C34) * t5;
+    t2 = (-C35) * t8;
+    t9 = t0 + t2;
+    t4 = 0.11097479267929677 * t9;
+    y[169] = t4;
+    t10 = (-0.0016653431095281137) * t9;
+    y[310] = t10;
+    t0 = C35 * t5;
+    t2 = (-C34) * t8;
+    t4 = t0 + t2;
+    y[9] = 0;
+    t9 = (-0.11263819195520765) * t4;
+    y[150] = t9;
+    t10 = C36 * t1;
+    t5 = C37 * t13;
+    t8 = t10 + t5;
+    y[22] = 0;
+    t0 = (-0.11293334718913527) * t8;
+    y[137] = t0;
+    t2 = (-C37) * t1;
+    t4 = C36 * t13;
+    t9 = t2 + t4;
+    t10 = 0.11068475619575513 * t9;
+    y[182] = t10;
+    t5 = (-0.008554277310528689) * t9;
+    y[297] = t5;
+    t8 = C38 * t7;
+    t0 = C39 * t14;
+    t1 = t8 + t0;
+    y[54] = 0;
+    t13 = (-0.11203805793071749) * t1;
+    y[105] = t13;
+    t2 = (-C39) * t7;
+    t4 = C38 * t14;
+    t10 = t2 + t4;
+    t9 = 0.11156923130290064 * t10;
+    y[214] = t9;
+    t5 = 0.008925661328443739 * t10;
+    y[265] = t5;
+    t8 = (-C40) * t3;
+    t0 = (-C41) * t12;
+    t1 = t8 + t0;
+    t13 = 0.11113880795092732 * t1;
+    y[233] = t13;
+    t7 = 0.07559758432646857 * t1;
+    y[246] = t7;
+    t14 = C41 * t3;
+    t2 = (-C40) * t12;
+    t4 = t14 + t2;
+    t9 = 0.0339435639090872 * t4;
+    y[73] = t9;
+    t10 = (-0.08938325638176887) * t4;
+    y[86] = t10;
+    t5 = (-C42) * t6;
+    t8 = (-C43) * t11;
+    t0 = t5 + t8;
+    t13 = 0.11039836343485919 * t0;
+    y[201] = t13;
+    t1 = (-0.009868114567417723) * t0;
+    y[278] = t1;
+    t7 = C43 * t6;
+    t3 = (-C42) * t11;
+    t12 = t7 + t3;
+    y[41] = 0;
+    t14 = (-0.11322631614349661) * t12;
+    y[118] = t14;
+    t2 = re[5];
+    t9 = im[5];
+    t4 = re[21];
+    t10 = im[21];
+    t5 = re[37];
+    t8 = im[37];
+    t13 = re[53];
+    t0 = im[53];
+    t1 = re[69];
+    t6 = im[69];
+    t11 = t4 + t1;
+    t7 = t10 + t6;
+    t3 = t5 + t13;
+    t12 = t8 + t0;
+    t14 = t4 - t1;
+    t4 = t10 - t6;
+    t1 = t5 - t13;
+    t10 = t8 - t0;
+    t6 = t11 + t3;
+    t5 = t7 + t12;
+    t13 = t11 - t3;
+    t8 = C0 * t13;
+    t0 = t7 - t12;
+    t11 = C0 * t0;
+    t3 = C1 * t6;
+    t13 = t2 - t3;
+    t7 = C1 * t5;
+    t12 = t9 - t7;
+    t0 = t13 + t8;
+    t3 = t12 + t11;
+    t7 = t13 - t8;
+    t13 = t12 - t11;
+    t8 = C2 * t14;
+    t12 = C3 * t1;
+    t11 = t8 + t12;
+    t8 = C2 * t4;
+    t12 = C3 * t10;
+    t8 = t8 + t12;
+    t12 = C3 * t14;
+    t14 = C2 * t1;
+    t1 = t12 - t14;
+    t12 = C3 * t4;
+    t14 = C2 * t10;
+    t4 = t12 - t14;
+    t10 = t2 + t6;
+    t12 = t9 + t5;
+    t14 = t0 + t8;
+    t2 = t3 - t11;
+    t6 = t7 + t4;
+    t9 = t13 - t1;
+    t5 = t7 - t4;
+    t7 = t13 + t1;
+    t4 = t0 - t8;
+    t13 = t3 + t11;
+    t1 = (-C44) * t10;
+    t0 = (-C45) * t12;
+    t8 = t1 + t0;
+    t3 = 0.1103968791240002 * t8;
+    y[199] = t3;
+    t11 = (-0.011020477312608395) * t8;
+    y[280] = t11;
+    t1 = C45 * t10;
+    t0 = (-C44) * t12;
+    t3 = t1 + t0;
+    y[39] = 0;
+    t8 = (-0.11322783849677243) * t3;
+    y[120] = t8;
+    t11 = (-C46) * t14;
+    t10 = (-C47) * t2;
+    t12 = t11 + t10;
+    t1 = 0.11110787961912116 * t12;
+    y[167] = t1;
+    t0 = (-0.0010489932501280576) * t12;
+    y[312] = t0;
+    t3 = C47 * t14;
+    t8 = (-C46) * t2;
+    t11 = t3 + t8;
+    y[7] = 0;
+    t10 = (-0.11250327198080023) * t11;
+    y[152] = t10;
+    t1 = C48 * t6;
+    t12 = C49 * t9;
+    t0 = t1 + t12;
+    y[24] = 0;
+    t14 = (-0.11294726822480333) * t0;
+    y[135] = t14;
+    t2 = (-C49) * t6;
+    t3 = C48 * t9;
+    t8 = t2 + t3;
+    t11 = 0.11067111402040077 * t8;
+    y[184] = t11;
+    t10 = (-0.009649905136779869) * t8;
+    y[295] = t10;
+    t1 = C50 * t5;
+    t12 = C51 * t7;
+    t0 = t1 + t12;
+    y[56] = 0;
+    t14 = (-0.11155296145740505) * t0;
+    y[103] = t14;
+    t6 = (-C51) * t5;
+    t9 = C50 * t7;
+    t2 = t6 + t9;
+    t3 = 0.11205439852686436 * t2;
+    y[216] = t3;
+    t11 = 0.013932619668397829 * t2;
+    y[263] = t11;
+    t8 = (-C52) * t4;
+    t10 = (-C53) * t13;
+    t1 = t8 + t10;
+    t12 = 0.1131905915283136 * t1;
+    y[231] = t12;
+    t0 = 0.06770907553871774 * t1;
+    y[248] = t0;
+    t14 = C53 * t4;
+    t5 = (-C52) * t13;
+    t7 = t14 + t5;
+    t6 = 0.025550251517770402 * t7;
+    y[71] = t6;
+    t9 = (-0.09514939311237743) * t7;
+    y[88] = t9;
+    t3 = re[25];
+    t2 = im[25];
+    t11 = re[41];
+    t8 = im[41];
+    t10 = re[57];
+    t12 = im[57];
+    t1 = re[73];
+    t0 = im[73];
+    t4 = re[9];
+    t13 = im[9];
+    t14 = t11 + t4;
+    t5 = t8 + t13;
+    t6 = t10 + t1;
+    t7 = t12 + t0;
+    t9 = t11 - t4;
+    t11 = t8 - t13;
+    t4 = t10 - t1;
+    t8 = t12 - t0;
+    t13 = t14 + t6;
+    t10 = t5 + t7;
+    t1 = t14 - t6;
+    t12 = C0 * t1;
+    t0 = t5 - t7;
+    t14 = C0 * t0;
+    t6 = C1 * t13;
+    t1 = t3 - t6;
+    t5 = C1 * t10;
+    t7 = t2 - t5;
+    t0 = t1 + t12;
+    t6 = t7 + t14;
+    t5 = t1 - t12;
+    t1 = t7 - t14;
+    t12 = C2 * t9;
+    t7 = C3 * t4;
+    t14 = t12 + t7;
+    t12 = C2 * t11;
+    t7 = C3 * t8;
+    t12 = t12 + t7;
+    t7 = C3 * t9;
+    t9 = C2 * t4;
+    t4 = t7 - t9;
+    t7 = C3 * t11;
+    t9 = C2 * t8;
+    t11 = t7 - t9;
+    t8 = t3 + t13;
+    t7 = t2 + t10;
+    t9 = t0 + t12;
+    t3 = t6 - t14;
+    t13 = t5 + t11;
+    t2 = t1 - t4;
+    t10 = t5 - t11;
+    t5 = t1 + t4;
+    t11 = t0 - t12;
+    t1 = t6 + t14;
+    t4 = (-C54) * t8;
+    t0 = (-C55) * t7;
+    t12 = t4 + t0;
+    t6 = 0.11438816391982388 * t12;
+    y[229] = t6;
+    t14 = 0.059650767254369894 * t12;
+    y[250] = t14;
+    t4 = C55 * t8;
+    t0 = (-C54) * t7;
+    t6 = t4 + t0;
+    t12 = 0.01813155316277703 * t6;
+    y[69] = t12;
+    t14 = (-0.09982185700900215) * t6;
+    y[90] = t14;
+    t8 = (-C56) * t9;
+    t7 = (-C57) * t3;
+    t4 = t8 + t7;
+    t0 = 0.11041928664604037 * t4;
+    y[197] = t0;
+    t12 = (-0.01180210664863542) * t4;
+    y[282] = t12;
+    t6 = C57 * t9;
+    t14 = (-C56) * t3;
+    t8 = t6 + t14;
+    y[37] = 0;
+    t7 = (-0.11320486103184091) * t8;
+    y[122] = t7;
+    t0 = (-C58) * t13;
+    t4 = (-C59) * t2;
+    t12 = t0 + t4;
+    t9 = 0.11126804657147886 * t12;
+    y[165] = t9;
+    t3 = (-0.0005953093527673472) * t12;
+    y[314] = t3;
+    t6 = C59 * t13;
+    t14 = (-C58) * t2;
+    t8 = t6 + t14;
+    y[5] = 0;
+    t7 = (-0.11234132695921792) * t8;
+    y[154] = t7;
+    t0 = C60 * t10;
+    t4 = C61 * t5;
+    t9 = t0 + t4;
+    y[26] = 0;
+    t12 = (-0.11296956092814121) * t9;
+    y[133] = t12;
+    t3 = (-C61) * t10;
+    t13 = C60 * t5;
+    t2 = t3 + t13;
+    t6 = 0.11064927487813397 * t2;
+    y[186] = t6;
+    t14 = (-0.010616155070436837) * t2;
+    y[293] = t14;
+    t8 = C62 * t11;
+    t7 = C63 * t1;
+    t0 = t8 + t7;
+    y[58] = 0;
+    t4 = (-0.11094095955847565) * t0;
+    y[101] = t4;
+    t9 = (-C63) * t11;
+    t12 = C62 * t1;
+    t10 = t9 + t12;
+    t5 = 0.11267254267267626 * t10;
+    y[218] = t5;
+    t3 = 0.019566348347520503 * t10;
+    y[261] = t3;
+    t13 = re[45];
+    t6 = im[45];
+    t2 = re[61];
+    t14 = im[61];
+    t8 = re[77];
+    t7 = im[77];
+    t0 = re[13];
+    t4 = im[13];
+    t11 = re[29];
+    t1 = im[29];
+    t9 = t2 + t11;
+    t12 = t14 + t1;
+    t5 = t8 + t0;
+    t10 = t7 + t4;
+    t3 = t2 - t11;
+    t2 = t14 - t1;
+    t11 = t8 - t0;
+    t14 = t7 - t4;
+    t1 = t9 + t5;
+    t8 = t12 + t10;
+    t0 = t9 - t5;
+    t7 = C0 * t0;
+    t4 = t12 - t10;
+    t9 = C0 * t4;
+    t5 = C1 * t1;
+    t0 = t13 - t5;
+    t12 = C1 * t8;
+    t10 = t6 - t12;
+    t4 = t0 + t7;
+    t5 = t10 + t9;
+    t12 = t0 - t7;
+    t0 = t10 - t9;
+    t7 = C2 * t3;
+    t10 = C3 * t11;
+    t9 = t7 + t10;
+    t7 = C2 * t2;
+    t10 = C3 * t14;
+    t7 = t7 + t10;
+    t10 = C3 * t3;
+    t3 = C2 * t11;
+    t11 = t10 - t3;
+    t10 = C3 * t2;
+    t3 = C2 * t14;
+    t2 = t10 - t3;
+    t14 = t13 + t1;
+    t10 = t6 + t8;
+    t3 = t4 + t7;
+    t13 = t5 - t9;
+    t1 = t12 + t2;
+    t6 = t0 - t11;
+    t8 = t12 - t2;
+    t12 = t0 + t11;
+    t2 = t4 - t7;
+    t0 = t5 + t9;
+    t11 = C64 * t14;
+    t4 = C65 * t10;
+    t7 = t11 + t4;
+    t5 = 0.0007555813326898759 * t7;
+    y[60] = t5;
+    t9 = (-0.11009685922530492) * t7;
+    y[99] = t9;
+    t11 = (-C65) * t14;
+    t4 = C64 * t10;
+    t5 = t11 + t4;
+    t7 = 0.11335924894760097 * t5;
+    y[220] = t7;
+    t9 = 0.025811551828905523 * t5;
+    y[259] = t9;
+    t14 = (-C66) * t3;
+    t10 = (-C67) * t13;
+    t11 = t14 + t10;
+    t4 = 0.11486653517215203 * t11;
+    y[227] = t4;
+    t7 = 0.05160761537146343 * t11;
+    y[252] = t7;
+    t5 = C67 * t3;
+    t9 = (-C66) * t13;
+    t14 = t5 + t9;
+    t10 = 0.01193881895517893 * t14;
+    y[67] = t10;
+    t4 = (-0.10345803506270192) * t14;
+    y[92] = t4;
+    t11 = (-C68) * t1;
+    t7 = (-C69) * t6;
+    t3 = t11 + t7;
+    t13 = 0.11045771058109824 * t3;
+    y[195] = t13;
+    t5 = (-0.01223824317580326) * t3;
+    y[284] = t5;
+    t9 = C69 * t1;
+    t10 = (-C68) * t6;
+    t14 = t9 + t10;
+    y[35] = 0;
+    t4 = (-0.11316548147014575) * t14;
+    y[124] = t4;
+    t11 = (-C70) * t8;
+    t7 = (-C71) * t12;
+    t13 = t11 + t7;
+    t3 = 0.11145078582284168 * t13;
+    y[163] = t3;
+    t5 = (-0.00029036538053302913) * t13;
+    y[316] = t5;
+    t1 = C71 * t8;
+    t6 = (-C70) * t12;
+    t9 = t1 + t6;
+    y[3] = 0;
+    t10 = (-0.11215712754030802) * t9;
+    y[156] = t10;
+    t14 = C72 * t2;
+    t4 = C73 * t0;
+    t11 = t14 + t4;
+    y[28] = 0;
+    t7 = (-0.11300208339074622) * t11;
+    y[131] = t7;
+    t3 = (-C73) * t2;
+    t13 = C72 * t0;
+    t5 = t3 + t13;
+    t8 = 0.11061742956345909 * t5;
+    y[188] = t8;
+    t12 = (-0.011406212765305677) * t5;
+    y[291] = t12;
+    t1 = re[65];
+    t6 = im[65];
+    t9 = re[1];
+    t10 = im[1];
+    t14 = re[17];
+    t4 = im[17];
+    t11 = re[33];
+    t7 = im[33];
+    t2 = re[49];
+    t0 = im[49];
+    t3 = t9 + t2;
+    t13 = t10 + t0;
+    t8 = t14 + t11;
+    t5 = t4 + t7;
+    t12 = t9 - t2;
+    t9 = t10 - t0;
+    t2 = t14 - t11;
+    t10 = t4 - t7;
+    t0 = t3 + t8;
+    t14 = t13 + t5;
+    t11 = t3 - t8;
+    t4 = C0 * t11;
+    t7 = t13 - t5;
+    t3 = C0 * t7;
+    t8 = C1 * t0;
+    t11 = t1 - t8;
+    t13 = C1 * t14;
+    t5 = t6 - t13;
+    t7 = t11 + t4;
+    t8 = t5 + t3;
+    t13 = t11 - t4;
+    t11 = t5 - t3;
+    t4 = C2 * t12;
+    t5 = C3 * t2;
+    t3 = t4 + t5;
+    t4 = C2 * t9;
+    t5 = C3 * t10;
+    t4 = t4 + t5;
+    t5 = C3 * t12;
+    t12 = C2 * t2;
+    t2 = t5 - t12;
+    t5 = C3 * t9;
+    t12 = C2 * t10;
+    t9 = t5 - t12;
+    t10 = t1 + t0;
+    t5 = t6 + t14;
+    t12 = t7 + t4;
+    t1 = t8 - t3;
+    t0 = t13 + t9;
+    t6 = t11 - t2;
+    t14 = t13 - t9;
+    t13 = t11 + t2;
+    t9 = t7 - t4;
+    t11 = t8 + t3;
+    t2 = C74 * t10;
+    t7 = C75 * t5;
+    t4 = t2 + t7;
+    y[30] = 0;
+    t8 = (-0.11304408052070636) * t4;
+    y[129] = t8;
+    t3 = (-C75) * t10;
+    t2 = C74 * t5;
+    t7 = t3 + t2;
+    t4 = 0.11057633396124945 * t7;
+    y[190] = t4;
+    t8 = (-0.011978418421403958) * t7;
+    y[289] = t8;
+    t10 = C76 * t12;
+    t5 = C77 * t1;
+    t3 = t10 + t5;
+    t2 = 0.0024407325566721005 * t3;
+    y[62] = t2;
+    t4 = (-0.1089119239146507) * t3;
+    y[97] = t4;
+    t7 = (-C77) * t12;
+    t8 = C76 * t1;
+    t10 = t7 + t8;
+    t5 = 0.1140404886851624 * t10;
+    y[222] = t5;
+    t2 = 0.032625849527973955 * t10;
+    y[257] = t2;
+    t3 = (-C78) * t0;
+    t4 = (-C79) * t6;
+    t12 = t3 + t4;
+    t1 = 0.11479287347018707 * t12;
+    y[225] = t1;
+    t7 = 0.04375031221246988 * t12;
+    y[254] = t7;
+    t8 = C79 * t0;
+    t5 = (-C78) * t6;
+    t10 = t8 + t5;
+    t2 = 0.007116496653311107 * t10;
+    y[65] = t2;
+    t3 = (-0.1061795099390396) * t10;
+    y[94] = t3;
+    t4 = (-C80) * t14;
+    t1 = (-C81) * t13;
+    t12 = t4 + t1;
+    t7 = 0.11050463693014653 * t12;
+    y[193] = t7;
+    t0 = (-0.012353140490374916) * t12;
+    y[286] = t0;
+    t6 = C81 * t14;
+    t8 = (-C80) * t13;
+    t5 = t6 + t8;
+    y[33] = 0;
+    t2 = (-0.11311742518010033) * t5;
+    y[126] = t2;
+    t10 = (-C82) * t9;
+    t3 = (-C83) * t11;
+    t4 = t10 + t3;
+    t1 = 0.1116492613513416 * t4;
+    y[161] = t1;
+    t7 = (-0.0001089766368577447) * t4;
+    y[318] = t7;
+    t12 = C83 * t9;
+    t0 = (-C82) * t11;
+    t14 = t12 + t0;
+    y[1] = 0;
+    t13 = (-0.11195774919338328) * t14;
+    y[158] = t13;
+    t6 = re[10];
+    t8 = im[10];
+    t5 = re[26];
+    t2 = im[26];
+    t10 = re[42];
+    t3 = im[42];
+    t1 = re[58];
+    t4 = im[58];
+    t7 = re[74];
+    t9 = im[74];
+    t11 = t5 + t7;
+    t12 = t2 + t9;
+    t0 = t10 + t1;
+    t14 = t3 + t4;
+    t13 = t5 - t7;
+    t5 = t2 - t9;
+    t7 = t10 - t1;
+    t2 = t3 - t4;
+    t9 = t11 + t0;
+    t10 = t12 + t14;
+    t1 = t11 - t0;
+    t3 = C0 * t1;
+    t4 = t12 - t14;
+    t11 = C0 * t4;
+    t0 = C1 * t9;
+    t1 = t6 - t0;
+    t12 = C1 * t10;
+    t14 = t8 - t12;
+    t4 = t1 + t3;
+    t0 = t14 + t11;
+    t12 = t1 - t3;
+    t1 = t14 - t11;
+    t3 = C2 * t13;
+    t14 = C3 * t7;
+    t11 = t3 + t14;
+    t3 = C2 * t5;
+    t14 = C3 * t2;
+    t3 = t3 + t14;
+    t14 = C3 * t13;
+    t13 = C2 * t7;
+    t7 = t14 - t13;
+    t14 = C3 * t5;
+    t13 = C2 * t2;
+    t5 = t14 - t13;
+    t2 = t6 + t9;
+    t14 = t8 + t10;
+    t13 = t4 + t3;
+    t6 = t0 - t11;
+    t9 = t12 + t5;
+    t8 = t1 - t7;
+    t10 = t12 - t5;
+    t12 = t1 + t7;
+    t5 = t4 - t3;
+    t1 = t0 + t11;
+    t7 = C84 * t2;
+    t4 = C85 * t14;
+    t3 = t7 + t4;
+    y[0] = 0;
+    t0 = (-0.11185504702302304) * t3;
+    y[159] = t0;
+    t11 = (-C85) * t2;
+    t7 = C84 * t14;
+    t4 = t11 + t7;
+    t3 = 0.11175177457506354 * t4;
+    y[160] = t3;
+    t0 = (-5.165203830021529e-05) * t4;
+    y[319] = t0;
+    t2 = C86 * t13;
+    t14 = C87 * t6;
+    t11 = t2 + t14;
+    y[32] = 0;
+    t7 = (-0.1130924009614444) * t11;
+    y[127] = t7;
+    t3 = (-C87) * t13;
+    t4 = C86 * t6;
+    t0 = t3 + t4;
+    t2 = 0.11052908854823514 * t0;
+    y[192] = t2;
+    t14 = (-0.01229803461763309) * t0;
+    y[287] = t14;
+    t11 = C88 * t9;
+    t7 = C89 * t8;
+    t13 = t11 + t7;
+    t6 = 0.005228528894598489 * t13;
+    y[64] = t6;
+    t3 = (-0.10724785486810427) * t13;
+    y[95] = t3;
+    t4 = (-C89) * t9;
+    t2 = C88 * t8;
+    t0 = t4 + t2;
+    t14 = 0.11460539079791128 * t0;
+    y[224] = t14;
+    t11 = 0.03993813265887571 * t0;
+    y[255] = t11;
+    t7 = (-C90) * t10;
+    t6 = (-C91) * t12;
+    t13 = t7 + t6;
+    t3 = 0.11434765455550672 * t13;
+    y[223] = t3;
+    t9 = 0.03622537124595676 * t13;
+    y[256] = t9;
+    t8 = C91 * t10;
+    t4 = (-C90) * t12;
+    t2 = t8 + t4;
+    t14 = 0.0036761770928009766 * t2;
+    y[63] = t14;
+    t0 = (-0.108151139331365) * t2;
+    y[96] = t0;
+    t11 = (-C92) * t5;
+    t7 = (-C93) * t1;
+    t6 = t11 + t7;
+    t3 = 0.11055324425243726 * t6;
+    y[191] = t3;
+    t13 = (-0.012171925741771757) * t6;
+    y[288] = t13;
+    t9 = C93 * t5;
+    t10 = (-C92) * t1;
+    t12 = t9 + t10;
+    y[31] = 0;
+    t8 = (-0.11306769045562794) * t12;
+    y[128] = t8;
+    t4 = re[30];
+    t14 = im[30];
+    t2 = re[46];
+    t0 = im[46];
+    t11 = re[62];
+    t7 = im[62];
+    t3 = re[78];
+    t6 = im[78];
+    t13 = re[14];
+    t5 = im[14];
+    t1 = t2 + t13;
+    t9 = t0 + t5;
+    t10 = t11 + t3;
+    t12 = t7 + t6;
+    t8 = t2 - t13;
+    t2 = t0 - t5;
+    t13 = t11 - t3;
+    t0 = t7 - t6;
+    t5 = t1 + t10;
+    t11 = t9 + t12;
+    t3 = t1 - t10;
+    t7 = C0 * t3;
+    t6 = t9 - t12;
+    t1 = C0 * t6;
+    t10 = C1 * t5;
+    t3 = t4 - t10;
+    t9 = C1 * t11;
+    t12 = t14 - t9;
+    t6 = t3 + t7;
+    t10 = t12 + t1;
+    t9 = t3 - t7;
+    t3 = t12 - t1;
+    t7 = C2 * t8;
+    t12 = C3 * t13;
+    t1 = t7 + t12;
+    t7 = C2 * t2;
+    t12 = C3 * t0;
+    t7 = t7 + t12;
+    t12 = C3 * t8;
+    t8 = C2 * t13;
+    t13 = t12 - t8;
+    t12 = C3 * t2;
+    t8 = C2 * t0;
+    t2 = t12 - t8;
+    t0 = t4 + t5;
+    t12 = t14 + t11;
+    t8 = t6 + t7;
+    t4 = t10 - t1;
+    t5 = t9 + t2;
+    t14 = t3 - t13;
+    t11 = t9 - t2;
+    t9 = t3 + t13;
+    t2 = t6 - t7;
+    t3 = t10 + t1;
+    t13 = (-C94) * t0;
+    t6 = (-C95) * t12;
+    t7 = t13 + t6;
+    t10 = 0.11059791963266878 * t7;
+    y[189] = t10;
+    t1 = (-0.011721902414949017) * t7;
+    y[290] = t1;
+    t13 = C95 * t0;
+    t6 = (-C94) * t12;
+    t10 = t13 + t6;
+    y[29] = 0;
+    t7 = (-0.11302201742597437) * t10;
+    y[130] = t7;
+    t1 = C96 * t8;
+    t0 = C97 * t4;
+    t12 = t1 + t0;
+    y[2] = 0;
+    t13 = (-0.11205885530668312) * t12;
+    y[157] = t13;
+    t6 = (-C97) * t8;
+    t10 = C96 * t4;
+    t7 = t6 + t10;
+    t1 = 0.11154852479788367 * t7;
+    y[162] = t1;
+    t0 = (-0.0001860937495776424) * t7;
+    y[317] = t0;
+    t12 = C98 * t5;
+    t13 = C99 * t14;
+    t8 = t12 + t13;
+    y[34] = 0;
+    t4 = (-0.11314211896669611) * t8;
+    y[125] = t4;
+    t6 = (-C99) * t5;
+    t10 = C98 * t14;
+    t1 = t6 + t10;
+    t7 = 0.1104805187861068 * t1;
+    y[194] = t7;
+    t0 = (-0.01233443984786758) * t1;
+    y[285] = t0;
+    t12 = C100 * t11;
+    t13 = C101 * t9;
+    t8 = t12 + t13;
+    t4 = 0.009352418308382831 * t8;
+    y[66] = t4;
+    t5 = (-0.10492339967141712) * t8;
+    y[93] = t5;
+    t14 = (-C101) * t11;
+    t6 = C100 * t9;
+    t10 = t14 + t6;
+    t7 = 0.11488758850671385 * t10;
+    y[226] = t7;
+    t1 = 0.04764581941606944 * t10;
+    y[253] = t1;
+    t0 = (-C102) * t2;
+    t12 = (-C103) * t3;
+    t13 = t0 + t12;
+    t4 = 0.11370366529486921 * t13;
+    y[221] = t4;
+    t8 = 0.02915122830740091 * t13;
+    y[258] = t8;
+    t5 = C103 * t2;
+    t11 = (-C102) * t3;
+    t9 = t5 + t11;
+    t14 = 0.0014941198559818211 * t9;
+    y[61] = t14;
+    t6 = (-0.10955182964996066) * t9;
+    y[98] = t6;
+    t7 = re[50];
+    t10 = im[50];
+    t1 = re[66];
+    t0 = im[66];
+    t12 = re[2];
+    t4 = im[2];
+    t13 = re[18];
+    t8 = im[18];
+    t2 = re[34];
+    t3 = im[34];
+    t5 = t1 + t2;
+    t11 = t0 + t3;
+    t14 = t12 + t13;
+    t9 = t4 + t8;
+    t6 = t1 - t2;
+    t1 = t0 - t3;
+    t2 = t12 - t13;
+    t0 = t4 - t8;
+    t3 = t5 + t14;
+    t12 = t11 + t9;
+    t13 = t5 - t14;
+    t4 = C0 * t13;
+    t8 = t11 - t9;
+    t5 = C0 * t8;
+    t14 = C1 * t3;
+    t13 = t7 - t14;
+    t11 = C1 * t12;
+    t9 = t10 - t11;
+    t8 = t13 + t4;
+    t14 = t9 + t5;
+    t11 = t13 - t4;
+    t13 = t9 - t5;
+    t4 = C2 * t6;
+    t9 = C3 * t2;
+    t5 = t4 + t9;
+    t4 = C2 * t1;
+    t9 = C3 * t0;
+    t4 = t4 + t9;
+    t9 = C3 * t6;
+    t6 = C2 * t2;
+    t2 = t9 - t6;
+    t9 = C3 * t1;
+    t6 = C2 * t0;
+    t1 = t9 - t6;
+    t0 = t7 + t3;
+    t9 = t10 + t12;
+    t6 = t8 + t4;
+    t7 = t14 - t5;
+    t3 = t11 + t1;
+    t10 = t13 - t2;
+    t12 = t11 - t1;
+    t11 = t13 + t2;
+    t1 = t8 - t4;
+    t13 = t14 + t5;
+    t2 = (-C104) * t0;
+    t8 = (-C105) * t9;
+    t4 = t2 + t8;
+    t14 = 0.1130382528407792 * t4;
+    y[219] = t14;
+    t5 = 0.022614471868246694 * t4;
+    y[260] = t5;
+    t2 = C105 * t0;
+    t8 = (-C104) * t9;
+    t14 = t2 + t8;
+    y[59] = 0;
+    t4 = (-0.11058203471710555) * t14;
+    y[100] = t4;
+    t5 = (-C106) * t6;
+    t0 = (-C107) * t7;
+    t9 = t5 + t0;
+    t2 = 0.11063464351695831 * t9;
+    y[187] = t2;
+    t8 = (-0.011035818916886387) * t9;
+    y[292] = t8;
+    t14 = C107 * t6;
+    t4 = (-C106) * t7;
+    t5 = t14 + t4;
+    y[27] = 0;
+    t0 = (-0.11298450108065812) * t5;
+    y[132] = t0;
+    t2 = C108 * t3;
+    t9 = C109 * t10;
+    t8 = t2 + t9;
+    y[4] = 0;
+    t6 = (-0.11225163518783692) * t8;
+    y[155] = t6;
+    t7 = (-C109) * t3;
+    t14 = C108 * t10;
+    t4 = t7 + t14;
+    t5 = 0.11135695243176677 * t4;
+    y[164] = t5;
+    t0 = (-0.0004255556183502251) * t4;
+    y[315] = t0;
+    t2 = C110 * t12;
+    t9 = C111 * t11;
+    t8 = t2 + t9;
+    y[36] = 0;
+    t6 = (-0.11318674554225053) * t8;
+    y[123] = t6;
+    t3 = (-C111) * t12;
+    t10 = C110 * t11;
+    t7 = t3 + t10;
+    t14 = 0.1104369592050332 * t7;
+    y[196] = t14;
+    t5 = (-0.01206173407961596) * t7;
+    y[283] = t5;
+    t4 = C112 * t1;
+    t0 = C113 * t13;
+    t2 = t4 + t0;
+    t9 = 0.014870022449247523 * t2;
+    y[68] = t9;
+    t8 = (-0.10176330597413) * t2;
+    y[91] = t8;
+    t6 = (-C113) * t1;
+    t12 = C112 * t13;
+    t11 = t6 + t12;
+    t3 = 0.11470720717048688 * t11;
+    y[228] = t3;
+    t10 = 0.05561628316934244 * t11;
+    y[251] = t10;
+    t14 = re[70];
+    t7 = im[70];
+    t5 = re[6];
+    t4 = im[6];
+    t0 = re[22];
+    t9 = im[22];
+    t2 = re[38];
+    t8 = im[38];
+    t1 = re[54];
+    t13 = im[54];
+    t6 = t5 + t1;
+    t12 = t4 + t13;
+    t3 = t0 + t2;
+    t11 = t9 + t8;
+    t10 = t5 - t1;
+    t5 = t4 - t13;
+    t1 = t0 - t2;
+    t4 = t9 - t8;
+    t13 = t6 + t3;
+    t0 = t12 + t11;
+    t2 = t6 - t3;
+    t9 = C0 * t2;
+    t8 = t12 - t11;
+    t6 = C0 * t8;
+    t3 = C1 * t13;
+    t2 = t14 - t3;
+    t12 = C1 * t0;
+    t11 = t7 - t12;
+    t8 = t2 + t9;
+    t3 = t11 + t6;
+    t12 = t2 - t9;
+    t2 = t11 - t6;
+    t9 = C2 * t10;
+    t11 = C3 * t1;
+    t6 = t9 + t11;
+    t9 = C2 * t5;
+    t11 = C3 * t4;
+    t9 = t9 + t11;
+    t11 = C3 * t10;
+    t10 = C2 * t1;
+    t1 = t11 - t10;
+    t11 = C3 * t5;
+    t10 = C2 * t4;
+    t5 = t11 - t10;
+    t4 = t14 + t13;
+    t11 = t7 + t0;
+    t10 = t8 + t9;
+    t14 = t3 - t6;
+    t13 = t12 + t5;
+    t7 = t2 - t1;
+    t0 = t12 - t5;
+    t12 = t2 + t1;
+    t5 = t8 - t9;
+    t2 = t3 + t6;
+    t1 = C114 * t4;
+    t8 = C115 * t11;
+    t9 = t1 + t8;
+    t3 = 0.021701284641749745 * t9;
+    y[70] = t3;
+    t6 = (-0.09762044271285876) * t9;
+    y[89] = t6;
+    t1 = (-C115) * t4;
+    t8 = C114 * t11;
+    t3 = t1 + t8;
+    t9 = 0.11388864301218943 * t3;
+    y[230] = t9;
+    t6 = 0.06368932862731685 * t3;
+    y[249] = t6;
+    t4 = (-C116) * t10;
+    t11 = (-C117) * t14;
+    t1 = t4 + t11;
+    t8 = 0.11234550604833171 * t1;
+    y[217] = t8;
+    t9 = 0.016671591989872066 * t1;
+    y[262] = t9;
+    t3 = C117 * t10;
+    t6 = (-C116) * t14;
+    t4 = t3 + t6;
+    y[57] = 0;
+    t11 = (-0.11126390756228761) * t4;
+    y[102] = t11;
+    t8 = (-C118) * t13;
+    t1 = (-C119) * t7;
+    t9 = t8 + t1;
+    t10 = 0.11066142996104605 * t9;
+    y[185] = t10;
+    t14 = (-0.010152208455441044) * t9;
+    y[294] = t14;
+    t3 = C119 * t13;
+    t6 = (-C118) * t7;
+    t4 = t3 + t6;
+    y[25] = 0;
+    t11 = (-0.11295715231946778) * t4;
+    y[134] = t11;
+    t8 = C120 * t0;
+    t1 = C121 * t12;
+    t10 = t8 + t1;
+    y[6] = 0;
+    t9 = (-0.11242546940951972) * t10;
+    y[153] = t9;
+    t14 = (-C121) * t0;
+    t13 = C120 * t12;
+    t7 = t14 + t13;
+    t3 = 0.11118477036967173 * t7;
+    y[166] = t3;
+    t6 = (-0.0008022883639918069) * t7;
+    y[313] = t6;
+    t4 = C122 * t5;
+    t11 = C123 * t2;
+    t8 = t4 + t11;
+    y[38] = 0;
+    t1 = (-0.11321893897230066) * t8;
+    y[121] = t1;
+    t10 = (-C123) * t5;
+    t9 = C122 * t2;
+    t0 = t10 + t9;
+    t12 = 0.11040555682170945 * t0;
+    y[198] = t12;
+    t14 = (-0.01145593708480445) * t0;
+    y[281] = t14;
+    t13 = re[15];
+    t3 = im[15];
+    t7 = re[31];
+    t6 = im[31];
+    t4 = re[47];
+    t11 = im[47];
+    t8 = re[63];
+    t1 = im[63];
+    t5 = re[79];
+    t2 = im[79];
+    t10 = t7 + t5;
+    t9 = t6 + t2;
+    t12 = t4 + t8;
+    t0 = t11 + t1;
+    t14 = t7 - t5;
+    t7 = t6 - t2;
+    t5 = t4 - t8;
+    t6 = t11 - t1;
+    t2 = t10 + t12;
+    t4 = t9 + t0;
+    t8 = t10 - t12;
+    t11 = C0 * t8;
+    t1 = t9 - t0;
+    t10 = C0 * t1;
+    t12 = C1 * t2;
+    t8 = t13 - t12;
+    t9 = C1 * t4;
+    t0 = t3 - t9;
+    t1 = t8 + t11;
+    t12 = t0 + t10;
+    t9 = t8 - t11;
+    t8 = t0 - t10;
+    t11 = C2 * t14;
+    t0 = C3 * t5;
+    t10 = t11 + t0;
+    t11 = C2 * t7;
+    t0 = C3 * t6;
+    t11 = t11 + t0;
+    t0 = C3 * t14;
+    t14 = C2 * t5;
+    t5 = t0 - t14;
+    t0 = C3 * t7;
+    t14 = C2 * t6;
+    t7 = t0 - t14;
+    t6 = t13 + t2;
+    t0 = t3 + t4;
+    t14 = t1 + t11;
+    t13 = t12 - t10;
+    t2 = t9 + t7;
+    t3 = t8 - t5;
+    t4 = t9 - t7;
+    t9 = t8 + t5;
+    t7 = t1 - t11;
+    t8 = t12 + t10;
+    t5 = C124 * t6;
+    t1 = C125 * t0;
+    t11 = t5 + t1;
+    y[40] = 0;
+    t12 = (-0.11323067239466955) * t11;
+    y[119] = t12;
+    t10 = (-C125) * t6;
+    t5 = C124 * t0;
+    t1 = t10 + t5;
+    t11 = 0.11039411614929569 * t1;
+    y[200] = t11;
+    t12 = (-0.010492396715068457) * t1;
+    y[279] = t12;
+    t6 = C126 * t14;
+    t0 = C127 * t13;
+    t10 = t6 + t0;
+    t5 = 0.029643940889860314 * t10;
+    y[72] = t5;
+    t11 = (-0.09240371932400153) * t10;
+    y[87] = t11;
+    t1 = (-C127) * t14;
+    t12 = C126 * t13;
+    t6 = t1 + t12;
+    t0 = 0.11227828538840914 * t6;
+    y[232] = t0;
+    t5 = 0.07168644812391273 * t6;
+    y[247] = t5;
+    t10 = (-C128) * t2;
+    t11 = (-C129) * t3;
+    t14 = t10 + t11;
+    t13 = 0.11179661430082742 * t14;
+    y[215] = t13;
+    t1 = 0.011350651572530776 * t14;
+    y[264] = t1;
+    t12 = C129 * t2;
+    t0 = (-C128) * t3;
+    t6 = t12 + t0;
+    y[55] = 0;
+    t5 = (-0.11181018386088534) * t6;
+    y[104] = t5;
+    t10 = (-C130) * t4;
+    t11 = (-C131) * t9;
+    t13 = t10 + t11;
+    t14 = 0.1106787773094936 * t13;
+    y[183] = t14;
+    t1 = (-0.009115290867001715) * t13;
+    y[296] = t1;
+    t2 = C131 * t4;
+    t3 = (-C130) * t9;
+    t12 = t2 + t3;
+    y[23] = 0;
+    t0 = (-0.11293944786764282) * t12;
+    y[136] = t0;
+    t6 = C132 * t7;
+    t5 = C133 * t8;
+    t10 = t6 + t5;
+    y[8] = 0;
+    t11 = (-0.11257434708384861) * t10;
+    y[151] = t11;
+    t14 = (-C133) * t7;
+    t13 = C132 * t8;
+    t1 = t14 + t13;
+    t4 = 0.11103773038709819 * t1;
+    y[168] = t4;
+    t9 = (-0.0013363528219741984) * t1;
+    y[311] = t9;
+    t2 = re[35];
+    t3 = im[35];
+    t12 = re[51];
+    t0 = im[51];
+    t6 = re[67];
+    t5 = im[67];
+    t10 = re[3];
+    t11 = im[3];
+    t7 = re[19];
+    t8 = im[19];
+    t14 = t12 + t7;
+    t13 = t0 + t8;
+    t4 = t6 + t10;
+    t1 = t5 + t11;
+    t9 = t12 - t7;
+    t12 = t0 - t8;
+    t7 = t6 - t10;
+    t0 = t5 - t11;
+    t8 = t14 + t4;
+    t6 = t13 + t1;
+    t10 = t14 - t4;
+    t5 = C0 * t10;
+    t11 = t13 - t1;
+    t14 = C0 * t11;
+    t4 = C1 * t8;
+    t10 = t2 - t4;
+    t13 = C1 * t6;
+    t1 = t3 - t13;
+    t11 = t10 + t5;
+    t4 = t1 + t14;
+    t13 = t10 - t5;
+    t10 = t1 - t14;
+    t5 = C2 * t9;
+    t1 = C3 * t7;
+    t14 = t5 + t1;
+    t5 = C2 * t12;
+    t1 = C3 * t0;
+    t5 = t5 + t1;
+    t1 = C3 * t9;
+    t9 = C2 * t7;
+    t7 = t1 - t9;
+    t1 = C3 * t12;
+    t9 = C2 * t0;
+    t12 = t1 - t9;
+    t0 = t2 + t8;
+    t1 = t3 + t6;
+    t9 = t11 + t5;
+    t2 = t4 - t14;
+    t8 = t13 + t12;
+    t3 = t10 - t7;
+    t6 = t13 - t12;
+    t13 = t10 + t7;
+    t12 = t11 - t5;
+    t10 = t4 + t14;
+    t7 = C134 * t0;
+    t11 = C135 * t1;
+    t5 = t7 + t11;
+    y[10] = 0;
+    t4 = (-0.11269474498682608) * t5;
+    y[149] = t4;
+    t14 = (-C135) * t0;
+    t7 = C134 * t1;
+    t11 = t14 + t7;
+    t5 = 0.11091910276261092 * t11;
+    y[170] = t5;
+    t4 = (-0.0020355669173363036) * t11;
+    y[309] = t4;
+    t0 = C136 * t9;
+    t1 = C137 * t2;
+    t14 = t0 + t1;
+    y[42] = 0;
+    t7 = (-0.11321389983506888) * t14;
+    y[117] = t7;
+    t5 = (-C137) * t9;
+    t11 = C136 * t2;
+    t4 = t5 + t11;
+    t0 = 0.11041047095992741 * t4;
+    y[202] = t0;
+    t1 = (-0.009144168244333128) * t4;
+    y[277] = t1;
+    t14 = C138 * t8;
+    t7 = C139 * t3;
+    t9 = t14 + t7;
+    t2 = 0.03840702414922375 * t9;
+    y[74] = t2;
+    t5 = (-0.08609343893725221) * t9;
+    y[85] = t5;
+    t11 = (-C139) * t8;
+    t0 = C138 * t3;
+    t4 = t11 + t0;
+    t1 = 0.10976184087525823 * t4;
+    y[234] = t1;
+    t14 = 0.07941843250116053 * t4;
+    y[245] = t14;
+    t7 = (-C140) * t6;
+    t2 = (-C141) * t13;
+    t9 = t7 + t2;
+    t5 = 0.11136963947658277 * t9;
+    y[213] = t5;
+    t8 = 0.006655923646798118 * t9;
+    y[266] = t8;
+    t3 = C141 * t6;
+    t11 = (-C140) * t13;
+    t0 = t3 + t11;
+    y[53] = 0;
+    t1 = (-0.11223884766753088) * t0;
+    y[106] = t1;
+    t4 = (-C142) * t12;
+    t14 = (-C143) * t10;
+    t7 = t4 + t14;
+    t2 = 0.11068977020554269 * t7;
+    y[181] = t2;
+    t5 = (-0.007973780692501398) * t7;
+    y[298] = t5;
+    t9 = C143 * t12;
+    t8 = (-C142) * t10;
+    t6 = t9 + t8;
+    y[21] = 0;
+    t13 = (-0.11292823155011004) * t6;
+    y[138] = t13;
+    t3 = re[55];
+    t11 = im[55];
+    t0 = re[71];
+    t1 = im[71];
+    t4 = re[7];
+    t14 = im[7];
+    t2 = re[23];
+    t7 = im[23];
+    t5 = re[39];
+    t12 = im[39];
+    t10 = t0 + t5;
+    t9 = t1 + t12;
+    t8 = t4 + t2;
+    t6 = t14 + t7;
+    t13 = t0 - t5;
+    t0 = t1 - t12;
+    t5 = t4 - t2;
+    t1 = t14 - t7;
+    t12 = t10 + t8;
+    t4 = t9 + t6;
+    t2 = t10 - t8;
+    t14 = C0 * t2;
+    t7 = t9 - t6;
+    t10 = C0 * t7;
+    t8 = C1 * t12;
+    t2 = t3 - t8;
+    t9 = C1 * t4;
+    t6 = t11 - t9;
+    t7 = t2 + t14;
+    t8 = t6 + t10;
+    t9 = t2 - t14;
+    t2 = t6 - t10;
+    t14 = C2 * t13;
+    t6 = C3 * t5;
+    t10 = t14 + t6;
+    t14 = C2 * t0;
+    t6 = C3 * t1;
+    t14 = t14 + t6;
+    t6 = C3 * t13;
+    t13 = C2 * t5;
+    t5 = t6 - t13;
+    t6 = C3 * t0;
+    t13 = C2 * t1;
+    t0 = t6 - t13;
+    t1 = t3 + t12;
+    t6 = t11 + t4;
+    t13 = t7 + t14;
+    t3 = t8 - t10;
+    t12 = t9 + t0;
+    t11 = t2 - t5;
+    t4 = t9 - t0;
+    t9 = t2 + t5;
+    t0 = t7 - t14;
+    t2 = t8 + t10;
+    t5 = (-C144) * t1;
+    t7 = (-C145) * t6;
+    t14 = t5 + t7;
+    t8 = 0.11069982990167095 * t14;
+    y[179] = t8;
+    t10 = (-0.00677944196717133) * t14;
+    y[300] = t10;
+    t5 = C145 * t1;
+    t7 = (-C144) * t6;
+    t8 = t5 + t7;
+    y[19] = 0;
+    t14 = (-0.11291796935101998) * t8;
+    y[140] = t14;
+    t10 = C146 * t13;
+    t1 = C147 * t3;
+    t6 = t10 + t1;
+    y[12] = 0;
+    t5 = (-0.11278570463175508) * t6;
+    y[147] = t5;
+    t7 = (-C147) * t13;
+    t8 = C146 * t3;
+    t14 = t7 + t8;
+    t10 = 0.11082964849856157 * t14;
+    y[172] = t10;
+    t1 = (-0.0028939996046675) * t14;
+    y[307] = t1;
+    t6 = C148 * t12;
+    t5 = C149 * t11;
+    t13 = t6 + t5;
+    y[44] = 0;
+    t3 = (-0.11316074359050755) * t13;
+    y[115] = t3;
+    t7 = (-C149) * t12;
+    t8 = C148 * t11;
+    t10 = t7 + t8;
+    t14 = 0.11046233528858285 * t10;
+    y[204] = t14;
+    t1 = (-0.007381472594023432) * t10;
+    y[275] = t1;
+    t6 = C150 * t4;
+    t5 = C151 * t9;
+    t13 = t6 + t5;
+    t3 = 0.04764807034464822 * t13;
+    y[76] = t3;
+    t12 = (-0.0787522384296202) * t13;
+    y[83] = t12;
+    t11 = (-C151) * t4;
+    t7 = C150 * t9;
+    t8 = t11 + t7;
+    t14 = 0.10627159994209234 * t8;
+    y[236] = t14;
+    t10 = 0.08669550714611719 * t8;
+    y[243] = t10;
+    t1 = (-C152) * t0;
+    t6 = (-C153) * t2;
+    t5 = t1 + t6;
+    t3 = 0.11104348913524584 * t5;
+    y[211] = t3;
+    t13 = 0.0025721960202326173 * t5;
+    y[268] = t13;
+    t12 = C153 * t0;
+    t4 = (-C152) * t2;
+    t9 = t12 + t4;
+    y[51] = 0;
+    t11 = (-0.11256850894495554) * t9;
+    y[108] = t11;
+    t7 = re[75];
+    t14 = im[75];
+    t8 = re[11];
+    t10 = im[11];
+    t1 = re[27];
+    t6 = im[27];
+    t3 = re[43];
+    t5 = im[43];
+    t13 = re[59];
+    t0 = im[59];
+    t2 = t8 + t13;
+    t12 = t10 + t0;
+    t4 = t1 + t3;
+    t9 = t6 + t5;
+    t11 = t8 - t13;
+    t8 = t10 - t0;
+    t13 = t1 - t3;
+    t10 = t6 - t5;
+    t0 = t2 + t4;
+    t1 = t12 + t9;
+    t3 = t2 - t4;
+    t6 = C0 * t3;
+    t5 = t12 - t9;
+    t2 = C0 * t5;
+    t4 = C1 * t0;
+    t3 = t7 - t4;
+    t12 = C1 * t1;
+    t9 = t14 - t12;
+    t5 = t3 + t6;
+    t4 = t9 + t2;
+    t12 = t3 - t6;
+    t3 = t9 - t2;
+    t6 = C2 * t11;
+    t9 = C3 * t13;
+    t2 = t6 + t9;
+    t6 = C2 * t8;
+    t9 = C3 * t10;
+    t6 = t6 + t9;
+    t9 = C3 * t11;
+    t11 = C2 * t13;
+    t13 = t9 - t11;
+    t9 = C3 * t8;
+    t11 = C2 * t10;
+    t8 = t9 - t11;
+    t10 = t7 + t0;
+    t9 = t14 + t1;
+    t11 = t5 + t6;
+    t7 = t4 - t2;
+    t0 = t12 + t8;
+    t14 = t3 - t13;
+    t1 = t12 - t8;
+    t12 = t3 + t13;
+    t8 = t5 - t6;
+    t3 = t4 + t2;
+    t13 = (-C154) * t10;
+    t5 = (-C155) * t9;
+    t6 = t13 + t5;
+    t4 = 0.11079974707998154 * t6;
+    y[209] = t4;
+    t2 = (-0.0009291338389342098) * t6;
+    y[270] = t2;
+    t13 = C155 * t10;
+    t5 = (-C154) * t9;
+    t4 = t13 + t5;
+    y[49] = 0;
+    t6 = (-0.11281614199874296) * t4;
+    y[110] = t6;
+    t2 = (-C156) * t11;
+    t10 = (-C157) * t7;
+    t9 = t2 + t10;
+    t13 = 0.1107159369533963 * t9;
+    y[177] = t13;
+    t5 = (-0.005583714262614551) * t9;
+    y[302] = t5;
+    t4 = C157 * t11;
+    t6 = (-C156) * t7;
+    t2 = t4 + t6;
+    y[17] = 0;
+    t10 = (-0.11290154194568777) * t2;
+    y[142] = t10;
+    t13 = C158 * t0;
+    t9 = C159 * t14;
+    t5 = t13 + t9;
+    y[14] = 0;
+    t11 = (-0.1128489577131372) * t5;
+    y[145] = t11;
+    t7 = (-C159) * t0;
+    t4 = C158 * t14;
+    t6 = t7 + t4;
+    t2 = 0.11076752726219304 * t6;
+    y[174] = t2;
+    t10 = (-0.0038925446683325056) * t6;
+    y[305] = t10;
+    t13 = C160 * t1;
+    t9 = C161 * t12;
+    t5 = t13 + t9;
+    y[46] = 0;
+    t11 = (-0.11306341881413566) * t5;
+    y[113] = t11;
+    t0 = (-C161) * t1;
+    t14 = C160 * t12;
+    t7 = t0 + t14;
+    t4 = 0.1105574210571917 * t7;
+    y[206] = t4;
+    t2 = (-0.005170299986352561) * t7;
+    y[273] = t2;
+    t6 = C162 * t8;
+    t10 = C163 * t3;
+    t13 = t6 + t10;
+    t9 = 0.057007607494891754 * t13;
+    y[78] = t9;
+    t5 = (-0.07052284850968048) * t13;
+    y[81] = t5;
+    t11 = (-C163) * t8;
+    t1 = C162 * t3;
+    t12 = t11 + t1;
+    t0 = 0.1017954643269173 * t12;
+    y[238] = t0;
+    t14 = 0.09334006677577329 * t12;
+    y[241] = t14;
+}
+
+//
+//  Public functions.
+//
+
+/**
+ *  Apply LD-MDCT transform (prebuilt for window W10_160).
+ * 
+ *  Note(s):
+ *    [1] X[k] = SUM(w[n] * x[n] * cos(PI / 160 * (n + 80.5) * (k + 0.5))), where
+ *        w[n] = sqrt(2 / 160) * W10_160[n].
+ *    [2] The size of all arrays will not be checked.
+ * 
+ *  @param {Number[]} x 
+ *    - The input block (320 points).
+ *  @param {Number[]} X 
+ *    - The array that would contain the output block (160 points).
+ *  @param {Number[]} re 
+ *    - The scratch buffer (real part, 80 points).
+ *  @param {Number[]} im 
+ *    - The scratch buffer (imaginary part, 80 points).
+ */
+function ApplyWindowedMDCT_W10_160(x, X, re, im) {
+    ApplyWindowedMDCT_W10_160_Part1(x, X, re, im);
+    ApplyWindowedMDCT_W10_160_Part2(x, X, re, im);
+}
+
+/**
+ *  Apply LD-IMDCT transform (prebuilt for window W10_160).
+ * 
+ *  Note(s):
+ *    [1] y[n] = w[n] * SUM(X[k] * cos(PI / 160 * (n + 80.5) * (k + 0.5))), where
+ *        w[n] = sqrt(2 / 160) * W10_160[319 - n].
+ *    [2] The size of all arrays will not be checked.
+ * 
+ *  @param {Number[]} X 
+ *    - The input block (160 points).
+ *  @param {Number[]} y 
+ *    - The array that would contain the output block (320 points).
+ *  @param {Number[]} re 
+ *    - The scratch buffer (real part, 80 points).
+ *  @param {Number[]} im 
+ *    - The scratch buffer (imaginary part, 80 points).
+ */
+function ApplyWindowedIMDCT_W10_160(X, y, re, im) {
+    ApplyWindowedIMDCT_W10_160_Part1(X, y, re, im);
+    ApplyWindowedIMDCT_W10_160_Part2(X, y, re, im);
+}
+
+//  Export public APIs.
+module.exports = {
+    "ApplyWindowedMDCT_W10_160": ApplyWindowedMDCT_W10_160,
+    "ApplyWindowedIMDCT_W10_160": ApplyWindowedIMDCT_W10_160
+};
\ No newline at end of file
@@ -0,0 +1,5279 @@
+//
+//  Copyright 2021 - 2023 XiaoJSoft Studio. All rights reserved.
+//  Use of this source code is governed by a BSD-style license that can be
+//  found in the LICENSE.md file.
+//
+
+//
+//  Note(s):
+//    [1] This file is generated automatically by a MDCT compiler, which locates 
+//        at "./../../dev/mdct-generator/" directory.
+//        Do NOT modify this file manually.
+//
+
+//
+//  Private functions.
+//
+
+/**
+ *  Part 1 of ApplyWindowedIMDCT_W75_180_K120().
+ * 
+ *  @param {Number[]} X 
+ *    - The input block (180 points, only the first 120 points are used).
+ *  @param {Number[]} y 
+ *    - The array that would contain the output block (360 points).
+ *  @param {Number[]} re 
+ *    - The scratch buffer (real part, 90 points).
+ *  @param {Number[]} im 
+ *    - The scratch buffer (imaginary part, 90 points).
+ */
+function ApplyWindowedIMDCT_W75_180_K120_Part1(X, y, re, im) {
+    let t0, t1, t10, t11, t12, t13, t14, t2, t3, t4, t5, t6, t7, t8, t9;
+    const C0 = 0.8660254037844387;
+    const C1 = 0.49999999999999994;
+    const C2 = 0.5;
+    const C3 = 0.8660254037844386;
+    const C4 = 0.984807753012208;
+    const C5 = 0.17364817766693033;
+    const C6 = 0.766044443118978;
+    const C7 = 0.6427876096865393;
+    const C8 = 0.9396926207859084;
+    const C9 = 0.3420201433256687;
+    const C10 = 1.4088320528055172;
+    const C11 = 0.12325683343243876;
+    const C12 = 1.1584559306791384;
+    const C13 = 0.8111595753452777;
+    const C14 = 0.5976724774602398;
+    const C15 = 1.281712764111577;
+    const C16 = 0.9510565162951535;
+    const C17 = 0.3090169943749474;
+    const C18 = 0.6691306063588582;
+    const C19 = 0.7431448254773942;
+    const C20 = 0.9781476007338057;
+    const C21 = 0.20791169081775931;
+    const C22 = 0.882947592858927;
+    const C23 = 0.4694715627858908;
+    const C24 = 0.5299192642332049;
+    const C25 = 0.848048096156426;
+    const C26 = 0.9993908270190958;
+    const C27 = 0.03489949670250097;
+    const C28 = 0.7880107536067219;
+    const C29 = 0.6156614753256583;
+    const C30 = 0.9271838545667874;
+    const C31 = 0.374606593415912;
+    const C32 = 0.9902680687415704;
+    const C33 = 0.13917310096006544;
+    const C34 = 0.8090169943749475;
+    const C35 = 0.5877852522924731;
+    const C36 = 0.9135454576426009;
+    const C37 = 0.40673664307580015;
+    const C38 = 0.9945218953682733;
+    const C39 = 0.10452846326765346;
+    const C40 = 0.6946583704589973;
+    const C41 = 0.7193398003386512;
+    const C42 = 0.9702957262759965;
+    const C43 = 0.24192189559966773;
+    const C44 = 0.9612616959383189;
+    const C45 = 0.27563735581699916;
+    const C46 = 0.5591929034707468;
+    const C47 = 0.8290375725550417;
+    const C48 = 0.9975640502598242;
+    const C49 = 0.0697564737441253;
+    const C50 = 0.898794046299167;
+    const C51 = 0.4383711467890774;
+    const C52 = 0.5590169943749475;
+    const C53 = 0.25;
+    t0 = X[0];
+    t1 = X[60];
+    t2 = X[119];
+    t3 = C0 * t1;
+    t4 = C1 * t2;
+    t3 = t3 + t4;
+    t4 = (-C1) * t1;
+    t1 = C0 * t2;
+    t2 = t4 + t1;
+    t4 = X[59];
+    t1 = C0 * t4;
+    t4 = C1 * t4;
+    t5 = t3 + t1;
+    t6 = t2 + t4;
+    t7 = C2 * t5;
+    t7 = t0 - t7;
+    t8 = C2 * t6;
+    t9 = -t8;
+    t3 = t3 - t1;
+    t1 = C3 * t3;
+    t3 = t2 - t4;
+    t2 = C3 * t3;
+    t4 = t0 + t5;
+    t3 = t7 + t2;
+    t0 = t9 - t1;
+    t5 = t7 - t2;
+    t9 = t1 - t8;
+    re[0] = t4;
+    im[0] = t6;
+    re[30] = t3;
+    im[30] = t0;
+    re[60] = t5;
+    im[60] = t9;
+    t7 = X[20];
+    t2 = C4 * t7;
+    t1 = (-C5) * t7;
+    t8 = X[80];
+    t4 = X[99];
+    t6 = C6 * t8;
+    t3 = C7 * t4;
+    t0 = t6 + t3;
+    t5 = (-C7) * t8;
+    t9 = C6 * t4;
+    t7 = t5 + t9;
+    t6 = X[39];
+    t3 = C8 * t6;
+    t8 = C9 * t6;
+    t4 = t0 + t3;
+    t5 = t7 + t8;
+    t9 = C2 * t4;
+    t6 = t2 - t9;
+    t9 = C2 * t5;
+    t9 = t1 - t9;
+    t0 = t0 - t3;
+    t3 = C3 * t0;
+    t0 = t7 - t8;
+    t7 = C3 * t0;
+    t8 = t2 + t4;
+    t0 = t1 + t5;
+    t2 = t6 + t7;
+    t4 = t9 - t3;
+    t1 = t6 - t7;
+    t5 = t9 + t3;
+    t6 = t2 + t4;
+    t7 = C6 * t6;
+    t9 = t2 * (-C10);
+    t3 = t4 * C11;
+    t6 = t7 - t3;
+    t2 = t7 + t9;
+    t4 = t1 + t5;
+    t3 = C5 * t4;
+    t7 = t1 * (-C12);
+    t9 = t5 * (-C13);
+    t4 = t3 - t9;
+    t1 = t3 + t7;
+    re[10] = t8;
+    im[10] = t0;
+    re[40] = t6;
+    im[40] = t2;
+    re[70] = t4;
+    im[70] = t1;
+    t5 = X[40];
+    t9 = C8 * t5;
+    t3 = (-C9) * t5;
+    t7 = X[100];
+    t8 = X[79];
+    t0 = C7 * t7;
+    t6 = C6 * t8;
+    t2 = t0 + t6;
+    t4 = (-C6) * t7;
+    t1 = C7 * t8;
+    t5 = t4 + t1;
+    t0 = X[19];
+    t6 = C4 * t0;
+    t7 = C5 * t0;
+    t8 = t2 + t6;
+    t4 = t5 + t7;
+    t1 = C2 * t8;
+    t0 = t9 - t1;
+    t1 = C2 * t4;
+    t1 = t3 - t1;
+    t2 = t2 - t6;
+    t6 = C3 * t2;
+    t2 = t5 - t7;
+    t5 = C3 * t2;
+    t7 = t9 + t8;
+    t2 = t3 + t4;
+    t9 = t0 + t5;
+    t8 = t1 - t6;
+    t3 = t0 - t5;
+    t4 = t1 + t6;
+    t0 = t9 + t8;
+    t5 = C5 * t0;
+    t1 = t9 * (-C12);
+    t6 = t8 * (-C13);
+    t0 = t5 - t6;
+    t9 = t5 + t1;
+    t8 = t3 + t4;
+    t6 = (-C8) * t8;
+    t5 = t3 * C14;
+    t1 = t4 * (-C15);
+    t8 = t6 - t1;
+    t3 = t6 + t5;
+    re[20] = t7;
+    im[20] = t2;
+    re[50] = t0;
+    im[50] = t9;
+    re[80] = t8;
+    im[80] = t3;
+    t4 = re[0];
+    t1 = im[0];
+    t6 = re[10];
+    t5 = im[10];
+    t7 = re[20];
+    t2 = im[20];
+    t0 = t6 + t7;
+    t9 = t5 + t2;
+    t8 = C2 * t0;
+    t3 = t4 - t8;
+    t8 = C2 * t9;
+    t8 = t1 - t8;
+    t6 = t6 - t7;
+    t7 = C3 * t6;
+    t6 = t5 - t2;
+    t5 = C3 * t6;
+    t2 = t4 + t0;
+    t6 = t1 + t9;
+    t4 = t3 + t5;
+    t0 = t8 - t7;
+    t1 = t3 - t5;
+    t9 = t8 + t7;
+    re[0] = t2;
+    im[0] = t6;
+    re[10] = t4;
+    im[10] = t0;
+    re[20] = t1;
+    im[20] = t9;
+    t3 = re[30];
+    t5 = im[30];
+    t8 = re[40];
+    t7 = im[40];
+    t2 = re[50];
+    t6 = im[50];
+    t4 = t8 + t2;
+    t0 = t7 + t6;
+    t1 = C2 * t4;
+    t9 = t3 - t1;
+    t1 = C2 * t0;
+    t1 = t5 - t1;
+    t8 = t8 - t2;
+    t2 = C3 * t8;
+    t8 = t7 - t6;
+    t7 = C3 * t8;
+    t6 = t3 + t4;
+    t8 = t5 + t0;
+    t3 = t9 + t7;
+    t4 = t1 - t2;
+    t5 = t9 - t7;
+    t0 = t1 + t2;
+    re[30] = t6;
+    im[30] = t8;
+    re[40] = t3;
+    im[40] = t4;
+    re[50] = t5;
+    im[50] = t0;
+    t9 = re[60];
+    t7 = im[60];
+    t1 = re[70];
+    t2 = im[70];
+    t6 = re[80];
+    t8 = im[80];
+    t3 = t1 + t6;
+    t4 = t2 + t8;
+    t5 = C2 * t3;
+    t0 = t9 - t5;
+    t5 = C2 * t4;
+    t5 = t7 - t5;
+    t1 = t1 - t6;
+    t6 = C3 * t1;
+    t1 = t2 - t8;
+    t2 = C3 * t1;
+    t8 = t9 + t3;
+    t1 = t7 + t4;
+    t9 = t0 + t2;
+    t3 = t5 - t6;
+    t7 = t0 - t2;
+    t4 = t5 + t6;
+    re[60] = t8;
+    im[60] = t1;
+    re[70] = t9;
+    im[70] = t3;
+    re[80] = t7;
+    im[80] = t4;
+    t0 = X[36];
+    t2 = C16 * t0;
+    t5 = (-C17) * t0;
+    t6 = X[96];
+    t8 = X[83];
+    t1 = C18 * t6;
+    t9 = C19 * t8;
+    t3 = t1 + t9;
+    t7 = (-C19) * t6;
+    t4 = C18 * t8;
+    t0 = t7 + t4;
+    t1 = X[23];
+    t9 = C20 * t1;
+    t6 = C21 * t1;
+    t8 = t3 + t9;
+    t7 = t0 + t6;
+    t4 = C2 * t8;
+    t1 = t2 - t4;
+    t4 = C2 * t7;
+    t4 = t5 - t4;
+    t3 = t3 - t9;
+    t9 = C3 * t3;
+    t3 = t0 - t6;
+    t0 = C3 * t3;
+    t6 = t2 + t8;
+    t3 = t5 + t7;
+    t2 = t1 + t0;
+    t8 = t4 - t9;
+    t5 = t1 - t0;
+    t7 = t4 + t9;
+    re[18] = t6;
+    im[18] = t3;
+    re[48] = t2;
+    im[48] = t8;
+    re[78] = t5;
+    im[78] = t7;
+    t1 = X[56];
+    t0 = C22 * t1;
+    t4 = (-C23) * t1;
+    t9 = X[116];
+    t6 = X[63];
+    t3 = C24 * t9;
+    t2 = C25 * t6;
+    t8 = t3 + t2;
+    t5 = (-C25) * t9;
+    t7 = C24 * t6;
+    t1 = t5 + t7;
+    t3 = X[3];
+    t2 = C26 * t3;
+    t9 = C27 * t3;
+    t6 = t8 + t2;
+    t5 = t1 + t9;
+    t7 = C2 * t6;
+    t3 = t0 - t7;
+    t7 = C2 * t5;
+    t7 = t4 - t7;
+    t8 = t8 - t2;
+    t2 = C3 * t8;
+    t8 = t1 - t9;
+    t1 = C3 * t8;
+    t9 = t0 + t6;
+    t8 = t4 + t5;
+    t0 = t3 + t1;
+    t6 = t7 - t2;
+    t4 = t3 - t1;
+    t5 = t7 + t2;
+    t3 = t0 + t6;
+    t1 = C6 * t3;
+    t7 = t0 * (-C10);
+    t2 = t6 * C11;
+    t3 = t1 - t2;
+    t0 = t1 + t7;
+    t6 = t4 + t5;
+    t2 = C5 * t6;
+    t1 = t4 * (-C12);
+    t7 = t5 * (-C13);
+    t6 = t2 - t7;
+    t4 = t2 + t1;
+    re[28] = t9;
+    im[28] = t8;
+    re[58] = t3;
+    im[58] = t0;
+    re[88] = t6;
+    im[88] = t4;
+    t5 = X[76];
+    t7 = X[103];
+    t2 = C28 * t5;
+    t1 = C29 * t7;
+    t9 = t2 + t1;
+    t8 = (-C29) * t5;
+    t3 = C28 * t7;
+    t0 = t8 + t3;
+    t6 = X[43];
+    t4 = C30 * t6;
+    t2 = C31 * t6;
+    t1 = X[16];
+    t5 = C32 * t1;
+    t7 = (-C33) * t1;
+    t8 = t4 + t5;
+    t3 = t2 + t7;
+    t6 = C2 * t8;
+    t1 = t9 - t6;
+    t6 = C2 * t3;
+    t6 = t0 - t6;
+    t4 = t4 - t5;
+    t5 = C3 * t4;
+    t4 = t2 - t7;
+    t2 = C3 * t4;
+    t7 = t9 + t8;
+    t4 = t0 + t3;
+    t9 = t1 + t2;
+    t8 = t6 - t5;
+    t0 = t1 - t2;
+    t3 = t6 + t5;
+    t1 = t9 + t8;
+    t2 = C5 * t1;
+    t6 = t9 * (-C12);
+    t5 = t8 * (-C13);
+    t1 = t2 - t5;
+    t9 = t2 + t6;
+    t8 = t0 + t3;
+    t5 = (-C8) * t8;
+    t2 = t0 * C14;
+    t6 = t3 * (-C15);
+    t8 = t5 - t6;
+    t0 = t5 + t2;
+    re[38] = t7;
+    im[38] = t4;
+    re[68] = t1;
+    im[68] = t9;
+    re[8] = t8;
+    im[8] = t0;
+    t3 = re[18];
+    t6 = im[18];
+    t5 = re[28];
+    t2 = im[28];
+    t7 = re[38];
+    t4 = im[38];
+    t1 = t5 + t7;
+    t9 = t2 + t4;
+    t8 = C2 * t1;
+    t0 = t3 - t8;
+    t8 = C2 * t9;
+    t8 = t6 - t8;
+    t5 = t5 - t7;
+    t7 = C3 * t5;
+    t5 = t2 - t4;
+    t2 = C3 * t5;
+    t4 = t3 + t1;
+    t5 = t6 + t9;
+    t3 = t0 + t2;
+    t1 = t8 - t7;
+    t6 = t0 - t2;
+    t9 = t8 + t7;
+    re[18] = t4;
+    im[18] = t5;
+    re[28] = t3;
+    im[28] = t1;
+    re[38] = t6;
+    im[38] = t9;
+    t0 = re[48];
+    t2 = im[48];
+    t8 = re[58];
+    t7 = im[58];
+    t4 = re[68];
+    t5 = im[68];
+    t3 = t8 + t4;
+    t1 = t7 + t5;
+    t6 = C2 * t3;
+    t9 = t0 - t6;
+    t6 = C2 * t1;
+    t6 = t2 - t6;
+    t8 = t8 - t4;
+    t4 = C3 * t8;
+    t8 = t7 - t5;
+    t7 = C3 * t8;
+    t5 = t0 + t3;
+    t8 = t2 + t1;
+    t0 = t9 + t7;
+    t3 = t6 - t4;
+    t2 = t9 - t7;
+    t1 = t6 + t4;
+    re[48] = t5;
+    im[48] = t8;
+    re[58] = t0;
+    im[58] = t3;
+    re[68] = t2;
+    im[68] = t1;
+    t9 = re[78];
+    t7 = im[78];
+    t6 = re[88];
+    t4 = im[88];
+    t5 = re[8];
+    t8 = im[8];
+    t0 = t6 + t5;
+    t3 = t4 + t8;
+    t2 = C2 * t0;
+    t1 = t9 - t2;
+    t2 = C2 * t3;
+    t2 = t7 - t2;
+    t6 = t6 - t5;
+    t5 = C3 * t6;
+    t6 = t4 - t8;
+    t4 = C3 * t6;
+    t8 = t9 + t0;
+    t6 = t7 + t3;
+    t9 = t1 + t4;
+    t0 = t2 - t5;
+    t7 = t1 - t4;
+    t3 = t2 + t5;
+    re[78] = t8;
+    im[78] = t6;
+    re[88] = t9;
+    im[88] = t0;
+    re[8] = t7;
+    im[8] = t3;
+    t1 = X[72];
+    t4 = X[107];
+    t2 = C34 * t1;
+    t5 = C35 * t4;
+    t8 = t2 + t5;
+    t6 = (-C35) * t1;
+    t9 = C34 * t4;
+    t0 = t6 + t9;
+    t7 = X[47];
+    t3 = C36 * t7;
+    t2 = C37 * t7;
+    t5 = X[12];
+    t1 = C38 * t5;
+    t4 = (-C39) * t5;
+    t6 = t3 + t1;
+    t9 = t2 + t4;
+    t7 = C2 * t6;
+    t5 = t8 - t7;
+    t7 = C2 * t9;
+    t7 = t0 - t7;
+    t3 = t3 - t1;
+    t1 = C3 * t3;
+    t3 = t2 - t4;
+    t2 = C3 * t3;
+    t4 = t8 + t6;
+    t3 = t0 + t9;
+    t8 = t5 + t2;
+    t6 = t7 - t1;
+    t0 = t5 - t2;
+    t9 = t7 + t1;
+    re[36] = t4;
+    im[36] = t3;
+    re[66] = t8;
+    im[66] = t6;
+    re[6] = t0;
+    im[6] = t9;
+    t5 = X[92];
+    t2 = X[87];
+    t7 = C40 * t5;
+    t1 = C41 * t2;
+    t4 = t7 + t1;
+    t3 = (-C41) * t5;
+    t8 = C40 * t2;
+    t6 = t3 + t8;
+    t0 = X[27];
+    t9 = C42 * t0;
+    t7 = C43 * t0;
+    t1 = X[32];
+    t5 = C44 * t1;
+    t2 = (-C45) * t1;
+    t3 = t9 + t5;
+    t8 = t7 + t2;
+    t0 = C2 * t3;
+    t1 = t4 - t0;
+    t0 = C2 * t8;
+    t0 = t6 - t0;
+    t9 = t9 - t5;
+    t5 = C3 * t9;
+    t9 = t7 - t2;
+    t7 = C3 * t9;
+    t2 = t4 + t3;
+    t9 = t6 + t8;
+    t4 = t1 + t7;
+    t3 = t0 - t5;
+    t6 = t1 - t7;
+    t8 = t0 + t5;
+    t1 = t4 + t3;
+    t7 = C6 * t1;
+    t0 = t4 * (-C10);
+    t5 = t3 * C11;
+    t1 = t7 - t5;
+    t4 = t7 + t0;
+    t3 = t6 + t8;
+    t5 = C5 * t3;
+    t7 = t6 * (-C12);
+    t0 = t8 * (-C13);
+    t3 = t5 - t0;
+    t6 = t5 + t7;
+    re[46] = t2;
+    im[46] = t9;
+    re[76] = t1;
+    im[76] = t4;
+    re[16] = t3;
+    im[16] = t6;
+    t8 = X[112];
+    t0 = X[67];
+    t5 = C46 * t8;
+    t7 = C47 * t0;
+    t2 = t5 + t7;
+    t9 = (-C47) * t8;
+    t1 = C46 * t0;
+    t4 = t9 + t1;
+    t3 = X[7];
+    t6 = C48 * t3;
+    t5 = C49 * t3;
+    t7 = X[52];
+    t8 = C50 * t7;
+    t0 = (-C51) * t7;
+    t9 = t6 + t8;
+    t1 = t5 + t0;
+    t3 = C2 * t9;
+    t7 = t2 - t3;
+    t3 = C2 * t1;
+    t3 = t4 - t3;
+    t6 = t6 - t8;
+    t8 = C3 * t6;
+    t6 = t5 - t0;
+    t5 = C3 * t6;
+    t0 = t2 + t9;
+    t6 = t4 + t1;
+    t2 = t7 + t5;
+    t9 = t3 - t8;
+    t4 = t7 - t5;
+    t1 = t3 + t8;
+    t7 = t2 + t9;
+    t5 = C5 * t7;
+    t3 = t2 * (-C12);
+    t8 = t9 * (-C13);
+    t7 = t5 - t8;
+    t2 = t5 + t3;
+    t9 = t4 + t1;
+    t8 = (-C8) * t9;
+    t5 = t4 * C14;
+    t3 = t1 * (-C15);
+    t9 = t8 - t3;
+    t4 = t8 + t5;
+    re[56] = t0;
+    im[56] = t6;
+    re[86] = t7;
+    im[86] = t2;
+    re[26] = t9;
+    im[26] = t4;
+    t1 = re[36];
+    t3 = im[36];
+    t8 = re[46];
+    t5 = im[46];
+    t0 = re[56];
+    t6 = im[56];
+    t7 = t8 + t0;
+    t2 = t5 + t6;
+    t9 = C2 * t7;
+    t4 = t1 - t9;
+    t9 = C2 * t2;
+    t9 = t3 - t9;
+    t8 = t8 - t0;
+    t0 = C3 * t8;
+    t8 = t5 - t6;
+    t5 = C3 * t8;
+    t6 = t1 + t7;
+    t8 = t3 + t2;
+    t1 = t4 + t5;
+    t7 = t9 - t0;
+    t3 = t4 - t5;
+    t2 = t9 + t0;
+    re[36] = t6;
+    im[36] = t8;
+    re[46] = t1;
+    im[46] = t7;
+    re[56] = t3;
+    im[56] = t2;
+    t4 = re[66];
+    t5 = im[66];
+    t9 = re[76];
+    t0 = im[76];
+    t6 = re[86];
+    t8 = im[86];
+    t1 = t9 + t6;
+    t7 = t0 + t8;
+    t3 = C2 * t1;
+    t2 = t4 - t3;
+    t3 = C2 * t7;
+    t3 = t5 - t3;
+    t9 = t9 - t6;
+    t6 = C3 * t9;
+    t9 = t0 - t8;
+    t0 = C3 * t9;
+    t8 = t4 + t1;
+    t9 = t5 + t7;
+    t4 = t2 + t0;
+    t1 = t3 - t6;
+    t5 = t2 - t0;
+    t7 = t3 + t6;
+    re[66] = t8;
+    im[66] = t9;
+    re[76] = t4;
+    im[76] = t1;
+    re[86] = t5;
+    im[86] = t7;
+    t2 = re[6];
+    t0 = im[6];
+    t3 = re[16];
+    t6 = im[16];
+    t8 = re[26];
+    t9 = im[26];
+    t4 = t3 + t8;
+    t1 = t6 + t9;
+    t5 = C2 * t4;
+    t7 = t2 - t5;
+    t5 = C2 * t1;
+    t5 = t0 - t5;
+    t3 = t3 - t8;
+    t8 = C3 * t3;
+    t3 = t6 - t9;
+    t6 = C3 * t3;
+    t9 = t2 + t4;
+    t3 = t0 + t1;
+    t2 = t7 + t6;
+    t4 = t5 - t8;
+    t0 = t7 - t6;
+    t1 = t5 + t8;
+    re[6] = t9;
+    im[6] = t3;
+    re[16] = t2;
+    im[16] = t4;
+    re[26] = t0;
+    im[26] = t1;
+    t7 = X[108];
+    t6 = X[71];
+    t5 = C35 * t7;
+    t8 = C34 * t6;
+    t9 = t5 + t8;
+    t3 = (-C34) * t7;
+    t2 = C35 * t6;
+    t4 = t3 + t2;
+    t0 = X[11];
+    t1 = C38 * t0;
+    t5 = C39 * t0;
+    t8 = X[48];
+    t7 = C36 * t8;
+    t6 = (-C37) * t8;
+    t3 = t1 + t7;
+    t2 = t5 + t6;
+    t0 = C2 * t3;
+    t8 = t9 - t0;
+    t0 = C2 * t2;
+    t0 = t4 - t0;
+    t1 = t1 - t7;
+    t7 = C3 * t1;
+    t1 = t5 - t6;
+    t5 = C3 * t1;
+    t6 = t9 + t3;
+    t1 = t4 + t2;
+    t9 = t8 + t5;
+    t3 = t0 - t7;
+    t4 = t8 - t5;
+    t2 = t0 + t7;
+    re[54] = t6;
+    im[54] = t1;
+    re[84] = t9;
+    im[84] = t3;
+    re[24] = t4;
+    im[24] = t2;
+    t8 = X[51];
+    t5 = C50 * t8;
+    t0 = C51 * t8;
+    t7 = X[8];
+    t6 = C48 * t7;
+    t1 = (-C49) * t7;
+    t9 = X[68];
+    t3 = X[111];
+    t4 = C47 * t9;
+    t2 = C46 * t3;
+    t8 = t4 + t2;
+    t7 = (-C46) * t9;
+    t4 = C47 * t3;
+    t2 = t7 + t4;
+    t9 = t6 + t8;
+    t3 = t1 + t2;
+    t7 = C2 * t9;
+    t4 = t5 - t7;
+    t7 = C2 * t3;
+    t7 = t0 - t7;
+    t6 = t6 - t8;
+    t8 = C3 * t6;
+    t6 = t1 - t2;
+    t1 = C3 * t6;
+    t2 = t5 + t9;
+    t6 = t0 + t3;
+    t5 = t4 + t1;
+    t9 = t7 - t8;
+    t0 = t4 - t1;
+    t3 = t7 + t8;
+    t4 = t5 + t9;
+    t1 = C6 * t4;
+    t7 = t5 * (-C10);
+    t8 = t9 * C11;
+    t4 = t1 - t8;
+    t5 = t1 + t7;
+    t9 = t0 + t3;
+    t8 = C5 * t9;
+    t1 = t0 * (-C12);
+    t7 = t3 * (-C13);
+    t9 = t8 - t7;
+    t0 = t8 + t1;
+    re[64] = t2;
+    im[64] = t6;
+    re[4] = t4;
+    im[4] = t5;
+    re[34] = t9;
+    im[34] = t0;
+    t3 = X[31];
+    t7 = C44 * t3;
+    t8 = C45 * t3;
+    t1 = X[28];
+    t2 = C42 * t1;
+    t6 = (-C43) * t1;
+    t4 = X[88];
+    t5 = X[91];
+    t9 = C41 * t4;
+    t0 = C40 * t5;
+    t3 = t9 + t0;
+    t1 = (-C40) * t4;
+    t9 = C41 * t5;
+    t0 = t1 + t9;
+    t4 = t2 + t3;
+    t5 = t6 + t0;
+    t1 = C2 * t4;
+    t9 = t7 - t1;
+    t1 = C2 * t5;
+    t1 = t8 - t1;
+    t2 = t2 - t3;
+    t3 = C3 * t2;
+    t2 = t6 - t0;
+    t6 = C3 * t2;
+    t0 = t7 + t4;
+    t2 = t8 + t5;
+    t7 = t9 + t6;
+    t4 = t1 - t3;
+    t8 = t9 - t6;
+    t5 = t1 + t3;
+    t9 = t7 + t4;
+    t6 = C5 * t9;
+    t1 = t7 * (-C12);
+    t3 = t4 * (-C13);
+    t9 = t6 - t3;
+    t7 = t6 + t1;
+    t4 = t8 + t5;
+    t3 = (-C8) * t4;
+    t6 = t8 * C14;
+    t1 = t5 * (-C15);
+    t4 = t3 - t1;
+    t8 = t3 + t6;
+    re[74] = t0;
+    im[74] = t2;
+    re[14] = t9;
+    im[14] = t7;
+    re[44] = t4;
+    im[44] = t8;
+    t5 = re[54];
+    t1 = im[54];
+    t3 = re[64];
+    t6 = im[64];
+    t0 = re[74];
+    t2 = im[74];
+    t9 = t3 + t0;
+    t7 = t6 + t2;
+    t4 = C2 * t9;
+    t8 = t5 - t4;
+    t4 = C2 * t7;
+    t4 = t1 - t4;
+    t3 = t3 - t0;
+    t0 = C3 * t3;
+    t3 = t6 - t2;
+    t6 = C3 * t3;
+    t2 = t5 + t9;
+    t3 = t1 + t7;
+    t5 = t8 + t6;
+    t9 = t4 - t0;
+    t1 = t8 - t6;
+    t7 = t4 + t0;
+    re[54] = t2;
+    im[54] = t3;
+    re[64] = t5;
+    im[64] = t9;
+    re[74] = t1;
+    im[74] = t7;
+    t8 = re[84];
+    t6 = im[84];
+    t4 = re[4];
+    t0 = im[4];
+    t2 = re[14];
+    t3 = im[14];
+    t5 = t4 + t2;
+    t9 = t0 + t3;
+    t1 = C2 * t5;
+    t7 = t8 - t1;
+    t1 = C2 * t9;
+    t1 = t6 - t1;
+    t4 = t4 - t2;
+    t2 = C3 * t4;
+    t4 = t0 - t3;
+    t0 = C3 * t4;
+    t3 = t8 + t5;
+    t4 = t6 + t9;
+    t8 = t7 + t0;
+    t5 = t1 - t2;
+    t6 = t7 - t0;
+    t9 = t1 + t2;
+    re[84] = t3;
+    im[84] = t4;
+    re[4] = t8;
+    im[4] = t5;
+    re[14] = t6;
+    im[14] = t9;
+    t7 = re[24];
+    t0 = im[24];
+    t1 = re[34];
+    t2 = im[34];
+    t3 = re[44];
+    t4 = im[44];
+    t8 = t1 + t3;
+    t5 = t2 + t4;
+    t6 = C2 * t8;
+    t9 = t7 - t6;
+    t6 = C2 * t5;
+    t6 = t0 - t6;
+    t1 = t1 - t3;
+    t3 = C3 * t1;
+    t1 = t2 - t4;
+    t2 = C3 * t1;
+    t4 = t7 + t8;
+    t1 = t0 + t5;
+    t7 = t9 + t2;
+    t8 = t6 - t3;
+    t0 = t9 - t2;
+    t5 = t6 + t3;
+    re[24] = t4;
+    im[24] = t1;
+    re[34] = t7;
+    im[34] = t8;
+    re[44] = t0;
+    im[44] = t5;
+    t9 = X[35];
+    t2 = C16 * t9;
+    t6 = C17 * t9;
+    t3 = X[24];
+    t4 = C20 * t3;
+    t1 = (-C21) * t3;
+    t7 = X[84];
+    t8 = X[95];
+    t0 = C19 * t7;
+    t5 = C18 * t8;
+    t9 = t0 + t5;
+    t3 = (-C18) * t7;
+    t0 = C19 * t8;
+    t5 = t3 + t0;
+    t7 = t4 + t9;
+    t8 = t1 + t5;
+    t3 = C2 * t7;
+    t0 = t2 - t3;
+    t3 = C2 * t8;
+    t3 = t6 - t3;
+    t4 = t4 - t9;
+    t9 = C3 * t4;
+    t4 = t1 - t5;
+    t1 = C3 * t4;
+    t5 = t2 + t7;
+    t4 = t6 + t8;
+    t2 = t0 + t1;
+    t7 = t3 - t9;
+    t6 = t0 - t1;
+    t8 = t3 + t9;
+    re[72] = t5;
+    im[72] = t4;
+    re[12] = t2;
+    im[12] = t7;
+    re[42] = t6;
+    im[42] = t8;
+    t0 = X[15];
+    t1 = C32 * t0;
+    t3 = C33 * t0;
+    t9 = X[44];
+    t5 = C30 * t9;
+    t4 = (-C31) * t9;
+    t2 = X[104];
+    t7 = X[75];
+    t6 = C29 * t2;
+    t8 = C28 * t7;
+    t0 = t6 + t8;
+    t9 = (-C28) * t2;
+    t6 = C29 * t7;
+    t8 = t9 + t6;
+    t2 = t5 + t0;
+    t7 = t4 + t8;
+    t9 = C2 * t2;
+    t6 = t1 - t9;
+    t9 = C2 * t7;
+    t9 = t3 - t9;
+    t5 = t5 - t0;
+    t0 = C3 * t5;
+    t5 = t4 - t8;
+    t4 = C3 * t5;
+    t8 = t1 + t2;
+    t5 = t3 + t7;
+    t1 = t6 + t4;
+    t2 = t9 - t0;
+    t3 = t6 - t4;
+    t7 = t9 + t0;
+    t6 = t1 + t2;
+    t4 = C6 * t6;
+    t9 = t1 * (-C10);
+    t0 = t2 * C11;
+    t6 = t4 - t0;
+    t1 = t4 + t9;
+    t2 = t3 + t7;
+    t0 = C5 * t2;
+    t4 = t3 * (-C12);
+    t9 = t7 * (-C13);
+    t2 = t0 - t9;
+    t3 = t0 + t4;
+    re[82] = t8;
+    im[82] = t5;
+    re[22] = t6;
+    im[22] = t1;
+    re[52] = t2;
+    im[52] = t3;
+    t7 = X[4];
+    t9 = C26 * t7;
+    t0 = (-C27) * t7;
+    t4 = X[64];
+    t8 = X[115];
+    t5 = C25 * t4;
+    t6 = C24 * t8;
+    t1 = t5 + t6;
+    t2 = (-C24) * t4;
+    t3 = C25 * t8;
+    t7 = t2 + t3;
+    t5 = X[55];
+    t6 = C22 * t5;
+    t4 = C23 * t5;
+    t8 = t1 + t6;
+    t2 = t7 + t4;
+    t3 = C2 * t8;
+    t5 = t9 - t3;
+    t3 = C2 * t2;
+    t3 = t0 - t3;
+    t1 = t1 - t6;
+    t6 = C3 * t1;
+    t1 = t7 - t4;
+    t7 = C3 * t1;
+    t4 = t9 + t8;
+    t1 = t0 + t2;
+    t9 = t5 + t7;
+    t8 = t3 - t6;
+    t0 = t5 - t7;
+    t2 = t3 + t6;
+    t5 = t9 + t8;
+    t7 = C5 * t5;
+    t3 = t9 * (-C12);
+    t6 = t8 * (-C13);
+    t5 = t7 - t6;
+    t9 = t7 + t3;
+    t8 = t0 + t2;
+    t6 = (-C8) * t8;
+    t7 = t0 * C14;
+    t3 = t2 * (-C15);
+    t8 = t6 - t3;
+    t0 = t6 + t7;
+    re[2] = t4;
+    im[2] = t1;
+    re[32] = t5;
+    im[32] = t9;
+    re[62] = t8;
+    im[62] = t0;
+    t2 = re[72];
+    t3 = im[72];
+    t6 = re[82];
+    t7 = im[82];
+    t4 = re[2];
+    t1 = im[2];
+    t5 = t6 + t4;
+    t9 = t7 + t1;
+    t8 = C2 * t5;
+    t0 = t2 - t8;
+    t8 = C2 * t9;
+    t8 = t3 - t8;
+    t6 = t6 - t4;
+    t4 = C3 * t6;
+    t6 = t7 - t1;
+    t7 = C3 * t6;
+    t1 = t2 + t5;
+    t6 = t3 + t9;
+    t2 = t0 + t7;
+    t5 = t8 - t4;
+    t3 = t0 - t7;
+    t9 = t8 + t4;
+    re[72] = t1;
+    im[72] = t6;
+    re[82] = t2;
+    im[82] = t5;
+    re[2] = t3;
+    im[2] = t9;
+    t0 = re[12];
+    t7 = im[12];
+    t8 = re[22];
+    t4 = im[22];
+    t1 = re[32];
+    t6 = im[32];
+    t2 = t8 + t1;
+    t5 = t4 + t6;
+    t3 = C2 * t2;
+    t9 = t0 - t3;
+    t3 = C2 * t5;
+    t3 = t7 - t3;
+    t8 = t8 - t1;
+    t1 = C3 * t8;
+    t8 = t4 - t6;
+    t4 = C3 * t8;
+    t6 = t0 + t2;
+    t8 = t7 + t5;
+    t0 = t9 + t4;
+    t2 = t3 - t1;
+    t7 = t9 - t4;
+    t5 = t3 + t1;
+    re[12] = t6;
+    im[12] = t8;
+    re[22] = t0;
+    im[22] = t2;
+    re[32] = t7;
+    im[32] = t5;
+    t9 = re[42];
+    t4 = im[42];
+    t3 = re[52];
+    t1 = im[52];
+    t6 = re[62];
+    t8 = im[62];
+    t0 = t3 + t6;
+    t2 = t1 + t8;
+    t7 = C2 * t0;
+    t5 = t9 - t7;
+    t7 = C2 * t2;
+    t7 = t4 - t7;
+    t3 = t3 - t6;
+    t6 = C3 * t3;
+    t3 = t1 - t8;
+    t1 = C3 * t3;
+    t8 = t9 + t0;
+    t3 = t4 + t2;
+    t9 = t5 + t1;
+    t0 = t7 - t6;
+    t4 = t5 - t1;
+    t2 = t7 + t6;
+    re[42] = t8;
+    im[42] = t3;
+    re[52] = t9;
+    im[52] = t0;
+    re[62] = t4;
+    im[62] = t2;
+    t5 = re[0];
+    t1 = im[0];
+    t7 = re[18];
+    t6 = im[18];
+    t8 = re[36];
+    t3 = im[36];
+    t9 = re[54];
+    t0 = im[54];
+    t4 = re[72];
+    t2 = im[72];
+    t10 = t7 + t4;
+    t11 = t6 + t2;
+    t12 = t8 + t9;
+    t13 = t3 + t0;
+    t7 = t7 - t4;
+    t4 = t6 - t2;
+    t6 = t8 - t9;
+    t2 = t3 - t0;
+    t8 = t10 + t12;
+    t9 = t11 + t13;
+    t3 = t10 - t12;
+    t0 = C52 * t3;
+    t10 = t11 - t13;
+    t12 = C52 * t10;
+    t3 = C53 * t8;
+    t11 = t5 - t3;
+    t13 = C53 * t9;
+    t10 = t1 - t13;
+    t3 = t11 + t0;
+    t13 = t10 + t12;
+    t11 = t11 - t0;
+    t0 = t10 - t12;
+    t10 = C16 * t7;
+    t12 = C35 * t6;
+    t10 = t10 + t12;
+    t12 = C16 * t4;
+    t14 = C35 * t2;
+    t12 = t12 + t14;
+    t14 = C35 * t7;
+    t7 = C16 * t6;
+    t6 = t14 - t7;
+    t14 = C35 * t4;
+    t7 = C16 * t2;
+    t4 = t14 - t7;
+    t2 = t5 + t8;
+    t14 = t1 + t9;
+    t7 = t3 + t12;
+    t5 = t13 - t10;
+    t8 = t11 + t4;
+    t1 = t0 - t6;
+    t9 = t11 - t4;
+    t11 = t0 + t6;
+    t4 = t3 - t12;
+    t0 = t13 + t10;
+    re[0] = t2;
+    im[0] = t14;
+    re[18] = t7;
+    im[18] = t5;
+    re[36] = t8;
+    im[36] = t1;
+    re[54] = t9;
+    im[54] = t11;
+    re[72] = t4;
+    im[72] = t0;
+    t6 = re[30];
+    t3 = im[30];
+    t12 = re[48];
+    t13 = im[48];
+    t10 = re[66];
+    t2 = im[66];
+    t14 = re[84];
+    t7 = im[84];
+    t5 = re[12];
+    t8 = im[12];
+    t1 = t12 + t5;
+    t9 = t13 + t8;
+    t11 = t10 + t14;
+    t4 = t2 + t7;
+    t0 = t12 - t5;
+    t12 = t13 - t8;
+    t5 = t10 - t14;
+    t13 = t2 - t7;
+    t8 = t1 + t11;
+    t10 = t9 + t4;
+    t14 = t1 - t11;
+    t2 = C52 * t14;
+    t7 = t9 - t4;
+    t1 = C52 * t7;
+    t11 = C53 * t8;
+    t14 = t6 - t11;
+    t9 = C53 * t10;
+    t4 = t3 - t9;
+    t7 = t14 + t2;
+    t11 = t4 + t1;
+    t9 = t14 - t2;
+    t14 = t4 - t1;
+    t2 = C16 * t0;
+    t4 = C35 * t5;
+    t1 = t2 + t4;
+    t2 = C16 * t12;
+    t4 = C35 * t13;
+    t2 = t2 + t4;
+    t4 = C35 * t0;
+    t0 = C16 * t5;
+    t5 = t4 - t0;
+    t4 = C35 * t12;
+    t0 = C16 * t13;
+    t12 = t4 - t0;
+    t13 = t6 + t8;
+    t4 = t3 + t10;
+    t0 = t7 + t2;
+    t6 = t11 - t1;
+    t8 = t9 + t12;
+    t3 = t14 - t5;
+    t10 = t9 - t12;
+    t9 = t14 + t5;
+    t12 = t7 - t2;
+    t14 = t11 + t1;
+    re[30] = t13;
+    im[30] = t4;
+    re[48] = t0;
+    im[48] = t6;
+    re[66] = t8;
+    im[66] = t3;
+    re[84] = t10;
+    im[84] = t9;
+    re[12] = t12;
+    im[12] = t14;
+    t5 = re[60];
+    t7 = im[60];
+    t2 = re[78];
+    t11 = im[78];
+    t1 = re[6];
+    t13 = im[6];
+    t4 = re[24];
+    t0 = im[24];
+    t6 = re[42];
+    t8 = im[42];
+    t3 = t2 + t6;
+    t10 = t11 + t8;
+    t9 = t1 + t4;
+    t12 = t13 + t0;
+    t14 = t2 - t6;
+    t2 = t11 - t8;
+    t6 = t1 - t4;
+    t11 = t13 - t0;
+    t8 = t3 + t9;
+    t1 = t10 + t12;
+    t4 = t3 - t9;
+    t13 = C52 * t4;
+    t0 = t10 - t12;
+    t3 = C52 * t0;
+    t9 = C53 * t8;
+    t4 = t5 - t9;
+    t10 = C53 * t1;
+    t12 = t7 - t10;
+    t0 = t4 + t13;
+    t9 = t12 + t3;
+    t10 = t4 - t13;
+    t4 = t12 - t3;
+    t13 = C16 * t14;
+    t12 = C35 * t6;
+    t3 = t13 + t12;
+    t13 = C16 * t2;
+    t12 = C35 * t11;
+    t13 = t13 + t12;
+    t12 = C35 * t14;
+    t14 = C16 * t6;
+    t6 = t12 - t14;
+    t12 = C35 * t2;
+    t14 = C16 * t11;
+    t2 = t12 - t14;
+    t11 = t5 + t8;
+    t12 = t7 + t1;
+    t14 = t0 + t13;
+    t5 = t9 - t3;
+    t8 = t10 + t2;
+    t7 = t4 - t6;
+    t1 = t10 - t2;
+    t10 = t4 + t6;
+    t2 = t0 - t13;
+    t4 = t9 + t3;
+    re[60] = t11;
+    im[60] = t12;
+    re[78] = t14;
+    im[78] = t5;
+    re[6] = t8;
+    im[6] = t7;
+    re[24] = t1;
+    im[24] = t10;
+    re[42] = t2;
+    im[42] = t4;
+    t6 = re[10];
+    t0 = im[10];
+    t13 = re[28];
+    t9 = im[28];
+    t3 = re[46];
+    t11 = im[46];
+    t12 = re[64];
+    t14 = im[64];
+    t5 = re[82];
+    t8 = im[82];
+    t7 = t13 + t5;
+    t1 = t9 + t8;
+    t10 = t3 + t12;
+    t2 = t11 + t14;
+    t4 = t13 - t5;
+    t13 = t9 - t8;
+    t5 = t3 - t12;
+    t9 = t11 - t14;
+    t8 = t7 + t10;
+    t3 = t1 + t2;
+    t12 = t7 - t10;
+    t11 = C52 * t12;
+    t14 = t1 - t2;
+    t7 = C52 * t14;
+    t10 = C53 * t8;
+    t12 = t6 - t10;
+    t1 = C53 * t3;
+    t2 = t0 - t1;
+    t14 = t12 + t11;
+    t10 = t2 + t7;
+    t1 = t12 - t11;
+    t12 = t2 - t7;
+    t11 = C16 * t4;
+    t2 = C35 * t5;
+    t7 = t11 + t2;
+    t11 = C16 * t13;
+    t2 = C35 * t9;
+    t11 = t11 + t2;
+    t2 = C35 * t4;
+    t4 = C16 * t5;
+    t5 = t2 - t4;
+    t2 = C35 * t13;
+    t4 = C16 * t9;
+    t13 = t2 - t4;
+    t9 = t6 + t8;
+    t2 = t0 + t3;
+    t4 = t14 + t11;
+    t6 = t10 - t7;
+    t8 = t1 + t13;
+    t0 = t12 - t5;
+    t3 = t1 - t13;
+    t1 = t12 + t5;
+    t13 = t14 - t11;
+    t12 = t10 + t7;
+    re[10] = t9;
+    im[10] = t2;
+    re[28] = t4;
+    im[28] = t6;
+    re[46] = t8;
+    im[46] = t0;
+    re[64] = t3;
+    im[64] = t1;
+    re[82] = t13;
+    im[82] = t12;
+    t5 = re[40];
+    t14 = im[40];
+    t11 = re[58];
+    t10 = im[58];
+    t7 = re[76];
+    t9 = im[76];
+    t2 = re[4];
+    t4 = im[4];
+    t6 = re[22];
+    t8 = im[22];
+    t0 = t11 + t6;
+    t3 = t10 + t8;
+    t1 = t7 + t2;
+    t13 = t9 + t4;
+    t12 = t11 - t6;
+    t11 = t10 - t8;
+    t6 = t7 - t2;
+    t10 = t9 - t4;
+    t8 = t0 + t1;
+    t7 = t3 + t13;
+    t2 = t0 - t1;
+    t9 = C52 * t2;
+    t4 = t3 - t13;
+    t0 = C52 * t4;
+    t1 = C53 * t8;
+    t2 = t5 - t1;
+    t3 = C53 * t7;
+    t13 = t14 - t3;
+    t4 = t2 + t9;
+    t1 = t13 + t0;
+    t3 = t2 - t9;
+    t2 = t13 - t0;
+    t9 = C16 * t12;
+    t13 = C35 * t6;
+    t0 = t9 + t13;
+    t9 = C16 * t11;
+    t13 = C35 * t10;
+    t9 = t9 + t13;
+    t13 = C35 * t12;
+    t12 = C16 * t6;
+    t6 = t13 - t12;
+    t13 = C35 * t11;
+    t12 = C16 * t10;
+    t11 = t13 - t12;
+    t10 = t5 + t8;
+    t13 = t14 + t7;
+    t12 = t4 + t9;
+    t5 = t1 - t0;
+    t8 = t3 + t11;
+    t14 = t2 - t6;
+    t7 = t3 - t11;
+    t3 = t2 + t6;
+    t11 = t4 - t9;
+    t2 = t1 + t0;
+    re[40] = t10;
+    im[40] = t13;
+    re[58] = t12;
+    im[58] = t5;
+    re[76] = t8;
+    im[76] = t14;
+    re[4] = t7;
+    im[4] = t3;
+    re[22] = t11;
+    im[22] = t2;
+    t6 = re[70];
+    t4 = im[70];
+    t9 = re[88];
+    t1 = im[88];
+    t0 = re[16];
+    t10 = im[16];
+    t13 = re[34];
+    t12 = im[34];
+    t5 = re[52];
+    t8 = im[52];
+    t14 = t9 + t5;
+    t7 = t1 + t8;
+    t3 = t0 + t13;
+    t11 = t10 + t12;
+    t2 = t9 - t5;
+    t9 = t1 - t8;
+    t5 = t0 - t13;
+    t1 = t10 - t12;
+    t8 = t14 + t3;
+    t0 = t7 + t11;
+    t13 = t14 - t3;
+    t10 = C52 * t13;
+    t12 = t7 - t11;
+    t14 = C52 * t12;
+    t3 = C53 * t8;
+    t13 = t6 - t3;
+    t7 = C53 * t0;
+    t11 = t4 - t7;
+    t12 = t13 + t10;
+    t3 = t11 + t14;
+    t7 = t13 - t10;
+    t13 = t11 - t14;
+    t10 = C16 * t2;
+    t11 = C35 * t5;
+    t14 = t10 + t11;
+    t10 = C16 * t9;
+    t11 = C35 * t1;
+    t10 = t10 + t11;
+    t11 = C35 * t2;
+    t2 = C16 * t5;
+    t5 = t11 - t2;
+    t11 = C35 * t9;
+    t2 = C16 * t1;
+    t9 = t11 - t2;
+    t1 = t6 + t8;
+    t11 = t4 + t0;
+    t2 = t12 + t10;
+    t6 = t3 - t14;
+    t8 = t7 + t9;
+    t4 = t13 - t5;
+    t0 = t7 - t9;
+    t7 = t13 + t5;
+    t9 = t12 - t10;
+    t13 = t3 + t14;
+    re[70] = t1;
+    im[70] = t11;
+    re[88] = t2;
+    im[88] = t6;
+    re[16] = t8;
+    im[16] = t4;
+    re[34] = t0;
+    im[34] = t7;
+    re[52] = t9;
+    im[52] = t13;
+    t5 = re[20];
+    t12 = im[20];
+    t10 = re[38];
+    t3 = im[38];
+    t14 = re[56];
+    t1 = im[56];
+    t11 = re[74];
+    t2 = im[74];
+    t6 = re[2];
+    t8 = im[2];
+    t4 = t10 + t6;
+    t0 = t3 + t8;
+    t7 = t14 + t11;
+    t9 = t1 + t2;
+    t13 = t10 - t6;
+    t10 = t3 - t8;
+    t6 = t14 - t11;
+    t3 = t1 - t2;
+    t8 = t4 + t7;
+    t14 = t0 + t9;
+    t11 = t4 - t7;
+    t1 = C52 * t11;
+    t2 = t0 - t9;
+    t4 = C52 * t2;
+    t7 = C53 * t8;
+    t11 = t5 - t7;
+    t0 = C53 * t14;
+    t9 = t12 - t0;
+    t2 = t11 + t1;
+    t7 = t9 + t4;
+    t0 = t11 - t1;
+    t11 = t9 - t4;
+    t1 = C16 * t13;
+    t9 = C35 * t6;
+    t4 = t1 + t9;
+    t1 = C16 * t10;
+    t9 = C35 * t3;
+    t1 = t1 + t9;
+    t9 = C35 * t13;
+    t13 = C16 * t6;
+    t6 = t9 - t13;
+    t9 = C35 * t10;
+    t13 = C16 * t3;
+    t10 = t9 - t13;
+    t3 = t5 + t8;
+    t9 = t12 + t14;
+    t13 = t2 + t1;
+    t5 = t7 - t4;
+    t8 = t0 + t10;
+    t12 = t11 - t6;
+    t14 = t0 - t10;
+    t0 = t11 + t6;
+    t10 = t2 - t1;
+    t11 = t7 + t4;
+    re[20] = t3;
+    im[20] = t9;
+    re[38] = t13;
+    im[38] = t5;
+    re[56] = t8;
+    im[56] = t12;
+    re[74] = t14;
+    im[74] = t0;
+    re[2] = t10;
+    im[2] = t11;
+    t6 = re[50];
+    t2 = im[50];
+    t1 = re[68];
+    t7 = im[68];
+    t4 = re[86];
+    t3 = im[86];
+    t9 = re[14];
+    t13 = im[14];
+    t5 = re[32];
+    t8 = im[32];
+    t12 = t1 + t5;
+    t14 = t7 + t8;
+    t0 = t4 + t9;
+    t10 = t3 + t13;
+    t11 = t1 - t5;
+    t1 = t7 - t8;
+    t5 = t4 - t9;
+    t7 = t3 - t13;
+    t8 = t12 + t0;
+    t4 = t14 + t10;
+    t9 = t12 - t0;
+    t3 = C52 * t9;
+    t13 = t14 - t10;
+    t12 = C52 * t13;
+    t0 = C53 * t8;
+    t9 = t6 - t0;
+    t14 = C53 * t4;
+    t10 = t2 - t14;
+    t13 = t9 + t3;
+    t0 = t10 + t12;
+    t14 = t9 - t3;
+    t9 = t10 - t12;
+    t3 = C16 * t11;
+    t10 = C35 * t5;
+    t12 = t3 + t10;
+    t3 = C16 * t1;
+    t10 = C35 * t7;
+    t3 = t3 + t10;
+    t10 = C35 * t11;
+    t11 = C16 * t5;
+    t5 = t10 - t11;
+    t10 = C35 * t1;
+    t11 = C16 * t7;
+    t1 = t10 - t11;
+    t7 = t6 + t8;
+    t10 = t2 + t4;
+    t11 = t13 + t3;
+    t6 = t0 - t12;
+    t8 = t14 + t1;
+    t2 = t9 - t5;
+    t4 = t14 - t1;
+    t14 = t9 + t5;
+    t1 = t13 - t3;
+    t9 = t0 + t12;
+    re[50] = t7;
+    im[50] = t10;
+    re[68] = t11;
+    im[68] = t6;
+    re[86] = t8;
+    im[86] = t2;
+    re[14] = t4;
+    im[14] = t14;
+    re[32] = t1;
+    im[32] = t9;
+    t5 = re[80];
+    t13 = im[80];
+    t3 = re[8];
+    t0 = im[8];
+    t12 = re[26];
+    t7 = im[26];
+    t10 = re[44];
+    t11 = im[44];
+    t6 = re[62];
+    t8 = im[62];
+    t2 = t3 + t6;
+    t4 = t0 + t8;
+    t14 = t12 + t10;
+    t1 = t7 + t11;
+    t9 = t3 - t6;
+    t3 = t0 - t8;
+    t6 = t12 - t10;
+    t0 = t7 - t11;
+    t8 = t2 + t14;
+    t12 = t4 + t1;
+    t10 = t2 - t14;
+    t7 = C52 * t10;
+    t11 = t4 - t1;
+    t2 = C52 * t11;
+    t14 = C53 * t8;
+    t10 = t5 - t14;
+    t4 = C53 * t12;
+    t1 = t13 - t4;
+    t11 = t10 + t7;
+    t14 = t1 + t2;
+    t4 = t10 - t7;
+    t10 = t1 - t2;
+    t7 = C16 * t9;
+    t1 = C35 * t6;
+    t2 = t7 + t1;
+    t7 = C16 * t3;
+    t1 = C35 * t0;
+    t7 = t7 + t1;
+    t1 = C35 * t9;
+    t9 = C16 * t6;
+    t6 = t1 - t9;
+    t1 = C35 * t3;
+    t9 = C16 * t0;
+    t3 = t1 - t9;
+    t0 = t5 + t8;
+    t1 = t13 + t12;
+    t9 = t11 + t7;
+    t5 = t14 - t2;
+    t8 = t4 + t3;
+    t13 = t10 - t6;
+    t12 = t4 - t3;
+    t4 = t10 + t6;
+    t3 = t11 - t7;
+    t10 = t14 + t2;
+    re[80] = t0;
+    im[80] = t1;
+    re[8] = t9;
+    im[8] = t5;
+    re[26] = t8;
+    im[26] = t13;
+    re[44] = t12;
+    im[44] = t4;
+    re[62] = t3;
+    im[62] = t10;
+}
+
+/**
+ *  Part 2 of ApplyWindowedIMDCT_W75_180_K120().
+ * 
+ *  @param {Number[]} X 
+ *    - The input block (180 points, only the first 120 points are used).
+ *  @param {Number[]} y 
+ *    - The array that would contain the output block (360 points).
+ *  @param {Number[]} re 
+ *    - The scratch buffer (real part, 90 points).
+ *  @param {Number[]} im 
+ *    - The scratch buffer (imaginary part, 90 points).
+ */
+function ApplyWindowedIMDCT_W75_180_K120_Part2(X, y, re, im) {
+    let t0, t1, t10, t11, t12, t13, t14, t2, t3, t4, t5, t6, t7, t8, t9;
+    const C0 = 0.7071067811865476;
+    const C1 = 0.7071067811865475;
+    const C2 = 0.9659258262890683;
+    const C3 = 0.25881904510252074;
+    const C4 = 0.5;
+    const C5 = 0.8660254037844386;
+    const C6 = 0.573576436351046;
+    const C7 = 0.8191520442889918;
+    const C8 = 0.9961946980917455;
+    const C9 = 0.08715574274765817;
+    const C10 = 0.9063077870366499;
+    const C11 = 0.42261826174069944;
+    const C12 = 0.766044443118978;
+    const C13 = 1.4088320528055172;
+    const C14 = 0.12325683343243876;
+    const C15 = 0.17364817766693033;
+    const C16 = 1.1584559306791384;
+    const C17 = 0.8111595753452777;
+    const C18 = 0.9396926207859084;
+    const C19 = 0.5976724774602398;
+    const C20 = 1.281712764111577;
+    const C21 = 0.8910065241883679;
+    const C22 = 0.45399049973954675;
+    const C23 = 0.9986295347545738;
+    const C24 = 0.05233595624294383;
+    const C25 = 0.838670567945424;
+    const C26 = 0.544639035015027;
+    const C27 = 0.9563047559630355;
+    const C28 = 0.2923717047227367;
+    const C29 = 0.9743700647852352;
+    const C30 = 0.22495105434386498;
+    const C31 = 0.7313537016191705;
+    const C32 = 0.6819983600624985;
+    const C33 = 0.992546151641322;
+    const C34 = 0.12186934340514748;
+    const C35 = 0.9205048534524404;
+    const C36 = 0.3907311284892737;
+    const C37 = 0.6018150231520483;
+    const C38 = 0.7986355100472928;
+    const C39 = 0.9876883405951378;
+    const C40 = 0.15643446504023087;
+    const C41 = 0.9335804264972017;
+    const C42 = 0.35836794954530027;
+    const C43 = 0.6293203910498375;
+    const C44 = 0.7771459614569709;
+    const C45 = 0.9998476951563913;
+    const C46 = 0.01745240643728351;
+    const C47 = 0.8571673007021123;
+    const C48 = 0.5150380749100542;
+    const C49 = 0.8746197071393957;
+    const C50 = 0.48480962024633706;
+    const C51 = 0.981627183447664;
+    const C52 = 0.1908089953765448;
+    const C53 = 0.754709580222772;
+    const C54 = 0.6560590289905073;
+    const C55 = 0.9455185755993168;
+    const C56 = 0.3255681544571567;
+    const C57 = 0.5590169943749475;
+    const C58 = 0.25;
+    const C59 = 0.9510565162951535;
+    const C60 = 0.5877852522924731;
+    const C61 = 0.9999904807207345;
+    const C62 = 0.004363309284746571;
+    const C63 = 0.7040147244559684;
+    const C64 = 0.7101853756232854;
+    const C65 = 0.6915130557822694;
+    const C66 = 0.7223639620597556;
+    const C67 = 0.9997620270799091;
+    const C68 = 0.02181488503456112;
+    const C69 = 0.9992290362407229;
+    const C70 = 0.03925981575906861;
+    const C71 = 0.6788007455329417;
+    const C72 = 0.7343225094356856;
+    const C73 = 0.6658816660008342;
+    const C74 = 0.7460573750616996;
+    const C75 = 0.9983916705573488;
+    const C76 = 0.056692787563377506;
+    const C77 = 0.9972501850994857;
+    const C78 = 0.07410849019539922;
+    const C79 = 0.6527597524627224;
+    const C80 = 0.7575649843840496;
+    const C81 = 0.6394390019805847;
+    const C82 = 0.7688418320734596;
+    const C83 = 0.9958049275746618;
+    const C84 = 0.09150161866340238;
+    const C85 = 0.9940563382223196;
+    const C86 = 0.10886687485196457;
+    const C87 = 0.6259234721840591;
+    const C88 = 0.7798844830928818;
+    const C89 = 0.6122172800344493;
+    const C90 = 0.7906895737438434;
+    const C91 = 0.992004949679715;
+    const C92 = 0.12619896913582976;
+    const C93 = 0.9896513868196702;
+    const C94 = 0.1434926219911793;
+    const C95 = 0.598324600570659;
+    const C96 = 0.8012538126910607;
+    t6 = X[90];
+    t11 = X[89];
+    t7 = C0 * t6;
+    t14 = C1 * t11;
+    t2 = t7 + t14;
+    t0 = (-C1) * t6;
+    t1 = C0 * t11;
+    t9 = t0 + t1;
+    t5 = X[29];
+    t8 = C2 * t5;
+    t13 = C3 * t5;
+    t12 = X[30];
+    t4 = C2 * t12;
+    t3 = (-C3) * t12;
+    t10 = t8 + t4;
+    t7 = t13 + t3;
+    t14 = C4 * t10;
+    t6 = t2 - t14;
+    t11 = C4 * t7;
+    t0 = t9 - t11;
+    t1 = t8 - t4;
+    t5 = C5 * t1;
+    t12 = t13 - t3;
+    t14 = C5 * t12;
+    t11 = t2 + t10;
+    t8 = t9 + t7;
+    t4 = t6 + t14;
+    t1 = t0 - t5;
+    t13 = t6 - t14;
+    t3 = t0 + t5;
+    re[45] = t11;
+    im[45] = t8;
+    re[75] = t4;
+    im[75] = t1;
+    re[15] = t13;
+    im[15] = t3;
+    t12 = X[110];
+    t2 = X[69];
+    t10 = C6 * t12;
+    t9 = C7 * t2;
+    t7 = t10 + t9;
+    t6 = (-C7) * t12;
+    t14 = C6 * t2;
+    t0 = t6 + t14;
+    t5 = X[9];
+    t11 = C8 * t5;
+    t8 = C9 * t5;
+    t4 = X[50];
+    t1 = C10 * t4;
+    t13 = (-C11) * t4;
+    t3 = t11 + t1;
+    t10 = t8 + t13;
+    t9 = C4 * t3;
+    t12 = t7 - t9;
+    t2 = C4 * t10;
+    t6 = t0 - t2;
+    t14 = t11 - t1;
+    t5 = C5 * t14;
+    t4 = t8 - t13;
+    t9 = C5 * t4;
+    t2 = t7 + t3;
+    t11 = t0 + t10;
+    t1 = t12 + t9;
+    t14 = t6 - t5;
+    t8 = t12 - t9;
+    t13 = t6 + t5;
+    t4 = t1 + t14;
+    t7 = C12 * t4;
+    t3 = t1 * (-C13);
+    t0 = t14 * C14;
+    t10 = t7 - t0;
+    t12 = t7 + t3;
+    t9 = t8 + t13;
+    t6 = C15 * t9;
+    t5 = t8 * (-C16);
+    t4 = t13 * (-C17);
+    t1 = t6 - t4;
+    t14 = t6 + t5;
+    re[55] = t2;
+    im[55] = t11;
+    re[85] = t10;
+    im[85] = t12;
+    re[25] = t1;
+    im[25] = t14;
+    t0 = X[49];
+    t7 = C10 * t0;
+    t3 = C11 * t0;
+    t9 = X[10];
+    t8 = C8 * t9;
+    t13 = (-C9) * t9;
+    t4 = X[70];
+    t6 = X[109];
+    t5 = C7 * t4;
+    t2 = C6 * t6;
+    t11 = t5 + t2;
+    t10 = (-C6) * t4;
+    t12 = C7 * t6;
+    t1 = t10 + t12;
+    t14 = t8 + t11;
+    t0 = t13 + t1;
+    t9 = C4 * t14;
+    t5 = t7 - t9;
+    t2 = C4 * t0;
+    t4 = t3 - t2;
+    t6 = t8 - t11;
+    t10 = C5 * t6;
+    t12 = t13 - t1;
+    t9 = C5 * t12;
+    t2 = t7 + t14;
+    t8 = t3 + t0;
+    t11 = t5 + t9;
+    t6 = t4 - t10;
+    t13 = t5 - t9;
+    t1 = t4 + t10;
+    t12 = t11 + t6;
+    t7 = C15 * t12;
+    t14 = t11 * (-C16);
+    t3 = t6 * (-C17);
+    t0 = t7 - t3;
+    t5 = t7 + t14;
+    t9 = t13 + t1;
+    t4 = (-C18) * t9;
+    t10 = t13 * C19;
+    t12 = t1 * (-C20);
+    t11 = t4 - t12;
+    t6 = t4 + t10;
+    re[65] = t2;
+    im[65] = t8;
+    re[5] = t0;
+    im[5] = t5;
+    re[35] = t11;
+    im[35] = t6;
+    t3 = re[45];
+    t7 = im[45];
+    t14 = re[55];
+    t9 = im[55];
+    t13 = re[65];
+    t1 = im[65];
+    t12 = t14 + t13;
+    t4 = t9 + t1;
+    t10 = C4 * t12;
+    t2 = t3 - t10;
+    t8 = C4 * t4;
+    t0 = t7 - t8;
+    t5 = t14 - t13;
+    t11 = C5 * t5;
+    t6 = t9 - t1;
+    t10 = C5 * t6;
+    t8 = t3 + t12;
+    t14 = t7 + t4;
+    t13 = t2 + t10;
+    t5 = t0 - t11;
+    t9 = t2 - t10;
+    t1 = t0 + t11;
+    re[45] = t8;
+    im[45] = t14;
+    re[55] = t13;
+    im[55] = t5;
+    re[65] = t9;
+    im[65] = t1;
+    t6 = re[75];
+    t3 = im[75];
+    t12 = re[85];
+    t7 = im[85];
+    t4 = re[5];
+    t2 = im[5];
+    t10 = t12 + t4;
+    t0 = t7 + t2;
+    t11 = C4 * t10;
+    t8 = t6 - t11;
+    t14 = C4 * t0;
+    t13 = t3 - t14;
+    t5 = t12 - t4;
+    t9 = C5 * t5;
+    t1 = t7 - t2;
+    t11 = C5 * t1;
+    t14 = t6 + t10;
+    t12 = t3 + t0;
+    t4 = t8 + t11;
+    t5 = t13 - t9;
+    t7 = t8 - t11;
+    t2 = t13 + t9;
+    re[75] = t14;
+    im[75] = t12;
+    re[85] = t4;
+    im[85] = t5;
+    re[5] = t7;
+    im[5] = t2;
+    t1 = re[15];
+    t6 = im[15];
+    t10 = re[25];
+    t3 = im[25];
+    t0 = re[35];
+    t8 = im[35];
+    t11 = t10 + t0;
+    t13 = t3 + t8;
+    t9 = C4 * t11;
+    t14 = t1 - t9;
+    t12 = C4 * t13;
+    t4 = t6 - t12;
+    t5 = t10 - t0;
+    t7 = C5 * t5;
+    t2 = t3 - t8;
+    t9 = C5 * t2;
+    t12 = t1 + t11;
+    t10 = t6 + t13;
+    t0 = t14 + t9;
+    t5 = t4 - t7;
+    t3 = t14 - t9;
+    t8 = t4 + t7;
+    re[15] = t12;
+    im[15] = t10;
+    re[25] = t0;
+    im[25] = t5;
+    re[35] = t3;
+    im[35] = t8;
+    t2 = X[53];
+    t1 = C21 * t2;
+    t11 = C22 * t2;
+    t6 = X[6];
+    t13 = C23 * t6;
+    t14 = (-C24) * t6;
+    t9 = X[66];
+    t4 = X[113];
+    t7 = C25 * t9;
+    t12 = C26 * t4;
+    t10 = t7 + t12;
+    t0 = (-C26) * t9;
+    t5 = C25 * t4;
+    t3 = t0 + t5;
+    t8 = t13 + t10;
+    t2 = t14 + t3;
+    t6 = C4 * t8;
+    t7 = t1 - t6;
+    t12 = C4 * t2;
+    t9 = t11 - t12;
+    t4 = t13 - t10;
+    t0 = C5 * t4;
+    t5 = t14 - t3;
+    t6 = C5 * t5;
+    t12 = t1 + t8;
+    t13 = t11 + t2;
+    t10 = t7 + t6;
+    t4 = t9 - t0;
+    t14 = t7 - t6;
+    t3 = t9 + t0;
+    re[63] = t12;
+    im[63] = t13;
+    re[3] = t10;
+    im[3] = t4;
+    re[33] = t14;
+    im[33] = t3;
+    t5 = X[33];
+    t1 = C27 * t5;
+    t8 = C28 * t5;
+    t11 = X[26];
+    t2 = C29 * t11;
+    t7 = (-C30) * t11;
+    t6 = X[86];
+    t9 = X[93];
+    t0 = C31 * t6;
+    t12 = C32 * t9;
+    t13 = t0 + t12;
+    t10 = (-C32) * t6;
+    t4 = C31 * t9;
+    t14 = t10 + t4;
+    t3 = t2 + t13;
+    t5 = t7 + t14;
+    t11 = C4 * t3;
+    t0 = t1 - t11;
+    t12 = C4 * t5;
+    t6 = t8 - t12;
+    t9 = t2 - t13;
+    t10 = C5 * t9;
+    t4 = t7 - t14;
+    t11 = C5 * t4;
+    t12 = t1 + t3;
+    t2 = t8 + t5;
+    t13 = t0 + t11;
+    t9 = t6 - t10;
+    t7 = t0 - t11;
+    t14 = t6 + t10;
+    t4 = t13 + t9;
+    t1 = C12 * t4;
+    t3 = t13 * (-C13);
+    t8 = t9 * C14;
+    t5 = t1 - t8;
+    t0 = t1 + t3;
+    t11 = t7 + t14;
+    t6 = C15 * t11;
+    t10 = t7 * (-C16);
+    t4 = t14 * (-C17);
+    t13 = t6 - t4;
+    t9 = t6 + t10;
+    re[73] = t12;
+    im[73] = t2;
+    re[13] = t5;
+    im[13] = t0;
+    re[43] = t13;
+    im[43] = t9;
+    t8 = X[13];
+    t1 = C33 * t8;
+    t3 = C34 * t8;
+    t11 = X[46];
+    t7 = C35 * t11;
+    t14 = (-C36) * t11;
+    t4 = X[106];
+    t6 = X[73];
+    t10 = C37 * t4;
+    t12 = C38 * t6;
+    t2 = t10 + t12;
+    t5 = (-C38) * t4;
+    t0 = C37 * t6;
+    t13 = t5 + t0;
+    t9 = t7 + t2;
+    t8 = t14 + t13;
+    t11 = C4 * t9;
+    t10 = t1 - t11;
+    t12 = C4 * t8;
+    t4 = t3 - t12;
+    t6 = t7 - t2;
+    t5 = C5 * t6;
+    t0 = t14 - t13;
+    t11 = C5 * t0;
+    t12 = t1 + t9;
+    t7 = t3 + t8;
+    t2 = t10 + t11;
+    t6 = t4 - t5;
+    t14 = t10 - t11;
+    t13 = t4 + t5;
+    t0 = t2 + t6;
+    t1 = C15 * t0;
+    t9 = t2 * (-C16);
+    t3 = t6 * (-C17);
+    t8 = t1 - t3;
+    t10 = t1 + t9;
+    t11 = t14 + t13;
+    t4 = (-C18) * t11;
+    t5 = t14 * C19;
+    t0 = t13 * (-C20);
+    t2 = t4 - t0;
+    t6 = t4 + t5;
+    re[83] = t12;
+    im[83] = t7;
+    re[23] = t8;
+    im[23] = t10;
+    re[53] = t2;
+    im[53] = t6;
+    t3 = re[63];
+    t1 = im[63];
+    t9 = re[73];
+    t11 = im[73];
+    t14 = re[83];
+    t13 = im[83];
+    t0 = t9 + t14;
+    t4 = t11 + t13;
+    t5 = C4 * t0;
+    t12 = t3 - t5;
+    t7 = C4 * t4;
+    t8 = t1 - t7;
+    t10 = t9 - t14;
+    t2 = C5 * t10;
+    t6 = t11 - t13;
+    t5 = C5 * t6;
+    t7 = t3 + t0;
+    t9 = t1 + t4;
+    t14 = t12 + t5;
+    t10 = t8 - t2;
+    t11 = t12 - t5;
+    t13 = t8 + t2;
+    re[63] = t7;
+    im[63] = t9;
+    re[73] = t14;
+    im[73] = t10;
+    re[83] = t11;
+    im[83] = t13;
+    t6 = re[3];
+    t3 = im[3];
+    t0 = re[13];
+    t1 = im[13];
+    t4 = re[23];
+    t12 = im[23];
+    t5 = t0 + t4;
+    t8 = t1 + t12;
+    t2 = C4 * t5;
+    t7 = t6 - t2;
+    t9 = C4 * t8;
+    t14 = t3 - t9;
+    t10 = t0 - t4;
+    t11 = C5 * t10;
+    t13 = t1 - t12;
+    t2 = C5 * t13;
+    t9 = t6 + t5;
+    t0 = t3 + t8;
+    t4 = t7 + t2;
+    t10 = t14 - t11;
+    t1 = t7 - t2;
+    t12 = t14 + t11;
+    re[3] = t9;
+    im[3] = t0;
+    re[13] = t4;
+    im[13] = t10;
+    re[23] = t1;
+    im[23] = t12;
+    t13 = re[33];
+    t6 = im[33];
+    t5 = re[43];
+    t3 = im[43];
+    t8 = re[53];
+    t7 = im[53];
+    t2 = t5 + t8;
+    t14 = t3 + t7;
+    t11 = C4 * t2;
+    t9 = t13 - t11;
+    t0 = C4 * t14;
+    t4 = t6 - t0;
+    t10 = t5 - t8;
+    t1 = C5 * t10;
+    t12 = t3 - t7;
+    t11 = C5 * t12;
+    t0 = t13 + t2;
+    t5 = t6 + t14;
+    t8 = t9 + t11;
+    t10 = t4 - t1;
+    t3 = t9 - t11;
+    t7 = t4 + t1;
+    re[33] = t0;
+    im[33] = t5;
+    re[43] = t8;
+    im[43] = t10;
+    re[53] = t3;
+    im[53] = t7;
+    t12 = X[17];
+    t13 = C39 * t12;
+    t2 = C40 * t12;
+    t6 = X[42];
+    t14 = C41 * t6;
+    t9 = (-C42) * t6;
+    t11 = X[102];
+    t4 = X[77];
+    t1 = C43 * t11;
+    t0 = C44 * t4;
+    t5 = t1 + t0;
+    t8 = (-C44) * t11;
+    t10 = C43 * t4;
+    t3 = t8 + t10;
+    t7 = t14 + t5;
+    t12 = t9 + t3;
+    t6 = C4 * t7;
+    t1 = t13 - t6;
+    t0 = C4 * t12;
+    t11 = t2 - t0;
+    t4 = t14 - t5;
+    t8 = C5 * t4;
+    t10 = t9 - t3;
+    t6 = C5 * t10;
+    t0 = t13 + t7;
+    t14 = t2 + t12;
+    t5 = t1 + t6;
+    t4 = t11 - t8;
+    t9 = t1 - t6;
+    t3 = t11 + t8;
+    re[81] = t0;
+    im[81] = t14;
+    re[21] = t5;
+    im[21] = t4;
+    re[51] = t9;
+    im[51] = t3;
+    t10 = X[2];
+    t13 = C45 * t10;
+    t7 = (-C46) * t10;
+    t2 = X[62];
+    t12 = X[117];
+    t1 = C47 * t2;
+    t6 = C48 * t12;
+    t11 = t1 + t6;
+    t8 = (-C48) * t2;
+    t0 = C47 * t12;
+    t14 = t8 + t0;
+    t5 = X[57];
+    t4 = C49 * t5;
+    t9 = C50 * t5;
+    t3 = t11 + t4;
+    t10 = t14 + t9;
+    t1 = C4 * t3;
+    t6 = t13 - t1;
+    t2 = C4 * t10;
+    t12 = t7 - t2;
+    t8 = t11 - t4;
+    t0 = C5 * t8;
+    t5 = t14 - t9;
+    t1 = C5 * t5;
+    t2 = t13 + t3;
+    t11 = t7 + t10;
+    t4 = t6 + t1;
+    t8 = t12 - t0;
+    t14 = t6 - t1;
+    t9 = t12 + t0;
+    t5 = t4 + t8;
+    t13 = C12 * t5;
+    t3 = t4 * (-C13);
+    t7 = t8 * C14;
+    t10 = t13 - t7;
+    t6 = t13 + t3;
+    t1 = t14 + t9;
+    t12 = C15 * t1;
+    t0 = t14 * (-C16);
+    t5 = t9 * (-C17);
+    t4 = t12 - t5;
+    t8 = t12 + t0;
+    re[1] = t2;
+    im[1] = t11;
+    re[31] = t10;
+    im[31] = t6;
+    re[61] = t4;
+    im[61] = t8;
+    t7 = X[22];
+    t13 = C51 * t7;
+    t3 = (-C52) * t7;
+    t1 = X[82];
+    t14 = X[97];
+    t9 = C53 * t1;
+    t5 = C54 * t14;
+    t12 = t9 + t5;
+    t0 = (-C54) * t1;
+    t2 = C53 * t14;
+    t11 = t0 + t2;
+    t10 = X[37];
+    t6 = C55 * t10;
+    t4 = C56 * t10;
+    t8 = t12 + t6;
+    t7 = t11 + t4;
+    t9 = C4 * t8;
+    t5 = t13 - t9;
+    t1 = C4 * t7;
+    t14 = t3 - t1;
+    t0 = t12 - t6;
+    t2 = C5 * t0;
+    t10 = t11 - t4;
+    t9 = C5 * t10;
+    t1 = t13 + t8;
+    t12 = t3 + t7;
+    t6 = t5 + t9;
+    t0 = t14 - t2;
+    t11 = t5 - t9;
+    t4 = t14 + t2;
+    t10 = t6 + t0;
+    t13 = C15 * t10;
+    t8 = t6 * (-C16);
+    t3 = t0 * (-C17);
+    t7 = t13 - t3;
+    t5 = t13 + t8;
+    t9 = t11 + t4;
+    t14 = (-C18) * t9;
+    t2 = t11 * C19;
+    t10 = t4 * (-C20);
+    t6 = t14 - t10;
+    t0 = t14 + t2;
+    re[11] = t1;
+    im[11] = t12;
+    re[41] = t7;
+    im[41] = t5;
+    re[71] = t6;
+    im[71] = t0;
+    t3 = re[81];
+    t13 = im[81];
+    t8 = re[1];
+    t9 = im[1];
+    t11 = re[11];
+    t4 = im[11];
+    t10 = t8 + t11;
+    t14 = t9 + t4;
+    t2 = C4 * t10;
+    t1 = t3 - t2;
+    t12 = C4 * t14;
+    t7 = t13 - t12;
+    t5 = t8 - t11;
+    t6 = C5 * t5;
+    t0 = t9 - t4;
+    t2 = C5 * t0;
+    t12 = t3 + t10;
+    t8 = t13 + t14;
+    t11 = t1 + t2;
+    t5 = t7 - t6;
+    t9 = t1 - t2;
+    t4 = t7 + t6;
+    re[81] = t12;
+    im[81] = t8;
+    re[1] = t11;
+    im[1] = t5;
+    re[11] = t9;
+    im[11] = t4;
+    t0 = re[21];
+    t3 = im[21];
+    t10 = re[31];
+    t13 = im[31];
+    t14 = re[41];
+    t1 = im[41];
+    t2 = t10 + t14;
+    t7 = t13 + t1;
+    t6 = C4 * t2;
+    t12 = t0 - t6;
+    t8 = C4 * t7;
+    t11 = t3 - t8;
+    t5 = t10 - t14;
+    t9 = C5 * t5;
+    t4 = t13 - t1;
+    t6 = C5 * t4;
+    t8 = t0 + t2;
+    t10 = t3 + t7;
+    t14 = t12 + t6;
+    t5 = t11 - t9;
+    t13 = t12 - t6;
+    t1 = t11 + t9;
+    re[21] = t8;
+    im[21] = t10;
+    re[31] = t14;
+    im[31] = t5;
+    re[41] = t13;
+    im[41] = t1;
+    t4 = re[51];
+    t0 = im[51];
+    t2 = re[61];
+    t3 = im[61];
+    t7 = re[71];
+    t12 = im[71];
+    t6 = t2 + t7;
+    t11 = t3 + t12;
+    t9 = C4 * t6;
+    t8 = t4 - t9;
+    t10 = C4 * t11;
+    t14 = t0 - t10;
+    t5 = t2 - t7;
+    t13 = C5 * t5;
+    t1 = t3 - t12;
+    t9 = C5 * t1;
+    t10 = t4 + t6;
+    t2 = t0 + t11;
+    t7 = t8 + t9;
+    t5 = t14 - t13;
+    t3 = t8 - t9;
+    t12 = t14 + t13;
+    re[51] = t10;
+    im[51] = t2;
+    re[61] = t7;
+    im[61] = t5;
+    re[71] = t3;
+    im[71] = t12;
+    t1 = X[18];
+    t4 = C39 * t1;
+    t6 = (-C40) * t1;
+    t0 = X[78];
+    t11 = X[101];
+    t8 = C44 * t0;
+    t9 = C43 * t11;
+    t14 = t8 + t9;
+    t13 = (-C43) * t0;
+    t10 = C44 * t11;
+    t2 = t13 + t10;
+    t7 = X[41];
+    t5 = C41 * t7;
+    t3 = C42 * t7;
+    t12 = t14 + t5;
+    t1 = t2 + t3;
+    t8 = C4 * t12;
+    t9 = t4 - t8;
+    t0 = C4 * t1;
+    t11 = t6 - t0;
+    t13 = t14 - t5;
+    t10 = C5 * t13;
+    t7 = t2 - t3;
+    t8 = C5 * t7;
+    t0 = t4 + t12;
+    t14 = t6 + t1;
+    t5 = t9 + t8;
+    t13 = t11 - t10;
+    t2 = t9 - t8;
+    t3 = t11 + t10;
+    re[9] = t0;
+    im[9] = t14;
+    re[39] = t5;
+    im[39] = t13;
+    re[69] = t2;
+    im[69] = t3;
+    t7 = X[38];
+    t4 = C55 * t7;
+    t12 = (-C56) * t7;
+    t6 = X[98];
+    t1 = X[81];
+    t9 = C54 * t6;
+    t8 = C53 * t1;
+    t11 = t9 + t8;
+    t10 = (-C53) * t6;
+    t0 = C54 * t1;
+    t14 = t10 + t0;
+    t5 = X[21];
+    t13 = C51 * t5;
+    t2 = C52 * t5;
+    t3 = t11 + t13;
+    t7 = t14 + t2;
+    t9 = C4 * t3;
+    t8 = t4 - t9;
+    t6 = C4 * t7;
+    t1 = t12 - t6;
+    t10 = t11 - t13;
+    t0 = C5 * t10;
+    t5 = t14 - t2;
+    t9 = C5 * t5;
+    t6 = t4 + t3;
+    t11 = t12 + t7;
+    t13 = t8 + t9;
+    t10 = t1 - t0;
+    t14 = t8 - t9;
+    t2 = t1 + t0;
+    t5 = t13 + t10;
+    t4 = C12 * t5;
+    t3 = t13 * (-C13);
+    t12 = t10 * C14;
+    t7 = t4 - t12;
+    t8 = t4 + t3;
+    t9 = t14 + t2;
+    t1 = C15 * t9;
+    t0 = t14 * (-C16);
+    t5 = t2 * (-C17);
+    t13 = t1 - t5;
+    t10 = t1 + t0;
+    re[19] = t6;
+    im[19] = t11;
+    re[49] = t7;
+    im[49] = t8;
+    re[79] = t13;
+    im[79] = t10;
+    t12 = X[58];
+    t4 = C49 * t12;
+    t3 = (-C50) * t12;
+    t9 = X[118];
+    t14 = X[61];
+    t2 = C48 * t9;
+    t5 = C47 * t14;
+    t1 = t2 + t5;
+    t0 = (-C47) * t9;
+    t6 = C48 * t14;
+    t11 = t0 + t6;
+    t7 = X[1];
+    t8 = C45 * t7;
+    t13 = C46 * t7;
+    t10 = t1 + t8;
+    t12 = t11 + t13;
+    t2 = C4 * t10;
+    t5 = t4 - t2;
+    t9 = C4 * t12;
+    t14 = t3 - t9;
+    t0 = t1 - t8;
+    t6 = C5 * t0;
+    t7 = t11 - t13;
+    t2 = C5 * t7;
+    t9 = t4 + t10;
+    t1 = t3 + t12;
+    t8 = t5 + t2;
+    t0 = t14 - t6;
+    t11 = t5 - t2;
+    t13 = t14 + t6;
+    t7 = t8 + t0;
+    t4 = C15 * t7;
+    t10 = t8 * (-C16);
+    t3 = t0 * (-C17);
+    t12 = t4 - t3;
+    t5 = t4 + t10;
+    t2 = t11 + t13;
+    t14 = (-C18) * t2;
+    t6 = t11 * C19;
+    t7 = t13 * (-C20);
+    t8 = t14 - t7;
+    t0 = t14 + t6;
+    re[29] = t9;
+    im[29] = t1;
+    re[59] = t12;
+    im[59] = t5;
+    re[89] = t8;
+    im[89] = t0;
+    t3 = re[9];
+    t4 = im[9];
+    t10 = re[19];
+    t2 = im[19];
+    t11 = re[29];
+    t13 = im[29];
+    t7 = t10 + t11;
+    t14 = t2 + t13;
+    t6 = C4 * t7;
+    t9 = t3 - t6;
+    t1 = C4 * t14;
+    t12 = t4 - t1;
+    t5 = t10 - t11;
+    t8 = C5 * t5;
+    t0 = t2 - t13;
+    t6 = C5 * t0;
+    t1 = t3 + t7;
+    t10 = t4 + t14;
+    t11 = t9 + t6;
+    t5 = t12 - t8;
+    t2 = t9 - t6;
+    t13 = t12 + t8;
+    re[9] = t1;
+    im[9] = t10;
+    re[19] = t11;
+    im[19] = t5;
+    re[29] = t2;
+    im[29] = t13;
+    t0 = re[39];
+    t3 = im[39];
+    t7 = re[49];
+    t4 = im[49];
+    t14 = re[59];
+    t9 = im[59];
+    t6 = t7 + t14;
+    t12 = t4 + t9;
+    t8 = C4 * t6;
+    t1 = t0 - t8;
+    t10 = C4 * t12;
+    t11 = t3 - t10;
+    t5 = t7 - t14;
+    t2 = C5 * t5;
+    t13 = t4 - t9;
+    t8 = C5 * t13;
+    t10 = t0 + t6;
+    t7 = t3 + t12;
+    t14 = t1 + t8;
+    t5 = t11 - t2;
+    t4 = t1 - t8;
+    t9 = t11 + t2;
+    re[39] = t10;
+    im[39] = t7;
+    re[49] = t14;
+    im[49] = t5;
+    re[59] = t4;
+    im[59] = t9;
+    t13 = re[69];
+    t0 = im[69];
+    t6 = re[79];
+    t3 = im[79];
+    t12 = re[89];
+    t1 = im[89];
+    t8 = t6 + t12;
+    t11 = t3 + t1;
+    t2 = C4 * t8;
+    t10 = t13 - t2;
+    t7 = C4 * t11;
+    t14 = t0 - t7;
+    t5 = t6 - t12;
+    t4 = C5 * t5;
+    t9 = t3 - t1;
+    t2 = C5 * t9;
+    t7 = t13 + t8;
+    t6 = t0 + t11;
+    t12 = t10 + t2;
+    t5 = t14 - t4;
+    t3 = t10 - t2;
+    t1 = t14 + t4;
+    re[69] = t7;
+    im[69] = t6;
+    re[79] = t12;
+    im[79] = t5;
+    re[89] = t3;
+    im[89] = t1;
+    t9 = X[54];
+    t13 = C21 * t9;
+    t8 = (-C22) * t9;
+    t0 = X[114];
+    t11 = X[65];
+    t10 = C26 * t0;
+    t2 = C25 * t11;
+    t14 = t10 + t2;
+    t4 = (-C25) * t0;
+    t7 = C26 * t11;
+    t6 = t4 + t7;
+    t12 = X[5];
+    t5 = C23 * t12;
+    t3 = C24 * t12;
+    t1 = t14 + t5;
+    t9 = t6 + t3;
+    t10 = C4 * t1;
+    t2 = t13 - t10;
+    t0 = C4 * t9;
+    t11 = t8 - t0;
+    t4 = t14 - t5;
+    t7 = C5 * t4;
+    t12 = t6 - t3;
+    t10 = C5 * t12;
+    t0 = t13 + t1;
+    t14 = t8 + t9;
+    t5 = t2 + t10;
+    t4 = t11 - t7;
+    t6 = t2 - t10;
+    t3 = t11 + t7;
+    re[27] = t0;
+    im[27] = t14;
+    re[57] = t5;
+    im[57] = t4;
+    re[87] = t6;
+    im[87] = t3;
+    t12 = X[74];
+    t13 = X[105];
+    t1 = C38 * t12;
+    t8 = C37 * t13;
+    t9 = t1 + t8;
+    t2 = (-C37) * t12;
+    t10 = C38 * t13;
+    t11 = t2 + t10;
+    t7 = X[45];
+    t0 = C35 * t7;
+    t14 = C36 * t7;
+    t5 = X[14];
+    t4 = C33 * t5;
+    t6 = (-C34) * t5;
+    t3 = t0 + t4;
+    t1 = t14 + t6;
+    t8 = C4 * t3;
+    t12 = t9 - t8;
+    t13 = C4 * t1;
+    t2 = t11 - t13;
+    t10 = t0 - t4;
+    t7 = C5 * t10;
+    t5 = t14 - t6;
+    t8 = C5 * t5;
+    t13 = t9 + t3;
+    t0 = t11 + t1;
+    t4 = t12 + t8;
+    t10 = t2 - t7;
+    t14 = t12 - t8;
+    t6 = t2 + t7;
+    t5 = t4 + t10;
+    t9 = C12 * t5;
+    t3 = t4 * (-C13);
+    t11 = t10 * C14;
+    t1 = t9 - t11;
+    t12 = t9 + t3;
+    t8 = t14 + t6;
+    t2 = C15 * t8;
+    t7 = t14 * (-C16);
+    t5 = t6 * (-C17);
+    t4 = t2 - t5;
+    t10 = t2 + t7;
+    re[37] = t13;
+    im[37] = t0;
+    re[67] = t1;
+    im[67] = t12;
+    re[7] = t4;
+    im[7] = t10;
+    t11 = X[94];
+    t9 = X[85];
+    t3 = C32 * t11;
+    t8 = C31 * t9;
+    t14 = t3 + t8;
+    t6 = (-C31) * t11;
+    t5 = C32 * t9;
+    t2 = t6 + t5;
+    t7 = X[25];
+    t13 = C29 * t7;
+    t0 = C30 * t7;
+    t1 = X[34];
+    t12 = C27 * t1;
+    t4 = (-C28) * t1;
+    t10 = t13 + t12;
+    t3 = t0 + t4;
+    t8 = C4 * t10;
+    t11 = t14 - t8;
+    t9 = C4 * t3;
+    t6 = t2 - t9;
+    t5 = t13 - t12;
+    t7 = C5 * t5;
+    t1 = t0 - t4;
+    t8 = C5 * t1;
+    t9 = t14 + t10;
+    t13 = t2 + t3;
+    t12 = t11 + t8;
+    t5 = t6 - t7;
+    t0 = t11 - t8;
+    t4 = t6 + t7;
+    t1 = t12 + t5;
+    t14 = C15 * t1;
+    t10 = t12 * (-C16);
+    t2 = t5 * (-C17);
+    t3 = t14 - t2;
+    t11 = t14 + t10;
+    t8 = t0 + t4;
+    t6 = (-C18) * t8;
+    t7 = t0 * C19;
+    t1 = t4 * (-C20);
+    t12 = t6 - t1;
+    t5 = t6 + t7;
+    re[47] = t9;
+    im[47] = t13;
+    re[77] = t3;
+    im[77] = t11;
+    re[17] = t12;
+    im[17] = t5;
+    t2 = re[27];
+    t14 = im[27];
+    t10 = re[37];
+    t8 = im[37];
+    t0 = re[47];
+    t4 = im[47];
+    t1 = t10 + t0;
+    t6 = t8 + t4;
+    t7 = C4 * t1;
+    t9 = t2 - t7;
+    t13 = C4 * t6;
+    t3 = t14 - t13;
+    t11 = t10 - t0;
+    t12 = C5 * t11;
+    t5 = t8 - t4;
+    t7 = C5 * t5;
+    t13 = t2 + t1;
+    t10 = t14 + t6;
+    t0 = t9 + t7;
+    t11 = t3 - t12;
+    t8 = t9 - t7;
+    t4 = t3 + t12;
+    re[27] = t13;
+    im[27] = t10;
+    re[37] = t0;
+    im[37] = t11;
+    re[47] = t8;
+    im[47] = t4;
+    t5 = re[57];
+    t2 = im[57];
+    t1 = re[67];
+    t14 = im[67];
+    t6 = re[77];
+    t9 = im[77];
+    t7 = t1 + t6;
+    t3 = t14 + t9;
+    t12 = C4 * t7;
+    t13 = t5 - t12;
+    t10 = C4 * t3;
+    t0 = t2 - t10;
+    t11 = t1 - t6;
+    t8 = C5 * t11;
+    t4 = t14 - t9;
+    t12 = C5 * t4;
+    t10 = t5 + t7;
+    t1 = t2 + t3;
+    t6 = t13 + t12;
+    t11 = t0 - t8;
+    t14 = t13 - t12;
+    t9 = t0 + t8;
+    re[57] = t10;
+    im[57] = t1;
+    re[67] = t6;
+    im[67] = t11;
+    re[77] = t14;
+    im[77] = t9;
+    t4 = re[87];
+    t5 = im[87];
+    t7 = re[7];
+    t2 = im[7];
+    t3 = re[17];
+    t13 = im[17];
+    t12 = t7 + t3;
+    t0 = t2 + t13;
+    t8 = C4 * t12;
+    t10 = t4 - t8;
+    t1 = C4 * t0;
+    t6 = t5 - t1;
+    t11 = t7 - t3;
+    t14 = C5 * t11;
+    t9 = t2 - t13;
+    t8 = C5 * t9;
+    t1 = t4 + t12;
+    t7 = t5 + t0;
+    t3 = t10 + t8;
+    t11 = t6 - t14;
+    t2 = t10 - t8;
+    t13 = t6 + t14;
+    re[87] = t1;
+    im[87] = t7;
+    re[7] = t3;
+    im[7] = t11;
+    re[17] = t2;
+    im[17] = t13;
+    t9 = re[45];
+    t4 = im[45];
+    t12 = re[63];
+    t5 = im[63];
+    t0 = re[81];
+    t10 = im[81];
+    t8 = re[9];
+    t6 = im[9];
+    t14 = re[27];
+    t1 = im[27];
+    t7 = t12 + t14;
+    t3 = t5 + t1;
+    t11 = t0 + t8;
+    t2 = t10 + t6;
+    t13 = t12 - t14;
+    t12 = t5 - t1;
+    t14 = t0 - t8;
+    t5 = t10 - t6;
+    t1 = t7 + t11;
+    t0 = t3 + t2;
+    t8 = t7 - t11;
+    t10 = C57 * t8;
+    t6 = t3 - t2;
+    t7 = C57 * t6;
+    t11 = C58 * t1;
+    t8 = t9 - t11;
+    t3 = C58 * t0;
+    t2 = t4 - t3;
+    t6 = t8 + t10;
+    t11 = t2 + t7;
+    t3 = t8 - t10;
+    t8 = t2 - t7;
+    t10 = C59 * t13;
+    t2 = C60 * t14;
+    t7 = t10 + t2;
+    t10 = C59 * t12;
+    t2 = C60 * t5;
+    t10 = t10 + t2;
+    t2 = C60 * t13;
+    t13 = C59 * t14;
+    t14 = t2 - t13;
+    t2 = C60 * t12;
+    t13 = C59 * t5;
+    t12 = t2 - t13;
+    t5 = t9 + t1;
+    t2 = t4 + t0;
+    t13 = t6 + t10;
+    t9 = t11 - t7;
+    t1 = t3 + t12;
+    t4 = t8 - t14;
+    t0 = t3 - t12;
+    t3 = t8 + t14;
+    t12 = t6 - t10;
+    t8 = t11 + t7;
+    re[45] = t5;
+    im[45] = t2;
+    re[63] = t13;
+    im[63] = t9;
+    re[81] = t1;
+    im[81] = t4;
+    re[9] = t0;
+    im[9] = t3;
+    re[27] = t12;
+    im[27] = t8;
+    t14 = re[75];
+    t6 = im[75];
+    t10 = re[3];
+    t11 = im[3];
+    t7 = re[21];
+    t5 = im[21];
+    t2 = re[39];
+    t13 = im[39];
+    t9 = re[57];
+    t1 = im[57];
+    t4 = t10 + t9;
+    t0 = t11 + t1;
+    t3 = t7 + t2;
+    t12 = t5 + t13;
+    t8 = t10 - t9;
+    t10 = t11 - t1;
+    t9 = t7 - t2;
+    t11 = t5 - t13;
+    t1 = t4 + t3;
+    t7 = t0 + t12;
+    t2 = t4 - t3;
+    t5 = C57 * t2;
+    t13 = t0 - t12;
+    t4 = C57 * t13;
+    t3 = C58 * t1;
+    t2 = t14 - t3;
+    t0 = C58 * t7;
+    t12 = t6 - t0;
+    t13 = t2 + t5;
+    t3 = t12 + t4;
+    t0 = t2 - t5;
+    t2 = t12 - t4;
+    t5 = C59 * t8;
+    t12 = C60 * t9;
+    t4 = t5 + t12;
+    t5 = C59 * t10;
+    t12 = C60 * t11;
+    t5 = t5 + t12;
+    t12 = C60 * t8;
+    t8 = C59 * t9;
+    t9 = t12 - t8;
+    t12 = C60 * t10;
+    t8 = C59 * t11;
+    t10 = t12 - t8;
+    t11 = t14 + t1;
+    t12 = t6 + t7;
+    t8 = t13 + t5;
+    t14 = t3 - t4;
+    t1 = t0 + t10;
+    t6 = t2 - t9;
+    t7 = t0 - t10;
+    t0 = t2 + t9;
+    t10 = t13 - t5;
+    t2 = t3 + t4;
+    re[75] = t11;
+    im[75] = t12;
+    re[3] = t8;
+    im[3] = t14;
+    re[21] = t1;
+    im[21] = t6;
+    re[39] = t7;
+    im[39] = t0;
+    re[57] = t10;
+    im[57] = t2;
+    t9 = re[15];
+    t13 = im[15];
+    t5 = re[33];
+    t3 = im[33];
+    t4 = re[51];
+    t11 = im[51];
+    t12 = re[69];
+    t8 = im[69];
+    t14 = re[87];
+    t1 = im[87];
+    t6 = t5 + t14;
+    t7 = t3 + t1;
+    t0 = t4 + t12;
+    t10 = t11 + t8;
+    t2 = t5 - t14;
+    t5 = t3 - t1;
+    t14 = t4 - t12;
+    t3 = t11 - t8;
+    t1 = t6 + t0;
+    t4 = t7 + t10;
+    t12 = t6 - t0;
+    t11 = C57 * t12;
+    t8 = t7 - t10;
+    t6 = C57 * t8;
+    t0 = C58 * t1;
+    t12 = t9 - t0;
+    t7 = C58 * t4;
+    t10 = t13 - t7;
+    t8 = t12 + t11;
+    t0 = t10 + t6;
+    t7 = t12 - t11;
+    t12 = t10 - t6;
+    t11 = C59 * t2;
+    t10 = C60 * t14;
+    t6 = t11 + t10;
+    t11 = C59 * t5;
+    t10 = C60 * t3;
+    t11 = t11 + t10;
+    t10 = C60 * t2;
+    t2 = C59 * t14;
+    t14 = t10 - t2;
+    t10 = C60 * t5;
+    t2 = C59 * t3;
+    t5 = t10 - t2;
+    t3 = t9 + t1;
+    t10 = t13 + t4;
+    t2 = t8 + t11;
+    t9 = t0 - t6;
+    t1 = t7 + t5;
+    t13 = t12 - t14;
+    t4 = t7 - t5;
+    t7 = t12 + t14;
+    t5 = t8 - t11;
+    t12 = t0 + t6;
+    re[15] = t3;
+    im[15] = t10;
+    re[33] = t2;
+    im[33] = t9;
+    re[51] = t1;
+    im[51] = t13;
+    re[69] = t4;
+    im[69] = t7;
+    re[87] = t5;
+    im[87] = t12;
+    t14 = re[55];
+    t8 = im[55];
+    t11 = re[73];
+    t0 = im[73];
+    t6 = re[1];
+    t3 = im[1];
+    t10 = re[19];
+    t2 = im[19];
+    t9 = re[37];
+    t1 = im[37];
+    t13 = t11 + t9;
+    t4 = t0 + t1;
+    t7 = t6 + t10;
+    t5 = t3 + t2;
+    t12 = t11 - t9;
+    t11 = t0 - t1;
+    t9 = t6 - t10;
+    t0 = t3 - t2;
+    t1 = t13 + t7;
+    t6 = t4 + t5;
+    t10 = t13 - t7;
+    t3 = C57 * t10;
+    t2 = t4 - t5;
+    t13 = C57 * t2;
+    t7 = C58 * t1;
+    t10 = t14 - t7;
+    t4 = C58 * t6;
+    t5 = t8 - t4;
+    t2 = t10 + t3;
+    t7 = t5 + t13;
+    t4 = t10 - t3;
+    t10 = t5 - t13;
+    t3 = C59 * t12;
+    t5 = C60 * t9;
+    t13 = t3 + t5;
+    t3 = C59 * t11;
+    t5 = C60 * t0;
+    t3 = t3 + t5;
+    t5 = C60 * t12;
+    t12 = C59 * t9;
+    t9 = t5 - t12;
+    t5 = C60 * t11;
+    t12 = C59 * t0;
+    t11 = t5 - t12;
+    t0 = t14 + t1;
+    t5 = t8 + t6;
+    t12 = t2 + t3;
+    t14 = t7 - t13;
+    t1 = t4 + t11;
+    t8 = t10 - t9;
+    t6 = t4 - t11;
+    t4 = t10 + t9;
+    t11 = t2 - t3;
+    t10 = t7 + t13;
+    re[55] = t0;
+    im[55] = t5;
+    re[73] = t12;
+    im[73] = t14;
+    re[1] = t1;
+    im[1] = t8;
+    re[19] = t6;
+    im[19] = t4;
+    re[37] = t11;
+    im[37] = t10;
+    t9 = re[85];
+    t2 = im[85];
+    t3 = re[13];
+    t7 = im[13];
+    t13 = re[31];
+    t0 = im[31];
+    t5 = re[49];
+    t12 = im[49];
+    t14 = re[67];
+    t1 = im[67];
+    t8 = t3 + t14;
+    t6 = t7 + t1;
+    t4 = t13 + t5;
+    t11 = t0 + t12;
+    t10 = t3 - t14;
+    t3 = t7 - t1;
+    t14 = t13 - t5;
+    t7 = t0 - t12;
+    t1 = t8 + t4;
+    t13 = t6 + t11;
+    t5 = t8 - t4;
+    t0 = C57 * t5;
+    t12 = t6 - t11;
+    t8 = C57 * t12;
+    t4 = C58 * t1;
+    t5 = t9 - t4;
+    t6 = C58 * t13;
+    t11 = t2 - t6;
+    t12 = t5 + t0;
+    t4 = t11 + t8;
+    t6 = t5 - t0;
+    t5 = t11 - t8;
+    t0 = C59 * t10;
+    t11 = C60 * t14;
+    t8 = t0 + t11;
+    t0 = C59 * t3;
+    t11 = C60 * t7;
+    t0 = t0 + t11;
+    t11 = C60 * t10;
+    t10 = C59 * t14;
+    t14 = t11 - t10;
+    t11 = C60 * t3;
+    t10 = C59 * t7;
+    t3 = t11 - t10;
+    t7 = t9 + t1;
+    t11 = t2 + t13;
+    t10 = t12 + t0;
+    t9 = t4 - t8;
+    t1 = t6 + t3;
+    t2 = t5 - t14;
+    t13 = t6 - t3;
+    t6 = t5 + t14;
+    t3 = t12 - t0;
+    t5 = t4 + t8;
+    re[85] = t7;
+    im[85] = t11;
+    re[13] = t10;
+    im[13] = t9;
+    re[31] = t1;
+    im[31] = t2;
+    re[49] = t13;
+    im[49] = t6;
+    re[67] = t3;
+    im[67] = t5;
+    t14 = re[25];
+    t12 = im[25];
+    t0 = re[43];
+    t4 = im[43];
+    t8 = re[61];
+    t7 = im[61];
+    t11 = re[79];
+    t10 = im[79];
+    t9 = re[7];
+    t1 = im[7];
+    t2 = t0 + t9;
+    t13 = t4 + t1;
+    t6 = t8 + t11;
+    t3 = t7 + t10;
+    t5 = t0 - t9;
+    t0 = t4 - t1;
+    t9 = t8 - t11;
+    t4 = t7 - t10;
+    t1 = t2 + t6;
+    t8 = t13 + t3;
+    t11 = t2 - t6;
+    t7 = C57 * t11;
+    t10 = t13 - t3;
+    t2 = C57 * t10;
+    t6 = C58 * t1;
+    t11 = t14 - t6;
+    t13 = C58 * t8;
+    t3 = t12 - t13;
+    t10 = t11 + t7;
+    t6 = t3 + t2;
+    t13 = t11 - t7;
+    t11 = t3 - t2;
+    t7 = C59 * t5;
+    t3 = C60 * t9;
+    t2 = t7 + t3;
+    t7 = C59 * t0;
+    t3 = C60 * t4;
+    t7 = t7 + t3;
+    t3 = C60 * t5;
+    t5 = C59 * t9;
+    t9 = t3 - t5;
+    t3 = C60 * t0;
+    t5 = C59 * t4;
+    t0 = t3 - t5;
+    t4 = t14 + t1;
+    t3 = t12 + t8;
+    t5 = t10 + t7;
+    t14 = t6 - t2;
+    t1 = t13 + t0;
+    t12 = t11 - t9;
+    t8 = t13 - t0;
+    t13 = t11 + t9;
+    t0 = t10 - t7;
+    t11 = t6 + t2;
+    re[25] = t4;
+    im[25] = t3;
+    re[43] = t5;
+    im[43] = t14;
+    re[61] = t1;
+    im[61] = t12;
+    re[79] = t8;
+    im[79] = t13;
+    re[7] = t0;
+    im[7] = t11;
+    t9 = re[65];
+    t10 = im[65];
+    t7 = re[83];
+    t6 = im[83];
+    t2 = re[11];
+    t4 = im[11];
+    t3 = re[29];
+    t5 = im[29];
+    t14 = re[47];
+    t1 = im[47];
+    t12 = t7 + t14;
+    t8 = t6 + t1;
+    t13 = t2 + t3;
+    t0 = t4 + t5;
+    t11 = t7 - t14;
+    t7 = t6 - t1;
+    t14 = t2 - t3;
+    t6 = t4 - t5;
+    t1 = t12 + t13;
+    t2 = t8 + t0;
+    t3 = t12 - t13;
+    t4 = C57 * t3;
+    t5 = t8 - t0;
+    t12 = C57 * t5;
+    t13 = C58 * t1;
+    t3 = t9 - t13;
+    t8 = C58 * t2;
+    t0 = t10 - t8;
+    t5 = t3 + t4;
+    t13 = t0 + t12;
+    t8 = t3 - t4;
+    t3 = t0 - t12;
+    t4 = C59 * t11;
+    t0 = C60 * t14;
+    t12 = t4 + t0;
+    t4 = C59 * t7;
+    t0 = C60 * t6;
+    t4 = t4 + t0;
+    t0 = C60 * t11;
+    t11 = C59 * t14;
+    t14 = t0 - t11;
+    t0 = C60 * t7;
+    t11 = C59 * t6;
+    t7 = t0 - t11;
+    t6 = t9 + t1;
+    t0 = t10 + t2;
+    t11 = t5 + t4;
+    t9 = t13 - t12;
+    t1 = t8 + t7;
+    t10 = t3 - t14;
+    t2 = t8 - t7;
+    t8 = t3 + t14;
+    t7 = t5 - t4;
+    t3 = t13 + t12;
+    re[65] = t6;
+    im[65] = t0;
+    re[83] = t11;
+    im[83] = t9;
+    re[11] = t1;
+    im[11] = t10;
+    re[29] = t2;
+    im[29] = t8;
+    re[47] = t7;
+    im[47] = t3;
+    t14 = re[5];
+    t5 = im[5];
+    t4 = re[23];
+    t13 = im[23];
+    t12 = re[41];
+    t6 = im[41];
+    t0 = re[59];
+    t11 = im[59];
+    t9 = re[77];
+    t1 = im[77];
+    t10 = t4 + t9;
+    t2 = t13 + t1;
+    t8 = t12 + t0;
+    t7 = t6 + t11;
+    t3 = t4 - t9;
+    t4 = t13 - t1;
+    t9 = t12 - t0;
+    t13 = t6 - t11;
+    t1 = t10 + t8;
+    t12 = t2 + t7;
+    t0 = t10 - t8;
+    t6 = C57 * t0;
+    t11 = t2 - t7;
+    t10 = C57 * t11;
+    t8 = C58 * t1;
+    t0 = t14 - t8;
+    t2 = C58 * t12;
+    t7 = t5 - t2;
+    t11 = t0 + t6;
+    t8 = t7 + t10;
+    t2 = t0 - t6;
+    t0 = t7 - t10;
+    t6 = C59 * t3;
+    t7 = C60 * t9;
+    t10 = t6 + t7;
+    t6 = C59 * t4;
+    t7 = C60 * t13;
+    t6 = t6 + t7;
+    t7 = C60 * t3;
+    t3 = C59 * t9;
+    t9 = t7 - t3;
+    t7 = C60 * t4;
+    t3 = C59 * t13;
+    t4 = t7 - t3;
+    t13 = t14 + t1;
+    t7 = t5 + t12;
+    t3 = t11 + t6;
+    t14 = t8 - t10;
+    t1 = t2 + t4;
+    t5 = t0 - t9;
+    t12 = t2 - t4;
+    t2 = t0 + t9;
+    t4 = t11 - t6;
+    t0 = t8 + t10;
+    re[5] = t13;
+    im[5] = t7;
+    re[23] = t3;
+    im[23] = t14;
+    re[41] = t1;
+    im[41] = t5;
+    re[59] = t12;
+    im[59] = t2;
+    re[77] = t4;
+    im[77] = t0;
+    t9 = re[35];
+    t11 = im[35];
+    t6 = re[53];
+    t8 = im[53];
+    t10 = re[71];
+    t13 = im[71];
+    t7 = re[89];
+    t3 = im[89];
+    t14 = re[17];
+    t1 = im[17];
+    t5 = t6 + t14;
+    t12 = t8 + t1;
+    t2 = t10 + t7;
+    t4 = t13 + t3;
+    t0 = t6 - t14;
+    t6 = t8 - t1;
+    t14 = t10 - t7;
+    t8 = t13 - t3;
+    t1 = t5 + t2;
+    t10 = t12 + t4;
+    t7 = t5 - t2;
+    t13 = C57 * t7;
+    t3 = t12 - t4;
+    t5 = C57 * t3;
+    t2 = C58 * t1;
+    t7 = t9 - t2;
+    t12 = C58 * t10;
+    t4 = t11 - t12;
+    t3 = t7 + t13;
+    t2 = t4 + t5;
+    t12 = t7 - t13;
+    t7 = t4 - t5;
+    t13 = C59 * t0;
+    t4 = C60 * t14;
+    t5 = t13 + t4;
+    t13 = C59 * t6;
+    t4 = C60 * t8;
+    t13 = t13 + t4;
+    t4 = C60 * t0;
+    t0 = C59 * t14;
+    t14 = t4 - t0;
+    t4 = C60 * t6;
+    t0 = C59 * t8;
+    t6 = t4 - t0;
+    t8 = t9 + t1;
+    t4 = t11 + t10;
+    t0 = t3 + t13;
+    t9 = t2 - t5;
+    t1 = t12 + t6;
+    t11 = t7 - t14;
+    t10 = t12 - t6;
+    t12 = t7 + t14;
+    t6 = t3 - t13;
+    t7 = t2 + t5;
+    re[35] = t8;
+    im[35] = t4;
+    re[53] = t0;
+    im[53] = t9;
+    re[71] = t1;
+    im[71] = t11;
+    re[89] = t10;
+    im[89] = t12;
+    re[17] = t6;
+    im[17] = t7;
+    t14 = re[0];
+    t3 = im[0];
+    t13 = re[45];
+    t2 = im[45];
+    t5 = t14 - t13;
+    t8 = t3 - t2;
+    t4 = t14 + t13;
+    t0 = t3 + t2;
+    t9 = (-C61) * t4;
+    t1 = (-C62) * t0;
+    t11 = t9 + t1;
+    t10 = 0.10283148949142575 * t11;
+    y[269] = t10;
+    t12 = 0.10195818372679734 * t11;
+    y[270] = t12;
+    t6 = C62 * t4;
+    t7 = (-C61) * t0;
+    t14 = t6 + t7;
+    t13 = 0.05341685744944068 * t14;
+    y[89] = t13;
+    t3 = (-0.05508843033578144) * t14;
+    y[90] = t3;
+    t2 = C63 * t5;
+    t9 = C64 * t8;
+    t1 = t2 + t9;
+    y[0] = 0;
+    t10 = (-0.10545185135140951) * t1;
+    y[179] = t10;
+    t11 = (-C64) * t5;
+    t12 = C63 * t8;
+    t4 = t11 + t12;
+    t0 = 0.10536667653263153 * t4;
+    y[180] = t0;
+    t6 = 0.00020774573354068366 * t4;
+    y[359] = t6;
+    t7 = re[48];
+    t13 = im[48];
+    t14 = re[3];
+    t3 = im[3];
+    t2 = t7 - t14;
+    t9 = t13 - t3;
+    t1 = t7 + t14;
+    t10 = t13 + t3;
+    t5 = C65 * t1;
+    t8 = C66 * t10;
+    t11 = t5 + t8;
+    y[2] = 0;
+    t12 = (-0.10562110222762526) * t11;
+    y[177] = t12;
+    t0 = (-C66) * t1;
+    t4 = C65 * t10;
+    t6 = t0 + t4;
+    t7 = 0.10519783335687435 * t6;
+    y[182] = t7;
+    t14 = 0.00043475807173410746 * t6;
+    y[357] = t14;
+    t13 = (-C67) * t2;
+    t3 = (-C68) * t9;
+    t5 = t13 + t3;
+    t8 = 0.10445761607662409 * t5;
+    y[267] = t8;
+    t11 = 0.10009323415744416 * t5;
+    y[272] = t11;
+    t12 = C68 * t2;
+    t1 = (-C67) * t9;
+    t10 = t12 + t1;
+    t0 = 0.050055274887662475 * t10;
+    y[87] = t0;
+    t4 = (-0.0584056671989319) * t10;
+    y[92] = t4;
+    t7 = re[6];
+    t6 = im[6];
+    t14 = re[51];
+    t13 = im[51];
+    t3 = t7 - t14;
+    t8 = t6 - t13;
+    t5 = t7 + t14;
+    t11 = t6 + t13;
+    t2 = (-C69) * t5;
+    t9 = (-C70) * t11;
+    t12 = t2 + t9;
+    t1 = 0.10592395115988588 * t12;
+    y[265] = t1;
+    t0 = 0.09807356363250865 * t12;
+    y[274] = t0;
+    t10 = C70 * t5;
+    t4 = (-C69) * t11;
+    t7 = t10 + t4;
+    t14 = 0.04668426482973558 * t7;
+    y[85] = t14;
+    t6 = (-0.06167272672669253) * t7;
+    y[94] = t6;
+    t13 = C71 * t3;
+    t2 = C72 * t8;
+    t9 = t13 + t2;
+    y[4] = 0;
+    t1 = (-0.10578594242587536) * t9;
+    y[175] = t1;
+    t12 = (-C72) * t3;
+    t0 = C71 * t8;
+    t5 = t12 + t0;
+    t11 = 0.10503390957543066 * t5;
+    y[184] = t11;
+    t10 = 0.0007563547636164294 * t5;
+    y[355] = t10;
+    t4 = re[64];
+    t14 = im[64];
+    t7 = re[19];
+    t6 = im[19];
+    t13 = t4 - t7;
+    t2 = t14 - t6;
+    t9 = t4 + t7;
+    t1 = t14 + t6;
+    t3 = C73 * t9;
+    t8 = C74 * t1;
+    t12 = t3 + t8;
+    y[6] = 0;
+    t0 = (-0.10594246825394384) * t12;
+    y[173] = t0;
+    t11 = (-C74) * t9;
+    t5 = C73 * t1;
+    t10 = t11 + t5;
+    t4 = 0.10487872610705846 * t10;
+    y[186] = t4;
+    t7 = 0.0011892177864014468 * t10;
+    y[353] = t7;
+    t14 = (-C75) * t13;
+    t6 = (-C76) * t2;
+    t3 = t14 + t6;
+    t8 = 0.10722697071612382 * t3;
+    y[263] = t8;
+    t12 = 0.09590169035311356 * t3;
+    y[276] = t12;
+    t0 = C76 * t13;
+    t9 = (-C75) * t2;
+    t1 = t0 + t9;
+    t11 = 0.043320144271118445 * t1;
+    y[83] = t11;
+    t5 = (-0.06487767026065987) * t1;
+    y[96] = t5;
+    t4 = re[22];
+    t10 = im[22];
+    t7 = re[67];
+    t14 = im[67];
+    t6 = t4 - t7;
+    t8 = t10 - t14;
+    t3 = t4 + t7;
+    t12 = t10 + t14;
+    t13 = (-C77) * t3;
+    t2 = (-C78) * t12;
+    t0 = t13 + t2;
+    t9 = 0.10836992079672758 * t0;
+    y[261] = t9;
+    t11 = 0.09358384301872717 * t0;
+    y[278] = t11;
+    t1 = C78 * t3;
+    t5 = (-C77) * t12;
+    t4 = t1 + t5;
+    t7 = 0.03998081633739134 * t4;
+    y[81] = t7;
+    t10 = (-0.06800367313228359) * t4;
+    y[98] = t10;
+    t14 = C79 * t6;
+    t13 = C80 * t8;
+    t2 = t14 + t13;
+    y[8] = 0;
+    t9 = (-0.10608679121443566) * t2;
+    y[171] = t9;
+    t0 = (-C80) * t6;
+    t11 = C79 * t8;
+    t3 = t0 + t11;
+    t12 = 0.10473604662669052 * t3;
+    y[188] = t12;
+    t1 = 0.0017455800739912659 * t3;
+    y[351] = t1;
+    t5 = re[70];
+    t7 = im[70];
+    t4 = re[25];
+    t10 = im[25];
+    t14 = t5 - t4;
+    t13 = t7 - t10;
+    t2 = t5 + t4;
+    t9 = t7 + t10;
+    t6 = C81 * t2;
+    t8 = C82 * t9;
+    t0 = t6 + t8;
+    y[10] = 0;
+    t11 = (-0.1062151252966577) * t0;
+    y[169] = t11;
+    t12 = (-C82) * t2;
+    t3 = C81 * t9;
+    t1 = t12 + t3;
+    t5 = 0.1046094996364962 * t1;
+    y[190] = t5;
+    t4 = 0.0024344642407252456 * t1;
+    y[349] = t4;
+    t7 = (-C83) * t14;
+    t10 = (-C84) * t13;
+    t6 = t7 + t10;
+    t8 = 0.1093520830501441 * t6;
+    y[259] = t8;
+    t0 = 0.09112774271407018 * t6;
+    y[280] = t0;
+    t11 = C84 * t14;
+    t2 = (-C83) * t13;
+    t9 = t11 + t2;
+    t12 = 0.036682878671273865 * t9;
+    y[79] = t12;
+    t3 = (-0.07103918795933337) * t9;
+    y[100] = t3;
+    t5 = re[38];
+    t1 = im[38];
+    t4 = re[83];
+    t7 = im[83];
+    t10 = t5 - t4;
+    t8 = t1 - t7;
+    t6 = t5 + t4;
+    t0 = t1 + t7;
+    t14 = (-C85) * t6;
+    t13 = (-C86) * t0;
+    t11 = t14 + t13;
+    t2 = 0.11017716427377129 * t11;
+    y[257] = t2;
+    t12 = 0.08853875428394885 * t11;
+    y[282] = t12;
+    t9 = C86 * t6;
+    t3 = (-C85) * t0;
+    t5 = t9 + t3;
+    t4 = 0.03344503750981467 * t5;
+    y[77] = t4;
+    t1 = (-0.07397112828898918) * t5;
+    y[102] = t1;
+    t7 = C87 * t10;
+    t14 = C88 * t8;
+    t13 = t7 + t14;
+    y[12] = 0;
+    t2 = (-0.10632360319216981) * t13;
+    y[167] = t2;
+    t11 = (-C88) * t10;
+    t12 = C87 * t8;
+    t6 = t11 + t12;
+    t0 = 0.10450277057511706 * t6;
+    y[192] = t0;
+    t9 = 0.003263813755121946 * t6;
+    y[347] = t9;
+    t3 = re[86];
+    t4 = im[86];
+    t5 = re[41];
+    t1 = im[41];
+    t7 = t3 - t5;
+    t14 = t4 - t1;
+    t13 = t3 + t5;
+    t2 = t4 + t1;
+    t10 = C89 * t13;
+    t8 = C90 * t2;
+    t11 = t10 + t8;
+    y[14] = 0;
+    t12 = (-0.1064084464218436) * t11;
+    y[165] = t12;
+    t0 = (-C90) * t13;
+    t6 = C89 * t2;
+    t9 = t0 + t6;
+    t3 = 0.10441944680840871 * t9;
+    y[194] = t3;
+    t5 = 0.004236562517080274 * t9;
+    y[345] = t5;
+    t4 = (-C91) * t7;
+    t1 = (-C92) * t14;
+    t10 = t4 + t1;
+    t8 = 0.11084873077916041 * t10;
+    y[255] = t8;
+    t11 = 0.08582541591976457 * t10;
+    y[284] = t11;
+    t12 = C92 * t7;
+    t13 = (-C91) * t14;
+    t2 = t12 + t13;
+    t0 = 0.030285070177357855 * t2;
+    y[75] = t0;
+    t6 = (-0.07678827089087746) * t2;
+    y[104] = t6;
+    t3 = re[44];
+    t9 = im[44];
+    t5 = re[89];
+    t4 = im[89];
+    t1 = t3 - t5;
+    t8 = t9 - t4;
+    t10 = t3 + t5;
+    t11 = t9 + t4;
+    t7 = (-C93) * t10;
+    t14 = (-C94) * t11;
+    t12 = t7 + t14;
+    t13 = 0.11137139713523048 * t12;
+    y[253] = t13;
+    t0 = 0.0829960016863824 * t12;
+    y[286] = t0;
+    t2 = C94 * t10;
+    t6 = (-C93) * t11;
+    t3 = t2 + t6;
+    t5 = 0.027219561165582794 * t3;
+    y[73] = t5;
+    t9 = (-0.07948177534274314) * t3;
+    y[106] = t9;
+    t4 = C95 * t1;
+    t7 = C96 * t8;
+    t14 = t4 + t7;
+    y[16] = 0;
+    t13 = (-0.1064659582961119) * t14;
+    y[163] = t13;
+    t12 = (-C96) * t1;
+    t0 = C95 * t8;
+    t10 = t12 + t0;
+    t11 = 0.10436304043972418 * t10;
+    y[196] = t11;
+    t2 = 0.005357839698617217 * t10;
+    y[343] = t2;
+}
+
+/**
+ *  Part 3 of ApplyWindowedIMDCT_W75_180_K120().
+ * 
+ *  @param {Number[]} X 
+ *    - The input block (180 points, only the first 120 points are used).
+ *  @param {Number[]} y 
+ *    - The array that would contain the output block (360 points).
+ *  @param {Number[]} re 
+ *    - The scratch buffer (real part, 90 points).
+ *  @param {Number[]} im 
+ *    - The scratch buffer (imaginary part, 90 points).
+ */
+function ApplyWindowedIMDCT_W75_180_K120_Part3(X, y, re, im) {
+    let t0, t1, t10, t11, t12, t13, t14, t2, t3, t4, t5, t6, t7, t8, t9;
+    const C0 = 0.5842496656374344;
+    const C1 = 0.8115739819650123;
+    const C2 = 0.9869963665602319;
+    const C3 = 0.1607425656038261;
+    const C4 = 0.9840406976462909;
+    const C5 = 0.17794354547384175;
+    const C6 = 0.569996762596303;
+    const C7 = 0.8216469379421637;
+    const C8 = 0.5555702330196022;
+    const C9 = 0.8314696123025452;
+    const C10 = 0.9807852804032304;
+    const C11 = 0.19509032201612825;
+    const C12 = 0.9772311064626789;
+    const C13 = 0.21217767215644623;
+    const C14 = 0.5409744713679939;
+    const C15 = 0.8410390129643925;
+    const C16 = 0.5262139236518696;
+    const C17 = 0.8503522249955628;
+    const C18 = 0.9733792584604485;
+    const C19 = 0.22920039092241415;
+    const C20 = 0.9692309097067544;
+    const C21 = 0.24615329302899303;
+    const C22 = 0.5112930860770522;
+    const C23 = 0.8594064115014527;
+    const C24 = 0.4962165036752082;
+    const C25 = 0.8681988144891423;
+    const C26 = 0.964787323828813;
+    const C27 = 0.2630312144579748;
+    const C28 = 0.9600498543859287;
+    const C29 = 0.2798290140309921;
+    const C30 = 0.48098876891938763;
+    const C31 = 0.8767267557075077;
+    const C32 = 0.4656145203251114;
+    const C33 = 0.8849876374630419;
+    const C34 = 0.9550199444571866;
+    const C35 = 0.296541574975571;
+    const C36 = 0.949699126201877;
+    const C37 = 0.31316380648374953;
+    const C38 = 0.45009844103743496;
+    const C39 = 0.892978943411137;
+    const C40 = 0.43444525740441703;
+    const C41 = 0.9006982393225879;
+    const C42 = 0.9440890203927842;
+    const C43 = 0.32969064526278724;
+    const C44 = 0.9381913359224842;
+    const C45 = 0.34611705707749296;
+    const C46 = 0.41865973753742813;
+    const C47 = 0.9081431738250813;
+    const C48 = 0.40274668985873724;
+    const C49 = 0.9153114791194471;
+    const C50 = 0.9320078692827986;
+    const C51 = 0.3624380382837016;
+    const C52 = 0.9255405040175664;
+    const C53 = 0.37864861735243294;
+    const C54 = 0.3867109616368206;
+    const C55 = 0.9222009716704518;
+    const C56 = 0.3705574375098362;
+    const C57 = 0.9288095528719242;
+    const C58 = 0.9187912101488983;
+    const C59 = 0.39474385638426723;
+    const C60 = 0.9117620435770886;
+    const C61 = 0.41071885261347724;
+    const C62 = 0.35429103799771583;
+    const C63 = 0.9351352096860117;
+    const C64 = 0.33791671800332695;
+    const C65 = 0.9411760152563706;
+    const C66 = 0.904455145454368;
+    const C67 = 0.4265687399014583;
+    const C68 = 0.8968727415326883;
+    const C69 = 0.4422886902190013;
+    const C70 = 0.3214394653031616;
+    const C71 = 0.9469301294951057;
+    const C72 = 0.30486429902801077;
+    const C73 = 0.9523957996432784;
+    const C74 = 0.8890171414857364;
+    const C75 = 0.4578739151169567;
+    const C76 = 0.8808907382053855;
+    const C77 = 0.47331966718484336;
+    const C78 = 0.28819626813408933;
+    const C79 = 0.9575713608048144;
+    const C80 = 0.27144044986507426;
+    const C81 = 0.9624552364536473;
+    const C82 = 0.8724960070727972;
+    const C83 = 0.4886212414969549;
+    const C84 = 0.8638355052043957;
+    const C85 = 0.5037739770455263;
+    const C86 = 0.25460194820552756;
+    const C87 = 0.9670459389139432;
+    const C88 = 0.2376858923261731;
+    const C89 = 0.9713420698132614;
+    const C90 = 0.8549118706729466;
+    const C91 = 0.5187732581605213;
+    const C92 = 0.8457278217039733;
+    const C93 = 0.5336145159156115;
+    const C94 = 0.22069743502150108;
+    const C95 = 0.9753423205085127;
+    const C96 = 0.2036417511401775;
+    const C97 = 0.9790454724845838;
+    const C98 = 0.8362861558477596;
+    const C99 = 0.5482932295199138;
+    const C100 = 0.8265897491271886;
+    const C101 = 0.5628049276950685;
+    const C102 = 0.18652403600873463;
+    const C103 = 0.9824503977255097;
+    const C104 = 0.1693495038490246;
+    const C105 = 0.9855560590580777;
+    const C106 = 0.8166415551616789;
+    const C107 = 0.5771451900372336;
+    const C108 = 0.8064446042674825;
+    const C109 = 0.5913096483635824;
+    const C110 = 0.1521233861899167;
+    const C111 = 0.9883615104677607;
+    const C112 = 0.134850930273723;
+    const C113 = 0.9908658973868822;
+    const C114 = 0.796002002534622;
+    const C115 = 0.6052939880428944;
+    const C116 = 0.785316930880745;
+    const C117 = 0.619093949309834;
+    const C118 = 0.11753739745783764;
+    const C119 = 0.9930684569549263;
+    const C120 = 0.10018806161207627;
+    const C121 = 0.9949685182509117;
+    const C122 = 0.7743926440821856;
+    const C123 = 0.632705328562516;
+    const C124 = 0.7632324697825288;
+    const C125 = 0.6461239796429639;
+    const C126 = 0.08280820751220434;
+    const C127 = 0.9965655024977614;
+    const C128 = 0.06540312923014306;
+    const C129 = 0.9978589232386035;
+    const C130 = 0.7518398074789774;
+    const C131 = 0.6593458151000688;
+    const C132 = 0.7402181274868321;
+    const C133 = 0.672366807434668;
+    const C134 = 0.04797812852134394;
+    const C135 = 0.9988483864849507;
+    const C136 = 0.03053851320982266;
+    const C137 = 0.9995335908367129;
+    const C138 = 0.7283709698824002;
+    const C139 = 0.6851829903263591;
+    const C140 = 0.7163019434246544;
+    const C141 = 0.6977904598416801;
+    const C142 = 0.01308959557134444;
+    const C143 = 0.999914327574007;
+    t6 = re[72];
+    t5 = im[72];
+    t3 = re[27];
+    t9 = im[27];
+    t4 = t6 - t3;
+    t7 = t5 - t9;
+    t14 = t6 + t3;
+    t13 = t5 + t9;
+    t1 = C0 * t14;
+    t8 = C1 * t13;
+    t12 = t1 + t8;
+    y[18] = 0;
+    t0 = (-0.10649251365137921) * t12;
+    y[161] = t0;
+    t11 = (-C1) * t14;
+    t10 = C0 * t13;
+    t2 = t11 + t10;
+    t6 = 0.10433701609753676 * t2;
+    y[198] = t6;
+    t3 = 0.0066295602099925134 * t2;
+    y[341] = t3;
+    t5 = (-C2) * t4;
+    t9 = (-C3) * t7;
+    t1 = t5 + t9;
+    t8 = 0.11175216614295466 * t1;
+    y[251] = t8;
+    t12 = 0.08005992338377164 * t1;
+    y[288] = t12;
+    t0 = C3 * t4;
+    t14 = (-C2) * t7;
+    t13 = t0 + t14;
+    t11 = 0.024266156878213443 * t13;
+    y[71] = t11;
+    t10 = (-0.0820419394725153) * t13;
+    y[108] = t10;
+    t6 = re[30];
+    t2 = im[30];
+    t3 = re[75];
+    t5 = im[75];
+    t9 = t6 - t3;
+    t8 = t2 - t5;
+    t1 = t6 + t3;
+    t12 = t2 + t5;
+    t4 = (-C4) * t1;
+    t7 = (-C5) * t12;
+    t0 = t4 + t7;
+    t14 = 0.1119972737491647 * t0;
+    y[249] = t14;
+    t11 = 0.07702845466518891 * t0;
+    y[290] = t11;
+    t13 = C5 * t1;
+    t10 = (-C4) * t12;
+    t6 = t13 + t10;
+    t3 = 0.02144008238657481 * t6;
+    y[69] = t3;
+    t2 = (-0.08446290146459451) * t6;
+    y[110] = t2;
+    t5 = C6 * t9;
+    t4 = C7 * t8;
+    t7 = t5 + t4;
+    y[20] = 0;
+    t14 = (-0.1064846134349639) * t7;
+    y[159] = t14;
+    t0 = (-C7) * t9;
+    t11 = C6 * t8;
+    t1 = t0 + t11;
+    t12 = 0.10434475698122611 * t1;
+    y[200] = t12;
+    t13 = 0.008054387752489418 * t1;
+    y[339] = t13;
+    t10 = re[78];
+    t3 = im[78];
+    t6 = re[33];
+    t2 = im[33];
+    t5 = t10 - t6;
+    t4 = t3 - t2;
+    t7 = t10 + t6;
+    t14 = t3 + t2;
+    t9 = C8 * t7;
+    t8 = C9 * t14;
+    t0 = t9 + t8;
+    y[22] = 0;
+    t11 = (-0.106439018245135) * t0;
+    y[157] = t11;
+    t12 = (-C9) * t7;
+    t1 = C8 * t14;
+    t13 = t12 + t1;
+    t10 = 0.10438945505417567 * t13;
+    y[202] = t10;
+    t6 = 0.009633186119027486 * t13;
+    y[337] = t6;
+    t3 = (-C10) * t5;
+    t2 = (-C11) * t4;
+    t9 = t3 + t2;
+    t8 = 0.11211600182090968 * t9;
+    y[247] = t8;
+    t0 = 0.0739149077116441 * t9;
+    y[292] = t0;
+    t11 = C11 * t5;
+    t7 = (-C10) * t4;
+    t14 = t11 + t7;
+    t12 = 0.018754638337760737 * t14;
+    y[67] = t12;
+    t1 = (-0.08673930207344024) * t14;
+    y[112] = t1;
+    t10 = re[46];
+    t13 = im[46];
+    t6 = re[1];
+    t3 = im[1];
+    t2 = t10 - t6;
+    t8 = t13 - t3;
+    t9 = t10 + t6;
+    t0 = t13 + t3;
+    t5 = (-C12) * t9;
+    t4 = (-C13) * t0;
+    t11 = t5 + t4;
+    t7 = 0.11211726616460811 * t11;
+    y[245] = t7;
+    t12 = 0.07072918180627431 * t11;
+    y[294] = t12;
+    t14 = C13 * t9;
+    t1 = (-C12) * t0;
+    t10 = t14 + t1;
+    t6 = 0.0162231586659377 * t10;
+    y[65] = t6;
+    t13 = (-0.08886820659475896) * t10;
+    y[114] = t13;
+    t3 = C14 * t2;
+    t5 = C15 * t8;
+    t4 = t3 + t5;
+    y[24] = 0;
+    t7 = (-0.10635259545515033) * t4;
+    y[155] = t7;
+    t11 = (-C15) * t2;
+    t12 = C14 * t8;
+    t9 = t11 + t12;
+    t0 = 0.10447428258388627 * t9;
+    y[204] = t0;
+    t14 = 0.011366778059010964 * t9;
+    y[335] = t14;
+    t1 = re[4];
+    t6 = im[4];
+    t10 = re[49];
+    t13 = im[49];
+    t3 = t1 - t10;
+    t5 = t6 - t13;
+    t4 = t1 + t10;
+    t7 = t6 + t13;
+    t2 = C16 * t4;
+    t8 = C17 * t7;
+    t11 = t2 + t8;
+    y[26] = 0;
+    t12 = (-0.10622278321308296) * t11;
+    y[153] = t12;
+    t0 = (-C17) * t4;
+    t9 = C16 * t7;
+    t14 = t0 + t9;
+    t1 = 0.10460195802648305 * t14;
+    y[206] = t1;
+    t10 = 0.013253791127641398 * t14;
+    y[333] = t10;
+    t6 = (-C18) * t3;
+    t13 = (-C19) * t5;
+    t2 = t6 + t13;
+    t8 = 0.11201282402976184 * t2;
+    y[243] = t8;
+    t11 = 0.06748590978994368 * t2;
+    y[296] = t11;
+    t12 = C19 * t3;
+    t4 = (-C18) * t5;
+    t7 = t12 + t4;
+    t0 = 0.01385646615380372 * t7;
+    y[63] = t0;
+    t9 = (-0.09084669522789945) * t7;
+    y[116] = t9;
+    t1 = re[52];
+    t14 = im[52];
+    t10 = re[7];
+    t6 = im[7];
+    t13 = t1 - t10;
+    t8 = t14 - t6;
+    t2 = t1 + t10;
+    t11 = t14 + t6;
+    t3 = (-C20) * t2;
+    t5 = (-C21) * t11;
+    t12 = t3 + t5;
+    t4 = 0.11181234565117065 * t12;
+    y[241] = t4;
+    t0 = 0.06419701362972723 * t12;
+    y[298] = t0;
+    t7 = C21 * t2;
+    t9 = (-C20) * t11;
+    t1 = t7 + t9;
+    t10 = 0.011663765406511857 * t1;
+    y[61] = t10;
+    t14 = (-0.09267610069341958) * t1;
+    y[118] = t14;
+    t6 = C22 * t13;
+    t3 = C23 * t8;
+    t5 = t6 + t3;
+    y[28] = 0;
+    t4 = (-0.10604711193419658) * t5;
+    y[151] = t4;
+    t12 = (-C23) * t13;
+    t0 = C22 * t8;
+    t2 = t12 + t0;
+    t11 = 0.10477523535016856 * t2;
+    y[208] = t11;
+    t7 = 0.015292094451545292 * t2;
+    y[331] = t7;
+    t9 = re[20];
+    t10 = im[20];
+    t1 = re[65];
+    t14 = im[65];
+    t6 = t9 - t1;
+    t3 = t10 - t14;
+    t5 = t9 + t1;
+    t4 = t10 + t14;
+    t13 = C24 * t5;
+    t8 = C25 * t4;
+    t12 = t13 + t8;
+    y[30] = 0;
+    t0 = (-0.1058237063615947) * t12;
+    y[149] = t0;
+    t11 = (-C25) * t5;
+    t2 = C24 * t4;
+    t7 = t11 + t2;
+    t9 = 0.10499642748426294 * t7;
+    y[210] = t9;
+    t1 = 0.017479194012891126 * t7;
+    y[329] = t1;
+    t10 = (-C26) * t6;
+    t14 = (-C27) * t3;
+    t13 = t10 + t14;
+    t8 = 0.11152777064293147 * t13;
+    y[239] = t8;
+    t12 = 0.06087681238074977 * t13;
+    y[300] = t12;
+    t0 = C27 * t6;
+    t5 = (-C26) * t3;
+    t4 = t0 + t5;
+    t11 = 0.009652524216948906 * t4;
+    y[59] = t11;
+    t2 = (-0.094357630791773) * t4;
+    y[120] = t2;
+    t9 = re[68];
+    t7 = im[68];
+    t1 = re[23];
+    t10 = im[23];
+    t14 = t9 - t1;
+    t8 = t7 - t10;
+    t13 = t9 + t1;
+    t12 = t7 + t10;
+    t6 = (-C28) * t13;
+    t3 = (-C29) * t12;
+    t0 = t6 + t3;
+    t5 = 0.1111711548927498 * t0;
+    y[237] = t5;
+    t11 = 0.057539681884399944 * t0;
+    y[302] = t11;
+    t4 = C29 * t13;
+    t2 = (-C28) * t12;
+    t9 = t4 + t2;
+    t1 = 0.00782996317541068 * t9;
+    y[57] = t1;
+    t7 = (-0.09589337747832162) * t9;
+    y[122] = t7;
+    t10 = C30 * t14;
+    t6 = C31 * t8;
+    t3 = t10 + t6;
+    y[32] = 0;
+    t5 = (-0.10555095396217636) * t3;
+    y[147] = t5;
+    t0 = (-C31) * t14;
+    t11 = C30 * t8;
+    t13 = t0 + t11;
+    t12 = 0.1052677469413751 * t13;
+    y[212] = t12;
+    t4 = 0.019809432322785005 * t13;
+    y[327] = t4;
+    t2 = re[26];
+    t1 = im[26];
+    t9 = re[71];
+    t7 = im[71];
+    t10 = t2 - t9;
+    t6 = t1 - t7;
+    t3 = t2 + t9;
+    t5 = t1 + t7;
+    t14 = C32 * t3;
+    t8 = C33 * t5;
+    t0 = t14 + t8;
+    y[34] = 0;
+    t11 = (-0.10522800037797932) * t0;
+    y[145] = t11;
+    t12 = (-C33) * t3;
+    t13 = C32 * t5;
+    t4 = t12 + t13;
+    t2 = 0.10559082251111834 * t4;
+    y[214] = t2;
+    t9 = 0.022277503292171038 * t4;
+    y[325] = t9;
+    t1 = (-C34) * t10;
+    t7 = (-C35) * t6;
+    t14 = t1 + t7;
+    t8 = 0.11075297764495041 * t14;
+    y[235] = t8;
+    t0 = 0.05419989393873094 * t14;
+    y[304] = t0;
+    t11 = C35 * t10;
+    t3 = (-C34) * t6;
+    t5 = t11 + t3;
+    t12 = 0.006201590324297938 * t5;
+    y[55] = t12;
+    t13 = (-0.09728845040920638) * t5;
+    y[124] = t13;
+    t2 = re[54];
+    t4 = im[54];
+    t9 = re[9];
+    t1 = im[9];
+    t7 = t2 - t9;
+    t8 = t4 - t1;
+    t14 = t2 + t9;
+    t0 = t4 + t1;
+    t10 = (-C36) * t14;
+    t6 = (-C37) * t0;
+    t11 = t10 + t6;
+    t3 = 0.11028748843781232 * t11;
+    y[233] = t3;
+    t12 = 0.05087145958604732 * t11;
+    y[306] = t12;
+    t5 = C37 * t14;
+    t13 = (-C36) * t0;
+    t2 = t5 + t13;
+    t9 = 0.004771859549919083 * t2;
+    y[53] = t9;
+    t4 = (-0.0985457172414932) * t2;
+    y[126] = t4;
+    t1 = C38 * t7;
+    t10 = C39 * t8;
+    t6 = t1 + t10;
+    y[36] = 0;
+    t3 = (-0.10485393165978092) * t6;
+    y[143] = t3;
+    t11 = (-C39) * t7;
+    t12 = C38 * t8;
+    t14 = t11 + t12;
+    t0 = 0.10596752010371228 * t14;
+    y[216] = t0;
+    t5 = 0.024876910991979265 * t14;
+    y[323] = t5;
+    t13 = re[12];
+    t9 = im[12];
+    t2 = re[57];
+    t4 = im[57];
+    t1 = t13 - t2;
+    t10 = t9 - t4;
+    t6 = t13 + t2;
+    t3 = t9 + t4;
+    t7 = C40 * t6;
+    t8 = C41 * t3;
+    t11 = t7 + t8;
+    y[38] = 0;
+    t12 = (-0.10442909411643879) * t11;
+    y[141] = t12;
+    t0 = (-C41) * t6;
+    t14 = C40 * t3;
+    t5 = t0 + t14;
+    t13 = 0.10639861625843644 * t5;
+    y[218] = t13;
+    t2 = 0.02759759882850269 * t5;
+    y[321] = t2;
+    t9 = (-C42) * t1;
+    t4 = (-C43) * t10;
+    t7 = t9 + t4;
+    t8 = 0.10978325427720098 * t7;
+    y[231] = t8;
+    t11 = 0.04756885867834906 * t7;
+    y[308] = t11;
+    t12 = C43 * t1;
+    t6 = (-C42) * t10;
+    t3 = t12 + t6;
+    t0 = 0.0035432705531146876 * t3;
+    y[51] = t0;
+    t14 = (-0.09967423398910226) * t3;
+    y[128] = t14;
+    t13 = re[60];
+    t5 = im[60];
+    t2 = re[15];
+    t9 = im[15];
+    t4 = t13 - t2;
+    t8 = t5 - t9;
+    t7 = t13 + t2;
+    t11 = t5 + t9;
+    t1 = (-C44) * t7;
+    t10 = (-C45) * t11;
+    t12 = t1 + t10;
+    t6 = 0.10925429467963434 * t12;
+    y[229] = t6;
+    t0 = 0.04430435466830059 * t12;
+    y[310] = t0;
+    t3 = C45 * t7;
+    t14 = (-C44) * t11;
+    t13 = t3 + t14;
+    t2 = 0.002515371651828484 * t13;
+    y[49] = t2;
+    t5 = (-0.1006795131082048) * t13;
+    y[130] = t5;
+    t9 = C46 * t4;
+    t1 = C47 * t8;
+    t10 = t9 + t1;
+    y[40] = 0;
+    t6 = (-0.10395322592855918) * t10;
+    y[139] = t6;
+    t12 = (-C47) * t4;
+    t0 = C46 * t8;
+    t7 = t12 + t0;
+    t11 = 0.10688567874504554 * t7;
+    y[220] = t11;
+    t3 = 0.030431768150683058 * t7;
+    y[319] = t3;
+    t14 = re[28];
+    t2 = im[28];
+    t13 = re[73];
+    t5 = im[73];
+    t9 = t14 - t13;
+    t1 = t2 - t5;
+    t10 = t14 + t13;
+    t6 = t2 + t5;
+    t4 = C48 * t10;
+    t8 = C49 * t6;
+    t12 = t4 + t8;
+    t0 = 0.0004039562545922317 * t12;
+    y[42] = t0;
+    t11 = (-0.1033626970269786) * t12;
+    y[137] = t11;
+    t7 = (-C49) * t10;
+    t3 = C48 * t6;
+    t14 = t7 + t3;
+    t13 = 0.10736592722456871 * t14;
+    y[222] = t13;
+    t2 = 0.03336822793098118 * t14;
+    y[317] = t2;
+    t5 = (-C50) * t9;
+    t4 = (-C51) * t1;
+    t8 = t5 + t4;
+    t0 = 0.10871066201687268 * t8;
+    y[227] = t0;
+    t12 = 0.041091881490305494 * t8;
+    y[312] = t12;
+    t11 = C51 * t9;
+    t10 = (-C50) * t1;
+    t6 = t11 + t10;
+    t7 = 0.0016836021815952902 * t6;
+    y[47] = t7;
+    t3 = (-0.10157171821908681) * t6;
+    y[132] = t3;
+    t13 = re[76];
+    t14 = im[76];
+    t2 = re[31];
+    t5 = im[31];
+    t4 = t13 - t2;
+    t0 = t14 - t5;
+    t8 = t13 + t2;
+    t12 = t14 + t5;
+    t9 = (-C52) * t8;
+    t1 = (-C53) * t12;
+    t11 = t9 + t1;
+    t10 = 0.10816553021132944 * t11;
+    y[225] = t10;
+    t7 = 0.03794353629982911 * t11;
+    y[314] = t7;
+    t6 = C53 * t8;
+    t3 = (-C52) * t12;
+    t13 = t6 + t3;
+    t2 = 0.0010382155367027563 * t13;
+    y[45] = t2;
+    t14 = (-0.10235901881658338) * t13;
+    y[134] = t14;
+    t5 = C54 * t4;
+    t9 = C55 * t0;
+    t1 = t5 + t9;
+    t10 = 0.0007807921408777607 * t1;
+    y[44] = t10;
+    t11 = (-0.10271657940570703) * t1;
+    y[135] = t11;
+    t7 = (-C55) * t4;
+    t8 = C54 * t0;
+    t12 = t7 + t8;
+    t6 = 0.1078958471118532 * t12;
+    y[224] = t6;
+    t3 = 0.036397348554850356 * t12;
+    y[315] = t3;
+    t2 = re[34];
+    t13 = im[34];
+    t14 = re[79];
+    t5 = im[79];
+    t9 = t2 - t14;
+    t10 = t13 - t5;
+    t1 = t2 + t14;
+    t11 = t13 + t5;
+    t4 = C56 * t1;
+    t0 = C57 * t11;
+    t7 = t4 + t0;
+    t8 = 0.001338446915694132 * t7;
+    y[46] = t8;
+    t6 = (-0.10197789626508247) * t7;
+    y[133] = t6;
+    t12 = (-C57) * t1;
+    t3 = C56 * t11;
+    t2 = t12 + t3;
+    t14 = 0.10843752343695495 * t2;
+    y[226] = t14;
+    t13 = 0.03950892201611919 * t2;
+    y[313] = t13;
+    t5 = (-C58) * t9;
+    t4 = (-C59) * t10;
+    t0 = t5 + t4;
+    t8 = 0.10762968653672474 * t0;
+    y[223] = t8;
+    t7 = 0.03487189790626826 * t0;
+    y[316] = t7;
+    t6 = C59 * t9;
+    t1 = (-C58) * t10;
+    t11 = t6 + t1;
+    t12 = 0.0005646408681615436 * t11;
+    y[43] = t12;
+    t3 = (-0.10305168926250033) * t11;
+    y[136] = t3;
+    t14 = re[2];
+    t2 = im[2];
+    t13 = re[47];
+    t5 = im[47];
+    t4 = t14 - t13;
+    t8 = t2 - t5;
+    t0 = t14 + t13;
+    t7 = t2 + t5;
+    t9 = (-C60) * t0;
+    t10 = (-C61) * t7;
+    t6 = t9 + t10;
+    t1 = 0.10715459052193034 * t6;
+    y[221] = t1;
+    t12 = 0.03188777901462403 * t6;
+    y[318] = t12;
+    t11 = C61 * t0;
+    t3 = (-C60) * t7;
+    t14 = t11 + t3;
+    y[41] = 0;
+    t13 = (-0.10369234819517234) * t14;
+    y[138] = t13;
+    t2 = C62 * t4;
+    t5 = C63 * t8;
+    t9 = t2 + t5;
+    t10 = 0.0020754473801508247 * t9;
+    y[48] = t10;
+    t1 = (-0.10113927380391523) * t9;
+    y[131] = t1;
+    t6 = (-C63) * t4;
+    t12 = C62 * t8;
+    t0 = t6 + t12;
+    t7 = 0.10898346481763614 * t0;
+    y[228] = t7;
+    t11 = 0.04269085483362434 * t0;
+    y[311] = t11;
+    t3 = re[50];
+    t14 = im[50];
+    t13 = re[5];
+    t2 = im[5];
+    t5 = t3 - t13;
+    t10 = t14 - t2;
+    t9 = t3 + t13;
+    t1 = t14 + t2;
+    t4 = C64 * t9;
+    t8 = C65 * t1;
+    t6 = t4 + t8;
+    t12 = 0.0030044094666997023 * t6;
+    y[50] = t12;
+    t7 = (-0.10019163696307268) * t6;
+    y[129] = t7;
+    t0 = (-C65) * t9;
+    t11 = C64 * t1;
+    t3 = t0 + t11;
+    t13 = 0.10952127322317406 * t3;
+    y[230] = t13;
+    t14 = 0.045930977828050105 * t3;
+    y[309] = t14;
+    t2 = (-C66) * t5;
+    t4 = (-C67) * t10;
+    t8 = t2 + t4;
+    t12 = 0.10663511500011805 * t8;
+    y[219] = t12;
+    t6 = 0.0290011599676947 * t8;
+    y[320] = t6;
+    t7 = C67 * t5;
+    t9 = (-C66) * t10;
+    t1 = t7 + t9;
+    y[39] = 0;
+    t0 = (-0.10419748795787213) * t1;
+    y[140] = t0;
+    t11 = re[8];
+    t13 = im[8];
+    t3 = re[53];
+    t14 = im[53];
+    t2 = t11 - t3;
+    t4 = t13 - t14;
+    t12 = t11 + t3;
+    t8 = t13 + t14;
+    t6 = (-C68) * t12;
+    t5 = (-C69) * t8;
+    t10 = t6 + t5;
+    t7 = 0.10617606024822178 * t10;
+    y[217] = t7;
+    t9 = 0.026222514401920968 * t10;
+    y[322] = t9;
+    t1 = C69 * t12;
+    t0 = (-C68) * t8;
+    t11 = t1 + t0;
+    y[37] = 0;
+    t3 = (-0.10464798830485135) * t11;
+    y[142] = t3;
+    t13 = C70 * t2;
+    t14 = C71 * t4;
+    t6 = t13 + t14;
+    t5 = 0.004132367980549081 * t6;
+    y[52] = t5;
+    t7 = (-0.09912579670623863) * t6;
+    y[127] = t7;
+    t10 = (-C71) * t2;
+    t9 = C70 * t4;
+    t12 = t10 + t9;
+    t8 = 0.11003928784390318 * t12;
+    y[232] = t8;
+    t1 = 0.049216099716768984 * t12;
+    y[307] = t1;
+    t0 = re[36];
+    t11 = im[36];
+    t3 = re[81];
+    t13 = im[81];
+    t14 = t0 - t3;
+    t5 = t11 - t13;
+    t6 = t0 + t3;
+    t7 = t11 + t13;
+    t2 = C72 * t6;
+    t4 = C73 * t7;
+    t10 = t2 + t4;
+    t9 = 0.005461682284304391 * t10;
+    y[54] = t9;
+    t8 = (-0.09793368984357992) * t10;
+    y[125] = t8;
+    t12 = (-C73) * t6;
+    t1 = C72 * t7;
+    t0 = t12 + t1;
+    t3 = 0.11052570836958936 * t0;
+    y[234] = t3;
+    t11 = 0.05253338677834252 * t0;
+    y[305] = t11;
+    t13 = (-C74) * t14;
+    t2 = (-C75) * t5;
+    t4 = t13 + t2;
+    t9 = 0.10577241761811562 * t4;
+    y[215] = t9;
+    t10 = 0.023561556790462897 * t4;
+    y[324] = t10;
+    t8 = C75 * t14;
+    t6 = (-C74) * t5;
+    t7 = t8 + t6;
+    y[35] = 0;
+    t12 = (-0.10504733995234042) * t7;
+    y[144] = t12;
+    t1 = re[84];
+    t3 = im[84];
+    t0 = re[39];
+    t11 = im[39];
+    t13 = t1 - t0;
+    t2 = t3 - t11;
+    t9 = t1 + t0;
+    t4 = t3 + t11;
+    t10 = (-C76) * t9;
+    t14 = (-C77) * t4;
+    t5 = t10 + t14;
+    t8 = 0.10542273976138705 * t5;
+    y[213] = t8;
+    t6 = 0.02102631934479988 * t5;
+    y[326] = t6;
+    t7 = C77 * t9;
+    t12 = (-C76) * t4;
+    t1 = t7 + t12;
+    y[33] = 0;
+    t0 = (-0.10539577264127174) * t1;
+    y[146] = t0;
+    t3 = C78 * t13;
+    t11 = C79 * t2;
+    t10 = t3 + t11;
+    t14 = 0.006991188554664076 * t10;
+    y[56] = t14;
+    t8 = (-0.09660859225373081) * t10;
+    y[123] = t8;
+    t5 = (-C79) * t13;
+    t6 = C78 * t2;
+    t9 = t5 + t6;
+    t4 = 0.11096858947791874 * t9;
+    y[236] = t4;
+    t7 = 0.055869169342692634 * t9;
+    y[303] = t7;
+    t12 = re[42];
+    t1 = im[42];
+    t0 = re[87];
+    t3 = im[87];
+    t11 = t12 - t0;
+    t14 = t1 - t3;
+    t10 = t12 + t0;
+    t8 = t1 + t3;
+    t13 = C80 * t10;
+    t2 = C81 * t8;
+    t5 = t13 + t2;
+    t6 = 0.008717302904480926 * t5;
+    y[58] = t6;
+    t4 = (-0.09514316862034689) * t5;
+    y[121] = t4;
+    t9 = (-C81) * t10;
+    t7 = C80 * t8;
+    t12 = t9 + t7;
+    t0 = 0.11135812131039002 * t12;
+    y[238] = t0;
+    t1 = 0.05920943710311134 * t12;
+    y[301] = t1;
+    t3 = (-C82) * t11;
+    t13 = (-C83) * t14;
+    t2 = t3 + t13;
+    t6 = 0.10512566139996281 * t2;
+    y[211] = t6;
+    t5 = 0.018626993267046175 * t2;
+    y[328] = t5;
+    t4 = C83 * t11;
+    t10 = (-C82) * t14;
+    t8 = t4 + t10;
+    y[31] = 0;
+    t9 = (-0.10569361431970062) * t8;
+    y[148] = t9;
+    t7 = re[10];
+    t0 = im[10];
+    t12 = re[55];
+    t1 = im[55];
+    t3 = t7 - t12;
+    t13 = t0 - t1;
+    t6 = t7 + t12;
+    t2 = t0 + t1;
+    t5 = (-C84) * t6;
+    t11 = (-C85) * t2;
+    t14 = t5 + t11;
+    t4 = 0.10487973921603179 * t14;
+    y[209] = t4;
+    t10 = 0.0163672975990987 * t14;
+    y[330] = t10;
+    t8 = C85 * t6;
+    t9 = (-C84) * t2;
+    t7 = t8 + t9;
+    y[29] = 0;
+    t12 = (-0.1059414448793049) * t7;
+    y[150] = t12;
+    t0 = C86 * t3;
+    t1 = C87 * t13;
+    t5 = t0 + t1;
+    t11 = 0.010634922571204589 * t5;
+    y[60] = t11;
+    t4 = (-0.09353555143552254) * t5;
+    y[119] = t4;
+    t14 = (-C87) * t3;
+    t10 = C86 * t13;
+    t6 = t14 + t10;
+    t2 = 0.1116795160109561 * t6;
+    y[240] = t2;
+    t8 = 0.06253980623939123 * t6;
+    y[299] = t8;
+    t9 = re[58];
+    t7 = im[58];
+    t12 = re[13];
+    t0 = im[13];
+    t1 = t9 - t12;
+    t11 = t7 - t0;
+    t5 = t9 + t12;
+    t4 = t7 + t0;
+    t3 = C88 * t5;
+    t13 = C89 * t4;
+    t14 = t3 + t13;
+    t10 = 0.01273784185791163 * t14;
+    y[62] = t10;
+    t2 = (-0.09177980677333142) * t14;
+    y[117] = t2;
+    t6 = (-C89) * t5;
+    t8 = C88 * t4;
+    t9 = t6 + t8;
+    t12 = 0.11192407043335297 * t9;
+    y[242] = t12;
+    t7 = 0.06584644108548751 * t9;
+    y[297] = t7;
+    t0 = (-C90) * t1;
+    t3 = (-C91) * t11;
+    t13 = t0 + t3;
+    t10 = 0.10468272521430462 * t13;
+    y[207] = t10;
+    t14 = 0.014254157485166856 * t13;
+    y[332] = t14;
+    t2 = C91 * t1;
+    t5 = (-C90) * t11;
+    t4 = t2 + t5;
+    y[27] = 0;
+    t6 = (-0.10614082780482303) * t4;
+    y[152] = t6;
+    t8 = re[16];
+    t12 = im[16];
+    t9 = re[61];
+    t7 = im[61];
+    t0 = t8 - t9;
+    t3 = t12 - t7;
+    t10 = t8 + t9;
+    t13 = t12 + t7;
+    t14 = (-C92) * t10;
+    t1 = (-C93) * t13;
+    t11 = t14 + t1;
+    t2 = 0.10453260185425502 * t11;
+    y[205] = t2;
+    t5 = 0.012291201401904974 * t11;
+    y[334] = t5;
+    t4 = C93 * t10;
+    t6 = (-C92) * t13;
+    t8 = t4 + t6;
+    y[25] = 0;
+    t9 = (-0.10629326080109268) * t8;
+    y[154] = t9;
+    t12 = C94 * t0;
+    t7 = C95 * t3;
+    t14 = t12 + t7;
+    t1 = 0.015018768373128936 * t14;
+    y[64] = t1;
+    t2 = (-0.08987633190957331) * t14;
+    y[115] = t2;
+    t11 = (-C95) * t0;
+    t5 = C94 * t3;
+    t10 = t11 + t5;
+    t13 = 0.11207741615761654 * t10;
+    y[244] = t13;
+    t4 = 0.06911379356638549 * t10;
+    y[295] = t4;
+    t6 = re[74];
+    t8 = im[74];
+    t9 = re[29];
+    t12 = im[29];
+    t7 = t6 - t9;
+    t1 = t8 - t12;
+    t14 = t6 + t9;
+    t2 = t8 + t12;
+    t0 = C96 * t14;
+    t3 = C97 * t2;
+    t11 = t0 + t3;
+    t5 = 0.01746912534711498 * t11;
+    y[66] = t5;
+    t13 = (-0.08782223808436534) * t11;
+    y[113] = t13;
+    t10 = (-C97) * t14;
+    t4 = C96 * t2;
+    t6 = t10 + t4;
+    t9 = 0.11213066231169123 * t6;
+    y[246] = t9;
+    t8 = 0.07233020336790129 * t6;
+    y[293] = t8;
+    t12 = (-C98) * t7;
+    t0 = (-C99) * t1;
+    t3 = t12 + t0;
+    t5 = 0.10442666453598959 * t3;
+    y[203] = t5;
+    t11 = 0.010480779093744487 * t3;
+    y[336] = t11;
+    t13 = C99 * t7;
+    t14 = (-C98) * t1;
+    t2 = t13 + t14;
+    y[23] = 0;
+    t10 = (-0.10640109171811937) * t2;
+    y[156] = t10;
+    t4 = re[32];
+    t9 = im[32];
+    t6 = re[77];
+    t8 = im[77];
+    t12 = t4 - t6;
+    t0 = t9 - t8;
+    t5 = t4 + t6;
+    t3 = t9 + t8;
+    t11 = (-C100) * t5;
+    t7 = (-C101) * t3;
+    t1 = t11 + t7;
+    t13 = 0.10436228446480811 * t1;
+    y[201] = t13;
+    t14 = 0.00882444138494175 * t1;
+    y[338] = t14;
+    t2 = C101 * t5;
+    t10 = (-C100) * t3;
+    t4 = t2 + t10;
+    y[21] = 0;
+    t6 = (-0.1064667295095277) * t4;
+    y[158] = t6;
+    t9 = C102 * t12;
+    t8 = C103 * t0;
+    t11 = t9 + t8;
+    t7 = 0.02007900444097957 * t11;
+    y[68] = t7;
+    t13 = (-0.08561946843470827) * t11;
+    y[111] = t13;
+    t1 = (-C103) * t12;
+    t14 = C102 * t0;
+    t5 = t1 + t14;
+    t3 = 0.11207172864296862 * t5;
+    y[248] = t3;
+    t2 = 0.07548129602721117 * t5;
+    y[291] = t2;
+    t10 = re[80];
+    t4 = im[80];
+    t6 = re[35];
+    t9 = im[35];
+    t8 = t10 - t6;
+    t7 = t4 - t9;
+    t11 = t10 + t6;
+    t13 = t4 + t9;
+    t12 = C104 * t11;
+    t0 = C105 * t13;
+    t1 = t12 + t0;
+    t14 = 0.022836010382399043 * t1;
+    y[70] = t14;
+    t3 = (-0.0832703302350659) * t1;
+    y[109] = t3;
+    t5 = (-C105) * t11;
+    t2 = C104 * t13;
+    t10 = t5 + t2;
+    t6 = 0.11189126112211174 * t10;
+    y[250] = t6;
+    t4 = 0.07855526499661797 * t10;
+    y[289] = t4;
+    t9 = (-C106) * t8;
+    t12 = (-C107) * t7;
+    t0 = t9 + t12;
+    t14 = 0.10433646450524006 * t0;
+    y[199] = t14;
+    t1 = 0.007322741888918101 * t0;
+    y[340] = t1;
+    t3 = C107 * t8;
+    t11 = (-C106) * t7;
+    t13 = t3 + t11;
+    y[19] = 0;
+    t5 = (-0.10649307664199294) * t13;
+    y[160] = t5;
+    t2 = re[18];
+    t6 = im[18];
+    t10 = re[63];
+    t4 = im[63];
+    t9 = t2 - t10;
+    t12 = t6 - t4;
+    t14 = t2 + t10;
+    t0 = t6 + t4;
+    t1 = (-C108) * t14;
+    t8 = (-C109) * t0;
+    t7 = t1 + t8;
+    t3 = 0.10434601759724747 * t7;
+    y[197] = t3;
+    t11 = 0.00597475942728469 * t7;
+    y[342] = t11;
+    t13 = C109 * t14;
+    t5 = (-C108) * t0;
+    t2 = t13 + t5;
+    y[17] = 0;
+    t10 = (-0.10648332698232474) * t2;
+    y[162] = t10;
+    t6 = C110 * t9;
+    t4 = C111 * t12;
+    t1 = t6 + t4;
+    t8 = 0.025727538017752363 * t1;
+    y[72] = t8;
+    t3 = (-0.08077908739264364) * t1;
+    y[107] = t3;
+    t7 = (-C111) * t9;
+    t11 = C110 * t12;
+    t14 = t7 + t11;
+    t0 = 0.11157928098847411 * t14;
+    y[252] = t0;
+    t13 = 0.08154058967816075 * t14;
+    y[287] = t13;
+    t5 = re[66];
+    t2 = im[66];
+    t10 = re[21];
+    t6 = im[21];
+    t4 = t5 - t10;
+    t8 = t2 - t6;
+    t1 = t5 + t10;
+    t3 = t2 + t6;
+    t9 = C112 * t1;
+    t12 = C113 * t3;
+    t7 = t9 + t12;
+    t11 = 0.028739200127234528 * t7;
+    y[74] = t11;
+    t0 = (-0.07815126422793621) * t7;
+    y[105] = t0;
+    t14 = (-C113) * t1;
+    t13 = C112 * t3;
+    t5 = t14 + t13;
+    t10 = 0.11112823978612332 * t5;
+    y[254] = t10;
+    t2 = 0.08442471153193547 * t5;
+    y[285] = t2;
+    t6 = (-C114) * t4;
+    t9 = (-C115) * t8;
+    t12 = t6 + t9;
+    t11 = 0.10438765580397108 * t12;
+    y[195] = t11;
+    t7 = 0.004778532564716806 * t12;
+    y[344] = t7;
+    t0 = C115 * t4;
+    t1 = (-C114) * t8;
+    t3 = t0 + t1;
+    y[15] = 0;
+    t14 = (-0.10644085285310552) * t3;
+    y[164] = t14;
+    t13 = re[24];
+    t10 = im[24];
+    t5 = re[69];
+    t2 = im[69];
+    t6 = t13 - t5;
+    t9 = t10 - t2;
+    t11 = t13 + t5;
+    t12 = t10 + t2;
+    t7 = (-C116) * t11;
+    t4 = (-C117) * t12;
+    t8 = t7 + t4;
+    t0 = 0.10445796994690988 * t8;
+    y[193] = t0;
+    t1 = 0.0037318695349662285 * t8;
+    y[346] = t1;
+    t3 = C117 * t11;
+    t14 = (-C116) * t12;
+    t13 = t3 + t14;
+    y[13] = 0;
+    t5 = (-0.1063692039655592) * t13;
+    y[166] = t5;
+    t10 = C118 * t6;
+    t2 = C119 * t9;
+    t7 = t10 + t2;
+    t4 = 0.0318543301923774 * t7;
+    y[76] = t4;
+    t0 = (-0.07539457511296481) * t7;
+    y[103] = t0;
+    t8 = (-C119) * t6;
+    t1 = C118 * t9;
+    t11 = t8 + t1;
+    t12 = 0.11053192528606762 * t11;
+    y[256] = t12;
+    t3 = 0.08719704828120174 * t11;
+    y[283] = t3;
+    t14 = re[82];
+    t13 = im[82];
+    t5 = re[37];
+    t10 = im[37];
+    t2 = t14 - t5;
+    t4 = t13 - t10;
+    t7 = t14 + t5;
+    t0 = t13 + t10;
+    t6 = C120 * t7;
+    t9 = C121 * t0;
+    t8 = t6 + t9;
+    t1 = 0.03505523933023199 * t8;
+    y[78] = t1;
+    t12 = (-0.07251899904062391) * t8;
+    y[101] = t12;
+    t11 = (-C121) * t7;
+    t3 = C120 * t0;
+    t14 = t11 + t3;
+    t5 = 0.10978391243307457 * t14;
+    y[258] = t5;
+    t13 = 0.089849384311141 * t14;
+    y[281] = t13;
+    t10 = (-C122) * t2;
+    t6 = (-C123) * t4;
+    t9 = t10 + t6;
+    t1 = 0.10455343402886527 * t9;
+    y[191] = t1;
+    t8 = 0.002831428512025885 * t9;
+    y[348] = t8;
+    t12 = C123 * t2;
+    t7 = (-C122) * t4;
+    t0 = t12 + t7;
+    y[11] = 0;
+    t11 = (-0.10627208196761412) * t0;
+    y[168] = t11;
+    t3 = re[40];
+    t5 = im[40];
+    t14 = re[85];
+    t13 = im[85];
+    t10 = t3 - t14;
+    t6 = t5 - t13;
+    t1 = t3 + t14;
+    t9 = t5 + t13;
+    t8 = (-C124) * t1;
+    t2 = (-C125) * t9;
+    t4 = t8 + t2;
+    t12 = 0.10467052399007644 * t4;
+    y[189] = t12;
+    t7 = 0.00207288243561721 * t4;
+    y[350] = t7;
+    t0 = C125 * t1;
+    t11 = (-C124) * t9;
+    t3 = t0 + t11;
+    y[9] = 0;
+    t14 = (-0.10615320041929409) * t3;
+    y[170] = t14;
+    t5 = C126 * t10;
+    t13 = C127 * t6;
+    t8 = t5 + t13;
+    t2 = 0.03832547887509067 * t8;
+    y[80] = t2;
+    t12 = (-0.0695334865235696) * t8;
+    y[99] = t12;
+    t4 = (-C127) * t10;
+    t7 = C126 * t6;
+    t1 = t4 + t7;
+    t9 = 0.10888112665010784 * t1;
+    y[260] = t9;
+    t0 = 0.09237266858564189 * t1;
+    y[279] = t0;
+    t11 = re[88];
+    t3 = im[88];
+    t14 = re[43];
+    t5 = im[43];
+    t13 = t11 - t14;
+    t2 = t3 - t5;
+    t8 = t11 + t14;
+    t12 = t3 + t5;
+    t10 = C128 * t8;
+    t6 = C129 * t12;
+    t4 = t10 + t6;
+    t7 = 0.041646250636607804 * t4;
+    y[82] = t7;
+    t9 = (-0.0664515457924376) * t4;
+    y[97] = t9;
+    t1 = (-C129) * t8;
+    t0 = C128 * t12;
+    t11 = t1 + t0;
+    t14 = 0.10781825814583676 * t11;
+    y[262] = t14;
+    t3 = 0.09476053984084731 * t11;
+    y[277] = t3;
+    t5 = (-C130) * t13;
+    t10 = (-C131) * t2;
+    t6 = t5 + t10;
+    t7 = 0.10480559227732088 * t6;
+    y[187] = t7;
+    t4 = 0.0014514366788171667 * t6;
+    y[352] = t4;
+    t9 = C131 * t13;
+    t8 = (-C130) * t2;
+    t12 = t9 + t8;
+    y[7] = 0;
+    t1 = (-0.1060163954010255) * t12;
+    y[172] = t1;
+    t0 = re[56];
+    t14 = im[56];
+    t11 = re[11];
+    t3 = im[11];
+    t5 = t0 - t11;
+    t10 = t14 - t3;
+    t7 = t0 + t11;
+    t6 = t14 + t3;
+    t4 = (-C132) * t7;
+    t13 = (-C133) * t6;
+    t2 = t4 + t13;
+    t9 = 0.10495498046159855 * t2;
+    y[185] = t9;
+    t8 = 0.0009579147564804909 * t2;
+    y[354] = t8;
+    t12 = C133 * t7;
+    t1 = (-C132) * t6;
+    t0 = t12 + t1;
+    y[5] = 0;
+    t11 = (-0.10586549644660743) * t0;
+    y[174] = t11;
+    t14 = C134 * t5;
+    t3 = C135 * t10;
+    t4 = t14 + t3;
+    t13 = 0.04499990039956431 * t4;
+    y[84] = t13;
+    t9 = (-0.06328411738407469) * t4;
+    y[95] = t9;
+    t2 = (-C135) * t5;
+    t8 = C134 * t10;
+    t7 = t2 + t8;
+    t6 = 0.10659592439523378 * t7;
+    y[264] = t6;
+    t12 = 0.09700648402016114 * t7;
+    y[275] = t12;
+    t1 = re[14];
+    t0 = im[14];
+    t11 = re[59];
+    t14 = im[59];
+    t3 = t1 - t11;
+    t13 = t0 - t14;
+    t4 = t1 + t11;
+    t9 = t0 + t14;
+    t5 = C136 * t4;
+    t10 = C137 * t9;
+    t2 = t5 + t10;
+    t8 = 0.04836983709461063 * t2;
+    y[86] = t8;
+    t6 = (-0.0600463334420454) * t2;
+    y[93] = t6;
+    t7 = (-C137) * t4;
+    t12 = C136 * t9;
+    t1 = t7 + t12;
+    t11 = 0.10521100884722148 * t1;
+    y[266] = t11;
+    t0 = 0.09910258293243136 * t1;
+    y[273] = t0;
+    t14 = (-C138) * t3;
+    t5 = (-C139) * t13;
+    t10 = t14 + t5;
+    t8 = 0.10511501301267116 * t10;
+    y[183] = t8;
+    t2 = 0.000582585005005862 * t10;
+    y[356] = t2;
+    t6 = C139 * t3;
+    t4 = (-C138) * t13;
+    t9 = t6 + t4;
+    y[3] = 0;
+    t7 = (-0.10570432132060638) * t9;
+    y[176] = t7;
+    t12 = re[62];
+    t11 = im[62];
+    t1 = re[17];
+    t0 = im[17];
+    t14 = t12 - t1;
+    t5 = t11 - t0;
+    t8 = t12 + t1;
+    t10 = t11 + t0;
+    t2 = (-C140) * t8;
+    t3 = (-C141) * t10;
+    t13 = t2 + t3;
+    t6 = 0.10528188045534946 * t13;
+    y[181] = t6;
+    t4 = 0.0003110214546045697 * t13;
+    y[358] = t4;
+    t9 = C141 * t8;
+    t7 = (-C140) * t10;
+    t12 = t9 + t7;
+    y[1] = 0;
+    t1 = (-0.1055367843265621) * t12;
+    y[178] = t1;
+    t11 = C142 * t14;
+    t0 = C143 * t5;
+    t2 = t11 + t0;
+    t3 = 0.05173842041721468 * t2;
+    y[88] = t3;
+    t6 = (-0.05675218688923857) * t2;
+    y[91] = t6;
+    t13 = (-C143) * t14;
+    t4 = C142 * t5;
+    t8 = t13 + t4;
+    t10 = 0.10366449176446424 * t8;
+    y[268] = t10;
+    t9 = 0.10104530556902915 * t8;
+    y[271] = t9;
+}
+
+//
+//  Public functions.
+//
+
+/**
+ *  Apply LD-IMDCT transform (prebuilt for window W75_180, input pruned).
+ * 
+ *  Note(s):
+ *    [1] y[n] = w[n] * SUM(X[k] * cos(PI / 180 * (n + 90.5) * (k + 0.5))), where
+ *        w[n] = sqrt(2 / 180) * W75_180[359 - n].
+ *    [2] X[k] shall be zero for all k >= 120 (not checked).
+ *    [3] The size of all arrays will not be checked.
+ * 
+ *  @param {Number[]} X 
+ *    - The input block (180 points, only the first 120 points are used).
+ *  @param {Number[]} y 
+ *    - The array that would contain the output block (360 points).
+ *  @param {Number[]} re 
+ *    - The scratch buffer (real part, 90 points).
+ *  @param {Number[]} im 
+ *    - The scratch buffer (imaginary part, 90 points).
+ */
+function ApplyWindowedIMDCT_W75_180_K120(X, y, re, im) {
+    ApplyWindowedIMDCT_W75_180_K120_Part1(X, y, re, im);
+    ApplyWindowedIMDCT_W75_180_K120_Part2(X, y, re, im);
+    ApplyWindowedIMDCT_W75_180_K120_Part3(X, y, re, im);
+}
+
+//  Export public APIs.
+module.exports = {
+    "ApplyWindowedIMDCT_W75_180_K120": ApplyWindowedIMDCT_W75_180_K120
+};
\ No newline at end of file
@@ -0,0 +1,4919 @@
+//
+//  Copyright 2021 - 2023 XiaoJSoft Studio. All rights reserved.
+//  Use of this source code is governed by a BSD-style license that can be
+//  found in the LICENSE.md file.
+//
+
+//
+//  Note(s):
+//    [1] This file is generated automatically by a MDCT compiler, which locates 
+//        at "./../../dev/mdct-generator/" directory.
+//        Do NOT modify this file manually.
+//
+
+//
+//  Private functions.
+//
+
+/**
+ *  Part 1 of ApplyWindowedIMDCT_W75_180_K60().
+ * 
+ *  @param {Number[]} X 
+ *    - The input block (180 points, only the first 60 points are used).
+ *  @param {Number[]} y 
+ *    - The array that would contain the output block (360 points).
+ *  @param {Number[]} re 
+ *    - The scratch buffer (real part, 90 points).
+ *  @param {Number[]} im 
+ *    - The scratch buffer (imaginary part, 90 points).
+ */
+function ApplyWindowedIMDCT_W75_180_K60_Part1(X, y, re, im) {
+    let t0, t1, t10, t11, t12, t13, t14, t2, t3, t4, t5, t6, t7, t8, t9;
+    const C0 = 0.984807753012208;
+    const C1 = 0.17364817766693033;
+    const C2 = 0.9396926207859084;
+    const C3 = 0.3420201433256687;
+    const C4 = 0.766044443118978;
+    const C5 = 1.4088320528055172;
+    const C6 = 0.12325683343243876;
+    const C7 = 1.1584559306791384;
+    const C8 = 0.8111595753452777;
+    const C9 = 0.5976724774602398;
+    const C10 = 1.281712764111577;
+    const C11 = 0.5;
+    const C12 = 0.8660254037844386;
+    const C13 = 0.9510565162951535;
+    const C14 = 0.3090169943749474;
+    const C15 = 0.9781476007338057;
+    const C16 = 0.20791169081775931;
+    const C17 = 0.48907380036690284;
+    const C18 = 0.10395584540887966;
+    const C19 = 0.8471006708862739;
+    const C20 = 0.18005680599195537;
+    const C21 = 0.882947592858927;
+    const C22 = 0.4694715627858908;
+    const C23 = 0.9993908270190958;
+    const C24 = 0.03489949670250097;
+    const C25 = 0.9271838545667874;
+    const C26 = 0.374606593415912;
+    const C27 = 0.9902680687415704;
+    const C28 = 0.13917310096006544;
+    const C29 = 0.9135454576426009;
+    const C30 = 0.40673664307580015;
+    const C31 = 0.9945218953682733;
+    const C32 = 0.10452846326765346;
+    const C33 = 0.9702957262759965;
+    const C34 = 0.24192189559966773;
+    const C35 = 0.9612616959383189;
+    const C36 = 0.27563735581699916;
+    const C37 = 0.9975640502598242;
+    const C38 = 0.0697564737441253;
+    const C39 = 0.898794046299167;
+    const C40 = 0.4383711467890774;
+    const C41 = 0.5590169943749475;
+    const C42 = 0.25;
+    const C43 = 0.5877852522924731;
+    t0 = X[0];
+    t1 = X[59];
+    t2 = 0.8660254037844387 * t1;
+    t3 = 0.49999999999999994 * t1;
+    t4 = 0.43301270189221935 * t1;
+    t4 = t0 - t4;
+    t5 = 0.24999999999999997 * t1;
+    t6 = -t5;
+    t7 = (-0.75) * t1;
+    t1 = (-0.43301270189221924) * t1;
+    t0 = t0 + t2;
+    t2 = t4 + t1;
+    t6 = t6 - t7;
+    t4 = t4 - t1;
+    t1 = t7 - t5;
+    re[0] = t0;
+    im[0] = t3;
+    re[30] = t2;
+    im[30] = t6;
+    re[60] = t4;
+    im[60] = t1;
+    t7 = X[20];
+    t5 = C0 * t7;
+    t0 = (-C1) * t7;
+    t3 = X[39];
+    t2 = C2 * t3;
+    t6 = C3 * t3;
+    t4 = 0.4698463103929542 * t3;
+    t1 = t5 - t4;
+    t7 = 0.17101007166283436 * t3;
+    t4 = t0 - t7;
+    t7 = (-0.8137976813493737) * t3;
+    t3 = (-0.2961981327260238) * t3;
+    t5 = t5 + t2;
+    t2 = t0 + t6;
+    t0 = t1 + t3;
+    t6 = t4 - t7;
+    t1 = t1 - t3;
+    t3 = t4 + t7;
+    t4 = t0 + t6;
+    t7 = C4 * t4;
+    t4 = t0 * (-C5);
+    t0 = t6 * C6;
+    t6 = t7 - t0;
+    t0 = t7 + t4;
+    t7 = t1 + t3;
+    t4 = C1 * t7;
+    t7 = t1 * (-C7);
+    t1 = t3 * (-C8);
+    t3 = t4 - t1;
+    t1 = t4 + t7;
+    re[10] = t5;
+    im[10] = t2;
+    re[40] = t6;
+    im[40] = t0;
+    re[70] = t3;
+    im[70] = t1;
+    t4 = X[40];
+    t7 = C2 * t4;
+    t5 = (-C3) * t4;
+    t2 = X[19];
+    t6 = C0 * t2;
+    t0 = C1 * t2;
+    t3 = 0.492403876506104 * t2;
+    t1 = t7 - t3;
+    t4 = 0.08682408883346517 * t2;
+    t3 = t5 - t4;
+    t4 = (-0.8528685319524432) * t2;
+    t2 = (-0.15038373318043527) * t2;
+    t7 = t7 + t6;
+    t6 = t5 + t0;
+    t5 = t1 + t2;
+    t0 = t3 - t4;
+    t1 = t1 - t2;
+    t2 = t3 + t4;
+    t3 = t5 + t0;
+    t4 = C1 * t3;
+    t3 = t5 * (-C7);
+    t5 = t0 * (-C8);
+    t0 = t4 - t5;
+    t5 = t4 + t3;
+    t4 = t1 + t2;
+    t3 = (-C2) * t4;
+    t4 = t1 * C9;
+    t1 = t2 * (-C10);
+    t2 = t3 - t1;
+    t1 = t3 + t4;
+    re[20] = t7;
+    im[20] = t6;
+    re[50] = t0;
+    im[50] = t5;
+    re[80] = t2;
+    im[80] = t1;
+    t3 = re[0];
+    t4 = im[0];
+    t7 = re[10];
+    t6 = im[10];
+    t0 = re[20];
+    t5 = im[20];
+    t2 = t7 + t0;
+    t1 = t6 + t5;
+    t8 = C11 * t2;
+    t8 = t3 - t8;
+    t9 = C11 * t1;
+    t9 = t4 - t9;
+    t7 = t7 - t0;
+    t0 = C12 * t7;
+    t7 = t6 - t5;
+    t6 = C12 * t7;
+    t5 = t3 + t2;
+    t7 = t4 + t1;
+    t3 = t8 + t6;
+    t2 = t9 - t0;
+    t4 = t8 - t6;
+    t1 = t9 + t0;
+    re[0] = t5;
+    im[0] = t7;
+    re[10] = t3;
+    im[10] = t2;
+    re[20] = t4;
+    im[20] = t1;
+    t8 = re[30];
+    t6 = im[30];
+    t9 = re[40];
+    t0 = im[40];
+    t5 = re[50];
+    t7 = im[50];
+    t3 = t9 + t5;
+    t2 = t0 + t7;
+    t4 = C11 * t3;
+    t1 = t8 - t4;
+    t4 = C11 * t2;
+    t4 = t6 - t4;
+    t9 = t9 - t5;
+    t5 = C12 * t9;
+    t9 = t0 - t7;
+    t0 = C12 * t9;
+    t7 = t8 + t3;
+    t9 = t6 + t2;
+    t8 = t1 + t0;
+    t3 = t4 - t5;
+    t6 = t1 - t0;
+    t2 = t4 + t5;
+    re[30] = t7;
+    im[30] = t9;
+    re[40] = t8;
+    im[40] = t3;
+    re[50] = t6;
+    im[50] = t2;
+    t1 = re[60];
+    t0 = im[60];
+    t4 = re[70];
+    t5 = im[70];
+    t7 = re[80];
+    t9 = im[80];
+    t8 = t4 + t7;
+    t3 = t5 + t9;
+    t6 = C11 * t8;
+    t2 = t1 - t6;
+    t6 = C11 * t3;
+    t6 = t0 - t6;
+    t4 = t4 - t7;
+    t7 = C12 * t4;
+    t4 = t5 - t9;
+    t5 = C12 * t4;
+    t9 = t1 + t8;
+    t4 = t0 + t3;
+    t1 = t2 + t5;
+    t8 = t6 - t7;
+    t0 = t2 - t5;
+    t3 = t6 + t7;
+    re[60] = t9;
+    im[60] = t4;
+    re[70] = t1;
+    im[70] = t8;
+    re[80] = t0;
+    im[80] = t3;
+    t2 = X[36];
+    t5 = C13 * t2;
+    t6 = (-C14) * t2;
+    t7 = X[23];
+    t9 = C15 * t7;
+    t4 = C16 * t7;
+    t1 = C17 * t7;
+    t8 = t5 - t1;
+    t0 = C18 * t7;
+    t3 = t6 - t0;
+    t2 = (-C19) * t7;
+    t1 = (-C20) * t7;
+    t0 = t5 + t9;
+    t7 = t6 + t4;
+    t5 = t8 + t1;
+    t9 = t3 - t2;
+    t6 = t8 - t1;
+    t4 = t3 + t2;
+    re[18] = t0;
+    im[18] = t7;
+    re[48] = t5;
+    im[48] = t9;
+    re[78] = t6;
+    im[78] = t4;
+    t8 = X[56];
+    t1 = C21 * t8;
+    t3 = (-C22) * t8;
+    t2 = X[3];
+    t0 = C23 * t2;
+    t7 = C24 * t2;
+    t5 = 0.4996954135095479 * t2;
+    t9 = t1 - t5;
+    t6 = 0.017449748351250485 * t2;
+    t4 = t3 - t6;
+    t8 = (-0.8654978445076764) * t2;
+    t5 = (-0.030223850723657086) * t2;
+    t6 = t1 + t0;
+    t2 = t3 + t7;
+    t1 = t9 + t5;
+    t0 = t4 - t8;
+    t3 = t9 - t5;
+    t7 = t4 + t8;
+    t9 = t1 + t0;
+    t5 = C4 * t9;
+    t4 = t1 * (-C5);
+    t8 = t0 * C6;
+    t9 = t5 - t8;
+    t1 = t5 + t4;
+    t0 = t3 + t7;
+    t8 = C1 * t0;
+    t5 = t3 * (-C7);
+    t4 = t7 * (-C8);
+    t0 = t8 - t4;
+    t3 = t8 + t5;
+    re[28] = t6;
+    im[28] = t2;
+    re[58] = t9;
+    im[58] = t1;
+    re[88] = t0;
+    im[88] = t3;
+    t7 = X[43];
+    t4 = C25 * t7;
+    t8 = C26 * t7;
+    t5 = X[16];
+    t6 = C27 * t5;
+    t2 = (-C28) * t5;
+    t9 = t4 + t6;
+    t1 = t8 + t2;
+    t0 = C11 * t9;
+    t3 = -t0;
+    t7 = C11 * t1;
+    t5 = -t7;
+    t4 = t4 - t6;
+    t6 = C12 * t4;
+    t4 = t8 - t2;
+    t8 = C12 * t4;
+    t2 = t8 - t0;
+    t4 = t5 - t6;
+    t0 = t3 - t8;
+    t5 = t6 - t7;
+    t3 = t2 + t4;
+    t8 = C1 * t3;
+    t6 = t2 * (-C7);
+    t7 = t4 * (-C8);
+    t3 = t8 - t7;
+    t2 = t8 + t6;
+    t4 = t0 + t5;
+    t7 = (-C2) * t4;
+    t8 = t0 * C9;
+    t6 = t5 * (-C10);
+    t4 = t7 - t6;
+    t0 = t7 + t8;
+    re[38] = t9;
+    im[38] = t1;
+    re[68] = t3;
+    im[68] = t2;
+    re[8] = t4;
+    im[8] = t0;
+    t5 = re[18];
+    t6 = im[18];
+    t7 = re[28];
+    t8 = im[28];
+    t9 = re[38];
+    t1 = im[38];
+    t3 = t7 + t9;
+    t2 = t8 + t1;
+    t4 = C11 * t3;
+    t0 = t5 - t4;
+    t4 = C11 * t2;
+    t4 = t6 - t4;
+    t7 = t7 - t9;
+    t9 = C12 * t7;
+    t7 = t8 - t1;
+    t8 = C12 * t7;
+    t1 = t5 + t3;
+    t7 = t6 + t2;
+    t5 = t0 + t8;
+    t3 = t4 - t9;
+    t6 = t0 - t8;
+    t2 = t4 + t9;
+    re[18] = t1;
+    im[18] = t7;
+    re[28] = t5;
+    im[28] = t3;
+    re[38] = t6;
+    im[38] = t2;
+    t0 = re[48];
+    t8 = im[48];
+    t4 = re[58];
+    t9 = im[58];
+    t1 = re[68];
+    t7 = im[68];
+    t5 = t4 + t1;
+    t3 = t9 + t7;
+    t6 = C11 * t5;
+    t2 = t0 - t6;
+    t6 = C11 * t3;
+    t6 = t8 - t6;
+    t4 = t4 - t1;
+    t1 = C12 * t4;
+    t4 = t9 - t7;
+    t9 = C12 * t4;
+    t7 = t0 + t5;
+    t4 = t8 + t3;
+    t0 = t2 + t9;
+    t5 = t6 - t1;
+    t8 = t2 - t9;
+    t3 = t6 + t1;
+    re[48] = t7;
+    im[48] = t4;
+    re[58] = t0;
+    im[58] = t5;
+    re[68] = t8;
+    im[68] = t3;
+    t2 = re[78];
+    t9 = im[78];
+    t6 = re[88];
+    t1 = im[88];
+    t7 = re[8];
+    t4 = im[8];
+    t0 = t6 + t7;
+    t5 = t1 + t4;
+    t8 = C11 * t0;
+    t3 = t2 - t8;
+    t8 = C11 * t5;
+    t8 = t9 - t8;
+    t6 = t6 - t7;
+    t7 = C12 * t6;
+    t6 = t1 - t4;
+    t1 = C12 * t6;
+    t4 = t2 + t0;
+    t6 = t9 + t5;
+    t2 = t3 + t1;
+    t0 = t8 - t7;
+    t9 = t3 - t1;
+    t5 = t8 + t7;
+    re[78] = t4;
+    im[78] = t6;
+    re[88] = t2;
+    im[88] = t0;
+    re[8] = t9;
+    im[8] = t5;
+    t3 = X[47];
+    t1 = C29 * t3;
+    t8 = C30 * t3;
+    t7 = X[12];
+    t4 = C31 * t7;
+    t6 = (-C32) * t7;
+    t2 = t1 + t4;
+    t0 = t8 + t6;
+    t9 = C11 * t2;
+    t5 = -t9;
+    t3 = C11 * t0;
+    t7 = -t3;
+    t1 = t1 - t4;
+    t4 = C12 * t1;
+    t1 = t8 - t6;
+    t8 = C12 * t1;
+    t6 = t8 - t9;
+    t1 = t7 - t4;
+    t9 = t5 - t8;
+    t7 = t4 - t3;
+    re[36] = t2;
+    im[36] = t0;
+    re[66] = t6;
+    im[66] = t1;
+    re[6] = t9;
+    im[6] = t7;
+    t5 = X[27];
+    t8 = C33 * t5;
+    t4 = C34 * t5;
+    t3 = X[32];
+    t2 = C35 * t3;
+    t0 = (-C36) * t3;
+    t6 = t8 + t2;
+    t1 = t4 + t0;
+    t9 = C11 * t6;
+    t7 = -t9;
+    t5 = C11 * t1;
+    t3 = -t5;
+    t8 = t8 - t2;
+    t2 = C12 * t8;
+    t8 = t4 - t0;
+    t4 = C12 * t8;
+    t0 = t4 - t9;
+    t8 = t3 - t2;
+    t9 = t7 - t4;
+    t3 = t2 - t5;
+    t7 = t0 + t8;
+    t4 = C4 * t7;
+    t2 = t0 * (-C5);
+    t5 = t8 * C6;
+    t7 = t4 - t5;
+    t0 = t4 + t2;
+    t8 = t9 + t3;
+    t5 = C1 * t8;
+    t4 = t9 * (-C7);
+    t2 = t3 * (-C8);
+    t8 = t5 - t2;
+    t9 = t5 + t4;
+    re[46] = t6;
+    im[46] = t1;
+    re[76] = t7;
+    im[76] = t0;
+    re[16] = t8;
+    im[16] = t9;
+    t3 = X[7];
+    t2 = C37 * t3;
+    t5 = C38 * t3;
+    t4 = X[52];
+    t6 = C39 * t4;
+    t1 = (-C40) * t4;
+    t7 = t2 + t6;
+    t0 = t5 + t1;
+    t8 = C11 * t7;
+    t9 = -t8;
+    t3 = C11 * t0;
+    t4 = -t3;
+    t2 = t2 - t6;
+    t6 = C12 * t2;
+    t2 = t5 - t1;
+    t5 = C12 * t2;
+    t1 = t5 - t8;
+    t2 = t4 - t6;
+    t8 = t9 - t5;
+    t4 = t6 - t3;
+    t9 = t1 + t2;
+    t5 = C1 * t9;
+    t6 = t1 * (-C7);
+    t3 = t2 * (-C8);
+    t9 = t5 - t3;
+    t1 = t5 + t6;
+    t2 = t8 + t4;
+    t3 = (-C2) * t2;
+    t5 = t8 * C9;
+    t6 = t4 * (-C10);
+    t2 = t3 - t6;
+    t8 = t3 + t5;
+    re[56] = t7;
+    im[56] = t0;
+    re[86] = t9;
+    im[86] = t1;
+    re[26] = t2;
+    im[26] = t8;
+    t4 = re[36];
+    t6 = im[36];
+    t3 = re[46];
+    t5 = im[46];
+    t7 = re[56];
+    t0 = im[56];
+    t9 = t3 + t7;
+    t1 = t5 + t0;
+    t2 = C11 * t9;
+    t8 = t4 - t2;
+    t2 = C11 * t1;
+    t2 = t6 - t2;
+    t3 = t3 - t7;
+    t7 = C12 * t3;
+    t3 = t5 - t0;
+    t5 = C12 * t3;
+    t0 = t4 + t9;
+    t3 = t6 + t1;
+    t4 = t8 + t5;
+    t9 = t2 - t7;
+    t6 = t8 - t5;
+    t1 = t2 + t7;
+    re[36] = t0;
+    im[36] = t3;
+    re[46] = t4;
+    im[46] = t9;
+    re[56] = t6;
+    im[56] = t1;
+    t8 = re[66];
+    t5 = im[66];
+    t2 = re[76];
+    t7 = im[76];
+    t0 = re[86];
+    t3 = im[86];
+    t4 = t2 + t0;
+    t9 = t7 + t3;
+    t6 = C11 * t4;
+    t1 = t8 - t6;
+    t6 = C11 * t9;
+    t6 = t5 - t6;
+    t2 = t2 - t0;
+    t0 = C12 * t2;
+    t2 = t7 - t3;
+    t7 = C12 * t2;
+    t3 = t8 + t4;
+    t2 = t5 + t9;
+    t8 = t1 + t7;
+    t4 = t6 - t0;
+    t5 = t1 - t7;
+    t9 = t6 + t0;
+    re[66] = t3;
+    im[66] = t2;
+    re[76] = t8;
+    im[76] = t4;
+    re[86] = t5;
+    im[86] = t9;
+    t1 = re[6];
+    t7 = im[6];
+    t6 = re[16];
+    t0 = im[16];
+    t3 = re[26];
+    t2 = im[26];
+    t8 = t6 + t3;
+    t4 = t0 + t2;
+    t5 = C11 * t8;
+    t9 = t1 - t5;
+    t5 = C11 * t4;
+    t5 = t7 - t5;
+    t6 = t6 - t3;
+    t3 = C12 * t6;
+    t6 = t0 - t2;
+    t0 = C12 * t6;
+    t2 = t1 + t8;
+    t6 = t7 + t4;
+    t1 = t9 + t0;
+    t8 = t5 - t3;
+    t7 = t9 - t0;
+    t4 = t5 + t3;
+    re[6] = t2;
+    im[6] = t6;
+    re[16] = t1;
+    im[16] = t8;
+    re[26] = t7;
+    im[26] = t4;
+    t9 = X[11];
+    t0 = C31 * t9;
+    t5 = C32 * t9;
+    t3 = X[48];
+    t2 = C29 * t3;
+    t6 = (-C30) * t3;
+    t1 = t0 + t2;
+    t8 = t5 + t6;
+    t7 = C11 * t1;
+    t4 = -t7;
+    t9 = C11 * t8;
+    t3 = -t9;
+    t0 = t0 - t2;
+    t2 = C12 * t0;
+    t0 = t5 - t6;
+    t5 = C12 * t0;
+    t6 = t5 - t7;
+    t0 = t3 - t2;
+    t7 = t4 - t5;
+    t3 = t2 - t9;
+    re[54] = t1;
+    im[54] = t8;
+    re[84] = t6;
+    im[84] = t0;
+    re[24] = t7;
+    im[24] = t3;
+    t4 = X[51];
+    t5 = C39 * t4;
+    t2 = C40 * t4;
+    t9 = X[8];
+    t1 = C37 * t9;
+    t8 = (-C38) * t9;
+    t6 = 0.4987820251299121 * t9;
+    t0 = t5 - t6;
+    t7 = (-0.03487823687206265) * t9;
+    t3 = t2 - t7;
+    t4 = 0.8639158094271042 * t9;
+    t6 = (-0.0604108783408347) * t9;
+    t7 = t5 + t1;
+    t9 = t2 + t8;
+    t5 = t0 + t6;
+    t1 = t3 - t4;
+    t2 = t0 - t6;
+    t8 = t3 + t4;
+    t0 = t5 + t1;
+    t6 = C4 * t0;
+    t3 = t5 * (-C5);
+    t4 = t1 * C6;
+    t0 = t6 - t4;
+    t5 = t6 + t3;
+    t1 = t2 + t8;
+    t4 = C1 * t1;
+    t6 = t2 * (-C7);
+    t3 = t8 * (-C8);
+    t1 = t4 - t3;
+    t2 = t4 + t6;
+    re[64] = t7;
+    im[64] = t9;
+    re[4] = t0;
+    im[4] = t5;
+    re[34] = t1;
+    im[34] = t2;
+    t8 = X[31];
+    t3 = C35 * t8;
+    t4 = C36 * t8;
+    t6 = X[28];
+    t7 = C33 * t6;
+    t9 = (-C34) * t6;
+    t0 = 0.48514786313799824 * t6;
+    t5 = t3 - t0;
+    t1 = (-0.12096094779983387) * t6;
+    t2 = t4 - t1;
+    t8 = 0.840300748138485 * t6;
+    t0 = (-0.20951050732099905) * t6;
+    t1 = t3 + t7;
+    t6 = t4 + t9;
+    t3 = t5 + t0;
+    t7 = t2 - t8;
+    t4 = t5 - t0;
+    t9 = t2 + t8;
+    t5 = t3 + t7;
+    t0 = C1 * t5;
+    t2 = t3 * (-C7);
+    t8 = t7 * (-C8);
+    t5 = t0 - t8;
+    t3 = t0 + t2;
+    t7 = t4 + t9;
+    t8 = (-C2) * t7;
+    t0 = t4 * C9;
+    t2 = t9 * (-C10);
+    t7 = t8 - t2;
+    t4 = t8 + t0;
+    re[74] = t1;
+    im[74] = t6;
+    re[14] = t5;
+    im[14] = t3;
+    re[44] = t7;
+    im[44] = t4;
+    t9 = re[54];
+    t2 = im[54];
+    t8 = re[64];
+    t0 = im[64];
+    t1 = re[74];
+    t6 = im[74];
+    t5 = t8 + t1;
+    t3 = t0 + t6;
+    t7 = C11 * t5;
+    t4 = t9 - t7;
+    t7 = C11 * t3;
+    t7 = t2 - t7;
+    t8 = t8 - t1;
+    t1 = C12 * t8;
+    t8 = t0 - t6;
+    t0 = C12 * t8;
+    t6 = t9 + t5;
+    t8 = t2 + t3;
+    t9 = t4 + t0;
+    t5 = t7 - t1;
+    t2 = t4 - t0;
+    t3 = t7 + t1;
+    re[54] = t6;
+    im[54] = t8;
+    re[64] = t9;
+    im[64] = t5;
+    re[74] = t2;
+    im[74] = t3;
+    t4 = re[84];
+    t0 = im[84];
+    t7 = re[4];
+    t1 = im[4];
+    t6 = re[14];
+    t8 = im[14];
+    t9 = t7 + t6;
+    t5 = t1 + t8;
+    t2 = C11 * t9;
+    t3 = t4 - t2;
+    t2 = C11 * t5;
+    t2 = t0 - t2;
+    t7 = t7 - t6;
+    t6 = C12 * t7;
+    t7 = t1 - t8;
+    t1 = C12 * t7;
+    t8 = t4 + t9;
+    t7 = t0 + t5;
+    t4 = t3 + t1;
+    t9 = t2 - t6;
+    t0 = t3 - t1;
+    t5 = t2 + t6;
+    re[84] = t8;
+    im[84] = t7;
+    re[4] = t4;
+    im[4] = t9;
+    re[14] = t0;
+    im[14] = t5;
+    t3 = re[24];
+    t1 = im[24];
+    t2 = re[34];
+    t6 = im[34];
+    t8 = re[44];
+    t7 = im[44];
+    t4 = t2 + t8;
+    t9 = t6 + t7;
+    t0 = C11 * t4;
+    t5 = t3 - t0;
+    t0 = C11 * t9;
+    t0 = t1 - t0;
+    t2 = t2 - t8;
+    t8 = C12 * t2;
+    t2 = t6 - t7;
+    t6 = C12 * t2;
+    t7 = t3 + t4;
+    t2 = t1 + t9;
+    t3 = t5 + t6;
+    t4 = t0 - t8;
+    t1 = t5 - t6;
+    t9 = t0 + t8;
+    re[24] = t7;
+    im[24] = t2;
+    re[34] = t3;
+    im[34] = t4;
+    re[44] = t1;
+    im[44] = t9;
+    t5 = X[35];
+    t6 = C13 * t5;
+    t0 = C14 * t5;
+    t8 = X[24];
+    t7 = C15 * t8;
+    t2 = (-C16) * t8;
+    t3 = C17 * t8;
+    t4 = t6 - t3;
+    t1 = (-C18) * t8;
+    t9 = t0 - t1;
+    t5 = C19 * t8;
+    t3 = (-C20) * t8;
+    t1 = t6 + t7;
+    t8 = t0 + t2;
+    t6 = t4 + t3;
+    t7 = t9 - t5;
+    t0 = t4 - t3;
+    t2 = t9 + t5;
+    re[72] = t1;
+    im[72] = t8;
+    re[12] = t6;
+    im[12] = t7;
+    re[42] = t0;
+    im[42] = t2;
+    t4 = X[15];
+    t3 = C27 * t4;
+    t9 = C28 * t4;
+    t5 = X[44];
+    t1 = C25 * t5;
+    t8 = (-C26) * t5;
+    t6 = 0.4635919272833937 * t5;
+    t7 = t3 - t6;
+    t0 = (-0.187303296707956) * t5;
+    t2 = t9 - t0;
+    t4 = 0.8029647720336143 * t5;
+    t6 = (-0.32441882632332825) * t5;
+    t0 = t3 + t1;
+    t5 = t9 + t8;
+    t3 = t7 + t6;
+    t1 = t2 - t4;
+    t9 = t7 - t6;
+    t8 = t2 + t4;
+    t7 = t3 + t1;
+    t6 = C4 * t7;
+    t2 = t3 * (-C5);
+    t4 = t1 * C6;
+    t7 = t6 - t4;
+    t3 = t6 + t2;
+    t1 = t9 + t8;
+    t4 = C1 * t1;
+    t6 = t9 * (-C7);
+    t2 = t8 * (-C8);
+    t1 = t4 - t2;
+    t9 = t4 + t6;
+    re[82] = t0;
+    im[82] = t5;
+    re[22] = t7;
+    im[22] = t3;
+    re[52] = t1;
+    im[52] = t9;
+    t8 = X[4];
+    t2 = C23 * t8;
+    t4 = (-C24) * t8;
+    t6 = X[55];
+    t0 = C21 * t6;
+    t5 = C22 * t6;
+    t7 = 0.4414737964294635 * t6;
+    t3 = t2 - t7;
+    t1 = 0.2347357813929454 * t6;
+    t9 = t4 - t1;
+    t8 = (-0.7646550456261504) * t6;
+    t7 = (-0.4065742997269625) * t6;
+    t1 = t2 + t0;
+    t6 = t4 + t5;
+    t2 = t3 + t7;
+    t0 = t9 - t8;
+    t4 = t3 - t7;
+    t5 = t9 + t8;
+    t3 = t2 + t0;
+    t7 = C1 * t3;
+    t9 = t2 * (-C7);
+    t8 = t0 * (-C8);
+    t3 = t7 - t8;
+    t2 = t7 + t9;
+    t0 = t4 + t5;
+    t8 = (-C2) * t0;
+    t7 = t4 * C9;
+    t9 = t5 * (-C10);
+    t0 = t8 - t9;
+    t4 = t8 + t7;
+    re[2] = t1;
+    im[2] = t6;
+    re[32] = t3;
+    im[32] = t2;
+    re[62] = t0;
+    im[62] = t4;
+    t5 = re[72];
+    t9 = im[72];
+    t8 = re[82];
+    t7 = im[82];
+    t1 = re[2];
+    t6 = im[2];
+    t3 = t8 + t1;
+    t2 = t7 + t6;
+    t0 = C11 * t3;
+    t4 = t5 - t0;
+    t0 = C11 * t2;
+    t0 = t9 - t0;
+    t8 = t8 - t1;
+    t1 = C12 * t8;
+    t8 = t7 - t6;
+    t7 = C12 * t8;
+    t6 = t5 + t3;
+    t8 = t9 + t2;
+    t5 = t4 + t7;
+    t3 = t0 - t1;
+    t9 = t4 - t7;
+    t2 = t0 + t1;
+    re[72] = t6;
+    im[72] = t8;
+    re[82] = t5;
+    im[82] = t3;
+    re[2] = t9;
+    im[2] = t2;
+    t4 = re[12];
+    t7 = im[12];
+    t0 = re[22];
+    t1 = im[22];
+    t6 = re[32];
+    t8 = im[32];
+    t5 = t0 + t6;
+    t3 = t1 + t8;
+    t9 = C11 * t5;
+    t2 = t4 - t9;
+    t9 = C11 * t3;
+    t9 = t7 - t9;
+    t0 = t0 - t6;
+    t6 = C12 * t0;
+    t0 = t1 - t8;
+    t1 = C12 * t0;
+    t8 = t4 + t5;
+    t0 = t7 + t3;
+    t4 = t2 + t1;
+    t5 = t9 - t6;
+    t7 = t2 - t1;
+    t3 = t9 + t6;
+    re[12] = t8;
+    im[12] = t0;
+    re[22] = t4;
+    im[22] = t5;
+    re[32] = t7;
+    im[32] = t3;
+    t2 = re[42];
+    t1 = im[42];
+    t9 = re[52];
+    t6 = im[52];
+    t8 = re[62];
+    t0 = im[62];
+    t4 = t9 + t8;
+    t5 = t6 + t0;
+    t7 = C11 * t4;
+    t3 = t2 - t7;
+    t7 = C11 * t5;
+    t7 = t1 - t7;
+    t9 = t9 - t8;
+    t8 = C12 * t9;
+    t9 = t6 - t0;
+    t6 = C12 * t9;
+    t0 = t2 + t4;
+    t9 = t1 + t5;
+    t2 = t3 + t6;
+    t4 = t7 - t8;
+    t1 = t3 - t6;
+    t5 = t7 + t8;
+    re[42] = t0;
+    im[42] = t9;
+    re[52] = t2;
+    im[52] = t4;
+    re[62] = t1;
+    im[62] = t5;
+    t3 = re[0];
+    t6 = im[0];
+    t7 = re[18];
+    t8 = im[18];
+    t0 = re[36];
+    t9 = im[36];
+    t2 = re[54];
+    t4 = im[54];
+    t1 = re[72];
+    t5 = im[72];
+    t10 = t7 + t1;
+    t11 = t8 + t5;
+    t12 = t0 + t2;
+    t13 = t9 + t4;
+    t7 = t7 - t1;
+    t1 = t8 - t5;
+    t8 = t0 - t2;
+    t5 = t9 - t4;
+    t0 = t10 + t12;
+    t2 = t11 + t13;
+    t9 = t10 - t12;
+    t4 = C41 * t9;
+    t10 = t11 - t13;
+    t12 = C41 * t10;
+    t9 = C42 * t0;
+    t11 = t3 - t9;
+    t13 = C42 * t2;
+    t10 = t6 - t13;
+    t9 = t11 + t4;
+    t13 = t10 + t12;
+    t11 = t11 - t4;
+    t4 = t10 - t12;
+    t10 = C13 * t7;
+    t12 = C43 * t8;
+    t10 = t10 + t12;
+    t12 = C13 * t1;
+    t14 = C43 * t5;
+    t12 = t12 + t14;
+    t14 = C43 * t7;
+    t7 = C13 * t8;
+    t8 = t14 - t7;
+    t14 = C43 * t1;
+    t7 = C13 * t5;
+    t1 = t14 - t7;
+    t5 = t3 + t0;
+    t14 = t6 + t2;
+    t7 = t9 + t12;
+    t3 = t13 - t10;
+    t0 = t11 + t1;
+    t6 = t4 - t8;
+    t2 = t11 - t1;
+    t11 = t4 + t8;
+    t1 = t9 - t12;
+    t4 = t13 + t10;
+    re[0] = t5;
+    im[0] = t14;
+    re[18] = t7;
+    im[18] = t3;
+    re[36] = t0;
+    im[36] = t6;
+    re[54] = t2;
+    im[54] = t11;
+    re[72] = t1;
+    im[72] = t4;
+    t8 = re[30];
+    t9 = im[30];
+    t12 = re[48];
+    t13 = im[48];
+    t10 = re[66];
+    t5 = im[66];
+    t14 = re[84];
+    t7 = im[84];
+    t3 = re[12];
+    t0 = im[12];
+    t6 = t12 + t3;
+    t2 = t13 + t0;
+    t11 = t10 + t14;
+    t1 = t5 + t7;
+    t4 = t12 - t3;
+    t12 = t13 - t0;
+    t3 = t10 - t14;
+    t13 = t5 - t7;
+    t0 = t6 + t11;
+    t10 = t2 + t1;
+    t14 = t6 - t11;
+    t5 = C41 * t14;
+    t7 = t2 - t1;
+    t6 = C41 * t7;
+    t11 = C42 * t0;
+    t14 = t8 - t11;
+    t2 = C42 * t10;
+    t1 = t9 - t2;
+    t7 = t14 + t5;
+    t11 = t1 + t6;
+    t2 = t14 - t5;
+    t14 = t1 - t6;
+    t5 = C13 * t4;
+    t1 = C43 * t3;
+    t6 = t5 + t1;
+    t5 = C13 * t12;
+    t1 = C43 * t13;
+    t5 = t5 + t1;
+    t1 = C43 * t4;
+    t4 = C13 * t3;
+    t3 = t1 - t4;
+    t1 = C43 * t12;
+    t4 = C13 * t13;
+    t12 = t1 - t4;
+    t13 = t8 + t0;
+    t1 = t9 + t10;
+    t4 = t7 + t5;
+    t8 = t11 - t6;
+    t0 = t2 + t12;
+    t9 = t14 - t3;
+    t10 = t2 - t12;
+    t2 = t14 + t3;
+    t12 = t7 - t5;
+    t14 = t11 + t6;
+    re[30] = t13;
+    im[30] = t1;
+    re[48] = t4;
+    im[48] = t8;
+    re[66] = t0;
+    im[66] = t9;
+    re[84] = t10;
+    im[84] = t2;
+    re[12] = t12;
+    im[12] = t14;
+    t3 = re[60];
+    t7 = im[60];
+    t5 = re[78];
+    t11 = im[78];
+    t6 = re[6];
+    t13 = im[6];
+    t1 = re[24];
+    t4 = im[24];
+    t8 = re[42];
+    t0 = im[42];
+    t9 = t5 + t8;
+    t10 = t11 + t0;
+    t2 = t6 + t1;
+    t12 = t13 + t4;
+    t14 = t5 - t8;
+    t5 = t11 - t0;
+    t8 = t6 - t1;
+    t11 = t13 - t4;
+    t0 = t9 + t2;
+    t6 = t10 + t12;
+    t1 = t9 - t2;
+    t13 = C41 * t1;
+    t4 = t10 - t12;
+    t9 = C41 * t4;
+    t2 = C42 * t0;
+    t1 = t3 - t2;
+    t10 = C42 * t6;
+    t12 = t7 - t10;
+    t4 = t1 + t13;
+    t2 = t12 + t9;
+    t10 = t1 - t13;
+    t1 = t12 - t9;
+    t13 = C13 * t14;
+    t12 = C43 * t8;
+    t9 = t13 + t12;
+    t13 = C13 * t5;
+    t12 = C43 * t11;
+    t13 = t13 + t12;
+    t12 = C43 * t14;
+    t14 = C13 * t8;
+    t8 = t12 - t14;
+    t12 = C43 * t5;
+    t14 = C13 * t11;
+    t5 = t12 - t14;
+    t11 = t3 + t0;
+    t12 = t7 + t6;
+    t14 = t4 + t13;
+    t3 = t2 - t9;
+    t0 = t10 + t5;
+    t7 = t1 - t8;
+    t6 = t10 - t5;
+    t10 = t1 + t8;
+    t5 = t4 - t13;
+    t1 = t2 + t9;
+    re[60] = t11;
+    im[60] = t12;
+    re[78] = t14;
+    im[78] = t3;
+    re[6] = t0;
+    im[6] = t7;
+    re[24] = t6;
+    im[24] = t10;
+    re[42] = t5;
+    im[42] = t1;
+    t8 = re[10];
+    t4 = im[10];
+    t13 = re[28];
+    t2 = im[28];
+    t9 = re[46];
+    t11 = im[46];
+    t12 = re[64];
+    t14 = im[64];
+    t3 = re[82];
+    t0 = im[82];
+    t7 = t13 + t3;
+    t6 = t2 + t0;
+    t10 = t9 + t12;
+    t5 = t11 + t14;
+    t1 = t13 - t3;
+    t13 = t2 - t0;
+    t3 = t9 - t12;
+    t2 = t11 - t14;
+    t0 = t7 + t10;
+    t9 = t6 + t5;
+    t12 = t7 - t10;
+    t11 = C41 * t12;
+    t14 = t6 - t5;
+    t7 = C41 * t14;
+    t10 = C42 * t0;
+    t12 = t8 - t10;
+    t6 = C42 * t9;
+    t5 = t4 - t6;
+    t14 = t12 + t11;
+    t10 = t5 + t7;
+    t6 = t12 - t11;
+    t12 = t5 - t7;
+    t11 = C13 * t1;
+    t5 = C43 * t3;
+    t7 = t11 + t5;
+    t11 = C13 * t13;
+    t5 = C43 * t2;
+    t11 = t11 + t5;
+    t5 = C43 * t1;
+    t1 = C13 * t3;
+    t3 = t5 - t1;
+    t5 = C43 * t13;
+    t1 = C13 * t2;
+    t13 = t5 - t1;
+    t2 = t8 + t0;
+    t5 = t4 + t9;
+    t1 = t14 + t11;
+    t8 = t10 - t7;
+    t0 = t6 + t13;
+    t4 = t12 - t3;
+    t9 = t6 - t13;
+    t6 = t12 + t3;
+    t13 = t14 - t11;
+    t12 = t10 + t7;
+    re[10] = t2;
+    im[10] = t5;
+    re[28] = t1;
+    im[28] = t8;
+    re[46] = t0;
+    im[46] = t4;
+    re[64] = t9;
+    im[64] = t6;
+    re[82] = t13;
+    im[82] = t12;
+    t3 = re[40];
+    t14 = im[40];
+    t11 = re[58];
+    t10 = im[58];
+    t7 = re[76];
+    t2 = im[76];
+    t5 = re[4];
+    t1 = im[4];
+    t8 = re[22];
+    t0 = im[22];
+    t4 = t11 + t8;
+    t9 = t10 + t0;
+    t6 = t7 + t5;
+    t13 = t2 + t1;
+    t12 = t11 - t8;
+    t11 = t10 - t0;
+    t8 = t7 - t5;
+    t10 = t2 - t1;
+    t0 = t4 + t6;
+    t7 = t9 + t13;
+    t5 = t4 - t6;
+    t2 = C41 * t5;
+    t1 = t9 - t13;
+    t4 = C41 * t1;
+    t6 = C42 * t0;
+    t5 = t3 - t6;
+    t9 = C42 * t7;
+    t13 = t14 - t9;
+    t1 = t5 + t2;
+    t6 = t13 + t4;
+    t9 = t5 - t2;
+    t5 = t13 - t4;
+    t2 = C13 * t12;
+    t13 = C43 * t8;
+    t4 = t2 + t13;
+    t2 = C13 * t11;
+    t13 = C43 * t10;
+    t2 = t2 + t13;
+    t13 = C43 * t12;
+    t12 = C13 * t8;
+    t8 = t13 - t12;
+    t13 = C43 * t11;
+    t12 = C13 * t10;
+    t11 = t13 - t12;
+    t10 = t3 + t0;
+    t13 = t14 + t7;
+    t12 = t1 + t2;
+    t3 = t6 - t4;
+    t0 = t9 + t11;
+    t14 = t5 - t8;
+    t7 = t9 - t11;
+    t9 = t5 + t8;
+    t11 = t1 - t2;
+    t5 = t6 + t4;
+    re[40] = t10;
+    im[40] = t13;
+    re[58] = t12;
+    im[58] = t3;
+    re[76] = t0;
+    im[76] = t14;
+    re[4] = t7;
+    im[4] = t9;
+    re[22] = t11;
+    im[22] = t5;
+    t8 = re[70];
+    t1 = im[70];
+    t2 = re[88];
+    t6 = im[88];
+    t4 = re[16];
+    t10 = im[16];
+    t13 = re[34];
+    t12 = im[34];
+    t3 = re[52];
+    t0 = im[52];
+    t14 = t2 + t3;
+    t7 = t6 + t0;
+    t9 = t4 + t13;
+    t11 = t10 + t12;
+    t5 = t2 - t3;
+    t2 = t6 - t0;
+    t3 = t4 - t13;
+    t6 = t10 - t12;
+    t0 = t14 + t9;
+    t4 = t7 + t11;
+    t13 = t14 - t9;
+    t10 = C41 * t13;
+    t12 = t7 - t11;
+    t14 = C41 * t12;
+    t9 = C42 * t0;
+    t13 = t8 - t9;
+    t7 = C42 * t4;
+    t11 = t1 - t7;
+    t12 = t13 + t10;
+    t9 = t11 + t14;
+    t7 = t13 - t10;
+    t13 = t11 - t14;
+    t10 = C13 * t5;
+    t11 = C43 * t3;
+    t14 = t10 + t11;
+    t10 = C13 * t2;
+    t11 = C43 * t6;
+    t10 = t10 + t11;
+    t11 = C43 * t5;
+    t5 = C13 * t3;
+    t3 = t11 - t5;
+    t11 = C43 * t2;
+    t5 = C13 * t6;
+    t2 = t11 - t5;
+    t6 = t8 + t0;
+    t11 = t1 + t4;
+    t5 = t12 + t10;
+    t8 = t9 - t14;
+    t0 = t7 + t2;
+    t1 = t13 - t3;
+    t4 = t7 - t2;
+    t7 = t13 + t3;
+    t2 = t12 - t10;
+    t13 = t9 + t14;
+    re[70] = t6;
+    im[70] = t11;
+    re[88] = t5;
+    im[88] = t8;
+    re[16] = t0;
+    im[16] = t1;
+    re[34] = t4;
+    im[34] = t7;
+    re[52] = t2;
+    im[52] = t13;
+    t3 = re[20];
+    t12 = im[20];
+    t10 = re[38];
+    t9 = im[38];
+    t14 = re[56];
+    t6 = im[56];
+    t11 = re[74];
+    t5 = im[74];
+    t8 = re[2];
+    t0 = im[2];
+    t1 = t10 + t8;
+    t4 = t9 + t0;
+    t7 = t14 + t11;
+    t2 = t6 + t5;
+    t13 = t10 - t8;
+    t10 = t9 - t0;
+    t8 = t14 - t11;
+    t9 = t6 - t5;
+    t0 = t1 + t7;
+    t14 = t4 + t2;
+    t11 = t1 - t7;
+    t6 = C41 * t11;
+    t5 = t4 - t2;
+    t1 = C41 * t5;
+    t7 = C42 * t0;
+    t11 = t3 - t7;
+    t4 = C42 * t14;
+    t2 = t12 - t4;
+    t5 = t11 + t6;
+    t7 = t2 + t1;
+    t4 = t11 - t6;
+    t11 = t2 - t1;
+    t6 = C13 * t13;
+    t2 = C43 * t8;
+    t1 = t6 + t2;
+    t6 = C13 * t10;
+    t2 = C43 * t9;
+    t6 = t6 + t2;
+    t2 = C43 * t13;
+    t13 = C13 * t8;
+    t8 = t2 - t13;
+    t2 = C43 * t10;
+    t13 = C13 * t9;
+    t10 = t2 - t13;
+    t9 = t3 + t0;
+    t2 = t12 + t14;
+    t13 = t5 + t6;
+    t3 = t7 - t1;
+    t0 = t4 + t10;
+    t12 = t11 - t8;
+    t14 = t4 - t10;
+    t4 = t11 + t8;
+    t10 = t5 - t6;
+    t11 = t7 + t1;
+    re[20] = t9;
+    im[20] = t2;
+    re[38] = t13;
+    im[38] = t3;
+    re[56] = t0;
+    im[56] = t12;
+    re[74] = t14;
+    im[74] = t4;
+    re[2] = t10;
+    im[2] = t11;
+    t8 = re[50];
+    t5 = im[50];
+    t6 = re[68];
+    t7 = im[68];
+    t1 = re[86];
+    t9 = im[86];
+    t2 = re[14];
+    t13 = im[14];
+    t3 = re[32];
+    t0 = im[32];
+    t12 = t6 + t3;
+    t14 = t7 + t0;
+    t4 = t1 + t2;
+    t10 = t9 + t13;
+    t11 = t6 - t3;
+    t6 = t7 - t0;
+    t3 = t1 - t2;
+    t7 = t9 - t13;
+    t0 = t12 + t4;
+    t1 = t14 + t10;
+    t2 = t12 - t4;
+    t9 = C41 * t2;
+    t13 = t14 - t10;
+    t12 = C41 * t13;
+    t4 = C42 * t0;
+    t2 = t8 - t4;
+    t14 = C42 * t1;
+    t10 = t5 - t14;
+    t13 = t2 + t9;
+    t4 = t10 + t12;
+    t14 = t2 - t9;
+    t2 = t10 - t12;
+    t9 = C13 * t11;
+    t10 = C43 * t3;
+    t12 = t9 + t10;
+    t9 = C13 * t6;
+    t10 = C43 * t7;
+    t9 = t9 + t10;
+    t10 = C43 * t11;
+    t11 = C13 * t3;
+    t3 = t10 - t11;
+    t10 = C43 * t6;
+    t11 = C13 * t7;
+    t6 = t10 - t11;
+    t7 = t8 + t0;
+    t10 = t5 + t1;
+    t11 = t13 + t9;
+    t8 = t4 - t12;
+    t0 = t14 + t6;
+    t5 = t2 - t3;
+    t1 = t14 - t6;
+    t14 = t2 + t3;
+    t6 = t13 - t9;
+    t2 = t4 + t12;
+    re[50] = t7;
+    im[50] = t10;
+    re[68] = t11;
+    im[68] = t8;
+    re[86] = t0;
+    im[86] = t5;
+    re[14] = t1;
+    im[14] = t14;
+    re[32] = t6;
+    im[32] = t2;
+    t3 = re[80];
+    t13 = im[80];
+    t9 = re[8];
+    t4 = im[8];
+    t12 = re[26];
+    t7 = im[26];
+    t10 = re[44];
+    t11 = im[44];
+    t8 = re[62];
+    t0 = im[62];
+    t5 = t9 + t8;
+    t1 = t4 + t0;
+    t14 = t12 + t10;
+    t6 = t7 + t11;
+    t2 = t9 - t8;
+    t9 = t4 - t0;
+    t8 = t12 - t10;
+    t4 = t7 - t11;
+    t0 = t5 + t14;
+    t12 = t1 + t6;
+    t10 = t5 - t14;
+    t7 = C41 * t10;
+    t11 = t1 - t6;
+    t5 = C41 * t11;
+    t14 = C42 * t0;
+    t10 = t3 - t14;
+    t1 = C42 * t12;
+    t6 = t13 - t1;
+    t11 = t10 + t7;
+    t14 = t6 + t5;
+    t1 = t10 - t7;
+    t10 = t6 - t5;
+    t7 = C13 * t2;
+    t6 = C43 * t8;
+    t5 = t7 + t6;
+    t7 = C13 * t9;
+    t6 = C43 * t4;
+    t7 = t7 + t6;
+    t6 = C43 * t2;
+    t2 = C13 * t8;
+    t8 = t6 - t2;
+    t6 = C43 * t9;
+    t2 = C13 * t4;
+    t9 = t6 - t2;
+    t4 = t3 + t0;
+    t6 = t13 + t12;
+    t2 = t11 + t7;
+    t3 = t14 - t5;
+    t0 = t1 + t9;
+    t13 = t10 - t8;
+    t12 = t1 - t9;
+    t1 = t10 + t8;
+    t9 = t11 - t7;
+    t10 = t14 + t5;
+    re[80] = t4;
+    im[80] = t6;
+    re[8] = t2;
+    im[8] = t3;
+    re[26] = t0;
+    im[26] = t13;
+    re[44] = t12;
+    im[44] = t1;
+    re[62] = t9;
+    im[62] = t10;
+}
+
+/**
+ *  Part 2 of ApplyWindowedIMDCT_W75_180_K60().
+ * 
+ *  @param {Number[]} X 
+ *    - The input block (180 points, only the first 60 points are used).
+ *  @param {Number[]} y 
+ *    - The array that would contain the output block (360 points).
+ *  @param {Number[]} re 
+ *    - The scratch buffer (real part, 90 points).
+ *  @param {Number[]} im 
+ *    - The scratch buffer (imaginary part, 90 points).
+ */
+function ApplyWindowedIMDCT_W75_180_K60_Part2(X, y, re, im) {
+    let t0, t1, t10, t11, t12, t13, t14, t2, t3, t4, t5, t6, t7, t8, t9;
+    const C0 = 0.9659258262890683;
+    const C1 = 0.25881904510252074;
+    const C2 = 0.5;
+    const C3 = 0.8660254037844386;
+    const C4 = 0.9961946980917455;
+    const C5 = 0.08715574274765817;
+    const C6 = 0.9063077870366499;
+    const C7 = 0.42261826174069944;
+    const C8 = 0.766044443118978;
+    const C9 = 1.4088320528055172;
+    const C10 = 0.12325683343243876;
+    const C11 = 0.17364817766693033;
+    const C12 = 1.1584559306791384;
+    const C13 = 0.8111595753452777;
+    const C14 = 0.9396926207859084;
+    const C15 = 0.5976724774602398;
+    const C16 = 1.281712764111577;
+    const C17 = 0.8910065241883679;
+    const C18 = 0.45399049973954675;
+    const C19 = 0.9986295347545738;
+    const C20 = 0.05233595624294383;
+    const C21 = 0.4993147673772869;
+    const C22 = 0.026167978121471914;
+    const C23 = 0.8648385460668958;
+    const C24 = 0.04532426763774014;
+    const C25 = 0.9563047559630355;
+    const C26 = 0.2923717047227367;
+    const C27 = 0.9743700647852352;
+    const C28 = 0.22495105434386498;
+    const C29 = 0.992546151641322;
+    const C30 = 0.12186934340514748;
+    const C31 = 0.9205048534524404;
+    const C32 = 0.3907311284892737;
+    const C33 = 0.9876883405951378;
+    const C34 = 0.15643446504023087;
+    const C35 = 0.9335804264972017;
+    const C36 = 0.35836794954530027;
+    const C37 = 0.46679021324860087;
+    const C38 = 0.17918397477265013;
+    const C39 = 0.8085043658224875;
+    const C40 = 0.31035574820837;
+    const C41 = 0.9998476951563913;
+    const C42 = 0.01745240643728351;
+    const C43 = 0.8746197071393957;
+    const C44 = 0.48480962024633706;
+    const C45 = 0.981627183447664;
+    const C46 = 0.1908089953765448;
+    const C47 = 0.9455185755993168;
+    const C48 = 0.3255681544571567;
+    const C49 = 0.5590169943749475;
+    const C50 = 0.25;
+    const C51 = 0.9510565162951535;
+    const C52 = 0.5877852522924731;
+    const C53 = 0.9999904807207345;
+    const C54 = 0.004363309284746571;
+    const C55 = 0.7040147244559684;
+    const C56 = 0.7101853756232854;
+    const C57 = 0.6915130557822694;
+    const C58 = 0.7223639620597556;
+    const C59 = 0.9997620270799091;
+    const C60 = 0.02181488503456112;
+    const C61 = 0.9992290362407229;
+    const C62 = 0.03925981575906861;
+    const C63 = 0.6788007455329417;
+    const C64 = 0.7343225094356856;
+    const C65 = 0.6658816660008342;
+    const C66 = 0.7460573750616996;
+    const C67 = 0.9983916705573488;
+    const C68 = 0.056692787563377506;
+    const C69 = 0.9972501850994857;
+    const C70 = 0.07410849019539922;
+    const C71 = 0.6527597524627224;
+    const C72 = 0.7575649843840496;
+    const C73 = 0.6394390019805847;
+    const C74 = 0.7688418320734596;
+    const C75 = 0.9958049275746618;
+    const C76 = 0.09150161866340238;
+    const C77 = 0.9940563382223196;
+    const C78 = 0.10886687485196457;
+    const C79 = 0.6259234721840591;
+    const C80 = 0.7798844830928818;
+    const C81 = 0.6122172800344493;
+    const C82 = 0.7906895737438434;
+    const C83 = 0.992004949679715;
+    const C84 = 0.12619896913582976;
+    const C85 = 0.9896513868196702;
+    const C86 = 0.1434926219911793;
+    const C87 = 0.598324600570659;
+    const C88 = 0.8012538126910607;
+    const C89 = 0.5842496656374344;
+    const C90 = 0.8115739819650123;
+    const C91 = 0.9869963665602319;
+    const C92 = 0.1607425656038261;
+    const C93 = 0.9840406976462909;
+    const C94 = 0.17794354547384175;
+    const C95 = 0.569996762596303;
+    const C96 = 0.8216469379421637;
+    const C97 = 0.5555702330196022;
+    const C98 = 0.8314696123025452;
+    const C99 = 0.9807852804032304;
+    const C100 = 0.19509032201612825;
+    const C101 = 0.9772311064626789;
+    const C102 = 0.21217767215644623;
+    const C103 = 0.5409744713679939;
+    const C104 = 0.8410390129643925;
+    const C105 = 0.5262139236518696;
+    const C106 = 0.8503522249955628;
+    const C107 = 0.9733792584604485;
+    const C108 = 0.22920039092241415;
+    t8 = X[29];
+    t11 = C0 * t8;
+    t7 = C1 * t8;
+    t14 = X[30];
+    t5 = C0 * t14;
+    t4 = (-C1) * t14;
+    t6 = t11 + t5;
+    t2 = t7 + t4;
+    t3 = C2 * t6;
+    t0 = -t3;
+    t13 = C2 * t2;
+    t12 = -t13;
+    t1 = t11 - t5;
+    t9 = C3 * t1;
+    t10 = t7 - t4;
+    t8 = C3 * t10;
+    t14 = t8 - t3;
+    t11 = t12 - t9;
+    t5 = t0 - t8;
+    t1 = t9 - t13;
+    re[45] = t6;
+    im[45] = t2;
+    re[75] = t14;
+    im[75] = t11;
+    re[15] = t5;
+    im[15] = t1;
+    t7 = X[9];
+    t4 = C4 * t7;
+    t10 = C5 * t7;
+    t3 = X[50];
+    t12 = C6 * t3;
+    t0 = (-C7) * t3;
+    t8 = t4 + t12;
+    t9 = t10 + t0;
+    t13 = C2 * t8;
+    t6 = -t13;
+    t2 = C2 * t9;
+    t14 = -t2;
+    t11 = t4 - t12;
+    t5 = C3 * t11;
+    t1 = t10 - t0;
+    t7 = C3 * t1;
+    t3 = t7 - t13;
+    t4 = t14 - t5;
+    t12 = t6 - t7;
+    t11 = t5 - t2;
+    t10 = t3 + t4;
+    t0 = C8 * t10;
+    t1 = t3 * (-C9);
+    t13 = t4 * C10;
+    t14 = t0 - t13;
+    t6 = t0 + t1;
+    t7 = t12 + t11;
+    t5 = C11 * t7;
+    t2 = t12 * (-C12);
+    t10 = t11 * (-C13);
+    t3 = t5 - t10;
+    t4 = t5 + t2;
+    re[55] = t8;
+    im[55] = t9;
+    re[85] = t14;
+    im[85] = t6;
+    re[25] = t3;
+    im[25] = t4;
+    t13 = X[49];
+    t0 = C6 * t13;
+    t1 = C7 * t13;
+    t7 = X[10];
+    t12 = C4 * t7;
+    t11 = (-C5) * t7;
+    t10 = 0.4980973490458728 * t7;
+    t5 = t0 - t10;
+    t2 = (-0.04357787137382908) * t7;
+    t8 = t1 - t2;
+    t9 = 0.8627299156628209 * t7;
+    t14 = (-0.07547908730517332) * t7;
+    t6 = t0 + t12;
+    t3 = t1 + t11;
+    t4 = t5 + t14;
+    t13 = t8 - t9;
+    t10 = t5 - t14;
+    t2 = t8 + t9;
+    t7 = t4 + t13;
+    t0 = C11 * t7;
+    t12 = t4 * (-C12);
+    t1 = t13 * (-C13);
+    t11 = t0 - t1;
+    t5 = t0 + t12;
+    t14 = t10 + t2;
+    t8 = (-C14) * t14;
+    t9 = t10 * C15;
+    t7 = t2 * (-C16);
+    t4 = t8 - t7;
+    t13 = t8 + t9;
+    re[65] = t6;
+    im[65] = t3;
+    re[5] = t11;
+    im[5] = t5;
+    re[35] = t4;
+    im[35] = t13;
+    t1 = re[45];
+    t0 = im[45];
+    t12 = re[55];
+    t14 = im[55];
+    t10 = re[65];
+    t2 = im[65];
+    t7 = t12 + t10;
+    t8 = t14 + t2;
+    t9 = C2 * t7;
+    t6 = t1 - t9;
+    t3 = C2 * t8;
+    t11 = t0 - t3;
+    t5 = t12 - t10;
+    t4 = C3 * t5;
+    t13 = t14 - t2;
+    t9 = C3 * t13;
+    t3 = t1 + t7;
+    t12 = t0 + t8;
+    t10 = t6 + t9;
+    t5 = t11 - t4;
+    t14 = t6 - t9;
+    t2 = t11 + t4;
+    re[45] = t3;
+    im[45] = t12;
+    re[55] = t10;
+    im[55] = t5;
+    re[65] = t14;
+    im[65] = t2;
+    t13 = re[75];
+    t1 = im[75];
+    t7 = re[85];
+    t0 = im[85];
+    t8 = re[5];
+    t6 = im[5];
+    t9 = t7 + t8;
+    t11 = t0 + t6;
+    t4 = C2 * t9;
+    t3 = t13 - t4;
+    t12 = C2 * t11;
+    t10 = t1 - t12;
+    t5 = t7 - t8;
+    t14 = C3 * t5;
+    t2 = t0 - t6;
+    t4 = C3 * t2;
+    t12 = t13 + t9;
+    t7 = t1 + t11;
+    t8 = t3 + t4;
+    t5 = t10 - t14;
+    t0 = t3 - t4;
+    t6 = t10 + t14;
+    re[75] = t12;
+    im[75] = t7;
+    re[85] = t8;
+    im[85] = t5;
+    re[5] = t0;
+    im[5] = t6;
+    t2 = re[15];
+    t13 = im[15];
+    t9 = re[25];
+    t1 = im[25];
+    t11 = re[35];
+    t3 = im[35];
+    t4 = t9 + t11;
+    t10 = t1 + t3;
+    t14 = C2 * t4;
+    t12 = t2 - t14;
+    t7 = C2 * t10;
+    t8 = t13 - t7;
+    t5 = t9 - t11;
+    t0 = C3 * t5;
+    t6 = t1 - t3;
+    t14 = C3 * t6;
+    t7 = t2 + t4;
+    t9 = t13 + t10;
+    t11 = t12 + t14;
+    t5 = t8 - t0;
+    t1 = t12 - t14;
+    t3 = t8 + t0;
+    re[15] = t7;
+    im[15] = t9;
+    re[25] = t11;
+    im[25] = t5;
+    re[35] = t1;
+    im[35] = t3;
+    t6 = X[53];
+    t2 = C17 * t6;
+    t4 = C18 * t6;
+    t13 = X[6];
+    t10 = C19 * t13;
+    t12 = (-C20) * t13;
+    t14 = C21 * t13;
+    t8 = t2 - t14;
+    t0 = (-C22) * t13;
+    t7 = t4 - t0;
+    t9 = C23 * t13;
+    t11 = (-C24) * t13;
+    t5 = t2 + t10;
+    t1 = t4 + t12;
+    t3 = t8 + t11;
+    t6 = t7 - t9;
+    t14 = t8 - t11;
+    t0 = t7 + t9;
+    re[63] = t5;
+    im[63] = t1;
+    re[3] = t3;
+    im[3] = t6;
+    re[33] = t14;
+    im[33] = t0;
+    t13 = X[33];
+    t2 = C25 * t13;
+    t10 = C26 * t13;
+    t4 = X[26];
+    t12 = C27 * t4;
+    t8 = (-C28) * t4;
+    t11 = 0.4871850323926176 * t4;
+    t7 = t2 - t11;
+    t9 = (-0.11247552717193249) * t4;
+    t5 = t10 - t9;
+    t1 = 0.843829228791103 * t4;
+    t3 = (-0.19481332766988085) * t4;
+    t6 = t2 + t12;
+    t14 = t10 + t8;
+    t0 = t7 + t3;
+    t13 = t5 - t1;
+    t11 = t7 - t3;
+    t9 = t5 + t1;
+    t4 = t0 + t13;
+    t2 = C8 * t4;
+    t12 = t0 * (-C9);
+    t10 = t13 * C10;
+    t8 = t2 - t10;
+    t7 = t2 + t12;
+    t3 = t11 + t9;
+    t5 = C11 * t3;
+    t1 = t11 * (-C12);
+    t4 = t9 * (-C13);
+    t0 = t5 - t4;
+    t13 = t5 + t1;
+    re[73] = t6;
+    im[73] = t14;
+    re[13] = t8;
+    im[13] = t7;
+    re[43] = t0;
+    im[43] = t13;
+    t10 = X[13];
+    t2 = C29 * t10;
+    t12 = C30 * t10;
+    t3 = X[46];
+    t11 = C31 * t3;
+    t9 = (-C32) * t3;
+    t4 = 0.4602524267262202 * t3;
+    t5 = t2 - t4;
+    t1 = (-0.19536556424463686) * t3;
+    t6 = t12 - t1;
+    t14 = 0.7971805873966852 * t3;
+    t8 = (-0.33838308332107264) * t3;
+    t7 = t2 + t11;
+    t0 = t12 + t9;
+    t13 = t5 + t8;
+    t10 = t6 - t14;
+    t4 = t5 - t8;
+    t1 = t6 + t14;
+    t3 = t13 + t10;
+    t2 = C11 * t3;
+    t11 = t13 * (-C12);
+    t12 = t10 * (-C13);
+    t9 = t2 - t12;
+    t5 = t2 + t11;
+    t8 = t4 + t1;
+    t6 = (-C14) * t8;
+    t14 = t4 * C15;
+    t3 = t1 * (-C16);
+    t13 = t6 - t3;
+    t10 = t6 + t14;
+    re[83] = t7;
+    im[83] = t0;
+    re[23] = t9;
+    im[23] = t5;
+    re[53] = t13;
+    im[53] = t10;
+    t12 = re[63];
+    t2 = im[63];
+    t11 = re[73];
+    t8 = im[73];
+    t4 = re[83];
+    t1 = im[83];
+    t3 = t11 + t4;
+    t6 = t8 + t1;
+    t14 = C2 * t3;
+    t7 = t12 - t14;
+    t0 = C2 * t6;
+    t9 = t2 - t0;
+    t5 = t11 - t4;
+    t13 = C3 * t5;
+    t10 = t8 - t1;
+    t14 = C3 * t10;
+    t0 = t12 + t3;
+    t11 = t2 + t6;
+    t4 = t7 + t14;
+    t5 = t9 - t13;
+    t8 = t7 - t14;
+    t1 = t9 + t13;
+    re[63] = t0;
+    im[63] = t11;
+    re[73] = t4;
+    im[73] = t5;
+    re[83] = t8;
+    im[83] = t1;
+    t10 = re[3];
+    t12 = im[3];
+    t3 = re[13];
+    t2 = im[13];
+    t6 = re[23];
+    t7 = im[23];
+    t14 = t3 + t6;
+    t9 = t2 + t7;
+    t13 = C2 * t14;
+    t0 = t10 - t13;
+    t11 = C2 * t9;
+    t4 = t12 - t11;
+    t5 = t3 - t6;
+    t8 = C3 * t5;
+    t1 = t2 - t7;
+    t13 = C3 * t1;
+    t11 = t10 + t14;
+    t3 = t12 + t9;
+    t6 = t0 + t13;
+    t5 = t4 - t8;
+    t2 = t0 - t13;
+    t7 = t4 + t8;
+    re[3] = t11;
+    im[3] = t3;
+    re[13] = t6;
+    im[13] = t5;
+    re[23] = t2;
+    im[23] = t7;
+    t1 = re[33];
+    t10 = im[33];
+    t14 = re[43];
+    t12 = im[43];
+    t9 = re[53];
+    t0 = im[53];
+    t13 = t14 + t9;
+    t4 = t12 + t0;
+    t8 = C2 * t13;
+    t11 = t1 - t8;
+    t3 = C2 * t4;
+    t6 = t10 - t3;
+    t5 = t14 - t9;
+    t2 = C3 * t5;
+    t7 = t12 - t0;
+    t8 = C3 * t7;
+    t3 = t1 + t13;
+    t14 = t10 + t4;
+    t9 = t11 + t8;
+    t5 = t6 - t2;
+    t12 = t11 - t8;
+    t0 = t6 + t2;
+    re[33] = t3;
+    im[33] = t14;
+    re[43] = t9;
+    im[43] = t5;
+    re[53] = t12;
+    im[53] = t0;
+    t7 = X[17];
+    t1 = C33 * t7;
+    t13 = C34 * t7;
+    t10 = X[42];
+    t4 = C35 * t10;
+    t11 = (-C36) * t10;
+    t8 = C37 * t10;
+    t6 = t1 - t8;
+    t2 = (-C38) * t10;
+    t3 = t13 - t2;
+    t14 = C39 * t10;
+    t9 = (-C40) * t10;
+    t5 = t1 + t4;
+    t12 = t13 + t11;
+    t0 = t6 + t9;
+    t7 = t3 - t14;
+    t8 = t6 - t9;
+    t2 = t3 + t14;
+    re[81] = t5;
+    im[81] = t12;
+    re[21] = t0;
+    im[21] = t7;
+    re[51] = t8;
+    im[51] = t2;
+    t10 = X[2];
+    t1 = C41 * t10;
+    t4 = (-C42) * t10;
+    t13 = X[57];
+    t11 = C43 * t13;
+    t6 = C44 * t13;
+    t9 = 0.43730985356969787 * t13;
+    t3 = t1 - t9;
+    t14 = 0.24240481012316853 * t13;
+    t5 = t4 - t14;
+    t12 = (-0.7574428850332227) * t13;
+    t0 = (-0.4198574471324144) * t13;
+    t7 = t1 + t11;
+    t8 = t4 + t6;
+    t2 = t3 + t0;
+    t10 = t5 - t12;
+    t9 = t3 - t0;
+    t14 = t5 + t12;
+    t13 = t2 + t10;
+    t1 = C8 * t13;
+    t11 = t2 * (-C9);
+    t4 = t10 * C10;
+    t6 = t1 - t4;
+    t3 = t1 + t11;
+    t0 = t9 + t14;
+    t5 = C11 * t0;
+    t12 = t9 * (-C12);
+    t13 = t14 * (-C13);
+    t2 = t5 - t13;
+    t10 = t5 + t12;
+    re[1] = t7;
+    im[1] = t8;
+    re[31] = t6;
+    im[31] = t3;
+    re[61] = t2;
+    im[61] = t10;
+    t4 = X[22];
+    t1 = C45 * t4;
+    t11 = (-C46) * t4;
+    t0 = X[37];
+    t9 = C47 * t0;
+    t14 = C48 * t0;
+    t13 = 0.4727592877996584 * t0;
+    t5 = t1 - t13;
+    t12 = 0.16278407722857835 * t0;
+    t7 = t11 - t12;
+    t8 = (-0.8188431062190856) * t0;
+    t6 = (-0.2819502924231136) * t0;
+    t3 = t1 + t9;
+    t2 = t11 + t14;
+    t10 = t5 + t6;
+    t4 = t7 - t8;
+    t13 = t5 - t6;
+    t12 = t7 + t8;
+    t0 = t10 + t4;
+    t1 = C11 * t0;
+    t9 = t10 * (-C12);
+    t11 = t4 * (-C13);
+    t14 = t1 - t11;
+    t5 = t1 + t9;
+    t6 = t13 + t12;
+    t7 = (-C14) * t6;
+    t8 = t13 * C15;
+    t0 = t12 * (-C16);
+    t10 = t7 - t0;
+    t4 = t7 + t8;
+    re[11] = t3;
+    im[11] = t2;
+    re[41] = t14;
+    im[41] = t5;
+    re[71] = t10;
+    im[71] = t4;
+    t11 = re[81];
+    t1 = im[81];
+    t9 = re[1];
+    t6 = im[1];
+    t13 = re[11];
+    t12 = im[11];
+    t0 = t9 + t13;
+    t7 = t6 + t12;
+    t8 = C2 * t0;
+    t3 = t11 - t8;
+    t2 = C2 * t7;
+    t14 = t1 - t2;
+    t5 = t9 - t13;
+    t10 = C3 * t5;
+    t4 = t6 - t12;
+    t8 = C3 * t4;
+    t2 = t11 + t0;
+    t9 = t1 + t7;
+    t13 = t3 + t8;
+    t5 = t14 - t10;
+    t6 = t3 - t8;
+    t12 = t14 + t10;
+    re[81] = t2;
+    im[81] = t9;
+    re[1] = t13;
+    im[1] = t5;
+    re[11] = t6;
+    im[11] = t12;
+    t4 = re[21];
+    t11 = im[21];
+    t0 = re[31];
+    t1 = im[31];
+    t7 = re[41];
+    t3 = im[41];
+    t8 = t0 + t7;
+    t14 = t1 + t3;
+    t10 = C2 * t8;
+    t2 = t4 - t10;
+    t9 = C2 * t14;
+    t13 = t11 - t9;
+    t5 = t0 - t7;
+    t6 = C3 * t5;
+    t12 = t1 - t3;
+    t10 = C3 * t12;
+    t9 = t4 + t8;
+    t0 = t11 + t14;
+    t7 = t2 + t10;
+    t5 = t13 - t6;
+    t1 = t2 - t10;
+    t3 = t13 + t6;
+    re[21] = t9;
+    im[21] = t0;
+    re[31] = t7;
+    im[31] = t5;
+    re[41] = t1;
+    im[41] = t3;
+    t12 = re[51];
+    t4 = im[51];
+    t8 = re[61];
+    t11 = im[61];
+    t14 = re[71];
+    t2 = im[71];
+    t10 = t8 + t14;
+    t13 = t11 + t2;
+    t6 = C2 * t10;
+    t9 = t12 - t6;
+    t0 = C2 * t13;
+    t7 = t4 - t0;
+    t5 = t8 - t14;
+    t1 = C3 * t5;
+    t3 = t11 - t2;
+    t6 = C3 * t3;
+    t0 = t12 + t10;
+    t8 = t4 + t13;
+    t14 = t9 + t6;
+    t5 = t7 - t1;
+    t11 = t9 - t6;
+    t2 = t7 + t1;
+    re[51] = t0;
+    im[51] = t8;
+    re[61] = t14;
+    im[61] = t5;
+    re[71] = t11;
+    im[71] = t2;
+    t3 = X[18];
+    t12 = C33 * t3;
+    t10 = (-C34) * t3;
+    t4 = X[41];
+    t13 = C35 * t4;
+    t9 = C36 * t4;
+    t6 = C37 * t4;
+    t7 = t12 - t6;
+    t1 = C38 * t4;
+    t0 = t10 - t1;
+    t8 = (-C39) * t4;
+    t14 = (-C40) * t4;
+    t5 = t12 + t13;
+    t11 = t10 + t9;
+    t2 = t7 + t14;
+    t3 = t0 - t8;
+    t6 = t7 - t14;
+    t1 = t0 + t8;
+    re[9] = t5;
+    im[9] = t11;
+    re[39] = t2;
+    im[39] = t3;
+    re[69] = t6;
+    im[69] = t1;
+    t4 = X[38];
+    t12 = C47 * t4;
+    t13 = (-C48) * t4;
+    t10 = X[21];
+    t9 = C45 * t10;
+    t7 = C46 * t10;
+    t14 = 0.490813591723832 * t10;
+    t0 = t12 - t14;
+    t8 = 0.0954044976882724 * t10;
+    t5 = t13 - t8;
+    t11 = (-0.8501140779110443) * t10;
+    t2 = (-0.1652454372666753) * t10;
+    t3 = t12 + t9;
+    t6 = t13 + t7;
+    t1 = t0 + t2;
+    t4 = t5 - t11;
+    t14 = t0 - t2;
+    t8 = t5 + t11;
+    t10 = t1 + t4;
+    t12 = C8 * t10;
+    t9 = t1 * (-C9);
+    t13 = t4 * C10;
+    t7 = t12 - t13;
+    t0 = t12 + t9;
+    t2 = t14 + t8;
+    t5 = C11 * t2;
+    t11 = t14 * (-C12);
+    t10 = t8 * (-C13);
+    t1 = t5 - t10;
+    t4 = t5 + t11;
+    re[19] = t3;
+    im[19] = t6;
+    re[49] = t7;
+    im[49] = t0;
+    re[79] = t1;
+    im[79] = t4;
+    t13 = X[58];
+    t12 = C43 * t13;
+    t9 = (-C44) * t13;
+    t2 = X[1];
+    t14 = C41 * t2;
+    t8 = C42 * t2;
+    t10 = 0.49992384757819563 * t2;
+    t5 = t12 - t10;
+    t11 = 0.008726203218641756 * t2;
+    t3 = t9 - t11;
+    t6 = (-0.865893503920754) * t2;
+    t7 = (-0.015114227331858588) * t2;
+    t0 = t12 + t14;
+    t1 = t9 + t8;
+    t4 = t5 + t7;
+    t13 = t3 - t6;
+    t10 = t5 - t7;
+    t11 = t3 + t6;
+    t2 = t4 + t13;
+    t12 = C11 * t2;
+    t14 = t4 * (-C12);
+    t9 = t13 * (-C13);
+    t8 = t12 - t9;
+    t5 = t12 + t14;
+    t7 = t10 + t11;
+    t3 = (-C14) * t7;
+    t6 = t10 * C15;
+    t2 = t11 * (-C16);
+    t4 = t3 - t2;
+    t13 = t3 + t6;
+    re[29] = t0;
+    im[29] = t1;
+    re[59] = t8;
+    im[59] = t5;
+    re[89] = t4;
+    im[89] = t13;
+    t9 = re[9];
+    t12 = im[9];
+    t14 = re[19];
+    t7 = im[19];
+    t10 = re[29];
+    t11 = im[29];
+    t2 = t14 + t10;
+    t3 = t7 + t11;
+    t6 = C2 * t2;
+    t0 = t9 - t6;
+    t1 = C2 * t3;
+    t8 = t12 - t1;
+    t5 = t14 - t10;
+    t4 = C3 * t5;
+    t13 = t7 - t11;
+    t6 = C3 * t13;
+    t1 = t9 + t2;
+    t14 = t12 + t3;
+    t10 = t0 + t6;
+    t5 = t8 - t4;
+    t7 = t0 - t6;
+    t11 = t8 + t4;
+    re[9] = t1;
+    im[9] = t14;
+    re[19] = t10;
+    im[19] = t5;
+    re[29] = t7;
+    im[29] = t11;
+    t13 = re[39];
+    t9 = im[39];
+    t2 = re[49];
+    t12 = im[49];
+    t3 = re[59];
+    t0 = im[59];
+    t6 = t2 + t3;
+    t8 = t12 + t0;
+    t4 = C2 * t6;
+    t1 = t13 - t4;
+    t14 = C2 * t8;
+    t10 = t9 - t14;
+    t5 = t2 - t3;
+    t7 = C3 * t5;
+    t11 = t12 - t0;
+    t4 = C3 * t11;
+    t14 = t13 + t6;
+    t2 = t9 + t8;
+    t3 = t1 + t4;
+    t5 = t10 - t7;
+    t12 = t1 - t4;
+    t0 = t10 + t7;
+    re[39] = t14;
+    im[39] = t2;
+    re[49] = t3;
+    im[49] = t5;
+    re[59] = t12;
+    im[59] = t0;
+    t11 = re[69];
+    t13 = im[69];
+    t6 = re[79];
+    t9 = im[79];
+    t8 = re[89];
+    t1 = im[89];
+    t4 = t6 + t8;
+    t10 = t9 + t1;
+    t7 = C2 * t4;
+    t14 = t11 - t7;
+    t2 = C2 * t10;
+    t3 = t13 - t2;
+    t5 = t6 - t8;
+    t12 = C3 * t5;
+    t0 = t9 - t1;
+    t7 = C3 * t0;
+    t2 = t11 + t4;
+    t6 = t13 + t10;
+    t8 = t14 + t7;
+    t5 = t3 - t12;
+    t9 = t14 - t7;
+    t1 = t3 + t12;
+    re[69] = t2;
+    im[69] = t6;
+    re[79] = t8;
+    im[79] = t5;
+    re[89] = t9;
+    im[89] = t1;
+    t0 = X[54];
+    t11 = C17 * t0;
+    t4 = (-C18) * t0;
+    t13 = X[5];
+    t10 = C19 * t13;
+    t14 = C20 * t13;
+    t7 = C21 * t13;
+    t3 = t11 - t7;
+    t12 = C22 * t13;
+    t2 = t4 - t12;
+    t6 = (-C23) * t13;
+    t8 = (-C24) * t13;
+    t5 = t11 + t10;
+    t9 = t4 + t14;
+    t1 = t3 + t8;
+    t0 = t2 - t6;
+    t7 = t3 - t8;
+    t12 = t2 + t6;
+    re[27] = t5;
+    im[27] = t9;
+    re[57] = t1;
+    im[57] = t0;
+    re[87] = t7;
+    im[87] = t12;
+    t13 = X[45];
+    t11 = C31 * t13;
+    t10 = C32 * t13;
+    t4 = X[14];
+    t14 = C29 * t4;
+    t3 = (-C30) * t4;
+    t8 = t11 + t14;
+    t2 = t10 + t3;
+    t6 = C2 * t8;
+    t5 = -t6;
+    t9 = C2 * t2;
+    t1 = -t9;
+    t0 = t11 - t14;
+    t7 = C3 * t0;
+    t12 = t10 - t3;
+    t13 = C3 * t12;
+    t4 = t13 - t6;
+    t11 = t1 - t7;
+    t14 = t5 - t13;
+    t0 = t7 - t9;
+    t10 = t4 + t11;
+    t3 = C8 * t10;
+    t12 = t4 * (-C9);
+    t6 = t11 * C10;
+    t1 = t3 - t6;
+    t5 = t3 + t12;
+    t13 = t14 + t0;
+    t7 = C11 * t13;
+    t9 = t14 * (-C12);
+    t10 = t0 * (-C13);
+    t4 = t7 - t10;
+    t11 = t7 + t9;
+    re[37] = t8;
+    im[37] = t2;
+    re[67] = t1;
+    im[67] = t5;
+    re[7] = t4;
+    im[7] = t11;
+    t6 = X[25];
+    t3 = C27 * t6;
+    t12 = C28 * t6;
+    t13 = X[34];
+    t14 = C25 * t13;
+    t0 = (-C26) * t13;
+    t10 = t3 + t14;
+    t7 = t12 + t0;
+    t9 = C2 * t10;
+    t8 = -t9;
+    t2 = C2 * t7;
+    t1 = -t2;
+    t5 = t3 - t14;
+    t4 = C3 * t5;
+    t11 = t12 - t0;
+    t6 = C3 * t11;
+    t13 = t6 - t9;
+    t3 = t1 - t4;
+    t14 = t8 - t6;
+    t5 = t4 - t2;
+    t12 = t13 + t3;
+    t0 = C11 * t12;
+    t11 = t13 * (-C12);
+    t9 = t3 * (-C13);
+    t1 = t0 - t9;
+    t8 = t0 + t11;
+    t6 = t14 + t5;
+    t4 = (-C14) * t6;
+    t2 = t14 * C15;
+    t12 = t5 * (-C16);
+    t13 = t4 - t12;
+    t3 = t4 + t2;
+    re[47] = t10;
+    im[47] = t7;
+    re[77] = t1;
+    im[77] = t8;
+    re[17] = t13;
+    im[17] = t3;
+    t9 = re[27];
+    t0 = im[27];
+    t11 = re[37];
+    t6 = im[37];
+    t14 = re[47];
+    t5 = im[47];
+    t12 = t11 + t14;
+    t4 = t6 + t5;
+    t2 = C2 * t12;
+    t10 = t9 - t2;
+    t7 = C2 * t4;
+    t1 = t0 - t7;
+    t8 = t11 - t14;
+    t13 = C3 * t8;
+    t3 = t6 - t5;
+    t2 = C3 * t3;
+    t7 = t9 + t12;
+    t11 = t0 + t4;
+    t14 = t10 + t2;
+    t8 = t1 - t13;
+    t6 = t10 - t2;
+    t5 = t1 + t13;
+    re[27] = t7;
+    im[27] = t11;
+    re[37] = t14;
+    im[37] = t8;
+    re[47] = t6;
+    im[47] = t5;
+    t3 = re[57];
+    t9 = im[57];
+    t12 = re[67];
+    t0 = im[67];
+    t4 = re[77];
+    t10 = im[77];
+    t2 = t12 + t4;
+    t1 = t0 + t10;
+    t13 = C2 * t2;
+    t7 = t3 - t13;
+    t11 = C2 * t1;
+    t14 = t9 - t11;
+    t8 = t12 - t4;
+    t6 = C3 * t8;
+    t5 = t0 - t10;
+    t13 = C3 * t5;
+    t11 = t3 + t2;
+    t12 = t9 + t1;
+    t4 = t7 + t13;
+    t8 = t14 - t6;
+    t0 = t7 - t13;
+    t10 = t14 + t6;
+    re[57] = t11;
+    im[57] = t12;
+    re[67] = t4;
+    im[67] = t8;
+    re[77] = t0;
+    im[77] = t10;
+    t5 = re[87];
+    t3 = im[87];
+    t2 = re[7];
+    t9 = im[7];
+    t1 = re[17];
+    t7 = im[17];
+    t13 = t2 + t1;
+    t14 = t9 + t7;
+    t6 = C2 * t13;
+    t11 = t5 - t6;
+    t12 = C2 * t14;
+    t4 = t3 - t12;
+    t8 = t2 - t1;
+    t0 = C3 * t8;
+    t10 = t9 - t7;
+    t6 = C3 * t10;
+    t12 = t5 + t13;
+    t2 = t3 + t14;
+    t1 = t11 + t6;
+    t8 = t4 - t0;
+    t9 = t11 - t6;
+    t7 = t4 + t0;
+    re[87] = t12;
+    im[87] = t2;
+    re[7] = t1;
+    im[7] = t8;
+    re[17] = t9;
+    im[17] = t7;
+    t10 = re[45];
+    t5 = im[45];
+    t13 = re[63];
+    t3 = im[63];
+    t14 = re[81];
+    t11 = im[81];
+    t6 = re[9];
+    t4 = im[9];
+    t0 = re[27];
+    t12 = im[27];
+    t2 = t13 + t0;
+    t1 = t3 + t12;
+    t8 = t14 + t6;
+    t9 = t11 + t4;
+    t7 = t13 - t0;
+    t13 = t3 - t12;
+    t0 = t14 - t6;
+    t3 = t11 - t4;
+    t12 = t2 + t8;
+    t14 = t1 + t9;
+    t6 = t2 - t8;
+    t11 = C49 * t6;
+    t4 = t1 - t9;
+    t2 = C49 * t4;
+    t8 = C50 * t12;
+    t6 = t10 - t8;
+    t1 = C50 * t14;
+    t9 = t5 - t1;
+    t4 = t6 + t11;
+    t8 = t9 + t2;
+    t1 = t6 - t11;
+    t6 = t9 - t2;
+    t11 = C51 * t7;
+    t9 = C52 * t0;
+    t2 = t11 + t9;
+    t11 = C51 * t13;
+    t9 = C52 * t3;
+    t11 = t11 + t9;
+    t9 = C52 * t7;
+    t7 = C51 * t0;
+    t0 = t9 - t7;
+    t9 = C52 * t13;
+    t7 = C51 * t3;
+    t13 = t9 - t7;
+    t3 = t10 + t12;
+    t9 = t5 + t14;
+    t7 = t4 + t11;
+    t10 = t8 - t2;
+    t12 = t1 + t13;
+    t5 = t6 - t0;
+    t14 = t1 - t13;
+    t1 = t6 + t0;
+    t13 = t4 - t11;
+    t6 = t8 + t2;
+    re[45] = t3;
+    im[45] = t9;
+    re[63] = t7;
+    im[63] = t10;
+    re[81] = t12;
+    im[81] = t5;
+    re[9] = t14;
+    im[9] = t1;
+    re[27] = t13;
+    im[27] = t6;
+    t0 = re[75];
+    t4 = im[75];
+    t11 = re[3];
+    t8 = im[3];
+    t2 = re[21];
+    t3 = im[21];
+    t9 = re[39];
+    t7 = im[39];
+    t10 = re[57];
+    t12 = im[57];
+    t5 = t11 + t10;
+    t14 = t8 + t12;
+    t1 = t2 + t9;
+    t13 = t3 + t7;
+    t6 = t11 - t10;
+    t11 = t8 - t12;
+    t10 = t2 - t9;
+    t8 = t3 - t7;
+    t12 = t5 + t1;
+    t2 = t14 + t13;
+    t9 = t5 - t1;
+    t3 = C49 * t9;
+    t7 = t14 - t13;
+    t5 = C49 * t7;
+    t1 = C50 * t12;
+    t9 = t0 - t1;
+    t14 = C50 * t2;
+    t13 = t4 - t14;
+    t7 = t9 + t3;
+    t1 = t13 + t5;
+    t14 = t9 - t3;
+    t9 = t13 - t5;
+    t3 = C51 * t6;
+    t13 = C52 * t10;
+    t5 = t3 + t13;
+    t3 = C51 * t11;
+    t13 = C52 * t8;
+    t3 = t3 + t13;
+    t13 = C52 * t6;
+    t6 = C51 * t10;
+    t10 = t13 - t6;
+    t13 = C52 * t11;
+    t6 = C51 * t8;
+    t11 = t13 - t6;
+    t8 = t0 + t12;
+    t13 = t4 + t2;
+    t6 = t7 + t3;
+    t0 = t1 - t5;
+    t12 = t14 + t11;
+    t4 = t9 - t10;
+    t2 = t14 - t11;
+    t14 = t9 + t10;
+    t11 = t7 - t3;
+    t9 = t1 + t5;
+    re[75] = t8;
+    im[75] = t13;
+    re[3] = t6;
+    im[3] = t0;
+    re[21] = t12;
+    im[21] = t4;
+    re[39] = t2;
+    im[39] = t14;
+    re[57] = t11;
+    im[57] = t9;
+    t10 = re[15];
+    t7 = im[15];
+    t3 = re[33];
+    t1 = im[33];
+    t5 = re[51];
+    t8 = im[51];
+    t13 = re[69];
+    t6 = im[69];
+    t0 = re[87];
+    t12 = im[87];
+    t4 = t3 + t0;
+    t2 = t1 + t12;
+    t14 = t5 + t13;
+    t11 = t8 + t6;
+    t9 = t3 - t0;
+    t3 = t1 - t12;
+    t0 = t5 - t13;
+    t1 = t8 - t6;
+    t12 = t4 + t14;
+    t5 = t2 + t11;
+    t13 = t4 - t14;
+    t8 = C49 * t13;
+    t6 = t2 - t11;
+    t4 = C49 * t6;
+    t14 = C50 * t12;
+    t13 = t10 - t14;
+    t2 = C50 * t5;
+    t11 = t7 - t2;
+    t6 = t13 + t8;
+    t14 = t11 + t4;
+    t2 = t13 - t8;
+    t13 = t11 - t4;
+    t8 = C51 * t9;
+    t11 = C52 * t0;
+    t4 = t8 + t11;
+    t8 = C51 * t3;
+    t11 = C52 * t1;
+    t8 = t8 + t11;
+    t11 = C52 * t9;
+    t9 = C51 * t0;
+    t0 = t11 - t9;
+    t11 = C52 * t3;
+    t9 = C51 * t1;
+    t3 = t11 - t9;
+    t1 = t10 + t12;
+    t11 = t7 + t5;
+    t9 = t6 + t8;
+    t10 = t14 - t4;
+    t12 = t2 + t3;
+    t7 = t13 - t0;
+    t5 = t2 - t3;
+    t2 = t13 + t0;
+    t3 = t6 - t8;
+    t13 = t14 + t4;
+    re[15] = t1;
+    im[15] = t11;
+    re[33] = t9;
+    im[33] = t10;
+    re[51] = t12;
+    im[51] = t7;
+    re[69] = t5;
+    im[69] = t2;
+    re[87] = t3;
+    im[87] = t13;
+    t0 = re[55];
+    t6 = im[55];
+    t8 = re[73];
+    t14 = im[73];
+    t4 = re[1];
+    t1 = im[1];
+    t11 = re[19];
+    t9 = im[19];
+    t10 = re[37];
+    t12 = im[37];
+    t7 = t8 + t10;
+    t5 = t14 + t12;
+    t2 = t4 + t11;
+    t3 = t1 + t9;
+    t13 = t8 - t10;
+    t8 = t14 - t12;
+    t10 = t4 - t11;
+    t14 = t1 - t9;
+    t12 = t7 + t2;
+    t4 = t5 + t3;
+    t11 = t7 - t2;
+    t1 = C49 * t11;
+    t9 = t5 - t3;
+    t7 = C49 * t9;
+    t2 = C50 * t12;
+    t11 = t0 - t2;
+    t5 = C50 * t4;
+    t3 = t6 - t5;
+    t9 = t11 + t1;
+    t2 = t3 + t7;
+    t5 = t11 - t1;
+    t11 = t3 - t7;
+    t1 = C51 * t13;
+    t3 = C52 * t10;
+    t7 = t1 + t3;
+    t1 = C51 * t8;
+    t3 = C52 * t14;
+    t1 = t1 + t3;
+    t3 = C52 * t13;
+    t13 = C51 * t10;
+    t10 = t3 - t13;
+    t3 = C52 * t8;
+    t13 = C51 * t14;
+    t8 = t3 - t13;
+    t14 = t0 + t12;
+    t3 = t6 + t4;
+    t13 = t9 + t1;
+    t0 = t2 - t7;
+    t12 = t5 + t8;
+    t6 = t11 - t10;
+    t4 = t5 - t8;
+    t5 = t11 + t10;
+    t8 = t9 - t1;
+    t11 = t2 + t7;
+    re[55] = t14;
+    im[55] = t3;
+    re[73] = t13;
+    im[73] = t0;
+    re[1] = t12;
+    im[1] = t6;
+    re[19] = t4;
+    im[19] = t5;
+    re[37] = t8;
+    im[37] = t11;
+    t10 = re[85];
+    t9 = im[85];
+    t1 = re[13];
+    t2 = im[13];
+    t7 = re[31];
+    t14 = im[31];
+    t3 = re[49];
+    t13 = im[49];
+    t0 = re[67];
+    t12 = im[67];
+    t6 = t1 + t0;
+    t4 = t2 + t12;
+    t5 = t7 + t3;
+    t8 = t14 + t13;
+    t11 = t1 - t0;
+    t1 = t2 - t12;
+    t0 = t7 - t3;
+    t2 = t14 - t13;
+    t12 = t6 + t5;
+    t7 = t4 + t8;
+    t3 = t6 - t5;
+    t14 = C49 * t3;
+    t13 = t4 - t8;
+    t6 = C49 * t13;
+    t5 = C50 * t12;
+    t3 = t10 - t5;
+    t4 = C50 * t7;
+    t8 = t9 - t4;
+    t13 = t3 + t14;
+    t5 = t8 + t6;
+    t4 = t3 - t14;
+    t3 = t8 - t6;
+    t14 = C51 * t11;
+    t8 = C52 * t0;
+    t6 = t14 + t8;
+    t14 = C51 * t1;
+    t8 = C52 * t2;
+    t14 = t14 + t8;
+    t8 = C52 * t11;
+    t11 = C51 * t0;
+    t0 = t8 - t11;
+    t8 = C52 * t1;
+    t11 = C51 * t2;
+    t1 = t8 - t11;
+    t2 = t10 + t12;
+    t8 = t9 + t7;
+    t11 = t13 + t14;
+    t10 = t5 - t6;
+    t12 = t4 + t1;
+    t9 = t3 - t0;
+    t7 = t4 - t1;
+    t4 = t3 + t0;
+    t1 = t13 - t14;
+    t3 = t5 + t6;
+    re[85] = t2;
+    im[85] = t8;
+    re[13] = t11;
+    im[13] = t10;
+    re[31] = t12;
+    im[31] = t9;
+    re[49] = t7;
+    im[49] = t4;
+    re[67] = t1;
+    im[67] = t3;
+    t0 = re[25];
+    t13 = im[25];
+    t14 = re[43];
+    t5 = im[43];
+    t6 = re[61];
+    t2 = im[61];
+    t8 = re[79];
+    t11 = im[79];
+    t10 = re[7];
+    t12 = im[7];
+    t9 = t14 + t10;
+    t7 = t5 + t12;
+    t4 = t6 + t8;
+    t1 = t2 + t11;
+    t3 = t14 - t10;
+    t14 = t5 - t12;
+    t10 = t6 - t8;
+    t5 = t2 - t11;
+    t12 = t9 + t4;
+    t6 = t7 + t1;
+    t8 = t9 - t4;
+    t2 = C49 * t8;
+    t11 = t7 - t1;
+    t9 = C49 * t11;
+    t4 = C50 * t12;
+    t8 = t0 - t4;
+    t7 = C50 * t6;
+    t1 = t13 - t7;
+    t11 = t8 + t2;
+    t4 = t1 + t9;
+    t7 = t8 - t2;
+    t8 = t1 - t9;
+    t2 = C51 * t3;
+    t1 = C52 * t10;
+    t9 = t2 + t1;
+    t2 = C51 * t14;
+    t1 = C52 * t5;
+    t2 = t2 + t1;
+    t1 = C52 * t3;
+    t3 = C51 * t10;
+    t10 = t1 - t3;
+    t1 = C52 * t14;
+    t3 = C51 * t5;
+    t14 = t1 - t3;
+    t5 = t0 + t12;
+    t1 = t13 + t6;
+    t3 = t11 + t2;
+    t0 = t4 - t9;
+    t12 = t7 + t14;
+    t13 = t8 - t10;
+    t6 = t7 - t14;
+    t7 = t8 + t10;
+    t14 = t11 - t2;
+    t8 = t4 + t9;
+    re[25] = t5;
+    im[25] = t1;
+    re[43] = t3;
+    im[43] = t0;
+    re[61] = t12;
+    im[61] = t13;
+    re[79] = t6;
+    im[79] = t7;
+    re[7] = t14;
+    im[7] = t8;
+    t10 = re[65];
+    t11 = im[65];
+    t2 = re[83];
+    t4 = im[83];
+    t9 = re[11];
+    t5 = im[11];
+    t1 = re[29];
+    t3 = im[29];
+    t0 = re[47];
+    t12 = im[47];
+    t13 = t2 + t0;
+    t6 = t4 + t12;
+    t7 = t9 + t1;
+    t14 = t5 + t3;
+    t8 = t2 - t0;
+    t2 = t4 - t12;
+    t0 = t9 - t1;
+    t4 = t5 - t3;
+    t12 = t13 + t7;
+    t9 = t6 + t14;
+    t1 = t13 - t7;
+    t5 = C49 * t1;
+    t3 = t6 - t14;
+    t13 = C49 * t3;
+    t7 = C50 * t12;
+    t1 = t10 - t7;
+    t6 = C50 * t9;
+    t14 = t11 - t6;
+    t3 = t1 + t5;
+    t7 = t14 + t13;
+    t6 = t1 - t5;
+    t1 = t14 - t13;
+    t5 = C51 * t8;
+    t14 = C52 * t0;
+    t13 = t5 + t14;
+    t5 = C51 * t2;
+    t14 = C52 * t4;
+    t5 = t5 + t14;
+    t14 = C52 * t8;
+    t8 = C51 * t0;
+    t0 = t14 - t8;
+    t14 = C52 * t2;
+    t8 = C51 * t4;
+    t2 = t14 - t8;
+    t4 = t10 + t12;
+    t14 = t11 + t9;
+    t8 = t3 + t5;
+    t10 = t7 - t13;
+    t12 = t6 + t2;
+    t11 = t1 - t0;
+    t9 = t6 - t2;
+    t6 = t1 + t0;
+    t2 = t3 - t5;
+    t1 = t7 + t13;
+    re[65] = t4;
+    im[65] = t14;
+    re[83] = t8;
+    im[83] = t10;
+    re[11] = t12;
+    im[11] = t11;
+    re[29] = t9;
+    im[29] = t6;
+    re[47] = t2;
+    im[47] = t1;
+    t0 = re[5];
+    t3 = im[5];
+    t5 = re[23];
+    t7 = im[23];
+    t13 = re[41];
+    t4 = im[41];
+    t14 = re[59];
+    t8 = im[59];
+    t10 = re[77];
+    t12 = im[77];
+    t11 = t5 + t10;
+    t9 = t7 + t12;
+    t6 = t13 + t14;
+    t2 = t4 + t8;
+    t1 = t5 - t10;
+    t5 = t7 - t12;
+    t10 = t13 - t14;
+    t7 = t4 - t8;
+    t12 = t11 + t6;
+    t13 = t9 + t2;
+    t14 = t11 - t6;
+    t4 = C49 * t14;
+    t8 = t9 - t2;
+    t11 = C49 * t8;
+    t6 = C50 * t12;
+    t14 = t0 - t6;
+    t9 = C50 * t13;
+    t2 = t3 - t9;
+    t8 = t14 + t4;
+    t6 = t2 + t11;
+    t9 = t14 - t4;
+    t14 = t2 - t11;
+    t4 = C51 * t1;
+    t2 = C52 * t10;
+    t11 = t4 + t2;
+    t4 = C51 * t5;
+    t2 = C52 * t7;
+    t4 = t4 + t2;
+    t2 = C52 * t1;
+    t1 = C51 * t10;
+    t10 = t2 - t1;
+    t2 = C52 * t5;
+    t1 = C51 * t7;
+    t5 = t2 - t1;
+    t7 = t0 + t12;
+    t2 = t3 + t13;
+    t1 = t8 + t4;
+    t0 = t6 - t11;
+    t12 = t9 + t5;
+    t3 = t14 - t10;
+    t13 = t9 - t5;
+    t9 = t14 + t10;
+    t5 = t8 - t4;
+    t14 = t6 + t11;
+    re[5] = t7;
+    im[5] = t2;
+    re[23] = t1;
+    im[23] = t0;
+    re[41] = t12;
+    im[41] = t3;
+    re[59] = t13;
+    im[59] = t9;
+    re[77] = t5;
+    im[77] = t14;
+    t10 = re[35];
+    t8 = im[35];
+    t4 = re[53];
+    t6 = im[53];
+    t11 = re[71];
+    t7 = im[71];
+    t2 = re[89];
+    t1 = im[89];
+    t0 = re[17];
+    t12 = im[17];
+    t3 = t4 + t0;
+    t13 = t6 + t12;
+    t9 = t11 + t2;
+    t5 = t7 + t1;
+    t14 = t4 - t0;
+    t4 = t6 - t12;
+    t0 = t11 - t2;
+    t6 = t7 - t1;
+    t12 = t3 + t9;
+    t11 = t13 + t5;
+    t2 = t3 - t9;
+    t7 = C49 * t2;
+    t1 = t13 - t5;
+    t3 = C49 * t1;
+    t9 = C50 * t12;
+    t2 = t10 - t9;
+    t13 = C50 * t11;
+    t5 = t8 - t13;
+    t1 = t2 + t7;
+    t9 = t5 + t3;
+    t13 = t2 - t7;
+    t2 = t5 - t3;
+    t7 = C51 * t14;
+    t5 = C52 * t0;
+    t3 = t7 + t5;
+    t7 = C51 * t4;
+    t5 = C52 * t6;
+    t7 = t7 + t5;
+    t5 = C52 * t14;
+    t14 = C51 * t0;
+    t0 = t5 - t14;
+    t5 = C52 * t4;
+    t14 = C51 * t6;
+    t4 = t5 - t14;
+    t6 = t10 + t12;
+    t5 = t8 + t11;
+    t14 = t1 + t7;
+    t10 = t9 - t3;
+    t12 = t13 + t4;
+    t8 = t2 - t0;
+    t11 = t13 - t4;
+    t13 = t2 + t0;
+    t4 = t1 - t7;
+    t2 = t9 + t3;
+    re[35] = t6;
+    im[35] = t5;
+    re[53] = t14;
+    im[53] = t10;
+    re[71] = t12;
+    im[71] = t8;
+    re[89] = t11;
+    im[89] = t13;
+    re[17] = t4;
+    im[17] = t2;
+    t0 = re[0];
+    t1 = im[0];
+    t7 = re[45];
+    t9 = im[45];
+    t3 = t0 - t7;
+    t6 = t1 - t9;
+    t5 = t0 + t7;
+    t14 = t1 + t9;
+    t10 = (-C53) * t5;
+    t12 = (-C54) * t14;
+    t8 = t10 + t12;
+    t11 = 0.10283148949142575 * t8;
+    y[269] = t11;
+    t13 = 0.10195818372679734 * t8;
+    y[270] = t13;
+    t4 = C54 * t5;
+    t2 = (-C53) * t14;
+    t0 = t4 + t2;
+    t7 = 0.05341685744944068 * t0;
+    y[89] = t7;
+    t1 = (-0.05508843033578144) * t0;
+    y[90] = t1;
+    t9 = C55 * t3;
+    t10 = C56 * t6;
+    t12 = t9 + t10;
+    y[0] = 0;
+    t11 = (-0.10545185135140951) * t12;
+    y[179] = t11;
+    t8 = (-C56) * t3;
+    t13 = C55 * t6;
+    t5 = t8 + t13;
+    t14 = 0.10536667653263153 * t5;
+    y[180] = t14;
+    t4 = 0.00020774573354068366 * t5;
+    y[359] = t4;
+    t2 = re[48];
+    t7 = im[48];
+    t0 = re[3];
+    t1 = im[3];
+    t9 = t2 - t0;
+    t10 = t7 - t1;
+    t12 = t2 + t0;
+    t11 = t7 + t1;
+    t3 = C57 * t12;
+    t6 = C58 * t11;
+    t8 = t3 + t6;
+    y[2] = 0;
+    t13 = (-0.10562110222762526) * t8;
+    y[177] = t13;
+    t14 = (-C58) * t12;
+    t5 = C57 * t11;
+    t4 = t14 + t5;
+    t2 = 0.10519783335687435 * t4;
+    y[182] = t2;
+    t0 = 0.00043475807173410746 * t4;
+    y[357] = t0;
+    t7 = (-C59) * t9;
+    t1 = (-C60) * t10;
+    t3 = t7 + t1;
+    t6 = 0.10445761607662409 * t3;
+    y[267] = t6;
+    t8 = 0.10009323415744416 * t3;
+    y[272] = t8;
+    t13 = C60 * t9;
+    t12 = (-C59) * t10;
+    t11 = t13 + t12;
+    t14 = 0.050055274887662475 * t11;
+    y[87] = t14;
+    t5 = (-0.0584056671989319) * t11;
+    y[92] = t5;
+    t2 = re[6];
+    t4 = im[6];
+    t0 = re[51];
+    t7 = im[51];
+    t1 = t2 - t0;
+    t6 = t4 - t7;
+    t3 = t2 + t0;
+    t8 = t4 + t7;
+    t9 = (-C61) * t3;
+    t10 = (-C62) * t8;
+    t13 = t9 + t10;
+    t12 = 0.10592395115988588 * t13;
+    y[265] = t12;
+    t14 = 0.09807356363250865 * t13;
+    y[274] = t14;
+    t11 = C62 * t3;
+    t5 = (-C61) * t8;
+    t2 = t11 + t5;
+    t0 = 0.04668426482973558 * t2;
+    y[85] = t0;
+    t4 = (-0.06167272672669253) * t2;
+    y[94] = t4;
+    t7 = C63 * t1;
+    t9 = C64 * t6;
+    t10 = t7 + t9;
+    y[4] = 0;
+    t12 = (-0.10578594242587536) * t10;
+    y[175] = t12;
+    t13 = (-C64) * t1;
+    t14 = C63 * t6;
+    t3 = t13 + t14;
+    t8 = 0.10503390957543066 * t3;
+    y[184] = t8;
+    t11 = 0.0007563547636164294 * t3;
+    y[355] = t11;
+    t5 = re[64];
+    t0 = im[64];
+    t2 = re[19];
+    t4 = im[19];
+    t7 = t5 - t2;
+    t9 = t0 - t4;
+    t10 = t5 + t2;
+    t12 = t0 + t4;
+    t1 = C65 * t10;
+    t6 = C66 * t12;
+    t13 = t1 + t6;
+    y[6] = 0;
+    t14 = (-0.10594246825394384) * t13;
+    y[173] = t14;
+    t8 = (-C66) * t10;
+    t3 = C65 * t12;
+    t11 = t8 + t3;
+    t5 = 0.10487872610705846 * t11;
+    y[186] = t5;
+    t2 = 0.0011892177864014468 * t11;
+    y[353] = t2;
+    t0 = (-C67) * t7;
+    t4 = (-C68) * t9;
+    t1 = t0 + t4;
+    t6 = 0.10722697071612382 * t1;
+    y[263] = t6;
+    t13 = 0.09590169035311356 * t1;
+    y[276] = t13;
+    t14 = C68 * t7;
+    t10 = (-C67) * t9;
+    t12 = t14 + t10;
+    t8 = 0.043320144271118445 * t12;
+    y[83] = t8;
+    t3 = (-0.06487767026065987) * t12;
+    y[96] = t3;
+    t5 = re[22];
+    t11 = im[22];
+    t2 = re[67];
+    t0 = im[67];
+    t4 = t5 - t2;
+    t6 = t11 - t0;
+    t1 = t5 + t2;
+    t13 = t11 + t0;
+    t7 = (-C69) * t1;
+    t9 = (-C70) * t13;
+    t14 = t7 + t9;
+    t10 = 0.10836992079672758 * t14;
+    y[261] = t10;
+    t8 = 0.09358384301872717 * t14;
+    y[278] = t8;
+    t12 = C70 * t1;
+    t3 = (-C69) * t13;
+    t5 = t12 + t3;
+    t2 = 0.03998081633739134 * t5;
+    y[81] = t2;
+    t11 = (-0.06800367313228359) * t5;
+    y[98] = t11;
+    t0 = C71 * t4;
+    t7 = C72 * t6;
+    t9 = t0 + t7;
+    y[8] = 0;
+    t10 = (-0.10608679121443566) * t9;
+    y[171] = t10;
+    t14 = (-C72) * t4;
+    t8 = C71 * t6;
+    t1 = t14 + t8;
+    t13 = 0.10473604662669052 * t1;
+    y[188] = t13;
+    t12 = 0.0017455800739912659 * t1;
+    y[351] = t12;
+    t3 = re[70];
+    t2 = im[70];
+    t5 = re[25];
+    t11 = im[25];
+    t0 = t3 - t5;
+    t7 = t2 - t11;
+    t9 = t3 + t5;
+    t10 = t2 + t11;
+    t4 = C73 * t9;
+    t6 = C74 * t10;
+    t14 = t4 + t6;
+    y[10] = 0;
+    t8 = (-0.1062151252966577) * t14;
+    y[169] = t8;
+    t13 = (-C74) * t9;
+    t1 = C73 * t10;
+    t12 = t13 + t1;
+    t3 = 0.1046094996364962 * t12;
+    y[190] = t3;
+    t5 = 0.0024344642407252456 * t12;
+    y[349] = t5;
+    t2 = (-C75) * t0;
+    t11 = (-C76) * t7;
+    t4 = t2 + t11;
+    t6 = 0.1093520830501441 * t4;
+    y[259] = t6;
+    t14 = 0.09112774271407018 * t4;
+    y[280] = t14;
+    t8 = C76 * t0;
+    t9 = (-C75) * t7;
+    t10 = t8 + t9;
+    t13 = 0.036682878671273865 * t10;
+    y[79] = t13;
+    t1 = (-0.07103918795933337) * t10;
+    y[100] = t1;
+    t3 = re[38];
+    t12 = im[38];
+    t5 = re[83];
+    t2 = im[83];
+    t11 = t3 - t5;
+    t6 = t12 - t2;
+    t4 = t3 + t5;
+    t14 = t12 + t2;
+    t0 = (-C77) * t4;
+    t7 = (-C78) * t14;
+    t8 = t0 + t7;
+    t9 = 0.11017716427377129 * t8;
+    y[257] = t9;
+    t13 = 0.08853875428394885 * t8;
+    y[282] = t13;
+    t10 = C78 * t4;
+    t1 = (-C77) * t14;
+    t3 = t10 + t1;
+    t5 = 0.03344503750981467 * t3;
+    y[77] = t5;
+    t12 = (-0.07397112828898918) * t3;
+    y[102] = t12;
+    t2 = C79 * t11;
+    t0 = C80 * t6;
+    t7 = t2 + t0;
+    y[12] = 0;
+    t9 = (-0.10632360319216981) * t7;
+    y[167] = t9;
+    t8 = (-C80) * t11;
+    t13 = C79 * t6;
+    t4 = t8 + t13;
+    t14 = 0.10450277057511706 * t4;
+    y[192] = t14;
+    t10 = 0.003263813755121946 * t4;
+    y[347] = t10;
+    t1 = re[86];
+    t5 = im[86];
+    t3 = re[41];
+    t12 = im[41];
+    t2 = t1 - t3;
+    t0 = t5 - t12;
+    t7 = t1 + t3;
+    t9 = t5 + t12;
+    t11 = C81 * t7;
+    t6 = C82 * t9;
+    t8 = t11 + t6;
+    y[14] = 0;
+    t13 = (-0.1064084464218436) * t8;
+    y[165] = t13;
+    t14 = (-C82) * t7;
+    t4 = C81 * t9;
+    t10 = t14 + t4;
+    t1 = 0.10441944680840871 * t10;
+    y[194] = t1;
+    t3 = 0.004236562517080274 * t10;
+    y[345] = t3;
+    t5 = (-C83) * t2;
+    t12 = (-C84) * t0;
+    t11 = t5 + t12;
+    t6 = 0.11084873077916041 * t11;
+    y[255] = t6;
+    t8 = 0.08582541591976457 * t11;
+    y[284] = t8;
+    t13 = C84 * t2;
+    t7 = (-C83) * t0;
+    t9 = t13 + t7;
+    t14 = 0.030285070177357855 * t9;
+    y[75] = t14;
+    t4 = (-0.07678827089087746) * t9;
+    y[104] = t4;
+    t1 = re[44];
+    t10 = im[44];
+    t3 = re[89];
+    t5 = im[89];
+    t12 = t1 - t3;
+    t6 = t10 - t5;
+    t11 = t1 + t3;
+    t8 = t10 + t5;
+    t2 = (-C85) * t11;
+    t0 = (-C86) * t8;
+    t13 = t2 + t0;
+    t7 = 0.11137139713523048 * t13;
+    y[253] = t7;
+    t14 = 0.0829960016863824 * t13;
+    y[286] = t14;
+    t9 = C86 * t11;
+    t4 = (-C85) * t8;
+    t1 = t9 + t4;
+    t3 = 0.027219561165582794 * t1;
+    y[73] = t3;
+    t10 = (-0.07948177534274314) * t1;
+    y[106] = t10;
+    t5 = C87 * t12;
+    t2 = C88 * t6;
+    t0 = t5 + t2;
+    y[16] = 0;
+    t7 = (-0.1064659582961119) * t0;
+    y[163] = t7;
+    t13 = (-C88) * t12;
+    t14 = C87 * t6;
+    t11 = t13 + t14;
+    t8 = 0.10436304043972418 * t11;
+    y[196] = t8;
+    t9 = 0.005357839698617217 * t11;
+    y[343] = t9;
+    t4 = re[72];
+    t3 = im[72];
+    t1 = re[27];
+    t10 = im[27];
+    t5 = t4 - t1;
+    t2 = t3 - t10;
+    t0 = t4 + t1;
+    t7 = t3 + t10;
+    t12 = C89 * t0;
+    t6 = C90 * t7;
+    t13 = t12 + t6;
+    y[18] = 0;
+    t14 = (-0.10649251365137921) * t13;
+    y[161] = t14;
+    t8 = (-C90) * t0;
+    t11 = C89 * t7;
+    t9 = t8 + t11;
+    t4 = 0.10433701609753676 * t9;
+    y[198] = t4;
+    t1 = 0.0066295602099925134 * t9;
+    y[341] = t1;
+    t3 = (-C91) * t5;
+    t10 = (-C92) * t2;
+    t12 = t3 + t10;
+    t6 = 0.11175216614295466 * t12;
+    y[251] = t6;
+    t13 = 0.08005992338377164 * t12;
+    y[288] = t13;
+    t14 = C92 * t5;
+    t0 = (-C91) * t2;
+    t7 = t14 + t0;
+    t8 = 0.024266156878213443 * t7;
+    y[71] = t8;
+    t11 = (-0.0820419394725153) * t7;
+    y[108] = t11;
+    t4 = re[30];
+    t9 = im[30];
+    t1 = re[75];
+    t3 = im[75];
+    t10 = t4 - t1;
+    t6 = t9 - t3;
+    t12 = t4 + t1;
+    t13 = t9 + t3;
+    t5 = (-C93) * t12;
+    t2 = (-C94) * t13;
+    t14 = t5 + t2;
+    t0 = 0.1119972737491647 * t14;
+    y[249] = t0;
+    t8 = 0.07702845466518891 * t14;
+    y[290] = t8;
+    t7 = C94 * t12;
+    t11 = (-C93) * t13;
+    t4 = t7 + t11;
+    t1 = 0.02144008238657481 * t4;
+    y[69] = t1;
+    t9 = (-0.08446290146459451) * t4;
+    y[110] = t9;
+    t3 = C95 * t10;
+    t5 = C96 * t6;
+    t2 = t3 + t5;
+    y[20] = 0;
+    t0 = (-0.1064846134349639) * t2;
+    y[159] = t0;
+    t14 = (-C96) * t10;
+    t8 = C95 * t6;
+    t12 = t14 + t8;
+    t13 = 0.10434475698122611 * t12;
+    y[200] = t13;
+    t7 = 0.008054387752489418 * t12;
+    y[339] = t7;
+    t11 = re[78];
+    t1 = im[78];
+    t4 = re[33];
+    t9 = im[33];
+    t3 = t11 - t4;
+    t5 = t1 - t9;
+    t2 = t11 + t4;
+    t0 = t1 + t9;
+    t10 = C97 * t2;
+    t6 = C98 * t0;
+    t14 = t10 + t6;
+    y[22] = 0;
+    t8 = (-0.106439018245135) * t14;
+    y[157] = t8;
+    t13 = (-C98) * t2;
+    t12 = C97 * t0;
+    t7 = t13 + t12;
+    t11 = 0.10438945505417567 * t7;
+    y[202] = t11;
+    t4 = 0.009633186119027486 * t7;
+    y[337] = t4;
+    t1 = (-C99) * t3;
+    t9 = (-C100) * t5;
+    t10 = t1 + t9;
+    t6 = 0.11211600182090968 * t10;
+    y[247] = t6;
+    t14 = 0.0739149077116441 * t10;
+    y[292] = t14;
+    t8 = C100 * t3;
+    t2 = (-C99) * t5;
+    t0 = t8 + t2;
+    t13 = 0.018754638337760737 * t0;
+    y[67] = t13;
+    t12 = (-0.08673930207344024) * t0;
+    y[112] = t12;
+    t11 = re[46];
+    t7 = im[46];
+    t4 = re[1];
+    t1 = im[1];
+    t9 = t11 - t4;
+    t6 = t7 - t1;
+    t10 = t11 + t4;
+    t14 = t7 + t1;
+    t3 = (-C101) * t10;
+    t5 = (-C102) * t14;
+    t8 = t3 + t5;
+    t2 = 0.11211726616460811 * t8;
+    y[245] = t2;
+    t13 = 0.07072918180627431 * t8;
+    y[294] = t13;
+    t0 = C102 * t10;
+    t12 = (-C101) * t14;
+    t11 = t0 + t12;
+    t4 = 0.0162231586659377 * t11;
+    y[65] = t4;
+    t7 = (-0.08886820659475896) * t11;
+    y[114] = t7;
+    t1 = C103 * t9;
+    t3 = C104 * t6;
+    t5 = t1 + t3;
+    y[24] = 0;
+    t2 = (-0.10635259545515033) * t5;
+    y[155] = t2;
+    t8 = (-C104) * t9;
+    t13 = C103 * t6;
+    t10 = t8 + t13;
+    t14 = 0.10447428258388627 * t10;
+    y[204] = t14;
+    t0 = 0.011366778059010964 * t10;
+    y[335] = t0;
+    t12 = re[4];
+    t4 = im[4];
+    t11 = re[49];
+    t7 = im[49];
+    t1 = t12 - t11;
+    t3 = t4 - t7;
+    t5 = t12 + t11;
+    t2 = t4 + t7;
+    t9 = C105 * t5;
+    t6 = C106 * t2;
+    t8 = t9 + t6;
+    y[26] = 0;
+    t13 = (-0.10622278321308296) * t8;
+    y[153] = t13;
+    t14 = (-C106) * t5;
+    t10 = C105 * t2;
+    t0 = t14 + t10;
+    t12 = 0.10460195802648305 * t0;
+    y[206] = t12;
+    t11 = 0.013253791127641398 * t0;
+    y[333] = t11;
+    t4 = (-C107) * t1;
+    t7 = (-C108) * t3;
+    t9 = t4 + t7;
+    t6 = 0.11201282402976184 * t9;
+    y[243] = t6;
+    t8 = 0.06748590978994368 * t9;
+    y[296] = t8;
+    t13 = C108 * t1;
+    t5 = (-C107) * t3;
+    t2 = t13 + t5;
+    t14 = 0.01385646615380372 * t2;
+    y[63] = t14;
+    t10 = (-0.09084669522789945) * t2;
+    y[116] = t10;
+}
+
+/**
+ *  Part 3 of ApplyWindowedIMDCT_W75_180_K60().
+ * 
+ *  @param {Number[]} X 
+ *    - The input block (180 points, only the first 60 points are used).
+ *  @param {Number[]} y 
+ *    - The array that would contain the output block (360 points).
+ *  @param {Number[]} re 
+ *    - The scratch buffer (real part, 90 points).
+ *  @param {Number[]} im 
+ *    - The scratch buffer (imaginary part, 90 points).
+ */
+function ApplyWindowedIMDCT_W75_180_K60_Part3(X, y, re, im) {
+    let t0, t1, t10, t11, t12, t13, t14, t2, t3, t4, t5, t6, t7, t8, t9;
+    const C0 = 0.9692309097067544;
+    const C1 = 0.24615329302899303;
+    const C2 = 0.5112930860770522;
+    const C3 = 0.8594064115014527;
+    const C4 = 0.4962165036752082;
+    const C5 = 0.8681988144891423;
+    const C6 = 0.964787323828813;
+    const C7 = 0.2630312144579748;
+    const C8 = 0.9600498543859287;
+    const C9 = 0.2798290140309921;
+    const C10 = 0.48098876891938763;
+    const C11 = 0.8767267557075077;
+    const C12 = 0.4656145203251114;
+    const C13 = 0.8849876374630419;
+    const C14 = 0.9550199444571866;
+    const C15 = 0.296541574975571;
+    const C16 = 0.949699126201877;
+    const C17 = 0.31316380648374953;
+    const C18 = 0.45009844103743496;
+    const C19 = 0.892978943411137;
+    const C20 = 0.43444525740441703;
+    const C21 = 0.9006982393225879;
+    const C22 = 0.9440890203927842;
+    const C23 = 0.32969064526278724;
+    const C24 = 0.9381913359224842;
+    const C25 = 0.34611705707749296;
+    const C26 = 0.41865973753742813;
+    const C27 = 0.9081431738250813;
+    const C28 = 0.40274668985873724;
+    const C29 = 0.9153114791194471;
+    const C30 = 0.9320078692827986;
+    const C31 = 0.3624380382837016;
+    const C32 = 0.9255405040175664;
+    const C33 = 0.37864861735243294;
+    const C34 = 0.3867109616368206;
+    const C35 = 0.9222009716704518;
+    const C36 = 0.3705574375098362;
+    const C37 = 0.9288095528719242;
+    const C38 = 0.9187912101488983;
+    const C39 = 0.39474385638426723;
+    const C40 = 0.9117620435770886;
+    const C41 = 0.41071885261347724;
+    const C42 = 0.35429103799771583;
+    const C43 = 0.9351352096860117;
+    const C44 = 0.33791671800332695;
+    const C45 = 0.9411760152563706;
+    const C46 = 0.904455145454368;
+    const C47 = 0.4265687399014583;
+    const C48 = 0.8968727415326883;
+    const C49 = 0.4422886902190013;
+    const C50 = 0.3214394653031616;
+    const C51 = 0.9469301294951057;
+    const C52 = 0.30486429902801077;
+    const C53 = 0.9523957996432784;
+    const C54 = 0.8890171414857364;
+    const C55 = 0.4578739151169567;
+    const C56 = 0.8808907382053855;
+    const C57 = 0.47331966718484336;
+    const C58 = 0.28819626813408933;
+    const C59 = 0.9575713608048144;
+    const C60 = 0.27144044986507426;
+    const C61 = 0.9624552364536473;
+    const C62 = 0.8724960070727972;
+    const C63 = 0.4886212414969549;
+    const C64 = 0.8638355052043957;
+    const C65 = 0.5037739770455263;
+    const C66 = 0.25460194820552756;
+    const C67 = 0.9670459389139432;
+    const C68 = 0.2376858923261731;
+    const C69 = 0.9713420698132614;
+    const C70 = 0.8549118706729466;
+    const C71 = 0.5187732581605213;
+    const C72 = 0.8457278217039733;
+    const C73 = 0.5336145159156115;
+    const C74 = 0.22069743502150108;
+    const C75 = 0.9753423205085127;
+    const C76 = 0.2036417511401775;
+    const C77 = 0.9790454724845838;
+    const C78 = 0.8362861558477596;
+    const C79 = 0.5482932295199138;
+    const C80 = 0.8265897491271886;
+    const C81 = 0.5628049276950685;
+    const C82 = 0.18652403600873463;
+    const C83 = 0.9824503977255097;
+    const C84 = 0.1693495038490246;
+    const C85 = 0.9855560590580777;
+    const C86 = 0.8166415551616789;
+    const C87 = 0.5771451900372336;
+    const C88 = 0.8064446042674825;
+    const C89 = 0.5913096483635824;
+    const C90 = 0.1521233861899167;
+    const C91 = 0.9883615104677607;
+    const C92 = 0.134850930273723;
+    const C93 = 0.9908658973868822;
+    const C94 = 0.796002002534622;
+    const C95 = 0.6052939880428944;
+    const C96 = 0.785316930880745;
+    const C97 = 0.619093949309834;
+    const C98 = 0.11753739745783764;
+    const C99 = 0.9930684569549263;
+    const C100 = 0.10018806161207627;
+    const C101 = 0.9949685182509117;
+    const C102 = 0.7743926440821856;
+    const C103 = 0.632705328562516;
+    const C104 = 0.7632324697825288;
+    const C105 = 0.6461239796429639;
+    const C106 = 0.08280820751220434;
+    const C107 = 0.9965655024977614;
+    const C108 = 0.06540312923014306;
+    const C109 = 0.9978589232386035;
+    const C110 = 0.7518398074789774;
+    const C111 = 0.6593458151000688;
+    const C112 = 0.7402181274868321;
+    const C113 = 0.672366807434668;
+    const C114 = 0.04797812852134394;
+    const C115 = 0.9988483864849507;
+    const C116 = 0.03053851320982266;
+    const C117 = 0.9995335908367129;
+    const C118 = 0.7283709698824002;
+    const C119 = 0.6851829903263591;
+    const C120 = 0.7163019434246544;
+    const C121 = 0.6977904598416801;
+    const C122 = 0.01308959557134444;
+    const C123 = 0.999914327574007;
+    t12 = re[52];
+    t0 = im[52];
+    t11 = re[7];
+    t4 = im[7];
+    t7 = t12 - t11;
+    t6 = t0 - t4;
+    t9 = t12 + t11;
+    t8 = t0 + t4;
+    t1 = (-C0) * t9;
+    t3 = (-C1) * t8;
+    t13 = t1 + t3;
+    t5 = 0.11181234565117065 * t13;
+    y[241] = t5;
+    t14 = 0.06419701362972723 * t13;
+    y[298] = t14;
+    t2 = C1 * t9;
+    t10 = (-C0) * t8;
+    t12 = t2 + t10;
+    t11 = 0.011663765406511857 * t12;
+    y[61] = t11;
+    t0 = (-0.09267610069341958) * t12;
+    y[118] = t0;
+    t4 = C2 * t7;
+    t1 = C3 * t6;
+    t3 = t4 + t1;
+    y[28] = 0;
+    t5 = (-0.10604711193419658) * t3;
+    y[151] = t5;
+    t13 = (-C3) * t7;
+    t14 = C2 * t6;
+    t9 = t13 + t14;
+    t8 = 0.10477523535016856 * t9;
+    y[208] = t8;
+    t2 = 0.015292094451545292 * t9;
+    y[331] = t2;
+    t10 = re[20];
+    t11 = im[20];
+    t12 = re[65];
+    t0 = im[65];
+    t4 = t10 - t12;
+    t1 = t11 - t0;
+    t3 = t10 + t12;
+    t5 = t11 + t0;
+    t7 = C4 * t3;
+    t6 = C5 * t5;
+    t13 = t7 + t6;
+    y[30] = 0;
+    t14 = (-0.1058237063615947) * t13;
+    y[149] = t14;
+    t8 = (-C5) * t3;
+    t9 = C4 * t5;
+    t2 = t8 + t9;
+    t10 = 0.10499642748426294 * t2;
+    y[210] = t10;
+    t12 = 0.017479194012891126 * t2;
+    y[329] = t12;
+    t11 = (-C6) * t4;
+    t0 = (-C7) * t1;
+    t7 = t11 + t0;
+    t6 = 0.11152777064293147 * t7;
+    y[239] = t6;
+    t13 = 0.06087681238074977 * t7;
+    y[300] = t13;
+    t14 = C7 * t4;
+    t3 = (-C6) * t1;
+    t5 = t14 + t3;
+    t8 = 0.009652524216948906 * t5;
+    y[59] = t8;
+    t9 = (-0.094357630791773) * t5;
+    y[120] = t9;
+    t10 = re[68];
+    t2 = im[68];
+    t12 = re[23];
+    t11 = im[23];
+    t0 = t10 - t12;
+    t6 = t2 - t11;
+    t7 = t10 + t12;
+    t13 = t2 + t11;
+    t4 = (-C8) * t7;
+    t1 = (-C9) * t13;
+    t14 = t4 + t1;
+    t3 = 0.1111711548927498 * t14;
+    y[237] = t3;
+    t8 = 0.057539681884399944 * t14;
+    y[302] = t8;
+    t5 = C9 * t7;
+    t9 = (-C8) * t13;
+    t10 = t5 + t9;
+    t12 = 0.00782996317541068 * t10;
+    y[57] = t12;
+    t2 = (-0.09589337747832162) * t10;
+    y[122] = t2;
+    t11 = C10 * t0;
+    t4 = C11 * t6;
+    t1 = t11 + t4;
+    y[32] = 0;
+    t3 = (-0.10555095396217636) * t1;
+    y[147] = t3;
+    t14 = (-C11) * t0;
+    t8 = C10 * t6;
+    t7 = t14 + t8;
+    t13 = 0.1052677469413751 * t7;
+    y[212] = t13;
+    t5 = 0.019809432322785005 * t7;
+    y[327] = t5;
+    t9 = re[26];
+    t12 = im[26];
+    t10 = re[71];
+    t2 = im[71];
+    t11 = t9 - t10;
+    t4 = t12 - t2;
+    t1 = t9 + t10;
+    t3 = t12 + t2;
+    t0 = C12 * t1;
+    t6 = C13 * t3;
+    t14 = t0 + t6;
+    y[34] = 0;
+    t8 = (-0.10522800037797932) * t14;
+    y[145] = t8;
+    t13 = (-C13) * t1;
+    t7 = C12 * t3;
+    t5 = t13 + t7;
+    t9 = 0.10559082251111834 * t5;
+    y[214] = t9;
+    t10 = 0.022277503292171038 * t5;
+    y[325] = t10;
+    t12 = (-C14) * t11;
+    t2 = (-C15) * t4;
+    t0 = t12 + t2;
+    t6 = 0.11075297764495041 * t0;
+    y[235] = t6;
+    t14 = 0.05419989393873094 * t0;
+    y[304] = t14;
+    t8 = C15 * t11;
+    t1 = (-C14) * t4;
+    t3 = t8 + t1;
+    t13 = 0.006201590324297938 * t3;
+    y[55] = t13;
+    t7 = (-0.09728845040920638) * t3;
+    y[124] = t7;
+    t9 = re[54];
+    t5 = im[54];
+    t10 = re[9];
+    t12 = im[9];
+    t2 = t9 - t10;
+    t6 = t5 - t12;
+    t0 = t9 + t10;
+    t14 = t5 + t12;
+    t11 = (-C16) * t0;
+    t4 = (-C17) * t14;
+    t8 = t11 + t4;
+    t1 = 0.11028748843781232 * t8;
+    y[233] = t1;
+    t13 = 0.05087145958604732 * t8;
+    y[306] = t13;
+    t3 = C17 * t0;
+    t7 = (-C16) * t14;
+    t9 = t3 + t7;
+    t10 = 0.004771859549919083 * t9;
+    y[53] = t10;
+    t5 = (-0.0985457172414932) * t9;
+    y[126] = t5;
+    t12 = C18 * t2;
+    t11 = C19 * t6;
+    t4 = t12 + t11;
+    y[36] = 0;
+    t1 = (-0.10485393165978092) * t4;
+    y[143] = t1;
+    t8 = (-C19) * t2;
+    t13 = C18 * t6;
+    t0 = t8 + t13;
+    t14 = 0.10596752010371228 * t0;
+    y[216] = t14;
+    t3 = 0.024876910991979265 * t0;
+    y[323] = t3;
+    t7 = re[12];
+    t10 = im[12];
+    t9 = re[57];
+    t5 = im[57];
+    t12 = t7 - t9;
+    t11 = t10 - t5;
+    t4 = t7 + t9;
+    t1 = t10 + t5;
+    t2 = C20 * t4;
+    t6 = C21 * t1;
+    t8 = t2 + t6;
+    y[38] = 0;
+    t13 = (-0.10442909411643879) * t8;
+    y[141] = t13;
+    t14 = (-C21) * t4;
+    t0 = C20 * t1;
+    t3 = t14 + t0;
+    t7 = 0.10639861625843644 * t3;
+    y[218] = t7;
+    t9 = 0.02759759882850269 * t3;
+    y[321] = t9;
+    t10 = (-C22) * t12;
+    t5 = (-C23) * t11;
+    t2 = t10 + t5;
+    t6 = 0.10978325427720098 * t2;
+    y[231] = t6;
+    t8 = 0.04756885867834906 * t2;
+    y[308] = t8;
+    t13 = C23 * t12;
+    t4 = (-C22) * t11;
+    t1 = t13 + t4;
+    t14 = 0.0035432705531146876 * t1;
+    y[51] = t14;
+    t0 = (-0.09967423398910226) * t1;
+    y[128] = t0;
+    t7 = re[60];
+    t3 = im[60];
+    t9 = re[15];
+    t10 = im[15];
+    t5 = t7 - t9;
+    t6 = t3 - t10;
+    t2 = t7 + t9;
+    t8 = t3 + t10;
+    t12 = (-C24) * t2;
+    t11 = (-C25) * t8;
+    t13 = t12 + t11;
+    t4 = 0.10925429467963434 * t13;
+    y[229] = t4;
+    t14 = 0.04430435466830059 * t13;
+    y[310] = t14;
+    t1 = C25 * t2;
+    t0 = (-C24) * t8;
+    t7 = t1 + t0;
+    t9 = 0.002515371651828484 * t7;
+    y[49] = t9;
+    t3 = (-0.1006795131082048) * t7;
+    y[130] = t3;
+    t10 = C26 * t5;
+    t12 = C27 * t6;
+    t11 = t10 + t12;
+    y[40] = 0;
+    t4 = (-0.10395322592855918) * t11;
+    y[139] = t4;
+    t13 = (-C27) * t5;
+    t14 = C26 * t6;
+    t2 = t13 + t14;
+    t8 = 0.10688567874504554 * t2;
+    y[220] = t8;
+    t1 = 0.030431768150683058 * t2;
+    y[319] = t1;
+    t0 = re[28];
+    t9 = im[28];
+    t7 = re[73];
+    t3 = im[73];
+    t10 = t0 - t7;
+    t12 = t9 - t3;
+    t11 = t0 + t7;
+    t4 = t9 + t3;
+    t5 = C28 * t11;
+    t6 = C29 * t4;
+    t13 = t5 + t6;
+    t14 = 0.0004039562545922317 * t13;
+    y[42] = t14;
+    t8 = (-0.1033626970269786) * t13;
+    y[137] = t8;
+    t2 = (-C29) * t11;
+    t1 = C28 * t4;
+    t0 = t2 + t1;
+    t7 = 0.10736592722456871 * t0;
+    y[222] = t7;
+    t9 = 0.03336822793098118 * t0;
+    y[317] = t9;
+    t3 = (-C30) * t10;
+    t5 = (-C31) * t12;
+    t6 = t3 + t5;
+    t14 = 0.10871066201687268 * t6;
+    y[227] = t14;
+    t13 = 0.041091881490305494 * t6;
+    y[312] = t13;
+    t8 = C31 * t10;
+    t11 = (-C30) * t12;
+    t4 = t8 + t11;
+    t2 = 0.0016836021815952902 * t4;
+    y[47] = t2;
+    t1 = (-0.10157171821908681) * t4;
+    y[132] = t1;
+    t7 = re[76];
+    t0 = im[76];
+    t9 = re[31];
+    t3 = im[31];
+    t5 = t7 - t9;
+    t14 = t0 - t3;
+    t6 = t7 + t9;
+    t13 = t0 + t3;
+    t10 = (-C32) * t6;
+    t12 = (-C33) * t13;
+    t8 = t10 + t12;
+    t11 = 0.10816553021132944 * t8;
+    y[225] = t11;
+    t2 = 0.03794353629982911 * t8;
+    y[314] = t2;
+    t4 = C33 * t6;
+    t1 = (-C32) * t13;
+    t7 = t4 + t1;
+    t9 = 0.0010382155367027563 * t7;
+    y[45] = t9;
+    t0 = (-0.10235901881658338) * t7;
+    y[134] = t0;
+    t3 = C34 * t5;
+    t10 = C35 * t14;
+    t12 = t3 + t10;
+    t11 = 0.0007807921408777607 * t12;
+    y[44] = t11;
+    t8 = (-0.10271657940570703) * t12;
+    y[135] = t8;
+    t2 = (-C35) * t5;
+    t6 = C34 * t14;
+    t13 = t2 + t6;
+    t4 = 0.1078958471118532 * t13;
+    y[224] = t4;
+    t1 = 0.036397348554850356 * t13;
+    y[315] = t1;
+    t9 = re[34];
+    t7 = im[34];
+    t0 = re[79];
+    t3 = im[79];
+    t10 = t9 - t0;
+    t11 = t7 - t3;
+    t12 = t9 + t0;
+    t8 = t7 + t3;
+    t5 = C36 * t12;
+    t14 = C37 * t8;
+    t2 = t5 + t14;
+    t6 = 0.001338446915694132 * t2;
+    y[46] = t6;
+    t4 = (-0.10197789626508247) * t2;
+    y[133] = t4;
+    t13 = (-C37) * t12;
+    t1 = C36 * t8;
+    t9 = t13 + t1;
+    t0 = 0.10843752343695495 * t9;
+    y[226] = t0;
+    t7 = 0.03950892201611919 * t9;
+    y[313] = t7;
+    t3 = (-C38) * t10;
+    t5 = (-C39) * t11;
+    t14 = t3 + t5;
+    t6 = 0.10762968653672474 * t14;
+    y[223] = t6;
+    t2 = 0.03487189790626826 * t14;
+    y[316] = t2;
+    t4 = C39 * t10;
+    t12 = (-C38) * t11;
+    t8 = t4 + t12;
+    t13 = 0.0005646408681615436 * t8;
+    y[43] = t13;
+    t1 = (-0.10305168926250033) * t8;
+    y[136] = t1;
+    t0 = re[2];
+    t9 = im[2];
+    t7 = re[47];
+    t3 = im[47];
+    t5 = t0 - t7;
+    t6 = t9 - t3;
+    t14 = t0 + t7;
+    t2 = t9 + t3;
+    t10 = (-C40) * t14;
+    t11 = (-C41) * t2;
+    t4 = t10 + t11;
+    t12 = 0.10715459052193034 * t4;
+    y[221] = t12;
+    t13 = 0.03188777901462403 * t4;
+    y[318] = t13;
+    t8 = C41 * t14;
+    t1 = (-C40) * t2;
+    t0 = t8 + t1;
+    y[41] = 0;
+    t7 = (-0.10369234819517234) * t0;
+    y[138] = t7;
+    t9 = C42 * t5;
+    t3 = C43 * t6;
+    t10 = t9 + t3;
+    t11 = 0.0020754473801508247 * t10;
+    y[48] = t11;
+    t12 = (-0.10113927380391523) * t10;
+    y[131] = t12;
+    t4 = (-C43) * t5;
+    t13 = C42 * t6;
+    t14 = t4 + t13;
+    t2 = 0.10898346481763614 * t14;
+    y[228] = t2;
+    t8 = 0.04269085483362434 * t14;
+    y[311] = t8;
+    t1 = re[50];
+    t0 = im[50];
+    t7 = re[5];
+    t9 = im[5];
+    t3 = t1 - t7;
+    t11 = t0 - t9;
+    t10 = t1 + t7;
+    t12 = t0 + t9;
+    t5 = C44 * t10;
+    t6 = C45 * t12;
+    t4 = t5 + t6;
+    t13 = 0.0030044094666997023 * t4;
+    y[50] = t13;
+    t2 = (-0.10019163696307268) * t4;
+    y[129] = t2;
+    t14 = (-C45) * t10;
+    t8 = C44 * t12;
+    t1 = t14 + t8;
+    t7 = 0.10952127322317406 * t1;
+    y[230] = t7;
+    t0 = 0.045930977828050105 * t1;
+    y[309] = t0;
+    t9 = (-C46) * t3;
+    t5 = (-C47) * t11;
+    t6 = t9 + t5;
+    t13 = 0.10663511500011805 * t6;
+    y[219] = t13;
+    t4 = 0.0290011599676947 * t6;
+    y[320] = t4;
+    t2 = C47 * t3;
+    t10 = (-C46) * t11;
+    t12 = t2 + t10;
+    y[39] = 0;
+    t14 = (-0.10419748795787213) * t12;
+    y[140] = t14;
+    t8 = re[8];
+    t7 = im[8];
+    t1 = re[53];
+    t0 = im[53];
+    t9 = t8 - t1;
+    t5 = t7 - t0;
+    t13 = t8 + t1;
+    t6 = t7 + t0;
+    t4 = (-C48) * t13;
+    t3 = (-C49) * t6;
+    t11 = t4 + t3;
+    t2 = 0.10617606024822178 * t11;
+    y[217] = t2;
+    t10 = 0.026222514401920968 * t11;
+    y[322] = t10;
+    t12 = C49 * t13;
+    t14 = (-C48) * t6;
+    t8 = t12 + t14;
+    y[37] = 0;
+    t1 = (-0.10464798830485135) * t8;
+    y[142] = t1;
+    t7 = C50 * t9;
+    t0 = C51 * t5;
+    t4 = t7 + t0;
+    t3 = 0.004132367980549081 * t4;
+    y[52] = t3;
+    t2 = (-0.09912579670623863) * t4;
+    y[127] = t2;
+    t11 = (-C51) * t9;
+    t10 = C50 * t5;
+    t13 = t11 + t10;
+    t6 = 0.11003928784390318 * t13;
+    y[232] = t6;
+    t12 = 0.049216099716768984 * t13;
+    y[307] = t12;
+    t14 = re[36];
+    t8 = im[36];
+    t1 = re[81];
+    t7 = im[81];
+    t0 = t14 - t1;
+    t3 = t8 - t7;
+    t4 = t14 + t1;
+    t2 = t8 + t7;
+    t9 = C52 * t4;
+    t5 = C53 * t2;
+    t11 = t9 + t5;
+    t10 = 0.005461682284304391 * t11;
+    y[54] = t10;
+    t6 = (-0.09793368984357992) * t11;
+    y[125] = t6;
+    t13 = (-C53) * t4;
+    t12 = C52 * t2;
+    t14 = t13 + t12;
+    t1 = 0.11052570836958936 * t14;
+    y[234] = t1;
+    t8 = 0.05253338677834252 * t14;
+    y[305] = t8;
+    t7 = (-C54) * t0;
+    t9 = (-C55) * t3;
+    t5 = t7 + t9;
+    t10 = 0.10577241761811562 * t5;
+    y[215] = t10;
+    t11 = 0.023561556790462897 * t5;
+    y[324] = t11;
+    t6 = C55 * t0;
+    t4 = (-C54) * t3;
+    t2 = t6 + t4;
+    y[35] = 0;
+    t13 = (-0.10504733995234042) * t2;
+    y[144] = t13;
+    t12 = re[84];
+    t1 = im[84];
+    t14 = re[39];
+    t8 = im[39];
+    t7 = t12 - t14;
+    t9 = t1 - t8;
+    t10 = t12 + t14;
+    t5 = t1 + t8;
+    t11 = (-C56) * t10;
+    t0 = (-C57) * t5;
+    t3 = t11 + t0;
+    t6 = 0.10542273976138705 * t3;
+    y[213] = t6;
+    t4 = 0.02102631934479988 * t3;
+    y[326] = t4;
+    t2 = C57 * t10;
+    t13 = (-C56) * t5;
+    t12 = t2 + t13;
+    y[33] = 0;
+    t14 = (-0.10539577264127174) * t12;
+    y[146] = t14;
+    t1 = C58 * t7;
+    t8 = C59 * t9;
+    t11 = t1 + t8;
+    t0 = 0.006991188554664076 * t11;
+    y[56] = t0;
+    t6 = (-0.09660859225373081) * t11;
+    y[123] = t6;
+    t3 = (-C59) * t7;
+    t4 = C58 * t9;
+    t10 = t3 + t4;
+    t5 = 0.11096858947791874 * t10;
+    y[236] = t5;
+    t2 = 0.055869169342692634 * t10;
+    y[303] = t2;
+    t13 = re[42];
+    t12 = im[42];
+    t14 = re[87];
+    t1 = im[87];
+    t8 = t13 - t14;
+    t0 = t12 - t1;
+    t11 = t13 + t14;
+    t6 = t12 + t1;
+    t7 = C60 * t11;
+    t9 = C61 * t6;
+    t3 = t7 + t9;
+    t4 = 0.008717302904480926 * t3;
+    y[58] = t4;
+    t5 = (-0.09514316862034689) * t3;
+    y[121] = t5;
+    t10 = (-C61) * t11;
+    t2 = C60 * t6;
+    t13 = t10 + t2;
+    t14 = 0.11135812131039002 * t13;
+    y[238] = t14;
+    t12 = 0.05920943710311134 * t13;
+    y[301] = t12;
+    t1 = (-C62) * t8;
+    t7 = (-C63) * t0;
+    t9 = t1 + t7;
+    t4 = 0.10512566139996281 * t9;
+    y[211] = t4;
+    t3 = 0.018626993267046175 * t9;
+    y[328] = t3;
+    t5 = C63 * t8;
+    t11 = (-C62) * t0;
+    t6 = t5 + t11;
+    y[31] = 0;
+    t10 = (-0.10569361431970062) * t6;
+    y[148] = t10;
+    t2 = re[10];
+    t14 = im[10];
+    t13 = re[55];
+    t12 = im[55];
+    t1 = t2 - t13;
+    t7 = t14 - t12;
+    t4 = t2 + t13;
+    t9 = t14 + t12;
+    t3 = (-C64) * t4;
+    t8 = (-C65) * t9;
+    t0 = t3 + t8;
+    t5 = 0.10487973921603179 * t0;
+    y[209] = t5;
+    t11 = 0.0163672975990987 * t0;
+    y[330] = t11;
+    t6 = C65 * t4;
+    t10 = (-C64) * t9;
+    t2 = t6 + t10;
+    y[29] = 0;
+    t13 = (-0.1059414448793049) * t2;
+    y[150] = t13;
+    t14 = C66 * t1;
+    t12 = C67 * t7;
+    t3 = t14 + t12;
+    t8 = 0.010634922571204589 * t3;
+    y[60] = t8;
+    t5 = (-0.09353555143552254) * t3;
+    y[119] = t5;
+    t0 = (-C67) * t1;
+    t11 = C66 * t7;
+    t4 = t0 + t11;
+    t9 = 0.1116795160109561 * t4;
+    y[240] = t9;
+    t6 = 0.06253980623939123 * t4;
+    y[299] = t6;
+    t10 = re[58];
+    t2 = im[58];
+    t13 = re[13];
+    t14 = im[13];
+    t12 = t10 - t13;
+    t8 = t2 - t14;
+    t3 = t10 + t13;
+    t5 = t2 + t14;
+    t1 = C68 * t3;
+    t7 = C69 * t5;
+    t0 = t1 + t7;
+    t11 = 0.01273784185791163 * t0;
+    y[62] = t11;
+    t9 = (-0.09177980677333142) * t0;
+    y[117] = t9;
+    t4 = (-C69) * t3;
+    t6 = C68 * t5;
+    t10 = t4 + t6;
+    t13 = 0.11192407043335297 * t10;
+    y[242] = t13;
+    t2 = 0.06584644108548751 * t10;
+    y[297] = t2;
+    t14 = (-C70) * t12;
+    t1 = (-C71) * t8;
+    t7 = t14 + t1;
+    t11 = 0.10468272521430462 * t7;
+    y[207] = t11;
+    t0 = 0.014254157485166856 * t7;
+    y[332] = t0;
+    t9 = C71 * t12;
+    t3 = (-C70) * t8;
+    t5 = t9 + t3;
+    y[27] = 0;
+    t4 = (-0.10614082780482303) * t5;
+    y[152] = t4;
+    t6 = re[16];
+    t13 = im[16];
+    t10 = re[61];
+    t2 = im[61];
+    t14 = t6 - t10;
+    t1 = t13 - t2;
+    t11 = t6 + t10;
+    t7 = t13 + t2;
+    t0 = (-C72) * t11;
+    t12 = (-C73) * t7;
+    t8 = t0 + t12;
+    t9 = 0.10453260185425502 * t8;
+    y[205] = t9;
+    t3 = 0.012291201401904974 * t8;
+    y[334] = t3;
+    t5 = C73 * t11;
+    t4 = (-C72) * t7;
+    t6 = t5 + t4;
+    y[25] = 0;
+    t10 = (-0.10629326080109268) * t6;
+    y[154] = t10;
+    t13 = C74 * t14;
+    t2 = C75 * t1;
+    t0 = t13 + t2;
+    t12 = 0.015018768373128936 * t0;
+    y[64] = t12;
+    t9 = (-0.08987633190957331) * t0;
+    y[115] = t9;
+    t8 = (-C75) * t14;
+    t3 = C74 * t1;
+    t11 = t8 + t3;
+    t7 = 0.11207741615761654 * t11;
+    y[244] = t7;
+    t5 = 0.06911379356638549 * t11;
+    y[295] = t5;
+    t4 = re[74];
+    t6 = im[74];
+    t10 = re[29];
+    t13 = im[29];
+    t2 = t4 - t10;
+    t12 = t6 - t13;
+    t0 = t4 + t10;
+    t9 = t6 + t13;
+    t14 = C76 * t0;
+    t1 = C77 * t9;
+    t8 = t14 + t1;
+    t3 = 0.01746912534711498 * t8;
+    y[66] = t3;
+    t7 = (-0.08782223808436534) * t8;
+    y[113] = t7;
+    t11 = (-C77) * t0;
+    t5 = C76 * t9;
+    t4 = t11 + t5;
+    t10 = 0.11213066231169123 * t4;
+    y[246] = t10;
+    t6 = 0.07233020336790129 * t4;
+    y[293] = t6;
+    t13 = (-C78) * t2;
+    t14 = (-C79) * t12;
+    t1 = t13 + t14;
+    t3 = 0.10442666453598959 * t1;
+    y[203] = t3;
+    t8 = 0.010480779093744487 * t1;
+    y[336] = t8;
+    t7 = C79 * t2;
+    t0 = (-C78) * t12;
+    t9 = t7 + t0;
+    y[23] = 0;
+    t11 = (-0.10640109171811937) * t9;
+    y[156] = t11;
+    t5 = re[32];
+    t10 = im[32];
+    t4 = re[77];
+    t6 = im[77];
+    t13 = t5 - t4;
+    t14 = t10 - t6;
+    t3 = t5 + t4;
+    t1 = t10 + t6;
+    t8 = (-C80) * t3;
+    t2 = (-C81) * t1;
+    t12 = t8 + t2;
+    t7 = 0.10436228446480811 * t12;
+    y[201] = t7;
+    t0 = 0.00882444138494175 * t12;
+    y[338] = t0;
+    t9 = C81 * t3;
+    t11 = (-C80) * t1;
+    t5 = t9 + t11;
+    y[21] = 0;
+    t4 = (-0.1064667295095277) * t5;
+    y[158] = t4;
+    t10 = C82 * t13;
+    t6 = C83 * t14;
+    t8 = t10 + t6;
+    t2 = 0.02007900444097957 * t8;
+    y[68] = t2;
+    t7 = (-0.08561946843470827) * t8;
+    y[111] = t7;
+    t12 = (-C83) * t13;
+    t0 = C82 * t14;
+    t3 = t12 + t0;
+    t1 = 0.11207172864296862 * t3;
+    y[248] = t1;
+    t9 = 0.07548129602721117 * t3;
+    y[291] = t9;
+    t11 = re[80];
+    t5 = im[80];
+    t4 = re[35];
+    t10 = im[35];
+    t6 = t11 - t4;
+    t2 = t5 - t10;
+    t8 = t11 + t4;
+    t7 = t5 + t10;
+    t13 = C84 * t8;
+    t14 = C85 * t7;
+    t12 = t13 + t14;
+    t0 = 0.022836010382399043 * t12;
+    y[70] = t0;
+    t1 = (-0.0832703302350659) * t12;
+    y[109] = t1;
+    t3 = (-C85) * t8;
+    t9 = C84 * t7;
+    t11 = t3 + t9;
+    t4 = 0.11189126112211174 * t11;
+    y[250] = t4;
+    t5 = 0.07855526499661797 * t11;
+    y[289] = t5;
+    t10 = (-C86) * t6;
+    t13 = (-C87) * t2;
+    t14 = t10 + t13;
+    t0 = 0.10433646450524006 * t14;
+    y[199] = t0;
+    t12 = 0.007322741888918101 * t14;
+    y[340] = t12;
+    t1 = C87 * t6;
+    t8 = (-C86) * t2;
+    t7 = t1 + t8;
+    y[19] = 0;
+    t3 = (-0.10649307664199294) * t7;
+    y[160] = t3;
+    t9 = re[18];
+    t4 = im[18];
+    t11 = re[63];
+    t5 = im[63];
+    t10 = t9 - t11;
+    t13 = t4 - t5;
+    t0 = t9 + t11;
+    t14 = t4 + t5;
+    t12 = (-C88) * t0;
+    t6 = (-C89) * t14;
+    t2 = t12 + t6;
+    t1 = 0.10434601759724747 * t2;
+    y[197] = t1;
+    t8 = 0.00597475942728469 * t2;
+    y[342] = t8;
+    t7 = C89 * t0;
+    t3 = (-C88) * t14;
+    t9 = t7 + t3;
+    y[17] = 0;
+    t11 = (-0.10648332698232474) * t9;
+    y[162] = t11;
+    t4 = C90 * t10;
+    t5 = C91 * t13;
+    t12 = t4 + t5;
+    t6 = 0.025727538017752363 * t12;
+    y[72] = t6;
+    t1 = (-0.08077908739264364) * t12;
+    y[107] = t1;
+    t2 = (-C91) * t10;
+    t8 = C90 * t13;
+    t0 = t2 + t8;
+    t14 = 0.11157928098847411 * t0;
+    y[252] = t14;
+    t7 = 0.08154058967816075 * t0;
+    y[287] = t7;
+    t3 = re[66];
+    t9 = im[66];
+    t11 = re[21];
+    t4 = im[21];
+    t5 = t3 - t11;
+    t6 = t9 - t4;
+    t12 = t3 + t11;
+    t1 = t9 + t4;
+    t10 = C92 * t12;
+    t13 = C93 * t1;
+    t2 = t10 + t13;
+    t8 = 0.028739200127234528 * t2;
+    y[74] = t8;
+    t14 = (-0.07815126422793621) * t2;
+    y[105] = t14;
+    t0 = (-C93) * t12;
+    t7 = C92 * t1;
+    t3 = t0 + t7;
+    t11 = 0.11112823978612332 * t3;
+    y[254] = t11;
+    t9 = 0.08442471153193547 * t3;
+    y[285] = t9;
+    t4 = (-C94) * t5;
+    t10 = (-C95) * t6;
+    t13 = t4 + t10;
+    t8 = 0.10438765580397108 * t13;
+    y[195] = t8;
+    t2 = 0.004778532564716806 * t13;
+    y[344] = t2;
+    t14 = C95 * t5;
+    t12 = (-C94) * t6;
+    t1 = t14 + t12;
+    y[15] = 0;
+    t0 = (-0.10644085285310552) * t1;
+    y[164] = t0;
+    t7 = re[24];
+    t11 = im[24];
+    t3 = re[69];
+    t9 = im[69];
+    t4 = t7 - t3;
+    t10 = t11 - t9;
+    t8 = t7 + t3;
+    t13 = t11 + t9;
+    t2 = (-C96) * t8;
+    t5 = (-C97) * t13;
+    t6 = t2 + t5;
+    t14 = 0.10445796994690988 * t6;
+    y[193] = t14;
+    t12 = 0.0037318695349662285 * t6;
+    y[346] = t12;
+    t1 = C97 * t8;
+    t0 = (-C96) * t13;
+    t7 = t1 + t0;
+    y[13] = 0;
+    t3 = (-0.1063692039655592) * t7;
+    y[166] = t3;
+    t11 = C98 * t4;
+    t9 = C99 * t10;
+    t2 = t11 + t9;
+    t5 = 0.0318543301923774 * t2;
+    y[76] = t5;
+    t14 = (-0.07539457511296481) * t2;
+    y[103] = t14;
+    t6 = (-C99) * t4;
+    t12 = C98 * t10;
+    t8 = t6 + t12;
+    t13 = 0.11053192528606762 * t8;
+    y[256] = t13;
+    t1 = 0.08719704828120174 * t8;
+    y[283] = t1;
+    t0 = re[82];
+    t7 = im[82];
+    t3 = re[37];
+    t11 = im[37];
+    t9 = t0 - t3;
+    t5 = t7 - t11;
+    t2 = t0 + t3;
+    t14 = t7 + t11;
+    t4 = C100 * t2;
+    t10 = C101 * t14;
+    t6 = t4 + t10;
+    t12 = 0.03505523933023199 * t6;
+    y[78] = t12;
+    t13 = (-0.07251899904062391) * t6;
+    y[101] = t13;
+    t8 = (-C101) * t2;
+    t1 = C100 * t14;
+    t0 = t8 + t1;
+    t3 = 0.10978391243307457 * t0;
+    y[258] = t3;
+    t7 = 0.089849384311141 * t0;
+    y[281] = t7;
+    t11 = (-C102) * t9;
+    t4 = (-C103) * t5;
+    t10 = t11 + t4;
+    t12 = 0.10455343402886527 * t10;
+    y[191] = t12;
+    t6 = 0.002831428512025885 * t10;
+    y[348] = t6;
+    t13 = C103 * t9;
+    t2 = (-C102) * t5;
+    t14 = t13 + t2;
+    y[11] = 0;
+    t8 = (-0.10627208196761412) * t14;
+    y[168] = t8;
+    t1 = re[40];
+    t3 = im[40];
+    t0 = re[85];
+    t7 = im[85];
+    t11 = t1 - t0;
+    t4 = t3 - t7;
+    t12 = t1 + t0;
+    t10 = t3 + t7;
+    t6 = (-C104) * t12;
+    t9 = (-C105) * t10;
+    t5 = t6 + t9;
+    t13 = 0.10467052399007644 * t5;
+    y[189] = t13;
+    t2 = 0.00207288243561721 * t5;
+    y[350] = t2;
+    t14 = C105 * t12;
+    t8 = (-C104) * t10;
+    t1 = t14 + t8;
+    y[9] = 0;
+    t0 = (-0.10615320041929409) * t1;
+    y[170] = t0;
+    t3 = C106 * t11;
+    t7 = C107 * t4;
+    t6 = t3 + t7;
+    t9 = 0.03832547887509067 * t6;
+    y[80] = t9;
+    t13 = (-0.0695334865235696) * t6;
+    y[99] = t13;
+    t5 = (-C107) * t11;
+    t2 = C106 * t4;
+    t12 = t5 + t2;
+    t10 = 0.10888112665010784 * t12;
+    y[260] = t10;
+    t14 = 0.09237266858564189 * t12;
+    y[279] = t14;
+    t8 = re[88];
+    t1 = im[88];
+    t0 = re[43];
+    t3 = im[43];
+    t7 = t8 - t0;
+    t9 = t1 - t3;
+    t6 = t8 + t0;
+    t13 = t1 + t3;
+    t11 = C108 * t6;
+    t4 = C109 * t13;
+    t5 = t11 + t4;
+    t2 = 0.041646250636607804 * t5;
+    y[82] = t2;
+    t10 = (-0.0664515457924376) * t5;
+    y[97] = t10;
+    t12 = (-C109) * t6;
+    t14 = C108 * t13;
+    t8 = t12 + t14;
+    t0 = 0.10781825814583676 * t8;
+    y[262] = t0;
+    t1 = 0.09476053984084731 * t8;
+    y[277] = t1;
+    t3 = (-C110) * t7;
+    t11 = (-C111) * t9;
+    t4 = t3 + t11;
+    t2 = 0.10480559227732088 * t4;
+    y[187] = t2;
+    t5 = 0.0014514366788171667 * t4;
+    y[352] = t5;
+    t10 = C111 * t7;
+    t6 = (-C110) * t9;
+    t13 = t10 + t6;
+    y[7] = 0;
+    t12 = (-0.1060163954010255) * t13;
+    y[172] = t12;
+    t14 = re[56];
+    t0 = im[56];
+    t8 = re[11];
+    t1 = im[11];
+    t3 = t14 - t8;
+    t11 = t0 - t1;
+    t2 = t14 + t8;
+    t4 = t0 + t1;
+    t5 = (-C112) * t2;
+    t7 = (-C113) * t4;
+    t9 = t5 + t7;
+    t10 = 0.10495498046159855 * t9;
+    y[185] = t10;
+    t6 = 0.0009579147564804909 * t9;
+    y[354] = t6;
+    t13 = C113 * t2;
+    t12 = (-C112) * t4;
+    t14 = t13 + t12;
+    y[5] = 0;
+    t8 = (-0.10586549644660743) * t14;
+    y[174] = t8;
+    t0 = C114 * t3;
+    t1 = C115 * t11;
+    t5 = t0 + t1;
+    t7 = 0.04499990039956431 * t5;
+    y[84] = t7;
+    t10 = (-0.06328411738407469) * t5;
+    y[95] = t10;
+    t9 = (-C115) * t3;
+    t6 = C114 * t11;
+    t2 = t9 + t6;
+    t4 = 0.10659592439523378 * t2;
+    y[264] = t4;
+    t13 = 0.09700648402016114 * t2;
+    y[275] = t13;
+    t12 = re[14];
+    t14 = im[14];
+    t8 = re[59];
+    t0 = im[59];
+    t1 = t12 - t8;
+    t7 = t14 - t0;
+    t5 = t12 + t8;
+    t10 = t14 + t0;
+    t3 = C116 * t5;
+    t11 = C117 * t10;
+    t9 = t3 + t11;
+    t6 = 0.04836983709461063 * t9;
+    y[86] = t6;
+    t4 = (-0.0600463334420454) * t9;
+    y[93] = t4;
+    t2 = (-C117) * t5;
+    t13 = C116 * t10;
+    t12 = t2 + t13;
+    t8 = 0.10521100884722148 * t12;
+    y[266] = t8;
+    t14 = 0.09910258293243136 * t12;
+    y[273] = t14;
+    t0 = (-C118) * t1;
+    t3 = (-C119) * t7;
+    t11 = t0 + t3;
+    t6 = 0.10511501301267116 * t11;
+    y[183] = t6;
+    t9 = 0.000582585005005862 * t11;
+    y[356] = t9;
+    t4 = C119 * t1;
+    t5 = (-C118) * t7;
+    t10 = t4 + t5;
+    y[3] = 0;
+    t2 = (-0.10570432132060638) * t10;
+    y[176] = t2;
+    t13 = re[62];
+    t8 = im[62];
+    t12 = re[17];
+    t14 = im[17];
+    t0 = t13 - t12;
+    t3 = t8 - t14;
+    t6 = t13 + t12;
+    t11 = t8 + t14;
+    t9 = (-C120) * t6;
+    t1 = (-C121) * t11;
+    t7 = t9 + t1;
+    t4 = 0.10528188045534946 * t7;
+    y[181] = t4;
+    t5 = 0.0003110214546045697 * t7;
+    y[358] = t5;
+    t10 = C121 * t6;
+    t2 = (-C120) * t11;
+    t13 = t10 + t2;
+    y[1] = 0;
+    t12 = (-0.1055367843265621) * t13;
+    y[178] = t12;
+    t8 = C122 * t0;
+    t14 = C123 * t3;
+    t9 = t8 + t14;
+    t1 = 0.05173842041721468 * t9;
+    y[88] = t1;
+    t4 = (-0.05675218688923857) * t9;
+    y[91] = t4;
+    t7 = (-C123) * t0;
+    t5 = C122 * t3;
+    t6 = t7 + t5;
+    t11 = 0.10366449176446424 * t6;
+    y[268] = t11;
+    t10 = 0.10104530556902915 * t6;
+    y[271] = t10;
+}
+
+//
+//  Public functions.
+//
+
+/**
+ *  Apply LD-IMDCT transform (prebuilt for window W75_180, input pruned).
+ * 
+ *  Note(s):
+ *    [1] y[n] = w[n] * SUM(X[k] * cos(PI / 180 * (n + 90.5) * (k + 0.5))), where
+ *        w[n] = sqrt(2 / 180) * W75_180[359 - n].
+ *    [2] X[k] shall be zero for all k >= 60 (not checked).
+ *    [3] The size of all arrays will not be checked.
+ * 
+ *  @param {Number[]} X 
+ *    - The input block (180 points, only the first 60 points are used).
+ *  @param {Number[]} y 
+ *    - The array that would contain the output block (360 points).
+ *  @param {Number[]} re 
+ *    - The scratch buffer (real part, 90 points).
+ *  @param {Number[]} im 
+ *    - The scratch buffer (imaginary part, 90 points).
+ */
+function ApplyWindowedIMDCT_W75_180_K60(X, y, re, im) {
+    ApplyWindowedIMDCT_W75_180_K60_Part1(X, y, re, im);
+    ApplyWindowedIMDCT_W75_180_K60_Part2(X, y, re, im);
+    ApplyWindowedIMDCT_W75_180_K60_Part3(X, y, re, im);
+}
+
+//  Export public APIs.
+module.exports = {
+    "ApplyWindowedIMDCT_W75_180_K60": ApplyWindowedIMDCT_W75_180_K60
+};
\ No newline at end of file
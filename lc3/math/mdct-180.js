@@ -0,0 +1,11183 @@
+//
+//  Copyright 2021 - 2023 XiaoJSoft Studio. All rights reserved.
+//  Use of this source code is governed by a BSD-style license that can be
+//  found in the LICENSE.md file.
+//
+
+//
+//  Note(s):
+//    [1] This file is generated automatically by a MDCT compiler, which locates 
+//        at "./../../dev/mdct-generator/" directory.
+//        Do NOT modify this file manually.
+//
+
+//
+//  Private functions.
+//
+
+/**
+ *  Part 1 of ApplyWindowedMDCT_W75_180().
+ * 
+ *  @param {Number[]} x 
+ *    - The input block (360 points).
+ *  @param {Number[]} X 
+ *    - The array that would contain the output block (180 points).
+ *  @param {Number[]} re 
+ *    - The scratch buffer (real part, 90 points).
+ *  @param {Number[]} im 
+ *    - The scratch buffer (imaginary part, 90 points).
+ */
+function ApplyWindowedMDCT_W75_180_Part1(x, X, re, im) {
+    let t0, t1, t10, t11, t12, t13, t14, t2, t3, t4, t5, t6, t7, t8, t9;
+    const C0 = 0.49999999999999994;
+    const C1 = 0.8660254037844387;
+    const C2 = 0.5;
+    const C3 = 0.8660254037844386;
+    const C4 = 0.984807753012208;
+    const C5 = 0.17364817766693033;
+    const C6 = 0.6427876096865393;
+    const C7 = 0.766044443118978;
+    const C8 = 0.3420201433256687;
+    const C9 = 0.9396926207859084;
+    const C10 = 1.4088320528055172;
+    const C11 = 0.12325683343243876;
+    const C12 = 1.1584559306791384;
+    const C13 = 0.8111595753452777;
+    const C14 = 0.5976724774602398;
+    const C15 = 1.281712764111577;
+    const C16 = 0.9510565162951535;
+    const C17 = 0.3090169943749474;
+    const C18 = 0.6691306063588582;
+    const C19 = 0.7431448254773942;
+    const C20 = 0.20791169081775931;
+    const C21 = 0.9781476007338057;
+    const C22 = 0.4694715627858908;
+    const C23 = 0.882947592858927;
+    const C24 = 0.5299192642332049;
+    const C25 = 0.848048096156426;
+    const C26 = 0.03489949670250097;
+    const C27 = 0.9993908270190958;
+    const C28 = 0.6156614753256583;
+    const C29 = 0.7880107536067219;
+    const C30 = 0.374606593415912;
+    const C31 = 0.9271838545667874;
+    const C32 = 0.9902680687415704;
+    const C33 = 0.13917310096006544;
+    const C34 = 0.5877852522924731;
+    const C35 = 0.8090169943749475;
+    const C36 = 0.40673664307580015;
+    const C37 = 0.9135454576426009;
+    const C38 = 0.9945218953682733;
+    const C39 = 0.10452846326765346;
+    const C40 = 0.6946583704589973;
+    const C41 = 0.7193398003386512;
+    const C42 = 0.24192189559966773;
+    const C43 = 0.9702957262759965;
+    const C44 = 0.9612616959383189;
+    const C45 = 0.27563735581699916;
+    const C46 = 0.5591929034707468;
+    const C47 = 0.8290375725550417;
+    const C48 = 0.0697564737441253;
+    const C49 = 0.9975640502598242;
+    const C50 = 0.4383711467890774;
+    const C51 = 0.898794046299167;
+    const C52 = 0.5590169943749475;
+    const C53 = 0.25;
+    t0 = x[269];
+    t0 = 0.05508843033578144 * t0;
+    t1 = x[270];
+    t1 = 0.05341685744944068 * t1;
+    t0 = t0 + t1;
+    t1 = x[89];
+    t1 = 0.10195818372679734 * t1;
+    t2 = x[90];
+    t2 = 0.10283148949142575 * t2;
+    t1 = t1 - t2;
+    t2 = -t0;
+    t3 = x[209];
+    t4 = x[29];
+    t4 = 0.0163672975990987 * t4;
+    t5 = x[150];
+    t5 = 0.10487973921603179 * t5;
+    t4 = t4 - t5;
+    t5 = (-0.09174798257910688) * t3;
+    t6 = C0 * t4;
+    t5 = t5 + t6;
+    t6 = 0.052970722439652444 * t3;
+    t3 = C1 * t4;
+    t4 = t6 + t3;
+    t6 = x[30];
+    t3 = 0.017479194012891126 * t6;
+    t6 = x[149];
+    t6 = 0.10499642748426294 * t6;
+    t3 = t3 - t6;
+    t6 = x[210];
+    t7 = C0 * t3;
+    t8 = (-0.09164601803176593) * t6;
+    t7 = t7 + t8;
+    t8 = (-C1) * t3;
+    t3 = (-0.052911853180797344) * t6;
+    t6 = t8 + t3;
+    t8 = t5 + t7;
+    t3 = t4 + t6;
+    t9 = C2 * t8;
+    t2 = t2 - t9;
+    t9 = C2 * t3;
+    t9 = t1 - t9;
+    t5 = t5 - t7;
+    t7 = C3 * t5;
+    t5 = t4 - t6;
+    t4 = C3 * t5;
+    t6 = t8 - t0;
+    t5 = t1 + t3;
+    t8 = t2 + t4;
+    t0 = t9 - t7;
+    t1 = t2 - t4;
+    t3 = t9 + t7;
+    re[0] = t6;
+    im[0] = t5;
+    re[30] = t8;
+    im[30] = t0;
+    re[60] = t1;
+    im[60] = t3;
+    t2 = x[249];
+    t4 = 0.08446290146459451 * t2;
+    t9 = x[290];
+    t7 = 0.02144008238657481 * t9;
+    t6 = t4 + t7;
+    t5 = x[69];
+    t8 = 0.07702845466518891 * t5;
+    t0 = x[110];
+    t1 = 0.1119972737491647 * t0;
+    t3 = t8 - t1;
+    t2 = (-C4) * t6;
+    t9 = C5 * t3;
+    t4 = t2 + t9;
+    t7 = C5 * t6;
+    t5 = C4 * t3;
+    t0 = t7 + t5;
+    t8 = x[189];
+    t1 = x[9];
+    t2 = 0.00207288243561721 * t1;
+    t9 = x[170];
+    t6 = 0.10467052399007644 * t9;
+    t3 = t2 - t6;
+    t7 = (-0.0813180693004954) * t8;
+    t5 = C6 * t3;
+    t1 = t7 + t5;
+    t9 = 0.06823396195809418 * t8;
+    t2 = C7 * t3;
+    t6 = t9 + t2;
+    t7 = x[50];
+    t5 = 0.045930977828050105 * t7;
+    t8 = x[129];
+    t3 = 0.10952127322317406 * t8;
+    t9 = t5 - t3;
+    t2 = x[230];
+    t7 = 0.10019163696307268 * t2;
+    t8 = x[309];
+    t5 = 0.0030044094666997023 * t8;
+    t3 = t7 + t5;
+    t2 = C8 * t9;
+    t8 = (-C9) * t3;
+    t7 = t2 + t8;
+    t5 = (-C9) * t9;
+    t2 = (-C8) * t3;
+    t8 = t5 + t2;
+    t9 = t1 + t7;
+    t3 = t6 + t8;
+    t5 = C2 * t9;
+    t2 = t4 - t5;
+    t5 = C2 * t3;
+    t5 = t0 - t5;
+    t1 = t1 - t7;
+    t7 = C3 * t1;
+    t1 = t6 - t8;
+    t6 = C3 * t1;
+    t8 = t4 + t9;
+    t1 = t0 + t3;
+    t4 = t2 + t6;
+    t9 = t5 - t7;
+    t0 = t2 - t6;
+    t3 = t5 + t7;
+    t2 = t4 + t9;
+    t6 = C7 * t2;
+    t5 = t4 * (-C10);
+    t7 = t9 * C11;
+    t2 = t6 - t7;
+    t4 = t6 + t5;
+    t9 = t0 + t3;
+    t7 = C5 * t9;
+    t6 = t0 * (-C12);
+    t5 = t3 * (-C13);
+    t9 = t7 - t5;
+    t0 = t7 + t6;
+    re[10] = t8;
+    im[10] = t1;
+    re[40] = t2;
+    im[40] = t4;
+    re[70] = t9;
+    im[70] = t0;
+    t3 = x[229];
+    t5 = 0.1006795131082048 * t3;
+    t7 = x[310];
+    t6 = 0.002515371651828484 * t7;
+    t8 = t5 + t6;
+    t1 = x[49];
+    t2 = 0.04430435466830059 * t1;
+    t4 = x[130];
+    t9 = 0.10925429467963434 * t4;
+    t0 = t2 - t9;
+    t3 = (-C9) * t8;
+    t7 = C8 * t0;
+    t5 = t3 + t7;
+    t6 = C8 * t8;
+    t1 = C9 * t0;
+    t4 = t6 + t1;
+    t2 = x[10];
+    t9 = 0.0024344642407252456 * t2;
+    t3 = x[169];
+    t7 = 0.1046094996364962 * t3;
+    t8 = t9 - t7;
+    t0 = x[190];
+    t6 = C6 * t8;
+    t1 = (-0.08136550650869062) * t0;
+    t2 = t6 + t1;
+    t3 = (-C7) * t8;
+    t9 = (-0.06827376650199488) * t0;
+    t7 = t3 + t9;
+    t6 = x[70];
+    t1 = 0.07855526499661797 * t6;
+    t8 = x[109];
+    t0 = 0.11189126112211174 * t8;
+    t3 = t1 - t0;
+    t9 = x[250];
+    t6 = 0.0832703302350659 * t9;
+    t8 = x[289];
+    t1 = 0.022836010382399043 * t8;
+    t0 = t6 + t1;
+    t9 = C5 * t3;
+    t8 = (-C4) * t0;
+    t6 = t9 + t8;
+    t1 = (-C4) * t3;
+    t9 = (-C5) * t0;
+    t8 = t1 + t9;
+    t3 = t2 + t6;
+    t0 = t7 + t8;
+    t1 = C2 * t3;
+    t9 = t5 - t1;
+    t1 = C2 * t0;
+    t1 = t4 - t1;
+    t2 = t2 - t6;
+    t6 = C3 * t2;
+    t2 = t7 - t8;
+    t7 = C3 * t2;
+    t8 = t5 + t3;
+    t2 = t4 + t0;
+    t5 = t9 + t7;
+    t3 = t1 - t6;
+    t4 = t9 - t7;
+    t0 = t1 + t6;
+    t9 = t5 + t3;
+    t7 = C5 * t9;
+    t1 = t5 * (-C12);
+    t6 = t3 * (-C13);
+    t9 = t7 - t6;
+    t5 = t7 + t1;
+    t3 = t4 + t0;
+    t6 = (-C9) * t3;
+    t7 = t4 * C14;
+    t1 = t0 * (-C15);
+    t3 = t6 - t1;
+    t4 = t6 + t7;
+    re[20] = t8;
+    im[20] = t2;
+    re[50] = t9;
+    im[50] = t5;
+    re[80] = t3;
+    im[80] = t4;
+    t0 = re[0];
+    t1 = im[0];
+    t6 = re[10];
+    t7 = im[10];
+    t8 = re[20];
+    t2 = im[20];
+    t9 = t6 + t8;
+    t5 = t7 + t2;
+    t3 = C2 * t9;
+    t4 = t0 - t3;
+    t3 = C2 * t5;
+    t3 = t1 - t3;
+    t6 = t6 - t8;
+    t8 = C3 * t6;
+    t6 = t7 - t2;
+    t7 = C3 * t6;
+    t2 = t0 + t9;
+    t6 = t1 + t5;
+    t0 = t4 + t7;
+    t9 = t3 - t8;
+    t1 = t4 - t7;
+    t5 = t3 + t8;
+    re[0] = t2;
+    im[0] = t6;
+    re[10] = t0;
+    im[10] = t9;
+    re[20] = t1;
+    im[20] = t5;
+    t4 = re[30];
+    t7 = im[30];
+    t3 = re[40];
+    t8 = im[40];
+    t2 = re[50];
+    t6 = im[50];
+    t0 = t3 + t2;
+    t9 = t8 + t6;
+    t1 = C2 * t0;
+    t5 = t4 - t1;
+    t1 = C2 * t9;
+    t1 = t7 - t1;
+    t3 = t3 - t2;
+    t2 = C3 * t3;
+    t3 = t8 - t6;
+    t8 = C3 * t3;
+    t6 = t4 + t0;
+    t3 = t7 + t9;
+    t4 = t5 + t8;
+    t0 = t1 - t2;
+    t7 = t5 - t8;
+    t9 = t1 + t2;
+    re[30] = t6;
+    im[30] = t3;
+    re[40] = t4;
+    im[40] = t0;
+    re[50] = t7;
+    im[50] = t9;
+    t5 = re[60];
+    t8 = im[60];
+    t1 = re[70];
+    t2 = im[70];
+    t6 = re[80];
+    t3 = im[80];
+    t4 = t1 + t6;
+    t0 = t2 + t3;
+    t7 = C2 * t4;
+    t9 = t5 - t7;
+    t7 = C2 * t0;
+    t7 = t8 - t7;
+    t1 = t1 - t6;
+    t6 = C3 * t1;
+    t1 = t2 - t3;
+    t2 = C3 * t1;
+    t3 = t5 + t4;
+    t1 = t8 + t0;
+    t5 = t9 + t2;
+    t4 = t7 - t6;
+    t8 = t9 - t2;
+    t0 = t7 + t6;
+    re[60] = t3;
+    im[60] = t1;
+    re[70] = t5;
+    im[70] = t4;
+    re[80] = t8;
+    im[80] = t0;
+    t9 = x[233];
+    t2 = 0.0985457172414932 * t9;
+    t7 = x[306];
+    t6 = 0.004771859549919083 * t7;
+    t3 = t2 + t6;
+    t1 = x[53];
+    t5 = 0.05087145958604732 * t1;
+    t4 = x[126];
+    t8 = 0.11028748843781232 * t4;
+    t0 = t5 - t8;
+    t9 = (-C16) * t3;
+    t7 = C17 * t0;
+    t2 = t9 + t7;
+    t6 = C17 * t3;
+    t1 = C16 * t0;
+    t4 = t6 + t1;
+    t5 = x[6];
+    t8 = 0.0011892177864014468 * t5;
+    t9 = x[173];
+    t7 = 0.10487872610705846 * t9;
+    t3 = t8 - t7;
+    t0 = x[186];
+    t6 = C18 * t3;
+    t1 = (-0.07873059708122147) * t0;
+    t5 = t6 + t1;
+    t9 = (-C19) * t3;
+    t8 = (-0.07088934802191553) * t0;
+    t7 = t9 + t8;
+    t6 = x[66];
+    t1 = 0.07233020336790129 * t6;
+    t3 = x[113];
+    t0 = 0.11213066231169123 * t3;
+    t9 = t1 - t0;
+    t8 = x[246];
+    t6 = 0.08782223808436534 * t8;
+    t3 = x[293];
+    t1 = 0.01746912534711498 * t3;
+    t0 = t6 + t1;
+    t8 = C20 * t9;
+    t3 = (-C21) * t0;
+    t6 = t8 + t3;
+    t1 = (-C21) * t9;
+    t8 = (-C20) * t0;
+    t3 = t1 + t8;
+    t9 = t5 + t6;
+    t0 = t7 + t3;
+    t1 = C2 * t9;
+    t8 = t2 - t1;
+    t1 = C2 * t0;
+    t1 = t4 - t1;
+    t5 = t5 - t6;
+    t6 = C3 * t5;
+    t5 = t7 - t3;
+    t7 = C3 * t5;
+    t3 = t2 + t9;
+    t5 = t4 + t0;
+    t2 = t8 + t7;
+    t9 = t1 - t6;
+    t4 = t8 - t7;
+    t0 = t1 + t6;
+    re[18] = t3;
+    im[18] = t5;
+    re[48] = t2;
+    im[48] = t9;
+    re[78] = t4;
+    im[78] = t0;
+    t8 = x[213];
+    t7 = x[33];
+    t1 = 0.02102631934479988 * t7;
+    t6 = x[146];
+    t3 = 0.10542273976138705 * t6;
+    t5 = t1 - t3;
+    t2 = (-0.09305894375111765) * t8;
+    t9 = C22 * t5;
+    t4 = t2 + t9;
+    t0 = 0.04948031809292428 * t8;
+    t7 = C23 * t5;
+    t6 = t0 + t7;
+    t1 = x[26];
+    t3 = 0.013253791127641398 * t1;
+    t2 = x[153];
+    t9 = 0.10460195802648305 * t2;
+    t8 = t3 - t9;
+    t5 = x[206];
+    t0 = C24 * t8;
+    t7 = (-0.09008202907229176) * t5;
+    t1 = t0 + t7;
+    t2 = (-C25) * t8;
+    t3 = (-0.05628949912508015) * t5;
+    t9 = t2 + t3;
+    t0 = x[86];
+    t7 = 0.09910258293243136 * t0;
+    t8 = x[93];
+    t5 = 0.10521100884722148 * t8;
+    t2 = t7 - t5;
+    t3 = x[266];
+    t0 = 0.0600463334420454 * t3;
+    t8 = x[273];
+    t7 = 0.04836983709461063 * t8;
+    t5 = t0 + t7;
+    t3 = C26 * t2;
+    t8 = (-C27) * t5;
+    t0 = t3 + t8;
+    t7 = (-C27) * t2;
+    t3 = (-C26) * t5;
+    t8 = t7 + t3;
+    t2 = t1 + t0;
+    t5 = t9 + t8;
+    t7 = C2 * t2;
+    t3 = t4 - t7;
+    t7 = C2 * t5;
+    t7 = t6 - t7;
+    t1 = t1 - t0;
+    t0 = C3 * t1;
+    t1 = t9 - t8;
+    t9 = C3 * t1;
+    t8 = t4 + t2;
+    t1 = t6 + t5;
+    t4 = t3 + t9;
+    t2 = t7 - t0;
+    t6 = t3 - t9;
+    t5 = t7 + t0;
+    t3 = t4 + t2;
+    t9 = C7 * t3;
+    t7 = t4 * (-C10);
+    t0 = t2 * C11;
+    t3 = t9 - t0;
+    t4 = t9 + t7;
+    t2 = t6 + t5;
+    t0 = C5 * t2;
+    t9 = t6 * (-C12);
+    t7 = t5 * (-C13);
+    t2 = t0 - t7;
+    t6 = t0 + t9;
+    re[28] = t8;
+    im[28] = t1;
+    re[58] = t3;
+    im[58] = t4;
+    re[88] = t2;
+    im[88] = t6;
+    t5 = x[193];
+    t7 = x[13];
+    t0 = 0.0037318695349662285 * t7;
+    t9 = x[166];
+    t8 = 0.10445796994690988 * t9;
+    t1 = t0 - t8;
+    t3 = (-0.08382007657744742) * t5;
+    t4 = C28 * t1;
+    t2 = t3 + t4;
+    t6 = 0.06548742104265204 * t5;
+    t7 = C29 * t1;
+    t9 = t6 + t7;
+    t0 = x[46];
+    t8 = 0.03950892201611919 * t0;
+    t3 = x[133];
+    t4 = 0.10843752343695495 * t3;
+    t5 = t8 - t4;
+    t1 = x[226];
+    t6 = 0.10197789626508247 * t1;
+    t7 = x[313];
+    t0 = 0.001338446915694132 * t7;
+    t3 = t6 + t0;
+    t8 = C30 * t5;
+    t4 = (-C31) * t3;
+    t1 = t8 + t4;
+    t7 = (-C31) * t5;
+    t6 = (-C30) * t3;
+    t0 = t7 + t6;
+    t8 = x[253];
+    t4 = 0.07948177534274314 * t8;
+    t5 = x[286];
+    t3 = 0.027219561165582794 * t5;
+    t7 = t4 + t3;
+    t6 = x[73];
+    t8 = 0.0829960016863824 * t6;
+    t5 = x[106];
+    t4 = 0.11137139713523048 * t5;
+    t3 = t8 - t4;
+    t6 = (-C32) * t7;
+    t5 = C33 * t3;
+    t8 = t6 + t5;
+    t4 = C33 * t7;
+    t6 = C32 * t3;
+    t5 = t4 + t6;
+    t7 = t1 + t8;
+    t3 = t0 + t5;
+    t4 = C2 * t7;
+    t6 = t2 - t4;
+    t4 = C2 * t3;
+    t4 = t9 - t4;
+    t1 = t1 - t8;
+    t8 = C3 * t1;
+    t1 = t0 - t5;
+    t0 = C3 * t1;
+    t5 = t2 + t7;
+    t1 = t9 + t3;
+    t2 = t6 + t0;
+    t7 = t4 - t8;
+    t9 = t6 - t0;
+    t3 = t4 + t8;
+    t6 = t2 + t7;
+    t0 = C5 * t6;
+    t4 = t2 * (-C12);
+    t8 = t7 * (-C13);
+    t6 = t0 - t8;
+    t2 = t0 + t4;
+    t7 = t9 + t3;
+    t8 = (-C9) * t7;
+    t0 = t9 * C14;
+    t4 = t3 * (-C15);
+    t7 = t8 - t4;
+    t9 = t8 + t0;
+    re[38] = t5;
+    im[38] = t1;
+    re[68] = t6;
+    im[68] = t2;
+    re[8] = t7;
+    im[8] = t9;
+    t3 = re[18];
+    t4 = im[18];
+    t8 = re[28];
+    t0 = im[28];
+    t5 = re[38];
+    t1 = im[38];
+    t6 = t8 + t5;
+    t2 = t0 + t1;
+    t7 = C2 * t6;
+    t9 = t3 - t7;
+    t7 = C2 * t2;
+    t7 = t4 - t7;
+    t8 = t8 - t5;
+    t5 = C3 * t8;
+    t8 = t0 - t1;
+    t0 = C3 * t8;
+    t1 = t3 + t6;
+    t8 = t4 + t2;
+    t3 = t9 + t0;
+    t6 = t7 - t5;
+    t4 = t9 - t0;
+    t2 = t7 + t5;
+    re[18] = t1;
+    im[18] = t8;
+    re[28] = t3;
+    im[28] = t6;
+    re[38] = t4;
+    im[38] = t2;
+    t9 = re[48];
+    t0 = im[48];
+    t7 = re[58];
+    t5 = im[58];
+    t1 = re[68];
+    t8 = im[68];
+    t3 = t7 + t1;
+    t6 = t5 + t8;
+    t4 = C2 * t3;
+    t2 = t9 - t4;
+    t4 = C2 * t6;
+    t4 = t0 - t4;
+    t7 = t7 - t1;
+    t1 = C3 * t7;
+    t7 = t5 - t8;
+    t5 = C3 * t7;
+    t8 = t9 + t3;
+    t7 = t0 + t6;
+    t9 = t2 + t5;
+    t3 = t4 - t1;
+    t0 = t2 - t5;
+    t6 = t4 + t1;
+    re[48] = t8;
+    im[48] = t7;
+    re[58] = t9;
+    im[58] = t3;
+    re[68] = t0;
+    im[68] = t6;
+    t2 = re[78];
+    t5 = im[78];
+    t4 = re[88];
+    t1 = im[88];
+    t8 = re[8];
+    t7 = im[8];
+    t9 = t4 + t8;
+    t3 = t1 + t7;
+    t0 = C2 * t9;
+    t6 = t2 - t0;
+    t0 = C2 * t3;
+    t0 = t5 - t0;
+    t4 = t4 - t8;
+    t8 = C3 * t4;
+    t4 = t1 - t7;
+    t1 = C3 * t4;
+    t7 = t2 + t9;
+    t4 = t5 + t3;
+    t2 = t6 + t1;
+    t9 = t0 - t8;
+    t5 = t6 - t1;
+    t3 = t0 + t8;
+    re[78] = t7;
+    im[78] = t4;
+    re[88] = t2;
+    im[88] = t9;
+    re[8] = t5;
+    im[8] = t3;
+    t6 = x[197];
+    t1 = x[17];
+    t0 = 0.00597475942728469 * t1;
+    t8 = x[162];
+    t7 = 0.10434601759724747 * t8;
+    t4 = t0 - t7;
+    t2 = (-0.08614682114628511) * t6;
+    t9 = C34 * t4;
+    t5 = t2 + t9;
+    t3 = 0.06258932921524765 * t6;
+    t1 = C35 * t4;
+    t8 = t3 + t1;
+    t0 = x[42];
+    t7 = 0.03336822793098118 * t0;
+    t2 = x[137];
+    t9 = 0.10736592722456871 * t2;
+    t6 = t7 - t9;
+    t4 = x[222];
+    t3 = 0.1033626970269786 * t4;
+    t1 = x[317];
+    t0 = 0.0004039562545922317 * t1;
+    t2 = t3 + t0;
+    t7 = C36 * t6;
+    t9 = (-C37) * t2;
+    t4 = t7 + t9;
+    t1 = (-C37) * t6;
+    t3 = (-C36) * t2;
+    t0 = t1 + t3;
+    t7 = x[257];
+    t9 = 0.07397112828898918 * t7;
+    t6 = x[282];
+    t2 = 0.03344503750981467 * t6;
+    t1 = t9 + t2;
+    t3 = x[77];
+    t7 = 0.08853875428394885 * t3;
+    t6 = x[102];
+    t9 = 0.11017716427377129 * t6;
+    t2 = t7 - t9;
+    t3 = (-C38) * t1;
+    t6 = C39 * t2;
+    t7 = t3 + t6;
+    t9 = C39 * t1;
+    t3 = C38 * t2;
+    t6 = t9 + t3;
+    t1 = t4 + t7;
+    t2 = t0 + t6;
+    t9 = C2 * t1;
+    t3 = t5 - t9;
+    t9 = C2 * t2;
+    t9 = t8 - t9;
+    t4 = t4 - t7;
+    t7 = C3 * t4;
+    t4 = t0 - t6;
+    t0 = C3 * t4;
+    t6 = t5 + t1;
+    t4 = t8 + t2;
+    t5 = t3 + t0;
+    t1 = t9 - t7;
+    t8 = t3 - t0;
+    t2 = t9 + t7;
+    re[36] = t6;
+    im[36] = t4;
+    re[66] = t5;
+    im[66] = t1;
+    re[6] = t8;
+    im[6] = t2;
+    t3 = x[2];
+    t0 = 0.00043475807173410746 * t3;
+    t9 = x[177];
+    t7 = 0.10519783335687435 * t9;
+    t6 = t0 - t7;
+    t4 = x[182];
+    t5 = C40 * t6;
+    t1 = (-0.07597746258796823) * t4;
+    t8 = t5 + t1;
+    t2 = (-C41) * t6;
+    t3 = (-0.07337058275952534) * t4;
+    t9 = t2 + t3;
+    t0 = x[62];
+    t7 = 0.06584644108548751 * t0;
+    t5 = x[117];
+    t1 = 0.11192407043335297 * t5;
+    t6 = t7 - t1;
+    t4 = x[242];
+    t2 = 0.09177980677333142 * t4;
+    t3 = x[297];
+    t0 = 0.01273784185791163 * t3;
+    t5 = t2 + t0;
+    t7 = C42 * t6;
+    t1 = (-C43) * t5;
+    t4 = t7 + t1;
+    t3 = (-C43) * t6;
+    t2 = (-C42) * t5;
+    t0 = t3 + t2;
+    t7 = x[237];
+    t1 = 0.09589337747832162 * t7;
+    t6 = x[302];
+    t5 = 0.00782996317541068 * t6;
+    t3 = t1 + t5;
+    t2 = x[57];
+    t7 = 0.057539681884399944 * t2;
+    t6 = x[122];
+    t1 = 0.1111711548927498 * t6;
+    t5 = t7 - t1;
+    t2 = (-C44) * t3;
+    t6 = C45 * t5;
+    t7 = t2 + t6;
+    t1 = C45 * t3;
+    t2 = C44 * t5;
+    t6 = t1 + t2;
+    t3 = t4 + t7;
+    t5 = t0 + t6;
+    t1 = C2 * t3;
+    t2 = t8 - t1;
+    t1 = C2 * t5;
+    t1 = t9 - t1;
+    t4 = t4 - t7;
+    t7 = C3 * t4;
+    t4 = t0 - t6;
+    t0 = C3 * t4;
+    t6 = t8 + t3;
+    t4 = t9 + t5;
+    t8 = t2 + t0;
+    t3 = t1 - t7;
+    t9 = t2 - t0;
+    t5 = t1 + t7;
+    t2 = t8 + t3;
+    t0 = C7 * t2;
+    t1 = t8 * (-C10);
+    t7 = t3 * C11;
+    t2 = t0 - t7;
+    t8 = t0 + t1;
+    t3 = t9 + t5;
+    t7 = C5 * t3;
+    t0 = t9 * (-C12);
+    t1 = t5 * (-C13);
+    t3 = t7 - t1;
+    t9 = t7 + t0;
+    re[46] = t6;
+    im[46] = t4;
+    re[76] = t2;
+    im[76] = t8;
+    re[16] = t3;
+    im[16] = t9;
+    t5 = x[22];
+    t1 = 0.009633186119027486 * t5;
+    t7 = x[157];
+    t0 = 0.10438945505417567 * t7;
+    t6 = t1 - t0;
+    t4 = x[202];
+    t2 = C46 * t6;
+    t8 = (-0.08824194531108852) * t4;
+    t3 = t2 + t8;
+    t9 = (-C47) * t6;
+    t5 = (-0.059519943655072835) * t4;
+    t7 = t9 + t5;
+    t1 = x[82];
+    t0 = 0.09476053984084731 * t1;
+    t2 = x[97];
+    t8 = 0.10781825814583676 * t2;
+    t6 = t0 - t8;
+    t4 = x[262];
+    t9 = 0.0664515457924376 * t4;
+    t5 = x[277];
+    t1 = 0.041646250636607804 * t5;
+    t2 = t9 + t1;
+    t0 = C48 * t6;
+    t8 = (-C49) * t2;
+    t4 = t0 + t8;
+    t5 = (-C49) * t6;
+    t9 = (-C48) * t2;
+    t1 = t5 + t9;
+    t0 = x[217];
+    t8 = x[37];
+    t6 = 0.026222514401920968 * t8;
+    t2 = x[142];
+    t5 = 0.10617606024822178 * t2;
+    t9 = t6 - t5;
+    t8 = (-0.09405698884558525) * t0;
+    t2 = C50 * t9;
+    t6 = t8 + t2;
+    t5 = 0.045874658642367644 * t0;
+    t8 = C51 * t9;
+    t2 = t5 + t8;
+    t0 = t4 + t6;
+    t9 = t1 + t2;
+    t5 = C2 * t0;
+    t8 = t3 - t5;
+    t5 = C2 * t9;
+    t5 = t7 - t5;
+    t4 = t4 - t6;
+    t6 = C3 * t4;
+    t4 = t1 - t2;
+    t1 = C3 * t4;
+    t2 = t3 + t0;
+    t4 = t7 + t9;
+    t3 = t8 + t1;
+    t0 = t5 - t6;
+    t7 = t8 - t1;
+    t9 = t5 + t6;
+    t8 = t3 + t0;
+    t1 = C5 * t8;
+    t5 = t3 * (-C12);
+    t6 = t0 * (-C13);
+    t8 = t1 - t6;
+    t3 = t1 + t5;
+    t0 = t7 + t9;
+    t6 = (-C9) * t0;
+    t1 = t7 * C14;
+    t5 = t9 * (-C15);
+    t0 = t6 - t5;
+    t7 = t6 + t1;
+    re[56] = t2;
+    im[56] = t4;
+    re[86] = t8;
+    im[86] = t3;
+    re[26] = t0;
+    im[26] = t7;
+    t9 = re[36];
+    t5 = im[36];
+    t6 = re[46];
+    t1 = im[46];
+    t2 = re[56];
+    t4 = im[56];
+    t8 = t6 + t2;
+    t3 = t1 + t4;
+    t0 = C2 * t8;
+    t7 = t9 - t0;
+    t0 = C2 * t3;
+    t0 = t5 - t0;
+    t6 = t6 - t2;
+    t2 = C3 * t6;
+    t6 = t1 - t4;
+    t1 = C3 * t6;
+    t4 = t9 + t8;
+    t6 = t5 + t3;
+    t9 = t7 + t1;
+    t8 = t0 - t2;
+    t5 = t7 - t1;
+    t3 = t0 + t2;
+    re[36] = t4;
+    im[36] = t6;
+    re[46] = t9;
+    im[46] = t8;
+    re[56] = t5;
+    im[56] = t3;
+    t7 = re[66];
+    t1 = im[66];
+    t0 = re[76];
+    t2 = im[76];
+    t4 = re[86];
+    t6 = im[86];
+    t9 = t0 + t4;
+    t8 = t2 + t6;
+    t5 = C2 * t9;
+    t3 = t7 - t5;
+    t5 = C2 * t8;
+    t5 = t1 - t5;
+    t0 = t0 - t4;
+    t4 = C3 * t0;
+    t0 = t2 - t6;
+    t2 = C3 * t0;
+    t6 = t7 + t9;
+    t0 = t1 + t8;
+    t7 = t3 + t2;
+    t9 = t5 - t4;
+    t1 = t3 - t2;
+    t8 = t5 + t4;
+    re[66] = t6;
+    im[66] = t0;
+    re[76] = t7;
+    im[76] = t9;
+    re[86] = t1;
+    im[86] = t8;
+    t3 = re[6];
+    t2 = im[6];
+    t5 = re[16];
+    t4 = im[16];
+    t6 = re[26];
+    t0 = im[26];
+    t7 = t5 + t6;
+    t9 = t4 + t0;
+    t1 = C2 * t7;
+    t8 = t3 - t1;
+    t1 = C2 * t9;
+    t1 = t2 - t1;
+    t5 = t5 - t6;
+    t6 = C3 * t5;
+    t5 = t4 - t0;
+    t4 = C3 * t5;
+    t0 = t3 + t7;
+    t5 = t2 + t9;
+    t3 = t8 + t4;
+    t7 = t1 - t6;
+    t2 = t8 - t4;
+    t9 = t1 + t6;
+    re[6] = t0;
+    im[6] = t5;
+    re[16] = t3;
+    im[16] = t7;
+    re[26] = t2;
+    im[26] = t9;
+    t8 = x[18];
+    t4 = 0.0066295602099925134 * t8;
+    t1 = x[161];
+    t6 = 0.10433701609753676 * t1;
+    t0 = t4 - t6;
+    t5 = x[198];
+    t3 = C34 * t0;
+    t7 = (-0.08615425331767188) * t5;
+    t2 = t3 + t7;
+    t9 = (-C35) * t0;
+    t8 = (-0.06259472900383557) * t5;
+    t1 = t9 + t8;
+    t4 = x[78];
+    t6 = 0.089849384311141 * t4;
+    t3 = x[101];
+    t7 = 0.10978391243307457 * t3;
+    t0 = t6 - t7;
+    t5 = x[258];
+    t9 = 0.07251899904062391 * t5;
+    t8 = x[281];
+    t4 = 0.03505523933023199 * t8;
+    t3 = t9 + t4;
+    t6 = C39 * t0;
+    t7 = (-C38) * t3;
+    t5 = t6 + t7;
+    t8 = (-C38) * t0;
+    t9 = (-C39) * t3;
+    t4 = t8 + t9;
+    t6 = x[221];
+    t7 = x[41];
+    t0 = 0.03188777901462403 * t7;
+    t3 = x[138];
+    t8 = 0.10715459052193034 * t3;
+    t9 = t0 - t8;
+    t7 = (-0.09472767368599463) * t6;
+    t3 = C36 * t9;
+    t0 = t7 + t3;
+    t8 = 0.0421754776175514 * t6;
+    t7 = C37 * t9;
+    t3 = t8 + t7;
+    t6 = t5 + t0;
+    t9 = t4 + t3;
+    t8 = C2 * t6;
+    t7 = t2 - t8;
+    t8 = C2 * t9;
+    t8 = t1 - t8;
+    t5 = t5 - t0;
+    t0 = C3 * t5;
+    t5 = t4 - t3;
+    t4 = C3 * t5;
+    t3 = t2 + t6;
+    t5 = t1 + t9;
+    t2 = t7 + t4;
+    t6 = t8 - t0;
+    t1 = t7 - t4;
+    t9 = t8 + t0;
+    re[54] = t3;
+    im[54] = t5;
+    re[84] = t2;
+    im[84] = t6;
+    re[24] = t1;
+    im[24] = t9;
+    t7 = x[38];
+    t4 = 0.02759759882850269 * t7;
+    t8 = x[141];
+    t0 = 0.10639861625843644 * t8;
+    t3 = t4 - t0;
+    t5 = x[218];
+    t2 = C50 * t3;
+    t6 = (-0.09386024805227056) * t5;
+    t1 = t2 + t6;
+    t9 = (-C51) * t3;
+    t7 = (-0.045778701745967765) * t5;
+    t8 = t9 + t7;
+    t4 = x[261];
+    t0 = 0.06800367313228359 * t4;
+    t2 = x[278];
+    t6 = 0.03998081633739134 * t2;
+    t3 = t0 + t6;
+    t5 = x[81];
+    t9 = 0.09358384301872717 * t5;
+    t7 = x[98];
+    t4 = 0.10836992079672758 * t7;
+    t2 = t9 - t4;
+    t0 = (-C49) * t3;
+    t6 = C48 * t2;
+    t5 = t0 + t6;
+    t7 = C48 * t3;
+    t9 = C49 * t2;
+    t4 = t7 + t9;
+    t0 = x[201];
+    t6 = x[21];
+    t3 = 0.00882444138494175 * t6;
+    t2 = x[158];
+    t7 = 0.10436228446480811 * t2;
+    t9 = t3 - t7;
+    t6 = (-0.08826491899045306) * t0;
+    t2 = C46 * t9;
+    t3 = t6 + t2;
+    t7 = 0.05953543959746743 * t0;
+    t6 = C47 * t9;
+    t2 = t7 + t6;
+    t0 = t5 + t3;
+    t9 = t4 + t2;
+    t7 = C2 * t0;
+    t6 = t1 - t7;
+    t7 = C2 * t9;
+    t7 = t8 - t7;
+    t5 = t5 - t3;
+    t3 = C3 * t5;
+    t5 = t4 - t2;
+    t4 = C3 * t5;
+    t2 = t1 + t0;
+    t5 = t8 + t9;
+    t1 = t6 + t4;
+    t0 = t7 - t3;
+    t8 = t6 - t4;
+    t9 = t7 + t3;
+    t6 = t1 + t0;
+    t4 = C7 * t6;
+    t7 = t1 * (-C10);
+    t3 = t0 * C11;
+    t6 = t4 - t3;
+    t1 = t4 + t7;
+    t0 = t8 + t9;
+    t3 = C5 * t0;
+    t4 = t8 * (-C12);
+    t7 = t9 * (-C13);
+    t0 = t3 - t7;
+    t8 = t3 + t4;
+    re[64] = t2;
+    im[64] = t5;
+    re[4] = t6;
+    im[4] = t1;
+    re[34] = t0;
+    im[34] = t8;
+    t9 = x[58];
+    t7 = 0.05920943710311134 * t9;
+    t3 = x[121];
+    t4 = 0.11135812131039002 * t3;
+    t2 = t7 - t4;
+    t5 = x[238];
+    t6 = 0.09514316862034689 * t5;
+    t1 = x[301];
+    t0 = 0.008717302904480926 * t1;
+    t8 = t6 + t0;
+    t9 = C45 * t2;
+    t3 = (-C44) * t8;
+    t7 = t9 + t3;
+    t4 = (-C44) * t2;
+    t5 = (-C45) * t8;
+    t1 = t4 + t5;
+    t6 = x[241];
+    t0 = 0.09267610069341958 * t6;
+    t9 = x[298];
+    t3 = 0.011663765406511857 * t9;
+    t2 = t0 + t3;
+    t8 = x[61];
+    t4 = 0.06419701362972723 * t8;
+    t5 = x[118];
+    t6 = 0.11181234565117065 * t5;
+    t9 = t4 - t6;
+    t0 = (-C43) * t2;
+    t3 = C42 * t9;
+    t8 = t0 + t3;
+    t5 = C42 * t2;
+    t4 = C43 * t9;
+    t6 = t5 + t4;
+    t0 = x[181];
+    t3 = x[1];
+    t2 = 0.0003110214546045697 * t3;
+    t9 = x[178];
+    t5 = 0.10528188045534946 * t9;
+    t4 = t2 - t5;
+    t3 = (-0.07591680936585248) * t0;
+    t9 = C40 * t4;
+    t2 = t3 + t9;
+    t5 = 0.07331201062377228 * t0;
+    t3 = C41 * t4;
+    t9 = t5 + t3;
+    t0 = t8 + t2;
+    t4 = t6 + t9;
+    t5 = C2 * t0;
+    t3 = t7 - t5;
+    t5 = C2 * t4;
+    t5 = t1 - t5;
+    t8 = t8 - t2;
+    t2 = C3 * t8;
+    t8 = t6 - t9;
+    t6 = C3 * t8;
+    t9 = t7 + t0;
+    t8 = t1 + t4;
+    t7 = t3 + t6;
+    t0 = t5 - t2;
+    t1 = t3 - t6;
+    t4 = t5 + t2;
+    t3 = t7 + t0;
+    t6 = C5 * t3;
+    t5 = t7 * (-C12);
+    t2 = t0 * (-C13);
+    t3 = t6 - t2;
+    t7 = t6 + t5;
+    t0 = t1 + t4;
+    t2 = (-C9) * t0;
+    t6 = t1 * C14;
+    t5 = t4 * (-C15);
+    t0 = t2 - t5;
+    t1 = t2 + t6;
+    re[74] = t9;
+    im[74] = t8;
+    re[14] = t3;
+    im[14] = t7;
+    re[44] = t0;
+    im[44] = t1;
+    t4 = re[54];
+    t5 = im[54];
+    t2 = re[64];
+    t6 = im[64];
+    t9 = re[74];
+    t8 = im[74];
+    t3 = t2 + t9;
+    t7 = t6 + t8;
+    t0 = C2 * t3;
+    t1 = t4 - t0;
+    t0 = C2 * t7;
+    t0 = t5 - t0;
+    t2 = t2 - t9;
+    t9 = C3 * t2;
+    t2 = t6 - t8;
+    t6 = C3 * t2;
+    t8 = t4 + t3;
+    t2 = t5 + t7;
+    t4 = t1 + t6;
+    t3 = t0 - t9;
+    t5 = t1 - t6;
+    t7 = t0 + t9;
+    re[54] = t8;
+    im[54] = t2;
+    re[64] = t4;
+    im[64] = t3;
+    re[74] = t5;
+    im[74] = t7;
+    t1 = re[84];
+    t6 = im[84];
+    t0 = re[4];
+    t9 = im[4];
+    t8 = re[14];
+    t2 = im[14];
+    t4 = t0 + t8;
+    t3 = t9 + t2;
+    t5 = C2 * t4;
+    t7 = t1 - t5;
+    t5 = C2 * t3;
+    t5 = t6 - t5;
+    t0 = t0 - t8;
+    t8 = C3 * t0;
+    t0 = t9 - t2;
+    t9 = C3 * t0;
+    t2 = t1 + t4;
+    t0 = t6 + t3;
+    t1 = t7 + t9;
+    t4 = t5 - t8;
+    t6 = t7 - t9;
+    t3 = t5 + t8;
+    re[84] = t2;
+    im[84] = t0;
+    re[4] = t1;
+    im[4] = t4;
+    re[14] = t6;
+    im[14] = t3;
+    t7 = re[24];
+    t9 = im[24];
+    t5 = re[34];
+    t8 = im[34];
+    t2 = re[44];
+    t0 = im[44];
+    t1 = t5 + t2;
+    t4 = t8 + t0;
+    t6 = C2 * t1;
+    t3 = t7 - t6;
+    t6 = C2 * t4;
+    t6 = t9 - t6;
+    t5 = t5 - t2;
+    t2 = C3 * t5;
+    t5 = t8 - t0;
+    t8 = C3 * t5;
+    t0 = t7 + t1;
+    t5 = t9 + t4;
+    t7 = t3 + t8;
+    t1 = t6 - t2;
+    t9 = t3 - t8;
+    t4 = t6 + t2;
+    re[24] = t0;
+    im[24] = t5;
+    re[34] = t7;
+    im[34] = t1;
+    re[44] = t9;
+    im[44] = t4;
+    t3 = x[54];
+    t8 = 0.05253338677834252 * t3;
+    t6 = x[125];
+    t2 = 0.11052570836958936 * t6;
+    t0 = t8 - t2;
+    t5 = x[234];
+    t7 = 0.09793368984357992 * t5;
+    t1 = x[305];
+    t9 = 0.005461682284304391 * t1;
+    t4 = t7 + t9;
+    t3 = C17 * t0;
+    t6 = (-C16) * t4;
+    t8 = t3 + t6;
+    t2 = (-C16) * t0;
+    t5 = (-C17) * t4;
+    t1 = t2 + t5;
+    t7 = x[245];
+    t9 = 0.08886820659475896 * t7;
+    t3 = x[294];
+    t6 = 0.0162231586659377 * t3;
+    t0 = t9 + t6;
+    t4 = x[65];
+    t2 = 0.07072918180627431 * t4;
+    t5 = x[114];
+    t7 = 0.11211726616460811 * t5;
+    t3 = t2 - t7;
+    t9 = (-C21) * t0;
+    t6 = C20 * t3;
+    t4 = t9 + t6;
+    t5 = C20 * t0;
+    t2 = C21 * t3;
+    t7 = t5 + t2;
+    t9 = x[185];
+    t6 = x[5];
+    t0 = 0.0009579147564804909 * t6;
+    t3 = x[174];
+    t5 = 0.10495498046159855 * t3;
+    t2 = t0 - t5;
+    t6 = (-0.07867339588089178) * t9;
+    t3 = C18 * t2;
+    t0 = t6 + t3;
+    t5 = 0.07083784382979999 * t9;
+    t6 = C19 * t2;
+    t3 = t5 + t6;
+    t9 = t4 + t0;
+    t2 = t7 + t3;
+    t5 = C2 * t9;
+    t6 = t8 - t5;
+    t5 = C2 * t2;
+    t5 = t1 - t5;
+    t4 = t4 - t0;
+    t0 = C3 * t4;
+    t4 = t7 - t3;
+    t7 = C3 * t4;
+    t3 = t8 + t9;
+    t4 = t1 + t2;
+    t8 = t6 + t7;
+    t9 = t5 - t0;
+    t1 = t6 - t7;
+    t2 = t5 + t0;
+    re[72] = t3;
+    im[72] = t4;
+    re[12] = t8;
+    im[12] = t9;
+    re[42] = t1;
+    im[42] = t2;
+    t6 = x[74];
+    t7 = 0.08442471153193547 * t6;
+    t5 = x[105];
+    t0 = 0.11112823978612332 * t5;
+    t3 = t7 - t0;
+    t4 = x[254];
+    t8 = 0.07815126422793621 * t4;
+    t9 = x[285];
+    t1 = 0.028739200127234528 * t9;
+    t2 = t8 + t1;
+    t6 = C33 * t3;
+    t5 = (-C32) * t2;
+    t7 = t6 + t5;
+    t0 = (-C32) * t3;
+    t4 = (-C33) * t2;
+    t9 = t0 + t4;
+    t8 = x[225];
+    t1 = 0.10235901881658338 * t8;
+    t6 = x[314];
+    t5 = 0.0010382155367027563 * t6;
+    t3 = t1 + t5;
+    t2 = x[45];
+    t0 = 0.03794353629982911 * t2;
+    t4 = x[134];
+    t8 = 0.10816553021132944 * t4;
+    t6 = t0 - t8;
+    t1 = (-C31) * t3;
+    t5 = C30 * t6;
+    t2 = t1 + t5;
+    t4 = C30 * t3;
+    t0 = C31 * t6;
+    t8 = t4 + t0;
+    t1 = x[14];
+    t5 = 0.004236562517080274 * t1;
+    t3 = x[165];
+    t6 = 0.10441944680840871 * t3;
+    t4 = t5 - t6;
+    t0 = x[194];
+    t1 = C28 * t4;
+    t3 = (-0.08385100005499747) * t0;
+    t5 = t1 + t3;
+    t6 = (-C29) * t4;
+    t1 = (-0.0655115811111835) * t0;
+    t3 = t6 + t1;
+    t4 = t2 + t5;
+    t0 = t8 + t3;
+    t6 = C2 * t4;
+    t1 = t7 - t6;
+    t6 = C2 * t0;
+    t6 = t9 - t6;
+    t2 = t2 - t5;
+    t5 = C3 * t2;
+    t2 = t8 - t3;
+    t8 = C3 * t2;
+    t3 = t7 + t4;
+    t2 = t9 + t0;
+    t7 = t1 + t8;
+    t4 = t6 - t5;
+    t9 = t1 - t8;
+    t0 = t6 + t5;
+    t1 = t7 + t4;
+    t8 = C7 * t1;
+    t6 = t7 * (-C10);
+    t5 = t4 * C11;
+    t1 = t8 - t5;
+    t7 = t8 + t6;
+    t4 = t9 + t0;
+    t5 = C5 * t4;
+    t8 = t9 * (-C12);
+    t6 = t0 * (-C13);
+    t4 = t5 - t6;
+    t9 = t5 + t8;
+    re[82] = t3;
+    im[82] = t2;
+    re[22] = t1;
+    im[22] = t7;
+    re[52] = t4;
+    im[52] = t9;
+    t0 = x[265];
+    t6 = 0.06167272672669253 * t0;
+    t5 = x[274];
+    t8 = 0.04668426482973558 * t5;
+    t3 = t6 + t8;
+    t2 = x[85];
+    t1 = 0.09807356363250865 * t2;
+    t7 = x[94];
+    t4 = 0.10592395115988588 * t7;
+    t9 = t1 - t4;
+    t0 = (-C27) * t3;
+    t5 = C26 * t9;
+    t6 = t0 + t5;
+    t8 = C26 * t3;
+    t2 = C27 * t9;
+    t7 = t8 + t2;
+    t1 = x[205];
+    t4 = x[25];
+    t0 = 0.012291201401904974 * t4;
+    t5 = x[154];
+    t3 = 0.10453260185425502 * t5;
+    t9 = t0 - t3;
+    t8 = (-0.09014179745662511) * t1;
+    t2 = C24 * t9;
+    t4 = t8 + t2;
+    t5 = 0.056326846556663195 * t1;
+    t0 = C25 * t9;
+    t3 = t5 + t0;
+    t8 = x[34];
+    t2 = 0.022277503292171038 * t8;
+    t1 = x[145];
+    t9 = 0.10559082251111834 * t1;
+    t5 = t2 - t9;
+    t0 = x[214];
+    t8 = C22 * t5;
+    t1 = (-0.0929108096350951) * t0;
+    t2 = t8 + t1;
+    t9 = (-C23) * t5;
+    t8 = (-0.04940155378628426) * t0;
+    t1 = t9 + t8;
+    t5 = t4 + t2;
+    t0 = t3 + t1;
+    t9 = C2 * t5;
+    t8 = t6 - t9;
+    t9 = C2 * t0;
+    t9 = t7 - t9;
+    t4 = t4 - t2;
+    t2 = C3 * t4;
+    t4 = t3 - t1;
+    t3 = C3 * t4;
+    t1 = t6 + t5;
+    t4 = t7 + t0;
+    t6 = t8 + t3;
+    t5 = t9 - t2;
+    t7 = t8 - t3;
+    t0 = t9 + t2;
+    t8 = t6 + t5;
+    t3 = C5 * t8;
+    t9 = t6 * (-C12);
+    t2 = t5 * (-C13);
+    t8 = t3 - t2;
+    t6 = t3 + t9;
+    t5 = t7 + t0;
+    t2 = (-C9) * t5;
+    t3 = t7 * C14;
+    t9 = t0 * (-C15);
+    t5 = t2 - t9;
+    t7 = t2 + t3;
+    re[2] = t1;
+    im[2] = t4;
+    re[32] = t8;
+    im[32] = t6;
+    re[62] = t5;
+    im[62] = t7;
+    t0 = re[72];
+    t9 = im[72];
+    t2 = re[82];
+    t3 = im[82];
+    t1 = re[2];
+    t4 = im[2];
+    t8 = t2 + t1;
+    t6 = t3 + t4;
+    t5 = C2 * t8;
+    t7 = t0 - t5;
+    t5 = C2 * t6;
+    t5 = t9 - t5;
+    t2 = t2 - t1;
+    t1 = C3 * t2;
+    t2 = t3 - t4;
+    t3 = C3 * t2;
+    t4 = t0 + t8;
+    t2 = t9 + t6;
+    t0 = t7 + t3;
+    t8 = t5 - t1;
+    t9 = t7 - t3;
+    t6 = t5 + t1;
+    re[72] = t4;
+    im[72] = t2;
+    re[82] = t0;
+    im[82] = t8;
+    re[2] = t9;
+    im[2] = t6;
+    t7 = re[12];
+    t3 = im[12];
+    t5 = re[22];
+    t1 = im[22];
+    t4 = re[32];
+    t2 = im[32];
+    t0 = t5 + t4;
+    t8 = t1 + t2;
+    t9 = C2 * t0;
+    t6 = t7 - t9;
+    t9 = C2 * t8;
+    t9 = t3 - t9;
+    t5 = t5 - t4;
+    t4 = C3 * t5;
+    t5 = t1 - t2;
+    t1 = C3 * t5;
+    t2 = t7 + t0;
+    t5 = t3 + t8;
+    t7 = t6 + t1;
+    t0 = t9 - t4;
+    t3 = t6 - t1;
+    t8 = t9 + t4;
+    re[12] = t2;
+    im[12] = t5;
+    re[22] = t7;
+    im[22] = t0;
+    re[32] = t3;
+    im[32] = t8;
+    t6 = re[42];
+    t1 = im[42];
+    t9 = re[52];
+    t4 = im[52];
+    t2 = re[62];
+    t5 = im[62];
+    t7 = t9 + t2;
+    t0 = t4 + t5;
+    t3 = C2 * t7;
+    t8 = t6 - t3;
+    t3 = C2 * t0;
+    t3 = t1 - t3;
+    t9 = t9 - t2;
+    t2 = C3 * t9;
+    t9 = t4 - t5;
+    t4 = C3 * t9;
+    t5 = t6 + t7;
+    t9 = t1 + t0;
+    t6 = t8 + t4;
+    t7 = t3 - t2;
+    t1 = t8 - t4;
+    t0 = t3 + t2;
+    re[42] = t5;
+    im[42] = t9;
+    re[52] = t6;
+    im[52] = t7;
+    re[62] = t1;
+    im[62] = t0;
+    t8 = re[0];
+    t4 = im[0];
+    t3 = re[18];
+    t2 = im[18];
+    t5 = re[36];
+    t9 = im[36];
+    t6 = re[54];
+    t7 = im[54];
+    t1 = re[72];
+    t0 = im[72];
+    t10 = t3 + t1;
+    t11 = t2 + t0;
+    t12 = t5 + t6;
+    t13 = t9 + t7;
+    t3 = t3 - t1;
+    t1 = t2 - t0;
+    t2 = t5 - t6;
+    t0 = t9 - t7;
+    t5 = t10 + t12;
+    t6 = t11 + t13;
+    t9 = t10 - t12;
+    t7 = C52 * t9;
+    t10 = t11 - t13;
+    t12 = C52 * t10;
+    t9 = C53 * t5;
+    t11 = t8 - t9;
+    t13 = C53 * t6;
+    t10 = t4 - t13;
+    t9 = t11 + t7;
+    t13 = t10 + t12;
+    t11 = t11 - t7;
+    t7 = t10 - t12;
+    t10 = C16 * t3;
+    t12 = C34 * t2;
+    t10 = t10 + t12;
+    t12 = C16 * t1;
+    t14 = C34 * t0;
+    t12 = t12 + t14;
+    t14 = C34 * t3;
+    t3 = C16 * t2;
+    t2 = t14 - t3;
+    t14 = C34 * t1;
+    t3 = C16 * t0;
+    t1 = t14 - t3;
+    t0 = t8 + t5;
+    t14 = t4 + t6;
+    t3 = t9 + t12;
+    t8 = t13 - t10;
+    t5 = t11 + t1;
+    t4 = t7 - t2;
+    t6 = t11 - t1;
+    t11 = t7 + t2;
+    t1 = t9 - t12;
+    t7 = t13 + t10;
+    re[0] = t0;
+    im[0] = t14;
+    re[18] = t3;
+    im[18] = t8;
+    re[36] = t5;
+    im[36] = t4;
+    re[54] = t6;
+    im[54] = t11;
+    re[72] = t1;
+    im[72] = t7;
+    t2 = re[30];
+    t9 = im[30];
+    t12 = re[48];
+    t13 = im[48];
+    t10 = re[66];
+    t0 = im[66];
+    t14 = re[84];
+    t3 = im[84];
+    t8 = re[12];
+    t5 = im[12];
+    t4 = t12 + t8;
+    t6 = t13 + t5;
+    t11 = t10 + t14;
+    t1 = t0 + t3;
+    t7 = t12 - t8;
+    t12 = t13 - t5;
+    t8 = t10 - t14;
+    t13 = t0 - t3;
+    t5 = t4 + t11;
+    t10 = t6 + t1;
+    t14 = t4 - t11;
+    t0 = C52 * t14;
+    t3 = t6 - t1;
+    t4 = C52 * t3;
+    t11 = C53 * t5;
+    t14 = t2 - t11;
+    t6 = C53 * t10;
+    t1 = t9 - t6;
+    t3 = t14 + t0;
+    t11 = t1 + t4;
+    t6 = t14 - t0;
+    t14 = t1 - t4;
+    t0 = C16 * t7;
+    t1 = C34 * t8;
+    t4 = t0 + t1;
+    t0 = C16 * t12;
+    t1 = C34 * t13;
+    t0 = t0 + t1;
+    t1 = C34 * t7;
+    t7 = C16 * t8;
+    t8 = t1 - t7;
+    t1 = C34 * t12;
+    t7 = C16 * t13;
+    t12 = t1 - t7;
+    t13 = t2 + t5;
+    t1 = t9 + t10;
+    t7 = t3 + t0;
+    t2 = t11 - t4;
+    t5 = t6 + t12;
+    t9 = t14 - t8;
+    t10 = t6 - t12;
+    t6 = t14 + t8;
+    t12 = t3 - t0;
+    t14 = t11 + t4;
+    re[30] = t13;
+    im[30] = t1;
+    re[48] = t7;
+    im[48] = t2;
+    re[66] = t5;
+    im[66] = t9;
+    re[84] = t10;
+    im[84] = t6;
+    re[12] = t12;
+    im[12] = t14;
+    t8 = re[60];
+    t3 = im[60];
+    t0 = re[78];
+    t11 = im[78];
+    t4 = re[6];
+    t13 = im[6];
+    t1 = re[24];
+    t7 = im[24];
+    t2 = re[42];
+    t5 = im[42];
+    t9 = t0 + t2;
+    t10 = t11 + t5;
+    t6 = t4 + t1;
+    t12 = t13 + t7;
+    t14 = t0 - t2;
+    t0 = t11 - t5;
+    t2 = t4 - t1;
+    t11 = t13 - t7;
+    t5 = t9 + t6;
+    t4 = t10 + t12;
+    t1 = t9 - t6;
+    t13 = C52 * t1;
+    t7 = t10 - t12;
+    t9 = C52 * t7;
+    t6 = C53 * t5;
+    t1 = t8 - t6;
+    t10 = C53 * t4;
+    t12 = t3 - t10;
+    t7 = t1 + t13;
+    t6 = t12 + t9;
+    t10 = t1 - t13;
+    t1 = t12 - t9;
+    t13 = C16 * t14;
+    t12 = C34 * t2;
+    t9 = t13 + t12;
+    t13 = C16 * t0;
+    t12 = C34 * t11;
+    t13 = t13 + t12;
+    t12 = C34 * t14;
+    t14 = C16 * t2;
+    t2 = t12 - t14;
+    t12 = C34 * t0;
+    t14 = C16 * t11;
+    t0 = t12 - t14;
+    t11 = t8 + t5;
+    t12 = t3 + t4;
+    t14 = t7 + t13;
+    t8 = t6 - t9;
+    t5 = t10 + t0;
+    t3 = t1 - t2;
+    t4 = t10 - t0;
+    t10 = t1 + t2;
+    t0 = t7 - t13;
+    t1 = t6 + t9;
+    re[60] = t11;
+    im[60] = t12;
+    re[78] = t14;
+    im[78] = t8;
+    re[6] = t5;
+    im[6] = t3;
+    re[24] = t4;
+    im[24] = t10;
+    re[42] = t0;
+    im[42] = t1;
+    t2 = re[10];
+    t7 = im[10];
+    t13 = re[28];
+    t6 = im[28];
+    t9 = re[46];
+    t11 = im[46];
+    t12 = re[64];
+    t14 = im[64];
+    t8 = re[82];
+    t5 = im[82];
+    t3 = t13 + t8;
+    t4 = t6 + t5;
+    t10 = t9 + t12;
+    t0 = t11 + t14;
+    t1 = t13 - t8;
+    t13 = t6 - t5;
+    t8 = t9 - t12;
+    t6 = t11 - t14;
+    t5 = t3 + t10;
+    t9 = t4 + t0;
+    t12 = t3 - t10;
+    t11 = C52 * t12;
+    t14 = t4 - t0;
+    t3 = C52 * t14;
+    t10 = C53 * t5;
+    t12 = t2 - t10;
+    t4 = C53 * t9;
+    t0 = t7 - t4;
+    t14 = t12 + t11;
+    t10 = t0 + t3;
+    t4 = t12 - t11;
+    t12 = t0 - t3;
+    t11 = C16 * t1;
+    t0 = C34 * t8;
+    t3 = t11 + t0;
+    t11 = C16 * t13;
+    t0 = C34 * t6;
+    t11 = t11 + t0;
+    t0 = C34 * t1;
+    t1 = C16 * t8;
+    t8 = t0 - t1;
+    t0 = C34 * t13;
+    t1 = C16 * t6;
+    t13 = t0 - t1;
+    t6 = t2 + t5;
+    t0 = t7 + t9;
+    t1 = t14 + t11;
+    t2 = t10 - t3;
+    t5 = t4 + t13;
+    t7 = t12 - t8;
+    t9 = t4 - t13;
+    t4 = t12 + t8;
+    t13 = t14 - t11;
+    t12 = t10 + t3;
+    re[10] = t6;
+    im[10] = t0;
+    re[28] = t1;
+    im[28] = t2;
+    re[46] = t5;
+    im[46] = t7;
+    re[64] = t9;
+    im[64] = t4;
+    re[82] = t13;
+    im[82] = t12;
+    t8 = re[40];
+    t14 = im[40];
+    t11 = re[58];
+    t10 = im[58];
+    t3 = re[76];
+    t6 = im[76];
+    t0 = re[4];
+    t1 = im[4];
+    t2 = re[22];
+    t5 = im[22];
+    t7 = t11 + t2;
+    t9 = t10 + t5;
+    t4 = t3 + t0;
+    t13 = t6 + t1;
+    t12 = t11 - t2;
+    t11 = t10 - t5;
+    t2 = t3 - t0;
+    t10 = t6 - t1;
+    t5 = t7 + t4;
+    t3 = t9 + t13;
+    t0 = t7 - t4;
+    t6 = C52 * t0;
+    t1 = t9 - t13;
+    t7 = C52 * t1;
+    t4 = C53 * t5;
+    t0 = t8 - t4;
+    t9 = C53 * t3;
+    t13 = t14 - t9;
+    t1 = t0 + t6;
+    t4 = t13 + t7;
+    t9 = t0 - t6;
+    t0 = t13 - t7;
+    t6 = C16 * t12;
+    t13 = C34 * t2;
+    t7 = t6 + t13;
+    t6 = C16 * t11;
+    t13 = C34 * t10;
+    t6 = t6 + t13;
+    t13 = C34 * t12;
+    t12 = C16 * t2;
+    t2 = t13 - t12;
+    t13 = C34 * t11;
+    t12 = C16 * t10;
+    t11 = t13 - t12;
+    t10 = t8 + t5;
+    t13 = t14 + t3;
+    t12 = t1 + t6;
+    t8 = t4 - t7;
+    t5 = t9 + t11;
+    t14 = t0 - t2;
+    t3 = t9 - t11;
+    t9 = t0 + t2;
+    t11 = t1 - t6;
+    t0 = t4 + t7;
+    re[40] = t10;
+    im[40] = t13;
+    re[58] = t12;
+    im[58] = t8;
+    re[76] = t5;
+    im[76] = t14;
+    re[4] = t3;
+    im[4] = t9;
+    re[22] = t11;
+    im[22] = t0;
+    t2 = re[70];
+    t1 = im[70];
+    t6 = re[88];
+    t4 = im[88];
+    t7 = re[16];
+    t10 = im[16];
+    t13 = re[34];
+    t12 = im[34];
+    t8 = re[52];
+    t5 = im[52];
+    t14 = t6 + t8;
+    t3 = t4 + t5;
+    t9 = t7 + t13;
+    t11 = t10 + t12;
+    t0 = t6 - t8;
+    t6 = t4 - t5;
+    t8 = t7 - t13;
+    t4 = t10 - t12;
+    t5 = t14 + t9;
+    t7 = t3 + t11;
+    t13 = t14 - t9;
+    t10 = C52 * t13;
+    t12 = t3 - t11;
+    t14 = C52 * t12;
+    t9 = C53 * t5;
+    t13 = t2 - t9;
+    t3 = C53 * t7;
+    t11 = t1 - t3;
+    t12 = t13 + t10;
+    t9 = t11 + t14;
+    t3 = t13 - t10;
+    t13 = t11 - t14;
+    t10 = C16 * t0;
+    t11 = C34 * t8;
+    t14 = t10 + t11;
+    t10 = C16 * t6;
+    t11 = C34 * t4;
+    t10 = t10 + t11;
+    t11 = C34 * t0;
+    t0 = C16 * t8;
+    t8 = t11 - t0;
+    t11 = C34 * t6;
+    t0 = C16 * t4;
+    t6 = t11 - t0;
+    t4 = t2 + t5;
+    t11 = t1 + t7;
+    t0 = t12 + t10;
+    t2 = t9 - t14;
+    t5 = t3 + t6;
+    t1 = t13 - t8;
+    t7 = t3 - t6;
+    t3 = t13 + t8;
+    t6 = t12 - t10;
+    t13 = t9 + t14;
+    re[70] = t4;
+    im[70] = t11;
+    re[88] = t0;
+    im[88] = t2;
+    re[16] = t5;
+    im[16] = t1;
+    re[34] = t7;
+    im[34] = t3;
+    re[52] = t6;
+    im[52] = t13;
+    t8 = re[20];
+    t12 = im[20];
+    t10 = re[38];
+    t9 = im[38];
+    t14 = re[56];
+    t4 = im[56];
+    t11 = re[74];
+    t0 = im[74];
+    t2 = re[2];
+    t5 = im[2];
+    t1 = t10 + t2;
+    t7 = t9 + t5;
+    t3 = t14 + t11;
+    t6 = t4 + t0;
+    t13 = t10 - t2;
+    t10 = t9 - t5;
+    t2 = t14 - t11;
+    t9 = t4 - t0;
+    t5 = t1 + t3;
+    t14 = t7 + t6;
+    t11 = t1 - t3;
+    t4 = C52 * t11;
+    t0 = t7 - t6;
+    t1 = C52 * t0;
+    t3 = C53 * t5;
+    t11 = t8 - t3;
+    t7 = C53 * t14;
+    t6 = t12 - t7;
+    t0 = t11 + t4;
+    t3 = t6 + t1;
+    t7 = t11 - t4;
+    t11 = t6 - t1;
+    t4 = C16 * t13;
+    t6 = C34 * t2;
+    t1 = t4 + t6;
+    t4 = C16 * t10;
+    t6 = C34 * t9;
+    t4 = t4 + t6;
+    t6 = C34 * t13;
+    t13 = C16 * t2;
+    t2 = t6 - t13;
+    t6 = C34 * t10;
+    t13 = C16 * t9;
+    t10 = t6 - t13;
+    t9 = t8 + t5;
+    t6 = t12 + t14;
+    t13 = t0 + t4;
+    t8 = t3 - t1;
+    t5 = t7 + t10;
+    t12 = t11 - t2;
+    t14 = t7 - t10;
+    t7 = t11 + t2;
+    t10 = t0 - t4;
+    t11 = t3 + t1;
+    re[20] = t9;
+    im[20] = t6;
+    re[38] = t13;
+    im[38] = t8;
+    re[56] = t5;
+    im[56] = t12;
+    re[74] = t14;
+    im[74] = t7;
+    re[2] = t10;
+    im[2] = t11;
+}
+
+/**
+ *  Part 2 of ApplyWindowedMDCT_W75_180().
+ * 
+ *  @param {Number[]} x 
+ *    - The input block (360 points).
+ *  @param {Number[]} X 
+ *    - The array that would contain the output block (180 points).
+ *  @param {Number[]} re 
+ *    - The scratch buffer (real part, 90 points).
+ *  @param {Number[]} im 
+ *    - The scratch buffer (imaginary part, 90 points).
+ */
+function ApplyWindowedMDCT_W75_180_Part2(x, X, re, im) {
+    let t0, t1, t10, t11, t12, t13, t14, t2, t3, t4, t5, t6, t7, t8, t9;
+    const C0 = 0.5590169943749475;
+    const C1 = 0.25;
+    const C2 = 0.9510565162951535;
+    const C3 = 0.5877852522924731;
+    const C4 = 0.25881904510252074;
+    const C5 = 0.9659258262890683;
+    const C6 = 0.5;
+    const C7 = 0.8660254037844386;
+    const C8 = 0.573576436351046;
+    const C9 = 0.8191520442889918;
+    const C10 = 0.08715574274765817;
+    const C11 = 0.9961946980917455;
+    const C12 = 0.42261826174069944;
+    const C13 = 0.9063077870366499;
+    const C14 = 0.766044443118978;
+    const C15 = 1.4088320528055172;
+    const C16 = 0.12325683343243876;
+    const C17 = 0.17364817766693033;
+    const C18 = 1.1584559306791384;
+    const C19 = 0.8111595753452777;
+    const C20 = 0.9396926207859084;
+    const C21 = 0.5976724774602398;
+    const C22 = 1.281712764111577;
+    const C23 = 0.45399049973954675;
+    const C24 = 0.8910065241883679;
+    const C25 = 0.9986295347545738;
+    const C26 = 0.05233595624294383;
+    const C27 = 0.544639035015027;
+    const C28 = 0.838670567945424;
+    const C29 = 0.2923717047227367;
+    const C30 = 0.9563047559630355;
+    const C31 = 0.9743700647852352;
+    const C32 = 0.22495105434386498;
+    const C33 = 0.6819983600624985;
+    const C34 = 0.7313537016191705;
+    const C35 = 0.12186934340514748;
+    const C36 = 0.992546151641322;
+    const C37 = 0.9205048534524404;
+    const C38 = 0.3907311284892737;
+    const C39 = 0.6018150231520483;
+    const C40 = 0.7986355100472928;
+    const C41 = 0.15643446504023087;
+    const C42 = 0.9876883405951378;
+    const C43 = 0.9335804264972017;
+    const C44 = 0.35836794954530027;
+    const C45 = 0.6293203910498375;
+    const C46 = 0.7771459614569709;
+    const C47 = 0.9998476951563913;
+    const C48 = 0.01745240643728351;
+    const C49 = 0.5150380749100542;
+    const C50 = 0.8571673007021123;
+    const C51 = 0.48480962024633706;
+    const C52 = 0.8746197071393957;
+    const C53 = 0.981627183447664;
+    const C54 = 0.1908089953765448;
+    const C55 = 0.6560590289905073;
+    const C56 = 0.754709580222772;
+    const C57 = 0.3255681544571567;
+    const C58 = 0.9455185755993168;
+    t2 = re[50];
+    t0 = im[50];
+    t4 = re[68];
+    t3 = im[68];
+    t1 = re[86];
+    t9 = im[86];
+    t6 = re[14];
+    t13 = im[14];
+    t8 = re[32];
+    t5 = im[32];
+    t12 = t4 + t8;
+    t14 = t3 + t5;
+    t7 = t1 + t6;
+    t10 = t9 + t13;
+    t11 = t4 - t8;
+    t4 = t3 - t5;
+    t8 = t1 - t6;
+    t3 = t9 - t13;
+    t5 = t12 + t7;
+    t1 = t14 + t10;
+    t6 = t12 - t7;
+    t9 = C0 * t6;
+    t13 = t14 - t10;
+    t12 = C0 * t13;
+    t7 = C1 * t5;
+    t6 = t2 - t7;
+    t14 = C1 * t1;
+    t10 = t0 - t14;
+    t13 = t6 + t9;
+    t7 = t10 + t12;
+    t14 = t6 - t9;
+    t6 = t10 - t12;
+    t9 = C2 * t11;
+    t10 = C3 * t8;
+    t12 = t9 + t10;
+    t9 = C2 * t4;
+    t10 = C3 * t3;
+    t9 = t9 + t10;
+    t10 = C3 * t11;
+    t11 = C2 * t8;
+    t8 = t10 - t11;
+    t10 = C3 * t4;
+    t11 = C2 * t3;
+    t4 = t10 - t11;
+    t3 = t2 + t5;
+    t10 = t0 + t1;
+    t11 = t13 + t9;
+    t2 = t7 - t12;
+    t5 = t14 + t4;
+    t0 = t6 - t8;
+    t1 = t14 - t4;
+    t14 = t6 + t8;
+    t4 = t13 - t9;
+    t6 = t7 + t12;
+    re[50] = t3;
+    im[50] = t10;
+    re[68] = t11;
+    im[68] = t2;
+    re[86] = t5;
+    im[86] = t0;
+    re[14] = t1;
+    im[14] = t14;
+    re[32] = t4;
+    im[32] = t6;
+    t8 = re[80];
+    t13 = im[80];
+    t9 = re[8];
+    t7 = im[8];
+    t12 = re[26];
+    t3 = im[26];
+    t10 = re[44];
+    t11 = im[44];
+    t2 = re[62];
+    t5 = im[62];
+    t0 = t9 + t2;
+    t1 = t7 + t5;
+    t14 = t12 + t10;
+    t4 = t3 + t11;
+    t6 = t9 - t2;
+    t9 = t7 - t5;
+    t2 = t12 - t10;
+    t7 = t3 - t11;
+    t5 = t0 + t14;
+    t12 = t1 + t4;
+    t10 = t0 - t14;
+    t3 = C0 * t10;
+    t11 = t1 - t4;
+    t0 = C0 * t11;
+    t14 = C1 * t5;
+    t10 = t8 - t14;
+    t1 = C1 * t12;
+    t4 = t13 - t1;
+    t11 = t10 + t3;
+    t14 = t4 + t0;
+    t1 = t10 - t3;
+    t10 = t4 - t0;
+    t3 = C2 * t6;
+    t4 = C3 * t2;
+    t0 = t3 + t4;
+    t3 = C2 * t9;
+    t4 = C3 * t7;
+    t3 = t3 + t4;
+    t4 = C3 * t6;
+    t6 = C2 * t2;
+    t2 = t4 - t6;
+    t4 = C3 * t9;
+    t6 = C2 * t7;
+    t9 = t4 - t6;
+    t7 = t8 + t5;
+    t4 = t13 + t12;
+    t6 = t11 + t3;
+    t8 = t14 - t0;
+    t5 = t1 + t9;
+    t13 = t10 - t2;
+    t12 = t1 - t9;
+    t1 = t10 + t2;
+    t9 = t11 - t3;
+    t10 = t14 + t0;
+    re[80] = t7;
+    im[80] = t4;
+    re[8] = t6;
+    im[8] = t8;
+    re[26] = t5;
+    im[26] = t13;
+    re[44] = t12;
+    im[44] = t1;
+    re[62] = t9;
+    im[62] = t10;
+    t2 = x[0];
+    t11 = 0.00020774573354068366 * t2;
+    t3 = x[179];
+    t14 = 0.10536667653263153 * t3;
+    t0 = t11 - t14;
+    t7 = x[180];
+    t4 = 0.7071067811865476 * t0;
+    t6 = (-0.07456571917925746) * t7;
+    t8 = t4 + t6;
+    t5 = (-0.7071067811865475) * t0;
+    t13 = (-0.07456571917925747) * t7;
+    t12 = t5 + t13;
+    t1 = x[60];
+    t9 = 0.06253980623939123 * t1;
+    t10 = x[119];
+    t2 = 0.1116795160109561 * t10;
+    t3 = t9 - t2;
+    t11 = x[240];
+    t14 = 0.09353555143552254 * t11;
+    t4 = x[299];
+    t6 = 0.010634922571204589 * t4;
+    t0 = t14 + t6;
+    t7 = C4 * t3;
+    t5 = (-C5) * t0;
+    t13 = t7 + t5;
+    t1 = (-C5) * t3;
+    t10 = (-C4) * t0;
+    t9 = t1 + t10;
+    t2 = x[239];
+    t11 = 0.094357630791773 * t2;
+    t4 = x[300];
+    t14 = 0.009652524216948906 * t4;
+    t6 = t11 + t14;
+    t7 = x[59];
+    t5 = 0.06087681238074977 * t7;
+    t3 = x[120];
+    t0 = 0.11152777064293147 * t3;
+    t1 = t5 - t0;
+    t10 = (-C5) * t6;
+    t2 = C4 * t1;
+    t4 = t10 + t2;
+    t11 = C4 * t6;
+    t14 = C5 * t1;
+    t7 = t11 + t14;
+    t3 = t13 + t4;
+    t5 = t9 + t7;
+    t0 = C6 * t3;
+    t10 = t8 - t0;
+    t2 = C6 * t5;
+    t6 = t12 - t2;
+    t1 = t13 - t4;
+    t11 = C7 * t1;
+    t14 = t9 - t7;
+    t0 = C7 * t14;
+    t2 = t8 + t3;
+    t13 = t12 + t5;
+    t4 = t10 + t0;
+    t1 = t6 - t11;
+    t9 = t10 - t0;
+    t7 = t6 + t11;
+    re[45] = t2;
+    im[45] = t13;
+    re[75] = t4;
+    im[75] = t1;
+    re[15] = t9;
+    im[15] = t7;
+    t14 = x[20];
+    t8 = 0.008054387752489418 * t14;
+    t3 = x[159];
+    t12 = 0.10434475698122611 * t3;
+    t5 = t8 - t12;
+    t10 = x[200];
+    t0 = C8 * t5;
+    t6 = (-0.08722708878057372) * t10;
+    t11 = t0 + t6;
+    t2 = (-C9) * t5;
+    t13 = (-0.06107706510024532) * t10;
+    t4 = t2 + t13;
+    t1 = x[80];
+    t9 = 0.09237266858564189 * t1;
+    t7 = x[99];
+    t14 = 0.10888112665010784 * t7;
+    t3 = t9 - t14;
+    t8 = x[260];
+    t12 = 0.0695334865235696 * t8;
+    t0 = x[279];
+    t6 = 0.03832547887509067 * t0;
+    t5 = t12 + t6;
+    t10 = C10 * t3;
+    t2 = (-C11) * t5;
+    t13 = t10 + t2;
+    t1 = (-C11) * t3;
+    t7 = (-C10) * t5;
+    t9 = t1 + t7;
+    t14 = x[219];
+    t8 = x[39];
+    t0 = 0.0290011599676947 * t8;
+    t12 = x[140];
+    t6 = 0.10663511500011805 * t12;
+    t10 = t0 - t6;
+    t2 = (-0.09443499472587707) * t14;
+    t3 = C12 * t10;
+    t5 = t2 + t3;
+    t1 = 0.04403576123850338 * t14;
+    t7 = C13 * t10;
+    t8 = t1 + t7;
+    t12 = t13 + t5;
+    t0 = t9 + t8;
+    t6 = C6 * t12;
+    t2 = t11 - t6;
+    t3 = C6 * t0;
+    t14 = t4 - t3;
+    t10 = t13 - t5;
+    t1 = C7 * t10;
+    t7 = t9 - t8;
+    t6 = C7 * t7;
+    t3 = t11 + t12;
+    t13 = t4 + t0;
+    t5 = t2 + t6;
+    t10 = t14 - t1;
+    t9 = t2 - t6;
+    t8 = t14 + t1;
+    t7 = t5 + t10;
+    t11 = C14 * t7;
+    t12 = t5 * (-C15);
+    t4 = t10 * C16;
+    t0 = t11 - t4;
+    t2 = t11 + t12;
+    t6 = t9 + t8;
+    t14 = C17 * t6;
+    t1 = t9 * (-C18);
+    t7 = t8 * (-C19);
+    t5 = t14 - t7;
+    t10 = t14 + t1;
+    re[55] = t3;
+    im[55] = t13;
+    re[85] = t0;
+    im[85] = t2;
+    re[25] = t5;
+    im[25] = t10;
+    t4 = x[40];
+    t11 = 0.030431768150683058 * t4;
+    t12 = x[139];
+    t6 = 0.10688567874504554 * t12;
+    t9 = t11 - t6;
+    t8 = x[220];
+    t7 = C12 * t9;
+    t14 = (-0.09421361814663337) * t8;
+    t1 = t7 + t14;
+    t3 = (-C13) * t9;
+    t13 = (-0.04393253164426589) * t8;
+    t0 = t3 + t13;
+    t2 = x[259];
+    t5 = 0.07103918795933337 * t2;
+    t10 = x[280];
+    t4 = 0.036682878671273865 * t10;
+    t12 = t5 + t4;
+    t11 = x[79];
+    t6 = 0.09112774271407018 * t11;
+    t7 = x[100];
+    t14 = 0.1093520830501441 * t7;
+    t9 = t6 - t14;
+    t8 = (-C11) * t12;
+    t3 = C10 * t9;
+    t13 = t8 + t3;
+    t2 = C10 * t12;
+    t10 = C11 * t9;
+    t5 = t2 + t10;
+    t4 = x[199];
+    t11 = x[19];
+    t7 = 0.007322741888918101 * t11;
+    t6 = x[160];
+    t14 = 0.10433646450524006 * t6;
+    t8 = t7 - t14;
+    t3 = (-0.08723402143391279) * t4;
+    t12 = C8 * t8;
+    t9 = t3 + t12;
+    t2 = 0.06108191939637313 * t4;
+    t10 = C9 * t8;
+    t11 = t2 + t10;
+    t6 = t13 + t9;
+    t7 = t5 + t11;
+    t14 = C6 * t6;
+    t3 = t1 - t14;
+    t12 = C6 * t7;
+    t4 = t0 - t12;
+    t8 = t13 - t9;
+    t2 = C7 * t8;
+    t10 = t5 - t11;
+    t14 = C7 * t10;
+    t12 = t1 + t6;
+    t13 = t0 + t7;
+    t9 = t3 + t14;
+    t8 = t4 - t2;
+    t5 = t3 - t14;
+    t11 = t4 + t2;
+    t10 = t9 + t8;
+    t1 = C17 * t10;
+    t6 = t9 * (-C18);
+    t0 = t8 * (-C19);
+    t7 = t1 - t0;
+    t3 = t1 + t6;
+    t14 = t5 + t11;
+    t4 = (-C20) * t14;
+    t2 = t5 * C21;
+    t10 = t11 * (-C22);
+    t9 = t4 - t10;
+    t8 = t4 + t2;
+    re[65] = t12;
+    im[65] = t13;
+    re[5] = t7;
+    im[5] = t3;
+    re[35] = t9;
+    im[35] = t8;
+    t0 = re[45];
+    t1 = im[45];
+    t6 = re[55];
+    t14 = im[55];
+    t5 = re[65];
+    t11 = im[65];
+    t10 = t6 + t5;
+    t4 = t14 + t11;
+    t2 = C6 * t10;
+    t12 = t0 - t2;
+    t13 = C6 * t4;
+    t7 = t1 - t13;
+    t3 = t6 - t5;
+    t9 = C7 * t3;
+    t8 = t14 - t11;
+    t2 = C7 * t8;
+    t13 = t0 + t10;
+    t6 = t1 + t4;
+    t5 = t12 + t2;
+    t3 = t7 - t9;
+    t14 = t12 - t2;
+    t11 = t7 + t9;
+    re[45] = t13;
+    im[45] = t6;
+    re[55] = t5;
+    im[55] = t3;
+    re[65] = t14;
+    im[65] = t11;
+    t8 = re[75];
+    t0 = im[75];
+    t10 = re[85];
+    t1 = im[85];
+    t4 = re[5];
+    t12 = im[5];
+    t2 = t10 + t4;
+    t7 = t1 + t12;
+    t9 = C6 * t2;
+    t13 = t8 - t9;
+    t6 = C6 * t7;
+    t5 = t0 - t6;
+    t3 = t10 - t4;
+    t14 = C7 * t3;
+    t11 = t1 - t12;
+    t9 = C7 * t11;
+    t6 = t8 + t2;
+    t10 = t0 + t7;
+    t4 = t13 + t9;
+    t3 = t5 - t14;
+    t1 = t13 - t9;
+    t12 = t5 + t14;
+    re[75] = t6;
+    im[75] = t10;
+    re[85] = t4;
+    im[85] = t3;
+    re[5] = t1;
+    im[5] = t12;
+    t11 = re[15];
+    t8 = im[15];
+    t2 = re[25];
+    t0 = im[25];
+    t7 = re[35];
+    t13 = im[35];
+    t9 = t2 + t7;
+    t5 = t0 + t13;
+    t14 = C6 * t9;
+    t6 = t11 - t14;
+    t10 = C6 * t5;
+    t4 = t8 - t10;
+    t3 = t2 - t7;
+    t1 = C7 * t3;
+    t12 = t0 - t13;
+    t14 = C7 * t12;
+    t10 = t11 + t9;
+    t2 = t8 + t5;
+    t7 = t6 + t14;
+    t3 = t4 - t1;
+    t0 = t6 - t14;
+    t13 = t4 + t1;
+    re[15] = t10;
+    im[15] = t2;
+    re[25] = t7;
+    im[25] = t3;
+    re[35] = t0;
+    im[35] = t13;
+    t12 = x[36];
+    t11 = 0.024876910991979265 * t12;
+    t9 = x[143];
+    t8 = 0.10596752010371228 * t9;
+    t5 = t11 - t8;
+    t6 = x[216];
+    t14 = C23 * t5;
+    t4 = (-0.09342553719566607) * t6;
+    t1 = t14 + t4;
+    t10 = (-C24) * t5;
+    t2 = (-0.047602688833880226) * t6;
+    t7 = t10 + t2;
+    t3 = x[263];
+    t0 = 0.06487767026065987 * t3;
+    t13 = x[276];
+    t12 = 0.043320144271118445 * t13;
+    t9 = t0 + t12;
+    t11 = x[83];
+    t8 = 0.09590169035311356 * t11;
+    t14 = x[96];
+    t4 = 0.10722697071612382 * t14;
+    t5 = t8 - t4;
+    t6 = (-C25) * t9;
+    t10 = C26 * t5;
+    t2 = t6 + t10;
+    t3 = C26 * t9;
+    t13 = C25 * t5;
+    t0 = t3 + t13;
+    t12 = x[203];
+    t11 = x[23];
+    t14 = 0.010480779093744487 * t11;
+    t8 = x[156];
+    t4 = 0.10442666453598959 * t8;
+    t6 = t14 - t4;
+    t10 = (-0.08923546402124832) * t12;
+    t9 = C27 * t6;
+    t5 = t10 + t9;
+    t3 = 0.057950187917901914 * t12;
+    t13 = C28 * t6;
+    t11 = t3 + t13;
+    t8 = t2 + t5;
+    t14 = t0 + t11;
+    t4 = C6 * t8;
+    t10 = t1 - t4;
+    t9 = C6 * t14;
+    t12 = t7 - t9;
+    t6 = t2 - t5;
+    t3 = C7 * t6;
+    t13 = t0 - t11;
+    t4 = C7 * t13;
+    t9 = t1 + t8;
+    t2 = t7 + t14;
+    t5 = t10 + t4;
+    t6 = t12 - t3;
+    t0 = t10 - t4;
+    t11 = t12 + t3;
+    re[63] = t9;
+    im[63] = t2;
+    re[3] = t5;
+    im[3] = t6;
+    re[33] = t0;
+    im[33] = t11;
+    t13 = x[56];
+    t1 = 0.055869169342692634 * t13;
+    t8 = x[123];
+    t7 = 0.11096858947791874 * t8;
+    t14 = t1 - t7;
+    t10 = x[236];
+    t4 = 0.09660859225373081 * t10;
+    t12 = x[303];
+    t3 = 0.006991188554664076 * t12;
+    t9 = t4 + t3;
+    t2 = C29 * t14;
+    t5 = (-C30) * t9;
+    t6 = t2 + t5;
+    t0 = (-C30) * t14;
+    t11 = (-C29) * t9;
+    t13 = t0 + t11;
+    t8 = x[243];
+    t1 = 0.09084669522789945 * t8;
+    t7 = x[296];
+    t10 = 0.01385646615380372 * t7;
+    t12 = t1 + t10;
+    t4 = x[63];
+    t3 = 0.06748590978994368 * t4;
+    t2 = x[116];
+    t5 = 0.11201282402976184 * t2;
+    t14 = t3 - t5;
+    t9 = (-C31) * t12;
+    t0 = C32 * t14;
+    t11 = t9 + t0;
+    t8 = C32 * t12;
+    t7 = C31 * t14;
+    t1 = t8 + t7;
+    t10 = x[183];
+    t4 = x[3];
+    t2 = 0.000582585005005862 * t4;
+    t3 = x[176];
+    t5 = 0.10511501301267116 * t3;
+    t9 = t2 - t5;
+    t0 = (-0.07730724667496768) * t10;
+    t12 = C33 * t9;
+    t14 = t0 + t12;
+    t8 = 0.07209017379217295 * t10;
+    t7 = C34 * t9;
+    t4 = t8 + t7;
+    t3 = t11 + t14;
+    t2 = t1 + t4;
+    t5 = C6 * t3;
+    t0 = t6 - t5;
+    t12 = C6 * t2;
+    t10 = t13 - t12;
+    t9 = t11 - t14;
+    t8 = C7 * t9;
+    t7 = t1 - t4;
+    t5 = C7 * t7;
+    t12 = t6 + t3;
+    t11 = t13 + t2;
+    t14 = t0 + t5;
+    t9 = t10 - t8;
+    t1 = t0 - t5;
+    t4 = t10 + t8;
+    t7 = t14 + t9;
+    t6 = C14 * t7;
+    t3 = t14 * (-C15);
+    t13 = t9 * C16;
+    t2 = t6 - t13;
+    t0 = t6 + t3;
+    t5 = t1 + t4;
+    t10 = C17 * t5;
+    t8 = t1 * (-C18);
+    t7 = t4 * (-C19);
+    t14 = t10 - t7;
+    t9 = t10 + t8;
+    re[73] = t12;
+    im[73] = t11;
+    re[13] = t2;
+    im[13] = t0;
+    re[43] = t14;
+    im[43] = t9;
+    t13 = x[76];
+    t6 = 0.08719704828120174 * t13;
+    t3 = x[103];
+    t5 = 0.11053192528606762 * t3;
+    t1 = t6 - t5;
+    t4 = x[256];
+    t7 = 0.07539457511296481 * t4;
+    t10 = x[283];
+    t8 = 0.0318543301923774 * t10;
+    t12 = t7 + t8;
+    t11 = C35 * t1;
+    t2 = (-C36) * t12;
+    t0 = t11 + t2;
+    t14 = (-C36) * t1;
+    t9 = (-C35) * t12;
+    t13 = t14 + t9;
+    t3 = x[223];
+    t6 = 0.10305168926250033 * t3;
+    t5 = x[316];
+    t4 = 0.0005646408681615436 * t5;
+    t10 = t6 + t4;
+    t7 = x[43];
+    t8 = 0.03487189790626826 * t7;
+    t11 = x[136];
+    t2 = 0.10762968653672474 * t11;
+    t1 = t8 - t2;
+    t12 = (-C37) * t10;
+    t14 = C38 * t1;
+    t9 = t12 + t14;
+    t3 = C38 * t10;
+    t5 = C37 * t1;
+    t6 = t3 + t5;
+    t4 = x[16];
+    t7 = 0.005357839698617217 * t4;
+    t11 = x[163];
+    t8 = 0.10436304043972418 * t11;
+    t2 = t7 - t8;
+    t12 = x[196];
+    t14 = C39 * t2;
+    t10 = (-0.08502749490648913) * t12;
+    t1 = t14 + t10;
+    t3 = (-C40) * t2;
+    t5 = (-0.06407281315687959) * t12;
+    t4 = t3 + t5;
+    t11 = t9 + t1;
+    t7 = t6 + t4;
+    t8 = C6 * t11;
+    t14 = t0 - t8;
+    t10 = C6 * t7;
+    t2 = t13 - t10;
+    t12 = t9 - t1;
+    t3 = C7 * t12;
+    t5 = t6 - t4;
+    t8 = C7 * t5;
+    t10 = t0 + t11;
+    t9 = t13 + t7;
+    t1 = t14 + t8;
+    t12 = t2 - t3;
+    t6 = t14 - t8;
+    t4 = t2 + t3;
+    t5 = t1 + t12;
+    t0 = C17 * t5;
+    t11 = t1 * (-C18);
+    t13 = t12 * (-C19);
+    t7 = t0 - t13;
+    t14 = t0 + t11;
+    t8 = t6 + t4;
+    t2 = (-C20) * t8;
+    t3 = t6 * C21;
+    t5 = t4 * (-C22);
+    t1 = t2 - t5;
+    t12 = t2 + t3;
+    re[83] = t10;
+    im[83] = t9;
+    re[23] = t7;
+    im[23] = t14;
+    re[53] = t1;
+    im[53] = t12;
+    t13 = re[63];
+    t0 = im[63];
+    t11 = re[73];
+    t8 = im[73];
+    t6 = re[83];
+    t4 = im[83];
+    t5 = t11 + t6;
+    t2 = t8 + t4;
+    t3 = C6 * t5;
+    t10 = t13 - t3;
+    t9 = C6 * t2;
+    t7 = t0 - t9;
+    t14 = t11 - t6;
+    t1 = C7 * t14;
+    t12 = t8 - t4;
+    t3 = C7 * t12;
+    t9 = t13 + t5;
+    t11 = t0 + t2;
+    t6 = t10 + t3;
+    t14 = t7 - t1;
+    t8 = t10 - t3;
+    t4 = t7 + t1;
+    re[63] = t9;
+    im[63] = t11;
+    re[73] = t6;
+    im[73] = t14;
+    re[83] = t8;
+    im[83] = t4;
+    t12 = re[3];
+    t13 = im[3];
+    t5 = re[13];
+    t0 = im[13];
+    t2 = re[23];
+    t10 = im[23];
+    t3 = t5 + t2;
+    t7 = t0 + t10;
+    t1 = C6 * t3;
+    t9 = t12 - t1;
+    t11 = C6 * t7;
+    t6 = t13 - t11;
+    t14 = t5 - t2;
+    t8 = C7 * t14;
+    t4 = t0 - t10;
+    t1 = C7 * t4;
+    t11 = t12 + t3;
+    t5 = t13 + t7;
+    t2 = t9 + t1;
+    t14 = t6 - t8;
+    t0 = t9 - t1;
+    t10 = t6 + t8;
+    re[3] = t11;
+    im[3] = t5;
+    re[13] = t2;
+    im[13] = t14;
+    re[23] = t0;
+    im[23] = t10;
+    t4 = re[33];
+    t12 = im[33];
+    t3 = re[43];
+    t13 = im[43];
+    t7 = re[53];
+    t9 = im[53];
+    t1 = t3 + t7;
+    t6 = t13 + t9;
+    t8 = C6 * t1;
+    t11 = t4 - t8;
+    t5 = C6 * t6;
+    t2 = t12 - t5;
+    t14 = t3 - t7;
+    t0 = C7 * t14;
+    t10 = t13 - t9;
+    t8 = C7 * t10;
+    t5 = t4 + t1;
+    t3 = t12 + t6;
+    t7 = t11 + t8;
+    t14 = t2 - t0;
+    t13 = t11 - t8;
+    t9 = t2 + t0;
+    re[33] = t5;
+    im[33] = t3;
+    re[43] = t7;
+    im[43] = t14;
+    re[53] = t13;
+    im[53] = t9;
+    t10 = x[72];
+    t4 = 0.08154058967816075 * t10;
+    t1 = x[107];
+    t12 = 0.11157928098847411 * t1;
+    t6 = t4 - t12;
+    t11 = x[252];
+    t8 = 0.08077908739264364 * t11;
+    t2 = x[287];
+    t0 = 0.025727538017752363 * t2;
+    t5 = t8 + t0;
+    t3 = C41 * t6;
+    t7 = (-C42) * t5;
+    t14 = t3 + t7;
+    t13 = (-C42) * t6;
+    t9 = (-C41) * t5;
+    t10 = t13 + t9;
+    t1 = x[227];
+    t4 = 0.10157171821908681 * t1;
+    t12 = x[312];
+    t11 = 0.0016836021815952902 * t12;
+    t2 = t4 + t11;
+    t8 = x[47];
+    t0 = 0.041091881490305494 * t8;
+    t3 = x[132];
+    t7 = 0.10871066201687268 * t3;
+    t6 = t0 - t7;
+    t5 = (-C43) * t2;
+    t13 = C44 * t6;
+    t9 = t5 + t13;
+    t1 = C44 * t2;
+    t12 = C43 * t6;
+    t4 = t1 + t12;
+    t11 = x[12];
+    t8 = 0.003263813755121946 * t11;
+    t3 = x[167];
+    t0 = 0.10450277057511706 * t3;
+    t7 = t8 - t0;
+    t5 = x[192];
+    t13 = C45 * t7;
+    t2 = (-0.08262895882834827) * t5;
+    t6 = t13 + t2;
+    t1 = (-C46) * t7;
+    t12 = (-0.06691161153872406) * t5;
+    t11 = t1 + t12;
+    t3 = t9 + t6;
+    t8 = t4 + t11;
+    t0 = C6 * t3;
+    t13 = t14 - t0;
+    t2 = C6 * t8;
+    t7 = t10 - t2;
+    t5 = t9 - t6;
+    t1 = C7 * t5;
+    t12 = t4 - t11;
+    t0 = C7 * t12;
+    t2 = t14 + t3;
+    t9 = t10 + t8;
+    t6 = t13 + t0;
+    t5 = t7 - t1;
+    t4 = t13 - t0;
+    t11 = t7 + t1;
+    re[81] = t2;
+    im[81] = t9;
+    re[21] = t6;
+    im[21] = t5;
+    re[51] = t4;
+    im[51] = t11;
+    t12 = x[267];
+    t14 = 0.0584056671989319 * t12;
+    t3 = x[272];
+    t10 = 0.050055274887662475 * t3;
+    t8 = t14 + t10;
+    t13 = x[87];
+    t0 = 0.10009323415744416 * t13;
+    t7 = x[92];
+    t1 = 0.10445761607662409 * t7;
+    t2 = t0 - t1;
+    t9 = (-C47) * t8;
+    t6 = C48 * t2;
+    t5 = t9 + t6;
+    t4 = C48 * t8;
+    t11 = C47 * t2;
+    t12 = t4 + t11;
+    t3 = x[207];
+    t14 = x[27];
+    t10 = 0.014254157485166856 * t14;
+    t13 = x[152];
+    t7 = 0.10468272521430462 * t13;
+    t0 = t10 - t7;
+    t1 = (-0.09098044686374787) * t3;
+    t9 = C49 * t0;
+    t6 = t1 + t9;
+    t8 = 0.054666567621955604 * t3;
+    t2 = C50 * t0;
+    t4 = t8 + t2;
+    t11 = x[32];
+    t14 = 0.019809432322785005 * t11;
+    t13 = x[147];
+    t10 = 0.1052677469413751 * t13;
+    t7 = t14 - t10;
+    t1 = x[212];
+    t9 = C51 * t7;
+    t3 = (-0.09231694444268253) * t1;
+    t0 = t9 + t3;
+    t8 = (-C52) * t7;
+    t2 = (-0.05117211790704133) * t1;
+    t11 = t8 + t2;
+    t13 = t6 + t0;
+    t14 = t4 + t11;
+    t10 = C6 * t13;
+    t9 = t5 - t10;
+    t3 = C6 * t14;
+    t7 = t12 - t3;
+    t1 = t6 - t0;
+    t8 = C7 * t1;
+    t2 = t4 - t11;
+    t10 = C7 * t2;
+    t3 = t5 + t13;
+    t6 = t12 + t14;
+    t0 = t9 + t10;
+    t1 = t7 - t8;
+    t4 = t9 - t10;
+    t11 = t7 + t8;
+    t2 = t0 + t1;
+    t5 = C14 * t2;
+    t13 = t0 * (-C15);
+    t12 = t1 * C16;
+    t14 = t5 - t12;
+    t9 = t5 + t13;
+    t10 = t4 + t11;
+    t7 = C17 * t10;
+    t8 = t4 * (-C18);
+    t2 = t11 * (-C19);
+    t0 = t7 - t2;
+    t1 = t7 + t8;
+    re[1] = t3;
+    im[1] = t6;
+    re[31] = t14;
+    im[31] = t9;
+    re[61] = t0;
+    im[61] = t1;
+    t12 = x[247];
+    t5 = 0.08673930207344024 * t12;
+    t13 = x[292];
+    t10 = 0.018754638337760737 * t13;
+    t4 = t5 + t10;
+    t11 = x[67];
+    t2 = 0.0739149077116441 * t11;
+    t7 = x[112];
+    t8 = 0.11211600182090968 * t7;
+    t3 = t2 - t8;
+    t6 = (-C53) * t4;
+    t14 = C54 * t3;
+    t9 = t6 + t14;
+    t0 = C54 * t4;
+    t1 = C53 * t3;
+    t12 = t0 + t1;
+    t13 = x[187];
+    t5 = x[7];
+    t10 = 0.0014514366788171667 * t5;
+    t11 = x[172];
+    t7 = 0.10480559227732088 * t11;
+    t2 = t10 - t7;
+    t8 = (-0.08001158926983938) * t13;
+    t6 = C55 * t2;
+    t14 = t8 + t6;
+    t4 = 0.06955301342387048 * t13;
+    t3 = C56 * t2;
+    t0 = t4 + t3;
+    t1 = x[52];
+    t5 = 0.049216099716768984 * t1;
+    t11 = x[127];
+    t10 = 0.11003928784390318 * t11;
+    t7 = t5 - t10;
+    t8 = x[232];
+    t6 = 0.09912579670623863 * t8;
+    t13 = x[307];
+    t2 = 0.004132367980549081 * t13;
+    t4 = t6 + t2;
+    t3 = C57 * t7;
+    t1 = (-C58) * t4;
+    t11 = t3 + t1;
+    t5 = (-C58) * t7;
+    t10 = (-C57) * t4;
+    t8 = t5 + t10;
+    t13 = t14 + t11;
+    t6 = t0 + t8;
+    t2 = C6 * t13;
+    t3 = t9 - t2;
+    t1 = C6 * t6;
+    t7 = t12 - t1;
+    t4 = t14 - t11;
+    t5 = C7 * t4;
+    t10 = t0 - t8;
+    t2 = C7 * t10;
+    t1 = t9 + t13;
+    t14 = t12 + t6;
+    t11 = t3 + t2;
+    t4 = t7 - t5;
+    t0 = t3 - t2;
+    t8 = t7 + t5;
+    t10 = t11 + t4;
+    t9 = C17 * t10;
+    t13 = t11 * (-C18);
+    t12 = t4 * (-C19);
+    t6 = t9 - t12;
+    t3 = t9 + t13;
+    t2 = t0 + t8;
+    t7 = (-C20) * t2;
+    t5 = t0 * C21;
+    t10 = t8 * (-C22);
+    t11 = t7 - t10;
+    t4 = t7 + t5;
+    re[11] = t1;
+    im[11] = t14;
+    re[41] = t6;
+    im[41] = t3;
+    re[71] = t11;
+    im[71] = t4;
+    t12 = re[81];
+    t9 = im[81];
+    t13 = re[1];
+    t2 = im[1];
+    t0 = re[11];
+    t8 = im[11];
+    t10 = t13 + t0;
+    t7 = t2 + t8;
+    t5 = C6 * t10;
+    t1 = t12 - t5;
+    t14 = C6 * t7;
+    t6 = t9 - t14;
+    t3 = t13 - t0;
+    t11 = C7 * t3;
+    t4 = t2 - t8;
+    t5 = C7 * t4;
+    t14 = t12 + t10;
+    t13 = t9 + t7;
+    t0 = t1 + t5;
+    t3 = t6 - t11;
+    t2 = t1 - t5;
+    t8 = t6 + t11;
+    re[81] = t14;
+    im[81] = t13;
+    re[1] = t0;
+    im[1] = t3;
+    re[11] = t2;
+    im[11] = t8;
+    t4 = re[21];
+    t12 = im[21];
+    t10 = re[31];
+    t9 = im[31];
+    t7 = re[41];
+    t1 = im[41];
+    t5 = t10 + t7;
+    t6 = t9 + t1;
+    t11 = C6 * t5;
+    t14 = t4 - t11;
+    t13 = C6 * t6;
+    t0 = t12 - t13;
+    t3 = t10 - t7;
+    t2 = C7 * t3;
+    t8 = t9 - t1;
+    t11 = C7 * t8;
+    t13 = t4 + t5;
+    t10 = t12 + t6;
+    t7 = t14 + t11;
+    t3 = t0 - t2;
+    t9 = t14 - t11;
+    t1 = t0 + t2;
+    re[21] = t13;
+    im[21] = t10;
+    re[31] = t7;
+    im[31] = t3;
+    re[41] = t9;
+    im[41] = t1;
+    t8 = re[51];
+    t4 = im[51];
+    t5 = re[61];
+    t12 = im[61];
+    t6 = re[71];
+    t14 = im[71];
+    t11 = t5 + t6;
+    t0 = t12 + t14;
+    t2 = C6 * t11;
+    t13 = t8 - t2;
+    t10 = C6 * t0;
+    t7 = t4 - t10;
+    t3 = t5 - t6;
+    t9 = C7 * t3;
+    t1 = t12 - t14;
+    t2 = C7 * t1;
+    t10 = t8 + t11;
+    t5 = t4 + t0;
+    t6 = t13 + t2;
+    t3 = t7 - t9;
+    t12 = t13 - t2;
+    t14 = t7 + t9;
+    re[51] = t10;
+    im[51] = t5;
+    re[61] = t6;
+    im[61] = t3;
+    re[71] = t12;
+    im[71] = t14;
+    t1 = x[251];
+    t8 = 0.0820419394725153 * t1;
+    t11 = x[288];
+    t4 = 0.024266156878213443 * t11;
+    t0 = t8 + t4;
+    t13 = x[71];
+    t2 = 0.08005992338377164 * t13;
+    t7 = x[108];
+    t9 = 0.11175216614295466 * t7;
+    t10 = t2 - t9;
+    t5 = (-C42) * t0;
+    t6 = C41 * t10;
+    t3 = t5 + t6;
+    t12 = C41 * t0;
+    t14 = C42 * t10;
+    t1 = t12 + t14;
+    t11 = x[191];
+    t8 = x[11];
+    t4 = 0.002831428512025885 * t8;
+    t13 = x[168];
+    t7 = 0.10455343402886527 * t13;
+    t2 = t4 - t7;
+    t9 = (-0.0825889193167555) * t11;
+    t5 = C45 * t2;
+    t6 = t9 + t5;
+    t0 = 0.0668791881815393 * t11;
+    t10 = C46 * t2;
+    t12 = t0 + t10;
+    t14 = x[48];
+    t8 = 0.04269085483362434 * t14;
+    t13 = x[131];
+    t4 = 0.10898346481763614 * t13;
+    t7 = t8 - t4;
+    t9 = x[228];
+    t5 = 0.10113927380391523 * t9;
+    t11 = x[311];
+    t2 = 0.0020754473801508247 * t11;
+    t0 = t5 + t2;
+    t10 = C44 * t7;
+    t14 = (-C43) * t0;
+    t13 = t10 + t14;
+    t8 = (-C43) * t7;
+    t4 = (-C44) * t0;
+    t9 = t8 + t4;
+    t11 = t6 + t13;
+    t5 = t12 + t9;
+    t2 = C6 * t11;
+    t10 = t3 - t2;
+    t14 = C6 * t5;
+    t7 = t1 - t14;
+    t0 = t6 - t13;
+    t8 = C7 * t0;
+    t4 = t12 - t9;
+    t2 = C7 * t4;
+    t14 = t3 + t11;
+    t6 = t1 + t5;
+    t13 = t10 + t2;
+    t0 = t7 - t8;
+    t12 = t10 - t2;
+    t9 = t7 + t8;
+    re[9] = t14;
+    im[9] = t6;
+    re[39] = t13;
+    im[39] = t0;
+    re[69] = t12;
+    im[69] = t9;
+    t4 = x[231];
+    t3 = 0.09967423398910226 * t4;
+    t11 = x[308];
+    t1 = 0.0035432705531146876 * t11;
+    t5 = t3 + t1;
+    t10 = x[51];
+    t2 = 0.04756885867834906 * t10;
+    t7 = x[128];
+    t8 = 0.10978325427720098 * t7;
+    t14 = t2 - t8;
+    t6 = (-C58) * t5;
+    t13 = C57 * t14;
+    t0 = t6 + t13;
+    t12 = C57 * t5;
+    t9 = C58 * t14;
+    t4 = t12 + t9;
+    t11 = x[8];
+    t3 = 0.0017455800739912659 * t11;
+    t1 = x[171];
+    t10 = 0.10473604662669052 * t1;
+    t7 = t3 - t10;
+    t2 = x[188];
+    t8 = C55 * t7;
+    t6 = (-0.0800647176646276) * t2;
+    t13 = t8 + t6;
+    t5 = (-C56) * t7;
+    t14 = (-0.06959919723286134) * t2;
+    t12 = t5 + t14;
+    t9 = x[68];
+    t11 = 0.07548129602721117 * t9;
+    t1 = x[111];
+    t3 = 0.11207172864296862 * t1;
+    t10 = t11 - t3;
+    t8 = x[248];
+    t6 = 0.08561946843470827 * t8;
+    t7 = x[291];
+    t2 = 0.02007900444097957 * t7;
+    t5 = t6 + t2;
+    t14 = C54 * t10;
+    t9 = (-C53) * t5;
+    t1 = t14 + t9;
+    t11 = (-C53) * t10;
+    t3 = (-C54) * t5;
+    t8 = t11 + t3;
+    t7 = t13 + t1;
+    t6 = t12 + t8;
+    t2 = C6 * t7;
+    t14 = t0 - t2;
+    t9 = C6 * t6;
+    t10 = t4 - t9;
+    t5 = t13 - t1;
+    t11 = C7 * t5;
+    t3 = t12 - t8;
+    t2 = C7 * t3;
+    t9 = t0 + t7;
+    t13 = t4 + t6;
+    t1 = t14 + t2;
+    t5 = t10 - t11;
+    t12 = t14 - t2;
+    t8 = t10 + t11;
+    t3 = t1 + t5;
+    t0 = C14 * t3;
+    t7 = t1 * (-C15);
+    t4 = t5 * C16;
+    t6 = t0 - t4;
+    t14 = t0 + t7;
+    t2 = t12 + t8;
+    t10 = C17 * t2;
+    t11 = t12 * (-C18);
+    t3 = t8 * (-C19);
+    t1 = t10 - t3;
+    t5 = t10 + t11;
+    re[19] = t9;
+    im[19] = t13;
+    re[49] = t6;
+    im[49] = t14;
+    re[79] = t1;
+    im[79] = t5;
+    t4 = x[211];
+    t0 = x[31];
+    t7 = 0.018626993267046175 * t0;
+    t2 = x[148];
+    t12 = 0.10512566139996281 * t2;
+    t8 = t7 - t12;
+    t3 = (-0.0924417180028008) * t4;
+    t10 = C51 * t8;
+    t11 = t3 + t10;
+    t9 = 0.05124128102079687 * t4;
+    t13 = C52 * t8;
+    t6 = t9 + t13;
+    t14 = x[28];
+    t1 = 0.015292094451545292 * t14;
+    t5 = x[151];
+    t0 = 0.10477523535016856 * t5;
+    t2 = t1 - t0;
+    t7 = x[208];
+    t12 = C49 * t2;
+    t3 = (-0.09090011668389004) * t7;
+    t10 = t12 + t3;
+    t4 = (-C50) * t2;
+    t8 = (-0.054618300380359634) * t7;
+    t9 = t4 + t8;
+    t13 = x[88];
+    t14 = 0.10104530556902915 * t13;
+    t5 = x[91];
+    t1 = 0.10366449176446424 * t5;
+    t0 = t14 - t1;
+    t12 = x[268];
+    t3 = 0.05675218688923857 * t12;
+    t2 = x[271];
+    t7 = 0.05173842041721468 * t2;
+    t4 = t3 + t7;
+    t8 = C48 * t0;
+    t13 = (-C47) * t4;
+    t5 = t8 + t13;
+    t14 = (-C47) * t0;
+    t1 = (-C48) * t4;
+    t12 = t14 + t1;
+    t2 = t10 + t5;
+    t3 = t9 + t12;
+    t7 = C6 * t2;
+    t8 = t11 - t7;
+    t13 = C6 * t3;
+    t0 = t6 - t13;
+    t4 = t10 - t5;
+    t14 = C7 * t4;
+    t1 = t9 - t12;
+    t7 = C7 * t1;
+    t13 = t11 + t2;
+    t10 = t6 + t3;
+    t5 = t8 + t7;
+    t4 = t0 - t14;
+    t9 = t8 - t7;
+    t12 = t0 + t14;
+    t1 = t5 + t4;
+    t11 = C17 * t1;
+    t2 = t5 * (-C18);
+    t6 = t4 * (-C19);
+    t3 = t11 - t6;
+    t8 = t11 + t2;
+    t7 = t9 + t12;
+    t0 = (-C20) * t7;
+    t14 = t9 * C21;
+    t1 = t12 * (-C22);
+    t5 = t0 - t1;
+    t4 = t0 + t14;
+    re[29] = t13;
+    im[29] = t10;
+    re[59] = t3;
+    im[59] = t8;
+    re[89] = t5;
+    im[89] = t4;
+    t6 = re[9];
+    t11 = im[9];
+    t2 = re[19];
+    t7 = im[19];
+    t9 = re[29];
+    t12 = im[29];
+    t1 = t2 + t9;
+    t0 = t7 + t12;
+    t14 = C6 * t1;
+    t13 = t6 - t14;
+    t10 = C6 * t0;
+    t3 = t11 - t10;
+    t8 = t2 - t9;
+    t5 = C7 * t8;
+    t4 = t7 - t12;
+    t14 = C7 * t4;
+    t10 = t6 + t1;
+    t2 = t11 + t0;
+    t9 = t13 + t14;
+    t8 = t3 - t5;
+    t7 = t13 - t14;
+    t12 = t3 + t5;
+    re[9] = t10;
+    im[9] = t2;
+    re[19] = t9;
+    im[19] = t8;
+    re[29] = t7;
+    im[29] = t12;
+    t4 = re[39];
+    t6 = im[39];
+    t1 = re[49];
+    t11 = im[49];
+    t0 = re[59];
+    t13 = im[59];
+    t14 = t1 + t0;
+    t3 = t11 + t13;
+    t5 = C6 * t14;
+    t10 = t4 - t5;
+    t2 = C6 * t3;
+    t9 = t6 - t2;
+    t8 = t1 - t0;
+    t7 = C7 * t8;
+    t12 = t11 - t13;
+    t5 = C7 * t12;
+    t2 = t4 + t14;
+    t1 = t6 + t3;
+    t0 = t10 + t5;
+    t8 = t9 - t7;
+    t11 = t10 - t5;
+    t13 = t9 + t7;
+    re[39] = t2;
+    im[39] = t1;
+    re[49] = t0;
+    im[49] = t8;
+    re[59] = t11;
+    im[59] = t13;
+    t12 = re[69];
+    t4 = im[69];
+    t14 = re[79];
+    t6 = im[79];
+    t3 = re[89];
+    t10 = im[89];
+    t5 = t14 + t3;
+    t9 = t6 + t10;
+    t7 = C6 * t5;
+    t2 = t12 - t7;
+    t1 = C6 * t9;
+    t0 = t4 - t1;
+    t8 = t14 - t3;
+    t11 = C7 * t8;
+    t13 = t6 - t10;
+    t7 = C7 * t13;
+    t1 = t12 + t5;
+    t14 = t4 + t9;
+    t3 = t2 + t7;
+    t8 = t0 - t11;
+    t6 = t2 - t7;
+    t10 = t0 + t11;
+    re[69] = t1;
+    im[69] = t14;
+    re[79] = t3;
+    im[79] = t8;
+    re[89] = t6;
+    im[89] = t10;
+    t13 = x[215];
+    t12 = x[35];
+    t5 = 0.023561556790462897 * t12;
+    t4 = x[144];
+    t9 = 0.10577241761811562 * t4;
+    t2 = t5 - t9;
+    t7 = (-0.09359786524616871) * t13;
+    t0 = C23 * t2;
+    t11 = t7 + t0;
+    t1 = 0.04769049436127308 * t13;
+    t14 = C24 * t2;
+    t3 = t1 + t14;
+    t8 = x[24];
+    t6 = 0.011366778059010964 * t8;
+    t10 = x[155];
+    t12 = 0.10447428258388627 * t10;
+    t4 = t6 - t12;
+    t5 = x[204];
+    t9 = C27 * t4;
+    t7 = (-0.08919479163284084) * t5;
+    t0 = t9 + t7;
+    t13 = (-C28) * t4;
+    t2 = (-0.05792377496003662) * t5;
+    t1 = t13 + t2;
+    t14 = x[84];
+    t8 = 0.09700648402016114 * t14;
+    t10 = x[95];
+    t6 = 0.10659592439523378 * t10;
+    t12 = t8 - t6;
+    t9 = x[264];
+    t7 = 0.06328411738407469 * t9;
+    t4 = x[275];
+    t5 = 0.04499990039956431 * t4;
+    t13 = t7 + t5;
+    t2 = C26 * t12;
+    t14 = (-C25) * t13;
+    t10 = t2 + t14;
+    t8 = (-C25) * t12;
+    t6 = (-C26) * t13;
+    t9 = t8 + t6;
+    t4 = t0 + t10;
+    t7 = t1 + t9;
+    t5 = C6 * t4;
+    t2 = t11 - t5;
+    t14 = C6 * t7;
+    t12 = t3 - t14;
+    t13 = t0 - t10;
+    t8 = C7 * t13;
+    t6 = t1 - t9;
+    t5 = C7 * t6;
+    t14 = t11 + t4;
+    t0 = t3 + t7;
+    t10 = t2 + t5;
+    t13 = t12 - t8;
+    t1 = t2 - t5;
+    t9 = t12 + t8;
+    re[27] = t14;
+    im[27] = t0;
+    re[57] = t10;
+    im[57] = t13;
+    re[87] = t1;
+    im[87] = t9;
+    t6 = x[195];
+    t11 = x[15];
+    t4 = 0.004778532564716806 * t11;
+    t3 = x[164];
+    t7 = 0.10438765580397108 * t3;
+    t2 = t4 - t7;
+    t5 = (-0.08500744480820877) * t6;
+    t12 = C39 * t2;
+    t8 = t5 + t12;
+    t14 = 0.06405770432411546 * t6;
+    t0 = C40 * t2;
+    t10 = t14 + t0;
+    t13 = x[44];
+    t1 = 0.036397348554850356 * t13;
+    t9 = x[135];
+    t11 = 0.1078958471118532 * t9;
+    t3 = t1 - t11;
+    t4 = x[224];
+    t7 = 0.10271657940570703 * t4;
+    t5 = x[315];
+    t12 = 0.0007807921408777607 * t5;
+    t6 = t7 + t12;
+    t2 = C38 * t3;
+    t14 = (-C37) * t6;
+    t0 = t2 + t14;
+    t13 = (-C37) * t3;
+    t9 = (-C38) * t6;
+    t1 = t13 + t9;
+    t11 = x[255];
+    t4 = 0.07678827089087746 * t11;
+    t5 = x[284];
+    t7 = 0.030285070177357855 * t5;
+    t12 = t4 + t7;
+    t2 = x[75];
+    t14 = 0.08582541591976457 * t2;
+    t3 = x[104];
+    t6 = 0.11084873077916041 * t3;
+    t13 = t14 - t6;
+    t9 = (-C36) * t12;
+    t11 = C35 * t13;
+    t5 = t9 + t11;
+    t4 = C35 * t12;
+    t7 = C36 * t13;
+    t2 = t4 + t7;
+    t3 = t0 + t5;
+    t14 = t1 + t2;
+    t6 = C6 * t3;
+    t9 = t8 - t6;
+    t11 = C6 * t14;
+    t12 = t10 - t11;
+    t13 = t0 - t5;
+    t4 = C7 * t13;
+    t7 = t1 - t2;
+    t6 = C7 * t7;
+    t11 = t8 + t3;
+    t0 = t10 + t14;
+    t5 = t9 + t6;
+    t13 = t12 - t4;
+    t1 = t9 - t6;
+    t2 = t12 + t4;
+    t7 = t5 + t13;
+    t8 = C14 * t7;
+    t3 = t5 * (-C15);
+    t10 = t13 * C16;
+    t14 = t8 - t10;
+    t9 = t8 + t3;
+    t6 = t1 + t2;
+    t12 = C17 * t6;
+    t4 = t1 * (-C18);
+    t7 = t2 * (-C19);
+    t5 = t12 - t7;
+    t13 = t12 + t4;
+    re[37] = t11;
+    im[37] = t0;
+    re[67] = t14;
+    im[67] = t9;
+    re[7] = t5;
+    im[7] = t13;
+    t10 = x[4];
+    t8 = 0.0007563547636164294 * t10;
+    t3 = x[175];
+    t6 = 0.10503390957543066 * t3;
+    t1 = t8 - t6;
+    t2 = x[184];
+    t7 = C33 * t1;
+    t12 = (-0.07736694057243639) * t2;
+    t4 = t7 + t12;
+    t11 = (-C34) * t1;
+    t0 = (-0.07214583925211288) * t2;
+    t14 = t11 + t0;
+    t9 = x[64];
+    t5 = 0.06911379356638549 * t9;
+    t13 = x[115];
+    t10 = 0.11207741615761654 * t13;
+    t3 = t5 - t10;
+    t8 = x[244];
+    t6 = 0.08987633190957331 * t8;
+    t7 = x[295];
+    t12 = 0.015018768373128936 * t7;
+    t1 = t6 + t12;
+    t2 = C32 * t3;
+    t11 = (-C31) * t1;
+    t0 = t2 + t11;
+    t9 = (-C31) * t3;
+    t13 = (-C32) * t1;
+    t5 = t9 + t13;
+    t10 = x[235];
+    t8 = 0.09728845040920638 * t10;
+    t7 = x[304];
+    t6 = 0.006201590324297938 * t7;
+    t12 = t8 + t6;
+    t2 = x[55];
+    t11 = 0.05419989393873094 * t2;
+    t3 = x[124];
+    t1 = 0.11075297764495041 * t3;
+    t9 = t11 - t1;
+    t13 = (-C30) * t12;
+    t10 = C29 * t9;
+    t7 = t13 + t10;
+    t8 = C29 * t12;
+    t6 = C30 * t9;
+    t2 = t8 + t6;
+    t3 = t0 + t7;
+    t11 = t5 + t2;
+    t1 = C6 * t3;
+    t13 = t4 - t1;
+    t10 = C6 * t11;
+    t12 = t14 - t10;
+    t9 = t0 - t7;
+    t8 = C7 * t9;
+    t6 = t5 - t2;
+    t1 = C7 * t6;
+    t10 = t4 + t3;
+    t0 = t14 + t11;
+    t7 = t13 + t1;
+    t9 = t12 - t8;
+    t5 = t13 - t1;
+    t2 = t12 + t8;
+    t6 = t7 + t9;
+    t4 = C17 * t6;
+    t3 = t7 * (-C18);
+    t14 = t9 * (-C19);
+    t11 = t4 - t14;
+    t13 = t4 + t3;
+    t1 = t5 + t2;
+    t12 = (-C20) * t1;
+    t8 = t5 * C21;
+    t6 = t2 * (-C22);
+    t7 = t12 - t6;
+    t9 = t12 + t8;
+    re[47] = t10;
+    im[47] = t0;
+    re[77] = t11;
+    im[77] = t13;
+    re[17] = t7;
+    im[17] = t9;
+    t14 = re[27];
+    t4 = im[27];
+    t3 = re[37];
+    t1 = im[37];
+    t5 = re[47];
+    t2 = im[47];
+    t6 = t3 + t5;
+    t12 = t1 + t2;
+    t8 = C6 * t6;
+    t10 = t14 - t8;
+    t0 = C6 * t12;
+    t11 = t4 - t0;
+    t13 = t3 - t5;
+    t7 = C7 * t13;
+    t9 = t1 - t2;
+    t8 = C7 * t9;
+    t0 = t14 + t6;
+    t3 = t4 + t12;
+    t5 = t10 + t8;
+    t13 = t11 - t7;
+    t1 = t10 - t8;
+    t2 = t11 + t7;
+    re[27] = t0;
+    im[27] = t3;
+    re[37] = t5;
+    im[37] = t13;
+    re[47] = t1;
+    im[47] = t2;
+    t9 = re[57];
+    t14 = im[57];
+    t6 = re[67];
+    t4 = im[67];
+    t12 = re[77];
+    t10 = im[77];
+    t8 = t6 + t12;
+    t11 = t4 + t10;
+    t7 = C6 * t8;
+    t0 = t9 - t7;
+    t3 = C6 * t11;
+    t5 = t14 - t3;
+    t13 = t6 - t12;
+    t1 = C7 * t13;
+    t2 = t4 - t10;
+    t7 = C7 * t2;
+    t3 = t9 + t8;
+    t6 = t14 + t11;
+    t12 = t0 + t7;
+    t13 = t5 - t1;
+    t4 = t0 - t7;
+    t10 = t5 + t1;
+    re[57] = t3;
+    im[57] = t6;
+    re[67] = t12;
+    im[67] = t13;
+    re[77] = t4;
+    im[77] = t10;
+    t2 = re[87];
+    t9 = im[87];
+    t8 = re[7];
+    t14 = im[7];
+    t11 = re[17];
+    t0 = im[17];
+    t7 = t8 + t11;
+    t5 = t14 + t0;
+    t1 = C6 * t7;
+    t3 = t2 - t1;
+    t6 = C6 * t5;
+    t12 = t9 - t6;
+    t13 = t8 - t11;
+    t4 = C7 * t13;
+    t10 = t14 - t0;
+    t1 = C7 * t10;
+    t6 = t2 + t7;
+    t8 = t9 + t5;
+    t11 = t3 + t1;
+    t13 = t12 - t4;
+    t14 = t3 - t1;
+    t0 = t12 + t4;
+    re[87] = t6;
+    im[87] = t8;
+    re[7] = t11;
+    im[7] = t13;
+    re[17] = t14;
+    im[17] = t0;
+    t10 = re[45];
+    t2 = im[45];
+    t7 = re[63];
+    t9 = im[63];
+    t5 = re[81];
+    t3 = im[81];
+    t1 = re[9];
+    t12 = im[9];
+    t4 = re[27];
+    t6 = im[27];
+    t8 = t7 + t4;
+    t11 = t9 + t6;
+    t13 = t5 + t1;
+    t14 = t3 + t12;
+    t0 = t7 - t4;
+    t7 = t9 - t6;
+    t4 = t5 - t1;
+    t9 = t3 - t12;
+    t6 = t8 + t13;
+    t5 = t11 + t14;
+    t1 = t8 - t13;
+    t3 = C0 * t1;
+    t12 = t11 - t14;
+    t8 = C0 * t12;
+    t13 = C1 * t6;
+    t1 = t10 - t13;
+    t11 = C1 * t5;
+    t14 = t2 - t11;
+    t12 = t1 + t3;
+    t13 = t14 + t8;
+    t11 = t1 - t3;
+    t1 = t14 - t8;
+    t3 = C2 * t0;
+    t14 = C3 * t4;
+    t8 = t3 + t14;
+    t3 = C2 * t7;
+    t14 = C3 * t9;
+    t3 = t3 + t14;
+    t14 = C3 * t0;
+    t0 = C2 * t4;
+    t4 = t14 - t0;
+    t14 = C3 * t7;
+    t0 = C2 * t9;
+    t7 = t14 - t0;
+    t9 = t10 + t6;
+    t14 = t2 + t5;
+    t0 = t12 + t3;
+    t10 = t13 - t8;
+    t6 = t11 + t7;
+    t2 = t1 - t4;
+    t5 = t11 - t7;
+    t11 = t1 + t4;
+    t7 = t12 - t3;
+    t1 = t13 + t8;
+    re[45] = t9;
+    im[45] = t14;
+    re[63] = t0;
+    im[63] = t10;
+    re[81] = t6;
+    im[81] = t2;
+    re[9] = t5;
+    im[9] = t11;
+    re[27] = t7;
+    im[27] = t1;
+    t4 = re[75];
+    t12 = im[75];
+    t3 = re[3];
+    t13 = im[3];
+    t8 = re[21];
+    t9 = im[21];
+    t14 = re[39];
+    t0 = im[39];
+    t10 = re[57];
+    t6 = im[57];
+    t2 = t3 + t10;
+    t5 = t13 + t6;
+    t11 = t8 + t14;
+    t7 = t9 + t0;
+    t1 = t3 - t10;
+    t3 = t13 - t6;
+    t10 = t8 - t14;
+    t13 = t9 - t0;
+    t6 = t2 + t11;
+    t8 = t5 + t7;
+    t14 = t2 - t11;
+    t9 = C0 * t14;
+    t0 = t5 - t7;
+    t2 = C0 * t0;
+    t11 = C1 * t6;
+    t14 = t4 - t11;
+    t5 = C1 * t8;
+    t7 = t12 - t5;
+    t0 = t14 + t9;
+    t11 = t7 + t2;
+    t5 = t14 - t9;
+    t14 = t7 - t2;
+    t9 = C2 * t1;
+    t7 = C3 * t10;
+    t2 = t9 + t7;
+    t9 = C2 * t3;
+    t7 = C3 * t13;
+    t9 = t9 + t7;
+    t7 = C3 * t1;
+    t1 = C2 * t10;
+    t10 = t7 - t1;
+    t7 = C3 * t3;
+    t1 = C2 * t13;
+    t3 = t7 - t1;
+    t13 = t4 + t6;
+    t7 = t12 + t8;
+    t1 = t0 + t9;
+    t4 = t11 - t2;
+    t6 = t5 + t3;
+    t12 = t14 - t10;
+    t8 = t5 - t3;
+    t5 = t14 + t10;
+    t3 = t0 - t9;
+    t14 = t11 + t2;
+    re[75] = t13;
+    im[75] = t7;
+    re[3] = t1;
+    im[3] = t4;
+    re[21] = t6;
+    im[21] = t12;
+    re[39] = t8;
+    im[39] = t5;
+    re[57] = t3;
+    im[57] = t14;
+    t10 = re[15];
+    t0 = im[15];
+    t9 = re[33];
+    t11 = im[33];
+    t2 = re[51];
+    t13 = im[51];
+    t7 = re[69];
+    t1 = im[69];
+    t4 = re[87];
+    t6 = im[87];
+    t12 = t9 + t4;
+    t8 = t11 + t6;
+    t5 = t2 + t7;
+    t3 = t13 + t1;
+    t14 = t9 - t4;
+    t9 = t11 - t6;
+    t4 = t2 - t7;
+    t11 = t13 - t1;
+    t6 = t12 + t5;
+    t2 = t8 + t3;
+    t7 = t12 - t5;
+    t13 = C0 * t7;
+    t1 = t8 - t3;
+    t12 = C0 * t1;
+    t5 = C1 * t6;
+    t7 = t10 - t5;
+    t8 = C1 * t2;
+    t3 = t0 - t8;
+    t1 = t7 + t13;
+    t5 = t3 + t12;
+    t8 = t7 - t13;
+    t7 = t3 - t12;
+    t13 = C2 * t14;
+    t3 = C3 * t4;
+    t12 = t13 + t3;
+    t13 = C2 * t9;
+    t3 = C3 * t11;
+    t13 = t13 + t3;
+    t3 = C3 * t14;
+    t14 = C2 * t4;
+    t4 = t3 - t14;
+    t3 = C3 * t9;
+    t14 = C2 * t11;
+    t9 = t3 - t14;
+    t11 = t10 + t6;
+    t3 = t0 + t2;
+    t14 = t1 + t13;
+    t10 = t5 - t12;
+    t6 = t8 + t9;
+    t0 = t7 - t4;
+    t2 = t8 - t9;
+    t8 = t7 + t4;
+    t9 = t1 - t13;
+    t7 = t5 + t12;
+    re[15] = t11;
+    im[15] = t3;
+    re[33] = t14;
+    im[33] = t10;
+    re[51] = t6;
+    im[51] = t0;
+    re[69] = t2;
+    im[69] = t8;
+    re[87] = t9;
+    im[87] = t7;
+    t4 = re[55];
+    t1 = im[55];
+    t13 = re[73];
+    t5 = im[73];
+    t12 = re[1];
+    t11 = im[1];
+    t3 = re[19];
+    t14 = im[19];
+    t10 = re[37];
+    t6 = im[37];
+    t0 = t13 + t10;
+    t2 = t5 + t6;
+    t8 = t12 + t3;
+    t9 = t11 + t14;
+    t7 = t13 - t10;
+    t13 = t5 - t6;
+    t10 = t12 - t3;
+    t5 = t11 - t14;
+    t6 = t0 + t8;
+    t12 = t2 + t9;
+    t3 = t0 - t8;
+    t11 = C0 * t3;
+    t14 = t2 - t9;
+    t0 = C0 * t14;
+    t8 = C1 * t6;
+    t3 = t4 - t8;
+    t2 = C1 * t12;
+    t9 = t1 - t2;
+    t14 = t3 + t11;
+    t8 = t9 + t0;
+    t2 = t3 - t11;
+    t3 = t9 - t0;
+    t11 = C2 * t7;
+    t9 = C3 * t10;
+    t0 = t11 + t9;
+    t11 = C2 * t13;
+    t9 = C3 * t5;
+    t11 = t11 + t9;
+    t9 = C3 * t7;
+    t7 = C2 * t10;
+    t10 = t9 - t7;
+    t9 = C3 * t13;
+    t7 = C2 * t5;
+    t13 = t9 - t7;
+    t5 = t4 + t6;
+    t9 = t1 + t12;
+    t7 = t14 + t11;
+    t4 = t8 - t0;
+    t6 = t2 + t13;
+    t1 = t3 - t10;
+    t12 = t2 - t13;
+    t2 = t3 + t10;
+    t13 = t14 - t11;
+    t3 = t8 + t0;
+    re[55] = t5;
+    im[55] = t9;
+    re[73] = t7;
+    im[73] = t4;
+    re[1] = t6;
+    im[1] = t1;
+    re[19] = t12;
+    im[19] = t2;
+    re[37] = t13;
+    im[37] = t3;
+    t10 = re[85];
+    t14 = im[85];
+    t11 = re[13];
+    t8 = im[13];
+    t0 = re[31];
+    t5 = im[31];
+    t9 = re[49];
+    t7 = im[49];
+    t4 = re[67];
+    t6 = im[67];
+    t1 = t11 + t4;
+    t12 = t8 + t6;
+    t2 = t0 + t9;
+    t13 = t5 + t7;
+    t3 = t11 - t4;
+    t11 = t8 - t6;
+    t4 = t0 - t9;
+    t8 = t5 - t7;
+    t6 = t1 + t2;
+    t0 = t12 + t13;
+    t9 = t1 - t2;
+    t5 = C0 * t9;
+    t7 = t12 - t13;
+    t1 = C0 * t7;
+    t2 = C1 * t6;
+    t9 = t10 - t2;
+    t12 = C1 * t0;
+    t13 = t14 - t12;
+    t7 = t9 + t5;
+    t2 = t13 + t1;
+    t12 = t9 - t5;
+    t9 = t13 - t1;
+    t5 = C2 * t3;
+    t13 = C3 * t4;
+    t1 = t5 + t13;
+    t5 = C2 * t11;
+    t13 = C3 * t8;
+    t5 = t5 + t13;
+    t13 = C3 * t3;
+    t3 = C2 * t4;
+    t4 = t13 - t3;
+    t13 = C3 * t11;
+    t3 = C2 * t8;
+    t11 = t13 - t3;
+    t8 = t10 + t6;
+    t13 = t14 + t0;
+    t3 = t7 + t5;
+    t10 = t2 - t1;
+    t6 = t12 + t11;
+    t14 = t9 - t4;
+    t0 = t12 - t11;
+    t12 = t9 + t4;
+    t11 = t7 - t5;
+    t9 = t2 + t1;
+    re[85] = t8;
+    im[85] = t13;
+    re[13] = t3;
+    im[13] = t10;
+    re[31] = t6;
+    im[31] = t14;
+    re[49] = t0;
+    im[49] = t12;
+    re[67] = t11;
+    im[67] = t9;
+}
+
+/**
+ *  Part 3 of ApplyWindowedMDCT_W75_180().
+ * 
+ *  @param {Number[]} x 
+ *    - The input block (360 points).
+ *  @param {Number[]} X 
+ *    - The array that would contain the output block (180 points).
+ *  @param {Number[]} re 
+ *    - The scratch buffer (real part, 90 points).
+ *  @param {Number[]} im 
+ *    - The scratch buffer (imaginary part, 90 points).
+ */
+function ApplyWindowedMDCT_W75_180_Part3(x, X, re, im) {
+    let t0, t1, t10, t11, t12, t13, t14, t2, t3, t4, t5, t6, t7, t8, t9;
+    const C0 = 0.5590169943749475;
+    const C1 = 0.25;
+    const C2 = 0.9510565162951535;
+    const C3 = 0.5877852522924731;
+    const C4 = 0.9999904807207345;
+    const C5 = 0.004363309284746571;
+    const C6 = 0.7040147244559684;
+    const C7 = 0.7101853756232854;
+    const C8 = 0.6915130557822694;
+    const C9 = 0.7223639620597556;
+    const C10 = 0.9997620270799091;
+    const C11 = 0.02181488503456112;
+    const C12 = 0.9992290362407229;
+    const C13 = 0.03925981575906861;
+    const C14 = 0.6788007455329417;
+    const C15 = 0.7343225094356856;
+    const C16 = 0.6658816660008342;
+    const C17 = 0.7460573750616996;
+    const C18 = 0.9983916705573488;
+    const C19 = 0.056692787563377506;
+    const C20 = 0.9972501850994857;
+    const C21 = 0.07410849019539922;
+    const C22 = 0.6527597524627224;
+    const C23 = 0.7575649843840496;
+    const C24 = 0.6394390019805847;
+    const C25 = 0.7688418320734596;
+    const C26 = 0.9958049275746618;
+    const C27 = 0.09150161866340238;
+    const C28 = 0.9940563382223196;
+    const C29 = 0.10886687485196457;
+    const C30 = 0.6259234721840591;
+    const C31 = 0.7798844830928818;
+    const C32 = 0.6122172800344493;
+    const C33 = 0.7906895737438434;
+    const C34 = 0.992004949679715;
+    const C35 = 0.12619896913582976;
+    const C36 = 0.9896513868196702;
+    const C37 = 0.1434926219911793;
+    const C38 = 0.598324600570659;
+    const C39 = 0.8012538126910607;
+    const C40 = 0.5842496656374344;
+    const C41 = 0.8115739819650123;
+    const C42 = 0.9869963665602319;
+    const C43 = 0.1607425656038261;
+    const C44 = 0.9840406976462909;
+    const C45 = 0.17794354547384175;
+    const C46 = 0.569996762596303;
+    const C47 = 0.8216469379421637;
+    const C48 = 0.5555702330196022;
+    const C49 = 0.8314696123025452;
+    const C50 = 0.9807852804032304;
+    const C51 = 0.19509032201612825;
+    const C52 = 0.9772311064626789;
+    const C53 = 0.21217767215644623;
+    const C54 = 0.5409744713679939;
+    const C55 = 0.8410390129643925;
+    const C56 = 0.5262139236518696;
+    const C57 = 0.8503522249955628;
+    const C58 = 0.9733792584604485;
+    const C59 = 0.22920039092241415;
+    const C60 = 0.9692309097067544;
+    const C61 = 0.24615329302899303;
+    const C62 = 0.5112930860770522;
+    const C63 = 0.8594064115014527;
+    const C64 = 0.4962165036752082;
+    const C65 = 0.8681988144891423;
+    const C66 = 0.964787323828813;
+    const C67 = 0.2630312144579748;
+    const C68 = 0.9600498543859287;
+    const C69 = 0.2798290140309921;
+    const C70 = 0.48098876891938763;
+    const C71 = 0.8767267557075077;
+    const C72 = 0.4656145203251114;
+    const C73 = 0.8849876374630419;
+    const C74 = 0.9550199444571866;
+    const C75 = 0.296541574975571;
+    const C76 = 0.949699126201877;
+    const C77 = 0.31316380648374953;
+    const C78 = 0.45009844103743496;
+    const C79 = 0.892978943411137;
+    const C80 = 0.43444525740441703;
+    const C81 = 0.9006982393225879;
+    const C82 = 0.9440890203927842;
+    const C83 = 0.32969064526278724;
+    const C84 = 0.9381913359224842;
+    const C85 = 0.34611705707749296;
+    const C86 = 0.41865973753742813;
+    const C87 = 0.9081431738250813;
+    const C88 = 0.40274668985873724;
+    const C89 = 0.9153114791194471;
+    const C90 = 0.9320078692827986;
+    const C91 = 0.3624380382837016;
+    const C92 = 0.9255405040175664;
+    const C93 = 0.37864861735243294;
+    const C94 = 0.3867109616368206;
+    const C95 = 0.9222009716704518;
+    const C96 = 0.3705574375098362;
+    const C97 = 0.9288095528719242;
+    const C98 = 0.9187912101488983;
+    const C99 = 0.39474385638426723;
+    const C100 = 0.9117620435770886;
+    const C101 = 0.41071885261347724;
+    const C102 = 0.35429103799771583;
+    const C103 = 0.9351352096860117;
+    const C104 = 0.33791671800332695;
+    const C105 = 0.9411760152563706;
+    const C106 = 0.904455145454368;
+    const C107 = 0.4265687399014583;
+    const C108 = 0.8968727415326883;
+    const C109 = 0.4422886902190013;
+    const C110 = 0.3214394653031616;
+    const C111 = 0.9469301294951057;
+    const C112 = 0.30486429902801077;
+    const C113 = 0.9523957996432784;
+    const C114 = 0.8890171414857364;
+    const C115 = 0.4578739151169567;
+    const C116 = 0.8808907382053855;
+    const C117 = 0.47331966718484336;
+    const C118 = 0.28819626813408933;
+    const C119 = 0.9575713608048144;
+    const C120 = 0.27144044986507426;
+    const C121 = 0.9624552364536473;
+    const C122 = 0.8724960070727972;
+    const C123 = 0.4886212414969549;
+    const C124 = 0.8638355052043957;
+    const C125 = 0.5037739770455263;
+    const C126 = 0.25460194820552756;
+    const C127 = 0.9670459389139432;
+    const C128 = 0.2376858923261731;
+    const C129 = 0.9713420698132614;
+    const C130 = 0.8549118706729466;
+    const C131 = 0.5187732581605213;
+    const C132 = 0.8457278217039733;
+    const C133 = 0.5336145159156115;
+    const C134 = 0.22069743502150108;
+    const C135 = 0.9753423205085127;
+    const C136 = 0.2036417511401775;
+    const C137 = 0.9790454724845838;
+    const C138 = 0.8362861558477596;
+    const C139 = 0.5482932295199138;
+    const C140 = 0.8265897491271886;
+    const C141 = 0.5628049276950685;
+    const C142 = 0.18652403600873463;
+    const C143 = 0.9824503977255097;
+    const C144 = 0.1693495038490246;
+    const C145 = 0.9855560590580777;
+    const C146 = 0.8166415551616789;
+    const C147 = 0.5771451900372336;
+    const C148 = 0.8064446042674825;
+    const C149 = 0.5913096483635824;
+    const C150 = 0.1521233861899167;
+    const C151 = 0.9883615104677607;
+    const C152 = 0.134850930273723;
+    const C153 = 0.9908658973868822;
+    const C154 = 0.796002002534622;
+    const C155 = 0.6052939880428944;
+    const C156 = 0.785316930880745;
+    const C157 = 0.619093949309834;
+    const C158 = 0.11753739745783764;
+    const C159 = 0.9930684569549263;
+    const C160 = 0.10018806161207627;
+    const C161 = 0.9949685182509117;
+    const C162 = 0.7743926440821856;
+    const C163 = 0.632705328562516;
+    const C164 = 0.7632324697825288;
+    const C165 = 0.6461239796429639;
+    const C166 = 0.08280820751220434;
+    const C167 = 0.9965655024977614;
+    const C168 = 0.06540312923014306;
+    const C169 = 0.9978589232386035;
+    const C170 = 0.7518398074789774;
+    const C171 = 0.6593458151000688;
+    const C172 = 0.7402181274868321;
+    const C173 = 0.672366807434668;
+    const C174 = 0.04797812852134394;
+    const C175 = 0.9988483864849507;
+    const C176 = 0.03053851320982266;
+    const C177 = 0.9995335908367129;
+    const C178 = 0.7283709698824002;
+    const C179 = 0.6851829903263591;
+    const C180 = 0.7163019434246544;
+    const C181 = 0.6977904598416801;
+    const C182 = 0.01308959557134444;
+    const C183 = 0.999914327574007;
+    t4 = re[25];
+    t7 = im[25];
+    t5 = re[43];
+    t2 = im[43];
+    t1 = re[61];
+    t8 = im[61];
+    t13 = re[79];
+    t3 = im[79];
+    t10 = re[7];
+    t6 = im[7];
+    t14 = t5 + t10;
+    t0 = t2 + t6;
+    t12 = t1 + t13;
+    t11 = t8 + t3;
+    t9 = t5 - t10;
+    t5 = t2 - t6;
+    t10 = t1 - t13;
+    t2 = t8 - t3;
+    t6 = t14 + t12;
+    t1 = t0 + t11;
+    t13 = t14 - t12;
+    t8 = C0 * t13;
+    t3 = t0 - t11;
+    t14 = C0 * t3;
+    t12 = C1 * t6;
+    t13 = t4 - t12;
+    t0 = C1 * t1;
+    t11 = t7 - t0;
+    t3 = t13 + t8;
+    t12 = t11 + t14;
+    t0 = t13 - t8;
+    t13 = t11 - t14;
+    t8 = C2 * t9;
+    t11 = C3 * t10;
+    t14 = t8 + t11;
+    t8 = C2 * t5;
+    t11 = C3 * t2;
+    t8 = t8 + t11;
+    t11 = C3 * t9;
+    t9 = C2 * t10;
+    t10 = t11 - t9;
+    t11 = C3 * t5;
+    t9 = C2 * t2;
+    t5 = t11 - t9;
+    t2 = t4 + t6;
+    t11 = t7 + t1;
+    t9 = t3 + t8;
+    t4 = t12 - t14;
+    t6 = t0 + t5;
+    t7 = t13 - t10;
+    t1 = t0 - t5;
+    t0 = t13 + t10;
+    t5 = t3 - t8;
+    t13 = t12 + t14;
+    re[25] = t2;
+    im[25] = t11;
+    re[43] = t9;
+    im[43] = t4;
+    re[61] = t6;
+    im[61] = t7;
+    re[79] = t1;
+    im[79] = t0;
+    re[7] = t5;
+    im[7] = t13;
+    t10 = re[65];
+    t3 = im[65];
+    t8 = re[83];
+    t12 = im[83];
+    t14 = re[11];
+    t2 = im[11];
+    t11 = re[29];
+    t9 = im[29];
+    t4 = re[47];
+    t6 = im[47];
+    t7 = t8 + t4;
+    t1 = t12 + t6;
+    t0 = t14 + t11;
+    t5 = t2 + t9;
+    t13 = t8 - t4;
+    t8 = t12 - t6;
+    t4 = t14 - t11;
+    t12 = t2 - t9;
+    t6 = t7 + t0;
+    t14 = t1 + t5;
+    t11 = t7 - t0;
+    t2 = C0 * t11;
+    t9 = t1 - t5;
+    t7 = C0 * t9;
+    t0 = C1 * t6;
+    t11 = t10 - t0;
+    t1 = C1 * t14;
+    t5 = t3 - t1;
+    t9 = t11 + t2;
+    t0 = t5 + t7;
+    t1 = t11 - t2;
+    t11 = t5 - t7;
+    t2 = C2 * t13;
+    t5 = C3 * t4;
+    t7 = t2 + t5;
+    t2 = C2 * t8;
+    t5 = C3 * t12;
+    t2 = t2 + t5;
+    t5 = C3 * t13;
+    t13 = C2 * t4;
+    t4 = t5 - t13;
+    t5 = C3 * t8;
+    t13 = C2 * t12;
+    t8 = t5 - t13;
+    t12 = t10 + t6;
+    t5 = t3 + t14;
+    t13 = t9 + t2;
+    t10 = t0 - t7;
+    t6 = t1 + t8;
+    t3 = t11 - t4;
+    t14 = t1 - t8;
+    t1 = t11 + t4;
+    t8 = t9 - t2;
+    t11 = t0 + t7;
+    re[65] = t12;
+    im[65] = t5;
+    re[83] = t13;
+    im[83] = t10;
+    re[11] = t6;
+    im[11] = t3;
+    re[29] = t14;
+    im[29] = t1;
+    re[47] = t8;
+    im[47] = t11;
+    t4 = re[5];
+    t9 = im[5];
+    t2 = re[23];
+    t0 = im[23];
+    t7 = re[41];
+    t12 = im[41];
+    t5 = re[59];
+    t13 = im[59];
+    t10 = re[77];
+    t6 = im[77];
+    t3 = t2 + t10;
+    t14 = t0 + t6;
+    t1 = t7 + t5;
+    t8 = t12 + t13;
+    t11 = t2 - t10;
+    t2 = t0 - t6;
+    t10 = t7 - t5;
+    t0 = t12 - t13;
+    t6 = t3 + t1;
+    t7 = t14 + t8;
+    t5 = t3 - t1;
+    t12 = C0 * t5;
+    t13 = t14 - t8;
+    t3 = C0 * t13;
+    t1 = C1 * t6;
+    t5 = t4 - t1;
+    t14 = C1 * t7;
+    t8 = t9 - t14;
+    t13 = t5 + t12;
+    t1 = t8 + t3;
+    t14 = t5 - t12;
+    t5 = t8 - t3;
+    t12 = C2 * t11;
+    t8 = C3 * t10;
+    t3 = t12 + t8;
+    t12 = C2 * t2;
+    t8 = C3 * t0;
+    t12 = t12 + t8;
+    t8 = C3 * t11;
+    t11 = C2 * t10;
+    t10 = t8 - t11;
+    t8 = C3 * t2;
+    t11 = C2 * t0;
+    t2 = t8 - t11;
+    t0 = t4 + t6;
+    t8 = t9 + t7;
+    t11 = t13 + t12;
+    t4 = t1 - t3;
+    t6 = t14 + t2;
+    t9 = t5 - t10;
+    t7 = t14 - t2;
+    t14 = t5 + t10;
+    t2 = t13 - t12;
+    t5 = t1 + t3;
+    re[5] = t0;
+    im[5] = t8;
+    re[23] = t11;
+    im[23] = t4;
+    re[41] = t6;
+    im[41] = t9;
+    re[59] = t7;
+    im[59] = t14;
+    re[77] = t2;
+    im[77] = t5;
+    t10 = re[35];
+    t13 = im[35];
+    t12 = re[53];
+    t1 = im[53];
+    t3 = re[71];
+    t0 = im[71];
+    t8 = re[89];
+    t11 = im[89];
+    t4 = re[17];
+    t6 = im[17];
+    t9 = t12 + t4;
+    t7 = t1 + t6;
+    t14 = t3 + t8;
+    t2 = t0 + t11;
+    t5 = t12 - t4;
+    t12 = t1 - t6;
+    t4 = t3 - t8;
+    t1 = t0 - t11;
+    t6 = t9 + t14;
+    t3 = t7 + t2;
+    t8 = t9 - t14;
+    t0 = C0 * t8;
+    t11 = t7 - t2;
+    t9 = C0 * t11;
+    t14 = C1 * t6;
+    t8 = t10 - t14;
+    t7 = C1 * t3;
+    t2 = t13 - t7;
+    t11 = t8 + t0;
+    t14 = t2 + t9;
+    t7 = t8 - t0;
+    t8 = t2 - t9;
+    t0 = C2 * t5;
+    t2 = C3 * t4;
+    t9 = t0 + t2;
+    t0 = C2 * t12;
+    t2 = C3 * t1;
+    t0 = t0 + t2;
+    t2 = C3 * t5;
+    t5 = C2 * t4;
+    t4 = t2 - t5;
+    t2 = C3 * t12;
+    t5 = C2 * t1;
+    t12 = t2 - t5;
+    t1 = t10 + t6;
+    t2 = t13 + t3;
+    t5 = t11 + t0;
+    t10 = t14 - t9;
+    t6 = t7 + t12;
+    t13 = t8 - t4;
+    t3 = t7 - t12;
+    t7 = t8 + t4;
+    t12 = t11 - t0;
+    t8 = t14 + t9;
+    re[35] = t1;
+    im[35] = t2;
+    re[53] = t5;
+    im[53] = t10;
+    re[71] = t6;
+    im[71] = t13;
+    re[89] = t3;
+    im[89] = t7;
+    re[17] = t12;
+    im[17] = t8;
+    t4 = re[0];
+    t11 = im[0];
+    t0 = re[45];
+    t14 = im[45];
+    t9 = t4 - t0;
+    t1 = t11 - t14;
+    t2 = t4 + t0;
+    t5 = t11 + t14;
+    t10 = C4 * t2;
+    t6 = C5 * t5;
+    t13 = t10 + t6;
+    t3 = C5 * t2;
+    t7 = (-C4) * t5;
+    t12 = t3 + t7;
+    X[0] = t13;
+    X[179] = t12;
+    t8 = C6 * t9;
+    t4 = C7 * t1;
+    t0 = t8 + t4;
+    t11 = C7 * t9;
+    t14 = (-C6) * t1;
+    t10 = t11 + t14;
+    X[90] = t0;
+    X[89] = t10;
+    t6 = re[48];
+    t2 = im[48];
+    t5 = re[3];
+    t3 = im[3];
+    t7 = t6 - t5;
+    t13 = t2 - t3;
+    t12 = t6 + t5;
+    t8 = t2 + t3;
+    t4 = C8 * t12;
+    t9 = C9 * t8;
+    t1 = t4 + t9;
+    t11 = C9 * t12;
+    t14 = (-C8) * t8;
+    t0 = t11 + t14;
+    X[92] = t1;
+    X[87] = t0;
+    t10 = C10 * t7;
+    t6 = C11 * t13;
+    t5 = t10 + t6;
+    t2 = C11 * t7;
+    t3 = (-C10) * t13;
+    t4 = t2 + t3;
+    X[2] = t5;
+    X[177] = t4;
+    t9 = re[6];
+    t12 = im[6];
+    t8 = re[51];
+    t11 = im[51];
+    t14 = t9 - t8;
+    t1 = t12 - t11;
+    t0 = t9 + t8;
+    t10 = t12 + t11;
+    t6 = C12 * t0;
+    t7 = C13 * t10;
+    t13 = t6 + t7;
+    t2 = C13 * t0;
+    t3 = (-C12) * t10;
+    t5 = t2 + t3;
+    X[4] = t13;
+    X[175] = t5;
+    t4 = C14 * t14;
+    t9 = C15 * t1;
+    t8 = t4 + t9;
+    t12 = C15 * t14;
+    t11 = (-C14) * t1;
+    t6 = t12 + t11;
+    X[94] = t8;
+    X[85] = t6;
+    t7 = re[64];
+    t0 = im[64];
+    t10 = re[19];
+    t2 = im[19];
+    t3 = t7 - t10;
+    t13 = t0 - t2;
+    t5 = t7 + t10;
+    t4 = t0 + t2;
+    t9 = C16 * t5;
+    t14 = C17 * t4;
+    t1 = t9 + t14;
+    t12 = C17 * t5;
+    t11 = (-C16) * t4;
+    t8 = t12 + t11;
+    X[96] = t1;
+    X[83] = t8;
+    t6 = C18 * t3;
+    t7 = C19 * t13;
+    t10 = t6 + t7;
+    t0 = C19 * t3;
+    t2 = (-C18) * t13;
+    t9 = t0 + t2;
+    X[6] = t10;
+    X[173] = t9;
+    t14 = re[22];
+    t5 = im[22];
+    t4 = re[67];
+    t12 = im[67];
+    t11 = t14 - t4;
+    t1 = t5 - t12;
+    t8 = t14 + t4;
+    t6 = t5 + t12;
+    t7 = C20 * t8;
+    t3 = C21 * t6;
+    t13 = t7 + t3;
+    t0 = C21 * t8;
+    t2 = (-C20) * t6;
+    t10 = t0 + t2;
+    X[8] = t13;
+    X[171] = t10;
+    t9 = C22 * t11;
+    t14 = C23 * t1;
+    t4 = t9 + t14;
+    t5 = C23 * t11;
+    t12 = (-C22) * t1;
+    t7 = t5 + t12;
+    X[98] = t4;
+    X[81] = t7;
+    t3 = re[70];
+    t8 = im[70];
+    t6 = re[25];
+    t0 = im[25];
+    t2 = t3 - t6;
+    t13 = t8 - t0;
+    t10 = t3 + t6;
+    t9 = t8 + t0;
+    t14 = C24 * t10;
+    t11 = C25 * t9;
+    t1 = t14 + t11;
+    t5 = C25 * t10;
+    t12 = (-C24) * t9;
+    t4 = t5 + t12;
+    X[100] = t1;
+    X[79] = t4;
+    t7 = C26 * t2;
+    t3 = C27 * t13;
+    t6 = t7 + t3;
+    t8 = C27 * t2;
+    t0 = (-C26) * t13;
+    t14 = t8 + t0;
+    X[10] = t6;
+    X[169] = t14;
+    t11 = re[38];
+    t10 = im[38];
+    t9 = re[83];
+    t5 = im[83];
+    t12 = t11 - t9;
+    t1 = t10 - t5;
+    t4 = t11 + t9;
+    t7 = t10 + t5;
+    t3 = C28 * t4;
+    t2 = C29 * t7;
+    t13 = t3 + t2;
+    t8 = C29 * t4;
+    t0 = (-C28) * t7;
+    t6 = t8 + t0;
+    X[12] = t13;
+    X[167] = t6;
+    t14 = C30 * t12;
+    t11 = C31 * t1;
+    t9 = t14 + t11;
+    t10 = C31 * t12;
+    t5 = (-C30) * t1;
+    t3 = t10 + t5;
+    X[102] = t9;
+    X[77] = t3;
+    t2 = re[86];
+    t4 = im[86];
+    t7 = re[41];
+    t8 = im[41];
+    t0 = t2 - t7;
+    t13 = t4 - t8;
+    t6 = t2 + t7;
+    t14 = t4 + t8;
+    t11 = C32 * t6;
+    t12 = C33 * t14;
+    t1 = t11 + t12;
+    t10 = C33 * t6;
+    t5 = (-C32) * t14;
+    t9 = t10 + t5;
+    X[104] = t1;
+    X[75] = t9;
+    t3 = C34 * t0;
+    t2 = C35 * t13;
+    t7 = t3 + t2;
+    t4 = C35 * t0;
+    t8 = (-C34) * t13;
+    t11 = t4 + t8;
+    X[14] = t7;
+    X[165] = t11;
+    t12 = re[44];
+    t6 = im[44];
+    t14 = re[89];
+    t10 = im[89];
+    t5 = t12 - t14;
+    t1 = t6 - t10;
+    t9 = t12 + t14;
+    t3 = t6 + t10;
+    t2 = C36 * t9;
+    t0 = C37 * t3;
+    t13 = t2 + t0;
+    t4 = C37 * t9;
+    t8 = (-C36) * t3;
+    t7 = t4 + t8;
+    X[16] = t13;
+    X[163] = t7;
+    t11 = C38 * t5;
+    t12 = C39 * t1;
+    t14 = t11 + t12;
+    t6 = C39 * t5;
+    t10 = (-C38) * t1;
+    t2 = t6 + t10;
+    X[106] = t14;
+    X[73] = t2;
+    t0 = re[72];
+    t9 = im[72];
+    t3 = re[27];
+    t4 = im[27];
+    t8 = t0 - t3;
+    t13 = t9 - t4;
+    t7 = t0 + t3;
+    t11 = t9 + t4;
+    t12 = C40 * t7;
+    t5 = C41 * t11;
+    t1 = t12 + t5;
+    t6 = C41 * t7;
+    t10 = (-C40) * t11;
+    t14 = t6 + t10;
+    X[108] = t1;
+    X[71] = t14;
+    t2 = C42 * t8;
+    t0 = C43 * t13;
+    t3 = t2 + t0;
+    t9 = C43 * t8;
+    t4 = (-C42) * t13;
+    t12 = t9 + t4;
+    X[18] = t3;
+    X[161] = t12;
+    t5 = re[30];
+    t7 = im[30];
+    t11 = re[75];
+    t6 = im[75];
+    t10 = t5 - t11;
+    t1 = t7 - t6;
+    t14 = t5 + t11;
+    t2 = t7 + t6;
+    t0 = C44 * t14;
+    t8 = C45 * t2;
+    t13 = t0 + t8;
+    t9 = C45 * t14;
+    t4 = (-C44) * t2;
+    t3 = t9 + t4;
+    X[20] = t13;
+    X[159] = t3;
+    t12 = C46 * t10;
+    t5 = C47 * t1;
+    t11 = t12 + t5;
+    t7 = C47 * t10;
+    t6 = (-C46) * t1;
+    t0 = t7 + t6;
+    X[110] = t11;
+    X[69] = t0;
+    t8 = re[78];
+    t14 = im[78];
+    t2 = re[33];
+    t9 = im[33];
+    t4 = t8 - t2;
+    t13 = t14 - t9;
+    t3 = t8 + t2;
+    t12 = t14 + t9;
+    t5 = C48 * t3;
+    t10 = C49 * t12;
+    t1 = t5 + t10;
+    t7 = C49 * t3;
+    t6 = (-C48) * t12;
+    t11 = t7 + t6;
+    X[112] = t1;
+    X[67] = t11;
+    t0 = C50 * t4;
+    t8 = C51 * t13;
+    t2 = t0 + t8;
+    t14 = C51 * t4;
+    t9 = (-C50) * t13;
+    t5 = t14 + t9;
+    X[22] = t2;
+    X[157] = t5;
+    t10 = re[46];
+    t3 = im[46];
+    t12 = re[1];
+    t7 = im[1];
+    t6 = t10 - t12;
+    t1 = t3 - t7;
+    t11 = t10 + t12;
+    t0 = t3 + t7;
+    t8 = C52 * t11;
+    t4 = C53 * t0;
+    t13 = t8 + t4;
+    t14 = C53 * t11;
+    t9 = (-C52) * t0;
+    t2 = t14 + t9;
+    X[24] = t13;
+    X[155] = t2;
+    t5 = C54 * t6;
+    t10 = C55 * t1;
+    t12 = t5 + t10;
+    t3 = C55 * t6;
+    t7 = (-C54) * t1;
+    t8 = t3 + t7;
+    X[114] = t12;
+    X[65] = t8;
+    t4 = re[4];
+    t11 = im[4];
+    t0 = re[49];
+    t14 = im[49];
+    t9 = t4 - t0;
+    t13 = t11 - t14;
+    t2 = t4 + t0;
+    t5 = t11 + t14;
+    t10 = C56 * t2;
+    t6 = C57 * t5;
+    t1 = t10 + t6;
+    t3 = C57 * t2;
+    t7 = (-C56) * t5;
+    t12 = t3 + t7;
+    X[116] = t1;
+    X[63] = t12;
+    t8 = C58 * t9;
+    t4 = C59 * t13;
+    t0 = t8 + t4;
+    t11 = C59 * t9;
+    t14 = (-C58) * t13;
+    t10 = t11 + t14;
+    X[26] = t0;
+    X[153] = t10;
+    t6 = re[52];
+    t2 = im[52];
+    t5 = re[7];
+    t3 = im[7];
+    t7 = t6 - t5;
+    t1 = t2 - t3;
+    t12 = t6 + t5;
+    t8 = t2 + t3;
+    t4 = C60 * t12;
+    t9 = C61 * t8;
+    t13 = t4 + t9;
+    t11 = C61 * t12;
+    t14 = (-C60) * t8;
+    t0 = t11 + t14;
+    X[28] = t13;
+    X[151] = t0;
+    t10 = C62 * t7;
+    t6 = C63 * t1;
+    t5 = t10 + t6;
+    t2 = C63 * t7;
+    t3 = (-C62) * t1;
+    t4 = t2 + t3;
+    X[118] = t5;
+    X[61] = t4;
+    t9 = re[20];
+    t12 = im[20];
+    t8 = re[65];
+    t11 = im[65];
+    t14 = t9 - t8;
+    t13 = t12 - t11;
+    t0 = t9 + t8;
+    t10 = t12 + t11;
+    t6 = C64 * t0;
+    t7 = C65 * t10;
+    t1 = t6 + t7;
+    t2 = C65 * t0;
+    t3 = (-C64) * t10;
+    t5 = t2 + t3;
+    X[120] = t1;
+    X[59] = t5;
+    t4 = C66 * t14;
+    t9 = C67 * t13;
+    t8 = t4 + t9;
+    t12 = C67 * t14;
+    t11 = (-C66) * t13;
+    t6 = t12 + t11;
+    X[30] = t8;
+    X[149] = t6;
+    t7 = re[68];
+    t0 = im[68];
+    t10 = re[23];
+    t2 = im[23];
+    t3 = t7 - t10;
+    t1 = t0 - t2;
+    t5 = t7 + t10;
+    t4 = t0 + t2;
+    t9 = C68 * t5;
+    t14 = C69 * t4;
+    t13 = t9 + t14;
+    t12 = C69 * t5;
+    t11 = (-C68) * t4;
+    t8 = t12 + t11;
+    X[32] = t13;
+    X[147] = t8;
+    t6 = C70 * t3;
+    t7 = C71 * t1;
+    t10 = t6 + t7;
+    t0 = C71 * t3;
+    t2 = (-C70) * t1;
+    t9 = t0 + t2;
+    X[122] = t10;
+    X[57] = t9;
+    t14 = re[26];
+    t5 = im[26];
+    t4 = re[71];
+    t12 = im[71];
+    t11 = t14 - t4;
+    t13 = t5 - t12;
+    t8 = t14 + t4;
+    t6 = t5 + t12;
+    t7 = C72 * t8;
+    t3 = C73 * t6;
+    t1 = t7 + t3;
+    t0 = C73 * t8;
+    t2 = (-C72) * t6;
+    t10 = t0 + t2;
+    X[124] = t1;
+    X[55] = t10;
+    t9 = C74 * t11;
+    t14 = C75 * t13;
+    t4 = t9 + t14;
+    t5 = C75 * t11;
+    t12 = (-C74) * t13;
+    t7 = t5 + t12;
+    X[34] = t4;
+    X[145] = t7;
+    t3 = re[54];
+    t8 = im[54];
+    t6 = re[9];
+    t0 = im[9];
+    t2 = t3 - t6;
+    t1 = t8 - t0;
+    t10 = t3 + t6;
+    t9 = t8 + t0;
+    t14 = C76 * t10;
+    t11 = C77 * t9;
+    t13 = t14 + t11;
+    t5 = C77 * t10;
+    t12 = (-C76) * t9;
+    t4 = t5 + t12;
+    X[36] = t13;
+    X[143] = t4;
+    t7 = C78 * t2;
+    t3 = C79 * t1;
+    t6 = t7 + t3;
+    t8 = C79 * t2;
+    t0 = (-C78) * t1;
+    t14 = t8 + t0;
+    X[126] = t6;
+    X[53] = t14;
+    t11 = re[12];
+    t10 = im[12];
+    t9 = re[57];
+    t5 = im[57];
+    t12 = t11 - t9;
+    t13 = t10 - t5;
+    t4 = t11 + t9;
+    t7 = t10 + t5;
+    t3 = C80 * t4;
+    t2 = C81 * t7;
+    t1 = t3 + t2;
+    t8 = C81 * t4;
+    t0 = (-C80) * t7;
+    t6 = t8 + t0;
+    X[128] = t1;
+    X[51] = t6;
+    t14 = C82 * t12;
+    t11 = C83 * t13;
+    t9 = t14 + t11;
+    t10 = C83 * t12;
+    t5 = (-C82) * t13;
+    t3 = t10 + t5;
+    X[38] = t9;
+    X[141] = t3;
+    t2 = re[60];
+    t4 = im[60];
+    t7 = re[15];
+    t8 = im[15];
+    t0 = t2 - t7;
+    t1 = t4 - t8;
+    t6 = t2 + t7;
+    t14 = t4 + t8;
+    t11 = C84 * t6;
+    t12 = C85 * t14;
+    t13 = t11 + t12;
+    t10 = C85 * t6;
+    t5 = (-C84) * t14;
+    t9 = t10 + t5;
+    X[40] = t13;
+    X[139] = t9;
+    t3 = C86 * t0;
+    t2 = C87 * t1;
+    t7 = t3 + t2;
+    t4 = C87 * t0;
+    t8 = (-C86) * t1;
+    t11 = t4 + t8;
+    X[130] = t7;
+    X[49] = t11;
+    t12 = re[28];
+    t6 = im[28];
+    t14 = re[73];
+    t10 = im[73];
+    t5 = t12 - t14;
+    t13 = t6 - t10;
+    t9 = t12 + t14;
+    t3 = t6 + t10;
+    t2 = C88 * t9;
+    t0 = C89 * t3;
+    t1 = t2 + t0;
+    t4 = C89 * t9;
+    t8 = (-C88) * t3;
+    t7 = t4 + t8;
+    X[132] = t1;
+    X[47] = t7;
+    t11 = C90 * t5;
+    t12 = C91 * t13;
+    t14 = t11 + t12;
+    t6 = C91 * t5;
+    t10 = (-C90) * t13;
+    t2 = t6 + t10;
+    X[42] = t14;
+    X[137] = t2;
+    t0 = re[76];
+    t9 = im[76];
+    t3 = re[31];
+    t4 = im[31];
+    t8 = t0 - t3;
+    t1 = t9 - t4;
+    t7 = t0 + t3;
+    t11 = t9 + t4;
+    t12 = C92 * t7;
+    t5 = C93 * t11;
+    t13 = t12 + t5;
+    t6 = C93 * t7;
+    t10 = (-C92) * t11;
+    t14 = t6 + t10;
+    X[44] = t13;
+    X[135] = t14;
+    t2 = C94 * t8;
+    t0 = C95 * t1;
+    t3 = t2 + t0;
+    t9 = C95 * t8;
+    t4 = (-C94) * t1;
+    t12 = t9 + t4;
+    X[134] = t3;
+    X[45] = t12;
+    t5 = re[34];
+    t7 = im[34];
+    t11 = re[79];
+    t6 = im[79];
+    t10 = t5 - t11;
+    t13 = t7 - t6;
+    t14 = t5 + t11;
+    t2 = t7 + t6;
+    t0 = C96 * t14;
+    t8 = C97 * t2;
+    t1 = t0 + t8;
+    t9 = C97 * t14;
+    t4 = (-C96) * t2;
+    t3 = t9 + t4;
+    X[136] = t1;
+    X[43] = t3;
+    t12 = C98 * t10;
+    t5 = C99 * t13;
+    t11 = t12 + t5;
+    t7 = C99 * t10;
+    t6 = (-C98) * t13;
+    t0 = t7 + t6;
+    X[46] = t11;
+    X[133] = t0;
+    t8 = re[2];
+    t14 = im[2];
+    t2 = re[47];
+    t9 = im[47];
+    t4 = t8 - t2;
+    t1 = t14 - t9;
+    t3 = t8 + t2;
+    t12 = t14 + t9;
+    t5 = C100 * t3;
+    t10 = C101 * t12;
+    t13 = t5 + t10;
+    t7 = C101 * t3;
+    t6 = (-C100) * t12;
+    t11 = t7 + t6;
+    X[48] = t13;
+    X[131] = t11;
+    t0 = C102 * t4;
+    t8 = C103 * t1;
+    t2 = t0 + t8;
+    t14 = C103 * t4;
+    t9 = (-C102) * t1;
+    t5 = t14 + t9;
+    X[138] = t2;
+    X[41] = t5;
+    t10 = re[50];
+    t3 = im[50];
+    t12 = re[5];
+    t7 = im[5];
+    t6 = t10 - t12;
+    t13 = t3 - t7;
+    t11 = t10 + t12;
+    t0 = t3 + t7;
+    t8 = C104 * t11;
+    t4 = C105 * t0;
+    t1 = t8 + t4;
+    t14 = C105 * t11;
+    t9 = (-C104) * t0;
+    t2 = t14 + t9;
+    X[140] = t1;
+    X[39] = t2;
+    t5 = C106 * t6;
+    t10 = C107 * t13;
+    t12 = t5 + t10;
+    t3 = C107 * t6;
+    t7 = (-C106) * t13;
+    t8 = t3 + t7;
+    X[50] = t12;
+    X[129] = t8;
+    t4 = re[8];
+    t11 = im[8];
+    t0 = re[53];
+    t14 = im[53];
+    t9 = t4 - t0;
+    t1 = t11 - t14;
+    t2 = t4 + t0;
+    t5 = t11 + t14;
+    t10 = C108 * t2;
+    t6 = C109 * t5;
+    t13 = t10 + t6;
+    t3 = C109 * t2;
+    t7 = (-C108) * t5;
+    t12 = t3 + t7;
+    X[52] = t13;
+    X[127] = t12;
+    t8 = C110 * t9;
+    t4 = C111 * t1;
+    t0 = t8 + t4;
+    t11 = C111 * t9;
+    t14 = (-C110) * t1;
+    t10 = t11 + t14;
+    X[142] = t0;
+    X[37] = t10;
+    t6 = re[36];
+    t2 = im[36];
+    t5 = re[81];
+    t3 = im[81];
+    t7 = t6 - t5;
+    t13 = t2 - t3;
+    t12 = t6 + t5;
+    t8 = t2 + t3;
+    t4 = C112 * t12;
+    t9 = C113 * t8;
+    t1 = t4 + t9;
+    t11 = C113 * t12;
+    t14 = (-C112) * t8;
+    t0 = t11 + t14;
+    X[144] = t1;
+    X[35] = t0;
+    t10 = C114 * t7;
+    t6 = C115 * t13;
+    t5 = t10 + t6;
+    t2 = C115 * t7;
+    t3 = (-C114) * t13;
+    t4 = t2 + t3;
+    X[54] = t5;
+    X[125] = t4;
+    t9 = re[84];
+    t12 = im[84];
+    t8 = re[39];
+    t11 = im[39];
+    t14 = t9 - t8;
+    t1 = t12 - t11;
+    t0 = t9 + t8;
+    t10 = t12 + t11;
+    t6 = C116 * t0;
+    t7 = C117 * t10;
+    t13 = t6 + t7;
+    t2 = C117 * t0;
+    t3 = (-C116) * t10;
+    t5 = t2 + t3;
+    X[56] = t13;
+    X[123] = t5;
+    t4 = C118 * t14;
+    t9 = C119 * t1;
+    t8 = t4 + t9;
+    t12 = C119 * t14;
+    t11 = (-C118) * t1;
+    t6 = t12 + t11;
+    X[146] = t8;
+    X[33] = t6;
+    t7 = re[42];
+    t0 = im[42];
+    t10 = re[87];
+    t2 = im[87];
+    t3 = t7 - t10;
+    t13 = t0 - t2;
+    t5 = t7 + t10;
+    t4 = t0 + t2;
+    t9 = C120 * t5;
+    t14 = C121 * t4;
+    t1 = t9 + t14;
+    t12 = C121 * t5;
+    t11 = (-C120) * t4;
+    t8 = t12 + t11;
+    X[148] = t1;
+    X[31] = t8;
+    t6 = C122 * t3;
+    t7 = C123 * t13;
+    t10 = t6 + t7;
+    t0 = C123 * t3;
+    t2 = (-C122) * t13;
+    t9 = t0 + t2;
+    X[58] = t10;
+    X[121] = t9;
+    t14 = re[10];
+    t5 = im[10];
+    t4 = re[55];
+    t12 = im[55];
+    t11 = t14 - t4;
+    t1 = t5 - t12;
+    t8 = t14 + t4;
+    t6 = t5 + t12;
+    t7 = C124 * t8;
+    t3 = C125 * t6;
+    t13 = t7 + t3;
+    t0 = C125 * t8;
+    t2 = (-C124) * t6;
+    t10 = t0 + t2;
+    X[60] = t13;
+    X[119] = t10;
+    t9 = C126 * t11;
+    t14 = C127 * t1;
+    t4 = t9 + t14;
+    t5 = C127 * t11;
+    t12 = (-C126) * t1;
+    t7 = t5 + t12;
+    X[150] = t4;
+    X[29] = t7;
+    t3 = re[58];
+    t8 = im[58];
+    t6 = re[13];
+    t0 = im[13];
+    t2 = t3 - t6;
+    t13 = t8 - t0;
+    t10 = t3 + t6;
+    t9 = t8 + t0;
+    t14 = C128 * t10;
+    t11 = C129 * t9;
+    t1 = t14 + t11;
+    t5 = C129 * t10;
+    t12 = (-C128) * t9;
+    t4 = t5 + t12;
+    X[152] = t1;
+    X[27] = t4;
+    t7 = C130 * t2;
+    t3 = C131 * t13;
+    t6 = t7 + t3;
+    t8 = C131 * t2;
+    t0 = (-C130) * t13;
+    t14 = t8 + t0;
+    X[62] = t6;
+    X[117] = t14;
+    t11 = re[16];
+    t10 = im[16];
+    t9 = re[61];
+    t5 = im[61];
+    t12 = t11 - t9;
+    t1 = t10 - t5;
+    t4 = t11 + t9;
+    t7 = t10 + t5;
+    t3 = C132 * t4;
+    t2 = C133 * t7;
+    t13 = t3 + t2;
+    t8 = C133 * t4;
+    t0 = (-C132) * t7;
+    t6 = t8 + t0;
+    X[64] = t13;
+    X[115] = t6;
+    t14 = C134 * t12;
+    t11 = C135 * t1;
+    t9 = t14 + t11;
+    t10 = C135 * t12;
+    t5 = (-C134) * t1;
+    t3 = t10 + t5;
+    X[154] = t9;
+    X[25] = t3;
+    t2 = re[74];
+    t4 = im[74];
+    t7 = re[29];
+    t8 = im[29];
+    t0 = t2 - t7;
+    t13 = t4 - t8;
+    t6 = t2 + t7;
+    t14 = t4 + t8;
+    t11 = C136 * t6;
+    t12 = C137 * t14;
+    t1 = t11 + t12;
+    t10 = C137 * t6;
+    t5 = (-C136) * t14;
+    t9 = t10 + t5;
+    X[156] = t1;
+    X[23] = t9;
+    t3 = C138 * t0;
+    t2 = C139 * t13;
+    t7 = t3 + t2;
+    t4 = C139 * t0;
+    t8 = (-C138) * t13;
+    t11 = t4 + t8;
+    X[66] = t7;
+    X[113] = t11;
+    t12 = re[32];
+    t6 = im[32];
+    t14 = re[77];
+    t10 = im[77];
+    t5 = t12 - t14;
+    t1 = t6 - t10;
+    t9 = t12 + t14;
+    t3 = t6 + t10;
+    t2 = C140 * t9;
+    t0 = C141 * t3;
+    t13 = t2 + t0;
+    t4 = C141 * t9;
+    t8 = (-C140) * t3;
+    t7 = t4 + t8;
+    X[68] = t13;
+    X[111] = t7;
+    t11 = C142 * t5;
+    t12 = C143 * t1;
+    t14 = t11 + t12;
+    t6 = C143 * t5;
+    t10 = (-C142) * t1;
+    t2 = t6 + t10;
+    X[158] = t14;
+    X[21] = t2;
+    t0 = re[80];
+    t9 = im[80];
+    t3 = re[35];
+    t4 = im[35];
+    t8 = t0 - t3;
+    t13 = t9 - t4;
+    t7 = t0 + t3;
+    t11 = t9 + t4;
+    t12 = C144 * t7;
+    t5 = C145 * t11;
+    t1 = t12 + t5;
+    t6 = C145 * t7;
+    t10 = (-C144) * t11;
+    t14 = t6 + t10;
+    X[160] = t1;
+    X[19] = t14;
+    t2 = C146 * t8;
+    t0 = C147 * t13;
+    t3 = t2 + t0;
+    t9 = C147 * t8;
+    t4 = (-C146) * t13;
+    t12 = t9 + t4;
+    X[70] = t3;
+    X[109] = t12;
+    t5 = re[18];
+    t7 = im[18];
+    t11 = re[63];
+    t6 = im[63];
+    t10 = t5 - t11;
+    t1 = t7 - t6;
+    t14 = t5 + t11;
+    t2 = t7 + t6;
+    t0 = C148 * t14;
+    t8 = C149 * t2;
+    t13 = t0 + t8;
+    t9 = C149 * t14;
+    t4 = (-C148) * t2;
+    t3 = t9 + t4;
+    X[72] = t13;
+    X[107] = t3;
+    t12 = C150 * t10;
+    t5 = C151 * t1;
+    t11 = t12 + t5;
+    t7 = C151 * t10;
+    t6 = (-C150) * t1;
+    t0 = t7 + t6;
+    X[162] = t11;
+    X[17] = t0;
+    t8 = re[66];
+    t14 = im[66];
+    t2 = re[21];
+    t9 = im[21];
+    t4 = t8 - t2;
+    t13 = t14 - t9;
+    t3 = t8 + t2;
+    t12 = t14 + t9;
+    t5 = C152 * t3;
+    t10 = C153 * t12;
+    t1 = t5 + t10;
+    t7 = C153 * t3;
+    t6 = (-C152) * t12;
+    t11 = t7 + t6;
+    X[164] = t1;
+    X[15] = t11;
+    t0 = C154 * t4;
+    t8 = C155 * t13;
+    t2 = t0 + t8;
+    t14 = C155 * t4;
+    t9 = (-C154) * t13;
+    t5 = t14 + t9;
+    X[74] = t2;
+    X[105] = t5;
+    t10 = re[24];
+    t3 = im[24];
+    t12 = re[69];
+    t7 = im[69];
+    t6 = t10 - t12;
+    t1 = t3 - t7;
+    t11 = t10 + t12;
+    t0 = t3 + t7;
+    t8 = C156 * t11;
+    t4 = C157 * t0;
+    t13 = t8 + t4;
+    t14 = C157 * t11;
+    t9 = (-C156) * t0;
+    t2 = t14 + t9;
+    X[76] = t13;
+    X[103] = t2;
+    t5 = C158 * t6;
+    t10 = C159 * t1;
+    t12 = t5 + t10;
+    t3 = C159 * t6;
+    t7 = (-C158) * t1;
+    t8 = t3 + t7;
+    X[166] = t12;
+    X[13] = t8;
+    t4 = re[82];
+    t11 = im[82];
+    t0 = re[37];
+    t14 = im[37];
+    t9 = t4 - t0;
+    t13 = t11 - t14;
+    t2 = t4 + t0;
+    t5 = t11 + t14;
+    t10 = C160 * t2;
+    t6 = C161 * t5;
+    t1 = t10 + t6;
+    t3 = C161 * t2;
+    t7 = (-C160) * t5;
+    t12 = t3 + t7;
+    X[168] = t1;
+    X[11] = t12;
+    t8 = C162 * t9;
+    t4 = C163 * t13;
+    t0 = t8 + t4;
+    t11 = C163 * t9;
+    t14 = (-C162) * t13;
+    t10 = t11 + t14;
+    X[78] = t0;
+    X[101] = t10;
+    t6 = re[40];
+    t2 = im[40];
+    t5 = re[85];
+    t3 = im[85];
+    t7 = t6 - t5;
+    t1 = t2 - t3;
+    t12 = t6 + t5;
+    t8 = t2 + t3;
+    t4 = C164 * t12;
+    t9 = C165 * t8;
+    t13 = t4 + t9;
+    t11 = C165 * t12;
+    t14 = (-C164) * t8;
+    t0 = t11 + t14;
+    X[80] = t13;
+    X[99] = t0;
+    t10 = C166 * t7;
+    t6 = C167 * t1;
+    t5 = t10 + t6;
+    t2 = C167 * t7;
+    t3 = (-C166) * t1;
+    t4 = t2 + t3;
+    X[170] = t5;
+    X[9] = t4;
+    t9 = re[88];
+    t12 = im[88];
+    t8 = re[43];
+    t11 = im[43];
+    t14 = t9 - t8;
+    t13 = t12 - t11;
+    t0 = t9 + t8;
+    t10 = t12 + t11;
+    t6 = C168 * t0;
+    t7 = C169 * t10;
+    t1 = t6 + t7;
+    t2 = C169 * t0;
+    t3 = (-C168) * t10;
+    t5 = t2 + t3;
+    X[172] = t1;
+    X[7] = t5;
+    t4 = C170 * t14;
+    t9 = C171 * t13;
+    t8 = t4 + t9;
+    t12 = C171 * t14;
+    t11 = (-C170) * t13;
+    t6 = t12 + t11;
+    X[82] = t8;
+    X[97] = t6;
+    t7 = re[56];
+    t0 = im[56];
+    t10 = re[11];
+    t2 = im[11];
+    t3 = t7 - t10;
+    t1 = t0 - t2;
+    t5 = t7 + t10;
+    t4 = t0 + t2;
+    t9 = C172 * t5;
+    t14 = C173 * t4;
+    t13 = t9 + t14;
+    t12 = C173 * t5;
+    t11 = (-C172) * t4;
+    t8 = t12 + t11;
+    X[84] = t13;
+    X[95] = t8;
+    t6 = C174 * t3;
+    t7 = C175 * t1;
+    t10 = t6 + t7;
+    t0 = C175 * t3;
+    t2 = (-C174) * t1;
+    t9 = t0 + t2;
+    X[174] = t10;
+    X[5] = t9;
+    t14 = re[14];
+    t5 = im[14];
+    t4 = re[59];
+    t12 = im[59];
+    t11 = t14 - t4;
+    t13 = t5 - t12;
+    t8 = t14 + t4;
+    t6 = t5 + t12;
+    t7 = C176 * t8;
+    t3 = C177 * t6;
+    t1 = t7 + t3;
+    t0 = C177 * t8;
+    t2 = (-C176) * t6;
+    t10 = t0 + t2;
+    X[176] = t1;
+    X[3] = t10;
+    t9 = C178 * t11;
+    t14 = C179 * t13;
+    t4 = t9 + t14;
+    t5 = C179 * t11;
+    t12 = (-C178) * t13;
+    t7 = t5 + t12;
+    X[86] = t4;
+    X[93] = t7;
+    t3 = re[62];
+    t8 = im[62];
+    t6 = re[17];
+    t0 = im[17];
+    t2 = t3 - t6;
+    t1 = t8 - t0;
+    t10 = t3 + t6;
+    t9 = t8 + t0;
+    t14 = C180 * t10;
+    t11 = C181 * t9;
+    t13 = t14 + t11;
+    t5 = C181 * t10;
+    t12 = (-C180) * t9;
+    t4 = t5 + t12;
+    X[88] = t13;
+    X[91] = t4;
+    t7 = C182 * t2;
+    t3 = C183 * t1;
+    t6 = t7 + t3;
+    t8 = C183 * t2;
+    t0 = (-C182) * t1;
+    t14 = t8 + t0;
+    X[178] = t6;
+    X[1] = t14;
+}
+
+/**
+ *  Part 1 of ApplyWindowedIMDCT_W75_180().
+ * 
+ *  @param {Number[]} X 
+ *    - The input block (180 points).
+ *  @param {Number[]} y 
+ *    - The array that would contain the output block (360 points).
+ *  @param {Number[]} re 
+ *    - The scratch buffer (real part, 90 points).
+ *  @param {Number[]} im 
+ *    - The scratch buffer (imaginary part, 90 points).
+ */
+function ApplyWindowedIMDCT_W75_180_Part1(X, y, re, im) {
+    let t0, t1, t10, t11, t12, t13, t14, t2, t3, t4, t5, t6, t7, t8, t9;
+    const C0 = 0.8660254037844387;
+    const C1 = 0.49999999999999994;
+    const C2 = 0.5;
+    const C3 = 0.8660254037844386;
+    const C4 = 0.984807753012208;
+    const C5 = 0.17364817766693033;
+    const C6 = 0.766044443118978;
+    const C7 = 0.6427876096865393;
+    const C8 = 0.3420201433256687;
+    const C9 = 0.9396926207859084;
+    const C10 = 1.4088320528055172;
+    const C11 = 0.12325683343243876;
+    const C12 = 1.1584559306791384;
+    const C13 = 0.8111595753452777;
+    const C14 = 0.5976724774602398;
+    const C15 = 1.281712764111577;
+    const C16 = 0.9510565162951535;
+    const C17 = 0.3090169943749474;
+    const C18 = 0.6691306063588582;
+    const C19 = 0.7431448254773942;
+    const C20 = 0.20791169081775931;
+    const C21 = 0.9781476007338057;
+    const C22 = 0.882947592858927;
+    const C23 = 0.4694715627858908;
+    const C24 = 0.5299192642332049;
+    const C25 = 0.848048096156426;
+    const C26 = 0.03489949670250097;
+    const C27 = 0.9993908270190958;
+    const C28 = 0.7880107536067219;
+    const C29 = 0.6156614753256583;
+    const C30 = 0.374606593415912;
+    const C31 = 0.9271838545667874;
+    const C32 = 0.9902680687415704;
+    const C33 = 0.13917310096006544;
+    const C34 = 0.8090169943749475;
+    const C35 = 0.5877852522924731;
+    const C36 = 0.40673664307580015;
+    const C37 = 0.9135454576426009;
+    const C38 = 0.9945218953682733;
+    const C39 = 0.10452846326765346;
+    const C40 = 0.6946583704589973;
+    const C41 = 0.7193398003386512;
+    const C42 = 0.24192189559966773;
+    const C43 = 0.9702957262759965;
+    const C44 = 0.9612616959383189;
+    const C45 = 0.27563735581699916;
+    const C46 = 0.5591929034707468;
+    const C47 = 0.8290375725550417;
+    const C48 = 0.0697564737441253;
+    const C49 = 0.9975640502598242;
+    const C50 = 0.898794046299167;
+    const C51 = 0.4383711467890774;
+    const C52 = 0.5590169943749475;
+    const C53 = 0.25;
+    t0 = X[0];
+    t1 = X[179];
+    t2 = X[60];
+    t3 = X[119];
+    t4 = C0 * t2;
+    t5 = C1 * t3;
+    t4 = t4 + t5;
+    t5 = (-C1) * t2;
+    t2 = C0 * t3;
+    t3 = t5 + t2;
+    t5 = X[120];
+    t2 = X[59];
+    t6 = C1 * t5;
+    t7 = C0 * t2;
+    t6 = t6 + t7;
+    t7 = (-C0) * t5;
+    t5 = C1 * t2;
+    t2 = t7 + t5;
+    t7 = t4 + t6;
+    t5 = t3 + t2;
+    t8 = C2 * t7;
+    t8 = t0 - t8;
+    t9 = C2 * t5;
+    t9 = t1 - t9;
+    t4 = t4 - t6;
+    t6 = C3 * t4;
+    t4 = t3 - t2;
+    t3 = C3 * t4;
+    t2 = t0 + t7;
+    t4 = t1 + t5;
+    t0 = t8 + t3;
+    t7 = t9 - t6;
+    t1 = t8 - t3;
+    t5 = t9 + t6;
+    re[0] = t2;
+    im[0] = t4;
+    re[30] = t0;
+    im[30] = t7;
+    re[60] = t1;
+    im[60] = t5;
+    t8 = X[20];
+    t3 = X[159];
+    t9 = C4 * t8;
+    t6 = C5 * t3;
+    t2 = t9 + t6;
+    t4 = (-C5) * t8;
+    t0 = C4 * t3;
+    t7 = t4 + t0;
+    t1 = X[80];
+    t5 = X[99];
+    t9 = C6 * t1;
+    t6 = C7 * t5;
+    t8 = t9 + t6;
+    t3 = (-C7) * t1;
+    t4 = C6 * t5;
+    t0 = t3 + t4;
+    t9 = X[140];
+    t6 = X[39];
+    t1 = C8 * t9;
+    t5 = C9 * t6;
+    t3 = t1 + t5;
+    t4 = (-C9) * t9;
+    t1 = C8 * t6;
+    t5 = t4 + t1;
+    t9 = t8 + t3;
+    t6 = t0 + t5;
+    t4 = C2 * t9;
+    t1 = t2 - t4;
+    t4 = C2 * t6;
+    t4 = t7 - t4;
+    t8 = t8 - t3;
+    t3 = C3 * t8;
+    t8 = t0 - t5;
+    t0 = C3 * t8;
+    t5 = t2 + t9;
+    t8 = t7 + t6;
+    t2 = t1 + t0;
+    t9 = t4 - t3;
+    t7 = t1 - t0;
+    t6 = t4 + t3;
+    t1 = t2 + t9;
+    t0 = C6 * t1;
+    t4 = t2 * (-C10);
+    t3 = t9 * C11;
+    t1 = t0 - t3;
+    t2 = t0 + t4;
+    t9 = t7 + t6;
+    t3 = C5 * t9;
+    t0 = t7 * (-C12);
+    t4 = t6 * (-C13);
+    t9 = t3 - t4;
+    t7 = t3 + t0;
+    re[10] = t5;
+    im[10] = t8;
+    re[40] = t1;
+    im[40] = t2;
+    re[70] = t9;
+    im[70] = t7;
+    t6 = X[40];
+    t4 = X[139];
+    t3 = C9 * t6;
+    t0 = C8 * t4;
+    t5 = t3 + t0;
+    t8 = (-C8) * t6;
+    t1 = C9 * t4;
+    t2 = t8 + t1;
+    t9 = X[100];
+    t7 = X[79];
+    t3 = C7 * t9;
+    t0 = C6 * t7;
+    t6 = t3 + t0;
+    t4 = (-C6) * t9;
+    t8 = C7 * t7;
+    t1 = t4 + t8;
+    t3 = X[160];
+    t0 = X[19];
+    t9 = C5 * t3;
+    t7 = C4 * t0;
+    t4 = t9 + t7;
+    t8 = (-C4) * t3;
+    t9 = C5 * t0;
+    t7 = t8 + t9;
+    t3 = t6 + t4;
+    t0 = t1 + t7;
+    t8 = C2 * t3;
+    t9 = t5 - t8;
+    t8 = C2 * t0;
+    t8 = t2 - t8;
+    t6 = t6 - t4;
+    t4 = C3 * t6;
+    t6 = t1 - t7;
+    t1 = C3 * t6;
+    t7 = t5 + t3;
+    t6 = t2 + t0;
+    t5 = t9 + t1;
+    t3 = t8 - t4;
+    t2 = t9 - t1;
+    t0 = t8 + t4;
+    t9 = t5 + t3;
+    t1 = C5 * t9;
+    t8 = t5 * (-C12);
+    t4 = t3 * (-C13);
+    t9 = t1 - t4;
+    t5 = t1 + t8;
+    t3 = t2 + t0;
+    t4 = (-C9) * t3;
+    t1 = t2 * C14;
+    t8 = t0 * (-C15);
+    t3 = t4 - t8;
+    t2 = t4 + t1;
+    re[20] = t7;
+    im[20] = t6;
+    re[50] = t9;
+    im[50] = t5;
+    re[80] = t3;
+    im[80] = t2;
+    t0 = re[0];
+    t8 = im[0];
+    t4 = re[10];
+    t1 = im[10];
+    t7 = re[20];
+    t6 = im[20];
+    t9 = t4 + t7;
+    t5 = t1 + t6;
+    t3 = C2 * t9;
+    t2 = t0 - t3;
+    t3 = C2 * t5;
+    t3 = t8 - t3;
+    t4 = t4 - t7;
+    t7 = C3 * t4;
+    t4 = t1 - t6;
+    t1 = C3 * t4;
+    t6 = t0 + t9;
+    t4 = t8 + t5;
+    t0 = t2 + t1;
+    t9 = t3 - t7;
+    t8 = t2 - t1;
+    t5 = t3 + t7;
+    re[0] = t6;
+    im[0] = t4;
+    re[10] = t0;
+    im[10] = t9;
+    re[20] = t8;
+    im[20] = t5;
+    t2 = re[30];
+    t1 = im[30];
+    t3 = re[40];
+    t7 = im[40];
+    t6 = re[50];
+    t4 = im[50];
+    t0 = t3 + t6;
+    t9 = t7 + t4;
+    t8 = C2 * t0;
+    t5 = t2 - t8;
+    t8 = C2 * t9;
+    t8 = t1 - t8;
+    t3 = t3 - t6;
+    t6 = C3 * t3;
+    t3 = t7 - t4;
+    t7 = C3 * t3;
+    t4 = t2 + t0;
+    t3 = t1 + t9;
+    t2 = t5 + t7;
+    t0 = t8 - t6;
+    t1 = t5 - t7;
+    t9 = t8 + t6;
+    re[30] = t4;
+    im[30] = t3;
+    re[40] = t2;
+    im[40] = t0;
+    re[50] = t1;
+    im[50] = t9;
+    t5 = re[60];
+    t7 = im[60];
+    t8 = re[70];
+    t6 = im[70];
+    t4 = re[80];
+    t3 = im[80];
+    t2 = t8 + t4;
+    t0 = t6 + t3;
+    t1 = C2 * t2;
+    t9 = t5 - t1;
+    t1 = C2 * t0;
+    t1 = t7 - t1;
+    t8 = t8 - t4;
+    t4 = C3 * t8;
+    t8 = t6 - t3;
+    t6 = C3 * t8;
+    t3 = t5 + t2;
+    t8 = t7 + t0;
+    t5 = t9 + t6;
+    t2 = t1 - t4;
+    t7 = t9 - t6;
+    t0 = t1 + t4;
+    re[60] = t3;
+    im[60] = t8;
+    re[70] = t5;
+    im[70] = t2;
+    re[80] = t7;
+    im[80] = t0;
+    t9 = X[36];
+    t6 = X[143];
+    t1 = C16 * t9;
+    t4 = C17 * t6;
+    t3 = t1 + t4;
+    t8 = (-C17) * t9;
+    t5 = C16 * t6;
+    t2 = t8 + t5;
+    t7 = X[96];
+    t0 = X[83];
+    t1 = C18 * t7;
+    t4 = C19 * t0;
+    t9 = t1 + t4;
+    t6 = (-C19) * t7;
+    t8 = C18 * t0;
+    t5 = t6 + t8;
+    t1 = X[156];
+    t4 = X[23];
+    t7 = C20 * t1;
+    t0 = C21 * t4;
+    t6 = t7 + t0;
+    t8 = (-C21) * t1;
+    t7 = C20 * t4;
+    t0 = t8 + t7;
+    t1 = t9 + t6;
+    t4 = t5 + t0;
+    t8 = C2 * t1;
+    t7 = t3 - t8;
+    t8 = C2 * t4;
+    t8 = t2 - t8;
+    t9 = t9 - t6;
+    t6 = C3 * t9;
+    t9 = t5 - t0;
+    t5 = C3 * t9;
+    t0 = t3 + t1;
+    t9 = t2 + t4;
+    t3 = t7 + t5;
+    t1 = t8 - t6;
+    t2 = t7 - t5;
+    t4 = t8 + t6;
+    re[18] = t0;
+    im[18] = t9;
+    re[48] = t3;
+    im[48] = t1;
+    re[78] = t2;
+    im[78] = t4;
+    t7 = X[56];
+    t5 = X[123];
+    t8 = C22 * t7;
+    t6 = C23 * t5;
+    t0 = t8 + t6;
+    t9 = (-C23) * t7;
+    t3 = C22 * t5;
+    t1 = t9 + t3;
+    t2 = X[116];
+    t4 = X[63];
+    t8 = C24 * t2;
+    t6 = C25 * t4;
+    t7 = t8 + t6;
+    t5 = (-C25) * t2;
+    t9 = C24 * t4;
+    t3 = t5 + t9;
+    t8 = X[176];
+    t6 = X[3];
+    t2 = C26 * t8;
+    t4 = C27 * t6;
+    t5 = t2 + t4;
+    t9 = (-C27) * t8;
+    t2 = C26 * t6;
+    t4 = t9 + t2;
+    t8 = t7 + t5;
+    t6 = t3 + t4;
+    t9 = C2 * t8;
+    t2 = t0 - t9;
+    t9 = C2 * t6;
+    t9 = t1 - t9;
+    t7 = t7 - t5;
+    t5 = C3 * t7;
+    t7 = t3 - t4;
+    t3 = C3 * t7;
+    t4 = t0 + t8;
+    t7 = t1 + t6;
+    t0 = t2 + t3;
+    t8 = t9 - t5;
+    t1 = t2 - t3;
+    t6 = t9 + t5;
+    t2 = t0 + t8;
+    t3 = C6 * t2;
+    t9 = t0 * (-C10);
+    t5 = t8 * C11;
+    t2 = t3 - t5;
+    t0 = t3 + t9;
+    t8 = t1 + t6;
+    t5 = C5 * t8;
+    t3 = t1 * (-C12);
+    t9 = t6 * (-C13);
+    t8 = t5 - t9;
+    t1 = t5 + t3;
+    re[28] = t4;
+    im[28] = t7;
+    re[58] = t2;
+    im[58] = t0;
+    re[88] = t8;
+    im[88] = t1;
+    t6 = X[76];
+    t9 = X[103];
+    t5 = C28 * t6;
+    t3 = C29 * t9;
+    t4 = t5 + t3;
+    t7 = (-C29) * t6;
+    t2 = C28 * t9;
+    t0 = t7 + t2;
+    t8 = X[136];
+    t1 = X[43];
+    t5 = C30 * t8;
+    t3 = C31 * t1;
+    t6 = t5 + t3;
+    t9 = (-C31) * t8;
+    t7 = C30 * t1;
+    t2 = t9 + t7;
+    t5 = X[16];
+    t3 = X[163];
+    t8 = C32 * t5;
+    t1 = C33 * t3;
+    t9 = t8 + t1;
+    t7 = (-C33) * t5;
+    t8 = C32 * t3;
+    t1 = t7 + t8;
+    t5 = t6 + t9;
+    t3 = t2 + t1;
+    t7 = C2 * t5;
+    t8 = t4 - t7;
+    t7 = C2 * t3;
+    t7 = t0 - t7;
+    t6 = t6 - t9;
+    t9 = C3 * t6;
+    t6 = t2 - t1;
+    t2 = C3 * t6;
+    t1 = t4 + t5;
+    t6 = t0 + t3;
+    t4 = t8 + t2;
+    t5 = t7 - t9;
+    t0 = t8 - t2;
+    t3 = t7 + t9;
+    t8 = t4 + t5;
+    t2 = C5 * t8;
+    t7 = t4 * (-C12);
+    t9 = t5 * (-C13);
+    t8 = t2 - t9;
+    t4 = t2 + t7;
+    t5 = t0 + t3;
+    t9 = (-C9) * t5;
+    t2 = t0 * C14;
+    t7 = t3 * (-C15);
+    t5 = t9 - t7;
+    t0 = t9 + t2;
+    re[38] = t1;
+    im[38] = t6;
+    re[68] = t8;
+    im[68] = t4;
+    re[8] = t5;
+    im[8] = t0;
+    t3 = re[18];
+    t7 = im[18];
+    t9 = re[28];
+    t2 = im[28];
+    t1 = re[38];
+    t6 = im[38];
+    t8 = t9 + t1;
+    t4 = t2 + t6;
+    t5 = C2 * t8;
+    t0 = t3 - t5;
+    t5 = C2 * t4;
+    t5 = t7 - t5;
+    t9 = t9 - t1;
+    t1 = C3 * t9;
+    t9 = t2 - t6;
+    t2 = C3 * t9;
+    t6 = t3 + t8;
+    t9 = t7 + t4;
+    t3 = t0 + t2;
+    t8 = t5 - t1;
+    t7 = t0 - t2;
+    t4 = t5 + t1;
+    re[18] = t6;
+    im[18] = t9;
+    re[28] = t3;
+    im[28] = t8;
+    re[38] = t7;
+    im[38] = t4;
+    t0 = re[48];
+    t2 = im[48];
+    t5 = re[58];
+    t1 = im[58];
+    t6 = re[68];
+    t9 = im[68];
+    t3 = t5 + t6;
+    t8 = t1 + t9;
+    t7 = C2 * t3;
+    t4 = t0 - t7;
+    t7 = C2 * t8;
+    t7 = t2 - t7;
+    t5 = t5 - t6;
+    t6 = C3 * t5;
+    t5 = t1 - t9;
+    t1 = C3 * t5;
+    t9 = t0 + t3;
+    t5 = t2 + t8;
+    t0 = t4 + t1;
+    t3 = t7 - t6;
+    t2 = t4 - t1;
+    t8 = t7 + t6;
+    re[48] = t9;
+    im[48] = t5;
+    re[58] = t0;
+    im[58] = t3;
+    re[68] = t2;
+    im[68] = t8;
+    t4 = re[78];
+    t1 = im[78];
+    t7 = re[88];
+    t6 = im[88];
+    t9 = re[8];
+    t5 = im[8];
+    t0 = t7 + t9;
+    t3 = t6 + t5;
+    t2 = C2 * t0;
+    t8 = t4 - t2;
+    t2 = C2 * t3;
+    t2 = t1 - t2;
+    t7 = t7 - t9;
+    t9 = C3 * t7;
+    t7 = t6 - t5;
+    t6 = C3 * t7;
+    t5 = t4 + t0;
+    t7 = t1 + t3;
+    t4 = t8 + t6;
+    t0 = t2 - t9;
+    t1 = t8 - t6;
+    t3 = t2 + t9;
+    re[78] = t5;
+    im[78] = t7;
+    re[88] = t4;
+    im[88] = t0;
+    re[8] = t1;
+    im[8] = t3;
+    t8 = X[72];
+    t6 = X[107];
+    t2 = C34 * t8;
+    t9 = C35 * t6;
+    t5 = t2 + t9;
+    t7 = (-C35) * t8;
+    t4 = C34 * t6;
+    t0 = t7 + t4;
+    t1 = X[132];
+    t3 = X[47];
+    t2 = C36 * t1;
+    t9 = C37 * t3;
+    t8 = t2 + t9;
+    t6 = (-C37) * t1;
+    t7 = C36 * t3;
+    t4 = t6 + t7;
+    t2 = X[12];
+    t9 = X[167];
+    t1 = C38 * t2;
+    t3 = C39 * t9;
+    t6 = t1 + t3;
+    t7 = (-C39) * t2;
+    t1 = C38 * t9;
+    t3 = t7 + t1;
+    t2 = t8 + t6;
+    t9 = t4 + t3;
+    t7 = C2 * t2;
+    t1 = t5 - t7;
+    t7 = C2 * t9;
+    t7 = t0 - t7;
+    t8 = t8 - t6;
+    t6 = C3 * t8;
+    t8 = t4 - t3;
+    t4 = C3 * t8;
+    t3 = t5 + t2;
+    t8 = t0 + t9;
+    t5 = t1 + t4;
+    t2 = t7 - t6;
+    t0 = t1 - t4;
+    t9 = t7 + t6;
+    re[36] = t3;
+    im[36] = t8;
+    re[66] = t5;
+    im[66] = t2;
+    re[6] = t0;
+    im[6] = t9;
+    t1 = X[92];
+    t4 = X[87];
+    t7 = C40 * t1;
+    t6 = C41 * t4;
+    t3 = t7 + t6;
+    t8 = (-C41) * t1;
+    t5 = C40 * t4;
+    t2 = t8 + t5;
+    t0 = X[152];
+    t9 = X[27];
+    t7 = C42 * t0;
+    t6 = C43 * t9;
+    t1 = t7 + t6;
+    t4 = (-C43) * t0;
+    t8 = C42 * t9;
+    t5 = t4 + t8;
+    t7 = X[32];
+    t6 = X[147];
+    t0 = C44 * t7;
+    t9 = C45 * t6;
+    t4 = t0 + t9;
+    t8 = (-C45) * t7;
+    t0 = C44 * t6;
+    t9 = t8 + t0;
+    t7 = t1 + t4;
+    t6 = t5 + t9;
+    t8 = C2 * t7;
+    t0 = t3 - t8;
+    t8 = C2 * t6;
+    t8 = t2 - t8;
+    t1 = t1 - t4;
+    t4 = C3 * t1;
+    t1 = t5 - t9;
+    t5 = C3 * t1;
+    t9 = t3 + t7;
+    t1 = t2 + t6;
+    t3 = t0 + t5;
+    t7 = t8 - t4;
+    t2 = t0 - t5;
+    t6 = t8 + t4;
+    t0 = t3 + t7;
+    t5 = C6 * t0;
+    t8 = t3 * (-C10);
+    t4 = t7 * C11;
+    t0 = t5 - t4;
+    t3 = t5 + t8;
+    t7 = t2 + t6;
+    t4 = C5 * t7;
+    t5 = t2 * (-C12);
+    t8 = t6 * (-C13);
+    t7 = t4 - t8;
+    t2 = t4 + t5;
+    re[46] = t9;
+    im[46] = t1;
+    re[76] = t0;
+    im[76] = t3;
+    re[16] = t7;
+    im[16] = t2;
+    t6 = X[112];
+    t8 = X[67];
+    t4 = C46 * t6;
+    t5 = C47 * t8;
+    t9 = t4 + t5;
+    t1 = (-C47) * t6;
+    t0 = C46 * t8;
+    t3 = t1 + t0;
+    t7 = X[172];
+    t2 = X[7];
+    t4 = C48 * t7;
+    t5 = C49 * t2;
+    t6 = t4 + t5;
+    t8 = (-C49) * t7;
+    t1 = C48 * t2;
+    t0 = t8 + t1;
+    t4 = X[52];
+    t5 = X[127];
+    t7 = C50 * t4;
+    t2 = C51 * t5;
+    t8 = t7 + t2;
+    t1 = (-C51) * t4;
+    t7 = C50 * t5;
+    t2 = t1 + t7;
+    t4 = t6 + t8;
+    t5 = t0 + t2;
+    t1 = C2 * t4;
+    t7 = t9 - t1;
+    t1 = C2 * t5;
+    t1 = t3 - t1;
+    t6 = t6 - t8;
+    t8 = C3 * t6;
+    t6 = t0 - t2;
+    t0 = C3 * t6;
+    t2 = t9 + t4;
+    t6 = t3 + t5;
+    t9 = t7 + t0;
+    t4 = t1 - t8;
+    t3 = t7 - t0;
+    t5 = t1 + t8;
+    t7 = t9 + t4;
+    t0 = C5 * t7;
+    t1 = t9 * (-C12);
+    t8 = t4 * (-C13);
+    t7 = t0 - t8;
+    t9 = t0 + t1;
+    t4 = t3 + t5;
+    t8 = (-C9) * t4;
+    t0 = t3 * C14;
+    t1 = t5 * (-C15);
+    t4 = t8 - t1;
+    t3 = t8 + t0;
+    re[56] = t2;
+    im[56] = t6;
+    re[86] = t7;
+    im[86] = t9;
+    re[26] = t4;
+    im[26] = t3;
+    t5 = re[36];
+    t1 = im[36];
+    t8 = re[46];
+    t0 = im[46];
+    t2 = re[56];
+    t6 = im[56];
+    t7 = t8 + t2;
+    t9 = t0 + t6;
+    t4 = C2 * t7;
+    t3 = t5 - t4;
+    t4 = C2 * t9;
+    t4 = t1 - t4;
+    t8 = t8 - t2;
+    t2 = C3 * t8;
+    t8 = t0 - t6;
+    t0 = C3 * t8;
+    t6 = t5 + t7;
+    t8 = t1 + t9;
+    t5 = t3 + t0;
+    t7 = t4 - t2;
+    t1 = t3 - t0;
+    t9 = t4 + t2;
+    re[36] = t6;
+    im[36] = t8;
+    re[46] = t5;
+    im[46] = t7;
+    re[56] = t1;
+    im[56] = t9;
+    t3 = re[66];
+    t0 = im[66];
+    t4 = re[76];
+    t2 = im[76];
+    t6 = re[86];
+    t8 = im[86];
+    t5 = t4 + t6;
+    t7 = t2 + t8;
+    t1 = C2 * t5;
+    t9 = t3 - t1;
+    t1 = C2 * t7;
+    t1 = t0 - t1;
+    t4 = t4 - t6;
+    t6 = C3 * t4;
+    t4 = t2 - t8;
+    t2 = C3 * t4;
+    t8 = t3 + t5;
+    t4 = t0 + t7;
+    t3 = t9 + t2;
+    t5 = t1 - t6;
+    t0 = t9 - t2;
+    t7 = t1 + t6;
+    re[66] = t8;
+    im[66] = t4;
+    re[76] = t3;
+    im[76] = t5;
+    re[86] = t0;
+    im[86] = t7;
+    t9 = re[6];
+    t2 = im[6];
+    t1 = re[16];
+    t6 = im[16];
+    t8 = re[26];
+    t4 = im[26];
+    t3 = t1 + t8;
+    t5 = t6 + t4;
+    t0 = C2 * t3;
+    t7 = t9 - t0;
+    t0 = C2 * t5;
+    t0 = t2 - t0;
+    t1 = t1 - t8;
+    t8 = C3 * t1;
+    t1 = t6 - t4;
+    t6 = C3 * t1;
+    t4 = t9 + t3;
+    t1 = t2 + t5;
+    t9 = t7 + t6;
+    t3 = t0 - t8;
+    t2 = t7 - t6;
+    t5 = t0 + t8;
+    re[6] = t4;
+    im[6] = t1;
+    re[16] = t9;
+    im[16] = t3;
+    re[26] = t2;
+    im[26] = t5;
+    t7 = X[108];
+    t6 = X[71];
+    t0 = C35 * t7;
+    t8 = C34 * t6;
+    t4 = t0 + t8;
+    t1 = (-C34) * t7;
+    t9 = C35 * t6;
+    t3 = t1 + t9;
+    t2 = X[168];
+    t5 = X[11];
+    t0 = C39 * t2;
+    t8 = C38 * t5;
+    t7 = t0 + t8;
+    t6 = (-C38) * t2;
+    t1 = C39 * t5;
+    t9 = t6 + t1;
+    t0 = X[48];
+    t8 = X[131];
+    t2 = C37 * t0;
+    t5 = C36 * t8;
+    t6 = t2 + t5;
+    t1 = (-C36) * t0;
+    t2 = C37 * t8;
+    t5 = t1 + t2;
+    t0 = t7 + t6;
+    t8 = t9 + t5;
+    t1 = C2 * t0;
+    t2 = t4 - t1;
+    t1 = C2 * t8;
+    t1 = t3 - t1;
+    t7 = t7 - t6;
+    t6 = C3 * t7;
+    t7 = t9 - t5;
+    t9 = C3 * t7;
+    t5 = t4 + t0;
+    t7 = t3 + t8;
+    t4 = t2 + t9;
+    t0 = t1 - t6;
+    t3 = t2 - t9;
+    t8 = t1 + t6;
+    re[54] = t5;
+    im[54] = t7;
+    re[84] = t4;
+    im[84] = t0;
+    re[24] = t3;
+    im[24] = t8;
+    t2 = X[128];
+    t9 = X[51];
+    t1 = C51 * t2;
+    t6 = C50 * t9;
+    t5 = t1 + t6;
+    t7 = (-C50) * t2;
+    t4 = C51 * t9;
+    t0 = t7 + t4;
+    t3 = X[8];
+    t8 = X[171];
+    t1 = C49 * t3;
+    t6 = C48 * t8;
+    t2 = t1 + t6;
+    t9 = (-C48) * t3;
+    t7 = C49 * t8;
+    t4 = t9 + t7;
+    t1 = X[68];
+    t6 = X[111];
+    t3 = C47 * t1;
+    t8 = C46 * t6;
+    t9 = t3 + t8;
+    t7 = (-C46) * t1;
+    t3 = C47 * t6;
+    t8 = t7 + t3;
+    t1 = t2 + t9;
+    t6 = t4 + t8;
+    t7 = C2 * t1;
+    t3 = t5 - t7;
+    t7 = C2 * t6;
+    t7 = t0 - t7;
+    t2 = t2 - t9;
+    t9 = C3 * t2;
+    t2 = t4 - t8;
+    t4 = C3 * t2;
+    t8 = t5 + t1;
+    t2 = t0 + t6;
+    t5 = t3 + t4;
+    t1 = t7 - t9;
+    t0 = t3 - t4;
+    t6 = t7 + t9;
+    t3 = t5 + t1;
+    t4 = C6 * t3;
+    t7 = t5 * (-C10);
+    t9 = t1 * C11;
+    t3 = t4 - t9;
+    t5 = t4 + t7;
+    t1 = t0 + t6;
+    t9 = C5 * t1;
+    t4 = t0 * (-C12);
+    t7 = t6 * (-C13);
+    t1 = t9 - t7;
+    t0 = t9 + t4;
+    re[64] = t8;
+    im[64] = t2;
+    re[4] = t3;
+    im[4] = t5;
+    re[34] = t1;
+    im[34] = t0;
+    t6 = X[148];
+    t7 = X[31];
+    t9 = C45 * t6;
+    t4 = C44 * t7;
+    t8 = t9 + t4;
+    t2 = (-C44) * t6;
+    t3 = C45 * t7;
+    t5 = t2 + t3;
+    t1 = X[28];
+    t0 = X[151];
+    t9 = C43 * t1;
+    t4 = C42 * t0;
+    t6 = t9 + t4;
+    t7 = (-C42) * t1;
+    t2 = C43 * t0;
+    t3 = t7 + t2;
+    t9 = X[88];
+    t4 = X[91];
+    t1 = C41 * t9;
+    t0 = C40 * t4;
+    t7 = t1 + t0;
+    t2 = (-C40) * t9;
+    t1 = C41 * t4;
+    t0 = t2 + t1;
+    t9 = t6 + t7;
+    t4 = t3 + t0;
+    t2 = C2 * t9;
+    t1 = t8 - t2;
+    t2 = C2 * t4;
+    t2 = t5 - t2;
+    t6 = t6 - t7;
+    t7 = C3 * t6;
+    t6 = t3 - t0;
+    t3 = C3 * t6;
+    t0 = t8 + t9;
+    t6 = t5 + t4;
+    t8 = t1 + t3;
+    t9 = t2 - t7;
+    t5 = t1 - t3;
+    t4 = t2 + t7;
+    t1 = t8 + t9;
+    t3 = C5 * t1;
+    t2 = t8 * (-C12);
+    t7 = t9 * (-C13);
+    t1 = t3 - t7;
+    t8 = t3 + t2;
+    t9 = t5 + t4;
+    t7 = (-C9) * t9;
+    t3 = t5 * C14;
+    t2 = t4 * (-C15);
+    t9 = t7 - t2;
+    t5 = t7 + t3;
+    re[74] = t0;
+    im[74] = t6;
+    re[14] = t1;
+    im[14] = t8;
+    re[44] = t9;
+    im[44] = t5;
+    t4 = re[54];
+    t2 = im[54];
+    t7 = re[64];
+    t3 = im[64];
+    t0 = re[74];
+    t6 = im[74];
+    t1 = t7 + t0;
+    t8 = t3 + t6;
+    t9 = C2 * t1;
+    t5 = t4 - t9;
+    t9 = C2 * t8;
+    t9 = t2 - t9;
+    t7 = t7 - t0;
+    t0 = C3 * t7;
+    t7 = t3 - t6;
+    t3 = C3 * t7;
+    t6 = t4 + t1;
+    t7 = t2 + t8;
+    t4 = t5 + t3;
+    t1 = t9 - t0;
+    t2 = t5 - t3;
+    t8 = t9 + t0;
+    re[54] = t6;
+    im[54] = t7;
+    re[64] = t4;
+    im[64] = t1;
+    re[74] = t2;
+    im[74] = t8;
+    t5 = re[84];
+    t3 = im[84];
+    t9 = re[4];
+    t0 = im[4];
+    t6 = re[14];
+    t7 = im[14];
+    t4 = t9 + t6;
+    t1 = t0 + t7;
+    t2 = C2 * t4;
+    t8 = t5 - t2;
+    t2 = C2 * t1;
+    t2 = t3 - t2;
+    t9 = t9 - t6;
+    t6 = C3 * t9;
+    t9 = t0 - t7;
+    t0 = C3 * t9;
+    t7 = t5 + t4;
+    t9 = t3 + t1;
+    t5 = t8 + t0;
+    t4 = t2 - t6;
+    t3 = t8 - t0;
+    t1 = t2 + t6;
+    re[84] = t7;
+    im[84] = t9;
+    re[4] = t5;
+    im[4] = t4;
+    re[14] = t3;
+    im[14] = t1;
+    t8 = re[24];
+    t0 = im[24];
+    t2 = re[34];
+    t6 = im[34];
+    t7 = re[44];
+    t9 = im[44];
+    t5 = t2 + t7;
+    t4 = t6 + t9;
+    t3 = C2 * t5;
+    t1 = t8 - t3;
+    t3 = C2 * t4;
+    t3 = t0 - t3;
+    t2 = t2 - t7;
+    t7 = C3 * t2;
+    t2 = t6 - t9;
+    t6 = C3 * t2;
+    t9 = t8 + t5;
+    t2 = t0 + t4;
+    t8 = t1 + t6;
+    t5 = t3 - t7;
+    t0 = t1 - t6;
+    t4 = t3 + t7;
+    re[24] = t9;
+    im[24] = t2;
+    re[34] = t8;
+    im[34] = t5;
+    re[44] = t0;
+    im[44] = t4;
+    t1 = X[144];
+    t6 = X[35];
+    t3 = C17 * t1;
+    t7 = C16 * t6;
+    t9 = t3 + t7;
+    t2 = (-C16) * t1;
+    t8 = C17 * t6;
+    t5 = t2 + t8;
+    t0 = X[24];
+    t4 = X[155];
+    t3 = C21 * t0;
+    t7 = C20 * t4;
+    t1 = t3 + t7;
+    t6 = (-C20) * t0;
+    t2 = C21 * t4;
+    t8 = t6 + t2;
+    t3 = X[84];
+    t7 = X[95];
+    t0 = C19 * t3;
+    t4 = C18 * t7;
+    t6 = t0 + t4;
+    t2 = (-C18) * t3;
+    t0 = C19 * t7;
+    t4 = t2 + t0;
+    t3 = t1 + t6;
+    t7 = t8 + t4;
+    t2 = C2 * t3;
+    t0 = t9 - t2;
+    t2 = C2 * t7;
+    t2 = t5 - t2;
+    t1 = t1 - t6;
+    t6 = C3 * t1;
+    t1 = t8 - t4;
+    t8 = C3 * t1;
+    t4 = t9 + t3;
+    t1 = t5 + t7;
+    t9 = t0 + t8;
+    t3 = t2 - t6;
+    t5 = t0 - t8;
+    t7 = t2 + t6;
+    re[72] = t4;
+    im[72] = t1;
+    re[12] = t9;
+    im[12] = t3;
+    re[42] = t5;
+    im[42] = t7;
+    t0 = X[164];
+    t8 = X[15];
+    t2 = C33 * t0;
+    t6 = C32 * t8;
+    t4 = t2 + t6;
+    t1 = (-C32) * t0;
+    t9 = C33 * t8;
+    t3 = t1 + t9;
+    t5 = X[44];
+    t7 = X[135];
+    t2 = C31 * t5;
+    t6 = C30 * t7;
+    t0 = t2 + t6;
+    t8 = (-C30) * t5;
+    t1 = C31 * t7;
+    t9 = t8 + t1;
+    t2 = X[104];
+    t6 = X[75];
+    t5 = C29 * t2;
+    t7 = C28 * t6;
+    t8 = t5 + t7;
+    t1 = (-C28) * t2;
+    t5 = C29 * t6;
+    t7 = t1 + t5;
+    t2 = t0 + t8;
+    t6 = t9 + t7;
+    t1 = C2 * t2;
+    t5 = t4 - t1;
+    t1 = C2 * t6;
+    t1 = t3 - t1;
+    t0 = t0 - t8;
+    t8 = C3 * t0;
+    t0 = t9 - t7;
+    t9 = C3 * t0;
+    t7 = t4 + t2;
+    t0 = t3 + t6;
+    t4 = t5 + t9;
+    t2 = t1 - t8;
+    t3 = t5 - t9;
+    t6 = t1 + t8;
+    t5 = t4 + t2;
+    t9 = C6 * t5;
+    t1 = t4 * (-C10);
+    t8 = t2 * C11;
+    t5 = t9 - t8;
+    t4 = t9 + t1;
+    t2 = t3 + t6;
+    t8 = C5 * t2;
+    t9 = t3 * (-C12);
+    t1 = t6 * (-C13);
+    t2 = t8 - t1;
+    t3 = t8 + t9;
+    re[82] = t7;
+    im[82] = t0;
+    re[22] = t5;
+    im[22] = t4;
+    re[52] = t2;
+    im[52] = t3;
+    t6 = X[4];
+    t1 = X[175];
+    t8 = C27 * t6;
+    t9 = C26 * t1;
+    t7 = t8 + t9;
+    t0 = (-C26) * t6;
+    t5 = C27 * t1;
+    t4 = t0 + t5;
+    t2 = X[64];
+    t3 = X[115];
+    t8 = C25 * t2;
+    t9 = C24 * t3;
+    t6 = t8 + t9;
+    t1 = (-C24) * t2;
+    t0 = C25 * t3;
+    t5 = t1 + t0;
+    t8 = X[124];
+    t9 = X[55];
+    t2 = C23 * t8;
+    t3 = C22 * t9;
+    t1 = t2 + t3;
+    t0 = (-C22) * t8;
+    t2 = C23 * t9;
+    t3 = t0 + t2;
+    t8 = t6 + t1;
+    t9 = t5 + t3;
+    t0 = C2 * t8;
+    t2 = t7 - t0;
+    t0 = C2 * t9;
+    t0 = t4 - t0;
+    t6 = t6 - t1;
+    t1 = C3 * t6;
+    t6 = t5 - t3;
+    t5 = C3 * t6;
+    t3 = t7 + t8;
+    t6 = t4 + t9;
+    t7 = t2 + t5;
+    t8 = t0 - t1;
+    t4 = t2 - t5;
+    t9 = t0 + t1;
+    t2 = t7 + t8;
+    t5 = C5 * t2;
+    t0 = t7 * (-C12);
+    t1 = t8 * (-C13);
+    t2 = t5 - t1;
+    t7 = t5 + t0;
+    t8 = t4 + t9;
+    t1 = (-C9) * t8;
+    t5 = t4 * C14;
+    t0 = t9 * (-C15);
+    t8 = t1 - t0;
+    t4 = t1 + t5;
+    re[2] = t3;
+    im[2] = t6;
+    re[32] = t2;
+    im[32] = t7;
+    re[62] = t8;
+    im[62] = t4;
+    t9 = re[72];
+    t0 = im[72];
+    t1 = re[82];
+    t5 = im[82];
+    t3 = re[2];
+    t6 = im[2];
+    t2 = t1 + t3;
+    t7 = t5 + t6;
+    t8 = C2 * t2;
+    t4 = t9 - t8;
+    t8 = C2 * t7;
+    t8 = t0 - t8;
+    t1 = t1 - t3;
+    t3 = C3 * t1;
+    t1 = t5 - t6;
+    t5 = C3 * t1;
+    t6 = t9 + t2;
+    t1 = t0 + t7;
+    t9 = t4 + t5;
+    t2 = t8 - t3;
+    t0 = t4 - t5;
+    t7 = t8 + t3;
+    re[72] = t6;
+    im[72] = t1;
+    re[82] = t9;
+    im[82] = t2;
+    re[2] = t0;
+    im[2] = t7;
+    t4 = re[12];
+    t5 = im[12];
+    t8 = re[22];
+    t3 = im[22];
+    t6 = re[32];
+    t1 = im[32];
+    t9 = t8 + t6;
+    t2 = t3 + t1;
+    t0 = C2 * t9;
+    t7 = t4 - t0;
+    t0 = C2 * t2;
+    t0 = t5 - t0;
+    t8 = t8 - t6;
+    t6 = C3 * t8;
+    t8 = t3 - t1;
+    t3 = C3 * t8;
+    t1 = t4 + t9;
+    t8 = t5 + t2;
+    t4 = t7 + t3;
+    t9 = t0 - t6;
+    t5 = t7 - t3;
+    t2 = t0 + t6;
+    re[12] = t1;
+    im[12] = t8;
+    re[22] = t4;
+    im[22] = t9;
+    re[32] = t5;
+    im[32] = t2;
+    t7 = re[42];
+    t3 = im[42];
+    t0 = re[52];
+    t6 = im[52];
+    t1 = re[62];
+    t8 = im[62];
+    t4 = t0 + t1;
+    t9 = t6 + t8;
+    t5 = C2 * t4;
+    t2 = t7 - t5;
+    t5 = C2 * t9;
+    t5 = t3 - t5;
+    t0 = t0 - t1;
+    t1 = C3 * t0;
+    t0 = t6 - t8;
+    t6 = C3 * t0;
+    t8 = t7 + t4;
+    t0 = t3 + t9;
+    t7 = t2 + t6;
+    t4 = t5 - t1;
+    t3 = t2 - t6;
+    t9 = t5 + t1;
+    re[42] = t8;
+    im[42] = t0;
+    re[52] = t7;
+    im[52] = t4;
+    re[62] = t3;
+    im[62] = t9;
+    t2 = re[0];
+    t6 = im[0];
+    t5 = re[18];
+    t1 = im[18];
+    t8 = re[36];
+    t0 = im[36];
+    t7 = re[54];
+    t4 = im[54];
+    t3 = re[72];
+    t9 = im[72];
+    t10 = t5 + t3;
+    t11 = t1 + t9;
+    t12 = t8 + t7;
+    t13 = t0 + t4;
+    t5 = t5 - t3;
+    t3 = t1 - t9;
+    t1 = t8 - t7;
+    t9 = t0 - t4;
+    t8 = t10 + t12;
+    t7 = t11 + t13;
+    t0 = t10 - t12;
+    t4 = C52 * t0;
+    t10 = t11 - t13;
+    t12 = C52 * t10;
+    t0 = C53 * t8;
+    t11 = t2 - t0;
+    t13 = C53 * t7;
+    t10 = t6 - t13;
+    t0 = t11 + t4;
+    t13 = t10 + t12;
+    t11 = t11 - t4;
+    t4 = t10 - t12;
+    t10 = C16 * t5;
+    t12 = C35 * t1;
+    t10 = t10 + t12;
+    t12 = C16 * t3;
+    t14 = C35 * t9;
+    t12 = t12 + t14;
+    t14 = C35 * t5;
+    t5 = C16 * t1;
+    t1 = t14 - t5;
+    t14 = C35 * t3;
+    t5 = C16 * t9;
+    t3 = t14 - t5;
+    t9 = t2 + t8;
+    t14 = t6 + t7;
+    t5 = t0 + t12;
+    t2 = t13 - t10;
+    t8 = t11 + t3;
+    t6 = t4 - t1;
+    t7 = t11 - t3;
+    t11 = t4 + t1;
+    t3 = t0 - t12;
+    t4 = t13 + t10;
+    re[0] = t9;
+    im[0] = t14;
+    re[18] = t5;
+    im[18] = t2;
+    re[36] = t8;
+    im[36] = t6;
+    re[54] = t7;
+    im[54] = t11;
+    re[72] = t3;
+    im[72] = t4;
+    t1 = re[30];
+    t0 = im[30];
+    t12 = re[48];
+    t13 = im[48];
+    t10 = re[66];
+    t9 = im[66];
+    t14 = re[84];
+    t5 = im[84];
+    t2 = re[12];
+    t8 = im[12];
+    t6 = t12 + t2;
+    t7 = t13 + t8;
+    t11 = t10 + t14;
+    t3 = t9 + t5;
+    t4 = t12 - t2;
+    t12 = t13 - t8;
+    t2 = t10 - t14;
+    t13 = t9 - t5;
+    t8 = t6 + t11;
+    t10 = t7 + t3;
+    t14 = t6 - t11;
+    t9 = C52 * t14;
+    t5 = t7 - t3;
+    t6 = C52 * t5;
+    t11 = C53 * t8;
+    t14 = t1 - t11;
+    t7 = C53 * t10;
+    t3 = t0 - t7;
+    t5 = t14 + t9;
+    t11 = t3 + t6;
+    t7 = t14 - t9;
+    t14 = t3 - t6;
+    t9 = C16 * t4;
+    t3 = C35 * t2;
+    t6 = t9 + t3;
+    t9 = C16 * t12;
+    t3 = C35 * t13;
+    t9 = t9 + t3;
+    t3 = C35 * t4;
+    t4 = C16 * t2;
+    t2 = t3 - t4;
+    t3 = C35 * t12;
+    t4 = C16 * t13;
+    t12 = t3 - t4;
+    t13 = t1 + t8;
+    t3 = t0 + t10;
+    t4 = t5 + t9;
+    t1 = t11 - t6;
+    t8 = t7 + t12;
+    t0 = t14 - t2;
+    t10 = t7 - t12;
+    t7 = t14 + t2;
+    t12 = t5 - t9;
+    t14 = t11 + t6;
+    re[30] = t13;
+    im[30] = t3;
+    re[48] = t4;
+    im[48] = t1;
+    re[66] = t8;
+    im[66] = t0;
+    re[84] = t10;
+    im[84] = t7;
+    re[12] = t12;
+    im[12] = t14;
+    t2 = re[60];
+    t5 = im[60];
+    t9 = re[78];
+    t11 = im[78];
+    t6 = re[6];
+    t13 = im[6];
+    t3 = re[24];
+    t4 = im[24];
+    t1 = re[42];
+    t8 = im[42];
+    t0 = t9 + t1;
+    t10 = t11 + t8;
+    t7 = t6 + t3;
+    t12 = t13 + t4;
+    t14 = t9 - t1;
+    t9 = t11 - t8;
+    t1 = t6 - t3;
+    t11 = t13 - t4;
+    t8 = t0 + t7;
+    t6 = t10 + t12;
+    t3 = t0 - t7;
+    t13 = C52 * t3;
+    t4 = t10 - t12;
+    t0 = C52 * t4;
+    t7 = C53 * t8;
+    t3 = t2 - t7;
+    t10 = C53 * t6;
+    t12 = t5 - t10;
+    t4 = t3 + t13;
+    t7 = t12 + t0;
+    t10 = t3 - t13;
+    t3 = t12 - t0;
+    t13 = C16 * t14;
+    t12 = C35 * t1;
+    t0 = t13 + t12;
+    t13 = C16 * t9;
+    t12 = C35 * t11;
+    t13 = t13 + t12;
+    t12 = C35 * t14;
+    t14 = C16 * t1;
+    t1 = t12 - t14;
+    t12 = C35 * t9;
+    t14 = C16 * t11;
+    t9 = t12 - t14;
+    t11 = t2 + t8;
+    t12 = t5 + t6;
+    t14 = t4 + t13;
+    t2 = t7 - t0;
+    t8 = t10 + t9;
+    t5 = t3 - t1;
+    t6 = t10 - t9;
+    t10 = t3 + t1;
+    t9 = t4 - t13;
+    t3 = t7 + t0;
+    re[60] = t11;
+    im[60] = t12;
+    re[78] = t14;
+    im[78] = t2;
+    re[6] = t8;
+    im[6] = t5;
+    re[24] = t6;
+    im[24] = t10;
+    re[42] = t9;
+    im[42] = t3;
+    t1 = re[10];
+    t4 = im[10];
+    t13 = re[28];
+    t7 = im[28];
+    t0 = re[46];
+    t11 = im[46];
+    t12 = re[64];
+    t14 = im[64];
+    t2 = re[82];
+    t8 = im[82];
+    t5 = t13 + t2;
+    t6 = t7 + t8;
+    t10 = t0 + t12;
+    t9 = t11 + t14;
+    t3 = t13 - t2;
+    t13 = t7 - t8;
+    t2 = t0 - t12;
+    t7 = t11 - t14;
+    t8 = t5 + t10;
+    t0 = t6 + t9;
+    t12 = t5 - t10;
+    t11 = C52 * t12;
+    t14 = t6 - t9;
+    t5 = C52 * t14;
+    t10 = C53 * t8;
+    t12 = t1 - t10;
+    t6 = C53 * t0;
+    t9 = t4 - t6;
+    t14 = t12 + t11;
+    t10 = t9 + t5;
+    t6 = t12 - t11;
+    t12 = t9 - t5;
+    t11 = C16 * t3;
+    t9 = C35 * t2;
+    t5 = t11 + t9;
+    t11 = C16 * t13;
+    t9 = C35 * t7;
+    t11 = t11 + t9;
+    t9 = C35 * t3;
+    t3 = C16 * t2;
+    t2 = t9 - t3;
+    t9 = C35 * t13;
+    t3 = C16 * t7;
+    t13 = t9 - t3;
+    t7 = t1 + t8;
+    t9 = t4 + t0;
+    t3 = t14 + t11;
+    t1 = t10 - t5;
+    t8 = t6 + t13;
+    t4 = t12 - t2;
+    t0 = t6 - t13;
+    t6 = t12 + t2;
+    t13 = t14 - t11;
+    t12 = t10 + t5;
+    re[10] = t7;
+    im[10] = t9;
+    re[28] = t3;
+    im[28] = t1;
+    re[46] = t8;
+    im[46] = t4;
+    re[64] = t0;
+    im[64] = t6;
+    re[82] = t13;
+    im[82] = t12;
+    t2 = re[40];
+    t14 = im[40];
+    t11 = re[58];
+    t10 = im[58];
+    t5 = re[76];
+    t7 = im[76];
+    t9 = re[4];
+    t3 = im[4];
+    t1 = re[22];
+    t8 = im[22];
+    t4 = t11 + t1;
+    t0 = t10 + t8;
+    t6 = t5 + t9;
+    t13 = t7 + t3;
+    t12 = t11 - t1;
+    t11 = t10 - t8;
+    t1 = t5 - t9;
+    t10 = t7 - t3;
+    t8 = t4 + t6;
+    t5 = t0 + t13;
+    t9 = t4 - t6;
+    t7 = C52 * t9;
+    t3 = t0 - t13;
+    t4 = C52 * t3;
+    t6 = C53 * t8;
+    t9 = t2 - t6;
+    t0 = C53 * t5;
+    t13 = t14 - t0;
+    t3 = t9 + t7;
+    t6 = t13 + t4;
+    t0 = t9 - t7;
+    t9 = t13 - t4;
+    t7 = C16 * t12;
+    t13 = C35 * t1;
+    t4 = t7 + t13;
+    t7 = C16 * t11;
+    t13 = C35 * t10;
+    t7 = t7 + t13;
+    t13 = C35 * t12;
+    t12 = C16 * t1;
+    t1 = t13 - t12;
+    t13 = C35 * t11;
+    t12 = C16 * t10;
+    t11 = t13 - t12;
+    t10 = t2 + t8;
+    t13 = t14 + t5;
+    t12 = t3 + t7;
+    t2 = t6 - t4;
+    t8 = t0 + t11;
+    t14 = t9 - t1;
+    t5 = t0 - t11;
+    t0 = t9 + t1;
+    t11 = t3 - t7;
+    t9 = t6 + t4;
+    re[40] = t10;
+    im[40] = t13;
+    re[58] = t12;
+    im[58] = t2;
+    re[76] = t8;
+    im[76] = t14;
+    re[4] = t5;
+    im[4] = t0;
+    re[22] = t11;
+    im[22] = t9;
+    t1 = re[70];
+    t3 = im[70];
+    t7 = re[88];
+    t6 = im[88];
+    t4 = re[16];
+    t10 = im[16];
+    t13 = re[34];
+    t12 = im[34];
+    t2 = re[52];
+    t8 = im[52];
+    t14 = t7 + t2;
+    t5 = t6 + t8;
+    t0 = t4 + t13;
+    t11 = t10 + t12;
+    t9 = t7 - t2;
+    t7 = t6 - t8;
+    t2 = t4 - t13;
+    t6 = t10 - t12;
+    t8 = t14 + t0;
+    t4 = t5 + t11;
+    t13 = t14 - t0;
+    t10 = C52 * t13;
+    t12 = t5 - t11;
+    t14 = C52 * t12;
+    t0 = C53 * t8;
+    t13 = t1 - t0;
+    t5 = C53 * t4;
+    t11 = t3 - t5;
+    t12 = t13 + t10;
+    t0 = t11 + t14;
+    t5 = t13 - t10;
+    t13 = t11 - t14;
+    t10 = C16 * t9;
+    t11 = C35 * t2;
+    t14 = t10 + t11;
+    t10 = C16 * t7;
+    t11 = C35 * t6;
+    t10 = t10 + t11;
+    t11 = C35 * t9;
+    t9 = C16 * t2;
+    t2 = t11 - t9;
+    t11 = C35 * t7;
+    t9 = C16 * t6;
+    t7 = t11 - t9;
+    t6 = t1 + t8;
+    t11 = t3 + t4;
+    t9 = t12 + t10;
+    t1 = t0 - t14;
+    t8 = t5 + t7;
+    t3 = t13 - t2;
+    t4 = t5 - t7;
+    t5 = t13 + t2;
+    t7 = t12 - t10;
+    t13 = t0 + t14;
+    re[70] = t6;
+    im[70] = t11;
+    re[88] = t9;
+    im[88] = t1;
+    re[16] = t8;
+    im[16] = t3;
+    re[34] = t4;
+    im[34] = t5;
+    re[52] = t7;
+    im[52] = t13;
+    t2 = re[20];
+    t12 = im[20];
+    t10 = re[38];
+    t0 = im[38];
+    t14 = re[56];
+    t6 = im[56];
+    t11 = re[74];
+    t9 = im[74];
+    t1 = re[2];
+    t8 = im[2];
+    t3 = t10 + t1;
+    t4 = t0 + t8;
+    t5 = t14 + t11;
+    t7 = t6 + t9;
+    t13 = t10 - t1;
+    t10 = t0 - t8;
+    t1 = t14 - t11;
+    t0 = t6 - t9;
+    t8 = t3 + t5;
+    t14 = t4 + t7;
+    t11 = t3 - t5;
+    t6 = C52 * t11;
+    t9 = t4 - t7;
+    t3 = C52 * t9;
+    t5 = C53 * t8;
+    t11 = t2 - t5;
+    t4 = C53 * t14;
+    t7 = t12 - t4;
+    t9 = t11 + t6;
+    t5 = t7 + t3;
+    t4 = t11 - t6;
+    t11 = t7 - t3;
+    t6 = C16 * t13;
+    t7 = C35 * t1;
+    t3 = t6 + t7;
+    t6 = C16 * t10;
+    t7 = C35 * t0;
+    t6 = t6 + t7;
+    t7 = C35 * t13;
+    t13 = C16 * t1;
+    t1 = t7 - t13;
+    t7 = C35 * t10;
+    t13 = C16 * t0;
+    t10 = t7 - t13;
+    t0 = t2 + t8;
+    t7 = t12 + t14;
+    t13 = t9 + t6;
+    t2 = t5 - t3;
+    t8 = t4 + t10;
+    t12 = t11 - t1;
+    t14 = t4 - t10;
+    t4 = t11 + t1;
+    t10 = t9 - t6;
+    t11 = t5 + t3;
+    re[20] = t0;
+    im[20] = t7;
+    re[38] = t13;
+    im[38] = t2;
+    re[56] = t8;
+    im[56] = t12;
+    re[74] = t14;
+    im[74] = t4;
+    re[2] = t10;
+    im[2] = t11;
+    t1 = re[50];
+    t9 = im[50];
+    t6 = re[68];
+    t5 = im[68];
+    t3 = re[86];
+    t0 = im[86];
+    t7 = re[14];
+    t13 = im[14];
+    t2 = re[32];
+    t8 = im[32];
+    t12 = t6 + t2;
+    t14 = t5 + t8;
+    t4 = t3 + t7;
+    t10 = t0 + t13;
+    t11 = t6 - t2;
+    t6 = t5 - t8;
+    t2 = t3 - t7;
+    t5 = t0 - t13;
+    t8 = t12 + t4;
+    t3 = t14 + t10;
+    t7 = t12 - t4;
+    t0 = C52 * t7;
+    t13 = t14 - t10;
+    t12 = C52 * t13;
+    t4 = C53 * t8;
+    t7 = t1 - t4;
+    t14 = C53 * t3;
+    t10 = t9 - t14;
+    t13 = t7 + t0;
+    t4 = t10 + t12;
+    t14 = t7 - t0;
+    t7 = t10 - t12;
+    t0 = C16 * t11;
+    t10 = C35 * t2;
+    t12 = t0 + t10;
+    t0 = C16 * t6;
+    t10 = C35 * t5;
+    t0 = t0 + t10;
+    t10 = C35 * t11;
+    t11 = C16 * t2;
+    t2 = t10 - t11;
+    t10 = C35 * t6;
+    t11 = C16 * t5;
+    t6 = t10 - t11;
+    t5 = t1 + t8;
+    t10 = t9 + t3;
+    t11 = t13 + t0;
+    t1 = t4 - t12;
+    t8 = t14 + t6;
+    t9 = t7 - t2;
+    t3 = t14 - t6;
+    t14 = t7 + t2;
+    t6 = t13 - t0;
+    t7 = t4 + t12;
+    re[50] = t5;
+    im[50] = t10;
+    re[68] = t11;
+    im[68] = t1;
+    re[86] = t8;
+    im[86] = t9;
+    re[14] = t3;
+    im[14] = t14;
+    re[32] = t6;
+    im[32] = t7;
+    t2 = re[80];
+    t13 = im[80];
+    t0 = re[8];
+    t4 = im[8];
+    t12 = re[26];
+    t5 = im[26];
+    t10 = re[44];
+    t11 = im[44];
+    t1 = re[62];
+    t8 = im[62];
+    t9 = t0 + t1;
+    t3 = t4 + t8;
+    t14 = t12 + t10;
+    t6 = t5 + t11;
+    t7 = t0 - t1;
+    t0 = t4 - t8;
+    t1 = t12 - t10;
+    t4 = t5 - t11;
+    t8 = t9 + t14;
+    t12 = t3 + t6;
+    t10 = t9 - t14;
+    t5 = C52 * t10;
+    t11 = t3 - t6;
+    t9 = C52 * t11;
+    t14 = C53 * t8;
+    t10 = t2 - t14;
+    t3 = C53 * t12;
+    t6 = t13 - t3;
+    t11 = t10 + t5;
+    t14 = t6 + t9;
+    t3 = t10 - t5;
+    t10 = t6 - t9;
+    t5 = C16 * t7;
+    t6 = C35 * t1;
+    t9 = t5 + t6;
+    t5 = C16 * t0;
+    t6 = C35 * t4;
+    t5 = t5 + t6;
+    t6 = C35 * t7;
+    t7 = C16 * t1;
+    t1 = t6 - t7;
+    t6 = C35 * t0;
+    t7 = C16 * t4;
+    t0 = t6 - t7;
+    t4 = t2 + t8;
+    t6 = t13 + t12;
+    t7 = t11 + t5;
+    t2 = t14 - t9;
+    t8 = t3 + t0;
+    t13 = t10 - t1;
+    t12 = t3 - t0;
+    t3 = t10 + t1;
+    t0 = t11 - t5;
+    t10 = t14 + t9;
+    re[80] = t4;
+    im[80] = t6;
+    re[8] = t7;
+    im[8] = t2;
+    re[26] = t8;
+    im[26] = t13;
+    re[44] = t12;
+    im[44] = t3;
+    re[62] = t0;
+    im[62] = t10;
+}
+
+/**
+ *  Part 2 of ApplyWindowedIMDCT_W75_180().
+ * 
+ *  @param {Number[]} X 
+ *    - The input block (180 points).
+ *  @param {Number[]} y 
+ *    - The array that would contain the output block (360 points).
+ *  @param {Number[]} re 
+ *    - The scratch buffer (real part, 90 points).
+ *  @param {Number[]} im 
+ *    - The scratch buffer (imaginary part, 90 points).
+ */
+function ApplyWindowedIMDCT_W75_180_Part2(X, y, re, im) {
+    let t0, t1, t10, t11, t12, t13, t14, t2, t3, t4, t5, t6, t7, t8, t9;
+    const C0 = 0.7071067811865476;
+    const C1 = 0.7071067811865475;
+    const C2 = 0.25881904510252074;
+    const C3 = 0.9659258262890683;
+    const C4 = 0.5;
+    const C5 = 0.8660254037844386;
+    const C6 = 0.573576436351046;
+    const C7 = 0.8191520442889918;
+    const C8 = 0.08715574274765817;
+    const C9 = 0.9961946980917455;
+    const C10 = 0.9063077870366499;
+    const C11 = 0.42261826174069944;
+    const C12 = 0.766044443118978;
+    const C13 = 1.4088320528055172;
+    const C14 = 0.12325683343243876;
+    const C15 = 0.17364817766693033;
+    const C16 = 1.1584559306791384;
+    const C17 = 0.8111595753452777;
+    const C18 = 0.9396926207859084;
+    const C19 = 0.5976724774602398;
+    const C20 = 1.281712764111577;
+    const C21 = 0.45399049973954675;
+    const C22 = 0.8910065241883679;
+    const C23 = 0.9986295347545738;
+    const C24 = 0.05233595624294383;
+    const C25 = 0.838670567945424;
+    const C26 = 0.544639035015027;
+    const C27 = 0.2923717047227367;
+    const C28 = 0.9563047559630355;
+    const C29 = 0.9743700647852352;
+    const C30 = 0.22495105434386498;
+    const C31 = 0.7313537016191705;
+    const C32 = 0.6819983600624985;
+    const C33 = 0.12186934340514748;
+    const C34 = 0.992546151641322;
+    const C35 = 0.9205048534524404;
+    const C36 = 0.3907311284892737;
+    const C37 = 0.6018150231520483;
+    const C38 = 0.7986355100472928;
+    const C39 = 0.15643446504023087;
+    const C40 = 0.9876883405951378;
+    const C41 = 0.9335804264972017;
+    const C42 = 0.35836794954530027;
+    const C43 = 0.6293203910498375;
+    const C44 = 0.7771459614569709;
+    const C45 = 0.9998476951563913;
+    const C46 = 0.01745240643728351;
+    const C47 = 0.8571673007021123;
+    const C48 = 0.5150380749100542;
+    const C49 = 0.48480962024633706;
+    const C50 = 0.8746197071393957;
+    const C51 = 0.981627183447664;
+    const C52 = 0.1908089953765448;
+    const C53 = 0.754709580222772;
+    const C54 = 0.6560590289905073;
+    const C55 = 0.3255681544571567;
+    const C56 = 0.9455185755993168;
+    const C57 = 0.5590169943749475;
+    const C58 = 0.25;
+    const C59 = 0.9510565162951535;
+    const C60 = 0.5877852522924731;
+    const C61 = 0.9999904807207345;
+    const C62 = 0.004363309284746571;
+    const C63 = 0.7040147244559684;
+    const C64 = 0.7101853756232854;
+    const C65 = 0.6915130557822694;
+    const C66 = 0.7223639620597556;
+    const C67 = 0.9997620270799091;
+    const C68 = 0.02181488503456112;
+    const C69 = 0.9992290362407229;
+    const C70 = 0.03925981575906861;
+    const C71 = 0.6788007455329417;
+    const C72 = 0.7343225094356856;
+    const C73 = 0.6658816660008342;
+    const C74 = 0.7460573750616996;
+    const C75 = 0.9983916705573488;
+    const C76 = 0.056692787563377506;
+    const C77 = 0.9972501850994857;
+    const C78 = 0.07410849019539922;
+    const C79 = 0.6527597524627224;
+    const C80 = 0.7575649843840496;
+    t1 = X[90];
+    t11 = X[89];
+    t5 = C0 * t1;
+    t14 = C1 * t11;
+    t9 = t5 + t14;
+    t4 = (-C1) * t1;
+    t6 = C0 * t11;
+    t7 = t4 + t6;
+    t2 = X[150];
+    t8 = X[29];
+    t13 = C2 * t2;
+    t12 = C3 * t8;
+    t3 = t13 + t12;
+    t0 = (-C3) * t2;
+    t10 = C2 * t8;
+    t5 = t0 + t10;
+    t14 = X[30];
+    t1 = X[149];
+    t11 = C3 * t14;
+    t4 = C2 * t1;
+    t6 = t11 + t4;
+    t13 = (-C2) * t14;
+    t12 = C3 * t1;
+    t2 = t13 + t12;
+    t8 = t3 + t6;
+    t0 = t5 + t2;
+    t10 = C4 * t8;
+    t11 = t9 - t10;
+    t4 = C4 * t0;
+    t14 = t7 - t4;
+    t1 = t3 - t6;
+    t13 = C5 * t1;
+    t12 = t5 - t2;
+    t10 = C5 * t12;
+    t4 = t9 + t8;
+    t3 = t7 + t0;
+    t6 = t11 + t10;
+    t1 = t14 - t13;
+    t5 = t11 - t10;
+    t2 = t14 + t13;
+    re[45] = t4;
+    im[45] = t3;
+    re[75] = t6;
+    im[75] = t1;
+    re[15] = t5;
+    im[15] = t2;
+    t12 = X[110];
+    t9 = X[69];
+    t8 = C6 * t12;
+    t7 = C7 * t9;
+    t0 = t8 + t7;
+    t11 = (-C7) * t12;
+    t10 = C6 * t9;
+    t14 = t11 + t10;
+    t13 = X[170];
+    t4 = X[9];
+    t3 = C8 * t13;
+    t6 = C9 * t4;
+    t1 = t3 + t6;
+    t5 = (-C9) * t13;
+    t2 = C8 * t4;
+    t8 = t5 + t2;
+    t7 = X[50];
+    t12 = X[129];
+    t9 = C10 * t7;
+    t11 = C11 * t12;
+    t10 = t9 + t11;
+    t3 = (-C11) * t7;
+    t6 = C10 * t12;
+    t13 = t3 + t6;
+    t4 = t1 + t10;
+    t5 = t8 + t13;
+    t2 = C4 * t4;
+    t9 = t0 - t2;
+    t11 = C4 * t5;
+    t7 = t14 - t11;
+    t12 = t1 - t10;
+    t3 = C5 * t12;
+    t6 = t8 - t13;
+    t2 = C5 * t6;
+    t11 = t0 + t4;
+    t1 = t14 + t5;
+    t10 = t9 + t2;
+    t12 = t7 - t3;
+    t8 = t9 - t2;
+    t13 = t7 + t3;
+    t6 = t10 + t12;
+    t0 = C12 * t6;
+    t4 = t10 * (-C13);
+    t14 = t12 * C14;
+    t5 = t0 - t14;
+    t9 = t0 + t4;
+    t2 = t8 + t13;
+    t7 = C15 * t2;
+    t3 = t8 * (-C16);
+    t6 = t13 * (-C17);
+    t10 = t7 - t6;
+    t12 = t7 + t3;
+    re[55] = t11;
+    im[55] = t1;
+    re[85] = t5;
+    im[85] = t9;
+    re[25] = t10;
+    im[25] = t12;
+    t14 = X[130];
+    t0 = X[49];
+    t4 = C11 * t14;
+    t2 = C10 * t0;
+    t8 = t4 + t2;
+    t13 = (-C10) * t14;
+    t6 = C11 * t0;
+    t7 = t13 + t6;
+    t3 = X[10];
+    t11 = X[169];
+    t1 = C9 * t3;
+    t5 = C8 * t11;
+    t9 = t1 + t5;
+    t10 = (-C8) * t3;
+    t12 = C9 * t11;
+    t4 = t10 + t12;
+    t2 = X[70];
+    t14 = X[109];
+    t0 = C7 * t2;
+    t13 = C6 * t14;
+    t6 = t0 + t13;
+    t1 = (-C6) * t2;
+    t5 = C7 * t14;
+    t3 = t1 + t5;
+    t11 = t9 + t6;
+    t10 = t4 + t3;
+    t12 = C4 * t11;
+    t0 = t8 - t12;
+    t13 = C4 * t10;
+    t2 = t7 - t13;
+    t14 = t9 - t6;
+    t1 = C5 * t14;
+    t5 = t4 - t3;
+    t12 = C5 * t5;
+    t13 = t8 + t11;
+    t9 = t7 + t10;
+    t6 = t0 + t12;
+    t14 = t2 - t1;
+    t4 = t0 - t12;
+    t3 = t2 + t1;
+    t5 = t6 + t14;
+    t8 = C15 * t5;
+    t11 = t6 * (-C16);
+    t7 = t14 * (-C17);
+    t10 = t8 - t7;
+    t0 = t8 + t11;
+    t12 = t4 + t3;
+    t2 = (-C18) * t12;
+    t1 = t4 * C19;
+    t5 = t3 * (-C20);
+    t6 = t2 - t5;
+    t14 = t2 + t1;
+    re[65] = t13;
+    im[65] = t9;
+    re[5] = t10;
+    im[5] = t0;
+    re[35] = t6;
+    im[35] = t14;
+    t7 = re[45];
+    t8 = im[45];
+    t11 = re[55];
+    t12 = im[55];
+    t4 = re[65];
+    t3 = im[65];
+    t5 = t11 + t4;
+    t2 = t12 + t3;
+    t1 = C4 * t5;
+    t13 = t7 - t1;
+    t9 = C4 * t2;
+    t10 = t8 - t9;
+    t0 = t11 - t4;
+    t6 = C5 * t0;
+    t14 = t12 - t3;
+    t1 = C5 * t14;
+    t9 = t7 + t5;
+    t11 = t8 + t2;
+    t4 = t13 + t1;
+    t0 = t10 - t6;
+    t12 = t13 - t1;
+    t3 = t10 + t6;
+    re[45] = t9;
+    im[45] = t11;
+    re[55] = t4;
+    im[55] = t0;
+    re[65] = t12;
+    im[65] = t3;
+    t14 = re[75];
+    t7 = im[75];
+    t5 = re[85];
+    t8 = im[85];
+    t2 = re[5];
+    t13 = im[5];
+    t1 = t5 + t2;
+    t10 = t8 + t13;
+    t6 = C4 * t1;
+    t9 = t14 - t6;
+    t11 = C4 * t10;
+    t4 = t7 - t11;
+    t0 = t5 - t2;
+    t12 = C5 * t0;
+    t3 = t8 - t13;
+    t6 = C5 * t3;
+    t11 = t14 + t1;
+    t5 = t7 + t10;
+    t2 = t9 + t6;
+    t0 = t4 - t12;
+    t8 = t9 - t6;
+    t13 = t4 + t12;
+    re[75] = t11;
+    im[75] = t5;
+    re[85] = t2;
+    im[85] = t0;
+    re[5] = t8;
+    im[5] = t13;
+    t3 = re[15];
+    t14 = im[15];
+    t1 = re[25];
+    t7 = im[25];
+    t10 = re[35];
+    t9 = im[35];
+    t6 = t1 + t10;
+    t4 = t7 + t9;
+    t12 = C4 * t6;
+    t11 = t3 - t12;
+    t5 = C4 * t4;
+    t2 = t14 - t5;
+    t0 = t1 - t10;
+    t8 = C5 * t0;
+    t13 = t7 - t9;
+    t12 = C5 * t13;
+    t5 = t3 + t6;
+    t1 = t14 + t4;
+    t10 = t11 + t12;
+    t0 = t2 - t8;
+    t7 = t11 - t12;
+    t9 = t2 + t8;
+    re[15] = t5;
+    im[15] = t1;
+    re[25] = t10;
+    im[25] = t0;
+    re[35] = t7;
+    im[35] = t9;
+    t13 = X[126];
+    t3 = X[53];
+    t6 = C21 * t13;
+    t14 = C22 * t3;
+    t4 = t6 + t14;
+    t11 = (-C22) * t13;
+    t12 = C21 * t3;
+    t2 = t11 + t12;
+    t8 = X[6];
+    t5 = X[173];
+    t1 = C23 * t8;
+    t10 = C24 * t5;
+    t0 = t1 + t10;
+    t7 = (-C24) * t8;
+    t9 = C23 * t5;
+    t6 = t7 + t9;
+    t14 = X[66];
+    t13 = X[113];
+    t3 = C25 * t14;
+    t11 = C26 * t13;
+    t12 = t3 + t11;
+    t1 = (-C26) * t14;
+    t10 = C25 * t13;
+    t8 = t1 + t10;
+    t5 = t0 + t12;
+    t7 = t6 + t8;
+    t9 = C4 * t5;
+    t3 = t4 - t9;
+    t11 = C4 * t7;
+    t14 = t2 - t11;
+    t13 = t0 - t12;
+    t1 = C5 * t13;
+    t10 = t6 - t8;
+    t9 = C5 * t10;
+    t11 = t4 + t5;
+    t0 = t2 + t7;
+    t12 = t3 + t9;
+    t13 = t14 - t1;
+    t6 = t3 - t9;
+    t8 = t14 + t1;
+    re[63] = t11;
+    im[63] = t0;
+    re[3] = t12;
+    im[3] = t13;
+    re[33] = t6;
+    im[33] = t8;
+    t10 = X[146];
+    t4 = X[33];
+    t5 = C27 * t10;
+    t2 = C28 * t4;
+    t7 = t5 + t2;
+    t3 = (-C28) * t10;
+    t9 = C27 * t4;
+    t14 = t3 + t9;
+    t1 = X[26];
+    t11 = X[153];
+    t0 = C29 * t1;
+    t12 = C30 * t11;
+    t13 = t0 + t12;
+    t6 = (-C30) * t1;
+    t8 = C29 * t11;
+    t5 = t6 + t8;
+    t2 = X[86];
+    t10 = X[93];
+    t4 = C31 * t2;
+    t3 = C32 * t10;
+    t9 = t4 + t3;
+    t0 = (-C32) * t2;
+    t12 = C31 * t10;
+    t1 = t0 + t12;
+    t11 = t13 + t9;
+    t6 = t5 + t1;
+    t8 = C4 * t11;
+    t4 = t7 - t8;
+    t3 = C4 * t6;
+    t2 = t14 - t3;
+    t10 = t13 - t9;
+    t0 = C5 * t10;
+    t12 = t5 - t1;
+    t8 = C5 * t12;
+    t3 = t7 + t11;
+    t13 = t14 + t6;
+    t9 = t4 + t8;
+    t10 = t2 - t0;
+    t5 = t4 - t8;
+    t1 = t2 + t0;
+    t12 = t9 + t10;
+    t7 = C12 * t12;
+    t11 = t9 * (-C13);
+    t14 = t10 * C14;
+    t6 = t7 - t14;
+    t4 = t7 + t11;
+    t8 = t5 + t1;
+    t2 = C15 * t8;
+    t0 = t5 * (-C16);
+    t12 = t1 * (-C17);
+    t9 = t2 - t12;
+    t10 = t2 + t0;
+    re[73] = t3;
+    im[73] = t13;
+    re[13] = t6;
+    im[13] = t4;
+    re[43] = t9;
+    im[43] = t10;
+    t14 = X[166];
+    t7 = X[13];
+    t11 = C33 * t14;
+    t8 = C34 * t7;
+    t5 = t11 + t8;
+    t1 = (-C34) * t14;
+    t12 = C33 * t7;
+    t2 = t1 + t12;
+    t0 = X[46];
+    t3 = X[133];
+    t13 = C35 * t0;
+    t6 = C36 * t3;
+    t4 = t13 + t6;
+    t9 = (-C36) * t0;
+    t10 = C35 * t3;
+    t11 = t9 + t10;
+    t8 = X[106];
+    t14 = X[73];
+    t7 = C37 * t8;
+    t1 = C38 * t14;
+    t12 = t7 + t1;
+    t13 = (-C38) * t8;
+    t6 = C37 * t14;
+    t0 = t13 + t6;
+    t3 = t4 + t12;
+    t9 = t11 + t0;
+    t10 = C4 * t3;
+    t7 = t5 - t10;
+    t1 = C4 * t9;
+    t8 = t2 - t1;
+    t14 = t4 - t12;
+    t13 = C5 * t14;
+    t6 = t11 - t0;
+    t10 = C5 * t6;
+    t1 = t5 + t3;
+    t4 = t2 + t9;
+    t12 = t7 + t10;
+    t14 = t8 - t13;
+    t11 = t7 - t10;
+    t0 = t8 + t13;
+    t6 = t12 + t14;
+    t5 = C15 * t6;
+    t3 = t12 * (-C16);
+    t2 = t14 * (-C17);
+    t9 = t5 - t2;
+    t7 = t5 + t3;
+    t10 = t11 + t0;
+    t8 = (-C18) * t10;
+    t13 = t11 * C19;
+    t6 = t0 * (-C20);
+    t12 = t8 - t6;
+    t14 = t8 + t13;
+    re[83] = t1;
+    im[83] = t4;
+    re[23] = t9;
+    im[23] = t7;
+    re[53] = t12;
+    im[53] = t14;
+    t2 = re[63];
+    t5 = im[63];
+    t3 = re[73];
+    t10 = im[73];
+    t11 = re[83];
+    t0 = im[83];
+    t6 = t3 + t11;
+    t8 = t10 + t0;
+    t13 = C4 * t6;
+    t1 = t2 - t13;
+    t4 = C4 * t8;
+    t9 = t5 - t4;
+    t7 = t3 - t11;
+    t12 = C5 * t7;
+    t14 = t10 - t0;
+    t13 = C5 * t14;
+    t4 = t2 + t6;
+    t3 = t5 + t8;
+    t11 = t1 + t13;
+    t7 = t9 - t12;
+    t10 = t1 - t13;
+    t0 = t9 + t12;
+    re[63] = t4;
+    im[63] = t3;
+    re[73] = t11;
+    im[73] = t7;
+    re[83] = t10;
+    im[83] = t0;
+    t14 = re[3];
+    t2 = im[3];
+    t6 = re[13];
+    t5 = im[13];
+    t8 = re[23];
+    t1 = im[23];
+    t13 = t6 + t8;
+    t9 = t5 + t1;
+    t12 = C4 * t13;
+    t4 = t14 - t12;
+    t3 = C4 * t9;
+    t11 = t2 - t3;
+    t7 = t6 - t8;
+    t10 = C5 * t7;
+    t0 = t5 - t1;
+    t12 = C5 * t0;
+    t3 = t14 + t13;
+    t6 = t2 + t9;
+    t8 = t4 + t12;
+    t7 = t11 - t10;
+    t5 = t4 - t12;
+    t1 = t11 + t10;
+    re[3] = t3;
+    im[3] = t6;
+    re[13] = t8;
+    im[13] = t7;
+    re[23] = t5;
+    im[23] = t1;
+    t0 = re[33];
+    t14 = im[33];
+    t13 = re[43];
+    t2 = im[43];
+    t9 = re[53];
+    t4 = im[53];
+    t12 = t13 + t9;
+    t11 = t2 + t4;
+    t10 = C4 * t12;
+    t3 = t0 - t10;
+    t6 = C4 * t11;
+    t8 = t14 - t6;
+    t7 = t13 - t9;
+    t5 = C5 * t7;
+    t1 = t2 - t4;
+    t10 = C5 * t1;
+    t6 = t0 + t12;
+    t13 = t14 + t11;
+    t9 = t3 + t10;
+    t7 = t8 - t5;
+    t2 = t3 - t10;
+    t4 = t8 + t5;
+    re[33] = t6;
+    im[33] = t13;
+    re[43] = t9;
+    im[43] = t7;
+    re[53] = t2;
+    im[53] = t4;
+    t1 = X[162];
+    t0 = X[17];
+    t12 = C39 * t1;
+    t14 = C40 * t0;
+    t11 = t12 + t14;
+    t3 = (-C40) * t1;
+    t10 = C39 * t0;
+    t8 = t3 + t10;
+    t5 = X[42];
+    t6 = X[137];
+    t13 = C41 * t5;
+    t9 = C42 * t6;
+    t7 = t13 + t9;
+    t2 = (-C42) * t5;
+    t4 = C41 * t6;
+    t12 = t2 + t4;
+    t14 = X[102];
+    t1 = X[77];
+    t0 = C43 * t14;
+    t3 = C44 * t1;
+    t10 = t0 + t3;
+    t13 = (-C44) * t14;
+    t9 = C43 * t1;
+    t5 = t13 + t9;
+    t6 = t7 + t10;
+    t2 = t12 + t5;
+    t4 = C4 * t6;
+    t0 = t11 - t4;
+    t3 = C4 * t2;
+    t14 = t8 - t3;
+    t1 = t7 - t10;
+    t13 = C5 * t1;
+    t9 = t12 - t5;
+    t4 = C5 * t9;
+    t3 = t11 + t6;
+    t7 = t8 + t2;
+    t10 = t0 + t4;
+    t1 = t14 - t13;
+    t12 = t0 - t4;
+    t5 = t14 + t13;
+    re[81] = t3;
+    im[81] = t7;
+    re[21] = t10;
+    im[21] = t1;
+    re[51] = t12;
+    im[51] = t5;
+    t9 = X[2];
+    t11 = X[177];
+    t6 = C45 * t9;
+    t8 = C46 * t11;
+    t2 = t6 + t8;
+    t0 = (-C46) * t9;
+    t4 = C45 * t11;
+    t14 = t0 + t4;
+    t13 = X[62];
+    t3 = X[117];
+    t7 = C47 * t13;
+    t10 = C48 * t3;
+    t1 = t7 + t10;
+    t12 = (-C48) * t13;
+    t5 = C47 * t3;
+    t6 = t12 + t5;
+    t8 = X[122];
+    t9 = X[57];
+    t11 = C49 * t8;
+    t0 = C50 * t9;
+    t4 = t11 + t0;
+    t7 = (-C50) * t8;
+    t10 = C49 * t9;
+    t13 = t7 + t10;
+    t3 = t1 + t4;
+    t12 = t6 + t13;
+    t5 = C4 * t3;
+    t11 = t2 - t5;
+    t0 = C4 * t12;
+    t8 = t14 - t0;
+    t9 = t1 - t4;
+    t7 = C5 * t9;
+    t10 = t6 - t13;
+    t5 = C5 * t10;
+    t0 = t2 + t3;
+    t1 = t14 + t12;
+    t4 = t11 + t5;
+    t9 = t8 - t7;
+    t6 = t11 - t5;
+    t13 = t8 + t7;
+    t10 = t4 + t9;
+    t2 = C12 * t10;
+    t3 = t4 * (-C13);
+    t14 = t9 * C14;
+    t12 = t2 - t14;
+    t11 = t2 + t3;
+    t5 = t6 + t13;
+    t8 = C15 * t5;
+    t7 = t6 * (-C16);
+    t10 = t13 * (-C17);
+    t4 = t8 - t10;
+    t9 = t8 + t7;
+    re[1] = t0;
+    im[1] = t1;
+    re[31] = t12;
+    im[31] = t11;
+    re[61] = t4;
+    im[61] = t9;
+    t14 = X[22];
+    t2 = X[157];
+    t3 = C51 * t14;
+    t5 = C52 * t2;
+    t6 = t3 + t5;
+    t13 = (-C52) * t14;
+    t10 = C51 * t2;
+    t8 = t13 + t10;
+    t7 = X[82];
+    t0 = X[97];
+    t1 = C53 * t7;
+    t12 = C54 * t0;
+    t11 = t1 + t12;
+    t4 = (-C54) * t7;
+    t9 = C53 * t0;
+    t3 = t4 + t9;
+    t5 = X[142];
+    t14 = X[37];
+    t2 = C55 * t5;
+    t13 = C56 * t14;
+    t10 = t2 + t13;
+    t1 = (-C56) * t5;
+    t12 = C55 * t14;
+    t7 = t1 + t12;
+    t0 = t11 + t10;
+    t4 = t3 + t7;
+    t9 = C4 * t0;
+    t2 = t6 - t9;
+    t13 = C4 * t4;
+    t5 = t8 - t13;
+    t14 = t11 - t10;
+    t1 = C5 * t14;
+    t12 = t3 - t7;
+    t9 = C5 * t12;
+    t13 = t6 + t0;
+    t11 = t8 + t4;
+    t10 = t2 + t9;
+    t14 = t5 - t1;
+    t3 = t2 - t9;
+    t7 = t5 + t1;
+    t12 = t10 + t14;
+    t6 = C15 * t12;
+    t0 = t10 * (-C16);
+    t8 = t14 * (-C17);
+    t4 = t6 - t8;
+    t2 = t6 + t0;
+    t9 = t3 + t7;
+    t5 = (-C18) * t9;
+    t1 = t3 * C19;
+    t12 = t7 * (-C20);
+    t10 = t5 - t12;
+    t14 = t5 + t1;
+    re[11] = t13;
+    im[11] = t11;
+    re[41] = t4;
+    im[41] = t2;
+    re[71] = t10;
+    im[71] = t14;
+    t8 = re[81];
+    t6 = im[81];
+    t0 = re[1];
+    t9 = im[1];
+    t3 = re[11];
+    t7 = im[11];
+    t12 = t0 + t3;
+    t5 = t9 + t7;
+    t1 = C4 * t12;
+    t13 = t8 - t1;
+    t11 = C4 * t5;
+    t4 = t6 - t11;
+    t2 = t0 - t3;
+    t10 = C5 * t2;
+    t14 = t9 - t7;
+    t1 = C5 * t14;
+    t11 = t8 + t12;
+    t0 = t6 + t5;
+    t3 = t13 + t1;
+    t2 = t4 - t10;
+    t9 = t13 - t1;
+    t7 = t4 + t10;
+    re[81] = t11;
+    im[81] = t0;
+    re[1] = t3;
+    im[1] = t2;
+    re[11] = t9;
+    im[11] = t7;
+    t14 = re[21];
+    t8 = im[21];
+    t12 = re[31];
+    t6 = im[31];
+    t5 = re[41];
+    t13 = im[41];
+    t1 = t12 + t5;
+    t4 = t6 + t13;
+    t10 = C4 * t1;
+    t11 = t14 - t10;
+    t0 = C4 * t4;
+    t3 = t8 - t0;
+    t2 = t12 - t5;
+    t9 = C5 * t2;
+    t7 = t6 - t13;
+    t10 = C5 * t7;
+    t0 = t14 + t1;
+    t12 = t8 + t4;
+    t5 = t11 + t10;
+    t2 = t3 - t9;
+    t6 = t11 - t10;
+    t13 = t3 + t9;
+    re[21] = t0;
+    im[21] = t12;
+    re[31] = t5;
+    im[31] = t2;
+    re[41] = t6;
+    im[41] = t13;
+    t7 = re[51];
+    t14 = im[51];
+    t1 = re[61];
+    t8 = im[61];
+    t4 = re[71];
+    t11 = im[71];
+    t10 = t1 + t4;
+    t3 = t8 + t11;
+    t9 = C4 * t10;
+    t0 = t7 - t9;
+    t12 = C4 * t3;
+    t5 = t14 - t12;
+    t2 = t1 - t4;
+    t6 = C5 * t2;
+    t13 = t8 - t11;
+    t9 = C5 * t13;
+    t12 = t7 + t10;
+    t1 = t14 + t3;
+    t4 = t0 + t9;
+    t2 = t5 - t6;
+    t8 = t0 - t9;
+    t11 = t5 + t6;
+    re[51] = t12;
+    im[51] = t1;
+    re[61] = t4;
+    im[61] = t2;
+    re[71] = t8;
+    im[71] = t11;
+    t13 = X[18];
+    t7 = X[161];
+    t10 = C40 * t13;
+    t14 = C39 * t7;
+    t3 = t10 + t14;
+    t0 = (-C39) * t13;
+    t9 = C40 * t7;
+    t5 = t0 + t9;
+    t6 = X[78];
+    t12 = X[101];
+    t1 = C44 * t6;
+    t4 = C43 * t12;
+    t2 = t1 + t4;
+    t8 = (-C43) * t6;
+    t11 = C44 * t12;
+    t10 = t8 + t11;
+    t14 = X[138];
+    t13 = X[41];
+    t7 = C42 * t14;
+    t0 = C41 * t13;
+    t9 = t7 + t0;
+    t1 = (-C41) * t14;
+    t4 = C42 * t13;
+    t6 = t1 + t4;
+    t12 = t2 + t9;
+    t8 = t10 + t6;
+    t11 = C4 * t12;
+    t7 = t3 - t11;
+    t0 = C4 * t8;
+    t14 = t5 - t0;
+    t13 = t2 - t9;
+    t1 = C5 * t13;
+    t4 = t10 - t6;
+    t11 = C5 * t4;
+    t0 = t3 + t12;
+    t2 = t5 + t8;
+    t9 = t7 + t11;
+    t13 = t14 - t1;
+    t10 = t7 - t11;
+    t6 = t14 + t1;
+    re[9] = t0;
+    im[9] = t2;
+    re[39] = t9;
+    im[39] = t13;
+    re[69] = t10;
+    im[69] = t6;
+    t4 = X[38];
+    t3 = X[141];
+    t12 = C56 * t4;
+    t5 = C55 * t3;
+    t8 = t12 + t5;
+    t7 = (-C55) * t4;
+    t11 = C56 * t3;
+    t14 = t7 + t11;
+    t1 = X[98];
+    t0 = X[81];
+    t2 = C54 * t1;
+    t9 = C53 * t0;
+    t13 = t2 + t9;
+    t10 = (-C53) * t1;
+    t6 = C54 * t0;
+    t12 = t10 + t6;
+    t5 = X[158];
+    t4 = X[21];
+    t3 = C52 * t5;
+    t7 = C51 * t4;
+    t11 = t3 + t7;
+    t2 = (-C51) * t5;
+    t9 = C52 * t4;
+    t1 = t2 + t9;
+    t0 = t13 + t11;
+    t10 = t12 + t1;
+    t6 = C4 * t0;
+    t3 = t8 - t6;
+    t7 = C4 * t10;
+    t5 = t14 - t7;
+    t4 = t13 - t11;
+    t2 = C5 * t4;
+    t9 = t12 - t1;
+    t6 = C5 * t9;
+    t7 = t8 + t0;
+    t13 = t14 + t10;
+    t11 = t3 + t6;
+    t4 = t5 - t2;
+    t12 = t3 - t6;
+    t1 = t5 + t2;
+    t9 = t11 + t4;
+    t8 = C12 * t9;
+    t0 = t11 * (-C13);
+    t14 = t4 * C14;
+    t10 = t8 - t14;
+    t3 = t8 + t0;
+    t6 = t12 + t1;
+    t5 = C15 * t6;
+    t2 = t12 * (-C16);
+    t9 = t1 * (-C17);
+    t11 = t5 - t9;
+    t4 = t5 + t2;
+    re[19] = t7;
+    im[19] = t13;
+    re[49] = t10;
+    im[49] = t3;
+    re[79] = t11;
+    im[79] = t4;
+    t14 = X[58];
+    t8 = X[121];
+    t0 = C50 * t14;
+    t6 = C49 * t8;
+    t12 = t0 + t6;
+    t1 = (-C49) * t14;
+    t9 = C50 * t8;
+    t5 = t1 + t9;
+    t2 = X[118];
+    t7 = X[61];
+    t13 = C48 * t2;
+    t10 = C47 * t7;
+    t3 = t13 + t10;
+    t11 = (-C47) * t2;
+    t4 = C48 * t7;
+    t0 = t11 + t4;
+    t6 = X[178];
+    t14 = X[1];
+    t8 = C46 * t6;
+    t1 = C45 * t14;
+    t9 = t8 + t1;
+    t13 = (-C45) * t6;
+    t10 = C46 * t14;
+    t2 = t13 + t10;
+    t7 = t3 + t9;
+    t11 = t0 + t2;
+    t4 = C4 * t7;
+    t8 = t12 - t4;
+    t1 = C4 * t11;
+    t6 = t5 - t1;
+    t14 = t3 - t9;
+    t13 = C5 * t14;
+    t10 = t0 - t2;
+    t4 = C5 * t10;
+    t1 = t12 + t7;
+    t3 = t5 + t11;
+    t9 = t8 + t4;
+    t14 = t6 - t13;
+    t0 = t8 - t4;
+    t2 = t6 + t13;
+    t10 = t9 + t14;
+    t12 = C15 * t10;
+    t7 = t9 * (-C16);
+    t5 = t14 * (-C17);
+    t11 = t12 - t5;
+    t8 = t12 + t7;
+    t4 = t0 + t2;
+    t6 = (-C18) * t4;
+    t13 = t0 * C19;
+    t10 = t2 * (-C20);
+    t9 = t6 - t10;
+    t14 = t6 + t13;
+    re[29] = t1;
+    im[29] = t3;
+    re[59] = t11;
+    im[59] = t8;
+    re[89] = t9;
+    im[89] = t14;
+    t5 = re[9];
+    t12 = im[9];
+    t7 = re[19];
+    t4 = im[19];
+    t0 = re[29];
+    t2 = im[29];
+    t10 = t7 + t0;
+    t6 = t4 + t2;
+    t13 = C4 * t10;
+    t1 = t5 - t13;
+    t3 = C4 * t6;
+    t11 = t12 - t3;
+    t8 = t7 - t0;
+    t9 = C5 * t8;
+    t14 = t4 - t2;
+    t13 = C5 * t14;
+    t3 = t5 + t10;
+    t7 = t12 + t6;
+    t0 = t1 + t13;
+    t8 = t11 - t9;
+    t4 = t1 - t13;
+    t2 = t11 + t9;
+    re[9] = t3;
+    im[9] = t7;
+    re[19] = t0;
+    im[19] = t8;
+    re[29] = t4;
+    im[29] = t2;
+    t14 = re[39];
+    t5 = im[39];
+    t10 = re[49];
+    t12 = im[49];
+    t6 = re[59];
+    t1 = im[59];
+    t13 = t10 + t6;
+    t11 = t12 + t1;
+    t9 = C4 * t13;
+    t3 = t14 - t9;
+    t7 = C4 * t11;
+    t0 = t5 - t7;
+    t8 = t10 - t6;
+    t4 = C5 * t8;
+    t2 = t12 - t1;
+    t9 = C5 * t2;
+    t7 = t14 + t13;
+    t10 = t5 + t11;
+    t6 = t3 + t9;
+    t8 = t0 - t4;
+    t12 = t3 - t9;
+    t1 = t0 + t4;
+    re[39] = t7;
+    im[39] = t10;
+    re[49] = t6;
+    im[49] = t8;
+    re[59] = t12;
+    im[59] = t1;
+    t2 = re[69];
+    t14 = im[69];
+    t13 = re[79];
+    t5 = im[79];
+    t11 = re[89];
+    t3 = im[89];
+    t9 = t13 + t11;
+    t0 = t5 + t3;
+    t4 = C4 * t9;
+    t7 = t2 - t4;
+    t10 = C4 * t0;
+    t6 = t14 - t10;
+    t8 = t13 - t11;
+    t12 = C5 * t8;
+    t1 = t5 - t3;
+    t4 = C5 * t1;
+    t10 = t2 + t9;
+    t13 = t14 + t0;
+    t11 = t7 + t4;
+    t8 = t6 - t12;
+    t5 = t7 - t4;
+    t3 = t6 + t12;
+    re[69] = t10;
+    im[69] = t13;
+    re[79] = t11;
+    im[79] = t8;
+    re[89] = t5;
+    im[89] = t3;
+    t1 = X[54];
+    t2 = X[125];
+    t9 = C22 * t1;
+    t14 = C21 * t2;
+    t0 = t9 + t14;
+    t7 = (-C21) * t1;
+    t4 = C22 * t2;
+    t6 = t7 + t4;
+    t12 = X[114];
+    t10 = X[65];
+    t13 = C26 * t12;
+    t11 = C25 * t10;
+    t8 = t13 + t11;
+    t5 = (-C25) * t12;
+    t3 = C26 * t10;
+    t9 = t5 + t3;
+    t14 = X[174];
+    t1 = X[5];
+    t2 = C24 * t14;
+    t7 = C23 * t1;
+    t4 = t2 + t7;
+    t13 = (-C23) * t14;
+    t11 = C24 * t1;
+    t12 = t13 + t11;
+    t10 = t8 + t4;
+    t5 = t9 + t12;
+    t3 = C4 * t10;
+    t2 = t0 - t3;
+    t7 = C4 * t5;
+    t14 = t6 - t7;
+    t1 = t8 - t4;
+    t13 = C5 * t1;
+    t11 = t9 - t12;
+    t3 = C5 * t11;
+    t7 = t0 + t10;
+    t8 = t6 + t5;
+    t4 = t2 + t3;
+    t1 = t14 - t13;
+    t9 = t2 - t3;
+    t12 = t14 + t13;
+    re[27] = t7;
+    im[27] = t8;
+    re[57] = t4;
+    im[57] = t1;
+    re[87] = t9;
+    im[87] = t12;
+    t11 = X[74];
+    t0 = X[105];
+    t10 = C38 * t11;
+    t6 = C37 * t0;
+    t5 = t10 + t6;
+    t2 = (-C37) * t11;
+    t3 = C38 * t0;
+    t14 = t2 + t3;
+    t13 = X[134];
+    t7 = X[45];
+    t8 = C36 * t13;
+    t4 = C35 * t7;
+    t1 = t8 + t4;
+    t9 = (-C35) * t13;
+    t12 = C36 * t7;
+    t10 = t9 + t12;
+    t6 = X[14];
+    t11 = X[165];
+    t0 = C34 * t6;
+    t2 = C33 * t11;
+    t3 = t0 + t2;
+    t8 = (-C33) * t6;
+    t4 = C34 * t11;
+    t13 = t8 + t4;
+    t7 = t1 + t3;
+    t9 = t10 + t13;
+    t12 = C4 * t7;
+    t0 = t5 - t12;
+    t2 = C4 * t9;
+    t6 = t14 - t2;
+    t11 = t1 - t3;
+    t8 = C5 * t11;
+    t4 = t10 - t13;
+    t12 = C5 * t4;
+    t2 = t5 + t7;
+    t1 = t14 + t9;
+    t3 = t0 + t12;
+    t11 = t6 - t8;
+    t10 = t0 - t12;
+    t13 = t6 + t8;
+    t4 = t3 + t11;
+    t5 = C12 * t4;
+    t7 = t3 * (-C13);
+    t14 = t11 * C14;
+    t9 = t5 - t14;
+    t0 = t5 + t7;
+    t12 = t10 + t13;
+    t6 = C15 * t12;
+    t8 = t10 * (-C16);
+    t4 = t13 * (-C17);
+    t3 = t6 - t4;
+    t11 = t6 + t8;
+    re[37] = t2;
+    im[37] = t1;
+    re[67] = t9;
+    im[67] = t0;
+    re[7] = t3;
+    im[7] = t11;
+    t14 = X[94];
+    t5 = X[85];
+    t7 = C32 * t14;
+    t12 = C31 * t5;
+    t10 = t7 + t12;
+    t13 = (-C31) * t14;
+    t4 = C32 * t5;
+    t6 = t13 + t4;
+    t8 = X[154];
+    t2 = X[25];
+    t1 = C30 * t8;
+    t9 = C29 * t2;
+    t0 = t1 + t9;
+    t3 = (-C29) * t8;
+    t11 = C30 * t2;
+    t7 = t3 + t11;
+    t12 = X[34];
+    t14 = X[145];
+    t5 = C28 * t12;
+    t13 = C27 * t14;
+    t4 = t5 + t13;
+    t1 = (-C27) * t12;
+    t9 = C28 * t14;
+    t8 = t1 + t9;
+    t2 = t0 + t4;
+    t3 = t7 + t8;
+    t11 = C4 * t2;
+    t5 = t10 - t11;
+    t13 = C4 * t3;
+    t12 = t6 - t13;
+    t14 = t0 - t4;
+    t1 = C5 * t14;
+    t9 = t7 - t8;
+    t11 = C5 * t9;
+    t13 = t10 + t2;
+    t0 = t6 + t3;
+    t4 = t5 + t11;
+    t14 = t12 - t1;
+    t7 = t5 - t11;
+    t8 = t12 + t1;
+    t9 = t4 + t14;
+    t10 = C15 * t9;
+    t2 = t4 * (-C16);
+    t6 = t14 * (-C17);
+    t3 = t10 - t6;
+    t5 = t10 + t2;
+    t11 = t7 + t8;
+    t12 = (-C18) * t11;
+    t1 = t7 * C19;
+    t9 = t8 * (-C20);
+    t4 = t12 - t9;
+    t14 = t12 + t1;
+    re[47] = t13;
+    im[47] = t0;
+    re[77] = t3;
+    im[77] = t5;
+    re[17] = t4;
+    im[17] = t14;
+    t6 = re[27];
+    t10 = im[27];
+    t2 = re[37];
+    t11 = im[37];
+    t7 = re[47];
+    t8 = im[47];
+    t9 = t2 + t7;
+    t12 = t11 + t8;
+    t1 = C4 * t9;
+    t13 = t6 - t1;
+    t0 = C4 * t12;
+    t3 = t10 - t0;
+    t5 = t2 - t7;
+    t4 = C5 * t5;
+    t14 = t11 - t8;
+    t1 = C5 * t14;
+    t0 = t6 + t9;
+    t2 = t10 + t12;
+    t7 = t13 + t1;
+    t5 = t3 - t4;
+    t11 = t13 - t1;
+    t8 = t3 + t4;
+    re[27] = t0;
+    im[27] = t2;
+    re[37] = t7;
+    im[37] = t5;
+    re[47] = t11;
+    im[47] = t8;
+    t14 = re[57];
+    t6 = im[57];
+    t9 = re[67];
+    t10 = im[67];
+    t12 = re[77];
+    t13 = im[77];
+    t1 = t9 + t12;
+    t3 = t10 + t13;
+    t4 = C4 * t1;
+    t0 = t14 - t4;
+    t2 = C4 * t3;
+    t7 = t6 - t2;
+    t5 = t9 - t12;
+    t11 = C5 * t5;
+    t8 = t10 - t13;
+    t4 = C5 * t8;
+    t2 = t14 + t1;
+    t9 = t6 + t3;
+    t12 = t0 + t4;
+    t5 = t7 - t11;
+    t10 = t0 - t4;
+    t13 = t7 + t11;
+    re[57] = t2;
+    im[57] = t9;
+    re[67] = t12;
+    im[67] = t5;
+    re[77] = t10;
+    im[77] = t13;
+    t8 = re[87];
+    t14 = im[87];
+    t1 = re[7];
+    t6 = im[7];
+    t3 = re[17];
+    t0 = im[17];
+    t4 = t1 + t3;
+    t7 = t6 + t0;
+    t11 = C4 * t4;
+    t2 = t8 - t11;
+    t9 = C4 * t7;
+    t12 = t14 - t9;
+    t5 = t1 - t3;
+    t10 = C5 * t5;
+    t13 = t6 - t0;
+    t11 = C5 * t13;
+    t9 = t8 + t4;
+    t1 = t14 + t7;
+    t3 = t2 + t11;
+    t5 = t12 - t10;
+    t6 = t2 - t11;
+    t0 = t12 + t10;
+    re[87] = t9;
+    im[87] = t1;
+    re[7] = t3;
+    im[7] = t5;
+    re[17] = t6;
+    im[17] = t0;
+    t13 = re[45];
+    t8 = im[45];
+    t4 = re[63];
+    t14 = im[63];
+    t7 = re[81];
+    t2 = im[81];
+    t11 = re[9];
+    t12 = im[9];
+    t10 = re[27];
+    t9 = im[27];
+    t1 = t4 + t10;
+    t3 = t14 + t9;
+    t5 = t7 + t11;
+    t6 = t2 + t12;
+    t0 = t4 - t10;
+    t4 = t14 - t9;
+    t10 = t7 - t11;
+    t14 = t2 - t12;
+    t9 = t1 + t5;
+    t7 = t3 + t6;
+    t11 = t1 - t5;
+    t2 = C57 * t11;
+    t12 = t3 - t6;
+    t1 = C57 * t12;
+    t5 = C58 * t9;
+    t11 = t13 - t5;
+    t3 = C58 * t7;
+    t6 = t8 - t3;
+    t12 = t11 + t2;
+    t5 = t6 + t1;
+    t3 = t11 - t2;
+    t11 = t6 - t1;
+    t2 = C59 * t0;
+    t6 = C60 * t10;
+    t1 = t2 + t6;
+    t2 = C59 * t4;
+    t6 = C60 * t14;
+    t2 = t2 + t6;
+    t6 = C60 * t0;
+    t0 = C59 * t10;
+    t10 = t6 - t0;
+    t6 = C60 * t4;
+    t0 = C59 * t14;
+    t4 = t6 - t0;
+    t14 = t13 + t9;
+    t6 = t8 + t7;
+    t0 = t12 + t2;
+    t13 = t5 - t1;
+    t9 = t3 + t4;
+    t8 = t11 - t10;
+    t7 = t3 - t4;
+    t3 = t11 + t10;
+    t4 = t12 - t2;
+    t11 = t5 + t1;
+    re[45] = t14;
+    im[45] = t6;
+    re[63] = t0;
+    im[63] = t13;
+    re[81] = t9;
+    im[81] = t8;
+    re[9] = t7;
+    im[9] = t3;
+    re[27] = t4;
+    im[27] = t11;
+    t10 = re[75];
+    t12 = im[75];
+    t2 = re[3];
+    t5 = im[3];
+    t1 = re[21];
+    t14 = im[21];
+    t6 = re[39];
+    t0 = im[39];
+    t13 = re[57];
+    t9 = im[57];
+    t8 = t2 + t13;
+    t7 = t5 + t9;
+    t3 = t1 + t6;
+    t4 = t14 + t0;
+    t11 = t2 - t13;
+    t2 = t5 - t9;
+    t13 = t1 - t6;
+    t5 = t14 - t0;
+    t9 = t8 + t3;
+    t1 = t7 + t4;
+    t6 = t8 - t3;
+    t14 = C57 * t6;
+    t0 = t7 - t4;
+    t8 = C57 * t0;
+    t3 = C58 * t9;
+    t6 = t10 - t3;
+    t7 = C58 * t1;
+    t4 = t12 - t7;
+    t0 = t6 + t14;
+    t3 = t4 + t8;
+    t7 = t6 - t14;
+    t6 = t4 - t8;
+    t14 = C59 * t11;
+    t4 = C60 * t13;
+    t8 = t14 + t4;
+    t14 = C59 * t2;
+    t4 = C60 * t5;
+    t14 = t14 + t4;
+    t4 = C60 * t11;
+    t11 = C59 * t13;
+    t13 = t4 - t11;
+    t4 = C60 * t2;
+    t11 = C59 * t5;
+    t2 = t4 - t11;
+    t5 = t10 + t9;
+    t4 = t12 + t1;
+    t11 = t0 + t14;
+    t10 = t3 - t8;
+    t9 = t7 + t2;
+    t12 = t6 - t13;
+    t1 = t7 - t2;
+    t7 = t6 + t13;
+    t2 = t0 - t14;
+    t6 = t3 + t8;
+    re[75] = t5;
+    im[75] = t4;
+    re[3] = t11;
+    im[3] = t10;
+    re[21] = t9;
+    im[21] = t12;
+    re[39] = t1;
+    im[39] = t7;
+    re[57] = t2;
+    im[57] = t6;
+    t13 = re[15];
+    t0 = im[15];
+    t14 = re[33];
+    t3 = im[33];
+    t8 = re[51];
+    t5 = im[51];
+    t4 = re[69];
+    t11 = im[69];
+    t10 = re[87];
+    t9 = im[87];
+    t12 = t14 + t10;
+    t1 = t3 + t9;
+    t7 = t8 + t4;
+    t2 = t5 + t11;
+    t6 = t14 - t10;
+    t14 = t3 - t9;
+    t10 = t8 - t4;
+    t3 = t5 - t11;
+    t9 = t12 + t7;
+    t8 = t1 + t2;
+    t4 = t12 - t7;
+    t5 = C57 * t4;
+    t11 = t1 - t2;
+    t12 = C57 * t11;
+    t7 = C58 * t9;
+    t4 = t13 - t7;
+    t1 = C58 * t8;
+    t2 = t0 - t1;
+    t11 = t4 + t5;
+    t7 = t2 + t12;
+    t1 = t4 - t5;
+    t4 = t2 - t12;
+    t5 = C59 * t6;
+    t2 = C60 * t10;
+    t12 = t5 + t2;
+    t5 = C59 * t14;
+    t2 = C60 * t3;
+    t5 = t5 + t2;
+    t2 = C60 * t6;
+    t6 = C59 * t10;
+    t10 = t2 - t6;
+    t2 = C60 * t14;
+    t6 = C59 * t3;
+    t14 = t2 - t6;
+    t3 = t13 + t9;
+    t2 = t0 + t8;
+    t6 = t11 + t5;
+    t13 = t7 - t12;
+    t9 = t1 + t14;
+    t0 = t4 - t10;
+    t8 = t1 - t14;
+    t1 = t4 + t10;
+    t14 = t11 - t5;
+    t4 = t7 + t12;
+    re[15] = t3;
+    im[15] = t2;
+    re[33] = t6;
+    im[33] = t13;
+    re[51] = t9;
+    im[51] = t0;
+    re[69] = t8;
+    im[69] = t1;
+    re[87] = t14;
+    im[87] = t4;
+    t10 = re[55];
+    t11 = im[55];
+    t5 = re[73];
+    t7 = im[73];
+    t12 = re[1];
+    t3 = im[1];
+    t2 = re[19];
+    t6 = im[19];
+    t13 = re[37];
+    t9 = im[37];
+    t0 = t5 + t13;
+    t8 = t7 + t9;
+    t1 = t12 + t2;
+    t14 = t3 + t6;
+    t4 = t5 - t13;
+    t5 = t7 - t9;
+    t13 = t12 - t2;
+    t7 = t3 - t6;
+    t9 = t0 + t1;
+    t12 = t8 + t14;
+    t2 = t0 - t1;
+    t3 = C57 * t2;
+    t6 = t8 - t14;
+    t0 = C57 * t6;
+    t1 = C58 * t9;
+    t2 = t10 - t1;
+    t8 = C58 * t12;
+    t14 = t11 - t8;
+    t6 = t2 + t3;
+    t1 = t14 + t0;
+    t8 = t2 - t3;
+    t2 = t14 - t0;
+    t3 = C59 * t4;
+    t14 = C60 * t13;
+    t0 = t3 + t14;
+    t3 = C59 * t5;
+    t14 = C60 * t7;
+    t3 = t3 + t14;
+    t14 = C60 * t4;
+    t4 = C59 * t13;
+    t13 = t14 - t4;
+    t14 = C60 * t5;
+    t4 = C59 * t7;
+    t5 = t14 - t4;
+    t7 = t10 + t9;
+    t14 = t11 + t12;
+    t4 = t6 + t3;
+    t10 = t1 - t0;
+    t9 = t8 + t5;
+    t11 = t2 - t13;
+    t12 = t8 - t5;
+    t8 = t2 + t13;
+    t5 = t6 - t3;
+    t2 = t1 + t0;
+    re[55] = t7;
+    im[55] = t14;
+    re[73] = t4;
+    im[73] = t10;
+    re[1] = t9;
+    im[1] = t11;
+    re[19] = t12;
+    im[19] = t8;
+    re[37] = t5;
+    im[37] = t2;
+    t13 = re[85];
+    t6 = im[85];
+    t3 = re[13];
+    t1 = im[13];
+    t0 = re[31];
+    t7 = im[31];
+    t14 = re[49];
+    t4 = im[49];
+    t10 = re[67];
+    t9 = im[67];
+    t11 = t3 + t10;
+    t12 = t1 + t9;
+    t8 = t0 + t14;
+    t5 = t7 + t4;
+    t2 = t3 - t10;
+    t3 = t1 - t9;
+    t10 = t0 - t14;
+    t1 = t7 - t4;
+    t9 = t11 + t8;
+    t0 = t12 + t5;
+    t14 = t11 - t8;
+    t7 = C57 * t14;
+    t4 = t12 - t5;
+    t11 = C57 * t4;
+    t8 = C58 * t9;
+    t14 = t13 - t8;
+    t12 = C58 * t0;
+    t5 = t6 - t12;
+    t4 = t14 + t7;
+    t8 = t5 + t11;
+    t12 = t14 - t7;
+    t14 = t5 - t11;
+    t7 = C59 * t2;
+    t5 = C60 * t10;
+    t11 = t7 + t5;
+    t7 = C59 * t3;
+    t5 = C60 * t1;
+    t7 = t7 + t5;
+    t5 = C60 * t2;
+    t2 = C59 * t10;
+    t10 = t5 - t2;
+    t5 = C60 * t3;
+    t2 = C59 * t1;
+    t3 = t5 - t2;
+    t1 = t13 + t9;
+    t5 = t6 + t0;
+    t2 = t4 + t7;
+    t13 = t8 - t11;
+    t9 = t12 + t3;
+    t6 = t14 - t10;
+    t0 = t12 - t3;
+    t12 = t14 + t10;
+    t3 = t4 - t7;
+    t14 = t8 + t11;
+    re[85] = t1;
+    im[85] = t5;
+    re[13] = t2;
+    im[13] = t13;
+    re[31] = t9;
+    im[31] = t6;
+    re[49] = t0;
+    im[49] = t12;
+    re[67] = t3;
+    im[67] = t14;
+    t10 = re[25];
+    t4 = im[25];
+    t7 = re[43];
+    t8 = im[43];
+    t11 = re[61];
+    t1 = im[61];
+    t5 = re[79];
+    t2 = im[79];
+    t13 = re[7];
+    t9 = im[7];
+    t6 = t7 + t13;
+    t0 = t8 + t9;
+    t12 = t11 + t5;
+    t3 = t1 + t2;
+    t14 = t7 - t13;
+    t7 = t8 - t9;
+    t13 = t11 - t5;
+    t8 = t1 - t2;
+    t9 = t6 + t12;
+    t11 = t0 + t3;
+    t5 = t6 - t12;
+    t1 = C57 * t5;
+    t2 = t0 - t3;
+    t6 = C57 * t2;
+    t12 = C58 * t9;
+    t5 = t10 - t12;
+    t0 = C58 * t11;
+    t3 = t4 - t0;
+    t2 = t5 + t1;
+    t12 = t3 + t6;
+    t0 = t5 - t1;
+    t5 = t3 - t6;
+    t1 = C59 * t14;
+    t3 = C60 * t13;
+    t6 = t1 + t3;
+    t1 = C59 * t7;
+    t3 = C60 * t8;
+    t1 = t1 + t3;
+    t3 = C60 * t14;
+    t14 = C59 * t13;
+    t13 = t3 - t14;
+    t3 = C60 * t7;
+    t14 = C59 * t8;
+    t7 = t3 - t14;
+    t8 = t10 + t9;
+    t3 = t4 + t11;
+    t14 = t2 + t1;
+    t10 = t12 - t6;
+    t9 = t0 + t7;
+    t4 = t5 - t13;
+    t11 = t0 - t7;
+    t0 = t5 + t13;
+    t7 = t2 - t1;
+    t5 = t12 + t6;
+    re[25] = t8;
+    im[25] = t3;
+    re[43] = t14;
+    im[43] = t10;
+    re[61] = t9;
+    im[61] = t4;
+    re[79] = t11;
+    im[79] = t0;
+    re[7] = t7;
+    im[7] = t5;
+    t13 = re[65];
+    t2 = im[65];
+    t1 = re[83];
+    t12 = im[83];
+    t6 = re[11];
+    t8 = im[11];
+    t3 = re[29];
+    t14 = im[29];
+    t10 = re[47];
+    t9 = im[47];
+    t4 = t1 + t10;
+    t11 = t12 + t9;
+    t0 = t6 + t3;
+    t7 = t8 + t14;
+    t5 = t1 - t10;
+    t1 = t12 - t9;
+    t10 = t6 - t3;
+    t12 = t8 - t14;
+    t9 = t4 + t0;
+    t6 = t11 + t7;
+    t3 = t4 - t0;
+    t8 = C57 * t3;
+    t14 = t11 - t7;
+    t4 = C57 * t14;
+    t0 = C58 * t9;
+    t3 = t13 - t0;
+    t11 = C58 * t6;
+    t7 = t2 - t11;
+    t14 = t3 + t8;
+    t0 = t7 + t4;
+    t11 = t3 - t8;
+    t3 = t7 - t4;
+    t8 = C59 * t5;
+    t7 = C60 * t10;
+    t4 = t8 + t7;
+    t8 = C59 * t1;
+    t7 = C60 * t12;
+    t8 = t8 + t7;
+    t7 = C60 * t5;
+    t5 = C59 * t10;
+    t10 = t7 - t5;
+    t7 = C60 * t1;
+    t5 = C59 * t12;
+    t1 = t7 - t5;
+    t12 = t13 + t9;
+    t7 = t2 + t6;
+    t5 = t14 + t8;
+    t13 = t0 - t4;
+    t9 = t11 + t1;
+    t2 = t3 - t10;
+    t6 = t11 - t1;
+    t11 = t3 + t10;
+    t1 = t14 - t8;
+    t3 = t0 + t4;
+    re[65] = t12;
+    im[65] = t7;
+    re[83] = t5;
+    im[83] = t13;
+    re[11] = t9;
+    im[11] = t2;
+    re[29] = t6;
+    im[29] = t11;
+    re[47] = t1;
+    im[47] = t3;
+    t10 = re[5];
+    t14 = im[5];
+    t8 = re[23];
+    t0 = im[23];
+    t4 = re[41];
+    t12 = im[41];
+    t7 = re[59];
+    t5 = im[59];
+    t13 = re[77];
+    t9 = im[77];
+    t2 = t8 + t13;
+    t6 = t0 + t9;
+    t11 = t4 + t7;
+    t1 = t12 + t5;
+    t3 = t8 - t13;
+    t8 = t0 - t9;
+    t13 = t4 - t7;
+    t0 = t12 - t5;
+    t9 = t2 + t11;
+    t4 = t6 + t1;
+    t7 = t2 - t11;
+    t12 = C57 * t7;
+    t5 = t6 - t1;
+    t2 = C57 * t5;
+    t11 = C58 * t9;
+    t7 = t10 - t11;
+    t6 = C58 * t4;
+    t1 = t14 - t6;
+    t5 = t7 + t12;
+    t11 = t1 + t2;
+    t6 = t7 - t12;
+    t7 = t1 - t2;
+    t12 = C59 * t3;
+    t1 = C60 * t13;
+    t2 = t12 + t1;
+    t12 = C59 * t8;
+    t1 = C60 * t0;
+    t12 = t12 + t1;
+    t1 = C60 * t3;
+    t3 = C59 * t13;
+    t13 = t1 - t3;
+    t1 = C60 * t8;
+    t3 = C59 * t0;
+    t8 = t1 - t3;
+    t0 = t10 + t9;
+    t1 = t14 + t4;
+    t3 = t5 + t12;
+    t10 = t11 - t2;
+    t9 = t6 + t8;
+    t14 = t7 - t13;
+    t4 = t6 - t8;
+    t6 = t7 + t13;
+    t8 = t5 - t12;
+    t7 = t11 + t2;
+    re[5] = t0;
+    im[5] = t1;
+    re[23] = t3;
+    im[23] = t10;
+    re[41] = t9;
+    im[41] = t14;
+    re[59] = t4;
+    im[59] = t6;
+    re[77] = t8;
+    im[77] = t7;
+    t13 = re[35];
+    t5 = im[35];
+    t12 = re[53];
+    t11 = im[53];
+    t2 = re[71];
+    t0 = im[71];
+    t1 = re[89];
+    t3 = im[89];
+    t10 = re[17];
+    t9 = im[17];
+    t14 = t12 + t10;
+    t4 = t11 + t9;
+    t6 = t2 + t1;
+    t8 = t0 + t3;
+    t7 = t12 - t10;
+    t12 = t11 - t9;
+    t10 = t2 - t1;
+    t11 = t0 - t3;
+    t9 = t14 + t6;
+    t2 = t4 + t8;
+    t1 = t14 - t6;
+    t0 = C57 * t1;
+    t3 = t4 - t8;
+    t14 = C57 * t3;
+    t6 = C58 * t9;
+    t1 = t13 - t6;
+    t4 = C58 * t2;
+    t8 = t5 - t4;
+    t3 = t1 + t0;
+    t6 = t8 + t14;
+    t4 = t1 - t0;
+    t1 = t8 - t14;
+    t0 = C59 * t7;
+    t8 = C60 * t10;
+    t14 = t0 + t8;
+    t0 = C59 * t12;
+    t8 = C60 * t11;
+    t0 = t0 + t8;
+    t8 = C60 * t7;
+    t7 = C59 * t10;
+    t10 = t8 - t7;
+    t8 = C60 * t12;
+    t7 = C59 * t11;
+    t12 = t8 - t7;
+    t11 = t13 + t9;
+    t8 = t5 + t2;
+    t7 = t3 + t0;
+    t13 = t6 - t14;
+    t9 = t4 + t12;
+    t5 = t1 - t10;
+    t2 = t4 - t12;
+    t4 = t1 + t10;
+    t12 = t3 - t0;
+    t1 = t6 + t14;
+    re[35] = t11;
+    im[35] = t8;
+    re[53] = t7;
+    im[53] = t13;
+    re[71] = t9;
+    im[71] = t5;
+    re[89] = t2;
+    im[89] = t4;
+    re[17] = t12;
+    im[17] = t1;
+    t10 = re[0];
+    t3 = im[0];
+    t0 = re[45];
+    t6 = im[45];
+    t14 = t10 - t0;
+    t11 = t3 - t6;
+    t8 = t10 + t0;
+    t7 = t3 + t6;
+    t13 = (-C61) * t8;
+    t9 = (-C62) * t7;
+    t5 = t13 + t9;
+    t2 = 0.10283148949142575 * t5;
+    y[269] = t2;
+    t4 = 0.10195818372679734 * t5;
+    y[270] = t4;
+    t12 = C62 * t8;
+    t1 = (-C61) * t7;
+    t10 = t12 + t1;
+    t0 = 0.05341685744944068 * t10;
+    y[89] = t0;
+    t3 = (-0.05508843033578144) * t10;
+    y[90] = t3;
+    t6 = C63 * t14;
+    t13 = C64 * t11;
+    t9 = t6 + t13;
+    y[0] = 0;
+    t2 = (-0.10545185135140951) * t9;
+    y[179] = t2;
+    t5 = (-C64) * t14;
+    t4 = C63 * t11;
+    t8 = t5 + t4;
+    t7 = 0.10536667653263153 * t8;
+    y[180] = t7;
+    t12 = 0.00020774573354068366 * t8;
+    y[359] = t12;
+    t1 = re[48];
+    t0 = im[48];
+    t10 = re[3];
+    t3 = im[3];
+    t6 = t1 - t10;
+    t13 = t0 - t3;
+    t9 = t1 + t10;
+    t2 = t0 + t3;
+    t14 = C65 * t9;
+    t11 = C66 * t2;
+    t5 = t14 + t11;
+    y[2] = 0;
+    t4 = (-0.10562110222762526) * t5;
+    y[177] = t4;
+    t7 = (-C66) * t9;
+    t8 = C65 * t2;
+    t12 = t7 + t8;
+    t1 = 0.10519783335687435 * t12;
+    y[182] = t1;
+    t10 = 0.00043475807173410746 * t12;
+    y[357] = t10;
+    t0 = (-C67) * t6;
+    t3 = (-C68) * t13;
+    t14 = t0 + t3;
+    t11 = 0.10445761607662409 * t14;
+    y[267] = t11;
+    t5 = 0.10009323415744416 * t14;
+    y[272] = t5;
+    t4 = C68 * t6;
+    t9 = (-C67) * t13;
+    t2 = t4 + t9;
+    t7 = 0.050055274887662475 * t2;
+    y[87] = t7;
+    t8 = (-0.0584056671989319) * t2;
+    y[92] = t8;
+    t1 = re[6];
+    t12 = im[6];
+    t10 = re[51];
+    t0 = im[51];
+    t3 = t1 - t10;
+    t11 = t12 - t0;
+    t14 = t1 + t10;
+    t5 = t12 + t0;
+    t6 = (-C69) * t14;
+    t13 = (-C70) * t5;
+    t4 = t6 + t13;
+    t9 = 0.10592395115988588 * t4;
+    y[265] = t9;
+    t7 = 0.09807356363250865 * t4;
+    y[274] = t7;
+    t2 = C70 * t14;
+    t8 = (-C69) * t5;
+    t1 = t2 + t8;
+    t10 = 0.04668426482973558 * t1;
+    y[85] = t10;
+    t12 = (-0.06167272672669253) * t1;
+    y[94] = t12;
+    t0 = C71 * t3;
+    t6 = C72 * t11;
+    t13 = t0 + t6;
+    y[4] = 0;
+    t9 = (-0.10578594242587536) * t13;
+    y[175] = t9;
+    t4 = (-C72) * t3;
+    t7 = C71 * t11;
+    t14 = t4 + t7;
+    t5 = 0.10503390957543066 * t14;
+    y[184] = t5;
+    t2 = 0.0007563547636164294 * t14;
+    y[355] = t2;
+    t8 = re[64];
+    t10 = im[64];
+    t1 = re[19];
+    t12 = im[19];
+    t0 = t8 - t1;
+    t6 = t10 - t12;
+    t13 = t8 + t1;
+    t9 = t10 + t12;
+    t3 = C73 * t13;
+    t11 = C74 * t9;
+    t4 = t3 + t11;
+    y[6] = 0;
+    t7 = (-0.10594246825394384) * t4;
+    y[173] = t7;
+    t5 = (-C74) * t13;
+    t14 = C73 * t9;
+    t2 = t5 + t14;
+    t8 = 0.10487872610705846 * t2;
+    y[186] = t8;
+    t1 = 0.0011892177864014468 * t2;
+    y[353] = t1;
+    t10 = (-C75) * t0;
+    t12 = (-C76) * t6;
+    t3 = t10 + t12;
+    t11 = 0.10722697071612382 * t3;
+    y[263] = t11;
+    t4 = 0.09590169035311356 * t3;
+    y[276] = t4;
+    t7 = C76 * t0;
+    t13 = (-C75) * t6;
+    t9 = t7 + t13;
+    t5 = 0.043320144271118445 * t9;
+    y[83] = t5;
+    t14 = (-0.06487767026065987) * t9;
+    y[96] = t14;
+    t8 = re[22];
+    t2 = im[22];
+    t1 = re[67];
+    t10 = im[67];
+    t12 = t8 - t1;
+    t11 = t2 - t10;
+    t3 = t8 + t1;
+    t4 = t2 + t10;
+    t0 = (-C77) * t3;
+    t6 = (-C78) * t4;
+    t7 = t0 + t6;
+    t13 = 0.10836992079672758 * t7;
+    y[261] = t13;
+    t5 = 0.09358384301872717 * t7;
+    y[278] = t5;
+    t9 = C78 * t3;
+    t14 = (-C77) * t4;
+    t8 = t9 + t14;
+    t1 = 0.03998081633739134 * t8;
+    y[81] = t1;
+    t2 = (-0.06800367313228359) * t8;
+    y[98] = t2;
+    t10 = C79 * t12;
+    t0 = C80 * t11;
+    t6 = t10 + t0;
+    y[8] = 0;
+    t13 = (-0.10608679121443566) * t6;
+    y[171] = t13;
+    t7 = (-C80) * t12;
+    t5 = C79 * t11;
+    t3 = t7 + t5;
+    t4 = 0.10473604662669052 * t3;
+    y[188] = t4;
+    t9 = 0.0017455800739912659 * t3;
+    y[351] = t9;
+}
+
+/**
+ *  Part 3 of ApplyWindowedIMDCT_W75_180().
+ * 
+ *  @param {Number[]} X 
+ *    - The input block (180 points).
+ *  @param {Number[]} y 
+ *    - The array that would contain the output block (360 points).
+ *  @param {Number[]} re 
+ *    - The scratch buffer (real part, 90 points).
+ *  @param {Number[]} im 
+ *    - The scratch buffer (imaginary part, 90 points).
+ */
+function ApplyWindowedIMDCT_W75_180_Part3(X, y, re, im) {
+    let t0, t1, t10, t11, t12, t13, t14, t2, t3, t4, t5, t6, t7, t8, t9;
+    const C0 = 0.6394390019805847;
+    const C1 = 0.7688418320734596;
+    const C2 = 0.9958049275746618;
+    const C3 = 0.09150161866340238;
+    const C4 = 0.9940563382223196;
+    const C5 = 0.10886687485196457;
+    const C6 = 0.6259234721840591;
+    const C7 = 0.7798844830928818;
+    const C8 = 0.6122172800344493;
+    const C9 = 0.7906895737438434;
+    const C10 = 0.992004949679715;
+    const C11 = 0.12619896913582976;
+    const C12 = 0.9896513868196702;
+    const C13 = 0.1434926219911793;
+    const C14 = 0.598324600570659;
+    const C15 = 0.8012538126910607;
+    const C16 = 0.5842496656374344;
+    const C17 = 0.8115739819650123;
+    const C18 = 0.9869963665602319;
+    const C19 = 0.1607425656038261;
+    const C20 = 0.9840406976462909;
+    const C21 = 0.17794354547384175;
+    const C22 = 0.569996762596303;
+    const C23 = 0.8216469379421637;
+    const C24 = 0.5555702330196022;
+    const C25 = 0.8314696123025452;
+    const C26 = 0.9807852804032304;
+    const C27 = 0.19509032201612825;
+    const C28 = 0.9772311064626789;
+    const C29 = 0.21217767215644623;
+    const C30 = 0.5409744713679939;
+    const C31 = 0.8410390129643925;
+    const C32 = 0.5262139236518696;
+    const C33 = 0.8503522249955628;
+    const C34 = 0.9733792584604485;
+    const C35 = 0.22920039092241415;
+    const C36 = 0.9692309097067544;
+    const C37 = 0.24615329302899303;
+    const C38 = 0.5112930860770522;
+    const C39 = 0.8594064115014527;
+    const C40 = 0.4962165036752082;
+    const C41 = 0.8681988144891423;
+    const C42 = 0.964787323828813;
+    const C43 = 0.2630312144579748;
+    const C44 = 0.9600498543859287;
+    const C45 = 0.2798290140309921;
+    const C46 = 0.48098876891938763;
+    const C47 = 0.8767267557075077;
+    const C48 = 0.4656145203251114;
+    const C49 = 0.8849876374630419;
+    const C50 = 0.9550199444571866;
+    const C51 = 0.296541574975571;
+    const C52 = 0.949699126201877;
+    const C53 = 0.31316380648374953;
+    const C54 = 0.45009844103743496;
+    const C55 = 0.892978943411137;
+    const C56 = 0.43444525740441703;
+    const C57 = 0.9006982393225879;
+    const C58 = 0.9440890203927842;
+    const C59 = 0.32969064526278724;
+    const C60 = 0.9381913359224842;
+    const C61 = 0.34611705707749296;
+    const C62 = 0.41865973753742813;
+    const C63 = 0.9081431738250813;
+    const C64 = 0.40274668985873724;
+    const C65 = 0.9153114791194471;
+    const C66 = 0.9320078692827986;
+    const C67 = 0.3624380382837016;
+    const C68 = 0.9255405040175664;
+    const C69 = 0.37864861735243294;
+    const C70 = 0.3867109616368206;
+    const C71 = 0.9222009716704518;
+    const C72 = 0.3705574375098362;
+    const C73 = 0.9288095528719242;
+    const C74 = 0.9187912101488983;
+    const C75 = 0.39474385638426723;
+    const C76 = 0.9117620435770886;
+    const C77 = 0.41071885261347724;
+    const C78 = 0.35429103799771583;
+    const C79 = 0.9351352096860117;
+    const C80 = 0.33791671800332695;
+    const C81 = 0.9411760152563706;
+    const C82 = 0.904455145454368;
+    const C83 = 0.4265687399014583;
+    const C84 = 0.8968727415326883;
+    const C85 = 0.4422886902190013;
+    const C86 = 0.3214394653031616;
+    const C87 = 0.9469301294951057;
+    const C88 = 0.30486429902801077;
+    const C89 = 0.9523957996432784;
+    const C90 = 0.8890171414857364;
+    const C91 = 0.4578739151169567;
+    const C92 = 0.8808907382053855;
+    const C93 = 0.47331966718484336;
+    const C94 = 0.28819626813408933;
+    const C95 = 0.9575713608048144;
+    const C96 = 0.27144044986507426;
+    const C97 = 0.9624552364536473;
+    const C98 = 0.8724960070727972;
+    const C99 = 0.4886212414969549;
+    const C100 = 0.8638355052043957;
+    const C101 = 0.5037739770455263;
+    const C102 = 0.25460194820552756;
+    const C103 = 0.9670459389139432;
+    const C104 = 0.2376858923261731;
+    const C105 = 0.9713420698132614;
+    const C106 = 0.8549118706729466;
+    const C107 = 0.5187732581605213;
+    const C108 = 0.8457278217039733;
+    const C109 = 0.5336145159156115;
+    const C110 = 0.22069743502150108;
+    const C111 = 0.9753423205085127;
+    const C112 = 0.2036417511401775;
+    const C113 = 0.9790454724845838;
+    const C114 = 0.8362861558477596;
+    const C115 = 0.5482932295199138;
+    const C116 = 0.8265897491271886;
+    const C117 = 0.5628049276950685;
+    const C118 = 0.18652403600873463;
+    const C119 = 0.9824503977255097;
+    const C120 = 0.1693495038490246;
+    const C121 = 0.9855560590580777;
+    const C122 = 0.8166415551616789;
+    const C123 = 0.5771451900372336;
+    const C124 = 0.8064446042674825;
+    const C125 = 0.5913096483635824;
+    const C126 = 0.1521233861899167;
+    const C127 = 0.9883615104677607;
+    const C128 = 0.134850930273723;
+    const C129 = 0.9908658973868822;
+    const C130 = 0.796002002534622;
+    const C131 = 0.6052939880428944;
+    const C132 = 0.785316930880745;
+    const C133 = 0.619093949309834;
+    const C134 = 0.11753739745783764;
+    const C135 = 0.9930684569549263;
+    const C136 = 0.10018806161207627;
+    const C137 = 0.9949685182509117;
+    const C138 = 0.7743926440821856;
+    const C139 = 0.632705328562516;
+    const C140 = 0.7632324697825288;
+    const C141 = 0.6461239796429639;
+    const C142 = 0.08280820751220434;
+    const C143 = 0.9965655024977614;
+    const C144 = 0.06540312923014306;
+    const C145 = 0.9978589232386035;
+    const C146 = 0.7518398074789774;
+    const C147 = 0.6593458151000688;
+    const C148 = 0.7402181274868321;
+    const C149 = 0.672366807434668;
+    const C150 = 0.04797812852134394;
+    const C151 = 0.9988483864849507;
+    const C152 = 0.03053851320982266;
+    const C153 = 0.9995335908367129;
+    const C154 = 0.7283709698824002;
+    const C155 = 0.6851829903263591;
+    const C156 = 0.7163019434246544;
+    const C157 = 0.6977904598416801;
+    const C158 = 0.01308959557134444;
+    const C159 = 0.999914327574007;
+    t14 = re[70];
+    t1 = im[70];
+    t8 = re[25];
+    t2 = im[25];
+    t10 = t14 - t8;
+    t0 = t1 - t2;
+    t6 = t14 + t8;
+    t13 = t1 + t2;
+    t12 = C0 * t6;
+    t11 = C1 * t13;
+    t7 = t12 + t11;
+    y[10] = 0;
+    t5 = (-0.1062151252966577) * t7;
+    y[169] = t5;
+    t4 = (-C1) * t6;
+    t3 = C0 * t13;
+    t9 = t4 + t3;
+    t14 = 0.1046094996364962 * t9;
+    y[190] = t14;
+    t8 = 0.0024344642407252456 * t9;
+    y[349] = t8;
+    t1 = (-C2) * t10;
+    t2 = (-C3) * t0;
+    t12 = t1 + t2;
+    t11 = 0.1093520830501441 * t12;
+    y[259] = t11;
+    t7 = 0.09112774271407018 * t12;
+    y[280] = t7;
+    t5 = C3 * t10;
+    t6 = (-C2) * t0;
+    t13 = t5 + t6;
+    t4 = 0.036682878671273865 * t13;
+    y[79] = t4;
+    t3 = (-0.07103918795933337) * t13;
+    y[100] = t3;
+    t14 = re[38];
+    t9 = im[38];
+    t8 = re[83];
+    t1 = im[83];
+    t2 = t14 - t8;
+    t11 = t9 - t1;
+    t12 = t14 + t8;
+    t7 = t9 + t1;
+    t10 = (-C4) * t12;
+    t0 = (-C5) * t7;
+    t5 = t10 + t0;
+    t6 = 0.11017716427377129 * t5;
+    y[257] = t6;
+    t4 = 0.08853875428394885 * t5;
+    y[282] = t4;
+    t13 = C5 * t12;
+    t3 = (-C4) * t7;
+    t14 = t13 + t3;
+    t8 = 0.03344503750981467 * t14;
+    y[77] = t8;
+    t9 = (-0.07397112828898918) * t14;
+    y[102] = t9;
+    t1 = C6 * t2;
+    t10 = C7 * t11;
+    t0 = t1 + t10;
+    y[12] = 0;
+    t6 = (-0.10632360319216981) * t0;
+    y[167] = t6;
+    t5 = (-C7) * t2;
+    t4 = C6 * t11;
+    t12 = t5 + t4;
+    t7 = 0.10450277057511706 * t12;
+    y[192] = t7;
+    t13 = 0.003263813755121946 * t12;
+    y[347] = t13;
+    t3 = re[86];
+    t8 = im[86];
+    t14 = re[41];
+    t9 = im[41];
+    t1 = t3 - t14;
+    t10 = t8 - t9;
+    t0 = t3 + t14;
+    t6 = t8 + t9;
+    t2 = C8 * t0;
+    t11 = C9 * t6;
+    t5 = t2 + t11;
+    y[14] = 0;
+    t4 = (-0.1064084464218436) * t5;
+    y[165] = t4;
+    t7 = (-C9) * t0;
+    t12 = C8 * t6;
+    t13 = t7 + t12;
+    t3 = 0.10441944680840871 * t13;
+    y[194] = t3;
+    t14 = 0.004236562517080274 * t13;
+    y[345] = t14;
+    t8 = (-C10) * t1;
+    t9 = (-C11) * t10;
+    t2 = t8 + t9;
+    t11 = 0.11084873077916041 * t2;
+    y[255] = t11;
+    t5 = 0.08582541591976457 * t2;
+    y[284] = t5;
+    t4 = C11 * t1;
+    t0 = (-C10) * t10;
+    t6 = t4 + t0;
+    t7 = 0.030285070177357855 * t6;
+    y[75] = t7;
+    t12 = (-0.07678827089087746) * t6;
+    y[104] = t12;
+    t3 = re[44];
+    t13 = im[44];
+    t14 = re[89];
+    t8 = im[89];
+    t9 = t3 - t14;
+    t11 = t13 - t8;
+    t2 = t3 + t14;
+    t5 = t13 + t8;
+    t1 = (-C12) * t2;
+    t10 = (-C13) * t5;
+    t4 = t1 + t10;
+    t0 = 0.11137139713523048 * t4;
+    y[253] = t0;
+    t7 = 0.0829960016863824 * t4;
+    y[286] = t7;
+    t6 = C13 * t2;
+    t12 = (-C12) * t5;
+    t3 = t6 + t12;
+    t14 = 0.027219561165582794 * t3;
+    y[73] = t14;
+    t13 = (-0.07948177534274314) * t3;
+    y[106] = t13;
+    t8 = C14 * t9;
+    t1 = C15 * t11;
+    t10 = t8 + t1;
+    y[16] = 0;
+    t0 = (-0.1064659582961119) * t10;
+    y[163] = t0;
+    t4 = (-C15) * t9;
+    t7 = C14 * t11;
+    t2 = t4 + t7;
+    t5 = 0.10436304043972418 * t2;
+    y[196] = t5;
+    t6 = 0.005357839698617217 * t2;
+    y[343] = t6;
+    t12 = re[72];
+    t14 = im[72];
+    t3 = re[27];
+    t13 = im[27];
+    t8 = t12 - t3;
+    t1 = t14 - t13;
+    t10 = t12 + t3;
+    t0 = t14 + t13;
+    t9 = C16 * t10;
+    t11 = C17 * t0;
+    t4 = t9 + t11;
+    y[18] = 0;
+    t7 = (-0.10649251365137921) * t4;
+    y[161] = t7;
+    t5 = (-C17) * t10;
+    t2 = C16 * t0;
+    t6 = t5 + t2;
+    t12 = 0.10433701609753676 * t6;
+    y[198] = t12;
+    t3 = 0.0066295602099925134 * t6;
+    y[341] = t3;
+    t14 = (-C18) * t8;
+    t13 = (-C19) * t1;
+    t9 = t14 + t13;
+    t11 = 0.11175216614295466 * t9;
+    y[251] = t11;
+    t4 = 0.08005992338377164 * t9;
+    y[288] = t4;
+    t7 = C19 * t8;
+    t10 = (-C18) * t1;
+    t0 = t7 + t10;
+    t5 = 0.024266156878213443 * t0;
+    y[71] = t5;
+    t2 = (-0.0820419394725153) * t0;
+    y[108] = t2;
+    t12 = re[30];
+    t6 = im[30];
+    t3 = re[75];
+    t14 = im[75];
+    t13 = t12 - t3;
+    t11 = t6 - t14;
+    t9 = t12 + t3;
+    t4 = t6 + t14;
+    t8 = (-C20) * t9;
+    t1 = (-C21) * t4;
+    t7 = t8 + t1;
+    t10 = 0.1119972737491647 * t7;
+    y[249] = t10;
+    t5 = 0.07702845466518891 * t7;
+    y[290] = t5;
+    t0 = C21 * t9;
+    t2 = (-C20) * t4;
+    t12 = t0 + t2;
+    t3 = 0.02144008238657481 * t12;
+    y[69] = t3;
+    t6 = (-0.08446290146459451) * t12;
+    y[110] = t6;
+    t14 = C22 * t13;
+    t8 = C23 * t11;
+    t1 = t14 + t8;
+    y[20] = 0;
+    t10 = (-0.1064846134349639) * t1;
+    y[159] = t10;
+    t7 = (-C23) * t13;
+    t5 = C22 * t11;
+    t9 = t7 + t5;
+    t4 = 0.10434475698122611 * t9;
+    y[200] = t4;
+    t0 = 0.008054387752489418 * t9;
+    y[339] = t0;
+    t2 = re[78];
+    t3 = im[78];
+    t12 = re[33];
+    t6 = im[33];
+    t14 = t2 - t12;
+    t8 = t3 - t6;
+    t1 = t2 + t12;
+    t10 = t3 + t6;
+    t13 = C24 * t1;
+    t11 = C25 * t10;
+    t7 = t13 + t11;
+    y[22] = 0;
+    t5 = (-0.106439018245135) * t7;
+    y[157] = t5;
+    t4 = (-C25) * t1;
+    t9 = C24 * t10;
+    t0 = t4 + t9;
+    t2 = 0.10438945505417567 * t0;
+    y[202] = t2;
+    t12 = 0.009633186119027486 * t0;
+    y[337] = t12;
+    t3 = (-C26) * t14;
+    t6 = (-C27) * t8;
+    t13 = t3 + t6;
+    t11 = 0.11211600182090968 * t13;
+    y[247] = t11;
+    t7 = 0.0739149077116441 * t13;
+    y[292] = t7;
+    t5 = C27 * t14;
+    t1 = (-C26) * t8;
+    t10 = t5 + t1;
+    t4 = 0.018754638337760737 * t10;
+    y[67] = t4;
+    t9 = (-0.08673930207344024) * t10;
+    y[112] = t9;
+    t2 = re[46];
+    t0 = im[46];
+    t12 = re[1];
+    t3 = im[1];
+    t6 = t2 - t12;
+    t11 = t0 - t3;
+    t13 = t2 + t12;
+    t7 = t0 + t3;
+    t14 = (-C28) * t13;
+    t8 = (-C29) * t7;
+    t5 = t14 + t8;
+    t1 = 0.11211726616460811 * t5;
+    y[245] = t1;
+    t4 = 0.07072918180627431 * t5;
+    y[294] = t4;
+    t10 = C29 * t13;
+    t9 = (-C28) * t7;
+    t2 = t10 + t9;
+    t12 = 0.0162231586659377 * t2;
+    y[65] = t12;
+    t0 = (-0.08886820659475896) * t2;
+    y[114] = t0;
+    t3 = C30 * t6;
+    t14 = C31 * t11;
+    t8 = t3 + t14;
+    y[24] = 0;
+    t1 = (-0.10635259545515033) * t8;
+    y[155] = t1;
+    t5 = (-C31) * t6;
+    t4 = C30 * t11;
+    t13 = t5 + t4;
+    t7 = 0.10447428258388627 * t13;
+    y[204] = t7;
+    t10 = 0.011366778059010964 * t13;
+    y[335] = t10;
+    t9 = re[4];
+    t12 = im[4];
+    t2 = re[49];
+    t0 = im[49];
+    t3 = t9 - t2;
+    t14 = t12 - t0;
+    t8 = t9 + t2;
+    t1 = t12 + t0;
+    t6 = C32 * t8;
+    t11 = C33 * t1;
+    t5 = t6 + t11;
+    y[26] = 0;
+    t4 = (-0.10622278321308296) * t5;
+    y[153] = t4;
+    t7 = (-C33) * t8;
+    t13 = C32 * t1;
+    t10 = t7 + t13;
+    t9 = 0.10460195802648305 * t10;
+    y[206] = t9;
+    t2 = 0.013253791127641398 * t10;
+    y[333] = t2;
+    t12 = (-C34) * t3;
+    t0 = (-C35) * t14;
+    t6 = t12 + t0;
+    t11 = 0.11201282402976184 * t6;
+    y[243] = t11;
+    t5 = 0.06748590978994368 * t6;
+    y[296] = t5;
+    t4 = C35 * t3;
+    t8 = (-C34) * t14;
+    t1 = t4 + t8;
+    t7 = 0.01385646615380372 * t1;
+    y[63] = t7;
+    t13 = (-0.09084669522789945) * t1;
+    y[116] = t13;
+    t9 = re[52];
+    t10 = im[52];
+    t2 = re[7];
+    t12 = im[7];
+    t0 = t9 - t2;
+    t11 = t10 - t12;
+    t6 = t9 + t2;
+    t5 = t10 + t12;
+    t3 = (-C36) * t6;
+    t14 = (-C37) * t5;
+    t4 = t3 + t14;
+    t8 = 0.11181234565117065 * t4;
+    y[241] = t8;
+    t7 = 0.06419701362972723 * t4;
+    y[298] = t7;
+    t1 = C37 * t6;
+    t13 = (-C36) * t5;
+    t9 = t1 + t13;
+    t2 = 0.011663765406511857 * t9;
+    y[61] = t2;
+    t10 = (-0.09267610069341958) * t9;
+    y[118] = t10;
+    t12 = C38 * t0;
+    t3 = C39 * t11;
+    t14 = t12 + t3;
+    y[28] = 0;
+    t8 = (-0.10604711193419658) * t14;
+    y[151] = t8;
+    t4 = (-C39) * t0;
+    t7 = C38 * t11;
+    t6 = t4 + t7;
+    t5 = 0.10477523535016856 * t6;
+    y[208] = t5;
+    t1 = 0.015292094451545292 * t6;
+    y[331] = t1;
+    t13 = re[20];
+    t2 = im[20];
+    t9 = re[65];
+    t10 = im[65];
+    t12 = t13 - t9;
+    t3 = t2 - t10;
+    t14 = t13 + t9;
+    t8 = t2 + t10;
+    t0 = C40 * t14;
+    t11 = C41 * t8;
+    t4 = t0 + t11;
+    y[30] = 0;
+    t7 = (-0.1058237063615947) * t4;
+    y[149] = t7;
+    t5 = (-C41) * t14;
+    t6 = C40 * t8;
+    t1 = t5 + t6;
+    t13 = 0.10499642748426294 * t1;
+    y[210] = t13;
+    t9 = 0.017479194012891126 * t1;
+    y[329] = t9;
+    t2 = (-C42) * t12;
+    t10 = (-C43) * t3;
+    t0 = t2 + t10;
+    t11 = 0.11152777064293147 * t0;
+    y[239] = t11;
+    t4 = 0.06087681238074977 * t0;
+    y[300] = t4;
+    t7 = C43 * t12;
+    t14 = (-C42) * t3;
+    t8 = t7 + t14;
+    t5 = 0.009652524216948906 * t8;
+    y[59] = t5;
+    t6 = (-0.094357630791773) * t8;
+    y[120] = t6;
+    t13 = re[68];
+    t1 = im[68];
+    t9 = re[23];
+    t2 = im[23];
+    t10 = t13 - t9;
+    t11 = t1 - t2;
+    t0 = t13 + t9;
+    t4 = t1 + t2;
+    t12 = (-C44) * t0;
+    t3 = (-C45) * t4;
+    t7 = t12 + t3;
+    t14 = 0.1111711548927498 * t7;
+    y[237] = t14;
+    t5 = 0.057539681884399944 * t7;
+    y[302] = t5;
+    t8 = C45 * t0;
+    t6 = (-C44) * t4;
+    t13 = t8 + t6;
+    t9 = 0.00782996317541068 * t13;
+    y[57] = t9;
+    t1 = (-0.09589337747832162) * t13;
+    y[122] = t1;
+    t2 = C46 * t10;
+    t12 = C47 * t11;
+    t3 = t2 + t12;
+    y[32] = 0;
+    t14 = (-0.10555095396217636) * t3;
+    y[147] = t14;
+    t7 = (-C47) * t10;
+    t5 = C46 * t11;
+    t0 = t7 + t5;
+    t4 = 0.1052677469413751 * t0;
+    y[212] = t4;
+    t8 = 0.019809432322785005 * t0;
+    y[327] = t8;
+    t6 = re[26];
+    t9 = im[26];
+    t13 = re[71];
+    t1 = im[71];
+    t2 = t6 - t13;
+    t12 = t9 - t1;
+    t3 = t6 + t13;
+    t14 = t9 + t1;
+    t10 = C48 * t3;
+    t11 = C49 * t14;
+    t7 = t10 + t11;
+    y[34] = 0;
+    t5 = (-0.10522800037797932) * t7;
+    y[145] = t5;
+    t4 = (-C49) * t3;
+    t0 = C48 * t14;
+    t8 = t4 + t0;
+    t6 = 0.10559082251111834 * t8;
+    y[214] = t6;
+    t13 = 0.022277503292171038 * t8;
+    y[325] = t13;
+    t9 = (-C50) * t2;
+    t1 = (-C51) * t12;
+    t10 = t9 + t1;
+    t11 = 0.11075297764495041 * t10;
+    y[235] = t11;
+    t7 = 0.05419989393873094 * t10;
+    y[304] = t7;
+    t5 = C51 * t2;
+    t3 = (-C50) * t12;
+    t14 = t5 + t3;
+    t4 = 0.006201590324297938 * t14;
+    y[55] = t4;
+    t0 = (-0.09728845040920638) * t14;
+    y[124] = t0;
+    t6 = re[54];
+    t8 = im[54];
+    t13 = re[9];
+    t9 = im[9];
+    t1 = t6 - t13;
+    t11 = t8 - t9;
+    t10 = t6 + t13;
+    t7 = t8 + t9;
+    t2 = (-C52) * t10;
+    t12 = (-C53) * t7;
+    t5 = t2 + t12;
+    t3 = 0.11028748843781232 * t5;
+    y[233] = t3;
+    t4 = 0.05087145958604732 * t5;
+    y[306] = t4;
+    t14 = C53 * t10;
+    t0 = (-C52) * t7;
+    t6 = t14 + t0;
+    t13 = 0.004771859549919083 * t6;
+    y[53] = t13;
+    t8 = (-0.0985457172414932) * t6;
+    y[126] = t8;
+    t9 = C54 * t1;
+    t2 = C55 * t11;
+    t12 = t9 + t2;
+    y[36] = 0;
+    t3 = (-0.10485393165978092) * t12;
+    y[143] = t3;
+    t5 = (-C55) * t1;
+    t4 = C54 * t11;
+    t10 = t5 + t4;
+    t7 = 0.10596752010371228 * t10;
+    y[216] = t7;
+    t14 = 0.024876910991979265 * t10;
+    y[323] = t14;
+    t0 = re[12];
+    t13 = im[12];
+    t6 = re[57];
+    t8 = im[57];
+    t9 = t0 - t6;
+    t2 = t13 - t8;
+    t12 = t0 + t6;
+    t3 = t13 + t8;
+    t1 = C56 * t12;
+    t11 = C57 * t3;
+    t5 = t1 + t11;
+    y[38] = 0;
+    t4 = (-0.10442909411643879) * t5;
+    y[141] = t4;
+    t7 = (-C57) * t12;
+    t10 = C56 * t3;
+    t14 = t7 + t10;
+    t0 = 0.10639861625843644 * t14;
+    y[218] = t0;
+    t6 = 0.02759759882850269 * t14;
+    y[321] = t6;
+    t13 = (-C58) * t9;
+    t8 = (-C59) * t2;
+    t1 = t13 + t8;
+    t11 = 0.10978325427720098 * t1;
+    y[231] = t11;
+    t5 = 0.04756885867834906 * t1;
+    y[308] = t5;
+    t4 = C59 * t9;
+    t12 = (-C58) * t2;
+    t3 = t4 + t12;
+    t7 = 0.0035432705531146876 * t3;
+    y[51] = t7;
+    t10 = (-0.09967423398910226) * t3;
+    y[128] = t10;
+    t0 = re[60];
+    t14 = im[60];
+    t6 = re[15];
+    t13 = im[15];
+    t8 = t0 - t6;
+    t11 = t14 - t13;
+    t1 = t0 + t6;
+    t5 = t14 + t13;
+    t9 = (-C60) * t1;
+    t2 = (-C61) * t5;
+    t4 = t9 + t2;
+    t12 = 0.10925429467963434 * t4;
+    y[229] = t12;
+    t7 = 0.04430435466830059 * t4;
+    y[310] = t7;
+    t3 = C61 * t1;
+    t10 = (-C60) * t5;
+    t0 = t3 + t10;
+    t6 = 0.002515371651828484 * t0;
+    y[49] = t6;
+    t14 = (-0.1006795131082048) * t0;
+    y[130] = t14;
+    t13 = C62 * t8;
+    t9 = C63 * t11;
+    t2 = t13 + t9;
+    y[40] = 0;
+    t12 = (-0.10395322592855918) * t2;
+    y[139] = t12;
+    t4 = (-C63) * t8;
+    t7 = C62 * t11;
+    t1 = t4 + t7;
+    t5 = 0.10688567874504554 * t1;
+    y[220] = t5;
+    t3 = 0.030431768150683058 * t1;
+    y[319] = t3;
+    t10 = re[28];
+    t6 = im[28];
+    t0 = re[73];
+    t14 = im[73];
+    t13 = t10 - t0;
+    t9 = t6 - t14;
+    t2 = t10 + t0;
+    t12 = t6 + t14;
+    t8 = C64 * t2;
+    t11 = C65 * t12;
+    t4 = t8 + t11;
+    t7 = 0.0004039562545922317 * t4;
+    y[42] = t7;
+    t5 = (-0.1033626970269786) * t4;
+    y[137] = t5;
+    t1 = (-C65) * t2;
+    t3 = C64 * t12;
+    t10 = t1 + t3;
+    t0 = 0.10736592722456871 * t10;
+    y[222] = t0;
+    t6 = 0.03336822793098118 * t10;
+    y[317] = t6;
+    t14 = (-C66) * t13;
+    t8 = (-C67) * t9;
+    t11 = t14 + t8;
+    t7 = 0.10871066201687268 * t11;
+    y[227] = t7;
+    t4 = 0.041091881490305494 * t11;
+    y[312] = t4;
+    t5 = C67 * t13;
+    t2 = (-C66) * t9;
+    t12 = t5 + t2;
+    t1 = 0.0016836021815952902 * t12;
+    y[47] = t1;
+    t3 = (-0.10157171821908681) * t12;
+    y[132] = t3;
+    t0 = re[76];
+    t10 = im[76];
+    t6 = re[31];
+    t14 = im[31];
+    t8 = t0 - t6;
+    t7 = t10 - t14;
+    t11 = t0 + t6;
+    t4 = t10 + t14;
+    t13 = (-C68) * t11;
+    t9 = (-C69) * t4;
+    t5 = t13 + t9;
+    t2 = 0.10816553021132944 * t5;
+    y[225] = t2;
+    t1 = 0.03794353629982911 * t5;
+    y[314] = t1;
+    t12 = C69 * t11;
+    t3 = (-C68) * t4;
+    t0 = t12 + t3;
+    t6 = 0.0010382155367027563 * t0;
+    y[45] = t6;
+    t10 = (-0.10235901881658338) * t0;
+    y[134] = t10;
+    t14 = C70 * t8;
+    t13 = C71 * t7;
+    t9 = t14 + t13;
+    t2 = 0.0007807921408777607 * t9;
+    y[44] = t2;
+    t5 = (-0.10271657940570703) * t9;
+    y[135] = t5;
+    t1 = (-C71) * t8;
+    t11 = C70 * t7;
+    t4 = t1 + t11;
+    t12 = 0.1078958471118532 * t4;
+    y[224] = t12;
+    t3 = 0.036397348554850356 * t4;
+    y[315] = t3;
+    t6 = re[34];
+    t0 = im[34];
+    t10 = re[79];
+    t14 = im[79];
+    t13 = t6 - t10;
+    t2 = t0 - t14;
+    t9 = t6 + t10;
+    t5 = t0 + t14;
+    t8 = C72 * t9;
+    t7 = C73 * t5;
+    t1 = t8 + t7;
+    t11 = 0.001338446915694132 * t1;
+    y[46] = t11;
+    t12 = (-0.10197789626508247) * t1;
+    y[133] = t12;
+    t4 = (-C73) * t9;
+    t3 = C72 * t5;
+    t6 = t4 + t3;
+    t10 = 0.10843752343695495 * t6;
+    y[226] = t10;
+    t0 = 0.03950892201611919 * t6;
+    y[313] = t0;
+    t14 = (-C74) * t13;
+    t8 = (-C75) * t2;
+    t7 = t14 + t8;
+    t11 = 0.10762968653672474 * t7;
+    y[223] = t11;
+    t1 = 0.03487189790626826 * t7;
+    y[316] = t1;
+    t12 = C75 * t13;
+    t9 = (-C74) * t2;
+    t5 = t12 + t9;
+    t4 = 0.0005646408681615436 * t5;
+    y[43] = t4;
+    t3 = (-0.10305168926250033) * t5;
+    y[136] = t3;
+    t10 = re[2];
+    t6 = im[2];
+    t0 = re[47];
+    t14 = im[47];
+    t8 = t10 - t0;
+    t11 = t6 - t14;
+    t7 = t10 + t0;
+    t1 = t6 + t14;
+    t13 = (-C76) * t7;
+    t2 = (-C77) * t1;
+    t12 = t13 + t2;
+    t9 = 0.10715459052193034 * t12;
+    y[221] = t9;
+    t4 = 0.03188777901462403 * t12;
+    y[318] = t4;
+    t5 = C77 * t7;
+    t3 = (-C76) * t1;
+    t10 = t5 + t3;
+    y[41] = 0;
+    t0 = (-0.10369234819517234) * t10;
+    y[138] = t0;
+    t6 = C78 * t8;
+    t14 = C79 * t11;
+    t13 = t6 + t14;
+    t2 = 0.0020754473801508247 * t13;
+    y[48] = t2;
+    t9 = (-0.10113927380391523) * t13;
+    y[131] = t9;
+    t12 = (-C79) * t8;
+    t4 = C78 * t11;
+    t7 = t12 + t4;
+    t1 = 0.10898346481763614 * t7;
+    y[228] = t1;
+    t5 = 0.04269085483362434 * t7;
+    y[311] = t5;
+    t3 = re[50];
+    t10 = im[50];
+    t0 = re[5];
+    t6 = im[5];
+    t14 = t3 - t0;
+    t2 = t10 - t6;
+    t13 = t3 + t0;
+    t9 = t10 + t6;
+    t8 = C80 * t13;
+    t11 = C81 * t9;
+    t12 = t8 + t11;
+    t4 = 0.0030044094666997023 * t12;
+    y[50] = t4;
+    t1 = (-0.10019163696307268) * t12;
+    y[129] = t1;
+    t7 = (-C81) * t13;
+    t5 = C80 * t9;
+    t3 = t7 + t5;
+    t0 = 0.10952127322317406 * t3;
+    y[230] = t0;
+    t10 = 0.045930977828050105 * t3;
+    y[309] = t10;
+    t6 = (-C82) * t14;
+    t8 = (-C83) * t2;
+    t11 = t6 + t8;
+    t4 = 0.10663511500011805 * t11;
+    y[219] = t4;
+    t12 = 0.0290011599676947 * t11;
+    y[320] = t12;
+    t1 = C83 * t14;
+    t13 = (-C82) * t2;
+    t9 = t1 + t13;
+    y[39] = 0;
+    t7 = (-0.10419748795787213) * t9;
+    y[140] = t7;
+    t5 = re[8];
+    t0 = im[8];
+    t3 = re[53];
+    t10 = im[53];
+    t6 = t5 - t3;
+    t8 = t0 - t10;
+    t4 = t5 + t3;
+    t11 = t0 + t10;
+    t12 = (-C84) * t4;
+    t14 = (-C85) * t11;
+    t2 = t12 + t14;
+    t1 = 0.10617606024822178 * t2;
+    y[217] = t1;
+    t13 = 0.026222514401920968 * t2;
+    y[322] = t13;
+    t9 = C85 * t4;
+    t7 = (-C84) * t11;
+    t5 = t9 + t7;
+    y[37] = 0;
+    t3 = (-0.10464798830485135) * t5;
+    y[142] = t3;
+    t0 = C86 * t6;
+    t10 = C87 * t8;
+    t12 = t0 + t10;
+    t14 = 0.004132367980549081 * t12;
+    y[52] = t14;
+    t1 = (-0.09912579670623863) * t12;
+    y[127] = t1;
+    t2 = (-C87) * t6;
+    t13 = C86 * t8;
+    t4 = t2 + t13;
+    t11 = 0.11003928784390318 * t4;
+    y[232] = t11;
+    t9 = 0.049216099716768984 * t4;
+    y[307] = t9;
+    t7 = re[36];
+    t5 = im[36];
+    t3 = re[81];
+    t0 = im[81];
+    t10 = t7 - t3;
+    t14 = t5 - t0;
+    t12 = t7 + t3;
+    t1 = t5 + t0;
+    t6 = C88 * t12;
+    t8 = C89 * t1;
+    t2 = t6 + t8;
+    t13 = 0.005461682284304391 * t2;
+    y[54] = t13;
+    t11 = (-0.09793368984357992) * t2;
+    y[125] = t11;
+    t4 = (-C89) * t12;
+    t9 = C88 * t1;
+    t7 = t4 + t9;
+    t3 = 0.11052570836958936 * t7;
+    y[234] = t3;
+    t5 = 0.05253338677834252 * t7;
+    y[305] = t5;
+    t0 = (-C90) * t10;
+    t6 = (-C91) * t14;
+    t8 = t0 + t6;
+    t13 = 0.10577241761811562 * t8;
+    y[215] = t13;
+    t2 = 0.023561556790462897 * t8;
+    y[324] = t2;
+    t11 = C91 * t10;
+    t12 = (-C90) * t14;
+    t1 = t11 + t12;
+    y[35] = 0;
+    t4 = (-0.10504733995234042) * t1;
+    y[144] = t4;
+    t9 = re[84];
+    t3 = im[84];
+    t7 = re[39];
+    t5 = im[39];
+    t0 = t9 - t7;
+    t6 = t3 - t5;
+    t13 = t9 + t7;
+    t8 = t3 + t5;
+    t2 = (-C92) * t13;
+    t10 = (-C93) * t8;
+    t14 = t2 + t10;
+    t11 = 0.10542273976138705 * t14;
+    y[213] = t11;
+    t12 = 0.02102631934479988 * t14;
+    y[326] = t12;
+    t1 = C93 * t13;
+    t4 = (-C92) * t8;
+    t9 = t1 + t4;
+    y[33] = 0;
+    t7 = (-0.10539577264127174) * t9;
+    y[146] = t7;
+    t3 = C94 * t0;
+    t5 = C95 * t6;
+    t2 = t3 + t5;
+    t10 = 0.006991188554664076 * t2;
+    y[56] = t10;
+    t11 = (-0.09660859225373081) * t2;
+    y[123] = t11;
+    t14 = (-C95) * t0;
+    t12 = C94 * t6;
+    t13 = t14 + t12;
+    t8 = 0.11096858947791874 * t13;
+    y[236] = t8;
+    t1 = 0.055869169342692634 * t13;
+    y[303] = t1;
+    t4 = re[42];
+    t9 = im[42];
+    t7 = re[87];
+    t3 = im[87];
+    t5 = t4 - t7;
+    t10 = t9 - t3;
+    t2 = t4 + t7;
+    t11 = t9 + t3;
+    t0 = C96 * t2;
+    t6 = C97 * t11;
+    t14 = t0 + t6;
+    t12 = 0.008717302904480926 * t14;
+    y[58] = t12;
+    t8 = (-0.09514316862034689) * t14;
+    y[121] = t8;
+    t13 = (-C97) * t2;
+    t1 = C96 * t11;
+    t4 = t13 + t1;
+    t7 = 0.11135812131039002 * t4;
+    y[238] = t7;
+    t9 = 0.05920943710311134 * t4;
+    y[301] = t9;
+    t3 = (-C98) * t5;
+    t0 = (-C99) * t10;
+    t6 = t3 + t0;
+    t12 = 0.10512566139996281 * t6;
+    y[211] = t12;
+    t14 = 0.018626993267046175 * t6;
+    y[328] = t14;
+    t8 = C99 * t5;
+    t2 = (-C98) * t10;
+    t11 = t8 + t2;
+    y[31] = 0;
+    t13 = (-0.10569361431970062) * t11;
+    y[148] = t13;
+    t1 = re[10];
+    t7 = im[10];
+    t4 = re[55];
+    t9 = im[55];
+    t3 = t1 - t4;
+    t0 = t7 - t9;
+    t12 = t1 + t4;
+    t6 = t7 + t9;
+    t14 = (-C100) * t12;
+    t5 = (-C101) * t6;
+    t10 = t14 + t5;
+    t8 = 0.10487973921603179 * t10;
+    y[209] = t8;
+    t2 = 0.0163672975990987 * t10;
+    y[330] = t2;
+    t11 = C101 * t12;
+    t13 = (-C100) * t6;
+    t1 = t11 + t13;
+    y[29] = 0;
+    t4 = (-0.1059414448793049) * t1;
+    y[150] = t4;
+    t7 = C102 * t3;
+    t9 = C103 * t0;
+    t14 = t7 + t9;
+    t5 = 0.010634922571204589 * t14;
+    y[60] = t5;
+    t8 = (-0.09353555143552254) * t14;
+    y[119] = t8;
+    t10 = (-C103) * t3;
+    t2 = C102 * t0;
+    t12 = t10 + t2;
+    t6 = 0.1116795160109561 * t12;
+    y[240] = t6;
+    t11 = 0.06253980623939123 * t12;
+    y[299] = t11;
+    t13 = re[58];
+    t1 = im[58];
+    t4 = re[13];
+    t7 = im[13];
+    t9 = t13 - t4;
+    t5 = t1 - t7;
+    t14 = t13 + t4;
+    t8 = t1 + t7;
+    t3 = C104 * t14;
+    t0 = C105 * t8;
+    t10 = t3 + t0;
+    t2 = 0.01273784185791163 * t10;
+    y[62] = t2;
+    t6 = (-0.09177980677333142) * t10;
+    y[117] = t6;
+    t12 = (-C105) * t14;
+    t11 = C104 * t8;
+    t13 = t12 + t11;
+    t4 = 0.11192407043335297 * t13;
+    y[242] = t4;
+    t1 = 0.06584644108548751 * t13;
+    y[297] = t1;
+    t7 = (-C106) * t9;
+    t3 = (-C107) * t5;
+    t0 = t7 + t3;
+    t2 = 0.10468272521430462 * t0;
+    y[207] = t2;
+    t10 = 0.014254157485166856 * t0;
+    y[332] = t10;
+    t6 = C107 * t9;
+    t14 = (-C106) * t5;
+    t8 = t6 + t14;
+    y[27] = 0;
+    t12 = (-0.10614082780482303) * t8;
+    y[152] = t12;
+    t11 = re[16];
+    t4 = im[16];
+    t13 = re[61];
+    t1 = im[61];
+    t7 = t11 - t13;
+    t3 = t4 - t1;
+    t2 = t11 + t13;
+    t0 = t4 + t1;
+    t10 = (-C108) * t2;
+    t9 = (-C109) * t0;
+    t5 = t10 + t9;
+    t6 = 0.10453260185425502 * t5;
+    y[205] = t6;
+    t14 = 0.012291201401904974 * t5;
+    y[334] = t14;
+    t8 = C109 * t2;
+    t12 = (-C108) * t0;
+    t11 = t8 + t12;
+    y[25] = 0;
+    t13 = (-0.10629326080109268) * t11;
+    y[154] = t13;
+    t4 = C110 * t7;
+    t1 = C111 * t3;
+    t10 = t4 + t1;
+    t9 = 0.015018768373128936 * t10;
+    y[64] = t9;
+    t6 = (-0.08987633190957331) * t10;
+    y[115] = t6;
+    t5 = (-C111) * t7;
+    t14 = C110 * t3;
+    t2 = t5 + t14;
+    t0 = 0.11207741615761654 * t2;
+    y[244] = t0;
+    t8 = 0.06911379356638549 * t2;
+    y[295] = t8;
+    t12 = re[74];
+    t11 = im[74];
+    t13 = re[29];
+    t4 = im[29];
+    t1 = t12 - t13;
+    t9 = t11 - t4;
+    t10 = t12 + t13;
+    t6 = t11 + t4;
+    t7 = C112 * t10;
+    t3 = C113 * t6;
+    t5 = t7 + t3;
+    t14 = 0.01746912534711498 * t5;
+    y[66] = t14;
+    t0 = (-0.08782223808436534) * t5;
+    y[113] = t0;
+    t2 = (-C113) * t10;
+    t8 = C112 * t6;
+    t12 = t2 + t8;
+    t13 = 0.11213066231169123 * t12;
+    y[246] = t13;
+    t11 = 0.07233020336790129 * t12;
+    y[293] = t11;
+    t4 = (-C114) * t1;
+    t7 = (-C115) * t9;
+    t3 = t4 + t7;
+    t14 = 0.10442666453598959 * t3;
+    y[203] = t14;
+    t5 = 0.010480779093744487 * t3;
+    y[336] = t5;
+    t0 = C115 * t1;
+    t10 = (-C114) * t9;
+    t6 = t0 + t10;
+    y[23] = 0;
+    t2 = (-0.10640109171811937) * t6;
+    y[156] = t2;
+    t8 = re[32];
+    t13 = im[32];
+    t12 = re[77];
+    t11 = im[77];
+    t4 = t8 - t12;
+    t7 = t13 - t11;
+    t14 = t8 + t12;
+    t3 = t13 + t11;
+    t5 = (-C116) * t14;
+    t1 = (-C117) * t3;
+    t9 = t5 + t1;
+    t0 = 0.10436228446480811 * t9;
+    y[201] = t0;
+    t10 = 0.00882444138494175 * t9;
+    y[338] = t10;
+    t6 = C117 * t14;
+    t2 = (-C116) * t3;
+    t8 = t6 + t2;
+    y[21] = 0;
+    t12 = (-0.1064667295095277) * t8;
+    y[158] = t12;
+    t13 = C118 * t4;
+    t11 = C119 * t7;
+    t5 = t13 + t11;
+    t1 = 0.02007900444097957 * t5;
+    y[68] = t1;
+    t0 = (-0.08561946843470827) * t5;
+    y[111] = t0;
+    t9 = (-C119) * t4;
+    t10 = C118 * t7;
+    t14 = t9 + t10;
+    t3 = 0.11207172864296862 * t14;
+    y[248] = t3;
+    t6 = 0.07548129602721117 * t14;
+    y[291] = t6;
+    t2 = re[80];
+    t8 = im[80];
+    t12 = re[35];
+    t13 = im[35];
+    t11 = t2 - t12;
+    t1 = t8 - t13;
+    t5 = t2 + t12;
+    t0 = t8 + t13;
+    t4 = C120 * t5;
+    t7 = C121 * t0;
+    t9 = t4 + t7;
+    t10 = 0.022836010382399043 * t9;
+    y[70] = t10;
+    t3 = (-0.0832703302350659) * t9;
+    y[109] = t3;
+    t14 = (-C121) * t5;
+    t6 = C120 * t0;
+    t2 = t14 + t6;
+    t12 = 0.11189126112211174 * t2;
+    y[250] = t12;
+    t8 = 0.07855526499661797 * t2;
+    y[289] = t8;
+    t13 = (-C122) * t11;
+    t4 = (-C123) * t1;
+    t7 = t13 + t4;
+    t10 = 0.10433646450524006 * t7;
+    y[199] = t10;
+    t9 = 0.007322741888918101 * t7;
+    y[340] = t9;
+    t3 = C123 * t11;
+    t5 = (-C122) * t1;
+    t0 = t3 + t5;
+    y[19] = 0;
+    t14 = (-0.10649307664199294) * t0;
+    y[160] = t14;
+    t6 = re[18];
+    t12 = im[18];
+    t2 = re[63];
+    t8 = im[63];
+    t13 = t6 - t2;
+    t4 = t12 - t8;
+    t10 = t6 + t2;
+    t7 = t12 + t8;
+    t9 = (-C124) * t10;
+    t11 = (-C125) * t7;
+    t1 = t9 + t11;
+    t3 = 0.10434601759724747 * t1;
+    y[197] = t3;
+    t5 = 0.00597475942728469 * t1;
+    y[342] = t5;
+    t0 = C125 * t10;
+    t14 = (-C124) * t7;
+    t6 = t0 + t14;
+    y[17] = 0;
+    t2 = (-0.10648332698232474) * t6;
+    y[162] = t2;
+    t12 = C126 * t13;
+    t8 = C127 * t4;
+    t9 = t12 + t8;
+    t11 = 0.025727538017752363 * t9;
+    y[72] = t11;
+    t3 = (-0.08077908739264364) * t9;
+    y[107] = t3;
+    t1 = (-C127) * t13;
+    t5 = C126 * t4;
+    t10 = t1 + t5;
+    t7 = 0.11157928098847411 * t10;
+    y[252] = t7;
+    t0 = 0.08154058967816075 * t10;
+    y[287] = t0;
+    t14 = re[66];
+    t6 = im[66];
+    t2 = re[21];
+    t12 = im[21];
+    t8 = t14 - t2;
+    t11 = t6 - t12;
+    t9 = t14 + t2;
+    t3 = t6 + t12;
+    t13 = C128 * t9;
+    t4 = C129 * t3;
+    t1 = t13 + t4;
+    t5 = 0.028739200127234528 * t1;
+    y[74] = t5;
+    t7 = (-0.07815126422793621) * t1;
+    y[105] = t7;
+    t10 = (-C129) * t9;
+    t0 = C128 * t3;
+    t14 = t10 + t0;
+    t2 = 0.11112823978612332 * t14;
+    y[254] = t2;
+    t6 = 0.08442471153193547 * t14;
+    y[285] = t6;
+    t12 = (-C130) * t8;
+    t13 = (-C131) * t11;
+    t4 = t12 + t13;
+    t5 = 0.10438765580397108 * t4;
+    y[195] = t5;
+    t1 = 0.004778532564716806 * t4;
+    y[344] = t1;
+    t7 = C131 * t8;
+    t9 = (-C130) * t11;
+    t3 = t7 + t9;
+    y[15] = 0;
+    t10 = (-0.10644085285310552) * t3;
+    y[164] = t10;
+    t0 = re[24];
+    t2 = im[24];
+    t14 = re[69];
+    t6 = im[69];
+    t12 = t0 - t14;
+    t13 = t2 - t6;
+    t5 = t0 + t14;
+    t4 = t2 + t6;
+    t1 = (-C132) * t5;
+    t8 = (-C133) * t4;
+    t11 = t1 + t8;
+    t7 = 0.10445796994690988 * t11;
+    y[193] = t7;
+    t9 = 0.0037318695349662285 * t11;
+    y[346] = t9;
+    t3 = C133 * t5;
+    t10 = (-C132) * t4;
+    t0 = t3 + t10;
+    y[13] = 0;
+    t14 = (-0.1063692039655592) * t0;
+    y[166] = t14;
+    t2 = C134 * t12;
+    t6 = C135 * t13;
+    t1 = t2 + t6;
+    t8 = 0.0318543301923774 * t1;
+    y[76] = t8;
+    t7 = (-0.07539457511296481) * t1;
+    y[103] = t7;
+    t11 = (-C135) * t12;
+    t9 = C134 * t13;
+    t5 = t11 + t9;
+    t4 = 0.11053192528606762 * t5;
+    y[256] = t4;
+    t3 = 0.08719704828120174 * t5;
+    y[283] = t3;
+    t10 = re[82];
+    t0 = im[82];
+    t14 = re[37];
+    t2 = im[37];
+    t6 = t10 - t14;
+    t8 = t0 - t2;
+    t1 = t10 + t14;
+    t7 = t0 + t2;
+    t12 = C136 * t1;
+    t13 = C137 * t7;
+    t11 = t12 + t13;
+    t9 = 0.03505523933023199 * t11;
+    y[78] = t9;
+    t4 = (-0.07251899904062391) * t11;
+    y[101] = t4;
+    t5 = (-C137) * t1;
+    t3 = C136 * t7;
+    t10 = t5 + t3;
+    t14 = 0.10978391243307457 * t10;
+    y[258] = t14;
+    t0 = 0.089849384311141 * t10;
+    y[281] = t0;
+    t2 = (-C138) * t6;
+    t12 = (-C139) * t8;
+    t13 = t2 + t12;
+    t9 = 0.10455343402886527 * t13;
+    y[191] = t9;
+    t11 = 0.002831428512025885 * t13;
+    y[348] = t11;
+    t4 = C139 * t6;
+    t1 = (-C138) * t8;
+    t7 = t4 + t1;
+    y[11] = 0;
+    t5 = (-0.10627208196761412) * t7;
+    y[168] = t5;
+    t3 = re[40];
+    t14 = im[40];
+    t10 = re[85];
+    t0 = im[85];
+    t2 = t3 - t10;
+    t12 = t14 - t0;
+    t9 = t3 + t10;
+    t13 = t14 + t0;
+    t11 = (-C140) * t9;
+    t6 = (-C141) * t13;
+    t8 = t11 + t6;
+    t4 = 0.10467052399007644 * t8;
+    y[189] = t4;
+    t1 = 0.00207288243561721 * t8;
+    y[350] = t1;
+    t7 = C141 * t9;
+    t5 = (-C140) * t13;
+    t3 = t7 + t5;
+    y[9] = 0;
+    t10 = (-0.10615320041929409) * t3;
+    y[170] = t10;
+    t14 = C142 * t2;
+    t0 = C143 * t12;
+    t11 = t14 + t0;
+    t6 = 0.03832547887509067 * t11;
+    y[80] = t6;
+    t4 = (-0.0695334865235696) * t11;
+    y[99] = t4;
+    t8 = (-C143) * t2;
+    t1 = C142 * t12;
+    t9 = t8 + t1;
+    t13 = 0.10888112665010784 * t9;
+    y[260] = t13;
+    t7 = 0.09237266858564189 * t9;
+    y[279] = t7;
+    t5 = re[88];
+    t3 = im[88];
+    t10 = re[43];
+    t14 = im[43];
+    t0 = t5 - t10;
+    t6 = t3 - t14;
+    t11 = t5 + t10;
+    t4 = t3 + t14;
+    t2 = C144 * t11;
+    t12 = C145 * t4;
+    t8 = t2 + t12;
+    t1 = 0.041646250636607804 * t8;
+    y[82] = t1;
+    t13 = (-0.0664515457924376) * t8;
+    y[97] = t13;
+    t9 = (-C145) * t11;
+    t7 = C144 * t4;
+    t5 = t9 + t7;
+    t10 = 0.10781825814583676 * t5;
+    y[262] = t10;
+    t3 = 0.09476053984084731 * t5;
+    y[277] = t3;
+    t14 = (-C146) * t0;
+    t2 = (-C147) * t6;
+    t12 = t14 + t2;
+    t1 = 0.10480559227732088 * t12;
+    y[187] = t1;
+    t8 = 0.0014514366788171667 * t12;
+    y[352] = t8;
+    t13 = C147 * t0;
+    t11 = (-C146) * t6;
+    t4 = t13 + t11;
+    y[7] = 0;
+    t9 = (-0.1060163954010255) * t4;
+    y[172] = t9;
+    t7 = re[56];
+    t10 = im[56];
+    t5 = re[11];
+    t3 = im[11];
+    t14 = t7 - t5;
+    t2 = t10 - t3;
+    t1 = t7 + t5;
+    t12 = t10 + t3;
+    t8 = (-C148) * t1;
+    t0 = (-C149) * t12;
+    t6 = t8 + t0;
+    t13 = 0.10495498046159855 * t6;
+    y[185] = t13;
+    t11 = 0.0009579147564804909 * t6;
+    y[354] = t11;
+    t4 = C149 * t1;
+    t9 = (-C148) * t12;
+    t7 = t4 + t9;
+    y[5] = 0;
+    t5 = (-0.10586549644660743) * t7;
+    y[174] = t5;
+    t10 = C150 * t14;
+    t3 = C151 * t2;
+    t8 = t10 + t3;
+    t0 = 0.04499990039956431 * t8;
+    y[84] = t0;
+    t13 = (-0.06328411738407469) * t8;
+    y[95] = t13;
+    t6 = (-C151) * t14;
+    t11 = C150 * t2;
+    t1 = t6 + t11;
+    t12 = 0.10659592439523378 * t1;
+    y[264] = t12;
+    t4 = 0.09700648402016114 * t1;
+    y[275] = t4;
+    t9 = re[14];
+    t7 = im[14];
+    t5 = re[59];
+    t10 = im[59];
+    t3 = t9 - t5;
+    t0 = t7 - t10;
+    t8 = t9 + t5;
+    t13 = t7 + t10;
+    t14 = C152 * t8;
+    t2 = C153 * t13;
+    t6 = t14 + t2;
+    t11 = 0.04836983709461063 * t6;
+    y[86] = t11;
+    t12 = (-0.0600463334420454) * t6;
+    y[93] = t12;
+    t1 = (-C153) * t8;
+    t4 = C152 * t13;
+    t9 = t1 + t4;
+    t5 = 0.10521100884722148 * t9;
+    y[266] = t5;
+    t7 = 0.09910258293243136 * t9;
+    y[273] = t7;
+    t10 = (-C154) * t3;
+    t14 = (-C155) * t0;
+    t2 = t10 + t14;
+    t11 = 0.10511501301267116 * t2;
+    y[183] = t11;
+    t6 = 0.000582585005005862 * t2;
+    y[356] = t6;
+    t12 = C155 * t3;
+    t8 = (-C154) * t0;
+    t13 = t12 + t8;
+    y[3] = 0;
+    t1 = (-0.10570432132060638) * t13;
+    y[176] = t1;
+    t4 = re[62];
+    t5 = im[62];
+    t9 = re[17];
+    t7 = im[17];
+    t10 = t4 - t9;
+    t14 = t5 - t7;
+    t11 = t4 + t9;
+    t2 = t5 + t7;
+    t6 = (-C156) * t11;
+    t3 = (-C157) * t2;
+    t0 = t6 + t3;
+    t12 = 0.10528188045534946 * t0;
+    y[181] = t12;
+    t8 = 0.0003110214546045697 * t0;
+    y[358] = t8;
+    t13 = C157 * t11;
+    t1 = (-C156) * t2;
+    t4 = t13 + t1;
+    y[1] = 0;
+    t9 = (-0.1055367843265621) * t4;
+    y[178] = t9;
+    t5 = C158 * t10;
+    t7 = C159 * t14;
+    t6 = t5 + t7;
+    t3 = 0.05173842041721468 * t6;
+    y[88] = t3;
+    t12 = (-0.05675218688923857) * t6;
+    y[91] = t12;
+    t0 = (-C159) * t10;
+    t8 = C158 * t14;
+    t11 = t0 + t8;
+    t2 = 0.10366449176446424 * t11;
+    y[268] = t2;
+    t13 = 0.10104530556902915 * t11;
+    y[271] = t13;
+}
+
+//
+//  Public functions.
+//
+
+/**
+ *  Apply LD-MDCT transform (prebuilt for window W75_180).
+ * 
+ *  Note(s):
+ *    [1] X[k] = SUM(w[n] * x[n] * cos(PI / 180 * (n + 90.5) * (k + 0.5))), where
+ *        w[n] = sqrt(2 / 180) * W75_180[n].
+ *    [2] The size of all arrays will not be checked.
+ * 
+ *  @param {Number[]} x 
+ *    - The input block (360 points).
+ *  @param {Number[]} X 
+ *    - The array that would contain the output block (180 points).
+ *  @param {Number[]} re 
+ *    - The scratch buffer (real part, 90 points).
+ *  @param {Number[]} im 
+ *    - The scratch buffer (imaginary part, 90 points).
+ */
+function ApplyWindowedMDCT_W75_180(x, X, re, im) {
+    ApplyWindowedMDCT_W75_180_Part1(x, X, re, im);
+    ApplyWindowedMDCT_W75_180_Part2(x, X, re, im);
+    ApplyWindowedMDCT_W75_180_Part3(x, X, re, im);
+}
+
+/**
+ *  Apply LD-IMDCT transform (prebuilt for window W75_180).
+ * 
+ *  Note(s):
+ *    [1] y[n] = w[n] * SUM(X[k] * cos(PI / 180 * (n + 90.5) * (k + 0.5))), where
+ *        w[n] = sqrt(2 / 180) * W75_180[359 - n].
+ *    [2] The size of all arrays will not be checked.
+ * 
+ *  @param {Number[]} X 
+ *    - The input block (180 points).
+ *  @param {Number[]} y 
+ *    - The array that would contain the output block (360 points).
+ *  @param {Number[]} re 
+ *    - The scratch buffer (real part, 90 points).
+ *  @param {Number[]} im 
+ *    - The scratch buffer (imaginary part, 90 points).
+ */
+function ApplyWindowedIMDCT_W75_180(X, y, re, im) {
+    ApplyWindowedIMDCT_W75_180_Part1(X, y, re, im);
+    ApplyWindowedIMDCT_W75_180_Part2(X, y, re, im);
+    ApplyWindowedIMDCT_W75_180_Part3(X, y, re, im);
+}
+
+//  Export public APIs.
+module.exports = {
+    "ApplyWindowedMDCT_W75_180": ApplyWindowedMDCT_W75_180,
+    "ApplyWindowedIMDCT_W75_180": ApplyWindowedIMDCT_W75_180
+};
\ No newline at end of file
@@ -0,0 +1,6107 @@
+//
+//  Copyright 2021 - 2023 XiaoJSoft Studio. All rights reserved.
+//  Use of this source code is governed by a BSD-style license that can be
+//  found in the LICENSE.md file.
+//
+
+//
+//  Note(s):
+//    [1] This file is generated automatically by a MDCT compiler, which locates 
+//        at "./../../dev/mdct-generator/" directory.
+//        Do NOT modify this file manually.
+//
+
+//
+//  Private functions.
+//
+
+/**
+ *  Part 1 of ApplyWindowedIMDCT_W10_240_K160().
+ * 
+ *  @param {Number[]} X 
+ *    - The input block (240 points, only the first 160 points are used).
+ *  @param {Number[]} y 
+ *    - The array that would contain the output block (480 points).
+ *  @param {Number[]} re 
+ *    - The scratch buffer (real part, 120 points).
+ *  @param {Number[]} im 
+ *    - The scratch buffer (imaginary part, 120 points).
+ */
+function ApplyWindowedIMDCT_W10_240_K160_Part1(X, y, re, im) {
+    let t0, t1, t10, t11, t12, t13, t14, t15, t16, t17, t18, t19, t2, t3, t4, t5, t6, t7, t8, t9;
+    const C0 = 0.9807852804032304;
+    const C1 = 0.19509032201612825;
+    const C2 = 0.9238795325112867;
+    const C3 = 0.3826834323650898;
+    const C4 = 0.8314696123025452;
+    const C5 = 0.5555702330196022;
+    const C6 = 0.7071067811865476;
+    const C7 = 0.7071067811865475;
+    const C8 = 0.9510565162951535;
+    const C9 = 0.3090169943749474;
+    const C10 = 0.8724960070727972;
+    const C11 = 0.4886212414969549;
+    const C12 = 0.7604059656000309;
+    const C13 = 0.6494480483301837;
+    const C14 = 0.619093949309834;
+    const C15 = 0.785316930880745;
+    const C16 = 0.8910065241883679;
+    const C17 = 0.45399049973954675;
+    const C18 = 0.9624552364536473;
+    const C19 = 0.27144044986507426;
+    const C20 = 0.996917333733128;
+    const C21 = 0.07845909572784494;
+    const C22 = 0.9930684569549263;
+    const C23 = 0.11753739745783764;
+    const C24 = 0.8090169943749475;
+    const C25 = 0.5877852522924731;
+    const C26 = 0.6788007455329417;
+    const C27 = 0.7343225094356856;
+    const C28 = 0.5224985647159488;
+    const C29 = 0.8526401643540922;
+    const C30 = 0.9381913359224842;
+    const C31 = 0.34611705707749296;
+    const C32 = 0.9876883405951378;
+    const C33 = 0.15643446504023087;
+    const C34 = 0.9992290362407229;
+    const C35 = 0.03925981575906861;
+    const C36 = 0.9723699203976766;
+    const C37 = 0.2334453638559054;
+    const C38 = 0.9081431738250813;
+    const C39 = 0.41865973753742813;
+    const C40 = 0.5590169943749475;
+    const C41 = 0.25;
+    t0 = X[0];
+    t1 = X[30];
+    t2 = C0 * t1;
+    t1 = (-C1) * t1;
+    t3 = X[60];
+    t4 = C2 * t3;
+    t3 = (-C3) * t3;
+    t5 = X[90];
+    t6 = X[149];
+    t7 = C4 * t5;
+    t8 = C5 * t6;
+    t7 = t7 + t8;
+    t8 = (-C5) * t5;
+    t5 = C4 * t6;
+    t6 = t8 + t5;
+    t8 = X[120];
+    t5 = X[119];
+    t9 = C6 * t8;
+    t10 = C7 * t5;
+    t9 = t9 + t10;
+    t10 = (-C7) * t8;
+    t8 = C6 * t5;
+    t5 = t10 + t8;
+    t10 = X[150];
+    t8 = X[89];
+    t11 = C5 * t10;
+    t12 = C4 * t8;
+    t11 = t11 + t12;
+    t12 = (-C4) * t10;
+    t10 = C5 * t8;
+    t8 = t12 + t10;
+    t12 = X[59];
+    t10 = C2 * t12;
+    t12 = C3 * t12;
+    t13 = X[29];
+    t14 = C0 * t13;
+    t13 = C1 * t13;
+    t15 = t0 + t9;
+    t16 = t4 + t10;
+    t17 = t3 + t12;
+    t0 = t0 - t9;
+    t9 = -t5;
+    t4 = t4 - t10;
+    t10 = t3 - t12;
+    t3 = t15 + t16;
+    t12 = t5 + t17;
+    t18 = t0 + t10;
+    t9 = t9 - t4;
+    t15 = t15 - t16;
+    t16 = t5 - t17;
+    t17 = t0 - t10;
+    t0 = t4 - t5;
+    t10 = t2 + t11;
+    t4 = t1 + t8;
+    t5 = t7 + t14;
+    t19 = t6 + t13;
+    t2 = t2 - t11;
+    t11 = t1 - t8;
+    t1 = t7 - t14;
+    t8 = t6 - t13;
+    t7 = t10 + t5;
+    t14 = t4 + t19;
+    t6 = t2 + t8;
+    t13 = t11 - t1;
+    t10 = t10 - t5;
+    t5 = t4 - t19;
+    t4 = t2 - t8;
+    t19 = t11 + t1;
+    t2 = t6 + t13;
+    t8 = t6 - t13;
+    t11 = C6 * t2;
+    t1 = (-C6) * t8;
+    t6 = t4 - t19;
+    t13 = t4 + t19;
+    t2 = (-C6) * t6;
+    t8 = (-C6) * t13;
+    t4 = t3 - t7;
+    t19 = t12 - t14;
+    t6 = t3 + t7;
+    t13 = t12 + t14;
+    t3 = t18 - t11;
+    t7 = t9 - t1;
+    t12 = t18 + t11;
+    t14 = t9 + t1;
+    t18 = t15 - t5;
+    t11 = t16 + t10;
+    t9 = t15 + t5;
+    t1 = t16 - t10;
+    t15 = t17 - t2;
+    t5 = t0 - t8;
+    t16 = t17 + t2;
+    t10 = t0 + t8;
+    re[0] = t6;
+    im[0] = t13;
+    re[15] = t12;
+    im[15] = t14;
+    re[30] = t9;
+    im[30] = t1;
+    re[45] = t16;
+    im[45] = t10;
+    re[60] = t4;
+    im[60] = t19;
+    re[75] = t3;
+    im[75] = t7;
+    re[90] = t18;
+    im[90] = t11;
+    re[105] = t15;
+    im[105] = t5;
+    t17 = X[48];
+    t2 = C8 * t17;
+    t0 = (-C9) * t17;
+    t8 = X[78];
+    t6 = C10 * t8;
+    t13 = (-C11) * t8;
+    t12 = X[108];
+    t14 = X[131];
+    t9 = C12 * t12;
+    t1 = C13 * t14;
+    t16 = t9 + t1;
+    t10 = (-C13) * t12;
+    t4 = C12 * t14;
+    t19 = t10 + t4;
+    t3 = X[138];
+    t7 = X[101];
+    t18 = C14 * t3;
+    t11 = C15 * t7;
+    t15 = t18 + t11;
+    t5 = (-C15) * t3;
+    t17 = C14 * t7;
+    t8 = t5 + t17;
+    t9 = X[71];
+    t1 = C16 * t9;
+    t12 = C17 * t9;
+    t14 = X[41];
+    t10 = C18 * t14;
+    t4 = C19 * t14;
+    t18 = X[11];
+    t11 = C20 * t18;
+    t3 = C21 * t18;
+    t7 = X[18];
+    t5 = C22 * t7;
+    t17 = (-C23) * t7;
+    t9 = t2 + t1;
+    t14 = t0 + t12;
+    t18 = t16 + t11;
+    t7 = t19 + t3;
+    t2 = t2 - t1;
+    t1 = t0 - t12;
+    t0 = t16 - t11;
+    t12 = t19 - t3;
+    t16 = t9 + t18;
+    t11 = t14 + t7;
+    t19 = t2 + t12;
+    t3 = t1 - t0;
+    t9 = t9 - t18;
+    t18 = t14 - t7;
+    t14 = t2 - t12;
+    t7 = t1 + t0;
+    t2 = t6 + t10;
+    t12 = t13 + t4;
+    t1 = t15 + t5;
+    t0 = t8 + t17;
+    t6 = t6 - t10;
+    t10 = t13 - t4;
+    t13 = t15 - t5;
+    t4 = t8 - t17;
+    t15 = t2 + t1;
+    t5 = t12 + t0;
+    t8 = t6 + t4;
+    t17 = t10 - t13;
+    t2 = t2 - t1;
+    t1 = t12 - t0;
+    t12 = t6 - t4;
+    t0 = t10 + t13;
+    t6 = t8 + t17;
+    t4 = t8 - t17;
+    t10 = C6 * t6;
+    t13 = (-C6) * t4;
+    t8 = t12 - t0;
+    t17 = t12 + t0;
+    t6 = (-C6) * t8;
+    t4 = (-C6) * t17;
+    t12 = t16 - t15;
+    t0 = t11 - t5;
+    t8 = t16 + t15;
+    t17 = t11 + t5;
+    t16 = t19 - t10;
+    t15 = t3 - t13;
+    t11 = t19 + t10;
+    t5 = t3 + t13;
+    t19 = t9 - t1;
+    t10 = t18 + t2;
+    t3 = t9 + t1;
+    t13 = t18 - t2;
+    t9 = t14 - t6;
+    t1 = t7 - t4;
+    t18 = t14 + t6;
+    t2 = t7 + t4;
+    re[24] = t8;
+    im[24] = t17;
+    re[39] = t11;
+    im[39] = t5;
+    re[54] = t3;
+    im[54] = t13;
+    re[69] = t18;
+    im[69] = t2;
+    re[84] = t12;
+    im[84] = t0;
+    re[99] = t16;
+    im[99] = t15;
+    re[114] = t19;
+    im[114] = t10;
+    re[9] = t9;
+    im[9] = t1;
+    t14 = X[96];
+    t6 = X[143];
+    t7 = C24 * t14;
+    t4 = C25 * t6;
+    t8 = t7 + t4;
+    t17 = (-C25) * t14;
+    t11 = C24 * t6;
+    t5 = t17 + t11;
+    t3 = X[126];
+    t13 = X[113];
+    t18 = C26 * t3;
+    t2 = C27 * t13;
+    t12 = t18 + t2;
+    t0 = (-C27) * t3;
+    t16 = C26 * t13;
+    t15 = t0 + t16;
+    t19 = X[156];
+    t10 = X[83];
+    t9 = C28 * t19;
+    t1 = C29 * t10;
+    t7 = t9 + t1;
+    t4 = (-C29) * t19;
+    t14 = C28 * t10;
+    t6 = t4 + t14;
+    t17 = X[53];
+    t11 = C30 * t17;
+    t18 = C31 * t17;
+    t2 = X[23];
+    t3 = C32 * t2;
+    t13 = C33 * t2;
+    t0 = X[6];
+    t16 = C34 * t0;
+    t9 = (-C35) * t0;
+    t1 = X[36];
+    t19 = C36 * t1;
+    t10 = (-C37) * t1;
+    t4 = X[66];
+    t14 = C38 * t4;
+    t17 = (-C39) * t4;
+    t2 = t8 + t3;
+    t0 = t5 + t13;
+    t1 = t7 + t19;
+    t4 = t6 + t10;
+    t8 = t8 - t3;
+    t3 = t5 - t13;
+    t5 = t7 - t19;
+    t13 = t6 - t10;
+    t7 = t2 + t1;
+    t19 = t0 + t4;
+    t6 = t8 + t13;
+    t10 = t3 - t5;
+    t2 = t2 - t1;
+    t1 = t0 - t4;
+    t0 = t8 - t13;
+    t4 = t3 + t5;
+    t8 = t12 + t16;
+    t13 = t15 + t9;
+    t3 = t11 + t14;
+    t5 = t18 + t17;
+    t12 = t12 - t16;
+    t16 = t15 - t9;
+    t15 = t11 - t14;
+    t9 = t18 - t17;
+    t11 = t8 + t3;
+    t14 = t13 + t5;
+    t18 = t12 + t9;
+    t17 = t16 - t15;
+    t8 = t8 - t3;
+    t3 = t13 - t5;
+    t13 = t12 - t9;
+    t5 = t16 + t15;
+    t12 = t18 + t17;
+    t9 = t18 - t17;
+    t16 = C6 * t12;
+    t15 = (-C6) * t9;
+    t18 = t13 - t5;
+    t17 = t13 + t5;
+    t12 = (-C6) * t18;
+    t9 = (-C6) * t17;
+    t13 = t7 - t11;
+    t5 = t19 - t14;
+    t18 = t7 + t11;
+    t17 = t19 + t14;
+    t7 = t6 - t16;
+    t11 = t10 - t15;
+    t19 = t6 + t16;
+    t14 = t10 + t15;
+    t6 = t2 - t3;
+    t16 = t1 + t8;
+    t10 = t2 + t3;
+    t15 = t1 - t8;
+    t2 = t0 - t12;
+    t3 = t4 - t9;
+    t1 = t0 + t12;
+    t8 = t4 + t9;
+    re[48] = t18;
+    im[48] = t17;
+    re[63] = t19;
+    im[63] = t14;
+    re[78] = t10;
+    im[78] = t15;
+    re[93] = t1;
+    im[93] = t8;
+    re[108] = t13;
+    im[108] = t5;
+    re[3] = t7;
+    im[3] = t11;
+    re[18] = t6;
+    im[18] = t16;
+    re[33] = t2;
+    im[33] = t3;
+    t0 = X[144];
+    t12 = X[95];
+    t4 = C25 * t0;
+    t9 = C24 * t12;
+    t18 = t4 + t9;
+    t17 = (-C24) * t0;
+    t19 = C25 * t12;
+    t14 = t17 + t19;
+    t10 = X[65];
+    t15 = C38 * t10;
+    t1 = C39 * t10;
+    t8 = X[35];
+    t13 = C36 * t8;
+    t5 = C37 * t8;
+    t7 = X[5];
+    t11 = C34 * t7;
+    t6 = C35 * t7;
+    t16 = X[24];
+    t2 = C32 * t16;
+    t3 = (-C33) * t16;
+    t4 = X[54];
+    t9 = C30 * t4;
+    t0 = (-C31) * t4;
+    t12 = X[84];
+    t17 = X[155];
+    t19 = C29 * t12;
+    t10 = C28 * t17;
+    t8 = t19 + t10;
+    t7 = (-C28) * t12;
+    t16 = C29 * t17;
+    t4 = t7 + t16;
+    t19 = X[114];
+    t10 = X[125];
+    t12 = C27 * t19;
+    t17 = C26 * t10;
+    t7 = t12 + t17;
+    t16 = (-C26) * t19;
+    t12 = C27 * t10;
+    t17 = t16 + t12;
+    t19 = t18 + t2;
+    t10 = t14 + t3;
+    t16 = t13 + t8;
+    t12 = t5 + t4;
+    t18 = t18 - t2;
+    t2 = t14 - t3;
+    t14 = t13 - t8;
+    t3 = t5 - t4;
+    t13 = t19 + t16;
+    t8 = t10 + t12;
+    t5 = t18 + t3;
+    t4 = t2 - t14;
+    t19 = t19 - t16;
+    t16 = t10 - t12;
+    t10 = t18 - t3;
+    t12 = t2 + t14;
+    t18 = t15 + t9;
+    t3 = t1 + t0;
+    t2 = t11 + t7;
+    t14 = t6 + t17;
+    t15 = t15 - t9;
+    t9 = t1 - t0;
+    t1 = t11 - t7;
+    t0 = t6 - t17;
+    t11 = t18 + t2;
+    t7 = t3 + t14;
+    t6 = t15 + t0;
+    t17 = t9 - t1;
+    t18 = t18 - t2;
+    t2 = t3 - t14;
+    t3 = t15 - t0;
+    t14 = t9 + t1;
+    t15 = t6 + t17;
+    t0 = t6 - t17;
+    t9 = C6 * t15;
+    t1 = (-C6) * t0;
+    t6 = t3 - t14;
+    t17 = t3 + t14;
+    t15 = (-C6) * t6;
+    t0 = (-C6) * t17;
+    t3 = t13 - t11;
+    t14 = t8 - t7;
+    t6 = t13 + t11;
+    t17 = t8 + t7;
+    t13 = t5 - t9;
+    t11 = t4 - t1;
+    t8 = t5 + t9;
+    t7 = t4 + t1;
+    t5 = t19 - t2;
+    t9 = t16 + t18;
+    t4 = t19 + t2;
+    t1 = t16 - t18;
+    t19 = t10 - t15;
+    t2 = t12 - t0;
+    t16 = t10 + t15;
+    t18 = t12 + t0;
+    re[72] = t6;
+    im[72] = t17;
+    re[87] = t8;
+    im[87] = t7;
+    re[102] = t4;
+    im[102] = t1;
+    re[117] = t16;
+    im[117] = t18;
+    re[12] = t3;
+    im[12] = t14;
+    re[27] = t13;
+    im[27] = t11;
+    re[42] = t5;
+    im[42] = t9;
+    re[57] = t19;
+    im[57] = t2;
+    t10 = X[47];
+    t15 = C8 * t10;
+    t12 = C9 * t10;
+    t0 = X[17];
+    t6 = C22 * t0;
+    t17 = C23 * t0;
+    t8 = X[12];
+    t7 = C20 * t8;
+    t4 = (-C21) * t8;
+    t1 = X[42];
+    t16 = C18 * t1;
+    t18 = (-C19) * t1;
+    t3 = X[72];
+    t14 = C16 * t3;
+    t13 = (-C17) * t3;
+    t11 = X[102];
+    t5 = X[137];
+    t9 = C15 * t11;
+    t19 = C14 * t5;
+    t2 = t9 + t19;
+    t10 = (-C14) * t11;
+    t0 = C15 * t5;
+    t8 = t10 + t0;
+    t1 = X[132];
+    t3 = X[107];
+    t9 = C13 * t1;
+    t19 = C12 * t3;
+    t11 = t9 + t19;
+    t5 = (-C12) * t1;
+    t10 = C13 * t3;
+    t0 = t5 + t10;
+    t9 = X[77];
+    t19 = C10 * t9;
+    t1 = C11 * t9;
+    t3 = t15 + t14;
+    t5 = t12 + t13;
+    t10 = t7 + t11;
+    t9 = t4 + t0;
+    t15 = t15 - t14;
+    t14 = t12 - t13;
+    t12 = t7 - t11;
+    t13 = t4 - t0;
+    t7 = t3 + t10;
+    t11 = t5 + t9;
+    t4 = t15 + t13;
+    t0 = t14 - t12;
+    t3 = t3 - t10;
+    t10 = t5 - t9;
+    t5 = t15 - t13;
+    t9 = t14 + t12;
+    t15 = t6 + t2;
+    t13 = t17 + t8;
+    t14 = t16 + t19;
+    t12 = t18 + t1;
+    t6 = t6 - t2;
+    t2 = t17 - t8;
+    t17 = t16 - t19;
+    t8 = t18 - t1;
+    t16 = t15 + t14;
+    t19 = t13 + t12;
+    t18 = t6 + t8;
+    t1 = t2 - t17;
+    t15 = t15 - t14;
+    t14 = t13 - t12;
+    t13 = t6 - t8;
+    t12 = t2 + t17;
+    t6 = t18 + t1;
+    t8 = t18 - t1;
+    t2 = C6 * t6;
+    t17 = (-C6) * t8;
+    t18 = t13 - t12;
+    t1 = t13 + t12;
+    t6 = (-C6) * t18;
+    t8 = (-C6) * t1;
+    t13 = t7 - t16;
+    t12 = t11 - t19;
+    t18 = t7 + t16;
+    t1 = t11 + t19;
+    t7 = t4 - t2;
+    t16 = t0 - t17;
+    t11 = t4 + t2;
+    t19 = t0 + t17;
+    t4 = t3 - t14;
+    t2 = t10 + t15;
+    t0 = t3 + t14;
+    t17 = t10 - t15;
+    t3 = t5 - t6;
+    t14 = t9 - t8;
+    t10 = t5 + t6;
+    t15 = t9 + t8;
+    re[96] = t18;
+    im[96] = t1;
+    re[111] = t11;
+    im[111] = t19;
+    re[6] = t0;
+    im[6] = t17;
+    re[21] = t10;
+    im[21] = t15;
+    re[36] = t13;
+    im[36] = t12;
+    re[51] = t7;
+    im[51] = t16;
+    re[66] = t4;
+    im[66] = t2;
+    re[81] = t3;
+    im[81] = t14;
+    t5 = re[0];
+    t6 = im[0];
+    t9 = re[24];
+    t8 = im[24];
+    t18 = re[48];
+    t1 = im[48];
+    t11 = re[72];
+    t19 = im[72];
+    t0 = re[96];
+    t17 = im[96];
+    t10 = t9 + t0;
+    t15 = t8 + t17;
+    t13 = t18 + t11;
+    t12 = t1 + t19;
+    t7 = t9 - t0;
+    t16 = t8 - t17;
+    t4 = t18 - t11;
+    t2 = t1 - t19;
+    t3 = t10 + t13;
+    t14 = t15 + t12;
+    t9 = t10 - t13;
+    t0 = C40 * t9;
+    t8 = t15 - t12;
+    t17 = C40 * t8;
+    t18 = C41 * t3;
+    t11 = t5 - t18;
+    t1 = C41 * t14;
+    t19 = t6 - t1;
+    t10 = t11 + t0;
+    t13 = t19 + t17;
+    t9 = t11 - t0;
+    t15 = t19 - t17;
+    t12 = C8 * t7;
+    t8 = C25 * t4;
+    t18 = t12 + t8;
+    t1 = C8 * t16;
+    t11 = C25 * t2;
+    t0 = t1 + t11;
+    t19 = C25 * t7;
+    t17 = C8 * t4;
+    t12 = t19 - t17;
+    t8 = C25 * t16;
+    t1 = C8 * t2;
+    t11 = t8 - t1;
+    t7 = t5 + t3;
+    t4 = t6 + t14;
+    t19 = t10 + t0;
+    t17 = t13 - t18;
+    t16 = t9 + t11;
+    t2 = t15 - t12;
+    t8 = t9 - t11;
+    t1 = t15 + t12;
+    t5 = t10 - t0;
+    t3 = t13 + t18;
+    re[0] = t7;
+    im[0] = t4;
+    re[24] = t19;
+    im[24] = t17;
+    re[48] = t16;
+    im[48] = t2;
+    re[72] = t8;
+    im[72] = t1;
+    re[96] = t5;
+    im[96] = t3;
+    t6 = re[15];
+    t14 = im[15];
+    t9 = re[39];
+    t11 = im[39];
+    t15 = re[63];
+    t12 = im[63];
+    t10 = re[87];
+    t0 = im[87];
+    t13 = re[111];
+    t18 = im[111];
+    t7 = t9 + t13;
+    t4 = t11 + t18;
+    t19 = t15 + t10;
+    t17 = t12 + t0;
+    t16 = t9 - t13;
+    t2 = t11 - t18;
+    t8 = t15 - t10;
+    t1 = t12 - t0;
+    t5 = t7 + t19;
+    t3 = t4 + t17;
+    t9 = t7 - t19;
+    t13 = C40 * t9;
+    t11 = t4 - t17;
+    t18 = C40 * t11;
+    t15 = C41 * t5;
+    t10 = t6 - t15;
+    t12 = C41 * t3;
+    t0 = t14 - t12;
+    t7 = t10 + t13;
+    t19 = t0 + t18;
+    t9 = t10 - t13;
+    t4 = t0 - t18;
+    t17 = C8 * t16;
+    t11 = C25 * t8;
+    t15 = t17 + t11;
+    t12 = C8 * t2;
+    t10 = C25 * t1;
+    t13 = t12 + t10;
+    t0 = C25 * t16;
+    t18 = C8 * t8;
+    t17 = t0 - t18;
+    t11 = C25 * t2;
+    t12 = C8 * t1;
+    t10 = t11 - t12;
+    t16 = t6 + t5;
+    t8 = t14 + t3;
+    t0 = t7 + t13;
+    t18 = t19 - t15;
+    t2 = t9 + t10;
+    t1 = t4 - t17;
+    t11 = t9 - t10;
+    t12 = t4 + t17;
+    t6 = t7 - t13;
+    t5 = t19 + t15;
+    re[15] = t16;
+    im[15] = t8;
+    re[39] = t0;
+    im[39] = t18;
+    re[63] = t2;
+    im[63] = t1;
+    re[87] = t11;
+    im[87] = t12;
+    re[111] = t6;
+    im[111] = t5;
+    t14 = re[30];
+    t3 = im[30];
+    t9 = re[54];
+    t10 = im[54];
+    t4 = re[78];
+    t17 = im[78];
+    t7 = re[102];
+    t13 = im[102];
+    t19 = re[6];
+    t15 = im[6];
+    t16 = t9 + t19;
+    t8 = t10 + t15;
+    t0 = t4 + t7;
+    t18 = t17 + t13;
+    t2 = t9 - t19;
+    t1 = t10 - t15;
+    t11 = t4 - t7;
+    t12 = t17 - t13;
+    t6 = t16 + t0;
+    t5 = t8 + t18;
+    t9 = t16 - t0;
+    t19 = C40 * t9;
+    t10 = t8 - t18;
+    t15 = C40 * t10;
+    t4 = C41 * t6;
+    t7 = t14 - t4;
+    t17 = C41 * t5;
+    t13 = t3 - t17;
+    t16 = t7 + t19;
+    t0 = t13 + t15;
+    t9 = t7 - t19;
+    t8 = t13 - t15;
+    t18 = C8 * t2;
+    t10 = C25 * t11;
+    t4 = t18 + t10;
+    t17 = C8 * t1;
+    t7 = C25 * t12;
+    t19 = t17 + t7;
+    t13 = C25 * t2;
+    t15 = C8 * t11;
+    t18 = t13 - t15;
+    t10 = C25 * t1;
+    t17 = C8 * t12;
+    t7 = t10 - t17;
+    t2 = t14 + t6;
+    t11 = t3 + t5;
+    t13 = t16 + t19;
+    t15 = t0 - t4;
+    t1 = t9 + t7;
+    t12 = t8 - t18;
+    t10 = t9 - t7;
+    t17 = t8 + t18;
+    t14 = t16 - t19;
+    t6 = t0 + t4;
+    re[30] = t2;
+    im[30] = t11;
+    re[54] = t13;
+    im[54] = t15;
+    re[78] = t1;
+    im[78] = t12;
+    re[102] = t10;
+    im[102] = t17;
+    re[6] = t14;
+    im[6] = t6;
+    t3 = re[45];
+    t5 = im[45];
+    t9 = re[69];
+    t7 = im[69];
+    t8 = re[93];
+    t18 = im[93];
+    t16 = re[117];
+    t19 = im[117];
+    t0 = re[21];
+    t4 = im[21];
+    t2 = t9 + t0;
+    t11 = t7 + t4;
+    t13 = t8 + t16;
+    t15 = t18 + t19;
+    t1 = t9 - t0;
+    t12 = t7 - t4;
+    t10 = t8 - t16;
+    t17 = t18 - t19;
+    t14 = t2 + t13;
+    t6 = t11 + t15;
+    t9 = t2 - t13;
+    t0 = C40 * t9;
+    t7 = t11 - t15;
+    t4 = C40 * t7;
+    t8 = C41 * t14;
+    t16 = t3 - t8;
+    t18 = C41 * t6;
+    t19 = t5 - t18;
+    t2 = t16 + t0;
+    t13 = t19 + t4;
+    t9 = t16 - t0;
+    t11 = t19 - t4;
+    t15 = C8 * t1;
+    t7 = C25 * t10;
+    t8 = t15 + t7;
+    t18 = C8 * t12;
+    t16 = C25 * t17;
+    t0 = t18 + t16;
+    t19 = C25 * t1;
+    t4 = C8 * t10;
+    t15 = t19 - t4;
+    t7 = C25 * t12;
+    t18 = C8 * t17;
+    t16 = t7 - t18;
+    t1 = t3 + t14;
+    t10 = t5 + t6;
+    t19 = t2 + t0;
+    t4 = t13 - t8;
+    t12 = t9 + t16;
+    t17 = t11 - t15;
+    t7 = t9 - t16;
+    t18 = t11 + t15;
+    t3 = t2 - t0;
+    t14 = t13 + t8;
+    re[45] = t1;
+    im[45] = t10;
+    re[69] = t19;
+    im[69] = t4;
+    re[93] = t12;
+    im[93] = t17;
+    re[117] = t7;
+    im[117] = t18;
+    re[21] = t3;
+    im[21] = t14;
+    t5 = re[60];
+    t6 = im[60];
+    t9 = re[84];
+    t16 = im[84];
+    t11 = re[108];
+    t15 = im[108];
+    t2 = re[12];
+    t0 = im[12];
+    t13 = re[36];
+    t8 = im[36];
+    t1 = t9 + t13;
+    t10 = t16 + t8;
+    t19 = t11 + t2;
+    t4 = t15 + t0;
+    t12 = t9 - t13;
+    t17 = t16 - t8;
+    t7 = t11 - t2;
+    t18 = t15 - t0;
+    t3 = t1 + t19;
+    t14 = t10 + t4;
+    t9 = t1 - t19;
+    t13 = C40 * t9;
+    t16 = t10 - t4;
+    t8 = C40 * t16;
+    t11 = C41 * t3;
+    t2 = t5 - t11;
+    t15 = C41 * t14;
+    t0 = t6 - t15;
+    t1 = t2 + t13;
+    t19 = t0 + t8;
+    t9 = t2 - t13;
+    t10 = t0 - t8;
+    t4 = C8 * t12;
+    t16 = C25 * t7;
+    t11 = t4 + t16;
+    t15 = C8 * t17;
+    t2 = C25 * t18;
+    t13 = t15 + t2;
+    t0 = C25 * t12;
+    t8 = C8 * t7;
+    t4 = t0 - t8;
+    t16 = C25 * t17;
+    t15 = C8 * t18;
+    t2 = t16 - t15;
+    t12 = t5 + t3;
+    t7 = t6 + t14;
+    t0 = t1 + t13;
+    t8 = t19 - t11;
+    t17 = t9 + t2;
+    t18 = t10 - t4;
+    t16 = t9 - t2;
+    t15 = t10 + t4;
+    t5 = t1 - t13;
+    t3 = t19 + t11;
+    re[60] = t12;
+    im[60] = t7;
+    re[84] = t0;
+    im[84] = t8;
+    re[108] = t17;
+    im[108] = t18;
+    re[12] = t16;
+    im[12] = t15;
+    re[36] = t5;
+    im[36] = t3;
+    t6 = re[75];
+    t14 = im[75];
+    t9 = re[99];
+    t2 = im[99];
+    t10 = re[3];
+    t4 = im[3];
+    t1 = re[27];
+    t13 = im[27];
+    t19 = re[51];
+    t11 = im[51];
+    t12 = t9 + t19;
+    t7 = t2 + t11;
+    t0 = t10 + t1;
+    t8 = t4 + t13;
+    t17 = t9 - t19;
+    t18 = t2 - t11;
+    t16 = t10 - t1;
+    t15 = t4 - t13;
+    t5 = t12 + t0;
+    t3 = t7 + t8;
+    t9 = t12 - t0;
+    t19 = C40 * t9;
+    t2 = t7 - t8;
+    t11 = C40 * t2;
+    t10 = C41 * t5;
+    t1 = t6 - t10;
+    t4 = C41 * t3;
+    t13 = t14 - t4;
+    t12 = t1 + t19;
+    t0 = t13 + t11;
+    t9 = t1 - t19;
+    t7 = t13 - t11;
+    t8 = C8 * t17;
+    t2 = C25 * t16;
+    t10 = t8 + t2;
+    t4 = C8 * t18;
+    t1 = C25 * t15;
+    t19 = t4 + t1;
+    t13 = C25 * t17;
+    t11 = C8 * t16;
+    t8 = t13 - t11;
+    t2 = C25 * t18;
+    t4 = C8 * t15;
+    t1 = t2 - t4;
+    t17 = t6 + t5;
+    t16 = t14 + t3;
+    t13 = t12 + t19;
+    t11 = t0 - t10;
+    t18 = t9 + t1;
+    t15 = t7 - t8;
+    t2 = t9 - t1;
+    t4 = t7 + t8;
+    t6 = t12 - t19;
+    t5 = t0 + t10;
+    re[75] = t17;
+    im[75] = t16;
+    re[99] = t13;
+    im[99] = t11;
+    re[3] = t18;
+    im[3] = t15;
+    re[27] = t2;
+    im[27] = t4;
+    re[51] = t6;
+    im[51] = t5;
+    t14 = re[90];
+    t3 = im[90];
+    t9 = re[114];
+    t1 = im[114];
+    t7 = re[18];
+    t8 = im[18];
+    t12 = re[42];
+    t19 = im[42];
+    t0 = re[66];
+    t10 = im[66];
+    t17 = t9 + t0;
+    t16 = t1 + t10;
+    t13 = t7 + t12;
+    t11 = t8 + t19;
+    t18 = t9 - t0;
+    t15 = t1 - t10;
+    t2 = t7 - t12;
+    t4 = t8 - t19;
+    t6 = t17 + t13;
+    t5 = t16 + t11;
+    t9 = t17 - t13;
+    t0 = C40 * t9;
+    t1 = t16 - t11;
+    t10 = C40 * t1;
+    t7 = C41 * t6;
+    t12 = t14 - t7;
+    t8 = C41 * t5;
+    t19 = t3 - t8;
+    t17 = t12 + t0;
+    t13 = t19 + t10;
+    t9 = t12 - t0;
+    t16 = t19 - t10;
+    t11 = C8 * t18;
+    t1 = C25 * t2;
+    t7 = t11 + t1;
+    t8 = C8 * t15;
+    t12 = C25 * t4;
+    t0 = t8 + t12;
+    t19 = C25 * t18;
+    t10 = C8 * t2;
+    t11 = t19 - t10;
+    t1 = C25 * t15;
+    t8 = C8 * t4;
+    t12 = t1 - t8;
+    t18 = t14 + t6;
+    t2 = t3 + t5;
+    t19 = t17 + t0;
+    t10 = t13 - t7;
+    t15 = t9 + t12;
+    t4 = t16 - t11;
+    t1 = t9 - t12;
+    t8 = t16 + t11;
+    t14 = t17 - t0;
+    t6 = t13 + t7;
+    re[90] = t18;
+    im[90] = t2;
+    re[114] = t19;
+    im[114] = t10;
+    re[18] = t15;
+    im[18] = t4;
+    re[42] = t1;
+    im[42] = t8;
+    re[66] = t14;
+    im[66] = t6;
+    t3 = re[105];
+    t5 = im[105];
+    t9 = re[9];
+    t12 = im[9];
+    t16 = re[33];
+    t11 = im[33];
+    t17 = re[57];
+    t0 = im[57];
+    t13 = re[81];
+    t7 = im[81];
+    t18 = t9 + t13;
+    t2 = t12 + t7;
+    t19 = t16 + t17;
+    t10 = t11 + t0;
+    t15 = t9 - t13;
+    t4 = t12 - t7;
+    t1 = t16 - t17;
+    t8 = t11 - t0;
+    t14 = t18 + t19;
+    t6 = t2 + t10;
+    t9 = t18 - t19;
+    t13 = C40 * t9;
+    t12 = t2 - t10;
+    t7 = C40 * t12;
+    t16 = C41 * t14;
+    t17 = t3 - t16;
+    t11 = C41 * t6;
+    t0 = t5 - t11;
+    t18 = t17 + t13;
+    t19 = t0 + t7;
+    t9 = t17 - t13;
+    t2 = t0 - t7;
+    t10 = C8 * t15;
+    t12 = C25 * t1;
+    t16 = t10 + t12;
+    t11 = C8 * t4;
+    t17 = C25 * t8;
+    t13 = t11 + t17;
+    t0 = C25 * t15;
+    t7 = C8 * t1;
+    t10 = t0 - t7;
+    t12 = C25 * t4;
+    t11 = C8 * t8;
+    t17 = t12 - t11;
+    t15 = t3 + t14;
+    t1 = t5 + t6;
+    t0 = t18 + t13;
+    t7 = t19 - t16;
+    t4 = t9 + t17;
+    t8 = t2 - t10;
+    t12 = t9 - t17;
+    t11 = t2 + t10;
+    t3 = t18 - t13;
+    t14 = t19 + t16;
+    re[105] = t15;
+    im[105] = t1;
+    re[9] = t0;
+    im[9] = t7;
+    re[33] = t4;
+    im[33] = t8;
+    re[57] = t12;
+    im[57] = t11;
+    re[81] = t3;
+    im[81] = t14;
+}
+
+/**
+ *  Part 2 of ApplyWindowedIMDCT_W10_240_K160().
+ * 
+ *  @param {Number[]} X 
+ *    - The input block (240 points, only the first 160 points are used).
+ *  @param {Number[]} y 
+ *    - The array that would contain the output block (480 points).
+ *  @param {Number[]} re 
+ *    - The scratch buffer (real part, 120 points).
+ *  @param {Number[]} im 
+ *    - The scratch buffer (imaginary part, 120 points).
+ */
+function ApplyWindowedIMDCT_W10_240_K160_Part2(X, y, re, im) {
+    let t0, t1, t10, t11, t12, t13, t14, t15, t16, t17, t18, t19, t2, t3, t4, t5, t6, t7, t8, t9;
+    const C0 = 0.8660254037844387;
+    const C1 = 0.49999999999999994;
+    const C2 = 0.7518398074789774;
+    const C3 = 0.6593458151000688;
+    const C4 = 0.6087614290087207;
+    const C5 = 0.7933533402912352;
+    const C6 = 0.7071067811865476;
+    const C7 = 0.6691306063588582;
+    const C8 = 0.7431448254773942;
+    const C9 = 0.5112930860770522;
+    const C10 = 0.8594064115014527;
+    const C11 = 0.8012538126910607;
+    const C12 = 0.598324600570659;
+    const C13 = 0.8457278217039733;
+    const C14 = 0.5336145159156115;
+    const C15 = 0.7253743710122876;
+    const C16 = 0.6883545756937539;
+    const C17 = 0.5771451900372336;
+    const C18 = 0.8166415551616789;
+    const C19 = 0.7771459614569709;
+    const C20 = 0.6293203910498375;
+    const C21 = 0.6394390019805847;
+    const C22 = 0.7688418320734596;
+    const C23 = 0.8241261886220156;
+    const C24 = 0.5664062369248328;
+    const C25 = 0.6977904598416801;
+    const C26 = 0.7163019434246544;
+    const C27 = 0.544639035015027;
+    const C28 = 0.838670567945424;
+    const C29 = 0.5590169943749475;
+    const C30 = 0.25;
+    const C31 = 0.9510565162951535;
+    const C32 = 0.5877852522924731;
+    t5 = X[80];
+    t6 = X[159];
+    t9 = C0 * t5;
+    t17 = C1 * t6;
+    t2 = t9 + t17;
+    t10 = (-C1) * t5;
+    t18 = C0 * t6;
+    t13 = t10 + t18;
+    t19 = X[110];
+    t16 = X[129];
+    t15 = C2 * t19;
+    t1 = C3 * t16;
+    t0 = t15 + t1;
+    t7 = (-C3) * t19;
+    t4 = C2 * t16;
+    t8 = t7 + t4;
+    t12 = X[140];
+    t11 = X[99];
+    t3 = C4 * t12;
+    t14 = C5 * t11;
+    t9 = t3 + t14;
+    t17 = (-C5) * t12;
+    t5 = C4 * t11;
+    t6 = t17 + t5;
+    t10 = X[69];
+    t18 = 0.8968727415326883 * t10;
+    t15 = 0.4422886902190013 * t10;
+    t1 = X[39];
+    t19 = 0.9659258262890683 * t1;
+    t16 = 0.25881904510252074 * t1;
+    t7 = X[9];
+    t4 = 0.9978589232386035 * t7;
+    t3 = 0.06540312923014306 * t7;
+    t14 = X[20];
+    t12 = 0.9914448613738104 * t14;
+    t11 = (-0.13052619222005157) * t14;
+    t17 = X[50];
+    t5 = 0.9469301294951057 * t17;
+    t10 = (-0.3214394653031616) * t17;
+    t1 = t2 + t19;
+    t7 = t13 + t16;
+    t14 = t9 + t12;
+    t17 = t6 + t11;
+    t2 = t2 - t19;
+    t19 = t13 - t16;
+    t13 = t9 - t12;
+    t16 = t6 - t11;
+    t9 = t1 + t14;
+    t12 = t7 + t17;
+    t6 = t2 + t16;
+    t11 = t19 - t13;
+    t1 = t1 - t14;
+    t14 = t7 - t17;
+    t7 = t2 - t16;
+    t17 = t19 + t13;
+    t2 = t0 + t4;
+    t16 = t8 + t3;
+    t19 = t18 + t5;
+    t13 = t15 + t10;
+    t0 = t0 - t4;
+    t4 = t8 - t3;
+    t8 = t18 - t5;
+    t3 = t15 - t10;
+    t18 = t2 + t19;
+    t5 = t16 + t13;
+    t15 = t0 + t3;
+    t10 = t4 - t8;
+    t2 = t2 - t19;
+    t19 = t16 - t13;
+    t16 = t0 - t3;
+    t13 = t4 + t8;
+    t0 = t15 + t10;
+    t3 = t15 - t10;
+    t4 = C6 * t0;
+    t8 = (-C6) * t3;
+    t15 = t16 - t13;
+    t10 = t16 + t13;
+    t0 = (-C6) * t15;
+    t3 = (-C6) * t10;
+    t16 = t9 - t18;
+    t13 = t12 - t5;
+    t15 = t9 + t18;
+    t10 = t12 + t5;
+    t9 = t6 - t4;
+    t18 = t11 - t8;
+    t12 = t6 + t4;
+    t5 = t11 + t8;
+    t6 = t1 - t19;
+    t4 = t14 + t2;
+    t11 = t1 + t19;
+    t8 = t14 - t2;
+    t1 = t7 - t0;
+    t19 = t17 - t3;
+    t14 = t7 + t0;
+    t2 = t17 + t3;
+    re[40] = t15;
+    im[40] = t10;
+    re[55] = t12;
+    im[55] = t5;
+    re[70] = t11;
+    im[70] = t8;
+    re[85] = t14;
+    im[85] = t2;
+    re[100] = t16;
+    im[100] = t13;
+    re[115] = t9;
+    im[115] = t18;
+    re[10] = t6;
+    im[10] = t4;
+    re[25] = t1;
+    im[25] = t19;
+    t7 = X[128];
+    t0 = X[111];
+    t17 = C7 * t7;
+    t3 = C8 * t0;
+    t15 = t17 + t3;
+    t10 = (-C8) * t7;
+    t12 = C7 * t0;
+    t5 = t10 + t12;
+    t11 = X[158];
+    t8 = X[81];
+    t14 = C9 * t11;
+    t2 = C10 * t8;
+    t16 = t14 + t2;
+    t13 = (-C10) * t11;
+    t9 = C9 * t8;
+    t18 = t13 + t9;
+    t6 = X[51];
+    t4 = 0.9426414910921784 * t6;
+    t1 = 0.33380685923377096 * t6;
+    t19 = X[21];
+    t17 = 0.9896513868196702 * t19;
+    t3 = 0.1434926219911793 * t19;
+    t7 = X[8];
+    t0 = 0.9986295347545738 * t7;
+    t10 = (-0.05233595624294383) * t7;
+    t12 = X[38];
+    t14 = 0.9692309097067544 * t12;
+    t2 = (-0.24615329302899303) * t12;
+    t11 = X[68];
+    t8 = 0.9025852843498606 * t11;
+    t13 = (-0.4305110968082951) * t11;
+    t9 = X[98];
+    t6 = X[141];
+    t19 = C11 * t9;
+    t7 = C12 * t6;
+    t12 = t19 + t7;
+    t11 = (-C12) * t9;
+    t19 = C11 * t6;
+    t7 = t11 + t19;
+    t9 = t15 + t0;
+    t6 = t5 + t10;
+    t11 = t4 + t8;
+    t19 = t1 + t13;
+    t15 = t15 - t0;
+    t0 = t5 - t10;
+    t5 = t4 - t8;
+    t10 = t1 - t13;
+    t4 = t9 + t11;
+    t8 = t6 + t19;
+    t1 = t15 + t10;
+    t13 = t0 - t5;
+    t9 = t9 - t11;
+    t11 = t6 - t19;
+    t6 = t15 - t10;
+    t19 = t0 + t5;
+    t15 = t16 + t14;
+    t10 = t18 + t2;
+    t0 = t17 + t12;
+    t5 = t3 + t7;
+    t16 = t16 - t14;
+    t14 = t18 - t2;
+    t18 = t17 - t12;
+    t2 = t3 - t7;
+    t17 = t15 + t0;
+    t12 = t10 + t5;
+    t3 = t16 + t2;
+    t7 = t14 - t18;
+    t15 = t15 - t0;
+    t0 = t10 - t5;
+    t10 = t16 - t2;
+    t5 = t14 + t18;
+    t16 = t3 + t7;
+    t2 = t3 - t7;
+    t14 = C6 * t16;
+    t18 = (-C6) * t2;
+    t3 = t10 - t5;
+    t7 = t10 + t5;
+    t16 = (-C6) * t3;
+    t2 = (-C6) * t7;
+    t10 = t4 - t17;
+    t5 = t8 - t12;
+    t3 = t4 + t17;
+    t7 = t8 + t12;
+    t4 = t1 - t14;
+    t17 = t13 - t18;
+    t8 = t1 + t14;
+    t12 = t13 + t18;
+    t1 = t9 - t0;
+    t14 = t11 + t15;
+    t13 = t9 + t0;
+    t18 = t11 - t15;
+    t9 = t6 - t16;
+    t0 = t19 - t2;
+    t11 = t6 + t16;
+    t15 = t19 + t2;
+    re[64] = t3;
+    im[64] = t7;
+    re[79] = t8;
+    im[79] = t12;
+    re[94] = t13;
+    im[94] = t18;
+    re[109] = t11;
+    im[109] = t15;
+    re[4] = t10;
+    im[4] = t5;
+    re[19] = t4;
+    im[19] = t17;
+    re[34] = t1;
+    im[34] = t14;
+    re[49] = t9;
+    im[49] = t0;
+    t6 = X[63];
+    t16 = 0.9135454576426009 * t6;
+    t19 = 0.40673664307580015 * t6;
+    t2 = X[33];
+    t3 = 0.9753423205085127 * t2;
+    t7 = 0.22069743502150108 * t2;
+    t8 = X[3];
+    t12 = 0.9996573249755573 * t8;
+    t13 = 0.02617694830787315 * t8;
+    t18 = X[26];
+    t11 = 0.9855560590580777 * t18;
+    t15 = (-0.1693495038490246) * t18;
+    t10 = X[56];
+    t5 = 0.9335804264972017 * t10;
+    t4 = (-0.35836794954530027) * t10;
+    t17 = X[86];
+    t1 = X[153];
+    t14 = C13 * t17;
+    t9 = C14 * t1;
+    t0 = t14 + t9;
+    t6 = (-C14) * t17;
+    t2 = C13 * t1;
+    t8 = t6 + t2;
+    t18 = X[116];
+    t10 = X[123];
+    t14 = C15 * t18;
+    t9 = C16 * t10;
+    t17 = t14 + t9;
+    t1 = (-C16) * t18;
+    t6 = C15 * t10;
+    t2 = t1 + t6;
+    t14 = X[146];
+    t9 = X[93];
+    t18 = C17 * t14;
+    t10 = C18 * t9;
+    t1 = t18 + t10;
+    t6 = (-C18) * t14;
+    t18 = C17 * t9;
+    t10 = t6 + t18;
+    t14 = t16 + t5;
+    t9 = t19 + t4;
+    t6 = t12 + t17;
+    t18 = t13 + t2;
+    t16 = t16 - t5;
+    t5 = t19 - t4;
+    t19 = t12 - t17;
+    t4 = t13 - t2;
+    t12 = t14 + t6;
+    t17 = t9 + t18;
+    t13 = t16 + t4;
+    t2 = t5 - t19;
+    t14 = t14 - t6;
+    t6 = t9 - t18;
+    t9 = t16 - t4;
+    t18 = t5 + t19;
+    t16 = t3 + t0;
+    t4 = t7 + t8;
+    t5 = t11 + t1;
+    t19 = t15 + t10;
+    t3 = t3 - t0;
+    t0 = t7 - t8;
+    t7 = t11 - t1;
+    t8 = t15 - t10;
+    t11 = t16 + t5;
+    t1 = t4 + t19;
+    t15 = t3 + t8;
+    t10 = t0 - t7;
+    t16 = t16 - t5;
+    t5 = t4 - t19;
+    t4 = t3 - t8;
+    t19 = t0 + t7;
+    t3 = t15 + t10;
+    t8 = t15 - t10;
+    t0 = C6 * t3;
+    t7 = (-C6) * t8;
+    t15 = t4 - t19;
+    t10 = t4 + t19;
+    t3 = (-C6) * t15;
+    t8 = (-C6) * t10;
+    t4 = t12 - t11;
+    t19 = t17 - t1;
+    t15 = t12 + t11;
+    t10 = t17 + t1;
+    t12 = t13 - t0;
+    t11 = t2 - t7;
+    t17 = t13 + t0;
+    t1 = t2 + t7;
+    t13 = t14 - t5;
+    t0 = t6 + t16;
+    t2 = t14 + t5;
+    t7 = t6 - t16;
+    t14 = t9 - t3;
+    t5 = t18 - t8;
+    t6 = t9 + t3;
+    t16 = t18 + t8;
+    re[88] = t15;
+    im[88] = t10;
+    re[103] = t17;
+    im[103] = t1;
+    re[118] = t2;
+    im[118] = t7;
+    re[13] = t6;
+    im[13] = t16;
+    re[28] = t4;
+    im[28] = t19;
+    re[43] = t12;
+    im[43] = t11;
+    re[58] = t13;
+    im[58] = t0;
+    re[73] = t14;
+    im[73] = t5;
+    t9 = X[15];
+    t3 = 0.9945218953682733 * t9;
+    t18 = 0.10452846326765346 * t9;
+    t8 = X[14];
+    t15 = 0.9958049275746618 * t8;
+    t10 = (-0.09150161866340238) * t8;
+    t17 = X[44];
+    t1 = 0.958819734868193 * t17;
+    t2 = (-0.2840153447039226) * t17;
+    t7 = X[74];
+    t6 = 0.8849876374630419 * t7;
+    t16 = (-0.4656145203251114) * t7;
+    t4 = X[104];
+    t19 = X[135];
+    t12 = C19 * t4;
+    t11 = C20 * t19;
+    t13 = t12 + t11;
+    t0 = (-C20) * t4;
+    t14 = C19 * t19;
+    t5 = t0 + t14;
+    t9 = X[134];
+    t8 = X[105];
+    t17 = C21 * t9;
+    t7 = C22 * t8;
+    t12 = t17 + t7;
+    t11 = (-C22) * t9;
+    t4 = C21 * t8;
+    t19 = t11 + t4;
+    t0 = X[75];
+    t14 = 0.8788171126619654 * t0;
+    t17 = 0.4771587602596084 * t0;
+    t7 = X[45];
+    t9 = 0.9550199444571866 * t7;
+    t8 = 0.296541574975571 * t7;
+    t11 = t3 + t13;
+    t4 = t18 + t5;
+    t0 = t1 + t14;
+    t7 = t2 + t17;
+    t3 = t3 - t13;
+    t13 = t18 - t5;
+    t18 = t1 - t14;
+    t5 = t2 - t17;
+    t1 = t11 + t0;
+    t14 = t4 + t7;
+    t2 = t3 + t5;
+    t17 = t13 - t18;
+    t11 = t11 - t0;
+    t0 = t4 - t7;
+    t4 = t3 - t5;
+    t7 = t13 + t18;
+    t3 = t15 + t12;
+    t5 = t10 + t19;
+    t13 = t6 + t9;
+    t18 = t16 + t8;
+    t15 = t15 - t12;
+    t12 = t10 - t19;
+    t10 = t6 - t9;
+    t19 = t16 - t8;
+    t6 = t3 + t13;
+    t9 = t5 + t18;
+    t16 = t15 + t19;
+    t8 = t12 - t10;
+    t3 = t3 - t13;
+    t13 = t5 - t18;
+    t5 = t15 - t19;
+    t18 = t12 + t10;
+    t15 = t16 + t8;
+    t19 = t16 - t8;
+    t12 = C6 * t15;
+    t10 = (-C6) * t19;
+    t16 = t5 - t18;
+    t8 = t5 + t18;
+    t15 = (-C6) * t16;
+    t19 = (-C6) * t8;
+    t5 = t1 - t6;
+    t18 = t14 - t9;
+    t16 = t1 + t6;
+    t8 = t14 + t9;
+    t1 = t2 - t12;
+    t6 = t17 - t10;
+    t14 = t2 + t12;
+    t9 = t17 + t10;
+    t2 = t11 - t13;
+    t12 = t0 + t3;
+    t17 = t11 + t13;
+    t10 = t0 - t3;
+    t11 = t4 - t15;
+    t13 = t7 - t19;
+    t0 = t4 + t15;
+    t3 = t7 + t19;
+    re[112] = t16;
+    im[112] = t8;
+    re[7] = t14;
+    im[7] = t9;
+    re[22] = t17;
+    im[22] = t10;
+    re[37] = t0;
+    im[37] = t3;
+    re[52] = t5;
+    im[52] = t18;
+    re[67] = t1;
+    im[67] = t6;
+    re[82] = t2;
+    im[82] = t12;
+    re[97] = t11;
+    im[97] = t13;
+    t4 = X[32];
+    t15 = 0.9781476007338057 * t4;
+    t7 = (-0.20791169081775931) * t4;
+    t19 = X[62];
+    t16 = 0.9187912101488983 * t19;
+    t8 = (-0.39474385638426723) * t19;
+    t14 = X[92];
+    t9 = X[147];
+    t17 = C23 * t14;
+    t10 = C24 * t9;
+    t0 = t17 + t10;
+    t3 = (-C24) * t14;
+    t5 = C23 * t9;
+    t18 = t3 + t5;
+    t1 = X[122];
+    t6 = X[117];
+    t2 = C25 * t1;
+    t12 = C26 * t6;
+    t11 = t2 + t12;
+    t13 = (-C26) * t1;
+    t4 = C25 * t6;
+    t19 = t13 + t4;
+    t17 = X[152];
+    t10 = X[87];
+    t14 = C27 * t17;
+    t9 = C28 * t10;
+    t3 = t14 + t9;
+    t5 = (-C28) * t17;
+    t2 = C27 * t10;
+    t12 = t5 + t2;
+    t1 = X[57];
+    t6 = 0.9288095528719242 * t1;
+    t13 = 0.3705574375098362 * t1;
+    t4 = X[27];
+    t14 = 0.9832549075639546 * t4;
+    t9 = 0.18223552549214747 * t4;
+    t17 = X[2];
+    t10 = 0.999914327574007 * t17;
+    t5 = (-0.01308959557134444) * t17;
+    t2 = t15 + t3;
+    t1 = t7 + t12;
+    t4 = t0 + t14;
+    t17 = t18 + t9;
+    t15 = t15 - t3;
+    t3 = t7 - t12;
+    t7 = t0 - t14;
+    t12 = t18 - t9;
+    t0 = t2 + t4;
+    t14 = t1 + t17;
+    t18 = t15 + t12;
+    t9 = t3 - t7;
+    t2 = t2 - t4;
+    t4 = t1 - t17;
+    t1 = t15 - t12;
+    t17 = t3 + t7;
+    t15 = t16 + t6;
+    t12 = t8 + t13;
+    t3 = t11 + t10;
+    t7 = t19 + t5;
+    t16 = t16 - t6;
+    t6 = t8 - t13;
+    t8 = t11 - t10;
+    t13 = t19 - t5;
+    t11 = t15 + t3;
+    t10 = t12 + t7;
+    t19 = t16 + t13;
+    t5 = t6 - t8;
+    t15 = t15 - t3;
+    t3 = t12 - t7;
+    t12 = t16 - t13;
+    t7 = t6 + t8;
+    t16 = t19 + t5;
+    t13 = t19 - t5;
+    t6 = C6 * t16;
+    t8 = (-C6) * t13;
+    t19 = t12 - t7;
+    t5 = t12 + t7;
+    t16 = (-C6) * t19;
+    t13 = (-C6) * t5;
+    t12 = t0 - t11;
+    t7 = t14 - t10;
+    t19 = t0 + t11;
+    t5 = t14 + t10;
+    t0 = t18 - t6;
+    t11 = t9 - t8;
+    t14 = t18 + t6;
+    t10 = t9 + t8;
+    t18 = t2 - t3;
+    t6 = t4 + t15;
+    t9 = t2 + t3;
+    t8 = t4 - t15;
+    t2 = t1 - t16;
+    t3 = t17 - t13;
+    t4 = t1 + t16;
+    t15 = t17 + t13;
+    re[16] = t19;
+    im[16] = t5;
+    re[31] = t14;
+    im[31] = t10;
+    re[46] = t9;
+    im[46] = t8;
+    re[61] = t4;
+    im[61] = t15;
+    re[76] = t12;
+    im[76] = t7;
+    re[91] = t0;
+    im[91] = t11;
+    re[106] = t18;
+    im[106] = t6;
+    re[1] = t2;
+    im[1] = t3;
+    t1 = re[40];
+    t16 = im[40];
+    t17 = re[64];
+    t13 = im[64];
+    t19 = re[88];
+    t5 = im[88];
+    t14 = re[112];
+    t10 = im[112];
+    t9 = re[16];
+    t8 = im[16];
+    t4 = t17 + t9;
+    t15 = t13 + t8;
+    t12 = t19 + t14;
+    t7 = t5 + t10;
+    t0 = t17 - t9;
+    t11 = t13 - t8;
+    t18 = t19 - t14;
+    t6 = t5 - t10;
+    t2 = t4 + t12;
+    t3 = t15 + t7;
+    t17 = t4 - t12;
+    t9 = C29 * t17;
+    t13 = t15 - t7;
+    t8 = C29 * t13;
+    t19 = C30 * t2;
+    t14 = t1 - t19;
+    t5 = C30 * t3;
+    t10 = t16 - t5;
+    t4 = t14 + t9;
+    t12 = t10 + t8;
+    t17 = t14 - t9;
+    t15 = t10 - t8;
+    t7 = C31 * t0;
+    t13 = C32 * t18;
+    t19 = t7 + t13;
+    t5 = C31 * t11;
+    t14 = C32 * t6;
+    t9 = t5 + t14;
+    t10 = C32 * t0;
+    t8 = C31 * t18;
+    t7 = t10 - t8;
+    t13 = C32 * t11;
+    t5 = C31 * t6;
+    t14 = t13 - t5;
+    t0 = t1 + t2;
+    t18 = t16 + t3;
+    t10 = t4 + t9;
+    t8 = t12 - t19;
+    t11 = t17 + t14;
+    t6 = t15 - t7;
+    t13 = t17 - t14;
+    t5 = t15 + t7;
+    t1 = t4 - t9;
+    t2 = t12 + t19;
+    re[40] = t0;
+    im[40] = t18;
+    re[64] = t10;
+    im[64] = t8;
+    re[88] = t11;
+    im[88] = t6;
+    re[112] = t13;
+    im[112] = t5;
+    re[16] = t1;
+    im[16] = t2;
+    t16 = re[55];
+    t3 = im[55];
+    t17 = re[79];
+    t14 = im[79];
+    t15 = re[103];
+    t7 = im[103];
+    t4 = re[7];
+    t9 = im[7];
+    t12 = re[31];
+    t19 = im[31];
+    t0 = t17 + t12;
+    t18 = t14 + t19;
+    t10 = t15 + t4;
+    t8 = t7 + t9;
+    t11 = t17 - t12;
+    t6 = t14 - t19;
+    t13 = t15 - t4;
+    t5 = t7 - t9;
+    t1 = t0 + t10;
+    t2 = t18 + t8;
+    t17 = t0 - t10;
+    t12 = C29 * t17;
+    t14 = t18 - t8;
+    t19 = C29 * t14;
+    t15 = C30 * t1;
+    t4 = t16 - t15;
+    t7 = C30 * t2;
+    t9 = t3 - t7;
+    t0 = t4 + t12;
+    t10 = t9 + t19;
+    t17 = t4 - t12;
+    t18 = t9 - t19;
+    t8 = C31 * t11;
+    t14 = C32 * t13;
+    t15 = t8 + t14;
+    t7 = C31 * t6;
+    t4 = C32 * t5;
+    t12 = t7 + t4;
+    t9 = C32 * t11;
+    t19 = C31 * t13;
+    t8 = t9 - t19;
+    t14 = C32 * t6;
+    t7 = C31 * t5;
+    t4 = t14 - t7;
+    t11 = t16 + t1;
+    t13 = t3 + t2;
+    t9 = t0 + t12;
+    t19 = t10 - t15;
+    t6 = t17 + t4;
+    t5 = t18 - t8;
+    t14 = t17 - t4;
+    t7 = t18 + t8;
+    t16 = t0 - t12;
+    t1 = t10 + t15;
+    re[55] = t11;
+    im[55] = t13;
+    re[79] = t9;
+    im[79] = t19;
+    re[103] = t6;
+    im[103] = t5;
+    re[7] = t14;
+    im[7] = t7;
+    re[31] = t16;
+    im[31] = t1;
+    t3 = re[70];
+    t2 = im[70];
+    t17 = re[94];
+    t4 = im[94];
+    t18 = re[118];
+    t8 = im[118];
+    t0 = re[22];
+    t12 = im[22];
+    t10 = re[46];
+    t15 = im[46];
+    t11 = t17 + t10;
+    t13 = t4 + t15;
+    t9 = t18 + t0;
+    t19 = t8 + t12;
+    t6 = t17 - t10;
+    t5 = t4 - t15;
+    t14 = t18 - t0;
+    t7 = t8 - t12;
+    t16 = t11 + t9;
+    t1 = t13 + t19;
+    t17 = t11 - t9;
+    t10 = C29 * t17;
+    t4 = t13 - t19;
+    t15 = C29 * t4;
+    t18 = C30 * t16;
+    t0 = t3 - t18;
+    t8 = C30 * t1;
+    t12 = t2 - t8;
+    t11 = t0 + t10;
+    t9 = t12 + t15;
+    t17 = t0 - t10;
+    t13 = t12 - t15;
+    t19 = C31 * t6;
+    t4 = C32 * t14;
+    t18 = t19 + t4;
+    t8 = C31 * t5;
+    t0 = C32 * t7;
+    t10 = t8 + t0;
+    t12 = C32 * t6;
+    t15 = C31 * t14;
+    t19 = t12 - t15;
+    t4 = C32 * t5;
+    t8 = C31 * t7;
+    t0 = t4 - t8;
+    t6 = t3 + t16;
+    t14 = t2 + t1;
+    t12 = t11 + t10;
+    t15 = t9 - t18;
+    t5 = t17 + t0;
+    t7 = t13 - t19;
+    t4 = t17 - t0;
+    t8 = t13 + t19;
+    t3 = t11 - t10;
+    t16 = t9 + t18;
+    re[70] = t6;
+    im[70] = t14;
+    re[94] = t12;
+    im[94] = t15;
+    re[118] = t5;
+    im[118] = t7;
+    re[22] = t4;
+    im[22] = t8;
+    re[46] = t3;
+    im[46] = t16;
+    t2 = re[85];
+    t1 = im[85];
+    t17 = re[109];
+    t0 = im[109];
+    t13 = re[13];
+    t19 = im[13];
+    t11 = re[37];
+    t10 = im[37];
+    t9 = re[61];
+    t18 = im[61];
+    t6 = t17 + t9;
+    t14 = t0 + t18;
+    t12 = t13 + t11;
+    t15 = t19 + t10;
+    t5 = t17 - t9;
+    t7 = t0 - t18;
+    t4 = t13 - t11;
+    t8 = t19 - t10;
+    t3 = t6 + t12;
+    t16 = t14 + t15;
+    t17 = t6 - t12;
+    t9 = C29 * t17;
+    t0 = t14 - t15;
+    t18 = C29 * t0;
+    t13 = C30 * t3;
+    t11 = t2 - t13;
+    t19 = C30 * t16;
+    t10 = t1 - t19;
+    t6 = t11 + t9;
+    t12 = t10 + t18;
+    t17 = t11 - t9;
+    t14 = t10 - t18;
+    t15 = C31 * t5;
+    t0 = C32 * t4;
+    t13 = t15 + t0;
+    t19 = C31 * t7;
+    t11 = C32 * t8;
+    t9 = t19 + t11;
+    t10 = C32 * t5;
+    t18 = C31 * t4;
+    t15 = t10 - t18;
+    t0 = C32 * t7;
+    t19 = C31 * t8;
+    t11 = t0 - t19;
+    t5 = t2 + t3;
+    t4 = t1 + t16;
+    t10 = t6 + t9;
+    t18 = t12 - t13;
+    t7 = t17 + t11;
+    t8 = t14 - t15;
+    t0 = t17 - t11;
+    t19 = t14 + t15;
+    t2 = t6 - t9;
+    t3 = t12 + t13;
+    re[85] = t5;
+    im[85] = t4;
+    re[109] = t10;
+    im[109] = t18;
+    re[13] = t7;
+    im[13] = t8;
+    re[37] = t0;
+    im[37] = t19;
+    re[61] = t2;
+    im[61] = t3;
+    t1 = re[100];
+    t16 = im[100];
+    t17 = re[4];
+    t11 = im[4];
+    t14 = re[28];
+    t15 = im[28];
+    t6 = re[52];
+    t9 = im[52];
+    t12 = re[76];
+    t13 = im[76];
+    t5 = t17 + t12;
+    t4 = t11 + t13;
+    t10 = t14 + t6;
+    t18 = t15 + t9;
+    t7 = t17 - t12;
+    t8 = t11 - t13;
+    t0 = t14 - t6;
+    t19 = t15 - t9;
+    t2 = t5 + t10;
+    t3 = t4 + t18;
+    t17 = t5 - t10;
+    t12 = C29 * t17;
+    t11 = t4 - t18;
+    t13 = C29 * t11;
+    t14 = C30 * t2;
+    t6 = t1 - t14;
+    t15 = C30 * t3;
+    t9 = t16 - t15;
+    t5 = t6 + t12;
+    t10 = t9 + t13;
+    t17 = t6 - t12;
+    t4 = t9 - t13;
+    t18 = C31 * t7;
+    t11 = C32 * t0;
+    t14 = t18 + t11;
+    t15 = C31 * t8;
+    t6 = C32 * t19;
+    t12 = t15 + t6;
+    t9 = C32 * t7;
+    t13 = C31 * t0;
+    t18 = t9 - t13;
+    t11 = C32 * t8;
+    t15 = C31 * t19;
+    t6 = t11 - t15;
+    t7 = t1 + t2;
+    t0 = t16 + t3;
+    t9 = t5 + t12;
+    t13 = t10 - t14;
+    t8 = t17 + t6;
+    t19 = t4 - t18;
+    t11 = t17 - t6;
+    t15 = t4 + t18;
+    t1 = t5 - t12;
+    t2 = t10 + t14;
+    re[100] = t7;
+    im[100] = t0;
+    re[4] = t9;
+    im[4] = t13;
+    re[28] = t8;
+    im[28] = t19;
+    re[52] = t11;
+    im[52] = t15;
+    re[76] = t1;
+    im[76] = t2;
+    t16 = re[115];
+    t3 = im[115];
+    t17 = re[19];
+    t6 = im[19];
+    t4 = re[43];
+    t18 = im[43];
+    t5 = re[67];
+    t12 = im[67];
+    t10 = re[91];
+    t14 = im[91];
+    t7 = t17 + t10;
+    t0 = t6 + t14;
+    t9 = t4 + t5;
+    t13 = t18 + t12;
+    t8 = t17 - t10;
+    t19 = t6 - t14;
+    t11 = t4 - t5;
+    t15 = t18 - t12;
+    t1 = t7 + t9;
+    t2 = t0 + t13;
+    t17 = t7 - t9;
+    t10 = C29 * t17;
+    t6 = t0 - t13;
+    t14 = C29 * t6;
+    t4 = C30 * t1;
+    t5 = t16 - t4;
+    t18 = C30 * t2;
+    t12 = t3 - t18;
+    t7 = t5 + t10;
+    t9 = t12 + t14;
+    t17 = t5 - t10;
+    t0 = t12 - t14;
+    t13 = C31 * t8;
+    t6 = C32 * t11;
+    t4 = t13 + t6;
+    t18 = C31 * t19;
+    t5 = C32 * t15;
+    t10 = t18 + t5;
+    t12 = C32 * t8;
+    t14 = C31 * t11;
+    t13 = t12 - t14;
+    t6 = C32 * t19;
+    t18 = C31 * t15;
+    t5 = t6 - t18;
+    t8 = t16 + t1;
+    t11 = t3 + t2;
+    t12 = t7 + t10;
+    t14 = t9 - t4;
+    t19 = t17 + t5;
+    t15 = t0 - t13;
+    t6 = t17 - t5;
+    t18 = t0 + t13;
+    t16 = t7 - t10;
+    t1 = t9 + t4;
+    re[115] = t8;
+    im[115] = t11;
+    re[19] = t12;
+    im[19] = t14;
+    re[43] = t19;
+    im[43] = t15;
+    re[67] = t6;
+    im[67] = t18;
+    re[91] = t16;
+    im[91] = t1;
+    t3 = re[10];
+    t2 = im[10];
+    t17 = re[34];
+    t5 = im[34];
+    t0 = re[58];
+    t13 = im[58];
+    t7 = re[82];
+    t10 = im[82];
+    t9 = re[106];
+    t4 = im[106];
+    t8 = t17 + t9;
+    t11 = t5 + t4;
+    t12 = t0 + t7;
+    t14 = t13 + t10;
+    t19 = t17 - t9;
+    t15 = t5 - t4;
+    t6 = t0 - t7;
+    t18 = t13 - t10;
+    t16 = t8 + t12;
+    t1 = t11 + t14;
+    t17 = t8 - t12;
+    t9 = C29 * t17;
+    t5 = t11 - t14;
+    t4 = C29 * t5;
+    t0 = C30 * t16;
+    t7 = t3 - t0;
+    t13 = C30 * t1;
+    t10 = t2 - t13;
+    t8 = t7 + t9;
+    t12 = t10 + t4;
+    t17 = t7 - t9;
+    t11 = t10 - t4;
+    t14 = C31 * t19;
+    t5 = C32 * t6;
+    t0 = t14 + t5;
+    t13 = C31 * t15;
+    t7 = C32 * t18;
+    t9 = t13 + t7;
+    t10 = C32 * t19;
+    t4 = C31 * t6;
+    t14 = t10 - t4;
+    t5 = C32 * t15;
+    t13 = C31 * t18;
+    t7 = t5 - t13;
+    t19 = t3 + t16;
+    t6 = t2 + t1;
+    t10 = t8 + t9;
+    t4 = t12 - t0;
+    t15 = t17 + t7;
+    t18 = t11 - t14;
+    t5 = t17 - t7;
+    t13 = t11 + t14;
+    t3 = t8 - t9;
+    t16 = t12 + t0;
+    re[10] = t19;
+    im[10] = t6;
+    re[34] = t10;
+    im[34] = t4;
+    re[58] = t15;
+    im[58] = t18;
+    re[82] = t5;
+    im[82] = t13;
+    re[106] = t3;
+    im[106] = t16;
+    t2 = re[25];
+    t1 = im[25];
+    t17 = re[49];
+    t7 = im[49];
+    t11 = re[73];
+    t14 = im[73];
+    t8 = re[97];
+    t9 = im[97];
+    t12 = re[1];
+    t0 = im[1];
+    t19 = t17 + t12;
+    t6 = t7 + t0;
+    t10 = t11 + t8;
+    t4 = t14 + t9;
+    t15 = t17 - t12;
+    t18 = t7 - t0;
+    t5 = t11 - t8;
+    t13 = t14 - t9;
+    t3 = t19 + t10;
+    t16 = t6 + t4;
+    t17 = t19 - t10;
+    t12 = C29 * t17;
+    t7 = t6 - t4;
+    t0 = C29 * t7;
+    t11 = C30 * t3;
+    t8 = t2 - t11;
+    t14 = C30 * t16;
+    t9 = t1 - t14;
+    t19 = t8 + t12;
+    t10 = t9 + t0;
+    t17 = t8 - t12;
+    t6 = t9 - t0;
+    t4 = C31 * t15;
+    t7 = C32 * t5;
+    t11 = t4 + t7;
+    t14 = C31 * t18;
+    t8 = C32 * t13;
+    t12 = t14 + t8;
+    t9 = C32 * t15;
+    t0 = C31 * t5;
+    t4 = t9 - t0;
+    t7 = C32 * t18;
+    t14 = C31 * t13;
+    t8 = t7 - t14;
+    t15 = t2 + t3;
+    t5 = t1 + t16;
+    t9 = t19 + t12;
+    t0 = t10 - t11;
+    t18 = t17 + t8;
+    t13 = t6 - t4;
+    t7 = t17 - t8;
+    t14 = t6 + t4;
+    t2 = t19 - t12;
+    t3 = t10 + t11;
+    re[25] = t15;
+    im[25] = t5;
+    re[49] = t9;
+    im[49] = t0;
+    re[73] = t18;
+    im[73] = t13;
+    re[97] = t7;
+    im[97] = t14;
+    re[1] = t2;
+    im[1] = t3;
+}
+
+/**
+ *  Part 3 of ApplyWindowedIMDCT_W10_240_K160().
+ * 
+ *  @param {Number[]} X 
+ *    - The input block (240 points, only the first 160 points are used).
+ *  @param {Number[]} y 
+ *    - The array that would contain the output block (480 points).
+ *  @param {Number[]} re 
+ *    - The scratch buffer (real part, 120 points).
+ *  @param {Number[]} im 
+ *    - The scratch buffer (imaginary part, 120 points).
+ */
+function ApplyWindowedIMDCT_W10_240_K160_Part3(X, y, re, im) {
+    let t0, t1, t10, t11, t12, t13, t14, t15, t16, t17, t18, t19, t2, t3, t4, t5, t6, t7, t8, t9;
+    const C0 = 0.7933533402912352;
+    const C1 = 0.6087614290087207;
+    const C2 = 0.6593458151000688;
+    const C3 = 0.7518398074789774;
+    const C4 = 0.7071067811865476;
+    const C5 = 0.838670567945424;
+    const C6 = 0.544639035015027;
+    const C7 = 0.7163019434246544;
+    const C8 = 0.6977904598416801;
+    const C9 = 0.5664062369248328;
+    const C10 = 0.8241261886220156;
+    const C11 = 0.7688418320734596;
+    const C12 = 0.6394390019805847;
+    const C13 = 0.6293203910498375;
+    const C14 = 0.7771459614569709;
+    const C15 = 0.8166415551616789;
+    const C16 = 0.5771451900372336;
+    const C17 = 0.6883545756937539;
+    const C18 = 0.7253743710122876;
+    const C19 = 0.5336145159156115;
+    const C20 = 0.8457278217039733;
+    const C21 = 0.7431448254773942;
+    const C22 = 0.6691306063588582;
+    const C23 = 0.598324600570659;
+    const C24 = 0.8012538126910607;
+    const C25 = 0.8594064115014527;
+    const C26 = 0.5112930860770522;
+    const C27 = 0.5590169943749475;
+    const C28 = 0.25;
+    const C29 = 0.9510565162951535;
+    const C30 = 0.5877852522924731;
+    const C31 = 0.5;
+    const C32 = 0.8660254037844386;
+    const C33 = 0.9999946454016965;
+    const C34 = 0.003272486506526625;
+    const C35 = 0.8643845233130174;
+    const C36 = 0.5028313791490421;
+    const C37 = 0.4971632662526543;
+    const C38 = 0.8676570098195441;
+    const C39 = 0.48576339371634003;
+    const C40 = 0.8740903416267589;
+    const C41 = 0.9998661379095618;
+    const C42 = 0.01636173162648678;
+    const C43 = 0.8577286100002721;
+    const C44 = 0.5141027441932217;
+    const C45 = 0.8509257293058021;
+    const C46 = 0.525286020378792;
+    const C47 = 0.4742802881232292;
+    const C48 = 0.8803739025537654;
+    const C49 = 0.9995663085020212;
+    const C50 = 0.02944817324796316;
+    const C51 = 0.9990952085533004;
+    const C52 = 0.04252956907655312;
+    const C53 = 0.8439770468681933;
+    const C54 = 0.5363792915089503;
+    const C55 = 0.4627159170443501;
+    const C56 = 0.8865066159447464;
+    const C57 = 0.4510722619751534;
+    const C58 = 0.8924874309908339;
+    const C59 = 0.99845291878395;
+    const C60 = 0.055603677682424614;
+    const C61 = 0.8368837533084093;
+    const C62 = 0.5473806568087966;
+    const C63 = 0.8296470640257853;
+    const C64 = 0.558288231251022;
+    const C65 = 0.4393513179959937;
+    const C66 = 0.898315322910159;
+    const C67 = 0.9976395492470157;
+    const C68 = 0.06866825888437376;
+    const C69 = 0.9966552393091803;
+    const C70 = 0.08172107413366822;
+    const C71 = 0.8222682189897751;
+    const C72 = 0.5691001458788982;
+    const C73 = 0.4275550934302821;
+    const C74 = 0.9039892931234433;
+    const C75 = 0.4156856095003708;
+    const C76 = 0.9095083694251006;
+    const C77 = 0.9955001576268845;
+    const C78 = 0.09475988689761111;
+    const C79 = 0.8147484825274894;
+    const C80 = 0.5798145481265136;
+    const C81 = 0.8070891431070594;
+    const C82 = 0.5904296021362011;
+    const C83 = 0.4037448999812271;
+    const C84 = 0.9148716061498187;
+    const C85 = 0.9941745021174282;
+    const C86 = 0.10778246304275935;
+    const C87 = 0.9926784999250583;
+    const C88 = 0.12078657121773083;
+    const C89 = 0.7992915131168641;
+    const C90 = 0.6009434890731024;
+    const C91 = 0.3917350108519559;
+    const C92 = 0.9200780843345949;
+    const C93 = 0.37965799994523275;
+    const C94 = 0.9251269118761953;
+    const C95 = 0.9910124073820492;
+    const C96 = 0.13376998323553513;
+    const C97 = 0.7913569286406602;
+    const C98 = 0.6113544074368165;
+    const C99 = 0.7832867492286504;
+    const C100 = 0.6216605733700774;
+    const C101 = 0.36751593659470355;
+    const C102 = 0.9300172236840121;
+    const C103 = 0.989176509964781;
+    const C104 = 0.14673047445536175;
+    const C105 = 0.9871711222448248;
+    const C106 = 0.159665824163761;
+    const C107 = 0.7750823576645314;
+    const C108 = 0.6318602209644087;
+    const C109 = 0.3553109012804161;
+    const C110 = 0.9347481818282924;
+    const C111 = 0.34304498527233984;
+    const C112 = 0.9393189756837131;
+    const C113 = 0.984996587835043;
+    const C114 = 0.1725738159551517;
+    const C115 = 0.7667451597285615;
+    const C116 = 0.641951602562703;
+    const C117 = 0.758276583956687;
+    const C118 = 0.6519329890586743;
+    const C119 = 0.3307202902720374;
+    const C120 = 0.9437288220682779;
+    const C121 = 0.9826532793307118;
+    const C122 = 0.18545223811159092;
+    t1 = X[79];
+    t16 = 0.8660254037844387 * t1;
+    t17 = 0.49999999999999994 * t1;
+    t8 = X[49];
+    t6 = 0.9469301294951057 * t8;
+    t4 = 0.3214394653031616 * t8;
+    t19 = X[19];
+    t12 = 0.9914448613738104 * t19;
+    t10 = 0.13052619222005157 * t19;
+    t11 = X[10];
+    t15 = 0.9978589232386035 * t11;
+    t5 = (-0.06540312923014306) * t11;
+    t9 = X[40];
+    t0 = 0.9659258262890683 * t9;
+    t18 = (-0.25881904510252074) * t9;
+    t13 = X[70];
+    t7 = 0.8968727415326883 * t13;
+    t14 = (-0.4422886902190013) * t13;
+    t2 = X[100];
+    t3 = X[139];
+    t1 = C0 * t2;
+    t8 = C1 * t3;
+    t19 = t1 + t8;
+    t11 = (-C1) * t2;
+    t9 = C0 * t3;
+    t13 = t11 + t9;
+    t1 = X[130];
+    t8 = X[109];
+    t2 = C2 * t1;
+    t3 = C3 * t8;
+    t11 = t2 + t3;
+    t9 = (-C3) * t1;
+    t2 = C2 * t8;
+    t3 = t9 + t2;
+    t1 = t16 + t0;
+    t8 = t17 + t18;
+    t9 = t12 + t19;
+    t2 = t10 + t13;
+    t16 = t16 - t0;
+    t0 = t17 - t18;
+    t17 = t12 - t19;
+    t18 = t10 - t13;
+    t12 = t1 + t9;
+    t19 = t8 + t2;
+    t10 = t16 + t18;
+    t13 = t0 - t17;
+    t1 = t1 - t9;
+    t9 = t8 - t2;
+    t8 = t16 - t18;
+    t2 = t0 + t17;
+    t16 = t6 + t7;
+    t18 = t4 + t14;
+    t0 = t15 + t11;
+    t17 = t5 + t3;
+    t6 = t6 - t7;
+    t7 = t4 - t14;
+    t4 = t15 - t11;
+    t14 = t5 - t3;
+    t15 = t16 + t0;
+    t11 = t18 + t17;
+    t5 = t6 + t14;
+    t3 = t7 - t4;
+    t16 = t16 - t0;
+    t0 = t18 - t17;
+    t18 = t6 - t14;
+    t17 = t7 + t4;
+    t6 = t5 + t3;
+    t14 = t5 - t3;
+    t7 = C4 * t6;
+    t4 = (-C4) * t14;
+    t5 = t18 - t17;
+    t3 = t18 + t17;
+    t6 = (-C4) * t5;
+    t14 = (-C4) * t3;
+    t18 = t12 - t15;
+    t17 = t19 - t11;
+    t5 = t12 + t15;
+    t3 = t19 + t11;
+    t12 = t10 - t7;
+    t15 = t13 - t4;
+    t19 = t10 + t7;
+    t11 = t13 + t4;
+    t10 = t1 - t0;
+    t7 = t9 + t16;
+    t13 = t1 + t0;
+    t4 = t9 - t16;
+    t1 = t8 - t6;
+    t0 = t2 - t14;
+    t9 = t8 + t6;
+    t16 = t2 + t14;
+    re[80] = t5;
+    im[80] = t3;
+    re[95] = t19;
+    im[95] = t11;
+    re[110] = t13;
+    im[110] = t4;
+    re[5] = t9;
+    im[5] = t16;
+    re[20] = t18;
+    im[20] = t17;
+    re[35] = t12;
+    im[35] = t15;
+    re[50] = t10;
+    im[50] = t7;
+    re[65] = t1;
+    im[65] = t0;
+    t8 = X[31];
+    t6 = 0.9781476007338057 * t8;
+    t2 = 0.20791169081775931 * t8;
+    t14 = X[1];
+    t5 = 0.999914327574007 * t14;
+    t3 = 0.01308959557134444 * t14;
+    t19 = X[28];
+    t11 = 0.9832549075639546 * t19;
+    t13 = (-0.18223552549214747) * t19;
+    t4 = X[58];
+    t9 = 0.9288095528719242 * t4;
+    t16 = (-0.3705574375098362) * t4;
+    t18 = X[88];
+    t17 = X[151];
+    t12 = C5 * t18;
+    t15 = C6 * t17;
+    t10 = t12 + t15;
+    t7 = (-C6) * t18;
+    t1 = C5 * t17;
+    t0 = t7 + t1;
+    t8 = X[118];
+    t14 = X[121];
+    t19 = C7 * t8;
+    t4 = C8 * t14;
+    t12 = t19 + t4;
+    t15 = (-C8) * t8;
+    t18 = C7 * t14;
+    t17 = t15 + t18;
+    t7 = X[148];
+    t1 = X[91];
+    t19 = C9 * t7;
+    t4 = C10 * t1;
+    t8 = t19 + t4;
+    t14 = (-C10) * t7;
+    t15 = C9 * t1;
+    t18 = t14 + t15;
+    t19 = X[61];
+    t4 = 0.9187912101488983 * t19;
+    t7 = 0.39474385638426723 * t19;
+    t1 = t6 + t10;
+    t14 = t2 + t0;
+    t15 = t11 + t8;
+    t19 = t13 + t18;
+    t6 = t6 - t10;
+    t10 = t2 - t0;
+    t2 = t11 - t8;
+    t0 = t13 - t18;
+    t11 = t1 + t15;
+    t8 = t14 + t19;
+    t13 = t6 + t0;
+    t18 = t10 - t2;
+    t1 = t1 - t15;
+    t15 = t14 - t19;
+    t14 = t6 - t0;
+    t19 = t10 + t2;
+    t6 = t5 + t12;
+    t0 = t3 + t17;
+    t10 = t9 + t4;
+    t2 = t16 + t7;
+    t5 = t5 - t12;
+    t12 = t3 - t17;
+    t3 = t9 - t4;
+    t17 = t16 - t7;
+    t9 = t6 + t10;
+    t4 = t0 + t2;
+    t16 = t5 + t17;
+    t7 = t12 - t3;
+    t6 = t6 - t10;
+    t10 = t0 - t2;
+    t0 = t5 - t17;
+    t2 = t12 + t3;
+    t5 = t16 + t7;
+    t17 = t16 - t7;
+    t12 = C4 * t5;
+    t3 = (-C4) * t17;
+    t16 = t0 - t2;
+    t7 = t0 + t2;
+    t5 = (-C4) * t16;
+    t17 = (-C4) * t7;
+    t0 = t11 - t9;
+    t2 = t8 - t4;
+    t16 = t11 + t9;
+    t7 = t8 + t4;
+    t11 = t13 - t12;
+    t9 = t18 - t3;
+    t8 = t13 + t12;
+    t4 = t18 + t3;
+    t13 = t1 - t10;
+    t12 = t15 + t6;
+    t18 = t1 + t10;
+    t3 = t15 - t6;
+    t1 = t14 - t5;
+    t10 = t19 - t17;
+    t15 = t14 + t5;
+    t6 = t19 + t17;
+    re[104] = t16;
+    im[104] = t7;
+    re[119] = t8;
+    im[119] = t4;
+    re[14] = t18;
+    im[14] = t3;
+    re[29] = t15;
+    im[29] = t6;
+    re[44] = t0;
+    im[44] = t2;
+    re[59] = t11;
+    im[59] = t9;
+    re[74] = t13;
+    im[74] = t12;
+    re[89] = t1;
+    im[89] = t10;
+    t14 = X[16];
+    t5 = 0.9945218953682733 * t14;
+    t19 = (-0.10452846326765346) * t14;
+    t17 = X[46];
+    t16 = 0.9550199444571866 * t17;
+    t7 = (-0.296541574975571) * t17;
+    t8 = X[76];
+    t4 = 0.8788171126619654 * t8;
+    t18 = (-0.4771587602596084) * t8;
+    t3 = X[106];
+    t15 = X[133];
+    t6 = C11 * t3;
+    t0 = C12 * t15;
+    t2 = t6 + t0;
+    t11 = (-C12) * t3;
+    t9 = C11 * t15;
+    t13 = t11 + t9;
+    t12 = X[136];
+    t1 = X[103];
+    t10 = C13 * t12;
+    t14 = C14 * t1;
+    t17 = t10 + t14;
+    t8 = (-C14) * t12;
+    t6 = C13 * t1;
+    t0 = t8 + t6;
+    t3 = X[73];
+    t15 = 0.8849876374630419 * t3;
+    t11 = 0.4656145203251114 * t3;
+    t9 = X[43];
+    t10 = 0.958819734868193 * t9;
+    t14 = 0.2840153447039226 * t9;
+    t12 = X[13];
+    t1 = 0.9958049275746618 * t12;
+    t8 = 0.09150161866340238 * t12;
+    t6 = t5 + t17;
+    t3 = t19 + t0;
+    t9 = t4 + t10;
+    t12 = t18 + t14;
+    t5 = t5 - t17;
+    t17 = t19 - t0;
+    t19 = t4 - t10;
+    t0 = t18 - t14;
+    t4 = t6 + t9;
+    t10 = t3 + t12;
+    t18 = t5 + t0;
+    t14 = t17 - t19;
+    t6 = t6 - t9;
+    t9 = t3 - t12;
+    t3 = t5 - t0;
+    t12 = t17 + t19;
+    t5 = t16 + t15;
+    t0 = t7 + t11;
+    t17 = t2 + t1;
+    t19 = t13 + t8;
+    t16 = t16 - t15;
+    t15 = t7 - t11;
+    t7 = t2 - t1;
+    t11 = t13 - t8;
+    t2 = t5 + t17;
+    t1 = t0 + t19;
+    t13 = t16 + t11;
+    t8 = t15 - t7;
+    t5 = t5 - t17;
+    t17 = t0 - t19;
+    t0 = t16 - t11;
+    t19 = t15 + t7;
+    t16 = t13 + t8;
+    t11 = t13 - t8;
+    t15 = C4 * t16;
+    t7 = (-C4) * t11;
+    t13 = t0 - t19;
+    t8 = t0 + t19;
+    t16 = (-C4) * t13;
+    t11 = (-C4) * t8;
+    t0 = t4 - t2;
+    t19 = t10 - t1;
+    t13 = t4 + t2;
+    t8 = t10 + t1;
+    t4 = t18 - t15;
+    t2 = t14 - t7;
+    t10 = t18 + t15;
+    t1 = t14 + t7;
+    t18 = t6 - t17;
+    t15 = t9 + t5;
+    t14 = t6 + t17;
+    t7 = t9 - t5;
+    t6 = t3 - t16;
+    t17 = t12 - t11;
+    t9 = t3 + t16;
+    t5 = t12 + t11;
+    re[8] = t13;
+    im[8] = t8;
+    re[23] = t10;
+    im[23] = t1;
+    re[38] = t14;
+    im[38] = t7;
+    re[53] = t9;
+    im[53] = t5;
+    re[68] = t0;
+    im[68] = t19;
+    re[83] = t4;
+    im[83] = t2;
+    re[98] = t18;
+    im[98] = t15;
+    re[113] = t6;
+    im[113] = t17;
+    t3 = X[64];
+    t16 = 0.9135454576426009 * t3;
+    t12 = (-0.40673664307580015) * t3;
+    t11 = X[94];
+    t13 = X[145];
+    t8 = C15 * t11;
+    t10 = C16 * t13;
+    t1 = t8 + t10;
+    t14 = (-C16) * t11;
+    t7 = C15 * t13;
+    t9 = t14 + t7;
+    t5 = X[124];
+    t0 = X[115];
+    t19 = C17 * t5;
+    t4 = C18 * t0;
+    t2 = t19 + t4;
+    t18 = (-C18) * t5;
+    t15 = C17 * t0;
+    t6 = t18 + t15;
+    t17 = X[154];
+    t3 = X[85];
+    t8 = C19 * t17;
+    t10 = C20 * t3;
+    t11 = t8 + t10;
+    t13 = (-C20) * t17;
+    t14 = C19 * t3;
+    t7 = t13 + t14;
+    t19 = X[55];
+    t4 = 0.9335804264972017 * t19;
+    t5 = 0.35836794954530027 * t19;
+    t0 = X[25];
+    t18 = 0.9855560590580777 * t0;
+    t15 = 0.1693495038490246 * t0;
+    t8 = X[4];
+    t10 = 0.9996573249755573 * t8;
+    t17 = (-0.02617694830787315) * t8;
+    t3 = X[34];
+    t13 = 0.9753423205085127 * t3;
+    t14 = (-0.22069743502150108) * t3;
+    t19 = t16 + t4;
+    t0 = t12 + t5;
+    t8 = t2 + t10;
+    t3 = t6 + t17;
+    t16 = t16 - t4;
+    t4 = t12 - t5;
+    t12 = t2 - t10;
+    t5 = t6 - t17;
+    t2 = t19 + t8;
+    t10 = t0 + t3;
+    t6 = t16 + t5;
+    t17 = t4 - t12;
+    t19 = t19 - t8;
+    t8 = t0 - t3;
+    t0 = t16 - t5;
+    t3 = t4 + t12;
+    t16 = t1 + t18;
+    t5 = t9 + t15;
+    t4 = t11 + t13;
+    t12 = t7 + t14;
+    t1 = t1 - t18;
+    t18 = t9 - t15;
+    t9 = t11 - t13;
+    t15 = t7 - t14;
+    t11 = t16 + t4;
+    t13 = t5 + t12;
+    t7 = t1 + t15;
+    t14 = t18 - t9;
+    t16 = t16 - t4;
+    t4 = t5 - t12;
+    t5 = t1 - t15;
+    t12 = t18 + t9;
+    t1 = t7 + t14;
+    t15 = t7 - t14;
+    t18 = C4 * t1;
+    t9 = (-C4) * t15;
+    t7 = t5 - t12;
+    t14 = t5 + t12;
+    t1 = (-C4) * t7;
+    t15 = (-C4) * t14;
+    t5 = t2 - t11;
+    t12 = t10 - t13;
+    t7 = t2 + t11;
+    t14 = t10 + t13;
+    t2 = t6 - t18;
+    t11 = t17 - t9;
+    t10 = t6 + t18;
+    t13 = t17 + t9;
+    t6 = t19 - t4;
+    t18 = t8 + t16;
+    t17 = t19 + t4;
+    t9 = t8 - t16;
+    t19 = t0 - t1;
+    t4 = t3 - t15;
+    t8 = t0 + t1;
+    t16 = t3 + t15;
+    re[32] = t7;
+    im[32] = t14;
+    re[47] = t10;
+    im[47] = t13;
+    re[62] = t17;
+    im[62] = t9;
+    re[77] = t8;
+    im[77] = t16;
+    re[92] = t5;
+    im[92] = t12;
+    re[107] = t2;
+    im[107] = t11;
+    re[2] = t6;
+    im[2] = t18;
+    re[17] = t19;
+    im[17] = t4;
+    t0 = X[112];
+    t1 = X[127];
+    t3 = C21 * t0;
+    t15 = C22 * t1;
+    t7 = t3 + t15;
+    t14 = (-C22) * t0;
+    t10 = C21 * t1;
+    t13 = t14 + t10;
+    t17 = X[142];
+    t9 = X[97];
+    t8 = C23 * t17;
+    t16 = C24 * t9;
+    t5 = t8 + t16;
+    t12 = (-C24) * t17;
+    t2 = C23 * t9;
+    t11 = t12 + t2;
+    t6 = X[67];
+    t18 = 0.9025852843498606 * t6;
+    t19 = 0.4305110968082951 * t6;
+    t4 = X[37];
+    t3 = 0.9692309097067544 * t4;
+    t15 = 0.24615329302899303 * t4;
+    t0 = X[7];
+    t1 = 0.9986295347545738 * t0;
+    t14 = 0.05233595624294383 * t0;
+    t10 = X[22];
+    t8 = 0.9896513868196702 * t10;
+    t16 = (-0.1434926219911793) * t10;
+    t17 = X[52];
+    t9 = 0.9426414910921784 * t17;
+    t12 = (-0.33380685923377096) * t17;
+    t2 = X[82];
+    t6 = X[157];
+    t4 = C25 * t2;
+    t0 = C26 * t6;
+    t10 = t4 + t0;
+    t17 = (-C26) * t2;
+    t4 = C25 * t6;
+    t0 = t17 + t4;
+    t2 = t7 + t1;
+    t6 = t13 + t14;
+    t17 = t18 + t9;
+    t4 = t19 + t12;
+    t7 = t7 - t1;
+    t1 = t13 - t14;
+    t13 = t18 - t9;
+    t14 = t19 - t12;
+    t18 = t2 + t17;
+    t9 = t6 + t4;
+    t19 = t7 + t14;
+    t12 = t1 - t13;
+    t2 = t2 - t17;
+    t17 = t6 - t4;
+    t6 = t7 - t14;
+    t4 = t1 + t13;
+    t7 = t5 + t8;
+    t14 = t11 + t16;
+    t1 = t3 + t10;
+    t13 = t15 + t0;
+    t5 = t5 - t8;
+    t8 = t11 - t16;
+    t11 = t3 - t10;
+    t16 = t15 - t0;
+    t3 = t7 + t1;
+    t10 = t14 + t13;
+    t15 = t5 + t16;
+    t0 = t8 - t11;
+    t7 = t7 - t1;
+    t1 = t14 - t13;
+    t14 = t5 - t16;
+    t13 = t8 + t11;
+    t5 = t15 + t0;
+    t16 = t15 - t0;
+    t8 = C4 * t5;
+    t11 = (-C4) * t16;
+    t15 = t14 - t13;
+    t0 = t14 + t13;
+    t5 = (-C4) * t15;
+    t16 = (-C4) * t0;
+    t14 = t18 - t3;
+    t13 = t9 - t10;
+    t15 = t18 + t3;
+    t0 = t9 + t10;
+    t18 = t19 - t8;
+    t3 = t12 - t11;
+    t9 = t19 + t8;
+    t10 = t12 + t11;
+    t19 = t2 - t1;
+    t8 = t17 + t7;
+    t12 = t2 + t1;
+    t11 = t17 - t7;
+    t2 = t6 - t5;
+    t1 = t4 - t16;
+    t17 = t6 + t5;
+    t7 = t4 + t16;
+    re[56] = t15;
+    im[56] = t0;
+    re[71] = t9;
+    im[71] = t10;
+    re[86] = t12;
+    im[86] = t11;
+    re[101] = t17;
+    im[101] = t7;
+    re[116] = t14;
+    im[116] = t13;
+    re[11] = t18;
+    im[11] = t3;
+    re[26] = t19;
+    im[26] = t8;
+    re[41] = t2;
+    im[41] = t1;
+    t6 = re[80];
+    t5 = im[80];
+    t4 = re[104];
+    t16 = im[104];
+    t15 = re[8];
+    t0 = im[8];
+    t9 = re[32];
+    t10 = im[32];
+    t12 = re[56];
+    t11 = im[56];
+    t17 = t4 + t12;
+    t7 = t16 + t11;
+    t14 = t15 + t9;
+    t13 = t0 + t10;
+    t18 = t4 - t12;
+    t3 = t16 - t11;
+    t19 = t15 - t9;
+    t8 = t0 - t10;
+    t2 = t17 + t14;
+    t1 = t7 + t13;
+    t4 = t17 - t14;
+    t12 = C27 * t4;
+    t16 = t7 - t13;
+    t11 = C27 * t16;
+    t15 = C28 * t2;
+    t9 = t6 - t15;
+    t0 = C28 * t1;
+    t10 = t5 - t0;
+    t17 = t9 + t12;
+    t14 = t10 + t11;
+    t4 = t9 - t12;
+    t7 = t10 - t11;
+    t13 = C29 * t18;
+    t16 = C30 * t19;
+    t15 = t13 + t16;
+    t0 = C29 * t3;
+    t9 = C30 * t8;
+    t12 = t0 + t9;
+    t10 = C30 * t18;
+    t11 = C29 * t19;
+    t13 = t10 - t11;
+    t16 = C30 * t3;
+    t0 = C29 * t8;
+    t9 = t16 - t0;
+    t18 = t6 + t2;
+    t19 = t5 + t1;
+    t10 = t17 + t12;
+    t11 = t14 - t15;
+    t3 = t4 + t9;
+    t8 = t7 - t13;
+    t16 = t4 - t9;
+    t0 = t7 + t13;
+    t6 = t17 - t12;
+    t2 = t14 + t15;
+    re[80] = t18;
+    im[80] = t19;
+    re[104] = t10;
+    im[104] = t11;
+    re[8] = t3;
+    im[8] = t8;
+    re[32] = t16;
+    im[32] = t0;
+    re[56] = t6;
+    im[56] = t2;
+    t5 = re[95];
+    t1 = im[95];
+    t4 = re[119];
+    t9 = im[119];
+    t7 = re[23];
+    t13 = im[23];
+    t17 = re[47];
+    t12 = im[47];
+    t14 = re[71];
+    t15 = im[71];
+    t18 = t4 + t14;
+    t19 = t9 + t15;
+    t10 = t7 + t17;
+    t11 = t13 + t12;
+    t3 = t4 - t14;
+    t8 = t9 - t15;
+    t16 = t7 - t17;
+    t0 = t13 - t12;
+    t6 = t18 + t10;
+    t2 = t19 + t11;
+    t4 = t18 - t10;
+    t14 = C27 * t4;
+    t9 = t19 - t11;
+    t15 = C27 * t9;
+    t7 = C28 * t6;
+    t17 = t5 - t7;
+    t13 = C28 * t2;
+    t12 = t1 - t13;
+    t18 = t17 + t14;
+    t10 = t12 + t15;
+    t4 = t17 - t14;
+    t19 = t12 - t15;
+    t11 = C29 * t3;
+    t9 = C30 * t16;
+    t7 = t11 + t9;
+    t13 = C29 * t8;
+    t17 = C30 * t0;
+    t14 = t13 + t17;
+    t12 = C30 * t3;
+    t15 = C29 * t16;
+    t11 = t12 - t15;
+    t9 = C30 * t8;
+    t13 = C29 * t0;
+    t17 = t9 - t13;
+    t3 = t5 + t6;
+    t16 = t1 + t2;
+    t12 = t18 + t14;
+    t15 = t10 - t7;
+    t8 = t4 + t17;
+    t0 = t19 - t11;
+    t9 = t4 - t17;
+    t13 = t19 + t11;
+    t5 = t18 - t14;
+    t6 = t10 + t7;
+    re[95] = t3;
+    im[95] = t16;
+    re[119] = t12;
+    im[119] = t15;
+    re[23] = t8;
+    im[23] = t0;
+    re[47] = t9;
+    im[47] = t13;
+    re[71] = t5;
+    im[71] = t6;
+    t1 = re[110];
+    t2 = im[110];
+    t4 = re[14];
+    t17 = im[14];
+    t19 = re[38];
+    t11 = im[38];
+    t18 = re[62];
+    t14 = im[62];
+    t10 = re[86];
+    t7 = im[86];
+    t3 = t4 + t10;
+    t16 = t17 + t7;
+    t12 = t19 + t18;
+    t15 = t11 + t14;
+    t8 = t4 - t10;
+    t0 = t17 - t7;
+    t9 = t19 - t18;
+    t13 = t11 - t14;
+    t5 = t3 + t12;
+    t6 = t16 + t15;
+    t4 = t3 - t12;
+    t10 = C27 * t4;
+    t17 = t16 - t15;
+    t7 = C27 * t17;
+    t19 = C28 * t5;
+    t18 = t1 - t19;
+    t11 = C28 * t6;
+    t14 = t2 - t11;
+    t3 = t18 + t10;
+    t12 = t14 + t7;
+    t4 = t18 - t10;
+    t16 = t14 - t7;
+    t15 = C29 * t8;
+    t17 = C30 * t9;
+    t19 = t15 + t17;
+    t11 = C29 * t0;
+    t18 = C30 * t13;
+    t10 = t11 + t18;
+    t14 = C30 * t8;
+    t7 = C29 * t9;
+    t15 = t14 - t7;
+    t17 = C30 * t0;
+    t11 = C29 * t13;
+    t18 = t17 - t11;
+    t8 = t1 + t5;
+    t9 = t2 + t6;
+    t14 = t3 + t10;
+    t7 = t12 - t19;
+    t0 = t4 + t18;
+    t13 = t16 - t15;
+    t17 = t4 - t18;
+    t11 = t16 + t15;
+    t1 = t3 - t10;
+    t5 = t12 + t19;
+    re[110] = t8;
+    im[110] = t9;
+    re[14] = t14;
+    im[14] = t7;
+    re[38] = t0;
+    im[38] = t13;
+    re[62] = t17;
+    im[62] = t11;
+    re[86] = t1;
+    im[86] = t5;
+    t2 = re[5];
+    t6 = im[5];
+    t4 = re[29];
+    t18 = im[29];
+    t16 = re[53];
+    t15 = im[53];
+    t3 = re[77];
+    t10 = im[77];
+    t12 = re[101];
+    t19 = im[101];
+    t8 = t4 + t12;
+    t9 = t18 + t19;
+    t14 = t16 + t3;
+    t7 = t15 + t10;
+    t0 = t4 - t12;
+    t13 = t18 - t19;
+    t17 = t16 - t3;
+    t11 = t15 - t10;
+    t1 = t8 + t14;
+    t5 = t9 + t7;
+    t4 = t8 - t14;
+    t12 = C27 * t4;
+    t18 = t9 - t7;
+    t19 = C27 * t18;
+    t16 = C28 * t1;
+    t3 = t2 - t16;
+    t15 = C28 * t5;
+    t10 = t6 - t15;
+    t8 = t3 + t12;
+    t14 = t10 + t19;
+    t4 = t3 - t12;
+    t9 = t10 - t19;
+    t7 = C29 * t0;
+    t18 = C30 * t17;
+    t16 = t7 + t18;
+    t15 = C29 * t13;
+    t3 = C30 * t11;
+    t12 = t15 + t3;
+    t10 = C30 * t0;
+    t19 = C29 * t17;
+    t7 = t10 - t19;
+    t18 = C30 * t13;
+    t15 = C29 * t11;
+    t3 = t18 - t15;
+    t0 = t2 + t1;
+    t17 = t6 + t5;
+    t10 = t8 + t12;
+    t19 = t14 - t16;
+    t13 = t4 + t3;
+    t11 = t9 - t7;
+    t18 = t4 - t3;
+    t15 = t9 + t7;
+    t2 = t8 - t12;
+    t1 = t14 + t16;
+    re[5] = t0;
+    im[5] = t17;
+    re[29] = t10;
+    im[29] = t19;
+    re[53] = t13;
+    im[53] = t11;
+    re[77] = t18;
+    im[77] = t15;
+    re[101] = t2;
+    im[101] = t1;
+    t6 = re[20];
+    t5 = im[20];
+    t4 = re[44];
+    t3 = im[44];
+    t9 = re[68];
+    t7 = im[68];
+    t8 = re[92];
+    t12 = im[92];
+    t14 = re[116];
+    t16 = im[116];
+    t0 = t4 + t14;
+    t17 = t3 + t16;
+    t10 = t9 + t8;
+    t19 = t7 + t12;
+    t13 = t4 - t14;
+    t11 = t3 - t16;
+    t18 = t9 - t8;
+    t15 = t7 - t12;
+    t2 = t0 + t10;
+    t1 = t17 + t19;
+    t4 = t0 - t10;
+    t14 = C27 * t4;
+    t3 = t17 - t19;
+    t16 = C27 * t3;
+    t9 = C28 * t2;
+    t8 = t6 - t9;
+    t7 = C28 * t1;
+    t12 = t5 - t7;
+    t0 = t8 + t14;
+    t10 = t12 + t16;
+    t4 = t8 - t14;
+    t17 = t12 - t16;
+    t19 = C29 * t13;
+    t3 = C30 * t18;
+    t9 = t19 + t3;
+    t7 = C29 * t11;
+    t8 = C30 * t15;
+    t14 = t7 + t8;
+    t12 = C30 * t13;
+    t16 = C29 * t18;
+    t19 = t12 - t16;
+    t3 = C30 * t11;
+    t7 = C29 * t15;
+    t8 = t3 - t7;
+    t13 = t6 + t2;
+    t18 = t5 + t1;
+    t12 = t0 + t14;
+    t16 = t10 - t9;
+    t11 = t4 + t8;
+    t15 = t17 - t19;
+    t3 = t4 - t8;
+    t7 = t17 + t19;
+    t6 = t0 - t14;
+    t2 = t10 + t9;
+    re[20] = t13;
+    im[20] = t18;
+    re[44] = t12;
+    im[44] = t16;
+    re[68] = t11;
+    im[68] = t15;
+    re[92] = t3;
+    im[92] = t7;
+    re[116] = t6;
+    im[116] = t2;
+    t5 = re[35];
+    t1 = im[35];
+    t4 = re[59];
+    t8 = im[59];
+    t17 = re[83];
+    t19 = im[83];
+    t0 = re[107];
+    t14 = im[107];
+    t10 = re[11];
+    t9 = im[11];
+    t13 = t4 + t10;
+    t18 = t8 + t9;
+    t12 = t17 + t0;
+    t16 = t19 + t14;
+    t11 = t4 - t10;
+    t15 = t8 - t9;
+    t3 = t17 - t0;
+    t7 = t19 - t14;
+    t6 = t13 + t12;
+    t2 = t18 + t16;
+    t4 = t13 - t12;
+    t10 = C27 * t4;
+    t8 = t18 - t16;
+    t9 = C27 * t8;
+    t17 = C28 * t6;
+    t0 = t5 - t17;
+    t19 = C28 * t2;
+    t14 = t1 - t19;
+    t13 = t0 + t10;
+    t12 = t14 + t9;
+    t4 = t0 - t10;
+    t18 = t14 - t9;
+    t16 = C29 * t11;
+    t8 = C30 * t3;
+    t17 = t16 + t8;
+    t19 = C29 * t15;
+    t0 = C30 * t7;
+    t10 = t19 + t0;
+    t14 = C30 * t11;
+    t9 = C29 * t3;
+    t16 = t14 - t9;
+    t8 = C30 * t15;
+    t19 = C29 * t7;
+    t0 = t8 - t19;
+    t11 = t5 + t6;
+    t3 = t1 + t2;
+    t14 = t13 + t10;
+    t9 = t12 - t17;
+    t15 = t4 + t0;
+    t7 = t18 - t16;
+    t8 = t4 - t0;
+    t19 = t18 + t16;
+    t5 = t13 - t10;
+    t6 = t12 + t17;
+    re[35] = t11;
+    im[35] = t3;
+    re[59] = t14;
+    im[59] = t9;
+    re[83] = t15;
+    im[83] = t7;
+    re[107] = t8;
+    im[107] = t19;
+    re[11] = t5;
+    im[11] = t6;
+    t1 = re[50];
+    t2 = im[50];
+    t4 = re[74];
+    t0 = im[74];
+    t18 = re[98];
+    t16 = im[98];
+    t13 = re[2];
+    t10 = im[2];
+    t12 = re[26];
+    t17 = im[26];
+    t11 = t4 + t12;
+    t3 = t0 + t17;
+    t14 = t18 + t13;
+    t9 = t16 + t10;
+    t15 = t4 - t12;
+    t7 = t0 - t17;
+    t8 = t18 - t13;
+    t19 = t16 - t10;
+    t5 = t11 + t14;
+    t6 = t3 + t9;
+    t4 = t11 - t14;
+    t12 = C27 * t4;
+    t0 = t3 - t9;
+    t17 = C27 * t0;
+    t18 = C28 * t5;
+    t13 = t1 - t18;
+    t16 = C28 * t6;
+    t10 = t2 - t16;
+    t11 = t13 + t12;
+    t14 = t10 + t17;
+    t4 = t13 - t12;
+    t3 = t10 - t17;
+    t9 = C29 * t15;
+    t0 = C30 * t8;
+    t18 = t9 + t0;
+    t16 = C29 * t7;
+    t13 = C30 * t19;
+    t12 = t16 + t13;
+    t10 = C30 * t15;
+    t17 = C29 * t8;
+    t9 = t10 - t17;
+    t0 = C30 * t7;
+    t16 = C29 * t19;
+    t13 = t0 - t16;
+    t15 = t1 + t5;
+    t8 = t2 + t6;
+    t10 = t11 + t12;
+    t17 = t14 - t18;
+    t7 = t4 + t13;
+    t19 = t3 - t9;
+    t0 = t4 - t13;
+    t16 = t3 + t9;
+    t1 = t11 - t12;
+    t5 = t14 + t18;
+    re[50] = t15;
+    im[50] = t8;
+    re[74] = t10;
+    im[74] = t17;
+    re[98] = t7;
+    im[98] = t19;
+    re[2] = t0;
+    im[2] = t16;
+    re[26] = t1;
+    im[26] = t5;
+    t2 = re[65];
+    t6 = im[65];
+    t4 = re[89];
+    t13 = im[89];
+    t3 = re[113];
+    t9 = im[113];
+    t11 = re[17];
+    t12 = im[17];
+    t14 = re[41];
+    t18 = im[41];
+    t15 = t4 + t14;
+    t8 = t13 + t18;
+    t10 = t3 + t11;
+    t17 = t9 + t12;
+    t7 = t4 - t14;
+    t19 = t13 - t18;
+    t0 = t3 - t11;
+    t16 = t9 - t12;
+    t1 = t15 + t10;
+    t5 = t8 + t17;
+    t4 = t15 - t10;
+    t14 = C27 * t4;
+    t13 = t8 - t17;
+    t18 = C27 * t13;
+    t3 = C28 * t1;
+    t11 = t2 - t3;
+    t9 = C28 * t5;
+    t12 = t6 - t9;
+    t15 = t11 + t14;
+    t10 = t12 + t18;
+    t4 = t11 - t14;
+    t8 = t12 - t18;
+    t17 = C29 * t7;
+    t13 = C30 * t0;
+    t3 = t17 + t13;
+    t9 = C29 * t19;
+    t11 = C30 * t16;
+    t14 = t9 + t11;
+    t12 = C30 * t7;
+    t18 = C29 * t0;
+    t17 = t12 - t18;
+    t13 = C30 * t19;
+    t9 = C29 * t16;
+    t11 = t13 - t9;
+    t7 = t2 + t1;
+    t0 = t6 + t5;
+    t12 = t15 + t14;
+    t18 = t10 - t3;
+    t19 = t4 + t11;
+    t16 = t8 - t17;
+    t13 = t4 - t11;
+    t9 = t8 + t17;
+    t2 = t15 - t14;
+    t1 = t10 + t3;
+    re[65] = t7;
+    im[65] = t0;
+    re[89] = t12;
+    im[89] = t18;
+    re[113] = t19;
+    im[113] = t16;
+    re[17] = t13;
+    im[17] = t9;
+    re[41] = t2;
+    im[41] = t1;
+    t6 = re[0];
+    t5 = im[0];
+    t4 = re[40];
+    t11 = im[40];
+    t8 = re[80];
+    t17 = im[80];
+    t15 = t4 + t8;
+    t14 = t11 + t17;
+    t10 = C31 * t15;
+    t3 = t6 - t10;
+    t7 = C31 * t14;
+    t0 = t5 - t7;
+    t12 = t4 - t8;
+    t18 = C32 * t12;
+    t19 = t11 - t17;
+    t16 = C32 * t19;
+    t13 = t6 + t15;
+    t9 = t5 + t14;
+    t2 = t3 + t16;
+    t1 = t0 - t18;
+    t10 = t3 - t16;
+    t7 = t0 + t18;
+    t4 = (-C33) * t13;
+    t8 = (-C34) * t9;
+    t12 = t4 + t8;
+    t11 = 0.08062381886627268 * t12;
+    y[359] = t11;
+    t17 = 0.07908701262725863 * t12;
+    y[360] = t17;
+    t19 = C34 * t13;
+    t6 = (-C33) * t9;
+    t15 = t19 + t6;
+    t5 = 0.05093589219767399 * t15;
+    y[119] = t5;
+    t14 = (-0.0533957066838501) * t15;
+    y[120] = t14;
+    t3 = (-C35) * t2;
+    t16 = (-C36) * t1;
+    t0 = t3 + t16;
+    t18 = 0.09034656516392356 * t0;
+    y[279] = t18;
+    t4 = (-0.008607320729772055) * t0;
+    y[440] = t4;
+    t8 = C36 * t2;
+    t11 = (-C35) * t1;
+    t12 = t8 + t11;
+    y[39] = 0;
+    t17 = (-0.09223741177335797) * t12;
+    y[200] = t17;
+    t13 = C37 * t10;
+    t9 = C38 * t7;
+    t19 = t13 + t9;
+    y[40] = 0;
+    t6 = (-0.09224509203483207) * t19;
+    y[199] = t6;
+    t5 = (-C38) * t10;
+    t15 = C37 * t7;
+    t14 = t5 + t15;
+    t3 = 0.09033904297246116 * t14;
+    y[280] = t3;
+    t16 = (-0.008844170730505122) * t14;
+    y[439] = t16;
+    t18 = re[39];
+    t0 = im[39];
+    t4 = re[79];
+    t2 = im[79];
+    t1 = re[119];
+    t8 = im[119];
+    t11 = t4 + t1;
+    t12 = t2 + t8;
+    t17 = C31 * t11;
+    t13 = t18 - t17;
+    t9 = C31 * t12;
+    t19 = t0 - t9;
+    t6 = t4 - t1;
+    t10 = C32 * t6;
+    t7 = t2 - t8;
+    t5 = C32 * t7;
+    t15 = t18 + t11;
+    t3 = t0 + t12;
+    t14 = t13 + t5;
+    t16 = t19 - t10;
+    t17 = t13 - t5;
+    t9 = t19 + t10;
+    t4 = C39 * t15;
+    t1 = C40 * t3;
+    t6 = t4 + t1;
+    y[42] = 0;
+    t2 = (-0.09226327155399247) * t6;
+    y[197] = t2;
+    t8 = (-C40) * t15;
+    t7 = C39 * t3;
+    t18 = t8 + t7;
+    t11 = 0.09032124260255246 * t18;
+    y[282] = t11;
+    t0 = (-0.009265717230196452) * t18;
+    y[437] = t0;
+    t12 = (-C41) * t14;
+    t13 = (-C42) * t16;
+    t5 = t12 + t13;
+    t19 = 0.08345046628438205 * t5;
+    y[357] = t19;
+    t10 = 0.07578270262387705 * t5;
+    y[362] = t10;
+    t4 = C42 * t14;
+    t1 = (-C41) * t16;
+    t6 = t4 + t1;
+    t2 = 0.04591306207989876 * t6;
+    y[117] = t2;
+    t15 = (-0.05816525202674937) * t6;
+    y[122] = t15;
+    t3 = (-C43) * t17;
+    t8 = (-C44) * t9;
+    t7 = t3 + t8;
+    t11 = 0.09035887908682398 * t7;
+    y[277] = t11;
+    t18 = (-0.00808776756287088) * t7;
+    y[442] = t18;
+    t0 = C44 * t17;
+    t12 = (-C43) * t9;
+    t13 = t0 + t12;
+    y[37] = 0;
+    t19 = (-0.09222484184787204) * t13;
+    y[202] = t19;
+    t5 = re[78];
+    t10 = im[78];
+    t14 = re[118];
+    t16 = im[118];
+    t4 = re[38];
+    t1 = im[38];
+    t2 = t14 + t4;
+    t6 = t16 + t1;
+    t15 = C31 * t2;
+    t3 = t5 - t15;
+    t8 = C31 * t6;
+    t11 = t10 - t8;
+    t7 = t14 - t4;
+    t18 = C32 * t7;
+    t17 = t16 - t1;
+    t9 = C32 * t17;
+    t0 = t5 + t2;
+    t12 = t10 + t6;
+    t13 = t3 + t9;
+    t19 = t11 - t18;
+    t15 = t3 - t9;
+    t8 = t11 + t18;
+    t14 = (-C45) * t0;
+    t4 = (-C46) * t12;
+    t7 = t14 + t4;
+    t16 = 0.09036790163852577 * t7;
+    y[275] = t16;
+    t1 = (-0.007516983228543206) * t7;
+    y[444] = t1;
+    t17 = C46 * t0;
+    t5 = (-C45) * t12;
+    t2 = t17 + t5;
+    y[35] = 0;
+    t10 = (-0.09221563389473073) * t2;
+    y[204] = t10;
+    t6 = C47 * t13;
+    t3 = C48 * t19;
+    t9 = t6 + t3;
+    y[44] = 0;
+    t11 = (-0.09228499199887408) * t9;
+    y[195] = t11;
+    t18 = (-C48) * t13;
+    t14 = C47 * t19;
+    t4 = t18 + t14;
+    t16 = 0.09029998435103076 * t4;
+    y[284] = t16;
+    t7 = (-0.009609217195098947) * t4;
+    y[435] = t7;
+    t1 = (-C49) * t15;
+    t0 = (-C50) * t8;
+    t12 = t1 + t0;
+    t17 = 0.08593171868025587 * t12;
+    y[355] = t17;
+    t5 = 0.0721967068995578 * t12;
+    y[364] = t5;
+    t2 = C50 * t15;
+    t10 = (-C49) * t8;
+    t6 = t2 + t10;
+    t3 = 0.04081728778312514 * t6;
+    y[115] = t3;
+    t9 = (-0.06268301918716075) * t6;
+    y[124] = t9;
+    t11 = re[117];
+    t13 = im[117];
+    t19 = re[37];
+    t18 = im[37];
+    t14 = re[77];
+    t16 = im[77];
+    t4 = t19 + t14;
+    t7 = t18 + t16;
+    t1 = C31 * t4;
+    t0 = t11 - t1;
+    t17 = C31 * t7;
+    t12 = t13 - t17;
+    t5 = t19 - t14;
+    t15 = C32 * t5;
+    t8 = t18 - t16;
+    t2 = C32 * t8;
+    t10 = t11 + t4;
+    t3 = t13 + t7;
+    t6 = t0 + t2;
+    t9 = t12 - t15;
+    t1 = t0 - t2;
+    t17 = t12 + t15;
+    t19 = (-C51) * t10;
+    t14 = (-C52) * t3;
+    t5 = t19 + t14;
+    t18 = 0.08805597029305232 * t5;
+    y[353] = t18;
+    t16 = 0.06836553343262328 * t5;
+    y[366] = t16;
+    t8 = C52 * t10;
+    t11 = (-C51) * t3;
+    t4 = t8 + t11;
+    t13 = 0.035732076918905245 * t4;
+    y[113] = t13;
+    t7 = (-0.06689484897518211) * t4;
+    y[126] = t7;
+    t0 = (-C53) * t6;
+    t2 = (-C54) * t9;
+    t12 = t0 + t2;
+    t15 = 0.09037445652792069 * t12;
+    y[273] = t15;
+    t19 = (-0.0069065039150964765) * t12;
+    y[446] = t19;
+    t14 = C54 * t6;
+    t18 = (-C53) * t9;
+    t5 = t14 + t18;
+    y[33] = 0;
+    t16 = (-0.09220894546412896) * t5;
+    y[206] = t16;
+    t10 = C55 * t1;
+    t3 = C56 * t17;
+    t8 = t10 + t3;
+    y[46] = 0;
+    t11 = (-0.09230960613835858) * t8;
+    y[193] = t11;
+    t13 = (-C56) * t1;
+    t4 = C55 * t17;
+    t7 = t13 + t4;
+    t0 = 0.09027590607247186 * t7;
+    y[286] = t0;
+    t2 = (-0.009866002803861918) * t7;
+    y[433] = t2;
+    t15 = re[36];
+    t12 = im[36];
+    t19 = re[76];
+    t6 = im[76];
+    t9 = re[116];
+    t14 = im[116];
+    t18 = t19 + t9;
+    t5 = t6 + t14;
+    t16 = C31 * t18;
+    t10 = t15 - t16;
+    t3 = C31 * t5;
+    t8 = t12 - t3;
+    t11 = t19 - t9;
+    t1 = C32 * t11;
+    t17 = t6 - t14;
+    t13 = C32 * t17;
+    t4 = t15 + t18;
+    t0 = t12 + t5;
+    t7 = t10 + t13;
+    t2 = t8 - t1;
+    t16 = t10 - t13;
+    t3 = t8 + t1;
+    t19 = C57 * t4;
+    t9 = C58 * t0;
+    t11 = t19 + t9;
+    y[48] = 0;
+    t6 = (-0.09233615544660524) * t11;
+    y[191] = t6;
+    t14 = (-C58) * t4;
+    t17 = C57 * t0;
+    t15 = t14 + t17;
+    t18 = 0.0902499491453508 * t15;
+    y[288] = t18;
+    t12 = (-0.010028110732918314) * t15;
+    y[431] = t12;
+    t5 = (-C59) * t7;
+    t10 = (-C60) * t2;
+    t13 = t5 + t10;
+    t8 = 0.08982134522665142 * t13;
+    y[351] = t8;
+    t1 = 0.06433086169952303 * t13;
+    y[368] = t1;
+    t19 = C60 * t7;
+    t9 = (-C59) * t2;
+    t11 = t19 + t9;
+    t6 = 0.030744011971085474 * t11;
+    y[111] = t6;
+    t4 = (-0.07075761930636477) * t11;
+    y[128] = t4;
+    t0 = (-C61) * t16;
+    t14 = (-C62) * t3;
+    t17 = t0 + t14;
+    t18 = 0.09037972981913145 * t17;
+    y[271] = t18;
+    t15 = (-0.0062692385583066525) * t17;
+    y[448] = t15;
+    t12 = C62 * t16;
+    t5 = (-C61) * t3;
+    t10 = t12 + t5;
+    y[31] = 0;
+    t8 = (-0.09220356544559334) * t10;
+    y[208] = t8;
+    t13 = re[75];
+    t1 = im[75];
+    t7 = re[115];
+    t2 = im[115];
+    t19 = re[35];
+    t9 = im[35];
+    t6 = t7 + t19;
+    t11 = t2 + t9;
+    t4 = C31 * t6;
+    t0 = t13 - t4;
+    t14 = C31 * t11;
+    t18 = t1 - t14;
+    t17 = t7 - t19;
+    t15 = C32 * t17;
+    t16 = t2 - t9;
+    t3 = C32 * t16;
+    t12 = t13 + t6;
+    t5 = t1 + t11;
+    t10 = t0 + t3;
+    t8 = t18 - t15;
+    t4 = t0 - t3;
+    t14 = t18 + t15;
+    t7 = (-C63) * t12;
+    t19 = (-C64) * t5;
+    t17 = t7 + t19;
+    t2 = 0.09038523656129972 * t17;
+    y[269] = t2;
+    t9 = (-0.00561728389438704) * t17;
+    y[450] = t9;
+    t16 = C64 * t12;
+    t13 = (-C63) * t5;
+    t6 = t16 + t13;
+    y[29] = 0;
+    t1 = (-0.09219794792130263) * t6;
+    y[210] = t1;
+    t11 = C65 * t10;
+    t0 = C66 * t8;
+    t3 = t11 + t0;
+    y[50] = 0;
+    t18 = (-0.09236339352934352) * t3;
+    y[189] = t18;
+    t15 = (-C66) * t10;
+    t7 = C65 * t8;
+    t19 = t15 + t7;
+    t2 = 0.09022333432006113 * t19;
+    y[290] = t2;
+    t17 = (-0.010087996230996618) * t19;
+    y[429] = t17;
+    t9 = (-C67) * t4;
+    t12 = (-C68) * t14;
+    t5 = t9 + t12;
+    t16 = 0.09123336800239044 * t5;
+    y[349] = t16;
+    t13 = 0.06013646578493223 * t5;
+    y[370] = t13;
+    t6 = C68 * t4;
+    t1 = (-C67) * t14;
+    t11 = t6 + t1;
+    t0 = 0.025940569677611058 * t11;
+    y[109] = t0;
+    t3 = (-0.07424212545015943) * t11;
+    y[130] = t3;
+    t18 = re[114];
+    t10 = im[114];
+    t8 = re[34];
+    t15 = im[34];
+    t7 = re[74];
+    t2 = im[74];
+    t19 = t8 + t7;
+    t17 = t15 + t2;
+    t9 = C31 * t19;
+    t12 = t18 - t9;
+    t16 = C31 * t17;
+    t5 = t10 - t16;
+    t13 = t8 - t7;
+    t4 = C32 * t13;
+    t14 = t15 - t2;
+    t6 = C32 * t14;
+    t1 = t18 + t19;
+    t0 = t10 + t17;
+    t11 = t12 + t6;
+    t3 = t5 - t4;
+    t9 = t12 - t6;
+    t16 = t5 + t4;
+    t8 = (-C69) * t1;
+    t7 = (-C70) * t0;
+    t13 = t8 + t7;
+    t15 = 0.09230804514914263 * t13;
+    y[347] = t15;
+    t2 = 0.055828404603232656 * t13;
+    y[372] = t2;
+    t14 = C70 * t1;
+    t18 = (-C69) * t0;
+    t19 = t14 + t18;
+    t10 = 0.021405733355147217 * t19;
+    y[107] = t10;
+    t17 = (-0.07733112947219162) * t19;
+    y[132] = t17;
+    t12 = (-C71) * t11;
+    t6 = (-C72) * t3;
+    t5 = t12 + t6;
+    t4 = 0.09039269800496416 * t5;
+    y[267] = t4;
+    t8 = (-0.004963431358318882) * t5;
+    y[452] = t8;
+    t7 = C72 * t11;
+    t15 = (-C71) * t3;
+    t13 = t7 + t15;
+    y[27] = 0;
+    t2 = (-0.09219033746371506) * t13;
+    y[212] = t2;
+    t1 = C73 * t9;
+    t0 = C74 * t16;
+    t14 = t1 + t0;
+    y[52] = 0;
+    t18 = (-0.09238985249618288) * t14;
+    y[187] = t18;
+    t10 = (-C74) * t9;
+    t19 = C73 * t16;
+    t17 = t10 + t19;
+    t12 = 0.09019749580915963 * t17;
+    y[292] = t12;
+    t6 = (-0.01003984440986052) * t17;
+    y[427] = t6;
+    t4 = re[33];
+    t5 = im[33];
+    t8 = re[73];
+    t11 = im[73];
+    t3 = re[113];
+    t7 = im[113];
+    t15 = t8 + t3;
+    t13 = t11 + t7;
+    t2 = C31 * t15;
+    t1 = t4 - t2;
+    t0 = C31 * t13;
+    t14 = t5 - t0;
+    t18 = t8 - t3;
+    t9 = C32 * t18;
+    t16 = t11 - t7;
+    t10 = C32 * t16;
+    t19 = t4 + t15;
+    t12 = t5 + t13;
+    t17 = t1 + t10;
+    t6 = t14 - t9;
+    t2 = t1 - t10;
+    t0 = t14 + t9;
+    t8 = C75 * t19;
+    t3 = C76 * t12;
+    t18 = t8 + t3;
+    y[54] = 0;
+    t11 = (-0.0924138411025536) * t18;
+    y[185] = t11;
+    t7 = (-C76) * t19;
+    t16 = C75 * t12;
+    t4 = t7 + t16;
+    t15 = 0.09017408251741922 * t4;
+    y[294] = t15;
+    t5 = (-0.009877028183254045) * t4;
+    y[425] = t5;
+    t13 = (-C77) * t17;
+    t1 = (-C78) * t6;
+    t10 = t13 + t1;
+    t14 = 0.09306856714612953 * t10;
+    y[345] = t14;
+    t9 = 0.05145305538177841 * t10;
+    y[374] = t9;
+    t8 = C78 * t17;
+    t3 = (-C77) * t6;
+    t18 = t8 + t3;
+    t11 = 0.017216724201455764 * t18;
+    y[105] = t11;
+    t19 = (-0.08002143471070666) * t18;
+    y[134] = t19;
+    t12 = (-C79) * t2;
+    t7 = (-C80) * t0;
+    t16 = t12 + t7;
+    t15 = 0.09040393857576512 * t16;
+    y[265] = t15;
+    t4 = (-0.004319493689614513) * t16;
+    y[454] = t4;
+    t5 = C80 * t2;
+    t13 = (-C79) * t0;
+    t1 = t5 + t13;
+    y[25] = 0;
+    t14 = (-0.09217887477711376) * t1;
+    y[214] = t14;
+    t10 = re[72];
+    t9 = im[72];
+    t17 = re[112];
+    t6 = im[112];
+    t8 = re[32];
+    t3 = im[32];
+    t11 = t17 + t8;
+    t18 = t6 + t3;
+    t19 = C31 * t11;
+    t12 = t10 - t19;
+    t7 = C31 * t18;
+    t15 = t9 - t7;
+    t16 = t17 - t8;
+    t4 = C32 * t16;
+    t2 = t6 - t3;
+    t0 = C32 * t2;
+    t5 = t10 + t11;
+    t13 = t9 + t18;
+    t1 = t12 + t0;
+    t14 = t15 - t4;
+    t19 = t12 - t0;
+    t7 = t15 + t4;
+    t17 = (-C81) * t5;
+    t8 = (-C82) * t13;
+    t16 = t17 + t8;
+    t6 = 0.09042074637842189 * t16;
+    y[263] = t6;
+    t3 = (-0.003697175871317106) * t16;
+    y[456] = t3;
+    t2 = C82 * t5;
+    t10 = (-C81) * t13;
+    t11 = t2 + t10;
+    y[23] = 0;
+    t9 = (-0.09216174016588313) * t11;
+    y[216] = t9;
+    t18 = C83 * t1;
+    t12 = C84 * t14;
+    t0 = t18 + t12;
+    y[56] = 0;
+    t15 = (-0.09243355653535416) * t0;
+    y[183] = t15;
+    t4 = (-C84) * t1;
+    t17 = C83 * t14;
+    t8 = t4 + t17;
+    t6 = 0.09015484901466475 * t8;
+    y[296] = t6;
+    t16 = (-0.009594235155045096) * t8;
+    y[423] = t16;
+    t3 = (-C85) * t19;
+    t5 = (-C86) * t7;
+    t13 = t3 + t5;
+    t2 = 0.09354518542538132 * t13;
+    y[343] = t2;
+    t10 = 0.0470560814586414 * t13;
+    y[376] = t10;
+    t11 = C86 * t19;
+    t9 = (-C85) * t7;
+    t18 = t11 + t9;
+    t12 = 0.013440088856608934 * t18;
+    y[103] = t12;
+    t0 = (-0.08232273400567668) * t18;
+    y[136] = t0;
+    t15 = re[111];
+    t1 = im[111];
+    t14 = re[31];
+    t4 = im[31];
+    t17 = re[71];
+    t6 = im[71];
+    t8 = t14 + t17;
+    t16 = t4 + t6;
+    t3 = C31 * t8;
+    t5 = t15 - t3;
+    t2 = C31 * t16;
+    t13 = t1 - t2;
+    t10 = t14 - t17;
+    t19 = C32 * t10;
+    t7 = t4 - t6;
+    t11 = C32 * t7;
+    t9 = t15 + t8;
+    t12 = t1 + t16;
+    t18 = t5 + t11;
+    t0 = t13 - t19;
+    t3 = t5 - t11;
+    t2 = t13 + t19;
+    t14 = (-C87) * t9;
+    t17 = (-C88) * t12;
+    t10 = t14 + t17;
+    t4 = 0.09377475550498254 * t10;
+    y[341] = t4;
+    t6 = 0.042680753490592846 * t10;
+    y[378] = t6;
+    t7 = C88 * t9;
+    t15 = (-C87) * t12;
+    t8 = t7 + t15;
+    t1 = 0.010127595928892156 * t8;
+    y[101] = t1;
+    t16 = (-0.08425593717085343) * t8;
+    y[138] = t16;
+    t5 = (-C89) * t18;
+    t11 = (-C90) * t0;
+    t13 = t5 + t11;
+    t19 = 0.09044476051911167 * t13;
+    y[261] = t19;
+    t14 = (-0.003106496364189138) * t13;
+    y[458] = t14;
+    t17 = C90 * t18;
+    t4 = (-C89) * t0;
+    t10 = t17 + t4;
+    y[21] = 0;
+    t6 = (-0.09213727014703564) * t10;
+    y[218] = t6;
+    t9 = C91 * t3;
+    t12 = C92 * t2;
+    t7 = t9 + t12;
+    y[58] = 0;
+    t15 = (-0.09244707397236758) * t7;
+    y[181] = t15;
+    t1 = (-C92) * t3;
+    t8 = C91 * t2;
+    t16 = t1 + t8;
+    t5 = 0.09014166674246678 * t16;
+    y[298] = t5;
+    t11 = (-0.009185219825295927) * t16;
+    y[421] = t11;
+    t19 = re[30];
+    t13 = im[30];
+    t14 = re[70];
+    t18 = im[70];
+    t0 = re[110];
+    t17 = im[110];
+    t4 = t14 + t0;
+    t10 = t18 + t17;
+    t6 = C31 * t4;
+    t9 = t19 - t6;
+    t12 = C31 * t10;
+    t7 = t13 - t12;
+    t15 = t14 - t0;
+    t3 = C32 * t15;
+    t2 = t18 - t17;
+    t1 = C32 * t2;
+    t8 = t19 + t4;
+    t5 = t13 + t10;
+    t16 = t9 + t1;
+    t11 = t7 - t3;
+    t6 = t9 - t1;
+    t12 = t7 + t3;
+    t14 = C93 * t8;
+    t0 = C94 * t5;
+    t15 = t14 + t0;
+    y[60] = 0;
+    t18 = (-0.09245244567865918) * t15;
+    y[179] = t18;
+    t17 = (-C94) * t8;
+    t2 = C93 * t5;
+    t19 = t17 + t2;
+    t4 = 0.09013642929791008 * t19;
+    y[300] = t4;
+    t13 = (-0.008644252539109377) * t19;
+    y[419] = t13;
+    t10 = (-C95) * t16;
+    t9 = (-C96) * t11;
+    t1 = t10 + t9;
+    t7 = 0.09379849794073448 * t1;
+    y[339] = t7;
+    t3 = 0.038368358115737966 * t1;
+    y[380] = t3;
+    t14 = C96 * t16;
+    t0 = (-C95) * t11;
+    t15 = t14 + t0;
+    t18 = 0.007312017970662098 * t15;
+    y[99] = t18;
+    t8 = (-0.08585194204681529) * t15;
+    y[140] = t8;
+    t5 = (-C97) * t6;
+    t17 = (-C98) * t12;
+    t2 = t5 + t17;
+    t4 = 0.09047736631347802 * t2;
+    y[259] = t4;
+    t19 = (-0.002556868825188347) * t2;
+    y[460] = t19;
+    t13 = C98 * t6;
+    t10 = (-C97) * t12;
+    t9 = t13 + t10;
+    y[19] = 0;
+    t7 = (-0.0921040661645779) * t9;
+    y[220] = t7;
+    t1 = re[69];
+    t3 = im[69];
+    t16 = re[109];
+    t11 = im[109];
+    t14 = re[29];
+    t0 = im[29];
+    t18 = t16 + t14;
+    t15 = t11 + t0;
+    t8 = C31 * t18;
+    t5 = t1 - t8;
+    t17 = C31 * t15;
+    t4 = t3 - t17;
+    t2 = t16 - t14;
+    t19 = C32 * t2;
+    t6 = t11 - t0;
+    t12 = C32 * t6;
+    t13 = t1 + t18;
+    t10 = t3 + t15;
+    t9 = t5 + t12;
+    t7 = t4 - t19;
+    t8 = t5 - t12;
+    t17 = t4 + t19;
+    t16 = (-C99) * t13;
+    t14 = (-C100) * t10;
+    t2 = t16 + t14;
+    t11 = 0.09051962918570353 * t2;
+    y[257] = t11;
+    t0 = (-0.0020558588746538045) * t2;
+    y[462] = t0;
+    t6 = C100 * t13;
+    t1 = (-C99) * t10;
+    t18 = t6 + t1;
+    y[17] = 0;
+    t3 = (-0.092061063531726) * t18;
+    y[222] = t3;
+    t15 = C101 * t9;
+    t5 = C102 * t7;
+    t12 = t15 + t5;
+    y[62] = 0;
+    t4 = (-0.09244769863880027) * t12;
+    y[177] = t4;
+    t19 = (-C102) * t9;
+    t16 = C101 * t7;
+    t14 = t19 + t16;
+    t11 = 0.0901410576578251 * t14;
+    y[302] = t11;
+    t2 = (-0.007964474361442294) * t14;
+    y[417] = t2;
+    t0 = (-C103) * t8;
+    t13 = (-C104) * t17;
+    t10 = t0 + t13;
+    t6 = 0.09365978084389547 * t10;
+    y[337] = t6;
+    t1 = 0.03415636549737041 * t10;
+    y[382] = t1;
+    t18 = C104 * t8;
+    t3 = (-C103) * t17;
+    t15 = t18 + t3;
+    t5 = 0.0050047570007893775 * t15;
+    y[97] = t5;
+    t12 = (-0.0871493500245666) * t15;
+    y[142] = t12;
+    t4 = re[108];
+    t9 = im[108];
+    t7 = re[28];
+    t19 = im[28];
+    t16 = re[68];
+    t11 = im[68];
+    t14 = t7 + t16;
+    t2 = t19 + t11;
+    t0 = C31 * t14;
+    t13 = t4 - t0;
+    t6 = C31 * t2;
+    t10 = t9 - t6;
+    t1 = t7 - t16;
+    t8 = C32 * t1;
+    t17 = t19 - t11;
+    t18 = C32 * t17;
+    t3 = t4 + t14;
+    t5 = t9 + t2;
+    t15 = t13 + t18;
+    t12 = t10 - t8;
+    t0 = t13 - t18;
+    t6 = t10 + t8;
+    t7 = (-C105) * t3;
+    t16 = (-C106) * t5;
+    t1 = t7 + t16;
+    t19 = 0.09340276040701101 * t1;
+    y[335] = t19;
+    t11 = 0.030076992374384853 * t1;
+    y[384] = t11;
+    t17 = C106 * t3;
+    t4 = (-C105) * t5;
+    t14 = t17 + t4;
+    t9 = 0.0031944649282448214 * t14;
+    y[95] = t9;
+    t2 = (-0.08819068515910766) * t14;
+    y[144] = t2;
+    t13 = (-C107) * t15;
+    t18 = (-C108) * t12;
+    t10 = t13 + t18;
+    t8 = 0.09057223570062113 * t10;
+    y[255] = t8;
+    t7 = (-0.0016093731094369787) * t10;
+    y[464] = t7;
+    t16 = C108 * t15;
+    t19 = (-C107) * t12;
+    t1 = t16 + t19;
+    y[15] = 0;
+    t11 = (-0.092007592270091) * t1;
+    y[224] = t11;
+    t3 = C109 * t0;
+    t5 = C110 * t6;
+    t17 = t3 + t5;
+    y[64] = 0;
+    t4 = (-0.09243093246183026) * t17;
+    y[175] = t4;
+    t9 = (-C110) * t0;
+    t14 = C109 * t6;
+    t2 = t9 + t14;
+    t13 = 0.09015740847118053 * t2;
+    y[304] = t13;
+    t18 = (-0.00713921434866316) * t2;
+    y[415] = t18;
+    t8 = re[27];
+    t10 = im[27];
+    t7 = re[67];
+    t15 = im[67];
+    t12 = re[107];
+    t16 = im[107];
+    t19 = t7 + t12;
+    t1 = t15 + t16;
+    t11 = C31 * t19;
+    t3 = t8 - t11;
+    t5 = C31 * t1;
+    t17 = t10 - t5;
+    t4 = t7 - t12;
+    t0 = C32 * t4;
+    t6 = t15 - t16;
+    t9 = C32 * t6;
+    t14 = t8 + t19;
+    t13 = t10 + t1;
+    t2 = t3 + t9;
+    t18 = t17 - t0;
+    t11 = t3 - t9;
+    t5 = t17 + t0;
+    t7 = C111 * t14;
+    t12 = C112 * t13;
+    t4 = t7 + t12;
+    y[66] = 0;
+    t15 = (-0.09240025394681477) * t4;
+    y[173] = t15;
+    t16 = (-C112) * t14;
+    t6 = C111 * t13;
+    t8 = t16 + t6;
+    t19 = 0.09018734232191579 * t8;
+    y[306] = t19;
+    t10 = (-0.006160480419908887) * t8;
+    y[413] = t10;
+    t1 = (-C113) * t2;
+    t3 = (-C114) * t18;
+    t9 = t1 + t3;
+    t17 = 0.09306915998476316 * t9;
+    y[333] = t17;
+    t0 = 0.026158716441240817 * t9;
+    y[386] = t0;
+    t7 = C114 * t2;
+    t12 = (-C113) * t18;
+    t4 = t7 + t12;
+    t15 = 0.0018479886878230783 * t4;
+    y[93] = t15;
+    t14 = (-0.08901973889759318) * t4;
+    y[146] = t14;
+    t13 = (-C115) * t11;
+    t16 = (-C116) * t5;
+    t6 = t13 + t16;
+    t19 = 0.09063548315755285 * t6;
+    y[253] = t19;
+    t8 = (-0.0012211593971509166) * t6;
+    y[466] = t8;
+    t10 = C116 * t11;
+    t1 = (-C115) * t5;
+    t3 = t10 + t1;
+    y[13] = 0;
+    t17 = (-0.09194338732488894) * t3;
+    y[226] = t17;
+    t9 = re[66];
+    t0 = im[66];
+    t2 = re[106];
+    t18 = im[106];
+    t7 = re[26];
+    t12 = im[26];
+    t15 = t2 + t7;
+    t4 = t18 + t12;
+    t14 = C31 * t15;
+    t13 = t9 - t14;
+    t16 = C31 * t4;
+    t19 = t0 - t16;
+    t6 = t2 - t7;
+    t8 = C32 * t6;
+    t11 = t18 - t12;
+    t5 = C32 * t11;
+    t10 = t9 + t15;
+    t1 = t0 + t4;
+    t3 = t13 + t5;
+    t17 = t19 - t8;
+    t14 = t13 - t5;
+    t16 = t19 + t8;
+    t2 = (-C117) * t10;
+    t7 = (-C118) * t1;
+    t6 = t2 + t7;
+    t18 = 0.0907092475124274 * t6;
+    y[251] = t18;
+    t12 = (-0.0008932729373177886) * t6;
+    y[468] = t12;
+    t11 = C118 * t10;
+    t9 = (-C117) * t1;
+    t15 = t11 + t9;
+    y[11] = 0;
+    t0 = (-0.09186861937303194) * t15;
+    y[228] = t0;
+    t4 = C119 * t3;
+    t13 = C120 * t17;
+    t5 = t4 + t13;
+    y[68] = 0;
+    t19 = (-0.09235379845708279) * t5;
+    y[171] = t19;
+    t8 = (-C120) * t3;
+    t2 = C119 * t17;
+    t7 = t8 + t2;
+    t18 = 0.09023270804834159 * t7;
+    y[308] = t18;
+    t6 = (-0.005020331172090252) * t7;
+    y[411] = t6;
+    t12 = (-C121) * t14;
+    t10 = (-C122) * t16;
+    t1 = t12 + t10;
+    t11 = 0.09269655281084341 * t1;
+    y[331] = t11;
+    t9 = 0.02242428004659937 * t1;
+    y[388] = t9;
+    t15 = C122 * t14;
+    t0 = (-C121) * t16;
+    t4 = t15 + t0;
+    t13 = 0.0009125736608240058 * t4;
+    y[91] = t13;
+    t5 = (-0.0896783027408053) * t4;
+    y[148] = t5;
+}
+
+/**
+ *  Part 4 of ApplyWindowedIMDCT_W10_240_K160().
+ * 
+ *  @param {Number[]} X 
+ *    - The input block (240 points, only the first 160 points are used).
+ *  @param {Number[]} y 
+ *    - The array that would contain the output block (480 points).
+ *  @param {Number[]} re 
+ *    - The scratch buffer (real part, 120 points).
+ *  @param {Number[]} im 
+ *    - The scratch buffer (imaginary part, 120 points).
+ */
+function ApplyWindowedIMDCT_W10_240_K160_Part4(X, y, re, im) {
+    let t0, t1, t10, t11, t12, t13, t14, t15, t16, t17, t18, t19, t2, t3, t4, t5, t6, t7, t8, t9;
+    const C0 = 0.5;
+    const C1 = 0.8660254037844386;
+    const C2 = 0.9801415982456801;
+    const C3 = 0.19829888398174045;
+    const C4 = 0.74967808139577;
+    const C5 = 0.6618026701931303;
+    const C6 = 0.3183389280525497;
+    const C7 = 0.9479769653775104;
+    const C8 = 0.30590302009655346;
+    const C9 = 0.9520626777139243;
+    const C10 = 0.9774619749435719;
+    const C11 = 0.21111155235896514;
+    const C12 = 0.7409511253549591;
+    const C13 = 0.6715589548470183;
+    const C14 = 0.7320972111532454;
+    const C15 = 0.6812001713311883;
+    const C16 = 0.2934146972328567;
+    const C17 = 0.9559852590117439;
+    const C18 = 0.974614868564045;
+    const C19 = 0.22388804785849836;
+    const C20 = 0.9716007669441208;
+    const C21 = 0.23662618129360988;
+    const C22 = 0.7231178558632475;
+    const C23 = 0.6907246676728287;
+    const C24 = 0.2808760992712921;
+    const C25 = 0.9597440371568574;
+    const C26 = 0.2682893746360714;
+    const C27 = 0.9633383681019799;
+    const C28 = 0.968420186534595;
+    const C29 = 0.24932377005071168;
+    const C30 = 0.7140145980512682;
+    const C31 = 0.7001308118985237;
+    const C32 = 0.7047889975136701;
+    const C33 = 0.709416992313883;
+    const C34 = 0.2556566799976644;
+    const C35 = 0.9667676359770075;
+    const C36 = 0.9650736723115474;
+    const C37 = 0.26197863846333747;
+    const C38 = 0.9615617976829619;
+    const C39 = 0.27458861818493235;
+    const C40 = 0.6954426350096117;
+    const C41 = 0.7185816177796981;
+    const C42 = 0.24298017990326387;
+    const C43 = 0.970031253194544;
+    const C44 = 0.23026204640590237;
+    const C45 = 0.97312866055058;
+    const C46 = 0.9578851643904772;
+    const C47 = 0.2871515485603873;
+    const C48 = 0.6859771119901928;
+    const C49 = 0.7276231179845748;
+    const C50 = 0.6763940503240542;
+    const C51 = 0.736539943713999;
+    const C52 = 0.21750445869228147;
+    const C53 = 0.9760593273203108;
+    const C54 = 0.9540444024062804;
+    const C55 = 0.2996652769962566;
+    const C56 = 0.9500401698251654;
+    const C57 = 0.3121276593295937;
+    const C58 = 0.6666950920194786;
+    const C59 = 0.7453305671157858;
+    const C60 = 0.2047096027093796;
+    const C61 = 0.9788227513490724;
+    const C62 = 0.19187967078990142;
+    const C63 = 0.9814184591383835;
+    const C64 = 0.945873152751771;
+    const C65 = 0.32453656019534216;
+    const C66 = 0.6568818989430413;
+    const C67 = 0.7539934819618695;
+    const C68 = 0.6469561525348573;
+    const C69 = 0.7625272039063882;
+    const C70 = 0.17901686127663266;
+    const C71 = 0.9838460059270774;
+    const C72 = 0.9415440651830208;
+    const C73 = 0.33688985339222005;
+    const C74 = 0.9370536488857836;
+    const C75 = 0.34918542224703286;
+    const C76 = 0.6369195535204759;
+    const C77 = 0.7709302707400181;
+    const C78 = 0.16612337814576547;
+    const C79 = 0.9861049757675088;
+    const C80 = 0.15320143062925848;
+    const C81 = 0.9881949815968246;
+    const C82 = 0.9324026732697752;
+    const C83 = 0.361421159977355;
+    const C84 = 0.6267738216194696;
+    const C85 = 0.7792012426405167;
+    const C86 = 0.6165206952507691;
+    const C87 = 0.7873387024194278;
+    const C88 = 0.14025323283629626;
+    const C89 = 0.9901156653032855;
+    const C90 = 0.927591935255724;
+    const C91 = 0.37359497005251635;
+    const C92 = 0.9226222591388232;
+    const C93 = 0.3857047665528313;
+    const C94 = 0.6061619312347947;
+    const C95 = 0.79534125576491;
+    const C96 = 0.1272810033739132;
+    const C97 = 0.991866697787626;
+    const C98 = 0.1142869649668464;
+    const C99 = 0.9934477790194444;
+    const C100 = 0.9174944964474913;
+    const C101 = 0.39774847452701106;
+    const C102 = 0.5956993044924334;
+    const C103 = 0.8032075314806449;
+    const C104 = 0.5851346077409155;
+    const C105 = 0.8109361817207843;
+    const C106 = 0.10127334407668342;
+    const C107 = 0.9948586380886109;
+    const C108 = 0.9122095257974677;
+    const C109 = 0.4097240303476953;
+    const C110 = 0.9067682527412662;
+    const C111 = 0.4216293820650445;
+    const C112 = 0.5744696511866426;
+    const C113 = 0.8185258822208966;
+    const C114 = 0.08824237052036951;
+    const C115 = 0.9960990332516871;
+    const C116 = 0.0751962770881399;
+    const C117 = 0.9971687519733476;
+    const C118 = 0.9011716096130131;
+    const C119 = 0.4334624897583309;
+    const C120 = 0.5637062622150166;
+    const C121 = 0.8259753325248732;
+    const C122 = 0.5528462850773279;
+    const C123 = 0.8332832562077542;
+    const C124 = 0.062137299160942724;
+    const C125 = 0.9980676109627962;
+    const C126 = 0.895420555368697;
+    const C127 = 0.4452213258854682;
+    const C128 = 0.8895160754218561;
+    const C129 = 0.4569038756304206;
+    const C130 = 0.5418915805747517;
+    const C131 = 0.840448401094438;
+    const C132 = 0.049067674327418015;
+    const C133 = 0.9987954562051724;
+    const C134 = 0.035989642000498374;
+    const C135 = 0.9993521629879409;
+    const C136 = 0.8834591814747328;
+    const C137 = 0.46850813724843143;
+    const C138 = 0.5308440257395095;
+    const C139 = 0.8474695394742344;
+    const C140 = 0.5197055135132492;
+    const C141 = 0.8543454683112272;
+    const C142 = 0.02290544303369714;
+    const C143 = 0.9997376359222604;
+    const C144 = 0.8772509113449243;
+    const C145 = 0.4800321224090111;
+    const C146 = 0.8708923287875567;
+    const C147 = 0.49147385653662823;
+    const C148 = 0.5084779524226998;
+    const C149 = 0.861075009450407;
+    const C150 = 0.009817319337149617;
+    const C151 = 0.999951808959328;
+    t19 = re[105];
+    t3 = im[105];
+    t17 = re[25];
+    t8 = im[25];
+    t2 = re[65];
+    t18 = im[65];
+    t7 = t17 + t2;
+    t6 = t8 + t18;
+    t12 = C0 * t7;
+    t10 = t19 - t12;
+    t11 = C0 * t6;
+    t1 = t3 - t11;
+    t9 = t17 - t2;
+    t14 = C1 * t9;
+    t16 = t8 - t18;
+    t15 = C1 * t16;
+    t0 = t19 + t7;
+    t13 = t3 + t6;
+    t4 = t10 + t15;
+    t5 = t1 - t14;
+    t12 = t10 - t15;
+    t11 = t1 + t14;
+    t17 = (-C2) * t0;
+    t2 = (-C3) * t13;
+    t9 = t17 + t2;
+    t8 = 0.0923510349517541 * t9;
+    y[329] = t8;
+    t18 = 0.01889140710216753 * t9;
+    y[390] = t18;
+    t16 = C3 * t0;
+    t19 = (-C2) * t13;
+    t7 = t16 + t19;
+    y[89] = 0;
+    t3 = (-0.09023540816501756) * t7;
+    y[150] = t3;
+    t6 = (-C4) * t4;
+    t10 = (-C5) * t5;
+    t15 = t6 + t10;
+    t1 = 0.09079298461985869 * t15;
+    y[249] = t1;
+    t14 = (-0.0006246989869539086) * t15;
+    y[470] = t14;
+    t17 = C5 * t4;
+    t2 = (-C4) * t5;
+    t8 = t17 + t2;
+    y[9] = 0;
+    t9 = (-0.09178389022262212) * t8;
+    y[230] = t9;
+    t18 = C6 * t12;
+    t0 = C7 * t11;
+    t13 = t18 + t0;
+    y[70] = 0;
+    t16 = (-0.09228962014198679) * t13;
+    y[169] = t16;
+    t19 = (-C7) * t12;
+    t7 = C6 * t11;
+    t3 = t19 + t7;
+    t6 = 0.09029545598424361 * t3;
+    y[310] = t6;
+    t10 = (-0.003709325825660647) * t3;
+    y[409] = t10;
+    t1 = re[24];
+    t15 = im[24];
+    t14 = re[64];
+    t4 = im[64];
+    t5 = re[104];
+    t17 = im[104];
+    t2 = t14 + t5;
+    t8 = t4 + t17;
+    t9 = C0 * t2;
+    t18 = t1 - t9;
+    t0 = C0 * t8;
+    t13 = t15 - t0;
+    t16 = t14 - t5;
+    t12 = C1 * t16;
+    t11 = t4 - t17;
+    t19 = C1 * t11;
+    t7 = t1 + t2;
+    t6 = t15 + t8;
+    t3 = t18 + t19;
+    t10 = t13 - t12;
+    t9 = t18 - t19;
+    t0 = t13 + t12;
+    t14 = C8 * t7;
+    t5 = C9 * t6;
+    t16 = t14 + t5;
+    y[72] = 0;
+    t4 = (-0.09220563580151571) * t16;
+    y[167] = t4;
+    t17 = (-C9) * t7;
+    t11 = C8 * t6;
+    t1 = t17 + t11;
+    t2 = 0.09037770046151931 * t1;
+    y[312] = t2;
+    t15 = (-0.0022183882598526463) * t1;
+    y[407] = t15;
+    t8 = (-C10) * t3;
+    t18 = (-C11) * t10;
+    t19 = t8 + t18;
+    t13 = 0.0919501276997701 * t19;
+    y[327] = t13;
+    t12 = 0.015573164605041014 * t19;
+    y[392] = t12;
+    t14 = C11 * t3;
+    t5 = (-C10) * t10;
+    t16 = t14 + t5;
+    y[87] = 0;
+    t4 = (-0.09062883915227195) * t16;
+    y[152] = t4;
+    t7 = (-C12) * t9;
+    t6 = (-C13) * t0;
+    t17 = t7 + t6;
+    t11 = 0.09088573803577533 * t17;
+    y[247] = t11;
+    t2 = (-0.0004130921772342458) * t17;
+    y[472] = t2;
+    t1 = C13 * t9;
+    t15 = (-C12) * t0;
+    t8 = t1 + t15;
+    y[7] = 0;
+    t18 = (-0.09169022019772878) * t8;
+    y[232] = t18;
+    t13 = re[63];
+    t19 = im[63];
+    t12 = re[103];
+    t3 = im[103];
+    t10 = re[23];
+    t14 = im[23];
+    t5 = t12 + t10;
+    t16 = t3 + t14;
+    t4 = C0 * t5;
+    t7 = t13 - t4;
+    t6 = C0 * t16;
+    t11 = t19 - t6;
+    t17 = t12 - t10;
+    t2 = C1 * t17;
+    t9 = t3 - t14;
+    t0 = C1 * t9;
+    t1 = t13 + t5;
+    t15 = t19 + t16;
+    t8 = t7 + t0;
+    t18 = t11 - t2;
+    t4 = t7 - t0;
+    t6 = t11 + t2;
+    t12 = (-C14) * t1;
+    t10 = (-C15) * t15;
+    t17 = t12 + t10;
+    t3 = 0.09098616076102845 * t17;
+    y[245] = t3;
+    t14 = (-0.0002536339642894417) * t17;
+    y[474] = t14;
+    t9 = C15 * t1;
+    t13 = (-C14) * t15;
+    t5 = t9 + t13;
+    y[5] = 0;
+    t19 = (-0.0915890203920188) * t5;
+    y[234] = t19;
+    t16 = C16 * t8;
+    t7 = C17 * t18;
+    t0 = t16 + t7;
+    y[74] = 0;
+    t11 = (-0.09209942840309658) * t0;
+    y[165] = t11;
+    t2 = (-C17) * t8;
+    t12 = C16 * t18;
+    t10 = t2 + t12;
+    t3 = 0.0904819223943538 * t10;
+    y[314] = t3;
+    t17 = (-0.0005378119076130155) * t10;
+    y[405] = t17;
+    t14 = (-C18) * t4;
+    t1 = (-C19) * t6;
+    t15 = t14 + t1;
+    t9 = 0.09160734286600784 * t15;
+    y[325] = t9;
+    t13 = 0.012478133323927637 * t15;
+    y[394] = t13;
+    t5 = C19 * t4;
+    t19 = (-C18) * t6;
+    t16 = t5 + t19;
+    y[85] = 0;
+    t7 = (-0.09096796253027797) * t16;
+    y[154] = t7;
+    t0 = re[102];
+    t11 = im[102];
+    t8 = re[22];
+    t18 = im[22];
+    t2 = re[62];
+    t12 = im[62];
+    t3 = t8 + t2;
+    t10 = t18 + t12;
+    t17 = C0 * t3;
+    t14 = t0 - t17;
+    t1 = C0 * t10;
+    t9 = t11 - t1;
+    t15 = t8 - t2;
+    t13 = C1 * t15;
+    t4 = t18 - t12;
+    t6 = C1 * t4;
+    t5 = t0 + t3;
+    t19 = t11 + t10;
+    t16 = t14 + t6;
+    t7 = t9 - t13;
+    t17 = t14 - t6;
+    t1 = t9 + t13;
+    t8 = (-C20) * t5;
+    t2 = (-C21) * t19;
+    t15 = t8 + t2;
+    t18 = 0.0913148375512127 * t15;
+    y[323] = t18;
+    t12 = 0.009610222402322096 * t15;
+    y[396] = t12;
+    t4 = C21 * t5;
+    t0 = (-C20) * t19;
+    t3 = t4 + t0;
+    y[83] = 0;
+    t11 = (-0.09125935671363042) * t3;
+    y[156] = t11;
+    t10 = (-C22) * t16;
+    t14 = (-C23) * t7;
+    t6 = t10 + t14;
+    t9 = 0.09109256795830346 * t6;
+    y[243] = t9;
+    t13 = (-0.00013998679778220064) * t6;
+    y[476] = t13;
+    t8 = C23 * t16;
+    t2 = (-C22) * t7;
+    t18 = t8 + t2;
+    y[3] = 0;
+    t15 = (-0.09148203327792692) * t18;
+    y[236] = t15;
+    t12 = C24 * t17;
+    t5 = C25 * t1;
+    t19 = t12 + t5;
+    y[76] = 0;
+    t4 = (-0.09196817316373651) * t19;
+    y[163] = t4;
+    t0 = (-C25) * t17;
+    t3 = C24 * t1;
+    t11 = t0 + t3;
+    t10 = 0.09061105648469268 * t11;
+    y[316] = t10;
+    t14 = 0.0013420618236381805 * t11;
+    y[403] = t14;
+    t9 = re[21];
+    t6 = im[21];
+    t13 = re[61];
+    t16 = im[61];
+    t7 = re[101];
+    t8 = im[101];
+    t2 = t13 + t7;
+    t18 = t16 + t8;
+    t15 = C0 * t2;
+    t12 = t9 - t15;
+    t5 = C0 * t18;
+    t19 = t6 - t5;
+    t4 = t13 - t7;
+    t17 = C1 * t4;
+    t1 = t16 - t8;
+    t0 = C1 * t1;
+    t3 = t9 + t2;
+    t10 = t6 + t18;
+    t11 = t12 + t0;
+    t14 = t19 - t17;
+    t15 = t12 - t0;
+    t5 = t19 + t17;
+    t13 = C26 * t3;
+    t7 = C27 * t10;
+    t4 = t13 + t7;
+    y[78] = 0;
+    t16 = (-0.09180855561597562) * t4;
+    y[161] = t16;
+    t8 = (-C27) * t3;
+    t1 = C26 * t10;
+    t9 = t8 + t1;
+    t2 = 0.0907685920709905 * t9;
+    y[318] = t2;
+    t6 = 0.0034302519777189918 * t9;
+    y[401] = t6;
+    t18 = (-C28) * t11;
+    t12 = (-C29) * t14;
+    t0 = t18 + t12;
+    t19 = 0.09106723054204843 * t0;
+    y[321] = t19;
+    t17 = 0.006970132619098952 * t0;
+    y[398] = t17;
+    t13 = C29 * t11;
+    t7 = (-C28) * t14;
+    t4 = t13 + t7;
+    y[81] = 0;
+    t16 = (-0.09150748610374818) * t4;
+    y[158] = t16;
+    t3 = (-C30) * t15;
+    t10 = (-C31) * t5;
+    t8 = t3 + t10;
+    t1 = 0.09120297040746775 * t8;
+    y[241] = t1;
+    t2 = (-6.461799509184562e-05) * t8;
+    y[478] = t2;
+    t9 = C31 * t15;
+    t6 = (-C30) * t5;
+    t18 = t9 + t6;
+    y[1] = 0;
+    t12 = (-0.0913712930193225) * t18;
+    y[238] = t12;
+    t19 = re[60];
+    t0 = im[60];
+    t17 = re[100];
+    t11 = im[100];
+    t14 = re[20];
+    t13 = im[20];
+    t7 = t17 + t14;
+    t4 = t11 + t13;
+    t16 = C0 * t7;
+    t3 = t19 - t16;
+    t10 = C0 * t4;
+    t1 = t0 - t10;
+    t8 = t17 - t14;
+    t2 = C1 * t8;
+    t15 = t11 - t13;
+    t5 = C1 * t15;
+    t9 = t19 + t7;
+    t6 = t0 + t4;
+    t18 = t3 + t5;
+    t12 = t1 - t2;
+    t16 = t3 - t5;
+    t10 = t1 + t2;
+    t17 = C32 * t9;
+    t14 = C33 * t6;
+    t8 = t17 + t14;
+    y[0] = 0;
+    t11 = (-0.09131522703664538) * t8;
+    y[239] = t11;
+    t13 = (-C33) * t9;
+    t15 = C32 * t6;
+    t19 = t13 + t15;
+    t7 = 0.09125896746650057 * t19;
+    y[240] = t7;
+    t0 = (-3.298655833518676e-05) * t19;
+    y[479] = t0;
+    t4 = C34 * t18;
+    t3 = C35 * t12;
+    t5 = t4 + t3;
+    y[80] = 0;
+    t1 = (-0.09161677326719576) * t5;
+    y[159] = t1;
+    t2 = (-C35) * t18;
+    t17 = C34 * t12;
+    t14 = t2 + t17;
+    t8 = 0.09095859891320969 * t14;
+    y[320] = t8;
+    t11 = 0.005734686242618052 * t14;
+    y[399] = t11;
+    t9 = (-C36) * t16;
+    t6 = (-C37) * t10;
+    t13 = t9 + t6;
+    t15 = 0.09085926593715277 * t13;
+    y[319] = t15;
+    t7 = 0.004554985403384171 * t13;
+    y[400] = t7;
+    t19 = C37 * t16;
+    t0 = (-C36) * t10;
+    t4 = t19 + t0;
+    y[79] = 0;
+    t3 = (-0.09171693439717513) * t4;
+    y[160] = t3;
+    t5 = re[99];
+    t1 = im[99];
+    t18 = re[19];
+    t12 = im[19];
+    t2 = re[59];
+    t17 = im[59];
+    t8 = t18 + t2;
+    t14 = t12 + t17;
+    t11 = C0 * t8;
+    t9 = t5 - t11;
+    t6 = C0 * t14;
+    t15 = t1 - t6;
+    t13 = t18 - t2;
+    t7 = C1 * t13;
+    t16 = t12 - t17;
+    t10 = C1 * t16;
+    t19 = t5 + t8;
+    t0 = t1 + t14;
+    t4 = t9 + t10;
+    t3 = t15 - t7;
+    t11 = t9 - t10;
+    t6 = t15 + t7;
+    t18 = (-C38) * t19;
+    t2 = (-C39) * t0;
+    t13 = t18 + t2;
+    t12 = 0.09068604919647034 * t13;
+    y[317] = t12;
+    t17 = 0.002359532354512745 * t13;
+    y[402] = t17;
+    t16 = C39 * t19;
+    t5 = (-C38) * t0;
+    t8 = t16 + t5;
+    y[77] = 0;
+    t1 = (-0.09189212020119278) * t8;
+    y[162] = t1;
+    t14 = C40 * t4;
+    t9 = C41 * t3;
+    t10 = t14 + t9;
+    y[2] = 0;
+    t15 = (-0.09142700285638952) * t10;
+    y[237] = t15;
+    t7 = (-C41) * t4;
+    t18 = C40 * t3;
+    t2 = t7 + t18;
+    t12 = 0.09114739708161547 * t2;
+    y[242] = t12;
+    t13 = (-9.808283613558938e-05) * t2;
+    y[477] = t13;
+    t17 = C42 * t11;
+    t19 = C43 * t6;
+    t0 = t17 + t19;
+    y[82] = 0;
+    t16 = (-0.09138855060144747) * t0;
+    y[157] = t16;
+    t5 = (-C43) * t11;
+    t8 = C42 * t6;
+    t1 = t5 + t8;
+    t14 = 0.09118574786983594 * t1;
+    y[322] = t14;
+    t9 = 0.008261818993155777 * t1;
+    y[397] = t9;
+    t10 = re[18];
+    t15 = im[18];
+    t4 = re[58];
+    t3 = im[58];
+    t7 = re[98];
+    t18 = im[98];
+    t12 = t4 + t7;
+    t2 = t3 + t18;
+    t13 = C0 * t12;
+    t17 = t10 - t13;
+    t19 = C0 * t2;
+    t0 = t15 - t19;
+    t16 = t4 - t7;
+    t11 = C1 * t16;
+    t6 = t3 - t18;
+    t5 = C1 * t6;
+    t8 = t10 + t12;
+    t14 = t15 + t2;
+    t1 = t17 + t5;
+    t9 = t0 - t11;
+    t13 = t17 - t5;
+    t19 = t0 + t11;
+    t4 = C44 * t8;
+    t7 = C45 * t14;
+    t16 = t4 + t7;
+    y[84] = 0;
+    t3 = (-0.09111936155223256) * t16;
+    y[155] = t3;
+    t18 = (-C45) * t8;
+    t6 = C44 * t14;
+    t10 = t18 + t6;
+    t12 = 0.09145513304059315 * t10;
+    y[324] = t12;
+    t15 = 0.011015645156279247 * t10;
+    y[395] = t15;
+    t2 = (-C46) * t1;
+    t17 = (-C47) * t9;
+    t5 = t2 + t17;
+    t0 = 0.09054319692897142 * t5;
+    y[315] = t0;
+    t11 = 0.00037670493957557815 * t5;
+    y[404] = t11;
+    t4 = C47 * t1;
+    t7 = (-C46) * t9;
+    t16 = t4 + t7;
+    y[75] = 0;
+    t3 = (-0.092037100698693) * t16;
+    y[164] = t3;
+    t8 = C48 * t13;
+    t14 = C49 * t19;
+    t18 = t8 + t14;
+    y[4] = 0;
+    t6 = (-0.09153613427519382) * t18;
+    y[235] = t6;
+    t12 = (-C49) * t13;
+    t10 = C48 * t19;
+    t15 = t12 + t10;
+    t2 = 0.09103872912395485 * t15;
+    y[244] = t2;
+    t17 = (-0.00019153837094621886) * t15;
+    y[475] = t17;
+    t0 = re[57];
+    t5 = im[57];
+    t11 = re[97];
+    t1 = im[97];
+    t9 = re[17];
+    t4 = im[17];
+    t7 = t11 + t9;
+    t16 = t1 + t4;
+    t3 = C0 * t7;
+    t8 = t0 - t3;
+    t14 = C0 * t16;
+    t18 = t5 - t14;
+    t6 = t11 - t9;
+    t13 = C1 * t6;
+    t19 = t1 - t4;
+    t12 = C1 * t19;
+    t10 = t0 + t7;
+    t2 = t5 + t16;
+    t15 = t8 + t12;
+    t17 = t18 - t13;
+    t3 = t8 - t12;
+    t14 = t18 + t13;
+    t11 = C50 * t10;
+    t9 = C51 * t2;
+    t6 = t11 + t9;
+    y[6] = 0;
+    t1 = (-0.09164045923745048) * t6;
+    y[233] = t1;
+    t4 = (-C51) * t10;
+    t19 = C50 * t2;
+    t0 = t4 + t19;
+    t7 = 0.09093508918086882 * t0;
+    y[246] = t7;
+    t5 = (-0.000327184801096971) * t0;
+    y[473] = t5;
+    t16 = C52 * t15;
+    t8 = C53 * t17;
+    t12 = t16 + t8;
+    y[86] = 0;
+    t18 = (-0.09080463044634797) * t12;
+    y[153] = t18;
+    t13 = (-C53) * t15;
+    t11 = C52 * t17;
+    t9 = t13 + t11;
+    t6 = 0.0917721188046362 * t9;
+    y[326] = t6;
+    t1 = 0.013997450622315546 * t9;
+    y[393] = t1;
+    t10 = (-C54) * t3;
+    t2 = (-C55) * t14;
+    t4 = t10 + t2;
+    t19 = 0.09042691251422759 * t4;
+    y[313] = t19;
+    t7 = (-0.0014024705571618484) * t4;
+    y[406] = t7;
+    t0 = C55 * t3;
+    t5 = (-C54) * t14;
+    t16 = t0 + t5;
+    y[73] = 0;
+    t8 = (-0.09215545573362552) * t16;
+    y[166] = t8;
+    t12 = re[96];
+    t18 = im[96];
+    t15 = re[16];
+    t17 = im[16];
+    t13 = re[56];
+    t11 = im[56];
+    t6 = t15 + t13;
+    t9 = t17 + t11;
+    t1 = C0 * t6;
+    t10 = t12 - t1;
+    t2 = C0 * t9;
+    t19 = t18 - t2;
+    t4 = t15 - t13;
+    t7 = C1 * t4;
+    t3 = t17 - t11;
+    t14 = C1 * t3;
+    t0 = t12 + t6;
+    t5 = t18 + t9;
+    t16 = t10 + t14;
+    t8 = t19 - t7;
+    t1 = t10 - t14;
+    t2 = t19 + t7;
+    t15 = (-C56) * t0;
+    t13 = (-C57) * t5;
+    t4 = t15 + t13;
+    t17 = 0.09033400449355983 * t4;
+    y[311] = t17;
+    t11 = (-0.0029869552982565196) * t4;
+    y[408] = t11;
+    t3 = C57 * t0;
+    t12 = (-C56) * t5;
+    t6 = t3 + t12;
+    y[71] = 0;
+    t18 = (-0.0922502371067524) * t6;
+    y[168] = t18;
+    t9 = C58 * t16;
+    t10 = C59 * t8;
+    t14 = t9 + t10;
+    y[8] = 0;
+    t19 = (-0.09173810125628178) * t14;
+    y[231] = t19;
+    t7 = (-C59) * t16;
+    t15 = C58 * t8;
+    t13 = t7 + t15;
+    t17 = 0.09083830185293602 * t13;
+    y[248] = t17;
+    t4 = (-0.0005120591773015618) * t13;
+    y[471] = t4;
+    t11 = C60 * t1;
+    t0 = C61 * t2;
+    t5 = t11 + t0;
+    y[88] = 0;
+    t3 = (-0.09043994865628115) * t5;
+    y[151] = t3;
+    t12 = (-C61) * t1;
+    t6 = C60 * t2;
+    t18 = t12 + t6;
+    t9 = 0.09214217231595667 * t18;
+    y[328] = t9;
+    t10 = 0.01720475415329727 * t18;
+    y[391] = t10;
+    t14 = re[15];
+    t19 = im[15];
+    t16 = re[55];
+    t8 = im[55];
+    t7 = re[95];
+    t15 = im[95];
+    t17 = t16 + t7;
+    t13 = t8 + t15;
+    t4 = C0 * t17;
+    t11 = t14 - t4;
+    t0 = C0 * t13;
+    t5 = t19 - t0;
+    t3 = t16 - t7;
+    t1 = C1 * t3;
+    t2 = t8 - t15;
+    t12 = C1 * t2;
+    t6 = t14 + t17;
+    t9 = t19 + t13;
+    t18 = t11 + t12;
+    t10 = t5 - t1;
+    t4 = t11 - t12;
+    t0 = t5 + t1;
+    t16 = C62 * t6;
+    t7 = C63 * t9;
+    t3 = t16 + t7;
+    t8 = 0.0004842994894200067 * t3;
+    y[90] = t8;
+    t15 = (-0.0899666037574483) * t3;
+    y[149] = t15;
+    t2 = (-C63) * t6;
+    t14 = C62 * t9;
+    t17 = t2 + t14;
+    t19 = 0.09251590088378046 * t17;
+    y[330] = t19;
+    t13 = 0.0206317319699406 * t17;
+    y[389] = t13;
+    t11 = (-C64) * t18;
+    t12 = (-C65) * t10;
+    t5 = t11 + t12;
+    t1 = 0.09026179621523889 * t5;
+    y[309] = t1;
+    t16 = (-0.004386750516852225) * t5;
+    y[410] = t16;
+    t7 = C65 * t18;
+    t8 = (-C64) * t10;
+    t3 = t7 + t8;
+    y[69] = 0;
+    t15 = (-0.0923240361122618) * t3;
+    y[170] = t15;
+    t6 = C66 * t4;
+    t9 = C67 * t0;
+    t2 = t6 + t9;
+    y[10] = 0;
+    t14 = (-0.09182744168049195) * t2;
+    y[229] = t14;
+    t19 = (-C67) * t4;
+    t17 = C66 * t0;
+    t13 = t19 + t17;
+    t11 = 0.0907499237790884 * t13;
+    y[250] = t11;
+    t12 = (-0.0007516557620710143) * t13;
+    y[469] = t12;
+    t1 = re[54];
+    t5 = im[54];
+    t16 = re[94];
+    t18 = im[94];
+    t10 = re[14];
+    t7 = im[14];
+    t8 = t16 + t10;
+    t3 = t18 + t7;
+    t15 = C0 * t8;
+    t6 = t1 - t15;
+    t9 = C0 * t3;
+    t2 = t5 - t9;
+    t14 = t16 - t10;
+    t4 = C1 * t14;
+    t0 = t18 - t7;
+    t19 = C1 * t0;
+    t17 = t1 + t8;
+    t11 = t5 + t3;
+    t13 = t6 + t19;
+    t12 = t2 - t4;
+    t15 = t6 - t19;
+    t9 = t2 + t4;
+    t16 = C68 * t17;
+    t10 = C69 * t11;
+    t14 = t16 + t10;
+    y[12] = 0;
+    t18 = (-0.09190729083812124) * t14;
+    y[227] = t18;
+    t7 = (-C69) * t17;
+    t0 = C68 * t11;
+    t1 = t7 + t0;
+    t8 = 0.09067108014326149 * t1;
+    y[252] = t8;
+    t5 = (-0.0010496923007052756) * t1;
+    y[467] = t5;
+    t3 = C70 * t13;
+    t6 = C71 * t12;
+    t19 = t3 + t6;
+    t2 = 0.0013335188911986337 * t19;
+    y[92] = t2;
+    t4 = (-0.08936775744636549) * t19;
+    y[147] = t4;
+    t16 = (-C71) * t13;
+    t10 = C70 * t12;
+    t14 = t16 + t10;
+    t18 = 0.0928855407162878 * t14;
+    y[332] = t18;
+    t17 = 0.024267268007375345 * t14;
+    y[387] = t17;
+    t11 = (-C72) * t15;
+    t7 = (-C73) * t9;
+    t0 = t11 + t7;
+    t8 = 0.09020799501323429 * t0;
+    y[307] = t8;
+    t1 = (-0.00561113289925892) * t0;
+    y[412] = t1;
+    t5 = C73 * t15;
+    t3 = (-C72) * t9;
+    t6 = t5 + t3;
+    y[67] = 0;
+    t2 = (-0.0923790993482425) * t6;
+    y[172] = t2;
+    t19 = re[93];
+    t4 = im[93];
+    t13 = re[13];
+    t12 = im[13];
+    t16 = re[53];
+    t10 = im[53];
+    t18 = t13 + t16;
+    t14 = t12 + t10;
+    t17 = C0 * t18;
+    t11 = t19 - t17;
+    t7 = C0 * t14;
+    t8 = t4 - t7;
+    t0 = t13 - t16;
+    t1 = C1 * t0;
+    t15 = t12 - t10;
+    t9 = C1 * t15;
+    t5 = t19 + t18;
+    t3 = t4 + t14;
+    t6 = t11 + t9;
+    t2 = t8 - t1;
+    t17 = t11 - t9;
+    t7 = t8 + t1;
+    t13 = (-C74) * t5;
+    t16 = (-C75) * t3;
+    t0 = t13 + t16;
+    t12 = 0.09017057297751993 * t0;
+    y[305] = t12;
+    t10 = (-0.006669565026439458) * t0;
+    y[414] = t10;
+    t15 = C75 * t5;
+    t19 = (-C74) * t3;
+    t18 = t15 + t19;
+    y[65] = 0;
+    t4 = (-0.09241743795296592) * t18;
+    y[174] = t4;
+    t14 = C76 * t6;
+    t11 = C77 * t2;
+    t9 = t14 + t11;
+    y[14] = 0;
+    t8 = (-0.09197681925364116) * t9;
+    y[225] = t8;
+    t1 = (-C77) * t6;
+    t13 = C76 * t2;
+    t16 = t1 + t13;
+    t12 = 0.0906025387804812 * t16;
+    y[254] = t12;
+    t0 = (-0.0014078128227328595) * t16;
+    y[465] = t0;
+    t10 = C78 * t17;
+    t5 = C79 * t7;
+    t3 = t10 + t5;
+    t15 = 0.0024660855829648633 * t3;
+    y[94] = t15;
+    t19 = (-0.0886290112993696) * t3;
+    y[145] = t19;
+    t18 = (-C79) * t17;
+    t4 = C78 * t7;
+    t14 = t18 + t4;
+    t11 = 0.0932431206828331 * t14;
+    y[334] = t11;
+    t9 = 0.028096241762516693 * t14;
+    y[385] = t9;
+    t8 = re[12];
+    t6 = im[12];
+    t2 = re[52];
+    t1 = im[52];
+    t13 = re[92];
+    t12 = im[92];
+    t16 = t2 + t13;
+    t0 = t1 + t12;
+    t10 = C0 * t16;
+    t5 = t8 - t10;
+    t15 = C0 * t0;
+    t3 = t6 - t15;
+    t19 = t2 - t13;
+    t17 = C1 * t19;
+    t7 = t1 - t12;
+    t18 = C1 * t7;
+    t4 = t8 + t16;
+    t11 = t6 + t0;
+    t14 = t5 + t18;
+    t9 = t3 - t17;
+    t10 = t5 - t18;
+    t15 = t3 + t17;
+    t2 = C80 * t4;
+    t13 = C81 * t11;
+    t19 = t2 + t13;
+    t1 = 0.004039078536152446 * t19;
+    y[96] = t1;
+    t12 = (-0.08769929472088642) * t19;
+    y[143] = t12;
+    t7 = (-C81) * t4;
+    t8 = C80 * t11;
+    t16 = t7 + t8;
+    t6 = 0.093543358396319 * t16;
+    y[336] = t6;
+    t0 = 0.032098107276850515 * t16;
+    y[383] = t0;
+    t5 = (-C82) * t14;
+    t18 = (-C83) * t9;
+    t3 = t5 + t18;
+    t17 = 0.09014764694307614 * t3;
+    y[303] = t17;
+    t2 = (-0.007570478703505297) * t3;
+    y[416] = t2;
+    t13 = C83 * t14;
+    t1 = (-C82) * t9;
+    t19 = t13 + t1;
+    y[63] = 0;
+    t12 = (-0.09244094123272491) * t19;
+    y[176] = t12;
+    t4 = C84 * t10;
+    t11 = C85 * t15;
+    t7 = t4 + t11;
+    y[16] = 0;
+    t8 = (-0.0920356604410908) * t7;
+    y[223] = t8;
+    t6 = (-C85) * t10;
+    t16 = C84 * t15;
+    t0 = t6 + t16;
+    t5 = 0.09054461383114908 * t0;
+    y[256] = t5;
+    t18 = (-0.0018254876761969407) * t0;
+    y[463] = t18;
+    t17 = re[51];
+    t3 = im[51];
+    t2 = re[91];
+    t14 = im[91];
+    t9 = re[11];
+    t13 = im[11];
+    t1 = t2 + t9;
+    t19 = t14 + t13;
+    t12 = C0 * t1;
+    t4 = t17 - t12;
+    t11 = C0 * t19;
+    t7 = t3 - t11;
+    t8 = t2 - t9;
+    t10 = C1 * t8;
+    t15 = t14 - t13;
+    t6 = C1 * t15;
+    t16 = t17 + t1;
+    t5 = t3 + t19;
+    t0 = t4 + t6;
+    t18 = t7 - t10;
+    t12 = t4 - t6;
+    t11 = t7 + t10;
+    t2 = C86 * t16;
+    t9 = C87 * t5;
+    t8 = t2 + t9;
+    y[18] = 0;
+    t14 = (-0.09208383616627881) * t8;
+    y[221] = t14;
+    t13 = (-C87) * t16;
+    t15 = C86 * t5;
+    t17 = t13 + t15;
+    t1 = 0.09049724338466482 * t17;
+    y[258] = t1;
+    t3 = (-0.0022998927704061803) * t17;
+    y[461] = t3;
+    t19 = C88 * t0;
+    t4 = C89 * t18;
+    t6 = t19 + t4;
+    t7 = 0.006095025443000334 * t6;
+    y[98] = t7;
+    t10 = (-0.08653541118025766) * t6;
+    y[141] = t10;
+    t2 = (-C89) * t0;
+    t9 = C88 * t18;
+    t8 = t2 + t9;
+    t14 = 0.0937466223587032 * t8;
+    y[338] = t14;
+    t16 = 0.03624772740142347 * t8;
+    y[381] = t16;
+    t5 = (-C90) * t12;
+    t13 = (-C91) * t11;
+    t15 = t5 + t13;
+    t1 = 0.09013738926953407 * t15;
+    y[301] = t1;
+    t17 = (-0.008322144470384114) * t15;
+    y[418] = t17;
+    t3 = C91 * t12;
+    t19 = (-C90) * t11;
+    t4 = t3 + t19;
+    y[61] = 0;
+    t7 = (-0.09245146105146788) * t4;
+    y[178] = t7;
+    t6 = re[90];
+    t10 = im[90];
+    t0 = re[10];
+    t18 = im[10];
+    t2 = re[50];
+    t9 = im[50];
+    t14 = t0 + t2;
+    t8 = t18 + t9;
+    t16 = C0 * t14;
+    t5 = t6 - t16;
+    t13 = C0 * t8;
+    t1 = t10 - t13;
+    t15 = t0 - t2;
+    t17 = C1 * t15;
+    t12 = t18 - t9;
+    t11 = C1 * t12;
+    t3 = t6 + t14;
+    t19 = t10 + t8;
+    t4 = t5 + t11;
+    t7 = t1 - t17;
+    t16 = t5 - t11;
+    t13 = t1 + t17;
+    t0 = (-C92) * t3;
+    t2 = (-C93) * t19;
+    t15 = t0 + t2;
+    t18 = 0.09013792870924264 * t15;
+    y[299] = t18;
+    t9 = (-0.008931638736934335) * t15;
+    y[420] = t9;
+    t12 = C93 * t3;
+    t6 = (-C92) * t19;
+    t14 = t12 + t6;
+    y[59] = 0;
+    t10 = (-0.09245090776618706) * t14;
+    y[180] = t10;
+    t8 = C94 * t4;
+    t5 = C95 * t7;
+    t11 = t8 + t5;
+    y[20] = 0;
+    t1 = (-0.09212183238639414) * t11;
+    y[219] = t1;
+    t17 = (-C95) * t4;
+    t0 = C94 * t7;
+    t2 = t17 + t0;
+    t18 = 0.09045991723634143 * t2;
+    y[260] = t18;
+    t15 = (-0.0028260339569157957) * t2;
+    y[459] = t15;
+    t9 = C96 * t16;
+    t3 = C97 * t13;
+    t19 = t9 + t3;
+    t12 = 0.00865644952865837 * t19;
+    y[100] = t12;
+    t6 = (-0.08509375534963323) * t19;
+    y[139] = t6;
+    t14 = (-C97) * t16;
+    t10 = C96 * t13;
+    t8 = t14 + t10;
+    t5 = 0.09380974732326158 * t8;
+    y[340] = t5;
+    t11 = 0.04051425980544644 * t8;
+    y[379] = t11;
+    t1 = re[9];
+    t4 = im[9];
+    t7 = re[49];
+    t17 = im[49];
+    t0 = re[89];
+    t18 = im[89];
+    t2 = t7 + t0;
+    t15 = t17 + t18;
+    t9 = C0 * t2;
+    t3 = t1 - t9;
+    t12 = C0 * t15;
+    t19 = t4 - t12;
+    t6 = t7 - t0;
+    t16 = C1 * t6;
+    t13 = t17 - t18;
+    t14 = C1 * t13;
+    t10 = t1 + t2;
+    t5 = t4 + t15;
+    t8 = t3 + t14;
+    t11 = t19 - t16;
+    t9 = t3 - t14;
+    t12 = t19 + t16;
+    t7 = C98 * t10;
+    t0 = C99 * t5;
+    t6 = t7 + t0;
+    t17 = 0.011723299109835212 * t6;
+    y[102] = t17;
+    t18 = (-0.08333366254031559) * t6;
+    y[137] = t18;
+    t13 = (-C99) * t10;
+    t1 = C98 * t5;
+    t2 = t13 + t1;
+    t4 = 0.09368831734586838 * t2;
+    y[342] = t4;
+    t15 = 0.04486302931753237 * t2;
+    y[377] = t15;
+    t3 = (-C100) * t8;
+    t14 = (-C101) * t11;
+    t19 = t3 + t14;
+    t16 = 0.09014737254320589 * t19;
+    y[297] = t16;
+    t7 = (-0.00940585792015134) * t19;
+    y[422] = t7;
+    t0 = C101 * t8;
+    t17 = (-C100) * t11;
+    t6 = t0 + t17;
+    y[57] = 0;
+    t18 = (-0.09244122261399611) * t6;
+    y[182] = t18;
+    t10 = C102 * t9;
+    t5 = C103 * t12;
+    t13 = t10 + t5;
+    y[22] = 0;
+    t1 = (-0.09215050828134111) * t13;
+    y[217] = t1;
+    t4 = (-C103) * t9;
+    t2 = C102 * t12;
+    t15 = t4 + t2;
+    t3 = 0.0904317674286848 * t15;
+    y[262] = t3;
+    t14 = (-0.0033972510637467705) * t15;
+    y[457] = t14;
+    t16 = re[48];
+    t19 = im[48];
+    t7 = re[88];
+    t8 = im[88];
+    t11 = re[8];
+    t0 = im[8];
+    t17 = t7 + t11;
+    t6 = t8 + t0;
+    t18 = C0 * t17;
+    t10 = t16 - t18;
+    t5 = C0 * t6;
+    t13 = t19 - t5;
+    t1 = t7 - t11;
+    t9 = C1 * t1;
+    t12 = t8 - t0;
+    t4 = C1 * t12;
+    t2 = t16 + t17;
+    t3 = t19 + t6;
+    t15 = t10 + t4;
+    t14 = t13 - t9;
+    t18 = t10 - t4;
+    t5 = t13 + t9;
+    t7 = C104 * t2;
+    t11 = C105 * t3;
+    t1 = t7 + t11;
+    y[24] = 0;
+    t8 = (-0.09217112540390858) * t1;
+    y[215] = t8;
+    t0 = (-C105) * t2;
+    t12 = C104 * t3;
+    t16 = t0 + t12;
+    t17 = 0.09041153937109188 * t16;
+    y[264] = t17;
+    t19 = (-0.004004964884675951) * t16;
+    y[455] = t19;
+    t6 = C106 * t15;
+    t10 = C107 * t14;
+    t4 = t6 + t10;
+    t13 = 0.01527325089115992 * t4;
+    y[104] = t13;
+    t9 = (-0.08121961706425723) * t4;
+    y[135] = t9;
+    t7 = (-C107) * t15;
+    t11 = C106 * t14;
+    t1 = t7 + t11;
+    t8 = 0.0933402251764112 * t1;
+    y[344] = t8;
+    t2 = 0.04925447720164721 * t1;
+    y[375] = t2;
+    t3 = (-C108) * t18;
+    t0 = (-C109) * t5;
+    t12 = t3 + t0;
+    t17 = 0.09016381559190259 * t12;
+    y[295] = t17;
+    t16 = (-0.009751032959974511) * t12;
+    y[424] = t16;
+    t19 = C109 * t18;
+    t6 = (-C108) * t5;
+    t10 = t19 + t6;
+    y[55] = 0;
+    t13 = (-0.09242436423777228) * t10;
+    y[184] = t13;
+    t4 = re[87];
+    t9 = im[87];
+    t15 = re[7];
+    t14 = im[7];
+    t7 = re[47];
+    t11 = im[47];
+    t8 = t15 + t7;
+    t1 = t14 + t11;
+    t2 = C0 * t8;
+    t3 = t4 - t2;
+    t0 = C0 * t1;
+    t17 = t9 - t0;
+    t12 = t15 - t7;
+    t16 = C1 * t12;
+    t18 = t14 - t11;
+    t5 = C1 * t18;
+    t19 = t4 + t8;
+    t6 = t9 + t1;
+    t10 = t3 + t5;
+    t13 = t17 - t16;
+    t2 = t3 - t5;
+    t0 = t17 + t16;
+    t15 = (-C110) * t19;
+    t7 = (-C111) * t6;
+    t12 = t15 + t7;
+    t14 = 0.09018536723388516 * t12;
+    y[293] = t14;
+    t11 = (-0.009973048940772533) * t12;
+    y[426] = t11;
+    t18 = C111 * t19;
+    t4 = (-C110) * t6;
+    t8 = t18 + t4;
+    y[53] = 0;
+    t9 = (-0.09240227754156406) * t8;
+    y[186] = t9;
+    t1 = C112 * t10;
+    t3 = C113 * t13;
+    t5 = t1 + t3;
+    y[26] = 0;
+    t17 = (-0.09218520351877914) * t5;
+    y[213] = t17;
+    t16 = (-C113) * t10;
+    t15 = C112 * t13;
+    t7 = t16 + t15;
+    t14 = 0.09039773212233286 * t7;
+    y[266] = t14;
+    t12 = (-0.004639507057936654) * t7;
+    y[453] = t12;
+    t11 = C114 * t2;
+    t19 = C115 * t0;
+    t6 = t11 + t19;
+    t18 = 0.019263488602330115 * t6;
+    y[106] = t18;
+    t4 = (-0.07872584358434256) * t6;
+    y[133] = t4;
+    t8 = (-C115) * t2;
+    t9 = C114 * t0;
+    t1 = t8 + t9;
+    t3 = 0.09272581162425671 * t1;
+    y[346] = t3;
+    t5 = 0.05364633647126045 * t1;
+    y[373] = t5;
+    t17 = re[6];
+    t10 = im[6];
+    t13 = re[46];
+    t16 = im[46];
+    t15 = re[86];
+    t14 = im[86];
+    t7 = t13 + t15;
+    t12 = t16 + t14;
+    t11 = C0 * t7;
+    t19 = t17 - t11;
+    t18 = C0 * t12;
+    t6 = t10 - t18;
+    t4 = t13 - t15;
+    t2 = C1 * t4;
+    t0 = t16 - t14;
+    t8 = C1 * t0;
+    t9 = t17 + t7;
+    t3 = t10 + t12;
+    t1 = t19 + t8;
+    t5 = t6 - t2;
+    t11 = t19 - t8;
+    t18 = t6 + t2;
+    t13 = C116 * t9;
+    t15 = C117 * t3;
+    t4 = t13 + t15;
+    t16 = 0.02363453610164699 * t4;
+    y[108] = t16;
+    t14 = (-0.07583656737509746) * t4;
+    y[131] = t14;
+    t0 = (-C117) * t9;
+    t17 = C116 * t3;
+    t7 = t0 + t17;
+    t10 = 0.09181163628090575 * t7;
+    y[348] = t10;
+    t12 = 0.057993691384658534 * t7;
+    y[371] = t12;
+    t19 = (-C118) * t1;
+    t8 = (-C119) * t5;
+    t6 = t19 + t8;
+    t2 = 0.09021020255745729 * t6;
+    y[291] = t2;
+    t13 = (-0.010077888829067619) * t6;
+    y[428] = t13;
+    t15 = C119 * t1;
+    t16 = (-C118) * t5;
+    t4 = t15 + t16;
+    y[51] = 0;
+    t14 = (-0.09237683872869709) * t4;
+    y[188] = t14;
+    t9 = C120 * t11;
+    t3 = C121 * t18;
+    t0 = t9 + t3;
+    y[28] = 0;
+    t17 = (-0.09219451731446794) * t0;
+    y[211] = t17;
+    t10 = (-C121) * t11;
+    t7 = C120 * t18;
+    t12 = t10 + t7;
+    t19 = 0.09038859984383908 * t12;
+    y[268] = t19;
+    t8 = (-0.005289771942594677) * t12;
+    y[451] = t8;
+    t2 = re[45];
+    t6 = im[45];
+    t13 = re[85];
+    t1 = im[85];
+    t5 = re[5];
+    t15 = im[5];
+    t16 = t13 + t5;
+    t4 = t1 + t15;
+    t14 = C0 * t16;
+    t9 = t2 - t14;
+    t3 = C0 * t4;
+    t0 = t6 - t3;
+    t17 = t13 - t5;
+    t11 = C1 * t17;
+    t18 = t1 - t15;
+    t10 = C1 * t18;
+    t7 = t2 + t16;
+    t19 = t6 + t4;
+    t12 = t9 + t10;
+    t8 = t0 - t11;
+    t14 = t9 - t10;
+    t3 = t0 + t11;
+    t13 = C122 * t7;
+    t5 = C123 * t19;
+    t17 = t13 + t5;
+    y[30] = 0;
+    t1 = (-0.09220089774016076) * t17;
+    y[209] = t1;
+    t15 = (-C123) * t7;
+    t18 = C122 * t19;
+    t2 = t15 + t18;
+    t16 = 0.09038234483158948 * t2;
+    y[270] = t16;
+    t6 = (-0.005944349081379847) * t2;
+    y[449] = t6;
+    t4 = C124 * t12;
+    t9 = C125 * t8;
+    t10 = t4 + t9;
+    t0 = 0.02831385891142267 * t10;
+    y[110] = t0;
+    t11 = (-0.07254851328183894) * t10;
+    y[129] = t11;
+    t13 = (-C125) * t12;
+    t5 = C124 * t8;
+    t17 = t13 + t5;
+    t1 = 0.09057075485758738 * t17;
+    y[350] = t1;
+    t7 = 0.06225077715882855 * t17;
+    y[369] = t7;
+    t19 = (-C126) * t14;
+    t15 = (-C127) * t3;
+    t18 = t19 + t15;
+    t16 = 0.09023662379888507 * t18;
+    y[289] = t16;
+    t2 = (-0.010071177893659302) * t18;
+    y[430] = t2;
+    t6 = C127 * t14;
+    t4 = (-C126) * t3;
+    t9 = t6 + t4;
+    y[49] = 0;
+    t0 = (-0.09234979083333456) * t9;
+    y[190] = t0;
+    t10 = re[84];
+    t11 = im[84];
+    t12 = re[4];
+    t8 = im[4];
+    t13 = re[44];
+    t5 = im[44];
+    t1 = t12 + t13;
+    t17 = t8 + t5;
+    t7 = C0 * t1;
+    t19 = t10 - t7;
+    t15 = C0 * t17;
+    t16 = t11 - t15;
+    t18 = t12 - t13;
+    t2 = C1 * t18;
+    t14 = t8 - t5;
+    t3 = C1 * t14;
+    t6 = t10 + t1;
+    t4 = t11 + t17;
+    t9 = t19 + t3;
+    t0 = t16 - t2;
+    t7 = t19 - t3;
+    t15 = t16 + t2;
+    t12 = (-C128) * t6;
+    t13 = (-C129) * t4;
+    t18 = t12 + t13;
+    t8 = 0.090263085231818 * t18;
+    y[287] = t8;
+    t5 = (-0.00995939719517774) * t18;
+    y[432] = t5;
+    t14 = C129 * t6;
+    t10 = (-C128) * t4;
+    t1 = t14 + t10;
+    y[47] = 0;
+    t11 = (-0.09232271766394046) * t1;
+    y[192] = t11;
+    t17 = C130 * t9;
+    t19 = C131 * t0;
+    t3 = t17 + t19;
+    y[32] = 0;
+    t16 = (-0.09220618981254637) * t3;
+    y[207] = t16;
+    t2 = (-C131) * t9;
+    t12 = C130 * t0;
+    t13 = t2 + t12;
+    t8 = 0.09037715743677144 * t13;
+    y[272] = t8;
+    t18 = (-0.006590424026111684) * t13;
+    y[447] = t18;
+    t5 = C132 * t7;
+    t6 = C133 * t15;
+    t4 = t5 + t6;
+    t14 = 0.03322042000362499 * t4;
+    y[112] = t14;
+    t10 = (-0.06887202171480471) * t4;
+    y[127] = t10;
+    t1 = (-C133) * t7;
+    t11 = C132 * t15;
+    t17 = t1 + t11;
+    t19 = 0.08898332462644315 * t17;
+    y[352] = t19;
+    t3 = 0.066370981076243 * t17;
+    y[367] = t3;
+    t16 = re[3];
+    t9 = im[3];
+    t0 = re[43];
+    t2 = im[43];
+    t12 = re[83];
+    t8 = im[83];
+    t13 = t0 + t12;
+    t18 = t2 + t8;
+    t5 = C0 * t13;
+    t6 = t16 - t5;
+    t14 = C0 * t18;
+    t4 = t9 - t14;
+    t10 = t0 - t12;
+    t7 = C1 * t10;
+    t15 = t2 - t8;
+    t1 = C1 * t15;
+    t11 = t16 + t13;
+    t19 = t9 + t18;
+    t17 = t6 + t1;
+    t3 = t4 - t7;
+    t5 = t6 - t1;
+    t14 = t4 + t7;
+    t0 = C134 * t11;
+    t12 = C135 * t19;
+    t10 = t0 + t12;
+    t2 = 0.03826800503743858 * t10;
+    y[114] = t2;
+    t8 = (-0.06483018405848807) * t10;
+    y[125] = t8;
+    t15 = (-C135) * t11;
+    t16 = C134 * t19;
+    t13 = t15 + t16;
+    t9 = 0.08703876860421736 * t13;
+    y[354] = t9;
+    t18 = 0.07030922939059663 * t13;
+    y[365] = t18;
+    t6 = (-C136) * t17;
+    t1 = (-C137) * t3;
+    t4 = t6 + t1;
+    t7 = 0.09028824521108123 * t4;
+    y[285] = t7;
+    t0 = (-0.009748913661253328) * t4;
+    y[434] = t0;
+    t12 = C137 * t17;
+    t2 = (-C136) * t3;
+    t10 = t12 + t2;
+    y[45] = 0;
+    t8 = (-0.0922969907527959) * t10;
+    y[194] = t8;
+    t11 = C138 * t5;
+    t19 = C139 * t14;
+    t15 = t11 + t19;
+    y[34] = 0;
+    t16 = (-0.09221204331965764) * t15;
+    y[205] = t16;
+    t9 = (-C139) * t5;
+    t13 = C138 * t14;
+    t18 = t9 + t13;
+    t6 = 0.09037142040595954 * t18;
+    y[274] = t6;
+    t1 = (-0.007215922854075747) * t18;
+    y[445] = t1;
+    t7 = re[42];
+    t4 = im[42];
+    t0 = re[82];
+    t17 = im[82];
+    t3 = re[2];
+    t12 = im[2];
+    t2 = t0 + t3;
+    t10 = t17 + t12;
+    t8 = C0 * t2;
+    t11 = t7 - t8;
+    t19 = C0 * t10;
+    t15 = t4 - t19;
+    t16 = t0 - t3;
+    t5 = C1 * t16;
+    t14 = t17 - t12;
+    t9 = C1 * t14;
+    t13 = t7 + t2;
+    t6 = t4 + t10;
+    t18 = t11 + t9;
+    t1 = t15 - t5;
+    t8 = t11 - t9;
+    t19 = t15 + t5;
+    t0 = C140 * t13;
+    t3 = C141 * t6;
+    t16 = t0 + t3;
+    y[36] = 0;
+    t17 = (-0.092219873210068) * t16;
+    y[203] = t17;
+    t12 = (-C141) * t13;
+    t14 = C140 * t6;
+    t7 = t12 + t14;
+    t2 = 0.09036374745767432 * t7;
+    y[276] = t2;
+    t4 = (-0.00780808135679578) * t7;
+    y[443] = t4;
+    t10 = C142 * t18;
+    t11 = C143 * t1;
+    t9 = t10 + t11;
+    t15 = 0.04336930039134643 * t9;
+    y[116] = t15;
+    t5 = (-0.06045909869529394) * t9;
+    y[123] = t5;
+    t0 = (-C143) * t18;
+    t3 = C142 * t1;
+    t16 = t0 + t3;
+    t17 = 0.08473525892773065 * t16;
+    y[356] = t17;
+    t13 = 0.07402277467890597 * t16;
+    y[363] = t13;
+    t6 = (-C144) * t8;
+    t12 = (-C145) * t19;
+    t14 = t6 + t12;
+    t2 = 0.09031100536051363 * t14;
+    y[283] = t2;
+    t7 = (-0.0094478602997263) * t14;
+    y[436] = t7;
+    t4 = C145 * t8;
+    t10 = (-C144) * t19;
+    t11 = t4 + t10;
+    y[43] = 0;
+    t15 = (-0.09227373009598769) * t11;
+    y[196] = t15;
+    t9 = re[81];
+    t5 = im[81];
+    t18 = re[1];
+    t1 = im[1];
+    t0 = re[41];
+    t3 = im[41];
+    t17 = t18 + t0;
+    t16 = t1 + t3;
+    t13 = C0 * t17;
+    t6 = t9 - t13;
+    t12 = C0 * t16;
+    t2 = t5 - t12;
+    t14 = t18 - t0;
+    t7 = C1 * t14;
+    t8 = t1 - t3;
+    t19 = C1 * t8;
+    t4 = t9 + t17;
+    t10 = t5 + t16;
+    t11 = t6 + t19;
+    t15 = t2 - t7;
+    t13 = t6 - t19;
+    t12 = t2 + t7;
+    t18 = (-C146) * t4;
+    t0 = (-C147) * t10;
+    t14 = t18 + t0;
+    t1 = 0.0903305936699626 * t14;
+    y[281] = t1;
+    t3 = (-0.009064007974917266) * t14;
+    y[438] = t3;
+    t8 = C147 * t4;
+    t9 = (-C146) * t10;
+    t17 = t8 + t9;
+    y[41] = 0;
+    t5 = (-0.09225372041481877) * t17;
+    y[198] = t5;
+    t16 = C148 * t11;
+    t6 = C149 * t15;
+    t19 = t16 + t6;
+    y[38] = 0;
+    t2 = (-0.09223068106750755) * t19;
+    y[201] = t2;
+    t7 = (-C149) * t11;
+    t18 = C148 * t15;
+    t0 = t7 + t18;
+    t1 = 0.09035315837290428 * t0;
+    y[278] = t1;
+    t14 = (-0.008354677907082433) * t0;
+    y[441] = t14;
+    t3 = C150 * t13;
+    t4 = C151 * t12;
+    t10 = t3 + t4;
+    t8 = 0.04843858972584554 * t10;
+    y[118] = t8;
+    t9 = (-0.055808255064714284) * t10;
+    y[121] = t9;
+    t17 = (-C151) * t13;
+    t5 = C150 * t12;
+    t16 = t17 + t5;
+    t6 = 0.08207914857879066 * t16;
+    y[358] = t6;
+    t19 = 0.07747210014149988 * t16;
+    y[361] = t19;
+}
+
+//
+//  Public functions.
+//
+
+/**
+ *  Apply LD-IMDCT transform (prebuilt for window W10_240, input pruned).
+ * 
+ *  Note(s):
+ *    [1] y[n] = w[n] * SUM(X[k] * cos(PI / 240 * (n + 120.5) * (k + 0.5))), where
+ *        w[n] = sqrt(2 / 240) * W10_240[479 - n].
+ *    [2] X[k] shall be zero for all k >= 160 (not checked).
+ *    [3] The size of all arrays will not be checked.
+ * 
+ *  @param {Number[]} X 
+ *    - The input block (240 points, only the first 160 points are used).
+ *  @param {Number[]} y 
+ *    - The array that would contain the output block (480 points).
+ *  @param {Number[]} re 
+ *    - The scratch buffer (real part, 120 points).
+ *  @param {Number[]} im 
+ *    - The scratch buffer (imaginary part, 120 points).
+ */
+function ApplyWindowedIMDCT_W10_240_K160(X, y, re, im) {
+    ApplyWindowedIMDCT_W10_240_K160_Part1(X, y, re, im);
+    ApplyWindowedIMDCT_W10_240_K160_Part2(X, y, re, im);
+    ApplyWindowedIMDCT_W10_240_K160_Part3(X, y, re, im);
+    ApplyWindowedIMDCT_W10_240_K160_Part4(X, y, re, im);
+}
+
+//  Export public APIs.
+module.exports = {
+    "ApplyWindowedIMDCT_W10_240_K160": ApplyWindowedIMDCT_W10_240_K160
+};
\ No newline at end of file
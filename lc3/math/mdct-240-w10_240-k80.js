@@ -0,0 +1,5558 @@
+//
+//  Copyright 2021 - 2023 XiaoJSoft Studio. All rights reserved.
+//  Use of this source code is governed by a BSD-style license that can be
+//  found in the LICENSE.md file.
+//
+
+//
+//  Note(s):
+//    [1] This file is generated automatically by a MDCT compiler, which locates 
+//        at "./../../dev/mdct-generator/" directory.
+//        Do NOT modify this file manually.
+//
+
+//
+//  Private functions.
+//
+
+/**
+ *  Part 1 of ApplyWindowedIMDCT_W10_240_K80().
+ * 
+ *  @param {Number[]} X 
+ *    - The input block (240 points, only the first 80 points are used).
+ *  @param {Number[]} y 
+ *    - The array that would contain the output block (480 points).
+ *  @param {Number[]} re 
+ *    - The scratch buffer (real part, 120 points).
+ *  @param {Number[]} im 
+ *    - The scratch buffer (imaginary part, 120 points).
+ */
+function ApplyWindowedIMDCT_W10_240_K80_Part1(X, y, re, im) {
+    let t0, t1, t10, t11, t12, t13, t14, t15, t16, t17, t18, t2, t3, t4, t5, t6, t7, t8, t9;
+    const C0 = 0.9807852804032304;
+    const C1 = 0.19509032201612825;
+    const C2 = 0.9238795325112867;
+    const C3 = 0.3826834323650898;
+    const C4 = 0.7071067811865476;
+    const C5 = 0.9510565162951535;
+    const C6 = 0.3090169943749474;
+    const C7 = 0.8724960070727972;
+    const C8 = 0.4886212414969549;
+    const C9 = 0.8910065241883679;
+    const C10 = 0.45399049973954675;
+    const C11 = 0.9624552364536473;
+    const C12 = 0.27144044986507426;
+    const C13 = 0.996917333733128;
+    const C14 = 0.07845909572784494;
+    const C15 = 0.9930684569549263;
+    const C16 = 0.11753739745783764;
+    const C17 = 0.9381913359224842;
+    const C18 = 0.34611705707749296;
+    const C19 = 0.9876883405951378;
+    const C20 = 0.15643446504023087;
+    const C21 = 0.9992290362407229;
+    const C22 = 0.03925981575906861;
+    const C23 = 0.9723699203976766;
+    const C24 = 0.2334453638559054;
+    const C25 = 0.9081431738250813;
+    const C26 = 0.41865973753742813;
+    const C27 = 0.5590169943749475;
+    const C28 = 0.25;
+    const C29 = 0.5877852522924731;
+    t0 = X[0];
+    t1 = X[30];
+    t2 = C0 * t1;
+    t1 = (-C1) * t1;
+    t3 = X[60];
+    t4 = C2 * t3;
+    t3 = (-C3) * t3;
+    t5 = X[59];
+    t6 = C2 * t5;
+    t5 = C3 * t5;
+    t7 = X[29];
+    t8 = C0 * t7;
+    t7 = C1 * t7;
+    t9 = t4 + t6;
+    t10 = t3 + t5;
+    t4 = t4 - t6;
+    t6 = t3 - t5;
+    t3 = t0 + t9;
+    t5 = t0 + t6;
+    t11 = -t4;
+    t9 = t0 - t9;
+    t12 = -t10;
+    t0 = t0 - t6;
+    t6 = t2 + t8;
+    t13 = t1 + t7;
+    t14 = t2 - t7;
+    t15 = t1 + t8;
+    t16 = t2 - t8;
+    t17 = t1 - t7;
+    t2 = t2 + t7;
+    t7 = t1 - t8;
+    t1 = t14 + t15;
+    t8 = t14 - t15;
+    t14 = C4 * t1;
+    t15 = (-C4) * t8;
+    t1 = t2 - t7;
+    t8 = t2 + t7;
+    t2 = (-C4) * t1;
+    t7 = (-C4) * t8;
+    t1 = t3 - t6;
+    t8 = t10 - t13;
+    t3 = t3 + t6;
+    t6 = t10 + t13;
+    t13 = t5 - t14;
+    t11 = t11 - t15;
+    t5 = t5 + t14;
+    t14 = t15 - t4;
+    t15 = t9 - t17;
+    t10 = t16 - t10;
+    t9 = t9 + t17;
+    t17 = t12 - t16;
+    t12 = t0 - t2;
+    t16 = t4 - t7;
+    t0 = t0 + t2;
+    t2 = t4 + t7;
+    re[0] = t3;
+    im[0] = t6;
+    re[15] = t5;
+    im[15] = t14;
+    re[30] = t9;
+    im[30] = t17;
+    re[45] = t0;
+    im[45] = t2;
+    re[60] = t1;
+    im[60] = t8;
+    re[75] = t13;
+    im[75] = t11;
+    re[90] = t15;
+    im[90] = t10;
+    re[105] = t12;
+    im[105] = t16;
+    t4 = X[48];
+    t7 = C5 * t4;
+    t3 = (-C6) * t4;
+    t6 = X[78];
+    t5 = C7 * t6;
+    t14 = (-C8) * t6;
+    t9 = X[71];
+    t17 = C9 * t9;
+    t0 = C10 * t9;
+    t2 = X[41];
+    t1 = C11 * t2;
+    t8 = C12 * t2;
+    t13 = X[11];
+    t11 = C13 * t13;
+    t15 = C14 * t13;
+    t10 = X[18];
+    t12 = C15 * t10;
+    t16 = (-C16) * t10;
+    t4 = t7 + t17;
+    t6 = t3 + t0;
+    t9 = t7 - t17;
+    t2 = t3 - t0;
+    t13 = t4 + t11;
+    t10 = t6 + t15;
+    t7 = t9 - t15;
+    t17 = t2 + t11;
+    t3 = t4 - t11;
+    t0 = t6 - t15;
+    t4 = t9 + t15;
+    t6 = t2 - t11;
+    t9 = t5 + t1;
+    t15 = t14 + t8;
+    t2 = t5 - t1;
+    t11 = t14 - t8;
+    t5 = t9 + t12;
+    t1 = t15 + t16;
+    t14 = t2 - t16;
+    t8 = t11 + t12;
+    t9 = t9 - t12;
+    t15 = t15 - t16;
+    t2 = t2 + t16;
+    t16 = t11 - t12;
+    t11 = t14 + t8;
+    t12 = t14 - t8;
+    t14 = C4 * t11;
+    t8 = (-C4) * t12;
+    t11 = t2 - t16;
+    t12 = t2 + t16;
+    t2 = (-C4) * t11;
+    t16 = (-C4) * t12;
+    t11 = t13 - t5;
+    t12 = t10 - t1;
+    t13 = t13 + t5;
+    t5 = t10 + t1;
+    t10 = t7 - t14;
+    t1 = t17 - t8;
+    t7 = t7 + t14;
+    t14 = t17 + t8;
+    t17 = t3 - t15;
+    t8 = t0 + t9;
+    t3 = t3 + t15;
+    t15 = t0 - t9;
+    t0 = t4 - t2;
+    t9 = t6 - t16;
+    t4 = t4 + t2;
+    t2 = t6 + t16;
+    re[24] = t13;
+    im[24] = t5;
+    re[39] = t7;
+    im[39] = t14;
+    re[54] = t3;
+    im[54] = t15;
+    re[69] = t4;
+    im[69] = t2;
+    re[84] = t11;
+    im[84] = t12;
+    re[99] = t10;
+    im[99] = t1;
+    re[114] = t17;
+    im[114] = t8;
+    re[9] = t0;
+    im[9] = t9;
+    t6 = X[53];
+    t16 = C17 * t6;
+    t13 = C18 * t6;
+    t5 = X[23];
+    t7 = C19 * t5;
+    t14 = C20 * t5;
+    t3 = X[6];
+    t15 = C21 * t3;
+    t4 = (-C22) * t3;
+    t2 = X[36];
+    t11 = C23 * t2;
+    t12 = (-C24) * t2;
+    t10 = X[66];
+    t1 = C25 * t10;
+    t17 = (-C26) * t10;
+    t8 = -t7;
+    t0 = -t14;
+    t9 = t7 + t11;
+    t6 = t14 + t12;
+    t5 = t8 - t12;
+    t3 = t11 - t14;
+    t2 = t7 - t11;
+    t10 = t14 - t12;
+    t8 = t12 - t7;
+    t14 = t0 - t11;
+    t12 = t16 + t1;
+    t7 = t13 + t17;
+    t0 = -t15;
+    t11 = -t4;
+    t16 = t16 - t1;
+    t1 = t13 - t17;
+    t13 = t15 + t12;
+    t17 = t4 + t7;
+    t18 = t1 - t15;
+    t11 = t11 - t16;
+    t15 = t15 - t12;
+    t12 = t4 - t7;
+    t7 = t0 - t1;
+    t0 = t16 - t4;
+    t1 = t18 + t11;
+    t16 = t18 - t11;
+    t4 = C4 * t1;
+    t18 = (-C4) * t16;
+    t11 = t7 - t0;
+    t1 = t7 + t0;
+    t16 = (-C4) * t11;
+    t7 = (-C4) * t1;
+    t0 = t9 - t13;
+    t11 = t6 - t17;
+    t1 = t9 + t13;
+    t9 = t6 + t17;
+    t13 = t5 - t4;
+    t6 = t3 - t18;
+    t17 = t5 + t4;
+    t5 = t3 + t18;
+    t4 = t2 - t12;
+    t3 = t10 + t15;
+    t18 = t2 + t12;
+    t2 = t10 - t15;
+    t12 = t8 - t16;
+    t10 = t14 - t7;
+    t15 = t8 + t16;
+    t8 = t14 + t7;
+    re[48] = t1;
+    im[48] = t9;
+    re[63] = t17;
+    im[63] = t5;
+    re[78] = t18;
+    im[78] = t2;
+    re[93] = t15;
+    im[93] = t8;
+    re[108] = t0;
+    im[108] = t11;
+    re[3] = t13;
+    im[3] = t6;
+    re[18] = t4;
+    im[18] = t3;
+    re[33] = t12;
+    im[33] = t10;
+    t16 = X[65];
+    t14 = C25 * t16;
+    t7 = C26 * t16;
+    t1 = X[35];
+    t9 = C23 * t1;
+    t17 = C24 * t1;
+    t5 = X[5];
+    t18 = C21 * t5;
+    t2 = C22 * t5;
+    t15 = X[24];
+    t8 = C19 * t15;
+    t0 = (-C20) * t15;
+    t11 = X[54];
+    t13 = C17 * t11;
+    t6 = (-C18) * t11;
+    t4 = -t8;
+    t3 = -t0;
+    t12 = t8 + t9;
+    t10 = t0 + t17;
+    t16 = t17 - t8;
+    t1 = t3 - t9;
+    t5 = t8 - t9;
+    t15 = t0 - t17;
+    t11 = t4 - t17;
+    t3 = t9 - t0;
+    t8 = t14 + t13;
+    t4 = t7 + t6;
+    t17 = t14 - t13;
+    t9 = t7 - t6;
+    t0 = t8 + t18;
+    t14 = t4 + t2;
+    t13 = t17 + t2;
+    t7 = t9 - t18;
+    t6 = t8 - t18;
+    t8 = t4 - t2;
+    t4 = t17 - t2;
+    t17 = t9 + t18;
+    t2 = t13 + t7;
+    t9 = t13 - t7;
+    t18 = C4 * t2;
+    t13 = (-C4) * t9;
+    t7 = t4 - t17;
+    t2 = t4 + t17;
+    t9 = (-C4) * t7;
+    t4 = (-C4) * t2;
+    t17 = t12 - t0;
+    t7 = t10 - t14;
+    t2 = t12 + t0;
+    t12 = t10 + t14;
+    t0 = t16 - t18;
+    t10 = t1 - t13;
+    t14 = t16 + t18;
+    t16 = t1 + t13;
+    t18 = t5 - t8;
+    t1 = t15 + t6;
+    t13 = t5 + t8;
+    t5 = t15 - t6;
+    t8 = t11 - t9;
+    t15 = t3 - t4;
+    t6 = t11 + t9;
+    t11 = t3 + t4;
+    re[72] = t2;
+    im[72] = t12;
+    re[87] = t14;
+    im[87] = t16;
+    re[102] = t13;
+    im[102] = t5;
+    re[117] = t6;
+    im[117] = t11;
+    re[12] = t17;
+    im[12] = t7;
+    re[27] = t0;
+    im[27] = t10;
+    re[42] = t18;
+    im[42] = t1;
+    re[57] = t8;
+    im[57] = t15;
+    t9 = X[47];
+    t3 = C5 * t9;
+    t4 = C6 * t9;
+    t2 = X[17];
+    t12 = C15 * t2;
+    t14 = C16 * t2;
+    t16 = X[12];
+    t13 = C13 * t16;
+    t5 = (-C14) * t16;
+    t6 = X[42];
+    t11 = C11 * t6;
+    t17 = (-C12) * t6;
+    t7 = X[72];
+    t0 = C9 * t7;
+    t10 = (-C10) * t7;
+    t18 = X[77];
+    t1 = C7 * t18;
+    t8 = C8 * t18;
+    t15 = t3 + t0;
+    t9 = t4 + t10;
+    t2 = t3 - t0;
+    t16 = t4 - t10;
+    t6 = t15 + t13;
+    t7 = t9 + t5;
+    t18 = t2 + t5;
+    t3 = t16 - t13;
+    t0 = t15 - t13;
+    t4 = t9 - t5;
+    t10 = t2 - t5;
+    t15 = t16 + t13;
+    t9 = t11 + t1;
+    t2 = t17 + t8;
+    t5 = t11 - t1;
+    t16 = t17 - t8;
+    t13 = t12 + t9;
+    t11 = t14 + t2;
+    t1 = t12 + t16;
+    t17 = t14 - t5;
+    t8 = t12 - t9;
+    t9 = t14 - t2;
+    t2 = t12 - t16;
+    t12 = t14 + t5;
+    t16 = t1 + t17;
+    t14 = t1 - t17;
+    t5 = C4 * t16;
+    t1 = (-C4) * t14;
+    t17 = t2 - t12;
+    t16 = t2 + t12;
+    t14 = (-C4) * t17;
+    t2 = (-C4) * t16;
+    t12 = t6 - t13;
+    t17 = t7 - t11;
+    t16 = t6 + t13;
+    t6 = t7 + t11;
+    t13 = t18 - t5;
+    t7 = t3 - t1;
+    t11 = t18 + t5;
+    t18 = t3 + t1;
+    t5 = t0 - t9;
+    t3 = t4 + t8;
+    t1 = t0 + t9;
+    t0 = t4 - t8;
+    t9 = t10 - t14;
+    t4 = t15 - t2;
+    t8 = t10 + t14;
+    t10 = t15 + t2;
+    re[96] = t16;
+    im[96] = t6;
+    re[111] = t11;
+    im[111] = t18;
+    re[6] = t1;
+    im[6] = t0;
+    re[21] = t8;
+    im[21] = t10;
+    re[36] = t12;
+    im[36] = t17;
+    re[51] = t13;
+    im[51] = t7;
+    re[66] = t5;
+    im[66] = t3;
+    re[81] = t9;
+    im[81] = t4;
+    t14 = re[0];
+    t15 = im[0];
+    t2 = re[24];
+    t16 = im[24];
+    t6 = re[48];
+    t11 = im[48];
+    t18 = re[72];
+    t1 = im[72];
+    t0 = re[96];
+    t8 = im[96];
+    t10 = t2 + t0;
+    t12 = t16 + t8;
+    t17 = t6 + t18;
+    t13 = t11 + t1;
+    t7 = t2 - t0;
+    t5 = t16 - t8;
+    t3 = t6 - t18;
+    t9 = t11 - t1;
+    t4 = t10 + t17;
+    t2 = t12 + t13;
+    t0 = t10 - t17;
+    t16 = C27 * t0;
+    t8 = t12 - t13;
+    t6 = C27 * t8;
+    t18 = C28 * t4;
+    t11 = t14 - t18;
+    t1 = C28 * t2;
+    t10 = t15 - t1;
+    t17 = t11 + t16;
+    t0 = t10 + t6;
+    t12 = t11 - t16;
+    t13 = t10 - t6;
+    t8 = C5 * t7;
+    t18 = C29 * t3;
+    t1 = t8 + t18;
+    t11 = C5 * t5;
+    t16 = C29 * t9;
+    t10 = t11 + t16;
+    t6 = C29 * t7;
+    t8 = C5 * t3;
+    t18 = t6 - t8;
+    t11 = C29 * t5;
+    t16 = C5 * t9;
+    t7 = t11 - t16;
+    t3 = t14 + t4;
+    t6 = t15 + t2;
+    t8 = t17 + t10;
+    t5 = t0 - t1;
+    t9 = t12 + t7;
+    t11 = t13 - t18;
+    t16 = t12 - t7;
+    t14 = t13 + t18;
+    t4 = t17 - t10;
+    t15 = t0 + t1;
+    re[0] = t3;
+    im[0] = t6;
+    re[24] = t8;
+    im[24] = t5;
+    re[48] = t9;
+    im[48] = t11;
+    re[72] = t16;
+    im[72] = t14;
+    re[96] = t4;
+    im[96] = t15;
+    t2 = re[15];
+    t12 = im[15];
+    t7 = re[39];
+    t13 = im[39];
+    t18 = re[63];
+    t17 = im[63];
+    t10 = re[87];
+    t0 = im[87];
+    t1 = re[111];
+    t3 = im[111];
+    t6 = t7 + t1;
+    t8 = t13 + t3;
+    t5 = t18 + t10;
+    t9 = t17 + t0;
+    t11 = t7 - t1;
+    t16 = t13 - t3;
+    t14 = t18 - t10;
+    t4 = t17 - t0;
+    t15 = t6 + t5;
+    t7 = t8 + t9;
+    t1 = t6 - t5;
+    t13 = C27 * t1;
+    t3 = t8 - t9;
+    t18 = C27 * t3;
+    t10 = C28 * t15;
+    t17 = t2 - t10;
+    t0 = C28 * t7;
+    t6 = t12 - t0;
+    t5 = t17 + t13;
+    t1 = t6 + t18;
+    t8 = t17 - t13;
+    t9 = t6 - t18;
+    t3 = C5 * t11;
+    t10 = C29 * t14;
+    t0 = t3 + t10;
+    t17 = C5 * t16;
+    t13 = C29 * t4;
+    t6 = t17 + t13;
+    t18 = C29 * t11;
+    t3 = C5 * t14;
+    t10 = t18 - t3;
+    t17 = C29 * t16;
+    t13 = C5 * t4;
+    t11 = t17 - t13;
+    t14 = t2 + t15;
+    t18 = t12 + t7;
+    t3 = t5 + t6;
+    t16 = t1 - t0;
+    t4 = t8 + t11;
+    t17 = t9 - t10;
+    t13 = t8 - t11;
+    t2 = t9 + t10;
+    t15 = t5 - t6;
+    t12 = t1 + t0;
+    re[15] = t14;
+    im[15] = t18;
+    re[39] = t3;
+    im[39] = t16;
+    re[63] = t4;
+    im[63] = t17;
+    re[87] = t13;
+    im[87] = t2;
+    re[111] = t15;
+    im[111] = t12;
+    t7 = re[30];
+    t8 = im[30];
+    t11 = re[54];
+    t9 = im[54];
+    t10 = re[78];
+    t5 = im[78];
+    t6 = re[102];
+    t1 = im[102];
+    t0 = re[6];
+    t14 = im[6];
+    t18 = t11 + t0;
+    t3 = t9 + t14;
+    t16 = t10 + t6;
+    t4 = t5 + t1;
+    t17 = t11 - t0;
+    t13 = t9 - t14;
+    t2 = t10 - t6;
+    t15 = t5 - t1;
+    t12 = t18 + t16;
+    t11 = t3 + t4;
+    t0 = t18 - t16;
+    t9 = C27 * t0;
+    t14 = t3 - t4;
+    t10 = C27 * t14;
+    t6 = C28 * t12;
+    t5 = t7 - t6;
+    t1 = C28 * t11;
+    t18 = t8 - t1;
+    t16 = t5 + t9;
+    t0 = t18 + t10;
+    t3 = t5 - t9;
+    t4 = t18 - t10;
+    t14 = C5 * t17;
+    t6 = C29 * t2;
+    t1 = t14 + t6;
+    t5 = C5 * t13;
+    t9 = C29 * t15;
+    t18 = t5 + t9;
+    t10 = C29 * t17;
+    t14 = C5 * t2;
+    t6 = t10 - t14;
+    t5 = C29 * t13;
+    t9 = C5 * t15;
+    t17 = t5 - t9;
+    t2 = t7 + t12;
+    t10 = t8 + t11;
+    t14 = t16 + t18;
+    t13 = t0 - t1;
+    t15 = t3 + t17;
+    t5 = t4 - t6;
+    t9 = t3 - t17;
+    t7 = t4 + t6;
+    t12 = t16 - t18;
+    t8 = t0 + t1;
+    re[30] = t2;
+    im[30] = t10;
+    re[54] = t14;
+    im[54] = t13;
+    re[78] = t15;
+    im[78] = t5;
+    re[102] = t9;
+    im[102] = t7;
+    re[6] = t12;
+    im[6] = t8;
+    t11 = re[45];
+    t3 = im[45];
+    t17 = re[69];
+    t4 = im[69];
+    t6 = re[93];
+    t16 = im[93];
+    t18 = re[117];
+    t0 = im[117];
+    t1 = re[21];
+    t2 = im[21];
+    t10 = t17 + t1;
+    t14 = t4 + t2;
+    t13 = t6 + t18;
+    t15 = t16 + t0;
+    t5 = t17 - t1;
+    t9 = t4 - t2;
+    t7 = t6 - t18;
+    t12 = t16 - t0;
+    t8 = t10 + t13;
+    t17 = t14 + t15;
+    t1 = t10 - t13;
+    t4 = C27 * t1;
+    t2 = t14 - t15;
+    t6 = C27 * t2;
+    t18 = C28 * t8;
+    t16 = t11 - t18;
+    t0 = C28 * t17;
+    t10 = t3 - t0;
+    t13 = t16 + t4;
+    t1 = t10 + t6;
+    t14 = t16 - t4;
+    t15 = t10 - t6;
+    t2 = C5 * t5;
+    t18 = C29 * t7;
+    t0 = t2 + t18;
+    t16 = C5 * t9;
+    t4 = C29 * t12;
+    t10 = t16 + t4;
+    t6 = C29 * t5;
+    t2 = C5 * t7;
+    t18 = t6 - t2;
+    t16 = C29 * t9;
+    t4 = C5 * t12;
+    t5 = t16 - t4;
+    t7 = t11 + t8;
+    t6 = t3 + t17;
+    t2 = t13 + t10;
+    t9 = t1 - t0;
+    t12 = t14 + t5;
+    t16 = t15 - t18;
+    t4 = t14 - t5;
+    t11 = t15 + t18;
+    t8 = t13 - t10;
+    t3 = t1 + t0;
+    re[45] = t7;
+    im[45] = t6;
+    re[69] = t2;
+    im[69] = t9;
+    re[93] = t12;
+    im[93] = t16;
+    re[117] = t4;
+    im[117] = t11;
+    re[21] = t8;
+    im[21] = t3;
+    t17 = re[60];
+    t14 = im[60];
+    t5 = re[84];
+    t15 = im[84];
+    t18 = re[108];
+    t13 = im[108];
+    t10 = re[12];
+    t1 = im[12];
+    t0 = re[36];
+    t7 = im[36];
+    t6 = t5 + t0;
+    t2 = t15 + t7;
+    t9 = t18 + t10;
+    t12 = t13 + t1;
+    t16 = t5 - t0;
+    t4 = t15 - t7;
+    t11 = t18 - t10;
+    t8 = t13 - t1;
+    t3 = t6 + t9;
+    t5 = t2 + t12;
+    t0 = t6 - t9;
+    t15 = C27 * t0;
+    t7 = t2 - t12;
+    t18 = C27 * t7;
+    t10 = C28 * t3;
+    t13 = t17 - t10;
+    t1 = C28 * t5;
+    t6 = t14 - t1;
+    t9 = t13 + t15;
+    t0 = t6 + t18;
+    t2 = t13 - t15;
+    t12 = t6 - t18;
+    t7 = C5 * t16;
+    t10 = C29 * t11;
+    t1 = t7 + t10;
+    t13 = C5 * t4;
+    t15 = C29 * t8;
+    t6 = t13 + t15;
+    t18 = C29 * t16;
+    t7 = C5 * t11;
+    t10 = t18 - t7;
+    t13 = C29 * t4;
+    t15 = C5 * t8;
+    t16 = t13 - t15;
+    t11 = t17 + t3;
+    t18 = t14 + t5;
+    t7 = t9 + t6;
+    t4 = t0 - t1;
+    t8 = t2 + t16;
+    t13 = t12 - t10;
+    t15 = t2 - t16;
+    t17 = t12 + t10;
+    t3 = t9 - t6;
+    t14 = t0 + t1;
+    re[60] = t11;
+    im[60] = t18;
+    re[84] = t7;
+    im[84] = t4;
+    re[108] = t8;
+    im[108] = t13;
+    re[12] = t15;
+    im[12] = t17;
+    re[36] = t3;
+    im[36] = t14;
+    t5 = re[75];
+    t2 = im[75];
+    t16 = re[99];
+    t12 = im[99];
+    t10 = re[3];
+    t9 = im[3];
+    t6 = re[27];
+    t0 = im[27];
+    t1 = re[51];
+    t11 = im[51];
+    t18 = t16 + t1;
+    t7 = t12 + t11;
+    t4 = t10 + t6;
+    t8 = t9 + t0;
+    t13 = t16 - t1;
+    t15 = t12 - t11;
+    t17 = t10 - t6;
+    t3 = t9 - t0;
+    t14 = t18 + t4;
+    t16 = t7 + t8;
+    t1 = t18 - t4;
+    t12 = C27 * t1;
+    t11 = t7 - t8;
+    t10 = C27 * t11;
+    t6 = C28 * t14;
+    t9 = t5 - t6;
+    t0 = C28 * t16;
+    t18 = t2 - t0;
+    t4 = t9 + t12;
+    t1 = t18 + t10;
+    t7 = t9 - t12;
+    t8 = t18 - t10;
+    t11 = C5 * t13;
+    t6 = C29 * t17;
+    t0 = t11 + t6;
+    t9 = C5 * t15;
+    t12 = C29 * t3;
+    t18 = t9 + t12;
+    t10 = C29 * t13;
+    t11 = C5 * t17;
+    t6 = t10 - t11;
+    t9 = C29 * t15;
+    t12 = C5 * t3;
+    t13 = t9 - t12;
+    t17 = t5 + t14;
+    t10 = t2 + t16;
+    t11 = t4 + t18;
+    t15 = t1 - t0;
+    t3 = t7 + t13;
+    t9 = t8 - t6;
+    t12 = t7 - t13;
+    t5 = t8 + t6;
+    t14 = t4 - t18;
+    t2 = t1 + t0;
+    re[75] = t17;
+    im[75] = t10;
+    re[99] = t11;
+    im[99] = t15;
+    re[3] = t3;
+    im[3] = t9;
+    re[27] = t12;
+    im[27] = t5;
+    re[51] = t14;
+    im[51] = t2;
+    t16 = re[90];
+    t7 = im[90];
+    t13 = re[114];
+    t8 = im[114];
+    t6 = re[18];
+    t4 = im[18];
+    t18 = re[42];
+    t1 = im[42];
+    t0 = re[66];
+    t17 = im[66];
+    t10 = t13 + t0;
+    t11 = t8 + t17;
+    t15 = t6 + t18;
+    t3 = t4 + t1;
+    t9 = t13 - t0;
+    t12 = t8 - t17;
+    t5 = t6 - t18;
+    t14 = t4 - t1;
+    t2 = t10 + t15;
+    t13 = t11 + t3;
+    t0 = t10 - t15;
+    t8 = C27 * t0;
+    t17 = t11 - t3;
+    t6 = C27 * t17;
+    t18 = C28 * t2;
+    t4 = t16 - t18;
+    t1 = C28 * t13;
+    t10 = t7 - t1;
+    t15 = t4 + t8;
+    t0 = t10 + t6;
+    t11 = t4 - t8;
+    t3 = t10 - t6;
+    t17 = C5 * t9;
+    t18 = C29 * t5;
+    t1 = t17 + t18;
+    t4 = C5 * t12;
+    t8 = C29 * t14;
+    t10 = t4 + t8;
+    t6 = C29 * t9;
+    t17 = C5 * t5;
+    t18 = t6 - t17;
+    t4 = C29 * t12;
+    t8 = C5 * t14;
+    t9 = t4 - t8;
+    t5 = t16 + t2;
+    t6 = t7 + t13;
+    t17 = t15 + t10;
+    t12 = t0 - t1;
+    t14 = t11 + t9;
+    t4 = t3 - t18;
+    t8 = t11 - t9;
+    t16 = t3 + t18;
+    t2 = t15 - t10;
+    t7 = t0 + t1;
+    re[90] = t5;
+    im[90] = t6;
+    re[114] = t17;
+    im[114] = t12;
+    re[18] = t14;
+    im[18] = t4;
+    re[42] = t8;
+    im[42] = t16;
+    re[66] = t2;
+    im[66] = t7;
+    t13 = re[105];
+    t11 = im[105];
+    t9 = re[9];
+    t3 = im[9];
+    t18 = re[33];
+    t15 = im[33];
+    t10 = re[57];
+    t0 = im[57];
+    t1 = re[81];
+    t5 = im[81];
+    t6 = t9 + t1;
+    t17 = t3 + t5;
+    t12 = t18 + t10;
+    t14 = t15 + t0;
+    t4 = t9 - t1;
+    t8 = t3 - t5;
+    t16 = t18 - t10;
+    t2 = t15 - t0;
+    t7 = t6 + t12;
+    t9 = t17 + t14;
+    t1 = t6 - t12;
+    t3 = C27 * t1;
+    t5 = t17 - t14;
+    t18 = C27 * t5;
+    t10 = C28 * t7;
+    t15 = t13 - t10;
+    t0 = C28 * t9;
+    t6 = t11 - t0;
+    t12 = t15 + t3;
+    t1 = t6 + t18;
+    t17 = t15 - t3;
+    t14 = t6 - t18;
+    t5 = C5 * t4;
+    t10 = C29 * t16;
+    t0 = t5 + t10;
+    t15 = C5 * t8;
+    t3 = C29 * t2;
+    t6 = t15 + t3;
+    t18 = C29 * t4;
+    t5 = C5 * t16;
+    t10 = t18 - t5;
+    t15 = C29 * t8;
+    t3 = C5 * t2;
+    t4 = t15 - t3;
+    t16 = t13 + t7;
+    t18 = t11 + t9;
+    t5 = t12 + t6;
+    t8 = t1 - t0;
+    t2 = t17 + t4;
+    t15 = t14 - t10;
+    t3 = t17 - t4;
+    t13 = t14 + t10;
+    t7 = t12 - t6;
+    t11 = t1 + t0;
+    re[105] = t16;
+    im[105] = t18;
+    re[9] = t5;
+    im[9] = t8;
+    re[33] = t2;
+    im[33] = t15;
+    re[57] = t3;
+    im[57] = t13;
+    re[81] = t7;
+    im[81] = t11;
+    t9 = X[69];
+    t17 = 0.8968727415326883 * t9;
+    t4 = 0.4422886902190013 * t9;
+    t14 = X[39];
+    t10 = 0.9659258262890683 * t14;
+    t12 = 0.25881904510252074 * t14;
+    t6 = X[9];
+    t1 = 0.9978589232386035 * t6;
+    t0 = 0.06540312923014306 * t6;
+    t16 = X[20];
+    t18 = 0.9914448613738104 * t16;
+    t5 = (-0.13052619222005157) * t16;
+    t8 = X[50];
+    t2 = 0.9469301294951057 * t8;
+    t15 = (-0.3214394653031616) * t8;
+    t3 = -t10;
+    t13 = -t12;
+    t7 = t10 + t18;
+    t11 = t12 + t5;
+    t9 = t3 - t5;
+    t14 = t18 - t12;
+    t6 = t10 - t18;
+    t16 = t12 - t5;
+    t8 = t5 - t10;
+    t3 = t13 - t18;
+    t12 = t17 + t2;
+    t5 = t4 + t15;
+    t10 = -t1;
+    t13 = -t0;
+    t18 = t17 - t2;
+    t17 = t4 - t15;
+    t2 = t1 + t12;
+    t4 = t0 + t5;
+    t15 = t17 - t1;
+    t13 = t13 - t18;
+    t1 = t1 - t12;
+    t12 = t0 - t5;
+    t5 = t10 - t17;
+    t10 = t18 - t0;
+    t17 = t15 + t13;
+    t18 = t15 - t13;
+    t0 = C4 * t17;
+    t15 = (-C4) * t18;
+    t13 = t5 - t10;
+    t17 = t5 + t10;
+    t18 = (-C4) * t13;
+    t5 = (-C4) * t17;
+    t10 = t7 - t2;
+    t13 = t11 - t4;
+    t17 = t7 + t2;
+    t7 = t11 + t4;
+    t2 = t9 - t0;
+    t11 = t14 - t15;
+    t4 = t9 + t0;
+    t9 = t14 + t15;
+    t0 = t6 - t12;
+    t14 = t16 + t1;
+    t15 = t6 + t12;
+    t6 = t16 - t1;
+    t12 = t8 - t18;
+    t16 = t3 - t5;
+    t1 = t8 + t18;
+    t8 = t3 + t5;
+    re[40] = t17;
+    im[40] = t7;
+    re[55] = t4;
+    im[55] = t9;
+    re[70] = t15;
+    im[70] = t6;
+    re[85] = t1;
+    im[85] = t8;
+    re[100] = t10;
+    im[100] = t13;
+    re[115] = t2;
+    im[115] = t11;
+    re[10] = t0;
+    im[10] = t14;
+    re[25] = t12;
+    im[25] = t16;
+    t18 = X[51];
+    t3 = 0.9426414910921784 * t18;
+    t5 = 0.33380685923377096 * t18;
+    t17 = X[21];
+    t7 = 0.9896513868196702 * t17;
+    t4 = 0.1434926219911793 * t17;
+    t9 = X[8];
+    t15 = 0.9986295347545738 * t9;
+    t6 = (-0.05233595624294383) * t9;
+    t1 = X[38];
+    t8 = 0.9692309097067544 * t1;
+    t10 = (-0.24615329302899303) * t1;
+    t13 = X[68];
+    t2 = 0.9025852843498606 * t13;
+    t11 = (-0.4305110968082951) * t13;
+    t0 = t3 + t2;
+    t14 = t5 + t11;
+    t12 = -t15;
+    t16 = -t6;
+    t18 = t3 - t2;
+    t17 = t5 - t11;
+    t9 = t15 + t0;
+    t1 = t6 + t14;
+    t13 = t17 - t15;
+    t3 = t16 - t18;
+    t2 = t15 - t0;
+    t5 = t6 - t14;
+    t11 = t12 - t17;
+    t16 = t18 - t6;
+    t15 = -t8;
+    t0 = -t10;
+    t14 = t8 + t7;
+    t12 = t10 + t4;
+    t17 = t4 - t8;
+    t18 = t0 - t7;
+    t6 = t8 - t7;
+    t0 = t10 - t4;
+    t8 = t15 - t4;
+    t15 = t7 - t10;
+    t4 = t17 + t18;
+    t7 = t17 - t18;
+    t10 = C4 * t4;
+    t17 = (-C4) * t7;
+    t18 = t8 - t15;
+    t4 = t8 + t15;
+    t7 = (-C4) * t18;
+    t8 = (-C4) * t4;
+    t15 = t9 - t14;
+    t18 = t1 - t12;
+    t4 = t9 + t14;
+    t9 = t1 + t12;
+    t14 = t13 - t10;
+    t1 = t3 - t17;
+    t12 = t13 + t10;
+    t13 = t3 + t17;
+    t10 = t2 - t0;
+    t3 = t5 + t6;
+    t17 = t2 + t0;
+    t2 = t5 - t6;
+    t0 = t11 - t7;
+    t5 = t16 - t8;
+    t6 = t11 + t7;
+    t11 = t16 + t8;
+    re[64] = t4;
+    im[64] = t9;
+    re[79] = t12;
+    im[79] = t13;
+    re[94] = t17;
+    im[94] = t2;
+    re[109] = t6;
+    im[109] = t11;
+    re[4] = t15;
+    im[4] = t18;
+    re[19] = t14;
+    im[19] = t1;
+    re[34] = t10;
+    im[34] = t3;
+    re[49] = t0;
+    im[49] = t5;
+    t7 = X[63];
+    t16 = 0.9135454576426009 * t7;
+    t8 = 0.40673664307580015 * t7;
+    t4 = X[33];
+    t9 = 0.9753423205085127 * t4;
+    t12 = 0.22069743502150108 * t4;
+    t13 = X[3];
+    t17 = 0.9996573249755573 * t13;
+    t2 = 0.02617694830787315 * t13;
+    t6 = X[26];
+    t11 = 0.9855560590580777 * t6;
+    t15 = (-0.1693495038490246) * t6;
+    t18 = X[56];
+    t14 = 0.9335804264972017 * t18;
+    t1 = (-0.35836794954530027) * t18;
+    t10 = t16 + t14;
+    t3 = t8 + t1;
+    t0 = t16 - t14;
+    t5 = t8 - t1;
+    t7 = t10 + t17;
+    t4 = t3 + t2;
+    t13 = t0 + t2;
+    t6 = t5 - t17;
+    t18 = t10 - t17;
+    t16 = t3 - t2;
+    t14 = t0 - t2;
+    t8 = t5 + t17;
+    t1 = t9 + t11;
+    t10 = t12 + t15;
+    t3 = t9 + t15;
+    t0 = t12 - t11;
+    t2 = t9 - t11;
+    t5 = t12 - t15;
+    t17 = t9 - t15;
+    t9 = t12 + t11;
+    t15 = t3 + t0;
+    t12 = t3 - t0;
+    t11 = C4 * t15;
+    t3 = (-C4) * t12;
+    t0 = t17 - t9;
+    t15 = t17 + t9;
+    t12 = (-C4) * t0;
+    t17 = (-C4) * t15;
+    t9 = t7 - t1;
+    t0 = t4 - t10;
+    t15 = t7 + t1;
+    t7 = t4 + t10;
+    t1 = t13 - t11;
+    t4 = t6 - t3;
+    t10 = t13 + t11;
+    t13 = t6 + t3;
+    t11 = t18 - t5;
+    t6 = t16 + t2;
+    t3 = t18 + t5;
+    t18 = t16 - t2;
+    t5 = t14 - t12;
+    t16 = t8 - t17;
+    t2 = t14 + t12;
+    t14 = t8 + t17;
+    re[88] = t15;
+    im[88] = t7;
+    re[103] = t10;
+    im[103] = t13;
+    re[118] = t3;
+    im[118] = t18;
+    re[13] = t2;
+    im[13] = t14;
+    re[28] = t9;
+    im[28] = t0;
+    re[43] = t1;
+    im[43] = t4;
+    re[58] = t11;
+    im[58] = t6;
+    re[73] = t5;
+    im[73] = t16;
+    t12 = X[15];
+    t8 = 0.9945218953682733 * t12;
+    t17 = 0.10452846326765346 * t12;
+    t15 = X[14];
+    t7 = 0.9958049275746618 * t15;
+    t10 = (-0.09150161866340238) * t15;
+    t13 = X[44];
+    t3 = 0.958819734868193 * t13;
+    t18 = (-0.2840153447039226) * t13;
+    t2 = X[74];
+    t14 = 0.8849876374630419 * t2;
+    t9 = (-0.4656145203251114) * t2;
+    t0 = X[75];
+    t1 = 0.8788171126619654 * t0;
+    t4 = 0.4771587602596084 * t0;
+    t11 = X[45];
+    t6 = 0.9550199444571866 * t11;
+    t5 = 0.296541574975571 * t11;
+    t16 = t3 + t1;
+    t12 = t18 + t4;
+    t15 = t3 - t1;
+    t13 = t18 - t4;
+    t2 = t8 + t16;
+    t0 = t17 + t12;
+    t11 = t8 + t13;
+    t3 = t17 - t15;
+    t1 = t8 - t16;
+    t18 = t17 - t12;
+    t4 = t8 - t13;
+    t16 = t17 + t15;
+    t12 = t14 + t6;
+    t8 = t9 + t5;
+    t13 = t14 - t6;
+    t17 = t9 - t5;
+    t15 = t7 + t12;
+    t14 = t10 + t8;
+    t6 = t7 + t17;
+    t9 = t10 - t13;
+    t5 = t7 - t12;
+    t12 = t10 - t8;
+    t8 = t7 - t17;
+    t7 = t10 + t13;
+    t17 = t6 + t9;
+    t10 = t6 - t9;
+    t13 = C4 * t17;
+    t6 = (-C4) * t10;
+    t9 = t8 - t7;
+    t17 = t8 + t7;
+    t10 = (-C4) * t9;
+    t8 = (-C4) * t17;
+    t7 = t2 - t15;
+    t9 = t0 - t14;
+    t17 = t2 + t15;
+    t2 = t0 + t14;
+    t15 = t11 - t13;
+    t0 = t3 - t6;
+    t14 = t11 + t13;
+    t11 = t3 + t6;
+    t13 = t1 - t12;
+    t3 = t18 + t5;
+    t6 = t1 + t12;
+    t1 = t18 - t5;
+    t12 = t4 - t10;
+    t18 = t16 - t8;
+    t5 = t4 + t10;
+    t4 = t16 + t8;
+    re[112] = t17;
+    im[112] = t2;
+    re[7] = t14;
+    im[7] = t11;
+    re[22] = t6;
+    im[22] = t1;
+    re[37] = t5;
+    im[37] = t4;
+    re[52] = t7;
+    im[52] = t9;
+    re[67] = t15;
+    im[67] = t0;
+    re[82] = t13;
+    im[82] = t3;
+    re[97] = t12;
+    im[97] = t18;
+    t10 = X[32];
+    t16 = 0.9781476007338057 * t10;
+    t8 = (-0.20791169081775931) * t10;
+    t17 = X[62];
+    t2 = 0.9187912101488983 * t17;
+    t14 = (-0.39474385638426723) * t17;
+    t11 = X[57];
+    t6 = 0.9288095528719242 * t11;
+    t1 = 0.3705574375098362 * t11;
+    t5 = X[27];
+    t4 = 0.9832549075639546 * t5;
+    t7 = 0.18223552549214747 * t5;
+    t9 = X[2];
+    t15 = 0.999914327574007 * t9;
+    t0 = (-0.01308959557134444) * t9;
+    t13 = t16 + t4;
+    t3 = t8 + t7;
+    t12 = t16 - t7;
+    t18 = t8 + t4;
+    t10 = t16 - t4;
+    t17 = t8 - t7;
+    t11 = t16 + t7;
+    t5 = t8 - t4;
+    t9 = t2 + t6;
+    t16 = t14 + t1;
+    t7 = t2 - t6;
+    t8 = t14 - t1;
+    t4 = t9 + t15;
+    t2 = t16 + t0;
+    t6 = t7 - t0;
+    t14 = t8 + t15;
+    t1 = t9 - t15;
+    t9 = t16 - t0;
+    t16 = t7 + t0;
+    t7 = t8 - t15;
+    t0 = t6 + t14;
+    t8 = t6 - t14;
+    t15 = C4 * t0;
+    t6 = (-C4) * t8;
+    t14 = t16 - t7;
+    t0 = t16 + t7;
+    t8 = (-C4) * t14;
+    t16 = (-C4) * t0;
+    t7 = t13 - t4;
+    t14 = t3 - t2;
+    t0 = t13 + t4;
+    t13 = t3 + t2;
+    t4 = t12 - t15;
+    t3 = t18 - t6;
+    t2 = t12 + t15;
+    t12 = t18 + t6;
+    t15 = t10 - t9;
+    t18 = t17 + t1;
+    t6 = t10 + t9;
+    t10 = t17 - t1;
+    t9 = t11 - t8;
+    t17 = t5 - t16;
+    t1 = t11 + t8;
+    t11 = t5 + t16;
+    re[16] = t0;
+    im[16] = t13;
+    re[31] = t2;
+    im[31] = t12;
+    re[46] = t6;
+    im[46] = t10;
+    re[61] = t1;
+    im[61] = t11;
+    re[76] = t7;
+    im[76] = t14;
+    re[91] = t4;
+    im[91] = t3;
+    re[106] = t15;
+    im[106] = t18;
+    re[1] = t9;
+    im[1] = t17;
+    t8 = re[40];
+    t5 = im[40];
+    t16 = re[64];
+    t0 = im[64];
+    t13 = re[88];
+    t2 = im[88];
+    t12 = re[112];
+    t6 = im[112];
+    t10 = re[16];
+    t1 = im[16];
+    t11 = t16 + t10;
+    t7 = t0 + t1;
+    t14 = t13 + t12;
+    t4 = t2 + t6;
+    t3 = t16 - t10;
+    t15 = t0 - t1;
+    t18 = t13 - t12;
+    t9 = t2 - t6;
+    t17 = t11 + t14;
+    t16 = t7 + t4;
+    t10 = t11 - t14;
+    t0 = C27 * t10;
+    t1 = t7 - t4;
+    t13 = C27 * t1;
+    t12 = C28 * t17;
+    t2 = t8 - t12;
+    t6 = C28 * t16;
+    t11 = t5 - t6;
+    t14 = t2 + t0;
+    t10 = t11 + t13;
+    t7 = t2 - t0;
+    t4 = t11 - t13;
+    t1 = C5 * t3;
+    t12 = C29 * t18;
+    t6 = t1 + t12;
+    t2 = C5 * t15;
+    t0 = C29 * t9;
+    t11 = t2 + t0;
+    t13 = C29 * t3;
+    t1 = C5 * t18;
+    t12 = t13 - t1;
+    t2 = C29 * t15;
+    t0 = C5 * t9;
+    t3 = t2 - t0;
+    t18 = t8 + t17;
+    t13 = t5 + t16;
+    t1 = t14 + t11;
+    t15 = t10 - t6;
+    t9 = t7 + t3;
+    t2 = t4 - t12;
+    t0 = t7 - t3;
+    t8 = t4 + t12;
+    t17 = t14 - t11;
+    t5 = t10 + t6;
+    re[40] = t18;
+    im[40] = t13;
+    re[64] = t1;
+    im[64] = t15;
+    re[88] = t9;
+    im[88] = t2;
+    re[112] = t0;
+    im[112] = t8;
+    re[16] = t17;
+    im[16] = t5;
+    t16 = re[55];
+    t7 = im[55];
+    t3 = re[79];
+    t4 = im[79];
+    t12 = re[103];
+    t14 = im[103];
+    t11 = re[7];
+    t10 = im[7];
+    t6 = re[31];
+    t18 = im[31];
+    t13 = t3 + t6;
+    t1 = t4 + t18;
+    t15 = t12 + t11;
+    t9 = t14 + t10;
+    t2 = t3 - t6;
+    t0 = t4 - t18;
+    t8 = t12 - t11;
+    t17 = t14 - t10;
+    t5 = t13 + t15;
+    t3 = t1 + t9;
+    t6 = t13 - t15;
+    t4 = C27 * t6;
+    t18 = t1 - t9;
+    t12 = C27 * t18;
+    t11 = C28 * t5;
+    t14 = t16 - t11;
+    t10 = C28 * t3;
+    t13 = t7 - t10;
+    t15 = t14 + t4;
+    t6 = t13 + t12;
+    t1 = t14 - t4;
+    t9 = t13 - t12;
+    t18 = C5 * t2;
+    t11 = C29 * t8;
+    t10 = t18 + t11;
+    t14 = C5 * t0;
+    t4 = C29 * t17;
+    t13 = t14 + t4;
+    t12 = C29 * t2;
+    t18 = C5 * t8;
+    t11 = t12 - t18;
+    t14 = C29 * t0;
+    t4 = C5 * t17;
+    t2 = t14 - t4;
+    t8 = t16 + t5;
+    t12 = t7 + t3;
+    t18 = t15 + t13;
+    t0 = t6 - t10;
+    t17 = t1 + t2;
+    t14 = t9 - t11;
+    t4 = t1 - t2;
+    t16 = t9 + t11;
+    t5 = t15 - t13;
+    t7 = t6 + t10;
+    re[55] = t8;
+    im[55] = t12;
+    re[79] = t18;
+    im[79] = t0;
+    re[103] = t17;
+    im[103] = t14;
+    re[7] = t4;
+    im[7] = t16;
+    re[31] = t5;
+    im[31] = t7;
+    t3 = re[70];
+    t1 = im[70];
+    t2 = re[94];
+    t9 = im[94];
+    t11 = re[118];
+    t15 = im[118];
+    t13 = re[22];
+    t6 = im[22];
+    t10 = re[46];
+    t8 = im[46];
+    t12 = t2 + t10;
+    t18 = t9 + t8;
+    t0 = t11 + t13;
+    t17 = t15 + t6;
+    t14 = t2 - t10;
+    t4 = t9 - t8;
+    t16 = t11 - t13;
+    t5 = t15 - t6;
+    t7 = t12 + t0;
+    t2 = t18 + t17;
+    t10 = t12 - t0;
+    t9 = C27 * t10;
+    t8 = t18 - t17;
+    t11 = C27 * t8;
+    t13 = C28 * t7;
+    t15 = t3 - t13;
+    t6 = C28 * t2;
+    t12 = t1 - t6;
+    t0 = t15 + t9;
+    t10 = t12 + t11;
+    t18 = t15 - t9;
+    t17 = t12 - t11;
+    t8 = C5 * t14;
+    t13 = C29 * t16;
+    t6 = t8 + t13;
+    t15 = C5 * t4;
+    t9 = C29 * t5;
+    t12 = t15 + t9;
+    t11 = C29 * t14;
+    t8 = C5 * t16;
+    t13 = t11 - t8;
+    t15 = C29 * t4;
+    t9 = C5 * t5;
+    t14 = t15 - t9;
+    t16 = t3 + t7;
+    t11 = t1 + t2;
+    t8 = t0 + t12;
+    t4 = t10 - t6;
+    t5 = t18 + t14;
+    t15 = t17 - t13;
+    t9 = t18 - t14;
+    t3 = t17 + t13;
+    t7 = t0 - t12;
+    t1 = t10 + t6;
+    re[70] = t16;
+    im[70] = t11;
+    re[94] = t8;
+    im[94] = t4;
+    re[118] = t5;
+    im[118] = t15;
+    re[22] = t9;
+    im[22] = t3;
+    re[46] = t7;
+    im[46] = t1;
+    t2 = re[85];
+    t18 = im[85];
+    t14 = re[109];
+    t17 = im[109];
+    t13 = re[13];
+    t0 = im[13];
+    t12 = re[37];
+    t10 = im[37];
+    t6 = re[61];
+    t16 = im[61];
+    t11 = t14 + t6;
+    t8 = t17 + t16;
+    t4 = t13 + t12;
+    t5 = t0 + t10;
+    t15 = t14 - t6;
+    t9 = t17 - t16;
+    t3 = t13 - t12;
+    t7 = t0 - t10;
+    t1 = t11 + t4;
+    t14 = t8 + t5;
+    t6 = t11 - t4;
+    t17 = C27 * t6;
+    t16 = t8 - t5;
+    t13 = C27 * t16;
+    t12 = C28 * t1;
+    t0 = t2 - t12;
+    t10 = C28 * t14;
+    t11 = t18 - t10;
+    t4 = t0 + t17;
+    t6 = t11 + t13;
+    t8 = t0 - t17;
+    t5 = t11 - t13;
+    t16 = C5 * t15;
+    t12 = C29 * t3;
+    t10 = t16 + t12;
+    t0 = C5 * t9;
+    t17 = C29 * t7;
+    t11 = t0 + t17;
+    t13 = C29 * t15;
+    t16 = C5 * t3;
+    t12 = t13 - t16;
+    t0 = C29 * t9;
+    t17 = C5 * t7;
+    t15 = t0 - t17;
+    t3 = t2 + t1;
+    t13 = t18 + t14;
+    t16 = t4 + t11;
+    t9 = t6 - t10;
+    t7 = t8 + t15;
+    t0 = t5 - t12;
+    t17 = t8 - t15;
+    t2 = t5 + t12;
+    t1 = t4 - t11;
+    t18 = t6 + t10;
+    re[85] = t3;
+    im[85] = t13;
+    re[109] = t16;
+    im[109] = t9;
+    re[13] = t7;
+    im[13] = t0;
+    re[37] = t17;
+    im[37] = t2;
+    re[61] = t1;
+    im[61] = t18;
+    t14 = re[100];
+    t8 = im[100];
+    t15 = re[4];
+    t5 = im[4];
+    t12 = re[28];
+    t4 = im[28];
+    t11 = re[52];
+    t6 = im[52];
+    t10 = re[76];
+    t3 = im[76];
+    t13 = t15 + t10;
+    t16 = t5 + t3;
+    t9 = t12 + t11;
+    t7 = t4 + t6;
+    t0 = t15 - t10;
+    t17 = t5 - t3;
+    t2 = t12 - t11;
+    t1 = t4 - t6;
+    t18 = t13 + t9;
+    t15 = t16 + t7;
+    t10 = t13 - t9;
+    t5 = C27 * t10;
+    t3 = t16 - t7;
+    t12 = C27 * t3;
+    t11 = C28 * t18;
+    t4 = t14 - t11;
+    t6 = C28 * t15;
+    t13 = t8 - t6;
+    t9 = t4 + t5;
+    t10 = t13 + t12;
+    t16 = t4 - t5;
+    t7 = t13 - t12;
+    t3 = C5 * t0;
+    t11 = C29 * t2;
+    t6 = t3 + t11;
+    t4 = C5 * t17;
+    t5 = C29 * t1;
+    t13 = t4 + t5;
+    t12 = C29 * t0;
+    t3 = C5 * t2;
+    t11 = t12 - t3;
+    t4 = C29 * t17;
+    t5 = C5 * t1;
+    t0 = t4 - t5;
+    t2 = t14 + t18;
+    t12 = t8 + t15;
+    t3 = t9 + t13;
+    t17 = t10 - t6;
+    t1 = t16 + t0;
+    t4 = t7 - t11;
+    t5 = t16 - t0;
+    t14 = t7 + t11;
+    t18 = t9 - t13;
+    t8 = t10 + t6;
+    re[100] = t2;
+    im[100] = t12;
+    re[4] = t3;
+    im[4] = t17;
+    re[28] = t1;
+    im[28] = t4;
+    re[52] = t5;
+    im[52] = t14;
+    re[76] = t18;
+    im[76] = t8;
+    t15 = re[115];
+    t16 = im[115];
+    t0 = re[19];
+    t7 = im[19];
+    t11 = re[43];
+    t9 = im[43];
+    t13 = re[67];
+    t10 = im[67];
+    t6 = re[91];
+    t2 = im[91];
+    t12 = t0 + t6;
+    t3 = t7 + t2;
+    t17 = t11 + t13;
+    t1 = t9 + t10;
+    t4 = t0 - t6;
+    t5 = t7 - t2;
+    t14 = t11 - t13;
+    t18 = t9 - t10;
+    t8 = t12 + t17;
+    t0 = t3 + t1;
+    t6 = t12 - t17;
+    t7 = C27 * t6;
+    t2 = t3 - t1;
+    t11 = C27 * t2;
+    t13 = C28 * t8;
+    t9 = t15 - t13;
+    t10 = C28 * t0;
+    t12 = t16 - t10;
+    t17 = t9 + t7;
+    t6 = t12 + t11;
+    t3 = t9 - t7;
+    t1 = t12 - t11;
+    t2 = C5 * t4;
+    t13 = C29 * t14;
+    t10 = t2 + t13;
+    t9 = C5 * t5;
+    t7 = C29 * t18;
+    t12 = t9 + t7;
+    t11 = C29 * t4;
+    t2 = C5 * t14;
+    t13 = t11 - t2;
+    t9 = C29 * t5;
+    t7 = C5 * t18;
+    t4 = t9 - t7;
+    t14 = t15 + t8;
+    t11 = t16 + t0;
+    t2 = t17 + t12;
+    t5 = t6 - t10;
+    t18 = t3 + t4;
+    t9 = t1 - t13;
+    t7 = t3 - t4;
+    t15 = t1 + t13;
+    t8 = t17 - t12;
+    t16 = t6 + t10;
+    re[115] = t14;
+    im[115] = t11;
+    re[19] = t2;
+    im[19] = t5;
+    re[43] = t18;
+    im[43] = t9;
+    re[67] = t7;
+    im[67] = t15;
+    re[91] = t8;
+    im[91] = t16;
+    t0 = re[10];
+    t3 = im[10];
+    t4 = re[34];
+    t1 = im[34];
+    t13 = re[58];
+    t17 = im[58];
+    t12 = re[82];
+    t6 = im[82];
+    t10 = re[106];
+    t14 = im[106];
+    t11 = t4 + t10;
+    t2 = t1 + t14;
+    t5 = t13 + t12;
+    t18 = t17 + t6;
+    t9 = t4 - t10;
+    t7 = t1 - t14;
+    t15 = t13 - t12;
+    t8 = t17 - t6;
+    t16 = t11 + t5;
+    t4 = t2 + t18;
+    t10 = t11 - t5;
+    t1 = C27 * t10;
+    t14 = t2 - t18;
+    t13 = C27 * t14;
+    t12 = C28 * t16;
+    t17 = t0 - t12;
+    t6 = C28 * t4;
+    t11 = t3 - t6;
+    t5 = t17 + t1;
+    t10 = t11 + t13;
+    t2 = t17 - t1;
+    t18 = t11 - t13;
+    t14 = C5 * t9;
+    t12 = C29 * t15;
+    t6 = t14 + t12;
+    t17 = C5 * t7;
+    t1 = C29 * t8;
+    t11 = t17 + t1;
+    t13 = C29 * t9;
+    t14 = C5 * t15;
+    t12 = t13 - t14;
+    t17 = C29 * t7;
+    t1 = C5 * t8;
+    t9 = t17 - t1;
+    t15 = t0 + t16;
+    t13 = t3 + t4;
+    t14 = t5 + t11;
+    t7 = t10 - t6;
+    t8 = t2 + t9;
+    t17 = t18 - t12;
+    t1 = t2 - t9;
+    t0 = t18 + t12;
+    t16 = t5 - t11;
+    t3 = t10 + t6;
+    re[10] = t15;
+    im[10] = t13;
+    re[34] = t14;
+    im[34] = t7;
+    re[58] = t8;
+    im[58] = t17;
+    re[82] = t1;
+    im[82] = t0;
+    re[106] = t16;
+    im[106] = t3;
+    t4 = re[25];
+    t2 = im[25];
+    t9 = re[49];
+    t18 = im[49];
+    t12 = re[73];
+    t5 = im[73];
+    t11 = re[97];
+    t10 = im[97];
+    t6 = re[1];
+    t15 = im[1];
+    t13 = t9 + t6;
+    t14 = t18 + t15;
+    t7 = t12 + t11;
+    t8 = t5 + t10;
+    t17 = t9 - t6;
+    t1 = t18 - t15;
+    t0 = t12 - t11;
+    t16 = t5 - t10;
+    t3 = t13 + t7;
+    t9 = t14 + t8;
+    t6 = t13 - t7;
+    t18 = C27 * t6;
+    t15 = t14 - t8;
+    t12 = C27 * t15;
+    t11 = C28 * t3;
+    t5 = t4 - t11;
+    t10 = C28 * t9;
+    t13 = t2 - t10;
+    t7 = t5 + t18;
+    t6 = t13 + t12;
+    t14 = t5 - t18;
+    t8 = t13 - t12;
+    t15 = C5 * t17;
+    t11 = C29 * t0;
+    t10 = t15 + t11;
+    t5 = C5 * t1;
+    t18 = C29 * t16;
+    t13 = t5 + t18;
+    t12 = C29 * t17;
+    t15 = C5 * t0;
+    t11 = t12 - t15;
+    t5 = C29 * t1;
+    t18 = C5 * t16;
+    t17 = t5 - t18;
+    t0 = t4 + t3;
+    t12 = t2 + t9;
+    t15 = t7 + t13;
+    t1 = t6 - t10;
+    t16 = t14 + t17;
+    t5 = t8 - t11;
+    t18 = t14 - t17;
+    t4 = t8 + t11;
+    t3 = t7 - t13;
+    t2 = t6 + t10;
+    re[25] = t0;
+    im[25] = t12;
+    re[49] = t15;
+    im[49] = t1;
+    re[73] = t16;
+    im[73] = t5;
+    re[97] = t18;
+    im[97] = t4;
+    re[1] = t3;
+    im[1] = t2;
+}
+
+/**
+ *  Part 2 of ApplyWindowedIMDCT_W10_240_K80().
+ * 
+ *  @param {Number[]} X 
+ *    - The input block (240 points, only the first 80 points are used).
+ *  @param {Number[]} y 
+ *    - The array that would contain the output block (480 points).
+ *  @param {Number[]} re 
+ *    - The scratch buffer (real part, 120 points).
+ *  @param {Number[]} im 
+ *    - The scratch buffer (imaginary part, 120 points).
+ */
+function ApplyWindowedIMDCT_W10_240_K80_Part2(X, y, re, im) {
+    let t0, t1, t10, t11, t12, t13, t14, t15, t16, t17, t18, t2, t3, t4, t5, t6, t7, t8, t9;
+    const C0 = 0.7071067811865476;
+    const C1 = 0.5590169943749475;
+    const C2 = 0.25;
+    const C3 = 0.9510565162951535;
+    const C4 = 0.5877852522924731;
+    const C5 = 0.5;
+    const C6 = 0.8660254037844386;
+    const C7 = 0.9999946454016965;
+    const C8 = 0.003272486506526625;
+    const C9 = 0.8643845233130174;
+    const C10 = 0.5028313791490421;
+    const C11 = 0.4971632662526543;
+    const C12 = 0.8676570098195441;
+    const C13 = 0.48576339371634003;
+    const C14 = 0.8740903416267589;
+    const C15 = 0.9998661379095618;
+    const C16 = 0.01636173162648678;
+    const C17 = 0.8577286100002721;
+    const C18 = 0.5141027441932217;
+    const C19 = 0.8509257293058021;
+    const C20 = 0.525286020378792;
+    const C21 = 0.4742802881232292;
+    const C22 = 0.8803739025537654;
+    const C23 = 0.9995663085020212;
+    const C24 = 0.02944817324796316;
+    const C25 = 0.9990952085533004;
+    const C26 = 0.04252956907655312;
+    const C27 = 0.8439770468681933;
+    const C28 = 0.5363792915089503;
+    const C29 = 0.4627159170443501;
+    const C30 = 0.8865066159447464;
+    const C31 = 0.4510722619751534;
+    const C32 = 0.8924874309908339;
+    const C33 = 0.99845291878395;
+    const C34 = 0.055603677682424614;
+    const C35 = 0.8368837533084093;
+    const C36 = 0.5473806568087966;
+    const C37 = 0.8296470640257853;
+    const C38 = 0.558288231251022;
+    const C39 = 0.4393513179959937;
+    const C40 = 0.898315322910159;
+    const C41 = 0.9976395492470157;
+    const C42 = 0.06866825888437376;
+    const C43 = 0.9966552393091803;
+    const C44 = 0.08172107413366822;
+    const C45 = 0.8222682189897751;
+    const C46 = 0.5691001458788982;
+    const C47 = 0.4275550934302821;
+    const C48 = 0.9039892931234433;
+    const C49 = 0.4156856095003708;
+    const C50 = 0.9095083694251006;
+    const C51 = 0.9955001576268845;
+    const C52 = 0.09475988689761111;
+    const C53 = 0.8147484825274894;
+    const C54 = 0.5798145481265136;
+    const C55 = 0.8070891431070594;
+    const C56 = 0.5904296021362011;
+    const C57 = 0.4037448999812271;
+    const C58 = 0.9148716061498187;
+    const C59 = 0.9941745021174282;
+    const C60 = 0.10778246304275935;
+    const C61 = 0.9926784999250583;
+    const C62 = 0.12078657121773083;
+    const C63 = 0.7992915131168641;
+    const C64 = 0.6009434890731024;
+    const C65 = 0.3917350108519559;
+    const C66 = 0.9200780843345949;
+    const C67 = 0.37965799994523275;
+    const C68 = 0.9251269118761953;
+    const C69 = 0.9910124073820492;
+    const C70 = 0.13376998323553513;
+    const C71 = 0.7913569286406602;
+    const C72 = 0.6113544074368165;
+    const C73 = 0.7832867492286504;
+    const C74 = 0.6216605733700774;
+    const C75 = 0.36751593659470355;
+    const C76 = 0.9300172236840121;
+    const C77 = 0.989176509964781;
+    const C78 = 0.14673047445536175;
+    const C79 = 0.9871711222448248;
+    const C80 = 0.159665824163761;
+    const C81 = 0.7750823576645314;
+    const C82 = 0.6318602209644087;
+    const C83 = 0.3553109012804161;
+    const C84 = 0.9347481818282924;
+    const C85 = 0.34304498527233984;
+    const C86 = 0.9393189756837131;
+    const C87 = 0.984996587835043;
+    const C88 = 0.1725738159551517;
+    const C89 = 0.7667451597285615;
+    const C90 = 0.641951602562703;
+    const C91 = 0.758276583956687;
+    const C92 = 0.6519329890586743;
+    const C93 = 0.3307202902720374;
+    const C94 = 0.9437288220682779;
+    const C95 = 0.9826532793307118;
+    const C96 = 0.18545223811159092;
+    const C97 = 0.9801415982456801;
+    const C98 = 0.19829888398174045;
+    const C99 = 0.74967808139577;
+    const C100 = 0.6618026701931303;
+    const C101 = 0.3183389280525497;
+    const C102 = 0.9479769653775104;
+    const C103 = 0.30590302009655346;
+    const C104 = 0.9520626777139243;
+    const C105 = 0.9774619749435719;
+    const C106 = 0.21111155235896514;
+    const C107 = 0.7409511253549591;
+    const C108 = 0.6715589548470183;
+    t9 = X[79];
+    t14 = 0.8660254037844387 * t9;
+    t17 = 0.49999999999999994 * t9;
+    t8 = X[49];
+    t11 = 0.9469301294951057 * t8;
+    t7 = 0.3214394653031616 * t8;
+    t13 = X[19];
+    t6 = 0.9914448613738104 * t13;
+    t10 = 0.13052619222005157 * t13;
+    t0 = X[10];
+    t12 = 0.9978589232386035 * t0;
+    t15 = (-0.06540312923014306) * t0;
+    t1 = X[40];
+    t16 = 0.9659258262890683 * t1;
+    t5 = (-0.25881904510252074) * t1;
+    t18 = X[70];
+    t4 = 0.8968727415326883 * t18;
+    t3 = (-0.4422886902190013) * t18;
+    t2 = t14 + t16;
+    t9 = t17 + t5;
+    t8 = t14 - t16;
+    t13 = t17 - t5;
+    t0 = t2 + t6;
+    t1 = t9 + t10;
+    t18 = t8 + t10;
+    t14 = t13 - t6;
+    t16 = t2 - t6;
+    t17 = t9 - t10;
+    t5 = t8 - t10;
+    t2 = t13 + t6;
+    t9 = t11 + t4;
+    t8 = t7 + t3;
+    t10 = t11 - t4;
+    t13 = t7 - t3;
+    t6 = t9 + t12;
+    t11 = t8 + t15;
+    t4 = t10 + t15;
+    t7 = t13 - t12;
+    t3 = t9 - t12;
+    t9 = t8 - t15;
+    t8 = t10 - t15;
+    t10 = t13 + t12;
+    t15 = t4 + t7;
+    t13 = t4 - t7;
+    t12 = C0 * t15;
+    t4 = (-C0) * t13;
+    t7 = t8 - t10;
+    t15 = t8 + t10;
+    t13 = (-C0) * t7;
+    t8 = (-C0) * t15;
+    t10 = t0 - t6;
+    t7 = t1 - t11;
+    t15 = t0 + t6;
+    t0 = t1 + t11;
+    t6 = t18 - t12;
+    t1 = t14 - t4;
+    t11 = t18 + t12;
+    t18 = t14 + t4;
+    t12 = t16 - t9;
+    t14 = t17 + t3;
+    t4 = t16 + t9;
+    t16 = t17 - t3;
+    t9 = t5 - t13;
+    t17 = t2 - t8;
+    t3 = t5 + t13;
+    t5 = t2 + t8;
+    re[80] = t15;
+    im[80] = t0;
+    re[95] = t11;
+    im[95] = t18;
+    re[110] = t4;
+    im[110] = t16;
+    re[5] = t3;
+    im[5] = t5;
+    re[20] = t10;
+    im[20] = t7;
+    re[35] = t6;
+    im[35] = t1;
+    re[50] = t12;
+    im[50] = t14;
+    re[65] = t9;
+    im[65] = t17;
+    t13 = X[31];
+    t2 = 0.9781476007338057 * t13;
+    t8 = 0.20791169081775931 * t13;
+    t15 = X[1];
+    t0 = 0.999914327574007 * t15;
+    t11 = 0.01308959557134444 * t15;
+    t18 = X[28];
+    t4 = 0.9832549075639546 * t18;
+    t16 = (-0.18223552549214747) * t18;
+    t3 = X[58];
+    t5 = 0.9288095528719242 * t3;
+    t10 = (-0.3705574375098362) * t3;
+    t7 = X[61];
+    t6 = 0.9187912101488983 * t7;
+    t1 = 0.39474385638426723 * t7;
+    t12 = t2 + t4;
+    t14 = t8 + t16;
+    t9 = t2 + t16;
+    t17 = t8 - t4;
+    t13 = t2 - t4;
+    t15 = t8 - t16;
+    t18 = t2 - t16;
+    t3 = t8 + t4;
+    t7 = t5 + t6;
+    t2 = t10 + t1;
+    t16 = t5 - t6;
+    t8 = t10 - t1;
+    t4 = t0 + t7;
+    t5 = t11 + t2;
+    t6 = t0 + t8;
+    t10 = t11 - t16;
+    t1 = t0 - t7;
+    t7 = t11 - t2;
+    t2 = t0 - t8;
+    t0 = t11 + t16;
+    t8 = t6 + t10;
+    t11 = t6 - t10;
+    t16 = C0 * t8;
+    t6 = (-C0) * t11;
+    t10 = t2 - t0;
+    t8 = t2 + t0;
+    t11 = (-C0) * t10;
+    t2 = (-C0) * t8;
+    t0 = t12 - t4;
+    t10 = t14 - t5;
+    t8 = t12 + t4;
+    t12 = t14 + t5;
+    t4 = t9 - t16;
+    t14 = t17 - t6;
+    t5 = t9 + t16;
+    t9 = t17 + t6;
+    t16 = t13 - t7;
+    t17 = t15 + t1;
+    t6 = t13 + t7;
+    t13 = t15 - t1;
+    t7 = t18 - t11;
+    t15 = t3 - t2;
+    t1 = t18 + t11;
+    t18 = t3 + t2;
+    re[104] = t8;
+    im[104] = t12;
+    re[119] = t5;
+    im[119] = t9;
+    re[14] = t6;
+    im[14] = t13;
+    re[29] = t1;
+    im[29] = t18;
+    re[44] = t0;
+    im[44] = t10;
+    re[59] = t4;
+    im[59] = t14;
+    re[74] = t16;
+    im[74] = t17;
+    re[89] = t7;
+    im[89] = t15;
+    t11 = X[16];
+    t3 = 0.9945218953682733 * t11;
+    t2 = (-0.10452846326765346) * t11;
+    t8 = X[46];
+    t12 = 0.9550199444571866 * t8;
+    t5 = (-0.296541574975571) * t8;
+    t9 = X[76];
+    t6 = 0.8788171126619654 * t9;
+    t13 = (-0.4771587602596084) * t9;
+    t1 = X[73];
+    t18 = 0.8849876374630419 * t1;
+    t0 = 0.4656145203251114 * t1;
+    t10 = X[43];
+    t4 = 0.958819734868193 * t10;
+    t14 = 0.2840153447039226 * t10;
+    t16 = X[13];
+    t17 = 0.9958049275746618 * t16;
+    t7 = 0.09150161866340238 * t16;
+    t15 = t6 + t4;
+    t11 = t13 + t14;
+    t8 = t6 - t4;
+    t9 = t13 - t14;
+    t1 = t3 + t15;
+    t10 = t2 + t11;
+    t16 = t3 + t9;
+    t6 = t2 - t8;
+    t4 = t3 - t15;
+    t13 = t2 - t11;
+    t14 = t3 - t9;
+    t15 = t2 + t8;
+    t11 = t12 + t18;
+    t3 = t5 + t0;
+    t9 = t12 - t18;
+    t2 = t5 - t0;
+    t8 = t11 + t17;
+    t12 = t3 + t7;
+    t18 = t9 - t7;
+    t5 = t2 + t17;
+    t0 = t11 - t17;
+    t11 = t3 - t7;
+    t3 = t9 + t7;
+    t9 = t2 - t17;
+    t7 = t18 + t5;
+    t2 = t18 - t5;
+    t17 = C0 * t7;
+    t18 = (-C0) * t2;
+    t5 = t3 - t9;
+    t7 = t3 + t9;
+    t2 = (-C0) * t5;
+    t3 = (-C0) * t7;
+    t9 = t1 - t8;
+    t5 = t10 - t12;
+    t7 = t1 + t8;
+    t1 = t10 + t12;
+    t8 = t16 - t17;
+    t10 = t6 - t18;
+    t12 = t16 + t17;
+    t16 = t6 + t18;
+    t17 = t4 - t11;
+    t6 = t13 + t0;
+    t18 = t4 + t11;
+    t4 = t13 - t0;
+    t11 = t14 - t2;
+    t13 = t15 - t3;
+    t0 = t14 + t2;
+    t14 = t15 + t3;
+    re[8] = t7;
+    im[8] = t1;
+    re[23] = t12;
+    im[23] = t16;
+    re[38] = t18;
+    im[38] = t4;
+    re[53] = t0;
+    im[53] = t14;
+    re[68] = t9;
+    im[68] = t5;
+    re[83] = t8;
+    im[83] = t10;
+    re[98] = t17;
+    im[98] = t6;
+    re[113] = t11;
+    im[113] = t13;
+    t2 = X[64];
+    t15 = 0.9135454576426009 * t2;
+    t3 = (-0.40673664307580015) * t2;
+    t7 = X[55];
+    t1 = 0.9335804264972017 * t7;
+    t12 = 0.35836794954530027 * t7;
+    t16 = X[25];
+    t18 = 0.9855560590580777 * t16;
+    t4 = 0.1693495038490246 * t16;
+    t0 = X[4];
+    t14 = 0.9996573249755573 * t0;
+    t9 = (-0.02617694830787315) * t0;
+    t5 = X[34];
+    t8 = 0.9753423205085127 * t5;
+    t10 = (-0.22069743502150108) * t5;
+    t17 = t15 + t1;
+    t6 = t3 + t12;
+    t11 = t15 - t1;
+    t13 = t3 - t12;
+    t2 = t17 + t14;
+    t7 = t6 + t9;
+    t16 = t11 - t9;
+    t0 = t13 + t14;
+    t5 = t17 - t14;
+    t15 = t6 - t9;
+    t1 = t11 + t9;
+    t3 = t13 - t14;
+    t12 = -t18;
+    t17 = -t4;
+    t6 = t18 + t8;
+    t11 = t4 + t10;
+    t9 = t12 - t10;
+    t13 = t8 - t4;
+    t14 = t18 - t8;
+    t12 = t4 - t10;
+    t4 = t10 - t18;
+    t10 = t17 - t8;
+    t18 = t9 + t13;
+    t17 = t9 - t13;
+    t8 = C0 * t18;
+    t9 = (-C0) * t17;
+    t13 = t4 - t10;
+    t18 = t4 + t10;
+    t17 = (-C0) * t13;
+    t4 = (-C0) * t18;
+    t10 = t2 - t6;
+    t13 = t7 - t11;
+    t18 = t2 + t6;
+    t2 = t7 + t11;
+    t6 = t16 - t8;
+    t7 = t0 - t9;
+    t11 = t16 + t8;
+    t16 = t0 + t9;
+    t8 = t5 - t12;
+    t0 = t15 + t14;
+    t9 = t5 + t12;
+    t5 = t15 - t14;
+    t12 = t1 - t17;
+    t15 = t3 - t4;
+    t14 = t1 + t17;
+    t1 = t3 + t4;
+    re[32] = t18;
+    im[32] = t2;
+    re[47] = t11;
+    im[47] = t16;
+    re[62] = t9;
+    im[62] = t5;
+    re[77] = t14;
+    im[77] = t1;
+    re[92] = t10;
+    im[92] = t13;
+    re[107] = t6;
+    im[107] = t7;
+    re[2] = t8;
+    im[2] = t0;
+    re[17] = t12;
+    im[17] = t15;
+    t17 = X[67];
+    t3 = 0.9025852843498606 * t17;
+    t4 = 0.4305110968082951 * t17;
+    t18 = X[37];
+    t2 = 0.9692309097067544 * t18;
+    t11 = 0.24615329302899303 * t18;
+    t16 = X[7];
+    t9 = 0.9986295347545738 * t16;
+    t5 = 0.05233595624294383 * t16;
+    t14 = X[22];
+    t1 = 0.9896513868196702 * t14;
+    t10 = (-0.1434926219911793) * t14;
+    t13 = X[52];
+    t6 = 0.9426414910921784 * t13;
+    t7 = (-0.33380685923377096) * t13;
+    t8 = t3 + t6;
+    t0 = t4 + t7;
+    t12 = -t9;
+    t15 = -t5;
+    t17 = t3 - t6;
+    t18 = t4 - t7;
+    t16 = t9 + t8;
+    t14 = t5 + t0;
+    t13 = t18 - t9;
+    t3 = t15 - t17;
+    t6 = t9 - t8;
+    t4 = t5 - t0;
+    t7 = t12 - t18;
+    t15 = t17 - t5;
+    t9 = -t1;
+    t8 = -t10;
+    t0 = t1 + t2;
+    t12 = t10 + t11;
+    t18 = t11 - t1;
+    t17 = t8 - t2;
+    t5 = t1 - t2;
+    t8 = t10 - t11;
+    t1 = t9 - t11;
+    t9 = t2 - t10;
+    t11 = t18 + t17;
+    t2 = t18 - t17;
+    t10 = C0 * t11;
+    t18 = (-C0) * t2;
+    t17 = t1 - t9;
+    t11 = t1 + t9;
+    t2 = (-C0) * t17;
+    t1 = (-C0) * t11;
+    t9 = t16 - t0;
+    t17 = t14 - t12;
+    t11 = t16 + t0;
+    t16 = t14 + t12;
+    t0 = t13 - t10;
+    t14 = t3 - t18;
+    t12 = t13 + t10;
+    t13 = t3 + t18;
+    t10 = t6 - t8;
+    t3 = t4 + t5;
+    t18 = t6 + t8;
+    t6 = t4 - t5;
+    t8 = t7 - t2;
+    t4 = t15 - t1;
+    t5 = t7 + t2;
+    t7 = t15 + t1;
+    re[56] = t11;
+    im[56] = t16;
+    re[71] = t12;
+    im[71] = t13;
+    re[86] = t18;
+    im[86] = t6;
+    re[101] = t5;
+    im[101] = t7;
+    re[116] = t9;
+    im[116] = t17;
+    re[11] = t0;
+    im[11] = t14;
+    re[26] = t10;
+    im[26] = t3;
+    re[41] = t8;
+    im[41] = t4;
+    t2 = re[80];
+    t15 = im[80];
+    t1 = re[104];
+    t11 = im[104];
+    t16 = re[8];
+    t12 = im[8];
+    t13 = re[32];
+    t18 = im[32];
+    t6 = re[56];
+    t5 = im[56];
+    t7 = t1 + t6;
+    t9 = t11 + t5;
+    t17 = t16 + t13;
+    t0 = t12 + t18;
+    t14 = t1 - t6;
+    t10 = t11 - t5;
+    t3 = t16 - t13;
+    t8 = t12 - t18;
+    t4 = t7 + t17;
+    t1 = t9 + t0;
+    t6 = t7 - t17;
+    t11 = C1 * t6;
+    t5 = t9 - t0;
+    t16 = C1 * t5;
+    t13 = C2 * t4;
+    t12 = t2 - t13;
+    t18 = C2 * t1;
+    t7 = t15 - t18;
+    t17 = t12 + t11;
+    t6 = t7 + t16;
+    t9 = t12 - t11;
+    t0 = t7 - t16;
+    t5 = C3 * t14;
+    t13 = C4 * t3;
+    t18 = t5 + t13;
+    t12 = C3 * t10;
+    t11 = C4 * t8;
+    t7 = t12 + t11;
+    t16 = C4 * t14;
+    t5 = C3 * t3;
+    t13 = t16 - t5;
+    t12 = C4 * t10;
+    t11 = C3 * t8;
+    t14 = t12 - t11;
+    t3 = t2 + t4;
+    t16 = t15 + t1;
+    t5 = t17 + t7;
+    t10 = t6 - t18;
+    t8 = t9 + t14;
+    t12 = t0 - t13;
+    t11 = t9 - t14;
+    t2 = t0 + t13;
+    t4 = t17 - t7;
+    t15 = t6 + t18;
+    re[80] = t3;
+    im[80] = t16;
+    re[104] = t5;
+    im[104] = t10;
+    re[8] = t8;
+    im[8] = t12;
+    re[32] = t11;
+    im[32] = t2;
+    re[56] = t4;
+    im[56] = t15;
+    t1 = re[95];
+    t9 = im[95];
+    t14 = re[119];
+    t0 = im[119];
+    t13 = re[23];
+    t17 = im[23];
+    t7 = re[47];
+    t6 = im[47];
+    t18 = re[71];
+    t3 = im[71];
+    t16 = t14 + t18;
+    t5 = t0 + t3;
+    t10 = t13 + t7;
+    t8 = t17 + t6;
+    t12 = t14 - t18;
+    t11 = t0 - t3;
+    t2 = t13 - t7;
+    t4 = t17 - t6;
+    t15 = t16 + t10;
+    t14 = t5 + t8;
+    t18 = t16 - t10;
+    t0 = C1 * t18;
+    t3 = t5 - t8;
+    t13 = C1 * t3;
+    t7 = C2 * t15;
+    t17 = t1 - t7;
+    t6 = C2 * t14;
+    t16 = t9 - t6;
+    t10 = t17 + t0;
+    t18 = t16 + t13;
+    t5 = t17 - t0;
+    t8 = t16 - t13;
+    t3 = C3 * t12;
+    t7 = C4 * t2;
+    t6 = t3 + t7;
+    t17 = C3 * t11;
+    t0 = C4 * t4;
+    t16 = t17 + t0;
+    t13 = C4 * t12;
+    t3 = C3 * t2;
+    t7 = t13 - t3;
+    t17 = C4 * t11;
+    t0 = C3 * t4;
+    t12 = t17 - t0;
+    t2 = t1 + t15;
+    t13 = t9 + t14;
+    t3 = t10 + t16;
+    t11 = t18 - t6;
+    t4 = t5 + t12;
+    t17 = t8 - t7;
+    t0 = t5 - t12;
+    t1 = t8 + t7;
+    t15 = t10 - t16;
+    t9 = t18 + t6;
+    re[95] = t2;
+    im[95] = t13;
+    re[119] = t3;
+    im[119] = t11;
+    re[23] = t4;
+    im[23] = t17;
+    re[47] = t0;
+    im[47] = t1;
+    re[71] = t15;
+    im[71] = t9;
+    t14 = re[110];
+    t5 = im[110];
+    t12 = re[14];
+    t8 = im[14];
+    t7 = re[38];
+    t10 = im[38];
+    t16 = re[62];
+    t18 = im[62];
+    t6 = re[86];
+    t2 = im[86];
+    t13 = t12 + t6;
+    t3 = t8 + t2;
+    t11 = t7 + t16;
+    t4 = t10 + t18;
+    t17 = t12 - t6;
+    t0 = t8 - t2;
+    t1 = t7 - t16;
+    t15 = t10 - t18;
+    t9 = t13 + t11;
+    t12 = t3 + t4;
+    t6 = t13 - t11;
+    t8 = C1 * t6;
+    t2 = t3 - t4;
+    t7 = C1 * t2;
+    t16 = C2 * t9;
+    t10 = t14 - t16;
+    t18 = C2 * t12;
+    t13 = t5 - t18;
+    t11 = t10 + t8;
+    t6 = t13 + t7;
+    t3 = t10 - t8;
+    t4 = t13 - t7;
+    t2 = C3 * t17;
+    t16 = C4 * t1;
+    t18 = t2 + t16;
+    t10 = C3 * t0;
+    t8 = C4 * t15;
+    t13 = t10 + t8;
+    t7 = C4 * t17;
+    t2 = C3 * t1;
+    t16 = t7 - t2;
+    t10 = C4 * t0;
+    t8 = C3 * t15;
+    t17 = t10 - t8;
+    t1 = t14 + t9;
+    t7 = t5 + t12;
+    t2 = t11 + t13;
+    t0 = t6 - t18;
+    t15 = t3 + t17;
+    t10 = t4 - t16;
+    t8 = t3 - t17;
+    t14 = t4 + t16;
+    t9 = t11 - t13;
+    t5 = t6 + t18;
+    re[110] = t1;
+    im[110] = t7;
+    re[14] = t2;
+    im[14] = t0;
+    re[38] = t15;
+    im[38] = t10;
+    re[62] = t8;
+    im[62] = t14;
+    re[86] = t9;
+    im[86] = t5;
+    t12 = re[5];
+    t3 = im[5];
+    t17 = re[29];
+    t4 = im[29];
+    t16 = re[53];
+    t11 = im[53];
+    t13 = re[77];
+    t6 = im[77];
+    t18 = re[101];
+    t1 = im[101];
+    t7 = t17 + t18;
+    t2 = t4 + t1;
+    t0 = t16 + t13;
+    t15 = t11 + t6;
+    t10 = t17 - t18;
+    t8 = t4 - t1;
+    t14 = t16 - t13;
+    t9 = t11 - t6;
+    t5 = t7 + t0;
+    t17 = t2 + t15;
+    t18 = t7 - t0;
+    t4 = C1 * t18;
+    t1 = t2 - t15;
+    t16 = C1 * t1;
+    t13 = C2 * t5;
+    t11 = t12 - t13;
+    t6 = C2 * t17;
+    t7 = t3 - t6;
+    t0 = t11 + t4;
+    t18 = t7 + t16;
+    t2 = t11 - t4;
+    t15 = t7 - t16;
+    t1 = C3 * t10;
+    t13 = C4 * t14;
+    t6 = t1 + t13;
+    t11 = C3 * t8;
+    t4 = C4 * t9;
+    t7 = t11 + t4;
+    t16 = C4 * t10;
+    t1 = C3 * t14;
+    t13 = t16 - t1;
+    t11 = C4 * t8;
+    t4 = C3 * t9;
+    t10 = t11 - t4;
+    t14 = t12 + t5;
+    t16 = t3 + t17;
+    t1 = t0 + t7;
+    t8 = t18 - t6;
+    t9 = t2 + t10;
+    t11 = t15 - t13;
+    t4 = t2 - t10;
+    t12 = t15 + t13;
+    t5 = t0 - t7;
+    t3 = t18 + t6;
+    re[5] = t14;
+    im[5] = t16;
+    re[29] = t1;
+    im[29] = t8;
+    re[53] = t9;
+    im[53] = t11;
+    re[77] = t4;
+    im[77] = t12;
+    re[101] = t5;
+    im[101] = t3;
+    t17 = re[20];
+    t2 = im[20];
+    t10 = re[44];
+    t15 = im[44];
+    t13 = re[68];
+    t0 = im[68];
+    t7 = re[92];
+    t18 = im[92];
+    t6 = re[116];
+    t14 = im[116];
+    t16 = t10 + t6;
+    t1 = t15 + t14;
+    t8 = t13 + t7;
+    t9 = t0 + t18;
+    t11 = t10 - t6;
+    t4 = t15 - t14;
+    t12 = t13 - t7;
+    t5 = t0 - t18;
+    t3 = t16 + t8;
+    t10 = t1 + t9;
+    t6 = t16 - t8;
+    t15 = C1 * t6;
+    t14 = t1 - t9;
+    t13 = C1 * t14;
+    t7 = C2 * t3;
+    t0 = t17 - t7;
+    t18 = C2 * t10;
+    t16 = t2 - t18;
+    t8 = t0 + t15;
+    t6 = t16 + t13;
+    t1 = t0 - t15;
+    t9 = t16 - t13;
+    t14 = C3 * t11;
+    t7 = C4 * t12;
+    t18 = t14 + t7;
+    t0 = C3 * t4;
+    t15 = C4 * t5;
+    t16 = t0 + t15;
+    t13 = C4 * t11;
+    t14 = C3 * t12;
+    t7 = t13 - t14;
+    t0 = C4 * t4;
+    t15 = C3 * t5;
+    t11 = t0 - t15;
+    t12 = t17 + t3;
+    t13 = t2 + t10;
+    t14 = t8 + t16;
+    t4 = t6 - t18;
+    t5 = t1 + t11;
+    t0 = t9 - t7;
+    t15 = t1 - t11;
+    t17 = t9 + t7;
+    t3 = t8 - t16;
+    t2 = t6 + t18;
+    re[20] = t12;
+    im[20] = t13;
+    re[44] = t14;
+    im[44] = t4;
+    re[68] = t5;
+    im[68] = t0;
+    re[92] = t15;
+    im[92] = t17;
+    re[116] = t3;
+    im[116] = t2;
+    t10 = re[35];
+    t1 = im[35];
+    t11 = re[59];
+    t9 = im[59];
+    t7 = re[83];
+    t8 = im[83];
+    t16 = re[107];
+    t6 = im[107];
+    t18 = re[11];
+    t12 = im[11];
+    t13 = t11 + t18;
+    t14 = t9 + t12;
+    t4 = t7 + t16;
+    t5 = t8 + t6;
+    t0 = t11 - t18;
+    t15 = t9 - t12;
+    t17 = t7 - t16;
+    t3 = t8 - t6;
+    t2 = t13 + t4;
+    t11 = t14 + t5;
+    t18 = t13 - t4;
+    t9 = C1 * t18;
+    t12 = t14 - t5;
+    t7 = C1 * t12;
+    t16 = C2 * t2;
+    t8 = t10 - t16;
+    t6 = C2 * t11;
+    t13 = t1 - t6;
+    t4 = t8 + t9;
+    t18 = t13 + t7;
+    t14 = t8 - t9;
+    t5 = t13 - t7;
+    t12 = C3 * t0;
+    t16 = C4 * t17;
+    t6 = t12 + t16;
+    t8 = C3 * t15;
+    t9 = C4 * t3;
+    t13 = t8 + t9;
+    t7 = C4 * t0;
+    t12 = C3 * t17;
+    t16 = t7 - t12;
+    t8 = C4 * t15;
+    t9 = C3 * t3;
+    t0 = t8 - t9;
+    t17 = t10 + t2;
+    t7 = t1 + t11;
+    t12 = t4 + t13;
+    t15 = t18 - t6;
+    t3 = t14 + t0;
+    t8 = t5 - t16;
+    t9 = t14 - t0;
+    t10 = t5 + t16;
+    t2 = t4 - t13;
+    t1 = t18 + t6;
+    re[35] = t17;
+    im[35] = t7;
+    re[59] = t12;
+    im[59] = t15;
+    re[83] = t3;
+    im[83] = t8;
+    re[107] = t9;
+    im[107] = t10;
+    re[11] = t2;
+    im[11] = t1;
+    t11 = re[50];
+    t14 = im[50];
+    t0 = re[74];
+    t5 = im[74];
+    t16 = re[98];
+    t4 = im[98];
+    t13 = re[2];
+    t18 = im[2];
+    t6 = re[26];
+    t17 = im[26];
+    t7 = t0 + t6;
+    t12 = t5 + t17;
+    t15 = t16 + t13;
+    t3 = t4 + t18;
+    t8 = t0 - t6;
+    t9 = t5 - t17;
+    t10 = t16 - t13;
+    t2 = t4 - t18;
+    t1 = t7 + t15;
+    t0 = t12 + t3;
+    t6 = t7 - t15;
+    t5 = C1 * t6;
+    t17 = t12 - t3;
+    t16 = C1 * t17;
+    t13 = C2 * t1;
+    t4 = t11 - t13;
+    t18 = C2 * t0;
+    t7 = t14 - t18;
+    t15 = t4 + t5;
+    t6 = t7 + t16;
+    t12 = t4 - t5;
+    t3 = t7 - t16;
+    t17 = C3 * t8;
+    t13 = C4 * t10;
+    t18 = t17 + t13;
+    t4 = C3 * t9;
+    t5 = C4 * t2;
+    t7 = t4 + t5;
+    t16 = C4 * t8;
+    t17 = C3 * t10;
+    t13 = t16 - t17;
+    t4 = C4 * t9;
+    t5 = C3 * t2;
+    t8 = t4 - t5;
+    t10 = t11 + t1;
+    t16 = t14 + t0;
+    t17 = t15 + t7;
+    t9 = t6 - t18;
+    t2 = t12 + t8;
+    t4 = t3 - t13;
+    t5 = t12 - t8;
+    t11 = t3 + t13;
+    t1 = t15 - t7;
+    t14 = t6 + t18;
+    re[50] = t10;
+    im[50] = t16;
+    re[74] = t17;
+    im[74] = t9;
+    re[98] = t2;
+    im[98] = t4;
+    re[2] = t5;
+    im[2] = t11;
+    re[26] = t1;
+    im[26] = t14;
+    t0 = re[65];
+    t12 = im[65];
+    t8 = re[89];
+    t3 = im[89];
+    t13 = re[113];
+    t15 = im[113];
+    t7 = re[17];
+    t6 = im[17];
+    t18 = re[41];
+    t10 = im[41];
+    t16 = t8 + t18;
+    t17 = t3 + t10;
+    t9 = t13 + t7;
+    t2 = t15 + t6;
+    t4 = t8 - t18;
+    t5 = t3 - t10;
+    t11 = t13 - t7;
+    t1 = t15 - t6;
+    t14 = t16 + t9;
+    t8 = t17 + t2;
+    t18 = t16 - t9;
+    t3 = C1 * t18;
+    t10 = t17 - t2;
+    t13 = C1 * t10;
+    t7 = C2 * t14;
+    t15 = t0 - t7;
+    t6 = C2 * t8;
+    t16 = t12 - t6;
+    t9 = t15 + t3;
+    t18 = t16 + t13;
+    t17 = t15 - t3;
+    t2 = t16 - t13;
+    t10 = C3 * t4;
+    t7 = C4 * t11;
+    t6 = t10 + t7;
+    t15 = C3 * t5;
+    t3 = C4 * t1;
+    t16 = t15 + t3;
+    t13 = C4 * t4;
+    t10 = C3 * t11;
+    t7 = t13 - t10;
+    t15 = C4 * t5;
+    t3 = C3 * t1;
+    t4 = t15 - t3;
+    t11 = t0 + t14;
+    t13 = t12 + t8;
+    t10 = t9 + t16;
+    t5 = t18 - t6;
+    t1 = t17 + t4;
+    t15 = t2 - t7;
+    t3 = t17 - t4;
+    t0 = t2 + t7;
+    t14 = t9 - t16;
+    t12 = t18 + t6;
+    re[65] = t11;
+    im[65] = t13;
+    re[89] = t10;
+    im[89] = t5;
+    re[113] = t1;
+    im[113] = t15;
+    re[17] = t3;
+    im[17] = t0;
+    re[41] = t14;
+    im[41] = t12;
+    t8 = re[0];
+    t17 = im[0];
+    t4 = re[40];
+    t2 = im[40];
+    t7 = re[80];
+    t9 = im[80];
+    t16 = t4 + t7;
+    t18 = t2 + t9;
+    t6 = C5 * t16;
+    t11 = t8 - t6;
+    t13 = C5 * t18;
+    t10 = t17 - t13;
+    t5 = t4 - t7;
+    t1 = C6 * t5;
+    t15 = t2 - t9;
+    t3 = C6 * t15;
+    t0 = t8 + t16;
+    t14 = t17 + t18;
+    t12 = t11 + t3;
+    t6 = t10 - t1;
+    t13 = t11 - t3;
+    t4 = t10 + t1;
+    t7 = (-C7) * t0;
+    t5 = (-C8) * t14;
+    t2 = t7 + t5;
+    t9 = 0.08062381886627268 * t2;
+    y[359] = t9;
+    t15 = 0.07908701262725863 * t2;
+    y[360] = t15;
+    t8 = C8 * t0;
+    t16 = (-C7) * t14;
+    t17 = t8 + t16;
+    t18 = 0.05093589219767399 * t17;
+    y[119] = t18;
+    t11 = (-0.0533957066838501) * t17;
+    y[120] = t11;
+    t3 = (-C9) * t12;
+    t10 = (-C10) * t6;
+    t1 = t3 + t10;
+    t7 = 0.09034656516392356 * t1;
+    y[279] = t7;
+    t5 = (-0.008607320729772055) * t1;
+    y[440] = t5;
+    t9 = C10 * t12;
+    t2 = (-C9) * t6;
+    t15 = t9 + t2;
+    y[39] = 0;
+    t0 = (-0.09223741177335797) * t15;
+    y[200] = t0;
+    t14 = C11 * t13;
+    t8 = C12 * t4;
+    t16 = t14 + t8;
+    y[40] = 0;
+    t18 = (-0.09224509203483207) * t16;
+    y[199] = t18;
+    t17 = (-C12) * t13;
+    t11 = C11 * t4;
+    t3 = t17 + t11;
+    t10 = 0.09033904297246116 * t3;
+    y[280] = t10;
+    t7 = (-0.008844170730505122) * t3;
+    y[439] = t7;
+    t1 = re[39];
+    t5 = im[39];
+    t12 = re[79];
+    t6 = im[79];
+    t9 = re[119];
+    t2 = im[119];
+    t15 = t12 + t9;
+    t0 = t6 + t2;
+    t14 = C5 * t15;
+    t8 = t1 - t14;
+    t16 = C5 * t0;
+    t18 = t5 - t16;
+    t13 = t12 - t9;
+    t4 = C6 * t13;
+    t17 = t6 - t2;
+    t11 = C6 * t17;
+    t10 = t1 + t15;
+    t3 = t5 + t0;
+    t7 = t8 + t11;
+    t14 = t18 - t4;
+    t16 = t8 - t11;
+    t12 = t18 + t4;
+    t9 = C13 * t10;
+    t13 = C14 * t3;
+    t6 = t9 + t13;
+    y[42] = 0;
+    t2 = (-0.09226327155399247) * t6;
+    y[197] = t2;
+    t17 = (-C14) * t10;
+    t1 = C13 * t3;
+    t15 = t17 + t1;
+    t5 = 0.09032124260255246 * t15;
+    y[282] = t5;
+    t0 = (-0.009265717230196452) * t15;
+    y[437] = t0;
+    t8 = (-C15) * t7;
+    t11 = (-C16) * t14;
+    t18 = t8 + t11;
+    t4 = 0.08345046628438205 * t18;
+    y[357] = t4;
+    t9 = 0.07578270262387705 * t18;
+    y[362] = t9;
+    t13 = C16 * t7;
+    t6 = (-C15) * t14;
+    t2 = t13 + t6;
+    t10 = 0.04591306207989876 * t2;
+    y[117] = t10;
+    t3 = (-0.05816525202674937) * t2;
+    y[122] = t3;
+    t17 = (-C17) * t16;
+    t1 = (-C18) * t12;
+    t5 = t17 + t1;
+    t15 = 0.09035887908682398 * t5;
+    y[277] = t15;
+    t0 = (-0.00808776756287088) * t5;
+    y[442] = t0;
+    t8 = C18 * t16;
+    t11 = (-C17) * t12;
+    t4 = t8 + t11;
+    y[37] = 0;
+    t18 = (-0.09222484184787204) * t4;
+    y[202] = t18;
+    t9 = re[78];
+    t7 = im[78];
+    t14 = re[118];
+    t13 = im[118];
+    t6 = re[38];
+    t10 = im[38];
+    t2 = t14 + t6;
+    t3 = t13 + t10;
+    t17 = C5 * t2;
+    t1 = t9 - t17;
+    t15 = C5 * t3;
+    t5 = t7 - t15;
+    t0 = t14 - t6;
+    t16 = C6 * t0;
+    t12 = t13 - t10;
+    t8 = C6 * t12;
+    t11 = t9 + t2;
+    t4 = t7 + t3;
+    t18 = t1 + t8;
+    t17 = t5 - t16;
+    t15 = t1 - t8;
+    t14 = t5 + t16;
+    t6 = (-C19) * t11;
+    t0 = (-C20) * t4;
+    t13 = t6 + t0;
+    t10 = 0.09036790163852577 * t13;
+    y[275] = t10;
+    t12 = (-0.007516983228543206) * t13;
+    y[444] = t12;
+    t9 = C20 * t11;
+    t2 = (-C19) * t4;
+    t7 = t9 + t2;
+    y[35] = 0;
+    t3 = (-0.09221563389473073) * t7;
+    y[204] = t3;
+    t1 = C21 * t18;
+    t8 = C22 * t17;
+    t5 = t1 + t8;
+    y[44] = 0;
+    t16 = (-0.09228499199887408) * t5;
+    y[195] = t16;
+    t6 = (-C22) * t18;
+    t0 = C21 * t17;
+    t10 = t6 + t0;
+    t13 = 0.09029998435103076 * t10;
+    y[284] = t13;
+    t12 = (-0.009609217195098947) * t10;
+    y[435] = t12;
+    t11 = (-C23) * t15;
+    t4 = (-C24) * t14;
+    t9 = t11 + t4;
+    t2 = 0.08593171868025587 * t9;
+    y[355] = t2;
+    t7 = 0.0721967068995578 * t9;
+    y[364] = t7;
+    t3 = C24 * t15;
+    t1 = (-C23) * t14;
+    t8 = t3 + t1;
+    t5 = 0.04081728778312514 * t8;
+    y[115] = t5;
+    t16 = (-0.06268301918716075) * t8;
+    y[124] = t16;
+    t18 = re[117];
+    t17 = im[117];
+    t6 = re[37];
+    t0 = im[37];
+    t13 = re[77];
+    t10 = im[77];
+    t12 = t6 + t13;
+    t11 = t0 + t10;
+    t4 = C5 * t12;
+    t2 = t18 - t4;
+    t9 = C5 * t11;
+    t7 = t17 - t9;
+    t15 = t6 - t13;
+    t14 = C6 * t15;
+    t3 = t0 - t10;
+    t1 = C6 * t3;
+    t5 = t18 + t12;
+    t8 = t17 + t11;
+    t16 = t2 + t1;
+    t4 = t7 - t14;
+    t9 = t2 - t1;
+    t6 = t7 + t14;
+    t13 = (-C25) * t5;
+    t15 = (-C26) * t8;
+    t0 = t13 + t15;
+    t10 = 0.08805597029305232 * t0;
+    y[353] = t10;
+    t3 = 0.06836553343262328 * t0;
+    y[366] = t3;
+    t18 = C26 * t5;
+    t12 = (-C25) * t8;
+    t17 = t18 + t12;
+    t11 = 0.035732076918905245 * t17;
+    y[113] = t11;
+    t2 = (-0.06689484897518211) * t17;
+    y[126] = t2;
+    t1 = (-C27) * t16;
+    t7 = (-C28) * t4;
+    t14 = t1 + t7;
+    t13 = 0.09037445652792069 * t14;
+    y[273] = t13;
+    t15 = (-0.0069065039150964765) * t14;
+    y[446] = t15;
+    t10 = C28 * t16;
+    t0 = (-C27) * t4;
+    t3 = t10 + t0;
+    y[33] = 0;
+    t5 = (-0.09220894546412896) * t3;
+    y[206] = t5;
+    t8 = C29 * t9;
+    t18 = C30 * t6;
+    t12 = t8 + t18;
+    y[46] = 0;
+    t11 = (-0.09230960613835858) * t12;
+    y[193] = t11;
+    t17 = (-C30) * t9;
+    t2 = C29 * t6;
+    t1 = t17 + t2;
+    t7 = 0.09027590607247186 * t1;
+    y[286] = t7;
+    t13 = (-0.009866002803861918) * t1;
+    y[433] = t13;
+    t14 = re[36];
+    t15 = im[36];
+    t16 = re[76];
+    t4 = im[76];
+    t10 = re[116];
+    t0 = im[116];
+    t3 = t16 + t10;
+    t5 = t4 + t0;
+    t8 = C5 * t3;
+    t18 = t14 - t8;
+    t12 = C5 * t5;
+    t11 = t15 - t12;
+    t9 = t16 - t10;
+    t6 = C6 * t9;
+    t17 = t4 - t0;
+    t2 = C6 * t17;
+    t7 = t14 + t3;
+    t1 = t15 + t5;
+    t13 = t18 + t2;
+    t8 = t11 - t6;
+    t12 = t18 - t2;
+    t16 = t11 + t6;
+    t10 = C31 * t7;
+    t9 = C32 * t1;
+    t4 = t10 + t9;
+    y[48] = 0;
+    t0 = (-0.09233615544660524) * t4;
+    y[191] = t0;
+    t17 = (-C32) * t7;
+    t14 = C31 * t1;
+    t3 = t17 + t14;
+    t15 = 0.0902499491453508 * t3;
+    y[288] = t15;
+    t5 = (-0.010028110732918314) * t3;
+    y[431] = t5;
+    t18 = (-C33) * t13;
+    t2 = (-C34) * t8;
+    t11 = t18 + t2;
+    t6 = 0.08982134522665142 * t11;
+    y[351] = t6;
+    t10 = 0.06433086169952303 * t11;
+    y[368] = t10;
+    t9 = C34 * t13;
+    t4 = (-C33) * t8;
+    t0 = t9 + t4;
+    t7 = 0.030744011971085474 * t0;
+    y[111] = t7;
+    t1 = (-0.07075761930636477) * t0;
+    y[128] = t1;
+    t17 = (-C35) * t12;
+    t14 = (-C36) * t16;
+    t15 = t17 + t14;
+    t3 = 0.09037972981913145 * t15;
+    y[271] = t3;
+    t5 = (-0.0062692385583066525) * t15;
+    y[448] = t5;
+    t18 = C36 * t12;
+    t2 = (-C35) * t16;
+    t6 = t18 + t2;
+    y[31] = 0;
+    t11 = (-0.09220356544559334) * t6;
+    y[208] = t11;
+    t10 = re[75];
+    t13 = im[75];
+    t8 = re[115];
+    t9 = im[115];
+    t4 = re[35];
+    t7 = im[35];
+    t0 = t8 + t4;
+    t1 = t9 + t7;
+    t17 = C5 * t0;
+    t14 = t10 - t17;
+    t3 = C5 * t1;
+    t15 = t13 - t3;
+    t5 = t8 - t4;
+    t12 = C6 * t5;
+    t16 = t9 - t7;
+    t18 = C6 * t16;
+    t2 = t10 + t0;
+    t6 = t13 + t1;
+    t11 = t14 + t18;
+    t17 = t15 - t12;
+    t3 = t14 - t18;
+    t8 = t15 + t12;
+    t4 = (-C37) * t2;
+    t5 = (-C38) * t6;
+    t9 = t4 + t5;
+    t7 = 0.09038523656129972 * t9;
+    y[269] = t7;
+    t16 = (-0.00561728389438704) * t9;
+    y[450] = t16;
+    t10 = C38 * t2;
+    t0 = (-C37) * t6;
+    t13 = t10 + t0;
+    y[29] = 0;
+    t1 = (-0.09219794792130263) * t13;
+    y[210] = t1;
+    t14 = C39 * t11;
+    t18 = C40 * t17;
+    t15 = t14 + t18;
+    y[50] = 0;
+    t12 = (-0.09236339352934352) * t15;
+    y[189] = t12;
+    t4 = (-C40) * t11;
+    t5 = C39 * t17;
+    t7 = t4 + t5;
+    t9 = 0.09022333432006113 * t7;
+    y[290] = t9;
+    t16 = (-0.010087996230996618) * t7;
+    y[429] = t16;
+    t2 = (-C41) * t3;
+    t6 = (-C42) * t8;
+    t10 = t2 + t6;
+    t0 = 0.09123336800239044 * t10;
+    y[349] = t0;
+    t13 = 0.06013646578493223 * t10;
+    y[370] = t13;
+    t1 = C42 * t3;
+    t14 = (-C41) * t8;
+    t18 = t1 + t14;
+    t15 = 0.025940569677611058 * t18;
+    y[109] = t15;
+    t12 = (-0.07424212545015943) * t18;
+    y[130] = t12;
+    t11 = re[114];
+    t17 = im[114];
+    t4 = re[34];
+    t5 = im[34];
+    t9 = re[74];
+    t7 = im[74];
+    t16 = t4 + t9;
+    t2 = t5 + t7;
+    t6 = C5 * t16;
+    t0 = t11 - t6;
+    t10 = C5 * t2;
+    t13 = t17 - t10;
+    t3 = t4 - t9;
+    t8 = C6 * t3;
+    t1 = t5 - t7;
+    t14 = C6 * t1;
+    t15 = t11 + t16;
+    t18 = t17 + t2;
+    t12 = t0 + t14;
+    t6 = t13 - t8;
+    t10 = t0 - t14;
+    t4 = t13 + t8;
+    t9 = (-C43) * t15;
+    t3 = (-C44) * t18;
+    t5 = t9 + t3;
+    t7 = 0.09230804514914263 * t5;
+    y[347] = t7;
+    t1 = 0.055828404603232656 * t5;
+    y[372] = t1;
+    t11 = C44 * t15;
+    t16 = (-C43) * t18;
+    t17 = t11 + t16;
+    t2 = 0.021405733355147217 * t17;
+    y[107] = t2;
+    t0 = (-0.07733112947219162) * t17;
+    y[132] = t0;
+    t14 = (-C45) * t12;
+    t13 = (-C46) * t6;
+    t8 = t14 + t13;
+    t9 = 0.09039269800496416 * t8;
+    y[267] = t9;
+    t3 = (-0.004963431358318882) * t8;
+    y[452] = t3;
+    t7 = C46 * t12;
+    t5 = (-C45) * t6;
+    t1 = t7 + t5;
+    y[27] = 0;
+    t15 = (-0.09219033746371506) * t1;
+    y[212] = t15;
+    t18 = C47 * t10;
+    t11 = C48 * t4;
+    t16 = t18 + t11;
+    y[52] = 0;
+    t2 = (-0.09238985249618288) * t16;
+    y[187] = t2;
+    t17 = (-C48) * t10;
+    t0 = C47 * t4;
+    t14 = t17 + t0;
+    t13 = 0.09019749580915963 * t14;
+    y[292] = t13;
+    t9 = (-0.01003984440986052) * t14;
+    y[427] = t9;
+    t8 = re[33];
+    t3 = im[33];
+    t12 = re[73];
+    t6 = im[73];
+    t7 = re[113];
+    t5 = im[113];
+    t1 = t12 + t7;
+    t15 = t6 + t5;
+    t18 = C5 * t1;
+    t11 = t8 - t18;
+    t16 = C5 * t15;
+    t2 = t3 - t16;
+    t10 = t12 - t7;
+    t4 = C6 * t10;
+    t17 = t6 - t5;
+    t0 = C6 * t17;
+    t13 = t8 + t1;
+    t14 = t3 + t15;
+    t9 = t11 + t0;
+    t18 = t2 - t4;
+    t16 = t11 - t0;
+    t12 = t2 + t4;
+    t7 = C49 * t13;
+    t10 = C50 * t14;
+    t6 = t7 + t10;
+    y[54] = 0;
+    t5 = (-0.0924138411025536) * t6;
+    y[185] = t5;
+    t17 = (-C50) * t13;
+    t8 = C49 * t14;
+    t1 = t17 + t8;
+    t3 = 0.09017408251741922 * t1;
+    y[294] = t3;
+    t15 = (-0.009877028183254045) * t1;
+    y[425] = t15;
+    t11 = (-C51) * t9;
+    t0 = (-C52) * t18;
+    t2 = t11 + t0;
+    t4 = 0.09306856714612953 * t2;
+    y[345] = t4;
+    t7 = 0.05145305538177841 * t2;
+    y[374] = t7;
+    t10 = C52 * t9;
+    t6 = (-C51) * t18;
+    t5 = t10 + t6;
+    t13 = 0.017216724201455764 * t5;
+    y[105] = t13;
+    t14 = (-0.08002143471070666) * t5;
+    y[134] = t14;
+    t17 = (-C53) * t16;
+    t8 = (-C54) * t12;
+    t3 = t17 + t8;
+    t1 = 0.09040393857576512 * t3;
+    y[265] = t1;
+    t15 = (-0.004319493689614513) * t3;
+    y[454] = t15;
+    t11 = C54 * t16;
+    t0 = (-C53) * t12;
+    t4 = t11 + t0;
+    y[25] = 0;
+    t2 = (-0.09217887477711376) * t4;
+    y[214] = t2;
+    t7 = re[72];
+    t9 = im[72];
+    t18 = re[112];
+    t10 = im[112];
+    t6 = re[32];
+    t13 = im[32];
+    t5 = t18 + t6;
+    t14 = t10 + t13;
+    t17 = C5 * t5;
+    t8 = t7 - t17;
+    t1 = C5 * t14;
+    t3 = t9 - t1;
+    t15 = t18 - t6;
+    t16 = C6 * t15;
+    t12 = t10 - t13;
+    t11 = C6 * t12;
+    t0 = t7 + t5;
+    t4 = t9 + t14;
+    t2 = t8 + t11;
+    t17 = t3 - t16;
+    t1 = t8 - t11;
+    t18 = t3 + t16;
+    t6 = (-C55) * t0;
+    t15 = (-C56) * t4;
+    t10 = t6 + t15;
+    t13 = 0.09042074637842189 * t10;
+    y[263] = t13;
+    t12 = (-0.003697175871317106) * t10;
+    y[456] = t12;
+    t7 = C56 * t0;
+    t5 = (-C55) * t4;
+    t9 = t7 + t5;
+    y[23] = 0;
+    t14 = (-0.09216174016588313) * t9;
+    y[216] = t14;
+    t8 = C57 * t2;
+    t11 = C58 * t17;
+    t3 = t8 + t11;
+    y[56] = 0;
+    t16 = (-0.09243355653535416) * t3;
+    y[183] = t16;
+    t6 = (-C58) * t2;
+    t15 = C57 * t17;
+    t13 = t6 + t15;
+    t10 = 0.09015484901466475 * t13;
+    y[296] = t10;
+    t12 = (-0.009594235155045096) * t13;
+    y[423] = t12;
+    t0 = (-C59) * t1;
+    t4 = (-C60) * t18;
+    t7 = t0 + t4;
+    t5 = 0.09354518542538132 * t7;
+    y[343] = t5;
+    t9 = 0.0470560814586414 * t7;
+    y[376] = t9;
+    t14 = C60 * t1;
+    t8 = (-C59) * t18;
+    t11 = t14 + t8;
+    t3 = 0.013440088856608934 * t11;
+    y[103] = t3;
+    t16 = (-0.08232273400567668) * t11;
+    y[136] = t16;
+    t2 = re[111];
+    t17 = im[111];
+    t6 = re[31];
+    t15 = im[31];
+    t10 = re[71];
+    t13 = im[71];
+    t12 = t6 + t10;
+    t0 = t15 + t13;
+    t4 = C5 * t12;
+    t5 = t2 - t4;
+    t7 = C5 * t0;
+    t9 = t17 - t7;
+    t1 = t6 - t10;
+    t18 = C6 * t1;
+    t14 = t15 - t13;
+    t8 = C6 * t14;
+    t3 = t2 + t12;
+    t11 = t17 + t0;
+    t16 = t5 + t8;
+    t4 = t9 - t18;
+    t7 = t5 - t8;
+    t6 = t9 + t18;
+    t10 = (-C61) * t3;
+    t1 = (-C62) * t11;
+    t15 = t10 + t1;
+    t13 = 0.09377475550498254 * t15;
+    y[341] = t13;
+    t14 = 0.042680753490592846 * t15;
+    y[378] = t14;
+    t2 = C62 * t3;
+    t12 = (-C61) * t11;
+    t17 = t2 + t12;
+    t0 = 0.010127595928892156 * t17;
+    y[101] = t0;
+    t5 = (-0.08425593717085343) * t17;
+    y[138] = t5;
+    t8 = (-C63) * t16;
+    t9 = (-C64) * t4;
+    t18 = t8 + t9;
+    t10 = 0.09044476051911167 * t18;
+    y[261] = t10;
+    t1 = (-0.003106496364189138) * t18;
+    y[458] = t1;
+    t13 = C64 * t16;
+    t15 = (-C63) * t4;
+    t14 = t13 + t15;
+    y[21] = 0;
+    t3 = (-0.09213727014703564) * t14;
+    y[218] = t3;
+    t11 = C65 * t7;
+    t2 = C66 * t6;
+    t12 = t11 + t2;
+    y[58] = 0;
+    t0 = (-0.09244707397236758) * t12;
+    y[181] = t0;
+    t17 = (-C66) * t7;
+    t5 = C65 * t6;
+    t8 = t17 + t5;
+    t9 = 0.09014166674246678 * t8;
+    y[298] = t9;
+    t10 = (-0.009185219825295927) * t8;
+    y[421] = t10;
+    t18 = re[30];
+    t1 = im[30];
+    t16 = re[70];
+    t4 = im[70];
+    t13 = re[110];
+    t15 = im[110];
+    t14 = t16 + t13;
+    t3 = t4 + t15;
+    t11 = C5 * t14;
+    t2 = t18 - t11;
+    t12 = C5 * t3;
+    t0 = t1 - t12;
+    t7 = t16 - t13;
+    t6 = C6 * t7;
+    t17 = t4 - t15;
+    t5 = C6 * t17;
+    t9 = t18 + t14;
+    t8 = t1 + t3;
+    t10 = t2 + t5;
+    t11 = t0 - t6;
+    t12 = t2 - t5;
+    t16 = t0 + t6;
+    t13 = C67 * t9;
+    t7 = C68 * t8;
+    t4 = t13 + t7;
+    y[60] = 0;
+    t15 = (-0.09245244567865918) * t4;
+    y[179] = t15;
+    t17 = (-C68) * t9;
+    t18 = C67 * t8;
+    t14 = t17 + t18;
+    t1 = 0.09013642929791008 * t14;
+    y[300] = t1;
+    t3 = (-0.008644252539109377) * t14;
+    y[419] = t3;
+    t2 = (-C69) * t10;
+    t5 = (-C70) * t11;
+    t0 = t2 + t5;
+    t6 = 0.09379849794073448 * t0;
+    y[339] = t6;
+    t13 = 0.038368358115737966 * t0;
+    y[380] = t13;
+    t7 = C70 * t10;
+    t4 = (-C69) * t11;
+    t15 = t7 + t4;
+    t9 = 0.007312017970662098 * t15;
+    y[99] = t9;
+    t8 = (-0.08585194204681529) * t15;
+    y[140] = t8;
+    t17 = (-C71) * t12;
+    t18 = (-C72) * t16;
+    t1 = t17 + t18;
+    t14 = 0.09047736631347802 * t1;
+    y[259] = t14;
+    t3 = (-0.002556868825188347) * t1;
+    y[460] = t3;
+    t2 = C72 * t12;
+    t5 = (-C71) * t16;
+    t6 = t2 + t5;
+    y[19] = 0;
+    t0 = (-0.0921040661645779) * t6;
+    y[220] = t0;
+    t13 = re[69];
+    t10 = im[69];
+    t11 = re[109];
+    t7 = im[109];
+    t4 = re[29];
+    t9 = im[29];
+    t15 = t11 + t4;
+    t8 = t7 + t9;
+    t17 = C5 * t15;
+    t18 = t13 - t17;
+    t14 = C5 * t8;
+    t1 = t10 - t14;
+    t3 = t11 - t4;
+    t12 = C6 * t3;
+    t16 = t7 - t9;
+    t2 = C6 * t16;
+    t5 = t13 + t15;
+    t6 = t10 + t8;
+    t0 = t18 + t2;
+    t17 = t1 - t12;
+    t14 = t18 - t2;
+    t11 = t1 + t12;
+    t4 = (-C73) * t5;
+    t3 = (-C74) * t6;
+    t7 = t4 + t3;
+    t9 = 0.09051962918570353 * t7;
+    y[257] = t9;
+    t16 = (-0.0020558588746538045) * t7;
+    y[462] = t16;
+    t13 = C74 * t5;
+    t15 = (-C73) * t6;
+    t10 = t13 + t15;
+    y[17] = 0;
+    t8 = (-0.092061063531726) * t10;
+    y[222] = t8;
+    t18 = C75 * t0;
+    t2 = C76 * t17;
+    t1 = t18 + t2;
+    y[62] = 0;
+    t12 = (-0.09244769863880027) * t1;
+    y[177] = t12;
+    t4 = (-C76) * t0;
+    t3 = C75 * t17;
+    t9 = t4 + t3;
+    t7 = 0.0901410576578251 * t9;
+    y[302] = t7;
+    t16 = (-0.007964474361442294) * t9;
+    y[417] = t16;
+    t5 = (-C77) * t14;
+    t6 = (-C78) * t11;
+    t13 = t5 + t6;
+    t15 = 0.09365978084389547 * t13;
+    y[337] = t15;
+    t10 = 0.03415636549737041 * t13;
+    y[382] = t10;
+    t8 = C78 * t14;
+    t18 = (-C77) * t11;
+    t2 = t8 + t18;
+    t1 = 0.0050047570007893775 * t2;
+    y[97] = t1;
+    t12 = (-0.0871493500245666) * t2;
+    y[142] = t12;
+    t0 = re[108];
+    t17 = im[108];
+    t4 = re[28];
+    t3 = im[28];
+    t7 = re[68];
+    t9 = im[68];
+    t16 = t4 + t7;
+    t5 = t3 + t9;
+    t6 = C5 * t16;
+    t15 = t0 - t6;
+    t13 = C5 * t5;
+    t10 = t17 - t13;
+    t14 = t4 - t7;
+    t11 = C6 * t14;
+    t8 = t3 - t9;
+    t18 = C6 * t8;
+    t1 = t0 + t16;
+    t2 = t17 + t5;
+    t12 = t15 + t18;
+    t6 = t10 - t11;
+    t13 = t15 - t18;
+    t4 = t10 + t11;
+    t7 = (-C79) * t1;
+    t14 = (-C80) * t2;
+    t3 = t7 + t14;
+    t9 = 0.09340276040701101 * t3;
+    y[335] = t9;
+    t8 = 0.030076992374384853 * t3;
+    y[384] = t8;
+    t0 = C80 * t1;
+    t16 = (-C79) * t2;
+    t17 = t0 + t16;
+    t5 = 0.0031944649282448214 * t17;
+    y[95] = t5;
+    t15 = (-0.08819068515910766) * t17;
+    y[144] = t15;
+    t18 = (-C81) * t12;
+    t10 = (-C82) * t6;
+    t11 = t18 + t10;
+    t7 = 0.09057223570062113 * t11;
+    y[255] = t7;
+    t14 = (-0.0016093731094369787) * t11;
+    y[464] = t14;
+    t9 = C82 * t12;
+    t3 = (-C81) * t6;
+    t8 = t9 + t3;
+    y[15] = 0;
+    t1 = (-0.092007592270091) * t8;
+    y[224] = t1;
+    t2 = C83 * t13;
+    t0 = C84 * t4;
+    t16 = t2 + t0;
+    y[64] = 0;
+    t5 = (-0.09243093246183026) * t16;
+    y[175] = t5;
+    t17 = (-C84) * t13;
+    t15 = C83 * t4;
+    t18 = t17 + t15;
+    t10 = 0.09015740847118053 * t18;
+    y[304] = t10;
+    t7 = (-0.00713921434866316) * t18;
+    y[415] = t7;
+    t11 = re[27];
+    t14 = im[27];
+    t12 = re[67];
+    t6 = im[67];
+    t9 = re[107];
+    t3 = im[107];
+    t8 = t12 + t9;
+    t1 = t6 + t3;
+    t2 = C5 * t8;
+    t0 = t11 - t2;
+    t16 = C5 * t1;
+    t5 = t14 - t16;
+    t13 = t12 - t9;
+    t4 = C6 * t13;
+    t17 = t6 - t3;
+    t15 = C6 * t17;
+    t10 = t11 + t8;
+    t18 = t14 + t1;
+    t7 = t0 + t15;
+    t2 = t5 - t4;
+    t16 = t0 - t15;
+    t12 = t5 + t4;
+    t9 = C85 * t10;
+    t13 = C86 * t18;
+    t6 = t9 + t13;
+    y[66] = 0;
+    t3 = (-0.09240025394681477) * t6;
+    y[173] = t3;
+    t17 = (-C86) * t10;
+    t11 = C85 * t18;
+    t8 = t17 + t11;
+    t14 = 0.09018734232191579 * t8;
+    y[306] = t14;
+    t1 = (-0.006160480419908887) * t8;
+    y[413] = t1;
+    t0 = (-C87) * t7;
+    t15 = (-C88) * t2;
+    t5 = t0 + t15;
+    t4 = 0.09306915998476316 * t5;
+    y[333] = t4;
+    t9 = 0.026158716441240817 * t5;
+    y[386] = t9;
+    t13 = C88 * t7;
+    t6 = (-C87) * t2;
+    t3 = t13 + t6;
+    t10 = 0.0018479886878230783 * t3;
+    y[93] = t10;
+    t18 = (-0.08901973889759318) * t3;
+    y[146] = t18;
+    t17 = (-C89) * t16;
+    t11 = (-C90) * t12;
+    t14 = t17 + t11;
+    t8 = 0.09063548315755285 * t14;
+    y[253] = t8;
+    t1 = (-0.0012211593971509166) * t14;
+    y[466] = t1;
+    t0 = C90 * t16;
+    t15 = (-C89) * t12;
+    t4 = t0 + t15;
+    y[13] = 0;
+    t5 = (-0.09194338732488894) * t4;
+    y[226] = t5;
+    t9 = re[66];
+    t7 = im[66];
+    t2 = re[106];
+    t13 = im[106];
+    t6 = re[26];
+    t10 = im[26];
+    t3 = t2 + t6;
+    t18 = t13 + t10;
+    t17 = C5 * t3;
+    t11 = t9 - t17;
+    t8 = C5 * t18;
+    t14 = t7 - t8;
+    t1 = t2 - t6;
+    t16 = C6 * t1;
+    t12 = t13 - t10;
+    t0 = C6 * t12;
+    t15 = t9 + t3;
+    t4 = t7 + t18;
+    t5 = t11 + t0;
+    t17 = t14 - t16;
+    t8 = t11 - t0;
+    t2 = t14 + t16;
+    t6 = (-C91) * t15;
+    t1 = (-C92) * t4;
+    t13 = t6 + t1;
+    t10 = 0.0907092475124274 * t13;
+    y[251] = t10;
+    t12 = (-0.0008932729373177886) * t13;
+    y[468] = t12;
+    t9 = C92 * t15;
+    t3 = (-C91) * t4;
+    t7 = t9 + t3;
+    y[11] = 0;
+    t18 = (-0.09186861937303194) * t7;
+    y[228] = t18;
+    t11 = C93 * t5;
+    t0 = C94 * t17;
+    t14 = t11 + t0;
+    y[68] = 0;
+    t16 = (-0.09235379845708279) * t14;
+    y[171] = t16;
+    t6 = (-C94) * t5;
+    t1 = C93 * t17;
+    t10 = t6 + t1;
+    t13 = 0.09023270804834159 * t10;
+    y[308] = t13;
+    t12 = (-0.005020331172090252) * t10;
+    y[411] = t12;
+    t15 = (-C95) * t8;
+    t4 = (-C96) * t2;
+    t9 = t15 + t4;
+    t3 = 0.09269655281084341 * t9;
+    y[331] = t3;
+    t7 = 0.02242428004659937 * t9;
+    y[388] = t7;
+    t18 = C96 * t8;
+    t11 = (-C95) * t2;
+    t0 = t18 + t11;
+    t14 = 0.0009125736608240058 * t0;
+    y[91] = t14;
+    t16 = (-0.0896783027408053) * t0;
+    y[148] = t16;
+    t5 = re[105];
+    t17 = im[105];
+    t6 = re[25];
+    t1 = im[25];
+    t13 = re[65];
+    t10 = im[65];
+    t12 = t6 + t13;
+    t15 = t1 + t10;
+    t4 = C5 * t12;
+    t3 = t5 - t4;
+    t9 = C5 * t15;
+    t7 = t17 - t9;
+    t8 = t6 - t13;
+    t2 = C6 * t8;
+    t18 = t1 - t10;
+    t11 = C6 * t18;
+    t14 = t5 + t12;
+    t0 = t17 + t15;
+    t16 = t3 + t11;
+    t4 = t7 - t2;
+    t9 = t3 - t11;
+    t6 = t7 + t2;
+    t13 = (-C97) * t14;
+    t8 = (-C98) * t0;
+    t1 = t13 + t8;
+    t10 = 0.0923510349517541 * t1;
+    y[329] = t10;
+    t18 = 0.01889140710216753 * t1;
+    y[390] = t18;
+    t5 = C98 * t14;
+    t12 = (-C97) * t0;
+    t17 = t5 + t12;
+    y[89] = 0;
+    t15 = (-0.09023540816501756) * t17;
+    y[150] = t15;
+    t3 = (-C99) * t16;
+    t11 = (-C100) * t4;
+    t7 = t3 + t11;
+    t2 = 0.09079298461985869 * t7;
+    y[249] = t2;
+    t13 = (-0.0006246989869539086) * t7;
+    y[470] = t13;
+    t8 = C100 * t16;
+    t10 = (-C99) * t4;
+    t1 = t8 + t10;
+    y[9] = 0;
+    t18 = (-0.09178389022262212) * t1;
+    y[230] = t18;
+    t14 = C101 * t9;
+    t0 = C102 * t6;
+    t5 = t14 + t0;
+    y[70] = 0;
+    t12 = (-0.09228962014198679) * t5;
+    y[169] = t12;
+    t17 = (-C102) * t9;
+    t15 = C101 * t6;
+    t3 = t17 + t15;
+    t11 = 0.09029545598424361 * t3;
+    y[310] = t11;
+    t2 = (-0.003709325825660647) * t3;
+    y[409] = t2;
+    t7 = re[24];
+    t13 = im[24];
+    t16 = re[64];
+    t4 = im[64];
+    t8 = re[104];
+    t10 = im[104];
+    t1 = t16 + t8;
+    t18 = t4 + t10;
+    t14 = C5 * t1;
+    t0 = t7 - t14;
+    t5 = C5 * t18;
+    t12 = t13 - t5;
+    t9 = t16 - t8;
+    t6 = C6 * t9;
+    t17 = t4 - t10;
+    t15 = C6 * t17;
+    t11 = t7 + t1;
+    t3 = t13 + t18;
+    t2 = t0 + t15;
+    t14 = t12 - t6;
+    t5 = t0 - t15;
+    t16 = t12 + t6;
+    t8 = C103 * t11;
+    t9 = C104 * t3;
+    t4 = t8 + t9;
+    y[72] = 0;
+    t10 = (-0.09220563580151571) * t4;
+    y[167] = t10;
+    t17 = (-C104) * t11;
+    t7 = C103 * t3;
+    t1 = t17 + t7;
+    t13 = 0.09037770046151931 * t1;
+    y[312] = t13;
+    t18 = (-0.0022183882598526463) * t1;
+    y[407] = t18;
+    t0 = (-C105) * t2;
+    t15 = (-C106) * t14;
+    t12 = t0 + t15;
+    t6 = 0.0919501276997701 * t12;
+    y[327] = t6;
+    t8 = 0.015573164605041014 * t12;
+    y[392] = t8;
+    t9 = C106 * t2;
+    t4 = (-C105) * t14;
+    t10 = t9 + t4;
+    y[87] = 0;
+    t11 = (-0.09062883915227195) * t10;
+    y[152] = t11;
+    t3 = (-C107) * t5;
+    t17 = (-C108) * t16;
+    t7 = t3 + t17;
+    t13 = 0.09088573803577533 * t7;
+    y[247] = t13;
+    t1 = (-0.0004130921772342458) * t7;
+    y[472] = t1;
+    t18 = C108 * t5;
+    t0 = (-C107) * t16;
+    t15 = t18 + t0;
+    y[7] = 0;
+    t6 = (-0.09169022019772878) * t15;
+    y[232] = t6;
+}
+
+/**
+ *  Part 3 of ApplyWindowedIMDCT_W10_240_K80().
+ * 
+ *  @param {Number[]} X 
+ *    - The input block (240 points, only the first 80 points are used).
+ *  @param {Number[]} y 
+ *    - The array that would contain the output block (480 points).
+ *  @param {Number[]} re 
+ *    - The scratch buffer (real part, 120 points).
+ *  @param {Number[]} im 
+ *    - The scratch buffer (imaginary part, 120 points).
+ */
+function ApplyWindowedIMDCT_W10_240_K80_Part3(X, y, re, im) {
+    let t0, t1, t10, t11, t12, t13, t14, t15, t16, t17, t18, t2, t3, t4, t5, t6, t7, t8, t9;
+    const C0 = 0.5;
+    const C1 = 0.8660254037844386;
+    const C2 = 0.7320972111532454;
+    const C3 = 0.6812001713311883;
+    const C4 = 0.2934146972328567;
+    const C5 = 0.9559852590117439;
+    const C6 = 0.974614868564045;
+    const C7 = 0.22388804785849836;
+    const C8 = 0.9716007669441208;
+    const C9 = 0.23662618129360988;
+    const C10 = 0.7231178558632475;
+    const C11 = 0.6907246676728287;
+    const C12 = 0.2808760992712921;
+    const C13 = 0.9597440371568574;
+    const C14 = 0.2682893746360714;
+    const C15 = 0.9633383681019799;
+    const C16 = 0.968420186534595;
+    const C17 = 0.24932377005071168;
+    const C18 = 0.7140145980512682;
+    const C19 = 0.7001308118985237;
+    const C20 = 0.7047889975136701;
+    const C21 = 0.709416992313883;
+    const C22 = 0.2556566799976644;
+    const C23 = 0.9667676359770075;
+    const C24 = 0.9650736723115474;
+    const C25 = 0.26197863846333747;
+    const C26 = 0.9615617976829619;
+    const C27 = 0.27458861818493235;
+    const C28 = 0.6954426350096117;
+    const C29 = 0.7185816177796981;
+    const C30 = 0.24298017990326387;
+    const C31 = 0.970031253194544;
+    const C32 = 0.23026204640590237;
+    const C33 = 0.97312866055058;
+    const C34 = 0.9578851643904772;
+    const C35 = 0.2871515485603873;
+    const C36 = 0.6859771119901928;
+    const C37 = 0.7276231179845748;
+    const C38 = 0.6763940503240542;
+    const C39 = 0.736539943713999;
+    const C40 = 0.21750445869228147;
+    const C41 = 0.9760593273203108;
+    const C42 = 0.9540444024062804;
+    const C43 = 0.2996652769962566;
+    const C44 = 0.9500401698251654;
+    const C45 = 0.3121276593295937;
+    const C46 = 0.6666950920194786;
+    const C47 = 0.7453305671157858;
+    const C48 = 0.2047096027093796;
+    const C49 = 0.9788227513490724;
+    const C50 = 0.19187967078990142;
+    const C51 = 0.9814184591383835;
+    const C52 = 0.945873152751771;
+    const C53 = 0.32453656019534216;
+    const C54 = 0.6568818989430413;
+    const C55 = 0.7539934819618695;
+    const C56 = 0.6469561525348573;
+    const C57 = 0.7625272039063882;
+    const C58 = 0.17901686127663266;
+    const C59 = 0.9838460059270774;
+    const C60 = 0.9415440651830208;
+    const C61 = 0.33688985339222005;
+    const C62 = 0.9370536488857836;
+    const C63 = 0.34918542224703286;
+    const C64 = 0.6369195535204759;
+    const C65 = 0.7709302707400181;
+    const C66 = 0.16612337814576547;
+    const C67 = 0.9861049757675088;
+    const C68 = 0.15320143062925848;
+    const C69 = 0.9881949815968246;
+    const C70 = 0.9324026732697752;
+    const C71 = 0.361421159977355;
+    const C72 = 0.6267738216194696;
+    const C73 = 0.7792012426405167;
+    const C74 = 0.6165206952507691;
+    const C75 = 0.7873387024194278;
+    const C76 = 0.14025323283629626;
+    const C77 = 0.9901156653032855;
+    const C78 = 0.927591935255724;
+    const C79 = 0.37359497005251635;
+    const C80 = 0.9226222591388232;
+    const C81 = 0.3857047665528313;
+    const C82 = 0.6061619312347947;
+    const C83 = 0.79534125576491;
+    const C84 = 0.1272810033739132;
+    const C85 = 0.991866697787626;
+    const C86 = 0.1142869649668464;
+    const C87 = 0.9934477790194444;
+    const C88 = 0.9174944964474913;
+    const C89 = 0.39774847452701106;
+    const C90 = 0.5956993044924334;
+    const C91 = 0.8032075314806449;
+    const C92 = 0.5851346077409155;
+    const C93 = 0.8109361817207843;
+    const C94 = 0.10127334407668342;
+    const C95 = 0.9948586380886109;
+    const C96 = 0.9122095257974677;
+    const C97 = 0.4097240303476953;
+    const C98 = 0.9067682527412662;
+    const C99 = 0.4216293820650445;
+    const C100 = 0.5744696511866426;
+    const C101 = 0.8185258822208966;
+    const C102 = 0.08824237052036951;
+    const C103 = 0.9960990332516871;
+    const C104 = 0.0751962770881399;
+    const C105 = 0.9971687519733476;
+    const C106 = 0.9011716096130131;
+    const C107 = 0.4334624897583309;
+    const C108 = 0.5637062622150166;
+    const C109 = 0.8259753325248732;
+    const C110 = 0.5528462850773279;
+    const C111 = 0.8332832562077542;
+    const C112 = 0.062137299160942724;
+    const C113 = 0.9980676109627962;
+    const C114 = 0.895420555368697;
+    const C115 = 0.4452213258854682;
+    const C116 = 0.8895160754218561;
+    const C117 = 0.4569038756304206;
+    const C118 = 0.5418915805747517;
+    const C119 = 0.840448401094438;
+    const C120 = 0.049067674327418015;
+    const C121 = 0.9987954562051724;
+    const C122 = 0.035989642000498374;
+    const C123 = 0.9993521629879409;
+    const C124 = 0.8834591814747328;
+    const C125 = 0.46850813724843143;
+    const C126 = 0.5308440257395095;
+    const C127 = 0.8474695394742344;
+    const C128 = 0.5197055135132492;
+    const C129 = 0.8543454683112272;
+    const C130 = 0.02290544303369714;
+    const C131 = 0.9997376359222604;
+    const C132 = 0.8772509113449243;
+    const C133 = 0.4800321224090111;
+    const C134 = 0.8708923287875567;
+    const C135 = 0.49147385653662823;
+    const C136 = 0.5084779524226998;
+    const C137 = 0.861075009450407;
+    const C138 = 0.009817319337149617;
+    const C139 = 0.999951808959328;
+    t12 = re[63];
+    t8 = im[63];
+    t2 = re[103];
+    t14 = im[103];
+    t9 = re[23];
+    t4 = im[23];
+    t10 = t2 + t9;
+    t11 = t14 + t4;
+    t3 = C0 * t10;
+    t17 = t12 - t3;
+    t13 = C0 * t11;
+    t7 = t8 - t13;
+    t1 = t2 - t9;
+    t5 = C1 * t1;
+    t16 = t14 - t4;
+    t18 = C1 * t16;
+    t0 = t12 + t10;
+    t15 = t8 + t11;
+    t6 = t17 + t18;
+    t3 = t7 - t5;
+    t13 = t17 - t18;
+    t2 = t7 + t5;
+    t9 = (-C2) * t0;
+    t1 = (-C3) * t15;
+    t14 = t9 + t1;
+    t4 = 0.09098616076102845 * t14;
+    y[245] = t4;
+    t16 = (-0.0002536339642894417) * t14;
+    y[474] = t16;
+    t12 = C3 * t0;
+    t10 = (-C2) * t15;
+    t8 = t12 + t10;
+    y[5] = 0;
+    t11 = (-0.0915890203920188) * t8;
+    y[234] = t11;
+    t17 = C4 * t6;
+    t18 = C5 * t3;
+    t7 = t17 + t18;
+    y[74] = 0;
+    t5 = (-0.09209942840309658) * t7;
+    y[165] = t5;
+    t9 = (-C5) * t6;
+    t1 = C4 * t3;
+    t4 = t9 + t1;
+    t14 = 0.0904819223943538 * t4;
+    y[314] = t14;
+    t16 = (-0.0005378119076130155) * t4;
+    y[405] = t16;
+    t0 = (-C6) * t13;
+    t15 = (-C7) * t2;
+    t12 = t0 + t15;
+    t10 = 0.09160734286600784 * t12;
+    y[325] = t10;
+    t8 = 0.012478133323927637 * t12;
+    y[394] = t8;
+    t11 = C7 * t13;
+    t17 = (-C6) * t2;
+    t18 = t11 + t17;
+    y[85] = 0;
+    t7 = (-0.09096796253027797) * t18;
+    y[154] = t7;
+    t5 = re[102];
+    t6 = im[102];
+    t3 = re[22];
+    t9 = im[22];
+    t1 = re[62];
+    t14 = im[62];
+    t4 = t3 + t1;
+    t16 = t9 + t14;
+    t0 = C0 * t4;
+    t15 = t5 - t0;
+    t10 = C0 * t16;
+    t12 = t6 - t10;
+    t8 = t3 - t1;
+    t13 = C1 * t8;
+    t2 = t9 - t14;
+    t11 = C1 * t2;
+    t17 = t5 + t4;
+    t18 = t6 + t16;
+    t7 = t15 + t11;
+    t0 = t12 - t13;
+    t10 = t15 - t11;
+    t3 = t12 + t13;
+    t1 = (-C8) * t17;
+    t8 = (-C9) * t18;
+    t9 = t1 + t8;
+    t14 = 0.0913148375512127 * t9;
+    y[323] = t14;
+    t2 = 0.009610222402322096 * t9;
+    y[396] = t2;
+    t5 = C9 * t17;
+    t4 = (-C8) * t18;
+    t6 = t5 + t4;
+    y[83] = 0;
+    t16 = (-0.09125935671363042) * t6;
+    y[156] = t16;
+    t15 = (-C10) * t7;
+    t11 = (-C11) * t0;
+    t12 = t15 + t11;
+    t13 = 0.09109256795830346 * t12;
+    y[243] = t13;
+    t1 = (-0.00013998679778220064) * t12;
+    y[476] = t1;
+    t8 = C11 * t7;
+    t14 = (-C10) * t0;
+    t9 = t8 + t14;
+    y[3] = 0;
+    t2 = (-0.09148203327792692) * t9;
+    y[236] = t2;
+    t17 = C12 * t10;
+    t18 = C13 * t3;
+    t5 = t17 + t18;
+    y[76] = 0;
+    t4 = (-0.09196817316373651) * t5;
+    y[163] = t4;
+    t6 = (-C13) * t10;
+    t16 = C12 * t3;
+    t15 = t6 + t16;
+    t11 = 0.09061105648469268 * t15;
+    y[316] = t11;
+    t13 = 0.0013420618236381805 * t15;
+    y[403] = t13;
+    t12 = re[21];
+    t1 = im[21];
+    t7 = re[61];
+    t0 = im[61];
+    t8 = re[101];
+    t14 = im[101];
+    t9 = t7 + t8;
+    t2 = t0 + t14;
+    t17 = C0 * t9;
+    t18 = t12 - t17;
+    t5 = C0 * t2;
+    t4 = t1 - t5;
+    t10 = t7 - t8;
+    t3 = C1 * t10;
+    t6 = t0 - t14;
+    t16 = C1 * t6;
+    t11 = t12 + t9;
+    t15 = t1 + t2;
+    t13 = t18 + t16;
+    t17 = t4 - t3;
+    t5 = t18 - t16;
+    t7 = t4 + t3;
+    t8 = C14 * t11;
+    t10 = C15 * t15;
+    t0 = t8 + t10;
+    y[78] = 0;
+    t14 = (-0.09180855561597562) * t0;
+    y[161] = t14;
+    t6 = (-C15) * t11;
+    t12 = C14 * t15;
+    t9 = t6 + t12;
+    t1 = 0.0907685920709905 * t9;
+    y[318] = t1;
+    t2 = 0.0034302519777189918 * t9;
+    y[401] = t2;
+    t18 = (-C16) * t13;
+    t16 = (-C17) * t17;
+    t4 = t18 + t16;
+    t3 = 0.09106723054204843 * t4;
+    y[321] = t3;
+    t8 = 0.006970132619098952 * t4;
+    y[398] = t8;
+    t10 = C17 * t13;
+    t0 = (-C16) * t17;
+    t14 = t10 + t0;
+    y[81] = 0;
+    t11 = (-0.09150748610374818) * t14;
+    y[158] = t11;
+    t15 = (-C18) * t5;
+    t6 = (-C19) * t7;
+    t12 = t15 + t6;
+    t1 = 0.09120297040746775 * t12;
+    y[241] = t1;
+    t9 = (-6.461799509184562e-05) * t12;
+    y[478] = t9;
+    t2 = C19 * t5;
+    t18 = (-C18) * t7;
+    t16 = t2 + t18;
+    y[1] = 0;
+    t3 = (-0.0913712930193225) * t16;
+    y[238] = t3;
+    t4 = re[60];
+    t8 = im[60];
+    t13 = re[100];
+    t17 = im[100];
+    t10 = re[20];
+    t0 = im[20];
+    t14 = t13 + t10;
+    t11 = t17 + t0;
+    t15 = C0 * t14;
+    t6 = t4 - t15;
+    t1 = C0 * t11;
+    t12 = t8 - t1;
+    t9 = t13 - t10;
+    t5 = C1 * t9;
+    t7 = t17 - t0;
+    t2 = C1 * t7;
+    t18 = t4 + t14;
+    t16 = t8 + t11;
+    t3 = t6 + t2;
+    t15 = t12 - t5;
+    t1 = t6 - t2;
+    t13 = t12 + t5;
+    t10 = C20 * t18;
+    t9 = C21 * t16;
+    t17 = t10 + t9;
+    y[0] = 0;
+    t0 = (-0.09131522703664538) * t17;
+    y[239] = t0;
+    t7 = (-C21) * t18;
+    t4 = C20 * t16;
+    t14 = t7 + t4;
+    t8 = 0.09125896746650057 * t14;
+    y[240] = t8;
+    t11 = (-3.298655833518676e-05) * t14;
+    y[479] = t11;
+    t6 = C22 * t3;
+    t2 = C23 * t15;
+    t12 = t6 + t2;
+    y[80] = 0;
+    t5 = (-0.09161677326719576) * t12;
+    y[159] = t5;
+    t10 = (-C23) * t3;
+    t9 = C22 * t15;
+    t17 = t10 + t9;
+    t0 = 0.09095859891320969 * t17;
+    y[320] = t0;
+    t18 = 0.005734686242618052 * t17;
+    y[399] = t18;
+    t16 = (-C24) * t1;
+    t7 = (-C25) * t13;
+    t4 = t16 + t7;
+    t8 = 0.09085926593715277 * t4;
+    y[319] = t8;
+    t14 = 0.004554985403384171 * t4;
+    y[400] = t14;
+    t11 = C25 * t1;
+    t6 = (-C24) * t13;
+    t2 = t11 + t6;
+    y[79] = 0;
+    t12 = (-0.09171693439717513) * t2;
+    y[160] = t12;
+    t5 = re[99];
+    t3 = im[99];
+    t15 = re[19];
+    t10 = im[19];
+    t9 = re[59];
+    t0 = im[59];
+    t17 = t15 + t9;
+    t18 = t10 + t0;
+    t16 = C0 * t17;
+    t7 = t5 - t16;
+    t8 = C0 * t18;
+    t4 = t3 - t8;
+    t14 = t15 - t9;
+    t1 = C1 * t14;
+    t13 = t10 - t0;
+    t11 = C1 * t13;
+    t6 = t5 + t17;
+    t2 = t3 + t18;
+    t12 = t7 + t11;
+    t16 = t4 - t1;
+    t8 = t7 - t11;
+    t15 = t4 + t1;
+    t9 = (-C26) * t6;
+    t14 = (-C27) * t2;
+    t10 = t9 + t14;
+    t0 = 0.09068604919647034 * t10;
+    y[317] = t0;
+    t13 = 0.002359532354512745 * t10;
+    y[402] = t13;
+    t5 = C27 * t6;
+    t17 = (-C26) * t2;
+    t3 = t5 + t17;
+    y[77] = 0;
+    t18 = (-0.09189212020119278) * t3;
+    y[162] = t18;
+    t7 = C28 * t12;
+    t11 = C29 * t16;
+    t4 = t7 + t11;
+    y[2] = 0;
+    t1 = (-0.09142700285638952) * t4;
+    y[237] = t1;
+    t9 = (-C29) * t12;
+    t14 = C28 * t16;
+    t0 = t9 + t14;
+    t10 = 0.09114739708161547 * t0;
+    y[242] = t10;
+    t13 = (-9.808283613558938e-05) * t0;
+    y[477] = t13;
+    t6 = C30 * t8;
+    t2 = C31 * t15;
+    t5 = t6 + t2;
+    y[82] = 0;
+    t17 = (-0.09138855060144747) * t5;
+    y[157] = t17;
+    t3 = (-C31) * t8;
+    t18 = C30 * t15;
+    t7 = t3 + t18;
+    t11 = 0.09118574786983594 * t7;
+    y[322] = t11;
+    t4 = 0.008261818993155777 * t7;
+    y[397] = t4;
+    t1 = re[18];
+    t12 = im[18];
+    t16 = re[58];
+    t9 = im[58];
+    t14 = re[98];
+    t10 = im[98];
+    t0 = t16 + t14;
+    t13 = t9 + t10;
+    t6 = C0 * t0;
+    t2 = t1 - t6;
+    t5 = C0 * t13;
+    t17 = t12 - t5;
+    t8 = t16 - t14;
+    t15 = C1 * t8;
+    t3 = t9 - t10;
+    t18 = C1 * t3;
+    t11 = t1 + t0;
+    t7 = t12 + t13;
+    t4 = t2 + t18;
+    t6 = t17 - t15;
+    t5 = t2 - t18;
+    t16 = t17 + t15;
+    t14 = C32 * t11;
+    t8 = C33 * t7;
+    t9 = t14 + t8;
+    y[84] = 0;
+    t10 = (-0.09111936155223256) * t9;
+    y[155] = t10;
+    t3 = (-C33) * t11;
+    t1 = C32 * t7;
+    t0 = t3 + t1;
+    t12 = 0.09145513304059315 * t0;
+    y[324] = t12;
+    t13 = 0.011015645156279247 * t0;
+    y[395] = t13;
+    t2 = (-C34) * t4;
+    t18 = (-C35) * t6;
+    t17 = t2 + t18;
+    t15 = 0.09054319692897142 * t17;
+    y[315] = t15;
+    t14 = 0.00037670493957557815 * t17;
+    y[404] = t14;
+    t8 = C35 * t4;
+    t9 = (-C34) * t6;
+    t10 = t8 + t9;
+    y[75] = 0;
+    t11 = (-0.092037100698693) * t10;
+    y[164] = t11;
+    t7 = C36 * t5;
+    t3 = C37 * t16;
+    t1 = t7 + t3;
+    y[4] = 0;
+    t12 = (-0.09153613427519382) * t1;
+    y[235] = t12;
+    t0 = (-C37) * t5;
+    t13 = C36 * t16;
+    t2 = t0 + t13;
+    t18 = 0.09103872912395485 * t2;
+    y[244] = t18;
+    t15 = (-0.00019153837094621886) * t2;
+    y[475] = t15;
+    t17 = re[57];
+    t14 = im[57];
+    t4 = re[97];
+    t6 = im[97];
+    t8 = re[17];
+    t9 = im[17];
+    t10 = t4 + t8;
+    t11 = t6 + t9;
+    t7 = C0 * t10;
+    t3 = t17 - t7;
+    t1 = C0 * t11;
+    t12 = t14 - t1;
+    t5 = t4 - t8;
+    t16 = C1 * t5;
+    t0 = t6 - t9;
+    t13 = C1 * t0;
+    t18 = t17 + t10;
+    t2 = t14 + t11;
+    t15 = t3 + t13;
+    t7 = t12 - t16;
+    t1 = t3 - t13;
+    t4 = t12 + t16;
+    t8 = C38 * t18;
+    t5 = C39 * t2;
+    t6 = t8 + t5;
+    y[6] = 0;
+    t9 = (-0.09164045923745048) * t6;
+    y[233] = t9;
+    t0 = (-C39) * t18;
+    t17 = C38 * t2;
+    t10 = t0 + t17;
+    t14 = 0.09093508918086882 * t10;
+    y[246] = t14;
+    t11 = (-0.000327184801096971) * t10;
+    y[473] = t11;
+    t3 = C40 * t15;
+    t13 = C41 * t7;
+    t12 = t3 + t13;
+    y[86] = 0;
+    t16 = (-0.09080463044634797) * t12;
+    y[153] = t16;
+    t8 = (-C41) * t15;
+    t5 = C40 * t7;
+    t6 = t8 + t5;
+    t9 = 0.0917721188046362 * t6;
+    y[326] = t9;
+    t18 = 0.013997450622315546 * t6;
+    y[393] = t18;
+    t2 = (-C42) * t1;
+    t0 = (-C43) * t4;
+    t17 = t2 + t0;
+    t14 = 0.09042691251422759 * t17;
+    y[313] = t14;
+    t10 = (-0.0014024705571618484) * t17;
+    y[406] = t10;
+    t11 = C43 * t1;
+    t3 = (-C42) * t4;
+    t13 = t11 + t3;
+    y[73] = 0;
+    t12 = (-0.09215545573362552) * t13;
+    y[166] = t12;
+    t16 = re[96];
+    t15 = im[96];
+    t7 = re[16];
+    t8 = im[16];
+    t5 = re[56];
+    t9 = im[56];
+    t6 = t7 + t5;
+    t18 = t8 + t9;
+    t2 = C0 * t6;
+    t0 = t16 - t2;
+    t14 = C0 * t18;
+    t17 = t15 - t14;
+    t10 = t7 - t5;
+    t1 = C1 * t10;
+    t4 = t8 - t9;
+    t11 = C1 * t4;
+    t3 = t16 + t6;
+    t13 = t15 + t18;
+    t12 = t0 + t11;
+    t2 = t17 - t1;
+    t14 = t0 - t11;
+    t7 = t17 + t1;
+    t5 = (-C44) * t3;
+    t10 = (-C45) * t13;
+    t8 = t5 + t10;
+    t9 = 0.09033400449355983 * t8;
+    y[311] = t9;
+    t4 = (-0.0029869552982565196) * t8;
+    y[408] = t4;
+    t16 = C45 * t3;
+    t6 = (-C44) * t13;
+    t15 = t16 + t6;
+    y[71] = 0;
+    t18 = (-0.0922502371067524) * t15;
+    y[168] = t18;
+    t0 = C46 * t12;
+    t11 = C47 * t2;
+    t17 = t0 + t11;
+    y[8] = 0;
+    t1 = (-0.09173810125628178) * t17;
+    y[231] = t1;
+    t5 = (-C47) * t12;
+    t10 = C46 * t2;
+    t9 = t5 + t10;
+    t8 = 0.09083830185293602 * t9;
+    y[248] = t8;
+    t4 = (-0.0005120591773015618) * t9;
+    y[471] = t4;
+    t3 = C48 * t14;
+    t13 = C49 * t7;
+    t16 = t3 + t13;
+    y[88] = 0;
+    t6 = (-0.09043994865628115) * t16;
+    y[151] = t6;
+    t15 = (-C49) * t14;
+    t18 = C48 * t7;
+    t0 = t15 + t18;
+    t11 = 0.09214217231595667 * t0;
+    y[328] = t11;
+    t17 = 0.01720475415329727 * t0;
+    y[391] = t17;
+    t1 = re[15];
+    t12 = im[15];
+    t2 = re[55];
+    t5 = im[55];
+    t10 = re[95];
+    t8 = im[95];
+    t9 = t2 + t10;
+    t4 = t5 + t8;
+    t3 = C0 * t9;
+    t13 = t1 - t3;
+    t16 = C0 * t4;
+    t6 = t12 - t16;
+    t14 = t2 - t10;
+    t7 = C1 * t14;
+    t15 = t5 - t8;
+    t18 = C1 * t15;
+    t11 = t1 + t9;
+    t0 = t12 + t4;
+    t17 = t13 + t18;
+    t3 = t6 - t7;
+    t16 = t13 - t18;
+    t2 = t6 + t7;
+    t10 = C50 * t11;
+    t14 = C51 * t0;
+    t5 = t10 + t14;
+    t8 = 0.0004842994894200067 * t5;
+    y[90] = t8;
+    t15 = (-0.0899666037574483) * t5;
+    y[149] = t15;
+    t1 = (-C51) * t11;
+    t9 = C50 * t0;
+    t12 = t1 + t9;
+    t4 = 0.09251590088378046 * t12;
+    y[330] = t4;
+    t13 = 0.0206317319699406 * t12;
+    y[389] = t13;
+    t18 = (-C52) * t17;
+    t6 = (-C53) * t3;
+    t7 = t18 + t6;
+    t10 = 0.09026179621523889 * t7;
+    y[309] = t10;
+    t14 = (-0.004386750516852225) * t7;
+    y[410] = t14;
+    t8 = C53 * t17;
+    t5 = (-C52) * t3;
+    t15 = t8 + t5;
+    y[69] = 0;
+    t11 = (-0.0923240361122618) * t15;
+    y[170] = t11;
+    t0 = C54 * t16;
+    t1 = C55 * t2;
+    t9 = t0 + t1;
+    y[10] = 0;
+    t4 = (-0.09182744168049195) * t9;
+    y[229] = t4;
+    t12 = (-C55) * t16;
+    t13 = C54 * t2;
+    t18 = t12 + t13;
+    t6 = 0.0907499237790884 * t18;
+    y[250] = t6;
+    t10 = (-0.0007516557620710143) * t18;
+    y[469] = t10;
+    t7 = re[54];
+    t14 = im[54];
+    t17 = re[94];
+    t3 = im[94];
+    t8 = re[14];
+    t5 = im[14];
+    t15 = t17 + t8;
+    t11 = t3 + t5;
+    t0 = C0 * t15;
+    t1 = t7 - t0;
+    t9 = C0 * t11;
+    t4 = t14 - t9;
+    t16 = t17 - t8;
+    t2 = C1 * t16;
+    t12 = t3 - t5;
+    t13 = C1 * t12;
+    t6 = t7 + t15;
+    t18 = t14 + t11;
+    t10 = t1 + t13;
+    t0 = t4 - t2;
+    t9 = t1 - t13;
+    t17 = t4 + t2;
+    t8 = C56 * t6;
+    t16 = C57 * t18;
+    t3 = t8 + t16;
+    y[12] = 0;
+    t5 = (-0.09190729083812124) * t3;
+    y[227] = t5;
+    t12 = (-C57) * t6;
+    t7 = C56 * t18;
+    t15 = t12 + t7;
+    t14 = 0.09067108014326149 * t15;
+    y[252] = t14;
+    t11 = (-0.0010496923007052756) * t15;
+    y[467] = t11;
+    t1 = C58 * t10;
+    t13 = C59 * t0;
+    t4 = t1 + t13;
+    t2 = 0.0013335188911986337 * t4;
+    y[92] = t2;
+    t8 = (-0.08936775744636549) * t4;
+    y[147] = t8;
+    t16 = (-C59) * t10;
+    t3 = C58 * t0;
+    t5 = t16 + t3;
+    t6 = 0.0928855407162878 * t5;
+    y[332] = t6;
+    t18 = 0.024267268007375345 * t5;
+    y[387] = t18;
+    t12 = (-C60) * t9;
+    t7 = (-C61) * t17;
+    t14 = t12 + t7;
+    t15 = 0.09020799501323429 * t14;
+    y[307] = t15;
+    t11 = (-0.00561113289925892) * t14;
+    y[412] = t11;
+    t1 = C61 * t9;
+    t13 = (-C60) * t17;
+    t2 = t1 + t13;
+    y[67] = 0;
+    t4 = (-0.0923790993482425) * t2;
+    y[172] = t4;
+    t8 = re[93];
+    t10 = im[93];
+    t0 = re[13];
+    t16 = im[13];
+    t3 = re[53];
+    t6 = im[53];
+    t5 = t0 + t3;
+    t18 = t16 + t6;
+    t12 = C0 * t5;
+    t7 = t8 - t12;
+    t15 = C0 * t18;
+    t14 = t10 - t15;
+    t11 = t0 - t3;
+    t9 = C1 * t11;
+    t17 = t16 - t6;
+    t1 = C1 * t17;
+    t13 = t8 + t5;
+    t2 = t10 + t18;
+    t4 = t7 + t1;
+    t12 = t14 - t9;
+    t15 = t7 - t1;
+    t0 = t14 + t9;
+    t3 = (-C62) * t13;
+    t11 = (-C63) * t2;
+    t16 = t3 + t11;
+    t6 = 0.09017057297751993 * t16;
+    y[305] = t6;
+    t17 = (-0.006669565026439458) * t16;
+    y[414] = t17;
+    t8 = C63 * t13;
+    t5 = (-C62) * t2;
+    t10 = t8 + t5;
+    y[65] = 0;
+    t18 = (-0.09241743795296592) * t10;
+    y[174] = t18;
+    t7 = C64 * t4;
+    t1 = C65 * t12;
+    t14 = t7 + t1;
+    y[14] = 0;
+    t9 = (-0.09197681925364116) * t14;
+    y[225] = t9;
+    t3 = (-C65) * t4;
+    t11 = C64 * t12;
+    t6 = t3 + t11;
+    t16 = 0.0906025387804812 * t6;
+    y[254] = t16;
+    t17 = (-0.0014078128227328595) * t6;
+    y[465] = t17;
+    t13 = C66 * t15;
+    t2 = C67 * t0;
+    t8 = t13 + t2;
+    t5 = 0.0024660855829648633 * t8;
+    y[94] = t5;
+    t10 = (-0.0886290112993696) * t8;
+    y[145] = t10;
+    t18 = (-C67) * t15;
+    t7 = C66 * t0;
+    t1 = t18 + t7;
+    t14 = 0.0932431206828331 * t1;
+    y[334] = t14;
+    t9 = 0.028096241762516693 * t1;
+    y[385] = t9;
+    t4 = re[12];
+    t12 = im[12];
+    t3 = re[52];
+    t11 = im[52];
+    t16 = re[92];
+    t6 = im[92];
+    t17 = t3 + t16;
+    t13 = t11 + t6;
+    t2 = C0 * t17;
+    t5 = t4 - t2;
+    t8 = C0 * t13;
+    t10 = t12 - t8;
+    t15 = t3 - t16;
+    t0 = C1 * t15;
+    t18 = t11 - t6;
+    t7 = C1 * t18;
+    t14 = t4 + t17;
+    t1 = t12 + t13;
+    t9 = t5 + t7;
+    t2 = t10 - t0;
+    t8 = t5 - t7;
+    t3 = t10 + t0;
+    t16 = C68 * t14;
+    t15 = C69 * t1;
+    t11 = t16 + t15;
+    t6 = 0.004039078536152446 * t11;
+    y[96] = t6;
+    t18 = (-0.08769929472088642) * t11;
+    y[143] = t18;
+    t4 = (-C69) * t14;
+    t17 = C68 * t1;
+    t12 = t4 + t17;
+    t13 = 0.093543358396319 * t12;
+    y[336] = t13;
+    t5 = 0.032098107276850515 * t12;
+    y[383] = t5;
+    t7 = (-C70) * t9;
+    t10 = (-C71) * t2;
+    t0 = t7 + t10;
+    t16 = 0.09014764694307614 * t0;
+    y[303] = t16;
+    t15 = (-0.007570478703505297) * t0;
+    y[416] = t15;
+    t6 = C71 * t9;
+    t11 = (-C70) * t2;
+    t18 = t6 + t11;
+    y[63] = 0;
+    t14 = (-0.09244094123272491) * t18;
+    y[176] = t14;
+    t1 = C72 * t8;
+    t4 = C73 * t3;
+    t17 = t1 + t4;
+    y[16] = 0;
+    t13 = (-0.0920356604410908) * t17;
+    y[223] = t13;
+    t12 = (-C73) * t8;
+    t5 = C72 * t3;
+    t7 = t12 + t5;
+    t10 = 0.09054461383114908 * t7;
+    y[256] = t10;
+    t16 = (-0.0018254876761969407) * t7;
+    y[463] = t16;
+    t0 = re[51];
+    t15 = im[51];
+    t9 = re[91];
+    t2 = im[91];
+    t6 = re[11];
+    t11 = im[11];
+    t18 = t9 + t6;
+    t14 = t2 + t11;
+    t1 = C0 * t18;
+    t4 = t0 - t1;
+    t17 = C0 * t14;
+    t13 = t15 - t17;
+    t8 = t9 - t6;
+    t3 = C1 * t8;
+    t12 = t2 - t11;
+    t5 = C1 * t12;
+    t10 = t0 + t18;
+    t7 = t15 + t14;
+    t16 = t4 + t5;
+    t1 = t13 - t3;
+    t17 = t4 - t5;
+    t9 = t13 + t3;
+    t6 = C74 * t10;
+    t8 = C75 * t7;
+    t2 = t6 + t8;
+    y[18] = 0;
+    t11 = (-0.09208383616627881) * t2;
+    y[221] = t11;
+    t12 = (-C75) * t10;
+    t0 = C74 * t7;
+    t18 = t12 + t0;
+    t15 = 0.09049724338466482 * t18;
+    y[258] = t15;
+    t14 = (-0.0022998927704061803) * t18;
+    y[461] = t14;
+    t4 = C76 * t16;
+    t5 = C77 * t1;
+    t13 = t4 + t5;
+    t3 = 0.006095025443000334 * t13;
+    y[98] = t3;
+    t6 = (-0.08653541118025766) * t13;
+    y[141] = t6;
+    t8 = (-C77) * t16;
+    t2 = C76 * t1;
+    t11 = t8 + t2;
+    t10 = 0.0937466223587032 * t11;
+    y[338] = t10;
+    t7 = 0.03624772740142347 * t11;
+    y[381] = t7;
+    t12 = (-C78) * t17;
+    t0 = (-C79) * t9;
+    t15 = t12 + t0;
+    t18 = 0.09013738926953407 * t15;
+    y[301] = t18;
+    t14 = (-0.008322144470384114) * t15;
+    y[418] = t14;
+    t4 = C79 * t17;
+    t5 = (-C78) * t9;
+    t3 = t4 + t5;
+    y[61] = 0;
+    t13 = (-0.09245146105146788) * t3;
+    y[178] = t13;
+    t6 = re[90];
+    t16 = im[90];
+    t1 = re[10];
+    t8 = im[10];
+    t2 = re[50];
+    t10 = im[50];
+    t11 = t1 + t2;
+    t7 = t8 + t10;
+    t12 = C0 * t11;
+    t0 = t6 - t12;
+    t18 = C0 * t7;
+    t15 = t16 - t18;
+    t14 = t1 - t2;
+    t17 = C1 * t14;
+    t9 = t8 - t10;
+    t4 = C1 * t9;
+    t5 = t6 + t11;
+    t3 = t16 + t7;
+    t13 = t0 + t4;
+    t12 = t15 - t17;
+    t18 = t0 - t4;
+    t1 = t15 + t17;
+    t2 = (-C80) * t5;
+    t14 = (-C81) * t3;
+    t8 = t2 + t14;
+    t10 = 0.09013792870924264 * t8;
+    y[299] = t10;
+    t9 = (-0.008931638736934335) * t8;
+    y[420] = t9;
+    t6 = C81 * t5;
+    t11 = (-C80) * t3;
+    t16 = t6 + t11;
+    y[59] = 0;
+    t7 = (-0.09245090776618706) * t16;
+    y[180] = t7;
+    t0 = C82 * t13;
+    t4 = C83 * t12;
+    t15 = t0 + t4;
+    y[20] = 0;
+    t17 = (-0.09212183238639414) * t15;
+    y[219] = t17;
+    t2 = (-C83) * t13;
+    t14 = C82 * t12;
+    t10 = t2 + t14;
+    t8 = 0.09045991723634143 * t10;
+    y[260] = t8;
+    t9 = (-0.0028260339569157957) * t10;
+    y[459] = t9;
+    t5 = C84 * t18;
+    t3 = C85 * t1;
+    t6 = t5 + t3;
+    t11 = 0.00865644952865837 * t6;
+    y[100] = t11;
+    t16 = (-0.08509375534963323) * t6;
+    y[139] = t16;
+    t7 = (-C85) * t18;
+    t0 = C84 * t1;
+    t4 = t7 + t0;
+    t15 = 0.09380974732326158 * t4;
+    y[340] = t15;
+    t17 = 0.04051425980544644 * t4;
+    y[379] = t17;
+    t13 = re[9];
+    t12 = im[9];
+    t2 = re[49];
+    t14 = im[49];
+    t8 = re[89];
+    t10 = im[89];
+    t9 = t2 + t8;
+    t5 = t14 + t10;
+    t3 = C0 * t9;
+    t11 = t13 - t3;
+    t6 = C0 * t5;
+    t16 = t12 - t6;
+    t18 = t2 - t8;
+    t1 = C1 * t18;
+    t7 = t14 - t10;
+    t0 = C1 * t7;
+    t15 = t13 + t9;
+    t4 = t12 + t5;
+    t17 = t11 + t0;
+    t3 = t16 - t1;
+    t6 = t11 - t0;
+    t2 = t16 + t1;
+    t8 = C86 * t15;
+    t18 = C87 * t4;
+    t14 = t8 + t18;
+    t10 = 0.011723299109835212 * t14;
+    y[102] = t10;
+    t7 = (-0.08333366254031559) * t14;
+    y[137] = t7;
+    t13 = (-C87) * t15;
+    t9 = C86 * t4;
+    t12 = t13 + t9;
+    t5 = 0.09368831734586838 * t12;
+    y[342] = t5;
+    t11 = 0.04486302931753237 * t12;
+    y[377] = t11;
+    t0 = (-C88) * t17;
+    t16 = (-C89) * t3;
+    t1 = t0 + t16;
+    t8 = 0.09014737254320589 * t1;
+    y[297] = t8;
+    t18 = (-0.00940585792015134) * t1;
+    y[422] = t18;
+    t10 = C89 * t17;
+    t14 = (-C88) * t3;
+    t7 = t10 + t14;
+    y[57] = 0;
+    t15 = (-0.09244122261399611) * t7;
+    y[182] = t15;
+    t4 = C90 * t6;
+    t13 = C91 * t2;
+    t9 = t4 + t13;
+    y[22] = 0;
+    t5 = (-0.09215050828134111) * t9;
+    y[217] = t5;
+    t12 = (-C91) * t6;
+    t11 = C90 * t2;
+    t0 = t12 + t11;
+    t16 = 0.0904317674286848 * t0;
+    y[262] = t16;
+    t8 = (-0.0033972510637467705) * t0;
+    y[457] = t8;
+    t1 = re[48];
+    t18 = im[48];
+    t17 = re[88];
+    t3 = im[88];
+    t10 = re[8];
+    t14 = im[8];
+    t7 = t17 + t10;
+    t15 = t3 + t14;
+    t4 = C0 * t7;
+    t13 = t1 - t4;
+    t9 = C0 * t15;
+    t5 = t18 - t9;
+    t6 = t17 - t10;
+    t2 = C1 * t6;
+    t12 = t3 - t14;
+    t11 = C1 * t12;
+    t16 = t1 + t7;
+    t0 = t18 + t15;
+    t8 = t13 + t11;
+    t4 = t5 - t2;
+    t9 = t13 - t11;
+    t17 = t5 + t2;
+    t10 = C92 * t16;
+    t6 = C93 * t0;
+    t3 = t10 + t6;
+    y[24] = 0;
+    t14 = (-0.09217112540390858) * t3;
+    y[215] = t14;
+    t12 = (-C93) * t16;
+    t1 = C92 * t0;
+    t7 = t12 + t1;
+    t18 = 0.09041153937109188 * t7;
+    y[264] = t18;
+    t15 = (-0.004004964884675951) * t7;
+    y[455] = t15;
+    t13 = C94 * t8;
+    t11 = C95 * t4;
+    t5 = t13 + t11;
+    t2 = 0.01527325089115992 * t5;
+    y[104] = t2;
+    t10 = (-0.08121961706425723) * t5;
+    y[135] = t10;
+    t6 = (-C95) * t8;
+    t3 = C94 * t4;
+    t14 = t6 + t3;
+    t16 = 0.0933402251764112 * t14;
+    y[344] = t16;
+    t0 = 0.04925447720164721 * t14;
+    y[375] = t0;
+    t12 = (-C96) * t9;
+    t1 = (-C97) * t17;
+    t18 = t12 + t1;
+    t7 = 0.09016381559190259 * t18;
+    y[295] = t7;
+    t15 = (-0.009751032959974511) * t18;
+    y[424] = t15;
+    t13 = C97 * t9;
+    t11 = (-C96) * t17;
+    t2 = t13 + t11;
+    y[55] = 0;
+    t5 = (-0.09242436423777228) * t2;
+    y[184] = t5;
+    t10 = re[87];
+    t8 = im[87];
+    t4 = re[7];
+    t6 = im[7];
+    t3 = re[47];
+    t16 = im[47];
+    t14 = t4 + t3;
+    t0 = t6 + t16;
+    t12 = C0 * t14;
+    t1 = t10 - t12;
+    t7 = C0 * t0;
+    t18 = t8 - t7;
+    t15 = t4 - t3;
+    t9 = C1 * t15;
+    t17 = t6 - t16;
+    t13 = C1 * t17;
+    t11 = t10 + t14;
+    t2 = t8 + t0;
+    t5 = t1 + t13;
+    t12 = t18 - t9;
+    t7 = t1 - t13;
+    t4 = t18 + t9;
+    t3 = (-C98) * t11;
+    t15 = (-C99) * t2;
+    t6 = t3 + t15;
+    t16 = 0.09018536723388516 * t6;
+    y[293] = t16;
+    t17 = (-0.009973048940772533) * t6;
+    y[426] = t17;
+    t10 = C99 * t11;
+    t14 = (-C98) * t2;
+    t8 = t10 + t14;
+    y[53] = 0;
+    t0 = (-0.09240227754156406) * t8;
+    y[186] = t0;
+    t1 = C100 * t5;
+    t13 = C101 * t12;
+    t18 = t1 + t13;
+    y[26] = 0;
+    t9 = (-0.09218520351877914) * t18;
+    y[213] = t9;
+    t3 = (-C101) * t5;
+    t15 = C100 * t12;
+    t16 = t3 + t15;
+    t6 = 0.09039773212233286 * t16;
+    y[266] = t6;
+    t17 = (-0.004639507057936654) * t16;
+    y[453] = t17;
+    t11 = C102 * t7;
+    t2 = C103 * t4;
+    t10 = t11 + t2;
+    t14 = 0.019263488602330115 * t10;
+    y[106] = t14;
+    t8 = (-0.07872584358434256) * t10;
+    y[133] = t8;
+    t0 = (-C103) * t7;
+    t1 = C102 * t4;
+    t13 = t0 + t1;
+    t18 = 0.09272581162425671 * t13;
+    y[346] = t18;
+    t9 = 0.05364633647126045 * t13;
+    y[373] = t9;
+    t5 = re[6];
+    t12 = im[6];
+    t3 = re[46];
+    t15 = im[46];
+    t6 = re[86];
+    t16 = im[86];
+    t17 = t3 + t6;
+    t11 = t15 + t16;
+    t2 = C0 * t17;
+    t14 = t5 - t2;
+    t10 = C0 * t11;
+    t8 = t12 - t10;
+    t7 = t3 - t6;
+    t4 = C1 * t7;
+    t0 = t15 - t16;
+    t1 = C1 * t0;
+    t18 = t5 + t17;
+    t13 = t12 + t11;
+    t9 = t14 + t1;
+    t2 = t8 - t4;
+    t10 = t14 - t1;
+    t3 = t8 + t4;
+    t6 = C104 * t18;
+    t7 = C105 * t13;
+    t15 = t6 + t7;
+    t16 = 0.02363453610164699 * t15;
+    y[108] = t16;
+    t0 = (-0.07583656737509746) * t15;
+    y[131] = t0;
+    t5 = (-C105) * t18;
+    t17 = C104 * t13;
+    t12 = t5 + t17;
+    t11 = 0.09181163628090575 * t12;
+    y[348] = t11;
+    t14 = 0.057993691384658534 * t12;
+    y[371] = t14;
+    t1 = (-C106) * t9;
+    t8 = (-C107) * t2;
+    t4 = t1 + t8;
+    t6 = 0.09021020255745729 * t4;
+    y[291] = t6;
+    t7 = (-0.010077888829067619) * t4;
+    y[428] = t7;
+    t16 = C107 * t9;
+    t15 = (-C106) * t2;
+    t0 = t16 + t15;
+    y[51] = 0;
+    t18 = (-0.09237683872869709) * t0;
+    y[188] = t18;
+    t13 = C108 * t10;
+    t5 = C109 * t3;
+    t17 = t13 + t5;
+    y[28] = 0;
+    t11 = (-0.09219451731446794) * t17;
+    y[211] = t11;
+    t12 = (-C109) * t10;
+    t14 = C108 * t3;
+    t1 = t12 + t14;
+    t8 = 0.09038859984383908 * t1;
+    y[268] = t8;
+    t6 = (-0.005289771942594677) * t1;
+    y[451] = t6;
+    t4 = re[45];
+    t7 = im[45];
+    t9 = re[85];
+    t2 = im[85];
+    t16 = re[5];
+    t15 = im[5];
+    t0 = t9 + t16;
+    t18 = t2 + t15;
+    t13 = C0 * t0;
+    t5 = t4 - t13;
+    t17 = C0 * t18;
+    t11 = t7 - t17;
+    t10 = t9 - t16;
+    t3 = C1 * t10;
+    t12 = t2 - t15;
+    t14 = C1 * t12;
+    t8 = t4 + t0;
+    t1 = t7 + t18;
+    t6 = t5 + t14;
+    t13 = t11 - t3;
+    t17 = t5 - t14;
+    t9 = t11 + t3;
+    t16 = C110 * t8;
+    t10 = C111 * t1;
+    t2 = t16 + t10;
+    y[30] = 0;
+    t15 = (-0.09220089774016076) * t2;
+    y[209] = t15;
+    t12 = (-C111) * t8;
+    t4 = C110 * t1;
+    t0 = t12 + t4;
+    t7 = 0.09038234483158948 * t0;
+    y[270] = t7;
+    t18 = (-0.005944349081379847) * t0;
+    y[449] = t18;
+    t5 = C112 * t6;
+    t14 = C113 * t13;
+    t11 = t5 + t14;
+    t3 = 0.02831385891142267 * t11;
+    y[110] = t3;
+    t16 = (-0.07254851328183894) * t11;
+    y[129] = t16;
+    t10 = (-C113) * t6;
+    t2 = C112 * t13;
+    t15 = t10 + t2;
+    t8 = 0.09057075485758738 * t15;
+    y[350] = t8;
+    t1 = 0.06225077715882855 * t15;
+    y[369] = t1;
+    t12 = (-C114) * t17;
+    t4 = (-C115) * t9;
+    t7 = t12 + t4;
+    t0 = 0.09023662379888507 * t7;
+    y[289] = t0;
+    t18 = (-0.010071177893659302) * t7;
+    y[430] = t18;
+    t5 = C115 * t17;
+    t14 = (-C114) * t9;
+    t3 = t5 + t14;
+    y[49] = 0;
+    t11 = (-0.09234979083333456) * t3;
+    y[190] = t11;
+    t16 = re[84];
+    t6 = im[84];
+    t13 = re[4];
+    t10 = im[4];
+    t2 = re[44];
+    t8 = im[44];
+    t15 = t13 + t2;
+    t1 = t10 + t8;
+    t12 = C0 * t15;
+    t4 = t16 - t12;
+    t0 = C0 * t1;
+    t7 = t6 - t0;
+    t18 = t13 - t2;
+    t17 = C1 * t18;
+    t9 = t10 - t8;
+    t5 = C1 * t9;
+    t14 = t16 + t15;
+    t3 = t6 + t1;
+    t11 = t4 + t5;
+    t12 = t7 - t17;
+    t0 = t4 - t5;
+    t13 = t7 + t17;
+    t2 = (-C116) * t14;
+    t18 = (-C117) * t3;
+    t10 = t2 + t18;
+    t8 = 0.090263085231818 * t10;
+    y[287] = t8;
+    t9 = (-0.00995939719517774) * t10;
+    y[432] = t9;
+    t16 = C117 * t14;
+    t15 = (-C116) * t3;
+    t6 = t16 + t15;
+    y[47] = 0;
+    t1 = (-0.09232271766394046) * t6;
+    y[192] = t1;
+    t4 = C118 * t11;
+    t5 = C119 * t12;
+    t7 = t4 + t5;
+    y[32] = 0;
+    t17 = (-0.09220618981254637) * t7;
+    y[207] = t17;
+    t2 = (-C119) * t11;
+    t18 = C118 * t12;
+    t8 = t2 + t18;
+    t10 = 0.09037715743677144 * t8;
+    y[272] = t10;
+    t9 = (-0.006590424026111684) * t8;
+    y[447] = t9;
+    t14 = C120 * t0;
+    t3 = C121 * t13;
+    t16 = t14 + t3;
+    t15 = 0.03322042000362499 * t16;
+    y[112] = t15;
+    t6 = (-0.06887202171480471) * t16;
+    y[127] = t6;
+    t1 = (-C121) * t0;
+    t4 = C120 * t13;
+    t5 = t1 + t4;
+    t7 = 0.08898332462644315 * t5;
+    y[352] = t7;
+    t17 = 0.066370981076243 * t5;
+    y[367] = t17;
+    t11 = re[3];
+    t12 = im[3];
+    t2 = re[43];
+    t18 = im[43];
+    t10 = re[83];
+    t8 = im[83];
+    t9 = t2 + t10;
+    t14 = t18 + t8;
+    t3 = C0 * t9;
+    t15 = t11 - t3;
+    t16 = C0 * t14;
+    t6 = t12 - t16;
+    t0 = t2 - t10;
+    t13 = C1 * t0;
+    t1 = t18 - t8;
+    t4 = C1 * t1;
+    t7 = t11 + t9;
+    t5 = t12 + t14;
+    t17 = t15 + t4;
+    t3 = t6 - t13;
+    t16 = t15 - t4;
+    t2 = t6 + t13;
+    t10 = C122 * t7;
+    t0 = C123 * t5;
+    t18 = t10 + t0;
+    t8 = 0.03826800503743858 * t18;
+    y[114] = t8;
+    t1 = (-0.06483018405848807) * t18;
+    y[125] = t1;
+    t11 = (-C123) * t7;
+    t9 = C122 * t5;
+    t12 = t11 + t9;
+    t14 = 0.08703876860421736 * t12;
+    y[354] = t14;
+    t15 = 0.07030922939059663 * t12;
+    y[365] = t15;
+    t4 = (-C124) * t17;
+    t6 = (-C125) * t3;
+    t13 = t4 + t6;
+    t10 = 0.09028824521108123 * t13;
+    y[285] = t10;
+    t0 = (-0.009748913661253328) * t13;
+    y[434] = t0;
+    t8 = C125 * t17;
+    t18 = (-C124) * t3;
+    t1 = t8 + t18;
+    y[45] = 0;
+    t7 = (-0.0922969907527959) * t1;
+    y[194] = t7;
+    t5 = C126 * t16;
+    t11 = C127 * t2;
+    t9 = t5 + t11;
+    y[34] = 0;
+    t14 = (-0.09221204331965764) * t9;
+    y[205] = t14;
+    t12 = (-C127) * t16;
+    t15 = C126 * t2;
+    t4 = t12 + t15;
+    t6 = 0.09037142040595954 * t4;
+    y[274] = t6;
+    t10 = (-0.007215922854075747) * t4;
+    y[445] = t10;
+    t13 = re[42];
+    t0 = im[42];
+    t17 = re[82];
+    t3 = im[82];
+    t8 = re[2];
+    t18 = im[2];
+    t1 = t17 + t8;
+    t7 = t3 + t18;
+    t5 = C0 * t1;
+    t11 = t13 - t5;
+    t9 = C0 * t7;
+    t14 = t0 - t9;
+    t16 = t17 - t8;
+    t2 = C1 * t16;
+    t12 = t3 - t18;
+    t15 = C1 * t12;
+    t6 = t13 + t1;
+    t4 = t0 + t7;
+    t10 = t11 + t15;
+    t5 = t14 - t2;
+    t9 = t11 - t15;
+    t17 = t14 + t2;
+    t8 = C128 * t6;
+    t16 = C129 * t4;
+    t3 = t8 + t16;
+    y[36] = 0;
+    t18 = (-0.092219873210068) * t3;
+    y[203] = t18;
+    t12 = (-C129) * t6;
+    t13 = C128 * t4;
+    t1 = t12 + t13;
+    t0 = 0.09036374745767432 * t1;
+    y[276] = t0;
+    t7 = (-0.00780808135679578) * t1;
+    y[443] = t7;
+    t11 = C130 * t10;
+    t15 = C131 * t5;
+    t14 = t11 + t15;
+    t2 = 0.04336930039134643 * t14;
+    y[116] = t2;
+    t8 = (-0.06045909869529394) * t14;
+    y[123] = t8;
+    t16 = (-C131) * t10;
+    t3 = C130 * t5;
+    t18 = t16 + t3;
+    t6 = 0.08473525892773065 * t18;
+    y[356] = t6;
+    t4 = 0.07402277467890597 * t18;
+    y[363] = t4;
+    t12 = (-C132) * t9;
+    t13 = (-C133) * t17;
+    t0 = t12 + t13;
+    t1 = 0.09031100536051363 * t0;
+    y[283] = t1;
+    t7 = (-0.0094478602997263) * t0;
+    y[436] = t7;
+    t11 = C133 * t9;
+    t15 = (-C132) * t17;
+    t2 = t11 + t15;
+    y[43] = 0;
+    t14 = (-0.09227373009598769) * t2;
+    y[196] = t14;
+    t8 = re[81];
+    t10 = im[81];
+    t5 = re[1];
+    t16 = im[1];
+    t3 = re[41];
+    t6 = im[41];
+    t18 = t5 + t3;
+    t4 = t16 + t6;
+    t12 = C0 * t18;
+    t13 = t8 - t12;
+    t1 = C0 * t4;
+    t0 = t10 - t1;
+    t7 = t5 - t3;
+    t9 = C1 * t7;
+    t17 = t16 - t6;
+    t11 = C1 * t17;
+    t15 = t8 + t18;
+    t2 = t10 + t4;
+    t14 = t13 + t11;
+    t12 = t0 - t9;
+    t1 = t13 - t11;
+    t5 = t0 + t9;
+    t3 = (-C134) * t15;
+    t7 = (-C135) * t2;
+    t16 = t3 + t7;
+    t6 = 0.0903305936699626 * t16;
+    y[281] = t6;
+    t17 = (-0.009064007974917266) * t16;
+    y[438] = t17;
+    t8 = C135 * t15;
+    t18 = (-C134) * t2;
+    t10 = t8 + t18;
+    y[41] = 0;
+    t4 = (-0.09225372041481877) * t10;
+    y[198] = t4;
+    t13 = C136 * t14;
+    t11 = C137 * t12;
+    t0 = t13 + t11;
+    y[38] = 0;
+    t9 = (-0.09223068106750755) * t0;
+    y[201] = t9;
+    t3 = (-C137) * t14;
+    t7 = C136 * t12;
+    t6 = t3 + t7;
+    t16 = 0.09035315837290428 * t6;
+    y[278] = t16;
+    t17 = (-0.008354677907082433) * t6;
+    y[441] = t17;
+    t15 = C138 * t1;
+    t2 = C139 * t5;
+    t8 = t15 + t2;
+    t18 = 0.04843858972584554 * t8;
+    y[118] = t18;
+    t10 = (-0.055808255064714284) * t8;
+    y[121] = t10;
+    t4 = (-C139) * t1;
+    t13 = C138 * t5;
+    t11 = t4 + t13;
+    t0 = 0.08207914857879066 * t11;
+    y[358] = t0;
+    t9 = 0.07747210014149988 * t11;
+    y[361] = t9;
+}
+
+//
+//  Public functions.
+//
+
+/**
+ *  Apply LD-IMDCT transform (prebuilt for window W10_240, input pruned).
+ * 
+ *  Note(s):
+ *    [1] y[n] = w[n] * SUM(X[k] * cos(PI / 240 * (n + 120.5) * (k + 0.5))), where
+ *        w[n] = sqrt(2 / 240) * W10_240[479 - n].
+ *    [2] X[k] shall be zero for all k >= 80 (not checked).
+ *    [3] The size of all arrays will not be checked.
+ * 
+ *  @param {Number[]} X 
+ *    - The input block (240 points, only the first 80 points are used).
+ *  @param {Number[]} y 
+ *    - The array that would contain the output block (480 points).
+ *  @param {Number[]} re 
+ *    - The scratch buffer (real part, 120 points).
+ *  @param {Number[]} im 
+ *    - The scratch buffer (imaginary part, 120 points).
+ */
+function ApplyWindowedIMDCT_W10_240_K80(X, y, re, im) {
+    ApplyWindowedIMDCT_W10_240_K80_Part1(X, y, re, im);
+    ApplyWindowedIMDCT_W10_240_K80_Part2(X, y, re, im);
+    ApplyWindowedIMDCT_W10_240_K80_Part3(X, y, re, im);
+}
+
+//  Export public APIs.
+module.exports = {
+    "ApplyWindowedIMDCT_W10_240_K80": ApplyWindowedIMDCT_W10_240_K80
+};
\ No newline at end of file
@@ -0,0 +1,5864 @@
+//
+//  Copyright 2021 - 2023 XiaoJSoft Studio. All rights reserved.
+//  Use of this source code is governed by a BSD-style license that can be
+//  found in the LICENSE.md file.
+//
+
+//
+//  Note(s):
+//    [1] This file is generated automatically by a MDCT compiler, which locates 
+//        at "./../../dev/mdct-generator/" directory.
+//        Do NOT modify this file manually.
+//
+
+//
+//  Private functions.
+//
+
+/**
+ *  Part 1 of ApplyWindowedIMDCT_W75_240_K120().
+ * 
+ *  @param {Number[]} X 
+ *    - The input block (240 points, only the first 120 points are used).
+ *  @param {Number[]} y 
+ *    - The array that would contain the output block (480 points).
+ *  @param {Number[]} re 
+ *    - The scratch buffer (real part, 120 points).
+ *  @param {Number[]} im 
+ *    - The scratch buffer (imaginary part, 120 points).
+ */
+function ApplyWindowedIMDCT_W75_240_K120_Part1(X, y, re, im) {
+    let t0, t1, t10, t11, t12, t13, t14, t15, t16, t17, t18, t19, t2, t3, t4, t5, t6, t7, t8, t9;
+    const C0 = 0.9807852804032304;
+    const C1 = 0.19509032201612825;
+    const C2 = 0.9238795325112867;
+    const C3 = 0.3826834323650898;
+    const C4 = 0.8314696123025452;
+    const C5 = 0.5555702330196022;
+    const C6 = 0.7071067811865476;
+    const C7 = 0.9510565162951535;
+    const C8 = 0.3090169943749474;
+    const C9 = 0.8724960070727972;
+    const C10 = 0.4886212414969549;
+    const C11 = 0.7604059656000309;
+    const C12 = 0.6494480483301837;
+    const C13 = 0.785316930880745;
+    const C14 = 0.619093949309834;
+    const C15 = 0.8910065241883679;
+    const C16 = 0.45399049973954675;
+    const C17 = 0.9624552364536473;
+    const C18 = 0.27144044986507426;
+    const C19 = 0.996917333733128;
+    const C20 = 0.07845909572784494;
+    const C21 = 0.9930684569549263;
+    const C22 = 0.11753739745783764;
+    const C23 = 0.8090169943749475;
+    const C24 = 0.5877852522924731;
+    const C25 = 0.7343225094356856;
+    const C26 = 0.6788007455329417;
+    const C27 = 0.8526401643540922;
+    const C28 = 0.5224985647159488;
+    const C29 = 0.9381913359224842;
+    const C30 = 0.34611705707749296;
+    const C31 = 0.9876883405951378;
+    const C32 = 0.15643446504023087;
+    const C33 = 0.9992290362407229;
+    const C34 = 0.03925981575906861;
+    const C35 = 0.9723699203976766;
+    const C36 = 0.2334453638559054;
+    const C37 = 0.9081431738250813;
+    const C38 = 0.41865973753742813;
+    const C39 = 0.5590169943749475;
+    const C40 = 0.25;
+    t0 = X[0];
+    t1 = X[30];
+    t2 = C0 * t1;
+    t1 = (-C1) * t1;
+    t3 = X[60];
+    t4 = C2 * t3;
+    t3 = (-C3) * t3;
+    t5 = X[90];
+    t6 = C4 * t5;
+    t5 = (-C5) * t5;
+    t7 = X[119];
+    t8 = 0.7071067811865475 * t7;
+    t7 = C6 * t7;
+    t9 = X[89];
+    t10 = C4 * t9;
+    t9 = C5 * t9;
+    t11 = X[59];
+    t12 = C2 * t11;
+    t11 = C3 * t11;
+    t13 = X[29];
+    t14 = C0 * t13;
+    t13 = C1 * t13;
+    t15 = t0 + t8;
+    t16 = t4 + t12;
+    t17 = t3 + t11;
+    t0 = t0 - t8;
+    t8 = -t7;
+    t4 = t4 - t12;
+    t12 = t3 - t11;
+    t3 = t15 + t16;
+    t11 = t7 + t17;
+    t18 = t0 + t12;
+    t8 = t8 - t4;
+    t15 = t15 - t16;
+    t16 = t7 - t17;
+    t17 = t0 - t12;
+    t0 = t4 - t7;
+    t12 = t2 + t10;
+    t4 = t1 + t9;
+    t7 = t6 + t14;
+    t19 = t5 + t13;
+    t2 = t2 - t10;
+    t10 = t1 - t9;
+    t1 = t6 - t14;
+    t9 = t5 - t13;
+    t6 = t12 + t7;
+    t14 = t4 + t19;
+    t5 = t2 + t9;
+    t13 = t10 - t1;
+    t12 = t12 - t7;
+    t7 = t4 - t19;
+    t4 = t2 - t9;
+    t19 = t10 + t1;
+    t2 = t5 + t13;
+    t9 = t5 - t13;
+    t10 = C6 * t2;
+    t1 = (-C6) * t9;
+    t5 = t4 - t19;
+    t13 = t4 + t19;
+    t2 = (-C6) * t5;
+    t9 = (-C6) * t13;
+    t4 = t3 - t6;
+    t19 = t11 - t14;
+    t5 = t3 + t6;
+    t13 = t11 + t14;
+    t3 = t18 - t10;
+    t6 = t8 - t1;
+    t11 = t18 + t10;
+    t14 = t8 + t1;
+    t18 = t15 - t7;
+    t10 = t16 + t12;
+    t8 = t15 + t7;
+    t1 = t16 - t12;
+    t15 = t17 - t2;
+    t7 = t0 - t9;
+    t16 = t17 + t2;
+    t12 = t0 + t9;
+    re[0] = t5;
+    im[0] = t13;
+    re[15] = t11;
+    im[15] = t14;
+    re[30] = t8;
+    im[30] = t1;
+    re[45] = t16;
+    im[45] = t12;
+    re[60] = t4;
+    im[60] = t19;
+    re[75] = t3;
+    im[75] = t6;
+    re[90] = t18;
+    im[90] = t10;
+    re[105] = t15;
+    im[105] = t7;
+    t17 = X[48];
+    t2 = C7 * t17;
+    t0 = (-C8) * t17;
+    t9 = X[78];
+    t5 = C9 * t9;
+    t13 = (-C10) * t9;
+    t11 = X[108];
+    t14 = C11 * t11;
+    t8 = (-C12) * t11;
+    t1 = X[101];
+    t16 = C13 * t1;
+    t12 = C14 * t1;
+    t4 = X[71];
+    t19 = C15 * t4;
+    t3 = C16 * t4;
+    t6 = X[41];
+    t18 = C17 * t6;
+    t10 = C18 * t6;
+    t15 = X[11];
+    t7 = C19 * t15;
+    t17 = C20 * t15;
+    t9 = X[18];
+    t11 = C21 * t9;
+    t1 = (-C22) * t9;
+    t4 = t2 + t19;
+    t6 = t0 + t3;
+    t15 = t14 + t7;
+    t9 = t8 + t17;
+    t2 = t2 - t19;
+    t19 = t0 - t3;
+    t0 = t14 - t7;
+    t3 = t8 - t17;
+    t14 = t4 + t15;
+    t7 = t6 + t9;
+    t8 = t2 + t3;
+    t17 = t19 - t0;
+    t4 = t4 - t15;
+    t15 = t6 - t9;
+    t6 = t2 - t3;
+    t9 = t19 + t0;
+    t2 = t5 + t18;
+    t3 = t13 + t10;
+    t19 = t16 + t11;
+    t0 = t12 + t1;
+    t5 = t5 - t18;
+    t18 = t13 - t10;
+    t13 = t16 - t11;
+    t10 = t12 - t1;
+    t16 = t2 + t19;
+    t11 = t3 + t0;
+    t12 = t5 + t10;
+    t1 = t18 - t13;
+    t2 = t2 - t19;
+    t19 = t3 - t0;
+    t3 = t5 - t10;
+    t0 = t18 + t13;
+    t5 = t12 + t1;
+    t10 = t12 - t1;
+    t18 = C6 * t5;
+    t13 = (-C6) * t10;
+    t12 = t3 - t0;
+    t1 = t3 + t0;
+    t5 = (-C6) * t12;
+    t10 = (-C6) * t1;
+    t3 = t14 - t16;
+    t0 = t7 - t11;
+    t12 = t14 + t16;
+    t1 = t7 + t11;
+    t14 = t8 - t18;
+    t16 = t17 - t13;
+    t7 = t8 + t18;
+    t11 = t17 + t13;
+    t8 = t4 - t19;
+    t18 = t15 + t2;
+    t17 = t4 + t19;
+    t13 = t15 - t2;
+    t4 = t6 - t5;
+    t19 = t9 - t10;
+    t15 = t6 + t5;
+    t2 = t9 + t10;
+    re[24] = t12;
+    im[24] = t1;
+    re[39] = t7;
+    im[39] = t11;
+    re[54] = t17;
+    im[54] = t13;
+    re[69] = t15;
+    im[69] = t2;
+    re[84] = t3;
+    im[84] = t0;
+    re[99] = t14;
+    im[99] = t16;
+    re[114] = t8;
+    im[114] = t18;
+    re[9] = t4;
+    im[9] = t19;
+    t6 = X[96];
+    t5 = C23 * t6;
+    t9 = (-C24) * t6;
+    t10 = X[113];
+    t12 = C25 * t10;
+    t1 = C26 * t10;
+    t7 = X[83];
+    t11 = C27 * t7;
+    t17 = C28 * t7;
+    t13 = X[53];
+    t15 = C29 * t13;
+    t2 = C30 * t13;
+    t3 = X[23];
+    t0 = C31 * t3;
+    t14 = C32 * t3;
+    t16 = X[6];
+    t8 = C33 * t16;
+    t18 = (-C34) * t16;
+    t4 = X[36];
+    t19 = C35 * t4;
+    t6 = (-C36) * t4;
+    t10 = X[66];
+    t7 = C37 * t10;
+    t13 = (-C38) * t10;
+    t3 = t5 + t0;
+    t16 = t9 + t14;
+    t4 = t11 + t19;
+    t10 = t17 + t6;
+    t5 = t5 - t0;
+    t0 = t9 - t14;
+    t9 = t11 - t19;
+    t14 = t17 - t6;
+    t11 = t3 + t4;
+    t19 = t16 + t10;
+    t17 = t5 + t14;
+    t6 = t0 - t9;
+    t3 = t3 - t4;
+    t4 = t16 - t10;
+    t16 = t5 - t14;
+    t10 = t0 + t9;
+    t5 = t12 + t8;
+    t14 = t1 + t18;
+    t0 = t15 + t7;
+    t9 = t2 + t13;
+    t12 = t12 - t8;
+    t8 = t1 - t18;
+    t1 = t15 - t7;
+    t18 = t2 - t13;
+    t15 = t5 + t0;
+    t7 = t14 + t9;
+    t2 = t12 + t18;
+    t13 = t8 - t1;
+    t5 = t5 - t0;
+    t0 = t14 - t9;
+    t14 = t12 - t18;
+    t9 = t8 + t1;
+    t12 = t2 + t13;
+    t18 = t2 - t13;
+    t8 = C6 * t12;
+    t1 = (-C6) * t18;
+    t2 = t14 - t9;
+    t13 = t14 + t9;
+    t12 = (-C6) * t2;
+    t18 = (-C6) * t13;
+    t14 = t11 - t15;
+    t9 = t19 - t7;
+    t2 = t11 + t15;
+    t13 = t19 + t7;
+    t11 = t17 - t8;
+    t15 = t6 - t1;
+    t19 = t17 + t8;
+    t7 = t6 + t1;
+    t17 = t3 - t0;
+    t8 = t4 + t5;
+    t6 = t3 + t0;
+    t1 = t4 - t5;
+    t3 = t16 - t12;
+    t0 = t10 - t18;
+    t4 = t16 + t12;
+    t5 = t10 + t18;
+    re[48] = t2;
+    im[48] = t13;
+    re[63] = t19;
+    im[63] = t7;
+    re[78] = t6;
+    im[78] = t1;
+    re[93] = t4;
+    im[93] = t5;
+    re[108] = t14;
+    im[108] = t9;
+    re[3] = t11;
+    im[3] = t15;
+    re[18] = t17;
+    im[18] = t8;
+    re[33] = t3;
+    im[33] = t0;
+    t16 = X[95];
+    t12 = C23 * t16;
+    t10 = C24 * t16;
+    t18 = X[65];
+    t2 = C37 * t18;
+    t13 = C38 * t18;
+    t19 = X[35];
+    t7 = C35 * t19;
+    t6 = C36 * t19;
+    t1 = X[5];
+    t4 = C33 * t1;
+    t5 = C34 * t1;
+    t14 = X[24];
+    t9 = C31 * t14;
+    t11 = (-C32) * t14;
+    t15 = X[54];
+    t17 = C29 * t15;
+    t8 = (-C30) * t15;
+    t3 = X[84];
+    t0 = C27 * t3;
+    t16 = (-C28) * t3;
+    t18 = X[114];
+    t19 = C25 * t18;
+    t1 = (-C26) * t18;
+    t14 = t12 + t9;
+    t15 = t10 + t11;
+    t3 = t7 + t0;
+    t18 = t6 + t16;
+    t12 = t12 - t9;
+    t9 = t10 - t11;
+    t10 = t7 - t0;
+    t11 = t6 - t16;
+    t7 = t14 + t3;
+    t0 = t15 + t18;
+    t6 = t12 + t11;
+    t16 = t9 - t10;
+    t14 = t14 - t3;
+    t3 = t15 - t18;
+    t15 = t12 - t11;
+    t18 = t9 + t10;
+    t12 = t2 + t17;
+    t11 = t13 + t8;
+    t9 = t4 + t19;
+    t10 = t5 + t1;
+    t2 = t2 - t17;
+    t17 = t13 - t8;
+    t13 = t4 - t19;
+    t8 = t5 - t1;
+    t4 = t12 + t9;
+    t19 = t11 + t10;
+    t5 = t2 + t8;
+    t1 = t17 - t13;
+    t12 = t12 - t9;
+    t9 = t11 - t10;
+    t11 = t2 - t8;
+    t10 = t17 + t13;
+    t2 = t5 + t1;
+    t8 = t5 - t1;
+    t17 = C6 * t2;
+    t13 = (-C6) * t8;
+    t5 = t11 - t10;
+    t1 = t11 + t10;
+    t2 = (-C6) * t5;
+    t8 = (-C6) * t1;
+    t11 = t7 - t4;
+    t10 = t0 - t19;
+    t5 = t7 + t4;
+    t1 = t0 + t19;
+    t7 = t6 - t17;
+    t4 = t16 - t13;
+    t0 = t6 + t17;
+    t19 = t16 + t13;
+    t6 = t14 - t9;
+    t17 = t3 + t12;
+    t16 = t14 + t9;
+    t13 = t3 - t12;
+    t14 = t15 - t2;
+    t9 = t18 - t8;
+    t3 = t15 + t2;
+    t12 = t18 + t8;
+    re[72] = t5;
+    im[72] = t1;
+    re[87] = t0;
+    im[87] = t19;
+    re[102] = t16;
+    im[102] = t13;
+    re[117] = t3;
+    im[117] = t12;
+    re[12] = t11;
+    im[12] = t10;
+    re[27] = t7;
+    im[27] = t4;
+    re[42] = t6;
+    im[42] = t17;
+    re[57] = t14;
+    im[57] = t9;
+    t15 = X[47];
+    t2 = C7 * t15;
+    t18 = C8 * t15;
+    t8 = X[17];
+    t5 = C21 * t8;
+    t1 = C22 * t8;
+    t0 = X[12];
+    t19 = C19 * t0;
+    t16 = (-C20) * t0;
+    t13 = X[42];
+    t3 = C17 * t13;
+    t12 = (-C18) * t13;
+    t11 = X[72];
+    t10 = C15 * t11;
+    t7 = (-C16) * t11;
+    t4 = X[102];
+    t6 = C13 * t4;
+    t17 = (-C14) * t4;
+    t14 = X[107];
+    t9 = C11 * t14;
+    t15 = C12 * t14;
+    t8 = X[77];
+    t0 = C9 * t8;
+    t13 = C10 * t8;
+    t11 = t2 + t10;
+    t4 = t18 + t7;
+    t14 = t19 + t9;
+    t8 = t16 + t15;
+    t2 = t2 - t10;
+    t10 = t18 - t7;
+    t18 = t19 - t9;
+    t7 = t16 - t15;
+    t19 = t11 + t14;
+    t9 = t4 + t8;
+    t16 = t2 + t7;
+    t15 = t10 - t18;
+    t11 = t11 - t14;
+    t14 = t4 - t8;
+    t4 = t2 - t7;
+    t8 = t10 + t18;
+    t2 = t5 + t6;
+    t7 = t1 + t17;
+    t10 = t3 + t0;
+    t18 = t12 + t13;
+    t5 = t5 - t6;
+    t6 = t1 - t17;
+    t1 = t3 - t0;
+    t17 = t12 - t13;
+    t3 = t2 + t10;
+    t0 = t7 + t18;
+    t12 = t5 + t17;
+    t13 = t6 - t1;
+    t2 = t2 - t10;
+    t10 = t7 - t18;
+    t7 = t5 - t17;
+    t18 = t6 + t1;
+    t5 = t12 + t13;
+    t17 = t12 - t13;
+    t6 = C6 * t5;
+    t1 = (-C6) * t17;
+    t12 = t7 - t18;
+    t13 = t7 + t18;
+    t5 = (-C6) * t12;
+    t17 = (-C6) * t13;
+    t7 = t19 - t3;
+    t18 = t9 - t0;
+    t12 = t19 + t3;
+    t13 = t9 + t0;
+    t19 = t16 - t6;
+    t3 = t15 - t1;
+    t9 = t16 + t6;
+    t0 = t15 + t1;
+    t16 = t11 - t10;
+    t6 = t14 + t2;
+    t15 = t11 + t10;
+    t1 = t14 - t2;
+    t11 = t4 - t5;
+    t10 = t8 - t17;
+    t14 = t4 + t5;
+    t2 = t8 + t17;
+    re[96] = t12;
+    im[96] = t13;
+    re[111] = t9;
+    im[111] = t0;
+    re[6] = t15;
+    im[6] = t1;
+    re[21] = t14;
+    im[21] = t2;
+    re[36] = t7;
+    im[36] = t18;
+    re[51] = t19;
+    im[51] = t3;
+    re[66] = t16;
+    im[66] = t6;
+    re[81] = t11;
+    im[81] = t10;
+    t4 = re[0];
+    t5 = im[0];
+    t8 = re[24];
+    t17 = im[24];
+    t12 = re[48];
+    t13 = im[48];
+    t9 = re[72];
+    t0 = im[72];
+    t15 = re[96];
+    t1 = im[96];
+    t14 = t8 + t15;
+    t2 = t17 + t1;
+    t7 = t12 + t9;
+    t18 = t13 + t0;
+    t19 = t8 - t15;
+    t3 = t17 - t1;
+    t16 = t12 - t9;
+    t6 = t13 - t0;
+    t11 = t14 + t7;
+    t10 = t2 + t18;
+    t8 = t14 - t7;
+    t15 = C39 * t8;
+    t17 = t2 - t18;
+    t1 = C39 * t17;
+    t12 = C40 * t11;
+    t9 = t4 - t12;
+    t13 = C40 * t10;
+    t0 = t5 - t13;
+    t14 = t9 + t15;
+    t7 = t0 + t1;
+    t8 = t9 - t15;
+    t2 = t0 - t1;
+    t18 = C7 * t19;
+    t17 = C24 * t16;
+    t12 = t18 + t17;
+    t13 = C7 * t3;
+    t9 = C24 * t6;
+    t15 = t13 + t9;
+    t0 = C24 * t19;
+    t1 = C7 * t16;
+    t18 = t0 - t1;
+    t17 = C24 * t3;
+    t13 = C7 * t6;
+    t9 = t17 - t13;
+    t19 = t4 + t11;
+    t16 = t5 + t10;
+    t0 = t14 + t15;
+    t1 = t7 - t12;
+    t3 = t8 + t9;
+    t6 = t2 - t18;
+    t17 = t8 - t9;
+    t13 = t2 + t18;
+    t4 = t14 - t15;
+    t11 = t7 + t12;
+    re[0] = t19;
+    im[0] = t16;
+    re[24] = t0;
+    im[24] = t1;
+    re[48] = t3;
+    im[48] = t6;
+    re[72] = t17;
+    im[72] = t13;
+    re[96] = t4;
+    im[96] = t11;
+    t5 = re[15];
+    t10 = im[15];
+    t8 = re[39];
+    t9 = im[39];
+    t2 = re[63];
+    t18 = im[63];
+    t14 = re[87];
+    t15 = im[87];
+    t7 = re[111];
+    t12 = im[111];
+    t19 = t8 + t7;
+    t16 = t9 + t12;
+    t0 = t2 + t14;
+    t1 = t18 + t15;
+    t3 = t8 - t7;
+    t6 = t9 - t12;
+    t17 = t2 - t14;
+    t13 = t18 - t15;
+    t4 = t19 + t0;
+    t11 = t16 + t1;
+    t8 = t19 - t0;
+    t7 = C39 * t8;
+    t9 = t16 - t1;
+    t12 = C39 * t9;
+    t2 = C40 * t4;
+    t14 = t5 - t2;
+    t18 = C40 * t11;
+    t15 = t10 - t18;
+    t19 = t14 + t7;
+    t0 = t15 + t12;
+    t8 = t14 - t7;
+    t16 = t15 - t12;
+    t1 = C7 * t3;
+    t9 = C24 * t17;
+    t2 = t1 + t9;
+    t18 = C7 * t6;
+    t14 = C24 * t13;
+    t7 = t18 + t14;
+    t15 = C24 * t3;
+    t12 = C7 * t17;
+    t1 = t15 - t12;
+    t9 = C24 * t6;
+    t18 = C7 * t13;
+    t14 = t9 - t18;
+    t3 = t5 + t4;
+    t17 = t10 + t11;
+    t15 = t19 + t7;
+    t12 = t0 - t2;
+    t6 = t8 + t14;
+    t13 = t16 - t1;
+    t9 = t8 - t14;
+    t18 = t16 + t1;
+    t5 = t19 - t7;
+    t4 = t0 + t2;
+    re[15] = t3;
+    im[15] = t17;
+    re[39] = t15;
+    im[39] = t12;
+    re[63] = t6;
+    im[63] = t13;
+    re[87] = t9;
+    im[87] = t18;
+    re[111] = t5;
+    im[111] = t4;
+    t10 = re[30];
+    t11 = im[30];
+    t8 = re[54];
+    t14 = im[54];
+    t16 = re[78];
+    t1 = im[78];
+    t19 = re[102];
+    t7 = im[102];
+    t0 = re[6];
+    t2 = im[6];
+    t3 = t8 + t0;
+    t17 = t14 + t2;
+    t15 = t16 + t19;
+    t12 = t1 + t7;
+    t6 = t8 - t0;
+    t13 = t14 - t2;
+    t9 = t16 - t19;
+    t18 = t1 - t7;
+    t5 = t3 + t15;
+    t4 = t17 + t12;
+    t8 = t3 - t15;
+    t0 = C39 * t8;
+    t14 = t17 - t12;
+    t2 = C39 * t14;
+    t16 = C40 * t5;
+    t19 = t10 - t16;
+    t1 = C40 * t4;
+    t7 = t11 - t1;
+    t3 = t19 + t0;
+    t15 = t7 + t2;
+    t8 = t19 - t0;
+    t17 = t7 - t2;
+    t12 = C7 * t6;
+    t14 = C24 * t9;
+    t16 = t12 + t14;
+    t1 = C7 * t13;
+    t19 = C24 * t18;
+    t0 = t1 + t19;
+    t7 = C24 * t6;
+    t2 = C7 * t9;
+    t12 = t7 - t2;
+    t14 = C24 * t13;
+    t1 = C7 * t18;
+    t19 = t14 - t1;
+    t6 = t10 + t5;
+    t9 = t11 + t4;
+    t7 = t3 + t0;
+    t2 = t15 - t16;
+    t13 = t8 + t19;
+    t18 = t17 - t12;
+    t14 = t8 - t19;
+    t1 = t17 + t12;
+    t10 = t3 - t0;
+    t5 = t15 + t16;
+    re[30] = t6;
+    im[30] = t9;
+    re[54] = t7;
+    im[54] = t2;
+    re[78] = t13;
+    im[78] = t18;
+    re[102] = t14;
+    im[102] = t1;
+    re[6] = t10;
+    im[6] = t5;
+    t11 = re[45];
+    t4 = im[45];
+    t8 = re[69];
+    t19 = im[69];
+    t17 = re[93];
+    t12 = im[93];
+    t3 = re[117];
+    t0 = im[117];
+    t15 = re[21];
+    t16 = im[21];
+    t6 = t8 + t15;
+    t9 = t19 + t16;
+    t7 = t17 + t3;
+    t2 = t12 + t0;
+    t13 = t8 - t15;
+    t18 = t19 - t16;
+    t14 = t17 - t3;
+    t1 = t12 - t0;
+    t10 = t6 + t7;
+    t5 = t9 + t2;
+    t8 = t6 - t7;
+    t15 = C39 * t8;
+    t19 = t9 - t2;
+    t16 = C39 * t19;
+    t17 = C40 * t10;
+    t3 = t11 - t17;
+    t12 = C40 * t5;
+    t0 = t4 - t12;
+    t6 = t3 + t15;
+    t7 = t0 + t16;
+    t8 = t3 - t15;
+    t9 = t0 - t16;
+    t2 = C7 * t13;
+    t19 = C24 * t14;
+    t17 = t2 + t19;
+    t12 = C7 * t18;
+    t3 = C24 * t1;
+    t15 = t12 + t3;
+    t0 = C24 * t13;
+    t16 = C7 * t14;
+    t2 = t0 - t16;
+    t19 = C24 * t18;
+    t12 = C7 * t1;
+    t3 = t19 - t12;
+    t13 = t11 + t10;
+    t14 = t4 + t5;
+    t0 = t6 + t15;
+    t16 = t7 - t17;
+    t18 = t8 + t3;
+    t1 = t9 - t2;
+    t19 = t8 - t3;
+    t12 = t9 + t2;
+    t11 = t6 - t15;
+    t10 = t7 + t17;
+    re[45] = t13;
+    im[45] = t14;
+    re[69] = t0;
+    im[69] = t16;
+    re[93] = t18;
+    im[93] = t1;
+    re[117] = t19;
+    im[117] = t12;
+    re[21] = t11;
+    im[21] = t10;
+    t4 = re[60];
+    t5 = im[60];
+    t8 = re[84];
+    t3 = im[84];
+    t9 = re[108];
+    t2 = im[108];
+    t6 = re[12];
+    t15 = im[12];
+    t7 = re[36];
+    t17 = im[36];
+    t13 = t8 + t7;
+    t14 = t3 + t17;
+    t0 = t9 + t6;
+    t16 = t2 + t15;
+    t18 = t8 - t7;
+    t1 = t3 - t17;
+    t19 = t9 - t6;
+    t12 = t2 - t15;
+    t11 = t13 + t0;
+    t10 = t14 + t16;
+    t8 = t13 - t0;
+    t7 = C39 * t8;
+    t3 = t14 - t16;
+    t17 = C39 * t3;
+    t9 = C40 * t11;
+    t6 = t4 - t9;
+    t2 = C40 * t10;
+    t15 = t5 - t2;
+    t13 = t6 + t7;
+    t0 = t15 + t17;
+    t8 = t6 - t7;
+    t14 = t15 - t17;
+    t16 = C7 * t18;
+    t3 = C24 * t19;
+    t9 = t16 + t3;
+    t2 = C7 * t1;
+    t6 = C24 * t12;
+    t7 = t2 + t6;
+    t15 = C24 * t18;
+    t17 = C7 * t19;
+    t16 = t15 - t17;
+    t3 = C24 * t1;
+    t2 = C7 * t12;
+    t6 = t3 - t2;
+    t18 = t4 + t11;
+    t19 = t5 + t10;
+    t15 = t13 + t7;
+    t17 = t0 - t9;
+    t1 = t8 + t6;
+    t12 = t14 - t16;
+    t3 = t8 - t6;
+    t2 = t14 + t16;
+    t4 = t13 - t7;
+    t11 = t0 + t9;
+    re[60] = t18;
+    im[60] = t19;
+    re[84] = t15;
+    im[84] = t17;
+    re[108] = t1;
+    im[108] = t12;
+    re[12] = t3;
+    im[12] = t2;
+    re[36] = t4;
+    im[36] = t11;
+    t5 = re[75];
+    t10 = im[75];
+    t8 = re[99];
+    t6 = im[99];
+    t14 = re[3];
+    t16 = im[3];
+    t13 = re[27];
+    t7 = im[27];
+    t0 = re[51];
+    t9 = im[51];
+    t18 = t8 + t0;
+    t19 = t6 + t9;
+    t15 = t14 + t13;
+    t17 = t16 + t7;
+    t1 = t8 - t0;
+    t12 = t6 - t9;
+    t3 = t14 - t13;
+    t2 = t16 - t7;
+    t4 = t18 + t15;
+    t11 = t19 + t17;
+    t8 = t18 - t15;
+    t0 = C39 * t8;
+    t6 = t19 - t17;
+    t9 = C39 * t6;
+    t14 = C40 * t4;
+    t13 = t5 - t14;
+    t16 = C40 * t11;
+    t7 = t10 - t16;
+    t18 = t13 + t0;
+    t15 = t7 + t9;
+    t8 = t13 - t0;
+    t19 = t7 - t9;
+    t17 = C7 * t1;
+    t6 = C24 * t3;
+    t14 = t17 + t6;
+    t16 = C7 * t12;
+    t13 = C24 * t2;
+    t0 = t16 + t13;
+    t7 = C24 * t1;
+    t9 = C7 * t3;
+    t17 = t7 - t9;
+    t6 = C24 * t12;
+    t16 = C7 * t2;
+    t13 = t6 - t16;
+    t1 = t5 + t4;
+    t3 = t10 + t11;
+    t7 = t18 + t0;
+    t9 = t15 - t14;
+    t12 = t8 + t13;
+    t2 = t19 - t17;
+    t6 = t8 - t13;
+    t16 = t19 + t17;
+    t5 = t18 - t0;
+    t4 = t15 + t14;
+    re[75] = t1;
+    im[75] = t3;
+    re[99] = t7;
+    im[99] = t9;
+    re[3] = t12;
+    im[3] = t2;
+    re[27] = t6;
+    im[27] = t16;
+    re[51] = t5;
+    im[51] = t4;
+    t10 = re[90];
+    t11 = im[90];
+    t8 = re[114];
+    t13 = im[114];
+    t19 = re[18];
+    t17 = im[18];
+    t18 = re[42];
+    t0 = im[42];
+    t15 = re[66];
+    t14 = im[66];
+    t1 = t8 + t15;
+    t3 = t13 + t14;
+    t7 = t19 + t18;
+    t9 = t17 + t0;
+    t12 = t8 - t15;
+    t2 = t13 - t14;
+    t6 = t19 - t18;
+    t16 = t17 - t0;
+    t5 = t1 + t7;
+    t4 = t3 + t9;
+    t8 = t1 - t7;
+    t15 = C39 * t8;
+    t13 = t3 - t9;
+    t14 = C39 * t13;
+    t19 = C40 * t5;
+    t18 = t10 - t19;
+    t17 = C40 * t4;
+    t0 = t11 - t17;
+    t1 = t18 + t15;
+    t7 = t0 + t14;
+    t8 = t18 - t15;
+    t3 = t0 - t14;
+    t9 = C7 * t12;
+    t13 = C24 * t6;
+    t19 = t9 + t13;
+    t17 = C7 * t2;
+    t18 = C24 * t16;
+    t15 = t17 + t18;
+    t0 = C24 * t12;
+    t14 = C7 * t6;
+    t9 = t0 - t14;
+    t13 = C24 * t2;
+    t17 = C7 * t16;
+    t18 = t13 - t17;
+    t12 = t10 + t5;
+    t6 = t11 + t4;
+    t0 = t1 + t15;
+    t14 = t7 - t19;
+    t2 = t8 + t18;
+    t16 = t3 - t9;
+    t13 = t8 - t18;
+    t17 = t3 + t9;
+    t10 = t1 - t15;
+    t5 = t7 + t19;
+    re[90] = t12;
+    im[90] = t6;
+    re[114] = t0;
+    im[114] = t14;
+    re[18] = t2;
+    im[18] = t16;
+    re[42] = t13;
+    im[42] = t17;
+    re[66] = t10;
+    im[66] = t5;
+    t11 = re[105];
+    t4 = im[105];
+    t8 = re[9];
+    t18 = im[9];
+    t3 = re[33];
+    t9 = im[33];
+    t1 = re[57];
+    t15 = im[57];
+    t7 = re[81];
+    t19 = im[81];
+    t12 = t8 + t7;
+    t6 = t18 + t19;
+    t0 = t3 + t1;
+    t14 = t9 + t15;
+    t2 = t8 - t7;
+    t16 = t18 - t19;
+    t13 = t3 - t1;
+    t17 = t9 - t15;
+    t10 = t12 + t0;
+    t5 = t6 + t14;
+    t8 = t12 - t0;
+    t7 = C39 * t8;
+    t18 = t6 - t14;
+    t19 = C39 * t18;
+    t3 = C40 * t10;
+    t1 = t11 - t3;
+    t9 = C40 * t5;
+    t15 = t4 - t9;
+    t12 = t1 + t7;
+    t0 = t15 + t19;
+    t8 = t1 - t7;
+    t6 = t15 - t19;
+    t14 = C7 * t2;
+    t18 = C24 * t13;
+    t3 = t14 + t18;
+    t9 = C7 * t16;
+    t1 = C24 * t17;
+    t7 = t9 + t1;
+    t15 = C24 * t2;
+    t19 = C7 * t13;
+    t14 = t15 - t19;
+    t18 = C24 * t16;
+    t9 = C7 * t17;
+    t1 = t18 - t9;
+    t2 = t11 + t10;
+    t13 = t4 + t5;
+    t15 = t12 + t7;
+    t19 = t0 - t3;
+    t16 = t8 + t1;
+    t17 = t6 - t14;
+    t18 = t8 - t1;
+    t9 = t6 + t14;
+    t11 = t12 - t7;
+    t10 = t0 + t3;
+    re[105] = t2;
+    im[105] = t13;
+    re[9] = t15;
+    im[9] = t19;
+    re[33] = t16;
+    im[33] = t17;
+    re[57] = t18;
+    im[57] = t9;
+    re[81] = t11;
+    im[81] = t10;
+    t4 = X[80];
+    t5 = 0.8660254037844387 * t4;
+    t8 = (-0.49999999999999994) * t4;
+    t1 = X[110];
+    t6 = 0.7518398074789774 * t1;
+    t14 = (-0.6593458151000688) * t1;
+    t12 = X[99];
+    t7 = 0.7933533402912352 * t12;
+    t0 = 0.6087614290087207 * t12;
+    t3 = X[69];
+    t2 = 0.8968727415326883 * t3;
+    t13 = 0.4422886902190013 * t3;
+    t15 = X[39];
+    t19 = 0.9659258262890683 * t15;
+    t16 = 0.25881904510252074 * t15;
+    t17 = X[9];
+    t18 = 0.9978589232386035 * t17;
+    t9 = 0.06540312923014306 * t17;
+    t11 = X[20];
+    t10 = 0.9914448613738104 * t11;
+    t4 = (-0.13052619222005157) * t11;
+    t1 = X[50];
+    t12 = 0.9469301294951057 * t1;
+    t3 = (-0.3214394653031616) * t1;
+    t15 = t5 + t19;
+    t17 = t8 + t16;
+    t11 = t7 + t10;
+    t1 = t0 + t4;
+    t5 = t5 - t19;
+    t19 = t8 - t16;
+    t8 = t7 - t10;
+    t16 = t0 - t4;
+    t7 = t15 + t11;
+    t10 = t17 + t1;
+    t0 = t5 + t16;
+    t4 = t19 - t8;
+    t15 = t15 - t11;
+    t11 = t17 - t1;
+    t17 = t5 - t16;
+    t1 = t19 + t8;
+    t5 = t6 + t18;
+    t16 = t14 + t9;
+    t19 = t2 + t12;
+    t8 = t13 + t3;
+    t6 = t6 - t18;
+    t18 = t14 - t9;
+    t14 = t2 - t12;
+    t9 = t13 - t3;
+    t2 = t5 + t19;
+    t12 = t16 + t8;
+    t13 = t6 + t9;
+    t3 = t18 - t14;
+    t5 = t5 - t19;
+    t19 = t16 - t8;
+    t16 = t6 - t9;
+    t8 = t18 + t14;
+    t6 = t13 + t3;
+    t9 = t13 - t3;
+    t18 = C6 * t6;
+    t14 = (-C6) * t9;
+    t13 = t16 - t8;
+    t3 = t16 + t8;
+    t6 = (-C6) * t13;
+    t9 = (-C6) * t3;
+    t16 = t7 - t2;
+    t8 = t10 - t12;
+    t13 = t7 + t2;
+    t3 = t10 + t12;
+    t7 = t0 - t18;
+    t2 = t4 - t14;
+    t10 = t0 + t18;
+    t12 = t4 + t14;
+    t0 = t15 - t19;
+    t18 = t11 + t5;
+    t4 = t15 + t19;
+    t14 = t11 - t5;
+    t15 = t17 - t6;
+    t19 = t1 - t9;
+    t11 = t17 + t6;
+    t5 = t1 + t9;
+    re[40] = t13;
+    im[40] = t3;
+    re[55] = t10;
+    im[55] = t12;
+    re[70] = t4;
+    im[70] = t14;
+    re[85] = t11;
+    im[85] = t5;
+    re[100] = t16;
+    im[100] = t8;
+    re[115] = t7;
+    im[115] = t2;
+    re[10] = t0;
+    im[10] = t18;
+    re[25] = t15;
+    im[25] = t19;
+    t17 = X[111];
+    t6 = 0.7431448254773942 * t17;
+    t1 = 0.6691306063588582 * t17;
+    t9 = X[81];
+    t13 = 0.8594064115014527 * t9;
+    t3 = 0.5112930860770522 * t9;
+    t10 = X[51];
+    t12 = 0.9426414910921784 * t10;
+    t4 = 0.33380685923377096 * t10;
+    t14 = X[21];
+    t11 = 0.9896513868196702 * t14;
+    t5 = 0.1434926219911793 * t14;
+    t16 = X[8];
+    t8 = 0.9986295347545738 * t16;
+    t7 = (-0.05233595624294383) * t16;
+    t2 = X[38];
+    t0 = 0.9692309097067544 * t2;
+    t18 = (-0.24615329302899303) * t2;
+    t15 = X[68];
+    t19 = 0.9025852843498606 * t15;
+    t17 = (-0.4305110968082951) * t15;
+    t9 = X[98];
+    t10 = 0.8012538126910607 * t9;
+    t14 = (-0.598324600570659) * t9;
+    t16 = t6 + t8;
+    t2 = t1 + t7;
+    t15 = t12 + t19;
+    t9 = t4 + t17;
+    t6 = t6 - t8;
+    t8 = t1 - t7;
+    t1 = t12 - t19;
+    t7 = t4 - t17;
+    t12 = t16 + t15;
+    t19 = t2 + t9;
+    t4 = t6 + t7;
+    t17 = t8 - t1;
+    t16 = t16 - t15;
+    t15 = t2 - t9;
+    t2 = t6 - t7;
+    t9 = t8 + t1;
+    t6 = t13 + t0;
+    t7 = t3 + t18;
+    t8 = t11 + t10;
+    t1 = t5 + t14;
+    t13 = t13 - t0;
+    t0 = t3 - t18;
+    t3 = t11 - t10;
+    t18 = t5 - t14;
+    t11 = t6 + t8;
+    t10 = t7 + t1;
+    t5 = t13 + t18;
+    t14 = t0 - t3;
+    t6 = t6 - t8;
+    t8 = t7 - t1;
+    t7 = t13 - t18;
+    t1 = t0 + t3;
+    t13 = t5 + t14;
+    t18 = t5 - t14;
+    t0 = C6 * t13;
+    t3 = (-C6) * t18;
+    t5 = t7 - t1;
+    t14 = t7 + t1;
+    t13 = (-C6) * t5;
+    t18 = (-C6) * t14;
+    t7 = t12 - t11;
+    t1 = t19 - t10;
+    t5 = t12 + t11;
+    t14 = t19 + t10;
+    t12 = t4 - t0;
+    t11 = t17 - t3;
+    t19 = t4 + t0;
+    t10 = t17 + t3;
+    t4 = t16 - t8;
+    t0 = t15 + t6;
+    t17 = t16 + t8;
+    t3 = t15 - t6;
+    t16 = t2 - t13;
+    t8 = t9 - t18;
+    t15 = t2 + t13;
+    t6 = t9 + t18;
+    re[64] = t5;
+    im[64] = t14;
+    re[79] = t19;
+    im[79] = t10;
+    re[94] = t17;
+    im[94] = t3;
+    re[109] = t15;
+    im[109] = t6;
+    re[4] = t7;
+    im[4] = t1;
+    re[19] = t12;
+    im[19] = t11;
+    re[34] = t4;
+    im[34] = t0;
+    re[49] = t16;
+    im[49] = t8;
+    t2 = X[63];
+    t13 = 0.9135454576426009 * t2;
+    t9 = 0.40673664307580015 * t2;
+    t18 = X[33];
+    t5 = 0.9753423205085127 * t18;
+    t14 = 0.22069743502150108 * t18;
+    t19 = X[3];
+    t10 = 0.9996573249755573 * t19;
+    t17 = 0.02617694830787315 * t19;
+    t3 = X[26];
+    t15 = 0.9855560590580777 * t3;
+    t6 = (-0.1693495038490246) * t3;
+    t7 = X[56];
+    t1 = 0.9335804264972017 * t7;
+    t12 = (-0.35836794954530027) * t7;
+    t11 = X[86];
+    t4 = 0.8457278217039733 * t11;
+    t0 = (-0.5336145159156115) * t11;
+    t16 = X[116];
+    t8 = 0.7253743710122876 * t16;
+    t2 = (-0.6883545756937539) * t16;
+    t18 = X[93];
+    t19 = 0.8166415551616789 * t18;
+    t3 = 0.5771451900372336 * t18;
+    t7 = t13 + t1;
+    t11 = t9 + t12;
+    t16 = t10 + t8;
+    t18 = t17 + t2;
+    t13 = t13 - t1;
+    t1 = t9 - t12;
+    t9 = t10 - t8;
+    t12 = t17 - t2;
+    t10 = t7 + t16;
+    t8 = t11 + t18;
+    t17 = t13 + t12;
+    t2 = t1 - t9;
+    t7 = t7 - t16;
+    t16 = t11 - t18;
+    t11 = t13 - t12;
+    t18 = t1 + t9;
+    t13 = t5 + t4;
+    t12 = t14 + t0;
+    t1 = t15 + t19;
+    t9 = t6 + t3;
+    t5 = t5 - t4;
+    t4 = t14 - t0;
+    t14 = t15 - t19;
+    t0 = t6 - t3;
+    t15 = t13 + t1;
+    t19 = t12 + t9;
+    t6 = t5 + t0;
+    t3 = t4 - t14;
+    t13 = t13 - t1;
+    t1 = t12 - t9;
+    t12 = t5 - t0;
+    t9 = t4 + t14;
+    t5 = t6 + t3;
+    t0 = t6 - t3;
+    t4 = C6 * t5;
+    t14 = (-C6) * t0;
+    t6 = t12 - t9;
+    t3 = t12 + t9;
+    t5 = (-C6) * t6;
+    t0 = (-C6) * t3;
+    t12 = t10 - t15;
+    t9 = t8 - t19;
+    t6 = t10 + t15;
+    t3 = t8 + t19;
+    t10 = t17 - t4;
+    t15 = t2 - t14;
+    t8 = t17 + t4;
+    t19 = t2 + t14;
+    t17 = t7 - t1;
+    t4 = t16 + t13;
+    t2 = t7 + t1;
+    t14 = t16 - t13;
+    t7 = t11 - t5;
+    t1 = t18 - t0;
+    t16 = t11 + t5;
+    t13 = t18 + t0;
+    re[88] = t6;
+    im[88] = t3;
+    re[103] = t8;
+    im[103] = t19;
+    re[118] = t2;
+    im[118] = t14;
+    re[13] = t16;
+    im[13] = t13;
+    re[28] = t12;
+    im[28] = t9;
+    re[43] = t10;
+    im[43] = t15;
+    re[58] = t17;
+    im[58] = t4;
+    re[73] = t7;
+    im[73] = t1;
+    t11 = X[15];
+    t5 = 0.9945218953682733 * t11;
+    t18 = 0.10452846326765346 * t11;
+    t0 = X[14];
+    t6 = 0.9958049275746618 * t0;
+    t3 = (-0.09150161866340238) * t0;
+    t8 = X[44];
+    t19 = 0.958819734868193 * t8;
+    t2 = (-0.2840153447039226) * t8;
+    t14 = X[74];
+    t16 = 0.8849876374630419 * t14;
+    t13 = (-0.4656145203251114) * t14;
+    t12 = X[104];
+    t9 = 0.7771459614569709 * t12;
+    t10 = (-0.6293203910498375) * t12;
+    t15 = X[105];
+    t17 = 0.7688418320734596 * t15;
+    t4 = 0.6394390019805847 * t15;
+    t7 = X[75];
+    t1 = 0.8788171126619654 * t7;
+    t11 = 0.4771587602596084 * t7;
+    t0 = X[45];
+    t8 = 0.9550199444571866 * t0;
+    t14 = 0.296541574975571 * t0;
+    t12 = t5 + t9;
+    t15 = t18 + t10;
+    t7 = t19 + t1;
+    t0 = t2 + t11;
+    t5 = t5 - t9;
+    t9 = t18 - t10;
+    t18 = t19 - t1;
+    t10 = t2 - t11;
+    t19 = t12 + t7;
+    t1 = t15 + t0;
+    t2 = t5 + t10;
+    t11 = t9 - t18;
+    t12 = t12 - t7;
+    t7 = t15 - t0;
+    t15 = t5 - t10;
+    t0 = t9 + t18;
+    t5 = t6 + t17;
+    t10 = t3 + t4;
+    t9 = t16 + t8;
+    t18 = t13 + t14;
+    t6 = t6 - t17;
+    t17 = t3 - t4;
+    t3 = t16 - t8;
+    t4 = t13 - t14;
+    t16 = t5 + t9;
+    t8 = t10 + t18;
+    t13 = t6 + t4;
+    t14 = t17 - t3;
+    t5 = t5 - t9;
+    t9 = t10 - t18;
+    t10 = t6 - t4;
+    t18 = t17 + t3;
+    t6 = t13 + t14;
+    t4 = t13 - t14;
+    t17 = C6 * t6;
+    t3 = (-C6) * t4;
+    t13 = t10 - t18;
+    t14 = t10 + t18;
+    t6 = (-C6) * t13;
+    t4 = (-C6) * t14;
+    t10 = t19 - t16;
+    t18 = t1 - t8;
+    t13 = t19 + t16;
+    t14 = t1 + t8;
+    t19 = t2 - t17;
+    t16 = t11 - t3;
+    t1 = t2 + t17;
+    t8 = t11 + t3;
+    t2 = t12 - t9;
+    t17 = t7 + t5;
+    t11 = t12 + t9;
+    t3 = t7 - t5;
+    t12 = t15 - t6;
+    t9 = t0 - t4;
+    t7 = t15 + t6;
+    t5 = t0 + t4;
+    re[112] = t13;
+    im[112] = t14;
+    re[7] = t1;
+    im[7] = t8;
+    re[22] = t11;
+    im[22] = t3;
+    re[37] = t7;
+    im[37] = t5;
+    re[52] = t10;
+    im[52] = t18;
+    re[67] = t19;
+    im[67] = t16;
+    re[82] = t2;
+    im[82] = t17;
+    re[97] = t12;
+    im[97] = t9;
+    t15 = X[32];
+    t6 = 0.9781476007338057 * t15;
+    t0 = (-0.20791169081775931) * t15;
+    t4 = X[62];
+    t13 = 0.9187912101488983 * t4;
+    t14 = (-0.39474385638426723) * t4;
+    t1 = X[92];
+    t8 = 0.8241261886220156 * t1;
+    t11 = (-0.5664062369248328) * t1;
+    t3 = X[117];
+    t7 = 0.7163019434246544 * t3;
+    t5 = 0.6977904598416801 * t3;
+    t10 = X[87];
+    t18 = 0.838670567945424 * t10;
+    t19 = 0.544639035015027 * t10;
+    t16 = X[57];
+    t2 = 0.9288095528719242 * t16;
+    t17 = 0.3705574375098362 * t16;
+    t12 = X[27];
+    t9 = 0.9832549075639546 * t12;
+    t15 = 0.18223552549214747 * t12;
+    t4 = X[2];
+    t1 = 0.999914327574007 * t4;
+    t3 = (-0.01308959557134444) * t4;
+    t10 = t6 + t18;
+    t16 = t0 + t19;
+    t12 = t8 + t9;
+    t4 = t11 + t15;
+    t6 = t6 - t18;
+    t18 = t0 - t19;
+    t0 = t8 - t9;
+    t19 = t11 - t15;
+    t8 = t10 + t12;
+    t9 = t16 + t4;
+    t11 = t6 + t19;
+    t15 = t18 - t0;
+    t10 = t10 - t12;
+    t12 = t16 - t4;
+    t16 = t6 - t19;
+    t4 = t18 + t0;
+    t6 = t13 + t2;
+    t19 = t14 + t17;
+    t18 = t7 + t1;
+    t0 = t5 + t3;
+    t13 = t13 - t2;
+    t2 = t14 - t17;
+    t14 = t7 - t1;
+    t17 = t5 - t3;
+    t7 = t6 + t18;
+    t1 = t19 + t0;
+    t5 = t13 + t17;
+    t3 = t2 - t14;
+    t6 = t6 - t18;
+    t18 = t19 - t0;
+    t19 = t13 - t17;
+    t0 = t2 + t14;
+    t13 = t5 + t3;
+    t17 = t5 - t3;
+    t2 = C6 * t13;
+    t14 = (-C6) * t17;
+    t5 = t19 - t0;
+    t3 = t19 + t0;
+    t13 = (-C6) * t5;
+    t17 = (-C6) * t3;
+    t19 = t8 - t7;
+    t0 = t9 - t1;
+    t5 = t8 + t7;
+    t3 = t9 + t1;
+    t8 = t11 - t2;
+    t7 = t15 - t14;
+    t9 = t11 + t2;
+    t1 = t15 + t14;
+    t11 = t10 - t18;
+    t2 = t12 + t6;
+    t15 = t10 + t18;
+    t14 = t12 - t6;
+    t10 = t16 - t13;
+    t18 = t4 - t17;
+    t12 = t16 + t13;
+    t6 = t4 + t17;
+    re[16] = t5;
+    im[16] = t3;
+    re[31] = t9;
+    im[31] = t1;
+    re[46] = t15;
+    im[46] = t14;
+    re[61] = t12;
+    im[61] = t6;
+    re[76] = t19;
+    im[76] = t0;
+    re[91] = t8;
+    im[91] = t7;
+    re[106] = t11;
+    im[106] = t2;
+    re[1] = t10;
+    im[1] = t18;
+    t16 = re[40];
+    t13 = im[40];
+    t4 = re[64];
+    t17 = im[64];
+    t5 = re[88];
+    t3 = im[88];
+    t9 = re[112];
+    t1 = im[112];
+    t15 = re[16];
+    t14 = im[16];
+    t12 = t4 + t15;
+    t6 = t17 + t14;
+    t19 = t5 + t9;
+    t0 = t3 + t1;
+    t8 = t4 - t15;
+    t7 = t17 - t14;
+    t11 = t5 - t9;
+    t2 = t3 - t1;
+    t10 = t12 + t19;
+    t18 = t6 + t0;
+    t4 = t12 - t19;
+    t15 = C39 * t4;
+    t17 = t6 - t0;
+    t14 = C39 * t17;
+    t5 = C40 * t10;
+    t9 = t16 - t5;
+    t3 = C40 * t18;
+    t1 = t13 - t3;
+    t12 = t9 + t15;
+    t19 = t1 + t14;
+    t4 = t9 - t15;
+    t6 = t1 - t14;
+    t0 = C7 * t8;
+    t17 = C24 * t11;
+    t5 = t0 + t17;
+    t3 = C7 * t7;
+    t9 = C24 * t2;
+    t15 = t3 + t9;
+    t1 = C24 * t8;
+    t14 = C7 * t11;
+    t0 = t1 - t14;
+    t17 = C24 * t7;
+    t3 = C7 * t2;
+    t9 = t17 - t3;
+    t8 = t16 + t10;
+    t11 = t13 + t18;
+    t1 = t12 + t15;
+    t14 = t19 - t5;
+    t7 = t4 + t9;
+    t2 = t6 - t0;
+    t17 = t4 - t9;
+    t3 = t6 + t0;
+    t16 = t12 - t15;
+    t10 = t19 + t5;
+    re[40] = t8;
+    im[40] = t11;
+    re[64] = t1;
+    im[64] = t14;
+    re[88] = t7;
+    im[88] = t2;
+    re[112] = t17;
+    im[112] = t3;
+    re[16] = t16;
+    im[16] = t10;
+    t13 = re[55];
+    t18 = im[55];
+    t4 = re[79];
+    t9 = im[79];
+    t6 = re[103];
+    t0 = im[103];
+    t12 = re[7];
+    t15 = im[7];
+    t19 = re[31];
+    t5 = im[31];
+    t8 = t4 + t19;
+    t11 = t9 + t5;
+    t1 = t6 + t12;
+    t14 = t0 + t15;
+    t7 = t4 - t19;
+    t2 = t9 - t5;
+    t17 = t6 - t12;
+    t3 = t0 - t15;
+    t16 = t8 + t1;
+    t10 = t11 + t14;
+    t4 = t8 - t1;
+    t19 = C39 * t4;
+    t9 = t11 - t14;
+    t5 = C39 * t9;
+    t6 = C40 * t16;
+    t12 = t13 - t6;
+    t0 = C40 * t10;
+    t15 = t18 - t0;
+    t8 = t12 + t19;
+    t1 = t15 + t5;
+    t4 = t12 - t19;
+    t11 = t15 - t5;
+    t14 = C7 * t7;
+    t9 = C24 * t17;
+    t6 = t14 + t9;
+    t0 = C7 * t2;
+    t12 = C24 * t3;
+    t19 = t0 + t12;
+    t15 = C24 * t7;
+    t5 = C7 * t17;
+    t14 = t15 - t5;
+    t9 = C24 * t2;
+    t0 = C7 * t3;
+    t12 = t9 - t0;
+    t7 = t13 + t16;
+    t17 = t18 + t10;
+    t15 = t8 + t19;
+    t5 = t1 - t6;
+    t2 = t4 + t12;
+    t3 = t11 - t14;
+    t9 = t4 - t12;
+    t0 = t11 + t14;
+    t13 = t8 - t19;
+    t16 = t1 + t6;
+    re[55] = t7;
+    im[55] = t17;
+    re[79] = t15;
+    im[79] = t5;
+    re[103] = t2;
+    im[103] = t3;
+    re[7] = t9;
+    im[7] = t0;
+    re[31] = t13;
+    im[31] = t16;
+    t18 = re[70];
+    t10 = im[70];
+    t4 = re[94];
+    t12 = im[94];
+    t11 = re[118];
+    t14 = im[118];
+    t8 = re[22];
+    t19 = im[22];
+    t1 = re[46];
+    t6 = im[46];
+    t7 = t4 + t1;
+    t17 = t12 + t6;
+    t15 = t11 + t8;
+    t5 = t14 + t19;
+    t2 = t4 - t1;
+    t3 = t12 - t6;
+    t9 = t11 - t8;
+    t0 = t14 - t19;
+    t13 = t7 + t15;
+    t16 = t17 + t5;
+    t4 = t7 - t15;
+    t1 = C39 * t4;
+    t12 = t17 - t5;
+    t6 = C39 * t12;
+    t11 = C40 * t13;
+    t8 = t18 - t11;
+    t14 = C40 * t16;
+    t19 = t10 - t14;
+    t7 = t8 + t1;
+    t15 = t19 + t6;
+    t4 = t8 - t1;
+    t17 = t19 - t6;
+    t5 = C7 * t2;
+    t12 = C24 * t9;
+    t11 = t5 + t12;
+    t14 = C7 * t3;
+    t8 = C24 * t0;
+    t1 = t14 + t8;
+    t19 = C24 * t2;
+    t6 = C7 * t9;
+    t5 = t19 - t6;
+    t12 = C24 * t3;
+    t14 = C7 * t0;
+    t8 = t12 - t14;
+    t2 = t18 + t13;
+    t9 = t10 + t16;
+    t19 = t7 + t1;
+    t6 = t15 - t11;
+    t3 = t4 + t8;
+    t0 = t17 - t5;
+    t12 = t4 - t8;
+    t14 = t17 + t5;
+    t18 = t7 - t1;
+    t13 = t15 + t11;
+    re[70] = t2;
+    im[70] = t9;
+    re[94] = t19;
+    im[94] = t6;
+    re[118] = t3;
+    im[118] = t0;
+    re[22] = t12;
+    im[22] = t14;
+    re[46] = t18;
+    im[46] = t13;
+    t10 = re[85];
+    t16 = im[85];
+    t4 = re[109];
+    t8 = im[109];
+    t17 = re[13];
+    t5 = im[13];
+    t7 = re[37];
+    t1 = im[37];
+    t15 = re[61];
+    t11 = im[61];
+    t2 = t4 + t15;
+    t9 = t8 + t11;
+    t19 = t17 + t7;
+    t6 = t5 + t1;
+    t3 = t4 - t15;
+    t0 = t8 - t11;
+    t12 = t17 - t7;
+    t14 = t5 - t1;
+    t18 = t2 + t19;
+    t13 = t9 + t6;
+    t4 = t2 - t19;
+    t15 = C39 * t4;
+    t8 = t9 - t6;
+    t11 = C39 * t8;
+    t17 = C40 * t18;
+    t7 = t10 - t17;
+    t5 = C40 * t13;
+    t1 = t16 - t5;
+    t2 = t7 + t15;
+    t19 = t1 + t11;
+    t4 = t7 - t15;
+    t9 = t1 - t11;
+    t6 = C7 * t3;
+    t8 = C24 * t12;
+    t17 = t6 + t8;
+    t5 = C7 * t0;
+    t7 = C24 * t14;
+    t15 = t5 + t7;
+    t1 = C24 * t3;
+    t11 = C7 * t12;
+    t6 = t1 - t11;
+    t8 = C24 * t0;
+    t5 = C7 * t14;
+    t7 = t8 - t5;
+    t3 = t10 + t18;
+    t12 = t16 + t13;
+    t1 = t2 + t15;
+    t11 = t19 - t17;
+    t0 = t4 + t7;
+    t14 = t9 - t6;
+    t8 = t4 - t7;
+    t5 = t9 + t6;
+    t10 = t2 - t15;
+    t18 = t19 + t17;
+    re[85] = t3;
+    im[85] = t12;
+    re[109] = t1;
+    im[109] = t11;
+    re[13] = t0;
+    im[13] = t14;
+    re[37] = t8;
+    im[37] = t5;
+    re[61] = t10;
+    im[61] = t18;
+    t16 = re[100];
+    t13 = im[100];
+    t4 = re[4];
+    t7 = im[4];
+    t9 = re[28];
+    t6 = im[28];
+    t2 = re[52];
+    t15 = im[52];
+    t19 = re[76];
+    t17 = im[76];
+    t3 = t4 + t19;
+    t12 = t7 + t17;
+    t1 = t9 + t2;
+    t11 = t6 + t15;
+    t0 = t4 - t19;
+    t14 = t7 - t17;
+    t8 = t9 - t2;
+    t5 = t6 - t15;
+    t10 = t3 + t1;
+    t18 = t12 + t11;
+    t4 = t3 - t1;
+    t19 = C39 * t4;
+    t7 = t12 - t11;
+    t17 = C39 * t7;
+    t9 = C40 * t10;
+    t2 = t16 - t9;
+    t6 = C40 * t18;
+    t15 = t13 - t6;
+    t3 = t2 + t19;
+    t1 = t15 + t17;
+    t4 = t2 - t19;
+    t12 = t15 - t17;
+    t11 = C7 * t0;
+    t7 = C24 * t8;
+    t9 = t11 + t7;
+    t6 = C7 * t14;
+    t2 = C24 * t5;
+    t19 = t6 + t2;
+    t15 = C24 * t0;
+    t17 = C7 * t8;
+    t11 = t15 - t17;
+    t7 = C24 * t14;
+    t6 = C7 * t5;
+    t2 = t7 - t6;
+    t0 = t16 + t10;
+    t8 = t13 + t18;
+    t15 = t3 + t19;
+    t17 = t1 - t9;
+    t14 = t4 + t2;
+    t5 = t12 - t11;
+    t7 = t4 - t2;
+    t6 = t12 + t11;
+    t16 = t3 - t19;
+    t10 = t1 + t9;
+    re[100] = t0;
+    im[100] = t8;
+    re[4] = t15;
+    im[4] = t17;
+    re[28] = t14;
+    im[28] = t5;
+    re[52] = t7;
+    im[52] = t6;
+    re[76] = t16;
+    im[76] = t10;
+    t13 = re[115];
+    t18 = im[115];
+    t4 = re[19];
+    t2 = im[19];
+    t12 = re[43];
+    t11 = im[43];
+    t3 = re[67];
+    t19 = im[67];
+    t1 = re[91];
+    t9 = im[91];
+    t0 = t4 + t1;
+    t8 = t2 + t9;
+    t15 = t12 + t3;
+    t17 = t11 + t19;
+    t14 = t4 - t1;
+    t5 = t2 - t9;
+    t7 = t12 - t3;
+    t6 = t11 - t19;
+    t16 = t0 + t15;
+    t10 = t8 + t17;
+    t4 = t0 - t15;
+    t1 = C39 * t4;
+    t2 = t8 - t17;
+    t9 = C39 * t2;
+    t12 = C40 * t16;
+    t3 = t13 - t12;
+    t11 = C40 * t10;
+    t19 = t18 - t11;
+    t0 = t3 + t1;
+    t15 = t19 + t9;
+    t4 = t3 - t1;
+    t8 = t19 - t9;
+    t17 = C7 * t14;
+    t2 = C24 * t7;
+    t12 = t17 + t2;
+    t11 = C7 * t5;
+    t3 = C24 * t6;
+    t1 = t11 + t3;
+    t19 = C24 * t14;
+    t9 = C7 * t7;
+    t17 = t19 - t9;
+    t2 = C24 * t5;
+    t11 = C7 * t6;
+    t3 = t2 - t11;
+    t14 = t13 + t16;
+    t7 = t18 + t10;
+    t19 = t0 + t1;
+    t9 = t15 - t12;
+    t5 = t4 + t3;
+    t6 = t8 - t17;
+    t2 = t4 - t3;
+    t11 = t8 + t17;
+    t13 = t0 - t1;
+    t16 = t15 + t12;
+    re[115] = t14;
+    im[115] = t7;
+    re[19] = t19;
+    im[19] = t9;
+    re[43] = t5;
+    im[43] = t6;
+    re[67] = t2;
+    im[67] = t11;
+    re[91] = t13;
+    im[91] = t16;
+    t18 = re[10];
+    t10 = im[10];
+    t4 = re[34];
+    t3 = im[34];
+    t8 = re[58];
+    t17 = im[58];
+    t0 = re[82];
+    t1 = im[82];
+    t15 = re[106];
+    t12 = im[106];
+    t14 = t4 + t15;
+    t7 = t3 + t12;
+    t19 = t8 + t0;
+    t9 = t17 + t1;
+    t5 = t4 - t15;
+    t6 = t3 - t12;
+    t2 = t8 - t0;
+    t11 = t17 - t1;
+    t13 = t14 + t19;
+    t16 = t7 + t9;
+    t4 = t14 - t19;
+    t15 = C39 * t4;
+    t3 = t7 - t9;
+    t12 = C39 * t3;
+    t8 = C40 * t13;
+    t0 = t18 - t8;
+    t17 = C40 * t16;
+    t1 = t10 - t17;
+    t14 = t0 + t15;
+    t19 = t1 + t12;
+    t4 = t0 - t15;
+    t7 = t1 - t12;
+    t9 = C7 * t5;
+    t3 = C24 * t2;
+    t8 = t9 + t3;
+    t17 = C7 * t6;
+    t0 = C24 * t11;
+    t15 = t17 + t0;
+    t1 = C24 * t5;
+    t12 = C7 * t2;
+    t9 = t1 - t12;
+    t3 = C24 * t6;
+    t17 = C7 * t11;
+    t0 = t3 - t17;
+    t5 = t18 + t13;
+    t2 = t10 + t16;
+    t1 = t14 + t15;
+    t12 = t19 - t8;
+    t6 = t4 + t0;
+    t11 = t7 - t9;
+    t3 = t4 - t0;
+    t17 = t7 + t9;
+    t18 = t14 - t15;
+    t13 = t19 + t8;
+    re[10] = t5;
+    im[10] = t2;
+    re[34] = t1;
+    im[34] = t12;
+    re[58] = t6;
+    im[58] = t11;
+    re[82] = t3;
+    im[82] = t17;
+    re[106] = t18;
+    im[106] = t13;
+    t10 = re[25];
+    t16 = im[25];
+    t4 = re[49];
+    t0 = im[49];
+    t7 = re[73];
+    t9 = im[73];
+    t14 = re[97];
+    t15 = im[97];
+    t19 = re[1];
+    t8 = im[1];
+    t5 = t4 + t19;
+    t2 = t0 + t8;
+    t1 = t7 + t14;
+    t12 = t9 + t15;
+    t6 = t4 - t19;
+    t11 = t0 - t8;
+    t3 = t7 - t14;
+    t17 = t9 - t15;
+    t18 = t5 + t1;
+    t13 = t2 + t12;
+    t4 = t5 - t1;
+    t19 = C39 * t4;
+    t0 = t2 - t12;
+    t8 = C39 * t0;
+    t7 = C40 * t18;
+    t14 = t10 - t7;
+    t9 = C40 * t13;
+    t15 = t16 - t9;
+    t5 = t14 + t19;
+    t1 = t15 + t8;
+    t4 = t14 - t19;
+    t2 = t15 - t8;
+    t12 = C7 * t6;
+    t0 = C24 * t3;
+    t7 = t12 + t0;
+    t9 = C7 * t11;
+    t14 = C24 * t17;
+    t19 = t9 + t14;
+    t15 = C24 * t6;
+    t8 = C7 * t3;
+    t12 = t15 - t8;
+    t0 = C24 * t11;
+    t9 = C7 * t17;
+    t14 = t0 - t9;
+    t6 = t10 + t18;
+    t3 = t16 + t13;
+    t15 = t5 + t19;
+    t8 = t1 - t7;
+    t11 = t4 + t14;
+    t17 = t2 - t12;
+    t0 = t4 - t14;
+    t9 = t2 + t12;
+    t10 = t5 - t19;
+    t18 = t1 + t7;
+    re[25] = t6;
+    im[25] = t3;
+    re[49] = t15;
+    im[49] = t8;
+    re[73] = t11;
+    im[73] = t17;
+    re[97] = t0;
+    im[97] = t9;
+    re[1] = t10;
+    im[1] = t18;
+}
+
+/**
+ *  Part 2 of ApplyWindowedIMDCT_W75_240_K120().
+ * 
+ *  @param {Number[]} X 
+ *    - The input block (240 points, only the first 120 points are used).
+ *  @param {Number[]} y 
+ *    - The array that would contain the output block (480 points).
+ *  @param {Number[]} re 
+ *    - The scratch buffer (real part, 120 points).
+ *  @param {Number[]} im 
+ *    - The scratch buffer (imaginary part, 120 points).
+ */
+function ApplyWindowedIMDCT_W75_240_K120_Part2(X, y, re, im) {
+    let t0, t1, t10, t11, t12, t13, t14, t15, t16, t17, t18, t19, t2, t3, t4, t5, t6, t7, t8, t9;
+    const C0 = 0.7071067811865476;
+    const C1 = 0.5590169943749475;
+    const C2 = 0.25;
+    const C3 = 0.9510565162951535;
+    const C4 = 0.5877852522924731;
+    const C5 = 0.5;
+    const C6 = 0.8660254037844386;
+    const C7 = 0.9999946454016965;
+    const C8 = 0.003272486506526625;
+    const C9 = 0.8643845233130174;
+    const C10 = 0.5028313791490421;
+    const C11 = 0.4971632662526543;
+    const C12 = 0.8676570098195441;
+    const C13 = 0.48576339371634003;
+    const C14 = 0.8740903416267589;
+    const C15 = 0.9998661379095618;
+    const C16 = 0.01636173162648678;
+    const C17 = 0.8577286100002721;
+    const C18 = 0.5141027441932217;
+    const C19 = 0.8509257293058021;
+    const C20 = 0.525286020378792;
+    const C21 = 0.4742802881232292;
+    const C22 = 0.8803739025537654;
+    const C23 = 0.9995663085020212;
+    const C24 = 0.02944817324796316;
+    const C25 = 0.9990952085533004;
+    const C26 = 0.04252956907655312;
+    const C27 = 0.8439770468681933;
+    const C28 = 0.5363792915089503;
+    const C29 = 0.4627159170443501;
+    const C30 = 0.8865066159447464;
+    const C31 = 0.4510722619751534;
+    const C32 = 0.8924874309908339;
+    const C33 = 0.99845291878395;
+    const C34 = 0.055603677682424614;
+    const C35 = 0.8368837533084093;
+    const C36 = 0.5473806568087966;
+    const C37 = 0.8296470640257853;
+    const C38 = 0.558288231251022;
+    const C39 = 0.4393513179959937;
+    const C40 = 0.898315322910159;
+    const C41 = 0.9976395492470157;
+    const C42 = 0.06866825888437376;
+    const C43 = 0.9966552393091803;
+    const C44 = 0.08172107413366822;
+    const C45 = 0.8222682189897751;
+    const C46 = 0.5691001458788982;
+    const C47 = 0.4275550934302821;
+    const C48 = 0.9039892931234433;
+    const C49 = 0.4156856095003708;
+    const C50 = 0.9095083694251006;
+    const C51 = 0.9955001576268845;
+    const C52 = 0.09475988689761111;
+    const C53 = 0.8147484825274894;
+    const C54 = 0.5798145481265136;
+    const C55 = 0.8070891431070594;
+    const C56 = 0.5904296021362011;
+    const C57 = 0.4037448999812271;
+    const C58 = 0.9148716061498187;
+    const C59 = 0.9941745021174282;
+    const C60 = 0.10778246304275935;
+    const C61 = 0.9926784999250583;
+    const C62 = 0.12078657121773083;
+    const C63 = 0.7992915131168641;
+    const C64 = 0.6009434890731024;
+    const C65 = 0.3917350108519559;
+    const C66 = 0.9200780843345949;
+    const C67 = 0.37965799994523275;
+    const C68 = 0.9251269118761953;
+    const C69 = 0.9910124073820492;
+    const C70 = 0.13376998323553513;
+    const C71 = 0.7913569286406602;
+    const C72 = 0.6113544074368165;
+    const C73 = 0.7832867492286504;
+    const C74 = 0.6216605733700774;
+    const C75 = 0.36751593659470355;
+    const C76 = 0.9300172236840121;
+    const C77 = 0.989176509964781;
+    const C78 = 0.14673047445536175;
+    const C79 = 0.9871711222448248;
+    const C80 = 0.159665824163761;
+    const C81 = 0.7750823576645314;
+    const C82 = 0.6318602209644087;
+    const C83 = 0.3553109012804161;
+    const C84 = 0.9347481818282924;
+    const C85 = 0.34304498527233984;
+    const C86 = 0.9393189756837131;
+    const C87 = 0.984996587835043;
+    const C88 = 0.1725738159551517;
+    const C89 = 0.7667451597285615;
+    const C90 = 0.641951602562703;
+    const C91 = 0.758276583956687;
+    const C92 = 0.6519329890586743;
+    const C93 = 0.3307202902720374;
+    const C94 = 0.9437288220682779;
+    const C95 = 0.9826532793307118;
+    const C96 = 0.18545223811159092;
+    const C97 = 0.9801415982456801;
+    const C98 = 0.19829888398174045;
+    const C99 = 0.74967808139577;
+    const C100 = 0.6618026701931303;
+    const C101 = 0.3183389280525497;
+    const C102 = 0.9479769653775104;
+    t16 = X[79];
+    t13 = 0.8660254037844387 * t16;
+    t4 = 0.49999999999999994 * t16;
+    t14 = X[49];
+    t2 = 0.9469301294951057 * t14;
+    t12 = 0.3214394653031616 * t14;
+    t5 = X[19];
+    t19 = 0.9914448613738104 * t5;
+    t1 = 0.13052619222005157 * t5;
+    t7 = X[10];
+    t6 = 0.9978589232386035 * t7;
+    t3 = (-0.06540312923014306) * t7;
+    t15 = X[40];
+    t8 = 0.9659258262890683 * t15;
+    t11 = (-0.25881904510252074) * t15;
+    t17 = X[70];
+    t0 = 0.8968727415326883 * t17;
+    t9 = (-0.4422886902190013) * t17;
+    t10 = X[100];
+    t18 = 0.7933533402912352 * t10;
+    t16 = (-0.6087614290087207) * t10;
+    t14 = X[109];
+    t5 = 0.7518398074789774 * t14;
+    t7 = 0.6593458151000688 * t14;
+    t15 = t13 + t8;
+    t17 = t4 + t11;
+    t10 = t19 + t18;
+    t14 = t1 + t16;
+    t13 = t13 - t8;
+    t8 = t4 - t11;
+    t4 = t19 - t18;
+    t11 = t1 - t16;
+    t19 = t15 + t10;
+    t18 = t17 + t14;
+    t1 = t13 + t11;
+    t16 = t8 - t4;
+    t15 = t15 - t10;
+    t10 = t17 - t14;
+    t17 = t13 - t11;
+    t14 = t8 + t4;
+    t13 = t2 + t0;
+    t11 = t12 + t9;
+    t8 = t6 + t5;
+    t4 = t3 + t7;
+    t2 = t2 - t0;
+    t0 = t12 - t9;
+    t12 = t6 - t5;
+    t9 = t3 - t7;
+    t6 = t13 + t8;
+    t5 = t11 + t4;
+    t3 = t2 + t9;
+    t7 = t0 - t12;
+    t13 = t13 - t8;
+    t8 = t11 - t4;
+    t11 = t2 - t9;
+    t4 = t0 + t12;
+    t2 = t3 + t7;
+    t9 = t3 - t7;
+    t0 = C0 * t2;
+    t12 = (-C0) * t9;
+    t3 = t11 - t4;
+    t7 = t11 + t4;
+    t2 = (-C0) * t3;
+    t9 = (-C0) * t7;
+    t11 = t19 - t6;
+    t4 = t18 - t5;
+    t3 = t19 + t6;
+    t7 = t18 + t5;
+    t19 = t1 - t0;
+    t6 = t16 - t12;
+    t18 = t1 + t0;
+    t5 = t16 + t12;
+    t1 = t15 - t8;
+    t0 = t10 + t13;
+    t16 = t15 + t8;
+    t12 = t10 - t13;
+    t15 = t17 - t2;
+    t8 = t14 - t9;
+    t10 = t17 + t2;
+    t13 = t14 + t9;
+    re[80] = t3;
+    im[80] = t7;
+    re[95] = t18;
+    im[95] = t5;
+    re[110] = t16;
+    im[110] = t12;
+    re[5] = t10;
+    im[5] = t13;
+    re[20] = t11;
+    im[20] = t4;
+    re[35] = t19;
+    im[35] = t6;
+    re[50] = t1;
+    im[50] = t0;
+    re[65] = t15;
+    im[65] = t8;
+    t17 = X[31];
+    t2 = 0.9781476007338057 * t17;
+    t14 = 0.20791169081775931 * t17;
+    t9 = X[1];
+    t3 = 0.999914327574007 * t9;
+    t7 = 0.01308959557134444 * t9;
+    t18 = X[28];
+    t5 = 0.9832549075639546 * t18;
+    t16 = (-0.18223552549214747) * t18;
+    t12 = X[58];
+    t10 = 0.9288095528719242 * t12;
+    t13 = (-0.3705574375098362) * t12;
+    t11 = X[88];
+    t4 = 0.838670567945424 * t11;
+    t19 = (-0.544639035015027) * t11;
+    t6 = X[118];
+    t1 = 0.7163019434246544 * t6;
+    t0 = (-0.6977904598416801) * t6;
+    t15 = X[91];
+    t8 = 0.8241261886220156 * t15;
+    t17 = 0.5664062369248328 * t15;
+    t9 = X[61];
+    t18 = 0.9187912101488983 * t9;
+    t12 = 0.39474385638426723 * t9;
+    t11 = t2 + t4;
+    t6 = t14 + t19;
+    t15 = t5 + t8;
+    t9 = t16 + t17;
+    t2 = t2 - t4;
+    t4 = t14 - t19;
+    t14 = t5 - t8;
+    t19 = t16 - t17;
+    t5 = t11 + t15;
+    t8 = t6 + t9;
+    t16 = t2 + t19;
+    t17 = t4 - t14;
+    t11 = t11 - t15;
+    t15 = t6 - t9;
+    t6 = t2 - t19;
+    t9 = t4 + t14;
+    t2 = t3 + t1;
+    t19 = t7 + t0;
+    t4 = t10 + t18;
+    t14 = t13 + t12;
+    t3 = t3 - t1;
+    t1 = t7 - t0;
+    t7 = t10 - t18;
+    t0 = t13 - t12;
+    t10 = t2 + t4;
+    t18 = t19 + t14;
+    t13 = t3 + t0;
+    t12 = t1 - t7;
+    t2 = t2 - t4;
+    t4 = t19 - t14;
+    t19 = t3 - t0;
+    t14 = t1 + t7;
+    t3 = t13 + t12;
+    t0 = t13 - t12;
+    t1 = C0 * t3;
+    t7 = (-C0) * t0;
+    t13 = t19 - t14;
+    t12 = t19 + t14;
+    t3 = (-C0) * t13;
+    t0 = (-C0) * t12;
+    t19 = t5 - t10;
+    t14 = t8 - t18;
+    t13 = t5 + t10;
+    t12 = t8 + t18;
+    t5 = t16 - t1;
+    t10 = t17 - t7;
+    t8 = t16 + t1;
+    t18 = t17 + t7;
+    t16 = t11 - t4;
+    t1 = t15 + t2;
+    t17 = t11 + t4;
+    t7 = t15 - t2;
+    t11 = t6 - t3;
+    t4 = t9 - t0;
+    t15 = t6 + t3;
+    t2 = t9 + t0;
+    re[104] = t13;
+    im[104] = t12;
+    re[119] = t8;
+    im[119] = t18;
+    re[14] = t17;
+    im[14] = t7;
+    re[29] = t15;
+    im[29] = t2;
+    re[44] = t19;
+    im[44] = t14;
+    re[59] = t5;
+    im[59] = t10;
+    re[74] = t16;
+    im[74] = t1;
+    re[89] = t11;
+    im[89] = t4;
+    t6 = X[16];
+    t3 = 0.9945218953682733 * t6;
+    t9 = (-0.10452846326765346) * t6;
+    t0 = X[46];
+    t13 = 0.9550199444571866 * t0;
+    t12 = (-0.296541574975571) * t0;
+    t8 = X[76];
+    t18 = 0.8788171126619654 * t8;
+    t17 = (-0.4771587602596084) * t8;
+    t7 = X[106];
+    t15 = 0.7688418320734596 * t7;
+    t2 = (-0.6394390019805847) * t7;
+    t19 = X[103];
+    t14 = 0.7771459614569709 * t19;
+    t5 = 0.6293203910498375 * t19;
+    t10 = X[73];
+    t16 = 0.8849876374630419 * t10;
+    t1 = 0.4656145203251114 * t10;
+    t11 = X[43];
+    t4 = 0.958819734868193 * t11;
+    t6 = 0.2840153447039226 * t11;
+    t0 = X[13];
+    t8 = 0.9958049275746618 * t0;
+    t7 = 0.09150161866340238 * t0;
+    t19 = t3 + t14;
+    t10 = t9 + t5;
+    t11 = t18 + t4;
+    t0 = t17 + t6;
+    t3 = t3 - t14;
+    t14 = t9 - t5;
+    t9 = t18 - t4;
+    t5 = t17 - t6;
+    t18 = t19 + t11;
+    t4 = t10 + t0;
+    t17 = t3 + t5;
+    t6 = t14 - t9;
+    t19 = t19 - t11;
+    t11 = t10 - t0;
+    t10 = t3 - t5;
+    t0 = t14 + t9;
+    t3 = t13 + t16;
+    t5 = t12 + t1;
+    t14 = t15 + t8;
+    t9 = t2 + t7;
+    t13 = t13 - t16;
+    t16 = t12 - t1;
+    t12 = t15 - t8;
+    t1 = t2 - t7;
+    t15 = t3 + t14;
+    t8 = t5 + t9;
+    t2 = t13 + t1;
+    t7 = t16 - t12;
+    t3 = t3 - t14;
+    t14 = t5 - t9;
+    t5 = t13 - t1;
+    t9 = t16 + t12;
+    t13 = t2 + t7;
+    t1 = t2 - t7;
+    t16 = C0 * t13;
+    t12 = (-C0) * t1;
+    t2 = t5 - t9;
+    t7 = t5 + t9;
+    t13 = (-C0) * t2;
+    t1 = (-C0) * t7;
+    t5 = t18 - t15;
+    t9 = t4 - t8;
+    t2 = t18 + t15;
+    t7 = t4 + t8;
+    t18 = t17 - t16;
+    t15 = t6 - t12;
+    t4 = t17 + t16;
+    t8 = t6 + t12;
+    t17 = t19 - t14;
+    t16 = t11 + t3;
+    t6 = t19 + t14;
+    t12 = t11 - t3;
+    t19 = t10 - t13;
+    t14 = t0 - t1;
+    t11 = t10 + t13;
+    t3 = t0 + t1;
+    re[8] = t2;
+    im[8] = t7;
+    re[23] = t4;
+    im[23] = t8;
+    re[38] = t6;
+    im[38] = t12;
+    re[53] = t11;
+    im[53] = t3;
+    re[68] = t5;
+    im[68] = t9;
+    re[83] = t18;
+    im[83] = t15;
+    re[98] = t17;
+    im[98] = t16;
+    re[113] = t19;
+    im[113] = t14;
+    t10 = X[64];
+    t13 = 0.9135454576426009 * t10;
+    t0 = (-0.40673664307580015) * t10;
+    t1 = X[94];
+    t2 = 0.8166415551616789 * t1;
+    t7 = (-0.5771451900372336) * t1;
+    t4 = X[115];
+    t8 = 0.7253743710122876 * t4;
+    t6 = 0.6883545756937539 * t4;
+    t12 = X[85];
+    t11 = 0.8457278217039733 * t12;
+    t3 = 0.5336145159156115 * t12;
+    t5 = X[55];
+    t9 = 0.9335804264972017 * t5;
+    t18 = 0.35836794954530027 * t5;
+    t15 = X[25];
+    t17 = 0.9855560590580777 * t15;
+    t16 = 0.1693495038490246 * t15;
+    t19 = X[4];
+    t14 = 0.9996573249755573 * t19;
+    t10 = (-0.02617694830787315) * t19;
+    t1 = X[34];
+    t4 = 0.9753423205085127 * t1;
+    t12 = (-0.22069743502150108) * t1;
+    t5 = t13 + t9;
+    t15 = t0 + t18;
+    t19 = t8 + t14;
+    t1 = t6 + t10;
+    t13 = t13 - t9;
+    t9 = t0 - t18;
+    t0 = t8 - t14;
+    t18 = t6 - t10;
+    t8 = t5 + t19;
+    t14 = t15 + t1;
+    t6 = t13 + t18;
+    t10 = t9 - t0;
+    t5 = t5 - t19;
+    t19 = t15 - t1;
+    t15 = t13 - t18;
+    t1 = t9 + t0;
+    t13 = t2 + t17;
+    t18 = t7 + t16;
+    t9 = t11 + t4;
+    t0 = t3 + t12;
+    t2 = t2 - t17;
+    t17 = t7 - t16;
+    t7 = t11 - t4;
+    t16 = t3 - t12;
+    t11 = t13 + t9;
+    t4 = t18 + t0;
+    t3 = t2 + t16;
+    t12 = t17 - t7;
+    t13 = t13 - t9;
+    t9 = t18 - t0;
+    t18 = t2 - t16;
+    t0 = t17 + t7;
+    t2 = t3 + t12;
+    t16 = t3 - t12;
+    t17 = C0 * t2;
+    t7 = (-C0) * t16;
+    t3 = t18 - t0;
+    t12 = t18 + t0;
+    t2 = (-C0) * t3;
+    t16 = (-C0) * t12;
+    t18 = t8 - t11;
+    t0 = t14 - t4;
+    t3 = t8 + t11;
+    t12 = t14 + t4;
+    t8 = t6 - t17;
+    t11 = t10 - t7;
+    t14 = t6 + t17;
+    t4 = t10 + t7;
+    t6 = t5 - t9;
+    t17 = t19 + t13;
+    t10 = t5 + t9;
+    t7 = t19 - t13;
+    t5 = t15 - t2;
+    t9 = t1 - t16;
+    t19 = t15 + t2;
+    t13 = t1 + t16;
+    re[32] = t3;
+    im[32] = t12;
+    re[47] = t14;
+    im[47] = t4;
+    re[62] = t10;
+    im[62] = t7;
+    re[77] = t19;
+    im[77] = t13;
+    re[92] = t18;
+    im[92] = t0;
+    re[107] = t8;
+    im[107] = t11;
+    re[2] = t6;
+    im[2] = t17;
+    re[17] = t5;
+    im[17] = t9;
+    t15 = X[112];
+    t2 = 0.7431448254773942 * t15;
+    t1 = (-0.6691306063588582) * t15;
+    t16 = X[97];
+    t3 = 0.8012538126910607 * t16;
+    t12 = 0.598324600570659 * t16;
+    t14 = X[67];
+    t4 = 0.9025852843498606 * t14;
+    t10 = 0.4305110968082951 * t14;
+    t7 = X[37];
+    t19 = 0.9692309097067544 * t7;
+    t13 = 0.24615329302899303 * t7;
+    t18 = X[7];
+    t0 = 0.9986295347545738 * t18;
+    t8 = 0.05233595624294383 * t18;
+    t11 = X[22];
+    t6 = 0.9896513868196702 * t11;
+    t17 = (-0.1434926219911793) * t11;
+    t5 = X[52];
+    t9 = 0.9426414910921784 * t5;
+    t15 = (-0.33380685923377096) * t5;
+    t16 = X[82];
+    t14 = 0.8594064115014527 * t16;
+    t7 = (-0.5112930860770522) * t16;
+    t18 = t2 + t0;
+    t11 = t1 + t8;
+    t5 = t4 + t9;
+    t16 = t10 + t15;
+    t2 = t2 - t0;
+    t0 = t1 - t8;
+    t1 = t4 - t9;
+    t8 = t10 - t15;
+    t4 = t18 + t5;
+    t9 = t11 + t16;
+    t10 = t2 + t8;
+    t15 = t0 - t1;
+    t18 = t18 - t5;
+    t5 = t11 - t16;
+    t11 = t2 - t8;
+    t16 = t0 + t1;
+    t2 = t3 + t6;
+    t8 = t12 + t17;
+    t0 = t19 + t14;
+    t1 = t13 + t7;
+    t3 = t3 - t6;
+    t6 = t12 - t17;
+    t12 = t19 - t14;
+    t17 = t13 - t7;
+    t19 = t2 + t0;
+    t14 = t8 + t1;
+    t13 = t3 + t17;
+    t7 = t6 - t12;
+    t2 = t2 - t0;
+    t0 = t8 - t1;
+    t8 = t3 - t17;
+    t1 = t6 + t12;
+    t3 = t13 + t7;
+    t17 = t13 - t7;
+    t6 = C0 * t3;
+    t12 = (-C0) * t17;
+    t13 = t8 - t1;
+    t7 = t8 + t1;
+    t3 = (-C0) * t13;
+    t17 = (-C0) * t7;
+    t8 = t4 - t19;
+    t1 = t9 - t14;
+    t13 = t4 + t19;
+    t7 = t9 + t14;
+    t4 = t10 - t6;
+    t19 = t15 - t12;
+    t9 = t10 + t6;
+    t14 = t15 + t12;
+    t10 = t18 - t0;
+    t6 = t5 + t2;
+    t15 = t18 + t0;
+    t12 = t5 - t2;
+    t18 = t11 - t3;
+    t0 = t16 - t17;
+    t5 = t11 + t3;
+    t2 = t16 + t17;
+    re[56] = t13;
+    im[56] = t7;
+    re[71] = t9;
+    im[71] = t14;
+    re[86] = t15;
+    im[86] = t12;
+    re[101] = t5;
+    im[101] = t2;
+    re[116] = t8;
+    im[116] = t1;
+    re[11] = t4;
+    im[11] = t19;
+    re[26] = t10;
+    im[26] = t6;
+    re[41] = t18;
+    im[41] = t0;
+    t11 = re[80];
+    t3 = im[80];
+    t16 = re[104];
+    t17 = im[104];
+    t13 = re[8];
+    t7 = im[8];
+    t9 = re[32];
+    t14 = im[32];
+    t15 = re[56];
+    t12 = im[56];
+    t5 = t16 + t15;
+    t2 = t17 + t12;
+    t8 = t13 + t9;
+    t1 = t7 + t14;
+    t4 = t16 - t15;
+    t19 = t17 - t12;
+    t10 = t13 - t9;
+    t6 = t7 - t14;
+    t18 = t5 + t8;
+    t0 = t2 + t1;
+    t16 = t5 - t8;
+    t15 = C1 * t16;
+    t17 = t2 - t1;
+    t12 = C1 * t17;
+    t13 = C2 * t18;
+    t9 = t11 - t13;
+    t7 = C2 * t0;
+    t14 = t3 - t7;
+    t5 = t9 + t15;
+    t8 = t14 + t12;
+    t16 = t9 - t15;
+    t2 = t14 - t12;
+    t1 = C3 * t4;
+    t17 = C4 * t10;
+    t13 = t1 + t17;
+    t7 = C3 * t19;
+    t9 = C4 * t6;
+    t15 = t7 + t9;
+    t14 = C4 * t4;
+    t12 = C3 * t10;
+    t1 = t14 - t12;
+    t17 = C4 * t19;
+    t7 = C3 * t6;
+    t9 = t17 - t7;
+    t4 = t11 + t18;
+    t10 = t3 + t0;
+    t14 = t5 + t15;
+    t12 = t8 - t13;
+    t19 = t16 + t9;
+    t6 = t2 - t1;
+    t17 = t16 - t9;
+    t7 = t2 + t1;
+    t11 = t5 - t15;
+    t18 = t8 + t13;
+    re[80] = t4;
+    im[80] = t10;
+    re[104] = t14;
+    im[104] = t12;
+    re[8] = t19;
+    im[8] = t6;
+    re[32] = t17;
+    im[32] = t7;
+    re[56] = t11;
+    im[56] = t18;
+    t3 = re[95];
+    t0 = im[95];
+    t16 = re[119];
+    t9 = im[119];
+    t2 = re[23];
+    t1 = im[23];
+    t5 = re[47];
+    t15 = im[47];
+    t8 = re[71];
+    t13 = im[71];
+    t4 = t16 + t8;
+    t10 = t9 + t13;
+    t14 = t2 + t5;
+    t12 = t1 + t15;
+    t19 = t16 - t8;
+    t6 = t9 - t13;
+    t17 = t2 - t5;
+    t7 = t1 - t15;
+    t11 = t4 + t14;
+    t18 = t10 + t12;
+    t16 = t4 - t14;
+    t8 = C1 * t16;
+    t9 = t10 - t12;
+    t13 = C1 * t9;
+    t2 = C2 * t11;
+    t5 = t3 - t2;
+    t1 = C2 * t18;
+    t15 = t0 - t1;
+    t4 = t5 + t8;
+    t14 = t15 + t13;
+    t16 = t5 - t8;
+    t10 = t15 - t13;
+    t12 = C3 * t19;
+    t9 = C4 * t17;
+    t2 = t12 + t9;
+    t1 = C3 * t6;
+    t5 = C4 * t7;
+    t8 = t1 + t5;
+    t15 = C4 * t19;
+    t13 = C3 * t17;
+    t12 = t15 - t13;
+    t9 = C4 * t6;
+    t1 = C3 * t7;
+    t5 = t9 - t1;
+    t19 = t3 + t11;
+    t17 = t0 + t18;
+    t15 = t4 + t8;
+    t13 = t14 - t2;
+    t6 = t16 + t5;
+    t7 = t10 - t12;
+    t9 = t16 - t5;
+    t1 = t10 + t12;
+    t3 = t4 - t8;
+    t11 = t14 + t2;
+    re[95] = t19;
+    im[95] = t17;
+    re[119] = t15;
+    im[119] = t13;
+    re[23] = t6;
+    im[23] = t7;
+    re[47] = t9;
+    im[47] = t1;
+    re[71] = t3;
+    im[71] = t11;
+    t0 = re[110];
+    t18 = im[110];
+    t16 = re[14];
+    t5 = im[14];
+    t10 = re[38];
+    t12 = im[38];
+    t4 = re[62];
+    t8 = im[62];
+    t14 = re[86];
+    t2 = im[86];
+    t19 = t16 + t14;
+    t17 = t5 + t2;
+    t15 = t10 + t4;
+    t13 = t12 + t8;
+    t6 = t16 - t14;
+    t7 = t5 - t2;
+    t9 = t10 - t4;
+    t1 = t12 - t8;
+    t3 = t19 + t15;
+    t11 = t17 + t13;
+    t16 = t19 - t15;
+    t14 = C1 * t16;
+    t5 = t17 - t13;
+    t2 = C1 * t5;
+    t10 = C2 * t3;
+    t4 = t0 - t10;
+    t12 = C2 * t11;
+    t8 = t18 - t12;
+    t19 = t4 + t14;
+    t15 = t8 + t2;
+    t16 = t4 - t14;
+    t17 = t8 - t2;
+    t13 = C3 * t6;
+    t5 = C4 * t9;
+    t10 = t13 + t5;
+    t12 = C3 * t7;
+    t4 = C4 * t1;
+    t14 = t12 + t4;
+    t8 = C4 * t6;
+    t2 = C3 * t9;
+    t13 = t8 - t2;
+    t5 = C4 * t7;
+    t12 = C3 * t1;
+    t4 = t5 - t12;
+    t6 = t0 + t3;
+    t9 = t18 + t11;
+    t8 = t19 + t14;
+    t2 = t15 - t10;
+    t7 = t16 + t4;
+    t1 = t17 - t13;
+    t5 = t16 - t4;
+    t12 = t17 + t13;
+    t0 = t19 - t14;
+    t3 = t15 + t10;
+    re[110] = t6;
+    im[110] = t9;
+    re[14] = t8;
+    im[14] = t2;
+    re[38] = t7;
+    im[38] = t1;
+    re[62] = t5;
+    im[62] = t12;
+    re[86] = t0;
+    im[86] = t3;
+    t18 = re[5];
+    t11 = im[5];
+    t16 = re[29];
+    t4 = im[29];
+    t17 = re[53];
+    t13 = im[53];
+    t19 = re[77];
+    t14 = im[77];
+    t15 = re[101];
+    t10 = im[101];
+    t6 = t16 + t15;
+    t9 = t4 + t10;
+    t8 = t17 + t19;
+    t2 = t13 + t14;
+    t7 = t16 - t15;
+    t1 = t4 - t10;
+    t5 = t17 - t19;
+    t12 = t13 - t14;
+    t0 = t6 + t8;
+    t3 = t9 + t2;
+    t16 = t6 - t8;
+    t15 = C1 * t16;
+    t4 = t9 - t2;
+    t10 = C1 * t4;
+    t17 = C2 * t0;
+    t19 = t18 - t17;
+    t13 = C2 * t3;
+    t14 = t11 - t13;
+    t6 = t19 + t15;
+    t8 = t14 + t10;
+    t16 = t19 - t15;
+    t9 = t14 - t10;
+    t2 = C3 * t7;
+    t4 = C4 * t5;
+    t17 = t2 + t4;
+    t13 = C3 * t1;
+    t19 = C4 * t12;
+    t15 = t13 + t19;
+    t14 = C4 * t7;
+    t10 = C3 * t5;
+    t2 = t14 - t10;
+    t4 = C4 * t1;
+    t13 = C3 * t12;
+    t19 = t4 - t13;
+    t7 = t18 + t0;
+    t5 = t11 + t3;
+    t14 = t6 + t15;
+    t10 = t8 - t17;
+    t1 = t16 + t19;
+    t12 = t9 - t2;
+    t4 = t16 - t19;
+    t13 = t9 + t2;
+    t18 = t6 - t15;
+    t0 = t8 + t17;
+    re[5] = t7;
+    im[5] = t5;
+    re[29] = t14;
+    im[29] = t10;
+    re[53] = t1;
+    im[53] = t12;
+    re[77] = t4;
+    im[77] = t13;
+    re[101] = t18;
+    im[101] = t0;
+    t11 = re[20];
+    t3 = im[20];
+    t16 = re[44];
+    t19 = im[44];
+    t9 = re[68];
+    t2 = im[68];
+    t6 = re[92];
+    t15 = im[92];
+    t8 = re[116];
+    t17 = im[116];
+    t7 = t16 + t8;
+    t5 = t19 + t17;
+    t14 = t9 + t6;
+    t10 = t2 + t15;
+    t1 = t16 - t8;
+    t12 = t19 - t17;
+    t4 = t9 - t6;
+    t13 = t2 - t15;
+    t18 = t7 + t14;
+    t0 = t5 + t10;
+    t16 = t7 - t14;
+    t8 = C1 * t16;
+    t19 = t5 - t10;
+    t17 = C1 * t19;
+    t9 = C2 * t18;
+    t6 = t11 - t9;
+    t2 = C2 * t0;
+    t15 = t3 - t2;
+    t7 = t6 + t8;
+    t14 = t15 + t17;
+    t16 = t6 - t8;
+    t5 = t15 - t17;
+    t10 = C3 * t1;
+    t19 = C4 * t4;
+    t9 = t10 + t19;
+    t2 = C3 * t12;
+    t6 = C4 * t13;
+    t8 = t2 + t6;
+    t15 = C4 * t1;
+    t17 = C3 * t4;
+    t10 = t15 - t17;
+    t19 = C4 * t12;
+    t2 = C3 * t13;
+    t6 = t19 - t2;
+    t1 = t11 + t18;
+    t4 = t3 + t0;
+    t15 = t7 + t8;
+    t17 = t14 - t9;
+    t12 = t16 + t6;
+    t13 = t5 - t10;
+    t19 = t16 - t6;
+    t2 = t5 + t10;
+    t11 = t7 - t8;
+    t18 = t14 + t9;
+    re[20] = t1;
+    im[20] = t4;
+    re[44] = t15;
+    im[44] = t17;
+    re[68] = t12;
+    im[68] = t13;
+    re[92] = t19;
+    im[92] = t2;
+    re[116] = t11;
+    im[116] = t18;
+    t3 = re[35];
+    t0 = im[35];
+    t16 = re[59];
+    t6 = im[59];
+    t5 = re[83];
+    t10 = im[83];
+    t7 = re[107];
+    t8 = im[107];
+    t14 = re[11];
+    t9 = im[11];
+    t1 = t16 + t14;
+    t4 = t6 + t9;
+    t15 = t5 + t7;
+    t17 = t10 + t8;
+    t12 = t16 - t14;
+    t13 = t6 - t9;
+    t19 = t5 - t7;
+    t2 = t10 - t8;
+    t11 = t1 + t15;
+    t18 = t4 + t17;
+    t16 = t1 - t15;
+    t14 = C1 * t16;
+    t6 = t4 - t17;
+    t9 = C1 * t6;
+    t5 = C2 * t11;
+    t7 = t3 - t5;
+    t10 = C2 * t18;
+    t8 = t0 - t10;
+    t1 = t7 + t14;
+    t15 = t8 + t9;
+    t16 = t7 - t14;
+    t4 = t8 - t9;
+    t17 = C3 * t12;
+    t6 = C4 * t19;
+    t5 = t17 + t6;
+    t10 = C3 * t13;
+    t7 = C4 * t2;
+    t14 = t10 + t7;
+    t8 = C4 * t12;
+    t9 = C3 * t19;
+    t17 = t8 - t9;
+    t6 = C4 * t13;
+    t10 = C3 * t2;
+    t7 = t6 - t10;
+    t12 = t3 + t11;
+    t19 = t0 + t18;
+    t8 = t1 + t14;
+    t9 = t15 - t5;
+    t13 = t16 + t7;
+    t2 = t4 - t17;
+    t6 = t16 - t7;
+    t10 = t4 + t17;
+    t3 = t1 - t14;
+    t11 = t15 + t5;
+    re[35] = t12;
+    im[35] = t19;
+    re[59] = t8;
+    im[59] = t9;
+    re[83] = t13;
+    im[83] = t2;
+    re[107] = t6;
+    im[107] = t10;
+    re[11] = t3;
+    im[11] = t11;
+    t0 = re[50];
+    t18 = im[50];
+    t16 = re[74];
+    t7 = im[74];
+    t4 = re[98];
+    t17 = im[98];
+    t1 = re[2];
+    t14 = im[2];
+    t15 = re[26];
+    t5 = im[26];
+    t12 = t16 + t15;
+    t19 = t7 + t5;
+    t8 = t4 + t1;
+    t9 = t17 + t14;
+    t13 = t16 - t15;
+    t2 = t7 - t5;
+    t6 = t4 - t1;
+    t10 = t17 - t14;
+    t3 = t12 + t8;
+    t11 = t19 + t9;
+    t16 = t12 - t8;
+    t15 = C1 * t16;
+    t7 = t19 - t9;
+    t5 = C1 * t7;
+    t4 = C2 * t3;
+    t1 = t0 - t4;
+    t17 = C2 * t11;
+    t14 = t18 - t17;
+    t12 = t1 + t15;
+    t8 = t14 + t5;
+    t16 = t1 - t15;
+    t19 = t14 - t5;
+    t9 = C3 * t13;
+    t7 = C4 * t6;
+    t4 = t9 + t7;
+    t17 = C3 * t2;
+    t1 = C4 * t10;
+    t15 = t17 + t1;
+    t14 = C4 * t13;
+    t5 = C3 * t6;
+    t9 = t14 - t5;
+    t7 = C4 * t2;
+    t17 = C3 * t10;
+    t1 = t7 - t17;
+    t13 = t0 + t3;
+    t6 = t18 + t11;
+    t14 = t12 + t15;
+    t5 = t8 - t4;
+    t2 = t16 + t1;
+    t10 = t19 - t9;
+    t7 = t16 - t1;
+    t17 = t19 + t9;
+    t0 = t12 - t15;
+    t3 = t8 + t4;
+    re[50] = t13;
+    im[50] = t6;
+    re[74] = t14;
+    im[74] = t5;
+    re[98] = t2;
+    im[98] = t10;
+    re[2] = t7;
+    im[2] = t17;
+    re[26] = t0;
+    im[26] = t3;
+    t18 = re[65];
+    t11 = im[65];
+    t16 = re[89];
+    t1 = im[89];
+    t19 = re[113];
+    t9 = im[113];
+    t12 = re[17];
+    t15 = im[17];
+    t8 = re[41];
+    t4 = im[41];
+    t13 = t16 + t8;
+    t6 = t1 + t4;
+    t14 = t19 + t12;
+    t5 = t9 + t15;
+    t2 = t16 - t8;
+    t10 = t1 - t4;
+    t7 = t19 - t12;
+    t17 = t9 - t15;
+    t0 = t13 + t14;
+    t3 = t6 + t5;
+    t16 = t13 - t14;
+    t8 = C1 * t16;
+    t1 = t6 - t5;
+    t4 = C1 * t1;
+    t19 = C2 * t0;
+    t12 = t18 - t19;
+    t9 = C2 * t3;
+    t15 = t11 - t9;
+    t13 = t12 + t8;
+    t14 = t15 + t4;
+    t16 = t12 - t8;
+    t6 = t15 - t4;
+    t5 = C3 * t2;
+    t1 = C4 * t7;
+    t19 = t5 + t1;
+    t9 = C3 * t10;
+    t12 = C4 * t17;
+    t8 = t9 + t12;
+    t15 = C4 * t2;
+    t4 = C3 * t7;
+    t5 = t15 - t4;
+    t1 = C4 * t10;
+    t9 = C3 * t17;
+    t12 = t1 - t9;
+    t2 = t18 + t0;
+    t7 = t11 + t3;
+    t15 = t13 + t8;
+    t4 = t14 - t19;
+    t10 = t16 + t12;
+    t17 = t6 - t5;
+    t1 = t16 - t12;
+    t9 = t6 + t5;
+    t18 = t13 - t8;
+    t0 = t14 + t19;
+    re[65] = t2;
+    im[65] = t7;
+    re[89] = t15;
+    im[89] = t4;
+    re[113] = t10;
+    im[113] = t17;
+    re[17] = t1;
+    im[17] = t9;
+    re[41] = t18;
+    im[41] = t0;
+    t11 = re[0];
+    t3 = im[0];
+    t16 = re[40];
+    t12 = im[40];
+    t6 = re[80];
+    t5 = im[80];
+    t13 = t16 + t6;
+    t8 = t12 + t5;
+    t14 = C5 * t13;
+    t19 = t11 - t14;
+    t2 = C5 * t8;
+    t7 = t3 - t2;
+    t15 = t16 - t6;
+    t4 = C6 * t15;
+    t10 = t12 - t5;
+    t17 = C6 * t10;
+    t1 = t11 + t13;
+    t9 = t3 + t8;
+    t18 = t19 + t17;
+    t0 = t7 - t4;
+    t14 = t19 - t17;
+    t2 = t7 + t4;
+    t16 = (-C7) * t1;
+    t6 = (-C8) * t9;
+    t15 = t16 + t6;
+    t12 = 0.08896202493476155 * t15;
+    y[359] = t12;
+    t5 = 0.08839478579440686 * t15;
+    y[360] = t5;
+    t10 = C8 * t1;
+    t11 = (-C7) * t9;
+    t13 = t10 + t11;
+    t3 = 0.04644169441234319 * t13;
+    y[119] = t3;
+    t8 = (-0.04752735458669829) * t13;
+    y[120] = t8;
+    t19 = (-C9) * t18;
+    t17 = (-C10) * t0;
+    t7 = t19 + t17;
+    t4 = 0.09084055835569309 * t7;
+    y[279] = t4;
+    t16 = 0.014293156561901202 * t7;
+    y[440] = t16;
+    t6 = C10 * t18;
+    t12 = (-C9) * t0;
+    t15 = t6 + t12;
+    y[39] = 0;
+    t5 = (-0.09173582245832897) * t15;
+    y[200] = t5;
+    t1 = C11 * t14;
+    t9 = C12 * t2;
+    t10 = t1 + t9;
+    y[40] = 0;
+    t11 = (-0.0916593323593214) * t10;
+    y[199] = t11;
+    t3 = (-C12) * t14;
+    t13 = C11 * t2;
+    t8 = t3 + t13;
+    t19 = 0.0909163651843452 * t8;
+    y[280] = t19;
+    t17 = 0.015015322977163095 * t8;
+    y[439] = t17;
+    t4 = re[39];
+    t7 = im[39];
+    t16 = re[79];
+    t18 = im[79];
+    t0 = re[119];
+    t6 = im[119];
+    t12 = t16 + t0;
+    t15 = t18 + t6;
+    t5 = C5 * t12;
+    t1 = t4 - t5;
+    t9 = C5 * t15;
+    t10 = t7 - t9;
+    t11 = t16 - t0;
+    t14 = C6 * t11;
+    t2 = t18 - t6;
+    t3 = C6 * t2;
+    t13 = t4 + t12;
+    t19 = t7 + t15;
+    t8 = t1 + t3;
+    t17 = t10 - t14;
+    t5 = t1 - t3;
+    t9 = t10 + t14;
+    t16 = C13 * t13;
+    t0 = C14 * t19;
+    t11 = t16 + t0;
+    y[42] = 0;
+    t18 = (-0.09148831176819235) * t11;
+    y[197] = t18;
+    t6 = (-C14) * t13;
+    t2 = C13 * t19;
+    t4 = t6 + t2;
+    t12 = 0.0910863166264106 * t4;
+    y[282] = t12;
+    t7 = 0.016511926279279197 * t4;
+    y[437] = t7;
+    t15 = (-C15) * t8;
+    t1 = (-C16) * t17;
+    t3 = t15 + t1;
+    t10 = 0.09003773116994462 * t3;
+    y[357] = t10;
+    t14 = 0.08720250941904868 * t3;
+    y[362] = t14;
+    t16 = C16 * t8;
+    t0 = (-C15) * t17;
+    t11 = t16 + t0;
+    t18 = 0.04426053611132889 * t11;
+    y[117] = t18;
+    t13 = (-0.0496869863118727) * t11;
+    y[122] = t13;
+    t19 = (-C17) * t5;
+    t6 = (-C18) * t9;
+    t2 = t19 + t6;
+    t12 = 0.09070677367426357 * t2;
+    y[277] = t12;
+    t4 = 0.012902477260925535 * t2;
+    y[442] = t4;
+    t7 = C18 * t5;
+    t15 = (-C17) * t9;
+    t1 = t7 + t15;
+    y[37] = 0;
+    t10 = (-0.09187112489811519) * t1;
+    y[202] = t10;
+    t3 = re[78];
+    t14 = im[78];
+    t8 = re[118];
+    t17 = im[118];
+    t16 = re[38];
+    t0 = im[38];
+    t18 = t8 + t16;
+    t11 = t17 + t0;
+    t13 = C5 * t18;
+    t19 = t3 - t13;
+    t6 = C5 * t11;
+    t12 = t14 - t6;
+    t2 = t8 - t16;
+    t4 = C6 * t2;
+    t5 = t17 - t0;
+    t9 = C6 * t5;
+    t7 = t3 + t18;
+    t15 = t14 + t11;
+    t1 = t19 + t9;
+    t10 = t12 - t4;
+    t13 = t19 - t9;
+    t6 = t12 + t4;
+    t8 = (-C19) * t7;
+    t16 = (-C20) * t15;
+    t2 = t8 + t16;
+    t17 = 0.09059613943028794 * t2;
+    y[275] = t17;
+    t0 = 0.011584653483930014 * t2;
+    y[444] = t0;
+    t5 = C20 * t7;
+    t3 = (-C19) * t15;
+    t18 = t5 + t3;
+    y[35] = 0;
+    t14 = (-0.09198331612955407) * t18;
+    y[204] = t14;
+    t11 = C21 * t1;
+    t19 = C22 * t10;
+    t9 = t11 + t19;
+    y[44] = 0;
+    t12 = (-0.09129279661173699) * t9;
+    y[195] = t12;
+    t4 = (-C22) * t1;
+    t8 = C21 * t10;
+    t16 = t4 + t8;
+    t17 = 0.09128138957966771 * t16;
+    y[284] = t17;
+    t2 = 0.018075962073785333 * t16;
+    y[435] = t2;
+    t0 = (-C23) * t13;
+    t7 = (-C24) * t6;
+    t15 = t0 + t7;
+    t5 = 0.09103571973635532 * t15;
+    y[355] = t5;
+    t3 = 0.08593441436671341 * t15;
+    y[364] = t3;
+    t18 = C24 * t13;
+    t14 = (-C23) * t6;
+    t11 = t18 + t14;
+    t19 = 0.042072022784559265 * t11;
+    y[115] = t19;
+    t9 = (-0.05182469812709293) * t11;
+    y[124] = t9;
+    t12 = re[117];
+    t1 = im[117];
+    t10 = re[37];
+    t4 = im[37];
+    t8 = re[77];
+    t17 = im[77];
+    t16 = t10 + t8;
+    t2 = t4 + t17;
+    t0 = C5 * t16;
+    t7 = t12 - t0;
+    t5 = C5 * t2;
+    t15 = t1 - t5;
+    t3 = t10 - t8;
+    t13 = C6 * t3;
+    t6 = t4 - t17;
+    t18 = C6 * t6;
+    t14 = t12 + t16;
+    t19 = t1 + t2;
+    t11 = t7 + t18;
+    t9 = t15 - t13;
+    t0 = t7 - t18;
+    t5 = t15 + t13;
+    t10 = (-C25) * t14;
+    t8 = (-C26) * t19;
+    t3 = t10 + t8;
+    t4 = 0.09195526554211034 * t3;
+    y[353] = t4;
+    t17 = 0.08459145275616263 * t3;
+    y[366] = t17;
+    t6 = C26 * t14;
+    t12 = (-C25) * t19;
+    t16 = t6 + t12;
+    t1 = 0.03988251285128333 * t16;
+    y[113] = t1;
+    t2 = (-0.05393506943227453) * t16;
+    y[126] = t2;
+    t7 = (-C27) * t11;
+    t18 = (-C28) * t9;
+    t15 = t7 + t18;
+    t13 = 0.09050785698244482 * t15;
+    y[273] = t13;
+    t10 = 0.010340424900205238 * t15;
+    y[446] = t10;
+    t8 = C28 * t11;
+    t4 = (-C27) * t9;
+    t3 = t8 + t4;
+    y[33] = 0;
+    t17 = (-0.09207303775792297) * t3;
+    y[206] = t17;
+    t14 = C29 * t0;
+    t19 = C30 * t5;
+    t6 = t14 + t19;
+    y[46] = 0;
+    t12 = (-0.09107277380945689) * t6;
+    y[193] = t12;
+    t1 = (-C30) * t0;
+    t16 = C29 * t5;
+    t2 = t1 + t16;
+    t7 = 0.09150191637698869 * t2;
+    y[286] = t7;
+    t18 = 0.019706630281976074 * t2;
+    y[433] = t18;
+    t13 = re[36];
+    t15 = im[36];
+    t10 = re[76];
+    t11 = im[76];
+    t9 = re[116];
+    t8 = im[116];
+    t4 = t10 + t9;
+    t3 = t11 + t8;
+    t17 = C5 * t4;
+    t14 = t13 - t17;
+    t19 = C5 * t3;
+    t6 = t15 - t19;
+    t12 = t10 - t9;
+    t0 = C6 * t12;
+    t5 = t11 - t8;
+    t1 = C6 * t5;
+    t16 = t13 + t4;
+    t7 = t15 + t3;
+    t2 = t14 + t1;
+    t18 = t6 - t0;
+    t17 = t14 - t1;
+    t19 = t6 + t0;
+    t10 = C31 * t16;
+    t9 = C32 * t7;
+    t12 = t10 + t9;
+    y[48] = 0;
+    t11 = (-0.09082768715553084) * t12;
+    y[191] = t11;
+    t8 = (-C32) * t16;
+    t5 = C31 * t7;
+    t13 = t8 + t5;
+    t4 = 0.09174882235043115 * t13;
+    y[288] = t4;
+    t15 = 0.02140019650804302 * t13;
+    y[431] = t15;
+    t3 = (-C33) * t2;
+    t14 = (-C34) * t18;
+    t1 = t3 + t14;
+    t6 = 0.09279483997724569 * t1;
+    y[351] = t6;
+    t0 = 0.08317465107752332 * t1;
+    y[368] = t0;
+    t10 = C34 * t2;
+    t9 = (-C33) * t18;
+    t12 = t10 + t9;
+    t11 = 0.03769797295232574 * t12;
+    y[111] = t11;
+    t16 = (-0.05601407996358747) * t12;
+    y[128] = t16;
+    t7 = (-C35) * t17;
+    t8 = (-C36) * t19;
+    t5 = t7 + t8;
+    t4 = 0.09044079022064527 * t5;
+    y[271] = t4;
+    t13 = 0.009170726184912756 * t5;
+    y[448] = t13;
+    t15 = C36 * t17;
+    t3 = (-C35) * t19;
+    t14 = t15 + t3;
+    y[31] = 0;
+    t6 = (-0.09214131491999118) * t14;
+    y[208] = t6;
+    t1 = re[75];
+    t0 = im[75];
+    t2 = re[115];
+    t18 = im[115];
+    t10 = re[35];
+    t9 = im[35];
+    t11 = t2 + t10;
+    t12 = t18 + t9;
+    t16 = C5 * t11;
+    t7 = t1 - t16;
+    t8 = C5 * t12;
+    t4 = t0 - t8;
+    t5 = t2 - t10;
+    t13 = C6 * t5;
+    t17 = t18 - t9;
+    t19 = C6 * t17;
+    t15 = t1 + t11;
+    t3 = t0 + t12;
+    t14 = t7 + t19;
+    t6 = t4 - t13;
+    t16 = t7 - t19;
+    t8 = t4 + t13;
+    t2 = (-C37) * t15;
+    t10 = (-C38) * t3;
+    t5 = t2 + t10;
+    t18 = 0.09039410601073432 * t5;
+    y[269] = t18;
+    t9 = 0.008076005721060965 * t5;
+    y[450] = t9;
+    t17 = C38 * t15;
+    t1 = (-C37) * t3;
+    t11 = t17 + t1;
+    y[29] = 0;
+    t0 = (-0.09218890147930385) * t11;
+    y[210] = t0;
+    t12 = C39 * t14;
+    t7 = C40 * t6;
+    t19 = t12 + t7;
+    y[50] = 0;
+    t4 = (-0.09055806752110487) * t19;
+    y[189] = t4;
+    t13 = (-C40) * t14;
+    t2 = C39 * t6;
+    t10 = t13 + t2;
+    t18 = 0.09202198723367433 * t10;
+    y[290] = t18;
+    t5 = 0.023152962148670807 * t10;
+    y[429] = t5;
+    t9 = (-C41) * t16;
+    t15 = (-C42) * t8;
+    t3 = t9 + t15;
+    t17 = 0.09355656451896484 * t3;
+    y[349] = t17;
+    t1 = 0.08168637648109286 * t3;
+    y[370] = t1;
+    t11 = C42 * t16;
+    t0 = (-C41) * t8;
+    t12 = t11 + t0;
+    t7 = 0.035525090341131965 * t12;
+    y[109] = t7;
+    t19 = (-0.05805490461443574) * t12;
+    y[130] = t19;
+    t4 = re[114];
+    t14 = im[114];
+    t6 = re[34];
+    t13 = im[34];
+    t2 = re[74];
+    t18 = im[74];
+    t10 = t6 + t2;
+    t5 = t13 + t18;
+    t9 = C5 * t10;
+    t15 = t4 - t9;
+    t17 = C5 * t5;
+    t3 = t14 - t17;
+    t1 = t6 - t2;
+    t16 = C6 * t1;
+    t8 = t13 - t18;
+    t11 = C6 * t8;
+    t0 = t4 + t10;
+    t7 = t14 + t5;
+    t12 = t15 + t11;
+    t19 = t3 - t16;
+    t9 = t15 - t11;
+    t17 = t3 + t16;
+    t6 = (-C43) * t0;
+    t2 = (-C44) * t7;
+    t1 = t6 + t2;
+    t13 = 0.09424038580969314 * t1;
+    y[347] = t13;
+    t18 = 0.0801298334988885 * t1;
+    y[372] = t18;
+    t8 = C44 * t0;
+    t4 = (-C43) * t7;
+    t10 = t8 + t4;
+    t14 = 0.03336942781104587 * t10;
+    y[107] = t14;
+    t5 = (-0.060053305069332) * t10;
+    y[132] = t5;
+    t15 = (-C45) * t12;
+    t11 = (-C46) * t19;
+    t3 = t15 + t11;
+    t16 = 0.09036665294277783 * t3;
+    y[267] = t16;
+    t6 = 0.007056849639334466 * t3;
+    y[452] = t6;
+    t2 = C46 * t12;
+    t13 = (-C45) * t19;
+    t1 = t2 + t13;
+    y[27] = 0;
+    t18 = (-0.09221690813988859) * t1;
+    y[212] = t18;
+    t0 = C47 * t9;
+    t7 = C48 * t17;
+    t8 = t0 + t7;
+    y[52] = 0;
+    t4 = (-0.09026332159056506) * t8;
+    y[187] = t4;
+    t14 = (-C48) * t9;
+    t10 = C47 * t17;
+    t5 = t14 + t10;
+    t15 = 0.0923224759125681 * t5;
+    y[292] = t15;
+    t11 = 0.024962500697769584 * t5;
+    y[427] = t11;
+    t16 = re[33];
+    t3 = im[33];
+    t6 = re[73];
+    t12 = im[73];
+    t19 = re[113];
+    t2 = im[113];
+    t13 = t6 + t19;
+    t1 = t12 + t2;
+    t18 = C5 * t13;
+    t0 = t16 - t18;
+    t7 = C5 * t1;
+    t8 = t3 - t7;
+    t4 = t6 - t19;
+    t9 = C6 * t4;
+    t17 = t12 - t2;
+    t14 = C6 * t17;
+    t10 = t16 + t13;
+    t15 = t3 + t1;
+    t5 = t0 + t14;
+    t11 = t8 - t9;
+    t18 = t0 - t14;
+    t7 = t8 + t9;
+    t6 = C49 * t10;
+    t19 = C50 * t15;
+    t4 = t6 + t19;
+    y[54] = 0;
+    t12 = (-0.08994493919512188) * t4;
+    y[185] = t12;
+    t2 = (-C50) * t10;
+    t17 = C49 * t15;
+    t16 = t2 + t17;
+    t13 = 0.09264927418823903 * t16;
+    y[294] = t13;
+    t3 = 0.026825028972436063 * t16;
+    y[425] = t3;
+    t1 = (-C51) * t5;
+    t0 = (-C52) * t11;
+    t14 = t1 + t0;
+    t8 = 0.09484585771001464 * t14;
+    y[345] = t8;
+    t9 = 0.07850712007363697 * t14;
+    y[374] = t9;
+    t6 = C52 * t5;
+    t19 = (-C51) * t11;
+    t4 = t6 + t19;
+    t12 = 0.031238088585639097 * t4;
+    y[105] = t12;
+    t10 = (-0.06200503747723192) * t4;
+    y[134] = t10;
+    t15 = (-C53) * t18;
+    t2 = (-C54) * t7;
+    t17 = t15 + t2;
+    t13 = 0.09035733828476188 * t17;
+    y[265] = t13;
+    t16 = 0.006112672898287684 * t17;
+    y[454] = t16;
+    t3 = C54 * t18;
+    t1 = (-C53) * t7;
+    t0 = t3 + t1;
+    y[25] = 0;
+    t8 = (-0.0922264144951987) * t0;
+    y[214] = t8;
+    t14 = re[72];
+    t9 = im[72];
+    t5 = re[112];
+    t11 = im[112];
+    t6 = re[32];
+    t19 = im[32];
+    t12 = t5 + t6;
+    t4 = t11 + t19;
+    t10 = C5 * t12;
+    t15 = t14 - t10;
+    t2 = C5 * t4;
+    t13 = t9 - t2;
+    t17 = t5 - t6;
+    t16 = C6 * t17;
+    t18 = t11 - t19;
+    t7 = C6 * t18;
+    t3 = t14 + t12;
+    t1 = t9 + t4;
+    t0 = t15 + t7;
+    t8 = t13 - t16;
+    t10 = t15 - t7;
+    t2 = t13 + t16;
+    t5 = (-C55) * t3;
+    t6 = (-C56) * t1;
+    t17 = t5 + t6;
+    t11 = 0.09036492994132213 * t17;
+    y[263] = t11;
+    t19 = 0.005243370587864342 * t17;
+    y[456] = t19;
+    t18 = C56 * t3;
+    t14 = (-C55) * t1;
+    t12 = t18 + t14;
+    y[23] = 0;
+    t9 = (-0.09221866645328587) * t12;
+    y[216] = t9;
+    t4 = C57 * t0;
+    t15 = C58 * t8;
+    t7 = t4 + t15;
+    t13 = 0.000329259000948847 * t7;
+    y[56] = t13;
+    t16 = (-0.0895480206469585) * t7;
+    y[183] = t16;
+    t5 = (-C58) * t0;
+    t6 = C57 * t8;
+    t11 = t5 + t6;
+    t17 = 0.09295427829844087 * t11;
+    y[296] = t17;
+    t19 = 0.02873634741694584 * t11;
+    y[423] = t19;
+    t3 = (-C59) * t10;
+    t1 = (-C60) * t2;
+    t18 = t3 + t1;
+    t14 = 0.0953754441237799 * t18;
+    y[343] = t14;
+    t12 = 0.07682020725123924 * t18;
+    y[376] = t12;
+    t9 = C60 * t10;
+    t4 = (-C59) * t2;
+    t15 = t9 + t4;
+    t13 = 0.029137704355627222 * t15;
+    y[103] = t13;
+    t7 = (-0.06390501141990558) * t15;
+    y[136] = t7;
+    t16 = re[111];
+    t0 = im[111];
+    t8 = re[31];
+    t5 = im[31];
+    t6 = re[71];
+    t17 = im[71];
+    t11 = t8 + t6;
+    t19 = t5 + t17;
+    t3 = C5 * t11;
+    t1 = t16 - t3;
+    t14 = C5 * t19;
+    t18 = t0 - t14;
+    t12 = t8 - t6;
+    t10 = C6 * t12;
+    t2 = t5 - t17;
+    t9 = C6 * t2;
+    t4 = t16 + t11;
+    t13 = t0 + t19;
+    t15 = t1 + t9;
+    t7 = t18 - t10;
+    t3 = t1 - t9;
+    t14 = t18 + t10;
+    t8 = (-C61) * t4;
+    t6 = (-C62) * t13;
+    t12 = t8 + t6;
+    t5 = 0.0958302170606977 * t12;
+    y[341] = t5;
+    t17 = 0.07507241738097777 * t12;
+    y[378] = t17;
+    t2 = C62 * t4;
+    t16 = (-C61) * t13;
+    t11 = t2 + t16;
+    t0 = 0.027074672896674333 * t11;
+    y[101] = t0;
+    t19 = (-0.06574932607311029) * t11;
+    y[138] = t19;
+    t1 = (-C63) * t15;
+    t9 = (-C64) * t7;
+    t18 = t1 + t9;
+    t10 = 0.09038829747800994 * t18;
+    y[261] = t10;
+    t8 = 0.004448082232380634 * t18;
+    y[458] = t8;
+    t6 = C64 * t15;
+    t5 = (-C63) * t7;
+    t12 = t6 + t5;
+    y[21] = 0;
+    t17 = (-0.09219482572244161) * t12;
+    y[218] = t17;
+    t4 = C65 * t3;
+    t13 = C66 * t14;
+    t2 = t4 + t13;
+    t16 = 0.0005543023788221308 * t2;
+    y[58] = t16;
+    t0 = (-0.08913894680518375) * t2;
+    y[181] = t0;
+    t11 = (-C66) * t3;
+    t19 = C65 * t14;
+    t1 = t11 + t19;
+    t9 = 0.09329614388539122 * t1;
+    y[298] = t9;
+    t10 = 0.030693222787216617 * t1;
+    y[421] = t10;
+    t18 = re[30];
+    t8 = im[30];
+    t15 = re[70];
+    t7 = im[70];
+    t6 = re[110];
+    t5 = im[110];
+    t12 = t15 + t6;
+    t17 = t7 + t5;
+    t4 = C5 * t12;
+    t13 = t18 - t4;
+    t16 = C5 * t17;
+    t2 = t8 - t16;
+    t0 = t15 - t6;
+    t3 = C6 * t0;
+    t14 = t7 - t5;
+    t11 = C6 * t14;
+    t19 = t18 + t12;
+    t9 = t8 + t17;
+    t1 = t13 + t11;
+    t10 = t2 - t3;
+    t4 = t13 - t11;
+    t16 = t2 + t3;
+    t15 = C67 * t19;
+    t6 = C68 * t9;
+    t0 = t15 + t6;
+    t7 = 0.0008692481724313596 * t0;
+    y[60] = t7;
+    t5 = (-0.08868530563218803) * t0;
+    y[179] = t5;
+    t14 = (-C68) * t19;
+    t18 = C67 * t9;
+    t12 = t14 + t18;
+    t8 = 0.09364478174038289 * t12;
+    y[300] = t8;
+    t17 = 0.03269174986983001 * t12;
+    y[419] = t17;
+    t13 = (-C69) * t1;
+    t11 = (-C70) * t10;
+    t2 = t13 + t11;
+    t3 = 0.09621138331081235 * t2;
+    y[339] = t3;
+    t15 = 0.07326697035985012 * t2;
+    y[380] = t15;
+    t6 = C70 * t1;
+    t7 = (-C69) * t10;
+    t0 = t6 + t7;
+    t5 = 0.02505487541976712 * t0;
+    y[99] = t5;
+    t19 = (-0.06753502854847021) * t0;
+    y[140] = t19;
+    t9 = (-C71) * t4;
+    t14 = (-C72) * t16;
+    t18 = t9 + t14;
+    t8 = 0.09042611495709132 * t18;
+    y[259] = t8;
+    t12 = 0.0037258660788030895 * t18;
+    y[460] = t12;
+    t17 = C72 * t4;
+    t13 = (-C71) * t16;
+    t11 = t17 + t13;
+    y[19] = 0;
+    t3 = (-0.09215626854352463) * t11;
+    y[220] = t3;
+    t2 = re[69];
+    t15 = im[69];
+    t1 = re[109];
+    t10 = im[109];
+    t6 = re[29];
+    t7 = im[29];
+    t5 = t1 + t6;
+    t0 = t10 + t7;
+    t19 = C5 * t5;
+    t9 = t2 - t19;
+    t14 = C5 * t0;
+    t8 = t15 - t14;
+    t18 = t1 - t6;
+    t12 = C6 * t18;
+    t4 = t10 - t7;
+    t16 = C6 * t4;
+    t17 = t2 + t5;
+    t13 = t15 + t0;
+    t11 = t9 + t16;
+    t3 = t8 - t12;
+    t19 = t9 - t16;
+    t14 = t8 + t12;
+    t1 = (-C73) * t17;
+    t6 = (-C74) * t13;
+    t18 = t1 + t6;
+    t10 = 0.0904771972914263 * t18;
+    y[257] = t10;
+    t7 = 0.0030761966919491423 * t18;
+    y[462] = t7;
+    t4 = C74 * t17;
+    t2 = (-C73) * t13;
+    t5 = t4 + t2;
+    y[17] = 0;
+    t15 = (-0.09210423822581212) * t5;
+    y[222] = t15;
+    t0 = C75 * t11;
+    t9 = C76 * t3;
+    t16 = t0 + t9;
+    t8 = 0.001266586606840836 * t16;
+    y[62] = t8;
+    t12 = (-0.08818615927816541) * t16;
+    y[177] = t12;
+    t1 = (-C76) * t11;
+    t6 = C75 * t3;
+    t10 = t1 + t6;
+    t18 = 0.09399827813076395 * t10;
+    y[302] = t18;
+    t7 = 0.034728147276250475 * t10;
+    y[417] = t7;
+    t17 = (-C77) * t19;
+    t13 = (-C78) * t14;
+    t4 = t17 + t13;
+    t2 = 0.09652165615928737 * t4;
+    y[337] = t2;
+    t5 = 0.07140668037545762 * t4;
+    y[382] = t5;
+    t15 = C78 * t19;
+    t0 = (-C77) * t14;
+    t9 = t15 + t0;
+    t8 = 0.02308496315134304 * t9;
+    y[97] = t8;
+    t16 = (-0.06925816458302594) * t9;
+    y[142] = t16;
+    t12 = re[108];
+    t11 = im[108];
+    t3 = re[28];
+    t1 = im[28];
+    t6 = re[68];
+    t18 = im[68];
+    t10 = t3 + t6;
+    t7 = t1 + t18;
+    t17 = C5 * t10;
+    t13 = t12 - t17;
+    t2 = C5 * t7;
+    t4 = t11 - t2;
+    t5 = t3 - t6;
+    t19 = C6 * t5;
+    t14 = t1 - t18;
+    t15 = C6 * t14;
+    t0 = t12 + t10;
+    t8 = t11 + t7;
+    t9 = t13 + t15;
+    t16 = t4 - t19;
+    t17 = t13 - t15;
+    t2 = t4 + t19;
+    t3 = (-C79) * t0;
+    t6 = (-C80) * t8;
+    t5 = t3 + t6;
+    t1 = 0.0967631084341196 * t5;
+    y[335] = t1;
+    t18 = 0.06949540812097872 * t5;
+    y[384] = t18;
+    t14 = C80 * t0;
+    t12 = (-C79) * t8;
+    t10 = t14 + t12;
+    t11 = 0.02117182715100995 * t10;
+    y[95] = t11;
+    t7 = (-0.07091533825082738) * t10;
+    y[144] = t7;
+    t13 = (-C81) * t9;
+    t15 = (-C82) * t16;
+    t4 = t13 + t15;
+    t19 = 0.09054017105349113 * t4;
+    y[255] = t19;
+    t3 = 0.002497218153517526 * t4;
+    y[464] = t3;
+    t6 = C82 * t9;
+    t1 = (-C81) * t16;
+    t5 = t6 + t1;
+    y[15] = 0;
+    t18 = (-0.09204017660194169) * t5;
+    y[224] = t18;
+    t0 = C83 * t17;
+    t8 = C84 * t2;
+    t14 = t0 + t8;
+    t12 = 0.0017527181996514706 * t14;
+    y[64] = t12;
+    t11 = (-0.08763727041503364) * t14;
+    y[175] = t11;
+    t10 = (-C84) * t17;
+    t7 = C83 * t2;
+    t13 = t10 + t7;
+    t15 = 0.09435297960865555 * t13;
+    y[304] = t15;
+    t19 = 0.036797555316227276 * t13;
+    y[415] = t19;
+    t4 = re[27];
+    t3 = im[27];
+    t9 = re[67];
+    t16 = im[67];
+    t6 = re[107];
+    t1 = im[107];
+    t5 = t9 + t6;
+    t18 = t16 + t1;
+    t0 = C5 * t5;
+    t8 = t4 - t0;
+    t12 = C5 * t18;
+    t14 = t3 - t12;
+    t11 = t9 - t6;
+    t17 = C6 * t11;
+    t2 = t16 - t1;
+    t10 = C6 * t2;
+    t7 = t4 + t5;
+    t15 = t3 + t18;
+    t13 = t8 + t10;
+    t19 = t14 - t17;
+    t0 = t8 - t10;
+    t12 = t14 + t17;
+    t9 = C85 * t7;
+    t6 = C86 * t15;
+    t11 = t9 + t6;
+    t16 = 0.0023321697985883467 * t11;
+    y[66] = t16;
+    t1 = (-0.08703551219791075) * t11;
+    y[173] = t1;
+    t2 = (-C86) * t7;
+    t4 = C85 * t15;
+    t5 = t2 + t4;
+    t3 = 0.09470412254796516 * t5;
+    y[306] = t3;
+    t18 = 0.03889576143743222 * t5;
+    y[413] = t18;
+    t8 = (-C87) * t13;
+    t10 = (-C88) * t19;
+    t14 = t8 + t10;
+    t17 = 0.09693835832518913 * t14;
+    y[333] = t17;
+    t9 = 0.06753718307378472 * t14;
+    y[386] = t9;
+    t6 = C88 * t13;
+    t16 = (-C87) * t19;
+    t11 = t6 + t16;
+    t1 = 0.01931982303769135 * t11;
+    y[93] = t1;
+    t7 = (-0.07250511592434625) * t11;
+    y[146] = t7;
+    t15 = (-C89) * t0;
+    t2 = (-C90) * t12;
+    t4 = t15 + t2;
+    t3 = 0.09061382845181774 * t4;
+    y[253] = t3;
+    t5 = 0.001987292053496043 * t4;
+    y[466] = t5;
+    t18 = C90 * t0;
+    t8 = (-C89) * t12;
+    t10 = t18 + t8;
+    y[13] = 0;
+    t17 = (-0.09196535976585991) * t10;
+    y[226] = t17;
+    t14 = re[66];
+    t9 = im[66];
+    t13 = re[106];
+    t19 = im[106];
+    t6 = re[26];
+    t16 = im[26];
+    t1 = t13 + t6;
+    t11 = t19 + t16;
+    t7 = C5 * t1;
+    t15 = t14 - t7;
+    t2 = C5 * t11;
+    t3 = t9 - t2;
+    t4 = t13 - t6;
+    t5 = C6 * t4;
+    t0 = t19 - t16;
+    t12 = C6 * t0;
+    t18 = t14 + t1;
+    t8 = t9 + t11;
+    t10 = t15 + t12;
+    t17 = t3 - t5;
+    t7 = t15 - t12;
+    t2 = t3 + t5;
+    t13 = (-C91) * t18;
+    t6 = (-C92) * t8;
+    t4 = t13 + t6;
+    t19 = 0.09069677564541208 * t4;
+    y[251] = t19;
+    t16 = 0.0015455547772786204 * t4;
+    y[468] = t16;
+    t0 = C92 * t18;
+    t14 = (-C91) * t8;
+    t1 = t0 + t14;
+    y[11] = 0;
+    t9 = (-0.09188125238226012) * t1;
+    y[228] = t9;
+    t11 = C93 * t10;
+    t15 = C94 * t17;
+    t12 = t11 + t15;
+    t3 = 0.0030078610211779653 * t12;
+    y[68] = t3;
+    t5 = (-0.08637786614799858) * t12;
+    y[171] = t5;
+    t13 = (-C94) * t10;
+    t6 = C93 * t17;
+    t19 = t13 + t6;
+    t4 = 0.09504699657158702 * t19;
+    y[308] = t4;
+    t16 = 0.0410180473216129 * t19;
+    y[411] = t16;
+    t18 = (-C95) * t7;
+    t8 = (-C96) * t2;
+    t0 = t18 + t8;
+    t14 = 0.09705031121367907 * t0;
+    y[331] = t14;
+    t1 = 0.0655371423617569 * t0;
+    y[388] = t1;
+    t9 = C96 * t7;
+    t11 = (-C95) * t2;
+    t15 = t9 + t11;
+    t3 = 0.01753462890895542 * t15;
+    y[91] = t3;
+    t12 = (-0.07402515017647827) * t15;
+    y[148] = t12;
+    t5 = re[105];
+    t10 = im[105];
+    t17 = re[25];
+    t13 = im[25];
+    t6 = re[65];
+    t4 = im[65];
+    t19 = t17 + t6;
+    t16 = t13 + t4;
+    t18 = C5 * t19;
+    t8 = t5 - t18;
+    t14 = C5 * t16;
+    t0 = t10 - t14;
+    t1 = t17 - t6;
+    t7 = C6 * t1;
+    t2 = t13 - t4;
+    t9 = C6 * t2;
+    t11 = t5 + t19;
+    t3 = t10 + t16;
+    t15 = t8 + t9;
+    t12 = t0 - t7;
+    t18 = t8 - t9;
+    t14 = t0 + t7;
+    t17 = (-C97) * t11;
+    t6 = (-C98) * t3;
+    t1 = t17 + t6;
+    t13 = 0.09710297608583138 * t1;
+    y[329] = t13;
+    t4 = 0.06349934378312706 * t1;
+    y[390] = t4;
+    t2 = C98 * t11;
+    t5 = (-C97) * t3;
+    t19 = t2 + t5;
+    t10 = 0.015820600627638397 * t19;
+    y[89] = t10;
+    t16 = (-0.07547385127254332) * t19;
+    y[150] = t16;
+    t8 = (-C99) * t15;
+    t9 = (-C100) * t12;
+    t0 = t8 + t9;
+    t7 = 0.09078772377604616 * t0;
+    y[249] = t7;
+    t17 = 0.0011685767792350902 * t0;
+    y[470] = t17;
+    t6 = C100 * t15;
+    t13 = (-C99) * t12;
+    t1 = t6 + t13;
+    y[9] = 0;
+    t4 = (-0.09178920879093609) * t1;
+    y[230] = t4;
+    t11 = C101 * t18;
+    t3 = C102 * t14;
+    t2 = t11 + t3;
+    t5 = 0.003781295030218233 * t2;
+    y[70] = t5;
+    t10 = (-0.0856603118363894) * t2;
+    y[169] = t10;
+    t19 = (-C102) * t18;
+    t16 = C101 * t14;
+    t8 = t19 + t16;
+    t9 = 0.09537830588915777 * t8;
+    y[310] = t9;
+    t7 = 0.04315926346326986 * t8;
+    y[409] = t7;
+}
+
+/**
+ *  Part 3 of ApplyWindowedIMDCT_W75_240_K120().
+ * 
+ *  @param {Number[]} X 
+ *    - The input block (240 points, only the first 120 points are used).
+ *  @param {Number[]} y 
+ *    - The array that would contain the output block (480 points).
+ *  @param {Number[]} re 
+ *    - The scratch buffer (real part, 120 points).
+ *  @param {Number[]} im 
+ *    - The scratch buffer (imaginary part, 120 points).
+ */
+function ApplyWindowedIMDCT_W75_240_K120_Part3(X, y, re, im) {
+    let t0, t1, t10, t11, t12, t13, t14, t15, t16, t17, t18, t19, t2, t3, t4, t5, t6, t7, t8, t9;
+    const C0 = 0.5;
+    const C1 = 0.8660254037844386;
+    const C2 = 0.30590302009655346;
+    const C3 = 0.9520626777139243;
+    const C4 = 0.9774619749435719;
+    const C5 = 0.21111155235896514;
+    const C6 = 0.7409511253549591;
+    const C7 = 0.6715589548470183;
+    const C8 = 0.7320972111532454;
+    const C9 = 0.6812001713311883;
+    const C10 = 0.2934146972328567;
+    const C11 = 0.9559852590117439;
+    const C12 = 0.974614868564045;
+    const C13 = 0.22388804785849836;
+    const C14 = 0.9716007669441208;
+    const C15 = 0.23662618129360988;
+    const C16 = 0.7231178558632475;
+    const C17 = 0.6907246676728287;
+    const C18 = 0.2808760992712921;
+    const C19 = 0.9597440371568574;
+    const C20 = 0.2682893746360714;
+    const C21 = 0.9633383681019799;
+    const C22 = 0.968420186534595;
+    const C23 = 0.24932377005071168;
+    const C24 = 0.7140145980512682;
+    const C25 = 0.7001308118985237;
+    const C26 = 0.7047889975136701;
+    const C27 = 0.709416992313883;
+    const C28 = 0.2556566799976644;
+    const C29 = 0.9667676359770075;
+    const C30 = 0.9650736723115474;
+    const C31 = 0.26197863846333747;
+    const C32 = 0.9615617976829619;
+    const C33 = 0.27458861818493235;
+    const C34 = 0.6954426350096117;
+    const C35 = 0.7185816177796981;
+    const C36 = 0.24298017990326387;
+    const C37 = 0.970031253194544;
+    const C38 = 0.23026204640590237;
+    const C39 = 0.97312866055058;
+    const C40 = 0.9578851643904772;
+    const C41 = 0.2871515485603873;
+    const C42 = 0.6859771119901928;
+    const C43 = 0.7276231179845748;
+    const C44 = 0.6763940503240542;
+    const C45 = 0.736539943713999;
+    const C46 = 0.21750445869228147;
+    const C47 = 0.9760593273203108;
+    const C48 = 0.9540444024062804;
+    const C49 = 0.2996652769962566;
+    const C50 = 0.9500401698251654;
+    const C51 = 0.3121276593295937;
+    const C52 = 0.6666950920194786;
+    const C53 = 0.7453305671157858;
+    const C54 = 0.2047096027093796;
+    const C55 = 0.9788227513490724;
+    const C56 = 0.19187967078990142;
+    const C57 = 0.9814184591383835;
+    const C58 = 0.945873152751771;
+    const C59 = 0.32453656019534216;
+    const C60 = 0.6568818989430413;
+    const C61 = 0.7539934819618695;
+    const C62 = 0.6469561525348573;
+    const C63 = 0.7625272039063882;
+    const C64 = 0.17901686127663266;
+    const C65 = 0.9838460059270774;
+    const C66 = 0.9415440651830208;
+    const C67 = 0.33688985339222005;
+    const C68 = 0.9370536488857836;
+    const C69 = 0.34918542224703286;
+    const C70 = 0.6369195535204759;
+    const C71 = 0.7709302707400181;
+    const C72 = 0.16612337814576547;
+    const C73 = 0.9861049757675088;
+    const C74 = 0.15320143062925848;
+    const C75 = 0.9881949815968246;
+    const C76 = 0.9324026732697752;
+    const C77 = 0.361421159977355;
+    const C78 = 0.6267738216194696;
+    const C79 = 0.7792012426405167;
+    const C80 = 0.6165206952507691;
+    const C81 = 0.7873387024194278;
+    const C82 = 0.14025323283629626;
+    const C83 = 0.9901156653032855;
+    const C84 = 0.927591935255724;
+    const C85 = 0.37359497005251635;
+    const C86 = 0.9226222591388232;
+    const C87 = 0.3857047665528313;
+    const C88 = 0.6061619312347947;
+    const C89 = 0.79534125576491;
+    const C90 = 0.1272810033739132;
+    const C91 = 0.991866697787626;
+    const C92 = 0.1142869649668464;
+    const C93 = 0.9934477790194444;
+    const C94 = 0.9174944964474913;
+    const C95 = 0.39774847452701106;
+    const C96 = 0.5956993044924334;
+    const C97 = 0.8032075314806449;
+    const C98 = 0.5851346077409155;
+    const C99 = 0.8109361817207843;
+    const C100 = 0.10127334407668342;
+    const C101 = 0.9948586380886109;
+    const C102 = 0.9122095257974677;
+    const C103 = 0.4097240303476953;
+    const C104 = 0.9067682527412662;
+    const C105 = 0.4216293820650445;
+    const C106 = 0.5744696511866426;
+    const C107 = 0.8185258822208966;
+    const C108 = 0.08824237052036951;
+    const C109 = 0.9960990332516871;
+    const C110 = 0.0751962770881399;
+    const C111 = 0.9971687519733476;
+    const C112 = 0.9011716096130131;
+    const C113 = 0.4334624897583309;
+    const C114 = 0.5637062622150166;
+    const C115 = 0.8259753325248732;
+    const C116 = 0.5528462850773279;
+    const C117 = 0.8332832562077542;
+    const C118 = 0.062137299160942724;
+    const C119 = 0.9980676109627962;
+    const C120 = 0.895420555368697;
+    const C121 = 0.4452213258854682;
+    const C122 = 0.8895160754218561;
+    const C123 = 0.4569038756304206;
+    const C124 = 0.5418915805747517;
+    const C125 = 0.840448401094438;
+    const C126 = 0.049067674327418015;
+    const C127 = 0.9987954562051724;
+    const C128 = 0.035989642000498374;
+    const C129 = 0.9993521629879409;
+    const C130 = 0.8834591814747328;
+    const C131 = 0.46850813724843143;
+    const C132 = 0.5308440257395095;
+    const C133 = 0.8474695394742344;
+    const C134 = 0.5197055135132492;
+    const C135 = 0.8543454683112272;
+    const C136 = 0.02290544303369714;
+    const C137 = 0.9997376359222604;
+    const C138 = 0.8772509113449243;
+    const C139 = 0.4800321224090111;
+    const C140 = 0.8708923287875567;
+    const C141 = 0.49147385653662823;
+    const C142 = 0.5084779524226998;
+    const C143 = 0.861075009450407;
+    const C144 = 0.009817319337149617;
+    const C145 = 0.999951808959328;
+    t0 = re[24];
+    t17 = im[24];
+    t15 = re[64];
+    t12 = im[64];
+    t6 = re[104];
+    t13 = im[104];
+    t1 = t15 + t6;
+    t4 = t12 + t13;
+    t11 = C0 * t1;
+    t3 = t0 - t11;
+    t5 = C0 * t4;
+    t2 = t17 - t5;
+    t10 = t15 - t6;
+    t18 = C1 * t10;
+    t14 = t12 - t13;
+    t19 = C1 * t14;
+    t16 = t0 + t1;
+    t9 = t17 + t4;
+    t8 = t3 + t19;
+    t7 = t2 - t18;
+    t11 = t3 - t19;
+    t5 = t2 + t18;
+    t15 = C2 * t16;
+    t6 = C3 * t9;
+    t10 = t15 + t6;
+    t12 = 0.0046529099454776825 * t10;
+    y[72] = t12;
+    t13 = (-0.08488084990913544) * t10;
+    y[167] = t13;
+    t14 = (-C3) * t16;
+    t0 = C2 * t9;
+    t1 = t14 + t0;
+    t17 = 0.09569280241720633 * t1;
+    y[312] = t17;
+    t4 = 0.045315068730014604 * t1;
+    y[407] = t4;
+    t3 = (-C4) * t8;
+    t19 = (-C5) * t7;
+    t2 = t3 + t19;
+    t18 = 0.09709912723798485 * t2;
+    y[327] = t18;
+    t15 = 0.06142731431140673 * t2;
+    y[392] = t15;
+    t6 = C5 * t8;
+    t12 = (-C4) * t7;
+    t10 = t6 + t12;
+    t13 = 0.014182605054244018 * t10;
+    y[87] = t13;
+    t16 = (-0.0768506804043917) * t10;
+    y[152] = t16;
+    t9 = (-C6) * t11;
+    t14 = (-C7) * t5;
+    t0 = t9 + t14;
+    t17 = 0.09088527913459936 * t0;
+    y[247] = t17;
+    t1 = 0.0008531948944978419 * t0;
+    y[472] = t1;
+    t4 = C7 * t11;
+    t3 = (-C6) * t5;
+    t19 = t4 + t3;
+    y[7] = 0;
+    t18 = (-0.09169068316324167) * t19;
+    y[232] = t18;
+    t2 = re[63];
+    t15 = im[63];
+    t8 = re[103];
+    t7 = im[103];
+    t6 = re[23];
+    t12 = im[23];
+    t13 = t8 + t6;
+    t10 = t7 + t12;
+    t16 = C0 * t13;
+    t9 = t2 - t16;
+    t14 = C0 * t10;
+    t17 = t15 - t14;
+    t0 = t8 - t6;
+    t1 = C1 * t0;
+    t11 = t7 - t12;
+    t5 = C1 * t11;
+    t4 = t2 + t13;
+    t3 = t15 + t10;
+    t19 = t9 + t5;
+    t18 = t17 - t1;
+    t16 = t9 - t5;
+    t14 = t17 + t1;
+    t8 = (-C8) * t4;
+    t6 = (-C9) * t3;
+    t0 = t8 + t6;
+    t7 = 0.09098818490486592 * t0;
+    y[245] = t7;
+    t12 = 0.0005958118887355562 * t0;
+    y[474] = t12;
+    t11 = C9 * t4;
+    t2 = (-C8) * t3;
+    t13 = t11 + t2;
+    y[5] = 0;
+    t15 = (-0.09158698288185847) * t13;
+    y[234] = t15;
+    t10 = C10 * t19;
+    t9 = C11 * t18;
+    t5 = t10 + t9;
+    t17 = 0.005622135445844074 * t5;
+    y[74] = t17;
+    t1 = (-0.08403708295850383) * t5;
+    y[165] = t1;
+    t8 = (-C11) * t19;
+    t6 = C10 * t18;
+    t7 = t8 + t6;
+    t0 = 0.09598610074001072 * t7;
+    y[314] = t0;
+    t12 = 0.04748043250702334 * t7;
+    y[405] = t12;
+    t4 = (-C12) * t16;
+    t3 = (-C13) * t14;
+    t11 = t4 + t3;
+    t2 = 0.09704334336966204 * t11;
+    y[325] = t2;
+    t13 = 0.059326876889732816 * t11;
+    y[394] = t13;
+    t15 = C13 * t16;
+    t10 = (-C12) * t14;
+    t9 = t15 + t10;
+    t17 = 0.012624949394551927 * t9;
+    y[85] = t17;
+    t5 = (-0.07815409333098762) * t9;
+    y[154] = t5;
+    t1 = re[102];
+    t19 = im[102];
+    t18 = re[22];
+    t8 = im[22];
+    t6 = re[62];
+    t0 = im[62];
+    t7 = t18 + t6;
+    t12 = t8 + t0;
+    t4 = C0 * t7;
+    t3 = t1 - t4;
+    t2 = C0 * t12;
+    t11 = t19 - t2;
+    t13 = t18 - t6;
+    t16 = C1 * t13;
+    t14 = t8 - t0;
+    t15 = C1 * t14;
+    t10 = t1 + t7;
+    t17 = t19 + t12;
+    t9 = t3 + t15;
+    t5 = t11 - t16;
+    t4 = t3 - t15;
+    t2 = t11 + t16;
+    t18 = (-C14) * t10;
+    t6 = (-C15) * t17;
+    t13 = t18 + t6;
+    t8 = 0.09693980393114883 * t13;
+    y[323] = t8;
+    t0 = 0.05720267793605442 * t13;
+    y[396] = t0;
+    t14 = C15 * t10;
+    t1 = (-C14) * t17;
+    t7 = t14 + t1;
+    t19 = 0.011150290256942962 * t7;
+    y[83] = t19;
+    t12 = (-0.07938438658631503) * t7;
+    y[156] = t12;
+    t3 = (-C16) * t9;
+    t15 = (-C17) * t5;
+    t11 = t3 + t15;
+    t16 = 0.09109495310907251 * t11;
+    y[243] = t16;
+    t18 = 0.0003913811942012797 * t11;
+    y[476] = t18;
+    t6 = C17 * t9;
+    t8 = (-C16) * t5;
+    t13 = t6 + t8;
+    y[3] = 0;
+    t0 = (-0.09147963799218842) * t13;
+    y[236] = t0;
+    t10 = C18 * t4;
+    t17 = C19 * t2;
+    t14 = t10 + t17;
+    t1 = 0.006687843776213512 * t14;
+    y[76] = t1;
+    t19 = (-0.08312516910399824) * t14;
+    y[163] = t19;
+    t7 = (-C19) * t4;
+    t12 = C18 * t2;
+    t3 = t7 + t12;
+    t15 = 0.09625582992869657 * t3;
+    y[316] = t15;
+    t16 = 0.049649962585211385 * t3;
+    y[403] = t16;
+    t11 = re[21];
+    t18 = im[21];
+    t9 = re[61];
+    t5 = im[61];
+    t6 = re[101];
+    t8 = im[101];
+    t13 = t9 + t6;
+    t0 = t5 + t8;
+    t10 = C0 * t13;
+    t17 = t11 - t10;
+    t1 = C0 * t0;
+    t14 = t18 - t1;
+    t19 = t9 - t6;
+    t4 = C1 * t19;
+    t2 = t5 - t8;
+    t7 = C1 * t2;
+    t12 = t11 + t13;
+    t15 = t18 + t0;
+    t3 = t17 + t7;
+    t16 = t14 - t4;
+    t10 = t17 - t7;
+    t1 = t14 + t4;
+    t9 = C20 * t12;
+    t6 = C21 * t15;
+    t19 = t9 + t6;
+    t5 = 0.00784829303888874 * t19;
+    y[78] = t5;
+    t8 = (-0.08214494215885092) * t19;
+    y[161] = t8;
+    t2 = (-C21) * t12;
+    t11 = C20 * t15;
+    t13 = t2 + t11;
+    t18 = 0.09649583471076638 * t13;
+    y[318] = t18;
+    t0 = 0.051818729299763125 * t13;
+    y[401] = t0;
+    t17 = (-C22) * t3;
+    t7 = (-C23) * t16;
+    t14 = t17 + t7;
+    t4 = 0.0967912198161176 * t14;
+    y[321] = t4;
+    t9 = 0.055058748193673866 * t14;
+    y[398] = t9;
+    t6 = C23 * t3;
+    t5 = (-C22) * t16;
+    t19 = t6 + t5;
+    t8 = 0.00976233994080978 * t19;
+    y[81] = t8;
+    t12 = (-0.08054275100119243) * t19;
+    y[158] = t12;
+    t15 = (-C24) * t10;
+    t2 = (-C25) * t1;
+    t11 = t15 + t2;
+    t18 = 0.09120428548155567 * t11;
+    y[241] = t18;
+    t13 = 0.00023413481508896496 * t11;
+    y[478] = t13;
+    t0 = C25 * t10;
+    t17 = (-C24) * t1;
+    t7 = t0 + t17;
+    y[1] = 0;
+    t4 = (-0.0913699755371538) * t7;
+    y[238] = t4;
+    t14 = re[60];
+    t9 = im[60];
+    t3 = re[100];
+    t16 = im[100];
+    t6 = re[20];
+    t5 = im[20];
+    t8 = t3 + t6;
+    t19 = t16 + t5;
+    t12 = C0 * t8;
+    t15 = t14 - t12;
+    t2 = C0 * t19;
+    t18 = t9 - t2;
+    t11 = t3 - t6;
+    t13 = C1 * t11;
+    t10 = t16 - t5;
+    t1 = C1 * t10;
+    t0 = t14 + t8;
+    t17 = t9 + t19;
+    t7 = t15 + t1;
+    t4 = t18 - t13;
+    t12 = t15 - t1;
+    t2 = t18 + t13;
+    t3 = C26 * t0;
+    t6 = C27 * t17;
+    t11 = t3 + t6;
+    y[0] = 0;
+    t16 = (-0.09131475557438358) * t11;
+    y[239] = t16;
+    t5 = (-C27) * t0;
+    t10 = C26 * t17;
+    t14 = t5 + t10;
+    t8 = 0.09125943864072585 * t14;
+    y[240] = t8;
+    t9 = 0.0001687287062834231 * t14;
+    y[479] = t9;
+    t19 = C28 * t7;
+    t15 = C29 * t4;
+    t1 = t19 + t15;
+    t18 = 0.009101559537619174 * t1;
+    y[80] = t18;
+    t13 = (-0.08109490290798863) * t1;
+    y[159] = t13;
+    t3 = (-C29) * t7;
+    t6 = C28 * t4;
+    t11 = t3 + t6;
+    t16 = 0.09670175848871748 * t11;
+    y[320] = t16;
+    t0 = 0.05398125624826106 * t11;
+    y[399] = t0;
+    t17 = (-C30) * t12;
+    t5 = (-C31) * t2;
+    t10 = t17 + t5;
+    t8 = 0.0966031645769662 * t10;
+    y[319] = t8;
+    t14 = 0.0529011247003047 * t10;
+    y[400] = t14;
+    t9 = C31 * t12;
+    t19 = (-C30) * t2;
+    t15 = t9 + t19;
+    t18 = 0.008463448060253795 * t15;
+    y[79] = t18;
+    t1 = (-0.0816288725802624) * t15;
+    y[160] = t1;
+    t13 = re[99];
+    t7 = im[99];
+    t4 = re[19];
+    t3 = im[19];
+    t6 = re[59];
+    t16 = im[59];
+    t11 = t4 + t6;
+    t0 = t3 + t16;
+    t17 = C0 * t11;
+    t5 = t13 - t17;
+    t8 = C0 * t0;
+    t10 = t7 - t8;
+    t14 = t4 - t6;
+    t12 = C1 * t14;
+    t2 = t3 - t16;
+    t9 = C1 * t2;
+    t19 = t13 + t11;
+    t18 = t7 + t0;
+    t15 = t5 + t9;
+    t1 = t10 - t12;
+    t17 = t5 - t9;
+    t8 = t10 + t12;
+    t4 = (-C32) * t19;
+    t6 = (-C33) * t18;
+    t14 = t4 + t6;
+    t3 = 0.09637995258792109 * t14;
+    y[317] = t3;
+    t16 = 0.05073477379794547 * t14;
+    y[402] = t16;
+    t2 = C33 * t19;
+    t13 = (-C32) * t18;
+    t11 = t2 + t13;
+    t7 = 0.007256349955859877 * t11;
+    y[77] = t7;
+    t0 = (-0.08264357727773244) * t11;
+    y[162] = t0;
+    t5 = C34 * t15;
+    t9 = C35 * t1;
+    t10 = t5 + t9;
+    y[2] = 0;
+    t12 = (-0.09142501297733138) * t10;
+    y[237] = t12;
+    t4 = (-C35) * t15;
+    t6 = C34 * t1;
+    t3 = t4 + t6;
+    t14 = 0.09114938091832223 * t3;
+    y[242] = t14;
+    t16 = 0.0003074203471366065 * t3;
+    y[477] = t16;
+    t19 = C36 * t17;
+    t18 = C37 * t8;
+    t2 = t19 + t18;
+    t13 = 0.010445384859933385 * t2;
+    y[82] = t13;
+    t7 = (-0.07997250269761456) * t2;
+    y[157] = t7;
+    t11 = (-C37) * t17;
+    t0 = C36 * t8;
+    t5 = t11 + t0;
+    t9 = 0.09687085215339357 * t5;
+    y[322] = t9;
+    t10 = 0.05613281425607352 * t5;
+    y[397] = t10;
+    t12 = re[18];
+    t15 = im[18];
+    t1 = re[58];
+    t4 = im[58];
+    t6 = re[98];
+    t14 = im[98];
+    t3 = t1 + t6;
+    t16 = t4 + t14;
+    t19 = C0 * t3;
+    t18 = t12 - t19;
+    t13 = C0 * t16;
+    t2 = t15 - t13;
+    t7 = t1 - t6;
+    t17 = C1 * t7;
+    t8 = t4 - t14;
+    t11 = C1 * t8;
+    t0 = t12 + t3;
+    t9 = t15 + t16;
+    t5 = t18 + t11;
+    t10 = t2 - t17;
+    t19 = t18 - t11;
+    t13 = t2 + t17;
+    t1 = C38 * t0;
+    t6 = C39 * t9;
+    t7 = t1 + t6;
+    t4 = 0.01187691435143269 * t7;
+    y[84] = t4;
+    t14 = (-0.07877827811770904) * t7;
+    y[155] = t14;
+    t8 = (-C39) * t0;
+    t12 = C38 * t9;
+    t3 = t8 + t12;
+    t15 = 0.09699748493185585 * t3;
+    y[324] = t15;
+    t16 = 0.058267532136393865 * t3;
+    y[395] = t16;
+    t18 = (-C40) * t5;
+    t11 = (-C41) * t10;
+    t2 = t18 + t11;
+    t17 = 0.09612420663291579 * t2;
+    y[315] = t17;
+    t1 = 0.04856492303546617 * t2;
+    y[404] = t1;
+    t6 = C41 * t5;
+    t4 = (-C40) * t10;
+    t7 = t6 + t4;
+    t14 = 0.006143019792502721 * t7;
+    y[75] = t14;
+    t0 = (-0.08358974634339059) * t7;
+    y[164] = t0;
+    t9 = C42 * t19;
+    t8 = C43 * t13;
+    t12 = t9 + t8;
+    y[4] = 0;
+    t15 = (-0.09153367620104567) * t12;
+    y[235] = t15;
+    t3 = (-C43) * t19;
+    t16 = C42 * t13;
+    t18 = t3 + t16;
+    t11 = 0.09104117390663842 * t18;
+    y[244] = t11;
+    t17 = 0.0004873180185828961 * t18;
+    y[475] = t17;
+    t2 = re[57];
+    t1 = im[57];
+    t5 = re[97];
+    t10 = im[97];
+    t6 = re[17];
+    t4 = im[17];
+    t14 = t5 + t6;
+    t7 = t10 + t4;
+    t0 = C0 * t14;
+    t9 = t2 - t0;
+    t8 = C0 * t7;
+    t12 = t1 - t8;
+    t15 = t5 - t6;
+    t19 = C1 * t15;
+    t13 = t10 - t4;
+    t3 = C1 * t13;
+    t16 = t2 + t14;
+    t11 = t1 + t7;
+    t18 = t9 + t3;
+    t17 = t12 - t19;
+    t0 = t9 - t3;
+    t8 = t12 + t19;
+    t5 = C44 * t16;
+    t6 = C45 * t11;
+    t15 = t5 + t6;
+    y[6] = 0;
+    t10 = (-0.09163939322407563) * t15;
+    y[233] = t10;
+    t4 = (-C45) * t16;
+    t13 = C44 * t11;
+    t2 = t4 + t13;
+    t14 = 0.09093614700128749 * t2;
+    y[246] = t14;
+    t1 = 0.0007176193279816504 * t2;
+    y[473] = t1;
+    t7 = C46 * t18;
+    t9 = C47 * t17;
+    t3 = t7 + t9;
+    t12 = 0.013393375586540204 * t3;
+    y[86] = t12;
+    t19 = (-0.0775117043266292) * t3;
+    y[153] = t19;
+    t5 = (-C47) * t18;
+    t6 = C46 * t17;
+    t15 = t5 + t6;
+    t10 = 0.09707744401023602 * t15;
+    y[326] = t10;
+    t16 = 0.06038023731968849 * t15;
+    y[393] = t16;
+    t11 = (-C48) * t0;
+    t4 = (-C49) * t8;
+    t13 = t11 + t4;
+    t14 = 0.0958422550018241 * t13;
+    y[313] = t14;
+    t2 = 0.046396889318521525 * t13;
+    y[406] = t2;
+    t1 = C49 * t0;
+    t7 = (-C48) * t8;
+    t9 = t1 + t7;
+    t12 = 0.005125386885201697 * t9;
+    y[73] = t12;
+    t3 = (-0.08446724594649771) * t9;
+    y[166] = t3;
+    t19 = re[96];
+    t18 = im[96];
+    t17 = re[16];
+    t5 = im[16];
+    t6 = re[56];
+    t10 = im[56];
+    t15 = t17 + t6;
+    t16 = t5 + t10;
+    t11 = C0 * t15;
+    t4 = t19 - t11;
+    t14 = C0 * t16;
+    t13 = t18 - t14;
+    t2 = t17 - t6;
+    t0 = C1 * t2;
+    t8 = t5 - t10;
+    t1 = C1 * t8;
+    t7 = t19 + t15;
+    t12 = t18 + t16;
+    t9 = t4 + t1;
+    t3 = t13 - t0;
+    t11 = t4 - t1;
+    t14 = t13 + t0;
+    t17 = (-C50) * t7;
+    t6 = (-C51) * t12;
+    t2 = t17 + t6;
+    t5 = 0.09553805039385353 * t2;
+    y[311] = t5;
+    t10 = 0.04423560528399145 * t2;
+    y[408] = t10;
+    t8 = C51 * t7;
+    t19 = (-C50) * t12;
+    t15 = t8 + t19;
+    t18 = 0.004204839118219382 * t15;
+    y[71] = t18;
+    t16 = (-0.08527837543502197) * t15;
+    y[168] = t16;
+    t4 = C52 * t9;
+    t1 = C53 * t3;
+    t13 = t4 + t1;
+    y[8] = 0;
+    t0 = (-0.09174066208859163) * t13;
+    y[231] = t0;
+    t17 = (-C53) * t9;
+    t6 = C52 * t3;
+    t5 = t17 + t6;
+    t2 = 0.09083576620894716 * t5;
+    y[248] = t2;
+    t10 = 0.0010033991315600104 * t5;
+    y[471] = t10;
+    t7 = C54 * t11;
+    t12 = C55 * t14;
+    t8 = t7 + t12;
+    t19 = 0.014992006244281922 * t8;
+    y[88] = t19;
+    t18 = (-0.07617123337222059) * t8;
+    y[151] = t18;
+    t15 = (-C55) * t11;
+    t16 = C54 * t14;
+    t4 = t15 + t16;
+    t1 = 0.09710785222241458 * t4;
+    y[328] = t1;
+    t13 = 0.06246718712392951 * t4;
+    y[391] = t13;
+    t0 = re[15];
+    t9 = im[15];
+    t3 = re[55];
+    t17 = im[55];
+    t6 = re[95];
+    t2 = im[95];
+    t5 = t3 + t6;
+    t10 = t17 + t2;
+    t7 = C0 * t5;
+    t12 = t0 - t7;
+    t19 = C0 * t10;
+    t8 = t9 - t19;
+    t18 = t3 - t6;
+    t11 = C1 * t18;
+    t14 = t17 - t2;
+    t15 = C1 * t14;
+    t16 = t0 + t5;
+    t1 = t9 + t10;
+    t4 = t12 + t15;
+    t13 = t8 - t11;
+    t7 = t12 - t15;
+    t19 = t8 + t11;
+    t3 = C56 * t16;
+    t6 = C57 * t1;
+    t18 = t3 + t6;
+    t17 = 0.016668033615864032 * t18;
+    y[90] = t17;
+    t2 = (-0.07475858286328994) * t18;
+    y[149] = t2;
+    t14 = (-C57) * t16;
+    t0 = C56 * t1;
+    t5 = t14 + t0;
+    t9 = 0.09708404002796817 * t5;
+    y[330] = t9;
+    t10 = 0.0645227929691675 * t5;
+    y[389] = t10;
+    t12 = (-C58) * t4;
+    t15 = (-C59) * t13;
+    t8 = t12 + t15;
+    t11 = 0.09521437769032931 * t8;
+    y[309] = t11;
+    t3 = 0.04208653165019209 * t8;
+    y[410] = t3;
+    t6 = C59 * t4;
+    t17 = (-C58) * t13;
+    t18 = t6 + t17;
+    t2 = 0.0033823163175740493 * t18;
+    y[69] = t2;
+    t16 = (-0.0860267489981687) * t18;
+    y[170] = t16;
+    t1 = C60 * t7;
+    t14 = C61 * t19;
+    t0 = t1 + t14;
+    y[10] = 0;
+    t9 = (-0.0918361435609985) * t0;
+    y[229] = t9;
+    t5 = (-C61) * t7;
+    t10 = C60 * t19;
+    t12 = t5 + t10;
+    t15 = 0.09074132482270718 * t12;
+    y[250] = t15;
+    t11 = 0.0013492771887970369 * t12;
+    y[469] = t11;
+    t8 = re[54];
+    t3 = im[54];
+    t4 = re[94];
+    t13 = im[94];
+    t6 = re[14];
+    t17 = im[14];
+    t2 = t4 + t6;
+    t18 = t13 + t17;
+    t16 = C0 * t2;
+    t1 = t8 - t16;
+    t14 = C0 * t18;
+    t0 = t3 - t14;
+    t9 = t4 - t6;
+    t7 = C1 * t9;
+    t19 = t13 - t17;
+    t5 = C1 * t19;
+    t10 = t8 + t2;
+    t15 = t3 + t18;
+    t12 = t1 + t5;
+    t11 = t0 - t7;
+    t16 = t1 - t5;
+    t14 = t0 + t7;
+    t4 = C62 * t10;
+    t6 = C63 * t15;
+    t9 = t4 + t6;
+    y[12] = 0;
+    t13 = (-0.09192437163927131) * t9;
+    y[227] = t13;
+    t17 = (-C63) * t10;
+    t19 = C62 * t15;
+    t8 = t17 + t19;
+    t2 = 0.0906542322207533 * t8;
+    y[252] = t2;
+    t3 = 0.0017581191828043815 * t8;
+    y[467] = t3;
+    t18 = C64 * t12;
+    t1 = C65 * t11;
+    t5 = t18 + t1;
+    t0 = 0.018418715600610196 * t5;
+    y[92] = t0;
+    t7 = (-0.07327389637800778) * t5;
+    y[147] = t7;
+    t4 = (-C65) * t12;
+    t6 = C64 * t11;
+    t9 = t4 + t6;
+    t13 = 0.09700200223142667 * t9;
+    y[332] = t13;
+    t10 = 0.06654202713938924 * t9;
+    y[387] = t10;
+    t15 = (-C66) * t16;
+    t17 = (-C67) * t14;
+    t19 = t15 + t17;
+    t2 = 0.09487681096790258 * t19;
+    y[307] = t2;
+    t8 = 0.039954198753038773 * t19;
+    y[412] = t8;
+    t3 = C67 * t16;
+    t18 = (-C66) * t14;
+    t1 = t3 + t18;
+    t0 = 0.0026578540809738863 * t1;
+    y[67] = t0;
+    t5 = (-0.086713927451765) * t1;
+    y[172] = t5;
+    t7 = re[93];
+    t12 = im[93];
+    t11 = re[13];
+    t4 = im[13];
+    t6 = re[53];
+    t13 = im[53];
+    t9 = t11 + t6;
+    t10 = t4 + t13;
+    t15 = C0 * t9;
+    t17 = t7 - t15;
+    t2 = C0 * t10;
+    t19 = t12 - t2;
+    t8 = t11 - t6;
+    t16 = C1 * t8;
+    t14 = t4 - t13;
+    t3 = C1 * t14;
+    t18 = t7 + t9;
+    t0 = t12 + t10;
+    t1 = t17 + t3;
+    t5 = t19 - t16;
+    t15 = t17 - t3;
+    t2 = t19 + t16;
+    t11 = (-C68) * t18;
+    t6 = (-C69) * t0;
+    t8 = t11 + t6;
+    t4 = 0.09452938893259823 * t8;
+    y[305] = t4;
+    t13 = 0.03784324285502507 * t8;
+    y[414] = t13;
+    t14 = C69 * t18;
+    t7 = (-C68) * t0;
+    t9 = t14 + t7;
+    t12 = 0.0020305692018240664 * t9;
+    y[65] = t12;
+    t10 = (-0.0873431014748424) * t9;
+    y[174] = t10;
+    t17 = C70 * t1;
+    t3 = C71 * t5;
+    t19 = t17 + t3;
+    y[14] = 0;
+    t16 = (-0.09200402888696975) * t19;
+    y[225] = t16;
+    t11 = (-C71) * t1;
+    t6 = C70 * t5;
+    t4 = t11 + t6;
+    t8 = 0.09057574362934841 * t4;
+    y[254] = t8;
+    t13 = 0.0022336672030543237 * t4;
+    y[465] = t13;
+    t18 = C72 * t15;
+    t0 = C73 * t2;
+    t14 = t18 + t0;
+    t7 = 0.02023751206992167 * t14;
+    y[94] = t7;
+    t12 = (-0.07171894336163445) * t14;
+    y[145] = t12;
+    t9 = (-C73) * t15;
+    t10 = C72 * t2;
+    t17 = t9 + t10;
+    t3 = 0.09685895736188291 * t17;
+    y[334] = t3;
+    t19 = 0.0685218247894467 * t17;
+    y[385] = t19;
+    t16 = re[12];
+    t1 = im[12];
+    t5 = re[52];
+    t11 = im[52];
+    t6 = re[92];
+    t8 = im[92];
+    t4 = t5 + t6;
+    t13 = t11 + t8;
+    t18 = C0 * t4;
+    t0 = t16 - t18;
+    t7 = C0 * t13;
+    t14 = t1 - t7;
+    t12 = t5 - t6;
+    t15 = C1 * t12;
+    t2 = t11 - t8;
+    t9 = C1 * t2;
+    t10 = t16 + t4;
+    t3 = t1 + t13;
+    t17 = t0 + t9;
+    t19 = t14 - t15;
+    t18 = t0 - t9;
+    t7 = t14 + t15;
+    t5 = C74 * t10;
+    t6 = C75 * t3;
+    t12 = t5 + t6;
+    t11 = 0.022121006853811794 * t12;
+    y[96] = t11;
+    t8 = (-0.07009508579978732) * t12;
+    y[143] = t8;
+    t2 = (-C75) * t10;
+    t16 = C74 * t3;
+    t4 = t2 + t16;
+    t1 = 0.09665087282156803 * t4;
+    y[336] = t1;
+    t13 = 0.07045710534702093 * t4;
+    y[383] = t13;
+    t0 = (-C76) * t17;
+    t9 = (-C77) * t19;
+    t14 = t0 + t9;
+    t15 = 0.09417575507955023 * t14;
+    y[303] = t15;
+    t5 = 0.035758982113670124 * t14;
+    y[416] = t5;
+    t6 = C77 * t17;
+    t11 = (-C76) * t19;
+    t12 = t6 + t11;
+    t8 = 0.0014982238934458136 * t12;
+    y[63] = t8;
+    t10 = (-0.08791815223495067) * t12;
+    y[176] = t10;
+    t3 = C78 * t18;
+    t2 = C79 * t7;
+    t16 = t3 + t2;
+    y[16] = 0;
+    t1 = (-0.09207362581828964) * t16;
+    y[223] = t1;
+    t4 = (-C79) * t18;
+    t13 = C78 * t7;
+    t0 = t4 + t13;
+    t9 = 0.09050727892240762 * t0;
+    y[256] = t9;
+    t15 = 0.002778041784911948 * t0;
+    y[463] = t15;
+    t14 = re[51];
+    t5 = im[51];
+    t17 = re[91];
+    t19 = im[91];
+    t6 = re[11];
+    t11 = im[11];
+    t8 = t17 + t6;
+    t12 = t19 + t11;
+    t10 = C0 * t8;
+    t3 = t14 - t10;
+    t2 = C0 * t12;
+    t16 = t5 - t2;
+    t1 = t17 - t6;
+    t18 = C1 * t1;
+    t7 = t19 - t11;
+    t4 = C1 * t7;
+    t13 = t14 + t8;
+    t9 = t5 + t12;
+    t0 = t3 + t4;
+    t15 = t16 - t18;
+    t10 = t3 - t4;
+    t2 = t16 + t18;
+    t17 = C80 * t13;
+    t6 = C81 * t9;
+    t1 = t17 + t6;
+    y[18] = 0;
+    t19 = (-0.09213185424311) * t1;
+    y[221] = t19;
+    t11 = (-C81) * t13;
+    t7 = C80 * t9;
+    t14 = t11 + t7;
+    t8 = 0.09045007724846191 * t14;
+    y[258] = t8;
+    t5 = 0.003392078454351888 * t14;
+    y[461] = t5;
+    t12 = C82 * t0;
+    t3 = C83 * t15;
+    t4 = t12 + t3;
+    t16 = 0.024064152632092713 * t4;
+    y[98] = t16;
+    t18 = (-0.06840421737663181) * t4;
+    y[141] = t18;
+    t17 = (-C83) * t0;
+    t6 = C82 * t15;
+    t1 = t17 + t6;
+    t19 = 0.09637494539960026 * t1;
+    y[338] = t19;
+    t13 = 0.07234331684866252 * t1;
+    y[381] = t13;
+    t9 = (-C84) * t10;
+    t11 = (-C85) * t2;
+    t7 = t9 + t11;
+    t8 = 0.09382117136084558 * t7;
+    y[301] = t8;
+    t14 = 0.03370544615326114 * t7;
+    y[418] = t14;
+    t5 = C85 * t10;
+    t12 = (-C84) * t2;
+    t3 = t5 + t12;
+    t16 = 0.0010571625305928285 * t3;
+    y[61] = t16;
+    t4 = (-0.08844167130113312) * t3;
+    y[178] = t4;
+    t18 = re[90];
+    t0 = im[90];
+    t15 = re[10];
+    t17 = im[10];
+    t6 = re[50];
+    t19 = im[50];
+    t1 = t15 + t6;
+    t13 = t17 + t19;
+    t9 = C0 * t1;
+    t11 = t18 - t9;
+    t8 = C0 * t13;
+    t7 = t0 - t8;
+    t14 = t15 - t6;
+    t10 = C1 * t14;
+    t2 = t17 - t19;
+    t5 = C1 * t2;
+    t12 = t18 + t1;
+    t16 = t0 + t13;
+    t3 = t11 + t5;
+    t4 = t7 - t10;
+    t9 = t11 - t5;
+    t8 = t7 + t10;
+    t15 = (-C86) * t12;
+    t6 = (-C87) * t16;
+    t14 = t15 + t6;
+    t17 = 0.09346957660009908 * t14;
+    y[299] = t17;
+    t19 = 0.03168746252407474 * t14;
+    y[420] = t19;
+    t2 = C87 * t12;
+    t18 = (-C86) * t16;
+    t1 = t2 + t18;
+    t0 = 0.0007021231543619729 * t1;
+    y[59] = t0;
+    t13 = (-0.08891754017192575) * t1;
+    y[180] = t13;
+    t11 = C88 * t3;
+    t5 = C89 * t4;
+    t7 = t11 + t5;
+    y[20] = 0;
+    t10 = (-0.09217730194744563) * t7;
+    y[219] = t10;
+    t15 = (-C89) * t3;
+    t6 = C88 * t4;
+    t17 = t15 + t6;
+    t14 = 0.09040548114637302 * t17;
+    y[260] = t14;
+    t19 = 0.004077868094918297 * t17;
+    y[459] = t19;
+    t12 = C90 * t9;
+    t16 = C91 * t8;
+    t2 = t12 + t16;
+    t18 = 0.026059152816006632 * t2;
+    y[100] = t18;
+    t0 = (-0.06664961433059914) * t2;
+    y[139] = t0;
+    t1 = (-C91) * t9;
+    t13 = C90 * t8;
+    t11 = t1 + t13;
+    t5 = 0.09602982670046604 * t11;
+    y[340] = t5;
+    t7 = 0.0741767176070929 * t11;
+    y[379] = t7;
+    t10 = re[9];
+    t3 = im[9];
+    t4 = re[49];
+    t15 = im[49];
+    t6 = re[89];
+    t14 = im[89];
+    t17 = t4 + t6;
+    t19 = t15 + t14;
+    t12 = C0 * t17;
+    t16 = t10 - t12;
+    t18 = C0 * t19;
+    t2 = t3 - t18;
+    t0 = t4 - t6;
+    t9 = C1 * t0;
+    t8 = t15 - t14;
+    t1 = C1 * t8;
+    t13 = t10 + t17;
+    t5 = t3 + t19;
+    t11 = t16 + t1;
+    t7 = t2 - t9;
+    t12 = t16 - t1;
+    t18 = t2 + t9;
+    t4 = C92 * t13;
+    t6 = C93 * t5;
+    t0 = t4 + t6;
+    t15 = 0.02810120791275669 * t0;
+    y[102] = t15;
+    t14 = (-0.06483429897658222) * t0;
+    y[137] = t14;
+    t8 = (-C93) * t13;
+    t10 = C92 * t5;
+    t17 = t8 + t10;
+    t3 = 0.09561210961373615 * t17;
+    y[342] = t3;
+    t19 = 0.07595364724111003 * t17;
+    y[377] = t19;
+    t16 = (-C94) * t11;
+    t1 = (-C95) * t7;
+    t2 = t16 + t1;
+    t9 = 0.09312553292068804 * t2;
+    y[297] = t9;
+    t4 = 0.029709304370203957 * t2;
+    y[422] = t4;
+    t6 = C95 * t11;
+    t15 = (-C94) * t7;
+    t0 = t6 + t15;
+    t14 = 0.0004222769452670429 * t0;
+    y[57] = t14;
+    t13 = (-0.08935022993236894) * t0;
+    y[182] = t13;
+    t5 = C96 * t12;
+    t8 = C97 * t18;
+    t10 = t5 + t8;
+    y[22] = 0;
+    t3 = (-0.09220868152367266) * t10;
+    y[217] = t3;
+    t17 = (-C97) * t12;
+    t19 = C96 * t18;
+    t16 = t17 + t19;
+    t1 = 0.09037471521804512 * t16;
+    y[262] = t1;
+    t9 = 0.004836578531268158 * t16;
+    y[457] = t9;
+    t2 = re[48];
+    t4 = im[48];
+    t11 = re[88];
+    t7 = im[88];
+    t6 = re[8];
+    t15 = im[8];
+    t14 = t11 + t6;
+    t0 = t7 + t15;
+    t13 = C0 * t14;
+    t5 = t2 - t13;
+    t8 = C0 * t0;
+    t10 = t4 - t8;
+    t3 = t11 - t6;
+    t12 = C1 * t3;
+    t18 = t7 - t15;
+    t17 = C1 * t18;
+    t19 = t2 + t14;
+    t1 = t4 + t0;
+    t16 = t5 + t17;
+    t9 = t10 - t12;
+    t13 = t5 - t17;
+    t8 = t10 + t12;
+    t11 = C98 * t19;
+    t6 = C99 * t1;
+    t3 = t11 + t6;
+    y[24] = 0;
+    t7 = (-0.09222461802987045) * t3;
+    y[215] = t7;
+    t15 = (-C99) * t19;
+    t18 = C98 * t1;
+    t2 = t15 + t18;
+    t14 = 0.09035909837690259 * t2;
+    y[264] = t14;
+    t4 = 0.005668641644993473 * t2;
+    y[455] = t4;
+    t0 = C100 * t16;
+    t5 = C101 * t9;
+    t17 = t0 + t5;
+    t10 = 0.030183604415960606 * t17;
+    y[104] = t10;
+    t12 = (-0.06296179334680656) * t17;
+    y[135] = t12;
+    t11 = (-C101) * t16;
+    t6 = C100 * t9;
+    t3 = t11 + t6;
+    t7 = 0.09512004217473578 * t3;
+    y[344] = t7;
+    t19 = 0.07767146900283439 * t3;
+    y[375] = t19;
+    t1 = (-C102) * t13;
+    t15 = (-C103) * t8;
+    t18 = t1 + t15;
+    t14 = 0.09282792874934585 * t18;
+    y[295] = t14;
+    t2 = 0.027774771122028637 * t18;
+    y[424] = t2;
+    t4 = C103 * t13;
+    t0 = (-C102) * t8;
+    t5 = t4 + t0;
+    y[55] = 0;
+    t10 = (-0.08977183317140486) * t5;
+    y[184] = t10;
+    t17 = re[87];
+    t12 = im[87];
+    t16 = re[7];
+    t9 = im[7];
+    t11 = re[47];
+    t6 = im[47];
+    t7 = t16 + t11;
+    t3 = t9 + t6;
+    t19 = C0 * t7;
+    t1 = t17 - t19;
+    t15 = C0 * t3;
+    t14 = t12 - t15;
+    t18 = t16 - t11;
+    t2 = C1 * t18;
+    t13 = t9 - t6;
+    t8 = C1 * t13;
+    t4 = t17 + t7;
+    t0 = t12 + t3;
+    t5 = t1 + t8;
+    t10 = t14 - t2;
+    t19 = t1 - t8;
+    t15 = t14 + t2;
+    t16 = (-C104) * t4;
+    t11 = (-C105) * t0;
+    t18 = t16 + t11;
+    t9 = 0.09248264559196126 * t18;
+    y[293] = t9;
+    t6 = 0.025887393635767413 * t18;
+    y[426] = t6;
+    t13 = C105 * t4;
+    t17 = (-C104) * t0;
+    t7 = t13 + t17;
+    y[53] = 0;
+    t12 = (-0.09010699553406464) * t7;
+    y[186] = t12;
+    t3 = C106 * t5;
+    t1 = C107 * t10;
+    t8 = t3 + t1;
+    y[26] = 0;
+    t14 = (-0.09222390568483599) * t8;
+    y[213] = t14;
+    t2 = (-C107) * t5;
+    t16 = C106 * t10;
+    t11 = t2 + t16;
+    t9 = 0.09035979631801205 * t11;
+    y[266] = t9;
+    t18 = 0.006575394365350636 * t11;
+    y[453] = t18;
+    t6 = C108 * t19;
+    t4 = C109 * t15;
+    t0 = t6 + t4;
+    t13 = 0.03230032719820284 * t0;
+    y[106] = t13;
+    t17 = (-0.06103529695492163) * t0;
+    y[133] = t17;
+    t7 = (-C109) * t19;
+    t12 = C108 * t15;
+    t3 = t7 + t12;
+    t1 = 0.09455277460094863 * t3;
+    y[346] = t1;
+    t8 = 0.07932664712434352 * t3;
+    y[373] = t8;
+    t14 = re[6];
+    t5 = im[6];
+    t10 = re[46];
+    t2 = im[46];
+    t16 = re[86];
+    t9 = im[86];
+    t11 = t10 + t16;
+    t18 = t2 + t9;
+    t6 = C0 * t11;
+    t4 = t14 - t6;
+    t13 = C0 * t18;
+    t0 = t5 - t13;
+    t17 = t10 - t16;
+    t19 = C1 * t17;
+    t15 = t2 - t9;
+    t7 = C1 * t15;
+    t12 = t14 + t11;
+    t1 = t5 + t18;
+    t3 = t4 + t7;
+    t8 = t0 - t19;
+    t6 = t4 - t7;
+    t13 = t0 + t19;
+    t10 = C110 * t12;
+    t16 = C111 * t1;
+    t17 = t10 + t16;
+    t2 = 0.03444464662276709 * t17;
+    y[108] = t2;
+    t9 = (-0.05905961963485038) * t17;
+    y[131] = t9;
+    t15 = (-C111) * t12;
+    t14 = C110 * t1;
+    t11 = t15 + t14;
+    t5 = 0.0939083749348817 * t11;
+    y[348] = t5;
+    t18 = 0.0809165052461322 * t11;
+    y[371] = t18;
+    t4 = (-C112) * t3;
+    t7 = (-C113) * t8;
+    t0 = t4 + t7;
+    t19 = 0.09216884617272778 * t0;
+    y[291] = t19;
+    t10 = 0.024050868215834645 * t0;
+    y[428] = t10;
+    t16 = C113 * t3;
+    t2 = (-C112) * t8;
+    t17 = t16 + t2;
+    y[51] = 0;
+    t9 = (-0.09041377514606573) * t17;
+    y[188] = t9;
+    t12 = C114 * t6;
+    t1 = C115 * t13;
+    t15 = t12 + t1;
+    y[28] = 0;
+    t14 = (-0.0922052764660204) * t15;
+    y[211] = t14;
+    t5 = (-C115) * t6;
+    t11 = C114 * t13;
+    t18 = t5 + t11;
+    t4 = 0.09037805267472243 * t18;
+    y[268] = t4;
+    t7 = 0.007556979010194901 * t18;
+    y[451] = t7;
+    t19 = re[45];
+    t0 = im[45];
+    t10 = re[85];
+    t3 = im[85];
+    t8 = re[5];
+    t16 = im[5];
+    t2 = t10 + t8;
+    t17 = t3 + t16;
+    t9 = C0 * t2;
+    t12 = t19 - t9;
+    t1 = C0 * t17;
+    t15 = t0 - t1;
+    t14 = t10 - t8;
+    t6 = C1 * t14;
+    t13 = t3 - t16;
+    t5 = C1 * t13;
+    t11 = t19 + t2;
+    t4 = t0 + t17;
+    t18 = t12 + t5;
+    t7 = t15 - t6;
+    t9 = t12 - t5;
+    t1 = t15 + t6;
+    t10 = C116 * t11;
+    t8 = C117 * t4;
+    t14 = t10 + t8;
+    y[30] = 0;
+    t3 = (-0.09216764187038416) * t14;
+    y[209] = t3;
+    t16 = (-C117) * t11;
+    t13 = C116 * t4;
+    t19 = t16 + t13;
+    t2 = 0.09041495653162682 * t19;
+    y[270] = t2;
+    t0 = 0.008613919159637174 * t19;
+    y[449] = t0;
+    t17 = C118 * t18;
+    t12 = C119 * t7;
+    t5 = t17 + t12;
+    t15 = 0.036609401127679665 * t5;
+    y[110] = t15;
+    t6 = (-0.05703985780184589) * t5;
+    y[129] = t6;
+    t10 = (-C119) * t18;
+    t8 = C118 * t7;
+    t14 = t10 + t8;
+    t3 = 0.09318534435922614 * t14;
+    y[350] = t3;
+    t11 = 0.08243933112539109 * t14;
+    y[369] = t11;
+    t4 = (-C120) * t9;
+    t16 = (-C121) * t1;
+    t13 = t4 + t16;
+    t2 = 0.09188206022001336 * t13;
+    y[289] = t2;
+    t19 = 0.022269332380766 * t13;
+    y[430] = t19;
+    t0 = C121 * t9;
+    t17 = (-C120) * t1;
+    t12 = t0 + t17;
+    y[49] = 0;
+    t15 = (-0.09069597822881863) * t12;
+    y[190] = t15;
+    t5 = re[84];
+    t6 = im[84];
+    t18 = re[4];
+    t7 = im[4];
+    t10 = re[44];
+    t8 = im[44];
+    t3 = t18 + t10;
+    t14 = t7 + t8;
+    t11 = C0 * t3;
+    t4 = t5 - t11;
+    t16 = C0 * t14;
+    t2 = t6 - t16;
+    t13 = t18 - t10;
+    t19 = C1 * t13;
+    t9 = t7 - t8;
+    t1 = C1 * t9;
+    t0 = t5 + t3;
+    t17 = t6 + t14;
+    t12 = t4 + t1;
+    t15 = t2 - t19;
+    t11 = t4 - t1;
+    t16 = t2 + t19;
+    t18 = (-C122) * t0;
+    t10 = (-C123) * t17;
+    t13 = t18 + t10;
+    t7 = 0.09162207646476439 * t13;
+    y[287] = t7;
+    t8 = 0.020545864807539 * t13;
+    y[432] = t8;
+    t9 = C123 * t0;
+    t5 = (-C122) * t17;
+    t3 = t9 + t5;
+    y[47] = 0;
+    t6 = (-0.09095333411853122) * t3;
+    y[192] = t6;
+    t14 = C124 * t12;
+    t4 = C125 * t15;
+    t1 = t14 + t4;
+    y[32] = 0;
+    t2 = (-0.09210979792503068) * t1;
+    y[207] = t2;
+    t19 = (-C125) * t12;
+    t18 = C124 * t15;
+    t10 = t19 + t18;
+    t7 = 0.09047173613512795 * t10;
+    y[272] = t7;
+    t13 = 0.009746159098938015 * t10;
+    y[447] = t13;
+    t8 = C126 * t11;
+    t0 = C127 * t16;
+    t17 = t8 + t0;
+    t9 = 0.038788983266110494 * t17;
+    y[112] = t9;
+    t5 = (-0.05497902929043668) * t17;
+    y[127] = t5;
+    t3 = (-C127) * t11;
+    t6 = C126 * t16;
+    t14 = t3 + t6;
+    t4 = 0.09238500948779206 * t14;
+    y[352] = t4;
+    t1 = 0.08389225281782092 * t14;
+    y[367] = t1;
+    t2 = re[3];
+    t12 = im[3];
+    t15 = re[43];
+    t19 = im[43];
+    t18 = re[83];
+    t7 = im[83];
+    t10 = t15 + t18;
+    t13 = t19 + t7;
+    t8 = C0 * t10;
+    t0 = t2 - t8;
+    t9 = C0 * t13;
+    t17 = t12 - t9;
+    t5 = t15 - t18;
+    t11 = C1 * t5;
+    t16 = t19 - t7;
+    t3 = C1 * t16;
+    t6 = t2 + t10;
+    t4 = t12 + t13;
+    t14 = t0 + t3;
+    t1 = t17 - t11;
+    t8 = t0 - t3;
+    t9 = t17 + t11;
+    t15 = C128 * t6;
+    t18 = C129 * t4;
+    t5 = t15 + t18;
+    t19 = 0.040977048916637684 * t5;
+    y[114] = t19;
+    t7 = (-0.05288347175089571) * t5;
+    y[125] = t7;
+    t16 = (-C129) * t6;
+    t2 = C128 * t4;
+    t10 = t16 + t2;
+    t12 = 0.09150544220877038 * t10;
+    y[354] = t12;
+    t13 = 0.08527231603088634 * t10;
+    y[365] = t13;
+    t0 = (-C130) * t14;
+    t3 = (-C131) * t1;
+    t17 = t0 + t3;
+    t11 = 0.09138840410436003 * t17;
+    y[285] = t11;
+    t15 = 0.018883113189353255 * t17;
+    y[434] = t15;
+    t18 = C131 * t14;
+    t19 = (-C130) * t1;
+    t5 = t18 + t19;
+    y[45] = 0;
+    t7 = (-0.09118589404206212) * t5;
+    y[194] = t7;
+    t6 = C132 * t8;
+    t4 = C133 * t9;
+    t16 = t6 + t4;
+    y[34] = 0;
+    t2 = (-0.09203093361579481) * t16;
+    y[205] = t2;
+    t12 = (-C133) * t8;
+    t10 = C132 * t9;
+    t13 = t12 + t10;
+    t0 = 0.09054926431717872 * t13;
+    y[274] = t0;
+    t3 = 0.0109532114963038 * t13;
+    y[445] = t3;
+    t11 = re[42];
+    t17 = im[42];
+    t15 = re[82];
+    t14 = im[82];
+    t1 = re[2];
+    t18 = im[2];
+    t19 = t15 + t1;
+    t5 = t14 + t18;
+    t7 = C0 * t19;
+    t6 = t11 - t7;
+    t4 = C0 * t5;
+    t16 = t17 - t4;
+    t2 = t15 - t1;
+    t8 = C1 * t2;
+    t9 = t14 - t18;
+    t12 = C1 * t9;
+    t10 = t11 + t19;
+    t0 = t17 + t5;
+    t13 = t6 + t12;
+    t3 = t16 - t8;
+    t7 = t6 - t12;
+    t4 = t16 + t8;
+    t15 = C134 * t10;
+    t1 = C135 * t0;
+    t2 = t15 + t1;
+    y[36] = 0;
+    t14 = (-0.09193006721260147) * t2;
+    y[203] = t14;
+    t18 = (-C135) * t10;
+    t9 = C134 * t0;
+    t11 = t18 + t9;
+    t19 = 0.09064861569241872 * t11;
+    y[276] = t19;
+    t17 = 0.012234374072361744 * t11;
+    y[443] = t17;
+    t5 = C136 * t13;
+    t6 = C137 * t3;
+    t12 = t5 + t6;
+    t16 = 0.04316675485476704 * t12;
+    y[116] = t16;
+    t8 = (-0.05075903923035873) * t12;
+    y[123] = t8;
+    t15 = (-C137) * t13;
+    t1 = C136 * t3;
+    t2 = t15 + t1;
+    t14 = 0.09054639388396353 * t2;
+    y[356] = t14;
+    t10 = 0.08657786267658361 * t2;
+    y[363] = t10;
+    t0 = (-C138) * t7;
+    t18 = (-C139) * t4;
+    t9 = t0 + t18;
+    t19 = 0.09118069998138907 * t9;
+    y[283] = t19;
+    t11 = 0.017285605367722928 * t9;
+    y[436] = t11;
+    t17 = C139 * t7;
+    t5 = (-C138) * t4;
+    t6 = t17 + t5;
+    y[43] = 0;
+    t16 = (-0.09139360999678939) * t6;
+    y[196] = t16;
+    t12 = re[81];
+    t8 = im[81];
+    t13 = re[1];
+    t3 = im[1];
+    t15 = re[41];
+    t1 = im[41];
+    t14 = t13 + t15;
+    t2 = t3 + t1;
+    t10 = C0 * t14;
+    t0 = t12 - t10;
+    t18 = C0 * t2;
+    t19 = t8 - t18;
+    t9 = t13 - t15;
+    t11 = C1 * t9;
+    t7 = t3 - t1;
+    t4 = C1 * t7;
+    t17 = t12 + t14;
+    t5 = t8 + t2;
+    t6 = t0 + t4;
+    t16 = t19 - t11;
+    t10 = t0 - t4;
+    t18 = t19 + t11;
+    t13 = (-C140) * t17;
+    t15 = (-C141) * t5;
+    t9 = t13 + t15;
+    t3 = 0.09099823826755285 * t9;
+    y[281] = t3;
+    t1 = 0.015755155066487784 * t9;
+    y[438] = t1;
+    t7 = C141 * t17;
+    t12 = (-C140) * t5;
+    t14 = t7 + t12;
+    y[41] = 0;
+    t8 = (-0.09157686447546028) * t14;
+    y[198] = t8;
+    t2 = C142 * t6;
+    t0 = C143 * t16;
+    t4 = t2 + t0;
+    y[38] = 0;
+    t19 = (-0.09180640400425469) * t4;
+    y[201] = t19;
+    t11 = (-C143) * t6;
+    t13 = C142 * t16;
+    t15 = t11 + t13;
+    t3 = 0.09077071936013452 * t15;
+    y[278] = t3;
+    t9 = 0.013588742078380437 * t15;
+    y[441] = t9;
+    t1 = C144 * t10;
+    t17 = C145 * t18;
+    t5 = t1 + t17;
+    t7 = 0.045352447076883386 * t5;
+    y[118] = t7;
+    t12 = (-0.048609442933946125) * t5;
+    y[121] = t12;
+    t14 = (-C145) * t10;
+    t8 = C144 * t18;
+    t2 = t14 + t8;
+    t0 = 0.08950958151221271 * t2;
+    y[358] = t0;
+    t4 = 0.0878083255799443 * t2;
+    y[361] = t4;
+}
+
+//
+//  Public functions.
+//
+
+/**
+ *  Apply LD-IMDCT transform (prebuilt for window W75_240, input pruned).
+ * 
+ *  Note(s):
+ *    [1] y[n] = w[n] * SUM(X[k] * cos(PI / 240 * (n + 120.5) * (k + 0.5))), where
+ *        w[n] = sqrt(2 / 240) * W75_240[479 - n].
+ *    [2] X[k] shall be zero for all k >= 120 (not checked).
+ *    [3] The size of all arrays will not be checked.
+ * 
+ *  @param {Number[]} X 
+ *    - The input block (240 points, only the first 120 points are used).
+ *  @param {Number[]} y 
+ *    - The array that would contain the output block (480 points).
+ *  @param {Number[]} re 
+ *    - The scratch buffer (real part, 120 points).
+ *  @param {Number[]} im 
+ *    - The scratch buffer (imaginary part, 120 points).
+ */
+function ApplyWindowedIMDCT_W75_240_K120(X, y, re, im) {
+    ApplyWindowedIMDCT_W75_240_K120_Part1(X, y, re, im);
+    ApplyWindowedIMDCT_W75_240_K120_Part2(X, y, re, im);
+    ApplyWindowedIMDCT_W75_240_K120_Part3(X, y, re, im);
+}
+
+//  Export public APIs.
+module.exports = {
+    "ApplyWindowedIMDCT_W75_240_K120": ApplyWindowedIMDCT_W75_240_K120
+};
\ No newline at end of file
@@ -0,0 +1,5456 @@
+//
+//  Copyright 2021 - 2023 XiaoJSoft Studio. All rights reserved.
+//  Use of this source code is governed by a BSD-style license that can be
+//  found in the LICENSE.md file.
+//
+
+//
+//  Note(s):
+//    [1] This file is generated automatically by a MDCT compiler, which locates 
+//        at "./../../dev/mdct-generator/" directory.
+//        Do NOT modify this file manually.
+//
+
+//
+//  Private functions.
+//
+
+/**
+ *  Part 1 of ApplyWindowedIMDCT_W75_240_K60().
+ * 
+ *  @param {Number[]} X 
+ *    - The input block (240 points, only the first 60 points are used).
+ *  @param {Number[]} y 
+ *    - The array that would contain the output block (480 points).
+ *  @param {Number[]} re 
+ *    - The scratch buffer (real part, 120 points).
+ *  @param {Number[]} im 
+ *    - The scratch buffer (imaginary part, 120 points).
+ */
+function ApplyWindowedIMDCT_W75_240_K60_Part1(X, y, re, im) {
+    let t0, t1, t10, t11, t12, t13, t14, t15, t16, t17, t18, t2, t3, t4, t5, t6, t7, t8, t9;
+    const C0 = 0.9807852804032304;
+    const C1 = 0.19509032201612825;
+    const C2 = 0.7071067811865476;
+    const C3 = 0.9510565162951535;
+    const C4 = 0.3090169943749474;
+    const C5 = 0.9624552364536473;
+    const C6 = 0.27144044986507426;
+    const C7 = 0.996917333733128;
+    const C8 = 0.07845909572784494;
+    const C9 = 0.9930684569549263;
+    const C10 = 0.11753739745783764;
+    const C11 = 0.9381913359224842;
+    const C12 = 0.34611705707749296;
+    const C13 = 0.9876883405951378;
+    const C14 = 0.15643446504023087;
+    const C15 = 0.9992290362407229;
+    const C16 = 0.03925981575906861;
+    const C17 = 0.9723699203976766;
+    const C18 = 0.2334453638559054;
+    const C19 = 0.5590169943749475;
+    const C20 = 0.25;
+    const C21 = 0.5877852522924731;
+    t0 = X[0];
+    t1 = X[30];
+    t2 = C0 * t1;
+    t1 = (-C1) * t1;
+    t3 = X[59];
+    t4 = 0.9238795325112867 * t3;
+    t3 = 0.3826834323650898 * t3;
+    t5 = X[29];
+    t6 = C0 * t5;
+    t5 = C1 * t5;
+    t7 = t0 + t4;
+    t8 = t0 - t3;
+    t9 = t0 - t4;
+    t10 = -t3;
+    t0 = t0 + t3;
+    t11 = -t4;
+    t12 = t2 + t6;
+    t13 = t1 + t5;
+    t14 = t2 - t5;
+    t15 = t1 + t6;
+    t16 = t2 - t6;
+    t17 = t1 - t5;
+    t2 = t2 + t5;
+    t5 = t1 - t6;
+    t1 = t14 + t15;
+    t6 = t14 - t15;
+    t14 = C2 * t1;
+    t15 = (-C2) * t6;
+    t1 = t2 - t5;
+    t6 = t2 + t5;
+    t2 = (-C2) * t1;
+    t5 = (-C2) * t6;
+    t1 = t7 - t12;
+    t6 = t3 - t13;
+    t7 = t7 + t12;
+    t12 = t3 + t13;
+    t13 = t8 - t14;
+    t18 = t4 - t15;
+    t8 = t8 + t14;
+    t14 = t4 + t15;
+    t15 = t9 - t17;
+    t3 = t16 - t3;
+    t9 = t9 + t17;
+    t17 = t10 - t16;
+    t10 = t0 - t2;
+    t16 = t11 - t5;
+    t11 = t0 + t2;
+    t0 = t5 - t4;
+    re[0] = t7;
+    im[0] = t12;
+    re[15] = t8;
+    im[15] = t14;
+    re[30] = t9;
+    im[30] = t17;
+    re[45] = t11;
+    im[45] = t0;
+    re[60] = t1;
+    im[60] = t6;
+    re[75] = t13;
+    im[75] = t18;
+    re[90] = t15;
+    im[90] = t3;
+    re[105] = t10;
+    im[105] = t16;
+    t2 = X[48];
+    t5 = C3 * t2;
+    t4 = (-C4) * t2;
+    t7 = X[41];
+    t12 = C5 * t7;
+    t8 = C6 * t7;
+    t14 = X[11];
+    t9 = C7 * t14;
+    t17 = C8 * t14;
+    t11 = X[18];
+    t0 = C9 * t11;
+    t1 = (-C10) * t11;
+    t6 = t5 + t9;
+    t13 = t4 + t17;
+    t18 = t5 - t17;
+    t15 = t4 + t9;
+    t3 = t5 - t9;
+    t10 = t4 - t17;
+    t16 = t5 + t17;
+    t2 = t4 - t9;
+    t7 = -t12;
+    t14 = -t8;
+    t11 = t12 + t0;
+    t5 = t8 + t1;
+    t17 = t7 - t1;
+    t4 = t0 - t8;
+    t9 = t12 - t0;
+    t7 = t8 - t1;
+    t8 = t1 - t12;
+    t1 = t14 - t0;
+    t12 = t17 + t4;
+    t14 = t17 - t4;
+    t0 = C2 * t12;
+    t17 = (-C2) * t14;
+    t4 = t8 - t1;
+    t12 = t8 + t1;
+    t14 = (-C2) * t4;
+    t8 = (-C2) * t12;
+    t1 = t6 - t11;
+    t4 = t13 - t5;
+    t12 = t6 + t11;
+    t6 = t13 + t5;
+    t11 = t18 - t0;
+    t13 = t15 - t17;
+    t5 = t18 + t0;
+    t18 = t15 + t17;
+    t0 = t3 - t7;
+    t15 = t10 + t9;
+    t17 = t3 + t7;
+    t3 = t10 - t9;
+    t7 = t16 - t14;
+    t10 = t2 - t8;
+    t9 = t16 + t14;
+    t16 = t2 + t8;
+    re[24] = t12;
+    im[24] = t6;
+    re[39] = t5;
+    im[39] = t18;
+    re[54] = t17;
+    im[54] = t3;
+    re[69] = t9;
+    im[69] = t16;
+    re[84] = t1;
+    im[84] = t4;
+    re[99] = t11;
+    im[99] = t13;
+    re[114] = t0;
+    im[114] = t15;
+    re[9] = t7;
+    im[9] = t10;
+    t14 = X[53];
+    t2 = C11 * t14;
+    t8 = C12 * t14;
+    t12 = X[23];
+    t6 = C13 * t12;
+    t5 = C14 * t12;
+    t18 = X[6];
+    t17 = C15 * t18;
+    t3 = (-C16) * t18;
+    t9 = X[36];
+    t16 = C17 * t9;
+    t1 = (-C18) * t9;
+    t4 = -t6;
+    t11 = -t5;
+    t13 = t6 + t16;
+    t0 = t5 + t1;
+    t15 = t4 - t1;
+    t7 = t16 - t5;
+    t10 = t6 - t16;
+    t14 = t5 - t1;
+    t12 = t1 - t6;
+    t18 = t11 - t16;
+    t9 = -t17;
+    t4 = -t3;
+    t5 = t17 + t2;
+    t1 = t3 + t8;
+    t6 = t8 - t17;
+    t11 = t4 - t2;
+    t16 = t17 - t2;
+    t4 = t3 - t8;
+    t17 = t9 - t8;
+    t9 = t2 - t3;
+    t8 = t6 + t11;
+    t2 = t6 - t11;
+    t3 = C2 * t8;
+    t6 = (-C2) * t2;
+    t11 = t17 - t9;
+    t8 = t17 + t9;
+    t2 = (-C2) * t11;
+    t17 = (-C2) * t8;
+    t9 = t13 - t5;
+    t11 = t0 - t1;
+    t8 = t13 + t5;
+    t13 = t0 + t1;
+    t5 = t15 - t3;
+    t0 = t7 - t6;
+    t1 = t15 + t3;
+    t15 = t7 + t6;
+    t3 = t10 - t4;
+    t7 = t14 + t16;
+    t6 = t10 + t4;
+    t10 = t14 - t16;
+    t4 = t12 - t2;
+    t14 = t18 - t17;
+    t16 = t12 + t2;
+    t12 = t18 + t17;
+    re[48] = t8;
+    im[48] = t13;
+    re[63] = t1;
+    im[63] = t15;
+    re[78] = t6;
+    im[78] = t10;
+    re[93] = t16;
+    im[93] = t12;
+    re[108] = t9;
+    im[108] = t11;
+    re[3] = t5;
+    im[3] = t0;
+    re[18] = t3;
+    im[18] = t7;
+    re[33] = t4;
+    im[33] = t14;
+    t2 = X[35];
+    t18 = C17 * t2;
+    t17 = C18 * t2;
+    t8 = X[5];
+    t13 = C15 * t8;
+    t1 = C16 * t8;
+    t15 = X[24];
+    t6 = C13 * t15;
+    t10 = (-C14) * t15;
+    t16 = X[54];
+    t12 = C11 * t16;
+    t9 = (-C12) * t16;
+    t11 = -t6;
+    t5 = -t10;
+    t0 = t6 + t18;
+    t3 = t10 + t17;
+    t7 = t17 - t6;
+    t4 = t5 - t18;
+    t14 = t6 - t18;
+    t2 = t10 - t17;
+    t8 = t11 - t17;
+    t15 = t18 - t10;
+    t16 = -t12;
+    t5 = -t9;
+    t6 = t12 + t13;
+    t11 = t9 + t1;
+    t17 = t1 - t12;
+    t18 = t5 - t13;
+    t10 = t12 - t13;
+    t5 = t9 - t1;
+    t12 = t16 - t1;
+    t16 = t13 - t9;
+    t1 = t17 + t18;
+    t13 = t17 - t18;
+    t9 = C2 * t1;
+    t17 = (-C2) * t13;
+    t18 = t12 - t16;
+    t1 = t12 + t16;
+    t13 = (-C2) * t18;
+    t12 = (-C2) * t1;
+    t16 = t0 - t6;
+    t18 = t3 - t11;
+    t1 = t0 + t6;
+    t0 = t3 + t11;
+    t6 = t7 - t9;
+    t3 = t4 - t17;
+    t11 = t7 + t9;
+    t7 = t4 + t17;
+    t9 = t14 - t5;
+    t4 = t2 + t10;
+    t17 = t14 + t5;
+    t14 = t2 - t10;
+    t5 = t8 - t13;
+    t2 = t15 - t12;
+    t10 = t8 + t13;
+    t8 = t15 + t12;
+    re[72] = t1;
+    im[72] = t0;
+    re[87] = t11;
+    im[87] = t7;
+    re[102] = t17;
+    im[102] = t14;
+    re[117] = t10;
+    im[117] = t8;
+    re[12] = t16;
+    im[12] = t18;
+    re[27] = t6;
+    im[27] = t3;
+    re[42] = t9;
+    im[42] = t4;
+    re[57] = t5;
+    im[57] = t2;
+    t13 = X[47];
+    t15 = C3 * t13;
+    t12 = C4 * t13;
+    t1 = X[17];
+    t0 = C9 * t1;
+    t11 = C10 * t1;
+    t7 = X[12];
+    t17 = C7 * t7;
+    t14 = (-C8) * t7;
+    t10 = X[42];
+    t8 = C5 * t10;
+    t16 = (-C6) * t10;
+    t18 = t15 + t17;
+    t6 = t12 + t14;
+    t3 = t15 + t14;
+    t9 = t12 - t17;
+    t4 = t15 - t17;
+    t5 = t12 - t14;
+    t2 = t15 - t14;
+    t13 = t12 + t17;
+    t1 = t0 + t8;
+    t7 = t11 + t16;
+    t10 = t0 + t16;
+    t15 = t11 - t8;
+    t14 = t0 - t8;
+    t12 = t11 - t16;
+    t17 = t0 - t16;
+    t0 = t11 + t8;
+    t16 = t10 + t15;
+    t11 = t10 - t15;
+    t8 = C2 * t16;
+    t10 = (-C2) * t11;
+    t15 = t17 - t0;
+    t16 = t17 + t0;
+    t11 = (-C2) * t15;
+    t17 = (-C2) * t16;
+    t0 = t18 - t1;
+    t15 = t6 - t7;
+    t16 = t18 + t1;
+    t18 = t6 + t7;
+    t1 = t3 - t8;
+    t6 = t9 - t10;
+    t7 = t3 + t8;
+    t3 = t9 + t10;
+    t8 = t4 - t12;
+    t9 = t5 + t14;
+    t10 = t4 + t12;
+    t4 = t5 - t14;
+    t12 = t2 - t11;
+    t5 = t13 - t17;
+    t14 = t2 + t11;
+    t2 = t13 + t17;
+    re[96] = t16;
+    im[96] = t18;
+    re[111] = t7;
+    im[111] = t3;
+    re[6] = t10;
+    im[6] = t4;
+    re[21] = t14;
+    im[21] = t2;
+    re[36] = t0;
+    im[36] = t15;
+    re[51] = t1;
+    im[51] = t6;
+    re[66] = t8;
+    im[66] = t9;
+    re[81] = t12;
+    im[81] = t5;
+    t11 = re[0];
+    t13 = im[0];
+    t17 = re[24];
+    t16 = im[24];
+    t18 = re[48];
+    t7 = im[48];
+    t3 = re[72];
+    t10 = im[72];
+    t4 = re[96];
+    t14 = im[96];
+    t2 = t17 + t4;
+    t0 = t16 + t14;
+    t15 = t18 + t3;
+    t1 = t7 + t10;
+    t6 = t17 - t4;
+    t8 = t16 - t14;
+    t9 = t18 - t3;
+    t12 = t7 - t10;
+    t5 = t2 + t15;
+    t17 = t0 + t1;
+    t4 = t2 - t15;
+    t16 = C19 * t4;
+    t14 = t0 - t1;
+    t18 = C19 * t14;
+    t3 = C20 * t5;
+    t7 = t11 - t3;
+    t10 = C20 * t17;
+    t2 = t13 - t10;
+    t15 = t7 + t16;
+    t4 = t2 + t18;
+    t0 = t7 - t16;
+    t1 = t2 - t18;
+    t14 = C3 * t6;
+    t3 = C21 * t9;
+    t10 = t14 + t3;
+    t7 = C3 * t8;
+    t16 = C21 * t12;
+    t2 = t7 + t16;
+    t18 = C21 * t6;
+    t14 = C3 * t9;
+    t3 = t18 - t14;
+    t7 = C21 * t8;
+    t16 = C3 * t12;
+    t6 = t7 - t16;
+    t9 = t11 + t5;
+    t18 = t13 + t17;
+    t14 = t15 + t2;
+    t8 = t4 - t10;
+    t12 = t0 + t6;
+    t7 = t1 - t3;
+    t16 = t0 - t6;
+    t11 = t1 + t3;
+    t5 = t15 - t2;
+    t13 = t4 + t10;
+    re[0] = t9;
+    im[0] = t18;
+    re[24] = t14;
+    im[24] = t8;
+    re[48] = t12;
+    im[48] = t7;
+    re[72] = t16;
+    im[72] = t11;
+    re[96] = t5;
+    im[96] = t13;
+    t17 = re[15];
+    t0 = im[15];
+    t6 = re[39];
+    t1 = im[39];
+    t3 = re[63];
+    t15 = im[63];
+    t2 = re[87];
+    t4 = im[87];
+    t10 = re[111];
+    t9 = im[111];
+    t18 = t6 + t10;
+    t14 = t1 + t9;
+    t8 = t3 + t2;
+    t12 = t15 + t4;
+    t7 = t6 - t10;
+    t16 = t1 - t9;
+    t11 = t3 - t2;
+    t5 = t15 - t4;
+    t13 = t18 + t8;
+    t6 = t14 + t12;
+    t10 = t18 - t8;
+    t1 = C19 * t10;
+    t9 = t14 - t12;
+    t3 = C19 * t9;
+    t2 = C20 * t13;
+    t15 = t17 - t2;
+    t4 = C20 * t6;
+    t18 = t0 - t4;
+    t8 = t15 + t1;
+    t10 = t18 + t3;
+    t14 = t15 - t1;
+    t12 = t18 - t3;
+    t9 = C3 * t7;
+    t2 = C21 * t11;
+    t4 = t9 + t2;
+    t15 = C3 * t16;
+    t1 = C21 * t5;
+    t18 = t15 + t1;
+    t3 = C21 * t7;
+    t9 = C3 * t11;
+    t2 = t3 - t9;
+    t15 = C21 * t16;
+    t1 = C3 * t5;
+    t7 = t15 - t1;
+    t11 = t17 + t13;
+    t3 = t0 + t6;
+    t9 = t8 + t18;
+    t16 = t10 - t4;
+    t5 = t14 + t7;
+    t15 = t12 - t2;
+    t1 = t14 - t7;
+    t17 = t12 + t2;
+    t13 = t8 - t18;
+    t0 = t10 + t4;
+    re[15] = t11;
+    im[15] = t3;
+    re[39] = t9;
+    im[39] = t16;
+    re[63] = t5;
+    im[63] = t15;
+    re[87] = t1;
+    im[87] = t17;
+    re[111] = t13;
+    im[111] = t0;
+    t6 = re[30];
+    t14 = im[30];
+    t7 = re[54];
+    t12 = im[54];
+    t2 = re[78];
+    t8 = im[78];
+    t18 = re[102];
+    t10 = im[102];
+    t4 = re[6];
+    t11 = im[6];
+    t3 = t7 + t4;
+    t9 = t12 + t11;
+    t16 = t2 + t18;
+    t5 = t8 + t10;
+    t15 = t7 - t4;
+    t1 = t12 - t11;
+    t17 = t2 - t18;
+    t13 = t8 - t10;
+    t0 = t3 + t16;
+    t7 = t9 + t5;
+    t4 = t3 - t16;
+    t12 = C19 * t4;
+    t11 = t9 - t5;
+    t2 = C19 * t11;
+    t18 = C20 * t0;
+    t8 = t6 - t18;
+    t10 = C20 * t7;
+    t3 = t14 - t10;
+    t16 = t8 + t12;
+    t4 = t3 + t2;
+    t9 = t8 - t12;
+    t5 = t3 - t2;
+    t11 = C3 * t15;
+    t18 = C21 * t17;
+    t10 = t11 + t18;
+    t8 = C3 * t1;
+    t12 = C21 * t13;
+    t3 = t8 + t12;
+    t2 = C21 * t15;
+    t11 = C3 * t17;
+    t18 = t2 - t11;
+    t8 = C21 * t1;
+    t12 = C3 * t13;
+    t15 = t8 - t12;
+    t17 = t6 + t0;
+    t2 = t14 + t7;
+    t11 = t16 + t3;
+    t1 = t4 - t10;
+    t13 = t9 + t15;
+    t8 = t5 - t18;
+    t12 = t9 - t15;
+    t6 = t5 + t18;
+    t0 = t16 - t3;
+    t14 = t4 + t10;
+    re[30] = t17;
+    im[30] = t2;
+    re[54] = t11;
+    im[54] = t1;
+    re[78] = t13;
+    im[78] = t8;
+    re[102] = t12;
+    im[102] = t6;
+    re[6] = t0;
+    im[6] = t14;
+    t7 = re[45];
+    t9 = im[45];
+    t15 = re[69];
+    t5 = im[69];
+    t18 = re[93];
+    t16 = im[93];
+    t3 = re[117];
+    t4 = im[117];
+    t10 = re[21];
+    t17 = im[21];
+    t2 = t15 + t10;
+    t11 = t5 + t17;
+    t1 = t18 + t3;
+    t13 = t16 + t4;
+    t8 = t15 - t10;
+    t12 = t5 - t17;
+    t6 = t18 - t3;
+    t0 = t16 - t4;
+    t14 = t2 + t1;
+    t15 = t11 + t13;
+    t10 = t2 - t1;
+    t5 = C19 * t10;
+    t17 = t11 - t13;
+    t18 = C19 * t17;
+    t3 = C20 * t14;
+    t16 = t7 - t3;
+    t4 = C20 * t15;
+    t2 = t9 - t4;
+    t1 = t16 + t5;
+    t10 = t2 + t18;
+    t11 = t16 - t5;
+    t13 = t2 - t18;
+    t17 = C3 * t8;
+    t3 = C21 * t6;
+    t4 = t17 + t3;
+    t16 = C3 * t12;
+    t5 = C21 * t0;
+    t2 = t16 + t5;
+    t18 = C21 * t8;
+    t17 = C3 * t6;
+    t3 = t18 - t17;
+    t16 = C21 * t12;
+    t5 = C3 * t0;
+    t8 = t16 - t5;
+    t6 = t7 + t14;
+    t18 = t9 + t15;
+    t17 = t1 + t2;
+    t12 = t10 - t4;
+    t0 = t11 + t8;
+    t16 = t13 - t3;
+    t5 = t11 - t8;
+    t7 = t13 + t3;
+    t14 = t1 - t2;
+    t9 = t10 + t4;
+    re[45] = t6;
+    im[45] = t18;
+    re[69] = t17;
+    im[69] = t12;
+    re[93] = t0;
+    im[93] = t16;
+    re[117] = t5;
+    im[117] = t7;
+    re[21] = t14;
+    im[21] = t9;
+    t15 = re[60];
+    t11 = im[60];
+    t8 = re[84];
+    t13 = im[84];
+    t3 = re[108];
+    t1 = im[108];
+    t2 = re[12];
+    t10 = im[12];
+    t4 = re[36];
+    t6 = im[36];
+    t18 = t8 + t4;
+    t17 = t13 + t6;
+    t12 = t3 + t2;
+    t0 = t1 + t10;
+    t16 = t8 - t4;
+    t5 = t13 - t6;
+    t7 = t3 - t2;
+    t14 = t1 - t10;
+    t9 = t18 + t12;
+    t8 = t17 + t0;
+    t4 = t18 - t12;
+    t13 = C19 * t4;
+    t6 = t17 - t0;
+    t3 = C19 * t6;
+    t2 = C20 * t9;
+    t1 = t15 - t2;
+    t10 = C20 * t8;
+    t18 = t11 - t10;
+    t12 = t1 + t13;
+    t4 = t18 + t3;
+    t17 = t1 - t13;
+    t0 = t18 - t3;
+    t6 = C3 * t16;
+    t2 = C21 * t7;
+    t10 = t6 + t2;
+    t1 = C3 * t5;
+    t13 = C21 * t14;
+    t18 = t1 + t13;
+    t3 = C21 * t16;
+    t6 = C3 * t7;
+    t2 = t3 - t6;
+    t1 = C21 * t5;
+    t13 = C3 * t14;
+    t16 = t1 - t13;
+    t7 = t15 + t9;
+    t3 = t11 + t8;
+    t6 = t12 + t18;
+    t5 = t4 - t10;
+    t14 = t17 + t16;
+    t1 = t0 - t2;
+    t13 = t17 - t16;
+    t15 = t0 + t2;
+    t9 = t12 - t18;
+    t11 = t4 + t10;
+    re[60] = t7;
+    im[60] = t3;
+    re[84] = t6;
+    im[84] = t5;
+    re[108] = t14;
+    im[108] = t1;
+    re[12] = t13;
+    im[12] = t15;
+    re[36] = t9;
+    im[36] = t11;
+    t8 = re[75];
+    t17 = im[75];
+    t16 = re[99];
+    t0 = im[99];
+    t2 = re[3];
+    t12 = im[3];
+    t18 = re[27];
+    t4 = im[27];
+    t10 = re[51];
+    t7 = im[51];
+    t3 = t16 + t10;
+    t6 = t0 + t7;
+    t5 = t2 + t18;
+    t14 = t12 + t4;
+    t1 = t16 - t10;
+    t13 = t0 - t7;
+    t15 = t2 - t18;
+    t9 = t12 - t4;
+    t11 = t3 + t5;
+    t16 = t6 + t14;
+    t10 = t3 - t5;
+    t0 = C19 * t10;
+    t7 = t6 - t14;
+    t2 = C19 * t7;
+    t18 = C20 * t11;
+    t12 = t8 - t18;
+    t4 = C20 * t16;
+    t3 = t17 - t4;
+    t5 = t12 + t0;
+    t10 = t3 + t2;
+    t6 = t12 - t0;
+    t14 = t3 - t2;
+    t7 = C3 * t1;
+    t18 = C21 * t15;
+    t4 = t7 + t18;
+    t12 = C3 * t13;
+    t0 = C21 * t9;
+    t3 = t12 + t0;
+    t2 = C21 * t1;
+    t7 = C3 * t15;
+    t18 = t2 - t7;
+    t12 = C21 * t13;
+    t0 = C3 * t9;
+    t1 = t12 - t0;
+    t15 = t8 + t11;
+    t2 = t17 + t16;
+    t7 = t5 + t3;
+    t13 = t10 - t4;
+    t9 = t6 + t1;
+    t12 = t14 - t18;
+    t0 = t6 - t1;
+    t8 = t14 + t18;
+    t11 = t5 - t3;
+    t17 = t10 + t4;
+    re[75] = t15;
+    im[75] = t2;
+    re[99] = t7;
+    im[99] = t13;
+    re[3] = t9;
+    im[3] = t12;
+    re[27] = t0;
+    im[27] = t8;
+    re[51] = t11;
+    im[51] = t17;
+    t16 = re[90];
+    t6 = im[90];
+    t1 = re[114];
+    t14 = im[114];
+    t18 = re[18];
+    t5 = im[18];
+    t3 = re[42];
+    t10 = im[42];
+    t4 = re[66];
+    t15 = im[66];
+    t2 = t1 + t4;
+    t7 = t14 + t15;
+    t13 = t18 + t3;
+    t9 = t5 + t10;
+    t12 = t1 - t4;
+    t0 = t14 - t15;
+    t8 = t18 - t3;
+    t11 = t5 - t10;
+    t17 = t2 + t13;
+    t1 = t7 + t9;
+    t4 = t2 - t13;
+    t14 = C19 * t4;
+    t15 = t7 - t9;
+    t18 = C19 * t15;
+    t3 = C20 * t17;
+    t5 = t16 - t3;
+    t10 = C20 * t1;
+    t2 = t6 - t10;
+    t13 = t5 + t14;
+    t4 = t2 + t18;
+    t7 = t5 - t14;
+    t9 = t2 - t18;
+    t15 = C3 * t12;
+    t3 = C21 * t8;
+    t10 = t15 + t3;
+    t5 = C3 * t0;
+    t14 = C21 * t11;
+    t2 = t5 + t14;
+    t18 = C21 * t12;
+    t15 = C3 * t8;
+    t3 = t18 - t15;
+    t5 = C21 * t0;
+    t14 = C3 * t11;
+    t12 = t5 - t14;
+    t8 = t16 + t17;
+    t18 = t6 + t1;
+    t15 = t13 + t2;
+    t0 = t4 - t10;
+    t11 = t7 + t12;
+    t5 = t9 - t3;
+    t14 = t7 - t12;
+    t16 = t9 + t3;
+    t17 = t13 - t2;
+    t6 = t4 + t10;
+    re[90] = t8;
+    im[90] = t18;
+    re[114] = t15;
+    im[114] = t0;
+    re[18] = t11;
+    im[18] = t5;
+    re[42] = t14;
+    im[42] = t16;
+    re[66] = t17;
+    im[66] = t6;
+    t1 = re[105];
+    t7 = im[105];
+    t12 = re[9];
+    t9 = im[9];
+    t3 = re[33];
+    t13 = im[33];
+    t2 = re[57];
+    t4 = im[57];
+    t10 = re[81];
+    t8 = im[81];
+    t18 = t12 + t10;
+    t15 = t9 + t8;
+    t0 = t3 + t2;
+    t11 = t13 + t4;
+    t5 = t12 - t10;
+    t14 = t9 - t8;
+    t16 = t3 - t2;
+    t17 = t13 - t4;
+    t6 = t18 + t0;
+    t12 = t15 + t11;
+    t10 = t18 - t0;
+    t9 = C19 * t10;
+    t8 = t15 - t11;
+    t3 = C19 * t8;
+    t2 = C20 * t6;
+    t13 = t1 - t2;
+    t4 = C20 * t12;
+    t18 = t7 - t4;
+    t0 = t13 + t9;
+    t10 = t18 + t3;
+    t15 = t13 - t9;
+    t11 = t18 - t3;
+    t8 = C3 * t5;
+    t2 = C21 * t16;
+    t4 = t8 + t2;
+    t13 = C3 * t14;
+    t9 = C21 * t17;
+    t18 = t13 + t9;
+    t3 = C21 * t5;
+    t8 = C3 * t16;
+    t2 = t3 - t8;
+    t13 = C21 * t14;
+    t9 = C3 * t17;
+    t5 = t13 - t9;
+    t16 = t1 + t6;
+    t3 = t7 + t12;
+    t8 = t0 + t18;
+    t14 = t10 - t4;
+    t17 = t15 + t5;
+    t13 = t11 - t2;
+    t9 = t15 - t5;
+    t1 = t11 + t2;
+    t6 = t0 - t18;
+    t7 = t10 + t4;
+    re[105] = t16;
+    im[105] = t3;
+    re[9] = t8;
+    im[9] = t14;
+    re[33] = t17;
+    im[33] = t13;
+    re[57] = t9;
+    im[57] = t1;
+    re[81] = t6;
+    im[81] = t7;
+    t12 = X[39];
+    t15 = 0.9659258262890683 * t12;
+    t5 = 0.25881904510252074 * t12;
+    t11 = X[9];
+    t2 = 0.9978589232386035 * t11;
+    t0 = 0.06540312923014306 * t11;
+    t18 = X[20];
+    t10 = 0.9914448613738104 * t18;
+    t4 = (-0.13052619222005157) * t18;
+    t16 = X[50];
+    t3 = 0.9469301294951057 * t16;
+    t8 = (-0.3214394653031616) * t16;
+    t14 = -t15;
+    t17 = -t5;
+    t13 = t15 + t10;
+    t9 = t5 + t4;
+    t1 = t14 - t4;
+    t6 = t10 - t5;
+    t7 = t15 - t10;
+    t12 = t5 - t4;
+    t11 = t4 - t15;
+    t18 = t17 - t10;
+    t16 = -t2;
+    t14 = -t0;
+    t5 = t2 + t3;
+    t4 = t0 + t8;
+    t15 = t16 - t8;
+    t17 = t3 - t0;
+    t10 = t2 - t3;
+    t16 = t0 - t8;
+    t0 = t8 - t2;
+    t8 = t14 - t3;
+    t2 = t15 + t17;
+    t14 = t15 - t17;
+    t3 = C2 * t2;
+    t15 = (-C2) * t14;
+    t17 = t0 - t8;
+    t2 = t0 + t8;
+    t14 = (-C2) * t17;
+    t0 = (-C2) * t2;
+    t8 = t13 - t5;
+    t17 = t9 - t4;
+    t2 = t13 + t5;
+    t13 = t9 + t4;
+    t5 = t1 - t3;
+    t9 = t6 - t15;
+    t4 = t1 + t3;
+    t1 = t6 + t15;
+    t3 = t7 - t16;
+    t6 = t12 + t10;
+    t15 = t7 + t16;
+    t7 = t12 - t10;
+    t16 = t11 - t14;
+    t12 = t18 - t0;
+    t10 = t11 + t14;
+    t11 = t18 + t0;
+    re[40] = t2;
+    im[40] = t13;
+    re[55] = t4;
+    im[55] = t1;
+    re[70] = t15;
+    im[70] = t7;
+    re[85] = t10;
+    im[85] = t11;
+    re[100] = t8;
+    im[100] = t17;
+    re[115] = t5;
+    im[115] = t9;
+    re[10] = t3;
+    im[10] = t6;
+    re[25] = t16;
+    im[25] = t12;
+    t14 = X[51];
+    t18 = 0.9426414910921784 * t14;
+    t0 = 0.33380685923377096 * t14;
+    t2 = X[21];
+    t13 = 0.9896513868196702 * t2;
+    t4 = 0.1434926219911793 * t2;
+    t1 = X[8];
+    t15 = 0.9986295347545738 * t1;
+    t7 = (-0.05233595624294383) * t1;
+    t10 = X[38];
+    t11 = 0.9692309097067544 * t10;
+    t8 = (-0.24615329302899303) * t10;
+    t17 = -t15;
+    t5 = -t7;
+    t9 = t15 + t18;
+    t3 = t7 + t0;
+    t6 = t0 - t15;
+    t16 = t5 - t18;
+    t12 = t15 - t18;
+    t14 = t7 - t0;
+    t2 = t17 - t0;
+    t1 = t18 - t7;
+    t10 = -t11;
+    t5 = -t8;
+    t15 = t11 + t13;
+    t17 = t8 + t4;
+    t0 = t4 - t11;
+    t18 = t5 - t13;
+    t7 = t11 - t13;
+    t5 = t8 - t4;
+    t11 = t10 - t4;
+    t10 = t13 - t8;
+    t4 = t0 + t18;
+    t13 = t0 - t18;
+    t8 = C2 * t4;
+    t0 = (-C2) * t13;
+    t18 = t11 - t10;
+    t4 = t11 + t10;
+    t13 = (-C2) * t18;
+    t11 = (-C2) * t4;
+    t10 = t9 - t15;
+    t18 = t3 - t17;
+    t4 = t9 + t15;
+    t9 = t3 + t17;
+    t15 = t6 - t8;
+    t3 = t16 - t0;
+    t17 = t6 + t8;
+    t6 = t16 + t0;
+    t8 = t12 - t5;
+    t16 = t14 + t7;
+    t0 = t12 + t5;
+    t12 = t14 - t7;
+    t5 = t2 - t13;
+    t14 = t1 - t11;
+    t7 = t2 + t13;
+    t2 = t1 + t11;
+    re[64] = t4;
+    im[64] = t9;
+    re[79] = t17;
+    im[79] = t6;
+    re[94] = t0;
+    im[94] = t12;
+    re[109] = t7;
+    im[109] = t2;
+    re[4] = t10;
+    im[4] = t18;
+    re[19] = t15;
+    im[19] = t3;
+    re[34] = t8;
+    im[34] = t16;
+    re[49] = t5;
+    im[49] = t14;
+    t13 = X[33];
+    t1 = 0.9753423205085127 * t13;
+    t11 = 0.22069743502150108 * t13;
+    t4 = X[3];
+    t9 = 0.9996573249755573 * t4;
+    t17 = 0.02617694830787315 * t4;
+    t6 = X[26];
+    t0 = 0.9855560590580777 * t6;
+    t12 = (-0.1693495038490246) * t6;
+    t7 = X[56];
+    t2 = 0.9335804264972017 * t7;
+    t10 = (-0.35836794954530027) * t7;
+    t18 = -t2;
+    t15 = -t10;
+    t3 = t2 + t9;
+    t8 = t10 + t17;
+    t16 = t17 - t2;
+    t5 = t15 - t9;
+    t14 = t2 - t9;
+    t13 = t10 - t17;
+    t4 = t18 - t17;
+    t6 = t9 - t10;
+    t7 = t1 + t0;
+    t15 = t11 + t12;
+    t2 = t1 + t12;
+    t18 = t11 - t0;
+    t17 = t1 - t0;
+    t9 = t11 - t12;
+    t10 = t1 - t12;
+    t1 = t11 + t0;
+    t12 = t2 + t18;
+    t11 = t2 - t18;
+    t0 = C2 * t12;
+    t2 = (-C2) * t11;
+    t18 = t10 - t1;
+    t12 = t10 + t1;
+    t11 = (-C2) * t18;
+    t10 = (-C2) * t12;
+    t1 = t3 - t7;
+    t18 = t8 - t15;
+    t12 = t3 + t7;
+    t3 = t8 + t15;
+    t7 = t16 - t0;
+    t8 = t5 - t2;
+    t15 = t16 + t0;
+    t16 = t5 + t2;
+    t0 = t14 - t9;
+    t5 = t13 + t17;
+    t2 = t14 + t9;
+    t14 = t13 - t17;
+    t9 = t4 - t11;
+    t13 = t6 - t10;
+    t17 = t4 + t11;
+    t4 = t6 + t10;
+    re[88] = t12;
+    im[88] = t3;
+    re[103] = t15;
+    im[103] = t16;
+    re[118] = t2;
+    im[118] = t14;
+    re[13] = t17;
+    im[13] = t4;
+    re[28] = t1;
+    im[28] = t18;
+    re[43] = t7;
+    im[43] = t8;
+    re[58] = t0;
+    im[58] = t5;
+    re[73] = t9;
+    im[73] = t13;
+    t11 = X[15];
+    t6 = 0.9945218953682733 * t11;
+    t10 = 0.10452846326765346 * t11;
+    t12 = X[14];
+    t3 = 0.9958049275746618 * t12;
+    t15 = (-0.09150161866340238) * t12;
+    t16 = X[44];
+    t2 = 0.958819734868193 * t16;
+    t14 = (-0.2840153447039226) * t16;
+    t17 = X[45];
+    t4 = 0.9550199444571866 * t17;
+    t1 = 0.296541574975571 * t17;
+    t18 = t6 + t2;
+    t7 = t10 + t14;
+    t8 = t6 + t14;
+    t0 = t10 - t2;
+    t5 = t6 - t2;
+    t9 = t10 - t14;
+    t13 = t6 - t14;
+    t11 = t10 + t2;
+    t12 = t3 + t4;
+    t16 = t15 + t1;
+    t17 = t3 - t1;
+    t6 = t15 + t4;
+    t14 = t3 - t4;
+    t10 = t15 - t1;
+    t2 = t3 + t1;
+    t3 = t15 - t4;
+    t1 = t17 + t6;
+    t15 = t17 - t6;
+    t4 = C2 * t1;
+    t17 = (-C2) * t15;
+    t6 = t2 - t3;
+    t1 = t2 + t3;
+    t15 = (-C2) * t6;
+    t2 = (-C2) * t1;
+    t3 = t18 - t12;
+    t6 = t7 - t16;
+    t1 = t18 + t12;
+    t18 = t7 + t16;
+    t12 = t8 - t4;
+    t7 = t0 - t17;
+    t16 = t8 + t4;
+    t8 = t0 + t17;
+    t4 = t5 - t10;
+    t0 = t9 + t14;
+    t17 = t5 + t10;
+    t5 = t9 - t14;
+    t10 = t13 - t15;
+    t9 = t11 - t2;
+    t14 = t13 + t15;
+    t13 = t11 + t2;
+    re[112] = t1;
+    im[112] = t18;
+    re[7] = t16;
+    im[7] = t8;
+    re[22] = t17;
+    im[22] = t5;
+    re[37] = t14;
+    im[37] = t13;
+    re[52] = t3;
+    im[52] = t6;
+    re[67] = t12;
+    im[67] = t7;
+    re[82] = t4;
+    im[82] = t0;
+    re[97] = t10;
+    im[97] = t9;
+    t15 = X[32];
+    t11 = 0.9781476007338057 * t15;
+    t2 = (-0.20791169081775931) * t15;
+    t1 = X[57];
+    t18 = 0.9288095528719242 * t1;
+    t16 = 0.3705574375098362 * t1;
+    t8 = X[27];
+    t17 = 0.9832549075639546 * t8;
+    t5 = 0.18223552549214747 * t8;
+    t14 = X[2];
+    t13 = 0.999914327574007 * t14;
+    t3 = (-0.01308959557134444) * t14;
+    t6 = t11 + t17;
+    t12 = t2 + t5;
+    t7 = t11 - t5;
+    t4 = t2 + t17;
+    t0 = t11 - t17;
+    t10 = t2 - t5;
+    t9 = t11 + t5;
+    t15 = t2 - t17;
+    t1 = -t18;
+    t8 = -t16;
+    t14 = t18 + t13;
+    t11 = t16 + t3;
+    t5 = t1 - t3;
+    t2 = t13 - t16;
+    t17 = t18 - t13;
+    t1 = t16 - t3;
+    t16 = t3 - t18;
+    t3 = t8 - t13;
+    t18 = t5 + t2;
+    t8 = t5 - t2;
+    t13 = C2 * t18;
+    t5 = (-C2) * t8;
+    t2 = t16 - t3;
+    t18 = t16 + t3;
+    t8 = (-C2) * t2;
+    t16 = (-C2) * t18;
+    t3 = t6 - t14;
+    t2 = t12 - t11;
+    t18 = t6 + t14;
+    t6 = t12 + t11;
+    t14 = t7 - t13;
+    t12 = t4 - t5;
+    t11 = t7 + t13;
+    t7 = t4 + t5;
+    t13 = t0 - t1;
+    t4 = t10 + t17;
+    t5 = t0 + t1;
+    t0 = t10 - t17;
+    t1 = t9 - t8;
+    t10 = t15 - t16;
+    t17 = t9 + t8;
+    t9 = t15 + t16;
+    re[16] = t18;
+    im[16] = t6;
+    re[31] = t11;
+    im[31] = t7;
+    re[46] = t5;
+    im[46] = t0;
+    re[61] = t17;
+    im[61] = t9;
+    re[76] = t3;
+    im[76] = t2;
+    re[91] = t14;
+    im[91] = t12;
+    re[106] = t13;
+    im[106] = t4;
+    re[1] = t1;
+    im[1] = t10;
+    t8 = re[40];
+    t15 = im[40];
+    t16 = re[64];
+    t18 = im[64];
+    t6 = re[88];
+    t11 = im[88];
+    t7 = re[112];
+    t5 = im[112];
+    t0 = re[16];
+    t17 = im[16];
+    t9 = t16 + t0;
+    t3 = t18 + t17;
+    t2 = t6 + t7;
+    t14 = t11 + t5;
+    t12 = t16 - t0;
+    t13 = t18 - t17;
+    t4 = t6 - t7;
+    t1 = t11 - t5;
+    t10 = t9 + t2;
+    t16 = t3 + t14;
+    t0 = t9 - t2;
+    t18 = C19 * t0;
+    t17 = t3 - t14;
+    t6 = C19 * t17;
+    t7 = C20 * t10;
+    t11 = t8 - t7;
+    t5 = C20 * t16;
+    t9 = t15 - t5;
+    t2 = t11 + t18;
+    t0 = t9 + t6;
+    t3 = t11 - t18;
+    t14 = t9 - t6;
+    t17 = C3 * t12;
+    t7 = C21 * t4;
+    t5 = t17 + t7;
+    t11 = C3 * t13;
+    t18 = C21 * t1;
+    t9 = t11 + t18;
+    t6 = C21 * t12;
+    t17 = C3 * t4;
+    t7 = t6 - t17;
+    t11 = C21 * t13;
+    t18 = C3 * t1;
+    t12 = t11 - t18;
+    t4 = t8 + t10;
+    t6 = t15 + t16;
+    t17 = t2 + t9;
+    t13 = t0 - t5;
+    t1 = t3 + t12;
+    t11 = t14 - t7;
+    t18 = t3 - t12;
+    t8 = t14 + t7;
+    t10 = t2 - t9;
+    t15 = t0 + t5;
+    re[40] = t4;
+    im[40] = t6;
+    re[64] = t17;
+    im[64] = t13;
+    re[88] = t1;
+    im[88] = t11;
+    re[112] = t18;
+    im[112] = t8;
+    re[16] = t10;
+    im[16] = t15;
+    t16 = re[55];
+    t3 = im[55];
+    t12 = re[79];
+    t14 = im[79];
+    t7 = re[103];
+    t2 = im[103];
+    t9 = re[7];
+    t0 = im[7];
+    t5 = re[31];
+    t4 = im[31];
+    t6 = t12 + t5;
+    t17 = t14 + t4;
+    t13 = t7 + t9;
+    t1 = t2 + t0;
+    t11 = t12 - t5;
+    t18 = t14 - t4;
+    t8 = t7 - t9;
+    t10 = t2 - t0;
+    t15 = t6 + t13;
+    t12 = t17 + t1;
+    t5 = t6 - t13;
+    t14 = C19 * t5;
+    t4 = t17 - t1;
+    t7 = C19 * t4;
+    t9 = C20 * t15;
+    t2 = t16 - t9;
+    t0 = C20 * t12;
+    t6 = t3 - t0;
+    t13 = t2 + t14;
+    t5 = t6 + t7;
+    t17 = t2 - t14;
+    t1 = t6 - t7;
+    t4 = C3 * t11;
+    t9 = C21 * t8;
+    t0 = t4 + t9;
+    t2 = C3 * t18;
+    t14 = C21 * t10;
+    t6 = t2 + t14;
+    t7 = C21 * t11;
+    t4 = C3 * t8;
+    t9 = t7 - t4;
+    t2 = C21 * t18;
+    t14 = C3 * t10;
+    t11 = t2 - t14;
+    t8 = t16 + t15;
+    t7 = t3 + t12;
+    t4 = t13 + t6;
+    t18 = t5 - t0;
+    t10 = t17 + t11;
+    t2 = t1 - t9;
+    t14 = t17 - t11;
+    t16 = t1 + t9;
+    t15 = t13 - t6;
+    t3 = t5 + t0;
+    re[55] = t8;
+    im[55] = t7;
+    re[79] = t4;
+    im[79] = t18;
+    re[103] = t10;
+    im[103] = t2;
+    re[7] = t14;
+    im[7] = t16;
+    re[31] = t15;
+    im[31] = t3;
+    t12 = re[70];
+    t17 = im[70];
+    t11 = re[94];
+    t1 = im[94];
+    t9 = re[118];
+    t13 = im[118];
+    t6 = re[22];
+    t5 = im[22];
+    t0 = re[46];
+    t8 = im[46];
+    t7 = t11 + t0;
+    t4 = t1 + t8;
+    t18 = t9 + t6;
+    t10 = t13 + t5;
+    t2 = t11 - t0;
+    t14 = t1 - t8;
+    t16 = t9 - t6;
+    t15 = t13 - t5;
+    t3 = t7 + t18;
+    t11 = t4 + t10;
+    t0 = t7 - t18;
+    t1 = C19 * t0;
+    t8 = t4 - t10;
+    t9 = C19 * t8;
+    t6 = C20 * t3;
+    t13 = t12 - t6;
+    t5 = C20 * t11;
+    t7 = t17 - t5;
+    t18 = t13 + t1;
+    t0 = t7 + t9;
+    t4 = t13 - t1;
+    t10 = t7 - t9;
+    t8 = C3 * t2;
+    t6 = C21 * t16;
+    t5 = t8 + t6;
+    t13 = C3 * t14;
+    t1 = C21 * t15;
+    t7 = t13 + t1;
+    t9 = C21 * t2;
+    t8 = C3 * t16;
+    t6 = t9 - t8;
+    t13 = C21 * t14;
+    t1 = C3 * t15;
+    t2 = t13 - t1;
+    t16 = t12 + t3;
+    t9 = t17 + t11;
+    t8 = t18 + t7;
+    t14 = t0 - t5;
+    t15 = t4 + t2;
+    t13 = t10 - t6;
+    t1 = t4 - t2;
+    t12 = t10 + t6;
+    t3 = t18 - t7;
+    t17 = t0 + t5;
+    re[70] = t16;
+    im[70] = t9;
+    re[94] = t8;
+    im[94] = t14;
+    re[118] = t15;
+    im[118] = t13;
+    re[22] = t1;
+    im[22] = t12;
+    re[46] = t3;
+    im[46] = t17;
+    t11 = re[85];
+    t4 = im[85];
+    t2 = re[109];
+    t10 = im[109];
+    t6 = re[13];
+    t18 = im[13];
+    t7 = re[37];
+    t0 = im[37];
+    t5 = re[61];
+    t16 = im[61];
+    t9 = t2 + t5;
+    t8 = t10 + t16;
+    t14 = t6 + t7;
+    t15 = t18 + t0;
+    t13 = t2 - t5;
+    t1 = t10 - t16;
+    t12 = t6 - t7;
+    t3 = t18 - t0;
+    t17 = t9 + t14;
+    t2 = t8 + t15;
+    t5 = t9 - t14;
+    t10 = C19 * t5;
+    t16 = t8 - t15;
+    t6 = C19 * t16;
+    t7 = C20 * t17;
+    t18 = t11 - t7;
+    t0 = C20 * t2;
+    t9 = t4 - t0;
+    t14 = t18 + t10;
+    t5 = t9 + t6;
+    t8 = t18 - t10;
+    t15 = t9 - t6;
+    t16 = C3 * t13;
+    t7 = C21 * t12;
+    t0 = t16 + t7;
+    t18 = C3 * t1;
+    t10 = C21 * t3;
+    t9 = t18 + t10;
+    t6 = C21 * t13;
+    t16 = C3 * t12;
+    t7 = t6 - t16;
+    t18 = C21 * t1;
+    t10 = C3 * t3;
+    t13 = t18 - t10;
+    t12 = t11 + t17;
+    t6 = t4 + t2;
+    t16 = t14 + t9;
+    t1 = t5 - t0;
+    t3 = t8 + t13;
+    t18 = t15 - t7;
+    t10 = t8 - t13;
+    t11 = t15 + t7;
+    t17 = t14 - t9;
+    t4 = t5 + t0;
+    re[85] = t12;
+    im[85] = t6;
+    re[109] = t16;
+    im[109] = t1;
+    re[13] = t3;
+    im[13] = t18;
+    re[37] = t10;
+    im[37] = t11;
+    re[61] = t17;
+    im[61] = t4;
+    t2 = re[100];
+    t8 = im[100];
+    t13 = re[4];
+    t15 = im[4];
+    t7 = re[28];
+    t14 = im[28];
+    t9 = re[52];
+    t5 = im[52];
+    t0 = re[76];
+    t12 = im[76];
+    t6 = t13 + t0;
+    t16 = t15 + t12;
+    t1 = t7 + t9;
+    t3 = t14 + t5;
+    t18 = t13 - t0;
+    t10 = t15 - t12;
+    t11 = t7 - t9;
+    t17 = t14 - t5;
+    t4 = t6 + t1;
+    t13 = t16 + t3;
+    t0 = t6 - t1;
+    t15 = C19 * t0;
+    t12 = t16 - t3;
+    t7 = C19 * t12;
+    t9 = C20 * t4;
+    t14 = t2 - t9;
+    t5 = C20 * t13;
+    t6 = t8 - t5;
+    t1 = t14 + t15;
+    t0 = t6 + t7;
+    t16 = t14 - t15;
+    t3 = t6 - t7;
+    t12 = C3 * t18;
+    t9 = C21 * t11;
+    t5 = t12 + t9;
+    t14 = C3 * t10;
+    t15 = C21 * t17;
+    t6 = t14 + t15;
+    t7 = C21 * t18;
+    t12 = C3 * t11;
+    t9 = t7 - t12;
+    t14 = C21 * t10;
+    t15 = C3 * t17;
+    t18 = t14 - t15;
+    t11 = t2 + t4;
+    t7 = t8 + t13;
+    t12 = t1 + t6;
+    t10 = t0 - t5;
+    t17 = t16 + t18;
+    t14 = t3 - t9;
+    t15 = t16 - t18;
+    t2 = t3 + t9;
+    t4 = t1 - t6;
+    t8 = t0 + t5;
+    re[100] = t11;
+    im[100] = t7;
+    re[4] = t12;
+    im[4] = t10;
+    re[28] = t17;
+    im[28] = t14;
+    re[52] = t15;
+    im[52] = t2;
+    re[76] = t4;
+    im[76] = t8;
+    t13 = re[115];
+    t16 = im[115];
+    t18 = re[19];
+    t3 = im[19];
+    t9 = re[43];
+    t1 = im[43];
+    t6 = re[67];
+    t0 = im[67];
+    t5 = re[91];
+    t11 = im[91];
+    t7 = t18 + t5;
+    t12 = t3 + t11;
+    t10 = t9 + t6;
+    t17 = t1 + t0;
+    t14 = t18 - t5;
+    t15 = t3 - t11;
+    t2 = t9 - t6;
+    t4 = t1 - t0;
+    t8 = t7 + t10;
+    t18 = t12 + t17;
+    t5 = t7 - t10;
+    t3 = C19 * t5;
+    t11 = t12 - t17;
+    t9 = C19 * t11;
+    t6 = C20 * t8;
+    t1 = t13 - t6;
+    t0 = C20 * t18;
+    t7 = t16 - t0;
+    t10 = t1 + t3;
+    t5 = t7 + t9;
+    t12 = t1 - t3;
+    t17 = t7 - t9;
+    t11 = C3 * t14;
+    t6 = C21 * t2;
+    t0 = t11 + t6;
+    t1 = C3 * t15;
+    t3 = C21 * t4;
+    t7 = t1 + t3;
+    t9 = C21 * t14;
+    t11 = C3 * t2;
+    t6 = t9 - t11;
+    t1 = C21 * t15;
+    t3 = C3 * t4;
+    t14 = t1 - t3;
+    t2 = t13 + t8;
+    t9 = t16 + t18;
+    t11 = t10 + t7;
+    t15 = t5 - t0;
+    t4 = t12 + t14;
+    t1 = t17 - t6;
+    t3 = t12 - t14;
+    t13 = t17 + t6;
+    t8 = t10 - t7;
+    t16 = t5 + t0;
+    re[115] = t2;
+    im[115] = t9;
+    re[19] = t11;
+    im[19] = t15;
+    re[43] = t4;
+    im[43] = t1;
+    re[67] = t3;
+    im[67] = t13;
+    re[91] = t8;
+    im[91] = t16;
+    t18 = re[10];
+    t12 = im[10];
+    t14 = re[34];
+    t17 = im[34];
+    t6 = re[58];
+    t10 = im[58];
+    t7 = re[82];
+    t5 = im[82];
+    t0 = re[106];
+    t2 = im[106];
+    t9 = t14 + t0;
+    t11 = t17 + t2;
+    t15 = t6 + t7;
+    t4 = t10 + t5;
+    t1 = t14 - t0;
+    t3 = t17 - t2;
+    t13 = t6 - t7;
+    t8 = t10 - t5;
+    t16 = t9 + t15;
+    t14 = t11 + t4;
+    t0 = t9 - t15;
+    t17 = C19 * t0;
+    t2 = t11 - t4;
+    t6 = C19 * t2;
+    t7 = C20 * t16;
+    t10 = t18 - t7;
+    t5 = C20 * t14;
+    t9 = t12 - t5;
+    t15 = t10 + t17;
+    t0 = t9 + t6;
+    t11 = t10 - t17;
+    t4 = t9 - t6;
+    t2 = C3 * t1;
+    t7 = C21 * t13;
+    t5 = t2 + t7;
+    t10 = C3 * t3;
+    t17 = C21 * t8;
+    t9 = t10 + t17;
+    t6 = C21 * t1;
+    t2 = C3 * t13;
+    t7 = t6 - t2;
+    t10 = C21 * t3;
+    t17 = C3 * t8;
+    t1 = t10 - t17;
+    t13 = t18 + t16;
+    t6 = t12 + t14;
+    t2 = t15 + t9;
+    t3 = t0 - t5;
+    t8 = t11 + t1;
+    t10 = t4 - t7;
+    t17 = t11 - t1;
+    t18 = t4 + t7;
+    t16 = t15 - t9;
+    t12 = t0 + t5;
+    re[10] = t13;
+    im[10] = t6;
+    re[34] = t2;
+    im[34] = t3;
+    re[58] = t8;
+    im[58] = t10;
+    re[82] = t17;
+    im[82] = t18;
+    re[106] = t16;
+    im[106] = t12;
+    t14 = re[25];
+    t11 = im[25];
+    t1 = re[49];
+    t4 = im[49];
+    t7 = re[73];
+    t15 = im[73];
+    t9 = re[97];
+    t0 = im[97];
+    t5 = re[1];
+    t13 = im[1];
+    t6 = t1 + t5;
+    t2 = t4 + t13;
+    t3 = t7 + t9;
+    t8 = t15 + t0;
+    t10 = t1 - t5;
+    t17 = t4 - t13;
+    t18 = t7 - t9;
+    t16 = t15 - t0;
+    t12 = t6 + t3;
+    t1 = t2 + t8;
+    t5 = t6 - t3;
+    t4 = C19 * t5;
+    t13 = t2 - t8;
+    t7 = C19 * t13;
+    t9 = C20 * t12;
+    t15 = t14 - t9;
+    t0 = C20 * t1;
+    t6 = t11 - t0;
+    t3 = t15 + t4;
+    t5 = t6 + t7;
+    t2 = t15 - t4;
+    t8 = t6 - t7;
+    t13 = C3 * t10;
+    t9 = C21 * t18;
+    t0 = t13 + t9;
+    t15 = C3 * t17;
+    t4 = C21 * t16;
+    t6 = t15 + t4;
+    t7 = C21 * t10;
+    t13 = C3 * t18;
+    t9 = t7 - t13;
+    t15 = C21 * t17;
+    t4 = C3 * t16;
+    t10 = t15 - t4;
+    t18 = t14 + t12;
+    t7 = t11 + t1;
+    t13 = t3 + t6;
+    t17 = t5 - t0;
+    t16 = t2 + t10;
+    t15 = t8 - t9;
+    t4 = t2 - t10;
+    t14 = t8 + t9;
+    t12 = t3 - t6;
+    t11 = t5 + t0;
+    re[25] = t18;
+    im[25] = t7;
+    re[49] = t13;
+    im[49] = t17;
+    re[73] = t16;
+    im[73] = t15;
+    re[97] = t4;
+    im[97] = t14;
+    re[1] = t12;
+    im[1] = t11;
+}
+
+/**
+ *  Part 2 of ApplyWindowedIMDCT_W75_240_K60().
+ * 
+ *  @param {Number[]} X 
+ *    - The input block (240 points, only the first 60 points are used).
+ *  @param {Number[]} y 
+ *    - The array that would contain the output block (480 points).
+ *  @param {Number[]} re 
+ *    - The scratch buffer (real part, 120 points).
+ *  @param {Number[]} im 
+ *    - The scratch buffer (imaginary part, 120 points).
+ */
+function ApplyWindowedIMDCT_W75_240_K60_Part2(X, y, re, im) {
+    let t0, t1, t10, t11, t12, t13, t14, t15, t16, t17, t18, t2, t3, t4, t5, t6, t7, t8, t9;
+    const C0 = 0.7071067811865476;
+    const C1 = 0.5590169943749475;
+    const C2 = 0.25;
+    const C3 = 0.9510565162951535;
+    const C4 = 0.5877852522924731;
+    const C5 = 0.5;
+    const C6 = 0.8660254037844386;
+    const C7 = 0.9999946454016965;
+    const C8 = 0.003272486506526625;
+    const C9 = 0.8643845233130174;
+    const C10 = 0.5028313791490421;
+    const C11 = 0.4971632662526543;
+    const C12 = 0.8676570098195441;
+    const C13 = 0.48576339371634003;
+    const C14 = 0.8740903416267589;
+    const C15 = 0.9998661379095618;
+    const C16 = 0.01636173162648678;
+    const C17 = 0.8577286100002721;
+    const C18 = 0.5141027441932217;
+    const C19 = 0.8509257293058021;
+    const C20 = 0.525286020378792;
+    const C21 = 0.4742802881232292;
+    const C22 = 0.8803739025537654;
+    const C23 = 0.9995663085020212;
+    const C24 = 0.02944817324796316;
+    const C25 = 0.9990952085533004;
+    const C26 = 0.04252956907655312;
+    const C27 = 0.8439770468681933;
+    const C28 = 0.5363792915089503;
+    const C29 = 0.4627159170443501;
+    const C30 = 0.8865066159447464;
+    const C31 = 0.4510722619751534;
+    const C32 = 0.8924874309908339;
+    const C33 = 0.99845291878395;
+    const C34 = 0.055603677682424614;
+    const C35 = 0.8368837533084093;
+    const C36 = 0.5473806568087966;
+    const C37 = 0.8296470640257853;
+    const C38 = 0.558288231251022;
+    const C39 = 0.4393513179959937;
+    const C40 = 0.898315322910159;
+    const C41 = 0.9976395492470157;
+    const C42 = 0.06866825888437376;
+    const C43 = 0.9966552393091803;
+    const C44 = 0.08172107413366822;
+    const C45 = 0.8222682189897751;
+    const C46 = 0.5691001458788982;
+    const C47 = 0.4275550934302821;
+    const C48 = 0.9039892931234433;
+    const C49 = 0.4156856095003708;
+    const C50 = 0.9095083694251006;
+    const C51 = 0.9955001576268845;
+    const C52 = 0.09475988689761111;
+    const C53 = 0.8147484825274894;
+    const C54 = 0.5798145481265136;
+    const C55 = 0.8070891431070594;
+    const C56 = 0.5904296021362011;
+    const C57 = 0.4037448999812271;
+    const C58 = 0.9148716061498187;
+    const C59 = 0.9941745021174282;
+    const C60 = 0.10778246304275935;
+    const C61 = 0.9926784999250583;
+    const C62 = 0.12078657121773083;
+    const C63 = 0.7992915131168641;
+    const C64 = 0.6009434890731024;
+    const C65 = 0.3917350108519559;
+    const C66 = 0.9200780843345949;
+    const C67 = 0.37965799994523275;
+    const C68 = 0.9251269118761953;
+    const C69 = 0.9910124073820492;
+    const C70 = 0.13376998323553513;
+    const C71 = 0.7913569286406602;
+    const C72 = 0.6113544074368165;
+    const C73 = 0.7832867492286504;
+    const C74 = 0.6216605733700774;
+    const C75 = 0.36751593659470355;
+    const C76 = 0.9300172236840121;
+    const C77 = 0.989176509964781;
+    const C78 = 0.14673047445536175;
+    const C79 = 0.9871711222448248;
+    const C80 = 0.159665824163761;
+    const C81 = 0.7750823576645314;
+    const C82 = 0.6318602209644087;
+    const C83 = 0.3553109012804161;
+    const C84 = 0.9347481818282924;
+    const C85 = 0.34304498527233984;
+    const C86 = 0.9393189756837131;
+    const C87 = 0.984996587835043;
+    const C88 = 0.1725738159551517;
+    const C89 = 0.7667451597285615;
+    const C90 = 0.641951602562703;
+    const C91 = 0.758276583956687;
+    const C92 = 0.6519329890586743;
+    const C93 = 0.3307202902720374;
+    const C94 = 0.9437288220682779;
+    const C95 = 0.9826532793307118;
+    const C96 = 0.18545223811159092;
+    const C97 = 0.9801415982456801;
+    const C98 = 0.19829888398174045;
+    const C99 = 0.74967808139577;
+    const C100 = 0.6618026701931303;
+    const C101 = 0.3183389280525497;
+    const C102 = 0.9479769653775104;
+    const C103 = 0.30590302009655346;
+    const C104 = 0.9520626777139243;
+    const C105 = 0.9774619749435719;
+    const C106 = 0.21111155235896514;
+    const C107 = 0.7409511253549591;
+    const C108 = 0.6715589548470183;
+    const C109 = 0.7320972111532454;
+    const C110 = 0.6812001713311883;
+    const C111 = 0.2934146972328567;
+    const C112 = 0.9559852590117439;
+    const C113 = 0.974614868564045;
+    const C114 = 0.22388804785849836;
+    t1 = X[49];
+    t2 = 0.9469301294951057 * t1;
+    t10 = 0.3214394653031616 * t1;
+    t8 = X[19];
+    t9 = 0.9914448613738104 * t8;
+    t3 = 0.13052619222005157 * t8;
+    t6 = X[10];
+    t5 = 0.9978589232386035 * t6;
+    t0 = (-0.06540312923014306) * t6;
+    t18 = X[40];
+    t7 = 0.9659258262890683 * t18;
+    t13 = (-0.25881904510252074) * t18;
+    t17 = -t7;
+    t16 = -t13;
+    t15 = t7 + t9;
+    t4 = t13 + t3;
+    t14 = t3 - t7;
+    t12 = t16 - t9;
+    t11 = t7 - t9;
+    t1 = t13 - t3;
+    t8 = t17 - t3;
+    t6 = t9 - t13;
+    t18 = t2 + t5;
+    t16 = t10 + t0;
+    t7 = t2 + t0;
+    t17 = t10 - t5;
+    t3 = t2 - t5;
+    t9 = t10 - t0;
+    t13 = t2 - t0;
+    t2 = t10 + t5;
+    t0 = t7 + t17;
+    t10 = t7 - t17;
+    t5 = C0 * t0;
+    t7 = (-C0) * t10;
+    t17 = t13 - t2;
+    t0 = t13 + t2;
+    t10 = (-C0) * t17;
+    t13 = (-C0) * t0;
+    t2 = t15 - t18;
+    t17 = t4 - t16;
+    t0 = t15 + t18;
+    t15 = t4 + t16;
+    t18 = t14 - t5;
+    t4 = t12 - t7;
+    t16 = t14 + t5;
+    t14 = t12 + t7;
+    t5 = t11 - t9;
+    t12 = t1 + t3;
+    t7 = t11 + t9;
+    t11 = t1 - t3;
+    t9 = t8 - t10;
+    t1 = t6 - t13;
+    t3 = t8 + t10;
+    t8 = t6 + t13;
+    re[80] = t0;
+    im[80] = t15;
+    re[95] = t16;
+    im[95] = t14;
+    re[110] = t7;
+    im[110] = t11;
+    re[5] = t3;
+    im[5] = t8;
+    re[20] = t2;
+    im[20] = t17;
+    re[35] = t18;
+    im[35] = t4;
+    re[50] = t5;
+    im[50] = t12;
+    re[65] = t9;
+    im[65] = t1;
+    t10 = X[31];
+    t6 = 0.9781476007338057 * t10;
+    t13 = 0.20791169081775931 * t10;
+    t0 = X[1];
+    t15 = 0.999914327574007 * t0;
+    t16 = 0.01308959557134444 * t0;
+    t14 = X[28];
+    t7 = 0.9832549075639546 * t14;
+    t11 = (-0.18223552549214747) * t14;
+    t3 = X[58];
+    t8 = 0.9288095528719242 * t3;
+    t2 = (-0.3705574375098362) * t3;
+    t17 = t6 + t7;
+    t18 = t13 + t11;
+    t4 = t6 + t11;
+    t5 = t13 - t7;
+    t12 = t6 - t7;
+    t9 = t13 - t11;
+    t1 = t6 - t11;
+    t10 = t13 + t7;
+    t0 = t15 + t8;
+    t14 = t16 + t2;
+    t3 = t15 + t2;
+    t6 = t16 - t8;
+    t11 = t15 - t8;
+    t13 = t16 - t2;
+    t7 = t15 - t2;
+    t15 = t16 + t8;
+    t2 = t3 + t6;
+    t16 = t3 - t6;
+    t8 = C0 * t2;
+    t3 = (-C0) * t16;
+    t6 = t7 - t15;
+    t2 = t7 + t15;
+    t16 = (-C0) * t6;
+    t7 = (-C0) * t2;
+    t15 = t17 - t0;
+    t6 = t18 - t14;
+    t2 = t17 + t0;
+    t17 = t18 + t14;
+    t0 = t4 - t8;
+    t18 = t5 - t3;
+    t14 = t4 + t8;
+    t4 = t5 + t3;
+    t8 = t12 - t13;
+    t5 = t9 + t11;
+    t3 = t12 + t13;
+    t12 = t9 - t11;
+    t13 = t1 - t16;
+    t9 = t10 - t7;
+    t11 = t1 + t16;
+    t1 = t10 + t7;
+    re[104] = t2;
+    im[104] = t17;
+    re[119] = t14;
+    im[119] = t4;
+    re[14] = t3;
+    im[14] = t12;
+    re[29] = t11;
+    im[29] = t1;
+    re[44] = t15;
+    im[44] = t6;
+    re[59] = t0;
+    im[59] = t18;
+    re[74] = t8;
+    im[74] = t5;
+    re[89] = t13;
+    im[89] = t9;
+    t16 = X[16];
+    t10 = 0.9945218953682733 * t16;
+    t7 = (-0.10452846326765346) * t16;
+    t2 = X[46];
+    t17 = 0.9550199444571866 * t2;
+    t14 = (-0.296541574975571) * t2;
+    t4 = X[43];
+    t3 = 0.958819734868193 * t4;
+    t12 = 0.2840153447039226 * t4;
+    t11 = X[13];
+    t1 = 0.9958049275746618 * t11;
+    t15 = 0.09150161866340238 * t11;
+    t6 = t10 + t3;
+    t0 = t7 + t12;
+    t18 = t10 - t12;
+    t8 = t7 + t3;
+    t5 = t10 - t3;
+    t13 = t7 - t12;
+    t9 = t10 + t12;
+    t16 = t7 - t3;
+    t2 = t17 + t1;
+    t4 = t14 + t15;
+    t11 = t17 - t15;
+    t10 = t14 + t1;
+    t12 = t17 - t1;
+    t7 = t14 - t15;
+    t3 = t17 + t15;
+    t17 = t14 - t1;
+    t15 = t11 + t10;
+    t14 = t11 - t10;
+    t1 = C0 * t15;
+    t11 = (-C0) * t14;
+    t10 = t3 - t17;
+    t15 = t3 + t17;
+    t14 = (-C0) * t10;
+    t3 = (-C0) * t15;
+    t17 = t6 - t2;
+    t10 = t0 - t4;
+    t15 = t6 + t2;
+    t6 = t0 + t4;
+    t2 = t18 - t1;
+    t0 = t8 - t11;
+    t4 = t18 + t1;
+    t18 = t8 + t11;
+    t1 = t5 - t7;
+    t8 = t13 + t12;
+    t11 = t5 + t7;
+    t5 = t13 - t12;
+    t7 = t9 - t14;
+    t13 = t16 - t3;
+    t12 = t9 + t14;
+    t9 = t16 + t3;
+    re[8] = t15;
+    im[8] = t6;
+    re[23] = t4;
+    im[23] = t18;
+    re[38] = t11;
+    im[38] = t5;
+    re[53] = t12;
+    im[53] = t9;
+    re[68] = t17;
+    im[68] = t10;
+    re[83] = t2;
+    im[83] = t0;
+    re[98] = t1;
+    im[98] = t8;
+    re[113] = t7;
+    im[113] = t13;
+    t14 = X[55];
+    t16 = 0.9335804264972017 * t14;
+    t3 = 0.35836794954530027 * t14;
+    t15 = X[25];
+    t6 = 0.9855560590580777 * t15;
+    t4 = 0.1693495038490246 * t15;
+    t18 = X[4];
+    t11 = 0.9996573249755573 * t18;
+    t5 = (-0.02617694830787315) * t18;
+    t12 = X[34];
+    t9 = 0.9753423205085127 * t12;
+    t17 = (-0.22069743502150108) * t12;
+    t10 = -t16;
+    t2 = -t3;
+    t0 = t16 + t11;
+    t1 = t3 + t5;
+    t8 = t10 - t5;
+    t7 = t11 - t3;
+    t13 = t16 - t11;
+    t14 = t3 - t5;
+    t15 = t5 - t16;
+    t18 = t2 - t11;
+    t12 = -t6;
+    t10 = -t4;
+    t3 = t6 + t9;
+    t5 = t4 + t17;
+    t16 = t12 - t17;
+    t2 = t9 - t4;
+    t11 = t6 - t9;
+    t12 = t4 - t17;
+    t4 = t17 - t6;
+    t17 = t10 - t9;
+    t6 = t16 + t2;
+    t10 = t16 - t2;
+    t9 = C0 * t6;
+    t16 = (-C0) * t10;
+    t2 = t4 - t17;
+    t6 = t4 + t17;
+    t10 = (-C0) * t2;
+    t4 = (-C0) * t6;
+    t17 = t0 - t3;
+    t2 = t1 - t5;
+    t6 = t0 + t3;
+    t0 = t1 + t5;
+    t3 = t8 - t9;
+    t1 = t7 - t16;
+    t5 = t8 + t9;
+    t8 = t7 + t16;
+    t9 = t13 - t12;
+    t7 = t14 + t11;
+    t16 = t13 + t12;
+    t13 = t14 - t11;
+    t12 = t15 - t10;
+    t14 = t18 - t4;
+    t11 = t15 + t10;
+    t15 = t18 + t4;
+    re[32] = t6;
+    im[32] = t0;
+    re[47] = t5;
+    im[47] = t8;
+    re[62] = t16;
+    im[62] = t13;
+    re[77] = t11;
+    im[77] = t15;
+    re[92] = t17;
+    im[92] = t2;
+    re[107] = t3;
+    im[107] = t1;
+    re[2] = t9;
+    im[2] = t7;
+    re[17] = t12;
+    im[17] = t14;
+    t10 = X[37];
+    t18 = 0.9692309097067544 * t10;
+    t4 = 0.24615329302899303 * t10;
+    t6 = X[7];
+    t0 = 0.9986295347545738 * t6;
+    t5 = 0.05233595624294383 * t6;
+    t8 = X[22];
+    t16 = 0.9896513868196702 * t8;
+    t13 = (-0.1434926219911793) * t8;
+    t11 = X[52];
+    t15 = 0.9426414910921784 * t11;
+    t17 = (-0.33380685923377096) * t11;
+    t2 = -t0;
+    t3 = -t5;
+    t1 = t0 + t15;
+    t9 = t5 + t17;
+    t7 = t2 - t17;
+    t12 = t15 - t5;
+    t14 = t0 - t15;
+    t10 = t5 - t17;
+    t6 = t17 - t0;
+    t8 = t3 - t15;
+    t11 = -t16;
+    t2 = -t13;
+    t5 = t16 + t18;
+    t17 = t13 + t4;
+    t0 = t4 - t16;
+    t3 = t2 - t18;
+    t15 = t16 - t18;
+    t2 = t13 - t4;
+    t16 = t11 - t4;
+    t11 = t18 - t13;
+    t4 = t0 + t3;
+    t18 = t0 - t3;
+    t13 = C0 * t4;
+    t0 = (-C0) * t18;
+    t3 = t16 - t11;
+    t4 = t16 + t11;
+    t18 = (-C0) * t3;
+    t16 = (-C0) * t4;
+    t11 = t1 - t5;
+    t3 = t9 - t17;
+    t4 = t1 + t5;
+    t1 = t9 + t17;
+    t5 = t7 - t13;
+    t9 = t12 - t0;
+    t17 = t7 + t13;
+    t7 = t12 + t0;
+    t13 = t14 - t2;
+    t12 = t10 + t15;
+    t0 = t14 + t2;
+    t14 = t10 - t15;
+    t2 = t6 - t18;
+    t10 = t8 - t16;
+    t15 = t6 + t18;
+    t6 = t8 + t16;
+    re[56] = t4;
+    im[56] = t1;
+    re[71] = t17;
+    im[71] = t7;
+    re[86] = t0;
+    im[86] = t14;
+    re[101] = t15;
+    im[101] = t6;
+    re[116] = t11;
+    im[116] = t3;
+    re[11] = t5;
+    im[11] = t9;
+    re[26] = t13;
+    im[26] = t12;
+    re[41] = t2;
+    im[41] = t10;
+    t18 = re[80];
+    t8 = im[80];
+    t16 = re[104];
+    t4 = im[104];
+    t1 = re[8];
+    t17 = im[8];
+    t7 = re[32];
+    t0 = im[32];
+    t14 = re[56];
+    t15 = im[56];
+    t6 = t16 + t14;
+    t11 = t4 + t15;
+    t3 = t1 + t7;
+    t5 = t17 + t0;
+    t9 = t16 - t14;
+    t13 = t4 - t15;
+    t12 = t1 - t7;
+    t2 = t17 - t0;
+    t10 = t6 + t3;
+    t16 = t11 + t5;
+    t14 = t6 - t3;
+    t4 = C1 * t14;
+    t15 = t11 - t5;
+    t1 = C1 * t15;
+    t7 = C2 * t10;
+    t17 = t18 - t7;
+    t0 = C2 * t16;
+    t6 = t8 - t0;
+    t3 = t17 + t4;
+    t14 = t6 + t1;
+    t11 = t17 - t4;
+    t5 = t6 - t1;
+    t15 = C3 * t9;
+    t7 = C4 * t12;
+    t0 = t15 + t7;
+    t17 = C3 * t13;
+    t4 = C4 * t2;
+    t6 = t17 + t4;
+    t1 = C4 * t9;
+    t15 = C3 * t12;
+    t7 = t1 - t15;
+    t17 = C4 * t13;
+    t4 = C3 * t2;
+    t9 = t17 - t4;
+    t12 = t18 + t10;
+    t1 = t8 + t16;
+    t15 = t3 + t6;
+    t13 = t14 - t0;
+    t2 = t11 + t9;
+    t17 = t5 - t7;
+    t4 = t11 - t9;
+    t18 = t5 + t7;
+    t10 = t3 - t6;
+    t8 = t14 + t0;
+    re[80] = t12;
+    im[80] = t1;
+    re[104] = t15;
+    im[104] = t13;
+    re[8] = t2;
+    im[8] = t17;
+    re[32] = t4;
+    im[32] = t18;
+    re[56] = t10;
+    im[56] = t8;
+    t16 = re[95];
+    t11 = im[95];
+    t9 = re[119];
+    t5 = im[119];
+    t7 = re[23];
+    t3 = im[23];
+    t6 = re[47];
+    t14 = im[47];
+    t0 = re[71];
+    t12 = im[71];
+    t1 = t9 + t0;
+    t15 = t5 + t12;
+    t13 = t7 + t6;
+    t2 = t3 + t14;
+    t17 = t9 - t0;
+    t4 = t5 - t12;
+    t18 = t7 - t6;
+    t10 = t3 - t14;
+    t8 = t1 + t13;
+    t9 = t15 + t2;
+    t0 = t1 - t13;
+    t5 = C1 * t0;
+    t12 = t15 - t2;
+    t7 = C1 * t12;
+    t6 = C2 * t8;
+    t3 = t16 - t6;
+    t14 = C2 * t9;
+    t1 = t11 - t14;
+    t13 = t3 + t5;
+    t0 = t1 + t7;
+    t15 = t3 - t5;
+    t2 = t1 - t7;
+    t12 = C3 * t17;
+    t6 = C4 * t18;
+    t14 = t12 + t6;
+    t3 = C3 * t4;
+    t5 = C4 * t10;
+    t1 = t3 + t5;
+    t7 = C4 * t17;
+    t12 = C3 * t18;
+    t6 = t7 - t12;
+    t3 = C4 * t4;
+    t5 = C3 * t10;
+    t17 = t3 - t5;
+    t18 = t16 + t8;
+    t7 = t11 + t9;
+    t12 = t13 + t1;
+    t4 = t0 - t14;
+    t10 = t15 + t17;
+    t3 = t2 - t6;
+    t5 = t15 - t17;
+    t16 = t2 + t6;
+    t8 = t13 - t1;
+    t11 = t0 + t14;
+    re[95] = t18;
+    im[95] = t7;
+    re[119] = t12;
+    im[119] = t4;
+    re[23] = t10;
+    im[23] = t3;
+    re[47] = t5;
+    im[47] = t16;
+    re[71] = t8;
+    im[71] = t11;
+    t9 = re[110];
+    t15 = im[110];
+    t17 = re[14];
+    t2 = im[14];
+    t6 = re[38];
+    t13 = im[38];
+    t1 = re[62];
+    t0 = im[62];
+    t14 = re[86];
+    t18 = im[86];
+    t7 = t17 + t14;
+    t12 = t2 + t18;
+    t4 = t6 + t1;
+    t10 = t13 + t0;
+    t3 = t17 - t14;
+    t5 = t2 - t18;
+    t16 = t6 - t1;
+    t8 = t13 - t0;
+    t11 = t7 + t4;
+    t17 = t12 + t10;
+    t14 = t7 - t4;
+    t2 = C1 * t14;
+    t18 = t12 - t10;
+    t6 = C1 * t18;
+    t1 = C2 * t11;
+    t13 = t9 - t1;
+    t0 = C2 * t17;
+    t7 = t15 - t0;
+    t4 = t13 + t2;
+    t14 = t7 + t6;
+    t12 = t13 - t2;
+    t10 = t7 - t6;
+    t18 = C3 * t3;
+    t1 = C4 * t16;
+    t0 = t18 + t1;
+    t13 = C3 * t5;
+    t2 = C4 * t8;
+    t7 = t13 + t2;
+    t6 = C4 * t3;
+    t18 = C3 * t16;
+    t1 = t6 - t18;
+    t13 = C4 * t5;
+    t2 = C3 * t8;
+    t3 = t13 - t2;
+    t16 = t9 + t11;
+    t6 = t15 + t17;
+    t18 = t4 + t7;
+    t5 = t14 - t0;
+    t8 = t12 + t3;
+    t13 = t10 - t1;
+    t2 = t12 - t3;
+    t9 = t10 + t1;
+    t11 = t4 - t7;
+    t15 = t14 + t0;
+    re[110] = t16;
+    im[110] = t6;
+    re[14] = t18;
+    im[14] = t5;
+    re[38] = t8;
+    im[38] = t13;
+    re[62] = t2;
+    im[62] = t9;
+    re[86] = t11;
+    im[86] = t15;
+    t17 = re[5];
+    t12 = im[5];
+    t3 = re[29];
+    t10 = im[29];
+    t1 = re[53];
+    t4 = im[53];
+    t7 = re[77];
+    t14 = im[77];
+    t0 = re[101];
+    t16 = im[101];
+    t6 = t3 + t0;
+    t18 = t10 + t16;
+    t5 = t1 + t7;
+    t8 = t4 + t14;
+    t13 = t3 - t0;
+    t2 = t10 - t16;
+    t9 = t1 - t7;
+    t11 = t4 - t14;
+    t15 = t6 + t5;
+    t3 = t18 + t8;
+    t0 = t6 - t5;
+    t10 = C1 * t0;
+    t16 = t18 - t8;
+    t1 = C1 * t16;
+    t7 = C2 * t15;
+    t4 = t17 - t7;
+    t14 = C2 * t3;
+    t6 = t12 - t14;
+    t5 = t4 + t10;
+    t0 = t6 + t1;
+    t18 = t4 - t10;
+    t8 = t6 - t1;
+    t16 = C3 * t13;
+    t7 = C4 * t9;
+    t14 = t16 + t7;
+    t4 = C3 * t2;
+    t10 = C4 * t11;
+    t6 = t4 + t10;
+    t1 = C4 * t13;
+    t16 = C3 * t9;
+    t7 = t1 - t16;
+    t4 = C4 * t2;
+    t10 = C3 * t11;
+    t13 = t4 - t10;
+    t9 = t17 + t15;
+    t1 = t12 + t3;
+    t16 = t5 + t6;
+    t2 = t0 - t14;
+    t11 = t18 + t13;
+    t4 = t8 - t7;
+    t10 = t18 - t13;
+    t17 = t8 + t7;
+    t15 = t5 - t6;
+    t12 = t0 + t14;
+    re[5] = t9;
+    im[5] = t1;
+    re[29] = t16;
+    im[29] = t2;
+    re[53] = t11;
+    im[53] = t4;
+    re[77] = t10;
+    im[77] = t17;
+    re[101] = t15;
+    im[101] = t12;
+    t3 = re[20];
+    t18 = im[20];
+    t13 = re[44];
+    t8 = im[44];
+    t7 = re[68];
+    t5 = im[68];
+    t6 = re[92];
+    t0 = im[92];
+    t14 = re[116];
+    t9 = im[116];
+    t1 = t13 + t14;
+    t16 = t8 + t9;
+    t2 = t7 + t6;
+    t11 = t5 + t0;
+    t4 = t13 - t14;
+    t10 = t8 - t9;
+    t17 = t7 - t6;
+    t15 = t5 - t0;
+    t12 = t1 + t2;
+    t13 = t16 + t11;
+    t14 = t1 - t2;
+    t8 = C1 * t14;
+    t9 = t16 - t11;
+    t7 = C1 * t9;
+    t6 = C2 * t12;
+    t5 = t3 - t6;
+    t0 = C2 * t13;
+    t1 = t18 - t0;
+    t2 = t5 + t8;
+    t14 = t1 + t7;
+    t16 = t5 - t8;
+    t11 = t1 - t7;
+    t9 = C3 * t4;
+    t6 = C4 * t17;
+    t0 = t9 + t6;
+    t5 = C3 * t10;
+    t8 = C4 * t15;
+    t1 = t5 + t8;
+    t7 = C4 * t4;
+    t9 = C3 * t17;
+    t6 = t7 - t9;
+    t5 = C4 * t10;
+    t8 = C3 * t15;
+    t4 = t5 - t8;
+    t17 = t3 + t12;
+    t7 = t18 + t13;
+    t9 = t2 + t1;
+    t10 = t14 - t0;
+    t15 = t16 + t4;
+    t5 = t11 - t6;
+    t8 = t16 - t4;
+    t3 = t11 + t6;
+    t12 = t2 - t1;
+    t18 = t14 + t0;
+    re[20] = t17;
+    im[20] = t7;
+    re[44] = t9;
+    im[44] = t10;
+    re[68] = t15;
+    im[68] = t5;
+    re[92] = t8;
+    im[92] = t3;
+    re[116] = t12;
+    im[116] = t18;
+    t13 = re[35];
+    t16 = im[35];
+    t4 = re[59];
+    t11 = im[59];
+    t6 = re[83];
+    t2 = im[83];
+    t1 = re[107];
+    t14 = im[107];
+    t0 = re[11];
+    t17 = im[11];
+    t7 = t4 + t0;
+    t9 = t11 + t17;
+    t10 = t6 + t1;
+    t15 = t2 + t14;
+    t5 = t4 - t0;
+    t8 = t11 - t17;
+    t3 = t6 - t1;
+    t12 = t2 - t14;
+    t18 = t7 + t10;
+    t4 = t9 + t15;
+    t0 = t7 - t10;
+    t11 = C1 * t0;
+    t17 = t9 - t15;
+    t6 = C1 * t17;
+    t1 = C2 * t18;
+    t2 = t13 - t1;
+    t14 = C2 * t4;
+    t7 = t16 - t14;
+    t10 = t2 + t11;
+    t0 = t7 + t6;
+    t9 = t2 - t11;
+    t15 = t7 - t6;
+    t17 = C3 * t5;
+    t1 = C4 * t3;
+    t14 = t17 + t1;
+    t2 = C3 * t8;
+    t11 = C4 * t12;
+    t7 = t2 + t11;
+    t6 = C4 * t5;
+    t17 = C3 * t3;
+    t1 = t6 - t17;
+    t2 = C4 * t8;
+    t11 = C3 * t12;
+    t5 = t2 - t11;
+    t3 = t13 + t18;
+    t6 = t16 + t4;
+    t17 = t10 + t7;
+    t8 = t0 - t14;
+    t12 = t9 + t5;
+    t2 = t15 - t1;
+    t11 = t9 - t5;
+    t13 = t15 + t1;
+    t18 = t10 - t7;
+    t16 = t0 + t14;
+    re[35] = t3;
+    im[35] = t6;
+    re[59] = t17;
+    im[59] = t8;
+    re[83] = t12;
+    im[83] = t2;
+    re[107] = t11;
+    im[107] = t13;
+    re[11] = t18;
+    im[11] = t16;
+    t4 = re[50];
+    t9 = im[50];
+    t5 = re[74];
+    t15 = im[74];
+    t1 = re[98];
+    t10 = im[98];
+    t7 = re[2];
+    t0 = im[2];
+    t14 = re[26];
+    t3 = im[26];
+    t6 = t5 + t14;
+    t17 = t15 + t3;
+    t8 = t1 + t7;
+    t12 = t10 + t0;
+    t2 = t5 - t14;
+    t11 = t15 - t3;
+    t13 = t1 - t7;
+    t18 = t10 - t0;
+    t16 = t6 + t8;
+    t5 = t17 + t12;
+    t14 = t6 - t8;
+    t15 = C1 * t14;
+    t3 = t17 - t12;
+    t1 = C1 * t3;
+    t7 = C2 * t16;
+    t10 = t4 - t7;
+    t0 = C2 * t5;
+    t6 = t9 - t0;
+    t8 = t10 + t15;
+    t14 = t6 + t1;
+    t17 = t10 - t15;
+    t12 = t6 - t1;
+    t3 = C3 * t2;
+    t7 = C4 * t13;
+    t0 = t3 + t7;
+    t10 = C3 * t11;
+    t15 = C4 * t18;
+    t6 = t10 + t15;
+    t1 = C4 * t2;
+    t3 = C3 * t13;
+    t7 = t1 - t3;
+    t10 = C4 * t11;
+    t15 = C3 * t18;
+    t2 = t10 - t15;
+    t13 = t4 + t16;
+    t1 = t9 + t5;
+    t3 = t8 + t6;
+    t11 = t14 - t0;
+    t18 = t17 + t2;
+    t10 = t12 - t7;
+    t15 = t17 - t2;
+    t4 = t12 + t7;
+    t16 = t8 - t6;
+    t9 = t14 + t0;
+    re[50] = t13;
+    im[50] = t1;
+    re[74] = t3;
+    im[74] = t11;
+    re[98] = t18;
+    im[98] = t10;
+    re[2] = t15;
+    im[2] = t4;
+    re[26] = t16;
+    im[26] = t9;
+    t5 = re[65];
+    t17 = im[65];
+    t2 = re[89];
+    t12 = im[89];
+    t7 = re[113];
+    t8 = im[113];
+    t6 = re[17];
+    t14 = im[17];
+    t0 = re[41];
+    t13 = im[41];
+    t1 = t2 + t0;
+    t3 = t12 + t13;
+    t11 = t7 + t6;
+    t18 = t8 + t14;
+    t10 = t2 - t0;
+    t15 = t12 - t13;
+    t4 = t7 - t6;
+    t16 = t8 - t14;
+    t9 = t1 + t11;
+    t2 = t3 + t18;
+    t0 = t1 - t11;
+    t12 = C1 * t0;
+    t13 = t3 - t18;
+    t7 = C1 * t13;
+    t6 = C2 * t9;
+    t8 = t5 - t6;
+    t14 = C2 * t2;
+    t1 = t17 - t14;
+    t11 = t8 + t12;
+    t0 = t1 + t7;
+    t3 = t8 - t12;
+    t18 = t1 - t7;
+    t13 = C3 * t10;
+    t6 = C4 * t4;
+    t14 = t13 + t6;
+    t8 = C3 * t15;
+    t12 = C4 * t16;
+    t1 = t8 + t12;
+    t7 = C4 * t10;
+    t13 = C3 * t4;
+    t6 = t7 - t13;
+    t8 = C4 * t15;
+    t12 = C3 * t16;
+    t10 = t8 - t12;
+    t4 = t5 + t9;
+    t7 = t17 + t2;
+    t13 = t11 + t1;
+    t15 = t0 - t14;
+    t16 = t3 + t10;
+    t8 = t18 - t6;
+    t12 = t3 - t10;
+    t5 = t18 + t6;
+    t9 = t11 - t1;
+    t17 = t0 + t14;
+    re[65] = t4;
+    im[65] = t7;
+    re[89] = t13;
+    im[89] = t15;
+    re[113] = t16;
+    im[113] = t8;
+    re[17] = t12;
+    im[17] = t5;
+    re[41] = t9;
+    im[41] = t17;
+    t2 = re[0];
+    t3 = im[0];
+    t10 = re[40];
+    t18 = im[40];
+    t6 = re[80];
+    t11 = im[80];
+    t1 = t10 + t6;
+    t0 = t18 + t11;
+    t14 = C5 * t1;
+    t4 = t2 - t14;
+    t7 = C5 * t0;
+    t13 = t3 - t7;
+    t15 = t10 - t6;
+    t16 = C6 * t15;
+    t8 = t18 - t11;
+    t12 = C6 * t8;
+    t5 = t2 + t1;
+    t9 = t3 + t0;
+    t17 = t4 + t12;
+    t14 = t13 - t16;
+    t7 = t4 - t12;
+    t10 = t13 + t16;
+    t6 = (-C7) * t5;
+    t15 = (-C8) * t9;
+    t18 = t6 + t15;
+    t11 = 0.08896202493476155 * t18;
+    y[359] = t11;
+    t8 = 0.08839478579440686 * t18;
+    y[360] = t8;
+    t2 = C8 * t5;
+    t1 = (-C7) * t9;
+    t3 = t2 + t1;
+    t0 = 0.04644169441234319 * t3;
+    y[119] = t0;
+    t4 = (-0.04752735458669829) * t3;
+    y[120] = t4;
+    t12 = (-C9) * t17;
+    t13 = (-C10) * t14;
+    t16 = t12 + t13;
+    t6 = 0.09084055835569309 * t16;
+    y[279] = t6;
+    t15 = 0.014293156561901202 * t16;
+    y[440] = t15;
+    t11 = C10 * t17;
+    t18 = (-C9) * t14;
+    t8 = t11 + t18;
+    y[39] = 0;
+    t5 = (-0.09173582245832897) * t8;
+    y[200] = t5;
+    t9 = C11 * t7;
+    t2 = C12 * t10;
+    t1 = t9 + t2;
+    y[40] = 0;
+    t0 = (-0.0916593323593214) * t1;
+    y[199] = t0;
+    t3 = (-C12) * t7;
+    t4 = C11 * t10;
+    t12 = t3 + t4;
+    t13 = 0.0909163651843452 * t12;
+    y[280] = t13;
+    t6 = 0.015015322977163095 * t12;
+    y[439] = t6;
+    t16 = re[39];
+    t15 = im[39];
+    t17 = re[79];
+    t14 = im[79];
+    t11 = re[119];
+    t18 = im[119];
+    t8 = t17 + t11;
+    t5 = t14 + t18;
+    t9 = C5 * t8;
+    t2 = t16 - t9;
+    t1 = C5 * t5;
+    t0 = t15 - t1;
+    t7 = t17 - t11;
+    t10 = C6 * t7;
+    t3 = t14 - t18;
+    t4 = C6 * t3;
+    t13 = t16 + t8;
+    t12 = t15 + t5;
+    t6 = t2 + t4;
+    t9 = t0 - t10;
+    t1 = t2 - t4;
+    t17 = t0 + t10;
+    t11 = C13 * t13;
+    t7 = C14 * t12;
+    t14 = t11 + t7;
+    y[42] = 0;
+    t18 = (-0.09148831176819235) * t14;
+    y[197] = t18;
+    t3 = (-C14) * t13;
+    t16 = C13 * t12;
+    t8 = t3 + t16;
+    t15 = 0.0910863166264106 * t8;
+    y[282] = t15;
+    t5 = 0.016511926279279197 * t8;
+    y[437] = t5;
+    t2 = (-C15) * t6;
+    t4 = (-C16) * t9;
+    t0 = t2 + t4;
+    t10 = 0.09003773116994462 * t0;
+    y[357] = t10;
+    t11 = 0.08720250941904868 * t0;
+    y[362] = t11;
+    t7 = C16 * t6;
+    t14 = (-C15) * t9;
+    t18 = t7 + t14;
+    t13 = 0.04426053611132889 * t18;
+    y[117] = t13;
+    t12 = (-0.0496869863118727) * t18;
+    y[122] = t12;
+    t3 = (-C17) * t1;
+    t16 = (-C18) * t17;
+    t15 = t3 + t16;
+    t8 = 0.09070677367426357 * t15;
+    y[277] = t8;
+    t5 = 0.012902477260925535 * t15;
+    y[442] = t5;
+    t2 = C18 * t1;
+    t4 = (-C17) * t17;
+    t10 = t2 + t4;
+    y[37] = 0;
+    t0 = (-0.09187112489811519) * t10;
+    y[202] = t0;
+    t11 = re[78];
+    t6 = im[78];
+    t9 = re[118];
+    t7 = im[118];
+    t14 = re[38];
+    t13 = im[38];
+    t18 = t9 + t14;
+    t12 = t7 + t13;
+    t3 = C5 * t18;
+    t16 = t11 - t3;
+    t8 = C5 * t12;
+    t15 = t6 - t8;
+    t5 = t9 - t14;
+    t1 = C6 * t5;
+    t17 = t7 - t13;
+    t2 = C6 * t17;
+    t4 = t11 + t18;
+    t10 = t6 + t12;
+    t0 = t16 + t2;
+    t3 = t15 - t1;
+    t8 = t16 - t2;
+    t9 = t15 + t1;
+    t14 = (-C19) * t4;
+    t5 = (-C20) * t10;
+    t7 = t14 + t5;
+    t13 = 0.09059613943028794 * t7;
+    y[275] = t13;
+    t17 = 0.011584653483930014 * t7;
+    y[444] = t17;
+    t11 = C20 * t4;
+    t18 = (-C19) * t10;
+    t6 = t11 + t18;
+    y[35] = 0;
+    t12 = (-0.09198331612955407) * t6;
+    y[204] = t12;
+    t16 = C21 * t0;
+    t2 = C22 * t3;
+    t15 = t16 + t2;
+    y[44] = 0;
+    t1 = (-0.09129279661173699) * t15;
+    y[195] = t1;
+    t14 = (-C22) * t0;
+    t5 = C21 * t3;
+    t13 = t14 + t5;
+    t7 = 0.09128138957966771 * t13;
+    y[284] = t7;
+    t17 = 0.018075962073785333 * t13;
+    y[435] = t17;
+    t4 = (-C23) * t8;
+    t10 = (-C24) * t9;
+    t11 = t4 + t10;
+    t18 = 0.09103571973635532 * t11;
+    y[355] = t18;
+    t6 = 0.08593441436671341 * t11;
+    y[364] = t6;
+    t12 = C24 * t8;
+    t16 = (-C23) * t9;
+    t2 = t12 + t16;
+    t15 = 0.042072022784559265 * t2;
+    y[115] = t15;
+    t1 = (-0.05182469812709293) * t2;
+    y[124] = t1;
+    t0 = re[117];
+    t3 = im[117];
+    t14 = re[37];
+    t5 = im[37];
+    t7 = re[77];
+    t13 = im[77];
+    t17 = t14 + t7;
+    t4 = t5 + t13;
+    t10 = C5 * t17;
+    t18 = t0 - t10;
+    t11 = C5 * t4;
+    t6 = t3 - t11;
+    t8 = t14 - t7;
+    t9 = C6 * t8;
+    t12 = t5 - t13;
+    t16 = C6 * t12;
+    t15 = t0 + t17;
+    t2 = t3 + t4;
+    t1 = t18 + t16;
+    t10 = t6 - t9;
+    t11 = t18 - t16;
+    t14 = t6 + t9;
+    t7 = (-C25) * t15;
+    t8 = (-C26) * t2;
+    t5 = t7 + t8;
+    t13 = 0.09195526554211034 * t5;
+    y[353] = t13;
+    t12 = 0.08459145275616263 * t5;
+    y[366] = t12;
+    t0 = C26 * t15;
+    t17 = (-C25) * t2;
+    t3 = t0 + t17;
+    t4 = 0.03988251285128333 * t3;
+    y[113] = t4;
+    t18 = (-0.05393506943227453) * t3;
+    y[126] = t18;
+    t16 = (-C27) * t1;
+    t6 = (-C28) * t10;
+    t9 = t16 + t6;
+    t7 = 0.09050785698244482 * t9;
+    y[273] = t7;
+    t8 = 0.010340424900205238 * t9;
+    y[446] = t8;
+    t13 = C28 * t1;
+    t5 = (-C27) * t10;
+    t12 = t13 + t5;
+    y[33] = 0;
+    t15 = (-0.09207303775792297) * t12;
+    y[206] = t15;
+    t2 = C29 * t11;
+    t0 = C30 * t14;
+    t17 = t2 + t0;
+    y[46] = 0;
+    t4 = (-0.09107277380945689) * t17;
+    y[193] = t4;
+    t3 = (-C30) * t11;
+    t18 = C29 * t14;
+    t16 = t3 + t18;
+    t6 = 0.09150191637698869 * t16;
+    y[286] = t6;
+    t7 = 0.019706630281976074 * t16;
+    y[433] = t7;
+    t9 = re[36];
+    t8 = im[36];
+    t1 = re[76];
+    t10 = im[76];
+    t13 = re[116];
+    t5 = im[116];
+    t12 = t1 + t13;
+    t15 = t10 + t5;
+    t2 = C5 * t12;
+    t0 = t9 - t2;
+    t17 = C5 * t15;
+    t4 = t8 - t17;
+    t11 = t1 - t13;
+    t14 = C6 * t11;
+    t3 = t10 - t5;
+    t18 = C6 * t3;
+    t6 = t9 + t12;
+    t16 = t8 + t15;
+    t7 = t0 + t18;
+    t2 = t4 - t14;
+    t17 = t0 - t18;
+    t1 = t4 + t14;
+    t13 = C31 * t6;
+    t11 = C32 * t16;
+    t10 = t13 + t11;
+    y[48] = 0;
+    t5 = (-0.09082768715553084) * t10;
+    y[191] = t5;
+    t3 = (-C32) * t6;
+    t9 = C31 * t16;
+    t12 = t3 + t9;
+    t8 = 0.09174882235043115 * t12;
+    y[288] = t8;
+    t15 = 0.02140019650804302 * t12;
+    y[431] = t15;
+    t0 = (-C33) * t7;
+    t18 = (-C34) * t2;
+    t4 = t0 + t18;
+    t14 = 0.09279483997724569 * t4;
+    y[351] = t14;
+    t13 = 0.08317465107752332 * t4;
+    y[368] = t13;
+    t11 = C34 * t7;
+    t10 = (-C33) * t2;
+    t5 = t11 + t10;
+    t6 = 0.03769797295232574 * t5;
+    y[111] = t6;
+    t16 = (-0.05601407996358747) * t5;
+    y[128] = t16;
+    t3 = (-C35) * t17;
+    t9 = (-C36) * t1;
+    t8 = t3 + t9;
+    t12 = 0.09044079022064527 * t8;
+    y[271] = t12;
+    t15 = 0.009170726184912756 * t8;
+    y[448] = t15;
+    t0 = C36 * t17;
+    t18 = (-C35) * t1;
+    t14 = t0 + t18;
+    y[31] = 0;
+    t4 = (-0.09214131491999118) * t14;
+    y[208] = t4;
+    t13 = re[75];
+    t7 = im[75];
+    t2 = re[115];
+    t11 = im[115];
+    t10 = re[35];
+    t6 = im[35];
+    t5 = t2 + t10;
+    t16 = t11 + t6;
+    t3 = C5 * t5;
+    t9 = t13 - t3;
+    t12 = C5 * t16;
+    t8 = t7 - t12;
+    t15 = t2 - t10;
+    t17 = C6 * t15;
+    t1 = t11 - t6;
+    t0 = C6 * t1;
+    t18 = t13 + t5;
+    t14 = t7 + t16;
+    t4 = t9 + t0;
+    t3 = t8 - t17;
+    t12 = t9 - t0;
+    t2 = t8 + t17;
+    t10 = (-C37) * t18;
+    t15 = (-C38) * t14;
+    t11 = t10 + t15;
+    t6 = 0.09039410601073432 * t11;
+    y[269] = t6;
+    t1 = 0.008076005721060965 * t11;
+    y[450] = t1;
+    t13 = C38 * t18;
+    t5 = (-C37) * t14;
+    t7 = t13 + t5;
+    y[29] = 0;
+    t16 = (-0.09218890147930385) * t7;
+    y[210] = t16;
+    t9 = C39 * t4;
+    t0 = C40 * t3;
+    t8 = t9 + t0;
+    y[50] = 0;
+    t17 = (-0.09055806752110487) * t8;
+    y[189] = t17;
+    t10 = (-C40) * t4;
+    t15 = C39 * t3;
+    t6 = t10 + t15;
+    t11 = 0.09202198723367433 * t6;
+    y[290] = t11;
+    t1 = 0.023152962148670807 * t6;
+    y[429] = t1;
+    t18 = (-C41) * t12;
+    t14 = (-C42) * t2;
+    t13 = t18 + t14;
+    t5 = 0.09355656451896484 * t13;
+    y[349] = t5;
+    t7 = 0.08168637648109286 * t13;
+    y[370] = t7;
+    t16 = C42 * t12;
+    t9 = (-C41) * t2;
+    t0 = t16 + t9;
+    t8 = 0.035525090341131965 * t0;
+    y[109] = t8;
+    t17 = (-0.05805490461443574) * t0;
+    y[130] = t17;
+    t4 = re[114];
+    t3 = im[114];
+    t10 = re[34];
+    t15 = im[34];
+    t11 = re[74];
+    t6 = im[74];
+    t1 = t10 + t11;
+    t18 = t15 + t6;
+    t14 = C5 * t1;
+    t5 = t4 - t14;
+    t13 = C5 * t18;
+    t7 = t3 - t13;
+    t12 = t10 - t11;
+    t2 = C6 * t12;
+    t16 = t15 - t6;
+    t9 = C6 * t16;
+    t8 = t4 + t1;
+    t0 = t3 + t18;
+    t17 = t5 + t9;
+    t14 = t7 - t2;
+    t13 = t5 - t9;
+    t10 = t7 + t2;
+    t11 = (-C43) * t8;
+    t12 = (-C44) * t0;
+    t15 = t11 + t12;
+    t6 = 0.09424038580969314 * t15;
+    y[347] = t6;
+    t16 = 0.0801298334988885 * t15;
+    y[372] = t16;
+    t4 = C44 * t8;
+    t1 = (-C43) * t0;
+    t3 = t4 + t1;
+    t18 = 0.03336942781104587 * t3;
+    y[107] = t18;
+    t5 = (-0.060053305069332) * t3;
+    y[132] = t5;
+    t9 = (-C45) * t17;
+    t7 = (-C46) * t14;
+    t2 = t9 + t7;
+    t11 = 0.09036665294277783 * t2;
+    y[267] = t11;
+    t12 = 0.007056849639334466 * t2;
+    y[452] = t12;
+    t6 = C46 * t17;
+    t15 = (-C45) * t14;
+    t16 = t6 + t15;
+    y[27] = 0;
+    t8 = (-0.09221690813988859) * t16;
+    y[212] = t8;
+    t0 = C47 * t13;
+    t4 = C48 * t10;
+    t1 = t0 + t4;
+    y[52] = 0;
+    t18 = (-0.09026332159056506) * t1;
+    y[187] = t18;
+    t3 = (-C48) * t13;
+    t5 = C47 * t10;
+    t9 = t3 + t5;
+    t7 = 0.0923224759125681 * t9;
+    y[292] = t7;
+    t11 = 0.024962500697769584 * t9;
+    y[427] = t11;
+    t2 = re[33];
+    t12 = im[33];
+    t17 = re[73];
+    t14 = im[73];
+    t6 = re[113];
+    t15 = im[113];
+    t16 = t17 + t6;
+    t8 = t14 + t15;
+    t0 = C5 * t16;
+    t4 = t2 - t0;
+    t1 = C5 * t8;
+    t18 = t12 - t1;
+    t13 = t17 - t6;
+    t10 = C6 * t13;
+    t3 = t14 - t15;
+    t5 = C6 * t3;
+    t7 = t2 + t16;
+    t9 = t12 + t8;
+    t11 = t4 + t5;
+    t0 = t18 - t10;
+    t1 = t4 - t5;
+    t17 = t18 + t10;
+    t6 = C49 * t7;
+    t13 = C50 * t9;
+    t14 = t6 + t13;
+    y[54] = 0;
+    t15 = (-0.08994493919512188) * t14;
+    y[185] = t15;
+    t3 = (-C50) * t7;
+    t2 = C49 * t9;
+    t16 = t3 + t2;
+    t12 = 0.09264927418823903 * t16;
+    y[294] = t12;
+    t8 = 0.026825028972436063 * t16;
+    y[425] = t8;
+    t4 = (-C51) * t11;
+    t5 = (-C52) * t0;
+    t18 = t4 + t5;
+    t10 = 0.09484585771001464 * t18;
+    y[345] = t10;
+    t6 = 0.07850712007363697 * t18;
+    y[374] = t6;
+    t13 = C52 * t11;
+    t14 = (-C51) * t0;
+    t15 = t13 + t14;
+    t7 = 0.031238088585639097 * t15;
+    y[105] = t7;
+    t9 = (-0.06200503747723192) * t15;
+    y[134] = t9;
+    t3 = (-C53) * t1;
+    t2 = (-C54) * t17;
+    t12 = t3 + t2;
+    t16 = 0.09035733828476188 * t12;
+    y[265] = t16;
+    t8 = 0.006112672898287684 * t12;
+    y[454] = t8;
+    t4 = C54 * t1;
+    t5 = (-C53) * t17;
+    t10 = t4 + t5;
+    y[25] = 0;
+    t18 = (-0.0922264144951987) * t10;
+    y[214] = t18;
+    t6 = re[72];
+    t11 = im[72];
+    t0 = re[112];
+    t13 = im[112];
+    t14 = re[32];
+    t7 = im[32];
+    t15 = t0 + t14;
+    t9 = t13 + t7;
+    t3 = C5 * t15;
+    t2 = t6 - t3;
+    t16 = C5 * t9;
+    t12 = t11 - t16;
+    t8 = t0 - t14;
+    t1 = C6 * t8;
+    t17 = t13 - t7;
+    t4 = C6 * t17;
+    t5 = t6 + t15;
+    t10 = t11 + t9;
+    t18 = t2 + t4;
+    t3 = t12 - t1;
+    t16 = t2 - t4;
+    t0 = t12 + t1;
+    t14 = (-C55) * t5;
+    t8 = (-C56) * t10;
+    t13 = t14 + t8;
+    t7 = 0.09036492994132213 * t13;
+    y[263] = t7;
+    t17 = 0.005243370587864342 * t13;
+    y[456] = t17;
+    t6 = C56 * t5;
+    t15 = (-C55) * t10;
+    t11 = t6 + t15;
+    y[23] = 0;
+    t9 = (-0.09221866645328587) * t11;
+    y[216] = t9;
+    t2 = C57 * t18;
+    t4 = C58 * t3;
+    t12 = t2 + t4;
+    t1 = 0.000329259000948847 * t12;
+    y[56] = t1;
+    t14 = (-0.0895480206469585) * t12;
+    y[183] = t14;
+    t8 = (-C58) * t18;
+    t7 = C57 * t3;
+    t13 = t8 + t7;
+    t17 = 0.09295427829844087 * t13;
+    y[296] = t17;
+    t5 = 0.02873634741694584 * t13;
+    y[423] = t5;
+    t10 = (-C59) * t16;
+    t6 = (-C60) * t0;
+    t15 = t10 + t6;
+    t11 = 0.0953754441237799 * t15;
+    y[343] = t11;
+    t9 = 0.07682020725123924 * t15;
+    y[376] = t9;
+    t2 = C60 * t16;
+    t4 = (-C59) * t0;
+    t1 = t2 + t4;
+    t12 = 0.029137704355627222 * t1;
+    y[103] = t12;
+    t14 = (-0.06390501141990558) * t1;
+    y[136] = t14;
+    t18 = re[111];
+    t3 = im[111];
+    t8 = re[31];
+    t7 = im[31];
+    t17 = re[71];
+    t13 = im[71];
+    t5 = t8 + t17;
+    t10 = t7 + t13;
+    t6 = C5 * t5;
+    t11 = t18 - t6;
+    t15 = C5 * t10;
+    t9 = t3 - t15;
+    t16 = t8 - t17;
+    t0 = C6 * t16;
+    t2 = t7 - t13;
+    t4 = C6 * t2;
+    t12 = t18 + t5;
+    t1 = t3 + t10;
+    t14 = t11 + t4;
+    t6 = t9 - t0;
+    t15 = t11 - t4;
+    t8 = t9 + t0;
+    t17 = (-C61) * t12;
+    t16 = (-C62) * t1;
+    t7 = t17 + t16;
+    t13 = 0.0958302170606977 * t7;
+    y[341] = t13;
+    t2 = 0.07507241738097777 * t7;
+    y[378] = t2;
+    t18 = C62 * t12;
+    t5 = (-C61) * t1;
+    t3 = t18 + t5;
+    t10 = 0.027074672896674333 * t3;
+    y[101] = t10;
+    t11 = (-0.06574932607311029) * t3;
+    y[138] = t11;
+    t4 = (-C63) * t14;
+    t9 = (-C64) * t6;
+    t0 = t4 + t9;
+    t17 = 0.09038829747800994 * t0;
+    y[261] = t17;
+    t16 = 0.004448082232380634 * t0;
+    y[458] = t16;
+    t13 = C64 * t14;
+    t7 = (-C63) * t6;
+    t2 = t13 + t7;
+    y[21] = 0;
+    t12 = (-0.09219482572244161) * t2;
+    y[218] = t12;
+    t1 = C65 * t15;
+    t18 = C66 * t8;
+    t5 = t1 + t18;
+    t10 = 0.0005543023788221308 * t5;
+    y[58] = t10;
+    t3 = (-0.08913894680518375) * t5;
+    y[181] = t3;
+    t11 = (-C66) * t15;
+    t4 = C65 * t8;
+    t9 = t11 + t4;
+    t17 = 0.09329614388539122 * t9;
+    y[298] = t17;
+    t0 = 0.030693222787216617 * t9;
+    y[421] = t0;
+    t16 = re[30];
+    t14 = im[30];
+    t6 = re[70];
+    t13 = im[70];
+    t7 = re[110];
+    t2 = im[110];
+    t12 = t6 + t7;
+    t1 = t13 + t2;
+    t18 = C5 * t12;
+    t10 = t16 - t18;
+    t5 = C5 * t1;
+    t3 = t14 - t5;
+    t15 = t6 - t7;
+    t8 = C6 * t15;
+    t11 = t13 - t2;
+    t4 = C6 * t11;
+    t17 = t16 + t12;
+    t9 = t14 + t1;
+    t0 = t10 + t4;
+    t18 = t3 - t8;
+    t5 = t10 - t4;
+    t6 = t3 + t8;
+    t7 = C67 * t17;
+    t15 = C68 * t9;
+    t13 = t7 + t15;
+    t2 = 0.0008692481724313596 * t13;
+    y[60] = t2;
+    t11 = (-0.08868530563218803) * t13;
+    y[179] = t11;
+    t16 = (-C68) * t17;
+    t12 = C67 * t9;
+    t14 = t16 + t12;
+    t1 = 0.09364478174038289 * t14;
+    y[300] = t1;
+    t10 = 0.03269174986983001 * t14;
+    y[419] = t10;
+    t4 = (-C69) * t0;
+    t3 = (-C70) * t18;
+    t8 = t4 + t3;
+    t7 = 0.09621138331081235 * t8;
+    y[339] = t7;
+    t15 = 0.07326697035985012 * t8;
+    y[380] = t15;
+    t2 = C70 * t0;
+    t13 = (-C69) * t18;
+    t11 = t2 + t13;
+    t17 = 0.02505487541976712 * t11;
+    y[99] = t17;
+    t9 = (-0.06753502854847021) * t11;
+    y[140] = t9;
+    t16 = (-C71) * t5;
+    t12 = (-C72) * t6;
+    t1 = t16 + t12;
+    t14 = 0.09042611495709132 * t1;
+    y[259] = t14;
+    t10 = 0.0037258660788030895 * t1;
+    y[460] = t10;
+    t4 = C72 * t5;
+    t3 = (-C71) * t6;
+    t7 = t4 + t3;
+    y[19] = 0;
+    t8 = (-0.09215626854352463) * t7;
+    y[220] = t8;
+    t15 = re[69];
+    t0 = im[69];
+    t18 = re[109];
+    t2 = im[109];
+    t13 = re[29];
+    t17 = im[29];
+    t11 = t18 + t13;
+    t9 = t2 + t17;
+    t16 = C5 * t11;
+    t12 = t15 - t16;
+    t14 = C5 * t9;
+    t1 = t0 - t14;
+    t10 = t18 - t13;
+    t5 = C6 * t10;
+    t6 = t2 - t17;
+    t4 = C6 * t6;
+    t3 = t15 + t11;
+    t7 = t0 + t9;
+    t8 = t12 + t4;
+    t16 = t1 - t5;
+    t14 = t12 - t4;
+    t18 = t1 + t5;
+    t13 = (-C73) * t3;
+    t10 = (-C74) * t7;
+    t2 = t13 + t10;
+    t17 = 0.0904771972914263 * t2;
+    y[257] = t17;
+    t6 = 0.0030761966919491423 * t2;
+    y[462] = t6;
+    t15 = C74 * t3;
+    t11 = (-C73) * t7;
+    t0 = t15 + t11;
+    y[17] = 0;
+    t9 = (-0.09210423822581212) * t0;
+    y[222] = t9;
+    t12 = C75 * t8;
+    t4 = C76 * t16;
+    t1 = t12 + t4;
+    t5 = 0.001266586606840836 * t1;
+    y[62] = t5;
+    t13 = (-0.08818615927816541) * t1;
+    y[177] = t13;
+    t10 = (-C76) * t8;
+    t17 = C75 * t16;
+    t2 = t10 + t17;
+    t6 = 0.09399827813076395 * t2;
+    y[302] = t6;
+    t3 = 0.034728147276250475 * t2;
+    y[417] = t3;
+    t7 = (-C77) * t14;
+    t15 = (-C78) * t18;
+    t11 = t7 + t15;
+    t0 = 0.09652165615928737 * t11;
+    y[337] = t0;
+    t9 = 0.07140668037545762 * t11;
+    y[382] = t9;
+    t12 = C78 * t14;
+    t4 = (-C77) * t18;
+    t5 = t12 + t4;
+    t1 = 0.02308496315134304 * t5;
+    y[97] = t1;
+    t13 = (-0.06925816458302594) * t5;
+    y[142] = t13;
+    t8 = re[108];
+    t16 = im[108];
+    t10 = re[28];
+    t17 = im[28];
+    t6 = re[68];
+    t2 = im[68];
+    t3 = t10 + t6;
+    t7 = t17 + t2;
+    t15 = C5 * t3;
+    t0 = t8 - t15;
+    t11 = C5 * t7;
+    t9 = t16 - t11;
+    t14 = t10 - t6;
+    t18 = C6 * t14;
+    t12 = t17 - t2;
+    t4 = C6 * t12;
+    t1 = t8 + t3;
+    t5 = t16 + t7;
+    t13 = t0 + t4;
+    t15 = t9 - t18;
+    t11 = t0 - t4;
+    t10 = t9 + t18;
+    t6 = (-C79) * t1;
+    t14 = (-C80) * t5;
+    t17 = t6 + t14;
+    t2 = 0.0967631084341196 * t17;
+    y[335] = t2;
+    t12 = 0.06949540812097872 * t17;
+    y[384] = t12;
+    t8 = C80 * t1;
+    t3 = (-C79) * t5;
+    t16 = t8 + t3;
+    t7 = 0.02117182715100995 * t16;
+    y[95] = t7;
+    t0 = (-0.07091533825082738) * t16;
+    y[144] = t0;
+    t4 = (-C81) * t13;
+    t9 = (-C82) * t15;
+    t18 = t4 + t9;
+    t6 = 0.09054017105349113 * t18;
+    y[255] = t6;
+    t14 = 0.002497218153517526 * t18;
+    y[464] = t14;
+    t2 = C82 * t13;
+    t17 = (-C81) * t15;
+    t12 = t2 + t17;
+    y[15] = 0;
+    t1 = (-0.09204017660194169) * t12;
+    y[224] = t1;
+    t5 = C83 * t11;
+    t8 = C84 * t10;
+    t3 = t5 + t8;
+    t7 = 0.0017527181996514706 * t3;
+    y[64] = t7;
+    t16 = (-0.08763727041503364) * t3;
+    y[175] = t16;
+    t0 = (-C84) * t11;
+    t4 = C83 * t10;
+    t9 = t0 + t4;
+    t6 = 0.09435297960865555 * t9;
+    y[304] = t6;
+    t18 = 0.036797555316227276 * t9;
+    y[415] = t18;
+    t14 = re[27];
+    t13 = im[27];
+    t15 = re[67];
+    t2 = im[67];
+    t17 = re[107];
+    t12 = im[107];
+    t1 = t15 + t17;
+    t5 = t2 + t12;
+    t8 = C5 * t1;
+    t7 = t14 - t8;
+    t3 = C5 * t5;
+    t16 = t13 - t3;
+    t11 = t15 - t17;
+    t10 = C6 * t11;
+    t0 = t2 - t12;
+    t4 = C6 * t0;
+    t6 = t14 + t1;
+    t9 = t13 + t5;
+    t18 = t7 + t4;
+    t8 = t16 - t10;
+    t3 = t7 - t4;
+    t15 = t16 + t10;
+    t17 = C85 * t6;
+    t11 = C86 * t9;
+    t2 = t17 + t11;
+    t12 = 0.0023321697985883467 * t2;
+    y[66] = t12;
+    t0 = (-0.08703551219791075) * t2;
+    y[173] = t0;
+    t14 = (-C86) * t6;
+    t1 = C85 * t9;
+    t13 = t14 + t1;
+    t5 = 0.09470412254796516 * t13;
+    y[306] = t5;
+    t7 = 0.03889576143743222 * t13;
+    y[413] = t7;
+    t4 = (-C87) * t18;
+    t16 = (-C88) * t8;
+    t10 = t4 + t16;
+    t17 = 0.09693835832518913 * t10;
+    y[333] = t17;
+    t11 = 0.06753718307378472 * t10;
+    y[386] = t11;
+    t12 = C88 * t18;
+    t2 = (-C87) * t8;
+    t0 = t12 + t2;
+    t6 = 0.01931982303769135 * t0;
+    y[93] = t6;
+    t9 = (-0.07250511592434625) * t0;
+    y[146] = t9;
+    t14 = (-C89) * t3;
+    t1 = (-C90) * t15;
+    t5 = t14 + t1;
+    t13 = 0.09061382845181774 * t5;
+    y[253] = t13;
+    t7 = 0.001987292053496043 * t5;
+    y[466] = t7;
+    t4 = C90 * t3;
+    t16 = (-C89) * t15;
+    t17 = t4 + t16;
+    y[13] = 0;
+    t10 = (-0.09196535976585991) * t17;
+    y[226] = t10;
+    t11 = re[66];
+    t18 = im[66];
+    t8 = re[106];
+    t12 = im[106];
+    t2 = re[26];
+    t6 = im[26];
+    t0 = t8 + t2;
+    t9 = t12 + t6;
+    t14 = C5 * t0;
+    t1 = t11 - t14;
+    t13 = C5 * t9;
+    t5 = t18 - t13;
+    t7 = t8 - t2;
+    t3 = C6 * t7;
+    t15 = t12 - t6;
+    t4 = C6 * t15;
+    t16 = t11 + t0;
+    t17 = t18 + t9;
+    t10 = t1 + t4;
+    t14 = t5 - t3;
+    t13 = t1 - t4;
+    t8 = t5 + t3;
+    t2 = (-C91) * t16;
+    t7 = (-C92) * t17;
+    t12 = t2 + t7;
+    t6 = 0.09069677564541208 * t12;
+    y[251] = t6;
+    t15 = 0.0015455547772786204 * t12;
+    y[468] = t15;
+    t11 = C92 * t16;
+    t0 = (-C91) * t17;
+    t18 = t11 + t0;
+    y[11] = 0;
+    t9 = (-0.09188125238226012) * t18;
+    y[228] = t9;
+    t1 = C93 * t10;
+    t4 = C94 * t14;
+    t5 = t1 + t4;
+    t3 = 0.0030078610211779653 * t5;
+    y[68] = t3;
+    t2 = (-0.08637786614799858) * t5;
+    y[171] = t2;
+    t7 = (-C94) * t10;
+    t6 = C93 * t14;
+    t12 = t7 + t6;
+    t15 = 0.09504699657158702 * t12;
+    y[308] = t15;
+    t16 = 0.0410180473216129 * t12;
+    y[411] = t16;
+    t17 = (-C95) * t13;
+    t11 = (-C96) * t8;
+    t0 = t17 + t11;
+    t18 = 0.09705031121367907 * t0;
+    y[331] = t18;
+    t9 = 0.0655371423617569 * t0;
+    y[388] = t9;
+    t1 = C96 * t13;
+    t4 = (-C95) * t8;
+    t3 = t1 + t4;
+    t5 = 0.01753462890895542 * t3;
+    y[91] = t5;
+    t2 = (-0.07402515017647827) * t3;
+    y[148] = t2;
+    t10 = re[105];
+    t14 = im[105];
+    t7 = re[25];
+    t6 = im[25];
+    t15 = re[65];
+    t12 = im[65];
+    t16 = t7 + t15;
+    t17 = t6 + t12;
+    t11 = C5 * t16;
+    t18 = t10 - t11;
+    t0 = C5 * t17;
+    t9 = t14 - t0;
+    t13 = t7 - t15;
+    t8 = C6 * t13;
+    t1 = t6 - t12;
+    t4 = C6 * t1;
+    t5 = t10 + t16;
+    t3 = t14 + t17;
+    t2 = t18 + t4;
+    t11 = t9 - t8;
+    t0 = t18 - t4;
+    t7 = t9 + t8;
+    t15 = (-C97) * t5;
+    t13 = (-C98) * t3;
+    t6 = t15 + t13;
+    t12 = 0.09710297608583138 * t6;
+    y[329] = t12;
+    t1 = 0.06349934378312706 * t6;
+    y[390] = t1;
+    t10 = C98 * t5;
+    t16 = (-C97) * t3;
+    t14 = t10 + t16;
+    t17 = 0.015820600627638397 * t14;
+    y[89] = t17;
+    t18 = (-0.07547385127254332) * t14;
+    y[150] = t18;
+    t4 = (-C99) * t2;
+    t9 = (-C100) * t11;
+    t8 = t4 + t9;
+    t15 = 0.09078772377604616 * t8;
+    y[249] = t15;
+    t13 = 0.0011685767792350902 * t8;
+    y[470] = t13;
+    t12 = C100 * t2;
+    t6 = (-C99) * t11;
+    t1 = t12 + t6;
+    y[9] = 0;
+    t5 = (-0.09178920879093609) * t1;
+    y[230] = t5;
+    t3 = C101 * t0;
+    t10 = C102 * t7;
+    t16 = t3 + t10;
+    t17 = 0.003781295030218233 * t16;
+    y[70] = t17;
+    t14 = (-0.0856603118363894) * t16;
+    y[169] = t14;
+    t18 = (-C102) * t0;
+    t4 = C101 * t7;
+    t9 = t18 + t4;
+    t15 = 0.09537830588915777 * t9;
+    y[310] = t15;
+    t8 = 0.04315926346326986 * t9;
+    y[409] = t8;
+    t13 = re[24];
+    t2 = im[24];
+    t11 = re[64];
+    t12 = im[64];
+    t6 = re[104];
+    t1 = im[104];
+    t5 = t11 + t6;
+    t3 = t12 + t1;
+    t10 = C5 * t5;
+    t17 = t13 - t10;
+    t16 = C5 * t3;
+    t14 = t2 - t16;
+    t0 = t11 - t6;
+    t7 = C6 * t0;
+    t18 = t12 - t1;
+    t4 = C6 * t18;
+    t15 = t13 + t5;
+    t9 = t2 + t3;
+    t8 = t17 + t4;
+    t10 = t14 - t7;
+    t16 = t17 - t4;
+    t11 = t14 + t7;
+    t6 = C103 * t15;
+    t0 = C104 * t9;
+    t12 = t6 + t0;
+    t1 = 0.0046529099454776825 * t12;
+    y[72] = t1;
+    t18 = (-0.08488084990913544) * t12;
+    y[167] = t18;
+    t13 = (-C104) * t15;
+    t5 = C103 * t9;
+    t2 = t13 + t5;
+    t3 = 0.09569280241720633 * t2;
+    y[312] = t3;
+    t17 = 0.045315068730014604 * t2;
+    y[407] = t17;
+    t4 = (-C105) * t8;
+    t14 = (-C106) * t10;
+    t7 = t4 + t14;
+    t6 = 0.09709912723798485 * t7;
+    y[327] = t6;
+    t0 = 0.06142731431140673 * t7;
+    y[392] = t0;
+    t1 = C106 * t8;
+    t12 = (-C105) * t10;
+    t18 = t1 + t12;
+    t15 = 0.014182605054244018 * t18;
+    y[87] = t15;
+    t9 = (-0.0768506804043917) * t18;
+    y[152] = t9;
+    t13 = (-C107) * t16;
+    t5 = (-C108) * t11;
+    t3 = t13 + t5;
+    t2 = 0.09088527913459936 * t3;
+    y[247] = t2;
+    t17 = 0.0008531948944978419 * t3;
+    y[472] = t17;
+    t4 = C108 * t16;
+    t14 = (-C107) * t11;
+    t6 = t4 + t14;
+    y[7] = 0;
+    t7 = (-0.09169068316324167) * t6;
+    y[232] = t7;
+    t0 = re[63];
+    t8 = im[63];
+    t10 = re[103];
+    t1 = im[103];
+    t12 = re[23];
+    t15 = im[23];
+    t18 = t10 + t12;
+    t9 = t1 + t15;
+    t13 = C5 * t18;
+    t5 = t0 - t13;
+    t2 = C5 * t9;
+    t3 = t8 - t2;
+    t17 = t10 - t12;
+    t16 = C6 * t17;
+    t11 = t1 - t15;
+    t4 = C6 * t11;
+    t14 = t0 + t18;
+    t6 = t8 + t9;
+    t7 = t5 + t4;
+    t13 = t3 - t16;
+    t2 = t5 - t4;
+    t10 = t3 + t16;
+    t12 = (-C109) * t14;
+    t17 = (-C110) * t6;
+    t1 = t12 + t17;
+    t15 = 0.09098818490486592 * t1;
+    y[245] = t15;
+    t11 = 0.0005958118887355562 * t1;
+    y[474] = t11;
+    t0 = C110 * t14;
+    t18 = (-C109) * t6;
+    t8 = t0 + t18;
+    y[5] = 0;
+    t9 = (-0.09158698288185847) * t8;
+    y[234] = t9;
+    t5 = C111 * t7;
+    t4 = C112 * t13;
+    t3 = t5 + t4;
+    t16 = 0.005622135445844074 * t3;
+    y[74] = t16;
+    t12 = (-0.08403708295850383) * t3;
+    y[165] = t12;
+    t17 = (-C112) * t7;
+    t15 = C111 * t13;
+    t1 = t17 + t15;
+    t11 = 0.09598610074001072 * t1;
+    y[314] = t11;
+    t14 = 0.04748043250702334 * t1;
+    y[405] = t14;
+    t6 = (-C113) * t2;
+    t0 = (-C114) * t10;
+    t18 = t6 + t0;
+    t8 = 0.09704334336966204 * t18;
+    y[325] = t8;
+    t9 = 0.059326876889732816 * t18;
+    y[394] = t9;
+    t5 = C114 * t2;
+    t4 = (-C113) * t10;
+    t16 = t5 + t4;
+    t3 = 0.012624949394551927 * t16;
+    y[85] = t3;
+    t12 = (-0.07815409333098762) * t16;
+    y[154] = t12;
+}
+
+/**
+ *  Part 3 of ApplyWindowedIMDCT_W75_240_K60().
+ * 
+ *  @param {Number[]} X 
+ *    - The input block (240 points, only the first 60 points are used).
+ *  @param {Number[]} y 
+ *    - The array that would contain the output block (480 points).
+ *  @param {Number[]} re 
+ *    - The scratch buffer (real part, 120 points).
+ *  @param {Number[]} im 
+ *    - The scratch buffer (imaginary part, 120 points).
+ */
+function ApplyWindowedIMDCT_W75_240_K60_Part3(X, y, re, im) {
+    let t0, t1, t10, t11, t12, t13, t14, t15, t16, t17, t18, t2, t3, t4, t5, t6, t7, t8, t9;
+    const C0 = 0.5;
+    const C1 = 0.8660254037844386;
+    const C2 = 0.9716007669441208;
+    const C3 = 0.23662618129360988;
+    const C4 = 0.7231178558632475;
+    const C5 = 0.6907246676728287;
+    const C6 = 0.2808760992712921;
+    const C7 = 0.9597440371568574;
+    const C8 = 0.2682893746360714;
+    const C9 = 0.9633383681019799;
+    const C10 = 0.968420186534595;
+    const C11 = 0.24932377005071168;
+    const C12 = 0.7140145980512682;
+    const C13 = 0.7001308118985237;
+    const C14 = 0.7047889975136701;
+    const C15 = 0.709416992313883;
+    const C16 = 0.2556566799976644;
+    const C17 = 0.9667676359770075;
+    const C18 = 0.9650736723115474;
+    const C19 = 0.26197863846333747;
+    const C20 = 0.9615617976829619;
+    const C21 = 0.27458861818493235;
+    const C22 = 0.6954426350096117;
+    const C23 = 0.7185816177796981;
+    const C24 = 0.24298017990326387;
+    const C25 = 0.970031253194544;
+    const C26 = 0.23026204640590237;
+    const C27 = 0.97312866055058;
+    const C28 = 0.9578851643904772;
+    const C29 = 0.2871515485603873;
+    const C30 = 0.6859771119901928;
+    const C31 = 0.7276231179845748;
+    const C32 = 0.6763940503240542;
+    const C33 = 0.736539943713999;
+    const C34 = 0.21750445869228147;
+    const C35 = 0.9760593273203108;
+    const C36 = 0.9540444024062804;
+    const C37 = 0.2996652769962566;
+    const C38 = 0.9500401698251654;
+    const C39 = 0.3121276593295937;
+    const C40 = 0.6666950920194786;
+    const C41 = 0.7453305671157858;
+    const C42 = 0.2047096027093796;
+    const C43 = 0.9788227513490724;
+    const C44 = 0.19187967078990142;
+    const C45 = 0.9814184591383835;
+    const C46 = 0.945873152751771;
+    const C47 = 0.32453656019534216;
+    const C48 = 0.6568818989430413;
+    const C49 = 0.7539934819618695;
+    const C50 = 0.6469561525348573;
+    const C51 = 0.7625272039063882;
+    const C52 = 0.17901686127663266;
+    const C53 = 0.9838460059270774;
+    const C54 = 0.9415440651830208;
+    const C55 = 0.33688985339222005;
+    const C56 = 0.9370536488857836;
+    const C57 = 0.34918542224703286;
+    const C58 = 0.6369195535204759;
+    const C59 = 0.7709302707400181;
+    const C60 = 0.16612337814576547;
+    const C61 = 0.9861049757675088;
+    const C62 = 0.15320143062925848;
+    const C63 = 0.9881949815968246;
+    const C64 = 0.9324026732697752;
+    const C65 = 0.361421159977355;
+    const C66 = 0.6267738216194696;
+    const C67 = 0.7792012426405167;
+    const C68 = 0.6165206952507691;
+    const C69 = 0.7873387024194278;
+    const C70 = 0.14025323283629626;
+    const C71 = 0.9901156653032855;
+    const C72 = 0.927591935255724;
+    const C73 = 0.37359497005251635;
+    const C74 = 0.9226222591388232;
+    const C75 = 0.3857047665528313;
+    const C76 = 0.6061619312347947;
+    const C77 = 0.79534125576491;
+    const C78 = 0.1272810033739132;
+    const C79 = 0.991866697787626;
+    const C80 = 0.1142869649668464;
+    const C81 = 0.9934477790194444;
+    const C82 = 0.9174944964474913;
+    const C83 = 0.39774847452701106;
+    const C84 = 0.5956993044924334;
+    const C85 = 0.8032075314806449;
+    const C86 = 0.5851346077409155;
+    const C87 = 0.8109361817207843;
+    const C88 = 0.10127334407668342;
+    const C89 = 0.9948586380886109;
+    const C90 = 0.9122095257974677;
+    const C91 = 0.4097240303476953;
+    const C92 = 0.9067682527412662;
+    const C93 = 0.4216293820650445;
+    const C94 = 0.5744696511866426;
+    const C95 = 0.8185258822208966;
+    const C96 = 0.08824237052036951;
+    const C97 = 0.9960990332516871;
+    const C98 = 0.0751962770881399;
+    const C99 = 0.9971687519733476;
+    const C100 = 0.9011716096130131;
+    const C101 = 0.4334624897583309;
+    const C102 = 0.5637062622150166;
+    const C103 = 0.8259753325248732;
+    const C104 = 0.5528462850773279;
+    const C105 = 0.8332832562077542;
+    const C106 = 0.062137299160942724;
+    const C107 = 0.9980676109627962;
+    const C108 = 0.895420555368697;
+    const C109 = 0.4452213258854682;
+    const C110 = 0.8895160754218561;
+    const C111 = 0.4569038756304206;
+    const C112 = 0.5418915805747517;
+    const C113 = 0.840448401094438;
+    const C114 = 0.049067674327418015;
+    const C115 = 0.9987954562051724;
+    const C116 = 0.035989642000498374;
+    const C117 = 0.9993521629879409;
+    const C118 = 0.8834591814747328;
+    const C119 = 0.46850813724843143;
+    const C120 = 0.5308440257395095;
+    const C121 = 0.8474695394742344;
+    const C122 = 0.5197055135132492;
+    const C123 = 0.8543454683112272;
+    const C124 = 0.02290544303369714;
+    const C125 = 0.9997376359222604;
+    const C126 = 0.8772509113449243;
+    const C127 = 0.4800321224090111;
+    const C128 = 0.8708923287875567;
+    const C129 = 0.49147385653662823;
+    const C130 = 0.5084779524226998;
+    const C131 = 0.861075009450407;
+    const C132 = 0.009817319337149617;
+    const C133 = 0.999951808959328;
+    t7 = re[102];
+    t13 = im[102];
+    t17 = re[22];
+    t15 = im[22];
+    t11 = re[62];
+    t1 = im[62];
+    t14 = t17 + t11;
+    t6 = t15 + t1;
+    t0 = C0 * t14;
+    t8 = t7 - t0;
+    t18 = C0 * t6;
+    t9 = t13 - t18;
+    t2 = t17 - t11;
+    t10 = C1 * t2;
+    t5 = t15 - t1;
+    t4 = C1 * t5;
+    t3 = t7 + t14;
+    t16 = t13 + t6;
+    t12 = t8 + t4;
+    t0 = t9 - t10;
+    t18 = t8 - t4;
+    t17 = t9 + t10;
+    t11 = (-C2) * t3;
+    t2 = (-C3) * t16;
+    t15 = t11 + t2;
+    t1 = 0.09693980393114883 * t15;
+    y[323] = t1;
+    t5 = 0.05720267793605442 * t15;
+    y[396] = t5;
+    t7 = C3 * t3;
+    t14 = (-C2) * t16;
+    t13 = t7 + t14;
+    t6 = 0.011150290256942962 * t13;
+    y[83] = t6;
+    t8 = (-0.07938438658631503) * t13;
+    y[156] = t8;
+    t4 = (-C4) * t12;
+    t9 = (-C5) * t0;
+    t10 = t4 + t9;
+    t11 = 0.09109495310907251 * t10;
+    y[243] = t11;
+    t2 = 0.0003913811942012797 * t10;
+    y[476] = t2;
+    t1 = C5 * t12;
+    t15 = (-C4) * t0;
+    t5 = t1 + t15;
+    y[3] = 0;
+    t3 = (-0.09147963799218842) * t5;
+    y[236] = t3;
+    t16 = C6 * t18;
+    t7 = C7 * t17;
+    t14 = t16 + t7;
+    t6 = 0.006687843776213512 * t14;
+    y[76] = t6;
+    t13 = (-0.08312516910399824) * t14;
+    y[163] = t13;
+    t8 = (-C7) * t18;
+    t4 = C6 * t17;
+    t9 = t8 + t4;
+    t11 = 0.09625582992869657 * t9;
+    y[316] = t11;
+    t10 = 0.049649962585211385 * t9;
+    y[403] = t10;
+    t2 = re[21];
+    t12 = im[21];
+    t0 = re[61];
+    t1 = im[61];
+    t15 = re[101];
+    t5 = im[101];
+    t3 = t0 + t15;
+    t16 = t1 + t5;
+    t7 = C0 * t3;
+    t6 = t2 - t7;
+    t14 = C0 * t16;
+    t13 = t12 - t14;
+    t18 = t0 - t15;
+    t17 = C1 * t18;
+    t8 = t1 - t5;
+    t4 = C1 * t8;
+    t11 = t2 + t3;
+    t9 = t12 + t16;
+    t10 = t6 + t4;
+    t7 = t13 - t17;
+    t14 = t6 - t4;
+    t0 = t13 + t17;
+    t15 = C8 * t11;
+    t18 = C9 * t9;
+    t1 = t15 + t18;
+    t5 = 0.00784829303888874 * t1;
+    y[78] = t5;
+    t8 = (-0.08214494215885092) * t1;
+    y[161] = t8;
+    t2 = (-C9) * t11;
+    t3 = C8 * t9;
+    t12 = t2 + t3;
+    t16 = 0.09649583471076638 * t12;
+    y[318] = t16;
+    t6 = 0.051818729299763125 * t12;
+    y[401] = t6;
+    t4 = (-C10) * t10;
+    t13 = (-C11) * t7;
+    t17 = t4 + t13;
+    t15 = 0.0967912198161176 * t17;
+    y[321] = t15;
+    t18 = 0.055058748193673866 * t17;
+    y[398] = t18;
+    t5 = C11 * t10;
+    t1 = (-C10) * t7;
+    t8 = t5 + t1;
+    t11 = 0.00976233994080978 * t8;
+    y[81] = t11;
+    t9 = (-0.08054275100119243) * t8;
+    y[158] = t9;
+    t2 = (-C12) * t14;
+    t3 = (-C13) * t0;
+    t16 = t2 + t3;
+    t12 = 0.09120428548155567 * t16;
+    y[241] = t12;
+    t6 = 0.00023413481508896496 * t16;
+    y[478] = t6;
+    t4 = C13 * t14;
+    t13 = (-C12) * t0;
+    t15 = t4 + t13;
+    y[1] = 0;
+    t17 = (-0.0913699755371538) * t15;
+    y[238] = t17;
+    t18 = re[60];
+    t10 = im[60];
+    t7 = re[100];
+    t5 = im[100];
+    t1 = re[20];
+    t11 = im[20];
+    t8 = t7 + t1;
+    t9 = t5 + t11;
+    t2 = C0 * t8;
+    t3 = t18 - t2;
+    t12 = C0 * t9;
+    t16 = t10 - t12;
+    t6 = t7 - t1;
+    t14 = C1 * t6;
+    t0 = t5 - t11;
+    t4 = C1 * t0;
+    t13 = t18 + t8;
+    t15 = t10 + t9;
+    t17 = t3 + t4;
+    t2 = t16 - t14;
+    t12 = t3 - t4;
+    t7 = t16 + t14;
+    t1 = C14 * t13;
+    t6 = C15 * t15;
+    t5 = t1 + t6;
+    y[0] = 0;
+    t11 = (-0.09131475557438358) * t5;
+    y[239] = t11;
+    t0 = (-C15) * t13;
+    t18 = C14 * t15;
+    t8 = t0 + t18;
+    t10 = 0.09125943864072585 * t8;
+    y[240] = t10;
+    t9 = 0.0001687287062834231 * t8;
+    y[479] = t9;
+    t3 = C16 * t17;
+    t4 = C17 * t2;
+    t16 = t3 + t4;
+    t14 = 0.009101559537619174 * t16;
+    y[80] = t14;
+    t1 = (-0.08109490290798863) * t16;
+    y[159] = t1;
+    t6 = (-C17) * t17;
+    t5 = C16 * t2;
+    t11 = t6 + t5;
+    t13 = 0.09670175848871748 * t11;
+    y[320] = t13;
+    t15 = 0.05398125624826106 * t11;
+    y[399] = t15;
+    t0 = (-C18) * t12;
+    t18 = (-C19) * t7;
+    t10 = t0 + t18;
+    t8 = 0.0966031645769662 * t10;
+    y[319] = t8;
+    t9 = 0.0529011247003047 * t10;
+    y[400] = t9;
+    t3 = C19 * t12;
+    t4 = (-C18) * t7;
+    t14 = t3 + t4;
+    t16 = 0.008463448060253795 * t14;
+    y[79] = t16;
+    t1 = (-0.0816288725802624) * t14;
+    y[160] = t1;
+    t17 = re[99];
+    t2 = im[99];
+    t6 = re[19];
+    t5 = im[19];
+    t13 = re[59];
+    t11 = im[59];
+    t15 = t6 + t13;
+    t0 = t5 + t11;
+    t18 = C0 * t15;
+    t8 = t17 - t18;
+    t10 = C0 * t0;
+    t9 = t2 - t10;
+    t12 = t6 - t13;
+    t7 = C1 * t12;
+    t3 = t5 - t11;
+    t4 = C1 * t3;
+    t16 = t17 + t15;
+    t14 = t2 + t0;
+    t1 = t8 + t4;
+    t18 = t9 - t7;
+    t10 = t8 - t4;
+    t6 = t9 + t7;
+    t13 = (-C20) * t16;
+    t12 = (-C21) * t14;
+    t5 = t13 + t12;
+    t11 = 0.09637995258792109 * t5;
+    y[317] = t11;
+    t3 = 0.05073477379794547 * t5;
+    y[402] = t3;
+    t17 = C21 * t16;
+    t15 = (-C20) * t14;
+    t2 = t17 + t15;
+    t0 = 0.007256349955859877 * t2;
+    y[77] = t0;
+    t8 = (-0.08264357727773244) * t2;
+    y[162] = t8;
+    t4 = C22 * t1;
+    t9 = C23 * t18;
+    t7 = t4 + t9;
+    y[2] = 0;
+    t13 = (-0.09142501297733138) * t7;
+    y[237] = t13;
+    t12 = (-C23) * t1;
+    t11 = C22 * t18;
+    t5 = t12 + t11;
+    t3 = 0.09114938091832223 * t5;
+    y[242] = t3;
+    t16 = 0.0003074203471366065 * t5;
+    y[477] = t16;
+    t14 = C24 * t10;
+    t17 = C25 * t6;
+    t15 = t14 + t17;
+    t0 = 0.010445384859933385 * t15;
+    y[82] = t0;
+    t2 = (-0.07997250269761456) * t15;
+    y[157] = t2;
+    t8 = (-C25) * t10;
+    t4 = C24 * t6;
+    t9 = t8 + t4;
+    t7 = 0.09687085215339357 * t9;
+    y[322] = t7;
+    t13 = 0.05613281425607352 * t9;
+    y[397] = t13;
+    t1 = re[18];
+    t18 = im[18];
+    t12 = re[58];
+    t11 = im[58];
+    t3 = re[98];
+    t5 = im[98];
+    t16 = t12 + t3;
+    t14 = t11 + t5;
+    t17 = C0 * t16;
+    t0 = t1 - t17;
+    t15 = C0 * t14;
+    t2 = t18 - t15;
+    t10 = t12 - t3;
+    t6 = C1 * t10;
+    t8 = t11 - t5;
+    t4 = C1 * t8;
+    t7 = t1 + t16;
+    t9 = t18 + t14;
+    t13 = t0 + t4;
+    t17 = t2 - t6;
+    t15 = t0 - t4;
+    t12 = t2 + t6;
+    t3 = C26 * t7;
+    t10 = C27 * t9;
+    t11 = t3 + t10;
+    t5 = 0.01187691435143269 * t11;
+    y[84] = t5;
+    t8 = (-0.07877827811770904) * t11;
+    y[155] = t8;
+    t1 = (-C27) * t7;
+    t16 = C26 * t9;
+    t18 = t1 + t16;
+    t14 = 0.09699748493185585 * t18;
+    y[324] = t14;
+    t0 = 0.058267532136393865 * t18;
+    y[395] = t0;
+    t4 = (-C28) * t13;
+    t2 = (-C29) * t17;
+    t6 = t4 + t2;
+    t3 = 0.09612420663291579 * t6;
+    y[315] = t3;
+    t10 = 0.04856492303546617 * t6;
+    y[404] = t10;
+    t5 = C29 * t13;
+    t11 = (-C28) * t17;
+    t8 = t5 + t11;
+    t7 = 0.006143019792502721 * t8;
+    y[75] = t7;
+    t9 = (-0.08358974634339059) * t8;
+    y[164] = t9;
+    t1 = C30 * t15;
+    t16 = C31 * t12;
+    t14 = t1 + t16;
+    y[4] = 0;
+    t18 = (-0.09153367620104567) * t14;
+    y[235] = t18;
+    t0 = (-C31) * t15;
+    t4 = C30 * t12;
+    t2 = t0 + t4;
+    t3 = 0.09104117390663842 * t2;
+    y[244] = t3;
+    t6 = 0.0004873180185828961 * t2;
+    y[475] = t6;
+    t10 = re[57];
+    t13 = im[57];
+    t17 = re[97];
+    t5 = im[97];
+    t11 = re[17];
+    t7 = im[17];
+    t8 = t17 + t11;
+    t9 = t5 + t7;
+    t1 = C0 * t8;
+    t16 = t10 - t1;
+    t14 = C0 * t9;
+    t18 = t13 - t14;
+    t15 = t17 - t11;
+    t12 = C1 * t15;
+    t0 = t5 - t7;
+    t4 = C1 * t0;
+    t3 = t10 + t8;
+    t2 = t13 + t9;
+    t6 = t16 + t4;
+    t1 = t18 - t12;
+    t14 = t16 - t4;
+    t17 = t18 + t12;
+    t11 = C32 * t3;
+    t15 = C33 * t2;
+    t5 = t11 + t15;
+    y[6] = 0;
+    t7 = (-0.09163939322407563) * t5;
+    y[233] = t7;
+    t0 = (-C33) * t3;
+    t10 = C32 * t2;
+    t8 = t0 + t10;
+    t13 = 0.09093614700128749 * t8;
+    y[246] = t13;
+    t9 = 0.0007176193279816504 * t8;
+    y[473] = t9;
+    t16 = C34 * t6;
+    t4 = C35 * t1;
+    t18 = t16 + t4;
+    t12 = 0.013393375586540204 * t18;
+    y[86] = t12;
+    t11 = (-0.0775117043266292) * t18;
+    y[153] = t11;
+    t15 = (-C35) * t6;
+    t5 = C34 * t1;
+    t7 = t15 + t5;
+    t3 = 0.09707744401023602 * t7;
+    y[326] = t3;
+    t2 = 0.06038023731968849 * t7;
+    y[393] = t2;
+    t0 = (-C36) * t14;
+    t10 = (-C37) * t17;
+    t13 = t0 + t10;
+    t8 = 0.0958422550018241 * t13;
+    y[313] = t8;
+    t9 = 0.046396889318521525 * t13;
+    y[406] = t9;
+    t16 = C37 * t14;
+    t4 = (-C36) * t17;
+    t12 = t16 + t4;
+    t18 = 0.005125386885201697 * t12;
+    y[73] = t18;
+    t11 = (-0.08446724594649771) * t12;
+    y[166] = t11;
+    t6 = re[96];
+    t1 = im[96];
+    t15 = re[16];
+    t5 = im[16];
+    t3 = re[56];
+    t7 = im[56];
+    t2 = t15 + t3;
+    t0 = t5 + t7;
+    t10 = C0 * t2;
+    t8 = t6 - t10;
+    t13 = C0 * t0;
+    t9 = t1 - t13;
+    t14 = t15 - t3;
+    t17 = C1 * t14;
+    t16 = t5 - t7;
+    t4 = C1 * t16;
+    t18 = t6 + t2;
+    t12 = t1 + t0;
+    t11 = t8 + t4;
+    t10 = t9 - t17;
+    t13 = t8 - t4;
+    t15 = t9 + t17;
+    t3 = (-C38) * t18;
+    t14 = (-C39) * t12;
+    t5 = t3 + t14;
+    t7 = 0.09553805039385353 * t5;
+    y[311] = t7;
+    t16 = 0.04423560528399145 * t5;
+    y[408] = t16;
+    t6 = C39 * t18;
+    t2 = (-C38) * t12;
+    t1 = t6 + t2;
+    t0 = 0.004204839118219382 * t1;
+    y[71] = t0;
+    t8 = (-0.08527837543502197) * t1;
+    y[168] = t8;
+    t4 = C40 * t11;
+    t9 = C41 * t10;
+    t17 = t4 + t9;
+    y[8] = 0;
+    t3 = (-0.09174066208859163) * t17;
+    y[231] = t3;
+    t14 = (-C41) * t11;
+    t7 = C40 * t10;
+    t5 = t14 + t7;
+    t16 = 0.09083576620894716 * t5;
+    y[248] = t16;
+    t18 = 0.0010033991315600104 * t5;
+    y[471] = t18;
+    t12 = C42 * t13;
+    t6 = C43 * t15;
+    t2 = t12 + t6;
+    t0 = 0.014992006244281922 * t2;
+    y[88] = t0;
+    t1 = (-0.07617123337222059) * t2;
+    y[151] = t1;
+    t8 = (-C43) * t13;
+    t4 = C42 * t15;
+    t9 = t8 + t4;
+    t17 = 0.09710785222241458 * t9;
+    y[328] = t17;
+    t3 = 0.06246718712392951 * t9;
+    y[391] = t3;
+    t11 = re[15];
+    t10 = im[15];
+    t14 = re[55];
+    t7 = im[55];
+    t16 = re[95];
+    t5 = im[95];
+    t18 = t14 + t16;
+    t12 = t7 + t5;
+    t6 = C0 * t18;
+    t0 = t11 - t6;
+    t2 = C0 * t12;
+    t1 = t10 - t2;
+    t13 = t14 - t16;
+    t15 = C1 * t13;
+    t8 = t7 - t5;
+    t4 = C1 * t8;
+    t17 = t11 + t18;
+    t9 = t10 + t12;
+    t3 = t0 + t4;
+    t6 = t1 - t15;
+    t2 = t0 - t4;
+    t14 = t1 + t15;
+    t16 = C44 * t17;
+    t13 = C45 * t9;
+    t7 = t16 + t13;
+    t5 = 0.016668033615864032 * t7;
+    y[90] = t5;
+    t8 = (-0.07475858286328994) * t7;
+    y[149] = t8;
+    t11 = (-C45) * t17;
+    t18 = C44 * t9;
+    t10 = t11 + t18;
+    t12 = 0.09708404002796817 * t10;
+    y[330] = t12;
+    t0 = 0.0645227929691675 * t10;
+    y[389] = t0;
+    t4 = (-C46) * t3;
+    t1 = (-C47) * t6;
+    t15 = t4 + t1;
+    t16 = 0.09521437769032931 * t15;
+    y[309] = t16;
+    t13 = 0.04208653165019209 * t15;
+    y[410] = t13;
+    t5 = C47 * t3;
+    t7 = (-C46) * t6;
+    t8 = t5 + t7;
+    t17 = 0.0033823163175740493 * t8;
+    y[69] = t17;
+    t9 = (-0.0860267489981687) * t8;
+    y[170] = t9;
+    t11 = C48 * t2;
+    t18 = C49 * t14;
+    t12 = t11 + t18;
+    y[10] = 0;
+    t10 = (-0.0918361435609985) * t12;
+    y[229] = t10;
+    t0 = (-C49) * t2;
+    t4 = C48 * t14;
+    t1 = t0 + t4;
+    t16 = 0.09074132482270718 * t1;
+    y[250] = t16;
+    t15 = 0.0013492771887970369 * t1;
+    y[469] = t15;
+    t13 = re[54];
+    t3 = im[54];
+    t6 = re[94];
+    t5 = im[94];
+    t7 = re[14];
+    t17 = im[14];
+    t8 = t6 + t7;
+    t9 = t5 + t17;
+    t11 = C0 * t8;
+    t18 = t13 - t11;
+    t12 = C0 * t9;
+    t10 = t3 - t12;
+    t2 = t6 - t7;
+    t14 = C1 * t2;
+    t0 = t5 - t17;
+    t4 = C1 * t0;
+    t16 = t13 + t8;
+    t1 = t3 + t9;
+    t15 = t18 + t4;
+    t11 = t10 - t14;
+    t12 = t18 - t4;
+    t6 = t10 + t14;
+    t7 = C50 * t16;
+    t2 = C51 * t1;
+    t5 = t7 + t2;
+    y[12] = 0;
+    t17 = (-0.09192437163927131) * t5;
+    y[227] = t17;
+    t0 = (-C51) * t16;
+    t13 = C50 * t1;
+    t8 = t0 + t13;
+    t3 = 0.0906542322207533 * t8;
+    y[252] = t3;
+    t9 = 0.0017581191828043815 * t8;
+    y[467] = t9;
+    t18 = C52 * t15;
+    t4 = C53 * t11;
+    t10 = t18 + t4;
+    t14 = 0.018418715600610196 * t10;
+    y[92] = t14;
+    t7 = (-0.07327389637800778) * t10;
+    y[147] = t7;
+    t2 = (-C53) * t15;
+    t5 = C52 * t11;
+    t17 = t2 + t5;
+    t16 = 0.09700200223142667 * t17;
+    y[332] = t16;
+    t1 = 0.06654202713938924 * t17;
+    y[387] = t1;
+    t0 = (-C54) * t12;
+    t13 = (-C55) * t6;
+    t3 = t0 + t13;
+    t8 = 0.09487681096790258 * t3;
+    y[307] = t8;
+    t9 = 0.039954198753038773 * t3;
+    y[412] = t9;
+    t18 = C55 * t12;
+    t4 = (-C54) * t6;
+    t14 = t18 + t4;
+    t10 = 0.0026578540809738863 * t14;
+    y[67] = t10;
+    t7 = (-0.086713927451765) * t14;
+    y[172] = t7;
+    t15 = re[93];
+    t11 = im[93];
+    t2 = re[13];
+    t5 = im[13];
+    t16 = re[53];
+    t17 = im[53];
+    t1 = t2 + t16;
+    t0 = t5 + t17;
+    t13 = C0 * t1;
+    t8 = t15 - t13;
+    t3 = C0 * t0;
+    t9 = t11 - t3;
+    t12 = t2 - t16;
+    t6 = C1 * t12;
+    t18 = t5 - t17;
+    t4 = C1 * t18;
+    t10 = t15 + t1;
+    t14 = t11 + t0;
+    t7 = t8 + t4;
+    t13 = t9 - t6;
+    t3 = t8 - t4;
+    t2 = t9 + t6;
+    t16 = (-C56) * t10;
+    t12 = (-C57) * t14;
+    t5 = t16 + t12;
+    t17 = 0.09452938893259823 * t5;
+    y[305] = t17;
+    t18 = 0.03784324285502507 * t5;
+    y[414] = t18;
+    t15 = C57 * t10;
+    t1 = (-C56) * t14;
+    t11 = t15 + t1;
+    t0 = 0.0020305692018240664 * t11;
+    y[65] = t0;
+    t8 = (-0.0873431014748424) * t11;
+    y[174] = t8;
+    t4 = C58 * t7;
+    t9 = C59 * t13;
+    t6 = t4 + t9;
+    y[14] = 0;
+    t16 = (-0.09200402888696975) * t6;
+    y[225] = t16;
+    t12 = (-C59) * t7;
+    t17 = C58 * t13;
+    t5 = t12 + t17;
+    t18 = 0.09057574362934841 * t5;
+    y[254] = t18;
+    t10 = 0.0022336672030543237 * t5;
+    y[465] = t10;
+    t14 = C60 * t3;
+    t15 = C61 * t2;
+    t1 = t14 + t15;
+    t0 = 0.02023751206992167 * t1;
+    y[94] = t0;
+    t11 = (-0.07171894336163445) * t1;
+    y[145] = t11;
+    t8 = (-C61) * t3;
+    t4 = C60 * t2;
+    t9 = t8 + t4;
+    t6 = 0.09685895736188291 * t9;
+    y[334] = t6;
+    t16 = 0.0685218247894467 * t9;
+    y[385] = t16;
+    t7 = re[12];
+    t13 = im[12];
+    t12 = re[52];
+    t17 = im[52];
+    t18 = re[92];
+    t5 = im[92];
+    t10 = t12 + t18;
+    t14 = t17 + t5;
+    t15 = C0 * t10;
+    t0 = t7 - t15;
+    t1 = C0 * t14;
+    t11 = t13 - t1;
+    t3 = t12 - t18;
+    t2 = C1 * t3;
+    t8 = t17 - t5;
+    t4 = C1 * t8;
+    t6 = t7 + t10;
+    t9 = t13 + t14;
+    t16 = t0 + t4;
+    t15 = t11 - t2;
+    t1 = t0 - t4;
+    t12 = t11 + t2;
+    t18 = C62 * t6;
+    t3 = C63 * t9;
+    t17 = t18 + t3;
+    t5 = 0.022121006853811794 * t17;
+    y[96] = t5;
+    t8 = (-0.07009508579978732) * t17;
+    y[143] = t8;
+    t7 = (-C63) * t6;
+    t10 = C62 * t9;
+    t13 = t7 + t10;
+    t14 = 0.09665087282156803 * t13;
+    y[336] = t14;
+    t0 = 0.07045710534702093 * t13;
+    y[383] = t0;
+    t4 = (-C64) * t16;
+    t11 = (-C65) * t15;
+    t2 = t4 + t11;
+    t18 = 0.09417575507955023 * t2;
+    y[303] = t18;
+    t3 = 0.035758982113670124 * t2;
+    y[416] = t3;
+    t5 = C65 * t16;
+    t17 = (-C64) * t15;
+    t8 = t5 + t17;
+    t6 = 0.0014982238934458136 * t8;
+    y[63] = t6;
+    t9 = (-0.08791815223495067) * t8;
+    y[176] = t9;
+    t7 = C66 * t1;
+    t10 = C67 * t12;
+    t14 = t7 + t10;
+    y[16] = 0;
+    t13 = (-0.09207362581828964) * t14;
+    y[223] = t13;
+    t0 = (-C67) * t1;
+    t4 = C66 * t12;
+    t11 = t0 + t4;
+    t18 = 0.09050727892240762 * t11;
+    y[256] = t18;
+    t2 = 0.002778041784911948 * t11;
+    y[463] = t2;
+    t3 = re[51];
+    t16 = im[51];
+    t15 = re[91];
+    t5 = im[91];
+    t17 = re[11];
+    t6 = im[11];
+    t8 = t15 + t17;
+    t9 = t5 + t6;
+    t7 = C0 * t8;
+    t10 = t3 - t7;
+    t14 = C0 * t9;
+    t13 = t16 - t14;
+    t1 = t15 - t17;
+    t12 = C1 * t1;
+    t0 = t5 - t6;
+    t4 = C1 * t0;
+    t18 = t3 + t8;
+    t11 = t16 + t9;
+    t2 = t10 + t4;
+    t7 = t13 - t12;
+    t14 = t10 - t4;
+    t15 = t13 + t12;
+    t17 = C68 * t18;
+    t1 = C69 * t11;
+    t5 = t17 + t1;
+    y[18] = 0;
+    t6 = (-0.09213185424311) * t5;
+    y[221] = t6;
+    t0 = (-C69) * t18;
+    t3 = C68 * t11;
+    t8 = t0 + t3;
+    t16 = 0.09045007724846191 * t8;
+    y[258] = t16;
+    t9 = 0.003392078454351888 * t8;
+    y[461] = t9;
+    t10 = C70 * t2;
+    t4 = C71 * t7;
+    t13 = t10 + t4;
+    t12 = 0.024064152632092713 * t13;
+    y[98] = t12;
+    t17 = (-0.06840421737663181) * t13;
+    y[141] = t17;
+    t1 = (-C71) * t2;
+    t5 = C70 * t7;
+    t6 = t1 + t5;
+    t18 = 0.09637494539960026 * t6;
+    y[338] = t18;
+    t11 = 0.07234331684866252 * t6;
+    y[381] = t11;
+    t0 = (-C72) * t14;
+    t3 = (-C73) * t15;
+    t16 = t0 + t3;
+    t8 = 0.09382117136084558 * t16;
+    y[301] = t8;
+    t9 = 0.03370544615326114 * t16;
+    y[418] = t9;
+    t10 = C73 * t14;
+    t4 = (-C72) * t15;
+    t12 = t10 + t4;
+    t13 = 0.0010571625305928285 * t12;
+    y[61] = t13;
+    t17 = (-0.08844167130113312) * t12;
+    y[178] = t17;
+    t2 = re[90];
+    t7 = im[90];
+    t1 = re[10];
+    t5 = im[10];
+    t18 = re[50];
+    t6 = im[50];
+    t11 = t1 + t18;
+    t0 = t5 + t6;
+    t3 = C0 * t11;
+    t8 = t2 - t3;
+    t16 = C0 * t0;
+    t9 = t7 - t16;
+    t14 = t1 - t18;
+    t15 = C1 * t14;
+    t10 = t5 - t6;
+    t4 = C1 * t10;
+    t13 = t2 + t11;
+    t12 = t7 + t0;
+    t17 = t8 + t4;
+    t3 = t9 - t15;
+    t16 = t8 - t4;
+    t1 = t9 + t15;
+    t18 = (-C74) * t13;
+    t14 = (-C75) * t12;
+    t5 = t18 + t14;
+    t6 = 0.09346957660009908 * t5;
+    y[299] = t6;
+    t10 = 0.03168746252407474 * t5;
+    y[420] = t10;
+    t2 = C75 * t13;
+    t11 = (-C74) * t12;
+    t7 = t2 + t11;
+    t0 = 0.0007021231543619729 * t7;
+    y[59] = t0;
+    t8 = (-0.08891754017192575) * t7;
+    y[180] = t8;
+    t4 = C76 * t17;
+    t9 = C77 * t3;
+    t15 = t4 + t9;
+    y[20] = 0;
+    t18 = (-0.09217730194744563) * t15;
+    y[219] = t18;
+    t14 = (-C77) * t17;
+    t6 = C76 * t3;
+    t5 = t14 + t6;
+    t10 = 0.09040548114637302 * t5;
+    y[260] = t10;
+    t13 = 0.004077868094918297 * t5;
+    y[459] = t13;
+    t12 = C78 * t16;
+    t2 = C79 * t1;
+    t11 = t12 + t2;
+    t0 = 0.026059152816006632 * t11;
+    y[100] = t0;
+    t7 = (-0.06664961433059914) * t11;
+    y[139] = t7;
+    t8 = (-C79) * t16;
+    t4 = C78 * t1;
+    t9 = t8 + t4;
+    t15 = 0.09602982670046604 * t9;
+    y[340] = t15;
+    t18 = 0.0741767176070929 * t9;
+    y[379] = t18;
+    t17 = re[9];
+    t3 = im[9];
+    t14 = re[49];
+    t6 = im[49];
+    t10 = re[89];
+    t5 = im[89];
+    t13 = t14 + t10;
+    t12 = t6 + t5;
+    t2 = C0 * t13;
+    t0 = t17 - t2;
+    t11 = C0 * t12;
+    t7 = t3 - t11;
+    t16 = t14 - t10;
+    t1 = C1 * t16;
+    t8 = t6 - t5;
+    t4 = C1 * t8;
+    t15 = t17 + t13;
+    t9 = t3 + t12;
+    t18 = t0 + t4;
+    t2 = t7 - t1;
+    t11 = t0 - t4;
+    t14 = t7 + t1;
+    t10 = C80 * t15;
+    t16 = C81 * t9;
+    t6 = t10 + t16;
+    t5 = 0.02810120791275669 * t6;
+    y[102] = t5;
+    t8 = (-0.06483429897658222) * t6;
+    y[137] = t8;
+    t17 = (-C81) * t15;
+    t13 = C80 * t9;
+    t3 = t17 + t13;
+    t12 = 0.09561210961373615 * t3;
+    y[342] = t12;
+    t0 = 0.07595364724111003 * t3;
+    y[377] = t0;
+    t4 = (-C82) * t18;
+    t7 = (-C83) * t2;
+    t1 = t4 + t7;
+    t10 = 0.09312553292068804 * t1;
+    y[297] = t10;
+    t16 = 0.029709304370203957 * t1;
+    y[422] = t16;
+    t5 = C83 * t18;
+    t6 = (-C82) * t2;
+    t8 = t5 + t6;
+    t15 = 0.0004222769452670429 * t8;
+    y[57] = t15;
+    t9 = (-0.08935022993236894) * t8;
+    y[182] = t9;
+    t17 = C84 * t11;
+    t13 = C85 * t14;
+    t12 = t17 + t13;
+    y[22] = 0;
+    t3 = (-0.09220868152367266) * t12;
+    y[217] = t3;
+    t0 = (-C85) * t11;
+    t4 = C84 * t14;
+    t7 = t0 + t4;
+    t10 = 0.09037471521804512 * t7;
+    y[262] = t10;
+    t1 = 0.004836578531268158 * t7;
+    y[457] = t1;
+    t16 = re[48];
+    t18 = im[48];
+    t2 = re[88];
+    t5 = im[88];
+    t6 = re[8];
+    t15 = im[8];
+    t8 = t2 + t6;
+    t9 = t5 + t15;
+    t17 = C0 * t8;
+    t13 = t16 - t17;
+    t12 = C0 * t9;
+    t3 = t18 - t12;
+    t11 = t2 - t6;
+    t14 = C1 * t11;
+    t0 = t5 - t15;
+    t4 = C1 * t0;
+    t10 = t16 + t8;
+    t7 = t18 + t9;
+    t1 = t13 + t4;
+    t17 = t3 - t14;
+    t12 = t13 - t4;
+    t2 = t3 + t14;
+    t6 = C86 * t10;
+    t11 = C87 * t7;
+    t5 = t6 + t11;
+    y[24] = 0;
+    t15 = (-0.09222461802987045) * t5;
+    y[215] = t15;
+    t0 = (-C87) * t10;
+    t16 = C86 * t7;
+    t8 = t0 + t16;
+    t18 = 0.09035909837690259 * t8;
+    y[264] = t18;
+    t9 = 0.005668641644993473 * t8;
+    y[455] = t9;
+    t13 = C88 * t1;
+    t4 = C89 * t17;
+    t3 = t13 + t4;
+    t14 = 0.030183604415960606 * t3;
+    y[104] = t14;
+    t6 = (-0.06296179334680656) * t3;
+    y[135] = t6;
+    t11 = (-C89) * t1;
+    t5 = C88 * t17;
+    t15 = t11 + t5;
+    t10 = 0.09512004217473578 * t15;
+    y[344] = t10;
+    t7 = 0.07767146900283439 * t15;
+    y[375] = t7;
+    t0 = (-C90) * t12;
+    t16 = (-C91) * t2;
+    t18 = t0 + t16;
+    t8 = 0.09282792874934585 * t18;
+    y[295] = t8;
+    t9 = 0.027774771122028637 * t18;
+    y[424] = t9;
+    t13 = C91 * t12;
+    t4 = (-C90) * t2;
+    t14 = t13 + t4;
+    y[55] = 0;
+    t3 = (-0.08977183317140486) * t14;
+    y[184] = t3;
+    t6 = re[87];
+    t1 = im[87];
+    t17 = re[7];
+    t11 = im[7];
+    t5 = re[47];
+    t10 = im[47];
+    t15 = t17 + t5;
+    t7 = t11 + t10;
+    t0 = C0 * t15;
+    t16 = t6 - t0;
+    t8 = C0 * t7;
+    t18 = t1 - t8;
+    t9 = t17 - t5;
+    t12 = C1 * t9;
+    t2 = t11 - t10;
+    t13 = C1 * t2;
+    t4 = t6 + t15;
+    t14 = t1 + t7;
+    t3 = t16 + t13;
+    t0 = t18 - t12;
+    t8 = t16 - t13;
+    t17 = t18 + t12;
+    t5 = (-C92) * t4;
+    t9 = (-C93) * t14;
+    t11 = t5 + t9;
+    t10 = 0.09248264559196126 * t11;
+    y[293] = t10;
+    t2 = 0.025887393635767413 * t11;
+    y[426] = t2;
+    t6 = C93 * t4;
+    t15 = (-C92) * t14;
+    t1 = t6 + t15;
+    y[53] = 0;
+    t7 = (-0.09010699553406464) * t1;
+    y[186] = t7;
+    t16 = C94 * t3;
+    t13 = C95 * t0;
+    t18 = t16 + t13;
+    y[26] = 0;
+    t12 = (-0.09222390568483599) * t18;
+    y[213] = t12;
+    t5 = (-C95) * t3;
+    t9 = C94 * t0;
+    t10 = t5 + t9;
+    t11 = 0.09035979631801205 * t10;
+    y[266] = t11;
+    t2 = 0.006575394365350636 * t10;
+    y[453] = t2;
+    t4 = C96 * t8;
+    t14 = C97 * t17;
+    t6 = t4 + t14;
+    t15 = 0.03230032719820284 * t6;
+    y[106] = t15;
+    t1 = (-0.06103529695492163) * t6;
+    y[133] = t1;
+    t7 = (-C97) * t8;
+    t16 = C96 * t17;
+    t13 = t7 + t16;
+    t18 = 0.09455277460094863 * t13;
+    y[346] = t18;
+    t12 = 0.07932664712434352 * t13;
+    y[373] = t12;
+    t3 = re[6];
+    t0 = im[6];
+    t5 = re[46];
+    t9 = im[46];
+    t11 = re[86];
+    t10 = im[86];
+    t2 = t5 + t11;
+    t4 = t9 + t10;
+    t14 = C0 * t2;
+    t15 = t3 - t14;
+    t6 = C0 * t4;
+    t1 = t0 - t6;
+    t8 = t5 - t11;
+    t17 = C1 * t8;
+    t7 = t9 - t10;
+    t16 = C1 * t7;
+    t18 = t3 + t2;
+    t13 = t0 + t4;
+    t12 = t15 + t16;
+    t14 = t1 - t17;
+    t6 = t15 - t16;
+    t5 = t1 + t17;
+    t11 = C98 * t18;
+    t8 = C99 * t13;
+    t9 = t11 + t8;
+    t10 = 0.03444464662276709 * t9;
+    y[108] = t10;
+    t7 = (-0.05905961963485038) * t9;
+    y[131] = t7;
+    t3 = (-C99) * t18;
+    t2 = C98 * t13;
+    t0 = t3 + t2;
+    t4 = 0.0939083749348817 * t0;
+    y[348] = t4;
+    t15 = 0.0809165052461322 * t0;
+    y[371] = t15;
+    t16 = (-C100) * t12;
+    t1 = (-C101) * t14;
+    t17 = t16 + t1;
+    t11 = 0.09216884617272778 * t17;
+    y[291] = t11;
+    t8 = 0.024050868215834645 * t17;
+    y[428] = t8;
+    t10 = C101 * t12;
+    t9 = (-C100) * t14;
+    t7 = t10 + t9;
+    y[51] = 0;
+    t18 = (-0.09041377514606573) * t7;
+    y[188] = t18;
+    t13 = C102 * t6;
+    t3 = C103 * t5;
+    t2 = t13 + t3;
+    y[28] = 0;
+    t4 = (-0.0922052764660204) * t2;
+    y[211] = t4;
+    t0 = (-C103) * t6;
+    t15 = C102 * t5;
+    t16 = t0 + t15;
+    t1 = 0.09037805267472243 * t16;
+    y[268] = t1;
+    t11 = 0.007556979010194901 * t16;
+    y[451] = t11;
+    t17 = re[45];
+    t8 = im[45];
+    t12 = re[85];
+    t14 = im[85];
+    t10 = re[5];
+    t9 = im[5];
+    t7 = t12 + t10;
+    t18 = t14 + t9;
+    t13 = C0 * t7;
+    t3 = t17 - t13;
+    t2 = C0 * t18;
+    t4 = t8 - t2;
+    t6 = t12 - t10;
+    t5 = C1 * t6;
+    t0 = t14 - t9;
+    t15 = C1 * t0;
+    t1 = t17 + t7;
+    t16 = t8 + t18;
+    t11 = t3 + t15;
+    t13 = t4 - t5;
+    t2 = t3 - t15;
+    t12 = t4 + t5;
+    t10 = C104 * t1;
+    t6 = C105 * t16;
+    t14 = t10 + t6;
+    y[30] = 0;
+    t9 = (-0.09216764187038416) * t14;
+    y[209] = t9;
+    t0 = (-C105) * t1;
+    t17 = C104 * t16;
+    t7 = t0 + t17;
+    t8 = 0.09041495653162682 * t7;
+    y[270] = t8;
+    t18 = 0.008613919159637174 * t7;
+    y[449] = t18;
+    t3 = C106 * t11;
+    t15 = C107 * t13;
+    t4 = t3 + t15;
+    t5 = 0.036609401127679665 * t4;
+    y[110] = t5;
+    t10 = (-0.05703985780184589) * t4;
+    y[129] = t10;
+    t6 = (-C107) * t11;
+    t14 = C106 * t13;
+    t9 = t6 + t14;
+    t1 = 0.09318534435922614 * t9;
+    y[350] = t1;
+    t16 = 0.08243933112539109 * t9;
+    y[369] = t16;
+    t0 = (-C108) * t2;
+    t17 = (-C109) * t12;
+    t8 = t0 + t17;
+    t7 = 0.09188206022001336 * t8;
+    y[289] = t7;
+    t18 = 0.022269332380766 * t8;
+    y[430] = t18;
+    t3 = C109 * t2;
+    t15 = (-C108) * t12;
+    t5 = t3 + t15;
+    y[49] = 0;
+    t4 = (-0.09069597822881863) * t5;
+    y[190] = t4;
+    t10 = re[84];
+    t11 = im[84];
+    t13 = re[4];
+    t6 = im[4];
+    t14 = re[44];
+    t1 = im[44];
+    t9 = t13 + t14;
+    t16 = t6 + t1;
+    t0 = C0 * t9;
+    t17 = t10 - t0;
+    t7 = C0 * t16;
+    t8 = t11 - t7;
+    t18 = t13 - t14;
+    t2 = C1 * t18;
+    t12 = t6 - t1;
+    t3 = C1 * t12;
+    t15 = t10 + t9;
+    t5 = t11 + t16;
+    t4 = t17 + t3;
+    t0 = t8 - t2;
+    t7 = t17 - t3;
+    t13 = t8 + t2;
+    t14 = (-C110) * t15;
+    t18 = (-C111) * t5;
+    t6 = t14 + t18;
+    t1 = 0.09162207646476439 * t6;
+    y[287] = t1;
+    t12 = 0.020545864807539 * t6;
+    y[432] = t12;
+    t10 = C111 * t15;
+    t9 = (-C110) * t5;
+    t11 = t10 + t9;
+    y[47] = 0;
+    t16 = (-0.09095333411853122) * t11;
+    y[192] = t16;
+    t17 = C112 * t4;
+    t3 = C113 * t0;
+    t8 = t17 + t3;
+    y[32] = 0;
+    t2 = (-0.09210979792503068) * t8;
+    y[207] = t2;
+    t14 = (-C113) * t4;
+    t18 = C112 * t0;
+    t1 = t14 + t18;
+    t6 = 0.09047173613512795 * t1;
+    y[272] = t6;
+    t12 = 0.009746159098938015 * t1;
+    y[447] = t12;
+    t15 = C114 * t7;
+    t5 = C115 * t13;
+    t10 = t15 + t5;
+    t9 = 0.038788983266110494 * t10;
+    y[112] = t9;
+    t11 = (-0.05497902929043668) * t10;
+    y[127] = t11;
+    t16 = (-C115) * t7;
+    t17 = C114 * t13;
+    t3 = t16 + t17;
+    t8 = 0.09238500948779206 * t3;
+    y[352] = t8;
+    t2 = 0.08389225281782092 * t3;
+    y[367] = t2;
+    t4 = re[3];
+    t0 = im[3];
+    t14 = re[43];
+    t18 = im[43];
+    t6 = re[83];
+    t1 = im[83];
+    t12 = t14 + t6;
+    t15 = t18 + t1;
+    t5 = C0 * t12;
+    t9 = t4 - t5;
+    t10 = C0 * t15;
+    t11 = t0 - t10;
+    t7 = t14 - t6;
+    t13 = C1 * t7;
+    t16 = t18 - t1;
+    t17 = C1 * t16;
+    t8 = t4 + t12;
+    t3 = t0 + t15;
+    t2 = t9 + t17;
+    t5 = t11 - t13;
+    t10 = t9 - t17;
+    t14 = t11 + t13;
+    t6 = C116 * t8;
+    t7 = C117 * t3;
+    t18 = t6 + t7;
+    t1 = 0.040977048916637684 * t18;
+    y[114] = t1;
+    t16 = (-0.05288347175089571) * t18;
+    y[125] = t16;
+    t4 = (-C117) * t8;
+    t12 = C116 * t3;
+    t0 = t4 + t12;
+    t15 = 0.09150544220877038 * t0;
+    y[354] = t15;
+    t9 = 0.08527231603088634 * t0;
+    y[365] = t9;
+    t17 = (-C118) * t2;
+    t11 = (-C119) * t5;
+    t13 = t17 + t11;
+    t6 = 0.09138840410436003 * t13;
+    y[285] = t6;
+    t7 = 0.018883113189353255 * t13;
+    y[434] = t7;
+    t1 = C119 * t2;
+    t18 = (-C118) * t5;
+    t16 = t1 + t18;
+    y[45] = 0;
+    t8 = (-0.09118589404206212) * t16;
+    y[194] = t8;
+    t3 = C120 * t10;
+    t4 = C121 * t14;
+    t12 = t3 + t4;
+    y[34] = 0;
+    t15 = (-0.09203093361579481) * t12;
+    y[205] = t15;
+    t0 = (-C121) * t10;
+    t9 = C120 * t14;
+    t17 = t0 + t9;
+    t11 = 0.09054926431717872 * t17;
+    y[274] = t11;
+    t6 = 0.0109532114963038 * t17;
+    y[445] = t6;
+    t13 = re[42];
+    t7 = im[42];
+    t2 = re[82];
+    t5 = im[82];
+    t1 = re[2];
+    t18 = im[2];
+    t16 = t2 + t1;
+    t8 = t5 + t18;
+    t3 = C0 * t16;
+    t4 = t13 - t3;
+    t12 = C0 * t8;
+    t15 = t7 - t12;
+    t10 = t2 - t1;
+    t14 = C1 * t10;
+    t0 = t5 - t18;
+    t9 = C1 * t0;
+    t11 = t13 + t16;
+    t17 = t7 + t8;
+    t6 = t4 + t9;
+    t3 = t15 - t14;
+    t12 = t4 - t9;
+    t2 = t15 + t14;
+    t1 = C122 * t11;
+    t10 = C123 * t17;
+    t5 = t1 + t10;
+    y[36] = 0;
+    t18 = (-0.09193006721260147) * t5;
+    y[203] = t18;
+    t0 = (-C123) * t11;
+    t13 = C122 * t17;
+    t16 = t0 + t13;
+    t7 = 0.09064861569241872 * t16;
+    y[276] = t7;
+    t8 = 0.012234374072361744 * t16;
+    y[443] = t8;
+    t4 = C124 * t6;
+    t9 = C125 * t3;
+    t15 = t4 + t9;
+    t14 = 0.04316675485476704 * t15;
+    y[116] = t14;
+    t1 = (-0.05075903923035873) * t15;
+    y[123] = t1;
+    t10 = (-C125) * t6;
+    t5 = C124 * t3;
+    t18 = t10 + t5;
+    t11 = 0.09054639388396353 * t18;
+    y[356] = t11;
+    t17 = 0.08657786267658361 * t18;
+    y[363] = t17;
+    t0 = (-C126) * t12;
+    t13 = (-C127) * t2;
+    t7 = t0 + t13;
+    t16 = 0.09118069998138907 * t7;
+    y[283] = t16;
+    t8 = 0.017285605367722928 * t7;
+    y[436] = t8;
+    t4 = C127 * t12;
+    t9 = (-C126) * t2;
+    t14 = t4 + t9;
+    y[43] = 0;
+    t15 = (-0.09139360999678939) * t14;
+    y[196] = t15;
+    t1 = re[81];
+    t6 = im[81];
+    t3 = re[1];
+    t10 = im[1];
+    t5 = re[41];
+    t11 = im[41];
+    t18 = t3 + t5;
+    t17 = t10 + t11;
+    t0 = C0 * t18;
+    t13 = t1 - t0;
+    t16 = C0 * t17;
+    t7 = t6 - t16;
+    t8 = t3 - t5;
+    t12 = C1 * t8;
+    t2 = t10 - t11;
+    t4 = C1 * t2;
+    t9 = t1 + t18;
+    t14 = t6 + t17;
+    t15 = t13 + t4;
+    t0 = t7 - t12;
+    t16 = t13 - t4;
+    t3 = t7 + t12;
+    t5 = (-C128) * t9;
+    t8 = (-C129) * t14;
+    t10 = t5 + t8;
+    t11 = 0.09099823826755285 * t10;
+    y[281] = t11;
+    t2 = 0.015755155066487784 * t10;
+    y[438] = t2;
+    t1 = C129 * t9;
+    t18 = (-C128) * t14;
+    t6 = t1 + t18;
+    y[41] = 0;
+    t17 = (-0.09157686447546028) * t6;
+    y[198] = t17;
+    t13 = C130 * t15;
+    t4 = C131 * t0;
+    t7 = t13 + t4;
+    y[38] = 0;
+    t12 = (-0.09180640400425469) * t7;
+    y[201] = t12;
+    t5 = (-C131) * t15;
+    t8 = C130 * t0;
+    t11 = t5 + t8;
+    t10 = 0.09077071936013452 * t11;
+    y[278] = t10;
+    t2 = 0.013588742078380437 * t11;
+    y[441] = t2;
+    t9 = C132 * t16;
+    t14 = C133 * t3;
+    t1 = t9 + t14;
+    t18 = 0.045352447076883386 * t1;
+    y[118] = t18;
+    t6 = (-0.048609442933946125) * t1;
+    y[121] = t6;
+    t17 = (-C133) * t16;
+    t13 = C132 * t3;
+    t4 = t17 + t13;
+    t7 = 0.08950958151221271 * t4;
+    y[358] = t7;
+    t12 = 0.0878083255799443 * t4;
+    y[361] = t12;
+}
+
+//
+//  Public functions.
+//
+
+/**
+ *  Apply LD-IMDCT transform (prebuilt for window W75_240, input pruned).
+ * 
+ *  Note(s):
+ *    [1] y[n] = w[n] * SUM(X[k] * cos(PI / 240 * (n + 120.5) * (k + 0.5))), where
+ *        w[n] = sqrt(2 / 240) * W75_240[479 - n].
+ *    [2] X[k] shall be zero for all k >= 60 (not checked).
+ *    [3] The size of all arrays will not be checked.
+ * 
+ *  @param {Number[]} X 
+ *    - The input block (240 points, only the first 60 points are used).
+ *  @param {Number[]} y 
+ *    - The array that would contain the output block (480 points).
+ *  @param {Number[]} re 
+ *    - The scratch buffer (real part, 120 points).
+ *  @param {Number[]} im 
+ *    - The scratch buffer (imaginary part, 120 points).
+ */
+function ApplyWindowedIMDCT_W75_240_K60(X, y, re, im) {
+    ApplyWindowedIMDCT_W75_240_K60_Part1(X, y, re, im);
+    ApplyWindowedIMDCT_W75_240_K60_Part2(X, y, re, im);
+    ApplyWindowedIMDCT_W75_240_K60_Part3(X, y, re, im);
+}
+
+//  Export public APIs.
+module.exports = {
+    "ApplyWindowedIMDCT_W75_240_K60": ApplyWindowedIMDCT_W75_240_K60
+};
\ No newline at end of file
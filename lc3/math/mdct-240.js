@@ -0,0 +1,26280 @@
+//
+//  Copyright 2021 - 2023 XiaoJSoft Studio. All rights reserved.
+//  Use of this source code is governed by a BSD-style license that can be
+//  found in the LICENSE.md file.
+//
+
+//
+//  Note(s):
+//    [1] This file is generated automatically by a MDCT compiler, which locates 
+//        at "./../../dev/mdct-generator/" directory.
+//        Do NOT modify this file manually.
+//
+
+//
+//  Private functions.
+//
+
+/**
+ *  Part 1 of ApplyWindowedMDCT_W10_240().
+ * 
+ *  @param {Number[]} x 
+ *    - The input block (480 points).
+ *  @param {Number[]} X 
+ *    - The array that would contain the output block (240 points).
+ *  @param {Number[]} re 
+ *    - The scratch buffer (real part, 120 points).
+ *  @param {Number[]} im 
+ *    - The scratch buffer (imaginary part, 120 points).
+ */
+function ApplyWindowedMDCT_W10_240_Part1(x, X, re, im) {
+    let t0, t1, t10, t11, t12, t13, t14, t15, t16, t17, t18, t19, t2, t3, t4, t5, t6, t7, t8, t9;
+    const C0 = 0.19509032201612825;
+    const C1 = 0.9807852804032304;
+    const C2 = 0.3826834323650898;
+    const C3 = 0.9238795325112867;
+    const C4 = 0.5555702330196022;
+    const C5 = 0.8314696123025452;
+    const C6 = 0.7071067811865476;
+    const C7 = 0.3090169943749474;
+    const C8 = 0.9510565162951535;
+    const C9 = 0.4886212414969549;
+    const C10 = 0.8724960070727972;
+    const C11 = 0.6494480483301837;
+    const C12 = 0.7604059656000309;
+    const C13 = 0.619093949309834;
+    const C14 = 0.785316930880745;
+    const C15 = 0.45399049973954675;
+    const C16 = 0.8910065241883679;
+    const C17 = 0.27144044986507426;
+    const C18 = 0.9624552364536473;
+    const C19 = 0.07845909572784494;
+    const C20 = 0.996917333733128;
+    const C21 = 0.9930684569549263;
+    const C22 = 0.11753739745783764;
+    const C23 = 0.5877852522924731;
+    const C24 = 0.8090169943749475;
+    const C25 = 0.6788007455329417;
+    const C26 = 0.7343225094356856;
+    const C27 = 0.5224985647159488;
+    const C28 = 0.8526401643540922;
+    const C29 = 0.34611705707749296;
+    const C30 = 0.9381913359224842;
+    const C31 = 0.15643446504023087;
+    const C32 = 0.9876883405951378;
+    const C33 = 0.9992290362407229;
+    const C34 = 0.03925981575906861;
+    const C35 = 0.2334453638559054;
+    const C36 = 0.9723699203976766;
+    const C37 = 0.41865973753742813;
+    const C38 = 0.9081431738250813;
+    const C39 = 0.5590169943749475;
+    const C40 = 0.25;
+    t0 = x[359];
+    t0 = 0.0533957066838501 * t0;
+    t1 = x[360];
+    t1 = 0.05093589219767399 * t1;
+    t0 = t0 + t1;
+    t1 = x[119];
+    t1 = 0.07908701262725863 * t1;
+    t2 = x[120];
+    t2 = 0.08062381886627268 * t2;
+    t1 = t1 - t2;
+    t2 = -t0;
+    t3 = x[329];
+    t4 = x[89];
+    t4 = 0.01889140710216753 * t4;
+    t5 = x[150];
+    t5 = 0.0923510349517541 * t5;
+    t4 = t4 - t5;
+    t5 = (-0.0885015600994267) * t3;
+    t6 = C0 * t4;
+    t5 = t5 + t6;
+    t6 = 0.017604054836170044 * t3;
+    t3 = C1 * t4;
+    t4 = t6 + t3;
+    t6 = x[299];
+    t3 = x[59];
+    t3 = (-0.008931638736934335) * t3;
+    t7 = x[180];
+    t7 = 0.09013792870924264 * t7;
+    t3 = t3 - t7;
+    t7 = (-0.08541350144726899) * t6;
+    t8 = C2 * t3;
+    t7 = t7 + t8;
+    t8 = 0.0353794307092328 * t6;
+    t6 = C3 * t3;
+    t3 = t8 + t6;
+    t8 = x[269];
+    t6 = x[29];
+    t6 = (-0.00561728389438704) * t6;
+    t9 = x[210];
+    t9 = 0.09038523656129972 * t9;
+    t6 = t6 - t9;
+    t9 = (-0.07665979201321575) * t8;
+    t10 = C4 * t6;
+    t9 = t9 + t10;
+    t10 = 0.05122243541056725 * t8;
+    t8 = C5 * t6;
+    t6 = t10 + t8;
+    t10 = x[0];
+    t8 = (-3.298655833518676e-05) * t10;
+    t10 = x[239];
+    t10 = 0.09125896746650057 * t10;
+    t8 = t8 - t10;
+    t10 = x[240];
+    t11 = C6 * t8;
+    t12 = (-0.06456961626320111) * t10;
+    t11 = t11 + t12;
+    t12 = (-0.7071067811865475) * t8;
+    t8 = (-0.06456961626320112) * t10;
+    t10 = t12 + t8;
+    t12 = x[30];
+    t8 = (-0.005944349081379847) * t12;
+    t12 = x[209];
+    t12 = 0.09038234483158948 * t12;
+    t8 = t8 - t12;
+    t12 = x[270];
+    t13 = C4 * t8;
+    t14 = (-0.07666224469795808) * t12;
+    t13 = t13 + t14;
+    t14 = (-C5) * t8;
+    t8 = (-0.051224074242117626) * t12;
+    t12 = t14 + t8;
+    t14 = x[60];
+    t8 = (-0.008644252539109377) * t14;
+    t14 = x[179];
+    t14 = 0.09013642929791008 * t14;
+    t8 = t8 - t14;
+    t14 = x[300];
+    t15 = C2 * t8;
+    t16 = (-0.08541492229312478) * t14;
+    t15 = t15 + t16;
+    t16 = (-C3) * t8;
+    t8 = (-0.03538001924285631) * t14;
+    t14 = t16 + t8;
+    t16 = x[90];
+    t8 = 0.0206317319699406 * t16;
+    t16 = x[149];
+    t16 = 0.09251590088378046 * t16;
+    t8 = t8 - t16;
+    t16 = x[330];
+    t16 = 0.0899666037574483 * t16;
+    t17 = x[389];
+    t17 = 0.0004842994894200067 * t17;
+    t16 = t16 + t17;
+    t17 = C0 * t8;
+    t18 = (-C1) * t16;
+    t17 = t17 + t18;
+    t18 = (-C1) * t8;
+    t8 = (-C0) * t16;
+    t16 = t18 + t8;
+    t18 = t11 - t0;
+    t8 = t1 + t10;
+    t0 = t7 + t15;
+    t19 = t3 + t14;
+    t2 = t2 - t11;
+    t11 = t1 - t10;
+    t1 = t7 - t15;
+    t10 = t3 - t14;
+    t7 = t18 + t0;
+    t15 = t8 + t19;
+    t3 = t2 + t10;
+    t14 = t11 - t1;
+    t18 = t18 - t0;
+    t0 = t8 - t19;
+    t8 = t2 - t10;
+    t19 = t11 + t1;
+    t2 = t5 + t13;
+    t10 = t4 + t12;
+    t11 = t9 + t17;
+    t1 = t6 + t16;
+    t5 = t5 - t13;
+    t13 = t4 - t12;
+    t4 = t9 - t17;
+    t12 = t6 - t16;
+    t9 = t2 + t11;
+    t17 = t10 + t1;
+    t6 = t5 + t12;
+    t16 = t13 - t4;
+    t2 = t2 - t11;
+    t11 = t10 - t1;
+    t10 = t5 - t12;
+    t1 = t13 + t4;
+    t5 = t6 + t16;
+    t12 = t6 - t16;
+    t13 = C6 * t5;
+    t4 = (-C6) * t12;
+    t6 = t10 - t1;
+    t16 = t10 + t1;
+    t5 = (-C6) * t6;
+    t12 = (-C6) * t16;
+    t10 = t7 - t9;
+    t1 = t15 - t17;
+    t6 = t7 + t9;
+    t16 = t15 + t17;
+    t7 = t3 - t13;
+    t9 = t14 - t4;
+    t15 = t3 + t13;
+    t17 = t14 + t4;
+    t3 = t18 - t11;
+    t13 = t0 + t2;
+    t14 = t18 + t11;
+    t4 = t0 - t2;
+    t18 = t8 - t5;
+    t11 = t19 - t12;
+    t0 = t8 + t5;
+    t2 = t19 + t12;
+    re[0] = t6;
+    im[0] = t16;
+    re[15] = t15;
+    im[15] = t17;
+    re[30] = t14;
+    im[30] = t4;
+    re[45] = t0;
+    im[45] = t2;
+    re[60] = t10;
+    im[60] = t1;
+    re[75] = t7;
+    im[75] = t9;
+    re[90] = t3;
+    im[90] = t13;
+    re[105] = t18;
+    im[105] = t11;
+    t8 = x[311];
+    t5 = x[71];
+    t19 = (-0.0029869552982565196) * t5;
+    t12 = x[168];
+    t6 = 0.09033400449355983 * t12;
+    t16 = t19 - t6;
+    t15 = (-0.08773518913014984) * t8;
+    t17 = C7 * t16;
+    t14 = t15 + t17;
+    t4 = 0.02850689100110487 * t8;
+    t0 = C8 * t16;
+    t2 = t4 + t0;
+    t10 = x[281];
+    t1 = x[41];
+    t7 = (-0.009064007974917266) * t1;
+    t9 = x[198];
+    t3 = 0.0903305936699626 * t9;
+    t13 = t7 - t3;
+    t18 = (-0.08049100269953957) * t10;
+    t11 = C9 * t13;
+    t5 = t18 + t11;
+    t12 = 0.045077127401801725 * t10;
+    t19 = C10 * t13;
+    t6 = t12 + t19;
+    t15 = x[251];
+    t17 = x[11];
+    t8 = (-0.0008932729373177886) * t17;
+    t16 = x[228];
+    t4 = 0.0907092475124274 * t16;
+    t0 = t8 - t4;
+    t1 = (-0.06985744622269206) * t15;
+    t9 = C11 * t0;
+    t7 = t1 + t9;
+    t3 = 0.05966389555460409 * t15;
+    t18 = C12 * t0;
+    t11 = t3 + t18;
+    t10 = x[18];
+    t13 = (-0.0022998927704061803) * t10;
+    t12 = x[221];
+    t19 = 0.09049724338466482 * t12;
+    t17 = t13 - t19;
+    t16 = x[258];
+    t8 = C13 * t17;
+    t4 = (-0.07231499560182741) * t16;
+    t1 = t8 + t4;
+    t9 = (-C14) * t17;
+    t15 = (-0.05700854579978127) * t16;
+    t0 = t9 + t15;
+    t3 = x[48];
+    t18 = (-0.010028110732918314) * t3;
+    t10 = x[191];
+    t12 = 0.0902499491453508 * t10;
+    t13 = t18 - t12;
+    t19 = x[288];
+    t8 = C15 * t13;
+    t4 = (-0.08227211692139658) * t19;
+    t17 = t8 + t4;
+    t16 = (-C16) * t13;
+    t9 = (-0.041919737355232786) * t19;
+    t15 = t16 + t9;
+    t3 = x[78];
+    t10 = 0.0034302519777189918 * t3;
+    t18 = x[161];
+    t12 = 0.0907685920709905 * t18;
+    t8 = t10 - t12;
+    t4 = x[318];
+    t13 = C17 * t8;
+    t19 = (-0.08836162510384164) * t4;
+    t16 = t13 + t19;
+    t9 = (-C18) * t8;
+    t3 = (-0.024920555637863114) * t4;
+    t18 = t9 + t3;
+    t10 = x[108];
+    t12 = 0.057993691384658534 * t10;
+    t13 = x[131];
+    t19 = 0.09181163628090575 * t13;
+    t8 = t12 - t19;
+    t4 = x[348];
+    t9 = 0.07583656737509746 * t4;
+    t3 = x[371];
+    t10 = 0.02363453610164699 * t3;
+    t13 = t9 + t10;
+    t12 = C19 * t8;
+    t19 = (-C20) * t13;
+    t4 = t12 + t19;
+    t3 = (-C20) * t8;
+    t9 = (-C19) * t13;
+    t10 = t3 + t9;
+    t12 = x[341];
+    t19 = 0.08425593717085343 * t12;
+    t8 = x[378];
+    t13 = 0.010127595928892156 * t8;
+    t3 = t19 + t13;
+    t9 = x[101];
+    t12 = 0.042680753490592846 * t9;
+    t8 = x[138];
+    t19 = 0.09377475550498254 * t8;
+    t13 = t12 - t19;
+    t9 = (-C21) * t3;
+    t8 = C22 * t13;
+    t12 = t9 + t8;
+    t19 = C22 * t3;
+    t9 = C21 * t13;
+    t8 = t19 + t9;
+    t3 = t14 + t17;
+    t13 = t2 + t15;
+    t19 = t7 + t4;
+    t9 = t11 + t10;
+    t14 = t14 - t17;
+    t17 = t2 - t15;
+    t2 = t7 - t4;
+    t15 = t11 - t10;
+    t7 = t3 + t19;
+    t4 = t13 + t9;
+    t11 = t14 + t15;
+    t10 = t17 - t2;
+    t3 = t3 - t19;
+    t19 = t13 - t9;
+    t13 = t14 - t15;
+    t9 = t17 + t2;
+    t14 = t5 + t16;
+    t15 = t6 + t18;
+    t17 = t1 + t12;
+    t2 = t0 + t8;
+    t5 = t5 - t16;
+    t16 = t6 - t18;
+    t6 = t1 - t12;
+    t18 = t0 - t8;
+    t1 = t14 + t17;
+    t12 = t15 + t2;
+    t0 = t5 + t18;
+    t8 = t16 - t6;
+    t14 = t14 - t17;
+    t17 = t15 - t2;
+    t15 = t5 - t18;
+    t2 = t16 + t6;
+    t5 = t0 + t8;
+    t18 = t0 - t8;
+    t16 = C6 * t5;
+    t6 = (-C6) * t18;
+    t0 = t15 - t2;
+    t8 = t15 + t2;
+    t5 = (-C6) * t0;
+    t18 = (-C6) * t8;
+    t15 = t7 - t1;
+    t2 = t4 - t12;
+    t0 = t7 + t1;
+    t8 = t4 + t12;
+    t7 = t11 - t16;
+    t1 = t10 - t6;
+    t4 = t11 + t16;
+    t12 = t10 + t6;
+    t11 = t3 - t17;
+    t16 = t19 + t14;
+    t10 = t3 + t17;
+    t6 = t19 - t14;
+    t3 = t13 - t5;
+    t17 = t9 - t18;
+    t19 = t13 + t5;
+    t14 = t9 + t18;
+    re[24] = t0;
+    im[24] = t8;
+    re[39] = t4;
+    im[39] = t12;
+    re[54] = t10;
+    im[54] = t6;
+    re[69] = t19;
+    im[69] = t14;
+    re[84] = t15;
+    im[84] = t2;
+    re[99] = t7;
+    im[99] = t1;
+    re[114] = t11;
+    im[114] = t16;
+    re[9] = t3;
+    im[9] = t17;
+    t13 = x[263];
+    t5 = x[23];
+    t9 = (-0.003697175871317106) * t5;
+    t18 = x[216];
+    t0 = 0.09042074637842189 * t18;
+    t8 = t9 - t0;
+    t4 = (-0.07456041402536764) * t13;
+    t12 = C23 * t8;
+    t10 = t4 + t12;
+    t6 = 0.05417131169511697 * t13;
+    t19 = C24 * t8;
+    t14 = t6 + t19;
+    t15 = x[6];
+    t2 = (-0.000327184801096971) * t15;
+    t7 = x[233];
+    t1 = 0.09093508918086882 * t7;
+    t11 = t2 - t1;
+    t16 = x[246];
+    t3 = C25 * t11;
+    t17 = (-0.06729365199308329) * t16;
+    t5 = t3 + t17;
+    t18 = (-C26) * t11;
+    t9 = (-0.06220561205136254) * t16;
+    t0 = t18 + t9;
+    t4 = x[36];
+    t12 = (-0.00780808135679578) * t4;
+    t13 = x[203];
+    t8 = 0.09036374745767432 * t13;
+    t6 = t12 - t8;
+    t19 = x[276];
+    t15 = C27 * t6;
+    t7 = (-0.07863036785054592) * t19;
+    t2 = t15 + t7;
+    t1 = (-C28) * t6;
+    t3 = (-0.04818475139054731) * t19;
+    t17 = t1 + t3;
+    t11 = x[66];
+    t16 = (-0.006160480419908887) * t11;
+    t18 = x[173];
+    t9 = 0.09018734232191579 * t18;
+    t4 = t16 - t9;
+    t13 = x[306];
+    t12 = C29 * t4;
+    t8 = (-0.08668911768993894) * t13;
+    t15 = t12 + t8;
+    t7 = (-C30) * t4;
+    t6 = (-0.03198130396928453) * t13;
+    t19 = t7 + t6;
+    t1 = x[96];
+    t3 = 0.032098107276850515 * t1;
+    t11 = x[143];
+    t18 = 0.093543358396319 * t11;
+    t16 = t3 - t18;
+    t9 = x[336];
+    t12 = 0.08769929472088642 * t9;
+    t8 = x[383];
+    t4 = 0.004039078536152446 * t8;
+    t13 = t12 + t4;
+    t7 = C31 * t16;
+    t6 = (-C32) * t13;
+    t1 = t7 + t6;
+    t11 = (-C32) * t16;
+    t3 = (-C31) * t13;
+    t18 = t11 + t3;
+    t9 = x[353];
+    t8 = 0.06689484897518211 * t9;
+    t12 = x[366];
+    t4 = 0.035732076918905245 * t12;
+    t7 = t8 + t4;
+    t6 = x[113];
+    t16 = 0.06836553343262328 * t6;
+    t13 = x[126];
+    t11 = 0.08805597029305232 * t13;
+    t3 = t16 - t11;
+    t9 = (-C33) * t7;
+    t12 = C34 * t3;
+    t8 = t9 + t12;
+    t4 = C34 * t7;
+    t6 = C33 * t3;
+    t13 = t4 + t6;
+    t16 = x[323];
+    t11 = x[83];
+    t9 = 0.009610222402322096 * t11;
+    t12 = x[156];
+    t7 = 0.0913148375512127 * t12;
+    t3 = t9 - t7;
+    t4 = (-0.08873785342317599) * t16;
+    t6 = C35 * t3;
+    t11 = t4 + t6;
+    t12 = 0.021304073733269317 * t16;
+    t9 = C36 * t3;
+    t7 = t12 + t9;
+    t4 = x[293];
+    t6 = x[53];
+    t16 = (-0.009973048940772533) * t6;
+    t3 = x[186];
+    t12 = 0.09018536723388516 * t3;
+    t9 = t16 - t12;
+    t6 = (-0.08391449759526201) * t4;
+    t3 = C37 * t9;
+    t16 = t6 + t3;
+    t12 = 0.0386851132634118 * t4;
+    t6 = C38 * t9;
+    t3 = t12 + t6;
+    t4 = t10 + t1;
+    t9 = t14 + t18;
+    t12 = t2 + t11;
+    t6 = t17 + t7;
+    t10 = t10 - t1;
+    t1 = t14 - t18;
+    t14 = t2 - t11;
+    t18 = t17 - t7;
+    t2 = t4 + t12;
+    t11 = t9 + t6;
+    t17 = t10 + t18;
+    t7 = t1 - t14;
+    t4 = t4 - t12;
+    t12 = t9 - t6;
+    t9 = t10 - t18;
+    t6 = t1 + t14;
+    t10 = t5 + t8;
+    t18 = t0 + t13;
+    t1 = t15 + t16;
+    t14 = t19 + t3;
+    t5 = t5 - t8;
+    t8 = t0 - t13;
+    t0 = t15 - t16;
+    t13 = t19 - t3;
+    t15 = t10 + t1;
+    t16 = t18 + t14;
+    t19 = t5 + t13;
+    t3 = t8 - t0;
+    t10 = t10 - t1;
+    t1 = t18 - t14;
+    t18 = t5 - t13;
+    t14 = t8 + t0;
+    t5 = t19 + t3;
+    t13 = t19 - t3;
+    t8 = C6 * t5;
+    t0 = (-C6) * t13;
+    t19 = t18 - t14;
+    t3 = t18 + t14;
+    t5 = (-C6) * t19;
+    t13 = (-C6) * t3;
+    t18 = t2 - t15;
+    t14 = t11 - t16;
+    t19 = t2 + t15;
+    t3 = t11 + t16;
+    t2 = t17 - t8;
+    t15 = t7 - t0;
+    t11 = t17 + t8;
+    t16 = t7 + t0;
+    t17 = t4 - t1;
+    t8 = t12 + t10;
+    t7 = t4 + t1;
+    t0 = t12 - t10;
+    t4 = t9 - t5;
+    t1 = t6 - t13;
+    t12 = t9 + t5;
+    t10 = t6 + t13;
+    re[48] = t19;
+    im[48] = t3;
+    re[63] = t11;
+    im[63] = t16;
+    re[78] = t7;
+    im[78] = t0;
+    re[93] = t12;
+    im[93] = t10;
+    re[108] = t18;
+    im[108] = t14;
+    re[3] = t2;
+    im[3] = t15;
+    re[18] = t17;
+    im[18] = t8;
+    re[33] = t4;
+    im[33] = t1;
+    t9 = x[24];
+    t5 = (-0.004004964884675951) * t9;
+    t6 = x[215];
+    t13 = 0.09041153937109188 * t6;
+    t19 = t5 - t13;
+    t3 = x[264];
+    t11 = C23 * t19;
+    t16 = (-0.07456800684242648) * t3;
+    t7 = t11 + t16;
+    t0 = (-C24) * t19;
+    t12 = (-0.05417682819961758) * t3;
+    t10 = t0 + t12;
+    t18 = x[54];
+    t14 = (-0.009877028183254045) * t18;
+    t2 = x[185];
+    t15 = 0.09017408251741922 * t2;
+    t17 = t14 - t15;
+    t8 = x[294];
+    t4 = C37 * t17;
+    t1 = (-0.08392499896423977) * t8;
+    t9 = t4 + t1;
+    t6 = (-C38) * t17;
+    t5 = (-0.03868995446082068) * t8;
+    t13 = t6 + t5;
+    t11 = x[84];
+    t16 = 0.011015645156279247 * t11;
+    t19 = x[155];
+    t3 = 0.09145513304059315 * t19;
+    t0 = t16 - t3;
+    t12 = x[324];
+    t18 = C35 * t0;
+    t2 = (-0.08860172633923148) * t12;
+    t14 = t18 + t2;
+    t15 = (-C36) * t0;
+    t4 = (-0.021271392511878727) * t12;
+    t1 = t15 + t4;
+    t17 = x[114];
+    t8 = 0.07030922939059663 * t17;
+    t6 = x[125];
+    t5 = 0.08703876860421736 * t6;
+    t11 = t8 - t5;
+    t19 = x[354];
+    t16 = 0.06483018405848807 * t19;
+    t3 = x[365];
+    t18 = 0.03826800503743858 * t3;
+    t2 = t16 + t18;
+    t0 = C34 * t11;
+    t12 = (-C33) * t2;
+    t15 = t0 + t12;
+    t4 = (-C33) * t11;
+    t17 = (-C34) * t2;
+    t6 = t4 + t17;
+    t8 = x[335];
+    t5 = 0.08819068515910766 * t8;
+    t19 = x[384];
+    t3 = 0.0031944649282448214 * t19;
+    t16 = t5 + t3;
+    t18 = x[95];
+    t0 = 0.030076992374384853 * t18;
+    t12 = x[144];
+    t11 = 0.09340276040701101 * t12;
+    t2 = t0 - t11;
+    t4 = (-C32) * t16;
+    t17 = C31 * t2;
+    t8 = t4 + t17;
+    t19 = C31 * t16;
+    t5 = C32 * t2;
+    t3 = t19 + t5;
+    t18 = x[305];
+    t12 = x[65];
+    t0 = (-0.006669565026439458) * t12;
+    t11 = x[174];
+    t4 = 0.09017057297751993 * t11;
+    t17 = t0 - t4;
+    t16 = (-0.08670523957562638) * t18;
+    t2 = C29 * t17;
+    t19 = t16 + t2;
+    t5 = 0.03198725164692237 * t18;
+    t12 = C30 * t17;
+    t11 = t5 + t12;
+    t0 = x[275];
+    t4 = x[35];
+    t16 = (-0.007516983228543206) * t4;
+    t2 = x[204];
+    t18 = 0.09036790163852577 * t2;
+    t17 = t16 - t18;
+    t5 = (-0.07862675324002) * t0;
+    t12 = C27 * t17;
+    t4 = t5 + t12;
+    t2 = 0.048182536354368206 * t0;
+    t16 = C28 * t17;
+    t18 = t2 + t16;
+    t5 = x[245];
+    t12 = x[5];
+    t0 = (-0.0002536339642894417) * t12;
+    t17 = x[234];
+    t2 = 0.09098616076102845 * t17;
+    t16 = t0 - t2;
+    t12 = (-0.06725587929102342) * t5;
+    t17 = C25 * t16;
+    t0 = t12 + t17;
+    t2 = 0.06217069532473416 * t5;
+    t12 = C26 * t16;
+    t17 = t2 + t12;
+    t5 = t7 + t8;
+    t16 = t10 + t3;
+    t2 = t14 + t4;
+    t12 = t1 + t18;
+    t7 = t7 - t8;
+    t8 = t10 - t3;
+    t10 = t14 - t4;
+    t3 = t1 - t18;
+    t14 = t5 + t2;
+    t4 = t16 + t12;
+    t1 = t7 + t3;
+    t18 = t8 - t10;
+    t5 = t5 - t2;
+    t2 = t16 - t12;
+    t16 = t7 - t3;
+    t12 = t8 + t10;
+    t7 = t9 + t19;
+    t3 = t13 + t11;
+    t8 = t15 + t0;
+    t10 = t6 + t17;
+    t9 = t9 - t19;
+    t19 = t13 - t11;
+    t13 = t15 - t0;
+    t11 = t6 - t17;
+    t15 = t7 + t8;
+    t0 = t3 + t10;
+    t6 = t9 + t11;
+    t17 = t19 - t13;
+    t7 = t7 - t8;
+    t8 = t3 - t10;
+    t3 = t9 - t11;
+    t10 = t19 + t13;
+    t9 = t6 + t17;
+    t11 = t6 - t17;
+    t19 = C6 * t9;
+    t13 = (-C6) * t11;
+    t6 = t3 - t10;
+    t17 = t3 + t10;
+    t9 = (-C6) * t6;
+    t11 = (-C6) * t17;
+    t3 = t14 - t15;
+    t10 = t4 - t0;
+    t6 = t14 + t15;
+    t17 = t4 + t0;
+    t14 = t1 - t19;
+    t15 = t18 - t13;
+    t4 = t1 + t19;
+    t0 = t18 + t13;
+    t1 = t5 - t8;
+    t19 = t2 + t7;
+    t18 = t5 + t8;
+    t13 = t2 - t7;
+    t5 = t16 - t9;
+    t8 = t12 - t11;
+    t2 = t16 + t9;
+    t7 = t12 + t11;
+    re[72] = t6;
+    im[72] = t17;
+    re[87] = t4;
+    im[87] = t0;
+    re[102] = t18;
+    im[102] = t13;
+    re[117] = t2;
+    im[117] = t7;
+    re[12] = t3;
+    im[12] = t10;
+    re[27] = t14;
+    im[27] = t15;
+    re[42] = t1;
+    im[42] = t19;
+    re[57] = t5;
+    im[57] = t8;
+    t16 = x[72];
+    t9 = (-0.0022183882598526463) * t16;
+    t12 = x[167];
+    t11 = 0.09037770046151931 * t12;
+    t6 = t9 - t11;
+    t17 = x[312];
+    t4 = C7 * t6;
+    t0 = (-0.08769277076816921) * t17;
+    t18 = t4 + t0;
+    t13 = (-C8) * t6;
+    t2 = (-0.028493108439815427) * t17;
+    t7 = t13 + t2;
+    t3 = x[102];
+    t10 = 0.04486302931753237 * t3;
+    t14 = x[137];
+    t15 = 0.09368831734586838 * t14;
+    t1 = t10 - t15;
+    t19 = x[342];
+    t5 = 0.08333366254031559 * t19;
+    t8 = x[377];
+    t16 = 0.011723299109835212 * t8;
+    t12 = t5 + t16;
+    t9 = C22 * t1;
+    t11 = (-C21) * t12;
+    t4 = t9 + t11;
+    t0 = (-C21) * t1;
+    t6 = (-C22) * t12;
+    t17 = t0 + t6;
+    t13 = x[347];
+    t2 = 0.07733112947219162 * t13;
+    t3 = x[372];
+    t14 = 0.021405733355147217 * t3;
+    t10 = t2 + t14;
+    t15 = x[107];
+    t19 = 0.055828404603232656 * t15;
+    t8 = x[132];
+    t5 = 0.09230804514914263 * t8;
+    t16 = t19 - t5;
+    t9 = (-C20) * t10;
+    t11 = C19 * t16;
+    t1 = t9 + t11;
+    t12 = C19 * t10;
+    t0 = C20 * t16;
+    t6 = t12 + t0;
+    t13 = x[317];
+    t3 = x[77];
+    t2 = 0.002359532354512745 * t3;
+    t14 = x[162];
+    t15 = 0.09068604919647034 * t14;
+    t8 = t2 - t15;
+    t19 = (-0.08844205227646597) * t13;
+    t5 = C17 * t8;
+    t9 = t19 + t5;
+    t11 = 0.024943238446467245 * t13;
+    t10 = C18 * t8;
+    t16 = t11 + t10;
+    t12 = x[287];
+    t0 = x[47];
+    t3 = (-0.00995939719517774) * t0;
+    t14 = x[192];
+    t2 = 0.090263085231818 * t14;
+    t15 = t3 - t2;
+    t19 = (-0.08226014376937163) * t12;
+    t5 = C15 * t15;
+    t13 = t19 + t5;
+    t8 = 0.041913636729565405 * t12;
+    t11 = C16 * t15;
+    t10 = t8 + t11;
+    t0 = x[257];
+    t14 = x[17];
+    t3 = (-0.0020558588746538045) * t14;
+    t2 = x[222];
+    t19 = 0.09051962918570353 * t2;
+    t5 = t3 - t19;
+    t12 = (-0.07229711186635233) * t0;
+    t15 = C13 * t5;
+    t8 = t12 + t15;
+    t11 = 0.056994447399519775 * t0;
+    t14 = C14 * t5;
+    t2 = t11 + t14;
+    t3 = x[12];
+    t19 = (-0.0010496923007052756) * t3;
+    t12 = x[227];
+    t15 = 0.09067108014326149 * t12;
+    t0 = t19 - t15;
+    t5 = x[252];
+    t11 = C11 * t0;
+    t14 = (-0.06988685223544445) * t5;
+    t3 = t11 + t14;
+    t12 = (-C12) * t0;
+    t19 = (-0.05968901066213241) * t5;
+    t15 = t12 + t19;
+    t11 = x[42];
+    t14 = (-0.009265717230196452) * t11;
+    t0 = x[197];
+    t5 = 0.09032124260255246 * t0;
+    t12 = t14 - t5;
+    t19 = x[282];
+    t11 = C9 * t12;
+    t0 = (-0.08049933603033162) * t19;
+    t14 = t11 + t0;
+    t5 = (-C10) * t12;
+    t11 = (-0.045081794291282486) * t19;
+    t0 = t5 + t11;
+    t12 = t18 + t13;
+    t19 = t7 + t10;
+    t5 = t1 + t3;
+    t11 = t6 + t15;
+    t18 = t18 - t13;
+    t13 = t7 - t10;
+    t7 = t1 - t3;
+    t10 = t6 - t15;
+    t1 = t12 + t5;
+    t3 = t19 + t11;
+    t6 = t18 + t10;
+    t15 = t13 - t7;
+    t12 = t12 - t5;
+    t5 = t19 - t11;
+    t19 = t18 - t10;
+    t11 = t13 + t7;
+    t18 = t4 + t8;
+    t10 = t17 + t2;
+    t13 = t9 + t14;
+    t7 = t16 + t0;
+    t4 = t4 - t8;
+    t8 = t17 - t2;
+    t17 = t9 - t14;
+    t2 = t16 - t0;
+    t9 = t18 + t13;
+    t14 = t10 + t7;
+    t16 = t4 + t2;
+    t0 = t8 - t17;
+    t18 = t18 - t13;
+    t13 = t10 - t7;
+    t10 = t4 - t2;
+    t7 = t8 + t17;
+    t4 = t16 + t0;
+    t2 = t16 - t0;
+    t8 = C6 * t4;
+    t17 = (-C6) * t2;
+    t16 = t10 - t7;
+    t0 = t10 + t7;
+    t4 = (-C6) * t16;
+    t2 = (-C6) * t0;
+    t10 = t1 - t9;
+    t7 = t3 - t14;
+    t16 = t1 + t9;
+    t0 = t3 + t14;
+    t1 = t6 - t8;
+    t9 = t15 - t17;
+    t3 = t6 + t8;
+    t14 = t15 + t17;
+    t6 = t12 - t13;
+    t8 = t5 + t18;
+    t15 = t12 + t13;
+    t17 = t5 - t18;
+    t12 = t19 - t4;
+    t13 = t11 - t2;
+    t5 = t19 + t4;
+    t18 = t11 + t2;
+    re[96] = t16;
+    im[96] = t0;
+    re[111] = t3;
+    im[111] = t14;
+    re[6] = t15;
+    im[6] = t17;
+    re[21] = t5;
+    im[21] = t18;
+    re[36] = t10;
+    im[36] = t7;
+    re[51] = t1;
+    im[51] = t9;
+    re[66] = t6;
+    im[66] = t8;
+    re[81] = t12;
+    im[81] = t13;
+    t19 = re[0];
+    t4 = im[0];
+    t11 = re[24];
+    t2 = im[24];
+    t16 = re[48];
+    t0 = im[48];
+    t3 = re[72];
+    t14 = im[72];
+    t15 = re[96];
+    t17 = im[96];
+    t5 = t11 + t15;
+    t18 = t2 + t17;
+    t10 = t16 + t3;
+    t7 = t0 + t14;
+    t1 = t11 - t15;
+    t9 = t2 - t17;
+    t6 = t16 - t3;
+    t8 = t0 - t14;
+    t12 = t5 + t10;
+    t13 = t18 + t7;
+    t11 = t5 - t10;
+    t15 = C39 * t11;
+    t2 = t18 - t7;
+    t17 = C39 * t2;
+    t16 = C40 * t12;
+    t3 = t19 - t16;
+    t0 = C40 * t13;
+    t14 = t4 - t0;
+    t5 = t3 + t15;
+    t10 = t14 + t17;
+    t11 = t3 - t15;
+    t18 = t14 - t17;
+    t7 = C8 * t1;
+    t2 = C23 * t6;
+    t16 = t7 + t2;
+    t0 = C8 * t9;
+    t3 = C23 * t8;
+    t15 = t0 + t3;
+    t14 = C23 * t1;
+    t17 = C8 * t6;
+    t7 = t14 - t17;
+    t2 = C23 * t9;
+    t0 = C8 * t8;
+    t3 = t2 - t0;
+    t1 = t19 + t12;
+    t6 = t4 + t13;
+    t14 = t5 + t15;
+    t17 = t10 - t16;
+    t9 = t11 + t3;
+    t8 = t18 - t7;
+    t2 = t11 - t3;
+    t0 = t18 + t7;
+    t19 = t5 - t15;
+    t12 = t10 + t16;
+    re[0] = t1;
+    im[0] = t6;
+    re[24] = t14;
+    im[24] = t17;
+    re[48] = t9;
+    im[48] = t8;
+    re[72] = t2;
+    im[72] = t0;
+    re[96] = t19;
+    im[96] = t12;
+    t4 = re[15];
+    t13 = im[15];
+    t11 = re[39];
+    t3 = im[39];
+    t18 = re[63];
+    t7 = im[63];
+    t5 = re[87];
+    t15 = im[87];
+    t10 = re[111];
+    t16 = im[111];
+    t1 = t11 + t10;
+    t6 = t3 + t16;
+    t14 = t18 + t5;
+    t17 = t7 + t15;
+    t9 = t11 - t10;
+    t8 = t3 - t16;
+    t2 = t18 - t5;
+    t0 = t7 - t15;
+    t19 = t1 + t14;
+    t12 = t6 + t17;
+    t11 = t1 - t14;
+    t10 = C39 * t11;
+    t3 = t6 - t17;
+    t16 = C39 * t3;
+    t18 = C40 * t19;
+    t5 = t4 - t18;
+    t7 = C40 * t12;
+    t15 = t13 - t7;
+    t1 = t5 + t10;
+    t14 = t15 + t16;
+    t11 = t5 - t10;
+    t6 = t15 - t16;
+    t17 = C8 * t9;
+    t3 = C23 * t2;
+    t18 = t17 + t3;
+    t7 = C8 * t8;
+    t5 = C23 * t0;
+    t10 = t7 + t5;
+    t15 = C23 * t9;
+    t16 = C8 * t2;
+    t17 = t15 - t16;
+    t3 = C23 * t8;
+    t7 = C8 * t0;
+    t5 = t3 - t7;
+    t9 = t4 + t19;
+    t2 = t13 + t12;
+    t15 = t1 + t10;
+    t16 = t14 - t18;
+    t8 = t11 + t5;
+    t0 = t6 - t17;
+    t3 = t11 - t5;
+    t7 = t6 + t17;
+    t4 = t1 - t10;
+    t19 = t14 + t18;
+    re[15] = t9;
+    im[15] = t2;
+    re[39] = t15;
+    im[39] = t16;
+    re[63] = t8;
+    im[63] = t0;
+    re[87] = t3;
+    im[87] = t7;
+    re[111] = t4;
+    im[111] = t19;
+    t13 = re[30];
+    t12 = im[30];
+    t11 = re[54];
+    t5 = im[54];
+    t6 = re[78];
+    t17 = im[78];
+    t1 = re[102];
+    t10 = im[102];
+    t14 = re[6];
+    t18 = im[6];
+    t9 = t11 + t14;
+    t2 = t5 + t18;
+    t15 = t6 + t1;
+    t16 = t17 + t10;
+    t8 = t11 - t14;
+    t0 = t5 - t18;
+    t3 = t6 - t1;
+    t7 = t17 - t10;
+    t4 = t9 + t15;
+    t19 = t2 + t16;
+    t11 = t9 - t15;
+    t14 = C39 * t11;
+    t5 = t2 - t16;
+    t18 = C39 * t5;
+    t6 = C40 * t4;
+    t1 = t13 - t6;
+    t17 = C40 * t19;
+    t10 = t12 - t17;
+    t9 = t1 + t14;
+    t15 = t10 + t18;
+    t11 = t1 - t14;
+    t2 = t10 - t18;
+    t16 = C8 * t8;
+    t5 = C23 * t3;
+    t6 = t16 + t5;
+    t17 = C8 * t0;
+    t1 = C23 * t7;
+    t14 = t17 + t1;
+    t10 = C23 * t8;
+    t18 = C8 * t3;
+    t16 = t10 - t18;
+    t5 = C23 * t0;
+    t17 = C8 * t7;
+    t1 = t5 - t17;
+    t8 = t13 + t4;
+    t3 = t12 + t19;
+    t10 = t9 + t14;
+    t18 = t15 - t6;
+    t0 = t11 + t1;
+    t7 = t2 - t16;
+    t5 = t11 - t1;
+    t17 = t2 + t16;
+    t13 = t9 - t14;
+    t4 = t15 + t6;
+    re[30] = t8;
+    im[30] = t3;
+    re[54] = t10;
+    im[54] = t18;
+    re[78] = t0;
+    im[78] = t7;
+    re[102] = t5;
+    im[102] = t17;
+    re[6] = t13;
+    im[6] = t4;
+    t12 = re[45];
+    t19 = im[45];
+    t11 = re[69];
+    t1 = im[69];
+    t2 = re[93];
+    t16 = im[93];
+    t9 = re[117];
+    t14 = im[117];
+    t15 = re[21];
+    t6 = im[21];
+    t8 = t11 + t15;
+    t3 = t1 + t6;
+    t10 = t2 + t9;
+    t18 = t16 + t14;
+    t0 = t11 - t15;
+    t7 = t1 - t6;
+    t5 = t2 - t9;
+    t17 = t16 - t14;
+    t13 = t8 + t10;
+    t4 = t3 + t18;
+    t11 = t8 - t10;
+    t15 = C39 * t11;
+    t1 = t3 - t18;
+    t6 = C39 * t1;
+    t2 = C40 * t13;
+    t9 = t12 - t2;
+    t16 = C40 * t4;
+    t14 = t19 - t16;
+    t8 = t9 + t15;
+    t10 = t14 + t6;
+    t11 = t9 - t15;
+    t3 = t14 - t6;
+    t18 = C8 * t0;
+    t1 = C23 * t5;
+    t2 = t18 + t1;
+    t16 = C8 * t7;
+    t9 = C23 * t17;
+    t15 = t16 + t9;
+    t14 = C23 * t0;
+    t6 = C8 * t5;
+    t18 = t14 - t6;
+    t1 = C23 * t7;
+    t16 = C8 * t17;
+    t9 = t1 - t16;
+    t0 = t12 + t13;
+    t5 = t19 + t4;
+    t14 = t8 + t15;
+    t6 = t10 - t2;
+    t7 = t11 + t9;
+    t17 = t3 - t18;
+    t1 = t11 - t9;
+    t16 = t3 + t18;
+    t12 = t8 - t15;
+    t13 = t10 + t2;
+    re[45] = t0;
+    im[45] = t5;
+    re[69] = t14;
+    im[69] = t6;
+    re[93] = t7;
+    im[93] = t17;
+    re[117] = t1;
+    im[117] = t16;
+    re[21] = t12;
+    im[21] = t13;
+    t19 = re[60];
+    t4 = im[60];
+    t11 = re[84];
+    t9 = im[84];
+    t3 = re[108];
+    t18 = im[108];
+    t8 = re[12];
+    t15 = im[12];
+    t10 = re[36];
+    t2 = im[36];
+    t0 = t11 + t10;
+    t5 = t9 + t2;
+    t14 = t3 + t8;
+    t6 = t18 + t15;
+    t7 = t11 - t10;
+    t17 = t9 - t2;
+    t1 = t3 - t8;
+    t16 = t18 - t15;
+    t12 = t0 + t14;
+    t13 = t5 + t6;
+    t11 = t0 - t14;
+    t10 = C39 * t11;
+    t9 = t5 - t6;
+    t2 = C39 * t9;
+    t3 = C40 * t12;
+    t8 = t19 - t3;
+    t18 = C40 * t13;
+    t15 = t4 - t18;
+    t0 = t8 + t10;
+    t14 = t15 + t2;
+    t11 = t8 - t10;
+    t5 = t15 - t2;
+    t6 = C8 * t7;
+    t9 = C23 * t1;
+    t3 = t6 + t9;
+    t18 = C8 * t17;
+    t8 = C23 * t16;
+    t10 = t18 + t8;
+    t15 = C23 * t7;
+    t2 = C8 * t1;
+    t6 = t15 - t2;
+    t9 = C23 * t17;
+    t18 = C8 * t16;
+    t8 = t9 - t18;
+    t7 = t19 + t12;
+    t1 = t4 + t13;
+    t15 = t0 + t10;
+    t2 = t14 - t3;
+    t17 = t11 + t8;
+    t16 = t5 - t6;
+    t9 = t11 - t8;
+    t18 = t5 + t6;
+    t19 = t0 - t10;
+    t12 = t14 + t3;
+    re[60] = t7;
+    im[60] = t1;
+    re[84] = t15;
+    im[84] = t2;
+    re[108] = t17;
+    im[108] = t16;
+    re[12] = t9;
+    im[12] = t18;
+    re[36] = t19;
+    im[36] = t12;
+    t4 = re[75];
+    t13 = im[75];
+    t11 = re[99];
+    t8 = im[99];
+    t5 = re[3];
+    t6 = im[3];
+    t0 = re[27];
+    t10 = im[27];
+    t14 = re[51];
+    t3 = im[51];
+    t7 = t11 + t14;
+    t1 = t8 + t3;
+    t15 = t5 + t0;
+    t2 = t6 + t10;
+    t17 = t11 - t14;
+    t16 = t8 - t3;
+    t9 = t5 - t0;
+    t18 = t6 - t10;
+    t19 = t7 + t15;
+    t12 = t1 + t2;
+    t11 = t7 - t15;
+    t14 = C39 * t11;
+    t8 = t1 - t2;
+    t3 = C39 * t8;
+    t5 = C40 * t19;
+    t0 = t4 - t5;
+    t6 = C40 * t12;
+    t10 = t13 - t6;
+    t7 = t0 + t14;
+    t15 = t10 + t3;
+    t11 = t0 - t14;
+    t1 = t10 - t3;
+    t2 = C8 * t17;
+    t8 = C23 * t9;
+    t5 = t2 + t8;
+    t6 = C8 * t16;
+    t0 = C23 * t18;
+    t14 = t6 + t0;
+    t10 = C23 * t17;
+    t3 = C8 * t9;
+    t2 = t10 - t3;
+    t8 = C23 * t16;
+    t6 = C8 * t18;
+    t0 = t8 - t6;
+    t17 = t4 + t19;
+    t9 = t13 + t12;
+    t10 = t7 + t14;
+    t3 = t15 - t5;
+    t16 = t11 + t0;
+    t18 = t1 - t2;
+    t8 = t11 - t0;
+    t6 = t1 + t2;
+    t4 = t7 - t14;
+    t19 = t15 + t5;
+    re[75] = t17;
+    im[75] = t9;
+    re[99] = t10;
+    im[99] = t3;
+    re[3] = t16;
+    im[3] = t18;
+    re[27] = t8;
+    im[27] = t6;
+    re[51] = t4;
+    im[51] = t19;
+    t13 = re[90];
+    t12 = im[90];
+    t11 = re[114];
+    t0 = im[114];
+    t1 = re[18];
+    t2 = im[18];
+    t7 = re[42];
+    t14 = im[42];
+    t15 = re[66];
+    t5 = im[66];
+    t17 = t11 + t15;
+    t9 = t0 + t5;
+    t10 = t1 + t7;
+    t3 = t2 + t14;
+    t16 = t11 - t15;
+    t18 = t0 - t5;
+    t8 = t1 - t7;
+    t6 = t2 - t14;
+    t4 = t17 + t10;
+    t19 = t9 + t3;
+    t11 = t17 - t10;
+    t15 = C39 * t11;
+    t0 = t9 - t3;
+    t5 = C39 * t0;
+    t1 = C40 * t4;
+    t7 = t13 - t1;
+    t2 = C40 * t19;
+    t14 = t12 - t2;
+    t17 = t7 + t15;
+    t10 = t14 + t5;
+    t11 = t7 - t15;
+    t9 = t14 - t5;
+    t3 = C8 * t16;
+    t0 = C23 * t8;
+    t1 = t3 + t0;
+    t2 = C8 * t18;
+    t7 = C23 * t6;
+    t15 = t2 + t7;
+    t14 = C23 * t16;
+    t5 = C8 * t8;
+    t3 = t14 - t5;
+    t0 = C23 * t18;
+    t2 = C8 * t6;
+    t7 = t0 - t2;
+    t16 = t13 + t4;
+    t8 = t12 + t19;
+    t14 = t17 + t15;
+    t5 = t10 - t1;
+    t18 = t11 + t7;
+    t6 = t9 - t3;
+    t0 = t11 - t7;
+    t2 = t9 + t3;
+    t13 = t17 - t15;
+    t4 = t10 + t1;
+    re[90] = t16;
+    im[90] = t8;
+    re[114] = t14;
+    im[114] = t5;
+    re[18] = t18;
+    im[18] = t6;
+    re[42] = t0;
+    im[42] = t2;
+    re[66] = t13;
+    im[66] = t4;
+    t12 = re[105];
+    t19 = im[105];
+    t11 = re[9];
+    t7 = im[9];
+    t9 = re[33];
+    t3 = im[33];
+    t17 = re[57];
+    t15 = im[57];
+    t10 = re[81];
+    t1 = im[81];
+    t16 = t11 + t10;
+    t8 = t7 + t1;
+    t14 = t9 + t17;
+    t5 = t3 + t15;
+    t18 = t11 - t10;
+    t6 = t7 - t1;
+    t0 = t9 - t17;
+    t2 = t3 - t15;
+    t13 = t16 + t14;
+    t4 = t8 + t5;
+    t11 = t16 - t14;
+    t10 = C39 * t11;
+    t7 = t8 - t5;
+    t1 = C39 * t7;
+    t9 = C40 * t13;
+    t17 = t12 - t9;
+    t3 = C40 * t4;
+    t15 = t19 - t3;
+    t16 = t17 + t10;
+    t14 = t15 + t1;
+    t11 = t17 - t10;
+    t8 = t15 - t1;
+    t5 = C8 * t18;
+    t7 = C23 * t0;
+    t9 = t5 + t7;
+    t3 = C8 * t6;
+    t17 = C23 * t2;
+    t10 = t3 + t17;
+    t15 = C23 * t18;
+    t1 = C8 * t0;
+    t5 = t15 - t1;
+    t7 = C23 * t6;
+    t3 = C8 * t2;
+    t17 = t7 - t3;
+    t18 = t12 + t13;
+    t0 = t19 + t4;
+    t15 = t16 + t10;
+    t1 = t14 - t9;
+    t6 = t11 + t17;
+    t2 = t8 - t5;
+    t7 = t11 - t17;
+    t3 = t8 + t5;
+    t12 = t16 - t10;
+    t13 = t14 + t9;
+    re[105] = t18;
+    im[105] = t0;
+    re[9] = t15;
+    im[9] = t1;
+    re[33] = t6;
+    im[33] = t2;
+    re[57] = t7;
+    im[57] = t3;
+    re[81] = t12;
+    im[81] = t13;
+}
+
+/**
+ *  Part 2 of ApplyWindowedMDCT_W10_240().
+ * 
+ *  @param {Number[]} x 
+ *    - The input block (480 points).
+ *  @param {Number[]} X 
+ *    - The array that would contain the output block (240 points).
+ *  @param {Number[]} re 
+ *    - The scratch buffer (real part, 120 points).
+ *  @param {Number[]} im 
+ *    - The scratch buffer (imaginary part, 120 points).
+ */
+function ApplyWindowedMDCT_W10_240_Part2(x, X, re, im) {
+    let t0, t1, t10, t11, t12, t13, t14, t15, t16, t17, t18, t19, t2, t3, t4, t5, t6, t7, t8, t9;
+    const C0 = 0.06540312923014306;
+    const C1 = 0.9978589232386035;
+    const C2 = 0.9914448613738104;
+    const C3 = 0.13052619222005157;
+    const C4 = 0.7071067811865476;
+    const C5 = 0.1434926219911793;
+    const C6 = 0.9896513868196702;
+    const C7 = 0.9986295347545738;
+    const C8 = 0.05233595624294383;
+    const C9 = 0.02617694830787315;
+    const C10 = 0.9996573249755573;
+    const C11 = 0.9855560590580777;
+    const C12 = 0.1693495038490246;
+    const C13 = 0.10452846326765346;
+    const C14 = 0.9945218953682733;
+    const C15 = 0.9958049275746618;
+    const C16 = 0.09150161866340238;
+    const C17 = 0.18223552549214747;
+    const C18 = 0.9832549075639546;
+    const C19 = 0.999914327574007;
+    const C20 = 0.01308959557134444;
+    const C21 = 0.5590169943749475;
+    const C22 = 0.25;
+    const C23 = 0.9510565162951535;
+    const C24 = 0.5877852522924731;
+    t19 = x[279];
+    t4 = x[39];
+    t11 = (-0.008607320729772055) * t4;
+    t17 = x[200];
+    t8 = 0.09034656516392356 * t17;
+    t5 = t11 - t8;
+    t16 = (-0.07987994177505388) * t19;
+    t10 = 0.49999999999999994 * t5;
+    t14 = t16 + t10;
+    t9 = 0.046118705886678976 * t19;
+    t18 = 0.8660254037844387 * t5;
+    t0 = t9 + t18;
+    t15 = x[249];
+    t1 = x[9];
+    t6 = (-0.0006246989869539086) * t1;
+    t2 = x[230];
+    t7 = 0.09079298461985869 * t2;
+    t3 = t6 - t7;
+    t12 = (-0.06900678235464781) * t15;
+    t13 = 0.6593458151000688 * t3;
+    t4 = t12 + t13;
+    t17 = 0.06051732391189002 * t15;
+    t11 = 0.7518398074789774 * t3;
+    t8 = t17 + t11;
+    t16 = x[20];
+    t10 = (-0.0028260339569157957) * t16;
+    t19 = x[219];
+    t5 = 0.09045991723634143 * t19;
+    t9 = t10 - t5;
+    t18 = x[260];
+    t1 = 0.6087614290087207 * t9;
+    t2 = (-0.07308516343749508) * t18;
+    t6 = t1 + t2;
+    t7 = (-0.7933533402912352) * t9;
+    t12 = (-0.05608021832644314) * t18;
+    t13 = t7 + t12;
+    t15 = x[50];
+    t3 = (-0.010087996230996618) * t15;
+    t17 = x[189];
+    t11 = 0.09022333432006113 * t17;
+    t16 = t3 - t11;
+    t19 = x[290];
+    t10 = 0.4422886902190013 * t16;
+    t5 = (-0.08283820997192488) * t19;
+    t1 = t10 + t5;
+    t2 = (-0.8968727415326883) * t16;
+    t9 = (-0.04085128434827552) * t19;
+    t18 = t2 + t9;
+    t7 = x[80];
+    t12 = 0.005734686242618052 * t7;
+    t15 = x[159];
+    t17 = 0.09095859891320969 * t15;
+    t3 = t12 - t17;
+    t11 = x[320];
+    t10 = 0.25881904510252074 * t3;
+    t5 = (-0.0884950074200543) * t11;
+    t16 = t10 + t5;
+    t19 = (-0.9659258262890683) * t3;
+    t2 = (-0.023712165772389757) * t11;
+    t9 = t19 + t2;
+    t7 = x[110];
+    t15 = 0.06225077715882855 * t7;
+    t12 = x[129];
+    t17 = 0.09057075485758738 * t12;
+    t10 = t15 - t17;
+    t5 = x[350];
+    t3 = 0.07254851328183894 * t5;
+    t11 = x[369];
+    t19 = 0.02831385891142267 * t11;
+    t2 = t3 + t19;
+    t7 = C0 * t10;
+    t12 = (-C1) * t2;
+    t15 = t7 + t12;
+    t17 = (-C1) * t10;
+    t5 = (-C0) * t2;
+    t11 = t17 + t5;
+    t3 = x[339];
+    t19 = 0.08585194204681529 * t3;
+    t7 = x[380];
+    t12 = 0.007312017970662098 * t7;
+    t10 = t19 + t12;
+    t2 = x[99];
+    t17 = 0.038368358115737966 * t2;
+    t5 = x[140];
+    t3 = 0.09379849794073448 * t5;
+    t7 = t17 - t3;
+    t19 = (-C2) * t10;
+    t12 = C3 * t7;
+    t2 = t19 + t12;
+    t5 = C3 * t10;
+    t17 = C2 * t7;
+    t3 = t5 + t17;
+    t19 = x[309];
+    t12 = x[69];
+    t10 = (-0.004386750516852225) * t12;
+    t7 = x[170];
+    t5 = 0.09026179621523889 * t7;
+    t17 = t10 - t5;
+    t12 = (-0.08742441147129487) * t19;
+    t7 = 0.3214394653031616 * t17;
+    t10 = t12 + t7;
+    t5 = 0.029676588802555214 * t19;
+    t12 = 0.9469301294951057 * t17;
+    t7 = t5 + t12;
+    t19 = t14 + t16;
+    t17 = t0 + t9;
+    t5 = t6 + t2;
+    t12 = t13 + t3;
+    t14 = t14 - t16;
+    t16 = t0 - t9;
+    t0 = t6 - t2;
+    t9 = t13 - t3;
+    t6 = t19 + t5;
+    t2 = t17 + t12;
+    t13 = t14 + t9;
+    t3 = t16 - t0;
+    t19 = t19 - t5;
+    t5 = t17 - t12;
+    t17 = t14 - t9;
+    t12 = t16 + t0;
+    t14 = t4 + t15;
+    t9 = t8 + t11;
+    t16 = t1 + t10;
+    t0 = t18 + t7;
+    t4 = t4 - t15;
+    t15 = t8 - t11;
+    t8 = t1 - t10;
+    t11 = t18 - t7;
+    t1 = t14 + t16;
+    t10 = t9 + t0;
+    t18 = t4 + t11;
+    t7 = t15 - t8;
+    t14 = t14 - t16;
+    t16 = t9 - t0;
+    t9 = t4 - t11;
+    t0 = t15 + t8;
+    t4 = t18 + t7;
+    t11 = t18 - t7;
+    t15 = C4 * t4;
+    t8 = (-C4) * t11;
+    t18 = t9 - t0;
+    t7 = t9 + t0;
+    t4 = (-C4) * t18;
+    t11 = (-C4) * t7;
+    t9 = t6 - t1;
+    t0 = t2 - t10;
+    t18 = t6 + t1;
+    t7 = t2 + t10;
+    t6 = t13 - t15;
+    t1 = t3 - t8;
+    t2 = t13 + t15;
+    t10 = t3 + t8;
+    t13 = t19 - t16;
+    t15 = t5 + t14;
+    t3 = t19 + t16;
+    t8 = t5 - t14;
+    t19 = t17 - t4;
+    t16 = t12 - t11;
+    t5 = t17 + t4;
+    t14 = t12 + t11;
+    re[40] = t18;
+    im[40] = t7;
+    re[55] = t2;
+    im[55] = t10;
+    re[70] = t3;
+    im[70] = t8;
+    re[85] = t5;
+    im[85] = t14;
+    re[100] = t9;
+    im[100] = t0;
+    re[115] = t6;
+    im[115] = t1;
+    re[10] = t13;
+    im[10] = t15;
+    re[25] = t19;
+    im[25] = t16;
+    t17 = x[8];
+    t4 = (-0.0005120591773015618) * t17;
+    t12 = x[231];
+    t11 = 0.09083830185293602 * t12;
+    t18 = t4 - t11;
+    t7 = x[248];
+    t2 = 0.6691306063588582 * t18;
+    t10 = (-0.06817469524772704) * t7;
+    t3 = t2 + t10;
+    t8 = (-0.7431448254773942) * t18;
+    t5 = (-0.061384771319826156) * t7;
+    t14 = t8 + t5;
+    t9 = x[38];
+    t0 = (-0.008354677907082433) * t9;
+    t6 = x[201];
+    t1 = 0.09035315837290428 * t6;
+    t13 = t0 - t1;
+    t15 = x[278];
+    t19 = 0.5112930860770522 * t13;
+    t16 = (-0.07926363864656163) * t15;
+    t17 = t19 + t16;
+    t12 = (-0.8594064115014527) * t13;
+    t4 = (-0.047156909553994285) * t15;
+    t11 = t12 + t4;
+    t2 = x[68];
+    t10 = (-0.005020331172090252) * t2;
+    t18 = x[171];
+    t7 = 0.09023270804834159 * t18;
+    t8 = t10 - t7;
+    t5 = x[308];
+    t9 = 0.33380685923377096 * t8;
+    t6 = (-0.08705652228561105) * t5;
+    t0 = t9 + t6;
+    t1 = (-0.9426414910921784) * t8;
+    t19 = (-0.03082833140126749) * t5;
+    t16 = t1 + t19;
+    t13 = x[98];
+    t15 = 0.03624772740142347 * t13;
+    t12 = x[141];
+    t4 = 0.0937466223587032 * t12;
+    t2 = t15 - t4;
+    t18 = x[338];
+    t10 = 0.08653541118025766 * t18;
+    t7 = x[381];
+    t9 = 0.006095025443000334 * t7;
+    t6 = t10 + t9;
+    t8 = C5 * t2;
+    t5 = (-C6) * t6;
+    t1 = t8 + t5;
+    t19 = (-C6) * t2;
+    t13 = (-C5) * t6;
+    t12 = t19 + t13;
+    t15 = x[351];
+    t4 = 0.07075761930636477 * t15;
+    t18 = x[368];
+    t7 = 0.030744011971085474 * t18;
+    t10 = t4 + t7;
+    t9 = x[111];
+    t8 = 0.06433086169952303 * t9;
+    t5 = x[128];
+    t2 = 0.08982134522665142 * t5;
+    t6 = t8 - t2;
+    t19 = (-C7) * t10;
+    t13 = C8 * t6;
+    t15 = t19 + t13;
+    t18 = C8 * t10;
+    t4 = C7 * t6;
+    t7 = t18 + t4;
+    t9 = x[321];
+    t5 = x[81];
+    t8 = 0.006970132619098952 * t5;
+    t2 = x[158];
+    t19 = 0.09106723054204843 * t2;
+    t13 = t8 - t19;
+    t10 = (-0.08869188400131403) * t9;
+    t6 = 0.24615329302899303 * t13;
+    t18 = t10 + t6;
+    t4 = 0.022524869041242433 * t9;
+    t5 = 0.9692309097067544 * t13;
+    t2 = t4 + t5;
+    t8 = x[291];
+    t19 = x[51];
+    t10 = (-0.010077888829067619) * t19;
+    t6 = x[188];
+    t9 = 0.09021020255745729 * t6;
+    t13 = t10 - t9;
+    t4 = (-0.08337797525128228) * t8;
+    t5 = 0.4305110968082951 * t13;
+    t19 = t4 + t5;
+    t6 = 0.03976925416077438 * t8;
+    t10 = 0.9025852843498606 * t13;
+    t9 = t6 + t10;
+    t4 = x[261];
+    t5 = x[21];
+    t8 = (-0.003106496364189138) * t5;
+    t13 = x[218];
+    t6 = 0.09044476051911167 * t13;
+    t10 = t8 - t6;
+    t5 = (-0.07382533899625855) * t4;
+    t13 = 0.598324600570659 * t10;
+    t8 = t5 + t13;
+    t6 = 0.055127995358396 * t4;
+    t5 = 0.8012538126910607 * t10;
+    t13 = t6 + t5;
+    t4 = t3 + t15;
+    t10 = t14 + t7;
+    t6 = t0 + t19;
+    t5 = t16 + t9;
+    t3 = t3 - t15;
+    t15 = t14 - t7;
+    t14 = t0 - t19;
+    t7 = t16 - t9;
+    t0 = t4 + t6;
+    t19 = t10 + t5;
+    t16 = t3 + t7;
+    t9 = t15 - t14;
+    t4 = t4 - t6;
+    t6 = t10 - t5;
+    t10 = t3 - t7;
+    t5 = t15 + t14;
+    t3 = t17 + t18;
+    t7 = t11 + t2;
+    t15 = t1 + t8;
+    t14 = t12 + t13;
+    t17 = t17 - t18;
+    t18 = t11 - t2;
+    t11 = t1 - t8;
+    t2 = t12 - t13;
+    t1 = t3 + t15;
+    t8 = t7 + t14;
+    t12 = t17 + t2;
+    t13 = t18 - t11;
+    t3 = t3 - t15;
+    t15 = t7 - t14;
+    t7 = t17 - t2;
+    t14 = t18 + t11;
+    t17 = t12 + t13;
+    t2 = t12 - t13;
+    t18 = C4 * t17;
+    t11 = (-C4) * t2;
+    t12 = t7 - t14;
+    t13 = t7 + t14;
+    t17 = (-C4) * t12;
+    t2 = (-C4) * t13;
+    t7 = t0 - t1;
+    t14 = t19 - t8;
+    t12 = t0 + t1;
+    t13 = t19 + t8;
+    t0 = t16 - t18;
+    t1 = t9 - t11;
+    t19 = t16 + t18;
+    t8 = t9 + t11;
+    t16 = t4 - t15;
+    t18 = t6 + t3;
+    t9 = t4 + t15;
+    t11 = t6 - t3;
+    t4 = t10 - t17;
+    t15 = t5 - t2;
+    t6 = t10 + t17;
+    t3 = t5 + t2;
+    re[64] = t12;
+    im[64] = t13;
+    re[79] = t19;
+    im[79] = t8;
+    re[94] = t9;
+    im[94] = t11;
+    re[109] = t6;
+    im[109] = t3;
+    re[4] = t7;
+    im[4] = t14;
+    re[19] = t0;
+    im[19] = t1;
+    re[34] = t16;
+    im[34] = t18;
+    re[49] = t4;
+    im[49] = t15;
+    t10 = x[56];
+    t17 = (-0.009594235155045096) * t10;
+    t5 = x[183];
+    t2 = 0.09015484901466475 * t5;
+    t12 = t17 - t2;
+    t13 = x[296];
+    t19 = 0.40673664307580015 * t12;
+    t8 = (-0.08444225570662334) * t13;
+    t9 = t19 + t8;
+    t11 = (-0.9135454576426009) * t12;
+    t6 = (-0.03759611449274714) * t13;
+    t3 = t11 + t6;
+    t7 = x[86];
+    t14 = 0.013997450622315546 * t7;
+    t0 = x[153];
+    t1 = 0.0917721188046362 * t0;
+    t16 = t14 - t1;
+    t18 = x[326];
+    t4 = 0.22069743502150108 * t16;
+    t15 = (-0.08856559897245897) * t18;
+    t10 = t4 + t15;
+    t5 = (-0.9753423205085127) * t16;
+    t17 = (-0.0200403490275843) * t18;
+    t2 = t5 + t17;
+    t19 = x[116];
+    t8 = 0.07402277467890597 * t19;
+    t12 = x[123];
+    t13 = 0.08473525892773065 * t12;
+    t11 = t8 - t13;
+    t6 = x[356];
+    t7 = 0.06045909869529394 * t6;
+    t0 = x[363];
+    t14 = 0.04336930039134643 * t0;
+    t1 = t7 + t14;
+    t4 = C9 * t11;
+    t15 = (-C10) * t1;
+    t16 = t4 + t15;
+    t18 = (-C10) * t11;
+    t5 = (-C9) * t1;
+    t17 = t18 + t5;
+    t19 = x[333];
+    t12 = 0.08901973889759318 * t19;
+    t8 = x[386];
+    t13 = 0.0018479886878230783 * t8;
+    t6 = t12 + t13;
+    t0 = x[93];
+    t7 = 0.026158716441240817 * t0;
+    t14 = x[146];
+    t4 = 0.09306915998476316 * t14;
+    t15 = t7 - t4;
+    t11 = (-C11) * t6;
+    t1 = C12 * t15;
+    t18 = t11 + t1;
+    t5 = C12 * t6;
+    t19 = C11 * t15;
+    t8 = t5 + t19;
+    t12 = x[303];
+    t13 = x[63];
+    t0 = (-0.007570478703505297) * t13;
+    t14 = x[176];
+    t7 = 0.09014764694307614 * t14;
+    t4 = t0 - t7;
+    t11 = (-0.08630105334185008) * t12;
+    t1 = 0.35836794954530027 * t4;
+    t6 = t11 + t1;
+    t15 = 0.033127870563609225 * t12;
+    t5 = 0.9335804264972017 * t4;
+    t19 = t15 + t5;
+    t13 = x[273];
+    t14 = x[33];
+    t0 = (-0.0069065039150964765) * t14;
+    t7 = x[206];
+    t11 = 0.09037445652792069 * t7;
+    t1 = t0 - t11;
+    t12 = (-0.07798367058899826) * t13;
+    t4 = 0.5336145159156115 * t1;
+    t15 = t12 + t4;
+    t5 = 0.04920403179693019 * t13;
+    t14 = 0.8457278217039733 * t1;
+    t7 = t5 + t14;
+    t0 = x[243];
+    t11 = x[3];
+    t12 = (-0.00013998679778220064) * t11;
+    t4 = x[236];
+    t13 = 0.09109256795830346 * t4;
+    t1 = t12 - t13;
+    t5 = (-0.06635872234790141) * t0;
+    t14 = 0.6883545756937539 * t1;
+    t11 = t5 + t14;
+    t4 = 0.06297207620062927 * t0;
+    t12 = 0.7253743710122876 * t1;
+    t13 = t4 + t12;
+    t5 = x[26];
+    t14 = (-0.004639507057936654) * t5;
+    t0 = x[213];
+    t1 = 0.09039773212233286 * t0;
+    t4 = t14 - t1;
+    t12 = x[266];
+    t5 = 0.5771451900372336 * t4;
+    t0 = (-0.07528226796447167) * t12;
+    t14 = t5 + t0;
+    t1 = (-0.8166415551616789) * t4;
+    t5 = (-0.053204246803466845) * t12;
+    t0 = t1 + t5;
+    t4 = t9 + t6;
+    t12 = t3 + t19;
+    t1 = t16 + t11;
+    t5 = t17 + t13;
+    t9 = t9 - t6;
+    t6 = t3 - t19;
+    t3 = t16 - t11;
+    t19 = t17 - t13;
+    t16 = t4 + t1;
+    t11 = t12 + t5;
+    t17 = t9 + t19;
+    t13 = t6 - t3;
+    t4 = t4 - t1;
+    t1 = t12 - t5;
+    t12 = t9 - t19;
+    t5 = t6 + t3;
+    t9 = t10 + t15;
+    t19 = t2 + t7;
+    t6 = t18 + t14;
+    t3 = t8 + t0;
+    t10 = t10 - t15;
+    t15 = t2 - t7;
+    t2 = t18 - t14;
+    t7 = t8 - t0;
+    t18 = t9 + t6;
+    t14 = t19 + t3;
+    t8 = t10 + t7;
+    t0 = t15 - t2;
+    t9 = t9 - t6;
+    t6 = t19 - t3;
+    t19 = t10 - t7;
+    t3 = t15 + t2;
+    t10 = t8 + t0;
+    t7 = t8 - t0;
+    t15 = C4 * t10;
+    t2 = (-C4) * t7;
+    t8 = t19 - t3;
+    t0 = t19 + t3;
+    t10 = (-C4) * t8;
+    t7 = (-C4) * t0;
+    t19 = t16 - t18;
+    t3 = t11 - t14;
+    t8 = t16 + t18;
+    t0 = t11 + t14;
+    t16 = t17 - t15;
+    t18 = t13 - t2;
+    t11 = t17 + t15;
+    t14 = t13 + t2;
+    t17 = t4 - t6;
+    t15 = t1 + t9;
+    t13 = t4 + t6;
+    t2 = t1 - t9;
+    t4 = t12 - t10;
+    t6 = t5 - t7;
+    t1 = t12 + t10;
+    t9 = t5 + t7;
+    re[88] = t8;
+    im[88] = t0;
+    re[103] = t11;
+    im[103] = t14;
+    re[118] = t13;
+    im[118] = t2;
+    re[13] = t1;
+    im[13] = t9;
+    re[28] = t19;
+    im[28] = t3;
+    re[43] = t16;
+    im[43] = t18;
+    re[58] = t17;
+    im[58] = t15;
+    re[73] = t4;
+    im[73] = t6;
+    t12 = x[104];
+    t10 = 0.04925447720164721 * t12;
+    t5 = x[135];
+    t7 = 0.0933402251764112 * t5;
+    t8 = t10 - t7;
+    t0 = x[344];
+    t11 = 0.08121961706425723 * t0;
+    t14 = x[375];
+    t13 = 0.01527325089115992 * t14;
+    t2 = t11 + t13;
+    t1 = C13 * t8;
+    t9 = (-C14) * t2;
+    t19 = t1 + t9;
+    t3 = (-C14) * t8;
+    t16 = (-C13) * t2;
+    t18 = t3 + t16;
+    t17 = x[345];
+    t15 = 0.08002143471070666 * t17;
+    t4 = x[374];
+    t6 = 0.017216724201455764 * t4;
+    t12 = t15 + t6;
+    t5 = x[105];
+    t10 = 0.05145305538177841 * t5;
+    t7 = x[134];
+    t0 = 0.09306856714612953 * t7;
+    t14 = t10 - t0;
+    t11 = (-C15) * t12;
+    t13 = C16 * t14;
+    t1 = t11 + t13;
+    t9 = C16 * t12;
+    t8 = C15 * t14;
+    t2 = t9 + t8;
+    t3 = x[315];
+    t16 = x[75];
+    t17 = 0.00037670493957557815 * t16;
+    t4 = x[164];
+    t15 = 0.09054319692897142 * t4;
+    t6 = t17 - t15;
+    t5 = (-0.08824698848995802) * t3;
+    t7 = 0.2840153447039226 * t6;
+    t10 = t5 + t7;
+    t0 = 0.026139948880488928 * t3;
+    t11 = 0.958819734868193 * t6;
+    t13 = t0 + t11;
+    t12 = x[285];
+    t14 = x[45];
+    t9 = (-0.009748913661253328) * t14;
+    t8 = x[194];
+    t16 = 0.09028824521108123 * t8;
+    t4 = t9 - t16;
+    t17 = (-0.08168169579126507) * t12;
+    t15 = 0.4656145203251114 * t4;
+    t5 = t17 + t15;
+    t7 = 0.04297481907681431 * t12;
+    t3 = 0.8849876374630419 * t4;
+    t6 = t7 + t3;
+    t0 = x[255];
+    t11 = x[15];
+    t14 = (-0.0016093731094369787) * t11;
+    t8 = x[224];
+    t9 = 0.09057223570062113 * t8;
+    t16 = t14 - t9;
+    t17 = (-0.07150332875608084) * t0;
+    t15 = 0.6293203910498375 * t16;
+    t12 = t17 + t15;
+    t4 = 0.05790225394696768 * t0;
+    t7 = 0.7771459614569709 * t16;
+    t3 = t4 + t7;
+    t11 = x[14];
+    t8 = (-0.0014078128227328595) * t11;
+    t14 = x[225];
+    t9 = 0.0906025387804812 * t14;
+    t17 = t8 - t9;
+    t15 = x[254];
+    t0 = 0.6394390019805847 * t17;
+    t16 = (-0.07071562622325893) * t15;
+    t4 = t0 + t16;
+    t7 = (-0.7688418320734596) * t17;
+    t11 = (-0.05881356550889693) * t15;
+    t14 = t7 + t11;
+    t8 = x[44];
+    t9 = (-0.009609217195098947) * t8;
+    t0 = x[195];
+    t16 = 0.09029998435103076 * t0;
+    t17 = t9 - t16;
+    t15 = x[284];
+    t7 = 0.4771587602596084 * t17;
+    t11 = (-0.0811016302104831) * t15;
+    t8 = t7 + t11;
+    t0 = (-0.8788171126619654) * t17;
+    t9 = (-0.04403459237275063) * t15;
+    t16 = t0 + t9;
+    t7 = x[74];
+    t11 = (-0.0005378119076130155) * t7;
+    t17 = x[165];
+    t15 = 0.0904819223943538 * t17;
+    t0 = t11 - t15;
+    t9 = x[314];
+    t7 = 0.296541574975571 * t0;
+    t17 = (-0.08795679099806393) * t9;
+    t11 = t7 + t17;
+    t15 = (-0.9550199444571866) * t0;
+    t7 = (-0.027311309553004096) * t9;
+    t17 = t15 + t7;
+    t0 = t19 + t12;
+    t9 = t18 + t3;
+    t15 = t10 + t8;
+    t7 = t13 + t16;
+    t19 = t19 - t12;
+    t12 = t18 - t3;
+    t18 = t10 - t8;
+    t3 = t13 - t16;
+    t10 = t0 + t15;
+    t8 = t9 + t7;
+    t13 = t19 + t3;
+    t16 = t12 - t18;
+    t0 = t0 - t15;
+    t15 = t9 - t7;
+    t9 = t19 - t3;
+    t7 = t12 + t18;
+    t19 = t1 + t4;
+    t3 = t2 + t14;
+    t12 = t5 + t11;
+    t18 = t6 + t17;
+    t1 = t1 - t4;
+    t4 = t2 - t14;
+    t2 = t5 - t11;
+    t14 = t6 - t17;
+    t5 = t19 + t12;
+    t11 = t3 + t18;
+    t6 = t1 + t14;
+    t17 = t4 - t2;
+    t19 = t19 - t12;
+    t12 = t3 - t18;
+    t3 = t1 - t14;
+    t18 = t4 + t2;
+    t1 = t6 + t17;
+    t14 = t6 - t17;
+    t4 = C4 * t1;
+    t2 = (-C4) * t14;
+    t6 = t3 - t18;
+    t17 = t3 + t18;
+    t1 = (-C4) * t6;
+    t14 = (-C4) * t17;
+    t3 = t10 - t5;
+    t18 = t8 - t11;
+    t6 = t10 + t5;
+    t17 = t8 + t11;
+    t10 = t13 - t4;
+    t5 = t16 - t2;
+    t8 = t13 + t4;
+    t11 = t16 + t2;
+    t13 = t0 - t12;
+    t4 = t15 + t19;
+    t16 = t0 + t12;
+    t2 = t15 - t19;
+    t0 = t9 - t1;
+    t12 = t7 - t14;
+    t15 = t9 + t1;
+    t19 = t7 + t14;
+    re[112] = t6;
+    im[112] = t17;
+    re[7] = t8;
+    im[7] = t11;
+    re[22] = t16;
+    im[22] = t2;
+    re[37] = t15;
+    im[37] = t19;
+    re[52] = t3;
+    im[52] = t18;
+    re[67] = t10;
+    im[67] = t5;
+    re[82] = t13;
+    im[82] = t4;
+    re[97] = t0;
+    im[97] = t12;
+    t9 = x[327];
+    t1 = x[87];
+    t7 = 0.015573164605041014 * t1;
+    t14 = x[152];
+    t6 = 0.0919501276997701 * t14;
+    t17 = t7 - t6;
+    t8 = (-0.08864838157408479) * t9;
+    t11 = 0.20791169081775931 * t17;
+    t16 = t8 + t11;
+    t2 = 0.018842795184999605 * t9;
+    t15 = 0.9781476007338057 * t17;
+    t19 = t2 + t15;
+    t3 = x[297];
+    t18 = x[57];
+    t10 = (-0.00940585792015134) * t18;
+    t5 = x[182];
+    t13 = 0.09014737254320589 * t5;
+    t4 = t10 - t13;
+    t0 = (-0.08493418279315719) * t3;
+    t12 = 0.39474385638426723 * t4;
+    t1 = t0 + t12;
+    t14 = 0.03649060470352536 * t3;
+    t7 = 0.9187912101488983 * t4;
+    t6 = t14 + t7;
+    t8 = x[267];
+    t11 = x[27];
+    t9 = (-0.004963431358318882) * t11;
+    t17 = x[212];
+    t2 = 0.09039269800496416 * t17;
+    t15 = t9 - t2;
+    t18 = (-0.0759764714417489) * t8;
+    t5 = 0.5664062369248328 * t15;
+    t10 = t18 + t5;
+    t13 = 0.05221718212365328 * t8;
+    t0 = 0.8241261886220156 * t15;
+    t12 = t13 + t0;
+    t3 = x[2];
+    t4 = (-9.808283613558938e-05) * t3;
+    t14 = x[237];
+    t7 = 0.09114739708161547 * t14;
+    t11 = t4 - t7;
+    t17 = x[242];
+    t9 = 0.6977904598416801 * t11;
+    t2 = (-0.06548933982752324) * t17;
+    t18 = t9 + t2;
+    t5 = (-0.7163019434246544) * t11;
+    t8 = (-0.06379689036510665) * t17;
+    t15 = t5 + t8;
+    t13 = x[32];
+    t0 = (-0.006590424026111684) * t13;
+    t3 = x[207];
+    t14 = 0.09037715743677144 * t3;
+    t4 = t0 - t14;
+    t7 = x[272];
+    t9 = 0.544639035015027 * t4;
+    t2 = (-0.07733061757817183) * t7;
+    t11 = t9 + t2;
+    t17 = (-0.838670567945424) * t4;
+    t5 = (-0.05021909024191767) * t7;
+    t8 = t17 + t5;
+    t13 = x[62];
+    t3 = (-0.007964474361442294) * t13;
+    t0 = x[177];
+    t14 = 0.0901410576578251 * t0;
+    t9 = t3 - t14;
+    t2 = x[302];
+    t4 = 0.3705574375098362 * t9;
+    t7 = (-0.08586630563674248) * t2;
+    t17 = t4 + t7;
+    t5 = (-0.9288095528719242) * t9;
+    t13 = (-0.034257182311275405) * t2;
+    t0 = t5 + t13;
+    t3 = x[92];
+    t14 = 0.024267268007375345 * t3;
+    t4 = x[147];
+    t7 = 0.0928855407162878 * t4;
+    t9 = t14 - t7;
+    t2 = x[332];
+    t5 = 0.08936775744636549 * t2;
+    t13 = x[387];
+    t3 = 0.0013335188911986337 * t13;
+    t4 = t5 + t3;
+    t14 = C17 * t9;
+    t7 = (-C18) * t4;
+    t2 = t14 + t7;
+    t13 = (-C18) * t9;
+    t5 = (-C17) * t4;
+    t3 = t13 + t5;
+    t14 = x[357];
+    t7 = 0.05816525202674937 * t14;
+    t9 = x[362];
+    t4 = 0.04591306207989876 * t9;
+    t13 = t7 + t4;
+    t5 = x[117];
+    t14 = 0.07578270262387705 * t5;
+    t9 = x[122];
+    t7 = 0.08345046628438205 * t9;
+    t4 = t14 - t7;
+    t5 = (-C19) * t13;
+    t9 = C20 * t4;
+    t14 = t5 + t9;
+    t7 = C20 * t13;
+    t5 = C19 * t4;
+    t9 = t7 + t5;
+    t13 = t16 + t11;
+    t4 = t19 + t8;
+    t7 = t10 + t2;
+    t5 = t12 + t3;
+    t16 = t16 - t11;
+    t11 = t19 - t8;
+    t19 = t10 - t2;
+    t8 = t12 - t3;
+    t10 = t13 + t7;
+    t2 = t4 + t5;
+    t12 = t16 + t8;
+    t3 = t11 - t19;
+    t13 = t13 - t7;
+    t7 = t4 - t5;
+    t4 = t16 - t8;
+    t5 = t11 + t19;
+    t16 = t1 + t17;
+    t8 = t6 + t0;
+    t11 = t18 + t14;
+    t19 = t15 + t9;
+    t1 = t1 - t17;
+    t17 = t6 - t0;
+    t6 = t18 - t14;
+    t0 = t15 - t9;
+    t18 = t16 + t11;
+    t14 = t8 + t19;
+    t15 = t1 + t0;
+    t9 = t17 - t6;
+    t16 = t16 - t11;
+    t11 = t8 - t19;
+    t8 = t1 - t0;
+    t19 = t17 + t6;
+    t1 = t15 + t9;
+    t0 = t15 - t9;
+    t17 = C4 * t1;
+    t6 = (-C4) * t0;
+    t15 = t8 - t19;
+    t9 = t8 + t19;
+    t1 = (-C4) * t15;
+    t0 = (-C4) * t9;
+    t8 = t10 - t18;
+    t19 = t2 - t14;
+    t15 = t10 + t18;
+    t9 = t2 + t14;
+    t10 = t12 - t17;
+    t18 = t3 - t6;
+    t2 = t12 + t17;
+    t14 = t3 + t6;
+    t12 = t13 - t11;
+    t17 = t7 + t16;
+    t3 = t13 + t11;
+    t6 = t7 - t16;
+    t13 = t4 - t1;
+    t11 = t5 - t0;
+    t7 = t4 + t1;
+    t16 = t5 + t0;
+    re[16] = t15;
+    im[16] = t9;
+    re[31] = t2;
+    im[31] = t14;
+    re[46] = t3;
+    im[46] = t6;
+    re[61] = t7;
+    im[61] = t16;
+    re[76] = t8;
+    im[76] = t19;
+    re[91] = t10;
+    im[91] = t18;
+    re[106] = t12;
+    im[106] = t17;
+    re[1] = t13;
+    im[1] = t11;
+    t4 = re[40];
+    t1 = im[40];
+    t5 = re[64];
+    t0 = im[64];
+    t15 = re[88];
+    t9 = im[88];
+    t2 = re[112];
+    t14 = im[112];
+    t3 = re[16];
+    t6 = im[16];
+    t7 = t5 + t3;
+    t16 = t0 + t6;
+    t8 = t15 + t2;
+    t19 = t9 + t14;
+    t10 = t5 - t3;
+    t18 = t0 - t6;
+    t12 = t15 - t2;
+    t17 = t9 - t14;
+    t13 = t7 + t8;
+    t11 = t16 + t19;
+    t5 = t7 - t8;
+    t3 = C21 * t5;
+    t0 = t16 - t19;
+    t6 = C21 * t0;
+    t15 = C22 * t13;
+    t2 = t4 - t15;
+    t9 = C22 * t11;
+    t14 = t1 - t9;
+    t7 = t2 + t3;
+    t8 = t14 + t6;
+    t5 = t2 - t3;
+    t16 = t14 - t6;
+    t19 = C23 * t10;
+    t0 = C24 * t12;
+    t15 = t19 + t0;
+    t9 = C23 * t18;
+    t2 = C24 * t17;
+    t3 = t9 + t2;
+    t14 = C24 * t10;
+    t6 = C23 * t12;
+    t19 = t14 - t6;
+    t0 = C24 * t18;
+    t9 = C23 * t17;
+    t2 = t0 - t9;
+    t10 = t4 + t13;
+    t12 = t1 + t11;
+    t14 = t7 + t3;
+    t6 = t8 - t15;
+    t18 = t5 + t2;
+    t17 = t16 - t19;
+    t0 = t5 - t2;
+    t9 = t16 + t19;
+    t4 = t7 - t3;
+    t13 = t8 + t15;
+    re[40] = t10;
+    im[40] = t12;
+    re[64] = t14;
+    im[64] = t6;
+    re[88] = t18;
+    im[88] = t17;
+    re[112] = t0;
+    im[112] = t9;
+    re[16] = t4;
+    im[16] = t13;
+    t1 = re[55];
+    t11 = im[55];
+    t5 = re[79];
+    t2 = im[79];
+    t16 = re[103];
+    t19 = im[103];
+    t7 = re[7];
+    t3 = im[7];
+    t8 = re[31];
+    t15 = im[31];
+    t10 = t5 + t8;
+    t12 = t2 + t15;
+    t14 = t16 + t7;
+    t6 = t19 + t3;
+    t18 = t5 - t8;
+    t17 = t2 - t15;
+    t0 = t16 - t7;
+    t9 = t19 - t3;
+    t4 = t10 + t14;
+    t13 = t12 + t6;
+    t5 = t10 - t14;
+    t8 = C21 * t5;
+    t2 = t12 - t6;
+    t15 = C21 * t2;
+    t16 = C22 * t4;
+    t7 = t1 - t16;
+    t19 = C22 * t13;
+    t3 = t11 - t19;
+    t10 = t7 + t8;
+    t14 = t3 + t15;
+    t5 = t7 - t8;
+    t12 = t3 - t15;
+    t6 = C23 * t18;
+    t2 = C24 * t0;
+    t16 = t6 + t2;
+    t19 = C23 * t17;
+    t7 = C24 * t9;
+    t8 = t19 + t7;
+    t3 = C24 * t18;
+    t15 = C23 * t0;
+    t6 = t3 - t15;
+    t2 = C24 * t17;
+    t19 = C23 * t9;
+    t7 = t2 - t19;
+    t18 = t1 + t4;
+    t0 = t11 + t13;
+    t3 = t10 + t8;
+    t15 = t14 - t16;
+    t17 = t5 + t7;
+    t9 = t12 - t6;
+    t2 = t5 - t7;
+    t19 = t12 + t6;
+    t1 = t10 - t8;
+    t4 = t14 + t16;
+    re[55] = t18;
+    im[55] = t0;
+    re[79] = t3;
+    im[79] = t15;
+    re[103] = t17;
+    im[103] = t9;
+    re[7] = t2;
+    im[7] = t19;
+    re[31] = t1;
+    im[31] = t4;
+    t11 = re[70];
+    t13 = im[70];
+    t5 = re[94];
+    t7 = im[94];
+    t12 = re[118];
+    t6 = im[118];
+    t10 = re[22];
+    t8 = im[22];
+    t14 = re[46];
+    t16 = im[46];
+    t18 = t5 + t14;
+    t0 = t7 + t16;
+    t3 = t12 + t10;
+    t15 = t6 + t8;
+    t17 = t5 - t14;
+    t9 = t7 - t16;
+    t2 = t12 - t10;
+    t19 = t6 - t8;
+    t1 = t18 + t3;
+    t4 = t0 + t15;
+    t5 = t18 - t3;
+    t14 = C21 * t5;
+    t7 = t0 - t15;
+    t16 = C21 * t7;
+    t12 = C22 * t1;
+    t10 = t11 - t12;
+    t6 = C22 * t4;
+    t8 = t13 - t6;
+    t18 = t10 + t14;
+    t3 = t8 + t16;
+    t5 = t10 - t14;
+    t0 = t8 - t16;
+    t15 = C23 * t17;
+    t7 = C24 * t2;
+    t12 = t15 + t7;
+    t6 = C23 * t9;
+    t10 = C24 * t19;
+    t14 = t6 + t10;
+    t8 = C24 * t17;
+    t16 = C23 * t2;
+    t15 = t8 - t16;
+    t7 = C24 * t9;
+    t6 = C23 * t19;
+    t10 = t7 - t6;
+    t17 = t11 + t1;
+    t2 = t13 + t4;
+    t8 = t18 + t14;
+    t16 = t3 - t12;
+    t9 = t5 + t10;
+    t19 = t0 - t15;
+    t7 = t5 - t10;
+    t6 = t0 + t15;
+    t11 = t18 - t14;
+    t1 = t3 + t12;
+    re[70] = t17;
+    im[70] = t2;
+    re[94] = t8;
+    im[94] = t16;
+    re[118] = t9;
+    im[118] = t19;
+    re[22] = t7;
+    im[22] = t6;
+    re[46] = t11;
+    im[46] = t1;
+    t13 = re[85];
+    t4 = im[85];
+    t5 = re[109];
+    t10 = im[109];
+    t0 = re[13];
+    t15 = im[13];
+    t18 = re[37];
+    t14 = im[37];
+    t3 = re[61];
+    t12 = im[61];
+    t17 = t5 + t3;
+    t2 = t10 + t12;
+    t8 = t0 + t18;
+    t16 = t15 + t14;
+    t9 = t5 - t3;
+    t19 = t10 - t12;
+    t7 = t0 - t18;
+    t6 = t15 - t14;
+    t11 = t17 + t8;
+    t1 = t2 + t16;
+    t5 = t17 - t8;
+    t3 = C21 * t5;
+    t10 = t2 - t16;
+    t12 = C21 * t10;
+    t0 = C22 * t11;
+    t18 = t13 - t0;
+    t15 = C22 * t1;
+    t14 = t4 - t15;
+    t17 = t18 + t3;
+    t8 = t14 + t12;
+    t5 = t18 - t3;
+    t2 = t14 - t12;
+    t16 = C23 * t9;
+    t10 = C24 * t7;
+    t0 = t16 + t10;
+    t15 = C23 * t19;
+    t18 = C24 * t6;
+    t3 = t15 + t18;
+    t14 = C24 * t9;
+    t12 = C23 * t7;
+    t16 = t14 - t12;
+    t10 = C24 * t19;
+    t15 = C23 * t6;
+    t18 = t10 - t15;
+    t9 = t13 + t11;
+    t7 = t4 + t1;
+    t14 = t17 + t3;
+    t12 = t8 - t0;
+    t19 = t5 + t18;
+    t6 = t2 - t16;
+    t10 = t5 - t18;
+    t15 = t2 + t16;
+    t13 = t17 - t3;
+    t11 = t8 + t0;
+    re[85] = t9;
+    im[85] = t7;
+    re[109] = t14;
+    im[109] = t12;
+    re[13] = t19;
+    im[13] = t6;
+    re[37] = t10;
+    im[37] = t15;
+    re[61] = t13;
+    im[61] = t11;
+    t4 = re[100];
+    t1 = im[100];
+    t5 = re[4];
+    t18 = im[4];
+    t2 = re[28];
+    t16 = im[28];
+    t17 = re[52];
+    t3 = im[52];
+    t8 = re[76];
+    t0 = im[76];
+    t9 = t5 + t8;
+    t7 = t18 + t0;
+    t14 = t2 + t17;
+    t12 = t16 + t3;
+    t19 = t5 - t8;
+    t6 = t18 - t0;
+    t10 = t2 - t17;
+    t15 = t16 - t3;
+    t13 = t9 + t14;
+    t11 = t7 + t12;
+    t5 = t9 - t14;
+    t8 = C21 * t5;
+    t18 = t7 - t12;
+    t0 = C21 * t18;
+    t2 = C22 * t13;
+    t17 = t4 - t2;
+    t16 = C22 * t11;
+    t3 = t1 - t16;
+    t9 = t17 + t8;
+    t14 = t3 + t0;
+    t5 = t17 - t8;
+    t7 = t3 - t0;
+    t12 = C23 * t19;
+    t18 = C24 * t10;
+    t2 = t12 + t18;
+    t16 = C23 * t6;
+    t17 = C24 * t15;
+    t8 = t16 + t17;
+    t3 = C24 * t19;
+    t0 = C23 * t10;
+    t12 = t3 - t0;
+    t18 = C24 * t6;
+    t16 = C23 * t15;
+    t17 = t18 - t16;
+    t19 = t4 + t13;
+    t10 = t1 + t11;
+    t3 = t9 + t8;
+    t0 = t14 - t2;
+    t6 = t5 + t17;
+    t15 = t7 - t12;
+    t18 = t5 - t17;
+    t16 = t7 + t12;
+    t4 = t9 - t8;
+    t13 = t14 + t2;
+    re[100] = t19;
+    im[100] = t10;
+    re[4] = t3;
+    im[4] = t0;
+    re[28] = t6;
+    im[28] = t15;
+    re[52] = t18;
+    im[52] = t16;
+    re[76] = t4;
+    im[76] = t13;
+    t1 = re[115];
+    t11 = im[115];
+    t5 = re[19];
+    t17 = im[19];
+    t7 = re[43];
+    t12 = im[43];
+    t9 = re[67];
+    t8 = im[67];
+    t14 = re[91];
+    t2 = im[91];
+    t19 = t5 + t14;
+    t10 = t17 + t2;
+    t3 = t7 + t9;
+    t0 = t12 + t8;
+    t6 = t5 - t14;
+    t15 = t17 - t2;
+    t18 = t7 - t9;
+    t16 = t12 - t8;
+    t4 = t19 + t3;
+    t13 = t10 + t0;
+    t5 = t19 - t3;
+    t14 = C21 * t5;
+    t17 = t10 - t0;
+    t2 = C21 * t17;
+    t7 = C22 * t4;
+    t9 = t1 - t7;
+    t12 = C22 * t13;
+    t8 = t11 - t12;
+    t19 = t9 + t14;
+    t3 = t8 + t2;
+    t5 = t9 - t14;
+    t10 = t8 - t2;
+    t0 = C23 * t6;
+    t17 = C24 * t18;
+    t7 = t0 + t17;
+    t12 = C23 * t15;
+    t9 = C24 * t16;
+    t14 = t12 + t9;
+    t8 = C24 * t6;
+    t2 = C23 * t18;
+    t0 = t8 - t2;
+    t17 = C24 * t15;
+    t12 = C23 * t16;
+    t9 = t17 - t12;
+    t6 = t1 + t4;
+    t18 = t11 + t13;
+    t8 = t19 + t14;
+    t2 = t3 - t7;
+    t15 = t5 + t9;
+    t16 = t10 - t0;
+    t17 = t5 - t9;
+    t12 = t10 + t0;
+    t1 = t19 - t14;
+    t4 = t3 + t7;
+    re[115] = t6;
+    im[115] = t18;
+    re[19] = t8;
+    im[19] = t2;
+    re[43] = t15;
+    im[43] = t16;
+    re[67] = t17;
+    im[67] = t12;
+    re[91] = t1;
+    im[91] = t4;
+    t11 = re[10];
+    t13 = im[10];
+    t5 = re[34];
+    t9 = im[34];
+    t10 = re[58];
+    t0 = im[58];
+    t19 = re[82];
+    t14 = im[82];
+    t3 = re[106];
+    t7 = im[106];
+    t6 = t5 + t3;
+    t18 = t9 + t7;
+    t8 = t10 + t19;
+    t2 = t0 + t14;
+    t15 = t5 - t3;
+    t16 = t9 - t7;
+    t17 = t10 - t19;
+    t12 = t0 - t14;
+    t1 = t6 + t8;
+    t4 = t18 + t2;
+    t5 = t6 - t8;
+    t3 = C21 * t5;
+    t9 = t18 - t2;
+    t7 = C21 * t9;
+    t10 = C22 * t1;
+    t19 = t11 - t10;
+    t0 = C22 * t4;
+    t14 = t13 - t0;
+    t6 = t19 + t3;
+    t8 = t14 + t7;
+    t5 = t19 - t3;
+    t18 = t14 - t7;
+    t2 = C23 * t15;
+    t9 = C24 * t17;
+    t10 = t2 + t9;
+    t0 = C23 * t16;
+    t19 = C24 * t12;
+    t3 = t0 + t19;
+    t14 = C24 * t15;
+    t7 = C23 * t17;
+    t2 = t14 - t7;
+    t9 = C24 * t16;
+    t0 = C23 * t12;
+    t19 = t9 - t0;
+    t15 = t11 + t1;
+    t17 = t13 + t4;
+    t14 = t6 + t3;
+    t7 = t8 - t10;
+    t16 = t5 + t19;
+    t12 = t18 - t2;
+    t9 = t5 - t19;
+    t0 = t18 + t2;
+    t11 = t6 - t3;
+    t1 = t8 + t10;
+    re[10] = t15;
+    im[10] = t17;
+    re[34] = t14;
+    im[34] = t7;
+    re[58] = t16;
+    im[58] = t12;
+    re[82] = t9;
+    im[82] = t0;
+    re[106] = t11;
+    im[106] = t1;
+    t13 = re[25];
+    t4 = im[25];
+    t5 = re[49];
+    t19 = im[49];
+    t18 = re[73];
+    t2 = im[73];
+    t6 = re[97];
+    t3 = im[97];
+    t8 = re[1];
+    t10 = im[1];
+    t15 = t5 + t8;
+    t17 = t19 + t10;
+    t14 = t18 + t6;
+    t7 = t2 + t3;
+    t16 = t5 - t8;
+    t12 = t19 - t10;
+    t9 = t18 - t6;
+    t0 = t2 - t3;
+    t11 = t15 + t14;
+    t1 = t17 + t7;
+    t5 = t15 - t14;
+    t8 = C21 * t5;
+    t19 = t17 - t7;
+    t10 = C21 * t19;
+    t18 = C22 * t11;
+    t6 = t13 - t18;
+    t2 = C22 * t1;
+    t3 = t4 - t2;
+    t15 = t6 + t8;
+    t14 = t3 + t10;
+    t5 = t6 - t8;
+    t17 = t3 - t10;
+    t7 = C23 * t16;
+    t19 = C24 * t9;
+    t18 = t7 + t19;
+    t2 = C23 * t12;
+    t6 = C24 * t0;
+    t8 = t2 + t6;
+    t3 = C24 * t16;
+    t10 = C23 * t9;
+    t7 = t3 - t10;
+    t19 = C24 * t12;
+    t2 = C23 * t0;
+    t6 = t19 - t2;
+    t16 = t13 + t11;
+    t9 = t4 + t1;
+    t3 = t15 + t8;
+    t10 = t14 - t18;
+    t12 = t5 + t6;
+    t0 = t17 - t7;
+    t19 = t5 - t6;
+    t2 = t17 + t7;
+    t13 = t15 - t8;
+    t11 = t14 + t18;
+    re[25] = t16;
+    im[25] = t9;
+    re[49] = t3;
+    im[49] = t10;
+    re[73] = t12;
+    im[73] = t0;
+    re[97] = t19;
+    im[97] = t2;
+    re[1] = t13;
+    im[1] = t11;
+}
+
+/**
+ *  Part 3 of ApplyWindowedMDCT_W10_240().
+ * 
+ *  @param {Number[]} x 
+ *    - The input block (480 points).
+ *  @param {Number[]} X 
+ *    - The array that would contain the output block (240 points).
+ *  @param {Number[]} re 
+ *    - The scratch buffer (real part, 120 points).
+ *  @param {Number[]} im 
+ *    - The scratch buffer (imaginary part, 120 points).
+ */
+function ApplyWindowedMDCT_W10_240_Part3(x, X, re, im) {
+    let t0, t1, t10, t11, t12, t13, t14, t15, t16, t17, t18, t19, t2, t3, t4, t5, t6, t7, t8, t9;
+    const C0 = 0.13052619222005157;
+    const C1 = 0.9914448613738104;
+    const C2 = 0.9978589232386035;
+    const C3 = 0.06540312923014306;
+    const C4 = 0.7071067811865476;
+    const C5 = 0.01308959557134444;
+    const C6 = 0.999914327574007;
+    const C7 = 0.9832549075639546;
+    const C8 = 0.18223552549214747;
+    const C9 = 0.9945218953682733;
+    const C10 = 0.10452846326765346;
+    const C11 = 0.09150161866340238;
+    const C12 = 0.9958049275746618;
+    const C13 = 0.1693495038490246;
+    const C14 = 0.9855560590580777;
+    const C15 = 0.9996573249755573;
+    const C16 = 0.02617694830787315;
+    const C17 = 0.05233595624294383;
+    const C18 = 0.9986295347545738;
+    const C19 = 0.9896513868196702;
+    const C20 = 0.1434926219911793;
+    const C21 = 0.5590169943749475;
+    const C22 = 0.25;
+    const C23 = 0.9510565162951535;
+    const C24 = 0.5877852522924731;
+    const C25 = 0.5;
+    const C26 = 0.8660254037844386;
+    const C27 = 0.9999946454016965;
+    const C28 = 0.003272486506526625;
+    const C29 = 0.8643845233130174;
+    const C30 = 0.5028313791490421;
+    const C31 = 0.4971632662526543;
+    const C32 = 0.8676570098195441;
+    const C33 = 0.48576339371634003;
+    const C34 = 0.8740903416267589;
+    const C35 = 0.9998661379095618;
+    const C36 = 0.01636173162648678;
+    const C37 = 0.8577286100002721;
+    const C38 = 0.5141027441932217;
+    const C39 = 0.8509257293058021;
+    const C40 = 0.525286020378792;
+    const C41 = 0.4742802881232292;
+    const C42 = 0.8803739025537654;
+    const C43 = 0.9995663085020212;
+    const C44 = 0.02944817324796316;
+    const C45 = 0.9990952085533004;
+    const C46 = 0.04252956907655312;
+    const C47 = 0.8439770468681933;
+    const C48 = 0.5363792915089503;
+    const C49 = 0.4627159170443501;
+    const C50 = 0.8865066159447464;
+    const C51 = 0.4510722619751534;
+    const C52 = 0.8924874309908339;
+    const C53 = 0.99845291878395;
+    const C54 = 0.055603677682424614;
+    const C55 = 0.8368837533084093;
+    const C56 = 0.5473806568087966;
+    const C57 = 0.8296470640257853;
+    const C58 = 0.558288231251022;
+    const C59 = 0.4393513179959937;
+    const C60 = 0.898315322910159;
+    const C61 = 0.9976395492470157;
+    const C62 = 0.06866825888437376;
+    const C63 = 0.9966552393091803;
+    const C64 = 0.08172107413366822;
+    const C65 = 0.8222682189897751;
+    const C66 = 0.5691001458788982;
+    const C67 = 0.4275550934302821;
+    const C68 = 0.9039892931234433;
+    const C69 = 0.4156856095003708;
+    const C70 = 0.9095083694251006;
+    const C71 = 0.9955001576268845;
+    const C72 = 0.09475988689761111;
+    const C73 = 0.8147484825274894;
+    const C74 = 0.5798145481265136;
+    const C75 = 0.8070891431070594;
+    const C76 = 0.5904296021362011;
+    const C77 = 0.4037448999812271;
+    const C78 = 0.9148716061498187;
+    const C79 = 0.9941745021174282;
+    const C80 = 0.10778246304275935;
+    const C81 = 0.9926784999250583;
+    const C82 = 0.12078657121773083;
+    const C83 = 0.7992915131168641;
+    const C84 = 0.6009434890731024;
+    const C85 = 0.3917350108519559;
+    const C86 = 0.9200780843345949;
+    const C87 = 0.37965799994523275;
+    const C88 = 0.9251269118761953;
+    const C89 = 0.9910124073820492;
+    const C90 = 0.13376998323553513;
+    const C91 = 0.7913569286406602;
+    const C92 = 0.6113544074368165;
+    const C93 = 0.7832867492286504;
+    const C94 = 0.6216605733700774;
+    const C95 = 0.36751593659470355;
+    const C96 = 0.9300172236840121;
+    const C97 = 0.989176509964781;
+    const C98 = 0.14673047445536175;
+    const C99 = 0.9871711222448248;
+    const C100 = 0.159665824163761;
+    const C101 = 0.7750823576645314;
+    const C102 = 0.6318602209644087;
+    const C103 = 0.3553109012804161;
+    const C104 = 0.9347481818282924;
+    t4 = x[40];
+    t1 = (-0.008844170730505122) * t4;
+    t5 = x[199];
+    t6 = 0.09033904297246116 * t5;
+    t17 = t1 - t6;
+    t7 = x[280];
+    t15 = 0.49999999999999994 * t17;
+    t8 = (-0.07988659307659815) * t7;
+    t14 = t15 + t8;
+    t18 = (-0.8660254037844387) * t17;
+    t16 = (-0.04612254601741603) * t7;
+    t9 = t18 + t16;
+    t3 = x[70];
+    t10 = (-0.003709325825660647) * t3;
+    t12 = x[169];
+    t0 = 0.09029545598424361 * t12;
+    t19 = t10 - t0;
+    t2 = x[310];
+    t13 = 0.3214394653031616 * t19;
+    t11 = (-0.08739182195210567) * t2;
+    t4 = t13 + t11;
+    t5 = (-0.9469301294951057) * t19;
+    t1 = (-0.029665526151472124) * t2;
+    t6 = t5 + t1;
+    t15 = x[100];
+    t8 = 0.04051425980544644 * t15;
+    t17 = x[139];
+    t7 = 0.09380974732326158 * t17;
+    t18 = t8 - t7;
+    t16 = x[340];
+    t3 = 0.08509375534963323 * t16;
+    t12 = x[379];
+    t10 = 0.00865644952865837 * t12;
+    t0 = t3 + t10;
+    t13 = C0 * t18;
+    t11 = (-C1) * t0;
+    t19 = t13 + t11;
+    t2 = (-C1) * t18;
+    t5 = (-C0) * t0;
+    t1 = t2 + t5;
+    t15 = x[349];
+    t17 = 0.07424212545015943 * t15;
+    t8 = x[370];
+    t7 = 0.025940569677611058 * t8;
+    t16 = t17 + t7;
+    t12 = x[109];
+    t3 = 0.06013646578493223 * t12;
+    t10 = x[130];
+    t13 = 0.09123336800239044 * t10;
+    t11 = t3 - t13;
+    t18 = (-C2) * t16;
+    t0 = C3 * t11;
+    t2 = t18 + t0;
+    t5 = C3 * t16;
+    t15 = C2 * t11;
+    t8 = t5 + t15;
+    t17 = x[319];
+    t7 = x[79];
+    t12 = 0.004554985403384171 * t7;
+    t10 = x[160];
+    t3 = 0.09085926593715277 * t10;
+    t13 = t12 - t3;
+    t18 = (-0.08859175564229166) * t17;
+    t0 = 0.25881904510252074 * t13;
+    t16 = t18 + t0;
+    t11 = 0.023738089380407404 * t17;
+    t5 = 0.9659258262890683 * t13;
+    t15 = t11 + t5;
+    t7 = x[289];
+    t10 = x[49];
+    t12 = (-0.010071177893659302) * t10;
+    t3 = x[190];
+    t18 = 0.09023662379888507 * t3;
+    t0 = t12 - t18;
+    t17 = (-0.08282601008466309) * t7;
+    t13 = 0.4422886902190013 * t0;
+    t11 = t17 + t13;
+    t5 = 0.040845268029674274 * t7;
+    t10 = 0.8968727415326883 * t0;
+    t3 = t5 + t10;
+    t12 = x[259];
+    t18 = x[19];
+    t17 = (-0.002556868825188347) * t18;
+    t13 = x[220];
+    t7 = 0.09047736631347802 * t13;
+    t0 = t17 - t7;
+    t5 = (-0.07307106854607281) * t12;
+    t10 = 0.6087614290087207 * t0;
+    t18 = t5 + t10;
+    t13 = 0.056069402935862205 * t12;
+    t17 = 0.7933533402912352 * t0;
+    t7 = t13 + t17;
+    t5 = x[10];
+    t10 = (-0.0007516557620710143) * t5;
+    t12 = x[229];
+    t0 = 0.0907499237790884 * t12;
+    t13 = t10 - t0;
+    t17 = x[250];
+    t5 = 0.6593458151000688 * t13;
+    t12 = (-0.06903952607434809) * t17;
+    t10 = t5 + t12;
+    t0 = (-0.7518398074789774) * t13;
+    t5 = (-0.060546039383378) * t17;
+    t12 = t0 + t5;
+    t13 = t14 + t16;
+    t17 = t9 + t15;
+    t0 = t19 + t18;
+    t5 = t1 + t7;
+    t14 = t14 - t16;
+    t16 = t9 - t15;
+    t9 = t19 - t18;
+    t15 = t1 - t7;
+    t19 = t13 + t0;
+    t18 = t17 + t5;
+    t1 = t14 + t15;
+    t7 = t16 - t9;
+    t13 = t13 - t0;
+    t0 = t17 - t5;
+    t17 = t14 - t15;
+    t5 = t16 + t9;
+    t14 = t4 + t11;
+    t15 = t6 + t3;
+    t16 = t2 + t10;
+    t9 = t8 + t12;
+    t4 = t4 - t11;
+    t11 = t6 - t3;
+    t6 = t2 - t10;
+    t3 = t8 - t12;
+    t2 = t14 + t16;
+    t10 = t15 + t9;
+    t8 = t4 + t3;
+    t12 = t11 - t6;
+    t14 = t14 - t16;
+    t16 = t15 - t9;
+    t15 = t4 - t3;
+    t9 = t11 + t6;
+    t4 = t8 + t12;
+    t3 = t8 - t12;
+    t11 = C4 * t4;
+    t6 = (-C4) * t3;
+    t8 = t15 - t9;
+    t12 = t15 + t9;
+    t4 = (-C4) * t8;
+    t3 = (-C4) * t12;
+    t15 = t19 - t2;
+    t9 = t18 - t10;
+    t8 = t19 + t2;
+    t12 = t18 + t10;
+    t19 = t1 - t11;
+    t2 = t7 - t6;
+    t18 = t1 + t11;
+    t10 = t7 + t6;
+    t1 = t13 - t16;
+    t11 = t0 + t14;
+    t7 = t13 + t16;
+    t6 = t0 - t14;
+    t13 = t17 - t4;
+    t16 = t5 - t3;
+    t0 = t17 + t4;
+    t14 = t5 + t3;
+    re[80] = t8;
+    im[80] = t12;
+    re[95] = t18;
+    im[95] = t10;
+    re[110] = t7;
+    im[110] = t6;
+    re[5] = t0;
+    im[5] = t14;
+    re[20] = t15;
+    im[20] = t9;
+    re[35] = t19;
+    im[35] = t2;
+    re[50] = t1;
+    im[50] = t11;
+    re[65] = t13;
+    im[65] = t16;
+    t17 = x[88];
+    t4 = 0.01720475415329727 * t17;
+    t5 = x[151];
+    t3 = 0.09214217231595667 * t5;
+    t8 = t4 - t3;
+    t12 = x[328];
+    t18 = 0.20791169081775931 * t8;
+    t10 = (-0.08846361878862997) * t12;
+    t7 = t18 + t10;
+    t6 = (-0.9781476007338057) * t8;
+    t0 = (-0.01880352264259875) * t12;
+    t14 = t6 + t0;
+    t15 = x[118];
+    t9 = 0.07747210014149988 * t15;
+    t19 = x[121];
+    t2 = 0.08207914857879066 * t19;
+    t1 = t9 - t2;
+    t11 = x[358];
+    t13 = 0.055808255064714284 * t11;
+    t16 = x[361];
+    t17 = 0.04843858972584554 * t16;
+    t5 = t13 + t17;
+    t4 = C5 * t1;
+    t3 = (-C6) * t5;
+    t18 = t4 + t3;
+    t10 = (-C6) * t1;
+    t8 = (-C5) * t5;
+    t12 = t10 + t8;
+    t6 = x[331];
+    t0 = 0.0896783027408053 * t6;
+    t15 = x[388];
+    t19 = 0.0009125736608240058 * t15;
+    t9 = t0 + t19;
+    t2 = x[91];
+    t11 = 0.02242428004659937 * t2;
+    t16 = x[148];
+    t13 = 0.09269655281084341 * t16;
+    t17 = t11 - t13;
+    t4 = (-C7) * t9;
+    t3 = C8 * t17;
+    t1 = t4 + t3;
+    t5 = C8 * t9;
+    t10 = C7 * t17;
+    t8 = t5 + t10;
+    t6 = x[301];
+    t15 = x[61];
+    t0 = (-0.008322144470384114) * t15;
+    t19 = x[178];
+    t2 = 0.09013738926953407 * t19;
+    t16 = t0 - t2;
+    t11 = (-0.08586980020157) * t6;
+    t13 = 0.3705574375098362 * t16;
+    t4 = t11 + t13;
+    t3 = 0.03425857650127237 * t6;
+    t9 = 0.9288095528719242 * t16;
+    t17 = t3 + t9;
+    t5 = x[271];
+    t10 = x[31];
+    t15 = (-0.0062692385583066525) * t10;
+    t19 = x[208];
+    t0 = 0.09037972981913145 * t19;
+    t2 = t15 - t0;
+    t11 = (-0.07732841659884884) * t5;
+    t13 = 0.544639035015027 * t2;
+    t6 = t11 + t13;
+    t16 = 0.050217660909232846 * t5;
+    t3 = 0.838670567945424 * t2;
+    t9 = t16 + t3;
+    t10 = x[241];
+    t19 = x[1];
+    t15 = (-6.461799509184562e-05) * t19;
+    t0 = x[238];
+    t11 = 0.09120297040746775 * t0;
+    t13 = t15 - t11;
+    t5 = (-0.06544943476296426) * t10;
+    t2 = 0.6977904598416801 * t13;
+    t16 = t5 + t2;
+    t3 = 0.06375801657228193 * t10;
+    t19 = 0.7163019434246544 * t13;
+    t0 = t3 + t19;
+    t15 = x[28];
+    t11 = (-0.005289771942594677) * t15;
+    t5 = x[211];
+    t2 = 0.09038859984383908 * t5;
+    t10 = t11 - t2;
+    t13 = x[268];
+    t3 = 0.5664062369248328 * t10;
+    t19 = (-0.0759799161662189) * t13;
+    t15 = t3 + t19;
+    t5 = (-0.8241261886220156) * t10;
+    t11 = (-0.05221954961718913) * t13;
+    t2 = t5 + t11;
+    t3 = x[58];
+    t19 = (-0.009185219825295927) * t3;
+    t10 = x[181];
+    t13 = 0.09014166674246678 * t10;
+    t5 = t19 - t13;
+    t11 = x[298];
+    t3 = 0.39474385638426723 * t5;
+    t10 = (-0.08493955896979632) * t11;
+    t19 = t3 + t10;
+    t13 = (-0.9187912101488983) * t5;
+    t3 = (-0.036492914491294) * t11;
+    t10 = t13 + t3;
+    t5 = t7 + t6;
+    t11 = t14 + t9;
+    t13 = t1 + t15;
+    t3 = t8 + t2;
+    t7 = t7 - t6;
+    t6 = t14 - t9;
+    t14 = t1 - t15;
+    t9 = t8 - t2;
+    t1 = t5 + t13;
+    t15 = t11 + t3;
+    t8 = t7 + t9;
+    t2 = t6 - t14;
+    t5 = t5 - t13;
+    t13 = t11 - t3;
+    t11 = t7 - t9;
+    t3 = t6 + t14;
+    t7 = t18 + t16;
+    t9 = t12 + t0;
+    t6 = t4 + t19;
+    t14 = t17 + t10;
+    t18 = t18 - t16;
+    t16 = t12 - t0;
+    t12 = t4 - t19;
+    t0 = t17 - t10;
+    t4 = t7 + t6;
+    t19 = t9 + t14;
+    t17 = t18 + t0;
+    t10 = t16 - t12;
+    t7 = t7 - t6;
+    t6 = t9 - t14;
+    t9 = t18 - t0;
+    t14 = t16 + t12;
+    t18 = t17 + t10;
+    t0 = t17 - t10;
+    t16 = C4 * t18;
+    t12 = (-C4) * t0;
+    t17 = t9 - t14;
+    t10 = t9 + t14;
+    t18 = (-C4) * t17;
+    t0 = (-C4) * t10;
+    t9 = t1 - t4;
+    t14 = t15 - t19;
+    t17 = t1 + t4;
+    t10 = t15 + t19;
+    t1 = t8 - t16;
+    t4 = t2 - t12;
+    t15 = t8 + t16;
+    t19 = t2 + t12;
+    t8 = t5 - t6;
+    t16 = t13 + t7;
+    t2 = t5 + t6;
+    t12 = t13 - t7;
+    t5 = t11 - t18;
+    t6 = t3 - t0;
+    t13 = t11 + t18;
+    t7 = t3 + t0;
+    re[104] = t17;
+    im[104] = t10;
+    re[119] = t15;
+    im[119] = t19;
+    re[14] = t2;
+    im[14] = t12;
+    re[29] = t13;
+    im[29] = t7;
+    re[44] = t9;
+    im[44] = t14;
+    re[59] = t1;
+    im[59] = t4;
+    re[74] = t8;
+    im[74] = t16;
+    re[89] = t5;
+    im[89] = t6;
+    t11 = x[343];
+    t18 = 0.08232273400567668 * t11;
+    t3 = x[376];
+    t0 = 0.013440088856608934 * t3;
+    t17 = t18 + t0;
+    t10 = x[103];
+    t15 = 0.0470560814586414 * t10;
+    t19 = x[136];
+    t2 = 0.09354518542538132 * t19;
+    t12 = t15 - t2;
+    t13 = (-C9) * t17;
+    t7 = C10 * t12;
+    t9 = t13 + t7;
+    t14 = C10 * t17;
+    t1 = C9 * t12;
+    t4 = t14 + t1;
+    t8 = x[313];
+    t16 = x[73];
+    t5 = (-0.0014024705571618484) * t16;
+    t6 = x[166];
+    t11 = 0.09042691251422759 * t6;
+    t3 = t5 - t11;
+    t18 = (-0.08801029821615376) * t8;
+    t0 = 0.296541574975571 * t3;
+    t10 = t18 + t0;
+    t19 = 0.027327923985840826 * t8;
+    t15 = 0.9550199444571866 * t3;
+    t2 = t19 + t15;
+    t13 = x[283];
+    t7 = x[43];
+    t17 = (-0.0094478602997263) * t7;
+    t12 = x[196];
+    t14 = 0.09031100536051363 * t12;
+    t1 = t17 - t14;
+    t16 = (-0.0810917330575054) * t13;
+    t6 = 0.4771587602596084 * t1;
+    t5 = t16 + t6;
+    t11 = 0.044029218657131206 * t13;
+    t18 = 0.8788171126619654 * t1;
+    t0 = t11 + t18;
+    t8 = x[253];
+    t3 = x[13];
+    t19 = (-0.0012211593971509166) * t3;
+    t15 = x[226];
+    t7 = 0.09063548315755285 * t15;
+    t12 = t19 - t7;
+    t17 = (-0.07068992235790732) * t8;
+    t14 = 0.6394390019805847 * t12;
+    t16 = t17 + t14;
+    t6 = 0.05879218782974132 * t8;
+    t13 = 0.7688418320734596 * t12;
+    t1 = t6 + t13;
+    t11 = x[16];
+    t18 = (-0.0018254876761969407) * t11;
+    t3 = x[223];
+    t15 = 0.09054461383114908 * t3;
+    t19 = t18 - t15;
+    t7 = x[256];
+    t17 = 0.6293203910498375 * t19;
+    t14 = (-0.07152514182181881) * t7;
+    t8 = t17 + t14;
+    t12 = (-0.7771459614569709) * t19;
+    t6 = (-0.05791991781931732) * t7;
+    t13 = t12 + t6;
+    t11 = x[46];
+    t3 = (-0.009866002803861918) * t11;
+    t18 = x[193];
+    t15 = 0.09027590607247186 * t18;
+    t17 = t3 - t15;
+    t14 = x[286];
+    t19 = 0.4656145203251114 * t17;
+    t7 = (-0.08169286025152986) * t14;
+    t12 = t19 + t7;
+    t6 = (-0.8849876374630419) * t17;
+    t11 = (-0.04298069298351179) * t14;
+    t18 = t6 + t11;
+    t3 = x[76];
+    t15 = 0.0013420618236381805 * t3;
+    t19 = x[163];
+    t7 = 0.09061105648469268 * t19;
+    t17 = t15 - t7;
+    t14 = x[316];
+    t6 = 0.2840153447039226 * t17;
+    t11 = (-0.0881808994091659) * t14;
+    t3 = t6 + t11;
+    t19 = (-0.958819734868193) * t17;
+    t15 = (-0.02612037240288867) * t14;
+    t7 = t19 + t15;
+    t6 = x[106];
+    t11 = 0.05364633647126045 * t6;
+    t17 = x[133];
+    t14 = 0.09272581162425671 * t17;
+    t19 = t11 - t14;
+    t15 = x[346];
+    t6 = 0.07872584358434256 * t15;
+    t17 = x[373];
+    t11 = 0.019263488602330115 * t17;
+    t14 = t6 + t11;
+    t15 = C11 * t19;
+    t17 = (-C12) * t14;
+    t6 = t15 + t17;
+    t11 = (-C12) * t19;
+    t15 = (-C11) * t14;
+    t17 = t11 + t15;
+    t19 = t9 + t8;
+    t14 = t4 + t13;
+    t11 = t5 + t3;
+    t15 = t0 + t7;
+    t9 = t9 - t8;
+    t8 = t4 - t13;
+    t4 = t5 - t3;
+    t13 = t0 - t7;
+    t5 = t19 + t11;
+    t3 = t14 + t15;
+    t0 = t9 + t13;
+    t7 = t8 - t4;
+    t19 = t19 - t11;
+    t11 = t14 - t15;
+    t14 = t9 - t13;
+    t15 = t8 + t4;
+    t9 = t10 + t12;
+    t13 = t2 + t18;
+    t8 = t16 + t6;
+    t4 = t1 + t17;
+    t10 = t10 - t12;
+    t12 = t2 - t18;
+    t2 = t16 - t6;
+    t18 = t1 - t17;
+    t16 = t9 + t8;
+    t6 = t13 + t4;
+    t1 = t10 + t18;
+    t17 = t12 - t2;
+    t9 = t9 - t8;
+    t8 = t13 - t4;
+    t13 = t10 - t18;
+    t4 = t12 + t2;
+    t10 = t1 + t17;
+    t18 = t1 - t17;
+    t12 = C4 * t10;
+    t2 = (-C4) * t18;
+    t1 = t13 - t4;
+    t17 = t13 + t4;
+    t10 = (-C4) * t1;
+    t18 = (-C4) * t17;
+    t13 = t5 - t16;
+    t4 = t3 - t6;
+    t1 = t5 + t16;
+    t17 = t3 + t6;
+    t5 = t0 - t12;
+    t16 = t7 - t2;
+    t3 = t0 + t12;
+    t6 = t7 + t2;
+    t0 = t19 - t8;
+    t12 = t11 + t9;
+    t7 = t19 + t8;
+    t2 = t11 - t9;
+    t19 = t14 - t10;
+    t8 = t15 - t18;
+    t11 = t14 + t10;
+    t9 = t15 + t18;
+    re[8] = t1;
+    im[8] = t17;
+    re[23] = t3;
+    im[23] = t6;
+    re[38] = t7;
+    im[38] = t2;
+    re[53] = t11;
+    im[53] = t9;
+    re[68] = t13;
+    im[68] = t4;
+    re[83] = t5;
+    im[83] = t16;
+    re[98] = t0;
+    im[98] = t12;
+    re[113] = t19;
+    im[113] = t8;
+    t14 = x[295];
+    t10 = x[55];
+    t15 = (-0.009751032959974511) * t10;
+    t18 = x[184];
+    t1 = 0.09016381559190259 * t18;
+    t17 = t15 - t1;
+    t3 = (-0.08443385812492211) * t14;
+    t6 = 0.40673664307580015 * t17;
+    t7 = t3 + t6;
+    t2 = 0.03759237564848653 * t14;
+    t11 = 0.9135454576426009 * t17;
+    t9 = t2 + t11;
+    t13 = x[265];
+    t4 = x[25];
+    t5 = (-0.004319493689614513) * t4;
+    t16 = x[214];
+    t0 = 0.09040393857576512 * t16;
+    t12 = t5 - t0;
+    t19 = (-0.07527709965103584) * t13;
+    t8 = 0.5771451900372336 * t12;
+    t10 = t19 + t8;
+    t18 = 0.05320059420065568 * t13;
+    t15 = 0.8166415551616789 * t12;
+    t1 = t18 + t15;
+    t3 = x[4];
+    t6 = (-0.00019153837094621886) * t3;
+    t14 = x[235];
+    t17 = 0.09103872912395485 * t14;
+    t2 = t6 - t17;
+    t11 = x[244];
+    t4 = 0.6883545756937539 * t2;
+    t16 = (-0.06639796582476502) * t11;
+    t5 = t4 + t16;
+    t0 = (-0.7253743710122876) * t2;
+    t19 = (-0.06300931686964753) * t11;
+    t8 = t0 + t19;
+    t13 = x[34];
+    t12 = (-0.007215922854075747) * t13;
+    t18 = x[205];
+    t15 = 0.09037142040595954 * t18;
+    t3 = t12 - t15;
+    t14 = x[274];
+    t6 = 0.5336145159156115 * t3;
+    t17 = (-0.07798629053160648) * t14;
+    t4 = t6 + t17;
+    t16 = (-0.8457278217039733) * t3;
+    t2 = (-0.04920568485760851) * t14;
+    t11 = t16 + t2;
+    t0 = x[64];
+    t19 = (-0.00713921434866316) * t0;
+    t13 = x[175];
+    t18 = 0.09015740847118053 * t13;
+    t12 = t19 - t18;
+    t15 = x[304];
+    t6 = 0.35836794954530027 * t12;
+    t17 = (-0.08629170934924954) * t15;
+    t3 = t6 + t17;
+    t14 = (-0.9335804264972017) * t12;
+    t16 = (-0.033124283740906244) * t15;
+    t2 = t14 + t16;
+    t0 = x[94];
+    t13 = 0.028096241762516693 * t0;
+    t19 = x[145];
+    t18 = 0.0932431206828331 * t19;
+    t6 = t13 - t18;
+    t17 = x[334];
+    t12 = 0.0886290112993696 * t17;
+    t15 = x[385];
+    t14 = 0.0024660855829648633 * t15;
+    t16 = t12 + t14;
+    t0 = C13 * t6;
+    t19 = (-C14) * t16;
+    t13 = t0 + t19;
+    t18 = (-C14) * t6;
+    t17 = (-C13) * t16;
+    t15 = t18 + t17;
+    t12 = x[355];
+    t14 = 0.06268301918716075 * t12;
+    t0 = x[364];
+    t19 = 0.04081728778312514 * t0;
+    t6 = t14 + t19;
+    t16 = x[115];
+    t18 = 0.0721967068995578 * t16;
+    t17 = x[124];
+    t12 = 0.08593171868025587 * t17;
+    t0 = t18 - t12;
+    t14 = (-C15) * t6;
+    t19 = C16 * t0;
+    t16 = t14 + t19;
+    t17 = C16 * t6;
+    t18 = C15 * t0;
+    t12 = t17 + t18;
+    t14 = x[325];
+    t19 = x[85];
+    t6 = 0.012478133323927637 * t19;
+    t0 = x[154];
+    t17 = 0.09160734286600784 * t0;
+    t18 = t6 - t17;
+    t19 = (-0.08872490366621275) * t14;
+    t0 = 0.22069743502150108 * t18;
+    t6 = t19 + t0;
+    t17 = 0.02007639599956437 * t14;
+    t19 = 0.9753423205085127 * t18;
+    t0 = t17 + t19;
+    t14 = t7 + t3;
+    t18 = t9 + t2;
+    t17 = t5 + t16;
+    t19 = t8 + t12;
+    t7 = t7 - t3;
+    t3 = t9 - t2;
+    t9 = t5 - t16;
+    t2 = t8 - t12;
+    t5 = t14 + t17;
+    t16 = t18 + t19;
+    t8 = t7 + t2;
+    t12 = t3 - t9;
+    t14 = t14 - t17;
+    t17 = t18 - t19;
+    t18 = t7 - t2;
+    t19 = t3 + t9;
+    t7 = t10 + t13;
+    t2 = t1 + t15;
+    t3 = t4 + t6;
+    t9 = t11 + t0;
+    t10 = t10 - t13;
+    t13 = t1 - t15;
+    t1 = t4 - t6;
+    t15 = t11 - t0;
+    t4 = t7 + t3;
+    t6 = t2 + t9;
+    t11 = t10 + t15;
+    t0 = t13 - t1;
+    t7 = t7 - t3;
+    t3 = t2 - t9;
+    t2 = t10 - t15;
+    t9 = t13 + t1;
+    t10 = t11 + t0;
+    t15 = t11 - t0;
+    t13 = C4 * t10;
+    t1 = (-C4) * t15;
+    t11 = t2 - t9;
+    t0 = t2 + t9;
+    t10 = (-C4) * t11;
+    t15 = (-C4) * t0;
+    t2 = t5 - t4;
+    t9 = t16 - t6;
+    t11 = t5 + t4;
+    t0 = t16 + t6;
+    t5 = t8 - t13;
+    t4 = t12 - t1;
+    t16 = t8 + t13;
+    t6 = t12 + t1;
+    t8 = t14 - t3;
+    t13 = t17 + t7;
+    t12 = t14 + t3;
+    t1 = t17 - t7;
+    t14 = t18 - t10;
+    t3 = t19 - t15;
+    t17 = t18 + t10;
+    t7 = t19 + t15;
+    re[32] = t11;
+    im[32] = t0;
+    re[47] = t16;
+    im[47] = t6;
+    re[62] = t12;
+    im[62] = t1;
+    re[77] = t17;
+    im[77] = t7;
+    re[92] = t2;
+    im[92] = t9;
+    re[107] = t5;
+    im[107] = t4;
+    re[2] = t8;
+    im[2] = t13;
+    re[17] = t14;
+    im[17] = t3;
+    t18 = x[247];
+    t10 = x[7];
+    t19 = (-0.0004130921772342458) * t10;
+    t15 = x[232];
+    t11 = 0.09088573803577533 * t15;
+    t0 = t19 - t11;
+    t16 = (-0.068139112686825) * t18;
+    t6 = 0.6691306063588582 * t0;
+    t12 = t16 + t6;
+    t1 = 0.06135273263808349 * t18;
+    t17 = 0.7431448254773942 * t0;
+    t7 = t1 + t17;
+    t2 = x[22];
+    t9 = (-0.0033972510637467705) * t2;
+    t5 = x[217];
+    t4 = 0.0904317674286848 * t5;
+    t8 = t9 - t4;
+    t13 = x[262];
+    t14 = 0.598324600570659 * t8;
+    t3 = (-0.07383594610184373) * t13;
+    t10 = t14 + t3;
+    t15 = (-0.8012538126910607) * t8;
+    t19 = (-0.05513591605981662) * t13;
+    t11 = t15 + t19;
+    t16 = x[52];
+    t6 = (-0.01003984440986052) * t16;
+    t18 = x[187];
+    t0 = 0.09019749580915963 * t18;
+    t1 = t6 - t0;
+    t17 = x[292];
+    t2 = 0.4305110968082951 * t1;
+    t5 = (-0.08338972128630891) * t17;
+    t9 = t2 + t5;
+    t4 = (-0.9025852843498606) * t1;
+    t14 = (-0.03977485673208829) * t17;
+    t3 = t4 + t14;
+    t8 = x[82];
+    t13 = 0.008261818993155777 * t8;
+    t15 = x[157];
+    t19 = 0.09118574786983594 * t15;
+    t16 = t13 - t19;
+    t18 = x[322];
+    t6 = 0.24615329302899303 * t16;
+    t0 = (-0.08857660803622269) * t18;
+    t2 = t6 + t0;
+    t5 = (-0.9692309097067544) * t16;
+    t1 = (-0.022495592675693055) * t18;
+    t17 = t5 + t1;
+    t4 = x[112];
+    t14 = 0.066370981076243 * t4;
+    t8 = x[127];
+    t15 = 0.08898332462644315 * t8;
+    t13 = t14 - t15;
+    t19 = x[352];
+    t6 = 0.06887202171480471 * t19;
+    t0 = x[367];
+    t16 = 0.03322042000362499 * t0;
+    t18 = t6 + t16;
+    t5 = C17 * t13;
+    t1 = (-C18) * t18;
+    t4 = t5 + t1;
+    t8 = (-C18) * t13;
+    t14 = (-C17) * t18;
+    t15 = t8 + t14;
+    t19 = x[337];
+    t0 = 0.0871493500245666 * t19;
+    t6 = x[382];
+    t16 = 0.0050047570007893775 * t6;
+    t5 = t0 + t16;
+    t1 = x[97];
+    t13 = 0.03415636549737041 * t1;
+    t18 = x[142];
+    t8 = 0.09365978084389547 * t18;
+    t14 = t13 - t8;
+    t19 = (-C19) * t5;
+    t6 = C20 * t14;
+    t0 = t19 + t6;
+    t16 = C20 * t5;
+    t1 = C19 * t14;
+    t18 = t16 + t1;
+    t13 = x[307];
+    t8 = x[67];
+    t19 = (-0.00561113289925892) * t8;
+    t6 = x[172];
+    t5 = 0.09020799501323429 * t6;
+    t14 = t19 - t5;
+    t16 = (-0.08708037195537979) * t13;
+    t1 = 0.33380685923377096 * t14;
+    t8 = t16 + t1;
+    t6 = 0.030836777012281325 * t13;
+    t19 = 0.9426414910921784 * t14;
+    t5 = t6 + t19;
+    t16 = x[277];
+    t1 = x[37];
+    t13 = (-0.00808776756287088) * t1;
+    t14 = x[202];
+    t6 = 0.09035887908682398 * t14;
+    t19 = t13 - t6;
+    t1 = (-0.07925862038376871) * t16;
+    t14 = 0.5112930860770522 * t19;
+    t13 = t1 + t14;
+    t6 = 0.04715392400136656 * t16;
+    t1 = 0.8594064115014527 * t19;
+    t14 = t6 + t1;
+    t16 = t12 + t4;
+    t19 = t7 + t15;
+    t6 = t9 + t8;
+    t1 = t3 + t5;
+    t12 = t12 - t4;
+    t4 = t7 - t15;
+    t7 = t9 - t8;
+    t15 = t3 - t5;
+    t9 = t16 + t6;
+    t8 = t19 + t1;
+    t3 = t12 + t15;
+    t5 = t4 - t7;
+    t16 = t16 - t6;
+    t6 = t19 - t1;
+    t19 = t12 - t15;
+    t1 = t4 + t7;
+    t12 = t10 + t0;
+    t15 = t11 + t18;
+    t4 = t2 + t13;
+    t7 = t17 + t14;
+    t10 = t10 - t0;
+    t0 = t11 - t18;
+    t11 = t2 - t13;
+    t18 = t17 - t14;
+    t2 = t12 + t4;
+    t13 = t15 + t7;
+    t17 = t10 + t18;
+    t14 = t0 - t11;
+    t12 = t12 - t4;
+    t4 = t15 - t7;
+    t15 = t10 - t18;
+    t7 = t0 + t11;
+    t10 = t17 + t14;
+    t18 = t17 - t14;
+    t0 = C4 * t10;
+    t11 = (-C4) * t18;
+    t17 = t15 - t7;
+    t14 = t15 + t7;
+    t10 = (-C4) * t17;
+    t18 = (-C4) * t14;
+    t15 = t9 - t2;
+    t7 = t8 - t13;
+    t17 = t9 + t2;
+    t14 = t8 + t13;
+    t9 = t3 - t0;
+    t2 = t5 - t11;
+    t8 = t3 + t0;
+    t13 = t5 + t11;
+    t3 = t16 - t4;
+    t0 = t6 + t12;
+    t5 = t16 + t4;
+    t11 = t6 - t12;
+    t16 = t19 - t10;
+    t4 = t1 - t18;
+    t6 = t19 + t10;
+    t12 = t1 + t18;
+    re[56] = t17;
+    im[56] = t14;
+    re[71] = t8;
+    im[71] = t13;
+    re[86] = t5;
+    im[86] = t11;
+    re[101] = t6;
+    im[101] = t12;
+    re[116] = t15;
+    im[116] = t7;
+    re[11] = t9;
+    im[11] = t2;
+    re[26] = t3;
+    im[26] = t0;
+    re[41] = t16;
+    im[41] = t4;
+    t19 = re[80];
+    t10 = im[80];
+    t1 = re[104];
+    t18 = im[104];
+    t17 = re[8];
+    t14 = im[8];
+    t8 = re[32];
+    t13 = im[32];
+    t5 = re[56];
+    t11 = im[56];
+    t6 = t1 + t5;
+    t12 = t18 + t11;
+    t15 = t17 + t8;
+    t7 = t14 + t13;
+    t9 = t1 - t5;
+    t2 = t18 - t11;
+    t3 = t17 - t8;
+    t0 = t14 - t13;
+    t16 = t6 + t15;
+    t4 = t12 + t7;
+    t1 = t6 - t15;
+    t5 = C21 * t1;
+    t18 = t12 - t7;
+    t11 = C21 * t18;
+    t17 = C22 * t16;
+    t8 = t19 - t17;
+    t14 = C22 * t4;
+    t13 = t10 - t14;
+    t6 = t8 + t5;
+    t15 = t13 + t11;
+    t1 = t8 - t5;
+    t12 = t13 - t11;
+    t7 = C23 * t9;
+    t18 = C24 * t3;
+    t17 = t7 + t18;
+    t14 = C23 * t2;
+    t8 = C24 * t0;
+    t5 = t14 + t8;
+    t13 = C24 * t9;
+    t11 = C23 * t3;
+    t7 = t13 - t11;
+    t18 = C24 * t2;
+    t14 = C23 * t0;
+    t8 = t18 - t14;
+    t9 = t19 + t16;
+    t3 = t10 + t4;
+    t13 = t6 + t5;
+    t11 = t15 - t17;
+    t2 = t1 + t8;
+    t0 = t12 - t7;
+    t18 = t1 - t8;
+    t14 = t12 + t7;
+    t19 = t6 - t5;
+    t16 = t15 + t17;
+    re[80] = t9;
+    im[80] = t3;
+    re[104] = t13;
+    im[104] = t11;
+    re[8] = t2;
+    im[8] = t0;
+    re[32] = t18;
+    im[32] = t14;
+    re[56] = t19;
+    im[56] = t16;
+    t10 = re[95];
+    t4 = im[95];
+    t1 = re[119];
+    t8 = im[119];
+    t12 = re[23];
+    t7 = im[23];
+    t6 = re[47];
+    t5 = im[47];
+    t15 = re[71];
+    t17 = im[71];
+    t9 = t1 + t15;
+    t3 = t8 + t17;
+    t13 = t12 + t6;
+    t11 = t7 + t5;
+    t2 = t1 - t15;
+    t0 = t8 - t17;
+    t18 = t12 - t6;
+    t14 = t7 - t5;
+    t19 = t9 + t13;
+    t16 = t3 + t11;
+    t1 = t9 - t13;
+    t15 = C21 * t1;
+    t8 = t3 - t11;
+    t17 = C21 * t8;
+    t12 = C22 * t19;
+    t6 = t10 - t12;
+    t7 = C22 * t16;
+    t5 = t4 - t7;
+    t9 = t6 + t15;
+    t13 = t5 + t17;
+    t1 = t6 - t15;
+    t3 = t5 - t17;
+    t11 = C23 * t2;
+    t8 = C24 * t18;
+    t12 = t11 + t8;
+    t7 = C23 * t0;
+    t6 = C24 * t14;
+    t15 = t7 + t6;
+    t5 = C24 * t2;
+    t17 = C23 * t18;
+    t11 = t5 - t17;
+    t8 = C24 * t0;
+    t7 = C23 * t14;
+    t6 = t8 - t7;
+    t2 = t10 + t19;
+    t18 = t4 + t16;
+    t5 = t9 + t15;
+    t17 = t13 - t12;
+    t0 = t1 + t6;
+    t14 = t3 - t11;
+    t8 = t1 - t6;
+    t7 = t3 + t11;
+    t10 = t9 - t15;
+    t19 = t13 + t12;
+    re[95] = t2;
+    im[95] = t18;
+    re[119] = t5;
+    im[119] = t17;
+    re[23] = t0;
+    im[23] = t14;
+    re[47] = t8;
+    im[47] = t7;
+    re[71] = t10;
+    im[71] = t19;
+    t4 = re[110];
+    t16 = im[110];
+    t1 = re[14];
+    t6 = im[14];
+    t3 = re[38];
+    t11 = im[38];
+    t9 = re[62];
+    t15 = im[62];
+    t13 = re[86];
+    t12 = im[86];
+    t2 = t1 + t13;
+    t18 = t6 + t12;
+    t5 = t3 + t9;
+    t17 = t11 + t15;
+    t0 = t1 - t13;
+    t14 = t6 - t12;
+    t8 = t3 - t9;
+    t7 = t11 - t15;
+    t10 = t2 + t5;
+    t19 = t18 + t17;
+    t1 = t2 - t5;
+    t13 = C21 * t1;
+    t6 = t18 - t17;
+    t12 = C21 * t6;
+    t3 = C22 * t10;
+    t9 = t4 - t3;
+    t11 = C22 * t19;
+    t15 = t16 - t11;
+    t2 = t9 + t13;
+    t5 = t15 + t12;
+    t1 = t9 - t13;
+    t18 = t15 - t12;
+    t17 = C23 * t0;
+    t6 = C24 * t8;
+    t3 = t17 + t6;
+    t11 = C23 * t14;
+    t9 = C24 * t7;
+    t13 = t11 + t9;
+    t15 = C24 * t0;
+    t12 = C23 * t8;
+    t17 = t15 - t12;
+    t6 = C24 * t14;
+    t11 = C23 * t7;
+    t9 = t6 - t11;
+    t0 = t4 + t10;
+    t8 = t16 + t19;
+    t15 = t2 + t13;
+    t12 = t5 - t3;
+    t14 = t1 + t9;
+    t7 = t18 - t17;
+    t6 = t1 - t9;
+    t11 = t18 + t17;
+    t4 = t2 - t13;
+    t10 = t5 + t3;
+    re[110] = t0;
+    im[110] = t8;
+    re[14] = t15;
+    im[14] = t12;
+    re[38] = t14;
+    im[38] = t7;
+    re[62] = t6;
+    im[62] = t11;
+    re[86] = t4;
+    im[86] = t10;
+    t16 = re[5];
+    t19 = im[5];
+    t1 = re[29];
+    t9 = im[29];
+    t18 = re[53];
+    t17 = im[53];
+    t2 = re[77];
+    t13 = im[77];
+    t5 = re[101];
+    t3 = im[101];
+    t0 = t1 + t5;
+    t8 = t9 + t3;
+    t15 = t18 + t2;
+    t12 = t17 + t13;
+    t14 = t1 - t5;
+    t7 = t9 - t3;
+    t6 = t18 - t2;
+    t11 = t17 - t13;
+    t4 = t0 + t15;
+    t10 = t8 + t12;
+    t1 = t0 - t15;
+    t5 = C21 * t1;
+    t9 = t8 - t12;
+    t3 = C21 * t9;
+    t18 = C22 * t4;
+    t2 = t16 - t18;
+    t17 = C22 * t10;
+    t13 = t19 - t17;
+    t0 = t2 + t5;
+    t15 = t13 + t3;
+    t1 = t2 - t5;
+    t8 = t13 - t3;
+    t12 = C23 * t14;
+    t9 = C24 * t6;
+    t18 = t12 + t9;
+    t17 = C23 * t7;
+    t2 = C24 * t11;
+    t5 = t17 + t2;
+    t13 = C24 * t14;
+    t3 = C23 * t6;
+    t12 = t13 - t3;
+    t9 = C24 * t7;
+    t17 = C23 * t11;
+    t2 = t9 - t17;
+    t14 = t16 + t4;
+    t6 = t19 + t10;
+    t13 = t0 + t5;
+    t3 = t15 - t18;
+    t7 = t1 + t2;
+    t11 = t8 - t12;
+    t9 = t1 - t2;
+    t17 = t8 + t12;
+    t16 = t0 - t5;
+    t4 = t15 + t18;
+    re[5] = t14;
+    im[5] = t6;
+    re[29] = t13;
+    im[29] = t3;
+    re[53] = t7;
+    im[53] = t11;
+    re[77] = t9;
+    im[77] = t17;
+    re[101] = t16;
+    im[101] = t4;
+    t19 = re[20];
+    t10 = im[20];
+    t1 = re[44];
+    t2 = im[44];
+    t8 = re[68];
+    t12 = im[68];
+    t0 = re[92];
+    t5 = im[92];
+    t15 = re[116];
+    t18 = im[116];
+    t14 = t1 + t15;
+    t6 = t2 + t18;
+    t13 = t8 + t0;
+    t3 = t12 + t5;
+    t7 = t1 - t15;
+    t11 = t2 - t18;
+    t9 = t8 - t0;
+    t17 = t12 - t5;
+    t16 = t14 + t13;
+    t4 = t6 + t3;
+    t1 = t14 - t13;
+    t15 = C21 * t1;
+    t2 = t6 - t3;
+    t18 = C21 * t2;
+    t8 = C22 * t16;
+    t0 = t19 - t8;
+    t12 = C22 * t4;
+    t5 = t10 - t12;
+    t14 = t0 + t15;
+    t13 = t5 + t18;
+    t1 = t0 - t15;
+    t6 = t5 - t18;
+    t3 = C23 * t7;
+    t2 = C24 * t9;
+    t8 = t3 + t2;
+    t12 = C23 * t11;
+    t0 = C24 * t17;
+    t15 = t12 + t0;
+    t5 = C24 * t7;
+    t18 = C23 * t9;
+    t3 = t5 - t18;
+    t2 = C24 * t11;
+    t12 = C23 * t17;
+    t0 = t2 - t12;
+    t7 = t19 + t16;
+    t9 = t10 + t4;
+    t5 = t14 + t15;
+    t18 = t13 - t8;
+    t11 = t1 + t0;
+    t17 = t6 - t3;
+    t2 = t1 - t0;
+    t12 = t6 + t3;
+    t19 = t14 - t15;
+    t16 = t13 + t8;
+    re[20] = t7;
+    im[20] = t9;
+    re[44] = t5;
+    im[44] = t18;
+    re[68] = t11;
+    im[68] = t17;
+    re[92] = t2;
+    im[92] = t12;
+    re[116] = t19;
+    im[116] = t16;
+    t10 = re[35];
+    t4 = im[35];
+    t1 = re[59];
+    t0 = im[59];
+    t6 = re[83];
+    t3 = im[83];
+    t14 = re[107];
+    t15 = im[107];
+    t13 = re[11];
+    t8 = im[11];
+    t7 = t1 + t13;
+    t9 = t0 + t8;
+    t5 = t6 + t14;
+    t18 = t3 + t15;
+    t11 = t1 - t13;
+    t17 = t0 - t8;
+    t2 = t6 - t14;
+    t12 = t3 - t15;
+    t19 = t7 + t5;
+    t16 = t9 + t18;
+    t1 = t7 - t5;
+    t13 = C21 * t1;
+    t0 = t9 - t18;
+    t8 = C21 * t0;
+    t6 = C22 * t19;
+    t14 = t10 - t6;
+    t3 = C22 * t16;
+    t15 = t4 - t3;
+    t7 = t14 + t13;
+    t5 = t15 + t8;
+    t1 = t14 - t13;
+    t9 = t15 - t8;
+    t18 = C23 * t11;
+    t0 = C24 * t2;
+    t6 = t18 + t0;
+    t3 = C23 * t17;
+    t14 = C24 * t12;
+    t13 = t3 + t14;
+    t15 = C24 * t11;
+    t8 = C23 * t2;
+    t18 = t15 - t8;
+    t0 = C24 * t17;
+    t3 = C23 * t12;
+    t14 = t0 - t3;
+    t11 = t10 + t19;
+    t2 = t4 + t16;
+    t15 = t7 + t13;
+    t8 = t5 - t6;
+    t17 = t1 + t14;
+    t12 = t9 - t18;
+    t0 = t1 - t14;
+    t3 = t9 + t18;
+    t10 = t7 - t13;
+    t19 = t5 + t6;
+    re[35] = t11;
+    im[35] = t2;
+    re[59] = t15;
+    im[59] = t8;
+    re[83] = t17;
+    im[83] = t12;
+    re[107] = t0;
+    im[107] = t3;
+    re[11] = t10;
+    im[11] = t19;
+    t4 = re[50];
+    t16 = im[50];
+    t1 = re[74];
+    t14 = im[74];
+    t9 = re[98];
+    t18 = im[98];
+    t7 = re[2];
+    t13 = im[2];
+    t5 = re[26];
+    t6 = im[26];
+    t11 = t1 + t5;
+    t2 = t14 + t6;
+    t15 = t9 + t7;
+    t8 = t18 + t13;
+    t17 = t1 - t5;
+    t12 = t14 - t6;
+    t0 = t9 - t7;
+    t3 = t18 - t13;
+    t10 = t11 + t15;
+    t19 = t2 + t8;
+    t1 = t11 - t15;
+    t5 = C21 * t1;
+    t14 = t2 - t8;
+    t6 = C21 * t14;
+    t9 = C22 * t10;
+    t7 = t4 - t9;
+    t18 = C22 * t19;
+    t13 = t16 - t18;
+    t11 = t7 + t5;
+    t15 = t13 + t6;
+    t1 = t7 - t5;
+    t2 = t13 - t6;
+    t8 = C23 * t17;
+    t14 = C24 * t0;
+    t9 = t8 + t14;
+    t18 = C23 * t12;
+    t7 = C24 * t3;
+    t5 = t18 + t7;
+    t13 = C24 * t17;
+    t6 = C23 * t0;
+    t8 = t13 - t6;
+    t14 = C24 * t12;
+    t18 = C23 * t3;
+    t7 = t14 - t18;
+    t17 = t4 + t10;
+    t0 = t16 + t19;
+    t13 = t11 + t5;
+    t6 = t15 - t9;
+    t12 = t1 + t7;
+    t3 = t2 - t8;
+    t14 = t1 - t7;
+    t18 = t2 + t8;
+    t4 = t11 - t5;
+    t10 = t15 + t9;
+    re[50] = t17;
+    im[50] = t0;
+    re[74] = t13;
+    im[74] = t6;
+    re[98] = t12;
+    im[98] = t3;
+    re[2] = t14;
+    im[2] = t18;
+    re[26] = t4;
+    im[26] = t10;
+    t16 = re[65];
+    t19 = im[65];
+    t1 = re[89];
+    t7 = im[89];
+    t2 = re[113];
+    t8 = im[113];
+    t11 = re[17];
+    t5 = im[17];
+    t15 = re[41];
+    t9 = im[41];
+    t17 = t1 + t15;
+    t0 = t7 + t9;
+    t13 = t2 + t11;
+    t6 = t8 + t5;
+    t12 = t1 - t15;
+    t3 = t7 - t9;
+    t14 = t2 - t11;
+    t18 = t8 - t5;
+    t4 = t17 + t13;
+    t10 = t0 + t6;
+    t1 = t17 - t13;
+    t15 = C21 * t1;
+    t7 = t0 - t6;
+    t9 = C21 * t7;
+    t2 = C22 * t4;
+    t11 = t16 - t2;
+    t8 = C22 * t10;
+    t5 = t19 - t8;
+    t17 = t11 + t15;
+    t13 = t5 + t9;
+    t1 = t11 - t15;
+    t0 = t5 - t9;
+    t6 = C23 * t12;
+    t7 = C24 * t14;
+    t2 = t6 + t7;
+    t8 = C23 * t3;
+    t11 = C24 * t18;
+    t15 = t8 + t11;
+    t5 = C24 * t12;
+    t9 = C23 * t14;
+    t6 = t5 - t9;
+    t7 = C24 * t3;
+    t8 = C23 * t18;
+    t11 = t7 - t8;
+    t12 = t16 + t4;
+    t14 = t19 + t10;
+    t5 = t17 + t15;
+    t9 = t13 - t2;
+    t3 = t1 + t11;
+    t18 = t0 - t6;
+    t7 = t1 - t11;
+    t8 = t0 + t6;
+    t16 = t17 - t15;
+    t4 = t13 + t2;
+    re[65] = t12;
+    im[65] = t14;
+    re[89] = t5;
+    im[89] = t9;
+    re[113] = t3;
+    im[113] = t18;
+    re[17] = t7;
+    im[17] = t8;
+    re[41] = t16;
+    im[41] = t4;
+    t19 = re[0];
+    t10 = im[0];
+    t1 = re[40];
+    t11 = im[40];
+    t0 = re[80];
+    t6 = im[80];
+    t17 = t1 + t0;
+    t15 = t11 + t6;
+    t13 = C25 * t17;
+    t2 = t19 - t13;
+    t12 = C25 * t15;
+    t14 = t10 - t12;
+    t5 = t1 - t0;
+    t9 = C26 * t5;
+    t3 = t11 - t6;
+    t18 = C26 * t3;
+    t7 = t19 + t17;
+    t8 = t10 + t15;
+    t16 = t2 + t18;
+    t4 = t14 - t9;
+    t13 = t2 - t18;
+    t12 = t14 + t9;
+    t1 = C27 * t7;
+    t0 = C28 * t8;
+    t5 = t1 + t0;
+    t11 = C28 * t7;
+    t6 = (-C27) * t8;
+    t3 = t11 + t6;
+    X[0] = t5;
+    X[239] = t3;
+    t19 = C29 * t16;
+    t17 = C30 * t4;
+    t10 = t19 + t17;
+    t15 = C30 * t16;
+    t2 = (-C29) * t4;
+    t18 = t15 + t2;
+    X[80] = t10;
+    X[159] = t18;
+    t14 = C31 * t13;
+    t9 = C32 * t12;
+    t1 = t14 + t9;
+    t0 = C32 * t13;
+    t7 = (-C31) * t12;
+    t8 = t0 + t7;
+    X[160] = t1;
+    X[79] = t8;
+    t11 = re[39];
+    t6 = im[39];
+    t5 = re[79];
+    t3 = im[79];
+    t19 = re[119];
+    t17 = im[119];
+    t16 = t5 + t19;
+    t4 = t3 + t17;
+    t15 = C25 * t16;
+    t2 = t11 - t15;
+    t10 = C25 * t4;
+    t18 = t6 - t10;
+    t14 = t5 - t19;
+    t9 = C26 * t14;
+    t13 = t3 - t17;
+    t12 = C26 * t13;
+    t0 = t11 + t16;
+    t7 = t6 + t4;
+    t1 = t2 + t12;
+    t8 = t18 - t9;
+    t15 = t2 - t12;
+    t10 = t18 + t9;
+    t5 = C33 * t0;
+    t19 = C34 * t7;
+    t14 = t5 + t19;
+    t3 = C34 * t0;
+    t17 = (-C33) * t7;
+    t13 = t3 + t17;
+    X[162] = t14;
+    X[77] = t13;
+    t11 = C35 * t1;
+    t16 = C36 * t8;
+    t6 = t11 + t16;
+    t4 = C36 * t1;
+    t2 = (-C35) * t8;
+    t12 = t4 + t2;
+    X[2] = t6;
+    X[237] = t12;
+    t18 = C37 * t15;
+    t9 = C38 * t10;
+    t5 = t18 + t9;
+    t19 = C38 * t15;
+    t0 = (-C37) * t10;
+    t7 = t19 + t0;
+    X[82] = t5;
+    X[157] = t7;
+    t3 = re[78];
+    t17 = im[78];
+    t14 = re[118];
+    t13 = im[118];
+    t11 = re[38];
+    t16 = im[38];
+    t1 = t14 + t11;
+    t8 = t13 + t16;
+    t4 = C25 * t1;
+    t2 = t3 - t4;
+    t6 = C25 * t8;
+    t12 = t17 - t6;
+    t18 = t14 - t11;
+    t9 = C26 * t18;
+    t15 = t13 - t16;
+    t10 = C26 * t15;
+    t19 = t3 + t1;
+    t0 = t17 + t8;
+    t5 = t2 + t10;
+    t7 = t12 - t9;
+    t4 = t2 - t10;
+    t6 = t12 + t9;
+    t14 = C39 * t19;
+    t11 = C40 * t0;
+    t18 = t14 + t11;
+    t13 = C40 * t19;
+    t16 = (-C39) * t0;
+    t15 = t13 + t16;
+    X[84] = t18;
+    X[155] = t15;
+    t3 = C41 * t5;
+    t1 = C42 * t7;
+    t17 = t3 + t1;
+    t8 = C42 * t5;
+    t2 = (-C41) * t7;
+    t10 = t8 + t2;
+    X[164] = t17;
+    X[75] = t10;
+    t12 = C43 * t4;
+    t9 = C44 * t6;
+    t14 = t12 + t9;
+    t11 = C44 * t4;
+    t19 = (-C43) * t6;
+    t0 = t11 + t19;
+    X[4] = t14;
+    X[235] = t0;
+    t13 = re[117];
+    t16 = im[117];
+    t18 = re[37];
+    t15 = im[37];
+    t3 = re[77];
+    t1 = im[77];
+    t5 = t18 + t3;
+    t7 = t15 + t1;
+    t8 = C25 * t5;
+    t2 = t13 - t8;
+    t17 = C25 * t7;
+    t10 = t16 - t17;
+    t12 = t18 - t3;
+    t9 = C26 * t12;
+    t4 = t15 - t1;
+    t6 = C26 * t4;
+    t11 = t13 + t5;
+    t19 = t16 + t7;
+    t14 = t2 + t6;
+    t0 = t10 - t9;
+    t8 = t2 - t6;
+    t17 = t10 + t9;
+    t18 = C45 * t11;
+    t3 = C46 * t19;
+    t12 = t18 + t3;
+    t15 = C46 * t11;
+    t1 = (-C45) * t19;
+    t4 = t15 + t1;
+    X[6] = t12;
+    X[233] = t4;
+    t13 = C47 * t14;
+    t5 = C48 * t0;
+    t16 = t13 + t5;
+    t7 = C48 * t14;
+    t2 = (-C47) * t0;
+    t6 = t7 + t2;
+    X[86] = t16;
+    X[153] = t6;
+    t10 = C49 * t8;
+    t9 = C50 * t17;
+    t18 = t10 + t9;
+    t3 = C50 * t8;
+    t11 = (-C49) * t17;
+    t19 = t3 + t11;
+    X[166] = t18;
+    X[73] = t19;
+    t15 = re[36];
+    t1 = im[36];
+    t12 = re[76];
+    t4 = im[76];
+    t13 = re[116];
+    t5 = im[116];
+    t14 = t12 + t13;
+    t0 = t4 + t5;
+    t7 = C25 * t14;
+    t2 = t15 - t7;
+    t16 = C25 * t0;
+    t6 = t1 - t16;
+    t10 = t12 - t13;
+    t9 = C26 * t10;
+    t8 = t4 - t5;
+    t17 = C26 * t8;
+    t3 = t15 + t14;
+    t11 = t1 + t0;
+    t18 = t2 + t17;
+    t19 = t6 - t9;
+    t7 = t2 - t17;
+    t16 = t6 + t9;
+    t12 = C51 * t3;
+    t13 = C52 * t11;
+    t10 = t12 + t13;
+    t4 = C52 * t3;
+    t5 = (-C51) * t11;
+    t8 = t4 + t5;
+    X[168] = t10;
+    X[71] = t8;
+    t15 = C53 * t18;
+    t14 = C54 * t19;
+    t1 = t15 + t14;
+    t0 = C54 * t18;
+    t2 = (-C53) * t19;
+    t17 = t0 + t2;
+    X[8] = t1;
+    X[231] = t17;
+    t6 = C55 * t7;
+    t9 = C56 * t16;
+    t12 = t6 + t9;
+    t13 = C56 * t7;
+    t3 = (-C55) * t16;
+    t11 = t13 + t3;
+    X[88] = t12;
+    X[151] = t11;
+    t4 = re[75];
+    t5 = im[75];
+    t10 = re[115];
+    t8 = im[115];
+    t15 = re[35];
+    t14 = im[35];
+    t18 = t10 + t15;
+    t19 = t8 + t14;
+    t0 = C25 * t18;
+    t2 = t4 - t0;
+    t1 = C25 * t19;
+    t17 = t5 - t1;
+    t6 = t10 - t15;
+    t9 = C26 * t6;
+    t7 = t8 - t14;
+    t16 = C26 * t7;
+    t13 = t4 + t18;
+    t3 = t5 + t19;
+    t12 = t2 + t16;
+    t11 = t17 - t9;
+    t0 = t2 - t16;
+    t1 = t17 + t9;
+    t10 = C57 * t13;
+    t15 = C58 * t3;
+    t6 = t10 + t15;
+    t8 = C58 * t13;
+    t14 = (-C57) * t3;
+    t7 = t8 + t14;
+    X[90] = t6;
+    X[149] = t7;
+    t4 = C59 * t12;
+    t18 = C60 * t11;
+    t5 = t4 + t18;
+    t19 = C60 * t12;
+    t2 = (-C59) * t11;
+    t16 = t19 + t2;
+    X[170] = t5;
+    X[69] = t16;
+    t17 = C61 * t0;
+    t9 = C62 * t1;
+    t10 = t17 + t9;
+    t15 = C62 * t0;
+    t13 = (-C61) * t1;
+    t3 = t15 + t13;
+    X[10] = t10;
+    X[229] = t3;
+    t8 = re[114];
+    t14 = im[114];
+    t6 = re[34];
+    t7 = im[34];
+    t4 = re[74];
+    t18 = im[74];
+    t12 = t6 + t4;
+    t11 = t7 + t18;
+    t19 = C25 * t12;
+    t2 = t8 - t19;
+    t5 = C25 * t11;
+    t16 = t14 - t5;
+    t17 = t6 - t4;
+    t9 = C26 * t17;
+    t0 = t7 - t18;
+    t1 = C26 * t0;
+    t15 = t8 + t12;
+    t13 = t14 + t11;
+    t10 = t2 + t1;
+    t3 = t16 - t9;
+    t19 = t2 - t1;
+    t5 = t16 + t9;
+    t6 = C63 * t15;
+    t4 = C64 * t13;
+    t17 = t6 + t4;
+    t7 = C64 * t15;
+    t18 = (-C63) * t13;
+    t0 = t7 + t18;
+    X[12] = t17;
+    X[227] = t0;
+    t8 = C65 * t10;
+    t12 = C66 * t3;
+    t14 = t8 + t12;
+    t11 = C66 * t10;
+    t2 = (-C65) * t3;
+    t1 = t11 + t2;
+    X[92] = t14;
+    X[147] = t1;
+    t16 = C67 * t19;
+    t9 = C68 * t5;
+    t6 = t16 + t9;
+    t4 = C68 * t19;
+    t15 = (-C67) * t5;
+    t13 = t4 + t15;
+    X[172] = t6;
+    X[67] = t13;
+    t7 = re[33];
+    t18 = im[33];
+    t17 = re[73];
+    t0 = im[73];
+    t8 = re[113];
+    t12 = im[113];
+    t10 = t17 + t8;
+    t3 = t0 + t12;
+    t11 = C25 * t10;
+    t2 = t7 - t11;
+    t14 = C25 * t3;
+    t1 = t18 - t14;
+    t16 = t17 - t8;
+    t9 = C26 * t16;
+    t19 = t0 - t12;
+    t5 = C26 * t19;
+    t4 = t7 + t10;
+    t15 = t18 + t3;
+    t6 = t2 + t5;
+    t13 = t1 - t9;
+    t11 = t2 - t5;
+    t14 = t1 + t9;
+    t17 = C69 * t4;
+    t8 = C70 * t15;
+    t16 = t17 + t8;
+    t0 = C70 * t4;
+    t12 = (-C69) * t15;
+    t19 = t0 + t12;
+    X[174] = t16;
+    X[65] = t19;
+    t7 = C71 * t6;
+    t10 = C72 * t13;
+    t18 = t7 + t10;
+    t3 = C72 * t6;
+    t2 = (-C71) * t13;
+    t5 = t3 + t2;
+    X[14] = t18;
+    X[225] = t5;
+    t1 = C73 * t11;
+    t9 = C74 * t14;
+    t17 = t1 + t9;
+    t8 = C74 * t11;
+    t4 = (-C73) * t14;
+    t15 = t8 + t4;
+    X[94] = t17;
+    X[145] = t15;
+    t0 = re[72];
+    t12 = im[72];
+    t16 = re[112];
+    t19 = im[112];
+    t7 = re[32];
+    t10 = im[32];
+    t6 = t16 + t7;
+    t13 = t19 + t10;
+    t3 = C25 * t6;
+    t2 = t0 - t3;
+    t18 = C25 * t13;
+    t5 = t12 - t18;
+    t1 = t16 - t7;
+    t9 = C26 * t1;
+    t11 = t19 - t10;
+    t14 = C26 * t11;
+    t8 = t0 + t6;
+    t4 = t12 + t13;
+    t17 = t2 + t14;
+    t15 = t5 - t9;
+    t3 = t2 - t14;
+    t18 = t5 + t9;
+    t16 = C75 * t8;
+    t7 = C76 * t4;
+    t1 = t16 + t7;
+    t19 = C76 * t8;
+    t10 = (-C75) * t4;
+    t11 = t19 + t10;
+    X[96] = t1;
+    X[143] = t11;
+    t0 = C77 * t17;
+    t6 = C78 * t15;
+    t12 = t0 + t6;
+    t13 = C78 * t17;
+    t2 = (-C77) * t15;
+    t14 = t13 + t2;
+    X[176] = t12;
+    X[63] = t14;
+    t5 = C79 * t3;
+    t9 = C80 * t18;
+    t16 = t5 + t9;
+    t7 = C80 * t3;
+    t8 = (-C79) * t18;
+    t4 = t7 + t8;
+    X[16] = t16;
+    X[223] = t4;
+    t19 = re[111];
+    t10 = im[111];
+    t1 = re[31];
+    t11 = im[31];
+    t0 = re[71];
+    t6 = im[71];
+    t17 = t1 + t0;
+    t15 = t11 + t6;
+    t13 = C25 * t17;
+    t2 = t19 - t13;
+    t12 = C25 * t15;
+    t14 = t10 - t12;
+    t5 = t1 - t0;
+    t9 = C26 * t5;
+    t3 = t11 - t6;
+    t18 = C26 * t3;
+    t7 = t19 + t17;
+    t8 = t10 + t15;
+    t16 = t2 + t18;
+    t4 = t14 - t9;
+    t13 = t2 - t18;
+    t12 = t14 + t9;
+    t1 = C81 * t7;
+    t0 = C82 * t8;
+    t5 = t1 + t0;
+    t11 = C82 * t7;
+    t6 = (-C81) * t8;
+    t3 = t11 + t6;
+    X[18] = t5;
+    X[221] = t3;
+    t19 = C83 * t16;
+    t17 = C84 * t4;
+    t10 = t19 + t17;
+    t15 = C84 * t16;
+    t2 = (-C83) * t4;
+    t18 = t15 + t2;
+    X[98] = t10;
+    X[141] = t18;
+    t14 = C85 * t13;
+    t9 = C86 * t12;
+    t1 = t14 + t9;
+    t0 = C86 * t13;
+    t7 = (-C85) * t12;
+    t8 = t0 + t7;
+    X[178] = t1;
+    X[61] = t8;
+    t11 = re[30];
+    t6 = im[30];
+    t5 = re[70];
+    t3 = im[70];
+    t19 = re[110];
+    t17 = im[110];
+    t16 = t5 + t19;
+    t4 = t3 + t17;
+    t15 = C25 * t16;
+    t2 = t11 - t15;
+    t10 = C25 * t4;
+    t18 = t6 - t10;
+    t14 = t5 - t19;
+    t9 = C26 * t14;
+    t13 = t3 - t17;
+    t12 = C26 * t13;
+    t0 = t11 + t16;
+    t7 = t6 + t4;
+    t1 = t2 + t12;
+    t8 = t18 - t9;
+    t15 = t2 - t12;
+    t10 = t18 + t9;
+    t5 = C87 * t0;
+    t19 = C88 * t7;
+    t14 = t5 + t19;
+    t3 = C88 * t0;
+    t17 = (-C87) * t7;
+    t13 = t3 + t17;
+    X[180] = t14;
+    X[59] = t13;
+    t11 = C89 * t1;
+    t16 = C90 * t8;
+    t6 = t11 + t16;
+    t4 = C90 * t1;
+    t2 = (-C89) * t8;
+    t12 = t4 + t2;
+    X[20] = t6;
+    X[219] = t12;
+    t18 = C91 * t15;
+    t9 = C92 * t10;
+    t5 = t18 + t9;
+    t19 = C92 * t15;
+    t0 = (-C91) * t10;
+    t7 = t19 + t0;
+    X[100] = t5;
+    X[139] = t7;
+    t3 = re[69];
+    t17 = im[69];
+    t14 = re[109];
+    t13 = im[109];
+    t11 = re[29];
+    t16 = im[29];
+    t1 = t14 + t11;
+    t8 = t13 + t16;
+    t4 = C25 * t1;
+    t2 = t3 - t4;
+    t6 = C25 * t8;
+    t12 = t17 - t6;
+    t18 = t14 - t11;
+    t9 = C26 * t18;
+    t15 = t13 - t16;
+    t10 = C26 * t15;
+    t19 = t3 + t1;
+    t0 = t17 + t8;
+    t5 = t2 + t10;
+    t7 = t12 - t9;
+    t4 = t2 - t10;
+    t6 = t12 + t9;
+    t14 = C93 * t19;
+    t11 = C94 * t0;
+    t18 = t14 + t11;
+    t13 = C94 * t19;
+    t16 = (-C93) * t0;
+    t15 = t13 + t16;
+    X[102] = t18;
+    X[137] = t15;
+    t3 = C95 * t5;
+    t1 = C96 * t7;
+    t17 = t3 + t1;
+    t8 = C96 * t5;
+    t2 = (-C95) * t7;
+    t10 = t8 + t2;
+    X[182] = t17;
+    X[57] = t10;
+    t12 = C97 * t4;
+    t9 = C98 * t6;
+    t14 = t12 + t9;
+    t11 = C98 * t4;
+    t19 = (-C97) * t6;
+    t0 = t11 + t19;
+    X[22] = t14;
+    X[217] = t0;
+    t13 = re[108];
+    t16 = im[108];
+    t18 = re[28];
+    t15 = im[28];
+    t3 = re[68];
+    t1 = im[68];
+    t5 = t18 + t3;
+    t7 = t15 + t1;
+    t8 = C25 * t5;
+    t2 = t13 - t8;
+    t17 = C25 * t7;
+    t10 = t16 - t17;
+    t12 = t18 - t3;
+    t9 = C26 * t12;
+    t4 = t15 - t1;
+    t6 = C26 * t4;
+    t11 = t13 + t5;
+    t19 = t16 + t7;
+    t14 = t2 + t6;
+    t0 = t10 - t9;
+    t8 = t2 - t6;
+    t17 = t10 + t9;
+    t18 = C99 * t11;
+    t3 = C100 * t19;
+    t12 = t18 + t3;
+    t15 = C100 * t11;
+    t1 = (-C99) * t19;
+    t4 = t15 + t1;
+    X[24] = t12;
+    X[215] = t4;
+    t13 = C101 * t14;
+    t5 = C102 * t0;
+    t16 = t13 + t5;
+    t7 = C102 * t14;
+    t2 = (-C101) * t0;
+    t6 = t7 + t2;
+    X[104] = t16;
+    X[135] = t6;
+    t10 = C103 * t8;
+    t9 = C104 * t17;
+    t18 = t10 + t9;
+    t3 = C104 * t8;
+    t11 = (-C103) * t17;
+    t19 = t3 + t11;
+    X[184] = t18;
+    X[55] = t19;
+}
+
+/**
+ *  Part 4 of ApplyWindowedMDCT_W10_240().
+ * 
+ *  @param {Number[]} x 
+ *    - The input block (480 points).
+ *  @param {Number[]} X 
+ *    - The array that would contain the output block (240 points).
+ *  @param {Number[]} re 
+ *    - The scratch buffer (real part, 120 points).
+ *  @param {Number[]} im 
+ *    - The scratch buffer (imaginary part, 120 points).
+ */
+function ApplyWindowedMDCT_W10_240_Part4(x, X, re, im) {
+    let t0, t1, t10, t11, t12, t13, t14, t15, t16, t17, t18, t19, t2, t3, t4, t5, t6, t7, t8, t9;
+    const C0 = 0.5;
+    const C1 = 0.8660254037844386;
+    const C2 = 0.34304498527233984;
+    const C3 = 0.9393189756837131;
+    const C4 = 0.984996587835043;
+    const C5 = 0.1725738159551517;
+    const C6 = 0.7667451597285615;
+    const C7 = 0.641951602562703;
+    const C8 = 0.758276583956687;
+    const C9 = 0.6519329890586743;
+    const C10 = 0.3307202902720374;
+    const C11 = 0.9437288220682779;
+    const C12 = 0.9826532793307118;
+    const C13 = 0.18545223811159092;
+    const C14 = 0.9801415982456801;
+    const C15 = 0.19829888398174045;
+    const C16 = 0.74967808139577;
+    const C17 = 0.6618026701931303;
+    const C18 = 0.3183389280525497;
+    const C19 = 0.9479769653775104;
+    const C20 = 0.30590302009655346;
+    const C21 = 0.9520626777139243;
+    const C22 = 0.9774619749435719;
+    const C23 = 0.21111155235896514;
+    const C24 = 0.7409511253549591;
+    const C25 = 0.6715589548470183;
+    const C26 = 0.7320972111532454;
+    const C27 = 0.6812001713311883;
+    const C28 = 0.2934146972328567;
+    const C29 = 0.9559852590117439;
+    const C30 = 0.974614868564045;
+    const C31 = 0.22388804785849836;
+    const C32 = 0.9716007669441208;
+    const C33 = 0.23662618129360988;
+    const C34 = 0.7231178558632475;
+    const C35 = 0.6907246676728287;
+    const C36 = 0.2808760992712921;
+    const C37 = 0.9597440371568574;
+    const C38 = 0.2682893746360714;
+    const C39 = 0.9633383681019799;
+    const C40 = 0.968420186534595;
+    const C41 = 0.24932377005071168;
+    const C42 = 0.7140145980512682;
+    const C43 = 0.7001308118985237;
+    const C44 = 0.7047889975136701;
+    const C45 = 0.709416992313883;
+    const C46 = 0.2556566799976644;
+    const C47 = 0.9667676359770075;
+    const C48 = 0.9650736723115474;
+    const C49 = 0.26197863846333747;
+    const C50 = 0.9615617976829619;
+    const C51 = 0.27458861818493235;
+    const C52 = 0.6954426350096117;
+    const C53 = 0.7185816177796981;
+    const C54 = 0.24298017990326387;
+    const C55 = 0.970031253194544;
+    const C56 = 0.23026204640590237;
+    const C57 = 0.97312866055058;
+    const C58 = 0.9578851643904772;
+    const C59 = 0.2871515485603873;
+    const C60 = 0.6859771119901928;
+    const C61 = 0.7276231179845748;
+    const C62 = 0.6763940503240542;
+    const C63 = 0.736539943713999;
+    const C64 = 0.21750445869228147;
+    const C65 = 0.9760593273203108;
+    const C66 = 0.9540444024062804;
+    const C67 = 0.2996652769962566;
+    const C68 = 0.9500401698251654;
+    const C69 = 0.3121276593295937;
+    const C70 = 0.6666950920194786;
+    const C71 = 0.7453305671157858;
+    const C72 = 0.2047096027093796;
+    const C73 = 0.9788227513490724;
+    const C74 = 0.19187967078990142;
+    const C75 = 0.9814184591383835;
+    const C76 = 0.945873152751771;
+    const C77 = 0.32453656019534216;
+    const C78 = 0.6568818989430413;
+    const C79 = 0.7539934819618695;
+    const C80 = 0.6469561525348573;
+    const C81 = 0.7625272039063882;
+    const C82 = 0.17901686127663266;
+    const C83 = 0.9838460059270774;
+    const C84 = 0.9415440651830208;
+    const C85 = 0.33688985339222005;
+    const C86 = 0.9370536488857836;
+    const C87 = 0.34918542224703286;
+    const C88 = 0.6369195535204759;
+    const C89 = 0.7709302707400181;
+    const C90 = 0.16612337814576547;
+    const C91 = 0.9861049757675088;
+    const C92 = 0.15320143062925848;
+    const C93 = 0.9881949815968246;
+    const C94 = 0.9324026732697752;
+    const C95 = 0.361421159977355;
+    const C96 = 0.6267738216194696;
+    const C97 = 0.7792012426405167;
+    const C98 = 0.6165206952507691;
+    const C99 = 0.7873387024194278;
+    const C100 = 0.14025323283629626;
+    const C101 = 0.9901156653032855;
+    const C102 = 0.927591935255724;
+    const C103 = 0.37359497005251635;
+    const C104 = 0.9226222591388232;
+    const C105 = 0.3857047665528313;
+    const C106 = 0.6061619312347947;
+    const C107 = 0.79534125576491;
+    const C108 = 0.1272810033739132;
+    const C109 = 0.991866697787626;
+    const C110 = 0.1142869649668464;
+    const C111 = 0.9934477790194444;
+    const C112 = 0.9174944964474913;
+    const C113 = 0.39774847452701106;
+    const C114 = 0.5956993044924334;
+    const C115 = 0.8032075314806449;
+    const C116 = 0.5851346077409155;
+    const C117 = 0.8109361817207843;
+    const C118 = 0.10127334407668342;
+    const C119 = 0.9948586380886109;
+    const C120 = 0.9122095257974677;
+    const C121 = 0.4097240303476953;
+    const C122 = 0.9067682527412662;
+    const C123 = 0.4216293820650445;
+    const C124 = 0.5744696511866426;
+    const C125 = 0.8185258822208966;
+    const C126 = 0.08824237052036951;
+    const C127 = 0.9960990332516871;
+    const C128 = 0.0751962770881399;
+    const C129 = 0.9971687519733476;
+    const C130 = 0.9011716096130131;
+    const C131 = 0.4334624897583309;
+    const C132 = 0.5637062622150166;
+    const C133 = 0.8259753325248732;
+    const C134 = 0.5528462850773279;
+    const C135 = 0.8332832562077542;
+    const C136 = 0.062137299160942724;
+    const C137 = 0.9980676109627962;
+    const C138 = 0.895420555368697;
+    const C139 = 0.4452213258854682;
+    const C140 = 0.8895160754218561;
+    const C141 = 0.4569038756304206;
+    const C142 = 0.5418915805747517;
+    const C143 = 0.840448401094438;
+    const C144 = 0.049067674327418015;
+    const C145 = 0.9987954562051724;
+    const C146 = 0.035989642000498374;
+    const C147 = 0.9993521629879409;
+    const C148 = 0.8834591814747328;
+    const C149 = 0.46850813724843143;
+    const C150 = 0.5308440257395095;
+    const C151 = 0.8474695394742344;
+    const C152 = 0.5197055135132492;
+    const C153 = 0.8543454683112272;
+    const C154 = 0.02290544303369714;
+    const C155 = 0.9997376359222604;
+    const C156 = 0.8772509113449243;
+    const C157 = 0.4800321224090111;
+    const C158 = 0.8708923287875567;
+    const C159 = 0.49147385653662823;
+    const C160 = 0.5084779524226998;
+    const C161 = 0.861075009450407;
+    const C162 = 0.009817319337149617;
+    const C163 = 0.999951808959328;
+    t15 = re[27];
+    t1 = im[27];
+    t12 = re[67];
+    t4 = im[67];
+    t13 = re[107];
+    t5 = im[107];
+    t14 = t12 + t13;
+    t0 = t4 + t5;
+    t7 = C0 * t14;
+    t2 = t15 - t7;
+    t16 = C0 * t0;
+    t6 = t1 - t16;
+    t10 = t12 - t13;
+    t9 = C1 * t10;
+    t8 = t4 - t5;
+    t17 = C1 * t8;
+    t3 = t15 + t14;
+    t11 = t1 + t0;
+    t18 = t2 + t17;
+    t19 = t6 - t9;
+    t7 = t2 - t17;
+    t16 = t6 + t9;
+    t12 = C2 * t3;
+    t13 = C3 * t11;
+    t10 = t12 + t13;
+    t4 = C3 * t3;
+    t5 = (-C2) * t11;
+    t8 = t4 + t5;
+    X[186] = t10;
+    X[53] = t8;
+    t15 = C4 * t18;
+    t14 = C5 * t19;
+    t1 = t15 + t14;
+    t0 = C5 * t18;
+    t2 = (-C4) * t19;
+    t17 = t0 + t2;
+    X[26] = t1;
+    X[213] = t17;
+    t6 = C6 * t7;
+    t9 = C7 * t16;
+    t12 = t6 + t9;
+    t13 = C7 * t7;
+    t3 = (-C6) * t16;
+    t11 = t13 + t3;
+    X[106] = t12;
+    X[133] = t11;
+    t4 = re[66];
+    t5 = im[66];
+    t10 = re[106];
+    t8 = im[106];
+    t15 = re[26];
+    t14 = im[26];
+    t18 = t10 + t15;
+    t19 = t8 + t14;
+    t0 = C0 * t18;
+    t2 = t4 - t0;
+    t1 = C0 * t19;
+    t17 = t5 - t1;
+    t6 = t10 - t15;
+    t9 = C1 * t6;
+    t7 = t8 - t14;
+    t16 = C1 * t7;
+    t13 = t4 + t18;
+    t3 = t5 + t19;
+    t12 = t2 + t16;
+    t11 = t17 - t9;
+    t0 = t2 - t16;
+    t1 = t17 + t9;
+    t10 = C8 * t13;
+    t15 = C9 * t3;
+    t6 = t10 + t15;
+    t8 = C9 * t13;
+    t14 = (-C8) * t3;
+    t7 = t8 + t14;
+    X[108] = t6;
+    X[131] = t7;
+    t4 = C10 * t12;
+    t18 = C11 * t11;
+    t5 = t4 + t18;
+    t19 = C11 * t12;
+    t2 = (-C10) * t11;
+    t16 = t19 + t2;
+    X[188] = t5;
+    X[51] = t16;
+    t17 = C12 * t0;
+    t9 = C13 * t1;
+    t10 = t17 + t9;
+    t15 = C13 * t0;
+    t13 = (-C12) * t1;
+    t3 = t15 + t13;
+    X[28] = t10;
+    X[211] = t3;
+    t8 = re[105];
+    t14 = im[105];
+    t6 = re[25];
+    t7 = im[25];
+    t4 = re[65];
+    t18 = im[65];
+    t12 = t6 + t4;
+    t11 = t7 + t18;
+    t19 = C0 * t12;
+    t2 = t8 - t19;
+    t5 = C0 * t11;
+    t16 = t14 - t5;
+    t17 = t6 - t4;
+    t9 = C1 * t17;
+    t0 = t7 - t18;
+    t1 = C1 * t0;
+    t15 = t8 + t12;
+    t13 = t14 + t11;
+    t10 = t2 + t1;
+    t3 = t16 - t9;
+    t19 = t2 - t1;
+    t5 = t16 + t9;
+    t6 = C14 * t15;
+    t4 = C15 * t13;
+    t17 = t6 + t4;
+    t7 = C15 * t15;
+    t18 = (-C14) * t13;
+    t0 = t7 + t18;
+    X[30] = t17;
+    X[209] = t0;
+    t8 = C16 * t10;
+    t12 = C17 * t3;
+    t14 = t8 + t12;
+    t11 = C17 * t10;
+    t2 = (-C16) * t3;
+    t1 = t11 + t2;
+    X[110] = t14;
+    X[129] = t1;
+    t16 = C18 * t19;
+    t9 = C19 * t5;
+    t6 = t16 + t9;
+    t4 = C19 * t19;
+    t15 = (-C18) * t5;
+    t13 = t4 + t15;
+    X[190] = t6;
+    X[49] = t13;
+    t7 = re[24];
+    t18 = im[24];
+    t17 = re[64];
+    t0 = im[64];
+    t8 = re[104];
+    t12 = im[104];
+    t10 = t17 + t8;
+    t3 = t0 + t12;
+    t11 = C0 * t10;
+    t2 = t7 - t11;
+    t14 = C0 * t3;
+    t1 = t18 - t14;
+    t16 = t17 - t8;
+    t9 = C1 * t16;
+    t19 = t0 - t12;
+    t5 = C1 * t19;
+    t4 = t7 + t10;
+    t15 = t18 + t3;
+    t6 = t2 + t5;
+    t13 = t1 - t9;
+    t11 = t2 - t5;
+    t14 = t1 + t9;
+    t17 = C20 * t4;
+    t8 = C21 * t15;
+    t16 = t17 + t8;
+    t0 = C21 * t4;
+    t12 = (-C20) * t15;
+    t19 = t0 + t12;
+    X[192] = t16;
+    X[47] = t19;
+    t7 = C22 * t6;
+    t10 = C23 * t13;
+    t18 = t7 + t10;
+    t3 = C23 * t6;
+    t2 = (-C22) * t13;
+    t5 = t3 + t2;
+    X[32] = t18;
+    X[207] = t5;
+    t1 = C24 * t11;
+    t9 = C25 * t14;
+    t17 = t1 + t9;
+    t8 = C25 * t11;
+    t4 = (-C24) * t14;
+    t15 = t8 + t4;
+    X[112] = t17;
+    X[127] = t15;
+    t0 = re[63];
+    t12 = im[63];
+    t16 = re[103];
+    t19 = im[103];
+    t7 = re[23];
+    t10 = im[23];
+    t6 = t16 + t7;
+    t13 = t19 + t10;
+    t3 = C0 * t6;
+    t2 = t0 - t3;
+    t18 = C0 * t13;
+    t5 = t12 - t18;
+    t1 = t16 - t7;
+    t9 = C1 * t1;
+    t11 = t19 - t10;
+    t14 = C1 * t11;
+    t8 = t0 + t6;
+    t4 = t12 + t13;
+    t17 = t2 + t14;
+    t15 = t5 - t9;
+    t3 = t2 - t14;
+    t18 = t5 + t9;
+    t16 = C26 * t8;
+    t7 = C27 * t4;
+    t1 = t16 + t7;
+    t19 = C27 * t8;
+    t10 = (-C26) * t4;
+    t11 = t19 + t10;
+    X[114] = t1;
+    X[125] = t11;
+    t0 = C28 * t17;
+    t6 = C29 * t15;
+    t12 = t0 + t6;
+    t13 = C29 * t17;
+    t2 = (-C28) * t15;
+    t14 = t13 + t2;
+    X[194] = t12;
+    X[45] = t14;
+    t5 = C30 * t3;
+    t9 = C31 * t18;
+    t16 = t5 + t9;
+    t7 = C31 * t3;
+    t8 = (-C30) * t18;
+    t4 = t7 + t8;
+    X[34] = t16;
+    X[205] = t4;
+    t19 = re[102];
+    t10 = im[102];
+    t1 = re[22];
+    t11 = im[22];
+    t0 = re[62];
+    t6 = im[62];
+    t17 = t1 + t0;
+    t15 = t11 + t6;
+    t13 = C0 * t17;
+    t2 = t19 - t13;
+    t12 = C0 * t15;
+    t14 = t10 - t12;
+    t5 = t1 - t0;
+    t9 = C1 * t5;
+    t3 = t11 - t6;
+    t18 = C1 * t3;
+    t7 = t19 + t17;
+    t8 = t10 + t15;
+    t16 = t2 + t18;
+    t4 = t14 - t9;
+    t13 = t2 - t18;
+    t12 = t14 + t9;
+    t1 = C32 * t7;
+    t0 = C33 * t8;
+    t5 = t1 + t0;
+    t11 = C33 * t7;
+    t6 = (-C32) * t8;
+    t3 = t11 + t6;
+    X[36] = t5;
+    X[203] = t3;
+    t19 = C34 * t16;
+    t17 = C35 * t4;
+    t10 = t19 + t17;
+    t15 = C35 * t16;
+    t2 = (-C34) * t4;
+    t18 = t15 + t2;
+    X[116] = t10;
+    X[123] = t18;
+    t14 = C36 * t13;
+    t9 = C37 * t12;
+    t1 = t14 + t9;
+    t0 = C37 * t13;
+    t7 = (-C36) * t12;
+    t8 = t0 + t7;
+    X[196] = t1;
+    X[43] = t8;
+    t11 = re[21];
+    t6 = im[21];
+    t5 = re[61];
+    t3 = im[61];
+    t19 = re[101];
+    t17 = im[101];
+    t16 = t5 + t19;
+    t4 = t3 + t17;
+    t15 = C0 * t16;
+    t2 = t11 - t15;
+    t10 = C0 * t4;
+    t18 = t6 - t10;
+    t14 = t5 - t19;
+    t9 = C1 * t14;
+    t13 = t3 - t17;
+    t12 = C1 * t13;
+    t0 = t11 + t16;
+    t7 = t6 + t4;
+    t1 = t2 + t12;
+    t8 = t18 - t9;
+    t15 = t2 - t12;
+    t10 = t18 + t9;
+    t5 = C38 * t0;
+    t19 = C39 * t7;
+    t14 = t5 + t19;
+    t3 = C39 * t0;
+    t17 = (-C38) * t7;
+    t13 = t3 + t17;
+    X[198] = t14;
+    X[41] = t13;
+    t11 = C40 * t1;
+    t16 = C41 * t8;
+    t6 = t11 + t16;
+    t4 = C41 * t1;
+    t2 = (-C40) * t8;
+    t12 = t4 + t2;
+    X[38] = t6;
+    X[201] = t12;
+    t18 = C42 * t15;
+    t9 = C43 * t10;
+    t5 = t18 + t9;
+    t19 = C43 * t15;
+    t0 = (-C42) * t10;
+    t7 = t19 + t0;
+    X[118] = t5;
+    X[121] = t7;
+    t3 = re[60];
+    t17 = im[60];
+    t14 = re[100];
+    t13 = im[100];
+    t11 = re[20];
+    t16 = im[20];
+    t1 = t14 + t11;
+    t8 = t13 + t16;
+    t4 = C0 * t1;
+    t2 = t3 - t4;
+    t6 = C0 * t8;
+    t12 = t17 - t6;
+    t18 = t14 - t11;
+    t9 = C1 * t18;
+    t15 = t13 - t16;
+    t10 = C1 * t15;
+    t19 = t3 + t1;
+    t0 = t17 + t8;
+    t5 = t2 + t10;
+    t7 = t12 - t9;
+    t4 = t2 - t10;
+    t6 = t12 + t9;
+    t14 = C44 * t19;
+    t11 = C45 * t0;
+    t18 = t14 + t11;
+    t13 = C45 * t19;
+    t16 = (-C44) * t0;
+    t15 = t13 + t16;
+    X[120] = t18;
+    X[119] = t15;
+    t3 = C46 * t5;
+    t1 = C47 * t7;
+    t17 = t3 + t1;
+    t8 = C47 * t5;
+    t2 = (-C46) * t7;
+    t10 = t8 + t2;
+    X[200] = t17;
+    X[39] = t10;
+    t12 = C48 * t4;
+    t9 = C49 * t6;
+    t14 = t12 + t9;
+    t11 = C49 * t4;
+    t19 = (-C48) * t6;
+    t0 = t11 + t19;
+    X[40] = t14;
+    X[199] = t0;
+    t13 = re[99];
+    t16 = im[99];
+    t18 = re[19];
+    t15 = im[19];
+    t3 = re[59];
+    t1 = im[59];
+    t5 = t18 + t3;
+    t7 = t15 + t1;
+    t8 = C0 * t5;
+    t2 = t13 - t8;
+    t17 = C0 * t7;
+    t10 = t16 - t17;
+    t12 = t18 - t3;
+    t9 = C1 * t12;
+    t4 = t15 - t1;
+    t6 = C1 * t4;
+    t11 = t13 + t5;
+    t19 = t16 + t7;
+    t14 = t2 + t6;
+    t0 = t10 - t9;
+    t8 = t2 - t6;
+    t17 = t10 + t9;
+    t18 = C50 * t11;
+    t3 = C51 * t19;
+    t12 = t18 + t3;
+    t15 = C51 * t11;
+    t1 = (-C50) * t19;
+    t4 = t15 + t1;
+    X[42] = t12;
+    X[197] = t4;
+    t13 = C52 * t14;
+    t5 = C53 * t0;
+    t16 = t13 + t5;
+    t7 = C53 * t14;
+    t2 = (-C52) * t0;
+    t6 = t7 + t2;
+    X[122] = t16;
+    X[117] = t6;
+    t10 = C54 * t8;
+    t9 = C55 * t17;
+    t18 = t10 + t9;
+    t3 = C55 * t8;
+    t11 = (-C54) * t17;
+    t19 = t3 + t11;
+    X[202] = t18;
+    X[37] = t19;
+    t15 = re[18];
+    t1 = im[18];
+    t12 = re[58];
+    t4 = im[58];
+    t13 = re[98];
+    t5 = im[98];
+    t14 = t12 + t13;
+    t0 = t4 + t5;
+    t7 = C0 * t14;
+    t2 = t15 - t7;
+    t16 = C0 * t0;
+    t6 = t1 - t16;
+    t10 = t12 - t13;
+    t9 = C1 * t10;
+    t8 = t4 - t5;
+    t17 = C1 * t8;
+    t3 = t15 + t14;
+    t11 = t1 + t0;
+    t18 = t2 + t17;
+    t19 = t6 - t9;
+    t7 = t2 - t17;
+    t16 = t6 + t9;
+    t12 = C56 * t3;
+    t13 = C57 * t11;
+    t10 = t12 + t13;
+    t4 = C57 * t3;
+    t5 = (-C56) * t11;
+    t8 = t4 + t5;
+    X[204] = t10;
+    X[35] = t8;
+    t15 = C58 * t18;
+    t14 = C59 * t19;
+    t1 = t15 + t14;
+    t0 = C59 * t18;
+    t2 = (-C58) * t19;
+    t17 = t0 + t2;
+    X[44] = t1;
+    X[195] = t17;
+    t6 = C60 * t7;
+    t9 = C61 * t16;
+    t12 = t6 + t9;
+    t13 = C61 * t7;
+    t3 = (-C60) * t16;
+    t11 = t13 + t3;
+    X[124] = t12;
+    X[115] = t11;
+    t4 = re[57];
+    t5 = im[57];
+    t10 = re[97];
+    t8 = im[97];
+    t15 = re[17];
+    t14 = im[17];
+    t18 = t10 + t15;
+    t19 = t8 + t14;
+    t0 = C0 * t18;
+    t2 = t4 - t0;
+    t1 = C0 * t19;
+    t17 = t5 - t1;
+    t6 = t10 - t15;
+    t9 = C1 * t6;
+    t7 = t8 - t14;
+    t16 = C1 * t7;
+    t13 = t4 + t18;
+    t3 = t5 + t19;
+    t12 = t2 + t16;
+    t11 = t17 - t9;
+    t0 = t2 - t16;
+    t1 = t17 + t9;
+    t10 = C62 * t13;
+    t15 = C63 * t3;
+    t6 = t10 + t15;
+    t8 = C63 * t13;
+    t14 = (-C62) * t3;
+    t7 = t8 + t14;
+    X[126] = t6;
+    X[113] = t7;
+    t4 = C64 * t12;
+    t18 = C65 * t11;
+    t5 = t4 + t18;
+    t19 = C65 * t12;
+    t2 = (-C64) * t11;
+    t16 = t19 + t2;
+    X[206] = t5;
+    X[33] = t16;
+    t17 = C66 * t0;
+    t9 = C67 * t1;
+    t10 = t17 + t9;
+    t15 = C67 * t0;
+    t13 = (-C66) * t1;
+    t3 = t15 + t13;
+    X[46] = t10;
+    X[193] = t3;
+    t8 = re[96];
+    t14 = im[96];
+    t6 = re[16];
+    t7 = im[16];
+    t4 = re[56];
+    t18 = im[56];
+    t12 = t6 + t4;
+    t11 = t7 + t18;
+    t19 = C0 * t12;
+    t2 = t8 - t19;
+    t5 = C0 * t11;
+    t16 = t14 - t5;
+    t17 = t6 - t4;
+    t9 = C1 * t17;
+    t0 = t7 - t18;
+    t1 = C1 * t0;
+    t15 = t8 + t12;
+    t13 = t14 + t11;
+    t10 = t2 + t1;
+    t3 = t16 - t9;
+    t19 = t2 - t1;
+    t5 = t16 + t9;
+    t6 = C68 * t15;
+    t4 = C69 * t13;
+    t17 = t6 + t4;
+    t7 = C69 * t15;
+    t18 = (-C68) * t13;
+    t0 = t7 + t18;
+    X[48] = t17;
+    X[191] = t0;
+    t8 = C70 * t10;
+    t12 = C71 * t3;
+    t14 = t8 + t12;
+    t11 = C71 * t10;
+    t2 = (-C70) * t3;
+    t1 = t11 + t2;
+    X[128] = t14;
+    X[111] = t1;
+    t16 = C72 * t19;
+    t9 = C73 * t5;
+    t6 = t16 + t9;
+    t4 = C73 * t19;
+    t15 = (-C72) * t5;
+    t13 = t4 + t15;
+    X[208] = t6;
+    X[31] = t13;
+    t7 = re[15];
+    t18 = im[15];
+    t17 = re[55];
+    t0 = im[55];
+    t8 = re[95];
+    t12 = im[95];
+    t10 = t17 + t8;
+    t3 = t0 + t12;
+    t11 = C0 * t10;
+    t2 = t7 - t11;
+    t14 = C0 * t3;
+    t1 = t18 - t14;
+    t16 = t17 - t8;
+    t9 = C1 * t16;
+    t19 = t0 - t12;
+    t5 = C1 * t19;
+    t4 = t7 + t10;
+    t15 = t18 + t3;
+    t6 = t2 + t5;
+    t13 = t1 - t9;
+    t11 = t2 - t5;
+    t14 = t1 + t9;
+    t17 = C74 * t4;
+    t8 = C75 * t15;
+    t16 = t17 + t8;
+    t0 = C75 * t4;
+    t12 = (-C74) * t15;
+    t19 = t0 + t12;
+    X[210] = t16;
+    X[29] = t19;
+    t7 = C76 * t6;
+    t10 = C77 * t13;
+    t18 = t7 + t10;
+    t3 = C77 * t6;
+    t2 = (-C76) * t13;
+    t5 = t3 + t2;
+    X[50] = t18;
+    X[189] = t5;
+    t1 = C78 * t11;
+    t9 = C79 * t14;
+    t17 = t1 + t9;
+    t8 = C79 * t11;
+    t4 = (-C78) * t14;
+    t15 = t8 + t4;
+    X[130] = t17;
+    X[109] = t15;
+    t0 = re[54];
+    t12 = im[54];
+    t16 = re[94];
+    t19 = im[94];
+    t7 = re[14];
+    t10 = im[14];
+    t6 = t16 + t7;
+    t13 = t19 + t10;
+    t3 = C0 * t6;
+    t2 = t0 - t3;
+    t18 = C0 * t13;
+    t5 = t12 - t18;
+    t1 = t16 - t7;
+    t9 = C1 * t1;
+    t11 = t19 - t10;
+    t14 = C1 * t11;
+    t8 = t0 + t6;
+    t4 = t12 + t13;
+    t17 = t2 + t14;
+    t15 = t5 - t9;
+    t3 = t2 - t14;
+    t18 = t5 + t9;
+    t16 = C80 * t8;
+    t7 = C81 * t4;
+    t1 = t16 + t7;
+    t19 = C81 * t8;
+    t10 = (-C80) * t4;
+    t11 = t19 + t10;
+    X[132] = t1;
+    X[107] = t11;
+    t0 = C82 * t17;
+    t6 = C83 * t15;
+    t12 = t0 + t6;
+    t13 = C83 * t17;
+    t2 = (-C82) * t15;
+    t14 = t13 + t2;
+    X[212] = t12;
+    X[27] = t14;
+    t5 = C84 * t3;
+    t9 = C85 * t18;
+    t16 = t5 + t9;
+    t7 = C85 * t3;
+    t8 = (-C84) * t18;
+    t4 = t7 + t8;
+    X[52] = t16;
+    X[187] = t4;
+    t19 = re[93];
+    t10 = im[93];
+    t1 = re[13];
+    t11 = im[13];
+    t0 = re[53];
+    t6 = im[53];
+    t17 = t1 + t0;
+    t15 = t11 + t6;
+    t13 = C0 * t17;
+    t2 = t19 - t13;
+    t12 = C0 * t15;
+    t14 = t10 - t12;
+    t5 = t1 - t0;
+    t9 = C1 * t5;
+    t3 = t11 - t6;
+    t18 = C1 * t3;
+    t7 = t19 + t17;
+    t8 = t10 + t15;
+    t16 = t2 + t18;
+    t4 = t14 - t9;
+    t13 = t2 - t18;
+    t12 = t14 + t9;
+    t1 = C86 * t7;
+    t0 = C87 * t8;
+    t5 = t1 + t0;
+    t11 = C87 * t7;
+    t6 = (-C86) * t8;
+    t3 = t11 + t6;
+    X[54] = t5;
+    X[185] = t3;
+    t19 = C88 * t16;
+    t17 = C89 * t4;
+    t10 = t19 + t17;
+    t15 = C89 * t16;
+    t2 = (-C88) * t4;
+    t18 = t15 + t2;
+    X[134] = t10;
+    X[105] = t18;
+    t14 = C90 * t13;
+    t9 = C91 * t12;
+    t1 = t14 + t9;
+    t0 = C91 * t13;
+    t7 = (-C90) * t12;
+    t8 = t0 + t7;
+    X[214] = t1;
+    X[25] = t8;
+    t11 = re[12];
+    t6 = im[12];
+    t5 = re[52];
+    t3 = im[52];
+    t19 = re[92];
+    t17 = im[92];
+    t16 = t5 + t19;
+    t4 = t3 + t17;
+    t15 = C0 * t16;
+    t2 = t11 - t15;
+    t10 = C0 * t4;
+    t18 = t6 - t10;
+    t14 = t5 - t19;
+    t9 = C1 * t14;
+    t13 = t3 - t17;
+    t12 = C1 * t13;
+    t0 = t11 + t16;
+    t7 = t6 + t4;
+    t1 = t2 + t12;
+    t8 = t18 - t9;
+    t15 = t2 - t12;
+    t10 = t18 + t9;
+    t5 = C92 * t0;
+    t19 = C93 * t7;
+    t14 = t5 + t19;
+    t3 = C93 * t0;
+    t17 = (-C92) * t7;
+    t13 = t3 + t17;
+    X[216] = t14;
+    X[23] = t13;
+    t11 = C94 * t1;
+    t16 = C95 * t8;
+    t6 = t11 + t16;
+    t4 = C95 * t1;
+    t2 = (-C94) * t8;
+    t12 = t4 + t2;
+    X[56] = t6;
+    X[183] = t12;
+    t18 = C96 * t15;
+    t9 = C97 * t10;
+    t5 = t18 + t9;
+    t19 = C97 * t15;
+    t0 = (-C96) * t10;
+    t7 = t19 + t0;
+    X[136] = t5;
+    X[103] = t7;
+    t3 = re[51];
+    t17 = im[51];
+    t14 = re[91];
+    t13 = im[91];
+    t11 = re[11];
+    t16 = im[11];
+    t1 = t14 + t11;
+    t8 = t13 + t16;
+    t4 = C0 * t1;
+    t2 = t3 - t4;
+    t6 = C0 * t8;
+    t12 = t17 - t6;
+    t18 = t14 - t11;
+    t9 = C1 * t18;
+    t15 = t13 - t16;
+    t10 = C1 * t15;
+    t19 = t3 + t1;
+    t0 = t17 + t8;
+    t5 = t2 + t10;
+    t7 = t12 - t9;
+    t4 = t2 - t10;
+    t6 = t12 + t9;
+    t14 = C98 * t19;
+    t11 = C99 * t0;
+    t18 = t14 + t11;
+    t13 = C99 * t19;
+    t16 = (-C98) * t0;
+    t15 = t13 + t16;
+    X[138] = t18;
+    X[101] = t15;
+    t3 = C100 * t5;
+    t1 = C101 * t7;
+    t17 = t3 + t1;
+    t8 = C101 * t5;
+    t2 = (-C100) * t7;
+    t10 = t8 + t2;
+    X[218] = t17;
+    X[21] = t10;
+    t12 = C102 * t4;
+    t9 = C103 * t6;
+    t14 = t12 + t9;
+    t11 = C103 * t4;
+    t19 = (-C102) * t6;
+    t0 = t11 + t19;
+    X[58] = t14;
+    X[181] = t0;
+    t13 = re[90];
+    t16 = im[90];
+    t18 = re[10];
+    t15 = im[10];
+    t3 = re[50];
+    t1 = im[50];
+    t5 = t18 + t3;
+    t7 = t15 + t1;
+    t8 = C0 * t5;
+    t2 = t13 - t8;
+    t17 = C0 * t7;
+    t10 = t16 - t17;
+    t12 = t18 - t3;
+    t9 = C1 * t12;
+    t4 = t15 - t1;
+    t6 = C1 * t4;
+    t11 = t13 + t5;
+    t19 = t16 + t7;
+    t14 = t2 + t6;
+    t0 = t10 - t9;
+    t8 = t2 - t6;
+    t17 = t10 + t9;
+    t18 = C104 * t11;
+    t3 = C105 * t19;
+    t12 = t18 + t3;
+    t15 = C105 * t11;
+    t1 = (-C104) * t19;
+    t4 = t15 + t1;
+    X[60] = t12;
+    X[179] = t4;
+    t13 = C106 * t14;
+    t5 = C107 * t0;
+    t16 = t13 + t5;
+    t7 = C107 * t14;
+    t2 = (-C106) * t0;
+    t6 = t7 + t2;
+    X[140] = t16;
+    X[99] = t6;
+    t10 = C108 * t8;
+    t9 = C109 * t17;
+    t18 = t10 + t9;
+    t3 = C109 * t8;
+    t11 = (-C108) * t17;
+    t19 = t3 + t11;
+    X[220] = t18;
+    X[19] = t19;
+    t15 = re[9];
+    t1 = im[9];
+    t12 = re[49];
+    t4 = im[49];
+    t13 = re[89];
+    t5 = im[89];
+    t14 = t12 + t13;
+    t0 = t4 + t5;
+    t7 = C0 * t14;
+    t2 = t15 - t7;
+    t16 = C0 * t0;
+    t6 = t1 - t16;
+    t10 = t12 - t13;
+    t9 = C1 * t10;
+    t8 = t4 - t5;
+    t17 = C1 * t8;
+    t3 = t15 + t14;
+    t11 = t1 + t0;
+    t18 = t2 + t17;
+    t19 = t6 - t9;
+    t7 = t2 - t17;
+    t16 = t6 + t9;
+    t12 = C110 * t3;
+    t13 = C111 * t11;
+    t10 = t12 + t13;
+    t4 = C111 * t3;
+    t5 = (-C110) * t11;
+    t8 = t4 + t5;
+    X[222] = t10;
+    X[17] = t8;
+    t15 = C112 * t18;
+    t14 = C113 * t19;
+    t1 = t15 + t14;
+    t0 = C113 * t18;
+    t2 = (-C112) * t19;
+    t17 = t0 + t2;
+    X[62] = t1;
+    X[177] = t17;
+    t6 = C114 * t7;
+    t9 = C115 * t16;
+    t12 = t6 + t9;
+    t13 = C115 * t7;
+    t3 = (-C114) * t16;
+    t11 = t13 + t3;
+    X[142] = t12;
+    X[97] = t11;
+    t4 = re[48];
+    t5 = im[48];
+    t10 = re[88];
+    t8 = im[88];
+    t15 = re[8];
+    t14 = im[8];
+    t18 = t10 + t15;
+    t19 = t8 + t14;
+    t0 = C0 * t18;
+    t2 = t4 - t0;
+    t1 = C0 * t19;
+    t17 = t5 - t1;
+    t6 = t10 - t15;
+    t9 = C1 * t6;
+    t7 = t8 - t14;
+    t16 = C1 * t7;
+    t13 = t4 + t18;
+    t3 = t5 + t19;
+    t12 = t2 + t16;
+    t11 = t17 - t9;
+    t0 = t2 - t16;
+    t1 = t17 + t9;
+    t10 = C116 * t13;
+    t15 = C117 * t3;
+    t6 = t10 + t15;
+    t8 = C117 * t13;
+    t14 = (-C116) * t3;
+    t7 = t8 + t14;
+    X[144] = t6;
+    X[95] = t7;
+    t4 = C118 * t12;
+    t18 = C119 * t11;
+    t5 = t4 + t18;
+    t19 = C119 * t12;
+    t2 = (-C118) * t11;
+    t16 = t19 + t2;
+    X[224] = t5;
+    X[15] = t16;
+    t17 = C120 * t0;
+    t9 = C121 * t1;
+    t10 = t17 + t9;
+    t15 = C121 * t0;
+    t13 = (-C120) * t1;
+    t3 = t15 + t13;
+    X[64] = t10;
+    X[175] = t3;
+    t8 = re[87];
+    t14 = im[87];
+    t6 = re[7];
+    t7 = im[7];
+    t4 = re[47];
+    t18 = im[47];
+    t12 = t6 + t4;
+    t11 = t7 + t18;
+    t19 = C0 * t12;
+    t2 = t8 - t19;
+    t5 = C0 * t11;
+    t16 = t14 - t5;
+    t17 = t6 - t4;
+    t9 = C1 * t17;
+    t0 = t7 - t18;
+    t1 = C1 * t0;
+    t15 = t8 + t12;
+    t13 = t14 + t11;
+    t10 = t2 + t1;
+    t3 = t16 - t9;
+    t19 = t2 - t1;
+    t5 = t16 + t9;
+    t6 = C122 * t15;
+    t4 = C123 * t13;
+    t17 = t6 + t4;
+    t7 = C123 * t15;
+    t18 = (-C122) * t13;
+    t0 = t7 + t18;
+    X[66] = t17;
+    X[173] = t0;
+    t8 = C124 * t10;
+    t12 = C125 * t3;
+    t14 = t8 + t12;
+    t11 = C125 * t10;
+    t2 = (-C124) * t3;
+    t1 = t11 + t2;
+    X[146] = t14;
+    X[93] = t1;
+    t16 = C126 * t19;
+    t9 = C127 * t5;
+    t6 = t16 + t9;
+    t4 = C127 * t19;
+    t15 = (-C126) * t5;
+    t13 = t4 + t15;
+    X[226] = t6;
+    X[13] = t13;
+    t7 = re[6];
+    t18 = im[6];
+    t17 = re[46];
+    t0 = im[46];
+    t8 = re[86];
+    t12 = im[86];
+    t10 = t17 + t8;
+    t3 = t0 + t12;
+    t11 = C0 * t10;
+    t2 = t7 - t11;
+    t14 = C0 * t3;
+    t1 = t18 - t14;
+    t16 = t17 - t8;
+    t9 = C1 * t16;
+    t19 = t0 - t12;
+    t5 = C1 * t19;
+    t4 = t7 + t10;
+    t15 = t18 + t3;
+    t6 = t2 + t5;
+    t13 = t1 - t9;
+    t11 = t2 - t5;
+    t14 = t1 + t9;
+    t17 = C128 * t4;
+    t8 = C129 * t15;
+    t16 = t17 + t8;
+    t0 = C129 * t4;
+    t12 = (-C128) * t15;
+    t19 = t0 + t12;
+    X[228] = t16;
+    X[11] = t19;
+    t7 = C130 * t6;
+    t10 = C131 * t13;
+    t18 = t7 + t10;
+    t3 = C131 * t6;
+    t2 = (-C130) * t13;
+    t5 = t3 + t2;
+    X[68] = t18;
+    X[171] = t5;
+    t1 = C132 * t11;
+    t9 = C133 * t14;
+    t17 = t1 + t9;
+    t8 = C133 * t11;
+    t4 = (-C132) * t14;
+    t15 = t8 + t4;
+    X[148] = t17;
+    X[91] = t15;
+    t0 = re[45];
+    t12 = im[45];
+    t16 = re[85];
+    t19 = im[85];
+    t7 = re[5];
+    t10 = im[5];
+    t6 = t16 + t7;
+    t13 = t19 + t10;
+    t3 = C0 * t6;
+    t2 = t0 - t3;
+    t18 = C0 * t13;
+    t5 = t12 - t18;
+    t1 = t16 - t7;
+    t9 = C1 * t1;
+    t11 = t19 - t10;
+    t14 = C1 * t11;
+    t8 = t0 + t6;
+    t4 = t12 + t13;
+    t17 = t2 + t14;
+    t15 = t5 - t9;
+    t3 = t2 - t14;
+    t18 = t5 + t9;
+    t16 = C134 * t8;
+    t7 = C135 * t4;
+    t1 = t16 + t7;
+    t19 = C135 * t8;
+    t10 = (-C134) * t4;
+    t11 = t19 + t10;
+    X[150] = t1;
+    X[89] = t11;
+    t0 = C136 * t17;
+    t6 = C137 * t15;
+    t12 = t0 + t6;
+    t13 = C137 * t17;
+    t2 = (-C136) * t15;
+    t14 = t13 + t2;
+    X[230] = t12;
+    X[9] = t14;
+    t5 = C138 * t3;
+    t9 = C139 * t18;
+    t16 = t5 + t9;
+    t7 = C139 * t3;
+    t8 = (-C138) * t18;
+    t4 = t7 + t8;
+    X[70] = t16;
+    X[169] = t4;
+    t19 = re[84];
+    t10 = im[84];
+    t1 = re[4];
+    t11 = im[4];
+    t0 = re[44];
+    t6 = im[44];
+    t17 = t1 + t0;
+    t15 = t11 + t6;
+    t13 = C0 * t17;
+    t2 = t19 - t13;
+    t12 = C0 * t15;
+    t14 = t10 - t12;
+    t5 = t1 - t0;
+    t9 = C1 * t5;
+    t3 = t11 - t6;
+    t18 = C1 * t3;
+    t7 = t19 + t17;
+    t8 = t10 + t15;
+    t16 = t2 + t18;
+    t4 = t14 - t9;
+    t13 = t2 - t18;
+    t12 = t14 + t9;
+    t1 = C140 * t7;
+    t0 = C141 * t8;
+    t5 = t1 + t0;
+    t11 = C141 * t7;
+    t6 = (-C140) * t8;
+    t3 = t11 + t6;
+    X[72] = t5;
+    X[167] = t3;
+    t19 = C142 * t16;
+    t17 = C143 * t4;
+    t10 = t19 + t17;
+    t15 = C143 * t16;
+    t2 = (-C142) * t4;
+    t18 = t15 + t2;
+    X[152] = t10;
+    X[87] = t18;
+    t14 = C144 * t13;
+    t9 = C145 * t12;
+    t1 = t14 + t9;
+    t0 = C145 * t13;
+    t7 = (-C144) * t12;
+    t8 = t0 + t7;
+    X[232] = t1;
+    X[7] = t8;
+    t11 = re[3];
+    t6 = im[3];
+    t5 = re[43];
+    t3 = im[43];
+    t19 = re[83];
+    t17 = im[83];
+    t16 = t5 + t19;
+    t4 = t3 + t17;
+    t15 = C0 * t16;
+    t2 = t11 - t15;
+    t10 = C0 * t4;
+    t18 = t6 - t10;
+    t14 = t5 - t19;
+    t9 = C1 * t14;
+    t13 = t3 - t17;
+    t12 = C1 * t13;
+    t0 = t11 + t16;
+    t7 = t6 + t4;
+    t1 = t2 + t12;
+    t8 = t18 - t9;
+    t15 = t2 - t12;
+    t10 = t18 + t9;
+    t5 = C146 * t0;
+    t19 = C147 * t7;
+    t14 = t5 + t19;
+    t3 = C147 * t0;
+    t17 = (-C146) * t7;
+    t13 = t3 + t17;
+    X[234] = t14;
+    X[5] = t13;
+    t11 = C148 * t1;
+    t16 = C149 * t8;
+    t6 = t11 + t16;
+    t4 = C149 * t1;
+    t2 = (-C148) * t8;
+    t12 = t4 + t2;
+    X[74] = t6;
+    X[165] = t12;
+    t18 = C150 * t15;
+    t9 = C151 * t10;
+    t5 = t18 + t9;
+    t19 = C151 * t15;
+    t0 = (-C150) * t10;
+    t7 = t19 + t0;
+    X[154] = t5;
+    X[85] = t7;
+    t3 = re[42];
+    t17 = im[42];
+    t14 = re[82];
+    t13 = im[82];
+    t11 = re[2];
+    t16 = im[2];
+    t1 = t14 + t11;
+    t8 = t13 + t16;
+    t4 = C0 * t1;
+    t2 = t3 - t4;
+    t6 = C0 * t8;
+    t12 = t17 - t6;
+    t18 = t14 - t11;
+    t9 = C1 * t18;
+    t15 = t13 - t16;
+    t10 = C1 * t15;
+    t19 = t3 + t1;
+    t0 = t17 + t8;
+    t5 = t2 + t10;
+    t7 = t12 - t9;
+    t4 = t2 - t10;
+    t6 = t12 + t9;
+    t14 = C152 * t19;
+    t11 = C153 * t0;
+    t18 = t14 + t11;
+    t13 = C153 * t19;
+    t16 = (-C152) * t0;
+    t15 = t13 + t16;
+    X[156] = t18;
+    X[83] = t15;
+    t3 = C154 * t5;
+    t1 = C155 * t7;
+    t17 = t3 + t1;
+    t8 = C155 * t5;
+    t2 = (-C154) * t7;
+    t10 = t8 + t2;
+    X[236] = t17;
+    X[3] = t10;
+    t12 = C156 * t4;
+    t9 = C157 * t6;
+    t14 = t12 + t9;
+    t11 = C157 * t4;
+    t19 = (-C156) * t6;
+    t0 = t11 + t19;
+    X[76] = t14;
+    X[163] = t0;
+    t13 = re[81];
+    t16 = im[81];
+    t18 = re[1];
+    t15 = im[1];
+    t3 = re[41];
+    t1 = im[41];
+    t5 = t18 + t3;
+    t7 = t15 + t1;
+    t8 = C0 * t5;
+    t2 = t13 - t8;
+    t17 = C0 * t7;
+    t10 = t16 - t17;
+    t12 = t18 - t3;
+    t9 = C1 * t12;
+    t4 = t15 - t1;
+    t6 = C1 * t4;
+    t11 = t13 + t5;
+    t19 = t16 + t7;
+    t14 = t2 + t6;
+    t0 = t10 - t9;
+    t8 = t2 - t6;
+    t17 = t10 + t9;
+    t18 = C158 * t11;
+    t3 = C159 * t19;
+    t12 = t18 + t3;
+    t15 = C159 * t11;
+    t1 = (-C158) * t19;
+    t4 = t15 + t1;
+    X[78] = t12;
+    X[161] = t4;
+    t13 = C160 * t14;
+    t5 = C161 * t0;
+    t16 = t13 + t5;
+    t7 = C161 * t14;
+    t2 = (-C160) * t0;
+    t6 = t7 + t2;
+    X[158] = t16;
+    X[81] = t6;
+    t10 = C162 * t8;
+    t9 = C163 * t17;
+    t18 = t10 + t9;
+    t3 = C163 * t8;
+    t11 = (-C162) * t17;
+    t19 = t3 + t11;
+    X[238] = t18;
+    X[1] = t19;
+}
+
+/**
+ *  Part 1 of ApplyWindowedIMDCT_W10_240().
+ * 
+ *  @param {Number[]} X 
+ *    - The input block (240 points).
+ *  @param {Number[]} y 
+ *    - The array that would contain the output block (480 points).
+ *  @param {Number[]} re 
+ *    - The scratch buffer (real part, 120 points).
+ *  @param {Number[]} im 
+ *    - The scratch buffer (imaginary part, 120 points).
+ */
+function ApplyWindowedIMDCT_W10_240_Part1(X, y, re, im) {
+    let t0, t1, t10, t11, t12, t13, t14, t15, t16, t17, t18, t19, t2, t3, t4, t5, t6, t7, t8, t9;
+    const C0 = 0.9807852804032304;
+    const C1 = 0.19509032201612825;
+    const C2 = 0.9238795325112867;
+    const C3 = 0.3826834323650898;
+    const C4 = 0.8314696123025452;
+    const C5 = 0.5555702330196022;
+    const C6 = 0.7071067811865476;
+    const C7 = 0.7071067811865475;
+    const C8 = 0.9510565162951535;
+    const C9 = 0.3090169943749474;
+    const C10 = 0.8724960070727972;
+    const C11 = 0.4886212414969549;
+    const C12 = 0.7604059656000309;
+    const C13 = 0.6494480483301837;
+    const C14 = 0.619093949309834;
+    const C15 = 0.785316930880745;
+    const C16 = 0.45399049973954675;
+    const C17 = 0.8910065241883679;
+    const C18 = 0.27144044986507426;
+    const C19 = 0.9624552364536473;
+    const C20 = 0.07845909572784494;
+    const C21 = 0.996917333733128;
+    const C22 = 0.9930684569549263;
+    const C23 = 0.11753739745783764;
+    const C24 = 0.8090169943749475;
+    const C25 = 0.5877852522924731;
+    const C26 = 0.6788007455329417;
+    const C27 = 0.7343225094356856;
+    const C28 = 0.5224985647159488;
+    const C29 = 0.8526401643540922;
+    const C30 = 0.34611705707749296;
+    const C31 = 0.9381913359224842;
+    const C32 = 0.15643446504023087;
+    const C33 = 0.9876883405951378;
+    const C34 = 0.9992290362407229;
+    const C35 = 0.03925981575906861;
+    const C36 = 0.9723699203976766;
+    const C37 = 0.2334453638559054;
+    const C38 = 0.9081431738250813;
+    const C39 = 0.41865973753742813;
+    const C40 = 0.5590169943749475;
+    const C41 = 0.25;
+    t0 = X[0];
+    t1 = X[239];
+    t2 = X[30];
+    t3 = X[209];
+    t4 = C0 * t2;
+    t5 = C1 * t3;
+    t4 = t4 + t5;
+    t5 = (-C1) * t2;
+    t2 = C0 * t3;
+    t3 = t5 + t2;
+    t5 = X[60];
+    t2 = X[179];
+    t6 = C2 * t5;
+    t7 = C3 * t2;
+    t6 = t6 + t7;
+    t7 = (-C3) * t5;
+    t5 = C2 * t2;
+    t2 = t7 + t5;
+    t7 = X[90];
+    t5 = X[149];
+    t8 = C4 * t7;
+    t9 = C5 * t5;
+    t8 = t8 + t9;
+    t9 = (-C5) * t7;
+    t7 = C4 * t5;
+    t5 = t9 + t7;
+    t9 = X[120];
+    t7 = X[119];
+    t10 = C6 * t9;
+    t11 = C7 * t7;
+    t10 = t10 + t11;
+    t11 = (-C7) * t9;
+    t9 = C6 * t7;
+    t7 = t11 + t9;
+    t11 = X[150];
+    t9 = X[89];
+    t12 = C5 * t11;
+    t13 = C4 * t9;
+    t12 = t12 + t13;
+    t13 = (-C4) * t11;
+    t11 = C5 * t9;
+    t9 = t13 + t11;
+    t13 = X[180];
+    t11 = X[59];
+    t14 = C3 * t13;
+    t15 = C2 * t11;
+    t14 = t14 + t15;
+    t15 = (-C2) * t13;
+    t13 = C3 * t11;
+    t11 = t15 + t13;
+    t15 = X[210];
+    t13 = X[29];
+    t16 = C1 * t15;
+    t17 = C0 * t13;
+    t16 = t16 + t17;
+    t17 = (-C0) * t15;
+    t15 = C1 * t13;
+    t13 = t17 + t15;
+    t17 = t0 + t10;
+    t15 = t1 + t7;
+    t18 = t6 + t14;
+    t19 = t2 + t11;
+    t0 = t0 - t10;
+    t10 = t1 - t7;
+    t1 = t6 - t14;
+    t7 = t2 - t11;
+    t6 = t17 + t18;
+    t14 = t15 + t19;
+    t2 = t0 + t7;
+    t11 = t10 - t1;
+    t17 = t17 - t18;
+    t18 = t15 - t19;
+    t15 = t0 - t7;
+    t19 = t10 + t1;
+    t0 = t4 + t12;
+    t7 = t3 + t9;
+    t10 = t8 + t16;
+    t1 = t5 + t13;
+    t4 = t4 - t12;
+    t12 = t3 - t9;
+    t3 = t8 - t16;
+    t9 = t5 - t13;
+    t8 = t0 + t10;
+    t16 = t7 + t1;
+    t5 = t4 + t9;
+    t13 = t12 - t3;
+    t0 = t0 - t10;
+    t10 = t7 - t1;
+    t7 = t4 - t9;
+    t1 = t12 + t3;
+    t4 = t5 + t13;
+    t9 = t5 - t13;
+    t12 = C6 * t4;
+    t3 = (-C6) * t9;
+    t5 = t7 - t1;
+    t13 = t7 + t1;
+    t4 = (-C6) * t5;
+    t9 = (-C6) * t13;
+    t7 = t6 - t8;
+    t1 = t14 - t16;
+    t5 = t6 + t8;
+    t13 = t14 + t16;
+    t6 = t2 - t12;
+    t8 = t11 - t3;
+    t14 = t2 + t12;
+    t16 = t11 + t3;
+    t2 = t17 - t10;
+    t12 = t18 + t0;
+    t11 = t17 + t10;
+    t3 = t18 - t0;
+    t17 = t15 - t4;
+    t10 = t19 - t9;
+    t18 = t15 + t4;
+    t0 = t19 + t9;
+    re[0] = t5;
+    im[0] = t13;
+    re[15] = t14;
+    im[15] = t16;
+    re[30] = t11;
+    im[30] = t3;
+    re[45] = t18;
+    im[45] = t0;
+    re[60] = t7;
+    im[60] = t1;
+    re[75] = t6;
+    im[75] = t8;
+    re[90] = t2;
+    im[90] = t12;
+    re[105] = t17;
+    im[105] = t10;
+    t15 = X[48];
+    t4 = X[191];
+    t19 = C8 * t15;
+    t9 = C9 * t4;
+    t5 = t19 + t9;
+    t13 = (-C9) * t15;
+    t14 = C8 * t4;
+    t16 = t13 + t14;
+    t11 = X[78];
+    t3 = X[161];
+    t18 = C10 * t11;
+    t0 = C11 * t3;
+    t7 = t18 + t0;
+    t1 = (-C11) * t11;
+    t6 = C10 * t3;
+    t8 = t1 + t6;
+    t2 = X[108];
+    t12 = X[131];
+    t17 = C12 * t2;
+    t10 = C13 * t12;
+    t19 = t17 + t10;
+    t9 = (-C13) * t2;
+    t15 = C12 * t12;
+    t4 = t9 + t15;
+    t13 = X[138];
+    t14 = X[101];
+    t18 = C14 * t13;
+    t0 = C15 * t14;
+    t11 = t18 + t0;
+    t3 = (-C15) * t13;
+    t1 = C14 * t14;
+    t6 = t3 + t1;
+    t17 = X[168];
+    t10 = X[71];
+    t2 = C16 * t17;
+    t12 = C17 * t10;
+    t9 = t2 + t12;
+    t15 = (-C17) * t17;
+    t18 = C16 * t10;
+    t0 = t15 + t18;
+    t13 = X[198];
+    t14 = X[41];
+    t3 = C18 * t13;
+    t1 = C19 * t14;
+    t2 = t3 + t1;
+    t12 = (-C19) * t13;
+    t17 = C18 * t14;
+    t10 = t12 + t17;
+    t15 = X[228];
+    t18 = X[11];
+    t3 = C20 * t15;
+    t1 = C21 * t18;
+    t13 = t3 + t1;
+    t14 = (-C21) * t15;
+    t12 = C20 * t18;
+    t17 = t14 + t12;
+    t3 = X[18];
+    t1 = X[221];
+    t15 = C22 * t3;
+    t18 = C23 * t1;
+    t14 = t15 + t18;
+    t12 = (-C23) * t3;
+    t15 = C22 * t1;
+    t18 = t12 + t15;
+    t3 = t5 + t9;
+    t1 = t16 + t0;
+    t12 = t19 + t13;
+    t15 = t4 + t17;
+    t5 = t5 - t9;
+    t9 = t16 - t0;
+    t16 = t19 - t13;
+    t0 = t4 - t17;
+    t19 = t3 + t12;
+    t13 = t1 + t15;
+    t4 = t5 + t0;
+    t17 = t9 - t16;
+    t3 = t3 - t12;
+    t12 = t1 - t15;
+    t1 = t5 - t0;
+    t15 = t9 + t16;
+    t5 = t7 + t2;
+    t0 = t8 + t10;
+    t9 = t11 + t14;
+    t16 = t6 + t18;
+    t7 = t7 - t2;
+    t2 = t8 - t10;
+    t8 = t11 - t14;
+    t10 = t6 - t18;
+    t11 = t5 + t9;
+    t14 = t0 + t16;
+    t6 = t7 + t10;
+    t18 = t2 - t8;
+    t5 = t5 - t9;
+    t9 = t0 - t16;
+    t0 = t7 - t10;
+    t16 = t2 + t8;
+    t7 = t6 + t18;
+    t10 = t6 - t18;
+    t2 = C6 * t7;
+    t8 = (-C6) * t10;
+    t6 = t0 - t16;
+    t18 = t0 + t16;
+    t7 = (-C6) * t6;
+    t10 = (-C6) * t18;
+    t0 = t19 - t11;
+    t16 = t13 - t14;
+    t6 = t19 + t11;
+    t18 = t13 + t14;
+    t19 = t4 - t2;
+    t11 = t17 - t8;
+    t13 = t4 + t2;
+    t14 = t17 + t8;
+    t4 = t3 - t9;
+    t2 = t12 + t5;
+    t17 = t3 + t9;
+    t8 = t12 - t5;
+    t3 = t1 - t7;
+    t9 = t15 - t10;
+    t12 = t1 + t7;
+    t5 = t15 + t10;
+    re[24] = t6;
+    im[24] = t18;
+    re[39] = t13;
+    im[39] = t14;
+    re[54] = t17;
+    im[54] = t8;
+    re[69] = t12;
+    im[69] = t5;
+    re[84] = t0;
+    im[84] = t16;
+    re[99] = t19;
+    im[99] = t11;
+    re[114] = t4;
+    im[114] = t2;
+    re[9] = t3;
+    im[9] = t9;
+    t1 = X[96];
+    t7 = X[143];
+    t15 = C24 * t1;
+    t10 = C25 * t7;
+    t6 = t15 + t10;
+    t18 = (-C25) * t1;
+    t13 = C24 * t7;
+    t14 = t18 + t13;
+    t17 = X[126];
+    t8 = X[113];
+    t12 = C26 * t17;
+    t5 = C27 * t8;
+    t0 = t12 + t5;
+    t16 = (-C27) * t17;
+    t19 = C26 * t8;
+    t11 = t16 + t19;
+    t4 = X[156];
+    t2 = X[83];
+    t3 = C28 * t4;
+    t9 = C29 * t2;
+    t15 = t3 + t9;
+    t10 = (-C29) * t4;
+    t1 = C28 * t2;
+    t7 = t10 + t1;
+    t18 = X[186];
+    t13 = X[53];
+    t12 = C30 * t18;
+    t5 = C31 * t13;
+    t17 = t12 + t5;
+    t8 = (-C31) * t18;
+    t16 = C30 * t13;
+    t19 = t8 + t16;
+    t3 = X[216];
+    t9 = X[23];
+    t4 = C32 * t3;
+    t2 = C33 * t9;
+    t10 = t4 + t2;
+    t1 = (-C33) * t3;
+    t12 = C32 * t9;
+    t5 = t1 + t12;
+    t18 = X[6];
+    t13 = X[233];
+    t8 = C34 * t18;
+    t16 = C35 * t13;
+    t4 = t8 + t16;
+    t2 = (-C35) * t18;
+    t3 = C34 * t13;
+    t9 = t2 + t3;
+    t1 = X[36];
+    t12 = X[203];
+    t8 = C36 * t1;
+    t16 = C37 * t12;
+    t18 = t8 + t16;
+    t13 = (-C37) * t1;
+    t2 = C36 * t12;
+    t3 = t13 + t2;
+    t8 = X[66];
+    t16 = X[173];
+    t1 = C38 * t8;
+    t12 = C39 * t16;
+    t13 = t1 + t12;
+    t2 = (-C39) * t8;
+    t1 = C38 * t16;
+    t12 = t2 + t1;
+    t8 = t6 + t10;
+    t16 = t14 + t5;
+    t2 = t15 + t18;
+    t1 = t7 + t3;
+    t6 = t6 - t10;
+    t10 = t14 - t5;
+    t14 = t15 - t18;
+    t5 = t7 - t3;
+    t15 = t8 + t2;
+    t18 = t16 + t1;
+    t7 = t6 + t5;
+    t3 = t10 - t14;
+    t8 = t8 - t2;
+    t2 = t16 - t1;
+    t16 = t6 - t5;
+    t1 = t10 + t14;
+    t6 = t0 + t4;
+    t5 = t11 + t9;
+    t10 = t17 + t13;
+    t14 = t19 + t12;
+    t0 = t0 - t4;
+    t4 = t11 - t9;
+    t11 = t17 - t13;
+    t9 = t19 - t12;
+    t17 = t6 + t10;
+    t13 = t5 + t14;
+    t19 = t0 + t9;
+    t12 = t4 - t11;
+    t6 = t6 - t10;
+    t10 = t5 - t14;
+    t5 = t0 - t9;
+    t14 = t4 + t11;
+    t0 = t19 + t12;
+    t9 = t19 - t12;
+    t4 = C6 * t0;
+    t11 = (-C6) * t9;
+    t19 = t5 - t14;
+    t12 = t5 + t14;
+    t0 = (-C6) * t19;
+    t9 = (-C6) * t12;
+    t5 = t15 - t17;
+    t14 = t18 - t13;
+    t19 = t15 + t17;
+    t12 = t18 + t13;
+    t15 = t7 - t4;
+    t17 = t3 - t11;
+    t18 = t7 + t4;
+    t13 = t3 + t11;
+    t7 = t8 - t10;
+    t4 = t2 + t6;
+    t3 = t8 + t10;
+    t11 = t2 - t6;
+    t8 = t16 - t0;
+    t10 = t1 - t9;
+    t2 = t16 + t0;
+    t6 = t1 + t9;
+    re[48] = t19;
+    im[48] = t12;
+    re[63] = t18;
+    im[63] = t13;
+    re[78] = t3;
+    im[78] = t11;
+    re[93] = t2;
+    im[93] = t6;
+    re[108] = t5;
+    im[108] = t14;
+    re[3] = t15;
+    im[3] = t17;
+    re[18] = t7;
+    im[18] = t4;
+    re[33] = t8;
+    im[33] = t10;
+    t16 = X[144];
+    t0 = X[95];
+    t1 = C25 * t16;
+    t9 = C24 * t0;
+    t19 = t1 + t9;
+    t12 = (-C24) * t16;
+    t18 = C25 * t0;
+    t13 = t12 + t18;
+    t3 = X[174];
+    t11 = X[65];
+    t2 = C39 * t3;
+    t6 = C38 * t11;
+    t5 = t2 + t6;
+    t14 = (-C38) * t3;
+    t15 = C39 * t11;
+    t17 = t14 + t15;
+    t7 = X[204];
+    t4 = X[35];
+    t8 = C37 * t7;
+    t10 = C36 * t4;
+    t1 = t8 + t10;
+    t9 = (-C36) * t7;
+    t16 = C37 * t4;
+    t0 = t9 + t16;
+    t12 = X[234];
+    t18 = X[5];
+    t2 = C35 * t12;
+    t6 = C34 * t18;
+    t3 = t2 + t6;
+    t11 = (-C34) * t12;
+    t14 = C35 * t18;
+    t15 = t11 + t14;
+    t8 = X[24];
+    t10 = X[215];
+    t7 = C33 * t8;
+    t4 = C32 * t10;
+    t9 = t7 + t4;
+    t16 = (-C32) * t8;
+    t2 = C33 * t10;
+    t6 = t16 + t2;
+    t12 = X[54];
+    t18 = X[185];
+    t11 = C31 * t12;
+    t14 = C30 * t18;
+    t7 = t11 + t14;
+    t4 = (-C30) * t12;
+    t8 = C31 * t18;
+    t10 = t4 + t8;
+    t16 = X[84];
+    t2 = X[155];
+    t11 = C29 * t16;
+    t14 = C28 * t2;
+    t12 = t11 + t14;
+    t18 = (-C28) * t16;
+    t4 = C29 * t2;
+    t8 = t18 + t4;
+    t11 = X[114];
+    t14 = X[125];
+    t16 = C27 * t11;
+    t2 = C26 * t14;
+    t18 = t16 + t2;
+    t4 = (-C26) * t11;
+    t16 = C27 * t14;
+    t2 = t4 + t16;
+    t11 = t19 + t9;
+    t14 = t13 + t6;
+    t4 = t1 + t12;
+    t16 = t0 + t8;
+    t19 = t19 - t9;
+    t9 = t13 - t6;
+    t13 = t1 - t12;
+    t6 = t0 - t8;
+    t1 = t11 + t4;
+    t12 = t14 + t16;
+    t0 = t19 + t6;
+    t8 = t9 - t13;
+    t11 = t11 - t4;
+    t4 = t14 - t16;
+    t14 = t19 - t6;
+    t16 = t9 + t13;
+    t19 = t5 + t7;
+    t6 = t17 + t10;
+    t9 = t3 + t18;
+    t13 = t15 + t2;
+    t5 = t5 - t7;
+    t7 = t17 - t10;
+    t17 = t3 - t18;
+    t10 = t15 - t2;
+    t3 = t19 + t9;
+    t18 = t6 + t13;
+    t15 = t5 + t10;
+    t2 = t7 - t17;
+    t19 = t19 - t9;
+    t9 = t6 - t13;
+    t6 = t5 - t10;
+    t13 = t7 + t17;
+    t5 = t15 + t2;
+    t10 = t15 - t2;
+    t7 = C6 * t5;
+    t17 = (-C6) * t10;
+    t15 = t6 - t13;
+    t2 = t6 + t13;
+    t5 = (-C6) * t15;
+    t10 = (-C6) * t2;
+    t6 = t1 - t3;
+    t13 = t12 - t18;
+    t15 = t1 + t3;
+    t2 = t12 + t18;
+    t1 = t0 - t7;
+    t3 = t8 - t17;
+    t12 = t0 + t7;
+    t18 = t8 + t17;
+    t0 = t11 - t9;
+    t7 = t4 + t19;
+    t8 = t11 + t9;
+    t17 = t4 - t19;
+    t11 = t14 - t5;
+    t9 = t16 - t10;
+    t4 = t14 + t5;
+    t19 = t16 + t10;
+    re[72] = t15;
+    im[72] = t2;
+    re[87] = t12;
+    im[87] = t18;
+    re[102] = t8;
+    im[102] = t17;
+    re[117] = t4;
+    im[117] = t19;
+    re[12] = t6;
+    im[12] = t13;
+    re[27] = t1;
+    im[27] = t3;
+    re[42] = t0;
+    im[42] = t7;
+    re[57] = t11;
+    im[57] = t9;
+    t14 = X[192];
+    t5 = X[47];
+    t16 = C9 * t14;
+    t10 = C8 * t5;
+    t15 = t16 + t10;
+    t2 = (-C8) * t14;
+    t12 = C9 * t5;
+    t18 = t2 + t12;
+    t8 = X[222];
+    t17 = X[17];
+    t4 = C23 * t8;
+    t19 = C22 * t17;
+    t6 = t4 + t19;
+    t13 = (-C22) * t8;
+    t1 = C23 * t17;
+    t3 = t13 + t1;
+    t0 = X[12];
+    t7 = X[227];
+    t11 = C21 * t0;
+    t9 = C20 * t7;
+    t16 = t11 + t9;
+    t10 = (-C20) * t0;
+    t14 = C21 * t7;
+    t5 = t10 + t14;
+    t2 = X[42];
+    t12 = X[197];
+    t4 = C19 * t2;
+    t19 = C18 * t12;
+    t8 = t4 + t19;
+    t17 = (-C18) * t2;
+    t13 = C19 * t12;
+    t1 = t17 + t13;
+    t11 = X[72];
+    t9 = X[167];
+    t0 = C17 * t11;
+    t7 = C16 * t9;
+    t10 = t0 + t7;
+    t14 = (-C16) * t11;
+    t4 = C17 * t9;
+    t19 = t14 + t4;
+    t2 = X[102];
+    t12 = X[137];
+    t17 = C15 * t2;
+    t13 = C14 * t12;
+    t0 = t17 + t13;
+    t7 = (-C14) * t2;
+    t11 = C15 * t12;
+    t9 = t7 + t11;
+    t14 = X[132];
+    t4 = X[107];
+    t17 = C13 * t14;
+    t13 = C12 * t4;
+    t2 = t17 + t13;
+    t12 = (-C12) * t14;
+    t7 = C13 * t4;
+    t11 = t12 + t7;
+    t17 = X[162];
+    t13 = X[77];
+    t14 = C11 * t17;
+    t4 = C10 * t13;
+    t12 = t14 + t4;
+    t7 = (-C10) * t17;
+    t14 = C11 * t13;
+    t4 = t7 + t14;
+    t17 = t15 + t10;
+    t13 = t18 + t19;
+    t7 = t16 + t2;
+    t14 = t5 + t11;
+    t15 = t15 - t10;
+    t10 = t18 - t19;
+    t18 = t16 - t2;
+    t19 = t5 - t11;
+    t16 = t17 + t7;
+    t2 = t13 + t14;
+    t5 = t15 + t19;
+    t11 = t10 - t18;
+    t17 = t17 - t7;
+    t7 = t13 - t14;
+    t13 = t15 - t19;
+    t14 = t10 + t18;
+    t15 = t6 + t0;
+    t19 = t3 + t9;
+    t10 = t8 + t12;
+    t18 = t1 + t4;
+    t6 = t6 - t0;
+    t0 = t3 - t9;
+    t3 = t8 - t12;
+    t9 = t1 - t4;
+    t8 = t15 + t10;
+    t12 = t19 + t18;
+    t1 = t6 + t9;
+    t4 = t0 - t3;
+    t15 = t15 - t10;
+    t10 = t19 - t18;
+    t19 = t6 - t9;
+    t18 = t0 + t3;
+    t6 = t1 + t4;
+    t9 = t1 - t4;
+    t0 = C6 * t6;
+    t3 = (-C6) * t9;
+    t1 = t19 - t18;
+    t4 = t19 + t18;
+    t6 = (-C6) * t1;
+    t9 = (-C6) * t4;
+    t19 = t16 - t8;
+    t18 = t2 - t12;
+    t1 = t16 + t8;
+    t4 = t2 + t12;
+    t16 = t5 - t0;
+    t8 = t11 - t3;
+    t2 = t5 + t0;
+    t12 = t11 + t3;
+    t5 = t17 - t10;
+    t0 = t7 + t15;
+    t11 = t17 + t10;
+    t3 = t7 - t15;
+    t17 = t13 - t6;
+    t10 = t14 - t9;
+    t7 = t13 + t6;
+    t15 = t14 + t9;
+    re[96] = t1;
+    im[96] = t4;
+    re[111] = t2;
+    im[111] = t12;
+    re[6] = t11;
+    im[6] = t3;
+    re[21] = t7;
+    im[21] = t15;
+    re[36] = t19;
+    im[36] = t18;
+    re[51] = t16;
+    im[51] = t8;
+    re[66] = t5;
+    im[66] = t0;
+    re[81] = t17;
+    im[81] = t10;
+    t13 = re[0];
+    t6 = im[0];
+    t14 = re[24];
+    t9 = im[24];
+    t1 = re[48];
+    t4 = im[48];
+    t2 = re[72];
+    t12 = im[72];
+    t11 = re[96];
+    t3 = im[96];
+    t7 = t14 + t11;
+    t15 = t9 + t3;
+    t19 = t1 + t2;
+    t18 = t4 + t12;
+    t16 = t14 - t11;
+    t8 = t9 - t3;
+    t5 = t1 - t2;
+    t0 = t4 - t12;
+    t17 = t7 + t19;
+    t10 = t15 + t18;
+    t14 = t7 - t19;
+    t11 = C40 * t14;
+    t9 = t15 - t18;
+    t3 = C40 * t9;
+    t1 = C41 * t17;
+    t2 = t13 - t1;
+    t4 = C41 * t10;
+    t12 = t6 - t4;
+    t7 = t2 + t11;
+    t19 = t12 + t3;
+    t14 = t2 - t11;
+    t15 = t12 - t3;
+    t18 = C8 * t16;
+    t9 = C25 * t5;
+    t1 = t18 + t9;
+    t4 = C8 * t8;
+    t2 = C25 * t0;
+    t11 = t4 + t2;
+    t12 = C25 * t16;
+    t3 = C8 * t5;
+    t18 = t12 - t3;
+    t9 = C25 * t8;
+    t4 = C8 * t0;
+    t2 = t9 - t4;
+    t16 = t13 + t17;
+    t5 = t6 + t10;
+    t12 = t7 + t11;
+    t3 = t19 - t1;
+    t8 = t14 + t2;
+    t0 = t15 - t18;
+    t9 = t14 - t2;
+    t4 = t15 + t18;
+    t13 = t7 - t11;
+    t17 = t19 + t1;
+    re[0] = t16;
+    im[0] = t5;
+    re[24] = t12;
+    im[24] = t3;
+    re[48] = t8;
+    im[48] = t0;
+    re[72] = t9;
+    im[72] = t4;
+    re[96] = t13;
+    im[96] = t17;
+    t6 = re[15];
+    t10 = im[15];
+    t14 = re[39];
+    t2 = im[39];
+    t15 = re[63];
+    t18 = im[63];
+    t7 = re[87];
+    t11 = im[87];
+    t19 = re[111];
+    t1 = im[111];
+    t16 = t14 + t19;
+    t5 = t2 + t1;
+    t12 = t15 + t7;
+    t3 = t18 + t11;
+    t8 = t14 - t19;
+    t0 = t2 - t1;
+    t9 = t15 - t7;
+    t4 = t18 - t11;
+    t13 = t16 + t12;
+    t17 = t5 + t3;
+    t14 = t16 - t12;
+    t19 = C40 * t14;
+    t2 = t5 - t3;
+    t1 = C40 * t2;
+    t15 = C41 * t13;
+    t7 = t6 - t15;
+    t18 = C41 * t17;
+    t11 = t10 - t18;
+    t16 = t7 + t19;
+    t12 = t11 + t1;
+    t14 = t7 - t19;
+    t5 = t11 - t1;
+    t3 = C8 * t8;
+    t2 = C25 * t9;
+    t15 = t3 + t2;
+    t18 = C8 * t0;
+    t7 = C25 * t4;
+    t19 = t18 + t7;
+    t11 = C25 * t8;
+    t1 = C8 * t9;
+    t3 = t11 - t1;
+    t2 = C25 * t0;
+    t18 = C8 * t4;
+    t7 = t2 - t18;
+    t8 = t6 + t13;
+    t9 = t10 + t17;
+    t11 = t16 + t19;
+    t1 = t12 - t15;
+    t0 = t14 + t7;
+    t4 = t5 - t3;
+    t2 = t14 - t7;
+    t18 = t5 + t3;
+    t6 = t16 - t19;
+    t13 = t12 + t15;
+    re[15] = t8;
+    im[15] = t9;
+    re[39] = t11;
+    im[39] = t1;
+    re[63] = t0;
+    im[63] = t4;
+    re[87] = t2;
+    im[87] = t18;
+    re[111] = t6;
+    im[111] = t13;
+    t10 = re[30];
+    t17 = im[30];
+    t14 = re[54];
+    t7 = im[54];
+    t5 = re[78];
+    t3 = im[78];
+    t16 = re[102];
+    t19 = im[102];
+    t12 = re[6];
+    t15 = im[6];
+    t8 = t14 + t12;
+    t9 = t7 + t15;
+    t11 = t5 + t16;
+    t1 = t3 + t19;
+    t0 = t14 - t12;
+    t4 = t7 - t15;
+    t2 = t5 - t16;
+    t18 = t3 - t19;
+    t6 = t8 + t11;
+    t13 = t9 + t1;
+    t14 = t8 - t11;
+    t12 = C40 * t14;
+    t7 = t9 - t1;
+    t15 = C40 * t7;
+    t5 = C41 * t6;
+    t16 = t10 - t5;
+    t3 = C41 * t13;
+    t19 = t17 - t3;
+    t8 = t16 + t12;
+    t11 = t19 + t15;
+    t14 = t16 - t12;
+    t9 = t19 - t15;
+    t1 = C8 * t0;
+    t7 = C25 * t2;
+    t5 = t1 + t7;
+    t3 = C8 * t4;
+    t16 = C25 * t18;
+    t12 = t3 + t16;
+    t19 = C25 * t0;
+    t15 = C8 * t2;
+    t1 = t19 - t15;
+    t7 = C25 * t4;
+    t3 = C8 * t18;
+    t16 = t7 - t3;
+    t0 = t10 + t6;
+    t2 = t17 + t13;
+    t19 = t8 + t12;
+    t15 = t11 - t5;
+    t4 = t14 + t16;
+    t18 = t9 - t1;
+    t7 = t14 - t16;
+    t3 = t9 + t1;
+    t10 = t8 - t12;
+    t6 = t11 + t5;
+    re[30] = t0;
+    im[30] = t2;
+    re[54] = t19;
+    im[54] = t15;
+    re[78] = t4;
+    im[78] = t18;
+    re[102] = t7;
+    im[102] = t3;
+    re[6] = t10;
+    im[6] = t6;
+    t17 = re[45];
+    t13 = im[45];
+    t14 = re[69];
+    t16 = im[69];
+    t9 = re[93];
+    t1 = im[93];
+    t8 = re[117];
+    t12 = im[117];
+    t11 = re[21];
+    t5 = im[21];
+    t0 = t14 + t11;
+    t2 = t16 + t5;
+    t19 = t9 + t8;
+    t15 = t1 + t12;
+    t4 = t14 - t11;
+    t18 = t16 - t5;
+    t7 = t9 - t8;
+    t3 = t1 - t12;
+    t10 = t0 + t19;
+    t6 = t2 + t15;
+    t14 = t0 - t19;
+    t11 = C40 * t14;
+    t16 = t2 - t15;
+    t5 = C40 * t16;
+    t9 = C41 * t10;
+    t8 = t17 - t9;
+    t1 = C41 * t6;
+    t12 = t13 - t1;
+    t0 = t8 + t11;
+    t19 = t12 + t5;
+    t14 = t8 - t11;
+    t2 = t12 - t5;
+    t15 = C8 * t4;
+    t16 = C25 * t7;
+    t9 = t15 + t16;
+    t1 = C8 * t18;
+    t8 = C25 * t3;
+    t11 = t1 + t8;
+    t12 = C25 * t4;
+    t5 = C8 * t7;
+    t15 = t12 - t5;
+    t16 = C25 * t18;
+    t1 = C8 * t3;
+    t8 = t16 - t1;
+    t4 = t17 + t10;
+    t7 = t13 + t6;
+    t12 = t0 + t11;
+    t5 = t19 - t9;
+    t18 = t14 + t8;
+    t3 = t2 - t15;
+    t16 = t14 - t8;
+    t1 = t2 + t15;
+    t17 = t0 - t11;
+    t10 = t19 + t9;
+    re[45] = t4;
+    im[45] = t7;
+    re[69] = t12;
+    im[69] = t5;
+    re[93] = t18;
+    im[93] = t3;
+    re[117] = t16;
+    im[117] = t1;
+    re[21] = t17;
+    im[21] = t10;
+    t13 = re[60];
+    t6 = im[60];
+    t14 = re[84];
+    t8 = im[84];
+    t2 = re[108];
+    t15 = im[108];
+    t0 = re[12];
+    t11 = im[12];
+    t19 = re[36];
+    t9 = im[36];
+    t4 = t14 + t19;
+    t7 = t8 + t9;
+    t12 = t2 + t0;
+    t5 = t15 + t11;
+    t18 = t14 - t19;
+    t3 = t8 - t9;
+    t16 = t2 - t0;
+    t1 = t15 - t11;
+    t17 = t4 + t12;
+    t10 = t7 + t5;
+    t14 = t4 - t12;
+    t19 = C40 * t14;
+    t8 = t7 - t5;
+    t9 = C40 * t8;
+    t2 = C41 * t17;
+    t0 = t13 - t2;
+    t15 = C41 * t10;
+    t11 = t6 - t15;
+    t4 = t0 + t19;
+    t12 = t11 + t9;
+    t14 = t0 - t19;
+    t7 = t11 - t9;
+    t5 = C8 * t18;
+    t8 = C25 * t16;
+    t2 = t5 + t8;
+    t15 = C8 * t3;
+    t0 = C25 * t1;
+    t19 = t15 + t0;
+    t11 = C25 * t18;
+    t9 = C8 * t16;
+    t5 = t11 - t9;
+    t8 = C25 * t3;
+    t15 = C8 * t1;
+    t0 = t8 - t15;
+    t18 = t13 + t17;
+    t16 = t6 + t10;
+    t11 = t4 + t19;
+    t9 = t12 - t2;
+    t3 = t14 + t0;
+    t1 = t7 - t5;
+    t8 = t14 - t0;
+    t15 = t7 + t5;
+    t13 = t4 - t19;
+    t17 = t12 + t2;
+    re[60] = t18;
+    im[60] = t16;
+    re[84] = t11;
+    im[84] = t9;
+    re[108] = t3;
+    im[108] = t1;
+    re[12] = t8;
+    im[12] = t15;
+    re[36] = t13;
+    im[36] = t17;
+    t6 = re[75];
+    t10 = im[75];
+    t14 = re[99];
+    t0 = im[99];
+    t7 = re[3];
+    t5 = im[3];
+    t4 = re[27];
+    t19 = im[27];
+    t12 = re[51];
+    t2 = im[51];
+    t18 = t14 + t12;
+    t16 = t0 + t2;
+    t11 = t7 + t4;
+    t9 = t5 + t19;
+    t3 = t14 - t12;
+    t1 = t0 - t2;
+    t8 = t7 - t4;
+    t15 = t5 - t19;
+    t13 = t18 + t11;
+    t17 = t16 + t9;
+    t14 = t18 - t11;
+    t12 = C40 * t14;
+    t0 = t16 - t9;
+    t2 = C40 * t0;
+    t7 = C41 * t13;
+    t4 = t6 - t7;
+    t5 = C41 * t17;
+    t19 = t10 - t5;
+    t18 = t4 + t12;
+    t11 = t19 + t2;
+    t14 = t4 - t12;
+    t16 = t19 - t2;
+    t9 = C8 * t3;
+    t0 = C25 * t8;
+    t7 = t9 + t0;
+    t5 = C8 * t1;
+    t4 = C25 * t15;
+    t12 = t5 + t4;
+    t19 = C25 * t3;
+    t2 = C8 * t8;
+    t9 = t19 - t2;
+    t0 = C25 * t1;
+    t5 = C8 * t15;
+    t4 = t0 - t5;
+    t3 = t6 + t13;
+    t8 = t10 + t17;
+    t19 = t18 + t12;
+    t2 = t11 - t7;
+    t1 = t14 + t4;
+    t15 = t16 - t9;
+    t0 = t14 - t4;
+    t5 = t16 + t9;
+    t6 = t18 - t12;
+    t13 = t11 + t7;
+    re[75] = t3;
+    im[75] = t8;
+    re[99] = t19;
+    im[99] = t2;
+    re[3] = t1;
+    im[3] = t15;
+    re[27] = t0;
+    im[27] = t5;
+    re[51] = t6;
+    im[51] = t13;
+    t10 = re[90];
+    t17 = im[90];
+    t14 = re[114];
+    t4 = im[114];
+    t16 = re[18];
+    t9 = im[18];
+    t18 = re[42];
+    t12 = im[42];
+    t11 = re[66];
+    t7 = im[66];
+    t3 = t14 + t11;
+    t8 = t4 + t7;
+    t19 = t16 + t18;
+    t2 = t9 + t12;
+    t1 = t14 - t11;
+    t15 = t4 - t7;
+    t0 = t16 - t18;
+    t5 = t9 - t12;
+    t6 = t3 + t19;
+    t13 = t8 + t2;
+    t14 = t3 - t19;
+    t11 = C40 * t14;
+    t4 = t8 - t2;
+    t7 = C40 * t4;
+    t16 = C41 * t6;
+    t18 = t10 - t16;
+    t9 = C41 * t13;
+    t12 = t17 - t9;
+    t3 = t18 + t11;
+    t19 = t12 + t7;
+    t14 = t18 - t11;
+    t8 = t12 - t7;
+    t2 = C8 * t1;
+    t4 = C25 * t0;
+    t16 = t2 + t4;
+    t9 = C8 * t15;
+    t18 = C25 * t5;
+    t11 = t9 + t18;
+    t12 = C25 * t1;
+    t7 = C8 * t0;
+    t2 = t12 - t7;
+    t4 = C25 * t15;
+    t9 = C8 * t5;
+    t18 = t4 - t9;
+    t1 = t10 + t6;
+    t0 = t17 + t13;
+    t12 = t3 + t11;
+    t7 = t19 - t16;
+    t15 = t14 + t18;
+    t5 = t8 - t2;
+    t4 = t14 - t18;
+    t9 = t8 + t2;
+    t10 = t3 - t11;
+    t6 = t19 + t16;
+    re[90] = t1;
+    im[90] = t0;
+    re[114] = t12;
+    im[114] = t7;
+    re[18] = t15;
+    im[18] = t5;
+    re[42] = t4;
+    im[42] = t9;
+    re[66] = t10;
+    im[66] = t6;
+    t17 = re[105];
+    t13 = im[105];
+    t14 = re[9];
+    t18 = im[9];
+    t8 = re[33];
+    t2 = im[33];
+    t3 = re[57];
+    t11 = im[57];
+    t19 = re[81];
+    t16 = im[81];
+    t1 = t14 + t19;
+    t0 = t18 + t16;
+    t12 = t8 + t3;
+    t7 = t2 + t11;
+    t15 = t14 - t19;
+    t5 = t18 - t16;
+    t4 = t8 - t3;
+    t9 = t2 - t11;
+    t10 = t1 + t12;
+    t6 = t0 + t7;
+    t14 = t1 - t12;
+    t19 = C40 * t14;
+    t18 = t0 - t7;
+    t16 = C40 * t18;
+    t8 = C41 * t10;
+    t3 = t17 - t8;
+    t2 = C41 * t6;
+    t11 = t13 - t2;
+    t1 = t3 + t19;
+    t12 = t11 + t16;
+    t14 = t3 - t19;
+    t0 = t11 - t16;
+    t7 = C8 * t15;
+    t18 = C25 * t4;
+    t8 = t7 + t18;
+    t2 = C8 * t5;
+    t3 = C25 * t9;
+    t19 = t2 + t3;
+    t11 = C25 * t15;
+    t16 = C8 * t4;
+    t7 = t11 - t16;
+    t18 = C25 * t5;
+    t2 = C8 * t9;
+    t3 = t18 - t2;
+    t15 = t17 + t10;
+    t4 = t13 + t6;
+    t11 = t1 + t19;
+    t16 = t12 - t8;
+    t5 = t14 + t3;
+    t9 = t0 - t7;
+    t18 = t14 - t3;
+    t2 = t0 + t7;
+    t17 = t1 - t19;
+    t10 = t12 + t8;
+    re[105] = t15;
+    im[105] = t4;
+    re[9] = t11;
+    im[9] = t16;
+    re[33] = t5;
+    im[33] = t9;
+    re[57] = t18;
+    im[57] = t2;
+    re[81] = t17;
+    im[81] = t10;
+}
+
+/**
+ *  Part 2 of ApplyWindowedIMDCT_W10_240().
+ * 
+ *  @param {Number[]} X 
+ *    - The input block (240 points).
+ *  @param {Number[]} y 
+ *    - The array that would contain the output block (480 points).
+ *  @param {Number[]} re 
+ *    - The scratch buffer (real part, 120 points).
+ *  @param {Number[]} im 
+ *    - The scratch buffer (imaginary part, 120 points).
+ */
+function ApplyWindowedIMDCT_W10_240_Part2(X, y, re, im) {
+    let t0, t1, t10, t11, t12, t13, t14, t15, t16, t17, t18, t19, t2, t3, t4, t5, t6, t7, t8, t9;
+    const C0 = 0.8660254037844387;
+    const C1 = 0.49999999999999994;
+    const C2 = 0.7518398074789774;
+    const C3 = 0.6593458151000688;
+    const C4 = 0.6087614290087207;
+    const C5 = 0.7933533402912352;
+    const C6 = 0.4422886902190013;
+    const C7 = 0.8968727415326883;
+    const C8 = 0.25881904510252074;
+    const C9 = 0.9659258262890683;
+    const C10 = 0.06540312923014306;
+    const C11 = 0.9978589232386035;
+    const C12 = 0.9914448613738104;
+    const C13 = 0.13052619222005157;
+    const C14 = 0.9469301294951057;
+    const C15 = 0.3214394653031616;
+    const C16 = 0.7071067811865476;
+    const C17 = 0.6691306063588582;
+    const C18 = 0.7431448254773942;
+    const C19 = 0.5112930860770522;
+    const C20 = 0.8594064115014527;
+    const C21 = 0.33380685923377096;
+    const C22 = 0.9426414910921784;
+    const C23 = 0.1434926219911793;
+    const C24 = 0.9896513868196702;
+    const C25 = 0.9986295347545738;
+    const C26 = 0.05233595624294383;
+    const C27 = 0.9692309097067544;
+    const C28 = 0.24615329302899303;
+    const C29 = 0.9025852843498606;
+    const C30 = 0.4305110968082951;
+    const C31 = 0.8012538126910607;
+    const C32 = 0.598324600570659;
+    const C33 = 0.40673664307580015;
+    const C34 = 0.9135454576426009;
+    const C35 = 0.22069743502150108;
+    const C36 = 0.9753423205085127;
+    const C37 = 0.02617694830787315;
+    const C38 = 0.9996573249755573;
+    const C39 = 0.9855560590580777;
+    const C40 = 0.1693495038490246;
+    const C41 = 0.9335804264972017;
+    const C42 = 0.35836794954530027;
+    const C43 = 0.8457278217039733;
+    const C44 = 0.5336145159156115;
+    const C45 = 0.7253743710122876;
+    const C46 = 0.6883545756937539;
+    const C47 = 0.5771451900372336;
+    const C48 = 0.8166415551616789;
+    const C49 = 0.10452846326765346;
+    const C50 = 0.9945218953682733;
+    const C51 = 0.9958049275746618;
+    const C52 = 0.09150161866340238;
+    const C53 = 0.958819734868193;
+    const C54 = 0.2840153447039226;
+    const C55 = 0.8849876374630419;
+    const C56 = 0.4656145203251114;
+    const C57 = 0.7771459614569709;
+    const C58 = 0.6293203910498375;
+    const C59 = 0.6394390019805847;
+    const C60 = 0.7688418320734596;
+    const C61 = 0.4771587602596084;
+    const C62 = 0.8788171126619654;
+    const C63 = 0.296541574975571;
+    const C64 = 0.9550199444571866;
+    const C65 = 0.9781476007338057;
+    const C66 = 0.20791169081775931;
+    const C67 = 0.9187912101488983;
+    const C68 = 0.39474385638426723;
+    const C69 = 0.8241261886220156;
+    const C70 = 0.5664062369248328;
+    const C71 = 0.6977904598416801;
+    const C72 = 0.7163019434246544;
+    const C73 = 0.544639035015027;
+    const C74 = 0.838670567945424;
+    const C75 = 0.3705574375098362;
+    const C76 = 0.9288095528719242;
+    const C77 = 0.18223552549214747;
+    const C78 = 0.9832549075639546;
+    const C79 = 0.999914327574007;
+    const C80 = 0.01308959557134444;
+    const C81 = 0.5590169943749475;
+    const C82 = 0.25;
+    const C83 = 0.9510565162951535;
+    const C84 = 0.5877852522924731;
+    t13 = X[80];
+    t6 = X[159];
+    t14 = C0 * t13;
+    t3 = C1 * t6;
+    t0 = t14 + t3;
+    t7 = (-C1) * t13;
+    t1 = C0 * t6;
+    t19 = t7 + t1;
+    t12 = X[110];
+    t8 = X[129];
+    t15 = C2 * t12;
+    t4 = C3 * t8;
+    t11 = t15 + t4;
+    t16 = (-C3) * t12;
+    t5 = C2 * t8;
+    t9 = t16 + t5;
+    t18 = X[140];
+    t2 = X[99];
+    t17 = C4 * t18;
+    t10 = C5 * t2;
+    t14 = t17 + t10;
+    t3 = (-C5) * t18;
+    t13 = C4 * t2;
+    t6 = t3 + t13;
+    t7 = X[170];
+    t1 = X[69];
+    t15 = C6 * t7;
+    t4 = C7 * t1;
+    t12 = t15 + t4;
+    t8 = (-C7) * t7;
+    t16 = C6 * t1;
+    t5 = t8 + t16;
+    t17 = X[200];
+    t10 = X[39];
+    t18 = C8 * t17;
+    t2 = C9 * t10;
+    t3 = t18 + t2;
+    t13 = (-C9) * t17;
+    t15 = C8 * t10;
+    t4 = t13 + t15;
+    t7 = X[230];
+    t1 = X[9];
+    t8 = C10 * t7;
+    t16 = C11 * t1;
+    t18 = t8 + t16;
+    t2 = (-C11) * t7;
+    t17 = C10 * t1;
+    t10 = t2 + t17;
+    t13 = X[20];
+    t15 = X[219];
+    t8 = C12 * t13;
+    t16 = C13 * t15;
+    t7 = t8 + t16;
+    t1 = (-C13) * t13;
+    t2 = C12 * t15;
+    t17 = t1 + t2;
+    t8 = X[50];
+    t16 = X[189];
+    t13 = C14 * t8;
+    t15 = C15 * t16;
+    t1 = t13 + t15;
+    t2 = (-C15) * t8;
+    t13 = C14 * t16;
+    t15 = t2 + t13;
+    t8 = t0 + t3;
+    t16 = t19 + t4;
+    t2 = t14 + t7;
+    t13 = t6 + t17;
+    t0 = t0 - t3;
+    t3 = t19 - t4;
+    t19 = t14 - t7;
+    t4 = t6 - t17;
+    t14 = t8 + t2;
+    t7 = t16 + t13;
+    t6 = t0 + t4;
+    t17 = t3 - t19;
+    t8 = t8 - t2;
+    t2 = t16 - t13;
+    t16 = t0 - t4;
+    t13 = t3 + t19;
+    t0 = t11 + t18;
+    t4 = t9 + t10;
+    t3 = t12 + t1;
+    t19 = t5 + t15;
+    t11 = t11 - t18;
+    t18 = t9 - t10;
+    t9 = t12 - t1;
+    t10 = t5 - t15;
+    t12 = t0 + t3;
+    t1 = t4 + t19;
+    t5 = t11 + t10;
+    t15 = t18 - t9;
+    t0 = t0 - t3;
+    t3 = t4 - t19;
+    t4 = t11 - t10;
+    t19 = t18 + t9;
+    t11 = t5 + t15;
+    t10 = t5 - t15;
+    t18 = C16 * t11;
+    t9 = (-C16) * t10;
+    t5 = t4 - t19;
+    t15 = t4 + t19;
+    t11 = (-C16) * t5;
+    t10 = (-C16) * t15;
+    t4 = t14 - t12;
+    t19 = t7 - t1;
+    t5 = t14 + t12;
+    t15 = t7 + t1;
+    t14 = t6 - t18;
+    t12 = t17 - t9;
+    t7 = t6 + t18;
+    t1 = t17 + t9;
+    t6 = t8 - t3;
+    t18 = t2 + t0;
+    t17 = t8 + t3;
+    t9 = t2 - t0;
+    t8 = t16 - t11;
+    t3 = t13 - t10;
+    t2 = t16 + t11;
+    t0 = t13 + t10;
+    re[40] = t5;
+    im[40] = t15;
+    re[55] = t7;
+    im[55] = t1;
+    re[70] = t17;
+    im[70] = t9;
+    re[85] = t2;
+    im[85] = t0;
+    re[100] = t4;
+    im[100] = t19;
+    re[115] = t14;
+    im[115] = t12;
+    re[10] = t6;
+    im[10] = t18;
+    re[25] = t8;
+    im[25] = t3;
+    t16 = X[128];
+    t11 = X[111];
+    t13 = C17 * t16;
+    t10 = C18 * t11;
+    t5 = t13 + t10;
+    t15 = (-C18) * t16;
+    t7 = C17 * t11;
+    t1 = t15 + t7;
+    t17 = X[158];
+    t9 = X[81];
+    t2 = C19 * t17;
+    t0 = C20 * t9;
+    t4 = t2 + t0;
+    t19 = (-C20) * t17;
+    t14 = C19 * t9;
+    t12 = t19 + t14;
+    t6 = X[188];
+    t18 = X[51];
+    t8 = C21 * t6;
+    t3 = C22 * t18;
+    t13 = t8 + t3;
+    t10 = (-C22) * t6;
+    t16 = C21 * t18;
+    t11 = t10 + t16;
+    t15 = X[218];
+    t7 = X[21];
+    t2 = C23 * t15;
+    t0 = C24 * t7;
+    t17 = t2 + t0;
+    t9 = (-C24) * t15;
+    t19 = C23 * t7;
+    t14 = t9 + t19;
+    t8 = X[8];
+    t3 = X[231];
+    t6 = C25 * t8;
+    t18 = C26 * t3;
+    t10 = t6 + t18;
+    t16 = (-C26) * t8;
+    t2 = C25 * t3;
+    t0 = t16 + t2;
+    t15 = X[38];
+    t7 = X[201];
+    t9 = C27 * t15;
+    t19 = C28 * t7;
+    t6 = t9 + t19;
+    t18 = (-C28) * t15;
+    t8 = C27 * t7;
+    t3 = t18 + t8;
+    t16 = X[68];
+    t2 = X[171];
+    t9 = C29 * t16;
+    t19 = C30 * t2;
+    t15 = t9 + t19;
+    t7 = (-C30) * t16;
+    t18 = C29 * t2;
+    t8 = t7 + t18;
+    t9 = X[98];
+    t19 = X[141];
+    t16 = C31 * t9;
+    t2 = C32 * t19;
+    t7 = t16 + t2;
+    t18 = (-C32) * t9;
+    t16 = C31 * t19;
+    t2 = t18 + t16;
+    t9 = t5 + t10;
+    t19 = t1 + t0;
+    t18 = t13 + t15;
+    t16 = t11 + t8;
+    t5 = t5 - t10;
+    t10 = t1 - t0;
+    t1 = t13 - t15;
+    t0 = t11 - t8;
+    t13 = t9 + t18;
+    t15 = t19 + t16;
+    t11 = t5 + t0;
+    t8 = t10 - t1;
+    t9 = t9 - t18;
+    t18 = t19 - t16;
+    t19 = t5 - t0;
+    t16 = t10 + t1;
+    t5 = t4 + t6;
+    t0 = t12 + t3;
+    t10 = t17 + t7;
+    t1 = t14 + t2;
+    t4 = t4 - t6;
+    t6 = t12 - t3;
+    t12 = t17 - t7;
+    t3 = t14 - t2;
+    t17 = t5 + t10;
+    t7 = t0 + t1;
+    t14 = t4 + t3;
+    t2 = t6 - t12;
+    t5 = t5 - t10;
+    t10 = t0 - t1;
+    t0 = t4 - t3;
+    t1 = t6 + t12;
+    t4 = t14 + t2;
+    t3 = t14 - t2;
+    t6 = C16 * t4;
+    t12 = (-C16) * t3;
+    t14 = t0 - t1;
+    t2 = t0 + t1;
+    t4 = (-C16) * t14;
+    t3 = (-C16) * t2;
+    t0 = t13 - t17;
+    t1 = t15 - t7;
+    t14 = t13 + t17;
+    t2 = t15 + t7;
+    t13 = t11 - t6;
+    t17 = t8 - t12;
+    t15 = t11 + t6;
+    t7 = t8 + t12;
+    t11 = t9 - t10;
+    t6 = t18 + t5;
+    t8 = t9 + t10;
+    t12 = t18 - t5;
+    t9 = t19 - t4;
+    t10 = t16 - t3;
+    t18 = t19 + t4;
+    t5 = t16 + t3;
+    re[64] = t14;
+    im[64] = t2;
+    re[79] = t15;
+    im[79] = t7;
+    re[94] = t8;
+    im[94] = t12;
+    re[109] = t18;
+    im[109] = t5;
+    re[4] = t0;
+    im[4] = t1;
+    re[19] = t13;
+    im[19] = t17;
+    re[34] = t11;
+    im[34] = t6;
+    re[49] = t9;
+    im[49] = t10;
+    t19 = X[176];
+    t4 = X[63];
+    t16 = C33 * t19;
+    t3 = C34 * t4;
+    t14 = t16 + t3;
+    t2 = (-C34) * t19;
+    t15 = C33 * t4;
+    t7 = t2 + t15;
+    t8 = X[206];
+    t12 = X[33];
+    t18 = C35 * t8;
+    t5 = C36 * t12;
+    t0 = t18 + t5;
+    t1 = (-C36) * t8;
+    t13 = C35 * t12;
+    t17 = t1 + t13;
+    t11 = X[236];
+    t6 = X[3];
+    t9 = C37 * t11;
+    t10 = C38 * t6;
+    t16 = t9 + t10;
+    t3 = (-C38) * t11;
+    t19 = C37 * t6;
+    t4 = t3 + t19;
+    t2 = X[26];
+    t15 = X[213];
+    t18 = C39 * t2;
+    t5 = C40 * t15;
+    t8 = t18 + t5;
+    t12 = (-C40) * t2;
+    t1 = C39 * t15;
+    t13 = t12 + t1;
+    t9 = X[56];
+    t10 = X[183];
+    t11 = C41 * t9;
+    t6 = C42 * t10;
+    t3 = t11 + t6;
+    t19 = (-C42) * t9;
+    t18 = C41 * t10;
+    t5 = t19 + t18;
+    t2 = X[86];
+    t15 = X[153];
+    t12 = C43 * t2;
+    t1 = C44 * t15;
+    t11 = t12 + t1;
+    t6 = (-C44) * t2;
+    t9 = C43 * t15;
+    t10 = t6 + t9;
+    t19 = X[116];
+    t18 = X[123];
+    t12 = C45 * t19;
+    t1 = C46 * t18;
+    t2 = t12 + t1;
+    t15 = (-C46) * t19;
+    t6 = C45 * t18;
+    t9 = t15 + t6;
+    t12 = X[146];
+    t1 = X[93];
+    t19 = C47 * t12;
+    t18 = C48 * t1;
+    t15 = t19 + t18;
+    t6 = (-C48) * t12;
+    t19 = C47 * t1;
+    t18 = t6 + t19;
+    t12 = t14 + t3;
+    t1 = t7 + t5;
+    t6 = t16 + t2;
+    t19 = t4 + t9;
+    t14 = t14 - t3;
+    t3 = t7 - t5;
+    t7 = t16 - t2;
+    t5 = t4 - t9;
+    t16 = t12 + t6;
+    t2 = t1 + t19;
+    t4 = t14 + t5;
+    t9 = t3 - t7;
+    t12 = t12 - t6;
+    t6 = t1 - t19;
+    t1 = t14 - t5;
+    t19 = t3 + t7;
+    t14 = t0 + t11;
+    t5 = t17 + t10;
+    t3 = t8 + t15;
+    t7 = t13 + t18;
+    t0 = t0 - t11;
+    t11 = t17 - t10;
+    t17 = t8 - t15;
+    t10 = t13 - t18;
+    t8 = t14 + t3;
+    t15 = t5 + t7;
+    t13 = t0 + t10;
+    t18 = t11 - t17;
+    t14 = t14 - t3;
+    t3 = t5 - t7;
+    t5 = t0 - t10;
+    t7 = t11 + t17;
+    t0 = t13 + t18;
+    t10 = t13 - t18;
+    t11 = C16 * t0;
+    t17 = (-C16) * t10;
+    t13 = t5 - t7;
+    t18 = t5 + t7;
+    t0 = (-C16) * t13;
+    t10 = (-C16) * t18;
+    t5 = t16 - t8;
+    t7 = t2 - t15;
+    t13 = t16 + t8;
+    t18 = t2 + t15;
+    t16 = t4 - t11;
+    t8 = t9 - t17;
+    t2 = t4 + t11;
+    t15 = t9 + t17;
+    t4 = t12 - t3;
+    t11 = t6 + t14;
+    t9 = t12 + t3;
+    t17 = t6 - t14;
+    t12 = t1 - t0;
+    t3 = t19 - t10;
+    t6 = t1 + t0;
+    t14 = t19 + t10;
+    re[88] = t13;
+    im[88] = t18;
+    re[103] = t2;
+    im[103] = t15;
+    re[118] = t9;
+    im[118] = t17;
+    re[13] = t6;
+    im[13] = t14;
+    re[28] = t5;
+    im[28] = t7;
+    re[43] = t16;
+    im[43] = t8;
+    re[58] = t4;
+    im[58] = t11;
+    re[73] = t12;
+    im[73] = t3;
+    t1 = X[224];
+    t0 = X[15];
+    t19 = C49 * t1;
+    t10 = C50 * t0;
+    t13 = t19 + t10;
+    t18 = (-C50) * t1;
+    t2 = C49 * t0;
+    t15 = t18 + t2;
+    t9 = X[14];
+    t17 = X[225];
+    t6 = C51 * t9;
+    t14 = C52 * t17;
+    t5 = t6 + t14;
+    t7 = (-C52) * t9;
+    t16 = C51 * t17;
+    t8 = t7 + t16;
+    t4 = X[44];
+    t11 = X[195];
+    t12 = C53 * t4;
+    t3 = C54 * t11;
+    t19 = t12 + t3;
+    t10 = (-C54) * t4;
+    t1 = C53 * t11;
+    t0 = t10 + t1;
+    t18 = X[74];
+    t2 = X[165];
+    t6 = C55 * t18;
+    t14 = C56 * t2;
+    t9 = t6 + t14;
+    t17 = (-C56) * t18;
+    t7 = C55 * t2;
+    t16 = t17 + t7;
+    t12 = X[104];
+    t3 = X[135];
+    t4 = C57 * t12;
+    t11 = C58 * t3;
+    t10 = t4 + t11;
+    t1 = (-C58) * t12;
+    t6 = C57 * t3;
+    t14 = t1 + t6;
+    t18 = X[134];
+    t2 = X[105];
+    t17 = C59 * t18;
+    t7 = C60 * t2;
+    t4 = t17 + t7;
+    t11 = (-C60) * t18;
+    t12 = C59 * t2;
+    t3 = t11 + t12;
+    t1 = X[164];
+    t6 = X[75];
+    t17 = C61 * t1;
+    t7 = C62 * t6;
+    t18 = t17 + t7;
+    t2 = (-C62) * t1;
+    t11 = C61 * t6;
+    t12 = t2 + t11;
+    t17 = X[194];
+    t7 = X[45];
+    t1 = C63 * t17;
+    t6 = C64 * t7;
+    t2 = t1 + t6;
+    t11 = (-C64) * t17;
+    t1 = C63 * t7;
+    t6 = t11 + t1;
+    t17 = t13 + t10;
+    t7 = t15 + t14;
+    t11 = t19 + t18;
+    t1 = t0 + t12;
+    t13 = t13 - t10;
+    t10 = t15 - t14;
+    t15 = t19 - t18;
+    t14 = t0 - t12;
+    t19 = t17 + t11;
+    t18 = t7 + t1;
+    t0 = t13 + t14;
+    t12 = t10 - t15;
+    t17 = t17 - t11;
+    t11 = t7 - t1;
+    t7 = t13 - t14;
+    t1 = t10 + t15;
+    t13 = t5 + t4;
+    t14 = t8 + t3;
+    t10 = t9 + t2;
+    t15 = t16 + t6;
+    t5 = t5 - t4;
+    t4 = t8 - t3;
+    t8 = t9 - t2;
+    t3 = t16 - t6;
+    t9 = t13 + t10;
+    t2 = t14 + t15;
+    t16 = t5 + t3;
+    t6 = t4 - t8;
+    t13 = t13 - t10;
+    t10 = t14 - t15;
+    t14 = t5 - t3;
+    t15 = t4 + t8;
+    t5 = t16 + t6;
+    t3 = t16 - t6;
+    t4 = C16 * t5;
+    t8 = (-C16) * t3;
+    t16 = t14 - t15;
+    t6 = t14 + t15;
+    t5 = (-C16) * t16;
+    t3 = (-C16) * t6;
+    t14 = t19 - t9;
+    t15 = t18 - t2;
+    t16 = t19 + t9;
+    t6 = t18 + t2;
+    t19 = t0 - t4;
+    t9 = t12 - t8;
+    t18 = t0 + t4;
+    t2 = t12 + t8;
+    t0 = t17 - t10;
+    t4 = t11 + t13;
+    t12 = t17 + t10;
+    t8 = t11 - t13;
+    t17 = t7 - t5;
+    t10 = t1 - t3;
+    t11 = t7 + t5;
+    t13 = t1 + t3;
+    re[112] = t16;
+    im[112] = t6;
+    re[7] = t18;
+    im[7] = t2;
+    re[22] = t12;
+    im[22] = t8;
+    re[37] = t11;
+    im[37] = t13;
+    re[52] = t14;
+    im[52] = t15;
+    re[67] = t19;
+    im[67] = t9;
+    re[82] = t0;
+    im[82] = t4;
+    re[97] = t17;
+    im[97] = t10;
+    t7 = X[32];
+    t5 = X[207];
+    t1 = C65 * t7;
+    t3 = C66 * t5;
+    t16 = t1 + t3;
+    t6 = (-C66) * t7;
+    t18 = C65 * t5;
+    t2 = t6 + t18;
+    t12 = X[62];
+    t8 = X[177];
+    t11 = C67 * t12;
+    t13 = C68 * t8;
+    t14 = t11 + t13;
+    t15 = (-C68) * t12;
+    t19 = C67 * t8;
+    t9 = t15 + t19;
+    t0 = X[92];
+    t4 = X[147];
+    t17 = C69 * t0;
+    t10 = C70 * t4;
+    t1 = t17 + t10;
+    t3 = (-C70) * t0;
+    t7 = C69 * t4;
+    t5 = t3 + t7;
+    t6 = X[122];
+    t18 = X[117];
+    t11 = C71 * t6;
+    t13 = C72 * t18;
+    t12 = t11 + t13;
+    t8 = (-C72) * t6;
+    t15 = C71 * t18;
+    t19 = t8 + t15;
+    t17 = X[152];
+    t10 = X[87];
+    t0 = C73 * t17;
+    t4 = C74 * t10;
+    t3 = t0 + t4;
+    t7 = (-C74) * t17;
+    t11 = C73 * t10;
+    t13 = t7 + t11;
+    t6 = X[182];
+    t18 = X[57];
+    t8 = C75 * t6;
+    t15 = C76 * t18;
+    t0 = t8 + t15;
+    t4 = (-C76) * t6;
+    t17 = C75 * t18;
+    t10 = t4 + t17;
+    t7 = X[212];
+    t11 = X[27];
+    t8 = C77 * t7;
+    t15 = C78 * t11;
+    t6 = t8 + t15;
+    t18 = (-C78) * t7;
+    t4 = C77 * t11;
+    t17 = t18 + t4;
+    t8 = X[2];
+    t15 = X[237];
+    t7 = C79 * t8;
+    t11 = C80 * t15;
+    t18 = t7 + t11;
+    t4 = (-C80) * t8;
+    t7 = C79 * t15;
+    t11 = t4 + t7;
+    t8 = t16 + t3;
+    t15 = t2 + t13;
+    t4 = t1 + t6;
+    t7 = t5 + t17;
+    t16 = t16 - t3;
+    t3 = t2 - t13;
+    t2 = t1 - t6;
+    t13 = t5 - t17;
+    t1 = t8 + t4;
+    t6 = t15 + t7;
+    t5 = t16 + t13;
+    t17 = t3 - t2;
+    t8 = t8 - t4;
+    t4 = t15 - t7;
+    t15 = t16 - t13;
+    t7 = t3 + t2;
+    t16 = t14 + t0;
+    t13 = t9 + t10;
+    t3 = t12 + t18;
+    t2 = t19 + t11;
+    t14 = t14 - t0;
+    t0 = t9 - t10;
+    t9 = t12 - t18;
+    t10 = t19 - t11;
+    t12 = t16 + t3;
+    t18 = t13 + t2;
+    t19 = t14 + t10;
+    t11 = t0 - t9;
+    t16 = t16 - t3;
+    t3 = t13 - t2;
+    t13 = t14 - t10;
+    t2 = t0 + t9;
+    t14 = t19 + t11;
+    t10 = t19 - t11;
+    t0 = C16 * t14;
+    t9 = (-C16) * t10;
+    t19 = t13 - t2;
+    t11 = t13 + t2;
+    t14 = (-C16) * t19;
+    t10 = (-C16) * t11;
+    t13 = t1 - t12;
+    t2 = t6 - t18;
+    t19 = t1 + t12;
+    t11 = t6 + t18;
+    t1 = t5 - t0;
+    t12 = t17 - t9;
+    t6 = t5 + t0;
+    t18 = t17 + t9;
+    t5 = t8 - t3;
+    t0 = t4 + t16;
+    t17 = t8 + t3;
+    t9 = t4 - t16;
+    t8 = t15 - t14;
+    t3 = t7 - t10;
+    t4 = t15 + t14;
+    t16 = t7 + t10;
+    re[16] = t19;
+    im[16] = t11;
+    re[31] = t6;
+    im[31] = t18;
+    re[46] = t17;
+    im[46] = t9;
+    re[61] = t4;
+    im[61] = t16;
+    re[76] = t13;
+    im[76] = t2;
+    re[91] = t1;
+    im[91] = t12;
+    re[106] = t5;
+    im[106] = t0;
+    re[1] = t8;
+    im[1] = t3;
+    t15 = re[40];
+    t14 = im[40];
+    t7 = re[64];
+    t10 = im[64];
+    t19 = re[88];
+    t11 = im[88];
+    t6 = re[112];
+    t18 = im[112];
+    t17 = re[16];
+    t9 = im[16];
+    t4 = t7 + t17;
+    t16 = t10 + t9;
+    t13 = t19 + t6;
+    t2 = t11 + t18;
+    t1 = t7 - t17;
+    t12 = t10 - t9;
+    t5 = t19 - t6;
+    t0 = t11 - t18;
+    t8 = t4 + t13;
+    t3 = t16 + t2;
+    t7 = t4 - t13;
+    t17 = C81 * t7;
+    t10 = t16 - t2;
+    t9 = C81 * t10;
+    t19 = C82 * t8;
+    t6 = t15 - t19;
+    t11 = C82 * t3;
+    t18 = t14 - t11;
+    t4 = t6 + t17;
+    t13 = t18 + t9;
+    t7 = t6 - t17;
+    t16 = t18 - t9;
+    t2 = C83 * t1;
+    t10 = C84 * t5;
+    t19 = t2 + t10;
+    t11 = C83 * t12;
+    t6 = C84 * t0;
+    t17 = t11 + t6;
+    t18 = C84 * t1;
+    t9 = C83 * t5;
+    t2 = t18 - t9;
+    t10 = C84 * t12;
+    t11 = C83 * t0;
+    t6 = t10 - t11;
+    t1 = t15 + t8;
+    t5 = t14 + t3;
+    t18 = t4 + t17;
+    t9 = t13 - t19;
+    t12 = t7 + t6;
+    t0 = t16 - t2;
+    t10 = t7 - t6;
+    t11 = t16 + t2;
+    t15 = t4 - t17;
+    t8 = t13 + t19;
+    re[40] = t1;
+    im[40] = t5;
+    re[64] = t18;
+    im[64] = t9;
+    re[88] = t12;
+    im[88] = t0;
+    re[112] = t10;
+    im[112] = t11;
+    re[16] = t15;
+    im[16] = t8;
+    t14 = re[55];
+    t3 = im[55];
+    t7 = re[79];
+    t6 = im[79];
+    t16 = re[103];
+    t2 = im[103];
+    t4 = re[7];
+    t17 = im[7];
+    t13 = re[31];
+    t19 = im[31];
+    t1 = t7 + t13;
+    t5 = t6 + t19;
+    t18 = t16 + t4;
+    t9 = t2 + t17;
+    t12 = t7 - t13;
+    t0 = t6 - t19;
+    t10 = t16 - t4;
+    t11 = t2 - t17;
+    t15 = t1 + t18;
+    t8 = t5 + t9;
+    t7 = t1 - t18;
+    t13 = C81 * t7;
+    t6 = t5 - t9;
+    t19 = C81 * t6;
+    t16 = C82 * t15;
+    t4 = t14 - t16;
+    t2 = C82 * t8;
+    t17 = t3 - t2;
+    t1 = t4 + t13;
+    t18 = t17 + t19;
+    t7 = t4 - t13;
+    t5 = t17 - t19;
+    t9 = C83 * t12;
+    t6 = C84 * t10;
+    t16 = t9 + t6;
+    t2 = C83 * t0;
+    t4 = C84 * t11;
+    t13 = t2 + t4;
+    t17 = C84 * t12;
+    t19 = C83 * t10;
+    t9 = t17 - t19;
+    t6 = C84 * t0;
+    t2 = C83 * t11;
+    t4 = t6 - t2;
+    t12 = t14 + t15;
+    t10 = t3 + t8;
+    t17 = t1 + t13;
+    t19 = t18 - t16;
+    t0 = t7 + t4;
+    t11 = t5 - t9;
+    t6 = t7 - t4;
+    t2 = t5 + t9;
+    t14 = t1 - t13;
+    t15 = t18 + t16;
+    re[55] = t12;
+    im[55] = t10;
+    re[79] = t17;
+    im[79] = t19;
+    re[103] = t0;
+    im[103] = t11;
+    re[7] = t6;
+    im[7] = t2;
+    re[31] = t14;
+    im[31] = t15;
+    t3 = re[70];
+    t8 = im[70];
+    t7 = re[94];
+    t4 = im[94];
+    t5 = re[118];
+    t9 = im[118];
+    t1 = re[22];
+    t13 = im[22];
+    t18 = re[46];
+    t16 = im[46];
+    t12 = t7 + t18;
+    t10 = t4 + t16;
+    t17 = t5 + t1;
+    t19 = t9 + t13;
+    t0 = t7 - t18;
+    t11 = t4 - t16;
+    t6 = t5 - t1;
+    t2 = t9 - t13;
+    t14 = t12 + t17;
+    t15 = t10 + t19;
+    t7 = t12 - t17;
+    t18 = C81 * t7;
+    t4 = t10 - t19;
+    t16 = C81 * t4;
+    t5 = C82 * t14;
+    t1 = t3 - t5;
+    t9 = C82 * t15;
+    t13 = t8 - t9;
+    t12 = t1 + t18;
+    t17 = t13 + t16;
+    t7 = t1 - t18;
+    t10 = t13 - t16;
+    t19 = C83 * t0;
+    t4 = C84 * t6;
+    t5 = t19 + t4;
+    t9 = C83 * t11;
+    t1 = C84 * t2;
+    t18 = t9 + t1;
+    t13 = C84 * t0;
+    t16 = C83 * t6;
+    t19 = t13 - t16;
+    t4 = C84 * t11;
+    t9 = C83 * t2;
+    t1 = t4 - t9;
+    t0 = t3 + t14;
+    t6 = t8 + t15;
+    t13 = t12 + t18;
+    t16 = t17 - t5;
+    t11 = t7 + t1;
+    t2 = t10 - t19;
+    t4 = t7 - t1;
+    t9 = t10 + t19;
+    t3 = t12 - t18;
+    t14 = t17 + t5;
+    re[70] = t0;
+    im[70] = t6;
+    re[94] = t13;
+    im[94] = t16;
+    re[118] = t11;
+    im[118] = t2;
+    re[22] = t4;
+    im[22] = t9;
+    re[46] = t3;
+    im[46] = t14;
+    t8 = re[85];
+    t15 = im[85];
+    t7 = re[109];
+    t1 = im[109];
+    t10 = re[13];
+    t19 = im[13];
+    t12 = re[37];
+    t18 = im[37];
+    t17 = re[61];
+    t5 = im[61];
+    t0 = t7 + t17;
+    t6 = t1 + t5;
+    t13 = t10 + t12;
+    t16 = t19 + t18;
+    t11 = t7 - t17;
+    t2 = t1 - t5;
+    t4 = t10 - t12;
+    t9 = t19 - t18;
+    t3 = t0 + t13;
+    t14 = t6 + t16;
+    t7 = t0 - t13;
+    t17 = C81 * t7;
+    t1 = t6 - t16;
+    t5 = C81 * t1;
+    t10 = C82 * t3;
+    t12 = t8 - t10;
+    t19 = C82 * t14;
+    t18 = t15 - t19;
+    t0 = t12 + t17;
+    t13 = t18 + t5;
+    t7 = t12 - t17;
+    t6 = t18 - t5;
+    t16 = C83 * t11;
+    t1 = C84 * t4;
+    t10 = t16 + t1;
+    t19 = C83 * t2;
+    t12 = C84 * t9;
+    t17 = t19 + t12;
+    t18 = C84 * t11;
+    t5 = C83 * t4;
+    t16 = t18 - t5;
+    t1 = C84 * t2;
+    t19 = C83 * t9;
+    t12 = t1 - t19;
+    t11 = t8 + t3;
+    t4 = t15 + t14;
+    t18 = t0 + t17;
+    t5 = t13 - t10;
+    t2 = t7 + t12;
+    t9 = t6 - t16;
+    t1 = t7 - t12;
+    t19 = t6 + t16;
+    t8 = t0 - t17;
+    t3 = t13 + t10;
+    re[85] = t11;
+    im[85] = t4;
+    re[109] = t18;
+    im[109] = t5;
+    re[13] = t2;
+    im[13] = t9;
+    re[37] = t1;
+    im[37] = t19;
+    re[61] = t8;
+    im[61] = t3;
+    t15 = re[100];
+    t14 = im[100];
+    t7 = re[4];
+    t12 = im[4];
+    t6 = re[28];
+    t16 = im[28];
+    t0 = re[52];
+    t17 = im[52];
+    t13 = re[76];
+    t10 = im[76];
+    t11 = t7 + t13;
+    t4 = t12 + t10;
+    t18 = t6 + t0;
+    t5 = t16 + t17;
+    t2 = t7 - t13;
+    t9 = t12 - t10;
+    t1 = t6 - t0;
+    t19 = t16 - t17;
+    t8 = t11 + t18;
+    t3 = t4 + t5;
+    t7 = t11 - t18;
+    t13 = C81 * t7;
+    t12 = t4 - t5;
+    t10 = C81 * t12;
+    t6 = C82 * t8;
+    t0 = t15 - t6;
+    t16 = C82 * t3;
+    t17 = t14 - t16;
+    t11 = t0 + t13;
+    t18 = t17 + t10;
+    t7 = t0 - t13;
+    t4 = t17 - t10;
+    t5 = C83 * t2;
+    t12 = C84 * t1;
+    t6 = t5 + t12;
+    t16 = C83 * t9;
+    t0 = C84 * t19;
+    t13 = t16 + t0;
+    t17 = C84 * t2;
+    t10 = C83 * t1;
+    t5 = t17 - t10;
+    t12 = C84 * t9;
+    t16 = C83 * t19;
+    t0 = t12 - t16;
+    t2 = t15 + t8;
+    t1 = t14 + t3;
+    t17 = t11 + t13;
+    t10 = t18 - t6;
+    t9 = t7 + t0;
+    t19 = t4 - t5;
+    t12 = t7 - t0;
+    t16 = t4 + t5;
+    t15 = t11 - t13;
+    t8 = t18 + t6;
+    re[100] = t2;
+    im[100] = t1;
+    re[4] = t17;
+    im[4] = t10;
+    re[28] = t9;
+    im[28] = t19;
+    re[52] = t12;
+    im[52] = t16;
+    re[76] = t15;
+    im[76] = t8;
+    t14 = re[115];
+    t3 = im[115];
+    t7 = re[19];
+    t0 = im[19];
+    t4 = re[43];
+    t5 = im[43];
+    t11 = re[67];
+    t13 = im[67];
+    t18 = re[91];
+    t6 = im[91];
+    t2 = t7 + t18;
+    t1 = t0 + t6;
+    t17 = t4 + t11;
+    t10 = t5 + t13;
+    t9 = t7 - t18;
+    t19 = t0 - t6;
+    t12 = t4 - t11;
+    t16 = t5 - t13;
+    t15 = t2 + t17;
+    t8 = t1 + t10;
+    t7 = t2 - t17;
+    t18 = C81 * t7;
+    t0 = t1 - t10;
+    t6 = C81 * t0;
+    t4 = C82 * t15;
+    t11 = t14 - t4;
+    t5 = C82 * t8;
+    t13 = t3 - t5;
+    t2 = t11 + t18;
+    t17 = t13 + t6;
+    t7 = t11 - t18;
+    t1 = t13 - t6;
+    t10 = C83 * t9;
+    t0 = C84 * t12;
+    t4 = t10 + t0;
+    t5 = C83 * t19;
+    t11 = C84 * t16;
+    t18 = t5 + t11;
+    t13 = C84 * t9;
+    t6 = C83 * t12;
+    t10 = t13 - t6;
+    t0 = C84 * t19;
+    t5 = C83 * t16;
+    t11 = t0 - t5;
+    t9 = t14 + t15;
+    t12 = t3 + t8;
+    t13 = t2 + t18;
+    t6 = t17 - t4;
+    t19 = t7 + t11;
+    t16 = t1 - t10;
+    t0 = t7 - t11;
+    t5 = t1 + t10;
+    t14 = t2 - t18;
+    t15 = t17 + t4;
+    re[115] = t9;
+    im[115] = t12;
+    re[19] = t13;
+    im[19] = t6;
+    re[43] = t19;
+    im[43] = t16;
+    re[67] = t0;
+    im[67] = t5;
+    re[91] = t14;
+    im[91] = t15;
+    t3 = re[10];
+    t8 = im[10];
+    t7 = re[34];
+    t11 = im[34];
+    t1 = re[58];
+    t10 = im[58];
+    t2 = re[82];
+    t18 = im[82];
+    t17 = re[106];
+    t4 = im[106];
+    t9 = t7 + t17;
+    t12 = t11 + t4;
+    t13 = t1 + t2;
+    t6 = t10 + t18;
+    t19 = t7 - t17;
+    t16 = t11 - t4;
+    t0 = t1 - t2;
+    t5 = t10 - t18;
+    t14 = t9 + t13;
+    t15 = t12 + t6;
+    t7 = t9 - t13;
+    t17 = C81 * t7;
+    t11 = t12 - t6;
+    t4 = C81 * t11;
+    t1 = C82 * t14;
+    t2 = t3 - t1;
+    t10 = C82 * t15;
+    t18 = t8 - t10;
+    t9 = t2 + t17;
+    t13 = t18 + t4;
+    t7 = t2 - t17;
+    t12 = t18 - t4;
+    t6 = C83 * t19;
+    t11 = C84 * t0;
+    t1 = t6 + t11;
+    t10 = C83 * t16;
+    t2 = C84 * t5;
+    t17 = t10 + t2;
+    t18 = C84 * t19;
+    t4 = C83 * t0;
+    t6 = t18 - t4;
+    t11 = C84 * t16;
+    t10 = C83 * t5;
+    t2 = t11 - t10;
+    t19 = t3 + t14;
+    t0 = t8 + t15;
+    t18 = t9 + t17;
+    t4 = t13 - t1;
+    t16 = t7 + t2;
+    t5 = t12 - t6;
+    t11 = t7 - t2;
+    t10 = t12 + t6;
+    t3 = t9 - t17;
+    t14 = t13 + t1;
+    re[10] = t19;
+    im[10] = t0;
+    re[34] = t18;
+    im[34] = t4;
+    re[58] = t16;
+    im[58] = t5;
+    re[82] = t11;
+    im[82] = t10;
+    re[106] = t3;
+    im[106] = t14;
+    t8 = re[25];
+    t15 = im[25];
+    t7 = re[49];
+    t2 = im[49];
+    t12 = re[73];
+    t6 = im[73];
+    t9 = re[97];
+    t17 = im[97];
+    t13 = re[1];
+    t1 = im[1];
+    t19 = t7 + t13;
+    t0 = t2 + t1;
+    t18 = t12 + t9;
+    t4 = t6 + t17;
+    t16 = t7 - t13;
+    t5 = t2 - t1;
+    t11 = t12 - t9;
+    t10 = t6 - t17;
+    t3 = t19 + t18;
+    t14 = t0 + t4;
+    t7 = t19 - t18;
+    t13 = C81 * t7;
+    t2 = t0 - t4;
+    t1 = C81 * t2;
+    t12 = C82 * t3;
+    t9 = t8 - t12;
+    t6 = C82 * t14;
+    t17 = t15 - t6;
+    t19 = t9 + t13;
+    t18 = t17 + t1;
+    t7 = t9 - t13;
+    t0 = t17 - t1;
+    t4 = C83 * t16;
+    t2 = C84 * t11;
+    t12 = t4 + t2;
+    t6 = C83 * t5;
+    t9 = C84 * t10;
+    t13 = t6 + t9;
+    t17 = C84 * t16;
+    t1 = C83 * t11;
+    t4 = t17 - t1;
+    t2 = C84 * t5;
+    t6 = C83 * t10;
+    t9 = t2 - t6;
+    t16 = t8 + t3;
+    t11 = t15 + t14;
+    t17 = t19 + t13;
+    t1 = t18 - t12;
+    t5 = t7 + t9;
+    t10 = t0 - t4;
+    t2 = t7 - t9;
+    t6 = t0 + t4;
+    t8 = t19 - t13;
+    t3 = t18 + t12;
+    re[25] = t16;
+    im[25] = t11;
+    re[49] = t17;
+    im[49] = t1;
+    re[73] = t5;
+    im[73] = t10;
+    re[97] = t2;
+    im[97] = t6;
+    re[1] = t8;
+    im[1] = t3;
+}
+
+/**
+ *  Part 3 of ApplyWindowedIMDCT_W10_240().
+ * 
+ *  @param {Number[]} X 
+ *    - The input block (240 points).
+ *  @param {Number[]} y 
+ *    - The array that would contain the output block (480 points).
+ *  @param {Number[]} re 
+ *    - The scratch buffer (real part, 120 points).
+ *  @param {Number[]} im 
+ *    - The scratch buffer (imaginary part, 120 points).
+ */
+function ApplyWindowedIMDCT_W10_240_Part3(X, y, re, im) {
+    let t0, t1, t10, t11, t12, t13, t14, t15, t16, t17, t18, t19, t2, t3, t4, t5, t6, t7, t8, t9;
+    const C0 = 0.49999999999999994;
+    const C1 = 0.8660254037844387;
+    const C2 = 0.3214394653031616;
+    const C3 = 0.9469301294951057;
+    const C4 = 0.13052619222005157;
+    const C5 = 0.9914448613738104;
+    const C6 = 0.9978589232386035;
+    const C7 = 0.06540312923014306;
+    const C8 = 0.9659258262890683;
+    const C9 = 0.25881904510252074;
+    const C10 = 0.8968727415326883;
+    const C11 = 0.4422886902190013;
+    const C12 = 0.7933533402912352;
+    const C13 = 0.6087614290087207;
+    const C14 = 0.6593458151000688;
+    const C15 = 0.7518398074789774;
+    const C16 = 0.7071067811865476;
+    const C17 = 0.20791169081775931;
+    const C18 = 0.9781476007338057;
+    const C19 = 0.01308959557134444;
+    const C20 = 0.999914327574007;
+    const C21 = 0.9832549075639546;
+    const C22 = 0.18223552549214747;
+    const C23 = 0.9288095528719242;
+    const C24 = 0.3705574375098362;
+    const C25 = 0.838670567945424;
+    const C26 = 0.544639035015027;
+    const C27 = 0.7163019434246544;
+    const C28 = 0.6977904598416801;
+    const C29 = 0.5664062369248328;
+    const C30 = 0.8241261886220156;
+    const C31 = 0.39474385638426723;
+    const C32 = 0.9187912101488983;
+    const C33 = 0.9945218953682733;
+    const C34 = 0.10452846326765346;
+    const C35 = 0.9550199444571866;
+    const C36 = 0.296541574975571;
+    const C37 = 0.8788171126619654;
+    const C38 = 0.4771587602596084;
+    const C39 = 0.7688418320734596;
+    const C40 = 0.6394390019805847;
+    const C41 = 0.6293203910498375;
+    const C42 = 0.7771459614569709;
+    const C43 = 0.4656145203251114;
+    const C44 = 0.8849876374630419;
+    const C45 = 0.2840153447039226;
+    const C46 = 0.958819734868193;
+    const C47 = 0.09150161866340238;
+    const C48 = 0.9958049275746618;
+    const C49 = 0.9135454576426009;
+    const C50 = 0.40673664307580015;
+    const C51 = 0.8166415551616789;
+    const C52 = 0.5771451900372336;
+    const C53 = 0.6883545756937539;
+    const C54 = 0.7253743710122876;
+    const C55 = 0.5336145159156115;
+    const C56 = 0.8457278217039733;
+    const C57 = 0.35836794954530027;
+    const C58 = 0.9335804264972017;
+    const C59 = 0.1693495038490246;
+    const C60 = 0.9855560590580777;
+    const C61 = 0.9996573249755573;
+    const C62 = 0.02617694830787315;
+    const C63 = 0.9753423205085127;
+    const C64 = 0.22069743502150108;
+    const C65 = 0.7431448254773942;
+    const C66 = 0.6691306063588582;
+    const C67 = 0.598324600570659;
+    const C68 = 0.8012538126910607;
+    const C69 = 0.4305110968082951;
+    const C70 = 0.9025852843498606;
+    const C71 = 0.24615329302899303;
+    const C72 = 0.9692309097067544;
+    const C73 = 0.05233595624294383;
+    const C74 = 0.9986295347545738;
+    const C75 = 0.9896513868196702;
+    const C76 = 0.1434926219911793;
+    const C77 = 0.9426414910921784;
+    const C78 = 0.33380685923377096;
+    const C79 = 0.8594064115014527;
+    const C80 = 0.5112930860770522;
+    const C81 = 0.5590169943749475;
+    const C82 = 0.25;
+    const C83 = 0.9510565162951535;
+    const C84 = 0.5877852522924731;
+    const C85 = 0.5;
+    const C86 = 0.8660254037844386;
+    const C87 = 0.9999946454016965;
+    const C88 = 0.003272486506526625;
+    const C89 = 0.8643845233130174;
+    const C90 = 0.5028313791490421;
+    const C91 = 0.4971632662526543;
+    const C92 = 0.8676570098195441;
+    const C93 = 0.48576339371634003;
+    const C94 = 0.8740903416267589;
+    const C95 = 0.9998661379095618;
+    const C96 = 0.01636173162648678;
+    const C97 = 0.8577286100002721;
+    const C98 = 0.5141027441932217;
+    const C99 = 0.8509257293058021;
+    const C100 = 0.525286020378792;
+    const C101 = 0.4742802881232292;
+    const C102 = 0.8803739025537654;
+    const C103 = 0.9995663085020212;
+    const C104 = 0.02944817324796316;
+    const C105 = 0.9990952085533004;
+    const C106 = 0.04252956907655312;
+    const C107 = 0.8439770468681933;
+    const C108 = 0.5363792915089503;
+    const C109 = 0.4627159170443501;
+    const C110 = 0.8865066159447464;
+    const C111 = 0.4510722619751534;
+    const C112 = 0.8924874309908339;
+    const C113 = 0.99845291878395;
+    const C114 = 0.055603677682424614;
+    const C115 = 0.8368837533084093;
+    const C116 = 0.5473806568087966;
+    const C117 = 0.8296470640257853;
+    const C118 = 0.558288231251022;
+    const C119 = 0.4393513179959937;
+    const C120 = 0.898315322910159;
+    const C121 = 0.9976395492470157;
+    const C122 = 0.06866825888437376;
+    const C123 = 0.9966552393091803;
+    const C124 = 0.08172107413366822;
+    const C125 = 0.8222682189897751;
+    const C126 = 0.5691001458788982;
+    const C127 = 0.4275550934302821;
+    const C128 = 0.9039892931234433;
+    const C129 = 0.4156856095003708;
+    const C130 = 0.9095083694251006;
+    const C131 = 0.9955001576268845;
+    const C132 = 0.09475988689761111;
+    const C133 = 0.8147484825274894;
+    const C134 = 0.5798145481265136;
+    const C135 = 0.8070891431070594;
+    const C136 = 0.5904296021362011;
+    const C137 = 0.4037448999812271;
+    const C138 = 0.9148716061498187;
+    const C139 = 0.9941745021174282;
+    const C140 = 0.10778246304275935;
+    const C141 = 0.9926784999250583;
+    const C142 = 0.12078657121773083;
+    const C143 = 0.7992915131168641;
+    const C144 = 0.6009434890731024;
+    const C145 = 0.3917350108519559;
+    const C146 = 0.9200780843345949;
+    const C147 = 0.37965799994523275;
+    const C148 = 0.9251269118761953;
+    const C149 = 0.9910124073820492;
+    const C150 = 0.13376998323553513;
+    const C151 = 0.7913569286406602;
+    const C152 = 0.6113544074368165;
+    const C153 = 0.7832867492286504;
+    const C154 = 0.6216605733700774;
+    const C155 = 0.36751593659470355;
+    const C156 = 0.9300172236840121;
+    const C157 = 0.989176509964781;
+    const C158 = 0.14673047445536175;
+    const C159 = 0.9871711222448248;
+    const C160 = 0.159665824163761;
+    const C161 = 0.7750823576645314;
+    const C162 = 0.6318602209644087;
+    const C163 = 0.3553109012804161;
+    const C164 = 0.9347481818282924;
+    t15 = X[160];
+    t14 = X[79];
+    t7 = C0 * t15;
+    t9 = C1 * t14;
+    t0 = t7 + t9;
+    t4 = (-C1) * t15;
+    t19 = C0 * t14;
+    t13 = t4 + t19;
+    t18 = X[190];
+    t12 = X[49];
+    t16 = C2 * t18;
+    t11 = C3 * t12;
+    t17 = t16 + t11;
+    t1 = (-C3) * t18;
+    t5 = C2 * t12;
+    t10 = t1 + t5;
+    t2 = X[220];
+    t6 = X[19];
+    t8 = C4 * t2;
+    t3 = C5 * t6;
+    t7 = t8 + t3;
+    t9 = (-C5) * t2;
+    t15 = C4 * t6;
+    t14 = t9 + t15;
+    t4 = X[10];
+    t19 = X[229];
+    t16 = C6 * t4;
+    t11 = C7 * t19;
+    t18 = t16 + t11;
+    t12 = (-C7) * t4;
+    t1 = C6 * t19;
+    t5 = t12 + t1;
+    t8 = X[40];
+    t3 = X[199];
+    t2 = C8 * t8;
+    t6 = C9 * t3;
+    t9 = t2 + t6;
+    t15 = (-C9) * t8;
+    t16 = C8 * t3;
+    t11 = t15 + t16;
+    t4 = X[70];
+    t19 = X[169];
+    t12 = C10 * t4;
+    t1 = C11 * t19;
+    t2 = t12 + t1;
+    t6 = (-C11) * t4;
+    t8 = C10 * t19;
+    t3 = t6 + t8;
+    t15 = X[100];
+    t16 = X[139];
+    t12 = C12 * t15;
+    t1 = C13 * t16;
+    t4 = t12 + t1;
+    t19 = (-C13) * t15;
+    t6 = C12 * t16;
+    t8 = t19 + t6;
+    t12 = X[130];
+    t1 = X[109];
+    t15 = C14 * t12;
+    t16 = C15 * t1;
+    t19 = t15 + t16;
+    t6 = (-C15) * t12;
+    t15 = C14 * t1;
+    t16 = t6 + t15;
+    t12 = t0 + t9;
+    t1 = t13 + t11;
+    t6 = t7 + t4;
+    t15 = t14 + t8;
+    t0 = t0 - t9;
+    t9 = t13 - t11;
+    t13 = t7 - t4;
+    t11 = t14 - t8;
+    t7 = t12 + t6;
+    t4 = t1 + t15;
+    t14 = t0 + t11;
+    t8 = t9 - t13;
+    t12 = t12 - t6;
+    t6 = t1 - t15;
+    t1 = t0 - t11;
+    t15 = t9 + t13;
+    t0 = t17 + t2;
+    t11 = t10 + t3;
+    t9 = t18 + t19;
+    t13 = t5 + t16;
+    t17 = t17 - t2;
+    t2 = t10 - t3;
+    t10 = t18 - t19;
+    t3 = t5 - t16;
+    t18 = t0 + t9;
+    t19 = t11 + t13;
+    t5 = t17 + t3;
+    t16 = t2 - t10;
+    t0 = t0 - t9;
+    t9 = t11 - t13;
+    t11 = t17 - t3;
+    t13 = t2 + t10;
+    t17 = t5 + t16;
+    t3 = t5 - t16;
+    t2 = C16 * t17;
+    t10 = (-C16) * t3;
+    t5 = t11 - t13;
+    t16 = t11 + t13;
+    t17 = (-C16) * t5;
+    t3 = (-C16) * t16;
+    t11 = t7 - t18;
+    t13 = t4 - t19;
+    t5 = t7 + t18;
+    t16 = t4 + t19;
+    t7 = t14 - t2;
+    t18 = t8 - t10;
+    t4 = t14 + t2;
+    t19 = t8 + t10;
+    t14 = t12 - t9;
+    t2 = t6 + t0;
+    t8 = t12 + t9;
+    t10 = t6 - t0;
+    t12 = t1 - t17;
+    t9 = t15 - t3;
+    t6 = t1 + t17;
+    t0 = t15 + t3;
+    re[80] = t5;
+    im[80] = t16;
+    re[95] = t4;
+    im[95] = t19;
+    re[110] = t8;
+    im[110] = t10;
+    re[5] = t6;
+    im[5] = t0;
+    re[20] = t11;
+    im[20] = t13;
+    re[35] = t7;
+    im[35] = t18;
+    re[50] = t14;
+    im[50] = t2;
+    re[65] = t12;
+    im[65] = t9;
+    t1 = X[208];
+    t17 = X[31];
+    t15 = C17 * t1;
+    t3 = C18 * t17;
+    t5 = t15 + t3;
+    t16 = (-C18) * t1;
+    t4 = C17 * t17;
+    t19 = t16 + t4;
+    t8 = X[238];
+    t10 = X[1];
+    t6 = C19 * t8;
+    t0 = C20 * t10;
+    t11 = t6 + t0;
+    t13 = (-C20) * t8;
+    t7 = C19 * t10;
+    t18 = t13 + t7;
+    t14 = X[28];
+    t2 = X[211];
+    t12 = C21 * t14;
+    t9 = C22 * t2;
+    t15 = t12 + t9;
+    t3 = (-C22) * t14;
+    t1 = C21 * t2;
+    t17 = t3 + t1;
+    t16 = X[58];
+    t4 = X[181];
+    t6 = C23 * t16;
+    t0 = C24 * t4;
+    t8 = t6 + t0;
+    t10 = (-C24) * t16;
+    t13 = C23 * t4;
+    t7 = t10 + t13;
+    t12 = X[88];
+    t9 = X[151];
+    t14 = C25 * t12;
+    t2 = C26 * t9;
+    t3 = t14 + t2;
+    t1 = (-C26) * t12;
+    t6 = C25 * t9;
+    t0 = t1 + t6;
+    t16 = X[118];
+    t4 = X[121];
+    t10 = C27 * t16;
+    t13 = C28 * t4;
+    t14 = t10 + t13;
+    t2 = (-C28) * t16;
+    t12 = C27 * t4;
+    t9 = t2 + t12;
+    t1 = X[148];
+    t6 = X[91];
+    t10 = C29 * t1;
+    t13 = C30 * t6;
+    t16 = t10 + t13;
+    t4 = (-C30) * t1;
+    t2 = C29 * t6;
+    t12 = t4 + t2;
+    t10 = X[178];
+    t13 = X[61];
+    t1 = C31 * t10;
+    t6 = C32 * t13;
+    t4 = t1 + t6;
+    t2 = (-C32) * t10;
+    t1 = C31 * t13;
+    t6 = t2 + t1;
+    t10 = t5 + t3;
+    t13 = t19 + t0;
+    t2 = t15 + t16;
+    t1 = t17 + t12;
+    t5 = t5 - t3;
+    t3 = t19 - t0;
+    t19 = t15 - t16;
+    t0 = t17 - t12;
+    t15 = t10 + t2;
+    t16 = t13 + t1;
+    t17 = t5 + t0;
+    t12 = t3 - t19;
+    t10 = t10 - t2;
+    t2 = t13 - t1;
+    t13 = t5 - t0;
+    t1 = t3 + t19;
+    t5 = t11 + t14;
+    t0 = t18 + t9;
+    t3 = t8 + t4;
+    t19 = t7 + t6;
+    t11 = t11 - t14;
+    t14 = t18 - t9;
+    t18 = t8 - t4;
+    t9 = t7 - t6;
+    t8 = t5 + t3;
+    t4 = t0 + t19;
+    t7 = t11 + t9;
+    t6 = t14 - t18;
+    t5 = t5 - t3;
+    t3 = t0 - t19;
+    t0 = t11 - t9;
+    t19 = t14 + t18;
+    t11 = t7 + t6;
+    t9 = t7 - t6;
+    t14 = C16 * t11;
+    t18 = (-C16) * t9;
+    t7 = t0 - t19;
+    t6 = t0 + t19;
+    t11 = (-C16) * t7;
+    t9 = (-C16) * t6;
+    t0 = t15 - t8;
+    t19 = t16 - t4;
+    t7 = t15 + t8;
+    t6 = t16 + t4;
+    t15 = t17 - t14;
+    t8 = t12 - t18;
+    t16 = t17 + t14;
+    t4 = t12 + t18;
+    t17 = t10 - t3;
+    t14 = t2 + t5;
+    t12 = t10 + t3;
+    t18 = t2 - t5;
+    t10 = t13 - t11;
+    t3 = t1 - t9;
+    t2 = t13 + t11;
+    t5 = t1 + t9;
+    re[104] = t7;
+    im[104] = t6;
+    re[119] = t16;
+    im[119] = t4;
+    re[14] = t12;
+    im[14] = t18;
+    re[29] = t2;
+    im[29] = t5;
+    re[44] = t0;
+    im[44] = t19;
+    re[59] = t15;
+    im[59] = t8;
+    re[74] = t17;
+    im[74] = t14;
+    re[89] = t10;
+    im[89] = t3;
+    t13 = X[16];
+    t11 = X[223];
+    t1 = C33 * t13;
+    t9 = C34 * t11;
+    t7 = t1 + t9;
+    t6 = (-C34) * t13;
+    t16 = C33 * t11;
+    t4 = t6 + t16;
+    t12 = X[46];
+    t18 = X[193];
+    t2 = C35 * t12;
+    t5 = C36 * t18;
+    t0 = t2 + t5;
+    t19 = (-C36) * t12;
+    t15 = C35 * t18;
+    t8 = t19 + t15;
+    t17 = X[76];
+    t14 = X[163];
+    t10 = C37 * t17;
+    t3 = C38 * t14;
+    t1 = t10 + t3;
+    t9 = (-C38) * t17;
+    t13 = C37 * t14;
+    t11 = t9 + t13;
+    t6 = X[106];
+    t16 = X[133];
+    t2 = C39 * t6;
+    t5 = C40 * t16;
+    t12 = t2 + t5;
+    t18 = (-C40) * t6;
+    t19 = C39 * t16;
+    t15 = t18 + t19;
+    t10 = X[136];
+    t3 = X[103];
+    t17 = C41 * t10;
+    t14 = C42 * t3;
+    t9 = t17 + t14;
+    t13 = (-C42) * t10;
+    t2 = C41 * t3;
+    t5 = t13 + t2;
+    t6 = X[166];
+    t16 = X[73];
+    t18 = C43 * t6;
+    t19 = C44 * t16;
+    t17 = t18 + t19;
+    t14 = (-C44) * t6;
+    t10 = C43 * t16;
+    t3 = t14 + t10;
+    t13 = X[196];
+    t2 = X[43];
+    t18 = C45 * t13;
+    t19 = C46 * t2;
+    t6 = t18 + t19;
+    t16 = (-C46) * t13;
+    t14 = C45 * t2;
+    t10 = t16 + t14;
+    t18 = X[226];
+    t19 = X[13];
+    t13 = C47 * t18;
+    t2 = C48 * t19;
+    t16 = t13 + t2;
+    t14 = (-C48) * t18;
+    t13 = C47 * t19;
+    t2 = t14 + t13;
+    t18 = t7 + t9;
+    t19 = t4 + t5;
+    t14 = t1 + t6;
+    t13 = t11 + t10;
+    t7 = t7 - t9;
+    t9 = t4 - t5;
+    t4 = t1 - t6;
+    t5 = t11 - t10;
+    t1 = t18 + t14;
+    t6 = t19 + t13;
+    t11 = t7 + t5;
+    t10 = t9 - t4;
+    t18 = t18 - t14;
+    t14 = t19 - t13;
+    t19 = t7 - t5;
+    t13 = t9 + t4;
+    t7 = t0 + t17;
+    t5 = t8 + t3;
+    t9 = t12 + t16;
+    t4 = t15 + t2;
+    t0 = t0 - t17;
+    t17 = t8 - t3;
+    t8 = t12 - t16;
+    t3 = t15 - t2;
+    t12 = t7 + t9;
+    t16 = t5 + t4;
+    t15 = t0 + t3;
+    t2 = t17 - t8;
+    t7 = t7 - t9;
+    t9 = t5 - t4;
+    t5 = t0 - t3;
+    t4 = t17 + t8;
+    t0 = t15 + t2;
+    t3 = t15 - t2;
+    t17 = C16 * t0;
+    t8 = (-C16) * t3;
+    t15 = t5 - t4;
+    t2 = t5 + t4;
+    t0 = (-C16) * t15;
+    t3 = (-C16) * t2;
+    t5 = t1 - t12;
+    t4 = t6 - t16;
+    t15 = t1 + t12;
+    t2 = t6 + t16;
+    t1 = t11 - t17;
+    t12 = t10 - t8;
+    t6 = t11 + t17;
+    t16 = t10 + t8;
+    t11 = t18 - t9;
+    t17 = t14 + t7;
+    t10 = t18 + t9;
+    t8 = t14 - t7;
+    t18 = t19 - t0;
+    t9 = t13 - t3;
+    t14 = t19 + t0;
+    t7 = t13 + t3;
+    re[8] = t15;
+    im[8] = t2;
+    re[23] = t6;
+    im[23] = t16;
+    re[38] = t10;
+    im[38] = t8;
+    re[53] = t14;
+    im[53] = t7;
+    re[68] = t5;
+    im[68] = t4;
+    re[83] = t1;
+    im[83] = t12;
+    re[98] = t11;
+    im[98] = t17;
+    re[113] = t18;
+    im[113] = t9;
+    t19 = X[64];
+    t0 = X[175];
+    t13 = C49 * t19;
+    t3 = C50 * t0;
+    t15 = t13 + t3;
+    t2 = (-C50) * t19;
+    t6 = C49 * t0;
+    t16 = t2 + t6;
+    t10 = X[94];
+    t8 = X[145];
+    t14 = C51 * t10;
+    t7 = C52 * t8;
+    t5 = t14 + t7;
+    t4 = (-C52) * t10;
+    t1 = C51 * t8;
+    t12 = t4 + t1;
+    t11 = X[124];
+    t17 = X[115];
+    t18 = C53 * t11;
+    t9 = C54 * t17;
+    t13 = t18 + t9;
+    t3 = (-C54) * t11;
+    t19 = C53 * t17;
+    t0 = t3 + t19;
+    t2 = X[154];
+    t6 = X[85];
+    t14 = C55 * t2;
+    t7 = C56 * t6;
+    t10 = t14 + t7;
+    t8 = (-C56) * t2;
+    t4 = C55 * t6;
+    t1 = t8 + t4;
+    t18 = X[184];
+    t9 = X[55];
+    t11 = C57 * t18;
+    t17 = C58 * t9;
+    t3 = t11 + t17;
+    t19 = (-C58) * t18;
+    t14 = C57 * t9;
+    t7 = t19 + t14;
+    t2 = X[214];
+    t6 = X[25];
+    t8 = C59 * t2;
+    t4 = C60 * t6;
+    t11 = t8 + t4;
+    t17 = (-C60) * t2;
+    t18 = C59 * t6;
+    t9 = t17 + t18;
+    t19 = X[4];
+    t14 = X[235];
+    t8 = C61 * t19;
+    t4 = C62 * t14;
+    t2 = t8 + t4;
+    t6 = (-C62) * t19;
+    t17 = C61 * t14;
+    t18 = t6 + t17;
+    t8 = X[34];
+    t4 = X[205];
+    t19 = C63 * t8;
+    t14 = C64 * t4;
+    t6 = t19 + t14;
+    t17 = (-C64) * t8;
+    t19 = C63 * t4;
+    t14 = t17 + t19;
+    t8 = t15 + t3;
+    t4 = t16 + t7;
+    t17 = t13 + t2;
+    t19 = t0 + t18;
+    t15 = t15 - t3;
+    t3 = t16 - t7;
+    t16 = t13 - t2;
+    t7 = t0 - t18;
+    t13 = t8 + t17;
+    t2 = t4 + t19;
+    t0 = t15 + t7;
+    t18 = t3 - t16;
+    t8 = t8 - t17;
+    t17 = t4 - t19;
+    t4 = t15 - t7;
+    t19 = t3 + t16;
+    t15 = t5 + t11;
+    t7 = t12 + t9;
+    t3 = t10 + t6;
+    t16 = t1 + t14;
+    t5 = t5 - t11;
+    t11 = t12 - t9;
+    t12 = t10 - t6;
+    t9 = t1 - t14;
+    t10 = t15 + t3;
+    t6 = t7 + t16;
+    t1 = t5 + t9;
+    t14 = t11 - t12;
+    t15 = t15 - t3;
+    t3 = t7 - t16;
+    t7 = t5 - t9;
+    t16 = t11 + t12;
+    t5 = t1 + t14;
+    t9 = t1 - t14;
+    t11 = C16 * t5;
+    t12 = (-C16) * t9;
+    t1 = t7 - t16;
+    t14 = t7 + t16;
+    t5 = (-C16) * t1;
+    t9 = (-C16) * t14;
+    t7 = t13 - t10;
+    t16 = t2 - t6;
+    t1 = t13 + t10;
+    t14 = t2 + t6;
+    t13 = t0 - t11;
+    t10 = t18 - t12;
+    t2 = t0 + t11;
+    t6 = t18 + t12;
+    t0 = t8 - t3;
+    t11 = t17 + t15;
+    t18 = t8 + t3;
+    t12 = t17 - t15;
+    t8 = t4 - t5;
+    t3 = t19 - t9;
+    t17 = t4 + t5;
+    t15 = t19 + t9;
+    re[32] = t1;
+    im[32] = t14;
+    re[47] = t2;
+    im[47] = t6;
+    re[62] = t18;
+    im[62] = t12;
+    re[77] = t17;
+    im[77] = t15;
+    re[92] = t7;
+    im[92] = t16;
+    re[107] = t13;
+    im[107] = t10;
+    re[2] = t0;
+    im[2] = t11;
+    re[17] = t8;
+    im[17] = t3;
+    t4 = X[112];
+    t5 = X[127];
+    t19 = C65 * t4;
+    t9 = C66 * t5;
+    t1 = t19 + t9;
+    t14 = (-C66) * t4;
+    t2 = C65 * t5;
+    t6 = t14 + t2;
+    t18 = X[142];
+    t12 = X[97];
+    t17 = C67 * t18;
+    t15 = C68 * t12;
+    t7 = t17 + t15;
+    t16 = (-C68) * t18;
+    t13 = C67 * t12;
+    t10 = t16 + t13;
+    t0 = X[172];
+    t11 = X[67];
+    t8 = C69 * t0;
+    t3 = C70 * t11;
+    t19 = t8 + t3;
+    t9 = (-C70) * t0;
+    t4 = C69 * t11;
+    t5 = t9 + t4;
+    t14 = X[202];
+    t2 = X[37];
+    t17 = C71 * t14;
+    t15 = C72 * t2;
+    t18 = t17 + t15;
+    t12 = (-C72) * t14;
+    t16 = C71 * t2;
+    t13 = t12 + t16;
+    t8 = X[232];
+    t3 = X[7];
+    t0 = C73 * t8;
+    t11 = C74 * t3;
+    t9 = t0 + t11;
+    t4 = (-C74) * t8;
+    t17 = C73 * t3;
+    t15 = t4 + t17;
+    t14 = X[22];
+    t2 = X[217];
+    t12 = C75 * t14;
+    t16 = C76 * t2;
+    t0 = t12 + t16;
+    t11 = (-C76) * t14;
+    t8 = C75 * t2;
+    t3 = t11 + t8;
+    t4 = X[52];
+    t17 = X[187];
+    t12 = C77 * t4;
+    t16 = C78 * t17;
+    t14 = t12 + t16;
+    t2 = (-C78) * t4;
+    t11 = C77 * t17;
+    t8 = t2 + t11;
+    t12 = X[82];
+    t16 = X[157];
+    t4 = C79 * t12;
+    t17 = C80 * t16;
+    t2 = t4 + t17;
+    t11 = (-C80) * t12;
+    t4 = C79 * t16;
+    t17 = t11 + t4;
+    t12 = t1 + t9;
+    t16 = t6 + t15;
+    t11 = t19 + t14;
+    t4 = t5 + t8;
+    t1 = t1 - t9;
+    t9 = t6 - t15;
+    t6 = t19 - t14;
+    t15 = t5 - t8;
+    t19 = t12 + t11;
+    t14 = t16 + t4;
+    t5 = t1 + t15;
+    t8 = t9 - t6;
+    t12 = t12 - t11;
+    t11 = t16 - t4;
+    t16 = t1 - t15;
+    t4 = t9 + t6;
+    t1 = t7 + t0;
+    t15 = t10 + t3;
+    t9 = t18 + t2;
+    t6 = t13 + t17;
+    t7 = t7 - t0;
+    t0 = t10 - t3;
+    t10 = t18 - t2;
+    t3 = t13 - t17;
+    t18 = t1 + t9;
+    t2 = t15 + t6;
+    t13 = t7 + t3;
+    t17 = t0 - t10;
+    t1 = t1 - t9;
+    t9 = t15 - t6;
+    t15 = t7 - t3;
+    t6 = t0 + t10;
+    t7 = t13 + t17;
+    t3 = t13 - t17;
+    t0 = C16 * t7;
+    t10 = (-C16) * t3;
+    t13 = t15 - t6;
+    t17 = t15 + t6;
+    t7 = (-C16) * t13;
+    t3 = (-C16) * t17;
+    t15 = t19 - t18;
+    t6 = t14 - t2;
+    t13 = t19 + t18;
+    t17 = t14 + t2;
+    t19 = t5 - t0;
+    t18 = t8 - t10;
+    t14 = t5 + t0;
+    t2 = t8 + t10;
+    t5 = t12 - t9;
+    t0 = t11 + t1;
+    t8 = t12 + t9;
+    t10 = t11 - t1;
+    t12 = t16 - t7;
+    t9 = t4 - t3;
+    t11 = t16 + t7;
+    t1 = t4 + t3;
+    re[56] = t13;
+    im[56] = t17;
+    re[71] = t14;
+    im[71] = t2;
+    re[86] = t8;
+    im[86] = t10;
+    re[101] = t11;
+    im[101] = t1;
+    re[116] = t15;
+    im[116] = t6;
+    re[11] = t19;
+    im[11] = t18;
+    re[26] = t5;
+    im[26] = t0;
+    re[41] = t12;
+    im[41] = t9;
+    t16 = re[80];
+    t7 = im[80];
+    t4 = re[104];
+    t3 = im[104];
+    t13 = re[8];
+    t17 = im[8];
+    t14 = re[32];
+    t2 = im[32];
+    t8 = re[56];
+    t10 = im[56];
+    t11 = t4 + t8;
+    t1 = t3 + t10;
+    t15 = t13 + t14;
+    t6 = t17 + t2;
+    t19 = t4 - t8;
+    t18 = t3 - t10;
+    t5 = t13 - t14;
+    t0 = t17 - t2;
+    t12 = t11 + t15;
+    t9 = t1 + t6;
+    t4 = t11 - t15;
+    t8 = C81 * t4;
+    t3 = t1 - t6;
+    t10 = C81 * t3;
+    t13 = C82 * t12;
+    t14 = t16 - t13;
+    t17 = C82 * t9;
+    t2 = t7 - t17;
+    t11 = t14 + t8;
+    t15 = t2 + t10;
+    t4 = t14 - t8;
+    t1 = t2 - t10;
+    t6 = C83 * t19;
+    t3 = C84 * t5;
+    t13 = t6 + t3;
+    t17 = C83 * t18;
+    t14 = C84 * t0;
+    t8 = t17 + t14;
+    t2 = C84 * t19;
+    t10 = C83 * t5;
+    t6 = t2 - t10;
+    t3 = C84 * t18;
+    t17 = C83 * t0;
+    t14 = t3 - t17;
+    t19 = t16 + t12;
+    t5 = t7 + t9;
+    t2 = t11 + t8;
+    t10 = t15 - t13;
+    t18 = t4 + t14;
+    t0 = t1 - t6;
+    t3 = t4 - t14;
+    t17 = t1 + t6;
+    t16 = t11 - t8;
+    t12 = t15 + t13;
+    re[80] = t19;
+    im[80] = t5;
+    re[104] = t2;
+    im[104] = t10;
+    re[8] = t18;
+    im[8] = t0;
+    re[32] = t3;
+    im[32] = t17;
+    re[56] = t16;
+    im[56] = t12;
+    t7 = re[95];
+    t9 = im[95];
+    t4 = re[119];
+    t14 = im[119];
+    t1 = re[23];
+    t6 = im[23];
+    t11 = re[47];
+    t8 = im[47];
+    t15 = re[71];
+    t13 = im[71];
+    t19 = t4 + t15;
+    t5 = t14 + t13;
+    t2 = t1 + t11;
+    t10 = t6 + t8;
+    t18 = t4 - t15;
+    t0 = t14 - t13;
+    t3 = t1 - t11;
+    t17 = t6 - t8;
+    t16 = t19 + t2;
+    t12 = t5 + t10;
+    t4 = t19 - t2;
+    t15 = C81 * t4;
+    t14 = t5 - t10;
+    t13 = C81 * t14;
+    t1 = C82 * t16;
+    t11 = t7 - t1;
+    t6 = C82 * t12;
+    t8 = t9 - t6;
+    t19 = t11 + t15;
+    t2 = t8 + t13;
+    t4 = t11 - t15;
+    t5 = t8 - t13;
+    t10 = C83 * t18;
+    t14 = C84 * t3;
+    t1 = t10 + t14;
+    t6 = C83 * t0;
+    t11 = C84 * t17;
+    t15 = t6 + t11;
+    t8 = C84 * t18;
+    t13 = C83 * t3;
+    t10 = t8 - t13;
+    t14 = C84 * t0;
+    t6 = C83 * t17;
+    t11 = t14 - t6;
+    t18 = t7 + t16;
+    t3 = t9 + t12;
+    t8 = t19 + t15;
+    t13 = t2 - t1;
+    t0 = t4 + t11;
+    t17 = t5 - t10;
+    t14 = t4 - t11;
+    t6 = t5 + t10;
+    t7 = t19 - t15;
+    t16 = t2 + t1;
+    re[95] = t18;
+    im[95] = t3;
+    re[119] = t8;
+    im[119] = t13;
+    re[23] = t0;
+    im[23] = t17;
+    re[47] = t14;
+    im[47] = t6;
+    re[71] = t7;
+    im[71] = t16;
+    t9 = re[110];
+    t12 = im[110];
+    t4 = re[14];
+    t11 = im[14];
+    t5 = re[38];
+    t10 = im[38];
+    t19 = re[62];
+    t15 = im[62];
+    t2 = re[86];
+    t1 = im[86];
+    t18 = t4 + t2;
+    t3 = t11 + t1;
+    t8 = t5 + t19;
+    t13 = t10 + t15;
+    t0 = t4 - t2;
+    t17 = t11 - t1;
+    t14 = t5 - t19;
+    t6 = t10 - t15;
+    t7 = t18 + t8;
+    t16 = t3 + t13;
+    t4 = t18 - t8;
+    t2 = C81 * t4;
+    t11 = t3 - t13;
+    t1 = C81 * t11;
+    t5 = C82 * t7;
+    t19 = t9 - t5;
+    t10 = C82 * t16;
+    t15 = t12 - t10;
+    t18 = t19 + t2;
+    t8 = t15 + t1;
+    t4 = t19 - t2;
+    t3 = t15 - t1;
+    t13 = C83 * t0;
+    t11 = C84 * t14;
+    t5 = t13 + t11;
+    t10 = C83 * t17;
+    t19 = C84 * t6;
+    t2 = t10 + t19;
+    t15 = C84 * t0;
+    t1 = C83 * t14;
+    t13 = t15 - t1;
+    t11 = C84 * t17;
+    t10 = C83 * t6;
+    t19 = t11 - t10;
+    t0 = t9 + t7;
+    t14 = t12 + t16;
+    t15 = t18 + t2;
+    t1 = t8 - t5;
+    t17 = t4 + t19;
+    t6 = t3 - t13;
+    t11 = t4 - t19;
+    t10 = t3 + t13;
+    t9 = t18 - t2;
+    t7 = t8 + t5;
+    re[110] = t0;
+    im[110] = t14;
+    re[14] = t15;
+    im[14] = t1;
+    re[38] = t17;
+    im[38] = t6;
+    re[62] = t11;
+    im[62] = t10;
+    re[86] = t9;
+    im[86] = t7;
+    t12 = re[5];
+    t16 = im[5];
+    t4 = re[29];
+    t19 = im[29];
+    t3 = re[53];
+    t13 = im[53];
+    t18 = re[77];
+    t2 = im[77];
+    t8 = re[101];
+    t5 = im[101];
+    t0 = t4 + t8;
+    t14 = t19 + t5;
+    t15 = t3 + t18;
+    t1 = t13 + t2;
+    t17 = t4 - t8;
+    t6 = t19 - t5;
+    t11 = t3 - t18;
+    t10 = t13 - t2;
+    t9 = t0 + t15;
+    t7 = t14 + t1;
+    t4 = t0 - t15;
+    t8 = C81 * t4;
+    t19 = t14 - t1;
+    t5 = C81 * t19;
+    t3 = C82 * t9;
+    t18 = t12 - t3;
+    t13 = C82 * t7;
+    t2 = t16 - t13;
+    t0 = t18 + t8;
+    t15 = t2 + t5;
+    t4 = t18 - t8;
+    t14 = t2 - t5;
+    t1 = C83 * t17;
+    t19 = C84 * t11;
+    t3 = t1 + t19;
+    t13 = C83 * t6;
+    t18 = C84 * t10;
+    t8 = t13 + t18;
+    t2 = C84 * t17;
+    t5 = C83 * t11;
+    t1 = t2 - t5;
+    t19 = C84 * t6;
+    t13 = C83 * t10;
+    t18 = t19 - t13;
+    t17 = t12 + t9;
+    t11 = t16 + t7;
+    t2 = t0 + t8;
+    t5 = t15 - t3;
+    t6 = t4 + t18;
+    t10 = t14 - t1;
+    t19 = t4 - t18;
+    t13 = t14 + t1;
+    t12 = t0 - t8;
+    t9 = t15 + t3;
+    re[5] = t17;
+    im[5] = t11;
+    re[29] = t2;
+    im[29] = t5;
+    re[53] = t6;
+    im[53] = t10;
+    re[77] = t19;
+    im[77] = t13;
+    re[101] = t12;
+    im[101] = t9;
+    t16 = re[20];
+    t7 = im[20];
+    t4 = re[44];
+    t18 = im[44];
+    t14 = re[68];
+    t1 = im[68];
+    t0 = re[92];
+    t8 = im[92];
+    t15 = re[116];
+    t3 = im[116];
+    t17 = t4 + t15;
+    t11 = t18 + t3;
+    t2 = t14 + t0;
+    t5 = t1 + t8;
+    t6 = t4 - t15;
+    t10 = t18 - t3;
+    t19 = t14 - t0;
+    t13 = t1 - t8;
+    t12 = t17 + t2;
+    t9 = t11 + t5;
+    t4 = t17 - t2;
+    t15 = C81 * t4;
+    t18 = t11 - t5;
+    t3 = C81 * t18;
+    t14 = C82 * t12;
+    t0 = t16 - t14;
+    t1 = C82 * t9;
+    t8 = t7 - t1;
+    t17 = t0 + t15;
+    t2 = t8 + t3;
+    t4 = t0 - t15;
+    t11 = t8 - t3;
+    t5 = C83 * t6;
+    t18 = C84 * t19;
+    t14 = t5 + t18;
+    t1 = C83 * t10;
+    t0 = C84 * t13;
+    t15 = t1 + t0;
+    t8 = C84 * t6;
+    t3 = C83 * t19;
+    t5 = t8 - t3;
+    t18 = C84 * t10;
+    t1 = C83 * t13;
+    t0 = t18 - t1;
+    t6 = t16 + t12;
+    t19 = t7 + t9;
+    t8 = t17 + t15;
+    t3 = t2 - t14;
+    t10 = t4 + t0;
+    t13 = t11 - t5;
+    t18 = t4 - t0;
+    t1 = t11 + t5;
+    t16 = t17 - t15;
+    t12 = t2 + t14;
+    re[20] = t6;
+    im[20] = t19;
+    re[44] = t8;
+    im[44] = t3;
+    re[68] = t10;
+    im[68] = t13;
+    re[92] = t18;
+    im[92] = t1;
+    re[116] = t16;
+    im[116] = t12;
+    t7 = re[35];
+    t9 = im[35];
+    t4 = re[59];
+    t0 = im[59];
+    t11 = re[83];
+    t5 = im[83];
+    t17 = re[107];
+    t15 = im[107];
+    t2 = re[11];
+    t14 = im[11];
+    t6 = t4 + t2;
+    t19 = t0 + t14;
+    t8 = t11 + t17;
+    t3 = t5 + t15;
+    t10 = t4 - t2;
+    t13 = t0 - t14;
+    t18 = t11 - t17;
+    t1 = t5 - t15;
+    t16 = t6 + t8;
+    t12 = t19 + t3;
+    t4 = t6 - t8;
+    t2 = C81 * t4;
+    t0 = t19 - t3;
+    t14 = C81 * t0;
+    t11 = C82 * t16;
+    t17 = t7 - t11;
+    t5 = C82 * t12;
+    t15 = t9 - t5;
+    t6 = t17 + t2;
+    t8 = t15 + t14;
+    t4 = t17 - t2;
+    t19 = t15 - t14;
+    t3 = C83 * t10;
+    t0 = C84 * t18;
+    t11 = t3 + t0;
+    t5 = C83 * t13;
+    t17 = C84 * t1;
+    t2 = t5 + t17;
+    t15 = C84 * t10;
+    t14 = C83 * t18;
+    t3 = t15 - t14;
+    t0 = C84 * t13;
+    t5 = C83 * t1;
+    t17 = t0 - t5;
+    t10 = t7 + t16;
+    t18 = t9 + t12;
+    t15 = t6 + t2;
+    t14 = t8 - t11;
+    t13 = t4 + t17;
+    t1 = t19 - t3;
+    t0 = t4 - t17;
+    t5 = t19 + t3;
+    t7 = t6 - t2;
+    t16 = t8 + t11;
+    re[35] = t10;
+    im[35] = t18;
+    re[59] = t15;
+    im[59] = t14;
+    re[83] = t13;
+    im[83] = t1;
+    re[107] = t0;
+    im[107] = t5;
+    re[11] = t7;
+    im[11] = t16;
+    t9 = re[50];
+    t12 = im[50];
+    t4 = re[74];
+    t17 = im[74];
+    t19 = re[98];
+    t3 = im[98];
+    t6 = re[2];
+    t2 = im[2];
+    t8 = re[26];
+    t11 = im[26];
+    t10 = t4 + t8;
+    t18 = t17 + t11;
+    t15 = t19 + t6;
+    t14 = t3 + t2;
+    t13 = t4 - t8;
+    t1 = t17 - t11;
+    t0 = t19 - t6;
+    t5 = t3 - t2;
+    t7 = t10 + t15;
+    t16 = t18 + t14;
+    t4 = t10 - t15;
+    t8 = C81 * t4;
+    t17 = t18 - t14;
+    t11 = C81 * t17;
+    t19 = C82 * t7;
+    t6 = t9 - t19;
+    t3 = C82 * t16;
+    t2 = t12 - t3;
+    t10 = t6 + t8;
+    t15 = t2 + t11;
+    t4 = t6 - t8;
+    t18 = t2 - t11;
+    t14 = C83 * t13;
+    t17 = C84 * t0;
+    t19 = t14 + t17;
+    t3 = C83 * t1;
+    t6 = C84 * t5;
+    t8 = t3 + t6;
+    t2 = C84 * t13;
+    t11 = C83 * t0;
+    t14 = t2 - t11;
+    t17 = C84 * t1;
+    t3 = C83 * t5;
+    t6 = t17 - t3;
+    t13 = t9 + t7;
+    t0 = t12 + t16;
+    t2 = t10 + t8;
+    t11 = t15 - t19;
+    t1 = t4 + t6;
+    t5 = t18 - t14;
+    t17 = t4 - t6;
+    t3 = t18 + t14;
+    t9 = t10 - t8;
+    t7 = t15 + t19;
+    re[50] = t13;
+    im[50] = t0;
+    re[74] = t2;
+    im[74] = t11;
+    re[98] = t1;
+    im[98] = t5;
+    re[2] = t17;
+    im[2] = t3;
+    re[26] = t9;
+    im[26] = t7;
+    t12 = re[65];
+    t16 = im[65];
+    t4 = re[89];
+    t6 = im[89];
+    t18 = re[113];
+    t14 = im[113];
+    t10 = re[17];
+    t8 = im[17];
+    t15 = re[41];
+    t19 = im[41];
+    t13 = t4 + t15;
+    t0 = t6 + t19;
+    t2 = t18 + t10;
+    t11 = t14 + t8;
+    t1 = t4 - t15;
+    t5 = t6 - t19;
+    t17 = t18 - t10;
+    t3 = t14 - t8;
+    t9 = t13 + t2;
+    t7 = t0 + t11;
+    t4 = t13 - t2;
+    t15 = C81 * t4;
+    t6 = t0 - t11;
+    t19 = C81 * t6;
+    t18 = C82 * t9;
+    t10 = t12 - t18;
+    t14 = C82 * t7;
+    t8 = t16 - t14;
+    t13 = t10 + t15;
+    t2 = t8 + t19;
+    t4 = t10 - t15;
+    t0 = t8 - t19;
+    t11 = C83 * t1;
+    t6 = C84 * t17;
+    t18 = t11 + t6;
+    t14 = C83 * t5;
+    t10 = C84 * t3;
+    t15 = t14 + t10;
+    t8 = C84 * t1;
+    t19 = C83 * t17;
+    t11 = t8 - t19;
+    t6 = C84 * t5;
+    t14 = C83 * t3;
+    t10 = t6 - t14;
+    t1 = t12 + t9;
+    t17 = t16 + t7;
+    t8 = t13 + t15;
+    t19 = t2 - t18;
+    t5 = t4 + t10;
+    t3 = t0 - t11;
+    t6 = t4 - t10;
+    t14 = t0 + t11;
+    t12 = t13 - t15;
+    t9 = t2 + t18;
+    re[65] = t1;
+    im[65] = t17;
+    re[89] = t8;
+    im[89] = t19;
+    re[113] = t5;
+    im[113] = t3;
+    re[17] = t6;
+    im[17] = t14;
+    re[41] = t12;
+    im[41] = t9;
+    t16 = re[0];
+    t7 = im[0];
+    t4 = re[40];
+    t10 = im[40];
+    t0 = re[80];
+    t11 = im[80];
+    t13 = t4 + t0;
+    t15 = t10 + t11;
+    t2 = C85 * t13;
+    t18 = t16 - t2;
+    t1 = C85 * t15;
+    t17 = t7 - t1;
+    t8 = t4 - t0;
+    t19 = C86 * t8;
+    t5 = t10 - t11;
+    t3 = C86 * t5;
+    t6 = t16 + t13;
+    t14 = t7 + t15;
+    t12 = t18 + t3;
+    t9 = t17 - t19;
+    t2 = t18 - t3;
+    t1 = t17 + t19;
+    t4 = (-C87) * t6;
+    t0 = (-C88) * t14;
+    t8 = t4 + t0;
+    t10 = 0.08062381886627268 * t8;
+    y[359] = t10;
+    t11 = 0.07908701262725863 * t8;
+    y[360] = t11;
+    t5 = C88 * t6;
+    t16 = (-C87) * t14;
+    t13 = t5 + t16;
+    t7 = 0.05093589219767399 * t13;
+    y[119] = t7;
+    t15 = (-0.0533957066838501) * t13;
+    y[120] = t15;
+    t18 = (-C89) * t12;
+    t3 = (-C90) * t9;
+    t17 = t18 + t3;
+    t19 = 0.09034656516392356 * t17;
+    y[279] = t19;
+    t4 = (-0.008607320729772055) * t17;
+    y[440] = t4;
+    t0 = C90 * t12;
+    t10 = (-C89) * t9;
+    t8 = t0 + t10;
+    y[39] = 0;
+    t11 = (-0.09223741177335797) * t8;
+    y[200] = t11;
+    t6 = C91 * t2;
+    t14 = C92 * t1;
+    t5 = t6 + t14;
+    y[40] = 0;
+    t16 = (-0.09224509203483207) * t5;
+    y[199] = t16;
+    t7 = (-C92) * t2;
+    t13 = C91 * t1;
+    t15 = t7 + t13;
+    t18 = 0.09033904297246116 * t15;
+    y[280] = t18;
+    t3 = (-0.008844170730505122) * t15;
+    y[439] = t3;
+    t19 = re[39];
+    t17 = im[39];
+    t4 = re[79];
+    t12 = im[79];
+    t9 = re[119];
+    t0 = im[119];
+    t10 = t4 + t9;
+    t8 = t12 + t0;
+    t11 = C85 * t10;
+    t6 = t19 - t11;
+    t14 = C85 * t8;
+    t5 = t17 - t14;
+    t16 = t4 - t9;
+    t2 = C86 * t16;
+    t1 = t12 - t0;
+    t7 = C86 * t1;
+    t13 = t19 + t10;
+    t18 = t17 + t8;
+    t15 = t6 + t7;
+    t3 = t5 - t2;
+    t11 = t6 - t7;
+    t14 = t5 + t2;
+    t4 = C93 * t13;
+    t9 = C94 * t18;
+    t16 = t4 + t9;
+    y[42] = 0;
+    t12 = (-0.09226327155399247) * t16;
+    y[197] = t12;
+    t0 = (-C94) * t13;
+    t1 = C93 * t18;
+    t19 = t0 + t1;
+    t10 = 0.09032124260255246 * t19;
+    y[282] = t10;
+    t17 = (-0.009265717230196452) * t19;
+    y[437] = t17;
+    t8 = (-C95) * t15;
+    t6 = (-C96) * t3;
+    t7 = t8 + t6;
+    t5 = 0.08345046628438205 * t7;
+    y[357] = t5;
+    t2 = 0.07578270262387705 * t7;
+    y[362] = t2;
+    t4 = C96 * t15;
+    t9 = (-C95) * t3;
+    t16 = t4 + t9;
+    t12 = 0.04591306207989876 * t16;
+    y[117] = t12;
+    t13 = (-0.05816525202674937) * t16;
+    y[122] = t13;
+    t18 = (-C97) * t11;
+    t0 = (-C98) * t14;
+    t1 = t18 + t0;
+    t10 = 0.09035887908682398 * t1;
+    y[277] = t10;
+    t19 = (-0.00808776756287088) * t1;
+    y[442] = t19;
+    t17 = C98 * t11;
+    t8 = (-C97) * t14;
+    t6 = t17 + t8;
+    y[37] = 0;
+    t5 = (-0.09222484184787204) * t6;
+    y[202] = t5;
+    t7 = re[78];
+    t2 = im[78];
+    t15 = re[118];
+    t3 = im[118];
+    t4 = re[38];
+    t9 = im[38];
+    t12 = t15 + t4;
+    t16 = t3 + t9;
+    t13 = C85 * t12;
+    t18 = t7 - t13;
+    t0 = C85 * t16;
+    t10 = t2 - t0;
+    t1 = t15 - t4;
+    t19 = C86 * t1;
+    t11 = t3 - t9;
+    t14 = C86 * t11;
+    t17 = t7 + t12;
+    t8 = t2 + t16;
+    t6 = t18 + t14;
+    t5 = t10 - t19;
+    t13 = t18 - t14;
+    t0 = t10 + t19;
+    t15 = (-C99) * t17;
+    t4 = (-C100) * t8;
+    t1 = t15 + t4;
+    t3 = 0.09036790163852577 * t1;
+    y[275] = t3;
+    t9 = (-0.007516983228543206) * t1;
+    y[444] = t9;
+    t11 = C100 * t17;
+    t7 = (-C99) * t8;
+    t12 = t11 + t7;
+    y[35] = 0;
+    t2 = (-0.09221563389473073) * t12;
+    y[204] = t2;
+    t16 = C101 * t6;
+    t18 = C102 * t5;
+    t14 = t16 + t18;
+    y[44] = 0;
+    t10 = (-0.09228499199887408) * t14;
+    y[195] = t10;
+    t19 = (-C102) * t6;
+    t15 = C101 * t5;
+    t4 = t19 + t15;
+    t3 = 0.09029998435103076 * t4;
+    y[284] = t3;
+    t1 = (-0.009609217195098947) * t4;
+    y[435] = t1;
+    t9 = (-C103) * t13;
+    t17 = (-C104) * t0;
+    t8 = t9 + t17;
+    t11 = 0.08593171868025587 * t8;
+    y[355] = t11;
+    t7 = 0.0721967068995578 * t8;
+    y[364] = t7;
+    t12 = C104 * t13;
+    t2 = (-C103) * t0;
+    t16 = t12 + t2;
+    t18 = 0.04081728778312514 * t16;
+    y[115] = t18;
+    t14 = (-0.06268301918716075) * t16;
+    y[124] = t14;
+    t10 = re[117];
+    t6 = im[117];
+    t5 = re[37];
+    t19 = im[37];
+    t15 = re[77];
+    t3 = im[77];
+    t4 = t5 + t15;
+    t1 = t19 + t3;
+    t9 = C85 * t4;
+    t17 = t10 - t9;
+    t11 = C85 * t1;
+    t8 = t6 - t11;
+    t7 = t5 - t15;
+    t13 = C86 * t7;
+    t0 = t19 - t3;
+    t12 = C86 * t0;
+    t2 = t10 + t4;
+    t18 = t6 + t1;
+    t16 = t17 + t12;
+    t14 = t8 - t13;
+    t9 = t17 - t12;
+    t11 = t8 + t13;
+    t5 = (-C105) * t2;
+    t15 = (-C106) * t18;
+    t7 = t5 + t15;
+    t19 = 0.08805597029305232 * t7;
+    y[353] = t19;
+    t3 = 0.06836553343262328 * t7;
+    y[366] = t3;
+    t0 = C106 * t2;
+    t10 = (-C105) * t18;
+    t4 = t0 + t10;
+    t6 = 0.035732076918905245 * t4;
+    y[113] = t6;
+    t1 = (-0.06689484897518211) * t4;
+    y[126] = t1;
+    t17 = (-C107) * t16;
+    t12 = (-C108) * t14;
+    t8 = t17 + t12;
+    t13 = 0.09037445652792069 * t8;
+    y[273] = t13;
+    t5 = (-0.0069065039150964765) * t8;
+    y[446] = t5;
+    t15 = C108 * t16;
+    t19 = (-C107) * t14;
+    t7 = t15 + t19;
+    y[33] = 0;
+    t3 = (-0.09220894546412896) * t7;
+    y[206] = t3;
+    t2 = C109 * t9;
+    t18 = C110 * t11;
+    t0 = t2 + t18;
+    y[46] = 0;
+    t10 = (-0.09230960613835858) * t0;
+    y[193] = t10;
+    t6 = (-C110) * t9;
+    t4 = C109 * t11;
+    t1 = t6 + t4;
+    t17 = 0.09027590607247186 * t1;
+    y[286] = t17;
+    t12 = (-0.009866002803861918) * t1;
+    y[433] = t12;
+    t13 = re[36];
+    t8 = im[36];
+    t5 = re[76];
+    t16 = im[76];
+    t14 = re[116];
+    t15 = im[116];
+    t19 = t5 + t14;
+    t7 = t16 + t15;
+    t3 = C85 * t19;
+    t2 = t13 - t3;
+    t18 = C85 * t7;
+    t0 = t8 - t18;
+    t10 = t5 - t14;
+    t9 = C86 * t10;
+    t11 = t16 - t15;
+    t6 = C86 * t11;
+    t4 = t13 + t19;
+    t17 = t8 + t7;
+    t1 = t2 + t6;
+    t12 = t0 - t9;
+    t3 = t2 - t6;
+    t18 = t0 + t9;
+    t5 = C111 * t4;
+    t14 = C112 * t17;
+    t10 = t5 + t14;
+    y[48] = 0;
+    t16 = (-0.09233615544660524) * t10;
+    y[191] = t16;
+    t15 = (-C112) * t4;
+    t11 = C111 * t17;
+    t13 = t15 + t11;
+    t19 = 0.0902499491453508 * t13;
+    y[288] = t19;
+    t8 = (-0.010028110732918314) * t13;
+    y[431] = t8;
+    t7 = (-C113) * t1;
+    t2 = (-C114) * t12;
+    t6 = t7 + t2;
+    t0 = 0.08982134522665142 * t6;
+    y[351] = t0;
+    t9 = 0.06433086169952303 * t6;
+    y[368] = t9;
+    t5 = C114 * t1;
+    t14 = (-C113) * t12;
+    t10 = t5 + t14;
+    t16 = 0.030744011971085474 * t10;
+    y[111] = t16;
+    t4 = (-0.07075761930636477) * t10;
+    y[128] = t4;
+    t17 = (-C115) * t3;
+    t15 = (-C116) * t18;
+    t11 = t17 + t15;
+    t19 = 0.09037972981913145 * t11;
+    y[271] = t19;
+    t13 = (-0.0062692385583066525) * t11;
+    y[448] = t13;
+    t8 = C116 * t3;
+    t7 = (-C115) * t18;
+    t2 = t8 + t7;
+    y[31] = 0;
+    t0 = (-0.09220356544559334) * t2;
+    y[208] = t0;
+    t6 = re[75];
+    t9 = im[75];
+    t1 = re[115];
+    t12 = im[115];
+    t5 = re[35];
+    t14 = im[35];
+    t16 = t1 + t5;
+    t10 = t12 + t14;
+    t4 = C85 * t16;
+    t17 = t6 - t4;
+    t15 = C85 * t10;
+    t19 = t9 - t15;
+    t11 = t1 - t5;
+    t13 = C86 * t11;
+    t3 = t12 - t14;
+    t18 = C86 * t3;
+    t8 = t6 + t16;
+    t7 = t9 + t10;
+    t2 = t17 + t18;
+    t0 = t19 - t13;
+    t4 = t17 - t18;
+    t15 = t19 + t13;
+    t1 = (-C117) * t8;
+    t5 = (-C118) * t7;
+    t11 = t1 + t5;
+    t12 = 0.09038523656129972 * t11;
+    y[269] = t12;
+    t14 = (-0.00561728389438704) * t11;
+    y[450] = t14;
+    t3 = C118 * t8;
+    t6 = (-C117) * t7;
+    t16 = t3 + t6;
+    y[29] = 0;
+    t9 = (-0.09219794792130263) * t16;
+    y[210] = t9;
+    t10 = C119 * t2;
+    t17 = C120 * t0;
+    t18 = t10 + t17;
+    y[50] = 0;
+    t19 = (-0.09236339352934352) * t18;
+    y[189] = t19;
+    t13 = (-C120) * t2;
+    t1 = C119 * t0;
+    t5 = t13 + t1;
+    t12 = 0.09022333432006113 * t5;
+    y[290] = t12;
+    t11 = (-0.010087996230996618) * t5;
+    y[429] = t11;
+    t14 = (-C121) * t4;
+    t8 = (-C122) * t15;
+    t7 = t14 + t8;
+    t3 = 0.09123336800239044 * t7;
+    y[349] = t3;
+    t6 = 0.06013646578493223 * t7;
+    y[370] = t6;
+    t16 = C122 * t4;
+    t9 = (-C121) * t15;
+    t10 = t16 + t9;
+    t17 = 0.025940569677611058 * t10;
+    y[109] = t17;
+    t18 = (-0.07424212545015943) * t10;
+    y[130] = t18;
+    t19 = re[114];
+    t2 = im[114];
+    t0 = re[34];
+    t13 = im[34];
+    t1 = re[74];
+    t12 = im[74];
+    t5 = t0 + t1;
+    t11 = t13 + t12;
+    t14 = C85 * t5;
+    t8 = t19 - t14;
+    t3 = C85 * t11;
+    t7 = t2 - t3;
+    t6 = t0 - t1;
+    t4 = C86 * t6;
+    t15 = t13 - t12;
+    t16 = C86 * t15;
+    t9 = t19 + t5;
+    t17 = t2 + t11;
+    t10 = t8 + t16;
+    t18 = t7 - t4;
+    t14 = t8 - t16;
+    t3 = t7 + t4;
+    t0 = (-C123) * t9;
+    t1 = (-C124) * t17;
+    t6 = t0 + t1;
+    t13 = 0.09230804514914263 * t6;
+    y[347] = t13;
+    t12 = 0.055828404603232656 * t6;
+    y[372] = t12;
+    t15 = C124 * t9;
+    t19 = (-C123) * t17;
+    t5 = t15 + t19;
+    t2 = 0.021405733355147217 * t5;
+    y[107] = t2;
+    t11 = (-0.07733112947219162) * t5;
+    y[132] = t11;
+    t8 = (-C125) * t10;
+    t16 = (-C126) * t18;
+    t7 = t8 + t16;
+    t4 = 0.09039269800496416 * t7;
+    y[267] = t4;
+    t0 = (-0.004963431358318882) * t7;
+    y[452] = t0;
+    t1 = C126 * t10;
+    t13 = (-C125) * t18;
+    t6 = t1 + t13;
+    y[27] = 0;
+    t12 = (-0.09219033746371506) * t6;
+    y[212] = t12;
+    t9 = C127 * t14;
+    t17 = C128 * t3;
+    t15 = t9 + t17;
+    y[52] = 0;
+    t19 = (-0.09238985249618288) * t15;
+    y[187] = t19;
+    t2 = (-C128) * t14;
+    t5 = C127 * t3;
+    t11 = t2 + t5;
+    t8 = 0.09019749580915963 * t11;
+    y[292] = t8;
+    t16 = (-0.01003984440986052) * t11;
+    y[427] = t16;
+    t4 = re[33];
+    t7 = im[33];
+    t0 = re[73];
+    t10 = im[73];
+    t18 = re[113];
+    t1 = im[113];
+    t13 = t0 + t18;
+    t6 = t10 + t1;
+    t12 = C85 * t13;
+    t9 = t4 - t12;
+    t17 = C85 * t6;
+    t15 = t7 - t17;
+    t19 = t0 - t18;
+    t14 = C86 * t19;
+    t3 = t10 - t1;
+    t2 = C86 * t3;
+    t5 = t4 + t13;
+    t8 = t7 + t6;
+    t11 = t9 + t2;
+    t16 = t15 - t14;
+    t12 = t9 - t2;
+    t17 = t15 + t14;
+    t0 = C129 * t5;
+    t18 = C130 * t8;
+    t19 = t0 + t18;
+    y[54] = 0;
+    t10 = (-0.0924138411025536) * t19;
+    y[185] = t10;
+    t1 = (-C130) * t5;
+    t3 = C129 * t8;
+    t4 = t1 + t3;
+    t13 = 0.09017408251741922 * t4;
+    y[294] = t13;
+    t7 = (-0.009877028183254045) * t4;
+    y[425] = t7;
+    t6 = (-C131) * t11;
+    t9 = (-C132) * t16;
+    t2 = t6 + t9;
+    t15 = 0.09306856714612953 * t2;
+    y[345] = t15;
+    t14 = 0.05145305538177841 * t2;
+    y[374] = t14;
+    t0 = C132 * t11;
+    t18 = (-C131) * t16;
+    t19 = t0 + t18;
+    t10 = 0.017216724201455764 * t19;
+    y[105] = t10;
+    t5 = (-0.08002143471070666) * t19;
+    y[134] = t5;
+    t8 = (-C133) * t12;
+    t1 = (-C134) * t17;
+    t3 = t8 + t1;
+    t13 = 0.09040393857576512 * t3;
+    y[265] = t13;
+    t4 = (-0.004319493689614513) * t3;
+    y[454] = t4;
+    t7 = C134 * t12;
+    t6 = (-C133) * t17;
+    t9 = t7 + t6;
+    y[25] = 0;
+    t15 = (-0.09217887477711376) * t9;
+    y[214] = t15;
+    t2 = re[72];
+    t14 = im[72];
+    t11 = re[112];
+    t16 = im[112];
+    t0 = re[32];
+    t18 = im[32];
+    t10 = t11 + t0;
+    t19 = t16 + t18;
+    t5 = C85 * t10;
+    t8 = t2 - t5;
+    t1 = C85 * t19;
+    t13 = t14 - t1;
+    t3 = t11 - t0;
+    t4 = C86 * t3;
+    t12 = t16 - t18;
+    t17 = C86 * t12;
+    t7 = t2 + t10;
+    t6 = t14 + t19;
+    t9 = t8 + t17;
+    t15 = t13 - t4;
+    t5 = t8 - t17;
+    t1 = t13 + t4;
+    t11 = (-C135) * t7;
+    t0 = (-C136) * t6;
+    t3 = t11 + t0;
+    t16 = 0.09042074637842189 * t3;
+    y[263] = t16;
+    t18 = (-0.003697175871317106) * t3;
+    y[456] = t18;
+    t12 = C136 * t7;
+    t2 = (-C135) * t6;
+    t10 = t12 + t2;
+    y[23] = 0;
+    t14 = (-0.09216174016588313) * t10;
+    y[216] = t14;
+    t19 = C137 * t9;
+    t8 = C138 * t15;
+    t17 = t19 + t8;
+    y[56] = 0;
+    t13 = (-0.09243355653535416) * t17;
+    y[183] = t13;
+    t4 = (-C138) * t9;
+    t11 = C137 * t15;
+    t0 = t4 + t11;
+    t16 = 0.09015484901466475 * t0;
+    y[296] = t16;
+    t3 = (-0.009594235155045096) * t0;
+    y[423] = t3;
+    t18 = (-C139) * t5;
+    t7 = (-C140) * t1;
+    t6 = t18 + t7;
+    t12 = 0.09354518542538132 * t6;
+    y[343] = t12;
+    t2 = 0.0470560814586414 * t6;
+    y[376] = t2;
+    t10 = C140 * t5;
+    t14 = (-C139) * t1;
+    t19 = t10 + t14;
+    t8 = 0.013440088856608934 * t19;
+    y[103] = t8;
+    t17 = (-0.08232273400567668) * t19;
+    y[136] = t17;
+    t13 = re[111];
+    t9 = im[111];
+    t15 = re[31];
+    t4 = im[31];
+    t11 = re[71];
+    t16 = im[71];
+    t0 = t15 + t11;
+    t3 = t4 + t16;
+    t18 = C85 * t0;
+    t7 = t13 - t18;
+    t12 = C85 * t3;
+    t6 = t9 - t12;
+    t2 = t15 - t11;
+    t5 = C86 * t2;
+    t1 = t4 - t16;
+    t10 = C86 * t1;
+    t14 = t13 + t0;
+    t8 = t9 + t3;
+    t19 = t7 + t10;
+    t17 = t6 - t5;
+    t18 = t7 - t10;
+    t12 = t6 + t5;
+    t15 = (-C141) * t14;
+    t11 = (-C142) * t8;
+    t2 = t15 + t11;
+    t4 = 0.09377475550498254 * t2;
+    y[341] = t4;
+    t16 = 0.042680753490592846 * t2;
+    y[378] = t16;
+    t1 = C142 * t14;
+    t13 = (-C141) * t8;
+    t0 = t1 + t13;
+    t9 = 0.010127595928892156 * t0;
+    y[101] = t9;
+    t3 = (-0.08425593717085343) * t0;
+    y[138] = t3;
+    t7 = (-C143) * t19;
+    t10 = (-C144) * t17;
+    t6 = t7 + t10;
+    t5 = 0.09044476051911167 * t6;
+    y[261] = t5;
+    t15 = (-0.003106496364189138) * t6;
+    y[458] = t15;
+    t11 = C144 * t19;
+    t4 = (-C143) * t17;
+    t2 = t11 + t4;
+    y[21] = 0;
+    t16 = (-0.09213727014703564) * t2;
+    y[218] = t16;
+    t14 = C145 * t18;
+    t8 = C146 * t12;
+    t1 = t14 + t8;
+    y[58] = 0;
+    t13 = (-0.09244707397236758) * t1;
+    y[181] = t13;
+    t9 = (-C146) * t18;
+    t0 = C145 * t12;
+    t3 = t9 + t0;
+    t7 = 0.09014166674246678 * t3;
+    y[298] = t7;
+    t10 = (-0.009185219825295927) * t3;
+    y[421] = t10;
+    t5 = re[30];
+    t6 = im[30];
+    t15 = re[70];
+    t19 = im[70];
+    t17 = re[110];
+    t11 = im[110];
+    t4 = t15 + t17;
+    t2 = t19 + t11;
+    t16 = C85 * t4;
+    t14 = t5 - t16;
+    t8 = C85 * t2;
+    t1 = t6 - t8;
+    t13 = t15 - t17;
+    t18 = C86 * t13;
+    t12 = t19 - t11;
+    t9 = C86 * t12;
+    t0 = t5 + t4;
+    t7 = t6 + t2;
+    t3 = t14 + t9;
+    t10 = t1 - t18;
+    t16 = t14 - t9;
+    t8 = t1 + t18;
+    t15 = C147 * t0;
+    t17 = C148 * t7;
+    t13 = t15 + t17;
+    y[60] = 0;
+    t19 = (-0.09245244567865918) * t13;
+    y[179] = t19;
+    t11 = (-C148) * t0;
+    t12 = C147 * t7;
+    t5 = t11 + t12;
+    t4 = 0.09013642929791008 * t5;
+    y[300] = t4;
+    t6 = (-0.008644252539109377) * t5;
+    y[419] = t6;
+    t2 = (-C149) * t3;
+    t14 = (-C150) * t10;
+    t9 = t2 + t14;
+    t1 = 0.09379849794073448 * t9;
+    y[339] = t1;
+    t18 = 0.038368358115737966 * t9;
+    y[380] = t18;
+    t15 = C150 * t3;
+    t17 = (-C149) * t10;
+    t13 = t15 + t17;
+    t19 = 0.007312017970662098 * t13;
+    y[99] = t19;
+    t0 = (-0.08585194204681529) * t13;
+    y[140] = t0;
+    t7 = (-C151) * t16;
+    t11 = (-C152) * t8;
+    t12 = t7 + t11;
+    t4 = 0.09047736631347802 * t12;
+    y[259] = t4;
+    t5 = (-0.002556868825188347) * t12;
+    y[460] = t5;
+    t6 = C152 * t16;
+    t2 = (-C151) * t8;
+    t14 = t6 + t2;
+    y[19] = 0;
+    t1 = (-0.0921040661645779) * t14;
+    y[220] = t1;
+    t9 = re[69];
+    t18 = im[69];
+    t3 = re[109];
+    t10 = im[109];
+    t15 = re[29];
+    t17 = im[29];
+    t19 = t3 + t15;
+    t13 = t10 + t17;
+    t0 = C85 * t19;
+    t7 = t9 - t0;
+    t11 = C85 * t13;
+    t4 = t18 - t11;
+    t12 = t3 - t15;
+    t5 = C86 * t12;
+    t16 = t10 - t17;
+    t8 = C86 * t16;
+    t6 = t9 + t19;
+    t2 = t18 + t13;
+    t14 = t7 + t8;
+    t1 = t4 - t5;
+    t0 = t7 - t8;
+    t11 = t4 + t5;
+    t3 = (-C153) * t6;
+    t15 = (-C154) * t2;
+    t12 = t3 + t15;
+    t10 = 0.09051962918570353 * t12;
+    y[257] = t10;
+    t17 = (-0.0020558588746538045) * t12;
+    y[462] = t17;
+    t16 = C154 * t6;
+    t9 = (-C153) * t2;
+    t19 = t16 + t9;
+    y[17] = 0;
+    t18 = (-0.092061063531726) * t19;
+    y[222] = t18;
+    t13 = C155 * t14;
+    t7 = C156 * t1;
+    t8 = t13 + t7;
+    y[62] = 0;
+    t4 = (-0.09244769863880027) * t8;
+    y[177] = t4;
+    t5 = (-C156) * t14;
+    t3 = C155 * t1;
+    t15 = t5 + t3;
+    t10 = 0.0901410576578251 * t15;
+    y[302] = t10;
+    t12 = (-0.007964474361442294) * t15;
+    y[417] = t12;
+    t17 = (-C157) * t0;
+    t6 = (-C158) * t11;
+    t2 = t17 + t6;
+    t16 = 0.09365978084389547 * t2;
+    y[337] = t16;
+    t9 = 0.03415636549737041 * t2;
+    y[382] = t9;
+    t19 = C158 * t0;
+    t18 = (-C157) * t11;
+    t13 = t19 + t18;
+    t7 = 0.0050047570007893775 * t13;
+    y[97] = t7;
+    t8 = (-0.0871493500245666) * t13;
+    y[142] = t8;
+    t4 = re[108];
+    t14 = im[108];
+    t1 = re[28];
+    t5 = im[28];
+    t3 = re[68];
+    t10 = im[68];
+    t15 = t1 + t3;
+    t12 = t5 + t10;
+    t17 = C85 * t15;
+    t6 = t4 - t17;
+    t16 = C85 * t12;
+    t2 = t14 - t16;
+    t9 = t1 - t3;
+    t0 = C86 * t9;
+    t11 = t5 - t10;
+    t19 = C86 * t11;
+    t18 = t4 + t15;
+    t7 = t14 + t12;
+    t13 = t6 + t19;
+    t8 = t2 - t0;
+    t17 = t6 - t19;
+    t16 = t2 + t0;
+    t1 = (-C159) * t18;
+    t3 = (-C160) * t7;
+    t9 = t1 + t3;
+    t5 = 0.09340276040701101 * t9;
+    y[335] = t5;
+    t10 = 0.030076992374384853 * t9;
+    y[384] = t10;
+    t11 = C160 * t18;
+    t4 = (-C159) * t7;
+    t15 = t11 + t4;
+    t14 = 0.0031944649282448214 * t15;
+    y[95] = t14;
+    t12 = (-0.08819068515910766) * t15;
+    y[144] = t12;
+    t6 = (-C161) * t13;
+    t19 = (-C162) * t8;
+    t2 = t6 + t19;
+    t0 = 0.09057223570062113 * t2;
+    y[255] = t0;
+    t1 = (-0.0016093731094369787) * t2;
+    y[464] = t1;
+    t3 = C162 * t13;
+    t5 = (-C161) * t8;
+    t9 = t3 + t5;
+    y[15] = 0;
+    t10 = (-0.092007592270091) * t9;
+    y[224] = t10;
+    t18 = C163 * t17;
+    t7 = C164 * t16;
+    t11 = t18 + t7;
+    y[64] = 0;
+    t4 = (-0.09243093246183026) * t11;
+    y[175] = t4;
+    t14 = (-C164) * t17;
+    t15 = C163 * t16;
+    t12 = t14 + t15;
+    t6 = 0.09015740847118053 * t12;
+    y[304] = t6;
+    t19 = (-0.00713921434866316) * t12;
+    y[415] = t19;
+}
+
+/**
+ *  Part 4 of ApplyWindowedIMDCT_W10_240().
+ * 
+ *  @param {Number[]} X 
+ *    - The input block (240 points).
+ *  @param {Number[]} y 
+ *    - The array that would contain the output block (480 points).
+ *  @param {Number[]} re 
+ *    - The scratch buffer (real part, 120 points).
+ *  @param {Number[]} im 
+ *    - The scratch buffer (imaginary part, 120 points).
+ */
+function ApplyWindowedIMDCT_W10_240_Part4(X, y, re, im) {
+    let t0, t1, t10, t11, t12, t13, t14, t15, t16, t17, t18, t19, t2, t3, t4, t5, t6, t7, t8, t9;
+    const C0 = 0.5;
+    const C1 = 0.8660254037844386;
+    const C2 = 0.34304498527233984;
+    const C3 = 0.9393189756837131;
+    const C4 = 0.984996587835043;
+    const C5 = 0.1725738159551517;
+    const C6 = 0.7667451597285615;
+    const C7 = 0.641951602562703;
+    const C8 = 0.758276583956687;
+    const C9 = 0.6519329890586743;
+    const C10 = 0.3307202902720374;
+    const C11 = 0.9437288220682779;
+    const C12 = 0.9826532793307118;
+    const C13 = 0.18545223811159092;
+    const C14 = 0.9801415982456801;
+    const C15 = 0.19829888398174045;
+    const C16 = 0.74967808139577;
+    const C17 = 0.6618026701931303;
+    const C18 = 0.3183389280525497;
+    const C19 = 0.9479769653775104;
+    const C20 = 0.30590302009655346;
+    const C21 = 0.9520626777139243;
+    const C22 = 0.9774619749435719;
+    const C23 = 0.21111155235896514;
+    const C24 = 0.7409511253549591;
+    const C25 = 0.6715589548470183;
+    const C26 = 0.7320972111532454;
+    const C27 = 0.6812001713311883;
+    const C28 = 0.2934146972328567;
+    const C29 = 0.9559852590117439;
+    const C30 = 0.974614868564045;
+    const C31 = 0.22388804785849836;
+    const C32 = 0.9716007669441208;
+    const C33 = 0.23662618129360988;
+    const C34 = 0.7231178558632475;
+    const C35 = 0.6907246676728287;
+    const C36 = 0.2808760992712921;
+    const C37 = 0.9597440371568574;
+    const C38 = 0.2682893746360714;
+    const C39 = 0.9633383681019799;
+    const C40 = 0.968420186534595;
+    const C41 = 0.24932377005071168;
+    const C42 = 0.7140145980512682;
+    const C43 = 0.7001308118985237;
+    const C44 = 0.7047889975136701;
+    const C45 = 0.709416992313883;
+    const C46 = 0.2556566799976644;
+    const C47 = 0.9667676359770075;
+    const C48 = 0.9650736723115474;
+    const C49 = 0.26197863846333747;
+    const C50 = 0.9615617976829619;
+    const C51 = 0.27458861818493235;
+    const C52 = 0.6954426350096117;
+    const C53 = 0.7185816177796981;
+    const C54 = 0.24298017990326387;
+    const C55 = 0.970031253194544;
+    const C56 = 0.23026204640590237;
+    const C57 = 0.97312866055058;
+    const C58 = 0.9578851643904772;
+    const C59 = 0.2871515485603873;
+    const C60 = 0.6859771119901928;
+    const C61 = 0.7276231179845748;
+    const C62 = 0.6763940503240542;
+    const C63 = 0.736539943713999;
+    const C64 = 0.21750445869228147;
+    const C65 = 0.9760593273203108;
+    const C66 = 0.9540444024062804;
+    const C67 = 0.2996652769962566;
+    const C68 = 0.9500401698251654;
+    const C69 = 0.3121276593295937;
+    const C70 = 0.6666950920194786;
+    const C71 = 0.7453305671157858;
+    const C72 = 0.2047096027093796;
+    const C73 = 0.9788227513490724;
+    const C74 = 0.19187967078990142;
+    const C75 = 0.9814184591383835;
+    const C76 = 0.945873152751771;
+    const C77 = 0.32453656019534216;
+    const C78 = 0.6568818989430413;
+    const C79 = 0.7539934819618695;
+    const C80 = 0.6469561525348573;
+    const C81 = 0.7625272039063882;
+    const C82 = 0.17901686127663266;
+    const C83 = 0.9838460059270774;
+    const C84 = 0.9415440651830208;
+    const C85 = 0.33688985339222005;
+    const C86 = 0.9370536488857836;
+    const C87 = 0.34918542224703286;
+    const C88 = 0.6369195535204759;
+    const C89 = 0.7709302707400181;
+    const C90 = 0.16612337814576547;
+    const C91 = 0.9861049757675088;
+    const C92 = 0.15320143062925848;
+    const C93 = 0.9881949815968246;
+    const C94 = 0.9324026732697752;
+    const C95 = 0.361421159977355;
+    const C96 = 0.6267738216194696;
+    const C97 = 0.7792012426405167;
+    const C98 = 0.6165206952507691;
+    const C99 = 0.7873387024194278;
+    const C100 = 0.14025323283629626;
+    const C101 = 0.9901156653032855;
+    const C102 = 0.927591935255724;
+    const C103 = 0.37359497005251635;
+    const C104 = 0.9226222591388232;
+    const C105 = 0.3857047665528313;
+    const C106 = 0.6061619312347947;
+    const C107 = 0.79534125576491;
+    const C108 = 0.1272810033739132;
+    const C109 = 0.991866697787626;
+    const C110 = 0.1142869649668464;
+    const C111 = 0.9934477790194444;
+    const C112 = 0.9174944964474913;
+    const C113 = 0.39774847452701106;
+    const C114 = 0.5956993044924334;
+    const C115 = 0.8032075314806449;
+    const C116 = 0.5851346077409155;
+    const C117 = 0.8109361817207843;
+    const C118 = 0.10127334407668342;
+    const C119 = 0.9948586380886109;
+    const C120 = 0.9122095257974677;
+    const C121 = 0.4097240303476953;
+    const C122 = 0.9067682527412662;
+    const C123 = 0.4216293820650445;
+    const C124 = 0.5744696511866426;
+    const C125 = 0.8185258822208966;
+    const C126 = 0.08824237052036951;
+    const C127 = 0.9960990332516871;
+    const C128 = 0.0751962770881399;
+    const C129 = 0.9971687519733476;
+    const C130 = 0.9011716096130131;
+    const C131 = 0.4334624897583309;
+    const C132 = 0.5637062622150166;
+    const C133 = 0.8259753325248732;
+    const C134 = 0.5528462850773279;
+    const C135 = 0.8332832562077542;
+    const C136 = 0.062137299160942724;
+    const C137 = 0.9980676109627962;
+    const C138 = 0.895420555368697;
+    const C139 = 0.4452213258854682;
+    const C140 = 0.8895160754218561;
+    const C141 = 0.4569038756304206;
+    const C142 = 0.5418915805747517;
+    const C143 = 0.840448401094438;
+    const C144 = 0.049067674327418015;
+    const C145 = 0.9987954562051724;
+    const C146 = 0.035989642000498374;
+    const C147 = 0.9993521629879409;
+    const C148 = 0.8834591814747328;
+    const C149 = 0.46850813724843143;
+    const C150 = 0.5308440257395095;
+    const C151 = 0.8474695394742344;
+    const C152 = 0.5197055135132492;
+    const C153 = 0.8543454683112272;
+    const C154 = 0.02290544303369714;
+    const C155 = 0.9997376359222604;
+    const C156 = 0.8772509113449243;
+    const C157 = 0.4800321224090111;
+    const C158 = 0.8708923287875567;
+    const C159 = 0.49147385653662823;
+    const C160 = 0.5084779524226998;
+    const C161 = 0.861075009450407;
+    const C162 = 0.009817319337149617;
+    const C163 = 0.999951808959328;
+    t0 = re[27];
+    t2 = im[27];
+    t1 = re[67];
+    t13 = im[67];
+    t8 = re[107];
+    t3 = im[107];
+    t5 = t1 + t8;
+    t9 = t13 + t3;
+    t10 = C0 * t5;
+    t18 = t0 - t10;
+    t7 = C0 * t9;
+    t11 = t2 - t7;
+    t4 = t1 - t8;
+    t17 = C1 * t4;
+    t16 = t13 - t3;
+    t14 = C1 * t16;
+    t15 = t0 + t5;
+    t6 = t2 + t9;
+    t12 = t18 + t14;
+    t19 = t11 - t17;
+    t10 = t18 - t14;
+    t7 = t11 + t17;
+    t1 = C2 * t15;
+    t8 = C3 * t6;
+    t4 = t1 + t8;
+    y[66] = 0;
+    t13 = (-0.09240025394681477) * t4;
+    y[173] = t13;
+    t3 = (-C3) * t15;
+    t16 = C2 * t6;
+    t0 = t3 + t16;
+    t5 = 0.09018734232191579 * t0;
+    y[306] = t5;
+    t2 = (-0.006160480419908887) * t0;
+    y[413] = t2;
+    t9 = (-C4) * t12;
+    t18 = (-C5) * t19;
+    t14 = t9 + t18;
+    t11 = 0.09306915998476316 * t14;
+    y[333] = t11;
+    t17 = 0.026158716441240817 * t14;
+    y[386] = t17;
+    t1 = C5 * t12;
+    t8 = (-C4) * t19;
+    t4 = t1 + t8;
+    t13 = 0.0018479886878230783 * t4;
+    y[93] = t13;
+    t15 = (-0.08901973889759318) * t4;
+    y[146] = t15;
+    t6 = (-C6) * t10;
+    t3 = (-C7) * t7;
+    t16 = t6 + t3;
+    t5 = 0.09063548315755285 * t16;
+    y[253] = t5;
+    t0 = (-0.0012211593971509166) * t16;
+    y[466] = t0;
+    t2 = C7 * t10;
+    t9 = (-C6) * t7;
+    t18 = t2 + t9;
+    y[13] = 0;
+    t11 = (-0.09194338732488894) * t18;
+    y[226] = t11;
+    t14 = re[66];
+    t17 = im[66];
+    t12 = re[106];
+    t19 = im[106];
+    t1 = re[26];
+    t8 = im[26];
+    t13 = t12 + t1;
+    t4 = t19 + t8;
+    t15 = C0 * t13;
+    t6 = t14 - t15;
+    t3 = C0 * t4;
+    t5 = t17 - t3;
+    t16 = t12 - t1;
+    t0 = C1 * t16;
+    t10 = t19 - t8;
+    t7 = C1 * t10;
+    t2 = t14 + t13;
+    t9 = t17 + t4;
+    t18 = t6 + t7;
+    t11 = t5 - t0;
+    t15 = t6 - t7;
+    t3 = t5 + t0;
+    t12 = (-C8) * t2;
+    t1 = (-C9) * t9;
+    t16 = t12 + t1;
+    t19 = 0.0907092475124274 * t16;
+    y[251] = t19;
+    t8 = (-0.0008932729373177886) * t16;
+    y[468] = t8;
+    t10 = C9 * t2;
+    t14 = (-C8) * t9;
+    t13 = t10 + t14;
+    y[11] = 0;
+    t17 = (-0.09186861937303194) * t13;
+    y[228] = t17;
+    t4 = C10 * t18;
+    t6 = C11 * t11;
+    t7 = t4 + t6;
+    y[68] = 0;
+    t5 = (-0.09235379845708279) * t7;
+    y[171] = t5;
+    t0 = (-C11) * t18;
+    t12 = C10 * t11;
+    t1 = t0 + t12;
+    t19 = 0.09023270804834159 * t1;
+    y[308] = t19;
+    t16 = (-0.005020331172090252) * t1;
+    y[411] = t16;
+    t8 = (-C12) * t15;
+    t2 = (-C13) * t3;
+    t9 = t8 + t2;
+    t10 = 0.09269655281084341 * t9;
+    y[331] = t10;
+    t14 = 0.02242428004659937 * t9;
+    y[388] = t14;
+    t13 = C13 * t15;
+    t17 = (-C12) * t3;
+    t4 = t13 + t17;
+    t6 = 0.0009125736608240058 * t4;
+    y[91] = t6;
+    t7 = (-0.0896783027408053) * t4;
+    y[148] = t7;
+    t5 = re[105];
+    t18 = im[105];
+    t11 = re[25];
+    t0 = im[25];
+    t12 = re[65];
+    t19 = im[65];
+    t1 = t11 + t12;
+    t16 = t0 + t19;
+    t8 = C0 * t1;
+    t2 = t5 - t8;
+    t10 = C0 * t16;
+    t9 = t18 - t10;
+    t14 = t11 - t12;
+    t15 = C1 * t14;
+    t3 = t0 - t19;
+    t13 = C1 * t3;
+    t17 = t5 + t1;
+    t6 = t18 + t16;
+    t4 = t2 + t13;
+    t7 = t9 - t15;
+    t8 = t2 - t13;
+    t10 = t9 + t15;
+    t11 = (-C14) * t17;
+    t12 = (-C15) * t6;
+    t14 = t11 + t12;
+    t0 = 0.0923510349517541 * t14;
+    y[329] = t0;
+    t19 = 0.01889140710216753 * t14;
+    y[390] = t19;
+    t3 = C15 * t17;
+    t5 = (-C14) * t6;
+    t1 = t3 + t5;
+    y[89] = 0;
+    t18 = (-0.09023540816501756) * t1;
+    y[150] = t18;
+    t16 = (-C16) * t4;
+    t2 = (-C17) * t7;
+    t13 = t16 + t2;
+    t9 = 0.09079298461985869 * t13;
+    y[249] = t9;
+    t15 = (-0.0006246989869539086) * t13;
+    y[470] = t15;
+    t11 = C17 * t4;
+    t12 = (-C16) * t7;
+    t0 = t11 + t12;
+    y[9] = 0;
+    t14 = (-0.09178389022262212) * t0;
+    y[230] = t14;
+    t19 = C18 * t8;
+    t17 = C19 * t10;
+    t6 = t19 + t17;
+    y[70] = 0;
+    t3 = (-0.09228962014198679) * t6;
+    y[169] = t3;
+    t5 = (-C19) * t8;
+    t1 = C18 * t10;
+    t18 = t5 + t1;
+    t16 = 0.09029545598424361 * t18;
+    y[310] = t16;
+    t2 = (-0.003709325825660647) * t18;
+    y[409] = t2;
+    t9 = re[24];
+    t13 = im[24];
+    t15 = re[64];
+    t4 = im[64];
+    t7 = re[104];
+    t11 = im[104];
+    t12 = t15 + t7;
+    t0 = t4 + t11;
+    t14 = C0 * t12;
+    t19 = t9 - t14;
+    t17 = C0 * t0;
+    t6 = t13 - t17;
+    t3 = t15 - t7;
+    t8 = C1 * t3;
+    t10 = t4 - t11;
+    t5 = C1 * t10;
+    t1 = t9 + t12;
+    t16 = t13 + t0;
+    t18 = t19 + t5;
+    t2 = t6 - t8;
+    t14 = t19 - t5;
+    t17 = t6 + t8;
+    t15 = C20 * t1;
+    t7 = C21 * t16;
+    t3 = t15 + t7;
+    y[72] = 0;
+    t4 = (-0.09220563580151571) * t3;
+    y[167] = t4;
+    t11 = (-C21) * t1;
+    t10 = C20 * t16;
+    t9 = t11 + t10;
+    t12 = 0.09037770046151931 * t9;
+    y[312] = t12;
+    t13 = (-0.0022183882598526463) * t9;
+    y[407] = t13;
+    t0 = (-C22) * t18;
+    t19 = (-C23) * t2;
+    t5 = t0 + t19;
+    t6 = 0.0919501276997701 * t5;
+    y[327] = t6;
+    t8 = 0.015573164605041014 * t5;
+    y[392] = t8;
+    t15 = C23 * t18;
+    t7 = (-C22) * t2;
+    t3 = t15 + t7;
+    y[87] = 0;
+    t4 = (-0.09062883915227195) * t3;
+    y[152] = t4;
+    t1 = (-C24) * t14;
+    t16 = (-C25) * t17;
+    t11 = t1 + t16;
+    t10 = 0.09088573803577533 * t11;
+    y[247] = t10;
+    t12 = (-0.0004130921772342458) * t11;
+    y[472] = t12;
+    t9 = C25 * t14;
+    t13 = (-C24) * t17;
+    t0 = t9 + t13;
+    y[7] = 0;
+    t19 = (-0.09169022019772878) * t0;
+    y[232] = t19;
+    t6 = re[63];
+    t5 = im[63];
+    t8 = re[103];
+    t18 = im[103];
+    t2 = re[23];
+    t15 = im[23];
+    t7 = t8 + t2;
+    t3 = t18 + t15;
+    t4 = C0 * t7;
+    t1 = t6 - t4;
+    t16 = C0 * t3;
+    t10 = t5 - t16;
+    t11 = t8 - t2;
+    t12 = C1 * t11;
+    t14 = t18 - t15;
+    t17 = C1 * t14;
+    t9 = t6 + t7;
+    t13 = t5 + t3;
+    t0 = t1 + t17;
+    t19 = t10 - t12;
+    t4 = t1 - t17;
+    t16 = t10 + t12;
+    t8 = (-C26) * t9;
+    t2 = (-C27) * t13;
+    t11 = t8 + t2;
+    t18 = 0.09098616076102845 * t11;
+    y[245] = t18;
+    t15 = (-0.0002536339642894417) * t11;
+    y[474] = t15;
+    t14 = C27 * t9;
+    t6 = (-C26) * t13;
+    t7 = t14 + t6;
+    y[5] = 0;
+    t5 = (-0.0915890203920188) * t7;
+    y[234] = t5;
+    t3 = C28 * t0;
+    t1 = C29 * t19;
+    t17 = t3 + t1;
+    y[74] = 0;
+    t10 = (-0.09209942840309658) * t17;
+    y[165] = t10;
+    t12 = (-C29) * t0;
+    t8 = C28 * t19;
+    t2 = t12 + t8;
+    t18 = 0.0904819223943538 * t2;
+    y[314] = t18;
+    t11 = (-0.0005378119076130155) * t2;
+    y[405] = t11;
+    t15 = (-C30) * t4;
+    t9 = (-C31) * t16;
+    t13 = t15 + t9;
+    t14 = 0.09160734286600784 * t13;
+    y[325] = t14;
+    t6 = 0.012478133323927637 * t13;
+    y[394] = t6;
+    t7 = C31 * t4;
+    t5 = (-C30) * t16;
+    t3 = t7 + t5;
+    y[85] = 0;
+    t1 = (-0.09096796253027797) * t3;
+    y[154] = t1;
+    t17 = re[102];
+    t10 = im[102];
+    t0 = re[22];
+    t19 = im[22];
+    t12 = re[62];
+    t8 = im[62];
+    t18 = t0 + t12;
+    t2 = t19 + t8;
+    t11 = C0 * t18;
+    t15 = t17 - t11;
+    t9 = C0 * t2;
+    t14 = t10 - t9;
+    t13 = t0 - t12;
+    t6 = C1 * t13;
+    t4 = t19 - t8;
+    t16 = C1 * t4;
+    t7 = t17 + t18;
+    t5 = t10 + t2;
+    t3 = t15 + t16;
+    t1 = t14 - t6;
+    t11 = t15 - t16;
+    t9 = t14 + t6;
+    t0 = (-C32) * t7;
+    t12 = (-C33) * t5;
+    t13 = t0 + t12;
+    t19 = 0.0913148375512127 * t13;
+    y[323] = t19;
+    t8 = 0.009610222402322096 * t13;
+    y[396] = t8;
+    t4 = C33 * t7;
+    t17 = (-C32) * t5;
+    t18 = t4 + t17;
+    y[83] = 0;
+    t10 = (-0.09125935671363042) * t18;
+    y[156] = t10;
+    t2 = (-C34) * t3;
+    t15 = (-C35) * t1;
+    t16 = t2 + t15;
+    t14 = 0.09109256795830346 * t16;
+    y[243] = t14;
+    t6 = (-0.00013998679778220064) * t16;
+    y[476] = t6;
+    t0 = C35 * t3;
+    t12 = (-C34) * t1;
+    t19 = t0 + t12;
+    y[3] = 0;
+    t13 = (-0.09148203327792692) * t19;
+    y[236] = t13;
+    t8 = C36 * t11;
+    t7 = C37 * t9;
+    t5 = t8 + t7;
+    y[76] = 0;
+    t4 = (-0.09196817316373651) * t5;
+    y[163] = t4;
+    t17 = (-C37) * t11;
+    t18 = C36 * t9;
+    t10 = t17 + t18;
+    t2 = 0.09061105648469268 * t10;
+    y[316] = t2;
+    t15 = 0.0013420618236381805 * t10;
+    y[403] = t15;
+    t14 = re[21];
+    t16 = im[21];
+    t6 = re[61];
+    t3 = im[61];
+    t1 = re[101];
+    t0 = im[101];
+    t12 = t6 + t1;
+    t19 = t3 + t0;
+    t13 = C0 * t12;
+    t8 = t14 - t13;
+    t7 = C0 * t19;
+    t5 = t16 - t7;
+    t4 = t6 - t1;
+    t11 = C1 * t4;
+    t9 = t3 - t0;
+    t17 = C1 * t9;
+    t18 = t14 + t12;
+    t2 = t16 + t19;
+    t10 = t8 + t17;
+    t15 = t5 - t11;
+    t13 = t8 - t17;
+    t7 = t5 + t11;
+    t6 = C38 * t18;
+    t1 = C39 * t2;
+    t4 = t6 + t1;
+    y[78] = 0;
+    t3 = (-0.09180855561597562) * t4;
+    y[161] = t3;
+    t0 = (-C39) * t18;
+    t9 = C38 * t2;
+    t14 = t0 + t9;
+    t12 = 0.0907685920709905 * t14;
+    y[318] = t12;
+    t16 = 0.0034302519777189918 * t14;
+    y[401] = t16;
+    t19 = (-C40) * t10;
+    t8 = (-C41) * t15;
+    t17 = t19 + t8;
+    t5 = 0.09106723054204843 * t17;
+    y[321] = t5;
+    t11 = 0.006970132619098952 * t17;
+    y[398] = t11;
+    t6 = C41 * t10;
+    t1 = (-C40) * t15;
+    t4 = t6 + t1;
+    y[81] = 0;
+    t3 = (-0.09150748610374818) * t4;
+    y[158] = t3;
+    t18 = (-C42) * t13;
+    t2 = (-C43) * t7;
+    t0 = t18 + t2;
+    t9 = 0.09120297040746775 * t0;
+    y[241] = t9;
+    t12 = (-6.461799509184562e-05) * t0;
+    y[478] = t12;
+    t14 = C43 * t13;
+    t16 = (-C42) * t7;
+    t19 = t14 + t16;
+    y[1] = 0;
+    t8 = (-0.0913712930193225) * t19;
+    y[238] = t8;
+    t5 = re[60];
+    t17 = im[60];
+    t11 = re[100];
+    t10 = im[100];
+    t15 = re[20];
+    t6 = im[20];
+    t1 = t11 + t15;
+    t4 = t10 + t6;
+    t3 = C0 * t1;
+    t18 = t5 - t3;
+    t2 = C0 * t4;
+    t9 = t17 - t2;
+    t0 = t11 - t15;
+    t12 = C1 * t0;
+    t13 = t10 - t6;
+    t7 = C1 * t13;
+    t14 = t5 + t1;
+    t16 = t17 + t4;
+    t19 = t18 + t7;
+    t8 = t9 - t12;
+    t3 = t18 - t7;
+    t2 = t9 + t12;
+    t11 = C44 * t14;
+    t15 = C45 * t16;
+    t0 = t11 + t15;
+    y[0] = 0;
+    t10 = (-0.09131522703664538) * t0;
+    y[239] = t10;
+    t6 = (-C45) * t14;
+    t13 = C44 * t16;
+    t5 = t6 + t13;
+    t1 = 0.09125896746650057 * t5;
+    y[240] = t1;
+    t17 = (-3.298655833518676e-05) * t5;
+    y[479] = t17;
+    t4 = C46 * t19;
+    t18 = C47 * t8;
+    t7 = t4 + t18;
+    y[80] = 0;
+    t9 = (-0.09161677326719576) * t7;
+    y[159] = t9;
+    t12 = (-C47) * t19;
+    t11 = C46 * t8;
+    t15 = t12 + t11;
+    t0 = 0.09095859891320969 * t15;
+    y[320] = t0;
+    t10 = 0.005734686242618052 * t15;
+    y[399] = t10;
+    t14 = (-C48) * t3;
+    t16 = (-C49) * t2;
+    t6 = t14 + t16;
+    t13 = 0.09085926593715277 * t6;
+    y[319] = t13;
+    t1 = 0.004554985403384171 * t6;
+    y[400] = t1;
+    t5 = C49 * t3;
+    t17 = (-C48) * t2;
+    t4 = t5 + t17;
+    y[79] = 0;
+    t18 = (-0.09171693439717513) * t4;
+    y[160] = t18;
+    t7 = re[99];
+    t9 = im[99];
+    t19 = re[19];
+    t8 = im[19];
+    t12 = re[59];
+    t11 = im[59];
+    t0 = t19 + t12;
+    t15 = t8 + t11;
+    t10 = C0 * t0;
+    t14 = t7 - t10;
+    t16 = C0 * t15;
+    t13 = t9 - t16;
+    t6 = t19 - t12;
+    t1 = C1 * t6;
+    t3 = t8 - t11;
+    t2 = C1 * t3;
+    t5 = t7 + t0;
+    t17 = t9 + t15;
+    t4 = t14 + t2;
+    t18 = t13 - t1;
+    t10 = t14 - t2;
+    t16 = t13 + t1;
+    t19 = (-C50) * t5;
+    t12 = (-C51) * t17;
+    t6 = t19 + t12;
+    t8 = 0.09068604919647034 * t6;
+    y[317] = t8;
+    t11 = 0.002359532354512745 * t6;
+    y[402] = t11;
+    t3 = C51 * t5;
+    t7 = (-C50) * t17;
+    t0 = t3 + t7;
+    y[77] = 0;
+    t9 = (-0.09189212020119278) * t0;
+    y[162] = t9;
+    t15 = C52 * t4;
+    t14 = C53 * t18;
+    t2 = t15 + t14;
+    y[2] = 0;
+    t13 = (-0.09142700285638952) * t2;
+    y[237] = t13;
+    t1 = (-C53) * t4;
+    t19 = C52 * t18;
+    t12 = t1 + t19;
+    t8 = 0.09114739708161547 * t12;
+    y[242] = t8;
+    t6 = (-9.808283613558938e-05) * t12;
+    y[477] = t6;
+    t11 = C54 * t10;
+    t5 = C55 * t16;
+    t17 = t11 + t5;
+    y[82] = 0;
+    t3 = (-0.09138855060144747) * t17;
+    y[157] = t3;
+    t7 = (-C55) * t10;
+    t0 = C54 * t16;
+    t9 = t7 + t0;
+    t15 = 0.09118574786983594 * t9;
+    y[322] = t15;
+    t14 = 0.008261818993155777 * t9;
+    y[397] = t14;
+    t2 = re[18];
+    t13 = im[18];
+    t4 = re[58];
+    t18 = im[58];
+    t1 = re[98];
+    t19 = im[98];
+    t8 = t4 + t1;
+    t12 = t18 + t19;
+    t6 = C0 * t8;
+    t11 = t2 - t6;
+    t5 = C0 * t12;
+    t17 = t13 - t5;
+    t3 = t4 - t1;
+    t10 = C1 * t3;
+    t16 = t18 - t19;
+    t7 = C1 * t16;
+    t0 = t2 + t8;
+    t15 = t13 + t12;
+    t9 = t11 + t7;
+    t14 = t17 - t10;
+    t6 = t11 - t7;
+    t5 = t17 + t10;
+    t4 = C56 * t0;
+    t1 = C57 * t15;
+    t3 = t4 + t1;
+    y[84] = 0;
+    t18 = (-0.09111936155223256) * t3;
+    y[155] = t18;
+    t19 = (-C57) * t0;
+    t16 = C56 * t15;
+    t2 = t19 + t16;
+    t8 = 0.09145513304059315 * t2;
+    y[324] = t8;
+    t13 = 0.011015645156279247 * t2;
+    y[395] = t13;
+    t12 = (-C58) * t9;
+    t11 = (-C59) * t14;
+    t7 = t12 + t11;
+    t17 = 0.09054319692897142 * t7;
+    y[315] = t17;
+    t10 = 0.00037670493957557815 * t7;
+    y[404] = t10;
+    t4 = C59 * t9;
+    t1 = (-C58) * t14;
+    t3 = t4 + t1;
+    y[75] = 0;
+    t18 = (-0.092037100698693) * t3;
+    y[164] = t18;
+    t0 = C60 * t6;
+    t15 = C61 * t5;
+    t19 = t0 + t15;
+    y[4] = 0;
+    t16 = (-0.09153613427519382) * t19;
+    y[235] = t16;
+    t8 = (-C61) * t6;
+    t2 = C60 * t5;
+    t13 = t8 + t2;
+    t12 = 0.09103872912395485 * t13;
+    y[244] = t12;
+    t11 = (-0.00019153837094621886) * t13;
+    y[475] = t11;
+    t17 = re[57];
+    t7 = im[57];
+    t10 = re[97];
+    t9 = im[97];
+    t14 = re[17];
+    t4 = im[17];
+    t1 = t10 + t14;
+    t3 = t9 + t4;
+    t18 = C0 * t1;
+    t0 = t17 - t18;
+    t15 = C0 * t3;
+    t19 = t7 - t15;
+    t16 = t10 - t14;
+    t6 = C1 * t16;
+    t5 = t9 - t4;
+    t8 = C1 * t5;
+    t2 = t17 + t1;
+    t12 = t7 + t3;
+    t13 = t0 + t8;
+    t11 = t19 - t6;
+    t18 = t0 - t8;
+    t15 = t19 + t6;
+    t10 = C62 * t2;
+    t14 = C63 * t12;
+    t16 = t10 + t14;
+    y[6] = 0;
+    t9 = (-0.09164045923745048) * t16;
+    y[233] = t9;
+    t4 = (-C63) * t2;
+    t5 = C62 * t12;
+    t17 = t4 + t5;
+    t1 = 0.09093508918086882 * t17;
+    y[246] = t1;
+    t7 = (-0.000327184801096971) * t17;
+    y[473] = t7;
+    t3 = C64 * t13;
+    t0 = C65 * t11;
+    t8 = t3 + t0;
+    y[86] = 0;
+    t19 = (-0.09080463044634797) * t8;
+    y[153] = t19;
+    t6 = (-C65) * t13;
+    t10 = C64 * t11;
+    t14 = t6 + t10;
+    t16 = 0.0917721188046362 * t14;
+    y[326] = t16;
+    t9 = 0.013997450622315546 * t14;
+    y[393] = t9;
+    t2 = (-C66) * t18;
+    t12 = (-C67) * t15;
+    t4 = t2 + t12;
+    t5 = 0.09042691251422759 * t4;
+    y[313] = t5;
+    t1 = (-0.0014024705571618484) * t4;
+    y[406] = t1;
+    t17 = C67 * t18;
+    t7 = (-C66) * t15;
+    t3 = t17 + t7;
+    y[73] = 0;
+    t0 = (-0.09215545573362552) * t3;
+    y[166] = t0;
+    t8 = re[96];
+    t19 = im[96];
+    t13 = re[16];
+    t11 = im[16];
+    t6 = re[56];
+    t10 = im[56];
+    t16 = t13 + t6;
+    t14 = t11 + t10;
+    t9 = C0 * t16;
+    t2 = t8 - t9;
+    t12 = C0 * t14;
+    t5 = t19 - t12;
+    t4 = t13 - t6;
+    t1 = C1 * t4;
+    t18 = t11 - t10;
+    t15 = C1 * t18;
+    t17 = t8 + t16;
+    t7 = t19 + t14;
+    t3 = t2 + t15;
+    t0 = t5 - t1;
+    t9 = t2 - t15;
+    t12 = t5 + t1;
+    t13 = (-C68) * t17;
+    t6 = (-C69) * t7;
+    t4 = t13 + t6;
+    t11 = 0.09033400449355983 * t4;
+    y[311] = t11;
+    t10 = (-0.0029869552982565196) * t4;
+    y[408] = t10;
+    t18 = C69 * t17;
+    t8 = (-C68) * t7;
+    t16 = t18 + t8;
+    y[71] = 0;
+    t19 = (-0.0922502371067524) * t16;
+    y[168] = t19;
+    t14 = C70 * t3;
+    t2 = C71 * t0;
+    t15 = t14 + t2;
+    y[8] = 0;
+    t5 = (-0.09173810125628178) * t15;
+    y[231] = t5;
+    t1 = (-C71) * t3;
+    t13 = C70 * t0;
+    t6 = t1 + t13;
+    t11 = 0.09083830185293602 * t6;
+    y[248] = t11;
+    t4 = (-0.0005120591773015618) * t6;
+    y[471] = t4;
+    t10 = C72 * t9;
+    t17 = C73 * t12;
+    t7 = t10 + t17;
+    y[88] = 0;
+    t18 = (-0.09043994865628115) * t7;
+    y[151] = t18;
+    t8 = (-C73) * t9;
+    t16 = C72 * t12;
+    t19 = t8 + t16;
+    t14 = 0.09214217231595667 * t19;
+    y[328] = t14;
+    t2 = 0.01720475415329727 * t19;
+    y[391] = t2;
+    t15 = re[15];
+    t5 = im[15];
+    t3 = re[55];
+    t0 = im[55];
+    t1 = re[95];
+    t13 = im[95];
+    t11 = t3 + t1;
+    t6 = t0 + t13;
+    t4 = C0 * t11;
+    t10 = t15 - t4;
+    t17 = C0 * t6;
+    t7 = t5 - t17;
+    t18 = t3 - t1;
+    t9 = C1 * t18;
+    t12 = t0 - t13;
+    t8 = C1 * t12;
+    t16 = t15 + t11;
+    t14 = t5 + t6;
+    t19 = t10 + t8;
+    t2 = t7 - t9;
+    t4 = t10 - t8;
+    t17 = t7 + t9;
+    t3 = C74 * t16;
+    t1 = C75 * t14;
+    t18 = t3 + t1;
+    t0 = 0.0004842994894200067 * t18;
+    y[90] = t0;
+    t13 = (-0.0899666037574483) * t18;
+    y[149] = t13;
+    t12 = (-C75) * t16;
+    t15 = C74 * t14;
+    t11 = t12 + t15;
+    t5 = 0.09251590088378046 * t11;
+    y[330] = t5;
+    t6 = 0.0206317319699406 * t11;
+    y[389] = t6;
+    t10 = (-C76) * t19;
+    t8 = (-C77) * t2;
+    t7 = t10 + t8;
+    t9 = 0.09026179621523889 * t7;
+    y[309] = t9;
+    t3 = (-0.004386750516852225) * t7;
+    y[410] = t3;
+    t1 = C77 * t19;
+    t0 = (-C76) * t2;
+    t18 = t1 + t0;
+    y[69] = 0;
+    t13 = (-0.0923240361122618) * t18;
+    y[170] = t13;
+    t16 = C78 * t4;
+    t14 = C79 * t17;
+    t12 = t16 + t14;
+    y[10] = 0;
+    t15 = (-0.09182744168049195) * t12;
+    y[229] = t15;
+    t5 = (-C79) * t4;
+    t11 = C78 * t17;
+    t6 = t5 + t11;
+    t10 = 0.0907499237790884 * t6;
+    y[250] = t10;
+    t8 = (-0.0007516557620710143) * t6;
+    y[469] = t8;
+    t9 = re[54];
+    t7 = im[54];
+    t3 = re[94];
+    t19 = im[94];
+    t2 = re[14];
+    t1 = im[14];
+    t0 = t3 + t2;
+    t18 = t19 + t1;
+    t13 = C0 * t0;
+    t16 = t9 - t13;
+    t14 = C0 * t18;
+    t12 = t7 - t14;
+    t15 = t3 - t2;
+    t4 = C1 * t15;
+    t17 = t19 - t1;
+    t5 = C1 * t17;
+    t11 = t9 + t0;
+    t10 = t7 + t18;
+    t6 = t16 + t5;
+    t8 = t12 - t4;
+    t13 = t16 - t5;
+    t14 = t12 + t4;
+    t3 = C80 * t11;
+    t2 = C81 * t10;
+    t15 = t3 + t2;
+    y[12] = 0;
+    t19 = (-0.09190729083812124) * t15;
+    y[227] = t19;
+    t1 = (-C81) * t11;
+    t17 = C80 * t10;
+    t9 = t1 + t17;
+    t0 = 0.09067108014326149 * t9;
+    y[252] = t0;
+    t7 = (-0.0010496923007052756) * t9;
+    y[467] = t7;
+    t18 = C82 * t6;
+    t16 = C83 * t8;
+    t5 = t18 + t16;
+    t12 = 0.0013335188911986337 * t5;
+    y[92] = t12;
+    t4 = (-0.08936775744636549) * t5;
+    y[147] = t4;
+    t3 = (-C83) * t6;
+    t2 = C82 * t8;
+    t15 = t3 + t2;
+    t19 = 0.0928855407162878 * t15;
+    y[332] = t19;
+    t11 = 0.024267268007375345 * t15;
+    y[387] = t11;
+    t10 = (-C84) * t13;
+    t1 = (-C85) * t14;
+    t17 = t10 + t1;
+    t0 = 0.09020799501323429 * t17;
+    y[307] = t0;
+    t9 = (-0.00561113289925892) * t17;
+    y[412] = t9;
+    t7 = C85 * t13;
+    t18 = (-C84) * t14;
+    t16 = t7 + t18;
+    y[67] = 0;
+    t12 = (-0.0923790993482425) * t16;
+    y[172] = t12;
+    t5 = re[93];
+    t4 = im[93];
+    t6 = re[13];
+    t8 = im[13];
+    t3 = re[53];
+    t2 = im[53];
+    t19 = t6 + t3;
+    t15 = t8 + t2;
+    t11 = C0 * t19;
+    t10 = t5 - t11;
+    t1 = C0 * t15;
+    t0 = t4 - t1;
+    t17 = t6 - t3;
+    t9 = C1 * t17;
+    t13 = t8 - t2;
+    t14 = C1 * t13;
+    t7 = t5 + t19;
+    t18 = t4 + t15;
+    t16 = t10 + t14;
+    t12 = t0 - t9;
+    t11 = t10 - t14;
+    t1 = t0 + t9;
+    t6 = (-C86) * t7;
+    t3 = (-C87) * t18;
+    t17 = t6 + t3;
+    t8 = 0.09017057297751993 * t17;
+    y[305] = t8;
+    t2 = (-0.006669565026439458) * t17;
+    y[414] = t2;
+    t13 = C87 * t7;
+    t5 = (-C86) * t18;
+    t19 = t13 + t5;
+    y[65] = 0;
+    t4 = (-0.09241743795296592) * t19;
+    y[174] = t4;
+    t15 = C88 * t16;
+    t10 = C89 * t12;
+    t14 = t15 + t10;
+    y[14] = 0;
+    t0 = (-0.09197681925364116) * t14;
+    y[225] = t0;
+    t9 = (-C89) * t16;
+    t6 = C88 * t12;
+    t3 = t9 + t6;
+    t8 = 0.0906025387804812 * t3;
+    y[254] = t8;
+    t17 = (-0.0014078128227328595) * t3;
+    y[465] = t17;
+    t2 = C90 * t11;
+    t7 = C91 * t1;
+    t18 = t2 + t7;
+    t13 = 0.0024660855829648633 * t18;
+    y[94] = t13;
+    t5 = (-0.0886290112993696) * t18;
+    y[145] = t5;
+    t19 = (-C91) * t11;
+    t4 = C90 * t1;
+    t15 = t19 + t4;
+    t10 = 0.0932431206828331 * t15;
+    y[334] = t10;
+    t14 = 0.028096241762516693 * t15;
+    y[385] = t14;
+    t0 = re[12];
+    t16 = im[12];
+    t12 = re[52];
+    t9 = im[52];
+    t6 = re[92];
+    t8 = im[92];
+    t3 = t12 + t6;
+    t17 = t9 + t8;
+    t2 = C0 * t3;
+    t7 = t0 - t2;
+    t13 = C0 * t17;
+    t18 = t16 - t13;
+    t5 = t12 - t6;
+    t11 = C1 * t5;
+    t1 = t9 - t8;
+    t19 = C1 * t1;
+    t4 = t0 + t3;
+    t10 = t16 + t17;
+    t15 = t7 + t19;
+    t14 = t18 - t11;
+    t2 = t7 - t19;
+    t13 = t18 + t11;
+    t12 = C92 * t4;
+    t6 = C93 * t10;
+    t5 = t12 + t6;
+    t9 = 0.004039078536152446 * t5;
+    y[96] = t9;
+    t8 = (-0.08769929472088642) * t5;
+    y[143] = t8;
+    t1 = (-C93) * t4;
+    t0 = C92 * t10;
+    t3 = t1 + t0;
+    t16 = 0.093543358396319 * t3;
+    y[336] = t16;
+    t17 = 0.032098107276850515 * t3;
+    y[383] = t17;
+    t7 = (-C94) * t15;
+    t19 = (-C95) * t14;
+    t18 = t7 + t19;
+    t11 = 0.09014764694307614 * t18;
+    y[303] = t11;
+    t12 = (-0.007570478703505297) * t18;
+    y[416] = t12;
+    t6 = C95 * t15;
+    t9 = (-C94) * t14;
+    t5 = t6 + t9;
+    y[63] = 0;
+    t8 = (-0.09244094123272491) * t5;
+    y[176] = t8;
+    t4 = C96 * t2;
+    t10 = C97 * t13;
+    t1 = t4 + t10;
+    y[16] = 0;
+    t0 = (-0.0920356604410908) * t1;
+    y[223] = t0;
+    t16 = (-C97) * t2;
+    t3 = C96 * t13;
+    t17 = t16 + t3;
+    t7 = 0.09054461383114908 * t17;
+    y[256] = t7;
+    t19 = (-0.0018254876761969407) * t17;
+    y[463] = t19;
+    t11 = re[51];
+    t18 = im[51];
+    t12 = re[91];
+    t15 = im[91];
+    t14 = re[11];
+    t6 = im[11];
+    t9 = t12 + t14;
+    t5 = t15 + t6;
+    t8 = C0 * t9;
+    t4 = t11 - t8;
+    t10 = C0 * t5;
+    t1 = t18 - t10;
+    t0 = t12 - t14;
+    t2 = C1 * t0;
+    t13 = t15 - t6;
+    t16 = C1 * t13;
+    t3 = t11 + t9;
+    t7 = t18 + t5;
+    t17 = t4 + t16;
+    t19 = t1 - t2;
+    t8 = t4 - t16;
+    t10 = t1 + t2;
+    t12 = C98 * t3;
+    t14 = C99 * t7;
+    t0 = t12 + t14;
+    y[18] = 0;
+    t15 = (-0.09208383616627881) * t0;
+    y[221] = t15;
+    t6 = (-C99) * t3;
+    t13 = C98 * t7;
+    t11 = t6 + t13;
+    t9 = 0.09049724338466482 * t11;
+    y[258] = t9;
+    t18 = (-0.0022998927704061803) * t11;
+    y[461] = t18;
+    t5 = C100 * t17;
+    t4 = C101 * t19;
+    t16 = t5 + t4;
+    t1 = 0.006095025443000334 * t16;
+    y[98] = t1;
+    t2 = (-0.08653541118025766) * t16;
+    y[141] = t2;
+    t12 = (-C101) * t17;
+    t14 = C100 * t19;
+    t0 = t12 + t14;
+    t15 = 0.0937466223587032 * t0;
+    y[338] = t15;
+    t3 = 0.03624772740142347 * t0;
+    y[381] = t3;
+    t7 = (-C102) * t8;
+    t6 = (-C103) * t10;
+    t13 = t7 + t6;
+    t9 = 0.09013738926953407 * t13;
+    y[301] = t9;
+    t11 = (-0.008322144470384114) * t13;
+    y[418] = t11;
+    t18 = C103 * t8;
+    t5 = (-C102) * t10;
+    t4 = t18 + t5;
+    y[61] = 0;
+    t1 = (-0.09245146105146788) * t4;
+    y[178] = t1;
+    t16 = re[90];
+    t2 = im[90];
+    t17 = re[10];
+    t19 = im[10];
+    t12 = re[50];
+    t14 = im[50];
+    t15 = t17 + t12;
+    t0 = t19 + t14;
+    t3 = C0 * t15;
+    t7 = t16 - t3;
+    t6 = C0 * t0;
+    t9 = t2 - t6;
+    t13 = t17 - t12;
+    t11 = C1 * t13;
+    t8 = t19 - t14;
+    t10 = C1 * t8;
+    t18 = t16 + t15;
+    t5 = t2 + t0;
+    t4 = t7 + t10;
+    t1 = t9 - t11;
+    t3 = t7 - t10;
+    t6 = t9 + t11;
+    t17 = (-C104) * t18;
+    t12 = (-C105) * t5;
+    t13 = t17 + t12;
+    t19 = 0.09013792870924264 * t13;
+    y[299] = t19;
+    t14 = (-0.008931638736934335) * t13;
+    y[420] = t14;
+    t8 = C105 * t18;
+    t16 = (-C104) * t5;
+    t15 = t8 + t16;
+    y[59] = 0;
+    t2 = (-0.09245090776618706) * t15;
+    y[180] = t2;
+    t0 = C106 * t4;
+    t7 = C107 * t1;
+    t10 = t0 + t7;
+    y[20] = 0;
+    t9 = (-0.09212183238639414) * t10;
+    y[219] = t9;
+    t11 = (-C107) * t4;
+    t17 = C106 * t1;
+    t12 = t11 + t17;
+    t19 = 0.09045991723634143 * t12;
+    y[260] = t19;
+    t13 = (-0.0028260339569157957) * t12;
+    y[459] = t13;
+    t14 = C108 * t3;
+    t18 = C109 * t6;
+    t5 = t14 + t18;
+    t8 = 0.00865644952865837 * t5;
+    y[100] = t8;
+    t16 = (-0.08509375534963323) * t5;
+    y[139] = t16;
+    t15 = (-C109) * t3;
+    t2 = C108 * t6;
+    t0 = t15 + t2;
+    t7 = 0.09380974732326158 * t0;
+    y[340] = t7;
+    t10 = 0.04051425980544644 * t0;
+    y[379] = t10;
+    t9 = re[9];
+    t4 = im[9];
+    t1 = re[49];
+    t11 = im[49];
+    t17 = re[89];
+    t19 = im[89];
+    t12 = t1 + t17;
+    t13 = t11 + t19;
+    t14 = C0 * t12;
+    t18 = t9 - t14;
+    t8 = C0 * t13;
+    t5 = t4 - t8;
+    t16 = t1 - t17;
+    t3 = C1 * t16;
+    t6 = t11 - t19;
+    t15 = C1 * t6;
+    t2 = t9 + t12;
+    t7 = t4 + t13;
+    t0 = t18 + t15;
+    t10 = t5 - t3;
+    t14 = t18 - t15;
+    t8 = t5 + t3;
+    t1 = C110 * t2;
+    t17 = C111 * t7;
+    t16 = t1 + t17;
+    t11 = 0.011723299109835212 * t16;
+    y[102] = t11;
+    t19 = (-0.08333366254031559) * t16;
+    y[137] = t19;
+    t6 = (-C111) * t2;
+    t9 = C110 * t7;
+    t12 = t6 + t9;
+    t4 = 0.09368831734586838 * t12;
+    y[342] = t4;
+    t13 = 0.04486302931753237 * t12;
+    y[377] = t13;
+    t18 = (-C112) * t0;
+    t15 = (-C113) * t10;
+    t5 = t18 + t15;
+    t3 = 0.09014737254320589 * t5;
+    y[297] = t3;
+    t1 = (-0.00940585792015134) * t5;
+    y[422] = t1;
+    t17 = C113 * t0;
+    t11 = (-C112) * t10;
+    t16 = t17 + t11;
+    y[57] = 0;
+    t19 = (-0.09244122261399611) * t16;
+    y[182] = t19;
+    t2 = C114 * t14;
+    t7 = C115 * t8;
+    t6 = t2 + t7;
+    y[22] = 0;
+    t9 = (-0.09215050828134111) * t6;
+    y[217] = t9;
+    t4 = (-C115) * t14;
+    t12 = C114 * t8;
+    t13 = t4 + t12;
+    t18 = 0.0904317674286848 * t13;
+    y[262] = t18;
+    t15 = (-0.0033972510637467705) * t13;
+    y[457] = t15;
+    t3 = re[48];
+    t5 = im[48];
+    t1 = re[88];
+    t0 = im[88];
+    t10 = re[8];
+    t17 = im[8];
+    t11 = t1 + t10;
+    t16 = t0 + t17;
+    t19 = C0 * t11;
+    t2 = t3 - t19;
+    t7 = C0 * t16;
+    t6 = t5 - t7;
+    t9 = t1 - t10;
+    t14 = C1 * t9;
+    t8 = t0 - t17;
+    t4 = C1 * t8;
+    t12 = t3 + t11;
+    t18 = t5 + t16;
+    t13 = t2 + t4;
+    t15 = t6 - t14;
+    t19 = t2 - t4;
+    t7 = t6 + t14;
+    t1 = C116 * t12;
+    t10 = C117 * t18;
+    t9 = t1 + t10;
+    y[24] = 0;
+    t0 = (-0.09217112540390858) * t9;
+    y[215] = t0;
+    t17 = (-C117) * t12;
+    t8 = C116 * t18;
+    t3 = t17 + t8;
+    t11 = 0.09041153937109188 * t3;
+    y[264] = t11;
+    t5 = (-0.004004964884675951) * t3;
+    y[455] = t5;
+    t16 = C118 * t13;
+    t2 = C119 * t15;
+    t4 = t16 + t2;
+    t6 = 0.01527325089115992 * t4;
+    y[104] = t6;
+    t14 = (-0.08121961706425723) * t4;
+    y[135] = t14;
+    t1 = (-C119) * t13;
+    t10 = C118 * t15;
+    t9 = t1 + t10;
+    t0 = 0.0933402251764112 * t9;
+    y[344] = t0;
+    t12 = 0.04925447720164721 * t9;
+    y[375] = t12;
+    t18 = (-C120) * t19;
+    t17 = (-C121) * t7;
+    t8 = t18 + t17;
+    t11 = 0.09016381559190259 * t8;
+    y[295] = t11;
+    t3 = (-0.009751032959974511) * t8;
+    y[424] = t3;
+    t5 = C121 * t19;
+    t16 = (-C120) * t7;
+    t2 = t5 + t16;
+    y[55] = 0;
+    t6 = (-0.09242436423777228) * t2;
+    y[184] = t6;
+    t4 = re[87];
+    t14 = im[87];
+    t13 = re[7];
+    t15 = im[7];
+    t1 = re[47];
+    t10 = im[47];
+    t0 = t13 + t1;
+    t9 = t15 + t10;
+    t12 = C0 * t0;
+    t18 = t4 - t12;
+    t17 = C0 * t9;
+    t11 = t14 - t17;
+    t8 = t13 - t1;
+    t3 = C1 * t8;
+    t19 = t15 - t10;
+    t7 = C1 * t19;
+    t5 = t4 + t0;
+    t16 = t14 + t9;
+    t2 = t18 + t7;
+    t6 = t11 - t3;
+    t12 = t18 - t7;
+    t17 = t11 + t3;
+    t13 = (-C122) * t5;
+    t1 = (-C123) * t16;
+    t8 = t13 + t1;
+    t15 = 0.09018536723388516 * t8;
+    y[293] = t15;
+    t10 = (-0.009973048940772533) * t8;
+    y[426] = t10;
+    t19 = C123 * t5;
+    t4 = (-C122) * t16;
+    t0 = t19 + t4;
+    y[53] = 0;
+    t14 = (-0.09240227754156406) * t0;
+    y[186] = t14;
+    t9 = C124 * t2;
+    t18 = C125 * t6;
+    t7 = t9 + t18;
+    y[26] = 0;
+    t11 = (-0.09218520351877914) * t7;
+    y[213] = t11;
+    t3 = (-C125) * t2;
+    t13 = C124 * t6;
+    t1 = t3 + t13;
+    t15 = 0.09039773212233286 * t1;
+    y[266] = t15;
+    t8 = (-0.004639507057936654) * t1;
+    y[453] = t8;
+    t10 = C126 * t12;
+    t5 = C127 * t17;
+    t16 = t10 + t5;
+    t19 = 0.019263488602330115 * t16;
+    y[106] = t19;
+    t4 = (-0.07872584358434256) * t16;
+    y[133] = t4;
+    t0 = (-C127) * t12;
+    t14 = C126 * t17;
+    t9 = t0 + t14;
+    t18 = 0.09272581162425671 * t9;
+    y[346] = t18;
+    t7 = 0.05364633647126045 * t9;
+    y[373] = t7;
+    t11 = re[6];
+    t2 = im[6];
+    t6 = re[46];
+    t3 = im[46];
+    t13 = re[86];
+    t15 = im[86];
+    t1 = t6 + t13;
+    t8 = t3 + t15;
+    t10 = C0 * t1;
+    t5 = t11 - t10;
+    t19 = C0 * t8;
+    t16 = t2 - t19;
+    t4 = t6 - t13;
+    t12 = C1 * t4;
+    t17 = t3 - t15;
+    t0 = C1 * t17;
+    t14 = t11 + t1;
+    t18 = t2 + t8;
+    t9 = t5 + t0;
+    t7 = t16 - t12;
+    t10 = t5 - t0;
+    t19 = t16 + t12;
+    t6 = C128 * t14;
+    t13 = C129 * t18;
+    t4 = t6 + t13;
+    t3 = 0.02363453610164699 * t4;
+    y[108] = t3;
+    t15 = (-0.07583656737509746) * t4;
+    y[131] = t15;
+    t17 = (-C129) * t14;
+    t11 = C128 * t18;
+    t1 = t17 + t11;
+    t2 = 0.09181163628090575 * t1;
+    y[348] = t2;
+    t8 = 0.057993691384658534 * t1;
+    y[371] = t8;
+    t5 = (-C130) * t9;
+    t0 = (-C131) * t7;
+    t16 = t5 + t0;
+    t12 = 0.09021020255745729 * t16;
+    y[291] = t12;
+    t6 = (-0.010077888829067619) * t16;
+    y[428] = t6;
+    t13 = C131 * t9;
+    t3 = (-C130) * t7;
+    t4 = t13 + t3;
+    y[51] = 0;
+    t15 = (-0.09237683872869709) * t4;
+    y[188] = t15;
+    t14 = C132 * t10;
+    t18 = C133 * t19;
+    t17 = t14 + t18;
+    y[28] = 0;
+    t11 = (-0.09219451731446794) * t17;
+    y[211] = t11;
+    t2 = (-C133) * t10;
+    t1 = C132 * t19;
+    t8 = t2 + t1;
+    t5 = 0.09038859984383908 * t8;
+    y[268] = t5;
+    t0 = (-0.005289771942594677) * t8;
+    y[451] = t0;
+    t12 = re[45];
+    t16 = im[45];
+    t6 = re[85];
+    t9 = im[85];
+    t7 = re[5];
+    t13 = im[5];
+    t3 = t6 + t7;
+    t4 = t9 + t13;
+    t15 = C0 * t3;
+    t14 = t12 - t15;
+    t18 = C0 * t4;
+    t17 = t16 - t18;
+    t11 = t6 - t7;
+    t10 = C1 * t11;
+    t19 = t9 - t13;
+    t2 = C1 * t19;
+    t1 = t12 + t3;
+    t5 = t16 + t4;
+    t8 = t14 + t2;
+    t0 = t17 - t10;
+    t15 = t14 - t2;
+    t18 = t17 + t10;
+    t6 = C134 * t1;
+    t7 = C135 * t5;
+    t11 = t6 + t7;
+    y[30] = 0;
+    t9 = (-0.09220089774016076) * t11;
+    y[209] = t9;
+    t13 = (-C135) * t1;
+    t19 = C134 * t5;
+    t12 = t13 + t19;
+    t3 = 0.09038234483158948 * t12;
+    y[270] = t3;
+    t16 = (-0.005944349081379847) * t12;
+    y[449] = t16;
+    t4 = C136 * t8;
+    t14 = C137 * t0;
+    t2 = t4 + t14;
+    t17 = 0.02831385891142267 * t2;
+    y[110] = t17;
+    t10 = (-0.07254851328183894) * t2;
+    y[129] = t10;
+    t6 = (-C137) * t8;
+    t7 = C136 * t0;
+    t11 = t6 + t7;
+    t9 = 0.09057075485758738 * t11;
+    y[350] = t9;
+    t1 = 0.06225077715882855 * t11;
+    y[369] = t1;
+    t5 = (-C138) * t15;
+    t13 = (-C139) * t18;
+    t19 = t5 + t13;
+    t3 = 0.09023662379888507 * t19;
+    y[289] = t3;
+    t12 = (-0.010071177893659302) * t19;
+    y[430] = t12;
+    t16 = C139 * t15;
+    t4 = (-C138) * t18;
+    t14 = t16 + t4;
+    y[49] = 0;
+    t17 = (-0.09234979083333456) * t14;
+    y[190] = t17;
+    t2 = re[84];
+    t10 = im[84];
+    t8 = re[4];
+    t0 = im[4];
+    t6 = re[44];
+    t7 = im[44];
+    t9 = t8 + t6;
+    t11 = t0 + t7;
+    t1 = C0 * t9;
+    t5 = t2 - t1;
+    t13 = C0 * t11;
+    t3 = t10 - t13;
+    t19 = t8 - t6;
+    t12 = C1 * t19;
+    t15 = t0 - t7;
+    t18 = C1 * t15;
+    t16 = t2 + t9;
+    t4 = t10 + t11;
+    t14 = t5 + t18;
+    t17 = t3 - t12;
+    t1 = t5 - t18;
+    t13 = t3 + t12;
+    t8 = (-C140) * t16;
+    t6 = (-C141) * t4;
+    t19 = t8 + t6;
+    t0 = 0.090263085231818 * t19;
+    y[287] = t0;
+    t7 = (-0.00995939719517774) * t19;
+    y[432] = t7;
+    t15 = C141 * t16;
+    t2 = (-C140) * t4;
+    t9 = t15 + t2;
+    y[47] = 0;
+    t10 = (-0.09232271766394046) * t9;
+    y[192] = t10;
+    t11 = C142 * t14;
+    t5 = C143 * t17;
+    t18 = t11 + t5;
+    y[32] = 0;
+    t3 = (-0.09220618981254637) * t18;
+    y[207] = t3;
+    t12 = (-C143) * t14;
+    t8 = C142 * t17;
+    t6 = t12 + t8;
+    t0 = 0.09037715743677144 * t6;
+    y[272] = t0;
+    t19 = (-0.006590424026111684) * t6;
+    y[447] = t19;
+    t7 = C144 * t1;
+    t16 = C145 * t13;
+    t4 = t7 + t16;
+    t15 = 0.03322042000362499 * t4;
+    y[112] = t15;
+    t2 = (-0.06887202171480471) * t4;
+    y[127] = t2;
+    t9 = (-C145) * t1;
+    t10 = C144 * t13;
+    t11 = t9 + t10;
+    t5 = 0.08898332462644315 * t11;
+    y[352] = t5;
+    t18 = 0.066370981076243 * t11;
+    y[367] = t18;
+    t3 = re[3];
+    t14 = im[3];
+    t17 = re[43];
+    t12 = im[43];
+    t8 = re[83];
+    t0 = im[83];
+    t6 = t17 + t8;
+    t19 = t12 + t0;
+    t7 = C0 * t6;
+    t16 = t3 - t7;
+    t15 = C0 * t19;
+    t4 = t14 - t15;
+    t2 = t17 - t8;
+    t1 = C1 * t2;
+    t13 = t12 - t0;
+    t9 = C1 * t13;
+    t10 = t3 + t6;
+    t5 = t14 + t19;
+    t11 = t16 + t9;
+    t18 = t4 - t1;
+    t7 = t16 - t9;
+    t15 = t4 + t1;
+    t17 = C146 * t10;
+    t8 = C147 * t5;
+    t2 = t17 + t8;
+    t12 = 0.03826800503743858 * t2;
+    y[114] = t12;
+    t0 = (-0.06483018405848807) * t2;
+    y[125] = t0;
+    t13 = (-C147) * t10;
+    t3 = C146 * t5;
+    t6 = t13 + t3;
+    t14 = 0.08703876860421736 * t6;
+    y[354] = t14;
+    t19 = 0.07030922939059663 * t6;
+    y[365] = t19;
+    t16 = (-C148) * t11;
+    t9 = (-C149) * t18;
+    t4 = t16 + t9;
+    t1 = 0.09028824521108123 * t4;
+    y[285] = t1;
+    t17 = (-0.009748913661253328) * t4;
+    y[434] = t17;
+    t8 = C149 * t11;
+    t12 = (-C148) * t18;
+    t2 = t8 + t12;
+    y[45] = 0;
+    t0 = (-0.0922969907527959) * t2;
+    y[194] = t0;
+    t10 = C150 * t7;
+    t5 = C151 * t15;
+    t13 = t10 + t5;
+    y[34] = 0;
+    t3 = (-0.09221204331965764) * t13;
+    y[205] = t3;
+    t14 = (-C151) * t7;
+    t6 = C150 * t15;
+    t19 = t14 + t6;
+    t16 = 0.09037142040595954 * t19;
+    y[274] = t16;
+    t9 = (-0.007215922854075747) * t19;
+    y[445] = t9;
+    t1 = re[42];
+    t4 = im[42];
+    t17 = re[82];
+    t11 = im[82];
+    t18 = re[2];
+    t8 = im[2];
+    t12 = t17 + t18;
+    t2 = t11 + t8;
+    t0 = C0 * t12;
+    t10 = t1 - t0;
+    t5 = C0 * t2;
+    t13 = t4 - t5;
+    t3 = t17 - t18;
+    t7 = C1 * t3;
+    t15 = t11 - t8;
+    t14 = C1 * t15;
+    t6 = t1 + t12;
+    t16 = t4 + t2;
+    t19 = t10 + t14;
+    t9 = t13 - t7;
+    t0 = t10 - t14;
+    t5 = t13 + t7;
+    t17 = C152 * t6;
+    t18 = C153 * t16;
+    t3 = t17 + t18;
+    y[36] = 0;
+    t11 = (-0.092219873210068) * t3;
+    y[203] = t11;
+    t8 = (-C153) * t6;
+    t15 = C152 * t16;
+    t1 = t8 + t15;
+    t12 = 0.09036374745767432 * t1;
+    y[276] = t12;
+    t4 = (-0.00780808135679578) * t1;
+    y[443] = t4;
+    t2 = C154 * t19;
+    t10 = C155 * t9;
+    t14 = t2 + t10;
+    t13 = 0.04336930039134643 * t14;
+    y[116] = t13;
+    t7 = (-0.06045909869529394) * t14;
+    y[123] = t7;
+    t17 = (-C155) * t19;
+    t18 = C154 * t9;
+    t3 = t17 + t18;
+    t11 = 0.08473525892773065 * t3;
+    y[356] = t11;
+    t6 = 0.07402277467890597 * t3;
+    y[363] = t6;
+    t16 = (-C156) * t0;
+    t8 = (-C157) * t5;
+    t15 = t16 + t8;
+    t12 = 0.09031100536051363 * t15;
+    y[283] = t12;
+    t1 = (-0.0094478602997263) * t15;
+    y[436] = t1;
+    t4 = C157 * t0;
+    t2 = (-C156) * t5;
+    t10 = t4 + t2;
+    y[43] = 0;
+    t13 = (-0.09227373009598769) * t10;
+    y[196] = t13;
+    t14 = re[81];
+    t7 = im[81];
+    t19 = re[1];
+    t9 = im[1];
+    t17 = re[41];
+    t18 = im[41];
+    t11 = t19 + t17;
+    t3 = t9 + t18;
+    t6 = C0 * t11;
+    t16 = t14 - t6;
+    t8 = C0 * t3;
+    t12 = t7 - t8;
+    t15 = t19 - t17;
+    t1 = C1 * t15;
+    t0 = t9 - t18;
+    t5 = C1 * t0;
+    t4 = t14 + t11;
+    t2 = t7 + t3;
+    t10 = t16 + t5;
+    t13 = t12 - t1;
+    t6 = t16 - t5;
+    t8 = t12 + t1;
+    t19 = (-C158) * t4;
+    t17 = (-C159) * t2;
+    t15 = t19 + t17;
+    t9 = 0.0903305936699626 * t15;
+    y[281] = t9;
+    t18 = (-0.009064007974917266) * t15;
+    y[438] = t18;
+    t0 = C159 * t4;
+    t14 = (-C158) * t2;
+    t11 = t0 + t14;
+    y[41] = 0;
+    t7 = (-0.09225372041481877) * t11;
+    y[198] = t7;
+    t3 = C160 * t10;
+    t16 = C161 * t13;
+    t5 = t3 + t16;
+    y[38] = 0;
+    t12 = (-0.09223068106750755) * t5;
+    y[201] = t12;
+    t1 = (-C161) * t10;
+    t19 = C160 * t13;
+    t17 = t1 + t19;
+    t9 = 0.09035315837290428 * t17;
+    y[278] = t9;
+    t15 = (-0.008354677907082433) * t17;
+    y[441] = t15;
+    t18 = C162 * t6;
+    t4 = C163 * t8;
+    t2 = t18 + t4;
+    t0 = 0.04843858972584554 * t2;
+    y[118] = t0;
+    t14 = (-0.055808255064714284) * t2;
+    y[121] = t14;
+    t11 = (-C163) * t6;
+    t7 = C162 * t8;
+    t3 = t11 + t7;
+    t16 = 0.08207914857879066 * t3;
+    y[358] = t16;
+    t5 = 0.07747210014149988 * t3;
+    y[361] = t5;
+}
+
+/**
+ *  Part 1 of ApplyWindowedMDCT_W75_240().
+ * 
+ *  @param {Number[]} x 
+ *    - The input block (480 points).
+ *  @param {Number[]} X 
+ *    - The array that would contain the output block (240 points).
+ *  @param {Number[]} re 
+ *    - The scratch buffer (real part, 120 points).
+ *  @param {Number[]} im 
+ *    - The scratch buffer (imaginary part, 120 points).
+ */
+function ApplyWindowedMDCT_W75_240_Part1(x, X, re, im) {
+    let t0, t1, t10, t11, t12, t13, t14, t15, t16, t17, t18, t19, t2, t3, t4, t5, t6, t7, t8, t9;
+    const C0 = 0.9807852804032304;
+    const C1 = 0.19509032201612825;
+    const C2 = 0.9238795325112867;
+    const C3 = 0.3826834323650898;
+    const C4 = 0.5555702330196022;
+    const C5 = 0.8314696123025452;
+    const C6 = 0.7071067811865476;
+    const C7 = 0.9510565162951535;
+    const C8 = 0.3090169943749474;
+    const C9 = 0.4886212414969549;
+    const C10 = 0.8724960070727972;
+    const C11 = 0.6494480483301837;
+    const C12 = 0.7604059656000309;
+    const C13 = 0.619093949309834;
+    const C14 = 0.785316930880745;
+    const C15 = 0.45399049973954675;
+    const C16 = 0.8910065241883679;
+    const C17 = 0.27144044986507426;
+    const C18 = 0.9624552364536473;
+    const C19 = 0.07845909572784494;
+    const C20 = 0.996917333733128;
+    const C21 = 0.9930684569549263;
+    const C22 = 0.11753739745783764;
+    const C23 = 0.5877852522924731;
+    const C24 = 0.8090169943749475;
+    const C25 = 0.6788007455329417;
+    const C26 = 0.7343225094356856;
+    const C27 = 0.5224985647159488;
+    const C28 = 0.8526401643540922;
+    const C29 = 0.34611705707749296;
+    const C30 = 0.9381913359224842;
+    const C31 = 0.15643446504023087;
+    const C32 = 0.9876883405951378;
+    const C33 = 0.9992290362407229;
+    const C34 = 0.03925981575906861;
+    const C35 = 0.9723699203976766;
+    const C36 = 0.2334453638559054;
+    const C37 = 0.41865973753742813;
+    const C38 = 0.9081431738250813;
+    const C39 = 0.5590169943749475;
+    const C40 = 0.25;
+    t0 = x[359];
+    t0 = 0.04752735458669829 * t0;
+    t1 = x[360];
+    t1 = 0.04644169441234319 * t1;
+    t0 = t0 + t1;
+    t1 = x[119];
+    t1 = 0.08839478579440686 * t1;
+    t2 = x[120];
+    t2 = 0.08896202493476155 * t2;
+    t1 = t1 - t2;
+    t2 = -t0;
+    t3 = x[329];
+    t3 = 0.07547385127254332 * t3;
+    t4 = x[390];
+    t4 = 0.015820600627638397 * t4;
+    t3 = t3 + t4;
+    t4 = x[89];
+    t4 = 0.06349934378312706 * t4;
+    t5 = x[150];
+    t5 = 0.09710297608583138 * t5;
+    t4 = t4 - t5;
+    t5 = (-C0) * t3;
+    t6 = C1 * t4;
+    t5 = t5 + t6;
+    t6 = C1 * t3;
+    t3 = C0 * t4;
+    t4 = t6 + t3;
+    t6 = x[299];
+    t3 = 0.08891754017192575 * t6;
+    t6 = x[420];
+    t6 = 0.0007021231543619729 * t6;
+    t3 = t3 + t6;
+    t6 = x[59];
+    t6 = 0.03168746252407474 * t6;
+    t7 = x[180];
+    t7 = 0.09346957660009908 * t7;
+    t6 = t6 - t7;
+    t7 = (-C2) * t3;
+    t8 = C3 * t6;
+    t7 = t7 + t8;
+    t8 = C3 * t3;
+    t3 = C2 * t6;
+    t6 = t8 + t3;
+    t8 = x[269];
+    t3 = x[29];
+    t3 = 0.008076005721060965 * t3;
+    t9 = x[210];
+    t9 = 0.09039410601073432 * t9;
+    t3 = t3 - t9;
+    t9 = (-0.07665227017159432) * t8;
+    t10 = C4 * t3;
+    t9 = t9 + t10;
+    t10 = 0.05121740947667799 * t8;
+    t8 = C5 * t3;
+    t3 = t10 + t8;
+    t10 = x[0];
+    t8 = 0.0001687287062834231 * t10;
+    t10 = x[239];
+    t10 = 0.09125943864072585 * t10;
+    t8 = t8 - t10;
+    t10 = x[240];
+    t11 = C6 * t8;
+    t12 = (-0.06456928288903871) * t10;
+    t11 = t11 + t12;
+    t12 = (-0.7071067811865475) * t8;
+    t8 = (-0.06456928288903872) * t10;
+    t10 = t12 + t8;
+    t12 = x[30];
+    t8 = 0.008613919159637174 * t12;
+    t12 = x[209];
+    t12 = 0.09041495653162682 * t12;
+    t8 = t8 - t12;
+    t12 = x[270];
+    t13 = C4 * t8;
+    t14 = (-0.07663459345280815) * t12;
+    t13 = t13 + t14;
+    t14 = (-C5) * t8;
+    t8 = (-0.05120559827079657) * t12;
+    t12 = t14 + t8;
+    t14 = x[60];
+    t8 = 0.03269174986983001 * t14;
+    t14 = x[179];
+    t14 = 0.09364478174038289 * t14;
+    t8 = t8 - t14;
+    t14 = x[300];
+    t14 = 0.08868530563218803 * t14;
+    t15 = x[419];
+    t15 = 0.0008692481724313596 * t15;
+    t14 = t14 + t15;
+    t15 = C3 * t8;
+    t16 = (-C2) * t14;
+    t15 = t15 + t16;
+    t16 = (-C2) * t8;
+    t8 = (-C3) * t14;
+    t14 = t16 + t8;
+    t16 = x[90];
+    t8 = 0.0645227929691675 * t16;
+    t16 = x[149];
+    t16 = 0.09708404002796817 * t16;
+    t8 = t8 - t16;
+    t16 = x[330];
+    t16 = 0.07475858286328994 * t16;
+    t17 = x[389];
+    t17 = 0.016668033615864032 * t17;
+    t16 = t16 + t17;
+    t17 = C1 * t8;
+    t18 = (-C0) * t16;
+    t17 = t17 + t18;
+    t18 = (-C0) * t8;
+    t8 = (-C1) * t16;
+    t16 = t18 + t8;
+    t18 = t11 - t0;
+    t8 = t1 + t10;
+    t0 = t7 + t15;
+    t19 = t6 + t14;
+    t2 = t2 - t11;
+    t11 = t1 - t10;
+    t1 = t7 - t15;
+    t10 = t6 - t14;
+    t7 = t18 + t0;
+    t15 = t8 + t19;
+    t6 = t2 + t10;
+    t14 = t11 - t1;
+    t18 = t18 - t0;
+    t0 = t8 - t19;
+    t8 = t2 - t10;
+    t19 = t11 + t1;
+    t2 = t5 + t13;
+    t10 = t4 + t12;
+    t11 = t9 + t17;
+    t1 = t3 + t16;
+    t5 = t5 - t13;
+    t13 = t4 - t12;
+    t4 = t9 - t17;
+    t12 = t3 - t16;
+    t9 = t2 + t11;
+    t17 = t10 + t1;
+    t3 = t5 + t12;
+    t16 = t13 - t4;
+    t2 = t2 - t11;
+    t11 = t10 - t1;
+    t10 = t5 - t12;
+    t1 = t13 + t4;
+    t5 = t3 + t16;
+    t12 = t3 - t16;
+    t13 = C6 * t5;
+    t4 = (-C6) * t12;
+    t3 = t10 - t1;
+    t16 = t10 + t1;
+    t5 = (-C6) * t3;
+    t12 = (-C6) * t16;
+    t10 = t7 - t9;
+    t1 = t15 - t17;
+    t3 = t7 + t9;
+    t16 = t15 + t17;
+    t7 = t6 - t13;
+    t9 = t14 - t4;
+    t15 = t6 + t13;
+    t17 = t14 + t4;
+    t6 = t18 - t11;
+    t13 = t0 + t2;
+    t14 = t18 + t11;
+    t4 = t0 - t2;
+    t18 = t8 - t5;
+    t11 = t19 - t12;
+    t0 = t8 + t5;
+    t2 = t19 + t12;
+    re[0] = t3;
+    im[0] = t16;
+    re[15] = t15;
+    im[15] = t17;
+    re[30] = t14;
+    im[30] = t4;
+    re[45] = t0;
+    im[45] = t2;
+    re[60] = t10;
+    im[60] = t1;
+    re[75] = t7;
+    im[75] = t9;
+    re[90] = t6;
+    im[90] = t13;
+    re[105] = t18;
+    im[105] = t11;
+    t8 = x[311];
+    t5 = 0.08527837543502197 * t8;
+    t19 = x[408];
+    t12 = 0.004204839118219382 * t19;
+    t3 = t5 + t12;
+    t16 = x[71];
+    t15 = 0.04423560528399145 * t16;
+    t17 = x[168];
+    t14 = 0.09553805039385353 * t17;
+    t4 = t15 - t14;
+    t0 = (-C7) * t3;
+    t2 = C8 * t4;
+    t10 = t0 + t2;
+    t1 = C8 * t3;
+    t7 = C7 * t4;
+    t9 = t1 + t7;
+    t6 = x[281];
+    t13 = x[41];
+    t18 = 0.015755155066487784 * t13;
+    t11 = x[198];
+    t8 = 0.09099823826755285 * t11;
+    t19 = t18 - t8;
+    t5 = (-0.07990044859508577) * t6;
+    t12 = C9 * t19;
+    t16 = t5 + t12;
+    t17 = 0.044746401212397785 * t6;
+    t15 = C10 * t19;
+    t14 = t17 + t15;
+    t0 = x[251];
+    t2 = x[11];
+    t3 = 0.0015455547772786204 * t2;
+    t4 = x[228];
+    t1 = 0.09069677564541208 * t4;
+    t7 = t3 - t1;
+    t13 = (-0.06986705243827265) * t0;
+    t11 = C11 * t7;
+    t18 = t13 + t11;
+    t8 = 0.05967210003779187 * t0;
+    t5 = C12 * t7;
+    t12 = t8 + t5;
+    t6 = x[18];
+    t19 = 0.003392078454351888 * t6;
+    t17 = x[221];
+    t15 = 0.09045007724846191 * t17;
+    t2 = t19 - t15;
+    t4 = x[258];
+    t3 = C13 * t2;
+    t1 = (-0.07235270501055129) * t4;
+    t13 = t3 + t1;
+    t11 = (-C14) * t2;
+    t0 = (-0.057038273500604954) * t4;
+    t7 = t11 + t0;
+    t8 = x[48];
+    t5 = 0.02140019650804302 * t8;
+    t6 = x[191];
+    t17 = 0.09174882235043115 * t6;
+    t19 = t5 - t17;
+    t15 = x[288];
+    t3 = C15 * t19;
+    t1 = (-0.08092806183251801) * t15;
+    t2 = t3 + t1;
+    t4 = (-C16) * t19;
+    t11 = (-0.04123490708192666) * t15;
+    t0 = t4 + t11;
+    t8 = x[78];
+    t6 = 0.051818729299763125 * t8;
+    t5 = x[161];
+    t17 = 0.09649583471076638 * t5;
+    t3 = t6 - t17;
+    t1 = x[318];
+    t19 = 0.08214494215885092 * t1;
+    t15 = x[401];
+    t4 = 0.00784829303888874 * t15;
+    t11 = t19 + t4;
+    t8 = C17 * t3;
+    t5 = (-C18) * t11;
+    t6 = t8 + t5;
+    t17 = (-C18) * t3;
+    t1 = (-C17) * t11;
+    t15 = t17 + t1;
+    t19 = x[108];
+    t4 = 0.0809165052461322 * t19;
+    t8 = x[131];
+    t5 = 0.0939083749348817 * t8;
+    t3 = t4 - t5;
+    t11 = x[348];
+    t17 = 0.05905961963485038 * t11;
+    t1 = x[371];
+    t19 = 0.03444464662276709 * t1;
+    t8 = t17 + t19;
+    t4 = C19 * t3;
+    t5 = (-C20) * t8;
+    t11 = t4 + t5;
+    t1 = (-C20) * t3;
+    t17 = (-C19) * t8;
+    t19 = t1 + t17;
+    t4 = x[341];
+    t5 = 0.06574932607311029 * t4;
+    t3 = x[378];
+    t8 = 0.027074672896674333 * t3;
+    t1 = t5 + t8;
+    t17 = x[101];
+    t4 = 0.07507241738097777 * t17;
+    t3 = x[138];
+    t5 = 0.0958302170606977 * t3;
+    t8 = t4 - t5;
+    t17 = (-C21) * t1;
+    t3 = C22 * t8;
+    t4 = t17 + t3;
+    t5 = C22 * t1;
+    t17 = C21 * t8;
+    t3 = t5 + t17;
+    t1 = t10 + t2;
+    t8 = t9 + t0;
+    t5 = t18 + t11;
+    t17 = t12 + t19;
+    t10 = t10 - t2;
+    t2 = t9 - t0;
+    t9 = t18 - t11;
+    t0 = t12 - t19;
+    t18 = t1 + t5;
+    t11 = t8 + t17;
+    t12 = t10 + t0;
+    t19 = t2 - t9;
+    t1 = t1 - t5;
+    t5 = t8 - t17;
+    t8 = t10 - t0;
+    t17 = t2 + t9;
+    t10 = t16 + t6;
+    t0 = t14 + t15;
+    t2 = t13 + t4;
+    t9 = t7 + t3;
+    t16 = t16 - t6;
+    t6 = t14 - t15;
+    t14 = t13 - t4;
+    t15 = t7 - t3;
+    t13 = t10 + t2;
+    t4 = t0 + t9;
+    t7 = t16 + t15;
+    t3 = t6 - t14;
+    t10 = t10 - t2;
+    t2 = t0 - t9;
+    t0 = t16 - t15;
+    t9 = t6 + t14;
+    t16 = t7 + t3;
+    t15 = t7 - t3;
+    t6 = C6 * t16;
+    t14 = (-C6) * t15;
+    t7 = t0 - t9;
+    t3 = t0 + t9;
+    t16 = (-C6) * t7;
+    t15 = (-C6) * t3;
+    t0 = t18 - t13;
+    t9 = t11 - t4;
+    t7 = t18 + t13;
+    t3 = t11 + t4;
+    t18 = t12 - t6;
+    t13 = t19 - t14;
+    t11 = t12 + t6;
+    t4 = t19 + t14;
+    t12 = t1 - t2;
+    t6 = t5 + t10;
+    t19 = t1 + t2;
+    t14 = t5 - t10;
+    t1 = t8 - t16;
+    t2 = t17 - t15;
+    t5 = t8 + t16;
+    t10 = t17 + t15;
+    re[24] = t7;
+    im[24] = t3;
+    re[39] = t11;
+    im[39] = t4;
+    re[54] = t19;
+    im[54] = t14;
+    re[69] = t5;
+    im[69] = t10;
+    re[84] = t0;
+    im[84] = t9;
+    re[99] = t18;
+    im[99] = t13;
+    re[114] = t12;
+    im[114] = t6;
+    re[9] = t1;
+    im[9] = t2;
+    t8 = x[263];
+    t16 = x[23];
+    t17 = 0.005243370587864342 * t16;
+    t15 = x[216];
+    t7 = 0.09036492994132213 * t15;
+    t3 = t17 - t7;
+    t11 = (-0.07460646835930314) * t8;
+    t4 = C23 * t3;
+    t19 = t11 + t4;
+    t14 = 0.05420477212732006 * t8;
+    t5 = C24 * t3;
+    t10 = t14 + t5;
+    t0 = x[6];
+    t9 = 0.0007176193279816504 * t0;
+    t18 = x[233];
+    t13 = 0.09093614700128749 * t18;
+    t12 = t9 - t13;
+    t6 = x[246];
+    t1 = C25 * t12;
+    t2 = (-0.06729286919546677) * t6;
+    t16 = t1 + t2;
+    t15 = (-C26) * t12;
+    t17 = (-0.062204888440688944) * t6;
+    t7 = t15 + t17;
+    t11 = x[36];
+    t4 = 0.012234374072361744 * t11;
+    t8 = x[203];
+    t3 = 0.09064861569241872 * t8;
+    t14 = t4 - t3;
+    t5 = x[276];
+    t0 = C27 * t14;
+    t18 = (-0.07838326761723526) * t5;
+    t9 = t0 + t18;
+    t13 = (-C28) * t14;
+    t1 = (-0.04803332817282497) * t5;
+    t2 = t13 + t1;
+    t12 = x[66];
+    t6 = 0.03889576143743222 * t12;
+    t15 = x[173];
+    t17 = 0.09470412254796516 * t15;
+    t11 = t6 - t17;
+    t8 = x[306];
+    t4 = 0.08703551219791075 * t8;
+    t3 = x[413];
+    t0 = 0.0023321697985883467 * t3;
+    t18 = t4 + t0;
+    t14 = C29 * t11;
+    t5 = (-C30) * t18;
+    t13 = t14 + t5;
+    t1 = (-C30) * t11;
+    t12 = (-C29) * t18;
+    t15 = t1 + t12;
+    t6 = x[96];
+    t17 = 0.07045710534702093 * t6;
+    t8 = x[143];
+    t3 = 0.09665087282156803 * t8;
+    t4 = t17 - t3;
+    t0 = x[336];
+    t14 = 0.07009508579978732 * t0;
+    t5 = x[383];
+    t11 = 0.022121006853811794 * t5;
+    t18 = t14 + t11;
+    t1 = C31 * t4;
+    t12 = (-C32) * t18;
+    t6 = t1 + t12;
+    t8 = (-C32) * t4;
+    t17 = (-C31) * t18;
+    t3 = t8 + t17;
+    t0 = x[353];
+    t5 = 0.05393506943227453 * t0;
+    t14 = x[366];
+    t11 = 0.03988251285128333 * t14;
+    t1 = t5 + t11;
+    t12 = x[113];
+    t4 = 0.08459145275616263 * t12;
+    t18 = x[126];
+    t8 = 0.09195526554211034 * t18;
+    t17 = t4 - t8;
+    t0 = (-C33) * t1;
+    t14 = C34 * t17;
+    t5 = t0 + t14;
+    t11 = C34 * t1;
+    t12 = C33 * t17;
+    t18 = t11 + t12;
+    t4 = x[323];
+    t8 = 0.07938438658631503 * t4;
+    t0 = x[396];
+    t14 = 0.011150290256942962 * t0;
+    t1 = t8 + t14;
+    t17 = x[83];
+    t11 = 0.05720267793605442 * t17;
+    t12 = x[156];
+    t4 = 0.09693980393114883 * t12;
+    t0 = t11 - t4;
+    t8 = (-C35) * t1;
+    t14 = C36 * t0;
+    t17 = t8 + t14;
+    t12 = C36 * t1;
+    t11 = C35 * t0;
+    t4 = t12 + t11;
+    t8 = x[293];
+    t14 = x[53];
+    t1 = 0.025887393635767413 * t14;
+    t0 = x[186];
+    t12 = 0.09248264559196126 * t0;
+    t11 = t1 - t12;
+    t14 = (-0.08183005290814788) * t8;
+    t0 = C37 * t11;
+    t1 = t14 + t0;
+    t12 = 0.03772417110057771 * t8;
+    t14 = C38 * t11;
+    t0 = t12 + t14;
+    t8 = t19 + t6;
+    t11 = t10 + t3;
+    t12 = t9 + t17;
+    t14 = t2 + t4;
+    t19 = t19 - t6;
+    t6 = t10 - t3;
+    t10 = t9 - t17;
+    t3 = t2 - t4;
+    t9 = t8 + t12;
+    t17 = t11 + t14;
+    t2 = t19 + t3;
+    t4 = t6 - t10;
+    t8 = t8 - t12;
+    t12 = t11 - t14;
+    t11 = t19 - t3;
+    t14 = t6 + t10;
+    t19 = t16 + t5;
+    t3 = t7 + t18;
+    t6 = t13 + t1;
+    t10 = t15 + t0;
+    t16 = t16 - t5;
+    t5 = t7 - t18;
+    t7 = t13 - t1;
+    t18 = t15 - t0;
+    t13 = t19 + t6;
+    t1 = t3 + t10;
+    t15 = t16 + t18;
+    t0 = t5 - t7;
+    t19 = t19 - t6;
+    t6 = t3 - t10;
+    t3 = t16 - t18;
+    t10 = t5 + t7;
+    t16 = t15 + t0;
+    t18 = t15 - t0;
+    t5 = C6 * t16;
+    t7 = (-C6) * t18;
+    t15 = t3 - t10;
+    t0 = t3 + t10;
+    t16 = (-C6) * t15;
+    t18 = (-C6) * t0;
+    t3 = t9 - t13;
+    t10 = t17 - t1;
+    t15 = t9 + t13;
+    t0 = t17 + t1;
+    t9 = t2 - t5;
+    t13 = t4 - t7;
+    t17 = t2 + t5;
+    t1 = t4 + t7;
+    t2 = t8 - t6;
+    t5 = t12 + t19;
+    t4 = t8 + t6;
+    t7 = t12 - t19;
+    t8 = t11 - t16;
+    t6 = t14 - t18;
+    t12 = t11 + t16;
+    t19 = t14 + t18;
+    re[48] = t15;
+    im[48] = t0;
+    re[63] = t17;
+    im[63] = t1;
+    re[78] = t4;
+    im[78] = t7;
+    re[93] = t12;
+    im[93] = t19;
+    re[108] = t3;
+    im[108] = t10;
+    re[3] = t9;
+    im[3] = t13;
+    re[18] = t2;
+    im[18] = t5;
+    re[33] = t8;
+    im[33] = t6;
+    t11 = x[24];
+    t16 = 0.005668641644993473 * t11;
+    t14 = x[215];
+    t18 = 0.09035909837690259 * t14;
+    t15 = t16 - t18;
+    t0 = x[264];
+    t17 = C23 * t15;
+    t1 = (-0.07461128328590337) * t0;
+    t4 = t17 + t1;
+    t7 = (-C24) * t15;
+    t12 = (-0.05420827037626437) * t0;
+    t19 = t7 + t12;
+    t3 = x[54];
+    t10 = 0.026825028972436063 * t3;
+    t9 = x[185];
+    t13 = 0.09264927418823903 * t9;
+    t2 = t10 - t13;
+    t5 = x[294];
+    t8 = C37 * t2;
+    t6 = (-0.08168288255016193) * t5;
+    t11 = t8 + t6;
+    t14 = (-C38) * t2;
+    t16 = (-0.037656324636249655) * t5;
+    t18 = t14 + t16;
+    t17 = x[84];
+    t1 = 0.058267532136393865 * t17;
+    t15 = x[155];
+    t0 = 0.09699748493185585 * t15;
+    t7 = t1 - t0;
+    t12 = x[324];
+    t3 = 0.07877827811770904 * t12;
+    t9 = x[395];
+    t10 = 0.01187691435143269 * t9;
+    t13 = t3 + t10;
+    t8 = C36 * t7;
+    t6 = (-C35) * t13;
+    t2 = t8 + t6;
+    t5 = (-C35) * t7;
+    t14 = (-C36) * t13;
+    t16 = t5 + t14;
+    t17 = x[114];
+    t15 = 0.08527231603088634 * t17;
+    t1 = x[125];
+    t0 = 0.09150544220877038 * t1;
+    t12 = t15 - t0;
+    t9 = x[354];
+    t3 = 0.05288347175089571 * t9;
+    t10 = x[365];
+    t8 = 0.040977048916637684 * t10;
+    t6 = t3 + t8;
+    t7 = C34 * t12;
+    t13 = (-C33) * t6;
+    t5 = t7 + t13;
+    t14 = (-C33) * t12;
+    t17 = (-C34) * t6;
+    t1 = t14 + t17;
+    t15 = x[335];
+    t0 = 0.07091533825082738 * t15;
+    t9 = x[384];
+    t10 = 0.02117182715100995 * t9;
+    t3 = t0 + t10;
+    t8 = x[95];
+    t7 = 0.06949540812097872 * t8;
+    t13 = x[144];
+    t12 = 0.0967631084341196 * t13;
+    t6 = t7 - t12;
+    t14 = (-C32) * t3;
+    t17 = C31 * t6;
+    t15 = t14 + t17;
+    t9 = C31 * t3;
+    t0 = C32 * t6;
+    t10 = t9 + t0;
+    t8 = x[305];
+    t13 = 0.0873431014748424 * t8;
+    t7 = x[414];
+    t12 = 0.0020305692018240664 * t7;
+    t14 = t13 + t12;
+    t17 = x[65];
+    t3 = 0.03784324285502507 * t17;
+    t6 = x[174];
+    t9 = 0.09452938893259823 * t6;
+    t0 = t3 - t9;
+    t8 = (-C30) * t14;
+    t7 = C29 * t0;
+    t13 = t8 + t7;
+    t12 = C29 * t14;
+    t17 = C30 * t0;
+    t6 = t12 + t17;
+    t3 = x[275];
+    t9 = x[35];
+    t8 = 0.011584653483930014 * t9;
+    t7 = x[204];
+    t14 = 0.09059613943028794 * t7;
+    t0 = t8 - t14;
+    t12 = (-0.0784286697825374) * t3;
+    t17 = C27 * t0;
+    t9 = t12 + t17;
+    t7 = 0.04806115065550538 * t3;
+    t8 = C28 * t0;
+    t14 = t7 + t8;
+    t12 = x[245];
+    t17 = x[5];
+    t3 = 0.0005958118887355562 * t17;
+    t0 = x[234];
+    t7 = 0.09098818490486592 * t0;
+    t8 = t3 - t7;
+    t17 = (-0.06725438310144949) * t12;
+    t0 = C25 * t8;
+    t3 = t17 + t0;
+    t7 = 0.0621693122613183 * t12;
+    t17 = C26 * t8;
+    t0 = t7 + t17;
+    t12 = t4 + t15;
+    t8 = t19 + t10;
+    t7 = t2 + t9;
+    t17 = t16 + t14;
+    t4 = t4 - t15;
+    t15 = t19 - t10;
+    t19 = t2 - t9;
+    t10 = t16 - t14;
+    t2 = t12 + t7;
+    t9 = t8 + t17;
+    t16 = t4 + t10;
+    t14 = t15 - t19;
+    t12 = t12 - t7;
+    t7 = t8 - t17;
+    t8 = t4 - t10;
+    t17 = t15 + t19;
+    t4 = t11 + t13;
+    t10 = t18 + t6;
+    t15 = t5 + t3;
+    t19 = t1 + t0;
+    t11 = t11 - t13;
+    t13 = t18 - t6;
+    t18 = t5 - t3;
+    t6 = t1 - t0;
+    t5 = t4 + t15;
+    t3 = t10 + t19;
+    t1 = t11 + t6;
+    t0 = t13 - t18;
+    t4 = t4 - t15;
+    t15 = t10 - t19;
+    t10 = t11 - t6;
+    t19 = t13 + t18;
+    t11 = t1 + t0;
+    t6 = t1 - t0;
+    t13 = C6 * t11;
+    t18 = (-C6) * t6;
+    t1 = t10 - t19;
+    t0 = t10 + t19;
+    t11 = (-C6) * t1;
+    t6 = (-C6) * t0;
+    t10 = t2 - t5;
+    t19 = t9 - t3;
+    t1 = t2 + t5;
+    t0 = t9 + t3;
+    t2 = t16 - t13;
+    t5 = t14 - t18;
+    t9 = t16 + t13;
+    t3 = t14 + t18;
+    t16 = t12 - t15;
+    t13 = t7 + t4;
+    t14 = t12 + t15;
+    t18 = t7 - t4;
+    t12 = t8 - t11;
+    t15 = t17 - t6;
+    t7 = t8 + t11;
+    t4 = t17 + t6;
+    re[72] = t1;
+    im[72] = t0;
+    re[87] = t9;
+    im[87] = t3;
+    re[102] = t14;
+    im[102] = t18;
+    re[117] = t7;
+    im[117] = t4;
+    re[12] = t10;
+    im[12] = t19;
+    re[27] = t2;
+    im[27] = t5;
+    re[42] = t16;
+    im[42] = t13;
+    re[57] = t12;
+    im[57] = t15;
+    t8 = x[72];
+    t11 = 0.045315068730014604 * t8;
+    t17 = x[167];
+    t6 = 0.09569280241720633 * t17;
+    t1 = t11 - t6;
+    t0 = x[312];
+    t9 = 0.08488084990913544 * t0;
+    t3 = x[407];
+    t14 = 0.0046529099454776825 * t3;
+    t18 = t9 + t14;
+    t7 = C8 * t1;
+    t4 = (-C7) * t18;
+    t10 = t7 + t4;
+    t19 = (-C7) * t1;
+    t2 = (-C8) * t18;
+    t5 = t19 + t2;
+    t16 = x[102];
+    t13 = 0.07595364724111003 * t16;
+    t12 = x[137];
+    t15 = 0.09561210961373615 * t12;
+    t8 = t13 - t15;
+    t17 = x[342];
+    t11 = 0.06483429897658222 * t17;
+    t6 = x[377];
+    t0 = 0.02810120791275669 * t6;
+    t3 = t11 + t0;
+    t9 = C22 * t8;
+    t14 = (-C21) * t3;
+    t7 = t9 + t14;
+    t4 = (-C21) * t8;
+    t1 = (-C22) * t3;
+    t18 = t4 + t1;
+    t19 = x[347];
+    t2 = 0.060053305069332 * t19;
+    t16 = x[372];
+    t12 = 0.03336942781104587 * t16;
+    t13 = t2 + t12;
+    t15 = x[107];
+    t17 = 0.0801298334988885 * t15;
+    t6 = x[132];
+    t11 = 0.09424038580969314 * t6;
+    t0 = t17 - t11;
+    t9 = (-C20) * t13;
+    t14 = C19 * t0;
+    t8 = t9 + t14;
+    t3 = C19 * t13;
+    t4 = C20 * t0;
+    t1 = t3 + t4;
+    t19 = x[317];
+    t16 = 0.08264357727773244 * t19;
+    t2 = x[402];
+    t12 = 0.007256349955859877 * t2;
+    t15 = t16 + t12;
+    t6 = x[77];
+    t17 = 0.05073477379794547 * t6;
+    t11 = x[162];
+    t9 = 0.09637995258792109 * t11;
+    t14 = t17 - t9;
+    t13 = (-C18) * t15;
+    t0 = C17 * t14;
+    t3 = t13 + t0;
+    t4 = C17 * t15;
+    t19 = C18 * t14;
+    t2 = t4 + t19;
+    t16 = x[287];
+    t12 = x[47];
+    t6 = 0.020545864807539 * t12;
+    t11 = x[192];
+    t17 = 0.09162207646476439 * t11;
+    t9 = t6 - t17;
+    t13 = (-0.0810400140962958) * t16;
+    t0 = C15 * t9;
+    t15 = t13 + t0;
+    t14 = 0.04129194960944996 * t16;
+    t4 = C16 * t9;
+    t19 = t14 + t4;
+    t12 = x[257];
+    t11 = x[17];
+    t6 = 0.0030761966919491423 * t11;
+    t17 = x[222];
+    t13 = 0.0904771972914263 * t17;
+    t0 = t6 - t13;
+    t16 = (-0.07233101768460376) * t12;
+    t9 = C13 * t0;
+    t14 = t16 + t9;
+    t4 = 0.0570211765913918 * t12;
+    t11 = C14 * t0;
+    t17 = t4 + t11;
+    t6 = x[12];
+    t13 = 0.0017581191828043815 * t6;
+    t16 = x[227];
+    t9 = 0.0906542322207533 * t16;
+    t12 = t13 - t9;
+    t0 = x[252];
+    t4 = C11 * t12;
+    t11 = (-0.0698998405785362) * t0;
+    t6 = t4 + t11;
+    t16 = (-C12) * t12;
+    t13 = (-0.059700103755103234) * t0;
+    t9 = t16 + t13;
+    t4 = x[42];
+    t11 = 0.016511926279279197 * t4;
+    t12 = x[197];
+    t0 = 0.0910863166264106 * t12;
+    t16 = t11 - t0;
+    t13 = x[282];
+    t4 = C9 * t16;
+    t12 = (-0.07982318671157902) * t13;
+    t11 = t4 + t12;
+    t0 = (-C10) * t16;
+    t4 = (-0.04470313247863461) * t13;
+    t12 = t0 + t4;
+    t16 = t10 + t15;
+    t13 = t5 + t19;
+    t0 = t8 + t6;
+    t4 = t1 + t9;
+    t10 = t10 - t15;
+    t15 = t5 - t19;
+    t5 = t8 - t6;
+    t19 = t1 - t9;
+    t8 = t16 + t0;
+    t6 = t13 + t4;
+    t1 = t10 + t19;
+    t9 = t15 - t5;
+    t16 = t16 - t0;
+    t0 = t13 - t4;
+    t13 = t10 - t19;
+    t4 = t15 + t5;
+    t10 = t7 + t14;
+    t19 = t18 + t17;
+    t15 = t3 + t11;
+    t5 = t2 + t12;
+    t7 = t7 - t14;
+    t14 = t18 - t17;
+    t18 = t3 - t11;
+    t17 = t2 - t12;
+    t3 = t10 + t15;
+    t11 = t19 + t5;
+    t2 = t7 + t17;
+    t12 = t14 - t18;
+    t10 = t10 - t15;
+    t15 = t19 - t5;
+    t19 = t7 - t17;
+    t5 = t14 + t18;
+    t7 = t2 + t12;
+    t17 = t2 - t12;
+    t14 = C6 * t7;
+    t18 = (-C6) * t17;
+    t2 = t19 - t5;
+    t12 = t19 + t5;
+    t7 = (-C6) * t2;
+    t17 = (-C6) * t12;
+    t19 = t8 - t3;
+    t5 = t6 - t11;
+    t2 = t8 + t3;
+    t12 = t6 + t11;
+    t8 = t1 - t14;
+    t3 = t9 - t18;
+    t6 = t1 + t14;
+    t11 = t9 + t18;
+    t1 = t16 - t15;
+    t14 = t0 + t10;
+    t9 = t16 + t15;
+    t18 = t0 - t10;
+    t16 = t13 - t7;
+    t15 = t4 - t17;
+    t0 = t13 + t7;
+    t10 = t4 + t17;
+    re[96] = t2;
+    im[96] = t12;
+    re[111] = t6;
+    im[111] = t11;
+    re[6] = t9;
+    im[6] = t18;
+    re[21] = t0;
+    im[21] = t10;
+    re[36] = t19;
+    im[36] = t5;
+    re[51] = t8;
+    im[51] = t3;
+    re[66] = t1;
+    im[66] = t14;
+    re[81] = t16;
+    im[81] = t15;
+    t13 = re[0];
+    t7 = im[0];
+    t4 = re[24];
+    t17 = im[24];
+    t2 = re[48];
+    t12 = im[48];
+    t6 = re[72];
+    t11 = im[72];
+    t9 = re[96];
+    t18 = im[96];
+    t0 = t4 + t9;
+    t10 = t17 + t18;
+    t19 = t2 + t6;
+    t5 = t12 + t11;
+    t8 = t4 - t9;
+    t3 = t17 - t18;
+    t1 = t2 - t6;
+    t14 = t12 - t11;
+    t16 = t0 + t19;
+    t15 = t10 + t5;
+    t4 = t0 - t19;
+    t9 = C39 * t4;
+    t17 = t10 - t5;
+    t18 = C39 * t17;
+    t2 = C40 * t16;
+    t6 = t13 - t2;
+    t12 = C40 * t15;
+    t11 = t7 - t12;
+    t0 = t6 + t9;
+    t19 = t11 + t18;
+    t4 = t6 - t9;
+    t10 = t11 - t18;
+    t5 = C7 * t8;
+    t17 = C23 * t1;
+    t2 = t5 + t17;
+    t12 = C7 * t3;
+    t6 = C23 * t14;
+    t9 = t12 + t6;
+    t11 = C23 * t8;
+    t18 = C7 * t1;
+    t5 = t11 - t18;
+    t17 = C23 * t3;
+    t12 = C7 * t14;
+    t6 = t17 - t12;
+    t8 = t13 + t16;
+    t1 = t7 + t15;
+    t11 = t0 + t9;
+    t18 = t19 - t2;
+    t3 = t4 + t6;
+    t14 = t10 - t5;
+    t17 = t4 - t6;
+    t12 = t10 + t5;
+    t13 = t0 - t9;
+    t16 = t19 + t2;
+    re[0] = t8;
+    im[0] = t1;
+    re[24] = t11;
+    im[24] = t18;
+    re[48] = t3;
+    im[48] = t14;
+    re[72] = t17;
+    im[72] = t12;
+    re[96] = t13;
+    im[96] = t16;
+    t7 = re[15];
+    t15 = im[15];
+    t4 = re[39];
+    t6 = im[39];
+    t10 = re[63];
+    t5 = im[63];
+    t0 = re[87];
+    t9 = im[87];
+    t19 = re[111];
+    t2 = im[111];
+    t8 = t4 + t19;
+    t1 = t6 + t2;
+    t11 = t10 + t0;
+    t18 = t5 + t9;
+    t3 = t4 - t19;
+    t14 = t6 - t2;
+    t17 = t10 - t0;
+    t12 = t5 - t9;
+    t13 = t8 + t11;
+    t16 = t1 + t18;
+    t4 = t8 - t11;
+    t19 = C39 * t4;
+    t6 = t1 - t18;
+    t2 = C39 * t6;
+    t10 = C40 * t13;
+    t0 = t7 - t10;
+    t5 = C40 * t16;
+    t9 = t15 - t5;
+    t8 = t0 + t19;
+    t11 = t9 + t2;
+    t4 = t0 - t19;
+    t1 = t9 - t2;
+    t18 = C7 * t3;
+    t6 = C23 * t17;
+    t10 = t18 + t6;
+    t5 = C7 * t14;
+    t0 = C23 * t12;
+    t19 = t5 + t0;
+    t9 = C23 * t3;
+    t2 = C7 * t17;
+    t18 = t9 - t2;
+    t6 = C23 * t14;
+    t5 = C7 * t12;
+    t0 = t6 - t5;
+    t3 = t7 + t13;
+    t17 = t15 + t16;
+    t9 = t8 + t19;
+    t2 = t11 - t10;
+    t14 = t4 + t0;
+    t12 = t1 - t18;
+    t6 = t4 - t0;
+    t5 = t1 + t18;
+    t7 = t8 - t19;
+    t13 = t11 + t10;
+    re[15] = t3;
+    im[15] = t17;
+    re[39] = t9;
+    im[39] = t2;
+    re[63] = t14;
+    im[63] = t12;
+    re[87] = t6;
+    im[87] = t5;
+    re[111] = t7;
+    im[111] = t13;
+    t15 = re[30];
+    t16 = im[30];
+    t4 = re[54];
+    t0 = im[54];
+    t1 = re[78];
+    t18 = im[78];
+    t8 = re[102];
+    t19 = im[102];
+    t11 = re[6];
+    t10 = im[6];
+    t3 = t4 + t11;
+    t17 = t0 + t10;
+    t9 = t1 + t8;
+    t2 = t18 + t19;
+    t14 = t4 - t11;
+    t12 = t0 - t10;
+    t6 = t1 - t8;
+    t5 = t18 - t19;
+    t7 = t3 + t9;
+    t13 = t17 + t2;
+    t4 = t3 - t9;
+    t11 = C39 * t4;
+    t0 = t17 - t2;
+    t10 = C39 * t0;
+    t1 = C40 * t7;
+    t8 = t15 - t1;
+    t18 = C40 * t13;
+    t19 = t16 - t18;
+    t3 = t8 + t11;
+    t9 = t19 + t10;
+    t4 = t8 - t11;
+    t17 = t19 - t10;
+    t2 = C7 * t14;
+    t0 = C23 * t6;
+    t1 = t2 + t0;
+    t18 = C7 * t12;
+    t8 = C23 * t5;
+    t11 = t18 + t8;
+    t19 = C23 * t14;
+    t10 = C7 * t6;
+    t2 = t19 - t10;
+    t0 = C23 * t12;
+    t18 = C7 * t5;
+    t8 = t0 - t18;
+    t14 = t15 + t7;
+    t6 = t16 + t13;
+    t19 = t3 + t11;
+    t10 = t9 - t1;
+    t12 = t4 + t8;
+    t5 = t17 - t2;
+    t0 = t4 - t8;
+    t18 = t17 + t2;
+    t15 = t3 - t11;
+    t7 = t9 + t1;
+    re[30] = t14;
+    im[30] = t6;
+    re[54] = t19;
+    im[54] = t10;
+    re[78] = t12;
+    im[78] = t5;
+    re[102] = t0;
+    im[102] = t18;
+    re[6] = t15;
+    im[6] = t7;
+    t16 = re[45];
+    t13 = im[45];
+    t4 = re[69];
+    t8 = im[69];
+    t17 = re[93];
+    t2 = im[93];
+    t3 = re[117];
+    t11 = im[117];
+    t9 = re[21];
+    t1 = im[21];
+    t14 = t4 + t9;
+    t6 = t8 + t1;
+    t19 = t17 + t3;
+    t10 = t2 + t11;
+    t12 = t4 - t9;
+    t5 = t8 - t1;
+    t0 = t17 - t3;
+    t18 = t2 - t11;
+    t15 = t14 + t19;
+    t7 = t6 + t10;
+    t4 = t14 - t19;
+    t9 = C39 * t4;
+    t8 = t6 - t10;
+    t1 = C39 * t8;
+    t17 = C40 * t15;
+    t3 = t16 - t17;
+    t2 = C40 * t7;
+    t11 = t13 - t2;
+    t14 = t3 + t9;
+    t19 = t11 + t1;
+    t4 = t3 - t9;
+    t6 = t11 - t1;
+    t10 = C7 * t12;
+    t8 = C23 * t0;
+    t17 = t10 + t8;
+    t2 = C7 * t5;
+    t3 = C23 * t18;
+    t9 = t2 + t3;
+    t11 = C23 * t12;
+    t1 = C7 * t0;
+    t10 = t11 - t1;
+    t8 = C23 * t5;
+    t2 = C7 * t18;
+    t3 = t8 - t2;
+    t12 = t16 + t15;
+    t0 = t13 + t7;
+    t11 = t14 + t9;
+    t1 = t19 - t17;
+    t5 = t4 + t3;
+    t18 = t6 - t10;
+    t8 = t4 - t3;
+    t2 = t6 + t10;
+    t16 = t14 - t9;
+    t15 = t19 + t17;
+    re[45] = t12;
+    im[45] = t0;
+    re[69] = t11;
+    im[69] = t1;
+    re[93] = t5;
+    im[93] = t18;
+    re[117] = t8;
+    im[117] = t2;
+    re[21] = t16;
+    im[21] = t15;
+    t13 = re[60];
+    t7 = im[60];
+    t4 = re[84];
+    t3 = im[84];
+    t6 = re[108];
+    t10 = im[108];
+    t14 = re[12];
+    t9 = im[12];
+    t19 = re[36];
+    t17 = im[36];
+    t12 = t4 + t19;
+    t0 = t3 + t17;
+    t11 = t6 + t14;
+    t1 = t10 + t9;
+    t5 = t4 - t19;
+    t18 = t3 - t17;
+    t8 = t6 - t14;
+    t2 = t10 - t9;
+    t16 = t12 + t11;
+    t15 = t0 + t1;
+    t4 = t12 - t11;
+    t19 = C39 * t4;
+    t3 = t0 - t1;
+    t17 = C39 * t3;
+    t6 = C40 * t16;
+    t14 = t13 - t6;
+    t10 = C40 * t15;
+    t9 = t7 - t10;
+    t12 = t14 + t19;
+    t11 = t9 + t17;
+    t4 = t14 - t19;
+    t0 = t9 - t17;
+    t1 = C7 * t5;
+    t3 = C23 * t8;
+    t6 = t1 + t3;
+    t10 = C7 * t18;
+    t14 = C23 * t2;
+    t19 = t10 + t14;
+    t9 = C23 * t5;
+    t17 = C7 * t8;
+    t1 = t9 - t17;
+    t3 = C23 * t18;
+    t10 = C7 * t2;
+    t14 = t3 - t10;
+    t5 = t13 + t16;
+    t8 = t7 + t15;
+    t9 = t12 + t19;
+    t17 = t11 - t6;
+    t18 = t4 + t14;
+    t2 = t0 - t1;
+    t3 = t4 - t14;
+    t10 = t0 + t1;
+    t13 = t12 - t19;
+    t16 = t11 + t6;
+    re[60] = t5;
+    im[60] = t8;
+    re[84] = t9;
+    im[84] = t17;
+    re[108] = t18;
+    im[108] = t2;
+    re[12] = t3;
+    im[12] = t10;
+    re[36] = t13;
+    im[36] = t16;
+    t7 = re[75];
+    t15 = im[75];
+    t4 = re[99];
+    t14 = im[99];
+    t0 = re[3];
+    t1 = im[3];
+    t12 = re[27];
+    t19 = im[27];
+    t11 = re[51];
+    t6 = im[51];
+    t5 = t4 + t11;
+    t8 = t14 + t6;
+    t9 = t0 + t12;
+    t17 = t1 + t19;
+    t18 = t4 - t11;
+    t2 = t14 - t6;
+    t3 = t0 - t12;
+    t10 = t1 - t19;
+    t13 = t5 + t9;
+    t16 = t8 + t17;
+    t4 = t5 - t9;
+    t11 = C39 * t4;
+    t14 = t8 - t17;
+    t6 = C39 * t14;
+    t0 = C40 * t13;
+    t12 = t7 - t0;
+    t1 = C40 * t16;
+    t19 = t15 - t1;
+    t5 = t12 + t11;
+    t9 = t19 + t6;
+    t4 = t12 - t11;
+    t8 = t19 - t6;
+    t17 = C7 * t18;
+    t14 = C23 * t3;
+    t0 = t17 + t14;
+    t1 = C7 * t2;
+    t12 = C23 * t10;
+    t11 = t1 + t12;
+    t19 = C23 * t18;
+    t6 = C7 * t3;
+    t17 = t19 - t6;
+    t14 = C23 * t2;
+    t1 = C7 * t10;
+    t12 = t14 - t1;
+    t18 = t7 + t13;
+    t3 = t15 + t16;
+    t19 = t5 + t11;
+    t6 = t9 - t0;
+    t2 = t4 + t12;
+    t10 = t8 - t17;
+    t14 = t4 - t12;
+    t1 = t8 + t17;
+    t7 = t5 - t11;
+    t13 = t9 + t0;
+    re[75] = t18;
+    im[75] = t3;
+    re[99] = t19;
+    im[99] = t6;
+    re[3] = t2;
+    im[3] = t10;
+    re[27] = t14;
+    im[27] = t1;
+    re[51] = t7;
+    im[51] = t13;
+    t15 = re[90];
+    t16 = im[90];
+    t4 = re[114];
+    t12 = im[114];
+    t8 = re[18];
+    t17 = im[18];
+    t5 = re[42];
+    t11 = im[42];
+    t9 = re[66];
+    t0 = im[66];
+    t18 = t4 + t9;
+    t3 = t12 + t0;
+    t19 = t8 + t5;
+    t6 = t17 + t11;
+    t2 = t4 - t9;
+    t10 = t12 - t0;
+    t14 = t8 - t5;
+    t1 = t17 - t11;
+    t7 = t18 + t19;
+    t13 = t3 + t6;
+    t4 = t18 - t19;
+    t9 = C39 * t4;
+    t12 = t3 - t6;
+    t0 = C39 * t12;
+    t8 = C40 * t7;
+    t5 = t15 - t8;
+    t17 = C40 * t13;
+    t11 = t16 - t17;
+    t18 = t5 + t9;
+    t19 = t11 + t0;
+    t4 = t5 - t9;
+    t3 = t11 - t0;
+    t6 = C7 * t2;
+    t12 = C23 * t14;
+    t8 = t6 + t12;
+    t17 = C7 * t10;
+    t5 = C23 * t1;
+    t9 = t17 + t5;
+    t11 = C23 * t2;
+    t0 = C7 * t14;
+    t6 = t11 - t0;
+    t12 = C23 * t10;
+    t17 = C7 * t1;
+    t5 = t12 - t17;
+    t2 = t15 + t7;
+    t14 = t16 + t13;
+    t11 = t18 + t9;
+    t0 = t19 - t8;
+    t10 = t4 + t5;
+    t1 = t3 - t6;
+    t12 = t4 - t5;
+    t17 = t3 + t6;
+    t15 = t18 - t9;
+    t7 = t19 + t8;
+    re[90] = t2;
+    im[90] = t14;
+    re[114] = t11;
+    im[114] = t0;
+    re[18] = t10;
+    im[18] = t1;
+    re[42] = t12;
+    im[42] = t17;
+    re[66] = t15;
+    im[66] = t7;
+    t16 = re[105];
+    t13 = im[105];
+    t4 = re[9];
+    t5 = im[9];
+    t3 = re[33];
+    t6 = im[33];
+    t18 = re[57];
+    t9 = im[57];
+    t19 = re[81];
+    t8 = im[81];
+    t2 = t4 + t19;
+    t14 = t5 + t8;
+    t11 = t3 + t18;
+    t0 = t6 + t9;
+    t10 = t4 - t19;
+    t1 = t5 - t8;
+    t12 = t3 - t18;
+    t17 = t6 - t9;
+    t15 = t2 + t11;
+    t7 = t14 + t0;
+    t4 = t2 - t11;
+    t19 = C39 * t4;
+    t5 = t14 - t0;
+    t8 = C39 * t5;
+    t3 = C40 * t15;
+    t18 = t16 - t3;
+    t6 = C40 * t7;
+    t9 = t13 - t6;
+    t2 = t18 + t19;
+    t11 = t9 + t8;
+    t4 = t18 - t19;
+    t14 = t9 - t8;
+    t0 = C7 * t10;
+    t5 = C23 * t12;
+    t3 = t0 + t5;
+    t6 = C7 * t1;
+    t18 = C23 * t17;
+    t19 = t6 + t18;
+    t9 = C23 * t10;
+    t8 = C7 * t12;
+    t0 = t9 - t8;
+    t5 = C23 * t1;
+    t6 = C7 * t17;
+    t18 = t5 - t6;
+    t10 = t16 + t15;
+    t12 = t13 + t7;
+    t9 = t2 + t19;
+    t8 = t11 - t3;
+    t1 = t4 + t18;
+    t17 = t14 - t0;
+    t5 = t4 - t18;
+    t6 = t14 + t0;
+    t16 = t2 - t19;
+    t15 = t11 + t3;
+    re[105] = t10;
+    im[105] = t12;
+    re[9] = t9;
+    im[9] = t8;
+    re[33] = t1;
+    im[33] = t17;
+    re[57] = t5;
+    im[57] = t6;
+    re[81] = t16;
+    im[81] = t15;
+}
+
+/**
+ *  Part 2 of ApplyWindowedMDCT_W75_240().
+ * 
+ *  @param {Number[]} x 
+ *    - The input block (480 points).
+ *  @param {Number[]} X 
+ *    - The array that would contain the output block (240 points).
+ *  @param {Number[]} re 
+ *    - The scratch buffer (real part, 120 points).
+ *  @param {Number[]} im 
+ *    - The scratch buffer (imaginary part, 120 points).
+ */
+function ApplyWindowedMDCT_W75_240_Part2(x, X, re, im) {
+    let t0, t1, t10, t11, t12, t13, t14, t15, t16, t17, t18, t19, t2, t3, t4, t5, t6, t7, t8, t9;
+    const C0 = 0.25881904510252074;
+    const C1 = 0.9659258262890683;
+    const C2 = 0.06540312923014306;
+    const C3 = 0.9978589232386035;
+    const C4 = 0.9914448613738104;
+    const C5 = 0.13052619222005157;
+    const C6 = 0.9469301294951057;
+    const C7 = 0.3214394653031616;
+    const C8 = 0.7071067811865476;
+    const C9 = 0.33380685923377096;
+    const C10 = 0.9426414910921784;
+    const C11 = 0.1434926219911793;
+    const C12 = 0.9896513868196702;
+    const C13 = 0.9986295347545738;
+    const C14 = 0.05233595624294383;
+    const C15 = 0.9692309097067544;
+    const C16 = 0.24615329302899303;
+    const C17 = 0.40673664307580015;
+    const C18 = 0.9135454576426009;
+    const C19 = 0.22069743502150108;
+    const C20 = 0.9753423205085127;
+    const C21 = 0.02617694830787315;
+    const C22 = 0.9996573249755573;
+    const C23 = 0.9855560590580777;
+    const C24 = 0.1693495038490246;
+    const C25 = 0.9335804264972017;
+    const C26 = 0.35836794954530027;
+    const C27 = 0.10452846326765346;
+    const C28 = 0.9945218953682733;
+    const C29 = 0.9958049275746618;
+    const C30 = 0.09150161866340238;
+    const C31 = 0.958819734868193;
+    const C32 = 0.2840153447039226;
+    const C33 = 0.296541574975571;
+    const C34 = 0.9550199444571866;
+    const C35 = 0.9781476007338057;
+    const C36 = 0.20791169081775931;
+    const C37 = 0.9187912101488983;
+    const C38 = 0.39474385638426723;
+    const C39 = 0.3705574375098362;
+    const C40 = 0.9288095528719242;
+    const C41 = 0.18223552549214747;
+    const C42 = 0.9832549075639546;
+    const C43 = 0.999914327574007;
+    const C44 = 0.01308959557134444;
+    const C45 = 0.5590169943749475;
+    const C46 = 0.25;
+    const C47 = 0.9510565162951535;
+    const C48 = 0.5877852522924731;
+    t13 = x[279];
+    t7 = x[39];
+    t4 = 0.014293156561901202 * t7;
+    t18 = x[200];
+    t14 = 0.09084055835569309 * t18;
+    t0 = t4 - t14;
+    t2 = (-0.07944555268597192) * t13;
+    t19 = 0.49999999999999994 * t0;
+    t11 = t2 + t19;
+    t3 = 0.045867911229164476 * t13;
+    t10 = 0.8660254037844387 * t0;
+    t12 = t3 + t10;
+    t9 = x[249];
+    t8 = x[9];
+    t1 = 0.0011685767792350902 * t8;
+    t17 = x[230];
+    t5 = 0.09078772377604616 * t17;
+    t6 = t1 - t5;
+    t16 = (-0.06901078106602505) * t9;
+    t15 = 0.6593458151000688 * t6;
+    t7 = t16 + t15;
+    t18 = 0.060520830687650164 * t9;
+    t4 = 0.7518398074789774 * t6;
+    t14 = t18 + t4;
+    t2 = x[20];
+    t19 = 0.004077868094918297 * t2;
+    t13 = x[219];
+    t0 = 0.09040548114637302 * t13;
+    t3 = t19 - t0;
+    t10 = x[260];
+    t8 = 0.6087614290087207 * t3;
+    t17 = (-0.07312917039903977) * t10;
+    t1 = t8 + t17;
+    t5 = (-0.7933533402912352) * t3;
+    t16 = (-0.05611398605569533) * t10;
+    t15 = t5 + t16;
+    t9 = x[50];
+    t6 = 0.023152962148670807 * t9;
+    t18 = x[189];
+    t4 = 0.09202198723367433 * t18;
+    t2 = t6 - t4;
+    t13 = x[290];
+    t19 = 0.4422886902190013 * t2;
+    t0 = (-0.08121906228555562) * t13;
+    t8 = t19 + t0;
+    t17 = (-0.8968727415326883) * t2;
+    t3 = (-0.040052809072673355) * t13;
+    t10 = t17 + t3;
+    t5 = x[80];
+    t16 = 0.05398125624826106 * t5;
+    t9 = x[159];
+    t18 = 0.09670175848871748 * t9;
+    t6 = t16 - t18;
+    t4 = x[320];
+    t19 = 0.08109490290798863 * t4;
+    t0 = x[399];
+    t2 = 0.009101559537619174 * t0;
+    t13 = t19 + t2;
+    t17 = C0 * t6;
+    t3 = (-C1) * t13;
+    t5 = t17 + t3;
+    t9 = (-C1) * t6;
+    t16 = (-C0) * t13;
+    t18 = t9 + t16;
+    t4 = x[110];
+    t0 = 0.08243933112539109 * t4;
+    t19 = x[129];
+    t2 = 0.09318534435922614 * t19;
+    t17 = t0 - t2;
+    t3 = x[350];
+    t6 = 0.05703985780184589 * t3;
+    t13 = x[369];
+    t9 = 0.036609401127679665 * t13;
+    t16 = t6 + t9;
+    t4 = C2 * t17;
+    t19 = (-C3) * t16;
+    t0 = t4 + t19;
+    t2 = (-C3) * t17;
+    t3 = (-C2) * t16;
+    t13 = t2 + t3;
+    t6 = x[339];
+    t9 = 0.06753502854847021 * t6;
+    t4 = x[380];
+    t19 = 0.02505487541976712 * t4;
+    t17 = t9 + t19;
+    t16 = x[99];
+    t2 = 0.07326697035985012 * t16;
+    t3 = x[140];
+    t6 = 0.09621138331081235 * t3;
+    t4 = t2 - t6;
+    t9 = (-C4) * t17;
+    t19 = C5 * t4;
+    t16 = t9 + t19;
+    t3 = C5 * t17;
+    t2 = C4 * t4;
+    t6 = t3 + t2;
+    t9 = x[309];
+    t19 = 0.0860267489981687 * t9;
+    t17 = x[410];
+    t4 = 0.0033823163175740493 * t17;
+    t3 = t19 + t4;
+    t2 = x[69];
+    t9 = 0.04208653165019209 * t2;
+    t17 = x[170];
+    t19 = 0.09521437769032931 * t17;
+    t4 = t9 - t19;
+    t2 = (-C6) * t3;
+    t17 = C7 * t4;
+    t9 = t2 + t17;
+    t19 = C7 * t3;
+    t2 = C6 * t4;
+    t17 = t19 + t2;
+    t3 = t11 + t5;
+    t4 = t12 + t18;
+    t19 = t1 + t16;
+    t2 = t15 + t6;
+    t11 = t11 - t5;
+    t5 = t12 - t18;
+    t12 = t1 - t16;
+    t18 = t15 - t6;
+    t1 = t3 + t19;
+    t16 = t4 + t2;
+    t15 = t11 + t18;
+    t6 = t5 - t12;
+    t3 = t3 - t19;
+    t19 = t4 - t2;
+    t4 = t11 - t18;
+    t2 = t5 + t12;
+    t11 = t7 + t0;
+    t18 = t14 + t13;
+    t5 = t8 + t9;
+    t12 = t10 + t17;
+    t7 = t7 - t0;
+    t0 = t14 - t13;
+    t14 = t8 - t9;
+    t13 = t10 - t17;
+    t8 = t11 + t5;
+    t9 = t18 + t12;
+    t10 = t7 + t13;
+    t17 = t0 - t14;
+    t11 = t11 - t5;
+    t5 = t18 - t12;
+    t18 = t7 - t13;
+    t12 = t0 + t14;
+    t7 = t10 + t17;
+    t13 = t10 - t17;
+    t0 = C8 * t7;
+    t14 = (-C8) * t13;
+    t10 = t18 - t12;
+    t17 = t18 + t12;
+    t7 = (-C8) * t10;
+    t13 = (-C8) * t17;
+    t18 = t1 - t8;
+    t12 = t16 - t9;
+    t10 = t1 + t8;
+    t17 = t16 + t9;
+    t1 = t15 - t0;
+    t8 = t6 - t14;
+    t16 = t15 + t0;
+    t9 = t6 + t14;
+    t15 = t3 - t5;
+    t0 = t19 + t11;
+    t6 = t3 + t5;
+    t14 = t19 - t11;
+    t3 = t4 - t7;
+    t5 = t2 - t13;
+    t19 = t4 + t7;
+    t11 = t2 + t13;
+    re[40] = t10;
+    im[40] = t17;
+    re[55] = t16;
+    im[55] = t9;
+    re[70] = t6;
+    im[70] = t14;
+    re[85] = t19;
+    im[85] = t11;
+    re[100] = t18;
+    im[100] = t12;
+    re[115] = t1;
+    im[115] = t8;
+    re[10] = t15;
+    im[10] = t0;
+    re[25] = t3;
+    im[25] = t5;
+    t4 = x[8];
+    t7 = 0.0010033991315600104 * t4;
+    t2 = x[231];
+    t13 = 0.09083576620894716 * t2;
+    t10 = t7 - t13;
+    t17 = x[248];
+    t16 = 0.6691306063588582 * t10;
+    t9 = (-0.06817659831700702) * t17;
+    t6 = t16 + t9;
+    t14 = (-0.7431448254773942) * t10;
+    t19 = (-0.06138648485110244) * t17;
+    t11 = t14 + t19;
+    t18 = x[38];
+    t12 = 0.013588742078380437 * t18;
+    t1 = x[201];
+    t8 = 0.09077071936013452 * t1;
+    t15 = t12 - t8;
+    t0 = x[278];
+    t3 = 0.5112930860770522 * t15;
+    t5 = (-0.07889901221814911) * t0;
+    t4 = t3 + t5;
+    t2 = (-0.8594064115014527) * t15;
+    t7 = (-0.04693997962497202) * t0;
+    t13 = t2 + t7;
+    t16 = x[68];
+    t9 = 0.0410180473216129 * t16;
+    t10 = x[171];
+    t17 = 0.09504699657158702 * t10;
+    t14 = t9 - t17;
+    t19 = x[308];
+    t18 = 0.08637786614799858 * t19;
+    t1 = x[411];
+    t12 = 0.0030078610211779653 * t1;
+    t8 = t18 + t12;
+    t3 = C9 * t14;
+    t5 = (-C10) * t8;
+    t15 = t3 + t5;
+    t0 = (-C10) * t14;
+    t2 = (-C9) * t8;
+    t7 = t0 + t2;
+    t16 = x[98];
+    t10 = 0.07234331684866252 * t16;
+    t9 = x[141];
+    t17 = 0.09637494539960026 * t9;
+    t19 = t10 - t17;
+    t1 = x[338];
+    t18 = 0.06840421737663181 * t1;
+    t12 = x[381];
+    t3 = 0.024064152632092713 * t12;
+    t5 = t18 + t3;
+    t14 = C11 * t19;
+    t8 = (-C12) * t5;
+    t0 = t14 + t8;
+    t2 = (-C12) * t19;
+    t16 = (-C11) * t5;
+    t9 = t2 + t16;
+    t10 = x[351];
+    t17 = 0.05601407996358747 * t10;
+    t1 = x[368];
+    t12 = 0.03769797295232574 * t1;
+    t18 = t17 + t12;
+    t3 = x[111];
+    t14 = 0.08317465107752332 * t3;
+    t8 = x[128];
+    t19 = 0.09279483997724569 * t8;
+    t5 = t14 - t19;
+    t2 = (-C13) * t18;
+    t16 = C14 * t5;
+    t10 = t2 + t16;
+    t1 = C14 * t18;
+    t17 = C13 * t5;
+    t12 = t1 + t17;
+    t3 = x[321];
+    t8 = 0.08054275100119243 * t3;
+    t14 = x[398];
+    t19 = 0.00976233994080978 * t14;
+    t2 = t8 + t19;
+    t16 = x[81];
+    t18 = 0.055058748193673866 * t16;
+    t5 = x[158];
+    t1 = 0.0967912198161176 * t5;
+    t17 = t18 - t1;
+    t3 = (-C15) * t2;
+    t14 = C16 * t17;
+    t8 = t3 + t14;
+    t19 = C16 * t2;
+    t16 = C15 * t17;
+    t5 = t19 + t16;
+    t18 = x[291];
+    t1 = x[51];
+    t3 = 0.024050868215834645 * t1;
+    t14 = x[188];
+    t2 = 0.09216884617272778 * t14;
+    t17 = t3 - t2;
+    t19 = (-0.0816061429493561) * t18;
+    t16 = 0.4305110968082951 * t17;
+    t1 = t19 + t16;
+    t14 = 0.03892413350471133 * t18;
+    t3 = 0.9025852843498606 * t17;
+    t2 = t14 + t3;
+    t19 = x[261];
+    t16 = x[21];
+    t18 = 0.004448082232380634 * t16;
+    t17 = x[218];
+    t14 = 0.09038829747800994 * t17;
+    t3 = t18 - t14;
+    t16 = (-0.07387145562049421) * t19;
+    t17 = 0.598324600570659 * t3;
+    t18 = t16 + t17;
+    t14 = 0.055162432275061395 * t19;
+    t16 = 0.8012538126910607 * t3;
+    t17 = t14 + t16;
+    t19 = t6 + t10;
+    t3 = t11 + t12;
+    t14 = t15 + t1;
+    t16 = t7 + t2;
+    t6 = t6 - t10;
+    t10 = t11 - t12;
+    t11 = t15 - t1;
+    t12 = t7 - t2;
+    t15 = t19 + t14;
+    t1 = t3 + t16;
+    t7 = t6 + t12;
+    t2 = t10 - t11;
+    t19 = t19 - t14;
+    t14 = t3 - t16;
+    t3 = t6 - t12;
+    t16 = t10 + t11;
+    t6 = t4 + t8;
+    t12 = t13 + t5;
+    t10 = t0 + t18;
+    t11 = t9 + t17;
+    t4 = t4 - t8;
+    t8 = t13 - t5;
+    t13 = t0 - t18;
+    t5 = t9 - t17;
+    t0 = t6 + t10;
+    t18 = t12 + t11;
+    t9 = t4 + t5;
+    t17 = t8 - t13;
+    t6 = t6 - t10;
+    t10 = t12 - t11;
+    t12 = t4 - t5;
+    t11 = t8 + t13;
+    t4 = t9 + t17;
+    t5 = t9 - t17;
+    t8 = C8 * t4;
+    t13 = (-C8) * t5;
+    t9 = t12 - t11;
+    t17 = t12 + t11;
+    t4 = (-C8) * t9;
+    t5 = (-C8) * t17;
+    t12 = t15 - t0;
+    t11 = t1 - t18;
+    t9 = t15 + t0;
+    t17 = t1 + t18;
+    t15 = t7 - t8;
+    t0 = t2 - t13;
+    t1 = t7 + t8;
+    t18 = t2 + t13;
+    t7 = t19 - t10;
+    t8 = t14 + t6;
+    t2 = t19 + t10;
+    t13 = t14 - t6;
+    t19 = t3 - t4;
+    t10 = t16 - t5;
+    t14 = t3 + t4;
+    t6 = t16 + t5;
+    re[64] = t9;
+    im[64] = t17;
+    re[79] = t1;
+    im[79] = t18;
+    re[94] = t2;
+    im[94] = t13;
+    re[109] = t14;
+    im[109] = t6;
+    re[4] = t12;
+    im[4] = t11;
+    re[19] = t15;
+    im[19] = t0;
+    re[34] = t7;
+    im[34] = t8;
+    re[49] = t19;
+    im[49] = t10;
+    t3 = x[56];
+    t4 = 0.02873634741694584 * t3;
+    t16 = x[183];
+    t5 = 0.09295427829844087 * t16;
+    t9 = t4 - t5;
+    t17 = x[296];
+    t1 = 0.0895480206469585 * t17;
+    t18 = x[423];
+    t2 = 0.000329259000948847 * t18;
+    t13 = t1 + t2;
+    t14 = C17 * t9;
+    t6 = (-C18) * t13;
+    t12 = t14 + t6;
+    t11 = (-C18) * t9;
+    t15 = (-C17) * t13;
+    t0 = t11 + t15;
+    t7 = x[86];
+    t8 = 0.06038023731968849 * t7;
+    t19 = x[153];
+    t10 = 0.09707744401023602 * t19;
+    t3 = t8 - t10;
+    t16 = x[326];
+    t4 = 0.0775117043266292 * t16;
+    t5 = x[393];
+    t17 = 0.013393375586540204 * t5;
+    t18 = t4 + t17;
+    t1 = C19 * t3;
+    t2 = (-C20) * t18;
+    t14 = t1 + t2;
+    t6 = (-C20) * t3;
+    t9 = (-C19) * t18;
+    t13 = t6 + t9;
+    t11 = x[116];
+    t15 = 0.08657786267658361 * t11;
+    t7 = x[123];
+    t19 = 0.09054639388396353 * t7;
+    t8 = t15 - t19;
+    t10 = x[356];
+    t16 = 0.05075903923035873 * t10;
+    t5 = x[363];
+    t4 = 0.04316675485476704 * t5;
+    t17 = t16 + t4;
+    t1 = C21 * t8;
+    t2 = (-C22) * t17;
+    t3 = t1 + t2;
+    t18 = (-C22) * t8;
+    t6 = (-C21) * t17;
+    t9 = t18 + t6;
+    t11 = x[333];
+    t7 = 0.07250511592434625 * t11;
+    t15 = x[386];
+    t19 = 0.01931982303769135 * t15;
+    t10 = t7 + t19;
+    t5 = x[93];
+    t16 = 0.06753718307378472 * t5;
+    t4 = x[146];
+    t1 = 0.09693835832518913 * t4;
+    t2 = t16 - t1;
+    t8 = (-C23) * t10;
+    t17 = C24 * t2;
+    t18 = t8 + t17;
+    t6 = C24 * t10;
+    t11 = C23 * t2;
+    t15 = t6 + t11;
+    t7 = x[303];
+    t19 = 0.08791815223495067 * t7;
+    t5 = x[416];
+    t4 = 0.0014982238934458136 * t5;
+    t16 = t19 + t4;
+    t1 = x[63];
+    t8 = 0.035758982113670124 * t1;
+    t17 = x[176];
+    t10 = 0.09417575507955023 * t17;
+    t2 = t8 - t10;
+    t6 = (-C25) * t16;
+    t11 = C26 * t2;
+    t7 = t6 + t11;
+    t5 = C26 * t16;
+    t19 = C25 * t2;
+    t4 = t5 + t19;
+    t1 = x[273];
+    t17 = x[33];
+    t8 = 0.010340424900205238 * t17;
+    t10 = x[206];
+    t6 = 0.09050785698244482 * t10;
+    t11 = t8 - t6;
+    t16 = (-0.07786872966067589) * t1;
+    t2 = 0.5336145159156115 * t11;
+    t5 = t16 + t2;
+    t19 = 0.049131509472073884 * t1;
+    t17 = 0.8457278217039733 * t11;
+    t10 = t19 + t17;
+    t8 = x[243];
+    t6 = x[3];
+    t16 = 0.0003913811942012797 * t6;
+    t2 = x[236];
+    t1 = 0.09109495310907251 * t2;
+    t11 = t16 - t1;
+    t19 = (-0.06635698486901545) * t8;
+    t17 = 0.6883545756937539 * t11;
+    t6 = t19 + t17;
+    t2 = 0.06297042739473106 * t8;
+    t16 = 0.7253743710122876 * t11;
+    t1 = t2 + t16;
+    t19 = x[26];
+    t17 = 0.006575394365350636 * t19;
+    t8 = x[213];
+    t11 = 0.09035979631801205 * t8;
+    t2 = t17 - t11;
+    t16 = x[266];
+    t19 = 0.5771451900372336 * t2;
+    t8 = (-0.07531387376154847) * t16;
+    t17 = t19 + t8;
+    t11 = (-0.8166415551616789) * t2;
+    t19 = (-0.05322658357245058) * t16;
+    t8 = t11 + t19;
+    t2 = t12 + t7;
+    t16 = t0 + t4;
+    t11 = t3 + t6;
+    t19 = t9 + t1;
+    t12 = t12 - t7;
+    t7 = t0 - t4;
+    t0 = t3 - t6;
+    t4 = t9 - t1;
+    t3 = t2 + t11;
+    t6 = t16 + t19;
+    t9 = t12 + t4;
+    t1 = t7 - t0;
+    t2 = t2 - t11;
+    t11 = t16 - t19;
+    t16 = t12 - t4;
+    t19 = t7 + t0;
+    t12 = t14 + t5;
+    t4 = t13 + t10;
+    t7 = t18 + t17;
+    t0 = t15 + t8;
+    t14 = t14 - t5;
+    t5 = t13 - t10;
+    t13 = t18 - t17;
+    t10 = t15 - t8;
+    t18 = t12 + t7;
+    t17 = t4 + t0;
+    t15 = t14 + t10;
+    t8 = t5 - t13;
+    t12 = t12 - t7;
+    t7 = t4 - t0;
+    t4 = t14 - t10;
+    t0 = t5 + t13;
+    t14 = t15 + t8;
+    t10 = t15 - t8;
+    t5 = C8 * t14;
+    t13 = (-C8) * t10;
+    t15 = t4 - t0;
+    t8 = t4 + t0;
+    t14 = (-C8) * t15;
+    t10 = (-C8) * t8;
+    t4 = t3 - t18;
+    t0 = t6 - t17;
+    t15 = t3 + t18;
+    t8 = t6 + t17;
+    t3 = t9 - t5;
+    t18 = t1 - t13;
+    t6 = t9 + t5;
+    t17 = t1 + t13;
+    t9 = t2 - t7;
+    t5 = t11 + t12;
+    t1 = t2 + t7;
+    t13 = t11 - t12;
+    t2 = t16 - t14;
+    t7 = t19 - t10;
+    t11 = t16 + t14;
+    t12 = t19 + t10;
+    re[88] = t15;
+    im[88] = t8;
+    re[103] = t6;
+    im[103] = t17;
+    re[118] = t1;
+    im[118] = t13;
+    re[13] = t11;
+    im[13] = t12;
+    re[28] = t4;
+    im[28] = t0;
+    re[43] = t3;
+    im[43] = t18;
+    re[58] = t9;
+    im[58] = t5;
+    re[73] = t2;
+    im[73] = t7;
+    t16 = x[104];
+    t14 = 0.07767146900283439 * t16;
+    t19 = x[135];
+    t10 = 0.09512004217473578 * t19;
+    t15 = t14 - t10;
+    t8 = x[344];
+    t6 = 0.06296179334680656 * t8;
+    t17 = x[375];
+    t1 = 0.030183604415960606 * t17;
+    t13 = t6 + t1;
+    t11 = C27 * t15;
+    t12 = (-C28) * t13;
+    t4 = t11 + t12;
+    t0 = (-C28) * t15;
+    t3 = (-C27) * t13;
+    t18 = t0 + t3;
+    t9 = x[345];
+    t5 = 0.06200503747723192 * t9;
+    t2 = x[374];
+    t7 = 0.031238088585639097 * t2;
+    t16 = t5 + t7;
+    t19 = x[105];
+    t14 = 0.07850712007363697 * t19;
+    t10 = x[134];
+    t8 = 0.09484585771001464 * t10;
+    t17 = t14 - t8;
+    t6 = (-C29) * t16;
+    t1 = C30 * t17;
+    t11 = t6 + t1;
+    t12 = C30 * t16;
+    t15 = C29 * t17;
+    t13 = t12 + t15;
+    t0 = x[315];
+    t3 = 0.08358974634339059 * t0;
+    t9 = x[404];
+    t2 = 0.006143019792502721 * t9;
+    t5 = t3 + t2;
+    t7 = x[75];
+    t19 = 0.04856492303546617 * t7;
+    t10 = x[164];
+    t14 = 0.09612420663291579 * t10;
+    t8 = t19 - t14;
+    t6 = (-C31) * t5;
+    t1 = C32 * t8;
+    t16 = t6 + t1;
+    t17 = C32 * t5;
+    t12 = C31 * t8;
+    t15 = t17 + t12;
+    t0 = x[285];
+    t9 = x[45];
+    t3 = 0.018883113189353255 * t9;
+    t2 = x[194];
+    t7 = 0.09138840410436003 * t2;
+    t10 = t3 - t7;
+    t19 = (-0.08069838893823983) * t0;
+    t14 = 0.4656145203251114 * t10;
+    t6 = t19 + t14;
+    t1 = 0.04245747631481119 * t0;
+    t5 = 0.8849876374630419 * t10;
+    t8 = t1 + t5;
+    t17 = x[255];
+    t12 = x[15];
+    t9 = 0.002497218153517526 * t12;
+    t2 = x[224];
+    t3 = 0.09054017105349113 * t2;
+    t7 = t9 - t3;
+    t19 = (-0.07152865153798538) * t17;
+    t14 = 0.6293203910498375 * t7;
+    t0 = t19 + t14;
+    t10 = 0.05792275993143005 * t17;
+    t1 = 0.7771459614569709 * t7;
+    t5 = t10 + t1;
+    t12 = x[14];
+    t2 = 0.0022336672030543237 * t12;
+    t9 = x[225];
+    t3 = 0.09057574362934841 * t9;
+    t19 = t2 - t3;
+    t14 = x[254];
+    t17 = 0.6394390019805847 * t19;
+    t7 = (-0.07073654612759732) * t14;
+    t10 = t17 + t7;
+    t1 = (-0.7688418320734596) * t19;
+    t12 = (-0.05883096440967682) * t14;
+    t9 = t1 + t12;
+    t2 = x[44];
+    t3 = 0.018075962073785333 * t2;
+    t17 = x[195];
+    t7 = 0.09128138957966771 * t17;
+    t19 = t3 - t7;
+    t14 = x[284];
+    t1 = 0.4771587602596084 * t19;
+    t12 = (-0.08022967192516275) * t14;
+    t2 = t1 + t12;
+    t17 = (-0.8788171126619654) * t19;
+    t3 = (-0.043561157651889004) * t14;
+    t7 = t17 + t3;
+    t1 = x[74];
+    t12 = 0.04748043250702334 * t1;
+    t19 = x[165];
+    t14 = 0.09598610074001072 * t19;
+    t17 = t12 - t14;
+    t3 = x[314];
+    t1 = 0.08403708295850383 * t3;
+    t19 = x[405];
+    t12 = 0.005622135445844074 * t19;
+    t14 = t1 + t12;
+    t3 = C33 * t17;
+    t19 = (-C34) * t14;
+    t1 = t3 + t19;
+    t12 = (-C34) * t17;
+    t3 = (-C33) * t14;
+    t19 = t12 + t3;
+    t17 = t4 + t0;
+    t14 = t18 + t5;
+    t12 = t16 + t2;
+    t3 = t15 + t7;
+    t4 = t4 - t0;
+    t0 = t18 - t5;
+    t18 = t16 - t2;
+    t5 = t15 - t7;
+    t16 = t17 + t12;
+    t2 = t14 + t3;
+    t15 = t4 + t5;
+    t7 = t0 - t18;
+    t17 = t17 - t12;
+    t12 = t14 - t3;
+    t14 = t4 - t5;
+    t3 = t0 + t18;
+    t4 = t11 + t10;
+    t5 = t13 + t9;
+    t0 = t6 + t1;
+    t18 = t8 + t19;
+    t11 = t11 - t10;
+    t10 = t13 - t9;
+    t13 = t6 - t1;
+    t9 = t8 - t19;
+    t6 = t4 + t0;
+    t1 = t5 + t18;
+    t8 = t11 + t9;
+    t19 = t10 - t13;
+    t4 = t4 - t0;
+    t0 = t5 - t18;
+    t5 = t11 - t9;
+    t18 = t10 + t13;
+    t11 = t8 + t19;
+    t9 = t8 - t19;
+    t10 = C8 * t11;
+    t13 = (-C8) * t9;
+    t8 = t5 - t18;
+    t19 = t5 + t18;
+    t11 = (-C8) * t8;
+    t9 = (-C8) * t19;
+    t5 = t16 - t6;
+    t18 = t2 - t1;
+    t8 = t16 + t6;
+    t19 = t2 + t1;
+    t16 = t15 - t10;
+    t6 = t7 - t13;
+    t2 = t15 + t10;
+    t1 = t7 + t13;
+    t15 = t17 - t0;
+    t10 = t12 + t4;
+    t7 = t17 + t0;
+    t13 = t12 - t4;
+    t17 = t14 - t11;
+    t0 = t3 - t9;
+    t12 = t14 + t11;
+    t4 = t3 + t9;
+    re[112] = t8;
+    im[112] = t19;
+    re[7] = t2;
+    im[7] = t1;
+    re[22] = t7;
+    im[22] = t13;
+    re[37] = t12;
+    im[37] = t4;
+    re[52] = t5;
+    im[52] = t18;
+    re[67] = t16;
+    im[67] = t6;
+    re[82] = t15;
+    im[82] = t10;
+    re[97] = t17;
+    im[97] = t0;
+    t14 = x[327];
+    t11 = 0.0768506804043917 * t14;
+    t3 = x[392];
+    t9 = 0.014182605054244018 * t3;
+    t8 = t11 + t9;
+    t19 = x[87];
+    t2 = 0.06142731431140673 * t19;
+    t1 = x[152];
+    t7 = 0.09709912723798485 * t1;
+    t13 = t2 - t7;
+    t12 = (-C35) * t8;
+    t4 = C36 * t13;
+    t5 = t12 + t4;
+    t18 = C36 * t8;
+    t16 = C35 * t13;
+    t6 = t18 + t16;
+    t15 = x[297];
+    t10 = 0.08935022993236894 * t15;
+    t17 = x[422];
+    t0 = 0.0004222769452670429 * t17;
+    t14 = t10 + t0;
+    t3 = x[57];
+    t11 = 0.029709304370203957 * t3;
+    t9 = x[182];
+    t19 = 0.09312553292068804 * t9;
+    t1 = t11 - t19;
+    t2 = (-C37) * t14;
+    t7 = C38 * t1;
+    t12 = t2 + t7;
+    t4 = C38 * t14;
+    t8 = C37 * t1;
+    t13 = t4 + t8;
+    t18 = x[267];
+    t16 = x[27];
+    t15 = 0.007056849639334466 * t16;
+    t17 = x[212];
+    t10 = 0.09036665294277783 * t17;
+    t0 = t15 - t10;
+    t3 = (-0.07599836903183291) * t18;
+    t9 = 0.5664062369248328 * t0;
+    t11 = t3 + t9;
+    t19 = 0.05223223192035728 * t18;
+    t2 = 0.8241261886220156 * t0;
+    t7 = t19 + t2;
+    t14 = x[2];
+    t1 = 0.0003074203471366065 * t14;
+    t4 = x[237];
+    t8 = 0.09114938091832223 * t4;
+    t16 = t1 - t8;
+    t17 = x[242];
+    t15 = 0.6977904598416801 * t16;
+    t10 = (-0.06548791447328671) * t17;
+    t3 = t15 + t10;
+    t9 = (-0.7163019434246544) * t16;
+    t18 = (-0.06379550184648364) * t17;
+    t0 = t9 + t18;
+    t19 = x[32];
+    t2 = 0.009746159098938015 * t19;
+    t14 = x[207];
+    t4 = 0.09047173613512795 * t14;
+    t1 = t2 - t4;
+    t8 = x[272];
+    t15 = 0.544639035015027 * t1;
+    t10 = (-0.07724977653912372) * t8;
+    t16 = t15 + t10;
+    t17 = (-0.838670567945424) * t1;
+    t9 = (-0.05016659145731785) * t8;
+    t18 = t17 + t9;
+    t19 = x[62];
+    t14 = 0.034728147276250475 * t19;
+    t2 = x[177];
+    t4 = 0.09399827813076395 * t2;
+    t15 = t14 - t4;
+    t10 = x[302];
+    t1 = 0.08818615927816541 * t10;
+    t8 = x[417];
+    t17 = 0.001266586606840836 * t8;
+    t9 = t1 + t17;
+    t19 = C39 * t15;
+    t2 = (-C40) * t9;
+    t14 = t19 + t2;
+    t4 = (-C40) * t15;
+    t10 = (-C39) * t9;
+    t8 = t4 + t10;
+    t1 = x[92];
+    t17 = 0.06654202713938924 * t1;
+    t19 = x[147];
+    t2 = 0.09700200223142667 * t19;
+    t15 = t17 - t2;
+    t9 = x[332];
+    t4 = 0.07327389637800778 * t9;
+    t10 = x[387];
+    t1 = 0.018418715600610196 * t10;
+    t19 = t4 + t1;
+    t17 = C41 * t15;
+    t2 = (-C42) * t19;
+    t9 = t17 + t2;
+    t10 = (-C42) * t15;
+    t4 = (-C41) * t19;
+    t1 = t10 + t4;
+    t17 = x[357];
+    t2 = 0.0496869863118727 * t17;
+    t15 = x[362];
+    t19 = 0.04426053611132889 * t15;
+    t10 = t2 + t19;
+    t4 = x[117];
+    t17 = 0.08720250941904868 * t4;
+    t15 = x[122];
+    t2 = 0.09003773116994462 * t15;
+    t19 = t17 - t2;
+    t4 = (-C43) * t10;
+    t15 = C44 * t19;
+    t17 = t4 + t15;
+    t2 = C44 * t10;
+    t4 = C43 * t19;
+    t15 = t2 + t4;
+    t10 = t5 + t16;
+    t19 = t6 + t18;
+    t2 = t11 + t9;
+    t4 = t7 + t1;
+    t5 = t5 - t16;
+    t16 = t6 - t18;
+    t6 = t11 - t9;
+    t18 = t7 - t1;
+    t11 = t10 + t2;
+    t9 = t19 + t4;
+    t7 = t5 + t18;
+    t1 = t16 - t6;
+    t10 = t10 - t2;
+    t2 = t19 - t4;
+    t19 = t5 - t18;
+    t4 = t16 + t6;
+    t5 = t12 + t14;
+    t18 = t13 + t8;
+    t16 = t3 + t17;
+    t6 = t0 + t15;
+    t12 = t12 - t14;
+    t14 = t13 - t8;
+    t13 = t3 - t17;
+    t8 = t0 - t15;
+    t3 = t5 + t16;
+    t17 = t18 + t6;
+    t0 = t12 + t8;
+    t15 = t14 - t13;
+    t5 = t5 - t16;
+    t16 = t18 - t6;
+    t18 = t12 - t8;
+    t6 = t14 + t13;
+    t12 = t0 + t15;
+    t8 = t0 - t15;
+    t14 = C8 * t12;
+    t13 = (-C8) * t8;
+    t0 = t18 - t6;
+    t15 = t18 + t6;
+    t12 = (-C8) * t0;
+    t8 = (-C8) * t15;
+    t18 = t11 - t3;
+    t6 = t9 - t17;
+    t0 = t11 + t3;
+    t15 = t9 + t17;
+    t11 = t7 - t14;
+    t3 = t1 - t13;
+    t9 = t7 + t14;
+    t17 = t1 + t13;
+    t7 = t10 - t16;
+    t14 = t2 + t5;
+    t1 = t10 + t16;
+    t13 = t2 - t5;
+    t10 = t19 - t12;
+    t16 = t4 - t8;
+    t2 = t19 + t12;
+    t5 = t4 + t8;
+    re[16] = t0;
+    im[16] = t15;
+    re[31] = t9;
+    im[31] = t17;
+    re[46] = t1;
+    im[46] = t13;
+    re[61] = t2;
+    im[61] = t5;
+    re[76] = t18;
+    im[76] = t6;
+    re[91] = t11;
+    im[91] = t3;
+    re[106] = t7;
+    im[106] = t14;
+    re[1] = t10;
+    im[1] = t16;
+    t19 = re[40];
+    t12 = im[40];
+    t4 = re[64];
+    t8 = im[64];
+    t0 = re[88];
+    t15 = im[88];
+    t9 = re[112];
+    t17 = im[112];
+    t1 = re[16];
+    t13 = im[16];
+    t2 = t4 + t1;
+    t5 = t8 + t13;
+    t18 = t0 + t9;
+    t6 = t15 + t17;
+    t11 = t4 - t1;
+    t3 = t8 - t13;
+    t7 = t0 - t9;
+    t14 = t15 - t17;
+    t10 = t2 + t18;
+    t16 = t5 + t6;
+    t4 = t2 - t18;
+    t1 = C45 * t4;
+    t8 = t5 - t6;
+    t13 = C45 * t8;
+    t0 = C46 * t10;
+    t9 = t19 - t0;
+    t15 = C46 * t16;
+    t17 = t12 - t15;
+    t2 = t9 + t1;
+    t18 = t17 + t13;
+    t4 = t9 - t1;
+    t5 = t17 - t13;
+    t6 = C47 * t11;
+    t8 = C48 * t7;
+    t0 = t6 + t8;
+    t15 = C47 * t3;
+    t9 = C48 * t14;
+    t1 = t15 + t9;
+    t17 = C48 * t11;
+    t13 = C47 * t7;
+    t6 = t17 - t13;
+    t8 = C48 * t3;
+    t15 = C47 * t14;
+    t9 = t8 - t15;
+    t11 = t19 + t10;
+    t7 = t12 + t16;
+    t17 = t2 + t1;
+    t13 = t18 - t0;
+    t3 = t4 + t9;
+    t14 = t5 - t6;
+    t8 = t4 - t9;
+    t15 = t5 + t6;
+    t19 = t2 - t1;
+    t10 = t18 + t0;
+    re[40] = t11;
+    im[40] = t7;
+    re[64] = t17;
+    im[64] = t13;
+    re[88] = t3;
+    im[88] = t14;
+    re[112] = t8;
+    im[112] = t15;
+    re[16] = t19;
+    im[16] = t10;
+    t12 = re[55];
+    t16 = im[55];
+    t4 = re[79];
+    t9 = im[79];
+    t5 = re[103];
+    t6 = im[103];
+    t2 = re[7];
+    t1 = im[7];
+    t18 = re[31];
+    t0 = im[31];
+    t11 = t4 + t18;
+    t7 = t9 + t0;
+    t17 = t5 + t2;
+    t13 = t6 + t1;
+    t3 = t4 - t18;
+    t14 = t9 - t0;
+    t8 = t5 - t2;
+    t15 = t6 - t1;
+    t19 = t11 + t17;
+    t10 = t7 + t13;
+    t4 = t11 - t17;
+    t18 = C45 * t4;
+    t9 = t7 - t13;
+    t0 = C45 * t9;
+    t5 = C46 * t19;
+    t2 = t12 - t5;
+    t6 = C46 * t10;
+    t1 = t16 - t6;
+    t11 = t2 + t18;
+    t17 = t1 + t0;
+    t4 = t2 - t18;
+    t7 = t1 - t0;
+    t13 = C47 * t3;
+    t9 = C48 * t8;
+    t5 = t13 + t9;
+    t6 = C47 * t14;
+    t2 = C48 * t15;
+    t18 = t6 + t2;
+    t1 = C48 * t3;
+    t0 = C47 * t8;
+    t13 = t1 - t0;
+    t9 = C48 * t14;
+    t6 = C47 * t15;
+    t2 = t9 - t6;
+    t3 = t12 + t19;
+    t8 = t16 + t10;
+    t1 = t11 + t18;
+    t0 = t17 - t5;
+    t14 = t4 + t2;
+    t15 = t7 - t13;
+    t9 = t4 - t2;
+    t6 = t7 + t13;
+    t12 = t11 - t18;
+    t19 = t17 + t5;
+    re[55] = t3;
+    im[55] = t8;
+    re[79] = t1;
+    im[79] = t0;
+    re[103] = t14;
+    im[103] = t15;
+    re[7] = t9;
+    im[7] = t6;
+    re[31] = t12;
+    im[31] = t19;
+    t16 = re[70];
+    t10 = im[70];
+    t4 = re[94];
+    t2 = im[94];
+    t7 = re[118];
+    t13 = im[118];
+    t11 = re[22];
+    t18 = im[22];
+    t17 = re[46];
+    t5 = im[46];
+    t3 = t4 + t17;
+    t8 = t2 + t5;
+    t1 = t7 + t11;
+    t0 = t13 + t18;
+    t14 = t4 - t17;
+    t15 = t2 - t5;
+    t9 = t7 - t11;
+    t6 = t13 - t18;
+    t12 = t3 + t1;
+    t19 = t8 + t0;
+    t4 = t3 - t1;
+    t17 = C45 * t4;
+    t2 = t8 - t0;
+    t5 = C45 * t2;
+    t7 = C46 * t12;
+    t11 = t16 - t7;
+    t13 = C46 * t19;
+    t18 = t10 - t13;
+    t3 = t11 + t17;
+    t1 = t18 + t5;
+    t4 = t11 - t17;
+    t8 = t18 - t5;
+    t0 = C47 * t14;
+    t2 = C48 * t9;
+    t7 = t0 + t2;
+    t13 = C47 * t15;
+    t11 = C48 * t6;
+    t17 = t13 + t11;
+    t18 = C48 * t14;
+    t5 = C47 * t9;
+    t0 = t18 - t5;
+    t2 = C48 * t15;
+    t13 = C47 * t6;
+    t11 = t2 - t13;
+    t14 = t16 + t12;
+    t9 = t10 + t19;
+    t18 = t3 + t17;
+    t5 = t1 - t7;
+    t15 = t4 + t11;
+    t6 = t8 - t0;
+    t2 = t4 - t11;
+    t13 = t8 + t0;
+    t16 = t3 - t17;
+    t12 = t1 + t7;
+    re[70] = t14;
+    im[70] = t9;
+    re[94] = t18;
+    im[94] = t5;
+    re[118] = t15;
+    im[118] = t6;
+    re[22] = t2;
+    im[22] = t13;
+    re[46] = t16;
+    im[46] = t12;
+    t10 = re[85];
+    t19 = im[85];
+    t4 = re[109];
+    t11 = im[109];
+    t8 = re[13];
+    t0 = im[13];
+    t3 = re[37];
+    t17 = im[37];
+    t1 = re[61];
+    t7 = im[61];
+    t14 = t4 + t1;
+    t9 = t11 + t7;
+    t18 = t8 + t3;
+    t5 = t0 + t17;
+    t15 = t4 - t1;
+    t6 = t11 - t7;
+    t2 = t8 - t3;
+    t13 = t0 - t17;
+    t16 = t14 + t18;
+    t12 = t9 + t5;
+    t4 = t14 - t18;
+    t1 = C45 * t4;
+    t11 = t9 - t5;
+    t7 = C45 * t11;
+    t8 = C46 * t16;
+    t3 = t10 - t8;
+    t0 = C46 * t12;
+    t17 = t19 - t0;
+    t14 = t3 + t1;
+    t18 = t17 + t7;
+    t4 = t3 - t1;
+    t9 = t17 - t7;
+    t5 = C47 * t15;
+    t11 = C48 * t2;
+    t8 = t5 + t11;
+    t0 = C47 * t6;
+    t3 = C48 * t13;
+    t1 = t0 + t3;
+    t17 = C48 * t15;
+    t7 = C47 * t2;
+    t5 = t17 - t7;
+    t11 = C48 * t6;
+    t0 = C47 * t13;
+    t3 = t11 - t0;
+    t15 = t10 + t16;
+    t2 = t19 + t12;
+    t17 = t14 + t1;
+    t7 = t18 - t8;
+    t6 = t4 + t3;
+    t13 = t9 - t5;
+    t11 = t4 - t3;
+    t0 = t9 + t5;
+    t10 = t14 - t1;
+    t16 = t18 + t8;
+    re[85] = t15;
+    im[85] = t2;
+    re[109] = t17;
+    im[109] = t7;
+    re[13] = t6;
+    im[13] = t13;
+    re[37] = t11;
+    im[37] = t0;
+    re[61] = t10;
+    im[61] = t16;
+    t19 = re[100];
+    t12 = im[100];
+    t4 = re[4];
+    t3 = im[4];
+    t9 = re[28];
+    t5 = im[28];
+    t14 = re[52];
+    t1 = im[52];
+    t18 = re[76];
+    t8 = im[76];
+    t15 = t4 + t18;
+    t2 = t3 + t8;
+    t17 = t9 + t14;
+    t7 = t5 + t1;
+    t6 = t4 - t18;
+    t13 = t3 - t8;
+    t11 = t9 - t14;
+    t0 = t5 - t1;
+    t10 = t15 + t17;
+    t16 = t2 + t7;
+    t4 = t15 - t17;
+    t18 = C45 * t4;
+    t3 = t2 - t7;
+    t8 = C45 * t3;
+    t9 = C46 * t10;
+    t14 = t19 - t9;
+    t5 = C46 * t16;
+    t1 = t12 - t5;
+    t15 = t14 + t18;
+    t17 = t1 + t8;
+    t4 = t14 - t18;
+    t2 = t1 - t8;
+    t7 = C47 * t6;
+    t3 = C48 * t11;
+    t9 = t7 + t3;
+    t5 = C47 * t13;
+    t14 = C48 * t0;
+    t18 = t5 + t14;
+    t1 = C48 * t6;
+    t8 = C47 * t11;
+    t7 = t1 - t8;
+    t3 = C48 * t13;
+    t5 = C47 * t0;
+    t14 = t3 - t5;
+    t6 = t19 + t10;
+    t11 = t12 + t16;
+    t1 = t15 + t18;
+    t8 = t17 - t9;
+    t13 = t4 + t14;
+    t0 = t2 - t7;
+    t3 = t4 - t14;
+    t5 = t2 + t7;
+    t19 = t15 - t18;
+    t10 = t17 + t9;
+    re[100] = t6;
+    im[100] = t11;
+    re[4] = t1;
+    im[4] = t8;
+    re[28] = t13;
+    im[28] = t0;
+    re[52] = t3;
+    im[52] = t5;
+    re[76] = t19;
+    im[76] = t10;
+    t12 = re[115];
+    t16 = im[115];
+    t4 = re[19];
+    t14 = im[19];
+    t2 = re[43];
+    t7 = im[43];
+    t15 = re[67];
+    t18 = im[67];
+    t17 = re[91];
+    t9 = im[91];
+    t6 = t4 + t17;
+    t11 = t14 + t9;
+    t1 = t2 + t15;
+    t8 = t7 + t18;
+    t13 = t4 - t17;
+    t0 = t14 - t9;
+    t3 = t2 - t15;
+    t5 = t7 - t18;
+    t19 = t6 + t1;
+    t10 = t11 + t8;
+    t4 = t6 - t1;
+    t17 = C45 * t4;
+    t14 = t11 - t8;
+    t9 = C45 * t14;
+    t2 = C46 * t19;
+    t15 = t12 - t2;
+    t7 = C46 * t10;
+    t18 = t16 - t7;
+    t6 = t15 + t17;
+    t1 = t18 + t9;
+    t4 = t15 - t17;
+    t11 = t18 - t9;
+    t8 = C47 * t13;
+    t14 = C48 * t3;
+    t2 = t8 + t14;
+    t7 = C47 * t0;
+    t15 = C48 * t5;
+    t17 = t7 + t15;
+    t18 = C48 * t13;
+    t9 = C47 * t3;
+    t8 = t18 - t9;
+    t14 = C48 * t0;
+    t7 = C47 * t5;
+    t15 = t14 - t7;
+    t13 = t12 + t19;
+    t3 = t16 + t10;
+    t18 = t6 + t17;
+    t9 = t1 - t2;
+    t0 = t4 + t15;
+    t5 = t11 - t8;
+    t14 = t4 - t15;
+    t7 = t11 + t8;
+    t12 = t6 - t17;
+    t19 = t1 + t2;
+    re[115] = t13;
+    im[115] = t3;
+    re[19] = t18;
+    im[19] = t9;
+    re[43] = t0;
+    im[43] = t5;
+    re[67] = t14;
+    im[67] = t7;
+    re[91] = t12;
+    im[91] = t19;
+    t16 = re[10];
+    t10 = im[10];
+    t4 = re[34];
+    t15 = im[34];
+    t11 = re[58];
+    t8 = im[58];
+    t6 = re[82];
+    t17 = im[82];
+    t1 = re[106];
+    t2 = im[106];
+    t13 = t4 + t1;
+    t3 = t15 + t2;
+    t18 = t11 + t6;
+    t9 = t8 + t17;
+    t0 = t4 - t1;
+    t5 = t15 - t2;
+    t14 = t11 - t6;
+    t7 = t8 - t17;
+    t12 = t13 + t18;
+    t19 = t3 + t9;
+    t4 = t13 - t18;
+    t1 = C45 * t4;
+    t15 = t3 - t9;
+    t2 = C45 * t15;
+    t11 = C46 * t12;
+    t6 = t16 - t11;
+    t8 = C46 * t19;
+    t17 = t10 - t8;
+    t13 = t6 + t1;
+    t18 = t17 + t2;
+    t4 = t6 - t1;
+    t3 = t17 - t2;
+    t9 = C47 * t0;
+    t15 = C48 * t14;
+    t11 = t9 + t15;
+    t8 = C47 * t5;
+    t6 = C48 * t7;
+    t1 = t8 + t6;
+    t17 = C48 * t0;
+    t2 = C47 * t14;
+    t9 = t17 - t2;
+    t15 = C48 * t5;
+    t8 = C47 * t7;
+    t6 = t15 - t8;
+    t0 = t16 + t12;
+    t14 = t10 + t19;
+    t17 = t13 + t1;
+    t2 = t18 - t11;
+    t5 = t4 + t6;
+    t7 = t3 - t9;
+    t15 = t4 - t6;
+    t8 = t3 + t9;
+    t16 = t13 - t1;
+    t12 = t18 + t11;
+    re[10] = t0;
+    im[10] = t14;
+    re[34] = t17;
+    im[34] = t2;
+    re[58] = t5;
+    im[58] = t7;
+    re[82] = t15;
+    im[82] = t8;
+    re[106] = t16;
+    im[106] = t12;
+    t10 = re[25];
+    t19 = im[25];
+    t4 = re[49];
+    t6 = im[49];
+    t3 = re[73];
+    t9 = im[73];
+    t13 = re[97];
+    t1 = im[97];
+    t18 = re[1];
+    t11 = im[1];
+    t0 = t4 + t18;
+    t14 = t6 + t11;
+    t17 = t3 + t13;
+    t2 = t9 + t1;
+    t5 = t4 - t18;
+    t7 = t6 - t11;
+    t15 = t3 - t13;
+    t8 = t9 - t1;
+    t16 = t0 + t17;
+    t12 = t14 + t2;
+    t4 = t0 - t17;
+    t18 = C45 * t4;
+    t6 = t14 - t2;
+    t11 = C45 * t6;
+    t3 = C46 * t16;
+    t13 = t10 - t3;
+    t9 = C46 * t12;
+    t1 = t19 - t9;
+    t0 = t13 + t18;
+    t17 = t1 + t11;
+    t4 = t13 - t18;
+    t14 = t1 - t11;
+    t2 = C47 * t5;
+    t6 = C48 * t15;
+    t3 = t2 + t6;
+    t9 = C47 * t7;
+    t13 = C48 * t8;
+    t18 = t9 + t13;
+    t1 = C48 * t5;
+    t11 = C47 * t15;
+    t2 = t1 - t11;
+    t6 = C48 * t7;
+    t9 = C47 * t8;
+    t13 = t6 - t9;
+    t5 = t10 + t16;
+    t15 = t19 + t12;
+    t1 = t0 + t18;
+    t11 = t17 - t3;
+    t7 = t4 + t13;
+    t8 = t14 - t2;
+    t6 = t4 - t13;
+    t9 = t14 + t2;
+    t10 = t0 - t18;
+    t16 = t17 + t3;
+    re[25] = t5;
+    im[25] = t15;
+    re[49] = t1;
+    im[49] = t11;
+    re[73] = t7;
+    im[73] = t8;
+    re[97] = t6;
+    im[97] = t9;
+    re[1] = t10;
+    im[1] = t16;
+}
+
+/**
+ *  Part 3 of ApplyWindowedMDCT_W75_240().
+ * 
+ *  @param {Number[]} x 
+ *    - The input block (480 points).
+ *  @param {Number[]} X 
+ *    - The array that would contain the output block (240 points).
+ *  @param {Number[]} re 
+ *    - The scratch buffer (real part, 120 points).
+ *  @param {Number[]} im 
+ *    - The scratch buffer (imaginary part, 120 points).
+ */
+function ApplyWindowedMDCT_W75_240_Part3(x, X, re, im) {
+    let t0, t1, t10, t11, t12, t13, t14, t15, t16, t17, t18, t19, t2, t3, t4, t5, t6, t7, t8, t9;
+    const C0 = 0.3214394653031616;
+    const C1 = 0.9469301294951057;
+    const C2 = 0.13052619222005157;
+    const C3 = 0.9914448613738104;
+    const C4 = 0.9978589232386035;
+    const C5 = 0.06540312923014306;
+    const C6 = 0.9659258262890683;
+    const C7 = 0.25881904510252074;
+    const C8 = 0.7071067811865476;
+    const C9 = 0.20791169081775931;
+    const C10 = 0.9781476007338057;
+    const C11 = 0.01308959557134444;
+    const C12 = 0.999914327574007;
+    const C13 = 0.9832549075639546;
+    const C14 = 0.18223552549214747;
+    const C15 = 0.9288095528719242;
+    const C16 = 0.3705574375098362;
+    const C17 = 0.39474385638426723;
+    const C18 = 0.9187912101488983;
+    const C19 = 0.9945218953682733;
+    const C20 = 0.10452846326765346;
+    const C21 = 0.9550199444571866;
+    const C22 = 0.296541574975571;
+    const C23 = 0.2840153447039226;
+    const C24 = 0.958819734868193;
+    const C25 = 0.09150161866340238;
+    const C26 = 0.9958049275746618;
+    const C27 = 0.35836794954530027;
+    const C28 = 0.9335804264972017;
+    const C29 = 0.1693495038490246;
+    const C30 = 0.9855560590580777;
+    const C31 = 0.9996573249755573;
+    const C32 = 0.02617694830787315;
+    const C33 = 0.9753423205085127;
+    const C34 = 0.22069743502150108;
+    const C35 = 0.24615329302899303;
+    const C36 = 0.9692309097067544;
+    const C37 = 0.05233595624294383;
+    const C38 = 0.9986295347545738;
+    const C39 = 0.9896513868196702;
+    const C40 = 0.1434926219911793;
+    const C41 = 0.9426414910921784;
+    const C42 = 0.33380685923377096;
+    const C43 = 0.5590169943749475;
+    const C44 = 0.25;
+    const C45 = 0.9510565162951535;
+    const C46 = 0.5877852522924731;
+    const C47 = 0.5;
+    const C48 = 0.8660254037844386;
+    const C49 = 0.9999946454016965;
+    const C50 = 0.003272486506526625;
+    const C51 = 0.8643845233130174;
+    const C52 = 0.5028313791490421;
+    const C53 = 0.4971632662526543;
+    const C54 = 0.8676570098195441;
+    const C55 = 0.48576339371634003;
+    const C56 = 0.8740903416267589;
+    const C57 = 0.9998661379095618;
+    const C58 = 0.01636173162648678;
+    const C59 = 0.8577286100002721;
+    const C60 = 0.5141027441932217;
+    const C61 = 0.8509257293058021;
+    const C62 = 0.525286020378792;
+    const C63 = 0.4742802881232292;
+    const C64 = 0.8803739025537654;
+    const C65 = 0.9995663085020212;
+    const C66 = 0.02944817324796316;
+    const C67 = 0.9990952085533004;
+    const C68 = 0.04252956907655312;
+    const C69 = 0.8439770468681933;
+    const C70 = 0.5363792915089503;
+    const C71 = 0.4627159170443501;
+    const C72 = 0.8865066159447464;
+    const C73 = 0.4510722619751534;
+    const C74 = 0.8924874309908339;
+    const C75 = 0.99845291878395;
+    const C76 = 0.055603677682424614;
+    const C77 = 0.8368837533084093;
+    const C78 = 0.5473806568087966;
+    const C79 = 0.8296470640257853;
+    const C80 = 0.558288231251022;
+    const C81 = 0.4393513179959937;
+    const C82 = 0.898315322910159;
+    const C83 = 0.9976395492470157;
+    const C84 = 0.06866825888437376;
+    const C85 = 0.9966552393091803;
+    const C86 = 0.08172107413366822;
+    const C87 = 0.8222682189897751;
+    const C88 = 0.5691001458788982;
+    const C89 = 0.4275550934302821;
+    const C90 = 0.9039892931234433;
+    const C91 = 0.4156856095003708;
+    const C92 = 0.9095083694251006;
+    const C93 = 0.9955001576268845;
+    const C94 = 0.09475988689761111;
+    const C95 = 0.8147484825274894;
+    const C96 = 0.5798145481265136;
+    const C97 = 0.8070891431070594;
+    const C98 = 0.5904296021362011;
+    const C99 = 0.4037448999812271;
+    const C100 = 0.9148716061498187;
+    const C101 = 0.9941745021174282;
+    const C102 = 0.10778246304275935;
+    const C103 = 0.9926784999250583;
+    const C104 = 0.12078657121773083;
+    const C105 = 0.7992915131168641;
+    const C106 = 0.6009434890731024;
+    const C107 = 0.3917350108519559;
+    const C108 = 0.9200780843345949;
+    const C109 = 0.37965799994523275;
+    const C110 = 0.9251269118761953;
+    const C111 = 0.9910124073820492;
+    const C112 = 0.13376998323553513;
+    const C113 = 0.7913569286406602;
+    const C114 = 0.6113544074368165;
+    const C115 = 0.7832867492286504;
+    const C116 = 0.6216605733700774;
+    const C117 = 0.36751593659470355;
+    const C118 = 0.9300172236840121;
+    const C119 = 0.989176509964781;
+    const C120 = 0.14673047445536175;
+    t19 = x[40];
+    t12 = 0.015015322977163095 * t19;
+    t4 = x[199];
+    t13 = 0.0909163651843452 * t4;
+    t14 = t12 - t13;
+    t2 = x[280];
+    t0 = 0.49999999999999994 * t14;
+    t18 = (-0.07937931031709339) * t2;
+    t17 = t0 + t18;
+    t3 = (-0.8660254037844387) * t14;
+    t5 = (-0.045829666179660694) * t2;
+    t15 = t3 + t5;
+    t1 = x[70];
+    t11 = 0.04315926346326986 * t1;
+    t7 = x[169];
+    t8 = 0.09537830588915777 * t7;
+    t6 = t11 - t8;
+    t9 = x[310];
+    t10 = 0.0856603118363894 * t9;
+    t16 = x[409];
+    t19 = 0.003781295030218233 * t16;
+    t4 = t10 + t19;
+    t12 = C0 * t6;
+    t13 = (-C1) * t4;
+    t0 = t12 + t13;
+    t18 = (-C1) * t6;
+    t14 = (-C0) * t4;
+    t2 = t18 + t14;
+    t3 = x[100];
+    t5 = 0.0741767176070929 * t3;
+    t1 = x[139];
+    t7 = 0.09602982670046604 * t1;
+    t11 = t5 - t7;
+    t8 = x[340];
+    t9 = 0.06664961433059914 * t8;
+    t16 = x[379];
+    t10 = 0.026059152816006632 * t16;
+    t19 = t9 + t10;
+    t12 = C2 * t11;
+    t13 = (-C3) * t19;
+    t6 = t12 + t13;
+    t4 = (-C3) * t11;
+    t18 = (-C2) * t19;
+    t14 = t4 + t18;
+    t3 = x[349];
+    t1 = 0.05805490461443574 * t3;
+    t5 = x[370];
+    t7 = 0.035525090341131965 * t5;
+    t8 = t1 + t7;
+    t16 = x[109];
+    t9 = 0.08168637648109286 * t16;
+    t10 = x[130];
+    t12 = 0.09355656451896484 * t10;
+    t13 = t9 - t12;
+    t11 = (-C4) * t8;
+    t19 = C5 * t13;
+    t4 = t11 + t19;
+    t18 = C5 * t8;
+    t3 = C4 * t13;
+    t5 = t18 + t3;
+    t1 = x[319];
+    t7 = 0.0816288725802624 * t1;
+    t16 = x[400];
+    t10 = 0.008463448060253795 * t16;
+    t9 = t7 + t10;
+    t12 = x[79];
+    t11 = 0.0529011247003047 * t12;
+    t19 = x[160];
+    t8 = 0.0966031645769662 * t19;
+    t13 = t11 - t8;
+    t18 = (-C6) * t9;
+    t3 = C7 * t13;
+    t1 = t18 + t3;
+    t16 = C7 * t9;
+    t7 = C6 * t13;
+    t10 = t16 + t7;
+    t12 = x[289];
+    t19 = x[49];
+    t11 = 0.022269332380766 * t19;
+    t8 = x[190];
+    t18 = 0.09188206022001336 * t8;
+    t3 = t11 - t18;
+    t9 = (-0.08134275064006957) * t12;
+    t13 = 0.4422886902190013 * t3;
+    t16 = t9 + t13;
+    t7 = 0.04011380541895525 * t12;
+    t19 = 0.8968727415326883 * t3;
+    t8 = t7 + t19;
+    t11 = x[259];
+    t18 = x[19];
+    t9 = 0.0037258660788030895 * t18;
+    t13 = x[220];
+    t12 = 0.09042611495709132 * t13;
+    t3 = t9 - t12;
+    t7 = (-0.07311248347778135) * t11;
+    t19 = 0.6087614290087207 * t3;
+    t18 = t7 + t19;
+    t13 = 0.056101181730667464 * t11;
+    t9 = 0.7933533402912352 * t3;
+    t12 = t13 + t9;
+    t7 = x[10];
+    t19 = 0.0013492771887970369 * t7;
+    t11 = x[229];
+    t3 = 0.09074132482270718 * t11;
+    t13 = t19 - t3;
+    t9 = x[250];
+    t7 = 0.6593458151000688 * t13;
+    t11 = (-0.06904606849451285) * t9;
+    t19 = t7 + t11;
+    t3 = (-0.7518398074789774) * t13;
+    t7 = (-0.0605517769318735) * t9;
+    t11 = t3 + t7;
+    t13 = t17 + t1;
+    t9 = t15 + t10;
+    t3 = t6 + t18;
+    t7 = t14 + t12;
+    t17 = t17 - t1;
+    t1 = t15 - t10;
+    t15 = t6 - t18;
+    t10 = t14 - t12;
+    t6 = t13 + t3;
+    t18 = t9 + t7;
+    t14 = t17 + t10;
+    t12 = t1 - t15;
+    t13 = t13 - t3;
+    t3 = t9 - t7;
+    t9 = t17 - t10;
+    t7 = t1 + t15;
+    t17 = t0 + t16;
+    t10 = t2 + t8;
+    t1 = t4 + t19;
+    t15 = t5 + t11;
+    t0 = t0 - t16;
+    t16 = t2 - t8;
+    t2 = t4 - t19;
+    t8 = t5 - t11;
+    t4 = t17 + t1;
+    t19 = t10 + t15;
+    t5 = t0 + t8;
+    t11 = t16 - t2;
+    t17 = t17 - t1;
+    t1 = t10 - t15;
+    t10 = t0 - t8;
+    t15 = t16 + t2;
+    t0 = t5 + t11;
+    t8 = t5 - t11;
+    t16 = C8 * t0;
+    t2 = (-C8) * t8;
+    t5 = t10 - t15;
+    t11 = t10 + t15;
+    t0 = (-C8) * t5;
+    t8 = (-C8) * t11;
+    t10 = t6 - t4;
+    t15 = t18 - t19;
+    t5 = t6 + t4;
+    t11 = t18 + t19;
+    t6 = t14 - t16;
+    t4 = t12 - t2;
+    t18 = t14 + t16;
+    t19 = t12 + t2;
+    t14 = t13 - t1;
+    t16 = t3 + t17;
+    t12 = t13 + t1;
+    t2 = t3 - t17;
+    t13 = t9 - t0;
+    t1 = t7 - t8;
+    t3 = t9 + t0;
+    t17 = t7 + t8;
+    re[80] = t5;
+    im[80] = t11;
+    re[95] = t18;
+    im[95] = t19;
+    re[110] = t12;
+    im[110] = t2;
+    re[5] = t3;
+    im[5] = t17;
+    re[20] = t10;
+    im[20] = t15;
+    re[35] = t6;
+    im[35] = t4;
+    re[50] = t14;
+    im[50] = t16;
+    re[65] = t13;
+    im[65] = t1;
+    t9 = x[88];
+    t0 = 0.06246718712392951 * t9;
+    t7 = x[151];
+    t8 = 0.09710785222241458 * t7;
+    t5 = t0 - t8;
+    t11 = x[328];
+    t18 = 0.07617123337222059 * t11;
+    t19 = x[391];
+    t12 = 0.014992006244281922 * t19;
+    t2 = t18 + t12;
+    t3 = C9 * t5;
+    t17 = (-C10) * t2;
+    t10 = t3 + t17;
+    t15 = (-C10) * t5;
+    t6 = (-C9) * t2;
+    t4 = t15 + t6;
+    t14 = x[118];
+    t16 = 0.0878083255799443 * t14;
+    t13 = x[121];
+    t1 = 0.08950958151221271 * t13;
+    t9 = t16 - t1;
+    t7 = x[358];
+    t0 = 0.048609442933946125 * t7;
+    t8 = x[361];
+    t11 = 0.045352447076883386 * t8;
+    t19 = t0 + t11;
+    t18 = C11 * t9;
+    t12 = (-C12) * t19;
+    t3 = t18 + t12;
+    t17 = (-C12) * t9;
+    t5 = (-C11) * t19;
+    t2 = t17 + t5;
+    t15 = x[331];
+    t6 = 0.07402515017647827 * t15;
+    t14 = x[388];
+    t13 = 0.01753462890895542 * t14;
+    t16 = t6 + t13;
+    t1 = x[91];
+    t7 = 0.0655371423617569 * t1;
+    t8 = x[148];
+    t0 = 0.09705031121367907 * t8;
+    t11 = t7 - t0;
+    t18 = (-C13) * t16;
+    t12 = C14 * t11;
+    t9 = t18 + t12;
+    t19 = C14 * t16;
+    t17 = C13 * t11;
+    t5 = t19 + t17;
+    t15 = x[301];
+    t14 = 0.08844167130113312 * t15;
+    t6 = x[418];
+    t13 = 0.0010571625305928285 * t6;
+    t1 = t14 + t13;
+    t8 = x[61];
+    t7 = 0.03370544615326114 * t8;
+    t0 = x[178];
+    t18 = 0.09382117136084558 * t0;
+    t12 = t7 - t18;
+    t16 = (-C15) * t1;
+    t11 = C16 * t12;
+    t19 = t16 + t11;
+    t17 = C16 * t1;
+    t15 = C15 * t12;
+    t6 = t17 + t15;
+    t14 = x[271];
+    t13 = x[31];
+    t8 = 0.009170726184912756 * t13;
+    t0 = x[208];
+    t7 = 0.09044079022064527 * t0;
+    t18 = t8 - t7;
+    t16 = (-0.07727620891518718) * t14;
+    t11 = 0.544639035015027 * t18;
+    t1 = t16 + t11;
+    t12 = 0.050183756843039704 * t14;
+    t17 = 0.838670567945424 * t18;
+    t15 = t12 + t17;
+    t13 = x[241];
+    t0 = x[1];
+    t8 = 0.00023413481508896496 * t0;
+    t7 = x[238];
+    t16 = 0.09120428548155567 * t7;
+    t11 = t8 - t16;
+    t14 = (-0.0654484910479264) * t13;
+    t18 = 0.6977904598416801 * t11;
+    t12 = t14 + t18;
+    t17 = 0.0637570972457936 * t13;
+    t0 = 0.7163019434246544 * t11;
+    t7 = t17 + t0;
+    t8 = x[28];
+    t16 = 0.007556979010194901 * t8;
+    t14 = x[211];
+    t18 = 0.09037805267472243 * t14;
+    t13 = t16 - t18;
+    t11 = x[268];
+    t17 = 0.5664062369248328 * t13;
+    t0 = (-0.07598878306478063) * t11;
+    t8 = t17 + t0;
+    t14 = (-0.8241261886220156) * t13;
+    t16 = (-0.05222564366773247) * t11;
+    t18 = t14 + t16;
+    t17 = x[58];
+    t0 = 0.030693222787216617 * t17;
+    t13 = x[181];
+    t11 = 0.09329614388539122 * t13;
+    t14 = t0 - t11;
+    t16 = x[298];
+    t17 = 0.08913894680518375 * t16;
+    t13 = x[421];
+    t0 = 0.0005543023788221308 * t13;
+    t11 = t17 + t0;
+    t16 = C17 * t14;
+    t13 = (-C18) * t11;
+    t17 = t16 + t13;
+    t0 = (-C18) * t14;
+    t16 = (-C17) * t11;
+    t13 = t0 + t16;
+    t14 = t10 + t1;
+    t11 = t4 + t15;
+    t0 = t9 + t8;
+    t16 = t5 + t18;
+    t10 = t10 - t1;
+    t1 = t4 - t15;
+    t4 = t9 - t8;
+    t15 = t5 - t18;
+    t9 = t14 + t0;
+    t8 = t11 + t16;
+    t5 = t10 + t15;
+    t18 = t1 - t4;
+    t14 = t14 - t0;
+    t0 = t11 - t16;
+    t11 = t10 - t15;
+    t16 = t1 + t4;
+    t10 = t3 + t12;
+    t15 = t2 + t7;
+    t1 = t19 + t17;
+    t4 = t6 + t13;
+    t3 = t3 - t12;
+    t12 = t2 - t7;
+    t2 = t19 - t17;
+    t7 = t6 - t13;
+    t19 = t10 + t1;
+    t17 = t15 + t4;
+    t6 = t3 + t7;
+    t13 = t12 - t2;
+    t10 = t10 - t1;
+    t1 = t15 - t4;
+    t15 = t3 - t7;
+    t4 = t12 + t2;
+    t3 = t6 + t13;
+    t7 = t6 - t13;
+    t12 = C8 * t3;
+    t2 = (-C8) * t7;
+    t6 = t15 - t4;
+    t13 = t15 + t4;
+    t3 = (-C8) * t6;
+    t7 = (-C8) * t13;
+    t15 = t9 - t19;
+    t4 = t8 - t17;
+    t6 = t9 + t19;
+    t13 = t8 + t17;
+    t9 = t5 - t12;
+    t19 = t18 - t2;
+    t8 = t5 + t12;
+    t17 = t18 + t2;
+    t5 = t14 - t1;
+    t12 = t0 + t10;
+    t18 = t14 + t1;
+    t2 = t0 - t10;
+    t14 = t11 - t3;
+    t1 = t16 - t7;
+    t0 = t11 + t3;
+    t10 = t16 + t7;
+    re[104] = t6;
+    im[104] = t13;
+    re[119] = t8;
+    im[119] = t17;
+    re[14] = t18;
+    im[14] = t2;
+    re[29] = t0;
+    im[29] = t10;
+    re[44] = t15;
+    im[44] = t4;
+    re[59] = t9;
+    im[59] = t19;
+    re[74] = t5;
+    im[74] = t12;
+    re[89] = t14;
+    im[89] = t1;
+    t11 = x[343];
+    t3 = 0.06390501141990558 * t11;
+    t16 = x[376];
+    t7 = 0.029137704355627222 * t16;
+    t6 = t3 + t7;
+    t13 = x[103];
+    t8 = 0.07682020725123924 * t13;
+    t17 = x[136];
+    t18 = 0.0953754441237799 * t17;
+    t2 = t8 - t18;
+    t0 = (-C19) * t6;
+    t10 = C20 * t2;
+    t15 = t0 + t10;
+    t4 = C20 * t6;
+    t9 = C19 * t2;
+    t19 = t4 + t9;
+    t5 = x[313];
+    t12 = 0.08446724594649771 * t5;
+    t14 = x[406];
+    t1 = 0.005125386885201697 * t14;
+    t11 = t12 + t1;
+    t16 = x[73];
+    t3 = 0.046396889318521525 * t16;
+    t7 = x[166];
+    t13 = 0.0958422550018241 * t7;
+    t17 = t3 - t13;
+    t8 = (-C21) * t11;
+    t18 = C22 * t17;
+    t0 = t8 + t18;
+    t10 = C22 * t11;
+    t6 = C21 * t17;
+    t2 = t10 + t6;
+    t4 = x[283];
+    t9 = x[43];
+    t5 = 0.017285605367722928 * t9;
+    t14 = x[196];
+    t12 = 0.09118069998138907 * t14;
+    t1 = t5 - t12;
+    t16 = (-0.08031826845313218) * t4;
+    t7 = 0.4771587602596084 * t1;
+    t3 = t16 + t7;
+    t13 = 0.043609261641718175 * t4;
+    t8 = 0.8788171126619654 * t1;
+    t18 = t13 + t8;
+    t11 = x[253];
+    t17 = x[13];
+    t10 = 0.001987292053496043 * t17;
+    t6 = x[226];
+    t9 = 0.09061382845181774 * t6;
+    t14 = t10 - t9;
+    t5 = (-0.07070681568967856) * t11;
+    t12 = 0.6394390019805847 * t14;
+    t16 = t5 + t12;
+    t7 = 0.05880623786546688 * t11;
+    t4 = 0.7688418320734596 * t14;
+    t1 = t7 + t4;
+    t13 = x[16];
+    t8 = 0.002778041784911948 * t13;
+    t17 = x[223];
+    t6 = 0.09050727892240762 * t17;
+    t10 = t8 - t6;
+    t9 = x[256];
+    t5 = 0.6293203910498375 * t10;
+    t12 = (-0.07155464646138408) * t9;
+    t11 = t5 + t12;
+    t14 = (-0.7771459614569709) * t10;
+    t7 = (-0.05794381020534245) * t9;
+    t4 = t14 + t7;
+    t13 = x[46];
+    t17 = 0.019706630281976074 * t13;
+    t8 = x[193];
+    t6 = 0.09150191637698869 * t8;
+    t5 = t17 - t6;
+    t12 = x[286];
+    t10 = 0.4656145203251114 * t5;
+    t9 = (-0.08059827893083725) * t12;
+    t14 = t10 + t9;
+    t7 = (-0.8849876374630419) * t5;
+    t13 = (-0.042404805891967635) * t12;
+    t8 = t7 + t13;
+    t17 = x[76];
+    t6 = 0.049649962585211385 * t17;
+    t10 = x[163];
+    t9 = 0.09625582992869657 * t10;
+    t5 = t6 - t9;
+    t12 = x[316];
+    t7 = 0.08312516910399824 * t12;
+    t13 = x[403];
+    t17 = 0.006687843776213512 * t13;
+    t10 = t7 + t17;
+    t6 = C23 * t5;
+    t9 = (-C24) * t10;
+    t12 = t6 + t9;
+    t13 = (-C24) * t5;
+    t7 = (-C23) * t10;
+    t17 = t13 + t7;
+    t6 = x[106];
+    t9 = 0.07932664712434352 * t6;
+    t5 = x[133];
+    t10 = 0.09455277460094863 * t5;
+    t13 = t9 - t10;
+    t7 = x[346];
+    t6 = 0.06103529695492163 * t7;
+    t5 = x[373];
+    t9 = 0.03230032719820284 * t5;
+    t10 = t6 + t9;
+    t7 = C25 * t13;
+    t5 = (-C26) * t10;
+    t6 = t7 + t5;
+    t9 = (-C26) * t13;
+    t7 = (-C25) * t10;
+    t5 = t9 + t7;
+    t13 = t15 + t11;
+    t10 = t19 + t4;
+    t9 = t3 + t12;
+    t7 = t18 + t17;
+    t15 = t15 - t11;
+    t11 = t19 - t4;
+    t19 = t3 - t12;
+    t4 = t18 - t17;
+    t3 = t13 + t9;
+    t12 = t10 + t7;
+    t18 = t15 + t4;
+    t17 = t11 - t19;
+    t13 = t13 - t9;
+    t9 = t10 - t7;
+    t10 = t15 - t4;
+    t7 = t11 + t19;
+    t15 = t0 + t14;
+    t4 = t2 + t8;
+    t11 = t16 + t6;
+    t19 = t1 + t5;
+    t0 = t0 - t14;
+    t14 = t2 - t8;
+    t2 = t16 - t6;
+    t8 = t1 - t5;
+    t16 = t15 + t11;
+    t6 = t4 + t19;
+    t1 = t0 + t8;
+    t5 = t14 - t2;
+    t15 = t15 - t11;
+    t11 = t4 - t19;
+    t4 = t0 - t8;
+    t19 = t14 + t2;
+    t0 = t1 + t5;
+    t8 = t1 - t5;
+    t14 = C8 * t0;
+    t2 = (-C8) * t8;
+    t1 = t4 - t19;
+    t5 = t4 + t19;
+    t0 = (-C8) * t1;
+    t8 = (-C8) * t5;
+    t4 = t3 - t16;
+    t19 = t12 - t6;
+    t1 = t3 + t16;
+    t5 = t12 + t6;
+    t3 = t18 - t14;
+    t16 = t17 - t2;
+    t12 = t18 + t14;
+    t6 = t17 + t2;
+    t18 = t13 - t11;
+    t14 = t9 + t15;
+    t17 = t13 + t11;
+    t2 = t9 - t15;
+    t13 = t10 - t0;
+    t11 = t7 - t8;
+    t9 = t10 + t0;
+    t15 = t7 + t8;
+    re[8] = t1;
+    im[8] = t5;
+    re[23] = t12;
+    im[23] = t6;
+    re[38] = t17;
+    im[38] = t2;
+    re[53] = t9;
+    im[53] = t15;
+    re[68] = t4;
+    im[68] = t19;
+    re[83] = t3;
+    im[83] = t16;
+    re[98] = t18;
+    im[98] = t14;
+    re[113] = t13;
+    im[113] = t11;
+    t10 = x[295];
+    t0 = x[55];
+    t7 = 0.027774771122028637 * t0;
+    t8 = x[184];
+    t1 = 0.09282792874934585 * t8;
+    t5 = t7 - t1;
+    t12 = (-0.08201065041798626) * t10;
+    t6 = 0.40673664307580015 * t5;
+    t17 = t12 + t6;
+    t2 = 0.036513494066897974 * t10;
+    t9 = 0.9135454576426009 * t5;
+    t15 = t2 + t9;
+    t4 = x[265];
+    t19 = x[25];
+    t3 = 0.006112672898287684 * t19;
+    t16 = x[214];
+    t18 = 0.09035733828476188 * t16;
+    t14 = t3 - t18;
+    t13 = (-0.07531592256034467) * t4;
+    t11 = 0.5771451900372336 * t14;
+    t0 = t13 + t11;
+    t8 = 0.05322803152028413 * t4;
+    t7 = 0.8166415551616789 * t14;
+    t1 = t8 + t7;
+    t12 = x[4];
+    t6 = 0.0004873180185828961 * t12;
+    t10 = x[235];
+    t5 = 0.09104117390663842 * t10;
+    t2 = t6 - t5;
+    t9 = x[244];
+    t19 = 0.6883545756937539 * t2;
+    t16 = (-0.0663961828007759) * t9;
+    t3 = t19 + t16;
+    t18 = (-0.7253743710122876) * t2;
+    t13 = (-0.06300762484306026) * t9;
+    t11 = t18 + t13;
+    t4 = x[34];
+    t14 = 0.0109532114963038 * t4;
+    t8 = x[205];
+    t7 = 0.09054926431717872 * t8;
+    t12 = t14 - t7;
+    t10 = x[274];
+    t6 = 0.5336145159156115 * t12;
+    t5 = (-0.07783312101626912) * t10;
+    t19 = t6 + t5;
+    t16 = (-0.8457278217039733) * t12;
+    t2 = (-0.04910904209065413) * t10;
+    t9 = t16 + t2;
+    t18 = x[64];
+    t13 = 0.036797555316227276 * t18;
+    t4 = x[175];
+    t8 = 0.09435297960865555 * t4;
+    t14 = t13 - t8;
+    t7 = x[304];
+    t6 = 0.08763727041503364 * t7;
+    t5 = x[415];
+    t12 = 0.0017527181996514706 * t5;
+    t10 = t6 + t12;
+    t16 = C27 * t14;
+    t2 = (-C28) * t10;
+    t18 = t16 + t2;
+    t4 = (-C28) * t14;
+    t13 = (-C27) * t10;
+    t8 = t4 + t13;
+    t7 = x[94];
+    t5 = 0.0685218247894467 * t7;
+    t6 = x[145];
+    t12 = 0.09685895736188291 * t6;
+    t16 = t5 - t12;
+    t2 = x[334];
+    t14 = 0.07171894336163445 * t2;
+    t10 = x[385];
+    t4 = 0.02023751206992167 * t10;
+    t13 = t14 + t4;
+    t7 = C29 * t16;
+    t6 = (-C30) * t13;
+    t5 = t7 + t6;
+    t12 = (-C30) * t16;
+    t2 = (-C29) * t13;
+    t10 = t12 + t2;
+    t14 = x[355];
+    t4 = 0.05182469812709293 * t14;
+    t7 = x[364];
+    t6 = 0.042072022784559265 * t7;
+    t16 = t4 + t6;
+    t13 = x[115];
+    t12 = 0.08593441436671341 * t13;
+    t2 = x[124];
+    t14 = 0.09103571973635532 * t2;
+    t7 = t12 - t14;
+    t4 = (-C31) * t16;
+    t6 = C32 * t7;
+    t13 = t4 + t6;
+    t2 = C32 * t16;
+    t12 = C31 * t7;
+    t14 = t2 + t12;
+    t4 = x[325];
+    t6 = 0.07815409333098762 * t4;
+    t16 = x[394];
+    t7 = 0.012624949394551927 * t16;
+    t2 = t6 + t7;
+    t12 = x[85];
+    t4 = 0.059326876889732816 * t12;
+    t16 = x[154];
+    t6 = 0.09704334336966204 * t16;
+    t7 = t4 - t6;
+    t12 = (-C33) * t2;
+    t16 = C34 * t7;
+    t4 = t12 + t16;
+    t6 = C34 * t2;
+    t12 = C33 * t7;
+    t16 = t6 + t12;
+    t2 = t17 + t18;
+    t7 = t15 + t8;
+    t6 = t3 + t13;
+    t12 = t11 + t14;
+    t17 = t17 - t18;
+    t18 = t15 - t8;
+    t15 = t3 - t13;
+    t8 = t11 - t14;
+    t3 = t2 + t6;
+    t13 = t7 + t12;
+    t11 = t17 + t8;
+    t14 = t18 - t15;
+    t2 = t2 - t6;
+    t6 = t7 - t12;
+    t7 = t17 - t8;
+    t12 = t18 + t15;
+    t17 = t0 + t5;
+    t8 = t1 + t10;
+    t18 = t19 + t4;
+    t15 = t9 + t16;
+    t0 = t0 - t5;
+    t5 = t1 - t10;
+    t1 = t19 - t4;
+    t10 = t9 - t16;
+    t19 = t17 + t18;
+    t4 = t8 + t15;
+    t9 = t0 + t10;
+    t16 = t5 - t1;
+    t17 = t17 - t18;
+    t18 = t8 - t15;
+    t8 = t0 - t10;
+    t15 = t5 + t1;
+    t0 = t9 + t16;
+    t10 = t9 - t16;
+    t5 = C8 * t0;
+    t1 = (-C8) * t10;
+    t9 = t8 - t15;
+    t16 = t8 + t15;
+    t0 = (-C8) * t9;
+    t10 = (-C8) * t16;
+    t8 = t3 - t19;
+    t15 = t13 - t4;
+    t9 = t3 + t19;
+    t16 = t13 + t4;
+    t3 = t11 - t5;
+    t19 = t14 - t1;
+    t13 = t11 + t5;
+    t4 = t14 + t1;
+    t11 = t2 - t18;
+    t5 = t6 + t17;
+    t14 = t2 + t18;
+    t1 = t6 - t17;
+    t2 = t7 - t0;
+    t18 = t12 - t10;
+    t6 = t7 + t0;
+    t17 = t12 + t10;
+    re[32] = t9;
+    im[32] = t16;
+    re[47] = t13;
+    im[47] = t4;
+    re[62] = t14;
+    im[62] = t1;
+    re[77] = t6;
+    im[77] = t17;
+    re[92] = t8;
+    im[92] = t15;
+    re[107] = t3;
+    im[107] = t19;
+    re[2] = t11;
+    im[2] = t5;
+    re[17] = t2;
+    im[17] = t18;
+    t7 = x[247];
+    t0 = x[7];
+    t12 = 0.0008531948944978419 * t0;
+    t10 = x[232];
+    t9 = 0.09088527913459936 * t10;
+    t16 = t12 - t9;
+    t13 = (-0.06813945673725028) * t7;
+    t4 = 0.6691306063588582 * t16;
+    t14 = t13 + t4;
+    t1 = 0.06135304242247785 * t7;
+    t6 = 0.7431448254773942 * t16;
+    t17 = t1 + t6;
+    t8 = x[22];
+    t15 = 0.004836578531268158 * t8;
+    t3 = x[217];
+    t19 = 0.09037471521804512 * t3;
+    t11 = t15 - t19;
+    t5 = x[262];
+    t2 = 0.598324600570659 * t11;
+    t18 = (-0.07388255763405847) * t5;
+    t0 = t2 + t18;
+    t10 = (-0.8012538126910607) * t11;
+    t12 = (-0.05517072254179854) * t5;
+    t9 = t10 + t12;
+    t13 = x[52];
+    t4 = 0.024962500697769584 * t13;
+    t7 = x[187];
+    t16 = 0.0923224759125681 * t7;
+    t1 = t4 - t16;
+    t6 = x[292];
+    t8 = 0.4305110968082951 * t1;
+    t3 = (-0.08147034578418308) * t6;
+    t15 = t8 + t3;
+    t19 = (-0.9025852843498606) * t1;
+    t2 = (-0.03885936157951403) * t6;
+    t18 = t19 + t2;
+    t11 = x[82];
+    t5 = 0.05613281425607352 * t11;
+    t10 = x[157];
+    t12 = 0.09687085215339357 * t10;
+    t13 = t5 - t12;
+    t7 = x[322];
+    t4 = 0.07997250269761456 * t7;
+    t16 = x[397];
+    t8 = 0.010445384859933385 * t16;
+    t3 = t4 + t8;
+    t1 = C35 * t13;
+    t6 = (-C36) * t3;
+    t19 = t1 + t6;
+    t2 = (-C36) * t13;
+    t11 = (-C35) * t3;
+    t10 = t2 + t11;
+    t5 = x[112];
+    t12 = 0.08389225281782092 * t5;
+    t7 = x[127];
+    t16 = 0.09238500948779206 * t7;
+    t4 = t12 - t16;
+    t8 = x[352];
+    t1 = 0.05497902929043668 * t8;
+    t6 = x[367];
+    t13 = 0.038788983266110494 * t6;
+    t3 = t1 + t13;
+    t2 = C37 * t4;
+    t11 = (-C38) * t3;
+    t5 = t2 + t11;
+    t7 = (-C38) * t4;
+    t12 = (-C37) * t3;
+    t16 = t7 + t12;
+    t8 = x[337];
+    t6 = 0.06925816458302594 * t8;
+    t1 = x[382];
+    t13 = 0.02308496315134304 * t1;
+    t2 = t6 + t13;
+    t11 = x[97];
+    t4 = 0.07140668037545762 * t11;
+    t3 = x[142];
+    t7 = 0.09652165615928737 * t3;
+    t12 = t4 - t7;
+    t8 = (-C39) * t2;
+    t1 = C40 * t12;
+    t6 = t8 + t1;
+    t13 = C40 * t2;
+    t11 = C39 * t12;
+    t3 = t13 + t11;
+    t4 = x[307];
+    t7 = 0.086713927451765 * t4;
+    t8 = x[412];
+    t1 = 0.0026578540809738863 * t8;
+    t2 = t7 + t1;
+    t12 = x[67];
+    t13 = 0.039954198753038773 * t12;
+    t11 = x[172];
+    t4 = 0.09487681096790258 * t11;
+    t8 = t13 - t4;
+    t7 = (-C41) * t2;
+    t1 = C42 * t8;
+    t12 = t7 + t1;
+    t11 = C42 * t2;
+    t13 = C41 * t8;
+    t4 = t11 + t13;
+    t7 = x[277];
+    t1 = x[37];
+    t2 = 0.012902477260925535 * t1;
+    t8 = x[202];
+    t11 = 0.09070677367426357 * t8;
+    t13 = t2 - t11;
+    t1 = (-0.07895463376929095) * t7;
+    t8 = 0.5112930860770522 * t13;
+    t2 = t1 + t8;
+    t11 = 0.04697307097052762 * t7;
+    t1 = 0.8594064115014527 * t13;
+    t8 = t11 + t1;
+    t7 = t14 + t5;
+    t13 = t17 + t16;
+    t11 = t15 + t12;
+    t1 = t18 + t4;
+    t14 = t14 - t5;
+    t5 = t17 - t16;
+    t17 = t15 - t12;
+    t16 = t18 - t4;
+    t15 = t7 + t11;
+    t12 = t13 + t1;
+    t18 = t14 + t16;
+    t4 = t5 - t17;
+    t7 = t7 - t11;
+    t11 = t13 - t1;
+    t13 = t14 - t16;
+    t1 = t5 + t17;
+    t14 = t0 + t6;
+    t16 = t9 + t3;
+    t5 = t19 + t2;
+    t17 = t10 + t8;
+    t0 = t0 - t6;
+    t6 = t9 - t3;
+    t9 = t19 - t2;
+    t3 = t10 - t8;
+    t19 = t14 + t5;
+    t2 = t16 + t17;
+    t10 = t0 + t3;
+    t8 = t6 - t9;
+    t14 = t14 - t5;
+    t5 = t16 - t17;
+    t16 = t0 - t3;
+    t17 = t6 + t9;
+    t0 = t10 + t8;
+    t3 = t10 - t8;
+    t6 = C8 * t0;
+    t9 = (-C8) * t3;
+    t10 = t16 - t17;
+    t8 = t16 + t17;
+    t0 = (-C8) * t10;
+    t3 = (-C8) * t8;
+    t16 = t15 - t19;
+    t17 = t12 - t2;
+    t10 = t15 + t19;
+    t8 = t12 + t2;
+    t15 = t18 - t6;
+    t19 = t4 - t9;
+    t12 = t18 + t6;
+    t2 = t4 + t9;
+    t18 = t7 - t5;
+    t6 = t11 + t14;
+    t4 = t7 + t5;
+    t9 = t11 - t14;
+    t7 = t13 - t0;
+    t5 = t1 - t3;
+    t11 = t13 + t0;
+    t14 = t1 + t3;
+    re[56] = t10;
+    im[56] = t8;
+    re[71] = t12;
+    im[71] = t2;
+    re[86] = t4;
+    im[86] = t9;
+    re[101] = t11;
+    im[101] = t14;
+    re[116] = t16;
+    im[116] = t17;
+    re[11] = t15;
+    im[11] = t19;
+    re[26] = t18;
+    im[26] = t6;
+    re[41] = t7;
+    im[41] = t5;
+    t13 = re[80];
+    t0 = im[80];
+    t1 = re[104];
+    t3 = im[104];
+    t10 = re[8];
+    t8 = im[8];
+    t12 = re[32];
+    t2 = im[32];
+    t4 = re[56];
+    t9 = im[56];
+    t11 = t1 + t4;
+    t14 = t3 + t9;
+    t16 = t10 + t12;
+    t17 = t8 + t2;
+    t15 = t1 - t4;
+    t19 = t3 - t9;
+    t18 = t10 - t12;
+    t6 = t8 - t2;
+    t7 = t11 + t16;
+    t5 = t14 + t17;
+    t1 = t11 - t16;
+    t4 = C43 * t1;
+    t3 = t14 - t17;
+    t9 = C43 * t3;
+    t10 = C44 * t7;
+    t12 = t13 - t10;
+    t8 = C44 * t5;
+    t2 = t0 - t8;
+    t11 = t12 + t4;
+    t16 = t2 + t9;
+    t1 = t12 - t4;
+    t14 = t2 - t9;
+    t17 = C45 * t15;
+    t3 = C46 * t18;
+    t10 = t17 + t3;
+    t8 = C45 * t19;
+    t12 = C46 * t6;
+    t4 = t8 + t12;
+    t2 = C46 * t15;
+    t9 = C45 * t18;
+    t17 = t2 - t9;
+    t3 = C46 * t19;
+    t8 = C45 * t6;
+    t12 = t3 - t8;
+    t15 = t13 + t7;
+    t18 = t0 + t5;
+    t2 = t11 + t4;
+    t9 = t16 - t10;
+    t19 = t1 + t12;
+    t6 = t14 - t17;
+    t3 = t1 - t12;
+    t8 = t14 + t17;
+    t13 = t11 - t4;
+    t7 = t16 + t10;
+    re[80] = t15;
+    im[80] = t18;
+    re[104] = t2;
+    im[104] = t9;
+    re[8] = t19;
+    im[8] = t6;
+    re[32] = t3;
+    im[32] = t8;
+    re[56] = t13;
+    im[56] = t7;
+    t0 = re[95];
+    t5 = im[95];
+    t1 = re[119];
+    t12 = im[119];
+    t14 = re[23];
+    t17 = im[23];
+    t11 = re[47];
+    t4 = im[47];
+    t16 = re[71];
+    t10 = im[71];
+    t15 = t1 + t16;
+    t18 = t12 + t10;
+    t2 = t14 + t11;
+    t9 = t17 + t4;
+    t19 = t1 - t16;
+    t6 = t12 - t10;
+    t3 = t14 - t11;
+    t8 = t17 - t4;
+    t13 = t15 + t2;
+    t7 = t18 + t9;
+    t1 = t15 - t2;
+    t16 = C43 * t1;
+    t12 = t18 - t9;
+    t10 = C43 * t12;
+    t14 = C44 * t13;
+    t11 = t0 - t14;
+    t17 = C44 * t7;
+    t4 = t5 - t17;
+    t15 = t11 + t16;
+    t2 = t4 + t10;
+    t1 = t11 - t16;
+    t18 = t4 - t10;
+    t9 = C45 * t19;
+    t12 = C46 * t3;
+    t14 = t9 + t12;
+    t17 = C45 * t6;
+    t11 = C46 * t8;
+    t16 = t17 + t11;
+    t4 = C46 * t19;
+    t10 = C45 * t3;
+    t9 = t4 - t10;
+    t12 = C46 * t6;
+    t17 = C45 * t8;
+    t11 = t12 - t17;
+    t19 = t0 + t13;
+    t3 = t5 + t7;
+    t4 = t15 + t16;
+    t10 = t2 - t14;
+    t6 = t1 + t11;
+    t8 = t18 - t9;
+    t12 = t1 - t11;
+    t17 = t18 + t9;
+    t0 = t15 - t16;
+    t13 = t2 + t14;
+    re[95] = t19;
+    im[95] = t3;
+    re[119] = t4;
+    im[119] = t10;
+    re[23] = t6;
+    im[23] = t8;
+    re[47] = t12;
+    im[47] = t17;
+    re[71] = t0;
+    im[71] = t13;
+    t5 = re[110];
+    t7 = im[110];
+    t1 = re[14];
+    t11 = im[14];
+    t18 = re[38];
+    t9 = im[38];
+    t15 = re[62];
+    t16 = im[62];
+    t2 = re[86];
+    t14 = im[86];
+    t19 = t1 + t2;
+    t3 = t11 + t14;
+    t4 = t18 + t15;
+    t10 = t9 + t16;
+    t6 = t1 - t2;
+    t8 = t11 - t14;
+    t12 = t18 - t15;
+    t17 = t9 - t16;
+    t0 = t19 + t4;
+    t13 = t3 + t10;
+    t1 = t19 - t4;
+    t2 = C43 * t1;
+    t11 = t3 - t10;
+    t14 = C43 * t11;
+    t18 = C44 * t0;
+    t15 = t5 - t18;
+    t9 = C44 * t13;
+    t16 = t7 - t9;
+    t19 = t15 + t2;
+    t4 = t16 + t14;
+    t1 = t15 - t2;
+    t3 = t16 - t14;
+    t10 = C45 * t6;
+    t11 = C46 * t12;
+    t18 = t10 + t11;
+    t9 = C45 * t8;
+    t15 = C46 * t17;
+    t2 = t9 + t15;
+    t16 = C46 * t6;
+    t14 = C45 * t12;
+    t10 = t16 - t14;
+    t11 = C46 * t8;
+    t9 = C45 * t17;
+    t15 = t11 - t9;
+    t6 = t5 + t0;
+    t12 = t7 + t13;
+    t16 = t19 + t2;
+    t14 = t4 - t18;
+    t8 = t1 + t15;
+    t17 = t3 - t10;
+    t11 = t1 - t15;
+    t9 = t3 + t10;
+    t5 = t19 - t2;
+    t0 = t4 + t18;
+    re[110] = t6;
+    im[110] = t12;
+    re[14] = t16;
+    im[14] = t14;
+    re[38] = t8;
+    im[38] = t17;
+    re[62] = t11;
+    im[62] = t9;
+    re[86] = t5;
+    im[86] = t0;
+    t7 = re[5];
+    t13 = im[5];
+    t1 = re[29];
+    t15 = im[29];
+    t3 = re[53];
+    t10 = im[53];
+    t19 = re[77];
+    t2 = im[77];
+    t4 = re[101];
+    t18 = im[101];
+    t6 = t1 + t4;
+    t12 = t15 + t18;
+    t16 = t3 + t19;
+    t14 = t10 + t2;
+    t8 = t1 - t4;
+    t17 = t15 - t18;
+    t11 = t3 - t19;
+    t9 = t10 - t2;
+    t5 = t6 + t16;
+    t0 = t12 + t14;
+    t1 = t6 - t16;
+    t4 = C43 * t1;
+    t15 = t12 - t14;
+    t18 = C43 * t15;
+    t3 = C44 * t5;
+    t19 = t7 - t3;
+    t10 = C44 * t0;
+    t2 = t13 - t10;
+    t6 = t19 + t4;
+    t16 = t2 + t18;
+    t1 = t19 - t4;
+    t12 = t2 - t18;
+    t14 = C45 * t8;
+    t15 = C46 * t11;
+    t3 = t14 + t15;
+    t10 = C45 * t17;
+    t19 = C46 * t9;
+    t4 = t10 + t19;
+    t2 = C46 * t8;
+    t18 = C45 * t11;
+    t14 = t2 - t18;
+    t15 = C46 * t17;
+    t10 = C45 * t9;
+    t19 = t15 - t10;
+    t8 = t7 + t5;
+    t11 = t13 + t0;
+    t2 = t6 + t4;
+    t18 = t16 - t3;
+    t17 = t1 + t19;
+    t9 = t12 - t14;
+    t15 = t1 - t19;
+    t10 = t12 + t14;
+    t7 = t6 - t4;
+    t5 = t16 + t3;
+    re[5] = t8;
+    im[5] = t11;
+    re[29] = t2;
+    im[29] = t18;
+    re[53] = t17;
+    im[53] = t9;
+    re[77] = t15;
+    im[77] = t10;
+    re[101] = t7;
+    im[101] = t5;
+    t13 = re[20];
+    t0 = im[20];
+    t1 = re[44];
+    t19 = im[44];
+    t12 = re[68];
+    t14 = im[68];
+    t6 = re[92];
+    t4 = im[92];
+    t16 = re[116];
+    t3 = im[116];
+    t8 = t1 + t16;
+    t11 = t19 + t3;
+    t2 = t12 + t6;
+    t18 = t14 + t4;
+    t17 = t1 - t16;
+    t9 = t19 - t3;
+    t15 = t12 - t6;
+    t10 = t14 - t4;
+    t7 = t8 + t2;
+    t5 = t11 + t18;
+    t1 = t8 - t2;
+    t16 = C43 * t1;
+    t19 = t11 - t18;
+    t3 = C43 * t19;
+    t12 = C44 * t7;
+    t6 = t13 - t12;
+    t14 = C44 * t5;
+    t4 = t0 - t14;
+    t8 = t6 + t16;
+    t2 = t4 + t3;
+    t1 = t6 - t16;
+    t11 = t4 - t3;
+    t18 = C45 * t17;
+    t19 = C46 * t15;
+    t12 = t18 + t19;
+    t14 = C45 * t9;
+    t6 = C46 * t10;
+    t16 = t14 + t6;
+    t4 = C46 * t17;
+    t3 = C45 * t15;
+    t18 = t4 - t3;
+    t19 = C46 * t9;
+    t14 = C45 * t10;
+    t6 = t19 - t14;
+    t17 = t13 + t7;
+    t15 = t0 + t5;
+    t4 = t8 + t16;
+    t3 = t2 - t12;
+    t9 = t1 + t6;
+    t10 = t11 - t18;
+    t19 = t1 - t6;
+    t14 = t11 + t18;
+    t13 = t8 - t16;
+    t7 = t2 + t12;
+    re[20] = t17;
+    im[20] = t15;
+    re[44] = t4;
+    im[44] = t3;
+    re[68] = t9;
+    im[68] = t10;
+    re[92] = t19;
+    im[92] = t14;
+    re[116] = t13;
+    im[116] = t7;
+    t0 = re[35];
+    t5 = im[35];
+    t1 = re[59];
+    t6 = im[59];
+    t11 = re[83];
+    t18 = im[83];
+    t8 = re[107];
+    t16 = im[107];
+    t2 = re[11];
+    t12 = im[11];
+    t17 = t1 + t2;
+    t15 = t6 + t12;
+    t4 = t11 + t8;
+    t3 = t18 + t16;
+    t9 = t1 - t2;
+    t10 = t6 - t12;
+    t19 = t11 - t8;
+    t14 = t18 - t16;
+    t13 = t17 + t4;
+    t7 = t15 + t3;
+    t1 = t17 - t4;
+    t2 = C43 * t1;
+    t6 = t15 - t3;
+    t12 = C43 * t6;
+    t11 = C44 * t13;
+    t8 = t0 - t11;
+    t18 = C44 * t7;
+    t16 = t5 - t18;
+    t17 = t8 + t2;
+    t4 = t16 + t12;
+    t1 = t8 - t2;
+    t15 = t16 - t12;
+    t3 = C45 * t9;
+    t6 = C46 * t19;
+    t11 = t3 + t6;
+    t18 = C45 * t10;
+    t8 = C46 * t14;
+    t2 = t18 + t8;
+    t16 = C46 * t9;
+    t12 = C45 * t19;
+    t3 = t16 - t12;
+    t6 = C46 * t10;
+    t18 = C45 * t14;
+    t8 = t6 - t18;
+    t9 = t0 + t13;
+    t19 = t5 + t7;
+    t16 = t17 + t2;
+    t12 = t4 - t11;
+    t10 = t1 + t8;
+    t14 = t15 - t3;
+    t6 = t1 - t8;
+    t18 = t15 + t3;
+    t0 = t17 - t2;
+    t13 = t4 + t11;
+    re[35] = t9;
+    im[35] = t19;
+    re[59] = t16;
+    im[59] = t12;
+    re[83] = t10;
+    im[83] = t14;
+    re[107] = t6;
+    im[107] = t18;
+    re[11] = t0;
+    im[11] = t13;
+    t5 = re[50];
+    t7 = im[50];
+    t1 = re[74];
+    t8 = im[74];
+    t15 = re[98];
+    t3 = im[98];
+    t17 = re[2];
+    t2 = im[2];
+    t4 = re[26];
+    t11 = im[26];
+    t9 = t1 + t4;
+    t19 = t8 + t11;
+    t16 = t15 + t17;
+    t12 = t3 + t2;
+    t10 = t1 - t4;
+    t14 = t8 - t11;
+    t6 = t15 - t17;
+    t18 = t3 - t2;
+    t0 = t9 + t16;
+    t13 = t19 + t12;
+    t1 = t9 - t16;
+    t4 = C43 * t1;
+    t8 = t19 - t12;
+    t11 = C43 * t8;
+    t15 = C44 * t0;
+    t17 = t5 - t15;
+    t3 = C44 * t13;
+    t2 = t7 - t3;
+    t9 = t17 + t4;
+    t16 = t2 + t11;
+    t1 = t17 - t4;
+    t19 = t2 - t11;
+    t12 = C45 * t10;
+    t8 = C46 * t6;
+    t15 = t12 + t8;
+    t3 = C45 * t14;
+    t17 = C46 * t18;
+    t4 = t3 + t17;
+    t2 = C46 * t10;
+    t11 = C45 * t6;
+    t12 = t2 - t11;
+    t8 = C46 * t14;
+    t3 = C45 * t18;
+    t17 = t8 - t3;
+    t10 = t5 + t0;
+    t6 = t7 + t13;
+    t2 = t9 + t4;
+    t11 = t16 - t15;
+    t14 = t1 + t17;
+    t18 = t19 - t12;
+    t8 = t1 - t17;
+    t3 = t19 + t12;
+    t5 = t9 - t4;
+    t0 = t16 + t15;
+    re[50] = t10;
+    im[50] = t6;
+    re[74] = t2;
+    im[74] = t11;
+    re[98] = t14;
+    im[98] = t18;
+    re[2] = t8;
+    im[2] = t3;
+    re[26] = t5;
+    im[26] = t0;
+    t7 = re[65];
+    t13 = im[65];
+    t1 = re[89];
+    t17 = im[89];
+    t19 = re[113];
+    t12 = im[113];
+    t9 = re[17];
+    t4 = im[17];
+    t16 = re[41];
+    t15 = im[41];
+    t10 = t1 + t16;
+    t6 = t17 + t15;
+    t2 = t19 + t9;
+    t11 = t12 + t4;
+    t14 = t1 - t16;
+    t18 = t17 - t15;
+    t8 = t19 - t9;
+    t3 = t12 - t4;
+    t5 = t10 + t2;
+    t0 = t6 + t11;
+    t1 = t10 - t2;
+    t16 = C43 * t1;
+    t17 = t6 - t11;
+    t15 = C43 * t17;
+    t19 = C44 * t5;
+    t9 = t7 - t19;
+    t12 = C44 * t0;
+    t4 = t13 - t12;
+    t10 = t9 + t16;
+    t2 = t4 + t15;
+    t1 = t9 - t16;
+    t6 = t4 - t15;
+    t11 = C45 * t14;
+    t17 = C46 * t8;
+    t19 = t11 + t17;
+    t12 = C45 * t18;
+    t9 = C46 * t3;
+    t16 = t12 + t9;
+    t4 = C46 * t14;
+    t15 = C45 * t8;
+    t11 = t4 - t15;
+    t17 = C46 * t18;
+    t12 = C45 * t3;
+    t9 = t17 - t12;
+    t14 = t7 + t5;
+    t8 = t13 + t0;
+    t4 = t10 + t16;
+    t15 = t2 - t19;
+    t18 = t1 + t9;
+    t3 = t6 - t11;
+    t17 = t1 - t9;
+    t12 = t6 + t11;
+    t7 = t10 - t16;
+    t5 = t2 + t19;
+    re[65] = t14;
+    im[65] = t8;
+    re[89] = t4;
+    im[89] = t15;
+    re[113] = t18;
+    im[113] = t3;
+    re[17] = t17;
+    im[17] = t12;
+    re[41] = t7;
+    im[41] = t5;
+    t13 = re[0];
+    t0 = im[0];
+    t1 = re[40];
+    t9 = im[40];
+    t6 = re[80];
+    t11 = im[80];
+    t10 = t1 + t6;
+    t16 = t9 + t11;
+    t2 = C47 * t10;
+    t19 = t13 - t2;
+    t14 = C47 * t16;
+    t8 = t0 - t14;
+    t4 = t1 - t6;
+    t15 = C48 * t4;
+    t18 = t9 - t11;
+    t3 = C48 * t18;
+    t17 = t13 + t10;
+    t12 = t0 + t16;
+    t7 = t19 + t3;
+    t5 = t8 - t15;
+    t2 = t19 - t3;
+    t14 = t8 + t15;
+    t1 = C49 * t17;
+    t6 = C50 * t12;
+    t4 = t1 + t6;
+    t9 = C50 * t17;
+    t11 = (-C49) * t12;
+    t18 = t9 + t11;
+    X[0] = t4;
+    X[239] = t18;
+    t13 = C51 * t7;
+    t10 = C52 * t5;
+    t0 = t13 + t10;
+    t16 = C52 * t7;
+    t19 = (-C51) * t5;
+    t3 = t16 + t19;
+    X[80] = t0;
+    X[159] = t3;
+    t8 = C53 * t2;
+    t15 = C54 * t14;
+    t1 = t8 + t15;
+    t6 = C54 * t2;
+    t17 = (-C53) * t14;
+    t12 = t6 + t17;
+    X[160] = t1;
+    X[79] = t12;
+    t9 = re[39];
+    t11 = im[39];
+    t4 = re[79];
+    t18 = im[79];
+    t13 = re[119];
+    t10 = im[119];
+    t7 = t4 + t13;
+    t5 = t18 + t10;
+    t16 = C47 * t7;
+    t19 = t9 - t16;
+    t0 = C47 * t5;
+    t3 = t11 - t0;
+    t8 = t4 - t13;
+    t15 = C48 * t8;
+    t2 = t18 - t10;
+    t14 = C48 * t2;
+    t6 = t9 + t7;
+    t17 = t11 + t5;
+    t1 = t19 + t14;
+    t12 = t3 - t15;
+    t16 = t19 - t14;
+    t0 = t3 + t15;
+    t4 = C55 * t6;
+    t13 = C56 * t17;
+    t8 = t4 + t13;
+    t18 = C56 * t6;
+    t10 = (-C55) * t17;
+    t2 = t18 + t10;
+    X[162] = t8;
+    X[77] = t2;
+    t9 = C57 * t1;
+    t7 = C58 * t12;
+    t11 = t9 + t7;
+    t5 = C58 * t1;
+    t19 = (-C57) * t12;
+    t14 = t5 + t19;
+    X[2] = t11;
+    X[237] = t14;
+    t3 = C59 * t16;
+    t15 = C60 * t0;
+    t4 = t3 + t15;
+    t13 = C60 * t16;
+    t6 = (-C59) * t0;
+    t17 = t13 + t6;
+    X[82] = t4;
+    X[157] = t17;
+    t18 = re[78];
+    t10 = im[78];
+    t8 = re[118];
+    t2 = im[118];
+    t9 = re[38];
+    t7 = im[38];
+    t1 = t8 + t9;
+    t12 = t2 + t7;
+    t5 = C47 * t1;
+    t19 = t18 - t5;
+    t11 = C47 * t12;
+    t14 = t10 - t11;
+    t3 = t8 - t9;
+    t15 = C48 * t3;
+    t16 = t2 - t7;
+    t0 = C48 * t16;
+    t13 = t18 + t1;
+    t6 = t10 + t12;
+    t4 = t19 + t0;
+    t17 = t14 - t15;
+    t5 = t19 - t0;
+    t11 = t14 + t15;
+    t8 = C61 * t13;
+    t9 = C62 * t6;
+    t3 = t8 + t9;
+    t2 = C62 * t13;
+    t7 = (-C61) * t6;
+    t16 = t2 + t7;
+    X[84] = t3;
+    X[155] = t16;
+    t18 = C63 * t4;
+    t1 = C64 * t17;
+    t10 = t18 + t1;
+    t12 = C64 * t4;
+    t19 = (-C63) * t17;
+    t0 = t12 + t19;
+    X[164] = t10;
+    X[75] = t0;
+    t14 = C65 * t5;
+    t15 = C66 * t11;
+    t8 = t14 + t15;
+    t9 = C66 * t5;
+    t13 = (-C65) * t11;
+    t6 = t9 + t13;
+    X[4] = t8;
+    X[235] = t6;
+    t2 = re[117];
+    t7 = im[117];
+    t3 = re[37];
+    t16 = im[37];
+    t18 = re[77];
+    t1 = im[77];
+    t4 = t3 + t18;
+    t17 = t16 + t1;
+    t12 = C47 * t4;
+    t19 = t2 - t12;
+    t10 = C47 * t17;
+    t0 = t7 - t10;
+    t14 = t3 - t18;
+    t15 = C48 * t14;
+    t5 = t16 - t1;
+    t11 = C48 * t5;
+    t9 = t2 + t4;
+    t13 = t7 + t17;
+    t8 = t19 + t11;
+    t6 = t0 - t15;
+    t12 = t19 - t11;
+    t10 = t0 + t15;
+    t3 = C67 * t9;
+    t18 = C68 * t13;
+    t14 = t3 + t18;
+    t16 = C68 * t9;
+    t1 = (-C67) * t13;
+    t5 = t16 + t1;
+    X[6] = t14;
+    X[233] = t5;
+    t2 = C69 * t8;
+    t4 = C70 * t6;
+    t7 = t2 + t4;
+    t17 = C70 * t8;
+    t19 = (-C69) * t6;
+    t11 = t17 + t19;
+    X[86] = t7;
+    X[153] = t11;
+    t0 = C71 * t12;
+    t15 = C72 * t10;
+    t3 = t0 + t15;
+    t18 = C72 * t12;
+    t9 = (-C71) * t10;
+    t13 = t18 + t9;
+    X[166] = t3;
+    X[73] = t13;
+    t16 = re[36];
+    t1 = im[36];
+    t14 = re[76];
+    t5 = im[76];
+    t2 = re[116];
+    t4 = im[116];
+    t8 = t14 + t2;
+    t6 = t5 + t4;
+    t17 = C47 * t8;
+    t19 = t16 - t17;
+    t7 = C47 * t6;
+    t11 = t1 - t7;
+    t0 = t14 - t2;
+    t15 = C48 * t0;
+    t12 = t5 - t4;
+    t10 = C48 * t12;
+    t18 = t16 + t8;
+    t9 = t1 + t6;
+    t3 = t19 + t10;
+    t13 = t11 - t15;
+    t17 = t19 - t10;
+    t7 = t11 + t15;
+    t14 = C73 * t18;
+    t2 = C74 * t9;
+    t0 = t14 + t2;
+    t5 = C74 * t18;
+    t4 = (-C73) * t9;
+    t12 = t5 + t4;
+    X[168] = t0;
+    X[71] = t12;
+    t16 = C75 * t3;
+    t8 = C76 * t13;
+    t1 = t16 + t8;
+    t6 = C76 * t3;
+    t19 = (-C75) * t13;
+    t10 = t6 + t19;
+    X[8] = t1;
+    X[231] = t10;
+    t11 = C77 * t17;
+    t15 = C78 * t7;
+    t14 = t11 + t15;
+    t2 = C78 * t17;
+    t18 = (-C77) * t7;
+    t9 = t2 + t18;
+    X[88] = t14;
+    X[151] = t9;
+    t5 = re[75];
+    t4 = im[75];
+    t0 = re[115];
+    t12 = im[115];
+    t16 = re[35];
+    t8 = im[35];
+    t3 = t0 + t16;
+    t13 = t12 + t8;
+    t6 = C47 * t3;
+    t19 = t5 - t6;
+    t1 = C47 * t13;
+    t10 = t4 - t1;
+    t11 = t0 - t16;
+    t15 = C48 * t11;
+    t17 = t12 - t8;
+    t7 = C48 * t17;
+    t2 = t5 + t3;
+    t18 = t4 + t13;
+    t14 = t19 + t7;
+    t9 = t10 - t15;
+    t6 = t19 - t7;
+    t1 = t10 + t15;
+    t0 = C79 * t2;
+    t16 = C80 * t18;
+    t11 = t0 + t16;
+    t12 = C80 * t2;
+    t8 = (-C79) * t18;
+    t17 = t12 + t8;
+    X[90] = t11;
+    X[149] = t17;
+    t5 = C81 * t14;
+    t3 = C82 * t9;
+    t4 = t5 + t3;
+    t13 = C82 * t14;
+    t19 = (-C81) * t9;
+    t7 = t13 + t19;
+    X[170] = t4;
+    X[69] = t7;
+    t10 = C83 * t6;
+    t15 = C84 * t1;
+    t0 = t10 + t15;
+    t16 = C84 * t6;
+    t2 = (-C83) * t1;
+    t18 = t16 + t2;
+    X[10] = t0;
+    X[229] = t18;
+    t12 = re[114];
+    t8 = im[114];
+    t11 = re[34];
+    t17 = im[34];
+    t5 = re[74];
+    t3 = im[74];
+    t14 = t11 + t5;
+    t9 = t17 + t3;
+    t13 = C47 * t14;
+    t19 = t12 - t13;
+    t4 = C47 * t9;
+    t7 = t8 - t4;
+    t10 = t11 - t5;
+    t15 = C48 * t10;
+    t6 = t17 - t3;
+    t1 = C48 * t6;
+    t16 = t12 + t14;
+    t2 = t8 + t9;
+    t0 = t19 + t1;
+    t18 = t7 - t15;
+    t13 = t19 - t1;
+    t4 = t7 + t15;
+    t11 = C85 * t16;
+    t5 = C86 * t2;
+    t10 = t11 + t5;
+    t17 = C86 * t16;
+    t3 = (-C85) * t2;
+    t6 = t17 + t3;
+    X[12] = t10;
+    X[227] = t6;
+    t12 = C87 * t0;
+    t14 = C88 * t18;
+    t8 = t12 + t14;
+    t9 = C88 * t0;
+    t19 = (-C87) * t18;
+    t1 = t9 + t19;
+    X[92] = t8;
+    X[147] = t1;
+    t7 = C89 * t13;
+    t15 = C90 * t4;
+    t11 = t7 + t15;
+    t5 = C90 * t13;
+    t16 = (-C89) * t4;
+    t2 = t5 + t16;
+    X[172] = t11;
+    X[67] = t2;
+    t17 = re[33];
+    t3 = im[33];
+    t10 = re[73];
+    t6 = im[73];
+    t12 = re[113];
+    t14 = im[113];
+    t0 = t10 + t12;
+    t18 = t6 + t14;
+    t9 = C47 * t0;
+    t19 = t17 - t9;
+    t8 = C47 * t18;
+    t1 = t3 - t8;
+    t7 = t10 - t12;
+    t15 = C48 * t7;
+    t13 = t6 - t14;
+    t4 = C48 * t13;
+    t5 = t17 + t0;
+    t16 = t3 + t18;
+    t11 = t19 + t4;
+    t2 = t1 - t15;
+    t9 = t19 - t4;
+    t8 = t1 + t15;
+    t10 = C91 * t5;
+    t12 = C92 * t16;
+    t7 = t10 + t12;
+    t6 = C92 * t5;
+    t14 = (-C91) * t16;
+    t13 = t6 + t14;
+    X[174] = t7;
+    X[65] = t13;
+    t17 = C93 * t11;
+    t0 = C94 * t2;
+    t3 = t17 + t0;
+    t18 = C94 * t11;
+    t19 = (-C93) * t2;
+    t4 = t18 + t19;
+    X[14] = t3;
+    X[225] = t4;
+    t1 = C95 * t9;
+    t15 = C96 * t8;
+    t10 = t1 + t15;
+    t12 = C96 * t9;
+    t5 = (-C95) * t8;
+    t16 = t12 + t5;
+    X[94] = t10;
+    X[145] = t16;
+    t6 = re[72];
+    t14 = im[72];
+    t7 = re[112];
+    t13 = im[112];
+    t17 = re[32];
+    t0 = im[32];
+    t11 = t7 + t17;
+    t2 = t13 + t0;
+    t18 = C47 * t11;
+    t19 = t6 - t18;
+    t3 = C47 * t2;
+    t4 = t14 - t3;
+    t1 = t7 - t17;
+    t15 = C48 * t1;
+    t9 = t13 - t0;
+    t8 = C48 * t9;
+    t12 = t6 + t11;
+    t5 = t14 + t2;
+    t10 = t19 + t8;
+    t16 = t4 - t15;
+    t18 = t19 - t8;
+    t3 = t4 + t15;
+    t7 = C97 * t12;
+    t17 = C98 * t5;
+    t1 = t7 + t17;
+    t13 = C98 * t12;
+    t0 = (-C97) * t5;
+    t9 = t13 + t0;
+    X[96] = t1;
+    X[143] = t9;
+    t6 = C99 * t10;
+    t11 = C100 * t16;
+    t14 = t6 + t11;
+    t2 = C100 * t10;
+    t19 = (-C99) * t16;
+    t8 = t2 + t19;
+    X[176] = t14;
+    X[63] = t8;
+    t4 = C101 * t18;
+    t15 = C102 * t3;
+    t7 = t4 + t15;
+    t17 = C102 * t18;
+    t12 = (-C101) * t3;
+    t5 = t17 + t12;
+    X[16] = t7;
+    X[223] = t5;
+    t13 = re[111];
+    t0 = im[111];
+    t1 = re[31];
+    t9 = im[31];
+    t6 = re[71];
+    t11 = im[71];
+    t10 = t1 + t6;
+    t16 = t9 + t11;
+    t2 = C47 * t10;
+    t19 = t13 - t2;
+    t14 = C47 * t16;
+    t8 = t0 - t14;
+    t4 = t1 - t6;
+    t15 = C48 * t4;
+    t18 = t9 - t11;
+    t3 = C48 * t18;
+    t17 = t13 + t10;
+    t12 = t0 + t16;
+    t7 = t19 + t3;
+    t5 = t8 - t15;
+    t2 = t19 - t3;
+    t14 = t8 + t15;
+    t1 = C103 * t17;
+    t6 = C104 * t12;
+    t4 = t1 + t6;
+    t9 = C104 * t17;
+    t11 = (-C103) * t12;
+    t18 = t9 + t11;
+    X[18] = t4;
+    X[221] = t18;
+    t13 = C105 * t7;
+    t10 = C106 * t5;
+    t0 = t13 + t10;
+    t16 = C106 * t7;
+    t19 = (-C105) * t5;
+    t3 = t16 + t19;
+    X[98] = t0;
+    X[141] = t3;
+    t8 = C107 * t2;
+    t15 = C108 * t14;
+    t1 = t8 + t15;
+    t6 = C108 * t2;
+    t17 = (-C107) * t14;
+    t12 = t6 + t17;
+    X[178] = t1;
+    X[61] = t12;
+    t9 = re[30];
+    t11 = im[30];
+    t4 = re[70];
+    t18 = im[70];
+    t13 = re[110];
+    t10 = im[110];
+    t7 = t4 + t13;
+    t5 = t18 + t10;
+    t16 = C47 * t7;
+    t19 = t9 - t16;
+    t0 = C47 * t5;
+    t3 = t11 - t0;
+    t8 = t4 - t13;
+    t15 = C48 * t8;
+    t2 = t18 - t10;
+    t14 = C48 * t2;
+    t6 = t9 + t7;
+    t17 = t11 + t5;
+    t1 = t19 + t14;
+    t12 = t3 - t15;
+    t16 = t19 - t14;
+    t0 = t3 + t15;
+    t4 = C109 * t6;
+    t13 = C110 * t17;
+    t8 = t4 + t13;
+    t18 = C110 * t6;
+    t10 = (-C109) * t17;
+    t2 = t18 + t10;
+    X[180] = t8;
+    X[59] = t2;
+    t9 = C111 * t1;
+    t7 = C112 * t12;
+    t11 = t9 + t7;
+    t5 = C112 * t1;
+    t19 = (-C111) * t12;
+    t14 = t5 + t19;
+    X[20] = t11;
+    X[219] = t14;
+    t3 = C113 * t16;
+    t15 = C114 * t0;
+    t4 = t3 + t15;
+    t13 = C114 * t16;
+    t6 = (-C113) * t0;
+    t17 = t13 + t6;
+    X[100] = t4;
+    X[139] = t17;
+    t18 = re[69];
+    t10 = im[69];
+    t8 = re[109];
+    t2 = im[109];
+    t9 = re[29];
+    t7 = im[29];
+    t1 = t8 + t9;
+    t12 = t2 + t7;
+    t5 = C47 * t1;
+    t19 = t18 - t5;
+    t11 = C47 * t12;
+    t14 = t10 - t11;
+    t3 = t8 - t9;
+    t15 = C48 * t3;
+    t16 = t2 - t7;
+    t0 = C48 * t16;
+    t13 = t18 + t1;
+    t6 = t10 + t12;
+    t4 = t19 + t0;
+    t17 = t14 - t15;
+    t5 = t19 - t0;
+    t11 = t14 + t15;
+    t8 = C115 * t13;
+    t9 = C116 * t6;
+    t3 = t8 + t9;
+    t2 = C116 * t13;
+    t7 = (-C115) * t6;
+    t16 = t2 + t7;
+    X[102] = t3;
+    X[137] = t16;
+    t18 = C117 * t4;
+    t1 = C118 * t17;
+    t10 = t18 + t1;
+    t12 = C118 * t4;
+    t19 = (-C117) * t17;
+    t0 = t12 + t19;
+    X[182] = t10;
+    X[57] = t0;
+    t14 = C119 * t5;
+    t15 = C120 * t11;
+    t8 = t14 + t15;
+    t9 = C120 * t5;
+    t13 = (-C119) * t11;
+    t6 = t9 + t13;
+    X[22] = t8;
+    X[217] = t6;
+}
+
+/**
+ *  Part 4 of ApplyWindowedMDCT_W75_240().
+ * 
+ *  @param {Number[]} x 
+ *    - The input block (480 points).
+ *  @param {Number[]} X 
+ *    - The array that would contain the output block (240 points).
+ *  @param {Number[]} re 
+ *    - The scratch buffer (real part, 120 points).
+ *  @param {Number[]} im 
+ *    - The scratch buffer (imaginary part, 120 points).
+ */
+function ApplyWindowedMDCT_W75_240_Part4(x, X, re, im) {
+    let t0, t1, t10, t11, t12, t13, t14, t15, t16, t17, t18, t19, t2, t3, t4, t5, t6, t7, t8, t9;
+    const C0 = 0.5;
+    const C1 = 0.8660254037844386;
+    const C2 = 0.9871711222448248;
+    const C3 = 0.159665824163761;
+    const C4 = 0.7750823576645314;
+    const C5 = 0.6318602209644087;
+    const C6 = 0.3553109012804161;
+    const C7 = 0.9347481818282924;
+    const C8 = 0.34304498527233984;
+    const C9 = 0.9393189756837131;
+    const C10 = 0.984996587835043;
+    const C11 = 0.1725738159551517;
+    const C12 = 0.7667451597285615;
+    const C13 = 0.641951602562703;
+    const C14 = 0.758276583956687;
+    const C15 = 0.6519329890586743;
+    const C16 = 0.3307202902720374;
+    const C17 = 0.9437288220682779;
+    const C18 = 0.9826532793307118;
+    const C19 = 0.18545223811159092;
+    const C20 = 0.9801415982456801;
+    const C21 = 0.19829888398174045;
+    const C22 = 0.74967808139577;
+    const C23 = 0.6618026701931303;
+    const C24 = 0.3183389280525497;
+    const C25 = 0.9479769653775104;
+    const C26 = 0.30590302009655346;
+    const C27 = 0.9520626777139243;
+    const C28 = 0.9774619749435719;
+    const C29 = 0.21111155235896514;
+    const C30 = 0.7409511253549591;
+    const C31 = 0.6715589548470183;
+    const C32 = 0.7320972111532454;
+    const C33 = 0.6812001713311883;
+    const C34 = 0.2934146972328567;
+    const C35 = 0.9559852590117439;
+    const C36 = 0.974614868564045;
+    const C37 = 0.22388804785849836;
+    const C38 = 0.9716007669441208;
+    const C39 = 0.23662618129360988;
+    const C40 = 0.7231178558632475;
+    const C41 = 0.6907246676728287;
+    const C42 = 0.2808760992712921;
+    const C43 = 0.9597440371568574;
+    const C44 = 0.2682893746360714;
+    const C45 = 0.9633383681019799;
+    const C46 = 0.968420186534595;
+    const C47 = 0.24932377005071168;
+    const C48 = 0.7140145980512682;
+    const C49 = 0.7001308118985237;
+    const C50 = 0.7047889975136701;
+    const C51 = 0.709416992313883;
+    const C52 = 0.2556566799976644;
+    const C53 = 0.9667676359770075;
+    const C54 = 0.9650736723115474;
+    const C55 = 0.26197863846333747;
+    const C56 = 0.9615617976829619;
+    const C57 = 0.27458861818493235;
+    const C58 = 0.6954426350096117;
+    const C59 = 0.7185816177796981;
+    const C60 = 0.24298017990326387;
+    const C61 = 0.970031253194544;
+    const C62 = 0.23026204640590237;
+    const C63 = 0.97312866055058;
+    const C64 = 0.9578851643904772;
+    const C65 = 0.2871515485603873;
+    const C66 = 0.6859771119901928;
+    const C67 = 0.7276231179845748;
+    const C68 = 0.6763940503240542;
+    const C69 = 0.736539943713999;
+    const C70 = 0.21750445869228147;
+    const C71 = 0.9760593273203108;
+    const C72 = 0.9540444024062804;
+    const C73 = 0.2996652769962566;
+    const C74 = 0.9500401698251654;
+    const C75 = 0.3121276593295937;
+    const C76 = 0.6666950920194786;
+    const C77 = 0.7453305671157858;
+    const C78 = 0.2047096027093796;
+    const C79 = 0.9788227513490724;
+    const C80 = 0.19187967078990142;
+    const C81 = 0.9814184591383835;
+    const C82 = 0.945873152751771;
+    const C83 = 0.32453656019534216;
+    const C84 = 0.6568818989430413;
+    const C85 = 0.7539934819618695;
+    const C86 = 0.6469561525348573;
+    const C87 = 0.7625272039063882;
+    const C88 = 0.17901686127663266;
+    const C89 = 0.9838460059270774;
+    const C90 = 0.9415440651830208;
+    const C91 = 0.33688985339222005;
+    const C92 = 0.9370536488857836;
+    const C93 = 0.34918542224703286;
+    const C94 = 0.6369195535204759;
+    const C95 = 0.7709302707400181;
+    const C96 = 0.16612337814576547;
+    const C97 = 0.9861049757675088;
+    const C98 = 0.15320143062925848;
+    const C99 = 0.9881949815968246;
+    const C100 = 0.9324026732697752;
+    const C101 = 0.361421159977355;
+    const C102 = 0.6267738216194696;
+    const C103 = 0.7792012426405167;
+    const C104 = 0.6165206952507691;
+    const C105 = 0.7873387024194278;
+    const C106 = 0.14025323283629626;
+    const C107 = 0.9901156653032855;
+    const C108 = 0.927591935255724;
+    const C109 = 0.37359497005251635;
+    const C110 = 0.9226222591388232;
+    const C111 = 0.3857047665528313;
+    const C112 = 0.6061619312347947;
+    const C113 = 0.79534125576491;
+    const C114 = 0.1272810033739132;
+    const C115 = 0.991866697787626;
+    const C116 = 0.1142869649668464;
+    const C117 = 0.9934477790194444;
+    const C118 = 0.9174944964474913;
+    const C119 = 0.39774847452701106;
+    const C120 = 0.5956993044924334;
+    const C121 = 0.8032075314806449;
+    const C122 = 0.5851346077409155;
+    const C123 = 0.8109361817207843;
+    const C124 = 0.10127334407668342;
+    const C125 = 0.9948586380886109;
+    const C126 = 0.9122095257974677;
+    const C127 = 0.4097240303476953;
+    const C128 = 0.9067682527412662;
+    const C129 = 0.4216293820650445;
+    const C130 = 0.5744696511866426;
+    const C131 = 0.8185258822208966;
+    const C132 = 0.08824237052036951;
+    const C133 = 0.9960990332516871;
+    const C134 = 0.0751962770881399;
+    const C135 = 0.9971687519733476;
+    const C136 = 0.9011716096130131;
+    const C137 = 0.4334624897583309;
+    const C138 = 0.5637062622150166;
+    const C139 = 0.8259753325248732;
+    const C140 = 0.5528462850773279;
+    const C141 = 0.8332832562077542;
+    const C142 = 0.062137299160942724;
+    const C143 = 0.9980676109627962;
+    const C144 = 0.895420555368697;
+    const C145 = 0.4452213258854682;
+    const C146 = 0.8895160754218561;
+    const C147 = 0.4569038756304206;
+    const C148 = 0.5418915805747517;
+    const C149 = 0.840448401094438;
+    const C150 = 0.049067674327418015;
+    const C151 = 0.9987954562051724;
+    const C152 = 0.035989642000498374;
+    const C153 = 0.9993521629879409;
+    const C154 = 0.8834591814747328;
+    const C155 = 0.46850813724843143;
+    const C156 = 0.5308440257395095;
+    const C157 = 0.8474695394742344;
+    const C158 = 0.5197055135132492;
+    const C159 = 0.8543454683112272;
+    const C160 = 0.02290544303369714;
+    const C161 = 0.9997376359222604;
+    const C162 = 0.8772509113449243;
+    const C163 = 0.4800321224090111;
+    const C164 = 0.8708923287875567;
+    const C165 = 0.49147385653662823;
+    const C166 = 0.5084779524226998;
+    const C167 = 0.861075009450407;
+    const C168 = 0.009817319337149617;
+    const C169 = 0.999951808959328;
+    t2 = re[108];
+    t7 = im[108];
+    t3 = re[28];
+    t16 = im[28];
+    t18 = re[68];
+    t1 = im[68];
+    t4 = t3 + t18;
+    t17 = t16 + t1;
+    t12 = C0 * t4;
+    t19 = t2 - t12;
+    t10 = C0 * t17;
+    t0 = t7 - t10;
+    t14 = t3 - t18;
+    t15 = C1 * t14;
+    t5 = t16 - t1;
+    t11 = C1 * t5;
+    t9 = t2 + t4;
+    t13 = t7 + t17;
+    t8 = t19 + t11;
+    t6 = t0 - t15;
+    t12 = t19 - t11;
+    t10 = t0 + t15;
+    t3 = C2 * t9;
+    t18 = C3 * t13;
+    t14 = t3 + t18;
+    t16 = C3 * t9;
+    t1 = (-C2) * t13;
+    t5 = t16 + t1;
+    X[24] = t14;
+    X[215] = t5;
+    t2 = C4 * t8;
+    t4 = C5 * t6;
+    t7 = t2 + t4;
+    t17 = C5 * t8;
+    t19 = (-C4) * t6;
+    t11 = t17 + t19;
+    X[104] = t7;
+    X[135] = t11;
+    t0 = C6 * t12;
+    t15 = C7 * t10;
+    t3 = t0 + t15;
+    t18 = C7 * t12;
+    t9 = (-C6) * t10;
+    t13 = t18 + t9;
+    X[184] = t3;
+    X[55] = t13;
+    t16 = re[27];
+    t1 = im[27];
+    t14 = re[67];
+    t5 = im[67];
+    t2 = re[107];
+    t4 = im[107];
+    t8 = t14 + t2;
+    t6 = t5 + t4;
+    t17 = C0 * t8;
+    t19 = t16 - t17;
+    t7 = C0 * t6;
+    t11 = t1 - t7;
+    t0 = t14 - t2;
+    t15 = C1 * t0;
+    t12 = t5 - t4;
+    t10 = C1 * t12;
+    t18 = t16 + t8;
+    t9 = t1 + t6;
+    t3 = t19 + t10;
+    t13 = t11 - t15;
+    t17 = t19 - t10;
+    t7 = t11 + t15;
+    t14 = C8 * t18;
+    t2 = C9 * t9;
+    t0 = t14 + t2;
+    t5 = C9 * t18;
+    t4 = (-C8) * t9;
+    t12 = t5 + t4;
+    X[186] = t0;
+    X[53] = t12;
+    t16 = C10 * t3;
+    t8 = C11 * t13;
+    t1 = t16 + t8;
+    t6 = C11 * t3;
+    t19 = (-C10) * t13;
+    t10 = t6 + t19;
+    X[26] = t1;
+    X[213] = t10;
+    t11 = C12 * t17;
+    t15 = C13 * t7;
+    t14 = t11 + t15;
+    t2 = C13 * t17;
+    t18 = (-C12) * t7;
+    t9 = t2 + t18;
+    X[106] = t14;
+    X[133] = t9;
+    t5 = re[66];
+    t4 = im[66];
+    t0 = re[106];
+    t12 = im[106];
+    t16 = re[26];
+    t8 = im[26];
+    t3 = t0 + t16;
+    t13 = t12 + t8;
+    t6 = C0 * t3;
+    t19 = t5 - t6;
+    t1 = C0 * t13;
+    t10 = t4 - t1;
+    t11 = t0 - t16;
+    t15 = C1 * t11;
+    t17 = t12 - t8;
+    t7 = C1 * t17;
+    t2 = t5 + t3;
+    t18 = t4 + t13;
+    t14 = t19 + t7;
+    t9 = t10 - t15;
+    t6 = t19 - t7;
+    t1 = t10 + t15;
+    t0 = C14 * t2;
+    t16 = C15 * t18;
+    t11 = t0 + t16;
+    t12 = C15 * t2;
+    t8 = (-C14) * t18;
+    t17 = t12 + t8;
+    X[108] = t11;
+    X[131] = t17;
+    t5 = C16 * t14;
+    t3 = C17 * t9;
+    t4 = t5 + t3;
+    t13 = C17 * t14;
+    t19 = (-C16) * t9;
+    t7 = t13 + t19;
+    X[188] = t4;
+    X[51] = t7;
+    t10 = C18 * t6;
+    t15 = C19 * t1;
+    t0 = t10 + t15;
+    t16 = C19 * t6;
+    t2 = (-C18) * t1;
+    t18 = t16 + t2;
+    X[28] = t0;
+    X[211] = t18;
+    t12 = re[105];
+    t8 = im[105];
+    t11 = re[25];
+    t17 = im[25];
+    t5 = re[65];
+    t3 = im[65];
+    t14 = t11 + t5;
+    t9 = t17 + t3;
+    t13 = C0 * t14;
+    t19 = t12 - t13;
+    t4 = C0 * t9;
+    t7 = t8 - t4;
+    t10 = t11 - t5;
+    t15 = C1 * t10;
+    t6 = t17 - t3;
+    t1 = C1 * t6;
+    t16 = t12 + t14;
+    t2 = t8 + t9;
+    t0 = t19 + t1;
+    t18 = t7 - t15;
+    t13 = t19 - t1;
+    t4 = t7 + t15;
+    t11 = C20 * t16;
+    t5 = C21 * t2;
+    t10 = t11 + t5;
+    t17 = C21 * t16;
+    t3 = (-C20) * t2;
+    t6 = t17 + t3;
+    X[30] = t10;
+    X[209] = t6;
+    t12 = C22 * t0;
+    t14 = C23 * t18;
+    t8 = t12 + t14;
+    t9 = C23 * t0;
+    t19 = (-C22) * t18;
+    t1 = t9 + t19;
+    X[110] = t8;
+    X[129] = t1;
+    t7 = C24 * t13;
+    t15 = C25 * t4;
+    t11 = t7 + t15;
+    t5 = C25 * t13;
+    t16 = (-C24) * t4;
+    t2 = t5 + t16;
+    X[190] = t11;
+    X[49] = t2;
+    t17 = re[24];
+    t3 = im[24];
+    t10 = re[64];
+    t6 = im[64];
+    t12 = re[104];
+    t14 = im[104];
+    t0 = t10 + t12;
+    t18 = t6 + t14;
+    t9 = C0 * t0;
+    t19 = t17 - t9;
+    t8 = C0 * t18;
+    t1 = t3 - t8;
+    t7 = t10 - t12;
+    t15 = C1 * t7;
+    t13 = t6 - t14;
+    t4 = C1 * t13;
+    t5 = t17 + t0;
+    t16 = t3 + t18;
+    t11 = t19 + t4;
+    t2 = t1 - t15;
+    t9 = t19 - t4;
+    t8 = t1 + t15;
+    t10 = C26 * t5;
+    t12 = C27 * t16;
+    t7 = t10 + t12;
+    t6 = C27 * t5;
+    t14 = (-C26) * t16;
+    t13 = t6 + t14;
+    X[192] = t7;
+    X[47] = t13;
+    t17 = C28 * t11;
+    t0 = C29 * t2;
+    t3 = t17 + t0;
+    t18 = C29 * t11;
+    t19 = (-C28) * t2;
+    t4 = t18 + t19;
+    X[32] = t3;
+    X[207] = t4;
+    t1 = C30 * t9;
+    t15 = C31 * t8;
+    t10 = t1 + t15;
+    t12 = C31 * t9;
+    t5 = (-C30) * t8;
+    t16 = t12 + t5;
+    X[112] = t10;
+    X[127] = t16;
+    t6 = re[63];
+    t14 = im[63];
+    t7 = re[103];
+    t13 = im[103];
+    t17 = re[23];
+    t0 = im[23];
+    t11 = t7 + t17;
+    t2 = t13 + t0;
+    t18 = C0 * t11;
+    t19 = t6 - t18;
+    t3 = C0 * t2;
+    t4 = t14 - t3;
+    t1 = t7 - t17;
+    t15 = C1 * t1;
+    t9 = t13 - t0;
+    t8 = C1 * t9;
+    t12 = t6 + t11;
+    t5 = t14 + t2;
+    t10 = t19 + t8;
+    t16 = t4 - t15;
+    t18 = t19 - t8;
+    t3 = t4 + t15;
+    t7 = C32 * t12;
+    t17 = C33 * t5;
+    t1 = t7 + t17;
+    t13 = C33 * t12;
+    t0 = (-C32) * t5;
+    t9 = t13 + t0;
+    X[114] = t1;
+    X[125] = t9;
+    t6 = C34 * t10;
+    t11 = C35 * t16;
+    t14 = t6 + t11;
+    t2 = C35 * t10;
+    t19 = (-C34) * t16;
+    t8 = t2 + t19;
+    X[194] = t14;
+    X[45] = t8;
+    t4 = C36 * t18;
+    t15 = C37 * t3;
+    t7 = t4 + t15;
+    t17 = C37 * t18;
+    t12 = (-C36) * t3;
+    t5 = t17 + t12;
+    X[34] = t7;
+    X[205] = t5;
+    t13 = re[102];
+    t0 = im[102];
+    t1 = re[22];
+    t9 = im[22];
+    t6 = re[62];
+    t11 = im[62];
+    t10 = t1 + t6;
+    t16 = t9 + t11;
+    t2 = C0 * t10;
+    t19 = t13 - t2;
+    t14 = C0 * t16;
+    t8 = t0 - t14;
+    t4 = t1 - t6;
+    t15 = C1 * t4;
+    t18 = t9 - t11;
+    t3 = C1 * t18;
+    t17 = t13 + t10;
+    t12 = t0 + t16;
+    t7 = t19 + t3;
+    t5 = t8 - t15;
+    t2 = t19 - t3;
+    t14 = t8 + t15;
+    t1 = C38 * t17;
+    t6 = C39 * t12;
+    t4 = t1 + t6;
+    t9 = C39 * t17;
+    t11 = (-C38) * t12;
+    t18 = t9 + t11;
+    X[36] = t4;
+    X[203] = t18;
+    t13 = C40 * t7;
+    t10 = C41 * t5;
+    t0 = t13 + t10;
+    t16 = C41 * t7;
+    t19 = (-C40) * t5;
+    t3 = t16 + t19;
+    X[116] = t0;
+    X[123] = t3;
+    t8 = C42 * t2;
+    t15 = C43 * t14;
+    t1 = t8 + t15;
+    t6 = C43 * t2;
+    t17 = (-C42) * t14;
+    t12 = t6 + t17;
+    X[196] = t1;
+    X[43] = t12;
+    t9 = re[21];
+    t11 = im[21];
+    t4 = re[61];
+    t18 = im[61];
+    t13 = re[101];
+    t10 = im[101];
+    t7 = t4 + t13;
+    t5 = t18 + t10;
+    t16 = C0 * t7;
+    t19 = t9 - t16;
+    t0 = C0 * t5;
+    t3 = t11 - t0;
+    t8 = t4 - t13;
+    t15 = C1 * t8;
+    t2 = t18 - t10;
+    t14 = C1 * t2;
+    t6 = t9 + t7;
+    t17 = t11 + t5;
+    t1 = t19 + t14;
+    t12 = t3 - t15;
+    t16 = t19 - t14;
+    t0 = t3 + t15;
+    t4 = C44 * t6;
+    t13 = C45 * t17;
+    t8 = t4 + t13;
+    t18 = C45 * t6;
+    t10 = (-C44) * t17;
+    t2 = t18 + t10;
+    X[198] = t8;
+    X[41] = t2;
+    t9 = C46 * t1;
+    t7 = C47 * t12;
+    t11 = t9 + t7;
+    t5 = C47 * t1;
+    t19 = (-C46) * t12;
+    t14 = t5 + t19;
+    X[38] = t11;
+    X[201] = t14;
+    t3 = C48 * t16;
+    t15 = C49 * t0;
+    t4 = t3 + t15;
+    t13 = C49 * t16;
+    t6 = (-C48) * t0;
+    t17 = t13 + t6;
+    X[118] = t4;
+    X[121] = t17;
+    t18 = re[60];
+    t10 = im[60];
+    t8 = re[100];
+    t2 = im[100];
+    t9 = re[20];
+    t7 = im[20];
+    t1 = t8 + t9;
+    t12 = t2 + t7;
+    t5 = C0 * t1;
+    t19 = t18 - t5;
+    t11 = C0 * t12;
+    t14 = t10 - t11;
+    t3 = t8 - t9;
+    t15 = C1 * t3;
+    t16 = t2 - t7;
+    t0 = C1 * t16;
+    t13 = t18 + t1;
+    t6 = t10 + t12;
+    t4 = t19 + t0;
+    t17 = t14 - t15;
+    t5 = t19 - t0;
+    t11 = t14 + t15;
+    t8 = C50 * t13;
+    t9 = C51 * t6;
+    t3 = t8 + t9;
+    t2 = C51 * t13;
+    t7 = (-C50) * t6;
+    t16 = t2 + t7;
+    X[120] = t3;
+    X[119] = t16;
+    t18 = C52 * t4;
+    t1 = C53 * t17;
+    t10 = t18 + t1;
+    t12 = C53 * t4;
+    t19 = (-C52) * t17;
+    t0 = t12 + t19;
+    X[200] = t10;
+    X[39] = t0;
+    t14 = C54 * t5;
+    t15 = C55 * t11;
+    t8 = t14 + t15;
+    t9 = C55 * t5;
+    t13 = (-C54) * t11;
+    t6 = t9 + t13;
+    X[40] = t8;
+    X[199] = t6;
+    t2 = re[99];
+    t7 = im[99];
+    t3 = re[19];
+    t16 = im[19];
+    t18 = re[59];
+    t1 = im[59];
+    t4 = t3 + t18;
+    t17 = t16 + t1;
+    t12 = C0 * t4;
+    t19 = t2 - t12;
+    t10 = C0 * t17;
+    t0 = t7 - t10;
+    t14 = t3 - t18;
+    t15 = C1 * t14;
+    t5 = t16 - t1;
+    t11 = C1 * t5;
+    t9 = t2 + t4;
+    t13 = t7 + t17;
+    t8 = t19 + t11;
+    t6 = t0 - t15;
+    t12 = t19 - t11;
+    t10 = t0 + t15;
+    t3 = C56 * t9;
+    t18 = C57 * t13;
+    t14 = t3 + t18;
+    t16 = C57 * t9;
+    t1 = (-C56) * t13;
+    t5 = t16 + t1;
+    X[42] = t14;
+    X[197] = t5;
+    t2 = C58 * t8;
+    t4 = C59 * t6;
+    t7 = t2 + t4;
+    t17 = C59 * t8;
+    t19 = (-C58) * t6;
+    t11 = t17 + t19;
+    X[122] = t7;
+    X[117] = t11;
+    t0 = C60 * t12;
+    t15 = C61 * t10;
+    t3 = t0 + t15;
+    t18 = C61 * t12;
+    t9 = (-C60) * t10;
+    t13 = t18 + t9;
+    X[202] = t3;
+    X[37] = t13;
+    t16 = re[18];
+    t1 = im[18];
+    t14 = re[58];
+    t5 = im[58];
+    t2 = re[98];
+    t4 = im[98];
+    t8 = t14 + t2;
+    t6 = t5 + t4;
+    t17 = C0 * t8;
+    t19 = t16 - t17;
+    t7 = C0 * t6;
+    t11 = t1 - t7;
+    t0 = t14 - t2;
+    t15 = C1 * t0;
+    t12 = t5 - t4;
+    t10 = C1 * t12;
+    t18 = t16 + t8;
+    t9 = t1 + t6;
+    t3 = t19 + t10;
+    t13 = t11 - t15;
+    t17 = t19 - t10;
+    t7 = t11 + t15;
+    t14 = C62 * t18;
+    t2 = C63 * t9;
+    t0 = t14 + t2;
+    t5 = C63 * t18;
+    t4 = (-C62) * t9;
+    t12 = t5 + t4;
+    X[204] = t0;
+    X[35] = t12;
+    t16 = C64 * t3;
+    t8 = C65 * t13;
+    t1 = t16 + t8;
+    t6 = C65 * t3;
+    t19 = (-C64) * t13;
+    t10 = t6 + t19;
+    X[44] = t1;
+    X[195] = t10;
+    t11 = C66 * t17;
+    t15 = C67 * t7;
+    t14 = t11 + t15;
+    t2 = C67 * t17;
+    t18 = (-C66) * t7;
+    t9 = t2 + t18;
+    X[124] = t14;
+    X[115] = t9;
+    t5 = re[57];
+    t4 = im[57];
+    t0 = re[97];
+    t12 = im[97];
+    t16 = re[17];
+    t8 = im[17];
+    t3 = t0 + t16;
+    t13 = t12 + t8;
+    t6 = C0 * t3;
+    t19 = t5 - t6;
+    t1 = C0 * t13;
+    t10 = t4 - t1;
+    t11 = t0 - t16;
+    t15 = C1 * t11;
+    t17 = t12 - t8;
+    t7 = C1 * t17;
+    t2 = t5 + t3;
+    t18 = t4 + t13;
+    t14 = t19 + t7;
+    t9 = t10 - t15;
+    t6 = t19 - t7;
+    t1 = t10 + t15;
+    t0 = C68 * t2;
+    t16 = C69 * t18;
+    t11 = t0 + t16;
+    t12 = C69 * t2;
+    t8 = (-C68) * t18;
+    t17 = t12 + t8;
+    X[126] = t11;
+    X[113] = t17;
+    t5 = C70 * t14;
+    t3 = C71 * t9;
+    t4 = t5 + t3;
+    t13 = C71 * t14;
+    t19 = (-C70) * t9;
+    t7 = t13 + t19;
+    X[206] = t4;
+    X[33] = t7;
+    t10 = C72 * t6;
+    t15 = C73 * t1;
+    t0 = t10 + t15;
+    t16 = C73 * t6;
+    t2 = (-C72) * t1;
+    t18 = t16 + t2;
+    X[46] = t0;
+    X[193] = t18;
+    t12 = re[96];
+    t8 = im[96];
+    t11 = re[16];
+    t17 = im[16];
+    t5 = re[56];
+    t3 = im[56];
+    t14 = t11 + t5;
+    t9 = t17 + t3;
+    t13 = C0 * t14;
+    t19 = t12 - t13;
+    t4 = C0 * t9;
+    t7 = t8 - t4;
+    t10 = t11 - t5;
+    t15 = C1 * t10;
+    t6 = t17 - t3;
+    t1 = C1 * t6;
+    t16 = t12 + t14;
+    t2 = t8 + t9;
+    t0 = t19 + t1;
+    t18 = t7 - t15;
+    t13 = t19 - t1;
+    t4 = t7 + t15;
+    t11 = C74 * t16;
+    t5 = C75 * t2;
+    t10 = t11 + t5;
+    t17 = C75 * t16;
+    t3 = (-C74) * t2;
+    t6 = t17 + t3;
+    X[48] = t10;
+    X[191] = t6;
+    t12 = C76 * t0;
+    t14 = C77 * t18;
+    t8 = t12 + t14;
+    t9 = C77 * t0;
+    t19 = (-C76) * t18;
+    t1 = t9 + t19;
+    X[128] = t8;
+    X[111] = t1;
+    t7 = C78 * t13;
+    t15 = C79 * t4;
+    t11 = t7 + t15;
+    t5 = C79 * t13;
+    t16 = (-C78) * t4;
+    t2 = t5 + t16;
+    X[208] = t11;
+    X[31] = t2;
+    t17 = re[15];
+    t3 = im[15];
+    t10 = re[55];
+    t6 = im[55];
+    t12 = re[95];
+    t14 = im[95];
+    t0 = t10 + t12;
+    t18 = t6 + t14;
+    t9 = C0 * t0;
+    t19 = t17 - t9;
+    t8 = C0 * t18;
+    t1 = t3 - t8;
+    t7 = t10 - t12;
+    t15 = C1 * t7;
+    t13 = t6 - t14;
+    t4 = C1 * t13;
+    t5 = t17 + t0;
+    t16 = t3 + t18;
+    t11 = t19 + t4;
+    t2 = t1 - t15;
+    t9 = t19 - t4;
+    t8 = t1 + t15;
+    t10 = C80 * t5;
+    t12 = C81 * t16;
+    t7 = t10 + t12;
+    t6 = C81 * t5;
+    t14 = (-C80) * t16;
+    t13 = t6 + t14;
+    X[210] = t7;
+    X[29] = t13;
+    t17 = C82 * t11;
+    t0 = C83 * t2;
+    t3 = t17 + t0;
+    t18 = C83 * t11;
+    t19 = (-C82) * t2;
+    t4 = t18 + t19;
+    X[50] = t3;
+    X[189] = t4;
+    t1 = C84 * t9;
+    t15 = C85 * t8;
+    t10 = t1 + t15;
+    t12 = C85 * t9;
+    t5 = (-C84) * t8;
+    t16 = t12 + t5;
+    X[130] = t10;
+    X[109] = t16;
+    t6 = re[54];
+    t14 = im[54];
+    t7 = re[94];
+    t13 = im[94];
+    t17 = re[14];
+    t0 = im[14];
+    t11 = t7 + t17;
+    t2 = t13 + t0;
+    t18 = C0 * t11;
+    t19 = t6 - t18;
+    t3 = C0 * t2;
+    t4 = t14 - t3;
+    t1 = t7 - t17;
+    t15 = C1 * t1;
+    t9 = t13 - t0;
+    t8 = C1 * t9;
+    t12 = t6 + t11;
+    t5 = t14 + t2;
+    t10 = t19 + t8;
+    t16 = t4 - t15;
+    t18 = t19 - t8;
+    t3 = t4 + t15;
+    t7 = C86 * t12;
+    t17 = C87 * t5;
+    t1 = t7 + t17;
+    t13 = C87 * t12;
+    t0 = (-C86) * t5;
+    t9 = t13 + t0;
+    X[132] = t1;
+    X[107] = t9;
+    t6 = C88 * t10;
+    t11 = C89 * t16;
+    t14 = t6 + t11;
+    t2 = C89 * t10;
+    t19 = (-C88) * t16;
+    t8 = t2 + t19;
+    X[212] = t14;
+    X[27] = t8;
+    t4 = C90 * t18;
+    t15 = C91 * t3;
+    t7 = t4 + t15;
+    t17 = C91 * t18;
+    t12 = (-C90) * t3;
+    t5 = t17 + t12;
+    X[52] = t7;
+    X[187] = t5;
+    t13 = re[93];
+    t0 = im[93];
+    t1 = re[13];
+    t9 = im[13];
+    t6 = re[53];
+    t11 = im[53];
+    t10 = t1 + t6;
+    t16 = t9 + t11;
+    t2 = C0 * t10;
+    t19 = t13 - t2;
+    t14 = C0 * t16;
+    t8 = t0 - t14;
+    t4 = t1 - t6;
+    t15 = C1 * t4;
+    t18 = t9 - t11;
+    t3 = C1 * t18;
+    t17 = t13 + t10;
+    t12 = t0 + t16;
+    t7 = t19 + t3;
+    t5 = t8 - t15;
+    t2 = t19 - t3;
+    t14 = t8 + t15;
+    t1 = C92 * t17;
+    t6 = C93 * t12;
+    t4 = t1 + t6;
+    t9 = C93 * t17;
+    t11 = (-C92) * t12;
+    t18 = t9 + t11;
+    X[54] = t4;
+    X[185] = t18;
+    t13 = C94 * t7;
+    t10 = C95 * t5;
+    t0 = t13 + t10;
+    t16 = C95 * t7;
+    t19 = (-C94) * t5;
+    t3 = t16 + t19;
+    X[134] = t0;
+    X[105] = t3;
+    t8 = C96 * t2;
+    t15 = C97 * t14;
+    t1 = t8 + t15;
+    t6 = C97 * t2;
+    t17 = (-C96) * t14;
+    t12 = t6 + t17;
+    X[214] = t1;
+    X[25] = t12;
+    t9 = re[12];
+    t11 = im[12];
+    t4 = re[52];
+    t18 = im[52];
+    t13 = re[92];
+    t10 = im[92];
+    t7 = t4 + t13;
+    t5 = t18 + t10;
+    t16 = C0 * t7;
+    t19 = t9 - t16;
+    t0 = C0 * t5;
+    t3 = t11 - t0;
+    t8 = t4 - t13;
+    t15 = C1 * t8;
+    t2 = t18 - t10;
+    t14 = C1 * t2;
+    t6 = t9 + t7;
+    t17 = t11 + t5;
+    t1 = t19 + t14;
+    t12 = t3 - t15;
+    t16 = t19 - t14;
+    t0 = t3 + t15;
+    t4 = C98 * t6;
+    t13 = C99 * t17;
+    t8 = t4 + t13;
+    t18 = C99 * t6;
+    t10 = (-C98) * t17;
+    t2 = t18 + t10;
+    X[216] = t8;
+    X[23] = t2;
+    t9 = C100 * t1;
+    t7 = C101 * t12;
+    t11 = t9 + t7;
+    t5 = C101 * t1;
+    t19 = (-C100) * t12;
+    t14 = t5 + t19;
+    X[56] = t11;
+    X[183] = t14;
+    t3 = C102 * t16;
+    t15 = C103 * t0;
+    t4 = t3 + t15;
+    t13 = C103 * t16;
+    t6 = (-C102) * t0;
+    t17 = t13 + t6;
+    X[136] = t4;
+    X[103] = t17;
+    t18 = re[51];
+    t10 = im[51];
+    t8 = re[91];
+    t2 = im[91];
+    t9 = re[11];
+    t7 = im[11];
+    t1 = t8 + t9;
+    t12 = t2 + t7;
+    t5 = C0 * t1;
+    t19 = t18 - t5;
+    t11 = C0 * t12;
+    t14 = t10 - t11;
+    t3 = t8 - t9;
+    t15 = C1 * t3;
+    t16 = t2 - t7;
+    t0 = C1 * t16;
+    t13 = t18 + t1;
+    t6 = t10 + t12;
+    t4 = t19 + t0;
+    t17 = t14 - t15;
+    t5 = t19 - t0;
+    t11 = t14 + t15;
+    t8 = C104 * t13;
+    t9 = C105 * t6;
+    t3 = t8 + t9;
+    t2 = C105 * t13;
+    t7 = (-C104) * t6;
+    t16 = t2 + t7;
+    X[138] = t3;
+    X[101] = t16;
+    t18 = C106 * t4;
+    t1 = C107 * t17;
+    t10 = t18 + t1;
+    t12 = C107 * t4;
+    t19 = (-C106) * t17;
+    t0 = t12 + t19;
+    X[218] = t10;
+    X[21] = t0;
+    t14 = C108 * t5;
+    t15 = C109 * t11;
+    t8 = t14 + t15;
+    t9 = C109 * t5;
+    t13 = (-C108) * t11;
+    t6 = t9 + t13;
+    X[58] = t8;
+    X[181] = t6;
+    t2 = re[90];
+    t7 = im[90];
+    t3 = re[10];
+    t16 = im[10];
+    t18 = re[50];
+    t1 = im[50];
+    t4 = t3 + t18;
+    t17 = t16 + t1;
+    t12 = C0 * t4;
+    t19 = t2 - t12;
+    t10 = C0 * t17;
+    t0 = t7 - t10;
+    t14 = t3 - t18;
+    t15 = C1 * t14;
+    t5 = t16 - t1;
+    t11 = C1 * t5;
+    t9 = t2 + t4;
+    t13 = t7 + t17;
+    t8 = t19 + t11;
+    t6 = t0 - t15;
+    t12 = t19 - t11;
+    t10 = t0 + t15;
+    t3 = C110 * t9;
+    t18 = C111 * t13;
+    t14 = t3 + t18;
+    t16 = C111 * t9;
+    t1 = (-C110) * t13;
+    t5 = t16 + t1;
+    X[60] = t14;
+    X[179] = t5;
+    t2 = C112 * t8;
+    t4 = C113 * t6;
+    t7 = t2 + t4;
+    t17 = C113 * t8;
+    t19 = (-C112) * t6;
+    t11 = t17 + t19;
+    X[140] = t7;
+    X[99] = t11;
+    t0 = C114 * t12;
+    t15 = C115 * t10;
+    t3 = t0 + t15;
+    t18 = C115 * t12;
+    t9 = (-C114) * t10;
+    t13 = t18 + t9;
+    X[220] = t3;
+    X[19] = t13;
+    t16 = re[9];
+    t1 = im[9];
+    t14 = re[49];
+    t5 = im[49];
+    t2 = re[89];
+    t4 = im[89];
+    t8 = t14 + t2;
+    t6 = t5 + t4;
+    t17 = C0 * t8;
+    t19 = t16 - t17;
+    t7 = C0 * t6;
+    t11 = t1 - t7;
+    t0 = t14 - t2;
+    t15 = C1 * t0;
+    t12 = t5 - t4;
+    t10 = C1 * t12;
+    t18 = t16 + t8;
+    t9 = t1 + t6;
+    t3 = t19 + t10;
+    t13 = t11 - t15;
+    t17 = t19 - t10;
+    t7 = t11 + t15;
+    t14 = C116 * t18;
+    t2 = C117 * t9;
+    t0 = t14 + t2;
+    t5 = C117 * t18;
+    t4 = (-C116) * t9;
+    t12 = t5 + t4;
+    X[222] = t0;
+    X[17] = t12;
+    t16 = C118 * t3;
+    t8 = C119 * t13;
+    t1 = t16 + t8;
+    t6 = C119 * t3;
+    t19 = (-C118) * t13;
+    t10 = t6 + t19;
+    X[62] = t1;
+    X[177] = t10;
+    t11 = C120 * t17;
+    t15 = C121 * t7;
+    t14 = t11 + t15;
+    t2 = C121 * t17;
+    t18 = (-C120) * t7;
+    t9 = t2 + t18;
+    X[142] = t14;
+    X[97] = t9;
+    t5 = re[48];
+    t4 = im[48];
+    t0 = re[88];
+    t12 = im[88];
+    t16 = re[8];
+    t8 = im[8];
+    t3 = t0 + t16;
+    t13 = t12 + t8;
+    t6 = C0 * t3;
+    t19 = t5 - t6;
+    t1 = C0 * t13;
+    t10 = t4 - t1;
+    t11 = t0 - t16;
+    t15 = C1 * t11;
+    t17 = t12 - t8;
+    t7 = C1 * t17;
+    t2 = t5 + t3;
+    t18 = t4 + t13;
+    t14 = t19 + t7;
+    t9 = t10 - t15;
+    t6 = t19 - t7;
+    t1 = t10 + t15;
+    t0 = C122 * t2;
+    t16 = C123 * t18;
+    t11 = t0 + t16;
+    t12 = C123 * t2;
+    t8 = (-C122) * t18;
+    t17 = t12 + t8;
+    X[144] = t11;
+    X[95] = t17;
+    t5 = C124 * t14;
+    t3 = C125 * t9;
+    t4 = t5 + t3;
+    t13 = C125 * t14;
+    t19 = (-C124) * t9;
+    t7 = t13 + t19;
+    X[224] = t4;
+    X[15] = t7;
+    t10 = C126 * t6;
+    t15 = C127 * t1;
+    t0 = t10 + t15;
+    t16 = C127 * t6;
+    t2 = (-C126) * t1;
+    t18 = t16 + t2;
+    X[64] = t0;
+    X[175] = t18;
+    t12 = re[87];
+    t8 = im[87];
+    t11 = re[7];
+    t17 = im[7];
+    t5 = re[47];
+    t3 = im[47];
+    t14 = t11 + t5;
+    t9 = t17 + t3;
+    t13 = C0 * t14;
+    t19 = t12 - t13;
+    t4 = C0 * t9;
+    t7 = t8 - t4;
+    t10 = t11 - t5;
+    t15 = C1 * t10;
+    t6 = t17 - t3;
+    t1 = C1 * t6;
+    t16 = t12 + t14;
+    t2 = t8 + t9;
+    t0 = t19 + t1;
+    t18 = t7 - t15;
+    t13 = t19 - t1;
+    t4 = t7 + t15;
+    t11 = C128 * t16;
+    t5 = C129 * t2;
+    t10 = t11 + t5;
+    t17 = C129 * t16;
+    t3 = (-C128) * t2;
+    t6 = t17 + t3;
+    X[66] = t10;
+    X[173] = t6;
+    t12 = C130 * t0;
+    t14 = C131 * t18;
+    t8 = t12 + t14;
+    t9 = C131 * t0;
+    t19 = (-C130) * t18;
+    t1 = t9 + t19;
+    X[146] = t8;
+    X[93] = t1;
+    t7 = C132 * t13;
+    t15 = C133 * t4;
+    t11 = t7 + t15;
+    t5 = C133 * t13;
+    t16 = (-C132) * t4;
+    t2 = t5 + t16;
+    X[226] = t11;
+    X[13] = t2;
+    t17 = re[6];
+    t3 = im[6];
+    t10 = re[46];
+    t6 = im[46];
+    t12 = re[86];
+    t14 = im[86];
+    t0 = t10 + t12;
+    t18 = t6 + t14;
+    t9 = C0 * t0;
+    t19 = t17 - t9;
+    t8 = C0 * t18;
+    t1 = t3 - t8;
+    t7 = t10 - t12;
+    t15 = C1 * t7;
+    t13 = t6 - t14;
+    t4 = C1 * t13;
+    t5 = t17 + t0;
+    t16 = t3 + t18;
+    t11 = t19 + t4;
+    t2 = t1 - t15;
+    t9 = t19 - t4;
+    t8 = t1 + t15;
+    t10 = C134 * t5;
+    t12 = C135 * t16;
+    t7 = t10 + t12;
+    t6 = C135 * t5;
+    t14 = (-C134) * t16;
+    t13 = t6 + t14;
+    X[228] = t7;
+    X[11] = t13;
+    t17 = C136 * t11;
+    t0 = C137 * t2;
+    t3 = t17 + t0;
+    t18 = C137 * t11;
+    t19 = (-C136) * t2;
+    t4 = t18 + t19;
+    X[68] = t3;
+    X[171] = t4;
+    t1 = C138 * t9;
+    t15 = C139 * t8;
+    t10 = t1 + t15;
+    t12 = C139 * t9;
+    t5 = (-C138) * t8;
+    t16 = t12 + t5;
+    X[148] = t10;
+    X[91] = t16;
+    t6 = re[45];
+    t14 = im[45];
+    t7 = re[85];
+    t13 = im[85];
+    t17 = re[5];
+    t0 = im[5];
+    t11 = t7 + t17;
+    t2 = t13 + t0;
+    t18 = C0 * t11;
+    t19 = t6 - t18;
+    t3 = C0 * t2;
+    t4 = t14 - t3;
+    t1 = t7 - t17;
+    t15 = C1 * t1;
+    t9 = t13 - t0;
+    t8 = C1 * t9;
+    t12 = t6 + t11;
+    t5 = t14 + t2;
+    t10 = t19 + t8;
+    t16 = t4 - t15;
+    t18 = t19 - t8;
+    t3 = t4 + t15;
+    t7 = C140 * t12;
+    t17 = C141 * t5;
+    t1 = t7 + t17;
+    t13 = C141 * t12;
+    t0 = (-C140) * t5;
+    t9 = t13 + t0;
+    X[150] = t1;
+    X[89] = t9;
+    t6 = C142 * t10;
+    t11 = C143 * t16;
+    t14 = t6 + t11;
+    t2 = C143 * t10;
+    t19 = (-C142) * t16;
+    t8 = t2 + t19;
+    X[230] = t14;
+    X[9] = t8;
+    t4 = C144 * t18;
+    t15 = C145 * t3;
+    t7 = t4 + t15;
+    t17 = C145 * t18;
+    t12 = (-C144) * t3;
+    t5 = t17 + t12;
+    X[70] = t7;
+    X[169] = t5;
+    t13 = re[84];
+    t0 = im[84];
+    t1 = re[4];
+    t9 = im[4];
+    t6 = re[44];
+    t11 = im[44];
+    t10 = t1 + t6;
+    t16 = t9 + t11;
+    t2 = C0 * t10;
+    t19 = t13 - t2;
+    t14 = C0 * t16;
+    t8 = t0 - t14;
+    t4 = t1 - t6;
+    t15 = C1 * t4;
+    t18 = t9 - t11;
+    t3 = C1 * t18;
+    t17 = t13 + t10;
+    t12 = t0 + t16;
+    t7 = t19 + t3;
+    t5 = t8 - t15;
+    t2 = t19 - t3;
+    t14 = t8 + t15;
+    t1 = C146 * t17;
+    t6 = C147 * t12;
+    t4 = t1 + t6;
+    t9 = C147 * t17;
+    t11 = (-C146) * t12;
+    t18 = t9 + t11;
+    X[72] = t4;
+    X[167] = t18;
+    t13 = C148 * t7;
+    t10 = C149 * t5;
+    t0 = t13 + t10;
+    t16 = C149 * t7;
+    t19 = (-C148) * t5;
+    t3 = t16 + t19;
+    X[152] = t0;
+    X[87] = t3;
+    t8 = C150 * t2;
+    t15 = C151 * t14;
+    t1 = t8 + t15;
+    t6 = C151 * t2;
+    t17 = (-C150) * t14;
+    t12 = t6 + t17;
+    X[232] = t1;
+    X[7] = t12;
+    t9 = re[3];
+    t11 = im[3];
+    t4 = re[43];
+    t18 = im[43];
+    t13 = re[83];
+    t10 = im[83];
+    t7 = t4 + t13;
+    t5 = t18 + t10;
+    t16 = C0 * t7;
+    t19 = t9 - t16;
+    t0 = C0 * t5;
+    t3 = t11 - t0;
+    t8 = t4 - t13;
+    t15 = C1 * t8;
+    t2 = t18 - t10;
+    t14 = C1 * t2;
+    t6 = t9 + t7;
+    t17 = t11 + t5;
+    t1 = t19 + t14;
+    t12 = t3 - t15;
+    t16 = t19 - t14;
+    t0 = t3 + t15;
+    t4 = C152 * t6;
+    t13 = C153 * t17;
+    t8 = t4 + t13;
+    t18 = C153 * t6;
+    t10 = (-C152) * t17;
+    t2 = t18 + t10;
+    X[234] = t8;
+    X[5] = t2;
+    t9 = C154 * t1;
+    t7 = C155 * t12;
+    t11 = t9 + t7;
+    t5 = C155 * t1;
+    t19 = (-C154) * t12;
+    t14 = t5 + t19;
+    X[74] = t11;
+    X[165] = t14;
+    t3 = C156 * t16;
+    t15 = C157 * t0;
+    t4 = t3 + t15;
+    t13 = C157 * t16;
+    t6 = (-C156) * t0;
+    t17 = t13 + t6;
+    X[154] = t4;
+    X[85] = t17;
+    t18 = re[42];
+    t10 = im[42];
+    t8 = re[82];
+    t2 = im[82];
+    t9 = re[2];
+    t7 = im[2];
+    t1 = t8 + t9;
+    t12 = t2 + t7;
+    t5 = C0 * t1;
+    t19 = t18 - t5;
+    t11 = C0 * t12;
+    t14 = t10 - t11;
+    t3 = t8 - t9;
+    t15 = C1 * t3;
+    t16 = t2 - t7;
+    t0 = C1 * t16;
+    t13 = t18 + t1;
+    t6 = t10 + t12;
+    t4 = t19 + t0;
+    t17 = t14 - t15;
+    t5 = t19 - t0;
+    t11 = t14 + t15;
+    t8 = C158 * t13;
+    t9 = C159 * t6;
+    t3 = t8 + t9;
+    t2 = C159 * t13;
+    t7 = (-C158) * t6;
+    t16 = t2 + t7;
+    X[156] = t3;
+    X[83] = t16;
+    t18 = C160 * t4;
+    t1 = C161 * t17;
+    t10 = t18 + t1;
+    t12 = C161 * t4;
+    t19 = (-C160) * t17;
+    t0 = t12 + t19;
+    X[236] = t10;
+    X[3] = t0;
+    t14 = C162 * t5;
+    t15 = C163 * t11;
+    t8 = t14 + t15;
+    t9 = C163 * t5;
+    t13 = (-C162) * t11;
+    t6 = t9 + t13;
+    X[76] = t8;
+    X[163] = t6;
+    t2 = re[81];
+    t7 = im[81];
+    t3 = re[1];
+    t16 = im[1];
+    t18 = re[41];
+    t1 = im[41];
+    t4 = t3 + t18;
+    t17 = t16 + t1;
+    t12 = C0 * t4;
+    t19 = t2 - t12;
+    t10 = C0 * t17;
+    t0 = t7 - t10;
+    t14 = t3 - t18;
+    t15 = C1 * t14;
+    t5 = t16 - t1;
+    t11 = C1 * t5;
+    t9 = t2 + t4;
+    t13 = t7 + t17;
+    t8 = t19 + t11;
+    t6 = t0 - t15;
+    t12 = t19 - t11;
+    t10 = t0 + t15;
+    t3 = C164 * t9;
+    t18 = C165 * t13;
+    t14 = t3 + t18;
+    t16 = C165 * t9;
+    t1 = (-C164) * t13;
+    t5 = t16 + t1;
+    X[78] = t14;
+    X[161] = t5;
+    t2 = C166 * t8;
+    t4 = C167 * t6;
+    t7 = t2 + t4;
+    t17 = C167 * t8;
+    t19 = (-C166) * t6;
+    t11 = t17 + t19;
+    X[158] = t7;
+    X[81] = t11;
+    t0 = C168 * t12;
+    t15 = C169 * t10;
+    t3 = t0 + t15;
+    t18 = C169 * t12;
+    t9 = (-C168) * t10;
+    t13 = t18 + t9;
+    X[238] = t3;
+    X[1] = t13;
+}
+
+/**
+ *  Part 1 of ApplyWindowedIMDCT_W75_240().
+ * 
+ *  @param {Number[]} X 
+ *    - The input block (240 points).
+ *  @param {Number[]} y 
+ *    - The array that would contain the output block (480 points).
+ *  @param {Number[]} re 
+ *    - The scratch buffer (real part, 120 points).
+ *  @param {Number[]} im 
+ *    - The scratch buffer (imaginary part, 120 points).
+ */
+function ApplyWindowedIMDCT_W75_240_Part1(X, y, re, im) {
+    let t0, t1, t10, t11, t12, t13, t14, t15, t16, t17, t18, t19, t2, t3, t4, t5, t6, t7, t8, t9;
+    const C0 = 0.9807852804032304;
+    const C1 = 0.19509032201612825;
+    const C2 = 0.9238795325112867;
+    const C3 = 0.3826834323650898;
+    const C4 = 0.8314696123025452;
+    const C5 = 0.5555702330196022;
+    const C6 = 0.7071067811865476;
+    const C7 = 0.7071067811865475;
+    const C8 = 0.9510565162951535;
+    const C9 = 0.3090169943749474;
+    const C10 = 0.8724960070727972;
+    const C11 = 0.4886212414969549;
+    const C12 = 0.7604059656000309;
+    const C13 = 0.6494480483301837;
+    const C14 = 0.619093949309834;
+    const C15 = 0.785316930880745;
+    const C16 = 0.45399049973954675;
+    const C17 = 0.8910065241883679;
+    const C18 = 0.27144044986507426;
+    const C19 = 0.9624552364536473;
+    const C20 = 0.07845909572784494;
+    const C21 = 0.996917333733128;
+    const C22 = 0.9930684569549263;
+    const C23 = 0.11753739745783764;
+    const C24 = 0.8090169943749475;
+    const C25 = 0.5877852522924731;
+    const C26 = 0.6788007455329417;
+    const C27 = 0.7343225094356856;
+    const C28 = 0.5224985647159488;
+    const C29 = 0.8526401643540922;
+    const C30 = 0.34611705707749296;
+    const C31 = 0.9381913359224842;
+    const C32 = 0.15643446504023087;
+    const C33 = 0.9876883405951378;
+    const C34 = 0.9992290362407229;
+    const C35 = 0.03925981575906861;
+    const C36 = 0.9723699203976766;
+    const C37 = 0.2334453638559054;
+    const C38 = 0.9081431738250813;
+    const C39 = 0.41865973753742813;
+    const C40 = 0.5590169943749475;
+    const C41 = 0.25;
+    t0 = X[0];
+    t1 = X[239];
+    t2 = X[30];
+    t3 = X[209];
+    t4 = C0 * t2;
+    t5 = C1 * t3;
+    t4 = t4 + t5;
+    t5 = (-C1) * t2;
+    t2 = C0 * t3;
+    t3 = t5 + t2;
+    t5 = X[60];
+    t2 = X[179];
+    t6 = C2 * t5;
+    t7 = C3 * t2;
+    t6 = t6 + t7;
+    t7 = (-C3) * t5;
+    t5 = C2 * t2;
+    t2 = t7 + t5;
+    t7 = X[90];
+    t5 = X[149];
+    t8 = C4 * t7;
+    t9 = C5 * t5;
+    t8 = t8 + t9;
+    t9 = (-C5) * t7;
+    t7 = C4 * t5;
+    t5 = t9 + t7;
+    t9 = X[120];
+    t7 = X[119];
+    t10 = C6 * t9;
+    t11 = C7 * t7;
+    t10 = t10 + t11;
+    t11 = (-C7) * t9;
+    t9 = C6 * t7;
+    t7 = t11 + t9;
+    t11 = X[150];
+    t9 = X[89];
+    t12 = C5 * t11;
+    t13 = C4 * t9;
+    t12 = t12 + t13;
+    t13 = (-C4) * t11;
+    t11 = C5 * t9;
+    t9 = t13 + t11;
+    t13 = X[180];
+    t11 = X[59];
+    t14 = C3 * t13;
+    t15 = C2 * t11;
+    t14 = t14 + t15;
+    t15 = (-C2) * t13;
+    t13 = C3 * t11;
+    t11 = t15 + t13;
+    t15 = X[210];
+    t13 = X[29];
+    t16 = C1 * t15;
+    t17 = C0 * t13;
+    t16 = t16 + t17;
+    t17 = (-C0) * t15;
+    t15 = C1 * t13;
+    t13 = t17 + t15;
+    t17 = t0 + t10;
+    t15 = t1 + t7;
+    t18 = t6 + t14;
+    t19 = t2 + t11;
+    t0 = t0 - t10;
+    t10 = t1 - t7;
+    t1 = t6 - t14;
+    t7 = t2 - t11;
+    t6 = t17 + t18;
+    t14 = t15 + t19;
+    t2 = t0 + t7;
+    t11 = t10 - t1;
+    t17 = t17 - t18;
+    t18 = t15 - t19;
+    t15 = t0 - t7;
+    t19 = t10 + t1;
+    t0 = t4 + t12;
+    t7 = t3 + t9;
+    t10 = t8 + t16;
+    t1 = t5 + t13;
+    t4 = t4 - t12;
+    t12 = t3 - t9;
+    t3 = t8 - t16;
+    t9 = t5 - t13;
+    t8 = t0 + t10;
+    t16 = t7 + t1;
+    t5 = t4 + t9;
+    t13 = t12 - t3;
+    t0 = t0 - t10;
+    t10 = t7 - t1;
+    t7 = t4 - t9;
+    t1 = t12 + t3;
+    t4 = t5 + t13;
+    t9 = t5 - t13;
+    t12 = C6 * t4;
+    t3 = (-C6) * t9;
+    t5 = t7 - t1;
+    t13 = t7 + t1;
+    t4 = (-C6) * t5;
+    t9 = (-C6) * t13;
+    t7 = t6 - t8;
+    t1 = t14 - t16;
+    t5 = t6 + t8;
+    t13 = t14 + t16;
+    t6 = t2 - t12;
+    t8 = t11 - t3;
+    t14 = t2 + t12;
+    t16 = t11 + t3;
+    t2 = t17 - t10;
+    t12 = t18 + t0;
+    t11 = t17 + t10;
+    t3 = t18 - t0;
+    t17 = t15 - t4;
+    t10 = t19 - t9;
+    t18 = t15 + t4;
+    t0 = t19 + t9;
+    re[0] = t5;
+    im[0] = t13;
+    re[15] = t14;
+    im[15] = t16;
+    re[30] = t11;
+    im[30] = t3;
+    re[45] = t18;
+    im[45] = t0;
+    re[60] = t7;
+    im[60] = t1;
+    re[75] = t6;
+    im[75] = t8;
+    re[90] = t2;
+    im[90] = t12;
+    re[105] = t17;
+    im[105] = t10;
+    t15 = X[48];
+    t4 = X[191];
+    t19 = C8 * t15;
+    t9 = C9 * t4;
+    t5 = t19 + t9;
+    t13 = (-C9) * t15;
+    t14 = C8 * t4;
+    t16 = t13 + t14;
+    t11 = X[78];
+    t3 = X[161];
+    t18 = C10 * t11;
+    t0 = C11 * t3;
+    t7 = t18 + t0;
+    t1 = (-C11) * t11;
+    t6 = C10 * t3;
+    t8 = t1 + t6;
+    t2 = X[108];
+    t12 = X[131];
+    t17 = C12 * t2;
+    t10 = C13 * t12;
+    t19 = t17 + t10;
+    t9 = (-C13) * t2;
+    t15 = C12 * t12;
+    t4 = t9 + t15;
+    t13 = X[138];
+    t14 = X[101];
+    t18 = C14 * t13;
+    t0 = C15 * t14;
+    t11 = t18 + t0;
+    t3 = (-C15) * t13;
+    t1 = C14 * t14;
+    t6 = t3 + t1;
+    t17 = X[168];
+    t10 = X[71];
+    t2 = C16 * t17;
+    t12 = C17 * t10;
+    t9 = t2 + t12;
+    t15 = (-C17) * t17;
+    t18 = C16 * t10;
+    t0 = t15 + t18;
+    t13 = X[198];
+    t14 = X[41];
+    t3 = C18 * t13;
+    t1 = C19 * t14;
+    t2 = t3 + t1;
+    t12 = (-C19) * t13;
+    t17 = C18 * t14;
+    t10 = t12 + t17;
+    t15 = X[228];
+    t18 = X[11];
+    t3 = C20 * t15;
+    t1 = C21 * t18;
+    t13 = t3 + t1;
+    t14 = (-C21) * t15;
+    t12 = C20 * t18;
+    t17 = t14 + t12;
+    t3 = X[18];
+    t1 = X[221];
+    t15 = C22 * t3;
+    t18 = C23 * t1;
+    t14 = t15 + t18;
+    t12 = (-C23) * t3;
+    t15 = C22 * t1;
+    t18 = t12 + t15;
+    t3 = t5 + t9;
+    t1 = t16 + t0;
+    t12 = t19 + t13;
+    t15 = t4 + t17;
+    t5 = t5 - t9;
+    t9 = t16 - t0;
+    t16 = t19 - t13;
+    t0 = t4 - t17;
+    t19 = t3 + t12;
+    t13 = t1 + t15;
+    t4 = t5 + t0;
+    t17 = t9 - t16;
+    t3 = t3 - t12;
+    t12 = t1 - t15;
+    t1 = t5 - t0;
+    t15 = t9 + t16;
+    t5 = t7 + t2;
+    t0 = t8 + t10;
+    t9 = t11 + t14;
+    t16 = t6 + t18;
+    t7 = t7 - t2;
+    t2 = t8 - t10;
+    t8 = t11 - t14;
+    t10 = t6 - t18;
+    t11 = t5 + t9;
+    t14 = t0 + t16;
+    t6 = t7 + t10;
+    t18 = t2 - t8;
+    t5 = t5 - t9;
+    t9 = t0 - t16;
+    t0 = t7 - t10;
+    t16 = t2 + t8;
+    t7 = t6 + t18;
+    t10 = t6 - t18;
+    t2 = C6 * t7;
+    t8 = (-C6) * t10;
+    t6 = t0 - t16;
+    t18 = t0 + t16;
+    t7 = (-C6) * t6;
+    t10 = (-C6) * t18;
+    t0 = t19 - t11;
+    t16 = t13 - t14;
+    t6 = t19 + t11;
+    t18 = t13 + t14;
+    t19 = t4 - t2;
+    t11 = t17 - t8;
+    t13 = t4 + t2;
+    t14 = t17 + t8;
+    t4 = t3 - t9;
+    t2 = t12 + t5;
+    t17 = t3 + t9;
+    t8 = t12 - t5;
+    t3 = t1 - t7;
+    t9 = t15 - t10;
+    t12 = t1 + t7;
+    t5 = t15 + t10;
+    re[24] = t6;
+    im[24] = t18;
+    re[39] = t13;
+    im[39] = t14;
+    re[54] = t17;
+    im[54] = t8;
+    re[69] = t12;
+    im[69] = t5;
+    re[84] = t0;
+    im[84] = t16;
+    re[99] = t19;
+    im[99] = t11;
+    re[114] = t4;
+    im[114] = t2;
+    re[9] = t3;
+    im[9] = t9;
+    t1 = X[96];
+    t7 = X[143];
+    t15 = C24 * t1;
+    t10 = C25 * t7;
+    t6 = t15 + t10;
+    t18 = (-C25) * t1;
+    t13 = C24 * t7;
+    t14 = t18 + t13;
+    t17 = X[126];
+    t8 = X[113];
+    t12 = C26 * t17;
+    t5 = C27 * t8;
+    t0 = t12 + t5;
+    t16 = (-C27) * t17;
+    t19 = C26 * t8;
+    t11 = t16 + t19;
+    t4 = X[156];
+    t2 = X[83];
+    t3 = C28 * t4;
+    t9 = C29 * t2;
+    t15 = t3 + t9;
+    t10 = (-C29) * t4;
+    t1 = C28 * t2;
+    t7 = t10 + t1;
+    t18 = X[186];
+    t13 = X[53];
+    t12 = C30 * t18;
+    t5 = C31 * t13;
+    t17 = t12 + t5;
+    t8 = (-C31) * t18;
+    t16 = C30 * t13;
+    t19 = t8 + t16;
+    t3 = X[216];
+    t9 = X[23];
+    t4 = C32 * t3;
+    t2 = C33 * t9;
+    t10 = t4 + t2;
+    t1 = (-C33) * t3;
+    t12 = C32 * t9;
+    t5 = t1 + t12;
+    t18 = X[6];
+    t13 = X[233];
+    t8 = C34 * t18;
+    t16 = C35 * t13;
+    t4 = t8 + t16;
+    t2 = (-C35) * t18;
+    t3 = C34 * t13;
+    t9 = t2 + t3;
+    t1 = X[36];
+    t12 = X[203];
+    t8 = C36 * t1;
+    t16 = C37 * t12;
+    t18 = t8 + t16;
+    t13 = (-C37) * t1;
+    t2 = C36 * t12;
+    t3 = t13 + t2;
+    t8 = X[66];
+    t16 = X[173];
+    t1 = C38 * t8;
+    t12 = C39 * t16;
+    t13 = t1 + t12;
+    t2 = (-C39) * t8;
+    t1 = C38 * t16;
+    t12 = t2 + t1;
+    t8 = t6 + t10;
+    t16 = t14 + t5;
+    t2 = t15 + t18;
+    t1 = t7 + t3;
+    t6 = t6 - t10;
+    t10 = t14 - t5;
+    t14 = t15 - t18;
+    t5 = t7 - t3;
+    t15 = t8 + t2;
+    t18 = t16 + t1;
+    t7 = t6 + t5;
+    t3 = t10 - t14;
+    t8 = t8 - t2;
+    t2 = t16 - t1;
+    t16 = t6 - t5;
+    t1 = t10 + t14;
+    t6 = t0 + t4;
+    t5 = t11 + t9;
+    t10 = t17 + t13;
+    t14 = t19 + t12;
+    t0 = t0 - t4;
+    t4 = t11 - t9;
+    t11 = t17 - t13;
+    t9 = t19 - t12;
+    t17 = t6 + t10;
+    t13 = t5 + t14;
+    t19 = t0 + t9;
+    t12 = t4 - t11;
+    t6 = t6 - t10;
+    t10 = t5 - t14;
+    t5 = t0 - t9;
+    t14 = t4 + t11;
+    t0 = t19 + t12;
+    t9 = t19 - t12;
+    t4 = C6 * t0;
+    t11 = (-C6) * t9;
+    t19 = t5 - t14;
+    t12 = t5 + t14;
+    t0 = (-C6) * t19;
+    t9 = (-C6) * t12;
+    t5 = t15 - t17;
+    t14 = t18 - t13;
+    t19 = t15 + t17;
+    t12 = t18 + t13;
+    t15 = t7 - t4;
+    t17 = t3 - t11;
+    t18 = t7 + t4;
+    t13 = t3 + t11;
+    t7 = t8 - t10;
+    t4 = t2 + t6;
+    t3 = t8 + t10;
+    t11 = t2 - t6;
+    t8 = t16 - t0;
+    t10 = t1 - t9;
+    t2 = t16 + t0;
+    t6 = t1 + t9;
+    re[48] = t19;
+    im[48] = t12;
+    re[63] = t18;
+    im[63] = t13;
+    re[78] = t3;
+    im[78] = t11;
+    re[93] = t2;
+    im[93] = t6;
+    re[108] = t5;
+    im[108] = t14;
+    re[3] = t15;
+    im[3] = t17;
+    re[18] = t7;
+    im[18] = t4;
+    re[33] = t8;
+    im[33] = t10;
+    t16 = X[144];
+    t0 = X[95];
+    t1 = C25 * t16;
+    t9 = C24 * t0;
+    t19 = t1 + t9;
+    t12 = (-C24) * t16;
+    t18 = C25 * t0;
+    t13 = t12 + t18;
+    t3 = X[174];
+    t11 = X[65];
+    t2 = C39 * t3;
+    t6 = C38 * t11;
+    t5 = t2 + t6;
+    t14 = (-C38) * t3;
+    t15 = C39 * t11;
+    t17 = t14 + t15;
+    t7 = X[204];
+    t4 = X[35];
+    t8 = C37 * t7;
+    t10 = C36 * t4;
+    t1 = t8 + t10;
+    t9 = (-C36) * t7;
+    t16 = C37 * t4;
+    t0 = t9 + t16;
+    t12 = X[234];
+    t18 = X[5];
+    t2 = C35 * t12;
+    t6 = C34 * t18;
+    t3 = t2 + t6;
+    t11 = (-C34) * t12;
+    t14 = C35 * t18;
+    t15 = t11 + t14;
+    t8 = X[24];
+    t10 = X[215];
+    t7 = C33 * t8;
+    t4 = C32 * t10;
+    t9 = t7 + t4;
+    t16 = (-C32) * t8;
+    t2 = C33 * t10;
+    t6 = t16 + t2;
+    t12 = X[54];
+    t18 = X[185];
+    t11 = C31 * t12;
+    t14 = C30 * t18;
+    t7 = t11 + t14;
+    t4 = (-C30) * t12;
+    t8 = C31 * t18;
+    t10 = t4 + t8;
+    t16 = X[84];
+    t2 = X[155];
+    t11 = C29 * t16;
+    t14 = C28 * t2;
+    t12 = t11 + t14;
+    t18 = (-C28) * t16;
+    t4 = C29 * t2;
+    t8 = t18 + t4;
+    t11 = X[114];
+    t14 = X[125];
+    t16 = C27 * t11;
+    t2 = C26 * t14;
+    t18 = t16 + t2;
+    t4 = (-C26) * t11;
+    t16 = C27 * t14;
+    t2 = t4 + t16;
+    t11 = t19 + t9;
+    t14 = t13 + t6;
+    t4 = t1 + t12;
+    t16 = t0 + t8;
+    t19 = t19 - t9;
+    t9 = t13 - t6;
+    t13 = t1 - t12;
+    t6 = t0 - t8;
+    t1 = t11 + t4;
+    t12 = t14 + t16;
+    t0 = t19 + t6;
+    t8 = t9 - t13;
+    t11 = t11 - t4;
+    t4 = t14 - t16;
+    t14 = t19 - t6;
+    t16 = t9 + t13;
+    t19 = t5 + t7;
+    t6 = t17 + t10;
+    t9 = t3 + t18;
+    t13 = t15 + t2;
+    t5 = t5 - t7;
+    t7 = t17 - t10;
+    t17 = t3 - t18;
+    t10 = t15 - t2;
+    t3 = t19 + t9;
+    t18 = t6 + t13;
+    t15 = t5 + t10;
+    t2 = t7 - t17;
+    t19 = t19 - t9;
+    t9 = t6 - t13;
+    t6 = t5 - t10;
+    t13 = t7 + t17;
+    t5 = t15 + t2;
+    t10 = t15 - t2;
+    t7 = C6 * t5;
+    t17 = (-C6) * t10;
+    t15 = t6 - t13;
+    t2 = t6 + t13;
+    t5 = (-C6) * t15;
+    t10 = (-C6) * t2;
+    t6 = t1 - t3;
+    t13 = t12 - t18;
+    t15 = t1 + t3;
+    t2 = t12 + t18;
+    t1 = t0 - t7;
+    t3 = t8 - t17;
+    t12 = t0 + t7;
+    t18 = t8 + t17;
+    t0 = t11 - t9;
+    t7 = t4 + t19;
+    t8 = t11 + t9;
+    t17 = t4 - t19;
+    t11 = t14 - t5;
+    t9 = t16 - t10;
+    t4 = t14 + t5;
+    t19 = t16 + t10;
+    re[72] = t15;
+    im[72] = t2;
+    re[87] = t12;
+    im[87] = t18;
+    re[102] = t8;
+    im[102] = t17;
+    re[117] = t4;
+    im[117] = t19;
+    re[12] = t6;
+    im[12] = t13;
+    re[27] = t1;
+    im[27] = t3;
+    re[42] = t0;
+    im[42] = t7;
+    re[57] = t11;
+    im[57] = t9;
+    t14 = X[192];
+    t5 = X[47];
+    t16 = C9 * t14;
+    t10 = C8 * t5;
+    t15 = t16 + t10;
+    t2 = (-C8) * t14;
+    t12 = C9 * t5;
+    t18 = t2 + t12;
+    t8 = X[222];
+    t17 = X[17];
+    t4 = C23 * t8;
+    t19 = C22 * t17;
+    t6 = t4 + t19;
+    t13 = (-C22) * t8;
+    t1 = C23 * t17;
+    t3 = t13 + t1;
+    t0 = X[12];
+    t7 = X[227];
+    t11 = C21 * t0;
+    t9 = C20 * t7;
+    t16 = t11 + t9;
+    t10 = (-C20) * t0;
+    t14 = C21 * t7;
+    t5 = t10 + t14;
+    t2 = X[42];
+    t12 = X[197];
+    t4 = C19 * t2;
+    t19 = C18 * t12;
+    t8 = t4 + t19;
+    t17 = (-C18) * t2;
+    t13 = C19 * t12;
+    t1 = t17 + t13;
+    t11 = X[72];
+    t9 = X[167];
+    t0 = C17 * t11;
+    t7 = C16 * t9;
+    t10 = t0 + t7;
+    t14 = (-C16) * t11;
+    t4 = C17 * t9;
+    t19 = t14 + t4;
+    t2 = X[102];
+    t12 = X[137];
+    t17 = C15 * t2;
+    t13 = C14 * t12;
+    t0 = t17 + t13;
+    t7 = (-C14) * t2;
+    t11 = C15 * t12;
+    t9 = t7 + t11;
+    t14 = X[132];
+    t4 = X[107];
+    t17 = C13 * t14;
+    t13 = C12 * t4;
+    t2 = t17 + t13;
+    t12 = (-C12) * t14;
+    t7 = C13 * t4;
+    t11 = t12 + t7;
+    t17 = X[162];
+    t13 = X[77];
+    t14 = C11 * t17;
+    t4 = C10 * t13;
+    t12 = t14 + t4;
+    t7 = (-C10) * t17;
+    t14 = C11 * t13;
+    t4 = t7 + t14;
+    t17 = t15 + t10;
+    t13 = t18 + t19;
+    t7 = t16 + t2;
+    t14 = t5 + t11;
+    t15 = t15 - t10;
+    t10 = t18 - t19;
+    t18 = t16 - t2;
+    t19 = t5 - t11;
+    t16 = t17 + t7;
+    t2 = t13 + t14;
+    t5 = t15 + t19;
+    t11 = t10 - t18;
+    t17 = t17 - t7;
+    t7 = t13 - t14;
+    t13 = t15 - t19;
+    t14 = t10 + t18;
+    t15 = t6 + t0;
+    t19 = t3 + t9;
+    t10 = t8 + t12;
+    t18 = t1 + t4;
+    t6 = t6 - t0;
+    t0 = t3 - t9;
+    t3 = t8 - t12;
+    t9 = t1 - t4;
+    t8 = t15 + t10;
+    t12 = t19 + t18;
+    t1 = t6 + t9;
+    t4 = t0 - t3;
+    t15 = t15 - t10;
+    t10 = t19 - t18;
+    t19 = t6 - t9;
+    t18 = t0 + t3;
+    t6 = t1 + t4;
+    t9 = t1 - t4;
+    t0 = C6 * t6;
+    t3 = (-C6) * t9;
+    t1 = t19 - t18;
+    t4 = t19 + t18;
+    t6 = (-C6) * t1;
+    t9 = (-C6) * t4;
+    t19 = t16 - t8;
+    t18 = t2 - t12;
+    t1 = t16 + t8;
+    t4 = t2 + t12;
+    t16 = t5 - t0;
+    t8 = t11 - t3;
+    t2 = t5 + t0;
+    t12 = t11 + t3;
+    t5 = t17 - t10;
+    t0 = t7 + t15;
+    t11 = t17 + t10;
+    t3 = t7 - t15;
+    t17 = t13 - t6;
+    t10 = t14 - t9;
+    t7 = t13 + t6;
+    t15 = t14 + t9;
+    re[96] = t1;
+    im[96] = t4;
+    re[111] = t2;
+    im[111] = t12;
+    re[6] = t11;
+    im[6] = t3;
+    re[21] = t7;
+    im[21] = t15;
+    re[36] = t19;
+    im[36] = t18;
+    re[51] = t16;
+    im[51] = t8;
+    re[66] = t5;
+    im[66] = t0;
+    re[81] = t17;
+    im[81] = t10;
+    t13 = re[0];
+    t6 = im[0];
+    t14 = re[24];
+    t9 = im[24];
+    t1 = re[48];
+    t4 = im[48];
+    t2 = re[72];
+    t12 = im[72];
+    t11 = re[96];
+    t3 = im[96];
+    t7 = t14 + t11;
+    t15 = t9 + t3;
+    t19 = t1 + t2;
+    t18 = t4 + t12;
+    t16 = t14 - t11;
+    t8 = t9 - t3;
+    t5 = t1 - t2;
+    t0 = t4 - t12;
+    t17 = t7 + t19;
+    t10 = t15 + t18;
+    t14 = t7 - t19;
+    t11 = C40 * t14;
+    t9 = t15 - t18;
+    t3 = C40 * t9;
+    t1 = C41 * t17;
+    t2 = t13 - t1;
+    t4 = C41 * t10;
+    t12 = t6 - t4;
+    t7 = t2 + t11;
+    t19 = t12 + t3;
+    t14 = t2 - t11;
+    t15 = t12 - t3;
+    t18 = C8 * t16;
+    t9 = C25 * t5;
+    t1 = t18 + t9;
+    t4 = C8 * t8;
+    t2 = C25 * t0;
+    t11 = t4 + t2;
+    t12 = C25 * t16;
+    t3 = C8 * t5;
+    t18 = t12 - t3;
+    t9 = C25 * t8;
+    t4 = C8 * t0;
+    t2 = t9 - t4;
+    t16 = t13 + t17;
+    t5 = t6 + t10;
+    t12 = t7 + t11;
+    t3 = t19 - t1;
+    t8 = t14 + t2;
+    t0 = t15 - t18;
+    t9 = t14 - t2;
+    t4 = t15 + t18;
+    t13 = t7 - t11;
+    t17 = t19 + t1;
+    re[0] = t16;
+    im[0] = t5;
+    re[24] = t12;
+    im[24] = t3;
+    re[48] = t8;
+    im[48] = t0;
+    re[72] = t9;
+    im[72] = t4;
+    re[96] = t13;
+    im[96] = t17;
+    t6 = re[15];
+    t10 = im[15];
+    t14 = re[39];
+    t2 = im[39];
+    t15 = re[63];
+    t18 = im[63];
+    t7 = re[87];
+    t11 = im[87];
+    t19 = re[111];
+    t1 = im[111];
+    t16 = t14 + t19;
+    t5 = t2 + t1;
+    t12 = t15 + t7;
+    t3 = t18 + t11;
+    t8 = t14 - t19;
+    t0 = t2 - t1;
+    t9 = t15 - t7;
+    t4 = t18 - t11;
+    t13 = t16 + t12;
+    t17 = t5 + t3;
+    t14 = t16 - t12;
+    t19 = C40 * t14;
+    t2 = t5 - t3;
+    t1 = C40 * t2;
+    t15 = C41 * t13;
+    t7 = t6 - t15;
+    t18 = C41 * t17;
+    t11 = t10 - t18;
+    t16 = t7 + t19;
+    t12 = t11 + t1;
+    t14 = t7 - t19;
+    t5 = t11 - t1;
+    t3 = C8 * t8;
+    t2 = C25 * t9;
+    t15 = t3 + t2;
+    t18 = C8 * t0;
+    t7 = C25 * t4;
+    t19 = t18 + t7;
+    t11 = C25 * t8;
+    t1 = C8 * t9;
+    t3 = t11 - t1;
+    t2 = C25 * t0;
+    t18 = C8 * t4;
+    t7 = t2 - t18;
+    t8 = t6 + t13;
+    t9 = t10 + t17;
+    t11 = t16 + t19;
+    t1 = t12 - t15;
+    t0 = t14 + t7;
+    t4 = t5 - t3;
+    t2 = t14 - t7;
+    t18 = t5 + t3;
+    t6 = t16 - t19;
+    t13 = t12 + t15;
+    re[15] = t8;
+    im[15] = t9;
+    re[39] = t11;
+    im[39] = t1;
+    re[63] = t0;
+    im[63] = t4;
+    re[87] = t2;
+    im[87] = t18;
+    re[111] = t6;
+    im[111] = t13;
+    t10 = re[30];
+    t17 = im[30];
+    t14 = re[54];
+    t7 = im[54];
+    t5 = re[78];
+    t3 = im[78];
+    t16 = re[102];
+    t19 = im[102];
+    t12 = re[6];
+    t15 = im[6];
+    t8 = t14 + t12;
+    t9 = t7 + t15;
+    t11 = t5 + t16;
+    t1 = t3 + t19;
+    t0 = t14 - t12;
+    t4 = t7 - t15;
+    t2 = t5 - t16;
+    t18 = t3 - t19;
+    t6 = t8 + t11;
+    t13 = t9 + t1;
+    t14 = t8 - t11;
+    t12 = C40 * t14;
+    t7 = t9 - t1;
+    t15 = C40 * t7;
+    t5 = C41 * t6;
+    t16 = t10 - t5;
+    t3 = C41 * t13;
+    t19 = t17 - t3;
+    t8 = t16 + t12;
+    t11 = t19 + t15;
+    t14 = t16 - t12;
+    t9 = t19 - t15;
+    t1 = C8 * t0;
+    t7 = C25 * t2;
+    t5 = t1 + t7;
+    t3 = C8 * t4;
+    t16 = C25 * t18;
+    t12 = t3 + t16;
+    t19 = C25 * t0;
+    t15 = C8 * t2;
+    t1 = t19 - t15;
+    t7 = C25 * t4;
+    t3 = C8 * t18;
+    t16 = t7 - t3;
+    t0 = t10 + t6;
+    t2 = t17 + t13;
+    t19 = t8 + t12;
+    t15 = t11 - t5;
+    t4 = t14 + t16;
+    t18 = t9 - t1;
+    t7 = t14 - t16;
+    t3 = t9 + t1;
+    t10 = t8 - t12;
+    t6 = t11 + t5;
+    re[30] = t0;
+    im[30] = t2;
+    re[54] = t19;
+    im[54] = t15;
+    re[78] = t4;
+    im[78] = t18;
+    re[102] = t7;
+    im[102] = t3;
+    re[6] = t10;
+    im[6] = t6;
+    t17 = re[45];
+    t13 = im[45];
+    t14 = re[69];
+    t16 = im[69];
+    t9 = re[93];
+    t1 = im[93];
+    t8 = re[117];
+    t12 = im[117];
+    t11 = re[21];
+    t5 = im[21];
+    t0 = t14 + t11;
+    t2 = t16 + t5;
+    t19 = t9 + t8;
+    t15 = t1 + t12;
+    t4 = t14 - t11;
+    t18 = t16 - t5;
+    t7 = t9 - t8;
+    t3 = t1 - t12;
+    t10 = t0 + t19;
+    t6 = t2 + t15;
+    t14 = t0 - t19;
+    t11 = C40 * t14;
+    t16 = t2 - t15;
+    t5 = C40 * t16;
+    t9 = C41 * t10;
+    t8 = t17 - t9;
+    t1 = C41 * t6;
+    t12 = t13 - t1;
+    t0 = t8 + t11;
+    t19 = t12 + t5;
+    t14 = t8 - t11;
+    t2 = t12 - t5;
+    t15 = C8 * t4;
+    t16 = C25 * t7;
+    t9 = t15 + t16;
+    t1 = C8 * t18;
+    t8 = C25 * t3;
+    t11 = t1 + t8;
+    t12 = C25 * t4;
+    t5 = C8 * t7;
+    t15 = t12 - t5;
+    t16 = C25 * t18;
+    t1 = C8 * t3;
+    t8 = t16 - t1;
+    t4 = t17 + t10;
+    t7 = t13 + t6;
+    t12 = t0 + t11;
+    t5 = t19 - t9;
+    t18 = t14 + t8;
+    t3 = t2 - t15;
+    t16 = t14 - t8;
+    t1 = t2 + t15;
+    t17 = t0 - t11;
+    t10 = t19 + t9;
+    re[45] = t4;
+    im[45] = t7;
+    re[69] = t12;
+    im[69] = t5;
+    re[93] = t18;
+    im[93] = t3;
+    re[117] = t16;
+    im[117] = t1;
+    re[21] = t17;
+    im[21] = t10;
+    t13 = re[60];
+    t6 = im[60];
+    t14 = re[84];
+    t8 = im[84];
+    t2 = re[108];
+    t15 = im[108];
+    t0 = re[12];
+    t11 = im[12];
+    t19 = re[36];
+    t9 = im[36];
+    t4 = t14 + t19;
+    t7 = t8 + t9;
+    t12 = t2 + t0;
+    t5 = t15 + t11;
+    t18 = t14 - t19;
+    t3 = t8 - t9;
+    t16 = t2 - t0;
+    t1 = t15 - t11;
+    t17 = t4 + t12;
+    t10 = t7 + t5;
+    t14 = t4 - t12;
+    t19 = C40 * t14;
+    t8 = t7 - t5;
+    t9 = C40 * t8;
+    t2 = C41 * t17;
+    t0 = t13 - t2;
+    t15 = C41 * t10;
+    t11 = t6 - t15;
+    t4 = t0 + t19;
+    t12 = t11 + t9;
+    t14 = t0 - t19;
+    t7 = t11 - t9;
+    t5 = C8 * t18;
+    t8 = C25 * t16;
+    t2 = t5 + t8;
+    t15 = C8 * t3;
+    t0 = C25 * t1;
+    t19 = t15 + t0;
+    t11 = C25 * t18;
+    t9 = C8 * t16;
+    t5 = t11 - t9;
+    t8 = C25 * t3;
+    t15 = C8 * t1;
+    t0 = t8 - t15;
+    t18 = t13 + t17;
+    t16 = t6 + t10;
+    t11 = t4 + t19;
+    t9 = t12 - t2;
+    t3 = t14 + t0;
+    t1 = t7 - t5;
+    t8 = t14 - t0;
+    t15 = t7 + t5;
+    t13 = t4 - t19;
+    t17 = t12 + t2;
+    re[60] = t18;
+    im[60] = t16;
+    re[84] = t11;
+    im[84] = t9;
+    re[108] = t3;
+    im[108] = t1;
+    re[12] = t8;
+    im[12] = t15;
+    re[36] = t13;
+    im[36] = t17;
+    t6 = re[75];
+    t10 = im[75];
+    t14 = re[99];
+    t0 = im[99];
+    t7 = re[3];
+    t5 = im[3];
+    t4 = re[27];
+    t19 = im[27];
+    t12 = re[51];
+    t2 = im[51];
+    t18 = t14 + t12;
+    t16 = t0 + t2;
+    t11 = t7 + t4;
+    t9 = t5 + t19;
+    t3 = t14 - t12;
+    t1 = t0 - t2;
+    t8 = t7 - t4;
+    t15 = t5 - t19;
+    t13 = t18 + t11;
+    t17 = t16 + t9;
+    t14 = t18 - t11;
+    t12 = C40 * t14;
+    t0 = t16 - t9;
+    t2 = C40 * t0;
+    t7 = C41 * t13;
+    t4 = t6 - t7;
+    t5 = C41 * t17;
+    t19 = t10 - t5;
+    t18 = t4 + t12;
+    t11 = t19 + t2;
+    t14 = t4 - t12;
+    t16 = t19 - t2;
+    t9 = C8 * t3;
+    t0 = C25 * t8;
+    t7 = t9 + t0;
+    t5 = C8 * t1;
+    t4 = C25 * t15;
+    t12 = t5 + t4;
+    t19 = C25 * t3;
+    t2 = C8 * t8;
+    t9 = t19 - t2;
+    t0 = C25 * t1;
+    t5 = C8 * t15;
+    t4 = t0 - t5;
+    t3 = t6 + t13;
+    t8 = t10 + t17;
+    t19 = t18 + t12;
+    t2 = t11 - t7;
+    t1 = t14 + t4;
+    t15 = t16 - t9;
+    t0 = t14 - t4;
+    t5 = t16 + t9;
+    t6 = t18 - t12;
+    t13 = t11 + t7;
+    re[75] = t3;
+    im[75] = t8;
+    re[99] = t19;
+    im[99] = t2;
+    re[3] = t1;
+    im[3] = t15;
+    re[27] = t0;
+    im[27] = t5;
+    re[51] = t6;
+    im[51] = t13;
+    t10 = re[90];
+    t17 = im[90];
+    t14 = re[114];
+    t4 = im[114];
+    t16 = re[18];
+    t9 = im[18];
+    t18 = re[42];
+    t12 = im[42];
+    t11 = re[66];
+    t7 = im[66];
+    t3 = t14 + t11;
+    t8 = t4 + t7;
+    t19 = t16 + t18;
+    t2 = t9 + t12;
+    t1 = t14 - t11;
+    t15 = t4 - t7;
+    t0 = t16 - t18;
+    t5 = t9 - t12;
+    t6 = t3 + t19;
+    t13 = t8 + t2;
+    t14 = t3 - t19;
+    t11 = C40 * t14;
+    t4 = t8 - t2;
+    t7 = C40 * t4;
+    t16 = C41 * t6;
+    t18 = t10 - t16;
+    t9 = C41 * t13;
+    t12 = t17 - t9;
+    t3 = t18 + t11;
+    t19 = t12 + t7;
+    t14 = t18 - t11;
+    t8 = t12 - t7;
+    t2 = C8 * t1;
+    t4 = C25 * t0;
+    t16 = t2 + t4;
+    t9 = C8 * t15;
+    t18 = C25 * t5;
+    t11 = t9 + t18;
+    t12 = C25 * t1;
+    t7 = C8 * t0;
+    t2 = t12 - t7;
+    t4 = C25 * t15;
+    t9 = C8 * t5;
+    t18 = t4 - t9;
+    t1 = t10 + t6;
+    t0 = t17 + t13;
+    t12 = t3 + t11;
+    t7 = t19 - t16;
+    t15 = t14 + t18;
+    t5 = t8 - t2;
+    t4 = t14 - t18;
+    t9 = t8 + t2;
+    t10 = t3 - t11;
+    t6 = t19 + t16;
+    re[90] = t1;
+    im[90] = t0;
+    re[114] = t12;
+    im[114] = t7;
+    re[18] = t15;
+    im[18] = t5;
+    re[42] = t4;
+    im[42] = t9;
+    re[66] = t10;
+    im[66] = t6;
+    t17 = re[105];
+    t13 = im[105];
+    t14 = re[9];
+    t18 = im[9];
+    t8 = re[33];
+    t2 = im[33];
+    t3 = re[57];
+    t11 = im[57];
+    t19 = re[81];
+    t16 = im[81];
+    t1 = t14 + t19;
+    t0 = t18 + t16;
+    t12 = t8 + t3;
+    t7 = t2 + t11;
+    t15 = t14 - t19;
+    t5 = t18 - t16;
+    t4 = t8 - t3;
+    t9 = t2 - t11;
+    t10 = t1 + t12;
+    t6 = t0 + t7;
+    t14 = t1 - t12;
+    t19 = C40 * t14;
+    t18 = t0 - t7;
+    t16 = C40 * t18;
+    t8 = C41 * t10;
+    t3 = t17 - t8;
+    t2 = C41 * t6;
+    t11 = t13 - t2;
+    t1 = t3 + t19;
+    t12 = t11 + t16;
+    t14 = t3 - t19;
+    t0 = t11 - t16;
+    t7 = C8 * t15;
+    t18 = C25 * t4;
+    t8 = t7 + t18;
+    t2 = C8 * t5;
+    t3 = C25 * t9;
+    t19 = t2 + t3;
+    t11 = C25 * t15;
+    t16 = C8 * t4;
+    t7 = t11 - t16;
+    t18 = C25 * t5;
+    t2 = C8 * t9;
+    t3 = t18 - t2;
+    t15 = t17 + t10;
+    t4 = t13 + t6;
+    t11 = t1 + t19;
+    t16 = t12 - t8;
+    t5 = t14 + t3;
+    t9 = t0 - t7;
+    t18 = t14 - t3;
+    t2 = t0 + t7;
+    t17 = t1 - t19;
+    t10 = t12 + t8;
+    re[105] = t15;
+    im[105] = t4;
+    re[9] = t11;
+    im[9] = t16;
+    re[33] = t5;
+    im[33] = t9;
+    re[57] = t18;
+    im[57] = t2;
+    re[81] = t17;
+    im[81] = t10;
+}
+
+/**
+ *  Part 2 of ApplyWindowedIMDCT_W75_240().
+ * 
+ *  @param {Number[]} X 
+ *    - The input block (240 points).
+ *  @param {Number[]} y 
+ *    - The array that would contain the output block (480 points).
+ *  @param {Number[]} re 
+ *    - The scratch buffer (real part, 120 points).
+ *  @param {Number[]} im 
+ *    - The scratch buffer (imaginary part, 120 points).
+ */
+function ApplyWindowedIMDCT_W75_240_Part2(X, y, re, im) {
+    let t0, t1, t10, t11, t12, t13, t14, t15, t16, t17, t18, t19, t2, t3, t4, t5, t6, t7, t8, t9;
+    const C0 = 0.8660254037844387;
+    const C1 = 0.49999999999999994;
+    const C2 = 0.7518398074789774;
+    const C3 = 0.6593458151000688;
+    const C4 = 0.6087614290087207;
+    const C5 = 0.7933533402912352;
+    const C6 = 0.4422886902190013;
+    const C7 = 0.8968727415326883;
+    const C8 = 0.25881904510252074;
+    const C9 = 0.9659258262890683;
+    const C10 = 0.06540312923014306;
+    const C11 = 0.9978589232386035;
+    const C12 = 0.9914448613738104;
+    const C13 = 0.13052619222005157;
+    const C14 = 0.9469301294951057;
+    const C15 = 0.3214394653031616;
+    const C16 = 0.7071067811865476;
+    const C17 = 0.6691306063588582;
+    const C18 = 0.7431448254773942;
+    const C19 = 0.5112930860770522;
+    const C20 = 0.8594064115014527;
+    const C21 = 0.33380685923377096;
+    const C22 = 0.9426414910921784;
+    const C23 = 0.1434926219911793;
+    const C24 = 0.9896513868196702;
+    const C25 = 0.9986295347545738;
+    const C26 = 0.05233595624294383;
+    const C27 = 0.9692309097067544;
+    const C28 = 0.24615329302899303;
+    const C29 = 0.9025852843498606;
+    const C30 = 0.4305110968082951;
+    const C31 = 0.8012538126910607;
+    const C32 = 0.598324600570659;
+    const C33 = 0.40673664307580015;
+    const C34 = 0.9135454576426009;
+    const C35 = 0.22069743502150108;
+    const C36 = 0.9753423205085127;
+    const C37 = 0.02617694830787315;
+    const C38 = 0.9996573249755573;
+    const C39 = 0.9855560590580777;
+    const C40 = 0.1693495038490246;
+    const C41 = 0.9335804264972017;
+    const C42 = 0.35836794954530027;
+    const C43 = 0.8457278217039733;
+    const C44 = 0.5336145159156115;
+    const C45 = 0.7253743710122876;
+    const C46 = 0.6883545756937539;
+    const C47 = 0.5771451900372336;
+    const C48 = 0.8166415551616789;
+    const C49 = 0.10452846326765346;
+    const C50 = 0.9945218953682733;
+    const C51 = 0.9958049275746618;
+    const C52 = 0.09150161866340238;
+    const C53 = 0.958819734868193;
+    const C54 = 0.2840153447039226;
+    const C55 = 0.8849876374630419;
+    const C56 = 0.4656145203251114;
+    const C57 = 0.7771459614569709;
+    const C58 = 0.6293203910498375;
+    const C59 = 0.6394390019805847;
+    const C60 = 0.7688418320734596;
+    const C61 = 0.4771587602596084;
+    const C62 = 0.8788171126619654;
+    const C63 = 0.296541574975571;
+    const C64 = 0.9550199444571866;
+    const C65 = 0.9781476007338057;
+    const C66 = 0.20791169081775931;
+    const C67 = 0.9187912101488983;
+    const C68 = 0.39474385638426723;
+    const C69 = 0.8241261886220156;
+    const C70 = 0.5664062369248328;
+    const C71 = 0.6977904598416801;
+    const C72 = 0.7163019434246544;
+    const C73 = 0.544639035015027;
+    const C74 = 0.838670567945424;
+    const C75 = 0.3705574375098362;
+    const C76 = 0.9288095528719242;
+    const C77 = 0.18223552549214747;
+    const C78 = 0.9832549075639546;
+    const C79 = 0.999914327574007;
+    const C80 = 0.01308959557134444;
+    const C81 = 0.5590169943749475;
+    const C82 = 0.25;
+    const C83 = 0.9510565162951535;
+    const C84 = 0.5877852522924731;
+    t13 = X[80];
+    t6 = X[159];
+    t14 = C0 * t13;
+    t3 = C1 * t6;
+    t0 = t14 + t3;
+    t7 = (-C1) * t13;
+    t1 = C0 * t6;
+    t19 = t7 + t1;
+    t12 = X[110];
+    t8 = X[129];
+    t15 = C2 * t12;
+    t4 = C3 * t8;
+    t11 = t15 + t4;
+    t16 = (-C3) * t12;
+    t5 = C2 * t8;
+    t9 = t16 + t5;
+    t18 = X[140];
+    t2 = X[99];
+    t17 = C4 * t18;
+    t10 = C5 * t2;
+    t14 = t17 + t10;
+    t3 = (-C5) * t18;
+    t13 = C4 * t2;
+    t6 = t3 + t13;
+    t7 = X[170];
+    t1 = X[69];
+    t15 = C6 * t7;
+    t4 = C7 * t1;
+    t12 = t15 + t4;
+    t8 = (-C7) * t7;
+    t16 = C6 * t1;
+    t5 = t8 + t16;
+    t17 = X[200];
+    t10 = X[39];
+    t18 = C8 * t17;
+    t2 = C9 * t10;
+    t3 = t18 + t2;
+    t13 = (-C9) * t17;
+    t15 = C8 * t10;
+    t4 = t13 + t15;
+    t7 = X[230];
+    t1 = X[9];
+    t8 = C10 * t7;
+    t16 = C11 * t1;
+    t18 = t8 + t16;
+    t2 = (-C11) * t7;
+    t17 = C10 * t1;
+    t10 = t2 + t17;
+    t13 = X[20];
+    t15 = X[219];
+    t8 = C12 * t13;
+    t16 = C13 * t15;
+    t7 = t8 + t16;
+    t1 = (-C13) * t13;
+    t2 = C12 * t15;
+    t17 = t1 + t2;
+    t8 = X[50];
+    t16 = X[189];
+    t13 = C14 * t8;
+    t15 = C15 * t16;
+    t1 = t13 + t15;
+    t2 = (-C15) * t8;
+    t13 = C14 * t16;
+    t15 = t2 + t13;
+    t8 = t0 + t3;
+    t16 = t19 + t4;
+    t2 = t14 + t7;
+    t13 = t6 + t17;
+    t0 = t0 - t3;
+    t3 = t19 - t4;
+    t19 = t14 - t7;
+    t4 = t6 - t17;
+    t14 = t8 + t2;
+    t7 = t16 + t13;
+    t6 = t0 + t4;
+    t17 = t3 - t19;
+    t8 = t8 - t2;
+    t2 = t16 - t13;
+    t16 = t0 - t4;
+    t13 = t3 + t19;
+    t0 = t11 + t18;
+    t4 = t9 + t10;
+    t3 = t12 + t1;
+    t19 = t5 + t15;
+    t11 = t11 - t18;
+    t18 = t9 - t10;
+    t9 = t12 - t1;
+    t10 = t5 - t15;
+    t12 = t0 + t3;
+    t1 = t4 + t19;
+    t5 = t11 + t10;
+    t15 = t18 - t9;
+    t0 = t0 - t3;
+    t3 = t4 - t19;
+    t4 = t11 - t10;
+    t19 = t18 + t9;
+    t11 = t5 + t15;
+    t10 = t5 - t15;
+    t18 = C16 * t11;
+    t9 = (-C16) * t10;
+    t5 = t4 - t19;
+    t15 = t4 + t19;
+    t11 = (-C16) * t5;
+    t10 = (-C16) * t15;
+    t4 = t14 - t12;
+    t19 = t7 - t1;
+    t5 = t14 + t12;
+    t15 = t7 + t1;
+    t14 = t6 - t18;
+    t12 = t17 - t9;
+    t7 = t6 + t18;
+    t1 = t17 + t9;
+    t6 = t8 - t3;
+    t18 = t2 + t0;
+    t17 = t8 + t3;
+    t9 = t2 - t0;
+    t8 = t16 - t11;
+    t3 = t13 - t10;
+    t2 = t16 + t11;
+    t0 = t13 + t10;
+    re[40] = t5;
+    im[40] = t15;
+    re[55] = t7;
+    im[55] = t1;
+    re[70] = t17;
+    im[70] = t9;
+    re[85] = t2;
+    im[85] = t0;
+    re[100] = t4;
+    im[100] = t19;
+    re[115] = t14;
+    im[115] = t12;
+    re[10] = t6;
+    im[10] = t18;
+    re[25] = t8;
+    im[25] = t3;
+    t16 = X[128];
+    t11 = X[111];
+    t13 = C17 * t16;
+    t10 = C18 * t11;
+    t5 = t13 + t10;
+    t15 = (-C18) * t16;
+    t7 = C17 * t11;
+    t1 = t15 + t7;
+    t17 = X[158];
+    t9 = X[81];
+    t2 = C19 * t17;
+    t0 = C20 * t9;
+    t4 = t2 + t0;
+    t19 = (-C20) * t17;
+    t14 = C19 * t9;
+    t12 = t19 + t14;
+    t6 = X[188];
+    t18 = X[51];
+    t8 = C21 * t6;
+    t3 = C22 * t18;
+    t13 = t8 + t3;
+    t10 = (-C22) * t6;
+    t16 = C21 * t18;
+    t11 = t10 + t16;
+    t15 = X[218];
+    t7 = X[21];
+    t2 = C23 * t15;
+    t0 = C24 * t7;
+    t17 = t2 + t0;
+    t9 = (-C24) * t15;
+    t19 = C23 * t7;
+    t14 = t9 + t19;
+    t8 = X[8];
+    t3 = X[231];
+    t6 = C25 * t8;
+    t18 = C26 * t3;
+    t10 = t6 + t18;
+    t16 = (-C26) * t8;
+    t2 = C25 * t3;
+    t0 = t16 + t2;
+    t15 = X[38];
+    t7 = X[201];
+    t9 = C27 * t15;
+    t19 = C28 * t7;
+    t6 = t9 + t19;
+    t18 = (-C28) * t15;
+    t8 = C27 * t7;
+    t3 = t18 + t8;
+    t16 = X[68];
+    t2 = X[171];
+    t9 = C29 * t16;
+    t19 = C30 * t2;
+    t15 = t9 + t19;
+    t7 = (-C30) * t16;
+    t18 = C29 * t2;
+    t8 = t7 + t18;
+    t9 = X[98];
+    t19 = X[141];
+    t16 = C31 * t9;
+    t2 = C32 * t19;
+    t7 = t16 + t2;
+    t18 = (-C32) * t9;
+    t16 = C31 * t19;
+    t2 = t18 + t16;
+    t9 = t5 + t10;
+    t19 = t1 + t0;
+    t18 = t13 + t15;
+    t16 = t11 + t8;
+    t5 = t5 - t10;
+    t10 = t1 - t0;
+    t1 = t13 - t15;
+    t0 = t11 - t8;
+    t13 = t9 + t18;
+    t15 = t19 + t16;
+    t11 = t5 + t0;
+    t8 = t10 - t1;
+    t9 = t9 - t18;
+    t18 = t19 - t16;
+    t19 = t5 - t0;
+    t16 = t10 + t1;
+    t5 = t4 + t6;
+    t0 = t12 + t3;
+    t10 = t17 + t7;
+    t1 = t14 + t2;
+    t4 = t4 - t6;
+    t6 = t12 - t3;
+    t12 = t17 - t7;
+    t3 = t14 - t2;
+    t17 = t5 + t10;
+    t7 = t0 + t1;
+    t14 = t4 + t3;
+    t2 = t6 - t12;
+    t5 = t5 - t10;
+    t10 = t0 - t1;
+    t0 = t4 - t3;
+    t1 = t6 + t12;
+    t4 = t14 + t2;
+    t3 = t14 - t2;
+    t6 = C16 * t4;
+    t12 = (-C16) * t3;
+    t14 = t0 - t1;
+    t2 = t0 + t1;
+    t4 = (-C16) * t14;
+    t3 = (-C16) * t2;
+    t0 = t13 - t17;
+    t1 = t15 - t7;
+    t14 = t13 + t17;
+    t2 = t15 + t7;
+    t13 = t11 - t6;
+    t17 = t8 - t12;
+    t15 = t11 + t6;
+    t7 = t8 + t12;
+    t11 = t9 - t10;
+    t6 = t18 + t5;
+    t8 = t9 + t10;
+    t12 = t18 - t5;
+    t9 = t19 - t4;
+    t10 = t16 - t3;
+    t18 = t19 + t4;
+    t5 = t16 + t3;
+    re[64] = t14;
+    im[64] = t2;
+    re[79] = t15;
+    im[79] = t7;
+    re[94] = t8;
+    im[94] = t12;
+    re[109] = t18;
+    im[109] = t5;
+    re[4] = t0;
+    im[4] = t1;
+    re[19] = t13;
+    im[19] = t17;
+    re[34] = t11;
+    im[34] = t6;
+    re[49] = t9;
+    im[49] = t10;
+    t19 = X[176];
+    t4 = X[63];
+    t16 = C33 * t19;
+    t3 = C34 * t4;
+    t14 = t16 + t3;
+    t2 = (-C34) * t19;
+    t15 = C33 * t4;
+    t7 = t2 + t15;
+    t8 = X[206];
+    t12 = X[33];
+    t18 = C35 * t8;
+    t5 = C36 * t12;
+    t0 = t18 + t5;
+    t1 = (-C36) * t8;
+    t13 = C35 * t12;
+    t17 = t1 + t13;
+    t11 = X[236];
+    t6 = X[3];
+    t9 = C37 * t11;
+    t10 = C38 * t6;
+    t16 = t9 + t10;
+    t3 = (-C38) * t11;
+    t19 = C37 * t6;
+    t4 = t3 + t19;
+    t2 = X[26];
+    t15 = X[213];
+    t18 = C39 * t2;
+    t5 = C40 * t15;
+    t8 = t18 + t5;
+    t12 = (-C40) * t2;
+    t1 = C39 * t15;
+    t13 = t12 + t1;
+    t9 = X[56];
+    t10 = X[183];
+    t11 = C41 * t9;
+    t6 = C42 * t10;
+    t3 = t11 + t6;
+    t19 = (-C42) * t9;
+    t18 = C41 * t10;
+    t5 = t19 + t18;
+    t2 = X[86];
+    t15 = X[153];
+    t12 = C43 * t2;
+    t1 = C44 * t15;
+    t11 = t12 + t1;
+    t6 = (-C44) * t2;
+    t9 = C43 * t15;
+    t10 = t6 + t9;
+    t19 = X[116];
+    t18 = X[123];
+    t12 = C45 * t19;
+    t1 = C46 * t18;
+    t2 = t12 + t1;
+    t15 = (-C46) * t19;
+    t6 = C45 * t18;
+    t9 = t15 + t6;
+    t12 = X[146];
+    t1 = X[93];
+    t19 = C47 * t12;
+    t18 = C48 * t1;
+    t15 = t19 + t18;
+    t6 = (-C48) * t12;
+    t19 = C47 * t1;
+    t18 = t6 + t19;
+    t12 = t14 + t3;
+    t1 = t7 + t5;
+    t6 = t16 + t2;
+    t19 = t4 + t9;
+    t14 = t14 - t3;
+    t3 = t7 - t5;
+    t7 = t16 - t2;
+    t5 = t4 - t9;
+    t16 = t12 + t6;
+    t2 = t1 + t19;
+    t4 = t14 + t5;
+    t9 = t3 - t7;
+    t12 = t12 - t6;
+    t6 = t1 - t19;
+    t1 = t14 - t5;
+    t19 = t3 + t7;
+    t14 = t0 + t11;
+    t5 = t17 + t10;
+    t3 = t8 + t15;
+    t7 = t13 + t18;
+    t0 = t0 - t11;
+    t11 = t17 - t10;
+    t17 = t8 - t15;
+    t10 = t13 - t18;
+    t8 = t14 + t3;
+    t15 = t5 + t7;
+    t13 = t0 + t10;
+    t18 = t11 - t17;
+    t14 = t14 - t3;
+    t3 = t5 - t7;
+    t5 = t0 - t10;
+    t7 = t11 + t17;
+    t0 = t13 + t18;
+    t10 = t13 - t18;
+    t11 = C16 * t0;
+    t17 = (-C16) * t10;
+    t13 = t5 - t7;
+    t18 = t5 + t7;
+    t0 = (-C16) * t13;
+    t10 = (-C16) * t18;
+    t5 = t16 - t8;
+    t7 = t2 - t15;
+    t13 = t16 + t8;
+    t18 = t2 + t15;
+    t16 = t4 - t11;
+    t8 = t9 - t17;
+    t2 = t4 + t11;
+    t15 = t9 + t17;
+    t4 = t12 - t3;
+    t11 = t6 + t14;
+    t9 = t12 + t3;
+    t17 = t6 - t14;
+    t12 = t1 - t0;
+    t3 = t19 - t10;
+    t6 = t1 + t0;
+    t14 = t19 + t10;
+    re[88] = t13;
+    im[88] = t18;
+    re[103] = t2;
+    im[103] = t15;
+    re[118] = t9;
+    im[118] = t17;
+    re[13] = t6;
+    im[13] = t14;
+    re[28] = t5;
+    im[28] = t7;
+    re[43] = t16;
+    im[43] = t8;
+    re[58] = t4;
+    im[58] = t11;
+    re[73] = t12;
+    im[73] = t3;
+    t1 = X[224];
+    t0 = X[15];
+    t19 = C49 * t1;
+    t10 = C50 * t0;
+    t13 = t19 + t10;
+    t18 = (-C50) * t1;
+    t2 = C49 * t0;
+    t15 = t18 + t2;
+    t9 = X[14];
+    t17 = X[225];
+    t6 = C51 * t9;
+    t14 = C52 * t17;
+    t5 = t6 + t14;
+    t7 = (-C52) * t9;
+    t16 = C51 * t17;
+    t8 = t7 + t16;
+    t4 = X[44];
+    t11 = X[195];
+    t12 = C53 * t4;
+    t3 = C54 * t11;
+    t19 = t12 + t3;
+    t10 = (-C54) * t4;
+    t1 = C53 * t11;
+    t0 = t10 + t1;
+    t18 = X[74];
+    t2 = X[165];
+    t6 = C55 * t18;
+    t14 = C56 * t2;
+    t9 = t6 + t14;
+    t17 = (-C56) * t18;
+    t7 = C55 * t2;
+    t16 = t17 + t7;
+    t12 = X[104];
+    t3 = X[135];
+    t4 = C57 * t12;
+    t11 = C58 * t3;
+    t10 = t4 + t11;
+    t1 = (-C58) * t12;
+    t6 = C57 * t3;
+    t14 = t1 + t6;
+    t18 = X[134];
+    t2 = X[105];
+    t17 = C59 * t18;
+    t7 = C60 * t2;
+    t4 = t17 + t7;
+    t11 = (-C60) * t18;
+    t12 = C59 * t2;
+    t3 = t11 + t12;
+    t1 = X[164];
+    t6 = X[75];
+    t17 = C61 * t1;
+    t7 = C62 * t6;
+    t18 = t17 + t7;
+    t2 = (-C62) * t1;
+    t11 = C61 * t6;
+    t12 = t2 + t11;
+    t17 = X[194];
+    t7 = X[45];
+    t1 = C63 * t17;
+    t6 = C64 * t7;
+    t2 = t1 + t6;
+    t11 = (-C64) * t17;
+    t1 = C63 * t7;
+    t6 = t11 + t1;
+    t17 = t13 + t10;
+    t7 = t15 + t14;
+    t11 = t19 + t18;
+    t1 = t0 + t12;
+    t13 = t13 - t10;
+    t10 = t15 - t14;
+    t15 = t19 - t18;
+    t14 = t0 - t12;
+    t19 = t17 + t11;
+    t18 = t7 + t1;
+    t0 = t13 + t14;
+    t12 = t10 - t15;
+    t17 = t17 - t11;
+    t11 = t7 - t1;
+    t7 = t13 - t14;
+    t1 = t10 + t15;
+    t13 = t5 + t4;
+    t14 = t8 + t3;
+    t10 = t9 + t2;
+    t15 = t16 + t6;
+    t5 = t5 - t4;
+    t4 = t8 - t3;
+    t8 = t9 - t2;
+    t3 = t16 - t6;
+    t9 = t13 + t10;
+    t2 = t14 + t15;
+    t16 = t5 + t3;
+    t6 = t4 - t8;
+    t13 = t13 - t10;
+    t10 = t14 - t15;
+    t14 = t5 - t3;
+    t15 = t4 + t8;
+    t5 = t16 + t6;
+    t3 = t16 - t6;
+    t4 = C16 * t5;
+    t8 = (-C16) * t3;
+    t16 = t14 - t15;
+    t6 = t14 + t15;
+    t5 = (-C16) * t16;
+    t3 = (-C16) * t6;
+    t14 = t19 - t9;
+    t15 = t18 - t2;
+    t16 = t19 + t9;
+    t6 = t18 + t2;
+    t19 = t0 - t4;
+    t9 = t12 - t8;
+    t18 = t0 + t4;
+    t2 = t12 + t8;
+    t0 = t17 - t10;
+    t4 = t11 + t13;
+    t12 = t17 + t10;
+    t8 = t11 - t13;
+    t17 = t7 - t5;
+    t10 = t1 - t3;
+    t11 = t7 + t5;
+    t13 = t1 + t3;
+    re[112] = t16;
+    im[112] = t6;
+    re[7] = t18;
+    im[7] = t2;
+    re[22] = t12;
+    im[22] = t8;
+    re[37] = t11;
+    im[37] = t13;
+    re[52] = t14;
+    im[52] = t15;
+    re[67] = t19;
+    im[67] = t9;
+    re[82] = t0;
+    im[82] = t4;
+    re[97] = t17;
+    im[97] = t10;
+    t7 = X[32];
+    t5 = X[207];
+    t1 = C65 * t7;
+    t3 = C66 * t5;
+    t16 = t1 + t3;
+    t6 = (-C66) * t7;
+    t18 = C65 * t5;
+    t2 = t6 + t18;
+    t12 = X[62];
+    t8 = X[177];
+    t11 = C67 * t12;
+    t13 = C68 * t8;
+    t14 = t11 + t13;
+    t15 = (-C68) * t12;
+    t19 = C67 * t8;
+    t9 = t15 + t19;
+    t0 = X[92];
+    t4 = X[147];
+    t17 = C69 * t0;
+    t10 = C70 * t4;
+    t1 = t17 + t10;
+    t3 = (-C70) * t0;
+    t7 = C69 * t4;
+    t5 = t3 + t7;
+    t6 = X[122];
+    t18 = X[117];
+    t11 = C71 * t6;
+    t13 = C72 * t18;
+    t12 = t11 + t13;
+    t8 = (-C72) * t6;
+    t15 = C71 * t18;
+    t19 = t8 + t15;
+    t17 = X[152];
+    t10 = X[87];
+    t0 = C73 * t17;
+    t4 = C74 * t10;
+    t3 = t0 + t4;
+    t7 = (-C74) * t17;
+    t11 = C73 * t10;
+    t13 = t7 + t11;
+    t6 = X[182];
+    t18 = X[57];
+    t8 = C75 * t6;
+    t15 = C76 * t18;
+    t0 = t8 + t15;
+    t4 = (-C76) * t6;
+    t17 = C75 * t18;
+    t10 = t4 + t17;
+    t7 = X[212];
+    t11 = X[27];
+    t8 = C77 * t7;
+    t15 = C78 * t11;
+    t6 = t8 + t15;
+    t18 = (-C78) * t7;
+    t4 = C77 * t11;
+    t17 = t18 + t4;
+    t8 = X[2];
+    t15 = X[237];
+    t7 = C79 * t8;
+    t11 = C80 * t15;
+    t18 = t7 + t11;
+    t4 = (-C80) * t8;
+    t7 = C79 * t15;
+    t11 = t4 + t7;
+    t8 = t16 + t3;
+    t15 = t2 + t13;
+    t4 = t1 + t6;
+    t7 = t5 + t17;
+    t16 = t16 - t3;
+    t3 = t2 - t13;
+    t2 = t1 - t6;
+    t13 = t5 - t17;
+    t1 = t8 + t4;
+    t6 = t15 + t7;
+    t5 = t16 + t13;
+    t17 = t3 - t2;
+    t8 = t8 - t4;
+    t4 = t15 - t7;
+    t15 = t16 - t13;
+    t7 = t3 + t2;
+    t16 = t14 + t0;
+    t13 = t9 + t10;
+    t3 = t12 + t18;
+    t2 = t19 + t11;
+    t14 = t14 - t0;
+    t0 = t9 - t10;
+    t9 = t12 - t18;
+    t10 = t19 - t11;
+    t12 = t16 + t3;
+    t18 = t13 + t2;
+    t19 = t14 + t10;
+    t11 = t0 - t9;
+    t16 = t16 - t3;
+    t3 = t13 - t2;
+    t13 = t14 - t10;
+    t2 = t0 + t9;
+    t14 = t19 + t11;
+    t10 = t19 - t11;
+    t0 = C16 * t14;
+    t9 = (-C16) * t10;
+    t19 = t13 - t2;
+    t11 = t13 + t2;
+    t14 = (-C16) * t19;
+    t10 = (-C16) * t11;
+    t13 = t1 - t12;
+    t2 = t6 - t18;
+    t19 = t1 + t12;
+    t11 = t6 + t18;
+    t1 = t5 - t0;
+    t12 = t17 - t9;
+    t6 = t5 + t0;
+    t18 = t17 + t9;
+    t5 = t8 - t3;
+    t0 = t4 + t16;
+    t17 = t8 + t3;
+    t9 = t4 - t16;
+    t8 = t15 - t14;
+    t3 = t7 - t10;
+    t4 = t15 + t14;
+    t16 = t7 + t10;
+    re[16] = t19;
+    im[16] = t11;
+    re[31] = t6;
+    im[31] = t18;
+    re[46] = t17;
+    im[46] = t9;
+    re[61] = t4;
+    im[61] = t16;
+    re[76] = t13;
+    im[76] = t2;
+    re[91] = t1;
+    im[91] = t12;
+    re[106] = t5;
+    im[106] = t0;
+    re[1] = t8;
+    im[1] = t3;
+    t15 = re[40];
+    t14 = im[40];
+    t7 = re[64];
+    t10 = im[64];
+    t19 = re[88];
+    t11 = im[88];
+    t6 = re[112];
+    t18 = im[112];
+    t17 = re[16];
+    t9 = im[16];
+    t4 = t7 + t17;
+    t16 = t10 + t9;
+    t13 = t19 + t6;
+    t2 = t11 + t18;
+    t1 = t7 - t17;
+    t12 = t10 - t9;
+    t5 = t19 - t6;
+    t0 = t11 - t18;
+    t8 = t4 + t13;
+    t3 = t16 + t2;
+    t7 = t4 - t13;
+    t17 = C81 * t7;
+    t10 = t16 - t2;
+    t9 = C81 * t10;
+    t19 = C82 * t8;
+    t6 = t15 - t19;
+    t11 = C82 * t3;
+    t18 = t14 - t11;
+    t4 = t6 + t17;
+    t13 = t18 + t9;
+    t7 = t6 - t17;
+    t16 = t18 - t9;
+    t2 = C83 * t1;
+    t10 = C84 * t5;
+    t19 = t2 + t10;
+    t11 = C83 * t12;
+    t6 = C84 * t0;
+    t17 = t11 + t6;
+    t18 = C84 * t1;
+    t9 = C83 * t5;
+    t2 = t18 - t9;
+    t10 = C84 * t12;
+    t11 = C83 * t0;
+    t6 = t10 - t11;
+    t1 = t15 + t8;
+    t5 = t14 + t3;
+    t18 = t4 + t17;
+    t9 = t13 - t19;
+    t12 = t7 + t6;
+    t0 = t16 - t2;
+    t10 = t7 - t6;
+    t11 = t16 + t2;
+    t15 = t4 - t17;
+    t8 = t13 + t19;
+    re[40] = t1;
+    im[40] = t5;
+    re[64] = t18;
+    im[64] = t9;
+    re[88] = t12;
+    im[88] = t0;
+    re[112] = t10;
+    im[112] = t11;
+    re[16] = t15;
+    im[16] = t8;
+    t14 = re[55];
+    t3 = im[55];
+    t7 = re[79];
+    t6 = im[79];
+    t16 = re[103];
+    t2 = im[103];
+    t4 = re[7];
+    t17 = im[7];
+    t13 = re[31];
+    t19 = im[31];
+    t1 = t7 + t13;
+    t5 = t6 + t19;
+    t18 = t16 + t4;
+    t9 = t2 + t17;
+    t12 = t7 - t13;
+    t0 = t6 - t19;
+    t10 = t16 - t4;
+    t11 = t2 - t17;
+    t15 = t1 + t18;
+    t8 = t5 + t9;
+    t7 = t1 - t18;
+    t13 = C81 * t7;
+    t6 = t5 - t9;
+    t19 = C81 * t6;
+    t16 = C82 * t15;
+    t4 = t14 - t16;
+    t2 = C82 * t8;
+    t17 = t3 - t2;
+    t1 = t4 + t13;
+    t18 = t17 + t19;
+    t7 = t4 - t13;
+    t5 = t17 - t19;
+    t9 = C83 * t12;
+    t6 = C84 * t10;
+    t16 = t9 + t6;
+    t2 = C83 * t0;
+    t4 = C84 * t11;
+    t13 = t2 + t4;
+    t17 = C84 * t12;
+    t19 = C83 * t10;
+    t9 = t17 - t19;
+    t6 = C84 * t0;
+    t2 = C83 * t11;
+    t4 = t6 - t2;
+    t12 = t14 + t15;
+    t10 = t3 + t8;
+    t17 = t1 + t13;
+    t19 = t18 - t16;
+    t0 = t7 + t4;
+    t11 = t5 - t9;
+    t6 = t7 - t4;
+    t2 = t5 + t9;
+    t14 = t1 - t13;
+    t15 = t18 + t16;
+    re[55] = t12;
+    im[55] = t10;
+    re[79] = t17;
+    im[79] = t19;
+    re[103] = t0;
+    im[103] = t11;
+    re[7] = t6;
+    im[7] = t2;
+    re[31] = t14;
+    im[31] = t15;
+    t3 = re[70];
+    t8 = im[70];
+    t7 = re[94];
+    t4 = im[94];
+    t5 = re[118];
+    t9 = im[118];
+    t1 = re[22];
+    t13 = im[22];
+    t18 = re[46];
+    t16 = im[46];
+    t12 = t7 + t18;
+    t10 = t4 + t16;
+    t17 = t5 + t1;
+    t19 = t9 + t13;
+    t0 = t7 - t18;
+    t11 = t4 - t16;
+    t6 = t5 - t1;
+    t2 = t9 - t13;
+    t14 = t12 + t17;
+    t15 = t10 + t19;
+    t7 = t12 - t17;
+    t18 = C81 * t7;
+    t4 = t10 - t19;
+    t16 = C81 * t4;
+    t5 = C82 * t14;
+    t1 = t3 - t5;
+    t9 = C82 * t15;
+    t13 = t8 - t9;
+    t12 = t1 + t18;
+    t17 = t13 + t16;
+    t7 = t1 - t18;
+    t10 = t13 - t16;
+    t19 = C83 * t0;
+    t4 = C84 * t6;
+    t5 = t19 + t4;
+    t9 = C83 * t11;
+    t1 = C84 * t2;
+    t18 = t9 + t1;
+    t13 = C84 * t0;
+    t16 = C83 * t6;
+    t19 = t13 - t16;
+    t4 = C84 * t11;
+    t9 = C83 * t2;
+    t1 = t4 - t9;
+    t0 = t3 + t14;
+    t6 = t8 + t15;
+    t13 = t12 + t18;
+    t16 = t17 - t5;
+    t11 = t7 + t1;
+    t2 = t10 - t19;
+    t4 = t7 - t1;
+    t9 = t10 + t19;
+    t3 = t12 - t18;
+    t14 = t17 + t5;
+    re[70] = t0;
+    im[70] = t6;
+    re[94] = t13;
+    im[94] = t16;
+    re[118] = t11;
+    im[118] = t2;
+    re[22] = t4;
+    im[22] = t9;
+    re[46] = t3;
+    im[46] = t14;
+    t8 = re[85];
+    t15 = im[85];
+    t7 = re[109];
+    t1 = im[109];
+    t10 = re[13];
+    t19 = im[13];
+    t12 = re[37];
+    t18 = im[37];
+    t17 = re[61];
+    t5 = im[61];
+    t0 = t7 + t17;
+    t6 = t1 + t5;
+    t13 = t10 + t12;
+    t16 = t19 + t18;
+    t11 = t7 - t17;
+    t2 = t1 - t5;
+    t4 = t10 - t12;
+    t9 = t19 - t18;
+    t3 = t0 + t13;
+    t14 = t6 + t16;
+    t7 = t0 - t13;
+    t17 = C81 * t7;
+    t1 = t6 - t16;
+    t5 = C81 * t1;
+    t10 = C82 * t3;
+    t12 = t8 - t10;
+    t19 = C82 * t14;
+    t18 = t15 - t19;
+    t0 = t12 + t17;
+    t13 = t18 + t5;
+    t7 = t12 - t17;
+    t6 = t18 - t5;
+    t16 = C83 * t11;
+    t1 = C84 * t4;
+    t10 = t16 + t1;
+    t19 = C83 * t2;
+    t12 = C84 * t9;
+    t17 = t19 + t12;
+    t18 = C84 * t11;
+    t5 = C83 * t4;
+    t16 = t18 - t5;
+    t1 = C84 * t2;
+    t19 = C83 * t9;
+    t12 = t1 - t19;
+    t11 = t8 + t3;
+    t4 = t15 + t14;
+    t18 = t0 + t17;
+    t5 = t13 - t10;
+    t2 = t7 + t12;
+    t9 = t6 - t16;
+    t1 = t7 - t12;
+    t19 = t6 + t16;
+    t8 = t0 - t17;
+    t3 = t13 + t10;
+    re[85] = t11;
+    im[85] = t4;
+    re[109] = t18;
+    im[109] = t5;
+    re[13] = t2;
+    im[13] = t9;
+    re[37] = t1;
+    im[37] = t19;
+    re[61] = t8;
+    im[61] = t3;
+    t15 = re[100];
+    t14 = im[100];
+    t7 = re[4];
+    t12 = im[4];
+    t6 = re[28];
+    t16 = im[28];
+    t0 = re[52];
+    t17 = im[52];
+    t13 = re[76];
+    t10 = im[76];
+    t11 = t7 + t13;
+    t4 = t12 + t10;
+    t18 = t6 + t0;
+    t5 = t16 + t17;
+    t2 = t7 - t13;
+    t9 = t12 - t10;
+    t1 = t6 - t0;
+    t19 = t16 - t17;
+    t8 = t11 + t18;
+    t3 = t4 + t5;
+    t7 = t11 - t18;
+    t13 = C81 * t7;
+    t12 = t4 - t5;
+    t10 = C81 * t12;
+    t6 = C82 * t8;
+    t0 = t15 - t6;
+    t16 = C82 * t3;
+    t17 = t14 - t16;
+    t11 = t0 + t13;
+    t18 = t17 + t10;
+    t7 = t0 - t13;
+    t4 = t17 - t10;
+    t5 = C83 * t2;
+    t12 = C84 * t1;
+    t6 = t5 + t12;
+    t16 = C83 * t9;
+    t0 = C84 * t19;
+    t13 = t16 + t0;
+    t17 = C84 * t2;
+    t10 = C83 * t1;
+    t5 = t17 - t10;
+    t12 = C84 * t9;
+    t16 = C83 * t19;
+    t0 = t12 - t16;
+    t2 = t15 + t8;
+    t1 = t14 + t3;
+    t17 = t11 + t13;
+    t10 = t18 - t6;
+    t9 = t7 + t0;
+    t19 = t4 - t5;
+    t12 = t7 - t0;
+    t16 = t4 + t5;
+    t15 = t11 - t13;
+    t8 = t18 + t6;
+    re[100] = t2;
+    im[100] = t1;
+    re[4] = t17;
+    im[4] = t10;
+    re[28] = t9;
+    im[28] = t19;
+    re[52] = t12;
+    im[52] = t16;
+    re[76] = t15;
+    im[76] = t8;
+    t14 = re[115];
+    t3 = im[115];
+    t7 = re[19];
+    t0 = im[19];
+    t4 = re[43];
+    t5 = im[43];
+    t11 = re[67];
+    t13 = im[67];
+    t18 = re[91];
+    t6 = im[91];
+    t2 = t7 + t18;
+    t1 = t0 + t6;
+    t17 = t4 + t11;
+    t10 = t5 + t13;
+    t9 = t7 - t18;
+    t19 = t0 - t6;
+    t12 = t4 - t11;
+    t16 = t5 - t13;
+    t15 = t2 + t17;
+    t8 = t1 + t10;
+    t7 = t2 - t17;
+    t18 = C81 * t7;
+    t0 = t1 - t10;
+    t6 = C81 * t0;
+    t4 = C82 * t15;
+    t11 = t14 - t4;
+    t5 = C82 * t8;
+    t13 = t3 - t5;
+    t2 = t11 + t18;
+    t17 = t13 + t6;
+    t7 = t11 - t18;
+    t1 = t13 - t6;
+    t10 = C83 * t9;
+    t0 = C84 * t12;
+    t4 = t10 + t0;
+    t5 = C83 * t19;
+    t11 = C84 * t16;
+    t18 = t5 + t11;
+    t13 = C84 * t9;
+    t6 = C83 * t12;
+    t10 = t13 - t6;
+    t0 = C84 * t19;
+    t5 = C83 * t16;
+    t11 = t0 - t5;
+    t9 = t14 + t15;
+    t12 = t3 + t8;
+    t13 = t2 + t18;
+    t6 = t17 - t4;
+    t19 = t7 + t11;
+    t16 = t1 - t10;
+    t0 = t7 - t11;
+    t5 = t1 + t10;
+    t14 = t2 - t18;
+    t15 = t17 + t4;
+    re[115] = t9;
+    im[115] = t12;
+    re[19] = t13;
+    im[19] = t6;
+    re[43] = t19;
+    im[43] = t16;
+    re[67] = t0;
+    im[67] = t5;
+    re[91] = t14;
+    im[91] = t15;
+    t3 = re[10];
+    t8 = im[10];
+    t7 = re[34];
+    t11 = im[34];
+    t1 = re[58];
+    t10 = im[58];
+    t2 = re[82];
+    t18 = im[82];
+    t17 = re[106];
+    t4 = im[106];
+    t9 = t7 + t17;
+    t12 = t11 + t4;
+    t13 = t1 + t2;
+    t6 = t10 + t18;
+    t19 = t7 - t17;
+    t16 = t11 - t4;
+    t0 = t1 - t2;
+    t5 = t10 - t18;
+    t14 = t9 + t13;
+    t15 = t12 + t6;
+    t7 = t9 - t13;
+    t17 = C81 * t7;
+    t11 = t12 - t6;
+    t4 = C81 * t11;
+    t1 = C82 * t14;
+    t2 = t3 - t1;
+    t10 = C82 * t15;
+    t18 = t8 - t10;
+    t9 = t2 + t17;
+    t13 = t18 + t4;
+    t7 = t2 - t17;
+    t12 = t18 - t4;
+    t6 = C83 * t19;
+    t11 = C84 * t0;
+    t1 = t6 + t11;
+    t10 = C83 * t16;
+    t2 = C84 * t5;
+    t17 = t10 + t2;
+    t18 = C84 * t19;
+    t4 = C83 * t0;
+    t6 = t18 - t4;
+    t11 = C84 * t16;
+    t10 = C83 * t5;
+    t2 = t11 - t10;
+    t19 = t3 + t14;
+    t0 = t8 + t15;
+    t18 = t9 + t17;
+    t4 = t13 - t1;
+    t16 = t7 + t2;
+    t5 = t12 - t6;
+    t11 = t7 - t2;
+    t10 = t12 + t6;
+    t3 = t9 - t17;
+    t14 = t13 + t1;
+    re[10] = t19;
+    im[10] = t0;
+    re[34] = t18;
+    im[34] = t4;
+    re[58] = t16;
+    im[58] = t5;
+    re[82] = t11;
+    im[82] = t10;
+    re[106] = t3;
+    im[106] = t14;
+    t8 = re[25];
+    t15 = im[25];
+    t7 = re[49];
+    t2 = im[49];
+    t12 = re[73];
+    t6 = im[73];
+    t9 = re[97];
+    t17 = im[97];
+    t13 = re[1];
+    t1 = im[1];
+    t19 = t7 + t13;
+    t0 = t2 + t1;
+    t18 = t12 + t9;
+    t4 = t6 + t17;
+    t16 = t7 - t13;
+    t5 = t2 - t1;
+    t11 = t12 - t9;
+    t10 = t6 - t17;
+    t3 = t19 + t18;
+    t14 = t0 + t4;
+    t7 = t19 - t18;
+    t13 = C81 * t7;
+    t2 = t0 - t4;
+    t1 = C81 * t2;
+    t12 = C82 * t3;
+    t9 = t8 - t12;
+    t6 = C82 * t14;
+    t17 = t15 - t6;
+    t19 = t9 + t13;
+    t18 = t17 + t1;
+    t7 = t9 - t13;
+    t0 = t17 - t1;
+    t4 = C83 * t16;
+    t2 = C84 * t11;
+    t12 = t4 + t2;
+    t6 = C83 * t5;
+    t9 = C84 * t10;
+    t13 = t6 + t9;
+    t17 = C84 * t16;
+    t1 = C83 * t11;
+    t4 = t17 - t1;
+    t2 = C84 * t5;
+    t6 = C83 * t10;
+    t9 = t2 - t6;
+    t16 = t8 + t3;
+    t11 = t15 + t14;
+    t17 = t19 + t13;
+    t1 = t18 - t12;
+    t5 = t7 + t9;
+    t10 = t0 - t4;
+    t2 = t7 - t9;
+    t6 = t0 + t4;
+    t8 = t19 - t13;
+    t3 = t18 + t12;
+    re[25] = t16;
+    im[25] = t11;
+    re[49] = t17;
+    im[49] = t1;
+    re[73] = t5;
+    im[73] = t10;
+    re[97] = t2;
+    im[97] = t6;
+    re[1] = t8;
+    im[1] = t3;
+}
+
+/**
+ *  Part 3 of ApplyWindowedIMDCT_W75_240().
+ * 
+ *  @param {Number[]} X 
+ *    - The input block (240 points).
+ *  @param {Number[]} y 
+ *    - The array that would contain the output block (480 points).
+ *  @param {Number[]} re 
+ *    - The scratch buffer (real part, 120 points).
+ *  @param {Number[]} im 
+ *    - The scratch buffer (imaginary part, 120 points).
+ */
+function ApplyWindowedIMDCT_W75_240_Part3(X, y, re, im) {
+    let t0, t1, t10, t11, t12, t13, t14, t15, t16, t17, t18, t19, t2, t3, t4, t5, t6, t7, t8, t9;
+    const C0 = 0.49999999999999994;
+    const C1 = 0.8660254037844387;
+    const C2 = 0.3214394653031616;
+    const C3 = 0.9469301294951057;
+    const C4 = 0.13052619222005157;
+    const C5 = 0.9914448613738104;
+    const C6 = 0.9978589232386035;
+    const C7 = 0.06540312923014306;
+    const C8 = 0.9659258262890683;
+    const C9 = 0.25881904510252074;
+    const C10 = 0.8968727415326883;
+    const C11 = 0.4422886902190013;
+    const C12 = 0.7933533402912352;
+    const C13 = 0.6087614290087207;
+    const C14 = 0.6593458151000688;
+    const C15 = 0.7518398074789774;
+    const C16 = 0.7071067811865476;
+    const C17 = 0.20791169081775931;
+    const C18 = 0.9781476007338057;
+    const C19 = 0.01308959557134444;
+    const C20 = 0.999914327574007;
+    const C21 = 0.9832549075639546;
+    const C22 = 0.18223552549214747;
+    const C23 = 0.9288095528719242;
+    const C24 = 0.3705574375098362;
+    const C25 = 0.838670567945424;
+    const C26 = 0.544639035015027;
+    const C27 = 0.7163019434246544;
+    const C28 = 0.6977904598416801;
+    const C29 = 0.5664062369248328;
+    const C30 = 0.8241261886220156;
+    const C31 = 0.39474385638426723;
+    const C32 = 0.9187912101488983;
+    const C33 = 0.9945218953682733;
+    const C34 = 0.10452846326765346;
+    const C35 = 0.9550199444571866;
+    const C36 = 0.296541574975571;
+    const C37 = 0.8788171126619654;
+    const C38 = 0.4771587602596084;
+    const C39 = 0.7688418320734596;
+    const C40 = 0.6394390019805847;
+    const C41 = 0.6293203910498375;
+    const C42 = 0.7771459614569709;
+    const C43 = 0.4656145203251114;
+    const C44 = 0.8849876374630419;
+    const C45 = 0.2840153447039226;
+    const C46 = 0.958819734868193;
+    const C47 = 0.09150161866340238;
+    const C48 = 0.9958049275746618;
+    const C49 = 0.9135454576426009;
+    const C50 = 0.40673664307580015;
+    const C51 = 0.8166415551616789;
+    const C52 = 0.5771451900372336;
+    const C53 = 0.6883545756937539;
+    const C54 = 0.7253743710122876;
+    const C55 = 0.5336145159156115;
+    const C56 = 0.8457278217039733;
+    const C57 = 0.35836794954530027;
+    const C58 = 0.9335804264972017;
+    const C59 = 0.1693495038490246;
+    const C60 = 0.9855560590580777;
+    const C61 = 0.9996573249755573;
+    const C62 = 0.02617694830787315;
+    const C63 = 0.9753423205085127;
+    const C64 = 0.22069743502150108;
+    const C65 = 0.7431448254773942;
+    const C66 = 0.6691306063588582;
+    const C67 = 0.598324600570659;
+    const C68 = 0.8012538126910607;
+    const C69 = 0.4305110968082951;
+    const C70 = 0.9025852843498606;
+    const C71 = 0.24615329302899303;
+    const C72 = 0.9692309097067544;
+    const C73 = 0.05233595624294383;
+    const C74 = 0.9986295347545738;
+    const C75 = 0.9896513868196702;
+    const C76 = 0.1434926219911793;
+    const C77 = 0.9426414910921784;
+    const C78 = 0.33380685923377096;
+    const C79 = 0.8594064115014527;
+    const C80 = 0.5112930860770522;
+    const C81 = 0.5590169943749475;
+    const C82 = 0.25;
+    const C83 = 0.9510565162951535;
+    const C84 = 0.5877852522924731;
+    const C85 = 0.5;
+    const C86 = 0.8660254037844386;
+    const C87 = 0.9999946454016965;
+    const C88 = 0.003272486506526625;
+    const C89 = 0.8643845233130174;
+    const C90 = 0.5028313791490421;
+    const C91 = 0.4971632662526543;
+    const C92 = 0.8676570098195441;
+    const C93 = 0.48576339371634003;
+    const C94 = 0.8740903416267589;
+    const C95 = 0.9998661379095618;
+    const C96 = 0.01636173162648678;
+    const C97 = 0.8577286100002721;
+    const C98 = 0.5141027441932217;
+    const C99 = 0.8509257293058021;
+    const C100 = 0.525286020378792;
+    const C101 = 0.4742802881232292;
+    const C102 = 0.8803739025537654;
+    const C103 = 0.9995663085020212;
+    const C104 = 0.02944817324796316;
+    const C105 = 0.9990952085533004;
+    const C106 = 0.04252956907655312;
+    const C107 = 0.8439770468681933;
+    const C108 = 0.5363792915089503;
+    const C109 = 0.4627159170443501;
+    const C110 = 0.8865066159447464;
+    const C111 = 0.4510722619751534;
+    const C112 = 0.8924874309908339;
+    const C113 = 0.99845291878395;
+    const C114 = 0.055603677682424614;
+    const C115 = 0.8368837533084093;
+    const C116 = 0.5473806568087966;
+    const C117 = 0.8296470640257853;
+    const C118 = 0.558288231251022;
+    const C119 = 0.4393513179959937;
+    const C120 = 0.898315322910159;
+    const C121 = 0.9976395492470157;
+    const C122 = 0.06866825888437376;
+    const C123 = 0.9966552393091803;
+    const C124 = 0.08172107413366822;
+    const C125 = 0.8222682189897751;
+    const C126 = 0.5691001458788982;
+    const C127 = 0.4275550934302821;
+    const C128 = 0.9039892931234433;
+    const C129 = 0.4156856095003708;
+    const C130 = 0.9095083694251006;
+    const C131 = 0.9955001576268845;
+    const C132 = 0.09475988689761111;
+    const C133 = 0.8147484825274894;
+    const C134 = 0.5798145481265136;
+    const C135 = 0.8070891431070594;
+    const C136 = 0.5904296021362011;
+    const C137 = 0.4037448999812271;
+    const C138 = 0.9148716061498187;
+    const C139 = 0.9941745021174282;
+    const C140 = 0.10778246304275935;
+    const C141 = 0.9926784999250583;
+    const C142 = 0.12078657121773083;
+    const C143 = 0.7992915131168641;
+    const C144 = 0.6009434890731024;
+    const C145 = 0.3917350108519559;
+    const C146 = 0.9200780843345949;
+    const C147 = 0.37965799994523275;
+    const C148 = 0.9251269118761953;
+    const C149 = 0.9910124073820492;
+    const C150 = 0.13376998323553513;
+    const C151 = 0.7913569286406602;
+    const C152 = 0.6113544074368165;
+    const C153 = 0.7832867492286504;
+    const C154 = 0.6216605733700774;
+    const C155 = 0.36751593659470355;
+    const C156 = 0.9300172236840121;
+    const C157 = 0.989176509964781;
+    const C158 = 0.14673047445536175;
+    t15 = X[160];
+    t14 = X[79];
+    t7 = C0 * t15;
+    t9 = C1 * t14;
+    t0 = t7 + t9;
+    t4 = (-C1) * t15;
+    t19 = C0 * t14;
+    t13 = t4 + t19;
+    t18 = X[190];
+    t12 = X[49];
+    t16 = C2 * t18;
+    t11 = C3 * t12;
+    t17 = t16 + t11;
+    t1 = (-C3) * t18;
+    t5 = C2 * t12;
+    t10 = t1 + t5;
+    t2 = X[220];
+    t6 = X[19];
+    t8 = C4 * t2;
+    t3 = C5 * t6;
+    t7 = t8 + t3;
+    t9 = (-C5) * t2;
+    t15 = C4 * t6;
+    t14 = t9 + t15;
+    t4 = X[10];
+    t19 = X[229];
+    t16 = C6 * t4;
+    t11 = C7 * t19;
+    t18 = t16 + t11;
+    t12 = (-C7) * t4;
+    t1 = C6 * t19;
+    t5 = t12 + t1;
+    t8 = X[40];
+    t3 = X[199];
+    t2 = C8 * t8;
+    t6 = C9 * t3;
+    t9 = t2 + t6;
+    t15 = (-C9) * t8;
+    t16 = C8 * t3;
+    t11 = t15 + t16;
+    t4 = X[70];
+    t19 = X[169];
+    t12 = C10 * t4;
+    t1 = C11 * t19;
+    t2 = t12 + t1;
+    t6 = (-C11) * t4;
+    t8 = C10 * t19;
+    t3 = t6 + t8;
+    t15 = X[100];
+    t16 = X[139];
+    t12 = C12 * t15;
+    t1 = C13 * t16;
+    t4 = t12 + t1;
+    t19 = (-C13) * t15;
+    t6 = C12 * t16;
+    t8 = t19 + t6;
+    t12 = X[130];
+    t1 = X[109];
+    t15 = C14 * t12;
+    t16 = C15 * t1;
+    t19 = t15 + t16;
+    t6 = (-C15) * t12;
+    t15 = C14 * t1;
+    t16 = t6 + t15;
+    t12 = t0 + t9;
+    t1 = t13 + t11;
+    t6 = t7 + t4;
+    t15 = t14 + t8;
+    t0 = t0 - t9;
+    t9 = t13 - t11;
+    t13 = t7 - t4;
+    t11 = t14 - t8;
+    t7 = t12 + t6;
+    t4 = t1 + t15;
+    t14 = t0 + t11;
+    t8 = t9 - t13;
+    t12 = t12 - t6;
+    t6 = t1 - t15;
+    t1 = t0 - t11;
+    t15 = t9 + t13;
+    t0 = t17 + t2;
+    t11 = t10 + t3;
+    t9 = t18 + t19;
+    t13 = t5 + t16;
+    t17 = t17 - t2;
+    t2 = t10 - t3;
+    t10 = t18 - t19;
+    t3 = t5 - t16;
+    t18 = t0 + t9;
+    t19 = t11 + t13;
+    t5 = t17 + t3;
+    t16 = t2 - t10;
+    t0 = t0 - t9;
+    t9 = t11 - t13;
+    t11 = t17 - t3;
+    t13 = t2 + t10;
+    t17 = t5 + t16;
+    t3 = t5 - t16;
+    t2 = C16 * t17;
+    t10 = (-C16) * t3;
+    t5 = t11 - t13;
+    t16 = t11 + t13;
+    t17 = (-C16) * t5;
+    t3 = (-C16) * t16;
+    t11 = t7 - t18;
+    t13 = t4 - t19;
+    t5 = t7 + t18;
+    t16 = t4 + t19;
+    t7 = t14 - t2;
+    t18 = t8 - t10;
+    t4 = t14 + t2;
+    t19 = t8 + t10;
+    t14 = t12 - t9;
+    t2 = t6 + t0;
+    t8 = t12 + t9;
+    t10 = t6 - t0;
+    t12 = t1 - t17;
+    t9 = t15 - t3;
+    t6 = t1 + t17;
+    t0 = t15 + t3;
+    re[80] = t5;
+    im[80] = t16;
+    re[95] = t4;
+    im[95] = t19;
+    re[110] = t8;
+    im[110] = t10;
+    re[5] = t6;
+    im[5] = t0;
+    re[20] = t11;
+    im[20] = t13;
+    re[35] = t7;
+    im[35] = t18;
+    re[50] = t14;
+    im[50] = t2;
+    re[65] = t12;
+    im[65] = t9;
+    t1 = X[208];
+    t17 = X[31];
+    t15 = C17 * t1;
+    t3 = C18 * t17;
+    t5 = t15 + t3;
+    t16 = (-C18) * t1;
+    t4 = C17 * t17;
+    t19 = t16 + t4;
+    t8 = X[238];
+    t10 = X[1];
+    t6 = C19 * t8;
+    t0 = C20 * t10;
+    t11 = t6 + t0;
+    t13 = (-C20) * t8;
+    t7 = C19 * t10;
+    t18 = t13 + t7;
+    t14 = X[28];
+    t2 = X[211];
+    t12 = C21 * t14;
+    t9 = C22 * t2;
+    t15 = t12 + t9;
+    t3 = (-C22) * t14;
+    t1 = C21 * t2;
+    t17 = t3 + t1;
+    t16 = X[58];
+    t4 = X[181];
+    t6 = C23 * t16;
+    t0 = C24 * t4;
+    t8 = t6 + t0;
+    t10 = (-C24) * t16;
+    t13 = C23 * t4;
+    t7 = t10 + t13;
+    t12 = X[88];
+    t9 = X[151];
+    t14 = C25 * t12;
+    t2 = C26 * t9;
+    t3 = t14 + t2;
+    t1 = (-C26) * t12;
+    t6 = C25 * t9;
+    t0 = t1 + t6;
+    t16 = X[118];
+    t4 = X[121];
+    t10 = C27 * t16;
+    t13 = C28 * t4;
+    t14 = t10 + t13;
+    t2 = (-C28) * t16;
+    t12 = C27 * t4;
+    t9 = t2 + t12;
+    t1 = X[148];
+    t6 = X[91];
+    t10 = C29 * t1;
+    t13 = C30 * t6;
+    t16 = t10 + t13;
+    t4 = (-C30) * t1;
+    t2 = C29 * t6;
+    t12 = t4 + t2;
+    t10 = X[178];
+    t13 = X[61];
+    t1 = C31 * t10;
+    t6 = C32 * t13;
+    t4 = t1 + t6;
+    t2 = (-C32) * t10;
+    t1 = C31 * t13;
+    t6 = t2 + t1;
+    t10 = t5 + t3;
+    t13 = t19 + t0;
+    t2 = t15 + t16;
+    t1 = t17 + t12;
+    t5 = t5 - t3;
+    t3 = t19 - t0;
+    t19 = t15 - t16;
+    t0 = t17 - t12;
+    t15 = t10 + t2;
+    t16 = t13 + t1;
+    t17 = t5 + t0;
+    t12 = t3 - t19;
+    t10 = t10 - t2;
+    t2 = t13 - t1;
+    t13 = t5 - t0;
+    t1 = t3 + t19;
+    t5 = t11 + t14;
+    t0 = t18 + t9;
+    t3 = t8 + t4;
+    t19 = t7 + t6;
+    t11 = t11 - t14;
+    t14 = t18 - t9;
+    t18 = t8 - t4;
+    t9 = t7 - t6;
+    t8 = t5 + t3;
+    t4 = t0 + t19;
+    t7 = t11 + t9;
+    t6 = t14 - t18;
+    t5 = t5 - t3;
+    t3 = t0 - t19;
+    t0 = t11 - t9;
+    t19 = t14 + t18;
+    t11 = t7 + t6;
+    t9 = t7 - t6;
+    t14 = C16 * t11;
+    t18 = (-C16) * t9;
+    t7 = t0 - t19;
+    t6 = t0 + t19;
+    t11 = (-C16) * t7;
+    t9 = (-C16) * t6;
+    t0 = t15 - t8;
+    t19 = t16 - t4;
+    t7 = t15 + t8;
+    t6 = t16 + t4;
+    t15 = t17 - t14;
+    t8 = t12 - t18;
+    t16 = t17 + t14;
+    t4 = t12 + t18;
+    t17 = t10 - t3;
+    t14 = t2 + t5;
+    t12 = t10 + t3;
+    t18 = t2 - t5;
+    t10 = t13 - t11;
+    t3 = t1 - t9;
+    t2 = t13 + t11;
+    t5 = t1 + t9;
+    re[104] = t7;
+    im[104] = t6;
+    re[119] = t16;
+    im[119] = t4;
+    re[14] = t12;
+    im[14] = t18;
+    re[29] = t2;
+    im[29] = t5;
+    re[44] = t0;
+    im[44] = t19;
+    re[59] = t15;
+    im[59] = t8;
+    re[74] = t17;
+    im[74] = t14;
+    re[89] = t10;
+    im[89] = t3;
+    t13 = X[16];
+    t11 = X[223];
+    t1 = C33 * t13;
+    t9 = C34 * t11;
+    t7 = t1 + t9;
+    t6 = (-C34) * t13;
+    t16 = C33 * t11;
+    t4 = t6 + t16;
+    t12 = X[46];
+    t18 = X[193];
+    t2 = C35 * t12;
+    t5 = C36 * t18;
+    t0 = t2 + t5;
+    t19 = (-C36) * t12;
+    t15 = C35 * t18;
+    t8 = t19 + t15;
+    t17 = X[76];
+    t14 = X[163];
+    t10 = C37 * t17;
+    t3 = C38 * t14;
+    t1 = t10 + t3;
+    t9 = (-C38) * t17;
+    t13 = C37 * t14;
+    t11 = t9 + t13;
+    t6 = X[106];
+    t16 = X[133];
+    t2 = C39 * t6;
+    t5 = C40 * t16;
+    t12 = t2 + t5;
+    t18 = (-C40) * t6;
+    t19 = C39 * t16;
+    t15 = t18 + t19;
+    t10 = X[136];
+    t3 = X[103];
+    t17 = C41 * t10;
+    t14 = C42 * t3;
+    t9 = t17 + t14;
+    t13 = (-C42) * t10;
+    t2 = C41 * t3;
+    t5 = t13 + t2;
+    t6 = X[166];
+    t16 = X[73];
+    t18 = C43 * t6;
+    t19 = C44 * t16;
+    t17 = t18 + t19;
+    t14 = (-C44) * t6;
+    t10 = C43 * t16;
+    t3 = t14 + t10;
+    t13 = X[196];
+    t2 = X[43];
+    t18 = C45 * t13;
+    t19 = C46 * t2;
+    t6 = t18 + t19;
+    t16 = (-C46) * t13;
+    t14 = C45 * t2;
+    t10 = t16 + t14;
+    t18 = X[226];
+    t19 = X[13];
+    t13 = C47 * t18;
+    t2 = C48 * t19;
+    t16 = t13 + t2;
+    t14 = (-C48) * t18;
+    t13 = C47 * t19;
+    t2 = t14 + t13;
+    t18 = t7 + t9;
+    t19 = t4 + t5;
+    t14 = t1 + t6;
+    t13 = t11 + t10;
+    t7 = t7 - t9;
+    t9 = t4 - t5;
+    t4 = t1 - t6;
+    t5 = t11 - t10;
+    t1 = t18 + t14;
+    t6 = t19 + t13;
+    t11 = t7 + t5;
+    t10 = t9 - t4;
+    t18 = t18 - t14;
+    t14 = t19 - t13;
+    t19 = t7 - t5;
+    t13 = t9 + t4;
+    t7 = t0 + t17;
+    t5 = t8 + t3;
+    t9 = t12 + t16;
+    t4 = t15 + t2;
+    t0 = t0 - t17;
+    t17 = t8 - t3;
+    t8 = t12 - t16;
+    t3 = t15 - t2;
+    t12 = t7 + t9;
+    t16 = t5 + t4;
+    t15 = t0 + t3;
+    t2 = t17 - t8;
+    t7 = t7 - t9;
+    t9 = t5 - t4;
+    t5 = t0 - t3;
+    t4 = t17 + t8;
+    t0 = t15 + t2;
+    t3 = t15 - t2;
+    t17 = C16 * t0;
+    t8 = (-C16) * t3;
+    t15 = t5 - t4;
+    t2 = t5 + t4;
+    t0 = (-C16) * t15;
+    t3 = (-C16) * t2;
+    t5 = t1 - t12;
+    t4 = t6 - t16;
+    t15 = t1 + t12;
+    t2 = t6 + t16;
+    t1 = t11 - t17;
+    t12 = t10 - t8;
+    t6 = t11 + t17;
+    t16 = t10 + t8;
+    t11 = t18 - t9;
+    t17 = t14 + t7;
+    t10 = t18 + t9;
+    t8 = t14 - t7;
+    t18 = t19 - t0;
+    t9 = t13 - t3;
+    t14 = t19 + t0;
+    t7 = t13 + t3;
+    re[8] = t15;
+    im[8] = t2;
+    re[23] = t6;
+    im[23] = t16;
+    re[38] = t10;
+    im[38] = t8;
+    re[53] = t14;
+    im[53] = t7;
+    re[68] = t5;
+    im[68] = t4;
+    re[83] = t1;
+    im[83] = t12;
+    re[98] = t11;
+    im[98] = t17;
+    re[113] = t18;
+    im[113] = t9;
+    t19 = X[64];
+    t0 = X[175];
+    t13 = C49 * t19;
+    t3 = C50 * t0;
+    t15 = t13 + t3;
+    t2 = (-C50) * t19;
+    t6 = C49 * t0;
+    t16 = t2 + t6;
+    t10 = X[94];
+    t8 = X[145];
+    t14 = C51 * t10;
+    t7 = C52 * t8;
+    t5 = t14 + t7;
+    t4 = (-C52) * t10;
+    t1 = C51 * t8;
+    t12 = t4 + t1;
+    t11 = X[124];
+    t17 = X[115];
+    t18 = C53 * t11;
+    t9 = C54 * t17;
+    t13 = t18 + t9;
+    t3 = (-C54) * t11;
+    t19 = C53 * t17;
+    t0 = t3 + t19;
+    t2 = X[154];
+    t6 = X[85];
+    t14 = C55 * t2;
+    t7 = C56 * t6;
+    t10 = t14 + t7;
+    t8 = (-C56) * t2;
+    t4 = C55 * t6;
+    t1 = t8 + t4;
+    t18 = X[184];
+    t9 = X[55];
+    t11 = C57 * t18;
+    t17 = C58 * t9;
+    t3 = t11 + t17;
+    t19 = (-C58) * t18;
+    t14 = C57 * t9;
+    t7 = t19 + t14;
+    t2 = X[214];
+    t6 = X[25];
+    t8 = C59 * t2;
+    t4 = C60 * t6;
+    t11 = t8 + t4;
+    t17 = (-C60) * t2;
+    t18 = C59 * t6;
+    t9 = t17 + t18;
+    t19 = X[4];
+    t14 = X[235];
+    t8 = C61 * t19;
+    t4 = C62 * t14;
+    t2 = t8 + t4;
+    t6 = (-C62) * t19;
+    t17 = C61 * t14;
+    t18 = t6 + t17;
+    t8 = X[34];
+    t4 = X[205];
+    t19 = C63 * t8;
+    t14 = C64 * t4;
+    t6 = t19 + t14;
+    t17 = (-C64) * t8;
+    t19 = C63 * t4;
+    t14 = t17 + t19;
+    t8 = t15 + t3;
+    t4 = t16 + t7;
+    t17 = t13 + t2;
+    t19 = t0 + t18;
+    t15 = t15 - t3;
+    t3 = t16 - t7;
+    t16 = t13 - t2;
+    t7 = t0 - t18;
+    t13 = t8 + t17;
+    t2 = t4 + t19;
+    t0 = t15 + t7;
+    t18 = t3 - t16;
+    t8 = t8 - t17;
+    t17 = t4 - t19;
+    t4 = t15 - t7;
+    t19 = t3 + t16;
+    t15 = t5 + t11;
+    t7 = t12 + t9;
+    t3 = t10 + t6;
+    t16 = t1 + t14;
+    t5 = t5 - t11;
+    t11 = t12 - t9;
+    t12 = t10 - t6;
+    t9 = t1 - t14;
+    t10 = t15 + t3;
+    t6 = t7 + t16;
+    t1 = t5 + t9;
+    t14 = t11 - t12;
+    t15 = t15 - t3;
+    t3 = t7 - t16;
+    t7 = t5 - t9;
+    t16 = t11 + t12;
+    t5 = t1 + t14;
+    t9 = t1 - t14;
+    t11 = C16 * t5;
+    t12 = (-C16) * t9;
+    t1 = t7 - t16;
+    t14 = t7 + t16;
+    t5 = (-C16) * t1;
+    t9 = (-C16) * t14;
+    t7 = t13 - t10;
+    t16 = t2 - t6;
+    t1 = t13 + t10;
+    t14 = t2 + t6;
+    t13 = t0 - t11;
+    t10 = t18 - t12;
+    t2 = t0 + t11;
+    t6 = t18 + t12;
+    t0 = t8 - t3;
+    t11 = t17 + t15;
+    t18 = t8 + t3;
+    t12 = t17 - t15;
+    t8 = t4 - t5;
+    t3 = t19 - t9;
+    t17 = t4 + t5;
+    t15 = t19 + t9;
+    re[32] = t1;
+    im[32] = t14;
+    re[47] = t2;
+    im[47] = t6;
+    re[62] = t18;
+    im[62] = t12;
+    re[77] = t17;
+    im[77] = t15;
+    re[92] = t7;
+    im[92] = t16;
+    re[107] = t13;
+    im[107] = t10;
+    re[2] = t0;
+    im[2] = t11;
+    re[17] = t8;
+    im[17] = t3;
+    t4 = X[112];
+    t5 = X[127];
+    t19 = C65 * t4;
+    t9 = C66 * t5;
+    t1 = t19 + t9;
+    t14 = (-C66) * t4;
+    t2 = C65 * t5;
+    t6 = t14 + t2;
+    t18 = X[142];
+    t12 = X[97];
+    t17 = C67 * t18;
+    t15 = C68 * t12;
+    t7 = t17 + t15;
+    t16 = (-C68) * t18;
+    t13 = C67 * t12;
+    t10 = t16 + t13;
+    t0 = X[172];
+    t11 = X[67];
+    t8 = C69 * t0;
+    t3 = C70 * t11;
+    t19 = t8 + t3;
+    t9 = (-C70) * t0;
+    t4 = C69 * t11;
+    t5 = t9 + t4;
+    t14 = X[202];
+    t2 = X[37];
+    t17 = C71 * t14;
+    t15 = C72 * t2;
+    t18 = t17 + t15;
+    t12 = (-C72) * t14;
+    t16 = C71 * t2;
+    t13 = t12 + t16;
+    t8 = X[232];
+    t3 = X[7];
+    t0 = C73 * t8;
+    t11 = C74 * t3;
+    t9 = t0 + t11;
+    t4 = (-C74) * t8;
+    t17 = C73 * t3;
+    t15 = t4 + t17;
+    t14 = X[22];
+    t2 = X[217];
+    t12 = C75 * t14;
+    t16 = C76 * t2;
+    t0 = t12 + t16;
+    t11 = (-C76) * t14;
+    t8 = C75 * t2;
+    t3 = t11 + t8;
+    t4 = X[52];
+    t17 = X[187];
+    t12 = C77 * t4;
+    t16 = C78 * t17;
+    t14 = t12 + t16;
+    t2 = (-C78) * t4;
+    t11 = C77 * t17;
+    t8 = t2 + t11;
+    t12 = X[82];
+    t16 = X[157];
+    t4 = C79 * t12;
+    t17 = C80 * t16;
+    t2 = t4 + t17;
+    t11 = (-C80) * t12;
+    t4 = C79 * t16;
+    t17 = t11 + t4;
+    t12 = t1 + t9;
+    t16 = t6 + t15;
+    t11 = t19 + t14;
+    t4 = t5 + t8;
+    t1 = t1 - t9;
+    t9 = t6 - t15;
+    t6 = t19 - t14;
+    t15 = t5 - t8;
+    t19 = t12 + t11;
+    t14 = t16 + t4;
+    t5 = t1 + t15;
+    t8 = t9 - t6;
+    t12 = t12 - t11;
+    t11 = t16 - t4;
+    t16 = t1 - t15;
+    t4 = t9 + t6;
+    t1 = t7 + t0;
+    t15 = t10 + t3;
+    t9 = t18 + t2;
+    t6 = t13 + t17;
+    t7 = t7 - t0;
+    t0 = t10 - t3;
+    t10 = t18 - t2;
+    t3 = t13 - t17;
+    t18 = t1 + t9;
+    t2 = t15 + t6;
+    t13 = t7 + t3;
+    t17 = t0 - t10;
+    t1 = t1 - t9;
+    t9 = t15 - t6;
+    t15 = t7 - t3;
+    t6 = t0 + t10;
+    t7 = t13 + t17;
+    t3 = t13 - t17;
+    t0 = C16 * t7;
+    t10 = (-C16) * t3;
+    t13 = t15 - t6;
+    t17 = t15 + t6;
+    t7 = (-C16) * t13;
+    t3 = (-C16) * t17;
+    t15 = t19 - t18;
+    t6 = t14 - t2;
+    t13 = t19 + t18;
+    t17 = t14 + t2;
+    t19 = t5 - t0;
+    t18 = t8 - t10;
+    t14 = t5 + t0;
+    t2 = t8 + t10;
+    t5 = t12 - t9;
+    t0 = t11 + t1;
+    t8 = t12 + t9;
+    t10 = t11 - t1;
+    t12 = t16 - t7;
+    t9 = t4 - t3;
+    t11 = t16 + t7;
+    t1 = t4 + t3;
+    re[56] = t13;
+    im[56] = t17;
+    re[71] = t14;
+    im[71] = t2;
+    re[86] = t8;
+    im[86] = t10;
+    re[101] = t11;
+    im[101] = t1;
+    re[116] = t15;
+    im[116] = t6;
+    re[11] = t19;
+    im[11] = t18;
+    re[26] = t5;
+    im[26] = t0;
+    re[41] = t12;
+    im[41] = t9;
+    t16 = re[80];
+    t7 = im[80];
+    t4 = re[104];
+    t3 = im[104];
+    t13 = re[8];
+    t17 = im[8];
+    t14 = re[32];
+    t2 = im[32];
+    t8 = re[56];
+    t10 = im[56];
+    t11 = t4 + t8;
+    t1 = t3 + t10;
+    t15 = t13 + t14;
+    t6 = t17 + t2;
+    t19 = t4 - t8;
+    t18 = t3 - t10;
+    t5 = t13 - t14;
+    t0 = t17 - t2;
+    t12 = t11 + t15;
+    t9 = t1 + t6;
+    t4 = t11 - t15;
+    t8 = C81 * t4;
+    t3 = t1 - t6;
+    t10 = C81 * t3;
+    t13 = C82 * t12;
+    t14 = t16 - t13;
+    t17 = C82 * t9;
+    t2 = t7 - t17;
+    t11 = t14 + t8;
+    t15 = t2 + t10;
+    t4 = t14 - t8;
+    t1 = t2 - t10;
+    t6 = C83 * t19;
+    t3 = C84 * t5;
+    t13 = t6 + t3;
+    t17 = C83 * t18;
+    t14 = C84 * t0;
+    t8 = t17 + t14;
+    t2 = C84 * t19;
+    t10 = C83 * t5;
+    t6 = t2 - t10;
+    t3 = C84 * t18;
+    t17 = C83 * t0;
+    t14 = t3 - t17;
+    t19 = t16 + t12;
+    t5 = t7 + t9;
+    t2 = t11 + t8;
+    t10 = t15 - t13;
+    t18 = t4 + t14;
+    t0 = t1 - t6;
+    t3 = t4 - t14;
+    t17 = t1 + t6;
+    t16 = t11 - t8;
+    t12 = t15 + t13;
+    re[80] = t19;
+    im[80] = t5;
+    re[104] = t2;
+    im[104] = t10;
+    re[8] = t18;
+    im[8] = t0;
+    re[32] = t3;
+    im[32] = t17;
+    re[56] = t16;
+    im[56] = t12;
+    t7 = re[95];
+    t9 = im[95];
+    t4 = re[119];
+    t14 = im[119];
+    t1 = re[23];
+    t6 = im[23];
+    t11 = re[47];
+    t8 = im[47];
+    t15 = re[71];
+    t13 = im[71];
+    t19 = t4 + t15;
+    t5 = t14 + t13;
+    t2 = t1 + t11;
+    t10 = t6 + t8;
+    t18 = t4 - t15;
+    t0 = t14 - t13;
+    t3 = t1 - t11;
+    t17 = t6 - t8;
+    t16 = t19 + t2;
+    t12 = t5 + t10;
+    t4 = t19 - t2;
+    t15 = C81 * t4;
+    t14 = t5 - t10;
+    t13 = C81 * t14;
+    t1 = C82 * t16;
+    t11 = t7 - t1;
+    t6 = C82 * t12;
+    t8 = t9 - t6;
+    t19 = t11 + t15;
+    t2 = t8 + t13;
+    t4 = t11 - t15;
+    t5 = t8 - t13;
+    t10 = C83 * t18;
+    t14 = C84 * t3;
+    t1 = t10 + t14;
+    t6 = C83 * t0;
+    t11 = C84 * t17;
+    t15 = t6 + t11;
+    t8 = C84 * t18;
+    t13 = C83 * t3;
+    t10 = t8 - t13;
+    t14 = C84 * t0;
+    t6 = C83 * t17;
+    t11 = t14 - t6;
+    t18 = t7 + t16;
+    t3 = t9 + t12;
+    t8 = t19 + t15;
+    t13 = t2 - t1;
+    t0 = t4 + t11;
+    t17 = t5 - t10;
+    t14 = t4 - t11;
+    t6 = t5 + t10;
+    t7 = t19 - t15;
+    t16 = t2 + t1;
+    re[95] = t18;
+    im[95] = t3;
+    re[119] = t8;
+    im[119] = t13;
+    re[23] = t0;
+    im[23] = t17;
+    re[47] = t14;
+    im[47] = t6;
+    re[71] = t7;
+    im[71] = t16;
+    t9 = re[110];
+    t12 = im[110];
+    t4 = re[14];
+    t11 = im[14];
+    t5 = re[38];
+    t10 = im[38];
+    t19 = re[62];
+    t15 = im[62];
+    t2 = re[86];
+    t1 = im[86];
+    t18 = t4 + t2;
+    t3 = t11 + t1;
+    t8 = t5 + t19;
+    t13 = t10 + t15;
+    t0 = t4 - t2;
+    t17 = t11 - t1;
+    t14 = t5 - t19;
+    t6 = t10 - t15;
+    t7 = t18 + t8;
+    t16 = t3 + t13;
+    t4 = t18 - t8;
+    t2 = C81 * t4;
+    t11 = t3 - t13;
+    t1 = C81 * t11;
+    t5 = C82 * t7;
+    t19 = t9 - t5;
+    t10 = C82 * t16;
+    t15 = t12 - t10;
+    t18 = t19 + t2;
+    t8 = t15 + t1;
+    t4 = t19 - t2;
+    t3 = t15 - t1;
+    t13 = C83 * t0;
+    t11 = C84 * t14;
+    t5 = t13 + t11;
+    t10 = C83 * t17;
+    t19 = C84 * t6;
+    t2 = t10 + t19;
+    t15 = C84 * t0;
+    t1 = C83 * t14;
+    t13 = t15 - t1;
+    t11 = C84 * t17;
+    t10 = C83 * t6;
+    t19 = t11 - t10;
+    t0 = t9 + t7;
+    t14 = t12 + t16;
+    t15 = t18 + t2;
+    t1 = t8 - t5;
+    t17 = t4 + t19;
+    t6 = t3 - t13;
+    t11 = t4 - t19;
+    t10 = t3 + t13;
+    t9 = t18 - t2;
+    t7 = t8 + t5;
+    re[110] = t0;
+    im[110] = t14;
+    re[14] = t15;
+    im[14] = t1;
+    re[38] = t17;
+    im[38] = t6;
+    re[62] = t11;
+    im[62] = t10;
+    re[86] = t9;
+    im[86] = t7;
+    t12 = re[5];
+    t16 = im[5];
+    t4 = re[29];
+    t19 = im[29];
+    t3 = re[53];
+    t13 = im[53];
+    t18 = re[77];
+    t2 = im[77];
+    t8 = re[101];
+    t5 = im[101];
+    t0 = t4 + t8;
+    t14 = t19 + t5;
+    t15 = t3 + t18;
+    t1 = t13 + t2;
+    t17 = t4 - t8;
+    t6 = t19 - t5;
+    t11 = t3 - t18;
+    t10 = t13 - t2;
+    t9 = t0 + t15;
+    t7 = t14 + t1;
+    t4 = t0 - t15;
+    t8 = C81 * t4;
+    t19 = t14 - t1;
+    t5 = C81 * t19;
+    t3 = C82 * t9;
+    t18 = t12 - t3;
+    t13 = C82 * t7;
+    t2 = t16 - t13;
+    t0 = t18 + t8;
+    t15 = t2 + t5;
+    t4 = t18 - t8;
+    t14 = t2 - t5;
+    t1 = C83 * t17;
+    t19 = C84 * t11;
+    t3 = t1 + t19;
+    t13 = C83 * t6;
+    t18 = C84 * t10;
+    t8 = t13 + t18;
+    t2 = C84 * t17;
+    t5 = C83 * t11;
+    t1 = t2 - t5;
+    t19 = C84 * t6;
+    t13 = C83 * t10;
+    t18 = t19 - t13;
+    t17 = t12 + t9;
+    t11 = t16 + t7;
+    t2 = t0 + t8;
+    t5 = t15 - t3;
+    t6 = t4 + t18;
+    t10 = t14 - t1;
+    t19 = t4 - t18;
+    t13 = t14 + t1;
+    t12 = t0 - t8;
+    t9 = t15 + t3;
+    re[5] = t17;
+    im[5] = t11;
+    re[29] = t2;
+    im[29] = t5;
+    re[53] = t6;
+    im[53] = t10;
+    re[77] = t19;
+    im[77] = t13;
+    re[101] = t12;
+    im[101] = t9;
+    t16 = re[20];
+    t7 = im[20];
+    t4 = re[44];
+    t18 = im[44];
+    t14 = re[68];
+    t1 = im[68];
+    t0 = re[92];
+    t8 = im[92];
+    t15 = re[116];
+    t3 = im[116];
+    t17 = t4 + t15;
+    t11 = t18 + t3;
+    t2 = t14 + t0;
+    t5 = t1 + t8;
+    t6 = t4 - t15;
+    t10 = t18 - t3;
+    t19 = t14 - t0;
+    t13 = t1 - t8;
+    t12 = t17 + t2;
+    t9 = t11 + t5;
+    t4 = t17 - t2;
+    t15 = C81 * t4;
+    t18 = t11 - t5;
+    t3 = C81 * t18;
+    t14 = C82 * t12;
+    t0 = t16 - t14;
+    t1 = C82 * t9;
+    t8 = t7 - t1;
+    t17 = t0 + t15;
+    t2 = t8 + t3;
+    t4 = t0 - t15;
+    t11 = t8 - t3;
+    t5 = C83 * t6;
+    t18 = C84 * t19;
+    t14 = t5 + t18;
+    t1 = C83 * t10;
+    t0 = C84 * t13;
+    t15 = t1 + t0;
+    t8 = C84 * t6;
+    t3 = C83 * t19;
+    t5 = t8 - t3;
+    t18 = C84 * t10;
+    t1 = C83 * t13;
+    t0 = t18 - t1;
+    t6 = t16 + t12;
+    t19 = t7 + t9;
+    t8 = t17 + t15;
+    t3 = t2 - t14;
+    t10 = t4 + t0;
+    t13 = t11 - t5;
+    t18 = t4 - t0;
+    t1 = t11 + t5;
+    t16 = t17 - t15;
+    t12 = t2 + t14;
+    re[20] = t6;
+    im[20] = t19;
+    re[44] = t8;
+    im[44] = t3;
+    re[68] = t10;
+    im[68] = t13;
+    re[92] = t18;
+    im[92] = t1;
+    re[116] = t16;
+    im[116] = t12;
+    t7 = re[35];
+    t9 = im[35];
+    t4 = re[59];
+    t0 = im[59];
+    t11 = re[83];
+    t5 = im[83];
+    t17 = re[107];
+    t15 = im[107];
+    t2 = re[11];
+    t14 = im[11];
+    t6 = t4 + t2;
+    t19 = t0 + t14;
+    t8 = t11 + t17;
+    t3 = t5 + t15;
+    t10 = t4 - t2;
+    t13 = t0 - t14;
+    t18 = t11 - t17;
+    t1 = t5 - t15;
+    t16 = t6 + t8;
+    t12 = t19 + t3;
+    t4 = t6 - t8;
+    t2 = C81 * t4;
+    t0 = t19 - t3;
+    t14 = C81 * t0;
+    t11 = C82 * t16;
+    t17 = t7 - t11;
+    t5 = C82 * t12;
+    t15 = t9 - t5;
+    t6 = t17 + t2;
+    t8 = t15 + t14;
+    t4 = t17 - t2;
+    t19 = t15 - t14;
+    t3 = C83 * t10;
+    t0 = C84 * t18;
+    t11 = t3 + t0;
+    t5 = C83 * t13;
+    t17 = C84 * t1;
+    t2 = t5 + t17;
+    t15 = C84 * t10;
+    t14 = C83 * t18;
+    t3 = t15 - t14;
+    t0 = C84 * t13;
+    t5 = C83 * t1;
+    t17 = t0 - t5;
+    t10 = t7 + t16;
+    t18 = t9 + t12;
+    t15 = t6 + t2;
+    t14 = t8 - t11;
+    t13 = t4 + t17;
+    t1 = t19 - t3;
+    t0 = t4 - t17;
+    t5 = t19 + t3;
+    t7 = t6 - t2;
+    t16 = t8 + t11;
+    re[35] = t10;
+    im[35] = t18;
+    re[59] = t15;
+    im[59] = t14;
+    re[83] = t13;
+    im[83] = t1;
+    re[107] = t0;
+    im[107] = t5;
+    re[11] = t7;
+    im[11] = t16;
+    t9 = re[50];
+    t12 = im[50];
+    t4 = re[74];
+    t17 = im[74];
+    t19 = re[98];
+    t3 = im[98];
+    t6 = re[2];
+    t2 = im[2];
+    t8 = re[26];
+    t11 = im[26];
+    t10 = t4 + t8;
+    t18 = t17 + t11;
+    t15 = t19 + t6;
+    t14 = t3 + t2;
+    t13 = t4 - t8;
+    t1 = t17 - t11;
+    t0 = t19 - t6;
+    t5 = t3 - t2;
+    t7 = t10 + t15;
+    t16 = t18 + t14;
+    t4 = t10 - t15;
+    t8 = C81 * t4;
+    t17 = t18 - t14;
+    t11 = C81 * t17;
+    t19 = C82 * t7;
+    t6 = t9 - t19;
+    t3 = C82 * t16;
+    t2 = t12 - t3;
+    t10 = t6 + t8;
+    t15 = t2 + t11;
+    t4 = t6 - t8;
+    t18 = t2 - t11;
+    t14 = C83 * t13;
+    t17 = C84 * t0;
+    t19 = t14 + t17;
+    t3 = C83 * t1;
+    t6 = C84 * t5;
+    t8 = t3 + t6;
+    t2 = C84 * t13;
+    t11 = C83 * t0;
+    t14 = t2 - t11;
+    t17 = C84 * t1;
+    t3 = C83 * t5;
+    t6 = t17 - t3;
+    t13 = t9 + t7;
+    t0 = t12 + t16;
+    t2 = t10 + t8;
+    t11 = t15 - t19;
+    t1 = t4 + t6;
+    t5 = t18 - t14;
+    t17 = t4 - t6;
+    t3 = t18 + t14;
+    t9 = t10 - t8;
+    t7 = t15 + t19;
+    re[50] = t13;
+    im[50] = t0;
+    re[74] = t2;
+    im[74] = t11;
+    re[98] = t1;
+    im[98] = t5;
+    re[2] = t17;
+    im[2] = t3;
+    re[26] = t9;
+    im[26] = t7;
+    t12 = re[65];
+    t16 = im[65];
+    t4 = re[89];
+    t6 = im[89];
+    t18 = re[113];
+    t14 = im[113];
+    t10 = re[17];
+    t8 = im[17];
+    t15 = re[41];
+    t19 = im[41];
+    t13 = t4 + t15;
+    t0 = t6 + t19;
+    t2 = t18 + t10;
+    t11 = t14 + t8;
+    t1 = t4 - t15;
+    t5 = t6 - t19;
+    t17 = t18 - t10;
+    t3 = t14 - t8;
+    t9 = t13 + t2;
+    t7 = t0 + t11;
+    t4 = t13 - t2;
+    t15 = C81 * t4;
+    t6 = t0 - t11;
+    t19 = C81 * t6;
+    t18 = C82 * t9;
+    t10 = t12 - t18;
+    t14 = C82 * t7;
+    t8 = t16 - t14;
+    t13 = t10 + t15;
+    t2 = t8 + t19;
+    t4 = t10 - t15;
+    t0 = t8 - t19;
+    t11 = C83 * t1;
+    t6 = C84 * t17;
+    t18 = t11 + t6;
+    t14 = C83 * t5;
+    t10 = C84 * t3;
+    t15 = t14 + t10;
+    t8 = C84 * t1;
+    t19 = C83 * t17;
+    t11 = t8 - t19;
+    t6 = C84 * t5;
+    t14 = C83 * t3;
+    t10 = t6 - t14;
+    t1 = t12 + t9;
+    t17 = t16 + t7;
+    t8 = t13 + t15;
+    t19 = t2 - t18;
+    t5 = t4 + t10;
+    t3 = t0 - t11;
+    t6 = t4 - t10;
+    t14 = t0 + t11;
+    t12 = t13 - t15;
+    t9 = t2 + t18;
+    re[65] = t1;
+    im[65] = t17;
+    re[89] = t8;
+    im[89] = t19;
+    re[113] = t5;
+    im[113] = t3;
+    re[17] = t6;
+    im[17] = t14;
+    re[41] = t12;
+    im[41] = t9;
+    t16 = re[0];
+    t7 = im[0];
+    t4 = re[40];
+    t10 = im[40];
+    t0 = re[80];
+    t11 = im[80];
+    t13 = t4 + t0;
+    t15 = t10 + t11;
+    t2 = C85 * t13;
+    t18 = t16 - t2;
+    t1 = C85 * t15;
+    t17 = t7 - t1;
+    t8 = t4 - t0;
+    t19 = C86 * t8;
+    t5 = t10 - t11;
+    t3 = C86 * t5;
+    t6 = t16 + t13;
+    t14 = t7 + t15;
+    t12 = t18 + t3;
+    t9 = t17 - t19;
+    t2 = t18 - t3;
+    t1 = t17 + t19;
+    t4 = (-C87) * t6;
+    t0 = (-C88) * t14;
+    t8 = t4 + t0;
+    t10 = 0.08896202493476155 * t8;
+    y[359] = t10;
+    t11 = 0.08839478579440686 * t8;
+    y[360] = t11;
+    t5 = C88 * t6;
+    t16 = (-C87) * t14;
+    t13 = t5 + t16;
+    t7 = 0.04644169441234319 * t13;
+    y[119] = t7;
+    t15 = (-0.04752735458669829) * t13;
+    y[120] = t15;
+    t18 = (-C89) * t12;
+    t3 = (-C90) * t9;
+    t17 = t18 + t3;
+    t19 = 0.09084055835569309 * t17;
+    y[279] = t19;
+    t4 = 0.014293156561901202 * t17;
+    y[440] = t4;
+    t0 = C90 * t12;
+    t10 = (-C89) * t9;
+    t8 = t0 + t10;
+    y[39] = 0;
+    t11 = (-0.09173582245832897) * t8;
+    y[200] = t11;
+    t6 = C91 * t2;
+    t14 = C92 * t1;
+    t5 = t6 + t14;
+    y[40] = 0;
+    t16 = (-0.0916593323593214) * t5;
+    y[199] = t16;
+    t7 = (-C92) * t2;
+    t13 = C91 * t1;
+    t15 = t7 + t13;
+    t18 = 0.0909163651843452 * t15;
+    y[280] = t18;
+    t3 = 0.015015322977163095 * t15;
+    y[439] = t3;
+    t19 = re[39];
+    t17 = im[39];
+    t4 = re[79];
+    t12 = im[79];
+    t9 = re[119];
+    t0 = im[119];
+    t10 = t4 + t9;
+    t8 = t12 + t0;
+    t11 = C85 * t10;
+    t6 = t19 - t11;
+    t14 = C85 * t8;
+    t5 = t17 - t14;
+    t16 = t4 - t9;
+    t2 = C86 * t16;
+    t1 = t12 - t0;
+    t7 = C86 * t1;
+    t13 = t19 + t10;
+    t18 = t17 + t8;
+    t15 = t6 + t7;
+    t3 = t5 - t2;
+    t11 = t6 - t7;
+    t14 = t5 + t2;
+    t4 = C93 * t13;
+    t9 = C94 * t18;
+    t16 = t4 + t9;
+    y[42] = 0;
+    t12 = (-0.09148831176819235) * t16;
+    y[197] = t12;
+    t0 = (-C94) * t13;
+    t1 = C93 * t18;
+    t19 = t0 + t1;
+    t10 = 0.0910863166264106 * t19;
+    y[282] = t10;
+    t17 = 0.016511926279279197 * t19;
+    y[437] = t17;
+    t8 = (-C95) * t15;
+    t6 = (-C96) * t3;
+    t7 = t8 + t6;
+    t5 = 0.09003773116994462 * t7;
+    y[357] = t5;
+    t2 = 0.08720250941904868 * t7;
+    y[362] = t2;
+    t4 = C96 * t15;
+    t9 = (-C95) * t3;
+    t16 = t4 + t9;
+    t12 = 0.04426053611132889 * t16;
+    y[117] = t12;
+    t13 = (-0.0496869863118727) * t16;
+    y[122] = t13;
+    t18 = (-C97) * t11;
+    t0 = (-C98) * t14;
+    t1 = t18 + t0;
+    t10 = 0.09070677367426357 * t1;
+    y[277] = t10;
+    t19 = 0.012902477260925535 * t1;
+    y[442] = t19;
+    t17 = C98 * t11;
+    t8 = (-C97) * t14;
+    t6 = t17 + t8;
+    y[37] = 0;
+    t5 = (-0.09187112489811519) * t6;
+    y[202] = t5;
+    t7 = re[78];
+    t2 = im[78];
+    t15 = re[118];
+    t3 = im[118];
+    t4 = re[38];
+    t9 = im[38];
+    t12 = t15 + t4;
+    t16 = t3 + t9;
+    t13 = C85 * t12;
+    t18 = t7 - t13;
+    t0 = C85 * t16;
+    t10 = t2 - t0;
+    t1 = t15 - t4;
+    t19 = C86 * t1;
+    t11 = t3 - t9;
+    t14 = C86 * t11;
+    t17 = t7 + t12;
+    t8 = t2 + t16;
+    t6 = t18 + t14;
+    t5 = t10 - t19;
+    t13 = t18 - t14;
+    t0 = t10 + t19;
+    t15 = (-C99) * t17;
+    t4 = (-C100) * t8;
+    t1 = t15 + t4;
+    t3 = 0.09059613943028794 * t1;
+    y[275] = t3;
+    t9 = 0.011584653483930014 * t1;
+    y[444] = t9;
+    t11 = C100 * t17;
+    t7 = (-C99) * t8;
+    t12 = t11 + t7;
+    y[35] = 0;
+    t2 = (-0.09198331612955407) * t12;
+    y[204] = t2;
+    t16 = C101 * t6;
+    t18 = C102 * t5;
+    t14 = t16 + t18;
+    y[44] = 0;
+    t10 = (-0.09129279661173699) * t14;
+    y[195] = t10;
+    t19 = (-C102) * t6;
+    t15 = C101 * t5;
+    t4 = t19 + t15;
+    t3 = 0.09128138957966771 * t4;
+    y[284] = t3;
+    t1 = 0.018075962073785333 * t4;
+    y[435] = t1;
+    t9 = (-C103) * t13;
+    t17 = (-C104) * t0;
+    t8 = t9 + t17;
+    t11 = 0.09103571973635532 * t8;
+    y[355] = t11;
+    t7 = 0.08593441436671341 * t8;
+    y[364] = t7;
+    t12 = C104 * t13;
+    t2 = (-C103) * t0;
+    t16 = t12 + t2;
+    t18 = 0.042072022784559265 * t16;
+    y[115] = t18;
+    t14 = (-0.05182469812709293) * t16;
+    y[124] = t14;
+    t10 = re[117];
+    t6 = im[117];
+    t5 = re[37];
+    t19 = im[37];
+    t15 = re[77];
+    t3 = im[77];
+    t4 = t5 + t15;
+    t1 = t19 + t3;
+    t9 = C85 * t4;
+    t17 = t10 - t9;
+    t11 = C85 * t1;
+    t8 = t6 - t11;
+    t7 = t5 - t15;
+    t13 = C86 * t7;
+    t0 = t19 - t3;
+    t12 = C86 * t0;
+    t2 = t10 + t4;
+    t18 = t6 + t1;
+    t16 = t17 + t12;
+    t14 = t8 - t13;
+    t9 = t17 - t12;
+    t11 = t8 + t13;
+    t5 = (-C105) * t2;
+    t15 = (-C106) * t18;
+    t7 = t5 + t15;
+    t19 = 0.09195526554211034 * t7;
+    y[353] = t19;
+    t3 = 0.08459145275616263 * t7;
+    y[366] = t3;
+    t0 = C106 * t2;
+    t10 = (-C105) * t18;
+    t4 = t0 + t10;
+    t6 = 0.03988251285128333 * t4;
+    y[113] = t6;
+    t1 = (-0.05393506943227453) * t4;
+    y[126] = t1;
+    t17 = (-C107) * t16;
+    t12 = (-C108) * t14;
+    t8 = t17 + t12;
+    t13 = 0.09050785698244482 * t8;
+    y[273] = t13;
+    t5 = 0.010340424900205238 * t8;
+    y[446] = t5;
+    t15 = C108 * t16;
+    t19 = (-C107) * t14;
+    t7 = t15 + t19;
+    y[33] = 0;
+    t3 = (-0.09207303775792297) * t7;
+    y[206] = t3;
+    t2 = C109 * t9;
+    t18 = C110 * t11;
+    t0 = t2 + t18;
+    y[46] = 0;
+    t10 = (-0.09107277380945689) * t0;
+    y[193] = t10;
+    t6 = (-C110) * t9;
+    t4 = C109 * t11;
+    t1 = t6 + t4;
+    t17 = 0.09150191637698869 * t1;
+    y[286] = t17;
+    t12 = 0.019706630281976074 * t1;
+    y[433] = t12;
+    t13 = re[36];
+    t8 = im[36];
+    t5 = re[76];
+    t16 = im[76];
+    t14 = re[116];
+    t15 = im[116];
+    t19 = t5 + t14;
+    t7 = t16 + t15;
+    t3 = C85 * t19;
+    t2 = t13 - t3;
+    t18 = C85 * t7;
+    t0 = t8 - t18;
+    t10 = t5 - t14;
+    t9 = C86 * t10;
+    t11 = t16 - t15;
+    t6 = C86 * t11;
+    t4 = t13 + t19;
+    t17 = t8 + t7;
+    t1 = t2 + t6;
+    t12 = t0 - t9;
+    t3 = t2 - t6;
+    t18 = t0 + t9;
+    t5 = C111 * t4;
+    t14 = C112 * t17;
+    t10 = t5 + t14;
+    y[48] = 0;
+    t16 = (-0.09082768715553084) * t10;
+    y[191] = t16;
+    t15 = (-C112) * t4;
+    t11 = C111 * t17;
+    t13 = t15 + t11;
+    t19 = 0.09174882235043115 * t13;
+    y[288] = t19;
+    t8 = 0.02140019650804302 * t13;
+    y[431] = t8;
+    t7 = (-C113) * t1;
+    t2 = (-C114) * t12;
+    t6 = t7 + t2;
+    t0 = 0.09279483997724569 * t6;
+    y[351] = t0;
+    t9 = 0.08317465107752332 * t6;
+    y[368] = t9;
+    t5 = C114 * t1;
+    t14 = (-C113) * t12;
+    t10 = t5 + t14;
+    t16 = 0.03769797295232574 * t10;
+    y[111] = t16;
+    t4 = (-0.05601407996358747) * t10;
+    y[128] = t4;
+    t17 = (-C115) * t3;
+    t15 = (-C116) * t18;
+    t11 = t17 + t15;
+    t19 = 0.09044079022064527 * t11;
+    y[271] = t19;
+    t13 = 0.009170726184912756 * t11;
+    y[448] = t13;
+    t8 = C116 * t3;
+    t7 = (-C115) * t18;
+    t2 = t8 + t7;
+    y[31] = 0;
+    t0 = (-0.09214131491999118) * t2;
+    y[208] = t0;
+    t6 = re[75];
+    t9 = im[75];
+    t1 = re[115];
+    t12 = im[115];
+    t5 = re[35];
+    t14 = im[35];
+    t16 = t1 + t5;
+    t10 = t12 + t14;
+    t4 = C85 * t16;
+    t17 = t6 - t4;
+    t15 = C85 * t10;
+    t19 = t9 - t15;
+    t11 = t1 - t5;
+    t13 = C86 * t11;
+    t3 = t12 - t14;
+    t18 = C86 * t3;
+    t8 = t6 + t16;
+    t7 = t9 + t10;
+    t2 = t17 + t18;
+    t0 = t19 - t13;
+    t4 = t17 - t18;
+    t15 = t19 + t13;
+    t1 = (-C117) * t8;
+    t5 = (-C118) * t7;
+    t11 = t1 + t5;
+    t12 = 0.09039410601073432 * t11;
+    y[269] = t12;
+    t14 = 0.008076005721060965 * t11;
+    y[450] = t14;
+    t3 = C118 * t8;
+    t6 = (-C117) * t7;
+    t16 = t3 + t6;
+    y[29] = 0;
+    t9 = (-0.09218890147930385) * t16;
+    y[210] = t9;
+    t10 = C119 * t2;
+    t17 = C120 * t0;
+    t18 = t10 + t17;
+    y[50] = 0;
+    t19 = (-0.09055806752110487) * t18;
+    y[189] = t19;
+    t13 = (-C120) * t2;
+    t1 = C119 * t0;
+    t5 = t13 + t1;
+    t12 = 0.09202198723367433 * t5;
+    y[290] = t12;
+    t11 = 0.023152962148670807 * t5;
+    y[429] = t11;
+    t14 = (-C121) * t4;
+    t8 = (-C122) * t15;
+    t7 = t14 + t8;
+    t3 = 0.09355656451896484 * t7;
+    y[349] = t3;
+    t6 = 0.08168637648109286 * t7;
+    y[370] = t6;
+    t16 = C122 * t4;
+    t9 = (-C121) * t15;
+    t10 = t16 + t9;
+    t17 = 0.035525090341131965 * t10;
+    y[109] = t17;
+    t18 = (-0.05805490461443574) * t10;
+    y[130] = t18;
+    t19 = re[114];
+    t2 = im[114];
+    t0 = re[34];
+    t13 = im[34];
+    t1 = re[74];
+    t12 = im[74];
+    t5 = t0 + t1;
+    t11 = t13 + t12;
+    t14 = C85 * t5;
+    t8 = t19 - t14;
+    t3 = C85 * t11;
+    t7 = t2 - t3;
+    t6 = t0 - t1;
+    t4 = C86 * t6;
+    t15 = t13 - t12;
+    t16 = C86 * t15;
+    t9 = t19 + t5;
+    t17 = t2 + t11;
+    t10 = t8 + t16;
+    t18 = t7 - t4;
+    t14 = t8 - t16;
+    t3 = t7 + t4;
+    t0 = (-C123) * t9;
+    t1 = (-C124) * t17;
+    t6 = t0 + t1;
+    t13 = 0.09424038580969314 * t6;
+    y[347] = t13;
+    t12 = 0.0801298334988885 * t6;
+    y[372] = t12;
+    t15 = C124 * t9;
+    t19 = (-C123) * t17;
+    t5 = t15 + t19;
+    t2 = 0.03336942781104587 * t5;
+    y[107] = t2;
+    t11 = (-0.060053305069332) * t5;
+    y[132] = t11;
+    t8 = (-C125) * t10;
+    t16 = (-C126) * t18;
+    t7 = t8 + t16;
+    t4 = 0.09036665294277783 * t7;
+    y[267] = t4;
+    t0 = 0.007056849639334466 * t7;
+    y[452] = t0;
+    t1 = C126 * t10;
+    t13 = (-C125) * t18;
+    t6 = t1 + t13;
+    y[27] = 0;
+    t12 = (-0.09221690813988859) * t6;
+    y[212] = t12;
+    t9 = C127 * t14;
+    t17 = C128 * t3;
+    t15 = t9 + t17;
+    y[52] = 0;
+    t19 = (-0.09026332159056506) * t15;
+    y[187] = t19;
+    t2 = (-C128) * t14;
+    t5 = C127 * t3;
+    t11 = t2 + t5;
+    t8 = 0.0923224759125681 * t11;
+    y[292] = t8;
+    t16 = 0.024962500697769584 * t11;
+    y[427] = t16;
+    t4 = re[33];
+    t7 = im[33];
+    t0 = re[73];
+    t10 = im[73];
+    t18 = re[113];
+    t1 = im[113];
+    t13 = t0 + t18;
+    t6 = t10 + t1;
+    t12 = C85 * t13;
+    t9 = t4 - t12;
+    t17 = C85 * t6;
+    t15 = t7 - t17;
+    t19 = t0 - t18;
+    t14 = C86 * t19;
+    t3 = t10 - t1;
+    t2 = C86 * t3;
+    t5 = t4 + t13;
+    t8 = t7 + t6;
+    t11 = t9 + t2;
+    t16 = t15 - t14;
+    t12 = t9 - t2;
+    t17 = t15 + t14;
+    t0 = C129 * t5;
+    t18 = C130 * t8;
+    t19 = t0 + t18;
+    y[54] = 0;
+    t10 = (-0.08994493919512188) * t19;
+    y[185] = t10;
+    t1 = (-C130) * t5;
+    t3 = C129 * t8;
+    t4 = t1 + t3;
+    t13 = 0.09264927418823903 * t4;
+    y[294] = t13;
+    t7 = 0.026825028972436063 * t4;
+    y[425] = t7;
+    t6 = (-C131) * t11;
+    t9 = (-C132) * t16;
+    t2 = t6 + t9;
+    t15 = 0.09484585771001464 * t2;
+    y[345] = t15;
+    t14 = 0.07850712007363697 * t2;
+    y[374] = t14;
+    t0 = C132 * t11;
+    t18 = (-C131) * t16;
+    t19 = t0 + t18;
+    t10 = 0.031238088585639097 * t19;
+    y[105] = t10;
+    t5 = (-0.06200503747723192) * t19;
+    y[134] = t5;
+    t8 = (-C133) * t12;
+    t1 = (-C134) * t17;
+    t3 = t8 + t1;
+    t13 = 0.09035733828476188 * t3;
+    y[265] = t13;
+    t4 = 0.006112672898287684 * t3;
+    y[454] = t4;
+    t7 = C134 * t12;
+    t6 = (-C133) * t17;
+    t9 = t7 + t6;
+    y[25] = 0;
+    t15 = (-0.0922264144951987) * t9;
+    y[214] = t15;
+    t2 = re[72];
+    t14 = im[72];
+    t11 = re[112];
+    t16 = im[112];
+    t0 = re[32];
+    t18 = im[32];
+    t10 = t11 + t0;
+    t19 = t16 + t18;
+    t5 = C85 * t10;
+    t8 = t2 - t5;
+    t1 = C85 * t19;
+    t13 = t14 - t1;
+    t3 = t11 - t0;
+    t4 = C86 * t3;
+    t12 = t16 - t18;
+    t17 = C86 * t12;
+    t7 = t2 + t10;
+    t6 = t14 + t19;
+    t9 = t8 + t17;
+    t15 = t13 - t4;
+    t5 = t8 - t17;
+    t1 = t13 + t4;
+    t11 = (-C135) * t7;
+    t0 = (-C136) * t6;
+    t3 = t11 + t0;
+    t16 = 0.09036492994132213 * t3;
+    y[263] = t16;
+    t18 = 0.005243370587864342 * t3;
+    y[456] = t18;
+    t12 = C136 * t7;
+    t2 = (-C135) * t6;
+    t10 = t12 + t2;
+    y[23] = 0;
+    t14 = (-0.09221866645328587) * t10;
+    y[216] = t14;
+    t19 = C137 * t9;
+    t8 = C138 * t15;
+    t17 = t19 + t8;
+    t13 = 0.000329259000948847 * t17;
+    y[56] = t13;
+    t4 = (-0.0895480206469585) * t17;
+    y[183] = t4;
+    t11 = (-C138) * t9;
+    t0 = C137 * t15;
+    t16 = t11 + t0;
+    t3 = 0.09295427829844087 * t16;
+    y[296] = t3;
+    t18 = 0.02873634741694584 * t16;
+    y[423] = t18;
+    t7 = (-C139) * t5;
+    t6 = (-C140) * t1;
+    t12 = t7 + t6;
+    t2 = 0.0953754441237799 * t12;
+    y[343] = t2;
+    t10 = 0.07682020725123924 * t12;
+    y[376] = t10;
+    t14 = C140 * t5;
+    t19 = (-C139) * t1;
+    t8 = t14 + t19;
+    t13 = 0.029137704355627222 * t8;
+    y[103] = t13;
+    t17 = (-0.06390501141990558) * t8;
+    y[136] = t17;
+    t4 = re[111];
+    t9 = im[111];
+    t15 = re[31];
+    t11 = im[31];
+    t0 = re[71];
+    t3 = im[71];
+    t16 = t15 + t0;
+    t18 = t11 + t3;
+    t7 = C85 * t16;
+    t6 = t4 - t7;
+    t2 = C85 * t18;
+    t12 = t9 - t2;
+    t10 = t15 - t0;
+    t5 = C86 * t10;
+    t1 = t11 - t3;
+    t14 = C86 * t1;
+    t19 = t4 + t16;
+    t13 = t9 + t18;
+    t8 = t6 + t14;
+    t17 = t12 - t5;
+    t7 = t6 - t14;
+    t2 = t12 + t5;
+    t15 = (-C141) * t19;
+    t0 = (-C142) * t13;
+    t10 = t15 + t0;
+    t11 = 0.0958302170606977 * t10;
+    y[341] = t11;
+    t3 = 0.07507241738097777 * t10;
+    y[378] = t3;
+    t1 = C142 * t19;
+    t4 = (-C141) * t13;
+    t16 = t1 + t4;
+    t9 = 0.027074672896674333 * t16;
+    y[101] = t9;
+    t18 = (-0.06574932607311029) * t16;
+    y[138] = t18;
+    t6 = (-C143) * t8;
+    t14 = (-C144) * t17;
+    t12 = t6 + t14;
+    t5 = 0.09038829747800994 * t12;
+    y[261] = t5;
+    t15 = 0.004448082232380634 * t12;
+    y[458] = t15;
+    t0 = C144 * t8;
+    t11 = (-C143) * t17;
+    t10 = t0 + t11;
+    y[21] = 0;
+    t3 = (-0.09219482572244161) * t10;
+    y[218] = t3;
+    t19 = C145 * t7;
+    t13 = C146 * t2;
+    t1 = t19 + t13;
+    t4 = 0.0005543023788221308 * t1;
+    y[58] = t4;
+    t9 = (-0.08913894680518375) * t1;
+    y[181] = t9;
+    t16 = (-C146) * t7;
+    t18 = C145 * t2;
+    t6 = t16 + t18;
+    t14 = 0.09329614388539122 * t6;
+    y[298] = t14;
+    t5 = 0.030693222787216617 * t6;
+    y[421] = t5;
+    t12 = re[30];
+    t15 = im[30];
+    t8 = re[70];
+    t17 = im[70];
+    t0 = re[110];
+    t11 = im[110];
+    t10 = t8 + t0;
+    t3 = t17 + t11;
+    t19 = C85 * t10;
+    t13 = t12 - t19;
+    t4 = C85 * t3;
+    t1 = t15 - t4;
+    t9 = t8 - t0;
+    t7 = C86 * t9;
+    t2 = t17 - t11;
+    t16 = C86 * t2;
+    t18 = t12 + t10;
+    t14 = t15 + t3;
+    t6 = t13 + t16;
+    t5 = t1 - t7;
+    t19 = t13 - t16;
+    t4 = t1 + t7;
+    t8 = C147 * t18;
+    t0 = C148 * t14;
+    t9 = t8 + t0;
+    t17 = 0.0008692481724313596 * t9;
+    y[60] = t17;
+    t11 = (-0.08868530563218803) * t9;
+    y[179] = t11;
+    t2 = (-C148) * t18;
+    t12 = C147 * t14;
+    t10 = t2 + t12;
+    t15 = 0.09364478174038289 * t10;
+    y[300] = t15;
+    t3 = 0.03269174986983001 * t10;
+    y[419] = t3;
+    t13 = (-C149) * t6;
+    t16 = (-C150) * t5;
+    t1 = t13 + t16;
+    t7 = 0.09621138331081235 * t1;
+    y[339] = t7;
+    t8 = 0.07326697035985012 * t1;
+    y[380] = t8;
+    t0 = C150 * t6;
+    t17 = (-C149) * t5;
+    t9 = t0 + t17;
+    t11 = 0.02505487541976712 * t9;
+    y[99] = t11;
+    t18 = (-0.06753502854847021) * t9;
+    y[140] = t18;
+    t14 = (-C151) * t19;
+    t2 = (-C152) * t4;
+    t12 = t14 + t2;
+    t15 = 0.09042611495709132 * t12;
+    y[259] = t15;
+    t10 = 0.0037258660788030895 * t12;
+    y[460] = t10;
+    t3 = C152 * t19;
+    t13 = (-C151) * t4;
+    t16 = t3 + t13;
+    y[19] = 0;
+    t7 = (-0.09215626854352463) * t16;
+    y[220] = t7;
+    t1 = re[69];
+    t8 = im[69];
+    t6 = re[109];
+    t5 = im[109];
+    t0 = re[29];
+    t17 = im[29];
+    t11 = t6 + t0;
+    t9 = t5 + t17;
+    t18 = C85 * t11;
+    t14 = t1 - t18;
+    t2 = C85 * t9;
+    t15 = t8 - t2;
+    t12 = t6 - t0;
+    t10 = C86 * t12;
+    t19 = t5 - t17;
+    t4 = C86 * t19;
+    t3 = t1 + t11;
+    t13 = t8 + t9;
+    t16 = t14 + t4;
+    t7 = t15 - t10;
+    t18 = t14 - t4;
+    t2 = t15 + t10;
+    t6 = (-C153) * t3;
+    t0 = (-C154) * t13;
+    t12 = t6 + t0;
+    t5 = 0.0904771972914263 * t12;
+    y[257] = t5;
+    t17 = 0.0030761966919491423 * t12;
+    y[462] = t17;
+    t19 = C154 * t3;
+    t1 = (-C153) * t13;
+    t11 = t19 + t1;
+    y[17] = 0;
+    t8 = (-0.09210423822581212) * t11;
+    y[222] = t8;
+    t9 = C155 * t16;
+    t14 = C156 * t7;
+    t4 = t9 + t14;
+    t15 = 0.001266586606840836 * t4;
+    y[62] = t15;
+    t10 = (-0.08818615927816541) * t4;
+    y[177] = t10;
+    t6 = (-C156) * t16;
+    t0 = C155 * t7;
+    t5 = t6 + t0;
+    t12 = 0.09399827813076395 * t5;
+    y[302] = t12;
+    t17 = 0.034728147276250475 * t5;
+    y[417] = t17;
+    t3 = (-C157) * t18;
+    t13 = (-C158) * t2;
+    t19 = t3 + t13;
+    t1 = 0.09652165615928737 * t19;
+    y[337] = t1;
+    t11 = 0.07140668037545762 * t19;
+    y[382] = t11;
+    t8 = C158 * t18;
+    t9 = (-C157) * t2;
+    t14 = t8 + t9;
+    t15 = 0.02308496315134304 * t14;
+    y[97] = t15;
+    t4 = (-0.06925816458302594) * t14;
+    y[142] = t4;
+}
+
+/**
+ *  Part 4 of ApplyWindowedIMDCT_W75_240().
+ * 
+ *  @param {Number[]} X 
+ *    - The input block (240 points).
+ *  @param {Number[]} y 
+ *    - The array that would contain the output block (480 points).
+ *  @param {Number[]} re 
+ *    - The scratch buffer (real part, 120 points).
+ *  @param {Number[]} im 
+ *    - The scratch buffer (imaginary part, 120 points).
+ */
+function ApplyWindowedIMDCT_W75_240_Part4(X, y, re, im) {
+    let t0, t1, t10, t11, t12, t13, t14, t15, t16, t17, t18, t19, t2, t3, t4, t5, t6, t7, t8, t9;
+    const C0 = 0.5;
+    const C1 = 0.8660254037844386;
+    const C2 = 0.9871711222448248;
+    const C3 = 0.159665824163761;
+    const C4 = 0.7750823576645314;
+    const C5 = 0.6318602209644087;
+    const C6 = 0.3553109012804161;
+    const C7 = 0.9347481818282924;
+    const C8 = 0.34304498527233984;
+    const C9 = 0.9393189756837131;
+    const C10 = 0.984996587835043;
+    const C11 = 0.1725738159551517;
+    const C12 = 0.7667451597285615;
+    const C13 = 0.641951602562703;
+    const C14 = 0.758276583956687;
+    const C15 = 0.6519329890586743;
+    const C16 = 0.3307202902720374;
+    const C17 = 0.9437288220682779;
+    const C18 = 0.9826532793307118;
+    const C19 = 0.18545223811159092;
+    const C20 = 0.9801415982456801;
+    const C21 = 0.19829888398174045;
+    const C22 = 0.74967808139577;
+    const C23 = 0.6618026701931303;
+    const C24 = 0.3183389280525497;
+    const C25 = 0.9479769653775104;
+    const C26 = 0.30590302009655346;
+    const C27 = 0.9520626777139243;
+    const C28 = 0.9774619749435719;
+    const C29 = 0.21111155235896514;
+    const C30 = 0.7409511253549591;
+    const C31 = 0.6715589548470183;
+    const C32 = 0.7320972111532454;
+    const C33 = 0.6812001713311883;
+    const C34 = 0.2934146972328567;
+    const C35 = 0.9559852590117439;
+    const C36 = 0.974614868564045;
+    const C37 = 0.22388804785849836;
+    const C38 = 0.9716007669441208;
+    const C39 = 0.23662618129360988;
+    const C40 = 0.7231178558632475;
+    const C41 = 0.6907246676728287;
+    const C42 = 0.2808760992712921;
+    const C43 = 0.9597440371568574;
+    const C44 = 0.2682893746360714;
+    const C45 = 0.9633383681019799;
+    const C46 = 0.968420186534595;
+    const C47 = 0.24932377005071168;
+    const C48 = 0.7140145980512682;
+    const C49 = 0.7001308118985237;
+    const C50 = 0.7047889975136701;
+    const C51 = 0.709416992313883;
+    const C52 = 0.2556566799976644;
+    const C53 = 0.9667676359770075;
+    const C54 = 0.9650736723115474;
+    const C55 = 0.26197863846333747;
+    const C56 = 0.9615617976829619;
+    const C57 = 0.27458861818493235;
+    const C58 = 0.6954426350096117;
+    const C59 = 0.7185816177796981;
+    const C60 = 0.24298017990326387;
+    const C61 = 0.970031253194544;
+    const C62 = 0.23026204640590237;
+    const C63 = 0.97312866055058;
+    const C64 = 0.9578851643904772;
+    const C65 = 0.2871515485603873;
+    const C66 = 0.6859771119901928;
+    const C67 = 0.7276231179845748;
+    const C68 = 0.6763940503240542;
+    const C69 = 0.736539943713999;
+    const C70 = 0.21750445869228147;
+    const C71 = 0.9760593273203108;
+    const C72 = 0.9540444024062804;
+    const C73 = 0.2996652769962566;
+    const C74 = 0.9500401698251654;
+    const C75 = 0.3121276593295937;
+    const C76 = 0.6666950920194786;
+    const C77 = 0.7453305671157858;
+    const C78 = 0.2047096027093796;
+    const C79 = 0.9788227513490724;
+    const C80 = 0.19187967078990142;
+    const C81 = 0.9814184591383835;
+    const C82 = 0.945873152751771;
+    const C83 = 0.32453656019534216;
+    const C84 = 0.6568818989430413;
+    const C85 = 0.7539934819618695;
+    const C86 = 0.6469561525348573;
+    const C87 = 0.7625272039063882;
+    const C88 = 0.17901686127663266;
+    const C89 = 0.9838460059270774;
+    const C90 = 0.9415440651830208;
+    const C91 = 0.33688985339222005;
+    const C92 = 0.9370536488857836;
+    const C93 = 0.34918542224703286;
+    const C94 = 0.6369195535204759;
+    const C95 = 0.7709302707400181;
+    const C96 = 0.16612337814576547;
+    const C97 = 0.9861049757675088;
+    const C98 = 0.15320143062925848;
+    const C99 = 0.9881949815968246;
+    const C100 = 0.9324026732697752;
+    const C101 = 0.361421159977355;
+    const C102 = 0.6267738216194696;
+    const C103 = 0.7792012426405167;
+    const C104 = 0.6165206952507691;
+    const C105 = 0.7873387024194278;
+    const C106 = 0.14025323283629626;
+    const C107 = 0.9901156653032855;
+    const C108 = 0.927591935255724;
+    const C109 = 0.37359497005251635;
+    const C110 = 0.9226222591388232;
+    const C111 = 0.3857047665528313;
+    const C112 = 0.6061619312347947;
+    const C113 = 0.79534125576491;
+    const C114 = 0.1272810033739132;
+    const C115 = 0.991866697787626;
+    const C116 = 0.1142869649668464;
+    const C117 = 0.9934477790194444;
+    const C118 = 0.9174944964474913;
+    const C119 = 0.39774847452701106;
+    const C120 = 0.5956993044924334;
+    const C121 = 0.8032075314806449;
+    const C122 = 0.5851346077409155;
+    const C123 = 0.8109361817207843;
+    const C124 = 0.10127334407668342;
+    const C125 = 0.9948586380886109;
+    const C126 = 0.9122095257974677;
+    const C127 = 0.4097240303476953;
+    const C128 = 0.9067682527412662;
+    const C129 = 0.4216293820650445;
+    const C130 = 0.5744696511866426;
+    const C131 = 0.8185258822208966;
+    const C132 = 0.08824237052036951;
+    const C133 = 0.9960990332516871;
+    const C134 = 0.0751962770881399;
+    const C135 = 0.9971687519733476;
+    const C136 = 0.9011716096130131;
+    const C137 = 0.4334624897583309;
+    const C138 = 0.5637062622150166;
+    const C139 = 0.8259753325248732;
+    const C140 = 0.5528462850773279;
+    const C141 = 0.8332832562077542;
+    const C142 = 0.062137299160942724;
+    const C143 = 0.9980676109627962;
+    const C144 = 0.895420555368697;
+    const C145 = 0.4452213258854682;
+    const C146 = 0.8895160754218561;
+    const C147 = 0.4569038756304206;
+    const C148 = 0.5418915805747517;
+    const C149 = 0.840448401094438;
+    const C150 = 0.049067674327418015;
+    const C151 = 0.9987954562051724;
+    const C152 = 0.035989642000498374;
+    const C153 = 0.9993521629879409;
+    const C154 = 0.8834591814747328;
+    const C155 = 0.46850813724843143;
+    const C156 = 0.5308440257395095;
+    const C157 = 0.8474695394742344;
+    const C158 = 0.5197055135132492;
+    const C159 = 0.8543454683112272;
+    const C160 = 0.02290544303369714;
+    const C161 = 0.9997376359222604;
+    const C162 = 0.8772509113449243;
+    const C163 = 0.4800321224090111;
+    const C164 = 0.8708923287875567;
+    const C165 = 0.49147385653662823;
+    const C166 = 0.5084779524226998;
+    const C167 = 0.861075009450407;
+    const C168 = 0.009817319337149617;
+    const C169 = 0.999951808959328;
+    t10 = re[108];
+    t16 = im[108];
+    t7 = re[28];
+    t6 = im[28];
+    t0 = re[68];
+    t12 = im[68];
+    t5 = t7 + t0;
+    t17 = t6 + t12;
+    t3 = C0 * t5;
+    t13 = t10 - t3;
+    t1 = C0 * t17;
+    t19 = t16 - t1;
+    t11 = t7 - t0;
+    t18 = C1 * t11;
+    t2 = t6 - t12;
+    t8 = C1 * t2;
+    t9 = t10 + t5;
+    t15 = t16 + t17;
+    t14 = t13 + t8;
+    t4 = t19 - t18;
+    t3 = t13 - t8;
+    t1 = t19 + t18;
+    t7 = (-C2) * t9;
+    t0 = (-C3) * t15;
+    t11 = t7 + t0;
+    t6 = 0.0967631084341196 * t11;
+    y[335] = t6;
+    t12 = 0.06949540812097872 * t11;
+    y[384] = t12;
+    t2 = C3 * t9;
+    t10 = (-C2) * t15;
+    t5 = t2 + t10;
+    t16 = 0.02117182715100995 * t5;
+    y[95] = t16;
+    t17 = (-0.07091533825082738) * t5;
+    y[144] = t17;
+    t13 = (-C4) * t14;
+    t8 = (-C5) * t4;
+    t19 = t13 + t8;
+    t18 = 0.09054017105349113 * t19;
+    y[255] = t18;
+    t7 = 0.002497218153517526 * t19;
+    y[464] = t7;
+    t0 = C5 * t14;
+    t6 = (-C4) * t4;
+    t11 = t0 + t6;
+    y[15] = 0;
+    t12 = (-0.09204017660194169) * t11;
+    y[224] = t12;
+    t9 = C6 * t3;
+    t15 = C7 * t1;
+    t2 = t9 + t15;
+    t10 = 0.0017527181996514706 * t2;
+    y[64] = t10;
+    t16 = (-0.08763727041503364) * t2;
+    y[175] = t16;
+    t5 = (-C7) * t3;
+    t17 = C6 * t1;
+    t13 = t5 + t17;
+    t8 = 0.09435297960865555 * t13;
+    y[304] = t8;
+    t18 = 0.036797555316227276 * t13;
+    y[415] = t18;
+    t19 = re[27];
+    t7 = im[27];
+    t14 = re[67];
+    t4 = im[67];
+    t0 = re[107];
+    t6 = im[107];
+    t11 = t14 + t0;
+    t12 = t4 + t6;
+    t9 = C0 * t11;
+    t15 = t19 - t9;
+    t10 = C0 * t12;
+    t2 = t7 - t10;
+    t16 = t14 - t0;
+    t3 = C1 * t16;
+    t1 = t4 - t6;
+    t5 = C1 * t1;
+    t17 = t19 + t11;
+    t8 = t7 + t12;
+    t13 = t15 + t5;
+    t18 = t2 - t3;
+    t9 = t15 - t5;
+    t10 = t2 + t3;
+    t14 = C8 * t17;
+    t0 = C9 * t8;
+    t16 = t14 + t0;
+    t4 = 0.0023321697985883467 * t16;
+    y[66] = t4;
+    t6 = (-0.08703551219791075) * t16;
+    y[173] = t6;
+    t1 = (-C9) * t17;
+    t19 = C8 * t8;
+    t11 = t1 + t19;
+    t7 = 0.09470412254796516 * t11;
+    y[306] = t7;
+    t12 = 0.03889576143743222 * t11;
+    y[413] = t12;
+    t15 = (-C10) * t13;
+    t5 = (-C11) * t18;
+    t2 = t15 + t5;
+    t3 = 0.09693835832518913 * t2;
+    y[333] = t3;
+    t14 = 0.06753718307378472 * t2;
+    y[386] = t14;
+    t0 = C11 * t13;
+    t4 = (-C10) * t18;
+    t16 = t0 + t4;
+    t6 = 0.01931982303769135 * t16;
+    y[93] = t6;
+    t17 = (-0.07250511592434625) * t16;
+    y[146] = t17;
+    t8 = (-C12) * t9;
+    t1 = (-C13) * t10;
+    t19 = t8 + t1;
+    t7 = 0.09061382845181774 * t19;
+    y[253] = t7;
+    t11 = 0.001987292053496043 * t19;
+    y[466] = t11;
+    t12 = C13 * t9;
+    t15 = (-C12) * t10;
+    t5 = t12 + t15;
+    y[13] = 0;
+    t3 = (-0.09196535976585991) * t5;
+    y[226] = t3;
+    t2 = re[66];
+    t14 = im[66];
+    t13 = re[106];
+    t18 = im[106];
+    t0 = re[26];
+    t4 = im[26];
+    t6 = t13 + t0;
+    t16 = t18 + t4;
+    t17 = C0 * t6;
+    t8 = t2 - t17;
+    t1 = C0 * t16;
+    t7 = t14 - t1;
+    t19 = t13 - t0;
+    t11 = C1 * t19;
+    t9 = t18 - t4;
+    t10 = C1 * t9;
+    t12 = t2 + t6;
+    t15 = t14 + t16;
+    t5 = t8 + t10;
+    t3 = t7 - t11;
+    t17 = t8 - t10;
+    t1 = t7 + t11;
+    t13 = (-C14) * t12;
+    t0 = (-C15) * t15;
+    t19 = t13 + t0;
+    t18 = 0.09069677564541208 * t19;
+    y[251] = t18;
+    t4 = 0.0015455547772786204 * t19;
+    y[468] = t4;
+    t9 = C15 * t12;
+    t2 = (-C14) * t15;
+    t6 = t9 + t2;
+    y[11] = 0;
+    t14 = (-0.09188125238226012) * t6;
+    y[228] = t14;
+    t16 = C16 * t5;
+    t8 = C17 * t3;
+    t10 = t16 + t8;
+    t7 = 0.0030078610211779653 * t10;
+    y[68] = t7;
+    t11 = (-0.08637786614799858) * t10;
+    y[171] = t11;
+    t13 = (-C17) * t5;
+    t0 = C16 * t3;
+    t18 = t13 + t0;
+    t19 = 0.09504699657158702 * t18;
+    y[308] = t19;
+    t4 = 0.0410180473216129 * t18;
+    y[411] = t4;
+    t12 = (-C18) * t17;
+    t15 = (-C19) * t1;
+    t9 = t12 + t15;
+    t2 = 0.09705031121367907 * t9;
+    y[331] = t2;
+    t6 = 0.0655371423617569 * t9;
+    y[388] = t6;
+    t14 = C19 * t17;
+    t16 = (-C18) * t1;
+    t8 = t14 + t16;
+    t7 = 0.01753462890895542 * t8;
+    y[91] = t7;
+    t10 = (-0.07402515017647827) * t8;
+    y[148] = t10;
+    t11 = re[105];
+    t5 = im[105];
+    t3 = re[25];
+    t13 = im[25];
+    t0 = re[65];
+    t19 = im[65];
+    t18 = t3 + t0;
+    t4 = t13 + t19;
+    t12 = C0 * t18;
+    t15 = t11 - t12;
+    t2 = C0 * t4;
+    t9 = t5 - t2;
+    t6 = t3 - t0;
+    t17 = C1 * t6;
+    t1 = t13 - t19;
+    t14 = C1 * t1;
+    t16 = t11 + t18;
+    t7 = t5 + t4;
+    t8 = t15 + t14;
+    t10 = t9 - t17;
+    t12 = t15 - t14;
+    t2 = t9 + t17;
+    t3 = (-C20) * t16;
+    t0 = (-C21) * t7;
+    t6 = t3 + t0;
+    t13 = 0.09710297608583138 * t6;
+    y[329] = t13;
+    t19 = 0.06349934378312706 * t6;
+    y[390] = t19;
+    t1 = C21 * t16;
+    t11 = (-C20) * t7;
+    t18 = t1 + t11;
+    t5 = 0.015820600627638397 * t18;
+    y[89] = t5;
+    t4 = (-0.07547385127254332) * t18;
+    y[150] = t4;
+    t15 = (-C22) * t8;
+    t14 = (-C23) * t10;
+    t9 = t15 + t14;
+    t17 = 0.09078772377604616 * t9;
+    y[249] = t17;
+    t3 = 0.0011685767792350902 * t9;
+    y[470] = t3;
+    t0 = C23 * t8;
+    t13 = (-C22) * t10;
+    t6 = t0 + t13;
+    y[9] = 0;
+    t19 = (-0.09178920879093609) * t6;
+    y[230] = t19;
+    t16 = C24 * t12;
+    t7 = C25 * t2;
+    t1 = t16 + t7;
+    t11 = 0.003781295030218233 * t1;
+    y[70] = t11;
+    t5 = (-0.0856603118363894) * t1;
+    y[169] = t5;
+    t18 = (-C25) * t12;
+    t4 = C24 * t2;
+    t15 = t18 + t4;
+    t14 = 0.09537830588915777 * t15;
+    y[310] = t14;
+    t17 = 0.04315926346326986 * t15;
+    y[409] = t17;
+    t9 = re[24];
+    t3 = im[24];
+    t8 = re[64];
+    t10 = im[64];
+    t0 = re[104];
+    t13 = im[104];
+    t6 = t8 + t0;
+    t19 = t10 + t13;
+    t16 = C0 * t6;
+    t7 = t9 - t16;
+    t11 = C0 * t19;
+    t1 = t3 - t11;
+    t5 = t8 - t0;
+    t12 = C1 * t5;
+    t2 = t10 - t13;
+    t18 = C1 * t2;
+    t4 = t9 + t6;
+    t14 = t3 + t19;
+    t15 = t7 + t18;
+    t17 = t1 - t12;
+    t16 = t7 - t18;
+    t11 = t1 + t12;
+    t8 = C26 * t4;
+    t0 = C27 * t14;
+    t5 = t8 + t0;
+    t10 = 0.0046529099454776825 * t5;
+    y[72] = t10;
+    t13 = (-0.08488084990913544) * t5;
+    y[167] = t13;
+    t2 = (-C27) * t4;
+    t9 = C26 * t14;
+    t6 = t2 + t9;
+    t3 = 0.09569280241720633 * t6;
+    y[312] = t3;
+    t19 = 0.045315068730014604 * t6;
+    y[407] = t19;
+    t7 = (-C28) * t15;
+    t18 = (-C29) * t17;
+    t1 = t7 + t18;
+    t12 = 0.09709912723798485 * t1;
+    y[327] = t12;
+    t8 = 0.06142731431140673 * t1;
+    y[392] = t8;
+    t0 = C29 * t15;
+    t10 = (-C28) * t17;
+    t5 = t0 + t10;
+    t13 = 0.014182605054244018 * t5;
+    y[87] = t13;
+    t4 = (-0.0768506804043917) * t5;
+    y[152] = t4;
+    t14 = (-C30) * t16;
+    t2 = (-C31) * t11;
+    t9 = t14 + t2;
+    t3 = 0.09088527913459936 * t9;
+    y[247] = t3;
+    t6 = 0.0008531948944978419 * t9;
+    y[472] = t6;
+    t19 = C31 * t16;
+    t7 = (-C30) * t11;
+    t18 = t19 + t7;
+    y[7] = 0;
+    t12 = (-0.09169068316324167) * t18;
+    y[232] = t12;
+    t1 = re[63];
+    t8 = im[63];
+    t15 = re[103];
+    t17 = im[103];
+    t0 = re[23];
+    t10 = im[23];
+    t13 = t15 + t0;
+    t5 = t17 + t10;
+    t4 = C0 * t13;
+    t14 = t1 - t4;
+    t2 = C0 * t5;
+    t3 = t8 - t2;
+    t9 = t15 - t0;
+    t6 = C1 * t9;
+    t16 = t17 - t10;
+    t11 = C1 * t16;
+    t19 = t1 + t13;
+    t7 = t8 + t5;
+    t18 = t14 + t11;
+    t12 = t3 - t6;
+    t4 = t14 - t11;
+    t2 = t3 + t6;
+    t15 = (-C32) * t19;
+    t0 = (-C33) * t7;
+    t9 = t15 + t0;
+    t17 = 0.09098818490486592 * t9;
+    y[245] = t17;
+    t10 = 0.0005958118887355562 * t9;
+    y[474] = t10;
+    t16 = C33 * t19;
+    t1 = (-C32) * t7;
+    t13 = t16 + t1;
+    y[5] = 0;
+    t8 = (-0.09158698288185847) * t13;
+    y[234] = t8;
+    t5 = C34 * t18;
+    t14 = C35 * t12;
+    t11 = t5 + t14;
+    t3 = 0.005622135445844074 * t11;
+    y[74] = t3;
+    t6 = (-0.08403708295850383) * t11;
+    y[165] = t6;
+    t15 = (-C35) * t18;
+    t0 = C34 * t12;
+    t17 = t15 + t0;
+    t9 = 0.09598610074001072 * t17;
+    y[314] = t9;
+    t10 = 0.04748043250702334 * t17;
+    y[405] = t10;
+    t19 = (-C36) * t4;
+    t7 = (-C37) * t2;
+    t16 = t19 + t7;
+    t1 = 0.09704334336966204 * t16;
+    y[325] = t1;
+    t13 = 0.059326876889732816 * t16;
+    y[394] = t13;
+    t8 = C37 * t4;
+    t5 = (-C36) * t2;
+    t14 = t8 + t5;
+    t3 = 0.012624949394551927 * t14;
+    y[85] = t3;
+    t11 = (-0.07815409333098762) * t14;
+    y[154] = t11;
+    t6 = re[102];
+    t18 = im[102];
+    t12 = re[22];
+    t15 = im[22];
+    t0 = re[62];
+    t9 = im[62];
+    t17 = t12 + t0;
+    t10 = t15 + t9;
+    t19 = C0 * t17;
+    t7 = t6 - t19;
+    t1 = C0 * t10;
+    t16 = t18 - t1;
+    t13 = t12 - t0;
+    t4 = C1 * t13;
+    t2 = t15 - t9;
+    t8 = C1 * t2;
+    t5 = t6 + t17;
+    t3 = t18 + t10;
+    t14 = t7 + t8;
+    t11 = t16 - t4;
+    t19 = t7 - t8;
+    t1 = t16 + t4;
+    t12 = (-C38) * t5;
+    t0 = (-C39) * t3;
+    t13 = t12 + t0;
+    t15 = 0.09693980393114883 * t13;
+    y[323] = t15;
+    t9 = 0.05720267793605442 * t13;
+    y[396] = t9;
+    t2 = C39 * t5;
+    t6 = (-C38) * t3;
+    t17 = t2 + t6;
+    t18 = 0.011150290256942962 * t17;
+    y[83] = t18;
+    t10 = (-0.07938438658631503) * t17;
+    y[156] = t10;
+    t7 = (-C40) * t14;
+    t8 = (-C41) * t11;
+    t16 = t7 + t8;
+    t4 = 0.09109495310907251 * t16;
+    y[243] = t4;
+    t12 = 0.0003913811942012797 * t16;
+    y[476] = t12;
+    t0 = C41 * t14;
+    t15 = (-C40) * t11;
+    t13 = t0 + t15;
+    y[3] = 0;
+    t9 = (-0.09147963799218842) * t13;
+    y[236] = t9;
+    t5 = C42 * t19;
+    t3 = C43 * t1;
+    t2 = t5 + t3;
+    t6 = 0.006687843776213512 * t2;
+    y[76] = t6;
+    t18 = (-0.08312516910399824) * t2;
+    y[163] = t18;
+    t17 = (-C43) * t19;
+    t10 = C42 * t1;
+    t7 = t17 + t10;
+    t8 = 0.09625582992869657 * t7;
+    y[316] = t8;
+    t4 = 0.049649962585211385 * t7;
+    y[403] = t4;
+    t16 = re[21];
+    t12 = im[21];
+    t14 = re[61];
+    t11 = im[61];
+    t0 = re[101];
+    t15 = im[101];
+    t13 = t14 + t0;
+    t9 = t11 + t15;
+    t5 = C0 * t13;
+    t3 = t16 - t5;
+    t6 = C0 * t9;
+    t2 = t12 - t6;
+    t18 = t14 - t0;
+    t19 = C1 * t18;
+    t1 = t11 - t15;
+    t17 = C1 * t1;
+    t10 = t16 + t13;
+    t8 = t12 + t9;
+    t7 = t3 + t17;
+    t4 = t2 - t19;
+    t5 = t3 - t17;
+    t6 = t2 + t19;
+    t14 = C44 * t10;
+    t0 = C45 * t8;
+    t18 = t14 + t0;
+    t11 = 0.00784829303888874 * t18;
+    y[78] = t11;
+    t15 = (-0.08214494215885092) * t18;
+    y[161] = t15;
+    t1 = (-C45) * t10;
+    t16 = C44 * t8;
+    t13 = t1 + t16;
+    t12 = 0.09649583471076638 * t13;
+    y[318] = t12;
+    t9 = 0.051818729299763125 * t13;
+    y[401] = t9;
+    t3 = (-C46) * t7;
+    t17 = (-C47) * t4;
+    t2 = t3 + t17;
+    t19 = 0.0967912198161176 * t2;
+    y[321] = t19;
+    t14 = 0.055058748193673866 * t2;
+    y[398] = t14;
+    t0 = C47 * t7;
+    t11 = (-C46) * t4;
+    t18 = t0 + t11;
+    t15 = 0.00976233994080978 * t18;
+    y[81] = t15;
+    t10 = (-0.08054275100119243) * t18;
+    y[158] = t10;
+    t8 = (-C48) * t5;
+    t1 = (-C49) * t6;
+    t16 = t8 + t1;
+    t12 = 0.09120428548155567 * t16;
+    y[241] = t12;
+    t13 = 0.00023413481508896496 * t16;
+    y[478] = t13;
+    t9 = C49 * t5;
+    t3 = (-C48) * t6;
+    t17 = t9 + t3;
+    y[1] = 0;
+    t19 = (-0.0913699755371538) * t17;
+    y[238] = t19;
+    t2 = re[60];
+    t14 = im[60];
+    t7 = re[100];
+    t4 = im[100];
+    t0 = re[20];
+    t11 = im[20];
+    t15 = t7 + t0;
+    t18 = t4 + t11;
+    t10 = C0 * t15;
+    t8 = t2 - t10;
+    t1 = C0 * t18;
+    t12 = t14 - t1;
+    t16 = t7 - t0;
+    t13 = C1 * t16;
+    t5 = t4 - t11;
+    t6 = C1 * t5;
+    t9 = t2 + t15;
+    t3 = t14 + t18;
+    t17 = t8 + t6;
+    t19 = t12 - t13;
+    t10 = t8 - t6;
+    t1 = t12 + t13;
+    t7 = C50 * t9;
+    t0 = C51 * t3;
+    t16 = t7 + t0;
+    y[0] = 0;
+    t4 = (-0.09131475557438358) * t16;
+    y[239] = t4;
+    t11 = (-C51) * t9;
+    t5 = C50 * t3;
+    t2 = t11 + t5;
+    t15 = 0.09125943864072585 * t2;
+    y[240] = t15;
+    t14 = 0.0001687287062834231 * t2;
+    y[479] = t14;
+    t18 = C52 * t17;
+    t8 = C53 * t19;
+    t6 = t18 + t8;
+    t12 = 0.009101559537619174 * t6;
+    y[80] = t12;
+    t13 = (-0.08109490290798863) * t6;
+    y[159] = t13;
+    t7 = (-C53) * t17;
+    t0 = C52 * t19;
+    t16 = t7 + t0;
+    t4 = 0.09670175848871748 * t16;
+    y[320] = t4;
+    t9 = 0.05398125624826106 * t16;
+    y[399] = t9;
+    t3 = (-C54) * t10;
+    t11 = (-C55) * t1;
+    t5 = t3 + t11;
+    t15 = 0.0966031645769662 * t5;
+    y[319] = t15;
+    t2 = 0.0529011247003047 * t5;
+    y[400] = t2;
+    t14 = C55 * t10;
+    t18 = (-C54) * t1;
+    t8 = t14 + t18;
+    t12 = 0.008463448060253795 * t8;
+    y[79] = t12;
+    t6 = (-0.0816288725802624) * t8;
+    y[160] = t6;
+    t13 = re[99];
+    t17 = im[99];
+    t19 = re[19];
+    t7 = im[19];
+    t0 = re[59];
+    t4 = im[59];
+    t16 = t19 + t0;
+    t9 = t7 + t4;
+    t3 = C0 * t16;
+    t11 = t13 - t3;
+    t15 = C0 * t9;
+    t5 = t17 - t15;
+    t2 = t19 - t0;
+    t10 = C1 * t2;
+    t1 = t7 - t4;
+    t14 = C1 * t1;
+    t18 = t13 + t16;
+    t12 = t17 + t9;
+    t8 = t11 + t14;
+    t6 = t5 - t10;
+    t3 = t11 - t14;
+    t15 = t5 + t10;
+    t19 = (-C56) * t18;
+    t0 = (-C57) * t12;
+    t2 = t19 + t0;
+    t7 = 0.09637995258792109 * t2;
+    y[317] = t7;
+    t4 = 0.05073477379794547 * t2;
+    y[402] = t4;
+    t1 = C57 * t18;
+    t13 = (-C56) * t12;
+    t16 = t1 + t13;
+    t17 = 0.007256349955859877 * t16;
+    y[77] = t17;
+    t9 = (-0.08264357727773244) * t16;
+    y[162] = t9;
+    t11 = C58 * t8;
+    t14 = C59 * t6;
+    t5 = t11 + t14;
+    y[2] = 0;
+    t10 = (-0.09142501297733138) * t5;
+    y[237] = t10;
+    t19 = (-C59) * t8;
+    t0 = C58 * t6;
+    t7 = t19 + t0;
+    t2 = 0.09114938091832223 * t7;
+    y[242] = t2;
+    t4 = 0.0003074203471366065 * t7;
+    y[477] = t4;
+    t18 = C60 * t3;
+    t12 = C61 * t15;
+    t1 = t18 + t12;
+    t13 = 0.010445384859933385 * t1;
+    y[82] = t13;
+    t17 = (-0.07997250269761456) * t1;
+    y[157] = t17;
+    t16 = (-C61) * t3;
+    t9 = C60 * t15;
+    t11 = t16 + t9;
+    t14 = 0.09687085215339357 * t11;
+    y[322] = t14;
+    t5 = 0.05613281425607352 * t11;
+    y[397] = t5;
+    t10 = re[18];
+    t8 = im[18];
+    t6 = re[58];
+    t19 = im[58];
+    t0 = re[98];
+    t2 = im[98];
+    t7 = t6 + t0;
+    t4 = t19 + t2;
+    t18 = C0 * t7;
+    t12 = t10 - t18;
+    t13 = C0 * t4;
+    t1 = t8 - t13;
+    t17 = t6 - t0;
+    t3 = C1 * t17;
+    t15 = t19 - t2;
+    t16 = C1 * t15;
+    t9 = t10 + t7;
+    t14 = t8 + t4;
+    t11 = t12 + t16;
+    t5 = t1 - t3;
+    t18 = t12 - t16;
+    t13 = t1 + t3;
+    t6 = C62 * t9;
+    t0 = C63 * t14;
+    t17 = t6 + t0;
+    t19 = 0.01187691435143269 * t17;
+    y[84] = t19;
+    t2 = (-0.07877827811770904) * t17;
+    y[155] = t2;
+    t15 = (-C63) * t9;
+    t10 = C62 * t14;
+    t7 = t15 + t10;
+    t8 = 0.09699748493185585 * t7;
+    y[324] = t8;
+    t4 = 0.058267532136393865 * t7;
+    y[395] = t4;
+    t12 = (-C64) * t11;
+    t16 = (-C65) * t5;
+    t1 = t12 + t16;
+    t3 = 0.09612420663291579 * t1;
+    y[315] = t3;
+    t6 = 0.04856492303546617 * t1;
+    y[404] = t6;
+    t0 = C65 * t11;
+    t19 = (-C64) * t5;
+    t17 = t0 + t19;
+    t2 = 0.006143019792502721 * t17;
+    y[75] = t2;
+    t9 = (-0.08358974634339059) * t17;
+    y[164] = t9;
+    t14 = C66 * t18;
+    t15 = C67 * t13;
+    t10 = t14 + t15;
+    y[4] = 0;
+    t8 = (-0.09153367620104567) * t10;
+    y[235] = t8;
+    t7 = (-C67) * t18;
+    t4 = C66 * t13;
+    t12 = t7 + t4;
+    t16 = 0.09104117390663842 * t12;
+    y[244] = t16;
+    t3 = 0.0004873180185828961 * t12;
+    y[475] = t3;
+    t1 = re[57];
+    t6 = im[57];
+    t11 = re[97];
+    t5 = im[97];
+    t0 = re[17];
+    t19 = im[17];
+    t2 = t11 + t0;
+    t17 = t5 + t19;
+    t9 = C0 * t2;
+    t14 = t1 - t9;
+    t15 = C0 * t17;
+    t10 = t6 - t15;
+    t8 = t11 - t0;
+    t18 = C1 * t8;
+    t13 = t5 - t19;
+    t7 = C1 * t13;
+    t4 = t1 + t2;
+    t16 = t6 + t17;
+    t12 = t14 + t7;
+    t3 = t10 - t18;
+    t9 = t14 - t7;
+    t15 = t10 + t18;
+    t11 = C68 * t4;
+    t0 = C69 * t16;
+    t8 = t11 + t0;
+    y[6] = 0;
+    t5 = (-0.09163939322407563) * t8;
+    y[233] = t5;
+    t19 = (-C69) * t4;
+    t13 = C68 * t16;
+    t1 = t19 + t13;
+    t2 = 0.09093614700128749 * t1;
+    y[246] = t2;
+    t6 = 0.0007176193279816504 * t1;
+    y[473] = t6;
+    t17 = C70 * t12;
+    t14 = C71 * t3;
+    t7 = t17 + t14;
+    t10 = 0.013393375586540204 * t7;
+    y[86] = t10;
+    t18 = (-0.0775117043266292) * t7;
+    y[153] = t18;
+    t11 = (-C71) * t12;
+    t0 = C70 * t3;
+    t8 = t11 + t0;
+    t5 = 0.09707744401023602 * t8;
+    y[326] = t5;
+    t4 = 0.06038023731968849 * t8;
+    y[393] = t4;
+    t16 = (-C72) * t9;
+    t19 = (-C73) * t15;
+    t13 = t16 + t19;
+    t2 = 0.0958422550018241 * t13;
+    y[313] = t2;
+    t1 = 0.046396889318521525 * t13;
+    y[406] = t1;
+    t6 = C73 * t9;
+    t17 = (-C72) * t15;
+    t14 = t6 + t17;
+    t10 = 0.005125386885201697 * t14;
+    y[73] = t10;
+    t7 = (-0.08446724594649771) * t14;
+    y[166] = t7;
+    t18 = re[96];
+    t12 = im[96];
+    t3 = re[16];
+    t11 = im[16];
+    t0 = re[56];
+    t5 = im[56];
+    t8 = t3 + t0;
+    t4 = t11 + t5;
+    t16 = C0 * t8;
+    t19 = t18 - t16;
+    t2 = C0 * t4;
+    t13 = t12 - t2;
+    t1 = t3 - t0;
+    t9 = C1 * t1;
+    t15 = t11 - t5;
+    t6 = C1 * t15;
+    t17 = t18 + t8;
+    t10 = t12 + t4;
+    t14 = t19 + t6;
+    t7 = t13 - t9;
+    t16 = t19 - t6;
+    t2 = t13 + t9;
+    t3 = (-C74) * t17;
+    t0 = (-C75) * t10;
+    t1 = t3 + t0;
+    t11 = 0.09553805039385353 * t1;
+    y[311] = t11;
+    t5 = 0.04423560528399145 * t1;
+    y[408] = t5;
+    t15 = C75 * t17;
+    t18 = (-C74) * t10;
+    t8 = t15 + t18;
+    t12 = 0.004204839118219382 * t8;
+    y[71] = t12;
+    t4 = (-0.08527837543502197) * t8;
+    y[168] = t4;
+    t19 = C76 * t14;
+    t6 = C77 * t7;
+    t13 = t19 + t6;
+    y[8] = 0;
+    t9 = (-0.09174066208859163) * t13;
+    y[231] = t9;
+    t3 = (-C77) * t14;
+    t0 = C76 * t7;
+    t11 = t3 + t0;
+    t1 = 0.09083576620894716 * t11;
+    y[248] = t1;
+    t5 = 0.0010033991315600104 * t11;
+    y[471] = t5;
+    t17 = C78 * t16;
+    t10 = C79 * t2;
+    t15 = t17 + t10;
+    t18 = 0.014992006244281922 * t15;
+    y[88] = t18;
+    t12 = (-0.07617123337222059) * t15;
+    y[151] = t12;
+    t8 = (-C79) * t16;
+    t4 = C78 * t2;
+    t19 = t8 + t4;
+    t6 = 0.09710785222241458 * t19;
+    y[328] = t6;
+    t13 = 0.06246718712392951 * t19;
+    y[391] = t13;
+    t9 = re[15];
+    t14 = im[15];
+    t7 = re[55];
+    t3 = im[55];
+    t0 = re[95];
+    t1 = im[95];
+    t11 = t7 + t0;
+    t5 = t3 + t1;
+    t17 = C0 * t11;
+    t10 = t9 - t17;
+    t18 = C0 * t5;
+    t15 = t14 - t18;
+    t12 = t7 - t0;
+    t16 = C1 * t12;
+    t2 = t3 - t1;
+    t8 = C1 * t2;
+    t4 = t9 + t11;
+    t6 = t14 + t5;
+    t19 = t10 + t8;
+    t13 = t15 - t16;
+    t17 = t10 - t8;
+    t18 = t15 + t16;
+    t7 = C80 * t4;
+    t0 = C81 * t6;
+    t12 = t7 + t0;
+    t3 = 0.016668033615864032 * t12;
+    y[90] = t3;
+    t1 = (-0.07475858286328994) * t12;
+    y[149] = t1;
+    t2 = (-C81) * t4;
+    t9 = C80 * t6;
+    t11 = t2 + t9;
+    t14 = 0.09708404002796817 * t11;
+    y[330] = t14;
+    t5 = 0.0645227929691675 * t11;
+    y[389] = t5;
+    t10 = (-C82) * t19;
+    t8 = (-C83) * t13;
+    t15 = t10 + t8;
+    t16 = 0.09521437769032931 * t15;
+    y[309] = t16;
+    t7 = 0.04208653165019209 * t15;
+    y[410] = t7;
+    t0 = C83 * t19;
+    t3 = (-C82) * t13;
+    t12 = t0 + t3;
+    t1 = 0.0033823163175740493 * t12;
+    y[69] = t1;
+    t4 = (-0.0860267489981687) * t12;
+    y[170] = t4;
+    t6 = C84 * t17;
+    t2 = C85 * t18;
+    t9 = t6 + t2;
+    y[10] = 0;
+    t14 = (-0.0918361435609985) * t9;
+    y[229] = t14;
+    t11 = (-C85) * t17;
+    t5 = C84 * t18;
+    t10 = t11 + t5;
+    t8 = 0.09074132482270718 * t10;
+    y[250] = t8;
+    t16 = 0.0013492771887970369 * t10;
+    y[469] = t16;
+    t15 = re[54];
+    t7 = im[54];
+    t19 = re[94];
+    t13 = im[94];
+    t0 = re[14];
+    t3 = im[14];
+    t1 = t19 + t0;
+    t12 = t13 + t3;
+    t4 = C0 * t1;
+    t6 = t15 - t4;
+    t2 = C0 * t12;
+    t9 = t7 - t2;
+    t14 = t19 - t0;
+    t17 = C1 * t14;
+    t18 = t13 - t3;
+    t11 = C1 * t18;
+    t5 = t15 + t1;
+    t8 = t7 + t12;
+    t10 = t6 + t11;
+    t16 = t9 - t17;
+    t4 = t6 - t11;
+    t2 = t9 + t17;
+    t19 = C86 * t5;
+    t0 = C87 * t8;
+    t14 = t19 + t0;
+    y[12] = 0;
+    t13 = (-0.09192437163927131) * t14;
+    y[227] = t13;
+    t3 = (-C87) * t5;
+    t18 = C86 * t8;
+    t15 = t3 + t18;
+    t1 = 0.0906542322207533 * t15;
+    y[252] = t1;
+    t7 = 0.0017581191828043815 * t15;
+    y[467] = t7;
+    t12 = C88 * t10;
+    t6 = C89 * t16;
+    t11 = t12 + t6;
+    t9 = 0.018418715600610196 * t11;
+    y[92] = t9;
+    t17 = (-0.07327389637800778) * t11;
+    y[147] = t17;
+    t19 = (-C89) * t10;
+    t0 = C88 * t16;
+    t14 = t19 + t0;
+    t13 = 0.09700200223142667 * t14;
+    y[332] = t13;
+    t5 = 0.06654202713938924 * t14;
+    y[387] = t5;
+    t8 = (-C90) * t4;
+    t3 = (-C91) * t2;
+    t18 = t8 + t3;
+    t1 = 0.09487681096790258 * t18;
+    y[307] = t1;
+    t15 = 0.039954198753038773 * t18;
+    y[412] = t15;
+    t7 = C91 * t4;
+    t12 = (-C90) * t2;
+    t6 = t7 + t12;
+    t9 = 0.0026578540809738863 * t6;
+    y[67] = t9;
+    t11 = (-0.086713927451765) * t6;
+    y[172] = t11;
+    t17 = re[93];
+    t10 = im[93];
+    t16 = re[13];
+    t19 = im[13];
+    t0 = re[53];
+    t13 = im[53];
+    t14 = t16 + t0;
+    t5 = t19 + t13;
+    t8 = C0 * t14;
+    t3 = t17 - t8;
+    t1 = C0 * t5;
+    t18 = t10 - t1;
+    t15 = t16 - t0;
+    t4 = C1 * t15;
+    t2 = t19 - t13;
+    t7 = C1 * t2;
+    t12 = t17 + t14;
+    t9 = t10 + t5;
+    t6 = t3 + t7;
+    t11 = t18 - t4;
+    t8 = t3 - t7;
+    t1 = t18 + t4;
+    t16 = (-C92) * t12;
+    t0 = (-C93) * t9;
+    t15 = t16 + t0;
+    t19 = 0.09452938893259823 * t15;
+    y[305] = t19;
+    t13 = 0.03784324285502507 * t15;
+    y[414] = t13;
+    t2 = C93 * t12;
+    t17 = (-C92) * t9;
+    t14 = t2 + t17;
+    t10 = 0.0020305692018240664 * t14;
+    y[65] = t10;
+    t5 = (-0.0873431014748424) * t14;
+    y[174] = t5;
+    t3 = C94 * t6;
+    t7 = C95 * t11;
+    t18 = t3 + t7;
+    y[14] = 0;
+    t4 = (-0.09200402888696975) * t18;
+    y[225] = t4;
+    t16 = (-C95) * t6;
+    t0 = C94 * t11;
+    t19 = t16 + t0;
+    t15 = 0.09057574362934841 * t19;
+    y[254] = t15;
+    t13 = 0.0022336672030543237 * t19;
+    y[465] = t13;
+    t12 = C96 * t8;
+    t9 = C97 * t1;
+    t2 = t12 + t9;
+    t17 = 0.02023751206992167 * t2;
+    y[94] = t17;
+    t10 = (-0.07171894336163445) * t2;
+    y[145] = t10;
+    t14 = (-C97) * t8;
+    t5 = C96 * t1;
+    t3 = t14 + t5;
+    t7 = 0.09685895736188291 * t3;
+    y[334] = t7;
+    t18 = 0.0685218247894467 * t3;
+    y[385] = t18;
+    t4 = re[12];
+    t6 = im[12];
+    t11 = re[52];
+    t16 = im[52];
+    t0 = re[92];
+    t15 = im[92];
+    t19 = t11 + t0;
+    t13 = t16 + t15;
+    t12 = C0 * t19;
+    t9 = t4 - t12;
+    t17 = C0 * t13;
+    t2 = t6 - t17;
+    t10 = t11 - t0;
+    t8 = C1 * t10;
+    t1 = t16 - t15;
+    t14 = C1 * t1;
+    t5 = t4 + t19;
+    t7 = t6 + t13;
+    t3 = t9 + t14;
+    t18 = t2 - t8;
+    t12 = t9 - t14;
+    t17 = t2 + t8;
+    t11 = C98 * t5;
+    t0 = C99 * t7;
+    t10 = t11 + t0;
+    t16 = 0.022121006853811794 * t10;
+    y[96] = t16;
+    t15 = (-0.07009508579978732) * t10;
+    y[143] = t15;
+    t1 = (-C99) * t5;
+    t4 = C98 * t7;
+    t19 = t1 + t4;
+    t6 = 0.09665087282156803 * t19;
+    y[336] = t6;
+    t13 = 0.07045710534702093 * t19;
+    y[383] = t13;
+    t9 = (-C100) * t3;
+    t14 = (-C101) * t18;
+    t2 = t9 + t14;
+    t8 = 0.09417575507955023 * t2;
+    y[303] = t8;
+    t11 = 0.035758982113670124 * t2;
+    y[416] = t11;
+    t0 = C101 * t3;
+    t16 = (-C100) * t18;
+    t10 = t0 + t16;
+    t15 = 0.0014982238934458136 * t10;
+    y[63] = t15;
+    t5 = (-0.08791815223495067) * t10;
+    y[176] = t5;
+    t7 = C102 * t12;
+    t1 = C103 * t17;
+    t4 = t7 + t1;
+    y[16] = 0;
+    t6 = (-0.09207362581828964) * t4;
+    y[223] = t6;
+    t19 = (-C103) * t12;
+    t13 = C102 * t17;
+    t9 = t19 + t13;
+    t14 = 0.09050727892240762 * t9;
+    y[256] = t14;
+    t8 = 0.002778041784911948 * t9;
+    y[463] = t8;
+    t2 = re[51];
+    t11 = im[51];
+    t3 = re[91];
+    t18 = im[91];
+    t0 = re[11];
+    t16 = im[11];
+    t15 = t3 + t0;
+    t10 = t18 + t16;
+    t5 = C0 * t15;
+    t7 = t2 - t5;
+    t1 = C0 * t10;
+    t4 = t11 - t1;
+    t6 = t3 - t0;
+    t12 = C1 * t6;
+    t17 = t18 - t16;
+    t19 = C1 * t17;
+    t13 = t2 + t15;
+    t14 = t11 + t10;
+    t9 = t7 + t19;
+    t8 = t4 - t12;
+    t5 = t7 - t19;
+    t1 = t4 + t12;
+    t3 = C104 * t13;
+    t0 = C105 * t14;
+    t6 = t3 + t0;
+    y[18] = 0;
+    t18 = (-0.09213185424311) * t6;
+    y[221] = t18;
+    t16 = (-C105) * t13;
+    t17 = C104 * t14;
+    t2 = t16 + t17;
+    t15 = 0.09045007724846191 * t2;
+    y[258] = t15;
+    t11 = 0.003392078454351888 * t2;
+    y[461] = t11;
+    t10 = C106 * t9;
+    t7 = C107 * t8;
+    t19 = t10 + t7;
+    t4 = 0.024064152632092713 * t19;
+    y[98] = t4;
+    t12 = (-0.06840421737663181) * t19;
+    y[141] = t12;
+    t3 = (-C107) * t9;
+    t0 = C106 * t8;
+    t6 = t3 + t0;
+    t18 = 0.09637494539960026 * t6;
+    y[338] = t18;
+    t13 = 0.07234331684866252 * t6;
+    y[381] = t13;
+    t14 = (-C108) * t5;
+    t16 = (-C109) * t1;
+    t17 = t14 + t16;
+    t15 = 0.09382117136084558 * t17;
+    y[301] = t15;
+    t2 = 0.03370544615326114 * t17;
+    y[418] = t2;
+    t11 = C109 * t5;
+    t10 = (-C108) * t1;
+    t7 = t11 + t10;
+    t4 = 0.0010571625305928285 * t7;
+    y[61] = t4;
+    t19 = (-0.08844167130113312) * t7;
+    y[178] = t19;
+    t12 = re[90];
+    t9 = im[90];
+    t8 = re[10];
+    t3 = im[10];
+    t0 = re[50];
+    t18 = im[50];
+    t6 = t8 + t0;
+    t13 = t3 + t18;
+    t14 = C0 * t6;
+    t16 = t12 - t14;
+    t15 = C0 * t13;
+    t17 = t9 - t15;
+    t2 = t8 - t0;
+    t5 = C1 * t2;
+    t1 = t3 - t18;
+    t11 = C1 * t1;
+    t10 = t12 + t6;
+    t4 = t9 + t13;
+    t7 = t16 + t11;
+    t19 = t17 - t5;
+    t14 = t16 - t11;
+    t15 = t17 + t5;
+    t8 = (-C110) * t10;
+    t0 = (-C111) * t4;
+    t2 = t8 + t0;
+    t3 = 0.09346957660009908 * t2;
+    y[299] = t3;
+    t18 = 0.03168746252407474 * t2;
+    y[420] = t18;
+    t1 = C111 * t10;
+    t12 = (-C110) * t4;
+    t6 = t1 + t12;
+    t9 = 0.0007021231543619729 * t6;
+    y[59] = t9;
+    t13 = (-0.08891754017192575) * t6;
+    y[180] = t13;
+    t16 = C112 * t7;
+    t11 = C113 * t19;
+    t17 = t16 + t11;
+    y[20] = 0;
+    t5 = (-0.09217730194744563) * t17;
+    y[219] = t5;
+    t8 = (-C113) * t7;
+    t0 = C112 * t19;
+    t3 = t8 + t0;
+    t2 = 0.09040548114637302 * t3;
+    y[260] = t2;
+    t18 = 0.004077868094918297 * t3;
+    y[459] = t18;
+    t10 = C114 * t14;
+    t4 = C115 * t15;
+    t1 = t10 + t4;
+    t12 = 0.026059152816006632 * t1;
+    y[100] = t12;
+    t9 = (-0.06664961433059914) * t1;
+    y[139] = t9;
+    t6 = (-C115) * t14;
+    t13 = C114 * t15;
+    t16 = t6 + t13;
+    t11 = 0.09602982670046604 * t16;
+    y[340] = t11;
+    t17 = 0.0741767176070929 * t16;
+    y[379] = t17;
+    t5 = re[9];
+    t7 = im[9];
+    t19 = re[49];
+    t8 = im[49];
+    t0 = re[89];
+    t2 = im[89];
+    t3 = t19 + t0;
+    t18 = t8 + t2;
+    t10 = C0 * t3;
+    t4 = t5 - t10;
+    t12 = C0 * t18;
+    t1 = t7 - t12;
+    t9 = t19 - t0;
+    t14 = C1 * t9;
+    t15 = t8 - t2;
+    t6 = C1 * t15;
+    t13 = t5 + t3;
+    t11 = t7 + t18;
+    t16 = t4 + t6;
+    t17 = t1 - t14;
+    t10 = t4 - t6;
+    t12 = t1 + t14;
+    t19 = C116 * t13;
+    t0 = C117 * t11;
+    t9 = t19 + t0;
+    t8 = 0.02810120791275669 * t9;
+    y[102] = t8;
+    t2 = (-0.06483429897658222) * t9;
+    y[137] = t2;
+    t15 = (-C117) * t13;
+    t5 = C116 * t11;
+    t3 = t15 + t5;
+    t7 = 0.09561210961373615 * t3;
+    y[342] = t7;
+    t18 = 0.07595364724111003 * t3;
+    y[377] = t18;
+    t4 = (-C118) * t16;
+    t6 = (-C119) * t17;
+    t1 = t4 + t6;
+    t14 = 0.09312553292068804 * t1;
+    y[297] = t14;
+    t19 = 0.029709304370203957 * t1;
+    y[422] = t19;
+    t0 = C119 * t16;
+    t8 = (-C118) * t17;
+    t9 = t0 + t8;
+    t2 = 0.0004222769452670429 * t9;
+    y[57] = t2;
+    t13 = (-0.08935022993236894) * t9;
+    y[182] = t13;
+    t11 = C120 * t10;
+    t15 = C121 * t12;
+    t5 = t11 + t15;
+    y[22] = 0;
+    t7 = (-0.09220868152367266) * t5;
+    y[217] = t7;
+    t3 = (-C121) * t10;
+    t18 = C120 * t12;
+    t4 = t3 + t18;
+    t6 = 0.09037471521804512 * t4;
+    y[262] = t6;
+    t14 = 0.004836578531268158 * t4;
+    y[457] = t14;
+    t1 = re[48];
+    t19 = im[48];
+    t16 = re[88];
+    t17 = im[88];
+    t0 = re[8];
+    t8 = im[8];
+    t2 = t16 + t0;
+    t9 = t17 + t8;
+    t13 = C0 * t2;
+    t11 = t1 - t13;
+    t15 = C0 * t9;
+    t5 = t19 - t15;
+    t7 = t16 - t0;
+    t10 = C1 * t7;
+    t12 = t17 - t8;
+    t3 = C1 * t12;
+    t18 = t1 + t2;
+    t6 = t19 + t9;
+    t4 = t11 + t3;
+    t14 = t5 - t10;
+    t13 = t11 - t3;
+    t15 = t5 + t10;
+    t16 = C122 * t18;
+    t0 = C123 * t6;
+    t7 = t16 + t0;
+    y[24] = 0;
+    t17 = (-0.09222461802987045) * t7;
+    y[215] = t17;
+    t8 = (-C123) * t18;
+    t12 = C122 * t6;
+    t1 = t8 + t12;
+    t2 = 0.09035909837690259 * t1;
+    y[264] = t2;
+    t19 = 0.005668641644993473 * t1;
+    y[455] = t19;
+    t9 = C124 * t4;
+    t11 = C125 * t14;
+    t3 = t9 + t11;
+    t5 = 0.030183604415960606 * t3;
+    y[104] = t5;
+    t10 = (-0.06296179334680656) * t3;
+    y[135] = t10;
+    t16 = (-C125) * t4;
+    t0 = C124 * t14;
+    t7 = t16 + t0;
+    t17 = 0.09512004217473578 * t7;
+    y[344] = t17;
+    t18 = 0.07767146900283439 * t7;
+    y[375] = t18;
+    t6 = (-C126) * t13;
+    t8 = (-C127) * t15;
+    t12 = t6 + t8;
+    t2 = 0.09282792874934585 * t12;
+    y[295] = t2;
+    t1 = 0.027774771122028637 * t12;
+    y[424] = t1;
+    t19 = C127 * t13;
+    t9 = (-C126) * t15;
+    t11 = t19 + t9;
+    y[55] = 0;
+    t5 = (-0.08977183317140486) * t11;
+    y[184] = t5;
+    t3 = re[87];
+    t10 = im[87];
+    t4 = re[7];
+    t14 = im[7];
+    t16 = re[47];
+    t0 = im[47];
+    t17 = t4 + t16;
+    t7 = t14 + t0;
+    t18 = C0 * t17;
+    t6 = t3 - t18;
+    t8 = C0 * t7;
+    t2 = t10 - t8;
+    t12 = t4 - t16;
+    t1 = C1 * t12;
+    t13 = t14 - t0;
+    t15 = C1 * t13;
+    t19 = t3 + t17;
+    t9 = t10 + t7;
+    t11 = t6 + t15;
+    t5 = t2 - t1;
+    t18 = t6 - t15;
+    t8 = t2 + t1;
+    t4 = (-C128) * t19;
+    t16 = (-C129) * t9;
+    t12 = t4 + t16;
+    t14 = 0.09248264559196126 * t12;
+    y[293] = t14;
+    t0 = 0.025887393635767413 * t12;
+    y[426] = t0;
+    t13 = C129 * t19;
+    t3 = (-C128) * t9;
+    t17 = t13 + t3;
+    y[53] = 0;
+    t10 = (-0.09010699553406464) * t17;
+    y[186] = t10;
+    t7 = C130 * t11;
+    t6 = C131 * t5;
+    t15 = t7 + t6;
+    y[26] = 0;
+    t2 = (-0.09222390568483599) * t15;
+    y[213] = t2;
+    t1 = (-C131) * t11;
+    t4 = C130 * t5;
+    t16 = t1 + t4;
+    t14 = 0.09035979631801205 * t16;
+    y[266] = t14;
+    t12 = 0.006575394365350636 * t16;
+    y[453] = t12;
+    t0 = C132 * t18;
+    t19 = C133 * t8;
+    t9 = t0 + t19;
+    t13 = 0.03230032719820284 * t9;
+    y[106] = t13;
+    t3 = (-0.06103529695492163) * t9;
+    y[133] = t3;
+    t17 = (-C133) * t18;
+    t10 = C132 * t8;
+    t7 = t17 + t10;
+    t6 = 0.09455277460094863 * t7;
+    y[346] = t6;
+    t15 = 0.07932664712434352 * t7;
+    y[373] = t15;
+    t2 = re[6];
+    t11 = im[6];
+    t5 = re[46];
+    t1 = im[46];
+    t4 = re[86];
+    t14 = im[86];
+    t16 = t5 + t4;
+    t12 = t1 + t14;
+    t0 = C0 * t16;
+    t19 = t2 - t0;
+    t13 = C0 * t12;
+    t9 = t11 - t13;
+    t3 = t5 - t4;
+    t18 = C1 * t3;
+    t8 = t1 - t14;
+    t17 = C1 * t8;
+    t10 = t2 + t16;
+    t6 = t11 + t12;
+    t7 = t19 + t17;
+    t15 = t9 - t18;
+    t0 = t19 - t17;
+    t13 = t9 + t18;
+    t5 = C134 * t10;
+    t4 = C135 * t6;
+    t3 = t5 + t4;
+    t1 = 0.03444464662276709 * t3;
+    y[108] = t1;
+    t14 = (-0.05905961963485038) * t3;
+    y[131] = t14;
+    t8 = (-C135) * t10;
+    t2 = C134 * t6;
+    t16 = t8 + t2;
+    t11 = 0.0939083749348817 * t16;
+    y[348] = t11;
+    t12 = 0.0809165052461322 * t16;
+    y[371] = t12;
+    t19 = (-C136) * t7;
+    t17 = (-C137) * t15;
+    t9 = t19 + t17;
+    t18 = 0.09216884617272778 * t9;
+    y[291] = t18;
+    t5 = 0.024050868215834645 * t9;
+    y[428] = t5;
+    t4 = C137 * t7;
+    t1 = (-C136) * t15;
+    t3 = t4 + t1;
+    y[51] = 0;
+    t14 = (-0.09041377514606573) * t3;
+    y[188] = t14;
+    t10 = C138 * t0;
+    t6 = C139 * t13;
+    t8 = t10 + t6;
+    y[28] = 0;
+    t2 = (-0.0922052764660204) * t8;
+    y[211] = t2;
+    t11 = (-C139) * t0;
+    t16 = C138 * t13;
+    t12 = t11 + t16;
+    t19 = 0.09037805267472243 * t12;
+    y[268] = t19;
+    t17 = 0.007556979010194901 * t12;
+    y[451] = t17;
+    t18 = re[45];
+    t9 = im[45];
+    t5 = re[85];
+    t7 = im[85];
+    t15 = re[5];
+    t4 = im[5];
+    t1 = t5 + t15;
+    t3 = t7 + t4;
+    t14 = C0 * t1;
+    t10 = t18 - t14;
+    t6 = C0 * t3;
+    t8 = t9 - t6;
+    t2 = t5 - t15;
+    t0 = C1 * t2;
+    t13 = t7 - t4;
+    t11 = C1 * t13;
+    t16 = t18 + t1;
+    t19 = t9 + t3;
+    t12 = t10 + t11;
+    t17 = t8 - t0;
+    t14 = t10 - t11;
+    t6 = t8 + t0;
+    t5 = C140 * t16;
+    t15 = C141 * t19;
+    t2 = t5 + t15;
+    y[30] = 0;
+    t7 = (-0.09216764187038416) * t2;
+    y[209] = t7;
+    t4 = (-C141) * t16;
+    t13 = C140 * t19;
+    t18 = t4 + t13;
+    t1 = 0.09041495653162682 * t18;
+    y[270] = t1;
+    t9 = 0.008613919159637174 * t18;
+    y[449] = t9;
+    t3 = C142 * t12;
+    t10 = C143 * t17;
+    t11 = t3 + t10;
+    t8 = 0.036609401127679665 * t11;
+    y[110] = t8;
+    t0 = (-0.05703985780184589) * t11;
+    y[129] = t0;
+    t5 = (-C143) * t12;
+    t15 = C142 * t17;
+    t2 = t5 + t15;
+    t7 = 0.09318534435922614 * t2;
+    y[350] = t7;
+    t16 = 0.08243933112539109 * t2;
+    y[369] = t16;
+    t19 = (-C144) * t14;
+    t4 = (-C145) * t6;
+    t13 = t19 + t4;
+    t1 = 0.09188206022001336 * t13;
+    y[289] = t1;
+    t18 = 0.022269332380766 * t13;
+    y[430] = t18;
+    t9 = C145 * t14;
+    t3 = (-C144) * t6;
+    t10 = t9 + t3;
+    y[49] = 0;
+    t8 = (-0.09069597822881863) * t10;
+    y[190] = t8;
+    t11 = re[84];
+    t0 = im[84];
+    t12 = re[4];
+    t17 = im[4];
+    t5 = re[44];
+    t15 = im[44];
+    t7 = t12 + t5;
+    t2 = t17 + t15;
+    t16 = C0 * t7;
+    t19 = t11 - t16;
+    t4 = C0 * t2;
+    t1 = t0 - t4;
+    t13 = t12 - t5;
+    t18 = C1 * t13;
+    t14 = t17 - t15;
+    t6 = C1 * t14;
+    t9 = t11 + t7;
+    t3 = t0 + t2;
+    t10 = t19 + t6;
+    t8 = t1 - t18;
+    t16 = t19 - t6;
+    t4 = t1 + t18;
+    t12 = (-C146) * t9;
+    t5 = (-C147) * t3;
+    t13 = t12 + t5;
+    t17 = 0.09162207646476439 * t13;
+    y[287] = t17;
+    t15 = 0.020545864807539 * t13;
+    y[432] = t15;
+    t14 = C147 * t9;
+    t11 = (-C146) * t3;
+    t7 = t14 + t11;
+    y[47] = 0;
+    t0 = (-0.09095333411853122) * t7;
+    y[192] = t0;
+    t2 = C148 * t10;
+    t19 = C149 * t8;
+    t6 = t2 + t19;
+    y[32] = 0;
+    t1 = (-0.09210979792503068) * t6;
+    y[207] = t1;
+    t18 = (-C149) * t10;
+    t12 = C148 * t8;
+    t5 = t18 + t12;
+    t17 = 0.09047173613512795 * t5;
+    y[272] = t17;
+    t13 = 0.009746159098938015 * t5;
+    y[447] = t13;
+    t15 = C150 * t16;
+    t9 = C151 * t4;
+    t3 = t15 + t9;
+    t14 = 0.038788983266110494 * t3;
+    y[112] = t14;
+    t11 = (-0.05497902929043668) * t3;
+    y[127] = t11;
+    t7 = (-C151) * t16;
+    t0 = C150 * t4;
+    t2 = t7 + t0;
+    t19 = 0.09238500948779206 * t2;
+    y[352] = t19;
+    t6 = 0.08389225281782092 * t2;
+    y[367] = t6;
+    t1 = re[3];
+    t10 = im[3];
+    t8 = re[43];
+    t18 = im[43];
+    t12 = re[83];
+    t17 = im[83];
+    t5 = t8 + t12;
+    t13 = t18 + t17;
+    t15 = C0 * t5;
+    t9 = t1 - t15;
+    t14 = C0 * t13;
+    t3 = t10 - t14;
+    t11 = t8 - t12;
+    t16 = C1 * t11;
+    t4 = t18 - t17;
+    t7 = C1 * t4;
+    t0 = t1 + t5;
+    t19 = t10 + t13;
+    t2 = t9 + t7;
+    t6 = t3 - t16;
+    t15 = t9 - t7;
+    t14 = t3 + t16;
+    t8 = C152 * t0;
+    t12 = C153 * t19;
+    t11 = t8 + t12;
+    t18 = 0.040977048916637684 * t11;
+    y[114] = t18;
+    t17 = (-0.05288347175089571) * t11;
+    y[125] = t17;
+    t4 = (-C153) * t0;
+    t1 = C152 * t19;
+    t5 = t4 + t1;
+    t10 = 0.09150544220877038 * t5;
+    y[354] = t10;
+    t13 = 0.08527231603088634 * t5;
+    y[365] = t13;
+    t9 = (-C154) * t2;
+    t7 = (-C155) * t6;
+    t3 = t9 + t7;
+    t16 = 0.09138840410436003 * t3;
+    y[285] = t16;
+    t8 = 0.018883113189353255 * t3;
+    y[434] = t8;
+    t12 = C155 * t2;
+    t18 = (-C154) * t6;
+    t11 = t12 + t18;
+    y[45] = 0;
+    t17 = (-0.09118589404206212) * t11;
+    y[194] = t17;
+    t0 = C156 * t15;
+    t19 = C157 * t14;
+    t4 = t0 + t19;
+    y[34] = 0;
+    t1 = (-0.09203093361579481) * t4;
+    y[205] = t1;
+    t10 = (-C157) * t15;
+    t5 = C156 * t14;
+    t13 = t10 + t5;
+    t9 = 0.09054926431717872 * t13;
+    y[274] = t9;
+    t7 = 0.0109532114963038 * t13;
+    y[445] = t7;
+    t16 = re[42];
+    t3 = im[42];
+    t8 = re[82];
+    t2 = im[82];
+    t6 = re[2];
+    t12 = im[2];
+    t18 = t8 + t6;
+    t11 = t2 + t12;
+    t17 = C0 * t18;
+    t0 = t16 - t17;
+    t19 = C0 * t11;
+    t4 = t3 - t19;
+    t1 = t8 - t6;
+    t15 = C1 * t1;
+    t14 = t2 - t12;
+    t10 = C1 * t14;
+    t5 = t16 + t18;
+    t9 = t3 + t11;
+    t13 = t0 + t10;
+    t7 = t4 - t15;
+    t17 = t0 - t10;
+    t19 = t4 + t15;
+    t8 = C158 * t5;
+    t6 = C159 * t9;
+    t1 = t8 + t6;
+    y[36] = 0;
+    t2 = (-0.09193006721260147) * t1;
+    y[203] = t2;
+    t12 = (-C159) * t5;
+    t14 = C158 * t9;
+    t16 = t12 + t14;
+    t18 = 0.09064861569241872 * t16;
+    y[276] = t18;
+    t3 = 0.012234374072361744 * t16;
+    y[443] = t3;
+    t11 = C160 * t13;
+    t0 = C161 * t7;
+    t10 = t11 + t0;
+    t4 = 0.04316675485476704 * t10;
+    y[116] = t4;
+    t15 = (-0.05075903923035873) * t10;
+    y[123] = t15;
+    t8 = (-C161) * t13;
+    t6 = C160 * t7;
+    t1 = t8 + t6;
+    t2 = 0.09054639388396353 * t1;
+    y[356] = t2;
+    t5 = 0.08657786267658361 * t1;
+    y[363] = t5;
+    t9 = (-C162) * t17;
+    t12 = (-C163) * t19;
+    t14 = t9 + t12;
+    t18 = 0.09118069998138907 * t14;
+    y[283] = t18;
+    t16 = 0.017285605367722928 * t14;
+    y[436] = t16;
+    t3 = C163 * t17;
+    t11 = (-C162) * t19;
+    t0 = t3 + t11;
+    y[43] = 0;
+    t4 = (-0.09139360999678939) * t0;
+    y[196] = t4;
+    t10 = re[81];
+    t15 = im[81];
+    t13 = re[1];
+    t7 = im[1];
+    t8 = re[41];
+    t6 = im[41];
+    t2 = t13 + t8;
+    t1 = t7 + t6;
+    t5 = C0 * t2;
+    t9 = t10 - t5;
+    t12 = C0 * t1;
+    t18 = t15 - t12;
+    t14 = t13 - t8;
+    t16 = C1 * t14;
+    t17 = t7 - t6;
+    t19 = C1 * t17;
+    t3 = t10 + t2;
+    t11 = t15 + t1;
+    t0 = t9 + t19;
+    t4 = t18 - t16;
+    t5 = t9 - t19;
+    t12 = t18 + t16;
+    t13 = (-C164) * t3;
+    t8 = (-C165) * t11;
+    t14 = t13 + t8;
+    t7 = 0.09099823826755285 * t14;
+    y[281] = t7;
+    t6 = 0.015755155066487784 * t14;
+    y[438] = t6;
+    t17 = C165 * t3;
+    t10 = (-C164) * t11;
+    t2 = t17 + t10;
+    y[41] = 0;
+    t15 = (-0.09157686447546028) * t2;
+    y[198] = t15;
+    t1 = C166 * t0;
+    t9 = C167 * t4;
+    t19 = t1 + t9;
+    y[38] = 0;
+    t18 = (-0.09180640400425469) * t19;
+    y[201] = t18;
+    t16 = (-C167) * t0;
+    t13 = C166 * t4;
+    t8 = t16 + t13;
+    t7 = 0.09077071936013452 * t8;
+    y[278] = t7;
+    t14 = 0.013588742078380437 * t8;
+    y[441] = t14;
+    t6 = C168 * t5;
+    t3 = C169 * t12;
+    t11 = t6 + t3;
+    t17 = 0.045352447076883386 * t11;
+    y[118] = t17;
+    t10 = (-0.048609442933946125) * t11;
+    y[121] = t10;
+    t2 = (-C169) * t5;
+    t15 = C168 * t12;
+    t1 = t2 + t15;
+    t9 = 0.08950958151221271 * t1;
+    y[358] = t9;
+    t19 = 0.0878083255799443 * t1;
+    y[361] = t19;
+}
+
+//
+//  Public functions.
+//
+
+/**
+ *  Apply LD-MDCT transform (prebuilt for window W10_240).
+ * 
+ *  Note(s):
+ *    [1] X[k] = SUM(w[n] * x[n] * cos(PI / 240 * (n + 120.5) * (k + 0.5))), where
+ *        w[n] = sqrt(2 / 240) * W10_240[n].
+ *    [2] The size of all arrays will not be checked.
+ * 
+ *  @param {Number[]} x 
+ *    - The input block (480 points).
+ *  @param {Number[]} X 
+ *    - The array that would contain the output block (240 points).
+ *  @param {Number[]} re 
+ *    - The scratch buffer (real part, 120 points).
+ *  @param {Number[]} im 
+ *    - The scratch buffer (imaginary part, 120 points).
+ */
+function ApplyWindowedMDCT_W10_240(x, X, re, im) {
+    ApplyWindowedMDCT_W10_240_Part1(x, X, re, im);
+    ApplyWindowedMDCT_W10_240_Part2(x, X, re, im);
+    ApplyWindowedMDCT_W10_240_Part3(x, X, re, im);
+    ApplyWindowedMDCT_W10_240_Part4(x, X, re, im);
+}
+
+/**
+ *  Apply LD-IMDCT transform (prebuilt for window W10_240).
+ * 
+ *  Note(s):
+ *    [1] y[n] = w[n] * SUM(X[k] * cos(PI / 240 * (n + 120.5) * (k + 0.5))), where
+ *        w[n] = sqrt(2 / 240) * W10_240[479 - n].
+ *    [2] The size of all arrays will not be checked.
+ * 
+ *  @param {Number[]} X 
+ *    - The input block (240 points).
+ *  @param {Number[]} y 
+ *    - The array that would contain the output block (480 points).
+ *  @param {Number[]} re 
+ *    - The scratch buffer (real part, 120 points).
+ *  @param {Number[]} im 
+ *    - The scratch buffer (imaginary part, 120 points).
+ */
+function ApplyWindowedIMDCT_W10_240(X, y, re, im) {
+    ApplyWindowedIMDCT_W10_240_Part1(X, y, re, im);
+    ApplyWindowedIMDCT_W10_240_Part2(X, y, re, im);
+    ApplyWindowedIMDCT_W10_240_Part3(X, y, re, im);
+    ApplyWindowedIMDCT_W10_240_Part4(X, y, re, im);
+}
+
+/**
+ *  Apply LD-MDCT transform (prebuilt for window W75_240).
+ * 
+ *  Note(s):
+ *    [1] X[k] = SUM(w[n] * x[n] * cos(PI / 240 * (n + 120.5) * (k + 0.5))), where
+ *        w[n] = sqrt(2 / 240) * W75_240[n].
+ *    [2] The size of all arrays will not be checked.
+ * 
+ *  @param {Number[]} x 
+ *    - The input block (480 points).
+ *  @param {Number[]} X 
+ *    - The array that would contain the output block (240 points).
+ *  @param {Number[]} re 
+ *    - The scratch buffer (real part, 120 points).
+ *  @param {Number[]} im 
+ *    - The scratch buffer (imaginary part, 120 points).
+ */
+function ApplyWindowedMDCT_W75_240(x, X, re, im) {
+    ApplyWindowedMDCT_W75_240_Part1(x, X, re, im);
+    ApplyWindowedMDCT_W75_240_Part2(x, X, re, im);
+    ApplyWindowedMDCT_W75_240_Part3(x, X, re, im);
+    ApplyWindowedMDCT_W75_240_Part4(x, X, re, im);
+}
+
+/**
+ *  Apply LD-IMDCT transform (prebuilt for window W75_240).
+ * 
+ *  Note(s):
+ *    [1] y[n] = w[n] * SUM(X[k] * cos(PI / 240 * (n + 120.5) * (k + 0.5))), where
+ *        w[n] = sqrt(2 / 240) * W75_240[479 - n].
+ *    [2] The size of all arrays will not be checked.
+ * 
+ *  @param {Number[]} X 
+ *    - The input block (240 points).
+ *  @param {Number[]} y 
+ *    - The array that would contain the output block (480 points).
+ *  @param {Number[]} re 
+ *    - The scratch buffer (real part, 120 points).
+ *  @param {Number[]} im 
+ *    - The scratch buffer (imaginary part, 120 points).
+ */
+function ApplyWindowedIMDCT_W75_240(X, y, re, im) {
+    ApplyWindowedIMDCT_W75_240_Part1(X, y, re, im);
+    ApplyWindowedIMDCT_W75_240_Part2(X, y, re, im);
+    ApplyWindowedIMDCT_W75_240_Part3(X, y, re, im);
+    ApplyWindowedIMDCT_W75_240_Part4(X, y, re, im);
+}
+
+//  Export public APIs.
+module.exports = {
+    "ApplyWindowedMDCT_W10_240": ApplyWindowedMDCT_W10_240,
+    "ApplyWindowedIMDCT_W10_240": ApplyWindowedIMDCT_W10_240,
+    "ApplyWindowedMDCT_W75_240": ApplyWindowedMDCT_W75_240,
+    "ApplyWindowedIMDCT_W75_240": ApplyWindowedIMDCT_W75_240
+};
\ No newline at end of file
@@ -0,0 +1,8200 @@
+//
+//  Copyright 2021 - 2023 XiaoJSoft Studio. All rights reserved.
+//  Use of this source code is governed by a BSD-style license that can be
+//  found in the LICENSE.md file.
+//
+
+//
+//  Note(s):
+//    [1] This file is generated automatically by a MDCT compiler, which locates 
+//        at "./../../dev/mdct-generator/" directory.
+//        Do NOT modify this file manually.
+//
+
+//
+//  Private functions.
+//
+
+/**
+ *  Part 1 of ApplyWindowedIMDCT_W10_320_K160().
+ * 
+ *  @param {Number[]} X 
+ *    - The input block (320 points, only the first 160 points are used).
+ *  @param {Number[]} y 
+ *    - The array that would contain the output block (640 points).
+ *  @param {Number[]} re 
+ *    - The scratch buffer (real part, 160 points).
+ *  @param {Number[]} im 
+ *    - The scratch buffer (imaginary part, 160 points).
+ */
+function ApplyWindowedIMDCT_W10_320_K160_Part1(X, y, re, im) {
+    let t0, t1, t10, t11, t12, t13, t14, t15, t16, t17, t18, t19, t2, t3, t4, t5, t6, t7, t8, t9;
+    const C0 = 0.9807852804032304;
+    const C1 = 0.19509032201612825;
+    const C2 = 0.9238795325112867;
+    const C3 = 0.3826834323650898;
+    const C4 = 0.8314696123025452;
+    const C5 = 0.5555702330196022;
+    const C6 = 0.7071067811865476;
+    const C7 = 0.9987954562051724;
+    const C8 = 0.049067674327418015;
+    const C9 = 0.970031253194544;
+    const C10 = 0.24298017990326387;
+    const C11 = 0.9039892931234433;
+    const C12 = 0.4275550934302821;
+    const C13 = 0.8032075314806449;
+    const C14 = 0.5956993044924334;
+    const C15 = 0.7409511253549591;
+    const C16 = 0.6715589548470183;
+    const C17 = 0.8577286100002721;
+    const C18 = 0.5141027441932217;
+    const C19 = 0.9415440651830208;
+    const C20 = 0.33688985339222005;
+    const C21 = 0.989176509964781;
+    const C22 = 0.14673047445536175;
+    const C23 = 1.1758756024193586;
+    const C24 = 0.7856949583871022;
+    const C25 = 1.3065629648763766;
+    const C26 = 0.5411961001461969;
+    const C27 = 1.3870398453221475;
+    const C28 = 0.27589937928294306;
+    const C29 = 0.9951847266721969;
+    const C30 = 0.0980171403295606;
+    const C31 = 0.9569403357322088;
+    const C32 = 0.29028467725446233;
+    const C33 = 0.881921264348355;
+    const C34 = 0.47139673682599764;
+    const C35 = 0.773010453362737;
+    const C36 = 0.6343932841636455;
+    t0 = X[0];
+    t1 = X[40];
+    t2 = C0 * t1;
+    t1 = (-C1) * t1;
+    t3 = X[80];
+    t4 = C2 * t3;
+    t3 = (-C3) * t3;
+    t5 = X[120];
+    t6 = C4 * t5;
+    t5 = (-C5) * t5;
+    t7 = X[159];
+    t8 = 0.7071067811865475 * t7;
+    t7 = C6 * t7;
+    t9 = X[119];
+    t10 = C4 * t9;
+    t9 = C5 * t9;
+    t11 = X[79];
+    t12 = C2 * t11;
+    t11 = C3 * t11;
+    t13 = X[39];
+    t14 = C0 * t13;
+    t13 = C1 * t13;
+    t15 = t0 + t8;
+    t16 = t4 + t12;
+    t17 = t3 + t11;
+    t0 = t0 - t8;
+    t8 = -t7;
+    t4 = t4 - t12;
+    t12 = t3 - t11;
+    t3 = t15 + t16;
+    t11 = t7 + t17;
+    t18 = t0 + t12;
+    t8 = t8 - t4;
+    t15 = t15 - t16;
+    t16 = t7 - t17;
+    t17 = t0 - t12;
+    t0 = t4 - t7;
+    t12 = t2 + t10;
+    t4 = t1 + t9;
+    t7 = t6 + t14;
+    t19 = t5 + t13;
+    t2 = t2 - t10;
+    t10 = t1 - t9;
+    t1 = t6 - t14;
+    t9 = t5 - t13;
+    t6 = t12 + t7;
+    t14 = t4 + t19;
+    t5 = t2 + t9;
+    t13 = t10 - t1;
+    t12 = t12 - t7;
+    t7 = t4 - t19;
+    t4 = t2 - t9;
+    t19 = t10 + t1;
+    t2 = t5 + t13;
+    t9 = t5 - t13;
+    t10 = C6 * t2;
+    t1 = (-C6) * t9;
+    t5 = t4 - t19;
+    t13 = t4 + t19;
+    t2 = (-C6) * t5;
+    t9 = (-C6) * t13;
+    t4 = t3 - t6;
+    t19 = t11 - t14;
+    t5 = t3 + t6;
+    t13 = t11 + t14;
+    t3 = t18 - t10;
+    t6 = t8 - t1;
+    t11 = t18 + t10;
+    t14 = t8 + t1;
+    t18 = t15 - t7;
+    t10 = t16 + t12;
+    t8 = t15 + t7;
+    t1 = t16 - t12;
+    t15 = t17 - t2;
+    t7 = t0 - t9;
+    t16 = t17 + t2;
+    t12 = t0 + t9;
+    re[0] = t5;
+    im[0] = t13;
+    re[20] = t11;
+    im[20] = t14;
+    re[40] = t8;
+    im[40] = t1;
+    re[60] = t16;
+    im[60] = t12;
+    re[80] = t4;
+    im[80] = t19;
+    re[100] = t3;
+    im[100] = t6;
+    re[120] = t18;
+    im[120] = t10;
+    re[140] = t15;
+    im[140] = t7;
+    t17 = X[10];
+    t2 = C7 * t17;
+    t0 = (-C8) * t17;
+    t9 = X[50];
+    t5 = C9 * t9;
+    t13 = (-C10) * t9;
+    t11 = X[90];
+    t14 = C11 * t11;
+    t8 = (-C12) * t11;
+    t1 = X[130];
+    t16 = C13 * t1;
+    t12 = (-C14) * t1;
+    t4 = X[149];
+    t19 = C15 * t4;
+    t3 = C16 * t4;
+    t6 = X[109];
+    t18 = C17 * t6;
+    t10 = C18 * t6;
+    t15 = X[69];
+    t7 = C19 * t15;
+    t17 = C20 * t15;
+    t9 = X[29];
+    t11 = C21 * t9;
+    t1 = C22 * t9;
+    t4 = t2 + t19;
+    t6 = t0 + t3;
+    t15 = t14 + t7;
+    t9 = t8 + t17;
+    t2 = t2 - t19;
+    t19 = t0 - t3;
+    t0 = t14 - t7;
+    t3 = t8 - t17;
+    t14 = t4 + t15;
+    t7 = t6 + t9;
+    t8 = t2 + t3;
+    t17 = t19 - t0;
+    t4 = t4 - t15;
+    t15 = t6 - t9;
+    t6 = t2 - t3;
+    t9 = t19 + t0;
+    t2 = t5 + t18;
+    t3 = t13 + t10;
+    t19 = t16 + t11;
+    t0 = t12 + t1;
+    t5 = t5 - t18;
+    t18 = t13 - t10;
+    t13 = t16 - t11;
+    t10 = t12 - t1;
+    t16 = t2 + t19;
+    t11 = t3 + t0;
+    t12 = t5 + t10;
+    t1 = t18 - t13;
+    t2 = t2 - t19;
+    t19 = t3 - t0;
+    t3 = t5 - t10;
+    t0 = t18 + t13;
+    t5 = t12 + t1;
+    t10 = t12 - t1;
+    t18 = C6 * t5;
+    t13 = (-C6) * t10;
+    t12 = t3 - t0;
+    t1 = t3 + t0;
+    t5 = (-C6) * t12;
+    t10 = (-C6) * t1;
+    t3 = t14 - t16;
+    t0 = t7 - t11;
+    t12 = t14 + t16;
+    t1 = t7 + t11;
+    t14 = t8 - t18;
+    t16 = t17 - t13;
+    t7 = t8 + t18;
+    t11 = t17 + t13;
+    t8 = t4 - t19;
+    t18 = t15 + t2;
+    t17 = t4 + t19;
+    t13 = t15 - t2;
+    t4 = t6 - t5;
+    t19 = t9 - t10;
+    t15 = t6 + t5;
+    t2 = t9 + t10;
+    t6 = t7 + t11;
+    t5 = C0 * t6;
+    t9 = t7 * (-C23);
+    t10 = t11 * C24;
+    t6 = t5 - t10;
+    t7 = t5 + t9;
+    t11 = t17 + t13;
+    t10 = C2 * t11;
+    t5 = t17 * (-C25);
+    t9 = t13 * C26;
+    t11 = t10 - t9;
+    t17 = t10 + t5;
+    t13 = t15 + t2;
+    t9 = C4 * t13;
+    t10 = t15 * (-C27);
+    t5 = t2 * C28;
+    t13 = t9 - t5;
+    t15 = t9 + t10;
+    t2 = t3 + t0;
+    t5 = t3 - t0;
+    t9 = C6 * t2;
+    t10 = (-C6) * t5;
+    t3 = t14 + t16;
+    t0 = C5 * t3;
+    t2 = t14 * (-C27);
+    t5 = t16 * (-C28);
+    t3 = t0 - t5;
+    t14 = t0 + t2;
+    t16 = t8 + t18;
+    t5 = C3 * t16;
+    t0 = t8 * (-C25);
+    t2 = t18 * (-C26);
+    t16 = t5 - t2;
+    t8 = t5 + t0;
+    t18 = t4 + t19;
+    t2 = C1 * t18;
+    t5 = t4 * (-C23);
+    t0 = t19 * (-C24);
+    t18 = t2 - t0;
+    t4 = t2 + t5;
+    re[5] = t12;
+    im[5] = t1;
+    re[25] = t6;
+    im[25] = t7;
+    re[45] = t11;
+    im[45] = t17;
+    re[65] = t13;
+    im[65] = t15;
+    re[85] = t9;
+    im[85] = t10;
+    re[105] = t3;
+    im[105] = t14;
+    re[125] = t16;
+    im[125] = t8;
+    re[145] = t18;
+    im[145] = t4;
+    t19 = X[20];
+    t0 = C29 * t19;
+    t2 = (-C30) * t19;
+    t5 = X[60];
+    t12 = C31 * t5;
+    t1 = (-C32) * t5;
+    t6 = X[100];
+    t7 = C33 * t6;
+    t11 = (-C34) * t6;
+    t17 = X[140];
+    t13 = C35 * t17;
+    t15 = (-C36) * t17;
+    t9 = X[139];
+    t10 = C35 * t9;
+    t3 = C36 * t9;
+    t14 = X[99];
+    t16 = C33 * t14;
+    t8 = C34 * t14;
+    t18 = X[59];
+    t4 = C31 * t18;
+    t19 = C32 * t18;
+    t5 = X[19];
+    t6 = C29 * t5;
+    t17 = C30 * t5;
+    t9 = t0 + t10;
+    t14 = t2 + t3;
+    t18 = t7 + t4;
+    t5 = t11 + t19;
+    t0 = t0 - t10;
+    t10 = t2 - t3;
+    t2 = t7 - t4;
+    t3 = t11 - t19;
+    t7 = t9 + t18;
+    t4 = t14 + t5;
+    t11 = t0 + t3;
+    t19 = t10 - t2;
+    t9 = t9 - t18;
+    t18 = t14 - t5;
+    t14 = t0 - t3;
+    t5 = t10 + t2;
+    t0 = t12 + t16;
+    t3 = t1 + t8;
+    t10 = t13 + t6;
+    t2 = t15 + t17;
+    t12 = t12 - t16;
+    t16 = t1 - t8;
+    t1 = t13 - t6;
+    t8 = t15 - t17;
+    t13 = t0 + t10;
+    t6 = t3 + t2;
+    t15 = t12 + t8;
+    t17 = t16 - t1;
+    t0 = t0 - t10;
+    t10 = t3 - t2;
+    t3 = t12 - t8;
+    t2 = t16 + t1;
+    t12 = t15 + t17;
+    t8 = t15 - t17;
+    t16 = C6 * t12;
+    t1 = (-C6) * t8;
+    t15 = t3 - t2;
+    t17 = t3 + t2;
+    t12 = (-C6) * t15;
+    t8 = (-C6) * t17;
+    t3 = t7 - t13;
+    t2 = t4 - t6;
+    t15 = t7 + t13;
+    t17 = t4 + t6;
+    t7 = t11 - t16;
+    t13 = t19 - t1;
+    t4 = t11 + t16;
+    t6 = t19 + t1;
+    t11 = t9 - t10;
+    t16 = t18 + t0;
+    t19 = t9 + t10;
+    t1 = t18 - t0;
+    t9 = t14 - t12;
+    t10 = t5 - t8;
+    t18 = t14 + t12;
+    t0 = t5 + t8;
+    t14 = t4 + t6;
+    t12 = C2 * t14;
+    t5 = t4 * (-C25);
+    t8 = t6 * C26;
+    t14 = t12 - t8;
+    t4 = t12 + t5;
+    t6 = t19 + t1;
+    t8 = t19 - t1;
+    t12 = C6 * t6;
+    t5 = (-C6) * t8;
+    t19 = t18 + t0;
+    t1 = C3 * t19;
+    t6 = t18 * (-C25);
+    t8 = t0 * (-C26);
+    t19 = t1 - t8;
+    t18 = t1 + t6;
+    t0 = -t3;
+    t8 = t7 + t13;
+    t1 = (-C3) * t8;
+    t6 = t7 * (-C26);
+    t3 = t13 * (-C25);
+    t8 = t1 - t3;
+    t7 = t1 + t6;
+    t13 = t11 - t16;
+    t3 = t11 + t16;
+    t1 = (-C6) * t13;
+    t6 = (-C6) * t3;
+    t11 = t9 + t10;
+    t16 = (-C2) * t11;
+    t13 = t9 * C26;
+    t3 = t10 * (-C25);
+    t11 = t16 - t3;
+    t9 = t16 + t13;
+    re[10] = t15;
+    im[10] = t17;
+    re[30] = t14;
+    im[30] = t4;
+    re[50] = t12;
+    im[50] = t5;
+    re[70] = t19;
+    im[70] = t18;
+    re[90] = t2;
+    im[90] = t0;
+    re[110] = t8;
+    im[110] = t7;
+    re[130] = t1;
+    im[130] = t6;
+    re[150] = t11;
+    im[150] = t9;
+    t10 = X[30];
+    t3 = C21 * t10;
+    t16 = (-C22) * t10;
+    t13 = X[70];
+    t15 = C19 * t13;
+    t17 = (-C20) * t13;
+    t14 = X[110];
+    t4 = C17 * t14;
+    t12 = (-C18) * t14;
+    t5 = X[150];
+    t19 = C15 * t5;
+    t18 = (-C16) * t5;
+    t2 = X[129];
+    t0 = C13 * t2;
+    t8 = C14 * t2;
+    t7 = X[89];
+    t1 = C11 * t7;
+    t6 = C12 * t7;
+    t11 = X[49];
+    t9 = C9 * t11;
+    t10 = C10 * t11;
+    t13 = X[9];
+    t14 = C7 * t13;
+    t5 = C8 * t13;
+    t2 = t3 + t0;
+    t7 = t16 + t8;
+    t11 = t4 + t9;
+    t13 = t12 + t10;
+    t3 = t3 - t0;
+    t0 = t16 - t8;
+    t16 = t4 - t9;
+    t8 = t12 - t10;
+    t4 = t2 + t11;
+    t9 = t7 + t13;
+    t12 = t3 + t8;
+    t10 = t0 - t16;
+    t2 = t2 - t11;
+    t11 = t7 - t13;
+    t7 = t3 - t8;
+    t13 = t0 + t16;
+    t3 = t15 + t1;
+    t8 = t17 + t6;
+    t0 = t19 + t14;
+    t16 = t18 + t5;
+    t15 = t15 - t1;
+    t1 = t17 - t6;
+    t17 = t19 - t14;
+    t6 = t18 - t5;
+    t19 = t3 + t0;
+    t14 = t8 + t16;
+    t18 = t15 + t6;
+    t5 = t1 - t17;
+    t3 = t3 - t0;
+    t0 = t8 - t16;
+    t8 = t15 - t6;
+    t16 = t1 + t17;
+    t15 = t18 + t5;
+    t6 = t18 - t5;
+    t1 = C6 * t15;
+    t17 = (-C6) * t6;
+    t18 = t8 - t16;
+    t5 = t8 + t16;
+    t15 = (-C6) * t18;
+    t6 = (-C6) * t5;
+    t8 = t4 - t19;
+    t16 = t9 - t14;
+    t18 = t4 + t19;
+    t5 = t9 + t14;
+    t4 = t12 - t1;
+    t19 = t10 - t17;
+    t9 = t12 + t1;
+    t14 = t10 + t17;
+    t12 = t2 - t0;
+    t1 = t11 + t3;
+    t10 = t2 + t0;
+    t17 = t11 - t3;
+    t2 = t7 - t15;
+    t0 = t13 - t6;
+    t11 = t7 + t15;
+    t3 = t13 + t6;
+    t7 = t9 + t14;
+    t15 = C4 * t7;
+    t13 = t9 * (-C27);
+    t6 = t14 * C28;
+    t7 = t15 - t6;
+    t9 = t15 + t13;
+    t14 = t10 + t17;
+    t6 = C3 * t14;
+    t15 = t10 * (-C25);
+    t13 = t17 * (-C26);
+    t14 = t6 - t13;
+    t10 = t6 + t15;
+    t17 = t11 + t3;
+    t13 = (-C1) * t17;
+    t6 = t11 * (-C24);
+    t15 = t3 * (-C23);
+    t17 = t13 - t15;
+    t11 = t13 + t6;
+    t3 = t8 - t16;
+    t15 = t8 + t16;
+    t13 = (-C6) * t3;
+    t6 = (-C6) * t15;
+    t8 = t4 + t19;
+    t16 = (-C0) * t8;
+    t3 = t4 * C24;
+    t15 = t19 * (-C23);
+    t8 = t16 - t15;
+    t4 = t16 + t3;
+    t19 = t12 + t1;
+    t15 = (-C2) * t19;
+    t16 = t12 * C25;
+    t3 = t1 * (-C26);
+    t19 = t15 - t3;
+    t12 = t15 + t16;
+    t1 = t2 + t0;
+    t3 = (-C5) * t1;
+    t15 = t2 * C27;
+    t16 = t0 * C28;
+    t1 = t3 - t16;
+    t2 = t3 + t15;
+    re[15] = t18;
+    im[15] = t5;
+    re[35] = t7;
+    im[35] = t9;
+    re[55] = t14;
+    im[55] = t10;
+    re[75] = t17;
+    im[75] = t11;
+    re[95] = t13;
+    im[95] = t6;
+    re[115] = t8;
+    im[115] = t4;
+    re[135] = t19;
+    im[135] = t12;
+    re[155] = t1;
+    im[155] = t2;
+    t0 = re[0];
+    t16 = im[0];
+    t3 = re[5];
+    t15 = im[5];
+    t18 = re[10];
+    t5 = im[10];
+    t7 = re[15];
+    t9 = im[15];
+    t14 = t0 + t18;
+    t10 = t16 + t5;
+    t17 = t3 + t7;
+    t11 = t15 + t9;
+    t13 = t0 - t18;
+    t6 = t16 - t5;
+    t8 = t3 - t7;
+    t4 = t15 - t9;
+    t19 = t14 + t17;
+    t12 = t10 + t11;
+    t1 = t13 + t4;
+    t2 = t6 - t8;
+    t0 = t14 - t17;
+    t18 = t10 - t11;
+    t16 = t13 - t4;
+    t5 = t6 + t8;
+    re[0] = t19;
+    im[0] = t12;
+    re[5] = t1;
+    im[5] = t2;
+    re[10] = t0;
+    im[10] = t18;
+    re[15] = t16;
+    im[15] = t5;
+    t3 = re[20];
+    t7 = im[20];
+    t15 = re[25];
+    t9 = im[25];
+    t14 = re[30];
+    t17 = im[30];
+    t10 = re[35];
+    t11 = im[35];
+    t13 = t3 + t14;
+    t4 = t7 + t17;
+    t6 = t15 + t10;
+    t8 = t9 + t11;
+    t19 = t3 - t14;
+    t12 = t7 - t17;
+    t1 = t15 - t10;
+    t2 = t9 - t11;
+    t0 = t13 + t6;
+    t18 = t4 + t8;
+    t16 = t19 + t2;
+    t5 = t12 - t1;
+    t3 = t13 - t6;
+    t14 = t4 - t8;
+    t7 = t19 - t2;
+    t17 = t12 + t1;
+    re[20] = t0;
+    im[20] = t18;
+    re[25] = t16;
+    im[25] = t5;
+    re[30] = t3;
+    im[30] = t14;
+    re[35] = t7;
+    im[35] = t17;
+    t15 = re[40];
+    t10 = im[40];
+    t9 = re[45];
+    t11 = im[45];
+    t13 = re[50];
+    t6 = im[50];
+    t4 = re[55];
+    t8 = im[55];
+    t19 = t15 + t13;
+    t2 = t10 + t6;
+    t12 = t9 + t4;
+    t1 = t11 + t8;
+    t0 = t15 - t13;
+    t18 = t10 - t6;
+    t16 = t9 - t4;
+    t5 = t11 - t8;
+    t3 = t19 + t12;
+    t14 = t2 + t1;
+    t7 = t0 + t5;
+    t17 = t18 - t16;
+    t15 = t19 - t12;
+    t13 = t2 - t1;
+    t10 = t0 - t5;
+    t6 = t18 + t16;
+    re[40] = t3;
+    im[40] = t14;
+    re[45] = t7;
+    im[45] = t17;
+    re[50] = t15;
+    im[50] = t13;
+    re[55] = t10;
+    im[55] = t6;
+    t9 = re[60];
+    t4 = im[60];
+    t11 = re[65];
+    t8 = im[65];
+    t19 = re[70];
+    t12 = im[70];
+    t2 = re[75];
+    t1 = im[75];
+    t0 = t9 + t19;
+    t5 = t4 + t12;
+    t18 = t11 + t2;
+    t16 = t8 + t1;
+    t3 = t9 - t19;
+    t14 = t4 - t12;
+    t7 = t11 - t2;
+    t17 = t8 - t1;
+    t15 = t0 + t18;
+    t13 = t5 + t16;
+    t10 = t3 + t17;
+    t6 = t14 - t7;
+    t9 = t0 - t18;
+    t19 = t5 - t16;
+    t4 = t3 - t17;
+    t12 = t14 + t7;
+    re[60] = t15;
+    im[60] = t13;
+    re[65] = t10;
+    im[65] = t6;
+    re[70] = t9;
+    im[70] = t19;
+    re[75] = t4;
+    im[75] = t12;
+    t11 = re[80];
+    t2 = im[80];
+    t8 = re[85];
+    t1 = im[85];
+    t0 = re[90];
+    t18 = im[90];
+    t5 = re[95];
+    t16 = im[95];
+    t3 = t11 + t0;
+    t17 = t2 + t18;
+    t14 = t8 + t5;
+    t7 = t1 + t16;
+    t15 = t11 - t0;
+    t13 = t2 - t18;
+    t10 = t8 - t5;
+    t6 = t1 - t16;
+    t9 = t3 + t14;
+    t19 = t17 + t7;
+    t4 = t15 + t6;
+    t12 = t13 - t10;
+    t11 = t3 - t14;
+    t0 = t17 - t7;
+    t2 = t15 - t6;
+    t18 = t13 + t10;
+    re[80] = t9;
+    im[80] = t19;
+    re[85] = t4;
+    im[85] = t12;
+    re[90] = t11;
+    im[90] = t0;
+    re[95] = t2;
+    im[95] = t18;
+    t8 = re[100];
+    t5 = im[100];
+    t1 = re[105];
+    t16 = im[105];
+    t3 = re[110];
+    t14 = im[110];
+    t17 = re[115];
+    t7 = im[115];
+    t15 = t8 + t3;
+    t6 = t5 + t14;
+    t13 = t1 + t17;
+    t10 = t16 + t7;
+    t9 = t8 - t3;
+    t19 = t5 - t14;
+    t4 = t1 - t17;
+    t12 = t16 - t7;
+    t11 = t15 + t13;
+    t0 = t6 + t10;
+    t2 = t9 + t12;
+    t18 = t19 - t4;
+    t8 = t15 - t13;
+    t3 = t6 - t10;
+    t5 = t9 - t12;
+    t14 = t19 + t4;
+    re[100] = t11;
+    im[100] = t0;
+    re[105] = t2;
+    im[105] = t18;
+    re[110] = t8;
+    im[110] = t3;
+    re[115] = t5;
+    im[115] = t14;
+    t1 = re[120];
+    t17 = im[120];
+    t16 = re[125];
+    t7 = im[125];
+    t15 = re[130];
+    t13 = im[130];
+    t6 = re[135];
+    t10 = im[135];
+    t9 = t1 + t15;
+    t12 = t17 + t13;
+    t19 = t16 + t6;
+    t4 = t7 + t10;
+    t11 = t1 - t15;
+    t0 = t17 - t13;
+    t2 = t16 - t6;
+    t18 = t7 - t10;
+    t8 = t9 + t19;
+    t3 = t12 + t4;
+    t5 = t11 + t18;
+    t14 = t0 - t2;
+    t1 = t9 - t19;
+    t15 = t12 - t4;
+    t17 = t11 - t18;
+    t13 = t0 + t2;
+    re[120] = t8;
+    im[120] = t3;
+    re[125] = t5;
+    im[125] = t14;
+    re[130] = t1;
+    im[130] = t15;
+    re[135] = t17;
+    im[135] = t13;
+    t16 = re[140];
+    t6 = im[140];
+    t7 = re[145];
+    t10 = im[145];
+    t9 = re[150];
+    t19 = im[150];
+    t12 = re[155];
+    t4 = im[155];
+    t11 = t16 + t9;
+    t18 = t6 + t19;
+    t0 = t7 + t12;
+    t2 = t10 + t4;
+    t8 = t16 - t9;
+    t3 = t6 - t19;
+    t5 = t7 - t12;
+    t14 = t10 - t4;
+    t1 = t11 + t0;
+    t15 = t18 + t2;
+    t17 = t8 + t14;
+    t13 = t3 - t5;
+    t16 = t11 - t0;
+    t9 = t18 - t2;
+    t6 = t8 - t14;
+    t19 = t3 + t5;
+    re[140] = t1;
+    im[140] = t15;
+    re[145] = t17;
+    im[145] = t13;
+    re[150] = t16;
+    im[150] = t9;
+    re[155] = t6;
+    im[155] = t19;
+    t7 = X[64];
+    t12 = 0.9510565162951535 * t7;
+    t10 = (-0.3090169943749474) * t7;
+    t4 = X[104];
+    t11 = 0.8724960070727972 * t4;
+    t0 = (-0.4886212414969549) * t4;
+    t18 = X[144];
+    t2 = 0.7604059656000309 * t18;
+    t8 = (-0.6494480483301837) * t18;
+    t14 = X[135];
+    t3 = 0.785316930880745 * t14;
+    t5 = 0.619093949309834 * t14;
+    t1 = X[95];
+    t15 = 0.8910065241883679 * t1;
+    t17 = 0.45399049973954675 * t1;
+    t13 = X[55];
+    t16 = 0.9624552364536473 * t13;
+    t9 = 0.27144044986507426 * t13;
+    t6 = X[15];
+    t19 = 0.996917333733128 * t6;
+    t7 = 0.07845909572784494 * t6;
+    t4 = X[24];
+    t18 = 0.9930684569549263 * t4;
+    t14 = (-0.11753739745783764) * t4;
+    t1 = t12 + t15;
+    t13 = t10 + t17;
+    t6 = t2 + t19;
+    t4 = t8 + t7;
+    t12 = t12 - t15;
+    t15 = t10 - t17;
+    t10 = t2 - t19;
+    t17 = t8 - t7;
+    t2 = t1 + t6;
+    t19 = t13 + t4;
+    t8 = t12 + t17;
+    t7 = t15 - t10;
+    t1 = t1 - t6;
+    t6 = t13 - t4;
+    t13 = t12 - t17;
+    t4 = t15 + t10;
+    t12 = t11 + t16;
+    t17 = t0 + t9;
+    t15 = t3 + t18;
+    t10 = t5 + t14;
+    t11 = t11 - t16;
+    t16 = t0 - t9;
+    t0 = t3 - t18;
+    t9 = t5 - t14;
+    t3 = t12 + t15;
+    t18 = t17 + t10;
+    t5 = t11 + t9;
+    t14 = t16 - t0;
+    t12 = t12 - t15;
+    t15 = t17 - t10;
+    t17 = t11 - t9;
+    t10 = t16 + t0;
+    t11 = t5 + t14;
+    t9 = t5 - t14;
+    t16 = C6 * t11;
+    t0 = (-C6) * t9;
+    t5 = t17 - t10;
+    t14 = t17 + t10;
+    t11 = (-C6) * t5;
+    t9 = (-C6) * t14;
+    t17 = t2 - t3;
+    t10 = t19 - t18;
+    t5 = t2 + t3;
+    t14 = t19 + t18;
+    t2 = t8 - t16;
+    t3 = t7 - t0;
+    t19 = t8 + t16;
+    t18 = t7 + t0;
+    t8 = t1 - t15;
+    t16 = t6 + t12;
+    t7 = t1 + t15;
+    t0 = t6 - t12;
+    t1 = t13 - t11;
+    t15 = t4 - t9;
+    t6 = t13 + t11;
+    t12 = t4 + t9;
+    re[32] = t5;
+    im[32] = t14;
+    re[52] = t19;
+    im[52] = t18;
+    re[72] = t7;
+    im[72] = t0;
+    re[92] = t6;
+    im[92] = t12;
+    re[112] = t17;
+    im[112] = t10;
+    re[132] = t2;
+    im[132] = t3;
+    re[152] = t8;
+    im[152] = t16;
+    re[12] = t1;
+    im[12] = t15;
+    t13 = X[74];
+    t11 = 0.9347481818282924 * t13;
+    t4 = (-0.3553109012804161) * t13;
+    t9 = X[114];
+    t5 = 0.8474695394742344 * t9;
+    t14 = (-0.5308440257395095) * t9;
+    t19 = X[154];
+    t18 = 0.7276231179845748 * t19;
+    t7 = (-0.6859771119901928) * t19;
+    t0 = X[125];
+    t6 = 0.8147484825274894 * t0;
+    t12 = 0.5798145481265136 * t0;
+    t17 = X[85];
+    t10 = 0.9122095257974677 * t17;
+    t2 = 0.4097240303476953 * t17;
+    t3 = X[45];
+    t8 = 0.974614868564045 * t3;
+    t16 = 0.22388804785849836 * t3;
+    t1 = X[5];
+    t15 = 0.9995663085020212 * t1;
+    t13 = 0.02944817324796316 * t1;
+    t9 = X[34];
+    t19 = 0.9861049757675088 * t9;
+    t0 = (-0.16612337814576547) * t9;
+    t17 = t11 + t10;
+    t3 = t4 + t2;
+    t1 = t18 + t15;
+    t9 = t7 + t13;
+    t11 = t11 - t10;
+    t10 = t4 - t2;
+    t4 = t18 - t15;
+    t2 = t7 - t13;
+    t18 = t17 + t1;
+    t15 = t3 + t9;
+    t7 = t11 + t2;
+    t13 = t10 - t4;
+    t17 = t17 - t1;
+    t1 = t3 - t9;
+    t3 = t11 - t2;
+    t9 = t10 + t4;
+    t11 = t5 + t8;
+    t2 = t14 + t16;
+    t10 = t6 + t19;
+    t4 = t12 + t0;
+    t5 = t5 - t8;
+    t8 = t14 - t16;
+    t14 = t6 - t19;
+    t16 = t12 - t0;
+    t6 = t11 + t10;
+    t19 = t2 + t4;
+    t12 = t5 + t16;
+    t0 = t8 - t14;
+    t11 = t11 - t10;
+    t10 = t2 - t4;
+    t2 = t5 - t16;
+    t4 = t8 + t14;
+    t5 = t12 + t0;
+    t16 = t12 - t0;
+    t8 = C6 * t5;
+    t14 = (-C6) * t16;
+    t12 = t2 - t4;
+    t0 = t2 + t4;
+    t5 = (-C6) * t12;
+    t16 = (-C6) * t0;
+    t2 = t18 - t6;
+    t4 = t15 - t19;
+    t12 = t18 + t6;
+    t0 = t15 + t19;
+    t18 = t7 - t8;
+    t6 = t13 - t14;
+    t15 = t7 + t8;
+    t19 = t13 + t14;
+    t7 = t17 - t10;
+    t8 = t1 + t11;
+    t13 = t17 + t10;
+    t14 = t1 - t11;
+    t17 = t3 - t5;
+    t10 = t9 - t16;
+    t1 = t3 + t5;
+    t11 = t9 + t16;
+    t3 = t15 + t19;
+    t5 = C0 * t3;
+    t9 = t15 * (-C23);
+    t16 = t19 * C24;
+    t3 = t5 - t16;
+    t15 = t5 + t9;
+    t19 = t13 + t14;
+    t16 = C2 * t19;
+    t5 = t13 * (-C25);
+    t9 = t14 * C26;
+    t19 = t16 - t9;
+    t13 = t16 + t5;
+    t14 = t1 + t11;
+    t9 = C4 * t14;
+    t16 = t1 * (-C27);
+    t5 = t11 * C28;
+    t14 = t9 - t5;
+    t1 = t9 + t16;
+    t11 = t2 + t4;
+    t5 = t2 - t4;
+    t9 = C6 * t11;
+    t16 = (-C6) * t5;
+    t2 = t18 + t6;
+    t4 = C5 * t2;
+    t11 = t18 * (-C27);
+    t5 = t6 * (-C28);
+    t2 = t4 - t5;
+    t18 = t4 + t11;
+    t6 = t7 + t8;
+    t5 = C3 * t6;
+    t4 = t7 * (-C25);
+    t11 = t8 * (-C26);
+    t6 = t5 - t11;
+    t7 = t5 + t4;
+    t8 = t17 + t10;
+    t11 = C1 * t8;
+    t5 = t17 * (-C23);
+    t4 = t10 * (-C24);
+    t8 = t11 - t4;
+    t17 = t11 + t5;
+    re[37] = t12;
+    im[37] = t0;
+    re[57] = t3;
+    im[57] = t15;
+    re[77] = t19;
+    im[77] = t13;
+    re[97] = t14;
+    im[97] = t1;
+    re[117] = t9;
+    im[117] = t16;
+    re[137] = t2;
+    im[137] = t18;
+    re[157] = t6;
+    im[157] = t7;
+    re[17] = t8;
+    im[17] = t17;
+    t10 = X[84];
+    t4 = 0.916187957117136 * t10;
+    t11 = (-0.40074883310314097) * t10;
+    t5 = X[124];
+    t12 = 0.8204014435255136 * t5;
+    t0 = (-0.5717879602276122) * t5;
+    t3 = X[155];
+    t15 = 0.7208535967029188 * t3;
+    t19 = 0.6930873625456359 * t3;
+    t13 = X[115];
+    t14 = 0.8422172337162865 * t13;
+    t1 = 0.5391383229110002 * t13;
+    t9 = X[75];
+    t16 = 0.9312149347588036 * t9;
+    t2 = 0.36447049987914965 * t9;
+    t18 = X[35];
+    t6 = 0.9844265680898916 * t18;
+    t7 = 0.1757962799343545 * t18;
+    t8 = X[4];
+    t17 = 0.9998072404820648 * t8;
+    t10 = (-0.0196336924606283) * t8;
+    t5 = X[44];
+    t3 = 0.9767658813208724 * t5;
+    t13 = (-0.21430915306505077) * t5;
+    t9 = t4 + t16;
+    t18 = t11 + t2;
+    t8 = t15 + t17;
+    t5 = t19 + t10;
+    t4 = t4 - t16;
+    t16 = t11 - t2;
+    t11 = t15 - t17;
+    t2 = t19 - t10;
+    t15 = t9 + t8;
+    t17 = t18 + t5;
+    t19 = t4 + t2;
+    t10 = t16 - t11;
+    t9 = t9 - t8;
+    t8 = t18 - t5;
+    t18 = t4 - t2;
+    t5 = t16 + t11;
+    t4 = t12 + t6;
+    t2 = t0 + t7;
+    t16 = t14 + t3;
+    t11 = t1 + t13;
+    t12 = t12 - t6;
+    t6 = t0 - t7;
+    t0 = t14 - t3;
+    t7 = t1 - t13;
+    t14 = t4 + t16;
+    t3 = t2 + t11;
+    t1 = t12 + t7;
+    t13 = t6 - t0;
+    t4 = t4 - t16;
+    t16 = t2 - t11;
+    t2 = t12 - t7;
+    t11 = t6 + t0;
+    t12 = t1 + t13;
+    t7 = t1 - t13;
+    t6 = C6 * t12;
+    t0 = (-C6) * t7;
+    t1 = t2 - t11;
+    t13 = t2 + t11;
+    t12 = (-C6) * t1;
+    t7 = (-C6) * t13;
+    t2 = t15 - t14;
+    t11 = t17 - t3;
+    t1 = t15 + t14;
+    t13 = t17 + t3;
+    t15 = t19 - t6;
+    t14 = t10 - t0;
+    t17 = t19 + t6;
+    t3 = t10 + t0;
+    t19 = t9 - t16;
+    t6 = t8 + t4;
+    t10 = t9 + t16;
+    t0 = t8 - t4;
+    t9 = t18 - t12;
+    t16 = t5 - t7;
+    t8 = t18 + t12;
+    t4 = t5 + t7;
+    t18 = t17 + t3;
+    t12 = C2 * t18;
+    t5 = t17 * (-C25);
+    t7 = t3 * C26;
+    t18 = t12 - t7;
+    t17 = t12 + t5;
+    t3 = t10 + t0;
+    t7 = t10 - t0;
+    t12 = C6 * t3;
+    t5 = (-C6) * t7;
+    t10 = t8 + t4;
+    t0 = C3 * t10;
+    t3 = t8 * (-C25);
+    t7 = t4 * (-C26);
+    t10 = t0 - t7;
+    t8 = t0 + t3;
+    t4 = -t2;
+    t7 = t15 + t14;
+    t0 = (-C3) * t7;
+    t3 = t15 * (-C26);
+    t2 = t14 * (-C25);
+    t7 = t0 - t2;
+    t15 = t0 + t3;
+    t14 = t19 - t6;
+    t2 = t19 + t6;
+    t0 = (-C6) * t14;
+    t3 = (-C6) * t2;
+    t19 = t9 + t16;
+    t6 = (-C2) * t19;
+    t14 = t9 * C26;
+    t2 = t16 * (-C25);
+    t19 = t6 - t2;
+    t9 = t6 + t14;
+    re[42] = t1;
+    im[42] = t13;
+    re[62] = t18;
+    im[62] = t17;
+    re[82] = t12;
+    im[82] = t5;
+    re[102] = t10;
+    im[102] = t8;
+    re[122] = t11;
+    im[122] = t4;
+    re[142] = t7;
+    im[142] = t15;
+    re[2] = t0;
+    im[2] = t3;
+    re[22] = t19;
+    im[22] = t9;
+    t16 = X[94];
+    t2 = 0.895420555368697 * t16;
+    t6 = (-0.4452213258854682) * t16;
+    t14 = X[134];
+    t1 = 0.7913569286406602 * t14;
+    t13 = (-0.6113544074368165) * t14;
+    t18 = X[145];
+    t17 = 0.7539934819618695 * t18;
+    t12 = 0.6568818989430413 * t18;
+    t5 = X[105];
+    t10 = 0.8676570098195441 * t5;
+    t8 = 0.4971632662526543 * t5;
+    t11 = X[65];
+    t4 = 0.9479769653775104 * t11;
+    t7 = 0.3183389280525497 * t11;
+    t15 = X[25];
+    t0 = 0.991866697787626 * t15;
+    t3 = 0.1272810033739132 * t15;
+    t19 = X[14];
+    t9 = 0.9976395492470157 * t19;
+    t16 = (-0.06866825888437376) * t19;
+    t14 = X[54];
+    t18 = 0.9650736723115474 * t14;
+    t5 = (-0.26197863846333747) * t14;
+    t11 = t2 + t4;
+    t15 = t6 + t7;
+    t19 = t17 + t9;
+    t14 = t12 + t16;
+    t2 = t2 - t4;
+    t4 = t6 - t7;
+    t6 = t17 - t9;
+    t7 = t12 - t16;
+    t17 = t11 + t19;
+    t9 = t15 + t14;
+    t12 = t2 + t7;
+    t16 = t4 - t6;
+    t11 = t11 - t19;
+    t19 = t15 - t14;
+    t15 = t2 - t7;
+    t14 = t4 + t6;
+    t2 = t1 + t0;
+    t7 = t13 + t3;
+    t4 = t10 + t18;
+    t6 = t8 + t5;
+    t1 = t1 - t0;
+    t0 = t13 - t3;
+    t13 = t10 - t18;
+    t3 = t8 - t5;
+    t10 = t2 + t4;
+    t18 = t7 + t6;
+    t8 = t1 + t3;
+    t5 = t0 - t13;
+    t2 = t2 - t4;
+    t4 = t7 - t6;
+    t7 = t1 - t3;
+    t6 = t0 + t13;
+    t1 = t8 + t5;
+    t3 = t8 - t5;
+    t0 = C6 * t1;
+    t13 = (-C6) * t3;
+    t8 = t7 - t6;
+    t5 = t7 + t6;
+    t1 = (-C6) * t8;
+    t3 = (-C6) * t5;
+    t7 = t17 - t10;
+    t6 = t9 - t18;
+    t8 = t17 + t10;
+    t5 = t9 + t18;
+    t17 = t12 - t0;
+    t10 = t16 - t13;
+    t9 = t12 + t0;
+    t18 = t16 + t13;
+    t12 = t11 - t4;
+    t0 = t19 + t2;
+    t16 = t11 + t4;
+    t13 = t19 - t2;
+    t11 = t15 - t1;
+    t4 = t14 - t3;
+    t19 = t15 + t1;
+    t2 = t14 + t3;
+    t15 = t9 + t18;
+    t1 = C4 * t15;
+    t14 = t9 * (-C27);
+    t3 = t18 * C28;
+    t15 = t1 - t3;
+    t9 = t1 + t14;
+    t18 = t16 + t13;
+    t3 = C3 * t18;
+    t1 = t16 * (-C25);
+    t14 = t13 * (-C26);
+    t18 = t3 - t14;
+    t16 = t3 + t1;
+    t13 = t19 + t2;
+    t14 = (-C1) * t13;
+    t3 = t19 * (-C24);
+    t1 = t2 * (-C23);
+    t13 = t14 - t1;
+    t19 = t14 + t3;
+    t2 = t7 - t6;
+    t1 = t7 + t6;
+    t14 = (-C6) * t2;
+    t3 = (-C6) * t1;
+    t7 = t17 + t10;
+    t6 = (-C0) * t7;
+    t2 = t17 * C24;
+    t1 = t10 * (-C23);
+    t7 = t6 - t1;
+    t17 = t6 + t2;
+    t10 = t12 + t0;
+    t1 = (-C2) * t10;
+    t6 = t12 * C25;
+    t2 = t0 * (-C26);
+    t10 = t1 - t2;
+    t12 = t1 + t6;
+    t0 = t11 + t4;
+    t2 = (-C5) * t0;
+    t1 = t11 * C27;
+    t6 = t4 * C28;
+    t0 = t2 - t6;
+    t11 = t2 + t1;
+    re[47] = t8;
+    im[47] = t5;
+    re[67] = t15;
+    im[67] = t9;
+    re[87] = t18;
+    im[87] = t16;
+    re[107] = t13;
+    im[107] = t19;
+    re[127] = t14;
+    im[127] = t3;
+    re[147] = t7;
+    im[147] = t17;
+    re[7] = t10;
+    im[7] = t12;
+    re[27] = t0;
+    im[27] = t11;
+    t4 = re[32];
+    t6 = im[32];
+    t2 = re[37];
+    t1 = im[37];
+    t8 = re[42];
+    t5 = im[42];
+    t15 = re[47];
+    t9 = im[47];
+    t18 = t4 + t8;
+    t16 = t6 + t5;
+    t13 = t2 + t15;
+    t19 = t1 + t9;
+    t14 = t4 - t8;
+    t3 = t6 - t5;
+    t7 = t2 - t15;
+    t17 = t1 - t9;
+    t10 = t18 + t13;
+    t12 = t16 + t19;
+    t0 = t14 + t17;
+    t11 = t3 - t7;
+    t4 = t18 - t13;
+    t8 = t16 - t19;
+    t6 = t14 - t17;
+    t5 = t3 + t7;
+    re[32] = t10;
+    im[32] = t12;
+    re[37] = t0;
+    im[37] = t11;
+    re[42] = t4;
+    im[42] = t8;
+    re[47] = t6;
+    im[47] = t5;
+    t2 = re[52];
+    t15 = im[52];
+    t1 = re[57];
+    t9 = im[57];
+    t18 = re[62];
+    t13 = im[62];
+    t16 = re[67];
+    t19 = im[67];
+    t14 = t2 + t18;
+    t17 = t15 + t13;
+    t3 = t1 + t16;
+    t7 = t9 + t19;
+    t10 = t2 - t18;
+    t12 = t15 - t13;
+    t0 = t1 - t16;
+    t11 = t9 - t19;
+    t4 = t14 + t3;
+    t8 = t17 + t7;
+    t6 = t10 + t11;
+    t5 = t12 - t0;
+    t2 = t14 - t3;
+    t18 = t17 - t7;
+    t15 = t10 - t11;
+    t13 = t12 + t0;
+    re[52] = t4;
+    im[52] = t8;
+    re[57] = t6;
+    im[57] = t5;
+    re[62] = t2;
+    im[62] = t18;
+    re[67] = t15;
+    im[67] = t13;
+    t1 = re[72];
+    t16 = im[72];
+    t9 = re[77];
+    t19 = im[77];
+    t14 = re[82];
+    t3 = im[82];
+    t17 = re[87];
+    t7 = im[87];
+    t10 = t1 + t14;
+    t11 = t16 + t3;
+    t12 = t9 + t17;
+    t0 = t19 + t7;
+    t4 = t1 - t14;
+    t8 = t16 - t3;
+    t6 = t9 - t17;
+    t5 = t19 - t7;
+    t2 = t10 + t12;
+    t18 = t11 + t0;
+    t15 = t4 + t5;
+    t13 = t8 - t6;
+    t1 = t10 - t12;
+    t14 = t11 - t0;
+    t16 = t4 - t5;
+    t3 = t8 + t6;
+    re[72] = t2;
+    im[72] = t18;
+    re[77] = t15;
+    im[77] = t13;
+    re[82] = t1;
+    im[82] = t14;
+    re[87] = t16;
+    im[87] = t3;
+    t9 = re[92];
+    t17 = im[92];
+    t19 = re[97];
+    t7 = im[97];
+    t10 = re[102];
+    t12 = im[102];
+    t11 = re[107];
+    t0 = im[107];
+    t4 = t9 + t10;
+    t5 = t17 + t12;
+    t8 = t19 + t11;
+    t6 = t7 + t0;
+    t2 = t9 - t10;
+    t18 = t17 - t12;
+    t15 = t19 - t11;
+    t13 = t7 - t0;
+    t1 = t4 + t8;
+    t14 = t5 + t6;
+    t16 = t2 + t13;
+    t3 = t18 - t15;
+    t9 = t4 - t8;
+    t10 = t5 - t6;
+    t17 = t2 - t13;
+    t12 = t18 + t15;
+    re[92] = t1;
+    im[92] = t14;
+    re[97] = t16;
+    im[97] = t3;
+    re[102] = t9;
+    im[102] = t10;
+    re[107] = t17;
+    im[107] = t12;
+    t19 = re[112];
+    t11 = im[112];
+    t7 = re[117];
+    t0 = im[117];
+    t4 = re[122];
+    t8 = im[122];
+    t5 = re[127];
+    t6 = im[127];
+    t2 = t19 + t4;
+    t13 = t11 + t8;
+    t18 = t7 + t5;
+    t15 = t0 + t6;
+    t1 = t19 - t4;
+    t14 = t11 - t8;
+    t16 = t7 - t5;
+    t3 = t0 - t6;
+    t9 = t2 + t18;
+    t10 = t13 + t15;
+    t17 = t1 + t3;
+    t12 = t14 - t16;
+    t19 = t2 - t18;
+    t4 = t13 - t15;
+    t11 = t1 - t3;
+    t8 = t14 + t16;
+    re[112] = t9;
+    im[112] = t10;
+    re[117] = t17;
+    im[117] = t12;
+    re[122] = t19;
+    im[122] = t4;
+    re[127] = t11;
+    im[127] = t8;
+    t7 = re[132];
+    t5 = im[132];
+    t0 = re[137];
+    t6 = im[137];
+    t2 = re[142];
+    t18 = im[142];
+    t13 = re[147];
+    t15 = im[147];
+    t1 = t7 + t2;
+    t3 = t5 + t18;
+    t14 = t0 + t13;
+    t16 = t6 + t15;
+    t9 = t7 - t2;
+    t10 = t5 - t18;
+    t17 = t0 - t13;
+    t12 = t6 - t15;
+    t19 = t1 + t14;
+    t4 = t3 + t16;
+    t11 = t9 + t12;
+    t8 = t10 - t17;
+    t7 = t1 - t14;
+    t2 = t3 - t16;
+    t5 = t9 - t12;
+    t18 = t10 + t17;
+    re[132] = t19;
+    im[132] = t4;
+    re[137] = t11;
+    im[137] = t8;
+    re[142] = t7;
+    im[142] = t2;
+    re[147] = t5;
+    im[147] = t18;
+    t0 = re[152];
+    t13 = im[152];
+    t6 = re[157];
+    t15 = im[157];
+    t1 = re[2];
+    t14 = im[2];
+    t3 = re[7];
+    t16 = im[7];
+    t9 = t0 + t1;
+    t12 = t13 + t14;
+    t10 = t6 + t3;
+    t17 = t15 + t16;
+    t19 = t0 - t1;
+    t4 = t13 - t14;
+    t11 = t6 - t3;
+    t8 = t15 - t16;
+    t7 = t9 + t10;
+    t2 = t12 + t17;
+    t5 = t19 + t8;
+    t18 = t4 - t11;
+    t0 = t9 - t10;
+    t1 = t12 - t17;
+    t13 = t19 - t8;
+    t14 = t4 + t11;
+    re[152] = t7;
+    im[152] = t2;
+    re[157] = t5;
+    im[157] = t18;
+    re[2] = t0;
+    im[2] = t1;
+    re[7] = t13;
+    im[7] = t14;
+    t6 = re[12];
+    t3 = im[12];
+    t15 = re[17];
+    t16 = im[17];
+    t9 = re[22];
+    t10 = im[22];
+    t12 = re[27];
+    t17 = im[27];
+    t19 = t6 + t9;
+    t8 = t3 + t10;
+    t4 = t15 + t12;
+    t11 = t16 + t17;
+    t7 = t6 - t9;
+    t2 = t3 - t10;
+    t5 = t15 - t12;
+    t18 = t16 - t17;
+    t0 = t19 + t4;
+    t1 = t8 + t11;
+    t13 = t7 + t18;
+    t14 = t2 - t5;
+    t6 = t19 - t4;
+    t9 = t8 - t11;
+    t3 = t7 - t18;
+    t10 = t2 + t5;
+    re[12] = t0;
+    im[12] = t1;
+    re[17] = t13;
+    im[17] = t14;
+    re[22] = t6;
+    im[22] = t9;
+    re[27] = t3;
+    im[27] = t10;
+}
+
+/**
+ *  Part 2 of ApplyWindowedIMDCT_W10_320_K160().
+ * 
+ *  @param {Number[]} X 
+ *    - The input block (320 points, only the first 160 points are used).
+ *  @param {Number[]} y 
+ *    - The array that would contain the output block (640 points).
+ *  @param {Number[]} re 
+ *    - The scratch buffer (real part, 160 points).
+ *  @param {Number[]} im 
+ *    - The scratch buffer (imaginary part, 160 points).
+ */
+function ApplyWindowedIMDCT_W10_320_K160_Part2(X, y, re, im) {
+    let t0, t1, t10, t11, t12, t13, t14, t15, t16, t17, t18, t19, t2, t3, t4, t5, t6, t7, t8, t9;
+    const C0 = 0.8090169943749475;
+    const C1 = 0.5877852522924731;
+    const C2 = 0.7343225094356856;
+    const C3 = 0.6788007455329417;
+    const C4 = 0.8526401643540922;
+    const C5 = 0.5224985647159488;
+    const C6 = 0.9381913359224842;
+    const C7 = 0.34611705707749296;
+    const C8 = 0.9876883405951378;
+    const C9 = 0.15643446504023087;
+    const C10 = 0.9992290362407229;
+    const C11 = 0.03925981575906861;
+    const C12 = 0.9723699203976766;
+    const C13 = 0.2334453638559054;
+    const C14 = 0.9081431738250813;
+    const C15 = 0.41865973753742813;
+    const C16 = 0.7071067811865476;
+    const C17 = 0.7792012426405167;
+    const C18 = 0.6267738216194696;
+    const C19 = 0.7667451597285615;
+    const C20 = 0.641951602562703;
+    const C21 = 0.8772509113449243;
+    const C22 = 0.4800321224090111;
+    const C23 = 0.9540444024062804;
+    const C24 = 0.2996652769962566;
+    const C25 = 0.9941745021174282;
+    const C26 = 0.10778246304275935;
+    const C27 = 0.9960990332516871;
+    const C28 = 0.08824237052036951;
+    const C29 = 0.9597440371568574;
+    const C30 = 0.2808760992712921;
+    const C31 = 0.8865066159447464;
+    const C32 = 0.4627159170443501;
+    const C33 = 0.9807852804032304;
+    const C34 = 1.1758756024193586;
+    const C35 = 0.7856949583871022;
+    const C36 = 0.9238795325112867;
+    const C37 = 1.3065629648763766;
+    const C38 = 0.5411961001461969;
+    const C39 = 0.8314696123025452;
+    const C40 = 1.3870398453221475;
+    const C41 = 0.27589937928294306;
+    const C42 = 0.5555702330196022;
+    const C43 = 0.3826834323650898;
+    const C44 = 0.19509032201612825;
+    const C45 = 0.7475083268625968;
+    const C46 = 0.6642524379112817;
+    const C47 = 0.7973206537727071;
+    const C48 = 0.6035559419535714;
+    const C49 = 0.8997482840522215;
+    const C50 = 0.436409240673342;
+    const C51 = 0.9675990923602598;
+    const C52 = 0.25249157701515795;
+    const C53 = 0.9982656101847159;
+    const C54 = 0.05887080365118903;
+    const C55 = 0.9905693404435773;
+    const C56 = 0.13701234168196802;
+    const C57 = 0.944806046466878;
+    const C58 = 0.3276301795616935;
+    const C59 = 0.8627343859777918;
+    const C60 = 0.5056573733779846;
+    const C61 = 0.7140145980512682;
+    const C62 = 0.7001308118985237;
+    const C63 = 0.8259753325248732;
+    const C64 = 0.5637062622150166;
+    const C65 = 0.9200780843345949;
+    const C66 = 0.3917350108519559;
+    const C67 = 0.9788227513490724;
+    const C68 = 0.2047096027093796;
+    const C69 = 0.999951808959328;
+    const C70 = 0.009817319337149617;
+    const C71 = 0.9826532793307118;
+    const C72 = 0.18545223811159092;
+    const C73 = 0.927591935255724;
+    const C74 = 0.37359497005251635;
+    const C75 = 0.8368837533084093;
+    const C76 = 0.5473806568087966;
+    t15 = X[128];
+    t12 = C0 * t15;
+    t16 = (-C1) * t15;
+    t17 = X[151];
+    t19 = C2 * t17;
+    t4 = C3 * t17;
+    t8 = X[111];
+    t11 = C4 * t8;
+    t7 = C5 * t8;
+    t18 = X[71];
+    t2 = C6 * t18;
+    t5 = C7 * t18;
+    t0 = X[31];
+    t1 = C8 * t0;
+    t13 = C9 * t0;
+    t14 = X[8];
+    t6 = C10 * t14;
+    t9 = (-C11) * t14;
+    t3 = X[48];
+    t10 = C12 * t3;
+    t15 = (-C13) * t3;
+    t17 = X[88];
+    t8 = C14 * t17;
+    t18 = (-C15) * t17;
+    t0 = t12 + t1;
+    t14 = t16 + t13;
+    t3 = t11 + t10;
+    t17 = t7 + t15;
+    t12 = t12 - t1;
+    t1 = t16 - t13;
+    t16 = t11 - t10;
+    t13 = t7 - t15;
+    t11 = t0 + t3;
+    t10 = t14 + t17;
+    t7 = t12 + t13;
+    t15 = t1 - t16;
+    t0 = t0 - t3;
+    t3 = t14 - t17;
+    t14 = t12 - t13;
+    t17 = t1 + t16;
+    t12 = t19 + t6;
+    t13 = t4 + t9;
+    t1 = t2 + t8;
+    t16 = t5 + t18;
+    t19 = t19 - t6;
+    t6 = t4 - t9;
+    t4 = t2 - t8;
+    t9 = t5 - t18;
+    t2 = t12 + t1;
+    t8 = t13 + t16;
+    t5 = t19 + t9;
+    t18 = t6 - t4;
+    t12 = t12 - t1;
+    t1 = t13 - t16;
+    t13 = t19 - t9;
+    t16 = t6 + t4;
+    t19 = t5 + t18;
+    t9 = t5 - t18;
+    t6 = C16 * t19;
+    t4 = (-C16) * t9;
+    t5 = t13 - t16;
+    t18 = t13 + t16;
+    t19 = (-C16) * t5;
+    t9 = (-C16) * t18;
+    t13 = t11 - t2;
+    t16 = t10 - t8;
+    t5 = t11 + t2;
+    t18 = t10 + t8;
+    t11 = t7 - t6;
+    t2 = t15 - t4;
+    t10 = t7 + t6;
+    t8 = t15 + t4;
+    t7 = t0 - t1;
+    t6 = t3 + t12;
+    t15 = t0 + t1;
+    t4 = t3 - t12;
+    t0 = t14 - t19;
+    t1 = t17 - t9;
+    t3 = t14 + t19;
+    t12 = t17 + t9;
+    re[64] = t5;
+    im[64] = t18;
+    re[84] = t10;
+    im[84] = t8;
+    re[104] = t15;
+    im[104] = t4;
+    re[124] = t3;
+    im[124] = t12;
+    re[144] = t13;
+    im[144] = t16;
+    re[4] = t11;
+    im[4] = t2;
+    re[24] = t7;
+    im[24] = t6;
+    re[44] = t0;
+    im[44] = t1;
+    t14 = X[138];
+    t19 = C17 * t14;
+    t17 = (-C18) * t14;
+    t9 = X[141];
+    t5 = C19 * t9;
+    t18 = C20 * t9;
+    t10 = X[101];
+    t8 = C21 * t10;
+    t15 = C22 * t10;
+    t4 = X[61];
+    t3 = C23 * t4;
+    t12 = C24 * t4;
+    t13 = X[21];
+    t16 = C25 * t13;
+    t11 = C26 * t13;
+    t2 = X[18];
+    t7 = C27 * t2;
+    t6 = (-C28) * t2;
+    t0 = X[58];
+    t1 = C29 * t0;
+    t14 = (-C30) * t0;
+    t9 = X[98];
+    t10 = C31 * t9;
+    t4 = (-C32) * t9;
+    t13 = t19 + t16;
+    t2 = t17 + t11;
+    t0 = t8 + t1;
+    t9 = t15 + t14;
+    t19 = t19 - t16;
+    t16 = t17 - t11;
+    t17 = t8 - t1;
+    t11 = t15 - t14;
+    t8 = t13 + t0;
+    t1 = t2 + t9;
+    t15 = t19 + t11;
+    t14 = t16 - t17;
+    t13 = t13 - t0;
+    t0 = t2 - t9;
+    t2 = t19 - t11;
+    t9 = t16 + t17;
+    t19 = t5 + t7;
+    t11 = t18 + t6;
+    t16 = t3 + t10;
+    t17 = t12 + t4;
+    t5 = t5 - t7;
+    t7 = t18 - t6;
+    t18 = t3 - t10;
+    t6 = t12 - t4;
+    t3 = t19 + t16;
+    t10 = t11 + t17;
+    t12 = t5 + t6;
+    t4 = t7 - t18;
+    t19 = t19 - t16;
+    t16 = t11 - t17;
+    t11 = t5 - t6;
+    t17 = t7 + t18;
+    t5 = t12 + t4;
+    t6 = t12 - t4;
+    t7 = C16 * t5;
+    t18 = (-C16) * t6;
+    t12 = t11 - t17;
+    t4 = t11 + t17;
+    t5 = (-C16) * t12;
+    t6 = (-C16) * t4;
+    t11 = t8 - t3;
+    t17 = t1 - t10;
+    t12 = t8 + t3;
+    t4 = t1 + t10;
+    t8 = t15 - t7;
+    t3 = t14 - t18;
+    t1 = t15 + t7;
+    t10 = t14 + t18;
+    t15 = t13 - t16;
+    t7 = t0 + t19;
+    t14 = t13 + t16;
+    t18 = t0 - t19;
+    t13 = t2 - t5;
+    t16 = t9 - t6;
+    t0 = t2 + t5;
+    t19 = t9 + t6;
+    t2 = t1 + t10;
+    t5 = C33 * t2;
+    t9 = t1 * (-C34);
+    t6 = t10 * C35;
+    t2 = t5 - t6;
+    t1 = t5 + t9;
+    t10 = t14 + t18;
+    t6 = C36 * t10;
+    t5 = t14 * (-C37);
+    t9 = t18 * C38;
+    t10 = t6 - t9;
+    t14 = t6 + t5;
+    t18 = t0 + t19;
+    t9 = C39 * t18;
+    t6 = t0 * (-C40);
+    t5 = t19 * C41;
+    t18 = t9 - t5;
+    t0 = t9 + t6;
+    t19 = t11 + t17;
+    t5 = t11 - t17;
+    t9 = C16 * t19;
+    t6 = (-C16) * t5;
+    t11 = t8 + t3;
+    t17 = C42 * t11;
+    t19 = t8 * (-C40);
+    t5 = t3 * (-C41);
+    t11 = t17 - t5;
+    t8 = t17 + t19;
+    t3 = t15 + t7;
+    t5 = C43 * t3;
+    t17 = t15 * (-C37);
+    t19 = t7 * (-C38);
+    t3 = t5 - t19;
+    t15 = t5 + t17;
+    t7 = t13 + t16;
+    t19 = C44 * t7;
+    t5 = t13 * (-C34);
+    t17 = t16 * (-C35);
+    t7 = t19 - t17;
+    t13 = t19 + t5;
+    re[69] = t12;
+    im[69] = t4;
+    re[89] = t2;
+    im[89] = t1;
+    re[109] = t10;
+    im[109] = t14;
+    re[129] = t18;
+    im[129] = t0;
+    re[149] = t9;
+    im[149] = t6;
+    re[9] = t11;
+    im[9] = t8;
+    re[29] = t3;
+    im[29] = t15;
+    re[49] = t7;
+    im[49] = t13;
+    t16 = X[148];
+    t17 = C45 * t16;
+    t19 = (-C46) * t16;
+    t5 = X[131];
+    t12 = C47 * t5;
+    t4 = C48 * t5;
+    t2 = X[91];
+    t1 = C49 * t2;
+    t10 = C50 * t2;
+    t14 = X[51];
+    t18 = C51 * t14;
+    t0 = C52 * t14;
+    t9 = X[11];
+    t6 = C53 * t9;
+    t11 = C54 * t9;
+    t8 = X[28];
+    t3 = C55 * t8;
+    t15 = (-C56) * t8;
+    t7 = X[68];
+    t13 = C57 * t7;
+    t16 = (-C58) * t7;
+    t5 = X[108];
+    t2 = C59 * t5;
+    t14 = (-C60) * t5;
+    t9 = t17 + t6;
+    t8 = t19 + t11;
+    t7 = t1 + t13;
+    t5 = t10 + t16;
+    t17 = t17 - t6;
+    t6 = t19 - t11;
+    t19 = t1 - t13;
+    t11 = t10 - t16;
+    t1 = t9 + t7;
+    t13 = t8 + t5;
+    t10 = t17 + t11;
+    t16 = t6 - t19;
+    t9 = t9 - t7;
+    t7 = t8 - t5;
+    t8 = t17 - t11;
+    t5 = t6 + t19;
+    t17 = t12 + t3;
+    t11 = t4 + t15;
+    t6 = t18 + t2;
+    t19 = t0 + t14;
+    t12 = t12 - t3;
+    t3 = t4 - t15;
+    t4 = t18 - t2;
+    t15 = t0 - t14;
+    t18 = t17 + t6;
+    t2 = t11 + t19;
+    t0 = t12 + t15;
+    t14 = t3 - t4;
+    t17 = t17 - t6;
+    t6 = t11 - t19;
+    t11 = t12 - t15;
+    t19 = t3 + t4;
+    t12 = t0 + t14;
+    t15 = t0 - t14;
+    t3 = C16 * t12;
+    t4 = (-C16) * t15;
+    t0 = t11 - t19;
+    t14 = t11 + t19;
+    t12 = (-C16) * t0;
+    t15 = (-C16) * t14;
+    t11 = t1 - t18;
+    t19 = t13 - t2;
+    t0 = t1 + t18;
+    t14 = t13 + t2;
+    t1 = t10 - t3;
+    t18 = t16 - t4;
+    t13 = t10 + t3;
+    t2 = t16 + t4;
+    t10 = t9 - t6;
+    t3 = t7 + t17;
+    t16 = t9 + t6;
+    t4 = t7 - t17;
+    t9 = t8 - t12;
+    t6 = t5 - t15;
+    t7 = t8 + t12;
+    t17 = t5 + t15;
+    t8 = t13 + t2;
+    t12 = C36 * t8;
+    t5 = t13 * (-C37);
+    t15 = t2 * C38;
+    t8 = t12 - t15;
+    t13 = t12 + t5;
+    t2 = t16 + t4;
+    t15 = t16 - t4;
+    t12 = C16 * t2;
+    t5 = (-C16) * t15;
+    t16 = t7 + t17;
+    t4 = C43 * t16;
+    t2 = t7 * (-C37);
+    t15 = t17 * (-C38);
+    t16 = t4 - t15;
+    t7 = t4 + t2;
+    t17 = -t11;
+    t15 = t1 + t18;
+    t4 = (-C43) * t15;
+    t2 = t1 * (-C38);
+    t11 = t18 * (-C37);
+    t15 = t4 - t11;
+    t1 = t4 + t2;
+    t18 = t10 - t3;
+    t11 = t10 + t3;
+    t4 = (-C16) * t18;
+    t2 = (-C16) * t11;
+    t10 = t9 + t6;
+    t3 = (-C36) * t10;
+    t18 = t9 * C38;
+    t11 = t6 * (-C37);
+    t10 = t3 - t11;
+    t9 = t3 + t18;
+    re[74] = t0;
+    im[74] = t14;
+    re[94] = t8;
+    im[94] = t13;
+    re[114] = t12;
+    im[114] = t5;
+    re[134] = t16;
+    im[134] = t7;
+    re[154] = t19;
+    im[154] = t17;
+    re[14] = t15;
+    im[14] = t1;
+    re[34] = t4;
+    im[34] = t2;
+    re[54] = t10;
+    im[54] = t9;
+    t6 = X[158];
+    t11 = C61 * t6;
+    t3 = (-C62) * t6;
+    t18 = X[121];
+    t0 = C63 * t18;
+    t14 = C64 * t18;
+    t8 = X[81];
+    t13 = C65 * t8;
+    t12 = C66 * t8;
+    t5 = X[41];
+    t16 = C67 * t5;
+    t7 = C68 * t5;
+    t19 = X[1];
+    t17 = C69 * t19;
+    t15 = C70 * t19;
+    t1 = X[38];
+    t4 = C71 * t1;
+    t2 = (-C72) * t1;
+    t10 = X[78];
+    t9 = C73 * t10;
+    t6 = (-C74) * t10;
+    t18 = X[118];
+    t8 = C75 * t18;
+    t5 = (-C76) * t18;
+    t19 = t11 + t17;
+    t1 = t3 + t15;
+    t10 = t13 + t9;
+    t18 = t12 + t6;
+    t11 = t11 - t17;
+    t17 = t3 - t15;
+    t3 = t13 - t9;
+    t15 = t12 - t6;
+    t13 = t19 + t10;
+    t9 = t1 + t18;
+    t12 = t11 + t15;
+    t6 = t17 - t3;
+    t19 = t19 - t10;
+    t10 = t1 - t18;
+    t1 = t11 - t15;
+    t18 = t17 + t3;
+    t11 = t0 + t4;
+    t15 = t14 + t2;
+    t17 = t16 + t8;
+    t3 = t7 + t5;
+    t0 = t0 - t4;
+    t4 = t14 - t2;
+    t14 = t16 - t8;
+    t2 = t7 - t5;
+    t16 = t11 + t17;
+    t8 = t15 + t3;
+    t7 = t0 + t2;
+    t5 = t4 - t14;
+    t11 = t11 - t17;
+    t17 = t15 - t3;
+    t15 = t0 - t2;
+    t3 = t4 + t14;
+    t0 = t7 + t5;
+    t2 = t7 - t5;
+    t4 = C16 * t0;
+    t14 = (-C16) * t2;
+    t7 = t15 - t3;
+    t5 = t15 + t3;
+    t0 = (-C16) * t7;
+    t2 = (-C16) * t5;
+    t15 = t13 - t16;
+    t3 = t9 - t8;
+    t7 = t13 + t16;
+    t5 = t9 + t8;
+    t13 = t12 - t4;
+    t16 = t6 - t14;
+    t9 = t12 + t4;
+    t8 = t6 + t14;
+    t12 = t19 - t17;
+    t4 = t10 + t11;
+    t6 = t19 + t17;
+    t14 = t10 - t11;
+    t19 = t1 - t0;
+    t17 = t18 - t2;
+    t10 = t1 + t0;
+    t11 = t18 + t2;
+    t1 = t9 + t8;
+    t0 = C39 * t1;
+    t18 = t9 * (-C40);
+    t2 = t8 * C41;
+    t1 = t0 - t2;
+    t9 = t0 + t18;
+    t8 = t6 + t14;
+    t2 = C43 * t8;
+    t0 = t6 * (-C37);
+    t18 = t14 * (-C38);
+    t8 = t2 - t18;
+    t6 = t2 + t0;
+    t14 = t10 + t11;
+    t18 = (-C44) * t14;
+    t2 = t10 * (-C35);
+    t0 = t11 * (-C34);
+    t14 = t18 - t0;
+    t10 = t18 + t2;
+    t11 = t15 - t3;
+    t0 = t15 + t3;
+    t18 = (-C16) * t11;
+    t2 = (-C16) * t0;
+    t15 = t13 + t16;
+    t3 = (-C33) * t15;
+    t11 = t13 * C35;
+    t0 = t16 * (-C34);
+    t15 = t3 - t0;
+    t13 = t3 + t11;
+    t16 = t12 + t4;
+    t0 = (-C36) * t16;
+    t3 = t12 * C37;
+    t11 = t4 * (-C38);
+    t16 = t0 - t11;
+    t12 = t0 + t3;
+    t4 = t19 + t17;
+    t11 = (-C42) * t4;
+    t0 = t19 * C40;
+    t3 = t17 * C41;
+    t4 = t11 - t3;
+    t19 = t11 + t0;
+    re[79] = t7;
+    im[79] = t5;
+    re[99] = t1;
+    im[99] = t9;
+    re[119] = t8;
+    im[119] = t6;
+    re[139] = t14;
+    im[139] = t10;
+    re[159] = t18;
+    im[159] = t2;
+    re[19] = t15;
+    im[19] = t13;
+    re[39] = t16;
+    im[39] = t12;
+    re[59] = t4;
+    im[59] = t19;
+    t17 = re[64];
+    t3 = im[64];
+    t11 = re[69];
+    t0 = im[69];
+    t7 = re[74];
+    t5 = im[74];
+    t1 = re[79];
+    t9 = im[79];
+    t8 = t17 + t7;
+    t6 = t3 + t5;
+    t14 = t11 + t1;
+    t10 = t0 + t9;
+    t18 = t17 - t7;
+    t2 = t3 - t5;
+    t15 = t11 - t1;
+    t13 = t0 - t9;
+    t16 = t8 + t14;
+    t12 = t6 + t10;
+    t4 = t18 + t13;
+    t19 = t2 - t15;
+    t17 = t8 - t14;
+    t7 = t6 - t10;
+    t3 = t18 - t13;
+    t5 = t2 + t15;
+    re[64] = t16;
+    im[64] = t12;
+    re[69] = t4;
+    im[69] = t19;
+    re[74] = t17;
+    im[74] = t7;
+    re[79] = t3;
+    im[79] = t5;
+    t11 = re[84];
+    t1 = im[84];
+    t0 = re[89];
+    t9 = im[89];
+    t8 = re[94];
+    t14 = im[94];
+    t6 = re[99];
+    t10 = im[99];
+    t18 = t11 + t8;
+    t13 = t1 + t14;
+    t2 = t0 + t6;
+    t15 = t9 + t10;
+    t16 = t11 - t8;
+    t12 = t1 - t14;
+    t4 = t0 - t6;
+    t19 = t9 - t10;
+    t17 = t18 + t2;
+    t7 = t13 + t15;
+    t3 = t16 + t19;
+    t5 = t12 - t4;
+    t11 = t18 - t2;
+    t8 = t13 - t15;
+    t1 = t16 - t19;
+    t14 = t12 + t4;
+    re[84] = t17;
+    im[84] = t7;
+    re[89] = t3;
+    im[89] = t5;
+    re[94] = t11;
+    im[94] = t8;
+    re[99] = t1;
+    im[99] = t14;
+    t0 = re[104];
+    t6 = im[104];
+    t9 = re[109];
+    t10 = im[109];
+    t18 = re[114];
+    t2 = im[114];
+    t13 = re[119];
+    t15 = im[119];
+    t16 = t0 + t18;
+    t19 = t6 + t2;
+    t12 = t9 + t13;
+    t4 = t10 + t15;
+    t17 = t0 - t18;
+    t7 = t6 - t2;
+    t3 = t9 - t13;
+    t5 = t10 - t15;
+    t11 = t16 + t12;
+    t8 = t19 + t4;
+    t1 = t17 + t5;
+    t14 = t7 - t3;
+    t0 = t16 - t12;
+    t18 = t19 - t4;
+    t6 = t17 - t5;
+    t2 = t7 + t3;
+    re[104] = t11;
+    im[104] = t8;
+    re[109] = t1;
+    im[109] = t14;
+    re[114] = t0;
+    im[114] = t18;
+    re[119] = t6;
+    im[119] = t2;
+    t9 = re[124];
+    t13 = im[124];
+    t10 = re[129];
+    t15 = im[129];
+    t16 = re[134];
+    t12 = im[134];
+    t19 = re[139];
+    t4 = im[139];
+    t17 = t9 + t16;
+    t5 = t13 + t12;
+    t7 = t10 + t19;
+    t3 = t15 + t4;
+    t11 = t9 - t16;
+    t8 = t13 - t12;
+    t1 = t10 - t19;
+    t14 = t15 - t4;
+    t0 = t17 + t7;
+    t18 = t5 + t3;
+    t6 = t11 + t14;
+    t2 = t8 - t1;
+    t9 = t17 - t7;
+    t16 = t5 - t3;
+    t13 = t11 - t14;
+    t12 = t8 + t1;
+    re[124] = t0;
+    im[124] = t18;
+    re[129] = t6;
+    im[129] = t2;
+    re[134] = t9;
+    im[134] = t16;
+    re[139] = t13;
+    im[139] = t12;
+    t10 = re[144];
+    t19 = im[144];
+    t15 = re[149];
+    t4 = im[149];
+    t17 = re[154];
+    t7 = im[154];
+    t5 = re[159];
+    t3 = im[159];
+    t11 = t10 + t17;
+    t14 = t19 + t7;
+    t8 = t15 + t5;
+    t1 = t4 + t3;
+    t0 = t10 - t17;
+    t18 = t19 - t7;
+    t6 = t15 - t5;
+    t2 = t4 - t3;
+    t9 = t11 + t8;
+    t16 = t14 + t1;
+    t13 = t0 + t2;
+    t12 = t18 - t6;
+    t10 = t11 - t8;
+    t17 = t14 - t1;
+    t19 = t0 - t2;
+    t7 = t18 + t6;
+    re[144] = t9;
+    im[144] = t16;
+    re[149] = t13;
+    im[149] = t12;
+    re[154] = t10;
+    im[154] = t17;
+    re[159] = t19;
+    im[159] = t7;
+    t15 = re[4];
+    t5 = im[4];
+    t4 = re[9];
+    t3 = im[9];
+    t11 = re[14];
+    t8 = im[14];
+    t14 = re[19];
+    t1 = im[19];
+    t0 = t15 + t11;
+    t2 = t5 + t8;
+    t18 = t4 + t14;
+    t6 = t3 + t1;
+    t9 = t15 - t11;
+    t16 = t5 - t8;
+    t13 = t4 - t14;
+    t12 = t3 - t1;
+    t10 = t0 + t18;
+    t17 = t2 + t6;
+    t19 = t9 + t12;
+    t7 = t16 - t13;
+    t15 = t0 - t18;
+    t11 = t2 - t6;
+    t5 = t9 - t12;
+    t8 = t16 + t13;
+    re[4] = t10;
+    im[4] = t17;
+    re[9] = t19;
+    im[9] = t7;
+    re[14] = t15;
+    im[14] = t11;
+    re[19] = t5;
+    im[19] = t8;
+    t4 = re[24];
+    t14 = im[24];
+    t3 = re[29];
+    t1 = im[29];
+    t0 = re[34];
+    t18 = im[34];
+    t2 = re[39];
+    t6 = im[39];
+    t9 = t4 + t0;
+    t12 = t14 + t18;
+    t16 = t3 + t2;
+    t13 = t1 + t6;
+    t10 = t4 - t0;
+    t17 = t14 - t18;
+    t19 = t3 - t2;
+    t7 = t1 - t6;
+    t15 = t9 + t16;
+    t11 = t12 + t13;
+    t5 = t10 + t7;
+    t8 = t17 - t19;
+    t4 = t9 - t16;
+    t0 = t12 - t13;
+    t14 = t10 - t7;
+    t18 = t17 + t19;
+    re[24] = t15;
+    im[24] = t11;
+    re[29] = t5;
+    im[29] = t8;
+    re[34] = t4;
+    im[34] = t0;
+    re[39] = t14;
+    im[39] = t18;
+    t3 = re[44];
+    t2 = im[44];
+    t1 = re[49];
+    t6 = im[49];
+    t9 = re[54];
+    t16 = im[54];
+    t12 = re[59];
+    t13 = im[59];
+    t10 = t3 + t9;
+    t7 = t2 + t16;
+    t17 = t1 + t12;
+    t19 = t6 + t13;
+    t15 = t3 - t9;
+    t11 = t2 - t16;
+    t5 = t1 - t12;
+    t8 = t6 - t13;
+    t4 = t10 + t17;
+    t0 = t7 + t19;
+    t14 = t15 + t8;
+    t18 = t11 - t5;
+    t3 = t10 - t17;
+    t9 = t7 - t19;
+    t2 = t15 - t8;
+    t16 = t11 + t5;
+    re[44] = t4;
+    im[44] = t0;
+    re[49] = t14;
+    im[49] = t18;
+    re[54] = t3;
+    im[54] = t9;
+    re[59] = t2;
+    im[59] = t16;
+    t1 = X[127];
+    t12 = C0 * t1;
+    t6 = C1 * t1;
+    t13 = X[87];
+    t10 = C14 * t13;
+    t17 = C15 * t13;
+    t7 = X[47];
+    t19 = C12 * t7;
+    t15 = C13 * t7;
+    t8 = X[7];
+    t11 = C10 * t8;
+    t5 = C11 * t8;
+    t4 = X[32];
+    t0 = C8 * t4;
+    t14 = (-C9) * t4;
+    t18 = X[72];
+    t3 = C6 * t18;
+    t9 = (-C7) * t18;
+    t2 = X[112];
+    t16 = C4 * t2;
+    t1 = (-C5) * t2;
+    t13 = X[152];
+    t7 = C2 * t13;
+    t8 = (-C3) * t13;
+    t4 = t12 + t0;
+    t18 = t6 + t14;
+    t2 = t19 + t16;
+    t13 = t15 + t1;
+    t12 = t12 - t0;
+    t0 = t6 - t14;
+    t6 = t19 - t16;
+    t14 = t15 - t1;
+    t19 = t4 + t2;
+    t16 = t18 + t13;
+    t15 = t12 + t14;
+    t1 = t0 - t6;
+    t4 = t4 - t2;
+    t2 = t18 - t13;
+    t18 = t12 - t14;
+    t13 = t0 + t6;
+    t12 = t10 + t3;
+    t14 = t17 + t9;
+    t0 = t11 + t7;
+    t6 = t5 + t8;
+    t10 = t10 - t3;
+    t3 = t17 - t9;
+    t17 = t11 - t7;
+    t9 = t5 - t8;
+    t11 = t12 + t0;
+    t7 = t14 + t6;
+    t5 = t10 + t9;
+    t8 = t3 - t17;
+    t12 = t12 - t0;
+    t0 = t14 - t6;
+    t14 = t10 - t9;
+    t6 = t3 + t17;
+    t10 = t5 + t8;
+    t9 = t5 - t8;
+    t3 = C16 * t10;
+    t17 = (-C16) * t9;
+    t5 = t14 - t6;
+    t8 = t14 + t6;
+    t10 = (-C16) * t5;
+    t9 = (-C16) * t8;
+    t14 = t19 - t11;
+    t6 = t16 - t7;
+    t5 = t19 + t11;
+    t8 = t16 + t7;
+    t19 = t15 - t3;
+    t11 = t1 - t17;
+    t16 = t15 + t3;
+    t7 = t1 + t17;
+    t15 = t4 - t0;
+    t3 = t2 + t12;
+    t1 = t4 + t0;
+    t17 = t2 - t12;
+    t4 = t18 - t10;
+    t0 = t13 - t9;
+    t2 = t18 + t10;
+    t12 = t13 + t9;
+    re[96] = t5;
+    im[96] = t8;
+    re[116] = t16;
+    im[116] = t7;
+    re[136] = t1;
+    im[136] = t17;
+    re[156] = t2;
+    im[156] = t12;
+    re[16] = t14;
+    im[16] = t6;
+    re[36] = t19;
+    im[36] = t11;
+    re[56] = t15;
+    im[56] = t3;
+    re[76] = t4;
+    im[76] = t0;
+    t18 = X[117];
+    t10 = C75 * t18;
+    t13 = C76 * t18;
+    t9 = X[77];
+    t5 = C73 * t9;
+    t8 = C74 * t9;
+    t16 = X[37];
+    t7 = C71 * t16;
+    t1 = C72 * t16;
+    t17 = X[2];
+    t2 = C69 * t17;
+    t12 = (-C70) * t17;
+    t14 = X[42];
+    t6 = C67 * t14;
+    t19 = (-C68) * t14;
+    t11 = X[82];
+    t15 = C65 * t11;
+    t3 = (-C66) * t11;
+    t4 = X[122];
+    t0 = C63 * t4;
+    t18 = (-C64) * t4;
+    t9 = X[157];
+    t16 = C61 * t9;
+    t17 = C62 * t9;
+    t14 = t10 + t6;
+    t11 = t13 + t19;
+    t4 = t7 + t0;
+    t9 = t1 + t18;
+    t10 = t10 - t6;
+    t6 = t13 - t19;
+    t13 = t7 - t0;
+    t19 = t1 - t18;
+    t7 = t14 + t4;
+    t0 = t11 + t9;
+    t1 = t10 + t19;
+    t18 = t6 - t13;
+    t14 = t14 - t4;
+    t4 = t11 - t9;
+    t11 = t10 - t19;
+    t9 = t6 + t13;
+    t10 = t5 + t15;
+    t19 = t8 + t3;
+    t6 = t2 + t16;
+    t13 = t12 + t17;
+    t5 = t5 - t15;
+    t15 = t8 - t3;
+    t8 = t2 - t16;
+    t3 = t12 - t17;
+    t2 = t10 + t6;
+    t16 = t19 + t13;
+    t12 = t5 + t3;
+    t17 = t15 - t8;
+    t10 = t10 - t6;
+    t6 = t19 - t13;
+    t19 = t5 - t3;
+    t13 = t15 + t8;
+    t5 = t12 + t17;
+    t3 = t12 - t17;
+    t15 = C16 * t5;
+    t8 = (-C16) * t3;
+    t12 = t19 - t13;
+    t17 = t19 + t13;
+    t5 = (-C16) * t12;
+    t3 = (-C16) * t17;
+    t19 = t7 - t2;
+    t13 = t0 - t16;
+    t12 = t7 + t2;
+    t17 = t0 + t16;
+    t7 = t1 - t15;
+    t2 = t18 - t8;
+    t0 = t1 + t15;
+    t16 = t18 + t8;
+    t1 = t14 - t6;
+    t15 = t4 + t10;
+    t18 = t14 + t6;
+    t8 = t4 - t10;
+    t14 = t11 - t5;
+    t6 = t9 - t3;
+    t4 = t11 + t5;
+    t10 = t9 + t3;
+    t11 = t0 + t16;
+    t5 = C33 * t11;
+    t9 = t0 * (-C34);
+    t3 = t16 * C35;
+    t11 = t5 - t3;
+    t0 = t5 + t9;
+    t16 = t18 + t8;
+    t3 = C36 * t16;
+    t5 = t18 * (-C37);
+    t9 = t8 * C38;
+    t16 = t3 - t9;
+    t18 = t3 + t5;
+    t8 = t4 + t10;
+    t9 = C39 * t8;
+    t3 = t4 * (-C40);
+    t5 = t10 * C41;
+    t8 = t9 - t5;
+    t4 = t9 + t3;
+    t10 = t19 + t13;
+    t5 = t19 - t13;
+    t9 = C16 * t10;
+    t3 = (-C16) * t5;
+    t19 = t7 + t2;
+    t13 = C42 * t19;
+    t10 = t7 * (-C40);
+    t5 = t2 * (-C41);
+    t19 = t13 - t5;
+    t7 = t13 + t10;
+    t2 = t1 + t15;
+    t5 = C43 * t2;
+    t13 = t1 * (-C37);
+    t10 = t15 * (-C38);
+    t2 = t5 - t10;
+    t1 = t5 + t13;
+    t15 = t14 + t6;
+    t10 = C44 * t15;
+    t5 = t14 * (-C34);
+    t13 = t6 * (-C35);
+    t15 = t10 - t13;
+    t14 = t10 + t5;
+    re[101] = t12;
+    im[101] = t17;
+    re[121] = t11;
+    im[121] = t0;
+    re[141] = t16;
+    im[141] = t18;
+    re[1] = t8;
+    im[1] = t4;
+    re[21] = t9;
+    im[21] = t3;
+    re[41] = t19;
+    im[41] = t7;
+    re[61] = t2;
+    im[61] = t1;
+    re[81] = t15;
+    im[81] = t14;
+    t6 = X[107];
+    t13 = C59 * t6;
+    t10 = C60 * t6;
+    t5 = X[67];
+    t12 = C57 * t5;
+    t17 = C58 * t5;
+    t11 = X[27];
+    t0 = C55 * t11;
+    t16 = C56 * t11;
+    t18 = X[12];
+    t8 = C53 * t18;
+    t4 = (-C54) * t18;
+    t9 = X[52];
+    t3 = C51 * t9;
+    t19 = (-C52) * t9;
+    t7 = X[92];
+    t2 = C49 * t7;
+    t1 = (-C50) * t7;
+    t15 = X[132];
+    t14 = C47 * t15;
+    t6 = (-C48) * t15;
+    t5 = X[147];
+    t11 = C45 * t5;
+    t18 = C46 * t5;
+    t9 = t13 + t3;
+    t7 = t10 + t19;
+    t15 = t0 + t14;
+    t5 = t16 + t6;
+    t13 = t13 - t3;
+    t3 = t10 - t19;
+    t10 = t0 - t14;
+    t19 = t16 - t6;
+    t0 = t9 + t15;
+    t14 = t7 + t5;
+    t16 = t13 + t19;
+    t6 = t3 - t10;
+    t9 = t9 - t15;
+    t15 = t7 - t5;
+    t7 = t13 - t19;
+    t5 = t3 + t10;
+    t13 = t12 + t2;
+    t19 = t17 + t1;
+    t3 = t8 + t11;
+    t10 = t4 + t18;
+    t12 = t12 - t2;
+    t2 = t17 - t1;
+    t17 = t8 - t11;
+    t1 = t4 - t18;
+    t8 = t13 + t3;
+    t11 = t19 + t10;
+    t4 = t12 + t1;
+    t18 = t2 - t17;
+    t13 = t13 - t3;
+    t3 = t19 - t10;
+    t19 = t12 - t1;
+    t10 = t2 + t17;
+    t12 = t4 + t18;
+    t1 = t4 - t18;
+    t2 = C16 * t12;
+    t17 = (-C16) * t1;
+    t4 = t19 - t10;
+    t18 = t19 + t10;
+    t12 = (-C16) * t4;
+    t1 = (-C16) * t18;
+    t19 = t0 - t8;
+    t10 = t14 - t11;
+    t4 = t0 + t8;
+    t18 = t14 + t11;
+    t0 = t16 - t2;
+    t8 = t6 - t17;
+    t14 = t16 + t2;
+    t11 = t6 + t17;
+    t16 = t9 - t3;
+    t2 = t15 + t13;
+    t6 = t9 + t3;
+    t17 = t15 - t13;
+    t9 = t7 - t12;
+    t3 = t5 - t1;
+    t15 = t7 + t12;
+    t13 = t5 + t1;
+    t7 = t14 + t11;
+    t12 = C36 * t7;
+    t5 = t14 * (-C37);
+    t1 = t11 * C38;
+    t7 = t12 - t1;
+    t14 = t12 + t5;
+    t11 = t6 + t17;
+    t1 = t6 - t17;
+    t12 = C16 * t11;
+    t5 = (-C16) * t1;
+    t6 = t15 + t13;
+    t17 = C43 * t6;
+    t11 = t15 * (-C37);
+    t1 = t13 * (-C38);
+    t6 = t17 - t1;
+    t15 = t17 + t11;
+    t13 = -t19;
+    t1 = t0 + t8;
+    t17 = (-C43) * t1;
+    t11 = t0 * (-C38);
+    t19 = t8 * (-C37);
+    t1 = t17 - t19;
+    t0 = t17 + t11;
+    t8 = t16 - t2;
+    t19 = t16 + t2;
+    t17 = (-C16) * t8;
+    t11 = (-C16) * t19;
+    t16 = t9 + t3;
+    t2 = (-C36) * t16;
+    t8 = t9 * C38;
+    t19 = t3 * (-C37);
+    t16 = t2 - t19;
+    t9 = t2 + t8;
+    re[106] = t4;
+    im[106] = t18;
+    re[126] = t7;
+    im[126] = t14;
+    re[146] = t12;
+    im[146] = t5;
+    re[6] = t6;
+    im[6] = t15;
+    re[26] = t10;
+    im[26] = t13;
+    re[46] = t1;
+    im[46] = t0;
+    re[66] = t17;
+    im[66] = t11;
+    re[86] = t16;
+    im[86] = t9;
+    t3 = X[97];
+    t19 = C31 * t3;
+    t2 = C32 * t3;
+    t8 = X[57];
+    t4 = C29 * t8;
+    t18 = C30 * t8;
+    t7 = X[17];
+    t14 = C27 * t7;
+    t12 = C28 * t7;
+    t5 = X[22];
+    t6 = C25 * t5;
+    t15 = (-C26) * t5;
+    t10 = X[62];
+    t13 = C23 * t10;
+    t1 = (-C24) * t10;
+    t0 = X[102];
+    t17 = C21 * t0;
+    t11 = (-C22) * t0;
+    t16 = X[142];
+    t9 = C19 * t16;
+    t3 = (-C20) * t16;
+    t8 = X[137];
+    t7 = C17 * t8;
+    t5 = C18 * t8;
+    t10 = t19 + t13;
+    t0 = t2 + t1;
+    t16 = t14 + t9;
+    t8 = t12 + t3;
+    t19 = t19 - t13;
+    t13 = t2 - t1;
+    t2 = t14 - t9;
+    t1 = t12 - t3;
+    t14 = t10 + t16;
+    t9 = t0 + t8;
+    t12 = t19 + t1;
+    t3 = t13 - t2;
+    t10 = t10 - t16;
+    t16 = t0 - t8;
+    t0 = t19 - t1;
+    t8 = t13 + t2;
+    t19 = t4 + t17;
+    t1 = t18 + t11;
+    t13 = t6 + t7;
+    t2 = t15 + t5;
+    t4 = t4 - t17;
+    t17 = t18 - t11;
+    t18 = t6 - t7;
+    t11 = t15 - t5;
+    t6 = t19 + t13;
+    t7 = t1 + t2;
+    t15 = t4 + t11;
+    t5 = t17 - t18;
+    t19 = t19 - t13;
+    t13 = t1 - t2;
+    t1 = t4 - t11;
+    t2 = t17 + t18;
+    t4 = t15 + t5;
+    t11 = t15 - t5;
+    t17 = C16 * t4;
+    t18 = (-C16) * t11;
+    t15 = t1 - t2;
+    t5 = t1 + t2;
+    t4 = (-C16) * t15;
+    t11 = (-C16) * t5;
+    t1 = t14 - t6;
+    t2 = t9 - t7;
+    t15 = t14 + t6;
+    t5 = t9 + t7;
+    t14 = t12 - t17;
+    t6 = t3 - t18;
+    t9 = t12 + t17;
+    t7 = t3 + t18;
+    t12 = t10 - t13;
+    t17 = t16 + t19;
+    t3 = t10 + t13;
+    t18 = t16 - t19;
+    t10 = t0 - t4;
+    t13 = t8 - t11;
+    t16 = t0 + t4;
+    t19 = t8 + t11;
+    t0 = t9 + t7;
+    t4 = C39 * t0;
+    t8 = t9 * (-C40);
+    t11 = t7 * C41;
+    t0 = t4 - t11;
+    t9 = t4 + t8;
+    t7 = t3 + t18;
+    t11 = C43 * t7;
+    t4 = t3 * (-C37);
+    t8 = t18 * (-C38);
+    t7 = t11 - t8;
+    t3 = t11 + t4;
+    t18 = t16 + t19;
+    t8 = (-C44) * t18;
+    t11 = t16 * (-C35);
+    t4 = t19 * (-C34);
+    t18 = t8 - t4;
+    t16 = t8 + t11;
+    t19 = t1 - t2;
+    t4 = t1 + t2;
+    t8 = (-C16) * t19;
+    t11 = (-C16) * t4;
+    t1 = t14 + t6;
+    t2 = (-C33) * t1;
+    t19 = t14 * C35;
+    t4 = t6 * (-C34);
+    t1 = t2 - t4;
+    t14 = t2 + t19;
+    t6 = t12 + t17;
+    t4 = (-C36) * t6;
+    t2 = t12 * C37;
+    t19 = t17 * (-C38);
+    t6 = t4 - t19;
+    t12 = t4 + t2;
+    t17 = t10 + t13;
+    t19 = (-C42) * t17;
+    t4 = t10 * C40;
+    t2 = t13 * C41;
+    t17 = t19 - t2;
+    t10 = t19 + t4;
+    re[111] = t15;
+    im[111] = t5;
+    re[131] = t0;
+    im[131] = t9;
+    re[151] = t7;
+    im[151] = t3;
+    re[11] = t18;
+    im[11] = t16;
+    re[31] = t8;
+    im[31] = t11;
+    re[51] = t1;
+    im[51] = t14;
+    re[71] = t6;
+    im[71] = t12;
+    re[91] = t17;
+    im[91] = t10;
+    t13 = re[96];
+    t2 = im[96];
+    t19 = re[101];
+    t4 = im[101];
+    t15 = re[106];
+    t5 = im[106];
+    t0 = re[111];
+    t9 = im[111];
+    t7 = t13 + t15;
+    t3 = t2 + t5;
+    t18 = t19 + t0;
+    t16 = t4 + t9;
+    t8 = t13 - t15;
+    t11 = t2 - t5;
+    t1 = t19 - t0;
+    t14 = t4 - t9;
+    t6 = t7 + t18;
+    t12 = t3 + t16;
+    t17 = t8 + t14;
+    t10 = t11 - t1;
+    t13 = t7 - t18;
+    t15 = t3 - t16;
+    t2 = t8 - t14;
+    t5 = t11 + t1;
+    re[96] = t6;
+    im[96] = t12;
+    re[101] = t17;
+    im[101] = t10;
+    re[106] = t13;
+    im[106] = t15;
+    re[111] = t2;
+    im[111] = t5;
+    t19 = re[116];
+    t0 = im[116];
+    t4 = re[121];
+    t9 = im[121];
+    t7 = re[126];
+    t18 = im[126];
+    t3 = re[131];
+    t16 = im[131];
+    t8 = t19 + t7;
+    t14 = t0 + t18;
+    t11 = t4 + t3;
+    t1 = t9 + t16;
+    t6 = t19 - t7;
+    t12 = t0 - t18;
+    t17 = t4 - t3;
+    t10 = t9 - t16;
+    t13 = t8 + t11;
+    t15 = t14 + t1;
+    t2 = t6 + t10;
+    t5 = t12 - t17;
+    t19 = t8 - t11;
+    t7 = t14 - t1;
+    t0 = t6 - t10;
+    t18 = t12 + t17;
+    re[116] = t13;
+    im[116] = t15;
+    re[121] = t2;
+    im[121] = t5;
+    re[126] = t19;
+    im[126] = t7;
+    re[131] = t0;
+    im[131] = t18;
+    t4 = re[136];
+    t3 = im[136];
+    t9 = re[141];
+    t16 = im[141];
+    t8 = re[146];
+    t11 = im[146];
+    t14 = re[151];
+    t1 = im[151];
+    t6 = t4 + t8;
+    t10 = t3 + t11;
+    t12 = t9 + t14;
+    t17 = t16 + t1;
+    t13 = t4 - t8;
+    t15 = t3 - t11;
+    t2 = t9 - t14;
+    t5 = t16 - t1;
+    t19 = t6 + t12;
+    t7 = t10 + t17;
+    t0 = t13 + t5;
+    t18 = t15 - t2;
+    t4 = t6 - t12;
+    t8 = t10 - t17;
+    t3 = t13 - t5;
+    t11 = t15 + t2;
+    re[136] = t19;
+    im[136] = t7;
+    re[141] = t0;
+    im[141] = t18;
+    re[146] = t4;
+    im[146] = t8;
+    re[151] = t3;
+    im[151] = t11;
+    t9 = re[156];
+    t14 = im[156];
+    t16 = re[1];
+    t1 = im[1];
+    t6 = re[6];
+    t12 = im[6];
+    t10 = re[11];
+    t17 = im[11];
+    t13 = t9 + t6;
+    t5 = t14 + t12;
+    t15 = t16 + t10;
+    t2 = t1 + t17;
+    t19 = t9 - t6;
+    t7 = t14 - t12;
+    t0 = t16 - t10;
+    t18 = t1 - t17;
+    t4 = t13 + t15;
+    t8 = t5 + t2;
+    t3 = t19 + t18;
+    t11 = t7 - t0;
+    t9 = t13 - t15;
+    t6 = t5 - t2;
+    t14 = t19 - t18;
+    t12 = t7 + t0;
+    re[156] = t4;
+    im[156] = t8;
+    re[1] = t3;
+    im[1] = t11;
+    re[6] = t9;
+    im[6] = t6;
+    re[11] = t14;
+    im[11] = t12;
+    t16 = re[16];
+    t10 = im[16];
+    t1 = re[21];
+    t17 = im[21];
+    t13 = re[26];
+    t15 = im[26];
+    t5 = re[31];
+    t2 = im[31];
+    t19 = t16 + t13;
+    t18 = t10 + t15;
+    t7 = t1 + t5;
+    t0 = t17 + t2;
+    t4 = t16 - t13;
+    t8 = t10 - t15;
+    t3 = t1 - t5;
+    t11 = t17 - t2;
+    t9 = t19 + t7;
+    t6 = t18 + t0;
+    t14 = t4 + t11;
+    t12 = t8 - t3;
+    t16 = t19 - t7;
+    t13 = t18 - t0;
+    t10 = t4 - t11;
+    t15 = t8 + t3;
+    re[16] = t9;
+    im[16] = t6;
+    re[21] = t14;
+    im[21] = t12;
+    re[26] = t16;
+    im[26] = t13;
+    re[31] = t10;
+    im[31] = t15;
+    t1 = re[36];
+    t5 = im[36];
+    t17 = re[41];
+    t2 = im[41];
+    t19 = re[46];
+    t7 = im[46];
+    t18 = re[51];
+    t0 = im[51];
+    t4 = t1 + t19;
+    t11 = t5 + t7;
+    t8 = t17 + t18;
+    t3 = t2 + t0;
+    t9 = t1 - t19;
+    t6 = t5 - t7;
+    t14 = t17 - t18;
+    t12 = t2 - t0;
+    t16 = t4 + t8;
+    t13 = t11 + t3;
+    t10 = t9 + t12;
+    t15 = t6 - t14;
+    t1 = t4 - t8;
+    t19 = t11 - t3;
+    t5 = t9 - t12;
+    t7 = t6 + t14;
+    re[36] = t16;
+    im[36] = t13;
+    re[41] = t10;
+    im[41] = t15;
+    re[46] = t1;
+    im[46] = t19;
+    re[51] = t5;
+    im[51] = t7;
+    t17 = re[56];
+    t18 = im[56];
+    t2 = re[61];
+    t0 = im[61];
+    t4 = re[66];
+    t8 = im[66];
+    t11 = re[71];
+    t3 = im[71];
+    t9 = t17 + t4;
+    t12 = t18 + t8;
+    t6 = t2 + t11;
+    t14 = t0 + t3;
+    t16 = t17 - t4;
+    t13 = t18 - t8;
+    t10 = t2 - t11;
+    t15 = t0 - t3;
+    t1 = t9 + t6;
+    t19 = t12 + t14;
+    t5 = t16 + t15;
+    t7 = t13 - t10;
+    t17 = t9 - t6;
+    t4 = t12 - t14;
+    t18 = t16 - t15;
+    t8 = t13 + t10;
+    re[56] = t1;
+    im[56] = t19;
+    re[61] = t5;
+    im[61] = t7;
+    re[66] = t17;
+    im[66] = t4;
+    re[71] = t18;
+    im[71] = t8;
+    t2 = re[76];
+    t11 = im[76];
+    t0 = re[81];
+    t3 = im[81];
+    t9 = re[86];
+    t6 = im[86];
+    t12 = re[91];
+    t14 = im[91];
+    t16 = t2 + t9;
+    t15 = t11 + t6;
+    t13 = t0 + t12;
+    t10 = t3 + t14;
+    t1 = t2 - t9;
+    t19 = t11 - t6;
+    t5 = t0 - t12;
+    t7 = t3 - t14;
+    t17 = t16 + t13;
+    t4 = t15 + t10;
+    t18 = t1 + t7;
+    t8 = t19 - t5;
+    t2 = t16 - t13;
+    t9 = t15 - t10;
+    t11 = t1 - t7;
+    t6 = t19 + t5;
+    re[76] = t17;
+    im[76] = t4;
+    re[81] = t18;
+    im[81] = t8;
+    re[86] = t2;
+    im[86] = t9;
+    re[91] = t11;
+    im[91] = t6;
+}
+
+/**
+ *  Part 3 of ApplyWindowedIMDCT_W10_320_K160().
+ * 
+ *  @param {Number[]} X 
+ *    - The input block (320 points, only the first 160 points are used).
+ *  @param {Number[]} y 
+ *    - The array that would contain the output block (640 points).
+ *  @param {Number[]} re 
+ *    - The scratch buffer (real part, 160 points).
+ *  @param {Number[]} im 
+ *    - The scratch buffer (imaginary part, 160 points).
+ */
+function ApplyWindowedIMDCT_W10_320_K160_Part3(X, y, re, im) {
+    let t0, t1, t10, t11, t12, t13, t14, t15, t16, t17, t18, t19, t2, t3, t4, t5, t6, t7, t8, t9;
+    const C0 = 0.9510565162951535;
+    const C1 = 0.7071067811865476;
+    const C2 = 0.9807852804032304;
+    const C3 = 1.1758756024193586;
+    const C4 = 0.7856949583871022;
+    const C5 = 0.9238795325112867;
+    const C6 = 1.3065629648763766;
+    const C7 = 0.5411961001461969;
+    const C8 = 0.8314696123025452;
+    const C9 = 1.3870398453221475;
+    const C10 = 0.27589937928294306;
+    const C11 = 0.5555702330196022;
+    const C12 = 0.3826834323650898;
+    const C13 = 0.19509032201612825;
+    const C14 = 0.5590169943749475;
+    const C15 = 0.25;
+    const C16 = 0.5877852522924731;
+    const C17 = 0.9999969880372782;
+    const C18 = 0.0024543667964602917;
+    const C19 = 0.5857978574564389;
+    const C20 = 0.8104571982525948;
+    const C21 = 0.9502952106978444;
+    const C22 = 0.311350305162432;
+    const C23 = 0.3066818220921279;
+    const C24 = 0.9518120927989161;
+    const C25 = 0.8075719170392435;
+    const C26 = 0.5897691063539708;
+    const C27 = 0.8017430476558816;
+    const C28 = 0.5976688761642678;
+    const C29 = 0.9999247018391445;
+    const C30 = 0.012271538285719925;
+    const C31 = 0.5778131101237274;
+    const C32 = 0.8161691061104588;
+    const C33 = 0.9471927896111967;
+    const C34 = 0.3206646524151973;
+    const C35 = 0.2973227995119985;
+    const C36 = 0.9547770173660172;
+    const C37 = 0.28793512034162105;
+    const C38 = 0.9576499185369652;
+    const C39 = 0.7958369046088836;
+    const C40 = 0.6055110414043255;
+    const C41 = 0.9997560408170603;
+    const C42 = 0.02208752701857829;
+    const C43 = 0.5697726719608341;
+    const C44 = 0.8218023498911473;
+    const C45 = 0.9439990761120522;
+    const C46 = 0.32994809334134934;
+    const C47 = 0.9407143780171653;
+    const C48 = 0.33919973318352975;
+    const C49 = 0.27851968938505306;
+    const C50 = 0.9604305194155658;
+    const C51 = 0.789854057144609;
+    const C52 = 0.6132948462299359;
+    const C53 = 0.9994910212269259;
+    const C54 = 0.03190138690961086;
+    const C55 = 0.5616773179219247;
+    const C56 = 0.8273563866508998;
+    const C57 = 0.55352782825407;
+    const C58 = 0.8328306810800937;
+    const C59 = 0.937339011912575;
+    const C60 = 0.34841868024943456;
+    const C61 = 0.2690774141211269;
+    const C62 = 0.9631185520017188;
+    const C63 = 0.7837950819023488;
+    const C64 = 0.6210195404217892;
+    const C65 = 0.9991296686118811;
+    const C66 = 0.041712172078575326;
+    const C67 = 0.9986720177998429;
+    const C68 = 0.05151893694157748;
+    const C69 = 0.5453249884220465;
+    const C70 = 0.8382247055548381;
+    const C71 = 0.9338733031230915;
+    const C72 = 0.3576040459977578;
+    const C73 = 0.2596092046159851;
+    const C74 = 0.965713757217249;
+    const C75 = 0.7776605628587479;
+    const C76 = 0.6286843794577813;
+    const C77 = 0.7714510912715192;
+    const C78 = 0.6362886245847729;
+    const C79 = 0.9981181129001492;
+    const C80 = 0.06132073630220858;
+    const C81 = 0.5370695890326298;
+    const C82 = 0.843537940187827;
+    const C83 = 0.9303175856809415;
+    const C84 = 0.3667549451238308;
+    const C85 = 0.25011597343536635;
+    const C86 = 0.9682158849308758;
+    const C87 = 0.24059863555665045;
+    const C88 = 0.970624693982323;
+    const C89 = 0.765167265622459;
+    const C90 = 0.6438315428897914;
+    const C91 = 0.9974680072993071;
+    const C92 = 0.07111662544264533;
+    const C93 = 0.5287624257583957;
+    const C94 = 0.8487698728784482;
+    const C95 = 0.9266722022935726;
+    const C96 = 0.37587049564494945;
+    const C97 = 0.9229375043106232;
+    const C98 = 0.3849498189853822;
+    const C99 = 0.2310581082806711;
+    const C100 = 0.9729399522055602;
+    const C101 = 0.7588096915597616;
+    const C102 = 0.6513124073706714;
+    const C103 = 0.9967217636558474;
+    const C104 = 0.08090566021470375;
+    const C105 = 0.5204042992610306;
+    const C106 = 0.8539199993621391;
+    const C107 = 0.5119960151141623;
+    const C108 = 0.8589878232589904;
+    const C109 = 0.9191138516900578;
+    const C110 = 0.3939920400610481;
+    const C111 = 0.22149531114330429;
+    const C112 = 0.975161436451181;
+    const C113 = 0.7523789818396478;
+    const C114 = 0.6587304970061238;
+    const C115 = 0.9958794538942858;
+    const C116 = 0.09068689713083816;
+    t0 = X[63];
+    t12 = C0 * t0;
+    t3 = 0.3090169943749474 * t0;
+    t14 = X[23];
+    t16 = 0.9930684569549263 * t14;
+    t13 = 0.11753739745783764 * t14;
+    t15 = X[16];
+    t10 = 0.996917333733128 * t15;
+    t1 = (-0.07845909572784494) * t15;
+    t7 = X[56];
+    t19 = 0.9624552364536473 * t7;
+    t5 = (-0.27144044986507426) * t7;
+    t17 = X[96];
+    t4 = 0.8910065241883679 * t17;
+    t18 = (-0.45399049973954675) * t17;
+    t8 = X[136];
+    t2 = 0.785316930880745 * t8;
+    t9 = (-0.619093949309834) * t8;
+    t11 = X[143];
+    t6 = 0.7604059656000309 * t11;
+    t0 = 0.6494480483301837 * t11;
+    t14 = X[103];
+    t15 = 0.8724960070727972 * t14;
+    t7 = 0.4886212414969549 * t14;
+    t17 = t12 + t4;
+    t8 = t3 + t18;
+    t11 = t10 + t6;
+    t14 = t1 + t0;
+    t12 = t12 - t4;
+    t4 = t3 - t18;
+    t3 = t10 - t6;
+    t18 = t1 - t0;
+    t10 = t17 + t11;
+    t6 = t8 + t14;
+    t1 = t12 + t18;
+    t0 = t4 - t3;
+    t17 = t17 - t11;
+    t11 = t8 - t14;
+    t8 = t12 - t18;
+    t14 = t4 + t3;
+    t12 = t16 + t2;
+    t18 = t13 + t9;
+    t4 = t19 + t15;
+    t3 = t5 + t7;
+    t16 = t16 - t2;
+    t2 = t13 - t9;
+    t13 = t19 - t15;
+    t9 = t5 - t7;
+    t19 = t12 + t4;
+    t15 = t18 + t3;
+    t5 = t16 + t9;
+    t7 = t2 - t13;
+    t12 = t12 - t4;
+    t4 = t18 - t3;
+    t18 = t16 - t9;
+    t3 = t2 + t13;
+    t16 = t5 + t7;
+    t9 = t5 - t7;
+    t2 = C1 * t16;
+    t13 = (-C1) * t9;
+    t5 = t18 - t3;
+    t7 = t18 + t3;
+    t16 = (-C1) * t5;
+    t9 = (-C1) * t7;
+    t18 = t10 - t19;
+    t3 = t6 - t15;
+    t5 = t10 + t19;
+    t7 = t6 + t15;
+    t10 = t1 - t2;
+    t19 = t0 - t13;
+    t6 = t1 + t2;
+    t15 = t0 + t13;
+    t1 = t17 - t4;
+    t2 = t11 + t12;
+    t0 = t17 + t4;
+    t13 = t11 - t12;
+    t17 = t8 - t16;
+    t4 = t14 - t9;
+    t11 = t8 + t16;
+    t12 = t14 + t9;
+    re[128] = t5;
+    im[128] = t7;
+    re[148] = t6;
+    im[148] = t15;
+    re[8] = t0;
+    im[8] = t13;
+    re[28] = t11;
+    im[28] = t12;
+    re[48] = t18;
+    im[48] = t3;
+    re[68] = t10;
+    im[68] = t19;
+    re[88] = t1;
+    im[88] = t2;
+    re[108] = t17;
+    im[108] = t4;
+    t8 = X[53];
+    t16 = 0.9650736723115474 * t8;
+    t14 = 0.26197863846333747 * t8;
+    t9 = X[13];
+    t5 = 0.9976395492470157 * t9;
+    t7 = 0.06866825888437376 * t9;
+    t6 = X[26];
+    t15 = 0.991866697787626 * t6;
+    t0 = (-0.1272810033739132) * t6;
+    t13 = X[66];
+    t11 = 0.9479769653775104 * t13;
+    t12 = (-0.3183389280525497) * t13;
+    t18 = X[106];
+    t3 = 0.8676570098195441 * t18;
+    t10 = (-0.4971632662526543) * t18;
+    t19 = X[146];
+    t1 = 0.7539934819618695 * t19;
+    t2 = (-0.6568818989430413) * t19;
+    t17 = X[133];
+    t4 = 0.7913569286406602 * t17;
+    t8 = 0.6113544074368165 * t17;
+    t9 = X[93];
+    t6 = 0.895420555368697 * t9;
+    t13 = 0.4452213258854682 * t9;
+    t18 = t16 + t3;
+    t19 = t14 + t10;
+    t17 = t15 + t4;
+    t9 = t0 + t8;
+    t16 = t16 - t3;
+    t3 = t14 - t10;
+    t14 = t15 - t4;
+    t10 = t0 - t8;
+    t15 = t18 + t17;
+    t4 = t19 + t9;
+    t0 = t16 + t10;
+    t8 = t3 - t14;
+    t18 = t18 - t17;
+    t17 = t19 - t9;
+    t19 = t16 - t10;
+    t9 = t3 + t14;
+    t16 = t5 + t1;
+    t10 = t7 + t2;
+    t3 = t11 + t6;
+    t14 = t12 + t13;
+    t5 = t5 - t1;
+    t1 = t7 - t2;
+    t7 = t11 - t6;
+    t2 = t12 - t13;
+    t11 = t16 + t3;
+    t6 = t10 + t14;
+    t12 = t5 + t2;
+    t13 = t1 - t7;
+    t16 = t16 - t3;
+    t3 = t10 - t14;
+    t10 = t5 - t2;
+    t14 = t1 + t7;
+    t5 = t12 + t13;
+    t2 = t12 - t13;
+    t1 = C1 * t5;
+    t7 = (-C1) * t2;
+    t12 = t10 - t14;
+    t13 = t10 + t14;
+    t5 = (-C1) * t12;
+    t2 = (-C1) * t13;
+    t10 = t15 - t11;
+    t14 = t4 - t6;
+    t12 = t15 + t11;
+    t13 = t4 + t6;
+    t15 = t0 - t1;
+    t11 = t8 - t7;
+    t4 = t0 + t1;
+    t6 = t8 + t7;
+    t0 = t18 - t3;
+    t1 = t17 + t16;
+    t8 = t18 + t3;
+    t7 = t17 - t16;
+    t18 = t19 - t5;
+    t3 = t9 - t2;
+    t17 = t19 + t5;
+    t16 = t9 + t2;
+    t19 = t4 + t6;
+    t5 = C2 * t19;
+    t9 = t4 * (-C3);
+    t2 = t6 * C4;
+    t19 = t5 - t2;
+    t4 = t5 + t9;
+    t6 = t8 + t7;
+    t2 = C5 * t6;
+    t5 = t8 * (-C6);
+    t9 = t7 * C7;
+    t6 = t2 - t9;
+    t8 = t2 + t5;
+    t7 = t17 + t16;
+    t9 = C8 * t7;
+    t2 = t17 * (-C9);
+    t5 = t16 * C10;
+    t7 = t9 - t5;
+    t17 = t9 + t2;
+    t16 = t10 + t14;
+    t5 = t10 - t14;
+    t9 = C1 * t16;
+    t2 = (-C1) * t5;
+    t10 = t15 + t11;
+    t14 = C11 * t10;
+    t16 = t15 * (-C9);
+    t5 = t11 * (-C10);
+    t10 = t14 - t5;
+    t15 = t14 + t16;
+    t11 = t0 + t1;
+    t5 = C12 * t11;
+    t14 = t0 * (-C6);
+    t16 = t1 * (-C7);
+    t11 = t5 - t16;
+    t0 = t5 + t14;
+    t1 = t18 + t3;
+    t16 = C13 * t1;
+    t5 = t18 * (-C3);
+    t14 = t3 * (-C4);
+    t1 = t16 - t14;
+    t18 = t16 + t5;
+    re[133] = t12;
+    im[133] = t13;
+    re[153] = t19;
+    im[153] = t4;
+    re[13] = t6;
+    im[13] = t8;
+    re[33] = t7;
+    im[33] = t17;
+    re[53] = t9;
+    im[53] = t2;
+    re[73] = t10;
+    im[73] = t15;
+    re[93] = t11;
+    im[93] = t0;
+    re[113] = t1;
+    im[113] = t18;
+    t3 = X[43];
+    t14 = 0.9767658813208724 * t3;
+    t16 = 0.21430915306505077 * t3;
+    t5 = X[3];
+    t12 = 0.9998072404820648 * t5;
+    t13 = 0.0196336924606283 * t5;
+    t19 = X[36];
+    t4 = 0.9844265680898916 * t19;
+    t6 = (-0.1757962799343545) * t19;
+    t8 = X[76];
+    t7 = 0.9312149347588036 * t8;
+    t17 = (-0.36447049987914965) * t8;
+    t9 = X[116];
+    t2 = 0.8422172337162865 * t9;
+    t10 = (-0.5391383229110002) * t9;
+    t15 = X[156];
+    t11 = 0.7208535967029188 * t15;
+    t0 = (-0.6930873625456359) * t15;
+    t1 = X[123];
+    t18 = 0.8204014435255136 * t1;
+    t3 = 0.5717879602276122 * t1;
+    t5 = X[83];
+    t19 = 0.916187957117136 * t5;
+    t8 = 0.40074883310314097 * t5;
+    t9 = t14 + t2;
+    t15 = t16 + t10;
+    t1 = t4 + t18;
+    t5 = t6 + t3;
+    t14 = t14 - t2;
+    t2 = t16 - t10;
+    t16 = t4 - t18;
+    t10 = t6 - t3;
+    t4 = t9 + t1;
+    t18 = t15 + t5;
+    t6 = t14 + t10;
+    t3 = t2 - t16;
+    t9 = t9 - t1;
+    t1 = t15 - t5;
+    t15 = t14 - t10;
+    t5 = t2 + t16;
+    t14 = t12 + t11;
+    t10 = t13 + t0;
+    t2 = t7 + t19;
+    t16 = t17 + t8;
+    t12 = t12 - t11;
+    t11 = t13 - t0;
+    t13 = t7 - t19;
+    t0 = t17 - t8;
+    t7 = t14 + t2;
+    t19 = t10 + t16;
+    t17 = t12 + t0;
+    t8 = t11 - t13;
+    t14 = t14 - t2;
+    t2 = t10 - t16;
+    t10 = t12 - t0;
+    t16 = t11 + t13;
+    t12 = t17 + t8;
+    t0 = t17 - t8;
+    t11 = C1 * t12;
+    t13 = (-C1) * t0;
+    t17 = t10 - t16;
+    t8 = t10 + t16;
+    t12 = (-C1) * t17;
+    t0 = (-C1) * t8;
+    t10 = t4 - t7;
+    t16 = t18 - t19;
+    t17 = t4 + t7;
+    t8 = t18 + t19;
+    t4 = t6 - t11;
+    t7 = t3 - t13;
+    t18 = t6 + t11;
+    t19 = t3 + t13;
+    t6 = t9 - t2;
+    t11 = t1 + t14;
+    t3 = t9 + t2;
+    t13 = t1 - t14;
+    t9 = t15 - t12;
+    t2 = t5 - t0;
+    t1 = t15 + t12;
+    t14 = t5 + t0;
+    t15 = t18 + t19;
+    t12 = C5 * t15;
+    t5 = t18 * (-C6);
+    t0 = t19 * C7;
+    t15 = t12 - t0;
+    t18 = t12 + t5;
+    t19 = t3 + t13;
+    t0 = t3 - t13;
+    t12 = C1 * t19;
+    t5 = (-C1) * t0;
+    t3 = t1 + t14;
+    t13 = C12 * t3;
+    t19 = t1 * (-C6);
+    t0 = t14 * (-C7);
+    t3 = t13 - t0;
+    t1 = t13 + t19;
+    t14 = -t10;
+    t0 = t4 + t7;
+    t13 = (-C12) * t0;
+    t19 = t4 * (-C7);
+    t10 = t7 * (-C6);
+    t0 = t13 - t10;
+    t4 = t13 + t19;
+    t7 = t6 - t11;
+    t10 = t6 + t11;
+    t13 = (-C1) * t7;
+    t19 = (-C1) * t10;
+    t6 = t9 + t2;
+    t11 = (-C5) * t6;
+    t7 = t9 * C7;
+    t10 = t2 * (-C6);
+    t6 = t11 - t10;
+    t9 = t11 + t7;
+    re[138] = t17;
+    im[138] = t8;
+    re[158] = t15;
+    im[158] = t18;
+    re[18] = t12;
+    im[18] = t5;
+    re[38] = t3;
+    im[38] = t1;
+    re[58] = t16;
+    im[58] = t14;
+    re[78] = t0;
+    im[78] = t4;
+    re[98] = t13;
+    im[98] = t19;
+    re[118] = t6;
+    im[118] = t9;
+    t2 = X[33];
+    t10 = 0.9861049757675088 * t2;
+    t11 = 0.16612337814576547 * t2;
+    t7 = X[6];
+    t17 = 0.9995663085020212 * t7;
+    t8 = (-0.02944817324796316) * t7;
+    t15 = X[46];
+    t18 = 0.974614868564045 * t15;
+    t12 = (-0.22388804785849836) * t15;
+    t5 = X[86];
+    t3 = 0.9122095257974677 * t5;
+    t1 = (-0.4097240303476953) * t5;
+    t16 = X[126];
+    t14 = 0.8147484825274894 * t16;
+    t0 = (-0.5798145481265136) * t16;
+    t4 = X[153];
+    t13 = 0.7276231179845748 * t4;
+    t19 = 0.6859771119901928 * t4;
+    t6 = X[113];
+    t9 = 0.8474695394742344 * t6;
+    t2 = 0.5308440257395095 * t6;
+    t7 = X[73];
+    t15 = 0.9347481818282924 * t7;
+    t5 = 0.3553109012804161 * t7;
+    t16 = t10 + t14;
+    t4 = t11 + t0;
+    t6 = t18 + t9;
+    t7 = t12 + t2;
+    t10 = t10 - t14;
+    t14 = t11 - t0;
+    t11 = t18 - t9;
+    t0 = t12 - t2;
+    t18 = t16 + t6;
+    t9 = t4 + t7;
+    t12 = t10 + t0;
+    t2 = t14 - t11;
+    t16 = t16 - t6;
+    t6 = t4 - t7;
+    t4 = t10 - t0;
+    t7 = t14 + t11;
+    t10 = t17 + t13;
+    t0 = t8 + t19;
+    t14 = t3 + t15;
+    t11 = t1 + t5;
+    t17 = t17 - t13;
+    t13 = t8 - t19;
+    t8 = t3 - t15;
+    t19 = t1 - t5;
+    t3 = t10 + t14;
+    t15 = t0 + t11;
+    t1 = t17 + t19;
+    t5 = t13 - t8;
+    t10 = t10 - t14;
+    t14 = t0 - t11;
+    t0 = t17 - t19;
+    t11 = t13 + t8;
+    t17 = t1 + t5;
+    t19 = t1 - t5;
+    t13 = C1 * t17;
+    t8 = (-C1) * t19;
+    t1 = t0 - t11;
+    t5 = t0 + t11;
+    t17 = (-C1) * t1;
+    t19 = (-C1) * t5;
+    t0 = t18 - t3;
+    t11 = t9 - t15;
+    t1 = t18 + t3;
+    t5 = t9 + t15;
+    t18 = t12 - t13;
+    t3 = t2 - t8;
+    t9 = t12 + t13;
+    t15 = t2 + t8;
+    t12 = t16 - t14;
+    t13 = t6 + t10;
+    t2 = t16 + t14;
+    t8 = t6 - t10;
+    t16 = t4 - t17;
+    t14 = t7 - t19;
+    t6 = t4 + t17;
+    t10 = t7 + t19;
+    t4 = t9 + t15;
+    t17 = C8 * t4;
+    t7 = t9 * (-C9);
+    t19 = t15 * C10;
+    t4 = t17 - t19;
+    t9 = t17 + t7;
+    t15 = t2 + t8;
+    t19 = C12 * t15;
+    t17 = t2 * (-C6);
+    t7 = t8 * (-C7);
+    t15 = t19 - t7;
+    t2 = t19 + t17;
+    t8 = t6 + t10;
+    t7 = (-C13) * t8;
+    t19 = t6 * (-C4);
+    t17 = t10 * (-C3);
+    t8 = t7 - t17;
+    t6 = t7 + t19;
+    t10 = t0 - t11;
+    t17 = t0 + t11;
+    t7 = (-C1) * t10;
+    t19 = (-C1) * t17;
+    t0 = t18 + t3;
+    t11 = (-C2) * t0;
+    t10 = t18 * C4;
+    t17 = t3 * (-C3);
+    t0 = t11 - t17;
+    t18 = t11 + t10;
+    t3 = t12 + t13;
+    t17 = (-C5) * t3;
+    t11 = t12 * C6;
+    t10 = t13 * (-C7);
+    t3 = t17 - t10;
+    t12 = t17 + t11;
+    t13 = t16 + t14;
+    t10 = (-C11) * t13;
+    t17 = t16 * C9;
+    t11 = t14 * C10;
+    t13 = t10 - t11;
+    t16 = t10 + t17;
+    re[143] = t1;
+    im[143] = t5;
+    re[3] = t4;
+    im[3] = t9;
+    re[23] = t15;
+    im[23] = t2;
+    re[43] = t8;
+    im[43] = t6;
+    re[63] = t7;
+    im[63] = t19;
+    re[83] = t0;
+    im[83] = t18;
+    re[103] = t3;
+    im[103] = t12;
+    re[123] = t13;
+    im[123] = t16;
+    t14 = re[128];
+    t11 = im[128];
+    t10 = re[133];
+    t17 = im[133];
+    t1 = re[138];
+    t5 = im[138];
+    t4 = re[143];
+    t9 = im[143];
+    t15 = t14 + t1;
+    t2 = t11 + t5;
+    t8 = t10 + t4;
+    t6 = t17 + t9;
+    t7 = t14 - t1;
+    t19 = t11 - t5;
+    t0 = t10 - t4;
+    t18 = t17 - t9;
+    t3 = t15 + t8;
+    t12 = t2 + t6;
+    t13 = t7 + t18;
+    t16 = t19 - t0;
+    t14 = t15 - t8;
+    t1 = t2 - t6;
+    t11 = t7 - t18;
+    t5 = t19 + t0;
+    re[128] = t3;
+    im[128] = t12;
+    re[133] = t13;
+    im[133] = t16;
+    re[138] = t14;
+    im[138] = t1;
+    re[143] = t11;
+    im[143] = t5;
+    t10 = re[148];
+    t4 = im[148];
+    t17 = re[153];
+    t9 = im[153];
+    t15 = re[158];
+    t8 = im[158];
+    t2 = re[3];
+    t6 = im[3];
+    t7 = t10 + t15;
+    t18 = t4 + t8;
+    t19 = t17 + t2;
+    t0 = t9 + t6;
+    t3 = t10 - t15;
+    t12 = t4 - t8;
+    t13 = t17 - t2;
+    t16 = t9 - t6;
+    t14 = t7 + t19;
+    t1 = t18 + t0;
+    t11 = t3 + t16;
+    t5 = t12 - t13;
+    t10 = t7 - t19;
+    t15 = t18 - t0;
+    t4 = t3 - t16;
+    t8 = t12 + t13;
+    re[148] = t14;
+    im[148] = t1;
+    re[153] = t11;
+    im[153] = t5;
+    re[158] = t10;
+    im[158] = t15;
+    re[3] = t4;
+    im[3] = t8;
+    t17 = re[8];
+    t2 = im[8];
+    t9 = re[13];
+    t6 = im[13];
+    t7 = re[18];
+    t19 = im[18];
+    t18 = re[23];
+    t0 = im[23];
+    t3 = t17 + t7;
+    t16 = t2 + t19;
+    t12 = t9 + t18;
+    t13 = t6 + t0;
+    t14 = t17 - t7;
+    t1 = t2 - t19;
+    t11 = t9 - t18;
+    t5 = t6 - t0;
+    t10 = t3 + t12;
+    t15 = t16 + t13;
+    t4 = t14 + t5;
+    t8 = t1 - t11;
+    t17 = t3 - t12;
+    t7 = t16 - t13;
+    t2 = t14 - t5;
+    t19 = t1 + t11;
+    re[8] = t10;
+    im[8] = t15;
+    re[13] = t4;
+    im[13] = t8;
+    re[18] = t17;
+    im[18] = t7;
+    re[23] = t2;
+    im[23] = t19;
+    t9 = re[28];
+    t18 = im[28];
+    t6 = re[33];
+    t0 = im[33];
+    t3 = re[38];
+    t12 = im[38];
+    t16 = re[43];
+    t13 = im[43];
+    t14 = t9 + t3;
+    t5 = t18 + t12;
+    t1 = t6 + t16;
+    t11 = t0 + t13;
+    t10 = t9 - t3;
+    t15 = t18 - t12;
+    t4 = t6 - t16;
+    t8 = t0 - t13;
+    t17 = t14 + t1;
+    t7 = t5 + t11;
+    t2 = t10 + t8;
+    t19 = t15 - t4;
+    t9 = t14 - t1;
+    t3 = t5 - t11;
+    t18 = t10 - t8;
+    t12 = t15 + t4;
+    re[28] = t17;
+    im[28] = t7;
+    re[33] = t2;
+    im[33] = t19;
+    re[38] = t9;
+    im[38] = t3;
+    re[43] = t18;
+    im[43] = t12;
+    t6 = re[48];
+    t16 = im[48];
+    t0 = re[53];
+    t13 = im[53];
+    t14 = re[58];
+    t1 = im[58];
+    t5 = re[63];
+    t11 = im[63];
+    t10 = t6 + t14;
+    t8 = t16 + t1;
+    t15 = t0 + t5;
+    t4 = t13 + t11;
+    t17 = t6 - t14;
+    t7 = t16 - t1;
+    t2 = t0 - t5;
+    t19 = t13 - t11;
+    t9 = t10 + t15;
+    t3 = t8 + t4;
+    t18 = t17 + t19;
+    t12 = t7 - t2;
+    t6 = t10 - t15;
+    t14 = t8 - t4;
+    t16 = t17 - t19;
+    t1 = t7 + t2;
+    re[48] = t9;
+    im[48] = t3;
+    re[53] = t18;
+    im[53] = t12;
+    re[58] = t6;
+    im[58] = t14;
+    re[63] = t16;
+    im[63] = t1;
+    t0 = re[68];
+    t5 = im[68];
+    t13 = re[73];
+    t11 = im[73];
+    t10 = re[78];
+    t15 = im[78];
+    t8 = re[83];
+    t4 = im[83];
+    t17 = t0 + t10;
+    t19 = t5 + t15;
+    t7 = t13 + t8;
+    t2 = t11 + t4;
+    t9 = t0 - t10;
+    t3 = t5 - t15;
+    t18 = t13 - t8;
+    t12 = t11 - t4;
+    t6 = t17 + t7;
+    t14 = t19 + t2;
+    t16 = t9 + t12;
+    t1 = t3 - t18;
+    t0 = t17 - t7;
+    t10 = t19 - t2;
+    t5 = t9 - t12;
+    t15 = t3 + t18;
+    re[68] = t6;
+    im[68] = t14;
+    re[73] = t16;
+    im[73] = t1;
+    re[78] = t0;
+    im[78] = t10;
+    re[83] = t5;
+    im[83] = t15;
+    t13 = re[88];
+    t8 = im[88];
+    t11 = re[93];
+    t4 = im[93];
+    t17 = re[98];
+    t7 = im[98];
+    t19 = re[103];
+    t2 = im[103];
+    t9 = t13 + t17;
+    t12 = t8 + t7;
+    t3 = t11 + t19;
+    t18 = t4 + t2;
+    t6 = t13 - t17;
+    t14 = t8 - t7;
+    t16 = t11 - t19;
+    t1 = t4 - t2;
+    t0 = t9 + t3;
+    t10 = t12 + t18;
+    t5 = t6 + t1;
+    t15 = t14 - t16;
+    t13 = t9 - t3;
+    t17 = t12 - t18;
+    t8 = t6 - t1;
+    t7 = t14 + t16;
+    re[88] = t0;
+    im[88] = t10;
+    re[93] = t5;
+    im[93] = t15;
+    re[98] = t13;
+    im[98] = t17;
+    re[103] = t8;
+    im[103] = t7;
+    t11 = re[108];
+    t19 = im[108];
+    t4 = re[113];
+    t2 = im[113];
+    t9 = re[118];
+    t3 = im[118];
+    t12 = re[123];
+    t18 = im[123];
+    t6 = t11 + t9;
+    t1 = t19 + t3;
+    t14 = t4 + t12;
+    t16 = t2 + t18;
+    t0 = t11 - t9;
+    t10 = t19 - t3;
+    t5 = t4 - t12;
+    t15 = t2 - t18;
+    t13 = t6 + t14;
+    t17 = t1 + t16;
+    t8 = t0 + t15;
+    t7 = t10 - t5;
+    t11 = t6 - t14;
+    t9 = t1 - t16;
+    t19 = t0 - t15;
+    t3 = t10 + t5;
+    re[108] = t13;
+    im[108] = t17;
+    re[113] = t8;
+    im[113] = t7;
+    re[118] = t11;
+    im[118] = t9;
+    re[123] = t19;
+    im[123] = t3;
+    t4 = re[0];
+    t12 = im[0];
+    t2 = re[32];
+    t18 = im[32];
+    t6 = re[64];
+    t14 = im[64];
+    t1 = re[96];
+    t16 = im[96];
+    t0 = re[128];
+    t15 = im[128];
+    t10 = t2 + t0;
+    t5 = t18 + t15;
+    t13 = t6 + t1;
+    t17 = t14 + t16;
+    t8 = t2 - t0;
+    t7 = t18 - t15;
+    t11 = t6 - t1;
+    t9 = t14 - t16;
+    t19 = t10 + t13;
+    t3 = t5 + t17;
+    t2 = t10 - t13;
+    t0 = C14 * t2;
+    t18 = t5 - t17;
+    t15 = C14 * t18;
+    t6 = C15 * t19;
+    t1 = t4 - t6;
+    t14 = C15 * t3;
+    t16 = t12 - t14;
+    t10 = t1 + t0;
+    t13 = t16 + t15;
+    t2 = t1 - t0;
+    t5 = t16 - t15;
+    t17 = C0 * t8;
+    t18 = C16 * t11;
+    t6 = t17 + t18;
+    t14 = C0 * t7;
+    t1 = C16 * t9;
+    t0 = t14 + t1;
+    t16 = C16 * t8;
+    t15 = C0 * t11;
+    t17 = t16 - t15;
+    t18 = C16 * t7;
+    t14 = C0 * t9;
+    t1 = t18 - t14;
+    t8 = t4 + t19;
+    t11 = t12 + t3;
+    t16 = t10 + t0;
+    t15 = t13 - t6;
+    t7 = t2 + t1;
+    t9 = t5 - t17;
+    t18 = t2 - t1;
+    t14 = t5 + t17;
+    t4 = t10 - t0;
+    t19 = t13 + t6;
+    t12 = (-C17) * t8;
+    t3 = (-C18) * t11;
+    t2 = t12 + t3;
+    t1 = 0.0696597151132507 * t2;
+    y[479] = t1;
+    t5 = 0.06866149903828855 * t2;
+    y[480] = t5;
+    t17 = C18 * t8;
+    t10 = (-C17) * t11;
+    t0 = t17 + t10;
+    t13 = 0.04437999374521572 * t0;
+    y[159] = t13;
+    t6 = (-0.045977838079537765) * t0;
+    y[160] = t6;
+    t12 = C19 * t16;
+    t3 = C20 * t15;
+    t1 = t12 + t3;
+    y[32] = 0;
+    t2 = (-0.07982159176456675) * t1;
+    y[287] = t2;
+    t5 = (-C20) * t16;
+    t8 = C19 * t15;
+    t11 = t5 + t8;
+    t17 = 0.07829961620452687 * t11;
+    y[352] = t17;
+    t10 = (-0.003434751278859086) * t11;
+    y[607] = t10;
+    t13 = (-C21) * t7;
+    t0 = (-C22) * t9;
+    t6 = t13 + t0;
+    t12 = 0.07823601689077271 * t6;
+    y[415] = t12;
+    t3 = (-0.002505779022165046) * t6;
+    y[544] = t3;
+    t1 = C22 * t7;
+    t2 = (-C21) * t9;
+    t16 = t1 + t2;
+    y[95] = 0;
+    t15 = (-0.07988648001758296) * t16;
+    y[224] = t15;
+    t5 = C23 * t18;
+    t8 = C24 * t14;
+    t17 = t5 + t8;
+    y[96] = 0;
+    t11 = (-0.079857500076909) * t17;
+    y[223] = t11;
+    t10 = (-C24) * t18;
+    t13 = C23 * t14;
+    t0 = t10 + t13;
+    t12 = 0.07826440840222601 * t0;
+    y[416] = t12;
+    t6 = (-0.0020066073440204468) * t0;
+    y[543] = t6;
+    t3 = (-C25) * t4;
+    t7 = (-C26) * t19;
+    t9 = t3 + t7;
+    t1 = 0.07830557878019587 * t9;
+    y[351] = t1;
+    t2 = (-0.003234809269272303) * t9;
+    y[608] = t2;
+    t16 = C26 * t4;
+    t15 = (-C25) * t19;
+    t5 = t16 + t15;
+    y[31] = 0;
+    t8 = (-0.07981551375213997) * t5;
+    y[288] = t8;
+    t17 = re[20];
+    t11 = im[20];
+    t18 = re[52];
+    t14 = im[52];
+    t10 = re[84];
+    t13 = im[84];
+    t12 = re[116];
+    t0 = im[116];
+    t6 = re[148];
+    t3 = im[148];
+    t7 = t18 + t6;
+    t1 = t14 + t3;
+    t9 = t10 + t12;
+    t2 = t13 + t0;
+    t4 = t18 - t6;
+    t19 = t14 - t3;
+    t16 = t10 - t12;
+    t15 = t13 - t0;
+    t5 = t7 + t9;
+    t8 = t1 + t2;
+    t18 = t7 - t9;
+    t6 = C14 * t18;
+    t14 = t1 - t2;
+    t3 = C14 * t14;
+    t10 = C15 * t5;
+    t12 = t17 - t10;
+    t13 = C15 * t8;
+    t0 = t11 - t13;
+    t7 = t12 + t6;
+    t9 = t0 + t3;
+    t18 = t12 - t6;
+    t1 = t0 - t3;
+    t2 = C0 * t4;
+    t14 = C16 * t16;
+    t10 = t2 + t14;
+    t13 = C0 * t19;
+    t12 = C16 * t15;
+    t6 = t13 + t12;
+    t0 = C16 * t4;
+    t3 = C0 * t16;
+    t2 = t0 - t3;
+    t14 = C16 * t19;
+    t13 = C0 * t15;
+    t12 = t14 - t13;
+    t4 = t17 + t5;
+    t16 = t11 + t8;
+    t0 = t7 + t6;
+    t3 = t9 - t10;
+    t19 = t18 + t12;
+    t15 = t1 - t2;
+    t14 = t18 - t12;
+    t13 = t1 + t2;
+    t17 = t7 - t6;
+    t5 = t9 + t10;
+    t11 = (-C27) * t4;
+    t8 = (-C28) * t16;
+    t18 = t11 + t8;
+    t12 = 0.07832023018246469 * t18;
+    y[349] = t12;
+    t1 = (-0.0028466989314485424) * t18;
+    y[610] = t1;
+    t2 = C28 * t4;
+    t7 = (-C27) * t16;
+    t6 = t2 + t7;
+    y[29] = 0;
+    t9 = (-0.07980058262647095) * t6;
+    y[290] = t9;
+    t10 = (-C29) * t0;
+    t11 = (-C30) * t3;
+    t8 = t10 + t11;
+    t12 = 0.07153664074123962 * t8;
+    y[477] = t12;
+    t18 = 0.06655154500769807 * t8;
+    y[482] = t18;
+    t1 = C30 * t0;
+    t4 = (-C29) * t3;
+    t16 = t1 + t4;
+    t2 = 0.04113124616241223 * t16;
+    y[157] = t2;
+    t7 = (-0.049102837139157966) * t16;
+    y[162] = t7;
+    t6 = C31 * t19;
+    t9 = C32 * t15;
+    t10 = t6 + t9;
+    y[34] = 0;
+    t11 = (-0.07983143667137488) * t10;
+    y[285] = t11;
+    t12 = (-C32) * t19;
+    t8 = C31 * t15;
+    t18 = t12 + t8;
+    t0 = 0.07828996020362315 * t18;
+    y[354] = t0;
+    t3 = (-0.0038442216590680264) * t18;
+    y[605] = t3;
+    t1 = (-C33) * t14;
+    t4 = (-C34) * t13;
+    t2 = t1 + t4;
+    t16 = 0.07818674997851927 * t2;
+    y[413] = t16;
+    t7 = (-0.003436879663473097) * t2;
+    y[546] = t7;
+    t6 = C34 * t14;
+    t9 = (-C33) * t13;
+    t10 = t6 + t9;
+    y[93] = 0;
+    t11 = (-0.07993681796106246) * t10;
+    y[226] = t11;
+    t19 = C35 * t17;
+    t15 = C36 * t5;
+    t12 = t19 + t15;
+    y[98] = 0;
+    t8 = (-0.07979138531197891) * t12;
+    y[221] = t8;
+    t0 = (-C36) * t17;
+    t18 = C35 * t5;
+    t3 = t0 + t18;
+    t1 = 0.0783292579213022 * t3;
+    y[418] = t1;
+    t4 = (-0.0009387706476628306) * t3;
+    y[541] = t4;
+    t16 = re[40];
+    t2 = im[40];
+    t7 = re[72];
+    t14 = im[72];
+    t13 = re[104];
+    t6 = im[104];
+    t9 = re[136];
+    t10 = im[136];
+    t11 = re[8];
+    t19 = im[8];
+    t15 = t7 + t11;
+    t12 = t14 + t19;
+    t8 = t13 + t9;
+    t17 = t6 + t10;
+    t5 = t7 - t11;
+    t0 = t14 - t19;
+    t18 = t13 - t9;
+    t1 = t6 - t10;
+    t3 = t15 + t8;
+    t4 = t12 + t17;
+    t7 = t15 - t8;
+    t11 = C14 * t7;
+    t14 = t12 - t17;
+    t19 = C14 * t14;
+    t13 = C15 * t3;
+    t9 = t16 - t13;
+    t6 = C15 * t4;
+    t10 = t2 - t6;
+    t15 = t9 + t11;
+    t8 = t10 + t19;
+    t7 = t9 - t11;
+    t12 = t10 - t19;
+    t17 = C0 * t5;
+    t14 = C16 * t18;
+    t13 = t17 + t14;
+    t6 = C0 * t0;
+    t9 = C16 * t1;
+    t11 = t6 + t9;
+    t10 = C16 * t5;
+    t19 = C0 * t18;
+    t17 = t10 - t19;
+    t14 = C16 * t0;
+    t6 = C0 * t1;
+    t9 = t14 - t6;
+    t5 = t16 + t3;
+    t18 = t2 + t4;
+    t10 = t15 + t11;
+    t19 = t8 - t13;
+    t0 = t7 + t9;
+    t1 = t12 - t17;
+    t14 = t7 - t9;
+    t6 = t12 + t17;
+    t16 = t15 - t11;
+    t3 = t8 + t13;
+    t2 = C37 * t5;
+    t4 = C38 * t18;
+    t7 = t2 + t4;
+    y[100] = 0;
+    t9 = (-0.07971351158182624) * t7;
+    y[219] = t9;
+    t12 = (-C38) * t5;
+    t17 = C37 * t18;
+    t15 = t12 + t17;
+    t11 = 0.07840577934625735 * t15;
+    y[420] = t11;
+    t8 = 0.0002248455903077584 * t15;
+    y[539] = t8;
+    t13 = (-C39) * t10;
+    t2 = (-C40) * t19;
+    t4 = t13 + t2;
+    t7 = 0.07833883145205656 * t4;
+    y[347] = t7;
+    t9 = (-0.002477252921970635) * t4;
+    y[612] = t9;
+    t5 = C40 * t10;
+    t18 = (-C39) * t19;
+    t12 = t5 + t18;
+    y[27] = 0;
+    t17 = (-0.07978163426939815) * t12;
+    y[292] = t17;
+    t11 = (-C41) * t0;
+    t15 = (-C42) * t1;
+    t8 = t11 + t15;
+    t13 = 0.07324795839525254 * t8;
+    y[475] = t13;
+    t2 = 0.06429934544866318 * t8;
+    y[484] = t2;
+    t7 = C42 * t0;
+    t4 = (-C41) * t1;
+    t9 = t7 + t4;
+    t10 = 0.03783486692384754 * t9;
+    y[155] = t10;
+    t19 = (-0.05211398249574624) * t9;
+    y[164] = t19;
+    t5 = C43 * t14;
+    t18 = C44 * t6;
+    t12 = t5 + t18;
+    y[36] = 0;
+    t17 = (-0.07983866315346692) * t12;
+    y[283] = t17;
+    t11 = (-C44) * t14;
+    t15 = C43 * t6;
+    t13 = t11 + t15;
+    t8 = 0.07828287390015748 * t13;
+    y[356] = t8;
+    t2 = (-0.004263260008349076) * t13;
+    y[603] = t2;
+    t0 = (-C45) * t16;
+    t1 = (-C46) * t3;
+    t7 = t0 + t1;
+    t4 = 0.07814674882599187 * t7;
+    y[411] = t4;
+    t10 = (-0.00428118345726987) * t7;
+    y[548] = t10;
+    t9 = C46 * t16;
+    t19 = (-C45) * t3;
+    t5 = t9 + t19;
+    y[91] = 0;
+    t18 = (-0.07997773540031433) * t5;
+    y[228] = t18;
+    t12 = re[60];
+    t17 = im[60];
+    t14 = re[92];
+    t6 = im[92];
+    t11 = re[124];
+    t15 = im[124];
+    t8 = re[156];
+    t13 = im[156];
+    t2 = re[28];
+    t0 = im[28];
+    t1 = t14 + t2;
+    t4 = t6 + t0;
+    t7 = t11 + t8;
+    t10 = t15 + t13;
+    t16 = t14 - t2;
+    t3 = t6 - t0;
+    t9 = t11 - t8;
+    t19 = t15 - t13;
+    t5 = t1 + t7;
+    t18 = t4 + t10;
+    t14 = t1 - t7;
+    t2 = C14 * t14;
+    t6 = t4 - t10;
+    t0 = C14 * t6;
+    t11 = C15 * t5;
+    t8 = t12 - t11;
+    t15 = C15 * t18;
+    t13 = t17 - t15;
+    t1 = t8 + t2;
+    t7 = t13 + t0;
+    t14 = t8 - t2;
+    t4 = t13 - t0;
+    t10 = C0 * t16;
+    t6 = C16 * t9;
+    t11 = t10 + t6;
+    t15 = C0 * t3;
+    t8 = C16 * t19;
+    t2 = t15 + t8;
+    t13 = C16 * t16;
+    t0 = C0 * t9;
+    t10 = t13 - t0;
+    t6 = C16 * t3;
+    t15 = C0 * t19;
+    t8 = t6 - t15;
+    t16 = t12 + t5;
+    t9 = t17 + t18;
+    t13 = t1 + t2;
+    t0 = t7 - t11;
+    t3 = t14 + t8;
+    t19 = t4 - t10;
+    t6 = t14 - t8;
+    t15 = t4 + t10;
+    t12 = t1 - t2;
+    t5 = t7 + t11;
+    t17 = (-C47) * t16;
+    t18 = (-C48) * t9;
+    t14 = t17 + t18;
+    t8 = 0.07811531141943964 * t14;
+    y[409] = t8;
+    t4 = (-0.0050419445369264924) * t14;
+    y[550] = t4;
+    t10 = C48 * t16;
+    t1 = (-C47) * t9;
+    t2 = t10 + t1;
+    y[89] = 0;
+    t7 = (-0.08000992233700084) * t2;
+    y[230] = t7;
+    t11 = C49 * t13;
+    t17 = C50 * t0;
+    t18 = t11 + t17;
+    y[102] = 0;
+    t8 = (-0.07962281744295999) * t18;
+    y[217] = t8;
+    t14 = (-C50) * t13;
+    t4 = C49 * t0;
+    t16 = t14 + t4;
+    t9 = 0.07849508722141564 * t16;
+    y[422] = t9;
+    t10 = 0.0014873424733383262 * t16;
+    y[537] = t10;
+    t1 = (-C51) * t3;
+    t2 = (-C52) * t19;
+    t7 = t1 + t2;
+    t11 = 0.07836190935367703 * t7;
+    y[345] = t11;
+    t17 = (-0.0021295937563124336) * t7;
+    y[614] = t17;
+    t18 = C52 * t3;
+    t8 = (-C51) * t19;
+    t13 = t18 + t8;
+    y[25] = 0;
+    t0 = (-0.07975813825300476) * t13;
+    y[294] = t0;
+    t14 = (-C53) * t6;
+    t4 = (-C54) * t15;
+    t9 = t14 + t4;
+    t16 = 0.07478768505676862 * t9;
+    y[473] = t16;
+    t10 = 0.06191719555714078 * t9;
+    y[486] = t10;
+    t1 = C54 * t6;
+    t2 = (-C53) * t15;
+    t11 = t1 + t2;
+    t7 = 0.034520136097357317 * t11;
+    y[153] = t7;
+    t17 = (-0.05499047041607303) * t11;
+    y[166] = t17;
+    t3 = C55 * t12;
+    t19 = C56 * t5;
+    t18 = t3 + t19;
+    y[38] = 0;
+    t8 = (-0.07984398377528498) * t18;
+    y[281] = t8;
+    t13 = (-C56) * t12;
+    t0 = C55 * t5;
+    t14 = t13 + t0;
+    t4 = 0.07827765730715747 * t14;
+    y[358] = t4;
+    t16 = (-0.004687378358449063) * t14;
+    y[601] = t16;
+    t9 = re[80];
+    t10 = im[80];
+    t6 = re[112];
+    t15 = im[112];
+    t1 = re[144];
+    t2 = im[144];
+    t7 = re[16];
+    t11 = im[16];
+    t17 = re[48];
+    t3 = im[48];
+    t19 = t6 + t17;
+    t18 = t15 + t3;
+    t8 = t1 + t7;
+    t12 = t2 + t11;
+    t5 = t6 - t17;
+    t13 = t15 - t3;
+    t0 = t1 - t7;
+    t4 = t2 - t11;
+    t14 = t19 + t8;
+    t16 = t18 + t12;
+    t6 = t19 - t8;
+    t17 = C14 * t6;
+    t15 = t18 - t12;
+    t3 = C14 * t15;
+    t1 = C15 * t14;
+    t7 = t9 - t1;
+    t2 = C15 * t16;
+    t11 = t10 - t2;
+    t19 = t7 + t17;
+    t8 = t11 + t3;
+    t6 = t7 - t17;
+    t18 = t11 - t3;
+    t12 = C0 * t5;
+    t15 = C16 * t0;
+    t1 = t12 + t15;
+    t2 = C0 * t13;
+    t7 = C16 * t4;
+    t17 = t2 + t7;
+    t11 = C16 * t5;
+    t3 = C0 * t0;
+    t12 = t11 - t3;
+    t15 = C16 * t13;
+    t2 = C0 * t4;
+    t7 = t15 - t2;
+    t5 = t9 + t14;
+    t0 = t10 + t16;
+    t11 = t19 + t17;
+    t3 = t8 - t1;
+    t13 = t6 + t7;
+    t4 = t18 - t12;
+    t15 = t6 - t7;
+    t2 = t18 + t12;
+    t9 = t19 - t17;
+    t14 = t8 + t1;
+    t10 = C57 * t5;
+    t16 = C58 * t0;
+    t6 = t10 + t16;
+    y[40] = 0;
+    t7 = (-0.07984800883388636) * t6;
+    y[279] = t7;
+    t18 = (-C58) * t5;
+    t12 = C57 * t0;
+    t19 = t18 + t12;
+    t17 = 0.07827371140841262 * t19;
+    y[360] = t17;
+    t8 = (-0.005112632604600919) * t19;
+    y[599] = t8;
+    t1 = (-C59) * t11;
+    t10 = (-C60) * t3;
+    t16 = t1 + t10;
+    t6 = 0.07809164250216843 * t16;
+    y[407] = t6;
+    t7 = (-0.005722778753227274) * t16;
+    y[552] = t7;
+    t5 = C60 * t11;
+    t0 = (-C59) * t3;
+    t18 = t5 + t0;
+    y[87] = 0;
+    t12 = (-0.08003417266868801) * t18;
+    y[232] = t12;
+    t17 = C61 * t13;
+    t19 = C62 * t4;
+    t8 = t17 + t19;
+    y[104] = 0;
+    t1 = (-0.07951795443212767) * t8;
+    y[215] = t1;
+    t10 = (-C62) * t13;
+    t6 = C61 * t4;
+    t16 = t10 + t6;
+    t7 = 0.0785986013427278 * t16;
+    y[424] = t7;
+    t11 = 0.0028522246127330657 * t16;
+    y[535] = t11;
+    t3 = (-C63) * t15;
+    t5 = (-C64) * t2;
+    t0 = t3 + t5;
+    t18 = 0.07838974698390234 * t0;
+    y[343] = t18;
+    t12 = (-0.0018062019202143727) * t0;
+    y[616] = t12;
+    t17 = C64 * t15;
+    t19 = (-C63) * t2;
+    t8 = t17 + t19;
+    y[23] = 0;
+    t1 = (-0.07972981468205868) * t8;
+    y[296] = t1;
+    t13 = (-C65) * t9;
+    t4 = (-C66) * t14;
+    t10 = t13 + t4;
+    t6 = 0.07615284897250663 * t10;
+    y[471] = t6;
+    t7 = 0.05941921293252666 * t10;
+    y[488] = t7;
+    t16 = C66 * t9;
+    t11 = (-C65) * t14;
+    t3 = t16 + t11;
+    t5 = 0.031218452451930608 * t3;
+    y[151] = t5;
+    t18 = (-0.057713193736474815) * t3;
+    y[168] = t18;
+    t0 = re[100];
+    t12 = im[100];
+    t15 = re[132];
+    t2 = im[132];
+    t17 = re[4];
+    t19 = im[4];
+    t8 = re[36];
+    t1 = im[36];
+    t13 = re[68];
+    t4 = im[68];
+    t6 = t15 + t13;
+    t10 = t2 + t4;
+    t7 = t17 + t8;
+    t9 = t19 + t1;
+    t14 = t15 - t13;
+    t16 = t2 - t4;
+    t11 = t17 - t8;
+    t5 = t19 - t1;
+    t3 = t6 + t7;
+    t18 = t10 + t9;
+    t15 = t6 - t7;
+    t13 = C14 * t15;
+    t2 = t10 - t9;
+    t4 = C14 * t2;
+    t17 = C15 * t3;
+    t8 = t0 - t17;
+    t19 = C15 * t18;
+    t1 = t12 - t19;
+    t6 = t8 + t13;
+    t7 = t1 + t4;
+    t15 = t8 - t13;
+    t10 = t1 - t4;
+    t9 = C0 * t14;
+    t2 = C16 * t11;
+    t17 = t9 + t2;
+    t19 = C0 * t16;
+    t8 = C16 * t5;
+    t13 = t19 + t8;
+    t1 = C16 * t14;
+    t4 = C0 * t11;
+    t9 = t1 - t4;
+    t2 = C16 * t16;
+    t19 = C0 * t5;
+    t8 = t2 - t19;
+    t14 = t0 + t3;
+    t11 = t12 + t18;
+    t1 = t6 + t13;
+    t4 = t7 - t17;
+    t16 = t15 + t8;
+    t5 = t10 - t9;
+    t2 = t15 - t8;
+    t19 = t10 + t9;
+    t0 = t6 - t13;
+    t3 = t7 + t17;
+    t12 = (-C67) * t14;
+    t18 = (-C68) * t11;
+    t15 = t12 + t18;
+    t8 = 0.07734301987131527 * t15;
+    y[469] = t8;
+    t10 = 0.05682077379979854 * t15;
+    y[490] = t10;
+    t9 = C68 * t14;
+    t6 = (-C67) * t11;
+    t13 = t9 + t6;
+    t7 = 0.027961403770009628 * t13;
+    y[149] = t7;
+    t17 = (-0.06026673653310746) * t13;
+    y[170] = t17;
+    t12 = C69 * t1;
+    t18 = C70 * t4;
+    t8 = t12 + t18;
+    y[42] = 0;
+    t15 = (-0.07985148385287637) * t8;
+    y[277] = t15;
+    t10 = (-C70) * t1;
+    t14 = C69 * t4;
+    t11 = t10 + t14;
+    t9 = 0.07827030505175593 * t11;
+    y[362] = t9;
+    t6 = (-0.005534064185263188) * t11;
+    y[597] = t6;
+    t7 = (-C71) * t16;
+    t13 = (-C72) * t5;
+    t17 = t7 + t13;
+    t12 = 0.07807511355243113 * t17;
+    y[405] = t12;
+    t18 = (-0.006326642346165435) * t17;
+    y[554] = t18;
+    t8 = C72 * t16;
+    t15 = (-C71) * t5;
+    t1 = t8 + t15;
+    y[85] = 0;
+    t4 = (-0.08005111636248635) * t1;
+    y[234] = t4;
+    t10 = C73 * t2;
+    t14 = C74 * t19;
+    t9 = t10 + t14;
+    y[106] = 0;
+    t11 = (-0.07939756861843485) * t9;
+    y[213] = t11;
+    t6 = (-C74) * t2;
+    t7 = C73 * t19;
+    t13 = t6 + t7;
+    t12 = 0.07871777572983324 * t13;
+    y[426] = t12;
+    t17 = 0.004322231781754117 * t13;
+    y[533] = t17;
+    t18 = (-C75) * t0;
+    t16 = (-C76) * t3;
+    t5 = t18 + t16;
+    t8 = 0.07842264533338364 * t5;
+    y[341] = t8;
+    t15 = (-0.0015092739897649792) * t5;
+    y[618] = t15;
+    t1 = C76 * t0;
+    t4 = (-C75) * t3;
+    t10 = t1 + t4;
+    y[21] = 0;
+    t14 = (-0.07969636797420614) * t10;
+    y[298] = t14;
+    t9 = re[120];
+    t11 = im[120];
+    t2 = re[152];
+    t19 = im[152];
+    t6 = re[24];
+    t7 = im[24];
+    t12 = re[56];
+    t13 = im[56];
+    t17 = re[88];
+    t18 = im[88];
+    t16 = t2 + t17;
+    t8 = t19 + t18;
+    t5 = t6 + t12;
+    t15 = t7 + t13;
+    t0 = t2 - t17;
+    t3 = t19 - t18;
+    t1 = t6 - t12;
+    t4 = t7 - t13;
+    t10 = t16 + t5;
+    t14 = t8 + t15;
+    t2 = t16 - t5;
+    t17 = C14 * t2;
+    t19 = t8 - t15;
+    t18 = C14 * t19;
+    t6 = C15 * t10;
+    t12 = t9 - t6;
+    t7 = C15 * t14;
+    t13 = t11 - t7;
+    t16 = t12 + t17;
+    t5 = t13 + t18;
+    t2 = t12 - t17;
+    t8 = t13 - t18;
+    t15 = C0 * t0;
+    t19 = C16 * t1;
+    t6 = t15 + t19;
+    t7 = C0 * t3;
+    t12 = C16 * t4;
+    t17 = t7 + t12;
+    t13 = C16 * t0;
+    t18 = C0 * t1;
+    t15 = t13 - t18;
+    t19 = C16 * t3;
+    t7 = C0 * t4;
+    t12 = t19 - t7;
+    t0 = t9 + t10;
+    t1 = t11 + t14;
+    t13 = t16 + t17;
+    t18 = t5 - t6;
+    t3 = t2 + t12;
+    t4 = t8 - t15;
+    t19 = t2 - t12;
+    t7 = t8 + t15;
+    t9 = t16 - t17;
+    t10 = t5 + t6;
+    t11 = (-C77) * t0;
+    t14 = (-C78) * t1;
+    t2 = t11 + t14;
+    t12 = 0.07846068721664735 * t2;
+    y[339] = t12;
+    t8 = (-0.0012403161494891884) * t2;
+    y[620] = t8;
+    t15 = C78 * t0;
+    t16 = (-C77) * t1;
+    t17 = t15 + t16;
+    y[19] = 0;
+    t5 = (-0.07965772696767702) * t17;
+    y[300] = t5;
+    t6 = (-C79) * t13;
+    t11 = (-C80) * t18;
+    t14 = t6 + t11;
+    t12 = 0.07835959668349907 * t14;
+    y[467] = t12;
+    t2 = 0.05413766123113763 * t14;
+    y[492] = t2;
+    t8 = C80 * t13;
+    t0 = (-C79) * t18;
+    t1 = t8 + t0;
+    t15 = 0.024781081945578775 * t1;
+    y[147] = t15;
+    t16 = (-0.06263955390830653) * t1;
+    y[172] = t16;
+    t17 = C81 * t3;
+    t5 = C82 * t4;
+    t6 = t17 + t5;
+    y[44] = 0;
+    t11 = (-0.07985497122541489) * t6;
+    y[275] = t11;
+    t12 = (-C82) * t3;
+    t14 = C81 * t4;
+    t2 = t12 + t14;
+    t13 = 0.07826688688369167 * t2;
+    y[364] = t13;
+    t18 = (-0.005947283706403402) * t2;
+    y[595] = t18;
+    t8 = (-C83) * t19;
+    t0 = (-C84) * t7;
+    t15 = t8 + t0;
+    t1 = 0.0780650096919715 * t15;
+    y[403] = t1;
+    t16 = (-0.006856511841418642) * t15;
+    y[556] = t16;
+    t17 = C84 * t19;
+    t5 = (-C83) * t7;
+    t6 = t17 + t5;
+    y[83] = 0;
+    t11 = (-0.08006147728234735) * t6;
+    y[236] = t11;
+    t3 = C85 * t9;
+    t4 = C86 * t10;
+    t12 = t3 + t4;
+    y[108] = 0;
+    t14 = (-0.07926007834812526) * t12;
+    y[211] = t14;
+    t13 = (-C86) * t9;
+    t2 = C85 * t10;
+    t18 = t13 + t2;
+    t8 = 0.07885432528275857 * t18;
+    y[428] = t8;
+    t0 = 0.005899910603536861 * t18;
+    y[531] = t0;
+    t1 = re[140];
+    t15 = im[140];
+    t16 = re[12];
+    t19 = im[12];
+    t7 = re[44];
+    t17 = im[44];
+    t5 = re[76];
+    t6 = im[76];
+    t11 = re[108];
+    t3 = im[108];
+    t4 = t16 + t11;
+    t12 = t19 + t3;
+    t14 = t7 + t5;
+    t9 = t17 + t6;
+    t10 = t16 - t11;
+    t13 = t19 - t3;
+    t2 = t7 - t5;
+    t8 = t17 - t6;
+    t18 = t4 + t14;
+    t0 = t12 + t9;
+    t16 = t4 - t14;
+    t11 = C14 * t16;
+    t19 = t12 - t9;
+    t3 = C14 * t19;
+    t7 = C15 * t18;
+    t5 = t1 - t7;
+    t17 = C15 * t0;
+    t6 = t15 - t17;
+    t4 = t5 + t11;
+    t14 = t6 + t3;
+    t16 = t5 - t11;
+    t12 = t6 - t3;
+    t9 = C0 * t10;
+    t19 = C16 * t2;
+    t7 = t9 + t19;
+    t17 = C0 * t13;
+    t5 = C16 * t8;
+    t11 = t17 + t5;
+    t6 = C16 * t10;
+    t3 = C0 * t2;
+    t9 = t6 - t3;
+    t19 = C16 * t13;
+    t17 = C0 * t8;
+    t5 = t19 - t17;
+    t10 = t1 + t18;
+    t2 = t15 + t0;
+    t6 = t4 + t11;
+    t3 = t14 - t7;
+    t13 = t16 + t5;
+    t8 = t12 - t9;
+    t19 = t16 - t5;
+    t17 = t12 + t9;
+    t1 = t4 - t11;
+    t18 = t14 + t7;
+    t15 = C87 * t10;
+    t0 = C88 * t2;
+    t16 = t15 + t0;
+    y[110] = 0;
+    t5 = (-0.07910392290808559) * t16;
+    y[209] = t5;
+    t12 = (-C88) * t10;
+    t9 = C87 * t2;
+    t4 = t12 + t9;
+    t11 = 0.07900998800352993 * t4;
+    y[430] = t11;
+    t14 = 0.0075870820171638305 * t4;
+    y[529] = t14;
+    t7 = (-C89) * t6;
+    t15 = (-C90) * t3;
+    t0 = t7 + t15;
+    t16 = 0.07850393454933578 * t0;
+    y[337] = t16;
+    t5 = (-0.00100033448048195) * t0;
+    y[622] = t5;
+    t10 = C90 * t6;
+    t2 = (-C89) * t3;
+    t12 = t10 + t2;
+    y[17] = 0;
+    t9 = (-0.07961384401787135) * t12;
+    y[302] = t9;
+    t11 = (-C91) * t13;
+    t4 = (-C92) * t8;
+    t14 = t11 + t4;
+    t7 = 0.07920667729745716 * t14;
+    y[465] = t7;
+    t15 = 0.05138642947995969 * t14;
+    y[494] = t15;
+    t16 = C92 * t13;
+    t0 = (-C91) * t8;
+    t5 = t16 + t0;
+    t6 = 0.021708977932100717 * t5;
+    y[145] = t6;
+    t3 = (-0.06482348851887695) * t5;
+    y[174] = t3;
+    t10 = C93 * t19;
+    t2 = C94 * t17;
+    t12 = t10 + t2;
+    y[46] = 0;
+    t9 = (-0.0798590925316545) * t12;
+    y[273] = t9;
+    t11 = (-C94) * t19;
+    t4 = C93 * t17;
+    t7 = t11 + t4;
+    t14 = 0.07826284774676884 * t7;
+    y[366] = t14;
+    t15 = (-0.006347861502626827) * t7;
+    y[593] = t15;
+    t13 = (-C95) * t1;
+    t8 = (-C96) * t18;
+    t16 = t13 + t8;
+    t0 = 0.0780607029671936 * t16;
+    y[401] = t0;
+    t6 = (-0.007315378642888369) * t16;
+    y[558] = t6;
+    t5 = C96 * t1;
+    t3 = (-C95) * t18;
+    t10 = t5 + t3;
+    y[81] = 0;
+    t2 = (-0.08006589439281213) * t10;
+    y[238] = t2;
+    t12 = re[5];
+    t9 = im[5];
+    t19 = re[37];
+    t17 = im[37];
+    t11 = re[69];
+    t4 = im[69];
+    t14 = re[101];
+    t7 = im[101];
+    t15 = re[133];
+    t13 = im[133];
+    t8 = t19 + t15;
+    t0 = t17 + t13;
+    t16 = t11 + t14;
+    t6 = t4 + t7;
+    t1 = t19 - t15;
+    t18 = t17 - t13;
+    t5 = t11 - t14;
+    t3 = t4 - t7;
+    t10 = t8 + t16;
+    t2 = t0 + t6;
+    t19 = t8 - t16;
+    t15 = C14 * t19;
+    t17 = t0 - t6;
+    t13 = C14 * t17;
+    t11 = C15 * t10;
+    t14 = t12 - t11;
+    t4 = C15 * t2;
+    t7 = t9 - t4;
+    t8 = t14 + t15;
+    t16 = t7 + t13;
+    t19 = t14 - t15;
+    t0 = t7 - t13;
+    t6 = C0 * t1;
+    t17 = C16 * t5;
+    t11 = t6 + t17;
+    t4 = C0 * t18;
+    t14 = C16 * t3;
+    t15 = t4 + t14;
+    t7 = C16 * t1;
+    t13 = C0 * t5;
+    t6 = t7 - t13;
+    t17 = C16 * t18;
+    t4 = C0 * t3;
+    t14 = t17 - t4;
+    t1 = t12 + t10;
+    t5 = t9 + t2;
+    t7 = t8 + t15;
+    t13 = t16 - t11;
+    t18 = t19 + t14;
+    t3 = t0 - t6;
+    t17 = t19 - t14;
+    t4 = t0 + t6;
+    t12 = t8 - t15;
+    t10 = t16 + t11;
+    t9 = (-C97) * t1;
+    t2 = (-C98) * t5;
+    t19 = t9 + t2;
+    t14 = 0.07806145671585792 * t19;
+    y[399] = t14;
+    t0 = (-0.00770552452765192) * t19;
+    y[560] = t0;
+    t6 = C98 * t1;
+    t8 = (-C97) * t5;
+    t15 = t6 + t8;
+    y[79] = 0;
+    t16 = (-0.08006512128962529) * t15;
+    y[240] = t16;
+    t11 = C99 * t7;
+    t9 = C100 * t13;
+    t2 = t11 + t9;
+    y[112] = 0;
+    t14 = (-0.07892736100051959) * t2;
+    y[207] = t14;
+    t19 = (-C100) * t7;
+    t0 = C99 * t13;
+    t1 = t19 + t0;
+    t5 = 0.07918673474916837 * t1;
+    y[432] = t5;
+    t6 = 0.009384974833630134 * t1;
+    y[527] = t6;
+    t8 = (-C101) * t18;
+    t15 = (-C102) * t3;
+    t16 = t8 + t15;
+    t11 = 0.07855225056629657 * t16;
+    y[335] = t11;
+    t9 = (-0.0007898186170955989) * t16;
+    y[624] = t9;
+    t2 = C102 * t18;
+    t14 = (-C101) * t3;
+    t7 = t2 + t14;
+    y[15] = 0;
+    t13 = (-0.07956487503467673) * t7;
+    y[304] = t13;
+    t19 = (-C103) * t17;
+    t0 = (-C104) * t4;
+    t5 = t19 + t0;
+    t1 = 0.0798911548658402 * t5;
+    y[463] = t1;
+    t6 = 0.04858411851028732 * t5;
+    y[496] = t6;
+    t8 = C104 * t17;
+    t15 = (-C103) * t4;
+    t11 = t8 + t15;
+    t16 = 0.018775250339183078 * t11;
+    y[143] = t16;
+    t9 = (-0.06681366693752928) * t11;
+    y[176] = t9;
+    t18 = C105 * t12;
+    t3 = C106 * t10;
+    t2 = t18 + t3;
+    y[48] = 0;
+    t14 = (-0.07986425164246268) * t2;
+    y[271] = t14;
+    t7 = (-C106) * t12;
+    t13 = C105 * t10;
+    t19 = t7 + t13;
+    t0 = 0.07825779208424921 * t19;
+    y[368] = t0;
+    t1 = (-0.006731007187738434) * t19;
+    y[591] = t1;
+    t5 = re[25];
+    t6 = im[25];
+    t17 = re[57];
+    t4 = im[57];
+    t8 = re[89];
+    t15 = im[89];
+    t16 = re[121];
+    t11 = im[121];
+    t9 = re[153];
+    t18 = im[153];
+    t3 = t17 + t9;
+    t2 = t4 + t18;
+    t14 = t8 + t16;
+    t12 = t15 + t11;
+    t10 = t17 - t9;
+    t7 = t4 - t18;
+    t13 = t8 - t16;
+    t0 = t15 - t11;
+    t19 = t3 + t14;
+    t1 = t2 + t12;
+    t17 = t3 - t14;
+    t9 = C14 * t17;
+    t4 = t2 - t12;
+    t18 = C14 * t4;
+    t8 = C15 * t19;
+    t16 = t5 - t8;
+    t15 = C15 * t1;
+    t11 = t6 - t15;
+    t3 = t16 + t9;
+    t14 = t11 + t18;
+    t17 = t16 - t9;
+    t2 = t11 - t18;
+    t12 = C0 * t10;
+    t4 = C16 * t13;
+    t8 = t12 + t4;
+    t15 = C0 * t7;
+    t16 = C16 * t0;
+    t9 = t15 + t16;
+    t11 = C16 * t10;
+    t18 = C0 * t13;
+    t12 = t11 - t18;
+    t4 = C16 * t7;
+    t15 = C0 * t0;
+    t16 = t4 - t15;
+    t10 = t5 + t19;
+    t13 = t6 + t1;
+    t11 = t3 + t9;
+    t18 = t14 - t8;
+    t7 = t17 + t16;
+    t0 = t2 - t12;
+    t4 = t17 - t16;
+    t15 = t2 + t12;
+    t5 = t3 - t9;
+    t19 = t14 + t8;
+    t6 = C107 * t10;
+    t1 = C108 * t13;
+    t17 = t6 + t1;
+    y[50] = 0;
+    t16 = (-0.07987086976732814) * t17;
+    y[269] = t16;
+    t2 = (-C108) * t10;
+    t12 = C107 * t13;
+    t3 = t2 + t12;
+    t9 = 0.07825130761949729 * t3;
+    y[370] = t9;
+    t14 = (-0.007092253041875984) * t3;
+    y[589] = t14;
+    t8 = (-C109) * t11;
+    t6 = (-C110) * t18;
+    t1 = t8 + t6;
+    t17 = 0.07806664449304893 * t1;
+    y[397] = t17;
+    t16 = (-0.008029601387179236) * t1;
+    y[562] = t16;
+    t10 = C110 * t11;
+    t13 = (-C109) * t18;
+    t2 = t10 + t13;
+    y[77] = 0;
+    t12 = (-0.0800598007072855) * t2;
+    y[242] = t12;
+    t9 = C111 * t7;
+    t3 = C112 * t0;
+    t14 = t9 + t3;
+    y[114] = 0;
+    t8 = (-0.07872876715165095) * t14;
+    y[205] = t8;
+    t6 = (-C112) * t7;
+    t17 = C111 * t0;
+    t1 = t6 + t17;
+    t16 = 0.07938648382440648 * t1;
+    y[434] = t16;
+    t11 = 0.011294046579022204 * t1;
+    y[525] = t11;
+    t18 = (-C113) * t4;
+    t10 = (-C114) * t15;
+    t13 = t18 + t10;
+    t2 = 0.07860548799126442 * t13;
+    y[333] = t2;
+    t12 = (-0.0006082496345561968) * t13;
+    y[626] = t12;
+    t9 = C114 * t4;
+    t3 = (-C113) * t15;
+    t14 = t9 + t3;
+    y[13] = 0;
+    t8 = (-0.07951098784215394) * t14;
+    y[306] = t8;
+    t7 = (-C115) * t5;
+    t0 = (-C116) * t19;
+    t6 = t7 + t0;
+    t17 = 0.08042166933048225 * t6;
+    y[461] = t17;
+    t16 = 0.045747664090940304 * t6;
+    y[498] = t16;
+    t1 = C116 * t5;
+    t11 = (-C115) * t19;
+    t18 = t1 + t11;
+    t10 = 0.016007887610726444 * t18;
+    y[141] = t10;
+    t2 = (-0.06860932607733869) * t18;
+    y[178] = t2;
+}
+
+/**
+ *  Part 4 of ApplyWindowedIMDCT_W10_320_K160().
+ * 
+ *  @param {Number[]} X 
+ *    - The input block (320 points, only the first 160 points are used).
+ *  @param {Number[]} y 
+ *    - The array that would contain the output block (640 points).
+ *  @param {Number[]} re 
+ *    - The scratch buffer (real part, 160 points).
+ *  @param {Number[]} im 
+ *    - The scratch buffer (imaginary part, 160 points).
+ */
+function ApplyWindowedIMDCT_W10_320_K160_Part4(X, y, re, im) {
+    let t0, t1, t10, t11, t12, t13, t14, t15, t16, t17, t18, t19, t2, t3, t4, t5, t6, t7, t8, t9;
+    const C0 = 0.5590169943749475;
+    const C1 = 0.25;
+    const C2 = 0.9510565162951535;
+    const C3 = 0.5877852522924731;
+    const C4 = 0.99494115919819;
+    const C5 = 0.10045939345507647;
+    const C6 = 0.5035383837257176;
+    const C7 = 0.8639728561215868;
+    const C8 = 0.9152016129634745;
+    const C9 = 0.4029962873638599;
+    const C10 = 0.21191116582684155;
+    const C11 = 0.9772889326079104;
+    const C12 = 0.7458757562673048;
+    const C13 = 0.6660850968252301;
+    const C14 = 0.7393006416371488;
+    const C15 = 0.6733754979763521;
+    const C16 = 0.9939069700023561;
+    const C17 = 0.11022220729388306;
+    const C18 = 0.4950322202598127;
+    const C19 = 0.8688746174820854;
+    const C20 = 0.9112011652005843;
+    const C21 = 0.4119616930457218;
+    const C22 = 0.20230659607115642;
+    const C23 = 0.9793222356232406;
+    const C24 = 0.1926825275846723;
+    const C25 = 0.981261149523195;
+    const C26 = 0.7326542716724128;
+    const C27 = 0.680600997795453;
+    const C28 = 0.9927769859840909;
+    const C29 = 0.11997439768694032;
+    const C30 = 0.48647834455818684;
+    const C31 = 0.8736926348985243;
+    const C32 = 0.9071128939728691;
+    const C33 = 0.4208873930021738;
+    const C34 = 0.9029371933164189;
+    const C35 = 0.42977252695567697;
+    const C36 = 0.18303988795514095;
+    const C37 = 0.9831054874312163;
+    const C38 = 0.7259372869640676;
+    const C39 = 0.6877608998738217;
+    const C40 = 0.9915513160536062;
+    const C41 = 0.1297150246978405;
+    const C42 = 0.4778775810611837;
+    const C43 = 0.8784264440003566;
+    const C44 = 0.4692307587282903;
+    const C45 = 0.8830755885332088;
+    const C46 = 0.8986744656939538;
+    const C47 = 0.43861623853852766;
+    const C48 = 0.1733796065602395;
+    const C49 = 0.9848550715861784;
+    const C50 = 0.7191503349090794;
+    const C51 = 0.6948545141251936;
+    const C52 = 0.9902300783435211;
+    const C53 = 0.13944314950467876;
+    const C54 = 0.9888134001974757;
+    const C55 = 0.14915783449053857;
+    const C56 = 0.46053871095824;
+    const C57 = 0.8876396204028539;
+    const C58 = 0.8943251219560346;
+    const C59 = 0.4474176753753966;
+    const C60 = 0.16370261447799525;
+    const C61 = 0.9865097333595187;
+    const C62 = 0.7122940696480137;
+    const C63 = 0.7018811568522627;
+    const C64 = 0.7053691520019861;
+    const C65 = 0.7088401508125785;
+    const C66 = 0.9873014181578584;
+    const C67 = 0.15885814333386145;
+    const C68 = 0.4518022755086881;
+    const C69 = 0.8921180997184013;
+    const C70 = 0.889889581301463;
+    const C71 = 0.45617598916548296;
+    const C72 = 0.15400984439704607;
+    const C73 = 0.988069313271492;
+    const C74 = 0.14430223052674654;
+    const C75 = 0.9895336610065398;
+    const C76 = 0.6983762494089729;
+    const C77 = 0.7157308252838186;
+    const C78 = 0.9856942779526452;
+    const C79 = 0.16854314109869134;
+    const C80 = 0.44302229441546676;
+    const C81 = 0.8965105948346932;
+    const C82 = 0.8853682712368793;
+    const C83 = 0.4648903357642743;
+    const C84 = 0.8807616275355579;
+    const C85 = 0.47355987526490806;
+    const C86 = 0.13458070850712617;
+    const C87 = 0.99090263542778;
+    const C88 = 0.6913160358594803;
+    const C89 = 0.722552516128436;
+    const C90 = 0.9839921344813541;
+    const C91 = 0.1782118943247859;
+    const C92 = 0.43419961391142786;
+    const C93 = 0.900816682393908;
+    const C94 = 0.4253350843448814;
+    const C95 = 0.9050359473663644;
+    const C96 = 0.8760700941954066;
+    const C97 = 0.4821837720791227;
+    const C98 = 0.12484621531871118;
+    const C99 = 0.9921761045906085;
+    const C100 = 0.6841891918315852;
+    const C101 = 0.7293045658576686;
+    const C102 = 0.9821951518001156;
+    const C103 = 0.1878634711175852;
+    const C104 = 0.9803035031058607;
+    const C105 = 0.19749694123802963;
+    const C106 = 0.41642956009763715;
+    const C107 = 0.9091679830905224;
+    const C108 = 0.8712941233961736;
+    const C109 = 0.49076119501779414;
+    const C110 = 0.11509968919221586;
+    const C111 = 0.9933539457554167;
+    const C112 = 0.6769964042253483;
+    const C113 = 0.7359863236949099;
+    const C114 = 0.6697383662966098;
+    const C115 = 0.742597145638433;
+    const C116 = 0.9783173707196277;
+    const C117 = 0.20711137619221856;
+    const C118 = 0.4074838995026576;
+    const C119 = 0.9132123913121788;
+    const C120 = 0.8664341754558649;
+    const C121 = 0.4992913173710469;
+    const C122 = 0.10534206951811415;
+    const C123 = 0.9944360453994218;
+    const C124 = 0.09557429675609919;
+    const C125 = 0.9954222992276077;
+    const C126 = 0.6624157775901718;
+    const C127 = 0.7491363945234594;
+    const C128 = 0.9762369460689896;
+    const C129 = 0.2167058493209;
+    const C130 = 0.3984989647613298;
+    const C131 = 0.9171687822228516;
+    const C132 = 0.8614907187863783;
+    const C133 = 0.5077733169879345;
+    const C134 = 0.8564642298483564;
+    const C135 = 0.5162063763556798;
+    const C136 = 0.0857973123444399;
+    const C137 = 0.996312612182778;
+    const C138 = 0.6550293438723744;
+    const C139 = 0.7556034400835709;
+    const C140 = 0.9740624296696047;
+    const C141 = 0.22627943588878452;
+    const C142 = 0.3894756218603649;
+    const C143 = 0.9210367744973499;
+    const C144 = 0.3804147404883323;
+    const C145 = 0.9248159953305278;
+    const C146 = 0.8513551931052652;
+    const C147 = 0.524589682678469;
+    const C148 = 0.07601205860924312;
+    const C149 = 0.9971068984547168;
+    const C150 = 0.6475797770630733;
+    const C151 = 0.7619976590114568;
+    const C152 = 0.9717940311058891;
+    const C153 = 0.2358312131736727;
+    const C154 = 0.969431969010818;
+    const C155 = 0.24536026055538934;
+    const C156 = 0.37131719395183754;
+    const C157 = 0.9285060804732156;
+    const C158 = 0.8461641009766995;
+    const C159 = 0.5329224279557898;
+    const C160 = 0.06621947867363034;
+    const C161 = 0.9978050814884601;
+    const C162 = 0.6400677951670226;
+    const C163 = 0.7683184350189877;
+    t13 = re[45];
+    t12 = im[45];
+    t4 = re[77];
+    t15 = im[77];
+    t9 = re[109];
+    t3 = im[109];
+    t14 = re[141];
+    t8 = im[141];
+    t7 = re[13];
+    t0 = im[13];
+    t17 = t4 + t7;
+    t6 = t15 + t0;
+    t16 = t9 + t14;
+    t5 = t3 + t8;
+    t19 = t4 - t7;
+    t1 = t15 - t0;
+    t11 = t9 - t14;
+    t10 = t3 - t8;
+    t18 = t17 + t16;
+    t2 = t6 + t5;
+    t4 = t17 - t16;
+    t7 = C0 * t4;
+    t15 = t6 - t5;
+    t0 = C0 * t15;
+    t9 = C1 * t18;
+    t14 = t13 - t9;
+    t3 = C1 * t2;
+    t8 = t12 - t3;
+    t17 = t14 + t7;
+    t16 = t8 + t0;
+    t4 = t14 - t7;
+    t6 = t8 - t0;
+    t5 = C2 * t19;
+    t15 = C3 * t11;
+    t9 = t5 + t15;
+    t3 = C2 * t1;
+    t14 = C3 * t10;
+    t7 = t3 + t14;
+    t8 = C3 * t19;
+    t0 = C2 * t11;
+    t5 = t8 - t0;
+    t15 = C3 * t1;
+    t3 = C2 * t10;
+    t14 = t15 - t3;
+    t19 = t13 + t18;
+    t11 = t12 + t2;
+    t8 = t17 + t7;
+    t0 = t16 - t9;
+    t1 = t4 + t14;
+    t10 = t6 - t5;
+    t15 = t4 - t14;
+    t3 = t6 + t5;
+    t13 = t17 - t7;
+    t18 = t16 + t9;
+    t12 = (-C4) * t19;
+    t2 = (-C5) * t11;
+    t4 = t12 + t2;
+    t14 = 0.08080883281425316 * t4;
+    y[459] = t14;
+    t6 = 0.04289372215178292 * t4;
+    y[500] = t6;
+    t5 = C5 * t19;
+    t17 = (-C4) * t11;
+    t7 = t5 + t17;
+    t16 = 0.013432310384368186 * t7;
+    y[139] = t16;
+    t9 = (-0.0702130944467205) * t7;
+    y[180] = t9;
+    t12 = C6 * t8;
+    t2 = C7 * t0;
+    t14 = t12 + t2;
+    y[52] = 0;
+    t4 = (-0.07987915873304213) * t14;
+    y[267] = t4;
+    t6 = (-C7) * t8;
+    t19 = C6 * t0;
+    t11 = t6 + t19;
+    t5 = 0.07824318757396576 * t11;
+    y[372] = t5;
+    t17 = (-0.007427539565617188) * t11;
+    y[587] = t17;
+    t16 = (-C8) * t1;
+    t7 = (-C9) * t10;
+    t9 = t16 + t7;
+    t12 = 0.07807549860039238 * t9;
+    y[395] = t12;
+    t2 = (-0.00828995947322154) * t9;
+    y[564] = t2;
+    t14 = C9 * t1;
+    t4 = (-C8) * t10;
+    t8 = t14 + t4;
+    y[75] = 0;
+    t0 = (-0.08005072157129448) * t8;
+    y[244] = t0;
+    t6 = C10 * t15;
+    t19 = C11 * t3;
+    t5 = t6 + t19;
+    y[116] = 0;
+    t11 = (-0.07850650978497138) * t5;
+    y[203] = t11;
+    t17 = (-C11) * t15;
+    t16 = C10 * t3;
+    t7 = t17 + t16;
+    t12 = 0.07961123245853997 * t7;
+    y[436] = t12;
+    t9 = 0.013313517900273962 * t7;
+    y[523] = t9;
+    t2 = (-C12) * t13;
+    t1 = (-C13) * t18;
+    t10 = t2 + t1;
+    t14 = 0.07866326189821478 * t10;
+    y[331] = t14;
+    t4 = (-0.000454986335991667) * t10;
+    y[628] = t4;
+    t8 = C13 * t13;
+    t0 = (-C12) * t18;
+    t6 = t8 + t0;
+    y[11] = 0;
+    t19 = (-0.0794525913263945) * t6;
+    y[308] = t19;
+    t5 = re[65];
+    t11 = im[65];
+    t15 = re[97];
+    t3 = im[97];
+    t17 = re[129];
+    t16 = im[129];
+    t12 = re[1];
+    t7 = im[1];
+    t9 = re[33];
+    t2 = im[33];
+    t1 = t15 + t9;
+    t14 = t3 + t2;
+    t10 = t17 + t12;
+    t4 = t16 + t7;
+    t13 = t15 - t9;
+    t18 = t3 - t2;
+    t8 = t17 - t12;
+    t0 = t16 - t7;
+    t6 = t1 + t10;
+    t19 = t14 + t4;
+    t15 = t1 - t10;
+    t9 = C0 * t15;
+    t3 = t14 - t4;
+    t2 = C0 * t3;
+    t17 = C1 * t6;
+    t12 = t5 - t17;
+    t16 = C1 * t19;
+    t7 = t11 - t16;
+    t1 = t12 + t9;
+    t10 = t7 + t2;
+    t15 = t12 - t9;
+    t14 = t7 - t2;
+    t4 = C2 * t13;
+    t3 = C3 * t8;
+    t17 = t4 + t3;
+    t16 = C2 * t18;
+    t12 = C3 * t0;
+    t9 = t16 + t12;
+    t7 = C3 * t13;
+    t2 = C2 * t8;
+    t4 = t7 - t2;
+    t3 = C3 * t18;
+    t16 = C2 * t0;
+    t12 = t3 - t16;
+    t13 = t5 + t6;
+    t8 = t11 + t19;
+    t7 = t1 + t9;
+    t2 = t10 - t17;
+    t18 = t15 + t12;
+    t0 = t14 - t4;
+    t3 = t15 - t12;
+    t16 = t14 + t4;
+    t5 = t1 - t9;
+    t6 = t10 + t17;
+    t11 = (-C14) * t13;
+    t19 = (-C15) * t8;
+    t15 = t11 + t19;
+    t12 = 0.07872520840851852 * t15;
+    y[329] = t12;
+    t14 = (-0.0003285577883509001) * t15;
+    y[630] = t14;
+    t4 = C15 * t13;
+    t1 = (-C14) * t8;
+    t9 = t4 + t1;
+    y[9] = 0;
+    t10 = (-0.07939007246024282) * t9;
+    y[310] = t10;
+    t17 = (-C16) * t7;
+    t11 = (-C17) * t2;
+    t19 = t17 + t11;
+    t12 = 0.08106504589428773 * t19;
+    y[457] = t12;
+    t15 = 0.04003874813103435 * t19;
+    y[502] = t15;
+    t14 = C17 * t7;
+    t13 = (-C16) * t2;
+    t8 = t14 + t13;
+    t4 = 0.011069855000296981 * t8;
+    y[137] = t4;
+    t1 = (-0.07163108093922897) * t8;
+    y[182] = t1;
+    t9 = C18 * t18;
+    t10 = C19 * t0;
+    t17 = t9 + t10;
+    y[54] = 0;
+    t11 = (-0.07988930163961726) * t17;
+    y[265] = t11;
+    t12 = (-C19) * t18;
+    t19 = C18 * t0;
+    t15 = t12 + t19;
+    t7 = 0.07823325366134647 * t15;
+    y[374] = t7;
+    t2 = (-0.007732435532826085) * t15;
+    y[585] = t2;
+    t14 = (-C20) * t3;
+    t13 = (-C21) * t16;
+    t4 = t14 + t13;
+    t8 = 0.07808737864458444 * t4;
+    y[393] = t8;
+    t1 = (-0.00848865954933994) * t4;
+    y[566] = t1;
+    t9 = C21 * t3;
+    t10 = (-C20) * t16;
+    t17 = t9 + t10;
+    y[73] = 0;
+    t11 = (-0.08003854282837364) * t17;
+    y[246] = t11;
+    t18 = C22 * t5;
+    t0 = C23 * t6;
+    t12 = t18 + t0;
+    y[118] = 0;
+    t19 = (-0.07825954791313729) * t12;
+    y[201] = t19;
+    t7 = (-C23) * t5;
+    t15 = C22 * t6;
+    t2 = t7 + t15;
+    t14 = 0.07986245981048944 * t2;
+    y[438] = t14;
+    t13 = 0.015441985894296665 * t2;
+    y[521] = t13;
+    t8 = re[85];
+    t4 = im[85];
+    t1 = re[117];
+    t3 = im[117];
+    t16 = re[149];
+    t9 = im[149];
+    t10 = re[21];
+    t17 = im[21];
+    t11 = re[53];
+    t18 = im[53];
+    t0 = t1 + t11;
+    t12 = t3 + t18;
+    t19 = t16 + t10;
+    t5 = t9 + t17;
+    t6 = t1 - t11;
+    t7 = t3 - t18;
+    t15 = t16 - t10;
+    t14 = t9 - t17;
+    t2 = t0 + t19;
+    t13 = t12 + t5;
+    t1 = t0 - t19;
+    t11 = C0 * t1;
+    t3 = t12 - t5;
+    t18 = C0 * t3;
+    t16 = C1 * t2;
+    t10 = t8 - t16;
+    t9 = C1 * t13;
+    t17 = t4 - t9;
+    t0 = t10 + t11;
+    t19 = t17 + t18;
+    t1 = t10 - t11;
+    t12 = t17 - t18;
+    t5 = C2 * t6;
+    t3 = C3 * t15;
+    t16 = t5 + t3;
+    t9 = C2 * t7;
+    t10 = C3 * t14;
+    t11 = t9 + t10;
+    t17 = C3 * t6;
+    t18 = C2 * t15;
+    t5 = t17 - t18;
+    t3 = C3 * t7;
+    t9 = C2 * t14;
+    t10 = t3 - t9;
+    t6 = t8 + t2;
+    t15 = t4 + t13;
+    t17 = t0 + t11;
+    t18 = t19 - t16;
+    t7 = t1 + t10;
+    t14 = t12 - t5;
+    t3 = t1 - t10;
+    t9 = t12 + t5;
+    t8 = t0 - t11;
+    t2 = t19 + t16;
+    t4 = C24 * t6;
+    t13 = C25 * t15;
+    t1 = t4 + t13;
+    t10 = 0.0003517772216361772 * t1;
+    y[120] = t10;
+    t12 = (-0.07794557950580416) * t1;
+    y[199] = t12;
+    t5 = (-C25) * t6;
+    t0 = C24 * t15;
+    t11 = t5 + t0;
+    t19 = 0.08010437254240924 * t11;
+    y[440] = t19;
+    t16 = 0.017676702329292165 * t11;
+    y[519] = t16;
+    t4 = (-C26) * t17;
+    t13 = (-C27) * t18;
+    t10 = t4 + t13;
+    t1 = 0.07879071480259427 * t10;
+    y[327] = t1;
+    t12 = (-0.00022705217394369635) * t10;
+    y[632] = t12;
+    t6 = C27 * t17;
+    t15 = (-C26) * t18;
+    t5 = t6 + t15;
+    y[7] = 0;
+    t0 = (-0.07932406776177908) * t5;
+    y[312] = t0;
+    t19 = (-C28) * t7;
+    t11 = (-C29) * t14;
+    t16 = t19 + t11;
+    t4 = 0.08120448463398589 * t16;
+    y[455] = t4;
+    t13 = 0.03719820422294464 * t16;
+    y[504] = t13;
+    t1 = C29 * t7;
+    t10 = (-C28) * t14;
+    t12 = t1 + t10;
+    t17 = 0.008937659462298152 * t12;
+    y[135] = t17;
+    t18 = (-0.07287202356764515) * t12;
+    y[184] = t18;
+    t6 = C30 * t3;
+    t15 = C31 * t9;
+    t5 = t6 + t15;
+    y[56] = 0;
+    t0 = (-0.07990125288587499) * t5;
+    y[263] = t0;
+    t19 = (-C31) * t3;
+    t11 = C30 * t9;
+    t4 = t19 + t11;
+    t16 = 0.07822155190641425 * t4;
+    y[376] = t16;
+    t13 = (-0.008003417742740937) * t4;
+    y[583] = t13;
+    t7 = (-C32) * t8;
+    t14 = (-C33) * t2;
+    t1 = t7 + t14;
+    t10 = 0.07810154602265036 * t1;
+    y[391] = t10;
+    t17 = (-0.00862790402088222) * t1;
+    y[568] = t17;
+    t12 = C33 * t8;
+    t18 = (-C32) * t2;
+    t6 = t12 + t18;
+    y[71] = 0;
+    t15 = (-0.08002402408509847) * t6;
+    y[248] = t15;
+    t5 = re[105];
+    t0 = im[105];
+    t3 = re[137];
+    t9 = im[137];
+    t19 = re[9];
+    t11 = im[9];
+    t16 = re[41];
+    t4 = im[41];
+    t13 = re[73];
+    t7 = im[73];
+    t14 = t3 + t13;
+    t10 = t9 + t7;
+    t1 = t19 + t16;
+    t17 = t11 + t4;
+    t8 = t3 - t13;
+    t2 = t9 - t7;
+    t12 = t19 - t16;
+    t18 = t11 - t4;
+    t6 = t14 + t1;
+    t15 = t10 + t17;
+    t3 = t14 - t1;
+    t13 = C0 * t3;
+    t9 = t10 - t17;
+    t7 = C0 * t9;
+    t19 = C1 * t6;
+    t16 = t5 - t19;
+    t11 = C1 * t15;
+    t4 = t0 - t11;
+    t14 = t16 + t13;
+    t1 = t4 + t7;
+    t3 = t16 - t13;
+    t10 = t4 - t7;
+    t17 = C2 * t8;
+    t9 = C3 * t12;
+    t19 = t17 + t9;
+    t11 = C2 * t2;
+    t16 = C3 * t18;
+    t13 = t11 + t16;
+    t4 = C3 * t8;
+    t7 = C2 * t12;
+    t17 = t4 - t7;
+    t9 = C3 * t2;
+    t11 = C2 * t18;
+    t16 = t9 - t11;
+    t8 = t5 + t6;
+    t12 = t0 + t15;
+    t4 = t14 + t13;
+    t7 = t1 - t19;
+    t2 = t3 + t16;
+    t18 = t10 - t17;
+    t9 = t3 - t16;
+    t11 = t10 + t17;
+    t5 = t14 - t13;
+    t6 = t1 + t19;
+    t0 = (-C34) * t8;
+    t15 = (-C35) * t12;
+    t3 = t0 + t15;
+    t16 = 0.0781174046680525 * t3;
+    y[389] = t16;
+    t10 = (-0.008710013292504275) * t3;
+    y[570] = t10;
+    t17 = C35 * t8;
+    t14 = (-C34) * t12;
+    t13 = t17 + t14;
+    y[69] = 0;
+    t1 = (-0.08000777837612989) * t13;
+    y[250] = t1;
+    t19 = C36 * t4;
+    t0 = C37 * t7;
+    t15 = t19 + t0;
+    t16 = 0.0009200547972867385 * t15;
+    y[122] = t16;
+    t3 = (-0.07756610969358985) * t15;
+    y[197] = t3;
+    t10 = (-C37) * t4;
+    t8 = C36 * t7;
+    t12 = t10 + t8;
+    t17 = 0.08033903605838183 * t12;
+    y[442] = t17;
+    t14 = 0.020013499709567478 * t12;
+    y[517] = t14;
+    t13 = (-C38) * t2;
+    t1 = (-C39) * t18;
+    t19 = t13 + t1;
+    t0 = 0.07885922470484415 * t19;
+    y[325] = t0;
+    t16 = (-0.00014811107628344213) * t19;
+    y[634] = t16;
+    t15 = C39 * t2;
+    t3 = (-C38) * t18;
+    t4 = t15 + t3;
+    y[5] = 0;
+    t7 = (-0.07925515402151904) * t4;
+    y[314] = t7;
+    t10 = (-C40) * t9;
+    t8 = (-C41) * t11;
+    t17 = t10 + t8;
+    t12 = 0.08124242814953461 * t17;
+    y[453] = t12;
+    t14 = 0.034387157709965845 * t17;
+    y[506] = t14;
+    t13 = C41 * t9;
+    t1 = (-C40) * t11;
+    t0 = t13 + t1;
+    t19 = 0.007047155047572928 * t0;
+    y[133] = t19;
+    t16 = (-0.07394742506852245) * t0;
+    y[186] = t16;
+    t2 = C42 * t5;
+    t18 = C43 * t6;
+    t15 = t2 + t18;
+    y[58] = 0;
+    t3 = (-0.07991498046591929) * t15;
+    y[261] = t3;
+    t4 = (-C43) * t5;
+    t7 = C42 * t6;
+    t10 = t4 + t7;
+    t8 = 0.07820811521896559 * t10;
+    y[378] = t8;
+    t12 = (-0.008236636173384312) * t10;
+    y[581] = t12;
+    t17 = re[125];
+    t14 = im[125];
+    t9 = re[157];
+    t11 = im[157];
+    t13 = re[29];
+    t1 = im[29];
+    t19 = re[61];
+    t0 = im[61];
+    t16 = re[93];
+    t2 = im[93];
+    t18 = t9 + t16;
+    t15 = t11 + t2;
+    t3 = t13 + t19;
+    t5 = t1 + t0;
+    t6 = t9 - t16;
+    t4 = t11 - t2;
+    t7 = t13 - t19;
+    t8 = t1 - t0;
+    t10 = t18 + t3;
+    t12 = t15 + t5;
+    t9 = t18 - t3;
+    t16 = C0 * t9;
+    t11 = t15 - t5;
+    t2 = C0 * t11;
+    t13 = C1 * t10;
+    t19 = t17 - t13;
+    t1 = C1 * t12;
+    t0 = t14 - t1;
+    t18 = t19 + t16;
+    t3 = t0 + t2;
+    t9 = t19 - t16;
+    t15 = t0 - t2;
+    t5 = C2 * t6;
+    t11 = C3 * t7;
+    t13 = t5 + t11;
+    t1 = C2 * t4;
+    t19 = C3 * t8;
+    t16 = t1 + t19;
+    t0 = C3 * t6;
+    t2 = C2 * t7;
+    t5 = t0 - t2;
+    t11 = C3 * t4;
+    t1 = C2 * t8;
+    t19 = t11 - t1;
+    t6 = t17 + t10;
+    t7 = t14 + t12;
+    t0 = t18 + t16;
+    t2 = t3 - t13;
+    t4 = t9 + t19;
+    t8 = t15 - t5;
+    t11 = t9 - t19;
+    t1 = t15 + t5;
+    t17 = t18 - t16;
+    t10 = t3 + t13;
+    t14 = C44 * t6;
+    t12 = C45 * t7;
+    t9 = t14 + t12;
+    y[60] = 0;
+    t19 = (-0.07993020077294767) * t9;
+    y[259] = t19;
+    t15 = (-C45) * t6;
+    t5 = C44 * t7;
+    t18 = t15 + t5;
+    t16 = 0.0781932228314296 * t18;
+    y[380] = t16;
+    t3 = (-0.008428741800686423) * t18;
+    y[579] = t3;
+    t13 = (-C46) * t0;
+    t14 = (-C47) * t2;
+    t12 = t13 + t14;
+    t9 = 0.07813426029130742 * t12;
+    y[387] = t9;
+    t19 = (-0.008736648715340965) * t12;
+    y[572] = t19;
+    t6 = C47 * t0;
+    t7 = (-C46) * t2;
+    t15 = t6 + t7;
+    y[67] = 0;
+    t5 = (-0.07999051858554966) * t15;
+    y[252] = t5;
+    t16 = C48 * t4;
+    t18 = C49 * t8;
+    t3 = t16 + t18;
+    t13 = 0.0015397724767375375 * t3;
+    y[124] = t13;
+    t14 = (-0.07713298043845977) * t3;
+    y[195] = t14;
+    t9 = (-C49) * t4;
+    t12 = C48 * t8;
+    t19 = t9 + t12;
+    t0 = 0.08058079051105971 * t19;
+    y[444] = t0;
+    t2 = 0.02244712275156356 * t19;
+    y[515] = t2;
+    t6 = (-C50) * t11;
+    t7 = (-C51) * t1;
+    t15 = t6 + t7;
+    t5 = 0.0789299805782335 * t15;
+    y[323] = t5;
+    t16 = (-8.906834541416462e-05) * t15;
+    y[636] = t16;
+    t18 = C51 * t11;
+    t13 = (-C50) * t1;
+    t3 = t18 + t13;
+    y[3] = 0;
+    t14 = (-0.07918410665013594) * t3;
+    y[316] = t14;
+    t4 = (-C52) * t17;
+    t8 = (-C53) * t10;
+    t9 = t4 + t8;
+    t12 = 0.08119431733865926 * t9;
+    y[451] = t12;
+    t0 = 0.03161970808366637 * t9;
+    y[508] = t0;
+    t19 = C53 * t17;
+    t2 = (-C52) * t10;
+    t6 = t19 + t2;
+    t7 = 0.005404191194233247 * t6;
+    y[131] = t7;
+    t5 = (-0.0748712625620606) * t6;
+    y[188] = t5;
+    t15 = re[145];
+    t16 = im[145];
+    t11 = re[17];
+    t1 = im[17];
+    t18 = re[49];
+    t13 = im[49];
+    t3 = re[81];
+    t14 = im[81];
+    t4 = re[113];
+    t8 = im[113];
+    t12 = t11 + t4;
+    t9 = t1 + t8;
+    t0 = t18 + t3;
+    t17 = t13 + t14;
+    t10 = t11 - t4;
+    t19 = t1 - t8;
+    t2 = t18 - t3;
+    t7 = t13 - t14;
+    t6 = t12 + t0;
+    t5 = t9 + t17;
+    t11 = t12 - t0;
+    t4 = C0 * t11;
+    t1 = t9 - t17;
+    t8 = C0 * t1;
+    t18 = C1 * t6;
+    t3 = t15 - t18;
+    t13 = C1 * t5;
+    t14 = t16 - t13;
+    t12 = t3 + t4;
+    t0 = t14 + t8;
+    t11 = t3 - t4;
+    t9 = t14 - t8;
+    t17 = C2 * t10;
+    t1 = C3 * t2;
+    t18 = t17 + t1;
+    t13 = C2 * t19;
+    t3 = C3 * t7;
+    t4 = t13 + t3;
+    t14 = C3 * t10;
+    t8 = C2 * t2;
+    t17 = t14 - t8;
+    t1 = C3 * t19;
+    t13 = C2 * t7;
+    t3 = t1 - t13;
+    t10 = t15 + t6;
+    t2 = t16 + t5;
+    t14 = t12 + t4;
+    t8 = t0 - t18;
+    t19 = t11 + t3;
+    t7 = t9 - t17;
+    t1 = t11 - t3;
+    t13 = t9 + t17;
+    t15 = t12 - t4;
+    t6 = t0 + t18;
+    t16 = (-C54) * t10;
+    t5 = (-C55) * t2;
+    t11 = t16 + t5;
+    t3 = 0.08107670419942832 * t11;
+    y[449] = t3;
+    t9 = 0.028908280442592 * t11;
+    y[510] = t9;
+    t17 = C55 * t10;
+    t12 = (-C54) * t2;
+    t4 = t17 + t12;
+    t0 = 0.004008102353092296 * t4;
+    y[129] = t0;
+    t18 = (-0.07565838687825509) * t4;
+    y[190] = t18;
+    t16 = C56 * t14;
+    t5 = C57 * t8;
+    t3 = t16 + t5;
+    y[62] = 0;
+    t11 = (-0.07994667977204827) * t3;
+    y[257] = t11;
+    t9 = (-C57) * t14;
+    t10 = C56 * t8;
+    t2 = t9 + t10;
+    t17 = 0.07817710526341563 * t2;
+    y[382] = t17;
+    t12 = (-0.00857698481964919) * t2;
+    y[577] = t12;
+    t0 = (-C58) * t19;
+    t4 = (-C59) * t7;
+    t18 = t0 + t4;
+    t16 = 0.07815155601597573 * t18;
+    y[385] = t16;
+    t5 = (-0.008710563872349865) * t18;
+    y[574] = t5;
+    t3 = C59 * t19;
+    t11 = (-C58) * t7;
+    t14 = t3 + t11;
+    y[65] = 0;
+    t8 = (-0.07997281587998553) * t14;
+    y[254] = t8;
+    t9 = C60 * t1;
+    t10 = C61 * t13;
+    t17 = t9 + t10;
+    t2 = 0.0023608903596866793 * t17;
+    y[126] = t2;
+    t12 = (-0.07661769202193537) * t17;
+    y[193] = t12;
+    t0 = (-C61) * t1;
+    t4 = C60 * t13;
+    t16 = t0 + t4;
+    t18 = 0.08080439208166479 * t16;
+    y[446] = t18;
+    t5 = 0.024971076367611027 * t16;
+    y[513] = t5;
+    t19 = (-C62) * t15;
+    t7 = (-C63) * t6;
+    t3 = t19 + t7;
+    t11 = 0.07900226121891851 * t3;
+    y[321] = t11;
+    t14 = (-4.6388537934607385e-05) * t3;
+    y[638] = t14;
+    t8 = C63 * t15;
+    t9 = (-C62) * t6;
+    t10 = t8 + t9;
+    y[1] = 0;
+    t2 = (-0.07911165963567798) * t10;
+    y[318] = t2;
+    t17 = re[10];
+    t12 = im[10];
+    t1 = re[42];
+    t13 = im[42];
+    t0 = re[74];
+    t4 = im[74];
+    t18 = re[106];
+    t16 = im[106];
+    t5 = re[138];
+    t19 = im[138];
+    t7 = t1 + t5;
+    t11 = t13 + t19;
+    t3 = t0 + t18;
+    t14 = t4 + t16;
+    t15 = t1 - t5;
+    t6 = t13 - t19;
+    t8 = t0 - t18;
+    t9 = t4 - t16;
+    t10 = t7 + t3;
+    t2 = t11 + t14;
+    t1 = t7 - t3;
+    t5 = C0 * t1;
+    t13 = t11 - t14;
+    t19 = C0 * t13;
+    t0 = C1 * t10;
+    t18 = t17 - t0;
+    t4 = C1 * t2;
+    t16 = t12 - t4;
+    t7 = t18 + t5;
+    t3 = t16 + t19;
+    t1 = t18 - t5;
+    t11 = t16 - t19;
+    t14 = C2 * t15;
+    t13 = C3 * t8;
+    t0 = t14 + t13;
+    t4 = C2 * t6;
+    t18 = C3 * t9;
+    t5 = t4 + t18;
+    t16 = C3 * t15;
+    t19 = C2 * t8;
+    t14 = t16 - t19;
+    t13 = C3 * t6;
+    t4 = C2 * t9;
+    t18 = t13 - t4;
+    t15 = t17 + t10;
+    t8 = t12 + t2;
+    t16 = t7 + t5;
+    t19 = t3 - t0;
+    t6 = t1 + t18;
+    t9 = t11 - t14;
+    t13 = t1 - t18;
+    t4 = t11 + t14;
+    t17 = t7 - t5;
+    t10 = t3 + t0;
+    t12 = C64 * t15;
+    t2 = C65 * t8;
+    t1 = t12 + t2;
+    y[0] = 0;
+    t18 = (-0.07907521403597356) * t1;
+    y[319] = t18;
+    t11 = (-C65) * t15;
+    t14 = C64 * t8;
+    t7 = t11 + t14;
+    t5 = 0.07903867319482309 * t7;
+    y[320] = t5;
+    t3 = (-2.3884315505491365e-05) * t7;
+    y[639] = t3;
+    t0 = (-C66) * t16;
+    t12 = (-C67) * t19;
+    t2 = t0 + t12;
+    t1 = 0.08090535634060078 * t2;
+    y[447] = t1;
+    t18 = 0.026264380520193423 * t2;
+    y[512] = t18;
+    t15 = C67 * t16;
+    t8 = (-C66) * t19;
+    t11 = t15 + t8;
+    t14 = 0.0028523908353459116 * t11;
+    y[127] = t14;
+    t5 = (-0.07632478244965488) * t11;
+    y[192] = t5;
+    t7 = C68 * t6;
+    t3 = C69 * t9;
+    t0 = t7 + t3;
+    y[64] = 0;
+    t12 = (-0.07996398566998175) * t0;
+    y[255] = t12;
+    t1 = (-C69) * t6;
+    t2 = C68 * t9;
+    t18 = t1 + t2;
+    t16 = 0.07816018608419902 * t18;
+    y[384] = t16;
+    t19 = (-0.008678366232986501) * t18;
+    y[575] = t19;
+    t15 = (-C70) * t13;
+    t8 = (-C71) * t4;
+    t14 = t15 + t8;
+    t11 = 0.07816870410371515 * t14;
+    y[383] = t11;
+    t5 = (-0.008633709146849975) * t14;
+    y[576] = t5;
+    t7 = C71 * t13;
+    t3 = (-C70) * t4;
+    t0 = t7 + t3;
+    y[63] = 0;
+    t12 = (-0.07995527201918852) * t0;
+    y[256] = t12;
+    t6 = C72 * t17;
+    t9 = C73 * t10;
+    t1 = t6 + t9;
+    t2 = 0.0034008064960340165 * t1;
+    y[128] = t2;
+    t16 = (-0.07600568836960063) * t1;
+    y[191] = t16;
+    t18 = (-C73) * t17;
+    t19 = C72 * t10;
+    t15 = t18 + t19;
+    t8 = 0.08099677233079813 * t15;
+    y[448] = t8;
+    t11 = 0.027577153652004537 * t15;
+    y[511] = t11;
+    t14 = re[30];
+    t5 = im[30];
+    t13 = re[62];
+    t4 = im[62];
+    t7 = re[94];
+    t3 = im[94];
+    t0 = re[126];
+    t12 = im[126];
+    t6 = re[158];
+    t9 = im[158];
+    t2 = t13 + t6;
+    t1 = t4 + t9;
+    t16 = t7 + t0;
+    t17 = t3 + t12;
+    t10 = t13 - t6;
+    t18 = t4 - t9;
+    t19 = t7 - t0;
+    t8 = t3 - t12;
+    t15 = t2 + t16;
+    t11 = t1 + t17;
+    t13 = t2 - t16;
+    t6 = C0 * t13;
+    t4 = t1 - t17;
+    t9 = C0 * t4;
+    t7 = C1 * t15;
+    t0 = t14 - t7;
+    t3 = C1 * t11;
+    t12 = t5 - t3;
+    t2 = t0 + t6;
+    t16 = t12 + t9;
+    t13 = t0 - t6;
+    t1 = t12 - t9;
+    t17 = C2 * t10;
+    t4 = C3 * t19;
+    t7 = t17 + t4;
+    t3 = C2 * t18;
+    t0 = C3 * t8;
+    t6 = t3 + t0;
+    t12 = C3 * t10;
+    t9 = C2 * t19;
+    t17 = t12 - t9;
+    t4 = C3 * t18;
+    t3 = C2 * t8;
+    t0 = t4 - t3;
+    t10 = t14 + t15;
+    t19 = t5 + t11;
+    t12 = t2 + t6;
+    t9 = t16 - t7;
+    t18 = t13 + t0;
+    t8 = t1 - t17;
+    t4 = t13 - t0;
+    t3 = t1 + t17;
+    t14 = t2 - t6;
+    t15 = t16 + t7;
+    t5 = C74 * t10;
+    t11 = C75 * t19;
+    t13 = t5 + t11;
+    t0 = 0.004675594754473637 * t13;
+    y[130] = t0;
+    t1 = (-0.07528092638447868) * t13;
+    y[189] = t1;
+    t17 = (-C75) * t10;
+    t2 = C74 * t19;
+    t6 = t17 + t2;
+    t16 = 0.08114318050945657 * t6;
+    y[450] = t16;
+    t7 = 0.03025630083312543 * t6;
+    y[509] = t7;
+    t5 = C76 * t12;
+    t11 = C77 * t9;
+    t0 = t5 + t11;
+    y[2] = 0;
+    t13 = (-0.07914801620130785) * t0;
+    y[317] = t13;
+    t1 = (-C77) * t12;
+    t10 = C76 * t9;
+    t19 = t1 + t10;
+    t17 = 0.07896597160570053 * t19;
+    y[322] = t17;
+    t2 = (-6.614302176500143e-05) * t19;
+    y[637] = t2;
+    t16 = (-C78) * t18;
+    t6 = (-C79) * t8;
+    t7 = t16 + t6;
+    t5 = 0.08069566222116688 * t7;
+    y[445] = t5;
+    t11 = 0.02369830053931917 * t7;
+    y[514] = t11;
+    t0 = C79 * t18;
+    t13 = (-C78) * t8;
+    t12 = t0 + t13;
+    t9 = 0.0019240266974218081 * t12;
+    y[125] = t9;
+    t1 = (-0.07688646039082105) * t12;
+    y[194] = t1;
+    t10 = C80 * t4;
+    t17 = C81 * t3;
+    t19 = t10 + t17;
+    y[66] = 0;
+    t2 = (-0.07998170347656396) * t19;
+    y[253] = t2;
+    t16 = (-C81) * t4;
+    t6 = C80 * t3;
+    t5 = t16 + t6;
+    t7 = 0.07814287178606243 * t5;
+    y[386] = t7;
+    t11 = (-0.008730035710984) * t5;
+    y[573] = t11;
+    t18 = (-C82) * t14;
+    t8 = (-C83) * t15;
+    t0 = t18 + t8;
+    t13 = 0.07818529382762993 * t0;
+    y[381] = t13;
+    t9 = (-0.008508545900253557) * t0;
+    y[578] = t9;
+    t12 = C83 * t14;
+    t1 = (-C82) * t15;
+    t10 = t12 + t1;
+    y[61] = 0;
+    t17 = (-0.07993830673296405) * t10;
+    y[258] = t17;
+    t19 = re[50];
+    t2 = im[50];
+    t4 = re[82];
+    t3 = im[82];
+    t16 = re[114];
+    t6 = im[114];
+    t7 = re[146];
+    t5 = im[146];
+    t11 = re[18];
+    t18 = im[18];
+    t8 = t4 + t11;
+    t13 = t3 + t18;
+    t0 = t16 + t7;
+    t9 = t6 + t5;
+    t14 = t4 - t11;
+    t15 = t3 - t18;
+    t12 = t16 - t7;
+    t1 = t6 - t5;
+    t10 = t8 + t0;
+    t17 = t13 + t9;
+    t4 = t8 - t0;
+    t11 = C0 * t4;
+    t3 = t13 - t9;
+    t18 = C0 * t3;
+    t16 = C1 * t10;
+    t7 = t19 - t16;
+    t6 = C1 * t17;
+    t5 = t2 - t6;
+    t8 = t7 + t11;
+    t0 = t5 + t18;
+    t4 = t7 - t11;
+    t13 = t5 - t18;
+    t9 = C2 * t14;
+    t3 = C3 * t12;
+    t16 = t9 + t3;
+    t6 = C2 * t15;
+    t7 = C3 * t1;
+    t11 = t6 + t7;
+    t5 = C3 * t14;
+    t18 = C2 * t12;
+    t9 = t5 - t18;
+    t3 = C3 * t15;
+    t6 = C2 * t1;
+    t7 = t3 - t6;
+    t14 = t19 + t10;
+    t12 = t2 + t17;
+    t5 = t8 + t11;
+    t18 = t0 - t16;
+    t15 = t4 + t7;
+    t1 = t13 - t9;
+    t3 = t4 - t7;
+    t6 = t13 + t9;
+    t19 = t8 - t11;
+    t10 = t0 + t16;
+    t2 = (-C84) * t14;
+    t17 = (-C85) * t12;
+    t4 = t2 + t17;
+    t7 = 0.07820083419064082 * t4;
+    y[379] = t7;
+    t13 = (-0.008337979459723047) * t4;
+    y[580] = t13;
+    t9 = C85 * t14;
+    t8 = (-C84) * t12;
+    t11 = t9 + t8;
+    y[59] = 0;
+    t0 = (-0.07992242109289432) * t11;
+    y[260] = t0;
+    t16 = C86 * t5;
+    t2 = C87 * t18;
+    t17 = t16 + t2;
+    t7 = 0.006194595274505857 * t17;
+    y[132] = t7;
+    t4 = (-0.07442739657708623) * t17;
+    y[187] = t4;
+    t13 = (-C87) * t5;
+    t14 = C86 * t18;
+    t12 = t13 + t14;
+    t9 = 0.08122810178898779 * t12;
+    y[452] = t9;
+    t8 = 0.03299712828508903 * t12;
+    y[507] = t8;
+    t11 = C88 * t15;
+    t0 = C89 * t1;
+    t16 = t11 + t0;
+    y[4] = 0;
+    t2 = (-0.07921983784734443) * t16;
+    y[315] = t2;
+    t7 = (-C89) * t15;
+    t17 = C88 * t1;
+    t4 = t7 + t17;
+    t5 = 0.07889438011781426 * t4;
+    y[324] = t5;
+    t18 = (-0.00011625267447388165) * t4;
+    y[635] = t18;
+    t13 = (-C90) * t3;
+    t14 = (-C91) * t6;
+    t9 = t13 + t14;
+    t12 = 0.08046140220484606 * t9;
+    y[443] = t12;
+    t8 = 0.021218579288406595 * t9;
+    y[516] = t8;
+    t11 = C91 * t3;
+    t0 = (-C90) * t6;
+    t16 = t11 + t0;
+    t2 = 0.0012061797976135472 * t16;
+    y[123] = t2;
+    t15 = (-0.07735891256880652) * t16;
+    y[196] = t15;
+    t1 = C92 * t19;
+    t7 = C93 * t10;
+    t17 = t1 + t7;
+    y[68] = 0;
+    t5 = (-0.07999924206306375) * t17;
+    y[251] = t5;
+    t4 = (-C93) * t19;
+    t18 = C92 * t10;
+    t13 = t4 + t18;
+    t14 = 0.07812574017980194 * t13;
+    y[388] = t14;
+    t12 = (-0.008730111522164116) * t13;
+    y[571] = t12;
+    t9 = re[70];
+    t8 = im[70];
+    t3 = re[102];
+    t6 = im[102];
+    t11 = re[134];
+    t0 = im[134];
+    t2 = re[6];
+    t16 = im[6];
+    t15 = re[38];
+    t1 = im[38];
+    t7 = t3 + t15;
+    t17 = t6 + t1;
+    t5 = t11 + t2;
+    t19 = t0 + t16;
+    t10 = t3 - t15;
+    t4 = t6 - t1;
+    t18 = t11 - t2;
+    t14 = t0 - t16;
+    t13 = t7 + t5;
+    t12 = t17 + t19;
+    t3 = t7 - t5;
+    t15 = C0 * t3;
+    t6 = t17 - t19;
+    t1 = C0 * t6;
+    t11 = C1 * t13;
+    t2 = t9 - t11;
+    t0 = C1 * t12;
+    t16 = t8 - t0;
+    t7 = t2 + t15;
+    t5 = t16 + t1;
+    t3 = t2 - t15;
+    t17 = t16 - t1;
+    t19 = C2 * t10;
+    t6 = C3 * t18;
+    t11 = t19 + t6;
+    t0 = C2 * t4;
+    t2 = C3 * t14;
+    t15 = t0 + t2;
+    t16 = C3 * t10;
+    t1 = C2 * t18;
+    t19 = t16 - t1;
+    t6 = C3 * t4;
+    t0 = C2 * t14;
+    t2 = t6 - t0;
+    t10 = t9 + t13;
+    t18 = t8 + t12;
+    t16 = t7 + t15;
+    t1 = t5 - t11;
+    t4 = t3 + t2;
+    t14 = t17 - t19;
+    t6 = t3 - t2;
+    t0 = t17 + t19;
+    t9 = t7 - t15;
+    t13 = t5 + t11;
+    t8 = C94 * t10;
+    t12 = C95 * t18;
+    t3 = t8 + t12;
+    y[70] = 0;
+    t2 = (-0.0800160723060249) * t3;
+    y[249] = t2;
+    t17 = (-C95) * t10;
+    t19 = C94 * t18;
+    t7 = t17 + t19;
+    t15 = 0.07810930754132253 * t7;
+    y[390] = t15;
+    t5 = (-0.00867600412008019) * t7;
+    y[569] = t5;
+    t11 = (-C96) * t16;
+    t8 = (-C97) * t1;
+    t12 = t11 + t8;
+    t3 = 0.07821504215293063 * t12;
+    y[377] = t3;
+    t2 = (-0.008125006300371175) * t12;
+    y[582] = t2;
+    t10 = C97 * t16;
+    t18 = (-C96) * t1;
+    t17 = t10 + t18;
+    y[57] = 0;
+    t19 = (-0.07990790298085675) * t17;
+    y[262] = t19;
+    t15 = C98 * t4;
+    t7 = C99 * t14;
+    t5 = t15 + t7;
+    t11 = 0.007961705785935923 * t5;
+    y[134] = t11;
+    t8 = (-0.07342959009395307) * t5;
+    y[185] = t8;
+    t3 = (-C99) * t4;
+    t12 = C98 * t14;
+    t2 = t3 + t12;
+    t16 = 0.08123517600333653 * t2;
+    y[454] = t16;
+    t1 = 0.035788100254620786 * t2;
+    y[505] = t1;
+    t10 = C100 * t6;
+    t18 = C101 * t0;
+    t17 = t10 + t18;
+    y[6] = 0;
+    t19 = (-0.07928993254082312) * t17;
+    y[313] = t19;
+    t15 = (-C101) * t6;
+    t7 = C100 * t0;
+    t11 = t15 + t7;
+    t5 = 0.07882463510461603 * t11;
+    y[326] = t5;
+    t8 = (-0.00018493729943036235) * t11;
+    y[633] = t8;
+    t4 = (-C102) * t9;
+    t14 = (-C103) * t13;
+    t3 = t4 + t14;
+    t12 = 0.08021633619237747 * t3;
+    y[441] = t12;
+    t16 = 0.01883263011236303 * t3;
+    y[518] = t16;
+    t2 = C103 * t9;
+    t1 = (-C102) * t13;
+    t10 = t2 + t1;
+    t18 = 0.000666694127532328 * t10;
+    y[121] = t18;
+    t17 = (-0.07775778216969736) * t10;
+    y[198] = t17;
+    t19 = re[90];
+    t6 = im[90];
+    t0 = re[122];
+    t15 = im[122];
+    t7 = re[154];
+    t5 = im[154];
+    t11 = re[26];
+    t8 = im[26];
+    t4 = re[58];
+    t14 = im[58];
+    t12 = t0 + t4;
+    t3 = t15 + t14;
+    t16 = t7 + t11;
+    t9 = t5 + t8;
+    t13 = t0 - t4;
+    t2 = t15 - t14;
+    t1 = t7 - t11;
+    t18 = t5 - t8;
+    t10 = t12 + t16;
+    t17 = t3 + t9;
+    t0 = t12 - t16;
+    t4 = C0 * t0;
+    t15 = t3 - t9;
+    t14 = C0 * t15;
+    t7 = C1 * t10;
+    t11 = t19 - t7;
+    t5 = C1 * t17;
+    t8 = t6 - t5;
+    t12 = t11 + t4;
+    t16 = t8 + t14;
+    t0 = t11 - t4;
+    t3 = t8 - t14;
+    t9 = C2 * t13;
+    t15 = C3 * t1;
+    t7 = t9 + t15;
+    t5 = C2 * t2;
+    t11 = C3 * t18;
+    t4 = t5 + t11;
+    t8 = C3 * t13;
+    t14 = C2 * t1;
+    t9 = t8 - t14;
+    t15 = C3 * t2;
+    t5 = C2 * t18;
+    t11 = t15 - t5;
+    t13 = t19 + t10;
+    t1 = t6 + t17;
+    t8 = t12 + t4;
+    t14 = t16 - t7;
+    t2 = t0 + t11;
+    t18 = t3 - t9;
+    t15 = t0 - t11;
+    t5 = t3 + t9;
+    t19 = t12 - t4;
+    t10 = t16 + t7;
+    t6 = (-C104) * t13;
+    t17 = (-C105) * t1;
+    t0 = t6 + t17;
+    t11 = 0.08000151439407795 * t0;
+    y[439] = t11;
+    t3 = 0.016546326981442205 * t0;
+    y[520] = t3;
+    t9 = C105 * t13;
+    t12 = (-C104) * t1;
+    t4 = t9 + t12;
+    y[119] = 0;
+    t16 = (-0.07812352112752824) * t4;
+    y[200] = t16;
+    t7 = C106 * t8;
+    t6 = C107 * t14;
+    t17 = t7 + t6;
+    y[72] = 0;
+    t11 = (-0.0800315207318005) * t17;
+    y[247] = t11;
+    t0 = (-C107) * t8;
+    t3 = C106 * t14;
+    t13 = t0 + t3;
+    t1 = 0.07809423015894994 * t13;
+    y[392] = t1;
+    t9 = (-0.008565561378246727) * t13;
+    y[567] = t9;
+    t12 = (-C108) * t2;
+    t4 = (-C109) * t18;
+    t16 = t12 + t4;
+    t7 = 0.07822760983345828 * t16;
+    y[375] = t7;
+    t6 = (-0.007872372680343373) * t16;
+    y[584] = t6;
+    t17 = C109 * t2;
+    t11 = (-C108) * t18;
+    t8 = t17 + t11;
+    y[55] = 0;
+    t14 = (-0.0798950653523208) * t8;
+    y[264] = t14;
+    t0 = C110 * t15;
+    t3 = C111 * t5;
+    t1 = t0 + t3;
+    t13 = 0.009974119378923667 * t1;
+    y[136] = t13;
+    t9 = (-0.07227303597195224) * t1;
+    y[183] = t9;
+    t12 = (-C111) * t15;
+    t4 = C110 * t5;
+    t7 = t12 + t4;
+    t16 = 0.08114841980269193 * t7;
+    y[456] = t16;
+    t6 = 0.038615673414421424 * t7;
+    y[503] = t6;
+    t2 = C112 * t19;
+    t18 = C113 * t10;
+    t17 = t2 + t18;
+    y[8] = 0;
+    t11 = (-0.07935746607752191) * t17;
+    y[311] = t11;
+    t8 = (-C113) * t19;
+    t14 = C112 * t10;
+    t0 = t8 + t14;
+    t3 = 0.07875755500931148 * t0;
+    y[328] = t3;
+    t13 = (-0.00027482219768941077) * t0;
+    y[631] = t13;
+    t1 = re[110];
+    t9 = im[110];
+    t15 = re[142];
+    t5 = im[142];
+    t12 = re[14];
+    t4 = im[14];
+    t16 = re[46];
+    t7 = im[46];
+    t6 = re[78];
+    t2 = im[78];
+    t18 = t15 + t6;
+    t17 = t5 + t2;
+    t11 = t12 + t16;
+    t19 = t4 + t7;
+    t10 = t15 - t6;
+    t8 = t5 - t2;
+    t14 = t12 - t16;
+    t3 = t4 - t7;
+    t0 = t18 + t11;
+    t13 = t17 + t19;
+    t15 = t18 - t11;
+    t6 = C0 * t15;
+    t5 = t17 - t19;
+    t2 = C0 * t5;
+    t12 = C1 * t0;
+    t16 = t1 - t12;
+    t4 = C1 * t13;
+    t7 = t9 - t4;
+    t18 = t16 + t6;
+    t11 = t7 + t2;
+    t15 = t16 - t6;
+    t17 = t7 - t2;
+    t19 = C2 * t10;
+    t5 = C3 * t14;
+    t12 = t19 + t5;
+    t4 = C2 * t8;
+    t16 = C3 * t3;
+    t6 = t4 + t16;
+    t7 = C3 * t10;
+    t2 = C2 * t14;
+    t19 = t7 - t2;
+    t5 = C3 * t8;
+    t4 = C2 * t3;
+    t16 = t5 - t4;
+    t10 = t1 + t0;
+    t14 = t9 + t13;
+    t7 = t18 + t6;
+    t2 = t11 - t12;
+    t8 = t15 + t16;
+    t3 = t17 - t19;
+    t5 = t15 - t16;
+    t4 = t17 + t19;
+    t1 = t18 - t6;
+    t0 = t11 + t12;
+    t9 = C114 * t10;
+    t13 = C115 * t14;
+    t15 = t9 + t13;
+    y[10] = 0;
+    t16 = (-0.07942181984972771) * t15;
+    y[309] = t16;
+    t17 = (-C115) * t10;
+    t19 = C114 * t14;
+    t18 = t17 + t19;
+    t6 = 0.0786937394764498 * t18;
+    y[330] = t6;
+    t11 = (-0.000388530381880178) * t18;
+    y[629] = t11;
+    t12 = (-C116) * t7;
+    t9 = (-C117) * t2;
+    t13 = t12 + t9;
+    t15 = 0.07973350773965149 * t13;
+    y[437] = t15;
+    t16 = 0.01436423434214279 * t13;
+    y[522] = t16;
+    t10 = C117 * t7;
+    t14 = (-C116) * t2;
+    t17 = t10 + t14;
+    y[117] = 0;
+    t19 = (-0.0783861161659626) * t17;
+    y[202] = t19;
+    t6 = C118 * t8;
+    t18 = C119 * t3;
+    t11 = t6 + t18;
+    y[74] = 0;
+    t12 = (-0.08004498652028395) * t11;
+    y[245] = t12;
+    t9 = (-C119) * t8;
+    t15 = C118 * t3;
+    t13 = t9 + t15;
+    t16 = 0.0780810925418322 * t13;
+    y[394] = t16;
+    t7 = (-0.008396876155933708) * t13;
+    y[565] = t7;
+    t2 = (-C120) * t5;
+    t10 = (-C121) * t4;
+    t14 = t2 + t10;
+    t17 = 0.07823844498003954 * t14;
+    y[373] = t17;
+    t19 = (-0.0075840412882783445) * t14;
+    y[586] = t19;
+    t6 = C121 * t5;
+    t18 = (-C120) * t4;
+    t11 = t6 + t18;
+    y[53] = 0;
+    t12 = (-0.07988400078240977) * t11;
+    y[266] = t12;
+    t8 = C122 * t1;
+    t3 = C123 * t0;
+    t9 = t8 + t3;
+    t15 = 0.012223248822784803 * t9;
+    y[138] = t15;
+    t16 = (-0.0709448429254907) * t9;
+    y[181] = t16;
+    t13 = (-C123) * t1;
+    t7 = C122 * t0;
+    t2 = t13 + t7;
+    t10 = 0.08095243610523627 * t2;
+    y[458] = t10;
+    t17 = 0.04146541917181707 * t2;
+    y[501] = t17;
+    t14 = re[130];
+    t19 = im[130];
+    t5 = re[2];
+    t4 = im[2];
+    t6 = re[34];
+    t18 = im[34];
+    t11 = re[66];
+    t12 = im[66];
+    t8 = re[98];
+    t3 = im[98];
+    t15 = t5 + t8;
+    t9 = t4 + t3;
+    t16 = t6 + t11;
+    t1 = t18 + t12;
+    t0 = t5 - t8;
+    t13 = t4 - t3;
+    t7 = t6 - t11;
+    t10 = t18 - t12;
+    t2 = t15 + t16;
+    t17 = t9 + t1;
+    t5 = t15 - t16;
+    t8 = C0 * t5;
+    t4 = t9 - t1;
+    t3 = C0 * t4;
+    t6 = C1 * t2;
+    t11 = t14 - t6;
+    t18 = C1 * t17;
+    t12 = t19 - t18;
+    t15 = t11 + t8;
+    t16 = t12 + t3;
+    t5 = t11 - t8;
+    t9 = t12 - t3;
+    t1 = C2 * t0;
+    t4 = C3 * t7;
+    t6 = t1 + t4;
+    t18 = C2 * t13;
+    t11 = C3 * t10;
+    t8 = t18 + t11;
+    t12 = C3 * t0;
+    t3 = C2 * t7;
+    t1 = t12 - t3;
+    t4 = C3 * t13;
+    t18 = C2 * t10;
+    t11 = t4 - t18;
+    t0 = t14 + t2;
+    t7 = t19 + t17;
+    t12 = t15 + t8;
+    t3 = t16 - t6;
+    t13 = t5 + t11;
+    t10 = t9 - t1;
+    t4 = t5 - t11;
+    t18 = t9 + t1;
+    t14 = t15 - t8;
+    t2 = t16 + t6;
+    t19 = C124 * t0;
+    t17 = C125 * t7;
+    t5 = t19 + t17;
+    t11 = 0.014694708331038423 * t5;
+    y[140] = t11;
+    t9 = (-0.06943487281706444) * t5;
+    y[179] = t9;
+    t1 = (-C125) * t0;
+    t15 = C124 * t7;
+    t8 = t1 + t15;
+    t16 = 0.08063245485341218 * t8;
+    y[460] = t16;
+    t6 = 0.04432178833723134 * t8;
+    y[499] = t6;
+    t19 = C126 * t12;
+    t17 = C127 * t3;
+    t11 = t19 + t17;
+    y[12] = 0;
+    t5 = (-0.07948231754482189) * t11;
+    y[307] = t5;
+    t9 = (-C127) * t12;
+    t0 = C126 * t3;
+    t7 = t9 + t0;
+    t1 = 0.07863384200486458 * t7;
+    y[332] = t1;
+    t15 = (-0.0005281496518064612) * t7;
+    y[627] = t15;
+    t16 = (-C128) * t13;
+    t8 = (-C129) * t10;
+    t6 = t16 + t8;
+    t19 = 0.07949560986070783 * t6;
+    y[435] = t19;
+    t17 = 0.012290071369447096 * t6;
+    y[524] = t17;
+    t11 = C129 * t13;
+    t5 = (-C128) * t10;
+    t12 = t11 + t5;
+    y[115] = 0;
+    t3 = (-0.0786206937836095) * t12;
+    y[204] = t3;
+    t9 = C130 * t4;
+    t0 = C131 * t18;
+    t1 = t9 + t0;
+    y[76] = 0;
+    t7 = (-0.0800556911882454) * t1;
+    y[243] = t7;
+    t15 = (-C131) * t4;
+    t16 = C130 * t18;
+    t8 = t15 + t16;
+    t19 = 0.07807065190785197 * t8;
+    y[396] = t19;
+    t6 = (-0.008167628783349251) * t8;
+    y[563] = t6;
+    t17 = (-C132) * t14;
+    t13 = (-C133) * t2;
+    t10 = t17 + t13;
+    t11 = 0.07824745321283438 * t10;
+    y[371] = t11;
+    t5 = (-0.007263407164054297) * t10;
+    y[588] = t5;
+    t12 = C133 * t14;
+    t3 = (-C132) * t2;
+    t9 = t12 + t3;
+    y[51] = 0;
+    t0 = (-0.07987480414218592) * t9;
+    y[268] = t0;
+    t1 = re[150];
+    t7 = im[150];
+    t4 = re[22];
+    t18 = im[22];
+    t15 = re[54];
+    t16 = im[54];
+    t19 = re[86];
+    t8 = im[86];
+    t6 = re[118];
+    t17 = im[118];
+    t13 = t4 + t6;
+    t11 = t18 + t17;
+    t10 = t15 + t19;
+    t5 = t16 + t8;
+    t14 = t4 - t6;
+    t2 = t18 - t17;
+    t12 = t15 - t19;
+    t3 = t16 - t8;
+    t9 = t13 + t10;
+    t0 = t11 + t5;
+    t4 = t13 - t10;
+    t6 = C0 * t4;
+    t18 = t11 - t5;
+    t17 = C0 * t18;
+    t15 = C1 * t9;
+    t19 = t1 - t15;
+    t16 = C1 * t0;
+    t8 = t7 - t16;
+    t13 = t19 + t6;
+    t10 = t8 + t17;
+    t4 = t19 - t6;
+    t11 = t8 - t17;
+    t5 = C2 * t14;
+    t18 = C3 * t12;
+    t15 = t5 + t18;
+    t16 = C2 * t2;
+    t19 = C3 * t3;
+    t6 = t16 + t19;
+    t8 = C3 * t14;
+    t17 = C2 * t12;
+    t5 = t8 - t17;
+    t18 = C3 * t2;
+    t16 = C2 * t3;
+    t19 = t18 - t16;
+    t14 = t1 + t9;
+    t12 = t7 + t0;
+    t8 = t13 + t6;
+    t17 = t10 - t15;
+    t2 = t4 + t19;
+    t3 = t11 - t5;
+    t18 = t4 - t19;
+    t16 = t11 + t5;
+    t1 = t13 - t6;
+    t9 = t10 + t15;
+    t7 = (-C134) * t14;
+    t0 = (-C135) * t12;
+    t4 = t7 + t0;
+    t19 = 0.07825475177229257 * t4;
+    y[369] = t19;
+    t11 = (-0.006914619827194874) * t4;
+    y[590] = t11;
+    t5 = C135 * t14;
+    t13 = (-C134) * t12;
+    t6 = t5 + t13;
+    y[49] = 0;
+    t10 = (-0.07986735448585142) * t6;
+    y[270] = t10;
+    t15 = C136 * t8;
+    t7 = C137 * t17;
+    t0 = t15 + t7;
+    t19 = 0.017369094907915213 * t0;
+    y[142] = t19;
+    t4 = (-0.06773575540655445) * t0;
+    y[177] = t4;
+    t11 = (-C137) * t8;
+    t14 = C136 * t17;
+    t12 = t11 + t14;
+    t5 = 0.08017500732004093 * t12;
+    y[462] = t5;
+    t13 = 0.0471691425946232 * t12;
+    y[497] = t13;
+    t6 = C138 * t2;
+    t10 = C139 * t3;
+    t15 = t6 + t10;
+    y[14] = 0;
+    t7 = (-0.07953851768496963) * t15;
+    y[305] = t7;
+    t19 = (-C139) * t2;
+    t0 = C138 * t3;
+    t4 = t19 + t0;
+    t8 = 0.07857828108834697 * t4;
+    y[334] = t8;
+    t17 = (-0.0006954450000195269) * t4;
+    y[625] = t17;
+    t11 = (-C140) * t18;
+    t14 = (-C141) * t16;
+    t5 = t11 + t14;
+    t12 = 0.07928361901336299 * t5;
+    y[433] = t12;
+    t13 = 0.010325635567219847 * t5;
+    y[526] = t13;
+    t6 = C141 * t18;
+    t10 = (-C140) * t16;
+    t15 = t6 + t10;
+    y[113] = 0;
+    t7 = (-0.07883091208218668) * t15;
+    y[206] = t7;
+    t2 = C142 * t1;
+    t3 = C143 * t9;
+    t19 = t2 + t3;
+    y[78] = 0;
+    t0 = (-0.08006298575141249) * t19;
+    y[241] = t0;
+    t8 = (-C143) * t1;
+    t4 = C142 * t9;
+    t17 = t8 + t4;
+    t11 = 0.07806353886683189 * t17;
+    y[398] = t11;
+    t14 = (-0.00787565686562428) * t17;
+    y[561] = t14;
+    t12 = re[15];
+    t5 = im[15];
+    t13 = re[47];
+    t18 = im[47];
+    t16 = re[79];
+    t6 = im[79];
+    t10 = re[111];
+    t15 = im[111];
+    t7 = re[143];
+    t2 = im[143];
+    t3 = t13 + t7;
+    t19 = t18 + t2;
+    t0 = t16 + t10;
+    t1 = t6 + t15;
+    t9 = t13 - t7;
+    t8 = t18 - t2;
+    t4 = t16 - t10;
+    t11 = t6 - t15;
+    t17 = t3 + t0;
+    t14 = t19 + t1;
+    t13 = t3 - t0;
+    t7 = C0 * t13;
+    t18 = t19 - t1;
+    t2 = C0 * t18;
+    t16 = C1 * t17;
+    t10 = t12 - t16;
+    t6 = C1 * t14;
+    t15 = t5 - t6;
+    t3 = t10 + t7;
+    t0 = t15 + t2;
+    t13 = t10 - t7;
+    t19 = t15 - t2;
+    t1 = C2 * t9;
+    t18 = C3 * t4;
+    t16 = t1 + t18;
+    t6 = C2 * t8;
+    t10 = C3 * t11;
+    t7 = t6 + t10;
+    t15 = C3 * t9;
+    t2 = C2 * t4;
+    t1 = t15 - t2;
+    t18 = C3 * t8;
+    t6 = C2 * t11;
+    t10 = t18 - t6;
+    t9 = t12 + t17;
+    t4 = t5 + t14;
+    t15 = t3 + t7;
+    t2 = t0 - t16;
+    t8 = t13 + t10;
+    t11 = t19 - t1;
+    t18 = t13 - t10;
+    t6 = t19 + t1;
+    t12 = t3 - t7;
+    t17 = t0 + t16;
+    t5 = C144 * t9;
+    t14 = C145 * t4;
+    t13 = t5 + t14;
+    y[80] = 0;
+    t10 = (-0.08006610833439101) * t13;
+    y[239] = t10;
+    t19 = (-C145) * t9;
+    t1 = C144 * t4;
+    t3 = t19 + t1;
+    t7 = 0.07806049438418153 * t3;
+    y[400] = t7;
+    t0 = (-0.007518887211504584) * t3;
+    y[559] = t0;
+    t16 = (-C146) * t15;
+    t5 = (-C147) * t2;
+    t14 = t16 + t5;
+    t13 = 0.07826047597585467 * t14;
+    y[367] = t13;
+    t10 = (-0.006541902249447796) * t14;
+    y[592] = t10;
+    t9 = C147 * t15;
+    t4 = (-C146) * t2;
+    t19 = t9 + t4;
+    y[47] = 0;
+    t1 = (-0.0798615127504244) * t19;
+    y[272] = t1;
+    t7 = C148 * t8;
+    t3 = C149 * t11;
+    t0 = t7 + t3;
+    t16 = 0.020223007836952297 * t0;
+    y[144] = t16;
+    t5 = (-0.06584291214118858) * t0;
+    y[175] = t5;
+    t13 = (-C149) * t8;
+    t14 = C148 * t11;
+    t10 = t13 + t14;
+    t15 = 0.07956878319930895 * t10;
+    y[464] = t15;
+    t2 = 0.04999056553691067 * t10;
+    y[495] = t2;
+    t9 = C150 * t18;
+    t4 = C151 * t6;
+    t19 = t9 + t4;
+    y[16] = 0;
+    t1 = (-0.07958997721867218) * t19;
+    y[303] = t1;
+    t7 = (-C151) * t18;
+    t3 = C150 * t6;
+    t16 = t7 + t3;
+    t0 = 0.07852747567483565 * t16;
+    y[336] = t0;
+    t5 = (-0.0008914256102028861) * t16;
+    y[623] = t5;
+    t8 = (-C152) * t12;
+    t11 = (-C153) * t17;
+    t13 = t8 + t11;
+    t14 = 0.07909560579994807 * t13;
+    y[431] = t14;
+    t15 = 0.00847214329494768 * t13;
+    y[528] = t15;
+    t10 = C153 * t12;
+    t2 = (-C152) * t17;
+    t9 = t10 + t2;
+    y[111] = 0;
+    t4 = (-0.07901829610873405) * t9;
+    y[208] = t4;
+    t19 = re[35];
+    t1 = im[35];
+    t18 = re[67];
+    t6 = im[67];
+    t7 = re[99];
+    t3 = im[99];
+    t0 = re[131];
+    t16 = im[131];
+    t5 = re[3];
+    t8 = im[3];
+    t11 = t18 + t5;
+    t14 = t6 + t8;
+    t13 = t7 + t0;
+    t15 = t3 + t16;
+    t12 = t18 - t5;
+    t17 = t6 - t8;
+    t10 = t7 - t0;
+    t2 = t3 - t16;
+    t9 = t11 + t13;
+    t4 = t14 + t15;
+    t18 = t11 - t13;
+    t5 = C0 * t18;
+    t6 = t14 - t15;
+    t8 = C0 * t6;
+    t7 = C1 * t9;
+    t0 = t19 - t7;
+    t3 = C1 * t4;
+    t16 = t1 - t3;
+    t11 = t0 + t5;
+    t13 = t16 + t8;
+    t18 = t0 - t5;
+    t14 = t16 - t8;
+    t15 = C2 * t12;
+    t6 = C3 * t10;
+    t7 = t15 + t6;
+    t3 = C2 * t17;
+    t0 = C3 * t2;
+    t5 = t3 + t0;
+    t16 = C3 * t12;
+    t8 = C2 * t10;
+    t15 = t16 - t8;
+    t6 = C3 * t17;
+    t3 = C2 * t2;
+    t0 = t6 - t3;
+    t12 = t19 + t9;
+    t10 = t1 + t4;
+    t16 = t11 + t5;
+    t8 = t13 - t7;
+    t17 = t18 + t0;
+    t2 = t14 - t15;
+    t6 = t18 - t0;
+    t3 = t14 + t15;
+    t19 = t11 - t5;
+    t9 = t13 + t7;
+    t1 = (-C154) * t12;
+    t4 = (-C155) * t10;
+    t18 = t1 + t4;
+    t0 = 0.0789296508586412 * t18;
+    y[429] = t0;
+    t14 = 0.00672971468946736 * t18;
+    y[530] = t14;
+    t15 = C155 * t12;
+    t11 = (-C154) * t10;
+    t5 = t15 + t11;
+    y[109] = 0;
+    t13 = (-0.07918443743268823) * t5;
+    y[210] = t13;
+    t7 = C156 * t16;
+    t1 = C157 * t8;
+    t4 = t7 + t1;
+    y[82] = 0;
+    t0 = (-0.08006439384135645) * t4;
+    y[237] = t0;
+    t18 = (-C157) * t16;
+    t14 = C156 * t8;
+    t12 = t18 + t14;
+    t10 = 0.07806216596586069 * t12;
+    y[402] = t10;
+    t15 = (-0.007094668922628993) * t12;
+    y[557] = t15;
+    t11 = (-C158) * t17;
+    t5 = (-C159) * t2;
+    t13 = t11 + t5;
+    t7 = 0.07826498459625951 * t13;
+    y[365] = t7;
+    t1 = (-0.006149464704131592) * t13;
+    y[594] = t1;
+    t4 = C159 * t17;
+    t0 = (-C158) * t2;
+    t16 = t4 + t0;
+    y[45] = 0;
+    t8 = (-0.07985691215862968) * t16;
+    y[274] = t8;
+    t18 = C160 * t6;
+    t14 = C161 * t3;
+    t10 = t18 + t14;
+    t12 = 0.023229600782742582 * t10;
+    y[146] = t12;
+    t15 = (-0.06375555749304516) * t10;
+    y[173] = t15;
+    t11 = (-C161) * t6;
+    t5 = C160 * t3;
+    t7 = t11 + t5;
+    t13 = 0.07880387979570969 * t7;
+    y[466] = t13;
+    t1 = 0.05276951259189433 * t7;
+    y[493] = t1;
+    t17 = C162 * t19;
+    t2 = C163 * t9;
+    t4 = t17 + t2;
+    y[18] = 0;
+    t0 = (-0.07963644616705444) * t4;
+    y[301] = t0;
+    t16 = (-C163) * t19;
+    t8 = C162 * t9;
+    t18 = t16 + t8;
+    t14 = 0.07848165382580351 * t18;
+    y[338] = t14;
+    t12 = (-0.0011166310633579017) * t18;
+    y[621] = t12;
+}
+
+/**
+ *  Part 5 of ApplyWindowedIMDCT_W10_320_K160().
+ * 
+ *  @param {Number[]} X 
+ *    - The input block (320 points, only the first 160 points are used).
+ *  @param {Number[]} y 
+ *    - The array that would contain the output block (640 points).
+ *  @param {Number[]} re 
+ *    - The scratch buffer (real part, 160 points).
+ *  @param {Number[]} im 
+ *    - The scratch buffer (imaginary part, 160 points).
+ */
+function ApplyWindowedIMDCT_W10_320_K160_Part5(X, y, re, im) {
+    let t0, t1, t10, t11, t12, t13, t14, t15, t16, t17, t18, t19, t2, t3, t4, t5, t6, t7, t8, t9;
+    const C0 = 0.5590169943749475;
+    const C1 = 0.25;
+    const C2 = 0.9510565162951535;
+    const C3 = 0.5877852522924731;
+    const C4 = 0.6324941222046724;
+    const C5 = 0.7745651588966166;
+    const C6 = 0.9669764710448521;
+    const C7 = 0.25486565960451457;
+    const C8 = 0.36218385909135087;
+    const C9 = 0.9321066742673269;
+    const C10 = 0.8408914537909229;
+    const C11 = 0.5412038090603096;
+    const C12 = 0.05642051636683749;
+    const C13 = 0.998407093991674;
+    const C14 = 0.04661611613324671;
+    const C15 = 0.9989128779411404;
+    const C16 = 0.6248594881423863;
+    const C17 = 0.7807372285720945;
+    const C18 = 0.9644277738739964;
+    const C19 = 0.264346494170904;
+    const C20 = 0.3530156161966958;
+    const C21 = 0.9356174296801376;
+    const C22 = 0.8355377597366458;
+    const C23 = 0.5494330278152808;
+    const C24 = 0.8301035348140438;
+    const C25 = 0.5576092910714722;
+    const C26 = 0.03680722294135883;
+    const C27 = 0.9993223845883495;
+    const C28 = 0.6171646288220856;
+    const C29 = 0.7868340491684999;
+    const C30 = 0.9617861231469886;
+    const C31 = 0.27380185047198924;
+    const C32 = 0.34381334892220483;
+    const C33 = 0.939038008337734;
+    const C34 = 0.33457794420155085;
+    const C35 = 0.9423680805576258;
+    const C36 = 0.8245893027850253;
+    const C37 = 0.5657318107836131;
+    const C38 = 0.026994782192715373;
+    const C39 = 0.9996355744641984;
+    const C40 = 0.609410285890327;
+    const C41 = 0.7928550330615742;
+    const C42 = 0.9590517734716243;
+    const C43 = 0.28323081718085014;
+    const C44 = 0.9562249883902162;
+    const C45 = 0.29263248551405047;
+    const C46 = 0.3253102921622629;
+    const C47 = 0.9456073253805213;
+    const C48 = 0.8189955951227504;
+    const C49 = 0.5737998040863485;
+    const C50 = 0.017179739630778748;
+    const C51 = 0.9998524173827948;
+    const C52 = 0.601597206726822;
+    const C53 = 0.7987995999363579;
+    const C54 = 0.5937261443724018;
+    const C55 = 0.804667176843123;
+    const C56 = 0.9533060403541939;
+    const C57 = 0.3020059493192281;
+    const C58 = 0.3160112860399338;
+    const C59 = 0.9487554306012626;
+    const C60 = 0.8133229509604061;
+    const C61 = 0.5818124933696911;
+    const C62 = 0.007363041249779567;
+    const C63 = 0.9999728924443673;
+    t10 = re[55];
+    t15 = im[55];
+    t6 = re[87];
+    t3 = im[87];
+    t11 = re[119];
+    t5 = im[119];
+    t13 = re[151];
+    t7 = im[151];
+    t1 = re[23];
+    t17 = im[23];
+    t2 = t6 + t1;
+    t4 = t3 + t17;
+    t0 = t11 + t13;
+    t19 = t5 + t7;
+    t9 = t6 - t1;
+    t16 = t3 - t17;
+    t8 = t11 - t13;
+    t14 = t5 - t7;
+    t18 = t2 + t0;
+    t12 = t4 + t19;
+    t6 = t2 - t0;
+    t1 = C0 * t6;
+    t3 = t4 - t19;
+    t17 = C0 * t3;
+    t11 = C1 * t18;
+    t13 = t10 - t11;
+    t5 = C1 * t12;
+    t7 = t15 - t5;
+    t2 = t13 + t1;
+    t0 = t7 + t17;
+    t6 = t13 - t1;
+    t4 = t7 - t17;
+    t19 = C2 * t9;
+    t3 = C3 * t8;
+    t11 = t19 + t3;
+    t5 = C2 * t16;
+    t13 = C3 * t14;
+    t1 = t5 + t13;
+    t7 = C3 * t9;
+    t17 = C2 * t8;
+    t19 = t7 - t17;
+    t3 = C3 * t16;
+    t5 = C2 * t14;
+    t13 = t3 - t5;
+    t9 = t10 + t18;
+    t8 = t15 + t12;
+    t7 = t2 + t1;
+    t17 = t0 - t11;
+    t16 = t6 + t13;
+    t14 = t4 - t19;
+    t3 = t6 - t13;
+    t5 = t4 + t19;
+    t10 = t2 - t1;
+    t18 = t0 + t11;
+    t15 = C4 * t9;
+    t12 = C5 * t8;
+    t6 = t15 + t12;
+    y[20] = 0;
+    t13 = (-0.07967770169910844) * t6;
+    y[299] = t13;
+    t4 = (-C5) * t9;
+    t19 = C4 * t8;
+    t2 = t4 + t19;
+    t1 = 0.07844101758359247 * t2;
+    y[340] = t1;
+    t0 = (-0.001371252207873613) * t2;
+    y[619] = t0;
+    t11 = (-C6) * t7;
+    t15 = (-C7) * t17;
+    t12 = t11 + t15;
+    t6 = 0.07878375895351551 * t12;
+    y[427] = t6;
+    t13 = 0.005097485695067034 * t12;
+    y[532] = t13;
+    t9 = C7 * t7;
+    t8 = (-C6) * t17;
+    t4 = t9 + t8;
+    y[107] = 0;
+    t19 = (-0.07933107131493516) * t4;
+    y[212] = t19;
+    t1 = C8 * t16;
+    t2 = C9 * t14;
+    t0 = t1 + t2;
+    y[84] = 0;
+    t11 = (-0.08005707839808375) * t0;
+    y[235] = t11;
+    t15 = (-C9) * t16;
+    t6 = C8 * t14;
+    t12 = t15 + t6;
+    t13 = 0.0780692991183351 * t12;
+    y[404] = t13;
+    t7 = (-0.00660063310082577) * t12;
+    y[555] = t7;
+    t17 = (-C10) * t3;
+    t9 = (-C11) * t5;
+    t8 = t17 + t9;
+    t4 = 0.07826862367318611 * t8;
+    y[363] = t4;
+    t19 = (-0.005741950732883771) * t8;
+    y[596] = t19;
+    t1 = C11 * t3;
+    t2 = (-C10) * t5;
+    t0 = t1 + t2;
+    y[43] = 0;
+    t11 = (-0.07985319923469122) * t0;
+    y[276] = t11;
+    t16 = C12 * t10;
+    t14 = C13 * t18;
+    t15 = t16 + t14;
+    t6 = 0.02635963991835971 * t15;
+    y[148] = t6;
+    t13 = (-0.061476294335568483) * t15;
+    y[171] = t13;
+    t12 = (-C13) * t10;
+    t7 = C12 * t18;
+    t17 = t12 + t7;
+    t9 = 0.07787288007785695 * t17;
+    y[468] = t9;
+    t4 = 0.05548876646666499 * t17;
+    y[491] = t4;
+    t8 = re[75];
+    t19 = im[75];
+    t3 = re[107];
+    t5 = im[107];
+    t1 = re[139];
+    t2 = im[139];
+    t0 = re[11];
+    t11 = im[11];
+    t16 = re[43];
+    t14 = im[43];
+    t6 = t3 + t16;
+    t15 = t5 + t14;
+    t13 = t1 + t0;
+    t10 = t2 + t11;
+    t18 = t3 - t16;
+    t12 = t5 - t14;
+    t7 = t1 - t0;
+    t9 = t2 - t11;
+    t17 = t6 + t13;
+    t4 = t15 + t10;
+    t3 = t6 - t13;
+    t16 = C0 * t3;
+    t5 = t15 - t10;
+    t14 = C0 * t5;
+    t1 = C1 * t17;
+    t0 = t8 - t1;
+    t2 = C1 * t4;
+    t11 = t19 - t2;
+    t6 = t0 + t16;
+    t13 = t11 + t14;
+    t3 = t0 - t16;
+    t15 = t11 - t14;
+    t10 = C2 * t18;
+    t5 = C3 * t7;
+    t1 = t10 + t5;
+    t2 = C2 * t12;
+    t0 = C3 * t9;
+    t16 = t2 + t0;
+    t11 = C3 * t18;
+    t14 = C2 * t7;
+    t10 = t11 - t14;
+    t5 = C3 * t12;
+    t2 = C2 * t9;
+    t0 = t5 - t2;
+    t18 = t8 + t17;
+    t7 = t19 + t4;
+    t11 = t6 + t16;
+    t14 = t13 - t1;
+    t12 = t3 + t0;
+    t9 = t15 - t10;
+    t5 = t3 - t0;
+    t2 = t15 + t10;
+    t8 = t6 - t16;
+    t17 = t13 + t1;
+    t19 = C14 * t18;
+    t4 = C15 * t7;
+    t3 = t19 + t4;
+    t0 = 0.029582342154535285 * t3;
+    y[150] = t0;
+    t15 = (-0.059011947189589936) * t3;
+    y[169] = t15;
+    t10 = (-C15) * t18;
+    t6 = C14 * t7;
+    t16 = t10 + t6;
+    t13 = 0.07676973640263576 * t16;
+    y[470] = t13;
+    t1 = 0.058131582707871575 * t16;
+    y[489] = t1;
+    t19 = C16 * t11;
+    t4 = C17 * t14;
+    t0 = t19 + t4;
+    y[22] = 0;
+    t3 = (-0.07971374919927883) * t0;
+    y[297] = t3;
+    t15 = (-C17) * t11;
+    t18 = C16 * t14;
+    t7 = t15 + t18;
+    t10 = 0.07840554562771143 * t7;
+    y[342] = t10;
+    t6 = (-0.0016543034293969414) * t7;
+    y[617] = t6;
+    t13 = (-C18) * t12;
+    t16 = (-C19) * t9;
+    t1 = t13 + t16;
+    t19 = 0.07865614188746739 * t1;
+    y[425] = t19;
+    t4 = 0.0035739293363973644 * t1;
+    y[534] = t4;
+    t0 = C19 * t12;
+    t3 = (-C18) * t9;
+    t11 = t0 + t3;
+    y[105] = 0;
+    t14 = (-0.07945978343232006) * t11;
+    y[214] = t14;
+    t15 = C20 * t5;
+    t18 = C21 * t2;
+    t10 = t15 + t18;
+    y[86] = 0;
+    t7 = (-0.0800435305099844) * t10;
+    y[233] = t7;
+    t6 = (-C21) * t5;
+    t13 = C20 * t2;
+    t16 = t6 + t13;
+    t19 = 0.078082512854932 * t16;
+    y[406] = t19;
+    t1 = (-0.006034162996387899) * t16;
+    y[553] = t1;
+    t4 = (-C22) * t8;
+    t12 = (-C23) * t17;
+    t9 = t4 + t12;
+    t0 = 0.0782719816664161 * t9;
+    y[361] = t0;
+    t3 = (-0.005324123100425294) * t9;
+    y[598] = t3;
+    t11 = C23 * t8;
+    t14 = (-C22) * t17;
+    t15 = t11 + t14;
+    y[41] = 0;
+    t18 = (-0.07984977340469802) * t15;
+    y[278] = t18;
+    t10 = re[95];
+    t7 = im[95];
+    t5 = re[127];
+    t2 = im[127];
+    t6 = re[159];
+    t13 = im[159];
+    t19 = re[31];
+    t16 = im[31];
+    t1 = re[63];
+    t4 = im[63];
+    t12 = t5 + t1;
+    t0 = t2 + t4;
+    t9 = t6 + t19;
+    t3 = t13 + t16;
+    t8 = t5 - t1;
+    t17 = t2 - t4;
+    t11 = t6 - t19;
+    t14 = t13 - t16;
+    t15 = t12 + t9;
+    t18 = t0 + t3;
+    t5 = t12 - t9;
+    t1 = C0 * t5;
+    t2 = t0 - t3;
+    t4 = C0 * t2;
+    t6 = C1 * t15;
+    t19 = t10 - t6;
+    t13 = C1 * t18;
+    t16 = t7 - t13;
+    t12 = t19 + t1;
+    t9 = t16 + t4;
+    t5 = t19 - t1;
+    t0 = t16 - t4;
+    t3 = C2 * t8;
+    t2 = C3 * t11;
+    t6 = t3 + t2;
+    t13 = C2 * t17;
+    t19 = C3 * t14;
+    t1 = t13 + t19;
+    t16 = C3 * t8;
+    t4 = C2 * t11;
+    t3 = t16 - t4;
+    t2 = C3 * t17;
+    t13 = C2 * t14;
+    t19 = t2 - t13;
+    t8 = t10 + t15;
+    t11 = t7 + t18;
+    t16 = t12 + t1;
+    t4 = t9 - t6;
+    t17 = t5 + t19;
+    t14 = t0 - t3;
+    t2 = t5 - t19;
+    t13 = t0 + t3;
+    t10 = t12 - t1;
+    t15 = t9 + t6;
+    t7 = (-C24) * t8;
+    t18 = (-C25) * t11;
+    t5 = t7 + t18;
+    t19 = 0.07827557368950344 * t5;
+    y[359] = t19;
+    t0 = (-0.00490016126713387) * t5;
+    y[600] = t0;
+    t3 = C25 * t8;
+    t12 = (-C24) * t11;
+    t1 = t3 + t12;
+    y[39] = 0;
+    t9 = (-0.07984610914245029) * t1;
+    y[280] = t9;
+    t6 = C26 * t16;
+    t7 = C27 * t4;
+    t18 = t6 + t7;
+    t19 = 0.032865721381615164 * t18;
+    y[152] = t19;
+    t5 = (-0.05637208485075786) * t18;
+    y[167] = t5;
+    t0 = (-C27) * t16;
+    t8 = C26 * t4;
+    t11 = t0 + t8;
+    t3 = 0.07549217237243139 * t11;
+    y[472] = t3;
+    t12 = 0.0606817306790926 * t11;
+    y[487] = t12;
+    t1 = C28 * t17;
+    t9 = C29 * t14;
+    t6 = t1 + t9;
+    y[24] = 0;
+    t7 = (-0.07974459018202704) * t6;
+    y[295] = t7;
+    t19 = (-C29) * t17;
+    t18 = C28 * t14;
+    t5 = t19 + t18;
+    t16 = 0.07837522251645646 * t5;
+    y[344] = t16;
+    t4 = (-0.0019647292104819658) * t5;
+    y[615] = t4;
+    t0 = (-C30) * t2;
+    t8 = (-C31) * t13;
+    t3 = t0 + t8;
+    t11 = 0.07854498143942426 * t3;
+    y[423] = t11;
+    t12 = 0.002156796701315304 * t3;
+    y[536] = t12;
+    t1 = C31 * t2;
+    t9 = (-C30) * t13;
+    t6 = t1 + t9;
+    y[103] = 0;
+    t7 = (-0.0795722385499594) * t6;
+    y[216] = t7;
+    t17 = C32 * t10;
+    t14 = C33 * t15;
+    t19 = t17 + t14;
+    y[88] = 0;
+    t18 = (-0.08002300227653168) * t19;
+    y[231] = t18;
+    t16 = (-C33) * t10;
+    t5 = C32 * t15;
+    t4 = t16 + t5;
+    t0 = 0.07810254329626591 * t4;
+    y[408] = t0;
+    t8 = (-0.005392139407981611) * t4;
+    y[551] = t8;
+    t11 = re[115];
+    t3 = im[115];
+    t12 = re[147];
+    t2 = im[147];
+    t13 = re[19];
+    t1 = im[19];
+    t9 = re[51];
+    t6 = im[51];
+    t7 = re[83];
+    t17 = im[83];
+    t14 = t12 + t7;
+    t19 = t2 + t17;
+    t18 = t13 + t9;
+    t10 = t1 + t6;
+    t15 = t12 - t7;
+    t16 = t2 - t17;
+    t5 = t13 - t9;
+    t0 = t1 - t6;
+    t4 = t14 + t18;
+    t8 = t19 + t10;
+    t12 = t14 - t18;
+    t7 = C0 * t12;
+    t2 = t19 - t10;
+    t17 = C0 * t2;
+    t13 = C1 * t4;
+    t9 = t11 - t13;
+    t1 = C1 * t8;
+    t6 = t3 - t1;
+    t14 = t9 + t7;
+    t18 = t6 + t17;
+    t12 = t9 - t7;
+    t19 = t6 - t17;
+    t10 = C2 * t15;
+    t2 = C3 * t5;
+    t13 = t10 + t2;
+    t1 = C2 * t16;
+    t9 = C3 * t0;
+    t7 = t1 + t9;
+    t6 = C3 * t15;
+    t17 = C2 * t5;
+    t10 = t6 - t17;
+    t2 = C3 * t16;
+    t1 = C2 * t0;
+    t9 = t2 - t1;
+    t15 = t11 + t4;
+    t5 = t3 + t8;
+    t6 = t14 + t7;
+    t17 = t18 - t13;
+    t16 = t12 + t9;
+    t0 = t19 - t10;
+    t2 = t12 - t9;
+    t1 = t19 + t10;
+    t11 = t14 - t7;
+    t4 = t18 + t13;
+    t3 = C34 * t15;
+    t8 = C35 * t5;
+    t12 = t3 + t8;
+    y[90] = 0;
+    t9 = (-0.07999487307524904) * t12;
+    y[229] = t9;
+    t19 = (-C35) * t15;
+    t10 = C34 * t5;
+    t14 = t19 + t10;
+    t7 = 0.07813000708333884 * t14;
+    y[410] = t7;
+    t18 = (-0.0046717798345097695) * t14;
+    y[549] = t18;
+    t13 = (-C36) * t6;
+    t3 = (-C37) * t17;
+    t8 = t13 + t3;
+    t12 = 0.07828008273966162 * t8;
+    y[357] = t12;
+    t9 = (-0.004474926713724794) * t8;
+    y[602] = t9;
+    t15 = C37 * t6;
+    t5 = (-C36) * t17;
+    t19 = t15 + t5;
+    y[37] = 0;
+    t10 = (-0.07984150988682279) * t19;
+    y[282] = t10;
+    t7 = C38 * t16;
+    t14 = C39 * t0;
+    t18 = t7 + t14;
+    t13 = 0.036177820954147843 * t18;
+    y[154] = t13;
+    t3 = (-0.05357035306535798) * t18;
+    y[165] = t3;
+    t12 = (-C39) * t16;
+    t8 = C38 * t0;
+    t9 = t12 + t8;
+    t6 = 0.0740395135648426 * t9;
+    y[474] = t6;
+    t17 = 0.06312367791411176 * t9;
+    y[485] = t17;
+    t15 = C40 * t2;
+    t5 = C41 * t1;
+    t19 = t15 + t5;
+    y[26] = 0;
+    t10 = (-0.07977048256001223) * t19;
+    y[293] = t10;
+    t7 = (-C41) * t2;
+    t14 = C40 * t1;
+    t13 = t7 + t14;
+    t18 = 0.07834978302028017 * t13;
+    y[346] = t18;
+    t3 = (-0.002300519434810679) * t13;
+    y[613] = t3;
+    t16 = (-C42) * t11;
+    t0 = (-C43) * t4;
+    t12 = t16 + t0;
+    t8 = 0.07844874145962522 * t12;
+    y[421] = t8;
+    t6 = 0.0008435186908425442 * t12;
+    y[538] = t6;
+    t9 = C43 * t11;
+    t17 = (-C42) * t4;
+    t15 = t9 + t17;
+    y[101] = 0;
+    t5 = (-0.07966985682258086) * t15;
+    y[218] = t5;
+    t19 = re[135];
+    t10 = im[135];
+    t2 = re[7];
+    t1 = im[7];
+    t7 = re[39];
+    t14 = im[39];
+    t18 = re[71];
+    t13 = im[71];
+    t3 = re[103];
+    t16 = im[103];
+    t0 = t2 + t3;
+    t8 = t1 + t16;
+    t12 = t7 + t18;
+    t6 = t14 + t13;
+    t11 = t2 - t3;
+    t4 = t1 - t16;
+    t9 = t7 - t18;
+    t17 = t14 - t13;
+    t15 = t0 + t12;
+    t5 = t8 + t6;
+    t2 = t0 - t12;
+    t3 = C0 * t2;
+    t1 = t8 - t6;
+    t16 = C0 * t1;
+    t7 = C1 * t15;
+    t18 = t19 - t7;
+    t14 = C1 * t5;
+    t13 = t10 - t14;
+    t0 = t18 + t3;
+    t12 = t13 + t16;
+    t2 = t18 - t3;
+    t8 = t13 - t16;
+    t6 = C2 * t11;
+    t1 = C3 * t9;
+    t7 = t6 + t1;
+    t14 = C2 * t4;
+    t18 = C3 * t17;
+    t3 = t14 + t18;
+    t13 = C3 * t11;
+    t16 = C2 * t9;
+    t6 = t13 - t16;
+    t1 = C3 * t4;
+    t14 = C2 * t17;
+    t18 = t1 - t14;
+    t11 = t19 + t15;
+    t9 = t10 + t5;
+    t13 = t0 + t3;
+    t16 = t12 - t7;
+    t4 = t2 + t18;
+    t17 = t8 - t6;
+    t1 = t2 - t18;
+    t14 = t8 + t6;
+    t19 = t0 - t3;
+    t15 = t12 + t7;
+    t10 = (-C44) * t11;
+    t5 = (-C45) * t9;
+    t2 = t10 + t5;
+    t18 = 0.07836596519679581 * t2;
+    y[419] = t18;
+    t8 = (-0.00036912470608087516) * t2;
+    y[540] = t8;
+    t6 = C45 * t11;
+    t0 = (-C44) * t9;
+    t3 = t6 + t0;
+    y[99] = 0;
+    t12 = (-0.07975401035774578) * t3;
+    y[220] = t12;
+    t7 = C46 * t13;
+    t10 = C47 * t16;
+    t5 = t7 + t10;
+    y[92] = 0;
+    t18 = (-0.07995838972390076) * t5;
+    y[227] = t18;
+    t2 = (-C47) * t13;
+    t8 = C46 * t16;
+    t11 = t2 + t8;
+    t9 = 0.07816565618168997 * t11;
+    y[412] = t9;
+    t6 = (-0.0038696892324265575) * t11;
+    y[547] = t6;
+    t0 = (-C48) * t4;
+    t3 = (-C49) * t17;
+    t12 = t0 + t3;
+    t7 = 0.0782861255568716 * t12;
+    y[355] = t7;
+    t10 = (-0.004052833713203016) * t12;
+    y[604] = t10;
+    t5 = C49 * t4;
+    t18 = (-C48) * t17;
+    t13 = t5 + t18;
+    y[35] = 0;
+    t16 = (-0.07983534701126106) * t13;
+    y[284] = t16;
+    t2 = C50 * t1;
+    t8 = C51 * t14;
+    t9 = t2 + t8;
+    t11 = 0.0394872088271444 * t9;
+    y[156] = t11;
+    t6 = (-0.05062400518738256) * t9;
+    y[163] = t6;
+    t0 = (-C51) * t1;
+    t3 = C50 * t14;
+    t7 = t0 + t3;
+    t12 = 0.07241345157237726 * t7;
+    y[476] = t12;
+    t10 = 0.06544248450873842 * t7;
+    y[483] = t10;
+    t4 = C52 * t19;
+    t17 = C53 * t15;
+    t5 = t4 + t17;
+    y[28] = 0;
+    t18 = (-0.07979164632836817) * t5;
+    y[291] = t18;
+    t13 = (-C53) * t19;
+    t16 = C52 * t15;
+    t2 = t13 + t16;
+    t8 = 0.07832900168871372 * t2;
+    y[348] = t8;
+    t11 = (-0.002659444465245213) * t2;
+    y[611] = t11;
+    t9 = re[155];
+    t6 = im[155];
+    t1 = re[27];
+    t14 = im[27];
+    t0 = re[59];
+    t3 = im[59];
+    t12 = re[91];
+    t7 = im[91];
+    t10 = re[123];
+    t4 = im[123];
+    t17 = t1 + t10;
+    t5 = t14 + t4;
+    t18 = t0 + t12;
+    t19 = t3 + t7;
+    t15 = t1 - t10;
+    t13 = t14 - t4;
+    t16 = t0 - t12;
+    t8 = t3 - t7;
+    t2 = t17 + t18;
+    t11 = t5 + t19;
+    t1 = t17 - t18;
+    t10 = C0 * t1;
+    t14 = t5 - t19;
+    t4 = C0 * t14;
+    t0 = C1 * t2;
+    t12 = t9 - t0;
+    t3 = C1 * t11;
+    t7 = t6 - t3;
+    t17 = t12 + t10;
+    t18 = t7 + t4;
+    t1 = t12 - t10;
+    t5 = t7 - t4;
+    t19 = C2 * t15;
+    t14 = C3 * t16;
+    t0 = t19 + t14;
+    t3 = C2 * t13;
+    t12 = C3 * t8;
+    t10 = t3 + t12;
+    t7 = C3 * t15;
+    t4 = C2 * t16;
+    t19 = t7 - t4;
+    t14 = C3 * t13;
+    t3 = C2 * t8;
+    t12 = t14 - t3;
+    t15 = t9 + t2;
+    t16 = t6 + t11;
+    t7 = t17 + t10;
+    t4 = t18 - t0;
+    t13 = t1 + t12;
+    t8 = t5 - t19;
+    t14 = t1 - t12;
+    t3 = t5 + t19;
+    t9 = t17 - t10;
+    t2 = t18 + t0;
+    t6 = C54 * t15;
+    t11 = C55 * t16;
+    t1 = t6 + t11;
+    y[30] = 0;
+    t12 = (-0.07980853720458624) * t1;
+    y[289] = t12;
+    t5 = (-C55) * t15;
+    t19 = C54 * t16;
+    t17 = t5 + t19;
+    t10 = 0.0783124239450518 * t17;
+    y[350] = t10;
+    t18 = (-0.0030386339806276795) * t17;
+    y[609] = t18;
+    t0 = (-C56) * t7;
+    t6 = (-C57) * t4;
+    t11 = t0 + t6;
+    t1 = 0.07829544839153392 * t11;
+    y[417] = t1;
+    t12 = (-0.001484443570694814) * t11;
+    y[542] = t12;
+    t15 = C57 * t7;
+    t16 = (-C56) * t4;
+    t5 = t15 + t16;
+    y[97] = 0;
+    t19 = (-0.07982584081702268) * t5;
+    y[222] = t19;
+    t10 = C58 * t13;
+    t17 = C59 * t8;
+    t18 = t10 + t17;
+    y[94] = 0;
+    t0 = (-0.07991288715667003) * t18;
+    y[225] = t0;
+    t6 = (-C59) * t13;
+    t1 = C58 * t8;
+    t11 = t6 + t1;
+    t12 = 0.0782101638719023 * t11;
+    y[414] = t12;
+    t7 = (-0.002982392523410217) * t11;
+    y[545] = t7;
+    t4 = (-C60) * t14;
+    t15 = (-C61) * t3;
+    t16 = t4 + t15;
+    t5 = 0.07829442545648338 * t16;
+    y[353] = t5;
+    t19 = (-0.0036380318390345115) * t16;
+    y[606] = t19;
+    t10 = C61 * t14;
+    t17 = (-C60) * t3;
+    t18 = t10 + t17;
+    y[33] = 0;
+    t0 = (-0.07982688376037442) * t18;
+    y[286] = t0;
+    t13 = C62 * t9;
+    t8 = C63 * t2;
+    t6 = t13 + t8;
+    t1 = 0.04276339088979664 * t6;
+    y[158] = t1;
+    t12 = (-0.04755313986979603) * t6;
+    y[161] = t12;
+    t11 = (-C63) * t9;
+    t7 = C62 * t2;
+    t4 = t11 + t7;
+    t15 = 0.07061837814965627 * t4;
+    y[478] = t15;
+    t5 = 0.06762500181343893 * t4;
+    y[481] = t5;
+}
+
+//
+//  Public functions.
+//
+
+/**
+ *  Apply LD-IMDCT transform (prebuilt for window W10_320, input pruned).
+ * 
+ *  Note(s):
+ *    [1] y[n] = w[n] * SUM(X[k] * cos(PI / 320 * (n + 160.5) * (k + 0.5))), where
+ *        w[n] = sqrt(2 / 320) * W10_320[639 - n].
+ *    [2] X[k] shall be zero for all k >= 160 (not checked).
+ *    [3] The size of all arrays will not be checked.
+ * 
+ *  @param {Number[]} X 
+ *    - The input block (320 points, only the first 160 points are used).
+ *  @param {Number[]} y 
+ *    - The array that would contain the output block (640 points).
+ *  @param {Number[]} re 
+ *    - The scratch buffer (real part, 160 points).
+ *  @param {Number[]} im 
+ *    - The scratch buffer (imaginary part, 160 points).
+ */
+function ApplyWindowedIMDCT_W10_320_K160(X, y, re, im) {
+    ApplyWindowedIMDCT_W10_320_K160_Part1(X, y, re, im);
+    ApplyWindowedIMDCT_W10_320_K160_Part2(X, y, re, im);
+    ApplyWindowedIMDCT_W10_320_K160_Part3(X, y, re, im);
+    ApplyWindowedIMDCT_W10_320_K160_Part4(X, y, re, im);
+    ApplyWindowedIMDCT_W10_320_K160_Part5(X, y, re, im);
+}
+
+//  Export public APIs.
+module.exports = {
+    "ApplyWindowedIMDCT_W10_320_K160": ApplyWindowedIMDCT_W10_320_K160
+};
\ No newline at end of file
@@ -0,0 +1,7571 @@
+//
+//  Copyright 2021 - 2023 XiaoJSoft Studio. All rights reserved.
+//  Use of this source code is governed by a BSD-style license that can be
+//  found in the LICENSE.md file.
+//
+
+//
+//  Note(s):
+//    [1] This file is generated automatically by a MDCT compiler, which locates 
+//        at "./../../dev/mdct-generator/" directory.
+//        Do NOT modify this file manually.
+//
+
+//
+//  Private functions.
+//
+
+/**
+ *  Part 1 of ApplyWindowedIMDCT_W10_320_K80().
+ * 
+ *  @param {Number[]} X 
+ *    - The input block (320 points, only the first 80 points are used).
+ *  @param {Number[]} y 
+ *    - The array that would contain the output block (640 points).
+ *  @param {Number[]} re 
+ *    - The scratch buffer (real part, 160 points).
+ *  @param {Number[]} im 
+ *    - The scratch buffer (imaginary part, 160 points).
+ */
+function ApplyWindowedIMDCT_W10_320_K80_Part1(X, y, re, im) {
+    let t0, t1, t10, t11, t12, t13, t14, t15, t16, t17, t18, t2, t3, t4, t5, t6, t7, t8, t9;
+    const C0 = 0.9807852804032304;
+    const C1 = 0.19509032201612825;
+    const C2 = 0.9238795325112867;
+    const C3 = 0.3826834323650898;
+    const C4 = 0.7071067811865476;
+    const C5 = 0.9987954562051724;
+    const C6 = 0.049067674327418015;
+    const C7 = 0.970031253194544;
+    const C8 = 0.24298017990326387;
+    const C9 = 0.9415440651830208;
+    const C10 = 0.33688985339222005;
+    const C11 = 0.989176509964781;
+    const C12 = 0.14673047445536175;
+    const C13 = 1.1758756024193586;
+    const C14 = 0.7856949583871022;
+    const C15 = 1.3065629648763766;
+    const C16 = 0.5411961001461969;
+    const C17 = 0.8314696123025452;
+    const C18 = 1.3870398453221475;
+    const C19 = 0.27589937928294306;
+    const C20 = 0.5555702330196022;
+    const C21 = 0.9951847266721969;
+    const C22 = 0.0980171403295606;
+    const C23 = 0.9569403357322088;
+    const C24 = 0.29028467725446233;
+    t0 = X[0];
+    t1 = X[40];
+    t2 = C0 * t1;
+    t1 = (-C1) * t1;
+    t3 = X[79];
+    t4 = C2 * t3;
+    t3 = C3 * t3;
+    t5 = X[39];
+    t6 = C0 * t5;
+    t5 = C1 * t5;
+    t7 = t0 + t4;
+    t8 = t0 - t3;
+    t9 = t0 - t4;
+    t10 = -t3;
+    t0 = t0 + t3;
+    t11 = -t4;
+    t12 = t2 + t6;
+    t13 = t1 + t5;
+    t14 = t2 - t5;
+    t15 = t1 + t6;
+    t16 = t2 - t6;
+    t17 = t1 - t5;
+    t2 = t2 + t5;
+    t5 = t1 - t6;
+    t1 = t14 + t15;
+    t6 = t14 - t15;
+    t14 = C4 * t1;
+    t15 = (-C4) * t6;
+    t1 = t2 - t5;
+    t6 = t2 + t5;
+    t2 = (-C4) * t1;
+    t5 = (-C4) * t6;
+    t1 = t7 - t12;
+    t6 = t3 - t13;
+    t7 = t7 + t12;
+    t12 = t3 + t13;
+    t13 = t8 - t14;
+    t18 = t4 - t15;
+    t8 = t8 + t14;
+    t14 = t4 + t15;
+    t15 = t9 - t17;
+    t3 = t16 - t3;
+    t9 = t9 + t17;
+    t17 = t10 - t16;
+    t10 = t0 - t2;
+    t16 = t11 - t5;
+    t11 = t0 + t2;
+    t0 = t5 - t4;
+    re[0] = t7;
+    im[0] = t12;
+    re[20] = t8;
+    im[20] = t14;
+    re[40] = t9;
+    im[40] = t17;
+    re[60] = t11;
+    im[60] = t0;
+    re[80] = t1;
+    im[80] = t6;
+    re[100] = t13;
+    im[100] = t18;
+    re[120] = t15;
+    im[120] = t3;
+    re[140] = t10;
+    im[140] = t16;
+    t2 = X[10];
+    t5 = C5 * t2;
+    t4 = (-C6) * t2;
+    t7 = X[50];
+    t12 = C7 * t7;
+    t8 = (-C8) * t7;
+    t14 = X[69];
+    t9 = C9 * t14;
+    t17 = C10 * t14;
+    t11 = X[29];
+    t0 = C11 * t11;
+    t1 = C12 * t11;
+    t6 = t5 + t9;
+    t13 = t4 + t17;
+    t18 = t5 - t17;
+    t15 = t4 + t9;
+    t3 = t5 - t9;
+    t10 = t4 - t17;
+    t16 = t5 + t17;
+    t2 = t4 - t9;
+    t7 = t12 + t0;
+    t14 = t8 + t1;
+    t11 = t12 - t1;
+    t5 = t8 + t0;
+    t17 = t12 - t0;
+    t4 = t8 - t1;
+    t9 = t12 + t1;
+    t12 = t8 - t0;
+    t1 = t11 + t5;
+    t8 = t11 - t5;
+    t0 = C4 * t1;
+    t11 = (-C4) * t8;
+    t5 = t9 - t12;
+    t1 = t9 + t12;
+    t8 = (-C4) * t5;
+    t9 = (-C4) * t1;
+    t12 = t6 - t7;
+    t5 = t13 - t14;
+    t1 = t6 + t7;
+    t6 = t13 + t14;
+    t7 = t18 - t0;
+    t13 = t15 - t11;
+    t14 = t18 + t0;
+    t18 = t15 + t11;
+    t0 = t3 - t4;
+    t15 = t10 + t17;
+    t11 = t3 + t4;
+    t3 = t10 - t17;
+    t4 = t16 - t8;
+    t10 = t2 - t9;
+    t17 = t16 + t8;
+    t16 = t2 + t9;
+    t8 = t14 + t18;
+    t2 = C0 * t8;
+    t9 = t14 * (-C13);
+    t8 = t18 * C14;
+    t14 = t2 - t8;
+    t18 = t2 + t9;
+    t8 = t11 + t3;
+    t2 = C2 * t8;
+    t9 = t11 * (-C15);
+    t8 = t3 * C16;
+    t11 = t2 - t8;
+    t3 = t2 + t9;
+    t8 = t17 + t16;
+    t2 = C17 * t8;
+    t9 = t17 * (-C18);
+    t8 = t16 * C19;
+    t17 = t2 - t8;
+    t16 = t2 + t9;
+    t8 = t12 + t5;
+    t2 = t12 - t5;
+    t9 = C4 * t8;
+    t12 = (-C4) * t2;
+    t5 = t7 + t13;
+    t8 = C20 * t5;
+    t2 = t7 * (-C18);
+    t5 = t13 * (-C19);
+    t7 = t8 - t5;
+    t13 = t8 + t2;
+    t5 = t0 + t15;
+    t8 = C3 * t5;
+    t2 = t0 * (-C15);
+    t5 = t15 * (-C16);
+    t0 = t8 - t5;
+    t15 = t8 + t2;
+    t5 = t4 + t10;
+    t8 = C1 * t5;
+    t2 = t4 * (-C13);
+    t5 = t10 * (-C14);
+    t4 = t8 - t5;
+    t10 = t8 + t2;
+    re[5] = t1;
+    im[5] = t6;
+    re[25] = t14;
+    im[25] = t18;
+    re[45] = t11;
+    im[45] = t3;
+    re[65] = t17;
+    im[65] = t16;
+    re[85] = t9;
+    im[85] = t12;
+    re[105] = t7;
+    im[105] = t13;
+    re[125] = t0;
+    im[125] = t15;
+    re[145] = t4;
+    im[145] = t10;
+    t5 = X[20];
+    t8 = C21 * t5;
+    t2 = (-C22) * t5;
+    t1 = X[60];
+    t6 = C23 * t1;
+    t14 = (-C24) * t1;
+    t18 = X[59];
+    t11 = C23 * t18;
+    t3 = C24 * t18;
+    t17 = X[19];
+    t16 = C21 * t17;
+    t9 = C22 * t17;
+    t12 = t8 + t11;
+    t7 = t2 + t3;
+    t13 = t8 - t3;
+    t0 = t2 + t11;
+    t15 = t8 - t11;
+    t4 = t2 - t3;
+    t10 = t8 + t3;
+    t5 = t2 - t11;
+    t1 = t6 + t16;
+    t18 = t14 + t9;
+    t17 = t6 - t9;
+    t8 = t14 + t16;
+    t3 = t6 - t16;
+    t2 = t14 - t9;
+    t11 = t6 + t9;
+    t6 = t14 - t16;
+    t9 = t17 + t8;
+    t14 = t17 - t8;
+    t16 = C4 * t9;
+    t17 = (-C4) * t14;
+    t8 = t11 - t6;
+    t9 = t11 + t6;
+    t14 = (-C4) * t8;
+    t11 = (-C4) * t9;
+    t6 = t12 - t1;
+    t8 = t7 - t18;
+    t9 = t12 + t1;
+    t12 = t7 + t18;
+    t1 = t13 - t16;
+    t7 = t0 - t17;
+    t18 = t13 + t16;
+    t13 = t0 + t17;
+    t16 = t15 - t2;
+    t0 = t4 + t3;
+    t17 = t15 + t2;
+    t15 = t4 - t3;
+    t2 = t10 - t14;
+    t4 = t5 - t11;
+    t3 = t10 + t14;
+    t10 = t5 + t11;
+    t14 = t18 + t13;
+    t5 = C2 * t14;
+    t11 = t18 * (-C15);
+    t14 = t13 * C16;
+    t18 = t5 - t14;
+    t13 = t5 + t11;
+    t14 = t17 + t15;
+    t5 = t17 - t15;
+    t11 = C4 * t14;
+    t17 = (-C4) * t5;
+    t15 = t3 + t10;
+    t14 = C3 * t15;
+    t5 = t3 * (-C15);
+    t15 = t10 * (-C16);
+    t3 = t14 - t15;
+    t10 = t14 + t5;
+    t15 = -t6;
+    t14 = t1 + t7;
+    t5 = (-C3) * t14;
+    t6 = t1 * (-C16);
+    t14 = t7 * (-C15);
+    t1 = t5 - t14;
+    t7 = t5 + t6;
+    t14 = t16 - t0;
+    t5 = t16 + t0;
+    t6 = (-C4) * t14;
+    t16 = (-C4) * t5;
+    t0 = t2 + t4;
+    t14 = (-C2) * t0;
+    t5 = t2 * C16;
+    t0 = t4 * (-C15);
+    t2 = t14 - t0;
+    t4 = t14 + t5;
+    re[10] = t9;
+    im[10] = t12;
+    re[30] = t18;
+    im[30] = t13;
+    re[50] = t11;
+    im[50] = t17;
+    re[70] = t3;
+    im[70] = t10;
+    re[90] = t8;
+    im[90] = t15;
+    re[110] = t1;
+    im[110] = t7;
+    re[130] = t6;
+    im[130] = t16;
+    re[150] = t2;
+    im[150] = t4;
+    t0 = X[30];
+    t14 = C11 * t0;
+    t5 = (-C12) * t0;
+    t9 = X[70];
+    t12 = C9 * t9;
+    t18 = (-C10) * t9;
+    t13 = X[49];
+    t11 = C7 * t13;
+    t17 = C8 * t13;
+    t3 = X[9];
+    t10 = C5 * t3;
+    t8 = C6 * t3;
+    t15 = t14 + t11;
+    t1 = t5 + t17;
+    t7 = t14 - t17;
+    t6 = t5 + t11;
+    t16 = t14 - t11;
+    t2 = t5 - t17;
+    t4 = t14 + t17;
+    t0 = t5 - t11;
+    t9 = t12 + t10;
+    t13 = t18 + t8;
+    t3 = t12 - t8;
+    t14 = t18 + t10;
+    t17 = t12 - t10;
+    t5 = t18 - t8;
+    t11 = t12 + t8;
+    t12 = t18 - t10;
+    t8 = t3 + t14;
+    t18 = t3 - t14;
+    t10 = C4 * t8;
+    t3 = (-C4) * t18;
+    t14 = t11 - t12;
+    t8 = t11 + t12;
+    t18 = (-C4) * t14;
+    t11 = (-C4) * t8;
+    t12 = t15 - t9;
+    t14 = t1 - t13;
+    t8 = t15 + t9;
+    t15 = t1 + t13;
+    t9 = t7 - t10;
+    t1 = t6 - t3;
+    t13 = t7 + t10;
+    t7 = t6 + t3;
+    t10 = t16 - t5;
+    t6 = t2 + t17;
+    t3 = t16 + t5;
+    t16 = t2 - t17;
+    t5 = t4 - t18;
+    t2 = t0 - t11;
+    t17 = t4 + t18;
+    t4 = t0 + t11;
+    t18 = t13 + t7;
+    t0 = C17 * t18;
+    t11 = t13 * (-C18);
+    t18 = t7 * C19;
+    t13 = t0 - t18;
+    t7 = t0 + t11;
+    t18 = t3 + t16;
+    t0 = C3 * t18;
+    t11 = t3 * (-C15);
+    t18 = t16 * (-C16);
+    t3 = t0 - t18;
+    t16 = t0 + t11;
+    t18 = t17 + t4;
+    t0 = (-C1) * t18;
+    t11 = t17 * (-C14);
+    t18 = t4 * (-C13);
+    t17 = t0 - t18;
+    t4 = t0 + t11;
+    t18 = t12 - t14;
+    t0 = t12 + t14;
+    t11 = (-C4) * t18;
+    t12 = (-C4) * t0;
+    t14 = t9 + t1;
+    t18 = (-C0) * t14;
+    t0 = t9 * C14;
+    t14 = t1 * (-C13);
+    t9 = t18 - t14;
+    t1 = t18 + t0;
+    t14 = t10 + t6;
+    t18 = (-C2) * t14;
+    t0 = t10 * C15;
+    t14 = t6 * (-C16);
+    t10 = t18 - t14;
+    t6 = t18 + t0;
+    t14 = t5 + t2;
+    t18 = (-C20) * t14;
+    t0 = t5 * C18;
+    t14 = t2 * C19;
+    t5 = t18 - t14;
+    t2 = t18 + t0;
+    re[15] = t8;
+    im[15] = t15;
+    re[35] = t13;
+    im[35] = t7;
+    re[55] = t3;
+    im[55] = t16;
+    re[75] = t17;
+    im[75] = t4;
+    re[95] = t11;
+    im[95] = t12;
+    re[115] = t9;
+    im[115] = t1;
+    re[135] = t10;
+    im[135] = t6;
+    re[155] = t5;
+    im[155] = t2;
+    t14 = re[0];
+    t18 = im[0];
+    t0 = re[5];
+    t8 = im[5];
+    t15 = re[10];
+    t13 = im[10];
+    t7 = re[15];
+    t3 = im[15];
+    t16 = t14 + t15;
+    t17 = t18 + t13;
+    t4 = t0 + t7;
+    t11 = t8 + t3;
+    t12 = t14 - t15;
+    t9 = t18 - t13;
+    t1 = t0 - t7;
+    t10 = t8 - t3;
+    t6 = t16 + t4;
+    t5 = t17 + t11;
+    t2 = t12 + t10;
+    t14 = t9 - t1;
+    t15 = t16 - t4;
+    t18 = t17 - t11;
+    t13 = t12 - t10;
+    t0 = t9 + t1;
+    re[0] = t6;
+    im[0] = t5;
+    re[5] = t2;
+    im[5] = t14;
+    re[10] = t15;
+    im[10] = t18;
+    re[15] = t13;
+    im[15] = t0;
+    t7 = re[20];
+    t8 = im[20];
+    t3 = re[25];
+    t16 = im[25];
+    t4 = re[30];
+    t17 = im[30];
+    t11 = re[35];
+    t12 = im[35];
+    t10 = t7 + t4;
+    t9 = t8 + t17;
+    t1 = t3 + t11;
+    t6 = t16 + t12;
+    t5 = t7 - t4;
+    t2 = t8 - t17;
+    t14 = t3 - t11;
+    t15 = t16 - t12;
+    t18 = t10 + t1;
+    t13 = t9 + t6;
+    t0 = t5 + t15;
+    t7 = t2 - t14;
+    t4 = t10 - t1;
+    t8 = t9 - t6;
+    t17 = t5 - t15;
+    t3 = t2 + t14;
+    re[20] = t18;
+    im[20] = t13;
+    re[25] = t0;
+    im[25] = t7;
+    re[30] = t4;
+    im[30] = t8;
+    re[35] = t17;
+    im[35] = t3;
+    t11 = re[40];
+    t16 = im[40];
+    t12 = re[45];
+    t10 = im[45];
+    t1 = re[50];
+    t9 = im[50];
+    t6 = re[55];
+    t5 = im[55];
+    t15 = t11 + t1;
+    t2 = t16 + t9;
+    t14 = t12 + t6;
+    t18 = t10 + t5;
+    t13 = t11 - t1;
+    t0 = t16 - t9;
+    t7 = t12 - t6;
+    t4 = t10 - t5;
+    t8 = t15 + t14;
+    t17 = t2 + t18;
+    t3 = t13 + t4;
+    t11 = t0 - t7;
+    t1 = t15 - t14;
+    t16 = t2 - t18;
+    t9 = t13 - t4;
+    t12 = t0 + t7;
+    re[40] = t8;
+    im[40] = t17;
+    re[45] = t3;
+    im[45] = t11;
+    re[50] = t1;
+    im[50] = t16;
+    re[55] = t9;
+    im[55] = t12;
+    t6 = re[60];
+    t10 = im[60];
+    t5 = re[65];
+    t15 = im[65];
+    t14 = re[70];
+    t2 = im[70];
+    t18 = re[75];
+    t13 = im[75];
+    t4 = t6 + t14;
+    t0 = t10 + t2;
+    t7 = t5 + t18;
+    t8 = t15 + t13;
+    t17 = t6 - t14;
+    t3 = t10 - t2;
+    t11 = t5 - t18;
+    t1 = t15 - t13;
+    t16 = t4 + t7;
+    t9 = t0 + t8;
+    t12 = t17 + t1;
+    t6 = t3 - t11;
+    t14 = t4 - t7;
+    t10 = t0 - t8;
+    t2 = t17 - t1;
+    t5 = t3 + t11;
+    re[60] = t16;
+    im[60] = t9;
+    re[65] = t12;
+    im[65] = t6;
+    re[70] = t14;
+    im[70] = t10;
+    re[75] = t2;
+    im[75] = t5;
+    t18 = re[80];
+    t15 = im[80];
+    t13 = re[85];
+    t4 = im[85];
+    t7 = re[90];
+    t0 = im[90];
+    t8 = re[95];
+    t17 = im[95];
+    t1 = t18 + t7;
+    t3 = t15 + t0;
+    t11 = t13 + t8;
+    t16 = t4 + t17;
+    t9 = t18 - t7;
+    t12 = t15 - t0;
+    t6 = t13 - t8;
+    t14 = t4 - t17;
+    t10 = t1 + t11;
+    t2 = t3 + t16;
+    t5 = t9 + t14;
+    t18 = t12 - t6;
+    t7 = t1 - t11;
+    t15 = t3 - t16;
+    t0 = t9 - t14;
+    t13 = t12 + t6;
+    re[80] = t10;
+    im[80] = t2;
+    re[85] = t5;
+    im[85] = t18;
+    re[90] = t7;
+    im[90] = t15;
+    re[95] = t0;
+    im[95] = t13;
+    t8 = re[100];
+    t4 = im[100];
+    t17 = re[105];
+    t1 = im[105];
+    t11 = re[110];
+    t3 = im[110];
+    t16 = re[115];
+    t9 = im[115];
+    t14 = t8 + t11;
+    t12 = t4 + t3;
+    t6 = t17 + t16;
+    t10 = t1 + t9;
+    t2 = t8 - t11;
+    t5 = t4 - t3;
+    t18 = t17 - t16;
+    t7 = t1 - t9;
+    t15 = t14 + t6;
+    t0 = t12 + t10;
+    t13 = t2 + t7;
+    t8 = t5 - t18;
+    t11 = t14 - t6;
+    t4 = t12 - t10;
+    t3 = t2 - t7;
+    t17 = t5 + t18;
+    re[100] = t15;
+    im[100] = t0;
+    re[105] = t13;
+    im[105] = t8;
+    re[110] = t11;
+    im[110] = t4;
+    re[115] = t3;
+    im[115] = t17;
+    t16 = re[120];
+    t1 = im[120];
+    t9 = re[125];
+    t14 = im[125];
+    t6 = re[130];
+    t12 = im[130];
+    t10 = re[135];
+    t2 = im[135];
+    t7 = t16 + t6;
+    t5 = t1 + t12;
+    t18 = t9 + t10;
+    t15 = t14 + t2;
+    t0 = t16 - t6;
+    t13 = t1 - t12;
+    t8 = t9 - t10;
+    t11 = t14 - t2;
+    t4 = t7 + t18;
+    t3 = t5 + t15;
+    t17 = t0 + t11;
+    t16 = t13 - t8;
+    t6 = t7 - t18;
+    t1 = t5 - t15;
+    t12 = t0 - t11;
+    t9 = t13 + t8;
+    re[120] = t4;
+    im[120] = t3;
+    re[125] = t17;
+    im[125] = t16;
+    re[130] = t6;
+    im[130] = t1;
+    re[135] = t12;
+    im[135] = t9;
+    t10 = re[140];
+    t14 = im[140];
+    t2 = re[145];
+    t7 = im[145];
+    t18 = re[150];
+    t5 = im[150];
+    t15 = re[155];
+    t0 = im[155];
+    t11 = t10 + t18;
+    t13 = t14 + t5;
+    t8 = t2 + t15;
+    t4 = t7 + t0;
+    t3 = t10 - t18;
+    t17 = t14 - t5;
+    t16 = t2 - t15;
+    t6 = t7 - t0;
+    t1 = t11 + t8;
+    t12 = t13 + t4;
+    t9 = t3 + t6;
+    t10 = t17 - t16;
+    t18 = t11 - t8;
+    t14 = t13 - t4;
+    t5 = t3 - t6;
+    t2 = t17 + t16;
+    re[140] = t1;
+    im[140] = t12;
+    re[145] = t9;
+    im[145] = t10;
+    re[150] = t18;
+    im[150] = t14;
+    re[155] = t5;
+    im[155] = t2;
+    t15 = X[64];
+    t7 = 0.9510565162951535 * t15;
+    t0 = (-0.3090169943749474) * t15;
+    t11 = X[55];
+    t8 = 0.9624552364536473 * t11;
+    t13 = 0.27144044986507426 * t11;
+    t4 = X[15];
+    t3 = 0.996917333733128 * t4;
+    t6 = 0.07845909572784494 * t4;
+    t17 = X[24];
+    t16 = 0.9930684569549263 * t17;
+    t1 = (-0.11753739745783764) * t17;
+    t12 = t7 + t3;
+    t9 = t0 + t6;
+    t10 = t7 - t6;
+    t18 = t0 + t3;
+    t14 = t7 - t3;
+    t5 = t0 - t6;
+    t2 = t7 + t6;
+    t15 = t0 - t3;
+    t11 = -t8;
+    t4 = -t13;
+    t17 = t8 + t16;
+    t7 = t13 + t1;
+    t6 = t11 - t1;
+    t0 = t16 - t13;
+    t3 = t8 - t16;
+    t11 = t13 - t1;
+    t13 = t1 - t8;
+    t1 = t4 - t16;
+    t8 = t6 + t0;
+    t4 = t6 - t0;
+    t16 = C4 * t8;
+    t6 = (-C4) * t4;
+    t0 = t13 - t1;
+    t8 = t13 + t1;
+    t4 = (-C4) * t0;
+    t13 = (-C4) * t8;
+    t1 = t12 - t17;
+    t0 = t9 - t7;
+    t8 = t12 + t17;
+    t12 = t9 + t7;
+    t17 = t10 - t16;
+    t9 = t18 - t6;
+    t7 = t10 + t16;
+    t10 = t18 + t6;
+    t16 = t14 - t11;
+    t18 = t5 + t3;
+    t6 = t14 + t11;
+    t14 = t5 - t3;
+    t11 = t2 - t4;
+    t5 = t15 - t13;
+    t3 = t2 + t4;
+    t2 = t15 + t13;
+    re[32] = t8;
+    im[32] = t12;
+    re[52] = t7;
+    im[52] = t10;
+    re[72] = t6;
+    im[72] = t14;
+    re[92] = t3;
+    im[92] = t2;
+    re[112] = t1;
+    im[112] = t0;
+    re[132] = t17;
+    im[132] = t9;
+    re[152] = t16;
+    im[152] = t18;
+    re[12] = t11;
+    im[12] = t5;
+    t4 = X[74];
+    t15 = 0.9347481818282924 * t4;
+    t13 = (-0.3553109012804161) * t4;
+    t8 = X[45];
+    t12 = 0.974614868564045 * t8;
+    t7 = 0.22388804785849836 * t8;
+    t10 = X[5];
+    t6 = 0.9995663085020212 * t10;
+    t14 = 0.02944817324796316 * t10;
+    t3 = X[34];
+    t2 = 0.9861049757675088 * t3;
+    t1 = (-0.16612337814576547) * t3;
+    t0 = t15 + t6;
+    t17 = t13 + t14;
+    t9 = t15 - t14;
+    t16 = t13 + t6;
+    t18 = t15 - t6;
+    t11 = t13 - t14;
+    t5 = t15 + t14;
+    t4 = t13 - t6;
+    t8 = -t12;
+    t10 = -t7;
+    t3 = t12 + t2;
+    t15 = t7 + t1;
+    t14 = t8 - t1;
+    t13 = t2 - t7;
+    t6 = t12 - t2;
+    t8 = t7 - t1;
+    t7 = t1 - t12;
+    t1 = t10 - t2;
+    t12 = t14 + t13;
+    t10 = t14 - t13;
+    t2 = C4 * t12;
+    t14 = (-C4) * t10;
+    t13 = t7 - t1;
+    t12 = t7 + t1;
+    t10 = (-C4) * t13;
+    t7 = (-C4) * t12;
+    t1 = t0 - t3;
+    t13 = t17 - t15;
+    t12 = t0 + t3;
+    t0 = t17 + t15;
+    t3 = t9 - t2;
+    t17 = t16 - t14;
+    t15 = t9 + t2;
+    t9 = t16 + t14;
+    t2 = t18 - t8;
+    t16 = t11 + t6;
+    t14 = t18 + t8;
+    t18 = t11 - t6;
+    t8 = t5 - t10;
+    t11 = t4 - t7;
+    t6 = t5 + t10;
+    t5 = t4 + t7;
+    t10 = t15 + t9;
+    t4 = C0 * t10;
+    t7 = t15 * (-C13);
+    t10 = t9 * C14;
+    t15 = t4 - t10;
+    t9 = t4 + t7;
+    t10 = t14 + t18;
+    t4 = C2 * t10;
+    t7 = t14 * (-C15);
+    t10 = t18 * C16;
+    t14 = t4 - t10;
+    t18 = t4 + t7;
+    t10 = t6 + t5;
+    t4 = C17 * t10;
+    t7 = t6 * (-C18);
+    t10 = t5 * C19;
+    t6 = t4 - t10;
+    t5 = t4 + t7;
+    t10 = t1 + t13;
+    t4 = t1 - t13;
+    t7 = C4 * t10;
+    t1 = (-C4) * t4;
+    t13 = t3 + t17;
+    t10 = C20 * t13;
+    t4 = t3 * (-C18);
+    t13 = t17 * (-C19);
+    t3 = t10 - t13;
+    t17 = t10 + t4;
+    t13 = t2 + t16;
+    t10 = C3 * t13;
+    t4 = t2 * (-C15);
+    t13 = t16 * (-C16);
+    t2 = t10 - t13;
+    t16 = t10 + t4;
+    t13 = t8 + t11;
+    t10 = C1 * t13;
+    t4 = t8 * (-C13);
+    t13 = t11 * (-C14);
+    t8 = t10 - t13;
+    t11 = t10 + t4;
+    re[37] = t12;
+    im[37] = t0;
+    re[57] = t15;
+    im[57] = t9;
+    re[77] = t14;
+    im[77] = t18;
+    re[97] = t6;
+    im[97] = t5;
+    re[117] = t7;
+    im[117] = t1;
+    re[137] = t3;
+    im[137] = t17;
+    re[157] = t2;
+    im[157] = t16;
+    re[17] = t8;
+    im[17] = t11;
+    t13 = X[75];
+    t10 = 0.9312149347588036 * t13;
+    t4 = 0.36447049987914965 * t13;
+    t12 = X[35];
+    t0 = 0.9844265680898916 * t12;
+    t15 = 0.1757962799343545 * t12;
+    t9 = X[4];
+    t14 = 0.9998072404820648 * t9;
+    t18 = (-0.0196336924606283) * t9;
+    t6 = X[44];
+    t5 = 0.9767658813208724 * t6;
+    t7 = (-0.21430915306505077) * t6;
+    t1 = -t10;
+    t3 = -t4;
+    t17 = t10 + t14;
+    t2 = t4 + t18;
+    t16 = t1 - t18;
+    t8 = t14 - t4;
+    t11 = t10 - t14;
+    t13 = t4 - t18;
+    t12 = t18 - t10;
+    t9 = t3 - t14;
+    t6 = -t0;
+    t1 = -t15;
+    t4 = t0 + t5;
+    t18 = t15 + t7;
+    t10 = t6 - t7;
+    t3 = t5 - t15;
+    t14 = t0 - t5;
+    t6 = t15 - t7;
+    t15 = t7 - t0;
+    t7 = t1 - t5;
+    t0 = t10 + t3;
+    t1 = t10 - t3;
+    t5 = C4 * t0;
+    t10 = (-C4) * t1;
+    t3 = t15 - t7;
+    t0 = t15 + t7;
+    t1 = (-C4) * t3;
+    t15 = (-C4) * t0;
+    t7 = t17 - t4;
+    t3 = t2 - t18;
+    t0 = t17 + t4;
+    t17 = t2 + t18;
+    t4 = t16 - t5;
+    t2 = t8 - t10;
+    t18 = t16 + t5;
+    t16 = t8 + t10;
+    t5 = t11 - t6;
+    t8 = t13 + t14;
+    t10 = t11 + t6;
+    t11 = t13 - t14;
+    t6 = t12 - t1;
+    t13 = t9 - t15;
+    t14 = t12 + t1;
+    t12 = t9 + t15;
+    t1 = t18 + t16;
+    t9 = C2 * t1;
+    t15 = t18 * (-C15);
+    t1 = t16 * C16;
+    t18 = t9 - t1;
+    t16 = t9 + t15;
+    t1 = t10 + t11;
+    t9 = t10 - t11;
+    t15 = C4 * t1;
+    t10 = (-C4) * t9;
+    t11 = t14 + t12;
+    t1 = C3 * t11;
+    t9 = t14 * (-C15);
+    t11 = t12 * (-C16);
+    t14 = t1 - t11;
+    t12 = t1 + t9;
+    t11 = -t7;
+    t1 = t4 + t2;
+    t9 = (-C3) * t1;
+    t7 = t4 * (-C16);
+    t1 = t2 * (-C15);
+    t4 = t9 - t1;
+    t2 = t9 + t7;
+    t1 = t5 - t8;
+    t9 = t5 + t8;
+    t7 = (-C4) * t1;
+    t5 = (-C4) * t9;
+    t8 = t6 + t13;
+    t1 = (-C2) * t8;
+    t9 = t6 * C16;
+    t8 = t13 * (-C15);
+    t6 = t1 - t8;
+    t13 = t1 + t9;
+    re[42] = t0;
+    im[42] = t17;
+    re[62] = t18;
+    im[62] = t16;
+    re[82] = t15;
+    im[82] = t10;
+    re[102] = t14;
+    im[102] = t12;
+    re[122] = t3;
+    im[122] = t11;
+    re[142] = t4;
+    im[142] = t2;
+    re[2] = t7;
+    im[2] = t5;
+    re[22] = t6;
+    im[22] = t13;
+    t8 = X[65];
+    t1 = 0.9479769653775104 * t8;
+    t9 = 0.3183389280525497 * t8;
+    t0 = X[25];
+    t17 = 0.991866697787626 * t0;
+    t18 = 0.1272810033739132 * t0;
+    t16 = X[14];
+    t15 = 0.9976395492470157 * t16;
+    t10 = (-0.06866825888437376) * t16;
+    t14 = X[54];
+    t12 = 0.9650736723115474 * t14;
+    t3 = (-0.26197863846333747) * t14;
+    t11 = -t1;
+    t4 = -t9;
+    t2 = t1 + t15;
+    t7 = t9 + t10;
+    t5 = t11 - t10;
+    t6 = t15 - t9;
+    t13 = t1 - t15;
+    t8 = t9 - t10;
+    t0 = t10 - t1;
+    t16 = t4 - t15;
+    t14 = -t17;
+    t11 = -t18;
+    t9 = t17 + t12;
+    t10 = t18 + t3;
+    t1 = t14 - t3;
+    t4 = t12 - t18;
+    t15 = t17 - t12;
+    t14 = t18 - t3;
+    t18 = t3 - t17;
+    t3 = t11 - t12;
+    t17 = t1 + t4;
+    t11 = t1 - t4;
+    t12 = C4 * t17;
+    t1 = (-C4) * t11;
+    t4 = t18 - t3;
+    t17 = t18 + t3;
+    t11 = (-C4) * t4;
+    t18 = (-C4) * t17;
+    t3 = t2 - t9;
+    t4 = t7 - t10;
+    t17 = t2 + t9;
+    t2 = t7 + t10;
+    t9 = t5 - t12;
+    t7 = t6 - t1;
+    t10 = t5 + t12;
+    t5 = t6 + t1;
+    t12 = t13 - t14;
+    t6 = t8 + t15;
+    t1 = t13 + t14;
+    t13 = t8 - t15;
+    t14 = t0 - t11;
+    t8 = t16 - t18;
+    t15 = t0 + t11;
+    t0 = t16 + t18;
+    t11 = t10 + t5;
+    t16 = C17 * t11;
+    t18 = t10 * (-C18);
+    t11 = t5 * C19;
+    t10 = t16 - t11;
+    t5 = t16 + t18;
+    t11 = t1 + t13;
+    t16 = C3 * t11;
+    t18 = t1 * (-C15);
+    t11 = t13 * (-C16);
+    t1 = t16 - t11;
+    t13 = t16 + t18;
+    t11 = t15 + t0;
+    t16 = (-C1) * t11;
+    t18 = t15 * (-C14);
+    t11 = t0 * (-C13);
+    t15 = t16 - t11;
+    t0 = t16 + t18;
+    t11 = t3 - t4;
+    t16 = t3 + t4;
+    t18 = (-C4) * t11;
+    t3 = (-C4) * t16;
+    t4 = t9 + t7;
+    t11 = (-C0) * t4;
+    t16 = t9 * C14;
+    t4 = t7 * (-C13);
+    t9 = t11 - t4;
+    t7 = t11 + t16;
+    t4 = t12 + t6;
+    t11 = (-C2) * t4;
+    t16 = t12 * C15;
+    t4 = t6 * (-C16);
+    t12 = t11 - t4;
+    t6 = t11 + t16;
+    t4 = t14 + t8;
+    t11 = (-C20) * t4;
+    t16 = t14 * C18;
+    t4 = t8 * C19;
+    t14 = t11 - t4;
+    t8 = t11 + t16;
+    re[47] = t17;
+    im[47] = t2;
+    re[67] = t10;
+    im[67] = t5;
+    re[87] = t1;
+    im[87] = t13;
+    re[107] = t15;
+    im[107] = t0;
+    re[127] = t18;
+    im[127] = t3;
+    re[147] = t9;
+    im[147] = t7;
+    re[7] = t12;
+    im[7] = t6;
+    re[27] = t14;
+    im[27] = t8;
+    t4 = re[32];
+    t11 = im[32];
+    t16 = re[37];
+    t17 = im[37];
+    t2 = re[42];
+    t10 = im[42];
+    t5 = re[47];
+    t1 = im[47];
+    t13 = t4 + t2;
+    t15 = t11 + t10;
+    t0 = t16 + t5;
+    t18 = t17 + t1;
+    t3 = t4 - t2;
+    t9 = t11 - t10;
+    t7 = t16 - t5;
+    t12 = t17 - t1;
+    t6 = t13 + t0;
+    t14 = t15 + t18;
+    t8 = t3 + t12;
+    t4 = t9 - t7;
+    t2 = t13 - t0;
+    t11 = t15 - t18;
+    t10 = t3 - t12;
+    t16 = t9 + t7;
+    re[32] = t6;
+    im[32] = t14;
+    re[37] = t8;
+    im[37] = t4;
+    re[42] = t2;
+    im[42] = t11;
+    re[47] = t10;
+    im[47] = t16;
+    t5 = re[52];
+    t17 = im[52];
+    t1 = re[57];
+    t13 = im[57];
+    t0 = re[62];
+    t15 = im[62];
+    t18 = re[67];
+    t3 = im[67];
+    t12 = t5 + t0;
+    t9 = t17 + t15;
+    t7 = t1 + t18;
+    t6 = t13 + t3;
+    t14 = t5 - t0;
+    t8 = t17 - t15;
+    t4 = t1 - t18;
+    t2 = t13 - t3;
+    t11 = t12 + t7;
+    t10 = t9 + t6;
+    t16 = t14 + t2;
+    t5 = t8 - t4;
+    t0 = t12 - t7;
+    t17 = t9 - t6;
+    t15 = t14 - t2;
+    t1 = t8 + t4;
+    re[52] = t11;
+    im[52] = t10;
+    re[57] = t16;
+    im[57] = t5;
+    re[62] = t0;
+    im[62] = t17;
+    re[67] = t15;
+    im[67] = t1;
+    t18 = re[72];
+    t13 = im[72];
+    t3 = re[77];
+    t12 = im[77];
+    t7 = re[82];
+    t9 = im[82];
+    t6 = re[87];
+    t14 = im[87];
+    t2 = t18 + t7;
+    t8 = t13 + t9;
+    t4 = t3 + t6;
+    t11 = t12 + t14;
+    t10 = t18 - t7;
+    t16 = t13 - t9;
+    t5 = t3 - t6;
+    t0 = t12 - t14;
+    t17 = t2 + t4;
+    t15 = t8 + t11;
+    t1 = t10 + t0;
+    t18 = t16 - t5;
+    t7 = t2 - t4;
+    t13 = t8 - t11;
+    t9 = t10 - t0;
+    t3 = t16 + t5;
+    re[72] = t17;
+    im[72] = t15;
+    re[77] = t1;
+    im[77] = t18;
+    re[82] = t7;
+    im[82] = t13;
+    re[87] = t9;
+    im[87] = t3;
+    t6 = re[92];
+    t12 = im[92];
+    t14 = re[97];
+    t2 = im[97];
+    t4 = re[102];
+    t8 = im[102];
+    t11 = re[107];
+    t10 = im[107];
+    t0 = t6 + t4;
+    t16 = t12 + t8;
+    t5 = t14 + t11;
+    t17 = t2 + t10;
+    t15 = t6 - t4;
+    t1 = t12 - t8;
+    t18 = t14 - t11;
+    t7 = t2 - t10;
+    t13 = t0 + t5;
+    t9 = t16 + t17;
+    t3 = t15 + t7;
+    t6 = t1 - t18;
+    t4 = t0 - t5;
+    t12 = t16 - t17;
+    t8 = t15 - t7;
+    t14 = t1 + t18;
+    re[92] = t13;
+    im[92] = t9;
+    re[97] = t3;
+    im[97] = t6;
+    re[102] = t4;
+    im[102] = t12;
+    re[107] = t8;
+    im[107] = t14;
+    t11 = re[112];
+    t2 = im[112];
+    t10 = re[117];
+    t0 = im[117];
+    t5 = re[122];
+    t16 = im[122];
+    t17 = re[127];
+    t15 = im[127];
+    t7 = t11 + t5;
+    t1 = t2 + t16;
+    t18 = t10 + t17;
+    t13 = t0 + t15;
+    t9 = t11 - t5;
+    t3 = t2 - t16;
+    t6 = t10 - t17;
+    t4 = t0 - t15;
+    t12 = t7 + t18;
+    t8 = t1 + t13;
+    t14 = t9 + t4;
+    t11 = t3 - t6;
+    t5 = t7 - t18;
+    t2 = t1 - t13;
+    t16 = t9 - t4;
+    t10 = t3 + t6;
+    re[112] = t12;
+    im[112] = t8;
+    re[117] = t14;
+    im[117] = t11;
+    re[122] = t5;
+    im[122] = t2;
+    re[127] = t16;
+    im[127] = t10;
+    t17 = re[132];
+    t0 = im[132];
+    t15 = re[137];
+    t7 = im[137];
+    t18 = re[142];
+    t1 = im[142];
+    t13 = re[147];
+    t9 = im[147];
+    t4 = t17 + t18;
+    t3 = t0 + t1;
+    t6 = t15 + t13;
+    t12 = t7 + t9;
+    t8 = t17 - t18;
+    t14 = t0 - t1;
+    t11 = t15 - t13;
+    t5 = t7 - t9;
+    t2 = t4 + t6;
+    t16 = t3 + t12;
+    t10 = t8 + t5;
+    t17 = t14 - t11;
+    t18 = t4 - t6;
+    t0 = t3 - t12;
+    t1 = t8 - t5;
+    t15 = t14 + t11;
+    re[132] = t2;
+    im[132] = t16;
+    re[137] = t10;
+    im[137] = t17;
+    re[142] = t18;
+    im[142] = t0;
+    re[147] = t1;
+    im[147] = t15;
+    t13 = re[152];
+    t7 = im[152];
+    t9 = re[157];
+    t4 = im[157];
+    t6 = re[2];
+    t3 = im[2];
+    t12 = re[7];
+    t8 = im[7];
+    t5 = t13 + t6;
+    t14 = t7 + t3;
+    t11 = t9 + t12;
+    t2 = t4 + t8;
+    t16 = t13 - t6;
+    t10 = t7 - t3;
+    t17 = t9 - t12;
+    t18 = t4 - t8;
+    t0 = t5 + t11;
+    t1 = t14 + t2;
+    t15 = t16 + t18;
+    t13 = t10 - t17;
+    t6 = t5 - t11;
+    t7 = t14 - t2;
+    t3 = t16 - t18;
+    t9 = t10 + t17;
+    re[152] = t0;
+    im[152] = t1;
+    re[157] = t15;
+    im[157] = t13;
+    re[2] = t6;
+    im[2] = t7;
+    re[7] = t3;
+    im[7] = t9;
+    t12 = re[12];
+    t4 = im[12];
+    t8 = re[17];
+    t5 = im[17];
+    t11 = re[22];
+    t14 = im[22];
+    t2 = re[27];
+    t16 = im[27];
+    t18 = t12 + t11;
+    t10 = t4 + t14;
+    t17 = t8 + t2;
+    t0 = t5 + t16;
+    t1 = t12 - t11;
+    t15 = t4 - t14;
+    t13 = t8 - t2;
+    t6 = t5 - t16;
+    t7 = t18 + t17;
+    t3 = t10 + t0;
+    t9 = t1 + t6;
+    t12 = t15 - t13;
+    t11 = t18 - t17;
+    t4 = t10 - t0;
+    t14 = t1 - t6;
+    t8 = t15 + t13;
+    re[12] = t7;
+    im[12] = t3;
+    re[17] = t9;
+    im[17] = t12;
+    re[22] = t11;
+    im[22] = t4;
+    re[27] = t14;
+    im[27] = t8;
+    t2 = X[71];
+    t5 = 0.9381913359224842 * t2;
+    t16 = 0.34611705707749296 * t2;
+    t18 = X[31];
+    t17 = 0.9876883405951378 * t18;
+    t10 = 0.15643446504023087 * t18;
+    t0 = X[8];
+    t1 = 0.9992290362407229 * t0;
+    t6 = (-0.03925981575906861) * t0;
+    t15 = X[48];
+    t13 = 0.9723699203976766 * t15;
+    t7 = (-0.2334453638559054) * t15;
+    t3 = -t17;
+    t9 = -t10;
+    t12 = t17 + t13;
+    t11 = t10 + t7;
+    t4 = t3 - t7;
+    t14 = t13 - t10;
+    t8 = t17 - t13;
+    t2 = t10 - t7;
+    t18 = t7 - t17;
+    t0 = t9 - t13;
+    t15 = -t1;
+    t3 = -t6;
+    t10 = t1 + t5;
+    t7 = t6 + t16;
+    t17 = t16 - t1;
+    t9 = t3 - t5;
+    t13 = t1 - t5;
+    t3 = t6 - t16;
+    t1 = t15 - t16;
+    t15 = t5 - t6;
+    t16 = t17 + t9;
+    t5 = t17 - t9;
+    t6 = C4 * t16;
+    t17 = (-C4) * t5;
+    t9 = t1 - t15;
+    t16 = t1 + t15;
+    t5 = (-C4) * t9;
+    t1 = (-C4) * t16;
+    t15 = t12 - t10;
+    t9 = t11 - t7;
+    t16 = t12 + t10;
+    t12 = t11 + t7;
+    t10 = t4 - t6;
+    t11 = t14 - t17;
+    t7 = t4 + t6;
+    t4 = t14 + t17;
+    t6 = t8 - t3;
+    t14 = t2 + t13;
+    t17 = t8 + t3;
+    t8 = t2 - t13;
+    t3 = t18 - t5;
+    t2 = t0 - t1;
+    t13 = t18 + t5;
+    t18 = t0 + t1;
+    re[64] = t16;
+    im[64] = t12;
+    re[84] = t7;
+    im[84] = t4;
+    re[104] = t17;
+    im[104] = t8;
+    re[124] = t13;
+    im[124] = t18;
+    re[144] = t15;
+    im[144] = t9;
+    re[4] = t10;
+    im[4] = t11;
+    re[24] = t6;
+    im[24] = t14;
+    re[44] = t3;
+    im[44] = t2;
+    t5 = X[61];
+    t0 = 0.9540444024062804 * t5;
+    t1 = 0.2996652769962566 * t5;
+    t16 = X[21];
+    t12 = 0.9941745021174282 * t16;
+    t7 = 0.10778246304275935 * t16;
+    t4 = X[18];
+    t17 = 0.9960990332516871 * t4;
+    t8 = (-0.08824237052036951) * t4;
+    t13 = X[58];
+    t18 = 0.9597440371568574 * t13;
+    t15 = (-0.2808760992712921) * t13;
+    t9 = -t12;
+    t10 = -t7;
+    t11 = t12 + t18;
+    t6 = t7 + t15;
+    t14 = t9 - t15;
+    t3 = t18 - t7;
+    t2 = t12 - t18;
+    t5 = t7 - t15;
+    t16 = t15 - t12;
+    t4 = t10 - t18;
+    t13 = -t17;
+    t9 = -t8;
+    t7 = t17 + t0;
+    t15 = t8 + t1;
+    t12 = t1 - t17;
+    t10 = t9 - t0;
+    t18 = t17 - t0;
+    t9 = t8 - t1;
+    t17 = t13 - t1;
+    t13 = t0 - t8;
+    t1 = t12 + t10;
+    t0 = t12 - t10;
+    t8 = C4 * t1;
+    t12 = (-C4) * t0;
+    t10 = t17 - t13;
+    t1 = t17 + t13;
+    t0 = (-C4) * t10;
+    t17 = (-C4) * t1;
+    t13 = t11 - t7;
+    t10 = t6 - t15;
+    t1 = t11 + t7;
+    t11 = t6 + t15;
+    t7 = t14 - t8;
+    t6 = t3 - t12;
+    t15 = t14 + t8;
+    t14 = t3 + t12;
+    t8 = t2 - t9;
+    t3 = t5 + t18;
+    t12 = t2 + t9;
+    t2 = t5 - t18;
+    t9 = t16 - t0;
+    t5 = t4 - t17;
+    t18 = t16 + t0;
+    t16 = t4 + t17;
+    t0 = t15 + t14;
+    t4 = C0 * t0;
+    t17 = t15 * (-C13);
+    t0 = t14 * C14;
+    t15 = t4 - t0;
+    t14 = t4 + t17;
+    t0 = t12 + t2;
+    t4 = C2 * t0;
+    t17 = t12 * (-C15);
+    t0 = t2 * C16;
+    t12 = t4 - t0;
+    t2 = t4 + t17;
+    t0 = t18 + t16;
+    t4 = C17 * t0;
+    t17 = t18 * (-C18);
+    t0 = t16 * C19;
+    t18 = t4 - t0;
+    t16 = t4 + t17;
+    t0 = t13 + t10;
+    t4 = t13 - t10;
+    t17 = C4 * t0;
+    t13 = (-C4) * t4;
+    t10 = t7 + t6;
+    t0 = C20 * t10;
+    t4 = t7 * (-C18);
+    t10 = t6 * (-C19);
+    t7 = t0 - t10;
+    t6 = t0 + t4;
+    t10 = t8 + t3;
+    t0 = C3 * t10;
+    t4 = t8 * (-C15);
+    t10 = t3 * (-C16);
+    t8 = t0 - t10;
+    t3 = t0 + t4;
+    t10 = t9 + t5;
+    t0 = C1 * t10;
+    t4 = t9 * (-C13);
+    t10 = t5 * (-C14);
+    t9 = t0 - t10;
+    t5 = t0 + t4;
+    re[69] = t1;
+    im[69] = t11;
+    re[89] = t15;
+    im[89] = t14;
+    re[109] = t12;
+    im[109] = t2;
+    re[129] = t18;
+    im[129] = t16;
+    re[149] = t17;
+    im[149] = t13;
+    re[9] = t7;
+    im[9] = t6;
+    re[29] = t8;
+    im[29] = t3;
+    re[49] = t9;
+    im[49] = t5;
+    t10 = X[51];
+    t0 = 0.9675990923602598 * t10;
+    t4 = 0.25249157701515795 * t10;
+    t1 = X[11];
+    t11 = 0.9982656101847159 * t1;
+    t15 = 0.05887080365118903 * t1;
+    t14 = X[28];
+    t12 = 0.9905693404435773 * t14;
+    t2 = (-0.13701234168196802) * t14;
+    t18 = X[68];
+    t16 = 0.944806046466878 * t18;
+    t17 = (-0.3276301795616935) * t18;
+    t13 = -t11;
+    t7 = -t15;
+    t6 = t11 + t16;
+    t8 = t15 + t17;
+    t3 = t13 - t17;
+    t9 = t16 - t15;
+    t5 = t11 - t16;
+    t10 = t15 - t17;
+    t1 = t17 - t11;
+    t14 = t7 - t16;
+    t18 = -t12;
+    t13 = -t2;
+    t15 = t12 + t0;
+    t17 = t2 + t4;
+    t11 = t4 - t12;
+    t7 = t13 - t0;
+    t16 = t12 - t0;
+    t13 = t2 - t4;
+    t12 = t18 - t4;
+    t18 = t0 - t2;
+    t4 = t11 + t7;
+    t0 = t11 - t7;
+    t2 = C4 * t4;
+    t11 = (-C4) * t0;
+    t7 = t12 - t18;
+    t4 = t12 + t18;
+    t0 = (-C4) * t7;
+    t12 = (-C4) * t4;
+    t18 = t6 - t15;
+    t7 = t8 - t17;
+    t4 = t6 + t15;
+    t6 = t8 + t17;
+    t15 = t3 - t2;
+    t8 = t9 - t11;
+    t17 = t3 + t2;
+    t3 = t9 + t11;
+    t2 = t5 - t13;
+    t9 = t10 + t16;
+    t11 = t5 + t13;
+    t5 = t10 - t16;
+    t13 = t1 - t0;
+    t10 = t14 - t12;
+    t16 = t1 + t0;
+    t1 = t14 + t12;
+    t0 = t17 + t3;
+    t14 = C2 * t0;
+    t12 = t17 * (-C15);
+    t0 = t3 * C16;
+    t17 = t14 - t0;
+    t3 = t14 + t12;
+    t0 = t11 + t5;
+    t14 = t11 - t5;
+    t12 = C4 * t0;
+    t11 = (-C4) * t14;
+    t5 = t16 + t1;
+    t0 = C3 * t5;
+    t14 = t16 * (-C15);
+    t5 = t1 * (-C16);
+    t16 = t0 - t5;
+    t1 = t0 + t14;
+    t5 = -t18;
+    t0 = t15 + t8;
+    t14 = (-C3) * t0;
+    t18 = t15 * (-C16);
+    t0 = t8 * (-C15);
+    t15 = t14 - t0;
+    t8 = t14 + t18;
+    t0 = t2 - t9;
+    t14 = t2 + t9;
+    t18 = (-C4) * t0;
+    t2 = (-C4) * t14;
+    t9 = t13 + t10;
+    t0 = (-C2) * t9;
+    t14 = t13 * C16;
+    t9 = t10 * (-C15);
+    t13 = t0 - t9;
+    t10 = t0 + t14;
+    re[74] = t4;
+    im[74] = t6;
+    re[94] = t17;
+    im[94] = t3;
+    re[114] = t12;
+    im[114] = t11;
+    re[134] = t16;
+    im[134] = t1;
+    re[154] = t7;
+    im[154] = t5;
+    re[14] = t15;
+    im[14] = t8;
+    re[34] = t18;
+    im[34] = t2;
+    re[54] = t13;
+    im[54] = t10;
+    t9 = X[41];
+    t0 = 0.9788227513490724 * t9;
+    t14 = 0.2047096027093796 * t9;
+    t4 = X[1];
+    t6 = 0.999951808959328 * t4;
+    t17 = 0.009817319337149617 * t4;
+    t3 = X[38];
+    t12 = 0.9826532793307118 * t3;
+    t11 = (-0.18545223811159092) * t3;
+    t16 = X[78];
+    t1 = 0.927591935255724 * t16;
+    t7 = (-0.37359497005251635) * t16;
+    t5 = -t6;
+    t15 = -t17;
+    t8 = t6 + t1;
+    t18 = t17 + t7;
+    t2 = t5 - t7;
+    t13 = t1 - t17;
+    t10 = t6 - t1;
+    t9 = t17 - t7;
+    t4 = t7 - t6;
+    t3 = t15 - t1;
+    t16 = -t12;
+    t5 = -t11;
+    t17 = t12 + t0;
+    t7 = t11 + t14;
+    t6 = t14 - t12;
+    t15 = t5 - t0;
+    t1 = t12 - t0;
+    t5 = t11 - t14;
+    t12 = t16 - t14;
+    t16 = t0 - t11;
+    t14 = t6 + t15;
+    t0 = t6 - t15;
+    t11 = C4 * t14;
+    t6 = (-C4) * t0;
+    t15 = t12 - t16;
+    t14 = t12 + t16;
+    t0 = (-C4) * t15;
+    t12 = (-C4) * t14;
+    t16 = t8 - t17;
+    t15 = t18 - t7;
+    t14 = t8 + t17;
+    t8 = t18 + t7;
+    t17 = t2 - t11;
+    t18 = t13 - t6;
+    t7 = t2 + t11;
+    t2 = t13 + t6;
+    t11 = t10 - t5;
+    t13 = t9 + t1;
+    t6 = t10 + t5;
+    t10 = t9 - t1;
+    t5 = t4 - t0;
+    t9 = t3 - t12;
+    t1 = t4 + t0;
+    t4 = t3 + t12;
+    t0 = t7 + t2;
+    t3 = C17 * t0;
+    t12 = t7 * (-C18);
+    t0 = t2 * C19;
+    t7 = t3 - t0;
+    t2 = t3 + t12;
+    t0 = t6 + t10;
+    t3 = C3 * t0;
+    t12 = t6 * (-C15);
+    t0 = t10 * (-C16);
+    t6 = t3 - t0;
+    t10 = t3 + t12;
+    t0 = t1 + t4;
+    t3 = (-C1) * t0;
+    t12 = t1 * (-C14);
+    t0 = t4 * (-C13);
+    t1 = t3 - t0;
+    t4 = t3 + t12;
+    t0 = t16 - t15;
+    t3 = t16 + t15;
+    t12 = (-C4) * t0;
+    t16 = (-C4) * t3;
+    t15 = t17 + t18;
+    t0 = (-C0) * t15;
+    t3 = t17 * C14;
+    t15 = t18 * (-C13);
+    t17 = t0 - t15;
+    t18 = t0 + t3;
+    t15 = t11 + t13;
+    t0 = (-C2) * t15;
+    t3 = t11 * C15;
+    t15 = t13 * (-C16);
+    t11 = t0 - t15;
+    t13 = t0 + t3;
+    t15 = t5 + t9;
+    t0 = (-C20) * t15;
+    t3 = t5 * C18;
+    t15 = t9 * C19;
+    t5 = t0 - t15;
+    t9 = t0 + t3;
+    re[79] = t14;
+    im[79] = t8;
+    re[99] = t7;
+    im[99] = t2;
+    re[119] = t6;
+    im[119] = t10;
+    re[139] = t1;
+    im[139] = t4;
+    re[159] = t12;
+    im[159] = t16;
+    re[19] = t17;
+    im[19] = t18;
+    re[39] = t11;
+    im[39] = t13;
+    re[59] = t5;
+    im[59] = t9;
+    t15 = re[64];
+    t0 = im[64];
+    t3 = re[69];
+    t14 = im[69];
+    t8 = re[74];
+    t7 = im[74];
+    t2 = re[79];
+    t6 = im[79];
+    t10 = t15 + t8;
+    t1 = t0 + t7;
+    t4 = t3 + t2;
+    t12 = t14 + t6;
+    t16 = t15 - t8;
+    t17 = t0 - t7;
+    t18 = t3 - t2;
+    t11 = t14 - t6;
+    t13 = t10 + t4;
+    t5 = t1 + t12;
+    t9 = t16 + t11;
+    t15 = t17 - t18;
+    t8 = t10 - t4;
+    t0 = t1 - t12;
+    t7 = t16 - t11;
+    t3 = t17 + t18;
+    re[64] = t13;
+    im[64] = t5;
+    re[69] = t9;
+    im[69] = t15;
+    re[74] = t8;
+    im[74] = t0;
+    re[79] = t7;
+    im[79] = t3;
+    t2 = re[84];
+    t14 = im[84];
+    t6 = re[89];
+    t10 = im[89];
+    t4 = re[94];
+    t1 = im[94];
+    t12 = re[99];
+    t16 = im[99];
+    t11 = t2 + t4;
+    t17 = t14 + t1;
+    t18 = t6 + t12;
+    t13 = t10 + t16;
+    t5 = t2 - t4;
+    t9 = t14 - t1;
+    t15 = t6 - t12;
+    t8 = t10 - t16;
+    t0 = t11 + t18;
+    t7 = t17 + t13;
+    t3 = t5 + t8;
+    t2 = t9 - t15;
+    t4 = t11 - t18;
+    t14 = t17 - t13;
+    t1 = t5 - t8;
+    t6 = t9 + t15;
+    re[84] = t0;
+    im[84] = t7;
+    re[89] = t3;
+    im[89] = t2;
+    re[94] = t4;
+    im[94] = t14;
+    re[99] = t1;
+    im[99] = t6;
+    t12 = re[104];
+    t10 = im[104];
+    t16 = re[109];
+    t11 = im[109];
+    t18 = re[114];
+    t17 = im[114];
+    t13 = re[119];
+    t5 = im[119];
+    t8 = t12 + t18;
+    t9 = t10 + t17;
+    t15 = t16 + t13;
+    t0 = t11 + t5;
+    t7 = t12 - t18;
+    t3 = t10 - t17;
+    t2 = t16 - t13;
+    t4 = t11 - t5;
+    t14 = t8 + t15;
+    t1 = t9 + t0;
+    t6 = t7 + t4;
+    t12 = t3 - t2;
+    t18 = t8 - t15;
+    t10 = t9 - t0;
+    t17 = t7 - t4;
+    t16 = t3 + t2;
+    re[104] = t14;
+    im[104] = t1;
+    re[109] = t6;
+    im[109] = t12;
+    re[114] = t18;
+    im[114] = t10;
+    re[119] = t17;
+    im[119] = t16;
+    t13 = re[124];
+    t11 = im[124];
+    t5 = re[129];
+    t8 = im[129];
+    t15 = re[134];
+    t9 = im[134];
+    t0 = re[139];
+    t7 = im[139];
+    t4 = t13 + t15;
+    t3 = t11 + t9;
+    t2 = t5 + t0;
+    t14 = t8 + t7;
+    t1 = t13 - t15;
+    t6 = t11 - t9;
+    t12 = t5 - t0;
+    t18 = t8 - t7;
+    t10 = t4 + t2;
+    t17 = t3 + t14;
+    t16 = t1 + t18;
+    t13 = t6 - t12;
+    t15 = t4 - t2;
+    t11 = t3 - t14;
+    t9 = t1 - t18;
+    t5 = t6 + t12;
+    re[124] = t10;
+    im[124] = t17;
+    re[129] = t16;
+    im[129] = t13;
+    re[134] = t15;
+    im[134] = t11;
+    re[139] = t9;
+    im[139] = t5;
+    t0 = re[144];
+    t8 = im[144];
+    t7 = re[149];
+    t4 = im[149];
+    t2 = re[154];
+    t3 = im[154];
+    t14 = re[159];
+    t1 = im[159];
+    t18 = t0 + t2;
+    t6 = t8 + t3;
+    t12 = t7 + t14;
+    t10 = t4 + t1;
+    t17 = t0 - t2;
+    t16 = t8 - t3;
+    t13 = t7 - t14;
+    t15 = t4 - t1;
+    t11 = t18 + t12;
+    t9 = t6 + t10;
+    t5 = t17 + t15;
+    t0 = t16 - t13;
+    t2 = t18 - t12;
+    t8 = t6 - t10;
+    t3 = t17 - t15;
+    t7 = t16 + t13;
+    re[144] = t11;
+    im[144] = t9;
+    re[149] = t5;
+    im[149] = t0;
+    re[154] = t2;
+    im[154] = t8;
+    re[159] = t3;
+    im[159] = t7;
+    t14 = re[4];
+    t4 = im[4];
+    t1 = re[9];
+    t18 = im[9];
+    t12 = re[14];
+    t6 = im[14];
+    t10 = re[19];
+    t17 = im[19];
+    t15 = t14 + t12;
+    t16 = t4 + t6;
+    t13 = t1 + t10;
+    t11 = t18 + t17;
+    t9 = t14 - t12;
+    t5 = t4 - t6;
+    t0 = t1 - t10;
+    t2 = t18 - t17;
+    t8 = t15 + t13;
+    t3 = t16 + t11;
+    t7 = t9 + t2;
+    t14 = t5 - t0;
+    t12 = t15 - t13;
+    t4 = t16 - t11;
+    t6 = t9 - t2;
+    t1 = t5 + t0;
+    re[4] = t8;
+    im[4] = t3;
+    re[9] = t7;
+    im[9] = t14;
+    re[14] = t12;
+    im[14] = t4;
+    re[19] = t6;
+    im[19] = t1;
+    t10 = re[24];
+    t18 = im[24];
+    t17 = re[29];
+    t15 = im[29];
+    t13 = re[34];
+    t16 = im[34];
+    t11 = re[39];
+    t9 = im[39];
+    t2 = t10 + t13;
+    t5 = t18 + t16;
+    t0 = t17 + t11;
+    t8 = t15 + t9;
+    t3 = t10 - t13;
+    t7 = t18 - t16;
+    t14 = t17 - t11;
+    t12 = t15 - t9;
+    t4 = t2 + t0;
+    t6 = t5 + t8;
+    t1 = t3 + t12;
+    t10 = t7 - t14;
+    t13 = t2 - t0;
+    t18 = t5 - t8;
+    t16 = t3 - t12;
+    t17 = t7 + t14;
+    re[24] = t4;
+    im[24] = t6;
+    re[29] = t1;
+    im[29] = t10;
+    re[34] = t13;
+    im[34] = t18;
+    re[39] = t16;
+    im[39] = t17;
+    t11 = re[44];
+    t15 = im[44];
+    t9 = re[49];
+    t2 = im[49];
+    t0 = re[54];
+    t5 = im[54];
+    t8 = re[59];
+    t3 = im[59];
+    t12 = t11 + t0;
+    t7 = t15 + t5;
+    t14 = t9 + t8;
+    t4 = t2 + t3;
+    t6 = t11 - t0;
+    t1 = t15 - t5;
+    t10 = t9 - t8;
+    t13 = t2 - t3;
+    t18 = t12 + t14;
+    t16 = t7 + t4;
+    t17 = t6 + t13;
+    t11 = t1 - t10;
+    t0 = t12 - t14;
+    t15 = t7 - t4;
+    t5 = t6 - t13;
+    t9 = t1 + t10;
+    re[44] = t18;
+    im[44] = t16;
+    re[49] = t17;
+    im[49] = t11;
+    re[54] = t0;
+    im[54] = t15;
+    re[59] = t5;
+    im[59] = t9;
+}
+
+/**
+ *  Part 2 of ApplyWindowedIMDCT_W10_320_K80().
+ * 
+ *  @param {Number[]} X 
+ *    - The input block (320 points, only the first 80 points are used).
+ *  @param {Number[]} y 
+ *    - The array that would contain the output block (640 points).
+ *  @param {Number[]} re 
+ *    - The scratch buffer (real part, 160 points).
+ *  @param {Number[]} im 
+ *    - The scratch buffer (imaginary part, 160 points).
+ */
+function ApplyWindowedIMDCT_W10_320_K80_Part2(X, y, re, im) {
+    let t0, t1, t10, t11, t12, t13, t14, t15, t16, t17, t18, t2, t3, t4, t5, t6, t7, t8, t9;
+    const C0 = 0.7071067811865476;
+    const C1 = 0.9807852804032304;
+    const C2 = 1.1758756024193586;
+    const C3 = 0.7856949583871022;
+    const C4 = 0.9238795325112867;
+    const C5 = 1.3065629648763766;
+    const C6 = 0.5411961001461969;
+    const C7 = 0.8314696123025452;
+    const C8 = 1.3870398453221475;
+    const C9 = 0.27589937928294306;
+    const C10 = 0.5555702330196022;
+    const C11 = 0.3826834323650898;
+    const C12 = 0.19509032201612825;
+    const C13 = 0.9510565162951535;
+    const C14 = 0.5590169943749475;
+    const C15 = 0.25;
+    const C16 = 0.5877852522924731;
+    const C17 = 0.9999969880372782;
+    const C18 = 0.0024543667964602917;
+    const C19 = 0.5857978574564389;
+    const C20 = 0.8104571982525948;
+    const C21 = 0.9502952106978444;
+    const C22 = 0.311350305162432;
+    const C23 = 0.3066818220921279;
+    const C24 = 0.9518120927989161;
+    const C25 = 0.8075719170392435;
+    const C26 = 0.5897691063539708;
+    const C27 = 0.8017430476558816;
+    const C28 = 0.5976688761642678;
+    const C29 = 0.9999247018391445;
+    const C30 = 0.012271538285719925;
+    const C31 = 0.5778131101237274;
+    const C32 = 0.8161691061104588;
+    const C33 = 0.9471927896111967;
+    const C34 = 0.3206646524151973;
+    const C35 = 0.2973227995119985;
+    const C36 = 0.9547770173660172;
+    const C37 = 0.28793512034162105;
+    const C38 = 0.9576499185369652;
+    const C39 = 0.7958369046088836;
+    const C40 = 0.6055110414043255;
+    const C41 = 0.9997560408170603;
+    const C42 = 0.02208752701857829;
+    const C43 = 0.5697726719608341;
+    const C44 = 0.8218023498911473;
+    const C45 = 0.9439990761120522;
+    const C46 = 0.32994809334134934;
+    const C47 = 0.9407143780171653;
+    const C48 = 0.33919973318352975;
+    const C49 = 0.27851968938505306;
+    const C50 = 0.9604305194155658;
+    const C51 = 0.789854057144609;
+    const C52 = 0.6132948462299359;
+    const C53 = 0.9994910212269259;
+    const C54 = 0.03190138690961086;
+    const C55 = 0.5616773179219247;
+    const C56 = 0.8273563866508998;
+    const C57 = 0.55352782825407;
+    const C58 = 0.8328306810800937;
+    const C59 = 0.937339011912575;
+    const C60 = 0.34841868024943456;
+    const C61 = 0.2690774141211269;
+    const C62 = 0.9631185520017188;
+    const C63 = 0.7837950819023488;
+    const C64 = 0.6210195404217892;
+    const C65 = 0.9991296686118811;
+    const C66 = 0.041712172078575326;
+    t8 = X[47];
+    t2 = 0.9723699203976766 * t8;
+    t3 = 0.2334453638559054 * t8;
+    t12 = X[7];
+    t14 = 0.9992290362407229 * t12;
+    t7 = 0.03925981575906861 * t12;
+    t4 = X[32];
+    t6 = 0.9876883405951378 * t4;
+    t13 = (-0.15643446504023087) * t4;
+    t1 = X[72];
+    t10 = 0.9381913359224842 * t1;
+    t18 = (-0.34611705707749296) * t1;
+    t16 = -t6;
+    t17 = -t13;
+    t11 = t6 + t2;
+    t0 = t13 + t3;
+    t15 = t3 - t6;
+    t5 = t17 - t2;
+    t9 = t6 - t2;
+    t8 = t13 - t3;
+    t12 = t16 - t3;
+    t4 = t2 - t13;
+    t1 = -t10;
+    t17 = -t18;
+    t6 = t10 + t14;
+    t16 = t18 + t7;
+    t3 = t7 - t10;
+    t2 = t17 - t14;
+    t13 = t10 - t14;
+    t17 = t18 - t7;
+    t10 = t1 - t7;
+    t1 = t14 - t18;
+    t7 = t3 + t2;
+    t14 = t3 - t2;
+    t18 = C0 * t7;
+    t3 = (-C0) * t14;
+    t2 = t10 - t1;
+    t7 = t10 + t1;
+    t14 = (-C0) * t2;
+    t10 = (-C0) * t7;
+    t1 = t11 - t6;
+    t2 = t0 - t16;
+    t7 = t11 + t6;
+    t11 = t0 + t16;
+    t6 = t15 - t18;
+    t0 = t5 - t3;
+    t16 = t15 + t18;
+    t15 = t5 + t3;
+    t18 = t9 - t17;
+    t5 = t8 + t13;
+    t3 = t9 + t17;
+    t9 = t8 - t13;
+    t17 = t12 - t14;
+    t8 = t4 - t10;
+    t13 = t12 + t14;
+    t12 = t4 + t10;
+    re[96] = t7;
+    im[96] = t11;
+    re[116] = t16;
+    im[116] = t15;
+    re[136] = t3;
+    im[136] = t9;
+    re[156] = t13;
+    im[156] = t12;
+    re[16] = t1;
+    im[16] = t2;
+    re[36] = t6;
+    im[36] = t0;
+    re[56] = t18;
+    im[56] = t5;
+    re[76] = t17;
+    im[76] = t8;
+    t14 = X[77];
+    t4 = 0.927591935255724 * t14;
+    t10 = 0.37359497005251635 * t14;
+    t7 = X[37];
+    t11 = 0.9826532793307118 * t7;
+    t16 = 0.18545223811159092 * t7;
+    t15 = X[2];
+    t3 = 0.999951808959328 * t15;
+    t9 = (-0.009817319337149617) * t15;
+    t13 = X[42];
+    t12 = 0.9788227513490724 * t13;
+    t1 = (-0.2047096027093796) * t13;
+    t2 = -t12;
+    t6 = -t1;
+    t0 = t12 + t11;
+    t18 = t1 + t16;
+    t5 = t16 - t12;
+    t17 = t6 - t11;
+    t8 = t12 - t11;
+    t14 = t1 - t16;
+    t7 = t2 - t16;
+    t15 = t11 - t1;
+    t13 = t4 + t3;
+    t6 = t10 + t9;
+    t12 = t4 + t9;
+    t2 = t10 - t3;
+    t16 = t4 - t3;
+    t11 = t10 - t9;
+    t1 = t4 - t9;
+    t4 = t10 + t3;
+    t9 = t12 + t2;
+    t10 = t12 - t2;
+    t3 = C0 * t9;
+    t12 = (-C0) * t10;
+    t2 = t1 - t4;
+    t9 = t1 + t4;
+    t10 = (-C0) * t2;
+    t1 = (-C0) * t9;
+    t4 = t0 - t13;
+    t2 = t18 - t6;
+    t9 = t0 + t13;
+    t0 = t18 + t6;
+    t13 = t5 - t3;
+    t18 = t17 - t12;
+    t6 = t5 + t3;
+    t5 = t17 + t12;
+    t3 = t8 - t11;
+    t17 = t14 + t16;
+    t12 = t8 + t11;
+    t8 = t14 - t16;
+    t11 = t7 - t10;
+    t14 = t15 - t1;
+    t16 = t7 + t10;
+    t7 = t15 + t1;
+    t10 = t6 + t5;
+    t15 = C1 * t10;
+    t1 = t6 * (-C2);
+    t10 = t5 * C3;
+    t6 = t15 - t10;
+    t5 = t15 + t1;
+    t10 = t12 + t8;
+    t15 = C4 * t10;
+    t1 = t12 * (-C5);
+    t10 = t8 * C6;
+    t12 = t15 - t10;
+    t8 = t15 + t1;
+    t10 = t16 + t7;
+    t15 = C7 * t10;
+    t1 = t16 * (-C8);
+    t10 = t7 * C9;
+    t16 = t15 - t10;
+    t7 = t15 + t1;
+    t10 = t4 + t2;
+    t15 = t4 - t2;
+    t1 = C0 * t10;
+    t4 = (-C0) * t15;
+    t2 = t13 + t18;
+    t10 = C10 * t2;
+    t15 = t13 * (-C8);
+    t2 = t18 * (-C9);
+    t13 = t10 - t2;
+    t18 = t10 + t15;
+    t2 = t3 + t17;
+    t10 = C11 * t2;
+    t15 = t3 * (-C5);
+    t2 = t17 * (-C6);
+    t3 = t10 - t2;
+    t17 = t10 + t15;
+    t2 = t11 + t14;
+    t10 = C12 * t2;
+    t15 = t11 * (-C2);
+    t2 = t14 * (-C3);
+    t11 = t10 - t2;
+    t14 = t10 + t15;
+    re[101] = t9;
+    im[101] = t0;
+    re[121] = t6;
+    im[121] = t5;
+    re[141] = t12;
+    im[141] = t8;
+    re[1] = t16;
+    im[1] = t7;
+    re[21] = t1;
+    im[21] = t4;
+    re[41] = t13;
+    im[41] = t18;
+    re[61] = t3;
+    im[61] = t17;
+    re[81] = t11;
+    im[81] = t14;
+    t2 = X[67];
+    t10 = 0.944806046466878 * t2;
+    t15 = 0.3276301795616935 * t2;
+    t9 = X[27];
+    t0 = 0.9905693404435773 * t9;
+    t6 = 0.13701234168196802 * t9;
+    t5 = X[12];
+    t12 = 0.9982656101847159 * t5;
+    t8 = (-0.05887080365118903) * t5;
+    t16 = X[52];
+    t7 = 0.9675990923602598 * t16;
+    t1 = (-0.25249157701515795) * t16;
+    t4 = -t7;
+    t13 = -t1;
+    t18 = t7 + t0;
+    t3 = t1 + t6;
+    t17 = t6 - t7;
+    t11 = t13 - t0;
+    t14 = t7 - t0;
+    t2 = t1 - t6;
+    t9 = t4 - t6;
+    t5 = t0 - t1;
+    t16 = t10 + t12;
+    t13 = t15 + t8;
+    t7 = t10 + t8;
+    t4 = t15 - t12;
+    t6 = t10 - t12;
+    t0 = t15 - t8;
+    t1 = t10 - t8;
+    t10 = t15 + t12;
+    t8 = t7 + t4;
+    t15 = t7 - t4;
+    t12 = C0 * t8;
+    t7 = (-C0) * t15;
+    t4 = t1 - t10;
+    t8 = t1 + t10;
+    t15 = (-C0) * t4;
+    t1 = (-C0) * t8;
+    t10 = t18 - t16;
+    t4 = t3 - t13;
+    t8 = t18 + t16;
+    t18 = t3 + t13;
+    t16 = t17 - t12;
+    t3 = t11 - t7;
+    t13 = t17 + t12;
+    t17 = t11 + t7;
+    t12 = t14 - t0;
+    t11 = t2 + t6;
+    t7 = t14 + t0;
+    t14 = t2 - t6;
+    t0 = t9 - t15;
+    t2 = t5 - t1;
+    t6 = t9 + t15;
+    t9 = t5 + t1;
+    t15 = t13 + t17;
+    t5 = C4 * t15;
+    t1 = t13 * (-C5);
+    t15 = t17 * C6;
+    t13 = t5 - t15;
+    t17 = t5 + t1;
+    t15 = t7 + t14;
+    t5 = t7 - t14;
+    t1 = C0 * t15;
+    t7 = (-C0) * t5;
+    t14 = t6 + t9;
+    t15 = C11 * t14;
+    t5 = t6 * (-C5);
+    t14 = t9 * (-C6);
+    t6 = t15 - t14;
+    t9 = t15 + t5;
+    t14 = -t10;
+    t15 = t16 + t3;
+    t5 = (-C11) * t15;
+    t10 = t16 * (-C6);
+    t15 = t3 * (-C5);
+    t16 = t5 - t15;
+    t3 = t5 + t10;
+    t15 = t12 - t11;
+    t5 = t12 + t11;
+    t10 = (-C0) * t15;
+    t12 = (-C0) * t5;
+    t11 = t0 + t2;
+    t15 = (-C4) * t11;
+    t5 = t0 * C6;
+    t11 = t2 * (-C5);
+    t0 = t15 - t11;
+    t2 = t15 + t5;
+    re[106] = t8;
+    im[106] = t18;
+    re[126] = t13;
+    im[126] = t17;
+    re[146] = t1;
+    im[146] = t7;
+    re[6] = t6;
+    im[6] = t9;
+    re[26] = t4;
+    im[26] = t14;
+    re[46] = t16;
+    im[46] = t3;
+    re[66] = t10;
+    im[66] = t12;
+    re[86] = t0;
+    im[86] = t2;
+    t11 = X[57];
+    t15 = 0.9597440371568574 * t11;
+    t5 = 0.2808760992712921 * t11;
+    t8 = X[17];
+    t18 = 0.9960990332516871 * t8;
+    t13 = 0.08824237052036951 * t8;
+    t17 = X[22];
+    t1 = 0.9941745021174282 * t17;
+    t7 = (-0.10778246304275935) * t17;
+    t6 = X[62];
+    t9 = 0.9540444024062804 * t6;
+    t4 = (-0.2996652769962566) * t6;
+    t14 = -t9;
+    t16 = -t4;
+    t3 = t9 + t18;
+    t10 = t4 + t13;
+    t12 = t13 - t9;
+    t0 = t16 - t18;
+    t2 = t9 - t18;
+    t11 = t4 - t13;
+    t8 = t14 - t13;
+    t17 = t18 - t4;
+    t6 = t15 + t1;
+    t16 = t5 + t7;
+    t9 = t15 + t7;
+    t14 = t5 - t1;
+    t13 = t15 - t1;
+    t18 = t5 - t7;
+    t4 = t15 - t7;
+    t15 = t5 + t1;
+    t7 = t9 + t14;
+    t5 = t9 - t14;
+    t1 = C0 * t7;
+    t9 = (-C0) * t5;
+    t14 = t4 - t15;
+    t7 = t4 + t15;
+    t5 = (-C0) * t14;
+    t4 = (-C0) * t7;
+    t15 = t3 - t6;
+    t14 = t10 - t16;
+    t7 = t3 + t6;
+    t3 = t10 + t16;
+    t6 = t12 - t1;
+    t10 = t0 - t9;
+    t16 = t12 + t1;
+    t12 = t0 + t9;
+    t1 = t2 - t18;
+    t0 = t11 + t13;
+    t9 = t2 + t18;
+    t2 = t11 - t13;
+    t18 = t8 - t5;
+    t11 = t17 - t4;
+    t13 = t8 + t5;
+    t8 = t17 + t4;
+    t5 = t16 + t12;
+    t17 = C7 * t5;
+    t4 = t16 * (-C8);
+    t5 = t12 * C9;
+    t16 = t17 - t5;
+    t12 = t17 + t4;
+    t5 = t9 + t2;
+    t17 = C11 * t5;
+    t4 = t9 * (-C5);
+    t5 = t2 * (-C6);
+    t9 = t17 - t5;
+    t2 = t17 + t4;
+    t5 = t13 + t8;
+    t17 = (-C12) * t5;
+    t4 = t13 * (-C3);
+    t5 = t8 * (-C2);
+    t13 = t17 - t5;
+    t8 = t17 + t4;
+    t5 = t15 - t14;
+    t17 = t15 + t14;
+    t4 = (-C0) * t5;
+    t15 = (-C0) * t17;
+    t14 = t6 + t10;
+    t5 = (-C1) * t14;
+    t17 = t6 * C3;
+    t14 = t10 * (-C2);
+    t6 = t5 - t14;
+    t10 = t5 + t17;
+    t14 = t1 + t0;
+    t5 = (-C4) * t14;
+    t17 = t1 * C5;
+    t14 = t0 * (-C6);
+    t1 = t5 - t14;
+    t0 = t5 + t17;
+    t14 = t18 + t11;
+    t5 = (-C10) * t14;
+    t17 = t18 * C8;
+    t14 = t11 * C9;
+    t18 = t5 - t14;
+    t11 = t5 + t17;
+    re[111] = t7;
+    im[111] = t3;
+    re[131] = t16;
+    im[131] = t12;
+    re[151] = t9;
+    im[151] = t2;
+    re[11] = t13;
+    im[11] = t8;
+    re[31] = t4;
+    im[31] = t15;
+    re[51] = t6;
+    im[51] = t10;
+    re[71] = t1;
+    im[71] = t0;
+    re[91] = t18;
+    im[91] = t11;
+    t14 = re[96];
+    t5 = im[96];
+    t17 = re[101];
+    t7 = im[101];
+    t3 = re[106];
+    t16 = im[106];
+    t12 = re[111];
+    t9 = im[111];
+    t2 = t14 + t3;
+    t13 = t5 + t16;
+    t8 = t17 + t12;
+    t4 = t7 + t9;
+    t15 = t14 - t3;
+    t6 = t5 - t16;
+    t10 = t17 - t12;
+    t1 = t7 - t9;
+    t0 = t2 + t8;
+    t18 = t13 + t4;
+    t11 = t15 + t1;
+    t14 = t6 - t10;
+    t3 = t2 - t8;
+    t5 = t13 - t4;
+    t16 = t15 - t1;
+    t17 = t6 + t10;
+    re[96] = t0;
+    im[96] = t18;
+    re[101] = t11;
+    im[101] = t14;
+    re[106] = t3;
+    im[106] = t5;
+    re[111] = t16;
+    im[111] = t17;
+    t12 = re[116];
+    t7 = im[116];
+    t9 = re[121];
+    t2 = im[121];
+    t8 = re[126];
+    t13 = im[126];
+    t4 = re[131];
+    t15 = im[131];
+    t1 = t12 + t8;
+    t6 = t7 + t13;
+    t10 = t9 + t4;
+    t0 = t2 + t15;
+    t18 = t12 - t8;
+    t11 = t7 - t13;
+    t14 = t9 - t4;
+    t3 = t2 - t15;
+    t5 = t1 + t10;
+    t16 = t6 + t0;
+    t17 = t18 + t3;
+    t12 = t11 - t14;
+    t8 = t1 - t10;
+    t7 = t6 - t0;
+    t13 = t18 - t3;
+    t9 = t11 + t14;
+    re[116] = t5;
+    im[116] = t16;
+    re[121] = t17;
+    im[121] = t12;
+    re[126] = t8;
+    im[126] = t7;
+    re[131] = t13;
+    im[131] = t9;
+    t4 = re[136];
+    t2 = im[136];
+    t15 = re[141];
+    t1 = im[141];
+    t10 = re[146];
+    t6 = im[146];
+    t0 = re[151];
+    t18 = im[151];
+    t3 = t4 + t10;
+    t11 = t2 + t6;
+    t14 = t15 + t0;
+    t5 = t1 + t18;
+    t16 = t4 - t10;
+    t17 = t2 - t6;
+    t12 = t15 - t0;
+    t8 = t1 - t18;
+    t7 = t3 + t14;
+    t13 = t11 + t5;
+    t9 = t16 + t8;
+    t4 = t17 - t12;
+    t10 = t3 - t14;
+    t2 = t11 - t5;
+    t6 = t16 - t8;
+    t15 = t17 + t12;
+    re[136] = t7;
+    im[136] = t13;
+    re[141] = t9;
+    im[141] = t4;
+    re[146] = t10;
+    im[146] = t2;
+    re[151] = t6;
+    im[151] = t15;
+    t0 = re[156];
+    t1 = im[156];
+    t18 = re[1];
+    t3 = im[1];
+    t14 = re[6];
+    t11 = im[6];
+    t5 = re[11];
+    t16 = im[11];
+    t8 = t0 + t14;
+    t17 = t1 + t11;
+    t12 = t18 + t5;
+    t7 = t3 + t16;
+    t13 = t0 - t14;
+    t9 = t1 - t11;
+    t4 = t18 - t5;
+    t10 = t3 - t16;
+    t2 = t8 + t12;
+    t6 = t17 + t7;
+    t15 = t13 + t10;
+    t0 = t9 - t4;
+    t14 = t8 - t12;
+    t1 = t17 - t7;
+    t11 = t13 - t10;
+    t18 = t9 + t4;
+    re[156] = t2;
+    im[156] = t6;
+    re[1] = t15;
+    im[1] = t0;
+    re[6] = t14;
+    im[6] = t1;
+    re[11] = t11;
+    im[11] = t18;
+    t5 = re[16];
+    t3 = im[16];
+    t16 = re[21];
+    t8 = im[21];
+    t12 = re[26];
+    t17 = im[26];
+    t7 = re[31];
+    t13 = im[31];
+    t10 = t5 + t12;
+    t9 = t3 + t17;
+    t4 = t16 + t7;
+    t2 = t8 + t13;
+    t6 = t5 - t12;
+    t15 = t3 - t17;
+    t0 = t16 - t7;
+    t14 = t8 - t13;
+    t1 = t10 + t4;
+    t11 = t9 + t2;
+    t18 = t6 + t14;
+    t5 = t15 - t0;
+    t12 = t10 - t4;
+    t3 = t9 - t2;
+    t17 = t6 - t14;
+    t16 = t15 + t0;
+    re[16] = t1;
+    im[16] = t11;
+    re[21] = t18;
+    im[21] = t5;
+    re[26] = t12;
+    im[26] = t3;
+    re[31] = t17;
+    im[31] = t16;
+    t7 = re[36];
+    t8 = im[36];
+    t13 = re[41];
+    t10 = im[41];
+    t4 = re[46];
+    t9 = im[46];
+    t2 = re[51];
+    t6 = im[51];
+    t14 = t7 + t4;
+    t15 = t8 + t9;
+    t0 = t13 + t2;
+    t1 = t10 + t6;
+    t11 = t7 - t4;
+    t18 = t8 - t9;
+    t5 = t13 - t2;
+    t12 = t10 - t6;
+    t3 = t14 + t0;
+    t17 = t15 + t1;
+    t16 = t11 + t12;
+    t7 = t18 - t5;
+    t4 = t14 - t0;
+    t8 = t15 - t1;
+    t9 = t11 - t12;
+    t13 = t18 + t5;
+    re[36] = t3;
+    im[36] = t17;
+    re[41] = t16;
+    im[41] = t7;
+    re[46] = t4;
+    im[46] = t8;
+    re[51] = t9;
+    im[51] = t13;
+    t2 = re[56];
+    t10 = im[56];
+    t6 = re[61];
+    t14 = im[61];
+    t0 = re[66];
+    t15 = im[66];
+    t1 = re[71];
+    t11 = im[71];
+    t12 = t2 + t0;
+    t18 = t10 + t15;
+    t5 = t6 + t1;
+    t3 = t14 + t11;
+    t17 = t2 - t0;
+    t16 = t10 - t15;
+    t7 = t6 - t1;
+    t4 = t14 - t11;
+    t8 = t12 + t5;
+    t9 = t18 + t3;
+    t13 = t17 + t4;
+    t2 = t16 - t7;
+    t0 = t12 - t5;
+    t10 = t18 - t3;
+    t15 = t17 - t4;
+    t6 = t16 + t7;
+    re[56] = t8;
+    im[56] = t9;
+    re[61] = t13;
+    im[61] = t2;
+    re[66] = t0;
+    im[66] = t10;
+    re[71] = t15;
+    im[71] = t6;
+    t1 = re[76];
+    t14 = im[76];
+    t11 = re[81];
+    t12 = im[81];
+    t5 = re[86];
+    t18 = im[86];
+    t3 = re[91];
+    t17 = im[91];
+    t4 = t1 + t5;
+    t16 = t14 + t18;
+    t7 = t11 + t3;
+    t8 = t12 + t17;
+    t9 = t1 - t5;
+    t13 = t14 - t18;
+    t2 = t11 - t3;
+    t0 = t12 - t17;
+    t10 = t4 + t7;
+    t15 = t16 + t8;
+    t6 = t9 + t0;
+    t1 = t13 - t2;
+    t5 = t4 - t7;
+    t14 = t16 - t8;
+    t18 = t9 - t0;
+    t11 = t13 + t2;
+    re[76] = t10;
+    im[76] = t15;
+    re[81] = t6;
+    im[81] = t1;
+    re[86] = t5;
+    im[86] = t14;
+    re[91] = t18;
+    im[91] = t11;
+    t3 = X[63];
+    t12 = C13 * t3;
+    t17 = 0.3090169943749474 * t3;
+    t4 = X[23];
+    t7 = 0.9930684569549263 * t4;
+    t16 = 0.11753739745783764 * t4;
+    t8 = X[16];
+    t9 = 0.996917333733128 * t8;
+    t0 = (-0.07845909572784494) * t8;
+    t13 = X[56];
+    t2 = 0.9624552364536473 * t13;
+    t10 = (-0.27144044986507426) * t13;
+    t15 = t12 + t9;
+    t6 = t17 + t0;
+    t1 = t12 + t0;
+    t5 = t17 - t9;
+    t14 = t12 - t9;
+    t18 = t17 - t0;
+    t11 = t12 - t0;
+    t3 = t17 + t9;
+    t4 = t7 + t2;
+    t8 = t16 + t10;
+    t13 = t7 + t10;
+    t12 = t16 - t2;
+    t0 = t7 - t2;
+    t17 = t16 - t10;
+    t9 = t7 - t10;
+    t7 = t16 + t2;
+    t10 = t13 + t12;
+    t16 = t13 - t12;
+    t2 = C0 * t10;
+    t13 = (-C0) * t16;
+    t12 = t9 - t7;
+    t10 = t9 + t7;
+    t16 = (-C0) * t12;
+    t9 = (-C0) * t10;
+    t7 = t15 - t4;
+    t12 = t6 - t8;
+    t10 = t15 + t4;
+    t15 = t6 + t8;
+    t4 = t1 - t2;
+    t6 = t5 - t13;
+    t8 = t1 + t2;
+    t1 = t5 + t13;
+    t2 = t14 - t17;
+    t5 = t18 + t0;
+    t13 = t14 + t17;
+    t14 = t18 - t0;
+    t17 = t11 - t16;
+    t18 = t3 - t9;
+    t0 = t11 + t16;
+    t11 = t3 + t9;
+    re[128] = t10;
+    im[128] = t15;
+    re[148] = t8;
+    im[148] = t1;
+    re[8] = t13;
+    im[8] = t14;
+    re[28] = t0;
+    im[28] = t11;
+    re[48] = t7;
+    im[48] = t12;
+    re[68] = t4;
+    im[68] = t6;
+    re[88] = t2;
+    im[88] = t5;
+    re[108] = t17;
+    im[108] = t18;
+    t16 = X[53];
+    t3 = 0.9650736723115474 * t16;
+    t9 = 0.26197863846333747 * t16;
+    t10 = X[13];
+    t15 = 0.9976395492470157 * t10;
+    t8 = 0.06866825888437376 * t10;
+    t1 = X[26];
+    t13 = 0.991866697787626 * t1;
+    t14 = (-0.1272810033739132) * t1;
+    t0 = X[66];
+    t11 = 0.9479769653775104 * t0;
+    t7 = (-0.3183389280525497) * t0;
+    t12 = t3 + t13;
+    t4 = t9 + t14;
+    t6 = t3 + t14;
+    t2 = t9 - t13;
+    t5 = t3 - t13;
+    t17 = t9 - t14;
+    t18 = t3 - t14;
+    t16 = t9 + t13;
+    t10 = t15 + t11;
+    t1 = t8 + t7;
+    t0 = t15 + t7;
+    t3 = t8 - t11;
+    t14 = t15 - t11;
+    t9 = t8 - t7;
+    t13 = t15 - t7;
+    t15 = t8 + t11;
+    t7 = t0 + t3;
+    t8 = t0 - t3;
+    t11 = C0 * t7;
+    t0 = (-C0) * t8;
+    t3 = t13 - t15;
+    t7 = t13 + t15;
+    t8 = (-C0) * t3;
+    t13 = (-C0) * t7;
+    t15 = t12 - t10;
+    t3 = t4 - t1;
+    t7 = t12 + t10;
+    t12 = t4 + t1;
+    t10 = t6 - t11;
+    t4 = t2 - t0;
+    t1 = t6 + t11;
+    t6 = t2 + t0;
+    t11 = t5 - t9;
+    t2 = t17 + t14;
+    t0 = t5 + t9;
+    t5 = t17 - t14;
+    t9 = t18 - t8;
+    t17 = t16 - t13;
+    t14 = t18 + t8;
+    t18 = t16 + t13;
+    t8 = t1 + t6;
+    t16 = C1 * t8;
+    t13 = t1 * (-C2);
+    t8 = t6 * C3;
+    t1 = t16 - t8;
+    t6 = t16 + t13;
+    t8 = t0 + t5;
+    t16 = C4 * t8;
+    t13 = t0 * (-C5);
+    t8 = t5 * C6;
+    t0 = t16 - t8;
+    t5 = t16 + t13;
+    t8 = t14 + t18;
+    t16 = C7 * t8;
+    t13 = t14 * (-C8);
+    t8 = t18 * C9;
+    t14 = t16 - t8;
+    t18 = t16 + t13;
+    t8 = t15 + t3;
+    t16 = t15 - t3;
+    t13 = C0 * t8;
+    t15 = (-C0) * t16;
+    t3 = t10 + t4;
+    t8 = C10 * t3;
+    t16 = t10 * (-C8);
+    t3 = t4 * (-C9);
+    t10 = t8 - t3;
+    t4 = t8 + t16;
+    t3 = t11 + t2;
+    t8 = C11 * t3;
+    t16 = t11 * (-C5);
+    t3 = t2 * (-C6);
+    t11 = t8 - t3;
+    t2 = t8 + t16;
+    t3 = t9 + t17;
+    t8 = C12 * t3;
+    t16 = t9 * (-C2);
+    t3 = t17 * (-C3);
+    t9 = t8 - t3;
+    t17 = t8 + t16;
+    re[133] = t7;
+    im[133] = t12;
+    re[153] = t1;
+    im[153] = t6;
+    re[13] = t0;
+    im[13] = t5;
+    re[33] = t14;
+    im[33] = t18;
+    re[53] = t13;
+    im[53] = t15;
+    re[73] = t10;
+    im[73] = t4;
+    re[93] = t11;
+    im[93] = t2;
+    re[113] = t9;
+    im[113] = t17;
+    t3 = X[43];
+    t8 = 0.9767658813208724 * t3;
+    t16 = 0.21430915306505077 * t3;
+    t7 = X[3];
+    t12 = 0.9998072404820648 * t7;
+    t1 = 0.0196336924606283 * t7;
+    t6 = X[36];
+    t0 = 0.9844265680898916 * t6;
+    t5 = (-0.1757962799343545) * t6;
+    t14 = X[76];
+    t18 = 0.9312149347588036 * t14;
+    t13 = (-0.36447049987914965) * t14;
+    t15 = t8 + t0;
+    t10 = t16 + t5;
+    t4 = t8 + t5;
+    t11 = t16 - t0;
+    t2 = t8 - t0;
+    t9 = t16 - t5;
+    t17 = t8 - t5;
+    t3 = t16 + t0;
+    t7 = t12 + t18;
+    t6 = t1 + t13;
+    t14 = t12 + t13;
+    t8 = t1 - t18;
+    t5 = t12 - t18;
+    t16 = t1 - t13;
+    t0 = t12 - t13;
+    t12 = t1 + t18;
+    t13 = t14 + t8;
+    t1 = t14 - t8;
+    t18 = C0 * t13;
+    t14 = (-C0) * t1;
+    t8 = t0 - t12;
+    t13 = t0 + t12;
+    t1 = (-C0) * t8;
+    t0 = (-C0) * t13;
+    t12 = t15 - t7;
+    t8 = t10 - t6;
+    t13 = t15 + t7;
+    t15 = t10 + t6;
+    t7 = t4 - t18;
+    t10 = t11 - t14;
+    t6 = t4 + t18;
+    t4 = t11 + t14;
+    t18 = t2 - t16;
+    t11 = t9 + t5;
+    t14 = t2 + t16;
+    t2 = t9 - t5;
+    t16 = t17 - t1;
+    t9 = t3 - t0;
+    t5 = t17 + t1;
+    t17 = t3 + t0;
+    t1 = t6 + t4;
+    t3 = C4 * t1;
+    t0 = t6 * (-C5);
+    t1 = t4 * C6;
+    t6 = t3 - t1;
+    t4 = t3 + t0;
+    t1 = t14 + t2;
+    t3 = t14 - t2;
+    t0 = C0 * t1;
+    t14 = (-C0) * t3;
+    t2 = t5 + t17;
+    t1 = C11 * t2;
+    t3 = t5 * (-C5);
+    t2 = t17 * (-C6);
+    t5 = t1 - t2;
+    t17 = t1 + t3;
+    t2 = -t12;
+    t1 = t7 + t10;
+    t3 = (-C11) * t1;
+    t12 = t7 * (-C6);
+    t1 = t10 * (-C5);
+    t7 = t3 - t1;
+    t10 = t3 + t12;
+    t1 = t18 - t11;
+    t3 = t18 + t11;
+    t12 = (-C0) * t1;
+    t18 = (-C0) * t3;
+    t11 = t16 + t9;
+    t1 = (-C4) * t11;
+    t3 = t16 * C6;
+    t11 = t9 * (-C5);
+    t16 = t1 - t11;
+    t9 = t1 + t3;
+    re[138] = t13;
+    im[138] = t15;
+    re[158] = t6;
+    im[158] = t4;
+    re[18] = t0;
+    im[18] = t14;
+    re[38] = t5;
+    im[38] = t17;
+    re[58] = t8;
+    im[58] = t2;
+    re[78] = t7;
+    im[78] = t10;
+    re[98] = t12;
+    im[98] = t18;
+    re[118] = t16;
+    im[118] = t9;
+    t11 = X[33];
+    t1 = 0.9861049757675088 * t11;
+    t3 = 0.16612337814576547 * t11;
+    t13 = X[6];
+    t15 = 0.9995663085020212 * t13;
+    t6 = (-0.02944817324796316) * t13;
+    t4 = X[46];
+    t0 = 0.974614868564045 * t4;
+    t14 = (-0.22388804785849836) * t4;
+    t5 = X[73];
+    t17 = 0.9347481818282924 * t5;
+    t8 = 0.3553109012804161 * t5;
+    t2 = t1 + t0;
+    t7 = t3 + t14;
+    t10 = t1 + t14;
+    t12 = t3 - t0;
+    t18 = t1 - t0;
+    t16 = t3 - t14;
+    t9 = t1 - t14;
+    t11 = t3 + t0;
+    t13 = t15 + t17;
+    t4 = t6 + t8;
+    t5 = t15 - t8;
+    t1 = t6 + t17;
+    t14 = t15 - t17;
+    t3 = t6 - t8;
+    t0 = t15 + t8;
+    t15 = t6 - t17;
+    t8 = t5 + t1;
+    t6 = t5 - t1;
+    t17 = C0 * t8;
+    t5 = (-C0) * t6;
+    t1 = t0 - t15;
+    t8 = t0 + t15;
+    t6 = (-C0) * t1;
+    t0 = (-C0) * t8;
+    t15 = t2 - t13;
+    t1 = t7 - t4;
+    t8 = t2 + t13;
+    t2 = t7 + t4;
+    t13 = t10 - t17;
+    t7 = t12 - t5;
+    t4 = t10 + t17;
+    t10 = t12 + t5;
+    t17 = t18 - t3;
+    t12 = t16 + t14;
+    t5 = t18 + t3;
+    t18 = t16 - t14;
+    t3 = t9 - t6;
+    t16 = t11 - t0;
+    t14 = t9 + t6;
+    t9 = t11 + t0;
+    t6 = t4 + t10;
+    t11 = C7 * t6;
+    t0 = t4 * (-C8);
+    t6 = t10 * C9;
+    t4 = t11 - t6;
+    t10 = t11 + t0;
+    t6 = t5 + t18;
+    t11 = C11 * t6;
+    t0 = t5 * (-C5);
+    t6 = t18 * (-C6);
+    t5 = t11 - t6;
+    t18 = t11 + t0;
+    t6 = t14 + t9;
+    t11 = (-C12) * t6;
+    t0 = t14 * (-C3);
+    t6 = t9 * (-C2);
+    t14 = t11 - t6;
+    t9 = t11 + t0;
+    t6 = t15 - t1;
+    t11 = t15 + t1;
+    t0 = (-C0) * t6;
+    t15 = (-C0) * t11;
+    t1 = t13 + t7;
+    t6 = (-C1) * t1;
+    t11 = t13 * C3;
+    t1 = t7 * (-C2);
+    t13 = t6 - t1;
+    t7 = t6 + t11;
+    t1 = t17 + t12;
+    t6 = (-C4) * t1;
+    t11 = t17 * C5;
+    t1 = t12 * (-C6);
+    t17 = t6 - t1;
+    t12 = t6 + t11;
+    t1 = t3 + t16;
+    t6 = (-C10) * t1;
+    t11 = t3 * C8;
+    t1 = t16 * C9;
+    t3 = t6 - t1;
+    t16 = t6 + t11;
+    re[143] = t8;
+    im[143] = t2;
+    re[3] = t4;
+    im[3] = t10;
+    re[23] = t5;
+    im[23] = t18;
+    re[43] = t14;
+    im[43] = t9;
+    re[63] = t0;
+    im[63] = t15;
+    re[83] = t13;
+    im[83] = t7;
+    re[103] = t17;
+    im[103] = t12;
+    re[123] = t3;
+    im[123] = t16;
+    t1 = re[128];
+    t6 = im[128];
+    t11 = re[133];
+    t8 = im[133];
+    t2 = re[138];
+    t4 = im[138];
+    t10 = re[143];
+    t5 = im[143];
+    t18 = t1 + t2;
+    t14 = t6 + t4;
+    t9 = t11 + t10;
+    t0 = t8 + t5;
+    t15 = t1 - t2;
+    t13 = t6 - t4;
+    t7 = t11 - t10;
+    t17 = t8 - t5;
+    t12 = t18 + t9;
+    t3 = t14 + t0;
+    t16 = t15 + t17;
+    t1 = t13 - t7;
+    t2 = t18 - t9;
+    t6 = t14 - t0;
+    t4 = t15 - t17;
+    t11 = t13 + t7;
+    re[128] = t12;
+    im[128] = t3;
+    re[133] = t16;
+    im[133] = t1;
+    re[138] = t2;
+    im[138] = t6;
+    re[143] = t4;
+    im[143] = t11;
+    t10 = re[148];
+    t8 = im[148];
+    t5 = re[153];
+    t18 = im[153];
+    t9 = re[158];
+    t14 = im[158];
+    t0 = re[3];
+    t15 = im[3];
+    t17 = t10 + t9;
+    t13 = t8 + t14;
+    t7 = t5 + t0;
+    t12 = t18 + t15;
+    t3 = t10 - t9;
+    t16 = t8 - t14;
+    t1 = t5 - t0;
+    t2 = t18 - t15;
+    t6 = t17 + t7;
+    t4 = t13 + t12;
+    t11 = t3 + t2;
+    t10 = t16 - t1;
+    t9 = t17 - t7;
+    t8 = t13 - t12;
+    t14 = t3 - t2;
+    t5 = t16 + t1;
+    re[148] = t6;
+    im[148] = t4;
+    re[153] = t11;
+    im[153] = t10;
+    re[158] = t9;
+    im[158] = t8;
+    re[3] = t14;
+    im[3] = t5;
+    t0 = re[8];
+    t18 = im[8];
+    t15 = re[13];
+    t17 = im[13];
+    t7 = re[18];
+    t13 = im[18];
+    t12 = re[23];
+    t3 = im[23];
+    t2 = t0 + t7;
+    t16 = t18 + t13;
+    t1 = t15 + t12;
+    t6 = t17 + t3;
+    t4 = t0 - t7;
+    t11 = t18 - t13;
+    t10 = t15 - t12;
+    t9 = t17 - t3;
+    t8 = t2 + t1;
+    t14 = t16 + t6;
+    t5 = t4 + t9;
+    t0 = t11 - t10;
+    t7 = t2 - t1;
+    t18 = t16 - t6;
+    t13 = t4 - t9;
+    t15 = t11 + t10;
+    re[8] = t8;
+    im[8] = t14;
+    re[13] = t5;
+    im[13] = t0;
+    re[18] = t7;
+    im[18] = t18;
+    re[23] = t13;
+    im[23] = t15;
+    t12 = re[28];
+    t17 = im[28];
+    t3 = re[33];
+    t2 = im[33];
+    t1 = re[38];
+    t16 = im[38];
+    t6 = re[43];
+    t4 = im[43];
+    t9 = t12 + t1;
+    t11 = t17 + t16;
+    t10 = t3 + t6;
+    t8 = t2 + t4;
+    t14 = t12 - t1;
+    t5 = t17 - t16;
+    t0 = t3 - t6;
+    t7 = t2 - t4;
+    t18 = t9 + t10;
+    t13 = t11 + t8;
+    t15 = t14 + t7;
+    t12 = t5 - t0;
+    t1 = t9 - t10;
+    t17 = t11 - t8;
+    t16 = t14 - t7;
+    t3 = t5 + t0;
+    re[28] = t18;
+    im[28] = t13;
+    re[33] = t15;
+    im[33] = t12;
+    re[38] = t1;
+    im[38] = t17;
+    re[43] = t16;
+    im[43] = t3;
+    t6 = re[48];
+    t2 = im[48];
+    t4 = re[53];
+    t9 = im[53];
+    t10 = re[58];
+    t11 = im[58];
+    t8 = re[63];
+    t14 = im[63];
+    t7 = t6 + t10;
+    t5 = t2 + t11;
+    t0 = t4 + t8;
+    t18 = t9 + t14;
+    t13 = t6 - t10;
+    t15 = t2 - t11;
+    t12 = t4 - t8;
+    t1 = t9 - t14;
+    t17 = t7 + t0;
+    t16 = t5 + t18;
+    t3 = t13 + t1;
+    t6 = t15 - t12;
+    t10 = t7 - t0;
+    t2 = t5 - t18;
+    t11 = t13 - t1;
+    t4 = t15 + t12;
+    re[48] = t17;
+    im[48] = t16;
+    re[53] = t3;
+    im[53] = t6;
+    re[58] = t10;
+    im[58] = t2;
+    re[63] = t11;
+    im[63] = t4;
+    t8 = re[68];
+    t9 = im[68];
+    t14 = re[73];
+    t7 = im[73];
+    t0 = re[78];
+    t5 = im[78];
+    t18 = re[83];
+    t13 = im[83];
+    t1 = t8 + t0;
+    t15 = t9 + t5;
+    t12 = t14 + t18;
+    t17 = t7 + t13;
+    t16 = t8 - t0;
+    t3 = t9 - t5;
+    t6 = t14 - t18;
+    t10 = t7 - t13;
+    t2 = t1 + t12;
+    t11 = t15 + t17;
+    t4 = t16 + t10;
+    t8 = t3 - t6;
+    t0 = t1 - t12;
+    t9 = t15 - t17;
+    t5 = t16 - t10;
+    t14 = t3 + t6;
+    re[68] = t2;
+    im[68] = t11;
+    re[73] = t4;
+    im[73] = t8;
+    re[78] = t0;
+    im[78] = t9;
+    re[83] = t5;
+    im[83] = t14;
+    t18 = re[88];
+    t7 = im[88];
+    t13 = re[93];
+    t1 = im[93];
+    t12 = re[98];
+    t15 = im[98];
+    t17 = re[103];
+    t16 = im[103];
+    t10 = t18 + t12;
+    t3 = t7 + t15;
+    t6 = t13 + t17;
+    t2 = t1 + t16;
+    t11 = t18 - t12;
+    t4 = t7 - t15;
+    t8 = t13 - t17;
+    t0 = t1 - t16;
+    t9 = t10 + t6;
+    t5 = t3 + t2;
+    t14 = t11 + t0;
+    t18 = t4 - t8;
+    t12 = t10 - t6;
+    t7 = t3 - t2;
+    t15 = t11 - t0;
+    t13 = t4 + t8;
+    re[88] = t9;
+    im[88] = t5;
+    re[93] = t14;
+    im[93] = t18;
+    re[98] = t12;
+    im[98] = t7;
+    re[103] = t15;
+    im[103] = t13;
+    t17 = re[108];
+    t1 = im[108];
+    t16 = re[113];
+    t10 = im[113];
+    t6 = re[118];
+    t3 = im[118];
+    t2 = re[123];
+    t11 = im[123];
+    t0 = t17 + t6;
+    t4 = t1 + t3;
+    t8 = t16 + t2;
+    t9 = t10 + t11;
+    t5 = t17 - t6;
+    t14 = t1 - t3;
+    t18 = t16 - t2;
+    t12 = t10 - t11;
+    t7 = t0 + t8;
+    t15 = t4 + t9;
+    t13 = t5 + t12;
+    t17 = t14 - t18;
+    t6 = t0 - t8;
+    t1 = t4 - t9;
+    t3 = t5 - t12;
+    t16 = t14 + t18;
+    re[108] = t7;
+    im[108] = t15;
+    re[113] = t13;
+    im[113] = t17;
+    re[118] = t6;
+    im[118] = t1;
+    re[123] = t3;
+    im[123] = t16;
+    t2 = re[0];
+    t10 = im[0];
+    t11 = re[32];
+    t0 = im[32];
+    t8 = re[64];
+    t4 = im[64];
+    t9 = re[96];
+    t5 = im[96];
+    t12 = re[128];
+    t14 = im[128];
+    t18 = t11 + t12;
+    t7 = t0 + t14;
+    t15 = t8 + t9;
+    t13 = t4 + t5;
+    t17 = t11 - t12;
+    t6 = t0 - t14;
+    t1 = t8 - t9;
+    t3 = t4 - t5;
+    t16 = t18 + t15;
+    t11 = t7 + t13;
+    t12 = t18 - t15;
+    t0 = C14 * t12;
+    t14 = t7 - t13;
+    t8 = C14 * t14;
+    t9 = C15 * t16;
+    t4 = t2 - t9;
+    t5 = C15 * t11;
+    t18 = t10 - t5;
+    t15 = t4 + t0;
+    t12 = t18 + t8;
+    t7 = t4 - t0;
+    t13 = t18 - t8;
+    t14 = C13 * t17;
+    t9 = C16 * t1;
+    t5 = t14 + t9;
+    t4 = C13 * t6;
+    t0 = C16 * t3;
+    t18 = t4 + t0;
+    t8 = C16 * t17;
+    t14 = C13 * t1;
+    t9 = t8 - t14;
+    t4 = C16 * t6;
+    t0 = C13 * t3;
+    t17 = t4 - t0;
+    t1 = t2 + t16;
+    t8 = t10 + t11;
+    t14 = t15 + t18;
+    t6 = t12 - t5;
+    t3 = t7 + t17;
+    t4 = t13 - t9;
+    t0 = t7 - t17;
+    t2 = t13 + t9;
+    t16 = t15 - t18;
+    t10 = t12 + t5;
+    t11 = (-C17) * t1;
+    t7 = (-C18) * t8;
+    t17 = t11 + t7;
+    t13 = 0.0696597151132507 * t17;
+    y[479] = t13;
+    t9 = 0.06866149903828855 * t17;
+    y[480] = t9;
+    t15 = C18 * t1;
+    t18 = (-C17) * t8;
+    t12 = t15 + t18;
+    t5 = 0.04437999374521572 * t12;
+    y[159] = t5;
+    t11 = (-0.045977838079537765) * t12;
+    y[160] = t11;
+    t7 = C19 * t14;
+    t13 = C20 * t6;
+    t17 = t7 + t13;
+    y[32] = 0;
+    t9 = (-0.07982159176456675) * t17;
+    y[287] = t9;
+    t1 = (-C20) * t14;
+    t8 = C19 * t6;
+    t15 = t1 + t8;
+    t18 = 0.07829961620452687 * t15;
+    y[352] = t18;
+    t5 = (-0.003434751278859086) * t15;
+    y[607] = t5;
+    t12 = (-C21) * t3;
+    t11 = (-C22) * t4;
+    t7 = t12 + t11;
+    t13 = 0.07823601689077271 * t7;
+    y[415] = t13;
+    t17 = (-0.002505779022165046) * t7;
+    y[544] = t17;
+    t9 = C22 * t3;
+    t14 = (-C21) * t4;
+    t6 = t9 + t14;
+    y[95] = 0;
+    t1 = (-0.07988648001758296) * t6;
+    y[224] = t1;
+    t8 = C23 * t0;
+    t18 = C24 * t2;
+    t15 = t8 + t18;
+    y[96] = 0;
+    t5 = (-0.079857500076909) * t15;
+    y[223] = t5;
+    t12 = (-C24) * t0;
+    t11 = C23 * t2;
+    t13 = t12 + t11;
+    t7 = 0.07826440840222601 * t13;
+    y[416] = t7;
+    t17 = (-0.0020066073440204468) * t13;
+    y[543] = t17;
+    t3 = (-C25) * t16;
+    t4 = (-C26) * t10;
+    t9 = t3 + t4;
+    t14 = 0.07830557878019587 * t9;
+    y[351] = t14;
+    t6 = (-0.003234809269272303) * t9;
+    y[608] = t6;
+    t1 = C26 * t16;
+    t8 = (-C25) * t10;
+    t18 = t1 + t8;
+    y[31] = 0;
+    t15 = (-0.07981551375213997) * t18;
+    y[288] = t15;
+    t5 = re[20];
+    t0 = im[20];
+    t2 = re[52];
+    t12 = im[52];
+    t11 = re[84];
+    t7 = im[84];
+    t13 = re[116];
+    t17 = im[116];
+    t3 = re[148];
+    t4 = im[148];
+    t14 = t2 + t3;
+    t9 = t12 + t4;
+    t6 = t11 + t13;
+    t16 = t7 + t17;
+    t10 = t2 - t3;
+    t1 = t12 - t4;
+    t8 = t11 - t13;
+    t18 = t7 - t17;
+    t15 = t14 + t6;
+    t2 = t9 + t16;
+    t3 = t14 - t6;
+    t12 = C14 * t3;
+    t4 = t9 - t16;
+    t11 = C14 * t4;
+    t13 = C15 * t15;
+    t7 = t5 - t13;
+    t17 = C15 * t2;
+    t14 = t0 - t17;
+    t6 = t7 + t12;
+    t3 = t14 + t11;
+    t9 = t7 - t12;
+    t16 = t14 - t11;
+    t4 = C13 * t10;
+    t13 = C16 * t8;
+    t17 = t4 + t13;
+    t7 = C13 * t1;
+    t12 = C16 * t18;
+    t14 = t7 + t12;
+    t11 = C16 * t10;
+    t4 = C13 * t8;
+    t13 = t11 - t4;
+    t7 = C16 * t1;
+    t12 = C13 * t18;
+    t10 = t7 - t12;
+    t8 = t5 + t15;
+    t11 = t0 + t2;
+    t4 = t6 + t14;
+    t1 = t3 - t17;
+    t18 = t9 + t10;
+    t7 = t16 - t13;
+    t12 = t9 - t10;
+    t5 = t16 + t13;
+    t15 = t6 - t14;
+    t0 = t3 + t17;
+    t2 = (-C27) * t8;
+    t9 = (-C28) * t11;
+    t10 = t2 + t9;
+    t16 = 0.07832023018246469 * t10;
+    y[349] = t16;
+    t13 = (-0.0028466989314485424) * t10;
+    y[610] = t13;
+    t6 = C28 * t8;
+    t14 = (-C27) * t11;
+    t3 = t6 + t14;
+    y[29] = 0;
+    t17 = (-0.07980058262647095) * t3;
+    y[290] = t17;
+    t2 = (-C29) * t4;
+    t9 = (-C30) * t1;
+    t16 = t2 + t9;
+    t10 = 0.07153664074123962 * t16;
+    y[477] = t10;
+    t13 = 0.06655154500769807 * t16;
+    y[482] = t13;
+    t8 = C30 * t4;
+    t11 = (-C29) * t1;
+    t6 = t8 + t11;
+    t14 = 0.04113124616241223 * t6;
+    y[157] = t14;
+    t3 = (-0.049102837139157966) * t6;
+    y[162] = t3;
+    t17 = C31 * t18;
+    t2 = C32 * t7;
+    t9 = t17 + t2;
+    y[34] = 0;
+    t10 = (-0.07983143667137488) * t9;
+    y[285] = t10;
+    t16 = (-C32) * t18;
+    t13 = C31 * t7;
+    t4 = t16 + t13;
+    t1 = 0.07828996020362315 * t4;
+    y[354] = t1;
+    t8 = (-0.0038442216590680264) * t4;
+    y[605] = t8;
+    t11 = (-C33) * t12;
+    t14 = (-C34) * t5;
+    t6 = t11 + t14;
+    t3 = 0.07818674997851927 * t6;
+    y[413] = t3;
+    t17 = (-0.003436879663473097) * t6;
+    y[546] = t17;
+    t2 = C34 * t12;
+    t9 = (-C33) * t5;
+    t10 = t2 + t9;
+    y[93] = 0;
+    t18 = (-0.07993681796106246) * t10;
+    y[226] = t18;
+    t7 = C35 * t15;
+    t16 = C36 * t0;
+    t13 = t7 + t16;
+    y[98] = 0;
+    t1 = (-0.07979138531197891) * t13;
+    y[221] = t1;
+    t4 = (-C36) * t15;
+    t8 = C35 * t0;
+    t11 = t4 + t8;
+    t14 = 0.0783292579213022 * t11;
+    y[418] = t14;
+    t3 = (-0.0009387706476628306) * t11;
+    y[541] = t3;
+    t6 = re[40];
+    t17 = im[40];
+    t12 = re[72];
+    t5 = im[72];
+    t2 = re[104];
+    t9 = im[104];
+    t10 = re[136];
+    t18 = im[136];
+    t7 = re[8];
+    t16 = im[8];
+    t13 = t12 + t7;
+    t1 = t5 + t16;
+    t15 = t2 + t10;
+    t0 = t9 + t18;
+    t4 = t12 - t7;
+    t8 = t5 - t16;
+    t14 = t2 - t10;
+    t11 = t9 - t18;
+    t3 = t13 + t15;
+    t12 = t1 + t0;
+    t7 = t13 - t15;
+    t5 = C14 * t7;
+    t16 = t1 - t0;
+    t2 = C14 * t16;
+    t10 = C15 * t3;
+    t9 = t6 - t10;
+    t18 = C15 * t12;
+    t13 = t17 - t18;
+    t15 = t9 + t5;
+    t7 = t13 + t2;
+    t1 = t9 - t5;
+    t0 = t13 - t2;
+    t16 = C13 * t4;
+    t10 = C16 * t14;
+    t18 = t16 + t10;
+    t9 = C13 * t8;
+    t5 = C16 * t11;
+    t13 = t9 + t5;
+    t2 = C16 * t4;
+    t16 = C13 * t14;
+    t10 = t2 - t16;
+    t9 = C16 * t8;
+    t5 = C13 * t11;
+    t4 = t9 - t5;
+    t14 = t6 + t3;
+    t2 = t17 + t12;
+    t16 = t15 + t13;
+    t8 = t7 - t18;
+    t11 = t1 + t4;
+    t9 = t0 - t10;
+    t5 = t1 - t4;
+    t6 = t0 + t10;
+    t3 = t15 - t13;
+    t17 = t7 + t18;
+    t12 = C37 * t14;
+    t1 = C38 * t2;
+    t4 = t12 + t1;
+    y[100] = 0;
+    t0 = (-0.07971351158182624) * t4;
+    y[219] = t0;
+    t10 = (-C38) * t14;
+    t15 = C37 * t2;
+    t13 = t10 + t15;
+    t7 = 0.07840577934625735 * t13;
+    y[420] = t7;
+    t18 = 0.0002248455903077584 * t13;
+    y[539] = t18;
+    t12 = (-C39) * t16;
+    t1 = (-C40) * t8;
+    t4 = t12 + t1;
+    t0 = 0.07833883145205656 * t4;
+    y[347] = t0;
+    t14 = (-0.002477252921970635) * t4;
+    y[612] = t14;
+    t2 = C40 * t16;
+    t10 = (-C39) * t8;
+    t15 = t2 + t10;
+    y[27] = 0;
+    t7 = (-0.07978163426939815) * t15;
+    y[292] = t7;
+    t13 = (-C41) * t11;
+    t18 = (-C42) * t9;
+    t12 = t13 + t18;
+    t1 = 0.07324795839525254 * t12;
+    y[475] = t1;
+    t0 = 0.06429934544866318 * t12;
+    y[484] = t0;
+    t4 = C42 * t11;
+    t14 = (-C41) * t9;
+    t16 = t4 + t14;
+    t8 = 0.03783486692384754 * t16;
+    y[155] = t8;
+    t2 = (-0.05211398249574624) * t16;
+    y[164] = t2;
+    t10 = C43 * t5;
+    t15 = C44 * t6;
+    t7 = t10 + t15;
+    y[36] = 0;
+    t13 = (-0.07983866315346692) * t7;
+    y[283] = t13;
+    t18 = (-C44) * t5;
+    t1 = C43 * t6;
+    t12 = t18 + t1;
+    t0 = 0.07828287390015748 * t12;
+    y[356] = t0;
+    t11 = (-0.004263260008349076) * t12;
+    y[603] = t11;
+    t9 = (-C45) * t3;
+    t4 = (-C46) * t17;
+    t14 = t9 + t4;
+    t8 = 0.07814674882599187 * t14;
+    y[411] = t8;
+    t16 = (-0.00428118345726987) * t14;
+    y[548] = t16;
+    t2 = C46 * t3;
+    t10 = (-C45) * t17;
+    t15 = t2 + t10;
+    y[91] = 0;
+    t7 = (-0.07997773540031433) * t15;
+    y[228] = t7;
+    t13 = re[60];
+    t5 = im[60];
+    t6 = re[92];
+    t18 = im[92];
+    t1 = re[124];
+    t0 = im[124];
+    t12 = re[156];
+    t11 = im[156];
+    t9 = re[28];
+    t4 = im[28];
+    t8 = t6 + t9;
+    t14 = t18 + t4;
+    t16 = t1 + t12;
+    t3 = t0 + t11;
+    t17 = t6 - t9;
+    t2 = t18 - t4;
+    t10 = t1 - t12;
+    t15 = t0 - t11;
+    t7 = t8 + t16;
+    t6 = t14 + t3;
+    t9 = t8 - t16;
+    t18 = C14 * t9;
+    t4 = t14 - t3;
+    t1 = C14 * t4;
+    t12 = C15 * t7;
+    t0 = t13 - t12;
+    t11 = C15 * t6;
+    t8 = t5 - t11;
+    t16 = t0 + t18;
+    t9 = t8 + t1;
+    t14 = t0 - t18;
+    t3 = t8 - t1;
+    t4 = C13 * t17;
+    t12 = C16 * t10;
+    t11 = t4 + t12;
+    t0 = C13 * t2;
+    t18 = C16 * t15;
+    t8 = t0 + t18;
+    t1 = C16 * t17;
+    t4 = C13 * t10;
+    t12 = t1 - t4;
+    t0 = C16 * t2;
+    t18 = C13 * t15;
+    t17 = t0 - t18;
+    t10 = t13 + t7;
+    t1 = t5 + t6;
+    t4 = t16 + t8;
+    t2 = t9 - t11;
+    t15 = t14 + t17;
+    t0 = t3 - t12;
+    t18 = t14 - t17;
+    t13 = t3 + t12;
+    t7 = t16 - t8;
+    t5 = t9 + t11;
+    t6 = (-C47) * t10;
+    t14 = (-C48) * t1;
+    t17 = t6 + t14;
+    t3 = 0.07811531141943964 * t17;
+    y[409] = t3;
+    t12 = (-0.0050419445369264924) * t17;
+    y[550] = t12;
+    t16 = C48 * t10;
+    t8 = (-C47) * t1;
+    t9 = t16 + t8;
+    y[89] = 0;
+    t11 = (-0.08000992233700084) * t9;
+    y[230] = t11;
+    t6 = C49 * t4;
+    t14 = C50 * t2;
+    t3 = t6 + t14;
+    y[102] = 0;
+    t17 = (-0.07962281744295999) * t3;
+    y[217] = t17;
+    t12 = (-C50) * t4;
+    t10 = C49 * t2;
+    t1 = t12 + t10;
+    t16 = 0.07849508722141564 * t1;
+    y[422] = t16;
+    t8 = 0.0014873424733383262 * t1;
+    y[537] = t8;
+    t9 = (-C51) * t15;
+    t11 = (-C52) * t0;
+    t6 = t9 + t11;
+    t14 = 0.07836190935367703 * t6;
+    y[345] = t14;
+    t3 = (-0.0021295937563124336) * t6;
+    y[614] = t3;
+    t17 = C52 * t15;
+    t4 = (-C51) * t0;
+    t2 = t17 + t4;
+    y[25] = 0;
+    t12 = (-0.07975813825300476) * t2;
+    y[294] = t12;
+    t10 = (-C53) * t18;
+    t16 = (-C54) * t13;
+    t1 = t10 + t16;
+    t8 = 0.07478768505676862 * t1;
+    y[473] = t8;
+    t9 = 0.06191719555714078 * t1;
+    y[486] = t9;
+    t11 = C54 * t18;
+    t14 = (-C53) * t13;
+    t6 = t11 + t14;
+    t3 = 0.034520136097357317 * t6;
+    y[153] = t3;
+    t15 = (-0.05499047041607303) * t6;
+    y[166] = t15;
+    t0 = C55 * t7;
+    t17 = C56 * t5;
+    t4 = t0 + t17;
+    y[38] = 0;
+    t2 = (-0.07984398377528498) * t4;
+    y[281] = t2;
+    t12 = (-C56) * t7;
+    t10 = C55 * t5;
+    t16 = t12 + t10;
+    t8 = 0.07827765730715747 * t16;
+    y[358] = t8;
+    t1 = (-0.004687378358449063) * t16;
+    y[601] = t1;
+    t9 = re[80];
+    t18 = im[80];
+    t13 = re[112];
+    t11 = im[112];
+    t14 = re[144];
+    t3 = im[144];
+    t6 = re[16];
+    t15 = im[16];
+    t0 = re[48];
+    t17 = im[48];
+    t4 = t13 + t0;
+    t2 = t11 + t17;
+    t7 = t14 + t6;
+    t5 = t3 + t15;
+    t12 = t13 - t0;
+    t10 = t11 - t17;
+    t8 = t14 - t6;
+    t16 = t3 - t15;
+    t1 = t4 + t7;
+    t13 = t2 + t5;
+    t0 = t4 - t7;
+    t11 = C14 * t0;
+    t17 = t2 - t5;
+    t14 = C14 * t17;
+    t6 = C15 * t1;
+    t3 = t9 - t6;
+    t15 = C15 * t13;
+    t4 = t18 - t15;
+    t7 = t3 + t11;
+    t0 = t4 + t14;
+    t2 = t3 - t11;
+    t5 = t4 - t14;
+    t17 = C13 * t12;
+    t6 = C16 * t8;
+    t15 = t17 + t6;
+    t3 = C13 * t10;
+    t11 = C16 * t16;
+    t4 = t3 + t11;
+    t14 = C16 * t12;
+    t17 = C13 * t8;
+    t6 = t14 - t17;
+    t3 = C16 * t10;
+    t11 = C13 * t16;
+    t12 = t3 - t11;
+    t8 = t9 + t1;
+    t14 = t18 + t13;
+    t17 = t7 + t4;
+    t10 = t0 - t15;
+    t16 = t2 + t12;
+    t3 = t5 - t6;
+    t11 = t2 - t12;
+    t9 = t5 + t6;
+    t1 = t7 - t4;
+    t18 = t0 + t15;
+    t13 = C57 * t8;
+    t2 = C58 * t14;
+    t12 = t13 + t2;
+    y[40] = 0;
+    t5 = (-0.07984800883388636) * t12;
+    y[279] = t5;
+    t6 = (-C58) * t8;
+    t7 = C57 * t14;
+    t4 = t6 + t7;
+    t0 = 0.07827371140841262 * t4;
+    y[360] = t0;
+    t15 = (-0.005112632604600919) * t4;
+    y[599] = t15;
+    t13 = (-C59) * t17;
+    t2 = (-C60) * t10;
+    t12 = t13 + t2;
+    t5 = 0.07809164250216843 * t12;
+    y[407] = t5;
+    t8 = (-0.005722778753227274) * t12;
+    y[552] = t8;
+    t14 = C60 * t17;
+    t6 = (-C59) * t10;
+    t7 = t14 + t6;
+    y[87] = 0;
+    t0 = (-0.08003417266868801) * t7;
+    y[232] = t0;
+    t4 = C61 * t16;
+    t15 = C62 * t3;
+    t13 = t4 + t15;
+    y[104] = 0;
+    t2 = (-0.07951795443212767) * t13;
+    y[215] = t2;
+    t5 = (-C62) * t16;
+    t12 = C61 * t3;
+    t8 = t5 + t12;
+    t17 = 0.0785986013427278 * t8;
+    y[424] = t17;
+    t10 = 0.0028522246127330657 * t8;
+    y[535] = t10;
+    t14 = (-C63) * t11;
+    t6 = (-C64) * t9;
+    t7 = t14 + t6;
+    t0 = 0.07838974698390234 * t7;
+    y[343] = t0;
+    t4 = (-0.0018062019202143727) * t7;
+    y[616] = t4;
+    t15 = C64 * t11;
+    t13 = (-C63) * t9;
+    t2 = t15 + t13;
+    y[23] = 0;
+    t16 = (-0.07972981468205868) * t2;
+    y[296] = t16;
+    t3 = (-C65) * t1;
+    t5 = (-C66) * t18;
+    t12 = t3 + t5;
+    t17 = 0.07615284897250663 * t12;
+    y[471] = t17;
+    t8 = 0.05941921293252666 * t12;
+    y[488] = t8;
+    t10 = C66 * t1;
+    t14 = (-C65) * t18;
+    t6 = t10 + t14;
+    t0 = 0.031218452451930608 * t6;
+    y[151] = t0;
+    t7 = (-0.057713193736474815) * t6;
+    y[168] = t7;
+}
+
+/**
+ *  Part 3 of ApplyWindowedIMDCT_W10_320_K80().
+ * 
+ *  @param {Number[]} X 
+ *    - The input block (320 points, only the first 80 points are used).
+ *  @param {Number[]} y 
+ *    - The array that would contain the output block (640 points).
+ *  @param {Number[]} re 
+ *    - The scratch buffer (real part, 160 points).
+ *  @param {Number[]} im 
+ *    - The scratch buffer (imaginary part, 160 points).
+ */
+function ApplyWindowedIMDCT_W10_320_K80_Part3(X, y, re, im) {
+    let t0, t1, t10, t11, t12, t13, t14, t15, t16, t17, t18, t2, t3, t4, t5, t6, t7, t8, t9;
+    const C0 = 0.5590169943749475;
+    const C1 = 0.25;
+    const C2 = 0.9510565162951535;
+    const C3 = 0.5877852522924731;
+    const C4 = 0.9986720177998429;
+    const C5 = 0.05151893694157748;
+    const C6 = 0.5453249884220465;
+    const C7 = 0.8382247055548381;
+    const C8 = 0.9338733031230915;
+    const C9 = 0.3576040459977578;
+    const C10 = 0.2596092046159851;
+    const C11 = 0.965713757217249;
+    const C12 = 0.7776605628587479;
+    const C13 = 0.6286843794577813;
+    const C14 = 0.7714510912715192;
+    const C15 = 0.6362886245847729;
+    const C16 = 0.9981181129001492;
+    const C17 = 0.06132073630220858;
+    const C18 = 0.5370695890326298;
+    const C19 = 0.843537940187827;
+    const C20 = 0.9303175856809415;
+    const C21 = 0.3667549451238308;
+    const C22 = 0.25011597343536635;
+    const C23 = 0.9682158849308758;
+    const C24 = 0.24059863555665045;
+    const C25 = 0.970624693982323;
+    const C26 = 0.765167265622459;
+    const C27 = 0.6438315428897914;
+    const C28 = 0.9974680072993071;
+    const C29 = 0.07111662544264533;
+    const C30 = 0.5287624257583957;
+    const C31 = 0.8487698728784482;
+    const C32 = 0.9266722022935726;
+    const C33 = 0.37587049564494945;
+    const C34 = 0.9229375043106232;
+    const C35 = 0.3849498189853822;
+    const C36 = 0.2310581082806711;
+    const C37 = 0.9729399522055602;
+    const C38 = 0.7588096915597616;
+    const C39 = 0.6513124073706714;
+    const C40 = 0.9967217636558474;
+    const C41 = 0.08090566021470375;
+    const C42 = 0.5204042992610306;
+    const C43 = 0.8539199993621391;
+    const C44 = 0.5119960151141623;
+    const C45 = 0.8589878232589904;
+    const C46 = 0.9191138516900578;
+    const C47 = 0.3939920400610481;
+    const C48 = 0.22149531114330429;
+    const C49 = 0.975161436451181;
+    const C50 = 0.7523789818396478;
+    const C51 = 0.6587304970061238;
+    const C52 = 0.9958794538942858;
+    const C53 = 0.09068689713083816;
+    const C54 = 0.99494115919819;
+    const C55 = 0.10045939345507647;
+    const C56 = 0.5035383837257176;
+    const C57 = 0.8639728561215868;
+    const C58 = 0.9152016129634745;
+    const C59 = 0.4029962873638599;
+    const C60 = 0.21191116582684155;
+    const C61 = 0.9772889326079104;
+    const C62 = 0.7458757562673048;
+    const C63 = 0.6660850968252301;
+    const C64 = 0.7393006416371488;
+    const C65 = 0.6733754979763521;
+    const C66 = 0.9939069700023561;
+    const C67 = 0.11022220729388306;
+    const C68 = 0.4950322202598127;
+    const C69 = 0.8688746174820854;
+    const C70 = 0.9112011652005843;
+    const C71 = 0.4119616930457218;
+    const C72 = 0.20230659607115642;
+    const C73 = 0.9793222356232406;
+    const C74 = 0.1926825275846723;
+    const C75 = 0.981261149523195;
+    const C76 = 0.7326542716724128;
+    const C77 = 0.680600997795453;
+    const C78 = 0.9927769859840909;
+    const C79 = 0.11997439768694032;
+    const C80 = 0.48647834455818684;
+    const C81 = 0.8736926348985243;
+    const C82 = 0.9071128939728691;
+    const C83 = 0.4208873930021738;
+    const C84 = 0.9029371933164189;
+    const C85 = 0.42977252695567697;
+    const C86 = 0.18303988795514095;
+    const C87 = 0.9831054874312163;
+    const C88 = 0.7259372869640676;
+    const C89 = 0.6877608998738217;
+    const C90 = 0.9915513160536062;
+    const C91 = 0.1297150246978405;
+    const C92 = 0.4778775810611837;
+    const C93 = 0.8784264440003566;
+    const C94 = 0.4692307587282903;
+    const C95 = 0.8830755885332088;
+    const C96 = 0.8986744656939538;
+    const C97 = 0.43861623853852766;
+    const C98 = 0.1733796065602395;
+    const C99 = 0.9848550715861784;
+    const C100 = 0.7191503349090794;
+    const C101 = 0.6948545141251936;
+    const C102 = 0.9902300783435211;
+    const C103 = 0.13944314950467876;
+    const C104 = 0.9888134001974757;
+    const C105 = 0.14915783449053857;
+    const C106 = 0.46053871095824;
+    const C107 = 0.8876396204028539;
+    const C108 = 0.8943251219560346;
+    const C109 = 0.4474176753753966;
+    const C110 = 0.16370261447799525;
+    const C111 = 0.9865097333595187;
+    const C112 = 0.7122940696480137;
+    const C113 = 0.7018811568522627;
+    const C114 = 0.7053691520019861;
+    const C115 = 0.7088401508125785;
+    const C116 = 0.9873014181578584;
+    const C117 = 0.15885814333386145;
+    const C118 = 0.4518022755086881;
+    const C119 = 0.8921180997184013;
+    const C120 = 0.889889581301463;
+    const C121 = 0.45617598916548296;
+    const C122 = 0.15400984439704607;
+    const C123 = 0.988069313271492;
+    const C124 = 0.14430223052674654;
+    const C125 = 0.9895336610065398;
+    const C126 = 0.6983762494089729;
+    const C127 = 0.7157308252838186;
+    const C128 = 0.9856942779526452;
+    const C129 = 0.16854314109869134;
+    const C130 = 0.44302229441546676;
+    const C131 = 0.8965105948346932;
+    const C132 = 0.8853682712368793;
+    const C133 = 0.4648903357642743;
+    const C134 = 0.8807616275355579;
+    const C135 = 0.47355987526490806;
+    const C136 = 0.13458070850712617;
+    const C137 = 0.99090263542778;
+    const C138 = 0.6913160358594803;
+    const C139 = 0.722552516128436;
+    const C140 = 0.9839921344813541;
+    const C141 = 0.1782118943247859;
+    const C142 = 0.43419961391142786;
+    const C143 = 0.900816682393908;
+    const C144 = 0.4253350843448814;
+    const C145 = 0.9050359473663644;
+    const C146 = 0.8760700941954066;
+    const C147 = 0.4821837720791227;
+    const C148 = 0.12484621531871118;
+    const C149 = 0.9921761045906085;
+    const C150 = 0.6841891918315852;
+    const C151 = 0.7293045658576686;
+    const C152 = 0.9821951518001156;
+    const C153 = 0.1878634711175852;
+    const C154 = 0.9803035031058607;
+    const C155 = 0.19749694123802963;
+    const C156 = 0.41642956009763715;
+    const C157 = 0.9091679830905224;
+    const C158 = 0.8712941233961736;
+    const C159 = 0.49076119501779414;
+    const C160 = 0.11509968919221586;
+    const C161 = 0.9933539457554167;
+    const C162 = 0.6769964042253483;
+    const C163 = 0.7359863236949099;
+    t4 = re[100];
+    t11 = im[100];
+    t9 = re[132];
+    t15 = im[132];
+    t13 = re[4];
+    t2 = im[4];
+    t16 = re[36];
+    t3 = im[36];
+    t5 = re[68];
+    t17 = im[68];
+    t12 = t9 + t5;
+    t8 = t15 + t17;
+    t1 = t13 + t16;
+    t18 = t2 + t3;
+    t10 = t9 - t5;
+    t14 = t15 - t17;
+    t0 = t13 - t16;
+    t6 = t2 - t3;
+    t7 = t12 + t1;
+    t9 = t8 + t18;
+    t5 = t12 - t1;
+    t15 = C0 * t5;
+    t17 = t8 - t18;
+    t13 = C0 * t17;
+    t16 = C1 * t7;
+    t2 = t4 - t16;
+    t3 = C1 * t9;
+    t12 = t11 - t3;
+    t1 = t2 + t15;
+    t5 = t12 + t13;
+    t8 = t2 - t15;
+    t18 = t12 - t13;
+    t17 = C2 * t10;
+    t16 = C3 * t0;
+    t3 = t17 + t16;
+    t2 = C2 * t14;
+    t15 = C3 * t6;
+    t12 = t2 + t15;
+    t13 = C3 * t10;
+    t17 = C2 * t0;
+    t16 = t13 - t17;
+    t2 = C3 * t14;
+    t15 = C2 * t6;
+    t10 = t2 - t15;
+    t0 = t4 + t7;
+    t13 = t11 + t9;
+    t17 = t1 + t12;
+    t14 = t5 - t3;
+    t6 = t8 + t10;
+    t2 = t18 - t16;
+    t15 = t8 - t10;
+    t4 = t18 + t16;
+    t7 = t1 - t12;
+    t11 = t5 + t3;
+    t9 = (-C4) * t0;
+    t8 = (-C5) * t13;
+    t10 = t9 + t8;
+    t18 = 0.07734301987131527 * t10;
+    y[469] = t18;
+    t16 = 0.05682077379979854 * t10;
+    y[490] = t16;
+    t1 = C5 * t0;
+    t12 = (-C4) * t13;
+    t5 = t1 + t12;
+    t3 = 0.027961403770009628 * t5;
+    y[149] = t3;
+    t9 = (-0.06026673653310746) * t5;
+    y[170] = t9;
+    t8 = C6 * t17;
+    t18 = C7 * t14;
+    t10 = t8 + t18;
+    y[42] = 0;
+    t16 = (-0.07985148385287637) * t10;
+    y[277] = t16;
+    t0 = (-C7) * t17;
+    t13 = C6 * t14;
+    t1 = t0 + t13;
+    t12 = 0.07827030505175593 * t1;
+    y[362] = t12;
+    t3 = (-0.005534064185263188) * t1;
+    y[597] = t3;
+    t5 = (-C8) * t6;
+    t9 = (-C9) * t2;
+    t8 = t5 + t9;
+    t18 = 0.07807511355243113 * t8;
+    y[405] = t18;
+    t10 = (-0.006326642346165435) * t8;
+    y[554] = t10;
+    t16 = C9 * t6;
+    t17 = (-C8) * t2;
+    t14 = t16 + t17;
+    y[85] = 0;
+    t0 = (-0.08005111636248635) * t14;
+    y[234] = t0;
+    t13 = C10 * t15;
+    t12 = C11 * t4;
+    t1 = t13 + t12;
+    y[106] = 0;
+    t3 = (-0.07939756861843485) * t1;
+    y[213] = t3;
+    t5 = (-C11) * t15;
+    t9 = C10 * t4;
+    t18 = t5 + t9;
+    t8 = 0.07871777572983324 * t18;
+    y[426] = t8;
+    t10 = 0.004322231781754117 * t18;
+    y[533] = t10;
+    t6 = (-C12) * t7;
+    t2 = (-C13) * t11;
+    t16 = t6 + t2;
+    t17 = 0.07842264533338364 * t16;
+    y[341] = t17;
+    t14 = (-0.0015092739897649792) * t16;
+    y[618] = t14;
+    t0 = C13 * t7;
+    t13 = (-C12) * t11;
+    t12 = t0 + t13;
+    y[21] = 0;
+    t1 = (-0.07969636797420614) * t12;
+    y[298] = t1;
+    t3 = re[120];
+    t15 = im[120];
+    t4 = re[152];
+    t5 = im[152];
+    t9 = re[24];
+    t8 = im[24];
+    t18 = re[56];
+    t10 = im[56];
+    t6 = re[88];
+    t2 = im[88];
+    t17 = t4 + t6;
+    t16 = t5 + t2;
+    t14 = t9 + t18;
+    t7 = t8 + t10;
+    t11 = t4 - t6;
+    t0 = t5 - t2;
+    t13 = t9 - t18;
+    t12 = t8 - t10;
+    t1 = t17 + t14;
+    t4 = t16 + t7;
+    t6 = t17 - t14;
+    t5 = C0 * t6;
+    t2 = t16 - t7;
+    t9 = C0 * t2;
+    t18 = C1 * t1;
+    t8 = t3 - t18;
+    t10 = C1 * t4;
+    t17 = t15 - t10;
+    t14 = t8 + t5;
+    t6 = t17 + t9;
+    t16 = t8 - t5;
+    t7 = t17 - t9;
+    t2 = C2 * t11;
+    t18 = C3 * t13;
+    t10 = t2 + t18;
+    t8 = C2 * t0;
+    t5 = C3 * t12;
+    t17 = t8 + t5;
+    t9 = C3 * t11;
+    t2 = C2 * t13;
+    t18 = t9 - t2;
+    t8 = C3 * t0;
+    t5 = C2 * t12;
+    t11 = t8 - t5;
+    t13 = t3 + t1;
+    t9 = t15 + t4;
+    t2 = t14 + t17;
+    t0 = t6 - t10;
+    t12 = t16 + t11;
+    t8 = t7 - t18;
+    t5 = t16 - t11;
+    t3 = t7 + t18;
+    t1 = t14 - t17;
+    t15 = t6 + t10;
+    t4 = (-C14) * t13;
+    t16 = (-C15) * t9;
+    t11 = t4 + t16;
+    t7 = 0.07846068721664735 * t11;
+    y[339] = t7;
+    t18 = (-0.0012403161494891884) * t11;
+    y[620] = t18;
+    t14 = C15 * t13;
+    t17 = (-C14) * t9;
+    t6 = t14 + t17;
+    y[19] = 0;
+    t10 = (-0.07965772696767702) * t6;
+    y[300] = t10;
+    t4 = (-C16) * t2;
+    t16 = (-C17) * t0;
+    t7 = t4 + t16;
+    t11 = 0.07835959668349907 * t7;
+    y[467] = t11;
+    t18 = 0.05413766123113763 * t7;
+    y[492] = t18;
+    t13 = C17 * t2;
+    t9 = (-C16) * t0;
+    t14 = t13 + t9;
+    t17 = 0.024781081945578775 * t14;
+    y[147] = t17;
+    t6 = (-0.06263955390830653) * t14;
+    y[172] = t6;
+    t10 = C18 * t12;
+    t4 = C19 * t8;
+    t16 = t10 + t4;
+    y[44] = 0;
+    t11 = (-0.07985497122541489) * t16;
+    y[275] = t11;
+    t7 = (-C19) * t12;
+    t18 = C18 * t8;
+    t2 = t7 + t18;
+    t0 = 0.07826688688369167 * t2;
+    y[364] = t0;
+    t13 = (-0.005947283706403402) * t2;
+    y[595] = t13;
+    t9 = (-C20) * t5;
+    t17 = (-C21) * t3;
+    t14 = t9 + t17;
+    t6 = 0.0780650096919715 * t14;
+    y[403] = t6;
+    t10 = (-0.006856511841418642) * t14;
+    y[556] = t10;
+    t4 = C21 * t5;
+    t16 = (-C20) * t3;
+    t11 = t4 + t16;
+    y[83] = 0;
+    t12 = (-0.08006147728234735) * t11;
+    y[236] = t12;
+    t8 = C22 * t1;
+    t7 = C23 * t15;
+    t18 = t8 + t7;
+    y[108] = 0;
+    t0 = (-0.07926007834812526) * t18;
+    y[211] = t0;
+    t2 = (-C23) * t1;
+    t13 = C22 * t15;
+    t9 = t2 + t13;
+    t17 = 0.07885432528275857 * t9;
+    y[428] = t17;
+    t6 = 0.005899910603536861 * t9;
+    y[531] = t6;
+    t14 = re[140];
+    t10 = im[140];
+    t5 = re[12];
+    t3 = im[12];
+    t4 = re[44];
+    t16 = im[44];
+    t11 = re[76];
+    t12 = im[76];
+    t8 = re[108];
+    t7 = im[108];
+    t18 = t5 + t8;
+    t0 = t3 + t7;
+    t1 = t4 + t11;
+    t15 = t16 + t12;
+    t2 = t5 - t8;
+    t13 = t3 - t7;
+    t17 = t4 - t11;
+    t9 = t16 - t12;
+    t6 = t18 + t1;
+    t5 = t0 + t15;
+    t8 = t18 - t1;
+    t3 = C0 * t8;
+    t7 = t0 - t15;
+    t4 = C0 * t7;
+    t11 = C1 * t6;
+    t16 = t14 - t11;
+    t12 = C1 * t5;
+    t18 = t10 - t12;
+    t1 = t16 + t3;
+    t8 = t18 + t4;
+    t0 = t16 - t3;
+    t15 = t18 - t4;
+    t7 = C2 * t2;
+    t11 = C3 * t17;
+    t12 = t7 + t11;
+    t16 = C2 * t13;
+    t3 = C3 * t9;
+    t18 = t16 + t3;
+    t4 = C3 * t2;
+    t7 = C2 * t17;
+    t11 = t4 - t7;
+    t16 = C3 * t13;
+    t3 = C2 * t9;
+    t2 = t16 - t3;
+    t17 = t14 + t6;
+    t4 = t10 + t5;
+    t7 = t1 + t18;
+    t13 = t8 - t12;
+    t9 = t0 + t2;
+    t16 = t15 - t11;
+    t3 = t0 - t2;
+    t14 = t15 + t11;
+    t6 = t1 - t18;
+    t10 = t8 + t12;
+    t5 = C24 * t17;
+    t0 = C25 * t4;
+    t2 = t5 + t0;
+    y[110] = 0;
+    t15 = (-0.07910392290808559) * t2;
+    y[209] = t15;
+    t11 = (-C25) * t17;
+    t1 = C24 * t4;
+    t18 = t11 + t1;
+    t8 = 0.07900998800352993 * t18;
+    y[430] = t8;
+    t12 = 0.0075870820171638305 * t18;
+    y[529] = t12;
+    t5 = (-C26) * t7;
+    t0 = (-C27) * t13;
+    t2 = t5 + t0;
+    t15 = 0.07850393454933578 * t2;
+    y[337] = t15;
+    t17 = (-0.00100033448048195) * t2;
+    y[622] = t17;
+    t4 = C27 * t7;
+    t11 = (-C26) * t13;
+    t1 = t4 + t11;
+    y[17] = 0;
+    t8 = (-0.07961384401787135) * t1;
+    y[302] = t8;
+    t18 = (-C28) * t9;
+    t12 = (-C29) * t16;
+    t5 = t18 + t12;
+    t0 = 0.07920667729745716 * t5;
+    y[465] = t0;
+    t15 = 0.05138642947995969 * t5;
+    y[494] = t15;
+    t2 = C29 * t9;
+    t17 = (-C28) * t16;
+    t7 = t2 + t17;
+    t13 = 0.021708977932100717 * t7;
+    y[145] = t13;
+    t4 = (-0.06482348851887695) * t7;
+    y[174] = t4;
+    t11 = C30 * t3;
+    t1 = C31 * t14;
+    t8 = t11 + t1;
+    y[46] = 0;
+    t18 = (-0.0798590925316545) * t8;
+    y[273] = t18;
+    t12 = (-C31) * t3;
+    t0 = C30 * t14;
+    t5 = t12 + t0;
+    t15 = 0.07826284774676884 * t5;
+    y[366] = t15;
+    t9 = (-0.006347861502626827) * t5;
+    y[593] = t9;
+    t16 = (-C32) * t6;
+    t2 = (-C33) * t10;
+    t17 = t16 + t2;
+    t13 = 0.0780607029671936 * t17;
+    y[401] = t13;
+    t7 = (-0.007315378642888369) * t17;
+    y[558] = t7;
+    t4 = C33 * t6;
+    t11 = (-C32) * t10;
+    t1 = t4 + t11;
+    y[81] = 0;
+    t8 = (-0.08006589439281213) * t1;
+    y[238] = t8;
+    t18 = re[5];
+    t3 = im[5];
+    t14 = re[37];
+    t12 = im[37];
+    t0 = re[69];
+    t15 = im[69];
+    t5 = re[101];
+    t9 = im[101];
+    t16 = re[133];
+    t2 = im[133];
+    t13 = t14 + t16;
+    t17 = t12 + t2;
+    t7 = t0 + t5;
+    t6 = t15 + t9;
+    t10 = t14 - t16;
+    t4 = t12 - t2;
+    t11 = t0 - t5;
+    t1 = t15 - t9;
+    t8 = t13 + t7;
+    t14 = t17 + t6;
+    t16 = t13 - t7;
+    t12 = C0 * t16;
+    t2 = t17 - t6;
+    t0 = C0 * t2;
+    t5 = C1 * t8;
+    t15 = t18 - t5;
+    t9 = C1 * t14;
+    t13 = t3 - t9;
+    t7 = t15 + t12;
+    t16 = t13 + t0;
+    t17 = t15 - t12;
+    t6 = t13 - t0;
+    t2 = C2 * t10;
+    t5 = C3 * t11;
+    t9 = t2 + t5;
+    t15 = C2 * t4;
+    t12 = C3 * t1;
+    t13 = t15 + t12;
+    t0 = C3 * t10;
+    t2 = C2 * t11;
+    t5 = t0 - t2;
+    t15 = C3 * t4;
+    t12 = C2 * t1;
+    t10 = t15 - t12;
+    t11 = t18 + t8;
+    t0 = t3 + t14;
+    t2 = t7 + t13;
+    t4 = t16 - t9;
+    t1 = t17 + t10;
+    t15 = t6 - t5;
+    t12 = t17 - t10;
+    t18 = t6 + t5;
+    t8 = t7 - t13;
+    t3 = t16 + t9;
+    t14 = (-C34) * t11;
+    t17 = (-C35) * t0;
+    t10 = t14 + t17;
+    t6 = 0.07806145671585792 * t10;
+    y[399] = t6;
+    t5 = (-0.00770552452765192) * t10;
+    y[560] = t5;
+    t7 = C35 * t11;
+    t13 = (-C34) * t0;
+    t16 = t7 + t13;
+    y[79] = 0;
+    t9 = (-0.08006512128962529) * t16;
+    y[240] = t9;
+    t14 = C36 * t2;
+    t17 = C37 * t4;
+    t6 = t14 + t17;
+    y[112] = 0;
+    t10 = (-0.07892736100051959) * t6;
+    y[207] = t10;
+    t5 = (-C37) * t2;
+    t11 = C36 * t4;
+    t0 = t5 + t11;
+    t7 = 0.07918673474916837 * t0;
+    y[432] = t7;
+    t13 = 0.009384974833630134 * t0;
+    y[527] = t13;
+    t16 = (-C38) * t1;
+    t9 = (-C39) * t15;
+    t14 = t16 + t9;
+    t17 = 0.07855225056629657 * t14;
+    y[335] = t17;
+    t6 = (-0.0007898186170955989) * t14;
+    y[624] = t6;
+    t10 = C39 * t1;
+    t2 = (-C38) * t15;
+    t4 = t10 + t2;
+    y[15] = 0;
+    t5 = (-0.07956487503467673) * t4;
+    y[304] = t5;
+    t11 = (-C40) * t12;
+    t7 = (-C41) * t18;
+    t0 = t11 + t7;
+    t13 = 0.0798911548658402 * t0;
+    y[463] = t13;
+    t16 = 0.04858411851028732 * t0;
+    y[496] = t16;
+    t9 = C41 * t12;
+    t17 = (-C40) * t18;
+    t14 = t9 + t17;
+    t6 = 0.018775250339183078 * t14;
+    y[143] = t6;
+    t1 = (-0.06681366693752928) * t14;
+    y[176] = t1;
+    t15 = C42 * t8;
+    t10 = C43 * t3;
+    t2 = t15 + t10;
+    y[48] = 0;
+    t4 = (-0.07986425164246268) * t2;
+    y[271] = t4;
+    t5 = (-C43) * t8;
+    t11 = C42 * t3;
+    t7 = t5 + t11;
+    t13 = 0.07825779208424921 * t7;
+    y[368] = t13;
+    t0 = (-0.006731007187738434) * t7;
+    y[591] = t0;
+    t16 = re[25];
+    t12 = im[25];
+    t18 = re[57];
+    t9 = im[57];
+    t17 = re[89];
+    t6 = im[89];
+    t14 = re[121];
+    t1 = im[121];
+    t15 = re[153];
+    t10 = im[153];
+    t2 = t18 + t15;
+    t4 = t9 + t10;
+    t8 = t17 + t14;
+    t3 = t6 + t1;
+    t5 = t18 - t15;
+    t11 = t9 - t10;
+    t13 = t17 - t14;
+    t7 = t6 - t1;
+    t0 = t2 + t8;
+    t18 = t4 + t3;
+    t15 = t2 - t8;
+    t9 = C0 * t15;
+    t10 = t4 - t3;
+    t17 = C0 * t10;
+    t14 = C1 * t0;
+    t6 = t16 - t14;
+    t1 = C1 * t18;
+    t2 = t12 - t1;
+    t8 = t6 + t9;
+    t15 = t2 + t17;
+    t4 = t6 - t9;
+    t3 = t2 - t17;
+    t10 = C2 * t5;
+    t14 = C3 * t13;
+    t1 = t10 + t14;
+    t6 = C2 * t11;
+    t9 = C3 * t7;
+    t2 = t6 + t9;
+    t17 = C3 * t5;
+    t10 = C2 * t13;
+    t14 = t17 - t10;
+    t6 = C3 * t11;
+    t9 = C2 * t7;
+    t5 = t6 - t9;
+    t13 = t16 + t0;
+    t17 = t12 + t18;
+    t10 = t8 + t2;
+    t11 = t15 - t1;
+    t7 = t4 + t5;
+    t6 = t3 - t14;
+    t9 = t4 - t5;
+    t16 = t3 + t14;
+    t0 = t8 - t2;
+    t12 = t15 + t1;
+    t18 = C44 * t13;
+    t4 = C45 * t17;
+    t5 = t18 + t4;
+    y[50] = 0;
+    t3 = (-0.07987086976732814) * t5;
+    y[269] = t3;
+    t14 = (-C45) * t13;
+    t8 = C44 * t17;
+    t2 = t14 + t8;
+    t15 = 0.07825130761949729 * t2;
+    y[370] = t15;
+    t1 = (-0.007092253041875984) * t2;
+    y[589] = t1;
+    t18 = (-C46) * t10;
+    t4 = (-C47) * t11;
+    t5 = t18 + t4;
+    t3 = 0.07806664449304893 * t5;
+    y[397] = t3;
+    t13 = (-0.008029601387179236) * t5;
+    y[562] = t13;
+    t17 = C47 * t10;
+    t14 = (-C46) * t11;
+    t8 = t17 + t14;
+    y[77] = 0;
+    t15 = (-0.0800598007072855) * t8;
+    y[242] = t15;
+    t2 = C48 * t7;
+    t1 = C49 * t6;
+    t18 = t2 + t1;
+    y[114] = 0;
+    t4 = (-0.07872876715165095) * t18;
+    y[205] = t4;
+    t3 = (-C49) * t7;
+    t5 = C48 * t6;
+    t13 = t3 + t5;
+    t10 = 0.07938648382440648 * t13;
+    y[434] = t10;
+    t11 = 0.011294046579022204 * t13;
+    y[525] = t11;
+    t17 = (-C50) * t9;
+    t14 = (-C51) * t16;
+    t8 = t17 + t14;
+    t15 = 0.07860548799126442 * t8;
+    y[333] = t15;
+    t2 = (-0.0006082496345561968) * t8;
+    y[626] = t2;
+    t1 = C51 * t9;
+    t18 = (-C50) * t16;
+    t4 = t1 + t18;
+    y[13] = 0;
+    t7 = (-0.07951098784215394) * t4;
+    y[306] = t7;
+    t6 = (-C52) * t0;
+    t3 = (-C53) * t12;
+    t5 = t6 + t3;
+    t10 = 0.08042166933048225 * t5;
+    y[461] = t10;
+    t13 = 0.045747664090940304 * t5;
+    y[498] = t13;
+    t11 = C53 * t0;
+    t17 = (-C52) * t12;
+    t14 = t11 + t17;
+    t15 = 0.016007887610726444 * t14;
+    y[141] = t15;
+    t8 = (-0.06860932607733869) * t14;
+    y[178] = t8;
+    t2 = re[45];
+    t9 = im[45];
+    t16 = re[77];
+    t1 = im[77];
+    t18 = re[109];
+    t4 = im[109];
+    t7 = re[141];
+    t6 = im[141];
+    t3 = re[13];
+    t10 = im[13];
+    t5 = t16 + t3;
+    t13 = t1 + t10;
+    t0 = t18 + t7;
+    t12 = t4 + t6;
+    t11 = t16 - t3;
+    t17 = t1 - t10;
+    t15 = t18 - t7;
+    t14 = t4 - t6;
+    t8 = t5 + t0;
+    t16 = t13 + t12;
+    t3 = t5 - t0;
+    t1 = C0 * t3;
+    t10 = t13 - t12;
+    t18 = C0 * t10;
+    t7 = C1 * t8;
+    t4 = t2 - t7;
+    t6 = C1 * t16;
+    t5 = t9 - t6;
+    t0 = t4 + t1;
+    t3 = t5 + t18;
+    t13 = t4 - t1;
+    t12 = t5 - t18;
+    t10 = C2 * t11;
+    t7 = C3 * t15;
+    t6 = t10 + t7;
+    t4 = C2 * t17;
+    t1 = C3 * t14;
+    t5 = t4 + t1;
+    t18 = C3 * t11;
+    t10 = C2 * t15;
+    t7 = t18 - t10;
+    t4 = C3 * t17;
+    t1 = C2 * t14;
+    t11 = t4 - t1;
+    t15 = t2 + t8;
+    t18 = t9 + t16;
+    t10 = t0 + t5;
+    t17 = t3 - t6;
+    t14 = t13 + t11;
+    t4 = t12 - t7;
+    t1 = t13 - t11;
+    t2 = t12 + t7;
+    t8 = t0 - t5;
+    t9 = t3 + t6;
+    t16 = (-C54) * t15;
+    t13 = (-C55) * t18;
+    t11 = t16 + t13;
+    t12 = 0.08080883281425316 * t11;
+    y[459] = t12;
+    t7 = 0.04289372215178292 * t11;
+    y[500] = t7;
+    t0 = C55 * t15;
+    t5 = (-C54) * t18;
+    t3 = t0 + t5;
+    t6 = 0.013432310384368186 * t3;
+    y[139] = t6;
+    t16 = (-0.0702130944467205) * t3;
+    y[180] = t16;
+    t13 = C56 * t10;
+    t12 = C57 * t17;
+    t11 = t13 + t12;
+    y[52] = 0;
+    t7 = (-0.07987915873304213) * t11;
+    y[267] = t7;
+    t15 = (-C57) * t10;
+    t18 = C56 * t17;
+    t0 = t15 + t18;
+    t5 = 0.07824318757396576 * t0;
+    y[372] = t5;
+    t6 = (-0.007427539565617188) * t0;
+    y[587] = t6;
+    t3 = (-C58) * t14;
+    t16 = (-C59) * t4;
+    t13 = t3 + t16;
+    t12 = 0.07807549860039238 * t13;
+    y[395] = t12;
+    t11 = (-0.00828995947322154) * t13;
+    y[564] = t11;
+    t7 = C59 * t14;
+    t10 = (-C58) * t4;
+    t17 = t7 + t10;
+    y[75] = 0;
+    t15 = (-0.08005072157129448) * t17;
+    y[244] = t15;
+    t18 = C60 * t1;
+    t5 = C61 * t2;
+    t0 = t18 + t5;
+    y[116] = 0;
+    t6 = (-0.07850650978497138) * t0;
+    y[203] = t6;
+    t3 = (-C61) * t1;
+    t16 = C60 * t2;
+    t12 = t3 + t16;
+    t13 = 0.07961123245853997 * t12;
+    y[436] = t13;
+    t11 = 0.013313517900273962 * t12;
+    y[523] = t11;
+    t14 = (-C62) * t8;
+    t4 = (-C63) * t9;
+    t7 = t14 + t4;
+    t10 = 0.07866326189821478 * t7;
+    y[331] = t10;
+    t17 = (-0.000454986335991667) * t7;
+    y[628] = t17;
+    t15 = C63 * t8;
+    t18 = (-C62) * t9;
+    t5 = t15 + t18;
+    y[11] = 0;
+    t0 = (-0.0794525913263945) * t5;
+    y[308] = t0;
+    t6 = re[65];
+    t1 = im[65];
+    t2 = re[97];
+    t3 = im[97];
+    t16 = re[129];
+    t13 = im[129];
+    t12 = re[1];
+    t11 = im[1];
+    t14 = re[33];
+    t4 = im[33];
+    t10 = t2 + t14;
+    t7 = t3 + t4;
+    t17 = t16 + t12;
+    t8 = t13 + t11;
+    t9 = t2 - t14;
+    t15 = t3 - t4;
+    t18 = t16 - t12;
+    t5 = t13 - t11;
+    t0 = t10 + t17;
+    t2 = t7 + t8;
+    t14 = t10 - t17;
+    t3 = C0 * t14;
+    t4 = t7 - t8;
+    t16 = C0 * t4;
+    t12 = C1 * t0;
+    t13 = t6 - t12;
+    t11 = C1 * t2;
+    t10 = t1 - t11;
+    t17 = t13 + t3;
+    t14 = t10 + t16;
+    t7 = t13 - t3;
+    t8 = t10 - t16;
+    t4 = C2 * t9;
+    t12 = C3 * t18;
+    t11 = t4 + t12;
+    t13 = C2 * t15;
+    t3 = C3 * t5;
+    t10 = t13 + t3;
+    t16 = C3 * t9;
+    t4 = C2 * t18;
+    t12 = t16 - t4;
+    t13 = C3 * t15;
+    t3 = C2 * t5;
+    t9 = t13 - t3;
+    t18 = t6 + t0;
+    t16 = t1 + t2;
+    t4 = t17 + t10;
+    t15 = t14 - t11;
+    t5 = t7 + t9;
+    t13 = t8 - t12;
+    t3 = t7 - t9;
+    t6 = t8 + t12;
+    t0 = t17 - t10;
+    t1 = t14 + t11;
+    t2 = (-C64) * t18;
+    t7 = (-C65) * t16;
+    t9 = t2 + t7;
+    t8 = 0.07872520840851852 * t9;
+    y[329] = t8;
+    t12 = (-0.0003285577883509001) * t9;
+    y[630] = t12;
+    t17 = C65 * t18;
+    t10 = (-C64) * t16;
+    t14 = t17 + t10;
+    y[9] = 0;
+    t11 = (-0.07939007246024282) * t14;
+    y[310] = t11;
+    t2 = (-C66) * t4;
+    t7 = (-C67) * t15;
+    t8 = t2 + t7;
+    t9 = 0.08106504589428773 * t8;
+    y[457] = t9;
+    t12 = 0.04003874813103435 * t8;
+    y[502] = t12;
+    t18 = C67 * t4;
+    t16 = (-C66) * t15;
+    t17 = t18 + t16;
+    t10 = 0.011069855000296981 * t17;
+    y[137] = t10;
+    t14 = (-0.07163108093922897) * t17;
+    y[182] = t14;
+    t11 = C68 * t5;
+    t2 = C69 * t13;
+    t7 = t11 + t2;
+    y[54] = 0;
+    t9 = (-0.07988930163961726) * t7;
+    y[265] = t9;
+    t8 = (-C69) * t5;
+    t12 = C68 * t13;
+    t4 = t8 + t12;
+    t15 = 0.07823325366134647 * t4;
+    y[374] = t15;
+    t18 = (-0.007732435532826085) * t4;
+    y[585] = t18;
+    t16 = (-C70) * t3;
+    t10 = (-C71) * t6;
+    t17 = t16 + t10;
+    t14 = 0.07808737864458444 * t17;
+    y[393] = t14;
+    t11 = (-0.00848865954933994) * t17;
+    y[566] = t11;
+    t2 = C71 * t3;
+    t7 = (-C70) * t6;
+    t9 = t2 + t7;
+    y[73] = 0;
+    t5 = (-0.08003854282837364) * t9;
+    y[246] = t5;
+    t13 = C72 * t0;
+    t8 = C73 * t1;
+    t12 = t13 + t8;
+    y[118] = 0;
+    t15 = (-0.07825954791313729) * t12;
+    y[201] = t15;
+    t4 = (-C73) * t0;
+    t18 = C72 * t1;
+    t16 = t4 + t18;
+    t10 = 0.07986245981048944 * t16;
+    y[438] = t10;
+    t14 = 0.015441985894296665 * t16;
+    y[521] = t14;
+    t17 = re[85];
+    t11 = im[85];
+    t3 = re[117];
+    t6 = im[117];
+    t2 = re[149];
+    t7 = im[149];
+    t9 = re[21];
+    t5 = im[21];
+    t13 = re[53];
+    t8 = im[53];
+    t12 = t3 + t13;
+    t15 = t6 + t8;
+    t0 = t2 + t9;
+    t1 = t7 + t5;
+    t4 = t3 - t13;
+    t18 = t6 - t8;
+    t10 = t2 - t9;
+    t16 = t7 - t5;
+    t14 = t12 + t0;
+    t3 = t15 + t1;
+    t13 = t12 - t0;
+    t6 = C0 * t13;
+    t8 = t15 - t1;
+    t2 = C0 * t8;
+    t9 = C1 * t14;
+    t7 = t17 - t9;
+    t5 = C1 * t3;
+    t12 = t11 - t5;
+    t0 = t7 + t6;
+    t13 = t12 + t2;
+    t15 = t7 - t6;
+    t1 = t12 - t2;
+    t8 = C2 * t4;
+    t9 = C3 * t10;
+    t5 = t8 + t9;
+    t7 = C2 * t18;
+    t6 = C3 * t16;
+    t12 = t7 + t6;
+    t2 = C3 * t4;
+    t8 = C2 * t10;
+    t9 = t2 - t8;
+    t7 = C3 * t18;
+    t6 = C2 * t16;
+    t4 = t7 - t6;
+    t10 = t17 + t14;
+    t2 = t11 + t3;
+    t8 = t0 + t12;
+    t18 = t13 - t5;
+    t16 = t15 + t4;
+    t7 = t1 - t9;
+    t6 = t15 - t4;
+    t17 = t1 + t9;
+    t14 = t0 - t12;
+    t11 = t13 + t5;
+    t3 = C74 * t10;
+    t15 = C75 * t2;
+    t4 = t3 + t15;
+    t1 = 0.0003517772216361772 * t4;
+    y[120] = t1;
+    t9 = (-0.07794557950580416) * t4;
+    y[199] = t9;
+    t0 = (-C75) * t10;
+    t12 = C74 * t2;
+    t13 = t0 + t12;
+    t5 = 0.08010437254240924 * t13;
+    y[440] = t5;
+    t3 = 0.017676702329292165 * t13;
+    y[519] = t3;
+    t15 = (-C76) * t8;
+    t1 = (-C77) * t18;
+    t4 = t15 + t1;
+    t9 = 0.07879071480259427 * t4;
+    y[327] = t9;
+    t10 = (-0.00022705217394369635) * t4;
+    y[632] = t10;
+    t2 = C77 * t8;
+    t0 = (-C76) * t18;
+    t12 = t2 + t0;
+    y[7] = 0;
+    t5 = (-0.07932406776177908) * t12;
+    y[312] = t5;
+    t13 = (-C78) * t16;
+    t3 = (-C79) * t7;
+    t15 = t13 + t3;
+    t1 = 0.08120448463398589 * t15;
+    y[455] = t1;
+    t9 = 0.03719820422294464 * t15;
+    y[504] = t9;
+    t4 = C79 * t16;
+    t10 = (-C78) * t7;
+    t8 = t4 + t10;
+    t18 = 0.008937659462298152 * t8;
+    y[135] = t18;
+    t2 = (-0.07287202356764515) * t8;
+    y[184] = t2;
+    t0 = C80 * t6;
+    t12 = C81 * t17;
+    t5 = t0 + t12;
+    y[56] = 0;
+    t13 = (-0.07990125288587499) * t5;
+    y[263] = t13;
+    t3 = (-C81) * t6;
+    t1 = C80 * t17;
+    t15 = t3 + t1;
+    t9 = 0.07822155190641425 * t15;
+    y[376] = t9;
+    t16 = (-0.008003417742740937) * t15;
+    y[583] = t16;
+    t7 = (-C82) * t14;
+    t4 = (-C83) * t11;
+    t10 = t7 + t4;
+    t18 = 0.07810154602265036 * t10;
+    y[391] = t18;
+    t8 = (-0.00862790402088222) * t10;
+    y[568] = t8;
+    t2 = C83 * t14;
+    t0 = (-C82) * t11;
+    t12 = t2 + t0;
+    y[71] = 0;
+    t5 = (-0.08002402408509847) * t12;
+    y[248] = t5;
+    t13 = re[105];
+    t6 = im[105];
+    t17 = re[137];
+    t3 = im[137];
+    t1 = re[9];
+    t9 = im[9];
+    t15 = re[41];
+    t16 = im[41];
+    t7 = re[73];
+    t4 = im[73];
+    t18 = t17 + t7;
+    t10 = t3 + t4;
+    t8 = t1 + t15;
+    t14 = t9 + t16;
+    t11 = t17 - t7;
+    t2 = t3 - t4;
+    t0 = t1 - t15;
+    t12 = t9 - t16;
+    t5 = t18 + t8;
+    t17 = t10 + t14;
+    t7 = t18 - t8;
+    t3 = C0 * t7;
+    t4 = t10 - t14;
+    t1 = C0 * t4;
+    t15 = C1 * t5;
+    t9 = t13 - t15;
+    t16 = C1 * t17;
+    t18 = t6 - t16;
+    t8 = t9 + t3;
+    t7 = t18 + t1;
+    t10 = t9 - t3;
+    t14 = t18 - t1;
+    t4 = C2 * t11;
+    t15 = C3 * t0;
+    t16 = t4 + t15;
+    t9 = C2 * t2;
+    t3 = C3 * t12;
+    t18 = t9 + t3;
+    t1 = C3 * t11;
+    t4 = C2 * t0;
+    t15 = t1 - t4;
+    t9 = C3 * t2;
+    t3 = C2 * t12;
+    t11 = t9 - t3;
+    t0 = t13 + t5;
+    t1 = t6 + t17;
+    t4 = t8 + t18;
+    t2 = t7 - t16;
+    t12 = t10 + t11;
+    t9 = t14 - t15;
+    t3 = t10 - t11;
+    t13 = t14 + t15;
+    t5 = t8 - t18;
+    t6 = t7 + t16;
+    t17 = (-C84) * t0;
+    t10 = (-C85) * t1;
+    t11 = t17 + t10;
+    t14 = 0.0781174046680525 * t11;
+    y[389] = t14;
+    t15 = (-0.008710013292504275) * t11;
+    y[570] = t15;
+    t8 = C85 * t0;
+    t18 = (-C84) * t1;
+    t7 = t8 + t18;
+    y[69] = 0;
+    t16 = (-0.08000777837612989) * t7;
+    y[250] = t16;
+    t17 = C86 * t4;
+    t10 = C87 * t2;
+    t14 = t17 + t10;
+    t11 = 0.0009200547972867385 * t14;
+    y[122] = t11;
+    t15 = (-0.07756610969358985) * t14;
+    y[197] = t15;
+    t0 = (-C87) * t4;
+    t1 = C86 * t2;
+    t8 = t0 + t1;
+    t18 = 0.08033903605838183 * t8;
+    y[442] = t18;
+    t7 = 0.020013499709567478 * t8;
+    y[517] = t7;
+    t16 = (-C88) * t12;
+    t17 = (-C89) * t9;
+    t10 = t16 + t17;
+    t11 = 0.07885922470484415 * t10;
+    y[325] = t11;
+    t14 = (-0.00014811107628344213) * t10;
+    y[634] = t14;
+    t15 = C89 * t12;
+    t4 = (-C88) * t9;
+    t2 = t15 + t4;
+    y[5] = 0;
+    t0 = (-0.07925515402151904) * t2;
+    y[314] = t0;
+    t1 = (-C90) * t3;
+    t18 = (-C91) * t13;
+    t8 = t1 + t18;
+    t7 = 0.08124242814953461 * t8;
+    y[453] = t7;
+    t16 = 0.034387157709965845 * t8;
+    y[506] = t16;
+    t17 = C91 * t3;
+    t11 = (-C90) * t13;
+    t10 = t17 + t11;
+    t14 = 0.007047155047572928 * t10;
+    y[133] = t14;
+    t12 = (-0.07394742506852245) * t10;
+    y[186] = t12;
+    t9 = C92 * t5;
+    t15 = C93 * t6;
+    t4 = t9 + t15;
+    y[58] = 0;
+    t2 = (-0.07991498046591929) * t4;
+    y[261] = t2;
+    t0 = (-C93) * t5;
+    t1 = C92 * t6;
+    t18 = t0 + t1;
+    t7 = 0.07820811521896559 * t18;
+    y[378] = t7;
+    t8 = (-0.008236636173384312) * t18;
+    y[581] = t8;
+    t16 = re[125];
+    t3 = im[125];
+    t13 = re[157];
+    t17 = im[157];
+    t11 = re[29];
+    t14 = im[29];
+    t10 = re[61];
+    t12 = im[61];
+    t9 = re[93];
+    t15 = im[93];
+    t4 = t13 + t9;
+    t2 = t17 + t15;
+    t5 = t11 + t10;
+    t6 = t14 + t12;
+    t0 = t13 - t9;
+    t1 = t17 - t15;
+    t7 = t11 - t10;
+    t18 = t14 - t12;
+    t8 = t4 + t5;
+    t13 = t2 + t6;
+    t9 = t4 - t5;
+    t17 = C0 * t9;
+    t15 = t2 - t6;
+    t11 = C0 * t15;
+    t10 = C1 * t8;
+    t14 = t16 - t10;
+    t12 = C1 * t13;
+    t4 = t3 - t12;
+    t5 = t14 + t17;
+    t9 = t4 + t11;
+    t2 = t14 - t17;
+    t6 = t4 - t11;
+    t15 = C2 * t0;
+    t10 = C3 * t7;
+    t12 = t15 + t10;
+    t14 = C2 * t1;
+    t17 = C3 * t18;
+    t4 = t14 + t17;
+    t11 = C3 * t0;
+    t15 = C2 * t7;
+    t10 = t11 - t15;
+    t14 = C3 * t1;
+    t17 = C2 * t18;
+    t0 = t14 - t17;
+    t7 = t16 + t8;
+    t11 = t3 + t13;
+    t15 = t5 + t4;
+    t1 = t9 - t12;
+    t18 = t2 + t0;
+    t14 = t6 - t10;
+    t17 = t2 - t0;
+    t16 = t6 + t10;
+    t8 = t5 - t4;
+    t3 = t9 + t12;
+    t13 = C94 * t7;
+    t2 = C95 * t11;
+    t0 = t13 + t2;
+    y[60] = 0;
+    t6 = (-0.07993020077294767) * t0;
+    y[259] = t6;
+    t10 = (-C95) * t7;
+    t5 = C94 * t11;
+    t4 = t10 + t5;
+    t9 = 0.0781932228314296 * t4;
+    y[380] = t9;
+    t12 = (-0.008428741800686423) * t4;
+    y[579] = t12;
+    t13 = (-C96) * t15;
+    t2 = (-C97) * t1;
+    t0 = t13 + t2;
+    t6 = 0.07813426029130742 * t0;
+    y[387] = t6;
+    t7 = (-0.008736648715340965) * t0;
+    y[572] = t7;
+    t11 = C97 * t15;
+    t10 = (-C96) * t1;
+    t5 = t11 + t10;
+    y[67] = 0;
+    t9 = (-0.07999051858554966) * t5;
+    y[252] = t9;
+    t4 = C98 * t18;
+    t12 = C99 * t14;
+    t13 = t4 + t12;
+    t2 = 0.0015397724767375375 * t13;
+    y[124] = t2;
+    t6 = (-0.07713298043845977) * t13;
+    y[195] = t6;
+    t0 = (-C99) * t18;
+    t7 = C98 * t14;
+    t15 = t0 + t7;
+    t1 = 0.08058079051105971 * t15;
+    y[444] = t1;
+    t11 = 0.02244712275156356 * t15;
+    y[515] = t11;
+    t10 = (-C100) * t17;
+    t5 = (-C101) * t16;
+    t9 = t10 + t5;
+    t4 = 0.0789299805782335 * t9;
+    y[323] = t4;
+    t12 = (-8.906834541416462e-05) * t9;
+    y[636] = t12;
+    t2 = C101 * t17;
+    t13 = (-C100) * t16;
+    t6 = t2 + t13;
+    y[3] = 0;
+    t18 = (-0.07918410665013594) * t6;
+    y[316] = t18;
+    t14 = (-C102) * t8;
+    t0 = (-C103) * t3;
+    t7 = t14 + t0;
+    t1 = 0.08119431733865926 * t7;
+    y[451] = t1;
+    t15 = 0.03161970808366637 * t7;
+    y[508] = t15;
+    t11 = C103 * t8;
+    t10 = (-C102) * t3;
+    t5 = t11 + t10;
+    t4 = 0.005404191194233247 * t5;
+    y[131] = t4;
+    t9 = (-0.0748712625620606) * t5;
+    y[188] = t9;
+    t12 = re[145];
+    t17 = im[145];
+    t16 = re[17];
+    t2 = im[17];
+    t13 = re[49];
+    t6 = im[49];
+    t18 = re[81];
+    t14 = im[81];
+    t0 = re[113];
+    t1 = im[113];
+    t7 = t16 + t0;
+    t15 = t2 + t1;
+    t8 = t13 + t18;
+    t3 = t6 + t14;
+    t11 = t16 - t0;
+    t10 = t2 - t1;
+    t4 = t13 - t18;
+    t5 = t6 - t14;
+    t9 = t7 + t8;
+    t16 = t15 + t3;
+    t0 = t7 - t8;
+    t2 = C0 * t0;
+    t1 = t15 - t3;
+    t13 = C0 * t1;
+    t18 = C1 * t9;
+    t6 = t12 - t18;
+    t14 = C1 * t16;
+    t7 = t17 - t14;
+    t8 = t6 + t2;
+    t0 = t7 + t13;
+    t15 = t6 - t2;
+    t3 = t7 - t13;
+    t1 = C2 * t11;
+    t18 = C3 * t4;
+    t14 = t1 + t18;
+    t6 = C2 * t10;
+    t2 = C3 * t5;
+    t7 = t6 + t2;
+    t13 = C3 * t11;
+    t1 = C2 * t4;
+    t18 = t13 - t1;
+    t6 = C3 * t10;
+    t2 = C2 * t5;
+    t11 = t6 - t2;
+    t4 = t12 + t9;
+    t13 = t17 + t16;
+    t1 = t8 + t7;
+    t10 = t0 - t14;
+    t5 = t15 + t11;
+    t6 = t3 - t18;
+    t2 = t15 - t11;
+    t12 = t3 + t18;
+    t9 = t8 - t7;
+    t17 = t0 + t14;
+    t16 = (-C104) * t4;
+    t15 = (-C105) * t13;
+    t11 = t16 + t15;
+    t3 = 0.08107670419942832 * t11;
+    y[449] = t3;
+    t18 = 0.028908280442592 * t11;
+    y[510] = t18;
+    t8 = C105 * t4;
+    t7 = (-C104) * t13;
+    t0 = t8 + t7;
+    t14 = 0.004008102353092296 * t0;
+    y[129] = t14;
+    t16 = (-0.07565838687825509) * t0;
+    y[190] = t16;
+    t15 = C106 * t1;
+    t3 = C107 * t10;
+    t11 = t15 + t3;
+    y[62] = 0;
+    t18 = (-0.07994667977204827) * t11;
+    y[257] = t18;
+    t4 = (-C107) * t1;
+    t13 = C106 * t10;
+    t8 = t4 + t13;
+    t7 = 0.07817710526341563 * t8;
+    y[382] = t7;
+    t14 = (-0.00857698481964919) * t8;
+    y[577] = t14;
+    t0 = (-C108) * t5;
+    t16 = (-C109) * t6;
+    t15 = t0 + t16;
+    t3 = 0.07815155601597573 * t15;
+    y[385] = t3;
+    t11 = (-0.008710563872349865) * t15;
+    y[574] = t11;
+    t18 = C109 * t5;
+    t1 = (-C108) * t6;
+    t10 = t18 + t1;
+    y[65] = 0;
+    t4 = (-0.07997281587998553) * t10;
+    y[254] = t4;
+    t13 = C110 * t2;
+    t7 = C111 * t12;
+    t8 = t13 + t7;
+    t14 = 0.0023608903596866793 * t8;
+    y[126] = t14;
+    t0 = (-0.07661769202193537) * t8;
+    y[193] = t0;
+    t16 = (-C111) * t2;
+    t3 = C110 * t12;
+    t15 = t16 + t3;
+    t11 = 0.08080439208166479 * t15;
+    y[446] = t11;
+    t5 = 0.024971076367611027 * t15;
+    y[513] = t5;
+    t6 = (-C112) * t9;
+    t18 = (-C113) * t17;
+    t1 = t6 + t18;
+    t10 = 0.07900226121891851 * t1;
+    y[321] = t10;
+    t4 = (-4.6388537934607385e-05) * t1;
+    y[638] = t4;
+    t13 = C113 * t9;
+    t7 = (-C112) * t17;
+    t14 = t13 + t7;
+    y[1] = 0;
+    t8 = (-0.07911165963567798) * t14;
+    y[318] = t8;
+    t0 = re[10];
+    t2 = im[10];
+    t12 = re[42];
+    t16 = im[42];
+    t3 = re[74];
+    t11 = im[74];
+    t15 = re[106];
+    t5 = im[106];
+    t6 = re[138];
+    t18 = im[138];
+    t10 = t12 + t6;
+    t1 = t16 + t18;
+    t4 = t3 + t15;
+    t9 = t11 + t5;
+    t17 = t12 - t6;
+    t13 = t16 - t18;
+    t7 = t3 - t15;
+    t14 = t11 - t5;
+    t8 = t10 + t4;
+    t12 = t1 + t9;
+    t6 = t10 - t4;
+    t16 = C0 * t6;
+    t18 = t1 - t9;
+    t3 = C0 * t18;
+    t15 = C1 * t8;
+    t11 = t0 - t15;
+    t5 = C1 * t12;
+    t10 = t2 - t5;
+    t4 = t11 + t16;
+    t6 = t10 + t3;
+    t1 = t11 - t16;
+    t9 = t10 - t3;
+    t18 = C2 * t17;
+    t15 = C3 * t7;
+    t5 = t18 + t15;
+    t11 = C2 * t13;
+    t16 = C3 * t14;
+    t10 = t11 + t16;
+    t3 = C3 * t17;
+    t18 = C2 * t7;
+    t15 = t3 - t18;
+    t11 = C3 * t13;
+    t16 = C2 * t14;
+    t17 = t11 - t16;
+    t7 = t0 + t8;
+    t3 = t2 + t12;
+    t18 = t4 + t10;
+    t13 = t6 - t5;
+    t14 = t1 + t17;
+    t11 = t9 - t15;
+    t16 = t1 - t17;
+    t0 = t9 + t15;
+    t8 = t4 - t10;
+    t2 = t6 + t5;
+    t12 = C114 * t7;
+    t1 = C115 * t3;
+    t17 = t12 + t1;
+    y[0] = 0;
+    t9 = (-0.07907521403597356) * t17;
+    y[319] = t9;
+    t15 = (-C115) * t7;
+    t4 = C114 * t3;
+    t10 = t15 + t4;
+    t6 = 0.07903867319482309 * t10;
+    y[320] = t6;
+    t5 = (-2.3884315505491365e-05) * t10;
+    y[639] = t5;
+    t12 = (-C116) * t18;
+    t1 = (-C117) * t13;
+    t17 = t12 + t1;
+    t9 = 0.08090535634060078 * t17;
+    y[447] = t9;
+    t7 = 0.026264380520193423 * t17;
+    y[512] = t7;
+    t3 = C117 * t18;
+    t15 = (-C116) * t13;
+    t4 = t3 + t15;
+    t6 = 0.0028523908353459116 * t4;
+    y[127] = t6;
+    t10 = (-0.07632478244965488) * t4;
+    y[192] = t10;
+    t5 = C118 * t14;
+    t12 = C119 * t11;
+    t1 = t5 + t12;
+    y[64] = 0;
+    t9 = (-0.07996398566998175) * t1;
+    y[255] = t9;
+    t17 = (-C119) * t14;
+    t7 = C118 * t11;
+    t18 = t17 + t7;
+    t13 = 0.07816018608419902 * t18;
+    y[384] = t13;
+    t3 = (-0.008678366232986501) * t18;
+    y[575] = t3;
+    t15 = (-C120) * t16;
+    t6 = (-C121) * t0;
+    t4 = t15 + t6;
+    t10 = 0.07816870410371515 * t4;
+    y[383] = t10;
+    t5 = (-0.008633709146849975) * t4;
+    y[576] = t5;
+    t12 = C121 * t16;
+    t1 = (-C120) * t0;
+    t9 = t12 + t1;
+    y[63] = 0;
+    t14 = (-0.07995527201918852) * t9;
+    y[256] = t14;
+    t11 = C122 * t8;
+    t17 = C123 * t2;
+    t7 = t11 + t17;
+    t13 = 0.0034008064960340165 * t7;
+    y[128] = t13;
+    t18 = (-0.07600568836960063) * t7;
+    y[191] = t18;
+    t3 = (-C123) * t8;
+    t15 = C122 * t2;
+    t6 = t3 + t15;
+    t10 = 0.08099677233079813 * t6;
+    y[448] = t10;
+    t4 = 0.027577153652004537 * t6;
+    y[511] = t4;
+    t5 = re[30];
+    t16 = im[30];
+    t0 = re[62];
+    t12 = im[62];
+    t1 = re[94];
+    t9 = im[94];
+    t14 = re[126];
+    t11 = im[126];
+    t17 = re[158];
+    t13 = im[158];
+    t7 = t0 + t17;
+    t18 = t12 + t13;
+    t8 = t1 + t14;
+    t2 = t9 + t11;
+    t3 = t0 - t17;
+    t15 = t12 - t13;
+    t10 = t1 - t14;
+    t6 = t9 - t11;
+    t4 = t7 + t8;
+    t0 = t18 + t2;
+    t17 = t7 - t8;
+    t12 = C0 * t17;
+    t13 = t18 - t2;
+    t1 = C0 * t13;
+    t14 = C1 * t4;
+    t9 = t5 - t14;
+    t11 = C1 * t0;
+    t7 = t16 - t11;
+    t8 = t9 + t12;
+    t17 = t7 + t1;
+    t18 = t9 - t12;
+    t2 = t7 - t1;
+    t13 = C2 * t3;
+    t14 = C3 * t10;
+    t11 = t13 + t14;
+    t9 = C2 * t15;
+    t12 = C3 * t6;
+    t7 = t9 + t12;
+    t1 = C3 * t3;
+    t13 = C2 * t10;
+    t14 = t1 - t13;
+    t9 = C3 * t15;
+    t12 = C2 * t6;
+    t3 = t9 - t12;
+    t10 = t5 + t4;
+    t1 = t16 + t0;
+    t13 = t8 + t7;
+    t15 = t17 - t11;
+    t6 = t18 + t3;
+    t9 = t2 - t14;
+    t12 = t18 - t3;
+    t5 = t2 + t14;
+    t4 = t8 - t7;
+    t16 = t17 + t11;
+    t0 = C124 * t10;
+    t18 = C125 * t1;
+    t3 = t0 + t18;
+    t2 = 0.004675594754473637 * t3;
+    y[130] = t2;
+    t14 = (-0.07528092638447868) * t3;
+    y[189] = t14;
+    t8 = (-C125) * t10;
+    t7 = C124 * t1;
+    t17 = t8 + t7;
+    t11 = 0.08114318050945657 * t17;
+    y[450] = t11;
+    t0 = 0.03025630083312543 * t17;
+    y[509] = t0;
+    t18 = C126 * t13;
+    t2 = C127 * t15;
+    t3 = t18 + t2;
+    y[2] = 0;
+    t14 = (-0.07914801620130785) * t3;
+    y[317] = t14;
+    t10 = (-C127) * t13;
+    t1 = C126 * t15;
+    t8 = t10 + t1;
+    t7 = 0.07896597160570053 * t8;
+    y[322] = t7;
+    t11 = (-6.614302176500143e-05) * t8;
+    y[637] = t11;
+    t17 = (-C128) * t6;
+    t0 = (-C129) * t9;
+    t18 = t17 + t0;
+    t2 = 0.08069566222116688 * t18;
+    y[445] = t2;
+    t3 = 0.02369830053931917 * t18;
+    y[514] = t3;
+    t14 = C129 * t6;
+    t13 = (-C128) * t9;
+    t15 = t14 + t13;
+    t10 = 0.0019240266974218081 * t15;
+    y[125] = t10;
+    t1 = (-0.07688646039082105) * t15;
+    y[194] = t1;
+    t7 = C130 * t12;
+    t8 = C131 * t5;
+    t11 = t7 + t8;
+    y[66] = 0;
+    t17 = (-0.07998170347656396) * t11;
+    y[253] = t17;
+    t0 = (-C131) * t12;
+    t2 = C130 * t5;
+    t18 = t0 + t2;
+    t3 = 0.07814287178606243 * t18;
+    y[386] = t3;
+    t6 = (-0.008730035710984) * t18;
+    y[573] = t6;
+    t9 = (-C132) * t4;
+    t14 = (-C133) * t16;
+    t13 = t9 + t14;
+    t10 = 0.07818529382762993 * t13;
+    y[381] = t10;
+    t15 = (-0.008508545900253557) * t13;
+    y[578] = t15;
+    t1 = C133 * t4;
+    t7 = (-C132) * t16;
+    t8 = t1 + t7;
+    y[61] = 0;
+    t11 = (-0.07993830673296405) * t8;
+    y[258] = t11;
+    t17 = re[50];
+    t12 = im[50];
+    t5 = re[82];
+    t0 = im[82];
+    t2 = re[114];
+    t3 = im[114];
+    t18 = re[146];
+    t6 = im[146];
+    t9 = re[18];
+    t14 = im[18];
+    t10 = t5 + t9;
+    t13 = t0 + t14;
+    t15 = t2 + t18;
+    t4 = t3 + t6;
+    t16 = t5 - t9;
+    t1 = t0 - t14;
+    t7 = t2 - t18;
+    t8 = t3 - t6;
+    t11 = t10 + t15;
+    t5 = t13 + t4;
+    t9 = t10 - t15;
+    t0 = C0 * t9;
+    t14 = t13 - t4;
+    t2 = C0 * t14;
+    t18 = C1 * t11;
+    t3 = t17 - t18;
+    t6 = C1 * t5;
+    t10 = t12 - t6;
+    t15 = t3 + t0;
+    t9 = t10 + t2;
+    t13 = t3 - t0;
+    t4 = t10 - t2;
+    t14 = C2 * t16;
+    t18 = C3 * t7;
+    t6 = t14 + t18;
+    t3 = C2 * t1;
+    t0 = C3 * t8;
+    t10 = t3 + t0;
+    t2 = C3 * t16;
+    t14 = C2 * t7;
+    t18 = t2 - t14;
+    t3 = C3 * t1;
+    t0 = C2 * t8;
+    t16 = t3 - t0;
+    t7 = t17 + t11;
+    t2 = t12 + t5;
+    t14 = t15 + t10;
+    t1 = t9 - t6;
+    t8 = t13 + t16;
+    t3 = t4 - t18;
+    t0 = t13 - t16;
+    t17 = t4 + t18;
+    t11 = t15 - t10;
+    t12 = t9 + t6;
+    t5 = (-C134) * t7;
+    t13 = (-C135) * t2;
+    t16 = t5 + t13;
+    t4 = 0.07820083419064082 * t16;
+    y[379] = t4;
+    t18 = (-0.008337979459723047) * t16;
+    y[580] = t18;
+    t15 = C135 * t7;
+    t10 = (-C134) * t2;
+    t9 = t15 + t10;
+    y[59] = 0;
+    t6 = (-0.07992242109289432) * t9;
+    y[260] = t6;
+    t5 = C136 * t14;
+    t13 = C137 * t1;
+    t4 = t5 + t13;
+    t16 = 0.006194595274505857 * t4;
+    y[132] = t16;
+    t18 = (-0.07442739657708623) * t4;
+    y[187] = t18;
+    t7 = (-C137) * t14;
+    t2 = C136 * t1;
+    t15 = t7 + t2;
+    t10 = 0.08122810178898779 * t15;
+    y[452] = t10;
+    t9 = 0.03299712828508903 * t15;
+    y[507] = t9;
+    t6 = C138 * t8;
+    t5 = C139 * t3;
+    t13 = t6 + t5;
+    y[4] = 0;
+    t16 = (-0.07921983784734443) * t13;
+    y[315] = t16;
+    t4 = (-C139) * t8;
+    t18 = C138 * t3;
+    t14 = t4 + t18;
+    t1 = 0.07889438011781426 * t14;
+    y[324] = t1;
+    t7 = (-0.00011625267447388165) * t14;
+    y[635] = t7;
+    t2 = (-C140) * t0;
+    t10 = (-C141) * t17;
+    t15 = t2 + t10;
+    t9 = 0.08046140220484606 * t15;
+    y[443] = t9;
+    t6 = 0.021218579288406595 * t15;
+    y[516] = t6;
+    t5 = C141 * t0;
+    t13 = (-C140) * t17;
+    t16 = t5 + t13;
+    t8 = 0.0012061797976135472 * t16;
+    y[123] = t8;
+    t3 = (-0.07735891256880652) * t16;
+    y[196] = t3;
+    t4 = C142 * t11;
+    t18 = C143 * t12;
+    t1 = t4 + t18;
+    y[68] = 0;
+    t14 = (-0.07999924206306375) * t1;
+    y[251] = t14;
+    t7 = (-C143) * t11;
+    t2 = C142 * t12;
+    t10 = t7 + t2;
+    t9 = 0.07812574017980194 * t10;
+    y[388] = t9;
+    t15 = (-0.008730111522164116) * t10;
+    y[571] = t15;
+    t6 = re[70];
+    t0 = im[70];
+    t17 = re[102];
+    t5 = im[102];
+    t13 = re[134];
+    t8 = im[134];
+    t16 = re[6];
+    t3 = im[6];
+    t4 = re[38];
+    t18 = im[38];
+    t1 = t17 + t4;
+    t14 = t5 + t18;
+    t11 = t13 + t16;
+    t12 = t8 + t3;
+    t7 = t17 - t4;
+    t2 = t5 - t18;
+    t9 = t13 - t16;
+    t10 = t8 - t3;
+    t15 = t1 + t11;
+    t17 = t14 + t12;
+    t4 = t1 - t11;
+    t5 = C0 * t4;
+    t18 = t14 - t12;
+    t13 = C0 * t18;
+    t16 = C1 * t15;
+    t8 = t6 - t16;
+    t3 = C1 * t17;
+    t1 = t0 - t3;
+    t11 = t8 + t5;
+    t4 = t1 + t13;
+    t14 = t8 - t5;
+    t12 = t1 - t13;
+    t18 = C2 * t7;
+    t16 = C3 * t9;
+    t3 = t18 + t16;
+    t8 = C2 * t2;
+    t5 = C3 * t10;
+    t1 = t8 + t5;
+    t13 = C3 * t7;
+    t18 = C2 * t9;
+    t16 = t13 - t18;
+    t8 = C3 * t2;
+    t5 = C2 * t10;
+    t7 = t8 - t5;
+    t9 = t6 + t15;
+    t13 = t0 + t17;
+    t18 = t11 + t1;
+    t2 = t4 - t3;
+    t10 = t14 + t7;
+    t8 = t12 - t16;
+    t5 = t14 - t7;
+    t6 = t12 + t16;
+    t15 = t11 - t1;
+    t0 = t4 + t3;
+    t17 = C144 * t9;
+    t14 = C145 * t13;
+    t7 = t17 + t14;
+    y[70] = 0;
+    t12 = (-0.0800160723060249) * t7;
+    y[249] = t12;
+    t16 = (-C145) * t9;
+    t11 = C144 * t13;
+    t1 = t16 + t11;
+    t4 = 0.07810930754132253 * t1;
+    y[390] = t4;
+    t3 = (-0.00867600412008019) * t1;
+    y[569] = t3;
+    t17 = (-C146) * t18;
+    t14 = (-C147) * t2;
+    t7 = t17 + t14;
+    t12 = 0.07821504215293063 * t7;
+    y[377] = t12;
+    t9 = (-0.008125006300371175) * t7;
+    y[582] = t9;
+    t13 = C147 * t18;
+    t16 = (-C146) * t2;
+    t11 = t13 + t16;
+    y[57] = 0;
+    t4 = (-0.07990790298085675) * t11;
+    y[262] = t4;
+    t1 = C148 * t10;
+    t3 = C149 * t8;
+    t17 = t1 + t3;
+    t14 = 0.007961705785935923 * t17;
+    y[134] = t14;
+    t12 = (-0.07342959009395307) * t17;
+    y[185] = t12;
+    t7 = (-C149) * t10;
+    t9 = C148 * t8;
+    t18 = t7 + t9;
+    t2 = 0.08123517600333653 * t18;
+    y[454] = t2;
+    t13 = 0.035788100254620786 * t18;
+    y[505] = t13;
+    t16 = C150 * t5;
+    t11 = C151 * t6;
+    t4 = t16 + t11;
+    y[6] = 0;
+    t1 = (-0.07928993254082312) * t4;
+    y[313] = t1;
+    t3 = (-C151) * t5;
+    t14 = C150 * t6;
+    t17 = t3 + t14;
+    t12 = 0.07882463510461603 * t17;
+    y[326] = t12;
+    t10 = (-0.00018493729943036235) * t17;
+    y[633] = t10;
+    t8 = (-C152) * t15;
+    t7 = (-C153) * t0;
+    t9 = t8 + t7;
+    t2 = 0.08021633619237747 * t9;
+    y[441] = t2;
+    t18 = 0.01883263011236303 * t9;
+    y[518] = t18;
+    t13 = C153 * t15;
+    t16 = (-C152) * t0;
+    t11 = t13 + t16;
+    t4 = 0.000666694127532328 * t11;
+    y[121] = t4;
+    t1 = (-0.07775778216969736) * t11;
+    y[198] = t1;
+    t5 = re[90];
+    t6 = im[90];
+    t3 = re[122];
+    t14 = im[122];
+    t12 = re[154];
+    t17 = im[154];
+    t10 = re[26];
+    t8 = im[26];
+    t7 = re[58];
+    t2 = im[58];
+    t9 = t3 + t7;
+    t18 = t14 + t2;
+    t15 = t12 + t10;
+    t0 = t17 + t8;
+    t13 = t3 - t7;
+    t16 = t14 - t2;
+    t4 = t12 - t10;
+    t11 = t17 - t8;
+    t1 = t9 + t15;
+    t3 = t18 + t0;
+    t7 = t9 - t15;
+    t14 = C0 * t7;
+    t2 = t18 - t0;
+    t12 = C0 * t2;
+    t10 = C1 * t1;
+    t17 = t5 - t10;
+    t8 = C1 * t3;
+    t9 = t6 - t8;
+    t15 = t17 + t14;
+    t7 = t9 + t12;
+    t18 = t17 - t14;
+    t0 = t9 - t12;
+    t2 = C2 * t13;
+    t10 = C3 * t4;
+    t8 = t2 + t10;
+    t17 = C2 * t16;
+    t14 = C3 * t11;
+    t9 = t17 + t14;
+    t12 = C3 * t13;
+    t2 = C2 * t4;
+    t10 = t12 - t2;
+    t17 = C3 * t16;
+    t14 = C2 * t11;
+    t13 = t17 - t14;
+    t4 = t5 + t1;
+    t12 = t6 + t3;
+    t2 = t15 + t9;
+    t16 = t7 - t8;
+    t11 = t18 + t13;
+    t17 = t0 - t10;
+    t14 = t18 - t13;
+    t5 = t0 + t10;
+    t1 = t15 - t9;
+    t6 = t7 + t8;
+    t3 = (-C154) * t4;
+    t18 = (-C155) * t12;
+    t13 = t3 + t18;
+    t0 = 0.08000151439407795 * t13;
+    y[439] = t0;
+    t10 = 0.016546326981442205 * t13;
+    y[520] = t10;
+    t15 = C155 * t4;
+    t9 = (-C154) * t12;
+    t7 = t15 + t9;
+    y[119] = 0;
+    t8 = (-0.07812352112752824) * t7;
+    y[200] = t8;
+    t3 = C156 * t2;
+    t18 = C157 * t16;
+    t0 = t3 + t18;
+    y[72] = 0;
+    t13 = (-0.0800315207318005) * t0;
+    y[247] = t13;
+    t10 = (-C157) * t2;
+    t4 = C156 * t16;
+    t12 = t10 + t4;
+    t15 = 0.07809423015894994 * t12;
+    y[392] = t15;
+    t9 = (-0.008565561378246727) * t12;
+    y[567] = t9;
+    t7 = (-C158) * t11;
+    t8 = (-C159) * t17;
+    t3 = t7 + t8;
+    t18 = 0.07822760983345828 * t3;
+    y[375] = t18;
+    t0 = (-0.007872372680343373) * t3;
+    y[584] = t0;
+    t13 = C159 * t11;
+    t2 = (-C158) * t17;
+    t16 = t13 + t2;
+    y[55] = 0;
+    t10 = (-0.0798950653523208) * t16;
+    y[264] = t10;
+    t4 = C160 * t14;
+    t15 = C161 * t5;
+    t12 = t4 + t15;
+    t9 = 0.009974119378923667 * t12;
+    y[136] = t9;
+    t7 = (-0.07227303597195224) * t12;
+    y[183] = t7;
+    t8 = (-C161) * t14;
+    t18 = C160 * t5;
+    t3 = t8 + t18;
+    t0 = 0.08114841980269193 * t3;
+    y[456] = t0;
+    t11 = 0.038615673414421424 * t3;
+    y[503] = t11;
+    t17 = C162 * t1;
+    t13 = C163 * t6;
+    t2 = t17 + t13;
+    y[8] = 0;
+    t16 = (-0.07935746607752191) * t2;
+    y[311] = t16;
+    t10 = (-C163) * t1;
+    t4 = C162 * t6;
+    t15 = t10 + t4;
+    t9 = 0.07875755500931148 * t15;
+    y[328] = t9;
+    t12 = (-0.00027482219768941077) * t15;
+    y[631] = t12;
+}
+
+/**
+ *  Part 4 of ApplyWindowedIMDCT_W10_320_K80().
+ * 
+ *  @param {Number[]} X 
+ *    - The input block (320 points, only the first 80 points are used).
+ *  @param {Number[]} y 
+ *    - The array that would contain the output block (640 points).
+ *  @param {Number[]} re 
+ *    - The scratch buffer (real part, 160 points).
+ *  @param {Number[]} im 
+ *    - The scratch buffer (imaginary part, 160 points).
+ */
+function ApplyWindowedIMDCT_W10_320_K80_Part4(X, y, re, im) {
+    let t0, t1, t10, t11, t12, t13, t14, t15, t16, t17, t18, t2, t3, t4, t5, t6, t7, t8, t9;
+    const C0 = 0.5590169943749475;
+    const C1 = 0.25;
+    const C2 = 0.9510565162951535;
+    const C3 = 0.5877852522924731;
+    const C4 = 0.6697383662966098;
+    const C5 = 0.742597145638433;
+    const C6 = 0.9783173707196277;
+    const C7 = 0.20711137619221856;
+    const C8 = 0.4074838995026576;
+    const C9 = 0.9132123913121788;
+    const C10 = 0.8664341754558649;
+    const C11 = 0.4992913173710469;
+    const C12 = 0.10534206951811415;
+    const C13 = 0.9944360453994218;
+    const C14 = 0.09557429675609919;
+    const C15 = 0.9954222992276077;
+    const C16 = 0.6624157775901718;
+    const C17 = 0.7491363945234594;
+    const C18 = 0.9762369460689896;
+    const C19 = 0.2167058493209;
+    const C20 = 0.3984989647613298;
+    const C21 = 0.9171687822228516;
+    const C22 = 0.8614907187863783;
+    const C23 = 0.5077733169879345;
+    const C24 = 0.8564642298483564;
+    const C25 = 0.5162063763556798;
+    const C26 = 0.0857973123444399;
+    const C27 = 0.996312612182778;
+    const C28 = 0.6550293438723744;
+    const C29 = 0.7556034400835709;
+    const C30 = 0.9740624296696047;
+    const C31 = 0.22627943588878452;
+    const C32 = 0.3894756218603649;
+    const C33 = 0.9210367744973499;
+    const C34 = 0.3804147404883323;
+    const C35 = 0.9248159953305278;
+    const C36 = 0.8513551931052652;
+    const C37 = 0.524589682678469;
+    const C38 = 0.07601205860924312;
+    const C39 = 0.9971068984547168;
+    const C40 = 0.6475797770630733;
+    const C41 = 0.7619976590114568;
+    const C42 = 0.9717940311058891;
+    const C43 = 0.2358312131736727;
+    const C44 = 0.969431969010818;
+    const C45 = 0.24536026055538934;
+    const C46 = 0.37131719395183754;
+    const C47 = 0.9285060804732156;
+    const C48 = 0.8461641009766995;
+    const C49 = 0.5329224279557898;
+    const C50 = 0.06621947867363034;
+    const C51 = 0.9978050814884601;
+    const C52 = 0.6400677951670226;
+    const C53 = 0.7683184350189877;
+    const C54 = 0.6324941222046724;
+    const C55 = 0.7745651588966166;
+    const C56 = 0.9669764710448521;
+    const C57 = 0.25486565960451457;
+    const C58 = 0.36218385909135087;
+    const C59 = 0.9321066742673269;
+    const C60 = 0.8408914537909229;
+    const C61 = 0.5412038090603096;
+    const C62 = 0.05642051636683749;
+    const C63 = 0.998407093991674;
+    const C64 = 0.04661611613324671;
+    const C65 = 0.9989128779411404;
+    const C66 = 0.6248594881423863;
+    const C67 = 0.7807372285720945;
+    const C68 = 0.9644277738739964;
+    const C69 = 0.264346494170904;
+    const C70 = 0.3530156161966958;
+    const C71 = 0.9356174296801376;
+    const C72 = 0.8355377597366458;
+    const C73 = 0.5494330278152808;
+    const C74 = 0.8301035348140438;
+    const C75 = 0.5576092910714722;
+    const C76 = 0.03680722294135883;
+    const C77 = 0.9993223845883495;
+    const C78 = 0.6171646288220856;
+    const C79 = 0.7868340491684999;
+    const C80 = 0.9617861231469886;
+    const C81 = 0.27380185047198924;
+    const C82 = 0.34381334892220483;
+    const C83 = 0.939038008337734;
+    const C84 = 0.33457794420155085;
+    const C85 = 0.9423680805576258;
+    const C86 = 0.8245893027850253;
+    const C87 = 0.5657318107836131;
+    const C88 = 0.026994782192715373;
+    const C89 = 0.9996355744641984;
+    const C90 = 0.609410285890327;
+    const C91 = 0.7928550330615742;
+    const C92 = 0.9590517734716243;
+    const C93 = 0.28323081718085014;
+    const C94 = 0.9562249883902162;
+    const C95 = 0.29263248551405047;
+    const C96 = 0.3253102921622629;
+    const C97 = 0.9456073253805213;
+    const C98 = 0.8189955951227504;
+    const C99 = 0.5737998040863485;
+    const C100 = 0.017179739630778748;
+    const C101 = 0.9998524173827948;
+    const C102 = 0.601597206726822;
+    const C103 = 0.7987995999363579;
+    const C104 = 0.5937261443724018;
+    const C105 = 0.804667176843123;
+    const C106 = 0.9533060403541939;
+    const C107 = 0.3020059493192281;
+    const C108 = 0.3160112860399338;
+    const C109 = 0.9487554306012626;
+    const C110 = 0.8133229509604061;
+    const C111 = 0.5818124933696911;
+    const C112 = 0.007363041249779567;
+    const C113 = 0.9999728924443673;
+    t7 = re[110];
+    t14 = im[110];
+    t5 = re[142];
+    t8 = im[142];
+    t18 = re[14];
+    t0 = im[14];
+    t3 = re[46];
+    t11 = im[46];
+    t17 = re[78];
+    t13 = im[78];
+    t2 = t5 + t17;
+    t16 = t8 + t13;
+    t1 = t18 + t3;
+    t6 = t0 + t11;
+    t10 = t5 - t17;
+    t4 = t8 - t13;
+    t9 = t18 - t3;
+    t15 = t0 - t11;
+    t12 = t2 + t1;
+    t5 = t16 + t6;
+    t17 = t2 - t1;
+    t8 = C0 * t17;
+    t13 = t16 - t6;
+    t18 = C0 * t13;
+    t3 = C1 * t12;
+    t0 = t7 - t3;
+    t11 = C1 * t5;
+    t2 = t14 - t11;
+    t1 = t0 + t8;
+    t17 = t2 + t18;
+    t16 = t0 - t8;
+    t6 = t2 - t18;
+    t13 = C2 * t10;
+    t3 = C3 * t9;
+    t11 = t13 + t3;
+    t0 = C2 * t4;
+    t8 = C3 * t15;
+    t2 = t0 + t8;
+    t18 = C3 * t10;
+    t13 = C2 * t9;
+    t3 = t18 - t13;
+    t0 = C3 * t4;
+    t8 = C2 * t15;
+    t10 = t0 - t8;
+    t9 = t7 + t12;
+    t18 = t14 + t5;
+    t13 = t1 + t2;
+    t4 = t17 - t11;
+    t15 = t16 + t10;
+    t0 = t6 - t3;
+    t8 = t16 - t10;
+    t7 = t6 + t3;
+    t12 = t1 - t2;
+    t14 = t17 + t11;
+    t5 = C4 * t9;
+    t16 = C5 * t18;
+    t10 = t5 + t16;
+    y[10] = 0;
+    t6 = (-0.07942181984972771) * t10;
+    y[309] = t6;
+    t3 = (-C5) * t9;
+    t1 = C4 * t18;
+    t2 = t3 + t1;
+    t17 = 0.0786937394764498 * t2;
+    y[330] = t17;
+    t11 = (-0.000388530381880178) * t2;
+    y[629] = t11;
+    t5 = (-C6) * t13;
+    t16 = (-C7) * t4;
+    t10 = t5 + t16;
+    t6 = 0.07973350773965149 * t10;
+    y[437] = t6;
+    t9 = 0.01436423434214279 * t10;
+    y[522] = t9;
+    t18 = C7 * t13;
+    t3 = (-C6) * t4;
+    t1 = t18 + t3;
+    y[117] = 0;
+    t17 = (-0.0783861161659626) * t1;
+    y[202] = t17;
+    t2 = C8 * t15;
+    t11 = C9 * t0;
+    t5 = t2 + t11;
+    y[74] = 0;
+    t16 = (-0.08004498652028395) * t5;
+    y[245] = t16;
+    t6 = (-C9) * t15;
+    t10 = C8 * t0;
+    t9 = t6 + t10;
+    t13 = 0.0780810925418322 * t9;
+    y[394] = t13;
+    t4 = (-0.008396876155933708) * t9;
+    y[565] = t4;
+    t18 = (-C10) * t8;
+    t3 = (-C11) * t7;
+    t1 = t18 + t3;
+    t17 = 0.07823844498003954 * t1;
+    y[373] = t17;
+    t2 = (-0.0075840412882783445) * t1;
+    y[586] = t2;
+    t11 = C11 * t8;
+    t5 = (-C10) * t7;
+    t16 = t11 + t5;
+    y[53] = 0;
+    t15 = (-0.07988400078240977) * t16;
+    y[266] = t15;
+    t0 = C12 * t12;
+    t6 = C13 * t14;
+    t10 = t0 + t6;
+    t13 = 0.012223248822784803 * t10;
+    y[138] = t13;
+    t9 = (-0.0709448429254907) * t10;
+    y[181] = t9;
+    t4 = (-C13) * t12;
+    t18 = C12 * t14;
+    t3 = t4 + t18;
+    t17 = 0.08095243610523627 * t3;
+    y[458] = t17;
+    t1 = 0.04146541917181707 * t3;
+    y[501] = t1;
+    t2 = re[130];
+    t8 = im[130];
+    t7 = re[2];
+    t11 = im[2];
+    t5 = re[34];
+    t16 = im[34];
+    t15 = re[66];
+    t0 = im[66];
+    t6 = re[98];
+    t13 = im[98];
+    t10 = t7 + t6;
+    t9 = t11 + t13;
+    t12 = t5 + t15;
+    t14 = t16 + t0;
+    t4 = t7 - t6;
+    t18 = t11 - t13;
+    t17 = t5 - t15;
+    t3 = t16 - t0;
+    t1 = t10 + t12;
+    t7 = t9 + t14;
+    t6 = t10 - t12;
+    t11 = C0 * t6;
+    t13 = t9 - t14;
+    t5 = C0 * t13;
+    t15 = C1 * t1;
+    t16 = t2 - t15;
+    t0 = C1 * t7;
+    t10 = t8 - t0;
+    t12 = t16 + t11;
+    t6 = t10 + t5;
+    t9 = t16 - t11;
+    t14 = t10 - t5;
+    t13 = C2 * t4;
+    t15 = C3 * t17;
+    t0 = t13 + t15;
+    t16 = C2 * t18;
+    t11 = C3 * t3;
+    t10 = t16 + t11;
+    t5 = C3 * t4;
+    t13 = C2 * t17;
+    t15 = t5 - t13;
+    t16 = C3 * t18;
+    t11 = C2 * t3;
+    t4 = t16 - t11;
+    t17 = t2 + t1;
+    t5 = t8 + t7;
+    t13 = t12 + t10;
+    t18 = t6 - t0;
+    t3 = t9 + t4;
+    t16 = t14 - t15;
+    t11 = t9 - t4;
+    t2 = t14 + t15;
+    t1 = t12 - t10;
+    t8 = t6 + t0;
+    t7 = C14 * t17;
+    t9 = C15 * t5;
+    t4 = t7 + t9;
+    t14 = 0.014694708331038423 * t4;
+    y[140] = t14;
+    t15 = (-0.06943487281706444) * t4;
+    y[179] = t15;
+    t12 = (-C15) * t17;
+    t10 = C14 * t5;
+    t6 = t12 + t10;
+    t0 = 0.08063245485341218 * t6;
+    y[460] = t0;
+    t7 = 0.04432178833723134 * t6;
+    y[499] = t7;
+    t9 = C16 * t13;
+    t14 = C17 * t18;
+    t4 = t9 + t14;
+    y[12] = 0;
+    t15 = (-0.07948231754482189) * t4;
+    y[307] = t15;
+    t17 = (-C17) * t13;
+    t5 = C16 * t18;
+    t12 = t17 + t5;
+    t10 = 0.07863384200486458 * t12;
+    y[332] = t10;
+    t0 = (-0.0005281496518064612) * t12;
+    y[627] = t0;
+    t6 = (-C18) * t3;
+    t7 = (-C19) * t16;
+    t9 = t6 + t7;
+    t14 = 0.07949560986070783 * t9;
+    y[435] = t14;
+    t4 = 0.012290071369447096 * t9;
+    y[524] = t4;
+    t15 = C19 * t3;
+    t13 = (-C18) * t16;
+    t18 = t15 + t13;
+    y[115] = 0;
+    t17 = (-0.0786206937836095) * t18;
+    y[204] = t17;
+    t5 = C20 * t11;
+    t10 = C21 * t2;
+    t12 = t5 + t10;
+    y[76] = 0;
+    t0 = (-0.0800556911882454) * t12;
+    y[243] = t0;
+    t6 = (-C21) * t11;
+    t7 = C20 * t2;
+    t14 = t6 + t7;
+    t9 = 0.07807065190785197 * t14;
+    y[396] = t9;
+    t4 = (-0.008167628783349251) * t14;
+    y[563] = t4;
+    t3 = (-C22) * t1;
+    t16 = (-C23) * t8;
+    t15 = t3 + t16;
+    t13 = 0.07824745321283438 * t15;
+    y[371] = t13;
+    t18 = (-0.007263407164054297) * t15;
+    y[588] = t18;
+    t17 = C23 * t1;
+    t5 = (-C22) * t8;
+    t10 = t17 + t5;
+    y[51] = 0;
+    t12 = (-0.07987480414218592) * t10;
+    y[268] = t12;
+    t0 = re[150];
+    t11 = im[150];
+    t2 = re[22];
+    t6 = im[22];
+    t7 = re[54];
+    t9 = im[54];
+    t14 = re[86];
+    t4 = im[86];
+    t3 = re[118];
+    t16 = im[118];
+    t13 = t2 + t3;
+    t15 = t6 + t16;
+    t18 = t7 + t14;
+    t1 = t9 + t4;
+    t8 = t2 - t3;
+    t17 = t6 - t16;
+    t5 = t7 - t14;
+    t10 = t9 - t4;
+    t12 = t13 + t18;
+    t2 = t15 + t1;
+    t3 = t13 - t18;
+    t6 = C0 * t3;
+    t16 = t15 - t1;
+    t7 = C0 * t16;
+    t14 = C1 * t12;
+    t9 = t0 - t14;
+    t4 = C1 * t2;
+    t13 = t11 - t4;
+    t18 = t9 + t6;
+    t3 = t13 + t7;
+    t15 = t9 - t6;
+    t1 = t13 - t7;
+    t16 = C2 * t8;
+    t14 = C3 * t5;
+    t4 = t16 + t14;
+    t9 = C2 * t17;
+    t6 = C3 * t10;
+    t13 = t9 + t6;
+    t7 = C3 * t8;
+    t16 = C2 * t5;
+    t14 = t7 - t16;
+    t9 = C3 * t17;
+    t6 = C2 * t10;
+    t8 = t9 - t6;
+    t5 = t0 + t12;
+    t7 = t11 + t2;
+    t16 = t18 + t13;
+    t17 = t3 - t4;
+    t10 = t15 + t8;
+    t9 = t1 - t14;
+    t6 = t15 - t8;
+    t0 = t1 + t14;
+    t12 = t18 - t13;
+    t11 = t3 + t4;
+    t2 = (-C24) * t5;
+    t15 = (-C25) * t7;
+    t8 = t2 + t15;
+    t1 = 0.07825475177229257 * t8;
+    y[369] = t1;
+    t14 = (-0.006914619827194874) * t8;
+    y[590] = t14;
+    t18 = C25 * t5;
+    t13 = (-C24) * t7;
+    t3 = t18 + t13;
+    y[49] = 0;
+    t4 = (-0.07986735448585142) * t3;
+    y[270] = t4;
+    t2 = C26 * t16;
+    t15 = C27 * t17;
+    t1 = t2 + t15;
+    t8 = 0.017369094907915213 * t1;
+    y[142] = t8;
+    t14 = (-0.06773575540655445) * t1;
+    y[177] = t14;
+    t5 = (-C27) * t16;
+    t7 = C26 * t17;
+    t18 = t5 + t7;
+    t13 = 0.08017500732004093 * t18;
+    y[462] = t13;
+    t3 = 0.0471691425946232 * t18;
+    y[497] = t3;
+    t4 = C28 * t10;
+    t2 = C29 * t9;
+    t15 = t4 + t2;
+    y[14] = 0;
+    t8 = (-0.07953851768496963) * t15;
+    y[305] = t8;
+    t1 = (-C29) * t10;
+    t14 = C28 * t9;
+    t16 = t1 + t14;
+    t17 = 0.07857828108834697 * t16;
+    y[334] = t17;
+    t5 = (-0.0006954450000195269) * t16;
+    y[625] = t5;
+    t7 = (-C30) * t6;
+    t13 = (-C31) * t0;
+    t18 = t7 + t13;
+    t3 = 0.07928361901336299 * t18;
+    y[433] = t3;
+    t4 = 0.010325635567219847 * t18;
+    y[526] = t4;
+    t2 = C31 * t6;
+    t15 = (-C30) * t0;
+    t8 = t2 + t15;
+    y[113] = 0;
+    t10 = (-0.07883091208218668) * t8;
+    y[206] = t10;
+    t9 = C32 * t12;
+    t1 = C33 * t11;
+    t14 = t9 + t1;
+    y[78] = 0;
+    t17 = (-0.08006298575141249) * t14;
+    y[241] = t17;
+    t16 = (-C33) * t12;
+    t5 = C32 * t11;
+    t7 = t16 + t5;
+    t13 = 0.07806353886683189 * t7;
+    y[398] = t13;
+    t3 = (-0.00787565686562428) * t7;
+    y[561] = t3;
+    t18 = re[15];
+    t4 = im[15];
+    t6 = re[47];
+    t0 = im[47];
+    t2 = re[79];
+    t15 = im[79];
+    t8 = re[111];
+    t10 = im[111];
+    t9 = re[143];
+    t1 = im[143];
+    t14 = t6 + t9;
+    t17 = t0 + t1;
+    t12 = t2 + t8;
+    t11 = t15 + t10;
+    t16 = t6 - t9;
+    t5 = t0 - t1;
+    t13 = t2 - t8;
+    t7 = t15 - t10;
+    t3 = t14 + t12;
+    t6 = t17 + t11;
+    t9 = t14 - t12;
+    t0 = C0 * t9;
+    t1 = t17 - t11;
+    t2 = C0 * t1;
+    t8 = C1 * t3;
+    t15 = t18 - t8;
+    t10 = C1 * t6;
+    t14 = t4 - t10;
+    t12 = t15 + t0;
+    t9 = t14 + t2;
+    t17 = t15 - t0;
+    t11 = t14 - t2;
+    t1 = C2 * t16;
+    t8 = C3 * t13;
+    t10 = t1 + t8;
+    t15 = C2 * t5;
+    t0 = C3 * t7;
+    t14 = t15 + t0;
+    t2 = C3 * t16;
+    t1 = C2 * t13;
+    t8 = t2 - t1;
+    t15 = C3 * t5;
+    t0 = C2 * t7;
+    t16 = t15 - t0;
+    t13 = t18 + t3;
+    t2 = t4 + t6;
+    t1 = t12 + t14;
+    t5 = t9 - t10;
+    t7 = t17 + t16;
+    t15 = t11 - t8;
+    t0 = t17 - t16;
+    t18 = t11 + t8;
+    t3 = t12 - t14;
+    t4 = t9 + t10;
+    t6 = C34 * t13;
+    t17 = C35 * t2;
+    t16 = t6 + t17;
+    y[80] = 0;
+    t11 = (-0.08006610833439101) * t16;
+    y[239] = t11;
+    t8 = (-C35) * t13;
+    t12 = C34 * t2;
+    t14 = t8 + t12;
+    t9 = 0.07806049438418153 * t14;
+    y[400] = t9;
+    t10 = (-0.007518887211504584) * t14;
+    y[559] = t10;
+    t6 = (-C36) * t1;
+    t17 = (-C37) * t5;
+    t16 = t6 + t17;
+    t11 = 0.07826047597585467 * t16;
+    y[367] = t11;
+    t13 = (-0.006541902249447796) * t16;
+    y[592] = t13;
+    t2 = C37 * t1;
+    t8 = (-C36) * t5;
+    t12 = t2 + t8;
+    y[47] = 0;
+    t9 = (-0.0798615127504244) * t12;
+    y[272] = t9;
+    t14 = C38 * t7;
+    t10 = C39 * t15;
+    t6 = t14 + t10;
+    t17 = 0.020223007836952297 * t6;
+    y[144] = t17;
+    t11 = (-0.06584291214118858) * t6;
+    y[175] = t11;
+    t16 = (-C39) * t7;
+    t13 = C38 * t15;
+    t1 = t16 + t13;
+    t5 = 0.07956878319930895 * t1;
+    y[464] = t5;
+    t2 = 0.04999056553691067 * t1;
+    y[495] = t2;
+    t8 = C40 * t0;
+    t12 = C41 * t18;
+    t9 = t8 + t12;
+    y[16] = 0;
+    t14 = (-0.07958997721867218) * t9;
+    y[303] = t14;
+    t10 = (-C41) * t0;
+    t17 = C40 * t18;
+    t6 = t10 + t17;
+    t11 = 0.07852747567483565 * t6;
+    y[336] = t11;
+    t7 = (-0.0008914256102028861) * t6;
+    y[623] = t7;
+    t15 = (-C42) * t3;
+    t16 = (-C43) * t4;
+    t13 = t15 + t16;
+    t5 = 0.07909560579994807 * t13;
+    y[431] = t5;
+    t1 = 0.00847214329494768 * t13;
+    y[528] = t1;
+    t2 = C43 * t3;
+    t8 = (-C42) * t4;
+    t12 = t2 + t8;
+    y[111] = 0;
+    t9 = (-0.07901829610873405) * t12;
+    y[208] = t9;
+    t14 = re[35];
+    t0 = im[35];
+    t18 = re[67];
+    t10 = im[67];
+    t17 = re[99];
+    t11 = im[99];
+    t6 = re[131];
+    t7 = im[131];
+    t15 = re[3];
+    t16 = im[3];
+    t5 = t18 + t15;
+    t13 = t10 + t16;
+    t1 = t17 + t6;
+    t3 = t11 + t7;
+    t4 = t18 - t15;
+    t2 = t10 - t16;
+    t8 = t17 - t6;
+    t12 = t11 - t7;
+    t9 = t5 + t1;
+    t18 = t13 + t3;
+    t15 = t5 - t1;
+    t10 = C0 * t15;
+    t16 = t13 - t3;
+    t17 = C0 * t16;
+    t6 = C1 * t9;
+    t11 = t14 - t6;
+    t7 = C1 * t18;
+    t5 = t0 - t7;
+    t1 = t11 + t10;
+    t15 = t5 + t17;
+    t13 = t11 - t10;
+    t3 = t5 - t17;
+    t16 = C2 * t4;
+    t6 = C3 * t8;
+    t7 = t16 + t6;
+    t11 = C2 * t2;
+    t10 = C3 * t12;
+    t5 = t11 + t10;
+    t17 = C3 * t4;
+    t16 = C2 * t8;
+    t6 = t17 - t16;
+    t11 = C3 * t2;
+    t10 = C2 * t12;
+    t4 = t11 - t10;
+    t8 = t14 + t9;
+    t17 = t0 + t18;
+    t16 = t1 + t5;
+    t2 = t15 - t7;
+    t12 = t13 + t4;
+    t11 = t3 - t6;
+    t10 = t13 - t4;
+    t14 = t3 + t6;
+    t9 = t1 - t5;
+    t0 = t15 + t7;
+    t18 = (-C44) * t8;
+    t13 = (-C45) * t17;
+    t4 = t18 + t13;
+    t3 = 0.0789296508586412 * t4;
+    y[429] = t3;
+    t6 = 0.00672971468946736 * t4;
+    y[530] = t6;
+    t1 = C45 * t8;
+    t5 = (-C44) * t17;
+    t15 = t1 + t5;
+    y[109] = 0;
+    t7 = (-0.07918443743268823) * t15;
+    y[210] = t7;
+    t18 = C46 * t16;
+    t13 = C47 * t2;
+    t3 = t18 + t13;
+    y[82] = 0;
+    t4 = (-0.08006439384135645) * t3;
+    y[237] = t4;
+    t6 = (-C47) * t16;
+    t8 = C46 * t2;
+    t17 = t6 + t8;
+    t1 = 0.07806216596586069 * t17;
+    y[402] = t1;
+    t5 = (-0.007094668922628993) * t17;
+    y[557] = t5;
+    t15 = (-C48) * t12;
+    t7 = (-C49) * t11;
+    t18 = t15 + t7;
+    t13 = 0.07826498459625951 * t18;
+    y[365] = t13;
+    t3 = (-0.006149464704131592) * t18;
+    y[594] = t3;
+    t4 = C49 * t12;
+    t16 = (-C48) * t11;
+    t2 = t4 + t16;
+    y[45] = 0;
+    t6 = (-0.07985691215862968) * t2;
+    y[274] = t6;
+    t8 = C50 * t10;
+    t1 = C51 * t14;
+    t17 = t8 + t1;
+    t5 = 0.023229600782742582 * t17;
+    y[146] = t5;
+    t15 = (-0.06375555749304516) * t17;
+    y[173] = t15;
+    t7 = (-C51) * t10;
+    t13 = C50 * t14;
+    t18 = t7 + t13;
+    t3 = 0.07880387979570969 * t18;
+    y[466] = t3;
+    t12 = 0.05276951259189433 * t18;
+    y[493] = t12;
+    t11 = C52 * t9;
+    t4 = C53 * t0;
+    t16 = t11 + t4;
+    y[18] = 0;
+    t2 = (-0.07963644616705444) * t16;
+    y[301] = t2;
+    t6 = (-C53) * t9;
+    t8 = C52 * t0;
+    t1 = t6 + t8;
+    t5 = 0.07848165382580351 * t1;
+    y[338] = t5;
+    t17 = (-0.0011166310633579017) * t1;
+    y[621] = t17;
+    t15 = re[55];
+    t10 = im[55];
+    t14 = re[87];
+    t7 = im[87];
+    t13 = re[119];
+    t3 = im[119];
+    t18 = re[151];
+    t12 = im[151];
+    t11 = re[23];
+    t4 = im[23];
+    t16 = t14 + t11;
+    t2 = t7 + t4;
+    t9 = t13 + t18;
+    t0 = t3 + t12;
+    t6 = t14 - t11;
+    t8 = t7 - t4;
+    t5 = t13 - t18;
+    t1 = t3 - t12;
+    t17 = t16 + t9;
+    t14 = t2 + t0;
+    t11 = t16 - t9;
+    t7 = C0 * t11;
+    t4 = t2 - t0;
+    t13 = C0 * t4;
+    t18 = C1 * t17;
+    t3 = t15 - t18;
+    t12 = C1 * t14;
+    t16 = t10 - t12;
+    t9 = t3 + t7;
+    t11 = t16 + t13;
+    t2 = t3 - t7;
+    t0 = t16 - t13;
+    t4 = C2 * t6;
+    t18 = C3 * t5;
+    t12 = t4 + t18;
+    t3 = C2 * t8;
+    t7 = C3 * t1;
+    t16 = t3 + t7;
+    t13 = C3 * t6;
+    t4 = C2 * t5;
+    t18 = t13 - t4;
+    t3 = C3 * t8;
+    t7 = C2 * t1;
+    t6 = t3 - t7;
+    t5 = t15 + t17;
+    t13 = t10 + t14;
+    t4 = t9 + t16;
+    t8 = t11 - t12;
+    t1 = t2 + t6;
+    t3 = t0 - t18;
+    t7 = t2 - t6;
+    t15 = t0 + t18;
+    t17 = t9 - t16;
+    t10 = t11 + t12;
+    t14 = C54 * t5;
+    t2 = C55 * t13;
+    t6 = t14 + t2;
+    y[20] = 0;
+    t0 = (-0.07967770169910844) * t6;
+    y[299] = t0;
+    t18 = (-C55) * t5;
+    t9 = C54 * t13;
+    t16 = t18 + t9;
+    t11 = 0.07844101758359247 * t16;
+    y[340] = t11;
+    t12 = (-0.001371252207873613) * t16;
+    y[619] = t12;
+    t14 = (-C56) * t4;
+    t2 = (-C57) * t8;
+    t6 = t14 + t2;
+    t0 = 0.07878375895351551 * t6;
+    y[427] = t0;
+    t5 = 0.005097485695067034 * t6;
+    y[532] = t5;
+    t13 = C57 * t4;
+    t18 = (-C56) * t8;
+    t9 = t13 + t18;
+    y[107] = 0;
+    t11 = (-0.07933107131493516) * t9;
+    y[212] = t11;
+    t16 = C58 * t1;
+    t12 = C59 * t3;
+    t14 = t16 + t12;
+    y[84] = 0;
+    t2 = (-0.08005707839808375) * t14;
+    y[235] = t2;
+    t0 = (-C59) * t1;
+    t6 = C58 * t3;
+    t5 = t0 + t6;
+    t4 = 0.0780692991183351 * t5;
+    y[404] = t4;
+    t8 = (-0.00660063310082577) * t5;
+    y[555] = t8;
+    t13 = (-C60) * t7;
+    t18 = (-C61) * t15;
+    t9 = t13 + t18;
+    t11 = 0.07826862367318611 * t9;
+    y[363] = t11;
+    t16 = (-0.005741950732883771) * t9;
+    y[596] = t16;
+    t12 = C61 * t7;
+    t14 = (-C60) * t15;
+    t2 = t12 + t14;
+    y[43] = 0;
+    t1 = (-0.07985319923469122) * t2;
+    y[276] = t1;
+    t3 = C62 * t17;
+    t0 = C63 * t10;
+    t6 = t3 + t0;
+    t4 = 0.02635963991835971 * t6;
+    y[148] = t4;
+    t5 = (-0.061476294335568483) * t6;
+    y[171] = t5;
+    t8 = (-C63) * t17;
+    t13 = C62 * t10;
+    t18 = t8 + t13;
+    t11 = 0.07787288007785695 * t18;
+    y[468] = t11;
+    t9 = 0.05548876646666499 * t18;
+    y[491] = t9;
+    t16 = re[75];
+    t7 = im[75];
+    t15 = re[107];
+    t12 = im[107];
+    t14 = re[139];
+    t2 = im[139];
+    t1 = re[11];
+    t3 = im[11];
+    t0 = re[43];
+    t4 = im[43];
+    t6 = t15 + t0;
+    t5 = t12 + t4;
+    t17 = t14 + t1;
+    t10 = t2 + t3;
+    t8 = t15 - t0;
+    t13 = t12 - t4;
+    t11 = t14 - t1;
+    t18 = t2 - t3;
+    t9 = t6 + t17;
+    t15 = t5 + t10;
+    t0 = t6 - t17;
+    t12 = C0 * t0;
+    t4 = t5 - t10;
+    t14 = C0 * t4;
+    t1 = C1 * t9;
+    t2 = t16 - t1;
+    t3 = C1 * t15;
+    t6 = t7 - t3;
+    t17 = t2 + t12;
+    t0 = t6 + t14;
+    t5 = t2 - t12;
+    t10 = t6 - t14;
+    t4 = C2 * t8;
+    t1 = C3 * t11;
+    t3 = t4 + t1;
+    t2 = C2 * t13;
+    t12 = C3 * t18;
+    t6 = t2 + t12;
+    t14 = C3 * t8;
+    t4 = C2 * t11;
+    t1 = t14 - t4;
+    t2 = C3 * t13;
+    t12 = C2 * t18;
+    t8 = t2 - t12;
+    t11 = t16 + t9;
+    t14 = t7 + t15;
+    t4 = t17 + t6;
+    t13 = t0 - t3;
+    t18 = t5 + t8;
+    t2 = t10 - t1;
+    t12 = t5 - t8;
+    t16 = t10 + t1;
+    t9 = t17 - t6;
+    t7 = t0 + t3;
+    t15 = C64 * t11;
+    t5 = C65 * t14;
+    t8 = t15 + t5;
+    t10 = 0.029582342154535285 * t8;
+    y[150] = t10;
+    t1 = (-0.059011947189589936) * t8;
+    y[169] = t1;
+    t17 = (-C65) * t11;
+    t6 = C64 * t14;
+    t0 = t17 + t6;
+    t3 = 0.07676973640263576 * t0;
+    y[470] = t3;
+    t15 = 0.058131582707871575 * t0;
+    y[489] = t15;
+    t5 = C66 * t4;
+    t10 = C67 * t13;
+    t8 = t5 + t10;
+    y[22] = 0;
+    t1 = (-0.07971374919927883) * t8;
+    y[297] = t1;
+    t11 = (-C67) * t4;
+    t14 = C66 * t13;
+    t17 = t11 + t14;
+    t6 = 0.07840554562771143 * t17;
+    y[342] = t6;
+    t3 = (-0.0016543034293969414) * t17;
+    y[617] = t3;
+    t0 = (-C68) * t18;
+    t15 = (-C69) * t2;
+    t5 = t0 + t15;
+    t10 = 0.07865614188746739 * t5;
+    y[425] = t10;
+    t8 = 0.0035739293363973644 * t5;
+    y[534] = t8;
+    t1 = C69 * t18;
+    t4 = (-C68) * t2;
+    t13 = t1 + t4;
+    y[105] = 0;
+    t11 = (-0.07945978343232006) * t13;
+    y[214] = t11;
+    t14 = C70 * t12;
+    t6 = C71 * t16;
+    t17 = t14 + t6;
+    y[86] = 0;
+    t3 = (-0.0800435305099844) * t17;
+    y[233] = t3;
+    t0 = (-C71) * t12;
+    t15 = C70 * t16;
+    t10 = t0 + t15;
+    t5 = 0.078082512854932 * t10;
+    y[406] = t5;
+    t8 = (-0.006034162996387899) * t10;
+    y[553] = t8;
+    t18 = (-C72) * t9;
+    t2 = (-C73) * t7;
+    t1 = t18 + t2;
+    t4 = 0.0782719816664161 * t1;
+    y[361] = t4;
+    t13 = (-0.005324123100425294) * t1;
+    y[598] = t13;
+    t11 = C73 * t9;
+    t14 = (-C72) * t7;
+    t6 = t11 + t14;
+    y[41] = 0;
+    t17 = (-0.07984977340469802) * t6;
+    y[278] = t17;
+    t3 = re[95];
+    t12 = im[95];
+    t16 = re[127];
+    t0 = im[127];
+    t15 = re[159];
+    t5 = im[159];
+    t10 = re[31];
+    t8 = im[31];
+    t18 = re[63];
+    t2 = im[63];
+    t4 = t16 + t18;
+    t1 = t0 + t2;
+    t13 = t15 + t10;
+    t9 = t5 + t8;
+    t7 = t16 - t18;
+    t11 = t0 - t2;
+    t14 = t15 - t10;
+    t6 = t5 - t8;
+    t17 = t4 + t13;
+    t16 = t1 + t9;
+    t18 = t4 - t13;
+    t0 = C0 * t18;
+    t2 = t1 - t9;
+    t15 = C0 * t2;
+    t10 = C1 * t17;
+    t5 = t3 - t10;
+    t8 = C1 * t16;
+    t4 = t12 - t8;
+    t13 = t5 + t0;
+    t18 = t4 + t15;
+    t1 = t5 - t0;
+    t9 = t4 - t15;
+    t2 = C2 * t7;
+    t10 = C3 * t14;
+    t8 = t2 + t10;
+    t5 = C2 * t11;
+    t0 = C3 * t6;
+    t4 = t5 + t0;
+    t15 = C3 * t7;
+    t2 = C2 * t14;
+    t10 = t15 - t2;
+    t5 = C3 * t11;
+    t0 = C2 * t6;
+    t7 = t5 - t0;
+    t14 = t3 + t17;
+    t15 = t12 + t16;
+    t2 = t13 + t4;
+    t11 = t18 - t8;
+    t6 = t1 + t7;
+    t5 = t9 - t10;
+    t0 = t1 - t7;
+    t3 = t9 + t10;
+    t17 = t13 - t4;
+    t12 = t18 + t8;
+    t16 = (-C74) * t14;
+    t1 = (-C75) * t15;
+    t7 = t16 + t1;
+    t9 = 0.07827557368950344 * t7;
+    y[359] = t9;
+    t10 = (-0.00490016126713387) * t7;
+    y[600] = t10;
+    t13 = C75 * t14;
+    t4 = (-C74) * t15;
+    t18 = t13 + t4;
+    y[39] = 0;
+    t8 = (-0.07984610914245029) * t18;
+    y[280] = t8;
+    t16 = C76 * t2;
+    t1 = C77 * t11;
+    t9 = t16 + t1;
+    t7 = 0.032865721381615164 * t9;
+    y[152] = t7;
+    t10 = (-0.05637208485075786) * t9;
+    y[167] = t10;
+    t14 = (-C77) * t2;
+    t15 = C76 * t11;
+    t13 = t14 + t15;
+    t4 = 0.07549217237243139 * t13;
+    y[472] = t4;
+    t18 = 0.0606817306790926 * t13;
+    y[487] = t18;
+    t8 = C78 * t6;
+    t16 = C79 * t5;
+    t1 = t8 + t16;
+    y[24] = 0;
+    t7 = (-0.07974459018202704) * t1;
+    y[295] = t7;
+    t9 = (-C79) * t6;
+    t10 = C78 * t5;
+    t2 = t9 + t10;
+    t11 = 0.07837522251645646 * t2;
+    y[344] = t11;
+    t14 = (-0.0019647292104819658) * t2;
+    y[615] = t14;
+    t15 = (-C80) * t0;
+    t4 = (-C81) * t3;
+    t13 = t15 + t4;
+    t18 = 0.07854498143942426 * t13;
+    y[423] = t18;
+    t8 = 0.002156796701315304 * t13;
+    y[536] = t8;
+    t16 = C81 * t0;
+    t1 = (-C80) * t3;
+    t7 = t16 + t1;
+    y[103] = 0;
+    t6 = (-0.0795722385499594) * t7;
+    y[216] = t6;
+    t5 = C82 * t17;
+    t9 = C83 * t12;
+    t10 = t5 + t9;
+    y[88] = 0;
+    t11 = (-0.08002300227653168) * t10;
+    y[231] = t11;
+    t2 = (-C83) * t17;
+    t14 = C82 * t12;
+    t15 = t2 + t14;
+    t4 = 0.07810254329626591 * t15;
+    y[408] = t4;
+    t18 = (-0.005392139407981611) * t15;
+    y[551] = t18;
+    t13 = re[115];
+    t8 = im[115];
+    t0 = re[147];
+    t3 = im[147];
+    t16 = re[19];
+    t1 = im[19];
+    t7 = re[51];
+    t6 = im[51];
+    t5 = re[83];
+    t9 = im[83];
+    t10 = t0 + t5;
+    t11 = t3 + t9;
+    t17 = t16 + t7;
+    t12 = t1 + t6;
+    t2 = t0 - t5;
+    t14 = t3 - t9;
+    t4 = t16 - t7;
+    t15 = t1 - t6;
+    t18 = t10 + t17;
+    t0 = t11 + t12;
+    t5 = t10 - t17;
+    t3 = C0 * t5;
+    t9 = t11 - t12;
+    t16 = C0 * t9;
+    t7 = C1 * t18;
+    t1 = t13 - t7;
+    t6 = C1 * t0;
+    t10 = t8 - t6;
+    t17 = t1 + t3;
+    t5 = t10 + t16;
+    t11 = t1 - t3;
+    t12 = t10 - t16;
+    t9 = C2 * t2;
+    t7 = C3 * t4;
+    t6 = t9 + t7;
+    t1 = C2 * t14;
+    t3 = C3 * t15;
+    t10 = t1 + t3;
+    t16 = C3 * t2;
+    t9 = C2 * t4;
+    t7 = t16 - t9;
+    t1 = C3 * t14;
+    t3 = C2 * t15;
+    t2 = t1 - t3;
+    t4 = t13 + t18;
+    t16 = t8 + t0;
+    t9 = t17 + t10;
+    t14 = t5 - t6;
+    t15 = t11 + t2;
+    t1 = t12 - t7;
+    t3 = t11 - t2;
+    t13 = t12 + t7;
+    t18 = t17 - t10;
+    t8 = t5 + t6;
+    t0 = C84 * t4;
+    t11 = C85 * t16;
+    t2 = t0 + t11;
+    y[90] = 0;
+    t12 = (-0.07999487307524904) * t2;
+    y[229] = t12;
+    t7 = (-C85) * t4;
+    t17 = C84 * t16;
+    t10 = t7 + t17;
+    t5 = 0.07813000708333884 * t10;
+    y[410] = t5;
+    t6 = (-0.0046717798345097695) * t10;
+    y[549] = t6;
+    t0 = (-C86) * t9;
+    t11 = (-C87) * t14;
+    t2 = t0 + t11;
+    t12 = 0.07828008273966162 * t2;
+    y[357] = t12;
+    t4 = (-0.004474926713724794) * t2;
+    y[602] = t4;
+    t16 = C87 * t9;
+    t7 = (-C86) * t14;
+    t17 = t16 + t7;
+    y[37] = 0;
+    t5 = (-0.07984150988682279) * t17;
+    y[282] = t5;
+    t10 = C88 * t15;
+    t6 = C89 * t1;
+    t0 = t10 + t6;
+    t11 = 0.036177820954147843 * t0;
+    y[154] = t11;
+    t12 = (-0.05357035306535798) * t0;
+    y[165] = t12;
+    t2 = (-C89) * t15;
+    t4 = C88 * t1;
+    t9 = t2 + t4;
+    t14 = 0.0740395135648426 * t9;
+    y[474] = t14;
+    t16 = 0.06312367791411176 * t9;
+    y[485] = t16;
+    t7 = C90 * t3;
+    t17 = C91 * t13;
+    t5 = t7 + t17;
+    y[26] = 0;
+    t10 = (-0.07977048256001223) * t5;
+    y[293] = t10;
+    t6 = (-C91) * t3;
+    t11 = C90 * t13;
+    t0 = t6 + t11;
+    t12 = 0.07834978302028017 * t0;
+    y[346] = t12;
+    t15 = (-0.002300519434810679) * t0;
+    y[613] = t15;
+    t1 = (-C92) * t18;
+    t2 = (-C93) * t8;
+    t4 = t1 + t2;
+    t14 = 0.07844874145962522 * t4;
+    y[421] = t14;
+    t9 = 0.0008435186908425442 * t4;
+    y[538] = t9;
+    t16 = C93 * t18;
+    t7 = (-C92) * t8;
+    t17 = t16 + t7;
+    y[101] = 0;
+    t5 = (-0.07966985682258086) * t17;
+    y[218] = t5;
+    t10 = re[135];
+    t3 = im[135];
+    t13 = re[7];
+    t6 = im[7];
+    t11 = re[39];
+    t12 = im[39];
+    t0 = re[71];
+    t15 = im[71];
+    t1 = re[103];
+    t2 = im[103];
+    t14 = t13 + t1;
+    t4 = t6 + t2;
+    t9 = t11 + t0;
+    t18 = t12 + t15;
+    t8 = t13 - t1;
+    t16 = t6 - t2;
+    t7 = t11 - t0;
+    t17 = t12 - t15;
+    t5 = t14 + t9;
+    t13 = t4 + t18;
+    t1 = t14 - t9;
+    t6 = C0 * t1;
+    t2 = t4 - t18;
+    t11 = C0 * t2;
+    t0 = C1 * t5;
+    t12 = t10 - t0;
+    t15 = C1 * t13;
+    t14 = t3 - t15;
+    t9 = t12 + t6;
+    t1 = t14 + t11;
+    t4 = t12 - t6;
+    t18 = t14 - t11;
+    t2 = C2 * t8;
+    t0 = C3 * t7;
+    t15 = t2 + t0;
+    t12 = C2 * t16;
+    t6 = C3 * t17;
+    t14 = t12 + t6;
+    t11 = C3 * t8;
+    t2 = C2 * t7;
+    t0 = t11 - t2;
+    t12 = C3 * t16;
+    t6 = C2 * t17;
+    t8 = t12 - t6;
+    t7 = t10 + t5;
+    t11 = t3 + t13;
+    t2 = t9 + t14;
+    t16 = t1 - t15;
+    t17 = t4 + t8;
+    t12 = t18 - t0;
+    t6 = t4 - t8;
+    t10 = t18 + t0;
+    t5 = t9 - t14;
+    t3 = t1 + t15;
+    t13 = (-C94) * t7;
+    t4 = (-C95) * t11;
+    t8 = t13 + t4;
+    t18 = 0.07836596519679581 * t8;
+    y[419] = t18;
+    t0 = (-0.00036912470608087516) * t8;
+    y[540] = t0;
+    t9 = C95 * t7;
+    t14 = (-C94) * t11;
+    t1 = t9 + t14;
+    y[99] = 0;
+    t15 = (-0.07975401035774578) * t1;
+    y[220] = t15;
+    t13 = C96 * t2;
+    t4 = C97 * t16;
+    t18 = t13 + t4;
+    y[92] = 0;
+    t8 = (-0.07995838972390076) * t18;
+    y[227] = t8;
+    t0 = (-C97) * t2;
+    t7 = C96 * t16;
+    t11 = t0 + t7;
+    t9 = 0.07816565618168997 * t11;
+    y[412] = t9;
+    t14 = (-0.0038696892324265575) * t11;
+    y[547] = t14;
+    t1 = (-C98) * t17;
+    t15 = (-C99) * t12;
+    t13 = t1 + t15;
+    t4 = 0.0782861255568716 * t13;
+    y[355] = t4;
+    t18 = (-0.004052833713203016) * t13;
+    y[604] = t18;
+    t8 = C99 * t17;
+    t2 = (-C98) * t12;
+    t16 = t8 + t2;
+    y[35] = 0;
+    t0 = (-0.07983534701126106) * t16;
+    y[284] = t0;
+    t7 = C100 * t6;
+    t9 = C101 * t10;
+    t11 = t7 + t9;
+    t14 = 0.0394872088271444 * t11;
+    y[156] = t14;
+    t1 = (-0.05062400518738256) * t11;
+    y[163] = t1;
+    t15 = (-C101) * t6;
+    t4 = C100 * t10;
+    t13 = t15 + t4;
+    t18 = 0.07241345157237726 * t13;
+    y[476] = t18;
+    t17 = 0.06544248450873842 * t13;
+    y[483] = t17;
+    t12 = C102 * t5;
+    t8 = C103 * t3;
+    t2 = t12 + t8;
+    y[28] = 0;
+    t16 = (-0.07979164632836817) * t2;
+    y[291] = t16;
+    t0 = (-C103) * t5;
+    t7 = C102 * t3;
+    t9 = t0 + t7;
+    t14 = 0.07832900168871372 * t9;
+    y[348] = t14;
+    t11 = (-0.002659444465245213) * t9;
+    y[611] = t11;
+    t1 = re[155];
+    t6 = im[155];
+    t10 = re[27];
+    t15 = im[27];
+    t4 = re[59];
+    t18 = im[59];
+    t13 = re[91];
+    t17 = im[91];
+    t12 = re[123];
+    t8 = im[123];
+    t2 = t10 + t12;
+    t16 = t15 + t8;
+    t5 = t4 + t13;
+    t3 = t18 + t17;
+    t0 = t10 - t12;
+    t7 = t15 - t8;
+    t14 = t4 - t13;
+    t9 = t18 - t17;
+    t11 = t2 + t5;
+    t10 = t16 + t3;
+    t12 = t2 - t5;
+    t15 = C0 * t12;
+    t8 = t16 - t3;
+    t4 = C0 * t8;
+    t13 = C1 * t11;
+    t18 = t1 - t13;
+    t17 = C1 * t10;
+    t2 = t6 - t17;
+    t5 = t18 + t15;
+    t12 = t2 + t4;
+    t16 = t18 - t15;
+    t3 = t2 - t4;
+    t8 = C2 * t0;
+    t13 = C3 * t14;
+    t17 = t8 + t13;
+    t18 = C2 * t7;
+    t15 = C3 * t9;
+    t2 = t18 + t15;
+    t4 = C3 * t0;
+    t8 = C2 * t14;
+    t13 = t4 - t8;
+    t18 = C3 * t7;
+    t15 = C2 * t9;
+    t0 = t18 - t15;
+    t14 = t1 + t11;
+    t4 = t6 + t10;
+    t8 = t5 + t2;
+    t7 = t12 - t17;
+    t9 = t16 + t0;
+    t18 = t3 - t13;
+    t15 = t16 - t0;
+    t1 = t3 + t13;
+    t11 = t5 - t2;
+    t6 = t12 + t17;
+    t10 = C104 * t14;
+    t16 = C105 * t4;
+    t0 = t10 + t16;
+    y[30] = 0;
+    t3 = (-0.07980853720458624) * t0;
+    y[289] = t3;
+    t13 = (-C105) * t14;
+    t5 = C104 * t4;
+    t2 = t13 + t5;
+    t12 = 0.0783124239450518 * t2;
+    y[350] = t12;
+    t17 = (-0.0030386339806276795) * t2;
+    y[609] = t17;
+    t10 = (-C106) * t8;
+    t16 = (-C107) * t7;
+    t0 = t10 + t16;
+    t3 = 0.07829544839153392 * t0;
+    y[417] = t3;
+    t14 = (-0.001484443570694814) * t0;
+    y[542] = t14;
+    t4 = C107 * t8;
+    t13 = (-C106) * t7;
+    t5 = t4 + t13;
+    y[97] = 0;
+    t12 = (-0.07982584081702268) * t5;
+    y[222] = t12;
+    t2 = C108 * t9;
+    t17 = C109 * t18;
+    t10 = t2 + t17;
+    y[94] = 0;
+    t16 = (-0.07991288715667003) * t10;
+    y[225] = t16;
+    t3 = (-C109) * t9;
+    t0 = C108 * t18;
+    t14 = t3 + t0;
+    t8 = 0.0782101638719023 * t14;
+    y[414] = t8;
+    t7 = (-0.002982392523410217) * t14;
+    y[545] = t7;
+    t4 = (-C110) * t15;
+    t13 = (-C111) * t1;
+    t5 = t4 + t13;
+    t12 = 0.07829442545648338 * t5;
+    y[353] = t12;
+    t2 = (-0.0036380318390345115) * t5;
+    y[606] = t2;
+    t17 = C111 * t15;
+    t10 = (-C110) * t1;
+    t16 = t17 + t10;
+    y[33] = 0;
+    t9 = (-0.07982688376037442) * t16;
+    y[286] = t9;
+    t18 = C112 * t11;
+    t3 = C113 * t6;
+    t0 = t18 + t3;
+    t8 = 0.04276339088979664 * t0;
+    y[158] = t8;
+    t14 = (-0.04755313986979603) * t0;
+    y[161] = t14;
+    t7 = (-C113) * t11;
+    t4 = C112 * t6;
+    t13 = t7 + t4;
+    t12 = 0.07061837814965627 * t13;
+    y[478] = t12;
+    t5 = 0.06762500181343893 * t13;
+    y[481] = t5;
+}
+
+//
+//  Public functions.
+//
+
+/**
+ *  Apply LD-IMDCT transform (prebuilt for window W10_320, input pruned).
+ * 
+ *  Note(s):
+ *    [1] y[n] = w[n] * SUM(X[k] * cos(PI / 320 * (n + 160.5) * (k + 0.5))), where
+ *        w[n] = sqrt(2 / 320) * W10_320[639 - n].
+ *    [2] X[k] shall be zero for all k >= 80 (not checked).
+ *    [3] The size of all arrays will not be checked.
+ * 
+ *  @param {Number[]} X 
+ *    - The input block (320 points, only the first 80 points are used).
+ *  @param {Number[]} y 
+ *    - The array that would contain the output block (640 points).
+ *  @param {Number[]} re 
+ *    - The scratch buffer (real part, 160 points).
+ *  @param {Number[]} im 
+ *    - The scratch buffer (imaginary part, 160 points).
+ */
+function ApplyWindowedIMDCT_W10_320_K80(X, y, re, im) {
+    ApplyWindowedIMDCT_W10_320_K80_Part1(X, y, re, im);
+    ApplyWindowedIMDCT_W10_320_K80_Part2(X, y, re, im);
+    ApplyWindowedIMDCT_W10_320_K80_Part3(X, y, re, im);
+    ApplyWindowedIMDCT_W10_320_K80_Part4(X, y, re, im);
+}
+
+//  Export public APIs.
+module.exports = {
+    "ApplyWindowedIMDCT_W10_320_K80": ApplyWindowedIMDCT_W10_320_K80
+};
\ No newline at end of file
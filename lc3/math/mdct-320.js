@@ -0,0 +1,18117 @@
+//
+//  Copyright 2021 - 2023 XiaoJSoft Studio. All rights reserved.
+//  Use of this source code is governed by a BSD-style license that can be
+//  found in the LICENSE.md file.
+//
+
+//
+//  Note(s):
+//    [1] This file is generated automatically by a MDCT compiler, which locates 
+//        at "./../../dev/mdct-generator/" directory.
+//        Do NOT modify this file manually.
+//
+
+//
+//  Private functions.
+//
+
+/**
+ *  Part 1 of ApplyWindowedMDCT_W10_320().
+ * 
+ *  @param {Number[]} x 
+ *    - The input block (640 points).
+ *  @param {Number[]} X 
+ *    - The array that would contain the output block (320 points).
+ *  @param {Number[]} re 
+ *    - The scratch buffer (real part, 160 points).
+ *  @param {Number[]} im 
+ *    - The scratch buffer (imaginary part, 160 points).
+ */
+function ApplyWindowedMDCT_W10_320_Part1(x, X, re, im) {
+    let t0, t1, t10, t11, t12, t13, t14, t15, t16, t17, t18, t19, t2, t3, t4, t5, t6, t7, t8, t9;
+    const C0 = 0.19509032201612825;
+    const C1 = 0.9807852804032304;
+    const C2 = 0.3826834323650898;
+    const C3 = 0.9238795325112867;
+    const C4 = 0.5555702330196022;
+    const C5 = 0.8314696123025452;
+    const C6 = 0.7071067811865476;
+    const C7 = 0.9987954562051724;
+    const C8 = 0.049067674327418015;
+    const C9 = 0.24298017990326387;
+    const C10 = 0.970031253194544;
+    const C11 = 0.4275550934302821;
+    const C12 = 0.9039892931234433;
+    const C13 = 0.5956993044924334;
+    const C14 = 0.8032075314806449;
+    const C15 = 0.6715589548470183;
+    const C16 = 0.7409511253549591;
+    const C17 = 0.5141027441932217;
+    const C18 = 0.8577286100002721;
+    const C19 = 0.33688985339222005;
+    const C20 = 0.9415440651830208;
+    const C21 = 0.14673047445536175;
+    const C22 = 0.989176509964781;
+    const C23 = 1.1758756024193586;
+    const C24 = 0.7856949583871022;
+    const C25 = 1.3065629648763766;
+    const C26 = 0.5411961001461969;
+    const C27 = 1.3870398453221475;
+    const C28 = 0.27589937928294306;
+    const C29 = 0.9951847266721969;
+    const C30 = 0.0980171403295606;
+    const C31 = 0.29028467725446233;
+    const C32 = 0.9569403357322088;
+    const C33 = 0.47139673682599764;
+    const C34 = 0.881921264348355;
+    const C35 = 0.6343932841636455;
+    const C36 = 0.773010453362737;
+    t0 = x[479];
+    t0 = 0.045977838079537765 * t0;
+    t1 = x[480];
+    t1 = 0.04437999374521572 * t1;
+    t0 = t0 + t1;
+    t1 = x[159];
+    t1 = 0.06866149903828855 * t1;
+    t2 = x[160];
+    t2 = 0.0696597151132507 * t2;
+    t1 = t1 - t2;
+    t2 = -t0;
+    t3 = x[439];
+    t4 = x[119];
+    t4 = 0.016546326981442205 * t4;
+    t5 = x[200];
+    t5 = 0.08000151439407795 * t5;
+    t4 = t4 - t5;
+    t5 = (-0.07662239957515048) * t3;
+    t6 = C0 * t4;
+    t5 = t5 + t6;
+    t6 = 0.015241142893803282 * t3;
+    t3 = C1 * t4;
+    t4 = t6 + t3;
+    t6 = x[399];
+    t3 = x[79];
+    t3 = (-0.00770552452765192) * t3;
+    t7 = x[240];
+    t7 = 0.07806145671585792 * t7;
+    t3 = t3 - t7;
+    t7 = (-0.07397052682751848) * t6;
+    t8 = C2 * t3;
+    t7 = t7 + t8;
+    t8 = 0.03063959542784103 * t6;
+    t6 = C3 * t3;
+    t3 = t8 + t6;
+    t8 = x[359];
+    t6 = x[39];
+    t6 = (-0.00490016126713387) * t6;
+    t9 = x[280];
+    t9 = 0.07827557368950344 * t9;
+    t6 = t6 - t9;
+    t9 = (-0.06638961341253985) * t8;
+    t10 = C4 * t6;
+    t9 = t9 + t10;
+    t10 = 0.04436012146197969 * t8;
+    t8 = C5 * t6;
+    t6 = t10 + t8;
+    t10 = x[0];
+    t8 = (-2.3884315505491365e-05) * t10;
+    t10 = x[319];
+    t10 = 0.07903867319482309 * t10;
+    t8 = t8 - t10;
+    t10 = x[320];
+    t11 = C6 * t8;
+    t12 = (-0.055914620068614564) * t10;
+    t11 = t11 + t12;
+    t12 = (-0.7071067811865475) * t8;
+    t8 = (-0.05591462006861457) * t10;
+    t10 = t12 + t8;
+    t12 = x[40];
+    t8 = (-0.005112632604600919) * t12;
+    t12 = x[279];
+    t12 = 0.07827371140841262 * t12;
+    t8 = t8 - t12;
+    t12 = x[360];
+    t13 = C4 * t8;
+    t14 = (-0.0663911929482417) * t12;
+    t13 = t13 + t14;
+    t14 = (-C5) * t8;
+    t8 = (-0.0443611768739935) * t12;
+    t12 = t14 + t8;
+    t14 = x[80];
+    t8 = (-0.007518887211504584) * t14;
+    t14 = x[239];
+    t14 = 0.07806049438418153 * t14;
+    t8 = t8 - t14;
+    t14 = x[400];
+    t15 = C2 * t8;
+    t16 = (-0.07397143873797521) * t14;
+    t15 = t15 + t16;
+    t16 = (-C3) * t8;
+    t8 = (-0.030639973153519875) * t14;
+    t14 = t16 + t8;
+    t16 = x[120];
+    t8 = 0.017676702329292165 * t16;
+    t16 = x[199];
+    t16 = 0.08010437254240924 * t16;
+    t8 = t8 - t16;
+    t16 = x[440];
+    t16 = 0.07794557950580416 * t16;
+    t17 = x[519];
+    t17 = 0.0003517772216361772 * t17;
+    t16 = t16 + t17;
+    t17 = C0 * t8;
+    t18 = (-C1) * t16;
+    t17 = t17 + t18;
+    t18 = (-C1) * t8;
+    t8 = (-C0) * t16;
+    t16 = t18 + t8;
+    t18 = t11 - t0;
+    t8 = t1 + t10;
+    t0 = t7 + t15;
+    t19 = t3 + t14;
+    t2 = t2 - t11;
+    t11 = t1 - t10;
+    t1 = t7 - t15;
+    t10 = t3 - t14;
+    t7 = t18 + t0;
+    t15 = t8 + t19;
+    t3 = t2 + t10;
+    t14 = t11 - t1;
+    t18 = t18 - t0;
+    t0 = t8 - t19;
+    t8 = t2 - t10;
+    t19 = t11 + t1;
+    t2 = t5 + t13;
+    t10 = t4 + t12;
+    t11 = t9 + t17;
+    t1 = t6 + t16;
+    t5 = t5 - t13;
+    t13 = t4 - t12;
+    t4 = t9 - t17;
+    t12 = t6 - t16;
+    t9 = t2 + t11;
+    t17 = t10 + t1;
+    t6 = t5 + t12;
+    t16 = t13 - t4;
+    t2 = t2 - t11;
+    t11 = t10 - t1;
+    t10 = t5 - t12;
+    t1 = t13 + t4;
+    t5 = t6 + t16;
+    t12 = t6 - t16;
+    t13 = C6 * t5;
+    t4 = (-C6) * t12;
+    t6 = t10 - t1;
+    t16 = t10 + t1;
+    t5 = (-C6) * t6;
+    t12 = (-C6) * t16;
+    t10 = t7 - t9;
+    t1 = t15 - t17;
+    t6 = t7 + t9;
+    t16 = t15 + t17;
+    t7 = t3 - t13;
+    t9 = t14 - t4;
+    t15 = t3 + t13;
+    t17 = t14 + t4;
+    t3 = t18 - t11;
+    t13 = t0 + t2;
+    t14 = t18 + t11;
+    t4 = t0 - t2;
+    t18 = t8 - t5;
+    t11 = t19 - t12;
+    t0 = t8 + t5;
+    t2 = t19 + t12;
+    re[0] = t6;
+    im[0] = t16;
+    re[20] = t15;
+    im[20] = t17;
+    re[40] = t14;
+    im[40] = t4;
+    re[60] = t0;
+    im[60] = t2;
+    re[80] = t10;
+    im[80] = t1;
+    re[100] = t7;
+    im[100] = t9;
+    re[120] = t3;
+    im[120] = t13;
+    re[140] = t18;
+    im[140] = t11;
+    t8 = x[469];
+    t5 = 0.06026673653310746 * t8;
+    t19 = x[490];
+    t12 = 0.027961403770009628 * t19;
+    t6 = t5 + t12;
+    t16 = x[149];
+    t15 = 0.05682077379979854 * t16;
+    t17 = x[170];
+    t14 = 0.07734301987131527 * t17;
+    t4 = t15 - t14;
+    t0 = (-C7) * t6;
+    t2 = C8 * t4;
+    t10 = t0 + t2;
+    t1 = C8 * t6;
+    t7 = C7 * t4;
+    t9 = t1 + t7;
+    t3 = x[429];
+    t13 = x[109];
+    t18 = 0.00672971468946736 * t13;
+    t11 = x[210];
+    t8 = 0.0789296508586412 * t11;
+    t19 = t18 - t8;
+    t5 = (-0.07681137907633552) * t3;
+    t12 = C9 * t19;
+    t16 = t5 + t12;
+    t17 = 0.019240248852933326 * t3;
+    t15 = C10 * t19;
+    t14 = t17 + t15;
+    t0 = x[389];
+    t2 = x[69];
+    t6 = (-0.008710013292504275) * t2;
+    t4 = x[250];
+    t1 = 0.0781174046680525 * t4;
+    t7 = t6 - t1;
+    t13 = (-0.07232617501861478) * t0;
+    t11 = C11 * t7;
+    t18 = t13 + t11;
+    t8 = 0.03420773315875552 * t0;
+    t5 = C12 * t7;
+    t12 = t8 + t5;
+    t3 = x[349];
+    t19 = x[29];
+    t17 = (-0.0028466989314485424) * t19;
+    t15 = x[290];
+    t2 = 0.07832023018246469 * t15;
+    t4 = t17 - t2;
+    t6 = (-0.06409642898212498) * t3;
+    t1 = C13 * t4;
+    t13 = t6 + t1;
+    t11 = 0.04753715156867971 * t3;
+    t0 = C14 * t4;
+    t7 = t11 + t0;
+    t8 = x[10];
+    t5 = (-0.000388530381880178) * t8;
+    t19 = x[309];
+    t15 = 0.0786937394764498 * t19;
+    t17 = t5 - t15;
+    t2 = x[330];
+    t6 = C15 * t17;
+    t1 = (-0.05884768679539457) * t2;
+    t3 = t6 + t1;
+    t4 = (-C16) * t17;
+    t11 = (-0.05333643433033131) * t2;
+    t0 = t4 + t11;
+    t8 = x[50];
+    t19 = (-0.007092253041875984) * t8;
+    t5 = x[269];
+    t15 = 0.07825130761949729 * t5;
+    t6 = t19 - t15;
+    t1 = x[370];
+    t17 = C17 * t6;
+    t2 = (-0.06850753010504312) * t1;
+    t4 = t17 + t2;
+    t11 = (-C18) * t6;
+    t8 = (-0.04106183332848282) * t1;
+    t5 = t11 + t8;
+    t19 = x[90];
+    t15 = (-0.0046717798345097695) * t19;
+    t17 = x[229];
+    t2 = 0.07813000708333884 * t17;
+    t6 = t15 - t2;
+    t1 = x[410];
+    t11 = C19 * t6;
+    t8 = (-0.07531869798906976) * t1;
+    t19 = t11 + t8;
+    t17 = (-C20) * t6;
+    t15 = (-0.0269494610624499) * t1;
+    t2 = t17 + t15;
+    t11 = x[130];
+    t8 = 0.03025630083312543 * t11;
+    t6 = x[189];
+    t1 = 0.08114318050945657 * t6;
+    t17 = t8 - t1;
+    t15 = x[450];
+    t11 = 0.07528092638447868 * t15;
+    t6 = x[509];
+    t8 = 0.004675594754473637 * t6;
+    t1 = t11 + t8;
+    t15 = C21 * t17;
+    t6 = (-C22) * t1;
+    t11 = t15 + t6;
+    t8 = (-C22) * t17;
+    t15 = (-C21) * t1;
+    t6 = t8 + t15;
+    t17 = t10 + t3;
+    t1 = t9 + t0;
+    t8 = t18 + t19;
+    t15 = t12 + t2;
+    t10 = t10 - t3;
+    t3 = t9 - t0;
+    t9 = t18 - t19;
+    t0 = t12 - t2;
+    t18 = t17 + t8;
+    t19 = t1 + t15;
+    t12 = t10 + t0;
+    t2 = t3 - t9;
+    t17 = t17 - t8;
+    t8 = t1 - t15;
+    t1 = t10 - t0;
+    t15 = t3 + t9;
+    t10 = t16 + t4;
+    t0 = t14 + t5;
+    t3 = t13 + t11;
+    t9 = t7 + t6;
+    t16 = t16 - t4;
+    t4 = t14 - t5;
+    t14 = t13 - t11;
+    t5 = t7 - t6;
+    t13 = t10 + t3;
+    t11 = t0 + t9;
+    t7 = t16 + t5;
+    t6 = t4 - t14;
+    t10 = t10 - t3;
+    t3 = t0 - t9;
+    t0 = t16 - t5;
+    t9 = t4 + t14;
+    t16 = t7 + t6;
+    t5 = t7 - t6;
+    t4 = C6 * t16;
+    t14 = (-C6) * t5;
+    t7 = t0 - t9;
+    t6 = t0 + t9;
+    t16 = (-C6) * t7;
+    t5 = (-C6) * t6;
+    t0 = t18 - t13;
+    t9 = t19 - t11;
+    t7 = t18 + t13;
+    t6 = t19 + t11;
+    t18 = t12 - t4;
+    t13 = t2 - t14;
+    t19 = t12 + t4;
+    t11 = t2 + t14;
+    t12 = t17 - t3;
+    t4 = t8 + t10;
+    t2 = t17 + t3;
+    t14 = t8 - t10;
+    t17 = t1 - t16;
+    t3 = t15 - t5;
+    t8 = t1 + t16;
+    t10 = t15 + t5;
+    t1 = t19 + t11;
+    t16 = C1 * t1;
+    t15 = t19 * (-C23);
+    t5 = t11 * C24;
+    t1 = t16 - t5;
+    t19 = t16 + t15;
+    t11 = t2 + t14;
+    t5 = C3 * t11;
+    t16 = t2 * (-C25);
+    t15 = t14 * C26;
+    t11 = t5 - t15;
+    t2 = t5 + t16;
+    t14 = t8 + t10;
+    t15 = C5 * t14;
+    t5 = t8 * (-C27);
+    t16 = t10 * C28;
+    t14 = t15 - t16;
+    t8 = t15 + t5;
+    t10 = t0 + t9;
+    t16 = t0 - t9;
+    t15 = C6 * t10;
+    t5 = (-C6) * t16;
+    t0 = t18 + t13;
+    t9 = C4 * t0;
+    t10 = t18 * (-C27);
+    t16 = t13 * (-C28);
+    t0 = t9 - t16;
+    t18 = t9 + t10;
+    t13 = t12 + t4;
+    t16 = C2 * t13;
+    t9 = t12 * (-C25);
+    t10 = t4 * (-C26);
+    t13 = t16 - t10;
+    t12 = t16 + t9;
+    t4 = t17 + t3;
+    t10 = C0 * t4;
+    t16 = t17 * (-C23);
+    t9 = t3 * (-C24);
+    t4 = t10 - t9;
+    t17 = t10 + t16;
+    re[5] = t7;
+    im[5] = t6;
+    re[25] = t1;
+    im[25] = t19;
+    re[45] = t11;
+    im[45] = t2;
+    re[65] = t14;
+    im[65] = t8;
+    re[85] = t15;
+    im[85] = t5;
+    re[105] = t0;
+    im[105] = t18;
+    re[125] = t13;
+    im[125] = t12;
+    re[145] = t4;
+    im[145] = t17;
+    t3 = x[459];
+    t9 = 0.0702130944467205 * t3;
+    t10 = x[500];
+    t16 = 0.013432310384368186 * t10;
+    t7 = t9 + t16;
+    t6 = x[139];
+    t1 = 0.04289372215178292 * t6;
+    t19 = x[180];
+    t11 = 0.08080883281425316 * t19;
+    t2 = t1 - t11;
+    t14 = (-C29) * t7;
+    t8 = C30 * t2;
+    t15 = t14 + t8;
+    t5 = C30 * t7;
+    t0 = C29 * t2;
+    t18 = t5 + t0;
+    t13 = x[419];
+    t12 = x[99];
+    t4 = (-0.00036912470608087516) * t12;
+    t17 = x[220];
+    t3 = 0.07836596519679581 * t17;
+    t10 = t4 - t3;
+    t9 = (-0.0763198294477313) * t13;
+    t16 = C31 * t10;
+    t6 = t9 + t16;
+    t19 = 0.023151367156447278 * t13;
+    t1 = C32 * t10;
+    t11 = t19 + t1;
+    t14 = x[379];
+    t8 = x[59];
+    t7 = (-0.008337979459723047) * t8;
+    t2 = x[260];
+    t5 = 0.07820083419064082 * t2;
+    t0 = t7 - t5;
+    t12 = (-0.070485282660027) * t14;
+    t17 = C33 * t0;
+    t4 = t12 + t17;
+    t3 = 0.03767516850242367 * t14;
+    t9 = C34 * t0;
+    t16 = t3 + t9;
+    t13 = x[339];
+    t10 = x[19];
+    t19 = (-0.0012403161494891884) * t10;
+    t1 = x[300];
+    t8 = 0.07846068721664735 * t1;
+    t2 = t19 - t8;
+    t7 = (-0.06157625563712913) * t13;
+    t5 = C35 * t2;
+    t12 = t7 + t5;
+    t17 = 0.050534327020035616 * t13;
+    t14 = C36 * t2;
+    t0 = t17 + t14;
+    t3 = x[20];
+    t9 = (-0.001371252207873613) * t3;
+    t10 = x[299];
+    t1 = 0.07844101758359247 * t10;
+    t19 = t9 - t1;
+    t8 = x[340];
+    t7 = C35 * t19;
+    t5 = (-0.06159169631332874) * t8;
+    t13 = t7 + t5;
+    t2 = (-C36) * t19;
+    t17 = (-0.05054699885550868) * t8;
+    t14 = t2 + t17;
+    t3 = x[60];
+    t10 = (-0.008428741800686423) * t3;
+    t9 = x[259];
+    t1 = 0.0781932228314296 * t9;
+    t7 = t10 - t1;
+    t5 = x[380];
+    t19 = C33 * t7;
+    t8 = (-0.07049214372529587) * t5;
+    t2 = t19 + t8;
+    t17 = (-C34) * t7;
+    t3 = (-0.037678835818214365) * t5;
+    t9 = t17 + t3;
+    t10 = x[100];
+    t1 = 0.0002248455903077584 * t10;
+    t19 = x[219];
+    t8 = 0.07840577934625735 * t19;
+    t7 = t1 - t8;
+    t5 = x[420];
+    t17 = C31 * t7;
+    t3 = (-0.07628107453550612) * t5;
+    t10 = t17 + t3;
+    t19 = (-C32) * t7;
+    t1 = (-0.023139610982350275) * t5;
+    t8 = t19 + t1;
+    t17 = x[140];
+    t3 = 0.04432178833723134 * t17;
+    t7 = x[179];
+    t5 = 0.08063245485341218 * t7;
+    t19 = t3 - t5;
+    t1 = x[460];
+    t17 = 0.06943487281706444 * t1;
+    t7 = x[499];
+    t3 = 0.014694708331038423 * t7;
+    t5 = t17 + t3;
+    t1 = C30 * t19;
+    t7 = (-C29) * t5;
+    t17 = t1 + t7;
+    t3 = (-C29) * t19;
+    t1 = (-C30) * t5;
+    t7 = t3 + t1;
+    t19 = t15 + t13;
+    t5 = t18 + t14;
+    t3 = t4 + t10;
+    t1 = t16 + t8;
+    t15 = t15 - t13;
+    t13 = t18 - t14;
+    t18 = t4 - t10;
+    t14 = t16 - t8;
+    t4 = t19 + t3;
+    t10 = t5 + t1;
+    t16 = t15 + t14;
+    t8 = t13 - t18;
+    t19 = t19 - t3;
+    t3 = t5 - t1;
+    t5 = t15 - t14;
+    t1 = t13 + t18;
+    t15 = t6 + t2;
+    t14 = t11 + t9;
+    t13 = t12 + t17;
+    t18 = t0 + t7;
+    t6 = t6 - t2;
+    t2 = t11 - t9;
+    t11 = t12 - t17;
+    t9 = t0 - t7;
+    t12 = t15 + t13;
+    t17 = t14 + t18;
+    t0 = t6 + t9;
+    t7 = t2 - t11;
+    t15 = t15 - t13;
+    t13 = t14 - t18;
+    t14 = t6 - t9;
+    t18 = t2 + t11;
+    t6 = t0 + t7;
+    t9 = t0 - t7;
+    t2 = C6 * t6;
+    t11 = (-C6) * t9;
+    t0 = t14 - t18;
+    t7 = t14 + t18;
+    t6 = (-C6) * t0;
+    t9 = (-C6) * t7;
+    t14 = t4 - t12;
+    t18 = t10 - t17;
+    t0 = t4 + t12;
+    t7 = t10 + t17;
+    t4 = t16 - t2;
+    t12 = t8 - t11;
+    t10 = t16 + t2;
+    t17 = t8 + t11;
+    t16 = t19 - t13;
+    t2 = t3 + t15;
+    t8 = t19 + t13;
+    t11 = t3 - t15;
+    t19 = t5 - t6;
+    t13 = t1 - t9;
+    t3 = t5 + t6;
+    t15 = t1 + t9;
+    t5 = t10 + t17;
+    t6 = C3 * t5;
+    t1 = t10 * (-C25);
+    t9 = t17 * C26;
+    t5 = t6 - t9;
+    t10 = t6 + t1;
+    t17 = t8 + t11;
+    t9 = t8 - t11;
+    t6 = C6 * t17;
+    t1 = (-C6) * t9;
+    t8 = t3 + t15;
+    t11 = C2 * t8;
+    t17 = t3 * (-C25);
+    t9 = t15 * (-C26);
+    t8 = t11 - t9;
+    t3 = t11 + t17;
+    t15 = -t14;
+    t9 = t4 + t12;
+    t11 = (-C2) * t9;
+    t17 = t4 * (-C26);
+    t14 = t12 * (-C25);
+    t9 = t11 - t14;
+    t4 = t11 + t17;
+    t12 = t16 - t2;
+    t14 = t16 + t2;
+    t11 = (-C6) * t12;
+    t17 = (-C6) * t14;
+    t16 = t19 + t13;
+    t2 = (-C3) * t16;
+    t12 = t19 * C26;
+    t14 = t13 * (-C25);
+    t16 = t2 - t14;
+    t19 = t2 + t12;
+    re[10] = t0;
+    im[10] = t7;
+    re[30] = t5;
+    im[30] = t10;
+    re[50] = t6;
+    im[50] = t1;
+    re[70] = t8;
+    im[70] = t3;
+    re[90] = t18;
+    im[90] = t15;
+    re[110] = t9;
+    im[110] = t4;
+    re[130] = t11;
+    im[130] = t17;
+    re[150] = t16;
+    im[150] = t19;
+    t13 = x[449];
+    t14 = 0.07565838687825509 * t13;
+    t2 = x[510];
+    t12 = 0.004008102353092296 * t2;
+    t0 = t14 + t12;
+    t7 = x[129];
+    t5 = 0.028908280442592 * t7;
+    t10 = x[190];
+    t6 = 0.08107670419942832 * t10;
+    t1 = t5 - t6;
+    t8 = (-C22) * t0;
+    t3 = C21 * t1;
+    t18 = t8 + t3;
+    t15 = C21 * t0;
+    t9 = C22 * t1;
+    t4 = t15 + t9;
+    t11 = x[409];
+    t17 = x[89];
+    t16 = (-0.0050419445369264924) * t17;
+    t19 = x[230];
+    t13 = 0.07811531141943964 * t19;
+    t2 = t16 - t13;
+    t14 = (-0.07533286753215755) * t11;
+    t12 = C19 * t2;
+    t7 = t14 + t12;
+    t10 = 0.026954531006035124 * t11;
+    t5 = C20 * t2;
+    t6 = t10 + t5;
+    t8 = x[369];
+    t3 = x[49];
+    t0 = (-0.006914619827194874) * t3;
+    t1 = x[270];
+    t15 = 0.07825475177229257 * t1;
+    t9 = t0 - t15;
+    t17 = (-0.06850451494754833) * t8;
+    t19 = C17 * t9;
+    t16 = t17 + t19;
+    t13 = 0.041060026112629024 * t8;
+    t14 = C18 * t9;
+    t12 = t13 + t14;
+    t11 = x[329];
+    t2 = x[9];
+    t10 = (-0.0003285577883509001) * t2;
+    t5 = x[310];
+    t3 = 0.07872520840851852 * t5;
+    t1 = t10 - t3;
+    t0 = (-0.058824163531428664) * t11;
+    t15 = C15 * t1;
+    t17 = t0 + t15;
+    t19 = 0.05331511408662972 * t11;
+    t8 = C16 * t1;
+    t9 = t19 + t8;
+    t13 = x[30];
+    t14 = (-0.0030386339806276795) * t13;
+    t2 = x[289];
+    t5 = 0.0783124239450518 * t2;
+    t10 = t14 - t5;
+    t3 = x[350];
+    t0 = C13 * t10;
+    t15 = (-0.06410281815917693) * t3;
+    t11 = t0 + t15;
+    t1 = (-C14) * t10;
+    t19 = (-0.04754189010533051) * t3;
+    t8 = t1 + t19;
+    t13 = x[70];
+    t2 = (-0.00867600412008019) * t13;
+    t14 = x[249];
+    t5 = 0.07810930754132253 * t14;
+    t0 = t2 - t5;
+    t15 = x[390];
+    t10 = C11 * t0;
+    t3 = (-0.07233367264243777) * t15;
+    t1 = t10 + t3;
+    t19 = (-C12) * t0;
+    t13 = (-0.03421127927072668) * t15;
+    t14 = t19 + t13;
+    t2 = x[110];
+    t5 = 0.0075870820171638305 * t2;
+    t10 = x[209];
+    t3 = 0.07900998800352993 * t10;
+    t0 = t5 - t3;
+    t15 = x[430];
+    t19 = C9 * t0;
+    t13 = (-0.07673327747113486) * t15;
+    t2 = t19 + t13;
+    t10 = (-C10) * t0;
+    t5 = (-0.01922068541926055) * t15;
+    t3 = t10 + t5;
+    t19 = x[150];
+    t13 = 0.058131582707871575 * t19;
+    t0 = x[169];
+    t15 = 0.07676973640263576 * t0;
+    t10 = t13 - t15;
+    t5 = x[470];
+    t19 = 0.059011947189589936 * t5;
+    t0 = x[489];
+    t13 = 0.029582342154535285 * t0;
+    t15 = t19 + t13;
+    t5 = C8 * t10;
+    t0 = (-C7) * t15;
+    t19 = t5 + t0;
+    t13 = (-C7) * t10;
+    t5 = (-C8) * t15;
+    t0 = t13 + t5;
+    t10 = t18 + t11;
+    t15 = t4 + t8;
+    t13 = t16 + t2;
+    t5 = t12 + t3;
+    t18 = t18 - t11;
+    t11 = t4 - t8;
+    t4 = t16 - t2;
+    t8 = t12 - t3;
+    t16 = t10 + t13;
+    t2 = t15 + t5;
+    t12 = t18 + t8;
+    t3 = t11 - t4;
+    t10 = t10 - t13;
+    t13 = t15 - t5;
+    t15 = t18 - t8;
+    t5 = t11 + t4;
+    t18 = t7 + t1;
+    t8 = t6 + t14;
+    t11 = t17 + t19;
+    t4 = t9 + t0;
+    t7 = t7 - t1;
+    t1 = t6 - t14;
+    t6 = t17 - t19;
+    t14 = t9 - t0;
+    t17 = t18 + t11;
+    t19 = t8 + t4;
+    t9 = t7 + t14;
+    t0 = t1 - t6;
+    t18 = t18 - t11;
+    t11 = t8 - t4;
+    t8 = t7 - t14;
+    t4 = t1 + t6;
+    t7 = t9 + t0;
+    t14 = t9 - t0;
+    t1 = C6 * t7;
+    t6 = (-C6) * t14;
+    t9 = t8 - t4;
+    t0 = t8 + t4;
+    t7 = (-C6) * t9;
+    t14 = (-C6) * t0;
+    t8 = t16 - t17;
+    t4 = t2 - t19;
+    t9 = t16 + t17;
+    t0 = t2 + t19;
+    t16 = t12 - t1;
+    t17 = t3 - t6;
+    t2 = t12 + t1;
+    t19 = t3 + t6;
+    t12 = t10 - t11;
+    t1 = t13 + t18;
+    t3 = t10 + t11;
+    t6 = t13 - t18;
+    t10 = t15 - t7;
+    t11 = t5 - t14;
+    t13 = t15 + t7;
+    t18 = t5 + t14;
+    t15 = t2 + t19;
+    t7 = C5 * t15;
+    t5 = t2 * (-C27);
+    t14 = t19 * C28;
+    t15 = t7 - t14;
+    t2 = t7 + t5;
+    t19 = t3 + t6;
+    t14 = C2 * t19;
+    t7 = t3 * (-C25);
+    t5 = t6 * (-C26);
+    t19 = t14 - t5;
+    t3 = t14 + t7;
+    t6 = t13 + t18;
+    t5 = (-C0) * t6;
+    t14 = t13 * (-C24);
+    t7 = t18 * (-C23);
+    t6 = t5 - t7;
+    t13 = t5 + t14;
+    t18 = t8 - t4;
+    t7 = t8 + t4;
+    t5 = (-C6) * t18;
+    t14 = (-C6) * t7;
+    t8 = t16 + t17;
+    t4 = (-C1) * t8;
+    t18 = t16 * C24;
+    t7 = t17 * (-C23);
+    t8 = t4 - t7;
+    t16 = t4 + t18;
+    t17 = t12 + t1;
+    t7 = (-C3) * t17;
+    t4 = t12 * C25;
+    t18 = t1 * (-C26);
+    t17 = t7 - t18;
+    t12 = t7 + t4;
+    t1 = t10 + t11;
+    t18 = (-C4) * t1;
+    t7 = t10 * C27;
+    t4 = t11 * C28;
+    t1 = t18 - t4;
+    t10 = t18 + t7;
+    re[15] = t9;
+    im[15] = t0;
+    re[35] = t15;
+    im[35] = t2;
+    re[55] = t19;
+    im[55] = t3;
+    re[75] = t6;
+    im[75] = t13;
+    re[95] = t5;
+    im[95] = t14;
+    re[115] = t8;
+    im[115] = t16;
+    re[135] = t17;
+    im[135] = t12;
+    re[155] = t1;
+    im[155] = t10;
+    t11 = re[0];
+    t4 = im[0];
+    t18 = re[5];
+    t7 = im[5];
+    t9 = re[10];
+    t0 = im[10];
+    t15 = re[15];
+    t2 = im[15];
+    t19 = t11 + t9;
+    t3 = t4 + t0;
+    t6 = t18 + t15;
+    t13 = t7 + t2;
+    t5 = t11 - t9;
+    t14 = t4 - t0;
+    t8 = t18 - t15;
+    t16 = t7 - t2;
+    t17 = t19 + t6;
+    t12 = t3 + t13;
+    t1 = t5 + t16;
+    t10 = t14 - t8;
+    t11 = t19 - t6;
+    t9 = t3 - t13;
+    t4 = t5 - t16;
+    t0 = t14 + t8;
+    re[0] = t17;
+    im[0] = t12;
+    re[5] = t1;
+    im[5] = t10;
+    re[10] = t11;
+    im[10] = t9;
+    re[15] = t4;
+    im[15] = t0;
+    t18 = re[20];
+    t15 = im[20];
+    t7 = re[25];
+    t2 = im[25];
+    t19 = re[30];
+    t6 = im[30];
+    t3 = re[35];
+    t13 = im[35];
+    t5 = t18 + t19;
+    t16 = t15 + t6;
+    t14 = t7 + t3;
+    t8 = t2 + t13;
+    t17 = t18 - t19;
+    t12 = t15 - t6;
+    t1 = t7 - t3;
+    t10 = t2 - t13;
+    t11 = t5 + t14;
+    t9 = t16 + t8;
+    t4 = t17 + t10;
+    t0 = t12 - t1;
+    t18 = t5 - t14;
+    t19 = t16 - t8;
+    t15 = t17 - t10;
+    t6 = t12 + t1;
+    re[20] = t11;
+    im[20] = t9;
+    re[25] = t4;
+    im[25] = t0;
+    re[30] = t18;
+    im[30] = t19;
+    re[35] = t15;
+    im[35] = t6;
+    t7 = re[40];
+    t3 = im[40];
+    t2 = re[45];
+    t13 = im[45];
+    t5 = re[50];
+    t14 = im[50];
+    t16 = re[55];
+    t8 = im[55];
+    t17 = t7 + t5;
+    t10 = t3 + t14;
+    t12 = t2 + t16;
+    t1 = t13 + t8;
+    t11 = t7 - t5;
+    t9 = t3 - t14;
+    t4 = t2 - t16;
+    t0 = t13 - t8;
+    t18 = t17 + t12;
+    t19 = t10 + t1;
+    t15 = t11 + t0;
+    t6 = t9 - t4;
+    t7 = t17 - t12;
+    t5 = t10 - t1;
+    t3 = t11 - t0;
+    t14 = t9 + t4;
+    re[40] = t18;
+    im[40] = t19;
+    re[45] = t15;
+    im[45] = t6;
+    re[50] = t7;
+    im[50] = t5;
+    re[55] = t3;
+    im[55] = t14;
+    t2 = re[60];
+    t16 = im[60];
+    t13 = re[65];
+    t8 = im[65];
+    t17 = re[70];
+    t12 = im[70];
+    t10 = re[75];
+    t1 = im[75];
+    t11 = t2 + t17;
+    t0 = t16 + t12;
+    t9 = t13 + t10;
+    t4 = t8 + t1;
+    t18 = t2 - t17;
+    t19 = t16 - t12;
+    t15 = t13 - t10;
+    t6 = t8 - t1;
+    t7 = t11 + t9;
+    t5 = t0 + t4;
+    t3 = t18 + t6;
+    t14 = t19 - t15;
+    t2 = t11 - t9;
+    t17 = t0 - t4;
+    t16 = t18 - t6;
+    t12 = t19 + t15;
+    re[60] = t7;
+    im[60] = t5;
+    re[65] = t3;
+    im[65] = t14;
+    re[70] = t2;
+    im[70] = t17;
+    re[75] = t16;
+    im[75] = t12;
+    t13 = re[80];
+    t10 = im[80];
+    t8 = re[85];
+    t1 = im[85];
+    t11 = re[90];
+    t9 = im[90];
+    t0 = re[95];
+    t4 = im[95];
+    t18 = t13 + t11;
+    t6 = t10 + t9;
+    t19 = t8 + t0;
+    t15 = t1 + t4;
+    t7 = t13 - t11;
+    t5 = t10 - t9;
+    t3 = t8 - t0;
+    t14 = t1 - t4;
+    t2 = t18 + t19;
+    t17 = t6 + t15;
+    t16 = t7 + t14;
+    t12 = t5 - t3;
+    t13 = t18 - t19;
+    t11 = t6 - t15;
+    t10 = t7 - t14;
+    t9 = t5 + t3;
+    re[80] = t2;
+    im[80] = t17;
+    re[85] = t16;
+    im[85] = t12;
+    re[90] = t13;
+    im[90] = t11;
+    re[95] = t10;
+    im[95] = t9;
+    t8 = re[100];
+    t0 = im[100];
+    t1 = re[105];
+    t4 = im[105];
+    t18 = re[110];
+    t19 = im[110];
+    t6 = re[115];
+    t15 = im[115];
+    t7 = t8 + t18;
+    t14 = t0 + t19;
+    t5 = t1 + t6;
+    t3 = t4 + t15;
+    t2 = t8 - t18;
+    t17 = t0 - t19;
+    t16 = t1 - t6;
+    t12 = t4 - t15;
+    t13 = t7 + t5;
+    t11 = t14 + t3;
+    t10 = t2 + t12;
+    t9 = t17 - t16;
+    t8 = t7 - t5;
+    t18 = t14 - t3;
+    t0 = t2 - t12;
+    t19 = t17 + t16;
+    re[100] = t13;
+    im[100] = t11;
+    re[105] = t10;
+    im[105] = t9;
+    re[110] = t8;
+    im[110] = t18;
+    re[115] = t0;
+    im[115] = t19;
+    t1 = re[120];
+    t6 = im[120];
+    t4 = re[125];
+    t15 = im[125];
+    t7 = re[130];
+    t5 = im[130];
+    t14 = re[135];
+    t3 = im[135];
+    t2 = t1 + t7;
+    t12 = t6 + t5;
+    t17 = t4 + t14;
+    t16 = t15 + t3;
+    t13 = t1 - t7;
+    t11 = t6 - t5;
+    t10 = t4 - t14;
+    t9 = t15 - t3;
+    t8 = t2 + t17;
+    t18 = t12 + t16;
+    t0 = t13 + t9;
+    t19 = t11 - t10;
+    t1 = t2 - t17;
+    t7 = t12 - t16;
+    t6 = t13 - t9;
+    t5 = t11 + t10;
+    re[120] = t8;
+    im[120] = t18;
+    re[125] = t0;
+    im[125] = t19;
+    re[130] = t1;
+    im[130] = t7;
+    re[135] = t6;
+    im[135] = t5;
+    t4 = re[140];
+    t14 = im[140];
+    t15 = re[145];
+    t3 = im[145];
+    t2 = re[150];
+    t17 = im[150];
+    t12 = re[155];
+    t16 = im[155];
+    t13 = t4 + t2;
+    t9 = t14 + t17;
+    t11 = t15 + t12;
+    t10 = t3 + t16;
+    t8 = t4 - t2;
+    t18 = t14 - t17;
+    t0 = t15 - t12;
+    t19 = t3 - t16;
+    t1 = t13 + t11;
+    t7 = t9 + t10;
+    t6 = t8 + t19;
+    t5 = t18 - t0;
+    t4 = t13 - t11;
+    t2 = t9 - t10;
+    t14 = t8 - t19;
+    t17 = t18 + t0;
+    re[140] = t1;
+    im[140] = t7;
+    re[145] = t6;
+    im[145] = t5;
+    re[150] = t4;
+    im[150] = t2;
+    re[155] = t14;
+    im[155] = t17;
+}
+
+/**
+ *  Part 2 of ApplyWindowedMDCT_W10_320().
+ * 
+ *  @param {Number[]} x 
+ *    - The input block (640 points).
+ *  @param {Number[]} X 
+ *    - The array that would contain the output block (320 points).
+ *  @param {Number[]} re 
+ *    - The scratch buffer (real part, 160 points).
+ *  @param {Number[]} im 
+ *    - The scratch buffer (imaginary part, 160 points).
+ */
+function ApplyWindowedMDCT_W10_320_Part2(x, X, re, im) {
+    let t0, t1, t10, t11, t12, t13, t14, t15, t16, t17, t18, t19, t2, t3, t4, t5, t6, t7, t8, t9;
+    const C0 = 0.07845909572784494;
+    const C1 = 0.996917333733128;
+    const C2 = 0.9930684569549263;
+    const C3 = 0.11753739745783764;
+    const C4 = 0.7071067811865476;
+    const C5 = 0.02944817324796316;
+    const C6 = 0.9995663085020212;
+    const C7 = 0.9861049757675088;
+    const C8 = 0.16612337814576547;
+    const C9 = 0.9807852804032304;
+    const C10 = 1.1758756024193586;
+    const C11 = 0.7856949583871022;
+    const C12 = 0.9238795325112867;
+    const C13 = 1.3065629648763766;
+    const C14 = 0.5411961001461969;
+    const C15 = 0.8314696123025452;
+    const C16 = 1.3870398453221475;
+    const C17 = 0.27589937928294306;
+    const C18 = 0.5555702330196022;
+    const C19 = 0.3826834323650898;
+    const C20 = 0.19509032201612825;
+    const C21 = 0.1757962799343545;
+    const C22 = 0.9844265680898916;
+    const C23 = 0.9998072404820648;
+    const C24 = 0.0196336924606283;
+    const C25 = 0.1272810033739132;
+    const C26 = 0.991866697787626;
+    const C27 = 0.9976395492470157;
+    const C28 = 0.06866825888437376;
+    t15 = x[415];
+    t12 = x[95];
+    t3 = (-0.002505779022165046) * t12;
+    t16 = x[224];
+    t13 = 0.07823601689077271 * t16;
+    t11 = t3 - t13;
+    t9 = (-0.07597655738460485) * t15;
+    t10 = 0.3090169943749474 * t11;
+    t8 = t9 + t10;
+    t19 = 0.024686279946227782 * t15;
+    t18 = 0.9510565162951535 * t11;
+    t0 = t19 + t18;
+    t1 = x[375];
+    t7 = x[55];
+    t6 = (-0.007872372680343373) * t7;
+    t5 = x[264];
+    t4 = 0.07822760983345828 * t5;
+    t2 = t6 - t4;
+    t14 = (-0.06970812550472008) * t1;
+    t17 = 0.4886212414969549 * t2;
+    t12 = t14 + t17;
+    t16 = 0.03903842602193133 * t1;
+    t3 = 0.8724960070727972 * t2;
+    t13 = t16 + t3;
+    t9 = x[335];
+    t10 = x[15];
+    t15 = (-0.0007898186170955989) * t10;
+    t11 = x[304];
+    t19 = 0.07855225056629657 * t11;
+    t18 = t15 - t19;
+    t7 = (-0.06050160562858915) * t9;
+    t5 = 0.6494480483301837 * t18;
+    t6 = t7 + t5;
+    t4 = 0.05167325280690575 * t9;
+    t14 = 0.7604059656000309 * t18;
+    t17 = t4 + t14;
+    t1 = x[24];
+    t2 = (-0.0019647292104819658) * t1;
+    t16 = x[295];
+    t3 = 0.07837522251645646 * t16;
+    t10 = t2 - t3;
+    t11 = x[344];
+    t15 = 0.619093949309834 * t10;
+    t19 = (-0.06262477681609226) * t11;
+    t7 = t15 + t19;
+    t5 = (-0.785316930880745) * t10;
+    t9 = (-0.04936939327188533) * t11;
+    t18 = t5 + t9;
+    t4 = x[64];
+    t14 = (-0.008678366232986501) * t4;
+    t1 = x[255];
+    t16 = 0.07816018608419902 * t1;
+    t2 = t14 - t16;
+    t3 = x[384];
+    t15 = 0.45399049973954675 * t2;
+    t19 = (-0.0712484329320589) * t3;
+    t10 = t15 + t19;
+    t11 = (-0.8910065241883679) * t2;
+    t5 = (-0.03630288981548097) * t3;
+    t9 = t11 + t5;
+    t4 = x[104];
+    t1 = 0.0028522246127330657 * t4;
+    t14 = x[215];
+    t16 = 0.0785986013427278 * t14;
+    t15 = t1 - t16;
+    t19 = x[424];
+    t2 = 0.27144044986507426 * t15;
+    t3 = (-0.07653247163528379) * t19;
+    t11 = t2 + t3;
+    t5 = (-0.9624552364536473) * t15;
+    t4 = (-0.02158438932340721) * t19;
+    t14 = t5 + t4;
+    t1 = x[144];
+    t16 = 0.04999056553691067 * t1;
+    t2 = x[175];
+    t3 = 0.07956878319930895 * t2;
+    t15 = t16 - t3;
+    t19 = x[464];
+    t5 = 0.06584291214118858 * t19;
+    t4 = x[495];
+    t1 = 0.020223007836952297 * t4;
+    t2 = t5 + t1;
+    t16 = C0 * t15;
+    t3 = (-C1) * t2;
+    t19 = t16 + t3;
+    t4 = (-C1) * t15;
+    t5 = (-C0) * t2;
+    t1 = t4 + t5;
+    t16 = x[455];
+    t3 = 0.07287202356764515 * t16;
+    t15 = x[504];
+    t2 = 0.008937659462298152 * t15;
+    t4 = t3 + t2;
+    t5 = x[135];
+    t16 = 0.03719820422294464 * t5;
+    t15 = x[184];
+    t3 = 0.08120448463398589 * t15;
+    t2 = t16 - t3;
+    t5 = (-C2) * t4;
+    t15 = C3 * t2;
+    t16 = t5 + t15;
+    t3 = C3 * t4;
+    t5 = C2 * t2;
+    t15 = t3 + t5;
+    t4 = t8 + t10;
+    t2 = t0 + t9;
+    t3 = t6 + t19;
+    t5 = t17 + t1;
+    t8 = t8 - t10;
+    t10 = t0 - t9;
+    t0 = t6 - t19;
+    t9 = t17 - t1;
+    t6 = t4 + t3;
+    t19 = t2 + t5;
+    t17 = t8 + t9;
+    t1 = t10 - t0;
+    t4 = t4 - t3;
+    t3 = t2 - t5;
+    t2 = t8 - t9;
+    t5 = t10 + t0;
+    t8 = t12 + t11;
+    t9 = t13 + t14;
+    t10 = t7 + t16;
+    t0 = t18 + t15;
+    t12 = t12 - t11;
+    t11 = t13 - t14;
+    t13 = t7 - t16;
+    t14 = t18 - t15;
+    t7 = t8 + t10;
+    t16 = t9 + t0;
+    t18 = t12 + t14;
+    t15 = t11 - t13;
+    t8 = t8 - t10;
+    t10 = t9 - t0;
+    t9 = t12 - t14;
+    t0 = t11 + t13;
+    t12 = t18 + t15;
+    t14 = t18 - t15;
+    t11 = C4 * t12;
+    t13 = (-C4) * t14;
+    t18 = t9 - t0;
+    t15 = t9 + t0;
+    t12 = (-C4) * t18;
+    t14 = (-C4) * t15;
+    t9 = t6 - t7;
+    t0 = t19 - t16;
+    t18 = t6 + t7;
+    t15 = t19 + t16;
+    t6 = t17 - t11;
+    t7 = t1 - t13;
+    t19 = t17 + t11;
+    t16 = t1 + t13;
+    t17 = t4 - t10;
+    t11 = t3 + t8;
+    t1 = t4 + t10;
+    t13 = t3 - t8;
+    t4 = t2 - t12;
+    t10 = t5 - t14;
+    t3 = t2 + t12;
+    t8 = t5 + t14;
+    re[32] = t18;
+    im[32] = t15;
+    re[52] = t19;
+    im[52] = t16;
+    re[72] = t1;
+    im[72] = t13;
+    re[92] = t3;
+    im[92] = t8;
+    re[112] = t9;
+    im[112] = t0;
+    re[132] = t6;
+    im[132] = t7;
+    re[152] = t17;
+    im[152] = t11;
+    re[12] = t4;
+    im[12] = t10;
+    t2 = x[405];
+    t12 = x[85];
+    t5 = (-0.006326642346165435) * t12;
+    t14 = x[234];
+    t18 = 0.07807511355243113 * t14;
+    t15 = t5 - t18;
+    t19 = (-0.0748276354731592) * t2;
+    t16 = 0.3553109012804161 * t15;
+    t1 = t19 + t16;
+    t13 = 0.02844303430325849 * t2;
+    t3 = 0.9347481818282924 * t15;
+    t8 = t13 + t3;
+    t9 = x[365];
+    t0 = x[45];
+    t6 = (-0.006149464704131592) * t0;
+    t7 = x[274];
+    t17 = 0.07826498459625951 * t7;
+    t11 = t6 - t17;
+    t4 = (-0.06767630057090829) * t9;
+    t10 = 0.5308440257395095 * t11;
+    t12 = t4 + t10;
+    t14 = 0.042391564733413364 * t9;
+    t5 = 0.8474695394742344 * t11;
+    t18 = t14 + t5;
+    t19 = x[325];
+    t16 = x[5];
+    t2 = (-0.00014811107628344213) * t16;
+    t15 = x[314];
+    t13 = 0.07885922470484415 * t15;
+    t3 = t2 - t13;
+    t0 = (-0.0576678822854854) * t19;
+    t7 = 0.6859771119901928 * t3;
+    t6 = t0 + t7;
+    t17 = 0.05436722166601955 * t19;
+    t4 = 0.7276231179845748 * t3;
+    t10 = t17 + t4;
+    t9 = x[34];
+    t11 = (-0.0038442216590680264) * t9;
+    t14 = x[285];
+    t5 = 0.07828996020362315 * t14;
+    t16 = t11 - t5;
+    t15 = x[354];
+    t2 = 0.5798145481265136 * t16;
+    t13 = (-0.06504254188599205) * t15;
+    t0 = t2 + t13;
+    t7 = (-0.8147484825274894) * t16;
+    t19 = (-0.04628742837990361) * t15;
+    t3 = t7 + t19;
+    t17 = x[74];
+    t4 = (-0.008396876155933708) * t17;
+    t9 = x[245];
+    t14 = 0.0780810925418322 * t9;
+    t11 = t4 - t14;
+    t5 = x[394];
+    t2 = 0.4097240303476953 * t11;
+    t13 = (-0.07301779919613292) * t5;
+    t16 = t2 + t13;
+    t15 = (-0.9122095257974677) * t11;
+    t7 = (-0.032796354486217684) * t5;
+    t19 = t15 + t7;
+    t17 = x[114];
+    t9 = 0.011294046579022204 * t17;
+    t4 = x[205];
+    t14 = 0.07938648382440648 * t4;
+    t2 = t9 - t14;
+    t13 = x[434];
+    t11 = 0.22388804785849836 * t2;
+    t5 = (-0.07673022704971559) * t13;
+    t15 = t11 + t5;
+    t7 = (-0.974614868564045) * t2;
+    t17 = (-0.0176264299878894) * t13;
+    t4 = t7 + t17;
+    t9 = x[154];
+    t14 = 0.06312367791411176 * t9;
+    t11 = x[165];
+    t5 = 0.0740395135648426 * t11;
+    t2 = t14 - t5;
+    t13 = x[474];
+    t7 = 0.05357035306535798 * t13;
+    t17 = x[485];
+    t9 = 0.036177820954147843 * t17;
+    t11 = t7 + t9;
+    t14 = C5 * t2;
+    t5 = (-C6) * t11;
+    t13 = t14 + t5;
+    t17 = (-C6) * t2;
+    t7 = (-C5) * t11;
+    t9 = t17 + t7;
+    t14 = x[445];
+    t5 = 0.07688646039082105 * t14;
+    t2 = x[514];
+    t11 = 0.0019240266974218081 * t2;
+    t17 = t5 + t11;
+    t7 = x[125];
+    t14 = 0.02369830053931917 * t7;
+    t2 = x[194];
+    t5 = 0.08069566222116688 * t2;
+    t11 = t14 - t5;
+    t7 = (-C7) * t17;
+    t2 = C8 * t11;
+    t14 = t7 + t2;
+    t5 = C8 * t17;
+    t7 = C7 * t11;
+    t2 = t5 + t7;
+    t17 = t1 + t16;
+    t11 = t8 + t19;
+    t5 = t6 + t13;
+    t7 = t10 + t9;
+    t1 = t1 - t16;
+    t16 = t8 - t19;
+    t8 = t6 - t13;
+    t19 = t10 - t9;
+    t6 = t17 + t5;
+    t13 = t11 + t7;
+    t10 = t1 + t19;
+    t9 = t16 - t8;
+    t17 = t17 - t5;
+    t5 = t11 - t7;
+    t11 = t1 - t19;
+    t7 = t16 + t8;
+    t1 = t12 + t15;
+    t19 = t18 + t4;
+    t16 = t0 + t14;
+    t8 = t3 + t2;
+    t12 = t12 - t15;
+    t15 = t18 - t4;
+    t18 = t0 - t14;
+    t4 = t3 - t2;
+    t0 = t1 + t16;
+    t14 = t19 + t8;
+    t3 = t12 + t4;
+    t2 = t15 - t18;
+    t1 = t1 - t16;
+    t16 = t19 - t8;
+    t19 = t12 - t4;
+    t8 = t15 + t18;
+    t12 = t3 + t2;
+    t4 = t3 - t2;
+    t15 = C4 * t12;
+    t18 = (-C4) * t4;
+    t3 = t19 - t8;
+    t2 = t19 + t8;
+    t12 = (-C4) * t3;
+    t4 = (-C4) * t2;
+    t19 = t6 - t0;
+    t8 = t13 - t14;
+    t3 = t6 + t0;
+    t2 = t13 + t14;
+    t6 = t10 - t15;
+    t0 = t9 - t18;
+    t13 = t10 + t15;
+    t14 = t9 + t18;
+    t10 = t17 - t16;
+    t15 = t5 + t1;
+    t9 = t17 + t16;
+    t18 = t5 - t1;
+    t17 = t11 - t12;
+    t16 = t7 - t4;
+    t5 = t11 + t12;
+    t1 = t7 + t4;
+    t11 = t13 + t14;
+    t12 = C9 * t11;
+    t7 = t13 * (-C10);
+    t4 = t14 * C11;
+    t11 = t12 - t4;
+    t13 = t12 + t7;
+    t14 = t9 + t18;
+    t4 = C12 * t14;
+    t12 = t9 * (-C13);
+    t7 = t18 * C14;
+    t14 = t4 - t7;
+    t9 = t4 + t12;
+    t18 = t5 + t1;
+    t7 = C15 * t18;
+    t4 = t5 * (-C16);
+    t12 = t1 * C17;
+    t18 = t7 - t12;
+    t5 = t7 + t4;
+    t1 = t19 + t8;
+    t12 = t19 - t8;
+    t7 = C4 * t1;
+    t4 = (-C4) * t12;
+    t19 = t6 + t0;
+    t8 = C18 * t19;
+    t1 = t6 * (-C16);
+    t12 = t0 * (-C17);
+    t19 = t8 - t12;
+    t6 = t8 + t1;
+    t0 = t10 + t15;
+    t12 = C19 * t0;
+    t8 = t10 * (-C13);
+    t1 = t15 * (-C14);
+    t0 = t12 - t1;
+    t10 = t12 + t8;
+    t15 = t17 + t16;
+    t1 = C20 * t15;
+    t12 = t17 * (-C10);
+    t8 = t16 * (-C11);
+    t15 = t1 - t8;
+    t17 = t1 + t12;
+    re[37] = t3;
+    im[37] = t2;
+    re[57] = t11;
+    im[57] = t13;
+    re[77] = t14;
+    im[77] = t9;
+    re[97] = t18;
+    im[97] = t5;
+    re[117] = t7;
+    im[117] = t4;
+    re[137] = t19;
+    im[137] = t6;
+    re[157] = t0;
+    im[157] = t10;
+    re[17] = t15;
+    im[17] = t17;
+    t16 = x[395];
+    t8 = x[75];
+    t1 = (-0.00828995947322154) * t8;
+    t12 = x[244];
+    t3 = 0.07807549860039238 * t12;
+    t2 = t1 - t3;
+    t11 = (-0.07334150706215693) * t16;
+    t13 = 0.40074883310314097 * t2;
+    t14 = t11 + t13;
+    t9 = 0.03208023325876069 * t16;
+    t18 = 0.916187957117136 * t2;
+    t5 = t9 + t18;
+    t7 = x[355];
+    t4 = x[35];
+    t19 = (-0.004052833713203016) * t4;
+    t6 = x[284];
+    t0 = 0.0782861255568716 * t6;
+    t10 = t19 - t0;
+    t15 = (-0.06549703393239888) * t7;
+    t17 = 0.5717879602276122 * t10;
+    t8 = t15 + t17;
+    t12 = 0.045648890221632564 * t7;
+    t1 = 0.8204014435255136 * t10;
+    t3 = t12 + t1;
+    t11 = x[4];
+    t13 = (-0.00011625267447388165) * t11;
+    t16 = x[315];
+    t2 = 0.07889438011781426 * t16;
+    t9 = t13 - t2;
+    t18 = x[324];
+    t4 = 0.6930873625456359 * t9;
+    t6 = (-0.05710590504248025) * t18;
+    t19 = t4 + t6;
+    t0 = (-0.7208535967029188) * t9;
+    t15 = (-0.0549062684749089) * t18;
+    t17 = t0 + t15;
+    t7 = x[44];
+    t10 = (-0.005947283706403402) * t7;
+    t12 = x[275];
+    t1 = 0.07826688688369167 * t12;
+    t11 = t10 - t1;
+    t16 = x[364];
+    t13 = 0.5391383229110002 * t11;
+    t2 = (-0.06725523296396259) * t16;
+    t4 = t13 + t2;
+    t6 = (-0.8422172337162865) * t11;
+    t9 = (-0.04305287526257636) * t16;
+    t18 = t6 + t9;
+    t0 = x[84];
+    t15 = (-0.00660063310082577) * t0;
+    t7 = x[235];
+    t12 = 0.0780692991183351 * t7;
+    t10 = t15 - t12;
+    t1 = x[404];
+    t13 = 0.36447049987914965 * t10;
+    t2 = (-0.07455034703745199) * t1;
+    t11 = t13 + t2;
+    t16 = (-0.9312149347588036) * t10;
+    t6 = (-0.029178443382613856) * t1;
+    t9 = t16 + t6;
+    t0 = x[124];
+    t7 = 0.02244712275156356 * t0;
+    t15 = x[195];
+    t12 = 0.08058079051105971 * t15;
+    t13 = t7 - t12;
+    t2 = x[444];
+    t10 = 0.07713298043845977 * t2;
+    t1 = x[515];
+    t16 = 0.0015397724767375375 * t1;
+    t6 = t10 + t16;
+    t0 = C21 * t13;
+    t15 = (-C22) * t6;
+    t7 = t0 + t15;
+    t12 = (-C22) * t13;
+    t2 = (-C21) * t6;
+    t1 = t12 + t2;
+    t10 = x[475];
+    t16 = 0.05211398249574624 * t10;
+    t0 = x[484];
+    t15 = 0.03783486692384754 * t0;
+    t13 = t16 + t15;
+    t6 = x[155];
+    t12 = 0.06429934544866318 * t6;
+    t2 = x[164];
+    t10 = 0.07324795839525254 * t2;
+    t0 = t12 - t10;
+    t16 = (-C23) * t13;
+    t15 = C24 * t0;
+    t6 = t16 + t15;
+    t2 = C24 * t13;
+    t12 = C23 * t0;
+    t10 = t2 + t12;
+    t16 = x[435];
+    t15 = x[115];
+    t13 = 0.012290071369447096 * t15;
+    t0 = x[204];
+    t2 = 0.07949560986070783 * t0;
+    t12 = t13 - t2;
+    t15 = (-0.07679401125360577) * t16;
+    t0 = 0.21430915306505077 * t12;
+    t13 = t15 + t0;
+    t2 = 0.016849134298152053 * t16;
+    t15 = 0.9767658813208724 * t12;
+    t0 = t2 + t15;
+    t16 = t14 + t11;
+    t12 = t5 + t9;
+    t2 = t19 + t6;
+    t15 = t17 + t10;
+    t14 = t14 - t11;
+    t11 = t5 - t9;
+    t5 = t19 - t6;
+    t9 = t17 - t10;
+    t19 = t16 + t2;
+    t6 = t12 + t15;
+    t17 = t14 + t9;
+    t10 = t11 - t5;
+    t16 = t16 - t2;
+    t2 = t12 - t15;
+    t12 = t14 - t9;
+    t15 = t11 + t5;
+    t14 = t8 + t7;
+    t9 = t3 + t1;
+    t11 = t4 + t13;
+    t5 = t18 + t0;
+    t8 = t8 - t7;
+    t7 = t3 - t1;
+    t3 = t4 - t13;
+    t1 = t18 - t0;
+    t4 = t14 + t11;
+    t13 = t9 + t5;
+    t18 = t8 + t1;
+    t0 = t7 - t3;
+    t14 = t14 - t11;
+    t11 = t9 - t5;
+    t9 = t8 - t1;
+    t5 = t7 + t3;
+    t8 = t18 + t0;
+    t1 = t18 - t0;
+    t7 = C4 * t8;
+    t3 = (-C4) * t1;
+    t18 = t9 - t5;
+    t0 = t9 + t5;
+    t8 = (-C4) * t18;
+    t1 = (-C4) * t0;
+    t9 = t19 - t4;
+    t5 = t6 - t13;
+    t18 = t19 + t4;
+    t0 = t6 + t13;
+    t19 = t17 - t7;
+    t4 = t10 - t3;
+    t6 = t17 + t7;
+    t13 = t10 + t3;
+    t17 = t16 - t11;
+    t7 = t2 + t14;
+    t10 = t16 + t11;
+    t3 = t2 - t14;
+    t16 = t12 - t8;
+    t11 = t15 - t1;
+    t2 = t12 + t8;
+    t14 = t15 + t1;
+    t12 = t6 + t13;
+    t8 = C12 * t12;
+    t15 = t6 * (-C13);
+    t1 = t13 * C14;
+    t12 = t8 - t1;
+    t6 = t8 + t15;
+    t13 = t10 + t3;
+    t1 = t10 - t3;
+    t8 = C4 * t13;
+    t15 = (-C4) * t1;
+    t10 = t2 + t14;
+    t3 = C19 * t10;
+    t13 = t2 * (-C13);
+    t1 = t14 * (-C14);
+    t10 = t3 - t1;
+    t2 = t3 + t13;
+    t14 = -t9;
+    t1 = t19 + t4;
+    t3 = (-C19) * t1;
+    t13 = t19 * (-C14);
+    t9 = t4 * (-C13);
+    t1 = t3 - t9;
+    t19 = t3 + t13;
+    t4 = t17 - t7;
+    t9 = t17 + t7;
+    t3 = (-C4) * t4;
+    t13 = (-C4) * t9;
+    t17 = t16 + t11;
+    t7 = (-C12) * t17;
+    t4 = t16 * C14;
+    t9 = t11 * (-C13);
+    t17 = t7 - t9;
+    t16 = t7 + t4;
+    re[42] = t18;
+    im[42] = t0;
+    re[62] = t12;
+    im[62] = t6;
+    re[82] = t8;
+    im[82] = t15;
+    re[102] = t10;
+    im[102] = t2;
+    re[122] = t5;
+    im[122] = t14;
+    re[142] = t1;
+    im[142] = t19;
+    re[2] = t3;
+    im[2] = t13;
+    re[22] = t17;
+    im[22] = t16;
+    t11 = x[385];
+    t9 = x[65];
+    t7 = (-0.008710563872349865) * t9;
+    t4 = x[254];
+    t18 = 0.07815155601597573 * t4;
+    t0 = t7 - t18;
+    t12 = (-0.0716093032096552) * t11;
+    t6 = 0.4452213258854682 * t0;
+    t8 = t12 + t6;
+    t15 = 0.03560560312088158 * t11;
+    t10 = 0.895420555368697 * t0;
+    t2 = t15 + t10;
+    t5 = x[345];
+    t14 = x[25];
+    t1 = (-0.0021295937563124336) * t14;
+    t19 = x[294];
+    t3 = 0.07836190935367703 * t19;
+    t13 = t1 - t3;
+    t17 = (-0.063117155321995) * t5;
+    t16 = 0.6113544074368165 * t13;
+    t9 = t17 + t16;
+    t4 = 0.04876048934992941 * t5;
+    t7 = 0.7913569286406602 * t13;
+    t18 = t4 + t7;
+    t12 = x[14];
+    t6 = (-0.0006954450000195269) * t12;
+    t11 = x[305];
+    t0 = 0.07857828108834697 * t11;
+    t15 = t6 - t0;
+    t10 = x[334];
+    t14 = 0.6568818989430413 * t15;
+    t19 = (-0.05997152389937599) * t10;
+    t1 = t14 + t19;
+    t3 = (-0.7539934819618695) * t15;
+    t17 = (-0.05224741253601752) * t10;
+    t16 = t3 + t17;
+    t5 = x[54];
+    t13 = (-0.007732435532826085) * t5;
+    t4 = x[265];
+    t7 = 0.07823325366134647 * t4;
+    t12 = t13 - t7;
+    t11 = x[374];
+    t6 = 0.4971632662526543 * t12;
+    t0 = (-0.06931651257720191) * t11;
+    t14 = t6 + t0;
+    t19 = (-0.8676570098195441) * t12;
+    t15 = (-0.03971802614179565) * t11;
+    t10 = t19 + t15;
+    t3 = x[94];
+    t17 = (-0.002982392523410217) * t3;
+    t5 = x[225];
+    t4 = 0.0782101638719023 * t5;
+    t13 = t17 - t4;
+    t7 = x[414];
+    t6 = 0.3183389280525497 * t13;
+    t0 = (-0.07575557626133547) * t7;
+    t12 = t6 + t0;
+    t11 = (-0.9479769653775104) * t13;
+    t19 = (-0.0254393828350387) * t7;
+    t15 = t11 + t19;
+    t3 = x[134];
+    t5 = 0.035788100254620786 * t3;
+    t17 = x[185];
+    t4 = 0.08123517600333653 * t17;
+    t6 = t5 - t4;
+    t0 = x[454];
+    t13 = 0.07342959009395307 * t0;
+    t7 = x[505];
+    t11 = 0.007961705785935923 * t7;
+    t19 = t13 + t11;
+    t3 = C25 * t6;
+    t17 = (-C26) * t19;
+    t5 = t3 + t17;
+    t4 = (-C26) * t6;
+    t0 = (-C25) * t19;
+    t7 = t4 + t0;
+    t13 = x[465];
+    t11 = 0.06482348851887695 * t13;
+    t3 = x[494];
+    t17 = 0.021708977932100717 * t3;
+    t6 = t11 + t17;
+    t19 = x[145];
+    t4 = 0.05138642947995969 * t19;
+    t0 = x[174];
+    t13 = 0.07920667729745716 * t0;
+    t3 = t4 - t13;
+    t11 = (-C27) * t6;
+    t17 = C28 * t3;
+    t19 = t11 + t17;
+    t0 = C28 * t6;
+    t4 = C27 * t3;
+    t13 = t0 + t4;
+    t11 = x[425];
+    t17 = x[105];
+    t6 = 0.0035739293363973644 * t17;
+    t3 = x[214];
+    t0 = 0.07865614188746739 * t3;
+    t4 = t6 - t0;
+    t17 = (-0.07668454499810937) * t11;
+    t3 = 0.26197863846333747 * t4;
+    t6 = t17 + t3;
+    t0 = 0.02081676587619087 * t11;
+    t17 = 0.9650736723115474 * t4;
+    t3 = t0 + t17;
+    t11 = t8 + t12;
+    t4 = t2 + t15;
+    t0 = t1 + t19;
+    t17 = t16 + t13;
+    t8 = t8 - t12;
+    t12 = t2 - t15;
+    t2 = t1 - t19;
+    t15 = t16 - t13;
+    t1 = t11 + t0;
+    t19 = t4 + t17;
+    t16 = t8 + t15;
+    t13 = t12 - t2;
+    t11 = t11 - t0;
+    t0 = t4 - t17;
+    t4 = t8 - t15;
+    t17 = t12 + t2;
+    t8 = t9 + t5;
+    t15 = t18 + t7;
+    t12 = t14 + t6;
+    t2 = t10 + t3;
+    t9 = t9 - t5;
+    t5 = t18 - t7;
+    t18 = t14 - t6;
+    t7 = t10 - t3;
+    t14 = t8 + t12;
+    t6 = t15 + t2;
+    t10 = t9 + t7;
+    t3 = t5 - t18;
+    t8 = t8 - t12;
+    t12 = t15 - t2;
+    t15 = t9 - t7;
+    t2 = t5 + t18;
+    t9 = t10 + t3;
+    t7 = t10 - t3;
+    t5 = C4 * t9;
+    t18 = (-C4) * t7;
+    t10 = t15 - t2;
+    t3 = t15 + t2;
+    t9 = (-C4) * t10;
+    t7 = (-C4) * t3;
+    t15 = t1 - t14;
+    t2 = t19 - t6;
+    t10 = t1 + t14;
+    t3 = t19 + t6;
+    t1 = t16 - t5;
+    t14 = t13 - t18;
+    t19 = t16 + t5;
+    t6 = t13 + t18;
+    t16 = t11 - t12;
+    t5 = t0 + t8;
+    t13 = t11 + t12;
+    t18 = t0 - t8;
+    t11 = t4 - t9;
+    t12 = t17 - t7;
+    t0 = t4 + t9;
+    t8 = t17 + t7;
+    t4 = t19 + t6;
+    t9 = C15 * t4;
+    t17 = t19 * (-C16);
+    t7 = t6 * C17;
+    t4 = t9 - t7;
+    t19 = t9 + t17;
+    t6 = t13 + t18;
+    t7 = C19 * t6;
+    t9 = t13 * (-C13);
+    t17 = t18 * (-C14);
+    t6 = t7 - t17;
+    t13 = t7 + t9;
+    t18 = t0 + t8;
+    t17 = (-C20) * t18;
+    t7 = t0 * (-C11);
+    t9 = t8 * (-C10);
+    t18 = t17 - t9;
+    t0 = t17 + t7;
+    t8 = t15 - t2;
+    t9 = t15 + t2;
+    t17 = (-C4) * t8;
+    t7 = (-C4) * t9;
+    t15 = t1 + t14;
+    t2 = (-C9) * t15;
+    t8 = t1 * C11;
+    t9 = t14 * (-C10);
+    t15 = t2 - t9;
+    t1 = t2 + t8;
+    t14 = t16 + t5;
+    t9 = (-C12) * t14;
+    t2 = t16 * C13;
+    t8 = t5 * (-C14);
+    t14 = t9 - t8;
+    t16 = t9 + t2;
+    t5 = t11 + t12;
+    t8 = (-C18) * t5;
+    t9 = t11 * C16;
+    t2 = t12 * C17;
+    t5 = t8 - t2;
+    t11 = t8 + t9;
+    re[47] = t10;
+    im[47] = t3;
+    re[67] = t4;
+    im[67] = t19;
+    re[87] = t6;
+    im[87] = t13;
+    re[107] = t18;
+    im[107] = t0;
+    re[127] = t17;
+    im[127] = t7;
+    re[147] = t15;
+    im[147] = t1;
+    re[7] = t14;
+    im[7] = t16;
+    re[27] = t5;
+    im[27] = t11;
+    t12 = re[32];
+    t2 = im[32];
+    t8 = re[37];
+    t9 = im[37];
+    t10 = re[42];
+    t3 = im[42];
+    t4 = re[47];
+    t19 = im[47];
+    t6 = t12 + t10;
+    t13 = t2 + t3;
+    t18 = t8 + t4;
+    t0 = t9 + t19;
+    t17 = t12 - t10;
+    t7 = t2 - t3;
+    t15 = t8 - t4;
+    t1 = t9 - t19;
+    t14 = t6 + t18;
+    t16 = t13 + t0;
+    t5 = t17 + t1;
+    t11 = t7 - t15;
+    t12 = t6 - t18;
+    t10 = t13 - t0;
+    t2 = t17 - t1;
+    t3 = t7 + t15;
+    re[32] = t14;
+    im[32] = t16;
+    re[37] = t5;
+    im[37] = t11;
+    re[42] = t12;
+    im[42] = t10;
+    re[47] = t2;
+    im[47] = t3;
+    t8 = re[52];
+    t4 = im[52];
+    t9 = re[57];
+    t19 = im[57];
+    t6 = re[62];
+    t18 = im[62];
+    t13 = re[67];
+    t0 = im[67];
+    t17 = t8 + t6;
+    t1 = t4 + t18;
+    t7 = t9 + t13;
+    t15 = t19 + t0;
+    t14 = t8 - t6;
+    t16 = t4 - t18;
+    t5 = t9 - t13;
+    t11 = t19 - t0;
+    t12 = t17 + t7;
+    t10 = t1 + t15;
+    t2 = t14 + t11;
+    t3 = t16 - t5;
+    t8 = t17 - t7;
+    t6 = t1 - t15;
+    t4 = t14 - t11;
+    t18 = t16 + t5;
+    re[52] = t12;
+    im[52] = t10;
+    re[57] = t2;
+    im[57] = t3;
+    re[62] = t8;
+    im[62] = t6;
+    re[67] = t4;
+    im[67] = t18;
+    t9 = re[72];
+    t13 = im[72];
+    t19 = re[77];
+    t0 = im[77];
+    t17 = re[82];
+    t7 = im[82];
+    t1 = re[87];
+    t15 = im[87];
+    t14 = t9 + t17;
+    t11 = t13 + t7;
+    t16 = t19 + t1;
+    t5 = t0 + t15;
+    t12 = t9 - t17;
+    t10 = t13 - t7;
+    t2 = t19 - t1;
+    t3 = t0 - t15;
+    t8 = t14 + t16;
+    t6 = t11 + t5;
+    t4 = t12 + t3;
+    t18 = t10 - t2;
+    t9 = t14 - t16;
+    t17 = t11 - t5;
+    t13 = t12 - t3;
+    t7 = t10 + t2;
+    re[72] = t8;
+    im[72] = t6;
+    re[77] = t4;
+    im[77] = t18;
+    re[82] = t9;
+    im[82] = t17;
+    re[87] = t13;
+    im[87] = t7;
+    t19 = re[92];
+    t1 = im[92];
+    t0 = re[97];
+    t15 = im[97];
+    t14 = re[102];
+    t16 = im[102];
+    t11 = re[107];
+    t5 = im[107];
+    t12 = t19 + t14;
+    t3 = t1 + t16;
+    t10 = t0 + t11;
+    t2 = t15 + t5;
+    t8 = t19 - t14;
+    t6 = t1 - t16;
+    t4 = t0 - t11;
+    t18 = t15 - t5;
+    t9 = t12 + t10;
+    t17 = t3 + t2;
+    t13 = t8 + t18;
+    t7 = t6 - t4;
+    t19 = t12 - t10;
+    t14 = t3 - t2;
+    t1 = t8 - t18;
+    t16 = t6 + t4;
+    re[92] = t9;
+    im[92] = t17;
+    re[97] = t13;
+    im[97] = t7;
+    re[102] = t19;
+    im[102] = t14;
+    re[107] = t1;
+    im[107] = t16;
+    t0 = re[112];
+    t11 = im[112];
+    t15 = re[117];
+    t5 = im[117];
+    t12 = re[122];
+    t10 = im[122];
+    t3 = re[127];
+    t2 = im[127];
+    t8 = t0 + t12;
+    t18 = t11 + t10;
+    t6 = t15 + t3;
+    t4 = t5 + t2;
+    t9 = t0 - t12;
+    t17 = t11 - t10;
+    t13 = t15 - t3;
+    t7 = t5 - t2;
+    t19 = t8 + t6;
+    t14 = t18 + t4;
+    t1 = t9 + t7;
+    t16 = t17 - t13;
+    t0 = t8 - t6;
+    t12 = t18 - t4;
+    t11 = t9 - t7;
+    t10 = t17 + t13;
+    re[112] = t19;
+    im[112] = t14;
+    re[117] = t1;
+    im[117] = t16;
+    re[122] = t0;
+    im[122] = t12;
+    re[127] = t11;
+    im[127] = t10;
+    t15 = re[132];
+    t3 = im[132];
+    t5 = re[137];
+    t2 = im[137];
+    t8 = re[142];
+    t6 = im[142];
+    t18 = re[147];
+    t4 = im[147];
+    t9 = t15 + t8;
+    t7 = t3 + t6;
+    t17 = t5 + t18;
+    t13 = t2 + t4;
+    t19 = t15 - t8;
+    t14 = t3 - t6;
+    t1 = t5 - t18;
+    t16 = t2 - t4;
+    t0 = t9 + t17;
+    t12 = t7 + t13;
+    t11 = t19 + t16;
+    t10 = t14 - t1;
+    t15 = t9 - t17;
+    t8 = t7 - t13;
+    t3 = t19 - t16;
+    t6 = t14 + t1;
+    re[132] = t0;
+    im[132] = t12;
+    re[137] = t11;
+    im[137] = t10;
+    re[142] = t15;
+    im[142] = t8;
+    re[147] = t3;
+    im[147] = t6;
+    t5 = re[152];
+    t18 = im[152];
+    t2 = re[157];
+    t4 = im[157];
+    t9 = re[2];
+    t17 = im[2];
+    t7 = re[7];
+    t13 = im[7];
+    t19 = t5 + t9;
+    t16 = t18 + t17;
+    t14 = t2 + t7;
+    t1 = t4 + t13;
+    t0 = t5 - t9;
+    t12 = t18 - t17;
+    t11 = t2 - t7;
+    t10 = t4 - t13;
+    t15 = t19 + t14;
+    t8 = t16 + t1;
+    t3 = t0 + t10;
+    t6 = t12 - t11;
+    t5 = t19 - t14;
+    t9 = t16 - t1;
+    t18 = t0 - t10;
+    t17 = t12 + t11;
+    re[152] = t15;
+    im[152] = t8;
+    re[157] = t3;
+    im[157] = t6;
+    re[2] = t5;
+    im[2] = t9;
+    re[7] = t18;
+    im[7] = t17;
+    t2 = re[12];
+    t7 = im[12];
+    t4 = re[17];
+    t13 = im[17];
+    t19 = re[22];
+    t14 = im[22];
+    t16 = re[27];
+    t1 = im[27];
+    t0 = t2 + t19;
+    t10 = t7 + t14;
+    t12 = t4 + t16;
+    t11 = t13 + t1;
+    t15 = t2 - t19;
+    t8 = t7 - t14;
+    t3 = t4 - t16;
+    t6 = t13 - t1;
+    t5 = t0 + t12;
+    t9 = t10 + t11;
+    t18 = t15 + t6;
+    t17 = t8 - t3;
+    t2 = t0 - t12;
+    t19 = t10 - t11;
+    t7 = t15 - t6;
+    t14 = t8 + t3;
+    re[12] = t5;
+    im[12] = t9;
+    re[17] = t18;
+    im[17] = t17;
+    re[22] = t2;
+    im[22] = t19;
+    re[27] = t7;
+    im[27] = t14;
+}
+
+/**
+ *  Part 3 of ApplyWindowedMDCT_W10_320().
+ * 
+ *  @param {Number[]} x 
+ *    - The input block (640 points).
+ *  @param {Number[]} X 
+ *    - The array that would contain the output block (320 points).
+ *  @param {Number[]} re 
+ *    - The scratch buffer (real part, 160 points).
+ *  @param {Number[]} im 
+ *    - The scratch buffer (imaginary part, 160 points).
+ */
+function ApplyWindowedMDCT_W10_320_Part3(x, X, re, im) {
+    let t0, t1, t10, t11, t12, t13, t14, t15, t16, t17, t18, t19, t2, t3, t4, t5, t6, t7, t8, t9;
+    const C0 = 0.15643446504023087;
+    const C1 = 0.9876883405951378;
+    const C2 = 0.9992290362407229;
+    const C3 = 0.03925981575906861;
+    const C4 = 0.7071067811865476;
+    const C5 = 0.10778246304275935;
+    const C6 = 0.9941745021174282;
+    const C7 = 0.9960990332516871;
+    const C8 = 0.08824237052036951;
+    const C9 = 0.9807852804032304;
+    const C10 = 1.1758756024193586;
+    const C11 = 0.7856949583871022;
+    const C12 = 0.9238795325112867;
+    const C13 = 1.3065629648763766;
+    const C14 = 0.5411961001461969;
+    const C15 = 0.8314696123025452;
+    const C16 = 1.3870398453221475;
+    const C17 = 0.27589937928294306;
+    const C18 = 0.5555702330196022;
+    const C19 = 0.3826834323650898;
+    const C20 = 0.19509032201612825;
+    const C21 = 0.05887080365118903;
+    const C22 = 0.9982656101847159;
+    const C23 = 0.9905693404435773;
+    const C24 = 0.13701234168196802;
+    const C25 = 0.009817319337149617;
+    const C26 = 0.999951808959328;
+    const C27 = 0.9826532793307118;
+    const C28 = 0.18545223811159092;
+    t4 = x[351];
+    t16 = x[31];
+    t13 = (-0.003234809269272303) * t16;
+    t1 = x[288];
+    t0 = 0.07830557878019587 * t1;
+    t12 = t13 - t0;
+    t10 = (-0.06457210704024856) * t4;
+    t11 = 0.5877852522924731 * t12;
+    t15 = t10 + t11;
+    t6 = 0.04691438188765495 * t4;
+    t8 = 0.8090169943749475 * t12;
+    t3 = t6 + t8;
+    t5 = x[8];
+    t9 = (-0.00027482219768941077) * t5;
+    t18 = x[311];
+    t17 = 0.07875755500931148 * t18;
+    t2 = t9 - t17;
+    t19 = x[328];
+    t7 = 0.6788007455329417 * t2;
+    t14 = (-0.058273973632503175) * t19;
+    t16 = t7 + t14;
+    t1 = (-0.7343225094356856) * t2;
+    t13 = (-0.053867907137027) * t19;
+    t0 = t1 + t13;
+    t10 = x[48];
+    t11 = (-0.006731007187738434) * t10;
+    t4 = x[271];
+    t12 = 0.07825779208424921 * t4;
+    t6 = t11 - t12;
+    t8 = x[368];
+    t5 = 0.5224985647159488 * t6;
+    t18 = (-0.06809546864644596) * t8;
+    t9 = t5 + t18;
+    t17 = (-0.8526401643540922) * t6;
+    t7 = (-0.041728956855300106) * t8;
+    t14 = t17 + t7;
+    t2 = x[88];
+    t19 = (-0.005392139407981611) * t2;
+    t1 = x[231];
+    t13 = 0.07810254329626591 * t1;
+    t10 = t19 - t13;
+    t4 = x[408];
+    t11 = 0.34611705707749296 * t10;
+    t12 = (-0.07507688741034725) * t4;
+    t5 = t11 + t12;
+    t18 = (-0.9381913359224842) * t10;
+    t6 = (-0.027697326046458665) * t4;
+    t8 = t18 + t6;
+    t17 = x[128];
+    t7 = 0.027577153652004537 * t17;
+    t2 = x[191];
+    t1 = 0.08099677233079813 * t2;
+    t19 = t7 - t1;
+    t13 = x[448];
+    t11 = 0.07600568836960063 * t13;
+    t12 = x[511];
+    t10 = 0.0034008064960340165 * t12;
+    t4 = t11 + t10;
+    t18 = C0 * t19;
+    t6 = (-C1) * t4;
+    t17 = t18 + t6;
+    t2 = (-C1) * t19;
+    t7 = (-C0) * t4;
+    t1 = t2 + t7;
+    t13 = x[471];
+    t12 = 0.057713193736474815 * t13;
+    t11 = x[488];
+    t10 = 0.031218452451930608 * t11;
+    t18 = t12 + t10;
+    t6 = x[151];
+    t19 = 0.05941921293252666 * t6;
+    t4 = x[168];
+    t2 = 0.07615284897250663 * t4;
+    t7 = t19 - t2;
+    t13 = (-C2) * t18;
+    t11 = C3 * t7;
+    t12 = t13 + t11;
+    t10 = C3 * t18;
+    t6 = C2 * t7;
+    t4 = t10 + t6;
+    t19 = x[431];
+    t2 = x[111];
+    t13 = 0.00847214329494768 * t2;
+    t11 = x[208];
+    t18 = 0.07909560579994807 * t11;
+    t7 = t13 - t18;
+    t10 = (-0.07683501429720976) * t19;
+    t6 = 0.2334453638559054 * t7;
+    t2 = t10 + t6;
+    t11 = 0.018446454886377094 * t19;
+    t13 = 0.9723699203976766 * t7;
+    t18 = t11 + t13;
+    t10 = x[391];
+    t6 = x[71];
+    t19 = (-0.00862790402088222) * t6;
+    t7 = x[248];
+    t11 = 0.07810154602265036 * t7;
+    t13 = t19 - t11;
+    t6 = (-0.07267327121489607) * t10;
+    t7 = 0.41865973753742813 * t13;
+    t19 = t6 + t7;
+    t11 = 0.033502836920156154 * t10;
+    t6 = 0.9081431738250813 * t13;
+    t7 = t11 + t6;
+    t10 = t15 + t17;
+    t13 = t3 + t1;
+    t11 = t9 + t2;
+    t6 = t14 + t18;
+    t15 = t15 - t17;
+    t17 = t3 - t1;
+    t3 = t9 - t2;
+    t1 = t14 - t18;
+    t9 = t10 + t11;
+    t2 = t13 + t6;
+    t14 = t15 + t1;
+    t18 = t17 - t3;
+    t10 = t10 - t11;
+    t11 = t13 - t6;
+    t13 = t15 - t1;
+    t6 = t17 + t3;
+    t15 = t16 + t12;
+    t1 = t0 + t4;
+    t17 = t5 + t19;
+    t3 = t8 + t7;
+    t16 = t16 - t12;
+    t12 = t0 - t4;
+    t0 = t5 - t19;
+    t4 = t8 - t7;
+    t5 = t15 + t17;
+    t19 = t1 + t3;
+    t8 = t16 + t4;
+    t7 = t12 - t0;
+    t15 = t15 - t17;
+    t17 = t1 - t3;
+    t1 = t16 - t4;
+    t3 = t12 + t0;
+    t16 = t8 + t7;
+    t4 = t8 - t7;
+    t12 = C4 * t16;
+    t0 = (-C4) * t4;
+    t8 = t1 - t3;
+    t7 = t1 + t3;
+    t16 = (-C4) * t8;
+    t4 = (-C4) * t7;
+    t1 = t9 - t5;
+    t3 = t2 - t19;
+    t8 = t9 + t5;
+    t7 = t2 + t19;
+    t9 = t14 - t12;
+    t5 = t18 - t0;
+    t2 = t14 + t12;
+    t19 = t18 + t0;
+    t14 = t10 - t17;
+    t12 = t11 + t15;
+    t18 = t10 + t17;
+    t0 = t11 - t15;
+    t10 = t13 - t16;
+    t17 = t6 - t4;
+    t11 = t13 + t16;
+    t15 = t6 + t4;
+    re[64] = t8;
+    im[64] = t7;
+    re[84] = t2;
+    im[84] = t19;
+    re[104] = t18;
+    im[104] = t0;
+    re[124] = t11;
+    im[124] = t15;
+    re[144] = t1;
+    im[144] = t3;
+    re[4] = t9;
+    im[4] = t5;
+    re[24] = t14;
+    im[24] = t12;
+    re[44] = t10;
+    im[44] = t17;
+    t13 = x[341];
+    t16 = x[21];
+    t6 = (-0.0015092739897649792) * t16;
+    t4 = x[298];
+    t8 = 0.07842264533338364 * t4;
+    t7 = t6 - t8;
+    t2 = (-0.0620995089594373) * t13;
+    t19 = 0.6267738216194696 * t7;
+    t18 = t2 + t19;
+    t0 = 0.04995159712438468 * t13;
+    t11 = 0.7792012426405167 * t7;
+    t15 = t0 + t11;
+    t1 = x[18];
+    t3 = (-0.0011166310633579017) * t1;
+    t9 = x[301];
+    t5 = 0.07848165382580351 * t9;
+    t14 = t3 - t5;
+    t12 = x[338];
+    t10 = 0.641951602562703 * t14;
+    t17 = (-0.061060859636573143) * t12;
+    t16 = t10 + t17;
+    t4 = (-0.7667451597285615) * t14;
+    t6 = (-0.051122744239339026) * t12;
+    t8 = t4 + t6;
+    t2 = x[58];
+    t19 = (-0.008236636173384312) * t2;
+    t13 = x[261];
+    t7 = 0.07820811521896559 * t13;
+    t0 = t19 - t7;
+    t11 = x[378];
+    t1 = 0.4800321224090111 * t0;
+    t9 = (-0.07010548944383951) * t11;
+    t3 = t1 + t9;
+    t5 = (-0.8772509113449243) * t0;
+    t10 = (-0.0383617576853299) * t11;
+    t17 = t5 + t10;
+    t14 = x[98];
+    t12 = (-0.0009387706476628306) * t14;
+    t4 = x[221];
+    t6 = 0.0783292579213022 * t4;
+    t2 = t12 - t6;
+    t13 = x[418];
+    t19 = 0.2996652769962566 * t2;
+    t7 = (-0.07612452451713618) * t13;
+    t1 = t19 + t7;
+    t9 = (-0.9540444024062804) * t2;
+    t0 = (-0.0239107075814292) * t13;
+    t11 = t9 + t0;
+    t5 = x[138];
+    t10 = 0.04146541917181707 * t5;
+    t14 = x[181];
+    t4 = 0.08095243610523627 * t14;
+    t12 = t10 - t4;
+    t6 = x[458];
+    t19 = 0.0709448429254907 * t6;
+    t7 = x[501];
+    t2 = 0.012223248822784803 * t7;
+    t13 = t19 + t2;
+    t9 = C5 * t12;
+    t0 = (-C6) * t13;
+    t5 = t9 + t0;
+    t14 = (-C6) * t12;
+    t10 = (-C5) * t13;
+    t4 = t14 + t10;
+    t6 = x[461];
+    t7 = 0.06860932607733869 * t6;
+    t19 = x[498];
+    t2 = 0.016007887610726444 * t19;
+    t9 = t7 + t2;
+    t0 = x[141];
+    t12 = 0.045747664090940304 * t0;
+    t13 = x[178];
+    t14 = 0.08042166933048225 * t13;
+    t10 = t12 - t14;
+    t6 = (-C7) * t9;
+    t19 = C8 * t10;
+    t7 = t6 + t19;
+    t2 = C8 * t9;
+    t0 = C7 * t10;
+    t13 = t2 + t0;
+    t12 = x[421];
+    t14 = x[101];
+    t6 = 0.0008435186908425442 * t14;
+    t19 = x[218];
+    t9 = 0.07844874145962522 * t19;
+    t10 = t6 - t9;
+    t2 = (-0.07646267002661256) * t12;
+    t0 = 0.2808760992712921 * t10;
+    t14 = t2 + t0;
+    t19 = 0.02237735861382885 * t12;
+    t6 = 0.9597440371568574 * t10;
+    t9 = t19 + t6;
+    t2 = x[381];
+    t0 = x[61];
+    t12 = (-0.008508545900253557) * t0;
+    t10 = x[258];
+    t19 = 0.07818529382762993 * t10;
+    t6 = t12 - t19;
+    t0 = (-0.0708658377861931) * t2;
+    t10 = 0.4627159170443501 * t6;
+    t12 = t0 + t10;
+    t19 = 0.03698872690691601 * t2;
+    t0 = 0.8865066159447464 * t6;
+    t10 = t19 + t0;
+    t2 = t18 + t5;
+    t6 = t15 + t4;
+    t19 = t3 + t14;
+    t0 = t17 + t9;
+    t18 = t18 - t5;
+    t5 = t15 - t4;
+    t15 = t3 - t14;
+    t4 = t17 - t9;
+    t3 = t2 + t19;
+    t14 = t6 + t0;
+    t17 = t18 + t4;
+    t9 = t5 - t15;
+    t2 = t2 - t19;
+    t19 = t6 - t0;
+    t6 = t18 - t4;
+    t0 = t5 + t15;
+    t18 = t16 + t7;
+    t4 = t8 + t13;
+    t5 = t1 + t12;
+    t15 = t11 + t10;
+    t16 = t16 - t7;
+    t7 = t8 - t13;
+    t8 = t1 - t12;
+    t13 = t11 - t10;
+    t1 = t18 + t5;
+    t12 = t4 + t15;
+    t11 = t16 + t13;
+    t10 = t7 - t8;
+    t18 = t18 - t5;
+    t5 = t4 - t15;
+    t4 = t16 - t13;
+    t15 = t7 + t8;
+    t16 = t11 + t10;
+    t13 = t11 - t10;
+    t7 = C4 * t16;
+    t8 = (-C4) * t13;
+    t11 = t4 - t15;
+    t10 = t4 + t15;
+    t16 = (-C4) * t11;
+    t13 = (-C4) * t10;
+    t4 = t3 - t1;
+    t15 = t14 - t12;
+    t11 = t3 + t1;
+    t10 = t14 + t12;
+    t3 = t17 - t7;
+    t1 = t9 - t8;
+    t14 = t17 + t7;
+    t12 = t9 + t8;
+    t17 = t2 - t5;
+    t7 = t19 + t18;
+    t9 = t2 + t5;
+    t8 = t19 - t18;
+    t2 = t6 - t16;
+    t5 = t0 - t13;
+    t19 = t6 + t16;
+    t18 = t0 + t13;
+    t6 = t14 + t12;
+    t16 = C9 * t6;
+    t0 = t14 * (-C10);
+    t13 = t12 * C11;
+    t6 = t16 - t13;
+    t14 = t16 + t0;
+    t12 = t9 + t8;
+    t13 = C12 * t12;
+    t16 = t9 * (-C13);
+    t0 = t8 * C14;
+    t12 = t13 - t0;
+    t9 = t13 + t16;
+    t8 = t19 + t18;
+    t0 = C15 * t8;
+    t13 = t19 * (-C16);
+    t16 = t18 * C17;
+    t8 = t0 - t16;
+    t19 = t0 + t13;
+    t18 = t4 + t15;
+    t16 = t4 - t15;
+    t0 = C4 * t18;
+    t13 = (-C4) * t16;
+    t4 = t3 + t1;
+    t15 = C18 * t4;
+    t18 = t3 * (-C16);
+    t16 = t1 * (-C17);
+    t4 = t15 - t16;
+    t3 = t15 + t18;
+    t1 = t17 + t7;
+    t16 = C19 * t1;
+    t15 = t17 * (-C13);
+    t18 = t7 * (-C14);
+    t1 = t16 - t18;
+    t17 = t16 + t15;
+    t7 = t2 + t5;
+    t18 = C20 * t7;
+    t16 = t2 * (-C10);
+    t15 = t5 * (-C11);
+    t7 = t18 - t15;
+    t2 = t18 + t16;
+    re[69] = t11;
+    im[69] = t10;
+    re[89] = t6;
+    im[89] = t14;
+    re[109] = t12;
+    im[109] = t9;
+    re[129] = t8;
+    im[129] = t19;
+    re[149] = t0;
+    im[149] = t13;
+    re[9] = t4;
+    im[9] = t3;
+    re[29] = t1;
+    im[29] = t17;
+    re[49] = t7;
+    im[49] = t2;
+    t5 = x[331];
+    t15 = x[11];
+    t18 = (-0.000454986335991667) * t15;
+    t16 = x[308];
+    t11 = 0.07866326189821478 * t16;
+    t10 = t18 - t11;
+    t6 = (-0.05939147360729082) * t5;
+    t14 = 0.6642524379112817 * t10;
+    t12 = t6 + t14;
+    t9 = 0.0527765774869263 * t5;
+    t8 = 0.7475083268625968 * t10;
+    t19 = t9 + t8;
+    t0 = x[28];
+    t13 = (-0.002659444465245213) * t0;
+    t4 = x[291];
+    t3 = 0.07832900168871372 * t4;
+    t1 = t13 - t3;
+    t17 = x[348];
+    t7 = 0.6035559419535714 * t1;
+    t2 = (-0.06361952761613514) * t17;
+    t15 = t7 + t2;
+    t16 = (-0.7973206537727071) * t1;
+    t18 = (-0.048158722259744484) * t17;
+    t11 = t16 + t18;
+    t6 = x[68];
+    t14 = (-0.008730111522164116) * t6;
+    t5 = x[251];
+    t10 = 0.07812574017980194 * t5;
+    t9 = t14 - t10;
+    t8 = x[388];
+    t0 = 0.436409240673342 * t9;
+    t4 = (-0.07197918077171991) * t8;
+    t13 = t0 + t4;
+    t3 = (-0.8997482840522215) * t9;
+    t7 = (-0.03491240848318453) * t8;
+    t2 = t3 + t7;
+    t1 = x[108];
+    t17 = 0.005899910603536861 * t1;
+    t16 = x[211];
+    t18 = 0.07885432528275857 * t16;
+    t6 = t17 - t18;
+    t5 = x[428];
+    t14 = 0.25249157701515795 * t6;
+    t10 = (-0.07669197987004908) * t5;
+    t0 = t14 + t10;
+    t4 = (-0.9675990923602598) * t6;
+    t9 = (-0.020012502176463123) * t5;
+    t8 = t4 + t9;
+    t3 = x[148];
+    t7 = 0.05548876646666499 * t3;
+    t1 = x[171];
+    t16 = 0.07787288007785695 * t1;
+    t17 = t7 - t16;
+    t18 = x[468];
+    t14 = 0.061476294335568483 * t18;
+    t10 = x[491];
+    t6 = 0.02635963991835971 * t10;
+    t5 = t14 + t6;
+    t4 = C21 * t17;
+    t9 = (-C22) * t5;
+    t3 = t4 + t9;
+    t1 = (-C22) * t17;
+    t7 = (-C21) * t5;
+    t16 = t1 + t7;
+    t18 = x[451];
+    t10 = 0.0748712625620606 * t18;
+    t14 = x[508];
+    t6 = 0.005404191194233247 * t14;
+    t4 = t10 + t6;
+    t9 = x[131];
+    t17 = 0.03161970808366637 * t9;
+    t5 = x[188];
+    t1 = 0.08119431733865926 * t5;
+    t7 = t17 - t1;
+    t18 = (-C23) * t4;
+    t14 = C24 * t7;
+    t10 = t18 + t14;
+    t6 = C24 * t4;
+    t9 = C23 * t7;
+    t5 = t6 + t9;
+    t17 = x[411];
+    t1 = x[91];
+    t18 = (-0.00428118345726987) * t1;
+    t14 = x[228];
+    t4 = 0.07814674882599187 * t14;
+    t7 = t18 - t4;
+    t6 = (-0.07556344798894506) * t17;
+    t9 = 0.3276301795616935 * t7;
+    t1 = t6 + t9;
+    t14 = 0.026203119810142596 * t17;
+    t18 = 0.944806046466878 * t7;
+    t4 = t14 + t18;
+    t6 = x[371];
+    t9 = x[51];
+    t17 = (-0.007263407164054297) * t9;
+    t7 = x[268];
+    t14 = 0.07824745321283438 * t7;
+    t18 = t17 - t14;
+    t9 = (-0.06891074010670516) * t6;
+    t7 = 0.5056573733779846 * t18;
+    t17 = t9 + t7;
+    t14 = 0.040389283661618695 * t6;
+    t9 = 0.8627343859777918 * t18;
+    t7 = t14 + t9;
+    t6 = t12 + t3;
+    t18 = t19 + t16;
+    t14 = t13 + t1;
+    t9 = t2 + t4;
+    t12 = t12 - t3;
+    t3 = t19 - t16;
+    t19 = t13 - t1;
+    t16 = t2 - t4;
+    t13 = t6 + t14;
+    t1 = t18 + t9;
+    t2 = t12 + t16;
+    t4 = t3 - t19;
+    t6 = t6 - t14;
+    t14 = t18 - t9;
+    t18 = t12 - t16;
+    t9 = t3 + t19;
+    t12 = t15 + t10;
+    t16 = t11 + t5;
+    t3 = t0 + t17;
+    t19 = t8 + t7;
+    t15 = t15 - t10;
+    t10 = t11 - t5;
+    t11 = t0 - t17;
+    t5 = t8 - t7;
+    t0 = t12 + t3;
+    t17 = t16 + t19;
+    t8 = t15 + t5;
+    t7 = t10 - t11;
+    t12 = t12 - t3;
+    t3 = t16 - t19;
+    t16 = t15 - t5;
+    t19 = t10 + t11;
+    t15 = t8 + t7;
+    t5 = t8 - t7;
+    t10 = C4 * t15;
+    t11 = (-C4) * t5;
+    t8 = t16 - t19;
+    t7 = t16 + t19;
+    t15 = (-C4) * t8;
+    t5 = (-C4) * t7;
+    t16 = t13 - t0;
+    t19 = t1 - t17;
+    t8 = t13 + t0;
+    t7 = t1 + t17;
+    t13 = t2 - t10;
+    t0 = t4 - t11;
+    t1 = t2 + t10;
+    t17 = t4 + t11;
+    t2 = t6 - t3;
+    t10 = t14 + t12;
+    t4 = t6 + t3;
+    t11 = t14 - t12;
+    t6 = t18 - t15;
+    t3 = t9 - t5;
+    t14 = t18 + t15;
+    t12 = t9 + t5;
+    t18 = t1 + t17;
+    t15 = C12 * t18;
+    t9 = t1 * (-C13);
+    t5 = t17 * C14;
+    t18 = t15 - t5;
+    t1 = t15 + t9;
+    t17 = t4 + t11;
+    t5 = t4 - t11;
+    t15 = C4 * t17;
+    t9 = (-C4) * t5;
+    t4 = t14 + t12;
+    t11 = C19 * t4;
+    t17 = t14 * (-C13);
+    t5 = t12 * (-C14);
+    t4 = t11 - t5;
+    t14 = t11 + t17;
+    t12 = -t16;
+    t5 = t13 + t0;
+    t11 = (-C19) * t5;
+    t17 = t13 * (-C14);
+    t16 = t0 * (-C13);
+    t5 = t11 - t16;
+    t13 = t11 + t17;
+    t0 = t2 - t10;
+    t16 = t2 + t10;
+    t11 = (-C4) * t0;
+    t17 = (-C4) * t16;
+    t2 = t6 + t3;
+    t10 = (-C12) * t2;
+    t0 = t6 * C14;
+    t16 = t3 * (-C13);
+    t2 = t10 - t16;
+    t6 = t10 + t0;
+    re[74] = t8;
+    im[74] = t7;
+    re[94] = t18;
+    im[94] = t1;
+    re[114] = t15;
+    im[114] = t9;
+    re[134] = t4;
+    im[134] = t14;
+    re[154] = t19;
+    im[154] = t12;
+    re[14] = t5;
+    im[14] = t13;
+    re[34] = t11;
+    im[34] = t17;
+    re[54] = t2;
+    im[54] = t6;
+    t3 = x[321];
+    t16 = x[1];
+    t10 = (-4.6388537934607385e-05) * t16;
+    t0 = x[318];
+    t8 = 0.07900226121891851 * t0;
+    t7 = t10 - t8;
+    t18 = (-0.05648687985593735) * t3;
+    t1 = 0.7001308118985237 * t7;
+    t15 = t18 + t1;
+    t9 = 0.05538851049136689 * t3;
+    t4 = 0.7140145980512682 * t7;
+    t14 = t9 + t4;
+    t19 = x[38];
+    t12 = (-0.004687378358449063) * t19;
+    t5 = x[281];
+    t13 = 0.07827765730715747 * t5;
+    t11 = t12 - t13;
+    t17 = x[358];
+    t2 = 0.5637062622150166 * t11;
+    t6 = (-0.0659491610489016) * t17;
+    t16 = t2 + t6;
+    t0 = (-0.8259753325248732) * t11;
+    t10 = (-0.04500855365432233) * t17;
+    t8 = t0 + t10;
+    t18 = x[78];
+    t1 = (-0.00787565686562428) * t18;
+    t3 = x[241];
+    t7 = 0.07806353886683189 * t3;
+    t9 = t1 - t7;
+    t4 = x[398];
+    t19 = 0.3917350108519559 * t9;
+    t5 = (-0.07366419855626757) * t4;
+    t12 = t19 + t5;
+    t13 = (-0.9200780843345949) * t9;
+    t2 = (-0.03136347459216956) * t4;
+    t6 = t13 + t2;
+    t11 = x[118];
+    t17 = 0.015441985894296665 * t11;
+    t0 = x[201];
+    t10 = 0.07986245981048944 * t0;
+    t18 = t17 - t10;
+    t3 = x[438];
+    t1 = 0.2047096027093796 * t18;
+    t7 = (-0.0766022260076716) * t3;
+    t19 = t1 + t7;
+    t5 = (-0.9788227513490724) * t18;
+    t9 = (-0.01602048096151399) * t3;
+    t4 = t5 + t9;
+    t13 = x[158];
+    t2 = 0.06762500181343893 * t13;
+    t11 = x[161];
+    t0 = 0.07061837814965627 * t11;
+    t17 = t2 - t0;
+    t10 = x[478];
+    t1 = 0.04755313986979603 * t10;
+    t7 = x[481];
+    t18 = 0.04276339088979664 * t7;
+    t3 = t1 + t18;
+    t5 = C25 * t17;
+    t9 = (-C26) * t3;
+    t13 = t5 + t9;
+    t11 = (-C26) * t17;
+    t2 = (-C25) * t3;
+    t0 = t11 + t2;
+    t10 = x[441];
+    t7 = 0.07775778216969736 * t10;
+    t1 = x[518];
+    t18 = 0.000666694127532328 * t1;
+    t5 = t7 + t18;
+    t9 = x[121];
+    t17 = 0.01883263011236303 * t9;
+    t3 = x[198];
+    t11 = 0.08021633619237747 * t3;
+    t2 = t17 - t11;
+    t10 = (-C27) * t5;
+    t1 = C28 * t2;
+    t7 = t10 + t1;
+    t18 = C28 * t5;
+    t9 = C27 * t2;
+    t3 = t18 + t9;
+    t17 = x[401];
+    t11 = x[81];
+    t10 = (-0.007315378642888369) * t11;
+    t1 = x[238];
+    t5 = 0.0780607029671936 * t1;
+    t2 = t10 - t5;
+    t18 = (-0.07426847792780902) * t17;
+    t9 = 0.37359497005251635 * t2;
+    t11 = t18 + t9;
+    t1 = 0.029912215417910584 * t17;
+    t10 = 0.927591935255724 * t2;
+    t5 = t1 + t10;
+    t18 = x[361];
+    t9 = x[41];
+    t17 = (-0.005324123100425294) * t9;
+    t2 = x[278];
+    t1 = 0.0782719816664161 * t2;
+    t10 = t17 - t1;
+    t9 = (-0.06682497806774967) * t18;
+    t2 = 0.5473806568087966 * t10;
+    t17 = t9 + t2;
+    t1 = 0.04370822141229718 * t18;
+    t9 = 0.8368837533084093 * t10;
+    t2 = t1 + t9;
+    t18 = t15 + t13;
+    t10 = t14 + t0;
+    t1 = t12 + t11;
+    t9 = t6 + t5;
+    t15 = t15 - t13;
+    t13 = t14 - t0;
+    t14 = t12 - t11;
+    t0 = t6 - t5;
+    t12 = t18 + t1;
+    t11 = t10 + t9;
+    t6 = t15 + t0;
+    t5 = t13 - t14;
+    t18 = t18 - t1;
+    t1 = t10 - t9;
+    t10 = t15 - t0;
+    t9 = t13 + t14;
+    t15 = t16 + t7;
+    t0 = t8 + t3;
+    t13 = t19 + t17;
+    t14 = t4 + t2;
+    t16 = t16 - t7;
+    t7 = t8 - t3;
+    t8 = t19 - t17;
+    t3 = t4 - t2;
+    t19 = t15 + t13;
+    t17 = t0 + t14;
+    t4 = t16 + t3;
+    t2 = t7 - t8;
+    t15 = t15 - t13;
+    t13 = t0 - t14;
+    t0 = t16 - t3;
+    t14 = t7 + t8;
+    t16 = t4 + t2;
+    t3 = t4 - t2;
+    t7 = C4 * t16;
+    t8 = (-C4) * t3;
+    t4 = t0 - t14;
+    t2 = t0 + t14;
+    t16 = (-C4) * t4;
+    t3 = (-C4) * t2;
+    t0 = t12 - t19;
+    t14 = t11 - t17;
+    t4 = t12 + t19;
+    t2 = t11 + t17;
+    t12 = t6 - t7;
+    t19 = t5 - t8;
+    t11 = t6 + t7;
+    t17 = t5 + t8;
+    t6 = t18 - t13;
+    t7 = t1 + t15;
+    t5 = t18 + t13;
+    t8 = t1 - t15;
+    t18 = t10 - t16;
+    t13 = t9 - t3;
+    t1 = t10 + t16;
+    t15 = t9 + t3;
+    t10 = t11 + t17;
+    t16 = C15 * t10;
+    t9 = t11 * (-C16);
+    t3 = t17 * C17;
+    t10 = t16 - t3;
+    t11 = t16 + t9;
+    t17 = t5 + t8;
+    t3 = C19 * t17;
+    t16 = t5 * (-C13);
+    t9 = t8 * (-C14);
+    t17 = t3 - t9;
+    t5 = t3 + t16;
+    t8 = t1 + t15;
+    t9 = (-C20) * t8;
+    t3 = t1 * (-C11);
+    t16 = t15 * (-C10);
+    t8 = t9 - t16;
+    t1 = t9 + t3;
+    t15 = t0 - t14;
+    t16 = t0 + t14;
+    t9 = (-C4) * t15;
+    t3 = (-C4) * t16;
+    t0 = t12 + t19;
+    t14 = (-C9) * t0;
+    t15 = t12 * C11;
+    t16 = t19 * (-C10);
+    t0 = t14 - t16;
+    t12 = t14 + t15;
+    t19 = t6 + t7;
+    t16 = (-C12) * t19;
+    t14 = t6 * C13;
+    t15 = t7 * (-C14);
+    t19 = t16 - t15;
+    t6 = t16 + t14;
+    t7 = t18 + t13;
+    t15 = (-C18) * t7;
+    t16 = t18 * C16;
+    t14 = t13 * C17;
+    t7 = t15 - t14;
+    t18 = t15 + t16;
+    re[79] = t4;
+    im[79] = t2;
+    re[99] = t10;
+    im[99] = t11;
+    re[119] = t17;
+    im[119] = t5;
+    re[139] = t8;
+    im[139] = t1;
+    re[159] = t9;
+    im[159] = t3;
+    re[19] = t0;
+    im[19] = t12;
+    re[39] = t19;
+    im[39] = t6;
+    re[59] = t7;
+    im[59] = t18;
+    t13 = re[64];
+    t14 = im[64];
+    t15 = re[69];
+    t16 = im[69];
+    t4 = re[74];
+    t2 = im[74];
+    t10 = re[79];
+    t11 = im[79];
+    t17 = t13 + t4;
+    t5 = t14 + t2;
+    t8 = t15 + t10;
+    t1 = t16 + t11;
+    t9 = t13 - t4;
+    t3 = t14 - t2;
+    t0 = t15 - t10;
+    t12 = t16 - t11;
+    t19 = t17 + t8;
+    t6 = t5 + t1;
+    t7 = t9 + t12;
+    t18 = t3 - t0;
+    t13 = t17 - t8;
+    t4 = t5 - t1;
+    t14 = t9 - t12;
+    t2 = t3 + t0;
+    re[64] = t19;
+    im[64] = t6;
+    re[69] = t7;
+    im[69] = t18;
+    re[74] = t13;
+    im[74] = t4;
+    re[79] = t14;
+    im[79] = t2;
+    t15 = re[84];
+    t10 = im[84];
+    t16 = re[89];
+    t11 = im[89];
+    t17 = re[94];
+    t8 = im[94];
+    t5 = re[99];
+    t1 = im[99];
+    t9 = t15 + t17;
+    t12 = t10 + t8;
+    t3 = t16 + t5;
+    t0 = t11 + t1;
+    t19 = t15 - t17;
+    t6 = t10 - t8;
+    t7 = t16 - t5;
+    t18 = t11 - t1;
+    t13 = t9 + t3;
+    t4 = t12 + t0;
+    t14 = t19 + t18;
+    t2 = t6 - t7;
+    t15 = t9 - t3;
+    t17 = t12 - t0;
+    t10 = t19 - t18;
+    t8 = t6 + t7;
+    re[84] = t13;
+    im[84] = t4;
+    re[89] = t14;
+    im[89] = t2;
+    re[94] = t15;
+    im[94] = t17;
+    re[99] = t10;
+    im[99] = t8;
+    t16 = re[104];
+    t5 = im[104];
+    t11 = re[109];
+    t1 = im[109];
+    t9 = re[114];
+    t3 = im[114];
+    t12 = re[119];
+    t0 = im[119];
+    t19 = t16 + t9;
+    t18 = t5 + t3;
+    t6 = t11 + t12;
+    t7 = t1 + t0;
+    t13 = t16 - t9;
+    t4 = t5 - t3;
+    t14 = t11 - t12;
+    t2 = t1 - t0;
+    t15 = t19 + t6;
+    t17 = t18 + t7;
+    t10 = t13 + t2;
+    t8 = t4 - t14;
+    t16 = t19 - t6;
+    t9 = t18 - t7;
+    t5 = t13 - t2;
+    t3 = t4 + t14;
+    re[104] = t15;
+    im[104] = t17;
+    re[109] = t10;
+    im[109] = t8;
+    re[114] = t16;
+    im[114] = t9;
+    re[119] = t5;
+    im[119] = t3;
+    t11 = re[124];
+    t12 = im[124];
+    t1 = re[129];
+    t0 = im[129];
+    t19 = re[134];
+    t6 = im[134];
+    t18 = re[139];
+    t7 = im[139];
+    t13 = t11 + t19;
+    t2 = t12 + t6;
+    t4 = t1 + t18;
+    t14 = t0 + t7;
+    t15 = t11 - t19;
+    t17 = t12 - t6;
+    t10 = t1 - t18;
+    t8 = t0 - t7;
+    t16 = t13 + t4;
+    t9 = t2 + t14;
+    t5 = t15 + t8;
+    t3 = t17 - t10;
+    t11 = t13 - t4;
+    t19 = t2 - t14;
+    t12 = t15 - t8;
+    t6 = t17 + t10;
+    re[124] = t16;
+    im[124] = t9;
+    re[129] = t5;
+    im[129] = t3;
+    re[134] = t11;
+    im[134] = t19;
+    re[139] = t12;
+    im[139] = t6;
+    t1 = re[144];
+    t18 = im[144];
+    t0 = re[149];
+    t7 = im[149];
+    t13 = re[154];
+    t4 = im[154];
+    t2 = re[159];
+    t14 = im[159];
+    t15 = t1 + t13;
+    t8 = t18 + t4;
+    t17 = t0 + t2;
+    t10 = t7 + t14;
+    t16 = t1 - t13;
+    t9 = t18 - t4;
+    t5 = t0 - t2;
+    t3 = t7 - t14;
+    t11 = t15 + t17;
+    t19 = t8 + t10;
+    t12 = t16 + t3;
+    t6 = t9 - t5;
+    t1 = t15 - t17;
+    t13 = t8 - t10;
+    t18 = t16 - t3;
+    t4 = t9 + t5;
+    re[144] = t11;
+    im[144] = t19;
+    re[149] = t12;
+    im[149] = t6;
+    re[154] = t1;
+    im[154] = t13;
+    re[159] = t18;
+    im[159] = t4;
+    t0 = re[4];
+    t2 = im[4];
+    t7 = re[9];
+    t14 = im[9];
+    t15 = re[14];
+    t17 = im[14];
+    t8 = re[19];
+    t10 = im[19];
+    t16 = t0 + t15;
+    t3 = t2 + t17;
+    t9 = t7 + t8;
+    t5 = t14 + t10;
+    t11 = t0 - t15;
+    t19 = t2 - t17;
+    t12 = t7 - t8;
+    t6 = t14 - t10;
+    t1 = t16 + t9;
+    t13 = t3 + t5;
+    t18 = t11 + t6;
+    t4 = t19 - t12;
+    t0 = t16 - t9;
+    t15 = t3 - t5;
+    t2 = t11 - t6;
+    t17 = t19 + t12;
+    re[4] = t1;
+    im[4] = t13;
+    re[9] = t18;
+    im[9] = t4;
+    re[14] = t0;
+    im[14] = t15;
+    re[19] = t2;
+    im[19] = t17;
+    t7 = re[24];
+    t8 = im[24];
+    t14 = re[29];
+    t10 = im[29];
+    t16 = re[34];
+    t9 = im[34];
+    t3 = re[39];
+    t5 = im[39];
+    t11 = t7 + t16;
+    t6 = t8 + t9;
+    t19 = t14 + t3;
+    t12 = t10 + t5;
+    t1 = t7 - t16;
+    t13 = t8 - t9;
+    t18 = t14 - t3;
+    t4 = t10 - t5;
+    t0 = t11 + t19;
+    t15 = t6 + t12;
+    t2 = t1 + t4;
+    t17 = t13 - t18;
+    t7 = t11 - t19;
+    t16 = t6 - t12;
+    t8 = t1 - t4;
+    t9 = t13 + t18;
+    re[24] = t0;
+    im[24] = t15;
+    re[29] = t2;
+    im[29] = t17;
+    re[34] = t7;
+    im[34] = t16;
+    re[39] = t8;
+    im[39] = t9;
+    t14 = re[44];
+    t3 = im[44];
+    t10 = re[49];
+    t5 = im[49];
+    t11 = re[54];
+    t19 = im[54];
+    t6 = re[59];
+    t12 = im[59];
+    t1 = t14 + t11;
+    t4 = t3 + t19;
+    t13 = t10 + t6;
+    t18 = t5 + t12;
+    t0 = t14 - t11;
+    t15 = t3 - t19;
+    t2 = t10 - t6;
+    t17 = t5 - t12;
+    t7 = t1 + t13;
+    t16 = t4 + t18;
+    t8 = t0 + t17;
+    t9 = t15 - t2;
+    t14 = t1 - t13;
+    t11 = t4 - t18;
+    t3 = t0 - t17;
+    t19 = t15 + t2;
+    re[44] = t7;
+    im[44] = t16;
+    re[49] = t8;
+    im[49] = t9;
+    re[54] = t14;
+    im[54] = t11;
+    re[59] = t3;
+    im[59] = t19;
+}
+
+/**
+ *  Part 4 of ApplyWindowedMDCT_W10_320().
+ * 
+ *  @param {Number[]} x 
+ *    - The input block (640 points).
+ *  @param {Number[]} X 
+ *    - The array that would contain the output block (320 points).
+ *  @param {Number[]} re 
+ *    - The scratch buffer (real part, 160 points).
+ *  @param {Number[]} im 
+ *    - The scratch buffer (imaginary part, 160 points).
+ */
+function ApplyWindowedMDCT_W10_320_Part4(x, X, re, im) {
+    let t0, t1, t10, t11, t12, t13, t14, t15, t16, t17, t18, t19, t2, t3, t4, t5, t6, t7, t8, t9;
+    const C0 = 0.03925981575906861;
+    const C1 = 0.9992290362407229;
+    const C2 = 0.9876883405951378;
+    const C3 = 0.15643446504023087;
+    const C4 = 0.7071067811865476;
+    const C5 = 0.18545223811159092;
+    const C6 = 0.9826532793307118;
+    const C7 = 0.999951808959328;
+    const C8 = 0.009817319337149617;
+    const C9 = 0.9807852804032304;
+    const C10 = 1.1758756024193586;
+    const C11 = 0.7856949583871022;
+    const C12 = 0.9238795325112867;
+    const C13 = 1.3065629648763766;
+    const C14 = 0.5411961001461969;
+    const C15 = 0.8314696123025452;
+    const C16 = 1.3870398453221475;
+    const C17 = 0.27589937928294306;
+    const C18 = 0.5555702330196022;
+    const C19 = 0.3826834323650898;
+    const C20 = 0.19509032201612825;
+    const C21 = 0.13701234168196802;
+    const C22 = 0.9905693404435773;
+    const C23 = 0.9982656101847159;
+    const C24 = 0.05887080365118903;
+    const C25 = 0.08824237052036951;
+    const C26 = 0.9960990332516871;
+    const C27 = 0.9941745021174282;
+    const C28 = 0.10778246304275935;
+    t10 = x[32];
+    t6 = (-0.003434751278859086) * t10;
+    t5 = x[287];
+    t12 = 0.07829961620452687 * t5;
+    t1 = t6 - t12;
+    t13 = x[352];
+    t4 = 0.5877852522924731 * t1;
+    t18 = (-0.06457702425559385) * t13;
+    t0 = t4 + t18;
+    t17 = (-0.8090169943749475) * t1;
+    t15 = (-0.04691795445372267) * t13;
+    t2 = t17 + t15;
+    t7 = x[72];
+    t16 = (-0.008565561378246727) * t7;
+    t8 = x[247];
+    t9 = 0.07809423015894994 * t8;
+    t14 = t16 - t9;
+    t11 = x[392];
+    t3 = 0.41865973753742813 * t14;
+    t19 = (-0.0726800792434251) * t11;
+    t10 = t3 + t19;
+    t5 = (-0.9081431738250813) * t14;
+    t6 = (-0.03350597546429684) * t11;
+    t12 = t5 + t6;
+    t4 = x[112];
+    t18 = 0.009384974833630134 * t4;
+    t1 = x[207];
+    t13 = 0.07918673474916837 * t1;
+    t17 = t18 - t13;
+    t15 = x[432];
+    t7 = 0.2334453638559054 * t17;
+    t8 = (-0.07674659173327392) * t15;
+    t16 = t7 + t8;
+    t9 = (-0.9723699203976766) * t17;
+    t3 = (-0.01842522650695269) * t15;
+    t19 = t9 + t3;
+    t14 = x[152];
+    t11 = 0.0606817306790926 * t14;
+    t5 = x[167];
+    t6 = 0.07549217237243139 * t5;
+    t4 = t11 - t6;
+    t1 = x[472];
+    t18 = 0.05637208485075786 * t1;
+    t13 = x[487];
+    t7 = 0.032865721381615164 * t13;
+    t8 = t18 + t7;
+    t17 = C0 * t4;
+    t15 = (-C1) * t8;
+    t9 = t17 + t15;
+    t3 = (-C1) * t4;
+    t14 = (-C0) * t8;
+    t5 = t3 + t14;
+    t11 = x[447];
+    t6 = 0.07632478244965488 * t11;
+    t1 = x[512];
+    t13 = 0.0028523908353459116 * t1;
+    t18 = t6 + t13;
+    t7 = x[127];
+    t17 = 0.026264380520193423 * t7;
+    t15 = x[192];
+    t4 = 0.08090535634060078 * t15;
+    t8 = t17 - t4;
+    t3 = (-C2) * t18;
+    t14 = C3 * t8;
+    t11 = t3 + t14;
+    t1 = C3 * t18;
+    t6 = C2 * t8;
+    t13 = t1 + t6;
+    t7 = x[407];
+    t15 = x[87];
+    t17 = (-0.005722778753227274) * t15;
+    t4 = x[232];
+    t3 = 0.07809164250216843 * t4;
+    t14 = t17 - t3;
+    t18 = (-0.07508736737548717) * t7;
+    t8 = 0.34611705707749296 * t14;
+    t1 = t18 + t8;
+    t6 = 0.027701192309718216 * t7;
+    t15 = 0.9381913359224842 * t14;
+    t4 = t6 + t15;
+    t17 = x[367];
+    t3 = x[47];
+    t18 = (-0.006541902249447796) * t3;
+    t8 = x[272];
+    t7 = 0.07826047597585467 * t8;
+    t14 = t18 - t7;
+    t6 = (-0.06809313335708829) * t17;
+    t15 = 0.5224985647159488 * t14;
+    t3 = t6 + t15;
+    t8 = 0.04172752578814119 * t17;
+    t18 = 0.8526401643540922 * t14;
+    t7 = t8 + t18;
+    t6 = x[327];
+    t15 = x[7];
+    t17 = (-0.00022705217394369635) * t15;
+    t14 = x[312];
+    t8 = 0.07879071480259427 * t14;
+    t18 = t17 - t8;
+    t15 = (-0.05824944849747598) * t6;
+    t14 = 0.6788007455329417 * t18;
+    t17 = t15 + t14;
+    t8 = 0.053845236335401225 * t6;
+    t15 = 0.7343225094356856 * t18;
+    t14 = t8 + t15;
+    t6 = t0 + t11;
+    t18 = t2 + t13;
+    t8 = t16 + t3;
+    t15 = t19 + t7;
+    t0 = t0 - t11;
+    t11 = t2 - t13;
+    t2 = t16 - t3;
+    t13 = t19 - t7;
+    t16 = t6 + t8;
+    t3 = t18 + t15;
+    t19 = t0 + t13;
+    t7 = t11 - t2;
+    t6 = t6 - t8;
+    t8 = t18 - t15;
+    t18 = t0 - t13;
+    t15 = t11 + t2;
+    t0 = t10 + t1;
+    t13 = t12 + t4;
+    t11 = t9 + t17;
+    t2 = t5 + t14;
+    t10 = t10 - t1;
+    t1 = t12 - t4;
+    t12 = t9 - t17;
+    t4 = t5 - t14;
+    t9 = t0 + t11;
+    t17 = t13 + t2;
+    t5 = t10 + t4;
+    t14 = t1 - t12;
+    t0 = t0 - t11;
+    t11 = t13 - t2;
+    t13 = t10 - t4;
+    t2 = t1 + t12;
+    t10 = t5 + t14;
+    t4 = t5 - t14;
+    t1 = C4 * t10;
+    t12 = (-C4) * t4;
+    t5 = t13 - t2;
+    t14 = t13 + t2;
+    t10 = (-C4) * t5;
+    t4 = (-C4) * t14;
+    t13 = t16 - t9;
+    t2 = t3 - t17;
+    t5 = t16 + t9;
+    t14 = t3 + t17;
+    t16 = t19 - t1;
+    t9 = t7 - t12;
+    t3 = t19 + t1;
+    t17 = t7 + t12;
+    t19 = t6 - t11;
+    t1 = t8 + t0;
+    t7 = t6 + t11;
+    t12 = t8 - t0;
+    t6 = t18 - t10;
+    t11 = t15 - t4;
+    t8 = t18 + t10;
+    t0 = t15 + t4;
+    re[96] = t5;
+    im[96] = t14;
+    re[116] = t3;
+    im[116] = t17;
+    re[136] = t7;
+    im[136] = t12;
+    re[156] = t8;
+    im[156] = t0;
+    re[16] = t13;
+    im[16] = t2;
+    re[36] = t16;
+    im[36] = t9;
+    re[56] = t19;
+    im[56] = t1;
+    re[76] = t6;
+    im[76] = t11;
+    t18 = x[42];
+    t10 = (-0.005534064185263188) * t18;
+    t15 = x[277];
+    t4 = 0.07827030505175593 * t15;
+    t5 = t10 - t4;
+    t14 = x[362];
+    t3 = 0.5473806568087966 * t5;
+    t17 = (-0.06682640951404101) * t14;
+    t7 = t3 + t17;
+    t12 = (-0.8368837533084093) * t5;
+    t8 = (-0.043709157678544476) * t14;
+    t0 = t12 + t8;
+    t13 = x[82];
+    t2 = (-0.007094668922628993) * t13;
+    t16 = x[237];
+    t9 = 0.07806216596586069 * t16;
+    t19 = t2 - t9;
+    t1 = x[402];
+    t6 = 0.37359497005251635 * t19;
+    t11 = (-0.07426708602838031) * t1;
+    t18 = t6 + t11;
+    t15 = (-0.927591935255724) * t19;
+    t10 = (-0.02991165481943444) * t1;
+    t4 = t15 + t10;
+    t3 = x[122];
+    t17 = 0.020013499709567478 * t3;
+    t5 = x[197];
+    t14 = 0.08033903605838183 * t5;
+    t12 = t17 - t14;
+    t8 = x[442];
+    t13 = 0.07756610969358985 * t8;
+    t16 = x[517];
+    t2 = 0.0009200547972867385 * t16;
+    t9 = t13 + t2;
+    t6 = C5 * t12;
+    t11 = (-C6) * t9;
+    t19 = t6 + t11;
+    t1 = (-C6) * t12;
+    t15 = (-C5) * t9;
+    t10 = t1 + t15;
+    t3 = x[477];
+    t5 = 0.049102837139157966 * t3;
+    t17 = x[482];
+    t14 = 0.04113124616241223 * t17;
+    t8 = t5 + t14;
+    t16 = x[157];
+    t13 = 0.06655154500769807 * t16;
+    t2 = x[162];
+    t6 = 0.07153664074123962 * t2;
+    t11 = t13 - t6;
+    t12 = (-C7) * t8;
+    t9 = C8 * t11;
+    t1 = t12 + t9;
+    t15 = C8 * t8;
+    t3 = C7 * t11;
+    t17 = t15 + t3;
+    t5 = x[437];
+    t14 = x[117];
+    t16 = 0.01436423434214279 * t14;
+    t2 = x[202];
+    t13 = 0.07973350773965149 * t2;
+    t6 = t16 - t13;
+    t12 = (-0.07672611389313551) * t5;
+    t9 = 0.2047096027093796 * t6;
+    t8 = t12 + t9;
+    t11 = 0.01604639069826548 * t5;
+    t15 = 0.9788227513490724 * t6;
+    t3 = t11 + t15;
+    t14 = x[397];
+    t2 = x[77];
+    t16 = (-0.008029601387179236) * t2;
+    t13 = x[242];
+    t12 = 0.07806664449304893 * t13;
+    t9 = t16 - t12;
+    t5 = (-0.07366126806696868) * t14;
+    t6 = 0.3917350108519559 * t9;
+    t11 = t5 + t6;
+    t15 = 0.031362226898873906 * t14;
+    t2 = 0.9200780843345949 * t9;
+    t13 = t15 + t2;
+    t16 = x[357];
+    t12 = x[37];
+    t5 = (-0.004474926713724794) * t12;
+    t6 = x[282];
+    t14 = 0.07828008273966162 * t6;
+    t9 = t5 - t14;
+    t15 = (-0.0659471176780564) * t16;
+    t2 = 0.5637062622150166 * t9;
+    t12 = t15 + t2;
+    t6 = 0.04500715910790417 * t16;
+    t5 = 0.8259753325248732 * t9;
+    t14 = t6 + t5;
+    t15 = x[2];
+    t2 = (-6.614302176500143e-05) * t15;
+    t16 = x[317];
+    t9 = 0.07896597160570053 * t16;
+    t6 = t2 - t9;
+    t5 = x[322];
+    t15 = 0.7001308118985237 * t6;
+    t16 = (-0.05651283897453209) * t5;
+    t2 = t15 + t16;
+    t9 = (-0.7140145980512682) * t6;
+    t15 = (-0.05541396484317917) * t5;
+    t16 = t9 + t15;
+    t6 = t7 + t8;
+    t5 = t0 + t3;
+    t9 = t19 + t12;
+    t15 = t10 + t14;
+    t7 = t7 - t8;
+    t8 = t0 - t3;
+    t0 = t19 - t12;
+    t3 = t10 - t14;
+    t19 = t6 + t9;
+    t12 = t5 + t15;
+    t10 = t7 + t3;
+    t14 = t8 - t0;
+    t6 = t6 - t9;
+    t9 = t5 - t15;
+    t5 = t7 - t3;
+    t15 = t8 + t0;
+    t7 = t18 + t11;
+    t3 = t4 + t13;
+    t8 = t1 + t2;
+    t0 = t17 + t16;
+    t18 = t18 - t11;
+    t11 = t4 - t13;
+    t4 = t1 - t2;
+    t13 = t17 - t16;
+    t1 = t7 + t8;
+    t2 = t3 + t0;
+    t17 = t18 + t13;
+    t16 = t11 - t4;
+    t7 = t7 - t8;
+    t8 = t3 - t0;
+    t3 = t18 - t13;
+    t0 = t11 + t4;
+    t18 = t17 + t16;
+    t13 = t17 - t16;
+    t11 = C4 * t18;
+    t4 = (-C4) * t13;
+    t17 = t3 - t0;
+    t16 = t3 + t0;
+    t18 = (-C4) * t17;
+    t13 = (-C4) * t16;
+    t3 = t19 - t1;
+    t0 = t12 - t2;
+    t17 = t19 + t1;
+    t16 = t12 + t2;
+    t19 = t10 - t11;
+    t1 = t14 - t4;
+    t12 = t10 + t11;
+    t2 = t14 + t4;
+    t10 = t6 - t8;
+    t11 = t9 + t7;
+    t14 = t6 + t8;
+    t4 = t9 - t7;
+    t6 = t5 - t18;
+    t8 = t15 - t13;
+    t9 = t5 + t18;
+    t7 = t15 + t13;
+    t5 = t12 + t2;
+    t18 = C9 * t5;
+    t15 = t12 * (-C10);
+    t13 = t2 * C11;
+    t5 = t18 - t13;
+    t12 = t18 + t15;
+    t2 = t14 + t4;
+    t13 = C12 * t2;
+    t18 = t14 * (-C13);
+    t15 = t4 * C14;
+    t2 = t13 - t15;
+    t14 = t13 + t18;
+    t4 = t9 + t7;
+    t15 = C15 * t4;
+    t13 = t9 * (-C16);
+    t18 = t7 * C17;
+    t4 = t15 - t18;
+    t9 = t15 + t13;
+    t7 = t3 + t0;
+    t18 = t3 - t0;
+    t15 = C4 * t7;
+    t13 = (-C4) * t18;
+    t3 = t19 + t1;
+    t0 = C18 * t3;
+    t7 = t19 * (-C16);
+    t18 = t1 * (-C17);
+    t3 = t0 - t18;
+    t19 = t0 + t7;
+    t1 = t10 + t11;
+    t18 = C19 * t1;
+    t0 = t10 * (-C13);
+    t7 = t11 * (-C14);
+    t1 = t18 - t7;
+    t10 = t18 + t0;
+    t11 = t6 + t8;
+    t7 = C20 * t11;
+    t18 = t6 * (-C10);
+    t0 = t8 * (-C11);
+    t11 = t7 - t0;
+    t6 = t7 + t18;
+    re[101] = t17;
+    im[101] = t16;
+    re[121] = t5;
+    im[121] = t12;
+    re[141] = t2;
+    im[141] = t14;
+    re[1] = t4;
+    im[1] = t9;
+    re[21] = t15;
+    im[21] = t13;
+    re[41] = t3;
+    im[41] = t19;
+    re[61] = t1;
+    im[61] = t10;
+    re[81] = t11;
+    im[81] = t6;
+    t8 = x[52];
+    t0 = (-0.007427539565617188) * t8;
+    t7 = x[267];
+    t18 = 0.07824318757396576 * t7;
+    t17 = t0 - t18;
+    t16 = x[372];
+    t5 = 0.5056573733779846 * t17;
+    t12 = (-0.06891449696197367) * t16;
+    t2 = t5 + t12;
+    t14 = (-0.8627343859777918) * t17;
+    t4 = (-0.04039148559259318) * t16;
+    t9 = t14 + t4;
+    t15 = x[92];
+    t13 = (-0.0038696892324265575) * t15;
+    t3 = x[227];
+    t19 = 0.07816565618168997 * t3;
+    t1 = t13 - t19;
+    t10 = x[412];
+    t11 = 0.3276301795616935 * t1;
+    t6 = (-0.07554517007689653) * t10;
+    t8 = t11 + t6;
+    t7 = (-0.944806046466878) * t1;
+    t0 = (-0.026196781582705476) * t10;
+    t18 = t7 + t0;
+    t5 = x[132];
+    t12 = 0.03299712828508903 * t5;
+    t17 = x[187];
+    t16 = 0.08122810178898779 * t17;
+    t14 = t12 - t16;
+    t4 = x[452];
+    t15 = 0.07442739657708623 * t4;
+    t3 = x[507];
+    t13 = 0.006194595274505857 * t3;
+    t19 = t15 + t13;
+    t11 = C21 * t14;
+    t6 = (-C22) * t19;
+    t1 = t11 + t6;
+    t10 = (-C22) * t14;
+    t7 = (-C21) * t19;
+    t0 = t10 + t7;
+    t5 = x[467];
+    t17 = 0.06263955390830653 * t5;
+    t12 = x[492];
+    t16 = 0.024781081945578775 * t12;
+    t4 = t17 + t16;
+    t3 = x[147];
+    t15 = 0.05413766123113763 * t3;
+    t13 = x[172];
+    t11 = 0.07835959668349907 * t13;
+    t6 = t15 - t11;
+    t14 = (-C23) * t4;
+    t19 = C24 * t6;
+    t10 = t14 + t19;
+    t7 = C24 * t4;
+    t5 = C23 * t6;
+    t12 = t7 + t5;
+    t17 = x[427];
+    t16 = x[107];
+    t3 = 0.005097485695067034 * t16;
+    t13 = x[212];
+    t15 = 0.07878375895351551 * t13;
+    t11 = t3 - t15;
+    t14 = (-0.0767606726002983) * t17;
+    t19 = 0.25249157701515795 * t11;
+    t4 = t14 + t19;
+    t6 = 0.02003042730260994 * t17;
+    t7 = 0.9675990923602598 * t11;
+    t5 = t6 + t7;
+    t16 = x[387];
+    t13 = x[67];
+    t3 = (-0.008736648715340965) * t13;
+    t15 = x[252];
+    t14 = 0.07813426029130742 * t15;
+    t19 = t3 - t14;
+    t17 = (-0.07197133183779564) * t16;
+    t11 = 0.436409240673342 * t19;
+    t6 = t17 + t11;
+    t7 = 0.03490860147698658 * t16;
+    t13 = 0.8997482840522215 * t19;
+    t15 = t7 + t13;
+    t3 = x[347];
+    t14 = x[27];
+    t17 = (-0.002477252921970635) * t14;
+    t11 = x[292];
+    t16 = 0.07833883145205656 * t11;
+    t19 = t17 - t16;
+    t7 = (-0.06361154479473155) * t3;
+    t13 = 0.6035559419535714 * t19;
+    t14 = t7 + t13;
+    t11 = 0.04815267942206193 * t3;
+    t17 = 0.7973206537727071 * t19;
+    t16 = t11 + t17;
+    t7 = x[12];
+    t13 = (-0.0005281496518064612) * t7;
+    t3 = x[307];
+    t19 = 0.07863384200486458 * t3;
+    t11 = t13 - t19;
+    t17 = x[332];
+    t7 = 0.6642524379112817 * t11;
+    t3 = (-0.059413694203091436) * t17;
+    t13 = t7 + t3;
+    t19 = (-0.7475083268625968) * t11;
+    t7 = (-0.05279632319998658) * t17;
+    t3 = t19 + t7;
+    t11 = t2 + t4;
+    t17 = t9 + t5;
+    t19 = t1 + t14;
+    t7 = t0 + t16;
+    t2 = t2 - t4;
+    t4 = t9 - t5;
+    t9 = t1 - t14;
+    t5 = t0 - t16;
+    t1 = t11 + t19;
+    t14 = t17 + t7;
+    t0 = t2 + t5;
+    t16 = t4 - t9;
+    t11 = t11 - t19;
+    t19 = t17 - t7;
+    t17 = t2 - t5;
+    t7 = t4 + t9;
+    t2 = t8 + t6;
+    t5 = t18 + t15;
+    t4 = t10 + t13;
+    t9 = t12 + t3;
+    t8 = t8 - t6;
+    t6 = t18 - t15;
+    t18 = t10 - t13;
+    t15 = t12 - t3;
+    t10 = t2 + t4;
+    t13 = t5 + t9;
+    t12 = t8 + t15;
+    t3 = t6 - t18;
+    t2 = t2 - t4;
+    t4 = t5 - t9;
+    t5 = t8 - t15;
+    t9 = t6 + t18;
+    t8 = t12 + t3;
+    t15 = t12 - t3;
+    t6 = C4 * t8;
+    t18 = (-C4) * t15;
+    t12 = t5 - t9;
+    t3 = t5 + t9;
+    t8 = (-C4) * t12;
+    t15 = (-C4) * t3;
+    t5 = t1 - t10;
+    t9 = t14 - t13;
+    t12 = t1 + t10;
+    t3 = t14 + t13;
+    t1 = t0 - t6;
+    t10 = t16 - t18;
+    t14 = t0 + t6;
+    t13 = t16 + t18;
+    t0 = t11 - t4;
+    t6 = t19 + t2;
+    t16 = t11 + t4;
+    t18 = t19 - t2;
+    t11 = t17 - t8;
+    t4 = t7 - t15;
+    t19 = t17 + t8;
+    t2 = t7 + t15;
+    t17 = t14 + t13;
+    t8 = C12 * t17;
+    t7 = t14 * (-C13);
+    t15 = t13 * C14;
+    t17 = t8 - t15;
+    t14 = t8 + t7;
+    t13 = t16 + t18;
+    t15 = t16 - t18;
+    t8 = C4 * t13;
+    t7 = (-C4) * t15;
+    t16 = t19 + t2;
+    t18 = C19 * t16;
+    t13 = t19 * (-C13);
+    t15 = t2 * (-C14);
+    t16 = t18 - t15;
+    t19 = t18 + t13;
+    t2 = -t5;
+    t15 = t1 + t10;
+    t18 = (-C19) * t15;
+    t13 = t1 * (-C14);
+    t5 = t10 * (-C13);
+    t15 = t18 - t5;
+    t1 = t18 + t13;
+    t10 = t0 - t6;
+    t5 = t0 + t6;
+    t18 = (-C4) * t10;
+    t13 = (-C4) * t5;
+    t0 = t11 + t4;
+    t6 = (-C12) * t0;
+    t10 = t11 * C14;
+    t5 = t4 * (-C13);
+    t0 = t6 - t5;
+    t11 = t6 + t10;
+    re[106] = t12;
+    im[106] = t3;
+    re[126] = t17;
+    im[126] = t14;
+    re[146] = t8;
+    im[146] = t7;
+    re[6] = t16;
+    im[6] = t19;
+    re[26] = t9;
+    im[26] = t2;
+    re[46] = t15;
+    im[46] = t1;
+    re[66] = t18;
+    im[66] = t13;
+    re[86] = t0;
+    im[86] = t11;
+    t4 = x[62];
+    t5 = (-0.00857698481964919) * t4;
+    t6 = x[257];
+    t10 = 0.07817710526341563 * t6;
+    t12 = t5 - t10;
+    t3 = x[382];
+    t17 = 0.4627159170443501 * t12;
+    t14 = (-0.07087326054073682) * t3;
+    t8 = t17 + t14;
+    t7 = (-0.8865066159447464) * t12;
+    t16 = (-0.03699260124537431) * t3;
+    t19 = t7 + t16;
+    t9 = x[102];
+    t2 = 0.0014873424733383262 * t9;
+    t15 = x[217];
+    t1 = 0.07849508722141564 * t15;
+    t18 = t2 - t1;
+    t13 = x[422];
+    t0 = 0.2808760992712921 * t18;
+    t11 = (-0.07641752426250986) * t13;
+    t4 = t0 + t11;
+    t6 = (-0.9597440371568574) * t18;
+    t5 = (-0.022364146376368795) * t13;
+    t10 = t6 + t5;
+    t17 = x[142];
+    t14 = 0.0471691425946232 * t17;
+    t12 = x[177];
+    t3 = 0.08017500732004093 * t12;
+    t7 = t14 - t3;
+    t16 = x[462];
+    t9 = 0.06773575540655445 * t16;
+    t15 = x[497];
+    t2 = 0.017369094907915213 * t15;
+    t1 = t9 + t2;
+    t0 = C25 * t7;
+    t11 = (-C26) * t1;
+    t18 = t0 + t11;
+    t13 = (-C26) * t7;
+    t6 = (-C25) * t1;
+    t5 = t13 + t6;
+    t17 = x[457];
+    t12 = 0.07163108093922897 * t17;
+    t14 = x[502];
+    t3 = 0.011069855000296981 * t14;
+    t16 = t12 + t3;
+    t15 = x[137];
+    t9 = 0.04003874813103435 * t15;
+    t2 = x[182];
+    t0 = 0.08106504589428773 * t2;
+    t11 = t9 - t0;
+    t7 = (-C27) * t16;
+    t1 = C28 * t11;
+    t13 = t7 + t1;
+    t6 = C28 * t16;
+    t17 = C27 * t11;
+    t14 = t6 + t17;
+    t12 = x[417];
+    t3 = x[97];
+    t15 = (-0.001484443570694814) * t3;
+    t2 = x[222];
+    t9 = 0.07829544839153392 * t2;
+    t0 = t15 - t9;
+    t7 = (-0.07615739659885527) * t12;
+    t1 = 0.2996652769962566 * t0;
+    t16 = t7 + t1;
+    t11 = 0.023921032699892188 * t12;
+    t6 = 0.9540444024062804 * t0;
+    t17 = t11 + t6;
+    t3 = x[377];
+    t2 = x[57];
+    t15 = (-0.008125006300371175) * t2;
+    t9 = x[262];
+    t7 = 0.07821504215293063 * t9;
+    t1 = t15 - t7;
+    t12 = (-0.07009928071361837) * t3;
+    t0 = 0.4800321224090111 * t1;
+    t11 = t12 + t0;
+    t6 = 0.03835836026515401 * t3;
+    t2 = 0.8772509113449243 * t1;
+    t9 = t6 + t2;
+    t15 = x[337];
+    t7 = x[17];
+    t12 = (-0.00100033448048195) * t7;
+    t0 = x[302];
+    t3 = 0.07850393454933578 * t0;
+    t1 = t12 - t3;
+    t6 = (-0.06104352954808755) * t15;
+    t2 = 0.641951602562703 * t1;
+    t7 = t6 + t2;
+    t0 = 0.051108234753449576 * t15;
+    t12 = 0.7667451597285615 * t1;
+    t3 = t0 + t12;
+    t6 = x[22];
+    t2 = (-0.0016543034293969414) * t6;
+    t15 = x[297];
+    t1 = 0.07840554562771143 * t15;
+    t0 = t2 - t1;
+    t12 = x[342];
+    t6 = 0.6267738216194696 * t0;
+    t15 = (-0.06211305243161256) * t12;
+    t2 = t6 + t15;
+    t1 = (-0.7792012426405167) * t0;
+    t6 = (-0.04996249122124793) * t12;
+    t15 = t1 + t6;
+    t0 = t8 + t16;
+    t12 = t19 + t17;
+    t1 = t18 + t7;
+    t6 = t5 + t3;
+    t8 = t8 - t16;
+    t16 = t19 - t17;
+    t19 = t18 - t7;
+    t17 = t5 - t3;
+    t18 = t0 + t1;
+    t7 = t12 + t6;
+    t5 = t8 + t17;
+    t3 = t16 - t19;
+    t0 = t0 - t1;
+    t1 = t12 - t6;
+    t12 = t8 - t17;
+    t6 = t16 + t19;
+    t8 = t4 + t11;
+    t17 = t10 + t9;
+    t16 = t13 + t2;
+    t19 = t14 + t15;
+    t4 = t4 - t11;
+    t11 = t10 - t9;
+    t10 = t13 - t2;
+    t9 = t14 - t15;
+    t13 = t8 + t16;
+    t2 = t17 + t19;
+    t14 = t4 + t9;
+    t15 = t11 - t10;
+    t8 = t8 - t16;
+    t16 = t17 - t19;
+    t17 = t4 - t9;
+    t19 = t11 + t10;
+    t4 = t14 + t15;
+    t9 = t14 - t15;
+    t11 = C4 * t4;
+    t10 = (-C4) * t9;
+    t14 = t17 - t19;
+    t15 = t17 + t19;
+    t4 = (-C4) * t14;
+    t9 = (-C4) * t15;
+    t17 = t18 - t13;
+    t19 = t7 - t2;
+    t14 = t18 + t13;
+    t15 = t7 + t2;
+    t18 = t5 - t11;
+    t13 = t3 - t10;
+    t7 = t5 + t11;
+    t2 = t3 + t10;
+    t5 = t0 - t16;
+    t11 = t1 + t8;
+    t3 = t0 + t16;
+    t10 = t1 - t8;
+    t0 = t12 - t4;
+    t16 = t6 - t9;
+    t1 = t12 + t4;
+    t8 = t6 + t9;
+    t12 = t7 + t2;
+    t4 = C15 * t12;
+    t6 = t7 * (-C16);
+    t9 = t2 * C17;
+    t12 = t4 - t9;
+    t7 = t4 + t6;
+    t2 = t3 + t10;
+    t9 = C19 * t2;
+    t4 = t3 * (-C13);
+    t6 = t10 * (-C14);
+    t2 = t9 - t6;
+    t3 = t9 + t4;
+    t10 = t1 + t8;
+    t6 = (-C20) * t10;
+    t9 = t1 * (-C11);
+    t4 = t8 * (-C10);
+    t10 = t6 - t4;
+    t1 = t6 + t9;
+    t8 = t17 - t19;
+    t4 = t17 + t19;
+    t6 = (-C4) * t8;
+    t9 = (-C4) * t4;
+    t17 = t18 + t13;
+    t19 = (-C9) * t17;
+    t8 = t18 * C11;
+    t4 = t13 * (-C10);
+    t17 = t19 - t4;
+    t18 = t19 + t8;
+    t13 = t5 + t11;
+    t4 = (-C12) * t13;
+    t19 = t5 * C13;
+    t8 = t11 * (-C14);
+    t13 = t4 - t8;
+    t5 = t4 + t19;
+    t11 = t0 + t16;
+    t8 = (-C18) * t11;
+    t4 = t0 * C16;
+    t19 = t16 * C17;
+    t11 = t8 - t19;
+    t0 = t8 + t4;
+    re[111] = t14;
+    im[111] = t15;
+    re[131] = t12;
+    im[131] = t7;
+    re[151] = t2;
+    im[151] = t3;
+    re[11] = t10;
+    im[11] = t1;
+    re[31] = t6;
+    im[31] = t9;
+    re[51] = t17;
+    im[51] = t18;
+    re[71] = t13;
+    im[71] = t5;
+    re[91] = t11;
+    im[91] = t0;
+    t16 = re[96];
+    t19 = im[96];
+    t8 = re[101];
+    t4 = im[101];
+    t14 = re[106];
+    t15 = im[106];
+    t12 = re[111];
+    t7 = im[111];
+    t2 = t16 + t14;
+    t3 = t19 + t15;
+    t10 = t8 + t12;
+    t1 = t4 + t7;
+    t6 = t16 - t14;
+    t9 = t19 - t15;
+    t17 = t8 - t12;
+    t18 = t4 - t7;
+    t13 = t2 + t10;
+    t5 = t3 + t1;
+    t11 = t6 + t18;
+    t0 = t9 - t17;
+    t16 = t2 - t10;
+    t14 = t3 - t1;
+    t19 = t6 - t18;
+    t15 = t9 + t17;
+    re[96] = t13;
+    im[96] = t5;
+    re[101] = t11;
+    im[101] = t0;
+    re[106] = t16;
+    im[106] = t14;
+    re[111] = t19;
+    im[111] = t15;
+    t8 = re[116];
+    t12 = im[116];
+    t4 = re[121];
+    t7 = im[121];
+    t2 = re[126];
+    t10 = im[126];
+    t3 = re[131];
+    t1 = im[131];
+    t6 = t8 + t2;
+    t18 = t12 + t10;
+    t9 = t4 + t3;
+    t17 = t7 + t1;
+    t13 = t8 - t2;
+    t5 = t12 - t10;
+    t11 = t4 - t3;
+    t0 = t7 - t1;
+    t16 = t6 + t9;
+    t14 = t18 + t17;
+    t19 = t13 + t0;
+    t15 = t5 - t11;
+    t8 = t6 - t9;
+    t2 = t18 - t17;
+    t12 = t13 - t0;
+    t10 = t5 + t11;
+    re[116] = t16;
+    im[116] = t14;
+    re[121] = t19;
+    im[121] = t15;
+    re[126] = t8;
+    im[126] = t2;
+    re[131] = t12;
+    im[131] = t10;
+    t4 = re[136];
+    t3 = im[136];
+    t7 = re[141];
+    t1 = im[141];
+    t6 = re[146];
+    t9 = im[146];
+    t18 = re[151];
+    t17 = im[151];
+    t13 = t4 + t6;
+    t0 = t3 + t9;
+    t5 = t7 + t18;
+    t11 = t1 + t17;
+    t16 = t4 - t6;
+    t14 = t3 - t9;
+    t19 = t7 - t18;
+    t15 = t1 - t17;
+    t8 = t13 + t5;
+    t2 = t0 + t11;
+    t12 = t16 + t15;
+    t10 = t14 - t19;
+    t4 = t13 - t5;
+    t6 = t0 - t11;
+    t3 = t16 - t15;
+    t9 = t14 + t19;
+    re[136] = t8;
+    im[136] = t2;
+    re[141] = t12;
+    im[141] = t10;
+    re[146] = t4;
+    im[146] = t6;
+    re[151] = t3;
+    im[151] = t9;
+    t7 = re[156];
+    t18 = im[156];
+    t1 = re[1];
+    t17 = im[1];
+    t13 = re[6];
+    t5 = im[6];
+    t0 = re[11];
+    t11 = im[11];
+    t16 = t7 + t13;
+    t15 = t18 + t5;
+    t14 = t1 + t0;
+    t19 = t17 + t11;
+    t8 = t7 - t13;
+    t2 = t18 - t5;
+    t12 = t1 - t0;
+    t10 = t17 - t11;
+    t4 = t16 + t14;
+    t6 = t15 + t19;
+    t3 = t8 + t10;
+    t9 = t2 - t12;
+    t7 = t16 - t14;
+    t13 = t15 - t19;
+    t18 = t8 - t10;
+    t5 = t2 + t12;
+    re[156] = t4;
+    im[156] = t6;
+    re[1] = t3;
+    im[1] = t9;
+    re[6] = t7;
+    im[6] = t13;
+    re[11] = t18;
+    im[11] = t5;
+    t1 = re[16];
+    t0 = im[16];
+    t17 = re[21];
+    t11 = im[21];
+    t16 = re[26];
+    t14 = im[26];
+    t15 = re[31];
+    t19 = im[31];
+    t8 = t1 + t16;
+    t10 = t0 + t14;
+    t2 = t17 + t15;
+    t12 = t11 + t19;
+    t4 = t1 - t16;
+    t6 = t0 - t14;
+    t3 = t17 - t15;
+    t9 = t11 - t19;
+    t7 = t8 + t2;
+    t13 = t10 + t12;
+    t18 = t4 + t9;
+    t5 = t6 - t3;
+    t1 = t8 - t2;
+    t16 = t10 - t12;
+    t0 = t4 - t9;
+    t14 = t6 + t3;
+    re[16] = t7;
+    im[16] = t13;
+    re[21] = t18;
+    im[21] = t5;
+    re[26] = t1;
+    im[26] = t16;
+    re[31] = t0;
+    im[31] = t14;
+    t17 = re[36];
+    t15 = im[36];
+    t11 = re[41];
+    t19 = im[41];
+    t8 = re[46];
+    t2 = im[46];
+    t10 = re[51];
+    t12 = im[51];
+    t4 = t17 + t8;
+    t9 = t15 + t2;
+    t6 = t11 + t10;
+    t3 = t19 + t12;
+    t7 = t17 - t8;
+    t13 = t15 - t2;
+    t18 = t11 - t10;
+    t5 = t19 - t12;
+    t1 = t4 + t6;
+    t16 = t9 + t3;
+    t0 = t7 + t5;
+    t14 = t13 - t18;
+    t17 = t4 - t6;
+    t8 = t9 - t3;
+    t15 = t7 - t5;
+    t2 = t13 + t18;
+    re[36] = t1;
+    im[36] = t16;
+    re[41] = t0;
+    im[41] = t14;
+    re[46] = t17;
+    im[46] = t8;
+    re[51] = t15;
+    im[51] = t2;
+    t11 = re[56];
+    t10 = im[56];
+    t19 = re[61];
+    t12 = im[61];
+    t4 = re[66];
+    t6 = im[66];
+    t9 = re[71];
+    t3 = im[71];
+    t7 = t11 + t4;
+    t5 = t10 + t6;
+    t13 = t19 + t9;
+    t18 = t12 + t3;
+    t1 = t11 - t4;
+    t16 = t10 - t6;
+    t0 = t19 - t9;
+    t14 = t12 - t3;
+    t17 = t7 + t13;
+    t8 = t5 + t18;
+    t15 = t1 + t14;
+    t2 = t16 - t0;
+    t11 = t7 - t13;
+    t4 = t5 - t18;
+    t10 = t1 - t14;
+    t6 = t16 + t0;
+    re[56] = t17;
+    im[56] = t8;
+    re[61] = t15;
+    im[61] = t2;
+    re[66] = t11;
+    im[66] = t4;
+    re[71] = t10;
+    im[71] = t6;
+    t19 = re[76];
+    t9 = im[76];
+    t12 = re[81];
+    t3 = im[81];
+    t7 = re[86];
+    t13 = im[86];
+    t5 = re[91];
+    t18 = im[91];
+    t1 = t19 + t7;
+    t14 = t9 + t13;
+    t16 = t12 + t5;
+    t0 = t3 + t18;
+    t17 = t19 - t7;
+    t8 = t9 - t13;
+    t15 = t12 - t5;
+    t2 = t3 - t18;
+    t11 = t1 + t16;
+    t4 = t14 + t0;
+    t10 = t17 + t2;
+    t6 = t8 - t15;
+    t19 = t1 - t16;
+    t7 = t14 - t0;
+    t9 = t17 - t2;
+    t13 = t8 + t15;
+    re[76] = t11;
+    im[76] = t4;
+    re[81] = t10;
+    im[81] = t6;
+    re[86] = t19;
+    im[86] = t7;
+    re[91] = t9;
+    im[91] = t13;
+}
+
+/**
+ *  Part 5 of ApplyWindowedMDCT_W10_320().
+ * 
+ *  @param {Number[]} x 
+ *    - The input block (640 points).
+ *  @param {Number[]} X 
+ *    - The array that would contain the output block (320 points).
+ *  @param {Number[]} re 
+ *    - The scratch buffer (real part, 160 points).
+ *  @param {Number[]} im 
+ *    - The scratch buffer (imaginary part, 160 points).
+ */
+function ApplyWindowedMDCT_W10_320_Part5(x, X, re, im) {
+    let t0, t1, t10, t11, t12, t13, t14, t15, t16, t17, t18, t19, t2, t3, t4, t5, t6, t7, t8, t9;
+    const C0 = 0.9510565162951535;
+    const C1 = 0.11753739745783764;
+    const C2 = 0.9930684569549263;
+    const C3 = 0.996917333733128;
+    const C4 = 0.07845909572784494;
+    const C5 = 0.7071067811865476;
+    const C6 = 0.06866825888437376;
+    const C7 = 0.9976395492470157;
+    const C8 = 0.991866697787626;
+    const C9 = 0.1272810033739132;
+    const C10 = 0.9807852804032304;
+    const C11 = 1.1758756024193586;
+    const C12 = 0.7856949583871022;
+    const C13 = 0.9238795325112867;
+    const C14 = 1.3065629648763766;
+    const C15 = 0.5411961001461969;
+    const C16 = 0.8314696123025452;
+    const C17 = 1.3870398453221475;
+    const C18 = 0.27589937928294306;
+    const C19 = 0.5555702330196022;
+    const C20 = 0.3826834323650898;
+    const C21 = 0.19509032201612825;
+    const C22 = 0.0196336924606283;
+    const C23 = 0.9998072404820648;
+    const C24 = 0.9844265680898916;
+    const C25 = 0.1757962799343545;
+    const C26 = 0.16612337814576547;
+    const C27 = 0.9861049757675088;
+    const C28 = 0.9995663085020212;
+    const C29 = 0.02944817324796316;
+    const C30 = 0.5590169943749475;
+    const C31 = 0.25;
+    const C32 = 0.5877852522924731;
+    const C33 = 0.9999969880372782;
+    const C34 = 0.0024543667964602917;
+    const C35 = 0.5857978574564389;
+    const C36 = 0.8104571982525948;
+    const C37 = 0.9502952106978444;
+    const C38 = 0.311350305162432;
+    const C39 = 0.3066818220921279;
+    const C40 = 0.9518120927989161;
+    const C41 = 0.8075719170392435;
+    const C42 = 0.5897691063539708;
+    const C43 = 0.8017430476558816;
+    const C44 = 0.5976688761642678;
+    const C45 = 0.9999247018391445;
+    const C46 = 0.012271538285719925;
+    const C47 = 0.5778131101237274;
+    const C48 = 0.8161691061104588;
+    const C49 = 0.9471927896111967;
+    const C50 = 0.3206646524151973;
+    const C51 = 0.2973227995119985;
+    const C52 = 0.9547770173660172;
+    const C53 = 0.28793512034162105;
+    const C54 = 0.9576499185369652;
+    const C55 = 0.7958369046088836;
+    const C56 = 0.6055110414043255;
+    const C57 = 0.9997560408170603;
+    const C58 = 0.02208752701857829;
+    const C59 = 0.5697726719608341;
+    const C60 = 0.8218023498911473;
+    const C61 = 0.9439990761120522;
+    const C62 = 0.32994809334134934;
+    const C63 = 0.9407143780171653;
+    const C64 = 0.33919973318352975;
+    const C65 = 0.27851968938505306;
+    const C66 = 0.9604305194155658;
+    const C67 = 0.789854057144609;
+    const C68 = 0.6132948462299359;
+    const C69 = 0.9994910212269259;
+    const C70 = 0.03190138690961086;
+    const C71 = 0.5616773179219247;
+    const C72 = 0.8273563866508998;
+    const C73 = 0.55352782825407;
+    const C74 = 0.8328306810800937;
+    const C75 = 0.937339011912575;
+    const C76 = 0.34841868024943456;
+    const C77 = 0.2690774141211269;
+    const C78 = 0.9631185520017188;
+    const C79 = 0.7837950819023488;
+    const C80 = 0.6210195404217892;
+    const C81 = 0.9991296686118811;
+    const C82 = 0.041712172078575326;
+    const C83 = 0.9986720177998429;
+    const C84 = 0.05151893694157748;
+    const C85 = 0.5453249884220465;
+    const C86 = 0.8382247055548381;
+    const C87 = 0.9338733031230915;
+    const C88 = 0.3576040459977578;
+    const C89 = 0.2596092046159851;
+    const C90 = 0.965713757217249;
+    const C91 = 0.7776605628587479;
+    const C92 = 0.6286843794577813;
+    const C93 = 0.7714510912715192;
+    const C94 = 0.6362886245847729;
+    const C95 = 0.9981181129001492;
+    const C96 = 0.06132073630220858;
+    const C97 = 0.5370695890326298;
+    const C98 = 0.843537940187827;
+    const C99 = 0.9303175856809415;
+    const C100 = 0.3667549451238308;
+    const C101 = 0.25011597343536635;
+    const C102 = 0.9682158849308758;
+    const C103 = 0.24059863555665045;
+    const C104 = 0.970624693982323;
+    const C105 = 0.765167265622459;
+    const C106 = 0.6438315428897914;
+    const C107 = 0.9974680072993071;
+    const C108 = 0.07111662544264533;
+    const C109 = 0.5287624257583957;
+    const C110 = 0.8487698728784482;
+    const C111 = 0.9266722022935726;
+    const C112 = 0.37587049564494945;
+    const C113 = 0.9229375043106232;
+    const C114 = 0.3849498189853822;
+    const C115 = 0.2310581082806711;
+    const C116 = 0.9729399522055602;
+    const C117 = 0.7588096915597616;
+    const C118 = 0.6513124073706714;
+    const C119 = 0.9967217636558474;
+    const C120 = 0.08090566021470375;
+    const C121 = 0.5204042992610306;
+    const C122 = 0.8539199993621391;
+    t12 = x[96];
+    t5 = (-0.0020066073440204468) * t12;
+    t3 = x[223];
+    t18 = 0.07826440840222601 * t3;
+    t1 = t5 - t18;
+    t16 = x[416];
+    t14 = 0.3090169943749474 * t1;
+    t0 = (-0.07594899582318504) * t16;
+    t17 = t14 + t0;
+    t2 = (-C0) * t1;
+    t8 = (-0.02467732465206355) * t16;
+    t15 = t2 + t8;
+    t11 = x[136];
+    t4 = 0.038615673414421424 * t11;
+    t10 = x[183];
+    t6 = 0.08114841980269193 * t10;
+    t19 = t4 - t6;
+    t7 = x[456];
+    t9 = 0.07227303597195224 * t7;
+    t13 = x[503];
+    t12 = 0.009974119378923667 * t13;
+    t3 = t9 + t12;
+    t5 = C1 * t19;
+    t18 = (-C2) * t3;
+    t14 = t5 + t18;
+    t0 = (-C2) * t19;
+    t1 = (-C1) * t3;
+    t16 = t0 + t1;
+    t2 = x[463];
+    t8 = 0.06681366693752928 * t2;
+    t11 = x[496];
+    t10 = 0.018775250339183078 * t11;
+    t4 = t8 + t10;
+    t6 = x[143];
+    t7 = 0.04858411851028732 * t6;
+    t13 = x[176];
+    t9 = 0.0798911548658402 * t13;
+    t12 = t7 - t9;
+    t5 = (-C3) * t4;
+    t18 = C4 * t12;
+    t19 = t5 + t18;
+    t3 = C4 * t4;
+    t0 = C3 * t12;
+    t1 = t3 + t0;
+    t2 = x[423];
+    t11 = x[103];
+    t8 = 0.002156796701315304 * t11;
+    t10 = x[216];
+    t6 = 0.07854498143942426 * t10;
+    t13 = t8 - t6;
+    t7 = (-0.07658471766874721) * t2;
+    t9 = 0.27144044986507426 * t13;
+    t5 = t7 + t9;
+    t18 = 0.021599124228771985 * t2;
+    t4 = 0.9624552364536473 * t13;
+    t12 = t18 + t4;
+    t3 = x[383];
+    t0 = x[63];
+    t11 = (-0.008633709146849975) * t0;
+    t10 = x[256];
+    t8 = 0.07816870410371515 * t10;
+    t6 = t11 - t8;
+    t7 = (-0.07124066901235263) * t3;
+    t9 = 0.45399049973954675 * t6;
+    t2 = t7 + t9;
+    t13 = 0.03629893390080279 * t3;
+    t18 = 0.8910065241883679 * t6;
+    t4 = t13 + t18;
+    t0 = x[343];
+    t10 = x[23];
+    t11 = (-0.0018062019202143727) * t10;
+    t8 = x[296];
+    t7 = 0.07838974698390234 * t8;
+    t9 = t11 - t7;
+    t3 = (-0.06261317336580488) * t0;
+    t6 = 0.619093949309834 * t9;
+    t13 = t3 + t6;
+    t18 = 0.0493602458492569 * t0;
+    t10 = 0.785316930880745 * t9;
+    t8 = t18 + t10;
+    t11 = x[16];
+    t7 = (-0.0008914256102028861) * t11;
+    t3 = x[303];
+    t6 = 0.07852747567483565 * t3;
+    t0 = t7 - t6;
+    t9 = x[336];
+    t18 = 0.6494480483301837 * t0;
+    t10 = (-0.060520693479048884) * t9;
+    t11 = t18 + t10;
+    t3 = (-0.7604059656000309) * t0;
+    t7 = (-0.05168955537131043) * t9;
+    t6 = t3 + t7;
+    t18 = x[56];
+    t10 = (-0.008003417742740937) * t18;
+    t0 = x[263];
+    t9 = 0.07822155190641425 * t0;
+    t3 = t10 - t9;
+    t7 = x[376];
+    t18 = 0.4886212414969549 * t3;
+    t0 = (-0.06971352410303974) * t7;
+    t10 = t18 + t0;
+    t9 = (-0.8724960070727972) * t3;
+    t18 = (-0.03904144938225839) * t7;
+    t0 = t9 + t18;
+    t3 = t17 + t2;
+    t7 = t15 + t4;
+    t9 = t19 + t11;
+    t18 = t1 + t6;
+    t17 = t17 - t2;
+    t2 = t15 - t4;
+    t15 = t19 - t11;
+    t4 = t1 - t6;
+    t19 = t3 + t9;
+    t11 = t7 + t18;
+    t1 = t17 + t4;
+    t6 = t2 - t15;
+    t3 = t3 - t9;
+    t9 = t7 - t18;
+    t7 = t17 - t4;
+    t18 = t2 + t15;
+    t17 = t14 + t13;
+    t4 = t16 + t8;
+    t2 = t5 + t10;
+    t15 = t12 + t0;
+    t14 = t14 - t13;
+    t13 = t16 - t8;
+    t16 = t5 - t10;
+    t8 = t12 - t0;
+    t5 = t17 + t2;
+    t10 = t4 + t15;
+    t12 = t14 + t8;
+    t0 = t13 - t16;
+    t17 = t17 - t2;
+    t2 = t4 - t15;
+    t4 = t14 - t8;
+    t15 = t13 + t16;
+    t14 = t12 + t0;
+    t8 = t12 - t0;
+    t13 = C5 * t14;
+    t16 = (-C5) * t8;
+    t12 = t4 - t15;
+    t0 = t4 + t15;
+    t14 = (-C5) * t12;
+    t8 = (-C5) * t0;
+    t4 = t19 - t5;
+    t15 = t11 - t10;
+    t12 = t19 + t5;
+    t0 = t11 + t10;
+    t19 = t1 - t13;
+    t5 = t6 - t16;
+    t11 = t1 + t13;
+    t10 = t6 + t16;
+    t1 = t3 - t2;
+    t13 = t9 + t17;
+    t6 = t3 + t2;
+    t16 = t9 - t17;
+    t3 = t7 - t14;
+    t2 = t18 - t8;
+    t9 = t7 + t14;
+    t17 = t18 + t8;
+    re[128] = t12;
+    im[128] = t0;
+    re[148] = t11;
+    im[148] = t10;
+    re[8] = t6;
+    im[8] = t16;
+    re[28] = t9;
+    im[28] = t17;
+    re[48] = t4;
+    im[48] = t15;
+    re[68] = t19;
+    im[68] = t5;
+    re[88] = t1;
+    im[88] = t13;
+    re[108] = t3;
+    im[108] = t2;
+    t7 = x[106];
+    t14 = 0.004322231781754117 * t7;
+    t18 = x[213];
+    t8 = 0.07871777572983324 * t18;
+    t12 = t14 - t8;
+    t0 = x[426];
+    t11 = 0.26197863846333747 * t12;
+    t10 = (-0.07662450311920099) * t0;
+    t6 = t11 + t10;
+    t16 = (-0.9650736723115474) * t12;
+    t9 = (-0.02080046692395697) * t0;
+    t17 = t16 + t9;
+    t4 = x[146];
+    t15 = 0.05276951259189433 * t4;
+    t19 = x[173];
+    t5 = 0.07880387979570969 * t19;
+    t1 = t15 - t5;
+    t13 = x[466];
+    t3 = 0.06375555749304516 * t13;
+    t2 = x[493];
+    t7 = 0.023229600782742582 * t2;
+    t18 = t3 + t7;
+    t14 = C6 * t1;
+    t8 = (-C7) * t18;
+    t11 = t14 + t8;
+    t10 = (-C7) * t1;
+    t12 = (-C6) * t18;
+    t0 = t10 + t12;
+    t16 = x[453];
+    t9 = 0.07394742506852245 * t16;
+    t4 = x[506];
+    t19 = 0.007047155047572928 * t4;
+    t15 = t9 + t19;
+    t5 = x[133];
+    t13 = 0.034387157709965845 * t5;
+    t2 = x[186];
+    t3 = 0.08124242814953461 * t2;
+    t7 = t13 - t3;
+    t14 = (-C8) * t15;
+    t8 = C9 * t7;
+    t1 = t14 + t8;
+    t18 = C9 * t15;
+    t10 = C8 * t7;
+    t12 = t18 + t10;
+    t16 = x[413];
+    t4 = x[93];
+    t9 = (-0.003436879663473097) * t4;
+    t19 = x[226];
+    t5 = 0.07818674997851927 * t19;
+    t2 = t9 - t5;
+    t13 = (-0.07577826211266246) * t16;
+    t3 = 0.3183389280525497 * t2;
+    t14 = t13 + t3;
+    t8 = 0.025447000941656424 * t16;
+    t15 = 0.9479769653775104 * t2;
+    t7 = t8 + t15;
+    t18 = x[373];
+    t10 = x[53];
+    t4 = (-0.0075840412882783445) * t10;
+    t19 = x[266];
+    t9 = 0.07823844498003954 * t19;
+    t5 = t4 - t9;
+    t13 = (-0.06931191325128779) * t18;
+    t3 = 0.4971632662526543 * t5;
+    t16 = t13 + t3;
+    t2 = 0.03971539075031243 * t18;
+    t8 = 0.8676570098195441 * t5;
+    t15 = t2 + t8;
+    t10 = x[333];
+    t19 = x[13];
+    t4 = (-0.0006082496345561968) * t19;
+    t9 = x[306];
+    t13 = 0.07860548799126442 * t9;
+    t3 = t4 - t13;
+    t18 = (-0.059950766577333524) * t10;
+    t5 = 0.6568818989430413 * t3;
+    t2 = t18 + t5;
+    t8 = 0.052229328680591144 * t10;
+    t19 = 0.7539934819618695 * t3;
+    t9 = t8 + t19;
+    t4 = x[26];
+    t13 = (-0.002300519434810679) * t4;
+    t18 = x[293];
+    t5 = 0.07834978302028017 * t18;
+    t10 = t13 - t5;
+    t3 = x[346];
+    t8 = 0.6113544074368165 * t10;
+    t19 = (-0.06312692407487464) * t3;
+    t4 = t8 + t19;
+    t18 = (-0.7913569286406602) * t10;
+    t13 = (-0.04876803609642518) * t3;
+    t5 = t18 + t13;
+    t8 = x[66];
+    t19 = (-0.008730035710984) * t8;
+    t10 = x[253];
+    t3 = 0.07814287178606243 * t10;
+    t18 = t19 - t3;
+    t13 = x[386];
+    t8 = 0.4452213258854682 * t18;
+    t10 = (-0.07161726134631935) * t13;
+    t19 = t8 + t10;
+    t3 = (-0.895420555368697) * t18;
+    t8 = (-0.03560956006841417) * t13;
+    t10 = t3 + t8;
+    t18 = t6 + t16;
+    t13 = t17 + t15;
+    t3 = t1 + t4;
+    t8 = t12 + t5;
+    t6 = t6 - t16;
+    t16 = t17 - t15;
+    t17 = t1 - t4;
+    t15 = t12 - t5;
+    t1 = t18 + t3;
+    t4 = t13 + t8;
+    t12 = t6 + t15;
+    t5 = t16 - t17;
+    t18 = t18 - t3;
+    t3 = t13 - t8;
+    t13 = t6 - t15;
+    t8 = t16 + t17;
+    t6 = t11 + t2;
+    t15 = t0 + t9;
+    t16 = t14 + t19;
+    t17 = t7 + t10;
+    t11 = t11 - t2;
+    t2 = t0 - t9;
+    t0 = t14 - t19;
+    t9 = t7 - t10;
+    t14 = t6 + t16;
+    t19 = t15 + t17;
+    t7 = t11 + t9;
+    t10 = t2 - t0;
+    t6 = t6 - t16;
+    t16 = t15 - t17;
+    t15 = t11 - t9;
+    t17 = t2 + t0;
+    t11 = t7 + t10;
+    t9 = t7 - t10;
+    t2 = C5 * t11;
+    t0 = (-C5) * t9;
+    t7 = t15 - t17;
+    t10 = t15 + t17;
+    t11 = (-C5) * t7;
+    t9 = (-C5) * t10;
+    t15 = t1 - t14;
+    t17 = t4 - t19;
+    t7 = t1 + t14;
+    t10 = t4 + t19;
+    t1 = t12 - t2;
+    t14 = t5 - t0;
+    t4 = t12 + t2;
+    t19 = t5 + t0;
+    t12 = t18 - t16;
+    t2 = t3 + t6;
+    t5 = t18 + t16;
+    t0 = t3 - t6;
+    t18 = t13 - t11;
+    t16 = t8 - t9;
+    t3 = t13 + t11;
+    t6 = t8 + t9;
+    t13 = t4 + t19;
+    t11 = C10 * t13;
+    t8 = t4 * (-C11);
+    t9 = t19 * C12;
+    t13 = t11 - t9;
+    t4 = t11 + t8;
+    t19 = t5 + t0;
+    t9 = C13 * t19;
+    t11 = t5 * (-C14);
+    t8 = t0 * C15;
+    t19 = t9 - t8;
+    t5 = t9 + t11;
+    t0 = t3 + t6;
+    t8 = C16 * t0;
+    t9 = t3 * (-C17);
+    t11 = t6 * C18;
+    t0 = t8 - t11;
+    t3 = t8 + t9;
+    t6 = t15 + t17;
+    t11 = t15 - t17;
+    t8 = C5 * t6;
+    t9 = (-C5) * t11;
+    t15 = t1 + t14;
+    t17 = C19 * t15;
+    t6 = t1 * (-C17);
+    t11 = t14 * (-C18);
+    t15 = t17 - t11;
+    t1 = t17 + t6;
+    t14 = t12 + t2;
+    t11 = C20 * t14;
+    t17 = t12 * (-C14);
+    t6 = t2 * (-C15);
+    t14 = t11 - t6;
+    t12 = t11 + t17;
+    t2 = t18 + t16;
+    t6 = C21 * t2;
+    t11 = t18 * (-C11);
+    t17 = t16 * (-C12);
+    t2 = t6 - t17;
+    t18 = t6 + t11;
+    re[133] = t7;
+    im[133] = t10;
+    re[153] = t13;
+    im[153] = t4;
+    re[13] = t19;
+    im[13] = t5;
+    re[33] = t0;
+    im[33] = t3;
+    re[53] = t8;
+    im[53] = t9;
+    re[73] = t15;
+    im[73] = t1;
+    re[93] = t14;
+    im[93] = t12;
+    re[113] = t2;
+    im[113] = t18;
+    t16 = x[116];
+    t17 = 0.013313517900273962 * t16;
+    t6 = x[203];
+    t11 = 0.07961123245853997 * t6;
+    t7 = t17 - t11;
+    t10 = x[436];
+    t13 = 0.21430915306505077 * t7;
+    t4 = (-0.07668248021954327) * t10;
+    t19 = t13 + t4;
+    t5 = (-0.9767658813208724) * t7;
+    t0 = (-0.01682466362211034) * t10;
+    t3 = t5 + t0;
+    t8 = x[156];
+    t9 = 0.06544248450873842 * t8;
+    t15 = x[163];
+    t1 = 0.07241345157237726 * t15;
+    t14 = t9 - t1;
+    t12 = x[476];
+    t2 = 0.05062400518738256 * t12;
+    t18 = x[483];
+    t16 = 0.0394872088271444 * t18;
+    t6 = t2 + t16;
+    t17 = C22 * t14;
+    t11 = (-C23) * t6;
+    t13 = t17 + t11;
+    t4 = (-C23) * t14;
+    t7 = (-C22) * t6;
+    t10 = t4 + t7;
+    t5 = x[443];
+    t0 = 0.07735891256880652 * t5;
+    t8 = x[516];
+    t15 = 0.0012061797976135472 * t8;
+    t9 = t0 + t15;
+    t1 = x[123];
+    t12 = 0.021218579288406595 * t1;
+    t18 = x[196];
+    t2 = 0.08046140220484606 * t18;
+    t16 = t12 - t2;
+    t17 = (-C24) * t9;
+    t11 = C25 * t16;
+    t14 = t17 + t11;
+    t6 = C25 * t9;
+    t4 = C24 * t16;
+    t7 = t6 + t4;
+    t5 = x[403];
+    t8 = x[83];
+    t0 = (-0.006856511841418642) * t8;
+    t15 = x[236];
+    t1 = 0.0780650096919715 * t15;
+    t18 = t0 - t1;
+    t12 = (-0.07455444334417452) * t5;
+    t2 = 0.36447049987914965 * t18;
+    t17 = t12 + t2;
+    t11 = 0.02918004664616032 * t5;
+    t9 = 0.9312149347588036 * t18;
+    t16 = t11 + t9;
+    t6 = x[363];
+    t4 = x[43];
+    t8 = (-0.005741950732883771) * t4;
+    t15 = x[276];
+    t0 = 0.07826862367318611 * t15;
+    t1 = t8 - t0;
+    t12 = (-0.06725374056283713) * t6;
+    t2 = 0.5391383229110002 * t1;
+    t5 = t12 + t2;
+    t18 = 0.04305191991446939 * t6;
+    t11 = 0.8422172337162865 * t1;
+    t9 = t18 + t11;
+    t4 = x[323];
+    t15 = x[3];
+    t8 = (-8.906834541416462e-05) * t15;
+    t0 = x[316];
+    t12 = 0.0789299805782335 * t0;
+    t2 = t8 - t12;
+    t6 = (-0.057080148080458) * t4;
+    t1 = 0.6930873625456359 * t2;
+    t18 = t6 + t1;
+    t11 = 0.05488150363367506 * t4;
+    t15 = 0.7208535967029188 * t2;
+    t0 = t11 + t15;
+    t8 = x[36];
+    t12 = (-0.004263260008349076) * t8;
+    t6 = x[283];
+    t1 = 0.07828287390015748 * t6;
+    t4 = t12 - t1;
+    t2 = x[356];
+    t11 = 0.5717879602276122 * t4;
+    t15 = (-0.0654997545002515) * t2;
+    t8 = t11 + t15;
+    t6 = (-0.8204014435255136) * t4;
+    t12 = (-0.04565078635182028) * t2;
+    t1 = t6 + t12;
+    t11 = x[76];
+    t15 = (-0.008167628783349251) * t11;
+    t4 = x[243];
+    t2 = 0.07807065190785197 * t4;
+    t6 = t15 - t2;
+    t12 = x[396];
+    t11 = 0.40074883310314097 * t6;
+    t4 = (-0.07334606016535886) * t12;
+    t15 = t11 + t4;
+    t2 = (-0.916187957117136) * t6;
+    t11 = (-0.03208222482695475) * t12;
+    t4 = t2 + t11;
+    t6 = t19 + t5;
+    t12 = t3 + t9;
+    t2 = t14 + t8;
+    t11 = t7 + t1;
+    t19 = t19 - t5;
+    t5 = t3 - t9;
+    t3 = t14 - t8;
+    t9 = t7 - t1;
+    t14 = t6 + t2;
+    t8 = t12 + t11;
+    t7 = t19 + t9;
+    t1 = t5 - t3;
+    t6 = t6 - t2;
+    t2 = t12 - t11;
+    t12 = t19 - t9;
+    t11 = t5 + t3;
+    t19 = t13 + t18;
+    t9 = t10 + t0;
+    t5 = t17 + t15;
+    t3 = t16 + t4;
+    t13 = t13 - t18;
+    t18 = t10 - t0;
+    t10 = t17 - t15;
+    t0 = t16 - t4;
+    t17 = t19 + t5;
+    t15 = t9 + t3;
+    t16 = t13 + t0;
+    t4 = t18 - t10;
+    t19 = t19 - t5;
+    t5 = t9 - t3;
+    t9 = t13 - t0;
+    t3 = t18 + t10;
+    t13 = t16 + t4;
+    t0 = t16 - t4;
+    t18 = C5 * t13;
+    t10 = (-C5) * t0;
+    t16 = t9 - t3;
+    t4 = t9 + t3;
+    t13 = (-C5) * t16;
+    t0 = (-C5) * t4;
+    t9 = t14 - t17;
+    t3 = t8 - t15;
+    t16 = t14 + t17;
+    t4 = t8 + t15;
+    t14 = t7 - t18;
+    t17 = t1 - t10;
+    t8 = t7 + t18;
+    t15 = t1 + t10;
+    t7 = t6 - t5;
+    t18 = t2 + t19;
+    t1 = t6 + t5;
+    t10 = t2 - t19;
+    t6 = t12 - t13;
+    t5 = t11 - t0;
+    t2 = t12 + t13;
+    t19 = t11 + t0;
+    t12 = t8 + t15;
+    t13 = C13 * t12;
+    t11 = t8 * (-C14);
+    t0 = t15 * C15;
+    t12 = t13 - t0;
+    t8 = t13 + t11;
+    t15 = t1 + t10;
+    t0 = t1 - t10;
+    t13 = C5 * t15;
+    t11 = (-C5) * t0;
+    t1 = t2 + t19;
+    t10 = C20 * t1;
+    t15 = t2 * (-C14);
+    t0 = t19 * (-C15);
+    t1 = t10 - t0;
+    t2 = t10 + t15;
+    t19 = -t9;
+    t0 = t14 + t17;
+    t10 = (-C20) * t0;
+    t15 = t14 * (-C15);
+    t9 = t17 * (-C14);
+    t0 = t10 - t9;
+    t14 = t10 + t15;
+    t17 = t7 - t18;
+    t9 = t7 + t18;
+    t10 = (-C5) * t17;
+    t15 = (-C5) * t9;
+    t7 = t6 + t5;
+    t18 = (-C13) * t7;
+    t17 = t6 * C15;
+    t9 = t5 * (-C14);
+    t7 = t18 - t9;
+    t6 = t18 + t17;
+    re[138] = t16;
+    im[138] = t4;
+    re[158] = t12;
+    im[158] = t8;
+    re[18] = t13;
+    im[18] = t11;
+    re[38] = t1;
+    im[38] = t2;
+    re[58] = t3;
+    im[58] = t19;
+    re[78] = t0;
+    im[78] = t14;
+    re[98] = t10;
+    im[98] = t15;
+    re[118] = t7;
+    im[118] = t6;
+    t5 = x[126];
+    t9 = 0.024971076367611027 * t5;
+    t18 = x[193];
+    t17 = 0.08080439208166479 * t18;
+    t16 = t9 - t17;
+    t4 = x[446];
+    t12 = 0.07661769202193537 * t4;
+    t8 = x[513];
+    t13 = 0.0023608903596866793 * t8;
+    t11 = t12 + t13;
+    t1 = C26 * t16;
+    t2 = (-C27) * t11;
+    t3 = t1 + t2;
+    t19 = (-C27) * t16;
+    t0 = (-C26) * t11;
+    t14 = t19 + t0;
+    t10 = x[473];
+    t15 = 0.05499047041607303 * t10;
+    t7 = x[486];
+    t6 = 0.034520136097357317 * t7;
+    t5 = t15 + t6;
+    t18 = x[153];
+    t9 = 0.06191719555714078 * t18;
+    t17 = x[166];
+    t4 = 0.07478768505676862 * t17;
+    t8 = t9 - t4;
+    t12 = (-C28) * t5;
+    t13 = C29 * t8;
+    t1 = t12 + t13;
+    t2 = C29 * t5;
+    t16 = C28 * t8;
+    t11 = t2 + t16;
+    t19 = x[433];
+    t0 = x[113];
+    t10 = 0.010325635567219847 * t0;
+    t7 = x[206];
+    t15 = 0.07928361901336299 * t7;
+    t6 = t10 - t15;
+    t18 = (-0.07682977901776415) * t19;
+    t17 = 0.22388804785849836 * t6;
+    t9 = t18 + t17;
+    t4 = 0.017649299016985687 * t19;
+    t12 = 0.974614868564045 * t6;
+    t13 = t4 + t12;
+    t5 = x[393];
+    t8 = x[73];
+    t2 = (-0.00848865954933994) * t8;
+    t16 = x[246];
+    t0 = 0.07808737864458444 * t16;
+    t7 = t2 - t0;
+    t10 = (-0.07301192119899103) * t5;
+    t15 = 0.4097240303476953 * t7;
+    t18 = t10 + t15;
+    t17 = 0.03279371435079787 * t5;
+    t19 = 0.9122095257974677 * t7;
+    t6 = t17 + t19;
+    t4 = x[353];
+    t12 = x[33];
+    t8 = (-0.0036380318390345115) * t12;
+    t16 = x[286];
+    t2 = 0.07829442545648338 * t16;
+    t0 = t8 - t2;
+    t10 = (-0.06503883240866334) * t4;
+    t15 = 0.5798145481265136 * t0;
+    t5 = t10 + t15;
+    t7 = 0.04628478853586922 * t4;
+    t17 = 0.8147484825274894 * t0;
+    t19 = t7 + t17;
+    t12 = x[6];
+    t16 = (-0.00018493729943036235) * t12;
+    t8 = x[313];
+    t2 = 0.07882463510461603 * t8;
+    t10 = t16 - t2;
+    t15 = x[326];
+    t4 = 0.6859771119901928 * t10;
+    t0 = (-0.05769318794014031) * t15;
+    t7 = t4 + t0;
+    t17 = (-0.7276231179845748) * t10;
+    t12 = (-0.054391078934251054) * t15;
+    t8 = t17 + t12;
+    t16 = x[46];
+    t2 = (-0.006347861502626827) * t16;
+    t4 = x[273];
+    t0 = 0.07826284774676884 * t4;
+    t10 = t2 - t0;
+    t15 = x[366];
+    t17 = 0.5308440257395095 * t10;
+    t12 = (-0.06767814837063152) * t15;
+    t16 = t17 + t12;
+    t4 = (-0.8474695394742344) * t10;
+    t2 = (-0.04239272217140747) * t15;
+    t0 = t4 + t2;
+    t17 = x[86];
+    t12 = (-0.006034162996387899) * t17;
+    t10 = x[233];
+    t15 = 0.078082512854932 * t10;
+    t4 = t12 - t15;
+    t2 = x[406];
+    t17 = 0.3553109012804161 * t4;
+    t10 = (-0.07482054461132538) * t2;
+    t12 = t17 + t10;
+    t15 = (-0.9347481818282924) * t4;
+    t17 = (-0.028440338967169042) * t2;
+    t10 = t15 + t17;
+    t4 = t3 + t5;
+    t2 = t14 + t19;
+    t15 = t9 + t16;
+    t17 = t13 + t0;
+    t3 = t3 - t5;
+    t5 = t14 - t19;
+    t14 = t9 - t16;
+    t19 = t13 - t0;
+    t9 = t4 + t15;
+    t16 = t2 + t17;
+    t13 = t3 + t19;
+    t0 = t5 - t14;
+    t4 = t4 - t15;
+    t15 = t2 - t17;
+    t2 = t3 - t19;
+    t17 = t5 + t14;
+    t3 = t1 + t7;
+    t19 = t11 + t8;
+    t5 = t18 + t12;
+    t14 = t6 + t10;
+    t1 = t1 - t7;
+    t7 = t11 - t8;
+    t11 = t18 - t12;
+    t8 = t6 - t10;
+    t18 = t3 + t5;
+    t12 = t19 + t14;
+    t6 = t1 + t8;
+    t10 = t7 - t11;
+    t3 = t3 - t5;
+    t5 = t19 - t14;
+    t19 = t1 - t8;
+    t14 = t7 + t11;
+    t1 = t6 + t10;
+    t8 = t6 - t10;
+    t7 = C5 * t1;
+    t11 = (-C5) * t8;
+    t6 = t19 - t14;
+    t10 = t19 + t14;
+    t1 = (-C5) * t6;
+    t8 = (-C5) * t10;
+    t19 = t9 - t18;
+    t14 = t16 - t12;
+    t6 = t9 + t18;
+    t10 = t16 + t12;
+    t9 = t13 - t7;
+    t18 = t0 - t11;
+    t16 = t13 + t7;
+    t12 = t0 + t11;
+    t13 = t4 - t5;
+    t7 = t15 + t3;
+    t0 = t4 + t5;
+    t11 = t15 - t3;
+    t4 = t2 - t1;
+    t5 = t17 - t8;
+    t15 = t2 + t1;
+    t3 = t17 + t8;
+    t2 = t16 + t12;
+    t1 = C16 * t2;
+    t17 = t16 * (-C17);
+    t8 = t12 * C18;
+    t2 = t1 - t8;
+    t16 = t1 + t17;
+    t12 = t0 + t11;
+    t8 = C20 * t12;
+    t1 = t0 * (-C14);
+    t17 = t11 * (-C15);
+    t12 = t8 - t17;
+    t0 = t8 + t1;
+    t11 = t15 + t3;
+    t17 = (-C21) * t11;
+    t8 = t15 * (-C12);
+    t1 = t3 * (-C11);
+    t11 = t17 - t1;
+    t15 = t17 + t8;
+    t3 = t19 - t14;
+    t1 = t19 + t14;
+    t17 = (-C5) * t3;
+    t8 = (-C5) * t1;
+    t19 = t9 + t18;
+    t14 = (-C10) * t19;
+    t3 = t9 * C12;
+    t1 = t18 * (-C11);
+    t19 = t14 - t1;
+    t9 = t14 + t3;
+    t18 = t13 + t7;
+    t1 = (-C13) * t18;
+    t14 = t13 * C14;
+    t3 = t7 * (-C15);
+    t18 = t1 - t3;
+    t13 = t1 + t14;
+    t7 = t4 + t5;
+    t3 = (-C19) * t7;
+    t1 = t4 * C17;
+    t14 = t5 * C18;
+    t7 = t3 - t14;
+    t4 = t3 + t1;
+    re[143] = t6;
+    im[143] = t10;
+    re[3] = t2;
+    im[3] = t16;
+    re[23] = t12;
+    im[23] = t0;
+    re[43] = t11;
+    im[43] = t15;
+    re[63] = t17;
+    im[63] = t8;
+    re[83] = t19;
+    im[83] = t9;
+    re[103] = t18;
+    im[103] = t13;
+    re[123] = t7;
+    im[123] = t4;
+    t5 = re[128];
+    t14 = im[128];
+    t3 = re[133];
+    t1 = im[133];
+    t6 = re[138];
+    t10 = im[138];
+    t2 = re[143];
+    t16 = im[143];
+    t12 = t5 + t6;
+    t0 = t14 + t10;
+    t11 = t3 + t2;
+    t15 = t1 + t16;
+    t17 = t5 - t6;
+    t8 = t14 - t10;
+    t19 = t3 - t2;
+    t9 = t1 - t16;
+    t18 = t12 + t11;
+    t13 = t0 + t15;
+    t7 = t17 + t9;
+    t4 = t8 - t19;
+    t5 = t12 - t11;
+    t6 = t0 - t15;
+    t14 = t17 - t9;
+    t10 = t8 + t19;
+    re[128] = t18;
+    im[128] = t13;
+    re[133] = t7;
+    im[133] = t4;
+    re[138] = t5;
+    im[138] = t6;
+    re[143] = t14;
+    im[143] = t10;
+    t3 = re[148];
+    t2 = im[148];
+    t1 = re[153];
+    t16 = im[153];
+    t12 = re[158];
+    t11 = im[158];
+    t0 = re[3];
+    t15 = im[3];
+    t17 = t3 + t12;
+    t9 = t2 + t11;
+    t8 = t1 + t0;
+    t19 = t16 + t15;
+    t18 = t3 - t12;
+    t13 = t2 - t11;
+    t7 = t1 - t0;
+    t4 = t16 - t15;
+    t5 = t17 + t8;
+    t6 = t9 + t19;
+    t14 = t18 + t4;
+    t10 = t13 - t7;
+    t3 = t17 - t8;
+    t12 = t9 - t19;
+    t2 = t18 - t4;
+    t11 = t13 + t7;
+    re[148] = t5;
+    im[148] = t6;
+    re[153] = t14;
+    im[153] = t10;
+    re[158] = t3;
+    im[158] = t12;
+    re[3] = t2;
+    im[3] = t11;
+    t1 = re[8];
+    t0 = im[8];
+    t16 = re[13];
+    t15 = im[13];
+    t17 = re[18];
+    t8 = im[18];
+    t9 = re[23];
+    t19 = im[23];
+    t18 = t1 + t17;
+    t4 = t0 + t8;
+    t13 = t16 + t9;
+    t7 = t15 + t19;
+    t5 = t1 - t17;
+    t6 = t0 - t8;
+    t14 = t16 - t9;
+    t10 = t15 - t19;
+    t3 = t18 + t13;
+    t12 = t4 + t7;
+    t2 = t5 + t10;
+    t11 = t6 - t14;
+    t1 = t18 - t13;
+    t17 = t4 - t7;
+    t0 = t5 - t10;
+    t8 = t6 + t14;
+    re[8] = t3;
+    im[8] = t12;
+    re[13] = t2;
+    im[13] = t11;
+    re[18] = t1;
+    im[18] = t17;
+    re[23] = t0;
+    im[23] = t8;
+    t16 = re[28];
+    t9 = im[28];
+    t15 = re[33];
+    t19 = im[33];
+    t18 = re[38];
+    t13 = im[38];
+    t4 = re[43];
+    t7 = im[43];
+    t5 = t16 + t18;
+    t10 = t9 + t13;
+    t6 = t15 + t4;
+    t14 = t19 + t7;
+    t3 = t16 - t18;
+    t12 = t9 - t13;
+    t2 = t15 - t4;
+    t11 = t19 - t7;
+    t1 = t5 + t6;
+    t17 = t10 + t14;
+    t0 = t3 + t11;
+    t8 = t12 - t2;
+    t16 = t5 - t6;
+    t18 = t10 - t14;
+    t9 = t3 - t11;
+    t13 = t12 + t2;
+    re[28] = t1;
+    im[28] = t17;
+    re[33] = t0;
+    im[33] = t8;
+    re[38] = t16;
+    im[38] = t18;
+    re[43] = t9;
+    im[43] = t13;
+    t15 = re[48];
+    t4 = im[48];
+    t19 = re[53];
+    t7 = im[53];
+    t5 = re[58];
+    t6 = im[58];
+    t10 = re[63];
+    t14 = im[63];
+    t3 = t15 + t5;
+    t11 = t4 + t6;
+    t12 = t19 + t10;
+    t2 = t7 + t14;
+    t1 = t15 - t5;
+    t17 = t4 - t6;
+    t0 = t19 - t10;
+    t8 = t7 - t14;
+    t16 = t3 + t12;
+    t18 = t11 + t2;
+    t9 = t1 + t8;
+    t13 = t17 - t0;
+    t15 = t3 - t12;
+    t5 = t11 - t2;
+    t4 = t1 - t8;
+    t6 = t17 + t0;
+    re[48] = t16;
+    im[48] = t18;
+    re[53] = t9;
+    im[53] = t13;
+    re[58] = t15;
+    im[58] = t5;
+    re[63] = t4;
+    im[63] = t6;
+    t19 = re[68];
+    t10 = im[68];
+    t7 = re[73];
+    t14 = im[73];
+    t3 = re[78];
+    t12 = im[78];
+    t11 = re[83];
+    t2 = im[83];
+    t1 = t19 + t3;
+    t8 = t10 + t12;
+    t17 = t7 + t11;
+    t0 = t14 + t2;
+    t16 = t19 - t3;
+    t18 = t10 - t12;
+    t9 = t7 - t11;
+    t13 = t14 - t2;
+    t15 = t1 + t17;
+    t5 = t8 + t0;
+    t4 = t16 + t13;
+    t6 = t18 - t9;
+    t19 = t1 - t17;
+    t3 = t8 - t0;
+    t10 = t16 - t13;
+    t12 = t18 + t9;
+    re[68] = t15;
+    im[68] = t5;
+    re[73] = t4;
+    im[73] = t6;
+    re[78] = t19;
+    im[78] = t3;
+    re[83] = t10;
+    im[83] = t12;
+    t7 = re[88];
+    t11 = im[88];
+    t14 = re[93];
+    t2 = im[93];
+    t1 = re[98];
+    t17 = im[98];
+    t8 = re[103];
+    t0 = im[103];
+    t16 = t7 + t1;
+    t13 = t11 + t17;
+    t18 = t14 + t8;
+    t9 = t2 + t0;
+    t15 = t7 - t1;
+    t5 = t11 - t17;
+    t4 = t14 - t8;
+    t6 = t2 - t0;
+    t19 = t16 + t18;
+    t3 = t13 + t9;
+    t10 = t15 + t6;
+    t12 = t5 - t4;
+    t7 = t16 - t18;
+    t1 = t13 - t9;
+    t11 = t15 - t6;
+    t17 = t5 + t4;
+    re[88] = t19;
+    im[88] = t3;
+    re[93] = t10;
+    im[93] = t12;
+    re[98] = t7;
+    im[98] = t1;
+    re[103] = t11;
+    im[103] = t17;
+    t14 = re[108];
+    t8 = im[108];
+    t2 = re[113];
+    t0 = im[113];
+    t16 = re[118];
+    t18 = im[118];
+    t13 = re[123];
+    t9 = im[123];
+    t15 = t14 + t16;
+    t6 = t8 + t18;
+    t5 = t2 + t13;
+    t4 = t0 + t9;
+    t19 = t14 - t16;
+    t3 = t8 - t18;
+    t10 = t2 - t13;
+    t12 = t0 - t9;
+    t7 = t15 + t5;
+    t1 = t6 + t4;
+    t11 = t19 + t12;
+    t17 = t3 - t10;
+    t14 = t15 - t5;
+    t16 = t6 - t4;
+    t8 = t19 - t12;
+    t18 = t3 + t10;
+    re[108] = t7;
+    im[108] = t1;
+    re[113] = t11;
+    im[113] = t17;
+    re[118] = t14;
+    im[118] = t16;
+    re[123] = t8;
+    im[123] = t18;
+    t2 = re[0];
+    t13 = im[0];
+    t0 = re[32];
+    t9 = im[32];
+    t15 = re[64];
+    t5 = im[64];
+    t6 = re[96];
+    t4 = im[96];
+    t19 = re[128];
+    t12 = im[128];
+    t3 = t0 + t19;
+    t10 = t9 + t12;
+    t7 = t15 + t6;
+    t1 = t5 + t4;
+    t11 = t0 - t19;
+    t17 = t9 - t12;
+    t14 = t15 - t6;
+    t16 = t5 - t4;
+    t8 = t3 + t7;
+    t18 = t10 + t1;
+    t0 = t3 - t7;
+    t19 = C30 * t0;
+    t9 = t10 - t1;
+    t12 = C30 * t9;
+    t15 = C31 * t8;
+    t6 = t2 - t15;
+    t5 = C31 * t18;
+    t4 = t13 - t5;
+    t3 = t6 + t19;
+    t7 = t4 + t12;
+    t0 = t6 - t19;
+    t10 = t4 - t12;
+    t1 = C0 * t11;
+    t9 = C32 * t14;
+    t15 = t1 + t9;
+    t5 = C0 * t17;
+    t6 = C32 * t16;
+    t19 = t5 + t6;
+    t4 = C32 * t11;
+    t12 = C0 * t14;
+    t1 = t4 - t12;
+    t9 = C32 * t17;
+    t5 = C0 * t16;
+    t6 = t9 - t5;
+    t11 = t2 + t8;
+    t14 = t13 + t18;
+    t4 = t3 + t19;
+    t12 = t7 - t15;
+    t17 = t0 + t6;
+    t16 = t10 - t1;
+    t9 = t0 - t6;
+    t5 = t10 + t1;
+    t2 = t3 - t19;
+    t8 = t7 + t15;
+    t13 = C33 * t11;
+    t18 = C34 * t14;
+    t0 = t13 + t18;
+    t6 = C34 * t11;
+    t10 = (-C33) * t14;
+    t1 = t6 + t10;
+    X[0] = t0;
+    X[319] = t1;
+    t3 = C35 * t4;
+    t19 = C36 * t12;
+    t7 = t3 + t19;
+    t15 = C36 * t4;
+    t13 = (-C35) * t12;
+    t18 = t15 + t13;
+    X[192] = t7;
+    X[127] = t18;
+    t11 = C37 * t17;
+    t14 = C38 * t16;
+    t6 = t11 + t14;
+    t10 = C38 * t17;
+    t0 = (-C37) * t16;
+    t1 = t10 + t0;
+    X[64] = t6;
+    X[255] = t1;
+    t3 = C39 * t9;
+    t19 = C40 * t5;
+    t4 = t3 + t19;
+    t12 = C40 * t9;
+    t15 = (-C39) * t5;
+    t13 = t12 + t15;
+    X[256] = t4;
+    X[63] = t13;
+    t7 = C41 * t2;
+    t18 = C42 * t8;
+    t11 = t7 + t18;
+    t14 = C42 * t2;
+    t17 = (-C41) * t8;
+    t16 = t14 + t17;
+    X[128] = t11;
+    X[191] = t16;
+    t10 = re[20];
+    t0 = im[20];
+    t6 = re[52];
+    t1 = im[52];
+    t3 = re[84];
+    t19 = im[84];
+    t9 = re[116];
+    t5 = im[116];
+    t12 = re[148];
+    t15 = im[148];
+    t4 = t6 + t12;
+    t13 = t1 + t15;
+    t7 = t3 + t9;
+    t18 = t19 + t5;
+    t2 = t6 - t12;
+    t8 = t1 - t15;
+    t14 = t3 - t9;
+    t17 = t19 - t5;
+    t11 = t4 + t7;
+    t16 = t13 + t18;
+    t6 = t4 - t7;
+    t12 = C30 * t6;
+    t1 = t13 - t18;
+    t15 = C30 * t1;
+    t3 = C31 * t11;
+    t9 = t10 - t3;
+    t19 = C31 * t16;
+    t5 = t0 - t19;
+    t4 = t9 + t12;
+    t7 = t5 + t15;
+    t6 = t9 - t12;
+    t13 = t5 - t15;
+    t18 = C0 * t2;
+    t1 = C32 * t14;
+    t3 = t18 + t1;
+    t19 = C0 * t8;
+    t9 = C32 * t17;
+    t12 = t19 + t9;
+    t5 = C32 * t2;
+    t15 = C0 * t14;
+    t18 = t5 - t15;
+    t1 = C32 * t8;
+    t19 = C0 * t17;
+    t9 = t1 - t19;
+    t2 = t10 + t11;
+    t14 = t0 + t16;
+    t5 = t4 + t12;
+    t15 = t7 - t3;
+    t8 = t6 + t9;
+    t17 = t13 - t18;
+    t1 = t6 - t9;
+    t19 = t13 + t18;
+    t10 = t4 - t12;
+    t11 = t7 + t3;
+    t0 = C43 * t2;
+    t16 = C44 * t14;
+    t6 = t0 + t16;
+    t9 = C44 * t2;
+    t13 = (-C43) * t14;
+    t18 = t9 + t13;
+    X[130] = t6;
+    X[189] = t18;
+    t4 = C45 * t5;
+    t12 = C46 * t15;
+    t7 = t4 + t12;
+    t3 = C46 * t5;
+    t0 = (-C45) * t15;
+    t16 = t3 + t0;
+    X[2] = t7;
+    X[317] = t16;
+    t2 = C47 * t8;
+    t14 = C48 * t17;
+    t9 = t2 + t14;
+    t13 = C48 * t8;
+    t6 = (-C47) * t17;
+    t18 = t13 + t6;
+    X[194] = t9;
+    X[125] = t18;
+    t4 = C49 * t1;
+    t12 = C50 * t19;
+    t5 = t4 + t12;
+    t15 = C50 * t1;
+    t3 = (-C49) * t19;
+    t0 = t15 + t3;
+    X[66] = t5;
+    X[253] = t0;
+    t7 = C51 * t10;
+    t16 = C52 * t11;
+    t2 = t7 + t16;
+    t14 = C52 * t10;
+    t8 = (-C51) * t11;
+    t17 = t14 + t8;
+    X[258] = t2;
+    X[61] = t17;
+    t13 = re[40];
+    t6 = im[40];
+    t9 = re[72];
+    t18 = im[72];
+    t4 = re[104];
+    t12 = im[104];
+    t1 = re[136];
+    t19 = im[136];
+    t15 = re[8];
+    t3 = im[8];
+    t5 = t9 + t15;
+    t0 = t18 + t3;
+    t7 = t4 + t1;
+    t16 = t12 + t19;
+    t10 = t9 - t15;
+    t11 = t18 - t3;
+    t14 = t4 - t1;
+    t8 = t12 - t19;
+    t2 = t5 + t7;
+    t17 = t0 + t16;
+    t9 = t5 - t7;
+    t15 = C30 * t9;
+    t18 = t0 - t16;
+    t3 = C30 * t18;
+    t4 = C31 * t2;
+    t1 = t13 - t4;
+    t12 = C31 * t17;
+    t19 = t6 - t12;
+    t5 = t1 + t15;
+    t7 = t19 + t3;
+    t9 = t1 - t15;
+    t0 = t19 - t3;
+    t16 = C0 * t10;
+    t18 = C32 * t14;
+    t4 = t16 + t18;
+    t12 = C0 * t11;
+    t1 = C32 * t8;
+    t15 = t12 + t1;
+    t19 = C32 * t10;
+    t3 = C0 * t14;
+    t16 = t19 - t3;
+    t18 = C32 * t11;
+    t12 = C0 * t8;
+    t1 = t18 - t12;
+    t10 = t13 + t2;
+    t14 = t6 + t17;
+    t19 = t5 + t15;
+    t3 = t7 - t4;
+    t11 = t9 + t1;
+    t8 = t0 - t16;
+    t18 = t9 - t1;
+    t12 = t0 + t16;
+    t13 = t5 - t15;
+    t2 = t7 + t4;
+    t6 = C53 * t10;
+    t17 = C54 * t14;
+    t9 = t6 + t17;
+    t1 = C54 * t10;
+    t0 = (-C53) * t14;
+    t16 = t1 + t0;
+    X[260] = t9;
+    X[59] = t16;
+    t5 = C55 * t19;
+    t15 = C56 * t3;
+    t7 = t5 + t15;
+    t4 = C56 * t19;
+    t6 = (-C55) * t3;
+    t17 = t4 + t6;
+    X[132] = t7;
+    X[187] = t17;
+    t10 = C57 * t11;
+    t14 = C58 * t8;
+    t1 = t10 + t14;
+    t0 = C58 * t11;
+    t9 = (-C57) * t8;
+    t16 = t0 + t9;
+    X[4] = t1;
+    X[315] = t16;
+    t5 = C59 * t18;
+    t15 = C60 * t12;
+    t19 = t5 + t15;
+    t3 = C60 * t18;
+    t4 = (-C59) * t12;
+    t6 = t3 + t4;
+    X[196] = t19;
+    X[123] = t6;
+    t7 = C61 * t13;
+    t17 = C62 * t2;
+    t10 = t7 + t17;
+    t14 = C62 * t13;
+    t11 = (-C61) * t2;
+    t8 = t14 + t11;
+    X[68] = t10;
+    X[251] = t8;
+    t0 = re[60];
+    t9 = im[60];
+    t1 = re[92];
+    t16 = im[92];
+    t5 = re[124];
+    t15 = im[124];
+    t18 = re[156];
+    t12 = im[156];
+    t3 = re[28];
+    t4 = im[28];
+    t19 = t1 + t3;
+    t6 = t16 + t4;
+    t7 = t5 + t18;
+    t17 = t15 + t12;
+    t13 = t1 - t3;
+    t2 = t16 - t4;
+    t14 = t5 - t18;
+    t11 = t15 - t12;
+    t10 = t19 + t7;
+    t8 = t6 + t17;
+    t1 = t19 - t7;
+    t3 = C30 * t1;
+    t16 = t6 - t17;
+    t4 = C30 * t16;
+    t5 = C31 * t10;
+    t18 = t0 - t5;
+    t15 = C31 * t8;
+    t12 = t9 - t15;
+    t19 = t18 + t3;
+    t7 = t12 + t4;
+    t1 = t18 - t3;
+    t6 = t12 - t4;
+    t17 = C0 * t13;
+    t16 = C32 * t14;
+    t5 = t17 + t16;
+    t15 = C0 * t2;
+    t18 = C32 * t11;
+    t3 = t15 + t18;
+    t12 = C32 * t13;
+    t4 = C0 * t14;
+    t17 = t12 - t4;
+    t16 = C32 * t2;
+    t15 = C0 * t11;
+    t18 = t16 - t15;
+    t13 = t0 + t10;
+    t14 = t9 + t8;
+    t12 = t19 + t3;
+    t4 = t7 - t5;
+    t2 = t1 + t18;
+    t11 = t6 - t17;
+    t16 = t1 - t18;
+    t15 = t6 + t17;
+    t0 = t19 - t3;
+    t10 = t7 + t5;
+    t9 = C63 * t13;
+    t8 = C64 * t14;
+    t1 = t9 + t8;
+    t18 = C64 * t13;
+    t6 = (-C63) * t14;
+    t17 = t18 + t6;
+    X[70] = t1;
+    X[249] = t17;
+    t19 = C65 * t12;
+    t3 = C66 * t4;
+    t7 = t19 + t3;
+    t5 = C66 * t12;
+    t9 = (-C65) * t4;
+    t8 = t5 + t9;
+    X[262] = t7;
+    X[57] = t8;
+    t13 = C67 * t2;
+    t14 = C68 * t11;
+    t18 = t13 + t14;
+    t6 = C68 * t2;
+    t1 = (-C67) * t11;
+    t17 = t6 + t1;
+    X[134] = t18;
+    X[185] = t17;
+    t19 = C69 * t16;
+    t3 = C70 * t15;
+    t12 = t19 + t3;
+    t4 = C70 * t16;
+    t5 = (-C69) * t15;
+    t9 = t4 + t5;
+    X[6] = t12;
+    X[313] = t9;
+    t7 = C71 * t0;
+    t8 = C72 * t10;
+    t13 = t7 + t8;
+    t14 = C72 * t0;
+    t2 = (-C71) * t10;
+    t11 = t14 + t2;
+    X[198] = t13;
+    X[121] = t11;
+    t6 = re[80];
+    t1 = im[80];
+    t18 = re[112];
+    t17 = im[112];
+    t19 = re[144];
+    t3 = im[144];
+    t16 = re[16];
+    t15 = im[16];
+    t4 = re[48];
+    t5 = im[48];
+    t12 = t18 + t4;
+    t9 = t17 + t5;
+    t7 = t19 + t16;
+    t8 = t3 + t15;
+    t0 = t18 - t4;
+    t10 = t17 - t5;
+    t14 = t19 - t16;
+    t2 = t3 - t15;
+    t13 = t12 + t7;
+    t11 = t9 + t8;
+    t18 = t12 - t7;
+    t4 = C30 * t18;
+    t17 = t9 - t8;
+    t5 = C30 * t17;
+    t19 = C31 * t13;
+    t16 = t6 - t19;
+    t3 = C31 * t11;
+    t15 = t1 - t3;
+    t12 = t16 + t4;
+    t7 = t15 + t5;
+    t18 = t16 - t4;
+    t9 = t15 - t5;
+    t8 = C0 * t0;
+    t17 = C32 * t14;
+    t19 = t8 + t17;
+    t3 = C0 * t10;
+    t16 = C32 * t2;
+    t4 = t3 + t16;
+    t15 = C32 * t0;
+    t5 = C0 * t14;
+    t8 = t15 - t5;
+    t17 = C32 * t10;
+    t3 = C0 * t2;
+    t16 = t17 - t3;
+    t0 = t6 + t13;
+    t14 = t1 + t11;
+    t15 = t12 + t4;
+    t5 = t7 - t19;
+    t10 = t18 + t16;
+    t2 = t9 - t8;
+    t17 = t18 - t16;
+    t3 = t9 + t8;
+    t6 = t12 - t4;
+    t13 = t7 + t19;
+    t1 = C73 * t0;
+    t11 = C74 * t14;
+    t18 = t1 + t11;
+    t16 = C74 * t0;
+    t9 = (-C73) * t14;
+    t8 = t16 + t9;
+    X[200] = t18;
+    X[119] = t8;
+    t12 = C75 * t15;
+    t4 = C76 * t5;
+    t7 = t12 + t4;
+    t19 = C76 * t15;
+    t1 = (-C75) * t5;
+    t11 = t19 + t1;
+    X[72] = t7;
+    X[247] = t11;
+    t0 = C77 * t10;
+    t14 = C78 * t2;
+    t16 = t0 + t14;
+    t9 = C78 * t10;
+    t18 = (-C77) * t2;
+    t8 = t9 + t18;
+    X[264] = t16;
+    X[55] = t8;
+    t12 = C79 * t17;
+    t4 = C80 * t3;
+    t15 = t12 + t4;
+    t5 = C80 * t17;
+    t19 = (-C79) * t3;
+    t1 = t5 + t19;
+    X[136] = t15;
+    X[183] = t1;
+    t7 = C81 * t6;
+    t11 = C82 * t13;
+    t0 = t7 + t11;
+    t14 = C82 * t6;
+    t10 = (-C81) * t13;
+    t2 = t14 + t10;
+    X[8] = t0;
+    X[311] = t2;
+    t9 = re[100];
+    t18 = im[100];
+    t16 = re[132];
+    t8 = im[132];
+    t12 = re[4];
+    t4 = im[4];
+    t17 = re[36];
+    t3 = im[36];
+    t5 = re[68];
+    t19 = im[68];
+    t15 = t16 + t5;
+    t1 = t8 + t19;
+    t7 = t12 + t17;
+    t11 = t4 + t3;
+    t6 = t16 - t5;
+    t13 = t8 - t19;
+    t14 = t12 - t17;
+    t10 = t4 - t3;
+    t0 = t15 + t7;
+    t2 = t1 + t11;
+    t16 = t15 - t7;
+    t5 = C30 * t16;
+    t8 = t1 - t11;
+    t19 = C30 * t8;
+    t12 = C31 * t0;
+    t17 = t9 - t12;
+    t4 = C31 * t2;
+    t3 = t18 - t4;
+    t15 = t17 + t5;
+    t7 = t3 + t19;
+    t16 = t17 - t5;
+    t1 = t3 - t19;
+    t11 = C0 * t6;
+    t8 = C32 * t14;
+    t12 = t11 + t8;
+    t4 = C0 * t13;
+    t17 = C32 * t10;
+    t5 = t4 + t17;
+    t3 = C32 * t6;
+    t19 = C0 * t14;
+    t11 = t3 - t19;
+    t8 = C32 * t13;
+    t4 = C0 * t10;
+    t17 = t8 - t4;
+    t6 = t9 + t0;
+    t14 = t18 + t2;
+    t3 = t15 + t5;
+    t19 = t7 - t12;
+    t13 = t16 + t17;
+    t10 = t1 - t11;
+    t8 = t16 - t17;
+    t4 = t1 + t11;
+    t9 = t15 - t5;
+    t0 = t7 + t12;
+    t18 = C83 * t6;
+    t2 = C84 * t14;
+    t16 = t18 + t2;
+    t17 = C84 * t6;
+    t1 = (-C83) * t14;
+    t11 = t17 + t1;
+    X[10] = t16;
+    X[309] = t11;
+    t15 = C85 * t3;
+    t5 = C86 * t19;
+    t7 = t15 + t5;
+    t12 = C86 * t3;
+    t18 = (-C85) * t19;
+    t2 = t12 + t18;
+    X[202] = t7;
+    X[117] = t2;
+    t6 = C87 * t13;
+    t14 = C88 * t10;
+    t17 = t6 + t14;
+    t1 = C88 * t13;
+    t16 = (-C87) * t10;
+    t11 = t1 + t16;
+    X[74] = t17;
+    X[245] = t11;
+    t15 = C89 * t8;
+    t5 = C90 * t4;
+    t3 = t15 + t5;
+    t19 = C90 * t8;
+    t12 = (-C89) * t4;
+    t18 = t19 + t12;
+    X[266] = t3;
+    X[53] = t18;
+    t7 = C91 * t9;
+    t2 = C92 * t0;
+    t6 = t7 + t2;
+    t14 = C92 * t9;
+    t13 = (-C91) * t0;
+    t10 = t14 + t13;
+    X[138] = t6;
+    X[181] = t10;
+    t1 = re[120];
+    t16 = im[120];
+    t17 = re[152];
+    t11 = im[152];
+    t15 = re[24];
+    t5 = im[24];
+    t8 = re[56];
+    t4 = im[56];
+    t19 = re[88];
+    t12 = im[88];
+    t3 = t17 + t19;
+    t18 = t11 + t12;
+    t7 = t15 + t8;
+    t2 = t5 + t4;
+    t9 = t17 - t19;
+    t0 = t11 - t12;
+    t14 = t15 - t8;
+    t13 = t5 - t4;
+    t6 = t3 + t7;
+    t10 = t18 + t2;
+    t17 = t3 - t7;
+    t19 = C30 * t17;
+    t11 = t18 - t2;
+    t12 = C30 * t11;
+    t15 = C31 * t6;
+    t8 = t1 - t15;
+    t5 = C31 * t10;
+    t4 = t16 - t5;
+    t3 = t8 + t19;
+    t7 = t4 + t12;
+    t17 = t8 - t19;
+    t18 = t4 - t12;
+    t2 = C0 * t9;
+    t11 = C32 * t14;
+    t15 = t2 + t11;
+    t5 = C0 * t0;
+    t8 = C32 * t13;
+    t19 = t5 + t8;
+    t4 = C32 * t9;
+    t12 = C0 * t14;
+    t2 = t4 - t12;
+    t11 = C32 * t0;
+    t5 = C0 * t13;
+    t8 = t11 - t5;
+    t9 = t1 + t6;
+    t14 = t16 + t10;
+    t4 = t3 + t19;
+    t12 = t7 - t15;
+    t0 = t17 + t8;
+    t13 = t18 - t2;
+    t11 = t17 - t8;
+    t5 = t18 + t2;
+    t1 = t3 - t19;
+    t6 = t7 + t15;
+    t16 = C93 * t9;
+    t10 = C94 * t14;
+    t17 = t16 + t10;
+    t8 = C94 * t9;
+    t18 = (-C93) * t14;
+    t2 = t8 + t18;
+    X[140] = t17;
+    X[179] = t2;
+    t3 = C95 * t4;
+    t19 = C96 * t12;
+    t7 = t3 + t19;
+    t15 = C96 * t4;
+    t16 = (-C95) * t12;
+    t10 = t15 + t16;
+    X[12] = t7;
+    X[307] = t10;
+    t9 = C97 * t0;
+    t14 = C98 * t13;
+    t8 = t9 + t14;
+    t18 = C98 * t0;
+    t17 = (-C97) * t13;
+    t2 = t18 + t17;
+    X[204] = t8;
+    X[115] = t2;
+    t3 = C99 * t11;
+    t19 = C100 * t5;
+    t4 = t3 + t19;
+    t12 = C100 * t11;
+    t15 = (-C99) * t5;
+    t16 = t12 + t15;
+    X[76] = t4;
+    X[243] = t16;
+    t7 = C101 * t1;
+    t10 = C102 * t6;
+    t9 = t7 + t10;
+    t14 = C102 * t1;
+    t0 = (-C101) * t6;
+    t13 = t14 + t0;
+    X[268] = t9;
+    X[51] = t13;
+    t18 = re[140];
+    t17 = im[140];
+    t8 = re[12];
+    t2 = im[12];
+    t3 = re[44];
+    t19 = im[44];
+    t11 = re[76];
+    t5 = im[76];
+    t12 = re[108];
+    t15 = im[108];
+    t4 = t8 + t12;
+    t16 = t2 + t15;
+    t7 = t3 + t11;
+    t10 = t19 + t5;
+    t1 = t8 - t12;
+    t6 = t2 - t15;
+    t14 = t3 - t11;
+    t0 = t19 - t5;
+    t9 = t4 + t7;
+    t13 = t16 + t10;
+    t8 = t4 - t7;
+    t12 = C30 * t8;
+    t2 = t16 - t10;
+    t15 = C30 * t2;
+    t3 = C31 * t9;
+    t11 = t18 - t3;
+    t19 = C31 * t13;
+    t5 = t17 - t19;
+    t4 = t11 + t12;
+    t7 = t5 + t15;
+    t8 = t11 - t12;
+    t16 = t5 - t15;
+    t10 = C0 * t1;
+    t2 = C32 * t14;
+    t3 = t10 + t2;
+    t19 = C0 * t6;
+    t11 = C32 * t0;
+    t12 = t19 + t11;
+    t5 = C32 * t1;
+    t15 = C0 * t14;
+    t10 = t5 - t15;
+    t2 = C32 * t6;
+    t19 = C0 * t0;
+    t11 = t2 - t19;
+    t1 = t18 + t9;
+    t14 = t17 + t13;
+    t5 = t4 + t12;
+    t15 = t7 - t3;
+    t6 = t8 + t11;
+    t0 = t16 - t10;
+    t2 = t8 - t11;
+    t19 = t16 + t10;
+    t18 = t4 - t12;
+    t9 = t7 + t3;
+    t17 = C103 * t1;
+    t13 = C104 * t14;
+    t8 = t17 + t13;
+    t11 = C104 * t1;
+    t16 = (-C103) * t14;
+    t10 = t11 + t16;
+    X[270] = t8;
+    X[49] = t10;
+    t4 = C105 * t5;
+    t12 = C106 * t15;
+    t7 = t4 + t12;
+    t3 = C106 * t5;
+    t17 = (-C105) * t15;
+    t13 = t3 + t17;
+    X[142] = t7;
+    X[177] = t13;
+    t1 = C107 * t6;
+    t14 = C108 * t0;
+    t11 = t1 + t14;
+    t16 = C108 * t6;
+    t8 = (-C107) * t0;
+    t10 = t16 + t8;
+    X[14] = t11;
+    X[305] = t10;
+    t4 = C109 * t2;
+    t12 = C110 * t19;
+    t5 = t4 + t12;
+    t15 = C110 * t2;
+    t3 = (-C109) * t19;
+    t17 = t15 + t3;
+    X[206] = t5;
+    X[113] = t17;
+    t7 = C111 * t18;
+    t13 = C112 * t9;
+    t1 = t7 + t13;
+    t14 = C112 * t18;
+    t6 = (-C111) * t9;
+    t0 = t14 + t6;
+    X[78] = t1;
+    X[241] = t0;
+    t16 = re[5];
+    t8 = im[5];
+    t11 = re[37];
+    t10 = im[37];
+    t4 = re[69];
+    t12 = im[69];
+    t2 = re[101];
+    t19 = im[101];
+    t15 = re[133];
+    t3 = im[133];
+    t5 = t11 + t15;
+    t17 = t10 + t3;
+    t7 = t4 + t2;
+    t13 = t12 + t19;
+    t18 = t11 - t15;
+    t9 = t10 - t3;
+    t14 = t4 - t2;
+    t6 = t12 - t19;
+    t1 = t5 + t7;
+    t0 = t17 + t13;
+    t11 = t5 - t7;
+    t15 = C30 * t11;
+    t10 = t17 - t13;
+    t3 = C30 * t10;
+    t4 = C31 * t1;
+    t2 = t16 - t4;
+    t12 = C31 * t0;
+    t19 = t8 - t12;
+    t5 = t2 + t15;
+    t7 = t19 + t3;
+    t11 = t2 - t15;
+    t17 = t19 - t3;
+    t13 = C0 * t18;
+    t10 = C32 * t14;
+    t4 = t13 + t10;
+    t12 = C0 * t9;
+    t2 = C32 * t6;
+    t15 = t12 + t2;
+    t19 = C32 * t18;
+    t3 = C0 * t14;
+    t13 = t19 - t3;
+    t10 = C32 * t9;
+    t12 = C0 * t6;
+    t2 = t10 - t12;
+    t18 = t16 + t1;
+    t14 = t8 + t0;
+    t19 = t5 + t15;
+    t3 = t7 - t4;
+    t9 = t11 + t2;
+    t6 = t17 - t13;
+    t10 = t11 - t2;
+    t12 = t17 + t13;
+    t16 = t5 - t15;
+    t1 = t7 + t4;
+    t8 = C113 * t18;
+    t0 = C114 * t14;
+    t11 = t8 + t0;
+    t2 = C114 * t18;
+    t17 = (-C113) * t14;
+    t13 = t2 + t17;
+    X[80] = t11;
+    X[239] = t13;
+    t5 = C115 * t19;
+    t15 = C116 * t3;
+    t7 = t5 + t15;
+    t4 = C116 * t19;
+    t8 = (-C115) * t3;
+    t0 = t4 + t8;
+    X[272] = t7;
+    X[47] = t0;
+    t18 = C117 * t9;
+    t14 = C118 * t6;
+    t2 = t18 + t14;
+    t17 = C118 * t9;
+    t11 = (-C117) * t6;
+    t13 = t17 + t11;
+    X[144] = t2;
+    X[175] = t13;
+    t5 = C119 * t10;
+    t15 = C120 * t12;
+    t19 = t5 + t15;
+    t3 = C120 * t10;
+    t4 = (-C119) * t12;
+    t8 = t3 + t4;
+    X[16] = t19;
+    X[303] = t8;
+    t7 = C121 * t16;
+    t0 = C122 * t1;
+    t18 = t7 + t0;
+    t14 = C122 * t16;
+    t9 = (-C121) * t1;
+    t6 = t14 + t9;
+    X[208] = t18;
+    X[111] = t6;
+}
+
+/**
+ *  Part 6 of ApplyWindowedMDCT_W10_320().
+ * 
+ *  @param {Number[]} x 
+ *    - The input block (640 points).
+ *  @param {Number[]} X 
+ *    - The array that would contain the output block (320 points).
+ *  @param {Number[]} re 
+ *    - The scratch buffer (real part, 160 points).
+ *  @param {Number[]} im 
+ *    - The scratch buffer (imaginary part, 160 points).
+ */
+function ApplyWindowedMDCT_W10_320_Part6(x, X, re, im) {
+    let t0, t1, t10, t11, t12, t13, t14, t15, t16, t17, t18, t19, t2, t3, t4, t5, t6, t7, t8, t9;
+    const C0 = 0.5590169943749475;
+    const C1 = 0.25;
+    const C2 = 0.9510565162951535;
+    const C3 = 0.5877852522924731;
+    const C4 = 0.5119960151141623;
+    const C5 = 0.8589878232589904;
+    const C6 = 0.9191138516900578;
+    const C7 = 0.3939920400610481;
+    const C8 = 0.22149531114330429;
+    const C9 = 0.975161436451181;
+    const C10 = 0.7523789818396478;
+    const C11 = 0.6587304970061238;
+    const C12 = 0.9958794538942858;
+    const C13 = 0.09068689713083816;
+    const C14 = 0.99494115919819;
+    const C15 = 0.10045939345507647;
+    const C16 = 0.5035383837257176;
+    const C17 = 0.8639728561215868;
+    const C18 = 0.9152016129634745;
+    const C19 = 0.4029962873638599;
+    const C20 = 0.21191116582684155;
+    const C21 = 0.9772889326079104;
+    const C22 = 0.7458757562673048;
+    const C23 = 0.6660850968252301;
+    const C24 = 0.7393006416371488;
+    const C25 = 0.6733754979763521;
+    const C26 = 0.9939069700023561;
+    const C27 = 0.11022220729388306;
+    const C28 = 0.4950322202598127;
+    const C29 = 0.8688746174820854;
+    const C30 = 0.9112011652005843;
+    const C31 = 0.4119616930457218;
+    const C32 = 0.20230659607115642;
+    const C33 = 0.9793222356232406;
+    const C34 = 0.1926825275846723;
+    const C35 = 0.981261149523195;
+    const C36 = 0.7326542716724128;
+    const C37 = 0.680600997795453;
+    const C38 = 0.9927769859840909;
+    const C39 = 0.11997439768694032;
+    const C40 = 0.48647834455818684;
+    const C41 = 0.8736926348985243;
+    const C42 = 0.9071128939728691;
+    const C43 = 0.4208873930021738;
+    const C44 = 0.9029371933164189;
+    const C45 = 0.42977252695567697;
+    const C46 = 0.18303988795514095;
+    const C47 = 0.9831054874312163;
+    const C48 = 0.7259372869640676;
+    const C49 = 0.6877608998738217;
+    const C50 = 0.9915513160536062;
+    const C51 = 0.1297150246978405;
+    const C52 = 0.4778775810611837;
+    const C53 = 0.8784264440003566;
+    const C54 = 0.4692307587282903;
+    const C55 = 0.8830755885332088;
+    const C56 = 0.8986744656939538;
+    const C57 = 0.43861623853852766;
+    const C58 = 0.1733796065602395;
+    const C59 = 0.9848550715861784;
+    const C60 = 0.7191503349090794;
+    const C61 = 0.6948545141251936;
+    const C62 = 0.9902300783435211;
+    const C63 = 0.13944314950467876;
+    const C64 = 0.9888134001974757;
+    const C65 = 0.14915783449053857;
+    const C66 = 0.46053871095824;
+    const C67 = 0.8876396204028539;
+    const C68 = 0.8943251219560346;
+    const C69 = 0.4474176753753966;
+    const C70 = 0.16370261447799525;
+    const C71 = 0.9865097333595187;
+    const C72 = 0.7122940696480137;
+    const C73 = 0.7018811568522627;
+    const C74 = 0.7053691520019861;
+    const C75 = 0.7088401508125785;
+    const C76 = 0.9873014181578584;
+    const C77 = 0.15885814333386145;
+    const C78 = 0.4518022755086881;
+    const C79 = 0.8921180997184013;
+    const C80 = 0.889889581301463;
+    const C81 = 0.45617598916548296;
+    const C82 = 0.15400984439704607;
+    const C83 = 0.988069313271492;
+    const C84 = 0.14430223052674654;
+    const C85 = 0.9895336610065398;
+    const C86 = 0.6983762494089729;
+    const C87 = 0.7157308252838186;
+    const C88 = 0.9856942779526452;
+    const C89 = 0.16854314109869134;
+    const C90 = 0.44302229441546676;
+    const C91 = 0.8965105948346932;
+    const C92 = 0.8853682712368793;
+    const C93 = 0.4648903357642743;
+    const C94 = 0.8807616275355579;
+    const C95 = 0.47355987526490806;
+    const C96 = 0.13458070850712617;
+    const C97 = 0.99090263542778;
+    const C98 = 0.6913160358594803;
+    const C99 = 0.722552516128436;
+    const C100 = 0.9839921344813541;
+    const C101 = 0.1782118943247859;
+    const C102 = 0.43419961391142786;
+    const C103 = 0.900816682393908;
+    const C104 = 0.4253350843448814;
+    const C105 = 0.9050359473663644;
+    const C106 = 0.8760700941954066;
+    const C107 = 0.4821837720791227;
+    const C108 = 0.12484621531871118;
+    const C109 = 0.9921761045906085;
+    const C110 = 0.6841891918315852;
+    const C111 = 0.7293045658576686;
+    const C112 = 0.9821951518001156;
+    const C113 = 0.1878634711175852;
+    const C114 = 0.9803035031058607;
+    const C115 = 0.19749694123802963;
+    const C116 = 0.41642956009763715;
+    const C117 = 0.9091679830905224;
+    const C118 = 0.8712941233961736;
+    const C119 = 0.49076119501779414;
+    const C120 = 0.11509968919221586;
+    const C121 = 0.9933539457554167;
+    const C122 = 0.6769964042253483;
+    const C123 = 0.7359863236949099;
+    const C124 = 0.6697383662966098;
+    const C125 = 0.742597145638433;
+    const C126 = 0.9783173707196277;
+    const C127 = 0.20711137619221856;
+    const C128 = 0.4074838995026576;
+    const C129 = 0.9132123913121788;
+    const C130 = 0.8664341754558649;
+    const C131 = 0.4992913173710469;
+    const C132 = 0.10534206951811415;
+    const C133 = 0.9944360453994218;
+    const C134 = 0.09557429675609919;
+    const C135 = 0.9954222992276077;
+    const C136 = 0.6624157775901718;
+    const C137 = 0.7491363945234594;
+    const C138 = 0.9762369460689896;
+    const C139 = 0.2167058493209;
+    const C140 = 0.3984989647613298;
+    const C141 = 0.9171687822228516;
+    const C142 = 0.8614907187863783;
+    const C143 = 0.5077733169879345;
+    const C144 = 0.8564642298483564;
+    const C145 = 0.5162063763556798;
+    const C146 = 0.0857973123444399;
+    const C147 = 0.996312612182778;
+    const C148 = 0.6550293438723744;
+    const C149 = 0.7556034400835709;
+    const C150 = 0.9740624296696047;
+    const C151 = 0.22627943588878452;
+    const C152 = 0.3894756218603649;
+    const C153 = 0.9210367744973499;
+    const C154 = 0.3804147404883323;
+    const C155 = 0.9248159953305278;
+    const C156 = 0.8513551931052652;
+    const C157 = 0.524589682678469;
+    const C158 = 0.07601205860924312;
+    const C159 = 0.9971068984547168;
+    const C160 = 0.6475797770630733;
+    const C161 = 0.7619976590114568;
+    const C162 = 0.9717940311058891;
+    const C163 = 0.2358312131736727;
+    const C164 = 0.969431969010818;
+    const C165 = 0.24536026055538934;
+    const C166 = 0.37131719395183754;
+    const C167 = 0.9285060804732156;
+    const C168 = 0.8461641009766995;
+    const C169 = 0.5329224279557898;
+    const C170 = 0.06621947867363034;
+    const C171 = 0.9978050814884601;
+    const C172 = 0.6400677951670226;
+    const C173 = 0.7683184350189877;
+    const C174 = 0.6324941222046724;
+    const C175 = 0.7745651588966166;
+    const C176 = 0.9669764710448521;
+    const C177 = 0.25486565960451457;
+    const C178 = 0.36218385909135087;
+    const C179 = 0.9321066742673269;
+    const C180 = 0.8408914537909229;
+    const C181 = 0.5412038090603096;
+    const C182 = 0.05642051636683749;
+    const C183 = 0.998407093991674;
+    const C184 = 0.04661611613324671;
+    const C185 = 0.9989128779411404;
+    const C186 = 0.6248594881423863;
+    const C187 = 0.7807372285720945;
+    const C188 = 0.9644277738739964;
+    const C189 = 0.264346494170904;
+    const C190 = 0.3530156161966958;
+    const C191 = 0.9356174296801376;
+    const C192 = 0.8355377597366458;
+    const C193 = 0.5494330278152808;
+    const C194 = 0.8301035348140438;
+    const C195 = 0.5576092910714722;
+    const C196 = 0.03680722294135883;
+    const C197 = 0.9993223845883495;
+    const C198 = 0.6171646288220856;
+    const C199 = 0.7868340491684999;
+    const C200 = 0.9617861231469886;
+    const C201 = 0.27380185047198924;
+    const C202 = 0.34381334892220483;
+    const C203 = 0.939038008337734;
+    const C204 = 0.33457794420155085;
+    const C205 = 0.9423680805576258;
+    const C206 = 0.8245893027850253;
+    const C207 = 0.5657318107836131;
+    const C208 = 0.026994782192715373;
+    const C209 = 0.9996355744641984;
+    const C210 = 0.609410285890327;
+    const C211 = 0.7928550330615742;
+    const C212 = 0.9590517734716243;
+    const C213 = 0.28323081718085014;
+    t17 = re[25];
+    t11 = im[25];
+    t2 = re[57];
+    t13 = im[57];
+    t5 = re[89];
+    t15 = im[89];
+    t10 = re[121];
+    t12 = im[121];
+    t3 = re[153];
+    t4 = im[153];
+    t19 = t2 + t3;
+    t8 = t13 + t4;
+    t7 = t5 + t10;
+    t0 = t15 + t12;
+    t16 = t2 - t3;
+    t1 = t13 - t4;
+    t14 = t5 - t10;
+    t9 = t15 - t12;
+    t18 = t19 + t7;
+    t6 = t8 + t0;
+    t2 = t19 - t7;
+    t3 = C0 * t2;
+    t13 = t8 - t0;
+    t4 = C0 * t13;
+    t5 = C1 * t18;
+    t10 = t17 - t5;
+    t15 = C1 * t6;
+    t12 = t11 - t15;
+    t19 = t10 + t3;
+    t7 = t12 + t4;
+    t2 = t10 - t3;
+    t8 = t12 - t4;
+    t0 = C2 * t16;
+    t13 = C3 * t14;
+    t5 = t0 + t13;
+    t15 = C2 * t1;
+    t10 = C3 * t9;
+    t3 = t15 + t10;
+    t12 = C3 * t16;
+    t4 = C2 * t14;
+    t0 = t12 - t4;
+    t13 = C3 * t1;
+    t15 = C2 * t9;
+    t10 = t13 - t15;
+    t16 = t17 + t18;
+    t14 = t11 + t6;
+    t12 = t19 + t3;
+    t4 = t7 - t5;
+    t1 = t2 + t10;
+    t9 = t8 - t0;
+    t13 = t2 - t10;
+    t15 = t8 + t0;
+    t17 = t19 - t3;
+    t18 = t7 + t5;
+    t11 = C4 * t16;
+    t6 = C5 * t14;
+    t2 = t11 + t6;
+    t10 = C5 * t16;
+    t8 = (-C4) * t14;
+    t0 = t10 + t8;
+    X[210] = t2;
+    X[109] = t0;
+    t19 = C6 * t12;
+    t3 = C7 * t4;
+    t7 = t19 + t3;
+    t5 = C7 * t12;
+    t11 = (-C6) * t4;
+    t6 = t5 + t11;
+    X[82] = t7;
+    X[237] = t6;
+    t16 = C8 * t1;
+    t14 = C9 * t9;
+    t10 = t16 + t14;
+    t8 = C9 * t1;
+    t2 = (-C8) * t9;
+    t0 = t8 + t2;
+    X[274] = t10;
+    X[45] = t0;
+    t19 = C10 * t13;
+    t3 = C11 * t15;
+    t12 = t19 + t3;
+    t4 = C11 * t13;
+    t5 = (-C10) * t15;
+    t11 = t4 + t5;
+    X[146] = t12;
+    X[173] = t11;
+    t7 = C12 * t17;
+    t6 = C13 * t18;
+    t16 = t7 + t6;
+    t14 = C13 * t17;
+    t1 = (-C12) * t18;
+    t9 = t14 + t1;
+    X[18] = t16;
+    X[301] = t9;
+    t8 = re[45];
+    t2 = im[45];
+    t10 = re[77];
+    t0 = im[77];
+    t19 = re[109];
+    t3 = im[109];
+    t13 = re[141];
+    t15 = im[141];
+    t4 = re[13];
+    t5 = im[13];
+    t12 = t10 + t4;
+    t11 = t0 + t5;
+    t7 = t19 + t13;
+    t6 = t3 + t15;
+    t17 = t10 - t4;
+    t18 = t0 - t5;
+    t14 = t19 - t13;
+    t1 = t3 - t15;
+    t16 = t12 + t7;
+    t9 = t11 + t6;
+    t10 = t12 - t7;
+    t4 = C0 * t10;
+    t0 = t11 - t6;
+    t5 = C0 * t0;
+    t19 = C1 * t16;
+    t13 = t8 - t19;
+    t3 = C1 * t9;
+    t15 = t2 - t3;
+    t12 = t13 + t4;
+    t7 = t15 + t5;
+    t10 = t13 - t4;
+    t11 = t15 - t5;
+    t6 = C2 * t17;
+    t0 = C3 * t14;
+    t19 = t6 + t0;
+    t3 = C2 * t18;
+    t13 = C3 * t1;
+    t4 = t3 + t13;
+    t15 = C3 * t17;
+    t5 = C2 * t14;
+    t6 = t15 - t5;
+    t0 = C3 * t18;
+    t3 = C2 * t1;
+    t13 = t0 - t3;
+    t17 = t8 + t16;
+    t14 = t2 + t9;
+    t15 = t12 + t4;
+    t5 = t7 - t19;
+    t18 = t10 + t13;
+    t1 = t11 - t6;
+    t0 = t10 - t13;
+    t3 = t11 + t6;
+    t8 = t12 - t4;
+    t16 = t7 + t19;
+    t2 = C14 * t17;
+    t9 = C15 * t14;
+    t10 = t2 + t9;
+    t13 = C15 * t17;
+    t11 = (-C14) * t14;
+    t6 = t13 + t11;
+    X[20] = t10;
+    X[299] = t6;
+    t12 = C16 * t15;
+    t4 = C17 * t5;
+    t7 = t12 + t4;
+    t19 = C17 * t15;
+    t2 = (-C16) * t5;
+    t9 = t19 + t2;
+    X[212] = t7;
+    X[107] = t9;
+    t17 = C18 * t18;
+    t14 = C19 * t1;
+    t13 = t17 + t14;
+    t11 = C19 * t18;
+    t10 = (-C18) * t1;
+    t6 = t11 + t10;
+    X[84] = t13;
+    X[235] = t6;
+    t12 = C20 * t0;
+    t4 = C21 * t3;
+    t15 = t12 + t4;
+    t5 = C21 * t0;
+    t19 = (-C20) * t3;
+    t2 = t5 + t19;
+    X[276] = t15;
+    X[43] = t2;
+    t7 = C22 * t8;
+    t9 = C23 * t16;
+    t17 = t7 + t9;
+    t14 = C23 * t8;
+    t18 = (-C22) * t16;
+    t1 = t14 + t18;
+    X[148] = t17;
+    X[171] = t1;
+    t11 = re[65];
+    t10 = im[65];
+    t13 = re[97];
+    t6 = im[97];
+    t12 = re[129];
+    t4 = im[129];
+    t0 = re[1];
+    t3 = im[1];
+    t5 = re[33];
+    t19 = im[33];
+    t15 = t13 + t5;
+    t2 = t6 + t19;
+    t7 = t12 + t0;
+    t9 = t4 + t3;
+    t8 = t13 - t5;
+    t16 = t6 - t19;
+    t14 = t12 - t0;
+    t18 = t4 - t3;
+    t17 = t15 + t7;
+    t1 = t2 + t9;
+    t13 = t15 - t7;
+    t5 = C0 * t13;
+    t6 = t2 - t9;
+    t19 = C0 * t6;
+    t12 = C1 * t17;
+    t0 = t11 - t12;
+    t4 = C1 * t1;
+    t3 = t10 - t4;
+    t15 = t0 + t5;
+    t7 = t3 + t19;
+    t13 = t0 - t5;
+    t2 = t3 - t19;
+    t9 = C2 * t8;
+    t6 = C3 * t14;
+    t12 = t9 + t6;
+    t4 = C2 * t16;
+    t0 = C3 * t18;
+    t5 = t4 + t0;
+    t3 = C3 * t8;
+    t19 = C2 * t14;
+    t9 = t3 - t19;
+    t6 = C3 * t16;
+    t4 = C2 * t18;
+    t0 = t6 - t4;
+    t8 = t11 + t17;
+    t14 = t10 + t1;
+    t3 = t15 + t5;
+    t19 = t7 - t12;
+    t16 = t13 + t0;
+    t18 = t2 - t9;
+    t6 = t13 - t0;
+    t4 = t2 + t9;
+    t11 = t15 - t5;
+    t17 = t7 + t12;
+    t10 = C24 * t8;
+    t1 = C25 * t14;
+    t13 = t10 + t1;
+    t0 = C25 * t8;
+    t2 = (-C24) * t14;
+    t9 = t0 + t2;
+    X[150] = t13;
+    X[169] = t9;
+    t15 = C26 * t3;
+    t5 = C27 * t19;
+    t7 = t15 + t5;
+    t12 = C27 * t3;
+    t10 = (-C26) * t19;
+    t1 = t12 + t10;
+    X[22] = t7;
+    X[297] = t1;
+    t8 = C28 * t16;
+    t14 = C29 * t18;
+    t0 = t8 + t14;
+    t2 = C29 * t16;
+    t13 = (-C28) * t18;
+    t9 = t2 + t13;
+    X[214] = t0;
+    X[105] = t9;
+    t15 = C30 * t6;
+    t5 = C31 * t4;
+    t3 = t15 + t5;
+    t19 = C31 * t6;
+    t12 = (-C30) * t4;
+    t10 = t19 + t12;
+    X[86] = t3;
+    X[233] = t10;
+    t7 = C32 * t11;
+    t1 = C33 * t17;
+    t8 = t7 + t1;
+    t14 = C33 * t11;
+    t16 = (-C32) * t17;
+    t18 = t14 + t16;
+    X[278] = t8;
+    X[41] = t18;
+    t2 = re[85];
+    t13 = im[85];
+    t0 = re[117];
+    t9 = im[117];
+    t15 = re[149];
+    t5 = im[149];
+    t6 = re[21];
+    t4 = im[21];
+    t19 = re[53];
+    t12 = im[53];
+    t3 = t0 + t19;
+    t10 = t9 + t12;
+    t7 = t15 + t6;
+    t1 = t5 + t4;
+    t11 = t0 - t19;
+    t17 = t9 - t12;
+    t14 = t15 - t6;
+    t16 = t5 - t4;
+    t8 = t3 + t7;
+    t18 = t10 + t1;
+    t0 = t3 - t7;
+    t19 = C0 * t0;
+    t9 = t10 - t1;
+    t12 = C0 * t9;
+    t15 = C1 * t8;
+    t6 = t2 - t15;
+    t5 = C1 * t18;
+    t4 = t13 - t5;
+    t3 = t6 + t19;
+    t7 = t4 + t12;
+    t0 = t6 - t19;
+    t10 = t4 - t12;
+    t1 = C2 * t11;
+    t9 = C3 * t14;
+    t15 = t1 + t9;
+    t5 = C2 * t17;
+    t6 = C3 * t16;
+    t19 = t5 + t6;
+    t4 = C3 * t11;
+    t12 = C2 * t14;
+    t1 = t4 - t12;
+    t9 = C3 * t17;
+    t5 = C2 * t16;
+    t6 = t9 - t5;
+    t11 = t2 + t8;
+    t14 = t13 + t18;
+    t4 = t3 + t19;
+    t12 = t7 - t15;
+    t17 = t0 + t6;
+    t16 = t10 - t1;
+    t9 = t0 - t6;
+    t5 = t10 + t1;
+    t2 = t3 - t19;
+    t8 = t7 + t15;
+    t13 = C34 * t11;
+    t18 = C35 * t14;
+    t0 = t13 + t18;
+    t6 = C35 * t11;
+    t10 = (-C34) * t14;
+    t1 = t6 + t10;
+    X[280] = t0;
+    X[39] = t1;
+    t3 = C36 * t4;
+    t19 = C37 * t12;
+    t7 = t3 + t19;
+    t15 = C37 * t4;
+    t13 = (-C36) * t12;
+    t18 = t15 + t13;
+    X[152] = t7;
+    X[167] = t18;
+    t11 = C38 * t17;
+    t14 = C39 * t16;
+    t6 = t11 + t14;
+    t10 = C39 * t17;
+    t0 = (-C38) * t16;
+    t1 = t10 + t0;
+    X[24] = t6;
+    X[295] = t1;
+    t3 = C40 * t9;
+    t19 = C41 * t5;
+    t4 = t3 + t19;
+    t12 = C41 * t9;
+    t15 = (-C40) * t5;
+    t13 = t12 + t15;
+    X[216] = t4;
+    X[103] = t13;
+    t7 = C42 * t2;
+    t18 = C43 * t8;
+    t11 = t7 + t18;
+    t14 = C43 * t2;
+    t17 = (-C42) * t8;
+    t16 = t14 + t17;
+    X[88] = t11;
+    X[231] = t16;
+    t10 = re[105];
+    t0 = im[105];
+    t6 = re[137];
+    t1 = im[137];
+    t3 = re[9];
+    t19 = im[9];
+    t9 = re[41];
+    t5 = im[41];
+    t12 = re[73];
+    t15 = im[73];
+    t4 = t6 + t12;
+    t13 = t1 + t15;
+    t7 = t3 + t9;
+    t18 = t19 + t5;
+    t2 = t6 - t12;
+    t8 = t1 - t15;
+    t14 = t3 - t9;
+    t17 = t19 - t5;
+    t11 = t4 + t7;
+    t16 = t13 + t18;
+    t6 = t4 - t7;
+    t12 = C0 * t6;
+    t1 = t13 - t18;
+    t15 = C0 * t1;
+    t3 = C1 * t11;
+    t9 = t10 - t3;
+    t19 = C1 * t16;
+    t5 = t0 - t19;
+    t4 = t9 + t12;
+    t7 = t5 + t15;
+    t6 = t9 - t12;
+    t13 = t5 - t15;
+    t18 = C2 * t2;
+    t1 = C3 * t14;
+    t3 = t18 + t1;
+    t19 = C2 * t8;
+    t9 = C3 * t17;
+    t12 = t19 + t9;
+    t5 = C3 * t2;
+    t15 = C2 * t14;
+    t18 = t5 - t15;
+    t1 = C3 * t8;
+    t19 = C2 * t17;
+    t9 = t1 - t19;
+    t2 = t10 + t11;
+    t14 = t0 + t16;
+    t5 = t4 + t12;
+    t15 = t7 - t3;
+    t8 = t6 + t9;
+    t17 = t13 - t18;
+    t1 = t6 - t9;
+    t19 = t13 + t18;
+    t10 = t4 - t12;
+    t11 = t7 + t3;
+    t0 = C44 * t2;
+    t16 = C45 * t14;
+    t6 = t0 + t16;
+    t9 = C45 * t2;
+    t13 = (-C44) * t14;
+    t18 = t9 + t13;
+    X[90] = t6;
+    X[229] = t18;
+    t4 = C46 * t5;
+    t12 = C47 * t15;
+    t7 = t4 + t12;
+    t3 = C47 * t5;
+    t0 = (-C46) * t15;
+    t16 = t3 + t0;
+    X[282] = t7;
+    X[37] = t16;
+    t2 = C48 * t8;
+    t14 = C49 * t17;
+    t9 = t2 + t14;
+    t13 = C49 * t8;
+    t6 = (-C48) * t17;
+    t18 = t13 + t6;
+    X[154] = t9;
+    X[165] = t18;
+    t4 = C50 * t1;
+    t12 = C51 * t19;
+    t5 = t4 + t12;
+    t15 = C51 * t1;
+    t3 = (-C50) * t19;
+    t0 = t15 + t3;
+    X[26] = t5;
+    X[293] = t0;
+    t7 = C52 * t10;
+    t16 = C53 * t11;
+    t2 = t7 + t16;
+    t14 = C53 * t10;
+    t8 = (-C52) * t11;
+    t17 = t14 + t8;
+    X[218] = t2;
+    X[101] = t17;
+    t13 = re[125];
+    t6 = im[125];
+    t9 = re[157];
+    t18 = im[157];
+    t4 = re[29];
+    t12 = im[29];
+    t1 = re[61];
+    t19 = im[61];
+    t15 = re[93];
+    t3 = im[93];
+    t5 = t9 + t15;
+    t0 = t18 + t3;
+    t7 = t4 + t1;
+    t16 = t12 + t19;
+    t10 = t9 - t15;
+    t11 = t18 - t3;
+    t14 = t4 - t1;
+    t8 = t12 - t19;
+    t2 = t5 + t7;
+    t17 = t0 + t16;
+    t9 = t5 - t7;
+    t15 = C0 * t9;
+    t18 = t0 - t16;
+    t3 = C0 * t18;
+    t4 = C1 * t2;
+    t1 = t13 - t4;
+    t12 = C1 * t17;
+    t19 = t6 - t12;
+    t5 = t1 + t15;
+    t7 = t19 + t3;
+    t9 = t1 - t15;
+    t0 = t19 - t3;
+    t16 = C2 * t10;
+    t18 = C3 * t14;
+    t4 = t16 + t18;
+    t12 = C2 * t11;
+    t1 = C3 * t8;
+    t15 = t12 + t1;
+    t19 = C3 * t10;
+    t3 = C2 * t14;
+    t16 = t19 - t3;
+    t18 = C3 * t11;
+    t12 = C2 * t8;
+    t1 = t18 - t12;
+    t10 = t13 + t2;
+    t14 = t6 + t17;
+    t19 = t5 + t15;
+    t3 = t7 - t4;
+    t11 = t9 + t1;
+    t8 = t0 - t16;
+    t18 = t9 - t1;
+    t12 = t0 + t16;
+    t13 = t5 - t15;
+    t2 = t7 + t4;
+    t6 = C54 * t10;
+    t17 = C55 * t14;
+    t9 = t6 + t17;
+    t1 = C55 * t10;
+    t0 = (-C54) * t14;
+    t16 = t1 + t0;
+    X[220] = t9;
+    X[99] = t16;
+    t5 = C56 * t19;
+    t15 = C57 * t3;
+    t7 = t5 + t15;
+    t4 = C57 * t19;
+    t6 = (-C56) * t3;
+    t17 = t4 + t6;
+    X[92] = t7;
+    X[227] = t17;
+    t10 = C58 * t11;
+    t14 = C59 * t8;
+    t1 = t10 + t14;
+    t0 = C59 * t11;
+    t9 = (-C58) * t8;
+    t16 = t0 + t9;
+    X[284] = t1;
+    X[35] = t16;
+    t5 = C60 * t18;
+    t15 = C61 * t12;
+    t19 = t5 + t15;
+    t3 = C61 * t18;
+    t4 = (-C60) * t12;
+    t6 = t3 + t4;
+    X[156] = t19;
+    X[163] = t6;
+    t7 = C62 * t13;
+    t17 = C63 * t2;
+    t10 = t7 + t17;
+    t14 = C63 * t13;
+    t11 = (-C62) * t2;
+    t8 = t14 + t11;
+    X[28] = t10;
+    X[291] = t8;
+    t0 = re[145];
+    t9 = im[145];
+    t1 = re[17];
+    t16 = im[17];
+    t5 = re[49];
+    t15 = im[49];
+    t18 = re[81];
+    t12 = im[81];
+    t3 = re[113];
+    t4 = im[113];
+    t19 = t1 + t3;
+    t6 = t16 + t4;
+    t7 = t5 + t18;
+    t17 = t15 + t12;
+    t13 = t1 - t3;
+    t2 = t16 - t4;
+    t14 = t5 - t18;
+    t11 = t15 - t12;
+    t10 = t19 + t7;
+    t8 = t6 + t17;
+    t1 = t19 - t7;
+    t3 = C0 * t1;
+    t16 = t6 - t17;
+    t4 = C0 * t16;
+    t5 = C1 * t10;
+    t18 = t0 - t5;
+    t15 = C1 * t8;
+    t12 = t9 - t15;
+    t19 = t18 + t3;
+    t7 = t12 + t4;
+    t1 = t18 - t3;
+    t6 = t12 - t4;
+    t17 = C2 * t13;
+    t16 = C3 * t14;
+    t5 = t17 + t16;
+    t15 = C2 * t2;
+    t18 = C3 * t11;
+    t3 = t15 + t18;
+    t12 = C3 * t13;
+    t4 = C2 * t14;
+    t17 = t12 - t4;
+    t16 = C3 * t2;
+    t15 = C2 * t11;
+    t18 = t16 - t15;
+    t13 = t0 + t10;
+    t14 = t9 + t8;
+    t12 = t19 + t3;
+    t4 = t7 - t5;
+    t2 = t1 + t18;
+    t11 = t6 - t17;
+    t16 = t1 - t18;
+    t15 = t6 + t17;
+    t0 = t19 - t3;
+    t10 = t7 + t5;
+    t9 = C64 * t13;
+    t8 = C65 * t14;
+    t1 = t9 + t8;
+    t18 = C65 * t13;
+    t6 = (-C64) * t14;
+    t17 = t18 + t6;
+    X[30] = t1;
+    X[289] = t17;
+    t19 = C66 * t12;
+    t3 = C67 * t4;
+    t7 = t19 + t3;
+    t5 = C67 * t12;
+    t9 = (-C66) * t4;
+    t8 = t5 + t9;
+    X[222] = t7;
+    X[97] = t8;
+    t13 = C68 * t2;
+    t14 = C69 * t11;
+    t18 = t13 + t14;
+    t6 = C69 * t2;
+    t1 = (-C68) * t11;
+    t17 = t6 + t1;
+    X[94] = t18;
+    X[225] = t17;
+    t19 = C70 * t16;
+    t3 = C71 * t15;
+    t12 = t19 + t3;
+    t4 = C71 * t16;
+    t5 = (-C70) * t15;
+    t9 = t4 + t5;
+    X[286] = t12;
+    X[33] = t9;
+    t7 = C72 * t0;
+    t8 = C73 * t10;
+    t13 = t7 + t8;
+    t14 = C73 * t0;
+    t2 = (-C72) * t10;
+    t11 = t14 + t2;
+    X[158] = t13;
+    X[161] = t11;
+    t6 = re[10];
+    t1 = im[10];
+    t18 = re[42];
+    t17 = im[42];
+    t19 = re[74];
+    t3 = im[74];
+    t16 = re[106];
+    t15 = im[106];
+    t4 = re[138];
+    t5 = im[138];
+    t12 = t18 + t4;
+    t9 = t17 + t5;
+    t7 = t19 + t16;
+    t8 = t3 + t15;
+    t0 = t18 - t4;
+    t10 = t17 - t5;
+    t14 = t19 - t16;
+    t2 = t3 - t15;
+    t13 = t12 + t7;
+    t11 = t9 + t8;
+    t18 = t12 - t7;
+    t4 = C0 * t18;
+    t17 = t9 - t8;
+    t5 = C0 * t17;
+    t19 = C1 * t13;
+    t16 = t6 - t19;
+    t3 = C1 * t11;
+    t15 = t1 - t3;
+    t12 = t16 + t4;
+    t7 = t15 + t5;
+    t18 = t16 - t4;
+    t9 = t15 - t5;
+    t8 = C2 * t0;
+    t17 = C3 * t14;
+    t19 = t8 + t17;
+    t3 = C2 * t10;
+    t16 = C3 * t2;
+    t4 = t3 + t16;
+    t15 = C3 * t0;
+    t5 = C2 * t14;
+    t8 = t15 - t5;
+    t17 = C3 * t10;
+    t3 = C2 * t2;
+    t16 = t17 - t3;
+    t0 = t6 + t13;
+    t14 = t1 + t11;
+    t15 = t12 + t4;
+    t5 = t7 - t19;
+    t10 = t18 + t16;
+    t2 = t9 - t8;
+    t17 = t18 - t16;
+    t3 = t9 + t8;
+    t6 = t12 - t4;
+    t13 = t7 + t19;
+    t1 = C74 * t0;
+    t11 = C75 * t14;
+    t18 = t1 + t11;
+    t16 = C75 * t0;
+    t9 = (-C74) * t14;
+    t8 = t16 + t9;
+    X[160] = t18;
+    X[159] = t8;
+    t12 = C76 * t15;
+    t4 = C77 * t5;
+    t7 = t12 + t4;
+    t19 = C77 * t15;
+    t1 = (-C76) * t5;
+    t11 = t19 + t1;
+    X[32] = t7;
+    X[287] = t11;
+    t0 = C78 * t10;
+    t14 = C79 * t2;
+    t16 = t0 + t14;
+    t9 = C79 * t10;
+    t18 = (-C78) * t2;
+    t8 = t9 + t18;
+    X[224] = t16;
+    X[95] = t8;
+    t12 = C80 * t17;
+    t4 = C81 * t3;
+    t15 = t12 + t4;
+    t5 = C81 * t17;
+    t19 = (-C80) * t3;
+    t1 = t5 + t19;
+    X[96] = t15;
+    X[223] = t1;
+    t7 = C82 * t6;
+    t11 = C83 * t13;
+    t0 = t7 + t11;
+    t14 = C83 * t6;
+    t10 = (-C82) * t13;
+    t2 = t14 + t10;
+    X[288] = t0;
+    X[31] = t2;
+    t9 = re[30];
+    t18 = im[30];
+    t16 = re[62];
+    t8 = im[62];
+    t12 = re[94];
+    t4 = im[94];
+    t17 = re[126];
+    t3 = im[126];
+    t5 = re[158];
+    t19 = im[158];
+    t15 = t16 + t5;
+    t1 = t8 + t19;
+    t7 = t12 + t17;
+    t11 = t4 + t3;
+    t6 = t16 - t5;
+    t13 = t8 - t19;
+    t14 = t12 - t17;
+    t10 = t4 - t3;
+    t0 = t15 + t7;
+    t2 = t1 + t11;
+    t16 = t15 - t7;
+    t5 = C0 * t16;
+    t8 = t1 - t11;
+    t19 = C0 * t8;
+    t12 = C1 * t0;
+    t17 = t9 - t12;
+    t4 = C1 * t2;
+    t3 = t18 - t4;
+    t15 = t17 + t5;
+    t7 = t3 + t19;
+    t16 = t17 - t5;
+    t1 = t3 - t19;
+    t11 = C2 * t6;
+    t8 = C3 * t14;
+    t12 = t11 + t8;
+    t4 = C2 * t13;
+    t17 = C3 * t10;
+    t5 = t4 + t17;
+    t3 = C3 * t6;
+    t19 = C2 * t14;
+    t11 = t3 - t19;
+    t8 = C3 * t13;
+    t4 = C2 * t10;
+    t17 = t8 - t4;
+    t6 = t9 + t0;
+    t14 = t18 + t2;
+    t3 = t15 + t5;
+    t19 = t7 - t12;
+    t13 = t16 + t17;
+    t10 = t1 - t11;
+    t8 = t16 - t17;
+    t4 = t1 + t11;
+    t9 = t15 - t5;
+    t0 = t7 + t12;
+    t18 = C84 * t6;
+    t2 = C85 * t14;
+    t16 = t18 + t2;
+    t17 = C85 * t6;
+    t1 = (-C84) * t14;
+    t11 = t17 + t1;
+    X[290] = t16;
+    X[29] = t11;
+    t15 = C86 * t3;
+    t5 = C87 * t19;
+    t7 = t15 + t5;
+    t12 = C87 * t3;
+    t18 = (-C86) * t19;
+    t2 = t12 + t18;
+    X[162] = t7;
+    X[157] = t2;
+    t6 = C88 * t13;
+    t14 = C89 * t10;
+    t17 = t6 + t14;
+    t1 = C89 * t13;
+    t16 = (-C88) * t10;
+    t11 = t1 + t16;
+    X[34] = t17;
+    X[285] = t11;
+    t15 = C90 * t8;
+    t5 = C91 * t4;
+    t3 = t15 + t5;
+    t19 = C91 * t8;
+    t12 = (-C90) * t4;
+    t18 = t19 + t12;
+    X[226] = t3;
+    X[93] = t18;
+    t7 = C92 * t9;
+    t2 = C93 * t0;
+    t6 = t7 + t2;
+    t14 = C93 * t9;
+    t13 = (-C92) * t0;
+    t10 = t14 + t13;
+    X[98] = t6;
+    X[221] = t10;
+    t1 = re[50];
+    t16 = im[50];
+    t17 = re[82];
+    t11 = im[82];
+    t15 = re[114];
+    t5 = im[114];
+    t8 = re[146];
+    t4 = im[146];
+    t19 = re[18];
+    t12 = im[18];
+    t3 = t17 + t19;
+    t18 = t11 + t12;
+    t7 = t15 + t8;
+    t2 = t5 + t4;
+    t9 = t17 - t19;
+    t0 = t11 - t12;
+    t14 = t15 - t8;
+    t13 = t5 - t4;
+    t6 = t3 + t7;
+    t10 = t18 + t2;
+    t17 = t3 - t7;
+    t19 = C0 * t17;
+    t11 = t18 - t2;
+    t12 = C0 * t11;
+    t15 = C1 * t6;
+    t8 = t1 - t15;
+    t5 = C1 * t10;
+    t4 = t16 - t5;
+    t3 = t8 + t19;
+    t7 = t4 + t12;
+    t17 = t8 - t19;
+    t18 = t4 - t12;
+    t2 = C2 * t9;
+    t11 = C3 * t14;
+    t15 = t2 + t11;
+    t5 = C2 * t0;
+    t8 = C3 * t13;
+    t19 = t5 + t8;
+    t4 = C3 * t9;
+    t12 = C2 * t14;
+    t2 = t4 - t12;
+    t11 = C3 * t0;
+    t5 = C2 * t13;
+    t8 = t11 - t5;
+    t9 = t1 + t6;
+    t14 = t16 + t10;
+    t4 = t3 + t19;
+    t12 = t7 - t15;
+    t0 = t17 + t8;
+    t13 = t18 - t2;
+    t11 = t17 - t8;
+    t5 = t18 + t2;
+    t1 = t3 - t19;
+    t6 = t7 + t15;
+    t16 = C94 * t9;
+    t10 = C95 * t14;
+    t17 = t16 + t10;
+    t8 = C95 * t9;
+    t18 = (-C94) * t14;
+    t2 = t8 + t18;
+    X[100] = t17;
+    X[219] = t2;
+    t3 = C96 * t4;
+    t19 = C97 * t12;
+    t7 = t3 + t19;
+    t15 = C97 * t4;
+    t16 = (-C96) * t12;
+    t10 = t15 + t16;
+    X[292] = t7;
+    X[27] = t10;
+    t9 = C98 * t0;
+    t14 = C99 * t13;
+    t8 = t9 + t14;
+    t18 = C99 * t0;
+    t17 = (-C98) * t13;
+    t2 = t18 + t17;
+    X[164] = t8;
+    X[155] = t2;
+    t3 = C100 * t11;
+    t19 = C101 * t5;
+    t4 = t3 + t19;
+    t12 = C101 * t11;
+    t15 = (-C100) * t5;
+    t16 = t12 + t15;
+    X[36] = t4;
+    X[283] = t16;
+    t7 = C102 * t1;
+    t10 = C103 * t6;
+    t9 = t7 + t10;
+    t14 = C103 * t1;
+    t0 = (-C102) * t6;
+    t13 = t14 + t0;
+    X[228] = t9;
+    X[91] = t13;
+    t18 = re[70];
+    t17 = im[70];
+    t8 = re[102];
+    t2 = im[102];
+    t3 = re[134];
+    t19 = im[134];
+    t11 = re[6];
+    t5 = im[6];
+    t12 = re[38];
+    t15 = im[38];
+    t4 = t8 + t12;
+    t16 = t2 + t15;
+    t7 = t3 + t11;
+    t10 = t19 + t5;
+    t1 = t8 - t12;
+    t6 = t2 - t15;
+    t14 = t3 - t11;
+    t0 = t19 - t5;
+    t9 = t4 + t7;
+    t13 = t16 + t10;
+    t8 = t4 - t7;
+    t12 = C0 * t8;
+    t2 = t16 - t10;
+    t15 = C0 * t2;
+    t3 = C1 * t9;
+    t11 = t18 - t3;
+    t19 = C1 * t13;
+    t5 = t17 - t19;
+    t4 = t11 + t12;
+    t7 = t5 + t15;
+    t8 = t11 - t12;
+    t16 = t5 - t15;
+    t10 = C2 * t1;
+    t2 = C3 * t14;
+    t3 = t10 + t2;
+    t19 = C2 * t6;
+    t11 = C3 * t0;
+    t12 = t19 + t11;
+    t5 = C3 * t1;
+    t15 = C2 * t14;
+    t10 = t5 - t15;
+    t2 = C3 * t6;
+    t19 = C2 * t0;
+    t11 = t2 - t19;
+    t1 = t18 + t9;
+    t14 = t17 + t13;
+    t5 = t4 + t12;
+    t15 = t7 - t3;
+    t6 = t8 + t11;
+    t0 = t16 - t10;
+    t2 = t8 - t11;
+    t19 = t16 + t10;
+    t18 = t4 - t12;
+    t9 = t7 + t3;
+    t17 = C104 * t1;
+    t13 = C105 * t14;
+    t8 = t17 + t13;
+    t11 = C105 * t1;
+    t16 = (-C104) * t14;
+    t10 = t11 + t16;
+    X[230] = t8;
+    X[89] = t10;
+    t4 = C106 * t5;
+    t12 = C107 * t15;
+    t7 = t4 + t12;
+    t3 = C107 * t5;
+    t17 = (-C106) * t15;
+    t13 = t3 + t17;
+    X[102] = t7;
+    X[217] = t13;
+    t1 = C108 * t6;
+    t14 = C109 * t0;
+    t11 = t1 + t14;
+    t16 = C109 * t6;
+    t8 = (-C108) * t0;
+    t10 = t16 + t8;
+    X[294] = t11;
+    X[25] = t10;
+    t4 = C110 * t2;
+    t12 = C111 * t19;
+    t5 = t4 + t12;
+    t15 = C111 * t2;
+    t3 = (-C110) * t19;
+    t17 = t15 + t3;
+    X[166] = t5;
+    X[153] = t17;
+    t7 = C112 * t18;
+    t13 = C113 * t9;
+    t1 = t7 + t13;
+    t14 = C113 * t18;
+    t6 = (-C112) * t9;
+    t0 = t14 + t6;
+    X[38] = t1;
+    X[281] = t0;
+    t16 = re[90];
+    t8 = im[90];
+    t11 = re[122];
+    t10 = im[122];
+    t4 = re[154];
+    t12 = im[154];
+    t2 = re[26];
+    t19 = im[26];
+    t15 = re[58];
+    t3 = im[58];
+    t5 = t11 + t15;
+    t17 = t10 + t3;
+    t7 = t4 + t2;
+    t13 = t12 + t19;
+    t18 = t11 - t15;
+    t9 = t10 - t3;
+    t14 = t4 - t2;
+    t6 = t12 - t19;
+    t1 = t5 + t7;
+    t0 = t17 + t13;
+    t11 = t5 - t7;
+    t15 = C0 * t11;
+    t10 = t17 - t13;
+    t3 = C0 * t10;
+    t4 = C1 * t1;
+    t2 = t16 - t4;
+    t12 = C1 * t0;
+    t19 = t8 - t12;
+    t5 = t2 + t15;
+    t7 = t19 + t3;
+    t11 = t2 - t15;
+    t17 = t19 - t3;
+    t13 = C2 * t18;
+    t10 = C3 * t14;
+    t4 = t13 + t10;
+    t12 = C2 * t9;
+    t2 = C3 * t6;
+    t15 = t12 + t2;
+    t19 = C3 * t18;
+    t3 = C2 * t14;
+    t13 = t19 - t3;
+    t10 = C3 * t9;
+    t12 = C2 * t6;
+    t2 = t10 - t12;
+    t18 = t16 + t1;
+    t14 = t8 + t0;
+    t19 = t5 + t15;
+    t3 = t7 - t4;
+    t9 = t11 + t2;
+    t6 = t17 - t13;
+    t10 = t11 - t2;
+    t12 = t17 + t13;
+    t16 = t5 - t15;
+    t1 = t7 + t4;
+    t8 = C114 * t18;
+    t0 = C115 * t14;
+    t11 = t8 + t0;
+    t2 = C115 * t18;
+    t17 = (-C114) * t14;
+    t13 = t2 + t17;
+    X[40] = t11;
+    X[279] = t13;
+    t5 = C116 * t19;
+    t15 = C117 * t3;
+    t7 = t5 + t15;
+    t4 = C117 * t19;
+    t8 = (-C116) * t3;
+    t0 = t4 + t8;
+    X[232] = t7;
+    X[87] = t0;
+    t18 = C118 * t9;
+    t14 = C119 * t6;
+    t2 = t18 + t14;
+    t17 = C119 * t9;
+    t11 = (-C118) * t6;
+    t13 = t17 + t11;
+    X[104] = t2;
+    X[215] = t13;
+    t5 = C120 * t10;
+    t15 = C121 * t12;
+    t19 = t5 + t15;
+    t3 = C121 * t10;
+    t4 = (-C120) * t12;
+    t8 = t3 + t4;
+    X[296] = t19;
+    X[23] = t8;
+    t7 = C122 * t16;
+    t0 = C123 * t1;
+    t18 = t7 + t0;
+    t14 = C123 * t16;
+    t9 = (-C122) * t1;
+    t6 = t14 + t9;
+    X[168] = t18;
+    X[151] = t6;
+    t17 = re[110];
+    t11 = im[110];
+    t2 = re[142];
+    t13 = im[142];
+    t5 = re[14];
+    t15 = im[14];
+    t10 = re[46];
+    t12 = im[46];
+    t3 = re[78];
+    t4 = im[78];
+    t19 = t2 + t3;
+    t8 = t13 + t4;
+    t7 = t5 + t10;
+    t0 = t15 + t12;
+    t16 = t2 - t3;
+    t1 = t13 - t4;
+    t14 = t5 - t10;
+    t9 = t15 - t12;
+    t18 = t19 + t7;
+    t6 = t8 + t0;
+    t2 = t19 - t7;
+    t3 = C0 * t2;
+    t13 = t8 - t0;
+    t4 = C0 * t13;
+    t5 = C1 * t18;
+    t10 = t17 - t5;
+    t15 = C1 * t6;
+    t12 = t11 - t15;
+    t19 = t10 + t3;
+    t7 = t12 + t4;
+    t2 = t10 - t3;
+    t8 = t12 - t4;
+    t0 = C2 * t16;
+    t13 = C3 * t14;
+    t5 = t0 + t13;
+    t15 = C2 * t1;
+    t10 = C3 * t9;
+    t3 = t15 + t10;
+    t12 = C3 * t16;
+    t4 = C2 * t14;
+    t0 = t12 - t4;
+    t13 = C3 * t1;
+    t15 = C2 * t9;
+    t10 = t13 - t15;
+    t16 = t17 + t18;
+    t14 = t11 + t6;
+    t12 = t19 + t3;
+    t4 = t7 - t5;
+    t1 = t2 + t10;
+    t9 = t8 - t0;
+    t13 = t2 - t10;
+    t15 = t8 + t0;
+    t17 = t19 - t3;
+    t18 = t7 + t5;
+    t11 = C124 * t16;
+    t6 = C125 * t14;
+    t2 = t11 + t6;
+    t10 = C125 * t16;
+    t8 = (-C124) * t14;
+    t0 = t10 + t8;
+    X[170] = t2;
+    X[149] = t0;
+    t19 = C126 * t12;
+    t3 = C127 * t4;
+    t7 = t19 + t3;
+    t5 = C127 * t12;
+    t11 = (-C126) * t4;
+    t6 = t5 + t11;
+    X[42] = t7;
+    X[277] = t6;
+    t16 = C128 * t1;
+    t14 = C129 * t9;
+    t10 = t16 + t14;
+    t8 = C129 * t1;
+    t2 = (-C128) * t9;
+    t0 = t8 + t2;
+    X[234] = t10;
+    X[85] = t0;
+    t19 = C130 * t13;
+    t3 = C131 * t15;
+    t12 = t19 + t3;
+    t4 = C131 * t13;
+    t5 = (-C130) * t15;
+    t11 = t4 + t5;
+    X[106] = t12;
+    X[213] = t11;
+    t7 = C132 * t17;
+    t6 = C133 * t18;
+    t16 = t7 + t6;
+    t14 = C133 * t17;
+    t1 = (-C132) * t18;
+    t9 = t14 + t1;
+    X[298] = t16;
+    X[21] = t9;
+    t8 = re[130];
+    t2 = im[130];
+    t10 = re[2];
+    t0 = im[2];
+    t19 = re[34];
+    t3 = im[34];
+    t13 = re[66];
+    t15 = im[66];
+    t4 = re[98];
+    t5 = im[98];
+    t12 = t10 + t4;
+    t11 = t0 + t5;
+    t7 = t19 + t13;
+    t6 = t3 + t15;
+    t17 = t10 - t4;
+    t18 = t0 - t5;
+    t14 = t19 - t13;
+    t1 = t3 - t15;
+    t16 = t12 + t7;
+    t9 = t11 + t6;
+    t10 = t12 - t7;
+    t4 = C0 * t10;
+    t0 = t11 - t6;
+    t5 = C0 * t0;
+    t19 = C1 * t16;
+    t13 = t8 - t19;
+    t3 = C1 * t9;
+    t15 = t2 - t3;
+    t12 = t13 + t4;
+    t7 = t15 + t5;
+    t10 = t13 - t4;
+    t11 = t15 - t5;
+    t6 = C2 * t17;
+    t0 = C3 * t14;
+    t19 = t6 + t0;
+    t3 = C2 * t18;
+    t13 = C3 * t1;
+    t4 = t3 + t13;
+    t15 = C3 * t17;
+    t5 = C2 * t14;
+    t6 = t15 - t5;
+    t0 = C3 * t18;
+    t3 = C2 * t1;
+    t13 = t0 - t3;
+    t17 = t8 + t16;
+    t14 = t2 + t9;
+    t15 = t12 + t4;
+    t5 = t7 - t19;
+    t18 = t10 + t13;
+    t1 = t11 - t6;
+    t0 = t10 - t13;
+    t3 = t11 + t6;
+    t8 = t12 - t4;
+    t16 = t7 + t19;
+    t2 = C134 * t17;
+    t9 = C135 * t14;
+    t10 = t2 + t9;
+    t13 = C135 * t17;
+    t11 = (-C134) * t14;
+    t6 = t13 + t11;
+    X[300] = t10;
+    X[19] = t6;
+    t12 = C136 * t15;
+    t4 = C137 * t5;
+    t7 = t12 + t4;
+    t19 = C137 * t15;
+    t2 = (-C136) * t5;
+    t9 = t19 + t2;
+    X[172] = t7;
+    X[147] = t9;
+    t17 = C138 * t18;
+    t14 = C139 * t1;
+    t13 = t17 + t14;
+    t11 = C139 * t18;
+    t10 = (-C138) * t1;
+    t6 = t11 + t10;
+    X[44] = t13;
+    X[275] = t6;
+    t12 = C140 * t0;
+    t4 = C141 * t3;
+    t15 = t12 + t4;
+    t5 = C141 * t0;
+    t19 = (-C140) * t3;
+    t2 = t5 + t19;
+    X[236] = t15;
+    X[83] = t2;
+    t7 = C142 * t8;
+    t9 = C143 * t16;
+    t17 = t7 + t9;
+    t14 = C143 * t8;
+    t18 = (-C142) * t16;
+    t1 = t14 + t18;
+    X[108] = t17;
+    X[211] = t1;
+    t11 = re[150];
+    t10 = im[150];
+    t13 = re[22];
+    t6 = im[22];
+    t12 = re[54];
+    t4 = im[54];
+    t0 = re[86];
+    t3 = im[86];
+    t5 = re[118];
+    t19 = im[118];
+    t15 = t13 + t5;
+    t2 = t6 + t19;
+    t7 = t12 + t0;
+    t9 = t4 + t3;
+    t8 = t13 - t5;
+    t16 = t6 - t19;
+    t14 = t12 - t0;
+    t18 = t4 - t3;
+    t17 = t15 + t7;
+    t1 = t2 + t9;
+    t13 = t15 - t7;
+    t5 = C0 * t13;
+    t6 = t2 - t9;
+    t19 = C0 * t6;
+    t12 = C1 * t17;
+    t0 = t11 - t12;
+    t4 = C1 * t1;
+    t3 = t10 - t4;
+    t15 = t0 + t5;
+    t7 = t3 + t19;
+    t13 = t0 - t5;
+    t2 = t3 - t19;
+    t9 = C2 * t8;
+    t6 = C3 * t14;
+    t12 = t9 + t6;
+    t4 = C2 * t16;
+    t0 = C3 * t18;
+    t5 = t4 + t0;
+    t3 = C3 * t8;
+    t19 = C2 * t14;
+    t9 = t3 - t19;
+    t6 = C3 * t16;
+    t4 = C2 * t18;
+    t0 = t6 - t4;
+    t8 = t11 + t17;
+    t14 = t10 + t1;
+    t3 = t15 + t5;
+    t19 = t7 - t12;
+    t16 = t13 + t0;
+    t18 = t2 - t9;
+    t6 = t13 - t0;
+    t4 = t2 + t9;
+    t11 = t15 - t5;
+    t17 = t7 + t12;
+    t10 = C144 * t8;
+    t1 = C145 * t14;
+    t13 = t10 + t1;
+    t0 = C145 * t8;
+    t2 = (-C144) * t14;
+    t9 = t0 + t2;
+    X[110] = t13;
+    X[209] = t9;
+    t15 = C146 * t3;
+    t5 = C147 * t19;
+    t7 = t15 + t5;
+    t12 = C147 * t3;
+    t10 = (-C146) * t19;
+    t1 = t12 + t10;
+    X[302] = t7;
+    X[17] = t1;
+    t8 = C148 * t16;
+    t14 = C149 * t18;
+    t0 = t8 + t14;
+    t2 = C149 * t16;
+    t13 = (-C148) * t18;
+    t9 = t2 + t13;
+    X[174] = t0;
+    X[145] = t9;
+    t15 = C150 * t6;
+    t5 = C151 * t4;
+    t3 = t15 + t5;
+    t19 = C151 * t6;
+    t12 = (-C150) * t4;
+    t10 = t19 + t12;
+    X[46] = t3;
+    X[273] = t10;
+    t7 = C152 * t11;
+    t1 = C153 * t17;
+    t8 = t7 + t1;
+    t14 = C153 * t11;
+    t16 = (-C152) * t17;
+    t18 = t14 + t16;
+    X[238] = t8;
+    X[81] = t18;
+    t2 = re[15];
+    t13 = im[15];
+    t0 = re[47];
+    t9 = im[47];
+    t15 = re[79];
+    t5 = im[79];
+    t6 = re[111];
+    t4 = im[111];
+    t19 = re[143];
+    t12 = im[143];
+    t3 = t0 + t19;
+    t10 = t9 + t12;
+    t7 = t15 + t6;
+    t1 = t5 + t4;
+    t11 = t0 - t19;
+    t17 = t9 - t12;
+    t14 = t15 - t6;
+    t16 = t5 - t4;
+    t8 = t3 + t7;
+    t18 = t10 + t1;
+    t0 = t3 - t7;
+    t19 = C0 * t0;
+    t9 = t10 - t1;
+    t12 = C0 * t9;
+    t15 = C1 * t8;
+    t6 = t2 - t15;
+    t5 = C1 * t18;
+    t4 = t13 - t5;
+    t3 = t6 + t19;
+    t7 = t4 + t12;
+    t0 = t6 - t19;
+    t10 = t4 - t12;
+    t1 = C2 * t11;
+    t9 = C3 * t14;
+    t15 = t1 + t9;
+    t5 = C2 * t17;
+    t6 = C3 * t16;
+    t19 = t5 + t6;
+    t4 = C3 * t11;
+    t12 = C2 * t14;
+    t1 = t4 - t12;
+    t9 = C3 * t17;
+    t5 = C2 * t16;
+    t6 = t9 - t5;
+    t11 = t2 + t8;
+    t14 = t13 + t18;
+    t4 = t3 + t19;
+    t12 = t7 - t15;
+    t17 = t0 + t6;
+    t16 = t10 - t1;
+    t9 = t0 - t6;
+    t5 = t10 + t1;
+    t2 = t3 - t19;
+    t8 = t7 + t15;
+    t13 = C154 * t11;
+    t18 = C155 * t14;
+    t0 = t13 + t18;
+    t6 = C155 * t11;
+    t10 = (-C154) * t14;
+    t1 = t6 + t10;
+    X[240] = t0;
+    X[79] = t1;
+    t3 = C156 * t4;
+    t19 = C157 * t12;
+    t7 = t3 + t19;
+    t15 = C157 * t4;
+    t13 = (-C156) * t12;
+    t18 = t15 + t13;
+    X[112] = t7;
+    X[207] = t18;
+    t11 = C158 * t17;
+    t14 = C159 * t16;
+    t6 = t11 + t14;
+    t10 = C159 * t17;
+    t0 = (-C158) * t16;
+    t1 = t10 + t0;
+    X[304] = t6;
+    X[15] = t1;
+    t3 = C160 * t9;
+    t19 = C161 * t5;
+    t4 = t3 + t19;
+    t12 = C161 * t9;
+    t15 = (-C160) * t5;
+    t13 = t12 + t15;
+    X[176] = t4;
+    X[143] = t13;
+    t7 = C162 * t2;
+    t18 = C163 * t8;
+    t11 = t7 + t18;
+    t14 = C163 * t2;
+    t17 = (-C162) * t8;
+    t16 = t14 + t17;
+    X[48] = t11;
+    X[271] = t16;
+    t10 = re[35];
+    t0 = im[35];
+    t6 = re[67];
+    t1 = im[67];
+    t3 = re[99];
+    t19 = im[99];
+    t9 = re[131];
+    t5 = im[131];
+    t12 = re[3];
+    t15 = im[3];
+    t4 = t6 + t12;
+    t13 = t1 + t15;
+    t7 = t3 + t9;
+    t18 = t19 + t5;
+    t2 = t6 - t12;
+    t8 = t1 - t15;
+    t14 = t3 - t9;
+    t17 = t19 - t5;
+    t11 = t4 + t7;
+    t16 = t13 + t18;
+    t6 = t4 - t7;
+    t12 = C0 * t6;
+    t1 = t13 - t18;
+    t15 = C0 * t1;
+    t3 = C1 * t11;
+    t9 = t10 - t3;
+    t19 = C1 * t16;
+    t5 = t0 - t19;
+    t4 = t9 + t12;
+    t7 = t5 + t15;
+    t6 = t9 - t12;
+    t13 = t5 - t15;
+    t18 = C2 * t2;
+    t1 = C3 * t14;
+    t3 = t18 + t1;
+    t19 = C2 * t8;
+    t9 = C3 * t17;
+    t12 = t19 + t9;
+    t5 = C3 * t2;
+    t15 = C2 * t14;
+    t18 = t5 - t15;
+    t1 = C3 * t8;
+    t19 = C2 * t17;
+    t9 = t1 - t19;
+    t2 = t10 + t11;
+    t14 = t0 + t16;
+    t5 = t4 + t12;
+    t15 = t7 - t3;
+    t8 = t6 + t9;
+    t17 = t13 - t18;
+    t1 = t6 - t9;
+    t19 = t13 + t18;
+    t10 = t4 - t12;
+    t11 = t7 + t3;
+    t0 = C164 * t2;
+    t16 = C165 * t14;
+    t6 = t0 + t16;
+    t9 = C165 * t2;
+    t13 = (-C164) * t14;
+    t18 = t9 + t13;
+    X[50] = t6;
+    X[269] = t18;
+    t4 = C166 * t5;
+    t12 = C167 * t15;
+    t7 = t4 + t12;
+    t3 = C167 * t5;
+    t0 = (-C166) * t15;
+    t16 = t3 + t0;
+    X[242] = t7;
+    X[77] = t16;
+    t2 = C168 * t8;
+    t14 = C169 * t17;
+    t9 = t2 + t14;
+    t13 = C169 * t8;
+    t6 = (-C168) * t17;
+    t18 = t13 + t6;
+    X[114] = t9;
+    X[205] = t18;
+    t4 = C170 * t1;
+    t12 = C171 * t19;
+    t5 = t4 + t12;
+    t15 = C171 * t1;
+    t3 = (-C170) * t19;
+    t0 = t15 + t3;
+    X[306] = t5;
+    X[13] = t0;
+    t7 = C172 * t10;
+    t16 = C173 * t11;
+    t2 = t7 + t16;
+    t14 = C173 * t10;
+    t8 = (-C172) * t11;
+    t17 = t14 + t8;
+    X[178] = t2;
+    X[141] = t17;
+    t13 = re[55];
+    t6 = im[55];
+    t9 = re[87];
+    t18 = im[87];
+    t4 = re[119];
+    t12 = im[119];
+    t1 = re[151];
+    t19 = im[151];
+    t15 = re[23];
+    t3 = im[23];
+    t5 = t9 + t15;
+    t0 = t18 + t3;
+    t7 = t4 + t1;
+    t16 = t12 + t19;
+    t10 = t9 - t15;
+    t11 = t18 - t3;
+    t14 = t4 - t1;
+    t8 = t12 - t19;
+    t2 = t5 + t7;
+    t17 = t0 + t16;
+    t9 = t5 - t7;
+    t15 = C0 * t9;
+    t18 = t0 - t16;
+    t3 = C0 * t18;
+    t4 = C1 * t2;
+    t1 = t13 - t4;
+    t12 = C1 * t17;
+    t19 = t6 - t12;
+    t5 = t1 + t15;
+    t7 = t19 + t3;
+    t9 = t1 - t15;
+    t0 = t19 - t3;
+    t16 = C2 * t10;
+    t18 = C3 * t14;
+    t4 = t16 + t18;
+    t12 = C2 * t11;
+    t1 = C3 * t8;
+    t15 = t12 + t1;
+    t19 = C3 * t10;
+    t3 = C2 * t14;
+    t16 = t19 - t3;
+    t18 = C3 * t11;
+    t12 = C2 * t8;
+    t1 = t18 - t12;
+    t10 = t13 + t2;
+    t14 = t6 + t17;
+    t19 = t5 + t15;
+    t3 = t7 - t4;
+    t11 = t9 + t1;
+    t8 = t0 - t16;
+    t18 = t9 - t1;
+    t12 = t0 + t16;
+    t13 = t5 - t15;
+    t2 = t7 + t4;
+    t6 = C174 * t10;
+    t17 = C175 * t14;
+    t9 = t6 + t17;
+    t1 = C175 * t10;
+    t0 = (-C174) * t14;
+    t16 = t1 + t0;
+    X[180] = t9;
+    X[139] = t16;
+    t5 = C176 * t19;
+    t15 = C177 * t3;
+    t7 = t5 + t15;
+    t4 = C177 * t19;
+    t6 = (-C176) * t3;
+    t17 = t4 + t6;
+    X[52] = t7;
+    X[267] = t17;
+    t10 = C178 * t11;
+    t14 = C179 * t8;
+    t1 = t10 + t14;
+    t0 = C179 * t11;
+    t9 = (-C178) * t8;
+    t16 = t0 + t9;
+    X[244] = t1;
+    X[75] = t16;
+    t5 = C180 * t18;
+    t15 = C181 * t12;
+    t19 = t5 + t15;
+    t3 = C181 * t18;
+    t4 = (-C180) * t12;
+    t6 = t3 + t4;
+    X[116] = t19;
+    X[203] = t6;
+    t7 = C182 * t13;
+    t17 = C183 * t2;
+    t10 = t7 + t17;
+    t14 = C183 * t13;
+    t11 = (-C182) * t2;
+    t8 = t14 + t11;
+    X[308] = t10;
+    X[11] = t8;
+    t0 = re[75];
+    t9 = im[75];
+    t1 = re[107];
+    t16 = im[107];
+    t5 = re[139];
+    t15 = im[139];
+    t18 = re[11];
+    t12 = im[11];
+    t3 = re[43];
+    t4 = im[43];
+    t19 = t1 + t3;
+    t6 = t16 + t4;
+    t7 = t5 + t18;
+    t17 = t15 + t12;
+    t13 = t1 - t3;
+    t2 = t16 - t4;
+    t14 = t5 - t18;
+    t11 = t15 - t12;
+    t10 = t19 + t7;
+    t8 = t6 + t17;
+    t1 = t19 - t7;
+    t3 = C0 * t1;
+    t16 = t6 - t17;
+    t4 = C0 * t16;
+    t5 = C1 * t10;
+    t18 = t0 - t5;
+    t15 = C1 * t8;
+    t12 = t9 - t15;
+    t19 = t18 + t3;
+    t7 = t12 + t4;
+    t1 = t18 - t3;
+    t6 = t12 - t4;
+    t17 = C2 * t13;
+    t16 = C3 * t14;
+    t5 = t17 + t16;
+    t15 = C2 * t2;
+    t18 = C3 * t11;
+    t3 = t15 + t18;
+    t12 = C3 * t13;
+    t4 = C2 * t14;
+    t17 = t12 - t4;
+    t16 = C3 * t2;
+    t15 = C2 * t11;
+    t18 = t16 - t15;
+    t13 = t0 + t10;
+    t14 = t9 + t8;
+    t12 = t19 + t3;
+    t4 = t7 - t5;
+    t2 = t1 + t18;
+    t11 = t6 - t17;
+    t16 = t1 - t18;
+    t15 = t6 + t17;
+    t0 = t19 - t3;
+    t10 = t7 + t5;
+    t9 = C184 * t13;
+    t8 = C185 * t14;
+    t1 = t9 + t8;
+    t18 = C185 * t13;
+    t6 = (-C184) * t14;
+    t17 = t18 + t6;
+    X[310] = t1;
+    X[9] = t17;
+    t19 = C186 * t12;
+    t3 = C187 * t4;
+    t7 = t19 + t3;
+    t5 = C187 * t12;
+    t9 = (-C186) * t4;
+    t8 = t5 + t9;
+    X[182] = t7;
+    X[137] = t8;
+    t13 = C188 * t2;
+    t14 = C189 * t11;
+    t18 = t13 + t14;
+    t6 = C189 * t2;
+    t1 = (-C188) * t11;
+    t17 = t6 + t1;
+    X[54] = t18;
+    X[265] = t17;
+    t19 = C190 * t16;
+    t3 = C191 * t15;
+    t12 = t19 + t3;
+    t4 = C191 * t16;
+    t5 = (-C190) * t15;
+    t9 = t4 + t5;
+    X[246] = t12;
+    X[73] = t9;
+    t7 = C192 * t0;
+    t8 = C193 * t10;
+    t13 = t7 + t8;
+    t14 = C193 * t0;
+    t2 = (-C192) * t10;
+    t11 = t14 + t2;
+    X[118] = t13;
+    X[201] = t11;
+    t6 = re[95];
+    t1 = im[95];
+    t18 = re[127];
+    t17 = im[127];
+    t19 = re[159];
+    t3 = im[159];
+    t16 = re[31];
+    t15 = im[31];
+    t4 = re[63];
+    t5 = im[63];
+    t12 = t18 + t4;
+    t9 = t17 + t5;
+    t7 = t19 + t16;
+    t8 = t3 + t15;
+    t0 = t18 - t4;
+    t10 = t17 - t5;
+    t14 = t19 - t16;
+    t2 = t3 - t15;
+    t13 = t12 + t7;
+    t11 = t9 + t8;
+    t18 = t12 - t7;
+    t4 = C0 * t18;
+    t17 = t9 - t8;
+    t5 = C0 * t17;
+    t19 = C1 * t13;
+    t16 = t6 - t19;
+    t3 = C1 * t11;
+    t15 = t1 - t3;
+    t12 = t16 + t4;
+    t7 = t15 + t5;
+    t18 = t16 - t4;
+    t9 = t15 - t5;
+    t8 = C2 * t0;
+    t17 = C3 * t14;
+    t19 = t8 + t17;
+    t3 = C2 * t10;
+    t16 = C3 * t2;
+    t4 = t3 + t16;
+    t15 = C3 * t0;
+    t5 = C2 * t14;
+    t8 = t15 - t5;
+    t17 = C3 * t10;
+    t3 = C2 * t2;
+    t16 = t17 - t3;
+    t0 = t6 + t13;
+    t14 = t1 + t11;
+    t15 = t12 + t4;
+    t5 = t7 - t19;
+    t10 = t18 + t16;
+    t2 = t9 - t8;
+    t17 = t18 - t16;
+    t3 = t9 + t8;
+    t6 = t12 - t4;
+    t13 = t7 + t19;
+    t1 = C194 * t0;
+    t11 = C195 * t14;
+    t18 = t1 + t11;
+    t16 = C195 * t0;
+    t9 = (-C194) * t14;
+    t8 = t16 + t9;
+    X[120] = t18;
+    X[199] = t8;
+    t12 = C196 * t15;
+    t4 = C197 * t5;
+    t7 = t12 + t4;
+    t19 = C197 * t15;
+    t1 = (-C196) * t5;
+    t11 = t19 + t1;
+    X[312] = t7;
+    X[7] = t11;
+    t0 = C198 * t10;
+    t14 = C199 * t2;
+    t16 = t0 + t14;
+    t9 = C199 * t10;
+    t18 = (-C198) * t2;
+    t8 = t9 + t18;
+    X[184] = t16;
+    X[135] = t8;
+    t12 = C200 * t17;
+    t4 = C201 * t3;
+    t15 = t12 + t4;
+    t5 = C201 * t17;
+    t19 = (-C200) * t3;
+    t1 = t5 + t19;
+    X[56] = t15;
+    X[263] = t1;
+    t7 = C202 * t6;
+    t11 = C203 * t13;
+    t0 = t7 + t11;
+    t14 = C203 * t6;
+    t10 = (-C202) * t13;
+    t2 = t14 + t10;
+    X[248] = t0;
+    X[71] = t2;
+    t9 = re[115];
+    t18 = im[115];
+    t16 = re[147];
+    t8 = im[147];
+    t12 = re[19];
+    t4 = im[19];
+    t17 = re[51];
+    t3 = im[51];
+    t5 = re[83];
+    t19 = im[83];
+    t15 = t16 + t5;
+    t1 = t8 + t19;
+    t7 = t12 + t17;
+    t11 = t4 + t3;
+    t6 = t16 - t5;
+    t13 = t8 - t19;
+    t14 = t12 - t17;
+    t10 = t4 - t3;
+    t0 = t15 + t7;
+    t2 = t1 + t11;
+    t16 = t15 - t7;
+    t5 = C0 * t16;
+    t8 = t1 - t11;
+    t19 = C0 * t8;
+    t12 = C1 * t0;
+    t17 = t9 - t12;
+    t4 = C1 * t2;
+    t3 = t18 - t4;
+    t15 = t17 + t5;
+    t7 = t3 + t19;
+    t16 = t17 - t5;
+    t1 = t3 - t19;
+    t11 = C2 * t6;
+    t8 = C3 * t14;
+    t12 = t11 + t8;
+    t4 = C2 * t13;
+    t17 = C3 * t10;
+    t5 = t4 + t17;
+    t3 = C3 * t6;
+    t19 = C2 * t14;
+    t11 = t3 - t19;
+    t8 = C3 * t13;
+    t4 = C2 * t10;
+    t17 = t8 - t4;
+    t6 = t9 + t0;
+    t14 = t18 + t2;
+    t3 = t15 + t5;
+    t19 = t7 - t12;
+    t13 = t16 + t17;
+    t10 = t1 - t11;
+    t8 = t16 - t17;
+    t4 = t1 + t11;
+    t9 = t15 - t5;
+    t0 = t7 + t12;
+    t18 = C204 * t6;
+    t2 = C205 * t14;
+    t16 = t18 + t2;
+    t17 = C205 * t6;
+    t1 = (-C204) * t14;
+    t11 = t17 + t1;
+    X[250] = t16;
+    X[69] = t11;
+    t15 = C206 * t3;
+    t5 = C207 * t19;
+    t7 = t15 + t5;
+    t12 = C207 * t3;
+    t18 = (-C206) * t19;
+    t2 = t12 + t18;
+    X[122] = t7;
+    X[197] = t2;
+    t6 = C208 * t13;
+    t14 = C209 * t10;
+    t17 = t6 + t14;
+    t1 = C209 * t13;
+    t16 = (-C208) * t10;
+    t11 = t1 + t16;
+    X[314] = t17;
+    X[5] = t11;
+    t15 = C210 * t8;
+    t5 = C211 * t4;
+    t3 = t15 + t5;
+    t19 = C211 * t8;
+    t12 = (-C210) * t4;
+    t18 = t19 + t12;
+    X[186] = t3;
+    X[133] = t18;
+    t7 = C212 * t9;
+    t2 = C213 * t0;
+    t6 = t7 + t2;
+    t14 = C213 * t9;
+    t13 = (-C212) * t0;
+    t10 = t14 + t13;
+    X[58] = t6;
+    X[261] = t10;
+}
+
+/**
+ *  Part 7 of ApplyWindowedMDCT_W10_320().
+ * 
+ *  @param {Number[]} x 
+ *    - The input block (640 points).
+ *  @param {Number[]} X 
+ *    - The array that would contain the output block (320 points).
+ *  @param {Number[]} re 
+ *    - The scratch buffer (real part, 160 points).
+ *  @param {Number[]} im 
+ *    - The scratch buffer (imaginary part, 160 points).
+ */
+function ApplyWindowedMDCT_W10_320_Part7(x, X, re, im) {
+    let t0, t1, t10, t11, t12, t13, t14, t15, t16, t17, t18, t19, t2, t3, t4, t5, t6, t7, t8, t9;
+    const C0 = 0.5590169943749475;
+    const C1 = 0.25;
+    const C2 = 0.9510565162951535;
+    const C3 = 0.5877852522924731;
+    const C4 = 0.9562249883902162;
+    const C5 = 0.29263248551405047;
+    const C6 = 0.3253102921622629;
+    const C7 = 0.9456073253805213;
+    const C8 = 0.8189955951227504;
+    const C9 = 0.5737998040863485;
+    const C10 = 0.017179739630778748;
+    const C11 = 0.9998524173827948;
+    const C12 = 0.601597206726822;
+    const C13 = 0.7987995999363579;
+    const C14 = 0.5937261443724018;
+    const C15 = 0.804667176843123;
+    const C16 = 0.9533060403541939;
+    const C17 = 0.3020059493192281;
+    const C18 = 0.3160112860399338;
+    const C19 = 0.9487554306012626;
+    const C20 = 0.8133229509604061;
+    const C21 = 0.5818124933696911;
+    const C22 = 0.007363041249779567;
+    const C23 = 0.9999728924443673;
+    t1 = re[135];
+    t16 = im[135];
+    t17 = re[7];
+    t11 = im[7];
+    t15 = re[39];
+    t5 = im[39];
+    t8 = re[71];
+    t4 = im[71];
+    t19 = re[103];
+    t12 = im[103];
+    t3 = t17 + t19;
+    t18 = t11 + t12;
+    t7 = t15 + t8;
+    t2 = t5 + t4;
+    t9 = t17 - t19;
+    t0 = t11 - t12;
+    t14 = t15 - t8;
+    t13 = t5 - t4;
+    t6 = t3 + t7;
+    t10 = t18 + t2;
+    t17 = t3 - t7;
+    t19 = C0 * t17;
+    t11 = t18 - t2;
+    t12 = C0 * t11;
+    t15 = C1 * t6;
+    t8 = t1 - t15;
+    t5 = C1 * t10;
+    t4 = t16 - t5;
+    t3 = t8 + t19;
+    t7 = t4 + t12;
+    t17 = t8 - t19;
+    t18 = t4 - t12;
+    t2 = C2 * t9;
+    t11 = C3 * t14;
+    t15 = t2 + t11;
+    t5 = C2 * t0;
+    t8 = C3 * t13;
+    t19 = t5 + t8;
+    t4 = C3 * t9;
+    t12 = C2 * t14;
+    t2 = t4 - t12;
+    t11 = C3 * t0;
+    t5 = C2 * t13;
+    t8 = t11 - t5;
+    t9 = t1 + t6;
+    t14 = t16 + t10;
+    t4 = t3 + t19;
+    t12 = t7 - t15;
+    t0 = t17 + t8;
+    t13 = t18 - t2;
+    t11 = t17 - t8;
+    t5 = t18 + t2;
+    t1 = t3 - t19;
+    t6 = t7 + t15;
+    t16 = C4 * t9;
+    t10 = C5 * t14;
+    t17 = t16 + t10;
+    t8 = C5 * t9;
+    t18 = (-C4) * t14;
+    t2 = t8 + t18;
+    X[60] = t17;
+    X[259] = t2;
+    t3 = C6 * t4;
+    t19 = C7 * t12;
+    t7 = t3 + t19;
+    t15 = C7 * t4;
+    t16 = (-C6) * t12;
+    t10 = t15 + t16;
+    X[252] = t7;
+    X[67] = t10;
+    t9 = C8 * t0;
+    t14 = C9 * t13;
+    t8 = t9 + t14;
+    t18 = C9 * t0;
+    t17 = (-C8) * t13;
+    t2 = t18 + t17;
+    X[124] = t8;
+    X[195] = t2;
+    t3 = C10 * t11;
+    t19 = C11 * t5;
+    t4 = t3 + t19;
+    t12 = C11 * t11;
+    t15 = (-C10) * t5;
+    t16 = t12 + t15;
+    X[316] = t4;
+    X[3] = t16;
+    t7 = C12 * t1;
+    t10 = C13 * t6;
+    t9 = t7 + t10;
+    t14 = C13 * t1;
+    t0 = (-C12) * t6;
+    t13 = t14 + t0;
+    X[188] = t9;
+    X[131] = t13;
+    t18 = re[155];
+    t17 = im[155];
+    t8 = re[27];
+    t2 = im[27];
+    t3 = re[59];
+    t19 = im[59];
+    t11 = re[91];
+    t5 = im[91];
+    t12 = re[123];
+    t15 = im[123];
+    t4 = t8 + t12;
+    t16 = t2 + t15;
+    t7 = t3 + t11;
+    t10 = t19 + t5;
+    t1 = t8 - t12;
+    t6 = t2 - t15;
+    t14 = t3 - t11;
+    t0 = t19 - t5;
+    t9 = t4 + t7;
+    t13 = t16 + t10;
+    t8 = t4 - t7;
+    t12 = C0 * t8;
+    t2 = t16 - t10;
+    t15 = C0 * t2;
+    t3 = C1 * t9;
+    t11 = t18 - t3;
+    t19 = C1 * t13;
+    t5 = t17 - t19;
+    t4 = t11 + t12;
+    t7 = t5 + t15;
+    t8 = t11 - t12;
+    t16 = t5 - t15;
+    t10 = C2 * t1;
+    t2 = C3 * t14;
+    t3 = t10 + t2;
+    t19 = C2 * t6;
+    t11 = C3 * t0;
+    t12 = t19 + t11;
+    t5 = C3 * t1;
+    t15 = C2 * t14;
+    t10 = t5 - t15;
+    t2 = C3 * t6;
+    t19 = C2 * t0;
+    t11 = t2 - t19;
+    t1 = t18 + t9;
+    t14 = t17 + t13;
+    t5 = t4 + t12;
+    t15 = t7 - t3;
+    t6 = t8 + t11;
+    t0 = t16 - t10;
+    t2 = t8 - t11;
+    t19 = t16 + t10;
+    t18 = t4 - t12;
+    t9 = t7 + t3;
+    t17 = C14 * t1;
+    t13 = C15 * t14;
+    t8 = t17 + t13;
+    t11 = C15 * t1;
+    t16 = (-C14) * t14;
+    t10 = t11 + t16;
+    X[190] = t8;
+    X[129] = t10;
+    t4 = C16 * t5;
+    t12 = C17 * t15;
+    t7 = t4 + t12;
+    t3 = C17 * t5;
+    t17 = (-C16) * t15;
+    t13 = t3 + t17;
+    X[62] = t7;
+    X[257] = t13;
+    t1 = C18 * t6;
+    t14 = C19 * t0;
+    t11 = t1 + t14;
+    t16 = C19 * t6;
+    t8 = (-C18) * t0;
+    t10 = t16 + t8;
+    X[254] = t11;
+    X[65] = t10;
+    t4 = C20 * t2;
+    t12 = C21 * t19;
+    t5 = t4 + t12;
+    t15 = C21 * t2;
+    t3 = (-C20) * t19;
+    t17 = t15 + t3;
+    X[126] = t5;
+    X[193] = t17;
+    t7 = C22 * t18;
+    t13 = C23 * t9;
+    t1 = t7 + t13;
+    t14 = C23 * t18;
+    t6 = (-C22) * t9;
+    t0 = t14 + t6;
+    X[318] = t1;
+    X[1] = t0;
+}
+
+/**
+ *  Part 1 of ApplyWindowedIMDCT_W10_320().
+ * 
+ *  @param {Number[]} X 
+ *    - The input block (320 points).
+ *  @param {Number[]} y 
+ *    - The array that would contain the output block (640 points).
+ *  @param {Number[]} re 
+ *    - The scratch buffer (real part, 160 points).
+ *  @param {Number[]} im 
+ *    - The scratch buffer (imaginary part, 160 points).
+ */
+function ApplyWindowedIMDCT_W10_320_Part1(X, y, re, im) {
+    let t0, t1, t10, t11, t12, t13, t14, t15, t16, t17, t18, t19, t2, t3, t4, t5, t6, t7, t8, t9;
+    const C0 = 0.9807852804032304;
+    const C1 = 0.19509032201612825;
+    const C2 = 0.9238795325112867;
+    const C3 = 0.3826834323650898;
+    const C4 = 0.8314696123025452;
+    const C5 = 0.5555702330196022;
+    const C6 = 0.7071067811865476;
+    const C7 = 0.7071067811865475;
+    const C8 = 0.9987954562051724;
+    const C9 = 0.049067674327418015;
+    const C10 = 0.970031253194544;
+    const C11 = 0.24298017990326387;
+    const C12 = 0.9039892931234433;
+    const C13 = 0.4275550934302821;
+    const C14 = 0.8032075314806449;
+    const C15 = 0.5956993044924334;
+    const C16 = 0.6715589548470183;
+    const C17 = 0.7409511253549591;
+    const C18 = 0.5141027441932217;
+    const C19 = 0.8577286100002721;
+    const C20 = 0.33688985339222005;
+    const C21 = 0.9415440651830208;
+    const C22 = 0.14673047445536175;
+    const C23 = 0.989176509964781;
+    const C24 = 1.1758756024193586;
+    const C25 = 0.7856949583871022;
+    const C26 = 1.3065629648763766;
+    const C27 = 0.5411961001461969;
+    const C28 = 1.3870398453221475;
+    const C29 = 0.27589937928294306;
+    const C30 = 0.9951847266721969;
+    const C31 = 0.0980171403295606;
+    const C32 = 0.9569403357322088;
+    const C33 = 0.29028467725446233;
+    const C34 = 0.881921264348355;
+    const C35 = 0.47139673682599764;
+    const C36 = 0.773010453362737;
+    const C37 = 0.6343932841636455;
+    const C38 = 0.9510565162951535;
+    const C39 = 0.3090169943749474;
+    const C40 = 0.8724960070727972;
+    const C41 = 0.4886212414969549;
+    const C42 = 0.7604059656000309;
+    const C43 = 0.6494480483301837;
+    const C44 = 0.619093949309834;
+    const C45 = 0.785316930880745;
+    const C46 = 0.45399049973954675;
+    const C47 = 0.8910065241883679;
+    const C48 = 0.27144044986507426;
+    const C49 = 0.9624552364536473;
+    const C50 = 0.07845909572784494;
+    const C51 = 0.996917333733128;
+    const C52 = 0.9930684569549263;
+    const C53 = 0.11753739745783764;
+    const C54 = 0.9347481818282924;
+    const C55 = 0.3553109012804161;
+    const C56 = 0.8474695394742344;
+    const C57 = 0.5308440257395095;
+    const C58 = 0.7276231179845748;
+    const C59 = 0.6859771119901928;
+    const C60 = 0.5798145481265136;
+    const C61 = 0.8147484825274894;
+    const C62 = 0.4097240303476953;
+    const C63 = 0.9122095257974677;
+    const C64 = 0.22388804785849836;
+    const C65 = 0.974614868564045;
+    const C66 = 0.02944817324796316;
+    const C67 = 0.9995663085020212;
+    const C68 = 0.9861049757675088;
+    const C69 = 0.16612337814576547;
+    const C70 = 0.916187957117136;
+    const C71 = 0.40074883310314097;
+    const C72 = 0.8204014435255136;
+    const C73 = 0.5717879602276122;
+    const C74 = 0.6930873625456359;
+    const C75 = 0.7208535967029188;
+    const C76 = 0.5391383229110002;
+    const C77 = 0.8422172337162865;
+    const C78 = 0.36447049987914965;
+    const C79 = 0.9312149347588036;
+    const C80 = 0.1757962799343545;
+    const C81 = 0.9844265680898916;
+    const C82 = 0.9998072404820648;
+    const C83 = 0.0196336924606283;
+    const C84 = 0.9767658813208724;
+    const C85 = 0.21430915306505077;
+    const C86 = 0.895420555368697;
+    const C87 = 0.4452213258854682;
+    const C88 = 0.7913569286406602;
+    const C89 = 0.6113544074368165;
+    const C90 = 0.6568818989430413;
+    const C91 = 0.7539934819618695;
+    const C92 = 0.4971632662526543;
+    const C93 = 0.8676570098195441;
+    const C94 = 0.3183389280525497;
+    const C95 = 0.9479769653775104;
+    const C96 = 0.1272810033739132;
+    const C97 = 0.991866697787626;
+    const C98 = 0.9976395492470157;
+    const C99 = 0.06866825888437376;
+    const C100 = 0.9650736723115474;
+    const C101 = 0.26197863846333747;
+    t0 = X[0];
+    t1 = X[319];
+    t2 = X[40];
+    t3 = X[279];
+    t4 = C0 * t2;
+    t5 = C1 * t3;
+    t4 = t4 + t5;
+    t5 = (-C1) * t2;
+    t2 = C0 * t3;
+    t3 = t5 + t2;
+    t5 = X[80];
+    t2 = X[239];
+    t6 = C2 * t5;
+    t7 = C3 * t2;
+    t6 = t6 + t7;
+    t7 = (-C3) * t5;
+    t5 = C2 * t2;
+    t2 = t7 + t5;
+    t7 = X[120];
+    t5 = X[199];
+    t8 = C4 * t7;
+    t9 = C5 * t5;
+    t8 = t8 + t9;
+    t9 = (-C5) * t7;
+    t7 = C4 * t5;
+    t5 = t9 + t7;
+    t9 = X[160];
+    t7 = X[159];
+    t10 = C6 * t9;
+    t11 = C7 * t7;
+    t10 = t10 + t11;
+    t11 = (-C7) * t9;
+    t9 = C6 * t7;
+    t7 = t11 + t9;
+    t11 = X[200];
+    t9 = X[119];
+    t12 = C5 * t11;
+    t13 = C4 * t9;
+    t12 = t12 + t13;
+    t13 = (-C4) * t11;
+    t11 = C5 * t9;
+    t9 = t13 + t11;
+    t13 = X[240];
+    t11 = X[79];
+    t14 = C3 * t13;
+    t15 = C2 * t11;
+    t14 = t14 + t15;
+    t15 = (-C2) * t13;
+    t13 = C3 * t11;
+    t11 = t15 + t13;
+    t15 = X[280];
+    t13 = X[39];
+    t16 = C1 * t15;
+    t17 = C0 * t13;
+    t16 = t16 + t17;
+    t17 = (-C0) * t15;
+    t15 = C1 * t13;
+    t13 = t17 + t15;
+    t17 = t0 + t10;
+    t15 = t1 + t7;
+    t18 = t6 + t14;
+    t19 = t2 + t11;
+    t0 = t0 - t10;
+    t10 = t1 - t7;
+    t1 = t6 - t14;
+    t7 = t2 - t11;
+    t6 = t17 + t18;
+    t14 = t15 + t19;
+    t2 = t0 + t7;
+    t11 = t10 - t1;
+    t17 = t17 - t18;
+    t18 = t15 - t19;
+    t15 = t0 - t7;
+    t19 = t10 + t1;
+    t0 = t4 + t12;
+    t7 = t3 + t9;
+    t10 = t8 + t16;
+    t1 = t5 + t13;
+    t4 = t4 - t12;
+    t12 = t3 - t9;
+    t3 = t8 - t16;
+    t9 = t5 - t13;
+    t8 = t0 + t10;
+    t16 = t7 + t1;
+    t5 = t4 + t9;
+    t13 = t12 - t3;
+    t0 = t0 - t10;
+    t10 = t7 - t1;
+    t7 = t4 - t9;
+    t1 = t12 + t3;
+    t4 = t5 + t13;
+    t9 = t5 - t13;
+    t12 = C6 * t4;
+    t3 = (-C6) * t9;
+    t5 = t7 - t1;
+    t13 = t7 + t1;
+    t4 = (-C6) * t5;
+    t9 = (-C6) * t13;
+    t7 = t6 - t8;
+    t1 = t14 - t16;
+    t5 = t6 + t8;
+    t13 = t14 + t16;
+    t6 = t2 - t12;
+    t8 = t11 - t3;
+    t14 = t2 + t12;
+    t16 = t11 + t3;
+    t2 = t17 - t10;
+    t12 = t18 + t0;
+    t11 = t17 + t10;
+    t3 = t18 - t0;
+    t17 = t15 - t4;
+    t10 = t19 - t9;
+    t18 = t15 + t4;
+    t0 = t19 + t9;
+    re[0] = t5;
+    im[0] = t13;
+    re[20] = t14;
+    im[20] = t16;
+    re[40] = t11;
+    im[40] = t3;
+    re[60] = t18;
+    im[60] = t0;
+    re[80] = t7;
+    im[80] = t1;
+    re[100] = t6;
+    im[100] = t8;
+    re[120] = t2;
+    im[120] = t12;
+    re[140] = t17;
+    im[140] = t10;
+    t15 = X[10];
+    t4 = X[309];
+    t19 = C8 * t15;
+    t9 = C9 * t4;
+    t5 = t19 + t9;
+    t13 = (-C9) * t15;
+    t14 = C8 * t4;
+    t16 = t13 + t14;
+    t11 = X[50];
+    t3 = X[269];
+    t18 = C10 * t11;
+    t0 = C11 * t3;
+    t7 = t18 + t0;
+    t1 = (-C11) * t11;
+    t6 = C10 * t3;
+    t8 = t1 + t6;
+    t2 = X[90];
+    t12 = X[229];
+    t17 = C12 * t2;
+    t10 = C13 * t12;
+    t19 = t17 + t10;
+    t9 = (-C13) * t2;
+    t15 = C12 * t12;
+    t4 = t9 + t15;
+    t13 = X[130];
+    t14 = X[189];
+    t18 = C14 * t13;
+    t0 = C15 * t14;
+    t11 = t18 + t0;
+    t3 = (-C15) * t13;
+    t1 = C14 * t14;
+    t6 = t3 + t1;
+    t17 = X[170];
+    t10 = X[149];
+    t2 = C16 * t17;
+    t12 = C17 * t10;
+    t9 = t2 + t12;
+    t15 = (-C17) * t17;
+    t18 = C16 * t10;
+    t0 = t15 + t18;
+    t13 = X[210];
+    t14 = X[109];
+    t3 = C18 * t13;
+    t1 = C19 * t14;
+    t2 = t3 + t1;
+    t12 = (-C19) * t13;
+    t17 = C18 * t14;
+    t10 = t12 + t17;
+    t15 = X[250];
+    t18 = X[69];
+    t3 = C20 * t15;
+    t1 = C21 * t18;
+    t13 = t3 + t1;
+    t14 = (-C21) * t15;
+    t12 = C20 * t18;
+    t17 = t14 + t12;
+    t3 = X[290];
+    t1 = X[29];
+    t15 = C22 * t3;
+    t18 = C23 * t1;
+    t14 = t15 + t18;
+    t12 = (-C23) * t3;
+    t15 = C22 * t1;
+    t18 = t12 + t15;
+    t3 = t5 + t9;
+    t1 = t16 + t0;
+    t12 = t19 + t13;
+    t15 = t4 + t17;
+    t5 = t5 - t9;
+    t9 = t16 - t0;
+    t16 = t19 - t13;
+    t0 = t4 - t17;
+    t19 = t3 + t12;
+    t13 = t1 + t15;
+    t4 = t5 + t0;
+    t17 = t9 - t16;
+    t3 = t3 - t12;
+    t12 = t1 - t15;
+    t1 = t5 - t0;
+    t15 = t9 + t16;
+    t5 = t7 + t2;
+    t0 = t8 + t10;
+    t9 = t11 + t14;
+    t16 = t6 + t18;
+    t7 = t7 - t2;
+    t2 = t8 - t10;
+    t8 = t11 - t14;
+    t10 = t6 - t18;
+    t11 = t5 + t9;
+    t14 = t0 + t16;
+    t6 = t7 + t10;
+    t18 = t2 - t8;
+    t5 = t5 - t9;
+    t9 = t0 - t16;
+    t0 = t7 - t10;
+    t16 = t2 + t8;
+    t7 = t6 + t18;
+    t10 = t6 - t18;
+    t2 = C6 * t7;
+    t8 = (-C6) * t10;
+    t6 = t0 - t16;
+    t18 = t0 + t16;
+    t7 = (-C6) * t6;
+    t10 = (-C6) * t18;
+    t0 = t19 - t11;
+    t16 = t13 - t14;
+    t6 = t19 + t11;
+    t18 = t13 + t14;
+    t19 = t4 - t2;
+    t11 = t17 - t8;
+    t13 = t4 + t2;
+    t14 = t17 + t8;
+    t4 = t3 - t9;
+    t2 = t12 + t5;
+    t17 = t3 + t9;
+    t8 = t12 - t5;
+    t3 = t1 - t7;
+    t9 = t15 - t10;
+    t12 = t1 + t7;
+    t5 = t15 + t10;
+    t1 = t13 + t14;
+    t7 = C0 * t1;
+    t15 = t13 * (-C24);
+    t10 = t14 * C25;
+    t1 = t7 - t10;
+    t13 = t7 + t15;
+    t14 = t17 + t8;
+    t10 = C2 * t14;
+    t7 = t17 * (-C26);
+    t15 = t8 * C27;
+    t14 = t10 - t15;
+    t17 = t10 + t7;
+    t8 = t12 + t5;
+    t15 = C4 * t8;
+    t10 = t12 * (-C28);
+    t7 = t5 * C29;
+    t8 = t15 - t7;
+    t12 = t15 + t10;
+    t5 = t0 + t16;
+    t7 = t0 - t16;
+    t15 = C6 * t5;
+    t10 = (-C6) * t7;
+    t0 = t19 + t11;
+    t16 = C5 * t0;
+    t5 = t19 * (-C28);
+    t7 = t11 * (-C29);
+    t0 = t16 - t7;
+    t19 = t16 + t5;
+    t11 = t4 + t2;
+    t7 = C3 * t11;
+    t16 = t4 * (-C26);
+    t5 = t2 * (-C27);
+    t11 = t7 - t5;
+    t4 = t7 + t16;
+    t2 = t3 + t9;
+    t5 = C1 * t2;
+    t7 = t3 * (-C24);
+    t16 = t9 * (-C25);
+    t2 = t5 - t16;
+    t3 = t5 + t7;
+    re[5] = t6;
+    im[5] = t18;
+    re[25] = t1;
+    im[25] = t13;
+    re[45] = t14;
+    im[45] = t17;
+    re[65] = t8;
+    im[65] = t12;
+    re[85] = t15;
+    im[85] = t10;
+    re[105] = t0;
+    im[105] = t19;
+    re[125] = t11;
+    im[125] = t4;
+    re[145] = t2;
+    im[145] = t3;
+    t9 = X[20];
+    t16 = X[299];
+    t5 = C30 * t9;
+    t7 = C31 * t16;
+    t6 = t5 + t7;
+    t18 = (-C31) * t9;
+    t1 = C30 * t16;
+    t13 = t18 + t1;
+    t14 = X[60];
+    t17 = X[259];
+    t8 = C32 * t14;
+    t12 = C33 * t17;
+    t15 = t8 + t12;
+    t10 = (-C33) * t14;
+    t0 = C32 * t17;
+    t19 = t10 + t0;
+    t11 = X[100];
+    t4 = X[219];
+    t2 = C34 * t11;
+    t3 = C35 * t4;
+    t5 = t2 + t3;
+    t7 = (-C35) * t11;
+    t9 = C34 * t4;
+    t16 = t7 + t9;
+    t18 = X[140];
+    t1 = X[179];
+    t8 = C36 * t18;
+    t12 = C37 * t1;
+    t14 = t8 + t12;
+    t17 = (-C37) * t18;
+    t10 = C36 * t1;
+    t0 = t17 + t10;
+    t2 = X[180];
+    t3 = X[139];
+    t11 = C37 * t2;
+    t4 = C36 * t3;
+    t7 = t11 + t4;
+    t9 = (-C36) * t2;
+    t8 = C37 * t3;
+    t12 = t9 + t8;
+    t18 = X[220];
+    t1 = X[99];
+    t17 = C35 * t18;
+    t10 = C34 * t1;
+    t11 = t17 + t10;
+    t4 = (-C34) * t18;
+    t2 = C35 * t1;
+    t3 = t4 + t2;
+    t9 = X[260];
+    t8 = X[59];
+    t17 = C33 * t9;
+    t10 = C32 * t8;
+    t18 = t17 + t10;
+    t1 = (-C32) * t9;
+    t4 = C33 * t8;
+    t2 = t1 + t4;
+    t17 = X[300];
+    t10 = X[19];
+    t9 = C31 * t17;
+    t8 = C30 * t10;
+    t1 = t9 + t8;
+    t4 = (-C30) * t17;
+    t9 = C31 * t10;
+    t8 = t4 + t9;
+    t17 = t6 + t7;
+    t10 = t13 + t12;
+    t4 = t5 + t18;
+    t9 = t16 + t2;
+    t6 = t6 - t7;
+    t7 = t13 - t12;
+    t13 = t5 - t18;
+    t12 = t16 - t2;
+    t5 = t17 + t4;
+    t18 = t10 + t9;
+    t16 = t6 + t12;
+    t2 = t7 - t13;
+    t17 = t17 - t4;
+    t4 = t10 - t9;
+    t10 = t6 - t12;
+    t9 = t7 + t13;
+    t6 = t15 + t11;
+    t12 = t19 + t3;
+    t7 = t14 + t1;
+    t13 = t0 + t8;
+    t15 = t15 - t11;
+    t11 = t19 - t3;
+    t19 = t14 - t1;
+    t3 = t0 - t8;
+    t14 = t6 + t7;
+    t1 = t12 + t13;
+    t0 = t15 + t3;
+    t8 = t11 - t19;
+    t6 = t6 - t7;
+    t7 = t12 - t13;
+    t12 = t15 - t3;
+    t13 = t11 + t19;
+    t15 = t0 + t8;
+    t3 = t0 - t8;
+    t11 = C6 * t15;
+    t19 = (-C6) * t3;
+    t0 = t12 - t13;
+    t8 = t12 + t13;
+    t15 = (-C6) * t0;
+    t3 = (-C6) * t8;
+    t12 = t5 - t14;
+    t13 = t18 - t1;
+    t0 = t5 + t14;
+    t8 = t18 + t1;
+    t5 = t16 - t11;
+    t14 = t2 - t19;
+    t18 = t16 + t11;
+    t1 = t2 + t19;
+    t16 = t17 - t7;
+    t11 = t4 + t6;
+    t2 = t17 + t7;
+    t19 = t4 - t6;
+    t17 = t10 - t15;
+    t7 = t9 - t3;
+    t4 = t10 + t15;
+    t6 = t9 + t3;
+    t10 = t18 + t1;
+    t15 = C2 * t10;
+    t9 = t18 * (-C26);
+    t3 = t1 * C27;
+    t10 = t15 - t3;
+    t18 = t15 + t9;
+    t1 = t2 + t19;
+    t3 = t2 - t19;
+    t15 = C6 * t1;
+    t9 = (-C6) * t3;
+    t2 = t4 + t6;
+    t19 = C3 * t2;
+    t1 = t4 * (-C26);
+    t3 = t6 * (-C27);
+    t2 = t19 - t3;
+    t4 = t19 + t1;
+    t6 = -t12;
+    t3 = t5 + t14;
+    t19 = (-C3) * t3;
+    t1 = t5 * (-C27);
+    t12 = t14 * (-C26);
+    t3 = t19 - t12;
+    t5 = t19 + t1;
+    t14 = t16 - t11;
+    t12 = t16 + t11;
+    t19 = (-C6) * t14;
+    t1 = (-C6) * t12;
+    t16 = t17 + t7;
+    t11 = (-C2) * t16;
+    t14 = t17 * C27;
+    t12 = t7 * (-C26);
+    t16 = t11 - t12;
+    t17 = t11 + t14;
+    re[10] = t0;
+    im[10] = t8;
+    re[30] = t10;
+    im[30] = t18;
+    re[50] = t15;
+    im[50] = t9;
+    re[70] = t2;
+    im[70] = t4;
+    re[90] = t13;
+    im[90] = t6;
+    re[110] = t3;
+    im[110] = t5;
+    re[130] = t19;
+    im[130] = t1;
+    re[150] = t16;
+    im[150] = t17;
+    t7 = X[30];
+    t12 = X[289];
+    t11 = C23 * t7;
+    t14 = C22 * t12;
+    t0 = t11 + t14;
+    t8 = (-C22) * t7;
+    t10 = C23 * t12;
+    t18 = t8 + t10;
+    t15 = X[70];
+    t9 = X[249];
+    t2 = C21 * t15;
+    t4 = C20 * t9;
+    t13 = t2 + t4;
+    t6 = (-C20) * t15;
+    t3 = C21 * t9;
+    t5 = t6 + t3;
+    t19 = X[110];
+    t1 = X[209];
+    t16 = C19 * t19;
+    t17 = C18 * t1;
+    t11 = t16 + t17;
+    t14 = (-C18) * t19;
+    t7 = C19 * t1;
+    t12 = t14 + t7;
+    t8 = X[150];
+    t10 = X[169];
+    t2 = C17 * t8;
+    t4 = C16 * t10;
+    t15 = t2 + t4;
+    t9 = (-C16) * t8;
+    t6 = C17 * t10;
+    t3 = t9 + t6;
+    t16 = X[190];
+    t17 = X[129];
+    t19 = C15 * t16;
+    t1 = C14 * t17;
+    t14 = t19 + t1;
+    t7 = (-C14) * t16;
+    t2 = C15 * t17;
+    t4 = t7 + t2;
+    t8 = X[230];
+    t10 = X[89];
+    t9 = C13 * t8;
+    t6 = C12 * t10;
+    t19 = t9 + t6;
+    t1 = (-C12) * t8;
+    t16 = C13 * t10;
+    t17 = t1 + t16;
+    t7 = X[270];
+    t2 = X[49];
+    t9 = C11 * t7;
+    t6 = C10 * t2;
+    t8 = t9 + t6;
+    t10 = (-C10) * t7;
+    t1 = C11 * t2;
+    t16 = t10 + t1;
+    t9 = X[310];
+    t6 = X[9];
+    t7 = C9 * t9;
+    t2 = C8 * t6;
+    t10 = t7 + t2;
+    t1 = (-C8) * t9;
+    t7 = C9 * t6;
+    t2 = t1 + t7;
+    t9 = t0 + t14;
+    t6 = t18 + t4;
+    t1 = t11 + t8;
+    t7 = t12 + t16;
+    t0 = t0 - t14;
+    t14 = t18 - t4;
+    t18 = t11 - t8;
+    t4 = t12 - t16;
+    t11 = t9 + t1;
+    t8 = t6 + t7;
+    t12 = t0 + t4;
+    t16 = t14 - t18;
+    t9 = t9 - t1;
+    t1 = t6 - t7;
+    t6 = t0 - t4;
+    t7 = t14 + t18;
+    t0 = t13 + t19;
+    t4 = t5 + t17;
+    t14 = t15 + t10;
+    t18 = t3 + t2;
+    t13 = t13 - t19;
+    t19 = t5 - t17;
+    t5 = t15 - t10;
+    t17 = t3 - t2;
+    t15 = t0 + t14;
+    t10 = t4 + t18;
+    t3 = t13 + t17;
+    t2 = t19 - t5;
+    t0 = t0 - t14;
+    t14 = t4 - t18;
+    t4 = t13 - t17;
+    t18 = t19 + t5;
+    t13 = t3 + t2;
+    t17 = t3 - t2;
+    t19 = C6 * t13;
+    t5 = (-C6) * t17;
+    t3 = t4 - t18;
+    t2 = t4 + t18;
+    t13 = (-C6) * t3;
+    t17 = (-C6) * t2;
+    t4 = t11 - t15;
+    t18 = t8 - t10;
+    t3 = t11 + t15;
+    t2 = t8 + t10;
+    t11 = t12 - t19;
+    t15 = t16 - t5;
+    t8 = t12 + t19;
+    t10 = t16 + t5;
+    t12 = t9 - t14;
+    t19 = t1 + t0;
+    t16 = t9 + t14;
+    t5 = t1 - t0;
+    t9 = t6 - t13;
+    t14 = t7 - t17;
+    t1 = t6 + t13;
+    t0 = t7 + t17;
+    t6 = t8 + t10;
+    t13 = C4 * t6;
+    t7 = t8 * (-C28);
+    t17 = t10 * C29;
+    t6 = t13 - t17;
+    t8 = t13 + t7;
+    t10 = t16 + t5;
+    t17 = C3 * t10;
+    t13 = t16 * (-C26);
+    t7 = t5 * (-C27);
+    t10 = t17 - t7;
+    t16 = t17 + t13;
+    t5 = t1 + t0;
+    t7 = (-C1) * t5;
+    t17 = t1 * (-C25);
+    t13 = t0 * (-C24);
+    t5 = t7 - t13;
+    t1 = t7 + t17;
+    t0 = t4 - t18;
+    t13 = t4 + t18;
+    t7 = (-C6) * t0;
+    t17 = (-C6) * t13;
+    t4 = t11 + t15;
+    t18 = (-C0) * t4;
+    t0 = t11 * C25;
+    t13 = t15 * (-C24);
+    t4 = t18 - t13;
+    t11 = t18 + t0;
+    t15 = t12 + t19;
+    t13 = (-C2) * t15;
+    t18 = t12 * C26;
+    t0 = t19 * (-C27);
+    t15 = t13 - t0;
+    t12 = t13 + t18;
+    t19 = t9 + t14;
+    t0 = (-C5) * t19;
+    t13 = t9 * C28;
+    t18 = t14 * C29;
+    t19 = t0 - t18;
+    t9 = t0 + t13;
+    re[15] = t3;
+    im[15] = t2;
+    re[35] = t6;
+    im[35] = t8;
+    re[55] = t10;
+    im[55] = t16;
+    re[75] = t5;
+    im[75] = t1;
+    re[95] = t7;
+    im[95] = t17;
+    re[115] = t4;
+    im[115] = t11;
+    re[135] = t15;
+    im[135] = t12;
+    re[155] = t19;
+    im[155] = t9;
+    t14 = re[0];
+    t18 = im[0];
+    t0 = re[5];
+    t13 = im[5];
+    t3 = re[10];
+    t2 = im[10];
+    t6 = re[15];
+    t8 = im[15];
+    t10 = t14 + t3;
+    t16 = t18 + t2;
+    t5 = t0 + t6;
+    t1 = t13 + t8;
+    t7 = t14 - t3;
+    t17 = t18 - t2;
+    t4 = t0 - t6;
+    t11 = t13 - t8;
+    t15 = t10 + t5;
+    t12 = t16 + t1;
+    t19 = t7 + t11;
+    t9 = t17 - t4;
+    t14 = t10 - t5;
+    t3 = t16 - t1;
+    t18 = t7 - t11;
+    t2 = t17 + t4;
+    re[0] = t15;
+    im[0] = t12;
+    re[5] = t19;
+    im[5] = t9;
+    re[10] = t14;
+    im[10] = t3;
+    re[15] = t18;
+    im[15] = t2;
+    t0 = re[20];
+    t6 = im[20];
+    t13 = re[25];
+    t8 = im[25];
+    t10 = re[30];
+    t5 = im[30];
+    t16 = re[35];
+    t1 = im[35];
+    t7 = t0 + t10;
+    t11 = t6 + t5;
+    t17 = t13 + t16;
+    t4 = t8 + t1;
+    t15 = t0 - t10;
+    t12 = t6 - t5;
+    t19 = t13 - t16;
+    t9 = t8 - t1;
+    t14 = t7 + t17;
+    t3 = t11 + t4;
+    t18 = t15 + t9;
+    t2 = t12 - t19;
+    t0 = t7 - t17;
+    t10 = t11 - t4;
+    t6 = t15 - t9;
+    t5 = t12 + t19;
+    re[20] = t14;
+    im[20] = t3;
+    re[25] = t18;
+    im[25] = t2;
+    re[30] = t0;
+    im[30] = t10;
+    re[35] = t6;
+    im[35] = t5;
+    t13 = re[40];
+    t16 = im[40];
+    t8 = re[45];
+    t1 = im[45];
+    t7 = re[50];
+    t17 = im[50];
+    t11 = re[55];
+    t4 = im[55];
+    t15 = t13 + t7;
+    t9 = t16 + t17;
+    t12 = t8 + t11;
+    t19 = t1 + t4;
+    t14 = t13 - t7;
+    t3 = t16 - t17;
+    t18 = t8 - t11;
+    t2 = t1 - t4;
+    t0 = t15 + t12;
+    t10 = t9 + t19;
+    t6 = t14 + t2;
+    t5 = t3 - t18;
+    t13 = t15 - t12;
+    t7 = t9 - t19;
+    t16 = t14 - t2;
+    t17 = t3 + t18;
+    re[40] = t0;
+    im[40] = t10;
+    re[45] = t6;
+    im[45] = t5;
+    re[50] = t13;
+    im[50] = t7;
+    re[55] = t16;
+    im[55] = t17;
+    t8 = re[60];
+    t11 = im[60];
+    t1 = re[65];
+    t4 = im[65];
+    t15 = re[70];
+    t12 = im[70];
+    t9 = re[75];
+    t19 = im[75];
+    t14 = t8 + t15;
+    t2 = t11 + t12;
+    t3 = t1 + t9;
+    t18 = t4 + t19;
+    t0 = t8 - t15;
+    t10 = t11 - t12;
+    t6 = t1 - t9;
+    t5 = t4 - t19;
+    t13 = t14 + t3;
+    t7 = t2 + t18;
+    t16 = t0 + t5;
+    t17 = t10 - t6;
+    t8 = t14 - t3;
+    t15 = t2 - t18;
+    t11 = t0 - t5;
+    t12 = t10 + t6;
+    re[60] = t13;
+    im[60] = t7;
+    re[65] = t16;
+    im[65] = t17;
+    re[70] = t8;
+    im[70] = t15;
+    re[75] = t11;
+    im[75] = t12;
+    t1 = re[80];
+    t9 = im[80];
+    t4 = re[85];
+    t19 = im[85];
+    t14 = re[90];
+    t3 = im[90];
+    t2 = re[95];
+    t18 = im[95];
+    t0 = t1 + t14;
+    t5 = t9 + t3;
+    t10 = t4 + t2;
+    t6 = t19 + t18;
+    t13 = t1 - t14;
+    t7 = t9 - t3;
+    t16 = t4 - t2;
+    t17 = t19 - t18;
+    t8 = t0 + t10;
+    t15 = t5 + t6;
+    t11 = t13 + t17;
+    t12 = t7 - t16;
+    t1 = t0 - t10;
+    t14 = t5 - t6;
+    t9 = t13 - t17;
+    t3 = t7 + t16;
+    re[80] = t8;
+    im[80] = t15;
+    re[85] = t11;
+    im[85] = t12;
+    re[90] = t1;
+    im[90] = t14;
+    re[95] = t9;
+    im[95] = t3;
+    t4 = re[100];
+    t2 = im[100];
+    t19 = re[105];
+    t18 = im[105];
+    t0 = re[110];
+    t10 = im[110];
+    t5 = re[115];
+    t6 = im[115];
+    t13 = t4 + t0;
+    t17 = t2 + t10;
+    t7 = t19 + t5;
+    t16 = t18 + t6;
+    t8 = t4 - t0;
+    t15 = t2 - t10;
+    t11 = t19 - t5;
+    t12 = t18 - t6;
+    t1 = t13 + t7;
+    t14 = t17 + t16;
+    t9 = t8 + t12;
+    t3 = t15 - t11;
+    t4 = t13 - t7;
+    t0 = t17 - t16;
+    t2 = t8 - t12;
+    t10 = t15 + t11;
+    re[100] = t1;
+    im[100] = t14;
+    re[105] = t9;
+    im[105] = t3;
+    re[110] = t4;
+    im[110] = t0;
+    re[115] = t2;
+    im[115] = t10;
+    t19 = re[120];
+    t5 = im[120];
+    t18 = re[125];
+    t6 = im[125];
+    t13 = re[130];
+    t7 = im[130];
+    t17 = re[135];
+    t16 = im[135];
+    t8 = t19 + t13;
+    t12 = t5 + t7;
+    t15 = t18 + t17;
+    t11 = t6 + t16;
+    t1 = t19 - t13;
+    t14 = t5 - t7;
+    t9 = t18 - t17;
+    t3 = t6 - t16;
+    t4 = t8 + t15;
+    t0 = t12 + t11;
+    t2 = t1 + t3;
+    t10 = t14 - t9;
+    t19 = t8 - t15;
+    t13 = t12 - t11;
+    t5 = t1 - t3;
+    t7 = t14 + t9;
+    re[120] = t4;
+    im[120] = t0;
+    re[125] = t2;
+    im[125] = t10;
+    re[130] = t19;
+    im[130] = t13;
+    re[135] = t5;
+    im[135] = t7;
+    t18 = re[140];
+    t17 = im[140];
+    t6 = re[145];
+    t16 = im[145];
+    t8 = re[150];
+    t15 = im[150];
+    t12 = re[155];
+    t11 = im[155];
+    t1 = t18 + t8;
+    t3 = t17 + t15;
+    t14 = t6 + t12;
+    t9 = t16 + t11;
+    t4 = t18 - t8;
+    t0 = t17 - t15;
+    t2 = t6 - t12;
+    t10 = t16 - t11;
+    t19 = t1 + t14;
+    t13 = t3 + t9;
+    t5 = t4 + t10;
+    t7 = t0 - t2;
+    t18 = t1 - t14;
+    t8 = t3 - t9;
+    t17 = t4 - t10;
+    t15 = t0 + t2;
+    re[140] = t19;
+    im[140] = t13;
+    re[145] = t5;
+    im[145] = t7;
+    re[150] = t18;
+    im[150] = t8;
+    re[155] = t17;
+    im[155] = t15;
+    t6 = X[64];
+    t12 = X[255];
+    t16 = C38 * t6;
+    t11 = C39 * t12;
+    t1 = t16 + t11;
+    t14 = (-C39) * t6;
+    t3 = C38 * t12;
+    t9 = t14 + t3;
+    t4 = X[104];
+    t10 = X[215];
+    t0 = C40 * t4;
+    t2 = C41 * t10;
+    t19 = t0 + t2;
+    t13 = (-C41) * t4;
+    t5 = C40 * t10;
+    t7 = t13 + t5;
+    t18 = X[144];
+    t8 = X[175];
+    t17 = C42 * t18;
+    t15 = C43 * t8;
+    t16 = t17 + t15;
+    t11 = (-C43) * t18;
+    t6 = C42 * t8;
+    t12 = t11 + t6;
+    t14 = X[184];
+    t3 = X[135];
+    t0 = C44 * t14;
+    t2 = C45 * t3;
+    t4 = t0 + t2;
+    t10 = (-C45) * t14;
+    t13 = C44 * t3;
+    t5 = t10 + t13;
+    t17 = X[224];
+    t15 = X[95];
+    t18 = C46 * t17;
+    t8 = C47 * t15;
+    t11 = t18 + t8;
+    t6 = (-C47) * t17;
+    t0 = C46 * t15;
+    t2 = t6 + t0;
+    t14 = X[264];
+    t3 = X[55];
+    t10 = C48 * t14;
+    t13 = C49 * t3;
+    t18 = t10 + t13;
+    t8 = (-C49) * t14;
+    t17 = C48 * t3;
+    t15 = t8 + t17;
+    t6 = X[304];
+    t0 = X[15];
+    t10 = C50 * t6;
+    t13 = C51 * t0;
+    t14 = t10 + t13;
+    t3 = (-C51) * t6;
+    t8 = C50 * t0;
+    t17 = t3 + t8;
+    t10 = X[24];
+    t13 = X[295];
+    t6 = C52 * t10;
+    t0 = C53 * t13;
+    t3 = t6 + t0;
+    t8 = (-C53) * t10;
+    t6 = C52 * t13;
+    t0 = t8 + t6;
+    t10 = t1 + t11;
+    t13 = t9 + t2;
+    t8 = t16 + t14;
+    t6 = t12 + t17;
+    t1 = t1 - t11;
+    t11 = t9 - t2;
+    t9 = t16 - t14;
+    t2 = t12 - t17;
+    t16 = t10 + t8;
+    t14 = t13 + t6;
+    t12 = t1 + t2;
+    t17 = t11 - t9;
+    t10 = t10 - t8;
+    t8 = t13 - t6;
+    t13 = t1 - t2;
+    t6 = t11 + t9;
+    t1 = t19 + t18;
+    t2 = t7 + t15;
+    t11 = t4 + t3;
+    t9 = t5 + t0;
+    t19 = t19 - t18;
+    t18 = t7 - t15;
+    t7 = t4 - t3;
+    t15 = t5 - t0;
+    t4 = t1 + t11;
+    t3 = t2 + t9;
+    t5 = t19 + t15;
+    t0 = t18 - t7;
+    t1 = t1 - t11;
+    t11 = t2 - t9;
+    t2 = t19 - t15;
+    t9 = t18 + t7;
+    t19 = t5 + t0;
+    t15 = t5 - t0;
+    t18 = C6 * t19;
+    t7 = (-C6) * t15;
+    t5 = t2 - t9;
+    t0 = t2 + t9;
+    t19 = (-C6) * t5;
+    t15 = (-C6) * t0;
+    t2 = t16 - t4;
+    t9 = t14 - t3;
+    t5 = t16 + t4;
+    t0 = t14 + t3;
+    t16 = t12 - t18;
+    t4 = t17 - t7;
+    t14 = t12 + t18;
+    t3 = t17 + t7;
+    t12 = t10 - t11;
+    t18 = t8 + t1;
+    t17 = t10 + t11;
+    t7 = t8 - t1;
+    t10 = t13 - t19;
+    t11 = t6 - t15;
+    t8 = t13 + t19;
+    t1 = t6 + t15;
+    re[32] = t5;
+    im[32] = t0;
+    re[52] = t14;
+    im[52] = t3;
+    re[72] = t17;
+    im[72] = t7;
+    re[92] = t8;
+    im[92] = t1;
+    re[112] = t2;
+    im[112] = t9;
+    re[132] = t16;
+    im[132] = t4;
+    re[152] = t12;
+    im[152] = t18;
+    re[12] = t10;
+    im[12] = t11;
+    t13 = X[74];
+    t19 = X[245];
+    t6 = C54 * t13;
+    t15 = C55 * t19;
+    t5 = t6 + t15;
+    t0 = (-C55) * t13;
+    t14 = C54 * t19;
+    t3 = t0 + t14;
+    t17 = X[114];
+    t7 = X[205];
+    t8 = C56 * t17;
+    t1 = C57 * t7;
+    t2 = t8 + t1;
+    t9 = (-C57) * t17;
+    t16 = C56 * t7;
+    t4 = t9 + t16;
+    t12 = X[154];
+    t18 = X[165];
+    t10 = C58 * t12;
+    t11 = C59 * t18;
+    t6 = t10 + t11;
+    t15 = (-C59) * t12;
+    t13 = C58 * t18;
+    t19 = t15 + t13;
+    t0 = X[194];
+    t14 = X[125];
+    t8 = C60 * t0;
+    t1 = C61 * t14;
+    t17 = t8 + t1;
+    t7 = (-C61) * t0;
+    t9 = C60 * t14;
+    t16 = t7 + t9;
+    t10 = X[234];
+    t11 = X[85];
+    t12 = C62 * t10;
+    t18 = C63 * t11;
+    t15 = t12 + t18;
+    t13 = (-C63) * t10;
+    t8 = C62 * t11;
+    t1 = t13 + t8;
+    t0 = X[274];
+    t14 = X[45];
+    t7 = C64 * t0;
+    t9 = C65 * t14;
+    t12 = t7 + t9;
+    t18 = (-C65) * t0;
+    t10 = C64 * t14;
+    t11 = t18 + t10;
+    t13 = X[314];
+    t8 = X[5];
+    t7 = C66 * t13;
+    t9 = C67 * t8;
+    t0 = t7 + t9;
+    t14 = (-C67) * t13;
+    t18 = C66 * t8;
+    t10 = t14 + t18;
+    t7 = X[34];
+    t9 = X[285];
+    t13 = C68 * t7;
+    t8 = C69 * t9;
+    t14 = t13 + t8;
+    t18 = (-C69) * t7;
+    t13 = C68 * t9;
+    t8 = t18 + t13;
+    t7 = t5 + t15;
+    t9 = t3 + t1;
+    t18 = t6 + t0;
+    t13 = t19 + t10;
+    t5 = t5 - t15;
+    t15 = t3 - t1;
+    t3 = t6 - t0;
+    t1 = t19 - t10;
+    t6 = t7 + t18;
+    t0 = t9 + t13;
+    t19 = t5 + t1;
+    t10 = t15 - t3;
+    t7 = t7 - t18;
+    t18 = t9 - t13;
+    t9 = t5 - t1;
+    t13 = t15 + t3;
+    t5 = t2 + t12;
+    t1 = t4 + t11;
+    t15 = t17 + t14;
+    t3 = t16 + t8;
+    t2 = t2 - t12;
+    t12 = t4 - t11;
+    t4 = t17 - t14;
+    t11 = t16 - t8;
+    t17 = t5 + t15;
+    t14 = t1 + t3;
+    t16 = t2 + t11;
+    t8 = t12 - t4;
+    t5 = t5 - t15;
+    t15 = t1 - t3;
+    t1 = t2 - t11;
+    t3 = t12 + t4;
+    t2 = t16 + t8;
+    t11 = t16 - t8;
+    t12 = C6 * t2;
+    t4 = (-C6) * t11;
+    t16 = t1 - t3;
+    t8 = t1 + t3;
+    t2 = (-C6) * t16;
+    t11 = (-C6) * t8;
+    t1 = t6 - t17;
+    t3 = t0 - t14;
+    t16 = t6 + t17;
+    t8 = t0 + t14;
+    t6 = t19 - t12;
+    t17 = t10 - t4;
+    t0 = t19 + t12;
+    t14 = t10 + t4;
+    t19 = t7 - t15;
+    t12 = t18 + t5;
+    t10 = t7 + t15;
+    t4 = t18 - t5;
+    t7 = t9 - t2;
+    t15 = t13 - t11;
+    t18 = t9 + t2;
+    t5 = t13 + t11;
+    t9 = t0 + t14;
+    t2 = C0 * t9;
+    t13 = t0 * (-C24);
+    t11 = t14 * C25;
+    t9 = t2 - t11;
+    t0 = t2 + t13;
+    t14 = t10 + t4;
+    t11 = C2 * t14;
+    t2 = t10 * (-C26);
+    t13 = t4 * C27;
+    t14 = t11 - t13;
+    t10 = t11 + t2;
+    t4 = t18 + t5;
+    t13 = C4 * t4;
+    t11 = t18 * (-C28);
+    t2 = t5 * C29;
+    t4 = t13 - t2;
+    t18 = t13 + t11;
+    t5 = t1 + t3;
+    t2 = t1 - t3;
+    t13 = C6 * t5;
+    t11 = (-C6) * t2;
+    t1 = t6 + t17;
+    t3 = C5 * t1;
+    t5 = t6 * (-C28);
+    t2 = t17 * (-C29);
+    t1 = t3 - t2;
+    t6 = t3 + t5;
+    t17 = t19 + t12;
+    t2 = C3 * t17;
+    t3 = t19 * (-C26);
+    t5 = t12 * (-C27);
+    t17 = t2 - t5;
+    t19 = t2 + t3;
+    t12 = t7 + t15;
+    t5 = C1 * t12;
+    t2 = t7 * (-C24);
+    t3 = t15 * (-C25);
+    t12 = t5 - t3;
+    t7 = t5 + t2;
+    re[37] = t16;
+    im[37] = t8;
+    re[57] = t9;
+    im[57] = t0;
+    re[77] = t14;
+    im[77] = t10;
+    re[97] = t4;
+    im[97] = t18;
+    re[117] = t13;
+    im[117] = t11;
+    re[137] = t1;
+    im[137] = t6;
+    re[157] = t17;
+    im[157] = t19;
+    re[17] = t12;
+    im[17] = t7;
+    t15 = X[84];
+    t3 = X[235];
+    t5 = C70 * t15;
+    t2 = C71 * t3;
+    t16 = t5 + t2;
+    t8 = (-C71) * t15;
+    t9 = C70 * t3;
+    t0 = t8 + t9;
+    t14 = X[124];
+    t10 = X[195];
+    t4 = C72 * t14;
+    t18 = C73 * t10;
+    t13 = t4 + t18;
+    t11 = (-C73) * t14;
+    t1 = C72 * t10;
+    t6 = t11 + t1;
+    t17 = X[164];
+    t19 = X[155];
+    t12 = C74 * t17;
+    t7 = C75 * t19;
+    t5 = t12 + t7;
+    t2 = (-C75) * t17;
+    t15 = C74 * t19;
+    t3 = t2 + t15;
+    t8 = X[204];
+    t9 = X[115];
+    t4 = C76 * t8;
+    t18 = C77 * t9;
+    t14 = t4 + t18;
+    t10 = (-C77) * t8;
+    t11 = C76 * t9;
+    t1 = t10 + t11;
+    t12 = X[244];
+    t7 = X[75];
+    t17 = C78 * t12;
+    t19 = C79 * t7;
+    t2 = t17 + t19;
+    t15 = (-C79) * t12;
+    t4 = C78 * t7;
+    t18 = t15 + t4;
+    t8 = X[284];
+    t9 = X[35];
+    t10 = C80 * t8;
+    t11 = C81 * t9;
+    t17 = t10 + t11;
+    t19 = (-C81) * t8;
+    t12 = C80 * t9;
+    t7 = t19 + t12;
+    t15 = X[4];
+    t4 = X[315];
+    t10 = C82 * t15;
+    t11 = C83 * t4;
+    t8 = t10 + t11;
+    t9 = (-C83) * t15;
+    t19 = C82 * t4;
+    t12 = t9 + t19;
+    t10 = X[44];
+    t11 = X[275];
+    t15 = C84 * t10;
+    t4 = C85 * t11;
+    t9 = t15 + t4;
+    t19 = (-C85) * t10;
+    t15 = C84 * t11;
+    t4 = t19 + t15;
+    t10 = t16 + t2;
+    t11 = t0 + t18;
+    t19 = t5 + t8;
+    t15 = t3 + t12;
+    t16 = t16 - t2;
+    t2 = t0 - t18;
+    t0 = t5 - t8;
+    t18 = t3 - t12;
+    t5 = t10 + t19;
+    t8 = t11 + t15;
+    t3 = t16 + t18;
+    t12 = t2 - t0;
+    t10 = t10 - t19;
+    t19 = t11 - t15;
+    t11 = t16 - t18;
+    t15 = t2 + t0;
+    t16 = t13 + t17;
+    t18 = t6 + t7;
+    t2 = t14 + t9;
+    t0 = t1 + t4;
+    t13 = t13 - t17;
+    t17 = t6 - t7;
+    t6 = t14 - t9;
+    t7 = t1 - t4;
+    t14 = t16 + t2;
+    t9 = t18 + t0;
+    t1 = t13 + t7;
+    t4 = t17 - t6;
+    t16 = t16 - t2;
+    t2 = t18 - t0;
+    t18 = t13 - t7;
+    t0 = t17 + t6;
+    t13 = t1 + t4;
+    t7 = t1 - t4;
+    t17 = C6 * t13;
+    t6 = (-C6) * t7;
+    t1 = t18 - t0;
+    t4 = t18 + t0;
+    t13 = (-C6) * t1;
+    t7 = (-C6) * t4;
+    t18 = t5 - t14;
+    t0 = t8 - t9;
+    t1 = t5 + t14;
+    t4 = t8 + t9;
+    t5 = t3 - t17;
+    t14 = t12 - t6;
+    t8 = t3 + t17;
+    t9 = t12 + t6;
+    t3 = t10 - t2;
+    t17 = t19 + t16;
+    t12 = t10 + t2;
+    t6 = t19 - t16;
+    t10 = t11 - t13;
+    t2 = t15 - t7;
+    t19 = t11 + t13;
+    t16 = t15 + t7;
+    t11 = t8 + t9;
+    t13 = C2 * t11;
+    t15 = t8 * (-C26);
+    t7 = t9 * C27;
+    t11 = t13 - t7;
+    t8 = t13 + t15;
+    t9 = t12 + t6;
+    t7 = t12 - t6;
+    t13 = C6 * t9;
+    t15 = (-C6) * t7;
+    t12 = t19 + t16;
+    t6 = C3 * t12;
+    t9 = t19 * (-C26);
+    t7 = t16 * (-C27);
+    t12 = t6 - t7;
+    t19 = t6 + t9;
+    t16 = -t18;
+    t7 = t5 + t14;
+    t6 = (-C3) * t7;
+    t9 = t5 * (-C27);
+    t18 = t14 * (-C26);
+    t7 = t6 - t18;
+    t5 = t6 + t9;
+    t14 = t3 - t17;
+    t18 = t3 + t17;
+    t6 = (-C6) * t14;
+    t9 = (-C6) * t18;
+    t3 = t10 + t2;
+    t17 = (-C2) * t3;
+    t14 = t10 * C27;
+    t18 = t2 * (-C26);
+    t3 = t17 - t18;
+    t10 = t17 + t14;
+    re[42] = t1;
+    im[42] = t4;
+    re[62] = t11;
+    im[62] = t8;
+    re[82] = t13;
+    im[82] = t15;
+    re[102] = t12;
+    im[102] = t19;
+    re[122] = t0;
+    im[122] = t16;
+    re[142] = t7;
+    im[142] = t5;
+    re[2] = t6;
+    im[2] = t9;
+    re[22] = t3;
+    im[22] = t10;
+    t2 = X[94];
+    t18 = X[225];
+    t17 = C86 * t2;
+    t14 = C87 * t18;
+    t1 = t17 + t14;
+    t4 = (-C87) * t2;
+    t11 = C86 * t18;
+    t8 = t4 + t11;
+    t13 = X[134];
+    t15 = X[185];
+    t12 = C88 * t13;
+    t19 = C89 * t15;
+    t0 = t12 + t19;
+    t16 = (-C89) * t13;
+    t7 = C88 * t15;
+    t5 = t16 + t7;
+    t6 = X[174];
+    t9 = X[145];
+    t3 = C90 * t6;
+    t10 = C91 * t9;
+    t17 = t3 + t10;
+    t14 = (-C91) * t6;
+    t2 = C90 * t9;
+    t18 = t14 + t2;
+    t4 = X[214];
+    t11 = X[105];
+    t12 = C92 * t4;
+    t19 = C93 * t11;
+    t13 = t12 + t19;
+    t15 = (-C93) * t4;
+    t16 = C92 * t11;
+    t7 = t15 + t16;
+    t3 = X[254];
+    t10 = X[65];
+    t6 = C94 * t3;
+    t9 = C95 * t10;
+    t14 = t6 + t9;
+    t2 = (-C95) * t3;
+    t12 = C94 * t10;
+    t19 = t2 + t12;
+    t4 = X[294];
+    t11 = X[25];
+    t15 = C96 * t4;
+    t16 = C97 * t11;
+    t6 = t15 + t16;
+    t9 = (-C97) * t4;
+    t3 = C96 * t11;
+    t10 = t9 + t3;
+    t2 = X[14];
+    t12 = X[305];
+    t15 = C98 * t2;
+    t16 = C99 * t12;
+    t4 = t15 + t16;
+    t11 = (-C99) * t2;
+    t9 = C98 * t12;
+    t3 = t11 + t9;
+    t15 = X[54];
+    t16 = X[265];
+    t2 = C100 * t15;
+    t12 = C101 * t16;
+    t11 = t2 + t12;
+    t9 = (-C101) * t15;
+    t2 = C100 * t16;
+    t12 = t9 + t2;
+    t15 = t1 + t14;
+    t16 = t8 + t19;
+    t9 = t17 + t4;
+    t2 = t18 + t3;
+    t1 = t1 - t14;
+    t14 = t8 - t19;
+    t8 = t17 - t4;
+    t19 = t18 - t3;
+    t17 = t15 + t9;
+    t4 = t16 + t2;
+    t18 = t1 + t19;
+    t3 = t14 - t8;
+    t15 = t15 - t9;
+    t9 = t16 - t2;
+    t16 = t1 - t19;
+    t2 = t14 + t8;
+    t1 = t0 + t6;
+    t19 = t5 + t10;
+    t14 = t13 + t11;
+    t8 = t7 + t12;
+    t0 = t0 - t6;
+    t6 = t5 - t10;
+    t5 = t13 - t11;
+    t10 = t7 - t12;
+    t13 = t1 + t14;
+    t11 = t19 + t8;
+    t7 = t0 + t10;
+    t12 = t6 - t5;
+    t1 = t1 - t14;
+    t14 = t19 - t8;
+    t19 = t0 - t10;
+    t8 = t6 + t5;
+    t0 = t7 + t12;
+    t10 = t7 - t12;
+    t6 = C6 * t0;
+    t5 = (-C6) * t10;
+    t7 = t19 - t8;
+    t12 = t19 + t8;
+    t0 = (-C6) * t7;
+    t10 = (-C6) * t12;
+    t19 = t17 - t13;
+    t8 = t4 - t11;
+    t7 = t17 + t13;
+    t12 = t4 + t11;
+    t17 = t18 - t6;
+    t13 = t3 - t5;
+    t4 = t18 + t6;
+    t11 = t3 + t5;
+    t18 = t15 - t14;
+    t6 = t9 + t1;
+    t3 = t15 + t14;
+    t5 = t9 - t1;
+    t15 = t16 - t0;
+    t14 = t2 - t10;
+    t9 = t16 + t0;
+    t1 = t2 + t10;
+    t16 = t4 + t11;
+    t0 = C4 * t16;
+    t2 = t4 * (-C28);
+    t10 = t11 * C29;
+    t16 = t0 - t10;
+    t4 = t0 + t2;
+    t11 = t3 + t5;
+    t10 = C3 * t11;
+    t0 = t3 * (-C26);
+    t2 = t5 * (-C27);
+    t11 = t10 - t2;
+    t3 = t10 + t0;
+    t5 = t9 + t1;
+    t2 = (-C1) * t5;
+    t10 = t9 * (-C25);
+    t0 = t1 * (-C24);
+    t5 = t2 - t0;
+    t9 = t2 + t10;
+    t1 = t19 - t8;
+    t0 = t19 + t8;
+    t2 = (-C6) * t1;
+    t10 = (-C6) * t0;
+    t19 = t17 + t13;
+    t8 = (-C0) * t19;
+    t1 = t17 * C25;
+    t0 = t13 * (-C24);
+    t19 = t8 - t0;
+    t17 = t8 + t1;
+    t13 = t18 + t6;
+    t0 = (-C2) * t13;
+    t8 = t18 * C26;
+    t1 = t6 * (-C27);
+    t13 = t0 - t1;
+    t18 = t0 + t8;
+    t6 = t15 + t14;
+    t1 = (-C5) * t6;
+    t0 = t15 * C28;
+    t8 = t14 * C29;
+    t6 = t1 - t8;
+    t15 = t1 + t0;
+    re[47] = t7;
+    im[47] = t12;
+    re[67] = t16;
+    im[67] = t4;
+    re[87] = t11;
+    im[87] = t3;
+    re[107] = t5;
+    im[107] = t9;
+    re[127] = t2;
+    im[127] = t10;
+    re[147] = t19;
+    im[147] = t17;
+    re[7] = t13;
+    im[7] = t18;
+    re[27] = t6;
+    im[27] = t15;
+    t14 = re[32];
+    t8 = im[32];
+    t1 = re[37];
+    t0 = im[37];
+    t7 = re[42];
+    t12 = im[42];
+    t16 = re[47];
+    t4 = im[47];
+    t11 = t14 + t7;
+    t3 = t8 + t12;
+    t5 = t1 + t16;
+    t9 = t0 + t4;
+    t2 = t14 - t7;
+    t10 = t8 - t12;
+    t19 = t1 - t16;
+    t17 = t0 - t4;
+    t13 = t11 + t5;
+    t18 = t3 + t9;
+    t6 = t2 + t17;
+    t15 = t10 - t19;
+    t14 = t11 - t5;
+    t7 = t3 - t9;
+    t8 = t2 - t17;
+    t12 = t10 + t19;
+    re[32] = t13;
+    im[32] = t18;
+    re[37] = t6;
+    im[37] = t15;
+    re[42] = t14;
+    im[42] = t7;
+    re[47] = t8;
+    im[47] = t12;
+    t1 = re[52];
+    t16 = im[52];
+    t0 = re[57];
+    t4 = im[57];
+    t11 = re[62];
+    t5 = im[62];
+    t3 = re[67];
+    t9 = im[67];
+    t2 = t1 + t11;
+    t17 = t16 + t5;
+    t10 = t0 + t3;
+    t19 = t4 + t9;
+    t13 = t1 - t11;
+    t18 = t16 - t5;
+    t6 = t0 - t3;
+    t15 = t4 - t9;
+    t14 = t2 + t10;
+    t7 = t17 + t19;
+    t8 = t13 + t15;
+    t12 = t18 - t6;
+    t1 = t2 - t10;
+    t11 = t17 - t19;
+    t16 = t13 - t15;
+    t5 = t18 + t6;
+    re[52] = t14;
+    im[52] = t7;
+    re[57] = t8;
+    im[57] = t12;
+    re[62] = t1;
+    im[62] = t11;
+    re[67] = t16;
+    im[67] = t5;
+    t0 = re[72];
+    t3 = im[72];
+    t4 = re[77];
+    t9 = im[77];
+    t2 = re[82];
+    t10 = im[82];
+    t17 = re[87];
+    t19 = im[87];
+    t13 = t0 + t2;
+    t15 = t3 + t10;
+    t18 = t4 + t17;
+    t6 = t9 + t19;
+    t14 = t0 - t2;
+    t7 = t3 - t10;
+    t8 = t4 - t17;
+    t12 = t9 - t19;
+    t1 = t13 + t18;
+    t11 = t15 + t6;
+    t16 = t14 + t12;
+    t5 = t7 - t8;
+    t0 = t13 - t18;
+    t2 = t15 - t6;
+    t3 = t14 - t12;
+    t10 = t7 + t8;
+    re[72] = t1;
+    im[72] = t11;
+    re[77] = t16;
+    im[77] = t5;
+    re[82] = t0;
+    im[82] = t2;
+    re[87] = t3;
+    im[87] = t10;
+    t4 = re[92];
+    t17 = im[92];
+    t9 = re[97];
+    t19 = im[97];
+    t13 = re[102];
+    t18 = im[102];
+    t15 = re[107];
+    t6 = im[107];
+    t14 = t4 + t13;
+    t12 = t17 + t18;
+    t7 = t9 + t15;
+    t8 = t19 + t6;
+    t1 = t4 - t13;
+    t11 = t17 - t18;
+    t16 = t9 - t15;
+    t5 = t19 - t6;
+    t0 = t14 + t7;
+    t2 = t12 + t8;
+    t3 = t1 + t5;
+    t10 = t11 - t16;
+    t4 = t14 - t7;
+    t13 = t12 - t8;
+    t17 = t1 - t5;
+    t18 = t11 + t16;
+    re[92] = t0;
+    im[92] = t2;
+    re[97] = t3;
+    im[97] = t10;
+    re[102] = t4;
+    im[102] = t13;
+    re[107] = t17;
+    im[107] = t18;
+    t9 = re[112];
+    t15 = im[112];
+    t19 = re[117];
+    t6 = im[117];
+    t14 = re[122];
+    t7 = im[122];
+    t12 = re[127];
+    t8 = im[127];
+    t1 = t9 + t14;
+    t5 = t15 + t7;
+    t11 = t19 + t12;
+    t16 = t6 + t8;
+    t0 = t9 - t14;
+    t2 = t15 - t7;
+    t3 = t19 - t12;
+    t10 = t6 - t8;
+    t4 = t1 + t11;
+    t13 = t5 + t16;
+    t17 = t0 + t10;
+    t18 = t2 - t3;
+    t9 = t1 - t11;
+    t14 = t5 - t16;
+    t15 = t0 - t10;
+    t7 = t2 + t3;
+    re[112] = t4;
+    im[112] = t13;
+    re[117] = t17;
+    im[117] = t18;
+    re[122] = t9;
+    im[122] = t14;
+    re[127] = t15;
+    im[127] = t7;
+    t19 = re[132];
+    t12 = im[132];
+    t6 = re[137];
+    t8 = im[137];
+    t1 = re[142];
+    t11 = im[142];
+    t5 = re[147];
+    t16 = im[147];
+    t0 = t19 + t1;
+    t10 = t12 + t11;
+    t2 = t6 + t5;
+    t3 = t8 + t16;
+    t4 = t19 - t1;
+    t13 = t12 - t11;
+    t17 = t6 - t5;
+    t18 = t8 - t16;
+    t9 = t0 + t2;
+    t14 = t10 + t3;
+    t15 = t4 + t18;
+    t7 = t13 - t17;
+    t19 = t0 - t2;
+    t1 = t10 - t3;
+    t12 = t4 - t18;
+    t11 = t13 + t17;
+    re[132] = t9;
+    im[132] = t14;
+    re[137] = t15;
+    im[137] = t7;
+    re[142] = t19;
+    im[142] = t1;
+    re[147] = t12;
+    im[147] = t11;
+    t6 = re[152];
+    t5 = im[152];
+    t8 = re[157];
+    t16 = im[157];
+    t0 = re[2];
+    t2 = im[2];
+    t10 = re[7];
+    t3 = im[7];
+    t4 = t6 + t0;
+    t18 = t5 + t2;
+    t13 = t8 + t10;
+    t17 = t16 + t3;
+    t9 = t6 - t0;
+    t14 = t5 - t2;
+    t15 = t8 - t10;
+    t7 = t16 - t3;
+    t19 = t4 + t13;
+    t1 = t18 + t17;
+    t12 = t9 + t7;
+    t11 = t14 - t15;
+    t6 = t4 - t13;
+    t0 = t18 - t17;
+    t5 = t9 - t7;
+    t2 = t14 + t15;
+    re[152] = t19;
+    im[152] = t1;
+    re[157] = t12;
+    im[157] = t11;
+    re[2] = t6;
+    im[2] = t0;
+    re[7] = t5;
+    im[7] = t2;
+    t8 = re[12];
+    t10 = im[12];
+    t16 = re[17];
+    t3 = im[17];
+    t4 = re[22];
+    t13 = im[22];
+    t18 = re[27];
+    t17 = im[27];
+    t9 = t8 + t4;
+    t7 = t10 + t13;
+    t14 = t16 + t18;
+    t15 = t3 + t17;
+    t19 = t8 - t4;
+    t1 = t10 - t13;
+    t12 = t16 - t18;
+    t11 = t3 - t17;
+    t6 = t9 + t14;
+    t0 = t7 + t15;
+    t5 = t19 + t11;
+    t2 = t1 - t12;
+    t8 = t9 - t14;
+    t4 = t7 - t15;
+    t10 = t19 - t11;
+    t13 = t1 + t12;
+    re[12] = t6;
+    im[12] = t0;
+    re[17] = t5;
+    im[17] = t2;
+    re[22] = t8;
+    im[22] = t4;
+    re[27] = t10;
+    im[27] = t13;
+}
+
+/**
+ *  Part 2 of ApplyWindowedIMDCT_W10_320().
+ * 
+ *  @param {Number[]} X 
+ *    - The input block (320 points).
+ *  @param {Number[]} y 
+ *    - The array that would contain the output block (640 points).
+ *  @param {Number[]} re 
+ *    - The scratch buffer (real part, 160 points).
+ *  @param {Number[]} im 
+ *    - The scratch buffer (imaginary part, 160 points).
+ */
+function ApplyWindowedIMDCT_W10_320_Part2(X, y, re, im) {
+    let t0, t1, t10, t11, t12, t13, t14, t15, t16, t17, t18, t19, t2, t3, t4, t5, t6, t7, t8, t9;
+    const C0 = 0.8090169943749475;
+    const C1 = 0.5877852522924731;
+    const C2 = 0.6788007455329417;
+    const C3 = 0.7343225094356856;
+    const C4 = 0.5224985647159488;
+    const C5 = 0.8526401643540922;
+    const C6 = 0.34611705707749296;
+    const C7 = 0.9381913359224842;
+    const C8 = 0.15643446504023087;
+    const C9 = 0.9876883405951378;
+    const C10 = 0.9992290362407229;
+    const C11 = 0.03925981575906861;
+    const C12 = 0.9723699203976766;
+    const C13 = 0.2334453638559054;
+    const C14 = 0.9081431738250813;
+    const C15 = 0.41865973753742813;
+    const C16 = 0.7071067811865476;
+    const C17 = 0.7792012426405167;
+    const C18 = 0.6267738216194696;
+    const C19 = 0.641951602562703;
+    const C20 = 0.7667451597285615;
+    const C21 = 0.4800321224090111;
+    const C22 = 0.8772509113449243;
+    const C23 = 0.2996652769962566;
+    const C24 = 0.9540444024062804;
+    const C25 = 0.10778246304275935;
+    const C26 = 0.9941745021174282;
+    const C27 = 0.9960990332516871;
+    const C28 = 0.08824237052036951;
+    const C29 = 0.9597440371568574;
+    const C30 = 0.2808760992712921;
+    const C31 = 0.8865066159447464;
+    const C32 = 0.4627159170443501;
+    const C33 = 0.9807852804032304;
+    const C34 = 1.1758756024193586;
+    const C35 = 0.7856949583871022;
+    const C36 = 0.9238795325112867;
+    const C37 = 1.3065629648763766;
+    const C38 = 0.5411961001461969;
+    const C39 = 0.8314696123025452;
+    const C40 = 1.3870398453221475;
+    const C41 = 0.27589937928294306;
+    const C42 = 0.5555702330196022;
+    const C43 = 0.3826834323650898;
+    const C44 = 0.19509032201612825;
+    const C45 = 0.7475083268625968;
+    const C46 = 0.6642524379112817;
+    const C47 = 0.6035559419535714;
+    const C48 = 0.7973206537727071;
+    const C49 = 0.436409240673342;
+    const C50 = 0.8997482840522215;
+    const C51 = 0.25249157701515795;
+    const C52 = 0.9675990923602598;
+    const C53 = 0.05887080365118903;
+    const C54 = 0.9982656101847159;
+    const C55 = 0.9905693404435773;
+    const C56 = 0.13701234168196802;
+    const C57 = 0.944806046466878;
+    const C58 = 0.3276301795616935;
+    const C59 = 0.8627343859777918;
+    const C60 = 0.5056573733779846;
+    const C61 = 0.7140145980512682;
+    const C62 = 0.7001308118985237;
+    const C63 = 0.5637062622150166;
+    const C64 = 0.8259753325248732;
+    const C65 = 0.3917350108519559;
+    const C66 = 0.9200780843345949;
+    const C67 = 0.2047096027093796;
+    const C68 = 0.9788227513490724;
+    const C69 = 0.009817319337149617;
+    const C70 = 0.999951808959328;
+    const C71 = 0.9826532793307118;
+    const C72 = 0.18545223811159092;
+    const C73 = 0.927591935255724;
+    const C74 = 0.37359497005251635;
+    const C75 = 0.8368837533084093;
+    const C76 = 0.5473806568087966;
+    t16 = X[128];
+    t18 = X[191];
+    t3 = C0 * t16;
+    t17 = C1 * t18;
+    t9 = t3 + t17;
+    t14 = (-C1) * t16;
+    t7 = C0 * t18;
+    t15 = t14 + t7;
+    t19 = X[168];
+    t11 = X[151];
+    t1 = C2 * t19;
+    t12 = C3 * t11;
+    t6 = t1 + t12;
+    t0 = (-C3) * t19;
+    t5 = C2 * t11;
+    t2 = t0 + t5;
+    t8 = X[208];
+    t4 = X[111];
+    t10 = C4 * t8;
+    t13 = C5 * t4;
+    t3 = t10 + t13;
+    t17 = (-C5) * t8;
+    t16 = C4 * t4;
+    t18 = t17 + t16;
+    t14 = X[248];
+    t7 = X[71];
+    t1 = C6 * t14;
+    t12 = C7 * t7;
+    t19 = t1 + t12;
+    t11 = (-C7) * t14;
+    t0 = C6 * t7;
+    t5 = t11 + t0;
+    t10 = X[288];
+    t13 = X[31];
+    t8 = C8 * t10;
+    t4 = C9 * t13;
+    t17 = t8 + t4;
+    t16 = (-C9) * t10;
+    t1 = C8 * t13;
+    t12 = t16 + t1;
+    t14 = X[8];
+    t7 = X[311];
+    t11 = C10 * t14;
+    t0 = C11 * t7;
+    t8 = t11 + t0;
+    t4 = (-C11) * t14;
+    t10 = C10 * t7;
+    t13 = t4 + t10;
+    t16 = X[48];
+    t1 = X[271];
+    t11 = C12 * t16;
+    t0 = C13 * t1;
+    t14 = t11 + t0;
+    t7 = (-C13) * t16;
+    t4 = C12 * t1;
+    t10 = t7 + t4;
+    t11 = X[88];
+    t0 = X[231];
+    t16 = C14 * t11;
+    t1 = C15 * t0;
+    t7 = t16 + t1;
+    t4 = (-C15) * t11;
+    t16 = C14 * t0;
+    t1 = t4 + t16;
+    t11 = t9 + t17;
+    t0 = t15 + t12;
+    t4 = t3 + t14;
+    t16 = t18 + t10;
+    t9 = t9 - t17;
+    t17 = t15 - t12;
+    t15 = t3 - t14;
+    t12 = t18 - t10;
+    t3 = t11 + t4;
+    t14 = t0 + t16;
+    t18 = t9 + t12;
+    t10 = t17 - t15;
+    t11 = t11 - t4;
+    t4 = t0 - t16;
+    t0 = t9 - t12;
+    t16 = t17 + t15;
+    t9 = t6 + t8;
+    t12 = t2 + t13;
+    t17 = t19 + t7;
+    t15 = t5 + t1;
+    t6 = t6 - t8;
+    t8 = t2 - t13;
+    t2 = t19 - t7;
+    t13 = t5 - t1;
+    t19 = t9 + t17;
+    t7 = t12 + t15;
+    t5 = t6 + t13;
+    t1 = t8 - t2;
+    t9 = t9 - t17;
+    t17 = t12 - t15;
+    t12 = t6 - t13;
+    t15 = t8 + t2;
+    t6 = t5 + t1;
+    t13 = t5 - t1;
+    t8 = C16 * t6;
+    t2 = (-C16) * t13;
+    t5 = t12 - t15;
+    t1 = t12 + t15;
+    t6 = (-C16) * t5;
+    t13 = (-C16) * t1;
+    t12 = t3 - t19;
+    t15 = t14 - t7;
+    t5 = t3 + t19;
+    t1 = t14 + t7;
+    t3 = t18 - t8;
+    t19 = t10 - t2;
+    t14 = t18 + t8;
+    t7 = t10 + t2;
+    t18 = t11 - t17;
+    t8 = t4 + t9;
+    t10 = t11 + t17;
+    t2 = t4 - t9;
+    t11 = t0 - t6;
+    t17 = t16 - t13;
+    t4 = t0 + t6;
+    t9 = t16 + t13;
+    re[64] = t5;
+    im[64] = t1;
+    re[84] = t14;
+    im[84] = t7;
+    re[104] = t10;
+    im[104] = t2;
+    re[124] = t4;
+    im[124] = t9;
+    re[144] = t12;
+    im[144] = t15;
+    re[4] = t3;
+    im[4] = t19;
+    re[24] = t18;
+    im[24] = t8;
+    re[44] = t11;
+    im[44] = t17;
+    t0 = X[138];
+    t6 = X[181];
+    t16 = C17 * t0;
+    t13 = C18 * t6;
+    t5 = t16 + t13;
+    t1 = (-C18) * t0;
+    t14 = C17 * t6;
+    t7 = t1 + t14;
+    t10 = X[178];
+    t2 = X[141];
+    t4 = C19 * t10;
+    t9 = C20 * t2;
+    t12 = t4 + t9;
+    t15 = (-C20) * t10;
+    t3 = C19 * t2;
+    t19 = t15 + t3;
+    t18 = X[218];
+    t8 = X[101];
+    t11 = C21 * t18;
+    t17 = C22 * t8;
+    t16 = t11 + t17;
+    t13 = (-C22) * t18;
+    t0 = C21 * t8;
+    t6 = t13 + t0;
+    t1 = X[258];
+    t14 = X[61];
+    t4 = C23 * t1;
+    t9 = C24 * t14;
+    t10 = t4 + t9;
+    t2 = (-C24) * t1;
+    t15 = C23 * t14;
+    t3 = t2 + t15;
+    t11 = X[298];
+    t17 = X[21];
+    t18 = C25 * t11;
+    t8 = C26 * t17;
+    t13 = t18 + t8;
+    t0 = (-C26) * t11;
+    t4 = C25 * t17;
+    t9 = t0 + t4;
+    t1 = X[18];
+    t14 = X[301];
+    t2 = C27 * t1;
+    t15 = C28 * t14;
+    t18 = t2 + t15;
+    t8 = (-C28) * t1;
+    t11 = C27 * t14;
+    t17 = t8 + t11;
+    t0 = X[58];
+    t4 = X[261];
+    t2 = C29 * t0;
+    t15 = C30 * t4;
+    t1 = t2 + t15;
+    t14 = (-C30) * t0;
+    t8 = C29 * t4;
+    t11 = t14 + t8;
+    t2 = X[98];
+    t15 = X[221];
+    t0 = C31 * t2;
+    t4 = C32 * t15;
+    t14 = t0 + t4;
+    t8 = (-C32) * t2;
+    t0 = C31 * t15;
+    t4 = t8 + t0;
+    t2 = t5 + t13;
+    t15 = t7 + t9;
+    t8 = t16 + t1;
+    t0 = t6 + t11;
+    t5 = t5 - t13;
+    t13 = t7 - t9;
+    t7 = t16 - t1;
+    t9 = t6 - t11;
+    t16 = t2 + t8;
+    t1 = t15 + t0;
+    t6 = t5 + t9;
+    t11 = t13 - t7;
+    t2 = t2 - t8;
+    t8 = t15 - t0;
+    t15 = t5 - t9;
+    t0 = t13 + t7;
+    t5 = t12 + t18;
+    t9 = t19 + t17;
+    t13 = t10 + t14;
+    t7 = t3 + t4;
+    t12 = t12 - t18;
+    t18 = t19 - t17;
+    t19 = t10 - t14;
+    t17 = t3 - t4;
+    t10 = t5 + t13;
+    t14 = t9 + t7;
+    t3 = t12 + t17;
+    t4 = t18 - t19;
+    t5 = t5 - t13;
+    t13 = t9 - t7;
+    t9 = t12 - t17;
+    t7 = t18 + t19;
+    t12 = t3 + t4;
+    t17 = t3 - t4;
+    t18 = C16 * t12;
+    t19 = (-C16) * t17;
+    t3 = t9 - t7;
+    t4 = t9 + t7;
+    t12 = (-C16) * t3;
+    t17 = (-C16) * t4;
+    t9 = t16 - t10;
+    t7 = t1 - t14;
+    t3 = t16 + t10;
+    t4 = t1 + t14;
+    t16 = t6 - t18;
+    t10 = t11 - t19;
+    t1 = t6 + t18;
+    t14 = t11 + t19;
+    t6 = t2 - t13;
+    t18 = t8 + t5;
+    t11 = t2 + t13;
+    t19 = t8 - t5;
+    t2 = t15 - t12;
+    t13 = t0 - t17;
+    t8 = t15 + t12;
+    t5 = t0 + t17;
+    t15 = t1 + t14;
+    t12 = C33 * t15;
+    t0 = t1 * (-C34);
+    t17 = t14 * C35;
+    t15 = t12 - t17;
+    t1 = t12 + t0;
+    t14 = t11 + t19;
+    t17 = C36 * t14;
+    t12 = t11 * (-C37);
+    t0 = t19 * C38;
+    t14 = t17 - t0;
+    t11 = t17 + t12;
+    t19 = t8 + t5;
+    t0 = C39 * t19;
+    t17 = t8 * (-C40);
+    t12 = t5 * C41;
+    t19 = t0 - t12;
+    t8 = t0 + t17;
+    t5 = t9 + t7;
+    t12 = t9 - t7;
+    t0 = C16 * t5;
+    t17 = (-C16) * t12;
+    t9 = t16 + t10;
+    t7 = C42 * t9;
+    t5 = t16 * (-C40);
+    t12 = t10 * (-C41);
+    t9 = t7 - t12;
+    t16 = t7 + t5;
+    t10 = t6 + t18;
+    t12 = C43 * t10;
+    t7 = t6 * (-C37);
+    t5 = t18 * (-C38);
+    t10 = t12 - t5;
+    t6 = t12 + t7;
+    t18 = t2 + t13;
+    t5 = C44 * t18;
+    t12 = t2 * (-C34);
+    t7 = t13 * (-C35);
+    t18 = t5 - t7;
+    t2 = t5 + t12;
+    re[69] = t3;
+    im[69] = t4;
+    re[89] = t15;
+    im[89] = t1;
+    re[109] = t14;
+    im[109] = t11;
+    re[129] = t19;
+    im[129] = t8;
+    re[149] = t0;
+    im[149] = t17;
+    re[9] = t9;
+    im[9] = t16;
+    re[29] = t10;
+    im[29] = t6;
+    re[49] = t18;
+    im[49] = t2;
+    t13 = X[148];
+    t7 = X[171];
+    t5 = C45 * t13;
+    t12 = C46 * t7;
+    t3 = t5 + t12;
+    t4 = (-C46) * t13;
+    t15 = C45 * t7;
+    t1 = t4 + t15;
+    t14 = X[188];
+    t11 = X[131];
+    t19 = C47 * t14;
+    t8 = C48 * t11;
+    t0 = t19 + t8;
+    t17 = (-C48) * t14;
+    t9 = C47 * t11;
+    t16 = t17 + t9;
+    t10 = X[228];
+    t6 = X[91];
+    t18 = C49 * t10;
+    t2 = C50 * t6;
+    t5 = t18 + t2;
+    t12 = (-C50) * t10;
+    t13 = C49 * t6;
+    t7 = t12 + t13;
+    t4 = X[268];
+    t15 = X[51];
+    t19 = C51 * t4;
+    t8 = C52 * t15;
+    t14 = t19 + t8;
+    t11 = (-C52) * t4;
+    t17 = C51 * t15;
+    t9 = t11 + t17;
+    t18 = X[308];
+    t2 = X[11];
+    t10 = C53 * t18;
+    t6 = C54 * t2;
+    t12 = t10 + t6;
+    t13 = (-C54) * t18;
+    t19 = C53 * t2;
+    t8 = t13 + t19;
+    t4 = X[28];
+    t15 = X[291];
+    t11 = C55 * t4;
+    t17 = C56 * t15;
+    t10 = t11 + t17;
+    t6 = (-C56) * t4;
+    t18 = C55 * t15;
+    t2 = t6 + t18;
+    t13 = X[68];
+    t19 = X[251];
+    t11 = C57 * t13;
+    t17 = C58 * t19;
+    t4 = t11 + t17;
+    t15 = (-C58) * t13;
+    t6 = C57 * t19;
+    t18 = t15 + t6;
+    t11 = X[108];
+    t17 = X[211];
+    t13 = C59 * t11;
+    t19 = C60 * t17;
+    t15 = t13 + t19;
+    t6 = (-C60) * t11;
+    t13 = C59 * t17;
+    t19 = t6 + t13;
+    t11 = t3 + t12;
+    t17 = t1 + t8;
+    t6 = t5 + t4;
+    t13 = t7 + t18;
+    t3 = t3 - t12;
+    t12 = t1 - t8;
+    t1 = t5 - t4;
+    t8 = t7 - t18;
+    t5 = t11 + t6;
+    t4 = t17 + t13;
+    t7 = t3 + t8;
+    t18 = t12 - t1;
+    t11 = t11 - t6;
+    t6 = t17 - t13;
+    t17 = t3 - t8;
+    t13 = t12 + t1;
+    t3 = t0 + t10;
+    t8 = t16 + t2;
+    t12 = t14 + t15;
+    t1 = t9 + t19;
+    t0 = t0 - t10;
+    t10 = t16 - t2;
+    t16 = t14 - t15;
+    t2 = t9 - t19;
+    t14 = t3 + t12;
+    t15 = t8 + t1;
+    t9 = t0 + t2;
+    t19 = t10 - t16;
+    t3 = t3 - t12;
+    t12 = t8 - t1;
+    t8 = t0 - t2;
+    t1 = t10 + t16;
+    t0 = t9 + t19;
+    t2 = t9 - t19;
+    t10 = C16 * t0;
+    t16 = (-C16) * t2;
+    t9 = t8 - t1;
+    t19 = t8 + t1;
+    t0 = (-C16) * t9;
+    t2 = (-C16) * t19;
+    t8 = t5 - t14;
+    t1 = t4 - t15;
+    t9 = t5 + t14;
+    t19 = t4 + t15;
+    t5 = t7 - t10;
+    t14 = t18 - t16;
+    t4 = t7 + t10;
+    t15 = t18 + t16;
+    t7 = t11 - t12;
+    t10 = t6 + t3;
+    t18 = t11 + t12;
+    t16 = t6 - t3;
+    t11 = t17 - t0;
+    t12 = t13 - t2;
+    t6 = t17 + t0;
+    t3 = t13 + t2;
+    t17 = t4 + t15;
+    t0 = C36 * t17;
+    t13 = t4 * (-C37);
+    t2 = t15 * C38;
+    t17 = t0 - t2;
+    t4 = t0 + t13;
+    t15 = t18 + t16;
+    t2 = t18 - t16;
+    t0 = C16 * t15;
+    t13 = (-C16) * t2;
+    t18 = t6 + t3;
+    t16 = C43 * t18;
+    t15 = t6 * (-C37);
+    t2 = t3 * (-C38);
+    t18 = t16 - t2;
+    t6 = t16 + t15;
+    t3 = -t8;
+    t2 = t5 + t14;
+    t16 = (-C43) * t2;
+    t15 = t5 * (-C38);
+    t8 = t14 * (-C37);
+    t2 = t16 - t8;
+    t5 = t16 + t15;
+    t14 = t7 - t10;
+    t8 = t7 + t10;
+    t16 = (-C16) * t14;
+    t15 = (-C16) * t8;
+    t7 = t11 + t12;
+    t10 = (-C36) * t7;
+    t14 = t11 * C38;
+    t8 = t12 * (-C37);
+    t7 = t10 - t8;
+    t11 = t10 + t14;
+    re[74] = t9;
+    im[74] = t19;
+    re[94] = t17;
+    im[94] = t4;
+    re[114] = t0;
+    im[114] = t13;
+    re[134] = t18;
+    im[134] = t6;
+    re[154] = t1;
+    im[154] = t3;
+    re[14] = t2;
+    im[14] = t5;
+    re[34] = t16;
+    im[34] = t15;
+    re[54] = t7;
+    im[54] = t11;
+    t12 = X[158];
+    t8 = X[161];
+    t10 = C61 * t12;
+    t14 = C62 * t8;
+    t9 = t10 + t14;
+    t19 = (-C62) * t12;
+    t17 = C61 * t8;
+    t4 = t19 + t17;
+    t0 = X[198];
+    t13 = X[121];
+    t18 = C63 * t0;
+    t6 = C64 * t13;
+    t1 = t18 + t6;
+    t3 = (-C64) * t0;
+    t2 = C63 * t13;
+    t5 = t3 + t2;
+    t16 = X[238];
+    t15 = X[81];
+    t7 = C65 * t16;
+    t11 = C66 * t15;
+    t10 = t7 + t11;
+    t14 = (-C66) * t16;
+    t12 = C65 * t15;
+    t8 = t14 + t12;
+    t19 = X[278];
+    t17 = X[41];
+    t18 = C67 * t19;
+    t6 = C68 * t17;
+    t0 = t18 + t6;
+    t13 = (-C68) * t19;
+    t3 = C67 * t17;
+    t2 = t13 + t3;
+    t7 = X[318];
+    t11 = X[1];
+    t16 = C69 * t7;
+    t15 = C70 * t11;
+    t14 = t16 + t15;
+    t12 = (-C70) * t7;
+    t18 = C69 * t11;
+    t6 = t12 + t18;
+    t19 = X[38];
+    t17 = X[281];
+    t13 = C71 * t19;
+    t3 = C72 * t17;
+    t16 = t13 + t3;
+    t15 = (-C72) * t19;
+    t7 = C71 * t17;
+    t11 = t15 + t7;
+    t12 = X[78];
+    t18 = X[241];
+    t13 = C73 * t12;
+    t3 = C74 * t18;
+    t19 = t13 + t3;
+    t17 = (-C74) * t12;
+    t15 = C73 * t18;
+    t7 = t17 + t15;
+    t13 = X[118];
+    t3 = X[201];
+    t12 = C75 * t13;
+    t18 = C76 * t3;
+    t17 = t12 + t18;
+    t15 = (-C76) * t13;
+    t12 = C75 * t3;
+    t18 = t15 + t12;
+    t13 = t9 + t14;
+    t3 = t4 + t6;
+    t15 = t10 + t19;
+    t12 = t8 + t7;
+    t9 = t9 - t14;
+    t14 = t4 - t6;
+    t4 = t10 - t19;
+    t6 = t8 - t7;
+    t10 = t13 + t15;
+    t19 = t3 + t12;
+    t8 = t9 + t6;
+    t7 = t14 - t4;
+    t13 = t13 - t15;
+    t15 = t3 - t12;
+    t3 = t9 - t6;
+    t12 = t14 + t4;
+    t9 = t1 + t16;
+    t6 = t5 + t11;
+    t14 = t0 + t17;
+    t4 = t2 + t18;
+    t1 = t1 - t16;
+    t16 = t5 - t11;
+    t5 = t0 - t17;
+    t11 = t2 - t18;
+    t0 = t9 + t14;
+    t17 = t6 + t4;
+    t2 = t1 + t11;
+    t18 = t16 - t5;
+    t9 = t9 - t14;
+    t14 = t6 - t4;
+    t6 = t1 - t11;
+    t4 = t16 + t5;
+    t1 = t2 + t18;
+    t11 = t2 - t18;
+    t16 = C16 * t1;
+    t5 = (-C16) * t11;
+    t2 = t6 - t4;
+    t18 = t6 + t4;
+    t1 = (-C16) * t2;
+    t11 = (-C16) * t18;
+    t6 = t10 - t0;
+    t4 = t19 - t17;
+    t2 = t10 + t0;
+    t18 = t19 + t17;
+    t10 = t8 - t16;
+    t0 = t7 - t5;
+    t19 = t8 + t16;
+    t17 = t7 + t5;
+    t8 = t13 - t14;
+    t16 = t15 + t9;
+    t7 = t13 + t14;
+    t5 = t15 - t9;
+    t13 = t3 - t1;
+    t14 = t12 - t11;
+    t15 = t3 + t1;
+    t9 = t12 + t11;
+    t3 = t19 + t17;
+    t1 = C39 * t3;
+    t12 = t19 * (-C40);
+    t11 = t17 * C41;
+    t3 = t1 - t11;
+    t19 = t1 + t12;
+    t17 = t7 + t5;
+    t11 = C43 * t17;
+    t1 = t7 * (-C37);
+    t12 = t5 * (-C38);
+    t17 = t11 - t12;
+    t7 = t11 + t1;
+    t5 = t15 + t9;
+    t12 = (-C44) * t5;
+    t11 = t15 * (-C35);
+    t1 = t9 * (-C34);
+    t5 = t12 - t1;
+    t15 = t12 + t11;
+    t9 = t6 - t4;
+    t1 = t6 + t4;
+    t12 = (-C16) * t9;
+    t11 = (-C16) * t1;
+    t6 = t10 + t0;
+    t4 = (-C33) * t6;
+    t9 = t10 * C35;
+    t1 = t0 * (-C34);
+    t6 = t4 - t1;
+    t10 = t4 + t9;
+    t0 = t8 + t16;
+    t1 = (-C36) * t0;
+    t4 = t8 * C37;
+    t9 = t16 * (-C38);
+    t0 = t1 - t9;
+    t8 = t1 + t4;
+    t16 = t13 + t14;
+    t9 = (-C42) * t16;
+    t1 = t13 * C40;
+    t4 = t14 * C41;
+    t16 = t9 - t4;
+    t13 = t9 + t1;
+    re[79] = t2;
+    im[79] = t18;
+    re[99] = t3;
+    im[99] = t19;
+    re[119] = t17;
+    im[119] = t7;
+    re[139] = t5;
+    im[139] = t15;
+    re[159] = t12;
+    im[159] = t11;
+    re[19] = t6;
+    im[19] = t10;
+    re[39] = t0;
+    im[39] = t8;
+    re[59] = t16;
+    im[59] = t13;
+    t14 = re[64];
+    t4 = im[64];
+    t9 = re[69];
+    t1 = im[69];
+    t2 = re[74];
+    t18 = im[74];
+    t3 = re[79];
+    t19 = im[79];
+    t17 = t14 + t2;
+    t7 = t4 + t18;
+    t5 = t9 + t3;
+    t15 = t1 + t19;
+    t12 = t14 - t2;
+    t11 = t4 - t18;
+    t6 = t9 - t3;
+    t10 = t1 - t19;
+    t0 = t17 + t5;
+    t8 = t7 + t15;
+    t16 = t12 + t10;
+    t13 = t11 - t6;
+    t14 = t17 - t5;
+    t2 = t7 - t15;
+    t4 = t12 - t10;
+    t18 = t11 + t6;
+    re[64] = t0;
+    im[64] = t8;
+    re[69] = t16;
+    im[69] = t13;
+    re[74] = t14;
+    im[74] = t2;
+    re[79] = t4;
+    im[79] = t18;
+    t9 = re[84];
+    t3 = im[84];
+    t1 = re[89];
+    t19 = im[89];
+    t17 = re[94];
+    t5 = im[94];
+    t7 = re[99];
+    t15 = im[99];
+    t12 = t9 + t17;
+    t10 = t3 + t5;
+    t11 = t1 + t7;
+    t6 = t19 + t15;
+    t0 = t9 - t17;
+    t8 = t3 - t5;
+    t16 = t1 - t7;
+    t13 = t19 - t15;
+    t14 = t12 + t11;
+    t2 = t10 + t6;
+    t4 = t0 + t13;
+    t18 = t8 - t16;
+    t9 = t12 - t11;
+    t17 = t10 - t6;
+    t3 = t0 - t13;
+    t5 = t8 + t16;
+    re[84] = t14;
+    im[84] = t2;
+    re[89] = t4;
+    im[89] = t18;
+    re[94] = t9;
+    im[94] = t17;
+    re[99] = t3;
+    im[99] = t5;
+    t1 = re[104];
+    t7 = im[104];
+    t19 = re[109];
+    t15 = im[109];
+    t12 = re[114];
+    t11 = im[114];
+    t10 = re[119];
+    t6 = im[119];
+    t0 = t1 + t12;
+    t13 = t7 + t11;
+    t8 = t19 + t10;
+    t16 = t15 + t6;
+    t14 = t1 - t12;
+    t2 = t7 - t11;
+    t4 = t19 - t10;
+    t18 = t15 - t6;
+    t9 = t0 + t8;
+    t17 = t13 + t16;
+    t3 = t14 + t18;
+    t5 = t2 - t4;
+    t1 = t0 - t8;
+    t12 = t13 - t16;
+    t7 = t14 - t18;
+    t11 = t2 + t4;
+    re[104] = t9;
+    im[104] = t17;
+    re[109] = t3;
+    im[109] = t5;
+    re[114] = t1;
+    im[114] = t12;
+    re[119] = t7;
+    im[119] = t11;
+    t19 = re[124];
+    t10 = im[124];
+    t15 = re[129];
+    t6 = im[129];
+    t0 = re[134];
+    t8 = im[134];
+    t13 = re[139];
+    t16 = im[139];
+    t14 = t19 + t0;
+    t18 = t10 + t8;
+    t2 = t15 + t13;
+    t4 = t6 + t16;
+    t9 = t19 - t0;
+    t17 = t10 - t8;
+    t3 = t15 - t13;
+    t5 = t6 - t16;
+    t1 = t14 + t2;
+    t12 = t18 + t4;
+    t7 = t9 + t5;
+    t11 = t17 - t3;
+    t19 = t14 - t2;
+    t0 = t18 - t4;
+    t10 = t9 - t5;
+    t8 = t17 + t3;
+    re[124] = t1;
+    im[124] = t12;
+    re[129] = t7;
+    im[129] = t11;
+    re[134] = t19;
+    im[134] = t0;
+    re[139] = t10;
+    im[139] = t8;
+    t15 = re[144];
+    t13 = im[144];
+    t6 = re[149];
+    t16 = im[149];
+    t14 = re[154];
+    t2 = im[154];
+    t18 = re[159];
+    t4 = im[159];
+    t9 = t15 + t14;
+    t5 = t13 + t2;
+    t17 = t6 + t18;
+    t3 = t16 + t4;
+    t1 = t15 - t14;
+    t12 = t13 - t2;
+    t7 = t6 - t18;
+    t11 = t16 - t4;
+    t19 = t9 + t17;
+    t0 = t5 + t3;
+    t10 = t1 + t11;
+    t8 = t12 - t7;
+    t15 = t9 - t17;
+    t14 = t5 - t3;
+    t13 = t1 - t11;
+    t2 = t12 + t7;
+    re[144] = t19;
+    im[144] = t0;
+    re[149] = t10;
+    im[149] = t8;
+    re[154] = t15;
+    im[154] = t14;
+    re[159] = t13;
+    im[159] = t2;
+    t6 = re[4];
+    t18 = im[4];
+    t16 = re[9];
+    t4 = im[9];
+    t9 = re[14];
+    t17 = im[14];
+    t5 = re[19];
+    t3 = im[19];
+    t1 = t6 + t9;
+    t11 = t18 + t17;
+    t12 = t16 + t5;
+    t7 = t4 + t3;
+    t19 = t6 - t9;
+    t0 = t18 - t17;
+    t10 = t16 - t5;
+    t8 = t4 - t3;
+    t15 = t1 + t12;
+    t14 = t11 + t7;
+    t13 = t19 + t8;
+    t2 = t0 - t10;
+    t6 = t1 - t12;
+    t9 = t11 - t7;
+    t18 = t19 - t8;
+    t17 = t0 + t10;
+    re[4] = t15;
+    im[4] = t14;
+    re[9] = t13;
+    im[9] = t2;
+    re[14] = t6;
+    im[14] = t9;
+    re[19] = t18;
+    im[19] = t17;
+    t16 = re[24];
+    t5 = im[24];
+    t4 = re[29];
+    t3 = im[29];
+    t1 = re[34];
+    t12 = im[34];
+    t11 = re[39];
+    t7 = im[39];
+    t19 = t16 + t1;
+    t8 = t5 + t12;
+    t0 = t4 + t11;
+    t10 = t3 + t7;
+    t15 = t16 - t1;
+    t14 = t5 - t12;
+    t13 = t4 - t11;
+    t2 = t3 - t7;
+    t6 = t19 + t0;
+    t9 = t8 + t10;
+    t18 = t15 + t2;
+    t17 = t14 - t13;
+    t16 = t19 - t0;
+    t1 = t8 - t10;
+    t5 = t15 - t2;
+    t12 = t14 + t13;
+    re[24] = t6;
+    im[24] = t9;
+    re[29] = t18;
+    im[29] = t17;
+    re[34] = t16;
+    im[34] = t1;
+    re[39] = t5;
+    im[39] = t12;
+    t4 = re[44];
+    t11 = im[44];
+    t3 = re[49];
+    t7 = im[49];
+    t19 = re[54];
+    t0 = im[54];
+    t8 = re[59];
+    t10 = im[59];
+    t15 = t4 + t19;
+    t2 = t11 + t0;
+    t14 = t3 + t8;
+    t13 = t7 + t10;
+    t6 = t4 - t19;
+    t9 = t11 - t0;
+    t18 = t3 - t8;
+    t17 = t7 - t10;
+    t16 = t15 + t14;
+    t1 = t2 + t13;
+    t5 = t6 + t17;
+    t12 = t9 - t18;
+    t4 = t15 - t14;
+    t19 = t2 - t13;
+    t11 = t6 - t17;
+    t0 = t9 + t18;
+    re[44] = t16;
+    im[44] = t1;
+    re[49] = t5;
+    im[49] = t12;
+    re[54] = t4;
+    im[54] = t19;
+    re[59] = t11;
+    im[59] = t0;
+    t3 = X[192];
+    t8 = X[127];
+    t7 = C1 * t3;
+    t10 = C0 * t8;
+    t15 = t7 + t10;
+    t14 = (-C0) * t3;
+    t2 = C1 * t8;
+    t13 = t14 + t2;
+    t6 = X[232];
+    t17 = X[87];
+    t9 = C15 * t6;
+    t18 = C14 * t17;
+    t16 = t9 + t18;
+    t1 = (-C14) * t6;
+    t5 = C15 * t17;
+    t12 = t1 + t5;
+    t4 = X[272];
+    t19 = X[47];
+    t11 = C13 * t4;
+    t0 = C12 * t19;
+    t7 = t11 + t0;
+    t10 = (-C12) * t4;
+    t3 = C13 * t19;
+    t8 = t10 + t3;
+    t14 = X[312];
+    t2 = X[7];
+    t9 = C11 * t14;
+    t18 = C10 * t2;
+    t6 = t9 + t18;
+    t17 = (-C10) * t14;
+    t1 = C11 * t2;
+    t5 = t17 + t1;
+    t11 = X[32];
+    t0 = X[287];
+    t4 = C9 * t11;
+    t19 = C8 * t0;
+    t10 = t4 + t19;
+    t3 = (-C8) * t11;
+    t9 = C9 * t0;
+    t18 = t3 + t9;
+    t14 = X[72];
+    t2 = X[247];
+    t17 = C7 * t14;
+    t1 = C6 * t2;
+    t4 = t17 + t1;
+    t19 = (-C6) * t14;
+    t11 = C7 * t2;
+    t0 = t19 + t11;
+    t3 = X[112];
+    t9 = X[207];
+    t17 = C5 * t3;
+    t1 = C4 * t9;
+    t14 = t17 + t1;
+    t2 = (-C4) * t3;
+    t19 = C5 * t9;
+    t11 = t2 + t19;
+    t17 = X[152];
+    t1 = X[167];
+    t3 = C3 * t17;
+    t9 = C2 * t1;
+    t2 = t3 + t9;
+    t19 = (-C2) * t17;
+    t3 = C3 * t1;
+    t9 = t19 + t3;
+    t17 = t15 + t10;
+    t1 = t13 + t18;
+    t19 = t7 + t14;
+    t3 = t8 + t11;
+    t15 = t15 - t10;
+    t10 = t13 - t18;
+    t13 = t7 - t14;
+    t18 = t8 - t11;
+    t7 = t17 + t19;
+    t14 = t1 + t3;
+    t8 = t15 + t18;
+    t11 = t10 - t13;
+    t17 = t17 - t19;
+    t19 = t1 - t3;
+    t1 = t15 - t18;
+    t3 = t10 + t13;
+    t15 = t16 + t4;
+    t18 = t12 + t0;
+    t10 = t6 + t2;
+    t13 = t5 + t9;
+    t16 = t16 - t4;
+    t4 = t12 - t0;
+    t12 = t6 - t2;
+    t0 = t5 - t9;
+    t6 = t15 + t10;
+    t2 = t18 + t13;
+    t5 = t16 + t0;
+    t9 = t4 - t12;
+    t15 = t15 - t10;
+    t10 = t18 - t13;
+    t18 = t16 - t0;
+    t13 = t4 + t12;
+    t16 = t5 + t9;
+    t0 = t5 - t9;
+    t4 = C16 * t16;
+    t12 = (-C16) * t0;
+    t5 = t18 - t13;
+    t9 = t18 + t13;
+    t16 = (-C16) * t5;
+    t0 = (-C16) * t9;
+    t18 = t7 - t6;
+    t13 = t14 - t2;
+    t5 = t7 + t6;
+    t9 = t14 + t2;
+    t7 = t8 - t4;
+    t6 = t11 - t12;
+    t14 = t8 + t4;
+    t2 = t11 + t12;
+    t8 = t17 - t10;
+    t4 = t19 + t15;
+    t11 = t17 + t10;
+    t12 = t19 - t15;
+    t17 = t1 - t16;
+    t10 = t3 - t0;
+    t19 = t1 + t16;
+    t15 = t3 + t0;
+    re[96] = t5;
+    im[96] = t9;
+    re[116] = t14;
+    im[116] = t2;
+    re[136] = t11;
+    im[136] = t12;
+    re[156] = t19;
+    im[156] = t15;
+    re[16] = t18;
+    im[16] = t13;
+    re[36] = t7;
+    im[36] = t6;
+    re[56] = t8;
+    im[56] = t4;
+    re[76] = t17;
+    im[76] = t10;
+    t1 = X[202];
+    t16 = X[117];
+    t3 = C76 * t1;
+    t0 = C75 * t16;
+    t5 = t3 + t0;
+    t9 = (-C75) * t1;
+    t14 = C76 * t16;
+    t2 = t9 + t14;
+    t11 = X[242];
+    t12 = X[77];
+    t19 = C74 * t11;
+    t15 = C73 * t12;
+    t18 = t19 + t15;
+    t13 = (-C73) * t11;
+    t7 = C74 * t12;
+    t6 = t13 + t7;
+    t8 = X[282];
+    t4 = X[37];
+    t17 = C72 * t8;
+    t10 = C71 * t4;
+    t3 = t17 + t10;
+    t0 = (-C71) * t8;
+    t1 = C72 * t4;
+    t16 = t0 + t1;
+    t9 = X[2];
+    t14 = X[317];
+    t19 = C70 * t9;
+    t15 = C69 * t14;
+    t11 = t19 + t15;
+    t12 = (-C69) * t9;
+    t13 = C70 * t14;
+    t7 = t12 + t13;
+    t17 = X[42];
+    t10 = X[277];
+    t8 = C68 * t17;
+    t4 = C67 * t10;
+    t0 = t8 + t4;
+    t1 = (-C67) * t17;
+    t19 = C68 * t10;
+    t15 = t1 + t19;
+    t9 = X[82];
+    t14 = X[237];
+    t12 = C66 * t9;
+    t13 = C65 * t14;
+    t8 = t12 + t13;
+    t4 = (-C65) * t9;
+    t17 = C66 * t14;
+    t10 = t4 + t17;
+    t1 = X[122];
+    t19 = X[197];
+    t12 = C64 * t1;
+    t13 = C63 * t19;
+    t9 = t12 + t13;
+    t14 = (-C63) * t1;
+    t4 = C64 * t19;
+    t17 = t14 + t4;
+    t12 = X[162];
+    t13 = X[157];
+    t1 = C62 * t12;
+    t19 = C61 * t13;
+    t14 = t1 + t19;
+    t4 = (-C61) * t12;
+    t1 = C62 * t13;
+    t19 = t4 + t1;
+    t12 = t5 + t0;
+    t13 = t2 + t15;
+    t4 = t3 + t9;
+    t1 = t16 + t17;
+    t5 = t5 - t0;
+    t0 = t2 - t15;
+    t2 = t3 - t9;
+    t15 = t16 - t17;
+    t3 = t12 + t4;
+    t9 = t13 + t1;
+    t16 = t5 + t15;
+    t17 = t0 - t2;
+    t12 = t12 - t4;
+    t4 = t13 - t1;
+    t13 = t5 - t15;
+    t1 = t0 + t2;
+    t5 = t18 + t8;
+    t15 = t6 + t10;
+    t0 = t11 + t14;
+    t2 = t7 + t19;
+    t18 = t18 - t8;
+    t8 = t6 - t10;
+    t6 = t11 - t14;
+    t10 = t7 - t19;
+    t11 = t5 + t0;
+    t14 = t15 + t2;
+    t7 = t18 + t10;
+    t19 = t8 - t6;
+    t5 = t5 - t0;
+    t0 = t15 - t2;
+    t15 = t18 - t10;
+    t2 = t8 + t6;
+    t18 = t7 + t19;
+    t10 = t7 - t19;
+    t8 = C16 * t18;
+    t6 = (-C16) * t10;
+    t7 = t15 - t2;
+    t19 = t15 + t2;
+    t18 = (-C16) * t7;
+    t10 = (-C16) * t19;
+    t15 = t3 - t11;
+    t2 = t9 - t14;
+    t7 = t3 + t11;
+    t19 = t9 + t14;
+    t3 = t16 - t8;
+    t11 = t17 - t6;
+    t9 = t16 + t8;
+    t14 = t17 + t6;
+    t16 = t12 - t0;
+    t8 = t4 + t5;
+    t17 = t12 + t0;
+    t6 = t4 - t5;
+    t12 = t13 - t18;
+    t0 = t1 - t10;
+    t4 = t13 + t18;
+    t5 = t1 + t10;
+    t13 = t9 + t14;
+    t18 = C33 * t13;
+    t1 = t9 * (-C34);
+    t10 = t14 * C35;
+    t13 = t18 - t10;
+    t9 = t18 + t1;
+    t14 = t17 + t6;
+    t10 = C36 * t14;
+    t18 = t17 * (-C37);
+    t1 = t6 * C38;
+    t14 = t10 - t1;
+    t17 = t10 + t18;
+    t6 = t4 + t5;
+    t1 = C39 * t6;
+    t10 = t4 * (-C40);
+    t18 = t5 * C41;
+    t6 = t1 - t18;
+    t4 = t1 + t10;
+    t5 = t15 + t2;
+    t18 = t15 - t2;
+    t1 = C16 * t5;
+    t10 = (-C16) * t18;
+    t15 = t3 + t11;
+    t2 = C42 * t15;
+    t5 = t3 * (-C40);
+    t18 = t11 * (-C41);
+    t15 = t2 - t18;
+    t3 = t2 + t5;
+    t11 = t16 + t8;
+    t18 = C43 * t11;
+    t2 = t16 * (-C37);
+    t5 = t8 * (-C38);
+    t11 = t18 - t5;
+    t16 = t18 + t2;
+    t8 = t12 + t0;
+    t5 = C44 * t8;
+    t18 = t12 * (-C34);
+    t2 = t0 * (-C35);
+    t8 = t5 - t2;
+    t12 = t5 + t18;
+    re[101] = t7;
+    im[101] = t19;
+    re[121] = t13;
+    im[121] = t9;
+    re[141] = t14;
+    im[141] = t17;
+    re[1] = t6;
+    im[1] = t4;
+    re[21] = t1;
+    im[21] = t10;
+    re[41] = t15;
+    im[41] = t3;
+    re[61] = t11;
+    im[61] = t16;
+    re[81] = t8;
+    im[81] = t12;
+    t0 = X[212];
+    t2 = X[107];
+    t5 = C60 * t0;
+    t18 = C59 * t2;
+    t7 = t5 + t18;
+    t19 = (-C59) * t0;
+    t13 = C60 * t2;
+    t9 = t19 + t13;
+    t14 = X[252];
+    t17 = X[67];
+    t6 = C58 * t14;
+    t4 = C57 * t17;
+    t1 = t6 + t4;
+    t10 = (-C57) * t14;
+    t15 = C58 * t17;
+    t3 = t10 + t15;
+    t11 = X[292];
+    t16 = X[27];
+    t8 = C56 * t11;
+    t12 = C55 * t16;
+    t5 = t8 + t12;
+    t18 = (-C55) * t11;
+    t0 = C56 * t16;
+    t2 = t18 + t0;
+    t19 = X[12];
+    t13 = X[307];
+    t6 = C54 * t19;
+    t4 = C53 * t13;
+    t14 = t6 + t4;
+    t17 = (-C53) * t19;
+    t10 = C54 * t13;
+    t15 = t17 + t10;
+    t8 = X[52];
+    t12 = X[267];
+    t11 = C52 * t8;
+    t16 = C51 * t12;
+    t18 = t11 + t16;
+    t0 = (-C51) * t8;
+    t6 = C52 * t12;
+    t4 = t0 + t6;
+    t19 = X[92];
+    t13 = X[227];
+    t17 = C50 * t19;
+    t10 = C49 * t13;
+    t11 = t17 + t10;
+    t16 = (-C49) * t19;
+    t8 = C50 * t13;
+    t12 = t16 + t8;
+    t0 = X[132];
+    t6 = X[187];
+    t17 = C48 * t0;
+    t10 = C47 * t6;
+    t19 = t17 + t10;
+    t13 = (-C47) * t0;
+    t16 = C48 * t6;
+    t8 = t13 + t16;
+    t17 = X[172];
+    t10 = X[147];
+    t0 = C46 * t17;
+    t6 = C45 * t10;
+    t13 = t0 + t6;
+    t16 = (-C45) * t17;
+    t0 = C46 * t10;
+    t6 = t16 + t0;
+    t17 = t7 + t18;
+    t10 = t9 + t4;
+    t16 = t5 + t19;
+    t0 = t2 + t8;
+    t7 = t7 - t18;
+    t18 = t9 - t4;
+    t9 = t5 - t19;
+    t4 = t2 - t8;
+    t5 = t17 + t16;
+    t19 = t10 + t0;
+    t2 = t7 + t4;
+    t8 = t18 - t9;
+    t17 = t17 - t16;
+    t16 = t10 - t0;
+    t10 = t7 - t4;
+    t0 = t18 + t9;
+    t7 = t1 + t11;
+    t4 = t3 + t12;
+    t18 = t14 + t13;
+    t9 = t15 + t6;
+    t1 = t1 - t11;
+    t11 = t3 - t12;
+    t3 = t14 - t13;
+    t12 = t15 - t6;
+    t14 = t7 + t18;
+    t13 = t4 + t9;
+    t15 = t1 + t12;
+    t6 = t11 - t3;
+    t7 = t7 - t18;
+    t18 = t4 - t9;
+    t4 = t1 - t12;
+    t9 = t11 + t3;
+    t1 = t15 + t6;
+    t12 = t15 - t6;
+    t11 = C16 * t1;
+    t3 = (-C16) * t12;
+    t15 = t4 - t9;
+    t6 = t4 + t9;
+    t1 = (-C16) * t15;
+    t12 = (-C16) * t6;
+    t4 = t5 - t14;
+    t9 = t19 - t13;
+    t15 = t5 + t14;
+    t6 = t19 + t13;
+    t5 = t2 - t11;
+    t14 = t8 - t3;
+    t19 = t2 + t11;
+    t13 = t8 + t3;
+    t2 = t17 - t18;
+    t11 = t16 + t7;
+    t8 = t17 + t18;
+    t3 = t16 - t7;
+    t17 = t10 - t1;
+    t18 = t0 - t12;
+    t16 = t10 + t1;
+    t7 = t0 + t12;
+    t10 = t19 + t13;
+    t1 = C36 * t10;
+    t0 = t19 * (-C37);
+    t12 = t13 * C38;
+    t10 = t1 - t12;
+    t19 = t1 + t0;
+    t13 = t8 + t3;
+    t12 = t8 - t3;
+    t1 = C16 * t13;
+    t0 = (-C16) * t12;
+    t8 = t16 + t7;
+    t3 = C43 * t8;
+    t13 = t16 * (-C37);
+    t12 = t7 * (-C38);
+    t8 = t3 - t12;
+    t16 = t3 + t13;
+    t7 = -t4;
+    t12 = t5 + t14;
+    t3 = (-C43) * t12;
+    t13 = t5 * (-C38);
+    t4 = t14 * (-C37);
+    t12 = t3 - t4;
+    t5 = t3 + t13;
+    t14 = t2 - t11;
+    t4 = t2 + t11;
+    t3 = (-C16) * t14;
+    t13 = (-C16) * t4;
+    t2 = t17 + t18;
+    t11 = (-C36) * t2;
+    t14 = t17 * C38;
+    t4 = t18 * (-C37);
+    t2 = t11 - t4;
+    t17 = t11 + t14;
+    re[106] = t15;
+    im[106] = t6;
+    re[126] = t10;
+    im[126] = t19;
+    re[146] = t1;
+    im[146] = t0;
+    re[6] = t8;
+    im[6] = t16;
+    re[26] = t9;
+    im[26] = t7;
+    re[46] = t12;
+    im[46] = t5;
+    re[66] = t3;
+    im[66] = t13;
+    re[86] = t2;
+    im[86] = t17;
+    t18 = X[222];
+    t4 = X[97];
+    t11 = C32 * t18;
+    t14 = C31 * t4;
+    t15 = t11 + t14;
+    t6 = (-C31) * t18;
+    t10 = C32 * t4;
+    t19 = t6 + t10;
+    t1 = X[262];
+    t0 = X[57];
+    t8 = C30 * t1;
+    t16 = C29 * t0;
+    t9 = t8 + t16;
+    t7 = (-C29) * t1;
+    t12 = C30 * t0;
+    t5 = t7 + t12;
+    t3 = X[302];
+    t13 = X[17];
+    t2 = C28 * t3;
+    t17 = C27 * t13;
+    t11 = t2 + t17;
+    t14 = (-C27) * t3;
+    t18 = C28 * t13;
+    t4 = t14 + t18;
+    t6 = X[22];
+    t10 = X[297];
+    t8 = C26 * t6;
+    t16 = C25 * t10;
+    t1 = t8 + t16;
+    t0 = (-C25) * t6;
+    t7 = C26 * t10;
+    t12 = t0 + t7;
+    t2 = X[62];
+    t17 = X[257];
+    t3 = C24 * t2;
+    t13 = C23 * t17;
+    t14 = t3 + t13;
+    t18 = (-C23) * t2;
+    t8 = C24 * t17;
+    t16 = t18 + t8;
+    t6 = X[102];
+    t10 = X[217];
+    t0 = C22 * t6;
+    t7 = C21 * t10;
+    t3 = t0 + t7;
+    t13 = (-C21) * t6;
+    t2 = C22 * t10;
+    t17 = t13 + t2;
+    t18 = X[142];
+    t8 = X[177];
+    t0 = C20 * t18;
+    t7 = C19 * t8;
+    t6 = t0 + t7;
+    t10 = (-C19) * t18;
+    t13 = C20 * t8;
+    t2 = t10 + t13;
+    t0 = X[182];
+    t7 = X[137];
+    t18 = C18 * t0;
+    t8 = C17 * t7;
+    t10 = t18 + t8;
+    t13 = (-C17) * t0;
+    t18 = C18 * t7;
+    t8 = t13 + t18;
+    t0 = t15 + t14;
+    t7 = t19 + t16;
+    t13 = t11 + t6;
+    t18 = t4 + t2;
+    t15 = t15 - t14;
+    t14 = t19 - t16;
+    t19 = t11 - t6;
+    t16 = t4 - t2;
+    t11 = t0 + t13;
+    t6 = t7 + t18;
+    t4 = t15 + t16;
+    t2 = t14 - t19;
+    t0 = t0 - t13;
+    t13 = t7 - t18;
+    t7 = t15 - t16;
+    t18 = t14 + t19;
+    t15 = t9 + t3;
+    t16 = t5 + t17;
+    t14 = t1 + t10;
+    t19 = t12 + t8;
+    t9 = t9 - t3;
+    t3 = t5 - t17;
+    t5 = t1 - t10;
+    t17 = t12 - t8;
+    t1 = t15 + t14;
+    t10 = t16 + t19;
+    t12 = t9 + t17;
+    t8 = t3 - t5;
+    t15 = t15 - t14;
+    t14 = t16 - t19;
+    t16 = t9 - t17;
+    t19 = t3 + t5;
+    t9 = t12 + t8;
+    t17 = t12 - t8;
+    t3 = C16 * t9;
+    t5 = (-C16) * t17;
+    t12 = t16 - t19;
+    t8 = t16 + t19;
+    t9 = (-C16) * t12;
+    t17 = (-C16) * t8;
+    t16 = t11 - t1;
+    t19 = t6 - t10;
+    t12 = t11 + t1;
+    t8 = t6 + t10;
+    t11 = t4 - t3;
+    t1 = t2 - t5;
+    t6 = t4 + t3;
+    t10 = t2 + t5;
+    t4 = t0 - t14;
+    t3 = t13 + t15;
+    t2 = t0 + t14;
+    t5 = t13 - t15;
+    t0 = t7 - t9;
+    t14 = t18 - t17;
+    t13 = t7 + t9;
+    t15 = t18 + t17;
+    t7 = t6 + t10;
+    t9 = C39 * t7;
+    t18 = t6 * (-C40);
+    t17 = t10 * C41;
+    t7 = t9 - t17;
+    t6 = t9 + t18;
+    t10 = t2 + t5;
+    t17 = C43 * t10;
+    t9 = t2 * (-C37);
+    t18 = t5 * (-C38);
+    t10 = t17 - t18;
+    t2 = t17 + t9;
+    t5 = t13 + t15;
+    t18 = (-C44) * t5;
+    t17 = t13 * (-C35);
+    t9 = t15 * (-C34);
+    t5 = t18 - t9;
+    t13 = t18 + t17;
+    t15 = t16 - t19;
+    t9 = t16 + t19;
+    t18 = (-C16) * t15;
+    t17 = (-C16) * t9;
+    t16 = t11 + t1;
+    t19 = (-C33) * t16;
+    t15 = t11 * C35;
+    t9 = t1 * (-C34);
+    t16 = t19 - t9;
+    t11 = t19 + t15;
+    t1 = t4 + t3;
+    t9 = (-C36) * t1;
+    t19 = t4 * C37;
+    t15 = t3 * (-C38);
+    t1 = t9 - t15;
+    t4 = t9 + t19;
+    t3 = t0 + t14;
+    t15 = (-C42) * t3;
+    t9 = t0 * C40;
+    t19 = t14 * C41;
+    t3 = t15 - t19;
+    t0 = t15 + t9;
+    re[111] = t12;
+    im[111] = t8;
+    re[131] = t7;
+    im[131] = t6;
+    re[151] = t10;
+    im[151] = t2;
+    re[11] = t5;
+    im[11] = t13;
+    re[31] = t18;
+    im[31] = t17;
+    re[51] = t16;
+    im[51] = t11;
+    re[71] = t1;
+    im[71] = t4;
+    re[91] = t3;
+    im[91] = t0;
+    t14 = re[96];
+    t19 = im[96];
+    t15 = re[101];
+    t9 = im[101];
+    t12 = re[106];
+    t8 = im[106];
+    t7 = re[111];
+    t6 = im[111];
+    t10 = t14 + t12;
+    t2 = t19 + t8;
+    t5 = t15 + t7;
+    t13 = t9 + t6;
+    t18 = t14 - t12;
+    t17 = t19 - t8;
+    t16 = t15 - t7;
+    t11 = t9 - t6;
+    t1 = t10 + t5;
+    t4 = t2 + t13;
+    t3 = t18 + t11;
+    t0 = t17 - t16;
+    t14 = t10 - t5;
+    t12 = t2 - t13;
+    t19 = t18 - t11;
+    t8 = t17 + t16;
+    re[96] = t1;
+    im[96] = t4;
+    re[101] = t3;
+    im[101] = t0;
+    re[106] = t14;
+    im[106] = t12;
+    re[111] = t19;
+    im[111] = t8;
+    t15 = re[116];
+    t7 = im[116];
+    t9 = re[121];
+    t6 = im[121];
+    t10 = re[126];
+    t5 = im[126];
+    t2 = re[131];
+    t13 = im[131];
+    t18 = t15 + t10;
+    t11 = t7 + t5;
+    t17 = t9 + t2;
+    t16 = t6 + t13;
+    t1 = t15 - t10;
+    t4 = t7 - t5;
+    t3 = t9 - t2;
+    t0 = t6 - t13;
+    t14 = t18 + t17;
+    t12 = t11 + t16;
+    t19 = t1 + t0;
+    t8 = t4 - t3;
+    t15 = t18 - t17;
+    t10 = t11 - t16;
+    t7 = t1 - t0;
+    t5 = t4 + t3;
+    re[116] = t14;
+    im[116] = t12;
+    re[121] = t19;
+    im[121] = t8;
+    re[126] = t15;
+    im[126] = t10;
+    re[131] = t7;
+    im[131] = t5;
+    t9 = re[136];
+    t2 = im[136];
+    t6 = re[141];
+    t13 = im[141];
+    t18 = re[146];
+    t17 = im[146];
+    t11 = re[151];
+    t16 = im[151];
+    t1 = t9 + t18;
+    t0 = t2 + t17;
+    t4 = t6 + t11;
+    t3 = t13 + t16;
+    t14 = t9 - t18;
+    t12 = t2 - t17;
+    t19 = t6 - t11;
+    t8 = t13 - t16;
+    t15 = t1 + t4;
+    t10 = t0 + t3;
+    t7 = t14 + t8;
+    t5 = t12 - t19;
+    t9 = t1 - t4;
+    t18 = t0 - t3;
+    t2 = t14 - t8;
+    t17 = t12 + t19;
+    re[136] = t15;
+    im[136] = t10;
+    re[141] = t7;
+    im[141] = t5;
+    re[146] = t9;
+    im[146] = t18;
+    re[151] = t2;
+    im[151] = t17;
+    t6 = re[156];
+    t11 = im[156];
+    t13 = re[1];
+    t16 = im[1];
+    t1 = re[6];
+    t4 = im[6];
+    t0 = re[11];
+    t3 = im[11];
+    t14 = t6 + t1;
+    t8 = t11 + t4;
+    t12 = t13 + t0;
+    t19 = t16 + t3;
+    t15 = t6 - t1;
+    t10 = t11 - t4;
+    t7 = t13 - t0;
+    t5 = t16 - t3;
+    t9 = t14 + t12;
+    t18 = t8 + t19;
+    t2 = t15 + t5;
+    t17 = t10 - t7;
+    t6 = t14 - t12;
+    t1 = t8 - t19;
+    t11 = t15 - t5;
+    t4 = t10 + t7;
+    re[156] = t9;
+    im[156] = t18;
+    re[1] = t2;
+    im[1] = t17;
+    re[6] = t6;
+    im[6] = t1;
+    re[11] = t11;
+    im[11] = t4;
+    t13 = re[16];
+    t0 = im[16];
+    t16 = re[21];
+    t3 = im[21];
+    t14 = re[26];
+    t12 = im[26];
+    t8 = re[31];
+    t19 = im[31];
+    t15 = t13 + t14;
+    t5 = t0 + t12;
+    t10 = t16 + t8;
+    t7 = t3 + t19;
+    t9 = t13 - t14;
+    t18 = t0 - t12;
+    t2 = t16 - t8;
+    t17 = t3 - t19;
+    t6 = t15 + t10;
+    t1 = t5 + t7;
+    t11 = t9 + t17;
+    t4 = t18 - t2;
+    t13 = t15 - t10;
+    t14 = t5 - t7;
+    t0 = t9 - t17;
+    t12 = t18 + t2;
+    re[16] = t6;
+    im[16] = t1;
+    re[21] = t11;
+    im[21] = t4;
+    re[26] = t13;
+    im[26] = t14;
+    re[31] = t0;
+    im[31] = t12;
+    t16 = re[36];
+    t8 = im[36];
+    t3 = re[41];
+    t19 = im[41];
+    t15 = re[46];
+    t10 = im[46];
+    t5 = re[51];
+    t7 = im[51];
+    t9 = t16 + t15;
+    t17 = t8 + t10;
+    t18 = t3 + t5;
+    t2 = t19 + t7;
+    t6 = t16 - t15;
+    t1 = t8 - t10;
+    t11 = t3 - t5;
+    t4 = t19 - t7;
+    t13 = t9 + t18;
+    t14 = t17 + t2;
+    t0 = t6 + t4;
+    t12 = t1 - t11;
+    t16 = t9 - t18;
+    t15 = t17 - t2;
+    t8 = t6 - t4;
+    t10 = t1 + t11;
+    re[36] = t13;
+    im[36] = t14;
+    re[41] = t0;
+    im[41] = t12;
+    re[46] = t16;
+    im[46] = t15;
+    re[51] = t8;
+    im[51] = t10;
+    t3 = re[56];
+    t5 = im[56];
+    t19 = re[61];
+    t7 = im[61];
+    t9 = re[66];
+    t18 = im[66];
+    t17 = re[71];
+    t2 = im[71];
+    t6 = t3 + t9;
+    t4 = t5 + t18;
+    t1 = t19 + t17;
+    t11 = t7 + t2;
+    t13 = t3 - t9;
+    t14 = t5 - t18;
+    t0 = t19 - t17;
+    t12 = t7 - t2;
+    t16 = t6 + t1;
+    t15 = t4 + t11;
+    t8 = t13 + t12;
+    t10 = t14 - t0;
+    t3 = t6 - t1;
+    t9 = t4 - t11;
+    t5 = t13 - t12;
+    t18 = t14 + t0;
+    re[56] = t16;
+    im[56] = t15;
+    re[61] = t8;
+    im[61] = t10;
+    re[66] = t3;
+    im[66] = t9;
+    re[71] = t5;
+    im[71] = t18;
+    t19 = re[76];
+    t17 = im[76];
+    t7 = re[81];
+    t2 = im[81];
+    t6 = re[86];
+    t1 = im[86];
+    t4 = re[91];
+    t11 = im[91];
+    t13 = t19 + t6;
+    t12 = t17 + t1;
+    t14 = t7 + t4;
+    t0 = t2 + t11;
+    t16 = t19 - t6;
+    t15 = t17 - t1;
+    t8 = t7 - t4;
+    t10 = t2 - t11;
+    t3 = t13 + t14;
+    t9 = t12 + t0;
+    t5 = t16 + t10;
+    t18 = t15 - t8;
+    t19 = t13 - t14;
+    t6 = t12 - t0;
+    t17 = t16 - t10;
+    t1 = t15 + t8;
+    re[76] = t3;
+    im[76] = t9;
+    re[81] = t5;
+    im[81] = t18;
+    re[86] = t19;
+    im[86] = t6;
+    re[91] = t17;
+    im[91] = t1;
+}
+
+/**
+ *  Part 3 of ApplyWindowedIMDCT_W10_320().
+ * 
+ *  @param {Number[]} X 
+ *    - The input block (320 points).
+ *  @param {Number[]} y 
+ *    - The array that would contain the output block (640 points).
+ *  @param {Number[]} re 
+ *    - The scratch buffer (real part, 160 points).
+ *  @param {Number[]} im 
+ *    - The scratch buffer (imaginary part, 160 points).
+ */
+function ApplyWindowedIMDCT_W10_320_Part3(X, y, re, im) {
+    let t0, t1, t10, t11, t12, t13, t14, t15, t16, t17, t18, t19, t2, t3, t4, t5, t6, t7, t8, t9;
+    const C0 = 0.3090169943749474;
+    const C1 = 0.9510565162951535;
+    const C2 = 0.11753739745783764;
+    const C3 = 0.9930684569549263;
+    const C4 = 0.996917333733128;
+    const C5 = 0.07845909572784494;
+    const C6 = 0.9624552364536473;
+    const C7 = 0.27144044986507426;
+    const C8 = 0.8910065241883679;
+    const C9 = 0.45399049973954675;
+    const C10 = 0.785316930880745;
+    const C11 = 0.619093949309834;
+    const C12 = 0.6494480483301837;
+    const C13 = 0.7604059656000309;
+    const C14 = 0.4886212414969549;
+    const C15 = 0.8724960070727972;
+    const C16 = 0.7071067811865476;
+    const C17 = 0.26197863846333747;
+    const C18 = 0.9650736723115474;
+    const C19 = 0.06866825888437376;
+    const C20 = 0.9976395492470157;
+    const C21 = 0.991866697787626;
+    const C22 = 0.1272810033739132;
+    const C23 = 0.9479769653775104;
+    const C24 = 0.3183389280525497;
+    const C25 = 0.8676570098195441;
+    const C26 = 0.4971632662526543;
+    const C27 = 0.7539934819618695;
+    const C28 = 0.6568818989430413;
+    const C29 = 0.6113544074368165;
+    const C30 = 0.7913569286406602;
+    const C31 = 0.4452213258854682;
+    const C32 = 0.895420555368697;
+    const C33 = 0.9807852804032304;
+    const C34 = 1.1758756024193586;
+    const C35 = 0.7856949583871022;
+    const C36 = 0.9238795325112867;
+    const C37 = 1.3065629648763766;
+    const C38 = 0.5411961001461969;
+    const C39 = 0.8314696123025452;
+    const C40 = 1.3870398453221475;
+    const C41 = 0.27589937928294306;
+    const C42 = 0.5555702330196022;
+    const C43 = 0.3826834323650898;
+    const C44 = 0.19509032201612825;
+    const C45 = 0.21430915306505077;
+    const C46 = 0.9767658813208724;
+    const C47 = 0.0196336924606283;
+    const C48 = 0.9998072404820648;
+    const C49 = 0.9844265680898916;
+    const C50 = 0.1757962799343545;
+    const C51 = 0.9312149347588036;
+    const C52 = 0.36447049987914965;
+    const C53 = 0.8422172337162865;
+    const C54 = 0.5391383229110002;
+    const C55 = 0.7208535967029188;
+    const C56 = 0.6930873625456359;
+    const C57 = 0.5717879602276122;
+    const C58 = 0.8204014435255136;
+    const C59 = 0.40074883310314097;
+    const C60 = 0.916187957117136;
+    const C61 = 0.16612337814576547;
+    const C62 = 0.9861049757675088;
+    const C63 = 0.9995663085020212;
+    const C64 = 0.02944817324796316;
+    const C65 = 0.974614868564045;
+    const C66 = 0.22388804785849836;
+    const C67 = 0.9122095257974677;
+    const C68 = 0.4097240303476953;
+    const C69 = 0.8147484825274894;
+    const C70 = 0.5798145481265136;
+    const C71 = 0.6859771119901928;
+    const C72 = 0.7276231179845748;
+    const C73 = 0.5308440257395095;
+    const C74 = 0.8474695394742344;
+    const C75 = 0.3553109012804161;
+    const C76 = 0.9347481818282924;
+    const C77 = 0.5590169943749475;
+    const C78 = 0.25;
+    const C79 = 0.5877852522924731;
+    const C80 = 0.9999969880372782;
+    const C81 = 0.0024543667964602917;
+    const C82 = 0.5857978574564389;
+    const C83 = 0.8104571982525948;
+    const C84 = 0.9502952106978444;
+    const C85 = 0.311350305162432;
+    const C86 = 0.3066818220921279;
+    const C87 = 0.9518120927989161;
+    const C88 = 0.8075719170392435;
+    const C89 = 0.5897691063539708;
+    const C90 = 0.8017430476558816;
+    const C91 = 0.5976688761642678;
+    const C92 = 0.9999247018391445;
+    const C93 = 0.012271538285719925;
+    const C94 = 0.5778131101237274;
+    const C95 = 0.8161691061104588;
+    const C96 = 0.9471927896111967;
+    const C97 = 0.3206646524151973;
+    const C98 = 0.2973227995119985;
+    const C99 = 0.9547770173660172;
+    const C100 = 0.28793512034162105;
+    const C101 = 0.9576499185369652;
+    const C102 = 0.7958369046088836;
+    const C103 = 0.6055110414043255;
+    const C104 = 0.9997560408170603;
+    const C105 = 0.02208752701857829;
+    const C106 = 0.5697726719608341;
+    const C107 = 0.8218023498911473;
+    const C108 = 0.9439990761120522;
+    const C109 = 0.32994809334134934;
+    const C110 = 0.9407143780171653;
+    const C111 = 0.33919973318352975;
+    const C112 = 0.27851968938505306;
+    const C113 = 0.9604305194155658;
+    const C114 = 0.789854057144609;
+    const C115 = 0.6132948462299359;
+    const C116 = 0.9994910212269259;
+    const C117 = 0.03190138690961086;
+    const C118 = 0.5616773179219247;
+    const C119 = 0.8273563866508998;
+    const C120 = 0.55352782825407;
+    const C121 = 0.8328306810800937;
+    const C122 = 0.937339011912575;
+    const C123 = 0.34841868024943456;
+    const C124 = 0.2690774141211269;
+    const C125 = 0.9631185520017188;
+    const C126 = 0.7837950819023488;
+    const C127 = 0.6210195404217892;
+    const C128 = 0.9991296686118811;
+    const C129 = 0.041712172078575326;
+    const C130 = 0.9986720177998429;
+    const C131 = 0.05151893694157748;
+    const C132 = 0.5453249884220465;
+    const C133 = 0.8382247055548381;
+    const C134 = 0.9338733031230915;
+    const C135 = 0.3576040459977578;
+    const C136 = 0.2596092046159851;
+    const C137 = 0.965713757217249;
+    const C138 = 0.7776605628587479;
+    const C139 = 0.6286843794577813;
+    const C140 = 0.7714510912715192;
+    const C141 = 0.6362886245847729;
+    const C142 = 0.9981181129001492;
+    const C143 = 0.06132073630220858;
+    const C144 = 0.5370695890326298;
+    const C145 = 0.843537940187827;
+    const C146 = 0.9303175856809415;
+    const C147 = 0.3667549451238308;
+    const C148 = 0.25011597343536635;
+    const C149 = 0.9682158849308758;
+    const C150 = 0.24059863555665045;
+    const C151 = 0.970624693982323;
+    const C152 = 0.765167265622459;
+    const C153 = 0.6438315428897914;
+    const C154 = 0.9974680072993071;
+    const C155 = 0.07111662544264533;
+    const C156 = 0.5287624257583957;
+    const C157 = 0.8487698728784482;
+    const C158 = 0.9266722022935726;
+    const C159 = 0.37587049564494945;
+    const C160 = 0.9229375043106232;
+    const C161 = 0.3849498189853822;
+    const C162 = 0.2310581082806711;
+    const C163 = 0.9729399522055602;
+    const C164 = 0.7588096915597616;
+    const C165 = 0.6513124073706714;
+    const C166 = 0.9967217636558474;
+    const C167 = 0.08090566021470375;
+    const C168 = 0.5204042992610306;
+    const C169 = 0.8539199993621391;
+    t7 = X[256];
+    t4 = X[63];
+    t2 = C0 * t7;
+    t11 = C1 * t4;
+    t13 = t2 + t11;
+    t14 = (-C1) * t7;
+    t12 = C0 * t4;
+    t0 = t14 + t12;
+    t16 = X[296];
+    t10 = X[23];
+    t15 = C2 * t16;
+    t8 = C3 * t10;
+    t3 = t15 + t8;
+    t9 = (-C3) * t16;
+    t5 = C2 * t10;
+    t18 = t9 + t5;
+    t19 = X[16];
+    t6 = X[303];
+    t17 = C4 * t19;
+    t1 = C5 * t6;
+    t2 = t17 + t1;
+    t11 = (-C5) * t19;
+    t7 = C4 * t6;
+    t4 = t11 + t7;
+    t14 = X[56];
+    t12 = X[263];
+    t15 = C6 * t14;
+    t8 = C7 * t12;
+    t16 = t15 + t8;
+    t10 = (-C7) * t14;
+    t9 = C6 * t12;
+    t5 = t10 + t9;
+    t17 = X[96];
+    t1 = X[223];
+    t19 = C8 * t17;
+    t6 = C9 * t1;
+    t11 = t19 + t6;
+    t7 = (-C9) * t17;
+    t15 = C8 * t1;
+    t8 = t7 + t15;
+    t14 = X[136];
+    t12 = X[183];
+    t10 = C10 * t14;
+    t9 = C11 * t12;
+    t19 = t10 + t9;
+    t6 = (-C11) * t14;
+    t17 = C10 * t12;
+    t1 = t6 + t17;
+    t7 = X[176];
+    t15 = X[143];
+    t10 = C12 * t7;
+    t9 = C13 * t15;
+    t14 = t10 + t9;
+    t12 = (-C13) * t7;
+    t6 = C12 * t15;
+    t17 = t12 + t6;
+    t10 = X[216];
+    t9 = X[103];
+    t7 = C14 * t10;
+    t15 = C15 * t9;
+    t12 = t7 + t15;
+    t6 = (-C15) * t10;
+    t7 = C14 * t9;
+    t15 = t6 + t7;
+    t10 = t13 + t11;
+    t9 = t0 + t8;
+    t6 = t2 + t14;
+    t7 = t4 + t17;
+    t13 = t13 - t11;
+    t11 = t0 - t8;
+    t0 = t2 - t14;
+    t8 = t4 - t17;
+    t2 = t10 + t6;
+    t14 = t9 + t7;
+    t4 = t13 + t8;
+    t17 = t11 - t0;
+    t10 = t10 - t6;
+    t6 = t9 - t7;
+    t9 = t13 - t8;
+    t7 = t11 + t0;
+    t13 = t3 + t19;
+    t8 = t18 + t1;
+    t11 = t16 + t12;
+    t0 = t5 + t15;
+    t3 = t3 - t19;
+    t19 = t18 - t1;
+    t18 = t16 - t12;
+    t1 = t5 - t15;
+    t16 = t13 + t11;
+    t12 = t8 + t0;
+    t5 = t3 + t1;
+    t15 = t19 - t18;
+    t13 = t13 - t11;
+    t11 = t8 - t0;
+    t8 = t3 - t1;
+    t0 = t19 + t18;
+    t3 = t5 + t15;
+    t1 = t5 - t15;
+    t19 = C16 * t3;
+    t18 = (-C16) * t1;
+    t5 = t8 - t0;
+    t15 = t8 + t0;
+    t3 = (-C16) * t5;
+    t1 = (-C16) * t15;
+    t8 = t2 - t16;
+    t0 = t14 - t12;
+    t5 = t2 + t16;
+    t15 = t14 + t12;
+    t2 = t4 - t19;
+    t16 = t17 - t18;
+    t14 = t4 + t19;
+    t12 = t17 + t18;
+    t4 = t10 - t11;
+    t19 = t6 + t13;
+    t17 = t10 + t11;
+    t18 = t6 - t13;
+    t10 = t9 - t3;
+    t11 = t7 - t1;
+    t6 = t9 + t3;
+    t13 = t7 + t1;
+    re[128] = t5;
+    im[128] = t15;
+    re[148] = t14;
+    im[148] = t12;
+    re[8] = t17;
+    im[8] = t18;
+    re[28] = t6;
+    im[28] = t13;
+    re[48] = t8;
+    im[48] = t0;
+    re[68] = t2;
+    im[68] = t16;
+    re[88] = t4;
+    im[88] = t19;
+    re[108] = t10;
+    im[108] = t11;
+    t9 = X[266];
+    t3 = X[53];
+    t7 = C17 * t9;
+    t1 = C18 * t3;
+    t5 = t7 + t1;
+    t15 = (-C18) * t9;
+    t14 = C17 * t3;
+    t12 = t15 + t14;
+    t17 = X[306];
+    t18 = X[13];
+    t6 = C19 * t17;
+    t13 = C20 * t18;
+    t8 = t6 + t13;
+    t0 = (-C20) * t17;
+    t2 = C19 * t18;
+    t16 = t0 + t2;
+    t4 = X[26];
+    t19 = X[293];
+    t10 = C21 * t4;
+    t11 = C22 * t19;
+    t7 = t10 + t11;
+    t1 = (-C22) * t4;
+    t9 = C21 * t19;
+    t3 = t1 + t9;
+    t15 = X[66];
+    t14 = X[253];
+    t6 = C23 * t15;
+    t13 = C24 * t14;
+    t17 = t6 + t13;
+    t18 = (-C24) * t15;
+    t0 = C23 * t14;
+    t2 = t18 + t0;
+    t10 = X[106];
+    t11 = X[213];
+    t4 = C25 * t10;
+    t19 = C26 * t11;
+    t1 = t4 + t19;
+    t9 = (-C26) * t10;
+    t6 = C25 * t11;
+    t13 = t9 + t6;
+    t15 = X[146];
+    t14 = X[173];
+    t18 = C27 * t15;
+    t0 = C28 * t14;
+    t4 = t18 + t0;
+    t19 = (-C28) * t15;
+    t10 = C27 * t14;
+    t11 = t19 + t10;
+    t9 = X[186];
+    t6 = X[133];
+    t18 = C29 * t9;
+    t0 = C30 * t6;
+    t15 = t18 + t0;
+    t14 = (-C30) * t9;
+    t19 = C29 * t6;
+    t10 = t14 + t19;
+    t18 = X[226];
+    t0 = X[93];
+    t9 = C31 * t18;
+    t6 = C32 * t0;
+    t14 = t9 + t6;
+    t19 = (-C32) * t18;
+    t9 = C31 * t0;
+    t6 = t19 + t9;
+    t18 = t5 + t1;
+    t0 = t12 + t13;
+    t19 = t7 + t15;
+    t9 = t3 + t10;
+    t5 = t5 - t1;
+    t1 = t12 - t13;
+    t12 = t7 - t15;
+    t13 = t3 - t10;
+    t7 = t18 + t19;
+    t15 = t0 + t9;
+    t3 = t5 + t13;
+    t10 = t1 - t12;
+    t18 = t18 - t19;
+    t19 = t0 - t9;
+    t0 = t5 - t13;
+    t9 = t1 + t12;
+    t5 = t8 + t4;
+    t13 = t16 + t11;
+    t1 = t17 + t14;
+    t12 = t2 + t6;
+    t8 = t8 - t4;
+    t4 = t16 - t11;
+    t16 = t17 - t14;
+    t11 = t2 - t6;
+    t17 = t5 + t1;
+    t14 = t13 + t12;
+    t2 = t8 + t11;
+    t6 = t4 - t16;
+    t5 = t5 - t1;
+    t1 = t13 - t12;
+    t13 = t8 - t11;
+    t12 = t4 + t16;
+    t8 = t2 + t6;
+    t11 = t2 - t6;
+    t4 = C16 * t8;
+    t16 = (-C16) * t11;
+    t2 = t13 - t12;
+    t6 = t13 + t12;
+    t8 = (-C16) * t2;
+    t11 = (-C16) * t6;
+    t13 = t7 - t17;
+    t12 = t15 - t14;
+    t2 = t7 + t17;
+    t6 = t15 + t14;
+    t7 = t3 - t4;
+    t17 = t10 - t16;
+    t15 = t3 + t4;
+    t14 = t10 + t16;
+    t3 = t18 - t1;
+    t4 = t19 + t5;
+    t10 = t18 + t1;
+    t16 = t19 - t5;
+    t18 = t0 - t8;
+    t1 = t9 - t11;
+    t19 = t0 + t8;
+    t5 = t9 + t11;
+    t0 = t15 + t14;
+    t8 = C33 * t0;
+    t9 = t15 * (-C34);
+    t11 = t14 * C35;
+    t0 = t8 - t11;
+    t15 = t8 + t9;
+    t14 = t10 + t16;
+    t11 = C36 * t14;
+    t8 = t10 * (-C37);
+    t9 = t16 * C38;
+    t14 = t11 - t9;
+    t10 = t11 + t8;
+    t16 = t19 + t5;
+    t9 = C39 * t16;
+    t11 = t19 * (-C40);
+    t8 = t5 * C41;
+    t16 = t9 - t8;
+    t19 = t9 + t11;
+    t5 = t13 + t12;
+    t8 = t13 - t12;
+    t9 = C16 * t5;
+    t11 = (-C16) * t8;
+    t13 = t7 + t17;
+    t12 = C42 * t13;
+    t5 = t7 * (-C40);
+    t8 = t17 * (-C41);
+    t13 = t12 - t8;
+    t7 = t12 + t5;
+    t17 = t3 + t4;
+    t8 = C43 * t17;
+    t12 = t3 * (-C37);
+    t5 = t4 * (-C38);
+    t17 = t8 - t5;
+    t3 = t8 + t12;
+    t4 = t18 + t1;
+    t5 = C44 * t4;
+    t8 = t18 * (-C34);
+    t12 = t1 * (-C35);
+    t4 = t5 - t12;
+    t18 = t5 + t8;
+    re[133] = t2;
+    im[133] = t6;
+    re[153] = t0;
+    im[153] = t15;
+    re[13] = t14;
+    im[13] = t10;
+    re[33] = t16;
+    im[33] = t19;
+    re[53] = t9;
+    im[53] = t11;
+    re[73] = t13;
+    im[73] = t7;
+    re[93] = t17;
+    im[93] = t3;
+    re[113] = t4;
+    im[113] = t18;
+    t1 = X[276];
+    t12 = X[43];
+    t5 = C45 * t1;
+    t8 = C46 * t12;
+    t2 = t5 + t8;
+    t6 = (-C46) * t1;
+    t0 = C45 * t12;
+    t15 = t6 + t0;
+    t14 = X[316];
+    t10 = X[3];
+    t16 = C47 * t14;
+    t19 = C48 * t10;
+    t9 = t16 + t19;
+    t11 = (-C48) * t14;
+    t13 = C47 * t10;
+    t7 = t11 + t13;
+    t17 = X[36];
+    t3 = X[283];
+    t4 = C49 * t17;
+    t18 = C50 * t3;
+    t5 = t4 + t18;
+    t8 = (-C50) * t17;
+    t1 = C49 * t3;
+    t12 = t8 + t1;
+    t6 = X[76];
+    t0 = X[243];
+    t16 = C51 * t6;
+    t19 = C52 * t0;
+    t14 = t16 + t19;
+    t10 = (-C52) * t6;
+    t11 = C51 * t0;
+    t13 = t10 + t11;
+    t4 = X[116];
+    t18 = X[203];
+    t17 = C53 * t4;
+    t3 = C54 * t18;
+    t8 = t17 + t3;
+    t1 = (-C54) * t4;
+    t16 = C53 * t18;
+    t19 = t1 + t16;
+    t6 = X[156];
+    t0 = X[163];
+    t10 = C55 * t6;
+    t11 = C56 * t0;
+    t17 = t10 + t11;
+    t3 = (-C56) * t6;
+    t4 = C55 * t0;
+    t18 = t3 + t4;
+    t1 = X[196];
+    t16 = X[123];
+    t10 = C57 * t1;
+    t11 = C58 * t16;
+    t6 = t10 + t11;
+    t0 = (-C58) * t1;
+    t3 = C57 * t16;
+    t4 = t0 + t3;
+    t10 = X[236];
+    t11 = X[83];
+    t1 = C59 * t10;
+    t16 = C60 * t11;
+    t0 = t1 + t16;
+    t3 = (-C60) * t10;
+    t1 = C59 * t11;
+    t16 = t3 + t1;
+    t10 = t2 + t8;
+    t11 = t15 + t19;
+    t3 = t5 + t6;
+    t1 = t12 + t4;
+    t2 = t2 - t8;
+    t8 = t15 - t19;
+    t15 = t5 - t6;
+    t19 = t12 - t4;
+    t5 = t10 + t3;
+    t6 = t11 + t1;
+    t12 = t2 + t19;
+    t4 = t8 - t15;
+    t10 = t10 - t3;
+    t3 = t11 - t1;
+    t11 = t2 - t19;
+    t1 = t8 + t15;
+    t2 = t9 + t17;
+    t19 = t7 + t18;
+    t8 = t14 + t0;
+    t15 = t13 + t16;
+    t9 = t9 - t17;
+    t17 = t7 - t18;
+    t7 = t14 - t0;
+    t18 = t13 - t16;
+    t14 = t2 + t8;
+    t0 = t19 + t15;
+    t13 = t9 + t18;
+    t16 = t17 - t7;
+    t2 = t2 - t8;
+    t8 = t19 - t15;
+    t19 = t9 - t18;
+    t15 = t17 + t7;
+    t9 = t13 + t16;
+    t18 = t13 - t16;
+    t17 = C16 * t9;
+    t7 = (-C16) * t18;
+    t13 = t19 - t15;
+    t16 = t19 + t15;
+    t9 = (-C16) * t13;
+    t18 = (-C16) * t16;
+    t19 = t5 - t14;
+    t15 = t6 - t0;
+    t13 = t5 + t14;
+    t16 = t6 + t0;
+    t5 = t12 - t17;
+    t14 = t4 - t7;
+    t6 = t12 + t17;
+    t0 = t4 + t7;
+    t12 = t10 - t8;
+    t17 = t3 + t2;
+    t4 = t10 + t8;
+    t7 = t3 - t2;
+    t10 = t11 - t9;
+    t8 = t1 - t18;
+    t3 = t11 + t9;
+    t2 = t1 + t18;
+    t11 = t6 + t0;
+    t9 = C36 * t11;
+    t1 = t6 * (-C37);
+    t18 = t0 * C38;
+    t11 = t9 - t18;
+    t6 = t9 + t1;
+    t0 = t4 + t7;
+    t18 = t4 - t7;
+    t9 = C16 * t0;
+    t1 = (-C16) * t18;
+    t4 = t3 + t2;
+    t7 = C43 * t4;
+    t0 = t3 * (-C37);
+    t18 = t2 * (-C38);
+    t4 = t7 - t18;
+    t3 = t7 + t0;
+    t2 = -t19;
+    t18 = t5 + t14;
+    t7 = (-C43) * t18;
+    t0 = t5 * (-C38);
+    t19 = t14 * (-C37);
+    t18 = t7 - t19;
+    t5 = t7 + t0;
+    t14 = t12 - t17;
+    t19 = t12 + t17;
+    t7 = (-C16) * t14;
+    t0 = (-C16) * t19;
+    t12 = t10 + t8;
+    t17 = (-C36) * t12;
+    t14 = t10 * C38;
+    t19 = t8 * (-C37);
+    t12 = t17 - t19;
+    t10 = t17 + t14;
+    re[138] = t13;
+    im[138] = t16;
+    re[158] = t11;
+    im[158] = t6;
+    re[18] = t9;
+    im[18] = t1;
+    re[38] = t4;
+    im[38] = t3;
+    re[58] = t15;
+    im[58] = t2;
+    re[78] = t18;
+    im[78] = t5;
+    re[98] = t7;
+    im[98] = t0;
+    re[118] = t12;
+    im[118] = t10;
+    t8 = X[286];
+    t19 = X[33];
+    t17 = C61 * t8;
+    t14 = C62 * t19;
+    t13 = t17 + t14;
+    t16 = (-C62) * t8;
+    t11 = C61 * t19;
+    t6 = t16 + t11;
+    t9 = X[6];
+    t1 = X[313];
+    t4 = C63 * t9;
+    t3 = C64 * t1;
+    t15 = t4 + t3;
+    t2 = (-C64) * t9;
+    t18 = C63 * t1;
+    t5 = t2 + t18;
+    t7 = X[46];
+    t0 = X[273];
+    t12 = C65 * t7;
+    t10 = C66 * t0;
+    t17 = t12 + t10;
+    t14 = (-C66) * t7;
+    t8 = C65 * t0;
+    t19 = t14 + t8;
+    t16 = X[86];
+    t11 = X[233];
+    t4 = C67 * t16;
+    t3 = C68 * t11;
+    t9 = t4 + t3;
+    t1 = (-C68) * t16;
+    t2 = C67 * t11;
+    t18 = t1 + t2;
+    t12 = X[126];
+    t10 = X[193];
+    t7 = C69 * t12;
+    t0 = C70 * t10;
+    t14 = t7 + t0;
+    t8 = (-C70) * t12;
+    t4 = C69 * t10;
+    t3 = t8 + t4;
+    t16 = X[166];
+    t11 = X[153];
+    t1 = C71 * t16;
+    t2 = C72 * t11;
+    t7 = t1 + t2;
+    t0 = (-C72) * t16;
+    t12 = C71 * t11;
+    t10 = t0 + t12;
+    t8 = X[206];
+    t4 = X[113];
+    t1 = C73 * t8;
+    t2 = C74 * t4;
+    t16 = t1 + t2;
+    t11 = (-C74) * t8;
+    t0 = C73 * t4;
+    t12 = t11 + t0;
+    t1 = X[246];
+    t2 = X[73];
+    t8 = C75 * t1;
+    t4 = C76 * t2;
+    t11 = t8 + t4;
+    t0 = (-C76) * t1;
+    t8 = C75 * t2;
+    t4 = t0 + t8;
+    t1 = t13 + t14;
+    t2 = t6 + t3;
+    t0 = t17 + t16;
+    t8 = t19 + t12;
+    t13 = t13 - t14;
+    t14 = t6 - t3;
+    t6 = t17 - t16;
+    t3 = t19 - t12;
+    t17 = t1 + t0;
+    t16 = t2 + t8;
+    t19 = t13 + t3;
+    t12 = t14 - t6;
+    t1 = t1 - t0;
+    t0 = t2 - t8;
+    t2 = t13 - t3;
+    t8 = t14 + t6;
+    t13 = t15 + t7;
+    t3 = t5 + t10;
+    t14 = t9 + t11;
+    t6 = t18 + t4;
+    t15 = t15 - t7;
+    t7 = t5 - t10;
+    t5 = t9 - t11;
+    t10 = t18 - t4;
+    t9 = t13 + t14;
+    t11 = t3 + t6;
+    t18 = t15 + t10;
+    t4 = t7 - t5;
+    t13 = t13 - t14;
+    t14 = t3 - t6;
+    t3 = t15 - t10;
+    t6 = t7 + t5;
+    t15 = t18 + t4;
+    t10 = t18 - t4;
+    t7 = C16 * t15;
+    t5 = (-C16) * t10;
+    t18 = t3 - t6;
+    t4 = t3 + t6;
+    t15 = (-C16) * t18;
+    t10 = (-C16) * t4;
+    t3 = t17 - t9;
+    t6 = t16 - t11;
+    t18 = t17 + t9;
+    t4 = t16 + t11;
+    t17 = t19 - t7;
+    t9 = t12 - t5;
+    t16 = t19 + t7;
+    t11 = t12 + t5;
+    t19 = t1 - t14;
+    t7 = t0 + t13;
+    t12 = t1 + t14;
+    t5 = t0 - t13;
+    t1 = t2 - t15;
+    t14 = t8 - t10;
+    t0 = t2 + t15;
+    t13 = t8 + t10;
+    t2 = t16 + t11;
+    t15 = C39 * t2;
+    t8 = t16 * (-C40);
+    t10 = t11 * C41;
+    t2 = t15 - t10;
+    t16 = t15 + t8;
+    t11 = t12 + t5;
+    t10 = C43 * t11;
+    t15 = t12 * (-C37);
+    t8 = t5 * (-C38);
+    t11 = t10 - t8;
+    t12 = t10 + t15;
+    t5 = t0 + t13;
+    t8 = (-C44) * t5;
+    t10 = t0 * (-C35);
+    t15 = t13 * (-C34);
+    t5 = t8 - t15;
+    t0 = t8 + t10;
+    t13 = t3 - t6;
+    t15 = t3 + t6;
+    t8 = (-C16) * t13;
+    t10 = (-C16) * t15;
+    t3 = t17 + t9;
+    t6 = (-C33) * t3;
+    t13 = t17 * C35;
+    t15 = t9 * (-C34);
+    t3 = t6 - t15;
+    t17 = t6 + t13;
+    t9 = t19 + t7;
+    t15 = (-C36) * t9;
+    t6 = t19 * C37;
+    t13 = t7 * (-C38);
+    t9 = t15 - t13;
+    t19 = t15 + t6;
+    t7 = t1 + t14;
+    t13 = (-C42) * t7;
+    t15 = t1 * C40;
+    t6 = t14 * C41;
+    t7 = t13 - t6;
+    t1 = t13 + t15;
+    re[143] = t18;
+    im[143] = t4;
+    re[3] = t2;
+    im[3] = t16;
+    re[23] = t11;
+    im[23] = t12;
+    re[43] = t5;
+    im[43] = t0;
+    re[63] = t8;
+    im[63] = t10;
+    re[83] = t3;
+    im[83] = t17;
+    re[103] = t9;
+    im[103] = t19;
+    re[123] = t7;
+    im[123] = t1;
+    t14 = re[128];
+    t6 = im[128];
+    t13 = re[133];
+    t15 = im[133];
+    t18 = re[138];
+    t4 = im[138];
+    t2 = re[143];
+    t16 = im[143];
+    t11 = t14 + t18;
+    t12 = t6 + t4;
+    t5 = t13 + t2;
+    t0 = t15 + t16;
+    t8 = t14 - t18;
+    t10 = t6 - t4;
+    t3 = t13 - t2;
+    t17 = t15 - t16;
+    t9 = t11 + t5;
+    t19 = t12 + t0;
+    t7 = t8 + t17;
+    t1 = t10 - t3;
+    t14 = t11 - t5;
+    t18 = t12 - t0;
+    t6 = t8 - t17;
+    t4 = t10 + t3;
+    re[128] = t9;
+    im[128] = t19;
+    re[133] = t7;
+    im[133] = t1;
+    re[138] = t14;
+    im[138] = t18;
+    re[143] = t6;
+    im[143] = t4;
+    t13 = re[148];
+    t2 = im[148];
+    t15 = re[153];
+    t16 = im[153];
+    t11 = re[158];
+    t5 = im[158];
+    t12 = re[3];
+    t0 = im[3];
+    t8 = t13 + t11;
+    t17 = t2 + t5;
+    t10 = t15 + t12;
+    t3 = t16 + t0;
+    t9 = t13 - t11;
+    t19 = t2 - t5;
+    t7 = t15 - t12;
+    t1 = t16 - t0;
+    t14 = t8 + t10;
+    t18 = t17 + t3;
+    t6 = t9 + t1;
+    t4 = t19 - t7;
+    t13 = t8 - t10;
+    t11 = t17 - t3;
+    t2 = t9 - t1;
+    t5 = t19 + t7;
+    re[148] = t14;
+    im[148] = t18;
+    re[153] = t6;
+    im[153] = t4;
+    re[158] = t13;
+    im[158] = t11;
+    re[3] = t2;
+    im[3] = t5;
+    t15 = re[8];
+    t12 = im[8];
+    t16 = re[13];
+    t0 = im[13];
+    t8 = re[18];
+    t10 = im[18];
+    t17 = re[23];
+    t3 = im[23];
+    t9 = t15 + t8;
+    t1 = t12 + t10;
+    t19 = t16 + t17;
+    t7 = t0 + t3;
+    t14 = t15 - t8;
+    t18 = t12 - t10;
+    t6 = t16 - t17;
+    t4 = t0 - t3;
+    t13 = t9 + t19;
+    t11 = t1 + t7;
+    t2 = t14 + t4;
+    t5 = t18 - t6;
+    t15 = t9 - t19;
+    t8 = t1 - t7;
+    t12 = t14 - t4;
+    t10 = t18 + t6;
+    re[8] = t13;
+    im[8] = t11;
+    re[13] = t2;
+    im[13] = t5;
+    re[18] = t15;
+    im[18] = t8;
+    re[23] = t12;
+    im[23] = t10;
+    t16 = re[28];
+    t17 = im[28];
+    t0 = re[33];
+    t3 = im[33];
+    t9 = re[38];
+    t19 = im[38];
+    t1 = re[43];
+    t7 = im[43];
+    t14 = t16 + t9;
+    t4 = t17 + t19;
+    t18 = t0 + t1;
+    t6 = t3 + t7;
+    t13 = t16 - t9;
+    t11 = t17 - t19;
+    t2 = t0 - t1;
+    t5 = t3 - t7;
+    t15 = t14 + t18;
+    t8 = t4 + t6;
+    t12 = t13 + t5;
+    t10 = t11 - t2;
+    t16 = t14 - t18;
+    t9 = t4 - t6;
+    t17 = t13 - t5;
+    t19 = t11 + t2;
+    re[28] = t15;
+    im[28] = t8;
+    re[33] = t12;
+    im[33] = t10;
+    re[38] = t16;
+    im[38] = t9;
+    re[43] = t17;
+    im[43] = t19;
+    t0 = re[48];
+    t1 = im[48];
+    t3 = re[53];
+    t7 = im[53];
+    t14 = re[58];
+    t18 = im[58];
+    t4 = re[63];
+    t6 = im[63];
+    t13 = t0 + t14;
+    t5 = t1 + t18;
+    t11 = t3 + t4;
+    t2 = t7 + t6;
+    t15 = t0 - t14;
+    t8 = t1 - t18;
+    t12 = t3 - t4;
+    t10 = t7 - t6;
+    t16 = t13 + t11;
+    t9 = t5 + t2;
+    t17 = t15 + t10;
+    t19 = t8 - t12;
+    t0 = t13 - t11;
+    t14 = t5 - t2;
+    t1 = t15 - t10;
+    t18 = t8 + t12;
+    re[48] = t16;
+    im[48] = t9;
+    re[53] = t17;
+    im[53] = t19;
+    re[58] = t0;
+    im[58] = t14;
+    re[63] = t1;
+    im[63] = t18;
+    t3 = re[68];
+    t4 = im[68];
+    t7 = re[73];
+    t6 = im[73];
+    t13 = re[78];
+    t11 = im[78];
+    t5 = re[83];
+    t2 = im[83];
+    t15 = t3 + t13;
+    t10 = t4 + t11;
+    t8 = t7 + t5;
+    t12 = t6 + t2;
+    t16 = t3 - t13;
+    t9 = t4 - t11;
+    t17 = t7 - t5;
+    t19 = t6 - t2;
+    t0 = t15 + t8;
+    t14 = t10 + t12;
+    t1 = t16 + t19;
+    t18 = t9 - t17;
+    t3 = t15 - t8;
+    t13 = t10 - t12;
+    t4 = t16 - t19;
+    t11 = t9 + t17;
+    re[68] = t0;
+    im[68] = t14;
+    re[73] = t1;
+    im[73] = t18;
+    re[78] = t3;
+    im[78] = t13;
+    re[83] = t4;
+    im[83] = t11;
+    t7 = re[88];
+    t5 = im[88];
+    t6 = re[93];
+    t2 = im[93];
+    t15 = re[98];
+    t8 = im[98];
+    t10 = re[103];
+    t12 = im[103];
+    t16 = t7 + t15;
+    t19 = t5 + t8;
+    t9 = t6 + t10;
+    t17 = t2 + t12;
+    t0 = t7 - t15;
+    t14 = t5 - t8;
+    t1 = t6 - t10;
+    t18 = t2 - t12;
+    t3 = t16 + t9;
+    t13 = t19 + t17;
+    t4 = t0 + t18;
+    t11 = t14 - t1;
+    t7 = t16 - t9;
+    t15 = t19 - t17;
+    t5 = t0 - t18;
+    t8 = t14 + t1;
+    re[88] = t3;
+    im[88] = t13;
+    re[93] = t4;
+    im[93] = t11;
+    re[98] = t7;
+    im[98] = t15;
+    re[103] = t5;
+    im[103] = t8;
+    t6 = re[108];
+    t10 = im[108];
+    t2 = re[113];
+    t12 = im[113];
+    t16 = re[118];
+    t9 = im[118];
+    t19 = re[123];
+    t17 = im[123];
+    t0 = t6 + t16;
+    t18 = t10 + t9;
+    t14 = t2 + t19;
+    t1 = t12 + t17;
+    t3 = t6 - t16;
+    t13 = t10 - t9;
+    t4 = t2 - t19;
+    t11 = t12 - t17;
+    t7 = t0 + t14;
+    t15 = t18 + t1;
+    t5 = t3 + t11;
+    t8 = t13 - t4;
+    t6 = t0 - t14;
+    t16 = t18 - t1;
+    t10 = t3 - t11;
+    t9 = t13 + t4;
+    re[108] = t7;
+    im[108] = t15;
+    re[113] = t5;
+    im[113] = t8;
+    re[118] = t6;
+    im[118] = t16;
+    re[123] = t10;
+    im[123] = t9;
+    t2 = re[0];
+    t19 = im[0];
+    t12 = re[32];
+    t17 = im[32];
+    t0 = re[64];
+    t14 = im[64];
+    t18 = re[96];
+    t1 = im[96];
+    t3 = re[128];
+    t11 = im[128];
+    t13 = t12 + t3;
+    t4 = t17 + t11;
+    t7 = t0 + t18;
+    t15 = t14 + t1;
+    t5 = t12 - t3;
+    t8 = t17 - t11;
+    t6 = t0 - t18;
+    t16 = t14 - t1;
+    t10 = t13 + t7;
+    t9 = t4 + t15;
+    t12 = t13 - t7;
+    t3 = C77 * t12;
+    t17 = t4 - t15;
+    t11 = C77 * t17;
+    t0 = C78 * t10;
+    t18 = t2 - t0;
+    t14 = C78 * t9;
+    t1 = t19 - t14;
+    t13 = t18 + t3;
+    t7 = t1 + t11;
+    t12 = t18 - t3;
+    t4 = t1 - t11;
+    t15 = C1 * t5;
+    t17 = C79 * t6;
+    t0 = t15 + t17;
+    t14 = C1 * t8;
+    t18 = C79 * t16;
+    t3 = t14 + t18;
+    t1 = C79 * t5;
+    t11 = C1 * t6;
+    t15 = t1 - t11;
+    t17 = C79 * t8;
+    t14 = C1 * t16;
+    t18 = t17 - t14;
+    t5 = t2 + t10;
+    t6 = t19 + t9;
+    t1 = t13 + t3;
+    t11 = t7 - t0;
+    t8 = t12 + t18;
+    t16 = t4 - t15;
+    t17 = t12 - t18;
+    t14 = t4 + t15;
+    t2 = t13 - t3;
+    t10 = t7 + t0;
+    t19 = (-C80) * t5;
+    t9 = (-C81) * t6;
+    t12 = t19 + t9;
+    t18 = 0.0696597151132507 * t12;
+    y[479] = t18;
+    t4 = 0.06866149903828855 * t12;
+    y[480] = t4;
+    t15 = C81 * t5;
+    t13 = (-C80) * t6;
+    t3 = t15 + t13;
+    t7 = 0.04437999374521572 * t3;
+    y[159] = t7;
+    t0 = (-0.045977838079537765) * t3;
+    y[160] = t0;
+    t19 = C82 * t1;
+    t9 = C83 * t11;
+    t18 = t19 + t9;
+    y[32] = 0;
+    t12 = (-0.07982159176456675) * t18;
+    y[287] = t12;
+    t4 = (-C83) * t1;
+    t5 = C82 * t11;
+    t6 = t4 + t5;
+    t15 = 0.07829961620452687 * t6;
+    y[352] = t15;
+    t13 = (-0.003434751278859086) * t6;
+    y[607] = t13;
+    t7 = (-C84) * t8;
+    t3 = (-C85) * t16;
+    t0 = t7 + t3;
+    t19 = 0.07823601689077271 * t0;
+    y[415] = t19;
+    t9 = (-0.002505779022165046) * t0;
+    y[544] = t9;
+    t18 = C85 * t8;
+    t12 = (-C84) * t16;
+    t1 = t18 + t12;
+    y[95] = 0;
+    t11 = (-0.07988648001758296) * t1;
+    y[224] = t11;
+    t4 = C86 * t17;
+    t5 = C87 * t14;
+    t15 = t4 + t5;
+    y[96] = 0;
+    t6 = (-0.079857500076909) * t15;
+    y[223] = t6;
+    t13 = (-C87) * t17;
+    t7 = C86 * t14;
+    t3 = t13 + t7;
+    t19 = 0.07826440840222601 * t3;
+    y[416] = t19;
+    t0 = (-0.0020066073440204468) * t3;
+    y[543] = t0;
+    t9 = (-C88) * t2;
+    t8 = (-C89) * t10;
+    t16 = t9 + t8;
+    t18 = 0.07830557878019587 * t16;
+    y[351] = t18;
+    t12 = (-0.003234809269272303) * t16;
+    y[608] = t12;
+    t1 = C89 * t2;
+    t11 = (-C88) * t10;
+    t4 = t1 + t11;
+    y[31] = 0;
+    t5 = (-0.07981551375213997) * t4;
+    y[288] = t5;
+    t15 = re[20];
+    t6 = im[20];
+    t17 = re[52];
+    t14 = im[52];
+    t13 = re[84];
+    t7 = im[84];
+    t19 = re[116];
+    t3 = im[116];
+    t0 = re[148];
+    t9 = im[148];
+    t8 = t17 + t0;
+    t18 = t14 + t9;
+    t16 = t13 + t19;
+    t12 = t7 + t3;
+    t2 = t17 - t0;
+    t10 = t14 - t9;
+    t1 = t13 - t19;
+    t11 = t7 - t3;
+    t4 = t8 + t16;
+    t5 = t18 + t12;
+    t17 = t8 - t16;
+    t0 = C77 * t17;
+    t14 = t18 - t12;
+    t9 = C77 * t14;
+    t13 = C78 * t4;
+    t19 = t15 - t13;
+    t7 = C78 * t5;
+    t3 = t6 - t7;
+    t8 = t19 + t0;
+    t16 = t3 + t9;
+    t17 = t19 - t0;
+    t18 = t3 - t9;
+    t12 = C1 * t2;
+    t14 = C79 * t1;
+    t13 = t12 + t14;
+    t7 = C1 * t10;
+    t19 = C79 * t11;
+    t0 = t7 + t19;
+    t3 = C79 * t2;
+    t9 = C1 * t1;
+    t12 = t3 - t9;
+    t14 = C79 * t10;
+    t7 = C1 * t11;
+    t19 = t14 - t7;
+    t2 = t15 + t4;
+    t1 = t6 + t5;
+    t3 = t8 + t0;
+    t9 = t16 - t13;
+    t10 = t17 + t19;
+    t11 = t18 - t12;
+    t14 = t17 - t19;
+    t7 = t18 + t12;
+    t15 = t8 - t0;
+    t4 = t16 + t13;
+    t6 = (-C90) * t2;
+    t5 = (-C91) * t1;
+    t17 = t6 + t5;
+    t19 = 0.07832023018246469 * t17;
+    y[349] = t19;
+    t18 = (-0.0028466989314485424) * t17;
+    y[610] = t18;
+    t12 = C91 * t2;
+    t8 = (-C90) * t1;
+    t0 = t12 + t8;
+    y[29] = 0;
+    t16 = (-0.07980058262647095) * t0;
+    y[290] = t16;
+    t13 = (-C92) * t3;
+    t6 = (-C93) * t9;
+    t5 = t13 + t6;
+    t19 = 0.07153664074123962 * t5;
+    y[477] = t19;
+    t17 = 0.06655154500769807 * t5;
+    y[482] = t17;
+    t18 = C93 * t3;
+    t2 = (-C92) * t9;
+    t1 = t18 + t2;
+    t12 = 0.04113124616241223 * t1;
+    y[157] = t12;
+    t8 = (-0.049102837139157966) * t1;
+    y[162] = t8;
+    t0 = C94 * t10;
+    t16 = C95 * t11;
+    t13 = t0 + t16;
+    y[34] = 0;
+    t6 = (-0.07983143667137488) * t13;
+    y[285] = t6;
+    t19 = (-C95) * t10;
+    t5 = C94 * t11;
+    t17 = t19 + t5;
+    t3 = 0.07828996020362315 * t17;
+    y[354] = t3;
+    t9 = (-0.0038442216590680264) * t17;
+    y[605] = t9;
+    t18 = (-C96) * t14;
+    t2 = (-C97) * t7;
+    t12 = t18 + t2;
+    t1 = 0.07818674997851927 * t12;
+    y[413] = t1;
+    t8 = (-0.003436879663473097) * t12;
+    y[546] = t8;
+    t0 = C97 * t14;
+    t16 = (-C96) * t7;
+    t13 = t0 + t16;
+    y[93] = 0;
+    t6 = (-0.07993681796106246) * t13;
+    y[226] = t6;
+    t10 = C98 * t15;
+    t11 = C99 * t4;
+    t19 = t10 + t11;
+    y[98] = 0;
+    t5 = (-0.07979138531197891) * t19;
+    y[221] = t5;
+    t3 = (-C99) * t15;
+    t17 = C98 * t4;
+    t9 = t3 + t17;
+    t18 = 0.0783292579213022 * t9;
+    y[418] = t18;
+    t2 = (-0.0009387706476628306) * t9;
+    y[541] = t2;
+    t1 = re[40];
+    t12 = im[40];
+    t8 = re[72];
+    t14 = im[72];
+    t7 = re[104];
+    t0 = im[104];
+    t16 = re[136];
+    t13 = im[136];
+    t6 = re[8];
+    t10 = im[8];
+    t11 = t8 + t6;
+    t19 = t14 + t10;
+    t5 = t7 + t16;
+    t15 = t0 + t13;
+    t4 = t8 - t6;
+    t3 = t14 - t10;
+    t17 = t7 - t16;
+    t18 = t0 - t13;
+    t9 = t11 + t5;
+    t2 = t19 + t15;
+    t8 = t11 - t5;
+    t6 = C77 * t8;
+    t14 = t19 - t15;
+    t10 = C77 * t14;
+    t7 = C78 * t9;
+    t16 = t1 - t7;
+    t0 = C78 * t2;
+    t13 = t12 - t0;
+    t11 = t16 + t6;
+    t5 = t13 + t10;
+    t8 = t16 - t6;
+    t19 = t13 - t10;
+    t15 = C1 * t4;
+    t14 = C79 * t17;
+    t7 = t15 + t14;
+    t0 = C1 * t3;
+    t16 = C79 * t18;
+    t6 = t0 + t16;
+    t13 = C79 * t4;
+    t10 = C1 * t17;
+    t15 = t13 - t10;
+    t14 = C79 * t3;
+    t0 = C1 * t18;
+    t16 = t14 - t0;
+    t4 = t1 + t9;
+    t17 = t12 + t2;
+    t13 = t11 + t6;
+    t10 = t5 - t7;
+    t3 = t8 + t16;
+    t18 = t19 - t15;
+    t14 = t8 - t16;
+    t0 = t19 + t15;
+    t1 = t11 - t6;
+    t9 = t5 + t7;
+    t12 = C100 * t4;
+    t2 = C101 * t17;
+    t8 = t12 + t2;
+    y[100] = 0;
+    t16 = (-0.07971351158182624) * t8;
+    y[219] = t16;
+    t19 = (-C101) * t4;
+    t15 = C100 * t17;
+    t11 = t19 + t15;
+    t6 = 0.07840577934625735 * t11;
+    y[420] = t6;
+    t5 = 0.0002248455903077584 * t11;
+    y[539] = t5;
+    t7 = (-C102) * t13;
+    t12 = (-C103) * t10;
+    t2 = t7 + t12;
+    t8 = 0.07833883145205656 * t2;
+    y[347] = t8;
+    t16 = (-0.002477252921970635) * t2;
+    y[612] = t16;
+    t4 = C103 * t13;
+    t17 = (-C102) * t10;
+    t19 = t4 + t17;
+    y[27] = 0;
+    t15 = (-0.07978163426939815) * t19;
+    y[292] = t15;
+    t6 = (-C104) * t3;
+    t11 = (-C105) * t18;
+    t5 = t6 + t11;
+    t7 = 0.07324795839525254 * t5;
+    y[475] = t7;
+    t12 = 0.06429934544866318 * t5;
+    y[484] = t12;
+    t8 = C105 * t3;
+    t2 = (-C104) * t18;
+    t16 = t8 + t2;
+    t13 = 0.03783486692384754 * t16;
+    y[155] = t13;
+    t10 = (-0.05211398249574624) * t16;
+    y[164] = t10;
+    t4 = C106 * t14;
+    t17 = C107 * t0;
+    t19 = t4 + t17;
+    y[36] = 0;
+    t15 = (-0.07983866315346692) * t19;
+    y[283] = t15;
+    t6 = (-C107) * t14;
+    t11 = C106 * t0;
+    t7 = t6 + t11;
+    t5 = 0.07828287390015748 * t7;
+    y[356] = t5;
+    t12 = (-0.004263260008349076) * t7;
+    y[603] = t12;
+    t3 = (-C108) * t1;
+    t18 = (-C109) * t9;
+    t8 = t3 + t18;
+    t2 = 0.07814674882599187 * t8;
+    y[411] = t2;
+    t13 = (-0.00428118345726987) * t8;
+    y[548] = t13;
+    t16 = C109 * t1;
+    t10 = (-C108) * t9;
+    t4 = t16 + t10;
+    y[91] = 0;
+    t17 = (-0.07997773540031433) * t4;
+    y[228] = t17;
+    t19 = re[60];
+    t15 = im[60];
+    t14 = re[92];
+    t0 = im[92];
+    t6 = re[124];
+    t11 = im[124];
+    t5 = re[156];
+    t7 = im[156];
+    t12 = re[28];
+    t3 = im[28];
+    t18 = t14 + t12;
+    t2 = t0 + t3;
+    t8 = t6 + t5;
+    t13 = t11 + t7;
+    t1 = t14 - t12;
+    t9 = t0 - t3;
+    t16 = t6 - t5;
+    t10 = t11 - t7;
+    t4 = t18 + t8;
+    t17 = t2 + t13;
+    t14 = t18 - t8;
+    t12 = C77 * t14;
+    t0 = t2 - t13;
+    t3 = C77 * t0;
+    t6 = C78 * t4;
+    t5 = t19 - t6;
+    t11 = C78 * t17;
+    t7 = t15 - t11;
+    t18 = t5 + t12;
+    t8 = t7 + t3;
+    t14 = t5 - t12;
+    t2 = t7 - t3;
+    t13 = C1 * t1;
+    t0 = C79 * t16;
+    t6 = t13 + t0;
+    t11 = C1 * t9;
+    t5 = C79 * t10;
+    t12 = t11 + t5;
+    t7 = C79 * t1;
+    t3 = C1 * t16;
+    t13 = t7 - t3;
+    t0 = C79 * t9;
+    t11 = C1 * t10;
+    t5 = t0 - t11;
+    t1 = t19 + t4;
+    t16 = t15 + t17;
+    t7 = t18 + t12;
+    t3 = t8 - t6;
+    t9 = t14 + t5;
+    t10 = t2 - t13;
+    t0 = t14 - t5;
+    t11 = t2 + t13;
+    t19 = t18 - t12;
+    t4 = t8 + t6;
+    t15 = (-C110) * t1;
+    t17 = (-C111) * t16;
+    t14 = t15 + t17;
+    t5 = 0.07811531141943964 * t14;
+    y[409] = t5;
+    t2 = (-0.0050419445369264924) * t14;
+    y[550] = t2;
+    t13 = C111 * t1;
+    t18 = (-C110) * t16;
+    t12 = t13 + t18;
+    y[89] = 0;
+    t8 = (-0.08000992233700084) * t12;
+    y[230] = t8;
+    t6 = C112 * t7;
+    t15 = C113 * t3;
+    t17 = t6 + t15;
+    y[102] = 0;
+    t5 = (-0.07962281744295999) * t17;
+    y[217] = t5;
+    t14 = (-C113) * t7;
+    t2 = C112 * t3;
+    t1 = t14 + t2;
+    t16 = 0.07849508722141564 * t1;
+    y[422] = t16;
+    t13 = 0.0014873424733383262 * t1;
+    y[537] = t13;
+    t18 = (-C114) * t9;
+    t12 = (-C115) * t10;
+    t8 = t18 + t12;
+    t6 = 0.07836190935367703 * t8;
+    y[345] = t6;
+    t15 = (-0.0021295937563124336) * t8;
+    y[614] = t15;
+    t17 = C115 * t9;
+    t5 = (-C114) * t10;
+    t7 = t17 + t5;
+    y[25] = 0;
+    t3 = (-0.07975813825300476) * t7;
+    y[294] = t3;
+    t14 = (-C116) * t0;
+    t2 = (-C117) * t11;
+    t16 = t14 + t2;
+    t1 = 0.07478768505676862 * t16;
+    y[473] = t1;
+    t13 = 0.06191719555714078 * t16;
+    y[486] = t13;
+    t18 = C117 * t0;
+    t12 = (-C116) * t11;
+    t6 = t18 + t12;
+    t8 = 0.034520136097357317 * t6;
+    y[153] = t8;
+    t15 = (-0.05499047041607303) * t6;
+    y[166] = t15;
+    t9 = C118 * t19;
+    t10 = C119 * t4;
+    t17 = t9 + t10;
+    y[38] = 0;
+    t5 = (-0.07984398377528498) * t17;
+    y[281] = t5;
+    t7 = (-C119) * t19;
+    t3 = C118 * t4;
+    t14 = t7 + t3;
+    t2 = 0.07827765730715747 * t14;
+    y[358] = t2;
+    t1 = (-0.004687378358449063) * t14;
+    y[601] = t1;
+    t16 = re[80];
+    t13 = im[80];
+    t0 = re[112];
+    t11 = im[112];
+    t18 = re[144];
+    t12 = im[144];
+    t8 = re[16];
+    t6 = im[16];
+    t15 = re[48];
+    t9 = im[48];
+    t10 = t0 + t15;
+    t17 = t11 + t9;
+    t5 = t18 + t8;
+    t19 = t12 + t6;
+    t4 = t0 - t15;
+    t7 = t11 - t9;
+    t3 = t18 - t8;
+    t2 = t12 - t6;
+    t14 = t10 + t5;
+    t1 = t17 + t19;
+    t0 = t10 - t5;
+    t15 = C77 * t0;
+    t11 = t17 - t19;
+    t9 = C77 * t11;
+    t18 = C78 * t14;
+    t8 = t16 - t18;
+    t12 = C78 * t1;
+    t6 = t13 - t12;
+    t10 = t8 + t15;
+    t5 = t6 + t9;
+    t0 = t8 - t15;
+    t17 = t6 - t9;
+    t19 = C1 * t4;
+    t11 = C79 * t3;
+    t18 = t19 + t11;
+    t12 = C1 * t7;
+    t8 = C79 * t2;
+    t15 = t12 + t8;
+    t6 = C79 * t4;
+    t9 = C1 * t3;
+    t19 = t6 - t9;
+    t11 = C79 * t7;
+    t12 = C1 * t2;
+    t8 = t11 - t12;
+    t4 = t16 + t14;
+    t3 = t13 + t1;
+    t6 = t10 + t15;
+    t9 = t5 - t18;
+    t7 = t0 + t8;
+    t2 = t17 - t19;
+    t11 = t0 - t8;
+    t12 = t17 + t19;
+    t16 = t10 - t15;
+    t14 = t5 + t18;
+    t13 = C120 * t4;
+    t1 = C121 * t3;
+    t0 = t13 + t1;
+    y[40] = 0;
+    t8 = (-0.07984800883388636) * t0;
+    y[279] = t8;
+    t17 = (-C121) * t4;
+    t19 = C120 * t3;
+    t10 = t17 + t19;
+    t15 = 0.07827371140841262 * t10;
+    y[360] = t15;
+    t5 = (-0.005112632604600919) * t10;
+    y[599] = t5;
+    t18 = (-C122) * t6;
+    t13 = (-C123) * t9;
+    t1 = t18 + t13;
+    t0 = 0.07809164250216843 * t1;
+    y[407] = t0;
+    t8 = (-0.005722778753227274) * t1;
+    y[552] = t8;
+    t4 = C123 * t6;
+    t3 = (-C122) * t9;
+    t17 = t4 + t3;
+    y[87] = 0;
+    t19 = (-0.08003417266868801) * t17;
+    y[232] = t19;
+    t15 = C124 * t7;
+    t10 = C125 * t2;
+    t5 = t15 + t10;
+    y[104] = 0;
+    t18 = (-0.07951795443212767) * t5;
+    y[215] = t18;
+    t13 = (-C125) * t7;
+    t0 = C124 * t2;
+    t1 = t13 + t0;
+    t8 = 0.0785986013427278 * t1;
+    y[424] = t8;
+    t6 = 0.0028522246127330657 * t1;
+    y[535] = t6;
+    t9 = (-C126) * t11;
+    t4 = (-C127) * t12;
+    t3 = t9 + t4;
+    t17 = 0.07838974698390234 * t3;
+    y[343] = t17;
+    t19 = (-0.0018062019202143727) * t3;
+    y[616] = t19;
+    t15 = C127 * t11;
+    t10 = (-C126) * t12;
+    t5 = t15 + t10;
+    y[23] = 0;
+    t18 = (-0.07972981468205868) * t5;
+    y[296] = t18;
+    t7 = (-C128) * t16;
+    t2 = (-C129) * t14;
+    t13 = t7 + t2;
+    t0 = 0.07615284897250663 * t13;
+    y[471] = t0;
+    t8 = 0.05941921293252666 * t13;
+    y[488] = t8;
+    t1 = C129 * t16;
+    t6 = (-C128) * t14;
+    t9 = t1 + t6;
+    t4 = 0.031218452451930608 * t9;
+    y[151] = t4;
+    t17 = (-0.057713193736474815) * t9;
+    y[168] = t17;
+    t3 = re[100];
+    t19 = im[100];
+    t11 = re[132];
+    t12 = im[132];
+    t15 = re[4];
+    t10 = im[4];
+    t5 = re[36];
+    t18 = im[36];
+    t7 = re[68];
+    t2 = im[68];
+    t0 = t11 + t7;
+    t13 = t12 + t2;
+    t8 = t15 + t5;
+    t16 = t10 + t18;
+    t14 = t11 - t7;
+    t1 = t12 - t2;
+    t6 = t15 - t5;
+    t4 = t10 - t18;
+    t9 = t0 + t8;
+    t17 = t13 + t16;
+    t11 = t0 - t8;
+    t7 = C77 * t11;
+    t12 = t13 - t16;
+    t2 = C77 * t12;
+    t15 = C78 * t9;
+    t5 = t3 - t15;
+    t10 = C78 * t17;
+    t18 = t19 - t10;
+    t0 = t5 + t7;
+    t8 = t18 + t2;
+    t11 = t5 - t7;
+    t13 = t18 - t2;
+    t16 = C1 * t14;
+    t12 = C79 * t6;
+    t15 = t16 + t12;
+    t10 = C1 * t1;
+    t5 = C79 * t4;
+    t7 = t10 + t5;
+    t18 = C79 * t14;
+    t2 = C1 * t6;
+    t16 = t18 - t2;
+    t12 = C79 * t1;
+    t10 = C1 * t4;
+    t5 = t12 - t10;
+    t14 = t3 + t9;
+    t6 = t19 + t17;
+    t18 = t0 + t7;
+    t2 = t8 - t15;
+    t1 = t11 + t5;
+    t4 = t13 - t16;
+    t12 = t11 - t5;
+    t10 = t13 + t16;
+    t3 = t0 - t7;
+    t9 = t8 + t15;
+    t19 = (-C130) * t14;
+    t17 = (-C131) * t6;
+    t11 = t19 + t17;
+    t5 = 0.07734301987131527 * t11;
+    y[469] = t5;
+    t13 = 0.05682077379979854 * t11;
+    y[490] = t13;
+    t16 = C131 * t14;
+    t0 = (-C130) * t6;
+    t7 = t16 + t0;
+    t8 = 0.027961403770009628 * t7;
+    y[149] = t8;
+    t15 = (-0.06026673653310746) * t7;
+    y[170] = t15;
+    t19 = C132 * t18;
+    t17 = C133 * t2;
+    t5 = t19 + t17;
+    y[42] = 0;
+    t11 = (-0.07985148385287637) * t5;
+    y[277] = t11;
+    t13 = (-C133) * t18;
+    t14 = C132 * t2;
+    t6 = t13 + t14;
+    t16 = 0.07827030505175593 * t6;
+    y[362] = t16;
+    t0 = (-0.005534064185263188) * t6;
+    y[597] = t0;
+    t8 = (-C134) * t1;
+    t7 = (-C135) * t4;
+    t15 = t8 + t7;
+    t19 = 0.07807511355243113 * t15;
+    y[405] = t19;
+    t17 = (-0.006326642346165435) * t15;
+    y[554] = t17;
+    t5 = C135 * t1;
+    t11 = (-C134) * t4;
+    t18 = t5 + t11;
+    y[85] = 0;
+    t2 = (-0.08005111636248635) * t18;
+    y[234] = t2;
+    t13 = C136 * t12;
+    t14 = C137 * t10;
+    t16 = t13 + t14;
+    y[106] = 0;
+    t6 = (-0.07939756861843485) * t16;
+    y[213] = t6;
+    t0 = (-C137) * t12;
+    t8 = C136 * t10;
+    t7 = t0 + t8;
+    t19 = 0.07871777572983324 * t7;
+    y[426] = t19;
+    t15 = 0.004322231781754117 * t7;
+    y[533] = t15;
+    t17 = (-C138) * t3;
+    t1 = (-C139) * t9;
+    t4 = t17 + t1;
+    t5 = 0.07842264533338364 * t4;
+    y[341] = t5;
+    t11 = (-0.0015092739897649792) * t4;
+    y[618] = t11;
+    t18 = C139 * t3;
+    t2 = (-C138) * t9;
+    t13 = t18 + t2;
+    y[21] = 0;
+    t14 = (-0.07969636797420614) * t13;
+    y[298] = t14;
+    t16 = re[120];
+    t6 = im[120];
+    t12 = re[152];
+    t10 = im[152];
+    t0 = re[24];
+    t8 = im[24];
+    t19 = re[56];
+    t7 = im[56];
+    t15 = re[88];
+    t17 = im[88];
+    t1 = t12 + t15;
+    t5 = t10 + t17;
+    t4 = t0 + t19;
+    t11 = t8 + t7;
+    t3 = t12 - t15;
+    t9 = t10 - t17;
+    t18 = t0 - t19;
+    t2 = t8 - t7;
+    t13 = t1 + t4;
+    t14 = t5 + t11;
+    t12 = t1 - t4;
+    t15 = C77 * t12;
+    t10 = t5 - t11;
+    t17 = C77 * t10;
+    t0 = C78 * t13;
+    t19 = t16 - t0;
+    t8 = C78 * t14;
+    t7 = t6 - t8;
+    t1 = t19 + t15;
+    t4 = t7 + t17;
+    t12 = t19 - t15;
+    t5 = t7 - t17;
+    t11 = C1 * t3;
+    t10 = C79 * t18;
+    t0 = t11 + t10;
+    t8 = C1 * t9;
+    t19 = C79 * t2;
+    t15 = t8 + t19;
+    t7 = C79 * t3;
+    t17 = C1 * t18;
+    t11 = t7 - t17;
+    t10 = C79 * t9;
+    t8 = C1 * t2;
+    t19 = t10 - t8;
+    t3 = t16 + t13;
+    t18 = t6 + t14;
+    t7 = t1 + t15;
+    t17 = t4 - t0;
+    t9 = t12 + t19;
+    t2 = t5 - t11;
+    t10 = t12 - t19;
+    t8 = t5 + t11;
+    t16 = t1 - t15;
+    t13 = t4 + t0;
+    t6 = (-C140) * t3;
+    t14 = (-C141) * t18;
+    t12 = t6 + t14;
+    t19 = 0.07846068721664735 * t12;
+    y[339] = t19;
+    t5 = (-0.0012403161494891884) * t12;
+    y[620] = t5;
+    t11 = C141 * t3;
+    t1 = (-C140) * t18;
+    t15 = t11 + t1;
+    y[19] = 0;
+    t4 = (-0.07965772696767702) * t15;
+    y[300] = t4;
+    t0 = (-C142) * t7;
+    t6 = (-C143) * t17;
+    t14 = t0 + t6;
+    t19 = 0.07835959668349907 * t14;
+    y[467] = t19;
+    t12 = 0.05413766123113763 * t14;
+    y[492] = t12;
+    t5 = C143 * t7;
+    t3 = (-C142) * t17;
+    t18 = t5 + t3;
+    t11 = 0.024781081945578775 * t18;
+    y[147] = t11;
+    t1 = (-0.06263955390830653) * t18;
+    y[172] = t1;
+    t15 = C144 * t9;
+    t4 = C145 * t2;
+    t0 = t15 + t4;
+    y[44] = 0;
+    t6 = (-0.07985497122541489) * t0;
+    y[275] = t6;
+    t19 = (-C145) * t9;
+    t14 = C144 * t2;
+    t12 = t19 + t14;
+    t7 = 0.07826688688369167 * t12;
+    y[364] = t7;
+    t17 = (-0.005947283706403402) * t12;
+    y[595] = t17;
+    t5 = (-C146) * t10;
+    t3 = (-C147) * t8;
+    t11 = t5 + t3;
+    t18 = 0.0780650096919715 * t11;
+    y[403] = t18;
+    t1 = (-0.006856511841418642) * t11;
+    y[556] = t1;
+    t15 = C147 * t10;
+    t4 = (-C146) * t8;
+    t0 = t15 + t4;
+    y[83] = 0;
+    t6 = (-0.08006147728234735) * t0;
+    y[236] = t6;
+    t9 = C148 * t16;
+    t2 = C149 * t13;
+    t19 = t9 + t2;
+    y[108] = 0;
+    t14 = (-0.07926007834812526) * t19;
+    y[211] = t14;
+    t7 = (-C149) * t16;
+    t12 = C148 * t13;
+    t17 = t7 + t12;
+    t5 = 0.07885432528275857 * t17;
+    y[428] = t5;
+    t3 = 0.005899910603536861 * t17;
+    y[531] = t3;
+    t18 = re[140];
+    t11 = im[140];
+    t1 = re[12];
+    t10 = im[12];
+    t8 = re[44];
+    t15 = im[44];
+    t4 = re[76];
+    t0 = im[76];
+    t6 = re[108];
+    t9 = im[108];
+    t2 = t1 + t6;
+    t19 = t10 + t9;
+    t14 = t8 + t4;
+    t16 = t15 + t0;
+    t13 = t1 - t6;
+    t7 = t10 - t9;
+    t12 = t8 - t4;
+    t5 = t15 - t0;
+    t17 = t2 + t14;
+    t3 = t19 + t16;
+    t1 = t2 - t14;
+    t6 = C77 * t1;
+    t10 = t19 - t16;
+    t9 = C77 * t10;
+    t8 = C78 * t17;
+    t4 = t18 - t8;
+    t15 = C78 * t3;
+    t0 = t11 - t15;
+    t2 = t4 + t6;
+    t14 = t0 + t9;
+    t1 = t4 - t6;
+    t19 = t0 - t9;
+    t16 = C1 * t13;
+    t10 = C79 * t12;
+    t8 = t16 + t10;
+    t15 = C1 * t7;
+    t4 = C79 * t5;
+    t6 = t15 + t4;
+    t0 = C79 * t13;
+    t9 = C1 * t12;
+    t16 = t0 - t9;
+    t10 = C79 * t7;
+    t15 = C1 * t5;
+    t4 = t10 - t15;
+    t13 = t18 + t17;
+    t12 = t11 + t3;
+    t0 = t2 + t6;
+    t9 = t14 - t8;
+    t7 = t1 + t4;
+    t5 = t19 - t16;
+    t10 = t1 - t4;
+    t15 = t19 + t16;
+    t18 = t2 - t6;
+    t17 = t14 + t8;
+    t11 = C150 * t13;
+    t3 = C151 * t12;
+    t1 = t11 + t3;
+    y[110] = 0;
+    t4 = (-0.07910392290808559) * t1;
+    y[209] = t4;
+    t19 = (-C151) * t13;
+    t16 = C150 * t12;
+    t2 = t19 + t16;
+    t6 = 0.07900998800352993 * t2;
+    y[430] = t6;
+    t14 = 0.0075870820171638305 * t2;
+    y[529] = t14;
+    t8 = (-C152) * t0;
+    t11 = (-C153) * t9;
+    t3 = t8 + t11;
+    t1 = 0.07850393454933578 * t3;
+    y[337] = t1;
+    t4 = (-0.00100033448048195) * t3;
+    y[622] = t4;
+    t13 = C153 * t0;
+    t12 = (-C152) * t9;
+    t19 = t13 + t12;
+    y[17] = 0;
+    t16 = (-0.07961384401787135) * t19;
+    y[302] = t16;
+    t6 = (-C154) * t7;
+    t2 = (-C155) * t5;
+    t14 = t6 + t2;
+    t8 = 0.07920667729745716 * t14;
+    y[465] = t8;
+    t11 = 0.05138642947995969 * t14;
+    y[494] = t11;
+    t1 = C155 * t7;
+    t3 = (-C154) * t5;
+    t4 = t1 + t3;
+    t0 = 0.021708977932100717 * t4;
+    y[145] = t0;
+    t9 = (-0.06482348851887695) * t4;
+    y[174] = t9;
+    t13 = C156 * t10;
+    t12 = C157 * t15;
+    t19 = t13 + t12;
+    y[46] = 0;
+    t16 = (-0.0798590925316545) * t19;
+    y[273] = t16;
+    t6 = (-C157) * t10;
+    t2 = C156 * t15;
+    t8 = t6 + t2;
+    t14 = 0.07826284774676884 * t8;
+    y[366] = t14;
+    t11 = (-0.006347861502626827) * t8;
+    y[593] = t11;
+    t7 = (-C158) * t18;
+    t5 = (-C159) * t17;
+    t1 = t7 + t5;
+    t3 = 0.0780607029671936 * t1;
+    y[401] = t3;
+    t0 = (-0.007315378642888369) * t1;
+    y[558] = t0;
+    t4 = C159 * t18;
+    t9 = (-C158) * t17;
+    t13 = t4 + t9;
+    y[81] = 0;
+    t12 = (-0.08006589439281213) * t13;
+    y[238] = t12;
+    t19 = re[5];
+    t16 = im[5];
+    t10 = re[37];
+    t15 = im[37];
+    t6 = re[69];
+    t2 = im[69];
+    t14 = re[101];
+    t8 = im[101];
+    t11 = re[133];
+    t7 = im[133];
+    t5 = t10 + t11;
+    t3 = t15 + t7;
+    t1 = t6 + t14;
+    t0 = t2 + t8;
+    t18 = t10 - t11;
+    t17 = t15 - t7;
+    t4 = t6 - t14;
+    t9 = t2 - t8;
+    t13 = t5 + t1;
+    t12 = t3 + t0;
+    t10 = t5 - t1;
+    t11 = C77 * t10;
+    t15 = t3 - t0;
+    t7 = C77 * t15;
+    t6 = C78 * t13;
+    t14 = t19 - t6;
+    t2 = C78 * t12;
+    t8 = t16 - t2;
+    t5 = t14 + t11;
+    t1 = t8 + t7;
+    t10 = t14 - t11;
+    t3 = t8 - t7;
+    t0 = C1 * t18;
+    t15 = C79 * t4;
+    t6 = t0 + t15;
+    t2 = C1 * t17;
+    t14 = C79 * t9;
+    t11 = t2 + t14;
+    t8 = C79 * t18;
+    t7 = C1 * t4;
+    t0 = t8 - t7;
+    t15 = C79 * t17;
+    t2 = C1 * t9;
+    t14 = t15 - t2;
+    t18 = t19 + t13;
+    t4 = t16 + t12;
+    t8 = t5 + t11;
+    t7 = t1 - t6;
+    t17 = t10 + t14;
+    t9 = t3 - t0;
+    t15 = t10 - t14;
+    t2 = t3 + t0;
+    t19 = t5 - t11;
+    t13 = t1 + t6;
+    t16 = (-C160) * t18;
+    t12 = (-C161) * t4;
+    t10 = t16 + t12;
+    t14 = 0.07806145671585792 * t10;
+    y[399] = t14;
+    t3 = (-0.00770552452765192) * t10;
+    y[560] = t3;
+    t0 = C161 * t18;
+    t5 = (-C160) * t4;
+    t11 = t0 + t5;
+    y[79] = 0;
+    t1 = (-0.08006512128962529) * t11;
+    y[240] = t1;
+    t6 = C162 * t8;
+    t16 = C163 * t7;
+    t12 = t6 + t16;
+    y[112] = 0;
+    t14 = (-0.07892736100051959) * t12;
+    y[207] = t14;
+    t10 = (-C163) * t8;
+    t3 = C162 * t7;
+    t18 = t10 + t3;
+    t4 = 0.07918673474916837 * t18;
+    y[432] = t4;
+    t0 = 0.009384974833630134 * t18;
+    y[527] = t0;
+    t5 = (-C164) * t17;
+    t11 = (-C165) * t9;
+    t1 = t5 + t11;
+    t6 = 0.07855225056629657 * t1;
+    y[335] = t6;
+    t16 = (-0.0007898186170955989) * t1;
+    y[624] = t16;
+    t12 = C165 * t17;
+    t14 = (-C164) * t9;
+    t8 = t12 + t14;
+    y[15] = 0;
+    t7 = (-0.07956487503467673) * t8;
+    y[304] = t7;
+    t10 = (-C166) * t15;
+    t3 = (-C167) * t2;
+    t4 = t10 + t3;
+    t18 = 0.0798911548658402 * t4;
+    y[463] = t18;
+    t0 = 0.04858411851028732 * t4;
+    y[496] = t0;
+    t5 = C167 * t15;
+    t11 = (-C166) * t2;
+    t6 = t5 + t11;
+    t1 = 0.018775250339183078 * t6;
+    y[143] = t1;
+    t16 = (-0.06681366693752928) * t6;
+    y[176] = t16;
+    t17 = C168 * t19;
+    t9 = C169 * t13;
+    t12 = t17 + t9;
+    y[48] = 0;
+    t14 = (-0.07986425164246268) * t12;
+    y[271] = t14;
+    t8 = (-C169) * t19;
+    t7 = C168 * t13;
+    t10 = t8 + t7;
+    t3 = 0.07825779208424921 * t10;
+    y[368] = t3;
+    t18 = (-0.006731007187738434) * t10;
+    y[591] = t18;
+}
+
+/**
+ *  Part 4 of ApplyWindowedIMDCT_W10_320().
+ * 
+ *  @param {Number[]} X 
+ *    - The input block (320 points).
+ *  @param {Number[]} y 
+ *    - The array that would contain the output block (640 points).
+ *  @param {Number[]} re 
+ *    - The scratch buffer (real part, 160 points).
+ *  @param {Number[]} im 
+ *    - The scratch buffer (imaginary part, 160 points).
+ */
+function ApplyWindowedIMDCT_W10_320_Part4(X, y, re, im) {
+    let t0, t1, t10, t11, t12, t13, t14, t15, t16, t17, t18, t19, t2, t3, t4, t5, t6, t7, t8, t9;
+    const C0 = 0.5590169943749475;
+    const C1 = 0.25;
+    const C2 = 0.9510565162951535;
+    const C3 = 0.5877852522924731;
+    const C4 = 0.5119960151141623;
+    const C5 = 0.8589878232589904;
+    const C6 = 0.9191138516900578;
+    const C7 = 0.3939920400610481;
+    const C8 = 0.22149531114330429;
+    const C9 = 0.975161436451181;
+    const C10 = 0.7523789818396478;
+    const C11 = 0.6587304970061238;
+    const C12 = 0.9958794538942858;
+    const C13 = 0.09068689713083816;
+    const C14 = 0.99494115919819;
+    const C15 = 0.10045939345507647;
+    const C16 = 0.5035383837257176;
+    const C17 = 0.8639728561215868;
+    const C18 = 0.9152016129634745;
+    const C19 = 0.4029962873638599;
+    const C20 = 0.21191116582684155;
+    const C21 = 0.9772889326079104;
+    const C22 = 0.7458757562673048;
+    const C23 = 0.6660850968252301;
+    const C24 = 0.7393006416371488;
+    const C25 = 0.6733754979763521;
+    const C26 = 0.9939069700023561;
+    const C27 = 0.11022220729388306;
+    const C28 = 0.4950322202598127;
+    const C29 = 0.8688746174820854;
+    const C30 = 0.9112011652005843;
+    const C31 = 0.4119616930457218;
+    const C32 = 0.20230659607115642;
+    const C33 = 0.9793222356232406;
+    const C34 = 0.1926825275846723;
+    const C35 = 0.981261149523195;
+    const C36 = 0.7326542716724128;
+    const C37 = 0.680600997795453;
+    const C38 = 0.9927769859840909;
+    const C39 = 0.11997439768694032;
+    const C40 = 0.48647834455818684;
+    const C41 = 0.8736926348985243;
+    const C42 = 0.9071128939728691;
+    const C43 = 0.4208873930021738;
+    const C44 = 0.9029371933164189;
+    const C45 = 0.42977252695567697;
+    const C46 = 0.18303988795514095;
+    const C47 = 0.9831054874312163;
+    const C48 = 0.7259372869640676;
+    const C49 = 0.6877608998738217;
+    const C50 = 0.9915513160536062;
+    const C51 = 0.1297150246978405;
+    const C52 = 0.4778775810611837;
+    const C53 = 0.8784264440003566;
+    const C54 = 0.4692307587282903;
+    const C55 = 0.8830755885332088;
+    const C56 = 0.8986744656939538;
+    const C57 = 0.43861623853852766;
+    const C58 = 0.1733796065602395;
+    const C59 = 0.9848550715861784;
+    const C60 = 0.7191503349090794;
+    const C61 = 0.6948545141251936;
+    const C62 = 0.9902300783435211;
+    const C63 = 0.13944314950467876;
+    const C64 = 0.9888134001974757;
+    const C65 = 0.14915783449053857;
+    const C66 = 0.46053871095824;
+    const C67 = 0.8876396204028539;
+    const C68 = 0.8943251219560346;
+    const C69 = 0.4474176753753966;
+    const C70 = 0.16370261447799525;
+    const C71 = 0.9865097333595187;
+    const C72 = 0.7122940696480137;
+    const C73 = 0.7018811568522627;
+    const C74 = 0.7053691520019861;
+    const C75 = 0.7088401508125785;
+    const C76 = 0.9873014181578584;
+    const C77 = 0.15885814333386145;
+    const C78 = 0.4518022755086881;
+    const C79 = 0.8921180997184013;
+    const C80 = 0.889889581301463;
+    const C81 = 0.45617598916548296;
+    const C82 = 0.15400984439704607;
+    const C83 = 0.988069313271492;
+    const C84 = 0.14430223052674654;
+    const C85 = 0.9895336610065398;
+    const C86 = 0.6983762494089729;
+    const C87 = 0.7157308252838186;
+    const C88 = 0.9856942779526452;
+    const C89 = 0.16854314109869134;
+    const C90 = 0.44302229441546676;
+    const C91 = 0.8965105948346932;
+    const C92 = 0.8853682712368793;
+    const C93 = 0.4648903357642743;
+    const C94 = 0.8807616275355579;
+    const C95 = 0.47355987526490806;
+    const C96 = 0.13458070850712617;
+    const C97 = 0.99090263542778;
+    const C98 = 0.6913160358594803;
+    const C99 = 0.722552516128436;
+    const C100 = 0.9839921344813541;
+    const C101 = 0.1782118943247859;
+    const C102 = 0.43419961391142786;
+    const C103 = 0.900816682393908;
+    const C104 = 0.4253350843448814;
+    const C105 = 0.9050359473663644;
+    const C106 = 0.8760700941954066;
+    const C107 = 0.4821837720791227;
+    const C108 = 0.12484621531871118;
+    const C109 = 0.9921761045906085;
+    const C110 = 0.6841891918315852;
+    const C111 = 0.7293045658576686;
+    const C112 = 0.9821951518001156;
+    const C113 = 0.1878634711175852;
+    const C114 = 0.9803035031058607;
+    const C115 = 0.19749694123802963;
+    const C116 = 0.41642956009763715;
+    const C117 = 0.9091679830905224;
+    const C118 = 0.8712941233961736;
+    const C119 = 0.49076119501779414;
+    const C120 = 0.11509968919221586;
+    const C121 = 0.9933539457554167;
+    const C122 = 0.6769964042253483;
+    const C123 = 0.7359863236949099;
+    const C124 = 0.6697383662966098;
+    const C125 = 0.742597145638433;
+    const C126 = 0.9783173707196277;
+    const C127 = 0.20711137619221856;
+    const C128 = 0.4074838995026576;
+    const C129 = 0.9132123913121788;
+    const C130 = 0.8664341754558649;
+    const C131 = 0.4992913173710469;
+    const C132 = 0.10534206951811415;
+    const C133 = 0.9944360453994218;
+    const C134 = 0.09557429675609919;
+    const C135 = 0.9954222992276077;
+    const C136 = 0.6624157775901718;
+    const C137 = 0.7491363945234594;
+    const C138 = 0.9762369460689896;
+    const C139 = 0.2167058493209;
+    const C140 = 0.3984989647613298;
+    const C141 = 0.9171687822228516;
+    const C142 = 0.8614907187863783;
+    const C143 = 0.5077733169879345;
+    const C144 = 0.8564642298483564;
+    const C145 = 0.5162063763556798;
+    const C146 = 0.0857973123444399;
+    const C147 = 0.996312612182778;
+    const C148 = 0.6550293438723744;
+    const C149 = 0.7556034400835709;
+    const C150 = 0.9740624296696047;
+    const C151 = 0.22627943588878452;
+    const C152 = 0.3894756218603649;
+    const C153 = 0.9210367744973499;
+    const C154 = 0.3804147404883323;
+    const C155 = 0.9248159953305278;
+    const C156 = 0.8513551931052652;
+    const C157 = 0.524589682678469;
+    const C158 = 0.07601205860924312;
+    const C159 = 0.9971068984547168;
+    const C160 = 0.6475797770630733;
+    const C161 = 0.7619976590114568;
+    const C162 = 0.9717940311058891;
+    const C163 = 0.2358312131736727;
+    t4 = re[25];
+    t0 = im[25];
+    t15 = re[57];
+    t2 = im[57];
+    t5 = re[89];
+    t11 = im[89];
+    t1 = re[121];
+    t6 = im[121];
+    t16 = re[153];
+    t17 = im[153];
+    t9 = t15 + t16;
+    t12 = t2 + t17;
+    t14 = t5 + t1;
+    t19 = t11 + t6;
+    t13 = t15 - t16;
+    t8 = t2 - t17;
+    t7 = t5 - t1;
+    t3 = t11 - t6;
+    t10 = t9 + t14;
+    t18 = t12 + t19;
+    t15 = t9 - t14;
+    t16 = C0 * t15;
+    t2 = t12 - t19;
+    t17 = C0 * t2;
+    t5 = C1 * t10;
+    t1 = t4 - t5;
+    t11 = C1 * t18;
+    t6 = t0 - t11;
+    t9 = t1 + t16;
+    t14 = t6 + t17;
+    t15 = t1 - t16;
+    t12 = t6 - t17;
+    t19 = C2 * t13;
+    t2 = C3 * t7;
+    t5 = t19 + t2;
+    t11 = C2 * t8;
+    t1 = C3 * t3;
+    t16 = t11 + t1;
+    t6 = C3 * t13;
+    t17 = C2 * t7;
+    t19 = t6 - t17;
+    t2 = C3 * t8;
+    t11 = C2 * t3;
+    t1 = t2 - t11;
+    t13 = t4 + t10;
+    t7 = t0 + t18;
+    t6 = t9 + t16;
+    t17 = t14 - t5;
+    t8 = t15 + t1;
+    t3 = t12 - t19;
+    t2 = t15 - t1;
+    t11 = t12 + t19;
+    t4 = t9 - t16;
+    t10 = t14 + t5;
+    t0 = C4 * t13;
+    t18 = C5 * t7;
+    t15 = t0 + t18;
+    y[50] = 0;
+    t1 = (-0.07987086976732814) * t15;
+    y[269] = t1;
+    t12 = (-C5) * t13;
+    t19 = C4 * t7;
+    t9 = t12 + t19;
+    t16 = 0.07825130761949729 * t9;
+    y[370] = t16;
+    t14 = (-0.007092253041875984) * t9;
+    y[589] = t14;
+    t5 = (-C6) * t6;
+    t0 = (-C7) * t17;
+    t18 = t5 + t0;
+    t15 = 0.07806664449304893 * t18;
+    y[397] = t15;
+    t1 = (-0.008029601387179236) * t18;
+    y[562] = t1;
+    t13 = C7 * t6;
+    t7 = (-C6) * t17;
+    t12 = t13 + t7;
+    y[77] = 0;
+    t19 = (-0.0800598007072855) * t12;
+    y[242] = t19;
+    t16 = C8 * t8;
+    t9 = C9 * t3;
+    t14 = t16 + t9;
+    y[114] = 0;
+    t5 = (-0.07872876715165095) * t14;
+    y[205] = t5;
+    t0 = (-C9) * t8;
+    t15 = C8 * t3;
+    t18 = t0 + t15;
+    t1 = 0.07938648382440648 * t18;
+    y[434] = t1;
+    t6 = 0.011294046579022204 * t18;
+    y[525] = t6;
+    t17 = (-C10) * t2;
+    t13 = (-C11) * t11;
+    t7 = t17 + t13;
+    t12 = 0.07860548799126442 * t7;
+    y[333] = t12;
+    t19 = (-0.0006082496345561968) * t7;
+    y[626] = t19;
+    t16 = C11 * t2;
+    t9 = (-C10) * t11;
+    t14 = t16 + t9;
+    y[13] = 0;
+    t5 = (-0.07951098784215394) * t14;
+    y[306] = t5;
+    t8 = (-C12) * t4;
+    t3 = (-C13) * t10;
+    t0 = t8 + t3;
+    t15 = 0.08042166933048225 * t0;
+    y[461] = t15;
+    t1 = 0.045747664090940304 * t0;
+    y[498] = t1;
+    t18 = C13 * t4;
+    t6 = (-C12) * t10;
+    t17 = t18 + t6;
+    t13 = 0.016007887610726444 * t17;
+    y[141] = t13;
+    t12 = (-0.06860932607733869) * t17;
+    y[178] = t12;
+    t7 = re[45];
+    t19 = im[45];
+    t2 = re[77];
+    t11 = im[77];
+    t16 = re[109];
+    t9 = im[109];
+    t14 = re[141];
+    t5 = im[141];
+    t8 = re[13];
+    t3 = im[13];
+    t15 = t2 + t8;
+    t0 = t11 + t3;
+    t1 = t16 + t14;
+    t4 = t9 + t5;
+    t10 = t2 - t8;
+    t18 = t11 - t3;
+    t6 = t16 - t14;
+    t13 = t9 - t5;
+    t17 = t15 + t1;
+    t12 = t0 + t4;
+    t2 = t15 - t1;
+    t8 = C0 * t2;
+    t11 = t0 - t4;
+    t3 = C0 * t11;
+    t16 = C1 * t17;
+    t14 = t7 - t16;
+    t9 = C1 * t12;
+    t5 = t19 - t9;
+    t15 = t14 + t8;
+    t1 = t5 + t3;
+    t2 = t14 - t8;
+    t0 = t5 - t3;
+    t4 = C2 * t10;
+    t11 = C3 * t6;
+    t16 = t4 + t11;
+    t9 = C2 * t18;
+    t14 = C3 * t13;
+    t8 = t9 + t14;
+    t5 = C3 * t10;
+    t3 = C2 * t6;
+    t4 = t5 - t3;
+    t11 = C3 * t18;
+    t9 = C2 * t13;
+    t14 = t11 - t9;
+    t10 = t7 + t17;
+    t6 = t19 + t12;
+    t5 = t15 + t8;
+    t3 = t1 - t16;
+    t18 = t2 + t14;
+    t13 = t0 - t4;
+    t11 = t2 - t14;
+    t9 = t0 + t4;
+    t7 = t15 - t8;
+    t17 = t1 + t16;
+    t19 = (-C14) * t10;
+    t12 = (-C15) * t6;
+    t2 = t19 + t12;
+    t14 = 0.08080883281425316 * t2;
+    y[459] = t14;
+    t0 = 0.04289372215178292 * t2;
+    y[500] = t0;
+    t4 = C15 * t10;
+    t15 = (-C14) * t6;
+    t8 = t4 + t15;
+    t1 = 0.013432310384368186 * t8;
+    y[139] = t1;
+    t16 = (-0.0702130944467205) * t8;
+    y[180] = t16;
+    t19 = C16 * t5;
+    t12 = C17 * t3;
+    t14 = t19 + t12;
+    y[52] = 0;
+    t2 = (-0.07987915873304213) * t14;
+    y[267] = t2;
+    t0 = (-C17) * t5;
+    t10 = C16 * t3;
+    t6 = t0 + t10;
+    t4 = 0.07824318757396576 * t6;
+    y[372] = t4;
+    t15 = (-0.007427539565617188) * t6;
+    y[587] = t15;
+    t1 = (-C18) * t18;
+    t8 = (-C19) * t13;
+    t16 = t1 + t8;
+    t19 = 0.07807549860039238 * t16;
+    y[395] = t19;
+    t12 = (-0.00828995947322154) * t16;
+    y[564] = t12;
+    t14 = C19 * t18;
+    t2 = (-C18) * t13;
+    t5 = t14 + t2;
+    y[75] = 0;
+    t3 = (-0.08005072157129448) * t5;
+    y[244] = t3;
+    t0 = C20 * t11;
+    t10 = C21 * t9;
+    t4 = t0 + t10;
+    y[116] = 0;
+    t6 = (-0.07850650978497138) * t4;
+    y[203] = t6;
+    t15 = (-C21) * t11;
+    t1 = C20 * t9;
+    t8 = t15 + t1;
+    t19 = 0.07961123245853997 * t8;
+    y[436] = t19;
+    t16 = 0.013313517900273962 * t8;
+    y[523] = t16;
+    t12 = (-C22) * t7;
+    t18 = (-C23) * t17;
+    t13 = t12 + t18;
+    t14 = 0.07866326189821478 * t13;
+    y[331] = t14;
+    t2 = (-0.000454986335991667) * t13;
+    y[628] = t2;
+    t5 = C23 * t7;
+    t3 = (-C22) * t17;
+    t0 = t5 + t3;
+    y[11] = 0;
+    t10 = (-0.0794525913263945) * t0;
+    y[308] = t10;
+    t4 = re[65];
+    t6 = im[65];
+    t11 = re[97];
+    t9 = im[97];
+    t15 = re[129];
+    t1 = im[129];
+    t19 = re[1];
+    t8 = im[1];
+    t16 = re[33];
+    t12 = im[33];
+    t18 = t11 + t16;
+    t14 = t9 + t12;
+    t13 = t15 + t19;
+    t2 = t1 + t8;
+    t7 = t11 - t16;
+    t17 = t9 - t12;
+    t5 = t15 - t19;
+    t3 = t1 - t8;
+    t0 = t18 + t13;
+    t10 = t14 + t2;
+    t11 = t18 - t13;
+    t16 = C0 * t11;
+    t9 = t14 - t2;
+    t12 = C0 * t9;
+    t15 = C1 * t0;
+    t19 = t4 - t15;
+    t1 = C1 * t10;
+    t8 = t6 - t1;
+    t18 = t19 + t16;
+    t13 = t8 + t12;
+    t11 = t19 - t16;
+    t14 = t8 - t12;
+    t2 = C2 * t7;
+    t9 = C3 * t5;
+    t15 = t2 + t9;
+    t1 = C2 * t17;
+    t19 = C3 * t3;
+    t16 = t1 + t19;
+    t8 = C3 * t7;
+    t12 = C2 * t5;
+    t2 = t8 - t12;
+    t9 = C3 * t17;
+    t1 = C2 * t3;
+    t19 = t9 - t1;
+    t7 = t4 + t0;
+    t5 = t6 + t10;
+    t8 = t18 + t16;
+    t12 = t13 - t15;
+    t17 = t11 + t19;
+    t3 = t14 - t2;
+    t9 = t11 - t19;
+    t1 = t14 + t2;
+    t4 = t18 - t16;
+    t0 = t13 + t15;
+    t6 = (-C24) * t7;
+    t10 = (-C25) * t5;
+    t11 = t6 + t10;
+    t19 = 0.07872520840851852 * t11;
+    y[329] = t19;
+    t14 = (-0.0003285577883509001) * t11;
+    y[630] = t14;
+    t2 = C25 * t7;
+    t18 = (-C24) * t5;
+    t16 = t2 + t18;
+    y[9] = 0;
+    t13 = (-0.07939007246024282) * t16;
+    y[310] = t13;
+    t15 = (-C26) * t8;
+    t6 = (-C27) * t12;
+    t10 = t15 + t6;
+    t19 = 0.08106504589428773 * t10;
+    y[457] = t19;
+    t11 = 0.04003874813103435 * t10;
+    y[502] = t11;
+    t14 = C27 * t8;
+    t7 = (-C26) * t12;
+    t5 = t14 + t7;
+    t2 = 0.011069855000296981 * t5;
+    y[137] = t2;
+    t18 = (-0.07163108093922897) * t5;
+    y[182] = t18;
+    t16 = C28 * t17;
+    t13 = C29 * t3;
+    t15 = t16 + t13;
+    y[54] = 0;
+    t6 = (-0.07988930163961726) * t15;
+    y[265] = t6;
+    t19 = (-C29) * t17;
+    t10 = C28 * t3;
+    t11 = t19 + t10;
+    t8 = 0.07823325366134647 * t11;
+    y[374] = t8;
+    t12 = (-0.007732435532826085) * t11;
+    y[585] = t12;
+    t14 = (-C30) * t9;
+    t7 = (-C31) * t1;
+    t2 = t14 + t7;
+    t5 = 0.07808737864458444 * t2;
+    y[393] = t5;
+    t18 = (-0.00848865954933994) * t2;
+    y[566] = t18;
+    t16 = C31 * t9;
+    t13 = (-C30) * t1;
+    t15 = t16 + t13;
+    y[73] = 0;
+    t6 = (-0.08003854282837364) * t15;
+    y[246] = t6;
+    t17 = C32 * t4;
+    t3 = C33 * t0;
+    t19 = t17 + t3;
+    y[118] = 0;
+    t10 = (-0.07825954791313729) * t19;
+    y[201] = t10;
+    t8 = (-C33) * t4;
+    t11 = C32 * t0;
+    t12 = t8 + t11;
+    t14 = 0.07986245981048944 * t12;
+    y[438] = t14;
+    t7 = 0.015441985894296665 * t12;
+    y[521] = t7;
+    t5 = re[85];
+    t2 = im[85];
+    t18 = re[117];
+    t9 = im[117];
+    t1 = re[149];
+    t16 = im[149];
+    t13 = re[21];
+    t15 = im[21];
+    t6 = re[53];
+    t17 = im[53];
+    t3 = t18 + t6;
+    t19 = t9 + t17;
+    t10 = t1 + t13;
+    t4 = t16 + t15;
+    t0 = t18 - t6;
+    t8 = t9 - t17;
+    t11 = t1 - t13;
+    t14 = t16 - t15;
+    t12 = t3 + t10;
+    t7 = t19 + t4;
+    t18 = t3 - t10;
+    t6 = C0 * t18;
+    t9 = t19 - t4;
+    t17 = C0 * t9;
+    t1 = C1 * t12;
+    t13 = t5 - t1;
+    t16 = C1 * t7;
+    t15 = t2 - t16;
+    t3 = t13 + t6;
+    t10 = t15 + t17;
+    t18 = t13 - t6;
+    t19 = t15 - t17;
+    t4 = C2 * t0;
+    t9 = C3 * t11;
+    t1 = t4 + t9;
+    t16 = C2 * t8;
+    t13 = C3 * t14;
+    t6 = t16 + t13;
+    t15 = C3 * t0;
+    t17 = C2 * t11;
+    t4 = t15 - t17;
+    t9 = C3 * t8;
+    t16 = C2 * t14;
+    t13 = t9 - t16;
+    t0 = t5 + t12;
+    t11 = t2 + t7;
+    t15 = t3 + t6;
+    t17 = t10 - t1;
+    t8 = t18 + t13;
+    t14 = t19 - t4;
+    t9 = t18 - t13;
+    t16 = t19 + t4;
+    t5 = t3 - t6;
+    t12 = t10 + t1;
+    t2 = C34 * t0;
+    t7 = C35 * t11;
+    t18 = t2 + t7;
+    t13 = 0.0003517772216361772 * t18;
+    y[120] = t13;
+    t19 = (-0.07794557950580416) * t18;
+    y[199] = t19;
+    t4 = (-C35) * t0;
+    t3 = C34 * t11;
+    t6 = t4 + t3;
+    t10 = 0.08010437254240924 * t6;
+    y[440] = t10;
+    t1 = 0.017676702329292165 * t6;
+    y[519] = t1;
+    t2 = (-C36) * t15;
+    t7 = (-C37) * t17;
+    t13 = t2 + t7;
+    t18 = 0.07879071480259427 * t13;
+    y[327] = t18;
+    t19 = (-0.00022705217394369635) * t13;
+    y[632] = t19;
+    t0 = C37 * t15;
+    t11 = (-C36) * t17;
+    t4 = t0 + t11;
+    y[7] = 0;
+    t3 = (-0.07932406776177908) * t4;
+    y[312] = t3;
+    t10 = (-C38) * t8;
+    t6 = (-C39) * t14;
+    t1 = t10 + t6;
+    t2 = 0.08120448463398589 * t1;
+    y[455] = t2;
+    t7 = 0.03719820422294464 * t1;
+    y[504] = t7;
+    t18 = C39 * t8;
+    t13 = (-C38) * t14;
+    t19 = t18 + t13;
+    t15 = 0.008937659462298152 * t19;
+    y[135] = t15;
+    t17 = (-0.07287202356764515) * t19;
+    y[184] = t17;
+    t0 = C40 * t9;
+    t11 = C41 * t16;
+    t4 = t0 + t11;
+    y[56] = 0;
+    t3 = (-0.07990125288587499) * t4;
+    y[263] = t3;
+    t10 = (-C41) * t9;
+    t6 = C40 * t16;
+    t2 = t10 + t6;
+    t1 = 0.07822155190641425 * t2;
+    y[376] = t1;
+    t7 = (-0.008003417742740937) * t2;
+    y[583] = t7;
+    t8 = (-C42) * t5;
+    t14 = (-C43) * t12;
+    t18 = t8 + t14;
+    t13 = 0.07810154602265036 * t18;
+    y[391] = t13;
+    t15 = (-0.00862790402088222) * t18;
+    y[568] = t15;
+    t19 = C43 * t5;
+    t17 = (-C42) * t12;
+    t0 = t19 + t17;
+    y[71] = 0;
+    t11 = (-0.08002402408509847) * t0;
+    y[248] = t11;
+    t4 = re[105];
+    t3 = im[105];
+    t9 = re[137];
+    t16 = im[137];
+    t10 = re[9];
+    t6 = im[9];
+    t1 = re[41];
+    t2 = im[41];
+    t7 = re[73];
+    t8 = im[73];
+    t14 = t9 + t7;
+    t13 = t16 + t8;
+    t18 = t10 + t1;
+    t15 = t6 + t2;
+    t5 = t9 - t7;
+    t12 = t16 - t8;
+    t19 = t10 - t1;
+    t17 = t6 - t2;
+    t0 = t14 + t18;
+    t11 = t13 + t15;
+    t9 = t14 - t18;
+    t7 = C0 * t9;
+    t16 = t13 - t15;
+    t8 = C0 * t16;
+    t10 = C1 * t0;
+    t1 = t4 - t10;
+    t6 = C1 * t11;
+    t2 = t3 - t6;
+    t14 = t1 + t7;
+    t18 = t2 + t8;
+    t9 = t1 - t7;
+    t13 = t2 - t8;
+    t15 = C2 * t5;
+    t16 = C3 * t19;
+    t10 = t15 + t16;
+    t6 = C2 * t12;
+    t1 = C3 * t17;
+    t7 = t6 + t1;
+    t2 = C3 * t5;
+    t8 = C2 * t19;
+    t15 = t2 - t8;
+    t16 = C3 * t12;
+    t6 = C2 * t17;
+    t1 = t16 - t6;
+    t5 = t4 + t0;
+    t19 = t3 + t11;
+    t2 = t14 + t7;
+    t8 = t18 - t10;
+    t12 = t9 + t1;
+    t17 = t13 - t15;
+    t16 = t9 - t1;
+    t6 = t13 + t15;
+    t4 = t14 - t7;
+    t0 = t18 + t10;
+    t3 = (-C44) * t5;
+    t11 = (-C45) * t19;
+    t9 = t3 + t11;
+    t1 = 0.0781174046680525 * t9;
+    y[389] = t1;
+    t13 = (-0.008710013292504275) * t9;
+    y[570] = t13;
+    t15 = C45 * t5;
+    t14 = (-C44) * t19;
+    t7 = t15 + t14;
+    y[69] = 0;
+    t18 = (-0.08000777837612989) * t7;
+    y[250] = t18;
+    t10 = C46 * t2;
+    t3 = C47 * t8;
+    t11 = t10 + t3;
+    t1 = 0.0009200547972867385 * t11;
+    y[122] = t1;
+    t9 = (-0.07756610969358985) * t11;
+    y[197] = t9;
+    t13 = (-C47) * t2;
+    t5 = C46 * t8;
+    t19 = t13 + t5;
+    t15 = 0.08033903605838183 * t19;
+    y[442] = t15;
+    t14 = 0.020013499709567478 * t19;
+    y[517] = t14;
+    t7 = (-C48) * t12;
+    t18 = (-C49) * t17;
+    t10 = t7 + t18;
+    t3 = 0.07885922470484415 * t10;
+    y[325] = t3;
+    t1 = (-0.00014811107628344213) * t10;
+    y[634] = t1;
+    t11 = C49 * t12;
+    t9 = (-C48) * t17;
+    t2 = t11 + t9;
+    y[5] = 0;
+    t8 = (-0.07925515402151904) * t2;
+    y[314] = t8;
+    t13 = (-C50) * t16;
+    t5 = (-C51) * t6;
+    t15 = t13 + t5;
+    t19 = 0.08124242814953461 * t15;
+    y[453] = t19;
+    t14 = 0.034387157709965845 * t15;
+    y[506] = t14;
+    t7 = C51 * t16;
+    t18 = (-C50) * t6;
+    t3 = t7 + t18;
+    t10 = 0.007047155047572928 * t3;
+    y[133] = t10;
+    t1 = (-0.07394742506852245) * t3;
+    y[186] = t1;
+    t12 = C52 * t4;
+    t17 = C53 * t0;
+    t11 = t12 + t17;
+    y[58] = 0;
+    t9 = (-0.07991498046591929) * t11;
+    y[261] = t9;
+    t2 = (-C53) * t4;
+    t8 = C52 * t0;
+    t13 = t2 + t8;
+    t5 = 0.07820811521896559 * t13;
+    y[378] = t5;
+    t19 = (-0.008236636173384312) * t13;
+    y[581] = t19;
+    t15 = re[125];
+    t14 = im[125];
+    t16 = re[157];
+    t6 = im[157];
+    t7 = re[29];
+    t18 = im[29];
+    t10 = re[61];
+    t3 = im[61];
+    t1 = re[93];
+    t12 = im[93];
+    t17 = t16 + t1;
+    t11 = t6 + t12;
+    t9 = t7 + t10;
+    t4 = t18 + t3;
+    t0 = t16 - t1;
+    t2 = t6 - t12;
+    t8 = t7 - t10;
+    t5 = t18 - t3;
+    t13 = t17 + t9;
+    t19 = t11 + t4;
+    t16 = t17 - t9;
+    t1 = C0 * t16;
+    t6 = t11 - t4;
+    t12 = C0 * t6;
+    t7 = C1 * t13;
+    t10 = t15 - t7;
+    t18 = C1 * t19;
+    t3 = t14 - t18;
+    t17 = t10 + t1;
+    t9 = t3 + t12;
+    t16 = t10 - t1;
+    t11 = t3 - t12;
+    t4 = C2 * t0;
+    t6 = C3 * t8;
+    t7 = t4 + t6;
+    t18 = C2 * t2;
+    t10 = C3 * t5;
+    t1 = t18 + t10;
+    t3 = C3 * t0;
+    t12 = C2 * t8;
+    t4 = t3 - t12;
+    t6 = C3 * t2;
+    t18 = C2 * t5;
+    t10 = t6 - t18;
+    t0 = t15 + t13;
+    t8 = t14 + t19;
+    t3 = t17 + t1;
+    t12 = t9 - t7;
+    t2 = t16 + t10;
+    t5 = t11 - t4;
+    t6 = t16 - t10;
+    t18 = t11 + t4;
+    t15 = t17 - t1;
+    t13 = t9 + t7;
+    t14 = C54 * t0;
+    t19 = C55 * t8;
+    t16 = t14 + t19;
+    y[60] = 0;
+    t10 = (-0.07993020077294767) * t16;
+    y[259] = t10;
+    t11 = (-C55) * t0;
+    t4 = C54 * t8;
+    t17 = t11 + t4;
+    t1 = 0.0781932228314296 * t17;
+    y[380] = t1;
+    t9 = (-0.008428741800686423) * t17;
+    y[579] = t9;
+    t7 = (-C56) * t3;
+    t14 = (-C57) * t12;
+    t19 = t7 + t14;
+    t16 = 0.07813426029130742 * t19;
+    y[387] = t16;
+    t10 = (-0.008736648715340965) * t19;
+    y[572] = t10;
+    t0 = C57 * t3;
+    t8 = (-C56) * t12;
+    t11 = t0 + t8;
+    y[67] = 0;
+    t4 = (-0.07999051858554966) * t11;
+    y[252] = t4;
+    t1 = C58 * t2;
+    t17 = C59 * t5;
+    t9 = t1 + t17;
+    t7 = 0.0015397724767375375 * t9;
+    y[124] = t7;
+    t14 = (-0.07713298043845977) * t9;
+    y[195] = t14;
+    t16 = (-C59) * t2;
+    t19 = C58 * t5;
+    t10 = t16 + t19;
+    t3 = 0.08058079051105971 * t10;
+    y[444] = t3;
+    t12 = 0.02244712275156356 * t10;
+    y[515] = t12;
+    t0 = (-C60) * t6;
+    t8 = (-C61) * t18;
+    t11 = t0 + t8;
+    t4 = 0.0789299805782335 * t11;
+    y[323] = t4;
+    t1 = (-8.906834541416462e-05) * t11;
+    y[636] = t1;
+    t17 = C61 * t6;
+    t7 = (-C60) * t18;
+    t9 = t17 + t7;
+    y[3] = 0;
+    t14 = (-0.07918410665013594) * t9;
+    y[316] = t14;
+    t2 = (-C62) * t15;
+    t5 = (-C63) * t13;
+    t16 = t2 + t5;
+    t19 = 0.08119431733865926 * t16;
+    y[451] = t19;
+    t3 = 0.03161970808366637 * t16;
+    y[508] = t3;
+    t10 = C63 * t15;
+    t12 = (-C62) * t13;
+    t0 = t10 + t12;
+    t8 = 0.005404191194233247 * t0;
+    y[131] = t8;
+    t4 = (-0.0748712625620606) * t0;
+    y[188] = t4;
+    t11 = re[145];
+    t1 = im[145];
+    t6 = re[17];
+    t18 = im[17];
+    t17 = re[49];
+    t7 = im[49];
+    t9 = re[81];
+    t14 = im[81];
+    t2 = re[113];
+    t5 = im[113];
+    t19 = t6 + t2;
+    t16 = t18 + t5;
+    t3 = t17 + t9;
+    t15 = t7 + t14;
+    t13 = t6 - t2;
+    t10 = t18 - t5;
+    t12 = t17 - t9;
+    t8 = t7 - t14;
+    t0 = t19 + t3;
+    t4 = t16 + t15;
+    t6 = t19 - t3;
+    t2 = C0 * t6;
+    t18 = t16 - t15;
+    t5 = C0 * t18;
+    t17 = C1 * t0;
+    t9 = t11 - t17;
+    t7 = C1 * t4;
+    t14 = t1 - t7;
+    t19 = t9 + t2;
+    t3 = t14 + t5;
+    t6 = t9 - t2;
+    t16 = t14 - t5;
+    t15 = C2 * t13;
+    t18 = C3 * t12;
+    t17 = t15 + t18;
+    t7 = C2 * t10;
+    t9 = C3 * t8;
+    t2 = t7 + t9;
+    t14 = C3 * t13;
+    t5 = C2 * t12;
+    t15 = t14 - t5;
+    t18 = C3 * t10;
+    t7 = C2 * t8;
+    t9 = t18 - t7;
+    t13 = t11 + t0;
+    t12 = t1 + t4;
+    t14 = t19 + t2;
+    t5 = t3 - t17;
+    t10 = t6 + t9;
+    t8 = t16 - t15;
+    t18 = t6 - t9;
+    t7 = t16 + t15;
+    t11 = t19 - t2;
+    t0 = t3 + t17;
+    t1 = (-C64) * t13;
+    t4 = (-C65) * t12;
+    t6 = t1 + t4;
+    t9 = 0.08107670419942832 * t6;
+    y[449] = t9;
+    t16 = 0.028908280442592 * t6;
+    y[510] = t16;
+    t15 = C65 * t13;
+    t19 = (-C64) * t12;
+    t2 = t15 + t19;
+    t3 = 0.004008102353092296 * t2;
+    y[129] = t3;
+    t17 = (-0.07565838687825509) * t2;
+    y[190] = t17;
+    t1 = C66 * t14;
+    t4 = C67 * t5;
+    t9 = t1 + t4;
+    y[62] = 0;
+    t6 = (-0.07994667977204827) * t9;
+    y[257] = t6;
+    t16 = (-C67) * t14;
+    t13 = C66 * t5;
+    t12 = t16 + t13;
+    t15 = 0.07817710526341563 * t12;
+    y[382] = t15;
+    t19 = (-0.00857698481964919) * t12;
+    y[577] = t19;
+    t3 = (-C68) * t10;
+    t2 = (-C69) * t8;
+    t17 = t3 + t2;
+    t1 = 0.07815155601597573 * t17;
+    y[385] = t1;
+    t4 = (-0.008710563872349865) * t17;
+    y[574] = t4;
+    t9 = C69 * t10;
+    t6 = (-C68) * t8;
+    t14 = t9 + t6;
+    y[65] = 0;
+    t5 = (-0.07997281587998553) * t14;
+    y[254] = t5;
+    t16 = C70 * t18;
+    t13 = C71 * t7;
+    t15 = t16 + t13;
+    t12 = 0.0023608903596866793 * t15;
+    y[126] = t12;
+    t19 = (-0.07661769202193537) * t15;
+    y[193] = t19;
+    t3 = (-C71) * t18;
+    t2 = C70 * t7;
+    t1 = t3 + t2;
+    t17 = 0.08080439208166479 * t1;
+    y[446] = t17;
+    t4 = 0.024971076367611027 * t1;
+    y[513] = t4;
+    t10 = (-C72) * t11;
+    t8 = (-C73) * t0;
+    t9 = t10 + t8;
+    t6 = 0.07900226121891851 * t9;
+    y[321] = t6;
+    t14 = (-4.6388537934607385e-05) * t9;
+    y[638] = t14;
+    t5 = C73 * t11;
+    t16 = (-C72) * t0;
+    t13 = t5 + t16;
+    y[1] = 0;
+    t12 = (-0.07911165963567798) * t13;
+    y[318] = t12;
+    t15 = re[10];
+    t19 = im[10];
+    t18 = re[42];
+    t7 = im[42];
+    t3 = re[74];
+    t2 = im[74];
+    t17 = re[106];
+    t1 = im[106];
+    t4 = re[138];
+    t10 = im[138];
+    t8 = t18 + t4;
+    t6 = t7 + t10;
+    t9 = t3 + t17;
+    t14 = t2 + t1;
+    t11 = t18 - t4;
+    t0 = t7 - t10;
+    t5 = t3 - t17;
+    t16 = t2 - t1;
+    t13 = t8 + t9;
+    t12 = t6 + t14;
+    t18 = t8 - t9;
+    t4 = C0 * t18;
+    t7 = t6 - t14;
+    t10 = C0 * t7;
+    t3 = C1 * t13;
+    t17 = t15 - t3;
+    t2 = C1 * t12;
+    t1 = t19 - t2;
+    t8 = t17 + t4;
+    t9 = t1 + t10;
+    t18 = t17 - t4;
+    t6 = t1 - t10;
+    t14 = C2 * t11;
+    t7 = C3 * t5;
+    t3 = t14 + t7;
+    t2 = C2 * t0;
+    t17 = C3 * t16;
+    t4 = t2 + t17;
+    t1 = C3 * t11;
+    t10 = C2 * t5;
+    t14 = t1 - t10;
+    t7 = C3 * t0;
+    t2 = C2 * t16;
+    t17 = t7 - t2;
+    t11 = t15 + t13;
+    t5 = t19 + t12;
+    t1 = t8 + t4;
+    t10 = t9 - t3;
+    t0 = t18 + t17;
+    t16 = t6 - t14;
+    t7 = t18 - t17;
+    t2 = t6 + t14;
+    t15 = t8 - t4;
+    t13 = t9 + t3;
+    t19 = C74 * t11;
+    t12 = C75 * t5;
+    t18 = t19 + t12;
+    y[0] = 0;
+    t17 = (-0.07907521403597356) * t18;
+    y[319] = t17;
+    t6 = (-C75) * t11;
+    t14 = C74 * t5;
+    t8 = t6 + t14;
+    t4 = 0.07903867319482309 * t8;
+    y[320] = t4;
+    t9 = (-2.3884315505491365e-05) * t8;
+    y[639] = t9;
+    t3 = (-C76) * t1;
+    t19 = (-C77) * t10;
+    t12 = t3 + t19;
+    t18 = 0.08090535634060078 * t12;
+    y[447] = t18;
+    t17 = 0.026264380520193423 * t12;
+    y[512] = t17;
+    t11 = C77 * t1;
+    t5 = (-C76) * t10;
+    t6 = t11 + t5;
+    t14 = 0.0028523908353459116 * t6;
+    y[127] = t14;
+    t4 = (-0.07632478244965488) * t6;
+    y[192] = t4;
+    t8 = C78 * t0;
+    t9 = C79 * t16;
+    t3 = t8 + t9;
+    y[64] = 0;
+    t19 = (-0.07996398566998175) * t3;
+    y[255] = t19;
+    t18 = (-C79) * t0;
+    t12 = C78 * t16;
+    t17 = t18 + t12;
+    t1 = 0.07816018608419902 * t17;
+    y[384] = t1;
+    t10 = (-0.008678366232986501) * t17;
+    y[575] = t10;
+    t11 = (-C80) * t7;
+    t5 = (-C81) * t2;
+    t14 = t11 + t5;
+    t6 = 0.07816870410371515 * t14;
+    y[383] = t6;
+    t4 = (-0.008633709146849975) * t14;
+    y[576] = t4;
+    t8 = C81 * t7;
+    t9 = (-C80) * t2;
+    t3 = t8 + t9;
+    y[63] = 0;
+    t19 = (-0.07995527201918852) * t3;
+    y[256] = t19;
+    t0 = C82 * t15;
+    t16 = C83 * t13;
+    t18 = t0 + t16;
+    t12 = 0.0034008064960340165 * t18;
+    y[128] = t12;
+    t1 = (-0.07600568836960063) * t18;
+    y[191] = t1;
+    t17 = (-C83) * t15;
+    t10 = C82 * t13;
+    t11 = t17 + t10;
+    t5 = 0.08099677233079813 * t11;
+    y[448] = t5;
+    t6 = 0.027577153652004537 * t11;
+    y[511] = t6;
+    t14 = re[30];
+    t4 = im[30];
+    t7 = re[62];
+    t2 = im[62];
+    t8 = re[94];
+    t9 = im[94];
+    t3 = re[126];
+    t19 = im[126];
+    t0 = re[158];
+    t16 = im[158];
+    t12 = t7 + t0;
+    t18 = t2 + t16;
+    t1 = t8 + t3;
+    t15 = t9 + t19;
+    t13 = t7 - t0;
+    t17 = t2 - t16;
+    t10 = t8 - t3;
+    t5 = t9 - t19;
+    t11 = t12 + t1;
+    t6 = t18 + t15;
+    t7 = t12 - t1;
+    t0 = C0 * t7;
+    t2 = t18 - t15;
+    t16 = C0 * t2;
+    t8 = C1 * t11;
+    t3 = t14 - t8;
+    t9 = C1 * t6;
+    t19 = t4 - t9;
+    t12 = t3 + t0;
+    t1 = t19 + t16;
+    t7 = t3 - t0;
+    t18 = t19 - t16;
+    t15 = C2 * t13;
+    t2 = C3 * t10;
+    t8 = t15 + t2;
+    t9 = C2 * t17;
+    t3 = C3 * t5;
+    t0 = t9 + t3;
+    t19 = C3 * t13;
+    t16 = C2 * t10;
+    t15 = t19 - t16;
+    t2 = C3 * t17;
+    t9 = C2 * t5;
+    t3 = t2 - t9;
+    t13 = t14 + t11;
+    t10 = t4 + t6;
+    t19 = t12 + t0;
+    t16 = t1 - t8;
+    t17 = t7 + t3;
+    t5 = t18 - t15;
+    t2 = t7 - t3;
+    t9 = t18 + t15;
+    t14 = t12 - t0;
+    t11 = t1 + t8;
+    t4 = C84 * t13;
+    t6 = C85 * t10;
+    t7 = t4 + t6;
+    t3 = 0.004675594754473637 * t7;
+    y[130] = t3;
+    t18 = (-0.07528092638447868) * t7;
+    y[189] = t18;
+    t15 = (-C85) * t13;
+    t12 = C84 * t10;
+    t0 = t15 + t12;
+    t1 = 0.08114318050945657 * t0;
+    y[450] = t1;
+    t8 = 0.03025630083312543 * t0;
+    y[509] = t8;
+    t4 = C86 * t19;
+    t6 = C87 * t16;
+    t3 = t4 + t6;
+    y[2] = 0;
+    t7 = (-0.07914801620130785) * t3;
+    y[317] = t7;
+    t18 = (-C87) * t19;
+    t13 = C86 * t16;
+    t10 = t18 + t13;
+    t15 = 0.07896597160570053 * t10;
+    y[322] = t15;
+    t12 = (-6.614302176500143e-05) * t10;
+    y[637] = t12;
+    t1 = (-C88) * t17;
+    t0 = (-C89) * t5;
+    t8 = t1 + t0;
+    t4 = 0.08069566222116688 * t8;
+    y[445] = t4;
+    t6 = 0.02369830053931917 * t8;
+    y[514] = t6;
+    t3 = C89 * t17;
+    t7 = (-C88) * t5;
+    t19 = t3 + t7;
+    t16 = 0.0019240266974218081 * t19;
+    y[125] = t16;
+    t18 = (-0.07688646039082105) * t19;
+    y[194] = t18;
+    t13 = C90 * t2;
+    t15 = C91 * t9;
+    t10 = t13 + t15;
+    y[66] = 0;
+    t12 = (-0.07998170347656396) * t10;
+    y[253] = t12;
+    t1 = (-C91) * t2;
+    t0 = C90 * t9;
+    t4 = t1 + t0;
+    t8 = 0.07814287178606243 * t4;
+    y[386] = t8;
+    t6 = (-0.008730035710984) * t4;
+    y[573] = t6;
+    t17 = (-C92) * t14;
+    t5 = (-C93) * t11;
+    t3 = t17 + t5;
+    t7 = 0.07818529382762993 * t3;
+    y[381] = t7;
+    t16 = (-0.008508545900253557) * t3;
+    y[578] = t16;
+    t19 = C93 * t14;
+    t18 = (-C92) * t11;
+    t13 = t19 + t18;
+    y[61] = 0;
+    t15 = (-0.07993830673296405) * t13;
+    y[258] = t15;
+    t10 = re[50];
+    t12 = im[50];
+    t2 = re[82];
+    t9 = im[82];
+    t1 = re[114];
+    t0 = im[114];
+    t8 = re[146];
+    t4 = im[146];
+    t6 = re[18];
+    t17 = im[18];
+    t5 = t2 + t6;
+    t7 = t9 + t17;
+    t3 = t1 + t8;
+    t16 = t0 + t4;
+    t14 = t2 - t6;
+    t11 = t9 - t17;
+    t19 = t1 - t8;
+    t18 = t0 - t4;
+    t13 = t5 + t3;
+    t15 = t7 + t16;
+    t2 = t5 - t3;
+    t6 = C0 * t2;
+    t9 = t7 - t16;
+    t17 = C0 * t9;
+    t1 = C1 * t13;
+    t8 = t10 - t1;
+    t0 = C1 * t15;
+    t4 = t12 - t0;
+    t5 = t8 + t6;
+    t3 = t4 + t17;
+    t2 = t8 - t6;
+    t7 = t4 - t17;
+    t16 = C2 * t14;
+    t9 = C3 * t19;
+    t1 = t16 + t9;
+    t0 = C2 * t11;
+    t8 = C3 * t18;
+    t6 = t0 + t8;
+    t4 = C3 * t14;
+    t17 = C2 * t19;
+    t16 = t4 - t17;
+    t9 = C3 * t11;
+    t0 = C2 * t18;
+    t8 = t9 - t0;
+    t14 = t10 + t13;
+    t19 = t12 + t15;
+    t4 = t5 + t6;
+    t17 = t3 - t1;
+    t11 = t2 + t8;
+    t18 = t7 - t16;
+    t9 = t2 - t8;
+    t0 = t7 + t16;
+    t10 = t5 - t6;
+    t13 = t3 + t1;
+    t12 = (-C94) * t14;
+    t15 = (-C95) * t19;
+    t2 = t12 + t15;
+    t8 = 0.07820083419064082 * t2;
+    y[379] = t8;
+    t7 = (-0.008337979459723047) * t2;
+    y[580] = t7;
+    t16 = C95 * t14;
+    t5 = (-C94) * t19;
+    t6 = t16 + t5;
+    y[59] = 0;
+    t3 = (-0.07992242109289432) * t6;
+    y[260] = t3;
+    t1 = C96 * t4;
+    t12 = C97 * t17;
+    t15 = t1 + t12;
+    t8 = 0.006194595274505857 * t15;
+    y[132] = t8;
+    t2 = (-0.07442739657708623) * t15;
+    y[187] = t2;
+    t7 = (-C97) * t4;
+    t14 = C96 * t17;
+    t19 = t7 + t14;
+    t16 = 0.08122810178898779 * t19;
+    y[452] = t16;
+    t5 = 0.03299712828508903 * t19;
+    y[507] = t5;
+    t6 = C98 * t11;
+    t3 = C99 * t18;
+    t1 = t6 + t3;
+    y[4] = 0;
+    t12 = (-0.07921983784734443) * t1;
+    y[315] = t12;
+    t8 = (-C99) * t11;
+    t15 = C98 * t18;
+    t2 = t8 + t15;
+    t4 = 0.07889438011781426 * t2;
+    y[324] = t4;
+    t17 = (-0.00011625267447388165) * t2;
+    y[635] = t17;
+    t7 = (-C100) * t9;
+    t14 = (-C101) * t0;
+    t16 = t7 + t14;
+    t19 = 0.08046140220484606 * t16;
+    y[443] = t19;
+    t5 = 0.021218579288406595 * t16;
+    y[516] = t5;
+    t6 = C101 * t9;
+    t3 = (-C100) * t0;
+    t1 = t6 + t3;
+    t12 = 0.0012061797976135472 * t1;
+    y[123] = t12;
+    t11 = (-0.07735891256880652) * t1;
+    y[196] = t11;
+    t18 = C102 * t10;
+    t8 = C103 * t13;
+    t15 = t18 + t8;
+    y[68] = 0;
+    t4 = (-0.07999924206306375) * t15;
+    y[251] = t4;
+    t2 = (-C103) * t10;
+    t17 = C102 * t13;
+    t7 = t2 + t17;
+    t14 = 0.07812574017980194 * t7;
+    y[388] = t14;
+    t19 = (-0.008730111522164116) * t7;
+    y[571] = t19;
+    t16 = re[70];
+    t5 = im[70];
+    t9 = re[102];
+    t0 = im[102];
+    t6 = re[134];
+    t3 = im[134];
+    t12 = re[6];
+    t1 = im[6];
+    t11 = re[38];
+    t18 = im[38];
+    t8 = t9 + t11;
+    t15 = t0 + t18;
+    t4 = t6 + t12;
+    t10 = t3 + t1;
+    t13 = t9 - t11;
+    t2 = t0 - t18;
+    t17 = t6 - t12;
+    t14 = t3 - t1;
+    t7 = t8 + t4;
+    t19 = t15 + t10;
+    t9 = t8 - t4;
+    t11 = C0 * t9;
+    t0 = t15 - t10;
+    t18 = C0 * t0;
+    t6 = C1 * t7;
+    t12 = t16 - t6;
+    t3 = C1 * t19;
+    t1 = t5 - t3;
+    t8 = t12 + t11;
+    t4 = t1 + t18;
+    t9 = t12 - t11;
+    t15 = t1 - t18;
+    t10 = C2 * t13;
+    t0 = C3 * t17;
+    t6 = t10 + t0;
+    t3 = C2 * t2;
+    t12 = C3 * t14;
+    t11 = t3 + t12;
+    t1 = C3 * t13;
+    t18 = C2 * t17;
+    t10 = t1 - t18;
+    t0 = C3 * t2;
+    t3 = C2 * t14;
+    t12 = t0 - t3;
+    t13 = t16 + t7;
+    t17 = t5 + t19;
+    t1 = t8 + t11;
+    t18 = t4 - t6;
+    t2 = t9 + t12;
+    t14 = t15 - t10;
+    t0 = t9 - t12;
+    t3 = t15 + t10;
+    t16 = t8 - t11;
+    t7 = t4 + t6;
+    t5 = C104 * t13;
+    t19 = C105 * t17;
+    t9 = t5 + t19;
+    y[70] = 0;
+    t12 = (-0.0800160723060249) * t9;
+    y[249] = t12;
+    t15 = (-C105) * t13;
+    t10 = C104 * t17;
+    t8 = t15 + t10;
+    t11 = 0.07810930754132253 * t8;
+    y[390] = t11;
+    t4 = (-0.00867600412008019) * t8;
+    y[569] = t4;
+    t6 = (-C106) * t1;
+    t5 = (-C107) * t18;
+    t19 = t6 + t5;
+    t9 = 0.07821504215293063 * t19;
+    y[377] = t9;
+    t12 = (-0.008125006300371175) * t19;
+    y[582] = t12;
+    t13 = C107 * t1;
+    t17 = (-C106) * t18;
+    t15 = t13 + t17;
+    y[57] = 0;
+    t10 = (-0.07990790298085675) * t15;
+    y[262] = t10;
+    t11 = C108 * t2;
+    t8 = C109 * t14;
+    t4 = t11 + t8;
+    t6 = 0.007961705785935923 * t4;
+    y[134] = t6;
+    t5 = (-0.07342959009395307) * t4;
+    y[185] = t5;
+    t9 = (-C109) * t2;
+    t19 = C108 * t14;
+    t12 = t9 + t19;
+    t1 = 0.08123517600333653 * t12;
+    y[454] = t1;
+    t18 = 0.035788100254620786 * t12;
+    y[505] = t18;
+    t13 = C110 * t0;
+    t17 = C111 * t3;
+    t15 = t13 + t17;
+    y[6] = 0;
+    t10 = (-0.07928993254082312) * t15;
+    y[313] = t10;
+    t11 = (-C111) * t0;
+    t8 = C110 * t3;
+    t6 = t11 + t8;
+    t4 = 0.07882463510461603 * t6;
+    y[326] = t4;
+    t5 = (-0.00018493729943036235) * t6;
+    y[633] = t5;
+    t2 = (-C112) * t16;
+    t14 = (-C113) * t7;
+    t9 = t2 + t14;
+    t19 = 0.08021633619237747 * t9;
+    y[441] = t19;
+    t1 = 0.01883263011236303 * t9;
+    y[518] = t1;
+    t12 = C113 * t16;
+    t18 = (-C112) * t7;
+    t13 = t12 + t18;
+    t17 = 0.000666694127532328 * t13;
+    y[121] = t17;
+    t15 = (-0.07775778216969736) * t13;
+    y[198] = t15;
+    t10 = re[90];
+    t0 = im[90];
+    t3 = re[122];
+    t11 = im[122];
+    t8 = re[154];
+    t4 = im[154];
+    t6 = re[26];
+    t5 = im[26];
+    t2 = re[58];
+    t14 = im[58];
+    t19 = t3 + t2;
+    t9 = t11 + t14;
+    t1 = t8 + t6;
+    t16 = t4 + t5;
+    t7 = t3 - t2;
+    t12 = t11 - t14;
+    t18 = t8 - t6;
+    t17 = t4 - t5;
+    t13 = t19 + t1;
+    t15 = t9 + t16;
+    t3 = t19 - t1;
+    t2 = C0 * t3;
+    t11 = t9 - t16;
+    t14 = C0 * t11;
+    t8 = C1 * t13;
+    t6 = t10 - t8;
+    t4 = C1 * t15;
+    t5 = t0 - t4;
+    t19 = t6 + t2;
+    t1 = t5 + t14;
+    t3 = t6 - t2;
+    t9 = t5 - t14;
+    t16 = C2 * t7;
+    t11 = C3 * t18;
+    t8 = t16 + t11;
+    t4 = C2 * t12;
+    t6 = C3 * t17;
+    t2 = t4 + t6;
+    t5 = C3 * t7;
+    t14 = C2 * t18;
+    t16 = t5 - t14;
+    t11 = C3 * t12;
+    t4 = C2 * t17;
+    t6 = t11 - t4;
+    t7 = t10 + t13;
+    t18 = t0 + t15;
+    t5 = t19 + t2;
+    t14 = t1 - t8;
+    t12 = t3 + t6;
+    t17 = t9 - t16;
+    t11 = t3 - t6;
+    t4 = t9 + t16;
+    t10 = t19 - t2;
+    t13 = t1 + t8;
+    t0 = (-C114) * t7;
+    t15 = (-C115) * t18;
+    t3 = t0 + t15;
+    t6 = 0.08000151439407795 * t3;
+    y[439] = t6;
+    t9 = 0.016546326981442205 * t3;
+    y[520] = t9;
+    t16 = C115 * t7;
+    t19 = (-C114) * t18;
+    t2 = t16 + t19;
+    y[119] = 0;
+    t1 = (-0.07812352112752824) * t2;
+    y[200] = t1;
+    t8 = C116 * t5;
+    t0 = C117 * t14;
+    t15 = t8 + t0;
+    y[72] = 0;
+    t6 = (-0.0800315207318005) * t15;
+    y[247] = t6;
+    t3 = (-C117) * t5;
+    t9 = C116 * t14;
+    t7 = t3 + t9;
+    t18 = 0.07809423015894994 * t7;
+    y[392] = t18;
+    t16 = (-0.008565561378246727) * t7;
+    y[567] = t16;
+    t19 = (-C118) * t12;
+    t2 = (-C119) * t17;
+    t1 = t19 + t2;
+    t8 = 0.07822760983345828 * t1;
+    y[375] = t8;
+    t0 = (-0.007872372680343373) * t1;
+    y[584] = t0;
+    t15 = C119 * t12;
+    t6 = (-C118) * t17;
+    t5 = t15 + t6;
+    y[55] = 0;
+    t14 = (-0.0798950653523208) * t5;
+    y[264] = t14;
+    t3 = C120 * t11;
+    t9 = C121 * t4;
+    t18 = t3 + t9;
+    t7 = 0.009974119378923667 * t18;
+    y[136] = t7;
+    t16 = (-0.07227303597195224) * t18;
+    y[183] = t16;
+    t19 = (-C121) * t11;
+    t2 = C120 * t4;
+    t8 = t19 + t2;
+    t1 = 0.08114841980269193 * t8;
+    y[456] = t1;
+    t0 = 0.038615673414421424 * t8;
+    y[503] = t0;
+    t12 = C122 * t10;
+    t17 = C123 * t13;
+    t15 = t12 + t17;
+    y[8] = 0;
+    t6 = (-0.07935746607752191) * t15;
+    y[311] = t6;
+    t5 = (-C123) * t10;
+    t14 = C122 * t13;
+    t3 = t5 + t14;
+    t9 = 0.07875755500931148 * t3;
+    y[328] = t9;
+    t7 = (-0.00027482219768941077) * t3;
+    y[631] = t7;
+    t18 = re[110];
+    t16 = im[110];
+    t11 = re[142];
+    t4 = im[142];
+    t19 = re[14];
+    t2 = im[14];
+    t1 = re[46];
+    t8 = im[46];
+    t0 = re[78];
+    t12 = im[78];
+    t17 = t11 + t0;
+    t15 = t4 + t12;
+    t6 = t19 + t1;
+    t10 = t2 + t8;
+    t13 = t11 - t0;
+    t5 = t4 - t12;
+    t14 = t19 - t1;
+    t9 = t2 - t8;
+    t3 = t17 + t6;
+    t7 = t15 + t10;
+    t11 = t17 - t6;
+    t0 = C0 * t11;
+    t4 = t15 - t10;
+    t12 = C0 * t4;
+    t19 = C1 * t3;
+    t1 = t18 - t19;
+    t2 = C1 * t7;
+    t8 = t16 - t2;
+    t17 = t1 + t0;
+    t6 = t8 + t12;
+    t11 = t1 - t0;
+    t15 = t8 - t12;
+    t10 = C2 * t13;
+    t4 = C3 * t14;
+    t19 = t10 + t4;
+    t2 = C2 * t5;
+    t1 = C3 * t9;
+    t0 = t2 + t1;
+    t8 = C3 * t13;
+    t12 = C2 * t14;
+    t10 = t8 - t12;
+    t4 = C3 * t5;
+    t2 = C2 * t9;
+    t1 = t4 - t2;
+    t13 = t18 + t3;
+    t14 = t16 + t7;
+    t8 = t17 + t0;
+    t12 = t6 - t19;
+    t5 = t11 + t1;
+    t9 = t15 - t10;
+    t4 = t11 - t1;
+    t2 = t15 + t10;
+    t18 = t17 - t0;
+    t3 = t6 + t19;
+    t16 = C124 * t13;
+    t7 = C125 * t14;
+    t11 = t16 + t7;
+    y[10] = 0;
+    t1 = (-0.07942181984972771) * t11;
+    y[309] = t1;
+    t15 = (-C125) * t13;
+    t10 = C124 * t14;
+    t17 = t15 + t10;
+    t0 = 0.0786937394764498 * t17;
+    y[330] = t0;
+    t6 = (-0.000388530381880178) * t17;
+    y[629] = t6;
+    t19 = (-C126) * t8;
+    t16 = (-C127) * t12;
+    t7 = t19 + t16;
+    t11 = 0.07973350773965149 * t7;
+    y[437] = t11;
+    t1 = 0.01436423434214279 * t7;
+    y[522] = t1;
+    t13 = C127 * t8;
+    t14 = (-C126) * t12;
+    t15 = t13 + t14;
+    y[117] = 0;
+    t10 = (-0.0783861161659626) * t15;
+    y[202] = t10;
+    t0 = C128 * t5;
+    t17 = C129 * t9;
+    t6 = t0 + t17;
+    y[74] = 0;
+    t19 = (-0.08004498652028395) * t6;
+    y[245] = t19;
+    t16 = (-C129) * t5;
+    t11 = C128 * t9;
+    t7 = t16 + t11;
+    t1 = 0.0780810925418322 * t7;
+    y[394] = t1;
+    t8 = (-0.008396876155933708) * t7;
+    y[565] = t8;
+    t12 = (-C130) * t4;
+    t13 = (-C131) * t2;
+    t14 = t12 + t13;
+    t15 = 0.07823844498003954 * t14;
+    y[373] = t15;
+    t10 = (-0.0075840412882783445) * t14;
+    y[586] = t10;
+    t0 = C131 * t4;
+    t17 = (-C130) * t2;
+    t6 = t0 + t17;
+    y[53] = 0;
+    t19 = (-0.07988400078240977) * t6;
+    y[266] = t19;
+    t5 = C132 * t18;
+    t9 = C133 * t3;
+    t16 = t5 + t9;
+    t11 = 0.012223248822784803 * t16;
+    y[138] = t11;
+    t1 = (-0.0709448429254907) * t16;
+    y[181] = t1;
+    t7 = (-C133) * t18;
+    t8 = C132 * t3;
+    t12 = t7 + t8;
+    t13 = 0.08095243610523627 * t12;
+    y[458] = t13;
+    t15 = 0.04146541917181707 * t12;
+    y[501] = t15;
+    t14 = re[130];
+    t10 = im[130];
+    t4 = re[2];
+    t2 = im[2];
+    t0 = re[34];
+    t17 = im[34];
+    t6 = re[66];
+    t19 = im[66];
+    t5 = re[98];
+    t9 = im[98];
+    t11 = t4 + t5;
+    t16 = t2 + t9;
+    t1 = t0 + t6;
+    t18 = t17 + t19;
+    t3 = t4 - t5;
+    t7 = t2 - t9;
+    t8 = t0 - t6;
+    t13 = t17 - t19;
+    t12 = t11 + t1;
+    t15 = t16 + t18;
+    t4 = t11 - t1;
+    t5 = C0 * t4;
+    t2 = t16 - t18;
+    t9 = C0 * t2;
+    t0 = C1 * t12;
+    t6 = t14 - t0;
+    t17 = C1 * t15;
+    t19 = t10 - t17;
+    t11 = t6 + t5;
+    t1 = t19 + t9;
+    t4 = t6 - t5;
+    t16 = t19 - t9;
+    t18 = C2 * t3;
+    t2 = C3 * t8;
+    t0 = t18 + t2;
+    t17 = C2 * t7;
+    t6 = C3 * t13;
+    t5 = t17 + t6;
+    t19 = C3 * t3;
+    t9 = C2 * t8;
+    t18 = t19 - t9;
+    t2 = C3 * t7;
+    t17 = C2 * t13;
+    t6 = t2 - t17;
+    t3 = t14 + t12;
+    t8 = t10 + t15;
+    t19 = t11 + t5;
+    t9 = t1 - t0;
+    t7 = t4 + t6;
+    t13 = t16 - t18;
+    t2 = t4 - t6;
+    t17 = t16 + t18;
+    t14 = t11 - t5;
+    t12 = t1 + t0;
+    t10 = C134 * t3;
+    t15 = C135 * t8;
+    t4 = t10 + t15;
+    t6 = 0.014694708331038423 * t4;
+    y[140] = t6;
+    t16 = (-0.06943487281706444) * t4;
+    y[179] = t16;
+    t18 = (-C135) * t3;
+    t11 = C134 * t8;
+    t5 = t18 + t11;
+    t1 = 0.08063245485341218 * t5;
+    y[460] = t1;
+    t0 = 0.04432178833723134 * t5;
+    y[499] = t0;
+    t10 = C136 * t19;
+    t15 = C137 * t9;
+    t6 = t10 + t15;
+    y[12] = 0;
+    t4 = (-0.07948231754482189) * t6;
+    y[307] = t4;
+    t16 = (-C137) * t19;
+    t3 = C136 * t9;
+    t8 = t16 + t3;
+    t18 = 0.07863384200486458 * t8;
+    y[332] = t18;
+    t11 = (-0.0005281496518064612) * t8;
+    y[627] = t11;
+    t1 = (-C138) * t7;
+    t5 = (-C139) * t13;
+    t0 = t1 + t5;
+    t10 = 0.07949560986070783 * t0;
+    y[435] = t10;
+    t15 = 0.012290071369447096 * t0;
+    y[524] = t15;
+    t6 = C139 * t7;
+    t4 = (-C138) * t13;
+    t19 = t6 + t4;
+    y[115] = 0;
+    t9 = (-0.0786206937836095) * t19;
+    y[204] = t9;
+    t16 = C140 * t2;
+    t3 = C141 * t17;
+    t18 = t16 + t3;
+    y[76] = 0;
+    t8 = (-0.0800556911882454) * t18;
+    y[243] = t8;
+    t11 = (-C141) * t2;
+    t1 = C140 * t17;
+    t5 = t11 + t1;
+    t10 = 0.07807065190785197 * t5;
+    y[396] = t10;
+    t0 = (-0.008167628783349251) * t5;
+    y[563] = t0;
+    t15 = (-C142) * t14;
+    t7 = (-C143) * t12;
+    t13 = t15 + t7;
+    t6 = 0.07824745321283438 * t13;
+    y[371] = t6;
+    t4 = (-0.007263407164054297) * t13;
+    y[588] = t4;
+    t19 = C143 * t14;
+    t9 = (-C142) * t12;
+    t16 = t19 + t9;
+    y[51] = 0;
+    t3 = (-0.07987480414218592) * t16;
+    y[268] = t3;
+    t18 = re[150];
+    t8 = im[150];
+    t2 = re[22];
+    t17 = im[22];
+    t11 = re[54];
+    t1 = im[54];
+    t10 = re[86];
+    t5 = im[86];
+    t0 = re[118];
+    t15 = im[118];
+    t7 = t2 + t0;
+    t6 = t17 + t15;
+    t13 = t11 + t10;
+    t4 = t1 + t5;
+    t14 = t2 - t0;
+    t12 = t17 - t15;
+    t19 = t11 - t10;
+    t9 = t1 - t5;
+    t16 = t7 + t13;
+    t3 = t6 + t4;
+    t2 = t7 - t13;
+    t0 = C0 * t2;
+    t17 = t6 - t4;
+    t15 = C0 * t17;
+    t11 = C1 * t16;
+    t10 = t18 - t11;
+    t1 = C1 * t3;
+    t5 = t8 - t1;
+    t7 = t10 + t0;
+    t13 = t5 + t15;
+    t2 = t10 - t0;
+    t6 = t5 - t15;
+    t4 = C2 * t14;
+    t17 = C3 * t19;
+    t11 = t4 + t17;
+    t1 = C2 * t12;
+    t10 = C3 * t9;
+    t0 = t1 + t10;
+    t5 = C3 * t14;
+    t15 = C2 * t19;
+    t4 = t5 - t15;
+    t17 = C3 * t12;
+    t1 = C2 * t9;
+    t10 = t17 - t1;
+    t14 = t18 + t16;
+    t19 = t8 + t3;
+    t5 = t7 + t0;
+    t15 = t13 - t11;
+    t12 = t2 + t10;
+    t9 = t6 - t4;
+    t17 = t2 - t10;
+    t1 = t6 + t4;
+    t18 = t7 - t0;
+    t16 = t13 + t11;
+    t8 = (-C144) * t14;
+    t3 = (-C145) * t19;
+    t2 = t8 + t3;
+    t10 = 0.07825475177229257 * t2;
+    y[369] = t10;
+    t6 = (-0.006914619827194874) * t2;
+    y[590] = t6;
+    t4 = C145 * t14;
+    t7 = (-C144) * t19;
+    t0 = t4 + t7;
+    y[49] = 0;
+    t13 = (-0.07986735448585142) * t0;
+    y[270] = t13;
+    t11 = C146 * t5;
+    t8 = C147 * t15;
+    t3 = t11 + t8;
+    t10 = 0.017369094907915213 * t3;
+    y[142] = t10;
+    t2 = (-0.06773575540655445) * t3;
+    y[177] = t2;
+    t6 = (-C147) * t5;
+    t14 = C146 * t15;
+    t19 = t6 + t14;
+    t4 = 0.08017500732004093 * t19;
+    y[462] = t4;
+    t7 = 0.0471691425946232 * t19;
+    y[497] = t7;
+    t0 = C148 * t12;
+    t13 = C149 * t9;
+    t11 = t0 + t13;
+    y[14] = 0;
+    t8 = (-0.07953851768496963) * t11;
+    y[305] = t8;
+    t10 = (-C149) * t12;
+    t3 = C148 * t9;
+    t2 = t10 + t3;
+    t5 = 0.07857828108834697 * t2;
+    y[334] = t5;
+    t15 = (-0.0006954450000195269) * t2;
+    y[625] = t15;
+    t6 = (-C150) * t17;
+    t14 = (-C151) * t1;
+    t4 = t6 + t14;
+    t19 = 0.07928361901336299 * t4;
+    y[433] = t19;
+    t7 = 0.010325635567219847 * t4;
+    y[526] = t7;
+    t0 = C151 * t17;
+    t13 = (-C150) * t1;
+    t11 = t0 + t13;
+    y[113] = 0;
+    t8 = (-0.07883091208218668) * t11;
+    y[206] = t8;
+    t12 = C152 * t18;
+    t9 = C153 * t16;
+    t10 = t12 + t9;
+    y[78] = 0;
+    t3 = (-0.08006298575141249) * t10;
+    y[241] = t3;
+    t5 = (-C153) * t18;
+    t2 = C152 * t16;
+    t15 = t5 + t2;
+    t6 = 0.07806353886683189 * t15;
+    y[398] = t6;
+    t14 = (-0.00787565686562428) * t15;
+    y[561] = t14;
+    t19 = re[15];
+    t4 = im[15];
+    t7 = re[47];
+    t17 = im[47];
+    t1 = re[79];
+    t0 = im[79];
+    t13 = re[111];
+    t11 = im[111];
+    t8 = re[143];
+    t12 = im[143];
+    t9 = t7 + t8;
+    t10 = t17 + t12;
+    t3 = t1 + t13;
+    t18 = t0 + t11;
+    t16 = t7 - t8;
+    t5 = t17 - t12;
+    t2 = t1 - t13;
+    t6 = t0 - t11;
+    t15 = t9 + t3;
+    t14 = t10 + t18;
+    t7 = t9 - t3;
+    t8 = C0 * t7;
+    t17 = t10 - t18;
+    t12 = C0 * t17;
+    t1 = C1 * t15;
+    t13 = t19 - t1;
+    t0 = C1 * t14;
+    t11 = t4 - t0;
+    t9 = t13 + t8;
+    t3 = t11 + t12;
+    t7 = t13 - t8;
+    t10 = t11 - t12;
+    t18 = C2 * t16;
+    t17 = C3 * t2;
+    t1 = t18 + t17;
+    t0 = C2 * t5;
+    t13 = C3 * t6;
+    t8 = t0 + t13;
+    t11 = C3 * t16;
+    t12 = C2 * t2;
+    t18 = t11 - t12;
+    t17 = C3 * t5;
+    t0 = C2 * t6;
+    t13 = t17 - t0;
+    t16 = t19 + t15;
+    t2 = t4 + t14;
+    t11 = t9 + t8;
+    t12 = t3 - t1;
+    t5 = t7 + t13;
+    t6 = t10 - t18;
+    t17 = t7 - t13;
+    t0 = t10 + t18;
+    t19 = t9 - t8;
+    t15 = t3 + t1;
+    t4 = C154 * t16;
+    t14 = C155 * t2;
+    t7 = t4 + t14;
+    y[80] = 0;
+    t13 = (-0.08006610833439101) * t7;
+    y[239] = t13;
+    t10 = (-C155) * t16;
+    t18 = C154 * t2;
+    t9 = t10 + t18;
+    t8 = 0.07806049438418153 * t9;
+    y[400] = t8;
+    t3 = (-0.007518887211504584) * t9;
+    y[559] = t3;
+    t1 = (-C156) * t11;
+    t4 = (-C157) * t12;
+    t14 = t1 + t4;
+    t7 = 0.07826047597585467 * t14;
+    y[367] = t7;
+    t13 = (-0.006541902249447796) * t14;
+    y[592] = t13;
+    t16 = C157 * t11;
+    t2 = (-C156) * t12;
+    t10 = t16 + t2;
+    y[47] = 0;
+    t18 = (-0.0798615127504244) * t10;
+    y[272] = t18;
+    t8 = C158 * t5;
+    t9 = C159 * t6;
+    t3 = t8 + t9;
+    t1 = 0.020223007836952297 * t3;
+    y[144] = t1;
+    t4 = (-0.06584291214118858) * t3;
+    y[175] = t4;
+    t7 = (-C159) * t5;
+    t14 = C158 * t6;
+    t13 = t7 + t14;
+    t11 = 0.07956878319930895 * t13;
+    y[464] = t11;
+    t12 = 0.04999056553691067 * t13;
+    y[495] = t12;
+    t16 = C160 * t17;
+    t2 = C161 * t0;
+    t10 = t16 + t2;
+    y[16] = 0;
+    t18 = (-0.07958997721867218) * t10;
+    y[303] = t18;
+    t8 = (-C161) * t17;
+    t9 = C160 * t0;
+    t1 = t8 + t9;
+    t3 = 0.07852747567483565 * t1;
+    y[336] = t3;
+    t4 = (-0.0008914256102028861) * t1;
+    y[623] = t4;
+    t5 = (-C162) * t19;
+    t6 = (-C163) * t15;
+    t7 = t5 + t6;
+    t14 = 0.07909560579994807 * t7;
+    y[431] = t14;
+    t11 = 0.00847214329494768 * t7;
+    y[528] = t11;
+    t13 = C163 * t19;
+    t12 = (-C162) * t15;
+    t16 = t13 + t12;
+    y[111] = 0;
+    t2 = (-0.07901829610873405) * t16;
+    y[208] = t2;
+}
+
+/**
+ *  Part 5 of ApplyWindowedIMDCT_W10_320().
+ * 
+ *  @param {Number[]} X 
+ *    - The input block (320 points).
+ *  @param {Number[]} y 
+ *    - The array that would contain the output block (640 points).
+ *  @param {Number[]} re 
+ *    - The scratch buffer (real part, 160 points).
+ *  @param {Number[]} im 
+ *    - The scratch buffer (imaginary part, 160 points).
+ */
+function ApplyWindowedIMDCT_W10_320_Part5(X, y, re, im) {
+    let t0, t1, t10, t11, t12, t13, t14, t15, t16, t17, t18, t19, t2, t3, t4, t5, t6, t7, t8, t9;
+    const C0 = 0.5590169943749475;
+    const C1 = 0.25;
+    const C2 = 0.9510565162951535;
+    const C3 = 0.5877852522924731;
+    const C4 = 0.969431969010818;
+    const C5 = 0.24536026055538934;
+    const C6 = 0.37131719395183754;
+    const C7 = 0.9285060804732156;
+    const C8 = 0.8461641009766995;
+    const C9 = 0.5329224279557898;
+    const C10 = 0.06621947867363034;
+    const C11 = 0.9978050814884601;
+    const C12 = 0.6400677951670226;
+    const C13 = 0.7683184350189877;
+    const C14 = 0.6324941222046724;
+    const C15 = 0.7745651588966166;
+    const C16 = 0.9669764710448521;
+    const C17 = 0.25486565960451457;
+    const C18 = 0.36218385909135087;
+    const C19 = 0.9321066742673269;
+    const C20 = 0.8408914537909229;
+    const C21 = 0.5412038090603096;
+    const C22 = 0.05642051636683749;
+    const C23 = 0.998407093991674;
+    const C24 = 0.04661611613324671;
+    const C25 = 0.9989128779411404;
+    const C26 = 0.6248594881423863;
+    const C27 = 0.7807372285720945;
+    const C28 = 0.9644277738739964;
+    const C29 = 0.264346494170904;
+    const C30 = 0.3530156161966958;
+    const C31 = 0.9356174296801376;
+    const C32 = 0.8355377597366458;
+    const C33 = 0.5494330278152808;
+    const C34 = 0.8301035348140438;
+    const C35 = 0.5576092910714722;
+    const C36 = 0.03680722294135883;
+    const C37 = 0.9993223845883495;
+    const C38 = 0.6171646288220856;
+    const C39 = 0.7868340491684999;
+    const C40 = 0.9617861231469886;
+    const C41 = 0.27380185047198924;
+    const C42 = 0.34381334892220483;
+    const C43 = 0.939038008337734;
+    const C44 = 0.33457794420155085;
+    const C45 = 0.9423680805576258;
+    const C46 = 0.8245893027850253;
+    const C47 = 0.5657318107836131;
+    const C48 = 0.026994782192715373;
+    const C49 = 0.9996355744641984;
+    const C50 = 0.609410285890327;
+    const C51 = 0.7928550330615742;
+    const C52 = 0.9590517734716243;
+    const C53 = 0.28323081718085014;
+    const C54 = 0.9562249883902162;
+    const C55 = 0.29263248551405047;
+    const C56 = 0.3253102921622629;
+    const C57 = 0.9456073253805213;
+    const C58 = 0.8189955951227504;
+    const C59 = 0.5737998040863485;
+    const C60 = 0.017179739630778748;
+    const C61 = 0.9998524173827948;
+    const C62 = 0.601597206726822;
+    const C63 = 0.7987995999363579;
+    const C64 = 0.5937261443724018;
+    const C65 = 0.804667176843123;
+    const C66 = 0.9533060403541939;
+    const C67 = 0.3020059493192281;
+    const C68 = 0.3160112860399338;
+    const C69 = 0.9487554306012626;
+    const C70 = 0.8133229509604061;
+    const C71 = 0.5818124933696911;
+    const C72 = 0.007363041249779567;
+    const C73 = 0.9999728924443673;
+    t10 = re[35];
+    t18 = im[35];
+    t17 = re[67];
+    t0 = im[67];
+    t8 = re[99];
+    t9 = im[99];
+    t3 = re[131];
+    t1 = im[131];
+    t4 = re[3];
+    t5 = im[3];
+    t6 = t17 + t4;
+    t14 = t0 + t5;
+    t7 = t8 + t3;
+    t11 = t9 + t1;
+    t19 = t17 - t4;
+    t15 = t0 - t5;
+    t13 = t8 - t3;
+    t12 = t9 - t1;
+    t16 = t6 + t7;
+    t2 = t14 + t11;
+    t17 = t6 - t7;
+    t4 = C0 * t17;
+    t0 = t14 - t11;
+    t5 = C0 * t0;
+    t8 = C1 * t16;
+    t3 = t10 - t8;
+    t9 = C1 * t2;
+    t1 = t18 - t9;
+    t6 = t3 + t4;
+    t7 = t1 + t5;
+    t17 = t3 - t4;
+    t14 = t1 - t5;
+    t11 = C2 * t19;
+    t0 = C3 * t13;
+    t8 = t11 + t0;
+    t9 = C2 * t15;
+    t3 = C3 * t12;
+    t4 = t9 + t3;
+    t1 = C3 * t19;
+    t5 = C2 * t13;
+    t11 = t1 - t5;
+    t0 = C3 * t15;
+    t9 = C2 * t12;
+    t3 = t0 - t9;
+    t19 = t10 + t16;
+    t13 = t18 + t2;
+    t1 = t6 + t4;
+    t5 = t7 - t8;
+    t15 = t17 + t3;
+    t12 = t14 - t11;
+    t0 = t17 - t3;
+    t9 = t14 + t11;
+    t10 = t6 - t4;
+    t16 = t7 + t8;
+    t18 = (-C4) * t19;
+    t2 = (-C5) * t13;
+    t17 = t18 + t2;
+    t3 = 0.0789296508586412 * t17;
+    y[429] = t3;
+    t14 = 0.00672971468946736 * t17;
+    y[530] = t14;
+    t11 = C5 * t19;
+    t6 = (-C4) * t13;
+    t4 = t11 + t6;
+    y[109] = 0;
+    t7 = (-0.07918443743268823) * t4;
+    y[210] = t7;
+    t8 = C6 * t1;
+    t18 = C7 * t5;
+    t2 = t8 + t18;
+    y[82] = 0;
+    t3 = (-0.08006439384135645) * t2;
+    y[237] = t3;
+    t17 = (-C7) * t1;
+    t14 = C6 * t5;
+    t19 = t17 + t14;
+    t13 = 0.07806216596586069 * t19;
+    y[402] = t13;
+    t11 = (-0.007094668922628993) * t19;
+    y[557] = t11;
+    t6 = (-C8) * t15;
+    t4 = (-C9) * t12;
+    t7 = t6 + t4;
+    t8 = 0.07826498459625951 * t7;
+    y[365] = t8;
+    t18 = (-0.006149464704131592) * t7;
+    y[594] = t18;
+    t2 = C9 * t15;
+    t3 = (-C8) * t12;
+    t1 = t2 + t3;
+    y[45] = 0;
+    t5 = (-0.07985691215862968) * t1;
+    y[274] = t5;
+    t17 = C10 * t0;
+    t14 = C11 * t9;
+    t13 = t17 + t14;
+    t19 = 0.023229600782742582 * t13;
+    y[146] = t19;
+    t11 = (-0.06375555749304516) * t13;
+    y[173] = t11;
+    t6 = (-C11) * t0;
+    t4 = C10 * t9;
+    t8 = t6 + t4;
+    t7 = 0.07880387979570969 * t8;
+    y[466] = t7;
+    t18 = 0.05276951259189433 * t8;
+    y[493] = t18;
+    t15 = C12 * t10;
+    t12 = C13 * t16;
+    t2 = t15 + t12;
+    y[18] = 0;
+    t3 = (-0.07963644616705444) * t2;
+    y[301] = t3;
+    t1 = (-C13) * t10;
+    t5 = C12 * t16;
+    t17 = t1 + t5;
+    t14 = 0.07848165382580351 * t17;
+    y[338] = t14;
+    t19 = (-0.0011166310633579017) * t17;
+    y[621] = t19;
+    t13 = re[55];
+    t11 = im[55];
+    t0 = re[87];
+    t9 = im[87];
+    t6 = re[119];
+    t4 = im[119];
+    t7 = re[151];
+    t8 = im[151];
+    t18 = re[23];
+    t15 = im[23];
+    t12 = t0 + t18;
+    t2 = t9 + t15;
+    t3 = t6 + t7;
+    t10 = t4 + t8;
+    t16 = t0 - t18;
+    t1 = t9 - t15;
+    t5 = t6 - t7;
+    t14 = t4 - t8;
+    t17 = t12 + t3;
+    t19 = t2 + t10;
+    t0 = t12 - t3;
+    t18 = C0 * t0;
+    t9 = t2 - t10;
+    t15 = C0 * t9;
+    t6 = C1 * t17;
+    t7 = t13 - t6;
+    t4 = C1 * t19;
+    t8 = t11 - t4;
+    t12 = t7 + t18;
+    t3 = t8 + t15;
+    t0 = t7 - t18;
+    t2 = t8 - t15;
+    t10 = C2 * t16;
+    t9 = C3 * t5;
+    t6 = t10 + t9;
+    t4 = C2 * t1;
+    t7 = C3 * t14;
+    t18 = t4 + t7;
+    t8 = C3 * t16;
+    t15 = C2 * t5;
+    t10 = t8 - t15;
+    t9 = C3 * t1;
+    t4 = C2 * t14;
+    t7 = t9 - t4;
+    t16 = t13 + t17;
+    t5 = t11 + t19;
+    t8 = t12 + t18;
+    t15 = t3 - t6;
+    t1 = t0 + t7;
+    t14 = t2 - t10;
+    t9 = t0 - t7;
+    t4 = t2 + t10;
+    t13 = t12 - t18;
+    t17 = t3 + t6;
+    t11 = C14 * t16;
+    t19 = C15 * t5;
+    t0 = t11 + t19;
+    y[20] = 0;
+    t7 = (-0.07967770169910844) * t0;
+    y[299] = t7;
+    t2 = (-C15) * t16;
+    t10 = C14 * t5;
+    t12 = t2 + t10;
+    t18 = 0.07844101758359247 * t12;
+    y[340] = t18;
+    t3 = (-0.001371252207873613) * t12;
+    y[619] = t3;
+    t6 = (-C16) * t8;
+    t11 = (-C17) * t15;
+    t19 = t6 + t11;
+    t0 = 0.07878375895351551 * t19;
+    y[427] = t0;
+    t7 = 0.005097485695067034 * t19;
+    y[532] = t7;
+    t16 = C17 * t8;
+    t5 = (-C16) * t15;
+    t2 = t16 + t5;
+    y[107] = 0;
+    t10 = (-0.07933107131493516) * t2;
+    y[212] = t10;
+    t18 = C18 * t1;
+    t12 = C19 * t14;
+    t3 = t18 + t12;
+    y[84] = 0;
+    t6 = (-0.08005707839808375) * t3;
+    y[235] = t6;
+    t11 = (-C19) * t1;
+    t0 = C18 * t14;
+    t19 = t11 + t0;
+    t7 = 0.0780692991183351 * t19;
+    y[404] = t7;
+    t8 = (-0.00660063310082577) * t19;
+    y[555] = t8;
+    t15 = (-C20) * t9;
+    t16 = (-C21) * t4;
+    t5 = t15 + t16;
+    t2 = 0.07826862367318611 * t5;
+    y[363] = t2;
+    t10 = (-0.005741950732883771) * t5;
+    y[596] = t10;
+    t18 = C21 * t9;
+    t12 = (-C20) * t4;
+    t3 = t18 + t12;
+    y[43] = 0;
+    t6 = (-0.07985319923469122) * t3;
+    y[276] = t6;
+    t1 = C22 * t13;
+    t14 = C23 * t17;
+    t11 = t1 + t14;
+    t0 = 0.02635963991835971 * t11;
+    y[148] = t0;
+    t7 = (-0.061476294335568483) * t11;
+    y[171] = t7;
+    t19 = (-C23) * t13;
+    t8 = C22 * t17;
+    t15 = t19 + t8;
+    t16 = 0.07787288007785695 * t15;
+    y[468] = t16;
+    t2 = 0.05548876646666499 * t15;
+    y[491] = t2;
+    t5 = re[75];
+    t10 = im[75];
+    t9 = re[107];
+    t4 = im[107];
+    t18 = re[139];
+    t12 = im[139];
+    t3 = re[11];
+    t6 = im[11];
+    t1 = re[43];
+    t14 = im[43];
+    t0 = t9 + t1;
+    t11 = t4 + t14;
+    t7 = t18 + t3;
+    t13 = t12 + t6;
+    t17 = t9 - t1;
+    t19 = t4 - t14;
+    t8 = t18 - t3;
+    t16 = t12 - t6;
+    t15 = t0 + t7;
+    t2 = t11 + t13;
+    t9 = t0 - t7;
+    t1 = C0 * t9;
+    t4 = t11 - t13;
+    t14 = C0 * t4;
+    t18 = C1 * t15;
+    t3 = t5 - t18;
+    t12 = C1 * t2;
+    t6 = t10 - t12;
+    t0 = t3 + t1;
+    t7 = t6 + t14;
+    t9 = t3 - t1;
+    t11 = t6 - t14;
+    t13 = C2 * t17;
+    t4 = C3 * t8;
+    t18 = t13 + t4;
+    t12 = C2 * t19;
+    t3 = C3 * t16;
+    t1 = t12 + t3;
+    t6 = C3 * t17;
+    t14 = C2 * t8;
+    t13 = t6 - t14;
+    t4 = C3 * t19;
+    t12 = C2 * t16;
+    t3 = t4 - t12;
+    t17 = t5 + t15;
+    t8 = t10 + t2;
+    t6 = t0 + t1;
+    t14 = t7 - t18;
+    t19 = t9 + t3;
+    t16 = t11 - t13;
+    t4 = t9 - t3;
+    t12 = t11 + t13;
+    t5 = t0 - t1;
+    t15 = t7 + t18;
+    t10 = C24 * t17;
+    t2 = C25 * t8;
+    t9 = t10 + t2;
+    t3 = 0.029582342154535285 * t9;
+    y[150] = t3;
+    t11 = (-0.059011947189589936) * t9;
+    y[169] = t11;
+    t13 = (-C25) * t17;
+    t0 = C24 * t8;
+    t1 = t13 + t0;
+    t7 = 0.07676973640263576 * t1;
+    y[470] = t7;
+    t18 = 0.058131582707871575 * t1;
+    y[489] = t18;
+    t10 = C26 * t6;
+    t2 = C27 * t14;
+    t3 = t10 + t2;
+    y[22] = 0;
+    t9 = (-0.07971374919927883) * t3;
+    y[297] = t9;
+    t11 = (-C27) * t6;
+    t17 = C26 * t14;
+    t8 = t11 + t17;
+    t13 = 0.07840554562771143 * t8;
+    y[342] = t13;
+    t0 = (-0.0016543034293969414) * t8;
+    y[617] = t0;
+    t7 = (-C28) * t19;
+    t1 = (-C29) * t16;
+    t18 = t7 + t1;
+    t10 = 0.07865614188746739 * t18;
+    y[425] = t10;
+    t2 = 0.0035739293363973644 * t18;
+    y[534] = t2;
+    t3 = C29 * t19;
+    t9 = (-C28) * t16;
+    t6 = t3 + t9;
+    y[105] = 0;
+    t14 = (-0.07945978343232006) * t6;
+    y[214] = t14;
+    t11 = C30 * t4;
+    t17 = C31 * t12;
+    t13 = t11 + t17;
+    y[86] = 0;
+    t8 = (-0.0800435305099844) * t13;
+    y[233] = t8;
+    t0 = (-C31) * t4;
+    t7 = C30 * t12;
+    t1 = t0 + t7;
+    t10 = 0.078082512854932 * t1;
+    y[406] = t10;
+    t18 = (-0.006034162996387899) * t1;
+    y[553] = t18;
+    t2 = (-C32) * t5;
+    t19 = (-C33) * t15;
+    t16 = t2 + t19;
+    t3 = 0.0782719816664161 * t16;
+    y[361] = t3;
+    t9 = (-0.005324123100425294) * t16;
+    y[598] = t9;
+    t6 = C33 * t5;
+    t14 = (-C32) * t15;
+    t11 = t6 + t14;
+    y[41] = 0;
+    t17 = (-0.07984977340469802) * t11;
+    y[278] = t17;
+    t13 = re[95];
+    t8 = im[95];
+    t4 = re[127];
+    t12 = im[127];
+    t0 = re[159];
+    t7 = im[159];
+    t10 = re[31];
+    t1 = im[31];
+    t18 = re[63];
+    t2 = im[63];
+    t19 = t4 + t18;
+    t3 = t12 + t2;
+    t16 = t0 + t10;
+    t9 = t7 + t1;
+    t5 = t4 - t18;
+    t15 = t12 - t2;
+    t6 = t0 - t10;
+    t14 = t7 - t1;
+    t11 = t19 + t16;
+    t17 = t3 + t9;
+    t4 = t19 - t16;
+    t18 = C0 * t4;
+    t12 = t3 - t9;
+    t2 = C0 * t12;
+    t0 = C1 * t11;
+    t10 = t13 - t0;
+    t7 = C1 * t17;
+    t1 = t8 - t7;
+    t19 = t10 + t18;
+    t16 = t1 + t2;
+    t4 = t10 - t18;
+    t3 = t1 - t2;
+    t9 = C2 * t5;
+    t12 = C3 * t6;
+    t0 = t9 + t12;
+    t7 = C2 * t15;
+    t10 = C3 * t14;
+    t18 = t7 + t10;
+    t1 = C3 * t5;
+    t2 = C2 * t6;
+    t9 = t1 - t2;
+    t12 = C3 * t15;
+    t7 = C2 * t14;
+    t10 = t12 - t7;
+    t5 = t13 + t11;
+    t6 = t8 + t17;
+    t1 = t19 + t18;
+    t2 = t16 - t0;
+    t15 = t4 + t10;
+    t14 = t3 - t9;
+    t12 = t4 - t10;
+    t7 = t3 + t9;
+    t13 = t19 - t18;
+    t11 = t16 + t0;
+    t8 = (-C34) * t5;
+    t17 = (-C35) * t6;
+    t4 = t8 + t17;
+    t10 = 0.07827557368950344 * t4;
+    y[359] = t10;
+    t3 = (-0.00490016126713387) * t4;
+    y[600] = t3;
+    t9 = C35 * t5;
+    t19 = (-C34) * t6;
+    t18 = t9 + t19;
+    y[39] = 0;
+    t16 = (-0.07984610914245029) * t18;
+    y[280] = t16;
+    t0 = C36 * t1;
+    t8 = C37 * t2;
+    t17 = t0 + t8;
+    t10 = 0.032865721381615164 * t17;
+    y[152] = t10;
+    t4 = (-0.05637208485075786) * t17;
+    y[167] = t4;
+    t3 = (-C37) * t1;
+    t5 = C36 * t2;
+    t6 = t3 + t5;
+    t9 = 0.07549217237243139 * t6;
+    y[472] = t9;
+    t19 = 0.0606817306790926 * t6;
+    y[487] = t19;
+    t18 = C38 * t15;
+    t16 = C39 * t14;
+    t0 = t18 + t16;
+    y[24] = 0;
+    t8 = (-0.07974459018202704) * t0;
+    y[295] = t8;
+    t10 = (-C39) * t15;
+    t17 = C38 * t14;
+    t4 = t10 + t17;
+    t1 = 0.07837522251645646 * t4;
+    y[344] = t1;
+    t2 = (-0.0019647292104819658) * t4;
+    y[615] = t2;
+    t3 = (-C40) * t12;
+    t5 = (-C41) * t7;
+    t9 = t3 + t5;
+    t6 = 0.07854498143942426 * t9;
+    y[423] = t6;
+    t19 = 0.002156796701315304 * t9;
+    y[536] = t19;
+    t18 = C41 * t12;
+    t16 = (-C40) * t7;
+    t0 = t18 + t16;
+    y[103] = 0;
+    t8 = (-0.0795722385499594) * t0;
+    y[216] = t8;
+    t15 = C42 * t13;
+    t14 = C43 * t11;
+    t10 = t15 + t14;
+    y[88] = 0;
+    t17 = (-0.08002300227653168) * t10;
+    y[231] = t17;
+    t1 = (-C43) * t13;
+    t4 = C42 * t11;
+    t2 = t1 + t4;
+    t3 = 0.07810254329626591 * t2;
+    y[408] = t3;
+    t5 = (-0.005392139407981611) * t2;
+    y[551] = t5;
+    t6 = re[115];
+    t9 = im[115];
+    t19 = re[147];
+    t12 = im[147];
+    t7 = re[19];
+    t18 = im[19];
+    t16 = re[51];
+    t0 = im[51];
+    t8 = re[83];
+    t15 = im[83];
+    t14 = t19 + t8;
+    t10 = t12 + t15;
+    t17 = t7 + t16;
+    t13 = t18 + t0;
+    t11 = t19 - t8;
+    t1 = t12 - t15;
+    t4 = t7 - t16;
+    t3 = t18 - t0;
+    t2 = t14 + t17;
+    t5 = t10 + t13;
+    t19 = t14 - t17;
+    t8 = C0 * t19;
+    t12 = t10 - t13;
+    t15 = C0 * t12;
+    t7 = C1 * t2;
+    t16 = t6 - t7;
+    t18 = C1 * t5;
+    t0 = t9 - t18;
+    t14 = t16 + t8;
+    t17 = t0 + t15;
+    t19 = t16 - t8;
+    t10 = t0 - t15;
+    t13 = C2 * t11;
+    t12 = C3 * t4;
+    t7 = t13 + t12;
+    t18 = C2 * t1;
+    t16 = C3 * t3;
+    t8 = t18 + t16;
+    t0 = C3 * t11;
+    t15 = C2 * t4;
+    t13 = t0 - t15;
+    t12 = C3 * t1;
+    t18 = C2 * t3;
+    t16 = t12 - t18;
+    t11 = t6 + t2;
+    t4 = t9 + t5;
+    t0 = t14 + t8;
+    t15 = t17 - t7;
+    t1 = t19 + t16;
+    t3 = t10 - t13;
+    t12 = t19 - t16;
+    t18 = t10 + t13;
+    t6 = t14 - t8;
+    t2 = t17 + t7;
+    t9 = C44 * t11;
+    t5 = C45 * t4;
+    t19 = t9 + t5;
+    y[90] = 0;
+    t16 = (-0.07999487307524904) * t19;
+    y[229] = t16;
+    t10 = (-C45) * t11;
+    t13 = C44 * t4;
+    t14 = t10 + t13;
+    t8 = 0.07813000708333884 * t14;
+    y[410] = t8;
+    t17 = (-0.0046717798345097695) * t14;
+    y[549] = t17;
+    t7 = (-C46) * t0;
+    t9 = (-C47) * t15;
+    t5 = t7 + t9;
+    t19 = 0.07828008273966162 * t5;
+    y[357] = t19;
+    t16 = (-0.004474926713724794) * t5;
+    y[602] = t16;
+    t11 = C47 * t0;
+    t4 = (-C46) * t15;
+    t10 = t11 + t4;
+    y[37] = 0;
+    t13 = (-0.07984150988682279) * t10;
+    y[282] = t13;
+    t8 = C48 * t1;
+    t14 = C49 * t3;
+    t17 = t8 + t14;
+    t7 = 0.036177820954147843 * t17;
+    y[154] = t7;
+    t9 = (-0.05357035306535798) * t17;
+    y[165] = t9;
+    t19 = (-C49) * t1;
+    t5 = C48 * t3;
+    t16 = t19 + t5;
+    t0 = 0.0740395135648426 * t16;
+    y[474] = t0;
+    t15 = 0.06312367791411176 * t16;
+    y[485] = t15;
+    t11 = C50 * t12;
+    t4 = C51 * t18;
+    t10 = t11 + t4;
+    y[26] = 0;
+    t13 = (-0.07977048256001223) * t10;
+    y[293] = t13;
+    t8 = (-C51) * t12;
+    t14 = C50 * t18;
+    t7 = t8 + t14;
+    t17 = 0.07834978302028017 * t7;
+    y[346] = t17;
+    t9 = (-0.002300519434810679) * t7;
+    y[613] = t9;
+    t1 = (-C52) * t6;
+    t3 = (-C53) * t2;
+    t19 = t1 + t3;
+    t5 = 0.07844874145962522 * t19;
+    y[421] = t5;
+    t0 = 0.0008435186908425442 * t19;
+    y[538] = t0;
+    t16 = C53 * t6;
+    t15 = (-C52) * t2;
+    t11 = t16 + t15;
+    y[101] = 0;
+    t4 = (-0.07966985682258086) * t11;
+    y[218] = t4;
+    t10 = re[135];
+    t13 = im[135];
+    t12 = re[7];
+    t18 = im[7];
+    t8 = re[39];
+    t14 = im[39];
+    t17 = re[71];
+    t7 = im[71];
+    t9 = re[103];
+    t1 = im[103];
+    t3 = t12 + t9;
+    t5 = t18 + t1;
+    t19 = t8 + t17;
+    t0 = t14 + t7;
+    t6 = t12 - t9;
+    t2 = t18 - t1;
+    t16 = t8 - t17;
+    t15 = t14 - t7;
+    t11 = t3 + t19;
+    t4 = t5 + t0;
+    t12 = t3 - t19;
+    t9 = C0 * t12;
+    t18 = t5 - t0;
+    t1 = C0 * t18;
+    t8 = C1 * t11;
+    t17 = t10 - t8;
+    t14 = C1 * t4;
+    t7 = t13 - t14;
+    t3 = t17 + t9;
+    t19 = t7 + t1;
+    t12 = t17 - t9;
+    t5 = t7 - t1;
+    t0 = C2 * t6;
+    t18 = C3 * t16;
+    t8 = t0 + t18;
+    t14 = C2 * t2;
+    t17 = C3 * t15;
+    t9 = t14 + t17;
+    t7 = C3 * t6;
+    t1 = C2 * t16;
+    t0 = t7 - t1;
+    t18 = C3 * t2;
+    t14 = C2 * t15;
+    t17 = t18 - t14;
+    t6 = t10 + t11;
+    t16 = t13 + t4;
+    t7 = t3 + t9;
+    t1 = t19 - t8;
+    t2 = t12 + t17;
+    t15 = t5 - t0;
+    t18 = t12 - t17;
+    t14 = t5 + t0;
+    t10 = t3 - t9;
+    t11 = t19 + t8;
+    t13 = (-C54) * t6;
+    t4 = (-C55) * t16;
+    t12 = t13 + t4;
+    t17 = 0.07836596519679581 * t12;
+    y[419] = t17;
+    t5 = (-0.00036912470608087516) * t12;
+    y[540] = t5;
+    t0 = C55 * t6;
+    t3 = (-C54) * t16;
+    t9 = t0 + t3;
+    y[99] = 0;
+    t19 = (-0.07975401035774578) * t9;
+    y[220] = t19;
+    t8 = C56 * t7;
+    t13 = C57 * t1;
+    t4 = t8 + t13;
+    y[92] = 0;
+    t17 = (-0.07995838972390076) * t4;
+    y[227] = t17;
+    t12 = (-C57) * t7;
+    t5 = C56 * t1;
+    t6 = t12 + t5;
+    t16 = 0.07816565618168997 * t6;
+    y[412] = t16;
+    t0 = (-0.0038696892324265575) * t6;
+    y[547] = t0;
+    t3 = (-C58) * t2;
+    t9 = (-C59) * t15;
+    t19 = t3 + t9;
+    t8 = 0.0782861255568716 * t19;
+    y[355] = t8;
+    t13 = (-0.004052833713203016) * t19;
+    y[604] = t13;
+    t4 = C59 * t2;
+    t17 = (-C58) * t15;
+    t7 = t4 + t17;
+    y[35] = 0;
+    t1 = (-0.07983534701126106) * t7;
+    y[284] = t1;
+    t12 = C60 * t18;
+    t5 = C61 * t14;
+    t16 = t12 + t5;
+    t6 = 0.0394872088271444 * t16;
+    y[156] = t6;
+    t0 = (-0.05062400518738256) * t16;
+    y[163] = t0;
+    t3 = (-C61) * t18;
+    t9 = C60 * t14;
+    t8 = t3 + t9;
+    t19 = 0.07241345157237726 * t8;
+    y[476] = t19;
+    t13 = 0.06544248450873842 * t8;
+    y[483] = t13;
+    t2 = C62 * t10;
+    t15 = C63 * t11;
+    t4 = t2 + t15;
+    y[28] = 0;
+    t17 = (-0.07979164632836817) * t4;
+    y[291] = t17;
+    t7 = (-C63) * t10;
+    t1 = C62 * t11;
+    t12 = t7 + t1;
+    t5 = 0.07832900168871372 * t12;
+    y[348] = t5;
+    t6 = (-0.002659444465245213) * t12;
+    y[611] = t6;
+    t16 = re[155];
+    t0 = im[155];
+    t18 = re[27];
+    t14 = im[27];
+    t3 = re[59];
+    t9 = im[59];
+    t19 = re[91];
+    t8 = im[91];
+    t13 = re[123];
+    t2 = im[123];
+    t15 = t18 + t13;
+    t4 = t14 + t2;
+    t17 = t3 + t19;
+    t10 = t9 + t8;
+    t11 = t18 - t13;
+    t7 = t14 - t2;
+    t1 = t3 - t19;
+    t5 = t9 - t8;
+    t12 = t15 + t17;
+    t6 = t4 + t10;
+    t18 = t15 - t17;
+    t13 = C0 * t18;
+    t14 = t4 - t10;
+    t2 = C0 * t14;
+    t3 = C1 * t12;
+    t19 = t16 - t3;
+    t9 = C1 * t6;
+    t8 = t0 - t9;
+    t15 = t19 + t13;
+    t17 = t8 + t2;
+    t18 = t19 - t13;
+    t4 = t8 - t2;
+    t10 = C2 * t11;
+    t14 = C3 * t1;
+    t3 = t10 + t14;
+    t9 = C2 * t7;
+    t19 = C3 * t5;
+    t13 = t9 + t19;
+    t8 = C3 * t11;
+    t2 = C2 * t1;
+    t10 = t8 - t2;
+    t14 = C3 * t7;
+    t9 = C2 * t5;
+    t19 = t14 - t9;
+    t11 = t16 + t12;
+    t1 = t0 + t6;
+    t8 = t15 + t13;
+    t2 = t17 - t3;
+    t7 = t18 + t19;
+    t5 = t4 - t10;
+    t14 = t18 - t19;
+    t9 = t4 + t10;
+    t16 = t15 - t13;
+    t12 = t17 + t3;
+    t0 = C64 * t11;
+    t6 = C65 * t1;
+    t18 = t0 + t6;
+    y[30] = 0;
+    t19 = (-0.07980853720458624) * t18;
+    y[289] = t19;
+    t4 = (-C65) * t11;
+    t10 = C64 * t1;
+    t15 = t4 + t10;
+    t13 = 0.0783124239450518 * t15;
+    y[350] = t13;
+    t17 = (-0.0030386339806276795) * t15;
+    y[609] = t17;
+    t3 = (-C66) * t8;
+    t0 = (-C67) * t2;
+    t6 = t3 + t0;
+    t18 = 0.07829544839153392 * t6;
+    y[417] = t18;
+    t19 = (-0.001484443570694814) * t6;
+    y[542] = t19;
+    t11 = C67 * t8;
+    t1 = (-C66) * t2;
+    t4 = t11 + t1;
+    y[97] = 0;
+    t10 = (-0.07982584081702268) * t4;
+    y[222] = t10;
+    t13 = C68 * t7;
+    t15 = C69 * t5;
+    t17 = t13 + t15;
+    y[94] = 0;
+    t3 = (-0.07991288715667003) * t17;
+    y[225] = t3;
+    t0 = (-C69) * t7;
+    t18 = C68 * t5;
+    t6 = t0 + t18;
+    t19 = 0.0782101638719023 * t6;
+    y[414] = t19;
+    t8 = (-0.002982392523410217) * t6;
+    y[545] = t8;
+    t2 = (-C70) * t14;
+    t11 = (-C71) * t9;
+    t1 = t2 + t11;
+    t4 = 0.07829442545648338 * t1;
+    y[353] = t4;
+    t10 = (-0.0036380318390345115) * t1;
+    y[606] = t10;
+    t13 = C71 * t14;
+    t15 = (-C70) * t9;
+    t17 = t13 + t15;
+    y[33] = 0;
+    t3 = (-0.07982688376037442) * t17;
+    y[286] = t3;
+    t7 = C72 * t16;
+    t5 = C73 * t12;
+    t0 = t7 + t5;
+    t18 = 0.04276339088979664 * t0;
+    y[158] = t18;
+    t19 = (-0.04755313986979603) * t0;
+    y[161] = t19;
+    t6 = (-C73) * t16;
+    t8 = C72 * t12;
+    t2 = t6 + t8;
+    t11 = 0.07061837814965627 * t2;
+    y[478] = t11;
+    t4 = 0.06762500181343893 * t2;
+    y[481] = t4;
+}
+
+//
+//  Public functions.
+//
+
+/**
+ *  Apply LD-MDCT transform (prebuilt for window W10_320).
+ * 
+ *  Note(s):
+ *    [1] X[k] = SUM(w[n] * x[n] * cos(PI / 320 * (n + 160.5) * (k + 0.5))), where
+ *        w[n] = sqrt(2 / 320) * W10_320[n].
+ *    [2] The size of all arrays will not be checked.
+ * 
+ *  @param {Number[]} x 
+ *    - The input block (640 points).
+ *  @param {Number[]} X 
+ *    - The array that would contain the output block (320 points).
+ *  @param {Number[]} re 
+ *    - The scratch buffer (real part, 160 points).
+ *  @param {Number[]} im 
+ *    - The scratch buffer (imaginary part, 160 points).
+ */
+function ApplyWindowedMDCT_W10_320(x, X, re, im) {
+    ApplyWindowedMDCT_W10_320_Part1(x, X, re, im);
+    ApplyWindowedMDCT_W10_320_Part2(x, X, re, im);
+    ApplyWindowedMDCT_W10_320_Part3(x, X, re, im);
+    ApplyWindowedMDCT_W10_320_Part4(x, X, re, im);
+    ApplyWindowedMDCT_W10_320_Part5(x, X, re, im);
+    ApplyWindowedMDCT_W10_320_Part6(x, X, re, im);
+    ApplyWindowedMDCT_W10_320_Part7(x, X, re, im);
+}
+
+/**
+ *  Apply LD-IMDCT transform (prebuilt for window W10_320).
+ * 
+ *  Note(s):
+ *    [1] y[n] = w[n] * SUM(X[k] * cos(PI / 320 * (n + 160.5) * (k + 0.5))), where
+ *        w[n] = sqrt(2 / 320) * W10_320[639 - n].
+ *    [2] The size of all arrays will not be checked.
+ * 
+ *  @param {Number[]} X 
+ *    - The input block (320 points).
+ *  @param {Number[]} y 
+ *    - The array that would contain the output block (640 points).
+ *  @param {Number[]} re 
+ *    - The scratch buffer (real part, 160 points).
+ *  @param {Number[]} im 
+ *    - The scratch buffer (imaginary part, 160 points).
+ */
+function ApplyWindowedIMDCT_W10_320(X, y, re, im) {
+    ApplyWindowedIMDCT_W10_320_Part1(X, y, re, im);
+    ApplyWindowedIMDCT_W10_320_Part2(X, y, re, im);
+    ApplyWindowedIMDCT_W10_320_Part3(X, y, re, im);
+    ApplyWindowedIMDCT_W10_320_Part4(X, y, re, im);
+    ApplyWindowedIMDCT_W10_320_Part5(X, y, re, im);
+}
+
+//  Export public APIs.
+module.exports = {
+    "ApplyWindowedMDCT_W10_320": ApplyWindowedMDCT_W10_320,
+    "ApplyWindowedIMDCT_W10_320": ApplyWindowedIMDCT_W10_320
+};
\ No newline at end of file
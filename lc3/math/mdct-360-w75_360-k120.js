@@ -0,0 +1,10092 @@
+//
+//  Copyright 2021 - 2023 XiaoJSoft Studio. All rights reserved.
+//  Use of this source code is governed by a BSD-style license that can be
+//  found in the LICENSE.md file.
+//
+
+//
+//  Note(s):
+//    [1] This file is generated automatically by a MDCT compiler, which locates 
+//        at "./../../dev/mdct-generator/" directory.
+//        Do NOT modify this file manually.
+//
+
+//
+//  Private functions.
+//
+
+/**
+ *  Part 1 of ApplyWindowedIMDCT_W75_360_K120().
+ * 
+ *  @param {Number[]} X 
+ *    - The input block (360 points, only the first 120 points are used).
+ *  @param {Number[]} y 
+ *    - The array that would contain the output block (720 points).
+ *  @param {Number[]} re 
+ *    - The scratch buffer (real part, 180 points).
+ *  @param {Number[]} im 
+ *    - The scratch buffer (imaginary part, 180 points).
+ */
+function ApplyWindowedIMDCT_W75_360_K120_Part1(X, y, re, im) {
+    let t0, t1, t10, t11, t12, t13, t14, t2, t3, t4, t5, t6, t7, t8, t9;
+    const C0 = 0.984807753012208;
+    const C1 = 0.17364817766693033;
+    const C2 = 0.9396926207859084;
+    const C3 = 0.3420201433256687;
+    const C4 = 0.766044443118978;
+    const C5 = 1.4088320528055172;
+    const C6 = 0.12325683343243876;
+    const C7 = 1.1584559306791384;
+    const C8 = 0.8111595753452777;
+    const C9 = 0.5976724774602398;
+    const C10 = 1.281712764111577;
+    const C11 = 0.5;
+    const C12 = 0.8660254037844386;
+    const C13 = 0.9510565162951535;
+    const C14 = 0.3090169943749474;
+    const C15 = 0.9781476007338057;
+    const C16 = 0.20791169081775931;
+    const C17 = 0.48907380036690284;
+    const C18 = 0.10395584540887966;
+    const C19 = 0.8471006708862739;
+    const C20 = 0.18005680599195537;
+    const C21 = 0.882947592858927;
+    const C22 = 0.4694715627858908;
+    const C23 = 0.9993908270190958;
+    const C24 = 0.03489949670250097;
+    const C25 = 0.9271838545667874;
+    const C26 = 0.374606593415912;
+    const C27 = 0.9902680687415704;
+    const C28 = 0.13917310096006544;
+    const C29 = 0.9135454576426009;
+    const C30 = 0.40673664307580015;
+    const C31 = 0.9945218953682733;
+    const C32 = 0.10452846326765346;
+    const C33 = 0.9702957262759965;
+    const C34 = 0.24192189559966773;
+    const C35 = 0.9612616959383189;
+    const C36 = 0.27563735581699916;
+    const C37 = 0.9975640502598242;
+    const C38 = 0.0697564737441253;
+    const C39 = 0.898794046299167;
+    const C40 = 0.4383711467890774;
+    const C41 = 0.5590169943749475;
+    const C42 = 0.25;
+    const C43 = 0.5877852522924731;
+    t0 = X[0];
+    t1 = X[119];
+    t2 = 0.8660254037844387 * t1;
+    t3 = 0.49999999999999994 * t1;
+    t4 = 0.43301270189221935 * t1;
+    t4 = t0 - t4;
+    t5 = 0.24999999999999997 * t1;
+    t6 = -t5;
+    t7 = (-0.75) * t1;
+    t1 = (-0.43301270189221924) * t1;
+    t0 = t0 + t2;
+    t2 = t4 + t1;
+    t6 = t6 - t7;
+    t4 = t4 - t1;
+    t1 = t7 - t5;
+    re[0] = t0;
+    im[0] = t3;
+    re[60] = t2;
+    im[60] = t6;
+    re[120] = t4;
+    im[120] = t1;
+    t7 = X[40];
+    t5 = C0 * t7;
+    t0 = (-C1) * t7;
+    t3 = X[79];
+    t2 = C2 * t3;
+    t6 = C3 * t3;
+    t4 = 0.4698463103929542 * t3;
+    t1 = t5 - t4;
+    t7 = 0.17101007166283436 * t3;
+    t4 = t0 - t7;
+    t7 = (-0.8137976813493737) * t3;
+    t3 = (-0.2961981327260238) * t3;
+    t5 = t5 + t2;
+    t2 = t0 + t6;
+    t0 = t1 + t3;
+    t6 = t4 - t7;
+    t1 = t1 - t3;
+    t3 = t4 + t7;
+    t4 = t0 + t6;
+    t7 = C4 * t4;
+    t4 = t0 * (-C5);
+    t0 = t6 * C6;
+    t6 = t7 - t0;
+    t0 = t7 + t4;
+    t7 = t1 + t3;
+    t4 = C1 * t7;
+    t7 = t1 * (-C7);
+    t1 = t3 * (-C8);
+    t3 = t4 - t1;
+    t1 = t4 + t7;
+    re[20] = t5;
+    im[20] = t2;
+    re[80] = t6;
+    im[80] = t0;
+    re[140] = t3;
+    im[140] = t1;
+    t4 = X[80];
+    t7 = C2 * t4;
+    t5 = (-C3) * t4;
+    t2 = X[39];
+    t6 = C0 * t2;
+    t0 = C1 * t2;
+    t3 = 0.492403876506104 * t2;
+    t1 = t7 - t3;
+    t4 = 0.08682408883346517 * t2;
+    t3 = t5 - t4;
+    t4 = (-0.8528685319524432) * t2;
+    t2 = (-0.15038373318043527) * t2;
+    t7 = t7 + t6;
+    t6 = t5 + t0;
+    t5 = t1 + t2;
+    t0 = t3 - t4;
+    t1 = t1 - t2;
+    t2 = t3 + t4;
+    t3 = t5 + t0;
+    t4 = C1 * t3;
+    t3 = t5 * (-C7);
+    t5 = t0 * (-C8);
+    t0 = t4 - t5;
+    t5 = t4 + t3;
+    t4 = t1 + t2;
+    t3 = (-C2) * t4;
+    t4 = t1 * C9;
+    t1 = t2 * (-C10);
+    t2 = t3 - t1;
+    t1 = t3 + t4;
+    re[40] = t7;
+    im[40] = t6;
+    re[100] = t0;
+    im[100] = t5;
+    re[160] = t2;
+    im[160] = t1;
+    t3 = re[0];
+    t4 = im[0];
+    t7 = re[20];
+    t6 = im[20];
+    t0 = re[40];
+    t5 = im[40];
+    t2 = t7 + t0;
+    t1 = t6 + t5;
+    t8 = C11 * t2;
+    t8 = t3 - t8;
+    t9 = C11 * t1;
+    t9 = t4 - t9;
+    t7 = t7 - t0;
+    t0 = C12 * t7;
+    t7 = t6 - t5;
+    t6 = C12 * t7;
+    t5 = t3 + t2;
+    t7 = t4 + t1;
+    t3 = t8 + t6;
+    t2 = t9 - t0;
+    t4 = t8 - t6;
+    t1 = t9 + t0;
+    re[0] = t5;
+    im[0] = t7;
+    re[20] = t3;
+    im[20] = t2;
+    re[40] = t4;
+    im[40] = t1;
+    t8 = re[60];
+    t6 = im[60];
+    t9 = re[80];
+    t0 = im[80];
+    t5 = re[100];
+    t7 = im[100];
+    t3 = t9 + t5;
+    t2 = t0 + t7;
+    t4 = C11 * t3;
+    t1 = t8 - t4;
+    t4 = C11 * t2;
+    t4 = t6 - t4;
+    t9 = t9 - t5;
+    t5 = C12 * t9;
+    t9 = t0 - t7;
+    t0 = C12 * t9;
+    t7 = t8 + t3;
+    t9 = t6 + t2;
+    t8 = t1 + t0;
+    t3 = t4 - t5;
+    t6 = t1 - t0;
+    t2 = t4 + t5;
+    re[60] = t7;
+    im[60] = t9;
+    re[80] = t8;
+    im[80] = t3;
+    re[100] = t6;
+    im[100] = t2;
+    t1 = re[120];
+    t0 = im[120];
+    t4 = re[140];
+    t5 = im[140];
+    t7 = re[160];
+    t9 = im[160];
+    t8 = t4 + t7;
+    t3 = t5 + t9;
+    t6 = C11 * t8;
+    t2 = t1 - t6;
+    t6 = C11 * t3;
+    t6 = t0 - t6;
+    t4 = t4 - t7;
+    t7 = C12 * t4;
+    t4 = t5 - t9;
+    t5 = C12 * t4;
+    t9 = t1 + t8;
+    t4 = t0 + t3;
+    t1 = t2 + t5;
+    t8 = t6 - t7;
+    t0 = t2 - t5;
+    t3 = t6 + t7;
+    re[120] = t9;
+    im[120] = t4;
+    re[140] = t1;
+    im[140] = t8;
+    re[160] = t0;
+    im[160] = t3;
+    t2 = X[72];
+    t5 = C13 * t2;
+    t6 = (-C14) * t2;
+    t7 = X[47];
+    t9 = C15 * t7;
+    t4 = C16 * t7;
+    t1 = C17 * t7;
+    t8 = t5 - t1;
+    t0 = C18 * t7;
+    t3 = t6 - t0;
+    t2 = (-C19) * t7;
+    t1 = (-C20) * t7;
+    t0 = t5 + t9;
+    t7 = t6 + t4;
+    t5 = t8 + t1;
+    t9 = t3 - t2;
+    t6 = t8 - t1;
+    t4 = t3 + t2;
+    re[36] = t0;
+    im[36] = t7;
+    re[96] = t5;
+    im[96] = t9;
+    re[156] = t6;
+    im[156] = t4;
+    t8 = X[112];
+    t1 = C21 * t8;
+    t3 = (-C22) * t8;
+    t2 = X[7];
+    t0 = C23 * t2;
+    t7 = C24 * t2;
+    t5 = 0.4996954135095479 * t2;
+    t9 = t1 - t5;
+    t6 = 0.017449748351250485 * t2;
+    t4 = t3 - t6;
+    t8 = (-0.8654978445076764) * t2;
+    t5 = (-0.030223850723657086) * t2;
+    t6 = t1 + t0;
+    t2 = t3 + t7;
+    t1 = t9 + t5;
+    t0 = t4 - t8;
+    t3 = t9 - t5;
+    t7 = t4 + t8;
+    t9 = t1 + t0;
+    t5 = C4 * t9;
+    t4 = t1 * (-C5);
+    t8 = t0 * C6;
+    t9 = t5 - t8;
+    t1 = t5 + t4;
+    t0 = t3 + t7;
+    t8 = C1 * t0;
+    t5 = t3 * (-C7);
+    t4 = t7 * (-C8);
+    t0 = t8 - t4;
+    t3 = t8 + t5;
+    re[56] = t6;
+    im[56] = t2;
+    re[116] = t9;
+    im[116] = t1;
+    re[176] = t0;
+    im[176] = t3;
+    t7 = X[87];
+    t4 = C25 * t7;
+    t8 = C26 * t7;
+    t5 = X[32];
+    t6 = C27 * t5;
+    t2 = (-C28) * t5;
+    t9 = t4 + t6;
+    t1 = t8 + t2;
+    t0 = C11 * t9;
+    t3 = -t0;
+    t7 = C11 * t1;
+    t5 = -t7;
+    t4 = t4 - t6;
+    t6 = C12 * t4;
+    t4 = t8 - t2;
+    t8 = C12 * t4;
+    t2 = t8 - t0;
+    t4 = t5 - t6;
+    t0 = t3 - t8;
+    t5 = t6 - t7;
+    t3 = t2 + t4;
+    t8 = C1 * t3;
+    t6 = t2 * (-C7);
+    t7 = t4 * (-C8);
+    t3 = t8 - t7;
+    t2 = t8 + t6;
+    t4 = t0 + t5;
+    t7 = (-C2) * t4;
+    t8 = t0 * C9;
+    t6 = t5 * (-C10);
+    t4 = t7 - t6;
+    t0 = t7 + t8;
+    re[76] = t9;
+    im[76] = t1;
+    re[136] = t3;
+    im[136] = t2;
+    re[16] = t4;
+    im[16] = t0;
+    t5 = re[36];
+    t6 = im[36];
+    t7 = re[56];
+    t8 = im[56];
+    t9 = re[76];
+    t1 = im[76];
+    t3 = t7 + t9;
+    t2 = t8 + t1;
+    t4 = C11 * t3;
+    t0 = t5 - t4;
+    t4 = C11 * t2;
+    t4 = t6 - t4;
+    t7 = t7 - t9;
+    t9 = C12 * t7;
+    t7 = t8 - t1;
+    t8 = C12 * t7;
+    t1 = t5 + t3;
+    t7 = t6 + t2;
+    t5 = t0 + t8;
+    t3 = t4 - t9;
+    t6 = t0 - t8;
+    t2 = t4 + t9;
+    re[36] = t1;
+    im[36] = t7;
+    re[56] = t5;
+    im[56] = t3;
+    re[76] = t6;
+    im[76] = t2;
+    t0 = re[96];
+    t8 = im[96];
+    t4 = re[116];
+    t9 = im[116];
+    t1 = re[136];
+    t7 = im[136];
+    t5 = t4 + t1;
+    t3 = t9 + t7;
+    t6 = C11 * t5;
+    t2 = t0 - t6;
+    t6 = C11 * t3;
+    t6 = t8 - t6;
+    t4 = t4 - t1;
+    t1 = C12 * t4;
+    t4 = t9 - t7;
+    t9 = C12 * t4;
+    t7 = t0 + t5;
+    t4 = t8 + t3;
+    t0 = t2 + t9;
+    t5 = t6 - t1;
+    t8 = t2 - t9;
+    t3 = t6 + t1;
+    re[96] = t7;
+    im[96] = t4;
+    re[116] = t0;
+    im[116] = t5;
+    re[136] = t8;
+    im[136] = t3;
+    t2 = re[156];
+    t9 = im[156];
+    t6 = re[176];
+    t1 = im[176];
+    t7 = re[16];
+    t4 = im[16];
+    t0 = t6 + t7;
+    t5 = t1 + t4;
+    t8 = C11 * t0;
+    t3 = t2 - t8;
+    t8 = C11 * t5;
+    t8 = t9 - t8;
+    t6 = t6 - t7;
+    t7 = C12 * t6;
+    t6 = t1 - t4;
+    t1 = C12 * t6;
+    t4 = t2 + t0;
+    t6 = t9 + t5;
+    t2 = t3 + t1;
+    t0 = t8 - t7;
+    t9 = t3 - t1;
+    t5 = t8 + t7;
+    re[156] = t4;
+    im[156] = t6;
+    re[176] = t2;
+    im[176] = t0;
+    re[16] = t9;
+    im[16] = t5;
+    t3 = X[95];
+    t1 = C29 * t3;
+    t8 = C30 * t3;
+    t7 = X[24];
+    t4 = C31 * t7;
+    t6 = (-C32) * t7;
+    t2 = t1 + t4;
+    t0 = t8 + t6;
+    t9 = C11 * t2;
+    t5 = -t9;
+    t3 = C11 * t0;
+    t7 = -t3;
+    t1 = t1 - t4;
+    t4 = C12 * t1;
+    t1 = t8 - t6;
+    t8 = C12 * t1;
+    t6 = t8 - t9;
+    t1 = t7 - t4;
+    t9 = t5 - t8;
+    t7 = t4 - t3;
+    re[72] = t2;
+    im[72] = t0;
+    re[132] = t6;
+    im[132] = t1;
+    re[12] = t9;
+    im[12] = t7;
+    t5 = X[55];
+    t8 = C33 * t5;
+    t4 = C34 * t5;
+    t3 = X[64];
+    t2 = C35 * t3;
+    t0 = (-C36) * t3;
+    t6 = t8 + t2;
+    t1 = t4 + t0;
+    t9 = C11 * t6;
+    t7 = -t9;
+    t5 = C11 * t1;
+    t3 = -t5;
+    t8 = t8 - t2;
+    t2 = C12 * t8;
+    t8 = t4 - t0;
+    t4 = C12 * t8;
+    t0 = t4 - t9;
+    t8 = t3 - t2;
+    t9 = t7 - t4;
+    t3 = t2 - t5;
+    t7 = t0 + t8;
+    t4 = C4 * t7;
+    t2 = t0 * (-C5);
+    t5 = t8 * C6;
+    t7 = t4 - t5;
+    t0 = t4 + t2;
+    t8 = t9 + t3;
+    t5 = C1 * t8;
+    t4 = t9 * (-C7);
+    t2 = t3 * (-C8);
+    t8 = t5 - t2;
+    t9 = t5 + t4;
+    re[92] = t6;
+    im[92] = t1;
+    re[152] = t7;
+    im[152] = t0;
+    re[32] = t8;
+    im[32] = t9;
+    t3 = X[15];
+    t2 = C37 * t3;
+    t5 = C38 * t3;
+    t4 = X[104];
+    t6 = C39 * t4;
+    t1 = (-C40) * t4;
+    t7 = t2 + t6;
+    t0 = t5 + t1;
+    t8 = C11 * t7;
+    t9 = -t8;
+    t3 = C11 * t0;
+    t4 = -t3;
+    t2 = t2 - t6;
+    t6 = C12 * t2;
+    t2 = t5 - t1;
+    t5 = C12 * t2;
+    t1 = t5 - t8;
+    t2 = t4 - t6;
+    t8 = t9 - t5;
+    t4 = t6 - t3;
+    t9 = t1 + t2;
+    t5 = C1 * t9;
+    t6 = t1 * (-C7);
+    t3 = t2 * (-C8);
+    t9 = t5 - t3;
+    t1 = t5 + t6;
+    t2 = t8 + t4;
+    t3 = (-C2) * t2;
+    t5 = t8 * C9;
+    t6 = t4 * (-C10);
+    t2 = t3 - t6;
+    t8 = t3 + t5;
+    re[112] = t7;
+    im[112] = t0;
+    re[172] = t9;
+    im[172] = t1;
+    re[52] = t2;
+    im[52] = t8;
+    t4 = re[72];
+    t6 = im[72];
+    t3 = re[92];
+    t5 = im[92];
+    t7 = re[112];
+    t0 = im[112];
+    t9 = t3 + t7;
+    t1 = t5 + t0;
+    t2 = C11 * t9;
+    t8 = t4 - t2;
+    t2 = C11 * t1;
+    t2 = t6 - t2;
+    t3 = t3 - t7;
+    t7 = C12 * t3;
+    t3 = t5 - t0;
+    t5 = C12 * t3;
+    t0 = t4 + t9;
+    t3 = t6 + t1;
+    t4 = t8 + t5;
+    t9 = t2 - t7;
+    t6 = t8 - t5;
+    t1 = t2 + t7;
+    re[72] = t0;
+    im[72] = t3;
+    re[92] = t4;
+    im[92] = t9;
+    re[112] = t6;
+    im[112] = t1;
+    t8 = re[132];
+    t5 = im[132];
+    t2 = re[152];
+    t7 = im[152];
+    t0 = re[172];
+    t3 = im[172];
+    t4 = t2 + t0;
+    t9 = t7 + t3;
+    t6 = C11 * t4;
+    t1 = t8 - t6;
+    t6 = C11 * t9;
+    t6 = t5 - t6;
+    t2 = t2 - t0;
+    t0 = C12 * t2;
+    t2 = t7 - t3;
+    t7 = C12 * t2;
+    t3 = t8 + t4;
+    t2 = t5 + t9;
+    t8 = t1 + t7;
+    t4 = t6 - t0;
+    t5 = t1 - t7;
+    t9 = t6 + t0;
+    re[132] = t3;
+    im[132] = t2;
+    re[152] = t8;
+    im[152] = t4;
+    re[172] = t5;
+    im[172] = t9;
+    t1 = re[12];
+    t7 = im[12];
+    t6 = re[32];
+    t0 = im[32];
+    t3 = re[52];
+    t2 = im[52];
+    t8 = t6 + t3;
+    t4 = t0 + t2;
+    t5 = C11 * t8;
+    t9 = t1 - t5;
+    t5 = C11 * t4;
+    t5 = t7 - t5;
+    t6 = t6 - t3;
+    t3 = C12 * t6;
+    t6 = t0 - t2;
+    t0 = C12 * t6;
+    t2 = t1 + t8;
+    t6 = t7 + t4;
+    t1 = t9 + t0;
+    t8 = t5 - t3;
+    t7 = t9 - t0;
+    t4 = t5 + t3;
+    re[12] = t2;
+    im[12] = t6;
+    re[32] = t1;
+    im[32] = t8;
+    re[52] = t7;
+    im[52] = t4;
+    t9 = X[23];
+    t0 = C31 * t9;
+    t5 = C32 * t9;
+    t3 = X[96];
+    t2 = C29 * t3;
+    t6 = (-C30) * t3;
+    t1 = t0 + t2;
+    t8 = t5 + t6;
+    t7 = C11 * t1;
+    t4 = -t7;
+    t9 = C11 * t8;
+    t3 = -t9;
+    t0 = t0 - t2;
+    t2 = C12 * t0;
+    t0 = t5 - t6;
+    t5 = C12 * t0;
+    t6 = t5 - t7;
+    t0 = t3 - t2;
+    t7 = t4 - t5;
+    t3 = t2 - t9;
+    re[108] = t1;
+    im[108] = t8;
+    re[168] = t6;
+    im[168] = t0;
+    re[48] = t7;
+    im[48] = t3;
+    t4 = X[103];
+    t5 = C39 * t4;
+    t2 = C40 * t4;
+    t9 = X[16];
+    t1 = C37 * t9;
+    t8 = (-C38) * t9;
+    t6 = 0.4987820251299121 * t9;
+    t0 = t5 - t6;
+    t7 = (-0.03487823687206265) * t9;
+    t3 = t2 - t7;
+    t4 = 0.8639158094271042 * t9;
+    t6 = (-0.0604108783408347) * t9;
+    t7 = t5 + t1;
+    t9 = t2 + t8;
+    t5 = t0 + t6;
+    t1 = t3 - t4;
+    t2 = t0 - t6;
+    t8 = t3 + t4;
+    t0 = t5 + t1;
+    t6 = C4 * t0;
+    t3 = t5 * (-C5);
+    t4 = t1 * C6;
+    t0 = t6 - t4;
+    t5 = t6 + t3;
+    t1 = t2 + t8;
+    t4 = C1 * t1;
+    t6 = t2 * (-C7);
+    t3 = t8 * (-C8);
+    t1 = t4 - t3;
+    t2 = t4 + t6;
+    re[128] = t7;
+    im[128] = t9;
+    re[8] = t0;
+    im[8] = t5;
+    re[68] = t1;
+    im[68] = t2;
+    t8 = X[63];
+    t3 = C35 * t8;
+    t4 = C36 * t8;
+    t6 = X[56];
+    t7 = C33 * t6;
+    t9 = (-C34) * t6;
+    t0 = 0.48514786313799824 * t6;
+    t5 = t3 - t0;
+    t1 = (-0.12096094779983387) * t6;
+    t2 = t4 - t1;
+    t8 = 0.840300748138485 * t6;
+    t0 = (-0.20951050732099905) * t6;
+    t1 = t3 + t7;
+    t6 = t4 + t9;
+    t3 = t5 + t0;
+    t7 = t2 - t8;
+    t4 = t5 - t0;
+    t9 = t2 + t8;
+    t5 = t3 + t7;
+    t0 = C1 * t5;
+    t2 = t3 * (-C7);
+    t8 = t7 * (-C8);
+    t5 = t0 - t8;
+    t3 = t0 + t2;
+    t7 = t4 + t9;
+    t8 = (-C2) * t7;
+    t0 = t4 * C9;
+    t2 = t9 * (-C10);
+    t7 = t8 - t2;
+    t4 = t8 + t0;
+    re[148] = t1;
+    im[148] = t6;
+    re[28] = t5;
+    im[28] = t3;
+    re[88] = t7;
+    im[88] = t4;
+    t9 = re[108];
+    t2 = im[108];
+    t8 = re[128];
+    t0 = im[128];
+    t1 = re[148];
+    t6 = im[148];
+    t5 = t8 + t1;
+    t3 = t0 + t6;
+    t7 = C11 * t5;
+    t4 = t9 - t7;
+    t7 = C11 * t3;
+    t7 = t2 - t7;
+    t8 = t8 - t1;
+    t1 = C12 * t8;
+    t8 = t0 - t6;
+    t0 = C12 * t8;
+    t6 = t9 + t5;
+    t8 = t2 + t3;
+    t9 = t4 + t0;
+    t5 = t7 - t1;
+    t2 = t4 - t0;
+    t3 = t7 + t1;
+    re[108] = t6;
+    im[108] = t8;
+    re[128] = t9;
+    im[128] = t5;
+    re[148] = t2;
+    im[148] = t3;
+    t4 = re[168];
+    t0 = im[168];
+    t7 = re[8];
+    t1 = im[8];
+    t6 = re[28];
+    t8 = im[28];
+    t9 = t7 + t6;
+    t5 = t1 + t8;
+    t2 = C11 * t9;
+    t3 = t4 - t2;
+    t2 = C11 * t5;
+    t2 = t0 - t2;
+    t7 = t7 - t6;
+    t6 = C12 * t7;
+    t7 = t1 - t8;
+    t1 = C12 * t7;
+    t8 = t4 + t9;
+    t7 = t0 + t5;
+    t4 = t3 + t1;
+    t9 = t2 - t6;
+    t0 = t3 - t1;
+    t5 = t2 + t6;
+    re[168] = t8;
+    im[168] = t7;
+    re[8] = t4;
+    im[8] = t9;
+    re[28] = t0;
+    im[28] = t5;
+    t3 = re[48];
+    t1 = im[48];
+    t2 = re[68];
+    t6 = im[68];
+    t8 = re[88];
+    t7 = im[88];
+    t4 = t2 + t8;
+    t9 = t6 + t7;
+    t0 = C11 * t4;
+    t5 = t3 - t0;
+    t0 = C11 * t9;
+    t0 = t1 - t0;
+    t2 = t2 - t8;
+    t8 = C12 * t2;
+    t2 = t6 - t7;
+    t6 = C12 * t2;
+    t7 = t3 + t4;
+    t2 = t1 + t9;
+    t3 = t5 + t6;
+    t4 = t0 - t8;
+    t1 = t5 - t6;
+    t9 = t0 + t8;
+    re[48] = t7;
+    im[48] = t2;
+    re[68] = t3;
+    im[68] = t4;
+    re[88] = t1;
+    im[88] = t9;
+    t5 = X[71];
+    t6 = C13 * t5;
+    t0 = C14 * t5;
+    t8 = X[48];
+    t7 = C15 * t8;
+    t2 = (-C16) * t8;
+    t3 = C17 * t8;
+    t4 = t6 - t3;
+    t1 = (-C18) * t8;
+    t9 = t0 - t1;
+    t5 = C19 * t8;
+    t3 = (-C20) * t8;
+    t1 = t6 + t7;
+    t8 = t0 + t2;
+    t6 = t4 + t3;
+    t7 = t9 - t5;
+    t0 = t4 - t3;
+    t2 = t9 + t5;
+    re[144] = t1;
+    im[144] = t8;
+    re[24] = t6;
+    im[24] = t7;
+    re[84] = t0;
+    im[84] = t2;
+    t4 = X[31];
+    t3 = C27 * t4;
+    t9 = C28 * t4;
+    t5 = X[88];
+    t1 = C25 * t5;
+    t8 = (-C26) * t5;
+    t6 = 0.4635919272833937 * t5;
+    t7 = t3 - t6;
+    t0 = (-0.187303296707956) * t5;
+    t2 = t9 - t0;
+    t4 = 0.8029647720336143 * t5;
+    t6 = (-0.32441882632332825) * t5;
+    t0 = t3 + t1;
+    t5 = t9 + t8;
+    t3 = t7 + t6;
+    t1 = t2 - t4;
+    t9 = t7 - t6;
+    t8 = t2 + t4;
+    t7 = t3 + t1;
+    t6 = C4 * t7;
+    t2 = t3 * (-C5);
+    t4 = t1 * C6;
+    t7 = t6 - t4;
+    t3 = t6 + t2;
+    t1 = t9 + t8;
+    t4 = C1 * t1;
+    t6 = t9 * (-C7);
+    t2 = t8 * (-C8);
+    t1 = t4 - t2;
+    t9 = t4 + t6;
+    re[164] = t0;
+    im[164] = t5;
+    re[44] = t7;
+    im[44] = t3;
+    re[104] = t1;
+    im[104] = t9;
+    t8 = X[8];
+    t2 = C23 * t8;
+    t4 = (-C24) * t8;
+    t6 = X[111];
+    t0 = C21 * t6;
+    t5 = C22 * t6;
+    t7 = 0.4414737964294635 * t6;
+    t3 = t2 - t7;
+    t1 = 0.2347357813929454 * t6;
+    t9 = t4 - t1;
+    t8 = (-0.7646550456261504) * t6;
+    t7 = (-0.4065742997269625) * t6;
+    t1 = t2 + t0;
+    t6 = t4 + t5;
+    t2 = t3 + t7;
+    t0 = t9 - t8;
+    t4 = t3 - t7;
+    t5 = t9 + t8;
+    t3 = t2 + t0;
+    t7 = C1 * t3;
+    t9 = t2 * (-C7);
+    t8 = t0 * (-C8);
+    t3 = t7 - t8;
+    t2 = t7 + t9;
+    t0 = t4 + t5;
+    t8 = (-C2) * t0;
+    t7 = t4 * C9;
+    t9 = t5 * (-C10);
+    t0 = t8 - t9;
+    t4 = t8 + t7;
+    re[4] = t1;
+    im[4] = t6;
+    re[64] = t3;
+    im[64] = t2;
+    re[124] = t0;
+    im[124] = t4;
+    t5 = re[144];
+    t9 = im[144];
+    t8 = re[164];
+    t7 = im[164];
+    t1 = re[4];
+    t6 = im[4];
+    t3 = t8 + t1;
+    t2 = t7 + t6;
+    t0 = C11 * t3;
+    t4 = t5 - t0;
+    t0 = C11 * t2;
+    t0 = t9 - t0;
+    t8 = t8 - t1;
+    t1 = C12 * t8;
+    t8 = t7 - t6;
+    t7 = C12 * t8;
+    t6 = t5 + t3;
+    t8 = t9 + t2;
+    t5 = t4 + t7;
+    t3 = t0 - t1;
+    t9 = t4 - t7;
+    t2 = t0 + t1;
+    re[144] = t6;
+    im[144] = t8;
+    re[164] = t5;
+    im[164] = t3;
+    re[4] = t9;
+    im[4] = t2;
+    t4 = re[24];
+    t7 = im[24];
+    t0 = re[44];
+    t1 = im[44];
+    t6 = re[64];
+    t8 = im[64];
+    t5 = t0 + t6;
+    t3 = t1 + t8;
+    t9 = C11 * t5;
+    t2 = t4 - t9;
+    t9 = C11 * t3;
+    t9 = t7 - t9;
+    t0 = t0 - t6;
+    t6 = C12 * t0;
+    t0 = t1 - t8;
+    t1 = C12 * t0;
+    t8 = t4 + t5;
+    t0 = t7 + t3;
+    t4 = t2 + t1;
+    t5 = t9 - t6;
+    t7 = t2 - t1;
+    t3 = t9 + t6;
+    re[24] = t8;
+    im[24] = t0;
+    re[44] = t4;
+    im[44] = t5;
+    re[64] = t7;
+    im[64] = t3;
+    t2 = re[84];
+    t1 = im[84];
+    t9 = re[104];
+    t6 = im[104];
+    t8 = re[124];
+    t0 = im[124];
+    t4 = t9 + t8;
+    t5 = t6 + t0;
+    t7 = C11 * t4;
+    t3 = t2 - t7;
+    t7 = C11 * t5;
+    t7 = t1 - t7;
+    t9 = t9 - t8;
+    t8 = C12 * t9;
+    t9 = t6 - t0;
+    t6 = C12 * t9;
+    t0 = t2 + t4;
+    t9 = t1 + t5;
+    t2 = t3 + t6;
+    t4 = t7 - t8;
+    t1 = t3 - t6;
+    t5 = t7 + t8;
+    re[84] = t0;
+    im[84] = t9;
+    re[104] = t2;
+    im[104] = t4;
+    re[124] = t1;
+    im[124] = t5;
+    t3 = re[0];
+    t6 = im[0];
+    t7 = re[36];
+    t8 = im[36];
+    t0 = re[72];
+    t9 = im[72];
+    t2 = re[108];
+    t4 = im[108];
+    t1 = re[144];
+    t5 = im[144];
+    t10 = t7 + t1;
+    t11 = t8 + t5;
+    t12 = t0 + t2;
+    t13 = t9 + t4;
+    t7 = t7 - t1;
+    t1 = t8 - t5;
+    t8 = t0 - t2;
+    t5 = t9 - t4;
+    t0 = t10 + t12;
+    t2 = t11 + t13;
+    t9 = t10 - t12;
+    t4 = C41 * t9;
+    t10 = t11 - t13;
+    t12 = C41 * t10;
+    t9 = C42 * t0;
+    t11 = t3 - t9;
+    t13 = C42 * t2;
+    t10 = t6 - t13;
+    t9 = t11 + t4;
+    t13 = t10 + t12;
+    t11 = t11 - t4;
+    t4 = t10 - t12;
+    t10 = C13 * t7;
+    t12 = C43 * t8;
+    t10 = t10 + t12;
+    t12 = C13 * t1;
+    t14 = C43 * t5;
+    t12 = t12 + t14;
+    t14 = C43 * t7;
+    t7 = C13 * t8;
+    t8 = t14 - t7;
+    t14 = C43 * t1;
+    t7 = C13 * t5;
+    t1 = t14 - t7;
+    t5 = t3 + t0;
+    t14 = t6 + t2;
+    t7 = t9 + t12;
+    t3 = t13 - t10;
+    t0 = t11 + t1;
+    t6 = t4 - t8;
+    t2 = t11 - t1;
+    t11 = t4 + t8;
+    t1 = t9 - t12;
+    t4 = t13 + t10;
+    re[0] = t5;
+    im[0] = t14;
+    re[36] = t7;
+    im[36] = t3;
+    re[72] = t0;
+    im[72] = t6;
+    re[108] = t2;
+    im[108] = t11;
+    re[144] = t1;
+    im[144] = t4;
+    t8 = re[60];
+    t9 = im[60];
+    t12 = re[96];
+    t13 = im[96];
+    t10 = re[132];
+    t5 = im[132];
+    t14 = re[168];
+    t7 = im[168];
+    t3 = re[24];
+    t0 = im[24];
+    t6 = t12 + t3;
+    t2 = t13 + t0;
+    t11 = t10 + t14;
+    t1 = t5 + t7;
+    t4 = t12 - t3;
+    t12 = t13 - t0;
+    t3 = t10 - t14;
+    t13 = t5 - t7;
+    t0 = t6 + t11;
+    t10 = t2 + t1;
+    t14 = t6 - t11;
+    t5 = C41 * t14;
+    t7 = t2 - t1;
+    t6 = C41 * t7;
+    t11 = C42 * t0;
+    t14 = t8 - t11;
+    t2 = C42 * t10;
+    t1 = t9 - t2;
+    t7 = t14 + t5;
+    t11 = t1 + t6;
+    t2 = t14 - t5;
+    t14 = t1 - t6;
+    t5 = C13 * t4;
+    t1 = C43 * t3;
+    t6 = t5 + t1;
+    t5 = C13 * t12;
+    t1 = C43 * t13;
+    t5 = t5 + t1;
+    t1 = C43 * t4;
+    t4 = C13 * t3;
+    t3 = t1 - t4;
+    t1 = C43 * t12;
+    t4 = C13 * t13;
+    t12 = t1 - t4;
+    t13 = t8 + t0;
+    t1 = t9 + t10;
+    t4 = t7 + t5;
+    t8 = t11 - t6;
+    t0 = t2 + t12;
+    t9 = t14 - t3;
+    t10 = t2 - t12;
+    t2 = t14 + t3;
+    t12 = t7 - t5;
+    t14 = t11 + t6;
+    re[60] = t13;
+    im[60] = t1;
+    re[96] = t4;
+    im[96] = t8;
+    re[132] = t0;
+    im[132] = t9;
+    re[168] = t10;
+    im[168] = t2;
+    re[24] = t12;
+    im[24] = t14;
+    t3 = re[120];
+    t7 = im[120];
+    t5 = re[156];
+    t11 = im[156];
+    t6 = re[12];
+    t13 = im[12];
+    t1 = re[48];
+    t4 = im[48];
+    t8 = re[84];
+    t0 = im[84];
+    t9 = t5 + t8;
+    t10 = t11 + t0;
+    t2 = t6 + t1;
+    t12 = t13 + t4;
+    t14 = t5 - t8;
+    t5 = t11 - t0;
+    t8 = t6 - t1;
+    t11 = t13 - t4;
+    t0 = t9 + t2;
+    t6 = t10 + t12;
+    t1 = t9 - t2;
+    t13 = C41 * t1;
+    t4 = t10 - t12;
+    t9 = C41 * t4;
+    t2 = C42 * t0;
+    t1 = t3 - t2;
+    t10 = C42 * t6;
+    t12 = t7 - t10;
+    t4 = t1 + t13;
+    t2 = t12 + t9;
+    t10 = t1 - t13;
+    t1 = t12 - t9;
+    t13 = C13 * t14;
+    t12 = C43 * t8;
+    t9 = t13 + t12;
+    t13 = C13 * t5;
+    t12 = C43 * t11;
+    t13 = t13 + t12;
+    t12 = C43 * t14;
+    t14 = C13 * t8;
+    t8 = t12 - t14;
+    t12 = C43 * t5;
+    t14 = C13 * t11;
+    t5 = t12 - t14;
+    t11 = t3 + t0;
+    t12 = t7 + t6;
+    t14 = t4 + t13;
+    t3 = t2 - t9;
+    t0 = t10 + t5;
+    t7 = t1 - t8;
+    t6 = t10 - t5;
+    t10 = t1 + t8;
+    t5 = t4 - t13;
+    t1 = t2 + t9;
+    re[120] = t11;
+    im[120] = t12;
+    re[156] = t14;
+    im[156] = t3;
+    re[12] = t0;
+    im[12] = t7;
+    re[48] = t6;
+    im[48] = t10;
+    re[84] = t5;
+    im[84] = t1;
+    t8 = re[20];
+    t4 = im[20];
+    t13 = re[56];
+    t2 = im[56];
+    t9 = re[92];
+    t11 = im[92];
+    t12 = re[128];
+    t14 = im[128];
+    t3 = re[164];
+    t0 = im[164];
+    t7 = t13 + t3;
+    t6 = t2 + t0;
+    t10 = t9 + t12;
+    t5 = t11 + t14;
+    t1 = t13 - t3;
+    t13 = t2 - t0;
+    t3 = t9 - t12;
+    t2 = t11 - t14;
+    t0 = t7 + t10;
+    t9 = t6 + t5;
+    t12 = t7 - t10;
+    t11 = C41 * t12;
+    t14 = t6 - t5;
+    t7 = C41 * t14;
+    t10 = C42 * t0;
+    t12 = t8 - t10;
+    t6 = C42 * t9;
+    t5 = t4 - t6;
+    t14 = t12 + t11;
+    t10 = t5 + t7;
+    t6 = t12 - t11;
+    t12 = t5 - t7;
+    t11 = C13 * t1;
+    t5 = C43 * t3;
+    t7 = t11 + t5;
+    t11 = C13 * t13;
+    t5 = C43 * t2;
+    t11 = t11 + t5;
+    t5 = C43 * t1;
+    t1 = C13 * t3;
+    t3 = t5 - t1;
+    t5 = C43 * t13;
+    t1 = C13 * t2;
+    t13 = t5 - t1;
+    t2 = t8 + t0;
+    t5 = t4 + t9;
+    t1 = t14 + t11;
+    t8 = t10 - t7;
+    t0 = t6 + t13;
+    t4 = t12 - t3;
+    t9 = t6 - t13;
+    t6 = t12 + t3;
+    t13 = t14 - t11;
+    t12 = t10 + t7;
+    re[20] = t2;
+    im[20] = t5;
+    re[56] = t1;
+    im[56] = t8;
+    re[92] = t0;
+    im[92] = t4;
+    re[128] = t9;
+    im[128] = t6;
+    re[164] = t13;
+    im[164] = t12;
+    t3 = re[80];
+    t14 = im[80];
+    t11 = re[116];
+    t10 = im[116];
+    t7 = re[152];
+    t2 = im[152];
+    t5 = re[8];
+    t1 = im[8];
+    t8 = re[44];
+    t0 = im[44];
+    t4 = t11 + t8;
+    t9 = t10 + t0;
+    t6 = t7 + t5;
+    t13 = t2 + t1;
+    t12 = t11 - t8;
+    t11 = t10 - t0;
+    t8 = t7 - t5;
+    t10 = t2 - t1;
+    t0 = t4 + t6;
+    t7 = t9 + t13;
+    t5 = t4 - t6;
+    t2 = C41 * t5;
+    t1 = t9 - t13;
+    t4 = C41 * t1;
+    t6 = C42 * t0;
+    t5 = t3 - t6;
+    t9 = C42 * t7;
+    t13 = t14 - t9;
+    t1 = t5 + t2;
+    t6 = t13 + t4;
+    t9 = t5 - t2;
+    t5 = t13 - t4;
+    t2 = C13 * t12;
+    t13 = C43 * t8;
+    t4 = t2 + t13;
+    t2 = C13 * t11;
+    t13 = C43 * t10;
+    t2 = t2 + t13;
+    t13 = C43 * t12;
+    t12 = C13 * t8;
+    t8 = t13 - t12;
+    t13 = C43 * t11;
+    t12 = C13 * t10;
+    t11 = t13 - t12;
+    t10 = t3 + t0;
+    t13 = t14 + t7;
+    t12 = t1 + t2;
+    t3 = t6 - t4;
+    t0 = t9 + t11;
+    t14 = t5 - t8;
+    t7 = t9 - t11;
+    t9 = t5 + t8;
+    t11 = t1 - t2;
+    t5 = t6 + t4;
+    re[80] = t10;
+    im[80] = t13;
+    re[116] = t12;
+    im[116] = t3;
+    re[152] = t0;
+    im[152] = t14;
+    re[8] = t7;
+    im[8] = t9;
+    re[44] = t11;
+    im[44] = t5;
+    t8 = re[140];
+    t1 = im[140];
+    t2 = re[176];
+    t6 = im[176];
+    t4 = re[32];
+    t10 = im[32];
+    t13 = re[68];
+    t12 = im[68];
+    t3 = re[104];
+    t0 = im[104];
+    t14 = t2 + t3;
+    t7 = t6 + t0;
+    t9 = t4 + t13;
+    t11 = t10 + t12;
+    t5 = t2 - t3;
+    t2 = t6 - t0;
+    t3 = t4 - t13;
+    t6 = t10 - t12;
+    t0 = t14 + t9;
+    t4 = t7 + t11;
+    t13 = t14 - t9;
+    t10 = C41 * t13;
+    t12 = t7 - t11;
+    t14 = C41 * t12;
+    t9 = C42 * t0;
+    t13 = t8 - t9;
+    t7 = C42 * t4;
+    t11 = t1 - t7;
+    t12 = t13 + t10;
+    t9 = t11 + t14;
+    t7 = t13 - t10;
+    t13 = t11 - t14;
+    t10 = C13 * t5;
+    t11 = C43 * t3;
+    t14 = t10 + t11;
+    t10 = C13 * t2;
+    t11 = C43 * t6;
+    t10 = t10 + t11;
+    t11 = C43 * t5;
+    t5 = C13 * t3;
+    t3 = t11 - t5;
+    t11 = C43 * t2;
+    t5 = C13 * t6;
+    t2 = t11 - t5;
+    t6 = t8 + t0;
+    t11 = t1 + t4;
+    t5 = t12 + t10;
+    t8 = t9 - t14;
+    t0 = t7 + t2;
+    t1 = t13 - t3;
+    t4 = t7 - t2;
+    t7 = t13 + t3;
+    t2 = t12 - t10;
+    t13 = t9 + t14;
+    re[140] = t6;
+    im[140] = t11;
+    re[176] = t5;
+    im[176] = t8;
+    re[32] = t0;
+    im[32] = t1;
+    re[68] = t4;
+    im[68] = t7;
+    re[104] = t2;
+    im[104] = t13;
+    t3 = re[40];
+    t12 = im[40];
+    t10 = re[76];
+    t9 = im[76];
+    t14 = re[112];
+    t6 = im[112];
+    t11 = re[148];
+    t5 = im[148];
+    t8 = re[4];
+    t0 = im[4];
+    t1 = t10 + t8;
+    t4 = t9 + t0;
+    t7 = t14 + t11;
+    t2 = t6 + t5;
+    t13 = t10 - t8;
+    t10 = t9 - t0;
+    t8 = t14 - t11;
+    t9 = t6 - t5;
+    t0 = t1 + t7;
+    t14 = t4 + t2;
+    t11 = t1 - t7;
+    t6 = C41 * t11;
+    t5 = t4 - t2;
+    t1 = C41 * t5;
+    t7 = C42 * t0;
+    t11 = t3 - t7;
+    t4 = C42 * t14;
+    t2 = t12 - t4;
+    t5 = t11 + t6;
+    t7 = t2 + t1;
+    t4 = t11 - t6;
+    t11 = t2 - t1;
+    t6 = C13 * t13;
+    t2 = C43 * t8;
+    t1 = t6 + t2;
+    t6 = C13 * t10;
+    t2 = C43 * t9;
+    t6 = t6 + t2;
+    t2 = C43 * t13;
+    t13 = C13 * t8;
+    t8 = t2 - t13;
+    t2 = C43 * t10;
+    t13 = C13 * t9;
+    t10 = t2 - t13;
+    t9 = t3 + t0;
+    t2 = t12 + t14;
+    t13 = t5 + t6;
+    t3 = t7 - t1;
+    t0 = t4 + t10;
+    t12 = t11 - t8;
+    t14 = t4 - t10;
+    t4 = t11 + t8;
+    t10 = t5 - t6;
+    t11 = t7 + t1;
+    re[40] = t9;
+    im[40] = t2;
+    re[76] = t13;
+    im[76] = t3;
+    re[112] = t0;
+    im[112] = t12;
+    re[148] = t14;
+    im[148] = t4;
+    re[4] = t10;
+    im[4] = t11;
+    t8 = re[100];
+    t5 = im[100];
+    t6 = re[136];
+    t7 = im[136];
+    t1 = re[172];
+    t9 = im[172];
+    t2 = re[28];
+    t13 = im[28];
+    t3 = re[64];
+    t0 = im[64];
+    t12 = t6 + t3;
+    t14 = t7 + t0;
+    t4 = t1 + t2;
+    t10 = t9 + t13;
+    t11 = t6 - t3;
+    t6 = t7 - t0;
+    t3 = t1 - t2;
+    t7 = t9 - t13;
+    t0 = t12 + t4;
+    t1 = t14 + t10;
+    t2 = t12 - t4;
+    t9 = C41 * t2;
+    t13 = t14 - t10;
+    t12 = C41 * t13;
+    t4 = C42 * t0;
+    t2 = t8 - t4;
+    t14 = C42 * t1;
+    t10 = t5 - t14;
+    t13 = t2 + t9;
+    t4 = t10 + t12;
+    t14 = t2 - t9;
+    t2 = t10 - t12;
+    t9 = C13 * t11;
+    t10 = C43 * t3;
+    t12 = t9 + t10;
+    t9 = C13 * t6;
+    t10 = C43 * t7;
+    t9 = t9 + t10;
+    t10 = C43 * t11;
+    t11 = C13 * t3;
+    t3 = t10 - t11;
+    t10 = C43 * t6;
+    t11 = C13 * t7;
+    t6 = t10 - t11;
+    t7 = t8 + t0;
+    t10 = t5 + t1;
+    t11 = t13 + t9;
+    t8 = t4 - t12;
+    t0 = t14 + t6;
+    t5 = t2 - t3;
+    t1 = t14 - t6;
+    t14 = t2 + t3;
+    t6 = t13 - t9;
+    t2 = t4 + t12;
+    re[100] = t7;
+    im[100] = t10;
+    re[136] = t11;
+    im[136] = t8;
+    re[172] = t0;
+    im[172] = t5;
+    re[28] = t1;
+    im[28] = t14;
+    re[64] = t6;
+    im[64] = t2;
+    t3 = re[160];
+    t13 = im[160];
+    t9 = re[16];
+    t4 = im[16];
+    t12 = re[52];
+    t7 = im[52];
+    t10 = re[88];
+    t11 = im[88];
+    t8 = re[124];
+    t0 = im[124];
+    t5 = t9 + t8;
+    t1 = t4 + t0;
+    t14 = t12 + t10;
+    t6 = t7 + t11;
+    t2 = t9 - t8;
+    t9 = t4 - t0;
+    t8 = t12 - t10;
+    t4 = t7 - t11;
+    t0 = t5 + t14;
+    t12 = t1 + t6;
+    t10 = t5 - t14;
+    t7 = C41 * t10;
+    t11 = t1 - t6;
+    t5 = C41 * t11;
+    t14 = C42 * t0;
+    t10 = t3 - t14;
+    t1 = C42 * t12;
+    t6 = t13 - t1;
+    t11 = t10 + t7;
+    t14 = t6 + t5;
+    t1 = t10 - t7;
+    t10 = t6 - t5;
+    t7 = C13 * t2;
+    t6 = C43 * t8;
+    t5 = t7 + t6;
+    t7 = C13 * t9;
+    t6 = C43 * t4;
+    t7 = t7 + t6;
+    t6 = C43 * t2;
+    t2 = C13 * t8;
+    t8 = t6 - t2;
+    t6 = C43 * t9;
+    t2 = C13 * t4;
+    t9 = t6 - t2;
+    t4 = t3 + t0;
+    t6 = t13 + t12;
+    t2 = t11 + t7;
+    t3 = t14 - t5;
+    t0 = t1 + t9;
+    t13 = t10 - t8;
+    t12 = t1 - t9;
+    t1 = t10 + t8;
+    t9 = t11 - t7;
+    t10 = t14 + t5;
+    re[160] = t4;
+    im[160] = t6;
+    re[16] = t2;
+    im[16] = t3;
+    re[52] = t0;
+    im[52] = t13;
+    re[88] = t12;
+    im[88] = t1;
+    re[124] = t9;
+    im[124] = t10;
+}
+
+/**
+ *  Part 2 of ApplyWindowedIMDCT_W75_360_K120().
+ * 
+ *  @param {Number[]} X 
+ *    - The input block (360 points, only the first 120 points are used).
+ *  @param {Number[]} y 
+ *    - The array that would contain the output block (720 points).
+ *  @param {Number[]} re 
+ *    - The scratch buffer (real part, 180 points).
+ *  @param {Number[]} im 
+ *    - The scratch buffer (imaginary part, 180 points).
+ */
+function ApplyWindowedIMDCT_W75_360_K120_Part2(X, y, re, im) {
+    let t0, t1, t10, t11, t12, t13, t14, t2, t3, t4, t5, t6, t7, t8, t9;
+    const C0 = 0.5;
+    const C1 = 0.8660254037844386;
+    const C2 = 0.766044443118978;
+    const C3 = 1.4088320528055172;
+    const C4 = 0.12325683343243876;
+    const C5 = 0.17364817766693033;
+    const C6 = 1.1584559306791384;
+    const C7 = 0.8111595753452777;
+    const C8 = 0.9396926207859084;
+    const C9 = 0.5976724774602398;
+    const C10 = 1.281712764111577;
+    const C11 = 0.5590169943749475;
+    const C12 = 0.25;
+    const C13 = 0.9510565162951535;
+    const C14 = 0.5877852522924731;
+    t8 = X[90];
+    t11 = 0.9238795325112867 * t8;
+    t7 = (-0.3826834323650898) * t8;
+    t14 = X[29];
+    t5 = 0.9914448613738104 * t14;
+    t4 = 0.13052619222005157 * t14;
+    t6 = 0.4957224306869052 * t14;
+    t2 = t11 - t6;
+    t3 = 0.06526309611002579 * t14;
+    t0 = t7 - t3;
+    t13 = (-0.8586164364012608) * t14;
+    t12 = (-0.11303899832181541) * t14;
+    t1 = t11 + t5;
+    t9 = t7 + t4;
+    t10 = t2 + t12;
+    t8 = t0 - t13;
+    t6 = t2 - t12;
+    t3 = t0 + t13;
+    re[45] = t1;
+    im[45] = t9;
+    re[105] = t10;
+    im[105] = t8;
+    re[165] = t6;
+    im[165] = t3;
+    t14 = X[109];
+    t11 = 0.8870108331782217 * t14;
+    t5 = 0.4617486132350339 * t14;
+    t7 = X[10];
+    t4 = 0.9990482215818578 * t7;
+    t2 = (-0.043619387365336) * t7;
+    t12 = t11 + t4;
+    t0 = t5 + t2;
+    t13 = C0 * t12;
+    t1 = -t13;
+    t9 = C0 * t0;
+    t10 = -t9;
+    t8 = t11 - t4;
+    t6 = C1 * t8;
+    t3 = t5 - t2;
+    t14 = C1 * t3;
+    t7 = t14 - t13;
+    t11 = t10 - t6;
+    t4 = t1 - t14;
+    t8 = t6 - t9;
+    t5 = t7 + t11;
+    t2 = C2 * t5;
+    t3 = t7 * (-C3);
+    t13 = t11 * C4;
+    t10 = t2 - t13;
+    t1 = t2 + t3;
+    t14 = t4 + t8;
+    t6 = C5 * t14;
+    t9 = t4 * (-C6);
+    t5 = t8 * (-C7);
+    t7 = t6 - t5;
+    t11 = t6 + t9;
+    re[65] = t12;
+    im[65] = t0;
+    re[125] = t10;
+    im[125] = t1;
+    re[5] = t7;
+    im[5] = t11;
+    t13 = X[69];
+    t2 = 0.9537169507482269 * t13;
+    t3 = 0.3007057995042731 * t13;
+    t14 = X[50];
+    t4 = 0.9762960071199334 * t14;
+    t8 = (-0.21643961393810288) * t14;
+    t5 = t2 + t4;
+    t6 = t3 + t8;
+    t9 = C0 * t5;
+    t12 = -t9;
+    t0 = C0 * t6;
+    t10 = -t0;
+    t1 = t2 - t4;
+    t7 = C1 * t1;
+    t11 = t3 - t8;
+    t13 = C1 * t11;
+    t14 = t13 - t9;
+    t2 = t10 - t7;
+    t4 = t12 - t13;
+    t1 = t7 - t0;
+    t3 = t14 + t2;
+    t8 = C5 * t3;
+    t11 = t14 * (-C6);
+    t9 = t2 * (-C7);
+    t10 = t8 - t9;
+    t12 = t8 + t11;
+    t13 = t4 + t1;
+    t7 = (-C8) * t13;
+    t0 = t4 * C9;
+    t3 = t1 * (-C10);
+    t14 = t7 - t3;
+    t2 = t7 + t0;
+    re[85] = t5;
+    im[85] = t6;
+    re[145] = t10;
+    im[145] = t12;
+    re[25] = t14;
+    im[25] = t2;
+    t9 = re[45];
+    t8 = im[45];
+    t11 = re[65];
+    t13 = im[65];
+    t4 = re[85];
+    t1 = im[85];
+    t3 = t11 + t4;
+    t7 = t13 + t1;
+    t0 = C0 * t3;
+    t5 = t9 - t0;
+    t6 = C0 * t7;
+    t10 = t8 - t6;
+    t12 = t11 - t4;
+    t14 = C1 * t12;
+    t2 = t13 - t1;
+    t0 = C1 * t2;
+    t6 = t9 + t3;
+    t11 = t8 + t7;
+    t4 = t5 + t0;
+    t12 = t10 - t14;
+    t13 = t5 - t0;
+    t1 = t10 + t14;
+    re[45] = t6;
+    im[45] = t11;
+    re[65] = t4;
+    im[65] = t12;
+    re[85] = t13;
+    im[85] = t1;
+    t2 = re[105];
+    t9 = im[105];
+    t3 = re[125];
+    t8 = im[125];
+    t7 = re[145];
+    t5 = im[145];
+    t0 = t3 + t7;
+    t10 = t8 + t5;
+    t14 = C0 * t0;
+    t6 = t2 - t14;
+    t11 = C0 * t10;
+    t4 = t9 - t11;
+    t12 = t3 - t7;
+    t13 = C1 * t12;
+    t1 = t8 - t5;
+    t14 = C1 * t1;
+    t11 = t2 + t0;
+    t3 = t9 + t10;
+    t7 = t6 + t14;
+    t12 = t4 - t13;
+    t8 = t6 - t14;
+    t5 = t4 + t13;
+    re[105] = t11;
+    im[105] = t3;
+    re[125] = t7;
+    im[125] = t12;
+    re[145] = t8;
+    im[145] = t5;
+    t1 = re[165];
+    t2 = im[165];
+    t0 = re[5];
+    t9 = im[5];
+    t10 = re[25];
+    t6 = im[25];
+    t14 = t0 + t10;
+    t4 = t9 + t6;
+    t13 = C0 * t14;
+    t11 = t1 - t13;
+    t3 = C0 * t4;
+    t7 = t2 - t3;
+    t12 = t0 - t10;
+    t8 = C1 * t12;
+    t5 = t9 - t6;
+    t13 = C1 * t5;
+    t3 = t1 + t14;
+    t0 = t2 + t4;
+    t10 = t11 + t13;
+    t12 = t7 - t8;
+    t9 = t11 - t13;
+    t6 = t7 + t8;
+    re[165] = t3;
+    im[165] = t0;
+    re[5] = t10;
+    im[5] = t12;
+    re[25] = t9;
+    im[25] = t6;
+    t5 = X[77];
+    t1 = 0.9426414910921784 * t5;
+    t14 = 0.33380685923377096 * t5;
+    t2 = X[42];
+    t4 = 0.9832549075639546 * t2;
+    t11 = (-0.18223552549214747) * t2;
+    t13 = t1 + t4;
+    t7 = t14 + t11;
+    t8 = C0 * t13;
+    t3 = -t8;
+    t0 = C0 * t7;
+    t10 = -t0;
+    t12 = t1 - t4;
+    t9 = C1 * t12;
+    t6 = t14 - t11;
+    t5 = C1 * t6;
+    t2 = t5 - t8;
+    t1 = t10 - t9;
+    t4 = t3 - t5;
+    t12 = t9 - t0;
+    re[81] = t13;
+    im[81] = t7;
+    re[141] = t2;
+    im[141] = t1;
+    re[21] = t4;
+    im[21] = t12;
+    t14 = X[37];
+    t11 = 0.9862856015372314 * t14;
+    t6 = 0.16504760586067765 * t14;
+    t8 = X[82];
+    t10 = 0.9366721892483976 * t8;
+    t3 = (-0.35020738125946743) * t8;
+    t5 = t11 + t10;
+    t9 = t6 + t3;
+    t0 = C0 * t5;
+    t13 = -t0;
+    t7 = C0 * t9;
+    t2 = -t7;
+    t1 = t11 - t10;
+    t4 = C1 * t1;
+    t12 = t6 - t3;
+    t14 = C1 * t12;
+    t8 = t14 - t0;
+    t11 = t2 - t4;
+    t10 = t13 - t14;
+    t1 = t4 - t7;
+    t6 = t8 + t11;
+    t3 = C2 * t6;
+    t12 = t8 * (-C3);
+    t0 = t11 * C4;
+    t2 = t3 - t0;
+    t13 = t3 + t12;
+    t14 = t10 + t1;
+    t4 = C5 * t14;
+    t7 = t10 * (-C6);
+    t6 = t1 * (-C7);
+    t8 = t4 - t6;
+    t11 = t4 + t7;
+    re[101] = t5;
+    im[101] = t9;
+    re[161] = t2;
+    im[161] = t13;
+    re[41] = t8;
+    im[41] = t11;
+    t0 = X[117];
+    t3 = 0.8703556959398997 * t0;
+    t12 = 0.49242356010346705 * t0;
+    t14 = X[2];
+    t10 = 0.9999619230641713 * t14;
+    t1 = (-0.008726535498373935) * t14;
+    t6 = 0.49998096153208565 * t14;
+    t4 = t3 - t6;
+    t7 = (-0.004363267749186967) * t14;
+    t5 = t12 - t7;
+    t9 = 0.8659924281907126 * t14;
+    t2 = (-0.0075574014286185235) * t14;
+    t13 = t3 + t10;
+    t8 = t12 + t1;
+    t11 = t4 + t2;
+    t0 = t5 - t9;
+    t6 = t4 - t2;
+    t7 = t5 + t9;
+    t14 = t11 + t0;
+    t3 = C5 * t14;
+    t10 = t11 * (-C6);
+    t12 = t0 * (-C7);
+    t1 = t3 - t12;
+    t4 = t3 + t10;
+    t2 = t6 + t7;
+    t5 = (-C8) * t2;
+    t9 = t6 * C9;
+    t14 = t7 * (-C10);
+    t11 = t5 - t14;
+    t0 = t5 + t9;
+    re[121] = t13;
+    im[121] = t8;
+    re[1] = t1;
+    im[1] = t4;
+    re[61] = t11;
+    im[61] = t0;
+    t12 = re[81];
+    t3 = im[81];
+    t10 = re[101];
+    t2 = im[101];
+    t6 = re[121];
+    t7 = im[121];
+    t14 = t10 + t6;
+    t5 = t2 + t7;
+    t9 = C0 * t14;
+    t13 = t12 - t9;
+    t8 = C0 * t5;
+    t1 = t3 - t8;
+    t4 = t10 - t6;
+    t11 = C1 * t4;
+    t0 = t2 - t7;
+    t9 = C1 * t0;
+    t8 = t12 + t14;
+    t10 = t3 + t5;
+    t6 = t13 + t9;
+    t4 = t1 - t11;
+    t2 = t13 - t9;
+    t7 = t1 + t11;
+    re[81] = t8;
+    im[81] = t10;
+    re[101] = t6;
+    im[101] = t4;
+    re[121] = t2;
+    im[121] = t7;
+    t0 = re[141];
+    t12 = im[141];
+    t14 = re[161];
+    t3 = im[161];
+    t5 = re[1];
+    t13 = im[1];
+    t9 = t14 + t5;
+    t1 = t3 + t13;
+    t11 = C0 * t9;
+    t8 = t0 - t11;
+    t10 = C0 * t1;
+    t6 = t12 - t10;
+    t4 = t14 - t5;
+    t2 = C1 * t4;
+    t7 = t3 - t13;
+    t11 = C1 * t7;
+    t10 = t0 + t9;
+    t14 = t12 + t1;
+    t5 = t8 + t11;
+    t4 = t6 - t2;
+    t3 = t8 - t11;
+    t13 = t6 + t2;
+    re[141] = t10;
+    im[141] = t14;
+    re[161] = t5;
+    im[161] = t4;
+    re[1] = t3;
+    im[1] = t13;
+    t7 = re[21];
+    t0 = im[21];
+    t9 = re[41];
+    t12 = im[41];
+    t1 = re[61];
+    t8 = im[61];
+    t11 = t9 + t1;
+    t6 = t12 + t8;
+    t2 = C0 * t11;
+    t10 = t7 - t2;
+    t14 = C0 * t6;
+    t5 = t0 - t14;
+    t4 = t9 - t1;
+    t3 = C1 * t4;
+    t13 = t12 - t8;
+    t2 = C1 * t13;
+    t14 = t7 + t11;
+    t9 = t0 + t6;
+    t1 = t10 + t2;
+    t4 = t5 - t3;
+    t12 = t10 - t2;
+    t8 = t5 + t3;
+    re[21] = t14;
+    im[21] = t9;
+    re[41] = t1;
+    im[41] = t4;
+    re[61] = t12;
+    im[61] = t8;
+    t13 = X[5];
+    t7 = 0.9996573249755573 * t13;
+    t11 = 0.02617694830787315 * t13;
+    t0 = X[114];
+    t6 = 0.8788171126619654 * t0;
+    t10 = (-0.4771587602596084) * t0;
+    t2 = t7 + t6;
+    t5 = t11 + t10;
+    t3 = C0 * t2;
+    t14 = -t3;
+    t9 = C0 * t5;
+    t1 = -t9;
+    t4 = t7 - t6;
+    t12 = C1 * t4;
+    t8 = t11 - t10;
+    t13 = C1 * t8;
+    t0 = t13 - t3;
+    t7 = t1 - t12;
+    t6 = t14 - t13;
+    t4 = t12 - t9;
+    re[117] = t2;
+    im[117] = t5;
+    re[177] = t0;
+    im[177] = t7;
+    re[57] = t6;
+    im[57] = t4;
+    t11 = X[85];
+    t10 = 0.9304175679820246 * t11;
+    t8 = 0.3665012267242973 * t11;
+    t3 = X[34];
+    t1 = 0.9890158633619168 * t3;
+    t14 = (-0.1478094111296106) * t3;
+    t13 = 0.4945079316809584 * t3;
+    t12 = t10 - t13;
+    t9 = (-0.0739047055648053) * t3;
+    t2 = t8 - t9;
+    t5 = 0.8565128624172191 * t3;
+    t0 = (-0.1280067049566611) * t3;
+    t7 = t10 + t1;
+    t6 = t8 + t14;
+    t4 = t12 + t0;
+    t11 = t2 - t5;
+    t13 = t12 - t0;
+    t9 = t2 + t5;
+    t3 = t4 + t11;
+    t10 = C2 * t3;
+    t1 = t4 * (-C3);
+    t8 = t11 * C4;
+    t14 = t10 - t8;
+    t12 = t10 + t1;
+    t0 = t13 + t9;
+    t2 = C5 * t0;
+    t5 = t13 * (-C6);
+    t3 = t9 * (-C7);
+    t4 = t2 - t3;
+    t11 = t2 + t5;
+    re[137] = t7;
+    im[137] = t6;
+    re[17] = t14;
+    im[17] = t12;
+    re[77] = t4;
+    im[77] = t11;
+    t8 = X[45];
+    t10 = 0.9799247046208296 * t8;
+    t1 = 0.19936793441719716 * t8;
+    t0 = X[74];
+    t13 = 0.9483236552061993 * t0;
+    t9 = (-0.31730465640509214) * t0;
+    t3 = 0.47416182760309966 * t0;
+    t2 = t10 - t3;
+    t5 = (-0.15865232820254607) * t0;
+    t7 = t1 - t5;
+    t6 = 0.8212723764182835 * t0;
+    t14 = (-0.27479389318590247) * t0;
+    t12 = t10 + t13;
+    t4 = t1 + t9;
+    t11 = t2 + t14;
+    t8 = t7 - t6;
+    t3 = t2 - t14;
+    t5 = t7 + t6;
+    t0 = t11 + t8;
+    t10 = C5 * t0;
+    t13 = t11 * (-C6);
+    t1 = t8 * (-C7);
+    t9 = t10 - t1;
+    t2 = t10 + t13;
+    t14 = t3 + t5;
+    t7 = (-C8) * t14;
+    t6 = t3 * C9;
+    t0 = t5 * (-C10);
+    t11 = t7 - t0;
+    t8 = t7 + t6;
+    re[157] = t12;
+    im[157] = t4;
+    re[37] = t9;
+    im[37] = t2;
+    re[97] = t11;
+    im[97] = t8;
+    t1 = re[117];
+    t10 = im[117];
+    t13 = re[137];
+    t14 = im[137];
+    t3 = re[157];
+    t5 = im[157];
+    t0 = t13 + t3;
+    t7 = t14 + t5;
+    t6 = C0 * t0;
+    t12 = t1 - t6;
+    t4 = C0 * t7;
+    t9 = t10 - t4;
+    t2 = t13 - t3;
+    t11 = C1 * t2;
+    t8 = t14 - t5;
+    t6 = C1 * t8;
+    t4 = t1 + t0;
+    t13 = t10 + t7;
+    t3 = t12 + t6;
+    t2 = t9 - t11;
+    t14 = t12 - t6;
+    t5 = t9 + t11;
+    re[117] = t4;
+    im[117] = t13;
+    re[137] = t3;
+    im[137] = t2;
+    re[157] = t14;
+    im[157] = t5;
+    t8 = re[177];
+    t1 = im[177];
+    t0 = re[17];
+    t10 = im[17];
+    t7 = re[37];
+    t12 = im[37];
+    t6 = t0 + t7;
+    t9 = t10 + t12;
+    t11 = C0 * t6;
+    t4 = t8 - t11;
+    t13 = C0 * t9;
+    t3 = t1 - t13;
+    t2 = t0 - t7;
+    t14 = C1 * t2;
+    t5 = t10 - t12;
+    t11 = C1 * t5;
+    t13 = t8 + t6;
+    t0 = t1 + t9;
+    t7 = t4 + t11;
+    t2 = t3 - t14;
+    t10 = t4 - t11;
+    t12 = t3 + t14;
+    re[177] = t13;
+    im[177] = t0;
+    re[17] = t7;
+    im[17] = t2;
+    re[37] = t10;
+    im[37] = t12;
+    t5 = re[57];
+    t8 = im[57];
+    t6 = re[77];
+    t1 = im[77];
+    t9 = re[97];
+    t4 = im[97];
+    t11 = t6 + t9;
+    t3 = t1 + t4;
+    t14 = C0 * t11;
+    t13 = t5 - t14;
+    t0 = C0 * t3;
+    t7 = t8 - t0;
+    t2 = t6 - t9;
+    t10 = C1 * t2;
+    t12 = t1 - t4;
+    t14 = C1 * t12;
+    t0 = t5 + t11;
+    t6 = t8 + t3;
+    t9 = t13 + t14;
+    t2 = t7 - t10;
+    t1 = t13 - t14;
+    t4 = t7 + t10;
+    re[57] = t0;
+    im[57] = t6;
+    re[77] = t9;
+    im[77] = t2;
+    re[97] = t1;
+    im[97] = t4;
+    t12 = X[53];
+    t5 = 0.9723699203976766 * t12;
+    t11 = 0.2334453638559054 * t12;
+    t8 = X[66];
+    t3 = 0.958819734868193 * t8;
+    t13 = (-0.2840153447039226) * t8;
+    t14 = 0.4794098674340965 * t8;
+    t7 = t5 - t14;
+    t10 = (-0.1420076723519613) * t8;
+    t0 = t11 - t10;
+    t6 = 0.8303622480457152 * t8;
+    t9 = (-0.24596450357819108) * t8;
+    t2 = t5 + t3;
+    t1 = t11 + t13;
+    t4 = t7 + t9;
+    t12 = t0 - t6;
+    t14 = t7 - t9;
+    t10 = t0 + t6;
+    re[153] = t2;
+    im[153] = t1;
+    re[33] = t4;
+    im[33] = t12;
+    re[93] = t14;
+    im[93] = t10;
+    t8 = X[13];
+    t5 = 0.9981347984218669 * t8;
+    t3 = 0.06104853953485687 * t8;
+    t11 = X[106];
+    t13 = 0.8949343616020251 * t11;
+    t7 = (-0.44619781310980877) * t11;
+    t9 = 0.44746718080101255 * t11;
+    t0 = t5 - t9;
+    t6 = (-0.22309890655490439) * t11;
+    t2 = t3 - t6;
+    t1 = 0.7750358918669625 * t11;
+    t4 = (-0.3864186412661556) * t11;
+    t12 = t5 + t13;
+    t14 = t3 + t7;
+    t10 = t0 + t4;
+    t8 = t2 - t1;
+    t9 = t0 - t4;
+    t6 = t2 + t1;
+    t11 = t10 + t8;
+    t5 = C2 * t11;
+    t13 = t10 * (-C3);
+    t3 = t8 * C4;
+    t7 = t5 - t3;
+    t0 = t5 + t13;
+    t4 = t9 + t6;
+    t2 = C5 * t4;
+    t1 = t9 * (-C6);
+    t11 = t6 * (-C7);
+    t10 = t2 - t11;
+    t8 = t2 + t1;
+    re[173] = t12;
+    im[173] = t14;
+    re[53] = t7;
+    im[53] = t0;
+    re[113] = t10;
+    im[113] = t8;
+    t3 = X[26];
+    t5 = 0.9935718556765875 * t3;
+    t13 = (-0.11320321376790671) * t3;
+    t4 = X[93];
+    t9 = 0.917060074385124 * t4;
+    t6 = 0.3987490689252462 * t4;
+    t11 = 0.458530037192562 * t4;
+    t2 = t5 - t11;
+    t1 = 0.1993745344626231 * t4;
+    t12 = t13 - t1;
+    t14 = (-0.7941973212139644) * t4;
+    t7 = (-0.34532682342465526) * t4;
+    t0 = t5 + t9;
+    t10 = t13 + t6;
+    t8 = t2 + t7;
+    t3 = t12 - t14;
+    t11 = t2 - t7;
+    t1 = t12 + t14;
+    t4 = t8 + t3;
+    t5 = C5 * t4;
+    t9 = t8 * (-C6);
+    t13 = t3 * (-C7);
+    t6 = t5 - t13;
+    t2 = t5 + t9;
+    t7 = t11 + t1;
+    t12 = (-C8) * t7;
+    t14 = t11 * C9;
+    t4 = t1 * (-C10);
+    t8 = t12 - t4;
+    t3 = t12 + t14;
+    re[13] = t0;
+    im[13] = t10;
+    re[73] = t6;
+    im[73] = t2;
+    re[133] = t8;
+    im[133] = t3;
+    t13 = re[153];
+    t5 = im[153];
+    t9 = re[173];
+    t7 = im[173];
+    t11 = re[13];
+    t1 = im[13];
+    t4 = t9 + t11;
+    t12 = t7 + t1;
+    t14 = C0 * t4;
+    t0 = t13 - t14;
+    t10 = C0 * t12;
+    t6 = t5 - t10;
+    t2 = t9 - t11;
+    t8 = C1 * t2;
+    t3 = t7 - t1;
+    t14 = C1 * t3;
+    t10 = t13 + t4;
+    t9 = t5 + t12;
+    t11 = t0 + t14;
+    t2 = t6 - t8;
+    t7 = t0 - t14;
+    t1 = t6 + t8;
+    re[153] = t10;
+    im[153] = t9;
+    re[173] = t11;
+    im[173] = t2;
+    re[13] = t7;
+    im[13] = t1;
+    t3 = re[33];
+    t13 = im[33];
+    t4 = re[53];
+    t5 = im[53];
+    t12 = re[73];
+    t0 = im[73];
+    t14 = t4 + t12;
+    t6 = t5 + t0;
+    t8 = C0 * t14;
+    t10 = t3 - t8;
+    t9 = C0 * t6;
+    t11 = t13 - t9;
+    t2 = t4 - t12;
+    t7 = C1 * t2;
+    t1 = t5 - t0;
+    t8 = C1 * t1;
+    t9 = t3 + t14;
+    t4 = t13 + t6;
+    t12 = t10 + t8;
+    t2 = t11 - t7;
+    t5 = t10 - t8;
+    t0 = t11 + t7;
+    re[33] = t9;
+    im[33] = t4;
+    re[53] = t12;
+    im[53] = t2;
+    re[73] = t5;
+    im[73] = t0;
+    t1 = re[93];
+    t3 = im[93];
+    t14 = re[113];
+    t13 = im[113];
+    t6 = re[133];
+    t10 = im[133];
+    t8 = t14 + t6;
+    t11 = t13 + t10;
+    t7 = C0 * t8;
+    t9 = t1 - t7;
+    t4 = C0 * t11;
+    t12 = t3 - t4;
+    t2 = t14 - t6;
+    t5 = C1 * t2;
+    t0 = t13 - t10;
+    t7 = C1 * t0;
+    t4 = t1 + t8;
+    t14 = t3 + t11;
+    t6 = t9 + t7;
+    t2 = t12 - t5;
+    t13 = t9 - t7;
+    t10 = t12 + t5;
+    re[93] = t4;
+    im[93] = t14;
+    re[113] = t6;
+    im[113] = t2;
+    re[133] = t13;
+    im[133] = t10;
+    t0 = X[18];
+    t1 = 0.996917333733128 * t0;
+    t8 = (-0.07845909572784494) * t0;
+    t3 = X[101];
+    t11 = 0.9025852843498606 * t3;
+    t9 = 0.4305110968082951 * t3;
+    t7 = 0.4512926421749303 * t3;
+    t12 = t1 - t7;
+    t5 = 0.21525554840414754 * t3;
+    t4 = t8 - t5;
+    t14 = (-0.7816617853289803) * t3;
+    t6 = (-0.3728335464470853) * t3;
+    t2 = t1 + t11;
+    t13 = t8 + t9;
+    t10 = t12 + t6;
+    t0 = t4 - t14;
+    t7 = t12 - t6;
+    t5 = t4 + t14;
+    re[9] = t2;
+    im[9] = t13;
+    re[69] = t10;
+    im[69] = t0;
+    re[129] = t7;
+    im[129] = t5;
+    t3 = X[58];
+    t1 = 0.9681476403781077 * t3;
+    t11 = (-0.25038000405444144) * t3;
+    t8 = X[61];
+    t9 = 0.963630453208623 * t8;
+    t12 = 0.26723837607825685 * t8;
+    t6 = 0.4818152266043115 * t8;
+    t4 = t1 - t6;
+    t14 = 0.13361918803912842 * t8;
+    t2 = t11 - t14;
+    t13 = (-0.8345284523389792) * t8;
+    t10 = (-0.23143522254987003) * t8;
+    t0 = t1 + t9;
+    t7 = t11 + t12;
+    t5 = t4 + t10;
+    t3 = t2 - t13;
+    t6 = t4 - t10;
+    t14 = t2 + t13;
+    t8 = t5 + t3;
+    t1 = C2 * t8;
+    t9 = t5 * (-C3);
+    t11 = t3 * C4;
+    t12 = t1 - t11;
+    t4 = t1 + t9;
+    t10 = t6 + t14;
+    t2 = C5 * t10;
+    t13 = t6 * (-C6);
+    t8 = t14 * (-C7);
+    t5 = t2 - t8;
+    t3 = t2 + t13;
+    re[29] = t0;
+    im[29] = t7;
+    re[89] = t12;
+    im[89] = t4;
+    re[149] = t5;
+    im[149] = t3;
+    t11 = X[98];
+    t1 = 0.9099612708765432 * t11;
+    t9 = (-0.41469324265623897) * t11;
+    t10 = X[21];
+    t6 = 0.9953961983671789 * t10;
+    t14 = 0.09584575252022398 * t10;
+    t8 = 0.4976980991835894 * t10;
+    t2 = t1 - t8;
+    t13 = 0.04792287626011199 * t10;
+    t0 = t9 - t13;
+    t7 = (-0.8620383946164312) * t10;
+    t12 = (-0.08300485652735035) * t10;
+    t4 = t1 + t6;
+    t5 = t9 + t14;
+    t3 = t2 + t12;
+    t11 = t0 - t7;
+    t8 = t2 - t12;
+    t13 = t0 + t7;
+    t10 = t3 + t11;
+    t1 = C5 * t10;
+    t6 = t3 * (-C6);
+    t9 = t11 * (-C7);
+    t14 = t1 - t9;
+    t2 = t1 + t6;
+    t12 = t8 + t13;
+    t0 = (-C8) * t12;
+    t7 = t8 * C9;
+    t10 = t13 * (-C10);
+    t3 = t0 - t10;
+    t11 = t0 + t7;
+    re[49] = t4;
+    im[49] = t5;
+    re[109] = t14;
+    im[109] = t2;
+    re[169] = t3;
+    im[169] = t11;
+    t9 = re[9];
+    t1 = im[9];
+    t6 = re[29];
+    t12 = im[29];
+    t8 = re[49];
+    t13 = im[49];
+    t10 = t6 + t8;
+    t0 = t12 + t13;
+    t7 = C0 * t10;
+    t4 = t9 - t7;
+    t5 = C0 * t0;
+    t14 = t1 - t5;
+    t2 = t6 - t8;
+    t3 = C1 * t2;
+    t11 = t12 - t13;
+    t7 = C1 * t11;
+    t5 = t9 + t10;
+    t6 = t1 + t0;
+    t8 = t4 + t7;
+    t2 = t14 - t3;
+    t12 = t4 - t7;
+    t13 = t14 + t3;
+    re[9] = t5;
+    im[9] = t6;
+    re[29] = t8;
+    im[29] = t2;
+    re[49] = t12;
+    im[49] = t13;
+    t11 = re[69];
+    t9 = im[69];
+    t10 = re[89];
+    t1 = im[89];
+    t0 = re[109];
+    t4 = im[109];
+    t7 = t10 + t0;
+    t14 = t1 + t4;
+    t3 = C0 * t7;
+    t5 = t11 - t3;
+    t6 = C0 * t14;
+    t8 = t9 - t6;
+    t2 = t10 - t0;
+    t12 = C1 * t2;
+    t13 = t1 - t4;
+    t3 = C1 * t13;
+    t6 = t11 + t7;
+    t10 = t9 + t14;
+    t0 = t5 + t3;
+    t2 = t8 - t12;
+    t1 = t5 - t3;
+    t4 = t8 + t12;
+    re[69] = t6;
+    im[69] = t10;
+    re[89] = t0;
+    im[89] = t2;
+    re[109] = t1;
+    im[109] = t4;
+    t13 = re[129];
+    t11 = im[129];
+    t7 = re[149];
+    t9 = im[149];
+    t14 = re[169];
+    t5 = im[169];
+    t3 = t7 + t14;
+    t8 = t9 + t5;
+    t12 = C0 * t3;
+    t6 = t13 - t12;
+    t10 = C0 * t8;
+    t0 = t11 - t10;
+    t2 = t7 - t14;
+    t1 = C1 * t2;
+    t4 = t9 - t5;
+    t12 = C1 * t4;
+    t10 = t13 + t3;
+    t7 = t11 + t8;
+    t14 = t6 + t12;
+    t2 = t0 - t1;
+    t9 = t6 - t12;
+    t5 = t0 + t1;
+    re[129] = t10;
+    im[129] = t7;
+    re[149] = t14;
+    im[149] = t2;
+    re[169] = t9;
+    im[169] = t5;
+    t4 = re[45];
+    t13 = im[45];
+    t3 = re[81];
+    t11 = im[81];
+    t8 = re[117];
+    t6 = im[117];
+    t12 = re[153];
+    t0 = im[153];
+    t1 = re[9];
+    t10 = im[9];
+    t7 = t3 + t1;
+    t14 = t11 + t10;
+    t2 = t8 + t12;
+    t9 = t6 + t0;
+    t5 = t3 - t1;
+    t3 = t11 - t10;
+    t1 = t8 - t12;
+    t11 = t6 - t0;
+    t10 = t7 + t2;
+    t8 = t14 + t9;
+    t12 = t7 - t2;
+    t6 = C11 * t12;
+    t0 = t14 - t9;
+    t7 = C11 * t0;
+    t2 = C12 * t10;
+    t12 = t4 - t2;
+    t14 = C12 * t8;
+    t9 = t13 - t14;
+    t0 = t12 + t6;
+    t2 = t9 + t7;
+    t14 = t12 - t6;
+    t12 = t9 - t7;
+    t6 = C13 * t5;
+    t9 = C14 * t1;
+    t7 = t6 + t9;
+    t6 = C13 * t3;
+    t9 = C14 * t11;
+    t6 = t6 + t9;
+    t9 = C14 * t5;
+    t5 = C13 * t1;
+    t1 = t9 - t5;
+    t9 = C14 * t3;
+    t5 = C13 * t11;
+    t3 = t9 - t5;
+    t11 = t4 + t10;
+    t9 = t13 + t8;
+    t5 = t0 + t6;
+    t4 = t2 - t7;
+    t10 = t14 + t3;
+    t13 = t12 - t1;
+    t8 = t14 - t3;
+    t14 = t12 + t1;
+    t3 = t0 - t6;
+    t12 = t2 + t7;
+    re[45] = t11;
+    im[45] = t9;
+    re[81] = t5;
+    im[81] = t4;
+    re[117] = t10;
+    im[117] = t13;
+    re[153] = t8;
+    im[153] = t14;
+    re[9] = t3;
+    im[9] = t12;
+    t1 = re[105];
+    t0 = im[105];
+    t6 = re[141];
+    t2 = im[141];
+    t7 = re[177];
+    t11 = im[177];
+    t9 = re[33];
+    t5 = im[33];
+    t4 = re[69];
+    t10 = im[69];
+    t13 = t6 + t4;
+    t8 = t2 + t10;
+    t14 = t7 + t9;
+    t3 = t11 + t5;
+    t12 = t6 - t4;
+    t6 = t2 - t10;
+    t4 = t7 - t9;
+    t2 = t11 - t5;
+    t10 = t13 + t14;
+    t7 = t8 + t3;
+    t9 = t13 - t14;
+    t11 = C11 * t9;
+    t5 = t8 - t3;
+    t13 = C11 * t5;
+    t14 = C12 * t10;
+    t9 = t1 - t14;
+    t8 = C12 * t7;
+    t3 = t0 - t8;
+    t5 = t9 + t11;
+    t14 = t3 + t13;
+    t8 = t9 - t11;
+    t9 = t3 - t13;
+    t11 = C13 * t12;
+    t3 = C14 * t4;
+    t13 = t11 + t3;
+    t11 = C13 * t6;
+    t3 = C14 * t2;
+    t11 = t11 + t3;
+    t3 = C14 * t12;
+    t12 = C13 * t4;
+    t4 = t3 - t12;
+    t3 = C14 * t6;
+    t12 = C13 * t2;
+    t6 = t3 - t12;
+    t2 = t1 + t10;
+    t3 = t0 + t7;
+    t12 = t5 + t11;
+    t1 = t14 - t13;
+    t10 = t8 + t6;
+    t0 = t9 - t4;
+    t7 = t8 - t6;
+    t8 = t9 + t4;
+    t6 = t5 - t11;
+    t9 = t14 + t13;
+    re[105] = t2;
+    im[105] = t3;
+    re[141] = t12;
+    im[141] = t1;
+    re[177] = t10;
+    im[177] = t0;
+    re[33] = t7;
+    im[33] = t8;
+    re[69] = t6;
+    im[69] = t9;
+    t4 = re[165];
+    t5 = im[165];
+    t11 = re[21];
+    t14 = im[21];
+    t13 = re[57];
+    t2 = im[57];
+    t3 = re[93];
+    t12 = im[93];
+    t1 = re[129];
+    t10 = im[129];
+    t0 = t11 + t1;
+    t7 = t14 + t10;
+    t8 = t13 + t3;
+    t6 = t2 + t12;
+    t9 = t11 - t1;
+    t11 = t14 - t10;
+    t1 = t13 - t3;
+    t14 = t2 - t12;
+    t10 = t0 + t8;
+    t13 = t7 + t6;
+    t3 = t0 - t8;
+    t2 = C11 * t3;
+    t12 = t7 - t6;
+    t0 = C11 * t12;
+    t8 = C12 * t10;
+    t3 = t4 - t8;
+    t7 = C12 * t13;
+    t6 = t5 - t7;
+    t12 = t3 + t2;
+    t8 = t6 + t0;
+    t7 = t3 - t2;
+    t3 = t6 - t0;
+    t2 = C13 * t9;
+    t6 = C14 * t1;
+    t0 = t2 + t6;
+    t2 = C13 * t11;
+    t6 = C14 * t14;
+    t2 = t2 + t6;
+    t6 = C14 * t9;
+    t9 = C13 * t1;
+    t1 = t6 - t9;
+    t6 = C14 * t11;
+    t9 = C13 * t14;
+    t11 = t6 - t9;
+    t14 = t4 + t10;
+    t6 = t5 + t13;
+    t9 = t12 + t2;
+    t4 = t8 - t0;
+    t10 = t7 + t11;
+    t5 = t3 - t1;
+    t13 = t7 - t11;
+    t7 = t3 + t1;
+    t11 = t12 - t2;
+    t3 = t8 + t0;
+    re[165] = t14;
+    im[165] = t6;
+    re[21] = t9;
+    im[21] = t4;
+    re[57] = t10;
+    im[57] = t5;
+    re[93] = t13;
+    im[93] = t7;
+    re[129] = t11;
+    im[129] = t3;
+    t1 = re[65];
+    t12 = im[65];
+    t2 = re[101];
+    t8 = im[101];
+    t0 = re[137];
+    t14 = im[137];
+    t6 = re[173];
+    t9 = im[173];
+    t4 = re[29];
+    t10 = im[29];
+    t5 = t2 + t4;
+    t13 = t8 + t10;
+    t7 = t0 + t6;
+    t11 = t14 + t9;
+    t3 = t2 - t4;
+    t2 = t8 - t10;
+    t4 = t0 - t6;
+    t8 = t14 - t9;
+    t10 = t5 + t7;
+    t0 = t13 + t11;
+    t6 = t5 - t7;
+    t14 = C11 * t6;
+    t9 = t13 - t11;
+    t5 = C11 * t9;
+    t7 = C12 * t10;
+    t6 = t1 - t7;
+    t13 = C12 * t0;
+    t11 = t12 - t13;
+    t9 = t6 + t14;
+    t7 = t11 + t5;
+    t13 = t6 - t14;
+    t6 = t11 - t5;
+    t14 = C13 * t3;
+    t11 = C14 * t4;
+    t5 = t14 + t11;
+    t14 = C13 * t2;
+    t11 = C14 * t8;
+    t14 = t14 + t11;
+    t11 = C14 * t3;
+    t3 = C13 * t4;
+    t4 = t11 - t3;
+    t11 = C14 * t2;
+    t3 = C13 * t8;
+    t2 = t11 - t3;
+    t8 = t1 + t10;
+    t11 = t12 + t0;
+    t3 = t9 + t14;
+    t1 = t7 - t5;
+    t10 = t13 + t2;
+    t12 = t6 - t4;
+    t0 = t13 - t2;
+    t13 = t6 + t4;
+    t2 = t9 - t14;
+    t6 = t7 + t5;
+    re[65] = t8;
+    im[65] = t11;
+    re[101] = t3;
+    im[101] = t1;
+    re[137] = t10;
+    im[137] = t12;
+    re[173] = t0;
+    im[173] = t13;
+    re[29] = t2;
+    im[29] = t6;
+    t4 = re[125];
+    t9 = im[125];
+    t14 = re[161];
+    t7 = im[161];
+    t5 = re[17];
+    t8 = im[17];
+    t11 = re[53];
+    t3 = im[53];
+    t1 = re[89];
+    t10 = im[89];
+    t12 = t14 + t1;
+    t0 = t7 + t10;
+    t13 = t5 + t11;
+    t2 = t8 + t3;
+    t6 = t14 - t1;
+    t14 = t7 - t10;
+    t1 = t5 - t11;
+    t7 = t8 - t3;
+    t10 = t12 + t13;
+    t5 = t0 + t2;
+    t11 = t12 - t13;
+    t8 = C11 * t11;
+    t3 = t0 - t2;
+    t12 = C11 * t3;
+    t13 = C12 * t10;
+    t11 = t4 - t13;
+    t0 = C12 * t5;
+    t2 = t9 - t0;
+    t3 = t11 + t8;
+    t13 = t2 + t12;
+    t0 = t11 - t8;
+    t11 = t2 - t12;
+    t8 = C13 * t6;
+    t2 = C14 * t1;
+    t12 = t8 + t2;
+    t8 = C13 * t14;
+    t2 = C14 * t7;
+    t8 = t8 + t2;
+    t2 = C14 * t6;
+    t6 = C13 * t1;
+    t1 = t2 - t6;
+    t2 = C14 * t14;
+    t6 = C13 * t7;
+    t14 = t2 - t6;
+    t7 = t4 + t10;
+    t2 = t9 + t5;
+    t6 = t3 + t8;
+    t4 = t13 - t12;
+    t10 = t0 + t14;
+    t9 = t11 - t1;
+    t5 = t0 - t14;
+    t0 = t11 + t1;
+    t14 = t3 - t8;
+    t11 = t13 + t12;
+    re[125] = t7;
+    im[125] = t2;
+    re[161] = t6;
+    im[161] = t4;
+    re[17] = t10;
+    im[17] = t9;
+    re[53] = t5;
+    im[53] = t0;
+    re[89] = t14;
+    im[89] = t11;
+    t1 = re[5];
+    t3 = im[5];
+    t8 = re[41];
+    t13 = im[41];
+    t12 = re[77];
+    t7 = im[77];
+    t2 = re[113];
+    t6 = im[113];
+    t4 = re[149];
+    t10 = im[149];
+    t9 = t8 + t4;
+    t5 = t13 + t10;
+    t0 = t12 + t2;
+    t14 = t7 + t6;
+    t11 = t8 - t4;
+    t8 = t13 - t10;
+    t4 = t12 - t2;
+    t13 = t7 - t6;
+    t10 = t9 + t0;
+    t12 = t5 + t14;
+    t2 = t9 - t0;
+    t7 = C11 * t2;
+    t6 = t5 - t14;
+    t9 = C11 * t6;
+    t0 = C12 * t10;
+    t2 = t1 - t0;
+    t5 = C12 * t12;
+    t14 = t3 - t5;
+    t6 = t2 + t7;
+    t0 = t14 + t9;
+    t5 = t2 - t7;
+    t2 = t14 - t9;
+    t7 = C13 * t11;
+    t14 = C14 * t4;
+    t9 = t7 + t14;
+    t7 = C13 * t8;
+    t14 = C14 * t13;
+    t7 = t7 + t14;
+    t14 = C14 * t11;
+    t11 = C13 * t4;
+    t4 = t14 - t11;
+    t14 = C14 * t8;
+    t11 = C13 * t13;
+    t8 = t14 - t11;
+    t13 = t1 + t10;
+    t14 = t3 + t12;
+    t11 = t6 + t7;
+    t1 = t0 - t9;
+    t10 = t5 + t8;
+    t3 = t2 - t4;
+    t12 = t5 - t8;
+    t5 = t2 + t4;
+    t8 = t6 - t7;
+    t2 = t0 + t9;
+    re[5] = t13;
+    im[5] = t14;
+    re[41] = t11;
+    im[41] = t1;
+    re[77] = t10;
+    im[77] = t3;
+    re[113] = t12;
+    im[113] = t5;
+    re[149] = t8;
+    im[149] = t2;
+    t4 = re[85];
+    t6 = im[85];
+    t7 = re[121];
+    t0 = im[121];
+    t9 = re[157];
+    t13 = im[157];
+    t14 = re[13];
+    t11 = im[13];
+    t1 = re[49];
+    t10 = im[49];
+    t3 = t7 + t1;
+    t12 = t0 + t10;
+    t5 = t9 + t14;
+    t8 = t13 + t11;
+    t2 = t7 - t1;
+    t7 = t0 - t10;
+    t1 = t9 - t14;
+    t0 = t13 - t11;
+    t10 = t3 + t5;
+    t9 = t12 + t8;
+    t14 = t3 - t5;
+    t13 = C11 * t14;
+    t11 = t12 - t8;
+    t3 = C11 * t11;
+    t5 = C12 * t10;
+    t14 = t4 - t5;
+    t12 = C12 * t9;
+    t8 = t6 - t12;
+    t11 = t14 + t13;
+    t5 = t8 + t3;
+    t12 = t14 - t13;
+    t14 = t8 - t3;
+    t13 = C13 * t2;
+    t8 = C14 * t1;
+    t3 = t13 + t8;
+    t13 = C13 * t7;
+    t8 = C14 * t0;
+    t13 = t13 + t8;
+    t8 = C14 * t2;
+    t2 = C13 * t1;
+    t1 = t8 - t2;
+    t8 = C14 * t7;
+    t2 = C13 * t0;
+    t7 = t8 - t2;
+    t0 = t4 + t10;
+    t8 = t6 + t9;
+    t2 = t11 + t13;
+    t4 = t5 - t3;
+    t10 = t12 + t7;
+    t6 = t14 - t1;
+    t9 = t12 - t7;
+    t12 = t14 + t1;
+    t7 = t11 - t13;
+    t14 = t5 + t3;
+    re[85] = t0;
+    im[85] = t8;
+    re[121] = t2;
+    im[121] = t4;
+    re[157] = t10;
+    im[157] = t6;
+    re[13] = t9;
+    im[13] = t12;
+    re[49] = t7;
+    im[49] = t14;
+    t1 = re[145];
+    t11 = im[145];
+    t13 = re[1];
+    t5 = im[1];
+    t3 = re[37];
+    t0 = im[37];
+    t8 = re[73];
+    t2 = im[73];
+    t4 = re[109];
+    t10 = im[109];
+    t6 = t13 + t4;
+    t9 = t5 + t10;
+    t12 = t3 + t8;
+    t7 = t0 + t2;
+    t14 = t13 - t4;
+    t13 = t5 - t10;
+    t4 = t3 - t8;
+    t5 = t0 - t2;
+    t10 = t6 + t12;
+    t3 = t9 + t7;
+    t8 = t6 - t12;
+    t0 = C11 * t8;
+    t2 = t9 - t7;
+    t6 = C11 * t2;
+    t12 = C12 * t10;
+    t8 = t1 - t12;
+    t9 = C12 * t3;
+    t7 = t11 - t9;
+    t2 = t8 + t0;
+    t12 = t7 + t6;
+    t9 = t8 - t0;
+    t8 = t7 - t6;
+    t0 = C13 * t14;
+    t7 = C14 * t4;
+    t6 = t0 + t7;
+    t0 = C13 * t13;
+    t7 = C14 * t5;
+    t0 = t0 + t7;
+    t7 = C14 * t14;
+    t14 = C13 * t4;
+    t4 = t7 - t14;
+    t7 = C14 * t13;
+    t14 = C13 * t5;
+    t13 = t7 - t14;
+    t5 = t1 + t10;
+    t7 = t11 + t3;
+    t14 = t2 + t0;
+    t1 = t12 - t6;
+    t10 = t9 + t13;
+    t11 = t8 - t4;
+    t3 = t9 - t13;
+    t9 = t8 + t4;
+    t13 = t2 - t0;
+    t8 = t12 + t6;
+    re[145] = t5;
+    im[145] = t7;
+    re[1] = t14;
+    im[1] = t1;
+    re[37] = t10;
+    im[37] = t11;
+    re[73] = t3;
+    im[73] = t9;
+    re[109] = t13;
+    im[109] = t8;
+    t4 = re[25];
+    t2 = im[25];
+    t0 = re[61];
+    t12 = im[61];
+    t6 = re[97];
+    t5 = im[97];
+    t7 = re[133];
+    t14 = im[133];
+    t1 = re[169];
+    t10 = im[169];
+    t11 = t0 + t1;
+    t3 = t12 + t10;
+    t9 = t6 + t7;
+    t13 = t5 + t14;
+    t8 = t0 - t1;
+    t0 = t12 - t10;
+    t1 = t6 - t7;
+    t12 = t5 - t14;
+    t10 = t11 + t9;
+    t6 = t3 + t13;
+    t7 = t11 - t9;
+    t5 = C11 * t7;
+    t14 = t3 - t13;
+    t11 = C11 * t14;
+    t9 = C12 * t10;
+    t7 = t4 - t9;
+    t3 = C12 * t6;
+    t13 = t2 - t3;
+    t14 = t7 + t5;
+    t9 = t13 + t11;
+    t3 = t7 - t5;
+    t7 = t13 - t11;
+    t5 = C13 * t8;
+    t13 = C14 * t1;
+    t11 = t5 + t13;
+    t5 = C13 * t0;
+    t13 = C14 * t12;
+    t5 = t5 + t13;
+    t13 = C14 * t8;
+    t8 = C13 * t1;
+    t1 = t13 - t8;
+    t13 = C14 * t0;
+    t8 = C13 * t12;
+    t0 = t13 - t8;
+    t12 = t4 + t10;
+    t13 = t2 + t6;
+    t8 = t14 + t5;
+    t4 = t9 - t11;
+    t10 = t3 + t0;
+    t2 = t7 - t1;
+    t6 = t3 - t0;
+    t3 = t7 + t1;
+    t0 = t14 - t5;
+    t7 = t9 + t11;
+    re[25] = t12;
+    im[25] = t13;
+    re[61] = t8;
+    im[61] = t4;
+    re[97] = t10;
+    im[97] = t2;
+    re[133] = t6;
+    im[133] = t3;
+    re[169] = t0;
+    im[169] = t7;
+}
+
+/**
+ *  Part 3 of ApplyWindowedIMDCT_W75_360_K120().
+ * 
+ *  @param {Number[]} X 
+ *    - The input block (360 points, only the first 120 points are used).
+ *  @param {Number[]} y 
+ *    - The array that would contain the output block (720 points).
+ *  @param {Number[]} re 
+ *    - The scratch buffer (real part, 180 points).
+ *  @param {Number[]} im 
+ *    - The scratch buffer (imaginary part, 180 points).
+ */
+function ApplyWindowedIMDCT_W75_360_K120_Part3(X, y, re, im) {
+    let t0, t1, t10, t11, t12, t13, t14, t2, t3, t4, t5, t6, t7, t8, t9;
+    const C0 = 0.9659258262890683;
+    const C1 = 0.25881904510252074;
+    const C2 = 0.5;
+    const C3 = 0.8660254037844386;
+    const C4 = 0.9961946980917455;
+    const C5 = 0.08715574274765817;
+    const C6 = 0.9063077870366499;
+    const C7 = 0.42261826174069944;
+    const C8 = 0.766044443118978;
+    const C9 = 1.4088320528055172;
+    const C10 = 0.12325683343243876;
+    const C11 = 0.17364817766693033;
+    const C12 = 1.1584559306791384;
+    const C13 = 0.8111595753452777;
+    const C14 = 0.9396926207859084;
+    const C15 = 0.5976724774602398;
+    const C16 = 1.281712764111577;
+    const C17 = 0.8910065241883679;
+    const C18 = 0.45399049973954675;
+    const C19 = 0.9986295347545738;
+    const C20 = 0.05233595624294383;
+    const C21 = 0.4993147673772869;
+    const C22 = 0.026167978121471914;
+    const C23 = 0.8648385460668958;
+    const C24 = 0.04532426763774014;
+    const C25 = 0.9563047559630355;
+    const C26 = 0.2923717047227367;
+    const C27 = 0.9743700647852352;
+    const C28 = 0.22495105434386498;
+    const C29 = 0.992546151641322;
+    const C30 = 0.12186934340514748;
+    const C31 = 0.9205048534524404;
+    const C32 = 0.3907311284892737;
+    const C33 = 0.9876883405951378;
+    const C34 = 0.15643446504023087;
+    const C35 = 0.9335804264972017;
+    const C36 = 0.35836794954530027;
+    const C37 = 0.46679021324860087;
+    const C38 = 0.17918397477265013;
+    const C39 = 0.8085043658224875;
+    const C40 = 0.31035574820837;
+    const C41 = 0.9998476951563913;
+    const C42 = 0.01745240643728351;
+    const C43 = 0.8746197071393957;
+    const C44 = 0.48480962024633706;
+    const C45 = 0.981627183447664;
+    const C46 = 0.1908089953765448;
+    const C47 = 0.9455185755993168;
+    const C48 = 0.3255681544571567;
+    const C49 = 0.5590169943749475;
+    const C50 = 0.25;
+    const C51 = 0.9510565162951535;
+    const C52 = 0.5877852522924731;
+    t1 = X[59];
+    t14 = C0 * t1;
+    t5 = C1 * t1;
+    t9 = X[60];
+    t11 = C0 * t9;
+    t12 = (-C1) * t9;
+    t13 = t14 + t11;
+    t8 = t5 + t12;
+    t4 = C2 * t13;
+    t10 = -t4;
+    t2 = C2 * t8;
+    t6 = -t2;
+    t3 = t14 - t11;
+    t0 = C3 * t3;
+    t7 = t5 - t12;
+    t1 = C3 * t7;
+    t9 = t1 - t4;
+    t14 = t6 - t0;
+    t11 = t10 - t1;
+    t3 = t0 - t2;
+    re[90] = t13;
+    im[90] = t8;
+    re[150] = t9;
+    im[150] = t14;
+    re[30] = t11;
+    im[30] = t3;
+    t5 = X[19];
+    t12 = C4 * t5;
+    t7 = C5 * t5;
+    t4 = X[100];
+    t6 = C6 * t4;
+    t10 = (-C7) * t4;
+    t1 = t12 + t6;
+    t0 = t7 + t10;
+    t2 = C2 * t1;
+    t13 = -t2;
+    t8 = C2 * t0;
+    t9 = -t8;
+    t14 = t12 - t6;
+    t11 = C3 * t14;
+    t3 = t7 - t10;
+    t5 = C3 * t3;
+    t4 = t5 - t2;
+    t12 = t9 - t11;
+    t6 = t13 - t5;
+    t14 = t11 - t8;
+    t7 = t4 + t12;
+    t10 = C8 * t7;
+    t3 = t4 * (-C9);
+    t2 = t12 * C10;
+    t9 = t10 - t2;
+    t13 = t10 + t3;
+    t5 = t6 + t14;
+    t11 = C11 * t5;
+    t8 = t6 * (-C12);
+    t7 = t14 * (-C13);
+    t4 = t11 - t7;
+    t12 = t11 + t8;
+    re[110] = t1;
+    im[110] = t0;
+    re[170] = t9;
+    im[170] = t13;
+    re[50] = t4;
+    im[50] = t12;
+    t2 = X[99];
+    t10 = C6 * t2;
+    t3 = C7 * t2;
+    t5 = X[20];
+    t6 = C4 * t5;
+    t14 = (-C5) * t5;
+    t7 = 0.4980973490458728 * t5;
+    t11 = t10 - t7;
+    t8 = (-0.04357787137382908) * t5;
+    t1 = t3 - t8;
+    t0 = 0.8627299156628209 * t5;
+    t9 = (-0.07547908730517332) * t5;
+    t13 = t10 + t6;
+    t4 = t3 + t14;
+    t12 = t11 + t9;
+    t2 = t1 - t0;
+    t7 = t11 - t9;
+    t8 = t1 + t0;
+    t5 = t12 + t2;
+    t10 = C11 * t5;
+    t6 = t12 * (-C12);
+    t3 = t2 * (-C13);
+    t14 = t10 - t3;
+    t11 = t10 + t6;
+    t9 = t7 + t8;
+    t1 = (-C14) * t9;
+    t0 = t7 * C15;
+    t5 = t8 * (-C16);
+    t12 = t1 - t5;
+    t2 = t1 + t0;
+    re[130] = t13;
+    im[130] = t4;
+    re[10] = t14;
+    im[10] = t11;
+    re[70] = t12;
+    im[70] = t2;
+    t3 = re[90];
+    t10 = im[90];
+    t6 = re[110];
+    t9 = im[110];
+    t7 = re[130];
+    t8 = im[130];
+    t5 = t6 + t7;
+    t1 = t9 + t8;
+    t0 = C2 * t5;
+    t13 = t3 - t0;
+    t4 = C2 * t1;
+    t14 = t10 - t4;
+    t11 = t6 - t7;
+    t12 = C3 * t11;
+    t2 = t9 - t8;
+    t0 = C3 * t2;
+    t4 = t3 + t5;
+    t6 = t10 + t1;
+    t7 = t13 + t0;
+    t11 = t14 - t12;
+    t9 = t13 - t0;
+    t8 = t14 + t12;
+    re[90] = t4;
+    im[90] = t6;
+    re[110] = t7;
+    im[110] = t11;
+    re[130] = t9;
+    im[130] = t8;
+    t2 = re[150];
+    t3 = im[150];
+    t5 = re[170];
+    t10 = im[170];
+    t1 = re[10];
+    t13 = im[10];
+    t0 = t5 + t1;
+    t14 = t10 + t13;
+    t12 = C2 * t0;
+    t4 = t2 - t12;
+    t6 = C2 * t14;
+    t7 = t3 - t6;
+    t11 = t5 - t1;
+    t9 = C3 * t11;
+    t8 = t10 - t13;
+    t12 = C3 * t8;
+    t6 = t2 + t0;
+    t5 = t3 + t14;
+    t1 = t4 + t12;
+    t11 = t7 - t9;
+    t10 = t4 - t12;
+    t13 = t7 + t9;
+    re[150] = t6;
+    im[150] = t5;
+    re[170] = t1;
+    im[170] = t11;
+    re[10] = t10;
+    im[10] = t13;
+    t8 = re[30];
+    t2 = im[30];
+    t0 = re[50];
+    t3 = im[50];
+    t14 = re[70];
+    t4 = im[70];
+    t12 = t0 + t14;
+    t7 = t3 + t4;
+    t9 = C2 * t12;
+    t6 = t8 - t9;
+    t5 = C2 * t7;
+    t1 = t2 - t5;
+    t11 = t0 - t14;
+    t10 = C3 * t11;
+    t13 = t3 - t4;
+    t9 = C3 * t13;
+    t5 = t8 + t12;
+    t0 = t2 + t7;
+    t14 = t6 + t9;
+    t11 = t1 - t10;
+    t3 = t6 - t9;
+    t4 = t1 + t10;
+    re[30] = t5;
+    im[30] = t0;
+    re[50] = t14;
+    im[50] = t11;
+    re[70] = t3;
+    im[70] = t4;
+    t13 = X[107];
+    t8 = C17 * t13;
+    t12 = C18 * t13;
+    t2 = X[12];
+    t7 = C19 * t2;
+    t6 = (-C20) * t2;
+    t9 = C21 * t2;
+    t1 = t8 - t9;
+    t10 = (-C22) * t2;
+    t5 = t12 - t10;
+    t0 = C23 * t2;
+    t14 = (-C24) * t2;
+    t11 = t8 + t7;
+    t3 = t12 + t6;
+    t4 = t1 + t14;
+    t13 = t5 - t0;
+    t9 = t1 - t14;
+    t10 = t5 + t0;
+    re[126] = t11;
+    im[126] = t3;
+    re[6] = t4;
+    im[6] = t13;
+    re[66] = t9;
+    im[66] = t10;
+    t2 = X[67];
+    t8 = C25 * t2;
+    t7 = C26 * t2;
+    t12 = X[52];
+    t6 = C27 * t12;
+    t1 = (-C28) * t12;
+    t14 = 0.4871850323926176 * t12;
+    t5 = t8 - t14;
+    t0 = (-0.11247552717193249) * t12;
+    t11 = t7 - t0;
+    t3 = 0.843829228791103 * t12;
+    t4 = (-0.19481332766988085) * t12;
+    t13 = t8 + t6;
+    t9 = t7 + t1;
+    t10 = t5 + t4;
+    t2 = t11 - t3;
+    t14 = t5 - t4;
+    t0 = t11 + t3;
+    t12 = t10 + t2;
+    t8 = C8 * t12;
+    t6 = t10 * (-C9);
+    t7 = t2 * C10;
+    t1 = t8 - t7;
+    t5 = t8 + t6;
+    t4 = t14 + t0;
+    t11 = C11 * t4;
+    t3 = t14 * (-C12);
+    t12 = t0 * (-C13);
+    t10 = t11 - t12;
+    t2 = t11 + t3;
+    re[146] = t13;
+    im[146] = t9;
+    re[26] = t1;
+    im[26] = t5;
+    re[86] = t10;
+    im[86] = t2;
+    t7 = X[27];
+    t8 = C29 * t7;
+    t6 = C30 * t7;
+    t4 = X[92];
+    t14 = C31 * t4;
+    t0 = (-C32) * t4;
+    t12 = 0.4602524267262202 * t4;
+    t11 = t8 - t12;
+    t3 = (-0.19536556424463686) * t4;
+    t13 = t6 - t3;
+    t9 = 0.7971805873966852 * t4;
+    t1 = (-0.33838308332107264) * t4;
+    t5 = t8 + t14;
+    t10 = t6 + t0;
+    t2 = t11 + t1;
+    t7 = t13 - t9;
+    t12 = t11 - t1;
+    t3 = t13 + t9;
+    t4 = t2 + t7;
+    t8 = C11 * t4;
+    t14 = t2 * (-C12);
+    t6 = t7 * (-C13);
+    t0 = t8 - t6;
+    t11 = t8 + t14;
+    t1 = t12 + t3;
+    t13 = (-C14) * t1;
+    t9 = t12 * C15;
+    t4 = t3 * (-C16);
+    t2 = t13 - t4;
+    t7 = t13 + t9;
+    re[166] = t5;
+    im[166] = t10;
+    re[46] = t0;
+    im[46] = t11;
+    re[106] = t2;
+    im[106] = t7;
+    t6 = re[126];
+    t8 = im[126];
+    t14 = re[146];
+    t1 = im[146];
+    t12 = re[166];
+    t3 = im[166];
+    t4 = t14 + t12;
+    t13 = t1 + t3;
+    t9 = C2 * t4;
+    t5 = t6 - t9;
+    t10 = C2 * t13;
+    t0 = t8 - t10;
+    t11 = t14 - t12;
+    t2 = C3 * t11;
+    t7 = t1 - t3;
+    t9 = C3 * t7;
+    t10 = t6 + t4;
+    t14 = t8 + t13;
+    t12 = t5 + t9;
+    t11 = t0 - t2;
+    t1 = t5 - t9;
+    t3 = t0 + t2;
+    re[126] = t10;
+    im[126] = t14;
+    re[146] = t12;
+    im[146] = t11;
+    re[166] = t1;
+    im[166] = t3;
+    t7 = re[6];
+    t6 = im[6];
+    t4 = re[26];
+    t8 = im[26];
+    t13 = re[46];
+    t5 = im[46];
+    t9 = t4 + t13;
+    t0 = t8 + t5;
+    t2 = C2 * t9;
+    t10 = t7 - t2;
+    t14 = C2 * t0;
+    t12 = t6 - t14;
+    t11 = t4 - t13;
+    t1 = C3 * t11;
+    t3 = t8 - t5;
+    t2 = C3 * t3;
+    t14 = t7 + t9;
+    t4 = t6 + t0;
+    t13 = t10 + t2;
+    t11 = t12 - t1;
+    t8 = t10 - t2;
+    t5 = t12 + t1;
+    re[6] = t14;
+    im[6] = t4;
+    re[26] = t13;
+    im[26] = t11;
+    re[46] = t8;
+    im[46] = t5;
+    t3 = re[66];
+    t7 = im[66];
+    t9 = re[86];
+    t6 = im[86];
+    t0 = re[106];
+    t10 = im[106];
+    t2 = t9 + t0;
+    t12 = t6 + t10;
+    t1 = C2 * t2;
+    t14 = t3 - t1;
+    t4 = C2 * t12;
+    t13 = t7 - t4;
+    t11 = t9 - t0;
+    t8 = C3 * t11;
+    t5 = t6 - t10;
+    t1 = C3 * t5;
+    t4 = t3 + t2;
+    t9 = t7 + t12;
+    t0 = t14 + t1;
+    t11 = t13 - t8;
+    t6 = t14 - t1;
+    t10 = t13 + t8;
+    re[66] = t4;
+    im[66] = t9;
+    re[86] = t0;
+    im[86] = t11;
+    re[106] = t6;
+    im[106] = t10;
+    t5 = X[35];
+    t3 = C33 * t5;
+    t2 = C34 * t5;
+    t7 = X[84];
+    t12 = C35 * t7;
+    t14 = (-C36) * t7;
+    t1 = C37 * t7;
+    t13 = t3 - t1;
+    t8 = (-C38) * t7;
+    t4 = t2 - t8;
+    t9 = C39 * t7;
+    t0 = (-C40) * t7;
+    t11 = t3 + t12;
+    t6 = t2 + t14;
+    t10 = t13 + t0;
+    t5 = t4 - t9;
+    t1 = t13 - t0;
+    t8 = t4 + t9;
+    re[162] = t11;
+    im[162] = t6;
+    re[42] = t10;
+    im[42] = t5;
+    re[102] = t1;
+    im[102] = t8;
+    t7 = X[4];
+    t3 = C41 * t7;
+    t12 = (-C42) * t7;
+    t2 = X[115];
+    t14 = C43 * t2;
+    t13 = C44 * t2;
+    t0 = 0.43730985356969787 * t2;
+    t4 = t3 - t0;
+    t9 = 0.24240481012316853 * t2;
+    t11 = t12 - t9;
+    t6 = (-0.7574428850332227) * t2;
+    t10 = (-0.4198574471324144) * t2;
+    t5 = t3 + t14;
+    t1 = t12 + t13;
+    t8 = t4 + t10;
+    t7 = t11 - t6;
+    t0 = t4 - t10;
+    t9 = t11 + t6;
+    t2 = t8 + t7;
+    t3 = C8 * t2;
+    t14 = t8 * (-C9);
+    t12 = t7 * C10;
+    t13 = t3 - t12;
+    t4 = t3 + t14;
+    t10 = t0 + t9;
+    t11 = C11 * t10;
+    t6 = t0 * (-C12);
+    t2 = t9 * (-C13);
+    t8 = t11 - t2;
+    t7 = t11 + t6;
+    re[2] = t5;
+    im[2] = t1;
+    re[62] = t13;
+    im[62] = t4;
+    re[122] = t8;
+    im[122] = t7;
+    t12 = X[44];
+    t3 = C45 * t12;
+    t14 = (-C46) * t12;
+    t10 = X[75];
+    t0 = C47 * t10;
+    t9 = C48 * t10;
+    t2 = 0.4727592877996584 * t10;
+    t11 = t3 - t2;
+    t6 = 0.16278407722857835 * t10;
+    t5 = t14 - t6;
+    t1 = (-0.8188431062190856) * t10;
+    t13 = (-0.2819502924231136) * t10;
+    t4 = t3 + t0;
+    t8 = t14 + t9;
+    t7 = t11 + t13;
+    t12 = t5 - t1;
+    t2 = t11 - t13;
+    t6 = t5 + t1;
+    t10 = t7 + t12;
+    t3 = C11 * t10;
+    t0 = t7 * (-C12);
+    t14 = t12 * (-C13);
+    t9 = t3 - t14;
+    t11 = t3 + t0;
+    t13 = t2 + t6;
+    t5 = (-C14) * t13;
+    t1 = t2 * C15;
+    t10 = t6 * (-C16);
+    t7 = t5 - t10;
+    t12 = t5 + t1;
+    re[22] = t4;
+    im[22] = t8;
+    re[82] = t9;
+    im[82] = t11;
+    re[142] = t7;
+    im[142] = t12;
+    t14 = re[162];
+    t3 = im[162];
+    t0 = re[2];
+    t13 = im[2];
+    t2 = re[22];
+    t6 = im[22];
+    t10 = t0 + t2;
+    t5 = t13 + t6;
+    t1 = C2 * t10;
+    t4 = t14 - t1;
+    t8 = C2 * t5;
+    t9 = t3 - t8;
+    t11 = t0 - t2;
+    t7 = C3 * t11;
+    t12 = t13 - t6;
+    t1 = C3 * t12;
+    t8 = t14 + t10;
+    t0 = t3 + t5;
+    t2 = t4 + t1;
+    t11 = t9 - t7;
+    t13 = t4 - t1;
+    t6 = t9 + t7;
+    re[162] = t8;
+    im[162] = t0;
+    re[2] = t2;
+    im[2] = t11;
+    re[22] = t13;
+    im[22] = t6;
+    t12 = re[42];
+    t14 = im[42];
+    t10 = re[62];
+    t3 = im[62];
+    t5 = re[82];
+    t4 = im[82];
+    t1 = t10 + t5;
+    t9 = t3 + t4;
+    t7 = C2 * t1;
+    t8 = t12 - t7;
+    t0 = C2 * t9;
+    t2 = t14 - t0;
+    t11 = t10 - t5;
+    t13 = C3 * t11;
+    t6 = t3 - t4;
+    t7 = C3 * t6;
+    t0 = t12 + t1;
+    t10 = t14 + t9;
+    t5 = t8 + t7;
+    t11 = t2 - t13;
+    t3 = t8 - t7;
+    t4 = t2 + t13;
+    re[42] = t0;
+    im[42] = t10;
+    re[62] = t5;
+    im[62] = t11;
+    re[82] = t3;
+    im[82] = t4;
+    t6 = re[102];
+    t12 = im[102];
+    t1 = re[122];
+    t14 = im[122];
+    t9 = re[142];
+    t8 = im[142];
+    t7 = t1 + t9;
+    t2 = t14 + t8;
+    t13 = C2 * t7;
+    t0 = t6 - t13;
+    t10 = C2 * t2;
+    t5 = t12 - t10;
+    t11 = t1 - t9;
+    t3 = C3 * t11;
+    t4 = t14 - t8;
+    t13 = C3 * t4;
+    t10 = t6 + t7;
+    t1 = t12 + t2;
+    t9 = t0 + t13;
+    t11 = t5 - t3;
+    t14 = t0 - t13;
+    t8 = t5 + t3;
+    re[102] = t10;
+    im[102] = t1;
+    re[122] = t9;
+    im[122] = t11;
+    re[142] = t14;
+    im[142] = t8;
+    t4 = X[36];
+    t6 = C33 * t4;
+    t7 = (-C34) * t4;
+    t12 = X[83];
+    t2 = C35 * t12;
+    t0 = C36 * t12;
+    t13 = C37 * t12;
+    t5 = t6 - t13;
+    t3 = C38 * t12;
+    t10 = t7 - t3;
+    t1 = (-C39) * t12;
+    t9 = (-C40) * t12;
+    t11 = t6 + t2;
+    t14 = t7 + t0;
+    t8 = t5 + t9;
+    t4 = t10 - t1;
+    t13 = t5 - t9;
+    t3 = t10 + t1;
+    re[18] = t11;
+    im[18] = t14;
+    re[78] = t8;
+    im[78] = t4;
+    re[138] = t13;
+    im[138] = t3;
+    t12 = X[76];
+    t6 = C47 * t12;
+    t2 = (-C48) * t12;
+    t7 = X[43];
+    t0 = C45 * t7;
+    t5 = C46 * t7;
+    t9 = 0.490813591723832 * t7;
+    t10 = t6 - t9;
+    t1 = 0.0954044976882724 * t7;
+    t11 = t2 - t1;
+    t14 = (-0.8501140779110443) * t7;
+    t8 = (-0.1652454372666753) * t7;
+    t4 = t6 + t0;
+    t13 = t2 + t5;
+    t3 = t10 + t8;
+    t12 = t11 - t14;
+    t9 = t10 - t8;
+    t1 = t11 + t14;
+    t7 = t3 + t12;
+    t6 = C8 * t7;
+    t0 = t3 * (-C9);
+    t2 = t12 * C10;
+    t5 = t6 - t2;
+    t10 = t6 + t0;
+    t8 = t9 + t1;
+    t11 = C11 * t8;
+    t14 = t9 * (-C12);
+    t7 = t1 * (-C13);
+    t3 = t11 - t7;
+    t12 = t11 + t14;
+    re[38] = t4;
+    im[38] = t13;
+    re[98] = t5;
+    im[98] = t10;
+    re[158] = t3;
+    im[158] = t12;
+    t2 = X[116];
+    t6 = C43 * t2;
+    t0 = (-C44) * t2;
+    t8 = X[3];
+    t9 = C41 * t8;
+    t1 = C42 * t8;
+    t7 = 0.49992384757819563 * t8;
+    t11 = t6 - t7;
+    t14 = 0.008726203218641756 * t8;
+    t4 = t0 - t14;
+    t13 = (-0.865893503920754) * t8;
+    t5 = (-0.015114227331858588) * t8;
+    t10 = t6 + t9;
+    t3 = t0 + t1;
+    t12 = t11 + t5;
+    t2 = t4 - t13;
+    t7 = t11 - t5;
+    t14 = t4 + t13;
+    t8 = t12 + t2;
+    t6 = C11 * t8;
+    t9 = t12 * (-C12);
+    t0 = t2 * (-C13);
+    t1 = t6 - t0;
+    t11 = t6 + t9;
+    t5 = t7 + t14;
+    t4 = (-C14) * t5;
+    t13 = t7 * C15;
+    t8 = t14 * (-C16);
+    t12 = t4 - t8;
+    t2 = t4 + t13;
+    re[58] = t10;
+    im[58] = t3;
+    re[118] = t1;
+    im[118] = t11;
+    re[178] = t12;
+    im[178] = t2;
+    t0 = re[18];
+    t6 = im[18];
+    t9 = re[38];
+    t5 = im[38];
+    t7 = re[58];
+    t14 = im[58];
+    t8 = t9 + t7;
+    t4 = t5 + t14;
+    t13 = C2 * t8;
+    t10 = t0 - t13;
+    t3 = C2 * t4;
+    t1 = t6 - t3;
+    t11 = t9 - t7;
+    t12 = C3 * t11;
+    t2 = t5 - t14;
+    t13 = C3 * t2;
+    t3 = t0 + t8;
+    t9 = t6 + t4;
+    t7 = t10 + t13;
+    t11 = t1 - t12;
+    t5 = t10 - t13;
+    t14 = t1 + t12;
+    re[18] = t3;
+    im[18] = t9;
+    re[38] = t7;
+    im[38] = t11;
+    re[58] = t5;
+    im[58] = t14;
+    t2 = re[78];
+    t0 = im[78];
+    t8 = re[98];
+    t6 = im[98];
+    t4 = re[118];
+    t10 = im[118];
+    t13 = t8 + t4;
+    t1 = t6 + t10;
+    t12 = C2 * t13;
+    t3 = t2 - t12;
+    t9 = C2 * t1;
+    t7 = t0 - t9;
+    t11 = t8 - t4;
+    t5 = C3 * t11;
+    t14 = t6 - t10;
+    t12 = C3 * t14;
+    t9 = t2 + t13;
+    t8 = t0 + t1;
+    t4 = t3 + t12;
+    t11 = t7 - t5;
+    t6 = t3 - t12;
+    t10 = t7 + t5;
+    re[78] = t9;
+    im[78] = t8;
+    re[98] = t4;
+    im[98] = t11;
+    re[118] = t6;
+    im[118] = t10;
+    t14 = re[138];
+    t2 = im[138];
+    t13 = re[158];
+    t0 = im[158];
+    t1 = re[178];
+    t3 = im[178];
+    t12 = t13 + t1;
+    t7 = t0 + t3;
+    t5 = C2 * t12;
+    t9 = t14 - t5;
+    t8 = C2 * t7;
+    t4 = t2 - t8;
+    t11 = t13 - t1;
+    t6 = C3 * t11;
+    t10 = t0 - t3;
+    t5 = C3 * t10;
+    t8 = t14 + t12;
+    t13 = t2 + t7;
+    t1 = t9 + t5;
+    t11 = t4 - t6;
+    t0 = t9 - t5;
+    t3 = t4 + t6;
+    re[138] = t8;
+    im[138] = t13;
+    re[158] = t1;
+    im[158] = t11;
+    re[178] = t0;
+    im[178] = t3;
+    t10 = X[108];
+    t14 = C17 * t10;
+    t12 = (-C18) * t10;
+    t2 = X[11];
+    t7 = C19 * t2;
+    t9 = C20 * t2;
+    t5 = C21 * t2;
+    t4 = t14 - t5;
+    t6 = C22 * t2;
+    t8 = t12 - t6;
+    t13 = (-C23) * t2;
+    t1 = (-C24) * t2;
+    t11 = t14 + t7;
+    t0 = t12 + t9;
+    t3 = t4 + t1;
+    t10 = t8 - t13;
+    t5 = t4 - t1;
+    t6 = t8 + t13;
+    re[54] = t11;
+    im[54] = t0;
+    re[114] = t3;
+    im[114] = t10;
+    re[174] = t5;
+    im[174] = t6;
+    t2 = X[91];
+    t14 = C31 * t2;
+    t7 = C32 * t2;
+    t12 = X[28];
+    t9 = C29 * t12;
+    t4 = (-C30) * t12;
+    t1 = t14 + t9;
+    t8 = t7 + t4;
+    t13 = C2 * t1;
+    t11 = -t13;
+    t0 = C2 * t8;
+    t3 = -t0;
+    t10 = t14 - t9;
+    t5 = C3 * t10;
+    t6 = t7 - t4;
+    t2 = C3 * t6;
+    t12 = t2 - t13;
+    t14 = t3 - t5;
+    t9 = t11 - t2;
+    t10 = t5 - t0;
+    t7 = t12 + t14;
+    t4 = C8 * t7;
+    t6 = t12 * (-C9);
+    t13 = t14 * C10;
+    t3 = t4 - t13;
+    t11 = t4 + t6;
+    t2 = t9 + t10;
+    t5 = C11 * t2;
+    t0 = t9 * (-C12);
+    t7 = t10 * (-C13);
+    t12 = t5 - t7;
+    t14 = t5 + t0;
+    re[74] = t1;
+    im[74] = t8;
+    re[134] = t3;
+    im[134] = t11;
+    re[14] = t12;
+    im[14] = t14;
+    t13 = X[51];
+    t4 = C27 * t13;
+    t6 = C28 * t13;
+    t2 = X[68];
+    t9 = C25 * t2;
+    t10 = (-C26) * t2;
+    t7 = t4 + t9;
+    t5 = t6 + t10;
+    t0 = C2 * t7;
+    t1 = -t0;
+    t8 = C2 * t5;
+    t3 = -t8;
+    t11 = t4 - t9;
+    t12 = C3 * t11;
+    t14 = t6 - t10;
+    t13 = C3 * t14;
+    t2 = t13 - t0;
+    t4 = t3 - t12;
+    t9 = t1 - t13;
+    t11 = t12 - t8;
+    t6 = t2 + t4;
+    t10 = C11 * t6;
+    t14 = t2 * (-C12);
+    t0 = t4 * (-C13);
+    t3 = t10 - t0;
+    t1 = t10 + t14;
+    t13 = t9 + t11;
+    t12 = (-C14) * t13;
+    t8 = t9 * C15;
+    t6 = t11 * (-C16);
+    t2 = t12 - t6;
+    t4 = t12 + t8;
+    re[94] = t7;
+    im[94] = t5;
+    re[154] = t3;
+    im[154] = t1;
+    re[34] = t2;
+    im[34] = t4;
+    t0 = re[54];
+    t10 = im[54];
+    t14 = re[74];
+    t13 = im[74];
+    t9 = re[94];
+    t11 = im[94];
+    t6 = t14 + t9;
+    t12 = t13 + t11;
+    t8 = C2 * t6;
+    t7 = t0 - t8;
+    t5 = C2 * t12;
+    t3 = t10 - t5;
+    t1 = t14 - t9;
+    t2 = C3 * t1;
+    t4 = t13 - t11;
+    t8 = C3 * t4;
+    t5 = t0 + t6;
+    t14 = t10 + t12;
+    t9 = t7 + t8;
+    t1 = t3 - t2;
+    t13 = t7 - t8;
+    t11 = t3 + t2;
+    re[54] = t5;
+    im[54] = t14;
+    re[74] = t9;
+    im[74] = t1;
+    re[94] = t13;
+    im[94] = t11;
+    t4 = re[114];
+    t0 = im[114];
+    t6 = re[134];
+    t10 = im[134];
+    t12 = re[154];
+    t7 = im[154];
+    t8 = t6 + t12;
+    t3 = t10 + t7;
+    t2 = C2 * t8;
+    t5 = t4 - t2;
+    t14 = C2 * t3;
+    t9 = t0 - t14;
+    t1 = t6 - t12;
+    t13 = C3 * t1;
+    t11 = t10 - t7;
+    t2 = C3 * t11;
+    t14 = t4 + t8;
+    t6 = t0 + t3;
+    t12 = t5 + t2;
+    t1 = t9 - t13;
+    t10 = t5 - t2;
+    t7 = t9 + t13;
+    re[114] = t14;
+    im[114] = t6;
+    re[134] = t12;
+    im[134] = t1;
+    re[154] = t10;
+    im[154] = t7;
+    t11 = re[174];
+    t4 = im[174];
+    t8 = re[14];
+    t0 = im[14];
+    t3 = re[34];
+    t5 = im[34];
+    t2 = t8 + t3;
+    t9 = t0 + t5;
+    t13 = C2 * t2;
+    t14 = t11 - t13;
+    t6 = C2 * t9;
+    t12 = t4 - t6;
+    t1 = t8 - t3;
+    t10 = C3 * t1;
+    t7 = t0 - t5;
+    t13 = C3 * t7;
+    t6 = t11 + t2;
+    t8 = t4 + t9;
+    t3 = t14 + t13;
+    t1 = t12 - t10;
+    t0 = t14 - t13;
+    t5 = t12 + t10;
+    re[174] = t6;
+    im[174] = t8;
+    re[14] = t3;
+    im[14] = t1;
+    re[34] = t0;
+    im[34] = t5;
+    t7 = re[90];
+    t11 = im[90];
+    t2 = re[126];
+    t4 = im[126];
+    t9 = re[162];
+    t14 = im[162];
+    t13 = re[18];
+    t12 = im[18];
+    t10 = re[54];
+    t6 = im[54];
+    t8 = t2 + t10;
+    t3 = t4 + t6;
+    t1 = t9 + t13;
+    t0 = t14 + t12;
+    t5 = t2 - t10;
+    t2 = t4 - t6;
+    t10 = t9 - t13;
+    t4 = t14 - t12;
+    t6 = t8 + t1;
+    t9 = t3 + t0;
+    t13 = t8 - t1;
+    t14 = C49 * t13;
+    t12 = t3 - t0;
+    t8 = C49 * t12;
+    t1 = C50 * t6;
+    t13 = t7 - t1;
+    t3 = C50 * t9;
+    t0 = t11 - t3;
+    t12 = t13 + t14;
+    t1 = t0 + t8;
+    t3 = t13 - t14;
+    t13 = t0 - t8;
+    t14 = C51 * t5;
+    t0 = C52 * t10;
+    t8 = t14 + t0;
+    t14 = C51 * t2;
+    t0 = C52 * t4;
+    t14 = t14 + t0;
+    t0 = C52 * t5;
+    t5 = C51 * t10;
+    t10 = t0 - t5;
+    t0 = C52 * t2;
+    t5 = C51 * t4;
+    t2 = t0 - t5;
+    t4 = t7 + t6;
+    t0 = t11 + t9;
+    t5 = t12 + t14;
+    t7 = t1 - t8;
+    t6 = t3 + t2;
+    t11 = t13 - t10;
+    t9 = t3 - t2;
+    t3 = t13 + t10;
+    t2 = t12 - t14;
+    t13 = t1 + t8;
+    re[90] = t4;
+    im[90] = t0;
+    re[126] = t5;
+    im[126] = t7;
+    re[162] = t6;
+    im[162] = t11;
+    re[18] = t9;
+    im[18] = t3;
+    re[54] = t2;
+    im[54] = t13;
+    t10 = re[150];
+    t12 = im[150];
+    t14 = re[6];
+    t1 = im[6];
+    t8 = re[42];
+    t4 = im[42];
+    t0 = re[78];
+    t5 = im[78];
+    t7 = re[114];
+    t6 = im[114];
+    t11 = t14 + t7;
+    t9 = t1 + t6;
+    t3 = t8 + t0;
+    t2 = t4 + t5;
+    t13 = t14 - t7;
+    t14 = t1 - t6;
+    t7 = t8 - t0;
+    t1 = t4 - t5;
+    t6 = t11 + t3;
+    t8 = t9 + t2;
+    t0 = t11 - t3;
+    t4 = C49 * t0;
+    t5 = t9 - t2;
+    t11 = C49 * t5;
+    t3 = C50 * t6;
+    t0 = t10 - t3;
+    t9 = C50 * t8;
+    t2 = t12 - t9;
+    t5 = t0 + t4;
+    t3 = t2 + t11;
+    t9 = t0 - t4;
+    t0 = t2 - t11;
+    t4 = C51 * t13;
+    t2 = C52 * t7;
+    t11 = t4 + t2;
+    t4 = C51 * t14;
+    t2 = C52 * t1;
+    t4 = t4 + t2;
+    t2 = C52 * t13;
+    t13 = C51 * t7;
+    t7 = t2 - t13;
+    t2 = C52 * t14;
+    t13 = C51 * t1;
+    t14 = t2 - t13;
+    t1 = t10 + t6;
+    t2 = t12 + t8;
+    t13 = t5 + t4;
+    t10 = t3 - t11;
+    t6 = t9 + t14;
+    t12 = t0 - t7;
+    t8 = t9 - t14;
+    t9 = t0 + t7;
+    t14 = t5 - t4;
+    t0 = t3 + t11;
+    re[150] = t1;
+    im[150] = t2;
+    re[6] = t13;
+    im[6] = t10;
+    re[42] = t6;
+    im[42] = t12;
+    re[78] = t8;
+    im[78] = t9;
+    re[114] = t14;
+    im[114] = t0;
+    t7 = re[30];
+    t5 = im[30];
+    t4 = re[66];
+    t3 = im[66];
+    t11 = re[102];
+    t1 = im[102];
+    t2 = re[138];
+    t13 = im[138];
+    t10 = re[174];
+    t6 = im[174];
+    t12 = t4 + t10;
+    t8 = t3 + t6;
+    t9 = t11 + t2;
+    t14 = t1 + t13;
+    t0 = t4 - t10;
+    t4 = t3 - t6;
+    t10 = t11 - t2;
+    t3 = t1 - t13;
+    t6 = t12 + t9;
+    t11 = t8 + t14;
+    t2 = t12 - t9;
+    t1 = C49 * t2;
+    t13 = t8 - t14;
+    t12 = C49 * t13;
+    t9 = C50 * t6;
+    t2 = t7 - t9;
+    t8 = C50 * t11;
+    t14 = t5 - t8;
+    t13 = t2 + t1;
+    t9 = t14 + t12;
+    t8 = t2 - t1;
+    t2 = t14 - t12;
+    t1 = C51 * t0;
+    t14 = C52 * t10;
+    t12 = t1 + t14;
+    t1 = C51 * t4;
+    t14 = C52 * t3;
+    t1 = t1 + t14;
+    t14 = C52 * t0;
+    t0 = C51 * t10;
+    t10 = t14 - t0;
+    t14 = C52 * t4;
+    t0 = C51 * t3;
+    t4 = t14 - t0;
+    t3 = t7 + t6;
+    t14 = t5 + t11;
+    t0 = t13 + t1;
+    t7 = t9 - t12;
+    t6 = t8 + t4;
+    t5 = t2 - t10;
+    t11 = t8 - t4;
+    t8 = t2 + t10;
+    t4 = t13 - t1;
+    t2 = t9 + t12;
+    re[30] = t3;
+    im[30] = t14;
+    re[66] = t0;
+    im[66] = t7;
+    re[102] = t6;
+    im[102] = t5;
+    re[138] = t11;
+    im[138] = t8;
+    re[174] = t4;
+    im[174] = t2;
+    t10 = re[110];
+    t13 = im[110];
+    t1 = re[146];
+    t9 = im[146];
+    t12 = re[2];
+    t3 = im[2];
+    t14 = re[38];
+    t0 = im[38];
+    t7 = re[74];
+    t6 = im[74];
+    t5 = t1 + t7;
+    t11 = t9 + t6;
+    t8 = t12 + t14;
+    t4 = t3 + t0;
+    t2 = t1 - t7;
+    t1 = t9 - t6;
+    t7 = t12 - t14;
+    t9 = t3 - t0;
+    t6 = t5 + t8;
+    t12 = t11 + t4;
+    t14 = t5 - t8;
+    t3 = C49 * t14;
+    t0 = t11 - t4;
+    t5 = C49 * t0;
+    t8 = C50 * t6;
+    t14 = t10 - t8;
+    t11 = C50 * t12;
+    t4 = t13 - t11;
+    t0 = t14 + t3;
+    t8 = t4 + t5;
+    t11 = t14 - t3;
+    t14 = t4 - t5;
+    t3 = C51 * t2;
+    t4 = C52 * t7;
+    t5 = t3 + t4;
+    t3 = C51 * t1;
+    t4 = C52 * t9;
+    t3 = t3 + t4;
+    t4 = C52 * t2;
+    t2 = C51 * t7;
+    t7 = t4 - t2;
+    t4 = C52 * t1;
+    t2 = C51 * t9;
+    t1 = t4 - t2;
+    t9 = t10 + t6;
+    t4 = t13 + t12;
+    t2 = t0 + t3;
+    t10 = t8 - t5;
+    t6 = t11 + t1;
+    t13 = t14 - t7;
+    t12 = t11 - t1;
+    t11 = t14 + t7;
+    t1 = t0 - t3;
+    t14 = t8 + t5;
+    re[110] = t9;
+    im[110] = t4;
+    re[146] = t2;
+    im[146] = t10;
+    re[2] = t6;
+    im[2] = t13;
+    re[38] = t12;
+    im[38] = t11;
+    re[74] = t1;
+    im[74] = t14;
+    t7 = re[170];
+    t0 = im[170];
+    t3 = re[26];
+    t8 = im[26];
+    t5 = re[62];
+    t9 = im[62];
+    t4 = re[98];
+    t2 = im[98];
+    t10 = re[134];
+    t6 = im[134];
+    t13 = t3 + t10;
+    t12 = t8 + t6;
+    t11 = t5 + t4;
+    t1 = t9 + t2;
+    t14 = t3 - t10;
+    t3 = t8 - t6;
+    t10 = t5 - t4;
+    t8 = t9 - t2;
+    t6 = t13 + t11;
+    t5 = t12 + t1;
+    t4 = t13 - t11;
+    t9 = C49 * t4;
+    t2 = t12 - t1;
+    t13 = C49 * t2;
+    t11 = C50 * t6;
+    t4 = t7 - t11;
+    t12 = C50 * t5;
+    t1 = t0 - t12;
+    t2 = t4 + t9;
+    t11 = t1 + t13;
+    t12 = t4 - t9;
+    t4 = t1 - t13;
+    t9 = C51 * t14;
+    t1 = C52 * t10;
+    t13 = t9 + t1;
+    t9 = C51 * t3;
+    t1 = C52 * t8;
+    t9 = t9 + t1;
+    t1 = C52 * t14;
+    t14 = C51 * t10;
+    t10 = t1 - t14;
+    t1 = C52 * t3;
+    t14 = C51 * t8;
+    t3 = t1 - t14;
+    t8 = t7 + t6;
+    t1 = t0 + t5;
+    t14 = t2 + t9;
+    t7 = t11 - t13;
+    t6 = t12 + t3;
+    t0 = t4 - t10;
+    t5 = t12 - t3;
+    t12 = t4 + t10;
+    t3 = t2 - t9;
+    t4 = t11 + t13;
+    re[170] = t8;
+    im[170] = t1;
+    re[26] = t14;
+    im[26] = t7;
+    re[62] = t6;
+    im[62] = t0;
+    re[98] = t5;
+    im[98] = t12;
+    re[134] = t3;
+    im[134] = t4;
+    t10 = re[50];
+    t2 = im[50];
+    t9 = re[86];
+    t11 = im[86];
+    t13 = re[122];
+    t8 = im[122];
+    t1 = re[158];
+    t14 = im[158];
+    t7 = re[14];
+    t6 = im[14];
+    t0 = t9 + t7;
+    t5 = t11 + t6;
+    t12 = t13 + t1;
+    t3 = t8 + t14;
+    t4 = t9 - t7;
+    t9 = t11 - t6;
+    t7 = t13 - t1;
+    t11 = t8 - t14;
+    t6 = t0 + t12;
+    t13 = t5 + t3;
+    t1 = t0 - t12;
+    t8 = C49 * t1;
+    t14 = t5 - t3;
+    t0 = C49 * t14;
+    t12 = C50 * t6;
+    t1 = t10 - t12;
+    t5 = C50 * t13;
+    t3 = t2 - t5;
+    t14 = t1 + t8;
+    t12 = t3 + t0;
+    t5 = t1 - t8;
+    t1 = t3 - t0;
+    t8 = C51 * t4;
+    t3 = C52 * t7;
+    t0 = t8 + t3;
+    t8 = C51 * t9;
+    t3 = C52 * t11;
+    t8 = t8 + t3;
+    t3 = C52 * t4;
+    t4 = C51 * t7;
+    t7 = t3 - t4;
+    t3 = C52 * t9;
+    t4 = C51 * t11;
+    t9 = t3 - t4;
+    t11 = t10 + t6;
+    t3 = t2 + t13;
+    t4 = t14 + t8;
+    t10 = t12 - t0;
+    t6 = t5 + t9;
+    t2 = t1 - t7;
+    t13 = t5 - t9;
+    t5 = t1 + t7;
+    t9 = t14 - t8;
+    t1 = t12 + t0;
+    re[50] = t11;
+    im[50] = t3;
+    re[86] = t4;
+    im[86] = t10;
+    re[122] = t6;
+    im[122] = t2;
+    re[158] = t13;
+    im[158] = t5;
+    re[14] = t9;
+    im[14] = t1;
+    t7 = re[130];
+    t14 = im[130];
+    t8 = re[166];
+    t12 = im[166];
+    t0 = re[22];
+    t11 = im[22];
+    t3 = re[58];
+    t4 = im[58];
+    t10 = re[94];
+    t6 = im[94];
+    t2 = t8 + t10;
+    t13 = t12 + t6;
+    t5 = t0 + t3;
+    t9 = t11 + t4;
+    t1 = t8 - t10;
+    t8 = t12 - t6;
+    t10 = t0 - t3;
+    t12 = t11 - t4;
+    t6 = t2 + t5;
+    t0 = t13 + t9;
+    t3 = t2 - t5;
+    t11 = C49 * t3;
+    t4 = t13 - t9;
+    t2 = C49 * t4;
+    t5 = C50 * t6;
+    t3 = t7 - t5;
+    t13 = C50 * t0;
+    t9 = t14 - t13;
+    t4 = t3 + t11;
+    t5 = t9 + t2;
+    t13 = t3 - t11;
+    t3 = t9 - t2;
+    t11 = C51 * t1;
+    t9 = C52 * t10;
+    t2 = t11 + t9;
+    t11 = C51 * t8;
+    t9 = C52 * t12;
+    t11 = t11 + t9;
+    t9 = C52 * t1;
+    t1 = C51 * t10;
+    t10 = t9 - t1;
+    t9 = C52 * t8;
+    t1 = C51 * t12;
+    t8 = t9 - t1;
+    t12 = t7 + t6;
+    t9 = t14 + t0;
+    t1 = t4 + t11;
+    t7 = t5 - t2;
+    t6 = t13 + t8;
+    t14 = t3 - t10;
+    t0 = t13 - t8;
+    t13 = t3 + t10;
+    t8 = t4 - t11;
+    t3 = t5 + t2;
+    re[130] = t12;
+    im[130] = t9;
+    re[166] = t1;
+    im[166] = t7;
+    re[22] = t6;
+    im[22] = t14;
+    re[58] = t0;
+    im[58] = t13;
+    re[94] = t8;
+    im[94] = t3;
+    t10 = re[10];
+    t4 = im[10];
+    t11 = re[46];
+    t5 = im[46];
+    t2 = re[82];
+    t12 = im[82];
+    t9 = re[118];
+    t1 = im[118];
+    t7 = re[154];
+    t6 = im[154];
+    t14 = t11 + t7;
+    t0 = t5 + t6;
+    t13 = t2 + t9;
+    t8 = t12 + t1;
+    t3 = t11 - t7;
+    t11 = t5 - t6;
+    t7 = t2 - t9;
+    t5 = t12 - t1;
+    t6 = t14 + t13;
+    t2 = t0 + t8;
+    t9 = t14 - t13;
+    t12 = C49 * t9;
+    t1 = t0 - t8;
+    t14 = C49 * t1;
+    t13 = C50 * t6;
+    t9 = t10 - t13;
+    t0 = C50 * t2;
+    t8 = t4 - t0;
+    t1 = t9 + t12;
+    t13 = t8 + t14;
+    t0 = t9 - t12;
+    t9 = t8 - t14;
+    t12 = C51 * t3;
+    t8 = C52 * t7;
+    t14 = t12 + t8;
+    t12 = C51 * t11;
+    t8 = C52 * t5;
+    t12 = t12 + t8;
+    t8 = C52 * t3;
+    t3 = C51 * t7;
+    t7 = t8 - t3;
+    t8 = C52 * t11;
+    t3 = C51 * t5;
+    t11 = t8 - t3;
+    t5 = t10 + t6;
+    t8 = t4 + t2;
+    t3 = t1 + t12;
+    t10 = t13 - t14;
+    t6 = t0 + t11;
+    t4 = t9 - t7;
+    t2 = t0 - t11;
+    t0 = t9 + t7;
+    t11 = t1 - t12;
+    t9 = t13 + t14;
+    re[10] = t5;
+    im[10] = t8;
+    re[46] = t3;
+    im[46] = t10;
+    re[82] = t6;
+    im[82] = t4;
+    re[118] = t2;
+    im[118] = t0;
+    re[154] = t11;
+    im[154] = t9;
+    t7 = re[70];
+    t1 = im[70];
+    t12 = re[106];
+    t13 = im[106];
+    t14 = re[142];
+    t5 = im[142];
+    t8 = re[178];
+    t3 = im[178];
+    t10 = re[34];
+    t6 = im[34];
+    t4 = t12 + t10;
+    t2 = t13 + t6;
+    t0 = t14 + t8;
+    t11 = t5 + t3;
+    t9 = t12 - t10;
+    t12 = t13 - t6;
+    t10 = t14 - t8;
+    t13 = t5 - t3;
+    t6 = t4 + t0;
+    t14 = t2 + t11;
+    t8 = t4 - t0;
+    t5 = C49 * t8;
+    t3 = t2 - t11;
+    t4 = C49 * t3;
+    t0 = C50 * t6;
+    t8 = t7 - t0;
+    t2 = C50 * t14;
+    t11 = t1 - t2;
+    t3 = t8 + t5;
+    t0 = t11 + t4;
+    t2 = t8 - t5;
+    t8 = t11 - t4;
+    t5 = C51 * t9;
+    t11 = C52 * t10;
+    t4 = t5 + t11;
+    t5 = C51 * t12;
+    t11 = C52 * t13;
+    t5 = t5 + t11;
+    t11 = C52 * t9;
+    t9 = C51 * t10;
+    t10 = t11 - t9;
+    t11 = C52 * t12;
+    t9 = C51 * t13;
+    t12 = t11 - t9;
+    t13 = t7 + t6;
+    t11 = t1 + t14;
+    t9 = t3 + t5;
+    t7 = t0 - t4;
+    t6 = t2 + t12;
+    t1 = t8 - t10;
+    t14 = t2 - t12;
+    t2 = t8 + t10;
+    t12 = t3 - t5;
+    t8 = t0 + t4;
+    re[70] = t13;
+    im[70] = t11;
+    re[106] = t9;
+    im[106] = t7;
+    re[142] = t6;
+    im[142] = t1;
+    re[178] = t14;
+    im[178] = t2;
+    re[34] = t12;
+    im[34] = t8;
+}
+
+/**
+ *  Part 4 of ApplyWindowedIMDCT_W75_360_K120().
+ * 
+ *  @param {Number[]} X 
+ *    - The input block (360 points, only the first 120 points are used).
+ *  @param {Number[]} y 
+ *    - The array that would contain the output block (720 points).
+ *  @param {Number[]} re 
+ *    - The scratch buffer (real part, 180 points).
+ *  @param {Number[]} im 
+ *    - The scratch buffer (imaginary part, 180 points).
+ */
+function ApplyWindowedIMDCT_W75_360_K120_Part4(X, y, re, im) {
+    let t0, t1, t10, t11, t12, t13, t14, t2, t3, t4, t5, t6, t7, t8, t9;
+    const C0 = 0.766044443118978;
+    const C1 = 1.4088320528055172;
+    const C2 = 0.12325683343243876;
+    const C3 = 0.17364817766693033;
+    const C4 = 1.1584559306791384;
+    const C5 = 0.8111595753452777;
+    const C6 = 0.9396926207859084;
+    const C7 = 0.5976724774602398;
+    const C8 = 1.281712764111577;
+    const C9 = 0.5;
+    const C10 = 0.8660254037844386;
+    const C11 = 0.5590169943749475;
+    const C12 = 0.25;
+    const C13 = 0.9510565162951535;
+    const C14 = 0.5877852522924731;
+    const C15 = 0.9999976201773518;
+    const C16 = 0.0021816598343367697;
+    const C17 = 0.9230424487681941;
+    const C18 = 0.384698112514236;
+    const C19 = 0.7055624319347131;
+    const C20 = 0.7086477648609169;
+    const C21 = 0.38066693077854463;
+    const C22 = 0.9247122189155081;
+    const C23 = 0.37258290214410295;
+    const C24 = 0.9279989121921846;
+    const C25 = 0.9999405050001497;
+    const C26 = 0.010908091494182374;
+    const C27 = 0.9196502204050923;
+    const C28 = 0.39273842708457407;
+    const C29 = 0.6993515264033671;
+    const C30 = 0.7147778973340464;
+    const C31 = 0.6930873625456359;
+    const C32 = 0.7208535967029188;
+    const C33 = 0.36447049987914965;
+    const C34 = 0.9312149347588036;
+    const C35 = 0.9998072404820648;
+    const C36 = 0.0196336924606283;
+    const C37 = 0.916187957117136;
+    const C38 = 0.40074883310314097;
+    const C39 = 0.9126559225690792;
+    const C40 = 0.40872872054650483;
+    const C41 = 0.68677041740185;
+    const C42 = 0.7268744002795041;
+    const C43 = 0.3563303417745256;
+    const C44 = 0.9343600417027955;
+    const C45 = 0.9995978367717061;
+    const C46 = 0.02835779824537842;
+    const C47 = 0.9993123098159769;
+    const C48 = 0.037079744474000476;
+    const C49 = 0.9090543857390279;
+    const C50 = 0.4166774817153415;
+    const C51 = 0.6804011720318391;
+    const C52 = 0.7328398495562994;
+    const C53 = 0.34816304773478646;
+    const C54 = 0.9374339935120898;
+    const C55 = 0.3399692397309942;
+    const C56 = 0.9404365560933549;
+    const C57 = 0.9989506813588601;
+    const C58 = 0.04579886693652077;
+    const C59 = 0.9053836208979552;
+    const C60 = 0.4245945112807131;
+    const C61 = 0.6739801114782978;
+    const C62 = 0.7387494902412463;
+    t10 = X[89];
+    t3 = 0.9238795325112867 * t10;
+    t5 = 0.3826834323650898 * t10;
+    t0 = X[30];
+    t4 = 0.9914448613738104 * t0;
+    t13 = (-0.13052619222005157) * t0;
+    t11 = 0.4957224306869052 * t0;
+    t9 = t3 - t11;
+    t7 = (-0.06526309611002579) * t0;
+    t6 = t5 - t7;
+    t1 = 0.8586164364012608 * t0;
+    t14 = (-0.11303899832181541) * t0;
+    t2 = t3 + t4;
+    t12 = t5 + t13;
+    t8 = t9 + t14;
+    t10 = t6 - t1;
+    t11 = t9 - t14;
+    t7 = t6 + t1;
+    re[135] = t2;
+    im[135] = t12;
+    re[15] = t8;
+    im[15] = t10;
+    re[75] = t11;
+    im[75] = t7;
+    t0 = X[49];
+    t3 = 0.9762960071199334 * t0;
+    t4 = 0.21643961393810288 * t0;
+    t5 = X[70];
+    t13 = 0.9537169507482269 * t5;
+    t9 = (-0.3007057995042731) * t5;
+    t14 = 0.47685847537411347 * t5;
+    t6 = t3 - t14;
+    t1 = (-0.15035289975213656) * t5;
+    t2 = t4 - t1;
+    t12 = 0.8259431073677967 * t5;
+    t8 = (-0.26041886143601056) * t5;
+    t10 = t3 + t13;
+    t11 = t4 + t9;
+    t7 = t6 + t8;
+    t0 = t2 - t12;
+    t14 = t6 - t8;
+    t1 = t2 + t12;
+    t5 = t7 + t0;
+    t3 = C0 * t5;
+    t13 = t7 * (-C1);
+    t4 = t0 * C2;
+    t9 = t3 - t4;
+    t6 = t3 + t13;
+    t8 = t14 + t1;
+    t2 = C3 * t8;
+    t12 = t14 * (-C4);
+    t5 = t1 * (-C5);
+    t7 = t2 - t5;
+    t0 = t2 + t12;
+    re[155] = t10;
+    im[155] = t11;
+    re[35] = t9;
+    im[35] = t6;
+    re[95] = t7;
+    im[95] = t0;
+    t4 = X[9];
+    t3 = 0.9990482215818578 * t4;
+    t13 = 0.043619387365336 * t4;
+    t8 = X[110];
+    t14 = 0.8870108331782217 * t8;
+    t1 = (-0.4617486132350339) * t8;
+    t5 = 0.44350541658911086 * t8;
+    t2 = t3 - t5;
+    t12 = (-0.23087430661751696) * t8;
+    t10 = t13 - t12;
+    t11 = 0.7681739149643407 * t8;
+    t9 = (-0.3998860292237748) * t8;
+    t6 = t3 + t14;
+    t7 = t13 + t1;
+    t0 = t2 + t9;
+    t4 = t10 - t11;
+    t5 = t2 - t9;
+    t12 = t10 + t11;
+    t8 = t0 + t4;
+    t3 = C3 * t8;
+    t14 = t0 * (-C4);
+    t13 = t4 * (-C5);
+    t1 = t3 - t13;
+    t2 = t3 + t14;
+    t9 = t5 + t12;
+    t10 = (-C6) * t9;
+    t11 = t5 * C7;
+    t8 = t12 * (-C8);
+    t0 = t10 - t8;
+    t4 = t10 + t11;
+    re[175] = t6;
+    im[175] = t7;
+    re[55] = t1;
+    im[55] = t2;
+    re[115] = t0;
+    im[115] = t4;
+    t13 = re[135];
+    t3 = im[135];
+    t14 = re[155];
+    t9 = im[155];
+    t5 = re[175];
+    t12 = im[175];
+    t8 = t14 + t5;
+    t10 = t9 + t12;
+    t11 = C9 * t8;
+    t6 = t13 - t11;
+    t7 = C9 * t10;
+    t1 = t3 - t7;
+    t2 = t14 - t5;
+    t0 = C10 * t2;
+    t4 = t9 - t12;
+    t11 = C10 * t4;
+    t7 = t13 + t8;
+    t14 = t3 + t10;
+    t5 = t6 + t11;
+    t2 = t1 - t0;
+    t9 = t6 - t11;
+    t12 = t1 + t0;
+    re[135] = t7;
+    im[135] = t14;
+    re[155] = t5;
+    im[155] = t2;
+    re[175] = t9;
+    im[175] = t12;
+    t4 = re[15];
+    t13 = im[15];
+    t8 = re[35];
+    t3 = im[35];
+    t10 = re[55];
+    t6 = im[55];
+    t11 = t8 + t10;
+    t1 = t3 + t6;
+    t0 = C9 * t11;
+    t7 = t4 - t0;
+    t14 = C9 * t1;
+    t5 = t13 - t14;
+    t2 = t8 - t10;
+    t9 = C10 * t2;
+    t12 = t3 - t6;
+    t0 = C10 * t12;
+    t14 = t4 + t11;
+    t8 = t13 + t1;
+    t10 = t7 + t0;
+    t2 = t5 - t9;
+    t3 = t7 - t0;
+    t6 = t5 + t9;
+    re[15] = t14;
+    im[15] = t8;
+    re[35] = t10;
+    im[35] = t2;
+    re[55] = t3;
+    im[55] = t6;
+    t12 = re[75];
+    t4 = im[75];
+    t11 = re[95];
+    t13 = im[95];
+    t1 = re[115];
+    t7 = im[115];
+    t0 = t11 + t1;
+    t5 = t13 + t7;
+    t9 = C9 * t0;
+    t14 = t12 - t9;
+    t8 = C9 * t5;
+    t10 = t4 - t8;
+    t2 = t11 - t1;
+    t3 = C10 * t2;
+    t6 = t13 - t7;
+    t9 = C10 * t6;
+    t8 = t12 + t0;
+    t11 = t4 + t5;
+    t1 = t14 + t9;
+    t2 = t10 - t3;
+    t13 = t14 - t9;
+    t7 = t10 + t3;
+    re[75] = t8;
+    im[75] = t11;
+    re[95] = t1;
+    im[95] = t2;
+    re[115] = t13;
+    im[115] = t7;
+    t6 = X[17];
+    t12 = 0.996917333733128 * t6;
+    t0 = 0.07845909572784494 * t6;
+    t4 = X[102];
+    t5 = 0.9025852843498606 * t4;
+    t14 = (-0.4305110968082951) * t4;
+    t9 = 0.4512926421749303 * t4;
+    t10 = t12 - t9;
+    t3 = (-0.21525554840414754) * t4;
+    t8 = t0 - t3;
+    t11 = 0.7816617853289803 * t4;
+    t1 = (-0.3728335464470853) * t4;
+    t2 = t12 + t5;
+    t13 = t0 + t14;
+    t7 = t10 + t1;
+    t6 = t8 - t11;
+    t9 = t10 - t1;
+    t3 = t8 + t11;
+    re[171] = t2;
+    im[171] = t13;
+    re[51] = t7;
+    im[51] = t6;
+    re[111] = t9;
+    im[111] = t3;
+    t4 = X[22];
+    t12 = 0.9953961983671789 * t4;
+    t5 = (-0.09584575252022398) * t4;
+    t0 = X[97];
+    t14 = 0.9099612708765432 * t0;
+    t10 = 0.41469324265623897 * t0;
+    t1 = 0.4549806354382716 * t0;
+    t8 = t12 - t1;
+    t11 = 0.20734662132811948 * t0;
+    t2 = t5 - t11;
+    t13 = (-0.7880495770390592) * t0;
+    t7 = (-0.3591348829180475) * t0;
+    t6 = t12 + t14;
+    t9 = t5 + t10;
+    t3 = t8 + t7;
+    t4 = t2 - t13;
+    t1 = t8 - t7;
+    t11 = t2 + t13;
+    t0 = t3 + t4;
+    t12 = C0 * t0;
+    t14 = t3 * (-C1);
+    t5 = t4 * C2;
+    t10 = t12 - t5;
+    t8 = t12 + t14;
+    t7 = t1 + t11;
+    t2 = C3 * t7;
+    t13 = t1 * (-C4);
+    t0 = t11 * (-C5);
+    t3 = t2 - t0;
+    t4 = t2 + t13;
+    re[11] = t6;
+    im[11] = t9;
+    re[71] = t10;
+    im[71] = t8;
+    re[131] = t3;
+    im[131] = t4;
+    t5 = X[62];
+    t12 = 0.963630453208623 * t5;
+    t14 = (-0.26723837607825685) * t5;
+    t7 = X[57];
+    t1 = 0.9681476403781077 * t7;
+    t11 = 0.25038000405444144 * t7;
+    t0 = 0.48407382018905387 * t7;
+    t2 = t12 - t0;
+    t13 = 0.12519000202722072 * t7;
+    t6 = t14 - t13;
+    t9 = (-0.8384404511814022) * t7;
+    t10 = (-0.21683544411079703) * t7;
+    t8 = t12 + t1;
+    t3 = t14 + t11;
+    t4 = t2 + t10;
+    t5 = t6 - t9;
+    t0 = t2 - t10;
+    t13 = t6 + t9;
+    t7 = t4 + t5;
+    t12 = C3 * t7;
+    t1 = t4 * (-C4);
+    t14 = t5 * (-C5);
+    t11 = t12 - t14;
+    t2 = t12 + t1;
+    t10 = t0 + t13;
+    t6 = (-C6) * t10;
+    t9 = t0 * C7;
+    t7 = t13 * (-C8);
+    t4 = t6 - t7;
+    t5 = t6 + t9;
+    re[31] = t8;
+    im[31] = t3;
+    re[91] = t11;
+    im[91] = t2;
+    re[151] = t4;
+    im[151] = t5;
+    t14 = re[171];
+    t12 = im[171];
+    t1 = re[11];
+    t10 = im[11];
+    t0 = re[31];
+    t13 = im[31];
+    t7 = t1 + t0;
+    t6 = t10 + t13;
+    t9 = C9 * t7;
+    t8 = t14 - t9;
+    t3 = C9 * t6;
+    t11 = t12 - t3;
+    t2 = t1 - t0;
+    t4 = C10 * t2;
+    t5 = t10 - t13;
+    t9 = C10 * t5;
+    t3 = t14 + t7;
+    t1 = t12 + t6;
+    t0 = t8 + t9;
+    t2 = t11 - t4;
+    t10 = t8 - t9;
+    t13 = t11 + t4;
+    re[171] = t3;
+    im[171] = t1;
+    re[11] = t0;
+    im[11] = t2;
+    re[31] = t10;
+    im[31] = t13;
+    t5 = re[51];
+    t14 = im[51];
+    t7 = re[71];
+    t12 = im[71];
+    t6 = re[91];
+    t8 = im[91];
+    t9 = t7 + t6;
+    t11 = t12 + t8;
+    t4 = C9 * t9;
+    t3 = t5 - t4;
+    t1 = C9 * t11;
+    t0 = t14 - t1;
+    t2 = t7 - t6;
+    t10 = C10 * t2;
+    t13 = t12 - t8;
+    t4 = C10 * t13;
+    t1 = t5 + t9;
+    t7 = t14 + t11;
+    t6 = t3 + t4;
+    t2 = t0 - t10;
+    t12 = t3 - t4;
+    t8 = t0 + t10;
+    re[51] = t1;
+    im[51] = t7;
+    re[71] = t6;
+    im[71] = t2;
+    re[91] = t12;
+    im[91] = t8;
+    t13 = re[111];
+    t5 = im[111];
+    t9 = re[131];
+    t14 = im[131];
+    t11 = re[151];
+    t3 = im[151];
+    t4 = t9 + t11;
+    t0 = t14 + t3;
+    t10 = C9 * t4;
+    t1 = t13 - t10;
+    t7 = C9 * t0;
+    t6 = t5 - t7;
+    t2 = t9 - t11;
+    t12 = C10 * t2;
+    t8 = t14 - t3;
+    t10 = C10 * t8;
+    t7 = t13 + t4;
+    t9 = t5 + t0;
+    t11 = t1 + t10;
+    t2 = t6 - t12;
+    t14 = t1 - t10;
+    t3 = t6 + t12;
+    re[111] = t7;
+    im[111] = t9;
+    re[131] = t11;
+    im[131] = t2;
+    re[151] = t14;
+    im[151] = t3;
+    t8 = X[54];
+    t13 = 0.9723699203976766 * t8;
+    t4 = (-0.2334453638559054) * t8;
+    t5 = X[65];
+    t0 = 0.958819734868193 * t5;
+    t1 = 0.2840153447039226 * t5;
+    t10 = 0.4794098674340965 * t5;
+    t6 = t13 - t10;
+    t12 = 0.1420076723519613 * t5;
+    t7 = t4 - t12;
+    t9 = (-0.8303622480457152) * t5;
+    t11 = (-0.24596450357819108) * t5;
+    t2 = t13 + t0;
+    t14 = t4 + t1;
+    t3 = t6 + t11;
+    t8 = t7 - t9;
+    t10 = t6 - t11;
+    t12 = t7 + t9;
+    re[27] = t2;
+    im[27] = t14;
+    re[87] = t3;
+    im[87] = t8;
+    re[147] = t10;
+    im[147] = t12;
+    t5 = X[94];
+    t13 = 0.917060074385124 * t5;
+    t0 = (-0.3987490689252462) * t5;
+    t4 = X[25];
+    t1 = 0.9935718556765875 * t4;
+    t6 = 0.11320321376790671 * t4;
+    t11 = 0.49678592783829373 * t4;
+    t7 = t13 - t11;
+    t9 = 0.056601606883953354 * t4;
+    t2 = t0 - t9;
+    t14 = (-0.8604584675011706) * t4;
+    t3 = (-0.09803685891304753) * t4;
+    t8 = t13 + t1;
+    t10 = t0 + t6;
+    t12 = t7 + t3;
+    t5 = t2 - t14;
+    t11 = t7 - t3;
+    t9 = t2 + t14;
+    t4 = t12 + t5;
+    t13 = C0 * t4;
+    t1 = t12 * (-C1);
+    t0 = t5 * C2;
+    t6 = t13 - t0;
+    t7 = t13 + t1;
+    t3 = t11 + t9;
+    t2 = C3 * t3;
+    t14 = t11 * (-C4);
+    t4 = t9 * (-C5);
+    t12 = t2 - t4;
+    t5 = t2 + t14;
+    re[47] = t8;
+    im[47] = t10;
+    re[107] = t6;
+    im[107] = t7;
+    re[167] = t12;
+    im[167] = t5;
+    t0 = X[105];
+    t13 = 0.8949343616020251 * t0;
+    t1 = 0.44619781310980877 * t0;
+    t3 = X[14];
+    t11 = 0.9981347984218669 * t3;
+    t9 = (-0.06104853953485687) * t3;
+    t4 = t13 + t11;
+    t2 = t1 + t9;
+    t14 = C9 * t4;
+    t8 = -t14;
+    t10 = C9 * t2;
+    t6 = -t10;
+    t7 = t13 - t11;
+    t12 = C10 * t7;
+    t5 = t1 - t9;
+    t0 = C10 * t5;
+    t3 = t0 - t14;
+    t13 = t6 - t12;
+    t11 = t8 - t0;
+    t7 = t12 - t10;
+    t1 = t3 + t13;
+    t9 = C3 * t1;
+    t5 = t3 * (-C4);
+    t14 = t13 * (-C5);
+    t6 = t9 - t14;
+    t8 = t9 + t5;
+    t0 = t11 + t7;
+    t12 = (-C6) * t0;
+    t10 = t11 * C7;
+    t1 = t7 * (-C8);
+    t3 = t12 - t1;
+    t13 = t12 + t10;
+    re[67] = t4;
+    im[67] = t2;
+    re[127] = t6;
+    im[127] = t8;
+    re[7] = t3;
+    im[7] = t13;
+    t14 = re[27];
+    t9 = im[27];
+    t5 = re[47];
+    t0 = im[47];
+    t11 = re[67];
+    t7 = im[67];
+    t1 = t5 + t11;
+    t12 = t0 + t7;
+    t10 = C9 * t1;
+    t4 = t14 - t10;
+    t2 = C9 * t12;
+    t6 = t9 - t2;
+    t8 = t5 - t11;
+    t3 = C10 * t8;
+    t13 = t0 - t7;
+    t10 = C10 * t13;
+    t2 = t14 + t1;
+    t5 = t9 + t12;
+    t11 = t4 + t10;
+    t8 = t6 - t3;
+    t0 = t4 - t10;
+    t7 = t6 + t3;
+    re[27] = t2;
+    im[27] = t5;
+    re[47] = t11;
+    im[47] = t8;
+    re[67] = t0;
+    im[67] = t7;
+    t13 = re[87];
+    t14 = im[87];
+    t1 = re[107];
+    t9 = im[107];
+    t12 = re[127];
+    t4 = im[127];
+    t10 = t1 + t12;
+    t6 = t9 + t4;
+    t3 = C9 * t10;
+    t2 = t13 - t3;
+    t5 = C9 * t6;
+    t11 = t14 - t5;
+    t8 = t1 - t12;
+    t0 = C10 * t8;
+    t7 = t9 - t4;
+    t3 = C10 * t7;
+    t5 = t13 + t10;
+    t1 = t14 + t6;
+    t12 = t2 + t3;
+    t8 = t11 - t0;
+    t9 = t2 - t3;
+    t4 = t11 + t0;
+    re[87] = t5;
+    im[87] = t1;
+    re[107] = t12;
+    im[107] = t8;
+    re[127] = t9;
+    im[127] = t4;
+    t7 = re[147];
+    t13 = im[147];
+    t10 = re[167];
+    t14 = im[167];
+    t6 = re[7];
+    t2 = im[7];
+    t3 = t10 + t6;
+    t11 = t14 + t2;
+    t0 = C9 * t3;
+    t5 = t7 - t0;
+    t1 = C9 * t11;
+    t12 = t13 - t1;
+    t8 = t10 - t6;
+    t9 = C10 * t8;
+    t4 = t14 - t2;
+    t0 = C10 * t4;
+    t1 = t7 + t3;
+    t10 = t13 + t11;
+    t6 = t5 + t0;
+    t8 = t12 - t9;
+    t14 = t5 - t0;
+    t2 = t12 + t9;
+    re[147] = t1;
+    im[147] = t10;
+    re[167] = t6;
+    im[167] = t8;
+    re[7] = t14;
+    im[7] = t2;
+    t4 = X[113];
+    t7 = 0.8788171126619654 * t4;
+    t3 = 0.4771587602596084 * t4;
+    t13 = X[6];
+    t11 = 0.9996573249755573 * t13;
+    t5 = (-0.02617694830787315) * t13;
+    t0 = t7 + t11;
+    t12 = t3 + t5;
+    t9 = C9 * t0;
+    t1 = -t9;
+    t10 = C9 * t12;
+    t6 = -t10;
+    t8 = t7 - t11;
+    t14 = C10 * t8;
+    t2 = t3 - t5;
+    t4 = C10 * t2;
+    t13 = t4 - t9;
+    t7 = t6 - t14;
+    t11 = t1 - t4;
+    t8 = t14 - t10;
+    re[63] = t0;
+    im[63] = t12;
+    re[123] = t13;
+    im[123] = t7;
+    re[3] = t11;
+    im[3] = t8;
+    t3 = X[73];
+    t5 = 0.9483236552061993 * t3;
+    t2 = 0.31730465640509214 * t3;
+    t9 = X[46];
+    t6 = 0.9799247046208296 * t9;
+    t1 = (-0.19936793441719716) * t9;
+    t4 = t5 + t6;
+    t14 = t2 + t1;
+    t10 = C9 * t4;
+    t0 = -t10;
+    t12 = C9 * t14;
+    t13 = -t12;
+    t7 = t5 - t6;
+    t11 = C10 * t7;
+    t8 = t2 - t1;
+    t3 = C10 * t8;
+    t9 = t3 - t10;
+    t5 = t13 - t11;
+    t6 = t0 - t3;
+    t7 = t11 - t12;
+    t2 = t9 + t5;
+    t1 = C0 * t2;
+    t8 = t9 * (-C1);
+    t10 = t5 * C2;
+    t13 = t1 - t10;
+    t0 = t1 + t8;
+    t3 = t6 + t7;
+    t11 = C3 * t3;
+    t12 = t6 * (-C4);
+    t2 = t7 * (-C5);
+    t9 = t11 - t2;
+    t5 = t11 + t12;
+    re[83] = t4;
+    im[83] = t14;
+    re[143] = t13;
+    im[143] = t0;
+    re[23] = t9;
+    im[23] = t5;
+    t10 = X[33];
+    t1 = 0.9890158633619168 * t10;
+    t8 = 0.1478094111296106 * t10;
+    t3 = X[86];
+    t6 = 0.9304175679820246 * t3;
+    t7 = (-0.3665012267242973) * t3;
+    t2 = t1 + t6;
+    t11 = t8 + t7;
+    t12 = C9 * t2;
+    t4 = -t12;
+    t14 = C9 * t11;
+    t13 = -t14;
+    t0 = t1 - t6;
+    t9 = C10 * t0;
+    t5 = t8 - t7;
+    t10 = C10 * t5;
+    t3 = t10 - t12;
+    t1 = t13 - t9;
+    t6 = t4 - t10;
+    t0 = t9 - t14;
+    t8 = t3 + t1;
+    t7 = C3 * t8;
+    t5 = t3 * (-C4);
+    t12 = t1 * (-C5);
+    t13 = t7 - t12;
+    t4 = t7 + t5;
+    t10 = t6 + t0;
+    t9 = (-C6) * t10;
+    t14 = t6 * C7;
+    t8 = t0 * (-C8);
+    t3 = t9 - t8;
+    t1 = t9 + t14;
+    re[103] = t2;
+    im[103] = t11;
+    re[163] = t13;
+    im[163] = t4;
+    re[43] = t3;
+    im[43] = t1;
+    t12 = re[63];
+    t7 = im[63];
+    t5 = re[83];
+    t10 = im[83];
+    t6 = re[103];
+    t0 = im[103];
+    t8 = t5 + t6;
+    t9 = t10 + t0;
+    t14 = C9 * t8;
+    t2 = t12 - t14;
+    t11 = C9 * t9;
+    t13 = t7 - t11;
+    t4 = t5 - t6;
+    t3 = C10 * t4;
+    t1 = t10 - t0;
+    t14 = C10 * t1;
+    t11 = t12 + t8;
+    t5 = t7 + t9;
+    t6 = t2 + t14;
+    t4 = t13 - t3;
+    t10 = t2 - t14;
+    t0 = t13 + t3;
+    re[63] = t11;
+    im[63] = t5;
+    re[83] = t6;
+    im[83] = t4;
+    re[103] = t10;
+    im[103] = t0;
+    t1 = re[123];
+    t12 = im[123];
+    t8 = re[143];
+    t7 = im[143];
+    t9 = re[163];
+    t2 = im[163];
+    t14 = t8 + t9;
+    t13 = t7 + t2;
+    t3 = C9 * t14;
+    t11 = t1 - t3;
+    t5 = C9 * t13;
+    t6 = t12 - t5;
+    t4 = t8 - t9;
+    t10 = C10 * t4;
+    t0 = t7 - t2;
+    t3 = C10 * t0;
+    t5 = t1 + t14;
+    t8 = t12 + t13;
+    t9 = t11 + t3;
+    t4 = t6 - t10;
+    t7 = t11 - t3;
+    t2 = t6 + t10;
+    re[123] = t5;
+    im[123] = t8;
+    re[143] = t9;
+    im[143] = t4;
+    re[163] = t7;
+    im[163] = t2;
+    t0 = re[3];
+    t1 = im[3];
+    t14 = re[23];
+    t12 = im[23];
+    t13 = re[43];
+    t11 = im[43];
+    t3 = t14 + t13;
+    t6 = t12 + t11;
+    t10 = C9 * t3;
+    t5 = t0 - t10;
+    t8 = C9 * t6;
+    t9 = t1 - t8;
+    t4 = t14 - t13;
+    t7 = C10 * t4;
+    t2 = t12 - t11;
+    t10 = C10 * t2;
+    t8 = t0 + t3;
+    t14 = t1 + t6;
+    t13 = t5 + t10;
+    t4 = t9 - t7;
+    t12 = t5 - t10;
+    t11 = t9 + t7;
+    re[3] = t8;
+    im[3] = t14;
+    re[23] = t13;
+    im[23] = t4;
+    re[43] = t12;
+    im[43] = t11;
+    t2 = X[41];
+    t0 = 0.9832549075639546 * t2;
+    t3 = 0.18223552549214747 * t2;
+    t1 = X[78];
+    t6 = 0.9426414910921784 * t1;
+    t5 = (-0.33380685923377096) * t1;
+    t10 = t0 + t6;
+    t9 = t3 + t5;
+    t7 = C9 * t10;
+    t8 = -t7;
+    t14 = C9 * t9;
+    t13 = -t14;
+    t4 = t0 - t6;
+    t12 = C10 * t4;
+    t11 = t3 - t5;
+    t2 = C10 * t11;
+    t1 = t2 - t7;
+    t0 = t13 - t12;
+    t6 = t8 - t2;
+    t4 = t12 - t14;
+    re[99] = t10;
+    im[99] = t9;
+    re[159] = t1;
+    im[159] = t0;
+    re[39] = t6;
+    im[39] = t4;
+    t3 = X[1];
+    t5 = 0.9999619230641713 * t3;
+    t11 = 0.008726535498373935 * t3;
+    t7 = X[118];
+    t13 = 0.8703556959398997 * t7;
+    t8 = (-0.49242356010346705) * t7;
+    t2 = t5 + t13;
+    t12 = t11 + t8;
+    t14 = C9 * t2;
+    t10 = -t14;
+    t9 = C9 * t12;
+    t1 = -t9;
+    t0 = t5 - t13;
+    t6 = C10 * t0;
+    t4 = t11 - t8;
+    t3 = C10 * t4;
+    t7 = t3 - t14;
+    t5 = t1 - t6;
+    t13 = t10 - t3;
+    t0 = t6 - t9;
+    t11 = t7 + t5;
+    t8 = C0 * t11;
+    t4 = t7 * (-C1);
+    t14 = t5 * C2;
+    t1 = t8 - t14;
+    t10 = t8 + t4;
+    t3 = t13 + t0;
+    t6 = C3 * t3;
+    t9 = t13 * (-C4);
+    t11 = t0 * (-C5);
+    t7 = t6 - t11;
+    t5 = t6 + t9;
+    re[119] = t2;
+    im[119] = t12;
+    re[179] = t1;
+    im[179] = t10;
+    re[59] = t7;
+    im[59] = t5;
+    t14 = X[81];
+    t8 = 0.9366721892483976 * t14;
+    t4 = 0.35020738125946743 * t14;
+    t3 = X[38];
+    t13 = 0.9862856015372314 * t3;
+    t0 = (-0.16504760586067765) * t3;
+    t11 = 0.4931428007686157 * t3;
+    t6 = t8 - t11;
+    t9 = (-0.08252380293033883) * t3;
+    t2 = t4 - t9;
+    t12 = 0.8541483863180588 * t3;
+    t1 = (-0.14293541950914823) * t3;
+    t10 = t8 + t13;
+    t7 = t4 + t0;
+    t5 = t6 + t1;
+    t14 = t2 - t12;
+    t11 = t6 - t1;
+    t9 = t2 + t12;
+    t3 = t5 + t14;
+    t8 = C3 * t3;
+    t13 = t5 * (-C4);
+    t4 = t14 * (-C5);
+    t0 = t8 - t4;
+    t6 = t8 + t13;
+    t1 = t11 + t9;
+    t2 = (-C6) * t1;
+    t12 = t11 * C7;
+    t3 = t9 * (-C8);
+    t5 = t2 - t3;
+    t14 = t2 + t12;
+    re[139] = t10;
+    im[139] = t7;
+    re[19] = t0;
+    im[19] = t6;
+    re[79] = t5;
+    im[79] = t14;
+    t4 = re[99];
+    t8 = im[99];
+    t13 = re[119];
+    t1 = im[119];
+    t11 = re[139];
+    t9 = im[139];
+    t3 = t13 + t11;
+    t2 = t1 + t9;
+    t12 = C9 * t3;
+    t10 = t4 - t12;
+    t7 = C9 * t2;
+    t0 = t8 - t7;
+    t6 = t13 - t11;
+    t5 = C10 * t6;
+    t14 = t1 - t9;
+    t12 = C10 * t14;
+    t7 = t4 + t3;
+    t13 = t8 + t2;
+    t11 = t10 + t12;
+    t6 = t0 - t5;
+    t1 = t10 - t12;
+    t9 = t0 + t5;
+    re[99] = t7;
+    im[99] = t13;
+    re[119] = t11;
+    im[119] = t6;
+    re[139] = t1;
+    im[139] = t9;
+    t14 = re[159];
+    t4 = im[159];
+    t3 = re[179];
+    t8 = im[179];
+    t2 = re[19];
+    t10 = im[19];
+    t12 = t3 + t2;
+    t0 = t8 + t10;
+    t5 = C9 * t12;
+    t7 = t14 - t5;
+    t13 = C9 * t0;
+    t11 = t4 - t13;
+    t6 = t3 - t2;
+    t1 = C10 * t6;
+    t9 = t8 - t10;
+    t5 = C10 * t9;
+    t13 = t14 + t12;
+    t3 = t4 + t0;
+    t2 = t7 + t5;
+    t6 = t11 - t1;
+    t8 = t7 - t5;
+    t10 = t11 + t1;
+    re[159] = t13;
+    im[159] = t3;
+    re[179] = t2;
+    im[179] = t6;
+    re[19] = t8;
+    im[19] = t10;
+    t9 = re[39];
+    t14 = im[39];
+    t12 = re[59];
+    t4 = im[59];
+    t0 = re[79];
+    t7 = im[79];
+    t5 = t12 + t0;
+    t11 = t4 + t7;
+    t1 = C9 * t5;
+    t13 = t9 - t1;
+    t3 = C9 * t11;
+    t2 = t14 - t3;
+    t6 = t12 - t0;
+    t8 = C10 * t6;
+    t10 = t4 - t7;
+    t1 = C10 * t10;
+    t3 = t9 + t5;
+    t12 = t14 + t11;
+    t0 = t13 + t1;
+    t6 = t2 - t8;
+    t4 = t13 - t1;
+    t7 = t2 + t8;
+    re[39] = t3;
+    im[39] = t12;
+    re[59] = t0;
+    im[59] = t6;
+    re[79] = t4;
+    im[79] = t7;
+    t10 = re[135];
+    t9 = im[135];
+    t5 = re[171];
+    t14 = im[171];
+    t11 = re[27];
+    t13 = im[27];
+    t1 = re[63];
+    t2 = im[63];
+    t8 = re[99];
+    t3 = im[99];
+    t12 = t5 + t8;
+    t0 = t14 + t3;
+    t6 = t11 + t1;
+    t4 = t13 + t2;
+    t7 = t5 - t8;
+    t5 = t14 - t3;
+    t8 = t11 - t1;
+    t14 = t13 - t2;
+    t3 = t12 + t6;
+    t11 = t0 + t4;
+    t1 = t12 - t6;
+    t13 = C11 * t1;
+    t2 = t0 - t4;
+    t12 = C11 * t2;
+    t6 = C12 * t3;
+    t1 = t10 - t6;
+    t0 = C12 * t11;
+    t4 = t9 - t0;
+    t2 = t1 + t13;
+    t6 = t4 + t12;
+    t0 = t1 - t13;
+    t1 = t4 - t12;
+    t13 = C13 * t7;
+    t4 = C14 * t8;
+    t12 = t13 + t4;
+    t13 = C13 * t5;
+    t4 = C14 * t14;
+    t13 = t13 + t4;
+    t4 = C14 * t7;
+    t7 = C13 * t8;
+    t8 = t4 - t7;
+    t4 = C14 * t5;
+    t7 = C13 * t14;
+    t5 = t4 - t7;
+    t14 = t10 + t3;
+    t4 = t9 + t11;
+    t7 = t2 + t13;
+    t10 = t6 - t12;
+    t3 = t0 + t5;
+    t9 = t1 - t8;
+    t11 = t0 - t5;
+    t0 = t1 + t8;
+    t5 = t2 - t13;
+    t1 = t6 + t12;
+    re[135] = t14;
+    im[135] = t4;
+    re[171] = t7;
+    im[171] = t10;
+    re[27] = t3;
+    im[27] = t9;
+    re[63] = t11;
+    im[63] = t0;
+    re[99] = t5;
+    im[99] = t1;
+    t8 = re[15];
+    t2 = im[15];
+    t13 = re[51];
+    t6 = im[51];
+    t12 = re[87];
+    t14 = im[87];
+    t4 = re[123];
+    t7 = im[123];
+    t10 = re[159];
+    t3 = im[159];
+    t9 = t13 + t10;
+    t11 = t6 + t3;
+    t0 = t12 + t4;
+    t5 = t14 + t7;
+    t1 = t13 - t10;
+    t13 = t6 - t3;
+    t10 = t12 - t4;
+    t6 = t14 - t7;
+    t3 = t9 + t0;
+    t12 = t11 + t5;
+    t4 = t9 - t0;
+    t14 = C11 * t4;
+    t7 = t11 - t5;
+    t9 = C11 * t7;
+    t0 = C12 * t3;
+    t4 = t8 - t0;
+    t11 = C12 * t12;
+    t5 = t2 - t11;
+    t7 = t4 + t14;
+    t0 = t5 + t9;
+    t11 = t4 - t14;
+    t4 = t5 - t9;
+    t14 = C13 * t1;
+    t5 = C14 * t10;
+    t9 = t14 + t5;
+    t14 = C13 * t13;
+    t5 = C14 * t6;
+    t14 = t14 + t5;
+    t5 = C14 * t1;
+    t1 = C13 * t10;
+    t10 = t5 - t1;
+    t5 = C14 * t13;
+    t1 = C13 * t6;
+    t13 = t5 - t1;
+    t6 = t8 + t3;
+    t5 = t2 + t12;
+    t1 = t7 + t14;
+    t8 = t0 - t9;
+    t3 = t11 + t13;
+    t2 = t4 - t10;
+    t12 = t11 - t13;
+    t11 = t4 + t10;
+    t13 = t7 - t14;
+    t4 = t0 + t9;
+    re[15] = t6;
+    im[15] = t5;
+    re[51] = t1;
+    im[51] = t8;
+    re[87] = t3;
+    im[87] = t2;
+    re[123] = t12;
+    im[123] = t11;
+    re[159] = t13;
+    im[159] = t4;
+    t10 = re[75];
+    t7 = im[75];
+    t14 = re[111];
+    t0 = im[111];
+    t9 = re[147];
+    t6 = im[147];
+    t5 = re[3];
+    t1 = im[3];
+    t8 = re[39];
+    t3 = im[39];
+    t2 = t14 + t8;
+    t12 = t0 + t3;
+    t11 = t9 + t5;
+    t13 = t6 + t1;
+    t4 = t14 - t8;
+    t14 = t0 - t3;
+    t8 = t9 - t5;
+    t0 = t6 - t1;
+    t3 = t2 + t11;
+    t9 = t12 + t13;
+    t5 = t2 - t11;
+    t6 = C11 * t5;
+    t1 = t12 - t13;
+    t2 = C11 * t1;
+    t11 = C12 * t3;
+    t5 = t10 - t11;
+    t12 = C12 * t9;
+    t13 = t7 - t12;
+    t1 = t5 + t6;
+    t11 = t13 + t2;
+    t12 = t5 - t6;
+    t5 = t13 - t2;
+    t6 = C13 * t4;
+    t13 = C14 * t8;
+    t2 = t6 + t13;
+    t6 = C13 * t14;
+    t13 = C14 * t0;
+    t6 = t6 + t13;
+    t13 = C14 * t4;
+    t4 = C13 * t8;
+    t8 = t13 - t4;
+    t13 = C14 * t14;
+    t4 = C13 * t0;
+    t14 = t13 - t4;
+    t0 = t10 + t3;
+    t13 = t7 + t9;
+    t4 = t1 + t6;
+    t10 = t11 - t2;
+    t3 = t12 + t14;
+    t7 = t5 - t8;
+    t9 = t12 - t14;
+    t12 = t5 + t8;
+    t14 = t1 - t6;
+    t5 = t11 + t2;
+    re[75] = t0;
+    im[75] = t13;
+    re[111] = t4;
+    im[111] = t10;
+    re[147] = t3;
+    im[147] = t7;
+    re[3] = t9;
+    im[3] = t12;
+    re[39] = t14;
+    im[39] = t5;
+    t8 = re[155];
+    t1 = im[155];
+    t6 = re[11];
+    t11 = im[11];
+    t2 = re[47];
+    t0 = im[47];
+    t13 = re[83];
+    t4 = im[83];
+    t10 = re[119];
+    t3 = im[119];
+    t7 = t6 + t10;
+    t9 = t11 + t3;
+    t12 = t2 + t13;
+    t14 = t0 + t4;
+    t5 = t6 - t10;
+    t6 = t11 - t3;
+    t10 = t2 - t13;
+    t11 = t0 - t4;
+    t3 = t7 + t12;
+    t2 = t9 + t14;
+    t13 = t7 - t12;
+    t0 = C11 * t13;
+    t4 = t9 - t14;
+    t7 = C11 * t4;
+    t12 = C12 * t3;
+    t13 = t8 - t12;
+    t9 = C12 * t2;
+    t14 = t1 - t9;
+    t4 = t13 + t0;
+    t12 = t14 + t7;
+    t9 = t13 - t0;
+    t13 = t14 - t7;
+    t0 = C13 * t5;
+    t14 = C14 * t10;
+    t7 = t0 + t14;
+    t0 = C13 * t6;
+    t14 = C14 * t11;
+    t0 = t0 + t14;
+    t14 = C14 * t5;
+    t5 = C13 * t10;
+    t10 = t14 - t5;
+    t14 = C14 * t6;
+    t5 = C13 * t11;
+    t6 = t14 - t5;
+    t11 = t8 + t3;
+    t14 = t1 + t2;
+    t5 = t4 + t0;
+    t8 = t12 - t7;
+    t3 = t9 + t6;
+    t1 = t13 - t10;
+    t2 = t9 - t6;
+    t9 = t13 + t10;
+    t6 = t4 - t0;
+    t13 = t12 + t7;
+    re[155] = t11;
+    im[155] = t14;
+    re[11] = t5;
+    im[11] = t8;
+    re[47] = t3;
+    im[47] = t1;
+    re[83] = t2;
+    im[83] = t9;
+    re[119] = t6;
+    im[119] = t13;
+    t10 = re[35];
+    t4 = im[35];
+    t0 = re[71];
+    t12 = im[71];
+    t7 = re[107];
+    t11 = im[107];
+    t14 = re[143];
+    t5 = im[143];
+    t8 = re[179];
+    t3 = im[179];
+    t1 = t0 + t8;
+    t2 = t12 + t3;
+    t9 = t7 + t14;
+    t6 = t11 + t5;
+    t13 = t0 - t8;
+    t0 = t12 - t3;
+    t8 = t7 - t14;
+    t12 = t11 - t5;
+    t3 = t1 + t9;
+    t7 = t2 + t6;
+    t14 = t1 - t9;
+    t11 = C11 * t14;
+    t5 = t2 - t6;
+    t1 = C11 * t5;
+    t9 = C12 * t3;
+    t14 = t10 - t9;
+    t2 = C12 * t7;
+    t6 = t4 - t2;
+    t5 = t14 + t11;
+    t9 = t6 + t1;
+    t2 = t14 - t11;
+    t14 = t6 - t1;
+    t11 = C13 * t13;
+    t6 = C14 * t8;
+    t1 = t11 + t6;
+    t11 = C13 * t0;
+    t6 = C14 * t12;
+    t11 = t11 + t6;
+    t6 = C14 * t13;
+    t13 = C13 * t8;
+    t8 = t6 - t13;
+    t6 = C14 * t0;
+    t13 = C13 * t12;
+    t0 = t6 - t13;
+    t12 = t10 + t3;
+    t6 = t4 + t7;
+    t13 = t5 + t11;
+    t10 = t9 - t1;
+    t3 = t2 + t0;
+    t4 = t14 - t8;
+    t7 = t2 - t0;
+    t2 = t14 + t8;
+    t0 = t5 - t11;
+    t14 = t9 + t1;
+    re[35] = t12;
+    im[35] = t6;
+    re[71] = t13;
+    im[71] = t10;
+    re[107] = t3;
+    im[107] = t4;
+    re[143] = t7;
+    im[143] = t2;
+    re[179] = t0;
+    im[179] = t14;
+    t8 = re[95];
+    t5 = im[95];
+    t11 = re[131];
+    t9 = im[131];
+    t1 = re[167];
+    t12 = im[167];
+    t6 = re[23];
+    t13 = im[23];
+    t10 = re[59];
+    t3 = im[59];
+    t4 = t11 + t10;
+    t7 = t9 + t3;
+    t2 = t1 + t6;
+    t0 = t12 + t13;
+    t14 = t11 - t10;
+    t11 = t9 - t3;
+    t10 = t1 - t6;
+    t9 = t12 - t13;
+    t3 = t4 + t2;
+    t1 = t7 + t0;
+    t6 = t4 - t2;
+    t12 = C11 * t6;
+    t13 = t7 - t0;
+    t4 = C11 * t13;
+    t2 = C12 * t3;
+    t6 = t8 - t2;
+    t7 = C12 * t1;
+    t0 = t5 - t7;
+    t13 = t6 + t12;
+    t2 = t0 + t4;
+    t7 = t6 - t12;
+    t6 = t0 - t4;
+    t12 = C13 * t14;
+    t0 = C14 * t10;
+    t4 = t12 + t0;
+    t12 = C13 * t11;
+    t0 = C14 * t9;
+    t12 = t12 + t0;
+    t0 = C14 * t14;
+    t14 = C13 * t10;
+    t10 = t0 - t14;
+    t0 = C14 * t11;
+    t14 = C13 * t9;
+    t11 = t0 - t14;
+    t9 = t8 + t3;
+    t0 = t5 + t1;
+    t14 = t13 + t12;
+    t8 = t2 - t4;
+    t3 = t7 + t11;
+    t5 = t6 - t10;
+    t1 = t7 - t11;
+    t7 = t6 + t10;
+    t11 = t13 - t12;
+    t6 = t2 + t4;
+    re[95] = t9;
+    im[95] = t0;
+    re[131] = t14;
+    im[131] = t8;
+    re[167] = t3;
+    im[167] = t5;
+    re[23] = t1;
+    im[23] = t7;
+    re[59] = t11;
+    im[59] = t6;
+    t10 = re[175];
+    t13 = im[175];
+    t12 = re[31];
+    t2 = im[31];
+    t4 = re[67];
+    t9 = im[67];
+    t0 = re[103];
+    t14 = im[103];
+    t8 = re[139];
+    t3 = im[139];
+    t5 = t12 + t8;
+    t1 = t2 + t3;
+    t7 = t4 + t0;
+    t11 = t9 + t14;
+    t6 = t12 - t8;
+    t12 = t2 - t3;
+    t8 = t4 - t0;
+    t2 = t9 - t14;
+    t3 = t5 + t7;
+    t4 = t1 + t11;
+    t0 = t5 - t7;
+    t9 = C11 * t0;
+    t14 = t1 - t11;
+    t5 = C11 * t14;
+    t7 = C12 * t3;
+    t0 = t10 - t7;
+    t1 = C12 * t4;
+    t11 = t13 - t1;
+    t14 = t0 + t9;
+    t7 = t11 + t5;
+    t1 = t0 - t9;
+    t0 = t11 - t5;
+    t9 = C13 * t6;
+    t11 = C14 * t8;
+    t5 = t9 + t11;
+    t9 = C13 * t12;
+    t11 = C14 * t2;
+    t9 = t9 + t11;
+    t11 = C14 * t6;
+    t6 = C13 * t8;
+    t8 = t11 - t6;
+    t11 = C14 * t12;
+    t6 = C13 * t2;
+    t12 = t11 - t6;
+    t2 = t10 + t3;
+    t11 = t13 + t4;
+    t6 = t14 + t9;
+    t10 = t7 - t5;
+    t3 = t1 + t12;
+    t13 = t0 - t8;
+    t4 = t1 - t12;
+    t1 = t0 + t8;
+    t12 = t14 - t9;
+    t0 = t7 + t5;
+    re[175] = t2;
+    im[175] = t11;
+    re[31] = t6;
+    im[31] = t10;
+    re[67] = t3;
+    im[67] = t13;
+    re[103] = t4;
+    im[103] = t1;
+    re[139] = t12;
+    im[139] = t0;
+    t8 = re[55];
+    t14 = im[55];
+    t9 = re[91];
+    t7 = im[91];
+    t5 = re[127];
+    t2 = im[127];
+    t11 = re[163];
+    t6 = im[163];
+    t10 = re[19];
+    t3 = im[19];
+    t13 = t9 + t10;
+    t4 = t7 + t3;
+    t1 = t5 + t11;
+    t12 = t2 + t6;
+    t0 = t9 - t10;
+    t9 = t7 - t3;
+    t10 = t5 - t11;
+    t7 = t2 - t6;
+    t3 = t13 + t1;
+    t5 = t4 + t12;
+    t11 = t13 - t1;
+    t2 = C11 * t11;
+    t6 = t4 - t12;
+    t13 = C11 * t6;
+    t1 = C12 * t3;
+    t11 = t8 - t1;
+    t4 = C12 * t5;
+    t12 = t14 - t4;
+    t6 = t11 + t2;
+    t1 = t12 + t13;
+    t4 = t11 - t2;
+    t11 = t12 - t13;
+    t2 = C13 * t0;
+    t12 = C14 * t10;
+    t13 = t2 + t12;
+    t2 = C13 * t9;
+    t12 = C14 * t7;
+    t2 = t2 + t12;
+    t12 = C14 * t0;
+    t0 = C13 * t10;
+    t10 = t12 - t0;
+    t12 = C14 * t9;
+    t0 = C13 * t7;
+    t9 = t12 - t0;
+    t7 = t8 + t3;
+    t12 = t14 + t5;
+    t0 = t6 + t2;
+    t8 = t1 - t13;
+    t3 = t4 + t9;
+    t14 = t11 - t10;
+    t5 = t4 - t9;
+    t4 = t11 + t10;
+    t9 = t6 - t2;
+    t11 = t1 + t13;
+    re[55] = t7;
+    im[55] = t12;
+    re[91] = t0;
+    im[91] = t8;
+    re[127] = t3;
+    im[127] = t14;
+    re[163] = t5;
+    im[163] = t4;
+    re[19] = t9;
+    im[19] = t11;
+    t10 = re[115];
+    t6 = im[115];
+    t2 = re[151];
+    t1 = im[151];
+    t13 = re[7];
+    t7 = im[7];
+    t12 = re[43];
+    t0 = im[43];
+    t8 = re[79];
+    t3 = im[79];
+    t14 = t2 + t8;
+    t5 = t1 + t3;
+    t4 = t13 + t12;
+    t9 = t7 + t0;
+    t11 = t2 - t8;
+    t2 = t1 - t3;
+    t8 = t13 - t12;
+    t1 = t7 - t0;
+    t3 = t14 + t4;
+    t13 = t5 + t9;
+    t12 = t14 - t4;
+    t7 = C11 * t12;
+    t0 = t5 - t9;
+    t14 = C11 * t0;
+    t4 = C12 * t3;
+    t12 = t10 - t4;
+    t5 = C12 * t13;
+    t9 = t6 - t5;
+    t0 = t12 + t7;
+    t4 = t9 + t14;
+    t5 = t12 - t7;
+    t12 = t9 - t14;
+    t7 = C13 * t11;
+    t9 = C14 * t8;
+    t14 = t7 + t9;
+    t7 = C13 * t2;
+    t9 = C14 * t1;
+    t7 = t7 + t9;
+    t9 = C14 * t11;
+    t11 = C13 * t8;
+    t8 = t9 - t11;
+    t9 = C14 * t2;
+    t11 = C13 * t1;
+    t2 = t9 - t11;
+    t1 = t10 + t3;
+    t9 = t6 + t13;
+    t11 = t0 + t7;
+    t10 = t4 - t14;
+    t3 = t5 + t2;
+    t6 = t12 - t8;
+    t13 = t5 - t2;
+    t5 = t12 + t8;
+    t2 = t0 - t7;
+    t12 = t4 + t14;
+    re[115] = t1;
+    im[115] = t9;
+    re[151] = t11;
+    im[151] = t10;
+    re[7] = t3;
+    im[7] = t6;
+    re[43] = t13;
+    im[43] = t5;
+    re[79] = t2;
+    im[79] = t12;
+    t8 = re[0];
+    t0 = im[0];
+    t7 = re[45];
+    t4 = im[45];
+    t14 = re[90];
+    t1 = im[90];
+    t9 = re[135];
+    t11 = im[135];
+    t10 = t8 + t14;
+    t3 = t0 + t1;
+    t6 = t7 + t9;
+    t13 = t4 + t11;
+    t5 = t8 - t14;
+    t2 = t0 - t1;
+    t12 = t7 - t9;
+    t8 = t4 - t11;
+    t14 = t10 + t6;
+    t0 = t3 + t13;
+    t1 = t5 + t8;
+    t7 = t2 - t12;
+    t9 = t10 - t6;
+    t4 = t3 - t13;
+    t11 = t5 - t8;
+    t10 = t2 + t12;
+    t6 = (-C15) * t14;
+    t3 = (-C16) * t0;
+    t13 = t6 + t3;
+    t5 = 0.07256106269182623 * t13;
+    y[539] = t5;
+    t8 = 0.07225232704692253 * t13;
+    y[540] = t8;
+    t2 = C16 * t14;
+    t12 = (-C15) * t0;
+    t6 = t2 + t12;
+    t3 = 0.038067478102163245 * t6;
+    y[179] = t3;
+    t5 = (-0.03865835992204059) * t6;
+    y[180] = t5;
+    t13 = (-C17) * t1;
+    t8 = (-C18) * t7;
+    t14 = t13 + t8;
+    t0 = 0.07634133969483003 * t14;
+    y[449] = t0;
+    t2 = 0.02600882290369695 * t14;
+    y[630] = t2;
+    t12 = C18 * t1;
+    t3 = (-C17) * t7;
+    t6 = t12 + t3;
+    t5 = 0.0005948867419687272 * t6;
+    y[89] = t5;
+    t13 = (-0.07256989822004814) * t6;
+    y[270] = t13;
+    t8 = C19 * t9;
+    t0 = C20 * t4;
+    t14 = t8 + t0;
+    y[0] = 0;
+    t2 = (-0.07455064005974621) * t14;
+    y[359] = t2;
+    t1 = (-C20) * t9;
+    t7 = C19 * t4;
+    t12 = t1 + t7;
+    t3 = 0.07452056147476713 * t12;
+    y[360] = t3;
+    t5 = 0.00012831502283879977 * t12;
+    y[719] = t5;
+    t6 = C21 * t11;
+    t13 = C22 * t10;
+    t8 = t6 + t13;
+    t0 = 0.0006858251109706325 * t8;
+    y[90] = t0;
+    t14 = (-0.07244348493003379) * t8;
+    y[269] = t14;
+    t2 = (-C22) * t11;
+    t9 = C21 * t10;
+    t4 = t2 + t9;
+    t1 = 0.07643673051777489 * t4;
+    y[450] = t1;
+    t7 = 0.02655548754157034 * t4;
+    y[629] = t7;
+    t3 = re[96];
+    t12 = im[96];
+    t5 = re[141];
+    t6 = im[141];
+    t13 = re[6];
+    t0 = im[6];
+    t8 = re[51];
+    t14 = im[51];
+    t11 = t3 + t13;
+    t10 = t12 + t0;
+    t2 = t5 + t8;
+    t9 = t6 + t14;
+    t1 = t3 - t13;
+    t4 = t12 - t0;
+    t7 = t5 - t8;
+    t3 = t6 - t14;
+    t13 = t11 + t2;
+    t12 = t10 + t9;
+    t0 = t1 + t3;
+    t5 = t4 - t7;
+    t8 = t11 - t2;
+    t6 = t10 - t9;
+    t14 = t1 - t3;
+    t11 = t4 + t7;
+    t2 = C23 * t13;
+    t10 = C24 * t12;
+    t9 = t2 + t10;
+    t1 = 0.0008904224612424559 * t9;
+    y[92] = t1;
+    t3 = (-0.07217823591153531) * t9;
+    y[267] = t3;
+    t4 = (-C24) * t13;
+    t7 = C23 * t12;
+    t2 = t4 + t7;
+    t10 = 0.07662874054739717 * t2;
+    y[452] = t10;
+    t1 = 0.027659053756716335 * t2;
+    y[627] = t1;
+    t9 = (-C25) * t0;
+    t3 = (-C26) * t5;
+    t13 = t9 + t3;
+    t12 = 0.07315722926378804 * t13;
+    y[537] = t12;
+    t4 = 0.07161384860400806 * t13;
+    y[542] = t4;
+    t7 = C26 * t0;
+    t10 = (-C25) * t5;
+    t2 = t7 + t10;
+    t1 = 0.03688166728156738 * t2;
+    y[177] = t1;
+    t9 = (-0.03983635585871724) * t2;
+    y[182] = t9;
+    t3 = (-C27) * t8;
+    t12 = (-C28) * t6;
+    t13 = t3 + t12;
+    t4 = 0.07615249922661345 * t13;
+    y[447] = t4;
+    t0 = 0.02492643432648059 * t13;
+    y[632] = t0;
+    t5 = C28 * t8;
+    t7 = (-C27) * t6;
+    t10 = t5 + t7;
+    t1 = 0.00043428713575801746 * t10;
+    y[87] = t1;
+    t2 = (-0.07281087793701063) * t10;
+    y[272] = t2;
+    t9 = C29 * t14;
+    t3 = C30 * t11;
+    t12 = t9 + t3;
+    y[2] = 0;
+    t4 = (-0.07461077435802718) * t12;
+    y[357] = t4;
+    t13 = (-C30) * t14;
+    t0 = C29 * t11;
+    t8 = t13 + t0;
+    t6 = 0.07446049988566894 * t8;
+    y[362] = t6;
+    t5 = 0.00020042753244037563 * t8;
+    y[717] = t5;
+    t7 = re[12];
+    t1 = im[12];
+    t10 = re[57];
+    t2 = im[57];
+    t9 = re[102];
+    t3 = im[102];
+    t12 = re[147];
+    t4 = im[147];
+    t14 = t7 + t9;
+    t11 = t1 + t3;
+    t13 = t10 + t12;
+    t0 = t2 + t4;
+    t6 = t7 - t9;
+    t8 = t1 - t3;
+    t5 = t10 - t12;
+    t7 = t2 - t4;
+    t9 = t14 + t13;
+    t1 = t11 + t0;
+    t3 = t6 + t7;
+    t10 = t8 - t5;
+    t12 = t14 - t13;
+    t2 = t11 - t0;
+    t4 = t6 - t7;
+    t14 = t8 + t5;
+    t13 = C31 * t9;
+    t11 = C32 * t1;
+    t0 = t13 + t11;
+    y[4] = 0;
+    t6 = (-0.0746705385692672) * t0;
+    y[355] = t6;
+    t7 = (-C32) * t9;
+    t8 = C31 * t1;
+    t5 = t7 + t8;
+    t13 = 0.0744009037835185 * t5;
+    y[364] = t13;
+    t11 = 0.0002839913808099415 * t5;
+    y[715] = t11;
+    t0 = C33 * t3;
+    t6 = C34 * t10;
+    t9 = t0 + t6;
+    t1 = 0.001126420177114152 * t9;
+    y[94] = t1;
+    t7 = (-0.07189555032362745) * t9;
+    y[265] = t7;
+    t8 = (-C34) * t3;
+    t13 = C33 * t10;
+    t5 = t8 + t13;
+    t11 = 0.07682175494009395 * t5;
+    y[454] = t11;
+    t0 = 0.02877541433401703 * t5;
+    y[625] = t0;
+    t6 = (-C35) * t12;
+    t1 = (-C36) * t2;
+    t9 = t6 + t1;
+    t7 = 0.07372511469768803 * t9;
+    y[535] = t7;
+    t3 = 0.07094747087527041 * t9;
+    y[544] = t3;
+    t10 = C36 * t12;
+    t8 = (-C35) * t2;
+    t13 = t10 + t8;
+    t11 = 0.03569218332318732 * t13;
+    y[175] = t11;
+    t5 = (-0.041007537677709524) * t13;
+    y[184] = t5;
+    t0 = (-C37) * t4;
+    t6 = (-C38) * t14;
+    t1 = t0 + t6;
+    t7 = 0.07596722926088151 * t1;
+    y[445] = t7;
+    t9 = 0.023859207739252954 * t1;
+    y[634] = t9;
+    t3 = C38 * t4;
+    t12 = (-C37) * t14;
+    t2 = t3 + t12;
+    t10 = 0.0002998948177058382 * t2;
+    y[85] = t10;
+    t8 = (-0.07303676015017009) * t2;
+    y[274] = t8;
+    t11 = re[128];
+    t13 = im[128];
+    t5 = re[173];
+    t0 = im[173];
+    t6 = re[38];
+    t7 = im[38];
+    t1 = re[83];
+    t9 = im[83];
+    t4 = t11 + t6;
+    t14 = t13 + t7;
+    t3 = t5 + t1;
+    t12 = t0 + t9;
+    t10 = t11 - t6;
+    t2 = t13 - t7;
+    t8 = t5 - t1;
+    t11 = t0 - t9;
+    t6 = t4 + t3;
+    t13 = t14 + t12;
+    t7 = t10 + t11;
+    t5 = t2 - t8;
+    t1 = t4 - t3;
+    t0 = t14 - t12;
+    t9 = t10 - t11;
+    t4 = t2 + t8;
+    t3 = (-C39) * t6;
+    t14 = (-C40) * t13;
+    t12 = t3 + t14;
+    t10 = 0.07581464632180492 * t12;
+    y[443] = t10;
+    t11 = 0.022808210591671367 * t12;
+    y[636] = t11;
+    t2 = C40 * t6;
+    t8 = (-C39) * t13;
+    t3 = t2 + t8;
+    y[83] = 0;
+    t14 = (-0.07327813061310468) * t3;
+    y[276] = t14;
+    t10 = C41 * t7;
+    t12 = C42 * t5;
+    t11 = t10 + t12;
+    y[6] = 0;
+    t6 = (-0.07472961231384904) * t11;
+    y[353] = t6;
+    t13 = (-C42) * t7;
+    t2 = C41 * t5;
+    t8 = t13 + t2;
+    t3 = 0.07434208988296852 * t8;
+    y[366] = t3;
+    t14 = 0.0003841335513603814 * t8;
+    y[713] = t14;
+    t10 = C43 * t1;
+    t12 = C44 * t0;
+    t11 = t10 + t12;
+    t6 = 0.0013951437018800152 * t11;
+    y[96] = t6;
+    t7 = (-0.07159449802127518) * t11;
+    y[263] = t7;
+    t5 = (-C44) * t1;
+    t13 = C43 * t0;
+    t2 = t5 + t13;
+    t3 = 0.07701480239856939 * t2;
+    y[456] = t3;
+    t8 = 0.02990332649322146 * t2;
+    y[623] = t8;
+    t14 = (-C45) * t9;
+    t10 = (-C46) * t4;
+    t12 = t14 + t10;
+    t6 = 0.07426485204615321 * t12;
+    y[533] = t6;
+    t11 = 0.07025377921076166 * t12;
+    y[546] = t11;
+    t7 = C46 * t9;
+    t1 = (-C45) * t4;
+    t0 = t7 + t1;
+    t5 = 0.03450067624018114 * t0;
+    y[173] = t5;
+    t13 = (-0.04217005188954833) * t0;
+    y[186] = t13;
+    t3 = re[44];
+    t2 = im[44];
+    t8 = re[89];
+    t14 = im[89];
+    t10 = re[134];
+    t6 = im[134];
+    t12 = re[179];
+    t11 = im[179];
+    t9 = t3 + t10;
+    t4 = t2 + t6;
+    t7 = t8 + t12;
+    t1 = t14 + t11;
+    t5 = t3 - t10;
+    t0 = t2 - t6;
+    t13 = t8 - t12;
+    t3 = t14 - t11;
+    t10 = t9 + t7;
+    t2 = t4 + t1;
+    t6 = t5 + t3;
+    t8 = t0 - t13;
+    t12 = t9 - t7;
+    t14 = t4 - t1;
+    t11 = t5 - t3;
+    t9 = t0 + t13;
+    t7 = (-C47) * t10;
+    t4 = (-C48) * t2;
+    t1 = t7 + t4;
+    t5 = 0.07477620946977974 * t1;
+    y[531] = t5;
+    t3 = 0.06953296335829233 * t1;
+    y[548] = t3;
+    t0 = C48 * t10;
+    t13 = (-C47) * t2;
+    t7 = t0 + t13;
+    t4 = 0.03330865582833472 * t7;
+    y[171] = t4;
+    t5 = (-0.043322682886716854) * t7;
+    y[188] = t5;
+    t1 = (-C49) * t6;
+    t3 = (-C50) * t8;
+    t10 = t1 + t3;
+    t2 = 0.07562514791656519 * t10;
+    y[441] = t2;
+    t0 = 0.02177426790135979 * t10;
+    y[638] = t0;
+    t13 = C50 * t6;
+    t4 = (-C49) * t8;
+    t7 = t13 + t4;
+    y[81] = 0;
+    t5 = (-0.07346174795829588) * t7;
+    y[278] = t5;
+    t1 = C51 * t12;
+    t3 = C52 * t14;
+    t2 = t1 + t3;
+    y[8] = 0;
+    t10 = (-0.07478763968520208) * t2;
+    y[351] = t10;
+    t0 = (-C52) * t12;
+    t6 = C51 * t14;
+    t8 = t0 + t6;
+    t13 = 0.07428440821157253 * t8;
+    y[368] = t13;
+    t4 = 0.0005022724154049494 * t8;
+    y[711] = t4;
+    t7 = C53 * t11;
+    t5 = C54 * t9;
+    t1 = t7 + t5;
+    t3 = 0.0016976417542155023 * t1;
+    y[98] = t3;
+    t2 = (-0.07127424888219953) * t1;
+    y[261] = t2;
+    t10 = (-C54) * t11;
+    t12 = C53 * t9;
+    t14 = t10 + t12;
+    t0 = 0.07720681608342408 * t14;
+    y[458] = t0;
+    t6 = 0.031041726260868836 * t14;
+    y[621] = t6;
+    t13 = re[140];
+    t8 = im[140];
+    t4 = re[5];
+    t7 = im[5];
+    t5 = re[50];
+    t3 = im[50];
+    t1 = re[95];
+    t2 = im[95];
+    t11 = t13 + t5;
+    t9 = t8 + t3;
+    t10 = t4 + t1;
+    t12 = t7 + t2;
+    t0 = t13 - t5;
+    t14 = t8 - t3;
+    t6 = t4 - t1;
+    t13 = t7 - t2;
+    t5 = t11 + t10;
+    t8 = t9 + t12;
+    t3 = t0 + t13;
+    t4 = t14 - t6;
+    t1 = t11 - t10;
+    t7 = t9 - t12;
+    t2 = t0 - t13;
+    t11 = t14 + t6;
+    t10 = C55 * t5;
+    t9 = C56 * t8;
+    t12 = t10 + t9;
+    t0 = 0.0020347072928291257 * t12;
+    y[100] = t0;
+    t13 = (-0.07093433826861917) * t12;
+    y[259] = t13;
+    t14 = (-C56) * t5;
+    t6 = C55 * t8;
+    t10 = t14 + t6;
+    t9 = 0.07739634901064964 * t10;
+    y[460] = t9;
+    t0 = 0.032189767200842816 * t10;
+    y[619] = t0;
+    t12 = (-C57) * t3;
+    t13 = (-C58) * t4;
+    t5 = t12 + t13;
+    t8 = 0.07525864895163345 * t5;
+    y[529] = t8;
+    t14 = 0.06878508710053848 * t5;
+    y[550] = t14;
+    t6 = C58 * t3;
+    t9 = (-C57) * t4;
+    t10 = t6 + t9;
+    t0 = 0.03211724980597228 * t10;
+    y[169] = t0;
+    t12 = (-0.04446489243213255) * t10;
+    y[190] = t12;
+    t13 = (-C59) * t1;
+    t8 = (-C60) * t7;
+    t5 = t13 + t8;
+    t14 = 0.07544569193026901 * t5;
+    y[439] = t14;
+    t3 = 0.02075805547774038 * t5;
+    y[640] = t3;
+    t4 = C60 * t1;
+    t6 = (-C59) * t7;
+    t9 = t4 + t6;
+    y[79] = 0;
+    t0 = (-0.07363648491275424) * t9;
+    y[280] = t0;
+    t10 = C61 * t2;
+    t12 = C62 * t11;
+    t13 = t10 + t12;
+    y[10] = 0;
+    t8 = (-0.07484429201598877) * t13;
+    y[349] = t8;
+    t14 = (-C62) * t2;
+    t5 = C61 * t11;
+    t3 = t14 + t5;
+    t1 = 0.07422817967693168 * t3;
+    y[370] = t1;
+    t7 = 0.0006397848555590884 * t3;
+    y[709] = t7;
+}
+
+/**
+ *  Part 5 of ApplyWindowedIMDCT_W75_360_K120().
+ * 
+ *  @param {Number[]} X 
+ *    - The input block (360 points, only the first 120 points are used).
+ *  @param {Number[]} y 
+ *    - The array that would contain the output block (720 points).
+ *  @param {Number[]} re 
+ *    - The scratch buffer (real part, 180 points).
+ *  @param {Number[]} im 
+ *    - The scratch buffer (imaginary part, 180 points).
+ */
+function ApplyWindowedIMDCT_W75_360_K120_Part5(X, y, re, im) {
+    let t0, t1, t10, t11, t12, t13, t14, t2, t3, t4, t5, t6, t7, t8, t9;
+    const C0 = 0.6675077247298474;
+    const C1 = 0.7446028722923262;
+    const C2 = 0.3317495417533521;
+    const C3 = 0.9433675007898252;
+    const C4 = 0.9985129789397631;
+    const C5 = 0.05451450163800632;
+    const C6 = 0.9016439075888161;
+    const C7 = 0.4324792063301662;
+    const C8 = 0.8978355306052577;
+    const C9 = 0.44033096641364594;
+    const C10 = 0.6609845046837974;
+    const C11 = 0.750399549951834;
+    const C12 = 0.3235045797636848;
+    const C13 = 0.9462266043987146;
+    const C14 = 0.9979992358914197;
+    const C15 = 0.06322598484913067;
+    const C16 = 0.9974094913373519;
+    const C17 = 0.07193265315671939;
+    const C18 = 0.8939587799699321;
+    const C19 = 0.44814919358922256;
+    const C20 = 0.6544109481086103;
+    const C21 = 0.7561390817803227;
+    const C22 = 0.31523498164776964;
+    const C23 = 0.949013649188214;
+    const C24 = 0.3069413771675201;
+    const C25 = 0.9517284229140717;
+    const C26 = 0.996743790188891;
+    const C27 = 0.08063384351427165;
+    const C28 = 0.8900139509124098;
+    const C29 = 0.4559332924686272;
+    const C30 = 0.6477875556060698;
+    const C31 = 0.7618210306902226;
+    const C32 = 0.6411148315731583;
+    const C33 = 0.7674449639791253;
+    const C34 = 0.2986243979130275;
+    const C35 = 0.9543707188357582;
+    const C36 = 0.9960021831417567;
+    const C37 = 0.08932889329245366;
+    const C38 = 0.8860013438466962;
+    const C39 = 0.46368267026259297;
+    const C40 = 0.881921264348355;
+    const C41 = 0.47139673682599764;
+    const C42 = 0.6343932841636455;
+    const C43 = 0.773010453362737;
+    const C44 = 0.29028467725446233;
+    const C45 = 0.9569403357322088;
+    const C46 = 0.9951847266721969;
+    const C47 = 0.0980171403295606;
+    const C48 = 0.9942914830326867;
+    const C49 = 0.10669792298194263;
+    const C50 = 0.8777740231312368;
+    const C51 = 0.47907490470280634;
+    const C52 = 0.6276234252493902;
+    const C53 = 0.7785170750074935;
+    const C54 = 0.28192285029384145;
+    const C55 = 0.9594370779171484;
+    const C56 = 0.27353955381666206;
+    const C57 = 0.9618607552539928;
+    const C58 = 0.9933225202471875;
+    const C59 = 0.1153705801743918;
+    const C60 = 0.8735599360238168;
+    const C61 = 0.4867165891708081;
+    const C62 = 0.6208057703813592;
+    const C63 = 0.7839644095628366;
+    const C64 = 0.6139408387503664;
+    const C65 = 0.78935204219315;
+    const C66 = 0.265135426243408;
+    const C67 = 0.9642111831703293;
+    const C68 = 0.992277912105967;
+    const C69 = 0.12403445145048532;
+    const C70 = 0.8692793239451436;
+    const C71 = 0.4943212082861446;
+    const C72 = 0.8649325128804005;
+    const C73 = 0.5018881829276276;
+    const C74 = 0.6070291531475343;
+    const C75 = 0.7946795626093497;
+    const C76 = 0.256711107580932;
+    const C77 = 0.966488182671972;
+    const C78 = 0.9911577381599795;
+    const C79 = 0.13268887702288198;
+    const C80 = 0.9899620837148079;
+    const C81 = 0.14133319782356749;
+    const C82 = 0.860519833856079;
+    const C83 = 0.5094169368408418;
+    const C84 = 0.6000712399244809;
+    const C85 = 0.7999465651001297;
+    const C86 = 0.24826723937371628;
+    const C87 = 0.9686915803565931;
+    const C88 = 0.23980446465501654;
+    const C89 = 0.9708212084269281;
+    const C90 = 0.9886910398241674;
+    const C91 = 0.149966755554045;
+    const C92 = 0.8560416229147715;
+    const C93 = 0.5169068966820275;
+    const C94 = 0.5930676289532372;
+    const C95 = 0.8051526485628582;
+    const C96 = 0.5860188535858938;
+    const C97 = 0.8102974165341235;
+    const C98 = 0.23132342789789254;
+    const C99 = 0.9728769047035543;
+    const C100 = 0.9873447032829712;
+    const C101 = 0.15858889273546717;
+    const C102 = 0.851498221089579;
+    const C103 = 0.5243574920617445;
+    const C104 = 0.8468899743781412;
+    const C105 = 0.5317681555883085;
+    const C106 = 0.5789254506139857;
+    const C107 = 0.8153804772199257;
+    const C108 = 0.22282477496612907;
+    const C109 = 0.9748585126372411;
+    const C110 = 0.9859231766199597;
+    const C111 = 0.16719895275870564;
+    const C112 = 0.9844265680898916;
+    const C113 = 0.1757962799343545;
+    const C114 = 0.8422172337162865;
+    const C115 = 0.5391383229110002;
+    const C116 = 0.5717879602276122;
+    const C117 = 0.8204014435255136;
+    const C118 = 0.21430915306505077;
+    const C119 = 0.9767658813208724;
+    const C120 = 0.2057772106922349;
+    const C121 = 0.9785988655009383;
+    const C122 = 0.9828549916653012;
+    const C123 = 0.18438021954266337;
+    const C124 = 0.8374803549513079;
+    const C125 = 0.5464674327630434;
+    const C126 = 0.5646069259743004;
+    const C127 = 0.8253599330848638;
+    const C128 = 0.557382894717611;
+    const C129 = 0.8302555682897986;
+    const C130 = 0.19722959758812594;
+    const C131 = 0.9803573255885968;
+    const C132 = 0.9812085670278176;
+    const C133 = 0.19295011788339703;
+    const C134 = 0.8326796988148626;
+    const C135 = 0.553754927004347;
+    const C136 = 0.8278156308955021;
+    const C137 = 0.5610002506640098;
+    const C138 = 0.5501164165954934;
+    const C139 = 0.8350879763187431;
+    const C140 = 0.18866696468655522;
+    const C141 = 0.9820411276703039;
+    const C142 = 0.9794874195590514;
+    const C143 = 0.20150532232561713;
+    const C144 = 0.977691680331046;
+    const C145 = 0.2100451813573825;
+    const C146 = 0.8228885216108303;
+    const C147 = 0.5682028519825839;
+    const C148 = 0.5428080449783895;
+    const C149 = 0.8398567891651163;
+    const C150 = 0.1800899640651698;
+    const C151 = 0.9836501435180122;
+    const C152 = 0.17149924889577414;
+    const C153 = 0.9851842505989351;
+    const C154 = 0.9758214860962962;
+    const C155 = 0.21856904463536458;
+    const C156 = 0.8178987461792955;
+    const C157 = 0.5753621824540925;
+    const C158 = 0.5354583364270938;
+    const C159 = 0.8445616436653568;
+    const C160 = 0.528067850650368;
+    const C161 = 0.8492021815265789;
+    const C162 = 0.16289547339458874;
+    const C163 = 0.986643332084879;
+    const C164 = 0.9738769792773336;
+    const C165 = 0.22707626303437323;
+    const C166 = 0.8128466845916152;
+    const C167 = 0.5824776968678022;
+    const C168 = 0.8077327215818395;
+    const C169 = 0.5895488533497412;
+    const C170 = 0.5206371504623173;
+    const C171 = 0.8537780493538577;
+    const C172 = 0.15427929277242886;
+    const C173 = 0.9880272768611397;
+    const C174 = 0.9718583079558811;
+    const C175 = 0.23556618869679022;
+    const C176 = 0.9697656258615752;
+    const C177 = 0.24403817508190642;
+    const C178 = 0.8025572465980509;
+    const C179 = 0.5965751134039663;
+    const C180 = 0.5131668017395302;
+    const C181 = 0.8582888986771422;
+    const C182 = 0.1456513631848078;
+    const C183 = 0.9893359795349642;
+    const C184 = 0.13701234168196802;
+    const C185 = 0.9905693404435773;
+    const C186 = 0.9675990923602598;
+    const C187 = 0.25249157701515795;
+    const C188 = 0.7973206537727071;
+    const C189 = 0.6035559419535714;
+    const C190 = 0.5056573733779846;
+    const C191 = 0.8627343859777918;
+    const C192 = 0.4981094372497241;
+    const C193 = 0.8671141727147372;
+    const C194 = 0.12836288615884434;
+    const C195 = 0.9917272656617703;
+    const C196 = 0.9653588724418489;
+    const C197 = 0.2609257507372589;
+    const C198 = 0.7920233418926261;
+    const C199 = 0.6104908073814348;
+    t4 = re[76];
+    t6 = im[76];
+    t9 = re[121];
+    t0 = im[121];
+    t10 = re[166];
+    t12 = im[166];
+    t13 = re[31];
+    t8 = im[31];
+    t2 = t4 + t10;
+    t11 = t6 + t12;
+    t14 = t9 + t13;
+    t5 = t0 + t8;
+    t1 = t4 - t10;
+    t3 = t6 - t12;
+    t7 = t9 - t13;
+    t4 = t0 - t8;
+    t10 = t2 + t14;
+    t6 = t11 + t5;
+    t12 = t1 + t4;
+    t9 = t3 - t7;
+    t13 = t2 - t14;
+    t0 = t11 - t5;
+    t8 = t1 - t4;
+    t2 = t3 + t7;
+    t14 = C0 * t10;
+    t11 = C1 * t6;
+    t5 = t14 + t11;
+    y[12] = 0;
+    t1 = (-0.07489920785476051) * t5;
+    y[347] = t1;
+    t4 = (-C1) * t10;
+    t3 = C0 * t6;
+    t7 = t4 + t3;
+    t14 = 0.07417375583368668 * t7;
+    y[372] = t14;
+    t11 = 0.0007979837397111069 * t7;
+    y[707] = t11;
+    t5 = C2 * t12;
+    t1 = C3 * t9;
+    t10 = t5 + t1;
+    t6 = 0.0024068981659060083 * t10;
+    y[102] = t6;
+    t4 = (-0.07057379992151286) * t10;
+    y[257] = t4;
+    t3 = (-C3) * t12;
+    t14 = C2 * t9;
+    t7 = t3 + t14;
+    t11 = 0.07758254548835453 * t7;
+    y[462] = t11;
+    t5 = 0.033346035987584 * t7;
+    y[617] = t5;
+    t1 = (-C4) * t13;
+    t6 = (-C5) * t0;
+    t10 = t1 + t6;
+    t4 = 0.07571198972050501 * t10;
+    y[527] = t4;
+    t12 = 0.0680104978428295 * t10;
+    y[552] = t12;
+    t9 = C5 * t13;
+    t3 = (-C4) * t0;
+    t14 = t9 + t3;
+    t11 = 0.0309286123492606 * t14;
+    y[167] = t11;
+    t7 = (-0.04559496117904212) * t14;
+    y[192] = t7;
+    t5 = (-C6) * t8;
+    t1 = (-C7) * t2;
+    t6 = t5 + t1;
+    t4 = 0.07527606842734347 * t6;
+    y[437] = t4;
+    t10 = 0.019760759384634594 * t6;
+    y[642] = t10;
+    t12 = C7 * t8;
+    t13 = (-C6) * t2;
+    t0 = t12 + t13;
+    y[77] = 0;
+    t9 = (-0.07380241385637434) * t0;
+    y[282] = t9;
+    t3 = re[172];
+    t11 = im[172];
+    t14 = re[37];
+    t7 = im[37];
+    t5 = re[82];
+    t1 = im[82];
+    t4 = re[127];
+    t6 = im[127];
+    t10 = t3 + t5;
+    t8 = t11 + t1;
+    t2 = t14 + t4;
+    t12 = t7 + t6;
+    t13 = t3 - t5;
+    t0 = t11 - t1;
+    t9 = t14 - t4;
+    t3 = t7 - t6;
+    t5 = t10 + t2;
+    t11 = t8 + t12;
+    t1 = t13 + t3;
+    t14 = t0 - t9;
+    t4 = t10 - t2;
+    t7 = t8 - t12;
+    t6 = t13 - t3;
+    t10 = t0 + t9;
+    t2 = (-C8) * t5;
+    t8 = (-C9) * t11;
+    t12 = t2 + t8;
+    t13 = 0.07511619859431522 * t12;
+    y[435] = t13;
+    t3 = 0.018783265486367183 * t12;
+    y[644] = t3;
+    t0 = C9 * t5;
+    t9 = (-C8) * t11;
+    t2 = t0 + t9;
+    y[75] = 0;
+    t8 = (-0.07395948756086279) * t2;
+    y[284] = t8;
+    t13 = C10 * t1;
+    t12 = C11 * t14;
+    t3 = t13 + t12;
+    y[14] = 0;
+    t5 = (-0.07495205222248426) * t3;
+    y[345] = t5;
+    t11 = (-C11) * t1;
+    t0 = C10 * t14;
+    t9 = t11 + t0;
+    t2 = 0.07412146019784352 * t9;
+    y[374] = t2;
+    t8 = 0.000977833493522871 * t9;
+    y[705] = t8;
+    t13 = C12 * t4;
+    t12 = C13 * t7;
+    t3 = t13 + t12;
+    t5 = 0.0028145556758956444 * t3;
+    y[104] = t5;
+    t1 = (-0.07019154559098635) * t3;
+    y[255] = t1;
+    t14 = (-C13) * t4;
+    t11 = C12 * t7;
+    t0 = t14 + t11;
+    t2 = 0.07776474091872976 * t0;
+    y[464] = t2;
+    t9 = 0.034509247345545814 * t0;
+    y[615] = t9;
+    t8 = (-C14) * t6;
+    t13 = (-C15) * t10;
+    t12 = t8 + t13;
+    t5 = 0.07613711365134428 * t12;
+    y[525] = t5;
+    t3 = 0.06720997326121436 * t12;
+    y[554] = t3;
+    t1 = C15 * t6;
+    t4 = (-C14) * t10;
+    t7 = t1 + t4;
+    t14 = 0.029743628280473965 * t7;
+    y[165] = t14;
+    t11 = (-0.04671160914268008) * t7;
+    y[194] = t11;
+    t2 = re[88];
+    t0 = im[88];
+    t9 = re[133];
+    t8 = im[133];
+    t13 = re[178];
+    t5 = im[178];
+    t12 = re[43];
+    t3 = im[43];
+    t6 = t2 + t13;
+    t10 = t0 + t5;
+    t1 = t9 + t12;
+    t4 = t8 + t3;
+    t14 = t2 - t13;
+    t7 = t0 - t5;
+    t11 = t9 - t12;
+    t2 = t8 - t3;
+    t13 = t6 + t1;
+    t0 = t10 + t4;
+    t5 = t14 + t2;
+    t9 = t7 - t11;
+    t12 = t6 - t1;
+    t8 = t10 - t4;
+    t3 = t14 - t2;
+    t6 = t7 + t11;
+    t1 = (-C16) * t13;
+    t10 = (-C17) * t0;
+    t4 = t1 + t10;
+    t14 = 0.07653423786690212 * t4;
+    y[523] = t14;
+    t2 = 0.06638406702686302 * t4;
+    y[556] = t2;
+    t7 = C17 * t13;
+    t11 = (-C16) * t0;
+    t1 = t7 + t11;
+    t10 = 0.028564578122477702 * t1;
+    y[163] = t10;
+    t14 = (-0.047812884649648266) * t1;
+    y[196] = t14;
+    t4 = (-C18) * t5;
+    t2 = (-C19) * t9;
+    t13 = t4 + t2;
+    t0 = 0.07496630414092705 * t13;
+    y[433] = t0;
+    t7 = 0.017826525775521376 * t13;
+    y[646] = t7;
+    t11 = C19 * t5;
+    t10 = (-C18) * t9;
+    t1 = t11 + t10;
+    y[73] = 0;
+    t14 = (-0.07410736889352079) * t1;
+    y[286] = t14;
+    t4 = C20 * t12;
+    t2 = C21 * t8;
+    t0 = t4 + t2;
+    y[16] = 0;
+    t13 = (-0.0750024847199091) * t0;
+    y[343] = t13;
+    t7 = (-C21) * t12;
+    t5 = C20 * t8;
+    t9 = t7 + t5;
+    t11 = 0.07407162011101821 * t9;
+    y[376] = t11;
+    t10 = 0.0011801616573000912 * t9;
+    y[703] = t10;
+    t1 = C22 * t3;
+    t14 = C23 * t6;
+    t4 = t1 + t14;
+    t2 = 0.0032578351613788224 * t4;
+    y[106] = t2;
+    t0 = (-0.06978698274465173) * t4;
+    y[253] = t0;
+    t13 = (-C23) * t3;
+    t12 = C22 * t6;
+    t8 = t13 + t12;
+    t7 = 0.07794177142410044 * t8;
+    y[466] = t7;
+    t5 = 0.035678446679014125 * t8;
+    y[613] = t5;
+    t11 = re[144];
+    t9 = im[144];
+    t10 = re[9];
+    t1 = im[9];
+    t14 = re[54];
+    t2 = im[54];
+    t4 = re[99];
+    t0 = im[99];
+    t3 = t11 + t14;
+    t6 = t9 + t2;
+    t13 = t10 + t4;
+    t12 = t1 + t0;
+    t7 = t11 - t14;
+    t8 = t9 - t2;
+    t5 = t10 - t4;
+    t11 = t1 - t0;
+    t14 = t3 + t13;
+    t9 = t6 + t12;
+    t2 = t7 + t11;
+    t10 = t8 - t5;
+    t4 = t3 - t13;
+    t1 = t6 - t12;
+    t0 = t7 - t11;
+    t3 = t8 + t5;
+    t13 = C24 * t14;
+    t6 = C25 * t9;
+    t12 = t13 + t6;
+    t7 = 0.0037367281520488786 * t12;
+    y[108] = t7;
+    t11 = (-0.06935991088229848) * t12;
+    y[251] = t11;
+    t8 = (-C25) * t14;
+    t5 = C24 * t9;
+    t13 = t8 + t5;
+    t6 = 0.07811209041394841 * t13;
+    y[468] = t6;
+    t7 = 0.03685254051423165 * t13;
+    y[611] = t7;
+    t12 = (-C26) * t2;
+    t11 = (-C27) * t10;
+    t14 = t12 + t11;
+    t9 = 0.07690288192773581 * t14;
+    y[521] = t9;
+    t8 = 0.06553374995687641 * t14;
+    y[558] = t8;
+    t5 = C27 * t2;
+    t6 = (-C26) * t10;
+    t13 = t5 + t6;
+    t7 = 0.02739198624153461 * t13;
+    y[161] = t7;
+    t12 = (-0.04889876535334858) * t13;
+    y[198] = t12;
+    t11 = (-C28) * t4;
+    t9 = (-C29) * t1;
+    t14 = t11 + t9;
+    t8 = 0.07482598399384086 * t14;
+    y[431] = t8;
+    t2 = 0.01689105598606925 * t14;
+    y[648] = t2;
+    t10 = C29 * t4;
+    t5 = (-C28) * t1;
+    t6 = t10 + t5;
+    y[71] = 0;
+    t7 = (-0.07424634143151193) * t6;
+    y[288] = t7;
+    t13 = C30 * t0;
+    t12 = C31 * t3;
+    t11 = t13 + t12;
+    y[18] = 0;
+    t9 = (-0.07505017829539895) * t11;
+    y[341] = t9;
+    t8 = (-C31) * t0;
+    t14 = C30 * t3;
+    t2 = t8 + t14;
+    t4 = 0.07402454839865644 * t2;
+    y[378] = t4;
+    t1 = 0.0014056274459970663 * t2;
+    y[701] = t1;
+    t10 = re[60];
+    t5 = im[60];
+    t6 = re[105];
+    t7 = im[105];
+    t13 = re[150];
+    t12 = im[150];
+    t11 = re[15];
+    t9 = im[15];
+    t0 = t10 + t13;
+    t3 = t5 + t12;
+    t8 = t6 + t11;
+    t14 = t7 + t9;
+    t4 = t10 - t13;
+    t2 = t5 - t12;
+    t1 = t6 - t11;
+    t10 = t7 - t9;
+    t13 = t0 + t8;
+    t5 = t3 + t14;
+    t12 = t4 + t10;
+    t6 = t2 - t1;
+    t11 = t0 - t8;
+    t7 = t3 - t14;
+    t9 = t4 - t10;
+    t0 = t2 + t1;
+    t8 = C32 * t13;
+    t3 = C33 * t5;
+    t14 = t8 + t3;
+    y[20] = 0;
+    t4 = (-0.07509479364736635) * t14;
+    y[339] = t4;
+    t10 = (-C33) * t13;
+    t2 = C32 * t5;
+    t1 = t10 + t2;
+    t8 = 0.07398056890126894 * t1;
+    y[380] = t8;
+    t3 = 0.0016551485214856972 * t1;
+    y[699] = t3;
+    t14 = C34 * t12;
+    t4 = C35 * t6;
+    t13 = t14 + t4;
+    t5 = 0.004251091028882468 * t13;
+    y[110] = t5;
+    t10 = (-0.06890962178717301) * t13;
+    y[249] = t10;
+    t2 = (-C35) * t12;
+    t8 = C34 * t6;
+    t1 = t2 + t8;
+    t3 = 0.07827477964699882 * t1;
+    y[470] = t3;
+    t14 = 0.03803025941062032 * t1;
+    y[609] = t14;
+    t4 = (-C36) * t11;
+    t5 = (-C37) * t7;
+    t13 = t4 + t5;
+    t10 = 0.07724297509017906 * t13;
+    y[519] = t10;
+    t12 = 0.06465935512789801 * t13;
+    y[560] = t12;
+    t6 = C37 * t11;
+    t2 = (-C36) * t7;
+    t8 = t6 + t2;
+    t3 = 0.026228131666691412 * t8;
+    y[159] = t3;
+    t1 = (-0.0499677992888239) * t8;
+    y[200] = t1;
+    t14 = (-C38) * t9;
+    t4 = (-C39) * t0;
+    t5 = t14 + t4;
+    t10 = 0.07469517305545602 * t5;
+    y[429] = t10;
+    t13 = 0.01597743799899386 * t5;
+    y[650] = t13;
+    t12 = C39 * t9;
+    t11 = (-C38) * t0;
+    t7 = t12 + t11;
+    y[69] = 0;
+    t6 = (-0.07437636634740691) * t7;
+    y[290] = t6;
+    t2 = re[156];
+    t3 = im[156];
+    t8 = re[21];
+    t1 = im[21];
+    t14 = re[66];
+    t4 = im[66];
+    t10 = re[111];
+    t5 = im[111];
+    t13 = t2 + t14;
+    t9 = t3 + t4;
+    t0 = t8 + t10;
+    t12 = t1 + t5;
+    t11 = t2 - t14;
+    t7 = t3 - t4;
+    t6 = t8 - t10;
+    t2 = t1 - t5;
+    t14 = t13 + t0;
+    t3 = t9 + t12;
+    t4 = t11 + t2;
+    t8 = t7 - t6;
+    t10 = t13 - t0;
+    t1 = t9 - t12;
+    t5 = t11 - t2;
+    t13 = t7 + t6;
+    t0 = (-C40) * t14;
+    t9 = (-C41) * t3;
+    t12 = t0 + t9;
+    t11 = 0.07457395540421297 * t12;
+    y[427] = t11;
+    t2 = 0.015086781910979527 * t12;
+    y[652] = t2;
+    t7 = C41 * t14;
+    t6 = (-C40) * t3;
+    t0 = t7 + t6;
+    y[67] = 0;
+    t9 = (-0.07449726282376734) * t0;
+    y[292] = t9;
+    t11 = C42 * t4;
+    t12 = C43 * t8;
+    t2 = t11 + t12;
+    y[22] = 0;
+    t14 = (-0.07513597558736292) * t2;
+    y[337] = t14;
+    t3 = (-C43) * t4;
+    t7 = C42 * t8;
+    t6 = t3 + t7;
+    t0 = 0.07394002023832033 * t6;
+    y[382] = t0;
+    t9 = 0.0019296043732207938 * t6;
+    y[697] = t9;
+    t11 = C44 * t10;
+    t12 = C45 * t1;
+    t2 = t11 + t12;
+    t14 = 0.004800668688217836 * t2;
+    y[112] = t14;
+    t4 = (-0.06843511489527315) * t2;
+    y[247] = t4;
+    t8 = (-C45) * t10;
+    t3 = C44 * t1;
+    t7 = t8 + t3;
+    t0 = 0.07842932782810454 * t7;
+    y[472] = t0;
+    t6 = 0.039210265632819354 * t7;
+    y[607] = t6;
+    t9 = (-C46) * t5;
+    t11 = (-C47) * t13;
+    t12 = t9 + t11;
+    t14 = 0.07755518221415482 * t12;
+    y[517] = t14;
+    t2 = 0.0637612778454389 * t12;
+    y[562] = t2;
+    t4 = C47 * t5;
+    t10 = (-C46) * t13;
+    t1 = t4 + t10;
+    t8 = 0.025074379332856854 * t1;
+    y[157] = t8;
+    t3 = (-0.05101891292299967) * t1;
+    y[202] = t3;
+    t0 = re[92];
+    t7 = im[92];
+    t6 = re[137];
+    t9 = im[137];
+    t11 = re[2];
+    t14 = im[2];
+    t12 = re[47];
+    t2 = im[47];
+    t5 = t0 + t11;
+    t13 = t7 + t14;
+    t4 = t6 + t12;
+    t10 = t9 + t2;
+    t8 = t0 - t11;
+    t1 = t7 - t14;
+    t3 = t6 - t12;
+    t0 = t9 - t2;
+    t11 = t5 + t4;
+    t7 = t13 + t10;
+    t14 = t8 + t0;
+    t6 = t1 - t3;
+    t12 = t5 - t4;
+    t9 = t13 - t10;
+    t2 = t8 - t0;
+    t5 = t1 + t3;
+    t4 = (-C48) * t11;
+    t13 = (-C49) * t7;
+    t10 = t4 + t13;
+    t8 = 0.07784000908910041 * t10;
+    y[515] = t8;
+    t0 = 0.06284016604564573 * t10;
+    y[564] = t0;
+    t1 = C49 * t11;
+    t3 = (-C48) * t7;
+    t4 = t1 + t3;
+    t13 = 0.02393267321582922 * t4;
+    y[155] = t13;
+    t8 = (-0.05205064136257923) * t4;
+    y[204] = t8;
+    t10 = (-C50) * t14;
+    t0 = (-C51) * t6;
+    t11 = t10 + t0;
+    t7 = 0.07446206884269224 * t11;
+    y[425] = t7;
+    t1 = 0.014220262010509356 * t11;
+    y[654] = t1;
+    t3 = C51 * t14;
+    t13 = (-C50) * t6;
+    t4 = t3 + t13;
+    y[65] = 0;
+    t8 = (-0.07460920226769635) * t4;
+    y[294] = t8;
+    t10 = C52 * t12;
+    t0 = C53 * t9;
+    t7 = t10 + t0;
+    y[24] = 0;
+    t11 = (-0.07517340029871654) * t7;
+    y[335] = t11;
+    t1 = (-C53) * t12;
+    t14 = C52 * t9;
+    t6 = t1 + t14;
+    t3 = 0.07390320955922502 * t6;
+    y[384] = t3;
+    t13 = 0.002229055261370192 * t6;
+    y[695] = t13;
+    t4 = C54 * t2;
+    t8 = C55 * t5;
+    t10 = t4 + t8;
+    t0 = 0.005385116887313331 * t10;
+    y[114] = t0;
+    t7 = (-0.06793559503952946) * t10;
+    y[245] = t7;
+    t11 = (-C55) * t2;
+    t12 = C54 * t5;
+    t9 = t11 + t12;
+    t1 = 0.07857505943811341 * t9;
+    y[474] = t1;
+    t14 = 0.04039134932676299 * t9;
+    y[605] = t14;
+    t3 = re[8];
+    t6 = im[8];
+    t13 = re[53];
+    t4 = im[53];
+    t8 = re[98];
+    t0 = im[98];
+    t10 = re[143];
+    t7 = im[143];
+    t2 = t3 + t8;
+    t5 = t6 + t0;
+    t11 = t13 + t10;
+    t12 = t4 + t7;
+    t1 = t3 - t8;
+    t9 = t6 - t0;
+    t14 = t13 - t10;
+    t3 = t4 - t7;
+    t8 = t2 + t11;
+    t6 = t5 + t12;
+    t0 = t1 + t3;
+    t13 = t9 - t14;
+    t10 = t2 - t11;
+    t4 = t5 - t12;
+    t7 = t1 - t3;
+    t2 = t9 + t14;
+    t11 = C56 * t8;
+    t5 = C57 * t6;
+    t12 = t11 + t5;
+    t1 = 0.006004019447140323 * t12;
+    y[116] = t1;
+    t3 = (-0.06741130369498281) * t12;
+    y[243] = t3;
+    t9 = (-C57) * t8;
+    t14 = C56 * t6;
+    t11 = t9 + t14;
+    t5 = 0.0787101603489525 * t11;
+    y[476] = t5;
+    t1 = 0.041572322439829716 * t11;
+    y[603] = t1;
+    t12 = (-C58) * t0;
+    t3 = (-C59) * t13;
+    t8 = t12 + t3;
+    t6 = 0.07809766918983464 * t8;
+    y[513] = t6;
+    t9 = 0.06189680526819404 * t8;
+    y[566] = t9;
+    t14 = C59 * t0;
+    t5 = (-C58) * t13;
+    t11 = t14 + t5;
+    t1 = 0.022804283234255183 * t11;
+    y[153] = t1;
+    t12 = (-0.05306231696686175) * t11;
+    y[206] = t12;
+    t3 = (-C60) * t10;
+    t6 = (-C61) * t4;
+    t8 = t3 + t6;
+    t9 = 0.07435931760665028 * t8;
+    y[423] = t9;
+    t0 = 0.013378002394316833 * t8;
+    y[656] = t0;
+    t13 = C61 * t10;
+    t14 = (-C60) * t4;
+    t5 = t13 + t14;
+    y[63] = 0;
+    t1 = (-0.07471229879950778) * t5;
+    y[296] = t1;
+    t11 = C62 * t7;
+    t12 = C63 * t2;
+    t3 = t11 + t12;
+    y[26] = 0;
+    t6 = (-0.07520672134166241) * t3;
+    y[333] = t6;
+    t9 = (-C63) * t7;
+    t8 = C62 * t2;
+    t0 = t9 + t8;
+    t10 = 0.07387046604939465 * t0;
+    y[386] = t10;
+    t4 = 0.00255366426502586 * t0;
+    y[693] = t4;
+    t13 = re[104];
+    t14 = im[104];
+    t5 = re[149];
+    t1 = im[149];
+    t11 = re[14];
+    t12 = im[14];
+    t3 = re[59];
+    t6 = im[59];
+    t7 = t13 + t11;
+    t2 = t14 + t12;
+    t9 = t5 + t3;
+    t8 = t1 + t6;
+    t10 = t13 - t11;
+    t0 = t14 - t12;
+    t4 = t5 - t3;
+    t13 = t1 - t6;
+    t11 = t7 + t9;
+    t14 = t2 + t8;
+    t12 = t10 + t13;
+    t5 = t0 - t4;
+    t3 = t7 - t9;
+    t1 = t2 - t8;
+    t6 = t10 - t13;
+    t7 = t0 + t4;
+    t9 = C64 * t11;
+    t2 = C65 * t14;
+    t8 = t9 + t2;
+    y[28] = 0;
+    t10 = (-0.07523562433528812) * t8;
+    y[331] = t10;
+    t13 = (-C65) * t11;
+    t0 = C64 * t14;
+    t4 = t13 + t0;
+    t9 = 0.07384208750361634 * t4;
+    y[388] = t9;
+    t2 = 0.0029040315795407093 * t4;
+    y[691] = t2;
+    t8 = C66 * t12;
+    t10 = C67 * t5;
+    t11 = t8 + t10;
+    t14 = 0.006656903764848652 * t11;
+    y[118] = t14;
+    t13 = (-0.0668621636659968) * t11;
+    y[241] = t13;
+    t0 = (-C67) * t12;
+    t9 = C66 * t5;
+    t4 = t0 + t9;
+    t2 = 0.07883322950726442 * t4;
+    y[478] = t2;
+    t8 = 0.04275189667372712 * t4;
+    y[601] = t8;
+    t10 = (-C68) * t3;
+    t14 = (-C69) * t1;
+    t11 = t10 + t14;
+    t13 = 0.07832839163125538 * t11;
+    y[511] = t13;
+    t12 = 0.06093217079840101 * t11;
+    y[568] = t12;
+    t5 = C69 * t3;
+    t0 = (-C68) * t1;
+    t9 = t5 + t0;
+    t2 = 0.021690646887164954 * t9;
+    y[151] = t2;
+    t4 = (-0.05405316343824382) * t9;
+    y[208] = t4;
+    t8 = (-C70) * t6;
+    t10 = (-C71) * t7;
+    t14 = t8 + t10;
+    t13 = 0.0742656761333236 * t14;
+    y[421] = t13;
+    t11 = 0.012560244466040787 * t14;
+    y[658] = t11;
+    t12 = C71 * t6;
+    t3 = (-C70) * t7;
+    t1 = t12 + t3;
+    y[61] = 0;
+    t5 = (-0.07480650341864636) * t1;
+    y[298] = t5;
+    t0 = re[40];
+    t2 = im[40];
+    t9 = re[85];
+    t4 = im[85];
+    t8 = re[130];
+    t10 = im[130];
+    t13 = re[175];
+    t14 = im[175];
+    t11 = t0 + t8;
+    t6 = t2 + t10;
+    t7 = t9 + t13;
+    t12 = t4 + t14;
+    t3 = t0 - t8;
+    t1 = t2 - t10;
+    t5 = t9 - t13;
+    t0 = t4 - t14;
+    t8 = t11 + t7;
+    t2 = t6 + t12;
+    t10 = t3 + t0;
+    t9 = t1 - t5;
+    t13 = t11 - t7;
+    t4 = t6 - t12;
+    t14 = t3 - t0;
+    t11 = t1 + t5;
+    t7 = (-C72) * t8;
+    t6 = (-C73) * t2;
+    t12 = t7 + t6;
+    t3 = 0.07418097507515262 * t12;
+    y[419] = t3;
+    t0 = 0.011767594897081788 * t12;
+    y[660] = t0;
+    t1 = C73 * t8;
+    t5 = (-C72) * t2;
+    t7 = t1 + t5;
+    y[59] = 0;
+    t6 = (-0.07489191871537453) * t7;
+    y[300] = t6;
+    t3 = C74 * t10;
+    t12 = C75 * t9;
+    t0 = t3 + t12;
+    y[30] = 0;
+    t8 = (-0.07525977943575472) * t0;
+    y[329] = t8;
+    t2 = (-C75) * t10;
+    t1 = C74 * t9;
+    t5 = t2 + t1;
+    t7 = 0.07381838742030912 * t5;
+    y[390] = t7;
+    t6 = 0.003280615794812773 * t5;
+    y[689] = t6;
+    t3 = C76 * t13;
+    t12 = C77 * t4;
+    t0 = t3 + t12;
+    t8 = 0.007343269434112685 * t0;
+    y[120] = t8;
+    t10 = (-0.06628739149209381) * t0;
+    y[239] = t10;
+    t9 = (-C77) * t13;
+    t2 = C76 * t4;
+    t1 = t9 + t2;
+    t7 = 0.078943755942419 * t1;
+    y[480] = t7;
+    t5 = 0.04392864819117198 * t1;
+    y[599] = t5;
+    t6 = (-C78) * t14;
+    t3 = (-C79) * t11;
+    t12 = t6 + t3;
+    t8 = 0.07853258704510427 * t12;
+    y[509] = t8;
+    t0 = 0.05994684933986933 * t12;
+    y[570] = t0;
+    t10 = C79 * t14;
+    t13 = (-C78) * t11;
+    t4 = t10 + t13;
+    t9 = 0.020593098975334338 * t4;
+    y[149] = t9;
+    t2 = (-0.05502256217993199) * t4;
+    y[210] = t2;
+    t7 = re[136];
+    t1 = im[136];
+    t5 = re[1];
+    t6 = im[1];
+    t3 = re[46];
+    t8 = im[46];
+    t12 = re[91];
+    t0 = im[91];
+    t14 = t7 + t3;
+    t11 = t1 + t8;
+    t10 = t5 + t12;
+    t13 = t6 + t0;
+    t9 = t7 - t3;
+    t4 = t1 - t8;
+    t2 = t5 - t12;
+    t7 = t6 - t0;
+    t3 = t14 + t10;
+    t1 = t11 + t13;
+    t8 = t9 + t7;
+    t5 = t4 - t2;
+    t12 = t14 - t10;
+    t6 = t11 - t13;
+    t0 = t9 - t7;
+    t14 = t4 + t2;
+    t10 = (-C80) * t3;
+    t11 = (-C81) * t1;
+    t13 = t10 + t11;
+    t9 = 0.07871072623375217 * t13;
+    y[507] = t9;
+    t7 = 0.058941354834138 * t13;
+    y[572] = t7;
+    t4 = C81 * t3;
+    t2 = (-C80) * t1;
+    t10 = t4 + t2;
+    t11 = 0.019514347494519975 * t10;
+    y[147] = t11;
+    t9 = (-0.05596890902062735) * t10;
+    y[212] = t9;
+    t13 = (-C82) * t8;
+    t7 = (-C83) * t5;
+    t3 = t13 + t7;
+    t1 = 0.07410494162131781 * t3;
+    y[417] = t1;
+    t4 = 0.011000747977745941 * t3;
+    y[662] = t4;
+    t2 = C83 * t8;
+    t11 = (-C82) * t5;
+    t10 = t2 + t11;
+    y[57] = 0;
+    t9 = (-0.07496875962665067) * t10;
+    y[302] = t9;
+    t13 = C84 * t12;
+    t7 = C85 * t6;
+    t1 = t13 + t7;
+    y[32] = 0;
+    t3 = (-0.07527885140656462) * t1;
+    y[327] = t3;
+    t4 = (-C85) * t12;
+    t8 = C84 * t6;
+    t5 = t4 + t8;
+    t2 = 0.073799685459482 * t5;
+    y[392] = t2;
+    t11 = 0.0036836583231711047 * t5;
+    y[687] = t11;
+    t10 = C86 * t0;
+    t9 = C87 * t14;
+    t13 = t10 + t9;
+    t7 = 0.00806262304799125 * t13;
+    y[122] = t7;
+    t1 = (-0.06568628740452798) * t13;
+    y[237] = t1;
+    t3 = (-C87) * t0;
+    t12 = C86 * t14;
+    t6 = t3 + t12;
+    t4 = 0.07904112455093797 * t6;
+    y[482] = t4;
+    t8 = 0.045101641160831665 * t6;
+    y[597] = t8;
+    t2 = re[52];
+    t5 = im[52];
+    t11 = re[97];
+    t10 = im[97];
+    t9 = re[142];
+    t7 = im[142];
+    t13 = re[7];
+    t1 = im[7];
+    t0 = t2 + t9;
+    t14 = t5 + t7;
+    t3 = t11 + t13;
+    t12 = t10 + t1;
+    t4 = t2 - t9;
+    t6 = t5 - t7;
+    t8 = t11 - t13;
+    t2 = t10 - t1;
+    t9 = t0 + t3;
+    t5 = t14 + t12;
+    t7 = t4 + t2;
+    t11 = t6 - t8;
+    t13 = t0 - t3;
+    t10 = t14 - t12;
+    t1 = t4 - t2;
+    t0 = t6 + t8;
+    t3 = C88 * t9;
+    t14 = C89 * t5;
+    t12 = t3 + t14;
+    t4 = 0.00881418212054679 * t12;
+    y[124] = t4;
+    t2 = (-0.06505898861211178) * t12;
+    y[235] = t2;
+    t6 = (-C89) * t9;
+    t8 = C88 * t5;
+    t3 = t6 + t8;
+    t14 = 0.07912400767771946 * t3;
+    y[484] = t14;
+    t4 = 0.0462694820152932 * t3;
+    y[595] = t4;
+    t12 = (-C90) * t7;
+    t2 = (-C91) * t11;
+    t9 = t12 + t2;
+    t5 = 0.0788640459127583 * t9;
+    y[505] = t5;
+    t6 = 0.05791691702580703 * t9;
+    y[574] = t6;
+    t8 = C91 * t7;
+    t14 = (-C90) * t11;
+    t3 = t8 + t14;
+    t4 = 0.018453847710442315 * t3;
+    y[145] = t4;
+    t12 = (-0.05689240942401537) * t3;
+    y[214] = t12;
+    t2 = (-C92) * t13;
+    t5 = (-C93) * t10;
+    t9 = t2 + t5;
+    t6 = 0.074037419382818 * t9;
+    y[415] = t6;
+    t7 = 0.010260231943808849 * t9;
+    y[664] = t7;
+    t11 = C93 * t13;
+    t8 = (-C92) * t10;
+    t14 = t11 + t8;
+    y[55] = 0;
+    t4 = (-0.07503713124886202) * t14;
+    y[304] = t4;
+    t3 = C94 * t1;
+    t12 = C95 * t0;
+    t2 = t3 + t12;
+    y[34] = 0;
+    t5 = (-0.0752925301001395) * t2;
+    y[325] = t5;
+    t6 = (-C95) * t1;
+    t9 = C94 * t0;
+    t7 = t6 + t9;
+    t13 = 0.07378627797693389 * t7;
+    y[394] = t13;
+    t10 = 0.004113242104958822 * t7;
+    y[685] = t10;
+    t11 = re[108];
+    t8 = im[108];
+    t14 = re[153];
+    t4 = im[153];
+    t3 = re[18];
+    t12 = im[18];
+    t2 = re[63];
+    t5 = im[63];
+    t1 = t11 + t3;
+    t0 = t8 + t12;
+    t6 = t14 + t2;
+    t9 = t4 + t5;
+    t13 = t11 - t3;
+    t7 = t8 - t12;
+    t10 = t14 - t2;
+    t11 = t4 - t5;
+    t3 = t1 + t6;
+    t8 = t0 + t9;
+    t12 = t13 + t11;
+    t14 = t7 - t10;
+    t2 = t1 - t6;
+    t4 = t0 - t9;
+    t5 = t13 - t11;
+    t1 = t7 + t10;
+    t6 = C96 * t3;
+    t0 = C97 * t8;
+    t9 = t6 + t0;
+    y[36] = 0;
+    t13 = (-0.07530050192675915) * t9;
+    y[323] = t13;
+    t11 = (-C97) * t3;
+    t7 = C96 * t8;
+    t10 = t11 + t7;
+    t6 = 0.07377846645642751 * t10;
+    y[396] = t6;
+    t0 = 0.004569478291400881 * t10;
+    y[683] = t0;
+    t9 = C98 * t12;
+    t13 = C99 * t14;
+    t3 = t9 + t13;
+    t8 = 0.009597393388131877 * t3;
+    y[126] = t8;
+    t11 = (-0.0644056743909316) * t3;
+    y[233] = t11;
+    t7 = (-C99) * t12;
+    t6 = C98 * t14;
+    t10 = t7 + t6;
+    t0 = 0.07919092994811297 * t10;
+    y[486] = t0;
+    t9 = 0.04743061873083486 * t10;
+    y[593] = t9;
+    t13 = (-C100) * t2;
+    t8 = (-C101) * t4;
+    t3 = t13 + t8;
+    t11 = 0.07899241569686438 * t3;
+    y[503] = t11;
+    t12 = 0.05687433380975956 * t3;
+    y[576] = t12;
+    t14 = C101 * t2;
+    t7 = (-C100) * t4;
+    t6 = t14 + t7;
+    t0 = 0.017415019803909308 * t6;
+    y[143] = t0;
+    t10 = (-0.0577914710627802) * t6;
+    y[216] = t10;
+    t9 = (-C102) * t5;
+    t13 = (-C103) * t1;
+    t8 = t9 + t13;
+    t11 = 0.07397825346062925 * t8;
+    y[413] = t11;
+    t3 = 0.009546221162544678 * t8;
+    y[666] = t3;
+    t12 = C103 * t5;
+    t2 = (-C102) * t1;
+    t4 = t12 + t2;
+    y[53] = 0;
+    t14 = (-0.0750971440345261) * t4;
+    y[306] = t14;
+    t7 = re[24];
+    t0 = im[24];
+    t6 = re[69];
+    t10 = im[69];
+    t9 = re[114];
+    t13 = im[114];
+    t11 = re[159];
+    t8 = im[159];
+    t3 = t7 + t9;
+    t5 = t0 + t13;
+    t1 = t6 + t11;
+    t12 = t10 + t8;
+    t2 = t7 - t9;
+    t4 = t0 - t13;
+    t14 = t6 - t11;
+    t7 = t10 - t8;
+    t9 = t3 + t1;
+    t0 = t5 + t12;
+    t13 = t2 + t7;
+    t6 = t4 - t14;
+    t11 = t3 - t1;
+    t10 = t5 - t12;
+    t8 = t2 - t7;
+    t3 = t4 + t14;
+    t1 = (-C104) * t9;
+    t5 = (-C105) * t0;
+    t12 = t1 + t5;
+    t2 = 0.07392721761500906 * t12;
+    y[411] = t2;
+    t7 = 0.008858817415260668 * t12;
+    y[668] = t7;
+    t4 = C105 * t9;
+    t14 = (-C104) * t0;
+    t1 = t4 + t14;
+    y[51] = 0;
+    t5 = (-0.07514898754187173) * t1;
+    y[308] = t5;
+    t2 = C106 * t13;
+    t12 = C107 * t6;
+    t7 = t2 + t12;
+    y[38] = 0;
+    t9 = (-0.07530245242836436) * t7;
+    y[321] = t9;
+    t0 = (-C107) * t13;
+    t4 = C106 * t6;
+    t14 = t0 + t4;
+    t1 = 0.07377655542946078 * t14;
+    y[398] = t1;
+    t5 = 0.005052872047437409 * t14;
+    y[681] = t5;
+    t2 = C108 * t11;
+    t12 = C109 * t10;
+    t7 = t2 + t12;
+    t9 = 0.010411689238175531 * t7;
+    y[128] = t9;
+    t13 = (-0.06372614899328394) * t7;
+    y[231] = t13;
+    t6 = (-C109) * t11;
+    t0 = C108 * t10;
+    t4 = t6 + t0;
+    t1 = 0.07924086912061755 * t4;
+    y[488] = t1;
+    t14 = 0.04858386684871984 * t4;
+    y[591] = t14;
+    t5 = (-C110) * t8;
+    t2 = (-C111) * t3;
+    t12 = t5 + t2;
+    t9 = 0.07909673955285182 * t12;
+    y[501] = t9;
+    t7 = 0.05581446591090588 * t12;
+    y[578] = t7;
+    t13 = C111 * t8;
+    t11 = (-C110) * t3;
+    t10 = t13 + t11;
+    t6 = 0.016397980292607583 * t10;
+    y[141] = t6;
+    t0 = (-0.05866627461180603) * t10;
+    y[218] = t0;
+    t1 = re[120];
+    t4 = im[120];
+    t14 = re[165];
+    t5 = im[165];
+    t2 = re[30];
+    t9 = im[30];
+    t12 = re[75];
+    t7 = im[75];
+    t8 = t1 + t2;
+    t3 = t4 + t9;
+    t13 = t14 + t12;
+    t11 = t5 + t7;
+    t6 = t1 - t2;
+    t10 = t4 - t9;
+    t0 = t14 - t12;
+    t1 = t5 - t7;
+    t2 = t8 + t13;
+    t4 = t3 + t11;
+    t9 = t6 + t1;
+    t14 = t10 - t0;
+    t12 = t8 - t13;
+    t5 = t3 - t11;
+    t7 = t6 - t1;
+    t8 = t10 + t0;
+    t13 = (-C112) * t2;
+    t3 = (-C113) * t4;
+    t11 = t13 + t3;
+    t6 = 0.07917742425593305 * t11;
+    y[499] = t6;
+    t1 = 0.0547386736643123 * t11;
+    y[580] = t1;
+    t10 = C113 * t2;
+    t0 = (-C112) * t4;
+    t13 = t10 + t0;
+    t3 = 0.015404851487337206 * t13;
+    y[139] = t3;
+    t6 = (-0.059515884248910744) * t13;
+    y[220] = t6;
+    t11 = (-C114) * t9;
+    t1 = (-C115) * t14;
+    t2 = t11 + t1;
+    t4 = 0.0738840539646149 * t2;
+    y[409] = t4;
+    t10 = 0.008198439078907925 * t2;
+    y[670] = t10;
+    t0 = C115 * t9;
+    t3 = (-C114) * t14;
+    t13 = t0 + t3;
+    y[49] = 0;
+    t6 = (-0.07519289017649554) * t13;
+    y[310] = t6;
+    t11 = C116 * t12;
+    t1 = C117 * t5;
+    t4 = t11 + t1;
+    y[40] = 0;
+    t2 = (-0.07529808938939887) * t4;
+    y[319] = t2;
+    t10 = (-C117) * t12;
+    t9 = C116 * t5;
+    t14 = t10 + t9;
+    t0 = 0.07378083030533994 * t14;
+    y[400] = t0;
+    t3 = 0.005563419649964133 * t14;
+    y[679] = t3;
+    t13 = C118 * t7;
+    t6 = C119 * t8;
+    t11 = t13 + t6;
+    t1 = 0.011255798390928823 * t11;
+    y[130] = t1;
+    t4 = (-0.06302004407934228) * t11;
+    y[229] = t4;
+    t2 = (-C119) * t7;
+    t12 = C118 * t8;
+    t5 = t2 + t12;
+    t10 = 0.07927355304937736 * t5;
+    y[490] = t10;
+    t9 = 0.04972839141369215 * t5;
+    y[589] = t9;
+    t0 = re[56];
+    t14 = im[56];
+    t3 = re[101];
+    t13 = im[101];
+    t6 = re[146];
+    t1 = im[146];
+    t11 = re[11];
+    t4 = im[11];
+    t7 = t0 + t6;
+    t8 = t14 + t1;
+    t2 = t3 + t11;
+    t12 = t13 + t4;
+    t10 = t0 - t6;
+    t5 = t14 - t1;
+    t9 = t3 - t11;
+    t0 = t13 - t4;
+    t6 = t7 + t2;
+    t14 = t8 + t12;
+    t1 = t10 + t0;
+    t3 = t5 - t9;
+    t11 = t7 - t2;
+    t13 = t8 - t12;
+    t4 = t10 - t0;
+    t7 = t5 + t9;
+    t2 = C120 * t6;
+    t8 = C121 * t14;
+    t12 = t2 + t8;
+    t10 = 0.012129720199284709 * t12;
+    y[132] = t10;
+    t0 = (-0.0622870096006031) * t12;
+    y[227] = t0;
+    t5 = (-C121) * t6;
+    t9 = C120 * t14;
+    t2 = t5 + t9;
+    t8 = 0.0792877978708678 * t2;
+    y[492] = t8;
+    t10 = 0.05086314591152052 * t2;
+    y[587] = t10;
+    t12 = (-C122) * t1;
+    t0 = (-C123) * t3;
+    t6 = t12 + t0;
+    t14 = 0.07923549255550565 * t6;
+    y[497] = t14;
+    t5 = 0.053648147946663574 * t6;
+    y[582] = t5;
+    t9 = C123 * t1;
+    t8 = (-C122) * t3;
+    t2 = t9 + t8;
+    t10 = 0.014436325447654757 * t2;
+    y[137] = t10;
+    t12 = (-0.06034004810135273) * t2;
+    y[222] = t12;
+    t0 = (-C124) * t11;
+    t14 = (-C125) * t13;
+    t6 = t0 + t14;
+    t5 = 0.07384850942488619 * t6;
+    y[407] = t5;
+    t1 = 0.0075651186862769355 * t6;
+    y[672] = t1;
+    t3 = C125 * t11;
+    t9 = (-C124) * t13;
+    t8 = t3 + t9;
+    y[47] = 0;
+    t10 = (-0.07522908178947471) * t8;
+    y[312] = t10;
+    t2 = C126 * t4;
+    t12 = C127 * t7;
+    t0 = t2 + t12;
+    y[42] = 0;
+    t14 = (-0.07528713607533286) * t0;
+    y[317] = t14;
+    t5 = (-C127) * t4;
+    t6 = C126 * t7;
+    t1 = t5 + t6;
+    t11 = 0.07379156447120827 * t1;
+    y[402] = t11;
+    t13 = 0.006101107904815549 * t1;
+    y[677] = t13;
+    t3 = re[152];
+    t9 = im[152];
+    t8 = re[17];
+    t10 = im[17];
+    t2 = re[62];
+    t12 = im[62];
+    t0 = re[107];
+    t14 = im[107];
+    t4 = t3 + t2;
+    t7 = t9 + t12;
+    t5 = t8 + t0;
+    t6 = t10 + t14;
+    t11 = t3 - t2;
+    t1 = t9 - t12;
+    t13 = t8 - t0;
+    t3 = t10 - t14;
+    t2 = t4 + t5;
+    t9 = t7 + t6;
+    t12 = t11 + t3;
+    t8 = t1 - t13;
+    t0 = t4 - t5;
+    t10 = t7 - t6;
+    t14 = t11 - t3;
+    t4 = t1 + t13;
+    t5 = C128 * t2;
+    t7 = C129 * t9;
+    t6 = t5 + t7;
+    y[44] = 0;
+    t11 = (-0.07526930436857467) * t6;
+    y[315] = t11;
+    t3 = (-C129) * t2;
+    t1 = C128 * t9;
+    t13 = t3 + t1;
+    t5 = 0.07380904609336382 * t13;
+    y[404] = t5;
+    t7 = 0.006666148096164151 * t13;
+    y[675] = t7;
+    t6 = C130 * t12;
+    t11 = C131 * t8;
+    t2 = t6 + t11;
+    t9 = 0.013031765120859037 * t2;
+    y[134] = t9;
+    t3 = (-0.0615277960611282) * t2;
+    y[225] = t3;
+    t1 = (-C131) * t12;
+    t5 = C130 * t8;
+    t13 = t1 + t5;
+    t7 = 0.07928247848482699 * t13;
+    y[494] = t7;
+    t6 = 0.051986770927596154 * t13;
+    y[585] = t6;
+    t11 = (-C132) * t0;
+    t9 = (-C133) * t10;
+    t2 = t11 + t9;
+    t3 = 0.07927218730124422 * t2;
+    y[495] = t3;
+    t12 = 0.05254388148070578 * t2;
+    y[584] = t12;
+    t8 = C133 * t0;
+    t1 = (-C132) * t10;
+    t5 = t8 + t1;
+    t7 = 0.013492984538424497 * t5;
+    y[135] = t7;
+    t13 = (-0.06113848930054078) * t5;
+    y[224] = t13;
+    t6 = (-C134) * t14;
+    t11 = (-C135) * t4;
+    t9 = t6 + t11;
+    t3 = 0.07382038068434472 * t9;
+    y[405] = t3;
+    t2 = 0.006958960986894562 * t9;
+    y[674] = t2;
+    t12 = C135 * t14;
+    t0 = (-C134) * t4;
+    t10 = t12 + t0;
+    y[45] = 0;
+    t8 = (-0.07525774730573473) * t10;
+    y[314] = t8;
+    t1 = re[68];
+    t7 = im[68];
+    t5 = re[113];
+    t13 = im[113];
+    t6 = re[158];
+    t11 = im[158];
+    t3 = re[23];
+    t9 = im[23];
+    t2 = t1 + t6;
+    t14 = t7 + t11;
+    t4 = t5 + t3;
+    t12 = t13 + t9;
+    t0 = t1 - t6;
+    t10 = t7 - t11;
+    t8 = t5 - t3;
+    t1 = t13 - t9;
+    t6 = t2 + t4;
+    t7 = t14 + t12;
+    t11 = t0 + t1;
+    t5 = t10 - t8;
+    t3 = t2 - t4;
+    t13 = t14 - t12;
+    t9 = t0 - t1;
+    t2 = t10 + t8;
+    t4 = (-C136) * t6;
+    t14 = (-C137) * t7;
+    t12 = t4 + t14;
+    t0 = 0.07379941994529313 * t12;
+    y[403] = t0;
+    t1 = 0.006380248502440559 * t12;
+    y[676] = t1;
+    t10 = C137 * t6;
+    t8 = (-C136) * t7;
+    t4 = t10 + t8;
+    y[43] = 0;
+    t14 = (-0.07527912224342473) * t4;
+    y[316] = t14;
+    t0 = C138 * t11;
+    t12 = C139 * t5;
+    t1 = t0 + t12;
+    y[46] = 0;
+    t6 = (-0.07524431766225147) * t1;
+    y[313] = t6;
+    t7 = (-C139) * t11;
+    t10 = C138 * t5;
+    t8 = t7 + t10;
+    t4 = 0.07383355618284335 * t8;
+    y[406] = t4;
+    t14 = 0.007258624754882618 * t8;
+    y[673] = t14;
+    t0 = C140 * t3;
+    t12 = C141 * t13;
+    t1 = t0 + t12;
+    t6 = 0.013961288678997456 * t1;
+    y[136] = t6;
+    t11 = (-0.060742536777194996) * t1;
+    y[223] = t11;
+    t5 = (-C141) * t3;
+    t7 = C140 * t13;
+    t10 = t5 + t7;
+    t4 = 0.07925654623502265 * t10;
+    y[496] = t4;
+    t8 = 0.05309766870993954 * t10;
+    y[583] = t8;
+    t14 = (-C142) * t9;
+    t0 = (-C143) * t2;
+    t12 = t14 + t0;
+    t6 = 0.07928765862449144 * t12;
+    y[493] = t6;
+    t1 = 0.051426496623277064 * t12;
+    y[586] = t1;
+    t11 = C143 * t9;
+    t3 = (-C142) * t2;
+    t13 = t11 + t3;
+    t5 = 0.012577110492092577 * t13;
+    y[133] = t5;
+    t7 = (-0.06191075522297103) * t13;
+    y[226] = t7;
+    t4 = re[4];
+    t10 = im[4];
+    t8 = re[49];
+    t14 = im[49];
+    t0 = re[94];
+    t6 = im[94];
+    t12 = re[139];
+    t1 = im[139];
+    t9 = t4 + t0;
+    t2 = t10 + t6;
+    t11 = t8 + t12;
+    t3 = t14 + t1;
+    t5 = t4 - t0;
+    t13 = t10 - t6;
+    t7 = t8 - t12;
+    t4 = t14 - t1;
+    t0 = t9 + t11;
+    t10 = t2 + t3;
+    t6 = t5 + t4;
+    t8 = t13 - t7;
+    t12 = t9 - t11;
+    t14 = t2 - t3;
+    t1 = t5 - t4;
+    t9 = t13 + t7;
+    t11 = (-C144) * t0;
+    t2 = (-C145) * t10;
+    t3 = t11 + t2;
+    t5 = 0.07928303866608047 * t3;
+    y[491] = t5;
+    t4 = 0.050297128855992426 * t3;
+    y[588] = t4;
+    t13 = C145 * t0;
+    t7 = (-C144) * t10;
+    t11 = t13 + t7;
+    t2 = 0.011689066002518803 * t11;
+    y[131] = t2;
+    t5 = (-0.06265689585313484) * t11;
+    y[228] = t5;
+    t3 = (-C146) * t6;
+    t4 = (-C147) * t8;
+    t0 = t3 + t4;
+    t10 = 0.07378534815077109 * t0;
+    y[401] = t10;
+    t13 = 0.005828892956762125 * t0;
+    y[678] = t13;
+    t7 = C147 * t6;
+    t2 = (-C146) * t8;
+    t11 = t7 + t2;
+    y[41] = 0;
+    t5 = (-0.07529347891946621) * t11;
+    y[318] = t5;
+    t3 = C148 * t12;
+    t4 = C149 * t14;
+    t10 = t3 + t4;
+    y[48] = 0;
+    t0 = (-0.07521191392388182) * t10;
+    y[311] = t0;
+    t13 = (-C149) * t12;
+    t6 = C148 * t14;
+    t8 = t13 + t6;
+    t7 = 0.07386536607987472 * t8;
+    y[408] = t7;
+    t2 = 0.007878320426860737 * t8;
+    y[671] = t2;
+    t11 = C150 * t1;
+    t5 = C151 * t9;
+    t3 = t11 + t5;
+    t4 = 0.01491758532673113 * t3;
+    y[138] = t4;
+    t10 = (-0.05993109228259522) * t3;
+    y[221] = t10;
+    t0 = (-C151) * t1;
+    t12 = C150 * t9;
+    t14 = t0 + t12;
+    t13 = 0.07920922261372015 * t14;
+    y[498] = t13;
+    t6 = 0.054195119903981286 * t14;
+    y[581] = t6;
+    t7 = re[100];
+    t8 = im[100];
+    t2 = re[145];
+    t11 = im[145];
+    t5 = re[10];
+    t4 = im[10];
+    t3 = re[55];
+    t10 = im[55];
+    t1 = t7 + t5;
+    t9 = t8 + t4;
+    t0 = t2 + t3;
+    t12 = t11 + t10;
+    t13 = t7 - t5;
+    t14 = t8 - t4;
+    t6 = t2 - t3;
+    t7 = t11 - t10;
+    t5 = t1 + t0;
+    t8 = t9 + t12;
+    t4 = t13 + t7;
+    t2 = t14 - t6;
+    t3 = t1 - t0;
+    t11 = t9 - t12;
+    t10 = t13 - t7;
+    t1 = t14 + t6;
+    t0 = C152 * t5;
+    t9 = C153 * t8;
+    t12 = t0 + t9;
+    t13 = 0.015898542092392835 * t12;
+    y[140] = t13;
+    t7 = (-0.05909416479402423) * t12;
+    y[219] = t7;
+    t14 = (-C153) * t5;
+    t6 = C152 * t8;
+    t0 = t14 + t6;
+    t9 = 0.07913993568537958 * t0;
+    y[500] = t9;
+    t13 = 0.055278474546151535 * t0;
+    y[579] = t13;
+    t12 = (-C154) * t4;
+    t7 = (-C155) * t2;
+    t5 = t12 + t7;
+    t8 = 0.07925944743120644 * t5;
+    y[489] = t8;
+    t14 = 0.049157257914493886 * t5;
+    y[590] = t14;
+    t6 = C155 * t4;
+    t9 = (-C154) * t2;
+    t0 = t6 + t9;
+    t13 = 0.01082989060848449 * t0;
+    y[129] = t13;
+    t12 = (-0.0633765184155293) * t0;
+    y[230] = t12;
+    t7 = (-C156) * t3;
+    t8 = (-C157) * t11;
+    t5 = t7 + t8;
+    t14 = 0.07377787855167459 * t5;
+    y[399] = t14;
+    t4 = 0.005304756981572133 * t5;
+    y[680] = t4;
+    t2 = C157 * t3;
+    t6 = (-C156) * t11;
+    t9 = t2 + t6;
+    y[39] = 0;
+    t13 = (-0.07530110196465468) * t9;
+    y[320] = t13;
+    t0 = C158 * t10;
+    t12 = C159 * t1;
+    t7 = t0 + t12;
+    y[50] = 0;
+    t8 = (-0.0751718910899392) * t7;
+    y[309] = t8;
+    t14 = (-C159) * t10;
+    t5 = C158 * t1;
+    t4 = t14 + t5;
+    t3 = 0.07390469329697484 * t4;
+    y[410] = t3;
+    t11 = 0.008525254162783965 * t4;
+    y[669] = t11;
+    t2 = re[16];
+    t6 = im[16];
+    t9 = re[61];
+    t13 = im[61];
+    t0 = re[106];
+    t12 = im[106];
+    t7 = re[151];
+    t8 = im[151];
+    t10 = t2 + t0;
+    t1 = t6 + t12;
+    t14 = t9 + t7;
+    t5 = t13 + t8;
+    t3 = t2 - t0;
+    t4 = t6 - t12;
+    t11 = t9 - t7;
+    t2 = t13 - t8;
+    t0 = t10 + t14;
+    t6 = t1 + t5;
+    t12 = t3 + t2;
+    t9 = t4 - t11;
+    t7 = t10 - t14;
+    t13 = t1 - t5;
+    t8 = t3 - t2;
+    t10 = t4 + t11;
+    t14 = C160 * t0;
+    t1 = C161 * t6;
+    t5 = t14 + t1;
+    y[52] = 0;
+    t3 = (-0.07512404916003154) * t5;
+    y[307] = t3;
+    t2 = (-C161) * t0;
+    t4 = C160 * t6;
+    t11 = t2 + t4;
+    t14 = 0.07395175869342371 * t11;
+    y[412] = t14;
+    t1 = 0.00919912980539764 * t11;
+    y[667] = t1;
+    t5 = C162 * t12;
+    t3 = C163 * t9;
+    t0 = t5 + t3;
+    t6 = 0.016903811785332918 * t0;
+    y[142] = t6;
+    t2 = (-0.0582318648569364) * t0;
+    y[217] = t2;
+    t4 = (-C163) * t12;
+    t14 = C162 * t9;
+    t11 = t4 + t14;
+    t1 = 0.07904754755085189 * t11;
+    y[502] = t1;
+    t5 = 0.056346430106878946 * t11;
+    y[577] = t5;
+    t3 = (-C164) * t7;
+    t6 = (-C165) * t13;
+    t0 = t3 + t6;
+    t2 = 0.07921804168631846 * t0;
+    y[487] = t2;
+    t12 = 0.0480083543162075 * t0;
+    y[592] = t12;
+    t9 = C165 * t7;
+    t4 = (-C164) * t13;
+    t14 = t9 + t4;
+    t1 = 0.01000057866679364 * t14;
+    y[127] = t1;
+    t11 = (-0.06406929688631251) * t14;
+    y[232] = t11;
+    t5 = (-C166) * t8;
+    t3 = (-C167) * t10;
+    t6 = t5 + t3;
+    t2 = 0.07377673045010832 * t6;
+    y[397] = t2;
+    t0 = 0.004807832252336169 * t6;
+    y[682] = t0;
+    t12 = C167 * t8;
+    t7 = (-C166) * t10;
+    t13 = t12 + t7;
+    y[37] = 0;
+    t9 = (-0.07530227378824429) * t13;
+    y[322] = t9;
+    t4 = re[72];
+    t1 = im[72];
+    t14 = re[117];
+    t11 = im[117];
+    t5 = re[162];
+    t3 = im[162];
+    t2 = re[27];
+    t6 = im[27];
+    t0 = t4 + t5;
+    t8 = t1 + t3;
+    t10 = t14 + t2;
+    t12 = t11 + t6;
+    t7 = t4 - t5;
+    t13 = t1 - t3;
+    t9 = t14 - t2;
+    t4 = t11 - t6;
+    t5 = t0 + t10;
+    t1 = t8 + t12;
+    t3 = t7 + t4;
+    t14 = t13 - t9;
+    t2 = t0 - t10;
+    t11 = t8 - t12;
+    t6 = t7 - t4;
+    t0 = t13 + t9;
+    t10 = (-C168) * t5;
+    t8 = (-C169) * t1;
+    t12 = t10 + t8;
+    t7 = 0.07378162974538252 * t12;
+    y[395] = t7;
+    t4 = 0.004338010208852921 * t12;
+    y[684] = t4;
+    t13 = C169 * t5;
+    t9 = (-C168) * t1;
+    t10 = t13 + t9;
+    y[35] = 0;
+    t8 = (-0.07529727351818549) * t10;
+    y[324] = t8;
+    t7 = C170 * t3;
+    t12 = C171 * t14;
+    t4 = t7 + t12;
+    y[54] = 0;
+    t5 = (-0.07506814700296977) * t4;
+    y[305] = t5;
+    t1 = (-C171) * t3;
+    t13 = C170 * t14;
+    t9 = t1 + t13;
+    t10 = 0.0740068294923514 * t9;
+    y[414] = t10;
+    t8 = 0.00989986156716879 * t9;
+    y[665] = t8;
+    t7 = C172 * t2;
+    t12 = C173 * t11;
+    t4 = t7 + t12;
+    t5 = 0.01793167713832639 * t4;
+    y[144] = t5;
+    t3 = (-0.05734497793414243) * t4;
+    y[215] = t3;
+    t14 = (-C173) * t2;
+    t1 = C172 * t11;
+    t13 = t14 + t1;
+    t10 = 0.07893135423244699 * t13;
+    y[504] = t10;
+    t9 = 0.057397798367898024 * t13;
+    y[575] = t9;
+    t8 = (-C174) * t6;
+    t7 = (-C175) * t0;
+    t12 = t8 + t7;
+    t5 = 0.07915951523735842 * t12;
+    y[485] = t5;
+    t4 = 0.04685099768320636 * t12;
+    y[594] = t4;
+    t3 = C175 * t6;
+    t2 = (-C174) * t0;
+    t11 = t3 + t2;
+    t14 = 0.009201834299866771 * t11;
+    y[125] = t14;
+    t1 = (-0.06473562177238838) * t11;
+    y[234] = t1;
+    t10 = re[168];
+    t13 = im[168];
+    t9 = re[33];
+    t8 = im[33];
+    t7 = re[78];
+    t5 = im[78];
+    t12 = re[123];
+    t4 = im[123];
+    t6 = t10 + t7;
+    t0 = t13 + t5;
+    t3 = t9 + t12;
+    t2 = t8 + t4;
+    t14 = t10 - t7;
+    t11 = t13 - t5;
+    t1 = t9 - t12;
+    t10 = t8 - t4;
+    t7 = t6 + t3;
+    t13 = t0 + t2;
+    t5 = t14 + t10;
+    t9 = t11 - t1;
+    t12 = t6 - t3;
+    t8 = t0 - t2;
+    t4 = t14 - t10;
+    t6 = t11 + t1;
+    t3 = (-C176) * t7;
+    t0 = (-C177) * t13;
+    t2 = t3 + t0;
+    t14 = 0.07908447036354024 * t2;
+    y[483] = t14;
+    t10 = 0.045686310111039866 * t2;
+    y[596] = t10;
+    t11 = C177 * t7;
+    t1 = (-C176) * t13;
+    t3 = t11 + t1;
+    t0 = 0.008434424318712016 * t3;
+    y[123] = t0;
+    t14 = (-0.06537589246986183) * t3;
+    y[236] = t14;
+    t2 = (-C178) * t5;
+    t10 = (-C179) * t9;
+    t7 = t2 + t10;
+    t13 = 0.07379227712376644 * t7;
+    y[393] = t13;
+    t11 = 0.00389514461881248 * t7;
+    y[686] = t11;
+    t1 = C179 * t5;
+    t0 = (-C178) * t9;
+    t3 = t1 + t0;
+    y[33] = 0;
+    t14 = (-0.07528640898610062) * t3;
+    y[326] = t14;
+    t2 = C180 * t12;
+    t10 = C181 * t8;
+    t13 = t2 + t10;
+    y[56] = 0;
+    t7 = (-0.07500397558099361) * t13;
+    y[303] = t7;
+    t11 = (-C181) * t12;
+    t5 = C180 * t8;
+    t9 = t11 + t5;
+    t1 = 0.07407014778245119 * t9;
+    y[416] = t1;
+    t0 = 0.010627184958870271 * t9;
+    y[663] = t0;
+    t3 = C182 * t4;
+    t14 = C183 * t6;
+    t2 = t3 + t14;
+    t10 = 0.018981178489387872 * t2;
+    y[146] = t10;
+    t13 = (-0.05643381030579669) * t2;
+    y[213] = t13;
+    t7 = (-C183) * t4;
+    t12 = C182 * t6;
+    t8 = t7 + t12;
+    t11 = 0.07879064723850839 * t8;
+    y[506] = t11;
+    t5 = 0.058431520258171214 * t8;
+    y[573] = t5;
+    t1 = re[84];
+    t9 = im[84];
+    t0 = re[129];
+    t3 = im[129];
+    t14 = re[174];
+    t10 = im[174];
+    t2 = re[39];
+    t13 = im[39];
+    t4 = t1 + t14;
+    t6 = t9 + t10;
+    t7 = t0 + t2;
+    t12 = t3 + t13;
+    t11 = t1 - t14;
+    t8 = t9 - t10;
+    t5 = t0 - t2;
+    t1 = t3 - t13;
+    t14 = t4 + t7;
+    t9 = t6 + t12;
+    t10 = t11 + t1;
+    t0 = t8 - t5;
+    t2 = t4 - t7;
+    t3 = t6 - t12;
+    t13 = t11 - t1;
+    t4 = t8 + t5;
+    t7 = C184 * t14;
+    t6 = C185 * t9;
+    t12 = t7 + t6;
+    t11 = 0.02005153598606483 * t12;
+    y[148] = t11;
+    t1 = (-0.05549852471039634) * t12;
+    y[211] = t1;
+    t8 = (-C185) * t14;
+    t5 = C184 * t9;
+    t7 = t8 + t5;
+    t6 = 0.07862483745225313 * t7;
+    y[508] = t6;
+    t11 = 0.05944647194056285 * t7;
+    y[571] = t11;
+    t12 = (-C186) * t10;
+    t1 = (-C187) * t0;
+    t14 = t12 + t1;
+    t9 = 0.0789941020164104 * t14;
+    y[481] = t9;
+    t8 = 0.04451574105757036 * t14;
+    y[598] = t8;
+    t5 = C187 * t10;
+    t6 = (-C186) * t0;
+    t7 = t5 + t6;
+    t11 = 0.007698836753981549 * t7;
+    y[121] = t11;
+    t12 = (-0.06599019419307889) * t7;
+    y[238] = t12;
+    t1 = (-C188) * t2;
+    t9 = (-C189) * t3;
+    t14 = t1 + t9;
+    t8 = 0.07380836847924803 * t14;
+    y[391] = t8;
+    t10 = 0.003478890727204296 * t14;
+    y[688] = t10;
+    t0 = C189 * t2;
+    t5 = (-C188) * t3;
+    t6 = t0 + t5;
+    y[31] = 0;
+    t11 = (-0.07526999539513679) * t6;
+    y[328] = t11;
+    t7 = C190 * t13;
+    t12 = C191 * t4;
+    t1 = t7 + t12;
+    y[58] = 0;
+    t9 = (-0.07493137687072132) * t1;
+    y[301] = t9;
+    t8 = (-C191) * t13;
+    t14 = C190 * t4;
+    t10 = t8 + t14;
+    t2 = 0.07414191207430397 * t10;
+    y[418] = t2;
+    t3 = 0.011380873256119571 * t10;
+    y[661] = t3;
+    t0 = re[20];
+    t5 = im[20];
+    t6 = re[65];
+    t11 = im[65];
+    t7 = re[110];
+    t12 = im[110];
+    t1 = re[155];
+    t9 = im[155];
+    t13 = t0 + t7;
+    t4 = t5 + t12;
+    t8 = t6 + t1;
+    t14 = t11 + t9;
+    t2 = t0 - t7;
+    t10 = t5 - t12;
+    t3 = t6 - t1;
+    t0 = t11 - t9;
+    t7 = t13 + t8;
+    t5 = t4 + t14;
+    t12 = t2 + t0;
+    t6 = t10 - t3;
+    t1 = t13 - t8;
+    t11 = t4 - t14;
+    t9 = t2 - t0;
+    t13 = t10 + t3;
+    t8 = C192 * t7;
+    t4 = C193 * t5;
+    t14 = t8 + t4;
+    y[60] = 0;
+    t2 = (-0.07485027111278542) * t14;
+    y[299] = t2;
+    t0 = (-C193) * t7;
+    t10 = C192 * t5;
+    t3 = t0 + t10;
+    t8 = 0.07422225027327382 * t3;
+    y[420] = t8;
+    t4 = 0.012160671482139212 * t3;
+    y[659] = t4;
+    t14 = C194 * t12;
+    t2 = C195 * t6;
+    t7 = t14 + t2;
+    t5 = 0.02113986934740008 * t7;
+    y[150] = t5;
+    t0 = (-0.054540535915650216) * t7;
+    y[209] = t0;
+    t10 = (-C195) * t12;
+    t8 = C194 * t6;
+    t3 = t10 + t8;
+    t4 = 0.07843375404242915 * t3;
+    y[510] = t4;
+    t14 = 0.06044202805644682 * t3;
+    y[569] = t14;
+    t2 = (-C196) * t1;
+    t5 = (-C197) * t11;
+    t7 = t2 + t5;
+    t0 = 0.07889007024276715 * t7;
+    y[479] = t0;
+    t12 = 0.04334071171649066 * t7;
+    y[600] = t12;
+    t6 = C197 * t1;
+    t10 = (-C196) * t11;
+    t8 = t6 + t10;
+    t4 = 0.006995911514090678 * t8;
+    y[119] = t4;
+    t3 = (-0.06657805925722098) * t8;
+    y[240] = t3;
+    t14 = (-C198) * t9;
+    t2 = (-C199) * t13;
+    t5 = t14 + t2;
+    t0 = 0.07382960802169211 * t5;
+    y[389] = t0;
+    t7 = 0.0030890222459463205 * t5;
+    y[690] = t7;
+    t12 = C199 * t9;
+    t1 = (-C198) * t13;
+    t11 = t12 + t1;
+    y[29] = 0;
+    t6 = (-0.07524834147735497) * t11;
+    y[330] = t6;
+}
+
+/**
+ *  Part 6 of ApplyWindowedIMDCT_W75_360_K120().
+ * 
+ *  @param {Number[]} X 
+ *    - The input block (360 points, only the first 120 points are used).
+ *  @param {Number[]} y 
+ *    - The array that would contain the output block (720 points).
+ *  @param {Number[]} re 
+ *    - The scratch buffer (real part, 180 points).
+ *  @param {Number[]} im 
+ *    - The scratch buffer (imaginary part, 180 points).
+ */
+function ApplyWindowedIMDCT_W75_360_K120_Part6(X, y, re, im) {
+    let t0, t1, t10, t11, t12, t13, t14, t2, t3, t4, t5, t6, t7, t8, t9;
+    const C0 = 0.786665714368617;
+    const C1 = 0.6173791815707049;
+    const C2 = 0.490523568159308;
+    const C3 = 0.8714279253502614;
+    const C4 = 0.11970365530496252;
+    const C5 = 0.992809667009055;
+    const C6 = 0.9630451367077627;
+    const C7 = 0.26934005395322597;
+    const C8 = 0.9606580613579353;
+    const C9 = 0.2777338458812922;
+    const C10 = 0.7812481792047586;
+    const C11 = 0.6242205399450176;
+    const C12 = 0.4829003438000374;
+    const C13 = 0.8756753153753997;
+    const C14 = 0.11103530855427768;
+    const C15 = 0.9938164620563781;
+    const C16 = 0.10235850603495578;
+    const C17 = 0.9947475741323987;
+    const C18 = 0.9581978281773966;
+    const C19 = 0.28610648730170424;
+    const C20 = 0.7757711489673284;
+    const C21 = 0.6310143615084456;
+    const C22 = 0.47524034470996157;
+    const C23 = 0.8798560193349574;
+    const C24 = 0.4675441542276683;
+    const C25 = 0.8839697188521416;
+    const C26 = 0.09367390851910222;
+    const C27 = 0.9956029323293272;
+    const C28 = 0.9556646245224285;
+    const C29 = 0.2944573406054019;
+    const C30 = 0.7702350407533842;
+    const C31 = 0.6377601288851731;
+    const C32 = 0.7646402761590003;
+    const C33 = 0.6444573283588975;
+    const C34 = 0.45981235844785984;
+    const C35 = 0.8880161006528073;
+    const C36 = 0.08498217737244167;
+    const C37 = 0.9963824715083254;
+    const C38 = 0.953058643306297;
+    const C39 = 0.3027857698425746;
+    const C40 = 0.9503800829845611;
+    const C41 = 0.31109114077109096;
+    const C42 = 0.7589872812471619;
+    const C43 = 0.6511054499119491;
+    const C44 = 0.45204554617671966;
+    const C45 = 0.8919948565893142;
+    const C46 = 0.0762839745039523;
+    const C47 = 0.9970861323044666;
+    const C48 = 0.06757996231545906;
+    const C49 = 0.9977138611312569;
+    const C50 = 0.9476291475399599;
+    const C51 = 0.31937282090479924;
+    const C52 = 0.7532764865153176;
+    const C53 = 0.6577039872641327;
+    const C54 = 0.4442443088870726;
+    const C55 = 0.8959056836639933;
+    const C56 = 0.436409240673342;
+    const C57 = 0.8997482840522215;
+    const C58 = 0.05887080365118903;
+    const C59 = 0.9982656101847159;
+    const C60 = 0.944806046466878;
+    const C61 = 0.3276301795616935;
+    const C62 = 0.7475083268625968;
+    const C63 = 0.6642524379112817;
+    const C64 = 0.7416832415566892;
+    const C65 = 0.6707503031635259;
+    const C66 = 0.4285409382063071;
+    const C67 = 0.903522365125102;
+    const C68 = 0.05015716174729338;
+    const C69 = 0.9987413374470168;
+    const C70 = 0.9419109947553924;
+    const C71 = 0.33586258791194235;
+    const C72 = 0.9389442128748994;
+    const C73 = 0.3440694190257768;
+    const C74 = 0.7358016742003936;
+    const C75 = 0.6771970881832687;
+    const C76 = 0.4206400006876641;
+    const C77 = 0.9072276394717491;
+    const C78 = 0.04143970018133933;
+    const C79 = 0.9991410066896868;
+    const C80 = 0.03271908282177614;
+    const C81 = 0.9994645874763657;
+    const C82 = 0.9359059267573258;
+    const C83 = 0.3522500479212335;
+    const C84 = 0.7298640726978356;
+    const C85 = 0.6835923020228712;
+    const C86 = 0.41270702980439467;
+    const C87 = 0.9108638249211758;
+    const C88 = 0.4047426296829455;
+    const C89 = 0.9144306445637821;
+    const C90 = 0.023995973777378995;
+    const C91 = 0.9997120551651237;
+    const C92 = 0.9327963677799223;
+    const C93 = 0.3604038516117495;
+    const C94 = 0.7238708892203581;
+    const C95 = 0.6899354576620396;
+    const C96 = 0.7178225801720864;
+    const C97 = 0.6962260720449132;
+    const C98 = 0.3967474068432212;
+    const C99 = 0.9179278267724427;
+    const C100 = 0.015271037346674515;
+    const C101 = 0.9998833909103383;
+    const C102 = 0.9296157727476445;
+    const C103 = 0.368530209153605;
+    const C104 = 0.9263643838751181;
+    const C105 = 0.3766285016932107;
+    const C106 = 0.7117196061551713;
+    const C107 = 0.7024636661168517;
+    const C108 = 0.38872197015239557;
+    const C109 = 0.9213551052231925;
+    const C110 = 0.006544937967351858;
+    const C111 = 0.9999785816641292;
+    t10 = re[116];
+    t4 = im[116];
+    t8 = re[161];
+    t3 = im[161];
+    t14 = re[26];
+    t2 = im[26];
+    t0 = re[71];
+    t5 = im[71];
+    t7 = t10 + t14;
+    t9 = t4 + t2;
+    t13 = t8 + t0;
+    t12 = t3 + t5;
+    t1 = t10 - t14;
+    t11 = t4 - t2;
+    t6 = t8 - t0;
+    t10 = t3 - t5;
+    t14 = t7 + t13;
+    t4 = t9 + t12;
+    t2 = t1 + t10;
+    t8 = t11 - t6;
+    t0 = t7 - t13;
+    t3 = t9 - t12;
+    t5 = t1 - t10;
+    t7 = t11 + t6;
+    t13 = (-C0) * t14;
+    t9 = (-C1) * t4;
+    t12 = t13 + t9;
+    t1 = 0.0738556887375873 * t12;
+    y[387] = t1;
+    t10 = 0.002725625043690865 * t12;
+    y[692] = t10;
+    t11 = C1 * t14;
+    t6 = (-C0) * t4;
+    t13 = t11 + t6;
+    y[27] = 0;
+    t9 = (-0.07522176897293187) * t13;
+    y[332] = t9;
+    t1 = C2 * t2;
+    t12 = C3 * t8;
+    t10 = t1 + t12;
+    y[62] = 0;
+    t14 = (-0.0747604873846722) * t10;
+    y[297] = t14;
+    t4 = (-C3) * t2;
+    t11 = C2 * t8;
+    t6 = t4 + t11;
+    t13 = 0.07431138760465847 * t6;
+    y[422] = t13;
+    t9 = 0.012966061461159185 * t6;
+    y[657] = t9;
+    t1 = C4 * t0;
+    t12 = C5 * t3;
+    t10 = t1 + t12;
+    t14 = 0.022245471494846798 * t10;
+    y[152] = t14;
+    t2 = (-0.05356040398594876) * t10;
+    y[207] = t2;
+    t8 = (-C5) * t0;
+    t4 = C4 * t3;
+    t11 = t8 + t4;
+    t13 = 0.07821641575885593 * t11;
+    y[512] = t13;
+    t6 = 0.06141711716448885 * t11;
+    y[567] = t6;
+    t9 = (-C6) * t5;
+    t1 = (-C7) * t7;
+    t12 = t9 + t1;
+    t14 = 0.07877322937044845 * t12;
+    y[477] = t14;
+    t10 = 0.04216237624301753 * t12;
+    y[602] = t10;
+    t2 = C7 * t5;
+    t0 = (-C6) * t7;
+    t3 = t2 + t0;
+    t8 = 0.00632622466030756 * t3;
+    y[117] = t8;
+    t4 = (-0.06713990188669226) * t3;
+    y[242] = t4;
+    t13 = re[32];
+    t11 = im[32];
+    t6 = re[77];
+    t9 = im[77];
+    t1 = re[122];
+    t14 = im[122];
+    t12 = re[167];
+    t10 = im[167];
+    t5 = t13 + t1;
+    t7 = t11 + t14;
+    t2 = t6 + t12;
+    t0 = t9 + t10;
+    t8 = t13 - t1;
+    t3 = t11 - t14;
+    t4 = t6 - t12;
+    t13 = t9 - t10;
+    t1 = t5 + t2;
+    t11 = t7 + t0;
+    t14 = t8 + t13;
+    t6 = t3 - t4;
+    t12 = t5 - t2;
+    t9 = t7 - t0;
+    t10 = t8 - t13;
+    t5 = t3 + t4;
+    t2 = (-C8) * t1;
+    t7 = (-C9) * t11;
+    t0 = t2 + t7;
+    t8 = 0.0786440057564167 * t0;
+    y[475] = t8;
+    t13 = 0.040982004156227624 * t0;
+    y[604] = t13;
+    t3 = C9 * t1;
+    t4 = (-C8) * t11;
+    t2 = t3 + t4;
+    t7 = 0.0056902696629836606 * t2;
+    y[115] = t7;
+    t8 = (-0.06767657432229467) * t2;
+    y[244] = t8;
+    t0 = (-C10) * t14;
+    t13 = (-C11) * t6;
+    t1 = t0 + t13;
+    t11 = 0.07388628536627204 * t1;
+    y[385] = t11;
+    t3 = 0.002388239070442009 * t1;
+    y[694] = t3;
+    t4 = C11 * t14;
+    t7 = (-C10) * t6;
+    t2 = t4 + t7;
+    y[25] = 0;
+    t8 = (-0.07519061931473928) * t2;
+    y[334] = t8;
+    t0 = C12 * t12;
+    t13 = C13 * t9;
+    t11 = t0 + t13;
+    y[64] = 0;
+    t1 = (-0.07466183533419639) * t11;
+    y[295] = t1;
+    t3 = (-C13) * t12;
+    t14 = C12 * t9;
+    t6 = t3 + t14;
+    t4 = 0.07440957660213073 * t6;
+    y[424] = t4;
+    t7 = 0.013796025469382255 * t6;
+    y[655] = t7;
+    t2 = C14 * t10;
+    t8 = C15 * t5;
+    t0 = t2 + t8;
+    t13 = 0.023366643389733904 * t0;
+    y[154] = t13;
+    t11 = (-0.052559051234607114) * t0;
+    y[205] = t11;
+    t1 = (-C15) * t10;
+    t12 = C14 * t5;
+    t9 = t1 + t12;
+    t3 = 0.07797231412824676 * t9;
+    y[514] = t3;
+    t14 = 0.0623711620920472 * t9;
+    y[565] = t14;
+    t4 = re[148];
+    t6 = im[148];
+    t7 = re[13];
+    t2 = im[13];
+    t8 = re[58];
+    t13 = im[58];
+    t0 = re[103];
+    t11 = im[103];
+    t10 = t4 + t8;
+    t5 = t6 + t13;
+    t1 = t7 + t0;
+    t12 = t2 + t11;
+    t3 = t4 - t8;
+    t9 = t6 - t13;
+    t14 = t7 - t0;
+    t4 = t2 - t11;
+    t8 = t10 + t1;
+    t6 = t5 + t12;
+    t13 = t3 + t4;
+    t7 = t9 - t14;
+    t0 = t10 - t1;
+    t2 = t5 - t12;
+    t11 = t3 - t4;
+    t10 = t9 + t14;
+    t1 = C16 * t8;
+    t5 = C17 * t6;
+    t12 = t1 + t5;
+    t3 = 0.024502010484116685 * t12;
+    y[156] = t3;
+    t4 = (-0.051537200432593716) * t12;
+    y[203] = t4;
+    t9 = (-C17) * t8;
+    t14 = C16 * t6;
+    t1 = t9 + t14;
+    t5 = 0.07770100053496265 * t1;
+    y[516] = t5;
+    t3 = 0.06330352026326927 * t1;
+    y[563] = t3;
+    t12 = (-C18) * t13;
+    t4 = (-C19) * t7;
+    t8 = t12 + t4;
+    t6 = 0.07850338675965945 * t8;
+    y[473] = t6;
+    t9 = 0.03980072930307692 * t8;
+    y[606] = t9;
+    t14 = C19 * t13;
+    t5 = (-C18) * t7;
+    t1 = t14 + t5;
+    t3 = 0.005088538798301135 * t1;
+    y[113] = t3;
+    t12 = (-0.06818849760819402) * t1;
+    y[246] = t12;
+    t4 = (-C20) * t0;
+    t6 = (-C21) * t2;
+    t8 = t4 + t6;
+    t9 = 0.0739211028647384 * t8;
+    y[383] = t9;
+    t13 = 0.0020762064534554383 * t8;
+    y[696] = t13;
+    t7 = C21 * t0;
+    t14 = (-C20) * t2;
+    t5 = t7 + t14;
+    y[23] = 0;
+    t3 = (-0.0751552038627071) * t5;
+    y[336] = t3;
+    t1 = C22 * t11;
+    t12 = C23 * t10;
+    t4 = t1 + t12;
+    y[66] = 0;
+    t6 = (-0.07455431330961315) * t4;
+    y[293] = t6;
+    t9 = (-C23) * t11;
+    t8 = C22 * t10;
+    t13 = t9 + t8;
+    t0 = 0.07451688988783449 * t13;
+    y[426] = t0;
+    t2 = 0.014650456311092089 * t13;
+    y[653] = t2;
+    t7 = re[64];
+    t14 = im[64];
+    t5 = re[109];
+    t3 = im[109];
+    t1 = re[154];
+    t12 = im[154];
+    t4 = re[19];
+    t6 = im[19];
+    t11 = t7 + t1;
+    t10 = t14 + t12;
+    t9 = t5 + t4;
+    t8 = t3 + t6;
+    t0 = t7 - t1;
+    t13 = t14 - t12;
+    t2 = t5 - t4;
+    t7 = t3 - t6;
+    t1 = t11 + t9;
+    t14 = t10 + t8;
+    t12 = t0 + t7;
+    t5 = t13 - t2;
+    t4 = t11 - t9;
+    t3 = t10 - t8;
+    t6 = t0 - t7;
+    t11 = t13 + t2;
+    t9 = C24 * t1;
+    t10 = C25 * t14;
+    t8 = t9 + t10;
+    y[68] = 0;
+    t0 = (-0.0744379272334968) * t8;
+    y[291] = t0;
+    t7 = (-C25) * t1;
+    t13 = C24 * t14;
+    t2 = t7 + t13;
+    t9 = 0.0746333994245822 * t2;
+    y[428] = t9;
+    t10 = 0.015529151731525307 * t2;
+    y[651] = t10;
+    t8 = C26 * t12;
+    t0 = C27 * t5;
+    t1 = t8 + t0;
+    t14 = 0.02564994813000861 * t1;
+    y[158] = t14;
+    t7 = (-0.050495641314265864) * t1;
+    y[201] = t7;
+    t13 = (-C27) * t12;
+    t9 = C26 * t5;
+    t2 = t13 + t9;
+    t10 = 0.07740250729577286 * t2;
+    y[518] = t10;
+    t8 = 0.06421324136700357 * t2;
+    y[561] = t8;
+    t0 = (-C28) * t4;
+    t14 = (-C29) * t3;
+    t1 = t0 + t14;
+    t7 = 0.07835306485128514 * t1;
+    y[471] = t7;
+    t12 = 0.03862009352798275 * t1;
+    y[608] = t12;
+    t5 = C29 * t4;
+    t13 = (-C28) * t3;
+    t9 = t5 + t13;
+    t10 = 0.004521478542881972 * t9;
+    y[111] = t10;
+    t2 = (-0.06867549650492617) * t9;
+    y[248] = t2;
+    t8 = (-C30) * t6;
+    t0 = (-C31) * t11;
+    t14 = t8 + t0;
+    t7 = 0.0739598233310438 * t14;
+    y[381] = t7;
+    t1 = 0.0017892804740102255 * t14;
+    y[698] = t1;
+    t12 = C31 * t6;
+    t4 = (-C30) * t11;
+    t3 = t12 + t4;
+    y[21] = 0;
+    t5 = (-0.07511585757430651) * t3;
+    y[338] = t5;
+    t13 = re[160];
+    t10 = im[160];
+    t9 = re[25];
+    t2 = im[25];
+    t8 = re[70];
+    t0 = im[70];
+    t7 = re[115];
+    t14 = im[115];
+    t1 = t13 + t8;
+    t6 = t10 + t0;
+    t11 = t9 + t7;
+    t12 = t2 + t14;
+    t4 = t13 - t8;
+    t3 = t10 - t0;
+    t5 = t9 - t7;
+    t13 = t2 - t14;
+    t8 = t1 + t11;
+    t10 = t6 + t12;
+    t0 = t4 + t13;
+    t9 = t3 - t5;
+    t7 = t1 - t11;
+    t2 = t6 - t12;
+    t14 = t4 - t13;
+    t1 = t3 + t5;
+    t11 = (-C32) * t8;
+    t6 = (-C33) * t10;
+    t12 = t11 + t6;
+    t4 = 0.07400212506510842 * t12;
+    y[379] = t4;
+    t13 = 0.0015273734490899057 * t12;
+    y[700] = t13;
+    t3 = C33 * t8;
+    t5 = (-C32) * t10;
+    t11 = t3 + t5;
+    y[19] = 0;
+    t6 = (-0.075072919198843) * t11;
+    y[340] = t6;
+    t4 = C34 * t0;
+    t12 = C35 * t9;
+    t13 = t4 + t12;
+    y[70] = 0;
+    t8 = (-0.0743124672610912) * t13;
+    y[289] = t8;
+    t10 = (-C35) * t0;
+    t3 = C34 * t9;
+    t5 = t10 + t3;
+    t11 = 0.07475940121913238 * t5;
+    y[430] = t11;
+    t6 = 0.01643140007008193 * t5;
+    y[649] = t6;
+    t4 = C36 * t7;
+    t12 = C37 * t2;
+    t13 = t4 + t12;
+    t8 = 0.026808971667655078 * t13;
+    y[160] = t8;
+    t0 = (-0.04943537917192268) * t13;
+    y[199] = t0;
+    t9 = (-C37) * t7;
+    t10 = C36 * t2;
+    t3 = t9 + t10;
+    t11 = 0.07707650387176249 * t3;
+    y[520] = t11;
+    t5 = 0.0650994518941004 * t3;
+    y[559] = t5;
+    t6 = (-C38) * t14;
+    t4 = (-C39) * t1;
+    t12 = t6 + t4;
+    t8 = 0.07819438677399508 * t12;
+    y[469] = t8;
+    t13 = 0.0374410809653893 * t12;
+    y[610] = t13;
+    t0 = C39 * t14;
+    t7 = (-C38) * t1;
+    t2 = t0 + t7;
+    t9 = 0.003989471102289299 * t2;
+    y[109] = t9;
+    t10 = (-0.06913776893770059) * t2;
+    y[250] = t10;
+    t11 = re[36];
+    t3 = im[36];
+    t5 = re[81];
+    t6 = im[81];
+    t4 = re[126];
+    t8 = im[126];
+    t12 = re[171];
+    t13 = im[171];
+    t14 = t11 + t4;
+    t1 = t3 + t8;
+    t0 = t5 + t12;
+    t7 = t6 + t13;
+    t9 = t11 - t4;
+    t2 = t3 - t8;
+    t10 = t5 - t12;
+    t11 = t6 - t13;
+    t4 = t14 + t0;
+    t3 = t1 + t7;
+    t8 = t9 + t11;
+    t5 = t2 - t10;
+    t12 = t14 - t0;
+    t6 = t1 - t7;
+    t13 = t9 - t11;
+    t14 = t2 + t10;
+    t0 = (-C40) * t4;
+    t1 = (-C41) * t3;
+    t7 = t0 + t1;
+    t9 = 0.07802784084844781 * t7;
+    y[467] = t9;
+    t11 = 0.03626495541946783 * t7;
+    y[612] = t11;
+    t2 = C41 * t4;
+    t10 = (-C40) * t3;
+    t0 = t2 + t10;
+    t1 = 0.003492818601842453 * t0;
+    y[107] = t1;
+    t9 = (-0.06957630232542114) * t0;
+    y[252] = t9;
+    t7 = (-C42) * t8;
+    t11 = (-C43) * t5;
+    t4 = t7 + t11;
+    t3 = 0.07404769515489659 * t4;
+    y[377] = t3;
+    t2 = 0.0012899360456039698 * t4;
+    y[702] = t2;
+    t10 = C43 * t8;
+    t1 = (-C42) * t5;
+    t0 = t10 + t1;
+    y[17] = 0;
+    t9 = (-0.07502671817041937) * t0;
+    y[342] = t9;
+    t7 = C44 * t12;
+    t11 = C45 * t6;
+    t3 = t7 + t11;
+    y[72] = 0;
+    t4 = (-0.07417793301083843) * t3;
+    y[287] = t4;
+    t2 = (-C45) * t12;
+    t8 = C44 * t6;
+    t5 = t2 + t8;
+    t10 = 0.07489499006050511 * t5;
+    y[432] = t10;
+    t1 = 0.0173560823152087 * t5;
+    y[647] = t1;
+    t0 = C46 * t13;
+    t9 = C47 * t14;
+    t7 = t0 + t9;
+    t11 = 0.02797728396717007 * t7;
+    y[162] = t11;
+    t3 = (-0.04835784909338468) * t7;
+    y[197] = t3;
+    t4 = (-C47) * t13;
+    t12 = C46 * t14;
+    t6 = t4 + t12;
+    t2 = 0.07672217418086602 * t6;
+    y[522] = t2;
+    t8 = 0.06596195100876791 * t6;
+    y[557] = t8;
+    t10 = re[132];
+    t5 = im[132];
+    t1 = re[177];
+    t0 = im[177];
+    t9 = re[42];
+    t11 = im[42];
+    t7 = re[87];
+    t3 = im[87];
+    t13 = t10 + t9;
+    t14 = t5 + t11;
+    t4 = t1 + t7;
+    t12 = t0 + t3;
+    t2 = t10 - t9;
+    t6 = t5 - t11;
+    t8 = t1 - t7;
+    t10 = t0 - t3;
+    t9 = t13 + t4;
+    t5 = t14 + t12;
+    t11 = t2 + t10;
+    t1 = t6 - t8;
+    t7 = t13 - t4;
+    t0 = t14 - t12;
+    t3 = t2 - t10;
+    t13 = t6 + t8;
+    t4 = C48 * t9;
+    t14 = C49 * t5;
+    t12 = t4 + t14;
+    t2 = 0.02915345280549821 * t12;
+    y[164] = t2;
+    t10 = (-0.04726409103525733) * t12;
+    y[195] = t10;
+    t6 = (-C49) * t9;
+    t8 = C48 * t5;
+    t4 = t6 + t8;
+    t14 = 0.07633919069356716 * t4;
+    y[524] = t14;
+    t2 = 0.06680008402605578 * t4;
+    y[555] = t2;
+    t12 = (-C50) * t11;
+    t10 = (-C51) * t1;
+    t9 = t12 + t10;
+    t5 = 0.07785396622111439 * t9;
+    y[465] = t5;
+    t6 = 0.035093195103053254 * t9;
+    y[614] = t6;
+    t8 = C51 * t11;
+    t14 = (-C50) * t1;
+    t4 = t8 + t14;
+    t2 = 0.0030317233148571673 * t4;
+    y[105] = t2;
+    t12 = (-0.06999210139522677) * t4;
+    y[254] = t12;
+    t10 = (-C52) * t7;
+    t5 = (-C53) * t0;
+    t9 = t10 + t5;
+    t6 = 0.07409618871715787 * t9;
+    y[375] = t6;
+    t11 = 0.0010762203215031797 * t9;
+    y[704] = t11;
+    t1 = C53 * t7;
+    t8 = (-C52) * t0;
+    t14 = t1 + t8;
+    y[15] = 0;
+    t2 = (-0.07497761560668637) * t14;
+    y[344] = t2;
+    t4 = C54 * t3;
+    t12 = C55 * t13;
+    t10 = t4 + t12;
+    y[74] = 0;
+    t5 = (-0.07403454077246585) * t10;
+    y[285] = t5;
+    t6 = (-C55) * t3;
+    t9 = C54 * t13;
+    t11 = t6 + t9;
+    t7 = 0.07504004884192814 * t11;
+    y[434] = t7;
+    t0 = 0.018302264227918173 * t11;
+    y[645] = t0;
+    t1 = re[48];
+    t8 = im[48];
+    t14 = re[93];
+    t2 = im[93];
+    t4 = re[138];
+    t12 = im[138];
+    t10 = re[3];
+    t5 = im[3];
+    t3 = t1 + t4;
+    t13 = t8 + t12;
+    t6 = t14 + t10;
+    t9 = t2 + t5;
+    t7 = t1 - t4;
+    t11 = t8 - t12;
+    t0 = t14 - t10;
+    t1 = t2 - t5;
+    t4 = t3 + t6;
+    t8 = t13 + t9;
+    t12 = t7 + t1;
+    t14 = t11 - t0;
+    t10 = t3 - t6;
+    t2 = t13 - t9;
+    t5 = t7 - t1;
+    t3 = t11 + t0;
+    t6 = C56 * t4;
+    t13 = C57 * t8;
+    t9 = t6 + t13;
+    y[76] = 0;
+    t7 = (-0.0738820686854372) * t9;
+    y[283] = t7;
+    t1 = (-C57) * t4;
+    t11 = C56 * t8;
+    t0 = t1 + t11;
+    t6 = 0.07519491067865303 * t0;
+    y[436] = t6;
+    t13 = 0.019269402875175413 * t0;
+    y[643] = t13;
+    t9 = C58 * t12;
+    t7 = C59 * t14;
+    t4 = t9 + t7;
+    t8 = 0.030335539013196404 * t4;
+    y[166] = t8;
+    t1 = (-0.046155076669294415) * t4;
+    y[193] = t1;
+    t11 = (-C59) * t12;
+    t6 = C58 * t14;
+    t0 = t11 + t6;
+    t13 = 0.07592809470006731 * t0;
+    y[526] = t13;
+    t9 = 0.0676133864780924 * t0;
+    y[553] = t9;
+    t7 = (-C60) * t10;
+    t8 = (-C61) * t2;
+    t4 = t7 + t8;
+    t1 = 0.0776741671325514 * t4;
+    y[463] = t1;
+    t12 = 0.033926889543385 * t4;
+    y[616] = t12;
+    t14 = C61 * t10;
+    t11 = (-C60) * t2;
+    t6 = t14 + t11;
+    t13 = 0.0026062646773406016 * t6;
+    y[103] = t13;
+    t0 = (-0.07038547439326777) * t6;
+    y[256] = t0;
+    t9 = (-C62) * t5;
+    t7 = (-C63) * t3;
+    t8 = t9 + t7;
+    t1 = 0.07414729844179238 * t8;
+    y[373] = t1;
+    t4 = 0.000885182709137595 * t8;
+    y[706] = t4;
+    t12 = C63 * t5;
+    t10 = (-C62) * t3;
+    t2 = t12 + t10;
+    y[13] = 0;
+    t14 = (-0.07492593354452172) * t2;
+    y[346] = t14;
+    t11 = re[164];
+    t13 = im[164];
+    t6 = re[29];
+    t0 = im[29];
+    t9 = re[74];
+    t7 = im[74];
+    t1 = re[119];
+    t8 = im[119];
+    t4 = t11 + t9;
+    t5 = t13 + t7;
+    t3 = t6 + t1;
+    t12 = t0 + t8;
+    t10 = t11 - t9;
+    t2 = t13 - t7;
+    t14 = t6 - t1;
+    t11 = t0 - t8;
+    t9 = t4 + t3;
+    t13 = t5 + t12;
+    t7 = t10 + t11;
+    t6 = t2 - t14;
+    t1 = t4 - t3;
+    t0 = t5 - t12;
+    t8 = t10 - t11;
+    t4 = t2 + t14;
+    t3 = (-C64) * t9;
+    t5 = (-C65) * t13;
+    t12 = t3 + t5;
+    t10 = 0.0742006958638272 * t12;
+    y[371] = t10;
+    t11 = 0.0007162412227853556 * t12;
+    y[708] = t11;
+    t2 = C65 * t9;
+    t14 = (-C64) * t13;
+    t3 = t2 + t14;
+    y[11] = 0;
+    t5 = (-0.07487201421602685) * t3;
+    y[348] = t5;
+    t10 = C66 * t7;
+    t12 = C67 * t6;
+    t11 = t10 + t12;
+    y[78] = 0;
+    t9 = (-0.07372050726801713) * t11;
+    y[281] = t9;
+    t13 = (-C67) * t7;
+    t2 = C66 * t6;
+    t14 = t13 + t2;
+    t3 = 0.07535970330966202 * t14;
+    y[438] = t3;
+    t5 = 0.020256980411977373 * t14;
+    y[641] = t5;
+    t10 = C68 * t1;
+    t12 = C69 * t0;
+    t11 = t10 + t12;
+    t9 = 0.03152247059222997 * t11;
+    y[168] = t9;
+    t7 = (-0.045031547794885766) * t11;
+    y[191] = t7;
+    t6 = (-C69) * t1;
+    t13 = C68 * t0;
+    t2 = t6 + t13;
+    t3 = 0.07548893115038266 * t2;
+    y[528] = t3;
+    t14 = 0.06840111526676283 * t2;
+    y[551] = t14;
+    t5 = (-C70) * t8;
+    t10 = (-C71) * t4;
+    t12 = t5 + t10;
+    t9 = 0.07748989472063063 * t12;
+    y[461] = t9;
+    t11 = 0.0327669483767956 * t12;
+    y[618] = t11;
+    t7 = C71 * t8;
+    t1 = (-C70) * t4;
+    t0 = t7 + t1;
+    t6 = 0.0022163732028366626 * t0;
+    y[101] = t6;
+    t13 = (-0.07075673271981794) * t0;
+    y[258] = t13;
+    t3 = re[80];
+    t2 = im[80];
+    t14 = re[125];
+    t5 = im[125];
+    t10 = re[170];
+    t9 = im[170];
+    t12 = re[35];
+    t11 = im[35];
+    t8 = t3 + t10;
+    t4 = t2 + t9;
+    t7 = t14 + t12;
+    t1 = t5 + t11;
+    t6 = t3 - t10;
+    t0 = t2 - t9;
+    t13 = t14 - t12;
+    t3 = t5 - t11;
+    t10 = t8 + t7;
+    t2 = t4 + t1;
+    t9 = t6 + t3;
+    t14 = t0 - t13;
+    t12 = t8 - t7;
+    t5 = t4 - t1;
+    t11 = t6 - t3;
+    t8 = t0 + t13;
+    t7 = (-C72) * t10;
+    t4 = (-C73) * t2;
+    t1 = t7 + t4;
+    t6 = 0.07730191568708542 * t1;
+    y[459] = t6;
+    t3 = 0.03161467776349159 * t1;
+    y[620] = t3;
+    t0 = C73 * t10;
+    t13 = (-C72) * t2;
+    t7 = t0 + t13;
+    t4 = 0.0018618037564494532 * t7;
+    y[99] = t4;
+    t6 = (-0.07110684361286619) * t7;
+    y[260] = t6;
+    t1 = (-C74) * t9;
+    t3 = (-C75) * t14;
+    t10 = t1 + t3;
+    t2 = 0.07425606701298204 * t10;
+    y[369] = t2;
+    t0 = 0.0005686036444083812 * t10;
+    y[710] = t0;
+    t13 = C75 * t9;
+    t4 = (-C74) * t14;
+    t7 = t13 + t4;
+    y[9] = 0;
+    t6 = (-0.07481618376831468) * t7;
+    y[350] = t6;
+    t1 = C76 * t12;
+    t3 = C77 * t5;
+    t2 = t1 + t3;
+    y[80] = 0;
+    t10 = (-0.07355021895858266) * t2;
+    y[279] = t10;
+    t0 = (-C77) * t12;
+    t9 = C76 * t5;
+    t14 = t0 + t9;
+    t13 = 0.07553418105640151 * t14;
+    y[440] = t13;
+    t4 = 0.021263859082068726 * t14;
+    y[639] = t4;
+    t7 = C78 * t11;
+    t6 = C79 * t8;
+    t1 = t7 + t6;
+    t3 = 0.032712878842642595 * t1;
+    y[170] = t3;
+    t2 = (-0.04389508776629477) * t1;
+    y[189] = t2;
+    t10 = (-C79) * t11;
+    t12 = C78 * t8;
+    t5 = t10 + t12;
+    t0 = 0.07502108030330112 * t5;
+    y[530] = t0;
+    t9 = 0.06916232173276785 * t5;
+    y[549] = t9;
+    t13 = re[176];
+    t14 = im[176];
+    t4 = re[41];
+    t7 = im[41];
+    t6 = re[86];
+    t3 = im[86];
+    t1 = re[131];
+    t2 = im[131];
+    t11 = t13 + t6;
+    t8 = t14 + t3;
+    t10 = t4 + t1;
+    t12 = t7 + t2;
+    t0 = t13 - t6;
+    t5 = t14 - t3;
+    t9 = t4 - t1;
+    t13 = t7 - t2;
+    t6 = t11 + t10;
+    t14 = t8 + t12;
+    t3 = t0 + t13;
+    t4 = t5 - t9;
+    t1 = t11 - t10;
+    t7 = t8 - t12;
+    t2 = t0 - t13;
+    t11 = t5 + t9;
+    t10 = C80 * t6;
+    t8 = C81 * t14;
+    t12 = t10 + t8;
+    t0 = 0.033904596440883734 * t12;
+    y[172] = t0;
+    t13 = (-0.04274765608915604) * t12;
+    y[187] = t13;
+    t5 = (-C81) * t6;
+    t9 = C80 * t14;
+    t10 = t5 + t9;
+    t8 = 0.07452418927846975 * t10;
+    y[532] = t8;
+    t0 = 0.06989675119974971 * t10;
+    y[547] = t0;
+    t12 = (-C82) * t3;
+    t13 = (-C83) * t4;
+    t6 = t12 + t13;
+    t14 = 0.07711101011160705 * t6;
+    y[457] = t14;
+    t5 = 0.030471291315313755 * t6;
+    y[622] = t5;
+    t9 = C83 * t3;
+    t8 = (-C82) * t4;
+    t10 = t9 + t8;
+    t0 = 0.0015421103034191147 * t10;
+    y[97] = t0;
+    t12 = (-0.07143682147707409) * t10;
+    y[262] = t12;
+    t13 = (-C84) * t1;
+    t14 = (-C85) * t7;
+    t6 = t13 + t14;
+    t5 = 0.0743130633063656 * t6;
+    y[367] = t5;
+    t3 = 0.0004409171809484468 * t6;
+    y[712] = t3;
+    t4 = C85 * t1;
+    t9 = (-C84) * t7;
+    t8 = t4 + t9;
+    y[7] = 0;
+    t0 = (-0.07475880159390051) * t8;
+    y[352] = t0;
+    t10 = C86 * t2;
+    t12 = C87 * t11;
+    t13 = t10 + t12;
+    y[82] = 0;
+    t14 = (-0.0733709898052653) * t13;
+    y[277] = t14;
+    t5 = (-C87) * t2;
+    t6 = C86 * t11;
+    t3 = t5 + t6;
+    t1 = 0.07571869440906569 * t3;
+    y[442] = t1;
+    t7 = 0.022289008698053562 * t3;
+    y[637] = t7;
+    t4 = re[112];
+    t9 = im[112];
+    t8 = re[157];
+    t0 = im[157];
+    t10 = re[22];
+    t12 = im[22];
+    t13 = re[67];
+    t14 = im[67];
+    t2 = t4 + t10;
+    t11 = t9 + t12;
+    t5 = t8 + t13;
+    t6 = t0 + t14;
+    t1 = t4 - t10;
+    t3 = t9 - t12;
+    t7 = t8 - t13;
+    t4 = t0 - t14;
+    t10 = t2 + t5;
+    t9 = t11 + t6;
+    t12 = t1 + t4;
+    t8 = t3 - t7;
+    t13 = t2 - t5;
+    t0 = t11 - t6;
+    t14 = t1 - t4;
+    t2 = t3 + t7;
+    t5 = C88 * t10;
+    t11 = C89 * t9;
+    t6 = t5 + t11;
+    t1 = 0.00023509919043350854 * t6;
+    y[84] = t1;
+    t4 = (-0.07314539575615532) * t6;
+    y[275] = t4;
+    t3 = (-C89) * t10;
+    t7 = C88 * t9;
+    t5 = t3 + t7;
+    t11 = 0.07587723401076818 * t5;
+    y[444] = t11;
+    t1 = 0.023331619923463064 * t5;
+    y[635] = t1;
+    t6 = C90 * t12;
+    t4 = C91 * t8;
+    t10 = t6 + t4;
+    t9 = 0.03509657226994685 * t10;
+    y[174] = t9;
+    t3 = (-0.04158997495987726) * t10;
+    y[185] = t3;
+    t7 = (-C91) * t12;
+    t11 = C90 * t8;
+    t5 = t7 + t11;
+    t1 = 0.07399851067964641 * t5;
+    y[534] = t1;
+    t6 = 0.07060402737513881 * t5;
+    y[545] = t6;
+    t4 = (-C92) * t13;
+    t9 = (-C93) * t0;
+    t10 = t4 + t9;
+    t3 = 0.07691831583769149 * t10;
+    y[455] = t3;
+    t12 = 0.02933799848474425 * t10;
+    y[624] = t12;
+    t8 = C93 * t13;
+    t7 = (-C92) * t0;
+    t11 = t8 + t7;
+    t1 = 0.0012566211405111928 * t11;
+    y[95] = t1;
+    t5 = (-0.07174739522488442) * t11;
+    y[264] = t5;
+    t6 = (-C94) * t14;
+    t4 = (-C95) * t2;
+    t9 = t6 + t4;
+    t3 = 0.07437135293666741 * t9;
+    y[365] = t3;
+    t10 = 0.0003319606381975926 * t9;
+    y[714] = t10;
+    t12 = C95 * t14;
+    t13 = (-C94) * t2;
+    t0 = t12 + t13;
+    y[5] = 0;
+    t8 = (-0.07470020829507447) * t0;
+    y[354] = t8;
+    t7 = re[28];
+    t1 = im[28];
+    t11 = re[73];
+    t5 = im[73];
+    t6 = re[118];
+    t4 = im[118];
+    t3 = re[163];
+    t9 = im[163];
+    t10 = t7 + t6;
+    t14 = t1 + t4;
+    t2 = t11 + t3;
+    t12 = t5 + t9;
+    t13 = t7 - t6;
+    t0 = t1 - t4;
+    t8 = t11 - t3;
+    t7 = t5 - t9;
+    t6 = t10 + t2;
+    t1 = t14 + t12;
+    t4 = t13 + t7;
+    t11 = t0 - t8;
+    t3 = t10 - t2;
+    t5 = t14 - t12;
+    t9 = t13 - t7;
+    t10 = t0 + t8;
+    t2 = (-C96) * t6;
+    t14 = (-C97) * t1;
+    t12 = t2 + t14;
+    t13 = 0.07443059987513743 * t12;
+    y[363] = t13;
+    t7 = 0.00024046178754918768 * t12;
+    y[716] = t7;
+    t0 = C97 * t6;
+    t8 = (-C96) * t1;
+    t2 = t0 + t8;
+    y[3] = 0;
+    t14 = (-0.07464074674764669) * t2;
+    y[356] = t14;
+    t13 = C98 * t4;
+    t12 = C99 * t11;
+    t7 = t13 + t12;
+    t6 = 0.0003636133682961057 * t7;
+    y[86] = t6;
+    t1 = (-0.07292566451690818) * t7;
+    y[273] = t1;
+    t0 = (-C99) * t4;
+    t8 = C98 * t11;
+    t2 = t0 + t8;
+    t14 = 0.07605946082798594 * t2;
+    y[446] = t14;
+    t13 = 0.0243908300690247 * t2;
+    y[633] = t13;
+    t12 = C100 * t3;
+    t6 = C101 * t5;
+    t7 = t12 + t6;
+    t1 = 0.03628729419584379 * t7;
+    y[176] = t1;
+    t4 = (-0.04042290599658089) * t7;
+    y[183] = t4;
+    t11 = (-C101) * t3;
+    t0 = C100 * t5;
+    t8 = t11 + t0;
+    t14 = 0.07344473947163749 * t8;
+    y[536] = t14;
+    t2 = 0.07128406273528302 * t8;
+    y[543] = t2;
+    t13 = (-C102) * t9;
+    t12 = (-C103) * t10;
+    t6 = t13 + t12;
+    t1 = 0.07672513012950198 * t6;
+    y[453] = t1;
+    t7 = 0.028215773590490503 * t6;
+    y[626] = t7;
+    t4 = C103 * t9;
+    t3 = (-C102) * t10;
+    t5 = t4 + t3;
+    t11 = 0.001004420079138153 * t5;
+    y[93] = t11;
+    t0 = (-0.07203917486596162) * t5;
+    y[266] = t0;
+    t14 = re[124];
+    t8 = im[124];
+    t2 = re[169];
+    t13 = im[169];
+    t12 = re[34];
+    t1 = im[34];
+    t6 = re[79];
+    t7 = im[79];
+    t9 = t14 + t12;
+    t10 = t8 + t1;
+    t4 = t2 + t6;
+    t3 = t13 + t7;
+    t11 = t14 - t12;
+    t5 = t8 - t1;
+    t0 = t2 - t6;
+    t14 = t13 - t7;
+    t12 = t9 + t4;
+    t8 = t10 + t3;
+    t1 = t11 + t14;
+    t2 = t5 - t0;
+    t6 = t9 - t4;
+    t13 = t10 - t3;
+    t7 = t11 - t14;
+    t9 = t5 + t0;
+    t4 = (-C104) * t12;
+    t10 = (-C105) * t8;
+    t3 = t4 + t10;
+    t11 = 0.07653253220047196 * t3;
+    y[451] = t11;
+    t14 = 0.027105618559342022 * t3;
+    y[628] = t14;
+    t5 = C105 * t12;
+    t0 = (-C104) * t8;
+    t4 = t5 + t0;
+    t10 = 0.0007843288223699206 * t4;
+    y[91] = t10;
+    t11 = (-0.07231298479938665) * t4;
+    y[268] = t11;
+    t3 = (-C106) * t1;
+    t14 = (-C107) * t2;
+    t12 = t3 + t14;
+    t8 = 0.07449046842735706 * t12;
+    y[361] = t8;
+    t5 = 0.00016459314335602588 * t12;
+    y[718] = t5;
+    t0 = C107 * t1;
+    t10 = (-C106) * t2;
+    t4 = t0 + t10;
+    y[1] = 0;
+    t11 = (-0.07458075741560576) * t4;
+    y[358] = t11;
+    t3 = C108 * t6;
+    t14 = C109 * t13;
+    t8 = t3 + t14;
+    t12 = 0.0005109767988647399 * t8;
+    y[88] = t12;
+    t5 = (-0.07269232485002053) * t8;
+    y[271] = t5;
+    t1 = (-C109) * t6;
+    t2 = C108 * t13;
+    t0 = t1 + t2;
+    t10 = 0.07624660746123198 * t0;
+    y[448] = t10;
+    t4 = 0.025465730147811696 * t0;
+    y[631] = t4;
+    t11 = C110 * t7;
+    t3 = C111 * t9;
+    t14 = t11 + t3;
+    t12 = 0.037475094952612274 * t14;
+    y[178] = t12;
+    t8 = (-0.03924810154316684) * t14;
+    y[181] = t8;
+    t5 = (-C111) * t7;
+    t6 = C110 * t9;
+    t13 = t5 + t6;
+    t1 = 0.07286276255040021 * t13;
+    y[538] = t1;
+    t2 = 0.07193658763695611 * t13;
+    y[541] = t2;
+}
+
+//
+//  Public functions.
+//
+
+/**
+ *  Apply LD-IMDCT transform (prebuilt for window W75_360, input pruned).
+ * 
+ *  Note(s):
+ *    [1] y[n] = w[n] * SUM(X[k] * cos(PI / 360 * (n + 180.5) * (k + 0.5))), where
+ *        w[n] = sqrt(2 / 360) * W75_360[719 - n].
+ *    [2] X[k] shall be zero for all k >= 120 (not checked).
+ *    [3] The size of all arrays will not be checked.
+ * 
+ *  @param {Number[]} X 
+ *    - The input block (360 points, only the first 120 points are used).
+ *  @param {Number[]} y 
+ *    - The array that would contain the output block (720 points).
+ *  @param {Number[]} re 
+ *    - The scratch buffer (real part, 180 points).
+ *  @param {Number[]} im 
+ *    - The scratch buffer (imaginary part, 180 points).
+ */
+function ApplyWindowedIMDCT_W75_360_K120(X, y, re, im) {
+    ApplyWindowedIMDCT_W75_360_K120_Part1(X, y, re, im);
+    ApplyWindowedIMDCT_W75_360_K120_Part2(X, y, re, im);
+    ApplyWindowedIMDCT_W75_360_K120_Part3(X, y, re, im);
+    ApplyWindowedIMDCT_W75_360_K120_Part4(X, y, re, im);
+    ApplyWindowedIMDCT_W75_360_K120_Part5(X, y, re, im);
+    ApplyWindowedIMDCT_W75_360_K120_Part6(X, y, re, im);
+}
+
+//  Export public APIs.
+module.exports = {
+    "ApplyWindowedIMDCT_W75_360_K120": ApplyWindowedIMDCT_W75_360_K120
+};
\ No newline at end of file
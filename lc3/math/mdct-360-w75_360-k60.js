@@ -0,0 +1,9528 @@
+//
+//  Copyright 2021 - 2023 XiaoJSoft Studio. All rights reserved.
+//  Use of this source code is governed by a BSD-style license that can be
+//  found in the LICENSE.md file.
+//
+
+//
+//  Note(s):
+//    [1] This file is generated automatically by a MDCT compiler, which locates 
+//        at "./../../dev/mdct-generator/" directory.
+//        Do NOT modify this file manually.
+//
+
+//
+//  Private functions.
+//
+
+/**
+ *  Part 1 of ApplyWindowedIMDCT_W75_360_K60().
+ * 
+ *  @param {Number[]} X 
+ *    - The input block (360 points, only the first 60 points are used).
+ *  @param {Number[]} y 
+ *    - The array that would contain the output block (720 points).
+ *  @param {Number[]} re 
+ *    - The scratch buffer (real part, 180 points).
+ *  @param {Number[]} im 
+ *    - The scratch buffer (imaginary part, 180 points).
+ */
+function ApplyWindowedIMDCT_W75_360_K60_Part1(X, y, re, im) {
+    let t0, t1, t10, t11, t12, t13, t14, t2, t3, t4, t5, t6, t7, t8, t9;
+    const C0 = 0.984807753012208;
+    const C1 = 0.17364817766693033;
+    const C2 = 0.766044443118978;
+    const C3 = 1.1584559306791384;
+    const C4 = 0.8111595753452777;
+    const C5 = 0.9396926207859084;
+    const C6 = 0.5976724774602398;
+    const C7 = 1.281712764111577;
+    const C8 = 0.5;
+    const C9 = 0.8660254037844386;
+    const C10 = 0.9781476007338057;
+    const C11 = 0.20791169081775931;
+    const C12 = 0.48907380036690284;
+    const C13 = 0.10395584540887966;
+    const C14 = 0.8471006708862739;
+    const C15 = 0.18005680599195537;
+    const C16 = 0.9993908270190958;
+    const C17 = 0.03489949670250097;
+    const C18 = 1.4088320528055172;
+    const C19 = 0.12325683343243876;
+    const C20 = 0.9902680687415704;
+    const C21 = 0.13917310096006544;
+    const C22 = 0.9945218953682733;
+    const C23 = 0.10452846326765346;
+    const C24 = 0.49726094768413664;
+    const C25 = 0.05226423163382673;
+    const C26 = 0.8612812260087741;
+    const C27 = 0.09052430460833644;
+    const C28 = 0.9702957262759965;
+    const C29 = 0.24192189559966773;
+    const C30 = 0.48514786313799824;
+    const C31 = 0.12096094779983387;
+    const C32 = 0.840300748138485;
+    const C33 = 0.20951050732099905;
+    const C34 = 0.9975640502598242;
+    const C35 = 0.0697564737441253;
+    const C36 = 0.4987820251299121;
+    const C37 = 0.03487823687206265;
+    const C38 = 0.8639158094271042;
+    const C39 = 0.0604108783408347;
+    const C40 = 0.5590169943749475;
+    const C41 = 0.25;
+    const C42 = 0.9510565162951535;
+    const C43 = 0.5877852522924731;
+    t0 = X[0];
+    re[0] = t0;
+    im[0] = 0.0;
+    re[60] = t0;
+    im[60] = (-0.0);
+    re[120] = t0;
+    im[120] = 0.0;
+    t0 = X[40];
+    t1 = C0 * t0;
+    t2 = (-C1) * t0;
+    t3 = t1 + t2;
+    t4 = C2 * t3;
+    t5 = (-1.3874287282949778) * t0;
+    t6 = (-0.021403324510539366) * t0;
+    t6 = t4 - t6;
+    t4 = t4 + t5;
+    t5 = C1 * t3;
+    t3 = (-1.1408563820557884) * t0;
+    t0 = 0.14085638205578854 * t0;
+    t0 = t5 - t0;
+    t5 = t5 + t3;
+    re[20] = t1;
+    im[20] = t2;
+    re[80] = t6;
+    im[80] = t4;
+    re[140] = t0;
+    im[140] = t5;
+    t3 = X[39];
+    t1 = C0 * t3;
+    t2 = C1 * t3;
+    t6 = 0.492403876506104 * t3;
+    t4 = -t6;
+    t0 = 0.08682408883346517 * t3;
+    t5 = -t0;
+    t7 = (-0.8528685319524432) * t3;
+    t3 = (-0.15038373318043527) * t3;
+    t6 = t3 - t6;
+    t5 = t5 - t7;
+    t4 = t4 - t3;
+    t3 = t7 - t0;
+    t7 = t6 + t5;
+    t0 = C1 * t7;
+    t7 = t6 * (-C3);
+    t6 = t5 * (-C4);
+    t5 = t0 - t6;
+    t6 = t0 + t7;
+    t0 = t4 + t3;
+    t7 = (-C5) * t0;
+    t0 = t4 * C6;
+    t4 = t3 * (-C7);
+    t3 = t7 - t4;
+    t4 = t7 + t0;
+    re[40] = t1;
+    im[40] = t2;
+    re[100] = t5;
+    im[100] = t6;
+    re[160] = t3;
+    im[160] = t4;
+    t7 = re[0];
+    t0 = im[0];
+    t1 = re[20];
+    t2 = im[20];
+    t5 = re[40];
+    t6 = im[40];
+    t3 = t1 + t5;
+    t4 = t2 + t6;
+    t8 = C8 * t3;
+    t8 = t7 - t8;
+    t9 = C8 * t4;
+    t9 = t0 - t9;
+    t1 = t1 - t5;
+    t5 = C9 * t1;
+    t1 = t2 - t6;
+    t2 = C9 * t1;
+    t6 = t7 + t3;
+    t1 = t0 + t4;
+    t7 = t8 + t2;
+    t3 = t9 - t5;
+    t0 = t8 - t2;
+    t4 = t9 + t5;
+    re[0] = t6;
+    im[0] = t1;
+    re[20] = t7;
+    im[20] = t3;
+    re[40] = t0;
+    im[40] = t4;
+    t8 = re[60];
+    t2 = im[60];
+    t9 = re[80];
+    t5 = im[80];
+    t6 = re[100];
+    t1 = im[100];
+    t7 = t9 + t6;
+    t3 = t5 + t1;
+    t0 = C8 * t7;
+    t4 = t8 - t0;
+    t0 = C8 * t3;
+    t0 = t2 - t0;
+    t9 = t9 - t6;
+    t6 = C9 * t9;
+    t9 = t5 - t1;
+    t5 = C9 * t9;
+    t1 = t8 + t7;
+    t9 = t2 + t3;
+    t8 = t4 + t5;
+    t7 = t0 - t6;
+    t2 = t4 - t5;
+    t3 = t0 + t6;
+    re[60] = t1;
+    im[60] = t9;
+    re[80] = t8;
+    im[80] = t7;
+    re[100] = t2;
+    im[100] = t3;
+    t4 = re[120];
+    t5 = im[120];
+    t0 = re[140];
+    t6 = im[140];
+    t1 = re[160];
+    t9 = im[160];
+    t8 = t0 + t1;
+    t7 = t6 + t9;
+    t2 = C8 * t8;
+    t3 = t4 - t2;
+    t2 = C8 * t7;
+    t2 = t5 - t2;
+    t0 = t0 - t1;
+    t1 = C9 * t0;
+    t0 = t6 - t9;
+    t6 = C9 * t0;
+    t9 = t4 + t8;
+    t0 = t5 + t7;
+    t4 = t3 + t6;
+    t8 = t2 - t1;
+    t5 = t3 - t6;
+    t7 = t2 + t1;
+    re[120] = t9;
+    im[120] = t0;
+    re[140] = t4;
+    im[140] = t8;
+    re[160] = t5;
+    im[160] = t7;
+    t3 = X[47];
+    t6 = C10 * t3;
+    t2 = C11 * t3;
+    t1 = C12 * t3;
+    t9 = -t1;
+    t0 = C13 * t3;
+    t4 = -t0;
+    t8 = (-C14) * t3;
+    t5 = (-C15) * t3;
+    t7 = t5 - t1;
+    t3 = t4 - t8;
+    t1 = t9 - t5;
+    t4 = t8 - t0;
+    re[36] = t6;
+    im[36] = t2;
+    re[96] = t7;
+    im[96] = t3;
+    re[156] = t1;
+    im[156] = t4;
+    t9 = X[7];
+    t5 = C16 * t9;
+    t8 = C17 * t9;
+    t0 = 0.4996954135095479 * t9;
+    t6 = -t0;
+    t2 = 0.017449748351250485 * t9;
+    t7 = -t2;
+    t3 = (-0.8654978445076764) * t9;
+    t1 = (-0.030223850723657086) * t9;
+    t4 = t1 - t0;
+    t9 = t7 - t3;
+    t0 = t6 - t1;
+    t7 = t3 - t2;
+    t6 = t4 + t9;
+    t1 = C2 * t6;
+    t3 = t4 * (-C18);
+    t2 = t9 * C19;
+    t6 = t1 - t2;
+    t4 = t1 + t3;
+    t9 = t0 + t7;
+    t2 = C1 * t9;
+    t1 = t0 * (-C3);
+    t3 = t7 * (-C4);
+    t9 = t2 - t3;
+    t0 = t2 + t1;
+    re[56] = t5;
+    im[56] = t8;
+    re[116] = t6;
+    im[116] = t4;
+    re[176] = t9;
+    im[176] = t0;
+    t7 = X[32];
+    t3 = C20 * t7;
+    t2 = (-C21) * t7;
+    t1 = 0.4951340343707852 * t7;
+    t5 = -t1;
+    t8 = (-0.06958655048003272) * t7;
+    t6 = -t8;
+    t4 = (-0.8575973040867547) * t7;
+    t9 = 0.12052744095487311 * t7;
+    t0 = t9 - t1;
+    t7 = t6 - t4;
+    t1 = t5 - t9;
+    t6 = t4 - t8;
+    t5 = t0 + t7;
+    t9 = C1 * t5;
+    t4 = t0 * (-C3);
+    t8 = t7 * (-C4);
+    t5 = t9 - t8;
+    t0 = t9 + t4;
+    t7 = t1 + t6;
+    t8 = (-C5) * t7;
+    t9 = t1 * C6;
+    t4 = t6 * (-C7);
+    t7 = t8 - t4;
+    t1 = t8 + t9;
+    re[76] = t3;
+    im[76] = t2;
+    re[136] = t5;
+    im[136] = t0;
+    re[16] = t7;
+    im[16] = t1;
+    t6 = re[36];
+    t4 = im[36];
+    t8 = re[56];
+    t9 = im[56];
+    t3 = re[76];
+    t2 = im[76];
+    t5 = t8 + t3;
+    t0 = t9 + t2;
+    t7 = C8 * t5;
+    t1 = t6 - t7;
+    t7 = C8 * t0;
+    t7 = t4 - t7;
+    t8 = t8 - t3;
+    t3 = C9 * t8;
+    t8 = t9 - t2;
+    t9 = C9 * t8;
+    t2 = t6 + t5;
+    t8 = t4 + t0;
+    t6 = t1 + t9;
+    t5 = t7 - t3;
+    t4 = t1 - t9;
+    t0 = t7 + t3;
+    re[36] = t2;
+    im[36] = t8;
+    re[56] = t6;
+    im[56] = t5;
+    re[76] = t4;
+    im[76] = t0;
+    t1 = re[96];
+    t9 = im[96];
+    t7 = re[116];
+    t3 = im[116];
+    t2 = re[136];
+    t8 = im[136];
+    t6 = t7 + t2;
+    t5 = t3 + t8;
+    t4 = C8 * t6;
+    t0 = t1 - t4;
+    t4 = C8 * t5;
+    t4 = t9 - t4;
+    t7 = t7 - t2;
+    t2 = C9 * t7;
+    t7 = t3 - t8;
+    t3 = C9 * t7;
+    t8 = t1 + t6;
+    t7 = t9 + t5;
+    t1 = t0 + t3;
+    t6 = t4 - t2;
+    t9 = t0 - t3;
+    t5 = t4 + t2;
+    re[96] = t8;
+    im[96] = t7;
+    re[116] = t1;
+    im[116] = t6;
+    re[136] = t9;
+    im[136] = t5;
+    t0 = re[156];
+    t3 = im[156];
+    t4 = re[176];
+    t2 = im[176];
+    t8 = re[16];
+    t7 = im[16];
+    t1 = t4 + t8;
+    t6 = t2 + t7;
+    t9 = C8 * t1;
+    t5 = t0 - t9;
+    t9 = C8 * t6;
+    t9 = t3 - t9;
+    t4 = t4 - t8;
+    t8 = C9 * t4;
+    t4 = t2 - t7;
+    t2 = C9 * t4;
+    t7 = t0 + t1;
+    t4 = t3 + t6;
+    t0 = t5 + t2;
+    t1 = t9 - t8;
+    t3 = t5 - t2;
+    t6 = t9 + t8;
+    re[156] = t7;
+    im[156] = t4;
+    re[176] = t0;
+    im[176] = t1;
+    re[16] = t3;
+    im[16] = t6;
+    t5 = X[24];
+    t2 = C22 * t5;
+    t9 = (-C23) * t5;
+    t8 = C24 * t5;
+    t7 = -t8;
+    t4 = (-C25) * t5;
+    t0 = -t4;
+    t1 = (-C26) * t5;
+    t3 = C27 * t5;
+    t6 = t3 - t8;
+    t5 = t0 - t1;
+    t8 = t7 - t3;
+    t0 = t1 - t4;
+    re[72] = t2;
+    im[72] = t9;
+    re[132] = t6;
+    im[132] = t5;
+    re[12] = t8;
+    im[12] = t0;
+    t7 = X[55];
+    t3 = C28 * t7;
+    t1 = C29 * t7;
+    t4 = C30 * t7;
+    t2 = -t4;
+    t9 = C31 * t7;
+    t6 = -t9;
+    t5 = C32 * t7;
+    t8 = C33 * t7;
+    t0 = t8 - t4;
+    t7 = t6 - t5;
+    t4 = t2 - t8;
+    t6 = t5 - t9;
+    t2 = t0 + t7;
+    t8 = C2 * t2;
+    t5 = t0 * (-C18);
+    t9 = t7 * C19;
+    t2 = t8 - t9;
+    t0 = t8 + t5;
+    t7 = t4 + t6;
+    t9 = C1 * t7;
+    t8 = t4 * (-C3);
+    t5 = t6 * (-C4);
+    t7 = t9 - t5;
+    t4 = t9 + t8;
+    re[92] = t3;
+    im[92] = t1;
+    re[152] = t2;
+    im[152] = t0;
+    re[32] = t7;
+    im[32] = t4;
+    t6 = X[15];
+    t5 = C34 * t6;
+    t9 = C35 * t6;
+    t8 = C36 * t6;
+    t3 = -t8;
+    t1 = C37 * t6;
+    t2 = -t1;
+    t0 = C38 * t6;
+    t7 = C39 * t6;
+    t4 = t7 - t8;
+    t6 = t2 - t0;
+    t8 = t3 - t7;
+    t2 = t0 - t1;
+    t3 = t4 + t6;
+    t7 = C1 * t3;
+    t0 = t4 * (-C3);
+    t1 = t6 * (-C4);
+    t3 = t7 - t1;
+    t4 = t7 + t0;
+    t6 = t8 + t2;
+    t1 = (-C5) * t6;
+    t7 = t8 * C6;
+    t0 = t2 * (-C7);
+    t6 = t1 - t0;
+    t8 = t1 + t7;
+    re[112] = t5;
+    im[112] = t9;
+    re[172] = t3;
+    im[172] = t4;
+    re[52] = t6;
+    im[52] = t8;
+    t2 = re[72];
+    t0 = im[72];
+    t1 = re[92];
+    t7 = im[92];
+    t5 = re[112];
+    t9 = im[112];
+    t3 = t1 + t5;
+    t4 = t7 + t9;
+    t6 = C8 * t3;
+    t8 = t2 - t6;
+    t6 = C8 * t4;
+    t6 = t0 - t6;
+    t1 = t1 - t5;
+    t5 = C9 * t1;
+    t1 = t7 - t9;
+    t7 = C9 * t1;
+    t9 = t2 + t3;
+    t1 = t0 + t4;
+    t2 = t8 + t7;
+    t3 = t6 - t5;
+    t0 = t8 - t7;
+    t4 = t6 + t5;
+    re[72] = t9;
+    im[72] = t1;
+    re[92] = t2;
+    im[92] = t3;
+    re[112] = t0;
+    im[112] = t4;
+    t8 = re[132];
+    t7 = im[132];
+    t6 = re[152];
+    t5 = im[152];
+    t9 = re[172];
+    t1 = im[172];
+    t2 = t6 + t9;
+    t3 = t5 + t1;
+    t0 = C8 * t2;
+    t4 = t8 - t0;
+    t0 = C8 * t3;
+    t0 = t7 - t0;
+    t6 = t6 - t9;
+    t9 = C9 * t6;
+    t6 = t5 - t1;
+    t5 = C9 * t6;
+    t1 = t8 + t2;
+    t6 = t7 + t3;
+    t8 = t4 + t5;
+    t2 = t0 - t9;
+    t7 = t4 - t5;
+    t3 = t0 + t9;
+    re[132] = t1;
+    im[132] = t6;
+    re[152] = t8;
+    im[152] = t2;
+    re[172] = t7;
+    im[172] = t3;
+    t4 = re[12];
+    t5 = im[12];
+    t0 = re[32];
+    t9 = im[32];
+    t1 = re[52];
+    t6 = im[52];
+    t8 = t0 + t1;
+    t2 = t9 + t6;
+    t7 = C8 * t8;
+    t3 = t4 - t7;
+    t7 = C8 * t2;
+    t7 = t5 - t7;
+    t0 = t0 - t1;
+    t1 = C9 * t0;
+    t0 = t9 - t6;
+    t9 = C9 * t0;
+    t6 = t4 + t8;
+    t0 = t5 + t2;
+    t4 = t3 + t9;
+    t8 = t7 - t1;
+    t5 = t3 - t9;
+    t2 = t7 + t1;
+    re[12] = t6;
+    im[12] = t0;
+    re[32] = t4;
+    im[32] = t8;
+    re[52] = t5;
+    im[52] = t2;
+    t3 = X[23];
+    t9 = C22 * t3;
+    t7 = C23 * t3;
+    t1 = C24 * t3;
+    t6 = -t1;
+    t0 = C25 * t3;
+    t4 = -t0;
+    t8 = C26 * t3;
+    t5 = C27 * t3;
+    t2 = t5 - t1;
+    t3 = t4 - t8;
+    t1 = t6 - t5;
+    t4 = t8 - t0;
+    re[108] = t9;
+    im[108] = t7;
+    re[168] = t2;
+    im[168] = t3;
+    re[48] = t1;
+    im[48] = t4;
+    t6 = X[16];
+    t5 = C34 * t6;
+    t8 = (-C35) * t6;
+    t0 = C36 * t6;
+    t9 = -t0;
+    t7 = (-C37) * t6;
+    t2 = -t7;
+    t3 = C38 * t6;
+    t1 = (-C39) * t6;
+    t4 = t1 - t0;
+    t6 = t2 - t3;
+    t0 = t9 - t1;
+    t2 = t3 - t7;
+    t9 = t4 + t6;
+    t1 = C2 * t9;
+    t3 = t4 * (-C18);
+    t7 = t6 * C19;
+    t9 = t1 - t7;
+    t4 = t1 + t3;
+    t6 = t0 + t2;
+    t7 = C1 * t6;
+    t1 = t0 * (-C3);
+    t3 = t2 * (-C4);
+    t6 = t7 - t3;
+    t0 = t7 + t1;
+    re[128] = t5;
+    im[128] = t8;
+    re[8] = t9;
+    im[8] = t4;
+    re[68] = t6;
+    im[68] = t0;
+    t2 = X[56];
+    t3 = C28 * t2;
+    t7 = (-C29) * t2;
+    t1 = C30 * t2;
+    t5 = -t1;
+    t8 = (-C31) * t2;
+    t9 = -t8;
+    t4 = C32 * t2;
+    t6 = (-C33) * t2;
+    t0 = t6 - t1;
+    t2 = t9 - t4;
+    t1 = t5 - t6;
+    t9 = t4 - t8;
+    t5 = t0 + t2;
+    t6 = C1 * t5;
+    t4 = t0 * (-C3);
+    t8 = t2 * (-C4);
+    t5 = t6 - t8;
+    t0 = t6 + t4;
+    t2 = t1 + t9;
+    t8 = (-C5) * t2;
+    t6 = t1 * C6;
+    t4 = t9 * (-C7);
+    t2 = t8 - t4;
+    t1 = t8 + t6;
+    re[148] = t3;
+    im[148] = t7;
+    re[28] = t5;
+    im[28] = t0;
+    re[88] = t2;
+    im[88] = t1;
+    t9 = re[108];
+    t4 = im[108];
+    t8 = re[128];
+    t6 = im[128];
+    t3 = re[148];
+    t7 = im[148];
+    t5 = t8 + t3;
+    t0 = t6 + t7;
+    t2 = C8 * t5;
+    t1 = t9 - t2;
+    t2 = C8 * t0;
+    t2 = t4 - t2;
+    t8 = t8 - t3;
+    t3 = C9 * t8;
+    t8 = t6 - t7;
+    t6 = C9 * t8;
+    t7 = t9 + t5;
+    t8 = t4 + t0;
+    t9 = t1 + t6;
+    t5 = t2 - t3;
+    t4 = t1 - t6;
+    t0 = t2 + t3;
+    re[108] = t7;
+    im[108] = t8;
+    re[128] = t9;
+    im[128] = t5;
+    re[148] = t4;
+    im[148] = t0;
+    t1 = re[168];
+    t6 = im[168];
+    t2 = re[8];
+    t3 = im[8];
+    t7 = re[28];
+    t8 = im[28];
+    t9 = t2 + t7;
+    t5 = t3 + t8;
+    t4 = C8 * t9;
+    t0 = t1 - t4;
+    t4 = C8 * t5;
+    t4 = t6 - t4;
+    t2 = t2 - t7;
+    t7 = C9 * t2;
+    t2 = t3 - t8;
+    t3 = C9 * t2;
+    t8 = t1 + t9;
+    t2 = t6 + t5;
+    t1 = t0 + t3;
+    t9 = t4 - t7;
+    t6 = t0 - t3;
+    t5 = t4 + t7;
+    re[168] = t8;
+    im[168] = t2;
+    re[8] = t1;
+    im[8] = t9;
+    re[28] = t6;
+    im[28] = t5;
+    t0 = re[48];
+    t3 = im[48];
+    t4 = re[68];
+    t7 = im[68];
+    t8 = re[88];
+    t2 = im[88];
+    t1 = t4 + t8;
+    t9 = t7 + t2;
+    t6 = C8 * t1;
+    t5 = t0 - t6;
+    t6 = C8 * t9;
+    t6 = t3 - t6;
+    t4 = t4 - t8;
+    t8 = C9 * t4;
+    t4 = t7 - t2;
+    t7 = C9 * t4;
+    t2 = t0 + t1;
+    t4 = t3 + t9;
+    t0 = t5 + t7;
+    t1 = t6 - t8;
+    t3 = t5 - t7;
+    t9 = t6 + t8;
+    re[48] = t2;
+    im[48] = t4;
+    re[68] = t0;
+    im[68] = t1;
+    re[88] = t3;
+    im[88] = t9;
+    t5 = X[48];
+    t7 = C10 * t5;
+    t6 = (-C11) * t5;
+    t8 = C12 * t5;
+    t2 = -t8;
+    t4 = (-C13) * t5;
+    t0 = -t4;
+    t1 = C14 * t5;
+    t3 = (-C15) * t5;
+    t9 = t3 - t8;
+    t5 = t0 - t1;
+    t8 = t2 - t3;
+    t0 = t1 - t4;
+    re[144] = t7;
+    im[144] = t6;
+    re[24] = t9;
+    im[24] = t5;
+    re[84] = t8;
+    im[84] = t0;
+    t2 = X[31];
+    t3 = C20 * t2;
+    t1 = C21 * t2;
+    t4 = t3 + t1;
+    t7 = C2 * t4;
+    t6 = (-1.3951213961129416) * t2;
+    t9 = 0.01715403572331077 * t2;
+    t5 = t7 - t9;
+    t8 = t7 + t6;
+    t0 = C1 * t4;
+    t9 = (-1.1471819171958488) * t2;
+    t7 = (-0.11289159347425215) * t2;
+    t6 = t0 - t7;
+    t4 = t0 + t9;
+    re[164] = t3;
+    im[164] = t1;
+    re[44] = t5;
+    im[44] = t8;
+    re[104] = t6;
+    im[104] = t4;
+    t2 = X[8];
+    t7 = C16 * t2;
+    t0 = (-C17) * t2;
+    t9 = t7 + t0;
+    t3 = C1 * t9;
+    t1 = (-1.1577502306266005) * t2;
+    t5 = 0.028309060924964605 * t2;
+    t8 = t3 - t5;
+    t6 = t3 + t1;
+    t4 = (-C5) * t9;
+    t5 = 0.5973083915355409 * t2;
+    t3 = 0.044731130384665384 * t2;
+    t1 = t4 - t3;
+    t9 = t4 + t5;
+    re[4] = t7;
+    im[4] = t0;
+    re[64] = t8;
+    im[64] = t6;
+    re[124] = t1;
+    im[124] = t9;
+    t2 = re[144];
+    t3 = im[144];
+    t4 = re[164];
+    t5 = im[164];
+    t7 = re[4];
+    t0 = im[4];
+    t8 = t4 + t7;
+    t6 = t5 + t0;
+    t1 = C8 * t8;
+    t9 = t2 - t1;
+    t1 = C8 * t6;
+    t1 = t3 - t1;
+    t4 = t4 - t7;
+    t7 = C9 * t4;
+    t4 = t5 - t0;
+    t5 = C9 * t4;
+    t0 = t2 + t8;
+    t4 = t3 + t6;
+    t2 = t9 + t5;
+    t8 = t1 - t7;
+    t3 = t9 - t5;
+    t6 = t1 + t7;
+    re[144] = t0;
+    im[144] = t4;
+    re[164] = t2;
+    im[164] = t8;
+    re[4] = t3;
+    im[4] = t6;
+    t9 = re[24];
+    t5 = im[24];
+    t1 = re[44];
+    t7 = im[44];
+    t0 = re[64];
+    t4 = im[64];
+    t2 = t1 + t0;
+    t8 = t7 + t4;
+    t3 = C8 * t2;
+    t6 = t9 - t3;
+    t3 = C8 * t8;
+    t3 = t5 - t3;
+    t1 = t1 - t0;
+    t0 = C9 * t1;
+    t1 = t7 - t4;
+    t7 = C9 * t1;
+    t4 = t9 + t2;
+    t1 = t5 + t8;
+    t9 = t6 + t7;
+    t2 = t3 - t0;
+    t5 = t6 - t7;
+    t8 = t3 + t0;
+    re[24] = t4;
+    im[24] = t1;
+    re[44] = t9;
+    im[44] = t2;
+    re[64] = t5;
+    im[64] = t8;
+    t6 = re[84];
+    t7 = im[84];
+    t3 = re[104];
+    t0 = im[104];
+    t4 = re[124];
+    t1 = im[124];
+    t9 = t3 + t4;
+    t2 = t0 + t1;
+    t5 = C8 * t9;
+    t8 = t6 - t5;
+    t5 = C8 * t2;
+    t5 = t7 - t5;
+    t3 = t3 - t4;
+    t4 = C9 * t3;
+    t3 = t0 - t1;
+    t0 = C9 * t3;
+    t1 = t6 + t9;
+    t3 = t7 + t2;
+    t6 = t8 + t0;
+    t9 = t5 - t4;
+    t7 = t8 - t0;
+    t2 = t5 + t4;
+    re[84] = t1;
+    im[84] = t3;
+    re[104] = t6;
+    im[104] = t9;
+    re[124] = t7;
+    im[124] = t2;
+    t8 = re[0];
+    t0 = im[0];
+    t5 = re[36];
+    t4 = im[36];
+    t1 = re[72];
+    t3 = im[72];
+    t6 = re[108];
+    t9 = im[108];
+    t7 = re[144];
+    t2 = im[144];
+    t10 = t5 + t7;
+    t11 = t4 + t2;
+    t12 = t1 + t6;
+    t13 = t3 + t9;
+    t5 = t5 - t7;
+    t7 = t4 - t2;
+    t4 = t1 - t6;
+    t2 = t3 - t9;
+    t1 = t10 + t12;
+    t6 = t11 + t13;
+    t3 = t10 - t12;
+    t9 = C40 * t3;
+    t10 = t11 - t13;
+    t12 = C40 * t10;
+    t3 = C41 * t1;
+    t11 = t8 - t3;
+    t13 = C41 * t6;
+    t10 = t0 - t13;
+    t3 = t11 + t9;
+    t13 = t10 + t12;
+    t11 = t11 - t9;
+    t9 = t10 - t12;
+    t10 = C42 * t5;
+    t12 = C43 * t4;
+    t10 = t10 + t12;
+    t12 = C42 * t7;
+    t14 = C43 * t2;
+    t12 = t12 + t14;
+    t14 = C43 * t5;
+    t5 = C42 * t4;
+    t4 = t14 - t5;
+    t14 = C43 * t7;
+    t5 = C42 * t2;
+    t7 = t14 - t5;
+    t2 = t8 + t1;
+    t14 = t0 + t6;
+    t5 = t3 + t12;
+    t8 = t13 - t10;
+    t1 = t11 + t7;
+    t0 = t9 - t4;
+    t6 = t11 - t7;
+    t11 = t9 + t4;
+    t7 = t3 - t12;
+    t9 = t13 + t10;
+    re[0] = t2;
+    im[0] = t14;
+    re[36] = t5;
+    im[36] = t8;
+    re[72] = t1;
+    im[72] = t0;
+    re[108] = t6;
+    im[108] = t11;
+    re[144] = t7;
+    im[144] = t9;
+    t4 = re[60];
+    t3 = im[60];
+    t12 = re[96];
+    t13 = im[96];
+    t10 = re[132];
+    t2 = im[132];
+    t14 = re[168];
+    t5 = im[168];
+    t8 = re[24];
+    t1 = im[24];
+    t0 = t12 + t8;
+    t6 = t13 + t1;
+    t11 = t10 + t14;
+    t7 = t2 + t5;
+    t9 = t12 - t8;
+    t12 = t13 - t1;
+    t8 = t10 - t14;
+    t13 = t2 - t5;
+    t1 = t0 + t11;
+    t10 = t6 + t7;
+    t14 = t0 - t11;
+    t2 = C40 * t14;
+    t5 = t6 - t7;
+    t0 = C40 * t5;
+    t11 = C41 * t1;
+    t14 = t4 - t11;
+    t6 = C41 * t10;
+    t7 = t3 - t6;
+    t5 = t14 + t2;
+    t11 = t7 + t0;
+    t6 = t14 - t2;
+    t14 = t7 - t0;
+    t2 = C42 * t9;
+    t7 = C43 * t8;
+    t0 = t2 + t7;
+    t2 = C42 * t12;
+    t7 = C43 * t13;
+    t2 = t2 + t7;
+    t7 = C43 * t9;
+    t9 = C42 * t8;
+    t8 = t7 - t9;
+    t7 = C43 * t12;
+    t9 = C42 * t13;
+    t12 = t7 - t9;
+    t13 = t4 + t1;
+    t7 = t3 + t10;
+    t9 = t5 + t2;
+    t4 = t11 - t0;
+    t1 = t6 + t12;
+    t3 = t14 - t8;
+    t10 = t6 - t12;
+    t6 = t14 + t8;
+    t12 = t5 - t2;
+    t14 = t11 + t0;
+    re[60] = t13;
+    im[60] = t7;
+    re[96] = t9;
+    im[96] = t4;
+    re[132] = t1;
+    im[132] = t3;
+    re[168] = t10;
+    im[168] = t6;
+    re[24] = t12;
+    im[24] = t14;
+    t8 = re[120];
+    t5 = im[120];
+    t2 = re[156];
+    t11 = im[156];
+    t0 = re[12];
+    t13 = im[12];
+    t7 = re[48];
+    t9 = im[48];
+    t4 = re[84];
+    t1 = im[84];
+    t3 = t2 + t4;
+    t10 = t11 + t1;
+    t6 = t0 + t7;
+    t12 = t13 + t9;
+    t14 = t2 - t4;
+    t2 = t11 - t1;
+    t4 = t0 - t7;
+    t11 = t13 - t9;
+    t1 = t3 + t6;
+    t0 = t10 + t12;
+    t7 = t3 - t6;
+    t13 = C40 * t7;
+    t9 = t10 - t12;
+    t3 = C40 * t9;
+    t6 = C41 * t1;
+    t7 = t8 - t6;
+    t10 = C41 * t0;
+    t12 = t5 - t10;
+    t9 = t7 + t13;
+    t6 = t12 + t3;
+    t10 = t7 - t13;
+    t7 = t12 - t3;
+    t13 = C42 * t14;
+    t12 = C43 * t4;
+    t3 = t13 + t12;
+    t13 = C42 * t2;
+    t12 = C43 * t11;
+    t13 = t13 + t12;
+    t12 = C43 * t14;
+    t14 = C42 * t4;
+    t4 = t12 - t14;
+    t12 = C43 * t2;
+    t14 = C42 * t11;
+    t2 = t12 - t14;
+    t11 = t8 + t1;
+    t12 = t5 + t0;
+    t14 = t9 + t13;
+    t8 = t6 - t3;
+    t1 = t10 + t2;
+    t5 = t7 - t4;
+    t0 = t10 - t2;
+    t10 = t7 + t4;
+    t2 = t9 - t13;
+    t7 = t6 + t3;
+    re[120] = t11;
+    im[120] = t12;
+    re[156] = t14;
+    im[156] = t8;
+    re[12] = t1;
+    im[12] = t5;
+    re[48] = t0;
+    im[48] = t10;
+    re[84] = t2;
+    im[84] = t7;
+    t4 = re[20];
+    t9 = im[20];
+    t13 = re[56];
+    t6 = im[56];
+    t3 = re[92];
+    t11 = im[92];
+    t12 = re[128];
+    t14 = im[128];
+    t8 = re[164];
+    t1 = im[164];
+    t5 = t13 + t8;
+    t0 = t6 + t1;
+    t10 = t3 + t12;
+    t2 = t11 + t14;
+    t7 = t13 - t8;
+    t13 = t6 - t1;
+    t8 = t3 - t12;
+    t6 = t11 - t14;
+    t1 = t5 + t10;
+    t3 = t0 + t2;
+    t12 = t5 - t10;
+    t11 = C40 * t12;
+    t14 = t0 - t2;
+    t5 = C40 * t14;
+    t10 = C41 * t1;
+    t12 = t4 - t10;
+    t0 = C41 * t3;
+    t2 = t9 - t0;
+    t14 = t12 + t11;
+    t10 = t2 + t5;
+    t0 = t12 - t11;
+    t12 = t2 - t5;
+    t11 = C42 * t7;
+    t2 = C43 * t8;
+    t5 = t11 + t2;
+    t11 = C42 * t13;
+    t2 = C43 * t6;
+    t11 = t11 + t2;
+    t2 = C43 * t7;
+    t7 = C42 * t8;
+    t8 = t2 - t7;
+    t2 = C43 * t13;
+    t7 = C42 * t6;
+    t13 = t2 - t7;
+    t6 = t4 + t1;
+    t2 = t9 + t3;
+    t7 = t14 + t11;
+    t4 = t10 - t5;
+    t1 = t0 + t13;
+    t9 = t12 - t8;
+    t3 = t0 - t13;
+    t0 = t12 + t8;
+    t13 = t14 - t11;
+    t12 = t10 + t5;
+    re[20] = t6;
+    im[20] = t2;
+    re[56] = t7;
+    im[56] = t4;
+    re[92] = t1;
+    im[92] = t9;
+    re[128] = t3;
+    im[128] = t0;
+    re[164] = t13;
+    im[164] = t12;
+    t8 = re[80];
+    t14 = im[80];
+    t11 = re[116];
+    t10 = im[116];
+    t5 = re[152];
+    t6 = im[152];
+    t2 = re[8];
+    t7 = im[8];
+    t4 = re[44];
+    t1 = im[44];
+    t9 = t11 + t4;
+    t3 = t10 + t1;
+    t0 = t5 + t2;
+    t13 = t6 + t7;
+    t12 = t11 - t4;
+    t11 = t10 - t1;
+    t4 = t5 - t2;
+    t10 = t6 - t7;
+    t1 = t9 + t0;
+    t5 = t3 + t13;
+    t2 = t9 - t0;
+    t6 = C40 * t2;
+    t7 = t3 - t13;
+    t9 = C40 * t7;
+    t0 = C41 * t1;
+    t2 = t8 - t0;
+    t3 = C41 * t5;
+    t13 = t14 - t3;
+    t7 = t2 + t6;
+    t0 = t13 + t9;
+    t3 = t2 - t6;
+    t2 = t13 - t9;
+    t6 = C42 * t12;
+    t13 = C43 * t4;
+    t9 = t6 + t13;
+    t6 = C42 * t11;
+    t13 = C43 * t10;
+    t6 = t6 + t13;
+    t13 = C43 * t12;
+    t12 = C42 * t4;
+    t4 = t13 - t12;
+    t13 = C43 * t11;
+    t12 = C42 * t10;
+    t11 = t13 - t12;
+    t10 = t8 + t1;
+    t13 = t14 + t5;
+    t12 = t7 + t6;
+    t8 = t0 - t9;
+    t1 = t3 + t11;
+    t14 = t2 - t4;
+    t5 = t3 - t11;
+    t3 = t2 + t4;
+    t11 = t7 - t6;
+    t2 = t0 + t9;
+    re[80] = t10;
+    im[80] = t13;
+    re[116] = t12;
+    im[116] = t8;
+    re[152] = t1;
+    im[152] = t14;
+    re[8] = t5;
+    im[8] = t3;
+    re[44] = t11;
+    im[44] = t2;
+    t4 = re[140];
+    t7 = im[140];
+    t6 = re[176];
+    t0 = im[176];
+    t9 = re[32];
+    t10 = im[32];
+    t13 = re[68];
+    t12 = im[68];
+    t8 = re[104];
+    t1 = im[104];
+    t14 = t6 + t8;
+    t5 = t0 + t1;
+    t3 = t9 + t13;
+    t11 = t10 + t12;
+    t2 = t6 - t8;
+    t6 = t0 - t1;
+    t8 = t9 - t13;
+    t0 = t10 - t12;
+    t1 = t14 + t3;
+    t9 = t5 + t11;
+    t13 = t14 - t3;
+    t10 = C40 * t13;
+    t12 = t5 - t11;
+    t14 = C40 * t12;
+    t3 = C41 * t1;
+    t13 = t4 - t3;
+    t5 = C41 * t9;
+    t11 = t7 - t5;
+    t12 = t13 + t10;
+    t3 = t11 + t14;
+    t5 = t13 - t10;
+    t13 = t11 - t14;
+    t10 = C42 * t2;
+    t11 = C43 * t8;
+    t14 = t10 + t11;
+    t10 = C42 * t6;
+    t11 = C43 * t0;
+    t10 = t10 + t11;
+    t11 = C43 * t2;
+    t2 = C42 * t8;
+    t8 = t11 - t2;
+    t11 = C43 * t6;
+    t2 = C42 * t0;
+    t6 = t11 - t2;
+    t0 = t4 + t1;
+    t11 = t7 + t9;
+    t2 = t12 + t10;
+    t4 = t3 - t14;
+    t1 = t5 + t6;
+    t7 = t13 - t8;
+    t9 = t5 - t6;
+    t5 = t13 + t8;
+    t6 = t12 - t10;
+    t13 = t3 + t14;
+    re[140] = t0;
+    im[140] = t11;
+    re[176] = t2;
+    im[176] = t4;
+    re[32] = t1;
+    im[32] = t7;
+    re[68] = t9;
+    im[68] = t5;
+    re[104] = t6;
+    im[104] = t13;
+    t8 = re[40];
+    t12 = im[40];
+    t10 = re[76];
+    t3 = im[76];
+    t14 = re[112];
+    t0 = im[112];
+    t11 = re[148];
+    t2 = im[148];
+    t4 = re[4];
+    t1 = im[4];
+    t7 = t10 + t4;
+    t9 = t3 + t1;
+    t5 = t14 + t11;
+    t6 = t0 + t2;
+    t13 = t10 - t4;
+    t10 = t3 - t1;
+    t4 = t14 - t11;
+    t3 = t0 - t2;
+    t1 = t7 + t5;
+    t14 = t9 + t6;
+    t11 = t7 - t5;
+    t0 = C40 * t11;
+    t2 = t9 - t6;
+    t7 = C40 * t2;
+    t5 = C41 * t1;
+    t11 = t8 - t5;
+    t9 = C41 * t14;
+    t6 = t12 - t9;
+    t2 = t11 + t0;
+    t5 = t6 + t7;
+    t9 = t11 - t0;
+    t11 = t6 - t7;
+    t0 = C42 * t13;
+    t6 = C43 * t4;
+    t7 = t0 + t6;
+    t0 = C42 * t10;
+    t6 = C43 * t3;
+    t0 = t0 + t6;
+    t6 = C43 * t13;
+    t13 = C42 * t4;
+    t4 = t6 - t13;
+    t6 = C43 * t10;
+    t13 = C42 * t3;
+    t10 = t6 - t13;
+    t3 = t8 + t1;
+    t6 = t12 + t14;
+    t13 = t2 + t0;
+    t8 = t5 - t7;
+    t1 = t9 + t10;
+    t12 = t11 - t4;
+    t14 = t9 - t10;
+    t9 = t11 + t4;
+    t10 = t2 - t0;
+    t11 = t5 + t7;
+    re[40] = t3;
+    im[40] = t6;
+    re[76] = t13;
+    im[76] = t8;
+    re[112] = t1;
+    im[112] = t12;
+    re[148] = t14;
+    im[148] = t9;
+    re[4] = t10;
+    im[4] = t11;
+    t4 = re[100];
+    t2 = im[100];
+    t0 = re[136];
+    t5 = im[136];
+    t7 = re[172];
+    t3 = im[172];
+    t6 = re[28];
+    t13 = im[28];
+    t8 = re[64];
+    t1 = im[64];
+    t12 = t0 + t8;
+    t14 = t5 + t1;
+    t9 = t7 + t6;
+    t10 = t3 + t13;
+    t11 = t0 - t8;
+    t0 = t5 - t1;
+    t8 = t7 - t6;
+    t5 = t3 - t13;
+    t1 = t12 + t9;
+    t7 = t14 + t10;
+    t6 = t12 - t9;
+    t3 = C40 * t6;
+    t13 = t14 - t10;
+    t12 = C40 * t13;
+    t9 = C41 * t1;
+    t6 = t4 - t9;
+    t14 = C41 * t7;
+    t10 = t2 - t14;
+    t13 = t6 + t3;
+    t9 = t10 + t12;
+    t14 = t6 - t3;
+    t6 = t10 - t12;
+    t3 = C42 * t11;
+    t10 = C43 * t8;
+    t12 = t3 + t10;
+    t3 = C42 * t0;
+    t10 = C43 * t5;
+    t3 = t3 + t10;
+    t10 = C43 * t11;
+    t11 = C42 * t8;
+    t8 = t10 - t11;
+    t10 = C43 * t0;
+    t11 = C42 * t5;
+    t0 = t10 - t11;
+    t5 = t4 + t1;
+    t10 = t2 + t7;
+    t11 = t13 + t3;
+    t4 = t9 - t12;
+    t1 = t14 + t0;
+    t2 = t6 - t8;
+    t7 = t14 - t0;
+    t14 = t6 + t8;
+    t0 = t13 - t3;
+    t6 = t9 + t12;
+    re[100] = t5;
+    im[100] = t10;
+    re[136] = t11;
+    im[136] = t4;
+    re[172] = t1;
+    im[172] = t2;
+    re[28] = t7;
+    im[28] = t14;
+    re[64] = t0;
+    im[64] = t6;
+    t8 = re[160];
+    t13 = im[160];
+    t3 = re[16];
+    t9 = im[16];
+    t12 = re[52];
+    t5 = im[52];
+    t10 = re[88];
+    t11 = im[88];
+    t4 = re[124];
+    t1 = im[124];
+    t2 = t3 + t4;
+    t7 = t9 + t1;
+    t14 = t12 + t10;
+    t0 = t5 + t11;
+    t6 = t3 - t4;
+    t3 = t9 - t1;
+    t4 = t12 - t10;
+    t9 = t5 - t11;
+    t1 = t2 + t14;
+    t12 = t7 + t0;
+    t10 = t2 - t14;
+    t5 = C40 * t10;
+    t11 = t7 - t0;
+    t2 = C40 * t11;
+    t14 = C41 * t1;
+    t10 = t8 - t14;
+    t7 = C41 * t12;
+    t0 = t13 - t7;
+    t11 = t10 + t5;
+    t14 = t0 + t2;
+    t7 = t10 - t5;
+    t10 = t0 - t2;
+    t5 = C42 * t6;
+    t0 = C43 * t4;
+    t2 = t5 + t0;
+    t5 = C42 * t3;
+    t0 = C43 * t9;
+    t5 = t5 + t0;
+    t0 = C43 * t6;
+    t6 = C42 * t4;
+    t4 = t0 - t6;
+    t0 = C43 * t3;
+    t6 = C42 * t9;
+    t3 = t0 - t6;
+    t9 = t8 + t1;
+    t0 = t13 + t12;
+    t6 = t11 + t5;
+    t8 = t14 - t2;
+    t1 = t7 + t3;
+    t13 = t10 - t4;
+    t12 = t7 - t3;
+    t7 = t10 + t4;
+    t3 = t11 - t5;
+    t10 = t14 + t2;
+    re[160] = t9;
+    im[160] = t0;
+    re[16] = t6;
+    im[16] = t8;
+    re[52] = t1;
+    im[52] = t13;
+    re[88] = t12;
+    im[88] = t7;
+    re[124] = t3;
+    im[124] = t10;
+}
+
+/**
+ *  Part 2 of ApplyWindowedIMDCT_W75_360_K60().
+ * 
+ *  @param {Number[]} X 
+ *    - The input block (360 points, only the first 60 points are used).
+ *  @param {Number[]} y 
+ *    - The array that would contain the output block (720 points).
+ *  @param {Number[]} re 
+ *    - The scratch buffer (real part, 180 points).
+ *  @param {Number[]} im 
+ *    - The scratch buffer (imaginary part, 180 points).
+ */
+function ApplyWindowedIMDCT_W75_360_K60_Part2(X, y, re, im) {
+    let t0, t1, t10, t11, t12, t13, t14, t2, t3, t4, t5, t6, t7, t8, t9;
+    const C0 = 0.766044443118978;
+    const C1 = 1.4088320528055172;
+    const C2 = 0.12325683343243876;
+    const C3 = 0.17364817766693033;
+    const C4 = 1.1584559306791384;
+    const C5 = 0.8111595753452777;
+    const C6 = 0.9396926207859084;
+    const C7 = 0.5976724774602398;
+    const C8 = 1.281712764111577;
+    const C9 = 0.5;
+    const C10 = 0.8660254037844386;
+    const C11 = 0.5590169943749475;
+    const C12 = 0.25;
+    const C13 = 0.9510565162951535;
+    const C14 = 0.5877852522924731;
+    t4 = X[29];
+    t11 = 0.9914448613738104 * t4;
+    t5 = 0.13052619222005157 * t4;
+    t14 = 0.4957224306869052 * t4;
+    t2 = -t14;
+    t9 = 0.06526309611002579 * t4;
+    t0 = -t9;
+    t6 = (-0.8586164364012608) * t4;
+    t8 = (-0.11303899832181541) * t4;
+    t1 = t8 - t14;
+    t13 = t0 - t6;
+    t12 = t2 - t8;
+    t7 = t6 - t9;
+    re[45] = t11;
+    im[45] = t5;
+    re[105] = t1;
+    im[105] = t13;
+    re[165] = t12;
+    im[165] = t7;
+    t3 = X[10];
+    t10 = 0.9990482215818578 * t3;
+    t4 = (-0.043619387365336) * t3;
+    t14 = 0.4995241107909289 * t3;
+    t0 = -t14;
+    t2 = (-0.021809693682668) * t3;
+    t8 = -t2;
+    t6 = (-0.8652011394955537) * t3;
+    t9 = 0.037775497555894946 * t3;
+    t11 = t9 - t14;
+    t5 = t8 - t6;
+    t1 = t0 - t9;
+    t13 = t6 - t2;
+    t12 = t11 + t5;
+    t7 = C0 * t12;
+    t3 = t11 * (-C1);
+    t14 = t5 * C2;
+    t8 = t7 - t14;
+    t0 = t7 + t3;
+    t9 = t1 + t13;
+    t6 = C3 * t9;
+    t2 = t1 * (-C4);
+    t12 = t13 * (-C5);
+    t11 = t6 - t12;
+    t5 = t6 + t2;
+    re[65] = t10;
+    im[65] = t4;
+    re[125] = t8;
+    im[125] = t0;
+    re[5] = t11;
+    im[5] = t5;
+    t14 = X[50];
+    t7 = 0.9762960071199334 * t14;
+    t3 = (-0.21643961393810288) * t14;
+    t9 = 0.4881480035599667 * t14;
+    t1 = -t9;
+    t13 = (-0.10821980696905144) * t14;
+    t12 = -t13;
+    t6 = (-0.8454971437791754) * t14;
+    t2 = 0.18744220405569353 * t14;
+    t10 = t2 - t9;
+    t4 = t12 - t6;
+    t8 = t1 - t2;
+    t0 = t6 - t13;
+    t11 = t10 + t4;
+    t5 = C3 * t11;
+    t14 = t10 * (-C4);
+    t9 = t4 * (-C5);
+    t12 = t5 - t9;
+    t1 = t5 + t14;
+    t2 = t8 + t0;
+    t6 = (-C6) * t2;
+    t13 = t8 * C7;
+    t11 = t0 * (-C8);
+    t10 = t6 - t11;
+    t4 = t6 + t13;
+    re[85] = t7;
+    im[85] = t3;
+    re[145] = t12;
+    im[145] = t1;
+    re[25] = t10;
+    im[25] = t4;
+    t9 = re[45];
+    t5 = im[45];
+    t14 = re[65];
+    t2 = im[65];
+    t8 = re[85];
+    t0 = im[85];
+    t11 = t14 + t8;
+    t6 = t2 + t0;
+    t13 = C9 * t11;
+    t7 = t9 - t13;
+    t3 = C9 * t6;
+    t12 = t5 - t3;
+    t1 = t14 - t8;
+    t10 = C10 * t1;
+    t4 = t2 - t0;
+    t13 = C10 * t4;
+    t3 = t9 + t11;
+    t14 = t5 + t6;
+    t8 = t7 + t13;
+    t1 = t12 - t10;
+    t2 = t7 - t13;
+    t0 = t12 + t10;
+    re[45] = t3;
+    im[45] = t14;
+    re[65] = t8;
+    im[65] = t1;
+    re[85] = t2;
+    im[85] = t0;
+    t4 = re[105];
+    t9 = im[105];
+    t11 = re[125];
+    t5 = im[125];
+    t6 = re[145];
+    t7 = im[145];
+    t13 = t11 + t6;
+    t12 = t5 + t7;
+    t10 = C9 * t13;
+    t3 = t4 - t10;
+    t14 = C9 * t12;
+    t8 = t9 - t14;
+    t1 = t11 - t6;
+    t2 = C10 * t1;
+    t0 = t5 - t7;
+    t10 = C10 * t0;
+    t14 = t4 + t13;
+    t11 = t9 + t12;
+    t6 = t3 + t10;
+    t1 = t8 - t2;
+    t5 = t3 - t10;
+    t7 = t8 + t2;
+    re[105] = t14;
+    im[105] = t11;
+    re[125] = t6;
+    im[125] = t1;
+    re[145] = t5;
+    im[145] = t7;
+    t0 = re[165];
+    t4 = im[165];
+    t13 = re[5];
+    t9 = im[5];
+    t12 = re[25];
+    t3 = im[25];
+    t10 = t13 + t12;
+    t8 = t9 + t3;
+    t2 = C9 * t10;
+    t14 = t0 - t2;
+    t11 = C9 * t8;
+    t6 = t4 - t11;
+    t1 = t13 - t12;
+    t5 = C10 * t1;
+    t7 = t9 - t3;
+    t2 = C10 * t7;
+    t11 = t0 + t10;
+    t13 = t4 + t8;
+    t12 = t14 + t2;
+    t1 = t6 - t5;
+    t9 = t14 - t2;
+    t3 = t6 + t5;
+    re[165] = t11;
+    im[165] = t13;
+    re[5] = t12;
+    im[5] = t1;
+    re[25] = t9;
+    im[25] = t3;
+    t7 = X[42];
+    t0 = 0.9832549075639546 * t7;
+    t10 = (-0.18223552549214747) * t7;
+    t4 = 0.4916274537819773 * t7;
+    t8 = -t4;
+    t14 = (-0.09111776274607374) * t7;
+    t2 = -t14;
+    t6 = (-0.8515237283461047) * t7;
+    t5 = 0.15782059454820638 * t7;
+    t11 = t5 - t4;
+    t13 = t2 - t6;
+    t12 = t8 - t5;
+    t1 = t6 - t14;
+    re[81] = t0;
+    im[81] = t10;
+    re[141] = t11;
+    im[141] = t13;
+    re[21] = t12;
+    im[21] = t1;
+    t9 = X[37];
+    t3 = 0.9862856015372314 * t9;
+    t7 = 0.16504760586067765 * t9;
+    t4 = 0.4931428007686157 * t9;
+    t2 = -t4;
+    t8 = 0.08252380293033883 * t9;
+    t5 = -t8;
+    t6 = 0.8541483863180588 * t9;
+    t14 = 0.14293541950914823 * t9;
+    t0 = t14 - t4;
+    t10 = t5 - t6;
+    t11 = t2 - t14;
+    t13 = t6 - t8;
+    t12 = t0 + t10;
+    t1 = C0 * t12;
+    t9 = t0 * (-C1);
+    t4 = t10 * C2;
+    t5 = t1 - t4;
+    t2 = t1 + t9;
+    t14 = t11 + t13;
+    t6 = C3 * t14;
+    t8 = t11 * (-C4);
+    t12 = t13 * (-C5);
+    t0 = t6 - t12;
+    t10 = t6 + t8;
+    re[101] = t3;
+    im[101] = t7;
+    re[161] = t5;
+    im[161] = t2;
+    re[41] = t0;
+    im[41] = t10;
+    t4 = X[2];
+    t1 = 0.9999619230641713 * t4;
+    t9 = (-0.008726535498373935) * t4;
+    t14 = 0.49998096153208565 * t4;
+    t11 = -t14;
+    t13 = (-0.004363267749186967) * t4;
+    t12 = -t13;
+    t6 = 0.8659924281907126 * t4;
+    t8 = (-0.0075574014286185235) * t4;
+    t3 = t8 - t14;
+    t7 = t12 - t6;
+    t5 = t11 - t8;
+    t2 = t6 - t13;
+    t0 = t3 + t7;
+    t10 = C3 * t0;
+    t4 = t3 * (-C4);
+    t14 = t7 * (-C5);
+    t12 = t10 - t14;
+    t11 = t10 + t4;
+    t8 = t5 + t2;
+    t6 = (-C6) * t8;
+    t13 = t5 * C7;
+    t0 = t2 * (-C8);
+    t3 = t6 - t0;
+    t7 = t6 + t13;
+    re[121] = t1;
+    im[121] = t9;
+    re[1] = t12;
+    im[1] = t11;
+    re[61] = t3;
+    im[61] = t7;
+    t14 = re[81];
+    t10 = im[81];
+    t4 = re[101];
+    t8 = im[101];
+    t5 = re[121];
+    t2 = im[121];
+    t0 = t4 + t5;
+    t6 = t8 + t2;
+    t13 = C9 * t0;
+    t1 = t14 - t13;
+    t9 = C9 * t6;
+    t12 = t10 - t9;
+    t11 = t4 - t5;
+    t3 = C10 * t11;
+    t7 = t8 - t2;
+    t13 = C10 * t7;
+    t9 = t14 + t0;
+    t4 = t10 + t6;
+    t5 = t1 + t13;
+    t11 = t12 - t3;
+    t8 = t1 - t13;
+    t2 = t12 + t3;
+    re[81] = t9;
+    im[81] = t4;
+    re[101] = t5;
+    im[101] = t11;
+    re[121] = t8;
+    im[121] = t2;
+    t7 = re[141];
+    t14 = im[141];
+    t0 = re[161];
+    t10 = im[161];
+    t6 = re[1];
+    t1 = im[1];
+    t13 = t0 + t6;
+    t12 = t10 + t1;
+    t3 = C9 * t13;
+    t9 = t7 - t3;
+    t4 = C9 * t12;
+    t5 = t14 - t4;
+    t11 = t0 - t6;
+    t8 = C10 * t11;
+    t2 = t10 - t1;
+    t3 = C10 * t2;
+    t4 = t7 + t13;
+    t0 = t14 + t12;
+    t6 = t9 + t3;
+    t11 = t5 - t8;
+    t10 = t9 - t3;
+    t1 = t5 + t8;
+    re[141] = t4;
+    im[141] = t0;
+    re[161] = t6;
+    im[161] = t11;
+    re[1] = t10;
+    im[1] = t1;
+    t2 = re[21];
+    t7 = im[21];
+    t13 = re[41];
+    t14 = im[41];
+    t12 = re[61];
+    t9 = im[61];
+    t3 = t13 + t12;
+    t5 = t14 + t9;
+    t8 = C9 * t3;
+    t4 = t2 - t8;
+    t0 = C9 * t5;
+    t6 = t7 - t0;
+    t11 = t13 - t12;
+    t10 = C10 * t11;
+    t1 = t14 - t9;
+    t8 = C10 * t1;
+    t0 = t2 + t3;
+    t13 = t7 + t5;
+    t12 = t4 + t8;
+    t11 = t6 - t10;
+    t14 = t4 - t8;
+    t9 = t6 + t10;
+    re[21] = t0;
+    im[21] = t13;
+    re[41] = t12;
+    im[41] = t11;
+    re[61] = t14;
+    im[61] = t9;
+    t1 = X[5];
+    t2 = 0.9996573249755573 * t1;
+    t3 = 0.02617694830787315 * t1;
+    t7 = 0.49982866248777863 * t1;
+    t5 = -t7;
+    t4 = 0.013088474153936575 * t1;
+    t8 = -t4;
+    t6 = 0.8657286385080287 * t1;
+    t10 = 0.02266990222817022 * t1;
+    t0 = t10 - t7;
+    t13 = t8 - t6;
+    t12 = t5 - t10;
+    t11 = t6 - t4;
+    re[117] = t2;
+    im[117] = t3;
+    re[177] = t0;
+    im[177] = t13;
+    re[57] = t12;
+    im[57] = t11;
+    t14 = X[34];
+    t9 = 0.9890158633619168 * t14;
+    t1 = (-0.1478094111296106) * t14;
+    t7 = 0.4945079316809584 * t14;
+    t8 = -t7;
+    t5 = (-0.0739047055648053) * t14;
+    t10 = -t5;
+    t6 = 0.8565128624172191 * t14;
+    t4 = (-0.1280067049566611) * t14;
+    t2 = t4 - t7;
+    t3 = t10 - t6;
+    t0 = t8 - t4;
+    t13 = t6 - t5;
+    t12 = t2 + t3;
+    t11 = C0 * t12;
+    t14 = t2 * (-C1);
+    t7 = t3 * C2;
+    t10 = t11 - t7;
+    t8 = t11 + t14;
+    t4 = t0 + t13;
+    t6 = C3 * t4;
+    t5 = t0 * (-C4);
+    t12 = t13 * (-C5);
+    t2 = t6 - t12;
+    t3 = t6 + t5;
+    re[137] = t9;
+    im[137] = t1;
+    re[17] = t10;
+    im[17] = t8;
+    re[77] = t2;
+    im[77] = t3;
+    t7 = X[45];
+    t11 = 0.9799247046208296 * t7;
+    t14 = 0.19936793441719716 * t7;
+    t4 = t11 + t14;
+    t0 = C3 * t4;
+    t13 = (-1.135199585687003) * t7;
+    t12 = (-0.16171920901931883) * t7;
+    t6 = t0 - t12;
+    t5 = t0 + t13;
+    t9 = (-C6) * t4;
+    t1 = 0.5856740259352249 * t7;
+    t10 = (-0.2555324262970814) * t7;
+    t8 = t9 - t10;
+    t2 = t9 + t1;
+    re[157] = t11;
+    im[157] = t14;
+    re[37] = t6;
+    im[37] = t5;
+    re[97] = t8;
+    im[97] = t2;
+    t3 = re[117];
+    t12 = im[117];
+    t0 = re[137];
+    t13 = im[137];
+    t4 = re[157];
+    t7 = im[157];
+    t10 = t0 + t4;
+    t9 = t13 + t7;
+    t1 = C9 * t10;
+    t11 = t3 - t1;
+    t14 = C9 * t9;
+    t6 = t12 - t14;
+    t5 = t0 - t4;
+    t8 = C10 * t5;
+    t2 = t13 - t7;
+    t1 = C10 * t2;
+    t14 = t3 + t10;
+    t0 = t12 + t9;
+    t4 = t11 + t1;
+    t5 = t6 - t8;
+    t13 = t11 - t1;
+    t7 = t6 + t8;
+    re[117] = t14;
+    im[117] = t0;
+    re[137] = t4;
+    im[137] = t5;
+    re[157] = t13;
+    im[157] = t7;
+    t2 = re[177];
+    t3 = im[177];
+    t10 = re[17];
+    t12 = im[17];
+    t9 = re[37];
+    t11 = im[37];
+    t1 = t10 + t9;
+    t6 = t12 + t11;
+    t8 = C9 * t1;
+    t14 = t2 - t8;
+    t0 = C9 * t6;
+    t4 = t3 - t0;
+    t5 = t10 - t9;
+    t13 = C10 * t5;
+    t7 = t12 - t11;
+    t8 = C10 * t7;
+    t0 = t2 + t1;
+    t10 = t3 + t6;
+    t9 = t14 + t8;
+    t5 = t4 - t13;
+    t12 = t14 - t8;
+    t11 = t4 + t13;
+    re[177] = t0;
+    im[177] = t10;
+    re[17] = t9;
+    im[17] = t5;
+    re[37] = t12;
+    im[37] = t11;
+    t7 = re[57];
+    t2 = im[57];
+    t1 = re[77];
+    t3 = im[77];
+    t6 = re[97];
+    t14 = im[97];
+    t8 = t1 + t6;
+    t4 = t3 + t14;
+    t13 = C9 * t8;
+    t0 = t7 - t13;
+    t10 = C9 * t4;
+    t9 = t2 - t10;
+    t5 = t1 - t6;
+    t12 = C10 * t5;
+    t11 = t3 - t14;
+    t13 = C10 * t11;
+    t10 = t7 + t8;
+    t1 = t2 + t4;
+    t6 = t0 + t13;
+    t5 = t9 - t12;
+    t3 = t0 - t13;
+    t14 = t9 + t12;
+    re[57] = t10;
+    im[57] = t1;
+    re[77] = t6;
+    im[77] = t5;
+    re[97] = t3;
+    im[97] = t14;
+    t11 = X[53];
+    t7 = 0.9723699203976766 * t11;
+    t8 = 0.2334453638559054 * t11;
+    re[153] = t7;
+    im[153] = t8;
+    re[33] = t7;
+    im[33] = t8;
+    re[93] = t7;
+    im[93] = t8;
+    t2 = X[13];
+    t4 = 0.9981347984218669 * t2;
+    t0 = 0.06104853953485687 * t2;
+    t13 = t4 + t0;
+    t9 = C0 * t13;
+    t12 = (-1.4062042970372999) * t2;
+    t10 = 0.007524649668741506 * t2;
+    t1 = t9 - t10;
+    t6 = t9 + t12;
+    t5 = C3 * t13;
+    t3 = (-1.1562951768490382) * t2;
+    t14 = (-0.0495201074045439) * t2;
+    t11 = t5 - t14;
+    t7 = t5 + t3;
+    re[173] = t4;
+    im[173] = t0;
+    re[53] = t1;
+    im[53] = t6;
+    re[113] = t11;
+    im[113] = t7;
+    t8 = X[26];
+    t10 = 0.9935718556765875 * t8;
+    t9 = (-0.11320321376790671) * t8;
+    t12 = t10 + t9;
+    t13 = C3 * t12;
+    t2 = (-1.1510092087644197) * t8;
+    t14 = 0.0918258708076959 * t8;
+    t5 = t13 - t14;
+    t3 = t13 + t2;
+    t4 = (-C6) * t12;
+    t0 = 0.5938305525169938 * t8;
+    t1 = 0.14509400402477746 * t8;
+    t6 = t4 - t1;
+    t11 = t4 + t0;
+    re[13] = t10;
+    im[13] = t9;
+    re[73] = t5;
+    im[73] = t3;
+    re[133] = t6;
+    im[133] = t11;
+    t7 = re[153];
+    t14 = im[153];
+    t13 = re[173];
+    t2 = im[173];
+    t12 = re[13];
+    t8 = im[13];
+    t1 = t13 + t12;
+    t4 = t2 + t8;
+    t0 = C9 * t1;
+    t10 = t7 - t0;
+    t9 = C9 * t4;
+    t5 = t14 - t9;
+    t3 = t13 - t12;
+    t6 = C10 * t3;
+    t11 = t2 - t8;
+    t0 = C10 * t11;
+    t9 = t7 + t1;
+    t13 = t14 + t4;
+    t12 = t10 + t0;
+    t3 = t5 - t6;
+    t2 = t10 - t0;
+    t8 = t5 + t6;
+    re[153] = t9;
+    im[153] = t13;
+    re[173] = t12;
+    im[173] = t3;
+    re[13] = t2;
+    im[13] = t8;
+    t11 = re[33];
+    t7 = im[33];
+    t1 = re[53];
+    t14 = im[53];
+    t4 = re[73];
+    t10 = im[73];
+    t0 = t1 + t4;
+    t5 = t14 + t10;
+    t6 = C9 * t0;
+    t9 = t11 - t6;
+    t13 = C9 * t5;
+    t12 = t7 - t13;
+    t3 = t1 - t4;
+    t2 = C10 * t3;
+    t8 = t14 - t10;
+    t6 = C10 * t8;
+    t13 = t11 + t0;
+    t1 = t7 + t5;
+    t4 = t9 + t6;
+    t3 = t12 - t2;
+    t14 = t9 - t6;
+    t10 = t12 + t2;
+    re[33] = t13;
+    im[33] = t1;
+    re[53] = t4;
+    im[53] = t3;
+    re[73] = t14;
+    im[73] = t10;
+    t8 = re[93];
+    t11 = im[93];
+    t0 = re[113];
+    t7 = im[113];
+    t5 = re[133];
+    t9 = im[133];
+    t6 = t0 + t5;
+    t12 = t7 + t9;
+    t2 = C9 * t6;
+    t13 = t8 - t2;
+    t1 = C9 * t12;
+    t4 = t11 - t1;
+    t3 = t0 - t5;
+    t14 = C10 * t3;
+    t10 = t7 - t9;
+    t2 = C10 * t10;
+    t1 = t8 + t6;
+    t0 = t11 + t12;
+    t5 = t13 + t2;
+    t3 = t4 - t14;
+    t7 = t13 - t2;
+    t9 = t4 + t14;
+    re[93] = t1;
+    im[93] = t0;
+    re[113] = t5;
+    im[113] = t3;
+    re[133] = t7;
+    im[133] = t9;
+    t10 = X[18];
+    t8 = 0.996917333733128 * t10;
+    t6 = (-0.07845909572784494) * t10;
+    re[9] = t8;
+    im[9] = t6;
+    re[69] = t8;
+    im[69] = t6;
+    re[129] = t8;
+    im[129] = t6;
+    t11 = X[58];
+    t12 = 0.9681476403781077 * t11;
+    t13 = (-0.25038000405444144) * t11;
+    t2 = t12 + t13;
+    t4 = C0 * t2;
+    t14 = (-1.363957427612707) * t11;
+    t1 = (-0.030861046454551632) * t11;
+    t0 = t4 - t1;
+    t5 = t4 + t14;
+    t3 = C3 * t2;
+    t7 = (-1.1215563757690326) * t11;
+    t9 = 0.20309813776374963 * t11;
+    t10 = t3 - t9;
+    t8 = t3 + t7;
+    re[29] = t12;
+    im[29] = t13;
+    re[89] = t0;
+    im[89] = t5;
+    re[149] = t10;
+    im[149] = t8;
+    t6 = X[21];
+    t1 = 0.9953961983671789 * t6;
+    t4 = 0.09584575252022398 * t6;
+    t14 = 0.4976980991835894 * t6;
+    t2 = -t14;
+    t11 = 0.04792287626011199 * t6;
+    t9 = -t11;
+    t3 = (-0.8620383946164312) * t6;
+    t7 = (-0.08300485652735035) * t6;
+    t12 = t7 - t14;
+    t13 = t9 - t3;
+    t0 = t2 - t7;
+    t5 = t3 - t11;
+    t10 = t12 + t13;
+    t8 = C3 * t10;
+    t6 = t12 * (-C4);
+    t14 = t13 * (-C5);
+    t9 = t8 - t14;
+    t2 = t8 + t6;
+    t7 = t0 + t5;
+    t3 = (-C6) * t7;
+    t11 = t0 * C7;
+    t10 = t5 * (-C8);
+    t12 = t3 - t10;
+    t13 = t3 + t11;
+    re[49] = t1;
+    im[49] = t4;
+    re[109] = t9;
+    im[109] = t2;
+    re[169] = t12;
+    im[169] = t13;
+    t14 = re[9];
+    t8 = im[9];
+    t6 = re[29];
+    t7 = im[29];
+    t0 = re[49];
+    t5 = im[49];
+    t10 = t6 + t0;
+    t3 = t7 + t5;
+    t11 = C9 * t10;
+    t1 = t14 - t11;
+    t4 = C9 * t3;
+    t9 = t8 - t4;
+    t2 = t6 - t0;
+    t12 = C10 * t2;
+    t13 = t7 - t5;
+    t11 = C10 * t13;
+    t4 = t14 + t10;
+    t6 = t8 + t3;
+    t0 = t1 + t11;
+    t2 = t9 - t12;
+    t7 = t1 - t11;
+    t5 = t9 + t12;
+    re[9] = t4;
+    im[9] = t6;
+    re[29] = t0;
+    im[29] = t2;
+    re[49] = t7;
+    im[49] = t5;
+    t13 = re[69];
+    t14 = im[69];
+    t10 = re[89];
+    t8 = im[89];
+    t3 = re[109];
+    t1 = im[109];
+    t11 = t10 + t3;
+    t9 = t8 + t1;
+    t12 = C9 * t11;
+    t4 = t13 - t12;
+    t6 = C9 * t9;
+    t0 = t14 - t6;
+    t2 = t10 - t3;
+    t7 = C10 * t2;
+    t5 = t8 - t1;
+    t12 = C10 * t5;
+    t6 = t13 + t11;
+    t10 = t14 + t9;
+    t3 = t4 + t12;
+    t2 = t0 - t7;
+    t8 = t4 - t12;
+    t1 = t0 + t7;
+    re[69] = t6;
+    im[69] = t10;
+    re[89] = t3;
+    im[89] = t2;
+    re[109] = t8;
+    im[109] = t1;
+    t5 = re[129];
+    t13 = im[129];
+    t11 = re[149];
+    t14 = im[149];
+    t9 = re[169];
+    t4 = im[169];
+    t12 = t11 + t9;
+    t0 = t14 + t4;
+    t7 = C9 * t12;
+    t6 = t5 - t7;
+    t10 = C9 * t0;
+    t3 = t13 - t10;
+    t2 = t11 - t9;
+    t8 = C10 * t2;
+    t1 = t14 - t4;
+    t7 = C10 * t1;
+    t10 = t5 + t12;
+    t11 = t13 + t0;
+    t9 = t6 + t7;
+    t2 = t3 - t8;
+    t14 = t6 - t7;
+    t4 = t3 + t8;
+    re[129] = t10;
+    im[129] = t11;
+    re[149] = t9;
+    im[149] = t2;
+    re[169] = t14;
+    im[169] = t4;
+    t1 = re[45];
+    t5 = im[45];
+    t12 = re[81];
+    t13 = im[81];
+    t0 = re[117];
+    t6 = im[117];
+    t7 = re[153];
+    t3 = im[153];
+    t8 = re[9];
+    t10 = im[9];
+    t11 = t12 + t8;
+    t9 = t13 + t10;
+    t2 = t0 + t7;
+    t14 = t6 + t3;
+    t4 = t12 - t8;
+    t12 = t13 - t10;
+    t8 = t0 - t7;
+    t13 = t6 - t3;
+    t10 = t11 + t2;
+    t0 = t9 + t14;
+    t7 = t11 - t2;
+    t6 = C11 * t7;
+    t3 = t9 - t14;
+    t11 = C11 * t3;
+    t2 = C12 * t10;
+    t7 = t1 - t2;
+    t9 = C12 * t0;
+    t14 = t5 - t9;
+    t3 = t7 + t6;
+    t2 = t14 + t11;
+    t9 = t7 - t6;
+    t7 = t14 - t11;
+    t6 = C13 * t4;
+    t14 = C14 * t8;
+    t11 = t6 + t14;
+    t6 = C13 * t12;
+    t14 = C14 * t13;
+    t6 = t6 + t14;
+    t14 = C14 * t4;
+    t4 = C13 * t8;
+    t8 = t14 - t4;
+    t14 = C14 * t12;
+    t4 = C13 * t13;
+    t12 = t14 - t4;
+    t13 = t1 + t10;
+    t14 = t5 + t0;
+    t4 = t3 + t6;
+    t1 = t2 - t11;
+    t10 = t9 + t12;
+    t5 = t7 - t8;
+    t0 = t9 - t12;
+    t9 = t7 + t8;
+    t12 = t3 - t6;
+    t7 = t2 + t11;
+    re[45] = t13;
+    im[45] = t14;
+    re[81] = t4;
+    im[81] = t1;
+    re[117] = t10;
+    im[117] = t5;
+    re[153] = t0;
+    im[153] = t9;
+    re[9] = t12;
+    im[9] = t7;
+    t8 = re[105];
+    t3 = im[105];
+    t6 = re[141];
+    t2 = im[141];
+    t11 = re[177];
+    t13 = im[177];
+    t14 = re[33];
+    t4 = im[33];
+    t1 = re[69];
+    t10 = im[69];
+    t5 = t6 + t1;
+    t0 = t2 + t10;
+    t9 = t11 + t14;
+    t12 = t13 + t4;
+    t7 = t6 - t1;
+    t6 = t2 - t10;
+    t1 = t11 - t14;
+    t2 = t13 - t4;
+    t10 = t5 + t9;
+    t11 = t0 + t12;
+    t14 = t5 - t9;
+    t13 = C11 * t14;
+    t4 = t0 - t12;
+    t5 = C11 * t4;
+    t9 = C12 * t10;
+    t14 = t8 - t9;
+    t0 = C12 * t11;
+    t12 = t3 - t0;
+    t4 = t14 + t13;
+    t9 = t12 + t5;
+    t0 = t14 - t13;
+    t14 = t12 - t5;
+    t13 = C13 * t7;
+    t12 = C14 * t1;
+    t5 = t13 + t12;
+    t13 = C13 * t6;
+    t12 = C14 * t2;
+    t13 = t13 + t12;
+    t12 = C14 * t7;
+    t7 = C13 * t1;
+    t1 = t12 - t7;
+    t12 = C14 * t6;
+    t7 = C13 * t2;
+    t6 = t12 - t7;
+    t2 = t8 + t10;
+    t12 = t3 + t11;
+    t7 = t4 + t13;
+    t8 = t9 - t5;
+    t10 = t0 + t6;
+    t3 = t14 - t1;
+    t11 = t0 - t6;
+    t0 = t14 + t1;
+    t6 = t4 - t13;
+    t14 = t9 + t5;
+    re[105] = t2;
+    im[105] = t12;
+    re[141] = t7;
+    im[141] = t8;
+    re[177] = t10;
+    im[177] = t3;
+    re[33] = t11;
+    im[33] = t0;
+    re[69] = t6;
+    im[69] = t14;
+    t1 = re[165];
+    t4 = im[165];
+    t13 = re[21];
+    t9 = im[21];
+    t5 = re[57];
+    t2 = im[57];
+    t12 = re[93];
+    t7 = im[93];
+    t8 = re[129];
+    t10 = im[129];
+    t3 = t13 + t8;
+    t11 = t9 + t10;
+    t0 = t5 + t12;
+    t6 = t2 + t7;
+    t14 = t13 - t8;
+    t13 = t9 - t10;
+    t8 = t5 - t12;
+    t9 = t2 - t7;
+    t10 = t3 + t0;
+    t5 = t11 + t6;
+    t12 = t3 - t0;
+    t2 = C11 * t12;
+    t7 = t11 - t6;
+    t3 = C11 * t7;
+    t0 = C12 * t10;
+    t12 = t1 - t0;
+    t11 = C12 * t5;
+    t6 = t4 - t11;
+    t7 = t12 + t2;
+    t0 = t6 + t3;
+    t11 = t12 - t2;
+    t12 = t6 - t3;
+    t2 = C13 * t14;
+    t6 = C14 * t8;
+    t3 = t2 + t6;
+    t2 = C13 * t13;
+    t6 = C14 * t9;
+    t2 = t2 + t6;
+    t6 = C14 * t14;
+    t14 = C13 * t8;
+    t8 = t6 - t14;
+    t6 = C14 * t13;
+    t14 = C13 * t9;
+    t13 = t6 - t14;
+    t9 = t1 + t10;
+    t6 = t4 + t5;
+    t14 = t7 + t2;
+    t1 = t0 - t3;
+    t10 = t11 + t13;
+    t4 = t12 - t8;
+    t5 = t11 - t13;
+    t11 = t12 + t8;
+    t13 = t7 - t2;
+    t12 = t0 + t3;
+    re[165] = t9;
+    im[165] = t6;
+    re[21] = t14;
+    im[21] = t1;
+    re[57] = t10;
+    im[57] = t4;
+    re[93] = t5;
+    im[93] = t11;
+    re[129] = t13;
+    im[129] = t12;
+    t8 = re[65];
+    t7 = im[65];
+    t2 = re[101];
+    t0 = im[101];
+    t3 = re[137];
+    t9 = im[137];
+    t6 = re[173];
+    t14 = im[173];
+    t1 = re[29];
+    t10 = im[29];
+    t4 = t2 + t1;
+    t5 = t0 + t10;
+    t11 = t3 + t6;
+    t13 = t9 + t14;
+    t12 = t2 - t1;
+    t2 = t0 - t10;
+    t1 = t3 - t6;
+    t0 = t9 - t14;
+    t10 = t4 + t11;
+    t3 = t5 + t13;
+    t6 = t4 - t11;
+    t9 = C11 * t6;
+    t14 = t5 - t13;
+    t4 = C11 * t14;
+    t11 = C12 * t10;
+    t6 = t8 - t11;
+    t5 = C12 * t3;
+    t13 = t7 - t5;
+    t14 = t6 + t9;
+    t11 = t13 + t4;
+    t5 = t6 - t9;
+    t6 = t13 - t4;
+    t9 = C13 * t12;
+    t13 = C14 * t1;
+    t4 = t9 + t13;
+    t9 = C13 * t2;
+    t13 = C14 * t0;
+    t9 = t9 + t13;
+    t13 = C14 * t12;
+    t12 = C13 * t1;
+    t1 = t13 - t12;
+    t13 = C14 * t2;
+    t12 = C13 * t0;
+    t2 = t13 - t12;
+    t0 = t8 + t10;
+    t13 = t7 + t3;
+    t12 = t14 + t9;
+    t8 = t11 - t4;
+    t10 = t5 + t2;
+    t7 = t6 - t1;
+    t3 = t5 - t2;
+    t5 = t6 + t1;
+    t2 = t14 - t9;
+    t6 = t11 + t4;
+    re[65] = t0;
+    im[65] = t13;
+    re[101] = t12;
+    im[101] = t8;
+    re[137] = t10;
+    im[137] = t7;
+    re[173] = t3;
+    im[173] = t5;
+    re[29] = t2;
+    im[29] = t6;
+    t1 = re[125];
+    t14 = im[125];
+    t9 = re[161];
+    t11 = im[161];
+    t4 = re[17];
+    t0 = im[17];
+    t13 = re[53];
+    t12 = im[53];
+    t8 = re[89];
+    t10 = im[89];
+    t7 = t9 + t8;
+    t3 = t11 + t10;
+    t5 = t4 + t13;
+    t2 = t0 + t12;
+    t6 = t9 - t8;
+    t9 = t11 - t10;
+    t8 = t4 - t13;
+    t11 = t0 - t12;
+    t10 = t7 + t5;
+    t4 = t3 + t2;
+    t13 = t7 - t5;
+    t0 = C11 * t13;
+    t12 = t3 - t2;
+    t7 = C11 * t12;
+    t5 = C12 * t10;
+    t13 = t1 - t5;
+    t3 = C12 * t4;
+    t2 = t14 - t3;
+    t12 = t13 + t0;
+    t5 = t2 + t7;
+    t3 = t13 - t0;
+    t13 = t2 - t7;
+    t0 = C13 * t6;
+    t2 = C14 * t8;
+    t7 = t0 + t2;
+    t0 = C13 * t9;
+    t2 = C14 * t11;
+    t0 = t0 + t2;
+    t2 = C14 * t6;
+    t6 = C13 * t8;
+    t8 = t2 - t6;
+    t2 = C14 * t9;
+    t6 = C13 * t11;
+    t9 = t2 - t6;
+    t11 = t1 + t10;
+    t2 = t14 + t4;
+    t6 = t12 + t0;
+    t1 = t5 - t7;
+    t10 = t3 + t9;
+    t14 = t13 - t8;
+    t4 = t3 - t9;
+    t3 = t13 + t8;
+    t9 = t12 - t0;
+    t13 = t5 + t7;
+    re[125] = t11;
+    im[125] = t2;
+    re[161] = t6;
+    im[161] = t1;
+    re[17] = t10;
+    im[17] = t14;
+    re[53] = t4;
+    im[53] = t3;
+    re[89] = t9;
+    im[89] = t13;
+    t8 = re[5];
+    t12 = im[5];
+    t0 = re[41];
+    t5 = im[41];
+    t7 = re[77];
+    t11 = im[77];
+    t2 = re[113];
+    t6 = im[113];
+    t1 = re[149];
+    t10 = im[149];
+    t14 = t0 + t1;
+    t4 = t5 + t10;
+    t3 = t7 + t2;
+    t9 = t11 + t6;
+    t13 = t0 - t1;
+    t0 = t5 - t10;
+    t1 = t7 - t2;
+    t5 = t11 - t6;
+    t10 = t14 + t3;
+    t7 = t4 + t9;
+    t2 = t14 - t3;
+    t11 = C11 * t2;
+    t6 = t4 - t9;
+    t14 = C11 * t6;
+    t3 = C12 * t10;
+    t2 = t8 - t3;
+    t4 = C12 * t7;
+    t9 = t12 - t4;
+    t6 = t2 + t11;
+    t3 = t9 + t14;
+    t4 = t2 - t11;
+    t2 = t9 - t14;
+    t11 = C13 * t13;
+    t9 = C14 * t1;
+    t14 = t11 + t9;
+    t11 = C13 * t0;
+    t9 = C14 * t5;
+    t11 = t11 + t9;
+    t9 = C14 * t13;
+    t13 = C13 * t1;
+    t1 = t9 - t13;
+    t9 = C14 * t0;
+    t13 = C13 * t5;
+    t0 = t9 - t13;
+    t5 = t8 + t10;
+    t9 = t12 + t7;
+    t13 = t6 + t11;
+    t8 = t3 - t14;
+    t10 = t4 + t0;
+    t12 = t2 - t1;
+    t7 = t4 - t0;
+    t4 = t2 + t1;
+    t0 = t6 - t11;
+    t2 = t3 + t14;
+    re[5] = t5;
+    im[5] = t9;
+    re[41] = t13;
+    im[41] = t8;
+    re[77] = t10;
+    im[77] = t12;
+    re[113] = t7;
+    im[113] = t4;
+    re[149] = t0;
+    im[149] = t2;
+    t1 = re[85];
+    t6 = im[85];
+    t11 = re[121];
+    t3 = im[121];
+    t14 = re[157];
+    t5 = im[157];
+    t9 = re[13];
+    t13 = im[13];
+    t8 = re[49];
+    t10 = im[49];
+    t12 = t11 + t8;
+    t7 = t3 + t10;
+    t4 = t14 + t9;
+    t0 = t5 + t13;
+    t2 = t11 - t8;
+    t11 = t3 - t10;
+    t8 = t14 - t9;
+    t3 = t5 - t13;
+    t10 = t12 + t4;
+    t14 = t7 + t0;
+    t9 = t12 - t4;
+    t5 = C11 * t9;
+    t13 = t7 - t0;
+    t12 = C11 * t13;
+    t4 = C12 * t10;
+    t9 = t1 - t4;
+    t7 = C12 * t14;
+    t0 = t6 - t7;
+    t13 = t9 + t5;
+    t4 = t0 + t12;
+    t7 = t9 - t5;
+    t9 = t0 - t12;
+    t5 = C13 * t2;
+    t0 = C14 * t8;
+    t12 = t5 + t0;
+    t5 = C13 * t11;
+    t0 = C14 * t3;
+    t5 = t5 + t0;
+    t0 = C14 * t2;
+    t2 = C13 * t8;
+    t8 = t0 - t2;
+    t0 = C14 * t11;
+    t2 = C13 * t3;
+    t11 = t0 - t2;
+    t3 = t1 + t10;
+    t0 = t6 + t14;
+    t2 = t13 + t5;
+    t1 = t4 - t12;
+    t10 = t7 + t11;
+    t6 = t9 - t8;
+    t14 = t7 - t11;
+    t7 = t9 + t8;
+    t11 = t13 - t5;
+    t9 = t4 + t12;
+    re[85] = t3;
+    im[85] = t0;
+    re[121] = t2;
+    im[121] = t1;
+    re[157] = t10;
+    im[157] = t6;
+    re[13] = t14;
+    im[13] = t7;
+    re[49] = t11;
+    im[49] = t9;
+    t8 = re[145];
+    t13 = im[145];
+    t5 = re[1];
+    t4 = im[1];
+    t12 = re[37];
+    t3 = im[37];
+    t0 = re[73];
+    t2 = im[73];
+    t1 = re[109];
+    t10 = im[109];
+    t6 = t5 + t1;
+    t14 = t4 + t10;
+    t7 = t12 + t0;
+    t11 = t3 + t2;
+    t9 = t5 - t1;
+    t5 = t4 - t10;
+    t1 = t12 - t0;
+    t4 = t3 - t2;
+    t10 = t6 + t7;
+    t12 = t14 + t11;
+    t0 = t6 - t7;
+    t3 = C11 * t0;
+    t2 = t14 - t11;
+    t6 = C11 * t2;
+    t7 = C12 * t10;
+    t0 = t8 - t7;
+    t14 = C12 * t12;
+    t11 = t13 - t14;
+    t2 = t0 + t3;
+    t7 = t11 + t6;
+    t14 = t0 - t3;
+    t0 = t11 - t6;
+    t3 = C13 * t9;
+    t11 = C14 * t1;
+    t6 = t3 + t11;
+    t3 = C13 * t5;
+    t11 = C14 * t4;
+    t3 = t3 + t11;
+    t11 = C14 * t9;
+    t9 = C13 * t1;
+    t1 = t11 - t9;
+    t11 = C14 * t5;
+    t9 = C13 * t4;
+    t5 = t11 - t9;
+    t4 = t8 + t10;
+    t11 = t13 + t12;
+    t9 = t2 + t3;
+    t8 = t7 - t6;
+    t10 = t14 + t5;
+    t13 = t0 - t1;
+    t12 = t14 - t5;
+    t14 = t0 + t1;
+    t5 = t2 - t3;
+    t0 = t7 + t6;
+    re[145] = t4;
+    im[145] = t11;
+    re[1] = t9;
+    im[1] = t8;
+    re[37] = t10;
+    im[37] = t13;
+    re[73] = t12;
+    im[73] = t14;
+    re[109] = t5;
+    im[109] = t0;
+    t1 = re[25];
+    t2 = im[25];
+    t3 = re[61];
+    t7 = im[61];
+    t6 = re[97];
+    t4 = im[97];
+    t11 = re[133];
+    t9 = im[133];
+    t8 = re[169];
+    t10 = im[169];
+    t13 = t3 + t8;
+    t12 = t7 + t10;
+    t14 = t6 + t11;
+    t5 = t4 + t9;
+    t0 = t3 - t8;
+    t3 = t7 - t10;
+    t8 = t6 - t11;
+    t7 = t4 - t9;
+    t10 = t13 + t14;
+    t6 = t12 + t5;
+    t11 = t13 - t14;
+    t4 = C11 * t11;
+    t9 = t12 - t5;
+    t13 = C11 * t9;
+    t14 = C12 * t10;
+    t11 = t1 - t14;
+    t12 = C12 * t6;
+    t5 = t2 - t12;
+    t9 = t11 + t4;
+    t14 = t5 + t13;
+    t12 = t11 - t4;
+    t11 = t5 - t13;
+    t4 = C13 * t0;
+    t5 = C14 * t8;
+    t13 = t4 + t5;
+    t4 = C13 * t3;
+    t5 = C14 * t7;
+    t4 = t4 + t5;
+    t5 = C14 * t0;
+    t0 = C13 * t8;
+    t8 = t5 - t0;
+    t5 = C14 * t3;
+    t0 = C13 * t7;
+    t3 = t5 - t0;
+    t7 = t1 + t10;
+    t5 = t2 + t6;
+    t0 = t9 + t4;
+    t1 = t14 - t13;
+    t10 = t12 + t3;
+    t2 = t11 - t8;
+    t6 = t12 - t3;
+    t12 = t11 + t8;
+    t3 = t9 - t4;
+    t11 = t14 + t13;
+    re[25] = t7;
+    im[25] = t5;
+    re[61] = t0;
+    im[61] = t1;
+    re[97] = t10;
+    im[97] = t2;
+    re[133] = t6;
+    im[133] = t12;
+    re[169] = t3;
+    im[169] = t11;
+}
+
+/**
+ *  Part 3 of ApplyWindowedIMDCT_W75_360_K60().
+ * 
+ *  @param {Number[]} X 
+ *    - The input block (360 points, only the first 60 points are used).
+ *  @param {Number[]} y 
+ *    - The array that would contain the output block (720 points).
+ *  @param {Number[]} re 
+ *    - The scratch buffer (real part, 180 points).
+ *  @param {Number[]} im 
+ *    - The scratch buffer (imaginary part, 180 points).
+ */
+function ApplyWindowedIMDCT_W75_360_K60_Part3(X, y, re, im) {
+    let t0, t1, t10, t11, t12, t13, t14, t2, t3, t4, t5, t6, t7, t8, t9;
+    const C0 = 0.9961946980917455;
+    const C1 = 0.08715574274765817;
+    const C2 = 0.4980973490458728;
+    const C3 = 0.04357787137382908;
+    const C4 = 0.8627299156628209;
+    const C5 = 0.07547908730517332;
+    const C6 = 0.766044443118978;
+    const C7 = 1.4088320528055172;
+    const C8 = 0.12325683343243876;
+    const C9 = 0.17364817766693033;
+    const C10 = 1.1584559306791384;
+    const C11 = 0.8111595753452777;
+    const C12 = 0.9396926207859084;
+    const C13 = 0.5976724774602398;
+    const C14 = 1.281712764111577;
+    const C15 = 0.5;
+    const C16 = 0.8660254037844386;
+    const C17 = 0.9986295347545738;
+    const C18 = 0.05233595624294383;
+    const C19 = 0.4993147673772869;
+    const C20 = 0.026167978121471914;
+    const C21 = 0.8648385460668958;
+    const C22 = 0.04532426763774014;
+    const C23 = 0.9743700647852352;
+    const C24 = 0.22495105434386498;
+    const C25 = 0.4871850323926176;
+    const C26 = 0.11247552717193249;
+    const C27 = 0.843829228791103;
+    const C28 = 0.19481332766988085;
+    const C29 = 0.992546151641322;
+    const C30 = 0.12186934340514748;
+    const C31 = 0.9876883405951378;
+    const C32 = 0.15643446504023087;
+    const C33 = 0.9998476951563913;
+    const C34 = 0.01745240643728351;
+    const C35 = 0.981627183447664;
+    const C36 = 0.1908089953765448;
+    const C37 = 0.5590169943749475;
+    const C38 = 0.25;
+    const C39 = 0.9510565162951535;
+    const C40 = 0.5877852522924731;
+    t8 = X[59];
+    t9 = 0.9659258262890683 * t8;
+    t4 = 0.25881904510252074 * t8;
+    t14 = 0.48296291314453416 * t8;
+    t13 = -t14;
+    t7 = 0.12940952255126037 * t8;
+    t5 = -t7;
+    t0 = 0.8365163037378078 * t8;
+    t1 = 0.22414386804201336 * t8;
+    t10 = t1 - t14;
+    t2 = t5 - t0;
+    t6 = t13 - t1;
+    t12 = t0 - t7;
+    re[90] = t9;
+    im[90] = t4;
+    re[150] = t10;
+    im[150] = t2;
+    re[30] = t6;
+    im[30] = t12;
+    t3 = X[19];
+    t11 = C0 * t3;
+    t8 = C1 * t3;
+    t14 = C2 * t3;
+    t5 = -t14;
+    t13 = C3 * t3;
+    t1 = -t13;
+    t0 = C4 * t3;
+    t7 = C5 * t3;
+    t9 = t7 - t14;
+    t4 = t1 - t0;
+    t10 = t5 - t7;
+    t2 = t0 - t13;
+    t6 = t9 + t4;
+    t12 = C6 * t6;
+    t3 = t9 * (-C7);
+    t14 = t4 * C8;
+    t1 = t12 - t14;
+    t5 = t12 + t3;
+    t7 = t10 + t2;
+    t0 = C9 * t7;
+    t13 = t10 * (-C10);
+    t6 = t2 * (-C11);
+    t9 = t0 - t6;
+    t4 = t0 + t13;
+    re[110] = t11;
+    im[110] = t8;
+    re[170] = t1;
+    im[170] = t5;
+    re[50] = t9;
+    im[50] = t4;
+    t14 = X[20];
+    t12 = C0 * t14;
+    t3 = (-C1) * t14;
+    t7 = C2 * t14;
+    t10 = -t7;
+    t2 = (-C3) * t14;
+    t6 = -t2;
+    t0 = C4 * t14;
+    t13 = (-C5) * t14;
+    t11 = t13 - t7;
+    t8 = t6 - t0;
+    t1 = t10 - t13;
+    t5 = t0 - t2;
+    t9 = t11 + t8;
+    t4 = C9 * t9;
+    t14 = t11 * (-C10);
+    t7 = t8 * (-C11);
+    t6 = t4 - t7;
+    t10 = t4 + t14;
+    t13 = t1 + t5;
+    t0 = (-C12) * t13;
+    t2 = t1 * C13;
+    t9 = t5 * (-C14);
+    t11 = t0 - t9;
+    t8 = t0 + t2;
+    re[130] = t12;
+    im[130] = t3;
+    re[10] = t6;
+    im[10] = t10;
+    re[70] = t11;
+    im[70] = t8;
+    t7 = re[90];
+    t4 = im[90];
+    t14 = re[110];
+    t13 = im[110];
+    t1 = re[130];
+    t5 = im[130];
+    t9 = t14 + t1;
+    t0 = t13 + t5;
+    t2 = C15 * t9;
+    t12 = t7 - t2;
+    t3 = C15 * t0;
+    t6 = t4 - t3;
+    t10 = t14 - t1;
+    t11 = C16 * t10;
+    t8 = t13 - t5;
+    t2 = C16 * t8;
+    t3 = t7 + t9;
+    t14 = t4 + t0;
+    t1 = t12 + t2;
+    t10 = t6 - t11;
+    t13 = t12 - t2;
+    t5 = t6 + t11;
+    re[90] = t3;
+    im[90] = t14;
+    re[110] = t1;
+    im[110] = t10;
+    re[130] = t13;
+    im[130] = t5;
+    t8 = re[150];
+    t7 = im[150];
+    t9 = re[170];
+    t4 = im[170];
+    t0 = re[10];
+    t12 = im[10];
+    t2 = t9 + t0;
+    t6 = t4 + t12;
+    t11 = C15 * t2;
+    t3 = t8 - t11;
+    t14 = C15 * t6;
+    t1 = t7 - t14;
+    t10 = t9 - t0;
+    t13 = C16 * t10;
+    t5 = t4 - t12;
+    t11 = C16 * t5;
+    t14 = t8 + t2;
+    t9 = t7 + t6;
+    t0 = t3 + t11;
+    t10 = t1 - t13;
+    t4 = t3 - t11;
+    t12 = t1 + t13;
+    re[150] = t14;
+    im[150] = t9;
+    re[170] = t0;
+    im[170] = t10;
+    re[10] = t4;
+    im[10] = t12;
+    t5 = re[30];
+    t8 = im[30];
+    t2 = re[50];
+    t7 = im[50];
+    t6 = re[70];
+    t3 = im[70];
+    t11 = t2 + t6;
+    t1 = t7 + t3;
+    t13 = C15 * t11;
+    t14 = t5 - t13;
+    t9 = C15 * t1;
+    t0 = t8 - t9;
+    t10 = t2 - t6;
+    t4 = C16 * t10;
+    t12 = t7 - t3;
+    t13 = C16 * t12;
+    t9 = t5 + t11;
+    t2 = t8 + t1;
+    t6 = t14 + t13;
+    t10 = t0 - t4;
+    t7 = t14 - t13;
+    t3 = t0 + t4;
+    re[30] = t9;
+    im[30] = t2;
+    re[50] = t6;
+    im[50] = t10;
+    re[70] = t7;
+    im[70] = t3;
+    t12 = X[12];
+    t5 = C17 * t12;
+    t11 = (-C18) * t12;
+    t8 = C19 * t12;
+    t1 = -t8;
+    t14 = (-C20) * t12;
+    t13 = -t14;
+    t0 = C21 * t12;
+    t4 = (-C22) * t12;
+    t9 = t4 - t8;
+    t2 = t13 - t0;
+    t6 = t1 - t4;
+    t10 = t0 - t14;
+    re[126] = t5;
+    im[126] = t11;
+    re[6] = t9;
+    im[6] = t2;
+    re[66] = t6;
+    im[66] = t10;
+    t7 = X[52];
+    t3 = C23 * t7;
+    t12 = (-C24) * t7;
+    t8 = C25 * t7;
+    t13 = -t8;
+    t1 = (-C26) * t7;
+    t4 = -t1;
+    t0 = C27 * t7;
+    t14 = (-C28) * t7;
+    t5 = t14 - t8;
+    t11 = t4 - t0;
+    t9 = t13 - t14;
+    t2 = t0 - t1;
+    t6 = t5 + t11;
+    t10 = C6 * t6;
+    t7 = t5 * (-C7);
+    t8 = t11 * C8;
+    t4 = t10 - t8;
+    t13 = t10 + t7;
+    t14 = t9 + t2;
+    t0 = C9 * t14;
+    t1 = t9 * (-C10);
+    t6 = t2 * (-C11);
+    t5 = t0 - t6;
+    t11 = t0 + t1;
+    re[146] = t3;
+    im[146] = t12;
+    re[26] = t4;
+    im[26] = t13;
+    re[86] = t5;
+    im[86] = t11;
+    t8 = X[27];
+    t10 = C29 * t8;
+    t7 = C30 * t8;
+    t14 = t10 + t7;
+    t9 = C9 * t14;
+    t2 = (-1.1498209758416449) * t8;
+    t6 = (-0.09885548484412725) * t8;
+    t0 = t9 - t6;
+    t1 = t9 + t2;
+    t3 = (-C12) * t14;
+    t12 = 0.5932175174450958 * t8;
+    t4 = (-0.15620149299627456) * t8;
+    t13 = t3 - t4;
+    t5 = t3 + t12;
+    re[166] = t10;
+    im[166] = t7;
+    re[46] = t0;
+    im[46] = t1;
+    re[106] = t13;
+    im[106] = t5;
+    t11 = re[126];
+    t6 = im[126];
+    t9 = re[146];
+    t2 = im[146];
+    t14 = re[166];
+    t8 = im[166];
+    t4 = t9 + t14;
+    t3 = t2 + t8;
+    t12 = C15 * t4;
+    t10 = t11 - t12;
+    t7 = C15 * t3;
+    t0 = t6 - t7;
+    t1 = t9 - t14;
+    t13 = C16 * t1;
+    t5 = t2 - t8;
+    t12 = C16 * t5;
+    t7 = t11 + t4;
+    t9 = t6 + t3;
+    t14 = t10 + t12;
+    t1 = t0 - t13;
+    t2 = t10 - t12;
+    t8 = t0 + t13;
+    re[126] = t7;
+    im[126] = t9;
+    re[146] = t14;
+    im[146] = t1;
+    re[166] = t2;
+    im[166] = t8;
+    t5 = re[6];
+    t11 = im[6];
+    t4 = re[26];
+    t6 = im[26];
+    t3 = re[46];
+    t10 = im[46];
+    t12 = t4 + t3;
+    t0 = t6 + t10;
+    t13 = C15 * t12;
+    t7 = t5 - t13;
+    t9 = C15 * t0;
+    t14 = t11 - t9;
+    t1 = t4 - t3;
+    t2 = C16 * t1;
+    t8 = t6 - t10;
+    t13 = C16 * t8;
+    t9 = t5 + t12;
+    t4 = t11 + t0;
+    t3 = t7 + t13;
+    t1 = t14 - t2;
+    t6 = t7 - t13;
+    t10 = t14 + t2;
+    re[6] = t9;
+    im[6] = t4;
+    re[26] = t3;
+    im[26] = t1;
+    re[46] = t6;
+    im[46] = t10;
+    t8 = re[66];
+    t5 = im[66];
+    t12 = re[86];
+    t11 = im[86];
+    t0 = re[106];
+    t7 = im[106];
+    t13 = t12 + t0;
+    t14 = t11 + t7;
+    t2 = C15 * t13;
+    t9 = t8 - t2;
+    t4 = C15 * t14;
+    t3 = t5 - t4;
+    t1 = t12 - t0;
+    t6 = C16 * t1;
+    t10 = t11 - t7;
+    t2 = C16 * t10;
+    t4 = t8 + t13;
+    t12 = t5 + t14;
+    t0 = t9 + t2;
+    t1 = t3 - t6;
+    t11 = t9 - t2;
+    t7 = t3 + t6;
+    re[66] = t4;
+    im[66] = t12;
+    re[86] = t0;
+    im[86] = t1;
+    re[106] = t11;
+    im[106] = t7;
+    t10 = X[35];
+    t8 = C31 * t10;
+    t13 = C32 * t10;
+    re[162] = t8;
+    im[162] = t13;
+    re[42] = t8;
+    im[42] = t13;
+    re[102] = t8;
+    im[102] = t13;
+    t5 = X[4];
+    t14 = C33 * t5;
+    t9 = (-C34) * t5;
+    t2 = t14 + t9;
+    t3 = C6 * t2;
+    t6 = (-1.4086174808600436) * t5;
+    t4 = (-0.002151128353235476) * t5;
+    t12 = t3 - t4;
+    t0 = t3 + t6;
+    t1 = C9 * t2;
+    t11 = (-1.1582794922297888) * t5;
+    t7 = 0.014156686594420084 * t5;
+    t10 = t1 - t7;
+    t8 = t1 + t11;
+    re[2] = t14;
+    im[2] = t9;
+    re[62] = t12;
+    im[62] = t0;
+    re[122] = t10;
+    im[122] = t8;
+    t13 = X[44];
+    t4 = C35 * t13;
+    t3 = (-C36) * t13;
+    t6 = t4 + t3;
+    t2 = C9 * t6;
+    t5 = (-1.1371718323808049) * t13;
+    t7 = 0.15477654366169713 * t13;
+    t1 = t2 - t7;
+    t11 = t2 + t5;
+    t14 = (-C12) * t6;
+    t9 = 0.5866915506734826 * t13;
+    t12 = 0.24456232488142438 * t13;
+    t0 = t14 - t12;
+    t10 = t14 + t9;
+    re[22] = t4;
+    im[22] = t3;
+    re[82] = t1;
+    im[82] = t11;
+    re[142] = t0;
+    im[142] = t10;
+    t8 = re[162];
+    t7 = im[162];
+    t2 = re[2];
+    t5 = im[2];
+    t6 = re[22];
+    t13 = im[22];
+    t12 = t2 + t6;
+    t14 = t5 + t13;
+    t9 = C15 * t12;
+    t4 = t8 - t9;
+    t3 = C15 * t14;
+    t1 = t7 - t3;
+    t11 = t2 - t6;
+    t0 = C16 * t11;
+    t10 = t5 - t13;
+    t9 = C16 * t10;
+    t3 = t8 + t12;
+    t2 = t7 + t14;
+    t6 = t4 + t9;
+    t11 = t1 - t0;
+    t5 = t4 - t9;
+    t13 = t1 + t0;
+    re[162] = t3;
+    im[162] = t2;
+    re[2] = t6;
+    im[2] = t11;
+    re[22] = t5;
+    im[22] = t13;
+    t10 = re[42];
+    t8 = im[42];
+    t12 = re[62];
+    t7 = im[62];
+    t14 = re[82];
+    t4 = im[82];
+    t9 = t12 + t14;
+    t1 = t7 + t4;
+    t0 = C15 * t9;
+    t3 = t10 - t0;
+    t2 = C15 * t1;
+    t6 = t8 - t2;
+    t11 = t12 - t14;
+    t5 = C16 * t11;
+    t13 = t7 - t4;
+    t0 = C16 * t13;
+    t2 = t10 + t9;
+    t12 = t8 + t1;
+    t14 = t3 + t0;
+    t11 = t6 - t5;
+    t7 = t3 - t0;
+    t4 = t6 + t5;
+    re[42] = t2;
+    im[42] = t12;
+    re[62] = t14;
+    im[62] = t11;
+    re[82] = t7;
+    im[82] = t4;
+    t13 = re[102];
+    t10 = im[102];
+    t9 = re[122];
+    t8 = im[122];
+    t1 = re[142];
+    t3 = im[142];
+    t0 = t9 + t1;
+    t6 = t8 + t3;
+    t5 = C15 * t0;
+    t2 = t13 - t5;
+    t12 = C15 * t6;
+    t14 = t10 - t12;
+    t11 = t9 - t1;
+    t7 = C16 * t11;
+    t4 = t8 - t3;
+    t5 = C16 * t4;
+    t12 = t13 + t0;
+    t9 = t10 + t6;
+    t1 = t2 + t5;
+    t11 = t14 - t7;
+    t8 = t2 - t5;
+    t3 = t14 + t7;
+    re[102] = t12;
+    im[102] = t9;
+    re[122] = t1;
+    im[122] = t11;
+    re[142] = t8;
+    im[142] = t3;
+    t4 = X[36];
+    t13 = C31 * t4;
+    t0 = (-C32) * t4;
+    re[18] = t13;
+    im[18] = t0;
+    re[78] = t13;
+    im[78] = t0;
+    re[138] = t13;
+    im[138] = t0;
+    t10 = X[43];
+    t6 = C35 * t10;
+    t2 = C36 * t10;
+    t5 = 0.490813591723832 * t10;
+    t14 = -t5;
+    t7 = 0.0954044976882724 * t10;
+    t12 = -t7;
+    t9 = (-0.8501140779110443) * t10;
+    t1 = (-0.1652454372666753) * t10;
+    t11 = t1 - t5;
+    t8 = t12 - t9;
+    t3 = t14 - t1;
+    t4 = t9 - t7;
+    t13 = t11 + t8;
+    t0 = C6 * t13;
+    t10 = t11 * (-C7);
+    t5 = t8 * C8;
+    t12 = t0 - t5;
+    t14 = t0 + t10;
+    t1 = t3 + t4;
+    t9 = C9 * t1;
+    t7 = t3 * (-C10);
+    t13 = t4 * (-C11);
+    t11 = t9 - t13;
+    t8 = t9 + t7;
+    re[38] = t6;
+    im[38] = t2;
+    re[98] = t12;
+    im[98] = t14;
+    re[158] = t11;
+    im[158] = t8;
+    t5 = X[3];
+    t0 = C33 * t5;
+    t10 = C34 * t5;
+    t1 = 0.49992384757819563 * t5;
+    t3 = -t1;
+    t4 = 0.008726203218641756 * t5;
+    t13 = -t4;
+    t9 = (-0.865893503920754) * t5;
+    t7 = (-0.015114227331858588) * t5;
+    t6 = t7 - t1;
+    t2 = t13 - t9;
+    t12 = t3 - t7;
+    t14 = t9 - t4;
+    t11 = t6 + t2;
+    t8 = C9 * t11;
+    t5 = t6 * (-C10);
+    t1 = t2 * (-C11);
+    t13 = t8 - t1;
+    t3 = t8 + t5;
+    t7 = t12 + t14;
+    t9 = (-C12) * t7;
+    t4 = t12 * C13;
+    t11 = t14 * (-C14);
+    t6 = t9 - t11;
+    t2 = t9 + t4;
+    re[58] = t0;
+    im[58] = t10;
+    re[118] = t13;
+    im[118] = t3;
+    re[178] = t6;
+    im[178] = t2;
+    t1 = re[18];
+    t8 = im[18];
+    t5 = re[38];
+    t7 = im[38];
+    t12 = re[58];
+    t14 = im[58];
+    t11 = t5 + t12;
+    t9 = t7 + t14;
+    t4 = C15 * t11;
+    t0 = t1 - t4;
+    t10 = C15 * t9;
+    t13 = t8 - t10;
+    t3 = t5 - t12;
+    t6 = C16 * t3;
+    t2 = t7 - t14;
+    t4 = C16 * t2;
+    t10 = t1 + t11;
+    t5 = t8 + t9;
+    t12 = t0 + t4;
+    t3 = t13 - t6;
+    t7 = t0 - t4;
+    t14 = t13 + t6;
+    re[18] = t10;
+    im[18] = t5;
+    re[38] = t12;
+    im[38] = t3;
+    re[58] = t7;
+    im[58] = t14;
+    t2 = re[78];
+    t1 = im[78];
+    t11 = re[98];
+    t8 = im[98];
+    t9 = re[118];
+    t0 = im[118];
+    t4 = t11 + t9;
+    t13 = t8 + t0;
+    t6 = C15 * t4;
+    t10 = t2 - t6;
+    t5 = C15 * t13;
+    t12 = t1 - t5;
+    t3 = t11 - t9;
+    t7 = C16 * t3;
+    t14 = t8 - t0;
+    t6 = C16 * t14;
+    t5 = t2 + t4;
+    t11 = t1 + t13;
+    t9 = t10 + t6;
+    t3 = t12 - t7;
+    t8 = t10 - t6;
+    t0 = t12 + t7;
+    re[78] = t5;
+    im[78] = t11;
+    re[98] = t9;
+    im[98] = t3;
+    re[118] = t8;
+    im[118] = t0;
+    t14 = re[138];
+    t2 = im[138];
+    t4 = re[158];
+    t1 = im[158];
+    t13 = re[178];
+    t10 = im[178];
+    t6 = t4 + t13;
+    t12 = t1 + t10;
+    t7 = C15 * t6;
+    t5 = t14 - t7;
+    t11 = C15 * t12;
+    t9 = t2 - t11;
+    t3 = t4 - t13;
+    t8 = C16 * t3;
+    t0 = t1 - t10;
+    t7 = C16 * t0;
+    t11 = t14 + t6;
+    t4 = t2 + t12;
+    t13 = t5 + t7;
+    t3 = t9 - t8;
+    t1 = t5 - t7;
+    t10 = t9 + t8;
+    re[138] = t11;
+    im[138] = t4;
+    re[158] = t13;
+    im[158] = t3;
+    re[178] = t1;
+    im[178] = t10;
+    t0 = X[11];
+    t14 = C17 * t0;
+    t6 = C18 * t0;
+    t2 = C19 * t0;
+    t12 = -t2;
+    t5 = C20 * t0;
+    t7 = -t5;
+    t9 = (-C21) * t0;
+    t8 = (-C22) * t0;
+    t11 = t8 - t2;
+    t4 = t7 - t9;
+    t13 = t12 - t8;
+    t3 = t9 - t5;
+    re[54] = t14;
+    im[54] = t6;
+    re[114] = t11;
+    im[114] = t4;
+    re[174] = t13;
+    im[174] = t3;
+    t1 = X[28];
+    t10 = C29 * t1;
+    t0 = (-C30) * t1;
+    t2 = 0.496273075820661 * t1;
+    t7 = -t2;
+    t12 = (-0.06093467170257374) * t1;
+    t8 = -t12;
+    t9 = (-0.8595701817498665) * t1;
+    t5 = 0.10554194733138725 * t1;
+    t14 = t5 - t2;
+    t6 = t8 - t9;
+    t11 = t7 - t5;
+    t4 = t9 - t12;
+    t13 = t14 + t6;
+    t3 = C6 * t13;
+    t1 = t14 * (-C7);
+    t2 = t6 * C8;
+    t8 = t3 - t2;
+    t7 = t3 + t1;
+    t5 = t11 + t4;
+    t9 = C9 * t5;
+    t12 = t11 * (-C10);
+    t13 = t4 * (-C11);
+    t14 = t9 - t13;
+    t6 = t9 + t12;
+    re[74] = t10;
+    im[74] = t0;
+    re[134] = t8;
+    im[134] = t7;
+    re[14] = t14;
+    im[14] = t6;
+    t2 = X[51];
+    t3 = C23 * t2;
+    t1 = C24 * t2;
+    t5 = C25 * t2;
+    t11 = -t5;
+    t4 = C26 * t2;
+    t13 = -t4;
+    t9 = C27 * t2;
+    t12 = C28 * t2;
+    t10 = t12 - t5;
+    t0 = t13 - t9;
+    t8 = t11 - t12;
+    t7 = t9 - t4;
+    t14 = t10 + t0;
+    t6 = C9 * t14;
+    t2 = t10 * (-C10);
+    t5 = t0 * (-C11);
+    t13 = t6 - t5;
+    t11 = t6 + t2;
+    t12 = t8 + t7;
+    t9 = (-C12) * t12;
+    t4 = t8 * C13;
+    t14 = t7 * (-C14);
+    t10 = t9 - t14;
+    t0 = t9 + t4;
+    re[94] = t3;
+    im[94] = t1;
+    re[154] = t13;
+    im[154] = t11;
+    re[34] = t10;
+    im[34] = t0;
+    t5 = re[54];
+    t6 = im[54];
+    t2 = re[74];
+    t12 = im[74];
+    t8 = re[94];
+    t7 = im[94];
+    t14 = t2 + t8;
+    t9 = t12 + t7;
+    t4 = C15 * t14;
+    t3 = t5 - t4;
+    t1 = C15 * t9;
+    t13 = t6 - t1;
+    t11 = t2 - t8;
+    t10 = C16 * t11;
+    t0 = t12 - t7;
+    t4 = C16 * t0;
+    t1 = t5 + t14;
+    t2 = t6 + t9;
+    t8 = t3 + t4;
+    t11 = t13 - t10;
+    t12 = t3 - t4;
+    t7 = t13 + t10;
+    re[54] = t1;
+    im[54] = t2;
+    re[74] = t8;
+    im[74] = t11;
+    re[94] = t12;
+    im[94] = t7;
+    t0 = re[114];
+    t5 = im[114];
+    t14 = re[134];
+    t6 = im[134];
+    t9 = re[154];
+    t3 = im[154];
+    t4 = t14 + t9;
+    t13 = t6 + t3;
+    t10 = C15 * t4;
+    t1 = t0 - t10;
+    t2 = C15 * t13;
+    t8 = t5 - t2;
+    t11 = t14 - t9;
+    t12 = C16 * t11;
+    t7 = t6 - t3;
+    t10 = C16 * t7;
+    t2 = t0 + t4;
+    t14 = t5 + t13;
+    t9 = t1 + t10;
+    t11 = t8 - t12;
+    t6 = t1 - t10;
+    t3 = t8 + t12;
+    re[114] = t2;
+    im[114] = t14;
+    re[134] = t9;
+    im[134] = t11;
+    re[154] = t6;
+    im[154] = t3;
+    t7 = re[174];
+    t0 = im[174];
+    t4 = re[14];
+    t5 = im[14];
+    t13 = re[34];
+    t1 = im[34];
+    t10 = t4 + t13;
+    t8 = t5 + t1;
+    t12 = C15 * t10;
+    t2 = t7 - t12;
+    t14 = C15 * t8;
+    t9 = t0 - t14;
+    t11 = t4 - t13;
+    t6 = C16 * t11;
+    t3 = t5 - t1;
+    t12 = C16 * t3;
+    t14 = t7 + t10;
+    t4 = t0 + t8;
+    t13 = t2 + t12;
+    t11 = t9 - t6;
+    t5 = t2 - t12;
+    t1 = t9 + t6;
+    re[174] = t14;
+    im[174] = t4;
+    re[14] = t13;
+    im[14] = t11;
+    re[34] = t5;
+    im[34] = t1;
+    t3 = re[90];
+    t7 = im[90];
+    t10 = re[126];
+    t0 = im[126];
+    t8 = re[162];
+    t2 = im[162];
+    t12 = re[18];
+    t9 = im[18];
+    t6 = re[54];
+    t14 = im[54];
+    t4 = t10 + t6;
+    t13 = t0 + t14;
+    t11 = t8 + t12;
+    t5 = t2 + t9;
+    t1 = t10 - t6;
+    t10 = t0 - t14;
+    t6 = t8 - t12;
+    t0 = t2 - t9;
+    t14 = t4 + t11;
+    t8 = t13 + t5;
+    t12 = t4 - t11;
+    t2 = C37 * t12;
+    t9 = t13 - t5;
+    t4 = C37 * t9;
+    t11 = C38 * t14;
+    t12 = t3 - t11;
+    t13 = C38 * t8;
+    t5 = t7 - t13;
+    t9 = t12 + t2;
+    t11 = t5 + t4;
+    t13 = t12 - t2;
+    t12 = t5 - t4;
+    t2 = C39 * t1;
+    t5 = C40 * t6;
+    t4 = t2 + t5;
+    t2 = C39 * t10;
+    t5 = C40 * t0;
+    t2 = t2 + t5;
+    t5 = C40 * t1;
+    t1 = C39 * t6;
+    t6 = t5 - t1;
+    t5 = C40 * t10;
+    t1 = C39 * t0;
+    t10 = t5 - t1;
+    t0 = t3 + t14;
+    t5 = t7 + t8;
+    t1 = t9 + t2;
+    t3 = t11 - t4;
+    t14 = t13 + t10;
+    t7 = t12 - t6;
+    t8 = t13 - t10;
+    t13 = t12 + t6;
+    t10 = t9 - t2;
+    t12 = t11 + t4;
+    re[90] = t0;
+    im[90] = t5;
+    re[126] = t1;
+    im[126] = t3;
+    re[162] = t14;
+    im[162] = t7;
+    re[18] = t8;
+    im[18] = t13;
+    re[54] = t10;
+    im[54] = t12;
+    t6 = re[150];
+    t9 = im[150];
+    t2 = re[6];
+    t11 = im[6];
+    t4 = re[42];
+    t0 = im[42];
+    t5 = re[78];
+    t1 = im[78];
+    t3 = re[114];
+    t14 = im[114];
+    t7 = t2 + t3;
+    t8 = t11 + t14;
+    t13 = t4 + t5;
+    t10 = t0 + t1;
+    t12 = t2 - t3;
+    t2 = t11 - t14;
+    t3 = t4 - t5;
+    t11 = t0 - t1;
+    t14 = t7 + t13;
+    t4 = t8 + t10;
+    t5 = t7 - t13;
+    t0 = C37 * t5;
+    t1 = t8 - t10;
+    t7 = C37 * t1;
+    t13 = C38 * t14;
+    t5 = t6 - t13;
+    t8 = C38 * t4;
+    t10 = t9 - t8;
+    t1 = t5 + t0;
+    t13 = t10 + t7;
+    t8 = t5 - t0;
+    t5 = t10 - t7;
+    t0 = C39 * t12;
+    t10 = C40 * t3;
+    t7 = t0 + t10;
+    t0 = C39 * t2;
+    t10 = C40 * t11;
+    t0 = t0 + t10;
+    t10 = C40 * t12;
+    t12 = C39 * t3;
+    t3 = t10 - t12;
+    t10 = C40 * t2;
+    t12 = C39 * t11;
+    t2 = t10 - t12;
+    t11 = t6 + t14;
+    t10 = t9 + t4;
+    t12 = t1 + t0;
+    t6 = t13 - t7;
+    t14 = t8 + t2;
+    t9 = t5 - t3;
+    t4 = t8 - t2;
+    t8 = t5 + t3;
+    t2 = t1 - t0;
+    t5 = t13 + t7;
+    re[150] = t11;
+    im[150] = t10;
+    re[6] = t12;
+    im[6] = t6;
+    re[42] = t14;
+    im[42] = t9;
+    re[78] = t4;
+    im[78] = t8;
+    re[114] = t2;
+    im[114] = t5;
+    t3 = re[30];
+    t1 = im[30];
+    t0 = re[66];
+    t13 = im[66];
+    t7 = re[102];
+    t11 = im[102];
+    t10 = re[138];
+    t12 = im[138];
+    t6 = re[174];
+    t14 = im[174];
+    t9 = t0 + t6;
+    t4 = t13 + t14;
+    t8 = t7 + t10;
+    t2 = t11 + t12;
+    t5 = t0 - t6;
+    t0 = t13 - t14;
+    t6 = t7 - t10;
+    t13 = t11 - t12;
+    t14 = t9 + t8;
+    t7 = t4 + t2;
+    t10 = t9 - t8;
+    t11 = C37 * t10;
+    t12 = t4 - t2;
+    t9 = C37 * t12;
+    t8 = C38 * t14;
+    t10 = t3 - t8;
+    t4 = C38 * t7;
+    t2 = t1 - t4;
+    t12 = t10 + t11;
+    t8 = t2 + t9;
+    t4 = t10 - t11;
+    t10 = t2 - t9;
+    t11 = C39 * t5;
+    t2 = C40 * t6;
+    t9 = t11 + t2;
+    t11 = C39 * t0;
+    t2 = C40 * t13;
+    t11 = t11 + t2;
+    t2 = C40 * t5;
+    t5 = C39 * t6;
+    t6 = t2 - t5;
+    t2 = C40 * t0;
+    t5 = C39 * t13;
+    t0 = t2 - t5;
+    t13 = t3 + t14;
+    t2 = t1 + t7;
+    t5 = t12 + t11;
+    t3 = t8 - t9;
+    t14 = t4 + t0;
+    t1 = t10 - t6;
+    t7 = t4 - t0;
+    t4 = t10 + t6;
+    t0 = t12 - t11;
+    t10 = t8 + t9;
+    re[30] = t13;
+    im[30] = t2;
+    re[66] = t5;
+    im[66] = t3;
+    re[102] = t14;
+    im[102] = t1;
+    re[138] = t7;
+    im[138] = t4;
+    re[174] = t0;
+    im[174] = t10;
+    t6 = re[110];
+    t12 = im[110];
+    t11 = re[146];
+    t8 = im[146];
+    t9 = re[2];
+    t13 = im[2];
+    t2 = re[38];
+    t5 = im[38];
+    t3 = re[74];
+    t14 = im[74];
+    t1 = t11 + t3;
+    t7 = t8 + t14;
+    t4 = t9 + t2;
+    t0 = t13 + t5;
+    t10 = t11 - t3;
+    t11 = t8 - t14;
+    t3 = t9 - t2;
+    t8 = t13 - t5;
+    t14 = t1 + t4;
+    t9 = t7 + t0;
+    t2 = t1 - t4;
+    t13 = C37 * t2;
+    t5 = t7 - t0;
+    t1 = C37 * t5;
+    t4 = C38 * t14;
+    t2 = t6 - t4;
+    t7 = C38 * t9;
+    t0 = t12 - t7;
+    t5 = t2 + t13;
+    t4 = t0 + t1;
+    t7 = t2 - t13;
+    t2 = t0 - t1;
+    t13 = C39 * t10;
+    t0 = C40 * t3;
+    t1 = t13 + t0;
+    t13 = C39 * t11;
+    t0 = C40 * t8;
+    t13 = t13 + t0;
+    t0 = C40 * t10;
+    t10 = C39 * t3;
+    t3 = t0 - t10;
+    t0 = C40 * t11;
+    t10 = C39 * t8;
+    t11 = t0 - t10;
+    t8 = t6 + t14;
+    t0 = t12 + t9;
+    t10 = t5 + t13;
+    t6 = t4 - t1;
+    t14 = t7 + t11;
+    t12 = t2 - t3;
+    t9 = t7 - t11;
+    t7 = t2 + t3;
+    t11 = t5 - t13;
+    t2 = t4 + t1;
+    re[110] = t8;
+    im[110] = t0;
+    re[146] = t10;
+    im[146] = t6;
+    re[2] = t14;
+    im[2] = t12;
+    re[38] = t9;
+    im[38] = t7;
+    re[74] = t11;
+    im[74] = t2;
+    t3 = re[170];
+    t5 = im[170];
+    t13 = re[26];
+    t4 = im[26];
+    t1 = re[62];
+    t8 = im[62];
+    t0 = re[98];
+    t10 = im[98];
+    t6 = re[134];
+    t14 = im[134];
+    t12 = t13 + t6;
+    t9 = t4 + t14;
+    t7 = t1 + t0;
+    t11 = t8 + t10;
+    t2 = t13 - t6;
+    t13 = t4 - t14;
+    t6 = t1 - t0;
+    t4 = t8 - t10;
+    t14 = t12 + t7;
+    t1 = t9 + t11;
+    t0 = t12 - t7;
+    t8 = C37 * t0;
+    t10 = t9 - t11;
+    t12 = C37 * t10;
+    t7 = C38 * t14;
+    t0 = t3 - t7;
+    t9 = C38 * t1;
+    t11 = t5 - t9;
+    t10 = t0 + t8;
+    t7 = t11 + t12;
+    t9 = t0 - t8;
+    t0 = t11 - t12;
+    t8 = C39 * t2;
+    t11 = C40 * t6;
+    t12 = t8 + t11;
+    t8 = C39 * t13;
+    t11 = C40 * t4;
+    t8 = t8 + t11;
+    t11 = C40 * t2;
+    t2 = C39 * t6;
+    t6 = t11 - t2;
+    t11 = C40 * t13;
+    t2 = C39 * t4;
+    t13 = t11 - t2;
+    t4 = t3 + t14;
+    t11 = t5 + t1;
+    t2 = t10 + t8;
+    t3 = t7 - t12;
+    t14 = t9 + t13;
+    t5 = t0 - t6;
+    t1 = t9 - t13;
+    t9 = t0 + t6;
+    t13 = t10 - t8;
+    t0 = t7 + t12;
+    re[170] = t4;
+    im[170] = t11;
+    re[26] = t2;
+    im[26] = t3;
+    re[62] = t14;
+    im[62] = t5;
+    re[98] = t1;
+    im[98] = t9;
+    re[134] = t13;
+    im[134] = t0;
+    t6 = re[50];
+    t10 = im[50];
+    t8 = re[86];
+    t7 = im[86];
+    t12 = re[122];
+    t4 = im[122];
+    t11 = re[158];
+    t2 = im[158];
+    t3 = re[14];
+    t14 = im[14];
+    t5 = t8 + t3;
+    t1 = t7 + t14;
+    t9 = t12 + t11;
+    t13 = t4 + t2;
+    t0 = t8 - t3;
+    t8 = t7 - t14;
+    t3 = t12 - t11;
+    t7 = t4 - t2;
+    t14 = t5 + t9;
+    t12 = t1 + t13;
+    t11 = t5 - t9;
+    t4 = C37 * t11;
+    t2 = t1 - t13;
+    t5 = C37 * t2;
+    t9 = C38 * t14;
+    t11 = t6 - t9;
+    t1 = C38 * t12;
+    t13 = t10 - t1;
+    t2 = t11 + t4;
+    t9 = t13 + t5;
+    t1 = t11 - t4;
+    t11 = t13 - t5;
+    t4 = C39 * t0;
+    t13 = C40 * t3;
+    t5 = t4 + t13;
+    t4 = C39 * t8;
+    t13 = C40 * t7;
+    t4 = t4 + t13;
+    t13 = C40 * t0;
+    t0 = C39 * t3;
+    t3 = t13 - t0;
+    t13 = C40 * t8;
+    t0 = C39 * t7;
+    t8 = t13 - t0;
+    t7 = t6 + t14;
+    t13 = t10 + t12;
+    t0 = t2 + t4;
+    t6 = t9 - t5;
+    t14 = t1 + t8;
+    t10 = t11 - t3;
+    t12 = t1 - t8;
+    t1 = t11 + t3;
+    t8 = t2 - t4;
+    t11 = t9 + t5;
+    re[50] = t7;
+    im[50] = t13;
+    re[86] = t0;
+    im[86] = t6;
+    re[122] = t14;
+    im[122] = t10;
+    re[158] = t12;
+    im[158] = t1;
+    re[14] = t8;
+    im[14] = t11;
+    t3 = re[130];
+    t2 = im[130];
+    t4 = re[166];
+    t9 = im[166];
+    t5 = re[22];
+    t7 = im[22];
+    t13 = re[58];
+    t0 = im[58];
+    t6 = re[94];
+    t14 = im[94];
+    t10 = t4 + t6;
+    t12 = t9 + t14;
+    t1 = t5 + t13;
+    t8 = t7 + t0;
+    t11 = t4 - t6;
+    t4 = t9 - t14;
+    t6 = t5 - t13;
+    t9 = t7 - t0;
+    t14 = t10 + t1;
+    t5 = t12 + t8;
+    t13 = t10 - t1;
+    t7 = C37 * t13;
+    t0 = t12 - t8;
+    t10 = C37 * t0;
+    t1 = C38 * t14;
+    t13 = t3 - t1;
+    t12 = C38 * t5;
+    t8 = t2 - t12;
+    t0 = t13 + t7;
+    t1 = t8 + t10;
+    t12 = t13 - t7;
+    t13 = t8 - t10;
+    t7 = C39 * t11;
+    t8 = C40 * t6;
+    t10 = t7 + t8;
+    t7 = C39 * t4;
+    t8 = C40 * t9;
+    t7 = t7 + t8;
+    t8 = C40 * t11;
+    t11 = C39 * t6;
+    t6 = t8 - t11;
+    t8 = C40 * t4;
+    t11 = C39 * t9;
+    t4 = t8 - t11;
+    t9 = t3 + t14;
+    t8 = t2 + t5;
+    t11 = t0 + t7;
+    t3 = t1 - t10;
+    t14 = t12 + t4;
+    t2 = t13 - t6;
+    t5 = t12 - t4;
+    t12 = t13 + t6;
+    t4 = t0 - t7;
+    t13 = t1 + t10;
+    re[130] = t9;
+    im[130] = t8;
+    re[166] = t11;
+    im[166] = t3;
+    re[22] = t14;
+    im[22] = t2;
+    re[58] = t5;
+    im[58] = t12;
+    re[94] = t4;
+    im[94] = t13;
+    t6 = re[10];
+    t0 = im[10];
+    t7 = re[46];
+    t1 = im[46];
+    t10 = re[82];
+    t9 = im[82];
+    t8 = re[118];
+    t11 = im[118];
+    t3 = re[154];
+    t14 = im[154];
+    t2 = t7 + t3;
+    t5 = t1 + t14;
+    t12 = t10 + t8;
+    t4 = t9 + t11;
+    t13 = t7 - t3;
+    t7 = t1 - t14;
+    t3 = t10 - t8;
+    t1 = t9 - t11;
+    t14 = t2 + t12;
+    t10 = t5 + t4;
+    t8 = t2 - t12;
+    t9 = C37 * t8;
+    t11 = t5 - t4;
+    t2 = C37 * t11;
+    t12 = C38 * t14;
+    t8 = t6 - t12;
+    t5 = C38 * t10;
+    t4 = t0 - t5;
+    t11 = t8 + t9;
+    t12 = t4 + t2;
+    t5 = t8 - t9;
+    t8 = t4 - t2;
+    t9 = C39 * t13;
+    t4 = C40 * t3;
+    t2 = t9 + t4;
+    t9 = C39 * t7;
+    t4 = C40 * t1;
+    t9 = t9 + t4;
+    t4 = C40 * t13;
+    t13 = C39 * t3;
+    t3 = t4 - t13;
+    t4 = C40 * t7;
+    t13 = C39 * t1;
+    t7 = t4 - t13;
+    t1 = t6 + t14;
+    t4 = t0 + t10;
+    t13 = t11 + t9;
+    t6 = t12 - t2;
+    t14 = t5 + t7;
+    t0 = t8 - t3;
+    t10 = t5 - t7;
+    t5 = t8 + t3;
+    t7 = t11 - t9;
+    t8 = t12 + t2;
+    re[10] = t1;
+    im[10] = t4;
+    re[46] = t13;
+    im[46] = t6;
+    re[82] = t14;
+    im[82] = t0;
+    re[118] = t10;
+    im[118] = t5;
+    re[154] = t7;
+    im[154] = t8;
+    t3 = re[70];
+    t11 = im[70];
+    t9 = re[106];
+    t12 = im[106];
+    t2 = re[142];
+    t1 = im[142];
+    t4 = re[178];
+    t13 = im[178];
+    t6 = re[34];
+    t14 = im[34];
+    t0 = t9 + t6;
+    t10 = t12 + t14;
+    t5 = t2 + t4;
+    t7 = t1 + t13;
+    t8 = t9 - t6;
+    t9 = t12 - t14;
+    t6 = t2 - t4;
+    t12 = t1 - t13;
+    t14 = t0 + t5;
+    t2 = t10 + t7;
+    t4 = t0 - t5;
+    t1 = C37 * t4;
+    t13 = t10 - t7;
+    t0 = C37 * t13;
+    t5 = C38 * t14;
+    t4 = t3 - t5;
+    t10 = C38 * t2;
+    t7 = t11 - t10;
+    t13 = t4 + t1;
+    t5 = t7 + t0;
+    t10 = t4 - t1;
+    t4 = t7 - t0;
+    t1 = C39 * t8;
+    t7 = C40 * t6;
+    t0 = t1 + t7;
+    t1 = C39 * t9;
+    t7 = C40 * t12;
+    t1 = t1 + t7;
+    t7 = C40 * t8;
+    t8 = C39 * t6;
+    t6 = t7 - t8;
+    t7 = C40 * t9;
+    t8 = C39 * t12;
+    t9 = t7 - t8;
+    t12 = t3 + t14;
+    t7 = t11 + t2;
+    t8 = t13 + t1;
+    t3 = t5 - t0;
+    t14 = t10 + t9;
+    t11 = t4 - t6;
+    t2 = t10 - t9;
+    t10 = t4 + t6;
+    t9 = t13 - t1;
+    t4 = t5 + t0;
+    re[70] = t12;
+    im[70] = t7;
+    re[106] = t8;
+    im[106] = t3;
+    re[142] = t14;
+    im[142] = t11;
+    re[178] = t2;
+    im[178] = t10;
+    re[34] = t9;
+    im[34] = t4;
+}
+
+/**
+ *  Part 4 of ApplyWindowedIMDCT_W75_360_K60().
+ * 
+ *  @param {Number[]} X 
+ *    - The input block (360 points, only the first 60 points are used).
+ *  @param {Number[]} y 
+ *    - The array that would contain the output block (720 points).
+ *  @param {Number[]} re 
+ *    - The scratch buffer (real part, 180 points).
+ *  @param {Number[]} im 
+ *    - The scratch buffer (imaginary part, 180 points).
+ */
+function ApplyWindowedIMDCT_W75_360_K60_Part4(X, y, re, im) {
+    let t0, t1, t10, t11, t12, t13, t14, t2, t3, t4, t5, t6, t7, t8, t9;
+    const C0 = 0.766044443118978;
+    const C1 = 0.17364817766693033;
+    const C2 = 0.9396926207859084;
+    const C3 = 0.5;
+    const C4 = 0.8660254037844386;
+    const C5 = 1.1584559306791384;
+    const C6 = 0.8111595753452777;
+    const C7 = 0.5976724774602398;
+    const C8 = 1.281712764111577;
+    const C9 = 1.4088320528055172;
+    const C10 = 0.12325683343243876;
+    const C11 = 0.5590169943749475;
+    const C12 = 0.25;
+    const C13 = 0.9510565162951535;
+    const C14 = 0.5877852522924731;
+    const C15 = 0.9999976201773518;
+    const C16 = 0.0021816598343367697;
+    const C17 = 0.9230424487681941;
+    const C18 = 0.384698112514236;
+    const C19 = 0.7055624319347131;
+    const C20 = 0.7086477648609169;
+    const C21 = 0.38066693077854463;
+    const C22 = 0.9247122189155081;
+    const C23 = 0.37258290214410295;
+    const C24 = 0.9279989121921846;
+    const C25 = 0.9999405050001497;
+    const C26 = 0.010908091494182374;
+    const C27 = 0.9196502204050923;
+    const C28 = 0.39273842708457407;
+    const C29 = 0.6993515264033671;
+    const C30 = 0.7147778973340464;
+    const C31 = 0.6930873625456359;
+    const C32 = 0.7208535967029188;
+    const C33 = 0.36447049987914965;
+    const C34 = 0.9312149347588036;
+    const C35 = 0.9998072404820648;
+    const C36 = 0.0196336924606283;
+    const C37 = 0.916187957117136;
+    const C38 = 0.40074883310314097;
+    const C39 = 0.9126559225690792;
+    const C40 = 0.40872872054650483;
+    const C41 = 0.68677041740185;
+    const C42 = 0.7268744002795041;
+    const C43 = 0.3563303417745256;
+    const C44 = 0.9343600417027955;
+    const C45 = 0.9995978367717061;
+    const C46 = 0.02835779824537842;
+    const C47 = 0.9993123098159769;
+    const C48 = 0.037079744474000476;
+    const C49 = 0.9090543857390279;
+    const C50 = 0.4166774817153415;
+    const C51 = 0.6804011720318391;
+    const C52 = 0.7328398495562994;
+    const C53 = 0.34816304773478646;
+    const C54 = 0.9374339935120898;
+    const C55 = 0.3399692397309942;
+    const C56 = 0.9404365560933549;
+    const C57 = 0.9989506813588601;
+    const C58 = 0.04579886693652077;
+    const C59 = 0.9053836208979552;
+    const C60 = 0.4245945112807131;
+    const C61 = 0.6739801114782978;
+    const C62 = 0.7387494902412463;
+    const C63 = 0.6675077247298474;
+    const C64 = 0.7446028722923262;
+    const C65 = 0.3317495417533521;
+    const C66 = 0.9433675007898252;
+    const C67 = 0.9985129789397631;
+    const C68 = 0.05451450163800632;
+    const C69 = 0.9016439075888161;
+    const C70 = 0.4324792063301662;
+    const C71 = 0.8978355306052577;
+    const C72 = 0.44033096641364594;
+    const C73 = 0.6609845046837974;
+    const C74 = 0.750399549951834;
+    const C75 = 0.3235045797636848;
+    const C76 = 0.9462266043987146;
+    const C77 = 0.9979992358914197;
+    const C78 = 0.06322598484913067;
+    t6 = X[30];
+    t13 = 0.9914448613738104 * t6;
+    t1 = (-0.13052619222005157) * t6;
+    t5 = 0.4957224306869052 * t6;
+    t0 = -t5;
+    t12 = (-0.06526309611002579) * t6;
+    t7 = -t12;
+    t8 = 0.8586164364012608 * t6;
+    t3 = (-0.11303899832181541) * t6;
+    t14 = t3 - t5;
+    t11 = t7 - t8;
+    t2 = t0 - t3;
+    t10 = t8 - t12;
+    re[135] = t13;
+    im[135] = t1;
+    re[15] = t14;
+    im[15] = t11;
+    re[75] = t2;
+    im[75] = t10;
+    t9 = X[49];
+    t4 = 0.9762960071199334 * t9;
+    t6 = 0.21643961393810288 * t9;
+    t5 = t4 + t6;
+    t7 = C0 * t5;
+    t0 = (-1.3754371078566054) * t9;
+    t3 = 0.026677661443350098 * t9;
+    t8 = t7 - t3;
+    t12 = t7 + t0;
+    t13 = C1 * t5;
+    t1 = (-1.130995899546449) * t9;
+    t14 = (-0.17556706532992739) * t9;
+    t11 = t13 - t14;
+    t2 = t13 + t1;
+    re[155] = t4;
+    im[155] = t6;
+    re[35] = t8;
+    im[35] = t12;
+    re[95] = t11;
+    im[95] = t2;
+    t10 = X[9];
+    t3 = 0.9990482215818578 * t10;
+    t7 = 0.043619387365336 * t10;
+    t0 = t3 + t7;
+    t5 = C1 * t0;
+    t9 = (-1.1573533373259492) * t10;
+    t14 = (-0.03538228373208712) * t10;
+    t13 = t5 - t14;
+    t1 = t5 + t9;
+    t4 = (-C2) * t0;
+    t6 = 0.5971036256950756 * t10;
+    t8 = (-0.05590752554887841) * t10;
+    t12 = t4 - t8;
+    t11 = t4 + t6;
+    re[175] = t3;
+    im[175] = t7;
+    re[55] = t13;
+    im[55] = t1;
+    re[115] = t12;
+    im[115] = t11;
+    t2 = re[135];
+    t14 = im[135];
+    t5 = re[155];
+    t9 = im[155];
+    t0 = re[175];
+    t10 = im[175];
+    t8 = t5 + t0;
+    t4 = t9 + t10;
+    t6 = C3 * t8;
+    t3 = t2 - t6;
+    t7 = C3 * t4;
+    t13 = t14 - t7;
+    t1 = t5 - t0;
+    t12 = C4 * t1;
+    t11 = t9 - t10;
+    t6 = C4 * t11;
+    t7 = t2 + t8;
+    t5 = t14 + t4;
+    t0 = t3 + t6;
+    t1 = t13 - t12;
+    t9 = t3 - t6;
+    t10 = t13 + t12;
+    re[135] = t7;
+    im[135] = t5;
+    re[155] = t0;
+    im[155] = t1;
+    re[175] = t9;
+    im[175] = t10;
+    t11 = re[15];
+    t2 = im[15];
+    t8 = re[35];
+    t14 = im[35];
+    t4 = re[55];
+    t3 = im[55];
+    t6 = t8 + t4;
+    t13 = t14 + t3;
+    t12 = C3 * t6;
+    t7 = t11 - t12;
+    t5 = C3 * t13;
+    t0 = t2 - t5;
+    t1 = t8 - t4;
+    t9 = C4 * t1;
+    t10 = t14 - t3;
+    t12 = C4 * t10;
+    t5 = t11 + t6;
+    t8 = t2 + t13;
+    t4 = t7 + t12;
+    t1 = t0 - t9;
+    t14 = t7 - t12;
+    t3 = t0 + t9;
+    re[15] = t5;
+    im[15] = t8;
+    re[35] = t4;
+    im[35] = t1;
+    re[55] = t14;
+    im[55] = t3;
+    t10 = re[75];
+    t11 = im[75];
+    t6 = re[95];
+    t2 = im[95];
+    t13 = re[115];
+    t7 = im[115];
+    t12 = t6 + t13;
+    t0 = t2 + t7;
+    t9 = C3 * t12;
+    t5 = t10 - t9;
+    t8 = C3 * t0;
+    t4 = t11 - t8;
+    t1 = t6 - t13;
+    t14 = C4 * t1;
+    t3 = t2 - t7;
+    t9 = C4 * t3;
+    t8 = t10 + t12;
+    t6 = t11 + t0;
+    t13 = t5 + t9;
+    t1 = t4 - t14;
+    t2 = t5 - t9;
+    t7 = t4 + t14;
+    re[75] = t8;
+    im[75] = t6;
+    re[95] = t13;
+    im[95] = t1;
+    re[115] = t2;
+    im[115] = t7;
+    t3 = X[17];
+    t10 = 0.996917333733128 * t3;
+    t12 = 0.07845909572784494 * t3;
+    re[171] = t10;
+    im[171] = t12;
+    re[51] = t10;
+    im[51] = t12;
+    re[111] = t10;
+    im[111] = t12;
+    t11 = X[22];
+    t0 = 0.9953961983671789 * t11;
+    t5 = (-0.09584575252022398) * t11;
+    t9 = t0 + t5;
+    t4 = C0 * t9;
+    t14 = (-1.4023460695004404) * t11;
+    t8 = (-0.011813643953591996) * t11;
+    t6 = t4 - t8;
+    t13 = t4 + t14;
+    t1 = C1 * t9;
+    t2 = (-1.1531226293739265) * t11;
+    t7 = 0.07774619991295346 * t11;
+    t3 = t1 - t7;
+    t10 = t1 + t2;
+    re[11] = t0;
+    im[11] = t5;
+    re[71] = t6;
+    im[71] = t13;
+    re[131] = t3;
+    im[131] = t10;
+    t12 = X[57];
+    t8 = 0.9681476403781077 * t12;
+    t4 = 0.25038000405444144 * t12;
+    t14 = 0.48407382018905387 * t12;
+    t9 = -t14;
+    t11 = 0.12519000202722072 * t12;
+    t7 = -t11;
+    t1 = (-0.8384404511814022) * t12;
+    t2 = (-0.21683544411079703) * t12;
+    t0 = t2 - t14;
+    t5 = t7 - t1;
+    t6 = t9 - t2;
+    t13 = t1 - t11;
+    t3 = t0 + t5;
+    t10 = C1 * t3;
+    t12 = t0 * (-C5);
+    t14 = t5 * (-C6);
+    t7 = t10 - t14;
+    t9 = t10 + t12;
+    t2 = t6 + t13;
+    t1 = (-C2) * t2;
+    t11 = t6 * C7;
+    t3 = t13 * (-C8);
+    t0 = t1 - t3;
+    t5 = t1 + t11;
+    re[31] = t8;
+    im[31] = t4;
+    re[91] = t7;
+    im[91] = t9;
+    re[151] = t0;
+    im[151] = t5;
+    t14 = re[171];
+    t10 = im[171];
+    t12 = re[11];
+    t2 = im[11];
+    t6 = re[31];
+    t13 = im[31];
+    t3 = t12 + t6;
+    t1 = t2 + t13;
+    t11 = C3 * t3;
+    t8 = t14 - t11;
+    t4 = C3 * t1;
+    t7 = t10 - t4;
+    t9 = t12 - t6;
+    t0 = C4 * t9;
+    t5 = t2 - t13;
+    t11 = C4 * t5;
+    t4 = t14 + t3;
+    t12 = t10 + t1;
+    t6 = t8 + t11;
+    t9 = t7 - t0;
+    t2 = t8 - t11;
+    t13 = t7 + t0;
+    re[171] = t4;
+    im[171] = t12;
+    re[11] = t6;
+    im[11] = t9;
+    re[31] = t2;
+    im[31] = t13;
+    t5 = re[51];
+    t14 = im[51];
+    t3 = re[71];
+    t10 = im[71];
+    t1 = re[91];
+    t8 = im[91];
+    t11 = t3 + t1;
+    t7 = t10 + t8;
+    t0 = C3 * t11;
+    t4 = t5 - t0;
+    t12 = C3 * t7;
+    t6 = t14 - t12;
+    t9 = t3 - t1;
+    t2 = C4 * t9;
+    t13 = t10 - t8;
+    t0 = C4 * t13;
+    t12 = t5 + t11;
+    t3 = t14 + t7;
+    t1 = t4 + t0;
+    t9 = t6 - t2;
+    t10 = t4 - t0;
+    t8 = t6 + t2;
+    re[51] = t12;
+    im[51] = t3;
+    re[71] = t1;
+    im[71] = t9;
+    re[91] = t10;
+    im[91] = t8;
+    t13 = re[111];
+    t5 = im[111];
+    t11 = re[131];
+    t14 = im[131];
+    t7 = re[151];
+    t4 = im[151];
+    t0 = t11 + t7;
+    t6 = t14 + t4;
+    t2 = C3 * t0;
+    t12 = t13 - t2;
+    t3 = C3 * t6;
+    t1 = t5 - t3;
+    t9 = t11 - t7;
+    t10 = C4 * t9;
+    t8 = t14 - t4;
+    t2 = C4 * t8;
+    t3 = t13 + t0;
+    t11 = t5 + t6;
+    t7 = t12 + t2;
+    t9 = t1 - t10;
+    t14 = t12 - t2;
+    t4 = t1 + t10;
+    re[111] = t3;
+    im[111] = t11;
+    re[131] = t7;
+    im[131] = t9;
+    re[151] = t14;
+    im[151] = t4;
+    t8 = X[54];
+    t13 = 0.9723699203976766 * t8;
+    t0 = (-0.2334453638559054) * t8;
+    re[27] = t13;
+    im[27] = t0;
+    re[87] = t13;
+    im[87] = t0;
+    re[147] = t13;
+    im[147] = t0;
+    t5 = X[25];
+    t6 = 0.9935718556765875 * t5;
+    t12 = 0.11320321376790671 * t5;
+    t2 = 0.49678592783829373 * t5;
+    t1 = -t2;
+    t10 = 0.056601606883953354 * t5;
+    t3 = -t10;
+    t11 = (-0.8604584675011706) * t5;
+    t7 = (-0.09803685891304753) * t5;
+    t9 = t7 - t2;
+    t14 = t3 - t11;
+    t4 = t1 - t7;
+    t8 = t11 - t10;
+    t13 = t9 + t14;
+    t0 = C0 * t13;
+    t5 = t9 * (-C9);
+    t2 = t14 * C10;
+    t3 = t0 - t2;
+    t1 = t0 + t5;
+    t7 = t4 + t8;
+    t11 = C1 * t7;
+    t10 = t4 * (-C5);
+    t13 = t8 * (-C6);
+    t9 = t11 - t13;
+    t14 = t11 + t10;
+    re[47] = t6;
+    im[47] = t12;
+    re[107] = t3;
+    im[107] = t1;
+    re[167] = t9;
+    im[167] = t14;
+    t2 = X[14];
+    t0 = 0.9981347984218669 * t2;
+    t5 = (-0.06104853953485687) * t2;
+    t7 = 0.49906739921093346 * t2;
+    t4 = -t7;
+    t8 = (-0.030524269767428436) * t2;
+    t13 = -t8;
+    t11 = (-0.8644100918345965) * t2;
+    t10 = 0.05286958610112469 * t2;
+    t6 = t10 - t7;
+    t12 = t13 - t11;
+    t3 = t4 - t10;
+    t1 = t11 - t8;
+    t9 = t6 + t12;
+    t14 = C1 * t9;
+    t2 = t6 * (-C5);
+    t7 = t12 * (-C6);
+    t13 = t14 - t7;
+    t4 = t14 + t2;
+    t10 = t3 + t1;
+    t11 = (-C2) * t10;
+    t8 = t3 * C7;
+    t9 = t1 * (-C8);
+    t6 = t11 - t9;
+    t12 = t11 + t8;
+    re[67] = t0;
+    im[67] = t5;
+    re[127] = t13;
+    im[127] = t4;
+    re[7] = t6;
+    im[7] = t12;
+    t7 = re[27];
+    t14 = im[27];
+    t2 = re[47];
+    t10 = im[47];
+    t3 = re[67];
+    t1 = im[67];
+    t9 = t2 + t3;
+    t11 = t10 + t1;
+    t8 = C3 * t9;
+    t0 = t7 - t8;
+    t5 = C3 * t11;
+    t13 = t14 - t5;
+    t4 = t2 - t3;
+    t6 = C4 * t4;
+    t12 = t10 - t1;
+    t8 = C4 * t12;
+    t5 = t7 + t9;
+    t2 = t14 + t11;
+    t3 = t0 + t8;
+    t4 = t13 - t6;
+    t10 = t0 - t8;
+    t1 = t13 + t6;
+    re[27] = t5;
+    im[27] = t2;
+    re[47] = t3;
+    im[47] = t4;
+    re[67] = t10;
+    im[67] = t1;
+    t12 = re[87];
+    t7 = im[87];
+    t9 = re[107];
+    t14 = im[107];
+    t11 = re[127];
+    t0 = im[127];
+    t8 = t9 + t11;
+    t13 = t14 + t0;
+    t6 = C3 * t8;
+    t5 = t12 - t6;
+    t2 = C3 * t13;
+    t3 = t7 - t2;
+    t4 = t9 - t11;
+    t10 = C4 * t4;
+    t1 = t14 - t0;
+    t6 = C4 * t1;
+    t2 = t12 + t8;
+    t9 = t7 + t13;
+    t11 = t5 + t6;
+    t4 = t3 - t10;
+    t14 = t5 - t6;
+    t0 = t3 + t10;
+    re[87] = t2;
+    im[87] = t9;
+    re[107] = t11;
+    im[107] = t4;
+    re[127] = t14;
+    im[127] = t0;
+    t1 = re[147];
+    t12 = im[147];
+    t8 = re[167];
+    t7 = im[167];
+    t13 = re[7];
+    t5 = im[7];
+    t6 = t8 + t13;
+    t3 = t7 + t5;
+    t10 = C3 * t6;
+    t2 = t1 - t10;
+    t9 = C3 * t3;
+    t11 = t12 - t9;
+    t4 = t8 - t13;
+    t14 = C4 * t4;
+    t0 = t7 - t5;
+    t10 = C4 * t0;
+    t9 = t1 + t6;
+    t8 = t12 + t3;
+    t13 = t2 + t10;
+    t4 = t11 - t14;
+    t7 = t2 - t10;
+    t5 = t11 + t14;
+    re[147] = t9;
+    im[147] = t8;
+    re[167] = t13;
+    im[167] = t4;
+    re[7] = t7;
+    im[7] = t5;
+    t0 = X[6];
+    t1 = 0.9996573249755573 * t0;
+    t6 = (-0.02617694830787315) * t0;
+    t12 = 0.49982866248777863 * t0;
+    t3 = -t12;
+    t2 = (-0.013088474153936575) * t0;
+    t10 = -t2;
+    t11 = (-0.8657286385080287) * t0;
+    t14 = 0.02266990222817022 * t0;
+    t9 = t14 - t12;
+    t8 = t10 - t11;
+    t13 = t3 - t14;
+    t4 = t11 - t2;
+    re[63] = t1;
+    im[63] = t6;
+    re[123] = t9;
+    im[123] = t8;
+    re[3] = t13;
+    im[3] = t4;
+    t7 = X[46];
+    t5 = 0.9799247046208296 * t7;
+    t0 = (-0.19936793441719716) * t7;
+    t12 = 0.4899623523104148 * t7;
+    t10 = -t12;
+    t3 = (-0.09968396720859858) * t7;
+    t14 = -t3;
+    t11 = (-0.8486396879976007) * t7;
+    t2 = 0.17265769590532265 * t7;
+    t1 = t2 - t12;
+    t6 = t14 - t11;
+    t9 = t10 - t2;
+    t8 = t11 - t3;
+    t13 = t1 + t6;
+    t4 = C0 * t13;
+    t7 = t1 * (-C9);
+    t12 = t6 * C10;
+    t14 = t4 - t12;
+    t10 = t4 + t7;
+    t2 = t9 + t8;
+    t11 = C1 * t2;
+    t3 = t9 * (-C5);
+    t13 = t8 * (-C6);
+    t1 = t11 - t13;
+    t6 = t11 + t3;
+    re[83] = t5;
+    im[83] = t0;
+    re[143] = t14;
+    im[143] = t10;
+    re[23] = t1;
+    im[23] = t6;
+    t12 = X[33];
+    t4 = 0.9890158633619168 * t12;
+    t7 = 0.1478094111296106 * t12;
+    t2 = 0.4945079316809584 * t12;
+    t9 = -t2;
+    t8 = 0.0739047055648053 * t12;
+    t13 = -t8;
+    t11 = 0.8565128624172191 * t12;
+    t3 = 0.1280067049566611 * t12;
+    t5 = t3 - t2;
+    t0 = t13 - t11;
+    t14 = t9 - t3;
+    t10 = t11 - t8;
+    t1 = t5 + t0;
+    t6 = C1 * t1;
+    t12 = t5 * (-C5);
+    t2 = t0 * (-C6);
+    t13 = t6 - t2;
+    t9 = t6 + t12;
+    t3 = t14 + t10;
+    t11 = (-C2) * t3;
+    t8 = t14 * C7;
+    t1 = t10 * (-C8);
+    t5 = t11 - t1;
+    t0 = t11 + t8;
+    re[103] = t4;
+    im[103] = t7;
+    re[163] = t13;
+    im[163] = t9;
+    re[43] = t5;
+    im[43] = t0;
+    t2 = re[63];
+    t6 = im[63];
+    t12 = re[83];
+    t3 = im[83];
+    t14 = re[103];
+    t10 = im[103];
+    t1 = t12 + t14;
+    t11 = t3 + t10;
+    t8 = C3 * t1;
+    t4 = t2 - t8;
+    t7 = C3 * t11;
+    t13 = t6 - t7;
+    t9 = t12 - t14;
+    t5 = C4 * t9;
+    t0 = t3 - t10;
+    t8 = C4 * t0;
+    t7 = t2 + t1;
+    t12 = t6 + t11;
+    t14 = t4 + t8;
+    t9 = t13 - t5;
+    t3 = t4 - t8;
+    t10 = t13 + t5;
+    re[63] = t7;
+    im[63] = t12;
+    re[83] = t14;
+    im[83] = t9;
+    re[103] = t3;
+    im[103] = t10;
+    t0 = re[123];
+    t2 = im[123];
+    t1 = re[143];
+    t6 = im[143];
+    t11 = re[163];
+    t4 = im[163];
+    t8 = t1 + t11;
+    t13 = t6 + t4;
+    t5 = C3 * t8;
+    t7 = t0 - t5;
+    t12 = C3 * t13;
+    t14 = t2 - t12;
+    t9 = t1 - t11;
+    t3 = C4 * t9;
+    t10 = t6 - t4;
+    t5 = C4 * t10;
+    t12 = t0 + t8;
+    t1 = t2 + t13;
+    t11 = t7 + t5;
+    t9 = t14 - t3;
+    t6 = t7 - t5;
+    t4 = t14 + t3;
+    re[123] = t12;
+    im[123] = t1;
+    re[143] = t11;
+    im[143] = t9;
+    re[163] = t6;
+    im[163] = t4;
+    t10 = re[3];
+    t0 = im[3];
+    t8 = re[23];
+    t2 = im[23];
+    t13 = re[43];
+    t7 = im[43];
+    t5 = t8 + t13;
+    t14 = t2 + t7;
+    t3 = C3 * t5;
+    t12 = t10 - t3;
+    t1 = C3 * t14;
+    t11 = t0 - t1;
+    t9 = t8 - t13;
+    t6 = C4 * t9;
+    t4 = t2 - t7;
+    t3 = C4 * t4;
+    t1 = t10 + t5;
+    t8 = t0 + t14;
+    t13 = t12 + t3;
+    t9 = t11 - t6;
+    t2 = t12 - t3;
+    t7 = t11 + t6;
+    re[3] = t1;
+    im[3] = t8;
+    re[23] = t13;
+    im[23] = t9;
+    re[43] = t2;
+    im[43] = t7;
+    t4 = X[41];
+    t10 = 0.9832549075639546 * t4;
+    t5 = 0.18223552549214747 * t4;
+    t0 = 0.4916274537819773 * t4;
+    t14 = -t0;
+    t12 = 0.09111776274607374 * t4;
+    t3 = -t12;
+    t11 = 0.8515237283461047 * t4;
+    t6 = 0.15782059454820638 * t4;
+    t1 = t6 - t0;
+    t8 = t3 - t11;
+    t13 = t14 - t6;
+    t9 = t11 - t12;
+    re[99] = t10;
+    im[99] = t5;
+    re[159] = t1;
+    im[159] = t8;
+    re[39] = t13;
+    im[39] = t9;
+    t2 = X[1];
+    t7 = 0.9999619230641713 * t2;
+    t4 = 0.008726535498373935 * t2;
+    t0 = 0.49998096153208565 * t2;
+    t3 = -t0;
+    t14 = 0.004363267749186967 * t2;
+    t6 = -t14;
+    t11 = 0.8659924281907126 * t2;
+    t12 = 0.0075574014286185235 * t2;
+    t10 = t12 - t0;
+    t5 = t6 - t11;
+    t1 = t3 - t12;
+    t8 = t11 - t14;
+    t13 = t10 + t5;
+    t9 = C0 * t13;
+    t2 = t10 * (-C9);
+    t0 = t5 * C10;
+    t6 = t9 - t0;
+    t3 = t9 + t2;
+    t12 = t1 + t8;
+    t11 = C1 * t12;
+    t14 = t1 * (-C5);
+    t13 = t8 * (-C6);
+    t10 = t11 - t13;
+    t5 = t11 + t14;
+    re[119] = t7;
+    im[119] = t4;
+    re[179] = t6;
+    im[179] = t3;
+    re[59] = t10;
+    im[59] = t5;
+    t0 = X[38];
+    t9 = 0.9862856015372314 * t0;
+    t2 = (-0.16504760586067765) * t0;
+    t12 = 0.4931428007686157 * t0;
+    t1 = -t12;
+    t8 = (-0.08252380293033883) * t0;
+    t13 = -t8;
+    t11 = 0.8541483863180588 * t0;
+    t14 = (-0.14293541950914823) * t0;
+    t7 = t14 - t12;
+    t4 = t13 - t11;
+    t6 = t1 - t14;
+    t3 = t11 - t8;
+    t10 = t7 + t4;
+    t5 = C1 * t10;
+    t0 = t7 * (-C5);
+    t12 = t4 * (-C6);
+    t13 = t5 - t12;
+    t1 = t5 + t0;
+    t14 = t6 + t3;
+    t11 = (-C2) * t14;
+    t8 = t6 * C7;
+    t10 = t3 * (-C8);
+    t7 = t11 - t10;
+    t4 = t11 + t8;
+    re[139] = t9;
+    im[139] = t2;
+    re[19] = t13;
+    im[19] = t1;
+    re[79] = t7;
+    im[79] = t4;
+    t12 = re[99];
+    t5 = im[99];
+    t0 = re[119];
+    t14 = im[119];
+    t6 = re[139];
+    t3 = im[139];
+    t10 = t0 + t6;
+    t11 = t14 + t3;
+    t8 = C3 * t10;
+    t9 = t12 - t8;
+    t2 = C3 * t11;
+    t13 = t5 - t2;
+    t1 = t0 - t6;
+    t7 = C4 * t1;
+    t4 = t14 - t3;
+    t8 = C4 * t4;
+    t2 = t12 + t10;
+    t0 = t5 + t11;
+    t6 = t9 + t8;
+    t1 = t13 - t7;
+    t14 = t9 - t8;
+    t3 = t13 + t7;
+    re[99] = t2;
+    im[99] = t0;
+    re[119] = t6;
+    im[119] = t1;
+    re[139] = t14;
+    im[139] = t3;
+    t4 = re[159];
+    t12 = im[159];
+    t10 = re[179];
+    t5 = im[179];
+    t11 = re[19];
+    t9 = im[19];
+    t8 = t10 + t11;
+    t13 = t5 + t9;
+    t7 = C3 * t8;
+    t2 = t4 - t7;
+    t0 = C3 * t13;
+    t6 = t12 - t0;
+    t1 = t10 - t11;
+    t14 = C4 * t1;
+    t3 = t5 - t9;
+    t7 = C4 * t3;
+    t0 = t4 + t8;
+    t10 = t12 + t13;
+    t11 = t2 + t7;
+    t1 = t6 - t14;
+    t5 = t2 - t7;
+    t9 = t6 + t14;
+    re[159] = t0;
+    im[159] = t10;
+    re[179] = t11;
+    im[179] = t1;
+    re[19] = t5;
+    im[19] = t9;
+    t3 = re[39];
+    t4 = im[39];
+    t8 = re[59];
+    t12 = im[59];
+    t13 = re[79];
+    t2 = im[79];
+    t7 = t8 + t13;
+    t6 = t12 + t2;
+    t14 = C3 * t7;
+    t0 = t3 - t14;
+    t10 = C3 * t6;
+    t11 = t4 - t10;
+    t1 = t8 - t13;
+    t5 = C4 * t1;
+    t9 = t12 - t2;
+    t14 = C4 * t9;
+    t10 = t3 + t7;
+    t8 = t4 + t6;
+    t13 = t0 + t14;
+    t1 = t11 - t5;
+    t12 = t0 - t14;
+    t2 = t11 + t5;
+    re[39] = t10;
+    im[39] = t8;
+    re[59] = t13;
+    im[59] = t1;
+    re[79] = t12;
+    im[79] = t2;
+    t9 = re[135];
+    t3 = im[135];
+    t7 = re[171];
+    t4 = im[171];
+    t6 = re[27];
+    t0 = im[27];
+    t14 = re[63];
+    t11 = im[63];
+    t5 = re[99];
+    t10 = im[99];
+    t8 = t7 + t5;
+    t13 = t4 + t10;
+    t1 = t6 + t14;
+    t12 = t0 + t11;
+    t2 = t7 - t5;
+    t7 = t4 - t10;
+    t5 = t6 - t14;
+    t4 = t0 - t11;
+    t10 = t8 + t1;
+    t6 = t13 + t12;
+    t14 = t8 - t1;
+    t0 = C11 * t14;
+    t11 = t13 - t12;
+    t8 = C11 * t11;
+    t1 = C12 * t10;
+    t14 = t9 - t1;
+    t13 = C12 * t6;
+    t12 = t3 - t13;
+    t11 = t14 + t0;
+    t1 = t12 + t8;
+    t13 = t14 - t0;
+    t14 = t12 - t8;
+    t0 = C13 * t2;
+    t12 = C14 * t5;
+    t8 = t0 + t12;
+    t0 = C13 * t7;
+    t12 = C14 * t4;
+    t0 = t0 + t12;
+    t12 = C14 * t2;
+    t2 = C13 * t5;
+    t5 = t12 - t2;
+    t12 = C14 * t7;
+    t2 = C13 * t4;
+    t7 = t12 - t2;
+    t4 = t9 + t10;
+    t12 = t3 + t6;
+    t2 = t11 + t0;
+    t9 = t1 - t8;
+    t10 = t13 + t7;
+    t3 = t14 - t5;
+    t6 = t13 - t7;
+    t13 = t14 + t5;
+    t7 = t11 - t0;
+    t14 = t1 + t8;
+    re[135] = t4;
+    im[135] = t12;
+    re[171] = t2;
+    im[171] = t9;
+    re[27] = t10;
+    im[27] = t3;
+    re[63] = t6;
+    im[63] = t13;
+    re[99] = t7;
+    im[99] = t14;
+    t5 = re[15];
+    t11 = im[15];
+    t0 = re[51];
+    t1 = im[51];
+    t8 = re[87];
+    t4 = im[87];
+    t12 = re[123];
+    t2 = im[123];
+    t9 = re[159];
+    t10 = im[159];
+    t3 = t0 + t9;
+    t6 = t1 + t10;
+    t13 = t8 + t12;
+    t7 = t4 + t2;
+    t14 = t0 - t9;
+    t0 = t1 - t10;
+    t9 = t8 - t12;
+    t1 = t4 - t2;
+    t10 = t3 + t13;
+    t8 = t6 + t7;
+    t12 = t3 - t13;
+    t4 = C11 * t12;
+    t2 = t6 - t7;
+    t3 = C11 * t2;
+    t13 = C12 * t10;
+    t12 = t5 - t13;
+    t6 = C12 * t8;
+    t7 = t11 - t6;
+    t2 = t12 + t4;
+    t13 = t7 + t3;
+    t6 = t12 - t4;
+    t12 = t7 - t3;
+    t4 = C13 * t14;
+    t7 = C14 * t9;
+    t3 = t4 + t7;
+    t4 = C13 * t0;
+    t7 = C14 * t1;
+    t4 = t4 + t7;
+    t7 = C14 * t14;
+    t14 = C13 * t9;
+    t9 = t7 - t14;
+    t7 = C14 * t0;
+    t14 = C13 * t1;
+    t0 = t7 - t14;
+    t1 = t5 + t10;
+    t7 = t11 + t8;
+    t14 = t2 + t4;
+    t5 = t13 - t3;
+    t10 = t6 + t0;
+    t11 = t12 - t9;
+    t8 = t6 - t0;
+    t6 = t12 + t9;
+    t0 = t2 - t4;
+    t12 = t13 + t3;
+    re[15] = t1;
+    im[15] = t7;
+    re[51] = t14;
+    im[51] = t5;
+    re[87] = t10;
+    im[87] = t11;
+    re[123] = t8;
+    im[123] = t6;
+    re[159] = t0;
+    im[159] = t12;
+    t9 = re[75];
+    t2 = im[75];
+    t4 = re[111];
+    t13 = im[111];
+    t3 = re[147];
+    t1 = im[147];
+    t7 = re[3];
+    t14 = im[3];
+    t5 = re[39];
+    t10 = im[39];
+    t11 = t4 + t5;
+    t8 = t13 + t10;
+    t6 = t3 + t7;
+    t0 = t1 + t14;
+    t12 = t4 - t5;
+    t4 = t13 - t10;
+    t5 = t3 - t7;
+    t13 = t1 - t14;
+    t10 = t11 + t6;
+    t3 = t8 + t0;
+    t7 = t11 - t6;
+    t1 = C11 * t7;
+    t14 = t8 - t0;
+    t11 = C11 * t14;
+    t6 = C12 * t10;
+    t7 = t9 - t6;
+    t8 = C12 * t3;
+    t0 = t2 - t8;
+    t14 = t7 + t1;
+    t6 = t0 + t11;
+    t8 = t7 - t1;
+    t7 = t0 - t11;
+    t1 = C13 * t12;
+    t0 = C14 * t5;
+    t11 = t1 + t0;
+    t1 = C13 * t4;
+    t0 = C14 * t13;
+    t1 = t1 + t0;
+    t0 = C14 * t12;
+    t12 = C13 * t5;
+    t5 = t0 - t12;
+    t0 = C14 * t4;
+    t12 = C13 * t13;
+    t4 = t0 - t12;
+    t13 = t9 + t10;
+    t0 = t2 + t3;
+    t12 = t14 + t1;
+    t9 = t6 - t11;
+    t10 = t8 + t4;
+    t2 = t7 - t5;
+    t3 = t8 - t4;
+    t8 = t7 + t5;
+    t4 = t14 - t1;
+    t7 = t6 + t11;
+    re[75] = t13;
+    im[75] = t0;
+    re[111] = t12;
+    im[111] = t9;
+    re[147] = t10;
+    im[147] = t2;
+    re[3] = t3;
+    im[3] = t8;
+    re[39] = t4;
+    im[39] = t7;
+    t5 = re[155];
+    t14 = im[155];
+    t1 = re[11];
+    t6 = im[11];
+    t11 = re[47];
+    t13 = im[47];
+    t0 = re[83];
+    t12 = im[83];
+    t9 = re[119];
+    t10 = im[119];
+    t2 = t1 + t9;
+    t3 = t6 + t10;
+    t8 = t11 + t0;
+    t4 = t13 + t12;
+    t7 = t1 - t9;
+    t1 = t6 - t10;
+    t9 = t11 - t0;
+    t6 = t13 - t12;
+    t10 = t2 + t8;
+    t11 = t3 + t4;
+    t0 = t2 - t8;
+    t13 = C11 * t0;
+    t12 = t3 - t4;
+    t2 = C11 * t12;
+    t8 = C12 * t10;
+    t0 = t5 - t8;
+    t3 = C12 * t11;
+    t4 = t14 - t3;
+    t12 = t0 + t13;
+    t8 = t4 + t2;
+    t3 = t0 - t13;
+    t0 = t4 - t2;
+    t13 = C13 * t7;
+    t4 = C14 * t9;
+    t2 = t13 + t4;
+    t13 = C13 * t1;
+    t4 = C14 * t6;
+    t13 = t13 + t4;
+    t4 = C14 * t7;
+    t7 = C13 * t9;
+    t9 = t4 - t7;
+    t4 = C14 * t1;
+    t7 = C13 * t6;
+    t1 = t4 - t7;
+    t6 = t5 + t10;
+    t4 = t14 + t11;
+    t7 = t12 + t13;
+    t5 = t8 - t2;
+    t10 = t3 + t1;
+    t14 = t0 - t9;
+    t11 = t3 - t1;
+    t3 = t0 + t9;
+    t1 = t12 - t13;
+    t0 = t8 + t2;
+    re[155] = t6;
+    im[155] = t4;
+    re[11] = t7;
+    im[11] = t5;
+    re[47] = t10;
+    im[47] = t14;
+    re[83] = t11;
+    im[83] = t3;
+    re[119] = t1;
+    im[119] = t0;
+    t9 = re[35];
+    t12 = im[35];
+    t13 = re[71];
+    t8 = im[71];
+    t2 = re[107];
+    t6 = im[107];
+    t4 = re[143];
+    t7 = im[143];
+    t5 = re[179];
+    t10 = im[179];
+    t14 = t13 + t5;
+    t11 = t8 + t10;
+    t3 = t2 + t4;
+    t1 = t6 + t7;
+    t0 = t13 - t5;
+    t13 = t8 - t10;
+    t5 = t2 - t4;
+    t8 = t6 - t7;
+    t10 = t14 + t3;
+    t2 = t11 + t1;
+    t4 = t14 - t3;
+    t6 = C11 * t4;
+    t7 = t11 - t1;
+    t14 = C11 * t7;
+    t3 = C12 * t10;
+    t4 = t9 - t3;
+    t11 = C12 * t2;
+    t1 = t12 - t11;
+    t7 = t4 + t6;
+    t3 = t1 + t14;
+    t11 = t4 - t6;
+    t4 = t1 - t14;
+    t6 = C13 * t0;
+    t1 = C14 * t5;
+    t14 = t6 + t1;
+    t6 = C13 * t13;
+    t1 = C14 * t8;
+    t6 = t6 + t1;
+    t1 = C14 * t0;
+    t0 = C13 * t5;
+    t5 = t1 - t0;
+    t1 = C14 * t13;
+    t0 = C13 * t8;
+    t13 = t1 - t0;
+    t8 = t9 + t10;
+    t1 = t12 + t2;
+    t0 = t7 + t6;
+    t9 = t3 - t14;
+    t10 = t11 + t13;
+    t12 = t4 - t5;
+    t2 = t11 - t13;
+    t11 = t4 + t5;
+    t13 = t7 - t6;
+    t4 = t3 + t14;
+    re[35] = t8;
+    im[35] = t1;
+    re[71] = t0;
+    im[71] = t9;
+    re[107] = t10;
+    im[107] = t12;
+    re[143] = t2;
+    im[143] = t11;
+    re[179] = t13;
+    im[179] = t4;
+    t5 = re[95];
+    t7 = im[95];
+    t6 = re[131];
+    t3 = im[131];
+    t14 = re[167];
+    t8 = im[167];
+    t1 = re[23];
+    t0 = im[23];
+    t9 = re[59];
+    t10 = im[59];
+    t12 = t6 + t9;
+    t2 = t3 + t10;
+    t11 = t14 + t1;
+    t13 = t8 + t0;
+    t4 = t6 - t9;
+    t6 = t3 - t10;
+    t9 = t14 - t1;
+    t3 = t8 - t0;
+    t10 = t12 + t11;
+    t14 = t2 + t13;
+    t1 = t12 - t11;
+    t8 = C11 * t1;
+    t0 = t2 - t13;
+    t12 = C11 * t0;
+    t11 = C12 * t10;
+    t1 = t5 - t11;
+    t2 = C12 * t14;
+    t13 = t7 - t2;
+    t0 = t1 + t8;
+    t11 = t13 + t12;
+    t2 = t1 - t8;
+    t1 = t13 - t12;
+    t8 = C13 * t4;
+    t13 = C14 * t9;
+    t12 = t8 + t13;
+    t8 = C13 * t6;
+    t13 = C14 * t3;
+    t8 = t8 + t13;
+    t13 = C14 * t4;
+    t4 = C13 * t9;
+    t9 = t13 - t4;
+    t13 = C14 * t6;
+    t4 = C13 * t3;
+    t6 = t13 - t4;
+    t3 = t5 + t10;
+    t13 = t7 + t14;
+    t4 = t0 + t8;
+    t5 = t11 - t12;
+    t10 = t2 + t6;
+    t7 = t1 - t9;
+    t14 = t2 - t6;
+    t2 = t1 + t9;
+    t6 = t0 - t8;
+    t1 = t11 + t12;
+    re[95] = t3;
+    im[95] = t13;
+    re[131] = t4;
+    im[131] = t5;
+    re[167] = t10;
+    im[167] = t7;
+    re[23] = t14;
+    im[23] = t2;
+    re[59] = t6;
+    im[59] = t1;
+    t9 = re[175];
+    t0 = im[175];
+    t8 = re[31];
+    t11 = im[31];
+    t12 = re[67];
+    t3 = im[67];
+    t13 = re[103];
+    t4 = im[103];
+    t5 = re[139];
+    t10 = im[139];
+    t7 = t8 + t5;
+    t14 = t11 + t10;
+    t2 = t12 + t13;
+    t6 = t3 + t4;
+    t1 = t8 - t5;
+    t8 = t11 - t10;
+    t5 = t12 - t13;
+    t11 = t3 - t4;
+    t10 = t7 + t2;
+    t12 = t14 + t6;
+    t13 = t7 - t2;
+    t3 = C11 * t13;
+    t4 = t14 - t6;
+    t7 = C11 * t4;
+    t2 = C12 * t10;
+    t13 = t9 - t2;
+    t14 = C12 * t12;
+    t6 = t0 - t14;
+    t4 = t13 + t3;
+    t2 = t6 + t7;
+    t14 = t13 - t3;
+    t13 = t6 - t7;
+    t3 = C13 * t1;
+    t6 = C14 * t5;
+    t7 = t3 + t6;
+    t3 = C13 * t8;
+    t6 = C14 * t11;
+    t3 = t3 + t6;
+    t6 = C14 * t1;
+    t1 = C13 * t5;
+    t5 = t6 - t1;
+    t6 = C14 * t8;
+    t1 = C13 * t11;
+    t8 = t6 - t1;
+    t11 = t9 + t10;
+    t6 = t0 + t12;
+    t1 = t4 + t3;
+    t9 = t2 - t7;
+    t10 = t14 + t8;
+    t0 = t13 - t5;
+    t12 = t14 - t8;
+    t14 = t13 + t5;
+    t8 = t4 - t3;
+    t13 = t2 + t7;
+    re[175] = t11;
+    im[175] = t6;
+    re[31] = t1;
+    im[31] = t9;
+    re[67] = t10;
+    im[67] = t0;
+    re[103] = t12;
+    im[103] = t14;
+    re[139] = t8;
+    im[139] = t13;
+    t5 = re[55];
+    t4 = im[55];
+    t3 = re[91];
+    t2 = im[91];
+    t7 = re[127];
+    t11 = im[127];
+    t6 = re[163];
+    t1 = im[163];
+    t9 = re[19];
+    t10 = im[19];
+    t0 = t3 + t9;
+    t12 = t2 + t10;
+    t14 = t7 + t6;
+    t8 = t11 + t1;
+    t13 = t3 - t9;
+    t3 = t2 - t10;
+    t9 = t7 - t6;
+    t2 = t11 - t1;
+    t10 = t0 + t14;
+    t7 = t12 + t8;
+    t6 = t0 - t14;
+    t11 = C11 * t6;
+    t1 = t12 - t8;
+    t0 = C11 * t1;
+    t14 = C12 * t10;
+    t6 = t5 - t14;
+    t12 = C12 * t7;
+    t8 = t4 - t12;
+    t1 = t6 + t11;
+    t14 = t8 + t0;
+    t12 = t6 - t11;
+    t6 = t8 - t0;
+    t11 = C13 * t13;
+    t8 = C14 * t9;
+    t0 = t11 + t8;
+    t11 = C13 * t3;
+    t8 = C14 * t2;
+    t11 = t11 + t8;
+    t8 = C14 * t13;
+    t13 = C13 * t9;
+    t9 = t8 - t13;
+    t8 = C14 * t3;
+    t13 = C13 * t2;
+    t3 = t8 - t13;
+    t2 = t5 + t10;
+    t8 = t4 + t7;
+    t13 = t1 + t11;
+    t5 = t14 - t0;
+    t10 = t12 + t3;
+    t4 = t6 - t9;
+    t7 = t12 - t3;
+    t12 = t6 + t9;
+    t3 = t1 - t11;
+    t6 = t14 + t0;
+    re[55] = t2;
+    im[55] = t8;
+    re[91] = t13;
+    im[91] = t5;
+    re[127] = t10;
+    im[127] = t4;
+    re[163] = t7;
+    im[163] = t12;
+    re[19] = t3;
+    im[19] = t6;
+    t9 = re[115];
+    t1 = im[115];
+    t11 = re[151];
+    t14 = im[151];
+    t0 = re[7];
+    t2 = im[7];
+    t8 = re[43];
+    t13 = im[43];
+    t5 = re[79];
+    t10 = im[79];
+    t4 = t11 + t5;
+    t7 = t14 + t10;
+    t12 = t0 + t8;
+    t3 = t2 + t13;
+    t6 = t11 - t5;
+    t11 = t14 - t10;
+    t5 = t0 - t8;
+    t14 = t2 - t13;
+    t10 = t4 + t12;
+    t0 = t7 + t3;
+    t8 = t4 - t12;
+    t2 = C11 * t8;
+    t13 = t7 - t3;
+    t4 = C11 * t13;
+    t12 = C12 * t10;
+    t8 = t9 - t12;
+    t7 = C12 * t0;
+    t3 = t1 - t7;
+    t13 = t8 + t2;
+    t12 = t3 + t4;
+    t7 = t8 - t2;
+    t8 = t3 - t4;
+    t2 = C13 * t6;
+    t3 = C14 * t5;
+    t4 = t2 + t3;
+    t2 = C13 * t11;
+    t3 = C14 * t14;
+    t2 = t2 + t3;
+    t3 = C14 * t6;
+    t6 = C13 * t5;
+    t5 = t3 - t6;
+    t3 = C14 * t11;
+    t6 = C13 * t14;
+    t11 = t3 - t6;
+    t14 = t9 + t10;
+    t3 = t1 + t0;
+    t6 = t13 + t2;
+    t9 = t12 - t4;
+    t10 = t7 + t11;
+    t1 = t8 - t5;
+    t0 = t7 - t11;
+    t7 = t8 + t5;
+    t11 = t13 - t2;
+    t8 = t12 + t4;
+    re[115] = t14;
+    im[115] = t3;
+    re[151] = t6;
+    im[151] = t9;
+    re[7] = t10;
+    im[7] = t1;
+    re[43] = t0;
+    im[43] = t7;
+    re[79] = t11;
+    im[79] = t8;
+    t5 = re[0];
+    t13 = im[0];
+    t2 = re[45];
+    t12 = im[45];
+    t4 = re[90];
+    t14 = im[90];
+    t3 = re[135];
+    t6 = im[135];
+    t9 = t5 + t4;
+    t10 = t13 + t14;
+    t1 = t2 + t3;
+    t0 = t12 + t6;
+    t7 = t5 - t4;
+    t11 = t13 - t14;
+    t8 = t2 - t3;
+    t5 = t12 - t6;
+    t4 = t9 + t1;
+    t13 = t10 + t0;
+    t14 = t7 + t5;
+    t2 = t11 - t8;
+    t3 = t9 - t1;
+    t12 = t10 - t0;
+    t6 = t7 - t5;
+    t9 = t11 + t8;
+    t1 = (-C15) * t4;
+    t10 = (-C16) * t13;
+    t0 = t1 + t10;
+    t7 = 0.07256106269182623 * t0;
+    y[539] = t7;
+    t5 = 0.07225232704692253 * t0;
+    y[540] = t5;
+    t11 = C16 * t4;
+    t8 = (-C15) * t13;
+    t1 = t11 + t8;
+    t10 = 0.038067478102163245 * t1;
+    y[179] = t10;
+    t7 = (-0.03865835992204059) * t1;
+    y[180] = t7;
+    t0 = (-C17) * t14;
+    t5 = (-C18) * t2;
+    t4 = t0 + t5;
+    t13 = 0.07634133969483003 * t4;
+    y[449] = t13;
+    t11 = 0.02600882290369695 * t4;
+    y[630] = t11;
+    t8 = C18 * t14;
+    t10 = (-C17) * t2;
+    t1 = t8 + t10;
+    t7 = 0.0005948867419687272 * t1;
+    y[89] = t7;
+    t0 = (-0.07256989822004814) * t1;
+    y[270] = t0;
+    t5 = C19 * t3;
+    t13 = C20 * t12;
+    t4 = t5 + t13;
+    y[0] = 0;
+    t11 = (-0.07455064005974621) * t4;
+    y[359] = t11;
+    t14 = (-C20) * t3;
+    t2 = C19 * t12;
+    t8 = t14 + t2;
+    t10 = 0.07452056147476713 * t8;
+    y[360] = t10;
+    t7 = 0.00012831502283879977 * t8;
+    y[719] = t7;
+    t1 = C21 * t6;
+    t0 = C22 * t9;
+    t5 = t1 + t0;
+    t13 = 0.0006858251109706325 * t5;
+    y[90] = t13;
+    t4 = (-0.07244348493003379) * t5;
+    y[269] = t4;
+    t11 = (-C22) * t6;
+    t3 = C21 * t9;
+    t12 = t11 + t3;
+    t14 = 0.07643673051777489 * t12;
+    y[450] = t14;
+    t2 = 0.02655548754157034 * t12;
+    y[629] = t2;
+    t10 = re[96];
+    t8 = im[96];
+    t7 = re[141];
+    t1 = im[141];
+    t0 = re[6];
+    t13 = im[6];
+    t5 = re[51];
+    t4 = im[51];
+    t6 = t10 + t0;
+    t9 = t8 + t13;
+    t11 = t7 + t5;
+    t3 = t1 + t4;
+    t14 = t10 - t0;
+    t12 = t8 - t13;
+    t2 = t7 - t5;
+    t10 = t1 - t4;
+    t0 = t6 + t11;
+    t8 = t9 + t3;
+    t13 = t14 + t10;
+    t7 = t12 - t2;
+    t5 = t6 - t11;
+    t1 = t9 - t3;
+    t4 = t14 - t10;
+    t6 = t12 + t2;
+    t11 = C23 * t0;
+    t9 = C24 * t8;
+    t3 = t11 + t9;
+    t14 = 0.0008904224612424559 * t3;
+    y[92] = t14;
+    t10 = (-0.07217823591153531) * t3;
+    y[267] = t10;
+    t12 = (-C24) * t0;
+    t2 = C23 * t8;
+    t11 = t12 + t2;
+    t9 = 0.07662874054739717 * t11;
+    y[452] = t9;
+    t14 = 0.027659053756716335 * t11;
+    y[627] = t14;
+    t3 = (-C25) * t13;
+    t10 = (-C26) * t7;
+    t0 = t3 + t10;
+    t8 = 0.07315722926378804 * t0;
+    y[537] = t8;
+    t12 = 0.07161384860400806 * t0;
+    y[542] = t12;
+    t2 = C26 * t13;
+    t9 = (-C25) * t7;
+    t11 = t2 + t9;
+    t14 = 0.03688166728156738 * t11;
+    y[177] = t14;
+    t3 = (-0.03983635585871724) * t11;
+    y[182] = t3;
+    t10 = (-C27) * t5;
+    t8 = (-C28) * t1;
+    t0 = t10 + t8;
+    t12 = 0.07615249922661345 * t0;
+    y[447] = t12;
+    t13 = 0.02492643432648059 * t0;
+    y[632] = t13;
+    t7 = C28 * t5;
+    t2 = (-C27) * t1;
+    t9 = t7 + t2;
+    t14 = 0.00043428713575801746 * t9;
+    y[87] = t14;
+    t11 = (-0.07281087793701063) * t9;
+    y[272] = t11;
+    t3 = C29 * t4;
+    t10 = C30 * t6;
+    t8 = t3 + t10;
+    y[2] = 0;
+    t12 = (-0.07461077435802718) * t8;
+    y[357] = t12;
+    t0 = (-C30) * t4;
+    t13 = C29 * t6;
+    t5 = t0 + t13;
+    t1 = 0.07446049988566894 * t5;
+    y[362] = t1;
+    t7 = 0.00020042753244037563 * t5;
+    y[717] = t7;
+    t2 = re[12];
+    t14 = im[12];
+    t9 = re[57];
+    t11 = im[57];
+    t3 = re[102];
+    t10 = im[102];
+    t8 = re[147];
+    t12 = im[147];
+    t4 = t2 + t3;
+    t6 = t14 + t10;
+    t0 = t9 + t8;
+    t13 = t11 + t12;
+    t1 = t2 - t3;
+    t5 = t14 - t10;
+    t7 = t9 - t8;
+    t2 = t11 - t12;
+    t3 = t4 + t0;
+    t14 = t6 + t13;
+    t10 = t1 + t2;
+    t9 = t5 - t7;
+    t8 = t4 - t0;
+    t11 = t6 - t13;
+    t12 = t1 - t2;
+    t4 = t5 + t7;
+    t0 = C31 * t3;
+    t6 = C32 * t14;
+    t13 = t0 + t6;
+    y[4] = 0;
+    t1 = (-0.0746705385692672) * t13;
+    y[355] = t1;
+    t2 = (-C32) * t3;
+    t5 = C31 * t14;
+    t7 = t2 + t5;
+    t0 = 0.0744009037835185 * t7;
+    y[364] = t0;
+    t6 = 0.0002839913808099415 * t7;
+    y[715] = t6;
+    t13 = C33 * t10;
+    t1 = C34 * t9;
+    t3 = t13 + t1;
+    t14 = 0.001126420177114152 * t3;
+    y[94] = t14;
+    t2 = (-0.07189555032362745) * t3;
+    y[265] = t2;
+    t5 = (-C34) * t10;
+    t0 = C33 * t9;
+    t7 = t5 + t0;
+    t6 = 0.07682175494009395 * t7;
+    y[454] = t6;
+    t13 = 0.02877541433401703 * t7;
+    y[625] = t13;
+    t1 = (-C35) * t8;
+    t14 = (-C36) * t11;
+    t3 = t1 + t14;
+    t2 = 0.07372511469768803 * t3;
+    y[535] = t2;
+    t10 = 0.07094747087527041 * t3;
+    y[544] = t10;
+    t9 = C36 * t8;
+    t5 = (-C35) * t11;
+    t0 = t9 + t5;
+    t6 = 0.03569218332318732 * t0;
+    y[175] = t6;
+    t7 = (-0.041007537677709524) * t0;
+    y[184] = t7;
+    t13 = (-C37) * t12;
+    t1 = (-C38) * t4;
+    t14 = t13 + t1;
+    t2 = 0.07596722926088151 * t14;
+    y[445] = t2;
+    t3 = 0.023859207739252954 * t14;
+    y[634] = t3;
+    t10 = C38 * t12;
+    t8 = (-C37) * t4;
+    t11 = t10 + t8;
+    t9 = 0.0002998948177058382 * t11;
+    y[85] = t9;
+    t5 = (-0.07303676015017009) * t11;
+    y[274] = t5;
+    t6 = re[128];
+    t0 = im[128];
+    t7 = re[173];
+    t13 = im[173];
+    t1 = re[38];
+    t2 = im[38];
+    t14 = re[83];
+    t3 = im[83];
+    t12 = t6 + t1;
+    t4 = t0 + t2;
+    t10 = t7 + t14;
+    t8 = t13 + t3;
+    t9 = t6 - t1;
+    t11 = t0 - t2;
+    t5 = t7 - t14;
+    t6 = t13 - t3;
+    t1 = t12 + t10;
+    t0 = t4 + t8;
+    t2 = t9 + t6;
+    t7 = t11 - t5;
+    t14 = t12 - t10;
+    t13 = t4 - t8;
+    t3 = t9 - t6;
+    t12 = t11 + t5;
+    t10 = (-C39) * t1;
+    t4 = (-C40) * t0;
+    t8 = t10 + t4;
+    t9 = 0.07581464632180492 * t8;
+    y[443] = t9;
+    t6 = 0.022808210591671367 * t8;
+    y[636] = t6;
+    t11 = C40 * t1;
+    t5 = (-C39) * t0;
+    t10 = t11 + t5;
+    y[83] = 0;
+    t4 = (-0.07327813061310468) * t10;
+    y[276] = t4;
+    t9 = C41 * t2;
+    t8 = C42 * t7;
+    t6 = t9 + t8;
+    y[6] = 0;
+    t1 = (-0.07472961231384904) * t6;
+    y[353] = t1;
+    t0 = (-C42) * t2;
+    t11 = C41 * t7;
+    t5 = t0 + t11;
+    t10 = 0.07434208988296852 * t5;
+    y[366] = t10;
+    t4 = 0.0003841335513603814 * t5;
+    y[713] = t4;
+    t9 = C43 * t14;
+    t8 = C44 * t13;
+    t6 = t9 + t8;
+    t1 = 0.0013951437018800152 * t6;
+    y[96] = t1;
+    t2 = (-0.07159449802127518) * t6;
+    y[263] = t2;
+    t7 = (-C44) * t14;
+    t0 = C43 * t13;
+    t11 = t7 + t0;
+    t10 = 0.07701480239856939 * t11;
+    y[456] = t10;
+    t5 = 0.02990332649322146 * t11;
+    y[623] = t5;
+    t4 = (-C45) * t3;
+    t9 = (-C46) * t12;
+    t8 = t4 + t9;
+    t1 = 0.07426485204615321 * t8;
+    y[533] = t1;
+    t6 = 0.07025377921076166 * t8;
+    y[546] = t6;
+    t2 = C46 * t3;
+    t14 = (-C45) * t12;
+    t13 = t2 + t14;
+    t7 = 0.03450067624018114 * t13;
+    y[173] = t7;
+    t0 = (-0.04217005188954833) * t13;
+    y[186] = t0;
+    t10 = re[44];
+    t11 = im[44];
+    t5 = re[89];
+    t4 = im[89];
+    t9 = re[134];
+    t1 = im[134];
+    t8 = re[179];
+    t6 = im[179];
+    t3 = t10 + t9;
+    t12 = t11 + t1;
+    t2 = t5 + t8;
+    t14 = t4 + t6;
+    t7 = t10 - t9;
+    t13 = t11 - t1;
+    t0 = t5 - t8;
+    t10 = t4 - t6;
+    t9 = t3 + t2;
+    t11 = t12 + t14;
+    t1 = t7 + t10;
+    t5 = t13 - t0;
+    t8 = t3 - t2;
+    t4 = t12 - t14;
+    t6 = t7 - t10;
+    t3 = t13 + t0;
+    t2 = (-C47) * t9;
+    t12 = (-C48) * t11;
+    t14 = t2 + t12;
+    t7 = 0.07477620946977974 * t14;
+    y[531] = t7;
+    t10 = 0.06953296335829233 * t14;
+    y[548] = t10;
+    t13 = C48 * t9;
+    t0 = (-C47) * t11;
+    t2 = t13 + t0;
+    t12 = 0.03330865582833472 * t2;
+    y[171] = t12;
+    t7 = (-0.043322682886716854) * t2;
+    y[188] = t7;
+    t14 = (-C49) * t1;
+    t10 = (-C50) * t5;
+    t9 = t14 + t10;
+    t11 = 0.07562514791656519 * t9;
+    y[441] = t11;
+    t13 = 0.02177426790135979 * t9;
+    y[638] = t13;
+    t0 = C50 * t1;
+    t12 = (-C49) * t5;
+    t2 = t0 + t12;
+    y[81] = 0;
+    t7 = (-0.07346174795829588) * t2;
+    y[278] = t7;
+    t14 = C51 * t8;
+    t10 = C52 * t4;
+    t11 = t14 + t10;
+    y[8] = 0;
+    t9 = (-0.07478763968520208) * t11;
+    y[351] = t9;
+    t13 = (-C52) * t8;
+    t1 = C51 * t4;
+    t5 = t13 + t1;
+    t0 = 0.07428440821157253 * t5;
+    y[368] = t0;
+    t12 = 0.0005022724154049494 * t5;
+    y[711] = t12;
+    t2 = C53 * t6;
+    t7 = C54 * t3;
+    t14 = t2 + t7;
+    t10 = 0.0016976417542155023 * t14;
+    y[98] = t10;
+    t11 = (-0.07127424888219953) * t14;
+    y[261] = t11;
+    t9 = (-C54) * t6;
+    t8 = C53 * t3;
+    t4 = t9 + t8;
+    t13 = 0.07720681608342408 * t4;
+    y[458] = t13;
+    t1 = 0.031041726260868836 * t4;
+    y[621] = t1;
+    t0 = re[140];
+    t5 = im[140];
+    t12 = re[5];
+    t2 = im[5];
+    t7 = re[50];
+    t10 = im[50];
+    t14 = re[95];
+    t11 = im[95];
+    t6 = t0 + t7;
+    t3 = t5 + t10;
+    t9 = t12 + t14;
+    t8 = t2 + t11;
+    t13 = t0 - t7;
+    t4 = t5 - t10;
+    t1 = t12 - t14;
+    t0 = t2 - t11;
+    t7 = t6 + t9;
+    t5 = t3 + t8;
+    t10 = t13 + t0;
+    t12 = t4 - t1;
+    t14 = t6 - t9;
+    t2 = t3 - t8;
+    t11 = t13 - t0;
+    t6 = t4 + t1;
+    t9 = C55 * t7;
+    t3 = C56 * t5;
+    t8 = t9 + t3;
+    t13 = 0.0020347072928291257 * t8;
+    y[100] = t13;
+    t0 = (-0.07093433826861917) * t8;
+    y[259] = t0;
+    t4 = (-C56) * t7;
+    t1 = C55 * t5;
+    t9 = t4 + t1;
+    t3 = 0.07739634901064964 * t9;
+    y[460] = t3;
+    t13 = 0.032189767200842816 * t9;
+    y[619] = t13;
+    t8 = (-C57) * t10;
+    t0 = (-C58) * t12;
+    t7 = t8 + t0;
+    t5 = 0.07525864895163345 * t7;
+    y[529] = t5;
+    t4 = 0.06878508710053848 * t7;
+    y[550] = t4;
+    t1 = C58 * t10;
+    t3 = (-C57) * t12;
+    t9 = t1 + t3;
+    t13 = 0.03211724980597228 * t9;
+    y[169] = t13;
+    t8 = (-0.04446489243213255) * t9;
+    y[190] = t8;
+    t0 = (-C59) * t14;
+    t5 = (-C60) * t2;
+    t7 = t0 + t5;
+    t4 = 0.07544569193026901 * t7;
+    y[439] = t4;
+    t10 = 0.02075805547774038 * t7;
+    y[640] = t10;
+    t12 = C60 * t14;
+    t1 = (-C59) * t2;
+    t3 = t12 + t1;
+    y[79] = 0;
+    t13 = (-0.07363648491275424) * t3;
+    y[280] = t13;
+    t9 = C61 * t11;
+    t8 = C62 * t6;
+    t0 = t9 + t8;
+    y[10] = 0;
+    t5 = (-0.07484429201598877) * t0;
+    y[349] = t5;
+    t4 = (-C62) * t11;
+    t7 = C61 * t6;
+    t10 = t4 + t7;
+    t14 = 0.07422817967693168 * t10;
+    y[370] = t14;
+    t2 = 0.0006397848555590884 * t10;
+    y[709] = t2;
+    t12 = re[76];
+    t1 = im[76];
+    t3 = re[121];
+    t13 = im[121];
+    t9 = re[166];
+    t8 = im[166];
+    t0 = re[31];
+    t5 = im[31];
+    t11 = t12 + t9;
+    t6 = t1 + t8;
+    t4 = t3 + t0;
+    t7 = t13 + t5;
+    t14 = t12 - t9;
+    t10 = t1 - t8;
+    t2 = t3 - t0;
+    t12 = t13 - t5;
+    t9 = t11 + t4;
+    t1 = t6 + t7;
+    t8 = t14 + t12;
+    t3 = t10 - t2;
+    t0 = t11 - t4;
+    t13 = t6 - t7;
+    t5 = t14 - t12;
+    t11 = t10 + t2;
+    t4 = C63 * t9;
+    t6 = C64 * t1;
+    t7 = t4 + t6;
+    y[12] = 0;
+    t14 = (-0.07489920785476051) * t7;
+    y[347] = t14;
+    t12 = (-C64) * t9;
+    t10 = C63 * t1;
+    t2 = t12 + t10;
+    t4 = 0.07417375583368668 * t2;
+    y[372] = t4;
+    t6 = 0.0007979837397111069 * t2;
+    y[707] = t6;
+    t7 = C65 * t8;
+    t14 = C66 * t3;
+    t9 = t7 + t14;
+    t1 = 0.0024068981659060083 * t9;
+    y[102] = t1;
+    t12 = (-0.07057379992151286) * t9;
+    y[257] = t12;
+    t10 = (-C66) * t8;
+    t4 = C65 * t3;
+    t2 = t10 + t4;
+    t6 = 0.07758254548835453 * t2;
+    y[462] = t6;
+    t7 = 0.033346035987584 * t2;
+    y[617] = t7;
+    t14 = (-C67) * t0;
+    t1 = (-C68) * t13;
+    t9 = t14 + t1;
+    t12 = 0.07571198972050501 * t9;
+    y[527] = t12;
+    t8 = 0.0680104978428295 * t9;
+    y[552] = t8;
+    t3 = C68 * t0;
+    t10 = (-C67) * t13;
+    t4 = t3 + t10;
+    t6 = 0.0309286123492606 * t4;
+    y[167] = t6;
+    t2 = (-0.04559496117904212) * t4;
+    y[192] = t2;
+    t7 = (-C69) * t5;
+    t14 = (-C70) * t11;
+    t1 = t7 + t14;
+    t12 = 0.07527606842734347 * t1;
+    y[437] = t12;
+    t9 = 0.019760759384634594 * t1;
+    y[642] = t9;
+    t8 = C70 * t5;
+    t0 = (-C69) * t11;
+    t13 = t8 + t0;
+    y[77] = 0;
+    t3 = (-0.07380241385637434) * t13;
+    y[282] = t3;
+    t10 = re[172];
+    t6 = im[172];
+    t4 = re[37];
+    t2 = im[37];
+    t7 = re[82];
+    t14 = im[82];
+    t12 = re[127];
+    t1 = im[127];
+    t9 = t10 + t7;
+    t5 = t6 + t14;
+    t11 = t4 + t12;
+    t8 = t2 + t1;
+    t0 = t10 - t7;
+    t13 = t6 - t14;
+    t3 = t4 - t12;
+    t10 = t2 - t1;
+    t7 = t9 + t11;
+    t6 = t5 + t8;
+    t14 = t0 + t10;
+    t4 = t13 - t3;
+    t12 = t9 - t11;
+    t2 = t5 - t8;
+    t1 = t0 - t10;
+    t9 = t13 + t3;
+    t11 = (-C71) * t7;
+    t5 = (-C72) * t6;
+    t8 = t11 + t5;
+    t0 = 0.07511619859431522 * t8;
+    y[435] = t0;
+    t10 = 0.018783265486367183 * t8;
+    y[644] = t10;
+    t13 = C72 * t7;
+    t3 = (-C71) * t6;
+    t11 = t13 + t3;
+    y[75] = 0;
+    t5 = (-0.07395948756086279) * t11;
+    y[284] = t5;
+    t0 = C73 * t14;
+    t8 = C74 * t4;
+    t10 = t0 + t8;
+    y[14] = 0;
+    t7 = (-0.07495205222248426) * t10;
+    y[345] = t7;
+    t6 = (-C74) * t14;
+    t13 = C73 * t4;
+    t3 = t6 + t13;
+    t11 = 0.07412146019784352 * t3;
+    y[374] = t11;
+    t5 = 0.000977833493522871 * t3;
+    y[705] = t5;
+    t0 = C75 * t12;
+    t8 = C76 * t2;
+    t10 = t0 + t8;
+    t7 = 0.0028145556758956444 * t10;
+    y[104] = t7;
+    t14 = (-0.07019154559098635) * t10;
+    y[255] = t14;
+    t4 = (-C76) * t12;
+    t6 = C75 * t2;
+    t13 = t4 + t6;
+    t11 = 0.07776474091872976 * t13;
+    y[464] = t11;
+    t3 = 0.034509247345545814 * t13;
+    y[615] = t3;
+    t5 = (-C77) * t1;
+    t0 = (-C78) * t9;
+    t8 = t5 + t0;
+    t7 = 0.07613711365134428 * t8;
+    y[525] = t7;
+    t10 = 0.06720997326121436 * t8;
+    y[554] = t10;
+    t14 = C78 * t1;
+    t12 = (-C77) * t9;
+    t2 = t14 + t12;
+    t4 = 0.029743628280473965 * t2;
+    y[165] = t4;
+    t6 = (-0.04671160914268008) * t2;
+    y[194] = t6;
+}
+
+/**
+ *  Part 5 of ApplyWindowedIMDCT_W75_360_K60().
+ * 
+ *  @param {Number[]} X 
+ *    - The input block (360 points, only the first 60 points are used).
+ *  @param {Number[]} y 
+ *    - The array that would contain the output block (720 points).
+ *  @param {Number[]} re 
+ *    - The scratch buffer (real part, 180 points).
+ *  @param {Number[]} im 
+ *    - The scratch buffer (imaginary part, 180 points).
+ */
+function ApplyWindowedIMDCT_W75_360_K60_Part5(X, y, re, im) {
+    let t0, t1, t10, t11, t12, t13, t14, t2, t3, t4, t5, t6, t7, t8, t9;
+    const C0 = 0.9974094913373519;
+    const C1 = 0.07193265315671939;
+    const C2 = 0.8939587799699321;
+    const C3 = 0.44814919358922256;
+    const C4 = 0.6544109481086103;
+    const C5 = 0.7561390817803227;
+    const C6 = 0.31523498164776964;
+    const C7 = 0.949013649188214;
+    const C8 = 0.3069413771675201;
+    const C9 = 0.9517284229140717;
+    const C10 = 0.996743790188891;
+    const C11 = 0.08063384351427165;
+    const C12 = 0.8900139509124098;
+    const C13 = 0.4559332924686272;
+    const C14 = 0.6477875556060698;
+    const C15 = 0.7618210306902226;
+    const C16 = 0.6411148315731583;
+    const C17 = 0.7674449639791253;
+    const C18 = 0.2986243979130275;
+    const C19 = 0.9543707188357582;
+    const C20 = 0.9960021831417567;
+    const C21 = 0.08932889329245366;
+    const C22 = 0.8860013438466962;
+    const C23 = 0.46368267026259297;
+    const C24 = 0.881921264348355;
+    const C25 = 0.47139673682599764;
+    const C26 = 0.6343932841636455;
+    const C27 = 0.773010453362737;
+    const C28 = 0.29028467725446233;
+    const C29 = 0.9569403357322088;
+    const C30 = 0.9951847266721969;
+    const C31 = 0.0980171403295606;
+    const C32 = 0.9942914830326867;
+    const C33 = 0.10669792298194263;
+    const C34 = 0.8777740231312368;
+    const C35 = 0.47907490470280634;
+    const C36 = 0.6276234252493902;
+    const C37 = 0.7785170750074935;
+    const C38 = 0.28192285029384145;
+    const C39 = 0.9594370779171484;
+    const C40 = 0.27353955381666206;
+    const C41 = 0.9618607552539928;
+    const C42 = 0.9933225202471875;
+    const C43 = 0.1153705801743918;
+    const C44 = 0.8735599360238168;
+    const C45 = 0.4867165891708081;
+    const C46 = 0.6208057703813592;
+    const C47 = 0.7839644095628366;
+    const C48 = 0.6139408387503664;
+    const C49 = 0.78935204219315;
+    const C50 = 0.265135426243408;
+    const C51 = 0.9642111831703293;
+    const C52 = 0.992277912105967;
+    const C53 = 0.12403445145048532;
+    const C54 = 0.8692793239451436;
+    const C55 = 0.4943212082861446;
+    const C56 = 0.8649325128804005;
+    const C57 = 0.5018881829276276;
+    const C58 = 0.6070291531475343;
+    const C59 = 0.7946795626093497;
+    const C60 = 0.256711107580932;
+    const C61 = 0.966488182671972;
+    const C62 = 0.9911577381599795;
+    const C63 = 0.13268887702288198;
+    const C64 = 0.9899620837148079;
+    const C65 = 0.14133319782356749;
+    const C66 = 0.860519833856079;
+    const C67 = 0.5094169368408418;
+    const C68 = 0.6000712399244809;
+    const C69 = 0.7999465651001297;
+    const C70 = 0.24826723937371628;
+    const C71 = 0.9686915803565931;
+    const C72 = 0.23980446465501654;
+    const C73 = 0.9708212084269281;
+    const C74 = 0.9886910398241674;
+    const C75 = 0.149966755554045;
+    const C76 = 0.8560416229147715;
+    const C77 = 0.5169068966820275;
+    const C78 = 0.5930676289532372;
+    const C79 = 0.8051526485628582;
+    const C80 = 0.5860188535858938;
+    const C81 = 0.8102974165341235;
+    const C82 = 0.23132342789789254;
+    const C83 = 0.9728769047035543;
+    const C84 = 0.9873447032829712;
+    const C85 = 0.15858889273546717;
+    const C86 = 0.851498221089579;
+    const C87 = 0.5243574920617445;
+    const C88 = 0.8468899743781412;
+    const C89 = 0.5317681555883085;
+    const C90 = 0.5789254506139857;
+    const C91 = 0.8153804772199257;
+    const C92 = 0.22282477496612907;
+    const C93 = 0.9748585126372411;
+    const C94 = 0.9859231766199597;
+    const C95 = 0.16719895275870564;
+    const C96 = 0.9844265680898916;
+    const C97 = 0.1757962799343545;
+    const C98 = 0.8422172337162865;
+    const C99 = 0.5391383229110002;
+    const C100 = 0.5717879602276122;
+    const C101 = 0.8204014435255136;
+    const C102 = 0.21430915306505077;
+    const C103 = 0.9767658813208724;
+    const C104 = 0.2057772106922349;
+    const C105 = 0.9785988655009383;
+    const C106 = 0.9828549916653012;
+    const C107 = 0.18438021954266337;
+    const C108 = 0.8374803549513079;
+    const C109 = 0.5464674327630434;
+    const C110 = 0.5646069259743004;
+    const C111 = 0.8253599330848638;
+    const C112 = 0.557382894717611;
+    const C113 = 0.8302555682897986;
+    const C114 = 0.19722959758812594;
+    const C115 = 0.9803573255885968;
+    const C116 = 0.9812085670278176;
+    const C117 = 0.19295011788339703;
+    const C118 = 0.8326796988148626;
+    const C119 = 0.553754927004347;
+    const C120 = 0.8278156308955021;
+    const C121 = 0.5610002506640098;
+    const C122 = 0.5501164165954934;
+    const C123 = 0.8350879763187431;
+    const C124 = 0.18866696468655522;
+    const C125 = 0.9820411276703039;
+    const C126 = 0.9794874195590514;
+    const C127 = 0.20150532232561713;
+    const C128 = 0.977691680331046;
+    const C129 = 0.2100451813573825;
+    const C130 = 0.8228885216108303;
+    const C131 = 0.5682028519825839;
+    const C132 = 0.5428080449783895;
+    const C133 = 0.8398567891651163;
+    const C134 = 0.1800899640651698;
+    const C135 = 0.9836501435180122;
+    const C136 = 0.17149924889577414;
+    const C137 = 0.9851842505989351;
+    const C138 = 0.9758214860962962;
+    const C139 = 0.21856904463536458;
+    const C140 = 0.8178987461792955;
+    const C141 = 0.5753621824540925;
+    const C142 = 0.5354583364270938;
+    const C143 = 0.8445616436653568;
+    const C144 = 0.528067850650368;
+    const C145 = 0.8492021815265789;
+    const C146 = 0.16289547339458874;
+    const C147 = 0.986643332084879;
+    const C148 = 0.9738769792773336;
+    const C149 = 0.22707626303437323;
+    const C150 = 0.8128466845916152;
+    const C151 = 0.5824776968678022;
+    const C152 = 0.8077327215818395;
+    const C153 = 0.5895488533497412;
+    const C154 = 0.5206371504623173;
+    const C155 = 0.8537780493538577;
+    const C156 = 0.15427929277242886;
+    const C157 = 0.9880272768611397;
+    const C158 = 0.9718583079558811;
+    const C159 = 0.23556618869679022;
+    const C160 = 0.9697656258615752;
+    const C161 = 0.24403817508190642;
+    const C162 = 0.8025572465980509;
+    const C163 = 0.5965751134039663;
+    const C164 = 0.5131668017395302;
+    const C165 = 0.8582888986771422;
+    const C166 = 0.1456513631848078;
+    const C167 = 0.9893359795349642;
+    const C168 = 0.13701234168196802;
+    const C169 = 0.9905693404435773;
+    const C170 = 0.9675990923602598;
+    const C171 = 0.25249157701515795;
+    const C172 = 0.7973206537727071;
+    const C173 = 0.6035559419535714;
+    const C174 = 0.5056573733779846;
+    const C175 = 0.8627343859777918;
+    const C176 = 0.4981094372497241;
+    const C177 = 0.8671141727147372;
+    const C178 = 0.12836288615884434;
+    const C179 = 0.9917272656617703;
+    const C180 = 0.9653588724418489;
+    const C181 = 0.2609257507372589;
+    const C182 = 0.7920233418926261;
+    const C183 = 0.6104908073814348;
+    const C184 = 0.786665714368617;
+    const C185 = 0.6173791815707049;
+    const C186 = 0.490523568159308;
+    const C187 = 0.8714279253502614;
+    const C188 = 0.11970365530496252;
+    const C189 = 0.992809667009055;
+    const C190 = 0.9630451367077627;
+    const C191 = 0.26934005395322597;
+    const C192 = 0.9606580613579353;
+    const C193 = 0.2777338458812922;
+    const C194 = 0.7812481792047586;
+    const C195 = 0.6242205399450176;
+    const C196 = 0.4829003438000374;
+    const C197 = 0.8756753153753997;
+    const C198 = 0.11103530855427768;
+    const C199 = 0.9938164620563781;
+    t11 = re[88];
+    t13 = im[88];
+    t3 = re[133];
+    t5 = im[133];
+    t0 = re[178];
+    t7 = im[178];
+    t8 = re[43];
+    t10 = im[43];
+    t1 = t11 + t0;
+    t9 = t13 + t7;
+    t14 = t3 + t8;
+    t12 = t5 + t10;
+    t4 = t11 - t0;
+    t2 = t13 - t7;
+    t6 = t3 - t8;
+    t11 = t5 - t10;
+    t0 = t1 + t14;
+    t13 = t9 + t12;
+    t7 = t4 + t11;
+    t3 = t2 - t6;
+    t8 = t1 - t14;
+    t5 = t9 - t12;
+    t10 = t4 - t11;
+    t1 = t2 + t6;
+    t14 = (-C0) * t0;
+    t9 = (-C1) * t13;
+    t12 = t14 + t9;
+    t4 = 0.07653423786690212 * t12;
+    y[523] = t4;
+    t11 = 0.06638406702686302 * t12;
+    y[556] = t11;
+    t2 = C1 * t0;
+    t6 = (-C0) * t13;
+    t14 = t2 + t6;
+    t9 = 0.028564578122477702 * t14;
+    y[163] = t9;
+    t4 = (-0.047812884649648266) * t14;
+    y[196] = t4;
+    t12 = (-C2) * t7;
+    t11 = (-C3) * t3;
+    t0 = t12 + t11;
+    t13 = 0.07496630414092705 * t0;
+    y[433] = t13;
+    t2 = 0.017826525775521376 * t0;
+    y[646] = t2;
+    t6 = C3 * t7;
+    t9 = (-C2) * t3;
+    t14 = t6 + t9;
+    y[73] = 0;
+    t4 = (-0.07410736889352079) * t14;
+    y[286] = t4;
+    t12 = C4 * t8;
+    t11 = C5 * t5;
+    t13 = t12 + t11;
+    y[16] = 0;
+    t0 = (-0.0750024847199091) * t13;
+    y[343] = t0;
+    t2 = (-C5) * t8;
+    t7 = C4 * t5;
+    t3 = t2 + t7;
+    t6 = 0.07407162011101821 * t3;
+    y[376] = t6;
+    t9 = 0.0011801616573000912 * t3;
+    y[703] = t9;
+    t14 = C6 * t10;
+    t4 = C7 * t1;
+    t12 = t14 + t4;
+    t11 = 0.0032578351613788224 * t12;
+    y[106] = t11;
+    t13 = (-0.06978698274465173) * t12;
+    y[253] = t13;
+    t0 = (-C7) * t10;
+    t8 = C6 * t1;
+    t5 = t0 + t8;
+    t2 = 0.07794177142410044 * t5;
+    y[466] = t2;
+    t7 = 0.035678446679014125 * t5;
+    y[613] = t7;
+    t6 = re[144];
+    t3 = im[144];
+    t9 = re[9];
+    t14 = im[9];
+    t4 = re[54];
+    t11 = im[54];
+    t12 = re[99];
+    t13 = im[99];
+    t10 = t6 + t4;
+    t1 = t3 + t11;
+    t0 = t9 + t12;
+    t8 = t14 + t13;
+    t2 = t6 - t4;
+    t5 = t3 - t11;
+    t7 = t9 - t12;
+    t6 = t14 - t13;
+    t4 = t10 + t0;
+    t3 = t1 + t8;
+    t11 = t2 + t6;
+    t9 = t5 - t7;
+    t12 = t10 - t0;
+    t14 = t1 - t8;
+    t13 = t2 - t6;
+    t10 = t5 + t7;
+    t0 = C8 * t4;
+    t1 = C9 * t3;
+    t8 = t0 + t1;
+    t2 = 0.0037367281520488786 * t8;
+    y[108] = t2;
+    t6 = (-0.06935991088229848) * t8;
+    y[251] = t6;
+    t5 = (-C9) * t4;
+    t7 = C8 * t3;
+    t0 = t5 + t7;
+    t1 = 0.07811209041394841 * t0;
+    y[468] = t1;
+    t2 = 0.03685254051423165 * t0;
+    y[611] = t2;
+    t8 = (-C10) * t11;
+    t6 = (-C11) * t9;
+    t4 = t8 + t6;
+    t3 = 0.07690288192773581 * t4;
+    y[521] = t3;
+    t5 = 0.06553374995687641 * t4;
+    y[558] = t5;
+    t7 = C11 * t11;
+    t1 = (-C10) * t9;
+    t0 = t7 + t1;
+    t2 = 0.02739198624153461 * t0;
+    y[161] = t2;
+    t8 = (-0.04889876535334858) * t0;
+    y[198] = t8;
+    t6 = (-C12) * t12;
+    t3 = (-C13) * t14;
+    t4 = t6 + t3;
+    t5 = 0.07482598399384086 * t4;
+    y[431] = t5;
+    t11 = 0.01689105598606925 * t4;
+    y[648] = t11;
+    t9 = C13 * t12;
+    t7 = (-C12) * t14;
+    t1 = t9 + t7;
+    y[71] = 0;
+    t2 = (-0.07424634143151193) * t1;
+    y[288] = t2;
+    t0 = C14 * t13;
+    t8 = C15 * t10;
+    t6 = t0 + t8;
+    y[18] = 0;
+    t3 = (-0.07505017829539895) * t6;
+    y[341] = t3;
+    t5 = (-C15) * t13;
+    t4 = C14 * t10;
+    t11 = t5 + t4;
+    t12 = 0.07402454839865644 * t11;
+    y[378] = t12;
+    t14 = 0.0014056274459970663 * t11;
+    y[701] = t14;
+    t9 = re[60];
+    t7 = im[60];
+    t1 = re[105];
+    t2 = im[105];
+    t0 = re[150];
+    t8 = im[150];
+    t6 = re[15];
+    t3 = im[15];
+    t13 = t9 + t0;
+    t10 = t7 + t8;
+    t5 = t1 + t6;
+    t4 = t2 + t3;
+    t12 = t9 - t0;
+    t11 = t7 - t8;
+    t14 = t1 - t6;
+    t9 = t2 - t3;
+    t0 = t13 + t5;
+    t7 = t10 + t4;
+    t8 = t12 + t9;
+    t1 = t11 - t14;
+    t6 = t13 - t5;
+    t2 = t10 - t4;
+    t3 = t12 - t9;
+    t13 = t11 + t14;
+    t5 = C16 * t0;
+    t10 = C17 * t7;
+    t4 = t5 + t10;
+    y[20] = 0;
+    t12 = (-0.07509479364736635) * t4;
+    y[339] = t12;
+    t9 = (-C17) * t0;
+    t11 = C16 * t7;
+    t14 = t9 + t11;
+    t5 = 0.07398056890126894 * t14;
+    y[380] = t5;
+    t10 = 0.0016551485214856972 * t14;
+    y[699] = t10;
+    t4 = C18 * t8;
+    t12 = C19 * t1;
+    t0 = t4 + t12;
+    t7 = 0.004251091028882468 * t0;
+    y[110] = t7;
+    t9 = (-0.06890962178717301) * t0;
+    y[249] = t9;
+    t11 = (-C19) * t8;
+    t5 = C18 * t1;
+    t14 = t11 + t5;
+    t10 = 0.07827477964699882 * t14;
+    y[470] = t10;
+    t4 = 0.03803025941062032 * t14;
+    y[609] = t4;
+    t12 = (-C20) * t6;
+    t7 = (-C21) * t2;
+    t0 = t12 + t7;
+    t9 = 0.07724297509017906 * t0;
+    y[519] = t9;
+    t8 = 0.06465935512789801 * t0;
+    y[560] = t8;
+    t1 = C21 * t6;
+    t11 = (-C20) * t2;
+    t5 = t1 + t11;
+    t10 = 0.026228131666691412 * t5;
+    y[159] = t10;
+    t14 = (-0.0499677992888239) * t5;
+    y[200] = t14;
+    t4 = (-C22) * t3;
+    t12 = (-C23) * t13;
+    t7 = t4 + t12;
+    t9 = 0.07469517305545602 * t7;
+    y[429] = t9;
+    t0 = 0.01597743799899386 * t7;
+    y[650] = t0;
+    t8 = C23 * t3;
+    t6 = (-C22) * t13;
+    t2 = t8 + t6;
+    y[69] = 0;
+    t1 = (-0.07437636634740691) * t2;
+    y[290] = t1;
+    t11 = re[156];
+    t10 = im[156];
+    t5 = re[21];
+    t14 = im[21];
+    t4 = re[66];
+    t12 = im[66];
+    t9 = re[111];
+    t7 = im[111];
+    t0 = t11 + t4;
+    t3 = t10 + t12;
+    t13 = t5 + t9;
+    t8 = t14 + t7;
+    t6 = t11 - t4;
+    t2 = t10 - t12;
+    t1 = t5 - t9;
+    t11 = t14 - t7;
+    t4 = t0 + t13;
+    t10 = t3 + t8;
+    t12 = t6 + t11;
+    t5 = t2 - t1;
+    t9 = t0 - t13;
+    t14 = t3 - t8;
+    t7 = t6 - t11;
+    t0 = t2 + t1;
+    t13 = (-C24) * t4;
+    t3 = (-C25) * t10;
+    t8 = t13 + t3;
+    t6 = 0.07457395540421297 * t8;
+    y[427] = t6;
+    t11 = 0.015086781910979527 * t8;
+    y[652] = t11;
+    t2 = C25 * t4;
+    t1 = (-C24) * t10;
+    t13 = t2 + t1;
+    y[67] = 0;
+    t3 = (-0.07449726282376734) * t13;
+    y[292] = t3;
+    t6 = C26 * t12;
+    t8 = C27 * t5;
+    t11 = t6 + t8;
+    y[22] = 0;
+    t4 = (-0.07513597558736292) * t11;
+    y[337] = t4;
+    t10 = (-C27) * t12;
+    t2 = C26 * t5;
+    t1 = t10 + t2;
+    t13 = 0.07394002023832033 * t1;
+    y[382] = t13;
+    t3 = 0.0019296043732207938 * t1;
+    y[697] = t3;
+    t6 = C28 * t9;
+    t8 = C29 * t14;
+    t11 = t6 + t8;
+    t4 = 0.004800668688217836 * t11;
+    y[112] = t4;
+    t12 = (-0.06843511489527315) * t11;
+    y[247] = t12;
+    t5 = (-C29) * t9;
+    t10 = C28 * t14;
+    t2 = t5 + t10;
+    t13 = 0.07842932782810454 * t2;
+    y[472] = t13;
+    t1 = 0.039210265632819354 * t2;
+    y[607] = t1;
+    t3 = (-C30) * t7;
+    t6 = (-C31) * t0;
+    t8 = t3 + t6;
+    t4 = 0.07755518221415482 * t8;
+    y[517] = t4;
+    t11 = 0.0637612778454389 * t8;
+    y[562] = t11;
+    t12 = C31 * t7;
+    t9 = (-C30) * t0;
+    t14 = t12 + t9;
+    t5 = 0.025074379332856854 * t14;
+    y[157] = t5;
+    t10 = (-0.05101891292299967) * t14;
+    y[202] = t10;
+    t13 = re[92];
+    t2 = im[92];
+    t1 = re[137];
+    t3 = im[137];
+    t6 = re[2];
+    t4 = im[2];
+    t8 = re[47];
+    t11 = im[47];
+    t7 = t13 + t6;
+    t0 = t2 + t4;
+    t12 = t1 + t8;
+    t9 = t3 + t11;
+    t5 = t13 - t6;
+    t14 = t2 - t4;
+    t10 = t1 - t8;
+    t13 = t3 - t11;
+    t6 = t7 + t12;
+    t2 = t0 + t9;
+    t4 = t5 + t13;
+    t1 = t14 - t10;
+    t8 = t7 - t12;
+    t3 = t0 - t9;
+    t11 = t5 - t13;
+    t7 = t14 + t10;
+    t12 = (-C32) * t6;
+    t0 = (-C33) * t2;
+    t9 = t12 + t0;
+    t5 = 0.07784000908910041 * t9;
+    y[515] = t5;
+    t13 = 0.06284016604564573 * t9;
+    y[564] = t13;
+    t14 = C33 * t6;
+    t10 = (-C32) * t2;
+    t12 = t14 + t10;
+    t0 = 0.02393267321582922 * t12;
+    y[155] = t0;
+    t5 = (-0.05205064136257923) * t12;
+    y[204] = t5;
+    t9 = (-C34) * t4;
+    t13 = (-C35) * t1;
+    t6 = t9 + t13;
+    t2 = 0.07446206884269224 * t6;
+    y[425] = t2;
+    t14 = 0.014220262010509356 * t6;
+    y[654] = t14;
+    t10 = C35 * t4;
+    t0 = (-C34) * t1;
+    t12 = t10 + t0;
+    y[65] = 0;
+    t5 = (-0.07460920226769635) * t12;
+    y[294] = t5;
+    t9 = C36 * t8;
+    t13 = C37 * t3;
+    t2 = t9 + t13;
+    y[24] = 0;
+    t6 = (-0.07517340029871654) * t2;
+    y[335] = t6;
+    t14 = (-C37) * t8;
+    t4 = C36 * t3;
+    t1 = t14 + t4;
+    t10 = 0.07390320955922502 * t1;
+    y[384] = t10;
+    t0 = 0.002229055261370192 * t1;
+    y[695] = t0;
+    t12 = C38 * t11;
+    t5 = C39 * t7;
+    t9 = t12 + t5;
+    t13 = 0.005385116887313331 * t9;
+    y[114] = t13;
+    t2 = (-0.06793559503952946) * t9;
+    y[245] = t2;
+    t6 = (-C39) * t11;
+    t8 = C38 * t7;
+    t3 = t6 + t8;
+    t14 = 0.07857505943811341 * t3;
+    y[474] = t14;
+    t4 = 0.04039134932676299 * t3;
+    y[605] = t4;
+    t10 = re[8];
+    t1 = im[8];
+    t0 = re[53];
+    t12 = im[53];
+    t5 = re[98];
+    t13 = im[98];
+    t9 = re[143];
+    t2 = im[143];
+    t11 = t10 + t5;
+    t7 = t1 + t13;
+    t6 = t0 + t9;
+    t8 = t12 + t2;
+    t14 = t10 - t5;
+    t3 = t1 - t13;
+    t4 = t0 - t9;
+    t10 = t12 - t2;
+    t5 = t11 + t6;
+    t1 = t7 + t8;
+    t13 = t14 + t10;
+    t0 = t3 - t4;
+    t9 = t11 - t6;
+    t12 = t7 - t8;
+    t2 = t14 - t10;
+    t11 = t3 + t4;
+    t6 = C40 * t5;
+    t7 = C41 * t1;
+    t8 = t6 + t7;
+    t14 = 0.006004019447140323 * t8;
+    y[116] = t14;
+    t10 = (-0.06741130369498281) * t8;
+    y[243] = t10;
+    t3 = (-C41) * t5;
+    t4 = C40 * t1;
+    t6 = t3 + t4;
+    t7 = 0.0787101603489525 * t6;
+    y[476] = t7;
+    t14 = 0.041572322439829716 * t6;
+    y[603] = t14;
+    t8 = (-C42) * t13;
+    t10 = (-C43) * t0;
+    t5 = t8 + t10;
+    t1 = 0.07809766918983464 * t5;
+    y[513] = t1;
+    t3 = 0.06189680526819404 * t5;
+    y[566] = t3;
+    t4 = C43 * t13;
+    t7 = (-C42) * t0;
+    t6 = t4 + t7;
+    t14 = 0.022804283234255183 * t6;
+    y[153] = t14;
+    t8 = (-0.05306231696686175) * t6;
+    y[206] = t8;
+    t10 = (-C44) * t9;
+    t1 = (-C45) * t12;
+    t5 = t10 + t1;
+    t3 = 0.07435931760665028 * t5;
+    y[423] = t3;
+    t13 = 0.013378002394316833 * t5;
+    y[656] = t13;
+    t0 = C45 * t9;
+    t4 = (-C44) * t12;
+    t7 = t0 + t4;
+    y[63] = 0;
+    t14 = (-0.07471229879950778) * t7;
+    y[296] = t14;
+    t6 = C46 * t2;
+    t8 = C47 * t11;
+    t10 = t6 + t8;
+    y[26] = 0;
+    t1 = (-0.07520672134166241) * t10;
+    y[333] = t1;
+    t3 = (-C47) * t2;
+    t5 = C46 * t11;
+    t13 = t3 + t5;
+    t9 = 0.07387046604939465 * t13;
+    y[386] = t9;
+    t12 = 0.00255366426502586 * t13;
+    y[693] = t12;
+    t0 = re[104];
+    t4 = im[104];
+    t7 = re[149];
+    t14 = im[149];
+    t6 = re[14];
+    t8 = im[14];
+    t10 = re[59];
+    t1 = im[59];
+    t2 = t0 + t6;
+    t11 = t4 + t8;
+    t3 = t7 + t10;
+    t5 = t14 + t1;
+    t9 = t0 - t6;
+    t13 = t4 - t8;
+    t12 = t7 - t10;
+    t0 = t14 - t1;
+    t6 = t2 + t3;
+    t4 = t11 + t5;
+    t8 = t9 + t0;
+    t7 = t13 - t12;
+    t10 = t2 - t3;
+    t14 = t11 - t5;
+    t1 = t9 - t0;
+    t2 = t13 + t12;
+    t3 = C48 * t6;
+    t11 = C49 * t4;
+    t5 = t3 + t11;
+    y[28] = 0;
+    t9 = (-0.07523562433528812) * t5;
+    y[331] = t9;
+    t0 = (-C49) * t6;
+    t13 = C48 * t4;
+    t12 = t0 + t13;
+    t3 = 0.07384208750361634 * t12;
+    y[388] = t3;
+    t11 = 0.0029040315795407093 * t12;
+    y[691] = t11;
+    t5 = C50 * t8;
+    t9 = C51 * t7;
+    t6 = t5 + t9;
+    t4 = 0.006656903764848652 * t6;
+    y[118] = t4;
+    t0 = (-0.0668621636659968) * t6;
+    y[241] = t0;
+    t13 = (-C51) * t8;
+    t3 = C50 * t7;
+    t12 = t13 + t3;
+    t11 = 0.07883322950726442 * t12;
+    y[478] = t11;
+    t5 = 0.04275189667372712 * t12;
+    y[601] = t5;
+    t9 = (-C52) * t10;
+    t4 = (-C53) * t14;
+    t6 = t9 + t4;
+    t0 = 0.07832839163125538 * t6;
+    y[511] = t0;
+    t8 = 0.06093217079840101 * t6;
+    y[568] = t8;
+    t7 = C53 * t10;
+    t13 = (-C52) * t14;
+    t3 = t7 + t13;
+    t11 = 0.021690646887164954 * t3;
+    y[151] = t11;
+    t12 = (-0.05405316343824382) * t3;
+    y[208] = t12;
+    t5 = (-C54) * t1;
+    t9 = (-C55) * t2;
+    t4 = t5 + t9;
+    t0 = 0.0742656761333236 * t4;
+    y[421] = t0;
+    t6 = 0.012560244466040787 * t4;
+    y[658] = t6;
+    t8 = C55 * t1;
+    t10 = (-C54) * t2;
+    t14 = t8 + t10;
+    y[61] = 0;
+    t7 = (-0.07480650341864636) * t14;
+    y[298] = t7;
+    t13 = re[40];
+    t11 = im[40];
+    t3 = re[85];
+    t12 = im[85];
+    t5 = re[130];
+    t9 = im[130];
+    t0 = re[175];
+    t4 = im[175];
+    t6 = t13 + t5;
+    t1 = t11 + t9;
+    t2 = t3 + t0;
+    t8 = t12 + t4;
+    t10 = t13 - t5;
+    t14 = t11 - t9;
+    t7 = t3 - t0;
+    t13 = t12 - t4;
+    t5 = t6 + t2;
+    t11 = t1 + t8;
+    t9 = t10 + t13;
+    t3 = t14 - t7;
+    t0 = t6 - t2;
+    t12 = t1 - t8;
+    t4 = t10 - t13;
+    t6 = t14 + t7;
+    t2 = (-C56) * t5;
+    t1 = (-C57) * t11;
+    t8 = t2 + t1;
+    t10 = 0.07418097507515262 * t8;
+    y[419] = t10;
+    t13 = 0.011767594897081788 * t8;
+    y[660] = t13;
+    t14 = C57 * t5;
+    t7 = (-C56) * t11;
+    t2 = t14 + t7;
+    y[59] = 0;
+    t1 = (-0.07489191871537453) * t2;
+    y[300] = t1;
+    t10 = C58 * t9;
+    t8 = C59 * t3;
+    t13 = t10 + t8;
+    y[30] = 0;
+    t5 = (-0.07525977943575472) * t13;
+    y[329] = t5;
+    t11 = (-C59) * t9;
+    t14 = C58 * t3;
+    t7 = t11 + t14;
+    t2 = 0.07381838742030912 * t7;
+    y[390] = t2;
+    t1 = 0.003280615794812773 * t7;
+    y[689] = t1;
+    t10 = C60 * t0;
+    t8 = C61 * t12;
+    t13 = t10 + t8;
+    t5 = 0.007343269434112685 * t13;
+    y[120] = t5;
+    t9 = (-0.06628739149209381) * t13;
+    y[239] = t9;
+    t3 = (-C61) * t0;
+    t11 = C60 * t12;
+    t14 = t3 + t11;
+    t2 = 0.078943755942419 * t14;
+    y[480] = t2;
+    t7 = 0.04392864819117198 * t14;
+    y[599] = t7;
+    t1 = (-C62) * t4;
+    t10 = (-C63) * t6;
+    t8 = t1 + t10;
+    t5 = 0.07853258704510427 * t8;
+    y[509] = t5;
+    t13 = 0.05994684933986933 * t8;
+    y[570] = t13;
+    t9 = C63 * t4;
+    t0 = (-C62) * t6;
+    t12 = t9 + t0;
+    t3 = 0.020593098975334338 * t12;
+    y[149] = t3;
+    t11 = (-0.05502256217993199) * t12;
+    y[210] = t11;
+    t2 = re[136];
+    t14 = im[136];
+    t7 = re[1];
+    t1 = im[1];
+    t10 = re[46];
+    t5 = im[46];
+    t8 = re[91];
+    t13 = im[91];
+    t4 = t2 + t10;
+    t6 = t14 + t5;
+    t9 = t7 + t8;
+    t0 = t1 + t13;
+    t3 = t2 - t10;
+    t12 = t14 - t5;
+    t11 = t7 - t8;
+    t2 = t1 - t13;
+    t10 = t4 + t9;
+    t14 = t6 + t0;
+    t5 = t3 + t2;
+    t7 = t12 - t11;
+    t8 = t4 - t9;
+    t1 = t6 - t0;
+    t13 = t3 - t2;
+    t4 = t12 + t11;
+    t9 = (-C64) * t10;
+    t6 = (-C65) * t14;
+    t0 = t9 + t6;
+    t3 = 0.07871072623375217 * t0;
+    y[507] = t3;
+    t2 = 0.058941354834138 * t0;
+    y[572] = t2;
+    t12 = C65 * t10;
+    t11 = (-C64) * t14;
+    t9 = t12 + t11;
+    t6 = 0.019514347494519975 * t9;
+    y[147] = t6;
+    t3 = (-0.05596890902062735) * t9;
+    y[212] = t3;
+    t0 = (-C66) * t5;
+    t2 = (-C67) * t7;
+    t10 = t0 + t2;
+    t14 = 0.07410494162131781 * t10;
+    y[417] = t14;
+    t12 = 0.011000747977745941 * t10;
+    y[662] = t12;
+    t11 = C67 * t5;
+    t6 = (-C66) * t7;
+    t9 = t11 + t6;
+    y[57] = 0;
+    t3 = (-0.07496875962665067) * t9;
+    y[302] = t3;
+    t0 = C68 * t8;
+    t2 = C69 * t1;
+    t14 = t0 + t2;
+    y[32] = 0;
+    t10 = (-0.07527885140656462) * t14;
+    y[327] = t10;
+    t12 = (-C69) * t8;
+    t5 = C68 * t1;
+    t7 = t12 + t5;
+    t11 = 0.073799685459482 * t7;
+    y[392] = t11;
+    t6 = 0.0036836583231711047 * t7;
+    y[687] = t6;
+    t9 = C70 * t13;
+    t3 = C71 * t4;
+    t0 = t9 + t3;
+    t2 = 0.00806262304799125 * t0;
+    y[122] = t2;
+    t14 = (-0.06568628740452798) * t0;
+    y[237] = t14;
+    t10 = (-C71) * t13;
+    t8 = C70 * t4;
+    t1 = t10 + t8;
+    t12 = 0.07904112455093797 * t1;
+    y[482] = t12;
+    t5 = 0.045101641160831665 * t1;
+    y[597] = t5;
+    t11 = re[52];
+    t7 = im[52];
+    t6 = re[97];
+    t9 = im[97];
+    t3 = re[142];
+    t2 = im[142];
+    t0 = re[7];
+    t14 = im[7];
+    t13 = t11 + t3;
+    t4 = t7 + t2;
+    t10 = t6 + t0;
+    t8 = t9 + t14;
+    t12 = t11 - t3;
+    t1 = t7 - t2;
+    t5 = t6 - t0;
+    t11 = t9 - t14;
+    t3 = t13 + t10;
+    t7 = t4 + t8;
+    t2 = t12 + t11;
+    t6 = t1 - t5;
+    t0 = t13 - t10;
+    t9 = t4 - t8;
+    t14 = t12 - t11;
+    t13 = t1 + t5;
+    t10 = C72 * t3;
+    t4 = C73 * t7;
+    t8 = t10 + t4;
+    t12 = 0.00881418212054679 * t8;
+    y[124] = t12;
+    t11 = (-0.06505898861211178) * t8;
+    y[235] = t11;
+    t1 = (-C73) * t3;
+    t5 = C72 * t7;
+    t10 = t1 + t5;
+    t4 = 0.07912400767771946 * t10;
+    y[484] = t4;
+    t12 = 0.0462694820152932 * t10;
+    y[595] = t12;
+    t8 = (-C74) * t2;
+    t11 = (-C75) * t6;
+    t3 = t8 + t11;
+    t7 = 0.0788640459127583 * t3;
+    y[505] = t7;
+    t1 = 0.05791691702580703 * t3;
+    y[574] = t1;
+    t5 = C75 * t2;
+    t4 = (-C74) * t6;
+    t10 = t5 + t4;
+    t12 = 0.018453847710442315 * t10;
+    y[145] = t12;
+    t8 = (-0.05689240942401537) * t10;
+    y[214] = t8;
+    t11 = (-C76) * t0;
+    t7 = (-C77) * t9;
+    t3 = t11 + t7;
+    t1 = 0.074037419382818 * t3;
+    y[415] = t1;
+    t2 = 0.010260231943808849 * t3;
+    y[664] = t2;
+    t6 = C77 * t0;
+    t5 = (-C76) * t9;
+    t4 = t6 + t5;
+    y[55] = 0;
+    t12 = (-0.07503713124886202) * t4;
+    y[304] = t12;
+    t10 = C78 * t14;
+    t8 = C79 * t13;
+    t11 = t10 + t8;
+    y[34] = 0;
+    t7 = (-0.0752925301001395) * t11;
+    y[325] = t7;
+    t1 = (-C79) * t14;
+    t3 = C78 * t13;
+    t2 = t1 + t3;
+    t0 = 0.07378627797693389 * t2;
+    y[394] = t0;
+    t9 = 0.004113242104958822 * t2;
+    y[685] = t9;
+    t6 = re[108];
+    t5 = im[108];
+    t4 = re[153];
+    t12 = im[153];
+    t10 = re[18];
+    t8 = im[18];
+    t11 = re[63];
+    t7 = im[63];
+    t14 = t6 + t10;
+    t13 = t5 + t8;
+    t1 = t4 + t11;
+    t3 = t12 + t7;
+    t0 = t6 - t10;
+    t2 = t5 - t8;
+    t9 = t4 - t11;
+    t6 = t12 - t7;
+    t10 = t14 + t1;
+    t5 = t13 + t3;
+    t8 = t0 + t6;
+    t4 = t2 - t9;
+    t11 = t14 - t1;
+    t12 = t13 - t3;
+    t7 = t0 - t6;
+    t14 = t2 + t9;
+    t1 = C80 * t10;
+    t13 = C81 * t5;
+    t3 = t1 + t13;
+    y[36] = 0;
+    t0 = (-0.07530050192675915) * t3;
+    y[323] = t0;
+    t6 = (-C81) * t10;
+    t2 = C80 * t5;
+    t9 = t6 + t2;
+    t1 = 0.07377846645642751 * t9;
+    y[396] = t1;
+    t13 = 0.004569478291400881 * t9;
+    y[683] = t13;
+    t3 = C82 * t8;
+    t0 = C83 * t4;
+    t10 = t3 + t0;
+    t5 = 0.009597393388131877 * t10;
+    y[126] = t5;
+    t6 = (-0.0644056743909316) * t10;
+    y[233] = t6;
+    t2 = (-C83) * t8;
+    t1 = C82 * t4;
+    t9 = t2 + t1;
+    t13 = 0.07919092994811297 * t9;
+    y[486] = t13;
+    t3 = 0.04743061873083486 * t9;
+    y[593] = t3;
+    t0 = (-C84) * t11;
+    t5 = (-C85) * t12;
+    t10 = t0 + t5;
+    t6 = 0.07899241569686438 * t10;
+    y[503] = t6;
+    t8 = 0.05687433380975956 * t10;
+    y[576] = t8;
+    t4 = C85 * t11;
+    t2 = (-C84) * t12;
+    t1 = t4 + t2;
+    t13 = 0.017415019803909308 * t1;
+    y[143] = t13;
+    t9 = (-0.0577914710627802) * t1;
+    y[216] = t9;
+    t3 = (-C86) * t7;
+    t0 = (-C87) * t14;
+    t5 = t3 + t0;
+    t6 = 0.07397825346062925 * t5;
+    y[413] = t6;
+    t10 = 0.009546221162544678 * t5;
+    y[666] = t10;
+    t8 = C87 * t7;
+    t11 = (-C86) * t14;
+    t12 = t8 + t11;
+    y[53] = 0;
+    t4 = (-0.0750971440345261) * t12;
+    y[306] = t4;
+    t2 = re[24];
+    t13 = im[24];
+    t1 = re[69];
+    t9 = im[69];
+    t3 = re[114];
+    t0 = im[114];
+    t6 = re[159];
+    t5 = im[159];
+    t10 = t2 + t3;
+    t7 = t13 + t0;
+    t14 = t1 + t6;
+    t8 = t9 + t5;
+    t11 = t2 - t3;
+    t12 = t13 - t0;
+    t4 = t1 - t6;
+    t2 = t9 - t5;
+    t3 = t10 + t14;
+    t13 = t7 + t8;
+    t0 = t11 + t2;
+    t1 = t12 - t4;
+    t6 = t10 - t14;
+    t9 = t7 - t8;
+    t5 = t11 - t2;
+    t10 = t12 + t4;
+    t14 = (-C88) * t3;
+    t7 = (-C89) * t13;
+    t8 = t14 + t7;
+    t11 = 0.07392721761500906 * t8;
+    y[411] = t11;
+    t2 = 0.008858817415260668 * t8;
+    y[668] = t2;
+    t12 = C89 * t3;
+    t4 = (-C88) * t13;
+    t14 = t12 + t4;
+    y[51] = 0;
+    t7 = (-0.07514898754187173) * t14;
+    y[308] = t7;
+    t11 = C90 * t0;
+    t8 = C91 * t1;
+    t2 = t11 + t8;
+    y[38] = 0;
+    t3 = (-0.07530245242836436) * t2;
+    y[321] = t3;
+    t13 = (-C91) * t0;
+    t12 = C90 * t1;
+    t4 = t13 + t12;
+    t14 = 0.07377655542946078 * t4;
+    y[398] = t14;
+    t7 = 0.005052872047437409 * t4;
+    y[681] = t7;
+    t11 = C92 * t6;
+    t8 = C93 * t9;
+    t2 = t11 + t8;
+    t3 = 0.010411689238175531 * t2;
+    y[128] = t3;
+    t0 = (-0.06372614899328394) * t2;
+    y[231] = t0;
+    t1 = (-C93) * t6;
+    t13 = C92 * t9;
+    t12 = t1 + t13;
+    t14 = 0.07924086912061755 * t12;
+    y[488] = t14;
+    t4 = 0.04858386684871984 * t12;
+    y[591] = t4;
+    t7 = (-C94) * t5;
+    t11 = (-C95) * t10;
+    t8 = t7 + t11;
+    t3 = 0.07909673955285182 * t8;
+    y[501] = t3;
+    t2 = 0.05581446591090588 * t8;
+    y[578] = t2;
+    t0 = C95 * t5;
+    t6 = (-C94) * t10;
+    t9 = t0 + t6;
+    t1 = 0.016397980292607583 * t9;
+    y[141] = t1;
+    t13 = (-0.05866627461180603) * t9;
+    y[218] = t13;
+    t14 = re[120];
+    t12 = im[120];
+    t4 = re[165];
+    t7 = im[165];
+    t11 = re[30];
+    t3 = im[30];
+    t8 = re[75];
+    t2 = im[75];
+    t5 = t14 + t11;
+    t10 = t12 + t3;
+    t0 = t4 + t8;
+    t6 = t7 + t2;
+    t1 = t14 - t11;
+    t9 = t12 - t3;
+    t13 = t4 - t8;
+    t14 = t7 - t2;
+    t11 = t5 + t0;
+    t12 = t10 + t6;
+    t3 = t1 + t14;
+    t4 = t9 - t13;
+    t8 = t5 - t0;
+    t7 = t10 - t6;
+    t2 = t1 - t14;
+    t5 = t9 + t13;
+    t0 = (-C96) * t11;
+    t10 = (-C97) * t12;
+    t6 = t0 + t10;
+    t1 = 0.07917742425593305 * t6;
+    y[499] = t1;
+    t14 = 0.0547386736643123 * t6;
+    y[580] = t14;
+    t9 = C97 * t11;
+    t13 = (-C96) * t12;
+    t0 = t9 + t13;
+    t10 = 0.015404851487337206 * t0;
+    y[139] = t10;
+    t1 = (-0.059515884248910744) * t0;
+    y[220] = t1;
+    t6 = (-C98) * t3;
+    t14 = (-C99) * t4;
+    t11 = t6 + t14;
+    t12 = 0.0738840539646149 * t11;
+    y[409] = t12;
+    t9 = 0.008198439078907925 * t11;
+    y[670] = t9;
+    t13 = C99 * t3;
+    t10 = (-C98) * t4;
+    t0 = t13 + t10;
+    y[49] = 0;
+    t1 = (-0.07519289017649554) * t0;
+    y[310] = t1;
+    t6 = C100 * t8;
+    t14 = C101 * t7;
+    t12 = t6 + t14;
+    y[40] = 0;
+    t11 = (-0.07529808938939887) * t12;
+    y[319] = t11;
+    t9 = (-C101) * t8;
+    t3 = C100 * t7;
+    t4 = t9 + t3;
+    t13 = 0.07378083030533994 * t4;
+    y[400] = t13;
+    t10 = 0.005563419649964133 * t4;
+    y[679] = t10;
+    t0 = C102 * t2;
+    t1 = C103 * t5;
+    t6 = t0 + t1;
+    t14 = 0.011255798390928823 * t6;
+    y[130] = t14;
+    t12 = (-0.06302004407934228) * t6;
+    y[229] = t12;
+    t11 = (-C103) * t2;
+    t8 = C102 * t5;
+    t7 = t11 + t8;
+    t9 = 0.07927355304937736 * t7;
+    y[490] = t9;
+    t3 = 0.04972839141369215 * t7;
+    y[589] = t3;
+    t13 = re[56];
+    t4 = im[56];
+    t10 = re[101];
+    t0 = im[101];
+    t1 = re[146];
+    t14 = im[146];
+    t6 = re[11];
+    t12 = im[11];
+    t2 = t13 + t1;
+    t5 = t4 + t14;
+    t11 = t10 + t6;
+    t8 = t0 + t12;
+    t9 = t13 - t1;
+    t7 = t4 - t14;
+    t3 = t10 - t6;
+    t13 = t0 - t12;
+    t1 = t2 + t11;
+    t4 = t5 + t8;
+    t14 = t9 + t13;
+    t10 = t7 - t3;
+    t6 = t2 - t11;
+    t0 = t5 - t8;
+    t12 = t9 - t13;
+    t2 = t7 + t3;
+    t11 = C104 * t1;
+    t5 = C105 * t4;
+    t8 = t11 + t5;
+    t9 = 0.012129720199284709 * t8;
+    y[132] = t9;
+    t13 = (-0.0622870096006031) * t8;
+    y[227] = t13;
+    t7 = (-C105) * t1;
+    t3 = C104 * t4;
+    t11 = t7 + t3;
+    t5 = 0.0792877978708678 * t11;
+    y[492] = t5;
+    t9 = 0.05086314591152052 * t11;
+    y[587] = t9;
+    t8 = (-C106) * t14;
+    t13 = (-C107) * t10;
+    t1 = t8 + t13;
+    t4 = 0.07923549255550565 * t1;
+    y[497] = t4;
+    t7 = 0.053648147946663574 * t1;
+    y[582] = t7;
+    t3 = C107 * t14;
+    t5 = (-C106) * t10;
+    t11 = t3 + t5;
+    t9 = 0.014436325447654757 * t11;
+    y[137] = t9;
+    t8 = (-0.06034004810135273) * t11;
+    y[222] = t8;
+    t13 = (-C108) * t6;
+    t4 = (-C109) * t0;
+    t1 = t13 + t4;
+    t7 = 0.07384850942488619 * t1;
+    y[407] = t7;
+    t14 = 0.0075651186862769355 * t1;
+    y[672] = t14;
+    t10 = C109 * t6;
+    t3 = (-C108) * t0;
+    t5 = t10 + t3;
+    y[47] = 0;
+    t9 = (-0.07522908178947471) * t5;
+    y[312] = t9;
+    t11 = C110 * t12;
+    t8 = C111 * t2;
+    t13 = t11 + t8;
+    y[42] = 0;
+    t4 = (-0.07528713607533286) * t13;
+    y[317] = t4;
+    t7 = (-C111) * t12;
+    t1 = C110 * t2;
+    t14 = t7 + t1;
+    t6 = 0.07379156447120827 * t14;
+    y[402] = t6;
+    t0 = 0.006101107904815549 * t14;
+    y[677] = t0;
+    t10 = re[152];
+    t3 = im[152];
+    t5 = re[17];
+    t9 = im[17];
+    t11 = re[62];
+    t8 = im[62];
+    t13 = re[107];
+    t4 = im[107];
+    t12 = t10 + t11;
+    t2 = t3 + t8;
+    t7 = t5 + t13;
+    t1 = t9 + t4;
+    t6 = t10 - t11;
+    t14 = t3 - t8;
+    t0 = t5 - t13;
+    t10 = t9 - t4;
+    t11 = t12 + t7;
+    t3 = t2 + t1;
+    t8 = t6 + t10;
+    t5 = t14 - t0;
+    t13 = t12 - t7;
+    t9 = t2 - t1;
+    t4 = t6 - t10;
+    t12 = t14 + t0;
+    t7 = C112 * t11;
+    t2 = C113 * t3;
+    t1 = t7 + t2;
+    y[44] = 0;
+    t6 = (-0.07526930436857467) * t1;
+    y[315] = t6;
+    t10 = (-C113) * t11;
+    t14 = C112 * t3;
+    t0 = t10 + t14;
+    t7 = 0.07380904609336382 * t0;
+    y[404] = t7;
+    t2 = 0.006666148096164151 * t0;
+    y[675] = t2;
+    t1 = C114 * t8;
+    t6 = C115 * t5;
+    t11 = t1 + t6;
+    t3 = 0.013031765120859037 * t11;
+    y[134] = t3;
+    t10 = (-0.0615277960611282) * t11;
+    y[225] = t10;
+    t14 = (-C115) * t8;
+    t7 = C114 * t5;
+    t0 = t14 + t7;
+    t2 = 0.07928247848482699 * t0;
+    y[494] = t2;
+    t1 = 0.051986770927596154 * t0;
+    y[585] = t1;
+    t6 = (-C116) * t13;
+    t3 = (-C117) * t9;
+    t11 = t6 + t3;
+    t10 = 0.07927218730124422 * t11;
+    y[495] = t10;
+    t8 = 0.05254388148070578 * t11;
+    y[584] = t8;
+    t5 = C117 * t13;
+    t14 = (-C116) * t9;
+    t7 = t5 + t14;
+    t2 = 0.013492984538424497 * t7;
+    y[135] = t2;
+    t0 = (-0.06113848930054078) * t7;
+    y[224] = t0;
+    t1 = (-C118) * t4;
+    t6 = (-C119) * t12;
+    t3 = t1 + t6;
+    t10 = 0.07382038068434472 * t3;
+    y[405] = t10;
+    t11 = 0.006958960986894562 * t3;
+    y[674] = t11;
+    t8 = C119 * t4;
+    t13 = (-C118) * t12;
+    t9 = t8 + t13;
+    y[45] = 0;
+    t5 = (-0.07525774730573473) * t9;
+    y[314] = t5;
+    t14 = re[68];
+    t2 = im[68];
+    t7 = re[113];
+    t0 = im[113];
+    t1 = re[158];
+    t6 = im[158];
+    t10 = re[23];
+    t3 = im[23];
+    t11 = t14 + t1;
+    t4 = t2 + t6;
+    t12 = t7 + t10;
+    t8 = t0 + t3;
+    t13 = t14 - t1;
+    t9 = t2 - t6;
+    t5 = t7 - t10;
+    t14 = t0 - t3;
+    t1 = t11 + t12;
+    t2 = t4 + t8;
+    t6 = t13 + t14;
+    t7 = t9 - t5;
+    t10 = t11 - t12;
+    t0 = t4 - t8;
+    t3 = t13 - t14;
+    t11 = t9 + t5;
+    t12 = (-C120) * t1;
+    t4 = (-C121) * t2;
+    t8 = t12 + t4;
+    t13 = 0.07379941994529313 * t8;
+    y[403] = t13;
+    t14 = 0.006380248502440559 * t8;
+    y[676] = t14;
+    t9 = C121 * t1;
+    t5 = (-C120) * t2;
+    t12 = t9 + t5;
+    y[43] = 0;
+    t4 = (-0.07527912224342473) * t12;
+    y[316] = t4;
+    t13 = C122 * t6;
+    t8 = C123 * t7;
+    t14 = t13 + t8;
+    y[46] = 0;
+    t1 = (-0.07524431766225147) * t14;
+    y[313] = t1;
+    t2 = (-C123) * t6;
+    t9 = C122 * t7;
+    t5 = t2 + t9;
+    t12 = 0.07383355618284335 * t5;
+    y[406] = t12;
+    t4 = 0.007258624754882618 * t5;
+    y[673] = t4;
+    t13 = C124 * t10;
+    t8 = C125 * t0;
+    t14 = t13 + t8;
+    t1 = 0.013961288678997456 * t14;
+    y[136] = t1;
+    t6 = (-0.060742536777194996) * t14;
+    y[223] = t6;
+    t7 = (-C125) * t10;
+    t2 = C124 * t0;
+    t9 = t7 + t2;
+    t12 = 0.07925654623502265 * t9;
+    y[496] = t12;
+    t5 = 0.05309766870993954 * t9;
+    y[583] = t5;
+    t4 = (-C126) * t3;
+    t13 = (-C127) * t11;
+    t8 = t4 + t13;
+    t1 = 0.07928765862449144 * t8;
+    y[493] = t1;
+    t14 = 0.051426496623277064 * t8;
+    y[586] = t14;
+    t6 = C127 * t3;
+    t10 = (-C126) * t11;
+    t0 = t6 + t10;
+    t7 = 0.012577110492092577 * t0;
+    y[133] = t7;
+    t2 = (-0.06191075522297103) * t0;
+    y[226] = t2;
+    t12 = re[4];
+    t9 = im[4];
+    t5 = re[49];
+    t4 = im[49];
+    t13 = re[94];
+    t1 = im[94];
+    t8 = re[139];
+    t14 = im[139];
+    t3 = t12 + t13;
+    t11 = t9 + t1;
+    t6 = t5 + t8;
+    t10 = t4 + t14;
+    t7 = t12 - t13;
+    t0 = t9 - t1;
+    t2 = t5 - t8;
+    t12 = t4 - t14;
+    t13 = t3 + t6;
+    t9 = t11 + t10;
+    t1 = t7 + t12;
+    t5 = t0 - t2;
+    t8 = t3 - t6;
+    t4 = t11 - t10;
+    t14 = t7 - t12;
+    t3 = t0 + t2;
+    t6 = (-C128) * t13;
+    t11 = (-C129) * t9;
+    t10 = t6 + t11;
+    t7 = 0.07928303866608047 * t10;
+    y[491] = t7;
+    t12 = 0.050297128855992426 * t10;
+    y[588] = t12;
+    t0 = C129 * t13;
+    t2 = (-C128) * t9;
+    t6 = t0 + t2;
+    t11 = 0.011689066002518803 * t6;
+    y[131] = t11;
+    t7 = (-0.06265689585313484) * t6;
+    y[228] = t7;
+    t10 = (-C130) * t1;
+    t12 = (-C131) * t5;
+    t13 = t10 + t12;
+    t9 = 0.07378534815077109 * t13;
+    y[401] = t9;
+    t0 = 0.005828892956762125 * t13;
+    y[678] = t0;
+    t2 = C131 * t1;
+    t11 = (-C130) * t5;
+    t6 = t2 + t11;
+    y[41] = 0;
+    t7 = (-0.07529347891946621) * t6;
+    y[318] = t7;
+    t10 = C132 * t8;
+    t12 = C133 * t4;
+    t9 = t10 + t12;
+    y[48] = 0;
+    t13 = (-0.07521191392388182) * t9;
+    y[311] = t13;
+    t0 = (-C133) * t8;
+    t1 = C132 * t4;
+    t5 = t0 + t1;
+    t2 = 0.07386536607987472 * t5;
+    y[408] = t2;
+    t11 = 0.007878320426860737 * t5;
+    y[671] = t11;
+    t6 = C134 * t14;
+    t7 = C135 * t3;
+    t10 = t6 + t7;
+    t12 = 0.01491758532673113 * t10;
+    y[138] = t12;
+    t9 = (-0.05993109228259522) * t10;
+    y[221] = t9;
+    t13 = (-C135) * t14;
+    t8 = C134 * t3;
+    t4 = t13 + t8;
+    t0 = 0.07920922261372015 * t4;
+    y[498] = t0;
+    t1 = 0.054195119903981286 * t4;
+    y[581] = t1;
+    t2 = re[100];
+    t5 = im[100];
+    t11 = re[145];
+    t6 = im[145];
+    t7 = re[10];
+    t12 = im[10];
+    t10 = re[55];
+    t9 = im[55];
+    t14 = t2 + t7;
+    t3 = t5 + t12;
+    t13 = t11 + t10;
+    t8 = t6 + t9;
+    t0 = t2 - t7;
+    t4 = t5 - t12;
+    t1 = t11 - t10;
+    t2 = t6 - t9;
+    t7 = t14 + t13;
+    t5 = t3 + t8;
+    t12 = t0 + t2;
+    t11 = t4 - t1;
+    t10 = t14 - t13;
+    t6 = t3 - t8;
+    t9 = t0 - t2;
+    t14 = t4 + t1;
+    t13 = C136 * t7;
+    t3 = C137 * t5;
+    t8 = t13 + t3;
+    t0 = 0.015898542092392835 * t8;
+    y[140] = t0;
+    t2 = (-0.05909416479402423) * t8;
+    y[219] = t2;
+    t4 = (-C137) * t7;
+    t1 = C136 * t5;
+    t13 = t4 + t1;
+    t3 = 0.07913993568537958 * t13;
+    y[500] = t3;
+    t0 = 0.055278474546151535 * t13;
+    y[579] = t0;
+    t8 = (-C138) * t12;
+    t2 = (-C139) * t11;
+    t7 = t8 + t2;
+    t5 = 0.07925944743120644 * t7;
+    y[489] = t5;
+    t4 = 0.049157257914493886 * t7;
+    y[590] = t4;
+    t1 = C139 * t12;
+    t3 = (-C138) * t11;
+    t13 = t1 + t3;
+    t0 = 0.01082989060848449 * t13;
+    y[129] = t0;
+    t8 = (-0.0633765184155293) * t13;
+    y[230] = t8;
+    t2 = (-C140) * t10;
+    t5 = (-C141) * t6;
+    t7 = t2 + t5;
+    t4 = 0.07377787855167459 * t7;
+    y[399] = t4;
+    t12 = 0.005304756981572133 * t7;
+    y[680] = t12;
+    t11 = C141 * t10;
+    t1 = (-C140) * t6;
+    t3 = t11 + t1;
+    y[39] = 0;
+    t0 = (-0.07530110196465468) * t3;
+    y[320] = t0;
+    t13 = C142 * t9;
+    t8 = C143 * t14;
+    t2 = t13 + t8;
+    y[50] = 0;
+    t5 = (-0.0751718910899392) * t2;
+    y[309] = t5;
+    t4 = (-C143) * t9;
+    t7 = C142 * t14;
+    t12 = t4 + t7;
+    t10 = 0.07390469329697484 * t12;
+    y[410] = t10;
+    t6 = 0.008525254162783965 * t12;
+    y[669] = t6;
+    t11 = re[16];
+    t1 = im[16];
+    t3 = re[61];
+    t0 = im[61];
+    t13 = re[106];
+    t8 = im[106];
+    t2 = re[151];
+    t5 = im[151];
+    t9 = t11 + t13;
+    t14 = t1 + t8;
+    t4 = t3 + t2;
+    t7 = t0 + t5;
+    t10 = t11 - t13;
+    t12 = t1 - t8;
+    t6 = t3 - t2;
+    t11 = t0 - t5;
+    t13 = t9 + t4;
+    t1 = t14 + t7;
+    t8 = t10 + t11;
+    t3 = t12 - t6;
+    t2 = t9 - t4;
+    t0 = t14 - t7;
+    t5 = t10 - t11;
+    t9 = t12 + t6;
+    t4 = C144 * t13;
+    t14 = C145 * t1;
+    t7 = t4 + t14;
+    y[52] = 0;
+    t10 = (-0.07512404916003154) * t7;
+    y[307] = t10;
+    t11 = (-C145) * t13;
+    t12 = C144 * t1;
+    t6 = t11 + t12;
+    t4 = 0.07395175869342371 * t6;
+    y[412] = t4;
+    t14 = 0.00919912980539764 * t6;
+    y[667] = t14;
+    t7 = C146 * t8;
+    t10 = C147 * t3;
+    t13 = t7 + t10;
+    t1 = 0.016903811785332918 * t13;
+    y[142] = t1;
+    t11 = (-0.0582318648569364) * t13;
+    y[217] = t11;
+    t12 = (-C147) * t8;
+    t4 = C146 * t3;
+    t6 = t12 + t4;
+    t14 = 0.07904754755085189 * t6;
+    y[502] = t14;
+    t7 = 0.056346430106878946 * t6;
+    y[577] = t7;
+    t10 = (-C148) * t2;
+    t1 = (-C149) * t0;
+    t13 = t10 + t1;
+    t11 = 0.07921804168631846 * t13;
+    y[487] = t11;
+    t8 = 0.0480083543162075 * t13;
+    y[592] = t8;
+    t3 = C149 * t2;
+    t12 = (-C148) * t0;
+    t4 = t3 + t12;
+    t14 = 0.01000057866679364 * t4;
+    y[127] = t14;
+    t6 = (-0.06406929688631251) * t4;
+    y[232] = t6;
+    t7 = (-C150) * t5;
+    t10 = (-C151) * t9;
+    t1 = t7 + t10;
+    t11 = 0.07377673045010832 * t1;
+    y[397] = t11;
+    t13 = 0.004807832252336169 * t1;
+    y[682] = t13;
+    t8 = C151 * t5;
+    t2 = (-C150) * t9;
+    t0 = t8 + t2;
+    y[37] = 0;
+    t3 = (-0.07530227378824429) * t0;
+    y[322] = t3;
+    t12 = re[72];
+    t14 = im[72];
+    t4 = re[117];
+    t6 = im[117];
+    t7 = re[162];
+    t10 = im[162];
+    t11 = re[27];
+    t1 = im[27];
+    t13 = t12 + t7;
+    t5 = t14 + t10;
+    t9 = t4 + t11;
+    t8 = t6 + t1;
+    t2 = t12 - t7;
+    t0 = t14 - t10;
+    t3 = t4 - t11;
+    t12 = t6 - t1;
+    t7 = t13 + t9;
+    t14 = t5 + t8;
+    t10 = t2 + t12;
+    t4 = t0 - t3;
+    t11 = t13 - t9;
+    t6 = t5 - t8;
+    t1 = t2 - t12;
+    t13 = t0 + t3;
+    t9 = (-C152) * t7;
+    t5 = (-C153) * t14;
+    t8 = t9 + t5;
+    t2 = 0.07378162974538252 * t8;
+    y[395] = t2;
+    t12 = 0.004338010208852921 * t8;
+    y[684] = t12;
+    t0 = C153 * t7;
+    t3 = (-C152) * t14;
+    t9 = t0 + t3;
+    y[35] = 0;
+    t5 = (-0.07529727351818549) * t9;
+    y[324] = t5;
+    t2 = C154 * t10;
+    t8 = C155 * t4;
+    t12 = t2 + t8;
+    y[54] = 0;
+    t7 = (-0.07506814700296977) * t12;
+    y[305] = t7;
+    t14 = (-C155) * t10;
+    t0 = C154 * t4;
+    t3 = t14 + t0;
+    t9 = 0.0740068294923514 * t3;
+    y[414] = t9;
+    t5 = 0.00989986156716879 * t3;
+    y[665] = t5;
+    t2 = C156 * t11;
+    t8 = C157 * t6;
+    t12 = t2 + t8;
+    t7 = 0.01793167713832639 * t12;
+    y[144] = t7;
+    t10 = (-0.05734497793414243) * t12;
+    y[215] = t10;
+    t4 = (-C157) * t11;
+    t14 = C156 * t6;
+    t0 = t4 + t14;
+    t9 = 0.07893135423244699 * t0;
+    y[504] = t9;
+    t3 = 0.057397798367898024 * t0;
+    y[575] = t3;
+    t5 = (-C158) * t1;
+    t2 = (-C159) * t13;
+    t8 = t5 + t2;
+    t7 = 0.07915951523735842 * t8;
+    y[485] = t7;
+    t12 = 0.04685099768320636 * t8;
+    y[594] = t12;
+    t10 = C159 * t1;
+    t11 = (-C158) * t13;
+    t6 = t10 + t11;
+    t4 = 0.009201834299866771 * t6;
+    y[125] = t4;
+    t14 = (-0.06473562177238838) * t6;
+    y[234] = t14;
+    t9 = re[168];
+    t0 = im[168];
+    t3 = re[33];
+    t5 = im[33];
+    t2 = re[78];
+    t7 = im[78];
+    t8 = re[123];
+    t12 = im[123];
+    t1 = t9 + t2;
+    t13 = t0 + t7;
+    t10 = t3 + t8;
+    t11 = t5 + t12;
+    t4 = t9 - t2;
+    t6 = t0 - t7;
+    t14 = t3 - t8;
+    t9 = t5 - t12;
+    t2 = t1 + t10;
+    t0 = t13 + t11;
+    t7 = t4 + t9;
+    t3 = t6 - t14;
+    t8 = t1 - t10;
+    t5 = t13 - t11;
+    t12 = t4 - t9;
+    t1 = t6 + t14;
+    t10 = (-C160) * t2;
+    t13 = (-C161) * t0;
+    t11 = t10 + t13;
+    t4 = 0.07908447036354024 * t11;
+    y[483] = t4;
+    t9 = 0.045686310111039866 * t11;
+    y[596] = t9;
+    t6 = C161 * t2;
+    t14 = (-C160) * t0;
+    t10 = t6 + t14;
+    t13 = 0.008434424318712016 * t10;
+    y[123] = t13;
+    t4 = (-0.06537589246986183) * t10;
+    y[236] = t4;
+    t11 = (-C162) * t7;
+    t9 = (-C163) * t3;
+    t2 = t11 + t9;
+    t0 = 0.07379227712376644 * t2;
+    y[393] = t0;
+    t6 = 0.00389514461881248 * t2;
+    y[686] = t6;
+    t14 = C163 * t7;
+    t13 = (-C162) * t3;
+    t10 = t14 + t13;
+    y[33] = 0;
+    t4 = (-0.07528640898610062) * t10;
+    y[326] = t4;
+    t11 = C164 * t8;
+    t9 = C165 * t5;
+    t0 = t11 + t9;
+    y[56] = 0;
+    t2 = (-0.07500397558099361) * t0;
+    y[303] = t2;
+    t6 = (-C165) * t8;
+    t7 = C164 * t5;
+    t3 = t6 + t7;
+    t14 = 0.07407014778245119 * t3;
+    y[416] = t14;
+    t13 = 0.010627184958870271 * t3;
+    y[663] = t13;
+    t10 = C166 * t12;
+    t4 = C167 * t1;
+    t11 = t10 + t4;
+    t9 = 0.018981178489387872 * t11;
+    y[146] = t9;
+    t0 = (-0.05643381030579669) * t11;
+    y[213] = t0;
+    t2 = (-C167) * t12;
+    t8 = C166 * t1;
+    t5 = t2 + t8;
+    t6 = 0.07879064723850839 * t5;
+    y[506] = t6;
+    t7 = 0.058431520258171214 * t5;
+    y[573] = t7;
+    t14 = re[84];
+    t3 = im[84];
+    t13 = re[129];
+    t10 = im[129];
+    t4 = re[174];
+    t9 = im[174];
+    t11 = re[39];
+    t0 = im[39];
+    t12 = t14 + t4;
+    t1 = t3 + t9;
+    t2 = t13 + t11;
+    t8 = t10 + t0;
+    t6 = t14 - t4;
+    t5 = t3 - t9;
+    t7 = t13 - t11;
+    t14 = t10 - t0;
+    t4 = t12 + t2;
+    t3 = t1 + t8;
+    t9 = t6 + t14;
+    t13 = t5 - t7;
+    t11 = t12 - t2;
+    t10 = t1 - t8;
+    t0 = t6 - t14;
+    t12 = t5 + t7;
+    t2 = C168 * t4;
+    t1 = C169 * t3;
+    t8 = t2 + t1;
+    t6 = 0.02005153598606483 * t8;
+    y[148] = t6;
+    t14 = (-0.05549852471039634) * t8;
+    y[211] = t14;
+    t5 = (-C169) * t4;
+    t7 = C168 * t3;
+    t2 = t5 + t7;
+    t1 = 0.07862483745225313 * t2;
+    y[508] = t1;
+    t6 = 0.05944647194056285 * t2;
+    y[571] = t6;
+    t8 = (-C170) * t9;
+    t14 = (-C171) * t13;
+    t4 = t8 + t14;
+    t3 = 0.0789941020164104 * t4;
+    y[481] = t3;
+    t5 = 0.04451574105757036 * t4;
+    y[598] = t5;
+    t7 = C171 * t9;
+    t1 = (-C170) * t13;
+    t2 = t7 + t1;
+    t6 = 0.007698836753981549 * t2;
+    y[121] = t6;
+    t8 = (-0.06599019419307889) * t2;
+    y[238] = t8;
+    t14 = (-C172) * t11;
+    t3 = (-C173) * t10;
+    t4 = t14 + t3;
+    t5 = 0.07380836847924803 * t4;
+    y[391] = t5;
+    t9 = 0.003478890727204296 * t4;
+    y[688] = t9;
+    t13 = C173 * t11;
+    t7 = (-C172) * t10;
+    t1 = t13 + t7;
+    y[31] = 0;
+    t6 = (-0.07526999539513679) * t1;
+    y[328] = t6;
+    t2 = C174 * t0;
+    t8 = C175 * t12;
+    t14 = t2 + t8;
+    y[58] = 0;
+    t3 = (-0.07493137687072132) * t14;
+    y[301] = t3;
+    t5 = (-C175) * t0;
+    t4 = C174 * t12;
+    t9 = t5 + t4;
+    t11 = 0.07414191207430397 * t9;
+    y[418] = t11;
+    t10 = 0.011380873256119571 * t9;
+    y[661] = t10;
+    t13 = re[20];
+    t7 = im[20];
+    t1 = re[65];
+    t6 = im[65];
+    t2 = re[110];
+    t8 = im[110];
+    t14 = re[155];
+    t3 = im[155];
+    t0 = t13 + t2;
+    t12 = t7 + t8;
+    t5 = t1 + t14;
+    t4 = t6 + t3;
+    t11 = t13 - t2;
+    t9 = t7 - t8;
+    t10 = t1 - t14;
+    t13 = t6 - t3;
+    t2 = t0 + t5;
+    t7 = t12 + t4;
+    t8 = t11 + t13;
+    t1 = t9 - t10;
+    t14 = t0 - t5;
+    t6 = t12 - t4;
+    t3 = t11 - t13;
+    t0 = t9 + t10;
+    t5 = C176 * t2;
+    t12 = C177 * t7;
+    t4 = t5 + t12;
+    y[60] = 0;
+    t11 = (-0.07485027111278542) * t4;
+    y[299] = t11;
+    t13 = (-C177) * t2;
+    t9 = C176 * t7;
+    t10 = t13 + t9;
+    t5 = 0.07422225027327382 * t10;
+    y[420] = t5;
+    t12 = 0.012160671482139212 * t10;
+    y[659] = t12;
+    t4 = C178 * t8;
+    t11 = C179 * t1;
+    t2 = t4 + t11;
+    t7 = 0.02113986934740008 * t2;
+    y[150] = t7;
+    t13 = (-0.054540535915650216) * t2;
+    y[209] = t13;
+    t9 = (-C179) * t8;
+    t5 = C178 * t1;
+    t10 = t9 + t5;
+    t12 = 0.07843375404242915 * t10;
+    y[510] = t12;
+    t4 = 0.06044202805644682 * t10;
+    y[569] = t4;
+    t11 = (-C180) * t14;
+    t7 = (-C181) * t6;
+    t2 = t11 + t7;
+    t13 = 0.07889007024276715 * t2;
+    y[479] = t13;
+    t8 = 0.04334071171649066 * t2;
+    y[600] = t8;
+    t1 = C181 * t14;
+    t9 = (-C180) * t6;
+    t5 = t1 + t9;
+    t12 = 0.006995911514090678 * t5;
+    y[119] = t12;
+    t10 = (-0.06657805925722098) * t5;
+    y[240] = t10;
+    t4 = (-C182) * t3;
+    t11 = (-C183) * t0;
+    t7 = t4 + t11;
+    t13 = 0.07382960802169211 * t7;
+    y[389] = t13;
+    t2 = 0.0030890222459463205 * t7;
+    y[690] = t2;
+    t8 = C183 * t3;
+    t14 = (-C182) * t0;
+    t6 = t8 + t14;
+    y[29] = 0;
+    t1 = (-0.07524834147735497) * t6;
+    y[330] = t1;
+    t9 = re[116];
+    t12 = im[116];
+    t5 = re[161];
+    t10 = im[161];
+    t4 = re[26];
+    t11 = im[26];
+    t13 = re[71];
+    t7 = im[71];
+    t2 = t9 + t4;
+    t3 = t12 + t11;
+    t0 = t5 + t13;
+    t8 = t10 + t7;
+    t14 = t9 - t4;
+    t6 = t12 - t11;
+    t1 = t5 - t13;
+    t9 = t10 - t7;
+    t4 = t2 + t0;
+    t12 = t3 + t8;
+    t11 = t14 + t9;
+    t5 = t6 - t1;
+    t13 = t2 - t0;
+    t10 = t3 - t8;
+    t7 = t14 - t9;
+    t2 = t6 + t1;
+    t0 = (-C184) * t4;
+    t3 = (-C185) * t12;
+    t8 = t0 + t3;
+    t14 = 0.0738556887375873 * t8;
+    y[387] = t14;
+    t9 = 0.002725625043690865 * t8;
+    y[692] = t9;
+    t6 = C185 * t4;
+    t1 = (-C184) * t12;
+    t0 = t6 + t1;
+    y[27] = 0;
+    t3 = (-0.07522176897293187) * t0;
+    y[332] = t3;
+    t14 = C186 * t11;
+    t8 = C187 * t5;
+    t9 = t14 + t8;
+    y[62] = 0;
+    t4 = (-0.0747604873846722) * t9;
+    y[297] = t4;
+    t12 = (-C187) * t11;
+    t6 = C186 * t5;
+    t1 = t12 + t6;
+    t0 = 0.07431138760465847 * t1;
+    y[422] = t0;
+    t3 = 0.012966061461159185 * t1;
+    y[657] = t3;
+    t14 = C188 * t13;
+    t8 = C189 * t10;
+    t9 = t14 + t8;
+    t4 = 0.022245471494846798 * t9;
+    y[152] = t4;
+    t11 = (-0.05356040398594876) * t9;
+    y[207] = t11;
+    t5 = (-C189) * t13;
+    t12 = C188 * t10;
+    t6 = t5 + t12;
+    t0 = 0.07821641575885593 * t6;
+    y[512] = t0;
+    t1 = 0.06141711716448885 * t6;
+    y[567] = t1;
+    t3 = (-C190) * t7;
+    t14 = (-C191) * t2;
+    t8 = t3 + t14;
+    t4 = 0.07877322937044845 * t8;
+    y[477] = t4;
+    t9 = 0.04216237624301753 * t8;
+    y[602] = t9;
+    t11 = C191 * t7;
+    t13 = (-C190) * t2;
+    t10 = t11 + t13;
+    t5 = 0.00632622466030756 * t10;
+    y[117] = t5;
+    t12 = (-0.06713990188669226) * t10;
+    y[242] = t12;
+    t0 = re[32];
+    t6 = im[32];
+    t1 = re[77];
+    t3 = im[77];
+    t14 = re[122];
+    t4 = im[122];
+    t8 = re[167];
+    t9 = im[167];
+    t7 = t0 + t14;
+    t2 = t6 + t4;
+    t11 = t1 + t8;
+    t13 = t3 + t9;
+    t5 = t0 - t14;
+    t10 = t6 - t4;
+    t12 = t1 - t8;
+    t0 = t3 - t9;
+    t14 = t7 + t11;
+    t6 = t2 + t13;
+    t4 = t5 + t0;
+    t1 = t10 - t12;
+    t8 = t7 - t11;
+    t3 = t2 - t13;
+    t9 = t5 - t0;
+    t7 = t10 + t12;
+    t11 = (-C192) * t14;
+    t2 = (-C193) * t6;
+    t13 = t11 + t2;
+    t5 = 0.0786440057564167 * t13;
+    y[475] = t5;
+    t0 = 0.040982004156227624 * t13;
+    y[604] = t0;
+    t10 = C193 * t14;
+    t12 = (-C192) * t6;
+    t11 = t10 + t12;
+    t2 = 0.0056902696629836606 * t11;
+    y[115] = t2;
+    t5 = (-0.06767657432229467) * t11;
+    y[244] = t5;
+    t13 = (-C194) * t4;
+    t0 = (-C195) * t1;
+    t14 = t13 + t0;
+    t6 = 0.07388628536627204 * t14;
+    y[385] = t6;
+    t10 = 0.002388239070442009 * t14;
+    y[694] = t10;
+    t12 = C195 * t4;
+    t2 = (-C194) * t1;
+    t11 = t12 + t2;
+    y[25] = 0;
+    t5 = (-0.07519061931473928) * t11;
+    y[334] = t5;
+    t13 = C196 * t8;
+    t0 = C197 * t3;
+    t6 = t13 + t0;
+    y[64] = 0;
+    t14 = (-0.07466183533419639) * t6;
+    y[295] = t14;
+    t10 = (-C197) * t8;
+    t4 = C196 * t3;
+    t1 = t10 + t4;
+    t12 = 0.07440957660213073 * t1;
+    y[424] = t12;
+    t2 = 0.013796025469382255 * t1;
+    y[655] = t2;
+    t11 = C198 * t9;
+    t5 = C199 * t7;
+    t13 = t11 + t5;
+    t0 = 0.023366643389733904 * t13;
+    y[154] = t0;
+    t6 = (-0.052559051234607114) * t13;
+    y[205] = t6;
+    t14 = (-C199) * t9;
+    t8 = C198 * t7;
+    t3 = t14 + t8;
+    t10 = 0.07797231412824676 * t3;
+    y[514] = t10;
+    t4 = 0.0623711620920472 * t3;
+    y[565] = t4;
+}
+
+/**
+ *  Part 6 of ApplyWindowedIMDCT_W75_360_K60().
+ * 
+ *  @param {Number[]} X 
+ *    - The input block (360 points, only the first 60 points are used).
+ *  @param {Number[]} y 
+ *    - The array that would contain the output block (720 points).
+ *  @param {Number[]} re 
+ *    - The scratch buffer (real part, 180 points).
+ *  @param {Number[]} im 
+ *    - The scratch buffer (imaginary part, 180 points).
+ */
+function ApplyWindowedIMDCT_W75_360_K60_Part6(X, y, re, im) {
+    let t0, t1, t10, t11, t12, t13, t14, t2, t3, t4, t5, t6, t7, t8, t9;
+    const C0 = 0.10235850603495578;
+    const C1 = 0.9947475741323987;
+    const C2 = 0.9581978281773966;
+    const C3 = 0.28610648730170424;
+    const C4 = 0.7757711489673284;
+    const C5 = 0.6310143615084456;
+    const C6 = 0.47524034470996157;
+    const C7 = 0.8798560193349574;
+    const C8 = 0.4675441542276683;
+    const C9 = 0.8839697188521416;
+    const C10 = 0.09367390851910222;
+    const C11 = 0.9956029323293272;
+    const C12 = 0.9556646245224285;
+    const C13 = 0.2944573406054019;
+    const C14 = 0.7702350407533842;
+    const C15 = 0.6377601288851731;
+    const C16 = 0.7646402761590003;
+    const C17 = 0.6444573283588975;
+    const C18 = 0.45981235844785984;
+    const C19 = 0.8880161006528073;
+    const C20 = 0.08498217737244167;
+    const C21 = 0.9963824715083254;
+    const C22 = 0.953058643306297;
+    const C23 = 0.3027857698425746;
+    const C24 = 0.9503800829845611;
+    const C25 = 0.31109114077109096;
+    const C26 = 0.7589872812471619;
+    const C27 = 0.6511054499119491;
+    const C28 = 0.45204554617671966;
+    const C29 = 0.8919948565893142;
+    const C30 = 0.0762839745039523;
+    const C31 = 0.9970861323044666;
+    const C32 = 0.06757996231545906;
+    const C33 = 0.9977138611312569;
+    const C34 = 0.9476291475399599;
+    const C35 = 0.31937282090479924;
+    const C36 = 0.7532764865153176;
+    const C37 = 0.6577039872641327;
+    const C38 = 0.4442443088870726;
+    const C39 = 0.8959056836639933;
+    const C40 = 0.436409240673342;
+    const C41 = 0.8997482840522215;
+    const C42 = 0.05887080365118903;
+    const C43 = 0.9982656101847159;
+    const C44 = 0.944806046466878;
+    const C45 = 0.3276301795616935;
+    const C46 = 0.7475083268625968;
+    const C47 = 0.6642524379112817;
+    const C48 = 0.7416832415566892;
+    const C49 = 0.6707503031635259;
+    const C50 = 0.4285409382063071;
+    const C51 = 0.903522365125102;
+    const C52 = 0.05015716174729338;
+    const C53 = 0.9987413374470168;
+    const C54 = 0.9419109947553924;
+    const C55 = 0.33586258791194235;
+    const C56 = 0.9389442128748994;
+    const C57 = 0.3440694190257768;
+    const C58 = 0.7358016742003936;
+    const C59 = 0.6771970881832687;
+    const C60 = 0.4206400006876641;
+    const C61 = 0.9072276394717491;
+    const C62 = 0.04143970018133933;
+    const C63 = 0.9991410066896868;
+    const C64 = 0.03271908282177614;
+    const C65 = 0.9994645874763657;
+    const C66 = 0.9359059267573258;
+    const C67 = 0.3522500479212335;
+    const C68 = 0.7298640726978356;
+    const C69 = 0.6835923020228712;
+    const C70 = 0.41270702980439467;
+    const C71 = 0.9108638249211758;
+    const C72 = 0.4047426296829455;
+    const C73 = 0.9144306445637821;
+    const C74 = 0.023995973777378995;
+    const C75 = 0.9997120551651237;
+    const C76 = 0.9327963677799223;
+    const C77 = 0.3604038516117495;
+    const C78 = 0.7238708892203581;
+    const C79 = 0.6899354576620396;
+    const C80 = 0.7178225801720864;
+    const C81 = 0.6962260720449132;
+    const C82 = 0.3967474068432212;
+    const C83 = 0.9179278267724427;
+    const C84 = 0.015271037346674515;
+    const C85 = 0.9998833909103383;
+    const C86 = 0.9296157727476445;
+    const C87 = 0.368530209153605;
+    const C88 = 0.9263643838751181;
+    const C89 = 0.3766285016932107;
+    const C90 = 0.7117196061551713;
+    const C91 = 0.7024636661168517;
+    const C92 = 0.38872197015239557;
+    const C93 = 0.9213551052231925;
+    const C94 = 0.006544937967351858;
+    const C95 = 0.9999785816641292;
+    t12 = re[148];
+    t1 = im[148];
+    t2 = re[13];
+    t11 = im[13];
+    t5 = re[58];
+    t0 = im[58];
+    t13 = re[103];
+    t6 = im[103];
+    t9 = t12 + t5;
+    t7 = t1 + t0;
+    t14 = t2 + t13;
+    t8 = t11 + t6;
+    t10 = t12 - t5;
+    t3 = t1 - t0;
+    t4 = t2 - t13;
+    t12 = t11 - t6;
+    t5 = t9 + t14;
+    t1 = t7 + t8;
+    t0 = t10 + t12;
+    t2 = t3 - t4;
+    t13 = t9 - t14;
+    t11 = t7 - t8;
+    t6 = t10 - t12;
+    t9 = t3 + t4;
+    t14 = C0 * t5;
+    t7 = C1 * t1;
+    t8 = t14 + t7;
+    t10 = 0.024502010484116685 * t8;
+    y[156] = t10;
+    t12 = (-0.051537200432593716) * t8;
+    y[203] = t12;
+    t3 = (-C1) * t5;
+    t4 = C0 * t1;
+    t14 = t3 + t4;
+    t7 = 0.07770100053496265 * t14;
+    y[516] = t7;
+    t10 = 0.06330352026326927 * t14;
+    y[563] = t10;
+    t8 = (-C2) * t0;
+    t12 = (-C3) * t2;
+    t5 = t8 + t12;
+    t1 = 0.07850338675965945 * t5;
+    y[473] = t1;
+    t3 = 0.03980072930307692 * t5;
+    y[606] = t3;
+    t4 = C3 * t0;
+    t7 = (-C2) * t2;
+    t14 = t4 + t7;
+    t10 = 0.005088538798301135 * t14;
+    y[113] = t10;
+    t8 = (-0.06818849760819402) * t14;
+    y[246] = t8;
+    t12 = (-C4) * t13;
+    t1 = (-C5) * t11;
+    t5 = t12 + t1;
+    t3 = 0.0739211028647384 * t5;
+    y[383] = t3;
+    t0 = 0.0020762064534554383 * t5;
+    y[696] = t0;
+    t2 = C5 * t13;
+    t4 = (-C4) * t11;
+    t7 = t2 + t4;
+    y[23] = 0;
+    t10 = (-0.0751552038627071) * t7;
+    y[336] = t10;
+    t14 = C6 * t6;
+    t8 = C7 * t9;
+    t12 = t14 + t8;
+    y[66] = 0;
+    t1 = (-0.07455431330961315) * t12;
+    y[293] = t1;
+    t3 = (-C7) * t6;
+    t5 = C6 * t9;
+    t0 = t3 + t5;
+    t13 = 0.07451688988783449 * t0;
+    y[426] = t13;
+    t11 = 0.014650456311092089 * t0;
+    y[653] = t11;
+    t2 = re[64];
+    t4 = im[64];
+    t7 = re[109];
+    t10 = im[109];
+    t14 = re[154];
+    t8 = im[154];
+    t12 = re[19];
+    t1 = im[19];
+    t6 = t2 + t14;
+    t9 = t4 + t8;
+    t3 = t7 + t12;
+    t5 = t10 + t1;
+    t13 = t2 - t14;
+    t0 = t4 - t8;
+    t11 = t7 - t12;
+    t2 = t10 - t1;
+    t14 = t6 + t3;
+    t4 = t9 + t5;
+    t8 = t13 + t2;
+    t7 = t0 - t11;
+    t12 = t6 - t3;
+    t10 = t9 - t5;
+    t1 = t13 - t2;
+    t6 = t0 + t11;
+    t3 = C8 * t14;
+    t9 = C9 * t4;
+    t5 = t3 + t9;
+    y[68] = 0;
+    t13 = (-0.0744379272334968) * t5;
+    y[291] = t13;
+    t2 = (-C9) * t14;
+    t0 = C8 * t4;
+    t11 = t2 + t0;
+    t3 = 0.0746333994245822 * t11;
+    y[428] = t3;
+    t9 = 0.015529151731525307 * t11;
+    y[651] = t9;
+    t5 = C10 * t8;
+    t13 = C11 * t7;
+    t14 = t5 + t13;
+    t4 = 0.02564994813000861 * t14;
+    y[158] = t4;
+    t2 = (-0.050495641314265864) * t14;
+    y[201] = t2;
+    t0 = (-C11) * t8;
+    t3 = C10 * t7;
+    t11 = t0 + t3;
+    t9 = 0.07740250729577286 * t11;
+    y[518] = t9;
+    t5 = 0.06421324136700357 * t11;
+    y[561] = t5;
+    t13 = (-C12) * t12;
+    t4 = (-C13) * t10;
+    t14 = t13 + t4;
+    t2 = 0.07835306485128514 * t14;
+    y[471] = t2;
+    t8 = 0.03862009352798275 * t14;
+    y[608] = t8;
+    t7 = C13 * t12;
+    t0 = (-C12) * t10;
+    t3 = t7 + t0;
+    t9 = 0.004521478542881972 * t3;
+    y[111] = t9;
+    t11 = (-0.06867549650492617) * t3;
+    y[248] = t11;
+    t5 = (-C14) * t1;
+    t13 = (-C15) * t6;
+    t4 = t5 + t13;
+    t2 = 0.0739598233310438 * t4;
+    y[381] = t2;
+    t14 = 0.0017892804740102255 * t4;
+    y[698] = t14;
+    t8 = C15 * t1;
+    t12 = (-C14) * t6;
+    t10 = t8 + t12;
+    y[21] = 0;
+    t7 = (-0.07511585757430651) * t10;
+    y[338] = t7;
+    t0 = re[160];
+    t9 = im[160];
+    t3 = re[25];
+    t11 = im[25];
+    t5 = re[70];
+    t13 = im[70];
+    t2 = re[115];
+    t4 = im[115];
+    t14 = t0 + t5;
+    t1 = t9 + t13;
+    t6 = t3 + t2;
+    t8 = t11 + t4;
+    t12 = t0 - t5;
+    t10 = t9 - t13;
+    t7 = t3 - t2;
+    t0 = t11 - t4;
+    t5 = t14 + t6;
+    t9 = t1 + t8;
+    t13 = t12 + t0;
+    t3 = t10 - t7;
+    t2 = t14 - t6;
+    t11 = t1 - t8;
+    t4 = t12 - t0;
+    t14 = t10 + t7;
+    t6 = (-C16) * t5;
+    t1 = (-C17) * t9;
+    t8 = t6 + t1;
+    t12 = 0.07400212506510842 * t8;
+    y[379] = t12;
+    t0 = 0.0015273734490899057 * t8;
+    y[700] = t0;
+    t10 = C17 * t5;
+    t7 = (-C16) * t9;
+    t6 = t10 + t7;
+    y[19] = 0;
+    t1 = (-0.075072919198843) * t6;
+    y[340] = t1;
+    t12 = C18 * t13;
+    t8 = C19 * t3;
+    t0 = t12 + t8;
+    y[70] = 0;
+    t5 = (-0.0743124672610912) * t0;
+    y[289] = t5;
+    t9 = (-C19) * t13;
+    t10 = C18 * t3;
+    t7 = t9 + t10;
+    t6 = 0.07475940121913238 * t7;
+    y[430] = t6;
+    t1 = 0.01643140007008193 * t7;
+    y[649] = t1;
+    t12 = C20 * t2;
+    t8 = C21 * t11;
+    t0 = t12 + t8;
+    t5 = 0.026808971667655078 * t0;
+    y[160] = t5;
+    t13 = (-0.04943537917192268) * t0;
+    y[199] = t13;
+    t3 = (-C21) * t2;
+    t9 = C20 * t11;
+    t10 = t3 + t9;
+    t6 = 0.07707650387176249 * t10;
+    y[520] = t6;
+    t7 = 0.0650994518941004 * t10;
+    y[559] = t7;
+    t1 = (-C22) * t4;
+    t12 = (-C23) * t14;
+    t8 = t1 + t12;
+    t5 = 0.07819438677399508 * t8;
+    y[469] = t5;
+    t0 = 0.0374410809653893 * t8;
+    y[610] = t0;
+    t13 = C23 * t4;
+    t2 = (-C22) * t14;
+    t11 = t13 + t2;
+    t3 = 0.003989471102289299 * t11;
+    y[109] = t3;
+    t9 = (-0.06913776893770059) * t11;
+    y[250] = t9;
+    t6 = re[36];
+    t10 = im[36];
+    t7 = re[81];
+    t1 = im[81];
+    t12 = re[126];
+    t5 = im[126];
+    t8 = re[171];
+    t0 = im[171];
+    t4 = t6 + t12;
+    t14 = t10 + t5;
+    t13 = t7 + t8;
+    t2 = t1 + t0;
+    t3 = t6 - t12;
+    t11 = t10 - t5;
+    t9 = t7 - t8;
+    t6 = t1 - t0;
+    t12 = t4 + t13;
+    t10 = t14 + t2;
+    t5 = t3 + t6;
+    t7 = t11 - t9;
+    t8 = t4 - t13;
+    t1 = t14 - t2;
+    t0 = t3 - t6;
+    t4 = t11 + t9;
+    t13 = (-C24) * t12;
+    t14 = (-C25) * t10;
+    t2 = t13 + t14;
+    t3 = 0.07802784084844781 * t2;
+    y[467] = t3;
+    t6 = 0.03626495541946783 * t2;
+    y[612] = t6;
+    t11 = C25 * t12;
+    t9 = (-C24) * t10;
+    t13 = t11 + t9;
+    t14 = 0.003492818601842453 * t13;
+    y[107] = t14;
+    t3 = (-0.06957630232542114) * t13;
+    y[252] = t3;
+    t2 = (-C26) * t5;
+    t6 = (-C27) * t7;
+    t12 = t2 + t6;
+    t10 = 0.07404769515489659 * t12;
+    y[377] = t10;
+    t11 = 0.0012899360456039698 * t12;
+    y[702] = t11;
+    t9 = C27 * t5;
+    t14 = (-C26) * t7;
+    t13 = t9 + t14;
+    y[17] = 0;
+    t3 = (-0.07502671817041937) * t13;
+    y[342] = t3;
+    t2 = C28 * t8;
+    t6 = C29 * t1;
+    t10 = t2 + t6;
+    y[72] = 0;
+    t12 = (-0.07417793301083843) * t10;
+    y[287] = t12;
+    t11 = (-C29) * t8;
+    t5 = C28 * t1;
+    t7 = t11 + t5;
+    t9 = 0.07489499006050511 * t7;
+    y[432] = t9;
+    t14 = 0.0173560823152087 * t7;
+    y[647] = t14;
+    t13 = C30 * t0;
+    t3 = C31 * t4;
+    t2 = t13 + t3;
+    t6 = 0.02797728396717007 * t2;
+    y[162] = t6;
+    t10 = (-0.04835784909338468) * t2;
+    y[197] = t10;
+    t12 = (-C31) * t0;
+    t8 = C30 * t4;
+    t1 = t12 + t8;
+    t11 = 0.07672217418086602 * t1;
+    y[522] = t11;
+    t5 = 0.06596195100876791 * t1;
+    y[557] = t5;
+    t9 = re[132];
+    t7 = im[132];
+    t14 = re[177];
+    t13 = im[177];
+    t3 = re[42];
+    t6 = im[42];
+    t2 = re[87];
+    t10 = im[87];
+    t0 = t9 + t3;
+    t4 = t7 + t6;
+    t12 = t14 + t2;
+    t8 = t13 + t10;
+    t11 = t9 - t3;
+    t1 = t7 - t6;
+    t5 = t14 - t2;
+    t9 = t13 - t10;
+    t3 = t0 + t12;
+    t7 = t4 + t8;
+    t6 = t11 + t9;
+    t14 = t1 - t5;
+    t2 = t0 - t12;
+    t13 = t4 - t8;
+    t10 = t11 - t9;
+    t0 = t1 + t5;
+    t12 = C32 * t3;
+    t4 = C33 * t7;
+    t8 = t12 + t4;
+    t11 = 0.02915345280549821 * t8;
+    y[164] = t11;
+    t9 = (-0.04726409103525733) * t8;
+    y[195] = t9;
+    t1 = (-C33) * t3;
+    t5 = C32 * t7;
+    t12 = t1 + t5;
+    t4 = 0.07633919069356716 * t12;
+    y[524] = t4;
+    t11 = 0.06680008402605578 * t12;
+    y[555] = t11;
+    t8 = (-C34) * t6;
+    t9 = (-C35) * t14;
+    t3 = t8 + t9;
+    t7 = 0.07785396622111439 * t3;
+    y[465] = t7;
+    t1 = 0.035093195103053254 * t3;
+    y[614] = t1;
+    t5 = C35 * t6;
+    t4 = (-C34) * t14;
+    t12 = t5 + t4;
+    t11 = 0.0030317233148571673 * t12;
+    y[105] = t11;
+    t8 = (-0.06999210139522677) * t12;
+    y[254] = t8;
+    t9 = (-C36) * t2;
+    t7 = (-C37) * t13;
+    t3 = t9 + t7;
+    t1 = 0.07409618871715787 * t3;
+    y[375] = t1;
+    t6 = 0.0010762203215031797 * t3;
+    y[704] = t6;
+    t14 = C37 * t2;
+    t5 = (-C36) * t13;
+    t4 = t14 + t5;
+    y[15] = 0;
+    t11 = (-0.07497761560668637) * t4;
+    y[344] = t11;
+    t12 = C38 * t10;
+    t8 = C39 * t0;
+    t9 = t12 + t8;
+    y[74] = 0;
+    t7 = (-0.07403454077246585) * t9;
+    y[285] = t7;
+    t1 = (-C39) * t10;
+    t3 = C38 * t0;
+    t6 = t1 + t3;
+    t2 = 0.07504004884192814 * t6;
+    y[434] = t2;
+    t13 = 0.018302264227918173 * t6;
+    y[645] = t13;
+    t14 = re[48];
+    t5 = im[48];
+    t4 = re[93];
+    t11 = im[93];
+    t12 = re[138];
+    t8 = im[138];
+    t9 = re[3];
+    t7 = im[3];
+    t10 = t14 + t12;
+    t0 = t5 + t8;
+    t1 = t4 + t9;
+    t3 = t11 + t7;
+    t2 = t14 - t12;
+    t6 = t5 - t8;
+    t13 = t4 - t9;
+    t14 = t11 - t7;
+    t12 = t10 + t1;
+    t5 = t0 + t3;
+    t8 = t2 + t14;
+    t4 = t6 - t13;
+    t9 = t10 - t1;
+    t11 = t0 - t3;
+    t7 = t2 - t14;
+    t10 = t6 + t13;
+    t1 = C40 * t12;
+    t0 = C41 * t5;
+    t3 = t1 + t0;
+    y[76] = 0;
+    t2 = (-0.0738820686854372) * t3;
+    y[283] = t2;
+    t14 = (-C41) * t12;
+    t6 = C40 * t5;
+    t13 = t14 + t6;
+    t1 = 0.07519491067865303 * t13;
+    y[436] = t1;
+    t0 = 0.019269402875175413 * t13;
+    y[643] = t0;
+    t3 = C42 * t8;
+    t2 = C43 * t4;
+    t12 = t3 + t2;
+    t5 = 0.030335539013196404 * t12;
+    y[166] = t5;
+    t14 = (-0.046155076669294415) * t12;
+    y[193] = t14;
+    t6 = (-C43) * t8;
+    t1 = C42 * t4;
+    t13 = t6 + t1;
+    t0 = 0.07592809470006731 * t13;
+    y[526] = t0;
+    t3 = 0.0676133864780924 * t13;
+    y[553] = t3;
+    t2 = (-C44) * t9;
+    t5 = (-C45) * t11;
+    t12 = t2 + t5;
+    t14 = 0.0776741671325514 * t12;
+    y[463] = t14;
+    t8 = 0.033926889543385 * t12;
+    y[616] = t8;
+    t4 = C45 * t9;
+    t6 = (-C44) * t11;
+    t1 = t4 + t6;
+    t0 = 0.0026062646773406016 * t1;
+    y[103] = t0;
+    t13 = (-0.07038547439326777) * t1;
+    y[256] = t13;
+    t3 = (-C46) * t7;
+    t2 = (-C47) * t10;
+    t5 = t3 + t2;
+    t14 = 0.07414729844179238 * t5;
+    y[373] = t14;
+    t12 = 0.000885182709137595 * t5;
+    y[706] = t12;
+    t8 = C47 * t7;
+    t9 = (-C46) * t10;
+    t11 = t8 + t9;
+    y[13] = 0;
+    t4 = (-0.07492593354452172) * t11;
+    y[346] = t4;
+    t6 = re[164];
+    t0 = im[164];
+    t1 = re[29];
+    t13 = im[29];
+    t3 = re[74];
+    t2 = im[74];
+    t14 = re[119];
+    t5 = im[119];
+    t12 = t6 + t3;
+    t7 = t0 + t2;
+    t10 = t1 + t14;
+    t8 = t13 + t5;
+    t9 = t6 - t3;
+    t11 = t0 - t2;
+    t4 = t1 - t14;
+    t6 = t13 - t5;
+    t3 = t12 + t10;
+    t0 = t7 + t8;
+    t2 = t9 + t6;
+    t1 = t11 - t4;
+    t14 = t12 - t10;
+    t13 = t7 - t8;
+    t5 = t9 - t6;
+    t12 = t11 + t4;
+    t10 = (-C48) * t3;
+    t7 = (-C49) * t0;
+    t8 = t10 + t7;
+    t9 = 0.0742006958638272 * t8;
+    y[371] = t9;
+    t6 = 0.0007162412227853556 * t8;
+    y[708] = t6;
+    t11 = C49 * t3;
+    t4 = (-C48) * t0;
+    t10 = t11 + t4;
+    y[11] = 0;
+    t7 = (-0.07487201421602685) * t10;
+    y[348] = t7;
+    t9 = C50 * t2;
+    t8 = C51 * t1;
+    t6 = t9 + t8;
+    y[78] = 0;
+    t3 = (-0.07372050726801713) * t6;
+    y[281] = t3;
+    t0 = (-C51) * t2;
+    t11 = C50 * t1;
+    t4 = t0 + t11;
+    t10 = 0.07535970330966202 * t4;
+    y[438] = t10;
+    t7 = 0.020256980411977373 * t4;
+    y[641] = t7;
+    t9 = C52 * t14;
+    t8 = C53 * t13;
+    t6 = t9 + t8;
+    t3 = 0.03152247059222997 * t6;
+    y[168] = t3;
+    t2 = (-0.045031547794885766) * t6;
+    y[191] = t2;
+    t1 = (-C53) * t14;
+    t0 = C52 * t13;
+    t11 = t1 + t0;
+    t10 = 0.07548893115038266 * t11;
+    y[528] = t10;
+    t4 = 0.06840111526676283 * t11;
+    y[551] = t4;
+    t7 = (-C54) * t5;
+    t9 = (-C55) * t12;
+    t8 = t7 + t9;
+    t3 = 0.07748989472063063 * t8;
+    y[461] = t3;
+    t6 = 0.0327669483767956 * t8;
+    y[618] = t6;
+    t2 = C55 * t5;
+    t14 = (-C54) * t12;
+    t13 = t2 + t14;
+    t1 = 0.0022163732028366626 * t13;
+    y[101] = t1;
+    t0 = (-0.07075673271981794) * t13;
+    y[258] = t0;
+    t10 = re[80];
+    t11 = im[80];
+    t4 = re[125];
+    t7 = im[125];
+    t9 = re[170];
+    t3 = im[170];
+    t8 = re[35];
+    t6 = im[35];
+    t5 = t10 + t9;
+    t12 = t11 + t3;
+    t2 = t4 + t8;
+    t14 = t7 + t6;
+    t1 = t10 - t9;
+    t13 = t11 - t3;
+    t0 = t4 - t8;
+    t10 = t7 - t6;
+    t9 = t5 + t2;
+    t11 = t12 + t14;
+    t3 = t1 + t10;
+    t4 = t13 - t0;
+    t8 = t5 - t2;
+    t7 = t12 - t14;
+    t6 = t1 - t10;
+    t5 = t13 + t0;
+    t2 = (-C56) * t9;
+    t12 = (-C57) * t11;
+    t14 = t2 + t12;
+    t1 = 0.07730191568708542 * t14;
+    y[459] = t1;
+    t10 = 0.03161467776349159 * t14;
+    y[620] = t10;
+    t13 = C57 * t9;
+    t0 = (-C56) * t11;
+    t2 = t13 + t0;
+    t12 = 0.0018618037564494532 * t2;
+    y[99] = t12;
+    t1 = (-0.07110684361286619) * t2;
+    y[260] = t1;
+    t14 = (-C58) * t3;
+    t10 = (-C59) * t4;
+    t9 = t14 + t10;
+    t11 = 0.07425606701298204 * t9;
+    y[369] = t11;
+    t13 = 0.0005686036444083812 * t9;
+    y[710] = t13;
+    t0 = C59 * t3;
+    t12 = (-C58) * t4;
+    t2 = t0 + t12;
+    y[9] = 0;
+    t1 = (-0.07481618376831468) * t2;
+    y[350] = t1;
+    t14 = C60 * t8;
+    t10 = C61 * t7;
+    t11 = t14 + t10;
+    y[80] = 0;
+    t9 = (-0.07355021895858266) * t11;
+    y[279] = t9;
+    t13 = (-C61) * t8;
+    t3 = C60 * t7;
+    t4 = t13 + t3;
+    t0 = 0.07553418105640151 * t4;
+    y[440] = t0;
+    t12 = 0.021263859082068726 * t4;
+    y[639] = t12;
+    t2 = C62 * t6;
+    t1 = C63 * t5;
+    t14 = t2 + t1;
+    t10 = 0.032712878842642595 * t14;
+    y[170] = t10;
+    t11 = (-0.04389508776629477) * t14;
+    y[189] = t11;
+    t9 = (-C63) * t6;
+    t8 = C62 * t5;
+    t7 = t9 + t8;
+    t13 = 0.07502108030330112 * t7;
+    y[530] = t13;
+    t3 = 0.06916232173276785 * t7;
+    y[549] = t3;
+    t0 = re[176];
+    t4 = im[176];
+    t12 = re[41];
+    t2 = im[41];
+    t1 = re[86];
+    t10 = im[86];
+    t14 = re[131];
+    t11 = im[131];
+    t6 = t0 + t1;
+    t5 = t4 + t10;
+    t9 = t12 + t14;
+    t8 = t2 + t11;
+    t13 = t0 - t1;
+    t7 = t4 - t10;
+    t3 = t12 - t14;
+    t0 = t2 - t11;
+    t1 = t6 + t9;
+    t4 = t5 + t8;
+    t10 = t13 + t0;
+    t12 = t7 - t3;
+    t14 = t6 - t9;
+    t2 = t5 - t8;
+    t11 = t13 - t0;
+    t6 = t7 + t3;
+    t9 = C64 * t1;
+    t5 = C65 * t4;
+    t8 = t9 + t5;
+    t13 = 0.033904596440883734 * t8;
+    y[172] = t13;
+    t0 = (-0.04274765608915604) * t8;
+    y[187] = t0;
+    t7 = (-C65) * t1;
+    t3 = C64 * t4;
+    t9 = t7 + t3;
+    t5 = 0.07452418927846975 * t9;
+    y[532] = t5;
+    t13 = 0.06989675119974971 * t9;
+    y[547] = t13;
+    t8 = (-C66) * t10;
+    t0 = (-C67) * t12;
+    t1 = t8 + t0;
+    t4 = 0.07711101011160705 * t1;
+    y[457] = t4;
+    t7 = 0.030471291315313755 * t1;
+    y[622] = t7;
+    t3 = C67 * t10;
+    t5 = (-C66) * t12;
+    t9 = t3 + t5;
+    t13 = 0.0015421103034191147 * t9;
+    y[97] = t13;
+    t8 = (-0.07143682147707409) * t9;
+    y[262] = t8;
+    t0 = (-C68) * t14;
+    t4 = (-C69) * t2;
+    t1 = t0 + t4;
+    t7 = 0.0743130633063656 * t1;
+    y[367] = t7;
+    t10 = 0.0004409171809484468 * t1;
+    y[712] = t10;
+    t12 = C69 * t14;
+    t3 = (-C68) * t2;
+    t5 = t12 + t3;
+    y[7] = 0;
+    t13 = (-0.07475880159390051) * t5;
+    y[352] = t13;
+    t9 = C70 * t11;
+    t8 = C71 * t6;
+    t0 = t9 + t8;
+    y[82] = 0;
+    t4 = (-0.0733709898052653) * t0;
+    y[277] = t4;
+    t7 = (-C71) * t11;
+    t1 = C70 * t6;
+    t10 = t7 + t1;
+    t14 = 0.07571869440906569 * t10;
+    y[442] = t14;
+    t2 = 0.022289008698053562 * t10;
+    y[637] = t2;
+    t12 = re[112];
+    t3 = im[112];
+    t5 = re[157];
+    t13 = im[157];
+    t9 = re[22];
+    t8 = im[22];
+    t0 = re[67];
+    t4 = im[67];
+    t11 = t12 + t9;
+    t6 = t3 + t8;
+    t7 = t5 + t0;
+    t1 = t13 + t4;
+    t14 = t12 - t9;
+    t10 = t3 - t8;
+    t2 = t5 - t0;
+    t12 = t13 - t4;
+    t9 = t11 + t7;
+    t3 = t6 + t1;
+    t8 = t14 + t12;
+    t5 = t10 - t2;
+    t0 = t11 - t7;
+    t13 = t6 - t1;
+    t4 = t14 - t12;
+    t11 = t10 + t2;
+    t7 = C72 * t9;
+    t6 = C73 * t3;
+    t1 = t7 + t6;
+    t14 = 0.00023509919043350854 * t1;
+    y[84] = t14;
+    t12 = (-0.07314539575615532) * t1;
+    y[275] = t12;
+    t10 = (-C73) * t9;
+    t2 = C72 * t3;
+    t7 = t10 + t2;
+    t6 = 0.07587723401076818 * t7;
+    y[444] = t6;
+    t14 = 0.023331619923463064 * t7;
+    y[635] = t14;
+    t1 = C74 * t8;
+    t12 = C75 * t5;
+    t9 = t1 + t12;
+    t3 = 0.03509657226994685 * t9;
+    y[174] = t3;
+    t10 = (-0.04158997495987726) * t9;
+    y[185] = t10;
+    t2 = (-C75) * t8;
+    t6 = C74 * t5;
+    t7 = t2 + t6;
+    t14 = 0.07399851067964641 * t7;
+    y[534] = t14;
+    t1 = 0.07060402737513881 * t7;
+    y[545] = t1;
+    t12 = (-C76) * t0;
+    t3 = (-C77) * t13;
+    t9 = t12 + t3;
+    t10 = 0.07691831583769149 * t9;
+    y[455] = t10;
+    t8 = 0.02933799848474425 * t9;
+    y[624] = t8;
+    t5 = C77 * t0;
+    t2 = (-C76) * t13;
+    t6 = t5 + t2;
+    t14 = 0.0012566211405111928 * t6;
+    y[95] = t14;
+    t7 = (-0.07174739522488442) * t6;
+    y[264] = t7;
+    t1 = (-C78) * t4;
+    t12 = (-C79) * t11;
+    t3 = t1 + t12;
+    t10 = 0.07437135293666741 * t3;
+    y[365] = t10;
+    t9 = 0.0003319606381975926 * t3;
+    y[714] = t9;
+    t8 = C79 * t4;
+    t0 = (-C78) * t11;
+    t13 = t8 + t0;
+    y[5] = 0;
+    t5 = (-0.07470020829507447) * t13;
+    y[354] = t5;
+    t2 = re[28];
+    t14 = im[28];
+    t6 = re[73];
+    t7 = im[73];
+    t1 = re[118];
+    t12 = im[118];
+    t10 = re[163];
+    t3 = im[163];
+    t9 = t2 + t1;
+    t4 = t14 + t12;
+    t11 = t6 + t10;
+    t8 = t7 + t3;
+    t0 = t2 - t1;
+    t13 = t14 - t12;
+    t5 = t6 - t10;
+    t2 = t7 - t3;
+    t1 = t9 + t11;
+    t14 = t4 + t8;
+    t12 = t0 + t2;
+    t6 = t13 - t5;
+    t10 = t9 - t11;
+    t7 = t4 - t8;
+    t3 = t0 - t2;
+    t9 = t13 + t5;
+    t11 = (-C80) * t1;
+    t4 = (-C81) * t14;
+    t8 = t11 + t4;
+    t0 = 0.07443059987513743 * t8;
+    y[363] = t0;
+    t2 = 0.00024046178754918768 * t8;
+    y[716] = t2;
+    t13 = C81 * t1;
+    t5 = (-C80) * t14;
+    t11 = t13 + t5;
+    y[3] = 0;
+    t4 = (-0.07464074674764669) * t11;
+    y[356] = t4;
+    t0 = C82 * t12;
+    t8 = C83 * t6;
+    t2 = t0 + t8;
+    t1 = 0.0003636133682961057 * t2;
+    y[86] = t1;
+    t14 = (-0.07292566451690818) * t2;
+    y[273] = t14;
+    t13 = (-C83) * t12;
+    t5 = C82 * t6;
+    t11 = t13 + t5;
+    t4 = 0.07605946082798594 * t11;
+    y[446] = t4;
+    t0 = 0.0243908300690247 * t11;
+    y[633] = t0;
+    t8 = C84 * t10;
+    t1 = C85 * t7;
+    t2 = t8 + t1;
+    t14 = 0.03628729419584379 * t2;
+    y[176] = t14;
+    t12 = (-0.04042290599658089) * t2;
+    y[183] = t12;
+    t6 = (-C85) * t10;
+    t13 = C84 * t7;
+    t5 = t6 + t13;
+    t4 = 0.07344473947163749 * t5;
+    y[536] = t4;
+    t11 = 0.07128406273528302 * t5;
+    y[543] = t11;
+    t0 = (-C86) * t3;
+    t8 = (-C87) * t9;
+    t1 = t0 + t8;
+    t14 = 0.07672513012950198 * t1;
+    y[453] = t14;
+    t2 = 0.028215773590490503 * t1;
+    y[626] = t2;
+    t12 = C87 * t3;
+    t10 = (-C86) * t9;
+    t7 = t12 + t10;
+    t6 = 0.001004420079138153 * t7;
+    y[93] = t6;
+    t13 = (-0.07203917486596162) * t7;
+    y[266] = t13;
+    t4 = re[124];
+    t5 = im[124];
+    t11 = re[169];
+    t0 = im[169];
+    t8 = re[34];
+    t14 = im[34];
+    t1 = re[79];
+    t2 = im[79];
+    t3 = t4 + t8;
+    t9 = t5 + t14;
+    t12 = t11 + t1;
+    t10 = t0 + t2;
+    t6 = t4 - t8;
+    t7 = t5 - t14;
+    t13 = t11 - t1;
+    t4 = t0 - t2;
+    t8 = t3 + t12;
+    t5 = t9 + t10;
+    t14 = t6 + t4;
+    t11 = t7 - t13;
+    t1 = t3 - t12;
+    t0 = t9 - t10;
+    t2 = t6 - t4;
+    t3 = t7 + t13;
+    t12 = (-C88) * t8;
+    t9 = (-C89) * t5;
+    t10 = t12 + t9;
+    t6 = 0.07653253220047196 * t10;
+    y[451] = t6;
+    t4 = 0.027105618559342022 * t10;
+    y[628] = t4;
+    t7 = C89 * t8;
+    t13 = (-C88) * t5;
+    t12 = t7 + t13;
+    t9 = 0.0007843288223699206 * t12;
+    y[91] = t9;
+    t6 = (-0.07231298479938665) * t12;
+    y[268] = t6;
+    t10 = (-C90) * t14;
+    t4 = (-C91) * t11;
+    t8 = t10 + t4;
+    t5 = 0.07449046842735706 * t8;
+    y[361] = t5;
+    t7 = 0.00016459314335602588 * t8;
+    y[718] = t7;
+    t13 = C91 * t14;
+    t9 = (-C90) * t11;
+    t12 = t13 + t9;
+    y[1] = 0;
+    t6 = (-0.07458075741560576) * t12;
+    y[358] = t6;
+    t10 = C92 * t1;
+    t4 = C93 * t0;
+    t5 = t10 + t4;
+    t8 = 0.0005109767988647399 * t5;
+    y[88] = t8;
+    t7 = (-0.07269232485002053) * t5;
+    y[271] = t7;
+    t14 = (-C93) * t1;
+    t11 = C92 * t0;
+    t13 = t14 + t11;
+    t9 = 0.07624660746123198 * t13;
+    y[448] = t9;
+    t12 = 0.025465730147811696 * t13;
+    y[631] = t12;
+    t6 = C94 * t2;
+    t10 = C95 * t3;
+    t4 = t6 + t10;
+    t8 = 0.037475094952612274 * t4;
+    y[178] = t8;
+    t5 = (-0.03924810154316684) * t4;
+    y[181] = t5;
+    t7 = (-C95) * t2;
+    t1 = C94 * t3;
+    t0 = t7 + t1;
+    t14 = 0.07286276255040021 * t0;
+    y[538] = t14;
+    t11 = 0.07193658763695611 * t0;
+    y[541] = t11;
+}
+
+//
+//  Public functions.
+//
+
+/**
+ *  Apply LD-IMDCT transform (prebuilt for window W75_360, input pruned).
+ * 
+ *  Note(s):
+ *    [1] y[n] = w[n] * SUM(X[k] * cos(PI / 360 * (n + 180.5) * (k + 0.5))), where
+ *        w[n] = sqrt(2 / 360) * W75_360[719 - n].
+ *    [2] X[k] shall be zero for all k >= 60 (not checked).
+ *    [3] The size of all arrays will not be checked.
+ * 
+ *  @param {Number[]} X 
+ *    - The input block (360 points, only the first 60 points are used).
+ *  @param {Number[]} y 
+ *    - The array that would contain the output block (720 points).
+ *  @param {Number[]} re 
+ *    - The scratch buffer (real part, 180 points).
+ *  @param {Number[]} im 
+ *    - The scratch buffer (imaginary part, 180 points).
+ */
+function ApplyWindowedIMDCT_W75_360_K60(X, y, re, im) {
+    ApplyWindowedIMDCT_W75_360_K60_Part1(X, y, re, im);
+    ApplyWindowedIMDCT_W75_360_K60_Part2(X, y, re, im);
+    ApplyWindowedIMDCT_W75_360_K60_Part3(X, y, re, im);
+    ApplyWindowedIMDCT_W75_360_K60_Part4(X, y, re, im);
+    ApplyWindowedIMDCT_W75_360_K60_Part5(X, y, re, im);
+    ApplyWindowedIMDCT_W75_360_K60_Part6(X, y, re, im);
+}
+
+//  Export public APIs.
+module.exports = {
+    "ApplyWindowedIMDCT_W75_360_K60": ApplyWindowedIMDCT_W75_360_K60
+};
\ No newline at end of file
@@ -0,0 +1,23135 @@
+//
+//  Copyright 2021 - 2023 XiaoJSoft Studio. All rights reserved.
+//  Use of this source code is governed by a BSD-style license that can be
+//  found in the LICENSE.md file.
+//
+
+//
+//  Note(s):
+//    [1] This file is generated automatically by a MDCT compiler, which locates 
+//        at "./../../dev/mdct-generator/" directory.
+//        Do NOT modify this file manually.
+//
+
+//
+//  Private functions.
+//
+
+/**
+ *  Part 1 of ApplyWindowedMDCT_W75_360().
+ * 
+ *  @param {Number[]} x 
+ *    - The input block (720 points).
+ *  @param {Number[]} X 
+ *    - The array that would contain the output block (360 points).
+ *  @param {Number[]} re 
+ *    - The scratch buffer (real part, 180 points).
+ *  @param {Number[]} im 
+ *    - The scratch buffer (imaginary part, 180 points).
+ */
+function ApplyWindowedMDCT_W75_360_Part1(x, X, re, im) {
+    let t0, t1, t10, t11, t12, t13, t14, t2, t3, t4, t5, t6, t7, t8, t9;
+    const C0 = 0.49999999999999994;
+    const C1 = 0.8660254037844387;
+    const C2 = 0.5;
+    const C3 = 0.8660254037844386;
+    const C4 = 0.984807753012208;
+    const C5 = 0.17364817766693033;
+    const C6 = 0.6427876096865393;
+    const C7 = 0.766044443118978;
+    const C8 = 0.3420201433256687;
+    const C9 = 0.9396926207859084;
+    const C10 = 1.4088320528055172;
+    const C11 = 0.12325683343243876;
+    const C12 = 1.1584559306791384;
+    const C13 = 0.8111595753452777;
+    const C14 = 0.5976724774602398;
+    const C15 = 1.281712764111577;
+    const C16 = 0.9510565162951535;
+    const C17 = 0.3090169943749474;
+    const C18 = 0.6691306063588582;
+    const C19 = 0.7431448254773942;
+    const C20 = 0.20791169081775931;
+    const C21 = 0.9781476007338057;
+    const C22 = 0.4694715627858908;
+    const C23 = 0.882947592858927;
+    const C24 = 0.5299192642332049;
+    const C25 = 0.848048096156426;
+    const C26 = 0.03489949670250097;
+    const C27 = 0.9993908270190958;
+    const C28 = 0.6156614753256583;
+    const C29 = 0.7880107536067219;
+    const C30 = 0.374606593415912;
+    const C31 = 0.9271838545667874;
+    const C32 = 0.9902680687415704;
+    const C33 = 0.13917310096006544;
+    const C34 = 0.5877852522924731;
+    const C35 = 0.8090169943749475;
+    const C36 = 0.40673664307580015;
+    const C37 = 0.9135454576426009;
+    const C38 = 0.9945218953682733;
+    const C39 = 0.10452846326765346;
+    const C40 = 0.6946583704589973;
+    const C41 = 0.7193398003386512;
+    const C42 = 0.24192189559966773;
+    const C43 = 0.9702957262759965;
+    const C44 = 0.9612616959383189;
+    const C45 = 0.27563735581699916;
+    const C46 = 0.5591929034707468;
+    const C47 = 0.8290375725550417;
+    const C48 = 0.0697564737441253;
+    const C49 = 0.9975640502598242;
+    const C50 = 0.4383711467890774;
+    const C51 = 0.898794046299167;
+    const C52 = 0.5590169943749475;
+    const C53 = 0.25;
+    t0 = x[539];
+    t0 = 0.03865835992204059 * t0;
+    t1 = x[540];
+    t1 = 0.038067478102163245 * t1;
+    t0 = t0 + t1;
+    t1 = x[179];
+    t1 = 0.07225232704692253 * t1;
+    t2 = x[180];
+    t2 = 0.07256106269182623 * t2;
+    t1 = t1 - t2;
+    t2 = -t0;
+    t3 = x[419];
+    t4 = x[59];
+    t4 = 0.011767594897081788 * t4;
+    t5 = x[300];
+    t5 = 0.07418097507515262 * t5;
+    t4 = t4 - t5;
+    t5 = (-0.06485830414567359) * t3;
+    t6 = C0 * t4;
+    t5 = t5 + t6;
+    t6 = 0.037445959357687256 * t3;
+    t3 = C1 * t4;
+    t4 = t6 + t3;
+    t6 = x[60];
+    t3 = 0.012160671482139212 * t6;
+    t6 = x[299];
+    t6 = 0.07422225027327382 * t6;
+    t3 = t3 - t6;
+    t6 = x[420];
+    t7 = C0 * t3;
+    t8 = (-0.0648222362638247) * t6;
+    t7 = t7 + t8;
+    t8 = (-C1) * t3;
+    t3 = (-0.0374251355563927) * t6;
+    t6 = t8 + t3;
+    t8 = t5 + t7;
+    t3 = t4 + t6;
+    t9 = C2 * t8;
+    t2 = t2 - t9;
+    t9 = C2 * t3;
+    t9 = t1 - t9;
+    t5 = t5 - t7;
+    t7 = C3 * t5;
+    t5 = t4 - t6;
+    t4 = C3 * t5;
+    t6 = t8 - t0;
+    t5 = t1 + t3;
+    t8 = t2 + t4;
+    t0 = t9 - t7;
+    t1 = t2 - t4;
+    t3 = t9 + t7;
+    re[0] = t6;
+    im[0] = t5;
+    re[60] = t8;
+    im[60] = t0;
+    re[120] = t1;
+    im[120] = t3;
+    t2 = x[499];
+    t4 = 0.059515884248910744 * t2;
+    t9 = x[580];
+    t7 = 0.015404851487337206 * t9;
+    t6 = t4 + t7;
+    t5 = x[139];
+    t8 = 0.0547386736643123 * t5;
+    t0 = x[220];
+    t1 = 0.07917742425593305 * t0;
+    t3 = t8 - t1;
+    t2 = (-C4) * t6;
+    t9 = C5 * t3;
+    t4 = t2 + t9;
+    t7 = C5 * t6;
+    t5 = C4 * t3;
+    t0 = t7 + t5;
+    t8 = x[379];
+    t1 = x[19];
+    t2 = 0.0015273734490899057 * t1;
+    t9 = x[340];
+    t6 = 0.07400212506510842 * t9;
+    t3 = t2 - t6;
+    t7 = (-0.05750919258099372) * t8;
+    t5 = C6 * t3;
+    t1 = t7 + t5;
+    t9 = 0.048255942284014995 * t8;
+    t2 = C7 * t3;
+    t6 = t9 + t2;
+    t7 = x[100];
+    t5 = 0.032189767200842816 * t7;
+    t8 = x[259];
+    t3 = 0.07739634901064964 * t8;
+    t9 = t5 - t3;
+    t2 = x[460];
+    t7 = 0.07093433826861917 * t2;
+    t8 = x[619];
+    t5 = 0.0020347072928291257 * t8;
+    t3 = t7 + t5;
+    t2 = C8 * t9;
+    t8 = (-C9) * t3;
+    t7 = t2 + t8;
+    t5 = (-C9) * t9;
+    t2 = (-C8) * t3;
+    t8 = t5 + t2;
+    t9 = t1 + t7;
+    t3 = t6 + t8;
+    t5 = C2 * t9;
+    t2 = t4 - t5;
+    t5 = C2 * t3;
+    t5 = t0 - t5;
+    t1 = t1 - t7;
+    t7 = C3 * t1;
+    t1 = t6 - t8;
+    t6 = C3 * t1;
+    t8 = t4 + t9;
+    t1 = t0 + t3;
+    t4 = t2 + t6;
+    t9 = t5 - t7;
+    t0 = t2 - t6;
+    t3 = t5 + t7;
+    t2 = t4 + t9;
+    t6 = C7 * t2;
+    t5 = t4 * (-C10);
+    t7 = t9 * C11;
+    t2 = t6 - t7;
+    t4 = t6 + t5;
+    t9 = t0 + t3;
+    t7 = C5 * t9;
+    t6 = t0 * (-C12);
+    t5 = t3 * (-C13);
+    t9 = t7 - t5;
+    t0 = t7 + t6;
+    re[20] = t8;
+    im[20] = t1;
+    re[80] = t2;
+    im[80] = t4;
+    re[140] = t9;
+    im[140] = t0;
+    t3 = x[459];
+    t5 = 0.07110684361286619 * t3;
+    t7 = x[620];
+    t6 = 0.0018618037564494532 * t7;
+    t8 = t5 + t6;
+    t1 = x[99];
+    t2 = 0.03161467776349159 * t1;
+    t4 = x[260];
+    t9 = 0.07730191568708542 * t4;
+    t0 = t2 - t9;
+    t3 = (-C9) * t8;
+    t7 = C8 * t0;
+    t5 = t3 + t7;
+    t6 = C8 * t8;
+    t1 = C9 * t0;
+    t4 = t6 + t1;
+    t2 = x[20];
+    t9 = 0.0016551485214856972 * t2;
+    t3 = x[339];
+    t7 = 0.07398056890126894 * t3;
+    t8 = t9 - t7;
+    t0 = x[380];
+    t6 = C6 * t8;
+    t1 = (-0.05752594938073132) * t0;
+    t2 = t6 + t1;
+    t3 = (-C7) * t8;
+    t9 = (-0.04827000290849453) * t0;
+    t7 = t3 + t9;
+    t6 = x[140];
+    t1 = 0.055278474546151535 * t6;
+    t8 = x[219];
+    t0 = 0.07913993568537958 * t8;
+    t3 = t1 - t0;
+    t9 = x[500];
+    t6 = 0.05909416479402423 * t9;
+    t8 = x[579];
+    t1 = 0.015898542092392835 * t8;
+    t0 = t6 + t1;
+    t9 = C5 * t3;
+    t8 = (-C4) * t0;
+    t6 = t9 + t8;
+    t1 = (-C4) * t3;
+    t9 = (-C5) * t0;
+    t8 = t1 + t9;
+    t3 = t2 + t6;
+    t0 = t7 + t8;
+    t1 = C2 * t3;
+    t9 = t5 - t1;
+    t1 = C2 * t0;
+    t1 = t4 - t1;
+    t2 = t2 - t6;
+    t6 = C3 * t2;
+    t2 = t7 - t8;
+    t7 = C3 * t2;
+    t8 = t5 + t3;
+    t2 = t4 + t0;
+    t5 = t9 + t7;
+    t3 = t1 - t6;
+    t4 = t9 - t7;
+    t0 = t1 + t6;
+    t9 = t5 + t3;
+    t7 = C5 * t9;
+    t1 = t5 * (-C12);
+    t6 = t3 * (-C13);
+    t9 = t7 - t6;
+    t5 = t7 + t1;
+    t3 = t4 + t0;
+    t6 = (-C9) * t3;
+    t7 = t4 * C14;
+    t1 = t0 * (-C15);
+    t3 = t6 - t1;
+    t4 = t6 + t7;
+    re[40] = t8;
+    im[40] = t2;
+    re[100] = t9;
+    im[100] = t5;
+    re[160] = t3;
+    im[160] = t4;
+    t0 = re[0];
+    t1 = im[0];
+    t6 = re[20];
+    t7 = im[20];
+    t8 = re[40];
+    t2 = im[40];
+    t9 = t6 + t8;
+    t5 = t7 + t2;
+    t3 = C2 * t9;
+    t4 = t0 - t3;
+    t3 = C2 * t5;
+    t3 = t1 - t3;
+    t6 = t6 - t8;
+    t8 = C3 * t6;
+    t6 = t7 - t2;
+    t7 = C3 * t6;
+    t2 = t0 + t9;
+    t6 = t1 + t5;
+    t0 = t4 + t7;
+    t9 = t3 - t8;
+    t1 = t4 - t7;
+    t5 = t3 + t8;
+    re[0] = t2;
+    im[0] = t6;
+    re[20] = t0;
+    im[20] = t9;
+    re[40] = t1;
+    im[40] = t5;
+    t4 = re[60];
+    t7 = im[60];
+    t3 = re[80];
+    t8 = im[80];
+    t2 = re[100];
+    t6 = im[100];
+    t0 = t3 + t2;
+    t9 = t8 + t6;
+    t1 = C2 * t0;
+    t5 = t4 - t1;
+    t1 = C2 * t9;
+    t1 = t7 - t1;
+    t3 = t3 - t2;
+    t2 = C3 * t3;
+    t3 = t8 - t6;
+    t8 = C3 * t3;
+    t6 = t4 + t0;
+    t3 = t7 + t9;
+    t4 = t5 + t8;
+    t0 = t1 - t2;
+    t7 = t5 - t8;
+    t9 = t1 + t2;
+    re[60] = t6;
+    im[60] = t3;
+    re[80] = t4;
+    im[80] = t0;
+    re[100] = t7;
+    im[100] = t9;
+    t5 = re[120];
+    t8 = im[120];
+    t1 = re[140];
+    t2 = im[140];
+    t6 = re[160];
+    t3 = im[160];
+    t4 = t1 + t6;
+    t0 = t2 + t3;
+    t7 = C2 * t4;
+    t9 = t5 - t7;
+    t7 = C2 * t0;
+    t7 = t8 - t7;
+    t1 = t1 - t6;
+    t6 = C3 * t1;
+    t1 = t2 - t3;
+    t2 = C3 * t1;
+    t3 = t5 + t4;
+    t1 = t8 + t0;
+    t5 = t9 + t2;
+    t4 = t7 - t6;
+    t8 = t9 - t2;
+    t0 = t7 + t6;
+    re[120] = t3;
+    im[120] = t1;
+    re[140] = t5;
+    im[140] = t4;
+    re[160] = t8;
+    im[160] = t0;
+    t9 = x[467];
+    t2 = 0.06957630232542114 * t9;
+    t7 = x[612];
+    t6 = 0.003492818601842453 * t7;
+    t3 = t2 + t6;
+    t1 = x[107];
+    t5 = 0.03626495541946783 * t1;
+    t4 = x[252];
+    t8 = 0.07802784084844781 * t4;
+    t0 = t5 - t8;
+    t9 = (-C16) * t3;
+    t7 = C17 * t0;
+    t2 = t9 + t7;
+    t6 = C17 * t3;
+    t1 = C16 * t0;
+    t4 = t6 + t1;
+    t5 = x[12];
+    t8 = 0.0007979837397111069 * t5;
+    t9 = x[347];
+    t7 = 0.07417375583368668 * t9;
+    t3 = t8 - t7;
+    t0 = x[372];
+    t6 = C18 * t3;
+    t1 = (-0.05566095874962108) * t0;
+    t5 = t6 + t1;
+    t9 = (-C19) * t3;
+    t8 = (-0.05011735236765406) * t0;
+    t7 = t9 + t8;
+    t6 = x[132];
+    t1 = 0.05086314591152052 * t6;
+    t3 = x[227];
+    t0 = 0.0792877978708678 * t3;
+    t9 = t1 - t0;
+    t8 = x[492];
+    t6 = 0.0622870096006031 * t8;
+    t3 = x[587];
+    t1 = 0.012129720199284709 * t3;
+    t0 = t6 + t1;
+    t8 = C20 * t9;
+    t3 = (-C21) * t0;
+    t6 = t8 + t3;
+    t1 = (-C21) * t9;
+    t8 = (-C20) * t0;
+    t3 = t1 + t8;
+    t9 = t5 + t6;
+    t0 = t7 + t3;
+    t1 = C2 * t9;
+    t8 = t2 - t1;
+    t1 = C2 * t0;
+    t1 = t4 - t1;
+    t5 = t5 - t6;
+    t6 = C3 * t5;
+    t5 = t7 - t3;
+    t7 = C3 * t5;
+    t3 = t2 + t9;
+    t5 = t4 + t0;
+    t2 = t8 + t7;
+    t9 = t1 - t6;
+    t4 = t8 - t7;
+    t0 = t1 + t6;
+    re[36] = t3;
+    im[36] = t5;
+    re[96] = t2;
+    im[96] = t9;
+    re[156] = t4;
+    im[156] = t0;
+    t8 = x[427];
+    t7 = x[67];
+    t1 = 0.015086781910979527 * t7;
+    t6 = x[292];
+    t3 = 0.07457395540421297 * t6;
+    t5 = t1 - t3;
+    t2 = (-0.0657771788848242) * t8;
+    t9 = C22 * t5;
+    t4 = t2 + t9;
+    t0 = 0.0349743464011453 * t8;
+    t7 = C23 * t5;
+    t6 = t0 + t7;
+    t1 = x[52];
+    t3 = 0.00919912980539764 * t1;
+    t2 = x[307];
+    t9 = 0.07395175869342371 * t2;
+    t8 = t3 - t9;
+    t5 = x[412];
+    t0 = C24 * t8;
+    t7 = (-0.0637088068657265) * t5;
+    t1 = t0 + t7;
+    t2 = (-C25) * t8;
+    t3 = (-0.03980968085710303) * t5;
+    t9 = t2 + t3;
+    t0 = x[172];
+    t7 = 0.06989675119974971 * t0;
+    t8 = x[187];
+    t5 = 0.07452418927846975 * t8;
+    t2 = t7 - t5;
+    t3 = x[532];
+    t0 = 0.04274765608915604 * t3;
+    t8 = x[547];
+    t7 = 0.033904596440883734 * t8;
+    t5 = t0 + t7;
+    t3 = C26 * t2;
+    t8 = (-C27) * t5;
+    t0 = t3 + t8;
+    t7 = (-C27) * t2;
+    t3 = (-C26) * t5;
+    t8 = t7 + t3;
+    t2 = t1 + t0;
+    t5 = t9 + t8;
+    t7 = C2 * t2;
+    t3 = t4 - t7;
+    t7 = C2 * t5;
+    t7 = t6 - t7;
+    t1 = t1 - t0;
+    t0 = C3 * t1;
+    t1 = t9 - t8;
+    t9 = C3 * t1;
+    t8 = t4 + t2;
+    t1 = t6 + t5;
+    t4 = t3 + t9;
+    t2 = t7 - t0;
+    t6 = t3 - t9;
+    t5 = t7 + t0;
+    t3 = t4 + t2;
+    t9 = C7 * t3;
+    t7 = t4 * (-C10);
+    t0 = t2 * C11;
+    t3 = t9 - t0;
+    t4 = t9 + t7;
+    t2 = t6 + t5;
+    t0 = C5 * t2;
+    t9 = t6 * (-C12);
+    t7 = t5 * (-C13);
+    t2 = t0 - t7;
+    t6 = t0 + t9;
+    re[56] = t8;
+    im[56] = t1;
+    re[116] = t3;
+    im[116] = t4;
+    re[176] = t2;
+    im[176] = t6;
+    t5 = x[387];
+    t7 = x[27];
+    t0 = 0.002725625043690865 * t7;
+    t9 = x[332];
+    t8 = 0.0738556887375873 * t9;
+    t1 = t0 - t8;
+    t3 = (-0.059275562855990775) * t5;
+    t4 = C28 * t1;
+    t2 = t3 + t4;
+    t6 = 0.04631114526248106 * t5;
+    t7 = C29 * t1;
+    t9 = t6 + t7;
+    t0 = x[92];
+    t8 = 0.027659053756716335 * t0;
+    t3 = x[267];
+    t4 = 0.07662874054739717 * t3;
+    t5 = t8 - t4;
+    t1 = x[452];
+    t6 = 0.07217823591153531 * t1;
+    t7 = x[627];
+    t0 = 0.0008904224612424559 * t7;
+    t3 = t6 + t0;
+    t8 = C30 * t5;
+    t4 = (-C31) * t3;
+    t1 = t8 + t4;
+    t7 = (-C31) * t5;
+    t6 = (-C30) * t3;
+    t0 = t7 + t6;
+    t8 = x[507];
+    t4 = 0.05596890902062735 * t8;
+    t5 = x[572];
+    t3 = 0.019514347494519975 * t5;
+    t7 = t4 + t3;
+    t6 = x[147];
+    t8 = 0.058941354834138 * t6;
+    t5 = x[212];
+    t4 = 0.07871072623375217 * t5;
+    t3 = t8 - t4;
+    t6 = (-C32) * t7;
+    t5 = C33 * t3;
+    t8 = t6 + t5;
+    t4 = C33 * t7;
+    t6 = C32 * t3;
+    t5 = t4 + t6;
+    t7 = t1 + t8;
+    t3 = t0 + t5;
+    t4 = C2 * t7;
+    t6 = t2 - t4;
+    t4 = C2 * t3;
+    t4 = t9 - t4;
+    t1 = t1 - t8;
+    t8 = C3 * t1;
+    t1 = t0 - t5;
+    t0 = C3 * t1;
+    t5 = t2 + t7;
+    t1 = t9 + t3;
+    t2 = t6 + t0;
+    t7 = t4 - t8;
+    t9 = t6 - t0;
+    t3 = t4 + t8;
+    t6 = t2 + t7;
+    t0 = C5 * t6;
+    t4 = t2 * (-C12);
+    t8 = t7 * (-C13);
+    t6 = t0 - t8;
+    t2 = t0 + t4;
+    t7 = t9 + t3;
+    t8 = (-C9) * t7;
+    t0 = t9 * C14;
+    t4 = t3 * (-C15);
+    t7 = t8 - t4;
+    t9 = t8 + t0;
+    re[76] = t5;
+    im[76] = t1;
+    re[136] = t6;
+    im[136] = t2;
+    re[16] = t7;
+    im[16] = t9;
+    t3 = re[36];
+    t4 = im[36];
+    t8 = re[56];
+    t0 = im[56];
+    t5 = re[76];
+    t1 = im[76];
+    t6 = t8 + t5;
+    t2 = t0 + t1;
+    t7 = C2 * t6;
+    t9 = t3 - t7;
+    t7 = C2 * t2;
+    t7 = t4 - t7;
+    t8 = t8 - t5;
+    t5 = C3 * t8;
+    t8 = t0 - t1;
+    t0 = C3 * t8;
+    t1 = t3 + t6;
+    t8 = t4 + t2;
+    t3 = t9 + t0;
+    t6 = t7 - t5;
+    t4 = t9 - t0;
+    t2 = t7 + t5;
+    re[36] = t1;
+    im[36] = t8;
+    re[56] = t3;
+    im[56] = t6;
+    re[76] = t4;
+    im[76] = t2;
+    t9 = re[96];
+    t0 = im[96];
+    t7 = re[116];
+    t5 = im[116];
+    t1 = re[136];
+    t8 = im[136];
+    t3 = t7 + t1;
+    t6 = t5 + t8;
+    t4 = C2 * t3;
+    t2 = t9 - t4;
+    t4 = C2 * t6;
+    t4 = t0 - t4;
+    t7 = t7 - t1;
+    t1 = C3 * t7;
+    t7 = t5 - t8;
+    t5 = C3 * t7;
+    t8 = t9 + t3;
+    t7 = t0 + t6;
+    t9 = t2 + t5;
+    t3 = t4 - t1;
+    t0 = t2 - t5;
+    t6 = t4 + t1;
+    re[96] = t8;
+    im[96] = t7;
+    re[116] = t9;
+    im[116] = t3;
+    re[136] = t0;
+    im[136] = t6;
+    t2 = re[156];
+    t5 = im[156];
+    t4 = re[176];
+    t1 = im[176];
+    t8 = re[16];
+    t7 = im[16];
+    t9 = t4 + t8;
+    t3 = t1 + t7;
+    t0 = C2 * t9;
+    t6 = t2 - t0;
+    t0 = C2 * t3;
+    t0 = t5 - t0;
+    t4 = t4 - t8;
+    t8 = C3 * t4;
+    t4 = t1 - t7;
+    t1 = C3 * t4;
+    t7 = t2 + t9;
+    t4 = t5 + t3;
+    t2 = t6 + t1;
+    t9 = t0 - t8;
+    t5 = t6 - t1;
+    t3 = t0 + t8;
+    re[156] = t7;
+    im[156] = t4;
+    re[176] = t2;
+    im[176] = t9;
+    re[16] = t5;
+    im[16] = t3;
+    t6 = x[395];
+    t1 = x[35];
+    t0 = 0.004338010208852921 * t1;
+    t8 = x[324];
+    t7 = 0.07378162974538252 * t8;
+    t4 = t0 - t7;
+    t2 = (-0.06091677390631075) * t6;
+    t9 = C34 * t4;
+    t5 = t2 + t9;
+    t3 = 0.044258626911822016 * t6;
+    t1 = C35 * t4;
+    t8 = t3 + t1;
+    t0 = x[84];
+    t7 = 0.023331619923463064 * t0;
+    t2 = x[275];
+    t9 = 0.07587723401076818 * t2;
+    t6 = t7 - t9;
+    t4 = x[444];
+    t3 = 0.07314539575615532 * t4;
+    t1 = x[635];
+    t0 = 0.00023509919043350854 * t1;
+    t2 = t3 + t0;
+    t7 = C36 * t6;
+    t9 = (-C37) * t2;
+    t4 = t7 + t9;
+    t1 = (-C37) * t6;
+    t3 = (-C36) * t2;
+    t0 = t1 + t3;
+    t7 = x[515];
+    t9 = 0.05205064136257923 * t7;
+    t6 = x[564];
+    t2 = 0.02393267321582922 * t6;
+    t1 = t9 + t2;
+    t3 = x[155];
+    t7 = 0.06284016604564573 * t3;
+    t6 = x[204];
+    t9 = 0.07784000908910041 * t6;
+    t2 = t7 - t9;
+    t3 = (-C38) * t1;
+    t6 = C39 * t2;
+    t7 = t3 + t6;
+    t9 = C39 * t1;
+    t3 = C38 * t2;
+    t6 = t9 + t3;
+    t1 = t4 + t7;
+    t2 = t0 + t6;
+    t9 = C2 * t1;
+    t3 = t5 - t9;
+    t9 = C2 * t2;
+    t9 = t8 - t9;
+    t4 = t4 - t7;
+    t7 = C3 * t4;
+    t4 = t0 - t6;
+    t0 = C3 * t4;
+    t6 = t5 + t1;
+    t4 = t8 + t2;
+    t5 = t3 + t0;
+    t1 = t9 - t7;
+    t8 = t3 - t0;
+    t2 = t9 + t7;
+    re[72] = t6;
+    im[72] = t4;
+    re[132] = t5;
+    im[132] = t1;
+    re[12] = t8;
+    im[12] = t2;
+    t3 = x[4];
+    t0 = 0.0002839913808099415 * t3;
+    t9 = x[355];
+    t7 = 0.0744009037835185 * t9;
+    t6 = t0 - t7;
+    t4 = x[364];
+    t5 = C40 * t6;
+    t1 = (-0.05371349030559622) * t4;
+    t8 = t5 + t1;
+    t2 = (-C41) * t6;
+    t3 = (-0.051870514643822856) * t4;
+    t9 = t2 + t3;
+    t0 = x[124];
+    t7 = 0.0462694820152932 * t0;
+    t5 = x[235];
+    t1 = 0.07912400767771946 * t5;
+    t6 = t7 - t1;
+    t4 = x[484];
+    t2 = 0.06505898861211178 * t4;
+    t3 = x[595];
+    t0 = 0.00881418212054679 * t3;
+    t5 = t2 + t0;
+    t7 = C42 * t6;
+    t1 = (-C43) * t5;
+    t4 = t7 + t1;
+    t3 = (-C43) * t6;
+    t2 = (-C42) * t5;
+    t0 = t3 + t2;
+    t7 = x[475];
+    t1 = 0.06767657432229467 * t7;
+    t6 = x[604];
+    t5 = 0.0056902696629836606 * t6;
+    t3 = t1 + t5;
+    t2 = x[115];
+    t7 = 0.040982004156227624 * t2;
+    t6 = x[244];
+    t1 = 0.0786440057564167 * t6;
+    t5 = t7 - t1;
+    t2 = (-C44) * t3;
+    t6 = C45 * t5;
+    t7 = t2 + t6;
+    t1 = C45 * t3;
+    t2 = C44 * t5;
+    t6 = t1 + t2;
+    t3 = t4 + t7;
+    t5 = t0 + t6;
+    t1 = C2 * t3;
+    t2 = t8 - t1;
+    t1 = C2 * t5;
+    t1 = t9 - t1;
+    t4 = t4 - t7;
+    t7 = C3 * t4;
+    t4 = t0 - t6;
+    t0 = C3 * t4;
+    t6 = t8 + t3;
+    t4 = t9 + t5;
+    t8 = t2 + t0;
+    t3 = t1 - t7;
+    t9 = t2 - t0;
+    t5 = t1 + t7;
+    t2 = t8 + t3;
+    t0 = C7 * t2;
+    t1 = t8 * (-C10);
+    t7 = t3 * C11;
+    t2 = t0 - t7;
+    t8 = t0 + t1;
+    t3 = t9 + t5;
+    t7 = C5 * t3;
+    t0 = t9 * (-C12);
+    t1 = t5 * (-C13);
+    t3 = t7 - t1;
+    t9 = t7 + t0;
+    re[92] = t6;
+    im[92] = t4;
+    re[152] = t2;
+    im[152] = t8;
+    re[32] = t3;
+    im[32] = t9;
+    t5 = x[44];
+    t1 = 0.006666148096164151 * t5;
+    t7 = x[315];
+    t0 = 0.07380904609336382 * t7;
+    t6 = t1 - t0;
+    t4 = x[404];
+    t2 = C46 * t6;
+    t8 = (-0.06240108138162974) * t4;
+    t3 = t2 + t8;
+    t9 = (-C47) * t6;
+    t5 = (-0.042090060852086636) * t4;
+    t7 = t9 + t5;
+    t1 = x[164];
+    t0 = 0.06680008402605578 * t1;
+    t2 = x[195];
+    t8 = 0.07633919069356716 * t2;
+    t6 = t0 - t8;
+    t4 = x[524];
+    t9 = 0.04726409103525733 * t4;
+    t5 = x[555];
+    t1 = 0.02915345280549821 * t5;
+    t2 = t9 + t1;
+    t0 = C48 * t6;
+    t8 = (-C49) * t2;
+    t4 = t0 + t8;
+    t5 = (-C49) * t6;
+    t9 = (-C48) * t2;
+    t1 = t5 + t9;
+    t0 = x[435];
+    t8 = x[75];
+    t6 = 0.018783265486367183 * t8;
+    t2 = x[284];
+    t5 = 0.07511619859431522 * t2;
+    t9 = t6 - t5;
+    t8 = (-0.06647434708704078) * t0;
+    t2 = C50 * t9;
+    t6 = t8 + t2;
+    t5 = 0.03242170537798793 * t0;
+    t8 = C51 * t9;
+    t2 = t5 + t8;
+    t0 = t4 + t6;
+    t9 = t1 + t2;
+    t5 = C2 * t0;
+    t8 = t3 - t5;
+    t5 = C2 * t9;
+    t5 = t7 - t5;
+    t4 = t4 - t6;
+    t6 = C3 * t4;
+    t4 = t1 - t2;
+    t1 = C3 * t4;
+    t2 = t3 + t0;
+    t4 = t7 + t9;
+    t3 = t8 + t1;
+    t0 = t5 - t6;
+    t7 = t8 - t1;
+    t9 = t5 + t6;
+    t8 = t3 + t0;
+    t1 = C5 * t8;
+    t5 = t3 * (-C12);
+    t6 = t0 * (-C13);
+    t8 = t1 - t6;
+    t3 = t1 + t5;
+    t0 = t7 + t9;
+    t6 = (-C9) * t0;
+    t1 = t7 * C14;
+    t5 = t9 * (-C15);
+    t0 = t6 - t5;
+    t7 = t6 + t1;
+    re[112] = t2;
+    im[112] = t4;
+    re[172] = t8;
+    im[172] = t3;
+    re[52] = t0;
+    im[52] = t7;
+    t9 = re[72];
+    t5 = im[72];
+    t6 = re[92];
+    t1 = im[92];
+    t2 = re[112];
+    t4 = im[112];
+    t8 = t6 + t2;
+    t3 = t1 + t4;
+    t0 = C2 * t8;
+    t7 = t9 - t0;
+    t0 = C2 * t3;
+    t0 = t5 - t0;
+    t6 = t6 - t2;
+    t2 = C3 * t6;
+    t6 = t1 - t4;
+    t1 = C3 * t6;
+    t4 = t9 + t8;
+    t6 = t5 + t3;
+    t9 = t7 + t1;
+    t8 = t0 - t2;
+    t5 = t7 - t1;
+    t3 = t0 + t2;
+    re[72] = t4;
+    im[72] = t6;
+    re[92] = t9;
+    im[92] = t8;
+    re[112] = t5;
+    im[112] = t3;
+    t7 = re[132];
+    t1 = im[132];
+    t0 = re[152];
+    t2 = im[152];
+    t4 = re[172];
+    t6 = im[172];
+    t9 = t0 + t4;
+    t8 = t2 + t6;
+    t5 = C2 * t9;
+    t3 = t7 - t5;
+    t5 = C2 * t8;
+    t5 = t1 - t5;
+    t0 = t0 - t4;
+    t4 = C3 * t0;
+    t0 = t2 - t6;
+    t2 = C3 * t0;
+    t6 = t7 + t9;
+    t0 = t1 + t8;
+    t7 = t3 + t2;
+    t9 = t5 - t4;
+    t1 = t3 - t2;
+    t8 = t5 + t4;
+    re[132] = t6;
+    im[132] = t0;
+    re[152] = t7;
+    im[152] = t9;
+    re[172] = t1;
+    im[172] = t8;
+    t3 = re[12];
+    t2 = im[12];
+    t5 = re[32];
+    t4 = im[32];
+    t6 = re[52];
+    t0 = im[52];
+    t7 = t5 + t6;
+    t9 = t4 + t0;
+    t1 = C2 * t7;
+    t8 = t3 - t1;
+    t1 = C2 * t9;
+    t1 = t2 - t1;
+    t5 = t5 - t6;
+    t6 = C3 * t5;
+    t5 = t4 - t0;
+    t4 = C3 * t5;
+    t0 = t3 + t7;
+    t5 = t2 + t9;
+    t3 = t8 + t4;
+    t7 = t1 - t6;
+    t2 = t8 - t4;
+    t9 = t1 + t6;
+    re[12] = t0;
+    im[12] = t5;
+    re[32] = t3;
+    im[32] = t7;
+    re[52] = t2;
+    im[52] = t9;
+    t8 = x[36];
+    t4 = 0.004569478291400881 * t8;
+    t1 = x[323];
+    t6 = 0.07377846645642751 * t1;
+    t0 = t4 - t6;
+    t5 = x[396];
+    t3 = C34 * t0;
+    t7 = (-0.060919385743711627) * t5;
+    t2 = t3 + t7;
+    t9 = (-C35) * t0;
+    t8 = (-0.04426052452276998) * t5;
+    t1 = t9 + t8;
+    t4 = x[156];
+    t6 = 0.06330352026326927 * t4;
+    t3 = x[203];
+    t7 = 0.07770100053496265 * t3;
+    t0 = t6 - t7;
+    t5 = x[516];
+    t9 = 0.051537200432593716 * t5;
+    t8 = x[563];
+    t4 = 0.024502010484116685 * t8;
+    t3 = t9 + t4;
+    t6 = C39 * t0;
+    t7 = (-C38) * t3;
+    t5 = t6 + t7;
+    t8 = (-C38) * t0;
+    t9 = (-C39) * t3;
+    t4 = t8 + t9;
+    t6 = x[443];
+    t7 = x[83];
+    t0 = 0.022808210591671367 * t7;
+    t3 = x[276];
+    t8 = 0.07581464632180492 * t3;
+    t9 = t0 - t8;
+    t7 = (-0.06694290336614299) * t6;
+    t3 = C36 * t9;
+    t0 = t7 + t3;
+    t8 = 0.02980490085644422 * t6;
+    t7 = C37 * t9;
+    t3 = t8 + t7;
+    t6 = t5 + t0;
+    t9 = t4 + t3;
+    t8 = C2 * t6;
+    t7 = t2 - t8;
+    t8 = C2 * t9;
+    t8 = t1 - t8;
+    t5 = t5 - t0;
+    t0 = C3 * t5;
+    t5 = t4 - t3;
+    t4 = C3 * t5;
+    t3 = t2 + t6;
+    t5 = t1 + t9;
+    t2 = t7 + t4;
+    t6 = t8 - t0;
+    t1 = t7 - t4;
+    t9 = t8 + t0;
+    re[108] = t3;
+    im[108] = t5;
+    re[168] = t2;
+    im[168] = t6;
+    re[48] = t1;
+    im[48] = t9;
+    t7 = x[76];
+    t4 = 0.019269402875175413 * t7;
+    t8 = x[283];
+    t0 = 0.07519491067865303 * t8;
+    t3 = t4 - t0;
+    t5 = x[436];
+    t2 = C50 * t3;
+    t6 = (-0.06640476346273709) * t5;
+    t1 = t2 + t6;
+    t9 = (-C51) * t3;
+    t7 = (-0.03238776717678449) * t5;
+    t8 = t9 + t7;
+    t4 = x[523];
+    t0 = 0.047812884649648266 * t4;
+    t2 = x[556];
+    t6 = 0.028564578122477702 * t2;
+    t3 = t0 + t6;
+    t5 = x[163];
+    t9 = 0.06638406702686302 * t5;
+    t7 = x[196];
+    t4 = 0.07653423786690212 * t7;
+    t2 = t9 - t4;
+    t0 = (-C49) * t3;
+    t6 = C48 * t2;
+    t5 = t0 + t6;
+    t7 = C48 * t3;
+    t9 = C49 * t2;
+    t4 = t7 + t9;
+    t0 = x[403];
+    t6 = x[43];
+    t3 = 0.006380248502440559 * t6;
+    t2 = x[316];
+    t7 = 0.07379941994529313 * t2;
+    t9 = t3 - t7;
+    t6 = (-0.06240922076876308) * t0;
+    t2 = C46 * t9;
+    t3 = t6 + t2;
+    t7 = 0.042095550938029955 * t0;
+    t6 = C47 * t9;
+    t2 = t7 + t6;
+    t0 = t5 + t3;
+    t9 = t4 + t2;
+    t7 = C2 * t0;
+    t6 = t1 - t7;
+    t7 = C2 * t9;
+    t7 = t8 - t7;
+    t5 = t5 - t3;
+    t3 = C3 * t5;
+    t5 = t4 - t2;
+    t4 = C3 * t5;
+    t2 = t1 + t0;
+    t5 = t8 + t9;
+    t1 = t6 + t4;
+    t0 = t7 - t3;
+    t8 = t6 - t4;
+    t9 = t7 + t3;
+    t6 = t1 + t0;
+    t4 = C7 * t6;
+    t7 = t1 * (-C10);
+    t3 = t0 * C11;
+    t6 = t4 - t3;
+    t1 = t4 + t7;
+    t0 = t8 + t9;
+    t3 = C5 * t0;
+    t4 = t8 * (-C12);
+    t7 = t9 * (-C13);
+    t0 = t3 - t7;
+    t8 = t3 + t4;
+    re[128] = t2;
+    im[128] = t5;
+    re[8] = t6;
+    im[8] = t1;
+    re[68] = t0;
+    im[68] = t8;
+    t9 = x[116];
+    t7 = 0.041572322439829716 * t9;
+    t3 = x[243];
+    t4 = 0.0787101603489525 * t3;
+    t2 = t7 - t4;
+    t5 = x[476];
+    t6 = 0.06741130369498281 * t5;
+    t1 = x[603];
+    t0 = 0.006004019447140323 * t1;
+    t8 = t6 + t0;
+    t9 = C45 * t2;
+    t3 = (-C44) * t8;
+    t7 = t9 + t3;
+    t4 = (-C44) * t2;
+    t5 = (-C45) * t8;
+    t1 = t4 + t5;
+    t6 = x[483];
+    t0 = 0.06537589246986183 * t6;
+    t9 = x[596];
+    t3 = 0.008434424318712016 * t9;
+    t2 = t0 + t3;
+    t8 = x[123];
+    t4 = 0.045686310111039866 * t8;
+    t5 = x[236];
+    t6 = 0.07908447036354024 * t5;
+    t9 = t4 - t6;
+    t0 = (-C43) * t2;
+    t3 = C42 * t9;
+    t8 = t0 + t3;
+    t5 = C42 * t2;
+    t4 = C43 * t9;
+    t6 = t5 + t4;
+    t0 = x[363];
+    t3 = x[3];
+    t2 = 0.00024046178754918768 * t3;
+    t9 = x[356];
+    t5 = 0.07443059987513743 * t9;
+    t4 = t2 - t5;
+    t3 = (-0.053692059862579994) * t0;
+    t9 = C40 * t4;
+    t2 = t3 + t9;
+    t5 = 0.05184981950556295 * t0;
+    t3 = C41 * t4;
+    t9 = t5 + t3;
+    t0 = t8 + t2;
+    t4 = t6 + t9;
+    t5 = C2 * t0;
+    t3 = t7 - t5;
+    t5 = C2 * t4;
+    t5 = t1 - t5;
+    t8 = t8 - t2;
+    t2 = C3 * t8;
+    t8 = t6 - t9;
+    t6 = C3 * t8;
+    t9 = t7 + t0;
+    t8 = t1 + t4;
+    t7 = t3 + t6;
+    t0 = t5 - t2;
+    t1 = t3 - t6;
+    t4 = t5 + t2;
+    t3 = t7 + t0;
+    t6 = C5 * t3;
+    t5 = t7 * (-C12);
+    t2 = t0 * (-C13);
+    t3 = t6 - t2;
+    t7 = t6 + t5;
+    t0 = t1 + t4;
+    t2 = (-C9) * t0;
+    t6 = t1 * C14;
+    t5 = t4 * (-C15);
+    t0 = t2 - t5;
+    t1 = t2 + t6;
+    re[148] = t9;
+    im[148] = t8;
+    re[28] = t3;
+    im[28] = t7;
+    re[88] = t0;
+    im[88] = t1;
+    t4 = re[108];
+    t5 = im[108];
+    t2 = re[128];
+    t6 = im[128];
+    t9 = re[148];
+    t8 = im[148];
+    t3 = t2 + t9;
+    t7 = t6 + t8;
+    t0 = C2 * t3;
+    t1 = t4 - t0;
+    t0 = C2 * t7;
+    t0 = t5 - t0;
+    t2 = t2 - t9;
+    t9 = C3 * t2;
+    t2 = t6 - t8;
+    t6 = C3 * t2;
+    t8 = t4 + t3;
+    t2 = t5 + t7;
+    t4 = t1 + t6;
+    t3 = t0 - t9;
+    t5 = t1 - t6;
+    t7 = t0 + t9;
+    re[108] = t8;
+    im[108] = t2;
+    re[128] = t4;
+    im[128] = t3;
+    re[148] = t5;
+    im[148] = t7;
+    t1 = re[168];
+    t6 = im[168];
+    t0 = re[8];
+    t9 = im[8];
+    t8 = re[28];
+    t2 = im[28];
+    t4 = t0 + t8;
+    t3 = t9 + t2;
+    t5 = C2 * t4;
+    t7 = t1 - t5;
+    t5 = C2 * t3;
+    t5 = t6 - t5;
+    t0 = t0 - t8;
+    t8 = C3 * t0;
+    t0 = t9 - t2;
+    t9 = C3 * t0;
+    t2 = t1 + t4;
+    t0 = t6 + t3;
+    t1 = t7 + t9;
+    t4 = t5 - t8;
+    t6 = t7 - t9;
+    t3 = t5 + t8;
+    re[168] = t2;
+    im[168] = t0;
+    re[8] = t1;
+    im[8] = t4;
+    re[28] = t6;
+    im[28] = t3;
+    t7 = re[48];
+    t9 = im[48];
+    t5 = re[68];
+    t8 = im[68];
+    t2 = re[88];
+    t0 = im[88];
+    t1 = t5 + t2;
+    t4 = t8 + t0;
+    t6 = C2 * t1;
+    t3 = t7 - t6;
+    t6 = C2 * t4;
+    t6 = t9 - t6;
+    t5 = t5 - t2;
+    t2 = C3 * t5;
+    t5 = t8 - t0;
+    t8 = C3 * t5;
+    t0 = t7 + t1;
+    t5 = t9 + t4;
+    t7 = t3 + t8;
+    t1 = t6 - t2;
+    t9 = t3 - t8;
+    t4 = t6 + t2;
+    re[48] = t0;
+    im[48] = t5;
+    re[68] = t7;
+    im[68] = t1;
+    re[88] = t9;
+    im[88] = t4;
+    t3 = x[108];
+    t8 = 0.03685254051423165 * t3;
+    t6 = x[251];
+    t2 = 0.07811209041394841 * t6;
+    t0 = t8 - t2;
+    t5 = x[468];
+    t7 = 0.06935991088229848 * t5;
+    t1 = x[611];
+    t9 = 0.0037367281520488786 * t1;
+    t4 = t7 + t9;
+    t3 = C17 * t0;
+    t6 = (-C16) * t4;
+    t8 = t3 + t6;
+    t2 = (-C16) * t0;
+    t5 = (-C17) * t4;
+    t1 = t2 + t5;
+    t7 = x[491];
+    t9 = 0.06265689585313484 * t7;
+    t3 = x[588];
+    t6 = 0.011689066002518803 * t3;
+    t0 = t9 + t6;
+    t4 = x[131];
+    t2 = 0.050297128855992426 * t4;
+    t5 = x[228];
+    t7 = 0.07928303866608047 * t5;
+    t3 = t2 - t7;
+    t9 = (-C21) * t0;
+    t6 = C20 * t3;
+    t4 = t9 + t6;
+    t5 = C20 * t0;
+    t2 = C21 * t3;
+    t7 = t5 + t2;
+    t9 = x[371];
+    t6 = x[11];
+    t0 = 0.0007162412227853556 * t6;
+    t3 = x[348];
+    t5 = 0.0742006958638272 * t3;
+    t2 = t0 - t5;
+    t6 = (-0.05564074993771025) * t9;
+    t3 = C18 * t2;
+    t0 = t6 + t3;
+    t5 = 0.0500991562716791 * t9;
+    t6 = C19 * t2;
+    t3 = t5 + t6;
+    t9 = t4 + t0;
+    t2 = t7 + t3;
+    t5 = C2 * t9;
+    t6 = t8 - t5;
+    t5 = C2 * t2;
+    t5 = t1 - t5;
+    t4 = t4 - t0;
+    t0 = C3 * t4;
+    t4 = t7 - t3;
+    t7 = C3 * t4;
+    t3 = t8 + t9;
+    t4 = t1 + t2;
+    t8 = t6 + t7;
+    t9 = t5 - t0;
+    t1 = t6 - t7;
+    t2 = t5 + t0;
+    re[144] = t3;
+    im[144] = t4;
+    re[24] = t8;
+    im[24] = t9;
+    re[84] = t1;
+    im[84] = t2;
+    t6 = x[148];
+    t7 = 0.05944647194056285 * t6;
+    t5 = x[211];
+    t0 = 0.07862483745225313 * t5;
+    t3 = t7 - t0;
+    t4 = x[508];
+    t8 = 0.05549852471039634 * t4;
+    t9 = x[571];
+    t1 = 0.02005153598606483 * t9;
+    t2 = t8 + t1;
+    t6 = C33 * t3;
+    t5 = (-C32) * t2;
+    t7 = t6 + t5;
+    t0 = (-C32) * t3;
+    t4 = (-C33) * t2;
+    t9 = t0 + t4;
+    t8 = x[451];
+    t1 = 0.07231298479938665 * t8;
+    t6 = x[628];
+    t5 = 0.0007843288223699206 * t6;
+    t3 = t1 + t5;
+    t2 = x[91];
+    t0 = 0.027105618559342022 * t2;
+    t4 = x[268];
+    t8 = 0.07653253220047196 * t4;
+    t6 = t0 - t8;
+    t1 = (-C31) * t3;
+    t5 = C30 * t6;
+    t2 = t1 + t5;
+    t4 = C30 * t3;
+    t0 = C31 * t6;
+    t8 = t4 + t0;
+    t1 = x[28];
+    t5 = 0.0029040315795407093 * t1;
+    t3 = x[331];
+    t6 = 0.07384208750361634 * t3;
+    t4 = t5 - t6;
+    t0 = x[388];
+    t1 = C28 * t4;
+    t3 = (-0.059286481030522614) * t0;
+    t5 = t1 + t3;
+    t6 = (-C29) * t4;
+    t1 = (-0.04631967547531048) * t0;
+    t3 = t6 + t1;
+    t4 = t2 + t5;
+    t0 = t8 + t3;
+    t6 = C2 * t4;
+    t1 = t7 - t6;
+    t6 = C2 * t0;
+    t6 = t9 - t6;
+    t2 = t2 - t5;
+    t5 = C3 * t2;
+    t2 = t8 - t3;
+    t8 = C3 * t2;
+    t3 = t7 + t4;
+    t2 = t9 + t0;
+    t7 = t1 + t8;
+    t4 = t6 - t5;
+    t9 = t1 - t8;
+    t0 = t6 + t5;
+    t1 = t7 + t4;
+    t8 = C7 * t1;
+    t6 = t7 * (-C10);
+    t5 = t4 * C11;
+    t1 = t8 - t5;
+    t7 = t8 + t6;
+    t4 = t9 + t0;
+    t5 = C5 * t4;
+    t8 = t9 * (-C12);
+    t6 = t0 * (-C13);
+    t4 = t5 - t6;
+    t9 = t5 + t8;
+    re[164] = t3;
+    im[164] = t2;
+    re[44] = t1;
+    im[44] = t7;
+    re[104] = t4;
+    im[104] = t9;
+    t0 = x[531];
+    t6 = 0.043322682886716854 * t0;
+    t5 = x[548];
+    t8 = 0.03330865582833472 * t5;
+    t3 = t6 + t8;
+    t2 = x[171];
+    t1 = 0.06953296335829233 * t2;
+    t7 = x[188];
+    t4 = 0.07477620946977974 * t7;
+    t9 = t1 - t4;
+    t0 = (-C27) * t3;
+    t5 = C26 * t9;
+    t6 = t0 + t5;
+    t8 = C26 * t3;
+    t2 = C27 * t9;
+    t7 = t8 + t2;
+    t1 = x[411];
+    t4 = x[51];
+    t0 = 0.008858817415260668 * t4;
+    t5 = x[308];
+    t3 = 0.07392721761500906 * t5;
+    t9 = t0 - t3;
+    t8 = (-0.0637299558129673) * t1;
+    t2 = C24 * t9;
+    t4 = t8 + t2;
+    t5 = 0.03982289618605895 * t1;
+    t0 = C25 * t9;
+    t3 = t5 + t0;
+    t8 = x[68];
+    t2 = 0.015529151731525307 * t8;
+    t1 = x[291];
+    t9 = 0.0746333994245822 * t1;
+    t5 = t2 - t9;
+    t0 = x[428];
+    t8 = C22 * t5;
+    t1 = (-0.06572478866822397) * t0;
+    t2 = t8 + t1;
+    t9 = (-C23) * t5;
+    t8 = (-0.03494649002885217) * t0;
+    t1 = t9 + t8;
+    t5 = t4 + t2;
+    t0 = t3 + t1;
+    t9 = C2 * t5;
+    t8 = t6 - t9;
+    t9 = C2 * t0;
+    t9 = t7 - t9;
+    t4 = t4 - t2;
+    t2 = C3 * t4;
+    t4 = t3 - t1;
+    t3 = C3 * t4;
+    t1 = t6 + t5;
+    t4 = t7 + t0;
+    t6 = t8 + t3;
+    t5 = t9 - t2;
+    t7 = t8 - t3;
+    t0 = t9 + t2;
+    t8 = t6 + t5;
+    t3 = C5 * t8;
+    t9 = t6 * (-C12);
+    t2 = t5 * (-C13);
+    t8 = t3 - t2;
+    t6 = t3 + t9;
+    t5 = t7 + t0;
+    t2 = (-C9) * t5;
+    t3 = t7 * C14;
+    t9 = t0 * (-C15);
+    t5 = t2 - t9;
+    t7 = t2 + t3;
+    re[4] = t1;
+    im[4] = t4;
+    re[64] = t8;
+    im[64] = t6;
+    re[124] = t5;
+    im[124] = t7;
+    t0 = re[144];
+    t9 = im[144];
+    t2 = re[164];
+    t3 = im[164];
+    t1 = re[4];
+    t4 = im[4];
+    t8 = t2 + t1;
+    t6 = t3 + t4;
+    t5 = C2 * t8;
+    t7 = t0 - t5;
+    t5 = C2 * t6;
+    t5 = t9 - t5;
+    t2 = t2 - t1;
+    t1 = C3 * t2;
+    t2 = t3 - t4;
+    t3 = C3 * t2;
+    t4 = t0 + t8;
+    t2 = t9 + t6;
+    t0 = t7 + t3;
+    t8 = t5 - t1;
+    t9 = t7 - t3;
+    t6 = t5 + t1;
+    re[144] = t4;
+    im[144] = t2;
+    re[164] = t0;
+    im[164] = t8;
+    re[4] = t9;
+    im[4] = t6;
+    t7 = re[24];
+    t3 = im[24];
+    t5 = re[44];
+    t1 = im[44];
+    t4 = re[64];
+    t2 = im[64];
+    t0 = t5 + t4;
+    t8 = t1 + t2;
+    t9 = C2 * t0;
+    t6 = t7 - t9;
+    t9 = C2 * t8;
+    t9 = t3 - t9;
+    t5 = t5 - t4;
+    t4 = C3 * t5;
+    t5 = t1 - t2;
+    t1 = C3 * t5;
+    t2 = t7 + t0;
+    t5 = t3 + t8;
+    t7 = t6 + t1;
+    t0 = t9 - t4;
+    t3 = t6 - t1;
+    t8 = t9 + t4;
+    re[24] = t2;
+    im[24] = t5;
+    re[44] = t7;
+    im[44] = t0;
+    re[64] = t3;
+    im[64] = t8;
+    t6 = re[84];
+    t1 = im[84];
+    t9 = re[104];
+    t4 = im[104];
+    t2 = re[124];
+    t5 = im[124];
+    t7 = t9 + t2;
+    t0 = t4 + t5;
+    t3 = C2 * t7;
+    t8 = t6 - t3;
+    t3 = C2 * t0;
+    t3 = t1 - t3;
+    t9 = t9 - t2;
+    t2 = C3 * t9;
+    t9 = t4 - t5;
+    t4 = C3 * t9;
+    t5 = t6 + t7;
+    t9 = t1 + t0;
+    t6 = t8 + t4;
+    t7 = t3 - t2;
+    t1 = t8 - t4;
+    t0 = t3 + t2;
+    re[84] = t5;
+    im[84] = t9;
+    re[104] = t6;
+    im[104] = t7;
+    re[124] = t1;
+    im[124] = t0;
+    t8 = re[0];
+    t4 = im[0];
+    t3 = re[36];
+    t2 = im[36];
+    t5 = re[72];
+    t9 = im[72];
+    t6 = re[108];
+    t7 = im[108];
+    t1 = re[144];
+    t0 = im[144];
+    t10 = t3 + t1;
+    t11 = t2 + t0;
+    t12 = t5 + t6;
+    t13 = t9 + t7;
+    t3 = t3 - t1;
+    t1 = t2 - t0;
+    t2 = t5 - t6;
+    t0 = t9 - t7;
+    t5 = t10 + t12;
+    t6 = t11 + t13;
+    t9 = t10 - t12;
+    t7 = C52 * t9;
+    t10 = t11 - t13;
+    t12 = C52 * t10;
+    t9 = C53 * t5;
+    t11 = t8 - t9;
+    t13 = C53 * t6;
+    t10 = t4 - t13;
+    t9 = t11 + t7;
+    t13 = t10 + t12;
+    t11 = t11 - t7;
+    t7 = t10 - t12;
+    t10 = C16 * t3;
+    t12 = C34 * t2;
+    t10 = t10 + t12;
+    t12 = C16 * t1;
+    t14 = C34 * t0;
+    t12 = t12 + t14;
+    t14 = C34 * t3;
+    t3 = C16 * t2;
+    t2 = t14 - t3;
+    t14 = C34 * t1;
+    t3 = C16 * t0;
+    t1 = t14 - t3;
+    t0 = t8 + t5;
+    t14 = t4 + t6;
+    t3 = t9 + t12;
+    t8 = t13 - t10;
+    t5 = t11 + t1;
+    t4 = t7 - t2;
+    t6 = t11 - t1;
+    t11 = t7 + t2;
+    t1 = t9 - t12;
+    t7 = t13 + t10;
+    re[0] = t0;
+    im[0] = t14;
+    re[36] = t3;
+    im[36] = t8;
+    re[72] = t5;
+    im[72] = t4;
+    re[108] = t6;
+    im[108] = t11;
+    re[144] = t1;
+    im[144] = t7;
+    t2 = re[60];
+    t9 = im[60];
+    t12 = re[96];
+    t13 = im[96];
+    t10 = re[132];
+    t0 = im[132];
+    t14 = re[168];
+    t3 = im[168];
+    t8 = re[24];
+    t5 = im[24];
+    t4 = t12 + t8;
+    t6 = t13 + t5;
+    t11 = t10 + t14;
+    t1 = t0 + t3;
+    t7 = t12 - t8;
+    t12 = t13 - t5;
+    t8 = t10 - t14;
+    t13 = t0 - t3;
+    t5 = t4 + t11;
+    t10 = t6 + t1;
+    t14 = t4 - t11;
+    t0 = C52 * t14;
+    t3 = t6 - t1;
+    t4 = C52 * t3;
+    t11 = C53 * t5;
+    t14 = t2 - t11;
+    t6 = C53 * t10;
+    t1 = t9 - t6;
+    t3 = t14 + t0;
+    t11 = t1 + t4;
+    t6 = t14 - t0;
+    t14 = t1 - t4;
+    t0 = C16 * t7;
+    t1 = C34 * t8;
+    t4 = t0 + t1;
+    t0 = C16 * t12;
+    t1 = C34 * t13;
+    t0 = t0 + t1;
+    t1 = C34 * t7;
+    t7 = C16 * t8;
+    t8 = t1 - t7;
+    t1 = C34 * t12;
+    t7 = C16 * t13;
+    t12 = t1 - t7;
+    t13 = t2 + t5;
+    t1 = t9 + t10;
+    t7 = t3 + t0;
+    t2 = t11 - t4;
+    t5 = t6 + t12;
+    t9 = t14 - t8;
+    t10 = t6 - t12;
+    t6 = t14 + t8;
+    t12 = t3 - t0;
+    t14 = t11 + t4;
+    re[60] = t13;
+    im[60] = t1;
+    re[96] = t7;
+    im[96] = t2;
+    re[132] = t5;
+    im[132] = t9;
+    re[168] = t10;
+    im[168] = t6;
+    re[24] = t12;
+    im[24] = t14;
+    t8 = re[120];
+    t3 = im[120];
+    t0 = re[156];
+    t11 = im[156];
+    t4 = re[12];
+    t13 = im[12];
+    t1 = re[48];
+    t7 = im[48];
+    t2 = re[84];
+    t5 = im[84];
+    t9 = t0 + t2;
+    t10 = t11 + t5;
+    t6 = t4 + t1;
+    t12 = t13 + t7;
+    t14 = t0 - t2;
+    t0 = t11 - t5;
+    t2 = t4 - t1;
+    t11 = t13 - t7;
+    t5 = t9 + t6;
+    t4 = t10 + t12;
+    t1 = t9 - t6;
+    t13 = C52 * t1;
+    t7 = t10 - t12;
+    t9 = C52 * t7;
+    t6 = C53 * t5;
+    t1 = t8 - t6;
+    t10 = C53 * t4;
+    t12 = t3 - t10;
+    t7 = t1 + t13;
+    t6 = t12 + t9;
+    t10 = t1 - t13;
+    t1 = t12 - t9;
+    t13 = C16 * t14;
+    t12 = C34 * t2;
+    t9 = t13 + t12;
+    t13 = C16 * t0;
+    t12 = C34 * t11;
+    t13 = t13 + t12;
+    t12 = C34 * t14;
+    t14 = C16 * t2;
+    t2 = t12 - t14;
+    t12 = C34 * t0;
+    t14 = C16 * t11;
+    t0 = t12 - t14;
+    t11 = t8 + t5;
+    t12 = t3 + t4;
+    t14 = t7 + t13;
+    t8 = t6 - t9;
+    t5 = t10 + t0;
+    t3 = t1 - t2;
+    t4 = t10 - t0;
+    t10 = t1 + t2;
+    t0 = t7 - t13;
+    t1 = t6 + t9;
+    re[120] = t11;
+    im[120] = t12;
+    re[156] = t14;
+    im[156] = t8;
+    re[12] = t5;
+    im[12] = t3;
+    re[48] = t4;
+    im[48] = t10;
+    re[84] = t0;
+    im[84] = t1;
+    t2 = re[20];
+    t7 = im[20];
+    t13 = re[56];
+    t6 = im[56];
+    t9 = re[92];
+    t11 = im[92];
+    t12 = re[128];
+    t14 = im[128];
+    t8 = re[164];
+    t5 = im[164];
+    t3 = t13 + t8;
+    t4 = t6 + t5;
+    t10 = t9 + t12;
+    t0 = t11 + t14;
+    t1 = t13 - t8;
+    t13 = t6 - t5;
+    t8 = t9 - t12;
+    t6 = t11 - t14;
+    t5 = t3 + t10;
+    t9 = t4 + t0;
+    t12 = t3 - t10;
+    t11 = C52 * t12;
+    t14 = t4 - t0;
+    t3 = C52 * t14;
+    t10 = C53 * t5;
+    t12 = t2 - t10;
+    t4 = C53 * t9;
+    t0 = t7 - t4;
+    t14 = t12 + t11;
+    t10 = t0 + t3;
+    t4 = t12 - t11;
+    t12 = t0 - t3;
+    t11 = C16 * t1;
+    t0 = C34 * t8;
+    t3 = t11 + t0;
+    t11 = C16 * t13;
+    t0 = C34 * t6;
+    t11 = t11 + t0;
+    t0 = C34 * t1;
+    t1 = C16 * t8;
+    t8 = t0 - t1;
+    t0 = C34 * t13;
+    t1 = C16 * t6;
+    t13 = t0 - t1;
+    t6 = t2 + t5;
+    t0 = t7 + t9;
+    t1 = t14 + t11;
+    t2 = t10 - t3;
+    t5 = t4 + t13;
+    t7 = t12 - t8;
+    t9 = t4 - t13;
+    t4 = t12 + t8;
+    t13 = t14 - t11;
+    t12 = t10 + t3;
+    re[20] = t6;
+    im[20] = t0;
+    re[56] = t1;
+    im[56] = t2;
+    re[92] = t5;
+    im[92] = t7;
+    re[128] = t9;
+    im[128] = t4;
+    re[164] = t13;
+    im[164] = t12;
+    t8 = re[80];
+    t14 = im[80];
+    t11 = re[116];
+    t10 = im[116];
+    t3 = re[152];
+    t6 = im[152];
+    t0 = re[8];
+    t1 = im[8];
+    t2 = re[44];
+    t5 = im[44];
+    t7 = t11 + t2;
+    t9 = t10 + t5;
+    t4 = t3 + t0;
+    t13 = t6 + t1;
+    t12 = t11 - t2;
+    t11 = t10 - t5;
+    t2 = t3 - t0;
+    t10 = t6 - t1;
+    t5 = t7 + t4;
+    t3 = t9 + t13;
+    t0 = t7 - t4;
+    t6 = C52 * t0;
+    t1 = t9 - t13;
+    t7 = C52 * t1;
+    t4 = C53 * t5;
+    t0 = t8 - t4;
+    t9 = C53 * t3;
+    t13 = t14 - t9;
+    t1 = t0 + t6;
+    t4 = t13 + t7;
+    t9 = t0 - t6;
+    t0 = t13 - t7;
+    t6 = C16 * t12;
+    t13 = C34 * t2;
+    t7 = t6 + t13;
+    t6 = C16 * t11;
+    t13 = C34 * t10;
+    t6 = t6 + t13;
+    t13 = C34 * t12;
+    t12 = C16 * t2;
+    t2 = t13 - t12;
+    t13 = C34 * t11;
+    t12 = C16 * t10;
+    t11 = t13 - t12;
+    t10 = t8 + t5;
+    t13 = t14 + t3;
+    t12 = t1 + t6;
+    t8 = t4 - t7;
+    t5 = t9 + t11;
+    t14 = t0 - t2;
+    t3 = t9 - t11;
+    t9 = t0 + t2;
+    t11 = t1 - t6;
+    t0 = t4 + t7;
+    re[80] = t10;
+    im[80] = t13;
+    re[116] = t12;
+    im[116] = t8;
+    re[152] = t5;
+    im[152] = t14;
+    re[8] = t3;
+    im[8] = t9;
+    re[44] = t11;
+    im[44] = t0;
+    t2 = re[140];
+    t1 = im[140];
+    t6 = re[176];
+    t4 = im[176];
+    t7 = re[32];
+    t10 = im[32];
+    t13 = re[68];
+    t12 = im[68];
+    t8 = re[104];
+    t5 = im[104];
+    t14 = t6 + t8;
+    t3 = t4 + t5;
+    t9 = t7 + t13;
+    t11 = t10 + t12;
+    t0 = t6 - t8;
+    t6 = t4 - t5;
+    t8 = t7 - t13;
+    t4 = t10 - t12;
+    t5 = t14 + t9;
+    t7 = t3 + t11;
+    t13 = t14 - t9;
+    t10 = C52 * t13;
+    t12 = t3 - t11;
+    t14 = C52 * t12;
+    t9 = C53 * t5;
+    t13 = t2 - t9;
+    t3 = C53 * t7;
+    t11 = t1 - t3;
+    t12 = t13 + t10;
+    t9 = t11 + t14;
+    t3 = t13 - t10;
+    t13 = t11 - t14;
+    t10 = C16 * t0;
+    t11 = C34 * t8;
+    t14 = t10 + t11;
+    t10 = C16 * t6;
+    t11 = C34 * t4;
+    t10 = t10 + t11;
+    t11 = C34 * t0;
+    t0 = C16 * t8;
+    t8 = t11 - t0;
+    t11 = C34 * t6;
+    t0 = C16 * t4;
+    t6 = t11 - t0;
+    t4 = t2 + t5;
+    t11 = t1 + t7;
+    t0 = t12 + t10;
+    t2 = t9 - t14;
+    t5 = t3 + t6;
+    t1 = t13 - t8;
+    t7 = t3 - t6;
+    t3 = t13 + t8;
+    t6 = t12 - t10;
+    t13 = t9 + t14;
+    re[140] = t4;
+    im[140] = t11;
+    re[176] = t0;
+    im[176] = t2;
+    re[32] = t5;
+    im[32] = t1;
+    re[68] = t7;
+    im[68] = t3;
+    re[104] = t6;
+    im[104] = t13;
+    t8 = re[40];
+    t12 = im[40];
+    t10 = re[76];
+    t9 = im[76];
+    t14 = re[112];
+    t4 = im[112];
+    t11 = re[148];
+    t0 = im[148];
+    t2 = re[4];
+    t5 = im[4];
+    t1 = t10 + t2;
+    t7 = t9 + t5;
+    t3 = t14 + t11;
+    t6 = t4 + t0;
+    t13 = t10 - t2;
+    t10 = t9 - t5;
+    t2 = t14 - t11;
+    t9 = t4 - t0;
+    t5 = t1 + t3;
+    t14 = t7 + t6;
+    t11 = t1 - t3;
+    t4 = C52 * t11;
+    t0 = t7 - t6;
+    t1 = C52 * t0;
+    t3 = C53 * t5;
+    t11 = t8 - t3;
+    t7 = C53 * t14;
+    t6 = t12 - t7;
+    t0 = t11 + t4;
+    t3 = t6 + t1;
+    t7 = t11 - t4;
+    t11 = t6 - t1;
+    t4 = C16 * t13;
+    t6 = C34 * t2;
+    t1 = t4 + t6;
+    t4 = C16 * t10;
+    t6 = C34 * t9;
+    t4 = t4 + t6;
+    t6 = C34 * t13;
+    t13 = C16 * t2;
+    t2 = t6 - t13;
+    t6 = C34 * t10;
+    t13 = C16 * t9;
+    t10 = t6 - t13;
+    t9 = t8 + t5;
+    t6 = t12 + t14;
+    t13 = t0 + t4;
+    t8 = t3 - t1;
+    t5 = t7 + t10;
+    t12 = t11 - t2;
+    t14 = t7 - t10;
+    t7 = t11 + t2;
+    t10 = t0 - t4;
+    t11 = t3 + t1;
+    re[40] = t9;
+    im[40] = t6;
+    re[76] = t13;
+    im[76] = t8;
+    re[112] = t5;
+    im[112] = t12;
+    re[148] = t14;
+    im[148] = t7;
+    re[4] = t10;
+    im[4] = t11;
+}
+
+/**
+ *  Part 2 of ApplyWindowedMDCT_W75_360().
+ * 
+ *  @param {Number[]} x 
+ *    - The input block (720 points).
+ *  @param {Number[]} X 
+ *    - The array that would contain the output block (360 points).
+ *  @param {Number[]} re 
+ *    - The scratch buffer (real part, 180 points).
+ *  @param {Number[]} im 
+ *    - The scratch buffer (imaginary part, 180 points).
+ */
+function ApplyWindowedMDCT_W75_360_Part2(x, X, re, im) {
+    let t0, t1, t10, t11, t12, t13, t14, t2, t3, t4, t5, t6, t7, t8, t9;
+    const C0 = 0.5590169943749475;
+    const C1 = 0.25;
+    const C2 = 0.9510565162951535;
+    const C3 = 0.5877852522924731;
+    const C4 = 0.9238795325112867;
+    const C5 = 0.3826834323650898;
+    const C6 = 0.13052619222005157;
+    const C7 = 0.9914448613738104;
+    const C8 = 0.5;
+    const C9 = 0.8660254037844386;
+    const C10 = 0.9990482215818578;
+    const C11 = 0.043619387365336;
+    const C12 = 0.766044443118978;
+    const C13 = 1.4088320528055172;
+    const C14 = 0.12325683343243876;
+    const C15 = 0.17364817766693033;
+    const C16 = 1.1584559306791384;
+    const C17 = 0.8111595753452777;
+    const C18 = 0.3007057995042731;
+    const C19 = 0.9537169507482269;
+    const C20 = 0.9762960071199334;
+    const C21 = 0.21643961393810288;
+    const C22 = 0.9396926207859084;
+    const C23 = 0.5976724774602398;
+    const C24 = 1.281712764111577;
+    const C25 = 0.33380685923377096;
+    const C26 = 0.9426414910921784;
+    const C27 = 0.9832549075639546;
+    const C28 = 0.18223552549214747;
+    const C29 = 0.16504760586067765;
+    const C30 = 0.9862856015372314;
+    const C31 = 0.9366721892483976;
+    const C32 = 0.35020738125946743;
+    const C33 = 0.9999619230641713;
+    const C34 = 0.008726535498373935;
+    const C35 = 0.02617694830787315;
+    const C36 = 0.9996573249755573;
+    const C37 = 0.3665012267242973;
+    const C38 = 0.9304175679820246;
+    const C39 = 0.9890158633619168;
+    const C40 = 0.1478094111296106;
+    const C41 = 0.19936793441719716;
+    const C42 = 0.9799247046208296;
+    const C43 = 0.9483236552061993;
+    const C44 = 0.31730465640509214;
+    const C45 = 0.2334453638559054;
+    const C46 = 0.9723699203976766;
+    const C47 = 0.958819734868193;
+    const C48 = 0.2840153447039226;
+    const C49 = 0.06104853953485687;
+    const C50 = 0.9981347984218669;
+    const C51 = 0.9935718556765875;
+    const C52 = 0.11320321376790671;
+    const C53 = 0.3987490689252462;
+    const C54 = 0.917060074385124;
+    const C55 = 0.996917333733128;
+    const C56 = 0.07845909572784494;
+    const C57 = 0.9681476403781077;
+    const C58 = 0.25038000405444144;
+    const C59 = 0.26723837607825685;
+    const C60 = 0.963630453208623;
+    const C61 = 0.09584575252022398;
+    const C62 = 0.9953961983671789;
+    t2 = re[100];
+    t0 = im[100];
+    t4 = re[136];
+    t3 = im[136];
+    t1 = re[172];
+    t9 = im[172];
+    t6 = re[28];
+    t13 = im[28];
+    t8 = re[64];
+    t5 = im[64];
+    t12 = t4 + t8;
+    t14 = t3 + t5;
+    t7 = t1 + t6;
+    t10 = t9 + t13;
+    t11 = t4 - t8;
+    t4 = t3 - t5;
+    t8 = t1 - t6;
+    t3 = t9 - t13;
+    t5 = t12 + t7;
+    t1 = t14 + t10;
+    t6 = t12 - t7;
+    t9 = C0 * t6;
+    t13 = t14 - t10;
+    t12 = C0 * t13;
+    t7 = C1 * t5;
+    t6 = t2 - t7;
+    t14 = C1 * t1;
+    t10 = t0 - t14;
+    t13 = t6 + t9;
+    t7 = t10 + t12;
+    t14 = t6 - t9;
+    t6 = t10 - t12;
+    t9 = C2 * t11;
+    t10 = C3 * t8;
+    t12 = t9 + t10;
+    t9 = C2 * t4;
+    t10 = C3 * t3;
+    t9 = t9 + t10;
+    t10 = C3 * t11;
+    t11 = C2 * t8;
+    t8 = t10 - t11;
+    t10 = C3 * t4;
+    t11 = C2 * t3;
+    t4 = t10 - t11;
+    t3 = t2 + t5;
+    t10 = t0 + t1;
+    t11 = t13 + t9;
+    t2 = t7 - t12;
+    t5 = t14 + t4;
+    t0 = t6 - t8;
+    t1 = t14 - t4;
+    t14 = t6 + t8;
+    t4 = t13 - t9;
+    t6 = t7 + t12;
+    re[100] = t3;
+    im[100] = t10;
+    re[136] = t11;
+    im[136] = t2;
+    re[172] = t5;
+    im[172] = t0;
+    re[28] = t1;
+    im[28] = t14;
+    re[64] = t4;
+    im[64] = t6;
+    t8 = re[160];
+    t13 = im[160];
+    t9 = re[16];
+    t7 = im[16];
+    t12 = re[52];
+    t3 = im[52];
+    t10 = re[88];
+    t11 = im[88];
+    t2 = re[124];
+    t5 = im[124];
+    t0 = t9 + t2;
+    t1 = t7 + t5;
+    t14 = t12 + t10;
+    t4 = t3 + t11;
+    t6 = t9 - t2;
+    t9 = t7 - t5;
+    t2 = t12 - t10;
+    t7 = t3 - t11;
+    t5 = t0 + t14;
+    t12 = t1 + t4;
+    t10 = t0 - t14;
+    t3 = C0 * t10;
+    t11 = t1 - t4;
+    t0 = C0 * t11;
+    t14 = C1 * t5;
+    t10 = t8 - t14;
+    t1 = C1 * t12;
+    t4 = t13 - t1;
+    t11 = t10 + t3;
+    t14 = t4 + t0;
+    t1 = t10 - t3;
+    t10 = t4 - t0;
+    t3 = C2 * t6;
+    t4 = C3 * t2;
+    t0 = t3 + t4;
+    t3 = C2 * t9;
+    t4 = C3 * t7;
+    t3 = t3 + t4;
+    t4 = C3 * t6;
+    t6 = C2 * t2;
+    t2 = t4 - t6;
+    t4 = C3 * t9;
+    t6 = C2 * t7;
+    t9 = t4 - t6;
+    t7 = t8 + t5;
+    t4 = t13 + t12;
+    t6 = t11 + t3;
+    t8 = t14 - t0;
+    t5 = t1 + t9;
+    t13 = t10 - t2;
+    t12 = t1 - t9;
+    t1 = t10 + t2;
+    t9 = t11 - t3;
+    t10 = t14 + t0;
+    re[160] = t7;
+    im[160] = t4;
+    re[16] = t6;
+    im[16] = t8;
+    re[52] = t5;
+    im[52] = t13;
+    re[88] = t12;
+    im[88] = t1;
+    re[124] = t9;
+    im[124] = t10;
+    t2 = x[449];
+    t11 = 0.07256989822004814 * t2;
+    t3 = x[630];
+    t14 = 0.0005948867419687272 * t3;
+    t0 = t11 + t14;
+    t7 = x[89];
+    t4 = 0.02600882290369695 * t7;
+    t6 = x[270];
+    t8 = 0.07634133969483003 * t6;
+    t5 = t4 - t8;
+    t13 = (-C4) * t0;
+    t12 = C5 * t5;
+    t1 = t13 + t12;
+    t9 = C5 * t0;
+    t10 = C4 * t5;
+    t2 = t9 + t10;
+    t3 = x[30];
+    t11 = 0.003280615794812773 * t3;
+    t14 = x[329];
+    t7 = 0.07381838742030912 * t14;
+    t6 = t11 - t7;
+    t4 = x[390];
+    t8 = 0.6087614290087207 * t6;
+    t13 = (-0.05970759740493762) * t4;
+    t12 = t8 + t13;
+    t0 = (-0.7933533402912352) * t6;
+    t5 = (-0.04581525087619117) * t4;
+    t9 = t0 + t5;
+    t10 = x[150];
+    t3 = 0.06044202805644682 * t10;
+    t14 = x[209];
+    t11 = 0.07843375404242915 * t14;
+    t7 = t3 - t11;
+    t8 = x[510];
+    t13 = 0.054540535915650216 * t8;
+    t6 = x[569];
+    t4 = 0.02113986934740008 * t6;
+    t0 = t13 + t4;
+    t5 = C6 * t7;
+    t10 = (-C7) * t0;
+    t14 = t5 + t10;
+    t3 = (-C7) * t7;
+    t11 = (-C6) * t0;
+    t8 = t3 + t11;
+    t6 = t12 + t14;
+    t13 = t9 + t8;
+    t4 = C8 * t6;
+    t5 = t1 - t4;
+    t10 = C8 * t13;
+    t7 = t2 - t10;
+    t0 = t12 - t14;
+    t3 = C9 * t0;
+    t11 = t9 - t8;
+    t4 = C9 * t11;
+    t10 = t1 + t6;
+    t12 = t2 + t13;
+    t14 = t5 + t4;
+    t0 = t7 - t3;
+    t9 = t5 - t4;
+    t8 = t7 + t3;
+    re[45] = t10;
+    im[45] = t12;
+    re[105] = t14;
+    im[105] = t0;
+    re[165] = t9;
+    im[165] = t8;
+    t11 = x[409];
+    t1 = x[49];
+    t6 = 0.008198439078907925 * t1;
+    t2 = x[310];
+    t13 = 0.0738840539646149 * t2;
+    t5 = t6 - t13;
+    t4 = (-0.0634170403608041) * t11;
+    t7 = 0.5372996083468239 * t5;
+    t3 = t4 + t7;
+    t10 = 0.04040111044229679 * t11;
+    t12 = 0.8433914458128857 * t5;
+    t14 = t10 + t12;
+    t0 = x[70];
+    t9 = 0.01643140007008193 * t0;
+    t8 = x[289];
+    t1 = 0.07475940121913238 * t8;
+    t2 = t9 - t1;
+    t6 = x[430];
+    t13 = 0.4617486132350339 * t2;
+    t4 = (-0.06591596350078982) * t6;
+    t7 = t13 + t4;
+    t11 = (-0.8870108331782217) * t2;
+    t5 = (-0.034313678703882716) * t6;
+    t10 = t11 + t5;
+    t12 = x[529];
+    t0 = 0.04446489243213255 * t12;
+    t8 = x[550];
+    t9 = 0.03211724980597228 * t8;
+    t1 = t0 + t9;
+    t13 = x[169];
+    t4 = 0.06878508710053848 * t13;
+    t2 = x[190];
+    t6 = 0.07525864895163345 * t2;
+    t11 = t4 - t6;
+    t5 = (-C10) * t1;
+    t12 = C11 * t11;
+    t8 = t5 + t12;
+    t0 = C11 * t1;
+    t9 = C10 * t11;
+    t13 = t0 + t9;
+    t2 = t7 + t8;
+    t4 = t10 + t13;
+    t6 = C8 * t2;
+    t5 = t3 - t6;
+    t12 = C8 * t4;
+    t1 = t14 - t12;
+    t11 = t7 - t8;
+    t0 = C9 * t11;
+    t9 = t10 - t13;
+    t6 = C9 * t9;
+    t12 = t3 + t2;
+    t7 = t14 + t4;
+    t8 = t5 + t6;
+    t11 = t1 - t0;
+    t10 = t5 - t6;
+    t13 = t1 + t0;
+    t9 = t8 + t11;
+    t3 = C12 * t9;
+    t2 = t8 * (-C13);
+    t14 = t11 * C14;
+    t4 = t3 - t14;
+    t5 = t3 + t2;
+    t6 = t10 + t13;
+    t1 = C15 * t6;
+    t0 = t10 * (-C16);
+    t9 = t13 * (-C17);
+    t8 = t1 - t9;
+    t11 = t1 + t0;
+    re[65] = t12;
+    im[65] = t7;
+    re[125] = t4;
+    im[125] = t5;
+    re[5] = t8;
+    im[5] = t11;
+    t14 = x[369];
+    t3 = x[9];
+    t2 = 0.0005686036444083812 * t3;
+    t6 = x[350];
+    t10 = 0.07425606701298204 * t6;
+    t13 = t2 - t10;
+    t9 = (-0.05516027671899988) * t14;
+    t1 = 0.6755902076156601 * t13;
+    t0 = t9 + t1;
+    t12 = 0.050545081125047096 * t14;
+    t7 = 0.7372773368101241 * t13;
+    t4 = t12 + t7;
+    t5 = x[110];
+    t8 = 0.03803025941062032 * t5;
+    t11 = x[249];
+    t3 = 0.07827477964699882 * t11;
+    t6 = t8 - t3;
+    t2 = x[470];
+    t10 = 0.06890962178717301 * t2;
+    t9 = x[609];
+    t1 = 0.004251091028882468 * t9;
+    t14 = t10 + t1;
+    t13 = C18 * t6;
+    t12 = (-C19) * t14;
+    t7 = t13 + t12;
+    t5 = (-C19) * t6;
+    t11 = (-C18) * t14;
+    t8 = t5 + t11;
+    t3 = x[489];
+    t2 = 0.0633765184155293 * t3;
+    t9 = x[590];
+    t10 = 0.01082989060848449 * t9;
+    t1 = t2 + t10;
+    t13 = x[129];
+    t12 = 0.049157257914493886 * t13;
+    t6 = x[230];
+    t14 = 0.07925944743120644 * t6;
+    t5 = t12 - t14;
+    t11 = (-C20) * t1;
+    t3 = C21 * t5;
+    t9 = t11 + t3;
+    t2 = C21 * t1;
+    t10 = C20 * t5;
+    t13 = t2 + t10;
+    t6 = t7 + t9;
+    t12 = t8 + t13;
+    t14 = C8 * t6;
+    t11 = t0 - t14;
+    t3 = C8 * t12;
+    t1 = t4 - t3;
+    t5 = t7 - t9;
+    t2 = C9 * t5;
+    t10 = t8 - t13;
+    t14 = C9 * t10;
+    t3 = t0 + t6;
+    t7 = t4 + t12;
+    t9 = t11 + t14;
+    t5 = t1 - t2;
+    t8 = t11 - t14;
+    t13 = t1 + t2;
+    t10 = t9 + t5;
+    t0 = C15 * t10;
+    t6 = t9 * (-C16);
+    t4 = t5 * (-C17);
+    t12 = t0 - t4;
+    t11 = t0 + t6;
+    t14 = t8 + t13;
+    t1 = (-C22) * t14;
+    t2 = t8 * C23;
+    t10 = t13 * (-C24);
+    t9 = t1 - t10;
+    t5 = t1 + t2;
+    re[85] = t3;
+    im[85] = t7;
+    re[145] = t12;
+    im[145] = t11;
+    re[25] = t9;
+    im[25] = t5;
+    t4 = re[45];
+    t0 = im[45];
+    t6 = re[65];
+    t14 = im[65];
+    t8 = re[85];
+    t13 = im[85];
+    t10 = t6 + t8;
+    t1 = t14 + t13;
+    t2 = C8 * t10;
+    t3 = t4 - t2;
+    t7 = C8 * t1;
+    t12 = t0 - t7;
+    t11 = t6 - t8;
+    t9 = C9 * t11;
+    t5 = t14 - t13;
+    t2 = C9 * t5;
+    t7 = t4 + t10;
+    t6 = t0 + t1;
+    t8 = t3 + t2;
+    t11 = t12 - t9;
+    t14 = t3 - t2;
+    t13 = t12 + t9;
+    re[45] = t7;
+    im[45] = t6;
+    re[65] = t8;
+    im[65] = t11;
+    re[85] = t14;
+    im[85] = t13;
+    t5 = re[105];
+    t4 = im[105];
+    t10 = re[125];
+    t0 = im[125];
+    t1 = re[145];
+    t3 = im[145];
+    t2 = t10 + t1;
+    t12 = t0 + t3;
+    t9 = C8 * t2;
+    t7 = t5 - t9;
+    t6 = C8 * t12;
+    t8 = t4 - t6;
+    t11 = t10 - t1;
+    t14 = C9 * t11;
+    t13 = t0 - t3;
+    t9 = C9 * t13;
+    t6 = t5 + t2;
+    t10 = t4 + t12;
+    t1 = t7 + t9;
+    t11 = t8 - t14;
+    t0 = t7 - t9;
+    t3 = t8 + t14;
+    re[105] = t6;
+    im[105] = t10;
+    re[125] = t1;
+    im[125] = t11;
+    re[145] = t0;
+    im[145] = t3;
+    t13 = re[165];
+    t5 = im[165];
+    t2 = re[5];
+    t4 = im[5];
+    t12 = re[25];
+    t7 = im[25];
+    t9 = t2 + t12;
+    t8 = t4 + t7;
+    t14 = C8 * t9;
+    t6 = t13 - t14;
+    t10 = C8 * t8;
+    t1 = t5 - t10;
+    t11 = t2 - t12;
+    t0 = C9 * t11;
+    t3 = t4 - t7;
+    t14 = C9 * t3;
+    t10 = t13 + t9;
+    t2 = t5 + t8;
+    t12 = t6 + t14;
+    t11 = t1 - t0;
+    t4 = t6 - t14;
+    t7 = t1 + t0;
+    re[165] = t10;
+    im[165] = t2;
+    re[5] = t12;
+    im[5] = t11;
+    re[25] = t4;
+    im[25] = t7;
+    t3 = x[377];
+    t13 = x[17];
+    t9 = 0.0012899360456039698 * t13;
+    t5 = x[342];
+    t8 = 0.07404769515489659 * t5;
+    t6 = t9 - t8;
+    t14 = (-0.05705076407617912) * t3;
+    t1 = 0.6494480483301837 * t6;
+    t0 = t14 + t1;
+    t10 = 0.04872595568839758 * t3;
+    t2 = 0.7604059656000309 * t6;
+    t12 = t10 + t2;
+    t11 = x[102];
+    t4 = 0.033346035987584 * t11;
+    t7 = x[257];
+    t13 = 0.07758254548835453 * t7;
+    t5 = t4 - t13;
+    t9 = x[462];
+    t8 = 0.07057379992151286 * t9;
+    t14 = x[617];
+    t1 = 0.0024068981659060083 * t14;
+    t3 = t8 + t1;
+    t6 = C25 * t5;
+    t10 = (-C26) * t3;
+    t2 = t6 + t10;
+    t11 = (-C26) * t5;
+    t7 = (-C25) * t3;
+    t4 = t11 + t7;
+    t13 = x[497];
+    t9 = 0.06034004810135273 * t13;
+    t14 = x[582];
+    t8 = 0.014436325447654757 * t14;
+    t1 = t9 + t8;
+    t6 = x[137];
+    t10 = 0.053648147946663574 * t6;
+    t5 = x[222];
+    t3 = 0.07923549255550565 * t5;
+    t11 = t10 - t3;
+    t7 = (-C27) * t1;
+    t13 = C28 * t11;
+    t14 = t7 + t13;
+    t9 = C28 * t1;
+    t8 = C27 * t11;
+    t6 = t9 + t8;
+    t5 = t2 + t14;
+    t10 = t4 + t6;
+    t3 = C8 * t5;
+    t7 = t0 - t3;
+    t13 = C8 * t10;
+    t1 = t12 - t13;
+    t11 = t2 - t14;
+    t9 = C9 * t11;
+    t8 = t4 - t6;
+    t3 = C9 * t8;
+    t13 = t0 + t5;
+    t2 = t12 + t10;
+    t14 = t7 + t3;
+    t11 = t1 - t9;
+    t4 = t7 - t3;
+    t6 = t1 + t9;
+    re[81] = t13;
+    im[81] = t2;
+    re[141] = t14;
+    im[141] = t11;
+    re[21] = t4;
+    im[21] = t6;
+    t8 = x[22];
+    t0 = 0.0019296043732207938 * t8;
+    t5 = x[337];
+    t12 = 0.07394002023832033 * t5;
+    t10 = t0 - t12;
+    t7 = x[382];
+    t3 = 0.636078220277764 * t10;
+    t1 = (-0.05797676586002881) * t7;
+    t9 = t3 + t1;
+    t13 = (-0.77162458338772) * t10;
+    t2 = (-0.04779235763044332) * t7;
+    t14 = t13 + t2;
+    t11 = x[142];
+    t4 = 0.056346430106878946 * t11;
+    t6 = x[217];
+    t8 = 0.07904754755085189 * t6;
+    t5 = t4 - t8;
+    t0 = x[502];
+    t12 = 0.0582318648569364 * t0;
+    t3 = x[577];
+    t1 = 0.016903811785332918 * t3;
+    t10 = t12 + t1;
+    t7 = C29 * t5;
+    t13 = (-C30) * t10;
+    t2 = t7 + t13;
+    t11 = (-C30) * t5;
+    t6 = (-C29) * t10;
+    t4 = t11 + t6;
+    t8 = x[457];
+    t0 = 0.07143682147707409 * t8;
+    t3 = x[622];
+    t12 = 0.0015421103034191147 * t3;
+    t1 = t0 + t12;
+    t7 = x[97];
+    t13 = 0.030471291315313755 * t7;
+    t5 = x[262];
+    t10 = 0.07711101011160705 * t5;
+    t11 = t13 - t10;
+    t6 = (-C31) * t1;
+    t8 = C32 * t11;
+    t3 = t6 + t8;
+    t0 = C32 * t1;
+    t12 = C31 * t11;
+    t7 = t0 + t12;
+    t5 = t2 + t3;
+    t13 = t4 + t7;
+    t10 = C8 * t5;
+    t6 = t9 - t10;
+    t8 = C8 * t13;
+    t1 = t14 - t8;
+    t11 = t2 - t3;
+    t0 = C9 * t11;
+    t12 = t4 - t7;
+    t10 = C9 * t12;
+    t8 = t9 + t5;
+    t2 = t14 + t13;
+    t3 = t6 + t10;
+    t11 = t1 - t0;
+    t4 = t6 - t10;
+    t7 = t1 + t0;
+    t12 = t3 + t11;
+    t9 = C12 * t12;
+    t5 = t3 * (-C13);
+    t14 = t11 * C14;
+    t13 = t9 - t14;
+    t6 = t9 + t5;
+    t10 = t4 + t7;
+    t1 = C15 * t10;
+    t0 = t4 * (-C16);
+    t12 = t7 * (-C17);
+    t3 = t1 - t12;
+    t11 = t1 + t0;
+    re[101] = t8;
+    im[101] = t2;
+    re[161] = t13;
+    im[161] = t6;
+    re[41] = t3;
+    im[41] = t11;
+    t14 = x[62];
+    t9 = 0.012966061461159185 * t14;
+    t5 = x[297];
+    t10 = 0.07431138760465847 * t5;
+    t4 = t9 - t10;
+    t7 = x[422];
+    t12 = 0.49242356010346705 * t4;
+    t1 = (-0.06506821602649246) * t7;
+    t0 = t12 + t1;
+    t8 = (-0.8703556959398997) * t4;
+    t2 = (-0.03681382535303062) * t7;
+    t13 = t8 + t2;
+    t6 = x[537];
+    t3 = 0.03983635585871724 * t6;
+    t11 = x[542];
+    t14 = 0.03688166728156738 * t11;
+    t5 = t3 + t14;
+    t9 = x[177];
+    t10 = 0.07161384860400806 * t9;
+    t12 = x[182];
+    t1 = 0.07315722926378804 * t12;
+    t4 = t10 - t1;
+    t7 = (-C33) * t5;
+    t8 = C34 * t4;
+    t2 = t7 + t8;
+    t6 = C34 * t5;
+    t11 = C33 * t4;
+    t3 = t6 + t11;
+    t14 = x[417];
+    t9 = x[57];
+    t12 = 0.011000747977745941 * t9;
+    t10 = x[302];
+    t1 = 0.07410494162131781 * t10;
+    t7 = t12 - t1;
+    t8 = (-0.06459526941645358) * t14;
+    t5 = 0.5075383629607041 * t7;
+    t4 = t8 + t5;
+    t6 = 0.038049521534104805 * t14;
+    t11 = 0.8616291604415258 * t7;
+    t9 = t6 + t11;
+    t10 = t2 + t4;
+    t12 = t3 + t9;
+    t1 = C8 * t10;
+    t8 = t0 - t1;
+    t5 = C8 * t12;
+    t14 = t13 - t5;
+    t7 = t2 - t4;
+    t6 = C9 * t7;
+    t11 = t3 - t9;
+    t1 = C9 * t11;
+    t5 = t0 + t10;
+    t2 = t13 + t12;
+    t4 = t8 + t1;
+    t7 = t14 - t6;
+    t3 = t8 - t1;
+    t9 = t14 + t6;
+    t11 = t4 + t7;
+    t0 = C15 * t11;
+    t10 = t4 * (-C16);
+    t13 = t7 * (-C17);
+    t12 = t0 - t13;
+    t8 = t0 + t10;
+    t1 = t3 + t9;
+    t14 = (-C22) * t1;
+    t6 = t3 * C23;
+    t11 = t9 * (-C24);
+    t4 = t14 - t11;
+    t7 = t14 + t6;
+    re[121] = t5;
+    im[121] = t2;
+    re[1] = t12;
+    im[1] = t8;
+    re[61] = t4;
+    im[61] = t7;
+    t13 = re[81];
+    t0 = im[81];
+    t10 = re[101];
+    t1 = im[101];
+    t3 = re[121];
+    t9 = im[121];
+    t11 = t10 + t3;
+    t14 = t1 + t9;
+    t6 = C8 * t11;
+    t5 = t13 - t6;
+    t2 = C8 * t14;
+    t12 = t0 - t2;
+    t8 = t10 - t3;
+    t4 = C9 * t8;
+    t7 = t1 - t9;
+    t6 = C9 * t7;
+    t2 = t13 + t11;
+    t10 = t0 + t14;
+    t3 = t5 + t6;
+    t8 = t12 - t4;
+    t1 = t5 - t6;
+    t9 = t12 + t4;
+    re[81] = t2;
+    im[81] = t10;
+    re[101] = t3;
+    im[101] = t8;
+    re[121] = t1;
+    im[121] = t9;
+    t7 = re[141];
+    t13 = im[141];
+    t11 = re[161];
+    t0 = im[161];
+    t14 = re[1];
+    t5 = im[1];
+    t6 = t11 + t14;
+    t12 = t0 + t5;
+    t4 = C8 * t6;
+    t2 = t7 - t4;
+    t10 = C8 * t12;
+    t3 = t13 - t10;
+    t8 = t11 - t14;
+    t1 = C9 * t8;
+    t9 = t0 - t5;
+    t4 = C9 * t9;
+    t10 = t7 + t6;
+    t11 = t13 + t12;
+    t14 = t2 + t4;
+    t8 = t3 - t1;
+    t0 = t2 - t4;
+    t5 = t3 + t1;
+    re[141] = t10;
+    im[141] = t11;
+    re[161] = t14;
+    im[161] = t8;
+    re[1] = t0;
+    im[1] = t5;
+    t9 = re[21];
+    t7 = im[21];
+    t6 = re[41];
+    t13 = im[41];
+    t12 = re[61];
+    t2 = im[61];
+    t4 = t6 + t12;
+    t3 = t13 + t2;
+    t1 = C8 * t4;
+    t10 = t9 - t1;
+    t11 = C8 * t3;
+    t14 = t7 - t11;
+    t8 = t6 - t12;
+    t0 = C9 * t8;
+    t5 = t13 - t2;
+    t1 = C9 * t5;
+    t11 = t9 + t4;
+    t6 = t7 + t3;
+    t12 = t10 + t1;
+    t8 = t14 - t0;
+    t13 = t10 - t1;
+    t2 = t14 + t0;
+    re[21] = t11;
+    im[21] = t6;
+    re[41] = t12;
+    im[41] = t8;
+    re[61] = t13;
+    im[61] = t2;
+    t5 = x[54];
+    t9 = 0.00989986156716879 * t5;
+    t4 = x[305];
+    t7 = 0.0740068294923514 * t4;
+    t3 = t9 - t7;
+    t10 = x[414];
+    t1 = 0.5224985647159488 * t3;
+    t14 = (-0.0640061171983693) * t10;
+    t0 = t1 + t14;
+    t11 = (-0.8526401643540922) * t3;
+    t6 = (-0.03922299906493756) * t10;
+    t12 = t11 + t6;
+    t8 = x[174];
+    t13 = 0.07060402737513881 * t8;
+    t2 = x[185];
+    t5 = 0.07399851067964641 * t2;
+    t4 = t13 - t5;
+    t9 = x[534];
+    t7 = 0.04158997495987726 * t9;
+    t1 = x[545];
+    t14 = 0.03509657226994685 * t1;
+    t3 = t7 + t14;
+    t10 = C35 * t4;
+    t11 = (-C36) * t3;
+    t6 = t10 + t11;
+    t8 = (-C36) * t4;
+    t2 = (-C35) * t3;
+    t13 = t8 + t2;
+    t5 = x[425];
+    t9 = x[65];
+    t1 = 0.014220262010509356 * t9;
+    t7 = x[294];
+    t14 = 0.07446206884269224 * t7;
+    t10 = t1 - t14;
+    t11 = (-0.06556784371490947) * t5;
+    t4 = 0.4771587602596084 * t10;
+    t3 = t11 + t4;
+    t8 = 0.03560043445801236 * t5;
+    t2 = 0.8788171126619654 * t10;
+    t9 = t8 + t2;
+    t7 = t6 + t3;
+    t1 = t13 + t9;
+    t14 = C8 * t7;
+    t11 = t0 - t14;
+    t4 = C8 * t1;
+    t5 = t12 - t4;
+    t10 = t6 - t3;
+    t8 = C9 * t10;
+    t2 = t13 - t9;
+    t14 = C9 * t2;
+    t4 = t0 + t7;
+    t6 = t12 + t1;
+    t3 = t11 + t14;
+    t10 = t5 - t8;
+    t13 = t11 - t14;
+    t9 = t5 + t8;
+    re[117] = t4;
+    im[117] = t6;
+    re[177] = t3;
+    im[177] = t10;
+    re[57] = t13;
+    im[57] = t9;
+    t2 = x[94];
+    t0 = 0.02877541433401703 * t2;
+    t7 = x[265];
+    t12 = 0.07682175494009395 * t7;
+    t1 = t0 - t12;
+    t11 = x[454];
+    t14 = 0.07189555032362745 * t11;
+    t5 = x[625];
+    t8 = 0.001126420177114152 * t5;
+    t4 = t14 + t8;
+    t6 = C37 * t1;
+    t3 = (-C38) * t4;
+    t10 = t6 + t3;
+    t13 = (-C38) * t1;
+    t9 = (-C37) * t4;
+    t2 = t13 + t9;
+    t7 = x[505];
+    t0 = 0.05689240942401537 * t7;
+    t12 = x[574];
+    t11 = 0.018453847710442315 * t12;
+    t5 = t0 + t11;
+    t14 = x[145];
+    t8 = 0.05791691702580703 * t14;
+    t6 = x[214];
+    t3 = 0.0788640459127583 * t6;
+    t1 = t8 - t3;
+    t4 = (-C39) * t5;
+    t13 = C40 * t1;
+    t9 = t4 + t13;
+    t7 = C40 * t5;
+    t12 = C39 * t1;
+    t0 = t7 + t12;
+    t11 = x[385];
+    t14 = x[25];
+    t6 = 0.002388239070442009 * t14;
+    t8 = x[334];
+    t3 = 0.07388628536627204 * t8;
+    t4 = t6 - t3;
+    t13 = (-0.05884479199449962) * t11;
+    t5 = 0.6225146366376195 * t4;
+    t1 = t13 + t5;
+    t7 = 0.0468072610612725 * t11;
+    t12 = 0.7826081568524139 * t4;
+    t14 = t7 + t12;
+    t8 = t9 + t1;
+    t6 = t0 + t14;
+    t3 = C8 * t8;
+    t13 = t10 - t3;
+    t5 = C8 * t6;
+    t11 = t2 - t5;
+    t4 = t9 - t1;
+    t7 = C9 * t4;
+    t12 = t0 - t14;
+    t3 = C9 * t12;
+    t5 = t10 + t8;
+    t9 = t2 + t6;
+    t1 = t13 + t3;
+    t4 = t11 - t7;
+    t0 = t13 - t3;
+    t14 = t11 + t7;
+    t12 = t1 + t4;
+    t10 = C12 * t12;
+    t8 = t1 * (-C13);
+    t2 = t4 * C14;
+    t6 = t10 - t2;
+    t13 = t10 + t8;
+    t3 = t0 + t14;
+    t11 = C15 * t3;
+    t7 = t0 * (-C16);
+    t12 = t14 * (-C17);
+    t1 = t11 - t12;
+    t4 = t11 + t7;
+    re[137] = t5;
+    im[137] = t9;
+    re[17] = t6;
+    im[17] = t13;
+    re[77] = t1;
+    im[77] = t4;
+    t2 = x[134];
+    t10 = 0.051986770927596154 * t2;
+    t8 = x[225];
+    t3 = 0.07928247848482699 * t8;
+    t0 = t10 - t3;
+    t14 = x[494];
+    t12 = 0.0615277960611282 * t14;
+    t11 = x[585];
+    t7 = 0.013031765120859037 * t11;
+    t5 = t12 + t7;
+    t9 = C41 * t0;
+    t6 = (-C42) * t5;
+    t13 = t9 + t6;
+    t1 = (-C42) * t0;
+    t4 = (-C41) * t5;
+    t2 = t1 + t4;
+    t8 = x[465];
+    t10 = 0.06999210139522677 * t8;
+    t3 = x[614];
+    t14 = 0.0030317233148571673 * t3;
+    t11 = t10 + t14;
+    t12 = x[105];
+    t7 = 0.035093195103053254 * t12;
+    t9 = x[254];
+    t6 = 0.07785396622111439 * t9;
+    t0 = t7 - t6;
+    t5 = (-C43) * t11;
+    t1 = C44 * t0;
+    t4 = t5 + t1;
+    t8 = C44 * t11;
+    t3 = C43 * t0;
+    t10 = t8 + t3;
+    t14 = x[14];
+    t12 = 0.000977833493522871 * t14;
+    t9 = x[345];
+    t7 = 0.07412146019784352 * t9;
+    t6 = t12 - t7;
+    t5 = x[374];
+    t1 = 0.6626200482157375 * t6;
+    t11 = (-0.056135768296905635) * t5;
+    t0 = t1 + t11;
+    t8 = (-0.7489557207890022) * t6;
+    t3 = (-0.049664732457530995) * t5;
+    t14 = t8 + t3;
+    t9 = t4 + t0;
+    t12 = t10 + t14;
+    t7 = C8 * t9;
+    t1 = t13 - t7;
+    t11 = C8 * t12;
+    t6 = t2 - t11;
+    t5 = t4 - t0;
+    t8 = C9 * t5;
+    t3 = t10 - t14;
+    t7 = C9 * t3;
+    t11 = t13 + t9;
+    t4 = t2 + t12;
+    t0 = t1 + t7;
+    t5 = t6 - t8;
+    t10 = t1 - t7;
+    t14 = t6 + t8;
+    t3 = t0 + t5;
+    t13 = C15 * t3;
+    t9 = t0 * (-C16);
+    t2 = t5 * (-C17);
+    t12 = t13 - t2;
+    t1 = t13 + t9;
+    t7 = t10 + t14;
+    t6 = (-C22) * t7;
+    t8 = t10 * C23;
+    t3 = t14 * (-C24);
+    t0 = t6 - t3;
+    t5 = t6 + t8;
+    re[157] = t11;
+    im[157] = t4;
+    re[37] = t12;
+    im[37] = t1;
+    re[97] = t0;
+    im[97] = t5;
+    t2 = re[117];
+    t13 = im[117];
+    t9 = re[137];
+    t7 = im[137];
+    t10 = re[157];
+    t14 = im[157];
+    t3 = t9 + t10;
+    t6 = t7 + t14;
+    t8 = C8 * t3;
+    t11 = t2 - t8;
+    t4 = C8 * t6;
+    t12 = t13 - t4;
+    t1 = t9 - t10;
+    t0 = C9 * t1;
+    t5 = t7 - t14;
+    t8 = C9 * t5;
+    t4 = t2 + t3;
+    t9 = t13 + t6;
+    t10 = t11 + t8;
+    t1 = t12 - t0;
+    t7 = t11 - t8;
+    t14 = t12 + t0;
+    re[117] = t4;
+    im[117] = t9;
+    re[137] = t10;
+    im[137] = t1;
+    re[157] = t7;
+    im[157] = t14;
+    t5 = re[177];
+    t2 = im[177];
+    t3 = re[17];
+    t13 = im[17];
+    t6 = re[37];
+    t11 = im[37];
+    t8 = t3 + t6;
+    t12 = t13 + t11;
+    t0 = C8 * t8;
+    t4 = t5 - t0;
+    t9 = C8 * t12;
+    t10 = t2 - t9;
+    t1 = t3 - t6;
+    t7 = C9 * t1;
+    t14 = t13 - t11;
+    t0 = C9 * t14;
+    t9 = t5 + t8;
+    t3 = t2 + t12;
+    t6 = t4 + t0;
+    t1 = t10 - t7;
+    t13 = t4 - t0;
+    t11 = t10 + t7;
+    re[177] = t9;
+    im[177] = t3;
+    re[17] = t6;
+    im[17] = t1;
+    re[37] = t13;
+    im[37] = t11;
+    t14 = re[57];
+    t5 = im[57];
+    t8 = re[77];
+    t2 = im[77];
+    t12 = re[97];
+    t4 = im[97];
+    t0 = t8 + t12;
+    t10 = t2 + t4;
+    t7 = C8 * t0;
+    t9 = t14 - t7;
+    t3 = C8 * t10;
+    t6 = t5 - t3;
+    t1 = t8 - t12;
+    t13 = C9 * t1;
+    t11 = t2 - t4;
+    t7 = C9 * t11;
+    t3 = t14 + t0;
+    t8 = t5 + t10;
+    t12 = t9 + t7;
+    t1 = t6 - t13;
+    t2 = t9 - t7;
+    t4 = t6 + t13;
+    re[57] = t3;
+    im[57] = t8;
+    re[77] = t12;
+    im[77] = t1;
+    re[97] = t2;
+    im[97] = t4;
+    t11 = x[126];
+    t14 = 0.04743061873083486 * t11;
+    t0 = x[233];
+    t5 = 0.07919092994811297 * t0;
+    t10 = t14 - t5;
+    t9 = x[486];
+    t7 = 0.0644056743909316 * t9;
+    t6 = x[593];
+    t13 = 0.009597393388131877 * t6;
+    t3 = t7 + t13;
+    t8 = C45 * t10;
+    t12 = (-C46) * t3;
+    t1 = t8 + t12;
+    t2 = (-C46) * t10;
+    t4 = (-C45) * t3;
+    t11 = t2 + t4;
+    t0 = x[473];
+    t14 = 0.06818849760819402 * t0;
+    t5 = x[606];
+    t9 = 0.005088538798301135 * t5;
+    t6 = t14 + t9;
+    t7 = x[113];
+    t13 = 0.03980072930307692 * t7;
+    t8 = x[246];
+    t12 = 0.07850338675965945 * t8;
+    t10 = t13 - t12;
+    t3 = (-C47) * t6;
+    t2 = C48 * t10;
+    t4 = t3 + t2;
+    t0 = C48 * t6;
+    t5 = C47 * t10;
+    t14 = t0 + t5;
+    t9 = x[6];
+    t7 = 0.0003841335513603814 * t9;
+    t8 = x[353];
+    t13 = 0.07434208988296852 * t8;
+    t12 = t7 - t13;
+    t3 = x[366];
+    t2 = 0.6883545756937539 * t12;
+    t6 = (-0.054206945528150356) * t3;
+    t10 = t2 + t6;
+    t0 = (-0.7253743710122876) * t12;
+    t5 = (-0.051440470576058286) * t3;
+    t9 = t0 + t5;
+    t8 = t4 + t10;
+    t7 = t14 + t9;
+    t13 = C8 * t8;
+    t2 = t1 - t13;
+    t6 = C8 * t7;
+    t12 = t11 - t6;
+    t3 = t4 - t10;
+    t0 = C9 * t3;
+    t5 = t14 - t9;
+    t13 = C9 * t5;
+    t6 = t1 + t8;
+    t4 = t11 + t7;
+    t10 = t2 + t13;
+    t3 = t12 - t0;
+    t14 = t2 - t13;
+    t9 = t12 + t0;
+    re[153] = t6;
+    im[153] = t4;
+    re[33] = t10;
+    im[33] = t3;
+    re[93] = t14;
+    im[93] = t9;
+    t5 = x[166];
+    t1 = 0.0676133864780924 * t5;
+    t8 = x[193];
+    t11 = 0.07592809470006731 * t8;
+    t7 = t1 - t11;
+    t2 = x[526];
+    t13 = 0.046155076669294415 * t2;
+    t12 = x[553];
+    t0 = 0.030335539013196404 * t12;
+    t6 = t13 + t0;
+    t4 = C49 * t7;
+    t10 = (-C50) * t6;
+    t3 = t4 + t10;
+    t14 = (-C50) * t7;
+    t9 = (-C49) * t6;
+    t5 = t14 + t9;
+    t8 = x[433];
+    t1 = x[73];
+    t11 = 0.017826525775521376 * t1;
+    t2 = x[286];
+    t12 = 0.07496630414092705 * t2;
+    t13 = t11 - t12;
+    t0 = (-0.0663212308707288) * t8;
+    t4 = 0.44619781310980877 * t13;
+    t10 = t0 + t4;
+    t7 = 0.03306654593561085 * t8;
+    t6 = 0.8949343616020251 * t13;
+    t14 = t7 + t6;
+    t9 = x[46];
+    t1 = 0.007258624754882618 * t9;
+    t2 = x[313];
+    t11 = 0.07383355618284335 * t2;
+    t12 = t1 - t11;
+    t0 = x[406];
+    t4 = 0.5519369853120581 * t12;
+    t8 = (-0.06274516968966971) * t0;
+    t13 = t4 + t8;
+    t7 = (-0.8338858220671682) * t12;
+    t6 = (-0.041530121852365924) * t0;
+    t9 = t7 + t6;
+    t2 = t10 + t13;
+    t1 = t14 + t9;
+    t11 = C8 * t2;
+    t4 = t3 - t11;
+    t8 = C8 * t1;
+    t12 = t5 - t8;
+    t0 = t10 - t13;
+    t7 = C9 * t0;
+    t6 = t14 - t9;
+    t11 = C9 * t6;
+    t8 = t3 + t2;
+    t10 = t5 + t1;
+    t13 = t4 + t11;
+    t0 = t12 - t7;
+    t14 = t4 - t11;
+    t9 = t12 + t7;
+    t6 = t13 + t0;
+    t3 = C12 * t6;
+    t2 = t13 * (-C13);
+    t5 = t0 * C14;
+    t1 = t3 - t5;
+    t4 = t3 + t2;
+    t11 = t14 + t9;
+    t12 = C15 * t11;
+    t7 = t14 * (-C16);
+    t6 = t9 * (-C17);
+    t13 = t12 - t6;
+    t0 = t12 + t7;
+    re[173] = t8;
+    im[173] = t10;
+    re[53] = t1;
+    im[53] = t4;
+    re[113] = t13;
+    im[113] = t0;
+    t5 = x[513];
+    t3 = 0.05306231696686175 * t5;
+    t2 = x[566];
+    t11 = 0.022804283234255183 * t2;
+    t14 = t3 + t11;
+    t9 = x[153];
+    t6 = 0.06189680526819404 * t9;
+    t12 = x[206];
+    t7 = 0.07809766918983464 * t12;
+    t8 = t6 - t7;
+    t10 = (-C51) * t14;
+    t1 = C52 * t8;
+    t4 = t10 + t1;
+    t13 = C52 * t14;
+    t0 = C51 * t8;
+    t5 = t13 + t0;
+    t2 = x[393];
+    t3 = x[33];
+    t11 = 0.00389514461881248 * t3;
+    t9 = x[326];
+    t12 = 0.07379227712376644 * t9;
+    t6 = t11 - t12;
+    t7 = (-0.0605194963747107) * t2;
+    t10 = 0.5948227867513413 * t6;
+    t1 = t7 + t10;
+    t14 = 0.04478207159761359 * t2;
+    t8 = 0.8038568606172173 * t6;
+    t13 = t14 + t8;
+    t0 = x[86];
+    t3 = 0.0243908300690247 * t0;
+    t9 = x[273];
+    t11 = 0.07605946082798594 * t9;
+    t12 = t3 - t11;
+    t7 = x[446];
+    t10 = 0.07292566451690818 * t7;
+    t2 = x[633];
+    t6 = 0.0003636133682961057 * t2;
+    t14 = t10 + t6;
+    t8 = C53 * t12;
+    t0 = (-C54) * t14;
+    t9 = t8 + t0;
+    t3 = (-C54) * t12;
+    t11 = (-C53) * t14;
+    t7 = t3 + t11;
+    t2 = t1 + t9;
+    t10 = t13 + t7;
+    t6 = C8 * t2;
+    t8 = t4 - t6;
+    t0 = C8 * t10;
+    t12 = t5 - t0;
+    t14 = t1 - t9;
+    t3 = C9 * t14;
+    t11 = t13 - t7;
+    t6 = C9 * t11;
+    t0 = t4 + t2;
+    t1 = t5 + t10;
+    t9 = t8 + t6;
+    t14 = t12 - t3;
+    t13 = t8 - t6;
+    t7 = t12 + t3;
+    t11 = t9 + t14;
+    t4 = C15 * t11;
+    t2 = t9 * (-C16);
+    t5 = t14 * (-C17);
+    t10 = t4 - t5;
+    t8 = t4 + t2;
+    t6 = t13 + t7;
+    t12 = (-C22) * t6;
+    t3 = t13 * C23;
+    t11 = t7 * (-C24);
+    t9 = t12 - t11;
+    t14 = t12 + t3;
+    re[13] = t0;
+    im[13] = t1;
+    re[73] = t10;
+    im[73] = t8;
+    re[133] = t9;
+    im[133] = t14;
+    t5 = re[153];
+    t4 = im[153];
+    t2 = re[173];
+    t6 = im[173];
+    t13 = re[13];
+    t7 = im[13];
+    t11 = t2 + t13;
+    t12 = t6 + t7;
+    t3 = C8 * t11;
+    t0 = t5 - t3;
+    t1 = C8 * t12;
+    t10 = t4 - t1;
+    t8 = t2 - t13;
+    t9 = C9 * t8;
+    t14 = t6 - t7;
+    t3 = C9 * t14;
+    t1 = t5 + t11;
+    t2 = t4 + t12;
+    t13 = t0 + t3;
+    t8 = t10 - t9;
+    t6 = t0 - t3;
+    t7 = t10 + t9;
+    re[153] = t1;
+    im[153] = t2;
+    re[173] = t13;
+    im[173] = t8;
+    re[13] = t6;
+    im[13] = t7;
+    t14 = re[33];
+    t5 = im[33];
+    t11 = re[53];
+    t4 = im[53];
+    t12 = re[73];
+    t0 = im[73];
+    t3 = t11 + t12;
+    t10 = t4 + t0;
+    t9 = C8 * t3;
+    t1 = t14 - t9;
+    t2 = C8 * t10;
+    t13 = t5 - t2;
+    t8 = t11 - t12;
+    t6 = C9 * t8;
+    t7 = t4 - t0;
+    t9 = C9 * t7;
+    t2 = t14 + t3;
+    t11 = t5 + t10;
+    t12 = t1 + t9;
+    t8 = t13 - t6;
+    t4 = t1 - t9;
+    t0 = t13 + t6;
+    re[33] = t2;
+    im[33] = t11;
+    re[53] = t12;
+    im[53] = t8;
+    re[73] = t4;
+    im[73] = t0;
+    t7 = re[93];
+    t14 = im[93];
+    t3 = re[113];
+    t5 = im[113];
+    t10 = re[133];
+    t1 = im[133];
+    t9 = t3 + t10;
+    t13 = t5 + t1;
+    t6 = C8 * t9;
+    t2 = t7 - t6;
+    t11 = C8 * t13;
+    t12 = t14 - t11;
+    t8 = t3 - t10;
+    t4 = C9 * t8;
+    t0 = t5 - t1;
+    t6 = C9 * t0;
+    t11 = t7 + t9;
+    t3 = t14 + t13;
+    t10 = t2 + t6;
+    t8 = t12 - t4;
+    t5 = t2 - t6;
+    t1 = t12 + t4;
+    re[93] = t11;
+    im[93] = t3;
+    re[113] = t10;
+    im[113] = t8;
+    re[133] = t5;
+    im[133] = t1;
+    t0 = x[521];
+    t7 = 0.04889876535334858 * t0;
+    t9 = x[558];
+    t14 = 0.02739198624153461 * t9;
+    t13 = t7 + t14;
+    t2 = x[161];
+    t6 = 0.06553374995687641 * t2;
+    t12 = x[198];
+    t4 = 0.07690288192773581 * t12;
+    t11 = t6 - t4;
+    t3 = (-C55) * t13;
+    t10 = C56 * t11;
+    t8 = t3 + t10;
+    t5 = C56 * t13;
+    t1 = C55 * t11;
+    t0 = t5 + t1;
+    t9 = x[401];
+    t7 = x[41];
+    t14 = 0.005828892956762125 * t7;
+    t2 = x[318];
+    t12 = 0.07378534815077109 * t2;
+    t6 = t14 - t12;
+    t4 = (-0.062051327809991765) * t9;
+    t3 = 0.5664062369248328 * t6;
+    t10 = t4 + t3;
+    t13 = 0.04264669605975408 * t9;
+    t11 = 0.8241261886220156 * t6;
+    t5 = t13 + t11;
+    t1 = x[78];
+    t7 = 0.020256980411977373 * t1;
+    t2 = x[281];
+    t14 = 0.07535970330966202 * t2;
+    t12 = t7 - t14;
+    t4 = x[438];
+    t3 = 0.4305110968082951 * t12;
+    t9 = (-0.06653904501491921) * t4;
+    t6 = t3 + t9;
+    t13 = (-0.9025852843498606) * t12;
+    t11 = (-0.03173749644121794) * t4;
+    t1 = t13 + t11;
+    t2 = t10 + t6;
+    t7 = t5 + t1;
+    t14 = C8 * t2;
+    t3 = t8 - t14;
+    t9 = C8 * t7;
+    t12 = t0 - t9;
+    t4 = t10 - t6;
+    t13 = C9 * t4;
+    t11 = t5 - t1;
+    t14 = C9 * t11;
+    t9 = t8 + t2;
+    t10 = t0 + t7;
+    t6 = t3 + t14;
+    t4 = t12 - t13;
+    t5 = t3 - t14;
+    t1 = t12 + t13;
+    re[9] = t9;
+    im[9] = t10;
+    re[69] = t6;
+    im[69] = t4;
+    re[129] = t5;
+    im[129] = t1;
+    t11 = x[481];
+    t8 = 0.06599019419307889 * t11;
+    t2 = x[598];
+    t0 = 0.007698836753981549 * t2;
+    t7 = t8 + t0;
+    t3 = x[121];
+    t14 = 0.04451574105757036 * t3;
+    t12 = x[238];
+    t13 = 0.0789941020164104 * t12;
+    t9 = t14 - t13;
+    t10 = (-C57) * t7;
+    t6 = C58 * t9;
+    t4 = t10 + t6;
+    t5 = C58 * t7;
+    t1 = C57 * t9;
+    t11 = t5 + t1;
+    t2 = x[361];
+    t8 = x[1];
+    t0 = 0.00016459314335602588 * t8;
+    t3 = x[358];
+    t12 = 0.07449046842735706 * t3;
+    t14 = t0 - t12;
+    t13 = (-0.05319475872493986) * t2;
+    t10 = 0.7009092642998509 * t14;
+    t6 = t13 + t10;
+    t7 = 0.05227434381109788 * t2;
+    t9 = 0.7132504491541816 * t14;
+    t5 = t7 + t9;
+    t1 = x[118];
+    t8 = 0.04275189667372712 * t1;
+    t3 = x[241];
+    t0 = 0.07883322950726442 * t3;
+    t12 = t8 - t0;
+    t13 = x[478];
+    t10 = 0.0668621636659968 * t13;
+    t2 = x[601];
+    t14 = 0.006656903764848652 * t2;
+    t7 = t10 + t14;
+    t9 = C59 * t12;
+    t1 = (-C60) * t7;
+    t3 = t9 + t1;
+    t8 = (-C60) * t12;
+    t0 = (-C59) * t7;
+    t13 = t8 + t0;
+    t2 = t6 + t3;
+    t10 = t5 + t13;
+    t14 = C8 * t2;
+    t9 = t4 - t14;
+    t1 = C8 * t10;
+    t12 = t11 - t1;
+    t7 = t6 - t3;
+    t8 = C9 * t7;
+    t0 = t5 - t13;
+    t14 = C9 * t0;
+    t1 = t4 + t2;
+    t6 = t11 + t10;
+    t3 = t9 + t14;
+    t7 = t12 - t8;
+    t5 = t9 - t14;
+    t13 = t12 + t8;
+    t0 = t3 + t7;
+    t4 = C12 * t0;
+    t2 = t3 * (-C13);
+    t11 = t7 * C14;
+    t10 = t4 - t11;
+    t9 = t4 + t2;
+    t14 = t5 + t13;
+    t12 = C15 * t14;
+    t8 = t5 * (-C16);
+    t0 = t13 * (-C17);
+    t3 = t12 - t0;
+    t7 = t12 + t8;
+    re[29] = t1;
+    im[29] = t6;
+    re[89] = t10;
+    im[89] = t9;
+    re[149] = t3;
+    im[149] = t7;
+    t11 = x[441];
+    t4 = x[81];
+    t2 = 0.02177426790135979 * t4;
+    t14 = x[278];
+    t5 = 0.07562514791656519 * t14;
+    t13 = t2 - t5;
+    t0 = (-0.06684734553294322) * t11;
+    t12 = 0.41469324265623897 * t13;
+    t8 = t0 + t12;
+    t1 = 0.03046409047202106 * t11;
+    t6 = 0.9099612708765432 * t13;
+    t10 = t1 + t6;
+    t9 = x[38];
+    t3 = 0.005052872047437409 * t9;
+    t7 = x[321];
+    t4 = 0.07377655542946078 * t7;
+    t14 = t3 - t4;
+    t2 = x[398];
+    t5 = 0.5807029557109398 * t14;
+    t0 = (-0.061304895092219924) * t2;
+    t12 = t5 + t0;
+    t11 = (-0.8141155183563192) * t14;
+    t13 = (-0.04372835669743362) * t2;
+    t1 = t11 + t13;
+    t6 = x[158];
+    t9 = 0.06421324136700357 * t6;
+    t7 = x[201];
+    t3 = 0.07740250729577286 * t7;
+    t4 = t9 - t3;
+    t5 = x[518];
+    t0 = 0.050495641314265864 * t5;
+    t14 = x[561];
+    t2 = 0.02564994813000861 * t14;
+    t11 = t0 + t2;
+    t13 = C61 * t4;
+    t6 = (-C62) * t11;
+    t7 = t13 + t6;
+    t9 = (-C62) * t4;
+    t3 = (-C61) * t11;
+    t5 = t9 + t3;
+    t14 = t12 + t7;
+    t0 = t1 + t5;
+    t2 = C8 * t14;
+    t13 = t8 - t2;
+    t6 = C8 * t0;
+    t4 = t10 - t6;
+    t11 = t12 - t7;
+    t9 = C9 * t11;
+    t3 = t1 - t5;
+    t2 = C9 * t3;
+    t6 = t8 + t14;
+    t12 = t10 + t0;
+    t7 = t13 + t2;
+    t11 = t4 - t9;
+    t1 = t13 - t2;
+    t5 = t4 + t9;
+    t3 = t7 + t11;
+    t8 = C15 * t3;
+    t14 = t7 * (-C16);
+    t10 = t11 * (-C17);
+    t0 = t8 - t10;
+    t13 = t8 + t14;
+    t2 = t1 + t5;
+    t4 = (-C22) * t2;
+    t9 = t1 * C23;
+    t3 = t5 * (-C24);
+    t7 = t4 - t3;
+    t11 = t4 + t9;
+    re[49] = t6;
+    im[49] = t12;
+    re[109] = t0;
+    im[109] = t13;
+    re[169] = t7;
+    im[169] = t11;
+    t10 = re[9];
+    t8 = im[9];
+    t14 = re[29];
+    t2 = im[29];
+    t1 = re[49];
+    t5 = im[49];
+    t3 = t14 + t1;
+    t4 = t2 + t5;
+    t9 = C8 * t3;
+    t6 = t10 - t9;
+    t12 = C8 * t4;
+    t0 = t8 - t12;
+    t13 = t14 - t1;
+    t7 = C9 * t13;
+    t11 = t2 - t5;
+    t9 = C9 * t11;
+    t12 = t10 + t3;
+    t14 = t8 + t4;
+    t1 = t6 + t9;
+    t13 = t0 - t7;
+    t2 = t6 - t9;
+    t5 = t0 + t7;
+    re[9] = t12;
+    im[9] = t14;
+    re[29] = t1;
+    im[29] = t13;
+    re[49] = t2;
+    im[49] = t5;
+    t11 = re[69];
+    t10 = im[69];
+    t3 = re[89];
+    t8 = im[89];
+    t4 = re[109];
+    t6 = im[109];
+    t9 = t3 + t4;
+    t0 = t8 + t6;
+    t7 = C8 * t9;
+    t12 = t11 - t7;
+    t14 = C8 * t0;
+    t1 = t10 - t14;
+    t13 = t3 - t4;
+    t2 = C9 * t13;
+    t5 = t8 - t6;
+    t7 = C9 * t5;
+    t14 = t11 + t9;
+    t3 = t10 + t0;
+    t4 = t12 + t7;
+    t13 = t1 - t2;
+    t8 = t12 - t7;
+    t6 = t1 + t2;
+    re[69] = t14;
+    im[69] = t3;
+    re[89] = t4;
+    im[89] = t13;
+    re[109] = t8;
+    im[109] = t6;
+    t5 = re[129];
+    t11 = im[129];
+    t9 = re[149];
+    t10 = im[149];
+    t0 = re[169];
+    t12 = im[169];
+    t7 = t9 + t0;
+    t1 = t10 + t12;
+    t2 = C8 * t7;
+    t14 = t5 - t2;
+    t3 = C8 * t1;
+    t4 = t11 - t3;
+    t13 = t9 - t0;
+    t8 = C9 * t13;
+    t6 = t10 - t12;
+    t2 = C9 * t6;
+    t3 = t5 + t7;
+    t9 = t11 + t1;
+    t0 = t14 + t2;
+    t13 = t4 - t8;
+    t10 = t14 - t2;
+    t12 = t4 + t8;
+    re[129] = t3;
+    im[129] = t9;
+    re[149] = t0;
+    im[149] = t13;
+    re[169] = t10;
+    im[169] = t12;
+    t6 = re[45];
+    t5 = im[45];
+    t7 = re[81];
+    t11 = im[81];
+    t1 = re[117];
+    t14 = im[117];
+    t2 = re[153];
+    t4 = im[153];
+    t8 = re[9];
+    t3 = im[9];
+    t9 = t7 + t8;
+    t0 = t11 + t3;
+    t13 = t1 + t2;
+    t10 = t14 + t4;
+    t12 = t7 - t8;
+    t7 = t11 - t3;
+    t8 = t1 - t2;
+    t11 = t14 - t4;
+    t3 = t9 + t13;
+    t1 = t0 + t10;
+    t2 = t9 - t13;
+    t14 = C0 * t2;
+    t4 = t0 - t10;
+    t9 = C0 * t4;
+    t13 = C1 * t3;
+    t2 = t6 - t13;
+    t0 = C1 * t1;
+    t10 = t5 - t0;
+    t4 = t2 + t14;
+    t13 = t10 + t9;
+    t0 = t2 - t14;
+    t2 = t10 - t9;
+    t14 = C2 * t12;
+    t10 = C3 * t8;
+    t9 = t14 + t10;
+    t14 = C2 * t7;
+    t10 = C3 * t11;
+    t14 = t14 + t10;
+    t10 = C3 * t12;
+    t12 = C2 * t8;
+    t8 = t10 - t12;
+    t10 = C3 * t7;
+    t12 = C2 * t11;
+    t7 = t10 - t12;
+    t11 = t6 + t3;
+    t10 = t5 + t1;
+    t12 = t4 + t14;
+    t6 = t13 - t9;
+    t3 = t0 + t7;
+    t5 = t2 - t8;
+    t1 = t0 - t7;
+    t0 = t2 + t8;
+    t7 = t4 - t14;
+    t2 = t13 + t9;
+    re[45] = t11;
+    im[45] = t10;
+    re[81] = t12;
+    im[81] = t6;
+    re[117] = t3;
+    im[117] = t5;
+    re[153] = t1;
+    im[153] = t0;
+    re[9] = t7;
+    im[9] = t2;
+    t8 = re[105];
+    t4 = im[105];
+    t14 = re[141];
+    t13 = im[141];
+    t9 = re[177];
+    t11 = im[177];
+    t10 = re[33];
+    t12 = im[33];
+    t6 = re[69];
+    t3 = im[69];
+    t5 = t14 + t6;
+    t1 = t13 + t3;
+    t0 = t9 + t10;
+    t7 = t11 + t12;
+    t2 = t14 - t6;
+    t14 = t13 - t3;
+    t6 = t9 - t10;
+    t13 = t11 - t12;
+    t3 = t5 + t0;
+    t9 = t1 + t7;
+    t10 = t5 - t0;
+    t11 = C0 * t10;
+    t12 = t1 - t7;
+    t5 = C0 * t12;
+    t0 = C1 * t3;
+    t10 = t8 - t0;
+    t1 = C1 * t9;
+    t7 = t4 - t1;
+    t12 = t10 + t11;
+    t0 = t7 + t5;
+    t1 = t10 - t11;
+    t10 = t7 - t5;
+    t11 = C2 * t2;
+    t7 = C3 * t6;
+    t5 = t11 + t7;
+    t11 = C2 * t14;
+    t7 = C3 * t13;
+    t11 = t11 + t7;
+    t7 = C3 * t2;
+    t2 = C2 * t6;
+    t6 = t7 - t2;
+    t7 = C3 * t14;
+    t2 = C2 * t13;
+    t14 = t7 - t2;
+    t13 = t8 + t3;
+    t7 = t4 + t9;
+    t2 = t12 + t11;
+    t8 = t0 - t5;
+    t3 = t1 + t14;
+    t4 = t10 - t6;
+    t9 = t1 - t14;
+    t1 = t10 + t6;
+    t14 = t12 - t11;
+    t10 = t0 + t5;
+    re[105] = t13;
+    im[105] = t7;
+    re[141] = t2;
+    im[141] = t8;
+    re[177] = t3;
+    im[177] = t4;
+    re[33] = t9;
+    im[33] = t1;
+    re[69] = t14;
+    im[69] = t10;
+    t6 = re[165];
+    t12 = im[165];
+    t11 = re[21];
+    t0 = im[21];
+    t5 = re[57];
+    t13 = im[57];
+    t7 = re[93];
+    t2 = im[93];
+    t8 = re[129];
+    t3 = im[129];
+    t4 = t11 + t8;
+    t9 = t0 + t3;
+    t1 = t5 + t7;
+    t14 = t13 + t2;
+    t10 = t11 - t8;
+    t11 = t0 - t3;
+    t8 = t5 - t7;
+    t0 = t13 - t2;
+    t3 = t4 + t1;
+    t5 = t9 + t14;
+    t7 = t4 - t1;
+    t13 = C0 * t7;
+    t2 = t9 - t14;
+    t4 = C0 * t2;
+    t1 = C1 * t3;
+    t7 = t6 - t1;
+    t9 = C1 * t5;
+    t14 = t12 - t9;
+    t2 = t7 + t13;
+    t1 = t14 + t4;
+    t9 = t7 - t13;
+    t7 = t14 - t4;
+    t13 = C2 * t10;
+    t14 = C3 * t8;
+    t4 = t13 + t14;
+    t13 = C2 * t11;
+    t14 = C3 * t0;
+    t13 = t13 + t14;
+    t14 = C3 * t10;
+    t10 = C2 * t8;
+    t8 = t14 - t10;
+    t14 = C3 * t11;
+    t10 = C2 * t0;
+    t11 = t14 - t10;
+    t0 = t6 + t3;
+    t14 = t12 + t5;
+    t10 = t2 + t13;
+    t6 = t1 - t4;
+    t3 = t9 + t11;
+    t12 = t7 - t8;
+    t5 = t9 - t11;
+    t9 = t7 + t8;
+    t11 = t2 - t13;
+    t7 = t1 + t4;
+    re[165] = t0;
+    im[165] = t14;
+    re[21] = t10;
+    im[21] = t6;
+    re[57] = t3;
+    im[57] = t12;
+    re[93] = t5;
+    im[93] = t9;
+    re[129] = t11;
+    im[129] = t7;
+    t8 = re[65];
+    t2 = im[65];
+    t13 = re[101];
+    t1 = im[101];
+    t4 = re[137];
+    t0 = im[137];
+    t14 = re[173];
+    t10 = im[173];
+    t6 = re[29];
+    t3 = im[29];
+    t12 = t13 + t6;
+    t5 = t1 + t3;
+    t9 = t4 + t14;
+    t11 = t0 + t10;
+    t7 = t13 - t6;
+    t13 = t1 - t3;
+    t6 = t4 - t14;
+    t1 = t0 - t10;
+    t3 = t12 + t9;
+    t4 = t5 + t11;
+    t14 = t12 - t9;
+    t0 = C0 * t14;
+    t10 = t5 - t11;
+    t12 = C0 * t10;
+    t9 = C1 * t3;
+    t14 = t8 - t9;
+    t5 = C1 * t4;
+    t11 = t2 - t5;
+    t10 = t14 + t0;
+    t9 = t11 + t12;
+    t5 = t14 - t0;
+    t14 = t11 - t12;
+    t0 = C2 * t7;
+    t11 = C3 * t6;
+    t12 = t0 + t11;
+    t0 = C2 * t13;
+    t11 = C3 * t1;
+    t0 = t0 + t11;
+    t11 = C3 * t7;
+    t7 = C2 * t6;
+    t6 = t11 - t7;
+    t11 = C3 * t13;
+    t7 = C2 * t1;
+    t13 = t11 - t7;
+    t1 = t8 + t3;
+    t11 = t2 + t4;
+    t7 = t10 + t0;
+    t8 = t9 - t12;
+    t3 = t5 + t13;
+    t2 = t14 - t6;
+    t4 = t5 - t13;
+    t5 = t14 + t6;
+    t13 = t10 - t0;
+    t14 = t9 + t12;
+    re[65] = t1;
+    im[65] = t11;
+    re[101] = t7;
+    im[101] = t8;
+    re[137] = t3;
+    im[137] = t2;
+    re[173] = t4;
+    im[173] = t5;
+    re[29] = t13;
+    im[29] = t14;
+    t6 = re[125];
+    t10 = im[125];
+    t0 = re[161];
+    t9 = im[161];
+    t12 = re[17];
+    t1 = im[17];
+    t11 = re[53];
+    t7 = im[53];
+    t8 = re[89];
+    t3 = im[89];
+    t2 = t0 + t8;
+    t4 = t9 + t3;
+    t5 = t12 + t11;
+    t13 = t1 + t7;
+    t14 = t0 - t8;
+    t0 = t9 - t3;
+    t8 = t12 - t11;
+    t9 = t1 - t7;
+    t3 = t2 + t5;
+    t12 = t4 + t13;
+    t11 = t2 - t5;
+    t1 = C0 * t11;
+    t7 = t4 - t13;
+    t2 = C0 * t7;
+    t5 = C1 * t3;
+    t11 = t6 - t5;
+    t4 = C1 * t12;
+    t13 = t10 - t4;
+    t7 = t11 + t1;
+    t5 = t13 + t2;
+    t4 = t11 - t1;
+    t11 = t13 - t2;
+    t1 = C2 * t14;
+    t13 = C3 * t8;
+    t2 = t1 + t13;
+    t1 = C2 * t0;
+    t13 = C3 * t9;
+    t1 = t1 + t13;
+    t13 = C3 * t14;
+    t14 = C2 * t8;
+    t8 = t13 - t14;
+    t13 = C3 * t0;
+    t14 = C2 * t9;
+    t0 = t13 - t14;
+    t9 = t6 + t3;
+    t13 = t10 + t12;
+    t14 = t7 + t1;
+    t6 = t5 - t2;
+    t3 = t4 + t0;
+    t10 = t11 - t8;
+    t12 = t4 - t0;
+    t4 = t11 + t8;
+    t0 = t7 - t1;
+    t11 = t5 + t2;
+    re[125] = t9;
+    im[125] = t13;
+    re[161] = t14;
+    im[161] = t6;
+    re[17] = t3;
+    im[17] = t10;
+    re[53] = t12;
+    im[53] = t4;
+    re[89] = t0;
+    im[89] = t11;
+}
+
+/**
+ *  Part 3 of ApplyWindowedMDCT_W75_360().
+ * 
+ *  @param {Number[]} x 
+ *    - The input block (720 points).
+ *  @param {Number[]} X 
+ *    - The array that would contain the output block (360 points).
+ *  @param {Number[]} re 
+ *    - The scratch buffer (real part, 180 points).
+ *  @param {Number[]} im 
+ *    - The scratch buffer (imaginary part, 180 points).
+ */
+function ApplyWindowedMDCT_W75_360_Part3(x, X, re, im) {
+    let t0, t1, t10, t11, t12, t13, t14, t2, t3, t4, t5, t6, t7, t8, t9;
+    const C0 = 0.5590169943749475;
+    const C1 = 0.25;
+    const C2 = 0.9510565162951535;
+    const C3 = 0.5877852522924731;
+    const C4 = 0.25881904510252074;
+    const C5 = 0.9659258262890683;
+    const C6 = 0.5;
+    const C7 = 0.8660254037844386;
+    const C8 = 0.573576436351046;
+    const C9 = 0.8191520442889918;
+    const C10 = 0.08715574274765817;
+    const C11 = 0.9961946980917455;
+    const C12 = 0.42261826174069944;
+    const C13 = 0.9063077870366499;
+    const C14 = 0.766044443118978;
+    const C15 = 1.4088320528055172;
+    const C16 = 0.12325683343243876;
+    const C17 = 0.17364817766693033;
+    const C18 = 1.1584559306791384;
+    const C19 = 0.8111595753452777;
+    const C20 = 0.9396926207859084;
+    const C21 = 0.5976724774602398;
+    const C22 = 1.281712764111577;
+    const C23 = 0.45399049973954675;
+    const C24 = 0.8910065241883679;
+    const C25 = 0.9986295347545738;
+    const C26 = 0.05233595624294383;
+    const C27 = 0.544639035015027;
+    const C28 = 0.838670567945424;
+    const C29 = 0.2923717047227367;
+    const C30 = 0.9563047559630355;
+    const C31 = 0.9743700647852352;
+    const C32 = 0.22495105434386498;
+    const C33 = 0.6819983600624985;
+    const C34 = 0.7313537016191705;
+    const C35 = 0.12186934340514748;
+    const C36 = 0.992546151641322;
+    const C37 = 0.9205048534524404;
+    const C38 = 0.3907311284892737;
+    const C39 = 0.6018150231520483;
+    const C40 = 0.7986355100472928;
+    const C41 = 0.15643446504023087;
+    const C42 = 0.9876883405951378;
+    const C43 = 0.9335804264972017;
+    const C44 = 0.35836794954530027;
+    const C45 = 0.6293203910498375;
+    const C46 = 0.7771459614569709;
+    const C47 = 0.9998476951563913;
+    const C48 = 0.01745240643728351;
+    const C49 = 0.5150380749100542;
+    const C50 = 0.8571673007021123;
+    const C51 = 0.48480962024633706;
+    const C52 = 0.8746197071393957;
+    const C53 = 0.981627183447664;
+    const C54 = 0.1908089953765448;
+    const C55 = 0.6560590289905073;
+    const C56 = 0.754709580222772;
+    const C57 = 0.3255681544571567;
+    const C58 = 0.9455185755993168;
+    t8 = re[5];
+    t7 = im[5];
+    t1 = re[41];
+    t5 = im[41];
+    t2 = re[77];
+    t9 = im[77];
+    t13 = re[113];
+    t14 = im[113];
+    t6 = re[149];
+    t3 = im[149];
+    t10 = t1 + t6;
+    t12 = t5 + t3;
+    t4 = t2 + t13;
+    t0 = t9 + t14;
+    t11 = t1 - t6;
+    t1 = t5 - t3;
+    t6 = t2 - t13;
+    t5 = t9 - t14;
+    t3 = t10 + t4;
+    t2 = t12 + t0;
+    t13 = t10 - t4;
+    t9 = C0 * t13;
+    t14 = t12 - t0;
+    t10 = C0 * t14;
+    t4 = C1 * t3;
+    t13 = t8 - t4;
+    t12 = C1 * t2;
+    t0 = t7 - t12;
+    t14 = t13 + t9;
+    t4 = t0 + t10;
+    t12 = t13 - t9;
+    t13 = t0 - t10;
+    t9 = C2 * t11;
+    t0 = C3 * t6;
+    t10 = t9 + t0;
+    t9 = C2 * t1;
+    t0 = C3 * t5;
+    t9 = t9 + t0;
+    t0 = C3 * t11;
+    t11 = C2 * t6;
+    t6 = t0 - t11;
+    t0 = C3 * t1;
+    t11 = C2 * t5;
+    t1 = t0 - t11;
+    t5 = t8 + t3;
+    t0 = t7 + t2;
+    t11 = t14 + t9;
+    t8 = t4 - t10;
+    t3 = t12 + t1;
+    t7 = t13 - t6;
+    t2 = t12 - t1;
+    t12 = t13 + t6;
+    t1 = t14 - t9;
+    t13 = t4 + t10;
+    re[5] = t5;
+    im[5] = t0;
+    re[41] = t11;
+    im[41] = t8;
+    re[77] = t3;
+    im[77] = t7;
+    re[113] = t2;
+    im[113] = t12;
+    re[149] = t1;
+    im[149] = t13;
+    t6 = re[85];
+    t14 = im[85];
+    t9 = re[121];
+    t4 = im[121];
+    t10 = re[157];
+    t5 = im[157];
+    t0 = re[13];
+    t11 = im[13];
+    t8 = re[49];
+    t3 = im[49];
+    t7 = t9 + t8;
+    t2 = t4 + t3;
+    t12 = t10 + t0;
+    t1 = t5 + t11;
+    t13 = t9 - t8;
+    t9 = t4 - t3;
+    t8 = t10 - t0;
+    t4 = t5 - t11;
+    t3 = t7 + t12;
+    t10 = t2 + t1;
+    t0 = t7 - t12;
+    t5 = C0 * t0;
+    t11 = t2 - t1;
+    t7 = C0 * t11;
+    t12 = C1 * t3;
+    t0 = t6 - t12;
+    t2 = C1 * t10;
+    t1 = t14 - t2;
+    t11 = t0 + t5;
+    t12 = t1 + t7;
+    t2 = t0 - t5;
+    t0 = t1 - t7;
+    t5 = C2 * t13;
+    t1 = C3 * t8;
+    t7 = t5 + t1;
+    t5 = C2 * t9;
+    t1 = C3 * t4;
+    t5 = t5 + t1;
+    t1 = C3 * t13;
+    t13 = C2 * t8;
+    t8 = t1 - t13;
+    t1 = C3 * t9;
+    t13 = C2 * t4;
+    t9 = t1 - t13;
+    t4 = t6 + t3;
+    t1 = t14 + t10;
+    t13 = t11 + t5;
+    t6 = t12 - t7;
+    t3 = t2 + t9;
+    t14 = t0 - t8;
+    t10 = t2 - t9;
+    t2 = t0 + t8;
+    t9 = t11 - t5;
+    t0 = t12 + t7;
+    re[85] = t4;
+    im[85] = t1;
+    re[121] = t13;
+    im[121] = t6;
+    re[157] = t3;
+    im[157] = t14;
+    re[13] = t10;
+    im[13] = t2;
+    re[49] = t9;
+    im[49] = t0;
+    t8 = re[145];
+    t11 = im[145];
+    t5 = re[1];
+    t12 = im[1];
+    t7 = re[37];
+    t4 = im[37];
+    t1 = re[73];
+    t13 = im[73];
+    t6 = re[109];
+    t3 = im[109];
+    t14 = t5 + t6;
+    t10 = t12 + t3;
+    t2 = t7 + t1;
+    t9 = t4 + t13;
+    t0 = t5 - t6;
+    t5 = t12 - t3;
+    t6 = t7 - t1;
+    t12 = t4 - t13;
+    t3 = t14 + t2;
+    t7 = t10 + t9;
+    t1 = t14 - t2;
+    t4 = C0 * t1;
+    t13 = t10 - t9;
+    t14 = C0 * t13;
+    t2 = C1 * t3;
+    t1 = t8 - t2;
+    t10 = C1 * t7;
+    t9 = t11 - t10;
+    t13 = t1 + t4;
+    t2 = t9 + t14;
+    t10 = t1 - t4;
+    t1 = t9 - t14;
+    t4 = C2 * t0;
+    t9 = C3 * t6;
+    t14 = t4 + t9;
+    t4 = C2 * t5;
+    t9 = C3 * t12;
+    t4 = t4 + t9;
+    t9 = C3 * t0;
+    t0 = C2 * t6;
+    t6 = t9 - t0;
+    t9 = C3 * t5;
+    t0 = C2 * t12;
+    t5 = t9 - t0;
+    t12 = t8 + t3;
+    t9 = t11 + t7;
+    t0 = t13 + t4;
+    t8 = t2 - t14;
+    t3 = t10 + t5;
+    t11 = t1 - t6;
+    t7 = t10 - t5;
+    t10 = t1 + t6;
+    t5 = t13 - t4;
+    t1 = t2 + t14;
+    re[145] = t12;
+    im[145] = t9;
+    re[1] = t0;
+    im[1] = t8;
+    re[37] = t3;
+    im[37] = t11;
+    re[73] = t7;
+    im[73] = t10;
+    re[109] = t5;
+    im[109] = t1;
+    t6 = re[25];
+    t13 = im[25];
+    t4 = re[61];
+    t2 = im[61];
+    t14 = re[97];
+    t12 = im[97];
+    t9 = re[133];
+    t0 = im[133];
+    t8 = re[169];
+    t3 = im[169];
+    t11 = t4 + t8;
+    t7 = t2 + t3;
+    t10 = t14 + t9;
+    t5 = t12 + t0;
+    t1 = t4 - t8;
+    t4 = t2 - t3;
+    t8 = t14 - t9;
+    t2 = t12 - t0;
+    t3 = t11 + t10;
+    t14 = t7 + t5;
+    t9 = t11 - t10;
+    t12 = C0 * t9;
+    t0 = t7 - t5;
+    t11 = C0 * t0;
+    t10 = C1 * t3;
+    t9 = t6 - t10;
+    t7 = C1 * t14;
+    t5 = t13 - t7;
+    t0 = t9 + t12;
+    t10 = t5 + t11;
+    t7 = t9 - t12;
+    t9 = t5 - t11;
+    t12 = C2 * t1;
+    t5 = C3 * t8;
+    t11 = t12 + t5;
+    t12 = C2 * t4;
+    t5 = C3 * t2;
+    t12 = t12 + t5;
+    t5 = C3 * t1;
+    t1 = C2 * t8;
+    t8 = t5 - t1;
+    t5 = C3 * t4;
+    t1 = C2 * t2;
+    t4 = t5 - t1;
+    t2 = t6 + t3;
+    t5 = t13 + t14;
+    t1 = t0 + t12;
+    t6 = t10 - t11;
+    t3 = t7 + t4;
+    t13 = t9 - t8;
+    t14 = t7 - t4;
+    t7 = t9 + t8;
+    t4 = t0 - t12;
+    t9 = t10 + t11;
+    re[25] = t2;
+    im[25] = t5;
+    re[61] = t1;
+    im[61] = t6;
+    re[97] = t3;
+    im[97] = t13;
+    re[133] = t14;
+    im[133] = t7;
+    re[169] = t4;
+    im[169] = t9;
+    t8 = x[0];
+    t0 = 0.00012831502283879977 * t8;
+    t12 = x[359];
+    t10 = 0.07452056147476713 * t12;
+    t11 = t0 - t10;
+    t2 = x[360];
+    t5 = 0.7071067811865476 * t11;
+    t1 = (-0.052715263128044025) * t2;
+    t6 = t5 + t1;
+    t3 = (-0.7071067811865475) * t11;
+    t13 = (-0.05271526312804403) * t2;
+    t14 = t3 + t13;
+    t7 = x[120];
+    t4 = 0.04392864819117198 * t7;
+    t9 = x[239];
+    t8 = 0.078943755942419 * t9;
+    t12 = t4 - t8;
+    t0 = x[480];
+    t10 = 0.06628739149209381 * t0;
+    t5 = x[599];
+    t1 = 0.007343269434112685 * t5;
+    t11 = t10 + t1;
+    t2 = C4 * t12;
+    t3 = (-C5) * t11;
+    t13 = t2 + t3;
+    t7 = (-C5) * t12;
+    t9 = (-C4) * t11;
+    t4 = t7 + t9;
+    t8 = x[479];
+    t0 = 0.06657805925722098 * t8;
+    t5 = x[600];
+    t10 = 0.006995911514090678 * t5;
+    t1 = t0 + t10;
+    t2 = x[119];
+    t3 = 0.04334071171649066 * t2;
+    t12 = x[240];
+    t11 = 0.07889007024276715 * t12;
+    t7 = t3 - t11;
+    t9 = (-C5) * t1;
+    t8 = C4 * t7;
+    t5 = t9 + t8;
+    t0 = C4 * t1;
+    t10 = C5 * t7;
+    t2 = t0 + t10;
+    t12 = t13 + t5;
+    t3 = t4 + t2;
+    t11 = C6 * t12;
+    t9 = t6 - t11;
+    t8 = C6 * t3;
+    t1 = t14 - t8;
+    t7 = t13 - t5;
+    t0 = C7 * t7;
+    t10 = t4 - t2;
+    t11 = C7 * t10;
+    t8 = t6 + t12;
+    t13 = t14 + t3;
+    t5 = t9 + t11;
+    t7 = t1 - t0;
+    t4 = t9 - t11;
+    t2 = t1 + t0;
+    re[90] = t8;
+    im[90] = t13;
+    re[150] = t5;
+    im[150] = t7;
+    re[30] = t4;
+    im[30] = t2;
+    t10 = x[40];
+    t6 = 0.005563419649964133 * t10;
+    t12 = x[319];
+    t14 = 0.07378083030533994 * t12;
+    t3 = t6 - t14;
+    t9 = x[400];
+    t11 = C8 * t3;
+    t1 = (-0.06168058385438133) * t9;
+    t0 = t11 + t1;
+    t8 = (-C9) * t3;
+    t13 = (-0.04318920977601392) * t9;
+    t5 = t8 + t13;
+    t7 = x[160];
+    t4 = 0.0650994518941004 * t7;
+    t2 = x[199];
+    t10 = 0.07707650387176249 * t2;
+    t12 = t4 - t10;
+    t6 = x[520];
+    t14 = 0.04943537917192268 * t6;
+    t11 = x[559];
+    t1 = 0.026808971667655078 * t11;
+    t3 = t14 + t1;
+    t9 = C10 * t12;
+    t8 = (-C11) * t3;
+    t13 = t9 + t8;
+    t7 = (-C11) * t12;
+    t2 = (-C10) * t3;
+    t4 = t7 + t2;
+    t10 = x[439];
+    t6 = x[79];
+    t11 = 0.02075805547774038 * t6;
+    t14 = x[280];
+    t1 = 0.07544569193026901 * t14;
+    t9 = t11 - t1;
+    t8 = (-0.06673731968643595) * t10;
+    t12 = C12 * t9;
+    t3 = t8 + t12;
+    t7 = 0.031120123254523437 * t10;
+    t2 = C13 * t9;
+    t6 = t7 + t2;
+    t14 = t13 + t3;
+    t11 = t4 + t6;
+    t1 = C6 * t14;
+    t8 = t0 - t1;
+    t12 = C6 * t11;
+    t10 = t5 - t12;
+    t9 = t13 - t3;
+    t7 = C7 * t9;
+    t2 = t4 - t6;
+    t1 = C7 * t2;
+    t12 = t0 + t14;
+    t13 = t5 + t11;
+    t3 = t8 + t1;
+    t9 = t10 - t7;
+    t4 = t8 - t1;
+    t6 = t10 + t7;
+    t2 = t3 + t9;
+    t0 = C14 * t2;
+    t14 = t3 * (-C15);
+    t5 = t9 * C16;
+    t11 = t0 - t5;
+    t8 = t0 + t14;
+    t1 = t4 + t6;
+    t10 = C17 * t1;
+    t7 = t4 * (-C18);
+    t2 = t6 * (-C19);
+    t3 = t10 - t2;
+    t9 = t10 + t7;
+    re[110] = t12;
+    im[110] = t13;
+    re[170] = t11;
+    im[170] = t8;
+    re[50] = t3;
+    im[50] = t9;
+    t5 = x[80];
+    t0 = 0.021263859082068726 * t5;
+    t14 = x[279];
+    t1 = 0.07553418105640151 * t14;
+    t4 = t0 - t1;
+    t6 = x[440];
+    t2 = C12 * t4;
+    t10 = (-0.06665913618041411) * t6;
+    t7 = t2 + t10;
+    t12 = (-C13) * t4;
+    t13 = (-0.031083665686924042) * t6;
+    t11 = t12 + t13;
+    t8 = x[519];
+    t3 = 0.0499677992888239 * t8;
+    t9 = x[560];
+    t5 = 0.026228131666691412 * t9;
+    t14 = t3 + t5;
+    t0 = x[159];
+    t1 = 0.06465935512789801 * t0;
+    t2 = x[200];
+    t10 = 0.07724297509017906 * t2;
+    t4 = t1 - t10;
+    t6 = (-C11) * t14;
+    t12 = C10 * t4;
+    t13 = t6 + t12;
+    t8 = C10 * t14;
+    t9 = C11 * t4;
+    t3 = t8 + t9;
+    t5 = x[399];
+    t0 = x[39];
+    t2 = 0.005304756981572133 * t0;
+    t1 = x[320];
+    t10 = 0.07377787855167459 * t1;
+    t6 = t2 - t10;
+    t12 = (-0.0616830516115607) * t5;
+    t14 = C8 * t6;
+    t4 = t12 + t14;
+    t8 = 0.043190937718193385 * t5;
+    t9 = C9 * t6;
+    t0 = t8 + t9;
+    t1 = t13 + t4;
+    t2 = t3 + t0;
+    t10 = C6 * t1;
+    t12 = t7 - t10;
+    t14 = C6 * t2;
+    t5 = t11 - t14;
+    t6 = t13 - t4;
+    t8 = C7 * t6;
+    t9 = t3 - t0;
+    t10 = C7 * t9;
+    t14 = t7 + t1;
+    t13 = t11 + t2;
+    t4 = t12 + t10;
+    t6 = t5 - t8;
+    t3 = t12 - t10;
+    t0 = t5 + t8;
+    t9 = t4 + t6;
+    t7 = C17 * t9;
+    t1 = t4 * (-C18);
+    t11 = t6 * (-C19);
+    t2 = t7 - t11;
+    t12 = t7 + t1;
+    t10 = t3 + t0;
+    t5 = (-C20) * t10;
+    t8 = t3 * C21;
+    t9 = t0 * (-C22);
+    t4 = t5 - t9;
+    t6 = t5 + t8;
+    re[130] = t14;
+    im[130] = t13;
+    re[10] = t2;
+    im[10] = t12;
+    re[70] = t4;
+    im[70] = t6;
+    t11 = re[90];
+    t7 = im[90];
+    t1 = re[110];
+    t10 = im[110];
+    t3 = re[130];
+    t0 = im[130];
+    t9 = t1 + t3;
+    t5 = t10 + t0;
+    t8 = C6 * t9;
+    t14 = t11 - t8;
+    t13 = C6 * t5;
+    t2 = t7 - t13;
+    t12 = t1 - t3;
+    t4 = C7 * t12;
+    t6 = t10 - t0;
+    t8 = C7 * t6;
+    t13 = t11 + t9;
+    t1 = t7 + t5;
+    t3 = t14 + t8;
+    t12 = t2 - t4;
+    t10 = t14 - t8;
+    t0 = t2 + t4;
+    re[90] = t13;
+    im[90] = t1;
+    re[110] = t3;
+    im[110] = t12;
+    re[130] = t10;
+    im[130] = t0;
+    t6 = re[150];
+    t11 = im[150];
+    t9 = re[170];
+    t7 = im[170];
+    t5 = re[10];
+    t14 = im[10];
+    t8 = t9 + t5;
+    t2 = t7 + t14;
+    t4 = C6 * t8;
+    t13 = t6 - t4;
+    t1 = C6 * t2;
+    t3 = t11 - t1;
+    t12 = t9 - t5;
+    t10 = C7 * t12;
+    t0 = t7 - t14;
+    t4 = C7 * t0;
+    t1 = t6 + t8;
+    t9 = t11 + t2;
+    t5 = t13 + t4;
+    t12 = t3 - t10;
+    t7 = t13 - t4;
+    t14 = t3 + t10;
+    re[150] = t1;
+    im[150] = t9;
+    re[170] = t5;
+    im[170] = t12;
+    re[10] = t7;
+    im[10] = t14;
+    t0 = re[30];
+    t6 = im[30];
+    t8 = re[50];
+    t11 = im[50];
+    t2 = re[70];
+    t13 = im[70];
+    t4 = t8 + t2;
+    t3 = t11 + t13;
+    t10 = C6 * t4;
+    t1 = t0 - t10;
+    t9 = C6 * t3;
+    t5 = t6 - t9;
+    t12 = t8 - t2;
+    t7 = C7 * t12;
+    t14 = t11 - t13;
+    t10 = C7 * t14;
+    t9 = t0 + t4;
+    t8 = t6 + t3;
+    t2 = t1 + t10;
+    t12 = t5 - t7;
+    t11 = t1 - t10;
+    t13 = t5 + t7;
+    re[30] = t9;
+    im[30] = t8;
+    re[50] = t2;
+    im[50] = t12;
+    re[70] = t11;
+    im[70] = t13;
+    t14 = x[72];
+    t0 = 0.0173560823152087 * t14;
+    t4 = x[287];
+    t6 = 0.07489499006050511 * t4;
+    t3 = t0 - t6;
+    t1 = x[432];
+    t10 = C23 * t3;
+    t5 = (-0.06609302226346474) * t1;
+    t7 = t10 + t5;
+    t9 = (-C24) * t3;
+    t8 = (-0.03367607687723716) * t1;
+    t2 = t9 + t8;
+    t12 = x[527];
+    t11 = 0.04559496117904212 * t12;
+    t13 = x[552];
+    t14 = 0.0309286123492606 * t13;
+    t4 = t11 + t14;
+    t0 = x[167];
+    t6 = 0.0680104978428295 * t0;
+    t10 = x[192];
+    t5 = 0.07571198972050501 * t10;
+    t3 = t6 - t5;
+    t1 = (-C25) * t4;
+    t9 = C26 * t3;
+    t8 = t1 + t9;
+    t12 = C26 * t4;
+    t13 = C25 * t3;
+    t11 = t12 + t13;
+    t14 = x[407];
+    t0 = x[47];
+    t10 = 0.0075651186862769355 * t0;
+    t6 = x[312];
+    t5 = 0.07384850942488619 * t6;
+    t1 = t10 - t5;
+    t9 = (-0.06309241675039151) * t14;
+    t4 = C27 * t1;
+    t3 = t9 + t4;
+    t12 = 0.040972694510886046 * t14;
+    t13 = C28 * t1;
+    t0 = t12 + t13;
+    t6 = t8 + t3;
+    t10 = t11 + t0;
+    t5 = C6 * t6;
+    t9 = t7 - t5;
+    t4 = C6 * t10;
+    t14 = t2 - t4;
+    t1 = t8 - t3;
+    t12 = C7 * t1;
+    t13 = t11 - t0;
+    t5 = C7 * t13;
+    t4 = t7 + t6;
+    t8 = t2 + t10;
+    t3 = t9 + t5;
+    t1 = t14 - t12;
+    t11 = t9 - t5;
+    t0 = t14 + t12;
+    re[126] = t4;
+    im[126] = t8;
+    re[6] = t3;
+    im[6] = t1;
+    re[66] = t11;
+    im[66] = t0;
+    t13 = x[112];
+    t7 = 0.039210265632819354 * t13;
+    t6 = x[247];
+    t2 = 0.07842932782810454 * t6;
+    t10 = t7 - t2;
+    t9 = x[472];
+    t5 = 0.06843511489527315 * t9;
+    t14 = x[607];
+    t12 = 0.004800668688217836 * t14;
+    t4 = t5 + t12;
+    t8 = C29 * t10;
+    t3 = (-C30) * t4;
+    t1 = t8 + t3;
+    t11 = (-C30) * t10;
+    t0 = (-C29) * t4;
+    t13 = t11 + t0;
+    t6 = x[487];
+    t7 = 0.06406929688631251 * t6;
+    t2 = x[592];
+    t9 = 0.01000057866679364 * t2;
+    t14 = t7 + t9;
+    t5 = x[127];
+    t12 = 0.0480083543162075 * t5;
+    t8 = x[232];
+    t3 = 0.07921804168631846 * t8;
+    t10 = t12 - t3;
+    t4 = (-C31) * t14;
+    t11 = C32 * t10;
+    t0 = t4 + t11;
+    t6 = C32 * t14;
+    t2 = C31 * t10;
+    t7 = t6 + t2;
+    t9 = x[367];
+    t5 = x[7];
+    t8 = 0.0004409171809484468 * t5;
+    t12 = x[352];
+    t3 = 0.0743130633063656 * t12;
+    t4 = t8 - t3;
+    t11 = (-0.05467512627431228) * t9;
+    t14 = C33 * t4;
+    t10 = t11 + t14;
+    t6 = 0.05098538008727785 * t9;
+    t2 = C34 * t4;
+    t5 = t6 + t2;
+    t12 = t0 + t10;
+    t8 = t7 + t5;
+    t3 = C6 * t12;
+    t11 = t1 - t3;
+    t14 = C6 * t8;
+    t9 = t13 - t14;
+    t4 = t0 - t10;
+    t6 = C7 * t4;
+    t2 = t7 - t5;
+    t3 = C7 * t2;
+    t14 = t1 + t12;
+    t0 = t13 + t8;
+    t10 = t11 + t3;
+    t4 = t9 - t6;
+    t7 = t11 - t3;
+    t5 = t9 + t6;
+    t2 = t10 + t4;
+    t1 = C14 * t2;
+    t12 = t10 * (-C15);
+    t13 = t4 * C16;
+    t8 = t1 - t13;
+    t11 = t1 + t12;
+    t3 = t7 + t5;
+    t9 = C17 * t3;
+    t6 = t7 * (-C18);
+    t2 = t5 * (-C19);
+    t10 = t9 - t2;
+    t4 = t9 + t6;
+    re[146] = t14;
+    im[146] = t0;
+    re[26] = t8;
+    im[26] = t11;
+    re[86] = t10;
+    im[86] = t4;
+    t13 = x[152];
+    t1 = 0.06141711716448885 * t13;
+    t12 = x[207];
+    t3 = 0.07821641575885593 * t12;
+    t7 = t1 - t3;
+    t5 = x[512];
+    t2 = 0.05356040398594876 * t5;
+    t9 = x[567];
+    t6 = 0.022245471494846798 * t9;
+    t14 = t2 + t6;
+    t0 = C35 * t7;
+    t8 = (-C36) * t14;
+    t11 = t0 + t8;
+    t10 = (-C36) * t7;
+    t4 = (-C35) * t14;
+    t13 = t10 + t4;
+    t12 = x[447];
+    t1 = 0.07281087793701063 * t12;
+    t3 = x[632];
+    t5 = 0.00043428713575801746 * t3;
+    t9 = t1 + t5;
+    t2 = x[87];
+    t6 = 0.02492643432648059 * t2;
+    t0 = x[272];
+    t8 = 0.07615249922661345 * t0;
+    t7 = t6 - t8;
+    t14 = (-C37) * t9;
+    t10 = C38 * t7;
+    t4 = t14 + t10;
+    t12 = C38 * t9;
+    t3 = C37 * t7;
+    t1 = t12 + t3;
+    t5 = x[32];
+    t2 = 0.0036836583231711047 * t5;
+    t0 = x[327];
+    t6 = 0.073799685459482 * t0;
+    t8 = t2 - t6;
+    t14 = x[392];
+    t10 = C39 * t8;
+    t9 = (-0.0601203638888561) * t14;
+    t7 = t10 + t9;
+    t12 = (-C40) * t8;
+    t3 = (-0.04530394370210129) * t14;
+    t5 = t12 + t3;
+    t0 = t4 + t7;
+    t2 = t1 + t5;
+    t6 = C6 * t0;
+    t10 = t11 - t6;
+    t9 = C6 * t2;
+    t8 = t13 - t9;
+    t14 = t4 - t7;
+    t12 = C7 * t14;
+    t3 = t1 - t5;
+    t6 = C7 * t3;
+    t9 = t11 + t0;
+    t4 = t13 + t2;
+    t7 = t10 + t6;
+    t14 = t8 - t12;
+    t1 = t10 - t6;
+    t5 = t8 + t12;
+    t3 = t7 + t14;
+    t11 = C17 * t3;
+    t0 = t7 * (-C18);
+    t13 = t14 * (-C19);
+    t2 = t11 - t13;
+    t10 = t11 + t0;
+    t6 = t1 + t5;
+    t8 = (-C20) * t6;
+    t12 = t1 * C21;
+    t3 = t5 * (-C22);
+    t7 = t8 - t3;
+    t14 = t8 + t12;
+    re[166] = t9;
+    im[166] = t4;
+    re[46] = t2;
+    im[46] = t10;
+    re[106] = t7;
+    im[106] = t14;
+    t13 = re[126];
+    t11 = im[126];
+    t0 = re[146];
+    t6 = im[146];
+    t1 = re[166];
+    t5 = im[166];
+    t3 = t0 + t1;
+    t8 = t6 + t5;
+    t12 = C6 * t3;
+    t9 = t13 - t12;
+    t4 = C6 * t8;
+    t2 = t11 - t4;
+    t10 = t0 - t1;
+    t7 = C7 * t10;
+    t14 = t6 - t5;
+    t12 = C7 * t14;
+    t4 = t13 + t3;
+    t0 = t11 + t8;
+    t1 = t9 + t12;
+    t10 = t2 - t7;
+    t6 = t9 - t12;
+    t5 = t2 + t7;
+    re[126] = t4;
+    im[126] = t0;
+    re[146] = t1;
+    im[146] = t10;
+    re[166] = t6;
+    im[166] = t5;
+    t14 = re[6];
+    t13 = im[6];
+    t3 = re[26];
+    t11 = im[26];
+    t8 = re[46];
+    t9 = im[46];
+    t12 = t3 + t8;
+    t2 = t11 + t9;
+    t7 = C6 * t12;
+    t4 = t14 - t7;
+    t0 = C6 * t2;
+    t1 = t13 - t0;
+    t10 = t3 - t8;
+    t6 = C7 * t10;
+    t5 = t11 - t9;
+    t7 = C7 * t5;
+    t0 = t14 + t12;
+    t3 = t13 + t2;
+    t8 = t4 + t7;
+    t10 = t1 - t6;
+    t11 = t4 - t7;
+    t9 = t1 + t6;
+    re[6] = t0;
+    im[6] = t3;
+    re[26] = t8;
+    im[26] = t10;
+    re[46] = t11;
+    im[46] = t9;
+    t5 = re[66];
+    t14 = im[66];
+    t12 = re[86];
+    t13 = im[86];
+    t2 = re[106];
+    t4 = im[106];
+    t7 = t12 + t2;
+    t1 = t13 + t4;
+    t6 = C6 * t7;
+    t0 = t5 - t6;
+    t3 = C6 * t1;
+    t8 = t14 - t3;
+    t10 = t12 - t2;
+    t11 = C7 * t10;
+    t9 = t13 - t4;
+    t6 = C7 * t9;
+    t3 = t5 + t7;
+    t12 = t14 + t1;
+    t2 = t0 + t6;
+    t10 = t8 - t11;
+    t13 = t0 - t6;
+    t4 = t8 + t11;
+    re[66] = t3;
+    im[66] = t12;
+    re[86] = t2;
+    im[86] = t10;
+    re[106] = t13;
+    im[106] = t4;
+    t9 = x[144];
+    t5 = 0.057397798367898024 * t9;
+    t7 = x[215];
+    t14 = 0.07893135423244699 * t7;
+    t1 = t5 - t14;
+    t0 = x[504];
+    t6 = 0.05734497793414243 * t0;
+    t8 = x[575];
+    t11 = 0.01793167713832639 * t8;
+    t3 = t6 + t11;
+    t12 = C41 * t1;
+    t2 = (-C42) * t3;
+    t10 = t12 + t2;
+    t13 = (-C42) * t1;
+    t4 = (-C41) * t3;
+    t9 = t13 + t4;
+    t7 = x[455];
+    t5 = 0.07174739522488442 * t7;
+    t14 = x[624];
+    t0 = 0.0012566211405111928 * t14;
+    t8 = t5 + t0;
+    t6 = x[95];
+    t11 = 0.02933799848474425 * t6;
+    t12 = x[264];
+    t2 = 0.07691831583769149 * t12;
+    t1 = t11 - t2;
+    t3 = (-C43) * t8;
+    t13 = C44 * t1;
+    t4 = t3 + t13;
+    t7 = C44 * t8;
+    t14 = C43 * t1;
+    t5 = t7 + t14;
+    t0 = x[24];
+    t6 = 0.002229055261370192 * t0;
+    t12 = x[335];
+    t11 = 0.07390320955922502 * t12;
+    t2 = t6 - t11;
+    t3 = x[384];
+    t13 = C45 * t2;
+    t8 = (-0.058420704451135806) * t3;
+    t1 = t13 + t8;
+    t7 = (-C46) * t2;
+    t14 = (-0.04730815367253426) * t3;
+    t0 = t7 + t14;
+    t12 = t4 + t1;
+    t6 = t5 + t0;
+    t11 = C6 * t12;
+    t13 = t10 - t11;
+    t8 = C6 * t6;
+    t2 = t9 - t8;
+    t3 = t4 - t1;
+    t7 = C7 * t3;
+    t14 = t5 - t0;
+    t11 = C7 * t14;
+    t8 = t10 + t12;
+    t4 = t9 + t6;
+    t1 = t13 + t11;
+    t3 = t2 - t7;
+    t5 = t13 - t11;
+    t0 = t2 + t7;
+    re[162] = t8;
+    im[162] = t4;
+    re[42] = t1;
+    im[42] = t3;
+    re[102] = t5;
+    im[102] = t0;
+    t14 = x[535];
+    t10 = 0.041007537677709524 * t14;
+    t12 = x[544];
+    t9 = 0.03569218332318732 * t12;
+    t6 = t10 + t9;
+    t13 = x[175];
+    t11 = 0.07094747087527041 * t13;
+    t2 = x[184];
+    t7 = 0.07372511469768803 * t2;
+    t8 = t11 - t7;
+    t4 = (-C47) * t6;
+    t1 = C48 * t8;
+    t3 = t4 + t1;
+    t5 = C48 * t6;
+    t0 = C47 * t8;
+    t14 = t5 + t0;
+    t12 = x[415];
+    t10 = x[55];
+    t9 = 0.010260231943808849 * t10;
+    t13 = x[304];
+    t2 = 0.074037419382818 * t13;
+    t11 = t9 - t2;
+    t7 = (-0.06431937524501719) * t12;
+    t4 = C49 * t11;
+    t1 = t7 + t4;
+    t6 = 0.03864697962518696 * t12;
+    t8 = C50 * t11;
+    t5 = t6 + t8;
+    t0 = x[64];
+    t10 = 0.013796025469382255 * t0;
+    t13 = x[295];
+    t9 = 0.07440957660213073 * t13;
+    t2 = t10 - t9;
+    t7 = x[424];
+    t4 = C51 * t2;
+    t12 = (-0.06530071255448464) * t7;
+    t11 = t4 + t12;
+    t6 = (-C52) * t2;
+    t8 = (-0.036196776035266304) * t7;
+    t0 = t6 + t8;
+    t13 = t1 + t11;
+    t10 = t5 + t0;
+    t9 = C6 * t13;
+    t4 = t3 - t9;
+    t12 = C6 * t10;
+    t2 = t14 - t12;
+    t7 = t1 - t11;
+    t6 = C7 * t7;
+    t8 = t5 - t0;
+    t9 = C7 * t8;
+    t12 = t3 + t13;
+    t1 = t14 + t10;
+    t11 = t4 + t9;
+    t7 = t2 - t6;
+    t5 = t4 - t9;
+    t0 = t2 + t6;
+    t8 = t11 + t7;
+    t3 = C14 * t8;
+    t13 = t11 * (-C15);
+    t14 = t7 * C16;
+    t10 = t3 - t14;
+    t4 = t3 + t13;
+    t9 = t5 + t0;
+    t2 = C17 * t9;
+    t6 = t5 * (-C18);
+    t8 = t0 * (-C19);
+    t11 = t2 - t8;
+    t7 = t2 + t6;
+    re[2] = t12;
+    im[2] = t1;
+    re[62] = t10;
+    im[62] = t4;
+    re[122] = t11;
+    im[122] = t7;
+    t14 = x[495];
+    t3 = 0.06113848930054078 * t14;
+    t13 = x[584];
+    t9 = 0.013492984538424497 * t13;
+    t5 = t3 + t9;
+    t0 = x[135];
+    t8 = 0.05254388148070578 * t0;
+    t2 = x[224];
+    t6 = 0.07927218730124422 * t2;
+    t12 = t8 - t6;
+    t1 = (-C53) * t5;
+    t10 = C54 * t12;
+    t4 = t1 + t10;
+    t11 = C54 * t5;
+    t7 = C53 * t12;
+    t14 = t11 + t7;
+    t13 = x[375];
+    t3 = x[15];
+    t9 = 0.0010762203215031797 * t3;
+    t0 = x[344];
+    t2 = 0.07409618871715787 * t0;
+    t8 = t9 - t2;
+    t6 = (-0.05658632480062663) * t13;
+    t1 = C55 * t8;
+    t10 = t6 + t1;
+    t5 = 0.049189741690946163 * t13;
+    t12 = C56 * t8;
+    t11 = t5 + t12;
+    t7 = x[104];
+    t3 = 0.034509247345545814 * t7;
+    t0 = x[255];
+    t9 = 0.07776474091872976 * t0;
+    t2 = t3 - t9;
+    t6 = x[464];
+    t1 = 0.07019154559098635 * t6;
+    t13 = x[615];
+    t8 = 0.0028145556758956444 * t13;
+    t5 = t1 + t8;
+    t12 = C57 * t2;
+    t7 = (-C58) * t5;
+    t0 = t12 + t7;
+    t3 = (-C58) * t2;
+    t9 = (-C57) * t5;
+    t6 = t3 + t9;
+    t13 = t10 + t0;
+    t1 = t11 + t6;
+    t8 = C6 * t13;
+    t12 = t4 - t8;
+    t7 = C6 * t1;
+    t2 = t14 - t7;
+    t5 = t10 - t0;
+    t3 = C7 * t5;
+    t9 = t11 - t6;
+    t8 = C7 * t9;
+    t7 = t4 + t13;
+    t10 = t14 + t1;
+    t0 = t12 + t8;
+    t5 = t2 - t3;
+    t11 = t12 - t8;
+    t6 = t2 + t3;
+    t9 = t0 + t5;
+    t4 = C17 * t9;
+    t13 = t0 * (-C18);
+    t14 = t5 * (-C19);
+    t1 = t4 - t14;
+    t12 = t4 + t13;
+    t8 = t11 + t6;
+    t2 = (-C20) * t8;
+    t3 = t11 * C21;
+    t9 = t6 * (-C22);
+    t0 = t2 - t9;
+    t5 = t2 + t3;
+    re[22] = t7;
+    im[22] = t10;
+    re[82] = t1;
+    im[82] = t12;
+    re[142] = t0;
+    im[142] = t5;
+    t14 = re[162];
+    t4 = im[162];
+    t13 = re[2];
+    t8 = im[2];
+    t11 = re[22];
+    t6 = im[22];
+    t9 = t13 + t11;
+    t2 = t8 + t6;
+    t3 = C6 * t9;
+    t7 = t14 - t3;
+    t10 = C6 * t2;
+    t1 = t4 - t10;
+    t12 = t13 - t11;
+    t0 = C7 * t12;
+    t5 = t8 - t6;
+    t3 = C7 * t5;
+    t10 = t14 + t9;
+    t13 = t4 + t2;
+    t11 = t7 + t3;
+    t12 = t1 - t0;
+    t8 = t7 - t3;
+    t6 = t1 + t0;
+    re[162] = t10;
+    im[162] = t13;
+    re[2] = t11;
+    im[2] = t12;
+    re[22] = t8;
+    im[22] = t6;
+    t5 = re[42];
+    t14 = im[42];
+    t9 = re[62];
+    t4 = im[62];
+    t2 = re[82];
+    t7 = im[82];
+    t3 = t9 + t2;
+    t1 = t4 + t7;
+    t0 = C6 * t3;
+    t10 = t5 - t0;
+    t13 = C6 * t1;
+    t11 = t14 - t13;
+    t12 = t9 - t2;
+    t8 = C7 * t12;
+    t6 = t4 - t7;
+    t0 = C7 * t6;
+    t13 = t5 + t3;
+    t9 = t14 + t1;
+    t2 = t10 + t0;
+    t12 = t11 - t8;
+    t4 = t10 - t0;
+    t7 = t11 + t8;
+    re[42] = t13;
+    im[42] = t9;
+    re[62] = t2;
+    im[62] = t12;
+    re[82] = t4;
+    im[82] = t7;
+    t6 = re[102];
+    t5 = im[102];
+    t3 = re[122];
+    t14 = im[122];
+    t1 = re[142];
+    t10 = im[142];
+    t0 = t3 + t1;
+    t11 = t14 + t10;
+    t8 = C6 * t0;
+    t13 = t6 - t8;
+    t9 = C6 * t11;
+    t2 = t5 - t9;
+    t12 = t3 - t1;
+    t4 = C7 * t12;
+    t7 = t14 - t10;
+    t8 = C7 * t7;
+    t9 = t6 + t0;
+    t3 = t5 + t11;
+    t1 = t13 + t8;
+    t12 = t2 - t4;
+    t14 = t13 - t8;
+    t10 = t2 + t4;
+    re[102] = t9;
+    im[102] = t3;
+    re[122] = t1;
+    im[122] = t12;
+    re[142] = t14;
+    im[142] = t10;
+    t7 = x[503];
+    t6 = 0.0577914710627802 * t7;
+    t0 = x[576];
+    t5 = 0.017415019803909308 * t0;
+    t11 = t6 + t5;
+    t13 = x[143];
+    t8 = 0.05687433380975956 * t13;
+    t2 = x[216];
+    t4 = 0.07899241569686438 * t2;
+    t9 = t8 - t4;
+    t3 = (-C42) * t11;
+    t1 = C41 * t9;
+    t12 = t3 + t1;
+    t14 = C41 * t11;
+    t10 = C42 * t9;
+    t7 = t14 + t10;
+    t0 = x[383];
+    t6 = x[23];
+    t5 = 0.0020762064534554383 * t6;
+    t13 = x[336];
+    t2 = 0.0739211028647384 * t13;
+    t8 = t5 - t2;
+    t4 = (-0.058406563164378165) * t0;
+    t3 = C45 * t8;
+    t1 = t4 + t3;
+    t11 = 0.04729670228430909 * t0;
+    t9 = C46 * t8;
+    t14 = t11 + t9;
+    t10 = x[96];
+    t6 = 0.02990332649322146 * t10;
+    t13 = x[263];
+    t5 = 0.07701480239856939 * t13;
+    t2 = t6 - t5;
+    t4 = x[456];
+    t3 = 0.07159449802127518 * t4;
+    t0 = x[623];
+    t8 = 0.0013951437018800152 * t0;
+    t11 = t3 + t8;
+    t9 = C44 * t2;
+    t10 = (-C43) * t11;
+    t13 = t9 + t10;
+    t6 = (-C43) * t2;
+    t5 = (-C44) * t11;
+    t4 = t6 + t5;
+    t0 = t1 + t13;
+    t3 = t14 + t4;
+    t8 = C6 * t0;
+    t9 = t12 - t8;
+    t10 = C6 * t3;
+    t2 = t7 - t10;
+    t11 = t1 - t13;
+    t6 = C7 * t11;
+    t5 = t14 - t4;
+    t8 = C7 * t5;
+    t10 = t12 + t0;
+    t1 = t7 + t3;
+    t13 = t9 + t8;
+    t11 = t2 - t6;
+    t14 = t9 - t8;
+    t4 = t2 + t6;
+    re[18] = t10;
+    im[18] = t1;
+    re[78] = t13;
+    im[78] = t11;
+    re[138] = t14;
+    im[138] = t4;
+    t5 = x[463];
+    t12 = 0.07038547439326777 * t5;
+    t0 = x[616];
+    t7 = 0.0026062646773406016 * t0;
+    t3 = t12 + t7;
+    t9 = x[103];
+    t8 = 0.033926889543385 * t9;
+    t2 = x[256];
+    t6 = 0.0776741671325514 * t2;
+    t10 = t8 - t6;
+    t1 = (-C58) * t3;
+    t13 = C57 * t10;
+    t11 = t1 + t13;
+    t14 = C57 * t3;
+    t4 = C58 * t10;
+    t5 = t14 + t4;
+    t0 = x[16];
+    t12 = 0.0011801616573000912 * t0;
+    t7 = x[343];
+    t9 = 0.07407162011101821 * t7;
+    t2 = t12 - t9;
+    t8 = x[376];
+    t6 = C55 * t2;
+    t1 = (-0.05660509375862747) * t8;
+    t13 = t6 + t1;
+    t3 = (-C56) * t2;
+    t10 = (-0.04920605729721892) * t8;
+    t14 = t3 + t10;
+    t4 = x[136];
+    t0 = 0.05309766870993954 * t4;
+    t7 = x[223];
+    t12 = 0.07925654623502265 * t7;
+    t9 = t0 - t12;
+    t6 = x[496];
+    t1 = 0.060742536777194996 * t6;
+    t2 = x[583];
+    t8 = 0.013961288678997456 * t2;
+    t3 = t1 + t8;
+    t10 = C54 * t9;
+    t4 = (-C53) * t3;
+    t7 = t10 + t4;
+    t0 = (-C53) * t9;
+    t12 = (-C54) * t3;
+    t6 = t0 + t12;
+    t2 = t13 + t7;
+    t1 = t14 + t6;
+    t8 = C6 * t2;
+    t10 = t11 - t8;
+    t4 = C6 * t1;
+    t9 = t5 - t4;
+    t3 = t13 - t7;
+    t0 = C7 * t3;
+    t12 = t14 - t6;
+    t8 = C7 * t12;
+    t4 = t11 + t2;
+    t13 = t5 + t1;
+    t7 = t10 + t8;
+    t3 = t9 - t0;
+    t14 = t10 - t8;
+    t6 = t9 + t0;
+    t12 = t7 + t3;
+    t11 = C14 * t12;
+    t2 = t7 * (-C15);
+    t5 = t3 * C16;
+    t1 = t11 - t5;
+    t10 = t11 + t2;
+    t8 = t14 + t6;
+    t9 = C17 * t8;
+    t0 = t14 * (-C18);
+    t12 = t6 * (-C19);
+    t7 = t9 - t12;
+    t3 = t9 + t0;
+    re[38] = t4;
+    im[38] = t13;
+    re[98] = t1;
+    im[98] = t10;
+    re[158] = t7;
+    im[158] = t3;
+    t5 = x[423];
+    t11 = x[63];
+    t2 = 0.013378002394316833 * t11;
+    t8 = x[296];
+    t14 = 0.07435931760665028 * t8;
+    t6 = t2 - t14;
+    t12 = (-0.06534484889573652) * t5;
+    t9 = C51 * t6;
+    t0 = t12 + t9;
+    t4 = 0.03622124120872023 * t5;
+    t13 = C52 * t6;
+    t1 = t4 + t13;
+    t10 = x[56];
+    t7 = 0.010627184958870271 * t10;
+    t3 = x[303];
+    t11 = 0.07407014778245119 * t3;
+    t8 = t7 - t11;
+    t2 = x[416];
+    t14 = C49 * t8;
+    t12 = (-0.06429095529068744) * t2;
+    t9 = t14 + t12;
+    t5 = (-C50) * t8;
+    t6 = (-0.03862990319383566) * t2;
+    t4 = t5 + t6;
+    t13 = x[176];
+    t10 = 0.07128406273528302 * t13;
+    t3 = x[183];
+    t7 = 0.07344473947163749 * t3;
+    t11 = t10 - t7;
+    t14 = x[536];
+    t12 = 0.04042290599658089 * t14;
+    t8 = x[543];
+    t2 = 0.03628729419584379 * t8;
+    t5 = t12 + t2;
+    t6 = C48 * t11;
+    t13 = (-C47) * t5;
+    t3 = t6 + t13;
+    t10 = (-C47) * t11;
+    t7 = (-C48) * t5;
+    t14 = t10 + t7;
+    t8 = t9 + t3;
+    t12 = t4 + t14;
+    t2 = C6 * t8;
+    t6 = t0 - t2;
+    t13 = C6 * t12;
+    t11 = t1 - t13;
+    t5 = t9 - t3;
+    t10 = C7 * t5;
+    t7 = t4 - t14;
+    t2 = C7 * t7;
+    t13 = t0 + t8;
+    t9 = t1 + t12;
+    t3 = t6 + t2;
+    t5 = t11 - t10;
+    t4 = t6 - t2;
+    t14 = t11 + t10;
+    t7 = t3 + t5;
+    t0 = C17 * t7;
+    t8 = t3 * (-C18);
+    t1 = t5 * (-C19);
+    t12 = t0 - t1;
+    t6 = t0 + t8;
+    t2 = t4 + t14;
+    t11 = (-C20) * t2;
+    t10 = t4 * C21;
+    t7 = t14 * (-C22);
+    t3 = t11 - t7;
+    t5 = t11 + t10;
+    re[58] = t13;
+    im[58] = t9;
+    re[118] = t12;
+    im[118] = t6;
+    re[178] = t3;
+    im[178] = t5;
+    t1 = re[18];
+    t0 = im[18];
+    t8 = re[38];
+    t2 = im[38];
+    t4 = re[58];
+    t14 = im[58];
+    t7 = t8 + t4;
+    t11 = t2 + t14;
+    t10 = C6 * t7;
+    t13 = t1 - t10;
+    t9 = C6 * t11;
+    t12 = t0 - t9;
+    t6 = t8 - t4;
+    t3 = C7 * t6;
+    t5 = t2 - t14;
+    t10 = C7 * t5;
+    t9 = t1 + t7;
+    t8 = t0 + t11;
+    t4 = t13 + t10;
+    t6 = t12 - t3;
+    t2 = t13 - t10;
+    t14 = t12 + t3;
+    re[18] = t9;
+    im[18] = t8;
+    re[38] = t4;
+    im[38] = t6;
+    re[58] = t2;
+    im[58] = t14;
+    t5 = re[78];
+    t1 = im[78];
+    t7 = re[98];
+    t0 = im[98];
+    t11 = re[118];
+    t13 = im[118];
+    t10 = t7 + t11;
+    t12 = t0 + t13;
+    t3 = C6 * t10;
+    t9 = t5 - t3;
+    t8 = C6 * t12;
+    t4 = t1 - t8;
+    t6 = t7 - t11;
+    t2 = C7 * t6;
+    t14 = t0 - t13;
+    t3 = C7 * t14;
+    t8 = t5 + t10;
+    t7 = t1 + t12;
+    t11 = t9 + t3;
+    t6 = t4 - t2;
+    t0 = t9 - t3;
+    t13 = t4 + t2;
+    re[78] = t8;
+    im[78] = t7;
+    re[98] = t11;
+    im[98] = t6;
+    re[118] = t0;
+    im[118] = t13;
+    t14 = re[138];
+    t5 = im[138];
+    t10 = re[158];
+    t1 = im[158];
+    t12 = re[178];
+    t9 = im[178];
+    t3 = t10 + t12;
+    t4 = t1 + t9;
+    t2 = C6 * t3;
+    t8 = t14 - t2;
+    t7 = C6 * t4;
+    t11 = t5 - t7;
+    t6 = t10 - t12;
+    t0 = C7 * t6;
+    t13 = t1 - t9;
+    t2 = C7 * t13;
+    t7 = t14 + t3;
+    t10 = t5 + t4;
+    t12 = t8 + t2;
+    t6 = t11 - t0;
+    t1 = t8 - t2;
+    t9 = t11 + t0;
+    re[138] = t7;
+    im[138] = t10;
+    re[158] = t12;
+    im[158] = t6;
+    re[178] = t1;
+    im[178] = t9;
+    t13 = x[431];
+    t14 = x[71];
+    t3 = 0.01689105598606925 * t14;
+    t5 = x[288];
+    t4 = 0.07482598399384086 * t5;
+    t8 = t3 - t4;
+    t2 = (-0.06615397461259426) * t13;
+    t11 = C23 * t8;
+    t0 = t2 + t11;
+    t7 = 0.03370713365032511 * t13;
+    t10 = C24 * t8;
+    t12 = t7 + t10;
+    t6 = x[48];
+    t1 = 0.007878320426860737 * t6;
+    t9 = x[311];
+    t14 = 0.07386536607987472 * t9;
+    t5 = t1 - t14;
+    t3 = x[408];
+    t4 = C27 * t5;
+    t2 = (-0.06307801856680431) * t3;
+    t11 = t4 + t2;
+    t13 = (-C28) * t5;
+    t8 = (-0.04096334422113627) * t3;
+    t7 = t13 + t8;
+    t10 = x[168];
+    t6 = 0.06840111526676283 * t10;
+    t9 = x[191];
+    t1 = 0.07548893115038266 * t9;
+    t14 = t6 - t1;
+    t4 = x[528];
+    t2 = 0.045031547794885766 * t4;
+    t5 = x[551];
+    t3 = 0.03152247059222997 * t5;
+    t13 = t2 + t3;
+    t8 = C26 * t14;
+    t10 = (-C25) * t13;
+    t9 = t8 + t10;
+    t6 = (-C25) * t14;
+    t1 = (-C26) * t13;
+    t4 = t6 + t1;
+    t5 = t11 + t9;
+    t2 = t7 + t4;
+    t3 = C6 * t5;
+    t8 = t0 - t3;
+    t10 = C6 * t2;
+    t14 = t12 - t10;
+    t13 = t11 - t9;
+    t6 = C7 * t13;
+    t1 = t7 - t4;
+    t3 = C7 * t1;
+    t10 = t0 + t5;
+    t11 = t12 + t2;
+    t9 = t8 + t3;
+    t13 = t14 - t6;
+    t7 = t8 - t3;
+    t4 = t14 + t6;
+    re[54] = t10;
+    im[54] = t11;
+    re[114] = t9;
+    im[114] = t13;
+    re[174] = t7;
+    im[174] = t4;
+    t1 = x[391];
+    t0 = x[31];
+    t5 = 0.003478890727204296 * t0;
+    t12 = x[328];
+    t2 = 0.07380836847924803 * t12;
+    t8 = t5 - t2;
+    t3 = (-0.06011329116365245) * t1;
+    t14 = C39 * t8;
+    t6 = t3 + t14;
+    t10 = 0.045298614021378816 * t1;
+    t11 = C40 * t8;
+    t9 = t10 + t11;
+    t13 = x[88];
+    t7 = 0.025465730147811696 * t13;
+    t4 = x[271];
+    t0 = 0.07624660746123198 * t4;
+    t12 = t7 - t0;
+    t5 = x[448];
+    t2 = 0.07269232485002053 * t5;
+    t3 = x[631];
+    t14 = 0.0005109767988647399 * t3;
+    t1 = t2 + t14;
+    t8 = C38 * t12;
+    t10 = (-C37) * t1;
+    t11 = t8 + t10;
+    t13 = (-C37) * t12;
+    t4 = (-C38) * t1;
+    t7 = t13 + t4;
+    t0 = x[511];
+    t5 = 0.05405316343824382 * t0;
+    t3 = x[568];
+    t2 = 0.021690646887164954 * t3;
+    t14 = t5 + t2;
+    t8 = x[151];
+    t10 = 0.06093217079840101 * t8;
+    t12 = x[208];
+    t1 = 0.07832839163125538 * t12;
+    t13 = t10 - t1;
+    t4 = (-C36) * t14;
+    t0 = C35 * t13;
+    t3 = t4 + t0;
+    t5 = C35 * t14;
+    t2 = C36 * t13;
+    t8 = t5 + t2;
+    t12 = t11 + t3;
+    t10 = t7 + t8;
+    t1 = C6 * t12;
+    t4 = t6 - t1;
+    t0 = C6 * t10;
+    t14 = t9 - t0;
+    t13 = t11 - t3;
+    t5 = C7 * t13;
+    t2 = t7 - t8;
+    t1 = C7 * t2;
+    t0 = t6 + t12;
+    t11 = t9 + t10;
+    t3 = t4 + t1;
+    t13 = t14 - t5;
+    t7 = t4 - t1;
+    t8 = t14 + t5;
+    t2 = t3 + t13;
+    t6 = C14 * t2;
+    t12 = t3 * (-C15);
+    t9 = t13 * C16;
+    t10 = t6 - t9;
+    t4 = t6 + t12;
+    t1 = t7 + t8;
+    t14 = C17 * t1;
+    t5 = t7 * (-C18);
+    t2 = t8 * (-C19);
+    t3 = t14 - t2;
+    t13 = t14 + t5;
+    re[74] = t0;
+    im[74] = t11;
+    re[134] = t10;
+    im[134] = t4;
+    re[14] = t3;
+    im[14] = t13;
+    t9 = x[8];
+    t6 = 0.0005022724154049494 * t9;
+    t12 = x[351];
+    t1 = 0.07428440821157253 * t12;
+    t7 = t6 - t1;
+    t8 = x[368];
+    t2 = C33 * t7;
+    t14 = (-0.05469621711913331) * t8;
+    t5 = t2 + t14;
+    t0 = (-C34) * t7;
+    t11 = (-0.05100504761825285) * t8;
+    t10 = t0 + t11;
+    t4 = x[128];
+    t3 = 0.04858386684871984 * t4;
+    t13 = x[231];
+    t9 = 0.07924086912061755 * t13;
+    t12 = t3 - t9;
+    t6 = x[488];
+    t1 = 0.06372614899328394 * t6;
+    t2 = x[591];
+    t14 = 0.010411689238175531 * t2;
+    t7 = t1 + t14;
+    t8 = C32 * t12;
+    t0 = (-C31) * t7;
+    t11 = t8 + t0;
+    t4 = (-C31) * t12;
+    t13 = (-C32) * t7;
+    t3 = t4 + t13;
+    t9 = x[471];
+    t6 = 0.06867549650492617 * t9;
+    t2 = x[608];
+    t1 = 0.004521478542881972 * t2;
+    t14 = t6 + t1;
+    t8 = x[111];
+    t0 = 0.03862009352798275 * t8;
+    t12 = x[248];
+    t7 = 0.07835306485128514 * t12;
+    t4 = t0 - t7;
+    t13 = (-C30) * t14;
+    t9 = C29 * t4;
+    t2 = t13 + t9;
+    t6 = C29 * t14;
+    t1 = C30 * t4;
+    t8 = t6 + t1;
+    t12 = t11 + t2;
+    t0 = t3 + t8;
+    t7 = C6 * t12;
+    t13 = t5 - t7;
+    t9 = C6 * t0;
+    t14 = t10 - t9;
+    t4 = t11 - t2;
+    t6 = C7 * t4;
+    t1 = t3 - t8;
+    t7 = C7 * t1;
+    t9 = t5 + t12;
+    t11 = t10 + t0;
+    t2 = t13 + t7;
+    t4 = t14 - t6;
+    t3 = t13 - t7;
+    t8 = t14 + t6;
+    t1 = t2 + t4;
+    t5 = C17 * t1;
+    t12 = t2 * (-C18);
+    t10 = t4 * (-C19);
+    t0 = t5 - t10;
+    t13 = t5 + t12;
+    t7 = t3 + t8;
+    t14 = (-C20) * t7;
+    t6 = t3 * C21;
+    t1 = t8 * (-C22);
+    t2 = t14 - t1;
+    t4 = t14 + t6;
+    re[94] = t9;
+    im[94] = t11;
+    re[154] = t0;
+    im[154] = t13;
+    re[34] = t2;
+    im[34] = t4;
+    t10 = re[54];
+    t5 = im[54];
+    t12 = re[74];
+    t7 = im[74];
+    t3 = re[94];
+    t8 = im[94];
+    t1 = t12 + t3;
+    t14 = t7 + t8;
+    t6 = C6 * t1;
+    t9 = t10 - t6;
+    t11 = C6 * t14;
+    t0 = t5 - t11;
+    t13 = t12 - t3;
+    t2 = C7 * t13;
+    t4 = t7 - t8;
+    t6 = C7 * t4;
+    t11 = t10 + t1;
+    t12 = t5 + t14;
+    t3 = t9 + t6;
+    t13 = t0 - t2;
+    t7 = t9 - t6;
+    t8 = t0 + t2;
+    re[54] = t11;
+    im[54] = t12;
+    re[74] = t3;
+    im[74] = t13;
+    re[94] = t7;
+    im[94] = t8;
+    t4 = re[114];
+    t10 = im[114];
+    t1 = re[134];
+    t5 = im[134];
+    t14 = re[154];
+    t9 = im[154];
+    t6 = t1 + t14;
+    t0 = t5 + t9;
+    t2 = C6 * t6;
+    t11 = t4 - t2;
+    t12 = C6 * t0;
+    t3 = t10 - t12;
+    t13 = t1 - t14;
+    t7 = C7 * t13;
+    t8 = t5 - t9;
+    t2 = C7 * t8;
+    t12 = t4 + t6;
+    t1 = t10 + t0;
+    t14 = t11 + t2;
+    t13 = t3 - t7;
+    t5 = t11 - t2;
+    t9 = t3 + t7;
+    re[114] = t12;
+    im[114] = t1;
+    re[134] = t14;
+    im[134] = t13;
+    re[154] = t5;
+    im[154] = t9;
+    t8 = re[174];
+    t4 = im[174];
+    t6 = re[14];
+    t10 = im[14];
+    t0 = re[34];
+    t11 = im[34];
+    t2 = t6 + t0;
+    t3 = t10 + t11;
+    t7 = C6 * t2;
+    t12 = t8 - t7;
+    t1 = C6 * t3;
+    t14 = t4 - t1;
+    t13 = t6 - t0;
+    t5 = C7 * t13;
+    t9 = t10 - t11;
+    t7 = C7 * t9;
+    t1 = t8 + t2;
+    t6 = t4 + t3;
+    t0 = t12 + t7;
+    t13 = t14 - t5;
+    t10 = t12 - t7;
+    t11 = t14 + t5;
+    re[174] = t1;
+    im[174] = t6;
+    re[14] = t0;
+    im[14] = t13;
+    re[34] = t10;
+    im[34] = t11;
+    t9 = re[90];
+    t8 = im[90];
+    t2 = re[126];
+    t4 = im[126];
+    t3 = re[162];
+    t12 = im[162];
+    t7 = re[18];
+    t14 = im[18];
+    t5 = re[54];
+    t1 = im[54];
+    t6 = t2 + t5;
+    t0 = t4 + t1;
+    t13 = t3 + t7;
+    t10 = t12 + t14;
+    t11 = t2 - t5;
+    t2 = t4 - t1;
+    t5 = t3 - t7;
+    t4 = t12 - t14;
+    t1 = t6 + t13;
+    t3 = t0 + t10;
+    t7 = t6 - t13;
+    t12 = C0 * t7;
+    t14 = t0 - t10;
+    t6 = C0 * t14;
+    t13 = C1 * t1;
+    t7 = t9 - t13;
+    t0 = C1 * t3;
+    t10 = t8 - t0;
+    t14 = t7 + t12;
+    t13 = t10 + t6;
+    t0 = t7 - t12;
+    t7 = t10 - t6;
+    t12 = C2 * t11;
+    t10 = C3 * t5;
+    t6 = t12 + t10;
+    t12 = C2 * t2;
+    t10 = C3 * t4;
+    t12 = t12 + t10;
+    t10 = C3 * t11;
+    t11 = C2 * t5;
+    t5 = t10 - t11;
+    t10 = C3 * t2;
+    t11 = C2 * t4;
+    t2 = t10 - t11;
+    t4 = t9 + t1;
+    t10 = t8 + t3;
+    t11 = t14 + t12;
+    t9 = t13 - t6;
+    t1 = t0 + t2;
+    t8 = t7 - t5;
+    t3 = t0 - t2;
+    t0 = t7 + t5;
+    t2 = t14 - t12;
+    t7 = t13 + t6;
+    re[90] = t4;
+    im[90] = t10;
+    re[126] = t11;
+    im[126] = t9;
+    re[162] = t1;
+    im[162] = t8;
+    re[18] = t3;
+    im[18] = t0;
+    re[54] = t2;
+    im[54] = t7;
+    t5 = re[150];
+    t14 = im[150];
+    t12 = re[6];
+    t13 = im[6];
+    t6 = re[42];
+    t4 = im[42];
+    t10 = re[78];
+    t11 = im[78];
+    t9 = re[114];
+    t1 = im[114];
+    t8 = t12 + t9;
+    t3 = t13 + t1;
+    t0 = t6 + t10;
+    t2 = t4 + t11;
+    t7 = t12 - t9;
+    t12 = t13 - t1;
+    t9 = t6 - t10;
+    t13 = t4 - t11;
+    t1 = t8 + t0;
+    t6 = t3 + t2;
+    t10 = t8 - t0;
+    t4 = C0 * t10;
+    t11 = t3 - t2;
+    t8 = C0 * t11;
+    t0 = C1 * t1;
+    t10 = t5 - t0;
+    t3 = C1 * t6;
+    t2 = t14 - t3;
+    t11 = t10 + t4;
+    t0 = t2 + t8;
+    t3 = t10 - t4;
+    t10 = t2 - t8;
+    t4 = C2 * t7;
+    t2 = C3 * t9;
+    t8 = t4 + t2;
+    t4 = C2 * t12;
+    t2 = C3 * t13;
+    t4 = t4 + t2;
+    t2 = C3 * t7;
+    t7 = C2 * t9;
+    t9 = t2 - t7;
+    t2 = C3 * t12;
+    t7 = C2 * t13;
+    t12 = t2 - t7;
+    t13 = t5 + t1;
+    t2 = t14 + t6;
+    t7 = t11 + t4;
+    t5 = t0 - t8;
+    t1 = t3 + t12;
+    t14 = t10 - t9;
+    t6 = t3 - t12;
+    t3 = t10 + t9;
+    t12 = t11 - t4;
+    t10 = t0 + t8;
+    re[150] = t13;
+    im[150] = t2;
+    re[6] = t7;
+    im[6] = t5;
+    re[42] = t1;
+    im[42] = t14;
+    re[78] = t6;
+    im[78] = t3;
+    re[114] = t12;
+    im[114] = t10;
+    t9 = re[30];
+    t11 = im[30];
+    t4 = re[66];
+    t0 = im[66];
+    t8 = re[102];
+    t13 = im[102];
+    t2 = re[138];
+    t7 = im[138];
+    t5 = re[174];
+    t1 = im[174];
+    t14 = t4 + t5;
+    t6 = t0 + t1;
+    t3 = t8 + t2;
+    t12 = t13 + t7;
+    t10 = t4 - t5;
+    t4 = t0 - t1;
+    t5 = t8 - t2;
+    t0 = t13 - t7;
+    t1 = t14 + t3;
+    t8 = t6 + t12;
+    t2 = t14 - t3;
+    t13 = C0 * t2;
+    t7 = t6 - t12;
+    t14 = C0 * t7;
+    t3 = C1 * t1;
+    t2 = t9 - t3;
+    t6 = C1 * t8;
+    t12 = t11 - t6;
+    t7 = t2 + t13;
+    t3 = t12 + t14;
+    t6 = t2 - t13;
+    t2 = t12 - t14;
+    t13 = C2 * t10;
+    t12 = C3 * t5;
+    t14 = t13 + t12;
+    t13 = C2 * t4;
+    t12 = C3 * t0;
+    t13 = t13 + t12;
+    t12 = C3 * t10;
+    t10 = C2 * t5;
+    t5 = t12 - t10;
+    t12 = C3 * t4;
+    t10 = C2 * t0;
+    t4 = t12 - t10;
+    t0 = t9 + t1;
+    t12 = t11 + t8;
+    t10 = t7 + t13;
+    t9 = t3 - t14;
+    t1 = t6 + t4;
+    t11 = t2 - t5;
+    t8 = t6 - t4;
+    t6 = t2 + t5;
+    t4 = t7 - t13;
+    t2 = t3 + t14;
+    re[30] = t0;
+    im[30] = t12;
+    re[66] = t10;
+    im[66] = t9;
+    re[102] = t1;
+    im[102] = t11;
+    re[138] = t8;
+    im[138] = t6;
+    re[174] = t4;
+    im[174] = t2;
+}
+
+/**
+ *  Part 4 of ApplyWindowedMDCT_W75_360().
+ * 
+ *  @param {Number[]} x 
+ *    - The input block (720 points).
+ *  @param {Number[]} X 
+ *    - The array that would contain the output block (360 points).
+ *  @param {Number[]} re 
+ *    - The scratch buffer (real part, 180 points).
+ *  @param {Number[]} im 
+ *    - The scratch buffer (imaginary part, 180 points).
+ */
+function ApplyWindowedMDCT_W75_360_Part4(x, X, re, im) {
+    let t0, t1, t10, t11, t12, t13, t14, t2, t3, t4, t5, t6, t7, t8, t9;
+    const C0 = 0.5590169943749475;
+    const C1 = 0.25;
+    const C2 = 0.9510565162951535;
+    const C3 = 0.5877852522924731;
+    const C4 = 0.3826834323650898;
+    const C5 = 0.9238795325112867;
+    const C6 = 0.9914448613738104;
+    const C7 = 0.13052619222005157;
+    const C8 = 0.5;
+    const C9 = 0.8660254037844386;
+    const C10 = 0.21643961393810288;
+    const C11 = 0.9762960071199334;
+    const C12 = 0.9537169507482269;
+    const C13 = 0.3007057995042731;
+    const C14 = 0.766044443118978;
+    const C15 = 1.4088320528055172;
+    const C16 = 0.12325683343243876;
+    const C17 = 0.17364817766693033;
+    const C18 = 1.1584559306791384;
+    const C19 = 0.8111595753452777;
+    const C20 = 0.043619387365336;
+    const C21 = 0.9990482215818578;
+    const C22 = 0.9396926207859084;
+    const C23 = 0.5976724774602398;
+    const C24 = 1.281712764111577;
+    const C25 = 0.07845909572784494;
+    const C26 = 0.996917333733128;
+    const C27 = 0.9953961983671789;
+    const C28 = 0.09584575252022398;
+    const C29 = 0.963630453208623;
+    const C30 = 0.26723837607825685;
+    const C31 = 0.25038000405444144;
+    const C32 = 0.9681476403781077;
+    const C33 = 0.9723699203976766;
+    const C34 = 0.2334453638559054;
+    const C35 = 0.2840153447039226;
+    const C36 = 0.958819734868193;
+    const C37 = 0.917060074385124;
+    const C38 = 0.3987490689252462;
+    const C39 = 0.11320321376790671;
+    const C40 = 0.9935718556765875;
+    const C41 = 0.9981347984218669;
+    const C42 = 0.06104853953485687;
+    const C43 = 0.9996573249755573;
+    const C44 = 0.02617694830787315;
+    const C45 = 0.31730465640509214;
+    const C46 = 0.9483236552061993;
+    const C47 = 0.9799247046208296;
+    const C48 = 0.19936793441719716;
+    const C49 = 0.1478094111296106;
+    const C50 = 0.9890158633619168;
+    const C51 = 0.9304175679820246;
+    const C52 = 0.3665012267242973;
+    const C53 = 0.18223552549214747;
+    const C54 = 0.9832549075639546;
+    const C55 = 0.9426414910921784;
+    const C56 = 0.33380685923377096;
+    const C57 = 0.008726535498373935;
+    const C58 = 0.9999619230641713;
+    const C59 = 0.35020738125946743;
+    const C60 = 0.9366721892483976;
+    const C61 = 0.9862856015372314;
+    const C62 = 0.16504760586067765;
+    t5 = re[110];
+    t7 = im[110];
+    t13 = re[146];
+    t3 = im[146];
+    t14 = re[2];
+    t0 = im[2];
+    t12 = re[38];
+    t10 = im[38];
+    t9 = re[74];
+    t1 = im[74];
+    t11 = t13 + t9;
+    t8 = t3 + t1;
+    t6 = t14 + t12;
+    t4 = t0 + t10;
+    t2 = t13 - t9;
+    t13 = t3 - t1;
+    t9 = t14 - t12;
+    t3 = t0 - t10;
+    t1 = t11 + t6;
+    t14 = t8 + t4;
+    t12 = t11 - t6;
+    t0 = C0 * t12;
+    t10 = t8 - t4;
+    t11 = C0 * t10;
+    t6 = C1 * t1;
+    t12 = t5 - t6;
+    t8 = C1 * t14;
+    t4 = t7 - t8;
+    t10 = t12 + t0;
+    t6 = t4 + t11;
+    t8 = t12 - t0;
+    t12 = t4 - t11;
+    t0 = C2 * t2;
+    t4 = C3 * t9;
+    t11 = t0 + t4;
+    t0 = C2 * t13;
+    t4 = C3 * t3;
+    t0 = t0 + t4;
+    t4 = C3 * t2;
+    t2 = C2 * t9;
+    t9 = t4 - t2;
+    t4 = C3 * t13;
+    t2 = C2 * t3;
+    t13 = t4 - t2;
+    t3 = t5 + t1;
+    t4 = t7 + t14;
+    t2 = t10 + t0;
+    t5 = t6 - t11;
+    t1 = t8 + t13;
+    t7 = t12 - t9;
+    t14 = t8 - t13;
+    t8 = t12 + t9;
+    t13 = t10 - t0;
+    t12 = t6 + t11;
+    re[110] = t3;
+    im[110] = t4;
+    re[146] = t2;
+    im[146] = t5;
+    re[2] = t1;
+    im[2] = t7;
+    re[38] = t14;
+    im[38] = t8;
+    re[74] = t13;
+    im[74] = t12;
+    t9 = re[170];
+    t10 = im[170];
+    t0 = re[26];
+    t6 = im[26];
+    t11 = re[62];
+    t3 = im[62];
+    t4 = re[98];
+    t2 = im[98];
+    t5 = re[134];
+    t1 = im[134];
+    t7 = t0 + t5;
+    t14 = t6 + t1;
+    t8 = t11 + t4;
+    t13 = t3 + t2;
+    t12 = t0 - t5;
+    t0 = t6 - t1;
+    t5 = t11 - t4;
+    t6 = t3 - t2;
+    t1 = t7 + t8;
+    t11 = t14 + t13;
+    t4 = t7 - t8;
+    t3 = C0 * t4;
+    t2 = t14 - t13;
+    t7 = C0 * t2;
+    t8 = C1 * t1;
+    t4 = t9 - t8;
+    t14 = C1 * t11;
+    t13 = t10 - t14;
+    t2 = t4 + t3;
+    t8 = t13 + t7;
+    t14 = t4 - t3;
+    t4 = t13 - t7;
+    t3 = C2 * t12;
+    t13 = C3 * t5;
+    t7 = t3 + t13;
+    t3 = C2 * t0;
+    t13 = C3 * t6;
+    t3 = t3 + t13;
+    t13 = C3 * t12;
+    t12 = C2 * t5;
+    t5 = t13 - t12;
+    t13 = C3 * t0;
+    t12 = C2 * t6;
+    t0 = t13 - t12;
+    t6 = t9 + t1;
+    t13 = t10 + t11;
+    t12 = t2 + t3;
+    t9 = t8 - t7;
+    t1 = t14 + t0;
+    t10 = t4 - t5;
+    t11 = t14 - t0;
+    t14 = t4 + t5;
+    t0 = t2 - t3;
+    t4 = t8 + t7;
+    re[170] = t6;
+    im[170] = t13;
+    re[26] = t12;
+    im[26] = t9;
+    re[62] = t1;
+    im[62] = t10;
+    re[98] = t11;
+    im[98] = t14;
+    re[134] = t0;
+    im[134] = t4;
+    t5 = re[50];
+    t2 = im[50];
+    t3 = re[86];
+    t8 = im[86];
+    t7 = re[122];
+    t6 = im[122];
+    t13 = re[158];
+    t12 = im[158];
+    t9 = re[14];
+    t1 = im[14];
+    t10 = t3 + t9;
+    t11 = t8 + t1;
+    t14 = t7 + t13;
+    t0 = t6 + t12;
+    t4 = t3 - t9;
+    t3 = t8 - t1;
+    t9 = t7 - t13;
+    t8 = t6 - t12;
+    t1 = t10 + t14;
+    t7 = t11 + t0;
+    t13 = t10 - t14;
+    t6 = C0 * t13;
+    t12 = t11 - t0;
+    t10 = C0 * t12;
+    t14 = C1 * t1;
+    t13 = t5 - t14;
+    t11 = C1 * t7;
+    t0 = t2 - t11;
+    t12 = t13 + t6;
+    t14 = t0 + t10;
+    t11 = t13 - t6;
+    t13 = t0 - t10;
+    t6 = C2 * t4;
+    t0 = C3 * t9;
+    t10 = t6 + t0;
+    t6 = C2 * t3;
+    t0 = C3 * t8;
+    t6 = t6 + t0;
+    t0 = C3 * t4;
+    t4 = C2 * t9;
+    t9 = t0 - t4;
+    t0 = C3 * t3;
+    t4 = C2 * t8;
+    t3 = t0 - t4;
+    t8 = t5 + t1;
+    t0 = t2 + t7;
+    t4 = t12 + t6;
+    t5 = t14 - t10;
+    t1 = t11 + t3;
+    t2 = t13 - t9;
+    t7 = t11 - t3;
+    t11 = t13 + t9;
+    t3 = t12 - t6;
+    t13 = t14 + t10;
+    re[50] = t8;
+    im[50] = t0;
+    re[86] = t4;
+    im[86] = t5;
+    re[122] = t1;
+    im[122] = t2;
+    re[158] = t7;
+    im[158] = t11;
+    re[14] = t3;
+    im[14] = t13;
+    t9 = re[130];
+    t12 = im[130];
+    t6 = re[166];
+    t14 = im[166];
+    t10 = re[22];
+    t8 = im[22];
+    t0 = re[58];
+    t4 = im[58];
+    t5 = re[94];
+    t1 = im[94];
+    t2 = t6 + t5;
+    t7 = t14 + t1;
+    t11 = t10 + t0;
+    t3 = t8 + t4;
+    t13 = t6 - t5;
+    t6 = t14 - t1;
+    t5 = t10 - t0;
+    t14 = t8 - t4;
+    t1 = t2 + t11;
+    t10 = t7 + t3;
+    t0 = t2 - t11;
+    t8 = C0 * t0;
+    t4 = t7 - t3;
+    t2 = C0 * t4;
+    t11 = C1 * t1;
+    t0 = t9 - t11;
+    t7 = C1 * t10;
+    t3 = t12 - t7;
+    t4 = t0 + t8;
+    t11 = t3 + t2;
+    t7 = t0 - t8;
+    t0 = t3 - t2;
+    t8 = C2 * t13;
+    t3 = C3 * t5;
+    t2 = t8 + t3;
+    t8 = C2 * t6;
+    t3 = C3 * t14;
+    t8 = t8 + t3;
+    t3 = C3 * t13;
+    t13 = C2 * t5;
+    t5 = t3 - t13;
+    t3 = C3 * t6;
+    t13 = C2 * t14;
+    t6 = t3 - t13;
+    t14 = t9 + t1;
+    t3 = t12 + t10;
+    t13 = t4 + t8;
+    t9 = t11 - t2;
+    t1 = t7 + t6;
+    t12 = t0 - t5;
+    t10 = t7 - t6;
+    t7 = t0 + t5;
+    t6 = t4 - t8;
+    t0 = t11 + t2;
+    re[130] = t14;
+    im[130] = t3;
+    re[166] = t13;
+    im[166] = t9;
+    re[22] = t1;
+    im[22] = t12;
+    re[58] = t10;
+    im[58] = t7;
+    re[94] = t6;
+    im[94] = t0;
+    t5 = re[10];
+    t4 = im[10];
+    t8 = re[46];
+    t11 = im[46];
+    t2 = re[82];
+    t14 = im[82];
+    t3 = re[118];
+    t13 = im[118];
+    t9 = re[154];
+    t1 = im[154];
+    t12 = t8 + t9;
+    t10 = t11 + t1;
+    t7 = t2 + t3;
+    t6 = t14 + t13;
+    t0 = t8 - t9;
+    t8 = t11 - t1;
+    t9 = t2 - t3;
+    t11 = t14 - t13;
+    t1 = t12 + t7;
+    t2 = t10 + t6;
+    t3 = t12 - t7;
+    t14 = C0 * t3;
+    t13 = t10 - t6;
+    t12 = C0 * t13;
+    t7 = C1 * t1;
+    t3 = t5 - t7;
+    t10 = C1 * t2;
+    t6 = t4 - t10;
+    t13 = t3 + t14;
+    t7 = t6 + t12;
+    t10 = t3 - t14;
+    t3 = t6 - t12;
+    t14 = C2 * t0;
+    t6 = C3 * t9;
+    t12 = t14 + t6;
+    t14 = C2 * t8;
+    t6 = C3 * t11;
+    t14 = t14 + t6;
+    t6 = C3 * t0;
+    t0 = C2 * t9;
+    t9 = t6 - t0;
+    t6 = C3 * t8;
+    t0 = C2 * t11;
+    t8 = t6 - t0;
+    t11 = t5 + t1;
+    t6 = t4 + t2;
+    t0 = t13 + t14;
+    t5 = t7 - t12;
+    t1 = t10 + t8;
+    t4 = t3 - t9;
+    t2 = t10 - t8;
+    t10 = t3 + t9;
+    t8 = t13 - t14;
+    t3 = t7 + t12;
+    re[10] = t11;
+    im[10] = t6;
+    re[46] = t0;
+    im[46] = t5;
+    re[82] = t1;
+    im[82] = t4;
+    re[118] = t2;
+    im[118] = t10;
+    re[154] = t8;
+    im[154] = t3;
+    t9 = re[70];
+    t13 = im[70];
+    t14 = re[106];
+    t7 = im[106];
+    t12 = re[142];
+    t11 = im[142];
+    t6 = re[178];
+    t0 = im[178];
+    t5 = re[34];
+    t1 = im[34];
+    t4 = t14 + t5;
+    t2 = t7 + t1;
+    t10 = t12 + t6;
+    t8 = t11 + t0;
+    t3 = t14 - t5;
+    t14 = t7 - t1;
+    t5 = t12 - t6;
+    t7 = t11 - t0;
+    t1 = t4 + t10;
+    t12 = t2 + t8;
+    t6 = t4 - t10;
+    t11 = C0 * t6;
+    t0 = t2 - t8;
+    t4 = C0 * t0;
+    t10 = C1 * t1;
+    t6 = t9 - t10;
+    t2 = C1 * t12;
+    t8 = t13 - t2;
+    t0 = t6 + t11;
+    t10 = t8 + t4;
+    t2 = t6 - t11;
+    t6 = t8 - t4;
+    t11 = C2 * t3;
+    t8 = C3 * t5;
+    t4 = t11 + t8;
+    t11 = C2 * t14;
+    t8 = C3 * t7;
+    t11 = t11 + t8;
+    t8 = C3 * t3;
+    t3 = C2 * t5;
+    t5 = t8 - t3;
+    t8 = C3 * t14;
+    t3 = C2 * t7;
+    t14 = t8 - t3;
+    t7 = t9 + t1;
+    t8 = t13 + t12;
+    t3 = t0 + t11;
+    t9 = t10 - t4;
+    t1 = t2 + t14;
+    t13 = t6 - t5;
+    t12 = t2 - t14;
+    t2 = t6 + t5;
+    t14 = t0 - t11;
+    t6 = t10 + t4;
+    re[70] = t7;
+    im[70] = t8;
+    re[106] = t3;
+    im[106] = t9;
+    re[142] = t1;
+    im[142] = t13;
+    re[178] = t12;
+    im[178] = t2;
+    re[34] = t14;
+    im[34] = t6;
+    t5 = x[90];
+    t0 = 0.02655548754157034 * t5;
+    t11 = x[269];
+    t10 = 0.07643673051777489 * t11;
+    t4 = t0 - t10;
+    t7 = x[450];
+    t8 = 0.07244348493003379 * t7;
+    t3 = x[629];
+    t9 = 0.0006858251109706325 * t3;
+    t1 = t8 + t9;
+    t13 = C4 * t4;
+    t12 = (-C5) * t1;
+    t2 = t13 + t12;
+    t14 = (-C5) * t4;
+    t6 = (-C4) * t1;
+    t5 = t14 + t6;
+    t11 = x[509];
+    t0 = 0.05502256217993199 * t11;
+    t10 = x[570];
+    t7 = 0.020593098975334338 * t10;
+    t3 = t0 + t7;
+    t8 = x[149];
+    t9 = 0.05994684933986933 * t8;
+    t13 = x[210];
+    t12 = 0.07853258704510427 * t13;
+    t4 = t9 - t12;
+    t1 = (-C6) * t3;
+    t14 = C7 * t4;
+    t6 = t1 + t14;
+    t11 = C7 * t3;
+    t10 = C6 * t4;
+    t0 = t11 + t10;
+    t7 = x[389];
+    t8 = x[29];
+    t13 = 0.0030890222459463205 * t8;
+    t9 = x[330];
+    t12 = 0.07382960802169211 * t9;
+    t1 = t13 - t12;
+    t14 = (-0.05969852306243507) * t7;
+    t3 = 0.6087614290087207 * t1;
+    t4 = t14 + t3;
+    t11 = 0.0458082878882908 * t7;
+    t10 = 0.7933533402912352 * t1;
+    t8 = t11 + t10;
+    t9 = t6 + t4;
+    t13 = t0 + t8;
+    t12 = C8 * t9;
+    t14 = t2 - t12;
+    t3 = C8 * t13;
+    t7 = t5 - t3;
+    t1 = t6 - t4;
+    t11 = C9 * t1;
+    t10 = t0 - t8;
+    t12 = C9 * t10;
+    t3 = t2 + t9;
+    t6 = t5 + t13;
+    t4 = t14 + t12;
+    t1 = t7 - t11;
+    t0 = t14 - t12;
+    t8 = t7 + t11;
+    re[135] = t3;
+    im[135] = t6;
+    re[15] = t4;
+    im[15] = t1;
+    re[75] = t0;
+    im[75] = t8;
+    t10 = x[130];
+    t2 = 0.04972839141369215 * t10;
+    t9 = x[229];
+    t5 = 0.07927355304937736 * t9;
+    t13 = t2 - t5;
+    t14 = x[490];
+    t12 = 0.06302004407934228 * t14;
+    t7 = x[589];
+    t11 = 0.011255798390928823 * t7;
+    t3 = t12 + t11;
+    t6 = C10 * t13;
+    t4 = (-C11) * t3;
+    t1 = t6 + t4;
+    t0 = (-C11) * t13;
+    t8 = (-C10) * t3;
+    t10 = t0 + t8;
+    t9 = x[469];
+    t2 = 0.06913776893770059 * t9;
+    t5 = x[610];
+    t14 = 0.003989471102289299 * t5;
+    t7 = t2 + t14;
+    t12 = x[109];
+    t11 = 0.0374410809653893 * t12;
+    t6 = x[250];
+    t4 = 0.07819438677399508 * t6;
+    t13 = t11 - t4;
+    t3 = (-C12) * t7;
+    t0 = C13 * t13;
+    t8 = t3 + t0;
+    t9 = C13 * t7;
+    t5 = C12 * t13;
+    t2 = t9 + t5;
+    t14 = x[10];
+    t12 = 0.0006397848555590884 * t14;
+    t6 = x[349];
+    t11 = 0.07422817967693168 * t6;
+    t4 = t12 - t11;
+    t3 = x[370];
+    t0 = 0.6755902076156601 * t4;
+    t7 = (-0.055181000292987434) * t3;
+    t13 = t0 + t7;
+    t9 = (-0.7372773368101241) * t4;
+    t5 = (-0.05056407078192895) * t3;
+    t14 = t9 + t5;
+    t6 = t8 + t13;
+    t12 = t2 + t14;
+    t11 = C8 * t6;
+    t0 = t1 - t11;
+    t7 = C8 * t12;
+    t4 = t10 - t7;
+    t3 = t8 - t13;
+    t9 = C9 * t3;
+    t5 = t2 - t14;
+    t11 = C9 * t5;
+    t7 = t1 + t6;
+    t8 = t10 + t12;
+    t13 = t0 + t11;
+    t3 = t4 - t9;
+    t2 = t0 - t11;
+    t14 = t4 + t9;
+    t5 = t13 + t3;
+    t1 = C14 * t5;
+    t6 = t13 * (-C15);
+    t10 = t3 * C16;
+    t12 = t1 - t10;
+    t0 = t1 + t6;
+    t11 = t2 + t14;
+    t4 = C17 * t11;
+    t9 = t2 * (-C18);
+    t5 = t14 * (-C19);
+    t13 = t4 - t5;
+    t3 = t4 + t9;
+    re[155] = t7;
+    im[155] = t8;
+    re[35] = t12;
+    im[35] = t0;
+    re[95] = t13;
+    im[95] = t3;
+    t10 = x[170];
+    t1 = 0.06916232173276785 * t10;
+    t6 = x[189];
+    t11 = 0.07502108030330112 * t6;
+    t2 = t1 - t11;
+    t14 = x[530];
+    t5 = 0.04389508776629477 * t14;
+    t4 = x[549];
+    t9 = 0.032712878842642595 * t4;
+    t7 = t5 + t9;
+    t8 = C20 * t2;
+    t12 = (-C21) * t7;
+    t0 = t8 + t12;
+    t13 = (-C21) * t2;
+    t3 = (-C20) * t7;
+    t10 = t13 + t3;
+    t6 = x[429];
+    t1 = x[69];
+    t11 = 0.01597743799899386 * t1;
+    t14 = x[290];
+    t4 = 0.07469517305545602 * t14;
+    t5 = t11 - t4;
+    t9 = (-0.06597264268258206) * t6;
+    t8 = 0.4617486132350339 * t5;
+    t12 = t9 + t8;
+    t2 = 0.03434318401837599 * t6;
+    t7 = 0.8870108331782217 * t5;
+    t13 = t2 + t7;
+    t3 = x[50];
+    t1 = 0.008525254162783965 * t3;
+    t14 = x[309];
+    t11 = 0.07390469329697484 * t14;
+    t4 = t1 - t11;
+    t9 = x[410];
+    t8 = 0.5372996083468239 * t4;
+    t6 = (-0.06339932991083261) * t9;
+    t5 = t8 + t6;
+    t2 = (-0.8433914458128857) * t4;
+    t7 = (-0.040389827641314435) * t9;
+    t3 = t2 + t7;
+    t14 = t12 + t5;
+    t1 = t13 + t3;
+    t11 = C8 * t14;
+    t8 = t0 - t11;
+    t6 = C8 * t1;
+    t4 = t10 - t6;
+    t9 = t12 - t5;
+    t2 = C9 * t9;
+    t7 = t13 - t3;
+    t11 = C9 * t7;
+    t6 = t0 + t14;
+    t12 = t10 + t1;
+    t5 = t8 + t11;
+    t9 = t4 - t2;
+    t13 = t8 - t11;
+    t3 = t4 + t2;
+    t7 = t5 + t9;
+    t0 = C17 * t7;
+    t14 = t5 * (-C18);
+    t10 = t9 * (-C19);
+    t1 = t0 - t10;
+    t8 = t0 + t14;
+    t11 = t13 + t3;
+    t4 = (-C22) * t11;
+    t2 = t13 * C23;
+    t7 = t3 * (-C24);
+    t5 = t4 - t7;
+    t9 = t4 + t2;
+    re[175] = t6;
+    im[175] = t12;
+    re[55] = t1;
+    im[55] = t8;
+    re[115] = t5;
+    im[115] = t9;
+    t10 = re[135];
+    t0 = im[135];
+    t14 = re[155];
+    t11 = im[155];
+    t13 = re[175];
+    t3 = im[175];
+    t7 = t14 + t13;
+    t4 = t11 + t3;
+    t2 = C8 * t7;
+    t6 = t10 - t2;
+    t12 = C8 * t4;
+    t1 = t0 - t12;
+    t8 = t14 - t13;
+    t5 = C9 * t8;
+    t9 = t11 - t3;
+    t2 = C9 * t9;
+    t12 = t10 + t7;
+    t14 = t0 + t4;
+    t13 = t6 + t2;
+    t8 = t1 - t5;
+    t11 = t6 - t2;
+    t3 = t1 + t5;
+    re[135] = t12;
+    im[135] = t14;
+    re[155] = t13;
+    im[155] = t8;
+    re[175] = t11;
+    im[175] = t3;
+    t9 = re[15];
+    t10 = im[15];
+    t7 = re[35];
+    t0 = im[35];
+    t4 = re[55];
+    t6 = im[55];
+    t2 = t7 + t4;
+    t1 = t0 + t6;
+    t5 = C8 * t2;
+    t12 = t9 - t5;
+    t14 = C8 * t1;
+    t13 = t10 - t14;
+    t8 = t7 - t4;
+    t11 = C9 * t8;
+    t3 = t0 - t6;
+    t5 = C9 * t3;
+    t14 = t9 + t2;
+    t7 = t10 + t1;
+    t4 = t12 + t5;
+    t8 = t13 - t11;
+    t0 = t12 - t5;
+    t6 = t13 + t11;
+    re[15] = t14;
+    im[15] = t7;
+    re[35] = t4;
+    im[35] = t8;
+    re[55] = t0;
+    im[55] = t6;
+    t3 = re[75];
+    t9 = im[75];
+    t2 = re[95];
+    t10 = im[95];
+    t1 = re[115];
+    t12 = im[115];
+    t5 = t2 + t1;
+    t13 = t10 + t12;
+    t11 = C8 * t5;
+    t14 = t3 - t11;
+    t7 = C8 * t13;
+    t4 = t9 - t7;
+    t8 = t2 - t1;
+    t0 = C9 * t8;
+    t6 = t10 - t12;
+    t11 = C9 * t6;
+    t7 = t3 + t5;
+    t2 = t9 + t13;
+    t1 = t14 + t11;
+    t8 = t4 - t0;
+    t10 = t14 - t11;
+    t12 = t4 + t0;
+    re[75] = t7;
+    im[75] = t2;
+    re[95] = t1;
+    im[95] = t8;
+    re[115] = t10;
+    im[115] = t12;
+    t6 = x[162];
+    t3 = 0.06596195100876791 * t6;
+    t5 = x[197];
+    t9 = 0.07672217418086602 * t5;
+    t13 = t3 - t9;
+    t14 = x[522];
+    t11 = 0.04835784909338468 * t14;
+    t4 = x[557];
+    t0 = 0.02797728396717007 * t4;
+    t7 = t11 + t0;
+    t2 = C25 * t13;
+    t1 = (-C26) * t7;
+    t8 = t2 + t1;
+    t10 = (-C26) * t13;
+    t12 = (-C25) * t7;
+    t6 = t10 + t12;
+    t5 = x[437];
+    t3 = x[77];
+    t9 = 0.019760759384634594 * t3;
+    t14 = x[282];
+    t4 = 0.07527606842734347 * t14;
+    t11 = t9 - t4;
+    t0 = (-0.06661297269626174) * t5;
+    t2 = 0.4305110968082951 * t11;
+    t1 = t0 + t2;
+    t13 = 0.03177275813640743 * t5;
+    t7 = 0.9025852843498606 * t11;
+    t10 = t13 + t7;
+    t12 = x[42];
+    t3 = 0.006101107904815549 * t12;
+    t14 = x[317];
+    t9 = 0.07379156447120827 * t14;
+    t4 = t3 - t9;
+    t0 = x[402];
+    t2 = 0.5664062369248328 * t4;
+    t5 = (-0.06204610050603112) * t0;
+    t11 = t2 + t5;
+    t13 = (-0.8241261886220156) * t4;
+    t7 = (-0.04264310343327711) * t0;
+    t12 = t13 + t7;
+    t14 = t1 + t11;
+    t3 = t10 + t12;
+    t9 = C8 * t14;
+    t2 = t8 - t9;
+    t5 = C8 * t3;
+    t4 = t6 - t5;
+    t0 = t1 - t11;
+    t13 = C9 * t0;
+    t7 = t10 - t12;
+    t9 = C9 * t7;
+    t5 = t8 + t14;
+    t1 = t6 + t3;
+    t11 = t2 + t9;
+    t0 = t4 - t13;
+    t10 = t2 - t9;
+    t12 = t4 + t13;
+    re[171] = t5;
+    im[171] = t1;
+    re[51] = t11;
+    im[51] = t0;
+    re[111] = t10;
+    im[111] = t12;
+    t7 = x[517];
+    t8 = 0.05101891292299967 * t7;
+    t14 = x[562];
+    t6 = 0.025074379332856854 * t14;
+    t3 = t8 + t6;
+    t2 = x[157];
+    t9 = 0.0637612778454389 * t2;
+    t4 = x[202];
+    t13 = 0.07755518221415482 * t4;
+    t5 = t9 - t13;
+    t1 = (-C27) * t3;
+    t11 = C28 * t5;
+    t0 = t1 + t11;
+    t10 = C28 * t3;
+    t12 = C27 * t5;
+    t7 = t10 + t12;
+    t14 = x[397];
+    t8 = x[37];
+    t6 = 0.004807832252336169 * t8;
+    t2 = x[322];
+    t4 = 0.07377673045010832 * t2;
+    t9 = t6 - t4;
+    t13 = (-0.061304749658525975) * t14;
+    t1 = 0.5807029557109398 * t9;
+    t11 = t13 + t1;
+    t3 = 0.04372825296058789 * t14;
+    t5 = 0.8141155183563192 * t9;
+    t10 = t3 + t5;
+    t12 = x[82];
+    t8 = 0.022289008698053562 * t12;
+    t2 = x[277];
+    t6 = 0.07571869440906569 * t2;
+    t4 = t8 - t6;
+    t13 = x[442];
+    t1 = 0.41469324265623897 * t4;
+    t14 = (-0.06676475912866911) * t13;
+    t9 = t1 + t14;
+    t3 = (-0.9099612708765432) * t4;
+    t5 = (-0.030426453679243317) * t13;
+    t12 = t3 + t5;
+    t2 = t11 + t9;
+    t8 = t10 + t12;
+    t6 = C8 * t2;
+    t1 = t0 - t6;
+    t14 = C8 * t8;
+    t4 = t7 - t14;
+    t13 = t11 - t9;
+    t3 = C9 * t13;
+    t5 = t10 - t12;
+    t6 = C9 * t5;
+    t14 = t0 + t2;
+    t11 = t7 + t8;
+    t9 = t1 + t6;
+    t13 = t4 - t3;
+    t10 = t1 - t6;
+    t12 = t4 + t3;
+    t5 = t9 + t13;
+    t0 = C14 * t5;
+    t2 = t9 * (-C15);
+    t7 = t13 * C16;
+    t8 = t0 - t7;
+    t1 = t0 + t2;
+    t6 = t10 + t12;
+    t4 = C17 * t6;
+    t3 = t10 * (-C18);
+    t5 = t12 * (-C19);
+    t9 = t4 - t5;
+    t13 = t4 + t3;
+    re[11] = t14;
+    im[11] = t11;
+    re[71] = t8;
+    im[71] = t1;
+    re[131] = t9;
+    im[131] = t13;
+    t7 = x[477];
+    t0 = 0.06713990188669226 * t7;
+    t2 = x[602];
+    t6 = 0.00632622466030756 * t2;
+    t10 = t0 + t6;
+    t12 = x[117];
+    t5 = 0.04216237624301753 * t12;
+    t4 = x[242];
+    t3 = 0.07877322937044845 * t4;
+    t14 = t5 - t3;
+    t11 = (-C29) * t10;
+    t8 = C30 * t14;
+    t1 = t11 + t8;
+    t9 = C30 * t10;
+    t13 = C29 * t14;
+    t7 = t9 + t13;
+    t2 = x[2];
+    t0 = 0.00020042753244037563 * t2;
+    t6 = x[357];
+    t12 = 0.07446049988566894 * t6;
+    t4 = t0 - t12;
+    t5 = x[362];
+    t3 = 0.7009092642998509 * t4;
+    t11 = (-0.05321616832260418) * t5;
+    t8 = t3 + t11;
+    t10 = (-0.7132504491541816) * t4;
+    t14 = (-0.052295382964127016) * t5;
+    t9 = t10 + t14;
+    t13 = x[122];
+    t2 = 0.045101641160831665 * t13;
+    t6 = x[237];
+    t0 = 0.07904112455093797 * t6;
+    t12 = t2 - t0;
+    t3 = x[482];
+    t11 = 0.06568628740452798 * t3;
+    t4 = x[597];
+    t5 = 0.00806262304799125 * t4;
+    t10 = t11 + t5;
+    t14 = C31 * t12;
+    t13 = (-C32) * t10;
+    t6 = t14 + t13;
+    t2 = (-C32) * t12;
+    t0 = (-C31) * t10;
+    t3 = t2 + t0;
+    t4 = t8 + t6;
+    t11 = t9 + t3;
+    t5 = C8 * t4;
+    t14 = t1 - t5;
+    t13 = C8 * t11;
+    t12 = t7 - t13;
+    t10 = t8 - t6;
+    t2 = C9 * t10;
+    t0 = t9 - t3;
+    t5 = C9 * t0;
+    t13 = t1 + t4;
+    t8 = t7 + t11;
+    t6 = t14 + t5;
+    t10 = t12 - t2;
+    t9 = t14 - t5;
+    t3 = t12 + t2;
+    t0 = t6 + t10;
+    t1 = C17 * t0;
+    t4 = t6 * (-C18);
+    t7 = t10 * (-C19);
+    t11 = t1 - t7;
+    t14 = t1 + t4;
+    t5 = t9 + t3;
+    t12 = (-C22) * t5;
+    t2 = t9 * C23;
+    t0 = t3 * (-C24);
+    t6 = t12 - t0;
+    t10 = t12 + t2;
+    re[31] = t13;
+    im[31] = t8;
+    re[91] = t11;
+    im[91] = t14;
+    re[151] = t6;
+    im[151] = t10;
+    t7 = re[171];
+    t1 = im[171];
+    t4 = re[11];
+    t5 = im[11];
+    t9 = re[31];
+    t3 = im[31];
+    t0 = t4 + t9;
+    t12 = t5 + t3;
+    t2 = C8 * t0;
+    t13 = t7 - t2;
+    t8 = C8 * t12;
+    t11 = t1 - t8;
+    t14 = t4 - t9;
+    t6 = C9 * t14;
+    t10 = t5 - t3;
+    t2 = C9 * t10;
+    t8 = t7 + t0;
+    t4 = t1 + t12;
+    t9 = t13 + t2;
+    t14 = t11 - t6;
+    t5 = t13 - t2;
+    t3 = t11 + t6;
+    re[171] = t8;
+    im[171] = t4;
+    re[11] = t9;
+    im[11] = t14;
+    re[31] = t5;
+    im[31] = t3;
+    t10 = re[51];
+    t7 = im[51];
+    t0 = re[71];
+    t1 = im[71];
+    t12 = re[91];
+    t13 = im[91];
+    t2 = t0 + t12;
+    t11 = t1 + t13;
+    t6 = C8 * t2;
+    t8 = t10 - t6;
+    t4 = C8 * t11;
+    t9 = t7 - t4;
+    t14 = t0 - t12;
+    t5 = C9 * t14;
+    t3 = t1 - t13;
+    t6 = C9 * t3;
+    t4 = t10 + t2;
+    t0 = t7 + t11;
+    t12 = t8 + t6;
+    t14 = t9 - t5;
+    t1 = t8 - t6;
+    t13 = t9 + t5;
+    re[51] = t4;
+    im[51] = t0;
+    re[71] = t12;
+    im[71] = t14;
+    re[91] = t1;
+    im[91] = t13;
+    t3 = re[111];
+    t10 = im[111];
+    t2 = re[131];
+    t7 = im[131];
+    t11 = re[151];
+    t8 = im[151];
+    t6 = t2 + t11;
+    t9 = t7 + t8;
+    t5 = C8 * t6;
+    t4 = t3 - t5;
+    t0 = C8 * t9;
+    t12 = t10 - t0;
+    t14 = t2 - t11;
+    t1 = C9 * t14;
+    t13 = t7 - t8;
+    t5 = C9 * t13;
+    t0 = t3 + t6;
+    t2 = t10 + t9;
+    t11 = t4 + t5;
+    t14 = t12 - t1;
+    t7 = t4 - t5;
+    t8 = t12 + t1;
+    re[111] = t0;
+    im[111] = t2;
+    re[131] = t11;
+    im[131] = t14;
+    re[151] = t7;
+    im[151] = t8;
+    t13 = x[485];
+    t3 = 0.06473562177238838 * t13;
+    t6 = x[594];
+    t10 = 0.009201834299866771 * t6;
+    t9 = t3 + t10;
+    t4 = x[125];
+    t5 = 0.04685099768320636 * t4;
+    t12 = x[234];
+    t1 = 0.07915951523735842 * t12;
+    t0 = t5 - t1;
+    t2 = (-C33) * t9;
+    t11 = C34 * t0;
+    t14 = t2 + t11;
+    t7 = C34 * t9;
+    t8 = C33 * t0;
+    t13 = t7 + t8;
+    t6 = x[365];
+    t3 = x[5];
+    t10 = 0.0003319606381975926 * t3;
+    t4 = x[354];
+    t12 = 0.07437135293666741 * t4;
+    t5 = t10 - t12;
+    t1 = (-0.054185616606526515) * t6;
+    t2 = 0.6883545756937539 * t5;
+    t11 = t1 + t2;
+    t9 = 0.05142023018519102 * t6;
+    t0 = 0.7253743710122876 * t5;
+    t7 = t9 + t0;
+    t8 = x[114];
+    t3 = 0.04039134932676299 * t8;
+    t4 = x[245];
+    t10 = 0.07857505943811341 * t4;
+    t12 = t3 - t10;
+    t1 = x[474];
+    t2 = 0.06793559503952946 * t1;
+    t6 = x[605];
+    t5 = 0.005385116887313331 * t6;
+    t9 = t2 + t5;
+    t0 = C35 * t12;
+    t8 = (-C36) * t9;
+    t4 = t0 + t8;
+    t3 = (-C36) * t12;
+    t10 = (-C35) * t9;
+    t1 = t3 + t10;
+    t6 = t11 + t4;
+    t2 = t7 + t1;
+    t5 = C8 * t6;
+    t0 = t14 - t5;
+    t8 = C8 * t2;
+    t12 = t13 - t8;
+    t9 = t11 - t4;
+    t3 = C9 * t9;
+    t10 = t7 - t1;
+    t5 = C9 * t10;
+    t8 = t14 + t6;
+    t11 = t13 + t2;
+    t4 = t0 + t5;
+    t9 = t12 - t3;
+    t7 = t0 - t5;
+    t1 = t12 + t3;
+    re[27] = t8;
+    im[27] = t11;
+    re[87] = t4;
+    im[87] = t9;
+    re[147] = t7;
+    im[147] = t1;
+    t10 = x[445];
+    t14 = 0.07303676015017009 * t10;
+    t6 = x[634];
+    t13 = 0.0002998948177058382 * t6;
+    t2 = t14 + t13;
+    t0 = x[85];
+    t5 = 0.023859207739252954 * t0;
+    t12 = x[274];
+    t3 = 0.07596722926088151 * t12;
+    t8 = t5 - t3;
+    t11 = (-C37) * t2;
+    t4 = C38 * t8;
+    t9 = t11 + t4;
+    t7 = C38 * t2;
+    t1 = C37 * t8;
+    t10 = t7 + t1;
+    t6 = x[34];
+    t14 = 0.004113242104958822 * t6;
+    t13 = x[325];
+    t0 = 0.07378627797693389 * t13;
+    t12 = t14 - t0;
+    t5 = x[394];
+    t3 = 0.5948227867513413 * t12;
+    t11 = (-0.06052441687422548) * t5;
+    t4 = t3 + t11;
+    t2 = (-0.8038568606172173) * t12;
+    t8 = (-0.044785712575724224) * t5;
+    t7 = t2 + t8;
+    t1 = x[154];
+    t6 = 0.0623711620920472 * t1;
+    t13 = x[205];
+    t14 = 0.07797231412824676 * t13;
+    t0 = t6 - t14;
+    t3 = x[514];
+    t11 = 0.052559051234607114 * t3;
+    t12 = x[565];
+    t5 = 0.023366643389733904 * t12;
+    t2 = t11 + t5;
+    t8 = C39 * t0;
+    t1 = (-C40) * t2;
+    t13 = t8 + t1;
+    t6 = (-C40) * t0;
+    t14 = (-C39) * t2;
+    t3 = t6 + t14;
+    t12 = t4 + t13;
+    t11 = t7 + t3;
+    t5 = C8 * t12;
+    t8 = t9 - t5;
+    t1 = C8 * t11;
+    t0 = t10 - t1;
+    t2 = t4 - t13;
+    t6 = C9 * t2;
+    t14 = t7 - t3;
+    t5 = C9 * t14;
+    t1 = t9 + t12;
+    t4 = t10 + t11;
+    t13 = t8 + t5;
+    t2 = t0 - t6;
+    t7 = t8 - t5;
+    t3 = t0 + t6;
+    t14 = t13 + t2;
+    t9 = C14 * t14;
+    t12 = t13 * (-C15);
+    t10 = t2 * C16;
+    t11 = t9 - t10;
+    t8 = t9 + t12;
+    t5 = t7 + t3;
+    t0 = C17 * t5;
+    t6 = t7 * (-C18);
+    t14 = t3 * (-C19);
+    t13 = t0 - t14;
+    t2 = t0 + t6;
+    re[47] = t1;
+    im[47] = t4;
+    re[107] = t11;
+    im[107] = t8;
+    re[167] = t13;
+    im[167] = t2;
+    t10 = x[405];
+    t9 = x[45];
+    t12 = 0.006958960986894562 * t9;
+    t5 = x[314];
+    t7 = 0.07382038068434472 * t5;
+    t3 = t12 - t7;
+    t14 = (-0.06275636847896582) * t10;
+    t0 = 0.5519369853120581 * t3;
+    t6 = t14 + t0;
+    t1 = 0.04153753416930389 * t10;
+    t4 = 0.8338858220671682 * t3;
+    t11 = t1 + t4;
+    t8 = x[74];
+    t13 = 0.018302264227918173 * t8;
+    t2 = x[285];
+    t9 = 0.07504004884192814 * t2;
+    t5 = t13 - t9;
+    t12 = x[434];
+    t7 = 0.44619781310980877 * t5;
+    t14 = (-0.06625605448270583) * t12;
+    t0 = t7 + t14;
+    t10 = (-0.8949343616020251) * t5;
+    t3 = (-0.033034050187263235) * t12;
+    t1 = t10 + t3;
+    t4 = x[525];
+    t8 = 0.04671160914268008 * t4;
+    t2 = x[554];
+    t13 = 0.029743628280473965 * t2;
+    t9 = t8 + t13;
+    t7 = x[165];
+    t14 = 0.06720997326121436 * t7;
+    t5 = x[194];
+    t12 = 0.07613711365134428 * t5;
+    t10 = t14 - t12;
+    t3 = (-C41) * t9;
+    t4 = C42 * t10;
+    t2 = t3 + t4;
+    t8 = C42 * t9;
+    t13 = C41 * t10;
+    t7 = t8 + t13;
+    t5 = t0 + t2;
+    t14 = t1 + t7;
+    t12 = C8 * t5;
+    t3 = t6 - t12;
+    t4 = C8 * t14;
+    t9 = t11 - t4;
+    t10 = t0 - t2;
+    t8 = C9 * t10;
+    t13 = t1 - t7;
+    t12 = C9 * t13;
+    t4 = t6 + t5;
+    t0 = t11 + t14;
+    t2 = t3 + t12;
+    t10 = t9 - t8;
+    t1 = t3 - t12;
+    t7 = t9 + t8;
+    t13 = t2 + t10;
+    t6 = C17 * t13;
+    t5 = t2 * (-C18);
+    t11 = t10 * (-C19);
+    t14 = t6 - t11;
+    t3 = t6 + t5;
+    t12 = t1 + t7;
+    t9 = (-C22) * t12;
+    t8 = t1 * C23;
+    t13 = t7 * (-C24);
+    t2 = t9 - t13;
+    t10 = t9 + t8;
+    re[67] = t4;
+    im[67] = t0;
+    re[127] = t14;
+    im[127] = t3;
+    re[7] = t2;
+    im[7] = t10;
+    t11 = re[27];
+    t6 = im[27];
+    t5 = re[47];
+    t12 = im[47];
+    t1 = re[67];
+    t7 = im[67];
+    t13 = t5 + t1;
+    t9 = t12 + t7;
+    t8 = C8 * t13;
+    t4 = t11 - t8;
+    t0 = C8 * t9;
+    t14 = t6 - t0;
+    t3 = t5 - t1;
+    t2 = C9 * t3;
+    t10 = t12 - t7;
+    t8 = C9 * t10;
+    t0 = t11 + t13;
+    t5 = t6 + t9;
+    t1 = t4 + t8;
+    t3 = t14 - t2;
+    t12 = t4 - t8;
+    t7 = t14 + t2;
+    re[27] = t0;
+    im[27] = t5;
+    re[47] = t1;
+    im[47] = t3;
+    re[67] = t12;
+    im[67] = t7;
+    t10 = re[87];
+    t11 = im[87];
+    t13 = re[107];
+    t6 = im[107];
+    t9 = re[127];
+    t4 = im[127];
+    t8 = t13 + t9;
+    t14 = t6 + t4;
+    t2 = C8 * t8;
+    t0 = t10 - t2;
+    t5 = C8 * t14;
+    t1 = t11 - t5;
+    t3 = t13 - t9;
+    t12 = C9 * t3;
+    t7 = t6 - t4;
+    t2 = C9 * t7;
+    t5 = t10 + t8;
+    t13 = t11 + t14;
+    t9 = t0 + t2;
+    t3 = t1 - t12;
+    t6 = t0 - t2;
+    t4 = t1 + t12;
+    re[87] = t5;
+    im[87] = t13;
+    re[107] = t9;
+    im[107] = t3;
+    re[127] = t6;
+    im[127] = t4;
+    t7 = re[147];
+    t10 = im[147];
+    t8 = re[167];
+    t11 = im[167];
+    t14 = re[7];
+    t0 = im[7];
+    t2 = t8 + t14;
+    t1 = t11 + t0;
+    t12 = C8 * t2;
+    t5 = t7 - t12;
+    t13 = C8 * t1;
+    t9 = t10 - t13;
+    t3 = t8 - t14;
+    t6 = C9 * t3;
+    t4 = t11 - t0;
+    t12 = C9 * t4;
+    t13 = t7 + t2;
+    t8 = t10 + t1;
+    t14 = t5 + t12;
+    t3 = t9 - t6;
+    t11 = t5 - t12;
+    t0 = t9 + t6;
+    re[147] = t13;
+    im[147] = t8;
+    re[167] = t14;
+    im[167] = t3;
+    re[7] = t11;
+    im[7] = t0;
+    t4 = x[413];
+    t7 = x[53];
+    t2 = 0.009546221162544678 * t7;
+    t10 = x[306];
+    t1 = 0.07397825346062925 * t10;
+    t5 = t2 - t1;
+    t12 = (-0.06403084123212126) * t4;
+    t9 = 0.5224985647159488 * t5;
+    t6 = t12 + t9;
+    t13 = 0.03923814997230676 * t4;
+    t8 = 0.8526401643540922 * t5;
+    t14 = t13 + t8;
+    t3 = x[66];
+    t11 = 0.014650456311092089 * t3;
+    t0 = x[293];
+    t7 = 0.07451688988783449 * t0;
+    t10 = t11 - t7;
+    t2 = x[426];
+    t1 = 0.4771587602596084 * t10;
+    t12 = (-0.06551960635924976) * t2;
+    t9 = t1 + t12;
+    t4 = (-0.8788171126619654) * t10;
+    t5 = (-0.035574243710821435) * t2;
+    t13 = t4 + t5;
+    t8 = x[533];
+    t3 = 0.04217005188954833 * t8;
+    t0 = x[546];
+    t11 = 0.03450067624018114 * t0;
+    t7 = t3 + t11;
+    t1 = x[173];
+    t12 = 0.07025377921076166 * t1;
+    t10 = x[186];
+    t2 = 0.07426485204615321 * t10;
+    t4 = t12 - t2;
+    t5 = (-C43) * t7;
+    t8 = C44 * t4;
+    t0 = t5 + t8;
+    t3 = C44 * t7;
+    t11 = C43 * t4;
+    t1 = t3 + t11;
+    t10 = t9 + t0;
+    t12 = t13 + t1;
+    t2 = C8 * t10;
+    t5 = t6 - t2;
+    t8 = C8 * t12;
+    t7 = t14 - t8;
+    t4 = t9 - t0;
+    t3 = C9 * t4;
+    t11 = t13 - t1;
+    t2 = C9 * t11;
+    t8 = t6 + t10;
+    t9 = t14 + t12;
+    t0 = t5 + t2;
+    t4 = t7 - t3;
+    t13 = t5 - t2;
+    t1 = t7 + t3;
+    re[63] = t8;
+    im[63] = t9;
+    re[123] = t0;
+    im[123] = t4;
+    re[3] = t13;
+    im[3] = t1;
+    t11 = x[373];
+    t6 = x[13];
+    t10 = 0.000885182709137595 * t6;
+    t14 = x[346];
+    t12 = 0.07414729844179238 * t14;
+    t5 = t10 - t12;
+    t2 = (-0.05611620656362614) * t11;
+    t7 = 0.6626200482157375 * t5;
+    t3 = t2 + t7;
+    t8 = 0.049647425697880124 * t11;
+    t9 = 0.7489557207890022 * t5;
+    t0 = t8 + t9;
+    t4 = x[106];
+    t13 = 0.035678446679014125 * t4;
+    t1 = x[253];
+    t6 = 0.07794177142410044 * t1;
+    t14 = t13 - t6;
+    t10 = x[466];
+    t12 = 0.06978698274465173 * t10;
+    t2 = x[613];
+    t7 = 0.0032578351613788224 * t2;
+    t11 = t12 + t7;
+    t5 = C45 * t14;
+    t8 = (-C46) * t11;
+    t9 = t5 + t8;
+    t4 = (-C46) * t14;
+    t1 = (-C45) * t11;
+    t13 = t4 + t1;
+    t6 = x[493];
+    t10 = 0.06191075522297103 * t6;
+    t2 = x[586];
+    t12 = 0.012577110492092577 * t2;
+    t7 = t10 + t12;
+    t5 = x[133];
+    t8 = 0.051426496623277064 * t5;
+    t14 = x[226];
+    t11 = 0.07928765862449144 * t14;
+    t4 = t8 - t11;
+    t1 = (-C47) * t7;
+    t6 = C48 * t4;
+    t2 = t1 + t6;
+    t10 = C48 * t7;
+    t12 = C47 * t4;
+    t5 = t10 + t12;
+    t14 = t9 + t2;
+    t8 = t13 + t5;
+    t11 = C8 * t14;
+    t1 = t3 - t11;
+    t6 = C8 * t8;
+    t7 = t0 - t6;
+    t4 = t9 - t2;
+    t10 = C9 * t4;
+    t12 = t13 - t5;
+    t11 = C9 * t12;
+    t6 = t3 + t14;
+    t9 = t0 + t8;
+    t2 = t1 + t11;
+    t4 = t7 - t10;
+    t13 = t1 - t11;
+    t5 = t7 + t10;
+    t12 = t2 + t4;
+    t3 = C14 * t12;
+    t14 = t2 * (-C15);
+    t0 = t4 * C16;
+    t8 = t3 - t0;
+    t1 = t3 + t14;
+    t11 = t13 + t5;
+    t7 = C17 * t11;
+    t10 = t13 * (-C18);
+    t12 = t5 * (-C19);
+    t2 = t7 - t12;
+    t4 = t7 + t10;
+    re[83] = t6;
+    im[83] = t9;
+    re[143] = t8;
+    im[143] = t1;
+    re[23] = t2;
+    im[23] = t4;
+    t0 = x[26];
+    t3 = 0.00255366426502586 * t0;
+    t14 = x[333];
+    t11 = 0.07387046604939465 * t14;
+    t13 = t3 - t11;
+    t5 = x[386];
+    t12 = 0.6225146366376195 * t13;
+    t7 = (-0.05885739357211152) * t5;
+    t10 = t12 + t7;
+    t6 = (-0.7826081568524139) * t13;
+    t9 = (-0.04681728480871168) * t5;
+    t8 = t6 + t9;
+    t1 = x[146];
+    t2 = 0.058431520258171214 * t1;
+    t4 = x[213];
+    t0 = 0.07879064723850839 * t4;
+    t14 = t2 - t0;
+    t3 = x[506];
+    t11 = 0.05643381030579669 * t3;
+    t12 = x[573];
+    t7 = 0.018981178489387872 * t12;
+    t13 = t11 + t7;
+    t5 = C49 * t14;
+    t6 = (-C50) * t13;
+    t9 = t5 + t6;
+    t1 = (-C50) * t14;
+    t4 = (-C49) * t13;
+    t2 = t1 + t4;
+    t0 = x[453];
+    t3 = 0.07203917486596162 * t0;
+    t12 = x[626];
+    t11 = 0.001004420079138153 * t12;
+    t7 = t3 + t11;
+    t5 = x[93];
+    t6 = 0.028215773590490503 * t5;
+    t14 = x[266];
+    t13 = 0.07672513012950198 * t14;
+    t1 = t6 - t13;
+    t4 = (-C51) * t7;
+    t0 = C52 * t1;
+    t12 = t4 + t0;
+    t3 = C52 * t7;
+    t11 = C51 * t1;
+    t5 = t3 + t11;
+    t14 = t9 + t12;
+    t6 = t2 + t5;
+    t13 = C8 * t14;
+    t4 = t10 - t13;
+    t0 = C8 * t6;
+    t7 = t8 - t0;
+    t1 = t9 - t12;
+    t3 = C9 * t1;
+    t11 = t2 - t5;
+    t13 = C9 * t11;
+    t0 = t10 + t14;
+    t9 = t8 + t6;
+    t12 = t4 + t13;
+    t1 = t7 - t3;
+    t2 = t4 - t13;
+    t5 = t7 + t3;
+    t11 = t12 + t1;
+    t10 = C17 * t11;
+    t14 = t12 * (-C18);
+    t8 = t1 * (-C19);
+    t6 = t10 - t8;
+    t4 = t10 + t14;
+    t13 = t2 + t5;
+    t7 = (-C22) * t13;
+    t3 = t2 * C23;
+    t11 = t5 * (-C24);
+    t12 = t7 - t11;
+    t1 = t7 + t3;
+    re[103] = t0;
+    im[103] = t9;
+    re[163] = t6;
+    im[163] = t4;
+    re[43] = t12;
+    im[43] = t1;
+    t8 = re[63];
+    t10 = im[63];
+    t14 = re[83];
+    t13 = im[83];
+    t2 = re[103];
+    t5 = im[103];
+    t11 = t14 + t2;
+    t7 = t13 + t5;
+    t3 = C8 * t11;
+    t0 = t8 - t3;
+    t9 = C8 * t7;
+    t6 = t10 - t9;
+    t4 = t14 - t2;
+    t12 = C9 * t4;
+    t1 = t13 - t5;
+    t3 = C9 * t1;
+    t9 = t8 + t11;
+    t14 = t10 + t7;
+    t2 = t0 + t3;
+    t4 = t6 - t12;
+    t13 = t0 - t3;
+    t5 = t6 + t12;
+    re[63] = t9;
+    im[63] = t14;
+    re[83] = t2;
+    im[83] = t4;
+    re[103] = t13;
+    im[103] = t5;
+    t1 = re[123];
+    t8 = im[123];
+    t11 = re[143];
+    t10 = im[143];
+    t7 = re[163];
+    t0 = im[163];
+    t3 = t11 + t7;
+    t6 = t10 + t0;
+    t12 = C8 * t3;
+    t9 = t1 - t12;
+    t14 = C8 * t6;
+    t2 = t8 - t14;
+    t4 = t11 - t7;
+    t13 = C9 * t4;
+    t5 = t10 - t0;
+    t12 = C9 * t5;
+    t14 = t1 + t3;
+    t11 = t8 + t6;
+    t7 = t9 + t12;
+    t4 = t2 - t13;
+    t10 = t9 - t12;
+    t0 = t2 + t13;
+    re[123] = t14;
+    im[123] = t11;
+    re[143] = t7;
+    im[143] = t4;
+    re[163] = t10;
+    im[163] = t0;
+    t5 = re[3];
+    t1 = im[3];
+    t3 = re[23];
+    t8 = im[23];
+    t6 = re[43];
+    t9 = im[43];
+    t12 = t3 + t6;
+    t2 = t8 + t9;
+    t13 = C8 * t12;
+    t14 = t5 - t13;
+    t11 = C8 * t2;
+    t7 = t1 - t11;
+    t4 = t3 - t6;
+    t10 = C9 * t4;
+    t0 = t8 - t9;
+    t13 = C9 * t0;
+    t11 = t5 + t12;
+    t3 = t1 + t2;
+    t6 = t14 + t13;
+    t4 = t7 - t10;
+    t8 = t14 - t13;
+    t9 = t7 + t10;
+    re[3] = t11;
+    im[3] = t3;
+    re[23] = t6;
+    im[23] = t4;
+    re[43] = t8;
+    im[43] = t9;
+    t0 = x[18];
+    t5 = 0.0014056274459970663 * t0;
+    t12 = x[341];
+    t1 = 0.07402454839865644 * t12;
+    t2 = t5 - t1;
+    t14 = x[378];
+    t13 = 0.6494480483301837 * t2;
+    t7 = (-0.057068603295167324) * t14;
+    t10 = t13 + t7;
+    t11 = (-0.7604059656000309) * t2;
+    t3 = (-0.048741191820779156) * t14;
+    t6 = t11 + t3;
+    t4 = x[138];
+    t8 = 0.054195119903981286 * t4;
+    t9 = x[221];
+    t0 = 0.07920922261372015 * t9;
+    t12 = t8 - t0;
+    t5 = x[498];
+    t1 = 0.05993109228259522 * t5;
+    t13 = x[581];
+    t7 = 0.01491758532673113 * t13;
+    t2 = t1 + t7;
+    t14 = C53 * t12;
+    t11 = (-C54) * t2;
+    t3 = t14 + t11;
+    t4 = (-C54) * t12;
+    t9 = (-C53) * t2;
+    t8 = t4 + t9;
+    t0 = x[461];
+    t5 = 0.07075673271981794 * t0;
+    t13 = x[618];
+    t1 = 0.0022163732028366626 * t13;
+    t7 = t5 + t1;
+    t14 = x[101];
+    t11 = 0.0327669483767956 * t14;
+    t12 = x[258];
+    t2 = 0.07748989472063063 * t12;
+    t4 = t11 - t2;
+    t9 = (-C55) * t7;
+    t0 = C56 * t4;
+    t13 = t9 + t0;
+    t5 = C56 * t7;
+    t1 = C55 * t4;
+    t14 = t5 + t1;
+    t12 = t3 + t13;
+    t11 = t8 + t14;
+    t2 = C8 * t12;
+    t9 = t10 - t2;
+    t0 = C8 * t11;
+    t7 = t6 - t0;
+    t4 = t3 - t13;
+    t5 = C9 * t4;
+    t1 = t8 - t14;
+    t2 = C9 * t1;
+    t0 = t10 + t12;
+    t3 = t6 + t11;
+    t13 = t9 + t2;
+    t4 = t7 - t5;
+    t8 = t9 - t2;
+    t14 = t7 + t5;
+    re[99] = t0;
+    im[99] = t3;
+    re[159] = t13;
+    im[159] = t4;
+    re[39] = t8;
+    im[39] = t14;
+    t1 = x[58];
+    t10 = 0.011380873256119571 * t1;
+    t12 = x[301];
+    t6 = 0.07414191207430397 * t12;
+    t11 = t10 - t6;
+    t9 = x[418];
+    t2 = 0.5075383629607041 * t11;
+    t7 = (-0.06456305934384718) * t9;
+    t5 = t2 + t7;
+    t0 = (-0.8616291604415258) * t11;
+    t3 = (-0.03803054835135747) * t9;
+    t13 = t0 + t3;
+    t4 = x[178];
+    t8 = 0.07193658763695611 * t4;
+    t14 = x[181];
+    t1 = 0.07286276255040021 * t14;
+    t12 = t8 - t1;
+    t10 = x[538];
+    t6 = 0.03924810154316684 * t10;
+    t2 = x[541];
+    t7 = 0.037475094952612274 * t2;
+    t11 = t6 + t7;
+    t9 = C57 * t12;
+    t0 = (-C58) * t11;
+    t3 = t9 + t0;
+    t4 = (-C58) * t12;
+    t14 = (-C57) * t11;
+    t8 = t4 + t14;
+    t1 = x[421];
+    t10 = x[61];
+    t2 = 0.012560244466040787 * t10;
+    t6 = x[298];
+    t7 = 0.0742656761333236 * t6;
+    t9 = t2 - t7;
+    t0 = (-0.06510826634376644) * t1;
+    t12 = 0.49242356010346705 * t9;
+    t11 = t0 + t12;
+    t4 = 0.03683648473230202 * t1;
+    t14 = 0.8703556959398997 * t9;
+    t10 = t4 + t14;
+    t6 = t3 + t11;
+    t2 = t8 + t10;
+    t7 = C8 * t6;
+    t0 = t5 - t7;
+    t12 = C8 * t2;
+    t1 = t13 - t12;
+    t9 = t3 - t11;
+    t4 = C9 * t9;
+    t14 = t8 - t10;
+    t7 = C9 * t14;
+    t12 = t5 + t6;
+    t3 = t13 + t2;
+    t11 = t0 + t7;
+    t9 = t1 - t4;
+    t8 = t0 - t7;
+    t10 = t1 + t4;
+    t14 = t11 + t9;
+    t5 = C14 * t14;
+    t6 = t11 * (-C15);
+    t13 = t9 * C16;
+    t2 = t5 - t13;
+    t0 = t5 + t6;
+    t7 = t8 + t10;
+    t1 = C17 * t7;
+    t4 = t8 * (-C18);
+    t14 = t10 * (-C19);
+    t11 = t1 - t14;
+    t9 = t1 + t4;
+    re[119] = t12;
+    im[119] = t3;
+    re[179] = t2;
+    im[179] = t0;
+    re[59] = t11;
+    im[59] = t9;
+    t13 = x[98];
+    t5 = 0.031041726260868836 * t13;
+    t6 = x[261];
+    t7 = 0.07720681608342408 * t6;
+    t8 = t5 - t7;
+    t10 = x[458];
+    t14 = 0.07127424888219953 * t10;
+    t1 = x[621];
+    t4 = 0.0016976417542155023 * t1;
+    t12 = t14 + t4;
+    t3 = C59 * t8;
+    t2 = (-C60) * t12;
+    t0 = t3 + t2;
+    t11 = (-C60) * t8;
+    t9 = (-C59) * t12;
+    t13 = t11 + t9;
+    t6 = x[501];
+    t5 = 0.05866627461180603 * t6;
+    t7 = x[578];
+    t10 = 0.016397980292607583 * t7;
+    t1 = t5 + t10;
+    t14 = x[141];
+    t4 = 0.05581446591090588 * t14;
+    t3 = x[218];
+    t2 = 0.07909673955285182 * t3;
+    t8 = t4 - t2;
+    t12 = (-C61) * t1;
+    t11 = C62 * t8;
+    t9 = t12 + t11;
+    t6 = C62 * t1;
+    t7 = C61 * t8;
+    t5 = t6 + t7;
+    t10 = x[381];
+    t14 = x[21];
+    t3 = 0.0017892804740102255 * t14;
+    t4 = x[338];
+    t2 = 0.0739598233310438 * t4;
+    t12 = t3 - t2;
+    t11 = (-0.05796124230658557) * t10;
+    t1 = 0.636078220277764 * t12;
+    t8 = t11 + t1;
+    t6 = 0.04777956100050288 * t10;
+    t7 = 0.77162458338772 * t12;
+    t14 = t6 + t7;
+    t4 = t9 + t8;
+    t3 = t5 + t14;
+    t2 = C8 * t4;
+    t11 = t0 - t2;
+    t1 = C8 * t3;
+    t10 = t13 - t1;
+    t12 = t9 - t8;
+    t6 = C9 * t12;
+    t7 = t5 - t14;
+    t2 = C9 * t7;
+    t1 = t0 + t4;
+    t9 = t13 + t3;
+    t8 = t11 + t2;
+    t12 = t10 - t6;
+    t5 = t11 - t2;
+    t14 = t10 + t6;
+    t7 = t8 + t12;
+    t0 = C17 * t7;
+    t4 = t8 * (-C18);
+    t13 = t12 * (-C19);
+    t3 = t0 - t13;
+    t11 = t0 + t4;
+    t2 = t5 + t14;
+    t10 = (-C22) * t2;
+    t6 = t5 * C23;
+    t7 = t14 * (-C24);
+    t8 = t10 - t7;
+    t12 = t10 + t6;
+    re[139] = t1;
+    im[139] = t9;
+    re[19] = t3;
+    im[19] = t11;
+    re[79] = t8;
+    im[79] = t12;
+    t13 = re[99];
+    t0 = im[99];
+    t4 = re[119];
+    t2 = im[119];
+    t5 = re[139];
+    t14 = im[139];
+    t7 = t4 + t5;
+    t10 = t2 + t14;
+    t6 = C8 * t7;
+    t1 = t13 - t6;
+    t9 = C8 * t10;
+    t3 = t0 - t9;
+    t11 = t4 - t5;
+    t8 = C9 * t11;
+    t12 = t2 - t14;
+    t6 = C9 * t12;
+    t9 = t13 + t7;
+    t4 = t0 + t10;
+    t5 = t1 + t6;
+    t11 = t3 - t8;
+    t2 = t1 - t6;
+    t14 = t3 + t8;
+    re[99] = t9;
+    im[99] = t4;
+    re[119] = t5;
+    im[119] = t11;
+    re[139] = t2;
+    im[139] = t14;
+    t12 = re[159];
+    t13 = im[159];
+    t7 = re[179];
+    t0 = im[179];
+    t10 = re[19];
+    t1 = im[19];
+    t6 = t7 + t10;
+    t3 = t0 + t1;
+    t8 = C8 * t6;
+    t9 = t12 - t8;
+    t4 = C8 * t3;
+    t5 = t13 - t4;
+    t11 = t7 - t10;
+    t2 = C9 * t11;
+    t14 = t0 - t1;
+    t8 = C9 * t14;
+    t4 = t12 + t6;
+    t7 = t13 + t3;
+    t10 = t9 + t8;
+    t11 = t5 - t2;
+    t0 = t9 - t8;
+    t1 = t5 + t2;
+    re[159] = t4;
+    im[159] = t7;
+    re[179] = t10;
+    im[179] = t11;
+    re[19] = t0;
+    im[19] = t1;
+    t14 = re[39];
+    t12 = im[39];
+    t6 = re[59];
+    t13 = im[59];
+    t3 = re[79];
+    t9 = im[79];
+    t8 = t6 + t3;
+    t5 = t13 + t9;
+    t2 = C8 * t8;
+    t4 = t14 - t2;
+    t7 = C8 * t5;
+    t10 = t12 - t7;
+    t11 = t6 - t3;
+    t0 = C9 * t11;
+    t1 = t13 - t9;
+    t2 = C9 * t1;
+    t7 = t14 + t8;
+    t6 = t12 + t5;
+    t3 = t4 + t2;
+    t11 = t10 - t0;
+    t13 = t4 - t2;
+    t9 = t10 + t0;
+    re[39] = t7;
+    im[39] = t6;
+    re[59] = t3;
+    im[59] = t11;
+    re[79] = t13;
+    im[79] = t9;
+    t1 = re[135];
+    t14 = im[135];
+    t8 = re[171];
+    t12 = im[171];
+    t5 = re[27];
+    t4 = im[27];
+    t2 = re[63];
+    t10 = im[63];
+    t0 = re[99];
+    t7 = im[99];
+    t6 = t8 + t0;
+    t3 = t12 + t7;
+    t11 = t5 + t2;
+    t13 = t4 + t10;
+    t9 = t8 - t0;
+    t8 = t12 - t7;
+    t0 = t5 - t2;
+    t12 = t4 - t10;
+    t7 = t6 + t11;
+    t5 = t3 + t13;
+    t2 = t6 - t11;
+    t4 = C0 * t2;
+    t10 = t3 - t13;
+    t6 = C0 * t10;
+    t11 = C1 * t7;
+    t2 = t1 - t11;
+    t3 = C1 * t5;
+    t13 = t14 - t3;
+    t10 = t2 + t4;
+    t11 = t13 + t6;
+    t3 = t2 - t4;
+    t2 = t13 - t6;
+    t4 = C2 * t9;
+    t13 = C3 * t0;
+    t6 = t4 + t13;
+    t4 = C2 * t8;
+    t13 = C3 * t12;
+    t4 = t4 + t13;
+    t13 = C3 * t9;
+    t9 = C2 * t0;
+    t0 = t13 - t9;
+    t13 = C3 * t8;
+    t9 = C2 * t12;
+    t8 = t13 - t9;
+    t12 = t1 + t7;
+    t13 = t14 + t5;
+    t9 = t10 + t4;
+    t1 = t11 - t6;
+    t7 = t3 + t8;
+    t14 = t2 - t0;
+    t5 = t3 - t8;
+    t3 = t2 + t0;
+    t8 = t10 - t4;
+    t2 = t11 + t6;
+    re[135] = t12;
+    im[135] = t13;
+    re[171] = t9;
+    im[171] = t1;
+    re[27] = t7;
+    im[27] = t14;
+    re[63] = t5;
+    im[63] = t3;
+    re[99] = t8;
+    im[99] = t2;
+}
+
+/**
+ *  Part 5 of ApplyWindowedMDCT_W75_360().
+ * 
+ *  @param {Number[]} x 
+ *    - The input block (720 points).
+ *  @param {Number[]} X 
+ *    - The array that would contain the output block (360 points).
+ *  @param {Number[]} re 
+ *    - The scratch buffer (real part, 180 points).
+ *  @param {Number[]} im 
+ *    - The scratch buffer (imaginary part, 180 points).
+ */
+function ApplyWindowedMDCT_W75_360_Part5(x, X, re, im) {
+    let t0, t1, t10, t11, t12, t13, t14, t2, t3, t4, t5, t6, t7, t8, t9;
+    const C0 = 0.5590169943749475;
+    const C1 = 0.25;
+    const C2 = 0.9510565162951535;
+    const C3 = 0.5877852522924731;
+    const C4 = 0.9999976201773518;
+    const C5 = 0.0021816598343367697;
+    const C6 = 0.9230424487681941;
+    const C7 = 0.384698112514236;
+    const C8 = 0.7055624319347131;
+    const C9 = 0.7086477648609169;
+    const C10 = 0.38066693077854463;
+    const C11 = 0.9247122189155081;
+    const C12 = 0.37258290214410295;
+    const C13 = 0.9279989121921846;
+    const C14 = 0.9999405050001497;
+    const C15 = 0.010908091494182374;
+    const C16 = 0.9196502204050923;
+    const C17 = 0.39273842708457407;
+    const C18 = 0.6993515264033671;
+    const C19 = 0.7147778973340464;
+    const C20 = 0.6930873625456359;
+    const C21 = 0.7208535967029188;
+    const C22 = 0.36447049987914965;
+    const C23 = 0.9312149347588036;
+    const C24 = 0.9998072404820648;
+    const C25 = 0.0196336924606283;
+    const C26 = 0.916187957117136;
+    const C27 = 0.40074883310314097;
+    const C28 = 0.9126559225690792;
+    const C29 = 0.40872872054650483;
+    const C30 = 0.68677041740185;
+    const C31 = 0.7268744002795041;
+    const C32 = 0.3563303417745256;
+    const C33 = 0.9343600417027955;
+    const C34 = 0.9995978367717061;
+    const C35 = 0.02835779824537842;
+    const C36 = 0.9993123098159769;
+    const C37 = 0.037079744474000476;
+    const C38 = 0.9090543857390279;
+    const C39 = 0.4166774817153415;
+    const C40 = 0.6804011720318391;
+    const C41 = 0.7328398495562994;
+    const C42 = 0.34816304773478646;
+    const C43 = 0.9374339935120898;
+    const C44 = 0.3399692397309942;
+    const C45 = 0.9404365560933549;
+    const C46 = 0.9989506813588601;
+    const C47 = 0.04579886693652077;
+    const C48 = 0.9053836208979552;
+    const C49 = 0.4245945112807131;
+    const C50 = 0.6739801114782978;
+    const C51 = 0.7387494902412463;
+    const C52 = 0.6675077247298474;
+    const C53 = 0.7446028722923262;
+    const C54 = 0.3317495417533521;
+    const C55 = 0.9433675007898252;
+    const C56 = 0.9985129789397631;
+    const C57 = 0.05451450163800632;
+    const C58 = 0.9016439075888161;
+    const C59 = 0.4324792063301662;
+    const C60 = 0.8978355306052577;
+    const C61 = 0.44033096641364594;
+    const C62 = 0.6609845046837974;
+    const C63 = 0.750399549951834;
+    const C64 = 0.3235045797636848;
+    const C65 = 0.9462266043987146;
+    const C66 = 0.9979992358914197;
+    const C67 = 0.06322598484913067;
+    const C68 = 0.9974094913373519;
+    const C69 = 0.07193265315671939;
+    const C70 = 0.8939587799699321;
+    const C71 = 0.44814919358922256;
+    const C72 = 0.6544109481086103;
+    const C73 = 0.7561390817803227;
+    const C74 = 0.31523498164776964;
+    const C75 = 0.949013649188214;
+    const C76 = 0.3069413771675201;
+    const C77 = 0.9517284229140717;
+    const C78 = 0.996743790188891;
+    const C79 = 0.08063384351427165;
+    const C80 = 0.8900139509124098;
+    const C81 = 0.4559332924686272;
+    const C82 = 0.6477875556060698;
+    const C83 = 0.7618210306902226;
+    const C84 = 0.6411148315731583;
+    const C85 = 0.7674449639791253;
+    const C86 = 0.2986243979130275;
+    const C87 = 0.9543707188357582;
+    const C88 = 0.9960021831417567;
+    const C89 = 0.08932889329245366;
+    const C90 = 0.8860013438466962;
+    const C91 = 0.46368267026259297;
+    const C92 = 0.881921264348355;
+    const C93 = 0.47139673682599764;
+    const C94 = 0.6343932841636455;
+    const C95 = 0.773010453362737;
+    const C96 = 0.29028467725446233;
+    const C97 = 0.9569403357322088;
+    const C98 = 0.9951847266721969;
+    const C99 = 0.0980171403295606;
+    const C100 = 0.9942914830326867;
+    const C101 = 0.10669792298194263;
+    const C102 = 0.8777740231312368;
+    const C103 = 0.47907490470280634;
+    const C104 = 0.6276234252493902;
+    const C105 = 0.7785170750074935;
+    const C106 = 0.28192285029384145;
+    const C107 = 0.9594370779171484;
+    const C108 = 0.27353955381666206;
+    const C109 = 0.9618607552539928;
+    const C110 = 0.9933225202471875;
+    const C111 = 0.1153705801743918;
+    const C112 = 0.8735599360238168;
+    const C113 = 0.4867165891708081;
+    const C114 = 0.6208057703813592;
+    const C115 = 0.7839644095628366;
+    const C116 = 0.6139408387503664;
+    const C117 = 0.78935204219315;
+    const C118 = 0.265135426243408;
+    const C119 = 0.9642111831703293;
+    const C120 = 0.992277912105967;
+    const C121 = 0.12403445145048532;
+    const C122 = 0.8692793239451436;
+    const C123 = 0.4943212082861446;
+    const C124 = 0.8649325128804005;
+    const C125 = 0.5018881829276276;
+    const C126 = 0.6070291531475343;
+    const C127 = 0.7946795626093497;
+    const C128 = 0.256711107580932;
+    const C129 = 0.966488182671972;
+    const C130 = 0.9911577381599795;
+    const C131 = 0.13268887702288198;
+    const C132 = 0.9899620837148079;
+    const C133 = 0.14133319782356749;
+    const C134 = 0.860519833856079;
+    const C135 = 0.5094169368408418;
+    const C136 = 0.6000712399244809;
+    const C137 = 0.7999465651001297;
+    const C138 = 0.24826723937371628;
+    const C139 = 0.9686915803565931;
+    const C140 = 0.23980446465501654;
+    const C141 = 0.9708212084269281;
+    const C142 = 0.9886910398241674;
+    const C143 = 0.149966755554045;
+    const C144 = 0.8560416229147715;
+    const C145 = 0.5169068966820275;
+    const C146 = 0.5930676289532372;
+    const C147 = 0.8051526485628582;
+    const C148 = 0.5860188535858938;
+    const C149 = 0.8102974165341235;
+    const C150 = 0.23132342789789254;
+    const C151 = 0.9728769047035543;
+    const C152 = 0.9873447032829712;
+    const C153 = 0.15858889273546717;
+    const C154 = 0.851498221089579;
+    const C155 = 0.5243574920617445;
+    const C156 = 0.8468899743781412;
+    const C157 = 0.5317681555883085;
+    const C158 = 0.5789254506139857;
+    const C159 = 0.8153804772199257;
+    const C160 = 0.22282477496612907;
+    const C161 = 0.9748585126372411;
+    const C162 = 0.9859231766199597;
+    const C163 = 0.16719895275870564;
+    const C164 = 0.9844265680898916;
+    const C165 = 0.1757962799343545;
+    const C166 = 0.8422172337162865;
+    const C167 = 0.5391383229110002;
+    const C168 = 0.5717879602276122;
+    const C169 = 0.8204014435255136;
+    const C170 = 0.21430915306505077;
+    const C171 = 0.9767658813208724;
+    const C172 = 0.2057772106922349;
+    const C173 = 0.9785988655009383;
+    const C174 = 0.9828549916653012;
+    const C175 = 0.18438021954266337;
+    const C176 = 0.8374803549513079;
+    const C177 = 0.5464674327630434;
+    const C178 = 0.5646069259743004;
+    const C179 = 0.8253599330848638;
+    const C180 = 0.557382894717611;
+    const C181 = 0.8302555682897986;
+    const C182 = 0.19722959758812594;
+    const C183 = 0.9803573255885968;
+    const C184 = 0.9812085670278176;
+    const C185 = 0.19295011788339703;
+    const C186 = 0.8326796988148626;
+    const C187 = 0.553754927004347;
+    const C188 = 0.8278156308955021;
+    const C189 = 0.5610002506640098;
+    const C190 = 0.5501164165954934;
+    const C191 = 0.8350879763187431;
+    const C192 = 0.18866696468655522;
+    const C193 = 0.9820411276703039;
+    const C194 = 0.9794874195590514;
+    const C195 = 0.20150532232561713;
+    const C196 = 0.977691680331046;
+    const C197 = 0.2100451813573825;
+    const C198 = 0.8228885216108303;
+    const C199 = 0.5682028519825839;
+    const C200 = 0.5428080449783895;
+    const C201 = 0.8398567891651163;
+    const C202 = 0.1800899640651698;
+    const C203 = 0.9836501435180122;
+    const C204 = 0.17149924889577414;
+    const C205 = 0.9851842505989351;
+    const C206 = 0.9758214860962962;
+    const C207 = 0.21856904463536458;
+    const C208 = 0.8178987461792955;
+    const C209 = 0.5753621824540925;
+    const C210 = 0.5354583364270938;
+    const C211 = 0.8445616436653568;
+    t0 = re[15];
+    t10 = im[15];
+    t4 = re[51];
+    t11 = im[51];
+    t6 = re[87];
+    t12 = im[87];
+    t13 = re[123];
+    t9 = im[123];
+    t1 = re[159];
+    t7 = im[159];
+    t14 = t4 + t1;
+    t5 = t11 + t7;
+    t3 = t6 + t13;
+    t8 = t12 + t9;
+    t2 = t4 - t1;
+    t4 = t11 - t7;
+    t1 = t6 - t13;
+    t11 = t12 - t9;
+    t7 = t14 + t3;
+    t6 = t5 + t8;
+    t13 = t14 - t3;
+    t12 = C0 * t13;
+    t9 = t5 - t8;
+    t14 = C0 * t9;
+    t3 = C1 * t7;
+    t13 = t0 - t3;
+    t5 = C1 * t6;
+    t8 = t10 - t5;
+    t9 = t13 + t12;
+    t3 = t8 + t14;
+    t5 = t13 - t12;
+    t13 = t8 - t14;
+    t12 = C2 * t2;
+    t8 = C3 * t1;
+    t14 = t12 + t8;
+    t12 = C2 * t4;
+    t8 = C3 * t11;
+    t12 = t12 + t8;
+    t8 = C3 * t2;
+    t2 = C2 * t1;
+    t1 = t8 - t2;
+    t8 = C3 * t4;
+    t2 = C2 * t11;
+    t4 = t8 - t2;
+    t11 = t0 + t7;
+    t8 = t10 + t6;
+    t2 = t9 + t12;
+    t0 = t3 - t14;
+    t7 = t5 + t4;
+    t10 = t13 - t1;
+    t6 = t5 - t4;
+    t5 = t13 + t1;
+    t4 = t9 - t12;
+    t13 = t3 + t14;
+    re[15] = t11;
+    im[15] = t8;
+    re[51] = t2;
+    im[51] = t0;
+    re[87] = t7;
+    im[87] = t10;
+    re[123] = t6;
+    im[123] = t5;
+    re[159] = t4;
+    im[159] = t13;
+    t1 = re[75];
+    t9 = im[75];
+    t12 = re[111];
+    t3 = im[111];
+    t14 = re[147];
+    t11 = im[147];
+    t8 = re[3];
+    t2 = im[3];
+    t0 = re[39];
+    t7 = im[39];
+    t10 = t12 + t0;
+    t6 = t3 + t7;
+    t5 = t14 + t8;
+    t4 = t11 + t2;
+    t13 = t12 - t0;
+    t12 = t3 - t7;
+    t0 = t14 - t8;
+    t3 = t11 - t2;
+    t7 = t10 + t5;
+    t14 = t6 + t4;
+    t8 = t10 - t5;
+    t11 = C0 * t8;
+    t2 = t6 - t4;
+    t10 = C0 * t2;
+    t5 = C1 * t7;
+    t8 = t1 - t5;
+    t6 = C1 * t14;
+    t4 = t9 - t6;
+    t2 = t8 + t11;
+    t5 = t4 + t10;
+    t6 = t8 - t11;
+    t8 = t4 - t10;
+    t11 = C2 * t13;
+    t4 = C3 * t0;
+    t10 = t11 + t4;
+    t11 = C2 * t12;
+    t4 = C3 * t3;
+    t11 = t11 + t4;
+    t4 = C3 * t13;
+    t13 = C2 * t0;
+    t0 = t4 - t13;
+    t4 = C3 * t12;
+    t13 = C2 * t3;
+    t12 = t4 - t13;
+    t3 = t1 + t7;
+    t4 = t9 + t14;
+    t13 = t2 + t11;
+    t1 = t5 - t10;
+    t7 = t6 + t12;
+    t9 = t8 - t0;
+    t14 = t6 - t12;
+    t6 = t8 + t0;
+    t12 = t2 - t11;
+    t8 = t5 + t10;
+    re[75] = t3;
+    im[75] = t4;
+    re[111] = t13;
+    im[111] = t1;
+    re[147] = t7;
+    im[147] = t9;
+    re[3] = t14;
+    im[3] = t6;
+    re[39] = t12;
+    im[39] = t8;
+    t0 = re[155];
+    t2 = im[155];
+    t11 = re[11];
+    t5 = im[11];
+    t10 = re[47];
+    t3 = im[47];
+    t4 = re[83];
+    t13 = im[83];
+    t1 = re[119];
+    t7 = im[119];
+    t9 = t11 + t1;
+    t14 = t5 + t7;
+    t6 = t10 + t4;
+    t12 = t3 + t13;
+    t8 = t11 - t1;
+    t11 = t5 - t7;
+    t1 = t10 - t4;
+    t5 = t3 - t13;
+    t7 = t9 + t6;
+    t10 = t14 + t12;
+    t4 = t9 - t6;
+    t3 = C0 * t4;
+    t13 = t14 - t12;
+    t9 = C0 * t13;
+    t6 = C1 * t7;
+    t4 = t0 - t6;
+    t14 = C1 * t10;
+    t12 = t2 - t14;
+    t13 = t4 + t3;
+    t6 = t12 + t9;
+    t14 = t4 - t3;
+    t4 = t12 - t9;
+    t3 = C2 * t8;
+    t12 = C3 * t1;
+    t9 = t3 + t12;
+    t3 = C2 * t11;
+    t12 = C3 * t5;
+    t3 = t3 + t12;
+    t12 = C3 * t8;
+    t8 = C2 * t1;
+    t1 = t12 - t8;
+    t12 = C3 * t11;
+    t8 = C2 * t5;
+    t11 = t12 - t8;
+    t5 = t0 + t7;
+    t12 = t2 + t10;
+    t8 = t13 + t3;
+    t0 = t6 - t9;
+    t7 = t14 + t11;
+    t2 = t4 - t1;
+    t10 = t14 - t11;
+    t14 = t4 + t1;
+    t11 = t13 - t3;
+    t4 = t6 + t9;
+    re[155] = t5;
+    im[155] = t12;
+    re[11] = t8;
+    im[11] = t0;
+    re[47] = t7;
+    im[47] = t2;
+    re[83] = t10;
+    im[83] = t14;
+    re[119] = t11;
+    im[119] = t4;
+    t1 = re[35];
+    t13 = im[35];
+    t3 = re[71];
+    t6 = im[71];
+    t9 = re[107];
+    t5 = im[107];
+    t12 = re[143];
+    t8 = im[143];
+    t0 = re[179];
+    t7 = im[179];
+    t2 = t3 + t0;
+    t10 = t6 + t7;
+    t14 = t9 + t12;
+    t11 = t5 + t8;
+    t4 = t3 - t0;
+    t3 = t6 - t7;
+    t0 = t9 - t12;
+    t6 = t5 - t8;
+    t7 = t2 + t14;
+    t9 = t10 + t11;
+    t12 = t2 - t14;
+    t5 = C0 * t12;
+    t8 = t10 - t11;
+    t2 = C0 * t8;
+    t14 = C1 * t7;
+    t12 = t1 - t14;
+    t10 = C1 * t9;
+    t11 = t13 - t10;
+    t8 = t12 + t5;
+    t14 = t11 + t2;
+    t10 = t12 - t5;
+    t12 = t11 - t2;
+    t5 = C2 * t4;
+    t11 = C3 * t0;
+    t2 = t5 + t11;
+    t5 = C2 * t3;
+    t11 = C3 * t6;
+    t5 = t5 + t11;
+    t11 = C3 * t4;
+    t4 = C2 * t0;
+    t0 = t11 - t4;
+    t11 = C3 * t3;
+    t4 = C2 * t6;
+    t3 = t11 - t4;
+    t6 = t1 + t7;
+    t11 = t13 + t9;
+    t4 = t8 + t5;
+    t1 = t14 - t2;
+    t7 = t10 + t3;
+    t13 = t12 - t0;
+    t9 = t10 - t3;
+    t10 = t12 + t0;
+    t3 = t8 - t5;
+    t12 = t14 + t2;
+    re[35] = t6;
+    im[35] = t11;
+    re[71] = t4;
+    im[71] = t1;
+    re[107] = t7;
+    im[107] = t13;
+    re[143] = t9;
+    im[143] = t10;
+    re[179] = t3;
+    im[179] = t12;
+    t0 = re[95];
+    t8 = im[95];
+    t5 = re[131];
+    t14 = im[131];
+    t2 = re[167];
+    t6 = im[167];
+    t11 = re[23];
+    t4 = im[23];
+    t1 = re[59];
+    t7 = im[59];
+    t13 = t5 + t1;
+    t9 = t14 + t7;
+    t10 = t2 + t11;
+    t3 = t6 + t4;
+    t12 = t5 - t1;
+    t5 = t14 - t7;
+    t1 = t2 - t11;
+    t14 = t6 - t4;
+    t7 = t13 + t10;
+    t2 = t9 + t3;
+    t11 = t13 - t10;
+    t6 = C0 * t11;
+    t4 = t9 - t3;
+    t13 = C0 * t4;
+    t10 = C1 * t7;
+    t11 = t0 - t10;
+    t9 = C1 * t2;
+    t3 = t8 - t9;
+    t4 = t11 + t6;
+    t10 = t3 + t13;
+    t9 = t11 - t6;
+    t11 = t3 - t13;
+    t6 = C2 * t12;
+    t3 = C3 * t1;
+    t13 = t6 + t3;
+    t6 = C2 * t5;
+    t3 = C3 * t14;
+    t6 = t6 + t3;
+    t3 = C3 * t12;
+    t12 = C2 * t1;
+    t1 = t3 - t12;
+    t3 = C3 * t5;
+    t12 = C2 * t14;
+    t5 = t3 - t12;
+    t14 = t0 + t7;
+    t3 = t8 + t2;
+    t12 = t4 + t6;
+    t0 = t10 - t13;
+    t7 = t9 + t5;
+    t8 = t11 - t1;
+    t2 = t9 - t5;
+    t9 = t11 + t1;
+    t5 = t4 - t6;
+    t11 = t10 + t13;
+    re[95] = t14;
+    im[95] = t3;
+    re[131] = t12;
+    im[131] = t0;
+    re[167] = t7;
+    im[167] = t8;
+    re[23] = t2;
+    im[23] = t9;
+    re[59] = t5;
+    im[59] = t11;
+    t1 = re[175];
+    t4 = im[175];
+    t6 = re[31];
+    t10 = im[31];
+    t13 = re[67];
+    t14 = im[67];
+    t3 = re[103];
+    t12 = im[103];
+    t0 = re[139];
+    t7 = im[139];
+    t8 = t6 + t0;
+    t2 = t10 + t7;
+    t9 = t13 + t3;
+    t5 = t14 + t12;
+    t11 = t6 - t0;
+    t6 = t10 - t7;
+    t0 = t13 - t3;
+    t10 = t14 - t12;
+    t7 = t8 + t9;
+    t13 = t2 + t5;
+    t3 = t8 - t9;
+    t14 = C0 * t3;
+    t12 = t2 - t5;
+    t8 = C0 * t12;
+    t9 = C1 * t7;
+    t3 = t1 - t9;
+    t2 = C1 * t13;
+    t5 = t4 - t2;
+    t12 = t3 + t14;
+    t9 = t5 + t8;
+    t2 = t3 - t14;
+    t3 = t5 - t8;
+    t14 = C2 * t11;
+    t5 = C3 * t0;
+    t8 = t14 + t5;
+    t14 = C2 * t6;
+    t5 = C3 * t10;
+    t14 = t14 + t5;
+    t5 = C3 * t11;
+    t11 = C2 * t0;
+    t0 = t5 - t11;
+    t5 = C3 * t6;
+    t11 = C2 * t10;
+    t6 = t5 - t11;
+    t10 = t1 + t7;
+    t5 = t4 + t13;
+    t11 = t12 + t14;
+    t1 = t9 - t8;
+    t7 = t2 + t6;
+    t4 = t3 - t0;
+    t13 = t2 - t6;
+    t2 = t3 + t0;
+    t6 = t12 - t14;
+    t3 = t9 + t8;
+    re[175] = t10;
+    im[175] = t5;
+    re[31] = t11;
+    im[31] = t1;
+    re[67] = t7;
+    im[67] = t4;
+    re[103] = t13;
+    im[103] = t2;
+    re[139] = t6;
+    im[139] = t3;
+    t0 = re[55];
+    t12 = im[55];
+    t14 = re[91];
+    t9 = im[91];
+    t8 = re[127];
+    t10 = im[127];
+    t5 = re[163];
+    t11 = im[163];
+    t1 = re[19];
+    t7 = im[19];
+    t4 = t14 + t1;
+    t13 = t9 + t7;
+    t2 = t8 + t5;
+    t6 = t10 + t11;
+    t3 = t14 - t1;
+    t14 = t9 - t7;
+    t1 = t8 - t5;
+    t9 = t10 - t11;
+    t7 = t4 + t2;
+    t8 = t13 + t6;
+    t5 = t4 - t2;
+    t10 = C0 * t5;
+    t11 = t13 - t6;
+    t4 = C0 * t11;
+    t2 = C1 * t7;
+    t5 = t0 - t2;
+    t13 = C1 * t8;
+    t6 = t12 - t13;
+    t11 = t5 + t10;
+    t2 = t6 + t4;
+    t13 = t5 - t10;
+    t5 = t6 - t4;
+    t10 = C2 * t3;
+    t6 = C3 * t1;
+    t4 = t10 + t6;
+    t10 = C2 * t14;
+    t6 = C3 * t9;
+    t10 = t10 + t6;
+    t6 = C3 * t3;
+    t3 = C2 * t1;
+    t1 = t6 - t3;
+    t6 = C3 * t14;
+    t3 = C2 * t9;
+    t14 = t6 - t3;
+    t9 = t0 + t7;
+    t6 = t12 + t8;
+    t3 = t11 + t10;
+    t0 = t2 - t4;
+    t7 = t13 + t14;
+    t12 = t5 - t1;
+    t8 = t13 - t14;
+    t13 = t5 + t1;
+    t14 = t11 - t10;
+    t5 = t2 + t4;
+    re[55] = t9;
+    im[55] = t6;
+    re[91] = t3;
+    im[91] = t0;
+    re[127] = t7;
+    im[127] = t12;
+    re[163] = t8;
+    im[163] = t13;
+    re[19] = t14;
+    im[19] = t5;
+    t1 = re[115];
+    t11 = im[115];
+    t10 = re[151];
+    t2 = im[151];
+    t4 = re[7];
+    t9 = im[7];
+    t6 = re[43];
+    t3 = im[43];
+    t0 = re[79];
+    t7 = im[79];
+    t12 = t10 + t0;
+    t8 = t2 + t7;
+    t13 = t4 + t6;
+    t14 = t9 + t3;
+    t5 = t10 - t0;
+    t10 = t2 - t7;
+    t0 = t4 - t6;
+    t2 = t9 - t3;
+    t7 = t12 + t13;
+    t4 = t8 + t14;
+    t6 = t12 - t13;
+    t9 = C0 * t6;
+    t3 = t8 - t14;
+    t12 = C0 * t3;
+    t13 = C1 * t7;
+    t6 = t1 - t13;
+    t8 = C1 * t4;
+    t14 = t11 - t8;
+    t3 = t6 + t9;
+    t13 = t14 + t12;
+    t8 = t6 - t9;
+    t6 = t14 - t12;
+    t9 = C2 * t5;
+    t14 = C3 * t0;
+    t12 = t9 + t14;
+    t9 = C2 * t10;
+    t14 = C3 * t2;
+    t9 = t9 + t14;
+    t14 = C3 * t5;
+    t5 = C2 * t0;
+    t0 = t14 - t5;
+    t14 = C3 * t10;
+    t5 = C2 * t2;
+    t10 = t14 - t5;
+    t2 = t1 + t7;
+    t14 = t11 + t4;
+    t5 = t3 + t9;
+    t1 = t13 - t12;
+    t7 = t8 + t10;
+    t11 = t6 - t0;
+    t4 = t8 - t10;
+    t8 = t6 + t0;
+    t10 = t3 - t9;
+    t6 = t13 + t12;
+    re[115] = t2;
+    im[115] = t14;
+    re[151] = t5;
+    im[151] = t1;
+    re[7] = t7;
+    im[7] = t11;
+    re[43] = t4;
+    im[43] = t8;
+    re[79] = t10;
+    im[79] = t6;
+    t0 = re[0];
+    t3 = im[0];
+    t9 = re[45];
+    t13 = im[45];
+    t12 = re[90];
+    t2 = im[90];
+    t14 = re[135];
+    t5 = im[135];
+    t1 = t0 + t12;
+    t7 = t3 + t2;
+    t11 = t9 + t14;
+    t4 = t13 + t5;
+    t8 = t0 - t12;
+    t10 = t3 - t2;
+    t6 = t9 - t14;
+    t0 = t13 - t5;
+    t12 = t1 + t11;
+    t3 = t7 + t4;
+    t2 = t8 + t0;
+    t9 = t10 - t6;
+    t14 = t1 - t11;
+    t13 = t7 - t4;
+    t5 = t8 - t0;
+    t1 = t10 + t6;
+    t11 = C4 * t12;
+    t7 = C5 * t3;
+    t4 = t11 + t7;
+    t8 = C5 * t12;
+    t0 = (-C4) * t3;
+    t10 = t8 + t0;
+    X[0] = t4;
+    X[359] = t10;
+    t6 = C6 * t2;
+    t11 = C7 * t9;
+    t7 = t6 + t11;
+    t12 = C7 * t2;
+    t3 = (-C6) * t9;
+    t8 = t12 + t3;
+    X[90] = t7;
+    X[269] = t8;
+    t0 = C8 * t14;
+    t4 = C9 * t13;
+    t10 = t0 + t4;
+    t6 = C9 * t14;
+    t11 = (-C8) * t13;
+    t2 = t6 + t11;
+    X[180] = t10;
+    X[179] = t2;
+    t9 = C10 * t5;
+    t12 = C11 * t1;
+    t3 = t9 + t12;
+    t7 = C11 * t5;
+    t8 = (-C10) * t1;
+    t0 = t7 + t8;
+    X[270] = t3;
+    X[89] = t0;
+    t4 = re[96];
+    t14 = im[96];
+    t13 = re[141];
+    t6 = im[141];
+    t11 = re[6];
+    t10 = im[6];
+    t2 = re[51];
+    t9 = im[51];
+    t12 = t4 + t11;
+    t5 = t14 + t10;
+    t1 = t13 + t2;
+    t7 = t6 + t9;
+    t8 = t4 - t11;
+    t3 = t14 - t10;
+    t0 = t13 - t2;
+    t4 = t6 - t9;
+    t11 = t12 + t1;
+    t14 = t5 + t7;
+    t10 = t8 + t4;
+    t13 = t3 - t0;
+    t2 = t12 - t1;
+    t6 = t5 - t7;
+    t9 = t8 - t4;
+    t12 = t3 + t0;
+    t1 = C12 * t11;
+    t5 = C13 * t14;
+    t7 = t1 + t5;
+    t8 = C13 * t11;
+    t4 = (-C12) * t14;
+    t3 = t8 + t4;
+    X[272] = t7;
+    X[87] = t3;
+    t0 = C14 * t10;
+    t1 = C15 * t13;
+    t5 = t0 + t1;
+    t11 = C15 * t10;
+    t14 = (-C14) * t13;
+    t8 = t11 + t14;
+    X[2] = t5;
+    X[357] = t8;
+    t4 = C16 * t2;
+    t7 = C17 * t6;
+    t3 = t4 + t7;
+    t0 = C17 * t2;
+    t1 = (-C16) * t6;
+    t10 = t0 + t1;
+    X[92] = t3;
+    X[267] = t10;
+    t13 = C18 * t9;
+    t11 = C19 * t12;
+    t14 = t13 + t11;
+    t5 = C19 * t9;
+    t8 = (-C18) * t12;
+    t4 = t5 + t8;
+    X[182] = t14;
+    X[177] = t4;
+    t7 = re[12];
+    t2 = im[12];
+    t6 = re[57];
+    t0 = im[57];
+    t1 = re[102];
+    t3 = im[102];
+    t10 = re[147];
+    t13 = im[147];
+    t11 = t7 + t1;
+    t9 = t2 + t3;
+    t12 = t6 + t10;
+    t5 = t0 + t13;
+    t8 = t7 - t1;
+    t14 = t2 - t3;
+    t4 = t6 - t10;
+    t7 = t0 - t13;
+    t1 = t11 + t12;
+    t2 = t9 + t5;
+    t3 = t8 + t7;
+    t6 = t14 - t4;
+    t10 = t11 - t12;
+    t0 = t9 - t5;
+    t13 = t8 - t7;
+    t11 = t14 + t4;
+    t12 = C20 * t1;
+    t9 = C21 * t2;
+    t5 = t12 + t9;
+    t8 = C21 * t1;
+    t7 = (-C20) * t2;
+    t14 = t8 + t7;
+    X[184] = t5;
+    X[175] = t14;
+    t4 = C22 * t3;
+    t12 = C23 * t6;
+    t9 = t4 + t12;
+    t1 = C23 * t3;
+    t2 = (-C22) * t6;
+    t8 = t1 + t2;
+    X[274] = t9;
+    X[85] = t8;
+    t7 = C24 * t10;
+    t5 = C25 * t0;
+    t14 = t7 + t5;
+    t4 = C25 * t10;
+    t12 = (-C24) * t0;
+    t3 = t4 + t12;
+    X[4] = t14;
+    X[355] = t3;
+    t6 = C26 * t13;
+    t1 = C27 * t11;
+    t2 = t6 + t1;
+    t9 = C27 * t13;
+    t8 = (-C26) * t11;
+    t7 = t9 + t8;
+    X[94] = t2;
+    X[265] = t7;
+    t5 = re[128];
+    t10 = im[128];
+    t0 = re[173];
+    t4 = im[173];
+    t12 = re[38];
+    t14 = im[38];
+    t3 = re[83];
+    t6 = im[83];
+    t1 = t5 + t12;
+    t13 = t10 + t14;
+    t11 = t0 + t3;
+    t9 = t4 + t6;
+    t8 = t5 - t12;
+    t2 = t10 - t14;
+    t7 = t0 - t3;
+    t5 = t4 - t6;
+    t12 = t1 + t11;
+    t10 = t13 + t9;
+    t14 = t8 + t5;
+    t0 = t2 - t7;
+    t3 = t1 - t11;
+    t4 = t13 - t9;
+    t6 = t8 - t5;
+    t1 = t2 + t7;
+    t11 = C28 * t12;
+    t13 = C29 * t10;
+    t9 = t11 + t13;
+    t8 = C29 * t12;
+    t5 = (-C28) * t10;
+    t2 = t8 + t5;
+    X[96] = t9;
+    X[263] = t2;
+    t7 = C30 * t14;
+    t11 = C31 * t0;
+    t13 = t7 + t11;
+    t12 = C31 * t14;
+    t10 = (-C30) * t0;
+    t8 = t12 + t10;
+    X[186] = t13;
+    X[173] = t8;
+    t5 = C32 * t3;
+    t9 = C33 * t4;
+    t2 = t5 + t9;
+    t7 = C33 * t3;
+    t11 = (-C32) * t4;
+    t14 = t7 + t11;
+    X[276] = t2;
+    X[83] = t14;
+    t0 = C34 * t6;
+    t12 = C35 * t1;
+    t10 = t0 + t12;
+    t13 = C35 * t6;
+    t8 = (-C34) * t1;
+    t5 = t13 + t8;
+    X[6] = t10;
+    X[353] = t5;
+    t9 = re[44];
+    t3 = im[44];
+    t4 = re[89];
+    t7 = im[89];
+    t11 = re[134];
+    t2 = im[134];
+    t14 = re[179];
+    t0 = im[179];
+    t12 = t9 + t11;
+    t6 = t3 + t2;
+    t1 = t4 + t14;
+    t13 = t7 + t0;
+    t8 = t9 - t11;
+    t10 = t3 - t2;
+    t5 = t4 - t14;
+    t9 = t7 - t0;
+    t11 = t12 + t1;
+    t3 = t6 + t13;
+    t2 = t8 + t9;
+    t4 = t10 - t5;
+    t14 = t12 - t1;
+    t7 = t6 - t13;
+    t0 = t8 - t9;
+    t12 = t10 + t5;
+    t1 = C36 * t11;
+    t6 = C37 * t3;
+    t13 = t1 + t6;
+    t8 = C37 * t11;
+    t9 = (-C36) * t3;
+    t10 = t8 + t9;
+    X[8] = t13;
+    X[351] = t10;
+    t5 = C38 * t2;
+    t1 = C39 * t4;
+    t6 = t5 + t1;
+    t11 = C39 * t2;
+    t3 = (-C38) * t4;
+    t8 = t11 + t3;
+    X[98] = t6;
+    X[261] = t8;
+    t9 = C40 * t14;
+    t13 = C41 * t7;
+    t10 = t9 + t13;
+    t5 = C41 * t14;
+    t1 = (-C40) * t7;
+    t2 = t5 + t1;
+    X[188] = t10;
+    X[171] = t2;
+    t4 = C42 * t0;
+    t11 = C43 * t12;
+    t3 = t4 + t11;
+    t6 = C43 * t0;
+    t8 = (-C42) * t12;
+    t9 = t6 + t8;
+    X[278] = t3;
+    X[81] = t9;
+    t13 = re[140];
+    t14 = im[140];
+    t7 = re[5];
+    t5 = im[5];
+    t1 = re[50];
+    t10 = im[50];
+    t2 = re[95];
+    t4 = im[95];
+    t11 = t13 + t1;
+    t0 = t14 + t10;
+    t12 = t7 + t2;
+    t6 = t5 + t4;
+    t8 = t13 - t1;
+    t3 = t14 - t10;
+    t9 = t7 - t2;
+    t13 = t5 - t4;
+    t1 = t11 + t12;
+    t14 = t0 + t6;
+    t10 = t8 + t13;
+    t7 = t3 - t9;
+    t2 = t11 - t12;
+    t5 = t0 - t6;
+    t4 = t8 - t13;
+    t11 = t3 + t9;
+    t12 = C44 * t1;
+    t0 = C45 * t14;
+    t6 = t12 + t0;
+    t8 = C45 * t1;
+    t13 = (-C44) * t14;
+    t3 = t8 + t13;
+    X[280] = t6;
+    X[79] = t3;
+    t9 = C46 * t10;
+    t12 = C47 * t7;
+    t0 = t9 + t12;
+    t1 = C47 * t10;
+    t14 = (-C46) * t7;
+    t8 = t1 + t14;
+    X[10] = t0;
+    X[349] = t8;
+    t13 = C48 * t2;
+    t6 = C49 * t5;
+    t3 = t13 + t6;
+    t9 = C49 * t2;
+    t12 = (-C48) * t5;
+    t10 = t9 + t12;
+    X[100] = t3;
+    X[259] = t10;
+    t7 = C50 * t4;
+    t1 = C51 * t11;
+    t14 = t7 + t1;
+    t0 = C51 * t4;
+    t8 = (-C50) * t11;
+    t13 = t0 + t8;
+    X[190] = t14;
+    X[169] = t13;
+    t6 = re[76];
+    t2 = im[76];
+    t5 = re[121];
+    t9 = im[121];
+    t12 = re[166];
+    t3 = im[166];
+    t10 = re[31];
+    t7 = im[31];
+    t1 = t6 + t12;
+    t4 = t2 + t3;
+    t11 = t5 + t10;
+    t0 = t9 + t7;
+    t8 = t6 - t12;
+    t14 = t2 - t3;
+    t13 = t5 - t10;
+    t6 = t9 - t7;
+    t12 = t1 + t11;
+    t2 = t4 + t0;
+    t3 = t8 + t6;
+    t5 = t14 - t13;
+    t10 = t1 - t11;
+    t9 = t4 - t0;
+    t7 = t8 - t6;
+    t1 = t14 + t13;
+    t11 = C52 * t12;
+    t4 = C53 * t2;
+    t0 = t11 + t4;
+    t8 = C53 * t12;
+    t6 = (-C52) * t2;
+    t14 = t8 + t6;
+    X[192] = t0;
+    X[167] = t14;
+    t13 = C54 * t3;
+    t11 = C55 * t5;
+    t4 = t13 + t11;
+    t12 = C55 * t3;
+    t2 = (-C54) * t5;
+    t8 = t12 + t2;
+    X[282] = t4;
+    X[77] = t8;
+    t6 = C56 * t10;
+    t0 = C57 * t9;
+    t14 = t6 + t0;
+    t13 = C57 * t10;
+    t11 = (-C56) * t9;
+    t3 = t13 + t11;
+    X[12] = t14;
+    X[347] = t3;
+    t5 = C58 * t7;
+    t12 = C59 * t1;
+    t2 = t5 + t12;
+    t4 = C59 * t7;
+    t8 = (-C58) * t1;
+    t6 = t4 + t8;
+    X[102] = t2;
+    X[257] = t6;
+    t0 = re[172];
+    t10 = im[172];
+    t9 = re[37];
+    t13 = im[37];
+    t11 = re[82];
+    t14 = im[82];
+    t3 = re[127];
+    t5 = im[127];
+    t12 = t0 + t11;
+    t7 = t10 + t14;
+    t1 = t9 + t3;
+    t4 = t13 + t5;
+    t8 = t0 - t11;
+    t2 = t10 - t14;
+    t6 = t9 - t3;
+    t0 = t13 - t5;
+    t11 = t12 + t1;
+    t10 = t7 + t4;
+    t14 = t8 + t0;
+    t9 = t2 - t6;
+    t3 = t12 - t1;
+    t13 = t7 - t4;
+    t5 = t8 - t0;
+    t12 = t2 + t6;
+    t1 = C60 * t11;
+    t7 = C61 * t10;
+    t4 = t1 + t7;
+    t8 = C61 * t11;
+    t0 = (-C60) * t10;
+    t2 = t8 + t0;
+    X[104] = t4;
+    X[255] = t2;
+    t6 = C62 * t14;
+    t1 = C63 * t9;
+    t7 = t6 + t1;
+    t11 = C63 * t14;
+    t10 = (-C62) * t9;
+    t8 = t11 + t10;
+    X[194] = t7;
+    X[165] = t8;
+    t0 = C64 * t3;
+    t4 = C65 * t13;
+    t2 = t0 + t4;
+    t6 = C65 * t3;
+    t1 = (-C64) * t13;
+    t14 = t6 + t1;
+    X[284] = t2;
+    X[75] = t14;
+    t9 = C66 * t5;
+    t11 = C67 * t12;
+    t10 = t9 + t11;
+    t7 = C67 * t5;
+    t8 = (-C66) * t12;
+    t0 = t7 + t8;
+    X[14] = t10;
+    X[345] = t0;
+    t4 = re[88];
+    t3 = im[88];
+    t13 = re[133];
+    t6 = im[133];
+    t1 = re[178];
+    t2 = im[178];
+    t14 = re[43];
+    t9 = im[43];
+    t11 = t4 + t1;
+    t5 = t3 + t2;
+    t12 = t13 + t14;
+    t7 = t6 + t9;
+    t8 = t4 - t1;
+    t10 = t3 - t2;
+    t0 = t13 - t14;
+    t4 = t6 - t9;
+    t1 = t11 + t12;
+    t3 = t5 + t7;
+    t2 = t8 + t4;
+    t13 = t10 - t0;
+    t14 = t11 - t12;
+    t6 = t5 - t7;
+    t9 = t8 - t4;
+    t11 = t10 + t0;
+    t12 = C68 * t1;
+    t5 = C69 * t3;
+    t7 = t12 + t5;
+    t8 = C69 * t1;
+    t4 = (-C68) * t3;
+    t10 = t8 + t4;
+    X[16] = t7;
+    X[343] = t10;
+    t0 = C70 * t2;
+    t12 = C71 * t13;
+    t5 = t0 + t12;
+    t1 = C71 * t2;
+    t3 = (-C70) * t13;
+    t8 = t1 + t3;
+    X[106] = t5;
+    X[253] = t8;
+    t4 = C72 * t14;
+    t7 = C73 * t6;
+    t10 = t4 + t7;
+    t0 = C73 * t14;
+    t12 = (-C72) * t6;
+    t2 = t0 + t12;
+    X[196] = t10;
+    X[163] = t2;
+    t13 = C74 * t9;
+    t1 = C75 * t11;
+    t3 = t13 + t1;
+    t5 = C75 * t9;
+    t8 = (-C74) * t11;
+    t4 = t5 + t8;
+    X[286] = t3;
+    X[73] = t4;
+    t7 = re[144];
+    t14 = im[144];
+    t6 = re[9];
+    t0 = im[9];
+    t12 = re[54];
+    t10 = im[54];
+    t2 = re[99];
+    t13 = im[99];
+    t1 = t7 + t12;
+    t9 = t14 + t10;
+    t11 = t6 + t2;
+    t5 = t0 + t13;
+    t8 = t7 - t12;
+    t3 = t14 - t10;
+    t4 = t6 - t2;
+    t7 = t0 - t13;
+    t12 = t1 + t11;
+    t14 = t9 + t5;
+    t10 = t8 + t7;
+    t6 = t3 - t4;
+    t2 = t1 - t11;
+    t0 = t9 - t5;
+    t13 = t8 - t7;
+    t1 = t3 + t4;
+    t11 = C76 * t12;
+    t9 = C77 * t14;
+    t5 = t11 + t9;
+    t8 = C77 * t12;
+    t7 = (-C76) * t14;
+    t3 = t8 + t7;
+    X[288] = t5;
+    X[71] = t3;
+    t4 = C78 * t10;
+    t11 = C79 * t6;
+    t9 = t4 + t11;
+    t12 = C79 * t10;
+    t14 = (-C78) * t6;
+    t8 = t12 + t14;
+    X[18] = t9;
+    X[341] = t8;
+    t7 = C80 * t2;
+    t5 = C81 * t0;
+    t3 = t7 + t5;
+    t4 = C81 * t2;
+    t11 = (-C80) * t0;
+    t10 = t4 + t11;
+    X[108] = t3;
+    X[251] = t10;
+    t6 = C82 * t13;
+    t12 = C83 * t1;
+    t14 = t6 + t12;
+    t9 = C83 * t13;
+    t8 = (-C82) * t1;
+    t7 = t9 + t8;
+    X[198] = t14;
+    X[161] = t7;
+    t5 = re[60];
+    t2 = im[60];
+    t0 = re[105];
+    t4 = im[105];
+    t11 = re[150];
+    t3 = im[150];
+    t10 = re[15];
+    t6 = im[15];
+    t12 = t5 + t11;
+    t13 = t2 + t3;
+    t1 = t0 + t10;
+    t9 = t4 + t6;
+    t8 = t5 - t11;
+    t14 = t2 - t3;
+    t7 = t0 - t10;
+    t5 = t4 - t6;
+    t11 = t12 + t1;
+    t2 = t13 + t9;
+    t3 = t8 + t5;
+    t0 = t14 - t7;
+    t10 = t12 - t1;
+    t4 = t13 - t9;
+    t6 = t8 - t5;
+    t12 = t14 + t7;
+    t1 = C84 * t11;
+    t13 = C85 * t2;
+    t9 = t1 + t13;
+    t8 = C85 * t11;
+    t5 = (-C84) * t2;
+    t14 = t8 + t5;
+    X[200] = t9;
+    X[159] = t14;
+    t7 = C86 * t3;
+    t1 = C87 * t0;
+    t13 = t7 + t1;
+    t11 = C87 * t3;
+    t2 = (-C86) * t0;
+    t8 = t11 + t2;
+    X[290] = t13;
+    X[69] = t8;
+    t5 = C88 * t10;
+    t9 = C89 * t4;
+    t14 = t5 + t9;
+    t7 = C89 * t10;
+    t1 = (-C88) * t4;
+    t3 = t7 + t1;
+    X[20] = t14;
+    X[339] = t3;
+    t0 = C90 * t6;
+    t11 = C91 * t12;
+    t2 = t0 + t11;
+    t13 = C91 * t6;
+    t8 = (-C90) * t12;
+    t5 = t13 + t8;
+    X[110] = t2;
+    X[249] = t5;
+    t9 = re[156];
+    t10 = im[156];
+    t4 = re[21];
+    t7 = im[21];
+    t1 = re[66];
+    t14 = im[66];
+    t3 = re[111];
+    t0 = im[111];
+    t11 = t9 + t1;
+    t6 = t10 + t14;
+    t12 = t4 + t3;
+    t13 = t7 + t0;
+    t8 = t9 - t1;
+    t2 = t10 - t14;
+    t5 = t4 - t3;
+    t9 = t7 - t0;
+    t1 = t11 + t12;
+    t10 = t6 + t13;
+    t14 = t8 + t9;
+    t4 = t2 - t5;
+    t3 = t11 - t12;
+    t7 = t6 - t13;
+    t0 = t8 - t9;
+    t11 = t2 + t5;
+    t12 = C92 * t1;
+    t6 = C93 * t10;
+    t13 = t12 + t6;
+    t8 = C93 * t1;
+    t9 = (-C92) * t10;
+    t2 = t8 + t9;
+    X[112] = t13;
+    X[247] = t2;
+    t5 = C94 * t14;
+    t12 = C95 * t4;
+    t6 = t5 + t12;
+    t1 = C95 * t14;
+    t10 = (-C94) * t4;
+    t8 = t1 + t10;
+    X[202] = t6;
+    X[157] = t8;
+    t9 = C96 * t3;
+    t13 = C97 * t7;
+    t2 = t9 + t13;
+    t5 = C97 * t3;
+    t12 = (-C96) * t7;
+    t14 = t5 + t12;
+    X[292] = t2;
+    X[67] = t14;
+    t4 = C98 * t0;
+    t1 = C99 * t11;
+    t10 = t4 + t1;
+    t6 = C99 * t0;
+    t8 = (-C98) * t11;
+    t9 = t6 + t8;
+    X[22] = t10;
+    X[337] = t9;
+    t13 = re[92];
+    t3 = im[92];
+    t7 = re[137];
+    t5 = im[137];
+    t12 = re[2];
+    t2 = im[2];
+    t14 = re[47];
+    t4 = im[47];
+    t1 = t13 + t12;
+    t0 = t3 + t2;
+    t11 = t7 + t14;
+    t6 = t5 + t4;
+    t8 = t13 - t12;
+    t10 = t3 - t2;
+    t9 = t7 - t14;
+    t13 = t5 - t4;
+    t12 = t1 + t11;
+    t3 = t0 + t6;
+    t2 = t8 + t13;
+    t7 = t10 - t9;
+    t14 = t1 - t11;
+    t5 = t0 - t6;
+    t4 = t8 - t13;
+    t1 = t10 + t9;
+    t11 = C100 * t12;
+    t0 = C101 * t3;
+    t6 = t11 + t0;
+    t8 = C101 * t12;
+    t13 = (-C100) * t3;
+    t10 = t8 + t13;
+    X[24] = t6;
+    X[335] = t10;
+    t9 = C102 * t2;
+    t11 = C103 * t7;
+    t0 = t9 + t11;
+    t12 = C103 * t2;
+    t3 = (-C102) * t7;
+    t8 = t12 + t3;
+    X[114] = t0;
+    X[245] = t8;
+    t13 = C104 * t14;
+    t6 = C105 * t5;
+    t10 = t13 + t6;
+    t9 = C105 * t14;
+    t11 = (-C104) * t5;
+    t2 = t9 + t11;
+    X[204] = t10;
+    X[155] = t2;
+    t7 = C106 * t4;
+    t12 = C107 * t1;
+    t3 = t7 + t12;
+    t0 = C107 * t4;
+    t8 = (-C106) * t1;
+    t13 = t0 + t8;
+    X[294] = t3;
+    X[65] = t13;
+    t6 = re[8];
+    t14 = im[8];
+    t5 = re[53];
+    t9 = im[53];
+    t11 = re[98];
+    t10 = im[98];
+    t2 = re[143];
+    t7 = im[143];
+    t12 = t6 + t11;
+    t4 = t14 + t10;
+    t1 = t5 + t2;
+    t0 = t9 + t7;
+    t8 = t6 - t11;
+    t3 = t14 - t10;
+    t13 = t5 - t2;
+    t6 = t9 - t7;
+    t11 = t12 + t1;
+    t14 = t4 + t0;
+    t10 = t8 + t6;
+    t5 = t3 - t13;
+    t2 = t12 - t1;
+    t9 = t4 - t0;
+    t7 = t8 - t6;
+    t12 = t3 + t13;
+    t1 = C108 * t11;
+    t4 = C109 * t14;
+    t0 = t1 + t4;
+    t8 = C109 * t11;
+    t6 = (-C108) * t14;
+    t3 = t8 + t6;
+    X[296] = t0;
+    X[63] = t3;
+    t13 = C110 * t10;
+    t1 = C111 * t5;
+    t4 = t13 + t1;
+    t11 = C111 * t10;
+    t14 = (-C110) * t5;
+    t8 = t11 + t14;
+    X[26] = t4;
+    X[333] = t8;
+    t6 = C112 * t2;
+    t0 = C113 * t9;
+    t3 = t6 + t0;
+    t13 = C113 * t2;
+    t1 = (-C112) * t9;
+    t10 = t13 + t1;
+    X[116] = t3;
+    X[243] = t10;
+    t5 = C114 * t7;
+    t11 = C115 * t12;
+    t14 = t5 + t11;
+    t4 = C115 * t7;
+    t8 = (-C114) * t12;
+    t6 = t4 + t8;
+    X[206] = t14;
+    X[153] = t6;
+    t0 = re[104];
+    t2 = im[104];
+    t9 = re[149];
+    t13 = im[149];
+    t1 = re[14];
+    t3 = im[14];
+    t10 = re[59];
+    t5 = im[59];
+    t11 = t0 + t1;
+    t7 = t2 + t3;
+    t12 = t9 + t10;
+    t4 = t13 + t5;
+    t8 = t0 - t1;
+    t14 = t2 - t3;
+    t6 = t9 - t10;
+    t0 = t13 - t5;
+    t1 = t11 + t12;
+    t2 = t7 + t4;
+    t3 = t8 + t0;
+    t9 = t14 - t6;
+    t10 = t11 - t12;
+    t13 = t7 - t4;
+    t5 = t8 - t0;
+    t11 = t14 + t6;
+    t12 = C116 * t1;
+    t7 = C117 * t2;
+    t4 = t12 + t7;
+    t8 = C117 * t1;
+    t0 = (-C116) * t2;
+    t14 = t8 + t0;
+    X[208] = t4;
+    X[151] = t14;
+    t6 = C118 * t3;
+    t12 = C119 * t9;
+    t7 = t6 + t12;
+    t1 = C119 * t3;
+    t2 = (-C118) * t9;
+    t8 = t1 + t2;
+    X[298] = t7;
+    X[61] = t8;
+    t0 = C120 * t10;
+    t4 = C121 * t13;
+    t14 = t0 + t4;
+    t6 = C121 * t10;
+    t12 = (-C120) * t13;
+    t3 = t6 + t12;
+    X[28] = t14;
+    X[331] = t3;
+    t9 = C122 * t5;
+    t1 = C123 * t11;
+    t2 = t9 + t1;
+    t7 = C123 * t5;
+    t8 = (-C122) * t11;
+    t0 = t7 + t8;
+    X[118] = t2;
+    X[241] = t0;
+    t4 = re[40];
+    t10 = im[40];
+    t13 = re[85];
+    t6 = im[85];
+    t12 = re[130];
+    t14 = im[130];
+    t3 = re[175];
+    t9 = im[175];
+    t1 = t4 + t12;
+    t5 = t10 + t14;
+    t11 = t13 + t3;
+    t7 = t6 + t9;
+    t8 = t4 - t12;
+    t2 = t10 - t14;
+    t0 = t13 - t3;
+    t4 = t6 - t9;
+    t12 = t1 + t11;
+    t10 = t5 + t7;
+    t14 = t8 + t4;
+    t13 = t2 - t0;
+    t3 = t1 - t11;
+    t6 = t5 - t7;
+    t9 = t8 - t4;
+    t1 = t2 + t0;
+    t11 = C124 * t12;
+    t5 = C125 * t10;
+    t7 = t11 + t5;
+    t8 = C125 * t12;
+    t4 = (-C124) * t10;
+    t2 = t8 + t4;
+    X[120] = t7;
+    X[239] = t2;
+    t0 = C126 * t14;
+    t11 = C127 * t13;
+    t5 = t0 + t11;
+    t12 = C127 * t14;
+    t10 = (-C126) * t13;
+    t8 = t12 + t10;
+    X[210] = t5;
+    X[149] = t8;
+    t4 = C128 * t3;
+    t7 = C129 * t6;
+    t2 = t4 + t7;
+    t0 = C129 * t3;
+    t11 = (-C128) * t6;
+    t14 = t0 + t11;
+    X[300] = t2;
+    X[59] = t14;
+    t13 = C130 * t9;
+    t12 = C131 * t1;
+    t10 = t13 + t12;
+    t5 = C131 * t9;
+    t8 = (-C130) * t1;
+    t4 = t5 + t8;
+    X[30] = t10;
+    X[329] = t4;
+    t7 = re[136];
+    t3 = im[136];
+    t6 = re[1];
+    t0 = im[1];
+    t11 = re[46];
+    t2 = im[46];
+    t14 = re[91];
+    t13 = im[91];
+    t12 = t7 + t11;
+    t9 = t3 + t2;
+    t1 = t6 + t14;
+    t5 = t0 + t13;
+    t8 = t7 - t11;
+    t10 = t3 - t2;
+    t4 = t6 - t14;
+    t7 = t0 - t13;
+    t11 = t12 + t1;
+    t3 = t9 + t5;
+    t2 = t8 + t7;
+    t6 = t10 - t4;
+    t14 = t12 - t1;
+    t0 = t9 - t5;
+    t13 = t8 - t7;
+    t12 = t10 + t4;
+    t1 = C132 * t11;
+    t9 = C133 * t3;
+    t5 = t1 + t9;
+    t8 = C133 * t11;
+    t7 = (-C132) * t3;
+    t10 = t8 + t7;
+    X[32] = t5;
+    X[327] = t10;
+    t4 = C134 * t2;
+    t1 = C135 * t6;
+    t9 = t4 + t1;
+    t11 = C135 * t2;
+    t3 = (-C134) * t6;
+    t8 = t11 + t3;
+    X[122] = t9;
+    X[237] = t8;
+    t7 = C136 * t14;
+    t5 = C137 * t0;
+    t10 = t7 + t5;
+    t4 = C137 * t14;
+    t1 = (-C136) * t0;
+    t2 = t4 + t1;
+    X[212] = t10;
+    X[147] = t2;
+    t6 = C138 * t13;
+    t11 = C139 * t12;
+    t3 = t6 + t11;
+    t9 = C139 * t13;
+    t8 = (-C138) * t12;
+    t7 = t9 + t8;
+    X[302] = t3;
+    X[57] = t7;
+    t5 = re[52];
+    t14 = im[52];
+    t0 = re[97];
+    t4 = im[97];
+    t1 = re[142];
+    t10 = im[142];
+    t2 = re[7];
+    t6 = im[7];
+    t11 = t5 + t1;
+    t13 = t14 + t10;
+    t12 = t0 + t2;
+    t9 = t4 + t6;
+    t8 = t5 - t1;
+    t3 = t14 - t10;
+    t7 = t0 - t2;
+    t5 = t4 - t6;
+    t1 = t11 + t12;
+    t14 = t13 + t9;
+    t10 = t8 + t5;
+    t0 = t3 - t7;
+    t2 = t11 - t12;
+    t4 = t13 - t9;
+    t6 = t8 - t5;
+    t11 = t3 + t7;
+    t12 = C140 * t1;
+    t13 = C141 * t14;
+    t9 = t12 + t13;
+    t8 = C141 * t1;
+    t5 = (-C140) * t14;
+    t3 = t8 + t5;
+    X[304] = t9;
+    X[55] = t3;
+    t7 = C142 * t10;
+    t12 = C143 * t0;
+    t13 = t7 + t12;
+    t1 = C143 * t10;
+    t14 = (-C142) * t0;
+    t8 = t1 + t14;
+    X[34] = t13;
+    X[325] = t8;
+    t5 = C144 * t2;
+    t9 = C145 * t4;
+    t3 = t5 + t9;
+    t7 = C145 * t2;
+    t12 = (-C144) * t4;
+    t10 = t7 + t12;
+    X[124] = t3;
+    X[235] = t10;
+    t0 = C146 * t6;
+    t1 = C147 * t11;
+    t14 = t0 + t1;
+    t13 = C147 * t6;
+    t8 = (-C146) * t11;
+    t5 = t13 + t8;
+    X[214] = t14;
+    X[145] = t5;
+    t9 = re[108];
+    t2 = im[108];
+    t4 = re[153];
+    t7 = im[153];
+    t12 = re[18];
+    t3 = im[18];
+    t10 = re[63];
+    t0 = im[63];
+    t1 = t9 + t12;
+    t6 = t2 + t3;
+    t11 = t4 + t10;
+    t13 = t7 + t0;
+    t8 = t9 - t12;
+    t14 = t2 - t3;
+    t5 = t4 - t10;
+    t9 = t7 - t0;
+    t12 = t1 + t11;
+    t2 = t6 + t13;
+    t3 = t8 + t9;
+    t4 = t14 - t5;
+    t10 = t1 - t11;
+    t7 = t6 - t13;
+    t0 = t8 - t9;
+    t1 = t14 + t5;
+    t11 = C148 * t12;
+    t6 = C149 * t2;
+    t13 = t11 + t6;
+    t8 = C149 * t12;
+    t9 = (-C148) * t2;
+    t14 = t8 + t9;
+    X[216] = t13;
+    X[143] = t14;
+    t5 = C150 * t3;
+    t11 = C151 * t4;
+    t6 = t5 + t11;
+    t12 = C151 * t3;
+    t2 = (-C150) * t4;
+    t8 = t12 + t2;
+    X[306] = t6;
+    X[53] = t8;
+    t9 = C152 * t10;
+    t13 = C153 * t7;
+    t14 = t9 + t13;
+    t5 = C153 * t10;
+    t11 = (-C152) * t7;
+    t3 = t5 + t11;
+    X[36] = t14;
+    X[323] = t3;
+    t4 = C154 * t0;
+    t12 = C155 * t1;
+    t2 = t4 + t12;
+    t6 = C155 * t0;
+    t8 = (-C154) * t1;
+    t9 = t6 + t8;
+    X[126] = t2;
+    X[233] = t9;
+    t13 = re[24];
+    t10 = im[24];
+    t7 = re[69];
+    t5 = im[69];
+    t11 = re[114];
+    t14 = im[114];
+    t3 = re[159];
+    t4 = im[159];
+    t12 = t13 + t11;
+    t0 = t10 + t14;
+    t1 = t7 + t3;
+    t6 = t5 + t4;
+    t8 = t13 - t11;
+    t2 = t10 - t14;
+    t9 = t7 - t3;
+    t13 = t5 - t4;
+    t11 = t12 + t1;
+    t10 = t0 + t6;
+    t14 = t8 + t13;
+    t7 = t2 - t9;
+    t3 = t12 - t1;
+    t5 = t0 - t6;
+    t4 = t8 - t13;
+    t12 = t2 + t9;
+    t1 = C156 * t11;
+    t0 = C157 * t10;
+    t6 = t1 + t0;
+    t8 = C157 * t11;
+    t13 = (-C156) * t10;
+    t2 = t8 + t13;
+    X[128] = t6;
+    X[231] = t2;
+    t9 = C158 * t14;
+    t1 = C159 * t7;
+    t0 = t9 + t1;
+    t11 = C159 * t14;
+    t10 = (-C158) * t7;
+    t8 = t11 + t10;
+    X[218] = t0;
+    X[141] = t8;
+    t13 = C160 * t3;
+    t6 = C161 * t5;
+    t2 = t13 + t6;
+    t9 = C161 * t3;
+    t1 = (-C160) * t5;
+    t14 = t9 + t1;
+    X[308] = t2;
+    X[51] = t14;
+    t7 = C162 * t4;
+    t11 = C163 * t12;
+    t10 = t7 + t11;
+    t0 = C163 * t4;
+    t8 = (-C162) * t12;
+    t13 = t0 + t8;
+    X[38] = t10;
+    X[321] = t13;
+    t6 = re[120];
+    t3 = im[120];
+    t5 = re[165];
+    t9 = im[165];
+    t1 = re[30];
+    t2 = im[30];
+    t14 = re[75];
+    t7 = im[75];
+    t11 = t6 + t1;
+    t4 = t3 + t2;
+    t12 = t5 + t14;
+    t0 = t9 + t7;
+    t8 = t6 - t1;
+    t10 = t3 - t2;
+    t13 = t5 - t14;
+    t6 = t9 - t7;
+    t1 = t11 + t12;
+    t3 = t4 + t0;
+    t2 = t8 + t6;
+    t5 = t10 - t13;
+    t14 = t11 - t12;
+    t9 = t4 - t0;
+    t7 = t8 - t6;
+    t11 = t10 + t13;
+    t12 = C164 * t1;
+    t4 = C165 * t3;
+    t0 = t12 + t4;
+    t8 = C165 * t1;
+    t6 = (-C164) * t3;
+    t10 = t8 + t6;
+    X[40] = t0;
+    X[319] = t10;
+    t13 = C166 * t2;
+    t12 = C167 * t5;
+    t4 = t13 + t12;
+    t1 = C167 * t2;
+    t3 = (-C166) * t5;
+    t8 = t1 + t3;
+    X[130] = t4;
+    X[229] = t8;
+    t6 = C168 * t14;
+    t0 = C169 * t9;
+    t10 = t6 + t0;
+    t13 = C169 * t14;
+    t12 = (-C168) * t9;
+    t2 = t13 + t12;
+    X[220] = t10;
+    X[139] = t2;
+    t5 = C170 * t7;
+    t1 = C171 * t11;
+    t3 = t5 + t1;
+    t4 = C171 * t7;
+    t8 = (-C170) * t11;
+    t6 = t4 + t8;
+    X[310] = t3;
+    X[49] = t6;
+    t0 = re[56];
+    t14 = im[56];
+    t9 = re[101];
+    t13 = im[101];
+    t12 = re[146];
+    t10 = im[146];
+    t2 = re[11];
+    t5 = im[11];
+    t1 = t0 + t12;
+    t7 = t14 + t10;
+    t11 = t9 + t2;
+    t4 = t13 + t5;
+    t8 = t0 - t12;
+    t3 = t14 - t10;
+    t6 = t9 - t2;
+    t0 = t13 - t5;
+    t12 = t1 + t11;
+    t14 = t7 + t4;
+    t10 = t8 + t0;
+    t9 = t3 - t6;
+    t2 = t1 - t11;
+    t13 = t7 - t4;
+    t5 = t8 - t0;
+    t1 = t3 + t6;
+    t11 = C172 * t12;
+    t7 = C173 * t14;
+    t4 = t11 + t7;
+    t8 = C173 * t12;
+    t0 = (-C172) * t14;
+    t3 = t8 + t0;
+    X[312] = t4;
+    X[47] = t3;
+    t6 = C174 * t10;
+    t11 = C175 * t9;
+    t7 = t6 + t11;
+    t12 = C175 * t10;
+    t14 = (-C174) * t9;
+    t8 = t12 + t14;
+    X[42] = t7;
+    X[317] = t8;
+    t0 = C176 * t2;
+    t4 = C177 * t13;
+    t3 = t0 + t4;
+    t6 = C177 * t2;
+    t11 = (-C176) * t13;
+    t10 = t6 + t11;
+    X[132] = t3;
+    X[227] = t10;
+    t9 = C178 * t5;
+    t12 = C179 * t1;
+    t14 = t9 + t12;
+    t7 = C179 * t5;
+    t8 = (-C178) * t1;
+    t0 = t7 + t8;
+    X[222] = t14;
+    X[137] = t0;
+    t4 = re[152];
+    t2 = im[152];
+    t13 = re[17];
+    t6 = im[17];
+    t11 = re[62];
+    t3 = im[62];
+    t10 = re[107];
+    t9 = im[107];
+    t12 = t4 + t11;
+    t5 = t2 + t3;
+    t1 = t13 + t10;
+    t7 = t6 + t9;
+    t8 = t4 - t11;
+    t14 = t2 - t3;
+    t0 = t13 - t10;
+    t4 = t6 - t9;
+    t11 = t12 + t1;
+    t2 = t5 + t7;
+    t3 = t8 + t4;
+    t13 = t14 - t0;
+    t10 = t12 - t1;
+    t6 = t5 - t7;
+    t9 = t8 - t4;
+    t12 = t14 + t0;
+    t1 = C180 * t11;
+    t5 = C181 * t2;
+    t7 = t1 + t5;
+    t8 = C181 * t11;
+    t4 = (-C180) * t2;
+    t14 = t8 + t4;
+    X[224] = t7;
+    X[135] = t14;
+    t0 = C182 * t3;
+    t1 = C183 * t13;
+    t5 = t0 + t1;
+    t11 = C183 * t3;
+    t2 = (-C182) * t13;
+    t8 = t11 + t2;
+    X[314] = t5;
+    X[45] = t8;
+    t4 = C184 * t10;
+    t7 = C185 * t6;
+    t14 = t4 + t7;
+    t0 = C185 * t10;
+    t1 = (-C184) * t6;
+    t3 = t0 + t1;
+    X[44] = t14;
+    X[315] = t3;
+    t13 = C186 * t9;
+    t11 = C187 * t12;
+    t2 = t13 + t11;
+    t5 = C187 * t9;
+    t8 = (-C186) * t12;
+    t4 = t5 + t8;
+    X[134] = t2;
+    X[225] = t4;
+    t7 = re[68];
+    t10 = im[68];
+    t6 = re[113];
+    t0 = im[113];
+    t1 = re[158];
+    t14 = im[158];
+    t3 = re[23];
+    t13 = im[23];
+    t11 = t7 + t1;
+    t9 = t10 + t14;
+    t12 = t6 + t3;
+    t5 = t0 + t13;
+    t8 = t7 - t1;
+    t2 = t10 - t14;
+    t4 = t6 - t3;
+    t7 = t0 - t13;
+    t1 = t11 + t12;
+    t10 = t9 + t5;
+    t14 = t8 + t7;
+    t6 = t2 - t4;
+    t3 = t11 - t12;
+    t0 = t9 - t5;
+    t13 = t8 - t7;
+    t11 = t2 + t4;
+    t12 = C188 * t1;
+    t9 = C189 * t10;
+    t5 = t12 + t9;
+    t8 = C189 * t1;
+    t7 = (-C188) * t10;
+    t2 = t8 + t7;
+    X[136] = t5;
+    X[223] = t2;
+    t4 = C190 * t14;
+    t12 = C191 * t6;
+    t9 = t4 + t12;
+    t1 = C191 * t14;
+    t10 = (-C190) * t6;
+    t8 = t1 + t10;
+    X[226] = t9;
+    X[133] = t8;
+    t7 = C192 * t3;
+    t5 = C193 * t0;
+    t2 = t7 + t5;
+    t4 = C193 * t3;
+    t12 = (-C192) * t0;
+    t14 = t4 + t12;
+    X[316] = t2;
+    X[43] = t14;
+    t6 = C194 * t13;
+    t1 = C195 * t11;
+    t10 = t6 + t1;
+    t9 = C195 * t13;
+    t8 = (-C194) * t11;
+    t7 = t9 + t8;
+    X[46] = t10;
+    X[313] = t7;
+    t5 = re[4];
+    t3 = im[4];
+    t0 = re[49];
+    t4 = im[49];
+    t12 = re[94];
+    t2 = im[94];
+    t14 = re[139];
+    t6 = im[139];
+    t1 = t5 + t12;
+    t13 = t3 + t2;
+    t11 = t0 + t14;
+    t9 = t4 + t6;
+    t8 = t5 - t12;
+    t10 = t3 - t2;
+    t7 = t0 - t14;
+    t5 = t4 - t6;
+    t12 = t1 + t11;
+    t3 = t13 + t9;
+    t2 = t8 + t5;
+    t0 = t10 - t7;
+    t14 = t1 - t11;
+    t4 = t13 - t9;
+    t6 = t8 - t5;
+    t1 = t10 + t7;
+    t11 = C196 * t12;
+    t13 = C197 * t3;
+    t9 = t11 + t13;
+    t8 = C197 * t12;
+    t5 = (-C196) * t3;
+    t10 = t8 + t5;
+    X[48] = t9;
+    X[311] = t10;
+    t7 = C198 * t2;
+    t11 = C199 * t0;
+    t13 = t7 + t11;
+    t12 = C199 * t2;
+    t3 = (-C198) * t0;
+    t8 = t12 + t3;
+    X[138] = t13;
+    X[221] = t8;
+    t5 = C200 * t14;
+    t9 = C201 * t4;
+    t10 = t5 + t9;
+    t7 = C201 * t14;
+    t11 = (-C200) * t4;
+    t2 = t7 + t11;
+    X[228] = t10;
+    X[131] = t2;
+    t0 = C202 * t6;
+    t12 = C203 * t1;
+    t3 = t0 + t12;
+    t13 = C203 * t6;
+    t8 = (-C202) * t1;
+    t5 = t13 + t8;
+    X[318] = t3;
+    X[41] = t5;
+    t9 = re[100];
+    t14 = im[100];
+    t4 = re[145];
+    t7 = im[145];
+    t11 = re[10];
+    t10 = im[10];
+    t2 = re[55];
+    t0 = im[55];
+    t12 = t9 + t11;
+    t6 = t14 + t10;
+    t1 = t4 + t2;
+    t13 = t7 + t0;
+    t8 = t9 - t11;
+    t3 = t14 - t10;
+    t5 = t4 - t2;
+    t9 = t7 - t0;
+    t11 = t12 + t1;
+    t14 = t6 + t13;
+    t10 = t8 + t9;
+    t4 = t3 - t5;
+    t2 = t12 - t1;
+    t7 = t6 - t13;
+    t0 = t8 - t9;
+    t12 = t3 + t5;
+    t1 = C204 * t11;
+    t6 = C205 * t14;
+    t13 = t1 + t6;
+    t8 = C205 * t11;
+    t9 = (-C204) * t14;
+    t3 = t8 + t9;
+    X[320] = t13;
+    X[39] = t3;
+    t5 = C206 * t10;
+    t1 = C207 * t4;
+    t6 = t5 + t1;
+    t11 = C207 * t10;
+    t14 = (-C206) * t4;
+    t8 = t11 + t14;
+    X[50] = t6;
+    X[309] = t8;
+    t9 = C208 * t2;
+    t13 = C209 * t7;
+    t3 = t9 + t13;
+    t5 = C209 * t2;
+    t1 = (-C208) * t7;
+    t10 = t5 + t1;
+    X[140] = t3;
+    X[219] = t10;
+    t4 = C210 * t0;
+    t11 = C211 * t12;
+    t14 = t4 + t11;
+    t6 = C211 * t0;
+    t8 = (-C210) * t12;
+    t9 = t6 + t8;
+    X[230] = t14;
+    X[129] = t9;
+}
+
+/**
+ *  Part 6 of ApplyWindowedMDCT_W75_360().
+ * 
+ *  @param {Number[]} x 
+ *    - The input block (720 points).
+ *  @param {Number[]} X 
+ *    - The array that would contain the output block (360 points).
+ *  @param {Number[]} re 
+ *    - The scratch buffer (real part, 180 points).
+ *  @param {Number[]} im 
+ *    - The scratch buffer (imaginary part, 180 points).
+ */
+function ApplyWindowedMDCT_W75_360_Part6(x, X, re, im) {
+    let t0, t1, t10, t11, t12, t13, t14, t2, t3, t4, t5, t6, t7, t8, t9;
+    const C0 = 0.528067850650368;
+    const C1 = 0.8492021815265789;
+    const C2 = 0.16289547339458874;
+    const C3 = 0.986643332084879;
+    const C4 = 0.9738769792773336;
+    const C5 = 0.22707626303437323;
+    const C6 = 0.8128466845916152;
+    const C7 = 0.5824776968678022;
+    const C8 = 0.8077327215818395;
+    const C9 = 0.5895488533497412;
+    const C10 = 0.5206371504623173;
+    const C11 = 0.8537780493538577;
+    const C12 = 0.15427929277242886;
+    const C13 = 0.9880272768611397;
+    const C14 = 0.9718583079558811;
+    const C15 = 0.23556618869679022;
+    const C16 = 0.9697656258615752;
+    const C17 = 0.24403817508190642;
+    const C18 = 0.8025572465980509;
+    const C19 = 0.5965751134039663;
+    const C20 = 0.5131668017395302;
+    const C21 = 0.8582888986771422;
+    const C22 = 0.1456513631848078;
+    const C23 = 0.9893359795349642;
+    const C24 = 0.13701234168196802;
+    const C25 = 0.9905693404435773;
+    const C26 = 0.9675990923602598;
+    const C27 = 0.25249157701515795;
+    const C28 = 0.7973206537727071;
+    const C29 = 0.6035559419535714;
+    const C30 = 0.5056573733779846;
+    const C31 = 0.8627343859777918;
+    const C32 = 0.4981094372497241;
+    const C33 = 0.8671141727147372;
+    const C34 = 0.12836288615884434;
+    const C35 = 0.9917272656617703;
+    const C36 = 0.9653588724418489;
+    const C37 = 0.2609257507372589;
+    const C38 = 0.7920233418926261;
+    const C39 = 0.6104908073814348;
+    const C40 = 0.786665714368617;
+    const C41 = 0.6173791815707049;
+    const C42 = 0.490523568159308;
+    const C43 = 0.8714279253502614;
+    const C44 = 0.11970365530496252;
+    const C45 = 0.992809667009055;
+    const C46 = 0.9630451367077627;
+    const C47 = 0.26934005395322597;
+    const C48 = 0.9606580613579353;
+    const C49 = 0.2777338458812922;
+    const C50 = 0.7812481792047586;
+    const C51 = 0.6242205399450176;
+    const C52 = 0.4829003438000374;
+    const C53 = 0.8756753153753997;
+    const C54 = 0.11103530855427768;
+    const C55 = 0.9938164620563781;
+    const C56 = 0.10235850603495578;
+    const C57 = 0.9947475741323987;
+    const C58 = 0.9581978281773966;
+    const C59 = 0.28610648730170424;
+    const C60 = 0.7757711489673284;
+    const C61 = 0.6310143615084456;
+    const C62 = 0.47524034470996157;
+    const C63 = 0.8798560193349574;
+    const C64 = 0.4675441542276683;
+    const C65 = 0.8839697188521416;
+    const C66 = 0.09367390851910222;
+    const C67 = 0.9956029323293272;
+    const C68 = 0.9556646245224285;
+    const C69 = 0.2944573406054019;
+    const C70 = 0.7702350407533842;
+    const C71 = 0.6377601288851731;
+    const C72 = 0.7646402761590003;
+    const C73 = 0.6444573283588975;
+    const C74 = 0.45981235844785984;
+    const C75 = 0.8880161006528073;
+    const C76 = 0.08498217737244167;
+    const C77 = 0.9963824715083254;
+    const C78 = 0.953058643306297;
+    const C79 = 0.3027857698425746;
+    const C80 = 0.9503800829845611;
+    const C81 = 0.31109114077109096;
+    const C82 = 0.7589872812471619;
+    const C83 = 0.6511054499119491;
+    const C84 = 0.45204554617671966;
+    const C85 = 0.8919948565893142;
+    const C86 = 0.0762839745039523;
+    const C87 = 0.9970861323044666;
+    const C88 = 0.06757996231545906;
+    const C89 = 0.9977138611312569;
+    const C90 = 0.9476291475399599;
+    const C91 = 0.31937282090479924;
+    const C92 = 0.7532764865153176;
+    const C93 = 0.6577039872641327;
+    const C94 = 0.4442443088870726;
+    const C95 = 0.8959056836639933;
+    const C96 = 0.436409240673342;
+    const C97 = 0.8997482840522215;
+    const C98 = 0.05887080365118903;
+    const C99 = 0.9982656101847159;
+    const C100 = 0.944806046466878;
+    const C101 = 0.3276301795616935;
+    const C102 = 0.7475083268625968;
+    const C103 = 0.6642524379112817;
+    const C104 = 0.7416832415566892;
+    const C105 = 0.6707503031635259;
+    const C106 = 0.4285409382063071;
+    const C107 = 0.903522365125102;
+    const C108 = 0.05015716174729338;
+    const C109 = 0.9987413374470168;
+    const C110 = 0.9419109947553924;
+    const C111 = 0.33586258791194235;
+    const C112 = 0.9389442128748994;
+    const C113 = 0.3440694190257768;
+    const C114 = 0.7358016742003936;
+    const C115 = 0.6771970881832687;
+    const C116 = 0.4206400006876641;
+    const C117 = 0.9072276394717491;
+    const C118 = 0.04143970018133933;
+    const C119 = 0.9991410066896868;
+    const C120 = 0.03271908282177614;
+    const C121 = 0.9994645874763657;
+    const C122 = 0.9359059267573258;
+    const C123 = 0.3522500479212335;
+    const C124 = 0.7298640726978356;
+    const C125 = 0.6835923020228712;
+    const C126 = 0.41270702980439467;
+    const C127 = 0.9108638249211758;
+    const C128 = 0.4047426296829455;
+    const C129 = 0.9144306445637821;
+    const C130 = 0.023995973777378995;
+    const C131 = 0.9997120551651237;
+    const C132 = 0.9327963677799223;
+    const C133 = 0.3604038516117495;
+    const C134 = 0.7238708892203581;
+    const C135 = 0.6899354576620396;
+    const C136 = 0.7178225801720864;
+    const C137 = 0.6962260720449132;
+    const C138 = 0.3967474068432212;
+    const C139 = 0.9179278267724427;
+    const C140 = 0.015271037346674515;
+    const C141 = 0.9998833909103383;
+    const C142 = 0.9296157727476445;
+    const C143 = 0.368530209153605;
+    const C144 = 0.9263643838751181;
+    const C145 = 0.3766285016932107;
+    const C146 = 0.7117196061551713;
+    const C147 = 0.7024636661168517;
+    const C148 = 0.38872197015239557;
+    const C149 = 0.9213551052231925;
+    const C150 = 0.006544937967351858;
+    const C151 = 0.9999785816641292;
+    t13 = re[16];
+    t2 = im[16];
+    t7 = re[61];
+    t5 = im[61];
+    t1 = re[106];
+    t3 = im[106];
+    t10 = re[151];
+    t4 = im[151];
+    t11 = t13 + t1;
+    t0 = t2 + t3;
+    t12 = t7 + t10;
+    t6 = t5 + t4;
+    t8 = t13 - t1;
+    t14 = t2 - t3;
+    t9 = t7 - t10;
+    t13 = t5 - t4;
+    t1 = t11 + t12;
+    t2 = t0 + t6;
+    t3 = t8 + t13;
+    t7 = t14 - t9;
+    t10 = t11 - t12;
+    t5 = t0 - t6;
+    t4 = t8 - t13;
+    t11 = t14 + t9;
+    t12 = C0 * t1;
+    t0 = C1 * t2;
+    t6 = t12 + t0;
+    t8 = C1 * t1;
+    t13 = (-C0) * t2;
+    t14 = t8 + t13;
+    X[232] = t6;
+    X[127] = t14;
+    t9 = C2 * t3;
+    t12 = C3 * t7;
+    t0 = t9 + t12;
+    t1 = C3 * t3;
+    t2 = (-C2) * t7;
+    t8 = t1 + t2;
+    X[322] = t0;
+    X[37] = t8;
+    t13 = C4 * t10;
+    t6 = C5 * t5;
+    t14 = t13 + t6;
+    t9 = C5 * t10;
+    t12 = (-C4) * t5;
+    t3 = t9 + t12;
+    X[52] = t14;
+    X[307] = t3;
+    t7 = C6 * t4;
+    t1 = C7 * t11;
+    t2 = t7 + t1;
+    t0 = C7 * t4;
+    t8 = (-C6) * t11;
+    t13 = t0 + t8;
+    X[142] = t2;
+    X[217] = t13;
+    t6 = re[72];
+    t10 = im[72];
+    t5 = re[117];
+    t9 = im[117];
+    t12 = re[162];
+    t14 = im[162];
+    t3 = re[27];
+    t7 = im[27];
+    t1 = t6 + t12;
+    t4 = t10 + t14;
+    t11 = t5 + t3;
+    t0 = t9 + t7;
+    t8 = t6 - t12;
+    t2 = t10 - t14;
+    t13 = t5 - t3;
+    t6 = t9 - t7;
+    t12 = t1 + t11;
+    t10 = t4 + t0;
+    t14 = t8 + t6;
+    t5 = t2 - t13;
+    t3 = t1 - t11;
+    t9 = t4 - t0;
+    t7 = t8 - t6;
+    t1 = t2 + t13;
+    t11 = C8 * t12;
+    t4 = C9 * t10;
+    t0 = t11 + t4;
+    t8 = C9 * t12;
+    t6 = (-C8) * t10;
+    t2 = t8 + t6;
+    X[144] = t0;
+    X[215] = t2;
+    t13 = C10 * t14;
+    t11 = C11 * t5;
+    t4 = t13 + t11;
+    t12 = C11 * t14;
+    t10 = (-C10) * t5;
+    t8 = t12 + t10;
+    X[234] = t4;
+    X[125] = t8;
+    t6 = C12 * t3;
+    t0 = C13 * t9;
+    t2 = t6 + t0;
+    t13 = C13 * t3;
+    t11 = (-C12) * t9;
+    t14 = t13 + t11;
+    X[324] = t2;
+    X[35] = t14;
+    t5 = C14 * t7;
+    t12 = C15 * t1;
+    t10 = t5 + t12;
+    t4 = C15 * t7;
+    t8 = (-C14) * t1;
+    t6 = t4 + t8;
+    X[54] = t10;
+    X[305] = t6;
+    t0 = re[168];
+    t3 = im[168];
+    t9 = re[33];
+    t13 = im[33];
+    t11 = re[78];
+    t2 = im[78];
+    t14 = re[123];
+    t5 = im[123];
+    t12 = t0 + t11;
+    t7 = t3 + t2;
+    t1 = t9 + t14;
+    t4 = t13 + t5;
+    t8 = t0 - t11;
+    t10 = t3 - t2;
+    t6 = t9 - t14;
+    t0 = t13 - t5;
+    t11 = t12 + t1;
+    t3 = t7 + t4;
+    t2 = t8 + t0;
+    t9 = t10 - t6;
+    t14 = t12 - t1;
+    t13 = t7 - t4;
+    t5 = t8 - t0;
+    t12 = t10 + t6;
+    t1 = C16 * t11;
+    t7 = C17 * t3;
+    t4 = t1 + t7;
+    t8 = C17 * t11;
+    t0 = (-C16) * t3;
+    t10 = t8 + t0;
+    X[56] = t4;
+    X[303] = t10;
+    t6 = C18 * t2;
+    t1 = C19 * t9;
+    t7 = t6 + t1;
+    t11 = C19 * t2;
+    t3 = (-C18) * t9;
+    t8 = t11 + t3;
+    X[146] = t7;
+    X[213] = t8;
+    t0 = C20 * t14;
+    t4 = C21 * t13;
+    t10 = t0 + t4;
+    t6 = C21 * t14;
+    t1 = (-C20) * t13;
+    t2 = t6 + t1;
+    X[236] = t10;
+    X[123] = t2;
+    t9 = C22 * t5;
+    t11 = C23 * t12;
+    t3 = t9 + t11;
+    t7 = C23 * t5;
+    t8 = (-C22) * t12;
+    t0 = t7 + t8;
+    X[326] = t3;
+    X[33] = t0;
+    t4 = re[84];
+    t14 = im[84];
+    t13 = re[129];
+    t6 = im[129];
+    t1 = re[174];
+    t10 = im[174];
+    t2 = re[39];
+    t9 = im[39];
+    t11 = t4 + t1;
+    t5 = t14 + t10;
+    t12 = t13 + t2;
+    t7 = t6 + t9;
+    t8 = t4 - t1;
+    t3 = t14 - t10;
+    t0 = t13 - t2;
+    t4 = t6 - t9;
+    t1 = t11 + t12;
+    t14 = t5 + t7;
+    t10 = t8 + t4;
+    t13 = t3 - t0;
+    t2 = t11 - t12;
+    t6 = t5 - t7;
+    t9 = t8 - t4;
+    t11 = t3 + t0;
+    t12 = C24 * t1;
+    t5 = C25 * t14;
+    t7 = t12 + t5;
+    t8 = C25 * t1;
+    t4 = (-C24) * t14;
+    t3 = t8 + t4;
+    X[328] = t7;
+    X[31] = t3;
+    t0 = C26 * t10;
+    t12 = C27 * t13;
+    t5 = t0 + t12;
+    t1 = C27 * t10;
+    t14 = (-C26) * t13;
+    t8 = t1 + t14;
+    X[58] = t5;
+    X[301] = t8;
+    t4 = C28 * t2;
+    t7 = C29 * t6;
+    t3 = t4 + t7;
+    t0 = C29 * t2;
+    t12 = (-C28) * t6;
+    t10 = t0 + t12;
+    X[148] = t3;
+    X[211] = t10;
+    t13 = C30 * t9;
+    t1 = C31 * t11;
+    t14 = t13 + t1;
+    t5 = C31 * t9;
+    t8 = (-C30) * t11;
+    t4 = t5 + t8;
+    X[238] = t14;
+    X[121] = t4;
+    t7 = re[20];
+    t2 = im[20];
+    t6 = re[65];
+    t0 = im[65];
+    t12 = re[110];
+    t3 = im[110];
+    t10 = re[155];
+    t13 = im[155];
+    t1 = t7 + t12;
+    t9 = t2 + t3;
+    t11 = t6 + t10;
+    t5 = t0 + t13;
+    t8 = t7 - t12;
+    t14 = t2 - t3;
+    t4 = t6 - t10;
+    t7 = t0 - t13;
+    t12 = t1 + t11;
+    t2 = t9 + t5;
+    t3 = t8 + t7;
+    t6 = t14 - t4;
+    t10 = t1 - t11;
+    t0 = t9 - t5;
+    t13 = t8 - t7;
+    t1 = t14 + t4;
+    t11 = C32 * t12;
+    t9 = C33 * t2;
+    t5 = t11 + t9;
+    t8 = C33 * t12;
+    t7 = (-C32) * t2;
+    t14 = t8 + t7;
+    X[240] = t5;
+    X[119] = t14;
+    t4 = C34 * t3;
+    t11 = C35 * t6;
+    t9 = t4 + t11;
+    t12 = C35 * t3;
+    t2 = (-C34) * t6;
+    t8 = t12 + t2;
+    X[330] = t9;
+    X[29] = t8;
+    t7 = C36 * t10;
+    t5 = C37 * t0;
+    t14 = t7 + t5;
+    t4 = C37 * t10;
+    t11 = (-C36) * t0;
+    t3 = t4 + t11;
+    X[60] = t14;
+    X[299] = t3;
+    t6 = C38 * t13;
+    t12 = C39 * t1;
+    t2 = t6 + t12;
+    t9 = C39 * t13;
+    t8 = (-C38) * t1;
+    t7 = t9 + t8;
+    X[150] = t2;
+    X[209] = t7;
+    t5 = re[116];
+    t10 = im[116];
+    t0 = re[161];
+    t4 = im[161];
+    t11 = re[26];
+    t14 = im[26];
+    t3 = re[71];
+    t6 = im[71];
+    t12 = t5 + t11;
+    t13 = t10 + t14;
+    t1 = t0 + t3;
+    t9 = t4 + t6;
+    t8 = t5 - t11;
+    t2 = t10 - t14;
+    t7 = t0 - t3;
+    t5 = t4 - t6;
+    t11 = t12 + t1;
+    t10 = t13 + t9;
+    t14 = t8 + t5;
+    t0 = t2 - t7;
+    t3 = t12 - t1;
+    t4 = t13 - t9;
+    t6 = t8 - t5;
+    t12 = t2 + t7;
+    t1 = C40 * t11;
+    t13 = C41 * t10;
+    t9 = t1 + t13;
+    t8 = C41 * t11;
+    t5 = (-C40) * t10;
+    t2 = t8 + t5;
+    X[152] = t9;
+    X[207] = t2;
+    t7 = C42 * t14;
+    t1 = C43 * t0;
+    t13 = t7 + t1;
+    t11 = C43 * t14;
+    t10 = (-C42) * t0;
+    t8 = t11 + t10;
+    X[242] = t13;
+    X[117] = t8;
+    t5 = C44 * t3;
+    t9 = C45 * t4;
+    t2 = t5 + t9;
+    t7 = C45 * t3;
+    t1 = (-C44) * t4;
+    t14 = t7 + t1;
+    X[332] = t2;
+    X[27] = t14;
+    t0 = C46 * t6;
+    t11 = C47 * t12;
+    t10 = t0 + t11;
+    t13 = C47 * t6;
+    t8 = (-C46) * t12;
+    t5 = t13 + t8;
+    X[62] = t10;
+    X[297] = t5;
+    t9 = re[32];
+    t3 = im[32];
+    t4 = re[77];
+    t7 = im[77];
+    t1 = re[122];
+    t2 = im[122];
+    t14 = re[167];
+    t0 = im[167];
+    t11 = t9 + t1;
+    t6 = t3 + t2;
+    t12 = t4 + t14;
+    t13 = t7 + t0;
+    t8 = t9 - t1;
+    t10 = t3 - t2;
+    t5 = t4 - t14;
+    t9 = t7 - t0;
+    t1 = t11 + t12;
+    t3 = t6 + t13;
+    t2 = t8 + t9;
+    t4 = t10 - t5;
+    t14 = t11 - t12;
+    t7 = t6 - t13;
+    t0 = t8 - t9;
+    t11 = t10 + t5;
+    t12 = C48 * t1;
+    t6 = C49 * t3;
+    t13 = t12 + t6;
+    t8 = C49 * t1;
+    t9 = (-C48) * t3;
+    t10 = t8 + t9;
+    X[64] = t13;
+    X[295] = t10;
+    t5 = C50 * t2;
+    t12 = C51 * t4;
+    t6 = t5 + t12;
+    t1 = C51 * t2;
+    t3 = (-C50) * t4;
+    t8 = t1 + t3;
+    X[154] = t6;
+    X[205] = t8;
+    t9 = C52 * t14;
+    t13 = C53 * t7;
+    t10 = t9 + t13;
+    t5 = C53 * t14;
+    t12 = (-C52) * t7;
+    t2 = t5 + t12;
+    X[244] = t10;
+    X[115] = t2;
+    t4 = C54 * t0;
+    t1 = C55 * t11;
+    t3 = t4 + t1;
+    t6 = C55 * t0;
+    t8 = (-C54) * t11;
+    t9 = t6 + t8;
+    X[334] = t3;
+    X[25] = t9;
+    t13 = re[148];
+    t14 = im[148];
+    t7 = re[13];
+    t5 = im[13];
+    t12 = re[58];
+    t10 = im[58];
+    t2 = re[103];
+    t4 = im[103];
+    t1 = t13 + t12;
+    t0 = t14 + t10;
+    t11 = t7 + t2;
+    t6 = t5 + t4;
+    t8 = t13 - t12;
+    t3 = t14 - t10;
+    t9 = t7 - t2;
+    t13 = t5 - t4;
+    t12 = t1 + t11;
+    t14 = t0 + t6;
+    t10 = t8 + t13;
+    t7 = t3 - t9;
+    t2 = t1 - t11;
+    t5 = t0 - t6;
+    t4 = t8 - t13;
+    t1 = t3 + t9;
+    t11 = C56 * t12;
+    t0 = C57 * t14;
+    t6 = t11 + t0;
+    t8 = C57 * t12;
+    t13 = (-C56) * t14;
+    t3 = t8 + t13;
+    X[336] = t6;
+    X[23] = t3;
+    t9 = C58 * t10;
+    t11 = C59 * t7;
+    t0 = t9 + t11;
+    t12 = C59 * t10;
+    t14 = (-C58) * t7;
+    t8 = t12 + t14;
+    X[66] = t0;
+    X[293] = t8;
+    t13 = C60 * t2;
+    t6 = C61 * t5;
+    t3 = t13 + t6;
+    t9 = C61 * t2;
+    t11 = (-C60) * t5;
+    t10 = t9 + t11;
+    X[156] = t3;
+    X[203] = t10;
+    t7 = C62 * t4;
+    t12 = C63 * t1;
+    t14 = t7 + t12;
+    t0 = C63 * t4;
+    t8 = (-C62) * t1;
+    t13 = t0 + t8;
+    X[246] = t14;
+    X[113] = t13;
+    t6 = re[64];
+    t2 = im[64];
+    t5 = re[109];
+    t9 = im[109];
+    t11 = re[154];
+    t3 = im[154];
+    t10 = re[19];
+    t7 = im[19];
+    t12 = t6 + t11;
+    t4 = t2 + t3;
+    t1 = t5 + t10;
+    t0 = t9 + t7;
+    t8 = t6 - t11;
+    t14 = t2 - t3;
+    t13 = t5 - t10;
+    t6 = t9 - t7;
+    t11 = t12 + t1;
+    t2 = t4 + t0;
+    t3 = t8 + t6;
+    t5 = t14 - t13;
+    t10 = t12 - t1;
+    t9 = t4 - t0;
+    t7 = t8 - t6;
+    t12 = t14 + t13;
+    t1 = C64 * t11;
+    t4 = C65 * t2;
+    t0 = t1 + t4;
+    t8 = C65 * t11;
+    t6 = (-C64) * t2;
+    t14 = t8 + t6;
+    X[248] = t0;
+    X[111] = t14;
+    t13 = C66 * t3;
+    t1 = C67 * t5;
+    t4 = t13 + t1;
+    t11 = C67 * t3;
+    t2 = (-C66) * t5;
+    t8 = t11 + t2;
+    X[338] = t4;
+    X[21] = t8;
+    t6 = C68 * t10;
+    t0 = C69 * t9;
+    t14 = t6 + t0;
+    t13 = C69 * t10;
+    t1 = (-C68) * t9;
+    t3 = t13 + t1;
+    X[68] = t14;
+    X[291] = t3;
+    t5 = C70 * t7;
+    t11 = C71 * t12;
+    t2 = t5 + t11;
+    t4 = C71 * t7;
+    t8 = (-C70) * t12;
+    t6 = t4 + t8;
+    X[158] = t2;
+    X[201] = t6;
+    t0 = re[160];
+    t10 = im[160];
+    t9 = re[25];
+    t13 = im[25];
+    t1 = re[70];
+    t14 = im[70];
+    t3 = re[115];
+    t5 = im[115];
+    t11 = t0 + t1;
+    t7 = t10 + t14;
+    t12 = t9 + t3;
+    t4 = t13 + t5;
+    t8 = t0 - t1;
+    t2 = t10 - t14;
+    t6 = t9 - t3;
+    t0 = t13 - t5;
+    t1 = t11 + t12;
+    t10 = t7 + t4;
+    t14 = t8 + t0;
+    t9 = t2 - t6;
+    t3 = t11 - t12;
+    t13 = t7 - t4;
+    t5 = t8 - t0;
+    t11 = t2 + t6;
+    t12 = C72 * t1;
+    t7 = C73 * t10;
+    t4 = t12 + t7;
+    t8 = C73 * t1;
+    t0 = (-C72) * t10;
+    t2 = t8 + t0;
+    X[160] = t4;
+    X[199] = t2;
+    t6 = C74 * t14;
+    t12 = C75 * t9;
+    t7 = t6 + t12;
+    t1 = C75 * t14;
+    t10 = (-C74) * t9;
+    t8 = t1 + t10;
+    X[250] = t7;
+    X[109] = t8;
+    t0 = C76 * t3;
+    t4 = C77 * t13;
+    t2 = t0 + t4;
+    t6 = C77 * t3;
+    t12 = (-C76) * t13;
+    t14 = t6 + t12;
+    X[340] = t2;
+    X[19] = t14;
+    t9 = C78 * t5;
+    t1 = C79 * t11;
+    t10 = t9 + t1;
+    t7 = C79 * t5;
+    t8 = (-C78) * t11;
+    t0 = t7 + t8;
+    X[70] = t10;
+    X[289] = t0;
+    t4 = re[36];
+    t3 = im[36];
+    t13 = re[81];
+    t6 = im[81];
+    t12 = re[126];
+    t2 = im[126];
+    t14 = re[171];
+    t9 = im[171];
+    t1 = t4 + t12;
+    t5 = t3 + t2;
+    t11 = t13 + t14;
+    t7 = t6 + t9;
+    t8 = t4 - t12;
+    t10 = t3 - t2;
+    t0 = t13 - t14;
+    t4 = t6 - t9;
+    t12 = t1 + t11;
+    t3 = t5 + t7;
+    t2 = t8 + t4;
+    t13 = t10 - t0;
+    t14 = t1 - t11;
+    t6 = t5 - t7;
+    t9 = t8 - t4;
+    t1 = t10 + t0;
+    t11 = C80 * t12;
+    t5 = C81 * t3;
+    t7 = t11 + t5;
+    t8 = C81 * t12;
+    t4 = (-C80) * t3;
+    t10 = t8 + t4;
+    X[72] = t7;
+    X[287] = t10;
+    t0 = C82 * t2;
+    t11 = C83 * t13;
+    t5 = t0 + t11;
+    t12 = C83 * t2;
+    t3 = (-C82) * t13;
+    t8 = t12 + t3;
+    X[162] = t5;
+    X[197] = t8;
+    t4 = C84 * t14;
+    t7 = C85 * t6;
+    t10 = t4 + t7;
+    t0 = C85 * t14;
+    t11 = (-C84) * t6;
+    t2 = t0 + t11;
+    X[252] = t10;
+    X[107] = t2;
+    t13 = C86 * t9;
+    t12 = C87 * t1;
+    t3 = t13 + t12;
+    t5 = C87 * t9;
+    t8 = (-C86) * t1;
+    t4 = t5 + t8;
+    X[342] = t3;
+    X[17] = t4;
+    t7 = re[132];
+    t14 = im[132];
+    t6 = re[177];
+    t0 = im[177];
+    t11 = re[42];
+    t10 = im[42];
+    t2 = re[87];
+    t13 = im[87];
+    t12 = t7 + t11;
+    t9 = t14 + t10;
+    t1 = t6 + t2;
+    t5 = t0 + t13;
+    t8 = t7 - t11;
+    t3 = t14 - t10;
+    t4 = t6 - t2;
+    t7 = t0 - t13;
+    t11 = t12 + t1;
+    t14 = t9 + t5;
+    t10 = t8 + t7;
+    t6 = t3 - t4;
+    t2 = t12 - t1;
+    t0 = t9 - t5;
+    t13 = t8 - t7;
+    t12 = t3 + t4;
+    t1 = C88 * t11;
+    t9 = C89 * t14;
+    t5 = t1 + t9;
+    t8 = C89 * t11;
+    t7 = (-C88) * t14;
+    t3 = t8 + t7;
+    X[344] = t5;
+    X[15] = t3;
+    t4 = C90 * t10;
+    t1 = C91 * t6;
+    t9 = t4 + t1;
+    t11 = C91 * t10;
+    t14 = (-C90) * t6;
+    t8 = t11 + t14;
+    X[74] = t9;
+    X[285] = t8;
+    t7 = C92 * t2;
+    t5 = C93 * t0;
+    t3 = t7 + t5;
+    t4 = C93 * t2;
+    t1 = (-C92) * t0;
+    t10 = t4 + t1;
+    X[164] = t3;
+    X[195] = t10;
+    t6 = C94 * t13;
+    t11 = C95 * t12;
+    t14 = t6 + t11;
+    t9 = C95 * t13;
+    t8 = (-C94) * t12;
+    t7 = t9 + t8;
+    X[254] = t14;
+    X[105] = t7;
+    t5 = re[48];
+    t2 = im[48];
+    t0 = re[93];
+    t4 = im[93];
+    t1 = re[138];
+    t3 = im[138];
+    t10 = re[3];
+    t6 = im[3];
+    t11 = t5 + t1;
+    t13 = t2 + t3;
+    t12 = t0 + t10;
+    t9 = t4 + t6;
+    t8 = t5 - t1;
+    t14 = t2 - t3;
+    t7 = t0 - t10;
+    t5 = t4 - t6;
+    t1 = t11 + t12;
+    t2 = t13 + t9;
+    t3 = t8 + t5;
+    t0 = t14 - t7;
+    t10 = t11 - t12;
+    t4 = t13 - t9;
+    t6 = t8 - t5;
+    t11 = t14 + t7;
+    t12 = C96 * t1;
+    t13 = C97 * t2;
+    t9 = t12 + t13;
+    t8 = C97 * t1;
+    t5 = (-C96) * t2;
+    t14 = t8 + t5;
+    X[256] = t9;
+    X[103] = t14;
+    t7 = C98 * t3;
+    t12 = C99 * t0;
+    t13 = t7 + t12;
+    t1 = C99 * t3;
+    t2 = (-C98) * t0;
+    t8 = t1 + t2;
+    X[346] = t13;
+    X[13] = t8;
+    t5 = C100 * t10;
+    t9 = C101 * t4;
+    t14 = t5 + t9;
+    t7 = C101 * t10;
+    t12 = (-C100) * t4;
+    t3 = t7 + t12;
+    X[76] = t14;
+    X[283] = t3;
+    t0 = C102 * t6;
+    t1 = C103 * t11;
+    t2 = t0 + t1;
+    t13 = C103 * t6;
+    t8 = (-C102) * t11;
+    t5 = t13 + t8;
+    X[166] = t2;
+    X[193] = t5;
+    t9 = re[164];
+    t10 = im[164];
+    t4 = re[29];
+    t7 = im[29];
+    t12 = re[74];
+    t14 = im[74];
+    t3 = re[119];
+    t0 = im[119];
+    t1 = t9 + t12;
+    t6 = t10 + t14;
+    t11 = t4 + t3;
+    t13 = t7 + t0;
+    t8 = t9 - t12;
+    t2 = t10 - t14;
+    t5 = t4 - t3;
+    t9 = t7 - t0;
+    t12 = t1 + t11;
+    t10 = t6 + t13;
+    t14 = t8 + t9;
+    t4 = t2 - t5;
+    t3 = t1 - t11;
+    t7 = t6 - t13;
+    t0 = t8 - t9;
+    t1 = t2 + t5;
+    t11 = C104 * t12;
+    t6 = C105 * t10;
+    t13 = t11 + t6;
+    t8 = C105 * t12;
+    t9 = (-C104) * t10;
+    t2 = t8 + t9;
+    X[168] = t13;
+    X[191] = t2;
+    t5 = C106 * t14;
+    t11 = C107 * t4;
+    t6 = t5 + t11;
+    t12 = C107 * t14;
+    t10 = (-C106) * t4;
+    t8 = t12 + t10;
+    X[258] = t6;
+    X[101] = t8;
+    t9 = C108 * t3;
+    t13 = C109 * t7;
+    t2 = t9 + t13;
+    t5 = C109 * t3;
+    t11 = (-C108) * t7;
+    t14 = t5 + t11;
+    X[348] = t2;
+    X[11] = t14;
+    t4 = C110 * t0;
+    t12 = C111 * t1;
+    t10 = t4 + t12;
+    t6 = C111 * t0;
+    t8 = (-C110) * t1;
+    t9 = t6 + t8;
+    X[78] = t10;
+    X[281] = t9;
+    t13 = re[80];
+    t3 = im[80];
+    t7 = re[125];
+    t5 = im[125];
+    t11 = re[170];
+    t2 = im[170];
+    t14 = re[35];
+    t4 = im[35];
+    t12 = t13 + t11;
+    t0 = t3 + t2;
+    t1 = t7 + t14;
+    t6 = t5 + t4;
+    t8 = t13 - t11;
+    t10 = t3 - t2;
+    t9 = t7 - t14;
+    t13 = t5 - t4;
+    t11 = t12 + t1;
+    t3 = t0 + t6;
+    t2 = t8 + t13;
+    t7 = t10 - t9;
+    t14 = t12 - t1;
+    t5 = t0 - t6;
+    t4 = t8 - t13;
+    t12 = t10 + t9;
+    t1 = C112 * t11;
+    t0 = C113 * t3;
+    t6 = t1 + t0;
+    t8 = C113 * t11;
+    t13 = (-C112) * t3;
+    t10 = t8 + t13;
+    X[80] = t6;
+    X[279] = t10;
+    t9 = C114 * t2;
+    t1 = C115 * t7;
+    t0 = t9 + t1;
+    t11 = C115 * t2;
+    t3 = (-C114) * t7;
+    t8 = t11 + t3;
+    X[170] = t0;
+    X[189] = t8;
+    t13 = C116 * t14;
+    t6 = C117 * t5;
+    t10 = t13 + t6;
+    t9 = C117 * t14;
+    t1 = (-C116) * t5;
+    t2 = t9 + t1;
+    X[260] = t10;
+    X[99] = t2;
+    t7 = C118 * t4;
+    t11 = C119 * t12;
+    t3 = t7 + t11;
+    t0 = C119 * t4;
+    t8 = (-C118) * t12;
+    t13 = t0 + t8;
+    X[350] = t3;
+    X[9] = t13;
+    t6 = re[176];
+    t14 = im[176];
+    t5 = re[41];
+    t9 = im[41];
+    t1 = re[86];
+    t10 = im[86];
+    t2 = re[131];
+    t7 = im[131];
+    t11 = t6 + t1;
+    t4 = t14 + t10;
+    t12 = t5 + t2;
+    t0 = t9 + t7;
+    t8 = t6 - t1;
+    t3 = t14 - t10;
+    t13 = t5 - t2;
+    t6 = t9 - t7;
+    t1 = t11 + t12;
+    t14 = t4 + t0;
+    t10 = t8 + t6;
+    t5 = t3 - t13;
+    t2 = t11 - t12;
+    t9 = t4 - t0;
+    t7 = t8 - t6;
+    t11 = t3 + t13;
+    t12 = C120 * t1;
+    t4 = C121 * t14;
+    t0 = t12 + t4;
+    t8 = C121 * t1;
+    t6 = (-C120) * t14;
+    t3 = t8 + t6;
+    X[352] = t0;
+    X[7] = t3;
+    t13 = C122 * t10;
+    t12 = C123 * t5;
+    t4 = t13 + t12;
+    t1 = C123 * t10;
+    t14 = (-C122) * t5;
+    t8 = t1 + t14;
+    X[82] = t4;
+    X[277] = t8;
+    t6 = C124 * t2;
+    t0 = C125 * t9;
+    t3 = t6 + t0;
+    t13 = C125 * t2;
+    t12 = (-C124) * t9;
+    t10 = t13 + t12;
+    X[172] = t3;
+    X[187] = t10;
+    t5 = C126 * t7;
+    t1 = C127 * t11;
+    t14 = t5 + t1;
+    t4 = C127 * t7;
+    t8 = (-C126) * t11;
+    t6 = t4 + t8;
+    X[262] = t14;
+    X[97] = t6;
+    t0 = re[112];
+    t2 = im[112];
+    t9 = re[157];
+    t13 = im[157];
+    t12 = re[22];
+    t3 = im[22];
+    t10 = re[67];
+    t5 = im[67];
+    t1 = t0 + t12;
+    t7 = t2 + t3;
+    t11 = t9 + t10;
+    t4 = t13 + t5;
+    t8 = t0 - t12;
+    t14 = t2 - t3;
+    t6 = t9 - t10;
+    t0 = t13 - t5;
+    t12 = t1 + t11;
+    t2 = t7 + t4;
+    t3 = t8 + t0;
+    t9 = t14 - t6;
+    t10 = t1 - t11;
+    t13 = t7 - t4;
+    t5 = t8 - t0;
+    t1 = t14 + t6;
+    t11 = C128 * t12;
+    t7 = C129 * t2;
+    t4 = t11 + t7;
+    t8 = C129 * t12;
+    t0 = (-C128) * t2;
+    t14 = t8 + t0;
+    X[264] = t4;
+    X[95] = t14;
+    t6 = C130 * t3;
+    t11 = C131 * t9;
+    t7 = t6 + t11;
+    t12 = C131 * t3;
+    t2 = (-C130) * t9;
+    t8 = t12 + t2;
+    X[354] = t7;
+    X[5] = t8;
+    t0 = C132 * t10;
+    t4 = C133 * t13;
+    t14 = t0 + t4;
+    t6 = C133 * t10;
+    t11 = (-C132) * t13;
+    t3 = t6 + t11;
+    X[84] = t14;
+    X[275] = t3;
+    t9 = C134 * t5;
+    t12 = C135 * t1;
+    t2 = t9 + t12;
+    t7 = C135 * t5;
+    t8 = (-C134) * t1;
+    t0 = t7 + t8;
+    X[174] = t2;
+    X[185] = t0;
+    t4 = re[28];
+    t10 = im[28];
+    t13 = re[73];
+    t6 = im[73];
+    t11 = re[118];
+    t14 = im[118];
+    t3 = re[163];
+    t9 = im[163];
+    t12 = t4 + t11;
+    t5 = t10 + t14;
+    t1 = t13 + t3;
+    t7 = t6 + t9;
+    t8 = t4 - t11;
+    t2 = t10 - t14;
+    t0 = t13 - t3;
+    t4 = t6 - t9;
+    t11 = t12 + t1;
+    t10 = t5 + t7;
+    t14 = t8 + t4;
+    t13 = t2 - t0;
+    t3 = t12 - t1;
+    t6 = t5 - t7;
+    t9 = t8 - t4;
+    t12 = t2 + t0;
+    t1 = C136 * t11;
+    t5 = C137 * t10;
+    t7 = t1 + t5;
+    t8 = C137 * t11;
+    t4 = (-C136) * t10;
+    t2 = t8 + t4;
+    X[176] = t7;
+    X[183] = t2;
+    t0 = C138 * t14;
+    t1 = C139 * t13;
+    t5 = t0 + t1;
+    t11 = C139 * t14;
+    t10 = (-C138) * t13;
+    t8 = t11 + t10;
+    X[266] = t5;
+    X[93] = t8;
+    t4 = C140 * t3;
+    t7 = C141 * t6;
+    t2 = t4 + t7;
+    t0 = C141 * t3;
+    t1 = (-C140) * t6;
+    t14 = t0 + t1;
+    X[356] = t2;
+    X[3] = t14;
+    t13 = C142 * t9;
+    t11 = C143 * t12;
+    t10 = t13 + t11;
+    t5 = C143 * t9;
+    t8 = (-C142) * t12;
+    t4 = t5 + t8;
+    X[86] = t10;
+    X[273] = t4;
+    t7 = re[124];
+    t3 = im[124];
+    t6 = re[169];
+    t0 = im[169];
+    t1 = re[34];
+    t2 = im[34];
+    t14 = re[79];
+    t13 = im[79];
+    t11 = t7 + t1;
+    t9 = t3 + t2;
+    t12 = t6 + t14;
+    t5 = t0 + t13;
+    t8 = t7 - t1;
+    t10 = t3 - t2;
+    t4 = t6 - t14;
+    t7 = t0 - t13;
+    t1 = t11 + t12;
+    t3 = t9 + t5;
+    t2 = t8 + t7;
+    t6 = t10 - t4;
+    t14 = t11 - t12;
+    t0 = t9 - t5;
+    t13 = t8 - t7;
+    t11 = t10 + t4;
+    t12 = C144 * t1;
+    t9 = C145 * t3;
+    t5 = t12 + t9;
+    t8 = C145 * t1;
+    t7 = (-C144) * t3;
+    t10 = t8 + t7;
+    X[88] = t5;
+    X[271] = t10;
+    t4 = C146 * t2;
+    t12 = C147 * t6;
+    t9 = t4 + t12;
+    t1 = C147 * t2;
+    t3 = (-C146) * t6;
+    t8 = t1 + t3;
+    X[178] = t9;
+    X[181] = t8;
+    t7 = C148 * t14;
+    t5 = C149 * t0;
+    t10 = t7 + t5;
+    t4 = C149 * t14;
+    t12 = (-C148) * t0;
+    t2 = t4 + t12;
+    X[268] = t10;
+    X[91] = t2;
+    t6 = C150 * t13;
+    t1 = C151 * t11;
+    t3 = t6 + t1;
+    t9 = C151 * t13;
+    t8 = (-C150) * t11;
+    t7 = t9 + t8;
+    X[358] = t3;
+    X[1] = t7;
+}
+
+/**
+ *  Part 1 of ApplyWindowedIMDCT_W75_360().
+ * 
+ *  @param {Number[]} X 
+ *    - The input block (360 points).
+ *  @param {Number[]} y 
+ *    - The array that would contain the output block (720 points).
+ *  @param {Number[]} re 
+ *    - The scratch buffer (real part, 180 points).
+ *  @param {Number[]} im 
+ *    - The scratch buffer (imaginary part, 180 points).
+ */
+function ApplyWindowedIMDCT_W75_360_Part1(X, y, re, im) {
+    let t0, t1, t10, t11, t12, t13, t14, t2, t3, t4, t5, t6, t7, t8, t9;
+    const C0 = 0.8660254037844387;
+    const C1 = 0.49999999999999994;
+    const C2 = 0.5;
+    const C3 = 0.8660254037844386;
+    const C4 = 0.984807753012208;
+    const C5 = 0.17364817766693033;
+    const C6 = 0.766044443118978;
+    const C7 = 0.6427876096865393;
+    const C8 = 0.3420201433256687;
+    const C9 = 0.9396926207859084;
+    const C10 = 1.4088320528055172;
+    const C11 = 0.12325683343243876;
+    const C12 = 1.1584559306791384;
+    const C13 = 0.8111595753452777;
+    const C14 = 0.5976724774602398;
+    const C15 = 1.281712764111577;
+    const C16 = 0.9510565162951535;
+    const C17 = 0.3090169943749474;
+    const C18 = 0.6691306063588582;
+    const C19 = 0.7431448254773942;
+    const C20 = 0.20791169081775931;
+    const C21 = 0.9781476007338057;
+    const C22 = 0.882947592858927;
+    const C23 = 0.4694715627858908;
+    const C24 = 0.5299192642332049;
+    const C25 = 0.848048096156426;
+    const C26 = 0.03489949670250097;
+    const C27 = 0.9993908270190958;
+    const C28 = 0.7880107536067219;
+    const C29 = 0.6156614753256583;
+    const C30 = 0.374606593415912;
+    const C31 = 0.9271838545667874;
+    const C32 = 0.9902680687415704;
+    const C33 = 0.13917310096006544;
+    const C34 = 0.8090169943749475;
+    const C35 = 0.5877852522924731;
+    const C36 = 0.40673664307580015;
+    const C37 = 0.9135454576426009;
+    const C38 = 0.9945218953682733;
+    const C39 = 0.10452846326765346;
+    const C40 = 0.6946583704589973;
+    const C41 = 0.7193398003386512;
+    const C42 = 0.24192189559966773;
+    const C43 = 0.9702957262759965;
+    const C44 = 0.9612616959383189;
+    const C45 = 0.27563735581699916;
+    const C46 = 0.5591929034707468;
+    const C47 = 0.8290375725550417;
+    const C48 = 0.0697564737441253;
+    const C49 = 0.9975640502598242;
+    const C50 = 0.898794046299167;
+    const C51 = 0.4383711467890774;
+    const C52 = 0.5590169943749475;
+    const C53 = 0.25;
+    t0 = X[0];
+    t1 = X[359];
+    t2 = X[120];
+    t3 = X[239];
+    t4 = C0 * t2;
+    t5 = C1 * t3;
+    t4 = t4 + t5;
+    t5 = (-C1) * t2;
+    t2 = C0 * t3;
+    t3 = t5 + t2;
+    t5 = X[240];
+    t2 = X[119];
+    t6 = C1 * t5;
+    t7 = C0 * t2;
+    t6 = t6 + t7;
+    t7 = (-C0) * t5;
+    t5 = C1 * t2;
+    t2 = t7 + t5;
+    t7 = t4 + t6;
+    t5 = t3 + t2;
+    t8 = C2 * t7;
+    t8 = t0 - t8;
+    t9 = C2 * t5;
+    t9 = t1 - t9;
+    t4 = t4 - t6;
+    t6 = C3 * t4;
+    t4 = t3 - t2;
+    t3 = C3 * t4;
+    t2 = t0 + t7;
+    t4 = t1 + t5;
+    t0 = t8 + t3;
+    t7 = t9 - t6;
+    t1 = t8 - t3;
+    t5 = t9 + t6;
+    re[0] = t2;
+    im[0] = t4;
+    re[60] = t0;
+    im[60] = t7;
+    re[120] = t1;
+    im[120] = t5;
+    t8 = X[40];
+    t3 = X[319];
+    t9 = C4 * t8;
+    t6 = C5 * t3;
+    t2 = t9 + t6;
+    t4 = (-C5) * t8;
+    t0 = C4 * t3;
+    t7 = t4 + t0;
+    t1 = X[160];
+    t5 = X[199];
+    t9 = C6 * t1;
+    t6 = C7 * t5;
+    t8 = t9 + t6;
+    t3 = (-C7) * t1;
+    t4 = C6 * t5;
+    t0 = t3 + t4;
+    t9 = X[280];
+    t6 = X[79];
+    t1 = C8 * t9;
+    t5 = C9 * t6;
+    t3 = t1 + t5;
+    t4 = (-C9) * t9;
+    t1 = C8 * t6;
+    t5 = t4 + t1;
+    t9 = t8 + t3;
+    t6 = t0 + t5;
+    t4 = C2 * t9;
+    t1 = t2 - t4;
+    t4 = C2 * t6;
+    t4 = t7 - t4;
+    t8 = t8 - t3;
+    t3 = C3 * t8;
+    t8 = t0 - t5;
+    t0 = C3 * t8;
+    t5 = t2 + t9;
+    t8 = t7 + t6;
+    t2 = t1 + t0;
+    t9 = t4 - t3;
+    t7 = t1 - t0;
+    t6 = t4 + t3;
+    t1 = t2 + t9;
+    t0 = C6 * t1;
+    t4 = t2 * (-C10);
+    t3 = t9 * C11;
+    t1 = t0 - t3;
+    t2 = t0 + t4;
+    t9 = t7 + t6;
+    t3 = C5 * t9;
+    t0 = t7 * (-C12);
+    t4 = t6 * (-C13);
+    t9 = t3 - t4;
+    t7 = t3 + t0;
+    re[20] = t5;
+    im[20] = t8;
+    re[80] = t1;
+    im[80] = t2;
+    re[140] = t9;
+    im[140] = t7;
+    t6 = X[80];
+    t4 = X[279];
+    t3 = C9 * t6;
+    t0 = C8 * t4;
+    t5 = t3 + t0;
+    t8 = (-C8) * t6;
+    t1 = C9 * t4;
+    t2 = t8 + t1;
+    t9 = X[200];
+    t7 = X[159];
+    t3 = C7 * t9;
+    t0 = C6 * t7;
+    t6 = t3 + t0;
+    t4 = (-C6) * t9;
+    t8 = C7 * t7;
+    t1 = t4 + t8;
+    t3 = X[320];
+    t0 = X[39];
+    t9 = C5 * t3;
+    t7 = C4 * t0;
+    t4 = t9 + t7;
+    t8 = (-C4) * t3;
+    t9 = C5 * t0;
+    t7 = t8 + t9;
+    t3 = t6 + t4;
+    t0 = t1 + t7;
+    t8 = C2 * t3;
+    t9 = t5 - t8;
+    t8 = C2 * t0;
+    t8 = t2 - t8;
+    t6 = t6 - t4;
+    t4 = C3 * t6;
+    t6 = t1 - t7;
+    t1 = C3 * t6;
+    t7 = t5 + t3;
+    t6 = t2 + t0;
+    t5 = t9 + t1;
+    t3 = t8 - t4;
+    t2 = t9 - t1;
+    t0 = t8 + t4;
+    t9 = t5 + t3;
+    t1 = C5 * t9;
+    t8 = t5 * (-C12);
+    t4 = t3 * (-C13);
+    t9 = t1 - t4;
+    t5 = t1 + t8;
+    t3 = t2 + t0;
+    t4 = (-C9) * t3;
+    t1 = t2 * C14;
+    t8 = t0 * (-C15);
+    t3 = t4 - t8;
+    t2 = t4 + t1;
+    re[40] = t7;
+    im[40] = t6;
+    re[100] = t9;
+    im[100] = t5;
+    re[160] = t3;
+    im[160] = t2;
+    t0 = re[0];
+    t8 = im[0];
+    t4 = re[20];
+    t1 = im[20];
+    t7 = re[40];
+    t6 = im[40];
+    t9 = t4 + t7;
+    t5 = t1 + t6;
+    t3 = C2 * t9;
+    t2 = t0 - t3;
+    t3 = C2 * t5;
+    t3 = t8 - t3;
+    t4 = t4 - t7;
+    t7 = C3 * t4;
+    t4 = t1 - t6;
+    t1 = C3 * t4;
+    t6 = t0 + t9;
+    t4 = t8 + t5;
+    t0 = t2 + t1;
+    t9 = t3 - t7;
+    t8 = t2 - t1;
+    t5 = t3 + t7;
+    re[0] = t6;
+    im[0] = t4;
+    re[20] = t0;
+    im[20] = t9;
+    re[40] = t8;
+    im[40] = t5;
+    t2 = re[60];
+    t1 = im[60];
+    t3 = re[80];
+    t7 = im[80];
+    t6 = re[100];
+    t4 = im[100];
+    t0 = t3 + t6;
+    t9 = t7 + t4;
+    t8 = C2 * t0;
+    t5 = t2 - t8;
+    t8 = C2 * t9;
+    t8 = t1 - t8;
+    t3 = t3 - t6;
+    t6 = C3 * t3;
+    t3 = t7 - t4;
+    t7 = C3 * t3;
+    t4 = t2 + t0;
+    t3 = t1 + t9;
+    t2 = t5 + t7;
+    t0 = t8 - t6;
+    t1 = t5 - t7;
+    t9 = t8 + t6;
+    re[60] = t4;
+    im[60] = t3;
+    re[80] = t2;
+    im[80] = t0;
+    re[100] = t1;
+    im[100] = t9;
+    t5 = re[120];
+    t7 = im[120];
+    t8 = re[140];
+    t6 = im[140];
+    t4 = re[160];
+    t3 = im[160];
+    t2 = t8 + t4;
+    t0 = t6 + t3;
+    t1 = C2 * t2;
+    t9 = t5 - t1;
+    t1 = C2 * t0;
+    t1 = t7 - t1;
+    t8 = t8 - t4;
+    t4 = C3 * t8;
+    t8 = t6 - t3;
+    t6 = C3 * t8;
+    t3 = t5 + t2;
+    t8 = t7 + t0;
+    t5 = t9 + t6;
+    t2 = t1 - t4;
+    t7 = t9 - t6;
+    t0 = t1 + t4;
+    re[120] = t3;
+    im[120] = t8;
+    re[140] = t5;
+    im[140] = t2;
+    re[160] = t7;
+    im[160] = t0;
+    t9 = X[72];
+    t6 = X[287];
+    t1 = C16 * t9;
+    t4 = C17 * t6;
+    t3 = t1 + t4;
+    t8 = (-C17) * t9;
+    t5 = C16 * t6;
+    t2 = t8 + t5;
+    t7 = X[192];
+    t0 = X[167];
+    t1 = C18 * t7;
+    t4 = C19 * t0;
+    t9 = t1 + t4;
+    t6 = (-C19) * t7;
+    t8 = C18 * t0;
+    t5 = t6 + t8;
+    t1 = X[312];
+    t4 = X[47];
+    t7 = C20 * t1;
+    t0 = C21 * t4;
+    t6 = t7 + t0;
+    t8 = (-C21) * t1;
+    t7 = C20 * t4;
+    t0 = t8 + t7;
+    t1 = t9 + t6;
+    t4 = t5 + t0;
+    t8 = C2 * t1;
+    t7 = t3 - t8;
+    t8 = C2 * t4;
+    t8 = t2 - t8;
+    t9 = t9 - t6;
+    t6 = C3 * t9;
+    t9 = t5 - t0;
+    t5 = C3 * t9;
+    t0 = t3 + t1;
+    t9 = t2 + t4;
+    t3 = t7 + t5;
+    t1 = t8 - t6;
+    t2 = t7 - t5;
+    t4 = t8 + t6;
+    re[36] = t0;
+    im[36] = t9;
+    re[96] = t3;
+    im[96] = t1;
+    re[156] = t2;
+    im[156] = t4;
+    t7 = X[112];
+    t5 = X[247];
+    t8 = C22 * t7;
+    t6 = C23 * t5;
+    t0 = t8 + t6;
+    t9 = (-C23) * t7;
+    t3 = C22 * t5;
+    t1 = t9 + t3;
+    t2 = X[232];
+    t4 = X[127];
+    t8 = C24 * t2;
+    t6 = C25 * t4;
+    t7 = t8 + t6;
+    t5 = (-C25) * t2;
+    t9 = C24 * t4;
+    t3 = t5 + t9;
+    t8 = X[352];
+    t6 = X[7];
+    t2 = C26 * t8;
+    t4 = C27 * t6;
+    t5 = t2 + t4;
+    t9 = (-C27) * t8;
+    t2 = C26 * t6;
+    t4 = t9 + t2;
+    t8 = t7 + t5;
+    t6 = t3 + t4;
+    t9 = C2 * t8;
+    t2 = t0 - t9;
+    t9 = C2 * t6;
+    t9 = t1 - t9;
+    t7 = t7 - t5;
+    t5 = C3 * t7;
+    t7 = t3 - t4;
+    t3 = C3 * t7;
+    t4 = t0 + t8;
+    t7 = t1 + t6;
+    t0 = t2 + t3;
+    t8 = t9 - t5;
+    t1 = t2 - t3;
+    t6 = t9 + t5;
+    t2 = t0 + t8;
+    t3 = C6 * t2;
+    t9 = t0 * (-C10);
+    t5 = t8 * C11;
+    t2 = t3 - t5;
+    t0 = t3 + t9;
+    t8 = t1 + t6;
+    t5 = C5 * t8;
+    t3 = t1 * (-C12);
+    t9 = t6 * (-C13);
+    t8 = t5 - t9;
+    t1 = t5 + t3;
+    re[56] = t4;
+    im[56] = t7;
+    re[116] = t2;
+    im[116] = t0;
+    re[176] = t8;
+    im[176] = t1;
+    t6 = X[152];
+    t9 = X[207];
+    t5 = C28 * t6;
+    t3 = C29 * t9;
+    t4 = t5 + t3;
+    t7 = (-C29) * t6;
+    t2 = C28 * t9;
+    t0 = t7 + t2;
+    t8 = X[272];
+    t1 = X[87];
+    t5 = C30 * t8;
+    t3 = C31 * t1;
+    t6 = t5 + t3;
+    t9 = (-C31) * t8;
+    t7 = C30 * t1;
+    t2 = t9 + t7;
+    t5 = X[32];
+    t3 = X[327];
+    t8 = C32 * t5;
+    t1 = C33 * t3;
+    t9 = t8 + t1;
+    t7 = (-C33) * t5;
+    t8 = C32 * t3;
+    t1 = t7 + t8;
+    t5 = t6 + t9;
+    t3 = t2 + t1;
+    t7 = C2 * t5;
+    t8 = t4 - t7;
+    t7 = C2 * t3;
+    t7 = t0 - t7;
+    t6 = t6 - t9;
+    t9 = C3 * t6;
+    t6 = t2 - t1;
+    t2 = C3 * t6;
+    t1 = t4 + t5;
+    t6 = t0 + t3;
+    t4 = t8 + t2;
+    t5 = t7 - t9;
+    t0 = t8 - t2;
+    t3 = t7 + t9;
+    t8 = t4 + t5;
+    t2 = C5 * t8;
+    t7 = t4 * (-C12);
+    t9 = t5 * (-C13);
+    t8 = t2 - t9;
+    t4 = t2 + t7;
+    t5 = t0 + t3;
+    t9 = (-C9) * t5;
+    t2 = t0 * C14;
+    t7 = t3 * (-C15);
+    t5 = t9 - t7;
+    t0 = t9 + t2;
+    re[76] = t1;
+    im[76] = t6;
+    re[136] = t8;
+    im[136] = t4;
+    re[16] = t5;
+    im[16] = t0;
+    t3 = re[36];
+    t7 = im[36];
+    t9 = re[56];
+    t2 = im[56];
+    t1 = re[76];
+    t6 = im[76];
+    t8 = t9 + t1;
+    t4 = t2 + t6;
+    t5 = C2 * t8;
+    t0 = t3 - t5;
+    t5 = C2 * t4;
+    t5 = t7 - t5;
+    t9 = t9 - t1;
+    t1 = C3 * t9;
+    t9 = t2 - t6;
+    t2 = C3 * t9;
+    t6 = t3 + t8;
+    t9 = t7 + t4;
+    t3 = t0 + t2;
+    t8 = t5 - t1;
+    t7 = t0 - t2;
+    t4 = t5 + t1;
+    re[36] = t6;
+    im[36] = t9;
+    re[56] = t3;
+    im[56] = t8;
+    re[76] = t7;
+    im[76] = t4;
+    t0 = re[96];
+    t2 = im[96];
+    t5 = re[116];
+    t1 = im[116];
+    t6 = re[136];
+    t9 = im[136];
+    t3 = t5 + t6;
+    t8 = t1 + t9;
+    t7 = C2 * t3;
+    t4 = t0 - t7;
+    t7 = C2 * t8;
+    t7 = t2 - t7;
+    t5 = t5 - t6;
+    t6 = C3 * t5;
+    t5 = t1 - t9;
+    t1 = C3 * t5;
+    t9 = t0 + t3;
+    t5 = t2 + t8;
+    t0 = t4 + t1;
+    t3 = t7 - t6;
+    t2 = t4 - t1;
+    t8 = t7 + t6;
+    re[96] = t9;
+    im[96] = t5;
+    re[116] = t0;
+    im[116] = t3;
+    re[136] = t2;
+    im[136] = t8;
+    t4 = re[156];
+    t1 = im[156];
+    t7 = re[176];
+    t6 = im[176];
+    t9 = re[16];
+    t5 = im[16];
+    t0 = t7 + t9;
+    t3 = t6 + t5;
+    t2 = C2 * t0;
+    t8 = t4 - t2;
+    t2 = C2 * t3;
+    t2 = t1 - t2;
+    t7 = t7 - t9;
+    t9 = C3 * t7;
+    t7 = t6 - t5;
+    t6 = C3 * t7;
+    t5 = t4 + t0;
+    t7 = t1 + t3;
+    t4 = t8 + t6;
+    t0 = t2 - t9;
+    t1 = t8 - t6;
+    t3 = t2 + t9;
+    re[156] = t5;
+    im[156] = t7;
+    re[176] = t4;
+    im[176] = t0;
+    re[16] = t1;
+    im[16] = t3;
+    t8 = X[144];
+    t6 = X[215];
+    t2 = C34 * t8;
+    t9 = C35 * t6;
+    t5 = t2 + t9;
+    t7 = (-C35) * t8;
+    t4 = C34 * t6;
+    t0 = t7 + t4;
+    t1 = X[264];
+    t3 = X[95];
+    t2 = C36 * t1;
+    t9 = C37 * t3;
+    t8 = t2 + t9;
+    t6 = (-C37) * t1;
+    t7 = C36 * t3;
+    t4 = t6 + t7;
+    t2 = X[24];
+    t9 = X[335];
+    t1 = C38 * t2;
+    t3 = C39 * t9;
+    t6 = t1 + t3;
+    t7 = (-C39) * t2;
+    t1 = C38 * t9;
+    t3 = t7 + t1;
+    t2 = t8 + t6;
+    t9 = t4 + t3;
+    t7 = C2 * t2;
+    t1 = t5 - t7;
+    t7 = C2 * t9;
+    t7 = t0 - t7;
+    t8 = t8 - t6;
+    t6 = C3 * t8;
+    t8 = t4 - t3;
+    t4 = C3 * t8;
+    t3 = t5 + t2;
+    t8 = t0 + t9;
+    t5 = t1 + t4;
+    t2 = t7 - t6;
+    t0 = t1 - t4;
+    t9 = t7 + t6;
+    re[72] = t3;
+    im[72] = t8;
+    re[132] = t5;
+    im[132] = t2;
+    re[12] = t0;
+    im[12] = t9;
+    t1 = X[184];
+    t4 = X[175];
+    t7 = C40 * t1;
+    t6 = C41 * t4;
+    t3 = t7 + t6;
+    t8 = (-C41) * t1;
+    t5 = C40 * t4;
+    t2 = t8 + t5;
+    t0 = X[304];
+    t9 = X[55];
+    t7 = C42 * t0;
+    t6 = C43 * t9;
+    t1 = t7 + t6;
+    t4 = (-C43) * t0;
+    t8 = C42 * t9;
+    t5 = t4 + t8;
+    t7 = X[64];
+    t6 = X[295];
+    t0 = C44 * t7;
+    t9 = C45 * t6;
+    t4 = t0 + t9;
+    t8 = (-C45) * t7;
+    t0 = C44 * t6;
+    t9 = t8 + t0;
+    t7 = t1 + t4;
+    t6 = t5 + t9;
+    t8 = C2 * t7;
+    t0 = t3 - t8;
+    t8 = C2 * t6;
+    t8 = t2 - t8;
+    t1 = t1 - t4;
+    t4 = C3 * t1;
+    t1 = t5 - t9;
+    t5 = C3 * t1;
+    t9 = t3 + t7;
+    t1 = t2 + t6;
+    t3 = t0 + t5;
+    t7 = t8 - t4;
+    t2 = t0 - t5;
+    t6 = t8 + t4;
+    t0 = t3 + t7;
+    t5 = C6 * t0;
+    t8 = t3 * (-C10);
+    t4 = t7 * C11;
+    t0 = t5 - t4;
+    t3 = t5 + t8;
+    t7 = t2 + t6;
+    t4 = C5 * t7;
+    t5 = t2 * (-C12);
+    t8 = t6 * (-C13);
+    t7 = t4 - t8;
+    t2 = t4 + t5;
+    re[92] = t9;
+    im[92] = t1;
+    re[152] = t0;
+    im[152] = t3;
+    re[32] = t7;
+    im[32] = t2;
+    t6 = X[224];
+    t8 = X[135];
+    t4 = C46 * t6;
+    t5 = C47 * t8;
+    t9 = t4 + t5;
+    t1 = (-C47) * t6;
+    t0 = C46 * t8;
+    t3 = t1 + t0;
+    t7 = X[344];
+    t2 = X[15];
+    t4 = C48 * t7;
+    t5 = C49 * t2;
+    t6 = t4 + t5;
+    t8 = (-C49) * t7;
+    t1 = C48 * t2;
+    t0 = t8 + t1;
+    t4 = X[104];
+    t5 = X[255];
+    t7 = C50 * t4;
+    t2 = C51 * t5;
+    t8 = t7 + t2;
+    t1 = (-C51) * t4;
+    t7 = C50 * t5;
+    t2 = t1 + t7;
+    t4 = t6 + t8;
+    t5 = t0 + t2;
+    t1 = C2 * t4;
+    t7 = t9 - t1;
+    t1 = C2 * t5;
+    t1 = t3 - t1;
+    t6 = t6 - t8;
+    t8 = C3 * t6;
+    t6 = t0 - t2;
+    t0 = C3 * t6;
+    t2 = t9 + t4;
+    t6 = t3 + t5;
+    t9 = t7 + t0;
+    t4 = t1 - t8;
+    t3 = t7 - t0;
+    t5 = t1 + t8;
+    t7 = t9 + t4;
+    t0 = C5 * t7;
+    t1 = t9 * (-C12);
+    t8 = t4 * (-C13);
+    t7 = t0 - t8;
+    t9 = t0 + t1;
+    t4 = t3 + t5;
+    t8 = (-C9) * t4;
+    t0 = t3 * C14;
+    t1 = t5 * (-C15);
+    t4 = t8 - t1;
+    t3 = t8 + t0;
+    re[112] = t2;
+    im[112] = t6;
+    re[172] = t7;
+    im[172] = t9;
+    re[52] = t4;
+    im[52] = t3;
+    t5 = re[72];
+    t1 = im[72];
+    t8 = re[92];
+    t0 = im[92];
+    t2 = re[112];
+    t6 = im[112];
+    t7 = t8 + t2;
+    t9 = t0 + t6;
+    t4 = C2 * t7;
+    t3 = t5 - t4;
+    t4 = C2 * t9;
+    t4 = t1 - t4;
+    t8 = t8 - t2;
+    t2 = C3 * t8;
+    t8 = t0 - t6;
+    t0 = C3 * t8;
+    t6 = t5 + t7;
+    t8 = t1 + t9;
+    t5 = t3 + t0;
+    t7 = t4 - t2;
+    t1 = t3 - t0;
+    t9 = t4 + t2;
+    re[72] = t6;
+    im[72] = t8;
+    re[92] = t5;
+    im[92] = t7;
+    re[112] = t1;
+    im[112] = t9;
+    t3 = re[132];
+    t0 = im[132];
+    t4 = re[152];
+    t2 = im[152];
+    t6 = re[172];
+    t8 = im[172];
+    t5 = t4 + t6;
+    t7 = t2 + t8;
+    t1 = C2 * t5;
+    t9 = t3 - t1;
+    t1 = C2 * t7;
+    t1 = t0 - t1;
+    t4 = t4 - t6;
+    t6 = C3 * t4;
+    t4 = t2 - t8;
+    t2 = C3 * t4;
+    t8 = t3 + t5;
+    t4 = t0 + t7;
+    t3 = t9 + t2;
+    t5 = t1 - t6;
+    t0 = t9 - t2;
+    t7 = t1 + t6;
+    re[132] = t8;
+    im[132] = t4;
+    re[152] = t3;
+    im[152] = t5;
+    re[172] = t0;
+    im[172] = t7;
+    t9 = re[12];
+    t2 = im[12];
+    t1 = re[32];
+    t6 = im[32];
+    t8 = re[52];
+    t4 = im[52];
+    t3 = t1 + t8;
+    t5 = t6 + t4;
+    t0 = C2 * t3;
+    t7 = t9 - t0;
+    t0 = C2 * t5;
+    t0 = t2 - t0;
+    t1 = t1 - t8;
+    t8 = C3 * t1;
+    t1 = t6 - t4;
+    t6 = C3 * t1;
+    t4 = t9 + t3;
+    t1 = t2 + t5;
+    t9 = t7 + t6;
+    t3 = t0 - t8;
+    t2 = t7 - t6;
+    t5 = t0 + t8;
+    re[12] = t4;
+    im[12] = t1;
+    re[32] = t9;
+    im[32] = t3;
+    re[52] = t2;
+    im[52] = t5;
+    t7 = X[216];
+    t6 = X[143];
+    t0 = C35 * t7;
+    t8 = C34 * t6;
+    t4 = t0 + t8;
+    t1 = (-C34) * t7;
+    t9 = C35 * t6;
+    t3 = t1 + t9;
+    t2 = X[336];
+    t5 = X[23];
+    t0 = C39 * t2;
+    t8 = C38 * t5;
+    t7 = t0 + t8;
+    t6 = (-C38) * t2;
+    t1 = C39 * t5;
+    t9 = t6 + t1;
+    t0 = X[96];
+    t8 = X[263];
+    t2 = C37 * t0;
+    t5 = C36 * t8;
+    t6 = t2 + t5;
+    t1 = (-C36) * t0;
+    t2 = C37 * t8;
+    t5 = t1 + t2;
+    t0 = t7 + t6;
+    t8 = t9 + t5;
+    t1 = C2 * t0;
+    t2 = t4 - t1;
+    t1 = C2 * t8;
+    t1 = t3 - t1;
+    t7 = t7 - t6;
+    t6 = C3 * t7;
+    t7 = t9 - t5;
+    t9 = C3 * t7;
+    t5 = t4 + t0;
+    t7 = t3 + t8;
+    t4 = t2 + t9;
+    t0 = t1 - t6;
+    t3 = t2 - t9;
+    t8 = t1 + t6;
+    re[108] = t5;
+    im[108] = t7;
+    re[168] = t4;
+    im[168] = t0;
+    re[48] = t3;
+    im[48] = t8;
+    t2 = X[256];
+    t9 = X[103];
+    t1 = C51 * t2;
+    t6 = C50 * t9;
+    t5 = t1 + t6;
+    t7 = (-C50) * t2;
+    t4 = C51 * t9;
+    t0 = t7 + t4;
+    t3 = X[16];
+    t8 = X[343];
+    t1 = C49 * t3;
+    t6 = C48 * t8;
+    t2 = t1 + t6;
+    t9 = (-C48) * t3;
+    t7 = C49 * t8;
+    t4 = t9 + t7;
+    t1 = X[136];
+    t6 = X[223];
+    t3 = C47 * t1;
+    t8 = C46 * t6;
+    t9 = t3 + t8;
+    t7 = (-C46) * t1;
+    t3 = C47 * t6;
+    t8 = t7 + t3;
+    t1 = t2 + t9;
+    t6 = t4 + t8;
+    t7 = C2 * t1;
+    t3 = t5 - t7;
+    t7 = C2 * t6;
+    t7 = t0 - t7;
+    t2 = t2 - t9;
+    t9 = C3 * t2;
+    t2 = t4 - t8;
+    t4 = C3 * t2;
+    t8 = t5 + t1;
+    t2 = t0 + t6;
+    t5 = t3 + t4;
+    t1 = t7 - t9;
+    t0 = t3 - t4;
+    t6 = t7 + t9;
+    t3 = t5 + t1;
+    t4 = C6 * t3;
+    t7 = t5 * (-C10);
+    t9 = t1 * C11;
+    t3 = t4 - t9;
+    t5 = t4 + t7;
+    t1 = t0 + t6;
+    t9 = C5 * t1;
+    t4 = t0 * (-C12);
+    t7 = t6 * (-C13);
+    t1 = t9 - t7;
+    t0 = t9 + t4;
+    re[128] = t8;
+    im[128] = t2;
+    re[8] = t3;
+    im[8] = t5;
+    re[68] = t1;
+    im[68] = t0;
+    t6 = X[296];
+    t7 = X[63];
+    t9 = C45 * t6;
+    t4 = C44 * t7;
+    t8 = t9 + t4;
+    t2 = (-C44) * t6;
+    t3 = C45 * t7;
+    t5 = t2 + t3;
+    t1 = X[56];
+    t0 = X[303];
+    t9 = C43 * t1;
+    t4 = C42 * t0;
+    t6 = t9 + t4;
+    t7 = (-C42) * t1;
+    t2 = C43 * t0;
+    t3 = t7 + t2;
+    t9 = X[176];
+    t4 = X[183];
+    t1 = C41 * t9;
+    t0 = C40 * t4;
+    t7 = t1 + t0;
+    t2 = (-C40) * t9;
+    t1 = C41 * t4;
+    t0 = t2 + t1;
+    t9 = t6 + t7;
+    t4 = t3 + t0;
+    t2 = C2 * t9;
+    t1 = t8 - t2;
+    t2 = C2 * t4;
+    t2 = t5 - t2;
+    t6 = t6 - t7;
+    t7 = C3 * t6;
+    t6 = t3 - t0;
+    t3 = C3 * t6;
+    t0 = t8 + t9;
+    t6 = t5 + t4;
+    t8 = t1 + t3;
+    t9 = t2 - t7;
+    t5 = t1 - t3;
+    t4 = t2 + t7;
+    t1 = t8 + t9;
+    t3 = C5 * t1;
+    t2 = t8 * (-C12);
+    t7 = t9 * (-C13);
+    t1 = t3 - t7;
+    t8 = t3 + t2;
+    t9 = t5 + t4;
+    t7 = (-C9) * t9;
+    t3 = t5 * C14;
+    t2 = t4 * (-C15);
+    t9 = t7 - t2;
+    t5 = t7 + t3;
+    re[148] = t0;
+    im[148] = t6;
+    re[28] = t1;
+    im[28] = t8;
+    re[88] = t9;
+    im[88] = t5;
+    t4 = re[108];
+    t2 = im[108];
+    t7 = re[128];
+    t3 = im[128];
+    t0 = re[148];
+    t6 = im[148];
+    t1 = t7 + t0;
+    t8 = t3 + t6;
+    t9 = C2 * t1;
+    t5 = t4 - t9;
+    t9 = C2 * t8;
+    t9 = t2 - t9;
+    t7 = t7 - t0;
+    t0 = C3 * t7;
+    t7 = t3 - t6;
+    t3 = C3 * t7;
+    t6 = t4 + t1;
+    t7 = t2 + t8;
+    t4 = t5 + t3;
+    t1 = t9 - t0;
+    t2 = t5 - t3;
+    t8 = t9 + t0;
+    re[108] = t6;
+    im[108] = t7;
+    re[128] = t4;
+    im[128] = t1;
+    re[148] = t2;
+    im[148] = t8;
+    t5 = re[168];
+    t3 = im[168];
+    t9 = re[8];
+    t0 = im[8];
+    t6 = re[28];
+    t7 = im[28];
+    t4 = t9 + t6;
+    t1 = t0 + t7;
+    t2 = C2 * t4;
+    t8 = t5 - t2;
+    t2 = C2 * t1;
+    t2 = t3 - t2;
+    t9 = t9 - t6;
+    t6 = C3 * t9;
+    t9 = t0 - t7;
+    t0 = C3 * t9;
+    t7 = t5 + t4;
+    t9 = t3 + t1;
+    t5 = t8 + t0;
+    t4 = t2 - t6;
+    t3 = t8 - t0;
+    t1 = t2 + t6;
+    re[168] = t7;
+    im[168] = t9;
+    re[8] = t5;
+    im[8] = t4;
+    re[28] = t3;
+    im[28] = t1;
+    t8 = re[48];
+    t0 = im[48];
+    t2 = re[68];
+    t6 = im[68];
+    t7 = re[88];
+    t9 = im[88];
+    t5 = t2 + t7;
+    t4 = t6 + t9;
+    t3 = C2 * t5;
+    t1 = t8 - t3;
+    t3 = C2 * t4;
+    t3 = t0 - t3;
+    t2 = t2 - t7;
+    t7 = C3 * t2;
+    t2 = t6 - t9;
+    t6 = C3 * t2;
+    t9 = t8 + t5;
+    t2 = t0 + t4;
+    t8 = t1 + t6;
+    t5 = t3 - t7;
+    t0 = t1 - t6;
+    t4 = t3 + t7;
+    re[48] = t9;
+    im[48] = t2;
+    re[68] = t8;
+    im[68] = t5;
+    re[88] = t0;
+    im[88] = t4;
+    t1 = X[288];
+    t6 = X[71];
+    t3 = C17 * t1;
+    t7 = C16 * t6;
+    t9 = t3 + t7;
+    t2 = (-C16) * t1;
+    t8 = C17 * t6;
+    t5 = t2 + t8;
+    t0 = X[48];
+    t4 = X[311];
+    t3 = C21 * t0;
+    t7 = C20 * t4;
+    t1 = t3 + t7;
+    t6 = (-C20) * t0;
+    t2 = C21 * t4;
+    t8 = t6 + t2;
+    t3 = X[168];
+    t7 = X[191];
+    t0 = C19 * t3;
+    t4 = C18 * t7;
+    t6 = t0 + t4;
+    t2 = (-C18) * t3;
+    t0 = C19 * t7;
+    t4 = t2 + t0;
+    t3 = t1 + t6;
+    t7 = t8 + t4;
+    t2 = C2 * t3;
+    t0 = t9 - t2;
+    t2 = C2 * t7;
+    t2 = t5 - t2;
+    t1 = t1 - t6;
+    t6 = C3 * t1;
+    t1 = t8 - t4;
+    t8 = C3 * t1;
+    t4 = t9 + t3;
+    t1 = t5 + t7;
+    t9 = t0 + t8;
+    t3 = t2 - t6;
+    t5 = t0 - t8;
+    t7 = t2 + t6;
+    re[144] = t4;
+    im[144] = t1;
+    re[24] = t9;
+    im[24] = t3;
+    re[84] = t5;
+    im[84] = t7;
+    t0 = X[328];
+    t8 = X[31];
+    t2 = C33 * t0;
+    t6 = C32 * t8;
+    t4 = t2 + t6;
+    t1 = (-C32) * t0;
+    t9 = C33 * t8;
+    t3 = t1 + t9;
+    t5 = X[88];
+    t7 = X[271];
+    t2 = C31 * t5;
+    t6 = C30 * t7;
+    t0 = t2 + t6;
+    t8 = (-C30) * t5;
+    t1 = C31 * t7;
+    t9 = t8 + t1;
+    t2 = X[208];
+    t6 = X[151];
+    t5 = C29 * t2;
+    t7 = C28 * t6;
+    t8 = t5 + t7;
+    t1 = (-C28) * t2;
+    t5 = C29 * t6;
+    t7 = t1 + t5;
+    t2 = t0 + t8;
+    t6 = t9 + t7;
+    t1 = C2 * t2;
+    t5 = t4 - t1;
+    t1 = C2 * t6;
+    t1 = t3 - t1;
+    t0 = t0 - t8;
+    t8 = C3 * t0;
+    t0 = t9 - t7;
+    t9 = C3 * t0;
+    t7 = t4 + t2;
+    t0 = t3 + t6;
+    t4 = t5 + t9;
+    t2 = t1 - t8;
+    t3 = t5 - t9;
+    t6 = t1 + t8;
+    t5 = t4 + t2;
+    t9 = C6 * t5;
+    t1 = t4 * (-C10);
+    t8 = t2 * C11;
+    t5 = t9 - t8;
+    t4 = t9 + t1;
+    t2 = t3 + t6;
+    t8 = C5 * t2;
+    t9 = t3 * (-C12);
+    t1 = t6 * (-C13);
+    t2 = t8 - t1;
+    t3 = t8 + t9;
+    re[164] = t7;
+    im[164] = t0;
+    re[44] = t5;
+    im[44] = t4;
+    re[104] = t2;
+    im[104] = t3;
+    t6 = X[8];
+    t1 = X[351];
+    t8 = C27 * t6;
+    t9 = C26 * t1;
+    t7 = t8 + t9;
+    t0 = (-C26) * t6;
+    t5 = C27 * t1;
+    t4 = t0 + t5;
+    t2 = X[128];
+    t3 = X[231];
+    t8 = C25 * t2;
+    t9 = C24 * t3;
+    t6 = t8 + t9;
+    t1 = (-C24) * t2;
+    t0 = C25 * t3;
+    t5 = t1 + t0;
+    t8 = X[248];
+    t9 = X[111];
+    t2 = C23 * t8;
+    t3 = C22 * t9;
+    t1 = t2 + t3;
+    t0 = (-C22) * t8;
+    t2 = C23 * t9;
+    t3 = t0 + t2;
+    t8 = t6 + t1;
+    t9 = t5 + t3;
+    t0 = C2 * t8;
+    t2 = t7 - t0;
+    t0 = C2 * t9;
+    t0 = t4 - t0;
+    t6 = t6 - t1;
+    t1 = C3 * t6;
+    t6 = t5 - t3;
+    t5 = C3 * t6;
+    t3 = t7 + t8;
+    t6 = t4 + t9;
+    t7 = t2 + t5;
+    t8 = t0 - t1;
+    t4 = t2 - t5;
+    t9 = t0 + t1;
+    t2 = t7 + t8;
+    t5 = C5 * t2;
+    t0 = t7 * (-C12);
+    t1 = t8 * (-C13);
+    t2 = t5 - t1;
+    t7 = t5 + t0;
+    t8 = t4 + t9;
+    t1 = (-C9) * t8;
+    t5 = t4 * C14;
+    t0 = t9 * (-C15);
+    t8 = t1 - t0;
+    t4 = t1 + t5;
+    re[4] = t3;
+    im[4] = t6;
+    re[64] = t2;
+    im[64] = t7;
+    re[124] = t8;
+    im[124] = t4;
+    t9 = re[144];
+    t0 = im[144];
+    t1 = re[164];
+    t5 = im[164];
+    t3 = re[4];
+    t6 = im[4];
+    t2 = t1 + t3;
+    t7 = t5 + t6;
+    t8 = C2 * t2;
+    t4 = t9 - t8;
+    t8 = C2 * t7;
+    t8 = t0 - t8;
+    t1 = t1 - t3;
+    t3 = C3 * t1;
+    t1 = t5 - t6;
+    t5 = C3 * t1;
+    t6 = t9 + t2;
+    t1 = t0 + t7;
+    t9 = t4 + t5;
+    t2 = t8 - t3;
+    t0 = t4 - t5;
+    t7 = t8 + t3;
+    re[144] = t6;
+    im[144] = t1;
+    re[164] = t9;
+    im[164] = t2;
+    re[4] = t0;
+    im[4] = t7;
+    t4 = re[24];
+    t5 = im[24];
+    t8 = re[44];
+    t3 = im[44];
+    t6 = re[64];
+    t1 = im[64];
+    t9 = t8 + t6;
+    t2 = t3 + t1;
+    t0 = C2 * t9;
+    t7 = t4 - t0;
+    t0 = C2 * t2;
+    t0 = t5 - t0;
+    t8 = t8 - t6;
+    t6 = C3 * t8;
+    t8 = t3 - t1;
+    t3 = C3 * t8;
+    t1 = t4 + t9;
+    t8 = t5 + t2;
+    t4 = t7 + t3;
+    t9 = t0 - t6;
+    t5 = t7 - t3;
+    t2 = t0 + t6;
+    re[24] = t1;
+    im[24] = t8;
+    re[44] = t4;
+    im[44] = t9;
+    re[64] = t5;
+    im[64] = t2;
+    t7 = re[84];
+    t3 = im[84];
+    t0 = re[104];
+    t6 = im[104];
+    t1 = re[124];
+    t8 = im[124];
+    t4 = t0 + t1;
+    t9 = t6 + t8;
+    t5 = C2 * t4;
+    t2 = t7 - t5;
+    t5 = C2 * t9;
+    t5 = t3 - t5;
+    t0 = t0 - t1;
+    t1 = C3 * t0;
+    t0 = t6 - t8;
+    t6 = C3 * t0;
+    t8 = t7 + t4;
+    t0 = t3 + t9;
+    t7 = t2 + t6;
+    t4 = t5 - t1;
+    t3 = t2 - t6;
+    t9 = t5 + t1;
+    re[84] = t8;
+    im[84] = t0;
+    re[104] = t7;
+    im[104] = t4;
+    re[124] = t3;
+    im[124] = t9;
+    t2 = re[0];
+    t6 = im[0];
+    t5 = re[36];
+    t1 = im[36];
+    t8 = re[72];
+    t0 = im[72];
+    t7 = re[108];
+    t4 = im[108];
+    t3 = re[144];
+    t9 = im[144];
+    t10 = t5 + t3;
+    t11 = t1 + t9;
+    t12 = t8 + t7;
+    t13 = t0 + t4;
+    t5 = t5 - t3;
+    t3 = t1 - t9;
+    t1 = t8 - t7;
+    t9 = t0 - t4;
+    t8 = t10 + t12;
+    t7 = t11 + t13;
+    t0 = t10 - t12;
+    t4 = C52 * t0;
+    t10 = t11 - t13;
+    t12 = C52 * t10;
+    t0 = C53 * t8;
+    t11 = t2 - t0;
+    t13 = C53 * t7;
+    t10 = t6 - t13;
+    t0 = t11 + t4;
+    t13 = t10 + t12;
+    t11 = t11 - t4;
+    t4 = t10 - t12;
+    t10 = C16 * t5;
+    t12 = C35 * t1;
+    t10 = t10 + t12;
+    t12 = C16 * t3;
+    t14 = C35 * t9;
+    t12 = t12 + t14;
+    t14 = C35 * t5;
+    t5 = C16 * t1;
+    t1 = t14 - t5;
+    t14 = C35 * t3;
+    t5 = C16 * t9;
+    t3 = t14 - t5;
+    t9 = t2 + t8;
+    t14 = t6 + t7;
+    t5 = t0 + t12;
+    t2 = t13 - t10;
+    t8 = t11 + t3;
+    t6 = t4 - t1;
+    t7 = t11 - t3;
+    t11 = t4 + t1;
+    t3 = t0 - t12;
+    t4 = t13 + t10;
+    re[0] = t9;
+    im[0] = t14;
+    re[36] = t5;
+    im[36] = t2;
+    re[72] = t8;
+    im[72] = t6;
+    re[108] = t7;
+    im[108] = t11;
+    re[144] = t3;
+    im[144] = t4;
+    t1 = re[60];
+    t0 = im[60];
+    t12 = re[96];
+    t13 = im[96];
+    t10 = re[132];
+    t9 = im[132];
+    t14 = re[168];
+    t5 = im[168];
+    t2 = re[24];
+    t8 = im[24];
+    t6 = t12 + t2;
+    t7 = t13 + t8;
+    t11 = t10 + t14;
+    t3 = t9 + t5;
+    t4 = t12 - t2;
+    t12 = t13 - t8;
+    t2 = t10 - t14;
+    t13 = t9 - t5;
+    t8 = t6 + t11;
+    t10 = t7 + t3;
+    t14 = t6 - t11;
+    t9 = C52 * t14;
+    t5 = t7 - t3;
+    t6 = C52 * t5;
+    t11 = C53 * t8;
+    t14 = t1 - t11;
+    t7 = C53 * t10;
+    t3 = t0 - t7;
+    t5 = t14 + t9;
+    t11 = t3 + t6;
+    t7 = t14 - t9;
+    t14 = t3 - t6;
+    t9 = C16 * t4;
+    t3 = C35 * t2;
+    t6 = t9 + t3;
+    t9 = C16 * t12;
+    t3 = C35 * t13;
+    t9 = t9 + t3;
+    t3 = C35 * t4;
+    t4 = C16 * t2;
+    t2 = t3 - t4;
+    t3 = C35 * t12;
+    t4 = C16 * t13;
+    t12 = t3 - t4;
+    t13 = t1 + t8;
+    t3 = t0 + t10;
+    t4 = t5 + t9;
+    t1 = t11 - t6;
+    t8 = t7 + t12;
+    t0 = t14 - t2;
+    t10 = t7 - t12;
+    t7 = t14 + t2;
+    t12 = t5 - t9;
+    t14 = t11 + t6;
+    re[60] = t13;
+    im[60] = t3;
+    re[96] = t4;
+    im[96] = t1;
+    re[132] = t8;
+    im[132] = t0;
+    re[168] = t10;
+    im[168] = t7;
+    re[24] = t12;
+    im[24] = t14;
+    t2 = re[120];
+    t5 = im[120];
+    t9 = re[156];
+    t11 = im[156];
+    t6 = re[12];
+    t13 = im[12];
+    t3 = re[48];
+    t4 = im[48];
+    t1 = re[84];
+    t8 = im[84];
+    t0 = t9 + t1;
+    t10 = t11 + t8;
+    t7 = t6 + t3;
+    t12 = t13 + t4;
+    t14 = t9 - t1;
+    t9 = t11 - t8;
+    t1 = t6 - t3;
+    t11 = t13 - t4;
+    t8 = t0 + t7;
+    t6 = t10 + t12;
+    t3 = t0 - t7;
+    t13 = C52 * t3;
+    t4 = t10 - t12;
+    t0 = C52 * t4;
+    t7 = C53 * t8;
+    t3 = t2 - t7;
+    t10 = C53 * t6;
+    t12 = t5 - t10;
+    t4 = t3 + t13;
+    t7 = t12 + t0;
+    t10 = t3 - t13;
+    t3 = t12 - t0;
+    t13 = C16 * t14;
+    t12 = C35 * t1;
+    t0 = t13 + t12;
+    t13 = C16 * t9;
+    t12 = C35 * t11;
+    t13 = t13 + t12;
+    t12 = C35 * t14;
+    t14 = C16 * t1;
+    t1 = t12 - t14;
+    t12 = C35 * t9;
+    t14 = C16 * t11;
+    t9 = t12 - t14;
+    t11 = t2 + t8;
+    t12 = t5 + t6;
+    t14 = t4 + t13;
+    t2 = t7 - t0;
+    t8 = t10 + t9;
+    t5 = t3 - t1;
+    t6 = t10 - t9;
+    t10 = t3 + t1;
+    t9 = t4 - t13;
+    t3 = t7 + t0;
+    re[120] = t11;
+    im[120] = t12;
+    re[156] = t14;
+    im[156] = t2;
+    re[12] = t8;
+    im[12] = t5;
+    re[48] = t6;
+    im[48] = t10;
+    re[84] = t9;
+    im[84] = t3;
+    t1 = re[20];
+    t4 = im[20];
+    t13 = re[56];
+    t7 = im[56];
+    t0 = re[92];
+    t11 = im[92];
+    t12 = re[128];
+    t14 = im[128];
+    t2 = re[164];
+    t8 = im[164];
+    t5 = t13 + t2;
+    t6 = t7 + t8;
+    t10 = t0 + t12;
+    t9 = t11 + t14;
+    t3 = t13 - t2;
+    t13 = t7 - t8;
+    t2 = t0 - t12;
+    t7 = t11 - t14;
+    t8 = t5 + t10;
+    t0 = t6 + t9;
+    t12 = t5 - t10;
+    t11 = C52 * t12;
+    t14 = t6 - t9;
+    t5 = C52 * t14;
+    t10 = C53 * t8;
+    t12 = t1 - t10;
+    t6 = C53 * t0;
+    t9 = t4 - t6;
+    t14 = t12 + t11;
+    t10 = t9 + t5;
+    t6 = t12 - t11;
+    t12 = t9 - t5;
+    t11 = C16 * t3;
+    t9 = C35 * t2;
+    t5 = t11 + t9;
+    t11 = C16 * t13;
+    t9 = C35 * t7;
+    t11 = t11 + t9;
+    t9 = C35 * t3;
+    t3 = C16 * t2;
+    t2 = t9 - t3;
+    t9 = C35 * t13;
+    t3 = C16 * t7;
+    t13 = t9 - t3;
+    t7 = t1 + t8;
+    t9 = t4 + t0;
+    t3 = t14 + t11;
+    t1 = t10 - t5;
+    t8 = t6 + t13;
+    t4 = t12 - t2;
+    t0 = t6 - t13;
+    t6 = t12 + t2;
+    t13 = t14 - t11;
+    t12 = t10 + t5;
+    re[20] = t7;
+    im[20] = t9;
+    re[56] = t3;
+    im[56] = t1;
+    re[92] = t8;
+    im[92] = t4;
+    re[128] = t0;
+    im[128] = t6;
+    re[164] = t13;
+    im[164] = t12;
+    t2 = re[80];
+    t14 = im[80];
+    t11 = re[116];
+    t10 = im[116];
+    t5 = re[152];
+    t7 = im[152];
+    t9 = re[8];
+    t3 = im[8];
+    t1 = re[44];
+    t8 = im[44];
+    t4 = t11 + t1;
+    t0 = t10 + t8;
+    t6 = t5 + t9;
+    t13 = t7 + t3;
+    t12 = t11 - t1;
+    t11 = t10 - t8;
+    t1 = t5 - t9;
+    t10 = t7 - t3;
+    t8 = t4 + t6;
+    t5 = t0 + t13;
+    t9 = t4 - t6;
+    t7 = C52 * t9;
+    t3 = t0 - t13;
+    t4 = C52 * t3;
+    t6 = C53 * t8;
+    t9 = t2 - t6;
+    t0 = C53 * t5;
+    t13 = t14 - t0;
+    t3 = t9 + t7;
+    t6 = t13 + t4;
+    t0 = t9 - t7;
+    t9 = t13 - t4;
+    t7 = C16 * t12;
+    t13 = C35 * t1;
+    t4 = t7 + t13;
+    t7 = C16 * t11;
+    t13 = C35 * t10;
+    t7 = t7 + t13;
+    t13 = C35 * t12;
+    t12 = C16 * t1;
+    t1 = t13 - t12;
+    t13 = C35 * t11;
+    t12 = C16 * t10;
+    t11 = t13 - t12;
+    t10 = t2 + t8;
+    t13 = t14 + t5;
+    t12 = t3 + t7;
+    t2 = t6 - t4;
+    t8 = t0 + t11;
+    t14 = t9 - t1;
+    t5 = t0 - t11;
+    t0 = t9 + t1;
+    t11 = t3 - t7;
+    t9 = t6 + t4;
+    re[80] = t10;
+    im[80] = t13;
+    re[116] = t12;
+    im[116] = t2;
+    re[152] = t8;
+    im[152] = t14;
+    re[8] = t5;
+    im[8] = t0;
+    re[44] = t11;
+    im[44] = t9;
+    t1 = re[140];
+    t3 = im[140];
+    t7 = re[176];
+    t6 = im[176];
+    t4 = re[32];
+    t10 = im[32];
+    t13 = re[68];
+    t12 = im[68];
+    t2 = re[104];
+    t8 = im[104];
+    t14 = t7 + t2;
+    t5 = t6 + t8;
+    t0 = t4 + t13;
+    t11 = t10 + t12;
+    t9 = t7 - t2;
+    t7 = t6 - t8;
+    t2 = t4 - t13;
+    t6 = t10 - t12;
+    t8 = t14 + t0;
+    t4 = t5 + t11;
+    t13 = t14 - t0;
+    t10 = C52 * t13;
+    t12 = t5 - t11;
+    t14 = C52 * t12;
+    t0 = C53 * t8;
+    t13 = t1 - t0;
+    t5 = C53 * t4;
+    t11 = t3 - t5;
+    t12 = t13 + t10;
+    t0 = t11 + t14;
+    t5 = t13 - t10;
+    t13 = t11 - t14;
+    t10 = C16 * t9;
+    t11 = C35 * t2;
+    t14 = t10 + t11;
+    t10 = C16 * t7;
+    t11 = C35 * t6;
+    t10 = t10 + t11;
+    t11 = C35 * t9;
+    t9 = C16 * t2;
+    t2 = t11 - t9;
+    t11 = C35 * t7;
+    t9 = C16 * t6;
+    t7 = t11 - t9;
+    t6 = t1 + t8;
+    t11 = t3 + t4;
+    t9 = t12 + t10;
+    t1 = t0 - t14;
+    t8 = t5 + t7;
+    t3 = t13 - t2;
+    t4 = t5 - t7;
+    t5 = t13 + t2;
+    t7 = t12 - t10;
+    t13 = t0 + t14;
+    re[140] = t6;
+    im[140] = t11;
+    re[176] = t9;
+    im[176] = t1;
+    re[32] = t8;
+    im[32] = t3;
+    re[68] = t4;
+    im[68] = t5;
+    re[104] = t7;
+    im[104] = t13;
+    t2 = re[40];
+    t12 = im[40];
+    t10 = re[76];
+    t0 = im[76];
+    t14 = re[112];
+    t6 = im[112];
+    t11 = re[148];
+    t9 = im[148];
+    t1 = re[4];
+    t8 = im[4];
+    t3 = t10 + t1;
+    t4 = t0 + t8;
+    t5 = t14 + t11;
+    t7 = t6 + t9;
+    t13 = t10 - t1;
+    t10 = t0 - t8;
+    t1 = t14 - t11;
+    t0 = t6 - t9;
+    t8 = t3 + t5;
+    t14 = t4 + t7;
+    t11 = t3 - t5;
+    t6 = C52 * t11;
+    t9 = t4 - t7;
+    t3 = C52 * t9;
+    t5 = C53 * t8;
+    t11 = t2 - t5;
+    t4 = C53 * t14;
+    t7 = t12 - t4;
+    t9 = t11 + t6;
+    t5 = t7 + t3;
+    t4 = t11 - t6;
+    t11 = t7 - t3;
+    t6 = C16 * t13;
+    t7 = C35 * t1;
+    t3 = t6 + t7;
+    t6 = C16 * t10;
+    t7 = C35 * t0;
+    t6 = t6 + t7;
+    t7 = C35 * t13;
+    t13 = C16 * t1;
+    t1 = t7 - t13;
+    t7 = C35 * t10;
+    t13 = C16 * t0;
+    t10 = t7 - t13;
+    t0 = t2 + t8;
+    t7 = t12 + t14;
+    t13 = t9 + t6;
+    t2 = t5 - t3;
+    t8 = t4 + t10;
+    t12 = t11 - t1;
+    t14 = t4 - t10;
+    t4 = t11 + t1;
+    t10 = t9 - t6;
+    t11 = t5 + t3;
+    re[40] = t0;
+    im[40] = t7;
+    re[76] = t13;
+    im[76] = t2;
+    re[112] = t8;
+    im[112] = t12;
+    re[148] = t14;
+    im[148] = t4;
+    re[4] = t10;
+    im[4] = t11;
+    t1 = re[100];
+    t9 = im[100];
+    t6 = re[136];
+    t5 = im[136];
+    t3 = re[172];
+    t0 = im[172];
+    t7 = re[28];
+    t13 = im[28];
+    t2 = re[64];
+    t8 = im[64];
+    t12 = t6 + t2;
+    t14 = t5 + t8;
+    t4 = t3 + t7;
+    t10 = t0 + t13;
+    t11 = t6 - t2;
+    t6 = t5 - t8;
+    t2 = t3 - t7;
+    t5 = t0 - t13;
+    t8 = t12 + t4;
+    t3 = t14 + t10;
+    t7 = t12 - t4;
+    t0 = C52 * t7;
+    t13 = t14 - t10;
+    t12 = C52 * t13;
+    t4 = C53 * t8;
+    t7 = t1 - t4;
+    t14 = C53 * t3;
+    t10 = t9 - t14;
+    t13 = t7 + t0;
+    t4 = t10 + t12;
+    t14 = t7 - t0;
+    t7 = t10 - t12;
+    t0 = C16 * t11;
+    t10 = C35 * t2;
+    t12 = t0 + t10;
+    t0 = C16 * t6;
+    t10 = C35 * t5;
+    t0 = t0 + t10;
+    t10 = C35 * t11;
+    t11 = C16 * t2;
+    t2 = t10 - t11;
+    t10 = C35 * t6;
+    t11 = C16 * t5;
+    t6 = t10 - t11;
+    t5 = t1 + t8;
+    t10 = t9 + t3;
+    t11 = t13 + t0;
+    t1 = t4 - t12;
+    t8 = t14 + t6;
+    t9 = t7 - t2;
+    t3 = t14 - t6;
+    t14 = t7 + t2;
+    t6 = t13 - t0;
+    t7 = t4 + t12;
+    re[100] = t5;
+    im[100] = t10;
+    re[136] = t11;
+    im[136] = t1;
+    re[172] = t8;
+    im[172] = t9;
+    re[28] = t3;
+    im[28] = t14;
+    re[64] = t6;
+    im[64] = t7;
+    t2 = re[160];
+    t13 = im[160];
+    t0 = re[16];
+    t4 = im[16];
+    t12 = re[52];
+    t5 = im[52];
+    t10 = re[88];
+    t11 = im[88];
+    t1 = re[124];
+    t8 = im[124];
+    t9 = t0 + t1;
+    t3 = t4 + t8;
+    t14 = t12 + t10;
+    t6 = t5 + t11;
+    t7 = t0 - t1;
+    t0 = t4 - t8;
+    t1 = t12 - t10;
+    t4 = t5 - t11;
+    t8 = t9 + t14;
+    t12 = t3 + t6;
+    t10 = t9 - t14;
+    t5 = C52 * t10;
+    t11 = t3 - t6;
+    t9 = C52 * t11;
+    t14 = C53 * t8;
+    t10 = t2 - t14;
+    t3 = C53 * t12;
+    t6 = t13 - t3;
+    t11 = t10 + t5;
+    t14 = t6 + t9;
+    t3 = t10 - t5;
+    t10 = t6 - t9;
+    t5 = C16 * t7;
+    t6 = C35 * t1;
+    t9 = t5 + t6;
+    t5 = C16 * t0;
+    t6 = C35 * t4;
+    t5 = t5 + t6;
+    t6 = C35 * t7;
+    t7 = C16 * t1;
+    t1 = t6 - t7;
+    t6 = C35 * t0;
+    t7 = C16 * t4;
+    t0 = t6 - t7;
+    t4 = t2 + t8;
+    t6 = t13 + t12;
+    t7 = t11 + t5;
+    t2 = t14 - t9;
+    t8 = t3 + t0;
+    t13 = t10 - t1;
+    t12 = t3 - t0;
+    t3 = t10 + t1;
+    t0 = t11 - t5;
+    t10 = t14 + t9;
+    re[160] = t4;
+    im[160] = t6;
+    re[16] = t7;
+    im[16] = t2;
+    re[52] = t8;
+    im[52] = t13;
+    re[88] = t12;
+    im[88] = t3;
+    re[124] = t0;
+    im[124] = t10;
+}
+
+/**
+ *  Part 2 of ApplyWindowedIMDCT_W75_360().
+ * 
+ *  @param {Number[]} X 
+ *    - The input block (360 points).
+ *  @param {Number[]} y 
+ *    - The array that would contain the output block (720 points).
+ *  @param {Number[]} re 
+ *    - The scratch buffer (real part, 180 points).
+ *  @param {Number[]} im 
+ *    - The scratch buffer (imaginary part, 180 points).
+ */
+function ApplyWindowedIMDCT_W75_360_Part2(X, y, re, im) {
+    let t0, t1, t10, t11, t12, t13, t14, t2, t3, t4, t5, t6, t7, t8, t9;
+    const C0 = 0.9238795325112867;
+    const C1 = 0.3826834323650898;
+    const C2 = 0.6087614290087207;
+    const C3 = 0.7933533402912352;
+    const C4 = 0.13052619222005157;
+    const C5 = 0.9914448613738104;
+    const C6 = 0.5;
+    const C7 = 0.8660254037844386;
+    const C8 = 0.8433914458128857;
+    const C9 = 0.5372996083468239;
+    const C10 = 0.4617486132350339;
+    const C11 = 0.8870108331782217;
+    const C12 = 0.9990482215818578;
+    const C13 = 0.043619387365336;
+    const C14 = 0.766044443118978;
+    const C15 = 1.4088320528055172;
+    const C16 = 0.12325683343243876;
+    const C17 = 0.17364817766693033;
+    const C18 = 1.1584559306791384;
+    const C19 = 0.8111595753452777;
+    const C20 = 0.7372773368101241;
+    const C21 = 0.6755902076156601;
+    const C22 = 0.3007057995042731;
+    const C23 = 0.9537169507482269;
+    const C24 = 0.9762960071199334;
+    const C25 = 0.21643961393810288;
+    const C26 = 0.9396926207859084;
+    const C27 = 0.5976724774602398;
+    const C28 = 1.281712764111577;
+    const C29 = 0.7604059656000309;
+    const C30 = 0.6494480483301837;
+    const C31 = 0.33380685923377096;
+    const C32 = 0.9426414910921784;
+    const C33 = 0.9832549075639546;
+    const C34 = 0.18223552549214747;
+    const C35 = 0.636078220277764;
+    const C36 = 0.77162458338772;
+    const C37 = 0.16504760586067765;
+    const C38 = 0.9862856015372314;
+    const C39 = 0.9366721892483976;
+    const C40 = 0.35020738125946743;
+    const C41 = 0.49242356010346705;
+    const C42 = 0.8703556959398997;
+    const C43 = 0.9999619230641713;
+    const C44 = 0.008726535498373935;
+    const C45 = 0.8616291604415258;
+    const C46 = 0.5075383629607041;
+    const C47 = 0.5224985647159488;
+    const C48 = 0.8526401643540922;
+    const C49 = 0.02617694830787315;
+    const C50 = 0.9996573249755573;
+    const C51 = 0.8788171126619654;
+    const C52 = 0.4771587602596084;
+    const C53 = 0.3665012267242973;
+    const C54 = 0.9304175679820246;
+    const C55 = 0.9890158633619168;
+    const C56 = 0.1478094111296106;
+    const C57 = 0.7826081568524139;
+    const C58 = 0.6225146366376195;
+    const C59 = 0.19936793441719716;
+    const C60 = 0.9799247046208296;
+    const C61 = 0.9483236552061993;
+    const C62 = 0.31730465640509214;
+    const C63 = 0.6626200482157375;
+    const C64 = 0.7489557207890022;
+    const C65 = 0.2334453638559054;
+    const C66 = 0.9723699203976766;
+    const C67 = 0.958819734868193;
+    const C68 = 0.2840153447039226;
+    const C69 = 0.6883545756937539;
+    const C70 = 0.7253743710122876;
+    const C71 = 0.06104853953485687;
+    const C72 = 0.9981347984218669;
+    const C73 = 0.8949343616020251;
+    const C74 = 0.44619781310980877;
+    const C75 = 0.5519369853120581;
+    const C76 = 0.8338858220671682;
+    const C77 = 0.9935718556765875;
+    const C78 = 0.11320321376790671;
+    const C79 = 0.8038568606172173;
+    const C80 = 0.5948227867513413;
+    const C81 = 0.3987490689252462;
+    const C82 = 0.917060074385124;
+    const C83 = 0.996917333733128;
+    const C84 = 0.07845909572784494;
+    const C85 = 0.8241261886220156;
+    const C86 = 0.5664062369248328;
+    const C87 = 0.4305110968082951;
+    const C88 = 0.9025852843498606;
+    const C89 = 0.9681476403781077;
+    const C90 = 0.25038000405444144;
+    const C91 = 0.7132504491541816;
+    const C92 = 0.7009092642998509;
+    const C93 = 0.26723837607825685;
+    const C94 = 0.963630453208623;
+    const C95 = 0.9099612708765432;
+    const C96 = 0.41469324265623897;
+    const C97 = 0.5807029557109398;
+    const C98 = 0.8141155183563192;
+    const C99 = 0.09584575252022398;
+    const C100 = 0.9953961983671789;
+    const C101 = 0.5590169943749475;
+    const C102 = 0.25;
+    const C103 = 0.9510565162951535;
+    const C104 = 0.5877852522924731;
+    t1 = X[90];
+    t11 = X[269];
+    t5 = C0 * t1;
+    t14 = C1 * t11;
+    t9 = t5 + t14;
+    t4 = (-C1) * t1;
+    t6 = C0 * t11;
+    t7 = t4 + t6;
+    t2 = X[210];
+    t8 = X[149];
+    t13 = C2 * t2;
+    t12 = C3 * t8;
+    t3 = t13 + t12;
+    t0 = (-C3) * t2;
+    t10 = C2 * t8;
+    t5 = t0 + t10;
+    t14 = X[330];
+    t1 = X[29];
+    t11 = C4 * t14;
+    t4 = C5 * t1;
+    t6 = t11 + t4;
+    t13 = (-C5) * t14;
+    t12 = C4 * t1;
+    t2 = t13 + t12;
+    t8 = t3 + t6;
+    t0 = t5 + t2;
+    t10 = C6 * t8;
+    t11 = t9 - t10;
+    t4 = C6 * t0;
+    t14 = t7 - t4;
+    t1 = t3 - t6;
+    t13 = C7 * t1;
+    t12 = t5 - t2;
+    t10 = C7 * t12;
+    t4 = t9 + t8;
+    t3 = t7 + t0;
+    t6 = t11 + t10;
+    t1 = t14 - t13;
+    t5 = t11 - t10;
+    t2 = t14 + t13;
+    re[45] = t4;
+    im[45] = t3;
+    re[105] = t6;
+    im[105] = t1;
+    re[165] = t5;
+    im[165] = t2;
+    t12 = X[130];
+    t9 = X[229];
+    t8 = C8 * t12;
+    t7 = C9 * t9;
+    t0 = t8 + t7;
+    t11 = (-C9) * t12;
+    t10 = C8 * t9;
+    t14 = t11 + t10;
+    t13 = X[250];
+    t4 = X[109];
+    t3 = C10 * t13;
+    t6 = C11 * t4;
+    t1 = t3 + t6;
+    t5 = (-C11) * t13;
+    t2 = C10 * t4;
+    t8 = t5 + t2;
+    t7 = X[10];
+    t12 = X[349];
+    t9 = C12 * t7;
+    t11 = C13 * t12;
+    t10 = t9 + t11;
+    t3 = (-C13) * t7;
+    t6 = C12 * t12;
+    t13 = t3 + t6;
+    t4 = t1 + t10;
+    t5 = t8 + t13;
+    t2 = C6 * t4;
+    t9 = t0 - t2;
+    t11 = C6 * t5;
+    t7 = t14 - t11;
+    t12 = t1 - t10;
+    t3 = C7 * t12;
+    t6 = t8 - t13;
+    t2 = C7 * t6;
+    t11 = t0 + t4;
+    t1 = t14 + t5;
+    t10 = t9 + t2;
+    t12 = t7 - t3;
+    t8 = t9 - t2;
+    t13 = t7 + t3;
+    t6 = t10 + t12;
+    t0 = C14 * t6;
+    t4 = t10 * (-C15);
+    t14 = t12 * C16;
+    t5 = t0 - t14;
+    t9 = t0 + t4;
+    t2 = t8 + t13;
+    t7 = C17 * t2;
+    t3 = t8 * (-C18);
+    t6 = t13 * (-C19);
+    t10 = t7 - t6;
+    t12 = t7 + t3;
+    re[65] = t11;
+    im[65] = t1;
+    re[125] = t5;
+    im[125] = t9;
+    re[5] = t10;
+    im[5] = t12;
+    t14 = X[170];
+    t0 = X[189];
+    t4 = C20 * t14;
+    t2 = C21 * t0;
+    t8 = t4 + t2;
+    t13 = (-C21) * t14;
+    t6 = C20 * t0;
+    t7 = t13 + t6;
+    t3 = X[290];
+    t11 = X[69];
+    t1 = C22 * t3;
+    t5 = C23 * t11;
+    t9 = t1 + t5;
+    t10 = (-C23) * t3;
+    t12 = C22 * t11;
+    t4 = t10 + t12;
+    t2 = X[50];
+    t14 = X[309];
+    t0 = C24 * t2;
+    t13 = C25 * t14;
+    t6 = t0 + t13;
+    t1 = (-C25) * t2;
+    t5 = C24 * t14;
+    t3 = t1 + t5;
+    t11 = t9 + t6;
+    t10 = t4 + t3;
+    t12 = C6 * t11;
+    t0 = t8 - t12;
+    t13 = C6 * t10;
+    t2 = t7 - t13;
+    t14 = t9 - t6;
+    t1 = C7 * t14;
+    t5 = t4 - t3;
+    t12 = C7 * t5;
+    t13 = t8 + t11;
+    t9 = t7 + t10;
+    t6 = t0 + t12;
+    t14 = t2 - t1;
+    t4 = t0 - t12;
+    t3 = t2 + t1;
+    t5 = t6 + t14;
+    t8 = C17 * t5;
+    t11 = t6 * (-C18);
+    t7 = t14 * (-C19);
+    t10 = t8 - t7;
+    t0 = t8 + t11;
+    t12 = t4 + t3;
+    t2 = (-C26) * t12;
+    t1 = t4 * C27;
+    t5 = t3 * (-C28);
+    t6 = t2 - t5;
+    t14 = t2 + t1;
+    re[85] = t13;
+    im[85] = t9;
+    re[145] = t10;
+    im[145] = t0;
+    re[25] = t6;
+    im[25] = t14;
+    t7 = re[45];
+    t8 = im[45];
+    t11 = re[65];
+    t12 = im[65];
+    t4 = re[85];
+    t3 = im[85];
+    t5 = t11 + t4;
+    t2 = t12 + t3;
+    t1 = C6 * t5;
+    t13 = t7 - t1;
+    t9 = C6 * t2;
+    t10 = t8 - t9;
+    t0 = t11 - t4;
+    t6 = C7 * t0;
+    t14 = t12 - t3;
+    t1 = C7 * t14;
+    t9 = t7 + t5;
+    t11 = t8 + t2;
+    t4 = t13 + t1;
+    t0 = t10 - t6;
+    t12 = t13 - t1;
+    t3 = t10 + t6;
+    re[45] = t9;
+    im[45] = t11;
+    re[65] = t4;
+    im[65] = t0;
+    re[85] = t12;
+    im[85] = t3;
+    t14 = re[105];
+    t7 = im[105];
+    t5 = re[125];
+    t8 = im[125];
+    t2 = re[145];
+    t13 = im[145];
+    t1 = t5 + t2;
+    t10 = t8 + t13;
+    t6 = C6 * t1;
+    t9 = t14 - t6;
+    t11 = C6 * t10;
+    t4 = t7 - t11;
+    t0 = t5 - t2;
+    t12 = C7 * t0;
+    t3 = t8 - t13;
+    t6 = C7 * t3;
+    t11 = t14 + t1;
+    t5 = t7 + t10;
+    t2 = t9 + t6;
+    t0 = t4 - t12;
+    t8 = t9 - t6;
+    t13 = t4 + t12;
+    re[105] = t11;
+    im[105] = t5;
+    re[125] = t2;
+    im[125] = t0;
+    re[145] = t8;
+    im[145] = t13;
+    t3 = re[165];
+    t14 = im[165];
+    t1 = re[5];
+    t7 = im[5];
+    t10 = re[25];
+    t9 = im[25];
+    t6 = t1 + t10;
+    t4 = t7 + t9;
+    t12 = C6 * t6;
+    t11 = t3 - t12;
+    t5 = C6 * t4;
+    t2 = t14 - t5;
+    t0 = t1 - t10;
+    t8 = C7 * t0;
+    t13 = t7 - t9;
+    t12 = C7 * t13;
+    t5 = t3 + t6;
+    t1 = t14 + t4;
+    t10 = t11 + t12;
+    t0 = t2 - t8;
+    t7 = t11 - t12;
+    t9 = t2 + t8;
+    re[165] = t5;
+    im[165] = t1;
+    re[5] = t10;
+    im[5] = t0;
+    re[25] = t7;
+    im[25] = t9;
+    t13 = X[162];
+    t3 = X[197];
+    t6 = C29 * t13;
+    t14 = C30 * t3;
+    t4 = t6 + t14;
+    t11 = (-C30) * t13;
+    t12 = C29 * t3;
+    t2 = t11 + t12;
+    t8 = X[282];
+    t5 = X[77];
+    t1 = C31 * t8;
+    t10 = C32 * t5;
+    t0 = t1 + t10;
+    t7 = (-C32) * t8;
+    t9 = C31 * t5;
+    t6 = t7 + t9;
+    t14 = X[42];
+    t13 = X[317];
+    t3 = C33 * t14;
+    t11 = C34 * t13;
+    t12 = t3 + t11;
+    t1 = (-C34) * t14;
+    t10 = C33 * t13;
+    t8 = t1 + t10;
+    t5 = t0 + t12;
+    t7 = t6 + t8;
+    t9 = C6 * t5;
+    t3 = t4 - t9;
+    t11 = C6 * t7;
+    t14 = t2 - t11;
+    t13 = t0 - t12;
+    t1 = C7 * t13;
+    t10 = t6 - t8;
+    t9 = C7 * t10;
+    t11 = t4 + t5;
+    t0 = t2 + t7;
+    t12 = t3 + t9;
+    t13 = t14 - t1;
+    t6 = t3 - t9;
+    t8 = t14 + t1;
+    re[81] = t11;
+    im[81] = t0;
+    re[141] = t12;
+    im[141] = t13;
+    re[21] = t6;
+    im[21] = t8;
+    t10 = X[202];
+    t4 = X[157];
+    t5 = C35 * t10;
+    t2 = C36 * t4;
+    t7 = t5 + t2;
+    t3 = (-C36) * t10;
+    t9 = C35 * t4;
+    t14 = t3 + t9;
+    t1 = X[322];
+    t11 = X[37];
+    t0 = C37 * t1;
+    t12 = C38 * t11;
+    t13 = t0 + t12;
+    t6 = (-C38) * t1;
+    t8 = C37 * t11;
+    t5 = t6 + t8;
+    t2 = X[82];
+    t10 = X[277];
+    t4 = C39 * t2;
+    t3 = C40 * t10;
+    t9 = t4 + t3;
+    t0 = (-C40) * t2;
+    t12 = C39 * t10;
+    t1 = t0 + t12;
+    t11 = t13 + t9;
+    t6 = t5 + t1;
+    t8 = C6 * t11;
+    t4 = t7 - t8;
+    t3 = C6 * t6;
+    t2 = t14 - t3;
+    t10 = t13 - t9;
+    t0 = C7 * t10;
+    t12 = t5 - t1;
+    t8 = C7 * t12;
+    t3 = t7 + t11;
+    t13 = t14 + t6;
+    t9 = t4 + t8;
+    t10 = t2 - t0;
+    t5 = t4 - t8;
+    t1 = t2 + t0;
+    t12 = t9 + t10;
+    t7 = C14 * t12;
+    t11 = t9 * (-C15);
+    t14 = t10 * C16;
+    t6 = t7 - t14;
+    t4 = t7 + t11;
+    t8 = t5 + t1;
+    t2 = C17 * t8;
+    t0 = t5 * (-C18);
+    t12 = t1 * (-C19);
+    t9 = t2 - t12;
+    t10 = t2 + t0;
+    re[101] = t3;
+    im[101] = t13;
+    re[161] = t6;
+    im[161] = t4;
+    re[41] = t9;
+    im[41] = t10;
+    t14 = X[242];
+    t7 = X[117];
+    t11 = C41 * t14;
+    t8 = C42 * t7;
+    t5 = t11 + t8;
+    t1 = (-C42) * t14;
+    t12 = C41 * t7;
+    t2 = t1 + t12;
+    t0 = X[2];
+    t3 = X[357];
+    t13 = C43 * t0;
+    t6 = C44 * t3;
+    t4 = t13 + t6;
+    t9 = (-C44) * t0;
+    t10 = C43 * t3;
+    t11 = t9 + t10;
+    t8 = X[122];
+    t14 = X[237];
+    t7 = C45 * t8;
+    t1 = C46 * t14;
+    t12 = t7 + t1;
+    t13 = (-C46) * t8;
+    t6 = C45 * t14;
+    t0 = t13 + t6;
+    t3 = t4 + t12;
+    t9 = t11 + t0;
+    t10 = C6 * t3;
+    t7 = t5 - t10;
+    t1 = C6 * t9;
+    t8 = t2 - t1;
+    t14 = t4 - t12;
+    t13 = C7 * t14;
+    t6 = t11 - t0;
+    t10 = C7 * t6;
+    t1 = t5 + t3;
+    t4 = t2 + t9;
+    t12 = t7 + t10;
+    t14 = t8 - t13;
+    t11 = t7 - t10;
+    t0 = t8 + t13;
+    t6 = t12 + t14;
+    t5 = C17 * t6;
+    t3 = t12 * (-C18);
+    t2 = t14 * (-C19);
+    t9 = t5 - t2;
+    t7 = t5 + t3;
+    t10 = t11 + t0;
+    t8 = (-C26) * t10;
+    t13 = t11 * C27;
+    t6 = t0 * (-C28);
+    t12 = t8 - t6;
+    t14 = t8 + t13;
+    re[121] = t1;
+    im[121] = t4;
+    re[1] = t9;
+    im[1] = t7;
+    re[61] = t12;
+    im[61] = t14;
+    t2 = re[81];
+    t5 = im[81];
+    t3 = re[101];
+    t10 = im[101];
+    t11 = re[121];
+    t0 = im[121];
+    t6 = t3 + t11;
+    t8 = t10 + t0;
+    t13 = C6 * t6;
+    t1 = t2 - t13;
+    t4 = C6 * t8;
+    t9 = t5 - t4;
+    t7 = t3 - t11;
+    t12 = C7 * t7;
+    t14 = t10 - t0;
+    t13 = C7 * t14;
+    t4 = t2 + t6;
+    t3 = t5 + t8;
+    t11 = t1 + t13;
+    t7 = t9 - t12;
+    t10 = t1 - t13;
+    t0 = t9 + t12;
+    re[81] = t4;
+    im[81] = t3;
+    re[101] = t11;
+    im[101] = t7;
+    re[121] = t10;
+    im[121] = t0;
+    t14 = re[141];
+    t2 = im[141];
+    t6 = re[161];
+    t5 = im[161];
+    t8 = re[1];
+    t1 = im[1];
+    t13 = t6 + t8;
+    t9 = t5 + t1;
+    t12 = C6 * t13;
+    t4 = t14 - t12;
+    t3 = C6 * t9;
+    t11 = t2 - t3;
+    t7 = t6 - t8;
+    t10 = C7 * t7;
+    t0 = t5 - t1;
+    t12 = C7 * t0;
+    t3 = t14 + t13;
+    t6 = t2 + t9;
+    t8 = t4 + t12;
+    t7 = t11 - t10;
+    t5 = t4 - t12;
+    t1 = t11 + t10;
+    re[141] = t3;
+    im[141] = t6;
+    re[161] = t8;
+    im[161] = t7;
+    re[1] = t5;
+    im[1] = t1;
+    t0 = re[21];
+    t14 = im[21];
+    t13 = re[41];
+    t2 = im[41];
+    t9 = re[61];
+    t4 = im[61];
+    t12 = t13 + t9;
+    t11 = t2 + t4;
+    t10 = C6 * t12;
+    t3 = t0 - t10;
+    t6 = C6 * t11;
+    t8 = t14 - t6;
+    t7 = t13 - t9;
+    t5 = C7 * t7;
+    t1 = t2 - t4;
+    t10 = C7 * t1;
+    t6 = t0 + t12;
+    t13 = t14 + t11;
+    t9 = t3 + t10;
+    t7 = t8 - t5;
+    t2 = t3 - t10;
+    t4 = t8 + t5;
+    re[21] = t6;
+    im[21] = t13;
+    re[41] = t9;
+    im[41] = t7;
+    re[61] = t2;
+    im[61] = t4;
+    t1 = X[234];
+    t0 = X[125];
+    t12 = C47 * t1;
+    t14 = C48 * t0;
+    t11 = t12 + t14;
+    t3 = (-C48) * t1;
+    t10 = C47 * t0;
+    t8 = t3 + t10;
+    t5 = X[354];
+    t6 = X[5];
+    t13 = C49 * t5;
+    t9 = C50 * t6;
+    t7 = t13 + t9;
+    t2 = (-C50) * t5;
+    t4 = C49 * t6;
+    t12 = t2 + t4;
+    t14 = X[114];
+    t1 = X[245];
+    t0 = C51 * t14;
+    t3 = C52 * t1;
+    t10 = t0 + t3;
+    t13 = (-C52) * t14;
+    t9 = C51 * t1;
+    t5 = t13 + t9;
+    t6 = t7 + t10;
+    t2 = t12 + t5;
+    t4 = C6 * t6;
+    t0 = t11 - t4;
+    t3 = C6 * t2;
+    t14 = t8 - t3;
+    t1 = t7 - t10;
+    t13 = C7 * t1;
+    t9 = t12 - t5;
+    t4 = C7 * t9;
+    t3 = t11 + t6;
+    t7 = t8 + t2;
+    t10 = t0 + t4;
+    t1 = t14 - t13;
+    t12 = t0 - t4;
+    t5 = t14 + t13;
+    re[117] = t3;
+    im[117] = t7;
+    re[177] = t10;
+    im[177] = t1;
+    re[57] = t12;
+    im[57] = t5;
+    t9 = X[274];
+    t11 = X[85];
+    t6 = C53 * t9;
+    t8 = C54 * t11;
+    t2 = t6 + t8;
+    t0 = (-C54) * t9;
+    t4 = C53 * t11;
+    t14 = t0 + t4;
+    t13 = X[34];
+    t3 = X[325];
+    t7 = C55 * t13;
+    t10 = C56 * t3;
+    t1 = t7 + t10;
+    t12 = (-C56) * t13;
+    t5 = C55 * t3;
+    t6 = t12 + t5;
+    t8 = X[154];
+    t9 = X[205];
+    t11 = C57 * t8;
+    t0 = C58 * t9;
+    t4 = t11 + t0;
+    t7 = (-C58) * t8;
+    t10 = C57 * t9;
+    t13 = t7 + t10;
+    t3 = t1 + t4;
+    t12 = t6 + t13;
+    t5 = C6 * t3;
+    t11 = t2 - t5;
+    t0 = C6 * t12;
+    t8 = t14 - t0;
+    t9 = t1 - t4;
+    t7 = C7 * t9;
+    t10 = t6 - t13;
+    t5 = C7 * t10;
+    t0 = t2 + t3;
+    t1 = t14 + t12;
+    t4 = t11 + t5;
+    t9 = t8 - t7;
+    t6 = t11 - t5;
+    t13 = t8 + t7;
+    t10 = t4 + t9;
+    t2 = C14 * t10;
+    t3 = t4 * (-C15);
+    t14 = t9 * C16;
+    t12 = t2 - t14;
+    t11 = t2 + t3;
+    t5 = t6 + t13;
+    t8 = C17 * t5;
+    t7 = t6 * (-C18);
+    t10 = t13 * (-C19);
+    t4 = t8 - t10;
+    t9 = t8 + t7;
+    re[137] = t0;
+    im[137] = t1;
+    re[17] = t12;
+    im[17] = t11;
+    re[77] = t4;
+    im[77] = t9;
+    t14 = X[314];
+    t2 = X[45];
+    t3 = C59 * t14;
+    t5 = C60 * t2;
+    t6 = t3 + t5;
+    t13 = (-C60) * t14;
+    t10 = C59 * t2;
+    t8 = t13 + t10;
+    t7 = X[74];
+    t0 = X[285];
+    t1 = C61 * t7;
+    t12 = C62 * t0;
+    t11 = t1 + t12;
+    t4 = (-C62) * t7;
+    t9 = C61 * t0;
+    t3 = t4 + t9;
+    t5 = X[194];
+    t14 = X[165];
+    t2 = C63 * t5;
+    t13 = C64 * t14;
+    t10 = t2 + t13;
+    t1 = (-C64) * t5;
+    t12 = C63 * t14;
+    t7 = t1 + t12;
+    t0 = t11 + t10;
+    t4 = t3 + t7;
+    t9 = C6 * t0;
+    t2 = t6 - t9;
+    t13 = C6 * t4;
+    t5 = t8 - t13;
+    t14 = t11 - t10;
+    t1 = C7 * t14;
+    t12 = t3 - t7;
+    t9 = C7 * t12;
+    t13 = t6 + t0;
+    t11 = t8 + t4;
+    t10 = t2 + t9;
+    t14 = t5 - t1;
+    t3 = t2 - t9;
+    t7 = t5 + t1;
+    t12 = t10 + t14;
+    t6 = C17 * t12;
+    t0 = t10 * (-C18);
+    t8 = t14 * (-C19);
+    t4 = t6 - t8;
+    t2 = t6 + t0;
+    t9 = t3 + t7;
+    t5 = (-C26) * t9;
+    t1 = t3 * C27;
+    t12 = t7 * (-C28);
+    t10 = t5 - t12;
+    t14 = t5 + t1;
+    re[157] = t13;
+    im[157] = t11;
+    re[37] = t4;
+    im[37] = t2;
+    re[97] = t10;
+    im[97] = t14;
+    t8 = re[117];
+    t6 = im[117];
+    t0 = re[137];
+    t9 = im[137];
+    t3 = re[157];
+    t7 = im[157];
+    t12 = t0 + t3;
+    t5 = t9 + t7;
+    t1 = C6 * t12;
+    t13 = t8 - t1;
+    t11 = C6 * t5;
+    t4 = t6 - t11;
+    t2 = t0 - t3;
+    t10 = C7 * t2;
+    t14 = t9 - t7;
+    t1 = C7 * t14;
+    t11 = t8 + t12;
+    t0 = t6 + t5;
+    t3 = t13 + t1;
+    t2 = t4 - t10;
+    t9 = t13 - t1;
+    t7 = t4 + t10;
+    re[117] = t11;
+    im[117] = t0;
+    re[137] = t3;
+    im[137] = t2;
+    re[157] = t9;
+    im[157] = t7;
+    t14 = re[177];
+    t8 = im[177];
+    t12 = re[17];
+    t6 = im[17];
+    t5 = re[37];
+    t13 = im[37];
+    t1 = t12 + t5;
+    t4 = t6 + t13;
+    t10 = C6 * t1;
+    t11 = t14 - t10;
+    t0 = C6 * t4;
+    t3 = t8 - t0;
+    t2 = t12 - t5;
+    t9 = C7 * t2;
+    t7 = t6 - t13;
+    t10 = C7 * t7;
+    t0 = t14 + t1;
+    t12 = t8 + t4;
+    t5 = t11 + t10;
+    t2 = t3 - t9;
+    t6 = t11 - t10;
+    t13 = t3 + t9;
+    re[177] = t0;
+    im[177] = t12;
+    re[17] = t5;
+    im[17] = t2;
+    re[37] = t6;
+    im[37] = t13;
+    t7 = re[57];
+    t14 = im[57];
+    t1 = re[77];
+    t8 = im[77];
+    t4 = re[97];
+    t11 = im[97];
+    t10 = t1 + t4;
+    t3 = t8 + t11;
+    t9 = C6 * t10;
+    t0 = t7 - t9;
+    t12 = C6 * t3;
+    t5 = t14 - t12;
+    t2 = t1 - t4;
+    t6 = C7 * t2;
+    t13 = t8 - t11;
+    t9 = C7 * t13;
+    t12 = t7 + t10;
+    t1 = t14 + t3;
+    t4 = t0 + t9;
+    t2 = t5 - t6;
+    t8 = t0 - t9;
+    t11 = t5 + t6;
+    re[57] = t12;
+    im[57] = t1;
+    re[77] = t4;
+    im[77] = t2;
+    re[97] = t8;
+    im[97] = t11;
+    t13 = X[306];
+    t7 = X[53];
+    t10 = C65 * t13;
+    t14 = C66 * t7;
+    t3 = t10 + t14;
+    t0 = (-C66) * t13;
+    t9 = C65 * t7;
+    t5 = t0 + t9;
+    t6 = X[66];
+    t12 = X[293];
+    t1 = C67 * t6;
+    t4 = C68 * t12;
+    t2 = t1 + t4;
+    t8 = (-C68) * t6;
+    t11 = C67 * t12;
+    t10 = t8 + t11;
+    t14 = X[186];
+    t13 = X[173];
+    t7 = C69 * t14;
+    t0 = C70 * t13;
+    t9 = t7 + t0;
+    t1 = (-C70) * t14;
+    t4 = C69 * t13;
+    t6 = t1 + t4;
+    t12 = t2 + t9;
+    t8 = t10 + t6;
+    t11 = C6 * t12;
+    t7 = t3 - t11;
+    t0 = C6 * t8;
+    t14 = t5 - t0;
+    t13 = t2 - t9;
+    t1 = C7 * t13;
+    t4 = t10 - t6;
+    t11 = C7 * t4;
+    t0 = t3 + t12;
+    t2 = t5 + t8;
+    t9 = t7 + t11;
+    t13 = t14 - t1;
+    t10 = t7 - t11;
+    t6 = t14 + t1;
+    re[153] = t0;
+    im[153] = t2;
+    re[33] = t9;
+    im[33] = t13;
+    re[93] = t10;
+    im[93] = t6;
+    t4 = X[346];
+    t3 = X[13];
+    t12 = C71 * t4;
+    t5 = C72 * t3;
+    t8 = t12 + t5;
+    t7 = (-C72) * t4;
+    t11 = C71 * t3;
+    t14 = t7 + t11;
+    t1 = X[106];
+    t0 = X[253];
+    t2 = C73 * t1;
+    t9 = C74 * t0;
+    t13 = t2 + t9;
+    t10 = (-C74) * t1;
+    t6 = C73 * t0;
+    t12 = t10 + t6;
+    t5 = X[226];
+    t4 = X[133];
+    t3 = C75 * t5;
+    t7 = C76 * t4;
+    t11 = t3 + t7;
+    t2 = (-C76) * t5;
+    t9 = C75 * t4;
+    t1 = t2 + t9;
+    t0 = t13 + t11;
+    t10 = t12 + t1;
+    t6 = C6 * t0;
+    t3 = t8 - t6;
+    t7 = C6 * t10;
+    t5 = t14 - t7;
+    t4 = t13 - t11;
+    t2 = C7 * t4;
+    t9 = t12 - t1;
+    t6 = C7 * t9;
+    t7 = t8 + t0;
+    t13 = t14 + t10;
+    t11 = t3 + t6;
+    t4 = t5 - t2;
+    t12 = t3 - t6;
+    t1 = t5 + t2;
+    t9 = t11 + t4;
+    t8 = C14 * t9;
+    t0 = t11 * (-C15);
+    t14 = t4 * C16;
+    t10 = t8 - t14;
+    t3 = t8 + t0;
+    t6 = t12 + t1;
+    t5 = C17 * t6;
+    t2 = t12 * (-C18);
+    t9 = t1 * (-C19);
+    t11 = t5 - t9;
+    t4 = t5 + t2;
+    re[173] = t7;
+    im[173] = t13;
+    re[53] = t10;
+    im[53] = t3;
+    re[113] = t11;
+    im[113] = t4;
+    t14 = X[26];
+    t8 = X[333];
+    t0 = C77 * t14;
+    t6 = C78 * t8;
+    t12 = t0 + t6;
+    t1 = (-C78) * t14;
+    t9 = C77 * t8;
+    t5 = t1 + t9;
+    t2 = X[146];
+    t7 = X[213];
+    t13 = C79 * t2;
+    t10 = C80 * t7;
+    t3 = t13 + t10;
+    t11 = (-C80) * t2;
+    t4 = C79 * t7;
+    t0 = t11 + t4;
+    t6 = X[266];
+    t14 = X[93];
+    t8 = C81 * t6;
+    t1 = C82 * t14;
+    t9 = t8 + t1;
+    t13 = (-C82) * t6;
+    t10 = C81 * t14;
+    t2 = t13 + t10;
+    t7 = t3 + t9;
+    t11 = t0 + t2;
+    t4 = C6 * t7;
+    t8 = t12 - t4;
+    t1 = C6 * t11;
+    t6 = t5 - t1;
+    t14 = t3 - t9;
+    t13 = C7 * t14;
+    t10 = t0 - t2;
+    t4 = C7 * t10;
+    t1 = t12 + t7;
+    t3 = t5 + t11;
+    t9 = t8 + t4;
+    t14 = t6 - t13;
+    t0 = t8 - t4;
+    t2 = t6 + t13;
+    t10 = t9 + t14;
+    t12 = C17 * t10;
+    t7 = t9 * (-C18);
+    t5 = t14 * (-C19);
+    t11 = t12 - t5;
+    t8 = t12 + t7;
+    t4 = t0 + t2;
+    t6 = (-C26) * t4;
+    t13 = t0 * C27;
+    t10 = t2 * (-C28);
+    t9 = t6 - t10;
+    t14 = t6 + t13;
+    re[13] = t1;
+    im[13] = t3;
+    re[73] = t11;
+    im[73] = t8;
+    re[133] = t9;
+    im[133] = t14;
+    t5 = re[153];
+    t12 = im[153];
+    t7 = re[173];
+    t4 = im[173];
+    t0 = re[13];
+    t2 = im[13];
+    t10 = t7 + t0;
+    t6 = t4 + t2;
+    t13 = C6 * t10;
+    t1 = t5 - t13;
+    t3 = C6 * t6;
+    t11 = t12 - t3;
+    t8 = t7 - t0;
+    t9 = C7 * t8;
+    t14 = t4 - t2;
+    t13 = C7 * t14;
+    t3 = t5 + t10;
+    t7 = t12 + t6;
+    t0 = t1 + t13;
+    t8 = t11 - t9;
+    t4 = t1 - t13;
+    t2 = t11 + t9;
+    re[153] = t3;
+    im[153] = t7;
+    re[173] = t0;
+    im[173] = t8;
+    re[13] = t4;
+    im[13] = t2;
+    t14 = re[33];
+    t5 = im[33];
+    t10 = re[53];
+    t12 = im[53];
+    t6 = re[73];
+    t1 = im[73];
+    t13 = t10 + t6;
+    t11 = t12 + t1;
+    t9 = C6 * t13;
+    t3 = t14 - t9;
+    t7 = C6 * t11;
+    t0 = t5 - t7;
+    t8 = t10 - t6;
+    t4 = C7 * t8;
+    t2 = t12 - t1;
+    t9 = C7 * t2;
+    t7 = t14 + t13;
+    t10 = t5 + t11;
+    t6 = t3 + t9;
+    t8 = t0 - t4;
+    t12 = t3 - t9;
+    t1 = t0 + t4;
+    re[33] = t7;
+    im[33] = t10;
+    re[53] = t6;
+    im[53] = t8;
+    re[73] = t12;
+    im[73] = t1;
+    t2 = re[93];
+    t14 = im[93];
+    t13 = re[113];
+    t5 = im[113];
+    t11 = re[133];
+    t3 = im[133];
+    t9 = t13 + t11;
+    t0 = t5 + t3;
+    t4 = C6 * t9;
+    t7 = t2 - t4;
+    t10 = C6 * t0;
+    t6 = t14 - t10;
+    t8 = t13 - t11;
+    t12 = C7 * t8;
+    t1 = t5 - t3;
+    t4 = C7 * t1;
+    t10 = t2 + t9;
+    t13 = t14 + t0;
+    t11 = t7 + t4;
+    t8 = t6 - t12;
+    t5 = t7 - t4;
+    t3 = t6 + t12;
+    re[93] = t10;
+    im[93] = t13;
+    re[113] = t11;
+    im[113] = t8;
+    re[133] = t5;
+    im[133] = t3;
+    t1 = X[18];
+    t2 = X[341];
+    t9 = C83 * t1;
+    t14 = C84 * t2;
+    t0 = t9 + t14;
+    t7 = (-C84) * t1;
+    t4 = C83 * t2;
+    t6 = t7 + t4;
+    t12 = X[138];
+    t10 = X[221];
+    t13 = C85 * t12;
+    t11 = C86 * t10;
+    t8 = t13 + t11;
+    t5 = (-C86) * t12;
+    t3 = C85 * t10;
+    t9 = t5 + t3;
+    t14 = X[258];
+    t1 = X[101];
+    t2 = C87 * t14;
+    t7 = C88 * t1;
+    t4 = t2 + t7;
+    t13 = (-C88) * t14;
+    t11 = C87 * t1;
+    t12 = t13 + t11;
+    t10 = t8 + t4;
+    t5 = t9 + t12;
+    t3 = C6 * t10;
+    t2 = t0 - t3;
+    t7 = C6 * t5;
+    t14 = t6 - t7;
+    t1 = t8 - t4;
+    t13 = C7 * t1;
+    t11 = t9 - t12;
+    t3 = C7 * t11;
+    t7 = t0 + t10;
+    t8 = t6 + t5;
+    t4 = t2 + t3;
+    t1 = t14 - t13;
+    t9 = t2 - t3;
+    t12 = t14 + t13;
+    re[9] = t7;
+    im[9] = t8;
+    re[69] = t4;
+    im[69] = t1;
+    re[129] = t9;
+    im[129] = t12;
+    t11 = X[58];
+    t0 = X[301];
+    t10 = C89 * t11;
+    t6 = C90 * t0;
+    t5 = t10 + t6;
+    t2 = (-C90) * t11;
+    t3 = C89 * t0;
+    t14 = t2 + t3;
+    t13 = X[178];
+    t7 = X[181];
+    t8 = C91 * t13;
+    t4 = C92 * t7;
+    t1 = t8 + t4;
+    t9 = (-C92) * t13;
+    t12 = C91 * t7;
+    t10 = t9 + t12;
+    t6 = X[298];
+    t11 = X[61];
+    t0 = C93 * t6;
+    t2 = C94 * t11;
+    t3 = t0 + t2;
+    t8 = (-C94) * t6;
+    t4 = C93 * t11;
+    t13 = t8 + t4;
+    t7 = t1 + t3;
+    t9 = t10 + t13;
+    t12 = C6 * t7;
+    t0 = t5 - t12;
+    t2 = C6 * t9;
+    t6 = t14 - t2;
+    t11 = t1 - t3;
+    t8 = C7 * t11;
+    t4 = t10 - t13;
+    t12 = C7 * t4;
+    t2 = t5 + t7;
+    t1 = t14 + t9;
+    t3 = t0 + t12;
+    t11 = t6 - t8;
+    t10 = t0 - t12;
+    t13 = t6 + t8;
+    t4 = t3 + t11;
+    t5 = C14 * t4;
+    t7 = t3 * (-C15);
+    t14 = t11 * C16;
+    t9 = t5 - t14;
+    t0 = t5 + t7;
+    t12 = t10 + t13;
+    t6 = C17 * t12;
+    t8 = t10 * (-C18);
+    t4 = t13 * (-C19);
+    t3 = t6 - t4;
+    t11 = t6 + t8;
+    re[29] = t2;
+    im[29] = t1;
+    re[89] = t9;
+    im[89] = t0;
+    re[149] = t3;
+    im[149] = t11;
+    t14 = X[98];
+    t5 = X[261];
+    t7 = C95 * t14;
+    t12 = C96 * t5;
+    t10 = t7 + t12;
+    t13 = (-C96) * t14;
+    t4 = C95 * t5;
+    t6 = t13 + t4;
+    t8 = X[218];
+    t2 = X[141];
+    t1 = C97 * t8;
+    t9 = C98 * t2;
+    t0 = t1 + t9;
+    t3 = (-C98) * t8;
+    t11 = C97 * t2;
+    t7 = t3 + t11;
+    t12 = X[338];
+    t14 = X[21];
+    t5 = C99 * t12;
+    t13 = C100 * t14;
+    t4 = t5 + t13;
+    t1 = (-C100) * t12;
+    t9 = C99 * t14;
+    t8 = t1 + t9;
+    t2 = t0 + t4;
+    t3 = t7 + t8;
+    t11 = C6 * t2;
+    t5 = t10 - t11;
+    t13 = C6 * t3;
+    t12 = t6 - t13;
+    t14 = t0 - t4;
+    t1 = C7 * t14;
+    t9 = t7 - t8;
+    t11 = C7 * t9;
+    t13 = t10 + t2;
+    t0 = t6 + t3;
+    t4 = t5 + t11;
+    t14 = t12 - t1;
+    t7 = t5 - t11;
+    t8 = t12 + t1;
+    t9 = t4 + t14;
+    t10 = C17 * t9;
+    t2 = t4 * (-C18);
+    t6 = t14 * (-C19);
+    t3 = t10 - t6;
+    t5 = t10 + t2;
+    t11 = t7 + t8;
+    t12 = (-C26) * t11;
+    t1 = t7 * C27;
+    t9 = t8 * (-C28);
+    t4 = t12 - t9;
+    t14 = t12 + t1;
+    re[49] = t13;
+    im[49] = t0;
+    re[109] = t3;
+    im[109] = t5;
+    re[169] = t4;
+    im[169] = t14;
+    t6 = re[9];
+    t10 = im[9];
+    t2 = re[29];
+    t11 = im[29];
+    t7 = re[49];
+    t8 = im[49];
+    t9 = t2 + t7;
+    t12 = t11 + t8;
+    t1 = C6 * t9;
+    t13 = t6 - t1;
+    t0 = C6 * t12;
+    t3 = t10 - t0;
+    t5 = t2 - t7;
+    t4 = C7 * t5;
+    t14 = t11 - t8;
+    t1 = C7 * t14;
+    t0 = t6 + t9;
+    t2 = t10 + t12;
+    t7 = t13 + t1;
+    t5 = t3 - t4;
+    t11 = t13 - t1;
+    t8 = t3 + t4;
+    re[9] = t0;
+    im[9] = t2;
+    re[29] = t7;
+    im[29] = t5;
+    re[49] = t11;
+    im[49] = t8;
+    t14 = re[69];
+    t6 = im[69];
+    t9 = re[89];
+    t10 = im[89];
+    t12 = re[109];
+    t13 = im[109];
+    t1 = t9 + t12;
+    t3 = t10 + t13;
+    t4 = C6 * t1;
+    t0 = t14 - t4;
+    t2 = C6 * t3;
+    t7 = t6 - t2;
+    t5 = t9 - t12;
+    t11 = C7 * t5;
+    t8 = t10 - t13;
+    t4 = C7 * t8;
+    t2 = t14 + t1;
+    t9 = t6 + t3;
+    t12 = t0 + t4;
+    t5 = t7 - t11;
+    t10 = t0 - t4;
+    t13 = t7 + t11;
+    re[69] = t2;
+    im[69] = t9;
+    re[89] = t12;
+    im[89] = t5;
+    re[109] = t10;
+    im[109] = t13;
+    t8 = re[129];
+    t14 = im[129];
+    t1 = re[149];
+    t6 = im[149];
+    t3 = re[169];
+    t0 = im[169];
+    t4 = t1 + t3;
+    t7 = t6 + t0;
+    t11 = C6 * t4;
+    t2 = t8 - t11;
+    t9 = C6 * t7;
+    t12 = t14 - t9;
+    t5 = t1 - t3;
+    t10 = C7 * t5;
+    t13 = t6 - t0;
+    t11 = C7 * t13;
+    t9 = t8 + t4;
+    t1 = t14 + t7;
+    t3 = t2 + t11;
+    t5 = t12 - t10;
+    t6 = t2 - t11;
+    t0 = t12 + t10;
+    re[129] = t9;
+    im[129] = t1;
+    re[149] = t3;
+    im[149] = t5;
+    re[169] = t6;
+    im[169] = t0;
+    t13 = re[45];
+    t8 = im[45];
+    t4 = re[81];
+    t14 = im[81];
+    t7 = re[117];
+    t2 = im[117];
+    t11 = re[153];
+    t12 = im[153];
+    t10 = re[9];
+    t9 = im[9];
+    t1 = t4 + t10;
+    t3 = t14 + t9;
+    t5 = t7 + t11;
+    t6 = t2 + t12;
+    t0 = t4 - t10;
+    t4 = t14 - t9;
+    t10 = t7 - t11;
+    t14 = t2 - t12;
+    t9 = t1 + t5;
+    t7 = t3 + t6;
+    t11 = t1 - t5;
+    t2 = C101 * t11;
+    t12 = t3 - t6;
+    t1 = C101 * t12;
+    t5 = C102 * t9;
+    t11 = t13 - t5;
+    t3 = C102 * t7;
+    t6 = t8 - t3;
+    t12 = t11 + t2;
+    t5 = t6 + t1;
+    t3 = t11 - t2;
+    t11 = t6 - t1;
+    t2 = C103 * t0;
+    t6 = C104 * t10;
+    t1 = t2 + t6;
+    t2 = C103 * t4;
+    t6 = C104 * t14;
+    t2 = t2 + t6;
+    t6 = C104 * t0;
+    t0 = C103 * t10;
+    t10 = t6 - t0;
+    t6 = C104 * t4;
+    t0 = C103 * t14;
+    t4 = t6 - t0;
+    t14 = t13 + t9;
+    t6 = t8 + t7;
+    t0 = t12 + t2;
+    t13 = t5 - t1;
+    t9 = t3 + t4;
+    t8 = t11 - t10;
+    t7 = t3 - t4;
+    t3 = t11 + t10;
+    t4 = t12 - t2;
+    t11 = t5 + t1;
+    re[45] = t14;
+    im[45] = t6;
+    re[81] = t0;
+    im[81] = t13;
+    re[117] = t9;
+    im[117] = t8;
+    re[153] = t7;
+    im[153] = t3;
+    re[9] = t4;
+    im[9] = t11;
+    t10 = re[105];
+    t12 = im[105];
+    t2 = re[141];
+    t5 = im[141];
+    t1 = re[177];
+    t14 = im[177];
+    t6 = re[33];
+    t0 = im[33];
+    t13 = re[69];
+    t9 = im[69];
+    t8 = t2 + t13;
+    t7 = t5 + t9;
+    t3 = t1 + t6;
+    t4 = t14 + t0;
+    t11 = t2 - t13;
+    t2 = t5 - t9;
+    t13 = t1 - t6;
+    t5 = t14 - t0;
+    t9 = t8 + t3;
+    t1 = t7 + t4;
+    t6 = t8 - t3;
+    t14 = C101 * t6;
+    t0 = t7 - t4;
+    t8 = C101 * t0;
+    t3 = C102 * t9;
+    t6 = t10 - t3;
+    t7 = C102 * t1;
+    t4 = t12 - t7;
+    t0 = t6 + t14;
+    t3 = t4 + t8;
+    t7 = t6 - t14;
+    t6 = t4 - t8;
+    t14 = C103 * t11;
+    t4 = C104 * t13;
+    t8 = t14 + t4;
+    t14 = C103 * t2;
+    t4 = C104 * t5;
+    t14 = t14 + t4;
+    t4 = C104 * t11;
+    t11 = C103 * t13;
+    t13 = t4 - t11;
+    t4 = C104 * t2;
+    t11 = C103 * t5;
+    t2 = t4 - t11;
+    t5 = t10 + t9;
+    t4 = t12 + t1;
+    t11 = t0 + t14;
+    t10 = t3 - t8;
+    t9 = t7 + t2;
+    t12 = t6 - t13;
+    t1 = t7 - t2;
+    t7 = t6 + t13;
+    t2 = t0 - t14;
+    t6 = t3 + t8;
+    re[105] = t5;
+    im[105] = t4;
+    re[141] = t11;
+    im[141] = t10;
+    re[177] = t9;
+    im[177] = t12;
+    re[33] = t1;
+    im[33] = t7;
+    re[69] = t2;
+    im[69] = t6;
+    t13 = re[165];
+    t0 = im[165];
+    t14 = re[21];
+    t3 = im[21];
+    t8 = re[57];
+    t5 = im[57];
+    t4 = re[93];
+    t11 = im[93];
+    t10 = re[129];
+    t9 = im[129];
+    t12 = t14 + t10;
+    t1 = t3 + t9;
+    t7 = t8 + t4;
+    t2 = t5 + t11;
+    t6 = t14 - t10;
+    t14 = t3 - t9;
+    t10 = t8 - t4;
+    t3 = t5 - t11;
+    t9 = t12 + t7;
+    t8 = t1 + t2;
+    t4 = t12 - t7;
+    t5 = C101 * t4;
+    t11 = t1 - t2;
+    t12 = C101 * t11;
+    t7 = C102 * t9;
+    t4 = t13 - t7;
+    t1 = C102 * t8;
+    t2 = t0 - t1;
+    t11 = t4 + t5;
+    t7 = t2 + t12;
+    t1 = t4 - t5;
+    t4 = t2 - t12;
+    t5 = C103 * t6;
+    t2 = C104 * t10;
+    t12 = t5 + t2;
+    t5 = C103 * t14;
+    t2 = C104 * t3;
+    t5 = t5 + t2;
+    t2 = C104 * t6;
+    t6 = C103 * t10;
+    t10 = t2 - t6;
+    t2 = C104 * t14;
+    t6 = C103 * t3;
+    t14 = t2 - t6;
+    t3 = t13 + t9;
+    t2 = t0 + t8;
+    t6 = t11 + t5;
+    t13 = t7 - t12;
+    t9 = t1 + t14;
+    t0 = t4 - t10;
+    t8 = t1 - t14;
+    t1 = t4 + t10;
+    t14 = t11 - t5;
+    t4 = t7 + t12;
+    re[165] = t3;
+    im[165] = t2;
+    re[21] = t6;
+    im[21] = t13;
+    re[57] = t9;
+    im[57] = t0;
+    re[93] = t8;
+    im[93] = t1;
+    re[129] = t14;
+    im[129] = t4;
+    t10 = re[65];
+    t11 = im[65];
+    t5 = re[101];
+    t7 = im[101];
+    t12 = re[137];
+    t3 = im[137];
+    t2 = re[173];
+    t6 = im[173];
+    t13 = re[29];
+    t9 = im[29];
+    t0 = t5 + t13;
+    t8 = t7 + t9;
+    t1 = t12 + t2;
+    t14 = t3 + t6;
+    t4 = t5 - t13;
+    t5 = t7 - t9;
+    t13 = t12 - t2;
+    t7 = t3 - t6;
+    t9 = t0 + t1;
+    t12 = t8 + t14;
+    t2 = t0 - t1;
+    t3 = C101 * t2;
+    t6 = t8 - t14;
+    t0 = C101 * t6;
+    t1 = C102 * t9;
+    t2 = t10 - t1;
+    t8 = C102 * t12;
+    t14 = t11 - t8;
+    t6 = t2 + t3;
+    t1 = t14 + t0;
+    t8 = t2 - t3;
+    t2 = t14 - t0;
+    t3 = C103 * t4;
+    t14 = C104 * t13;
+    t0 = t3 + t14;
+    t3 = C103 * t5;
+    t14 = C104 * t7;
+    t3 = t3 + t14;
+    t14 = C104 * t4;
+    t4 = C103 * t13;
+    t13 = t14 - t4;
+    t14 = C104 * t5;
+    t4 = C103 * t7;
+    t5 = t14 - t4;
+    t7 = t10 + t9;
+    t14 = t11 + t12;
+    t4 = t6 + t3;
+    t10 = t1 - t0;
+    t9 = t8 + t5;
+    t11 = t2 - t13;
+    t12 = t8 - t5;
+    t8 = t2 + t13;
+    t5 = t6 - t3;
+    t2 = t1 + t0;
+    re[65] = t7;
+    im[65] = t14;
+    re[101] = t4;
+    im[101] = t10;
+    re[137] = t9;
+    im[137] = t11;
+    re[173] = t12;
+    im[173] = t8;
+    re[29] = t5;
+    im[29] = t2;
+    t13 = re[125];
+    t6 = im[125];
+    t3 = re[161];
+    t1 = im[161];
+    t0 = re[17];
+    t7 = im[17];
+    t14 = re[53];
+    t4 = im[53];
+    t10 = re[89];
+    t9 = im[89];
+    t11 = t3 + t10;
+    t12 = t1 + t9;
+    t8 = t0 + t14;
+    t5 = t7 + t4;
+    t2 = t3 - t10;
+    t3 = t1 - t9;
+    t10 = t0 - t14;
+    t1 = t7 - t4;
+    t9 = t11 + t8;
+    t0 = t12 + t5;
+    t14 = t11 - t8;
+    t7 = C101 * t14;
+    t4 = t12 - t5;
+    t11 = C101 * t4;
+    t8 = C102 * t9;
+    t14 = t13 - t8;
+    t12 = C102 * t0;
+    t5 = t6 - t12;
+    t4 = t14 + t7;
+    t8 = t5 + t11;
+    t12 = t14 - t7;
+    t14 = t5 - t11;
+    t7 = C103 * t2;
+    t5 = C104 * t10;
+    t11 = t7 + t5;
+    t7 = C103 * t3;
+    t5 = C104 * t1;
+    t7 = t7 + t5;
+    t5 = C104 * t2;
+    t2 = C103 * t10;
+    t10 = t5 - t2;
+    t5 = C104 * t3;
+    t2 = C103 * t1;
+    t3 = t5 - t2;
+    t1 = t13 + t9;
+    t5 = t6 + t0;
+    t2 = t4 + t7;
+    t13 = t8 - t11;
+    t9 = t12 + t3;
+    t6 = t14 - t10;
+    t0 = t12 - t3;
+    t12 = t14 + t10;
+    t3 = t4 - t7;
+    t14 = t8 + t11;
+    re[125] = t1;
+    im[125] = t5;
+    re[161] = t2;
+    im[161] = t13;
+    re[17] = t9;
+    im[17] = t6;
+    re[53] = t0;
+    im[53] = t12;
+    re[89] = t3;
+    im[89] = t14;
+    t10 = re[5];
+    t4 = im[5];
+    t7 = re[41];
+    t8 = im[41];
+    t11 = re[77];
+    t1 = im[77];
+    t5 = re[113];
+    t2 = im[113];
+    t13 = re[149];
+    t9 = im[149];
+    t6 = t7 + t13;
+    t0 = t8 + t9;
+    t12 = t11 + t5;
+    t3 = t1 + t2;
+    t14 = t7 - t13;
+    t7 = t8 - t9;
+    t13 = t11 - t5;
+    t8 = t1 - t2;
+    t9 = t6 + t12;
+    t11 = t0 + t3;
+    t5 = t6 - t12;
+    t1 = C101 * t5;
+    t2 = t0 - t3;
+    t6 = C101 * t2;
+    t12 = C102 * t9;
+    t5 = t10 - t12;
+    t0 = C102 * t11;
+    t3 = t4 - t0;
+    t2 = t5 + t1;
+    t12 = t3 + t6;
+    t0 = t5 - t1;
+    t5 = t3 - t6;
+    t1 = C103 * t14;
+    t3 = C104 * t13;
+    t6 = t1 + t3;
+    t1 = C103 * t7;
+    t3 = C104 * t8;
+    t1 = t1 + t3;
+    t3 = C104 * t14;
+    t14 = C103 * t13;
+    t13 = t3 - t14;
+    t3 = C104 * t7;
+    t14 = C103 * t8;
+    t7 = t3 - t14;
+    t8 = t10 + t9;
+    t3 = t4 + t11;
+    t14 = t2 + t1;
+    t10 = t12 - t6;
+    t9 = t0 + t7;
+    t4 = t5 - t13;
+    t11 = t0 - t7;
+    t0 = t5 + t13;
+    t7 = t2 - t1;
+    t5 = t12 + t6;
+    re[5] = t8;
+    im[5] = t3;
+    re[41] = t14;
+    im[41] = t10;
+    re[77] = t9;
+    im[77] = t4;
+    re[113] = t11;
+    im[113] = t0;
+    re[149] = t7;
+    im[149] = t5;
+    t13 = re[85];
+    t2 = im[85];
+    t1 = re[121];
+    t12 = im[121];
+    t6 = re[157];
+    t8 = im[157];
+    t3 = re[13];
+    t14 = im[13];
+    t10 = re[49];
+    t9 = im[49];
+    t4 = t1 + t10;
+    t11 = t12 + t9;
+    t0 = t6 + t3;
+    t7 = t8 + t14;
+    t5 = t1 - t10;
+    t1 = t12 - t9;
+    t10 = t6 - t3;
+    t12 = t8 - t14;
+    t9 = t4 + t0;
+    t6 = t11 + t7;
+    t3 = t4 - t0;
+    t8 = C101 * t3;
+    t14 = t11 - t7;
+    t4 = C101 * t14;
+    t0 = C102 * t9;
+    t3 = t13 - t0;
+    t11 = C102 * t6;
+    t7 = t2 - t11;
+    t14 = t3 + t8;
+    t0 = t7 + t4;
+    t11 = t3 - t8;
+    t3 = t7 - t4;
+    t8 = C103 * t5;
+    t7 = C104 * t10;
+    t4 = t8 + t7;
+    t8 = C103 * t1;
+    t7 = C104 * t12;
+    t8 = t8 + t7;
+    t7 = C104 * t5;
+    t5 = C103 * t10;
+    t10 = t7 - t5;
+    t7 = C104 * t1;
+    t5 = C103 * t12;
+    t1 = t7 - t5;
+    t12 = t13 + t9;
+    t7 = t2 + t6;
+    t5 = t14 + t8;
+    t13 = t0 - t4;
+    t9 = t11 + t1;
+    t2 = t3 - t10;
+    t6 = t11 - t1;
+    t11 = t3 + t10;
+    t1 = t14 - t8;
+    t3 = t0 + t4;
+    re[85] = t12;
+    im[85] = t7;
+    re[121] = t5;
+    im[121] = t13;
+    re[157] = t9;
+    im[157] = t2;
+    re[13] = t6;
+    im[13] = t11;
+    re[49] = t1;
+    im[49] = t3;
+    t10 = re[145];
+    t14 = im[145];
+    t8 = re[1];
+    t0 = im[1];
+    t4 = re[37];
+    t12 = im[37];
+    t7 = re[73];
+    t5 = im[73];
+    t13 = re[109];
+    t9 = im[109];
+    t2 = t8 + t13;
+    t6 = t0 + t9;
+    t11 = t4 + t7;
+    t1 = t12 + t5;
+    t3 = t8 - t13;
+    t8 = t0 - t9;
+    t13 = t4 - t7;
+    t0 = t12 - t5;
+    t9 = t2 + t11;
+    t4 = t6 + t1;
+    t7 = t2 - t11;
+    t12 = C101 * t7;
+    t5 = t6 - t1;
+    t2 = C101 * t5;
+    t11 = C102 * t9;
+    t7 = t10 - t11;
+    t6 = C102 * t4;
+    t1 = t14 - t6;
+    t5 = t7 + t12;
+    t11 = t1 + t2;
+    t6 = t7 - t12;
+    t7 = t1 - t2;
+    t12 = C103 * t3;
+    t1 = C104 * t13;
+    t2 = t12 + t1;
+    t12 = C103 * t8;
+    t1 = C104 * t0;
+    t12 = t12 + t1;
+    t1 = C104 * t3;
+    t3 = C103 * t13;
+    t13 = t1 - t3;
+    t1 = C104 * t8;
+    t3 = C103 * t0;
+    t8 = t1 - t3;
+    t0 = t10 + t9;
+    t1 = t14 + t4;
+    t3 = t5 + t12;
+    t10 = t11 - t2;
+    t9 = t6 + t8;
+    t14 = t7 - t13;
+    t4 = t6 - t8;
+    t6 = t7 + t13;
+    t8 = t5 - t12;
+    t7 = t11 + t2;
+    re[145] = t0;
+    im[145] = t1;
+    re[1] = t3;
+    im[1] = t10;
+    re[37] = t9;
+    im[37] = t14;
+    re[73] = t4;
+    im[73] = t6;
+    re[109] = t8;
+    im[109] = t7;
+    t13 = re[25];
+    t5 = im[25];
+    t12 = re[61];
+    t11 = im[61];
+    t2 = re[97];
+    t0 = im[97];
+    t1 = re[133];
+    t3 = im[133];
+    t10 = re[169];
+    t9 = im[169];
+    t14 = t12 + t10;
+    t4 = t11 + t9;
+    t6 = t2 + t1;
+    t8 = t0 + t3;
+    t7 = t12 - t10;
+    t12 = t11 - t9;
+    t10 = t2 - t1;
+    t11 = t0 - t3;
+    t9 = t14 + t6;
+    t2 = t4 + t8;
+    t1 = t14 - t6;
+    t0 = C101 * t1;
+    t3 = t4 - t8;
+    t14 = C101 * t3;
+    t6 = C102 * t9;
+    t1 = t13 - t6;
+    t4 = C102 * t2;
+    t8 = t5 - t4;
+    t3 = t1 + t0;
+    t6 = t8 + t14;
+    t4 = t1 - t0;
+    t1 = t8 - t14;
+    t0 = C103 * t7;
+    t8 = C104 * t10;
+    t14 = t0 + t8;
+    t0 = C103 * t12;
+    t8 = C104 * t11;
+    t0 = t0 + t8;
+    t8 = C104 * t7;
+    t7 = C103 * t10;
+    t10 = t8 - t7;
+    t8 = C104 * t12;
+    t7 = C103 * t11;
+    t12 = t8 - t7;
+    t11 = t13 + t9;
+    t8 = t5 + t2;
+    t7 = t3 + t0;
+    t13 = t6 - t14;
+    t9 = t4 + t12;
+    t5 = t1 - t10;
+    t2 = t4 - t12;
+    t4 = t1 + t10;
+    t12 = t3 - t0;
+    t1 = t6 + t14;
+    re[25] = t11;
+    im[25] = t8;
+    re[61] = t7;
+    im[61] = t13;
+    re[97] = t9;
+    im[97] = t5;
+    re[133] = t2;
+    im[133] = t4;
+    re[169] = t12;
+    im[169] = t1;
+}
+
+/**
+ *  Part 3 of ApplyWindowedIMDCT_W75_360().
+ * 
+ *  @param {Number[]} X 
+ *    - The input block (360 points).
+ *  @param {Number[]} y 
+ *    - The array that would contain the output block (720 points).
+ *  @param {Number[]} re 
+ *    - The scratch buffer (real part, 180 points).
+ *  @param {Number[]} im 
+ *    - The scratch buffer (imaginary part, 180 points).
+ */
+function ApplyWindowedIMDCT_W75_360_Part3(X, y, re, im) {
+    let t0, t1, t10, t11, t12, t13, t14, t2, t3, t4, t5, t6, t7, t8, t9;
+    const C0 = 0.7071067811865476;
+    const C1 = 0.7071067811865475;
+    const C2 = 0.25881904510252074;
+    const C3 = 0.9659258262890683;
+    const C4 = 0.5;
+    const C5 = 0.8660254037844386;
+    const C6 = 0.573576436351046;
+    const C7 = 0.8191520442889918;
+    const C8 = 0.08715574274765817;
+    const C9 = 0.9961946980917455;
+    const C10 = 0.9063077870366499;
+    const C11 = 0.42261826174069944;
+    const C12 = 0.766044443118978;
+    const C13 = 1.4088320528055172;
+    const C14 = 0.12325683343243876;
+    const C15 = 0.17364817766693033;
+    const C16 = 1.1584559306791384;
+    const C17 = 0.8111595753452777;
+    const C18 = 0.9396926207859084;
+    const C19 = 0.5976724774602398;
+    const C20 = 1.281712764111577;
+    const C21 = 0.45399049973954675;
+    const C22 = 0.8910065241883679;
+    const C23 = 0.9986295347545738;
+    const C24 = 0.05233595624294383;
+    const C25 = 0.838670567945424;
+    const C26 = 0.544639035015027;
+    const C27 = 0.2923717047227367;
+    const C28 = 0.9563047559630355;
+    const C29 = 0.9743700647852352;
+    const C30 = 0.22495105434386498;
+    const C31 = 0.7313537016191705;
+    const C32 = 0.6819983600624985;
+    const C33 = 0.12186934340514748;
+    const C34 = 0.992546151641322;
+    const C35 = 0.9205048534524404;
+    const C36 = 0.3907311284892737;
+    const C37 = 0.6018150231520483;
+    const C38 = 0.7986355100472928;
+    const C39 = 0.15643446504023087;
+    const C40 = 0.9876883405951378;
+    const C41 = 0.9335804264972017;
+    const C42 = 0.35836794954530027;
+    const C43 = 0.6293203910498375;
+    const C44 = 0.7771459614569709;
+    const C45 = 0.9998476951563913;
+    const C46 = 0.01745240643728351;
+    const C47 = 0.8571673007021123;
+    const C48 = 0.5150380749100542;
+    const C49 = 0.48480962024633706;
+    const C50 = 0.8746197071393957;
+    const C51 = 0.981627183447664;
+    const C52 = 0.1908089953765448;
+    const C53 = 0.754709580222772;
+    const C54 = 0.6560590289905073;
+    const C55 = 0.3255681544571567;
+    const C56 = 0.9455185755993168;
+    const C57 = 0.5590169943749475;
+    const C58 = 0.25;
+    const C59 = 0.9510565162951535;
+    const C60 = 0.5877852522924731;
+    t10 = X[180];
+    t3 = X[179];
+    t0 = C0 * t10;
+    t6 = C1 * t3;
+    t14 = t0 + t6;
+    t11 = (-C1) * t10;
+    t8 = C0 * t3;
+    t7 = t11 + t8;
+    t13 = X[300];
+    t9 = X[59];
+    t5 = C2 * t13;
+    t2 = C3 * t9;
+    t4 = t5 + t2;
+    t12 = (-C3) * t13;
+    t1 = C2 * t9;
+    t0 = t12 + t1;
+    t6 = X[60];
+    t10 = X[299];
+    t3 = C3 * t6;
+    t11 = C2 * t10;
+    t8 = t3 + t11;
+    t5 = (-C2) * t6;
+    t2 = C3 * t10;
+    t13 = t5 + t2;
+    t9 = t4 + t8;
+    t12 = t0 + t13;
+    t1 = C4 * t9;
+    t3 = t14 - t1;
+    t11 = C4 * t12;
+    t6 = t7 - t11;
+    t10 = t4 - t8;
+    t5 = C5 * t10;
+    t2 = t0 - t13;
+    t1 = C5 * t2;
+    t11 = t14 + t9;
+    t4 = t7 + t12;
+    t8 = t3 + t1;
+    t10 = t6 - t5;
+    t0 = t3 - t1;
+    t13 = t6 + t5;
+    re[90] = t11;
+    im[90] = t4;
+    re[150] = t8;
+    im[150] = t10;
+    re[30] = t0;
+    im[30] = t13;
+    t2 = X[220];
+    t14 = X[139];
+    t9 = C6 * t2;
+    t7 = C7 * t14;
+    t12 = t9 + t7;
+    t3 = (-C7) * t2;
+    t1 = C6 * t14;
+    t6 = t3 + t1;
+    t5 = X[340];
+    t11 = X[19];
+    t4 = C8 * t5;
+    t8 = C9 * t11;
+    t10 = t4 + t8;
+    t0 = (-C9) * t5;
+    t13 = C8 * t11;
+    t9 = t0 + t13;
+    t7 = X[100];
+    t2 = X[259];
+    t14 = C10 * t7;
+    t3 = C11 * t2;
+    t1 = t14 + t3;
+    t4 = (-C11) * t7;
+    t8 = C10 * t2;
+    t5 = t4 + t8;
+    t11 = t10 + t1;
+    t0 = t9 + t5;
+    t13 = C4 * t11;
+    t14 = t12 - t13;
+    t3 = C4 * t0;
+    t7 = t6 - t3;
+    t2 = t10 - t1;
+    t4 = C5 * t2;
+    t8 = t9 - t5;
+    t13 = C5 * t8;
+    t3 = t12 + t11;
+    t10 = t6 + t0;
+    t1 = t14 + t13;
+    t2 = t7 - t4;
+    t9 = t14 - t13;
+    t5 = t7 + t4;
+    t8 = t1 + t2;
+    t12 = C12 * t8;
+    t11 = t1 * (-C13);
+    t6 = t2 * C14;
+    t0 = t12 - t6;
+    t14 = t12 + t11;
+    t13 = t9 + t5;
+    t7 = C15 * t13;
+    t4 = t9 * (-C16);
+    t8 = t5 * (-C17);
+    t1 = t7 - t8;
+    t2 = t7 + t4;
+    re[110] = t3;
+    im[110] = t10;
+    re[170] = t0;
+    im[170] = t14;
+    re[50] = t1;
+    im[50] = t2;
+    t6 = X[260];
+    t12 = X[99];
+    t11 = C11 * t6;
+    t13 = C10 * t12;
+    t9 = t11 + t13;
+    t5 = (-C10) * t6;
+    t8 = C11 * t12;
+    t7 = t5 + t8;
+    t4 = X[20];
+    t3 = X[339];
+    t10 = C9 * t4;
+    t0 = C8 * t3;
+    t14 = t10 + t0;
+    t1 = (-C8) * t4;
+    t2 = C9 * t3;
+    t11 = t1 + t2;
+    t13 = X[140];
+    t6 = X[219];
+    t12 = C7 * t13;
+    t5 = C6 * t6;
+    t8 = t12 + t5;
+    t10 = (-C6) * t13;
+    t0 = C7 * t6;
+    t4 = t10 + t0;
+    t3 = t14 + t8;
+    t1 = t11 + t4;
+    t2 = C4 * t3;
+    t12 = t9 - t2;
+    t5 = C4 * t1;
+    t13 = t7 - t5;
+    t6 = t14 - t8;
+    t10 = C5 * t6;
+    t0 = t11 - t4;
+    t2 = C5 * t0;
+    t5 = t9 + t3;
+    t14 = t7 + t1;
+    t8 = t12 + t2;
+    t6 = t13 - t10;
+    t11 = t12 - t2;
+    t4 = t13 + t10;
+    t0 = t8 + t6;
+    t9 = C15 * t0;
+    t3 = t8 * (-C16);
+    t7 = t6 * (-C17);
+    t1 = t9 - t7;
+    t12 = t9 + t3;
+    t2 = t11 + t4;
+    t13 = (-C18) * t2;
+    t10 = t11 * C19;
+    t0 = t4 * (-C20);
+    t8 = t13 - t0;
+    t6 = t13 + t10;
+    re[130] = t5;
+    im[130] = t14;
+    re[10] = t1;
+    im[10] = t12;
+    re[70] = t8;
+    im[70] = t6;
+    t7 = re[90];
+    t9 = im[90];
+    t3 = re[110];
+    t2 = im[110];
+    t11 = re[130];
+    t4 = im[130];
+    t0 = t3 + t11;
+    t13 = t2 + t4;
+    t10 = C4 * t0;
+    t5 = t7 - t10;
+    t14 = C4 * t13;
+    t1 = t9 - t14;
+    t12 = t3 - t11;
+    t8 = C5 * t12;
+    t6 = t2 - t4;
+    t10 = C5 * t6;
+    t14 = t7 + t0;
+    t3 = t9 + t13;
+    t11 = t5 + t10;
+    t12 = t1 - t8;
+    t2 = t5 - t10;
+    t4 = t1 + t8;
+    re[90] = t14;
+    im[90] = t3;
+    re[110] = t11;
+    im[110] = t12;
+    re[130] = t2;
+    im[130] = t4;
+    t6 = re[150];
+    t7 = im[150];
+    t0 = re[170];
+    t9 = im[170];
+    t13 = re[10];
+    t5 = im[10];
+    t10 = t0 + t13;
+    t1 = t9 + t5;
+    t8 = C4 * t10;
+    t14 = t6 - t8;
+    t3 = C4 * t1;
+    t11 = t7 - t3;
+    t12 = t0 - t13;
+    t2 = C5 * t12;
+    t4 = t9 - t5;
+    t8 = C5 * t4;
+    t3 = t6 + t10;
+    t0 = t7 + t1;
+    t13 = t14 + t8;
+    t12 = t11 - t2;
+    t9 = t14 - t8;
+    t5 = t11 + t2;
+    re[150] = t3;
+    im[150] = t0;
+    re[170] = t13;
+    im[170] = t12;
+    re[10] = t9;
+    im[10] = t5;
+    t4 = re[30];
+    t6 = im[30];
+    t10 = re[50];
+    t7 = im[50];
+    t1 = re[70];
+    t14 = im[70];
+    t8 = t10 + t1;
+    t11 = t7 + t14;
+    t2 = C4 * t8;
+    t3 = t4 - t2;
+    t0 = C4 * t11;
+    t13 = t6 - t0;
+    t12 = t10 - t1;
+    t9 = C5 * t12;
+    t5 = t7 - t14;
+    t2 = C5 * t5;
+    t0 = t4 + t8;
+    t10 = t6 + t11;
+    t1 = t3 + t2;
+    t12 = t13 - t9;
+    t7 = t3 - t2;
+    t14 = t13 + t9;
+    re[30] = t0;
+    im[30] = t10;
+    re[50] = t1;
+    im[50] = t12;
+    re[70] = t7;
+    im[70] = t14;
+    t5 = X[252];
+    t4 = X[107];
+    t8 = C21 * t5;
+    t6 = C22 * t4;
+    t11 = t8 + t6;
+    t3 = (-C22) * t5;
+    t2 = C21 * t4;
+    t13 = t3 + t2;
+    t9 = X[12];
+    t0 = X[347];
+    t10 = C23 * t9;
+    t1 = C24 * t0;
+    t12 = t10 + t1;
+    t7 = (-C24) * t9;
+    t14 = C23 * t0;
+    t8 = t7 + t14;
+    t6 = X[132];
+    t5 = X[227];
+    t4 = C25 * t6;
+    t3 = C26 * t5;
+    t2 = t4 + t3;
+    t10 = (-C26) * t6;
+    t1 = C25 * t5;
+    t9 = t10 + t1;
+    t0 = t12 + t2;
+    t7 = t8 + t9;
+    t14 = C4 * t0;
+    t4 = t11 - t14;
+    t3 = C4 * t7;
+    t6 = t13 - t3;
+    t5 = t12 - t2;
+    t10 = C5 * t5;
+    t1 = t8 - t9;
+    t14 = C5 * t1;
+    t3 = t11 + t0;
+    t12 = t13 + t7;
+    t2 = t4 + t14;
+    t5 = t6 - t10;
+    t8 = t4 - t14;
+    t9 = t6 + t10;
+    re[126] = t3;
+    im[126] = t12;
+    re[6] = t2;
+    im[6] = t5;
+    re[66] = t8;
+    im[66] = t9;
+    t1 = X[292];
+    t11 = X[67];
+    t0 = C27 * t1;
+    t13 = C28 * t11;
+    t7 = t0 + t13;
+    t4 = (-C28) * t1;
+    t14 = C27 * t11;
+    t6 = t4 + t14;
+    t10 = X[52];
+    t3 = X[307];
+    t12 = C29 * t10;
+    t2 = C30 * t3;
+    t5 = t12 + t2;
+    t8 = (-C30) * t10;
+    t9 = C29 * t3;
+    t0 = t8 + t9;
+    t13 = X[172];
+    t1 = X[187];
+    t11 = C31 * t13;
+    t4 = C32 * t1;
+    t14 = t11 + t4;
+    t12 = (-C32) * t13;
+    t2 = C31 * t1;
+    t10 = t12 + t2;
+    t3 = t5 + t14;
+    t8 = t0 + t10;
+    t9 = C4 * t3;
+    t11 = t7 - t9;
+    t4 = C4 * t8;
+    t13 = t6 - t4;
+    t1 = t5 - t14;
+    t12 = C5 * t1;
+    t2 = t0 - t10;
+    t9 = C5 * t2;
+    t4 = t7 + t3;
+    t5 = t6 + t8;
+    t14 = t11 + t9;
+    t1 = t13 - t12;
+    t0 = t11 - t9;
+    t10 = t13 + t12;
+    t2 = t14 + t1;
+    t7 = C12 * t2;
+    t3 = t14 * (-C13);
+    t6 = t1 * C14;
+    t8 = t7 - t6;
+    t11 = t7 + t3;
+    t9 = t0 + t10;
+    t13 = C15 * t9;
+    t12 = t0 * (-C16);
+    t2 = t10 * (-C17);
+    t14 = t13 - t2;
+    t1 = t13 + t12;
+    re[146] = t4;
+    im[146] = t5;
+    re[26] = t8;
+    im[26] = t11;
+    re[86] = t14;
+    im[86] = t1;
+    t6 = X[332];
+    t7 = X[27];
+    t3 = C33 * t6;
+    t9 = C34 * t7;
+    t0 = t3 + t9;
+    t10 = (-C34) * t6;
+    t2 = C33 * t7;
+    t13 = t10 + t2;
+    t12 = X[92];
+    t4 = X[267];
+    t5 = C35 * t12;
+    t8 = C36 * t4;
+    t11 = t5 + t8;
+    t14 = (-C36) * t12;
+    t1 = C35 * t4;
+    t3 = t14 + t1;
+    t9 = X[212];
+    t6 = X[147];
+    t7 = C37 * t9;
+    t10 = C38 * t6;
+    t2 = t7 + t10;
+    t5 = (-C38) * t9;
+    t8 = C37 * t6;
+    t12 = t5 + t8;
+    t4 = t11 + t2;
+    t14 = t3 + t12;
+    t1 = C4 * t4;
+    t7 = t0 - t1;
+    t10 = C4 * t14;
+    t9 = t13 - t10;
+    t6 = t11 - t2;
+    t5 = C5 * t6;
+    t8 = t3 - t12;
+    t1 = C5 * t8;
+    t10 = t0 + t4;
+    t11 = t13 + t14;
+    t2 = t7 + t1;
+    t6 = t9 - t5;
+    t3 = t7 - t1;
+    t12 = t9 + t5;
+    t8 = t2 + t6;
+    t0 = C15 * t8;
+    t4 = t2 * (-C16);
+    t13 = t6 * (-C17);
+    t14 = t0 - t13;
+    t7 = t0 + t4;
+    t1 = t3 + t12;
+    t9 = (-C18) * t1;
+    t5 = t3 * C19;
+    t8 = t12 * (-C20);
+    t2 = t9 - t8;
+    t6 = t9 + t5;
+    re[166] = t10;
+    im[166] = t11;
+    re[46] = t14;
+    im[46] = t7;
+    re[106] = t2;
+    im[106] = t6;
+    t13 = re[126];
+    t0 = im[126];
+    t4 = re[146];
+    t1 = im[146];
+    t3 = re[166];
+    t12 = im[166];
+    t8 = t4 + t3;
+    t9 = t1 + t12;
+    t5 = C4 * t8;
+    t10 = t13 - t5;
+    t11 = C4 * t9;
+    t14 = t0 - t11;
+    t7 = t4 - t3;
+    t2 = C5 * t7;
+    t6 = t1 - t12;
+    t5 = C5 * t6;
+    t11 = t13 + t8;
+    t4 = t0 + t9;
+    t3 = t10 + t5;
+    t7 = t14 - t2;
+    t1 = t10 - t5;
+    t12 = t14 + t2;
+    re[126] = t11;
+    im[126] = t4;
+    re[146] = t3;
+    im[146] = t7;
+    re[166] = t1;
+    im[166] = t12;
+    t6 = re[6];
+    t13 = im[6];
+    t8 = re[26];
+    t0 = im[26];
+    t9 = re[46];
+    t10 = im[46];
+    t5 = t8 + t9;
+    t14 = t0 + t10;
+    t2 = C4 * t5;
+    t11 = t6 - t2;
+    t4 = C4 * t14;
+    t3 = t13 - t4;
+    t7 = t8 - t9;
+    t1 = C5 * t7;
+    t12 = t0 - t10;
+    t2 = C5 * t12;
+    t4 = t6 + t5;
+    t8 = t13 + t14;
+    t9 = t11 + t2;
+    t7 = t3 - t1;
+    t0 = t11 - t2;
+    t10 = t3 + t1;
+    re[6] = t4;
+    im[6] = t8;
+    re[26] = t9;
+    im[26] = t7;
+    re[46] = t0;
+    im[46] = t10;
+    t12 = re[66];
+    t6 = im[66];
+    t5 = re[86];
+    t13 = im[86];
+    t14 = re[106];
+    t11 = im[106];
+    t2 = t5 + t14;
+    t3 = t13 + t11;
+    t1 = C4 * t2;
+    t4 = t12 - t1;
+    t8 = C4 * t3;
+    t9 = t6 - t8;
+    t7 = t5 - t14;
+    t0 = C5 * t7;
+    t10 = t13 - t11;
+    t1 = C5 * t10;
+    t8 = t12 + t2;
+    t5 = t6 + t3;
+    t14 = t4 + t1;
+    t7 = t9 - t0;
+    t13 = t4 - t1;
+    t11 = t9 + t0;
+    re[66] = t8;
+    im[66] = t5;
+    re[86] = t14;
+    im[86] = t7;
+    re[106] = t13;
+    im[106] = t11;
+    t10 = X[324];
+    t12 = X[35];
+    t2 = C39 * t10;
+    t6 = C40 * t12;
+    t3 = t2 + t6;
+    t4 = (-C40) * t10;
+    t1 = C39 * t12;
+    t9 = t4 + t1;
+    t0 = X[84];
+    t8 = X[275];
+    t5 = C41 * t0;
+    t14 = C42 * t8;
+    t7 = t5 + t14;
+    t13 = (-C42) * t0;
+    t11 = C41 * t8;
+    t2 = t13 + t11;
+    t6 = X[204];
+    t10 = X[155];
+    t12 = C43 * t6;
+    t4 = C44 * t10;
+    t1 = t12 + t4;
+    t5 = (-C44) * t6;
+    t14 = C43 * t10;
+    t0 = t5 + t14;
+    t8 = t7 + t1;
+    t13 = t2 + t0;
+    t11 = C4 * t8;
+    t12 = t3 - t11;
+    t4 = C4 * t13;
+    t6 = t9 - t4;
+    t10 = t7 - t1;
+    t5 = C5 * t10;
+    t14 = t2 - t0;
+    t11 = C5 * t14;
+    t4 = t3 + t8;
+    t7 = t9 + t13;
+    t1 = t12 + t11;
+    t10 = t6 - t5;
+    t2 = t12 - t11;
+    t0 = t6 + t5;
+    re[162] = t4;
+    im[162] = t7;
+    re[42] = t1;
+    im[42] = t10;
+    re[102] = t2;
+    im[102] = t0;
+    t14 = X[4];
+    t3 = X[355];
+    t8 = C45 * t14;
+    t9 = C46 * t3;
+    t13 = t8 + t9;
+    t12 = (-C46) * t14;
+    t11 = C45 * t3;
+    t6 = t12 + t11;
+    t5 = X[124];
+    t4 = X[235];
+    t7 = C47 * t5;
+    t1 = C48 * t4;
+    t10 = t7 + t1;
+    t2 = (-C48) * t5;
+    t0 = C47 * t4;
+    t8 = t2 + t0;
+    t9 = X[244];
+    t14 = X[115];
+    t3 = C49 * t9;
+    t12 = C50 * t14;
+    t11 = t3 + t12;
+    t7 = (-C50) * t9;
+    t1 = C49 * t14;
+    t5 = t7 + t1;
+    t4 = t10 + t11;
+    t2 = t8 + t5;
+    t0 = C4 * t4;
+    t3 = t13 - t0;
+    t12 = C4 * t2;
+    t9 = t6 - t12;
+    t14 = t10 - t11;
+    t7 = C5 * t14;
+    t1 = t8 - t5;
+    t0 = C5 * t1;
+    t12 = t13 + t4;
+    t10 = t6 + t2;
+    t11 = t3 + t0;
+    t14 = t9 - t7;
+    t8 = t3 - t0;
+    t5 = t9 + t7;
+    t1 = t11 + t14;
+    t13 = C12 * t1;
+    t4 = t11 * (-C13);
+    t6 = t14 * C14;
+    t2 = t13 - t6;
+    t3 = t13 + t4;
+    t0 = t8 + t5;
+    t9 = C15 * t0;
+    t7 = t8 * (-C16);
+    t1 = t5 * (-C17);
+    t11 = t9 - t1;
+    t14 = t9 + t7;
+    re[2] = t12;
+    im[2] = t10;
+    re[62] = t2;
+    im[62] = t3;
+    re[122] = t11;
+    im[122] = t14;
+    t6 = X[44];
+    t13 = X[315];
+    t4 = C51 * t6;
+    t0 = C52 * t13;
+    t8 = t4 + t0;
+    t5 = (-C52) * t6;
+    t1 = C51 * t13;
+    t9 = t5 + t1;
+    t7 = X[164];
+    t12 = X[195];
+    t10 = C53 * t7;
+    t2 = C54 * t12;
+    t3 = t10 + t2;
+    t11 = (-C54) * t7;
+    t14 = C53 * t12;
+    t4 = t11 + t14;
+    t0 = X[284];
+    t6 = X[75];
+    t13 = C55 * t0;
+    t5 = C56 * t6;
+    t1 = t13 + t5;
+    t10 = (-C56) * t0;
+    t2 = C55 * t6;
+    t7 = t10 + t2;
+    t12 = t3 + t1;
+    t11 = t4 + t7;
+    t14 = C4 * t12;
+    t13 = t8 - t14;
+    t5 = C4 * t11;
+    t0 = t9 - t5;
+    t6 = t3 - t1;
+    t10 = C5 * t6;
+    t2 = t4 - t7;
+    t14 = C5 * t2;
+    t5 = t8 + t12;
+    t3 = t9 + t11;
+    t1 = t13 + t14;
+    t6 = t0 - t10;
+    t4 = t13 - t14;
+    t7 = t0 + t10;
+    t2 = t1 + t6;
+    t8 = C15 * t2;
+    t12 = t1 * (-C16);
+    t9 = t6 * (-C17);
+    t11 = t8 - t9;
+    t13 = t8 + t12;
+    t14 = t4 + t7;
+    t0 = (-C18) * t14;
+    t10 = t4 * C19;
+    t2 = t7 * (-C20);
+    t1 = t0 - t2;
+    t6 = t0 + t10;
+    re[22] = t5;
+    im[22] = t3;
+    re[82] = t11;
+    im[82] = t13;
+    re[142] = t1;
+    im[142] = t6;
+    t9 = re[162];
+    t8 = im[162];
+    t12 = re[2];
+    t14 = im[2];
+    t4 = re[22];
+    t7 = im[22];
+    t2 = t12 + t4;
+    t0 = t14 + t7;
+    t10 = C4 * t2;
+    t5 = t9 - t10;
+    t3 = C4 * t0;
+    t11 = t8 - t3;
+    t13 = t12 - t4;
+    t1 = C5 * t13;
+    t6 = t14 - t7;
+    t10 = C5 * t6;
+    t3 = t9 + t2;
+    t12 = t8 + t0;
+    t4 = t5 + t10;
+    t13 = t11 - t1;
+    t14 = t5 - t10;
+    t7 = t11 + t1;
+    re[162] = t3;
+    im[162] = t12;
+    re[2] = t4;
+    im[2] = t13;
+    re[22] = t14;
+    im[22] = t7;
+    t6 = re[42];
+    t9 = im[42];
+    t2 = re[62];
+    t8 = im[62];
+    t0 = re[82];
+    t5 = im[82];
+    t10 = t2 + t0;
+    t11 = t8 + t5;
+    t1 = C4 * t10;
+    t3 = t6 - t1;
+    t12 = C4 * t11;
+    t4 = t9 - t12;
+    t13 = t2 - t0;
+    t14 = C5 * t13;
+    t7 = t8 - t5;
+    t1 = C5 * t7;
+    t12 = t6 + t10;
+    t2 = t9 + t11;
+    t0 = t3 + t1;
+    t13 = t4 - t14;
+    t8 = t3 - t1;
+    t5 = t4 + t14;
+    re[42] = t12;
+    im[42] = t2;
+    re[62] = t0;
+    im[62] = t13;
+    re[82] = t8;
+    im[82] = t5;
+    t7 = re[102];
+    t6 = im[102];
+    t10 = re[122];
+    t9 = im[122];
+    t11 = re[142];
+    t3 = im[142];
+    t1 = t10 + t11;
+    t4 = t9 + t3;
+    t14 = C4 * t1;
+    t12 = t7 - t14;
+    t2 = C4 * t4;
+    t0 = t6 - t2;
+    t13 = t10 - t11;
+    t8 = C5 * t13;
+    t5 = t9 - t3;
+    t14 = C5 * t5;
+    t2 = t7 + t1;
+    t10 = t6 + t4;
+    t11 = t12 + t14;
+    t13 = t0 - t8;
+    t9 = t12 - t14;
+    t3 = t0 + t8;
+    re[102] = t2;
+    im[102] = t10;
+    re[122] = t11;
+    im[122] = t13;
+    re[142] = t9;
+    im[142] = t3;
+    t5 = X[36];
+    t7 = X[323];
+    t1 = C40 * t5;
+    t6 = C39 * t7;
+    t4 = t1 + t6;
+    t12 = (-C39) * t5;
+    t14 = C40 * t7;
+    t0 = t12 + t14;
+    t8 = X[156];
+    t2 = X[203];
+    t10 = C44 * t8;
+    t11 = C43 * t2;
+    t13 = t10 + t11;
+    t9 = (-C43) * t8;
+    t3 = C44 * t2;
+    t1 = t9 + t3;
+    t6 = X[276];
+    t5 = X[83];
+    t7 = C42 * t6;
+    t12 = C41 * t5;
+    t14 = t7 + t12;
+    t10 = (-C41) * t6;
+    t11 = C42 * t5;
+    t8 = t10 + t11;
+    t2 = t13 + t14;
+    t9 = t1 + t8;
+    t3 = C4 * t2;
+    t7 = t4 - t3;
+    t12 = C4 * t9;
+    t6 = t0 - t12;
+    t5 = t13 - t14;
+    t10 = C5 * t5;
+    t11 = t1 - t8;
+    t3 = C5 * t11;
+    t12 = t4 + t2;
+    t13 = t0 + t9;
+    t14 = t7 + t3;
+    t5 = t6 - t10;
+    t1 = t7 - t3;
+    t8 = t6 + t10;
+    re[18] = t12;
+    im[18] = t13;
+    re[78] = t14;
+    im[78] = t5;
+    re[138] = t1;
+    im[138] = t8;
+    t11 = X[76];
+    t4 = X[283];
+    t2 = C56 * t11;
+    t0 = C55 * t4;
+    t9 = t2 + t0;
+    t7 = (-C55) * t11;
+    t3 = C56 * t4;
+    t6 = t7 + t3;
+    t10 = X[196];
+    t12 = X[163];
+    t13 = C54 * t10;
+    t14 = C53 * t12;
+    t5 = t13 + t14;
+    t1 = (-C53) * t10;
+    t8 = C54 * t12;
+    t2 = t1 + t8;
+    t0 = X[316];
+    t11 = X[43];
+    t4 = C52 * t0;
+    t7 = C51 * t11;
+    t3 = t4 + t7;
+    t13 = (-C51) * t0;
+    t14 = C52 * t11;
+    t10 = t13 + t14;
+    t12 = t5 + t3;
+    t1 = t2 + t10;
+    t8 = C4 * t12;
+    t4 = t9 - t8;
+    t7 = C4 * t1;
+    t0 = t6 - t7;
+    t11 = t5 - t3;
+    t13 = C5 * t11;
+    t14 = t2 - t10;
+    t8 = C5 * t14;
+    t7 = t9 + t12;
+    t5 = t6 + t1;
+    t3 = t4 + t8;
+    t11 = t0 - t13;
+    t2 = t4 - t8;
+    t10 = t0 + t13;
+    t14 = t3 + t11;
+    t9 = C12 * t14;
+    t12 = t3 * (-C13);
+    t6 = t11 * C14;
+    t1 = t9 - t6;
+    t4 = t9 + t12;
+    t8 = t2 + t10;
+    t0 = C15 * t8;
+    t13 = t2 * (-C16);
+    t14 = t10 * (-C17);
+    t3 = t0 - t14;
+    t11 = t0 + t13;
+    re[38] = t7;
+    im[38] = t5;
+    re[98] = t1;
+    im[98] = t4;
+    re[158] = t3;
+    im[158] = t11;
+    t6 = X[116];
+    t9 = X[243];
+    t12 = C50 * t6;
+    t8 = C49 * t9;
+    t2 = t12 + t8;
+    t10 = (-C49) * t6;
+    t14 = C50 * t9;
+    t0 = t10 + t14;
+    t13 = X[236];
+    t7 = X[123];
+    t5 = C48 * t13;
+    t1 = C47 * t7;
+    t4 = t5 + t1;
+    t3 = (-C47) * t13;
+    t11 = C48 * t7;
+    t12 = t3 + t11;
+    t8 = X[356];
+    t6 = X[3];
+    t9 = C46 * t8;
+    t10 = C45 * t6;
+    t14 = t9 + t10;
+    t5 = (-C45) * t8;
+    t1 = C46 * t6;
+    t13 = t5 + t1;
+    t7 = t4 + t14;
+    t3 = t12 + t13;
+    t11 = C4 * t7;
+    t9 = t2 - t11;
+    t10 = C4 * t3;
+    t8 = t0 - t10;
+    t6 = t4 - t14;
+    t5 = C5 * t6;
+    t1 = t12 - t13;
+    t11 = C5 * t1;
+    t10 = t2 + t7;
+    t4 = t0 + t3;
+    t14 = t9 + t11;
+    t6 = t8 - t5;
+    t12 = t9 - t11;
+    t13 = t8 + t5;
+    t1 = t14 + t6;
+    t2 = C15 * t1;
+    t7 = t14 * (-C16);
+    t0 = t6 * (-C17);
+    t3 = t2 - t0;
+    t9 = t2 + t7;
+    t11 = t12 + t13;
+    t8 = (-C18) * t11;
+    t5 = t12 * C19;
+    t1 = t13 * (-C20);
+    t14 = t8 - t1;
+    t6 = t8 + t5;
+    re[58] = t10;
+    im[58] = t4;
+    re[118] = t3;
+    im[118] = t9;
+    re[178] = t14;
+    im[178] = t6;
+    t0 = re[18];
+    t2 = im[18];
+    t7 = re[38];
+    t11 = im[38];
+    t12 = re[58];
+    t13 = im[58];
+    t1 = t7 + t12;
+    t8 = t11 + t13;
+    t5 = C4 * t1;
+    t10 = t0 - t5;
+    t4 = C4 * t8;
+    t3 = t2 - t4;
+    t9 = t7 - t12;
+    t14 = C5 * t9;
+    t6 = t11 - t13;
+    t5 = C5 * t6;
+    t4 = t0 + t1;
+    t7 = t2 + t8;
+    t12 = t10 + t5;
+    t9 = t3 - t14;
+    t11 = t10 - t5;
+    t13 = t3 + t14;
+    re[18] = t4;
+    im[18] = t7;
+    re[38] = t12;
+    im[38] = t9;
+    re[58] = t11;
+    im[58] = t13;
+    t6 = re[78];
+    t0 = im[78];
+    t1 = re[98];
+    t2 = im[98];
+    t8 = re[118];
+    t10 = im[118];
+    t5 = t1 + t8;
+    t3 = t2 + t10;
+    t14 = C4 * t5;
+    t4 = t6 - t14;
+    t7 = C4 * t3;
+    t12 = t0 - t7;
+    t9 = t1 - t8;
+    t11 = C5 * t9;
+    t13 = t2 - t10;
+    t14 = C5 * t13;
+    t7 = t6 + t5;
+    t1 = t0 + t3;
+    t8 = t4 + t14;
+    t9 = t12 - t11;
+    t2 = t4 - t14;
+    t10 = t12 + t11;
+    re[78] = t7;
+    im[78] = t1;
+    re[98] = t8;
+    im[98] = t9;
+    re[118] = t2;
+    im[118] = t10;
+    t13 = re[138];
+    t6 = im[138];
+    t5 = re[158];
+    t0 = im[158];
+    t3 = re[178];
+    t4 = im[178];
+    t14 = t5 + t3;
+    t12 = t0 + t4;
+    t11 = C4 * t14;
+    t7 = t13 - t11;
+    t1 = C4 * t12;
+    t8 = t6 - t1;
+    t9 = t5 - t3;
+    t2 = C5 * t9;
+    t10 = t0 - t4;
+    t11 = C5 * t10;
+    t1 = t13 + t14;
+    t5 = t6 + t12;
+    t3 = t7 + t11;
+    t9 = t8 - t2;
+    t0 = t7 - t11;
+    t4 = t8 + t2;
+    re[138] = t1;
+    im[138] = t5;
+    re[158] = t3;
+    im[158] = t9;
+    re[178] = t0;
+    im[178] = t4;
+    t10 = X[108];
+    t13 = X[251];
+    t14 = C22 * t10;
+    t6 = C21 * t13;
+    t12 = t14 + t6;
+    t7 = (-C21) * t10;
+    t11 = C22 * t13;
+    t8 = t7 + t11;
+    t2 = X[228];
+    t1 = X[131];
+    t5 = C26 * t2;
+    t3 = C25 * t1;
+    t9 = t5 + t3;
+    t0 = (-C25) * t2;
+    t4 = C26 * t1;
+    t14 = t0 + t4;
+    t6 = X[348];
+    t10 = X[11];
+    t13 = C24 * t6;
+    t7 = C23 * t10;
+    t11 = t13 + t7;
+    t5 = (-C23) * t6;
+    t3 = C24 * t10;
+    t2 = t5 + t3;
+    t1 = t9 + t11;
+    t0 = t14 + t2;
+    t4 = C4 * t1;
+    t13 = t12 - t4;
+    t7 = C4 * t0;
+    t6 = t8 - t7;
+    t10 = t9 - t11;
+    t5 = C5 * t10;
+    t3 = t14 - t2;
+    t4 = C5 * t3;
+    t7 = t12 + t1;
+    t9 = t8 + t0;
+    t11 = t13 + t4;
+    t10 = t6 - t5;
+    t14 = t13 - t4;
+    t2 = t6 + t5;
+    re[54] = t7;
+    im[54] = t9;
+    re[114] = t11;
+    im[114] = t10;
+    re[174] = t14;
+    im[174] = t2;
+    t3 = X[148];
+    t12 = X[211];
+    t1 = C38 * t3;
+    t8 = C37 * t12;
+    t0 = t1 + t8;
+    t13 = (-C37) * t3;
+    t4 = C38 * t12;
+    t6 = t13 + t4;
+    t5 = X[268];
+    t7 = X[91];
+    t9 = C36 * t5;
+    t11 = C35 * t7;
+    t10 = t9 + t11;
+    t14 = (-C35) * t5;
+    t2 = C36 * t7;
+    t1 = t14 + t2;
+    t8 = X[28];
+    t3 = X[331];
+    t12 = C34 * t8;
+    t13 = C33 * t3;
+    t4 = t12 + t13;
+    t9 = (-C33) * t8;
+    t11 = C34 * t3;
+    t5 = t9 + t11;
+    t7 = t10 + t4;
+    t14 = t1 + t5;
+    t2 = C4 * t7;
+    t12 = t0 - t2;
+    t13 = C4 * t14;
+    t8 = t6 - t13;
+    t3 = t10 - t4;
+    t9 = C5 * t3;
+    t11 = t1 - t5;
+    t2 = C5 * t11;
+    t13 = t0 + t7;
+    t10 = t6 + t14;
+    t4 = t12 + t2;
+    t3 = t8 - t9;
+    t1 = t12 - t2;
+    t5 = t8 + t9;
+    t11 = t4 + t3;
+    t0 = C12 * t11;
+    t7 = t4 * (-C13);
+    t6 = t3 * C14;
+    t14 = t0 - t6;
+    t12 = t0 + t7;
+    t2 = t1 + t5;
+    t8 = C15 * t2;
+    t9 = t1 * (-C16);
+    t11 = t5 * (-C17);
+    t4 = t8 - t11;
+    t3 = t8 + t9;
+    re[74] = t13;
+    im[74] = t10;
+    re[134] = t14;
+    im[134] = t12;
+    re[14] = t4;
+    im[14] = t3;
+    t6 = X[188];
+    t0 = X[171];
+    t7 = C32 * t6;
+    t2 = C31 * t0;
+    t1 = t7 + t2;
+    t5 = (-C31) * t6;
+    t11 = C32 * t0;
+    t8 = t5 + t11;
+    t9 = X[308];
+    t13 = X[51];
+    t10 = C30 * t9;
+    t14 = C29 * t13;
+    t12 = t10 + t14;
+    t4 = (-C29) * t9;
+    t3 = C30 * t13;
+    t7 = t4 + t3;
+    t2 = X[68];
+    t6 = X[291];
+    t0 = C28 * t2;
+    t5 = C27 * t6;
+    t11 = t0 + t5;
+    t10 = (-C27) * t2;
+    t14 = C28 * t6;
+    t9 = t10 + t14;
+    t13 = t12 + t11;
+    t4 = t7 + t9;
+    t3 = C4 * t13;
+    t0 = t1 - t3;
+    t5 = C4 * t4;
+    t2 = t8 - t5;
+    t6 = t12 - t11;
+    t10 = C5 * t6;
+    t14 = t7 - t9;
+    t3 = C5 * t14;
+    t5 = t1 + t13;
+    t12 = t8 + t4;
+    t11 = t0 + t3;
+    t6 = t2 - t10;
+    t7 = t0 - t3;
+    t9 = t2 + t10;
+    t14 = t11 + t6;
+    t1 = C15 * t14;
+    t13 = t11 * (-C16);
+    t8 = t6 * (-C17);
+    t4 = t1 - t8;
+    t0 = t1 + t13;
+    t3 = t7 + t9;
+    t2 = (-C18) * t3;
+    t10 = t7 * C19;
+    t14 = t9 * (-C20);
+    t11 = t2 - t14;
+    t6 = t2 + t10;
+    re[94] = t5;
+    im[94] = t12;
+    re[154] = t4;
+    im[154] = t0;
+    re[34] = t11;
+    im[34] = t6;
+    t8 = re[54];
+    t1 = im[54];
+    t13 = re[74];
+    t3 = im[74];
+    t7 = re[94];
+    t9 = im[94];
+    t14 = t13 + t7;
+    t2 = t3 + t9;
+    t10 = C4 * t14;
+    t5 = t8 - t10;
+    t12 = C4 * t2;
+    t4 = t1 - t12;
+    t0 = t13 - t7;
+    t11 = C5 * t0;
+    t6 = t3 - t9;
+    t10 = C5 * t6;
+    t12 = t8 + t14;
+    t13 = t1 + t2;
+    t7 = t5 + t10;
+    t0 = t4 - t11;
+    t3 = t5 - t10;
+    t9 = t4 + t11;
+    re[54] = t12;
+    im[54] = t13;
+    re[74] = t7;
+    im[74] = t0;
+    re[94] = t3;
+    im[94] = t9;
+    t6 = re[114];
+    t8 = im[114];
+    t14 = re[134];
+    t1 = im[134];
+    t2 = re[154];
+    t5 = im[154];
+    t10 = t14 + t2;
+    t4 = t1 + t5;
+    t11 = C4 * t10;
+    t12 = t6 - t11;
+    t13 = C4 * t4;
+    t7 = t8 - t13;
+    t0 = t14 - t2;
+    t3 = C5 * t0;
+    t9 = t1 - t5;
+    t11 = C5 * t9;
+    t13 = t6 + t10;
+    t14 = t8 + t4;
+    t2 = t12 + t11;
+    t0 = t7 - t3;
+    t1 = t12 - t11;
+    t5 = t7 + t3;
+    re[114] = t13;
+    im[114] = t14;
+    re[134] = t2;
+    im[134] = t0;
+    re[154] = t1;
+    im[154] = t5;
+    t9 = re[174];
+    t6 = im[174];
+    t10 = re[14];
+    t8 = im[14];
+    t4 = re[34];
+    t12 = im[34];
+    t11 = t10 + t4;
+    t7 = t8 + t12;
+    t3 = C4 * t11;
+    t13 = t9 - t3;
+    t14 = C4 * t7;
+    t2 = t6 - t14;
+    t0 = t10 - t4;
+    t1 = C5 * t0;
+    t5 = t8 - t12;
+    t3 = C5 * t5;
+    t14 = t9 + t11;
+    t10 = t6 + t7;
+    t4 = t13 + t3;
+    t0 = t2 - t1;
+    t8 = t13 - t3;
+    t12 = t2 + t1;
+    re[174] = t14;
+    im[174] = t10;
+    re[14] = t4;
+    im[14] = t0;
+    re[34] = t8;
+    im[34] = t12;
+    t5 = re[90];
+    t9 = im[90];
+    t11 = re[126];
+    t6 = im[126];
+    t7 = re[162];
+    t13 = im[162];
+    t3 = re[18];
+    t2 = im[18];
+    t1 = re[54];
+    t14 = im[54];
+    t10 = t11 + t1;
+    t4 = t6 + t14;
+    t0 = t7 + t3;
+    t8 = t13 + t2;
+    t12 = t11 - t1;
+    t11 = t6 - t14;
+    t1 = t7 - t3;
+    t6 = t13 - t2;
+    t14 = t10 + t0;
+    t7 = t4 + t8;
+    t3 = t10 - t0;
+    t13 = C57 * t3;
+    t2 = t4 - t8;
+    t10 = C57 * t2;
+    t0 = C58 * t14;
+    t3 = t5 - t0;
+    t4 = C58 * t7;
+    t8 = t9 - t4;
+    t2 = t3 + t13;
+    t0 = t8 + t10;
+    t4 = t3 - t13;
+    t3 = t8 - t10;
+    t13 = C59 * t12;
+    t8 = C60 * t1;
+    t10 = t13 + t8;
+    t13 = C59 * t11;
+    t8 = C60 * t6;
+    t13 = t13 + t8;
+    t8 = C60 * t12;
+    t12 = C59 * t1;
+    t1 = t8 - t12;
+    t8 = C60 * t11;
+    t12 = C59 * t6;
+    t11 = t8 - t12;
+    t6 = t5 + t14;
+    t8 = t9 + t7;
+    t12 = t2 + t13;
+    t5 = t0 - t10;
+    t14 = t4 + t11;
+    t9 = t3 - t1;
+    t7 = t4 - t11;
+    t4 = t3 + t1;
+    t11 = t2 - t13;
+    t3 = t0 + t10;
+    re[90] = t6;
+    im[90] = t8;
+    re[126] = t12;
+    im[126] = t5;
+    re[162] = t14;
+    im[162] = t9;
+    re[18] = t7;
+    im[18] = t4;
+    re[54] = t11;
+    im[54] = t3;
+    t1 = re[150];
+    t2 = im[150];
+    t13 = re[6];
+    t0 = im[6];
+    t10 = re[42];
+    t6 = im[42];
+    t8 = re[78];
+    t12 = im[78];
+    t5 = re[114];
+    t14 = im[114];
+    t9 = t13 + t5;
+    t7 = t0 + t14;
+    t4 = t10 + t8;
+    t11 = t6 + t12;
+    t3 = t13 - t5;
+    t13 = t0 - t14;
+    t5 = t10 - t8;
+    t0 = t6 - t12;
+    t14 = t9 + t4;
+    t10 = t7 + t11;
+    t8 = t9 - t4;
+    t6 = C57 * t8;
+    t12 = t7 - t11;
+    t9 = C57 * t12;
+    t4 = C58 * t14;
+    t8 = t1 - t4;
+    t7 = C58 * t10;
+    t11 = t2 - t7;
+    t12 = t8 + t6;
+    t4 = t11 + t9;
+    t7 = t8 - t6;
+    t8 = t11 - t9;
+    t6 = C59 * t3;
+    t11 = C60 * t5;
+    t9 = t6 + t11;
+    t6 = C59 * t13;
+    t11 = C60 * t0;
+    t6 = t6 + t11;
+    t11 = C60 * t3;
+    t3 = C59 * t5;
+    t5 = t11 - t3;
+    t11 = C60 * t13;
+    t3 = C59 * t0;
+    t13 = t11 - t3;
+    t0 = t1 + t14;
+    t11 = t2 + t10;
+    t3 = t12 + t6;
+    t1 = t4 - t9;
+    t14 = t7 + t13;
+    t2 = t8 - t5;
+    t10 = t7 - t13;
+    t7 = t8 + t5;
+    t13 = t12 - t6;
+    t8 = t4 + t9;
+    re[150] = t0;
+    im[150] = t11;
+    re[6] = t3;
+    im[6] = t1;
+    re[42] = t14;
+    im[42] = t2;
+    re[78] = t10;
+    im[78] = t7;
+    re[114] = t13;
+    im[114] = t8;
+    t5 = re[30];
+    t12 = im[30];
+    t6 = re[66];
+    t4 = im[66];
+    t9 = re[102];
+    t0 = im[102];
+    t11 = re[138];
+    t3 = im[138];
+    t1 = re[174];
+    t14 = im[174];
+    t2 = t6 + t1;
+    t10 = t4 + t14;
+    t7 = t9 + t11;
+    t13 = t0 + t3;
+    t8 = t6 - t1;
+    t6 = t4 - t14;
+    t1 = t9 - t11;
+    t4 = t0 - t3;
+    t14 = t2 + t7;
+    t9 = t10 + t13;
+    t11 = t2 - t7;
+    t0 = C57 * t11;
+    t3 = t10 - t13;
+    t2 = C57 * t3;
+    t7 = C58 * t14;
+    t11 = t5 - t7;
+    t10 = C58 * t9;
+    t13 = t12 - t10;
+    t3 = t11 + t0;
+    t7 = t13 + t2;
+    t10 = t11 - t0;
+    t11 = t13 - t2;
+    t0 = C59 * t8;
+    t13 = C60 * t1;
+    t2 = t0 + t13;
+    t0 = C59 * t6;
+    t13 = C60 * t4;
+    t0 = t0 + t13;
+    t13 = C60 * t8;
+    t8 = C59 * t1;
+    t1 = t13 - t8;
+    t13 = C60 * t6;
+    t8 = C59 * t4;
+    t6 = t13 - t8;
+    t4 = t5 + t14;
+    t13 = t12 + t9;
+    t8 = t3 + t0;
+    t5 = t7 - t2;
+    t14 = t10 + t6;
+    t12 = t11 - t1;
+    t9 = t10 - t6;
+    t10 = t11 + t1;
+    t6 = t3 - t0;
+    t11 = t7 + t2;
+    re[30] = t4;
+    im[30] = t13;
+    re[66] = t8;
+    im[66] = t5;
+    re[102] = t14;
+    im[102] = t12;
+    re[138] = t9;
+    im[138] = t10;
+    re[174] = t6;
+    im[174] = t11;
+    t1 = re[110];
+    t3 = im[110];
+    t0 = re[146];
+    t7 = im[146];
+    t2 = re[2];
+    t4 = im[2];
+    t13 = re[38];
+    t8 = im[38];
+    t5 = re[74];
+    t14 = im[74];
+    t12 = t0 + t5;
+    t9 = t7 + t14;
+    t10 = t2 + t13;
+    t6 = t4 + t8;
+    t11 = t0 - t5;
+    t0 = t7 - t14;
+    t5 = t2 - t13;
+    t7 = t4 - t8;
+    t14 = t12 + t10;
+    t2 = t9 + t6;
+    t13 = t12 - t10;
+    t4 = C57 * t13;
+    t8 = t9 - t6;
+    t12 = C57 * t8;
+    t10 = C58 * t14;
+    t13 = t1 - t10;
+    t9 = C58 * t2;
+    t6 = t3 - t9;
+    t8 = t13 + t4;
+    t10 = t6 + t12;
+    t9 = t13 - t4;
+    t13 = t6 - t12;
+    t4 = C59 * t11;
+    t6 = C60 * t5;
+    t12 = t4 + t6;
+    t4 = C59 * t0;
+    t6 = C60 * t7;
+    t4 = t4 + t6;
+    t6 = C60 * t11;
+    t11 = C59 * t5;
+    t5 = t6 - t11;
+    t6 = C60 * t0;
+    t11 = C59 * t7;
+    t0 = t6 - t11;
+    t7 = t1 + t14;
+    t6 = t3 + t2;
+    t11 = t8 + t4;
+    t1 = t10 - t12;
+    t14 = t9 + t0;
+    t3 = t13 - t5;
+    t2 = t9 - t0;
+    t9 = t13 + t5;
+    t0 = t8 - t4;
+    t13 = t10 + t12;
+    re[110] = t7;
+    im[110] = t6;
+    re[146] = t11;
+    im[146] = t1;
+    re[2] = t14;
+    im[2] = t3;
+    re[38] = t2;
+    im[38] = t9;
+    re[74] = t0;
+    im[74] = t13;
+    t5 = re[170];
+    t8 = im[170];
+    t4 = re[26];
+    t10 = im[26];
+    t12 = re[62];
+    t7 = im[62];
+    t6 = re[98];
+    t11 = im[98];
+    t1 = re[134];
+    t14 = im[134];
+    t3 = t4 + t1;
+    t2 = t10 + t14;
+    t9 = t12 + t6;
+    t0 = t7 + t11;
+    t13 = t4 - t1;
+    t4 = t10 - t14;
+    t1 = t12 - t6;
+    t10 = t7 - t11;
+    t14 = t3 + t9;
+    t12 = t2 + t0;
+    t6 = t3 - t9;
+    t7 = C57 * t6;
+    t11 = t2 - t0;
+    t3 = C57 * t11;
+    t9 = C58 * t14;
+    t6 = t5 - t9;
+    t2 = C58 * t12;
+    t0 = t8 - t2;
+    t11 = t6 + t7;
+    t9 = t0 + t3;
+    t2 = t6 - t7;
+    t6 = t0 - t3;
+    t7 = C59 * t13;
+    t0 = C60 * t1;
+    t3 = t7 + t0;
+    t7 = C59 * t4;
+    t0 = C60 * t10;
+    t7 = t7 + t0;
+    t0 = C60 * t13;
+    t13 = C59 * t1;
+    t1 = t0 - t13;
+    t0 = C60 * t4;
+    t13 = C59 * t10;
+    t4 = t0 - t13;
+    t10 = t5 + t14;
+    t0 = t8 + t12;
+    t13 = t11 + t7;
+    t5 = t9 - t3;
+    t14 = t2 + t4;
+    t8 = t6 - t1;
+    t12 = t2 - t4;
+    t2 = t6 + t1;
+    t4 = t11 - t7;
+    t6 = t9 + t3;
+    re[170] = t10;
+    im[170] = t0;
+    re[26] = t13;
+    im[26] = t5;
+    re[62] = t14;
+    im[62] = t8;
+    re[98] = t12;
+    im[98] = t2;
+    re[134] = t4;
+    im[134] = t6;
+    t1 = re[50];
+    t11 = im[50];
+    t7 = re[86];
+    t9 = im[86];
+    t3 = re[122];
+    t10 = im[122];
+    t0 = re[158];
+    t13 = im[158];
+    t5 = re[14];
+    t14 = im[14];
+    t8 = t7 + t5;
+    t12 = t9 + t14;
+    t2 = t3 + t0;
+    t4 = t10 + t13;
+    t6 = t7 - t5;
+    t7 = t9 - t14;
+    t5 = t3 - t0;
+    t9 = t10 - t13;
+    t14 = t8 + t2;
+    t3 = t12 + t4;
+    t0 = t8 - t2;
+    t10 = C57 * t0;
+    t13 = t12 - t4;
+    t8 = C57 * t13;
+    t2 = C58 * t14;
+    t0 = t1 - t2;
+    t12 = C58 * t3;
+    t4 = t11 - t12;
+    t13 = t0 + t10;
+    t2 = t4 + t8;
+    t12 = t0 - t10;
+    t0 = t4 - t8;
+    t10 = C59 * t6;
+    t4 = C60 * t5;
+    t8 = t10 + t4;
+    t10 = C59 * t7;
+    t4 = C60 * t9;
+    t10 = t10 + t4;
+    t4 = C60 * t6;
+    t6 = C59 * t5;
+    t5 = t4 - t6;
+    t4 = C60 * t7;
+    t6 = C59 * t9;
+    t7 = t4 - t6;
+    t9 = t1 + t14;
+    t4 = t11 + t3;
+    t6 = t13 + t10;
+    t1 = t2 - t8;
+    t14 = t12 + t7;
+    t11 = t0 - t5;
+    t3 = t12 - t7;
+    t12 = t0 + t5;
+    t7 = t13 - t10;
+    t0 = t2 + t8;
+    re[50] = t9;
+    im[50] = t4;
+    re[86] = t6;
+    im[86] = t1;
+    re[122] = t14;
+    im[122] = t11;
+    re[158] = t3;
+    im[158] = t12;
+    re[14] = t7;
+    im[14] = t0;
+    t5 = re[130];
+    t13 = im[130];
+    t10 = re[166];
+    t2 = im[166];
+    t8 = re[22];
+    t9 = im[22];
+    t4 = re[58];
+    t6 = im[58];
+    t1 = re[94];
+    t14 = im[94];
+    t11 = t10 + t1;
+    t3 = t2 + t14;
+    t12 = t8 + t4;
+    t7 = t9 + t6;
+    t0 = t10 - t1;
+    t10 = t2 - t14;
+    t1 = t8 - t4;
+    t2 = t9 - t6;
+    t14 = t11 + t12;
+    t8 = t3 + t7;
+    t4 = t11 - t12;
+    t9 = C57 * t4;
+    t6 = t3 - t7;
+    t11 = C57 * t6;
+    t12 = C58 * t14;
+    t4 = t5 - t12;
+    t3 = C58 * t8;
+    t7 = t13 - t3;
+    t6 = t4 + t9;
+    t12 = t7 + t11;
+    t3 = t4 - t9;
+    t4 = t7 - t11;
+    t9 = C59 * t0;
+    t7 = C60 * t1;
+    t11 = t9 + t7;
+    t9 = C59 * t10;
+    t7 = C60 * t2;
+    t9 = t9 + t7;
+    t7 = C60 * t0;
+    t0 = C59 * t1;
+    t1 = t7 - t0;
+    t7 = C60 * t10;
+    t0 = C59 * t2;
+    t10 = t7 - t0;
+    t2 = t5 + t14;
+    t7 = t13 + t8;
+    t0 = t6 + t9;
+    t5 = t12 - t11;
+    t14 = t3 + t10;
+    t13 = t4 - t1;
+    t8 = t3 - t10;
+    t3 = t4 + t1;
+    t10 = t6 - t9;
+    t4 = t12 + t11;
+    re[130] = t2;
+    im[130] = t7;
+    re[166] = t0;
+    im[166] = t5;
+    re[22] = t14;
+    im[22] = t13;
+    re[58] = t8;
+    im[58] = t3;
+    re[94] = t10;
+    im[94] = t4;
+    t1 = re[10];
+    t6 = im[10];
+    t9 = re[46];
+    t12 = im[46];
+    t11 = re[82];
+    t2 = im[82];
+    t7 = re[118];
+    t0 = im[118];
+    t5 = re[154];
+    t14 = im[154];
+    t13 = t9 + t5;
+    t8 = t12 + t14;
+    t3 = t11 + t7;
+    t10 = t2 + t0;
+    t4 = t9 - t5;
+    t9 = t12 - t14;
+    t5 = t11 - t7;
+    t12 = t2 - t0;
+    t14 = t13 + t3;
+    t11 = t8 + t10;
+    t7 = t13 - t3;
+    t2 = C57 * t7;
+    t0 = t8 - t10;
+    t13 = C57 * t0;
+    t3 = C58 * t14;
+    t7 = t1 - t3;
+    t8 = C58 * t11;
+    t10 = t6 - t8;
+    t0 = t7 + t2;
+    t3 = t10 + t13;
+    t8 = t7 - t2;
+    t7 = t10 - t13;
+    t2 = C59 * t4;
+    t10 = C60 * t5;
+    t13 = t2 + t10;
+    t2 = C59 * t9;
+    t10 = C60 * t12;
+    t2 = t2 + t10;
+    t10 = C60 * t4;
+    t4 = C59 * t5;
+    t5 = t10 - t4;
+    t10 = C60 * t9;
+    t4 = C59 * t12;
+    t9 = t10 - t4;
+    t12 = t1 + t14;
+    t10 = t6 + t11;
+    t4 = t0 + t2;
+    t1 = t3 - t13;
+    t14 = t8 + t9;
+    t6 = t7 - t5;
+    t11 = t8 - t9;
+    t8 = t7 + t5;
+    t9 = t0 - t2;
+    t7 = t3 + t13;
+    re[10] = t12;
+    im[10] = t10;
+    re[46] = t4;
+    im[46] = t1;
+    re[82] = t14;
+    im[82] = t6;
+    re[118] = t11;
+    im[118] = t8;
+    re[154] = t9;
+    im[154] = t7;
+    t5 = re[70];
+    t0 = im[70];
+    t2 = re[106];
+    t3 = im[106];
+    t13 = re[142];
+    t12 = im[142];
+    t10 = re[178];
+    t4 = im[178];
+    t1 = re[34];
+    t14 = im[34];
+    t6 = t2 + t1;
+    t11 = t3 + t14;
+    t8 = t13 + t10;
+    t9 = t12 + t4;
+    t7 = t2 - t1;
+    t2 = t3 - t14;
+    t1 = t13 - t10;
+    t3 = t12 - t4;
+    t14 = t6 + t8;
+    t13 = t11 + t9;
+    t10 = t6 - t8;
+    t12 = C57 * t10;
+    t4 = t11 - t9;
+    t6 = C57 * t4;
+    t8 = C58 * t14;
+    t10 = t5 - t8;
+    t11 = C58 * t13;
+    t9 = t0 - t11;
+    t4 = t10 + t12;
+    t8 = t9 + t6;
+    t11 = t10 - t12;
+    t10 = t9 - t6;
+    t12 = C59 * t7;
+    t9 = C60 * t1;
+    t6 = t12 + t9;
+    t12 = C59 * t2;
+    t9 = C60 * t3;
+    t12 = t12 + t9;
+    t9 = C60 * t7;
+    t7 = C59 * t1;
+    t1 = t9 - t7;
+    t9 = C60 * t2;
+    t7 = C59 * t3;
+    t2 = t9 - t7;
+    t3 = t5 + t14;
+    t9 = t0 + t13;
+    t7 = t4 + t12;
+    t5 = t8 - t6;
+    t14 = t11 + t2;
+    t0 = t10 - t1;
+    t13 = t11 - t2;
+    t11 = t10 + t1;
+    t2 = t4 - t12;
+    t10 = t8 + t6;
+    re[70] = t3;
+    im[70] = t9;
+    re[106] = t7;
+    im[106] = t5;
+    re[142] = t14;
+    im[142] = t0;
+    re[178] = t13;
+    im[178] = t11;
+    re[34] = t2;
+    im[34] = t10;
+}
+
+/**
+ *  Part 4 of ApplyWindowedIMDCT_W75_360().
+ * 
+ *  @param {Number[]} X 
+ *    - The input block (360 points).
+ *  @param {Number[]} y 
+ *    - The array that would contain the output block (720 points).
+ *  @param {Number[]} re 
+ *    - The scratch buffer (real part, 180 points).
+ *  @param {Number[]} im 
+ *    - The scratch buffer (imaginary part, 180 points).
+ */
+function ApplyWindowedIMDCT_W75_360_Part4(X, y, re, im) {
+    let t0, t1, t10, t11, t12, t13, t14, t2, t3, t4, t5, t6, t7, t8, t9;
+    const C0 = 0.3826834323650898;
+    const C1 = 0.9238795325112867;
+    const C2 = 0.9914448613738104;
+    const C3 = 0.13052619222005157;
+    const C4 = 0.7933533402912352;
+    const C5 = 0.6087614290087207;
+    const C6 = 0.5;
+    const C7 = 0.8660254037844386;
+    const C8 = 0.21643961393810288;
+    const C9 = 0.9762960071199334;
+    const C10 = 0.9537169507482269;
+    const C11 = 0.3007057995042731;
+    const C12 = 0.6755902076156601;
+    const C13 = 0.7372773368101241;
+    const C14 = 0.766044443118978;
+    const C15 = 1.4088320528055172;
+    const C16 = 0.12325683343243876;
+    const C17 = 0.17364817766693033;
+    const C18 = 1.1584559306791384;
+    const C19 = 0.8111595753452777;
+    const C20 = 0.043619387365336;
+    const C21 = 0.9990482215818578;
+    const C22 = 0.8870108331782217;
+    const C23 = 0.4617486132350339;
+    const C24 = 0.5372996083468239;
+    const C25 = 0.8433914458128857;
+    const C26 = 0.9396926207859084;
+    const C27 = 0.5976724774602398;
+    const C28 = 1.281712764111577;
+    const C29 = 0.07845909572784494;
+    const C30 = 0.996917333733128;
+    const C31 = 0.9025852843498606;
+    const C32 = 0.4305110968082951;
+    const C33 = 0.5664062369248328;
+    const C34 = 0.8241261886220156;
+    const C35 = 0.9953961983671789;
+    const C36 = 0.09584575252022398;
+    const C37 = 0.8141155183563192;
+    const C38 = 0.5807029557109398;
+    const C39 = 0.41469324265623897;
+    const C40 = 0.9099612708765432;
+    const C41 = 0.963630453208623;
+    const C42 = 0.26723837607825685;
+    const C43 = 0.7009092642998509;
+    const C44 = 0.7132504491541816;
+    const C45 = 0.25038000405444144;
+    const C46 = 0.9681476403781077;
+    const C47 = 0.9723699203976766;
+    const C48 = 0.2334453638559054;
+    const C49 = 0.7253743710122876;
+    const C50 = 0.6883545756937539;
+    const C51 = 0.2840153447039226;
+    const C52 = 0.958819734868193;
+    const C53 = 0.917060074385124;
+    const C54 = 0.3987490689252462;
+    const C55 = 0.5948227867513413;
+    const C56 = 0.8038568606172173;
+    const C57 = 0.11320321376790671;
+    const C58 = 0.9935718556765875;
+    const C59 = 0.8338858220671682;
+    const C60 = 0.5519369853120581;
+    const C61 = 0.44619781310980877;
+    const C62 = 0.8949343616020251;
+    const C63 = 0.9981347984218669;
+    const C64 = 0.06104853953485687;
+    const C65 = 0.8526401643540922;
+    const C66 = 0.5224985647159488;
+    const C67 = 0.4771587602596084;
+    const C68 = 0.8788171126619654;
+    const C69 = 0.9996573249755573;
+    const C70 = 0.02617694830787315;
+    const C71 = 0.7489557207890022;
+    const C72 = 0.6626200482157375;
+    const C73 = 0.31730465640509214;
+    const C74 = 0.9483236552061993;
+    const C75 = 0.9799247046208296;
+    const C76 = 0.19936793441719716;
+    const C77 = 0.6225146366376195;
+    const C78 = 0.7826081568524139;
+    const C79 = 0.1478094111296106;
+    const C80 = 0.9890158633619168;
+    const C81 = 0.9304175679820246;
+    const C82 = 0.3665012267242973;
+    const C83 = 0.6494480483301837;
+    const C84 = 0.7604059656000309;
+    const C85 = 0.18223552549214747;
+    const C86 = 0.9832549075639546;
+    const C87 = 0.9426414910921784;
+    const C88 = 0.33380685923377096;
+    const C89 = 0.5075383629607041;
+    const C90 = 0.8616291604415258;
+    const C91 = 0.008726535498373935;
+    const C92 = 0.9999619230641713;
+    const C93 = 0.8703556959398997;
+    const C94 = 0.49242356010346705;
+    const C95 = 0.35020738125946743;
+    const C96 = 0.9366721892483976;
+    const C97 = 0.9862856015372314;
+    const C98 = 0.16504760586067765;
+    const C99 = 0.77162458338772;
+    const C100 = 0.636078220277764;
+    const C101 = 0.5590169943749475;
+    const C102 = 0.25;
+    const C103 = 0.9510565162951535;
+    const C104 = 0.5877852522924731;
+    const C105 = 0.9999976201773518;
+    const C106 = 0.0021816598343367697;
+    const C107 = 0.9230424487681941;
+    const C108 = 0.384698112514236;
+    const C109 = 0.7055624319347131;
+    const C110 = 0.7086477648609169;
+    const C111 = 0.38066693077854463;
+    const C112 = 0.9247122189155081;
+    const C113 = 0.37258290214410295;
+    const C114 = 0.9279989121921846;
+    const C115 = 0.9999405050001497;
+    const C116 = 0.010908091494182374;
+    const C117 = 0.9196502204050923;
+    const C118 = 0.39273842708457407;
+    const C119 = 0.6993515264033671;
+    const C120 = 0.7147778973340464;
+    t1 = X[270];
+    t4 = X[89];
+    t12 = C0 * t1;
+    t8 = C1 * t4;
+    t6 = t12 + t8;
+    t3 = (-C1) * t1;
+    t9 = C0 * t4;
+    t7 = t3 + t9;
+    t5 = X[30];
+    t14 = X[329];
+    t0 = C2 * t5;
+    t13 = C3 * t14;
+    t11 = t0 + t13;
+    t2 = (-C3) * t5;
+    t10 = C2 * t14;
+    t12 = t2 + t10;
+    t8 = X[150];
+    t1 = X[209];
+    t4 = C4 * t8;
+    t3 = C5 * t1;
+    t9 = t4 + t3;
+    t0 = (-C5) * t8;
+    t13 = C4 * t1;
+    t5 = t0 + t13;
+    t14 = t11 + t9;
+    t2 = t12 + t5;
+    t10 = C6 * t14;
+    t4 = t6 - t10;
+    t3 = C6 * t2;
+    t8 = t7 - t3;
+    t1 = t11 - t9;
+    t0 = C7 * t1;
+    t13 = t12 - t5;
+    t10 = C7 * t13;
+    t3 = t6 + t14;
+    t11 = t7 + t2;
+    t9 = t4 + t10;
+    t1 = t8 - t0;
+    t12 = t4 - t10;
+    t5 = t8 + t0;
+    re[135] = t3;
+    im[135] = t11;
+    re[15] = t9;
+    im[15] = t1;
+    re[75] = t12;
+    im[75] = t5;
+    t13 = X[310];
+    t6 = X[49];
+    t14 = C8 * t13;
+    t7 = C9 * t6;
+    t2 = t14 + t7;
+    t4 = (-C9) * t13;
+    t10 = C8 * t6;
+    t8 = t4 + t10;
+    t0 = X[70];
+    t3 = X[289];
+    t11 = C10 * t0;
+    t9 = C11 * t3;
+    t1 = t11 + t9;
+    t12 = (-C11) * t0;
+    t5 = C10 * t3;
+    t14 = t12 + t5;
+    t7 = X[190];
+    t13 = X[169];
+    t6 = C12 * t7;
+    t4 = C13 * t13;
+    t10 = t6 + t4;
+    t11 = (-C13) * t7;
+    t9 = C12 * t13;
+    t0 = t11 + t9;
+    t3 = t1 + t10;
+    t12 = t14 + t0;
+    t5 = C6 * t3;
+    t6 = t2 - t5;
+    t4 = C6 * t12;
+    t7 = t8 - t4;
+    t13 = t1 - t10;
+    t11 = C7 * t13;
+    t9 = t14 - t0;
+    t5 = C7 * t9;
+    t4 = t2 + t3;
+    t1 = t8 + t12;
+    t10 = t6 + t5;
+    t13 = t7 - t11;
+    t14 = t6 - t5;
+    t0 = t7 + t11;
+    t9 = t10 + t13;
+    t2 = C14 * t9;
+    t3 = t10 * (-C15);
+    t8 = t13 * C16;
+    t12 = t2 - t8;
+    t6 = t2 + t3;
+    t5 = t14 + t0;
+    t7 = C17 * t5;
+    t11 = t14 * (-C18);
+    t9 = t0 * (-C19);
+    t10 = t7 - t9;
+    t13 = t7 + t11;
+    re[155] = t4;
+    im[155] = t1;
+    re[35] = t12;
+    im[35] = t6;
+    re[95] = t10;
+    im[95] = t13;
+    t8 = X[350];
+    t2 = X[9];
+    t3 = C20 * t8;
+    t5 = C21 * t2;
+    t14 = t3 + t5;
+    t0 = (-C21) * t8;
+    t9 = C20 * t2;
+    t7 = t0 + t9;
+    t11 = X[110];
+    t4 = X[249];
+    t1 = C22 * t11;
+    t12 = C23 * t4;
+    t6 = t1 + t12;
+    t10 = (-C23) * t11;
+    t13 = C22 * t4;
+    t3 = t10 + t13;
+    t5 = X[230];
+    t8 = X[129];
+    t2 = C24 * t5;
+    t0 = C25 * t8;
+    t9 = t2 + t0;
+    t1 = (-C25) * t5;
+    t12 = C24 * t8;
+    t11 = t1 + t12;
+    t4 = t6 + t9;
+    t10 = t3 + t11;
+    t13 = C6 * t4;
+    t2 = t14 - t13;
+    t0 = C6 * t10;
+    t5 = t7 - t0;
+    t8 = t6 - t9;
+    t1 = C7 * t8;
+    t12 = t3 - t11;
+    t13 = C7 * t12;
+    t0 = t14 + t4;
+    t6 = t7 + t10;
+    t9 = t2 + t13;
+    t8 = t5 - t1;
+    t3 = t2 - t13;
+    t11 = t5 + t1;
+    t12 = t9 + t8;
+    t14 = C17 * t12;
+    t4 = t9 * (-C18);
+    t7 = t8 * (-C19);
+    t10 = t14 - t7;
+    t2 = t14 + t4;
+    t13 = t3 + t11;
+    t5 = (-C26) * t13;
+    t1 = t3 * C27;
+    t12 = t11 * (-C28);
+    t9 = t5 - t12;
+    t8 = t5 + t1;
+    re[175] = t0;
+    im[175] = t6;
+    re[55] = t10;
+    im[55] = t2;
+    re[115] = t9;
+    im[115] = t8;
+    t7 = re[135];
+    t14 = im[135];
+    t4 = re[155];
+    t13 = im[155];
+    t3 = re[175];
+    t11 = im[175];
+    t12 = t4 + t3;
+    t5 = t13 + t11;
+    t1 = C6 * t12;
+    t0 = t7 - t1;
+    t6 = C6 * t5;
+    t10 = t14 - t6;
+    t2 = t4 - t3;
+    t9 = C7 * t2;
+    t8 = t13 - t11;
+    t1 = C7 * t8;
+    t6 = t7 + t12;
+    t4 = t14 + t5;
+    t3 = t0 + t1;
+    t2 = t10 - t9;
+    t13 = t0 - t1;
+    t11 = t10 + t9;
+    re[135] = t6;
+    im[135] = t4;
+    re[155] = t3;
+    im[155] = t2;
+    re[175] = t13;
+    im[175] = t11;
+    t8 = re[15];
+    t7 = im[15];
+    t12 = re[35];
+    t14 = im[35];
+    t5 = re[55];
+    t0 = im[55];
+    t1 = t12 + t5;
+    t10 = t14 + t0;
+    t9 = C6 * t1;
+    t6 = t8 - t9;
+    t4 = C6 * t10;
+    t3 = t7 - t4;
+    t2 = t12 - t5;
+    t13 = C7 * t2;
+    t11 = t14 - t0;
+    t9 = C7 * t11;
+    t4 = t8 + t1;
+    t12 = t7 + t10;
+    t5 = t6 + t9;
+    t2 = t3 - t13;
+    t14 = t6 - t9;
+    t0 = t3 + t13;
+    re[15] = t4;
+    im[15] = t12;
+    re[35] = t5;
+    im[35] = t2;
+    re[55] = t14;
+    im[55] = t0;
+    t11 = re[75];
+    t8 = im[75];
+    t1 = re[95];
+    t7 = im[95];
+    t10 = re[115];
+    t6 = im[115];
+    t9 = t1 + t10;
+    t3 = t7 + t6;
+    t13 = C6 * t9;
+    t4 = t11 - t13;
+    t12 = C6 * t3;
+    t5 = t8 - t12;
+    t2 = t1 - t10;
+    t14 = C7 * t2;
+    t0 = t7 - t6;
+    t13 = C7 * t0;
+    t12 = t11 + t9;
+    t1 = t8 + t3;
+    t10 = t4 + t13;
+    t2 = t5 - t14;
+    t7 = t4 - t13;
+    t6 = t5 + t14;
+    re[75] = t12;
+    im[75] = t1;
+    re[95] = t10;
+    im[95] = t2;
+    re[115] = t7;
+    im[115] = t6;
+    t0 = X[342];
+    t11 = X[17];
+    t9 = C29 * t0;
+    t8 = C30 * t11;
+    t3 = t9 + t8;
+    t4 = (-C30) * t0;
+    t13 = C29 * t11;
+    t5 = t4 + t13;
+    t14 = X[102];
+    t12 = X[257];
+    t1 = C31 * t14;
+    t10 = C32 * t12;
+    t2 = t1 + t10;
+    t7 = (-C32) * t14;
+    t6 = C31 * t12;
+    t9 = t7 + t6;
+    t8 = X[222];
+    t0 = X[137];
+    t11 = C33 * t8;
+    t4 = C34 * t0;
+    t13 = t11 + t4;
+    t1 = (-C34) * t8;
+    t10 = C33 * t0;
+    t14 = t1 + t10;
+    t12 = t2 + t13;
+    t7 = t9 + t14;
+    t6 = C6 * t12;
+    t11 = t3 - t6;
+    t4 = C6 * t7;
+    t8 = t5 - t4;
+    t0 = t2 - t13;
+    t1 = C7 * t0;
+    t10 = t9 - t14;
+    t6 = C7 * t10;
+    t4 = t3 + t12;
+    t2 = t5 + t7;
+    t13 = t11 + t6;
+    t0 = t8 - t1;
+    t9 = t11 - t6;
+    t14 = t8 + t1;
+    re[171] = t4;
+    im[171] = t2;
+    re[51] = t13;
+    im[51] = t0;
+    re[111] = t9;
+    im[111] = t14;
+    t10 = X[22];
+    t3 = X[337];
+    t12 = C35 * t10;
+    t5 = C36 * t3;
+    t7 = t12 + t5;
+    t11 = (-C36) * t10;
+    t6 = C35 * t3;
+    t8 = t11 + t6;
+    t1 = X[142];
+    t4 = X[217];
+    t2 = C37 * t1;
+    t13 = C38 * t4;
+    t0 = t2 + t13;
+    t9 = (-C38) * t1;
+    t14 = C37 * t4;
+    t12 = t9 + t14;
+    t5 = X[262];
+    t10 = X[97];
+    t3 = C39 * t5;
+    t11 = C40 * t10;
+    t6 = t3 + t11;
+    t2 = (-C40) * t5;
+    t13 = C39 * t10;
+    t1 = t2 + t13;
+    t4 = t0 + t6;
+    t9 = t12 + t1;
+    t14 = C6 * t4;
+    t3 = t7 - t14;
+    t11 = C6 * t9;
+    t5 = t8 - t11;
+    t10 = t0 - t6;
+    t2 = C7 * t10;
+    t13 = t12 - t1;
+    t14 = C7 * t13;
+    t11 = t7 + t4;
+    t0 = t8 + t9;
+    t6 = t3 + t14;
+    t10 = t5 - t2;
+    t12 = t3 - t14;
+    t1 = t5 + t2;
+    t13 = t6 + t10;
+    t7 = C14 * t13;
+    t4 = t6 * (-C15);
+    t8 = t10 * C16;
+    t9 = t7 - t8;
+    t3 = t7 + t4;
+    t14 = t12 + t1;
+    t5 = C17 * t14;
+    t2 = t12 * (-C18);
+    t13 = t1 * (-C19);
+    t6 = t5 - t13;
+    t10 = t5 + t2;
+    re[11] = t11;
+    im[11] = t0;
+    re[71] = t9;
+    im[71] = t3;
+    re[131] = t6;
+    im[131] = t10;
+    t8 = X[62];
+    t7 = X[297];
+    t4 = C41 * t8;
+    t14 = C42 * t7;
+    t12 = t4 + t14;
+    t1 = (-C42) * t8;
+    t13 = C41 * t7;
+    t5 = t1 + t13;
+    t2 = X[182];
+    t11 = X[177];
+    t0 = C43 * t2;
+    t9 = C44 * t11;
+    t3 = t0 + t9;
+    t6 = (-C44) * t2;
+    t10 = C43 * t11;
+    t4 = t6 + t10;
+    t14 = X[302];
+    t8 = X[57];
+    t7 = C45 * t14;
+    t1 = C46 * t8;
+    t13 = t7 + t1;
+    t0 = (-C46) * t14;
+    t9 = C45 * t8;
+    t2 = t0 + t9;
+    t11 = t3 + t13;
+    t6 = t4 + t2;
+    t10 = C6 * t11;
+    t7 = t12 - t10;
+    t1 = C6 * t6;
+    t14 = t5 - t1;
+    t8 = t3 - t13;
+    t0 = C7 * t8;
+    t9 = t4 - t2;
+    t10 = C7 * t9;
+    t1 = t12 + t11;
+    t3 = t5 + t6;
+    t13 = t7 + t10;
+    t8 = t14 - t0;
+    t4 = t7 - t10;
+    t2 = t14 + t0;
+    t9 = t13 + t8;
+    t12 = C17 * t9;
+    t11 = t13 * (-C18);
+    t5 = t8 * (-C19);
+    t6 = t12 - t5;
+    t7 = t12 + t11;
+    t10 = t4 + t2;
+    t14 = (-C26) * t10;
+    t0 = t4 * C27;
+    t9 = t2 * (-C28);
+    t13 = t14 - t9;
+    t8 = t14 + t0;
+    re[31] = t1;
+    im[31] = t3;
+    re[91] = t6;
+    im[91] = t7;
+    re[151] = t13;
+    im[151] = t8;
+    t5 = re[171];
+    t12 = im[171];
+    t11 = re[11];
+    t10 = im[11];
+    t4 = re[31];
+    t2 = im[31];
+    t9 = t11 + t4;
+    t14 = t10 + t2;
+    t0 = C6 * t9;
+    t1 = t5 - t0;
+    t3 = C6 * t14;
+    t6 = t12 - t3;
+    t7 = t11 - t4;
+    t13 = C7 * t7;
+    t8 = t10 - t2;
+    t0 = C7 * t8;
+    t3 = t5 + t9;
+    t11 = t12 + t14;
+    t4 = t1 + t0;
+    t7 = t6 - t13;
+    t10 = t1 - t0;
+    t2 = t6 + t13;
+    re[171] = t3;
+    im[171] = t11;
+    re[11] = t4;
+    im[11] = t7;
+    re[31] = t10;
+    im[31] = t2;
+    t8 = re[51];
+    t5 = im[51];
+    t9 = re[71];
+    t12 = im[71];
+    t14 = re[91];
+    t1 = im[91];
+    t0 = t9 + t14;
+    t6 = t12 + t1;
+    t13 = C6 * t0;
+    t3 = t8 - t13;
+    t11 = C6 * t6;
+    t4 = t5 - t11;
+    t7 = t9 - t14;
+    t10 = C7 * t7;
+    t2 = t12 - t1;
+    t13 = C7 * t2;
+    t11 = t8 + t0;
+    t9 = t5 + t6;
+    t14 = t3 + t13;
+    t7 = t4 - t10;
+    t12 = t3 - t13;
+    t1 = t4 + t10;
+    re[51] = t11;
+    im[51] = t9;
+    re[71] = t14;
+    im[71] = t7;
+    re[91] = t12;
+    im[91] = t1;
+    t2 = re[111];
+    t8 = im[111];
+    t0 = re[131];
+    t5 = im[131];
+    t6 = re[151];
+    t3 = im[151];
+    t13 = t0 + t6;
+    t4 = t5 + t3;
+    t10 = C6 * t13;
+    t11 = t2 - t10;
+    t9 = C6 * t4;
+    t14 = t8 - t9;
+    t7 = t0 - t6;
+    t12 = C7 * t7;
+    t1 = t5 - t3;
+    t10 = C7 * t1;
+    t9 = t2 + t13;
+    t0 = t8 + t4;
+    t6 = t11 + t10;
+    t7 = t14 - t12;
+    t5 = t11 - t10;
+    t3 = t14 + t12;
+    re[111] = t9;
+    im[111] = t0;
+    re[131] = t6;
+    im[131] = t7;
+    re[151] = t5;
+    im[151] = t3;
+    t1 = X[54];
+    t2 = X[305];
+    t13 = C47 * t1;
+    t8 = C48 * t2;
+    t4 = t13 + t8;
+    t11 = (-C48) * t1;
+    t10 = C47 * t2;
+    t14 = t11 + t10;
+    t12 = X[174];
+    t9 = X[185];
+    t0 = C49 * t12;
+    t6 = C50 * t9;
+    t7 = t0 + t6;
+    t5 = (-C50) * t12;
+    t3 = C49 * t9;
+    t13 = t5 + t3;
+    t8 = X[294];
+    t1 = X[65];
+    t2 = C51 * t8;
+    t11 = C52 * t1;
+    t10 = t2 + t11;
+    t0 = (-C52) * t8;
+    t6 = C51 * t1;
+    t12 = t0 + t6;
+    t9 = t7 + t10;
+    t5 = t13 + t12;
+    t3 = C6 * t9;
+    t2 = t4 - t3;
+    t11 = C6 * t5;
+    t8 = t14 - t11;
+    t1 = t7 - t10;
+    t0 = C7 * t1;
+    t6 = t13 - t12;
+    t3 = C7 * t6;
+    t11 = t4 + t9;
+    t7 = t14 + t5;
+    t10 = t2 + t3;
+    t1 = t8 - t0;
+    t13 = t2 - t3;
+    t12 = t8 + t0;
+    re[27] = t11;
+    im[27] = t7;
+    re[87] = t10;
+    im[87] = t1;
+    re[147] = t13;
+    im[147] = t12;
+    t6 = X[94];
+    t4 = X[265];
+    t9 = C53 * t6;
+    t14 = C54 * t4;
+    t5 = t9 + t14;
+    t2 = (-C54) * t6;
+    t3 = C53 * t4;
+    t8 = t2 + t3;
+    t0 = X[214];
+    t11 = X[145];
+    t7 = C55 * t0;
+    t10 = C56 * t11;
+    t1 = t7 + t10;
+    t13 = (-C56) * t0;
+    t12 = C55 * t11;
+    t9 = t13 + t12;
+    t14 = X[334];
+    t6 = X[25];
+    t4 = C57 * t14;
+    t2 = C58 * t6;
+    t3 = t4 + t2;
+    t7 = (-C58) * t14;
+    t10 = C57 * t6;
+    t0 = t7 + t10;
+    t11 = t1 + t3;
+    t13 = t9 + t0;
+    t12 = C6 * t11;
+    t4 = t5 - t12;
+    t2 = C6 * t13;
+    t14 = t8 - t2;
+    t6 = t1 - t3;
+    t7 = C7 * t6;
+    t10 = t9 - t0;
+    t12 = C7 * t10;
+    t2 = t5 + t11;
+    t1 = t8 + t13;
+    t3 = t4 + t12;
+    t6 = t14 - t7;
+    t9 = t4 - t12;
+    t0 = t14 + t7;
+    t10 = t3 + t6;
+    t5 = C14 * t10;
+    t11 = t3 * (-C15);
+    t8 = t6 * C16;
+    t13 = t5 - t8;
+    t4 = t5 + t11;
+    t12 = t9 + t0;
+    t14 = C17 * t12;
+    t7 = t9 * (-C18);
+    t10 = t0 * (-C19);
+    t3 = t14 - t10;
+    t6 = t14 + t7;
+    re[47] = t2;
+    im[47] = t1;
+    re[107] = t13;
+    im[107] = t4;
+    re[167] = t3;
+    im[167] = t6;
+    t8 = X[134];
+    t5 = X[225];
+    t11 = C59 * t8;
+    t12 = C60 * t5;
+    t9 = t11 + t12;
+    t0 = (-C60) * t8;
+    t10 = C59 * t5;
+    t14 = t0 + t10;
+    t7 = X[254];
+    t2 = X[105];
+    t1 = C61 * t7;
+    t13 = C62 * t2;
+    t4 = t1 + t13;
+    t3 = (-C62) * t7;
+    t6 = C61 * t2;
+    t11 = t3 + t6;
+    t12 = X[14];
+    t8 = X[345];
+    t5 = C63 * t12;
+    t0 = C64 * t8;
+    t10 = t5 + t0;
+    t1 = (-C64) * t12;
+    t13 = C63 * t8;
+    t7 = t1 + t13;
+    t2 = t4 + t10;
+    t3 = t11 + t7;
+    t6 = C6 * t2;
+    t5 = t9 - t6;
+    t0 = C6 * t3;
+    t12 = t14 - t0;
+    t8 = t4 - t10;
+    t1 = C7 * t8;
+    t13 = t11 - t7;
+    t6 = C7 * t13;
+    t0 = t9 + t2;
+    t4 = t14 + t3;
+    t10 = t5 + t6;
+    t8 = t12 - t1;
+    t11 = t5 - t6;
+    t7 = t12 + t1;
+    t13 = t10 + t8;
+    t9 = C17 * t13;
+    t2 = t10 * (-C18);
+    t14 = t8 * (-C19);
+    t3 = t9 - t14;
+    t5 = t9 + t2;
+    t6 = t11 + t7;
+    t12 = (-C26) * t6;
+    t1 = t11 * C27;
+    t13 = t7 * (-C28);
+    t10 = t12 - t13;
+    t8 = t12 + t1;
+    re[67] = t0;
+    im[67] = t4;
+    re[127] = t3;
+    im[127] = t5;
+    re[7] = t10;
+    im[7] = t8;
+    t14 = re[27];
+    t9 = im[27];
+    t2 = re[47];
+    t6 = im[47];
+    t11 = re[67];
+    t7 = im[67];
+    t13 = t2 + t11;
+    t12 = t6 + t7;
+    t1 = C6 * t13;
+    t0 = t14 - t1;
+    t4 = C6 * t12;
+    t3 = t9 - t4;
+    t5 = t2 - t11;
+    t10 = C7 * t5;
+    t8 = t6 - t7;
+    t1 = C7 * t8;
+    t4 = t14 + t13;
+    t2 = t9 + t12;
+    t11 = t0 + t1;
+    t5 = t3 - t10;
+    t6 = t0 - t1;
+    t7 = t3 + t10;
+    re[27] = t4;
+    im[27] = t2;
+    re[47] = t11;
+    im[47] = t5;
+    re[67] = t6;
+    im[67] = t7;
+    t8 = re[87];
+    t14 = im[87];
+    t13 = re[107];
+    t9 = im[107];
+    t12 = re[127];
+    t0 = im[127];
+    t1 = t13 + t12;
+    t3 = t9 + t0;
+    t10 = C6 * t1;
+    t4 = t8 - t10;
+    t2 = C6 * t3;
+    t11 = t14 - t2;
+    t5 = t13 - t12;
+    t6 = C7 * t5;
+    t7 = t9 - t0;
+    t10 = C7 * t7;
+    t2 = t8 + t1;
+    t13 = t14 + t3;
+    t12 = t4 + t10;
+    t5 = t11 - t6;
+    t9 = t4 - t10;
+    t0 = t11 + t6;
+    re[87] = t2;
+    im[87] = t13;
+    re[107] = t12;
+    im[107] = t5;
+    re[127] = t9;
+    im[127] = t0;
+    t7 = re[147];
+    t8 = im[147];
+    t1 = re[167];
+    t14 = im[167];
+    t3 = re[7];
+    t4 = im[7];
+    t10 = t1 + t3;
+    t11 = t14 + t4;
+    t6 = C6 * t10;
+    t2 = t7 - t6;
+    t13 = C6 * t11;
+    t12 = t8 - t13;
+    t5 = t1 - t3;
+    t9 = C7 * t5;
+    t0 = t14 - t4;
+    t6 = C7 * t0;
+    t13 = t7 + t10;
+    t1 = t8 + t11;
+    t3 = t2 + t6;
+    t5 = t12 - t9;
+    t14 = t2 - t6;
+    t4 = t12 + t9;
+    re[147] = t13;
+    im[147] = t1;
+    re[167] = t3;
+    im[167] = t5;
+    re[7] = t14;
+    im[7] = t4;
+    t0 = X[126];
+    t7 = X[233];
+    t10 = C65 * t0;
+    t8 = C66 * t7;
+    t11 = t10 + t8;
+    t2 = (-C66) * t0;
+    t6 = C65 * t7;
+    t12 = t2 + t6;
+    t9 = X[246];
+    t13 = X[113];
+    t1 = C67 * t9;
+    t3 = C68 * t13;
+    t5 = t1 + t3;
+    t14 = (-C68) * t9;
+    t4 = C67 * t13;
+    t10 = t14 + t4;
+    t8 = X[6];
+    t0 = X[353];
+    t7 = C69 * t8;
+    t2 = C70 * t0;
+    t6 = t7 + t2;
+    t1 = (-C70) * t8;
+    t3 = C69 * t0;
+    t9 = t1 + t3;
+    t13 = t5 + t6;
+    t14 = t10 + t9;
+    t4 = C6 * t13;
+    t7 = t11 - t4;
+    t2 = C6 * t14;
+    t8 = t12 - t2;
+    t0 = t5 - t6;
+    t1 = C7 * t0;
+    t3 = t10 - t9;
+    t4 = C7 * t3;
+    t2 = t11 + t13;
+    t5 = t12 + t14;
+    t6 = t7 + t4;
+    t0 = t8 - t1;
+    t10 = t7 - t4;
+    t9 = t8 + t1;
+    re[63] = t2;
+    im[63] = t5;
+    re[123] = t6;
+    im[123] = t0;
+    re[3] = t10;
+    im[3] = t9;
+    t3 = X[166];
+    t11 = X[193];
+    t13 = C71 * t3;
+    t12 = C72 * t11;
+    t14 = t13 + t12;
+    t7 = (-C72) * t3;
+    t4 = C71 * t11;
+    t8 = t7 + t4;
+    t1 = X[286];
+    t2 = X[73];
+    t5 = C73 * t1;
+    t6 = C74 * t2;
+    t0 = t5 + t6;
+    t10 = (-C74) * t1;
+    t9 = C73 * t2;
+    t13 = t10 + t9;
+    t12 = X[46];
+    t3 = X[313];
+    t11 = C75 * t12;
+    t7 = C76 * t3;
+    t4 = t11 + t7;
+    t5 = (-C76) * t12;
+    t6 = C75 * t3;
+    t1 = t5 + t6;
+    t2 = t0 + t4;
+    t10 = t13 + t1;
+    t9 = C6 * t2;
+    t11 = t14 - t9;
+    t7 = C6 * t10;
+    t12 = t8 - t7;
+    t3 = t0 - t4;
+    t5 = C7 * t3;
+    t6 = t13 - t1;
+    t9 = C7 * t6;
+    t7 = t14 + t2;
+    t0 = t8 + t10;
+    t4 = t11 + t9;
+    t3 = t12 - t5;
+    t13 = t11 - t9;
+    t1 = t12 + t5;
+    t6 = t4 + t3;
+    t14 = C14 * t6;
+    t2 = t4 * (-C15);
+    t8 = t3 * C16;
+    t10 = t14 - t8;
+    t11 = t14 + t2;
+    t9 = t13 + t1;
+    t12 = C17 * t9;
+    t5 = t13 * (-C18);
+    t6 = t1 * (-C19);
+    t4 = t12 - t6;
+    t3 = t12 + t5;
+    re[83] = t7;
+    im[83] = t0;
+    re[143] = t10;
+    im[143] = t11;
+    re[23] = t4;
+    im[23] = t3;
+    t8 = X[206];
+    t14 = X[153];
+    t2 = C77 * t8;
+    t9 = C78 * t14;
+    t13 = t2 + t9;
+    t1 = (-C78) * t8;
+    t6 = C77 * t14;
+    t12 = t1 + t6;
+    t5 = X[326];
+    t7 = X[33];
+    t0 = C79 * t5;
+    t10 = C80 * t7;
+    t11 = t0 + t10;
+    t4 = (-C80) * t5;
+    t3 = C79 * t7;
+    t2 = t4 + t3;
+    t9 = X[86];
+    t8 = X[273];
+    t14 = C81 * t9;
+    t1 = C82 * t8;
+    t6 = t14 + t1;
+    t0 = (-C82) * t9;
+    t10 = C81 * t8;
+    t5 = t0 + t10;
+    t7 = t11 + t6;
+    t4 = t2 + t5;
+    t3 = C6 * t7;
+    t14 = t13 - t3;
+    t1 = C6 * t4;
+    t9 = t12 - t1;
+    t8 = t11 - t6;
+    t0 = C7 * t8;
+    t10 = t2 - t5;
+    t3 = C7 * t10;
+    t1 = t13 + t7;
+    t11 = t12 + t4;
+    t6 = t14 + t3;
+    t8 = t9 - t0;
+    t2 = t14 - t3;
+    t5 = t9 + t0;
+    t10 = t6 + t8;
+    t13 = C17 * t10;
+    t7 = t6 * (-C18);
+    t12 = t8 * (-C19);
+    t4 = t13 - t12;
+    t14 = t13 + t7;
+    t3 = t2 + t5;
+    t9 = (-C26) * t3;
+    t0 = t2 * C27;
+    t10 = t5 * (-C28);
+    t6 = t9 - t10;
+    t8 = t9 + t0;
+    re[103] = t1;
+    im[103] = t11;
+    re[163] = t4;
+    im[163] = t14;
+    re[43] = t6;
+    im[43] = t8;
+    t12 = re[63];
+    t13 = im[63];
+    t7 = re[83];
+    t3 = im[83];
+    t2 = re[103];
+    t5 = im[103];
+    t10 = t7 + t2;
+    t9 = t3 + t5;
+    t0 = C6 * t10;
+    t1 = t12 - t0;
+    t11 = C6 * t9;
+    t4 = t13 - t11;
+    t14 = t7 - t2;
+    t6 = C7 * t14;
+    t8 = t3 - t5;
+    t0 = C7 * t8;
+    t11 = t12 + t10;
+    t7 = t13 + t9;
+    t2 = t1 + t0;
+    t14 = t4 - t6;
+    t3 = t1 - t0;
+    t5 = t4 + t6;
+    re[63] = t11;
+    im[63] = t7;
+    re[83] = t2;
+    im[83] = t14;
+    re[103] = t3;
+    im[103] = t5;
+    t8 = re[123];
+    t12 = im[123];
+    t10 = re[143];
+    t13 = im[143];
+    t9 = re[163];
+    t1 = im[163];
+    t0 = t10 + t9;
+    t4 = t13 + t1;
+    t6 = C6 * t0;
+    t11 = t8 - t6;
+    t7 = C6 * t4;
+    t2 = t12 - t7;
+    t14 = t10 - t9;
+    t3 = C7 * t14;
+    t5 = t13 - t1;
+    t6 = C7 * t5;
+    t7 = t8 + t0;
+    t10 = t12 + t4;
+    t9 = t11 + t6;
+    t14 = t2 - t3;
+    t13 = t11 - t6;
+    t1 = t2 + t3;
+    re[123] = t7;
+    im[123] = t10;
+    re[143] = t9;
+    im[143] = t14;
+    re[163] = t13;
+    im[163] = t1;
+    t5 = re[3];
+    t8 = im[3];
+    t0 = re[23];
+    t12 = im[23];
+    t4 = re[43];
+    t11 = im[43];
+    t6 = t0 + t4;
+    t2 = t12 + t11;
+    t3 = C6 * t6;
+    t7 = t5 - t3;
+    t10 = C6 * t2;
+    t9 = t8 - t10;
+    t14 = t0 - t4;
+    t13 = C7 * t14;
+    t1 = t12 - t11;
+    t3 = C7 * t1;
+    t10 = t5 + t6;
+    t0 = t8 + t2;
+    t4 = t7 + t3;
+    t14 = t9 - t13;
+    t12 = t7 - t3;
+    t11 = t9 + t13;
+    re[3] = t10;
+    im[3] = t0;
+    re[23] = t4;
+    im[23] = t14;
+    re[43] = t12;
+    im[43] = t11;
+    t1 = X[198];
+    t5 = X[161];
+    t6 = C83 * t1;
+    t8 = C84 * t5;
+    t2 = t6 + t8;
+    t7 = (-C84) * t1;
+    t3 = C83 * t5;
+    t9 = t7 + t3;
+    t13 = X[318];
+    t10 = X[41];
+    t0 = C85 * t13;
+    t4 = C86 * t10;
+    t14 = t0 + t4;
+    t12 = (-C86) * t13;
+    t11 = C85 * t10;
+    t6 = t12 + t11;
+    t8 = X[78];
+    t1 = X[281];
+    t5 = C87 * t8;
+    t7 = C88 * t1;
+    t3 = t5 + t7;
+    t0 = (-C88) * t8;
+    t4 = C87 * t1;
+    t13 = t0 + t4;
+    t10 = t14 + t3;
+    t12 = t6 + t13;
+    t11 = C6 * t10;
+    t5 = t2 - t11;
+    t7 = C6 * t12;
+    t8 = t9 - t7;
+    t1 = t14 - t3;
+    t0 = C7 * t1;
+    t4 = t6 - t13;
+    t11 = C7 * t4;
+    t7 = t2 + t10;
+    t14 = t9 + t12;
+    t3 = t5 + t11;
+    t1 = t8 - t0;
+    t6 = t5 - t11;
+    t13 = t8 + t0;
+    re[99] = t7;
+    im[99] = t14;
+    re[159] = t3;
+    im[159] = t1;
+    re[39] = t6;
+    im[39] = t13;
+    t4 = X[238];
+    t2 = X[121];
+    t10 = C89 * t4;
+    t9 = C90 * t2;
+    t12 = t10 + t9;
+    t5 = (-C90) * t4;
+    t11 = C89 * t2;
+    t8 = t5 + t11;
+    t0 = X[358];
+    t7 = X[1];
+    t14 = C91 * t0;
+    t3 = C92 * t7;
+    t1 = t14 + t3;
+    t6 = (-C92) * t0;
+    t13 = C91 * t7;
+    t10 = t6 + t13;
+    t9 = X[118];
+    t4 = X[241];
+    t2 = C93 * t9;
+    t5 = C94 * t4;
+    t11 = t2 + t5;
+    t14 = (-C94) * t9;
+    t3 = C93 * t4;
+    t0 = t14 + t3;
+    t7 = t1 + t11;
+    t6 = t10 + t0;
+    t13 = C6 * t7;
+    t2 = t12 - t13;
+    t5 = C6 * t6;
+    t9 = t8 - t5;
+    t4 = t1 - t11;
+    t14 = C7 * t4;
+    t3 = t10 - t0;
+    t13 = C7 * t3;
+    t5 = t12 + t7;
+    t1 = t8 + t6;
+    t11 = t2 + t13;
+    t4 = t9 - t14;
+    t10 = t2 - t13;
+    t0 = t9 + t14;
+    t3 = t11 + t4;
+    t12 = C14 * t3;
+    t7 = t11 * (-C15);
+    t8 = t4 * C16;
+    t6 = t12 - t8;
+    t2 = t12 + t7;
+    t13 = t10 + t0;
+    t9 = C17 * t13;
+    t14 = t10 * (-C18);
+    t3 = t0 * (-C19);
+    t11 = t9 - t3;
+    t4 = t9 + t14;
+    re[119] = t5;
+    im[119] = t1;
+    re[179] = t6;
+    im[179] = t2;
+    re[59] = t11;
+    im[59] = t4;
+    t8 = X[278];
+    t12 = X[81];
+    t7 = C95 * t8;
+    t13 = C96 * t12;
+    t10 = t7 + t13;
+    t0 = (-C96) * t8;
+    t3 = C95 * t12;
+    t9 = t0 + t3;
+    t14 = X[38];
+    t5 = X[321];
+    t1 = C97 * t14;
+    t6 = C98 * t5;
+    t2 = t1 + t6;
+    t11 = (-C98) * t14;
+    t4 = C97 * t5;
+    t7 = t11 + t4;
+    t13 = X[158];
+    t8 = X[201];
+    t12 = C99 * t13;
+    t0 = C100 * t8;
+    t3 = t12 + t0;
+    t1 = (-C100) * t13;
+    t6 = C99 * t8;
+    t14 = t1 + t6;
+    t5 = t2 + t3;
+    t11 = t7 + t14;
+    t4 = C6 * t5;
+    t12 = t10 - t4;
+    t0 = C6 * t11;
+    t13 = t9 - t0;
+    t8 = t2 - t3;
+    t1 = C7 * t8;
+    t6 = t7 - t14;
+    t4 = C7 * t6;
+    t0 = t10 + t5;
+    t2 = t9 + t11;
+    t3 = t12 + t4;
+    t8 = t13 - t1;
+    t7 = t12 - t4;
+    t14 = t13 + t1;
+    t6 = t3 + t8;
+    t10 = C17 * t6;
+    t5 = t3 * (-C18);
+    t9 = t8 * (-C19);
+    t11 = t10 - t9;
+    t12 = t10 + t5;
+    t4 = t7 + t14;
+    t13 = (-C26) * t4;
+    t1 = t7 * C27;
+    t6 = t14 * (-C28);
+    t3 = t13 - t6;
+    t8 = t13 + t1;
+    re[139] = t0;
+    im[139] = t2;
+    re[19] = t11;
+    im[19] = t12;
+    re[79] = t3;
+    im[79] = t8;
+    t9 = re[99];
+    t10 = im[99];
+    t5 = re[119];
+    t4 = im[119];
+    t7 = re[139];
+    t14 = im[139];
+    t6 = t5 + t7;
+    t13 = t4 + t14;
+    t1 = C6 * t6;
+    t0 = t9 - t1;
+    t2 = C6 * t13;
+    t11 = t10 - t2;
+    t12 = t5 - t7;
+    t3 = C7 * t12;
+    t8 = t4 - t14;
+    t1 = C7 * t8;
+    t2 = t9 + t6;
+    t5 = t10 + t13;
+    t7 = t0 + t1;
+    t12 = t11 - t3;
+    t4 = t0 - t1;
+    t14 = t11 + t3;
+    re[99] = t2;
+    im[99] = t5;
+    re[119] = t7;
+    im[119] = t12;
+    re[139] = t4;
+    im[139] = t14;
+    t8 = re[159];
+    t9 = im[159];
+    t6 = re[179];
+    t10 = im[179];
+    t13 = re[19];
+    t0 = im[19];
+    t1 = t6 + t13;
+    t11 = t10 + t0;
+    t3 = C6 * t1;
+    t2 = t8 - t3;
+    t5 = C6 * t11;
+    t7 = t9 - t5;
+    t12 = t6 - t13;
+    t4 = C7 * t12;
+    t14 = t10 - t0;
+    t3 = C7 * t14;
+    t5 = t8 + t1;
+    t6 = t9 + t11;
+    t13 = t2 + t3;
+    t12 = t7 - t4;
+    t10 = t2 - t3;
+    t0 = t7 + t4;
+    re[159] = t5;
+    im[159] = t6;
+    re[179] = t13;
+    im[179] = t12;
+    re[19] = t10;
+    im[19] = t0;
+    t14 = re[39];
+    t8 = im[39];
+    t1 = re[59];
+    t9 = im[59];
+    t11 = re[79];
+    t2 = im[79];
+    t3 = t1 + t11;
+    t7 = t9 + t2;
+    t4 = C6 * t3;
+    t5 = t14 - t4;
+    t6 = C6 * t7;
+    t13 = t8 - t6;
+    t12 = t1 - t11;
+    t10 = C7 * t12;
+    t0 = t9 - t2;
+    t4 = C7 * t0;
+    t6 = t14 + t3;
+    t1 = t8 + t7;
+    t11 = t5 + t4;
+    t12 = t13 - t10;
+    t9 = t5 - t4;
+    t2 = t13 + t10;
+    re[39] = t6;
+    im[39] = t1;
+    re[59] = t11;
+    im[59] = t12;
+    re[79] = t9;
+    im[79] = t2;
+    t0 = re[135];
+    t14 = im[135];
+    t3 = re[171];
+    t8 = im[171];
+    t7 = re[27];
+    t5 = im[27];
+    t4 = re[63];
+    t13 = im[63];
+    t10 = re[99];
+    t6 = im[99];
+    t1 = t3 + t10;
+    t11 = t8 + t6;
+    t12 = t7 + t4;
+    t9 = t5 + t13;
+    t2 = t3 - t10;
+    t3 = t8 - t6;
+    t10 = t7 - t4;
+    t8 = t5 - t13;
+    t6 = t1 + t12;
+    t7 = t11 + t9;
+    t4 = t1 - t12;
+    t5 = C101 * t4;
+    t13 = t11 - t9;
+    t1 = C101 * t13;
+    t12 = C102 * t6;
+    t4 = t0 - t12;
+    t11 = C102 * t7;
+    t9 = t14 - t11;
+    t13 = t4 + t5;
+    t12 = t9 + t1;
+    t11 = t4 - t5;
+    t4 = t9 - t1;
+    t5 = C103 * t2;
+    t9 = C104 * t10;
+    t1 = t5 + t9;
+    t5 = C103 * t3;
+    t9 = C104 * t8;
+    t5 = t5 + t9;
+    t9 = C104 * t2;
+    t2 = C103 * t10;
+    t10 = t9 - t2;
+    t9 = C104 * t3;
+    t2 = C103 * t8;
+    t3 = t9 - t2;
+    t8 = t0 + t6;
+    t9 = t14 + t7;
+    t2 = t13 + t5;
+    t0 = t12 - t1;
+    t6 = t11 + t3;
+    t14 = t4 - t10;
+    t7 = t11 - t3;
+    t11 = t4 + t10;
+    t3 = t13 - t5;
+    t4 = t12 + t1;
+    re[135] = t8;
+    im[135] = t9;
+    re[171] = t2;
+    im[171] = t0;
+    re[27] = t6;
+    im[27] = t14;
+    re[63] = t7;
+    im[63] = t11;
+    re[99] = t3;
+    im[99] = t4;
+    t10 = re[15];
+    t13 = im[15];
+    t5 = re[51];
+    t12 = im[51];
+    t1 = re[87];
+    t8 = im[87];
+    t9 = re[123];
+    t2 = im[123];
+    t0 = re[159];
+    t6 = im[159];
+    t14 = t5 + t0;
+    t7 = t12 + t6;
+    t11 = t1 + t9;
+    t3 = t8 + t2;
+    t4 = t5 - t0;
+    t5 = t12 - t6;
+    t0 = t1 - t9;
+    t12 = t8 - t2;
+    t6 = t14 + t11;
+    t1 = t7 + t3;
+    t9 = t14 - t11;
+    t8 = C101 * t9;
+    t2 = t7 - t3;
+    t14 = C101 * t2;
+    t11 = C102 * t6;
+    t9 = t10 - t11;
+    t7 = C102 * t1;
+    t3 = t13 - t7;
+    t2 = t9 + t8;
+    t11 = t3 + t14;
+    t7 = t9 - t8;
+    t9 = t3 - t14;
+    t8 = C103 * t4;
+    t3 = C104 * t0;
+    t14 = t8 + t3;
+    t8 = C103 * t5;
+    t3 = C104 * t12;
+    t8 = t8 + t3;
+    t3 = C104 * t4;
+    t4 = C103 * t0;
+    t0 = t3 - t4;
+    t3 = C104 * t5;
+    t4 = C103 * t12;
+    t5 = t3 - t4;
+    t12 = t10 + t6;
+    t3 = t13 + t1;
+    t4 = t2 + t8;
+    t10 = t11 - t14;
+    t6 = t7 + t5;
+    t13 = t9 - t0;
+    t1 = t7 - t5;
+    t7 = t9 + t0;
+    t5 = t2 - t8;
+    t9 = t11 + t14;
+    re[15] = t12;
+    im[15] = t3;
+    re[51] = t4;
+    im[51] = t10;
+    re[87] = t6;
+    im[87] = t13;
+    re[123] = t1;
+    im[123] = t7;
+    re[159] = t5;
+    im[159] = t9;
+    t0 = re[75];
+    t2 = im[75];
+    t8 = re[111];
+    t11 = im[111];
+    t14 = re[147];
+    t12 = im[147];
+    t3 = re[3];
+    t4 = im[3];
+    t10 = re[39];
+    t6 = im[39];
+    t13 = t8 + t10;
+    t1 = t11 + t6;
+    t7 = t14 + t3;
+    t5 = t12 + t4;
+    t9 = t8 - t10;
+    t8 = t11 - t6;
+    t10 = t14 - t3;
+    t11 = t12 - t4;
+    t6 = t13 + t7;
+    t14 = t1 + t5;
+    t3 = t13 - t7;
+    t12 = C101 * t3;
+    t4 = t1 - t5;
+    t13 = C101 * t4;
+    t7 = C102 * t6;
+    t3 = t0 - t7;
+    t1 = C102 * t14;
+    t5 = t2 - t1;
+    t4 = t3 + t12;
+    t7 = t5 + t13;
+    t1 = t3 - t12;
+    t3 = t5 - t13;
+    t12 = C103 * t9;
+    t5 = C104 * t10;
+    t13 = t12 + t5;
+    t12 = C103 * t8;
+    t5 = C104 * t11;
+    t12 = t12 + t5;
+    t5 = C104 * t9;
+    t9 = C103 * t10;
+    t10 = t5 - t9;
+    t5 = C104 * t8;
+    t9 = C103 * t11;
+    t8 = t5 - t9;
+    t11 = t0 + t6;
+    t5 = t2 + t14;
+    t9 = t4 + t12;
+    t0 = t7 - t13;
+    t6 = t1 + t8;
+    t2 = t3 - t10;
+    t14 = t1 - t8;
+    t1 = t3 + t10;
+    t8 = t4 - t12;
+    t3 = t7 + t13;
+    re[75] = t11;
+    im[75] = t5;
+    re[111] = t9;
+    im[111] = t0;
+    re[147] = t6;
+    im[147] = t2;
+    re[3] = t14;
+    im[3] = t1;
+    re[39] = t8;
+    im[39] = t3;
+    t10 = re[155];
+    t4 = im[155];
+    t12 = re[11];
+    t7 = im[11];
+    t13 = re[47];
+    t11 = im[47];
+    t5 = re[83];
+    t9 = im[83];
+    t0 = re[119];
+    t6 = im[119];
+    t2 = t12 + t0;
+    t14 = t7 + t6;
+    t1 = t13 + t5;
+    t8 = t11 + t9;
+    t3 = t12 - t0;
+    t12 = t7 - t6;
+    t0 = t13 - t5;
+    t7 = t11 - t9;
+    t6 = t2 + t1;
+    t13 = t14 + t8;
+    t5 = t2 - t1;
+    t11 = C101 * t5;
+    t9 = t14 - t8;
+    t2 = C101 * t9;
+    t1 = C102 * t6;
+    t5 = t10 - t1;
+    t14 = C102 * t13;
+    t8 = t4 - t14;
+    t9 = t5 + t11;
+    t1 = t8 + t2;
+    t14 = t5 - t11;
+    t5 = t8 - t2;
+    t11 = C103 * t3;
+    t8 = C104 * t0;
+    t2 = t11 + t8;
+    t11 = C103 * t12;
+    t8 = C104 * t7;
+    t11 = t11 + t8;
+    t8 = C104 * t3;
+    t3 = C103 * t0;
+    t0 = t8 - t3;
+    t8 = C104 * t12;
+    t3 = C103 * t7;
+    t12 = t8 - t3;
+    t7 = t10 + t6;
+    t8 = t4 + t13;
+    t3 = t9 + t11;
+    t10 = t1 - t2;
+    t6 = t14 + t12;
+    t4 = t5 - t0;
+    t13 = t14 - t12;
+    t14 = t5 + t0;
+    t12 = t9 - t11;
+    t5 = t1 + t2;
+    re[155] = t7;
+    im[155] = t8;
+    re[11] = t3;
+    im[11] = t10;
+    re[47] = t6;
+    im[47] = t4;
+    re[83] = t13;
+    im[83] = t14;
+    re[119] = t12;
+    im[119] = t5;
+    t0 = re[35];
+    t9 = im[35];
+    t11 = re[71];
+    t1 = im[71];
+    t2 = re[107];
+    t7 = im[107];
+    t8 = re[143];
+    t3 = im[143];
+    t10 = re[179];
+    t6 = im[179];
+    t4 = t11 + t10;
+    t13 = t1 + t6;
+    t14 = t2 + t8;
+    t12 = t7 + t3;
+    t5 = t11 - t10;
+    t11 = t1 - t6;
+    t10 = t2 - t8;
+    t1 = t7 - t3;
+    t6 = t4 + t14;
+    t2 = t13 + t12;
+    t8 = t4 - t14;
+    t7 = C101 * t8;
+    t3 = t13 - t12;
+    t4 = C101 * t3;
+    t14 = C102 * t6;
+    t8 = t0 - t14;
+    t13 = C102 * t2;
+    t12 = t9 - t13;
+    t3 = t8 + t7;
+    t14 = t12 + t4;
+    t13 = t8 - t7;
+    t8 = t12 - t4;
+    t7 = C103 * t5;
+    t12 = C104 * t10;
+    t4 = t7 + t12;
+    t7 = C103 * t11;
+    t12 = C104 * t1;
+    t7 = t7 + t12;
+    t12 = C104 * t5;
+    t5 = C103 * t10;
+    t10 = t12 - t5;
+    t12 = C104 * t11;
+    t5 = C103 * t1;
+    t11 = t12 - t5;
+    t1 = t0 + t6;
+    t12 = t9 + t2;
+    t5 = t3 + t7;
+    t0 = t14 - t4;
+    t6 = t13 + t11;
+    t9 = t8 - t10;
+    t2 = t13 - t11;
+    t13 = t8 + t10;
+    t11 = t3 - t7;
+    t8 = t14 + t4;
+    re[35] = t1;
+    im[35] = t12;
+    re[71] = t5;
+    im[71] = t0;
+    re[107] = t6;
+    im[107] = t9;
+    re[143] = t2;
+    im[143] = t13;
+    re[179] = t11;
+    im[179] = t8;
+    t10 = re[95];
+    t3 = im[95];
+    t7 = re[131];
+    t14 = im[131];
+    t4 = re[167];
+    t1 = im[167];
+    t12 = re[23];
+    t5 = im[23];
+    t0 = re[59];
+    t6 = im[59];
+    t9 = t7 + t0;
+    t2 = t14 + t6;
+    t13 = t4 + t12;
+    t11 = t1 + t5;
+    t8 = t7 - t0;
+    t7 = t14 - t6;
+    t0 = t4 - t12;
+    t14 = t1 - t5;
+    t6 = t9 + t13;
+    t4 = t2 + t11;
+    t12 = t9 - t13;
+    t1 = C101 * t12;
+    t5 = t2 - t11;
+    t9 = C101 * t5;
+    t13 = C102 * t6;
+    t12 = t10 - t13;
+    t2 = C102 * t4;
+    t11 = t3 - t2;
+    t5 = t12 + t1;
+    t13 = t11 + t9;
+    t2 = t12 - t1;
+    t12 = t11 - t9;
+    t1 = C103 * t8;
+    t11 = C104 * t0;
+    t9 = t1 + t11;
+    t1 = C103 * t7;
+    t11 = C104 * t14;
+    t1 = t1 + t11;
+    t11 = C104 * t8;
+    t8 = C103 * t0;
+    t0 = t11 - t8;
+    t11 = C104 * t7;
+    t8 = C103 * t14;
+    t7 = t11 - t8;
+    t14 = t10 + t6;
+    t11 = t3 + t4;
+    t8 = t5 + t1;
+    t10 = t13 - t9;
+    t6 = t2 + t7;
+    t3 = t12 - t0;
+    t4 = t2 - t7;
+    t2 = t12 + t0;
+    t7 = t5 - t1;
+    t12 = t13 + t9;
+    re[95] = t14;
+    im[95] = t11;
+    re[131] = t8;
+    im[131] = t10;
+    re[167] = t6;
+    im[167] = t3;
+    re[23] = t4;
+    im[23] = t2;
+    re[59] = t7;
+    im[59] = t12;
+    t0 = re[175];
+    t5 = im[175];
+    t1 = re[31];
+    t13 = im[31];
+    t9 = re[67];
+    t14 = im[67];
+    t11 = re[103];
+    t8 = im[103];
+    t10 = re[139];
+    t6 = im[139];
+    t3 = t1 + t10;
+    t4 = t13 + t6;
+    t2 = t9 + t11;
+    t7 = t14 + t8;
+    t12 = t1 - t10;
+    t1 = t13 - t6;
+    t10 = t9 - t11;
+    t13 = t14 - t8;
+    t6 = t3 + t2;
+    t9 = t4 + t7;
+    t11 = t3 - t2;
+    t14 = C101 * t11;
+    t8 = t4 - t7;
+    t3 = C101 * t8;
+    t2 = C102 * t6;
+    t11 = t0 - t2;
+    t4 = C102 * t9;
+    t7 = t5 - t4;
+    t8 = t11 + t14;
+    t2 = t7 + t3;
+    t4 = t11 - t14;
+    t11 = t7 - t3;
+    t14 = C103 * t12;
+    t7 = C104 * t10;
+    t3 = t14 + t7;
+    t14 = C103 * t1;
+    t7 = C104 * t13;
+    t14 = t14 + t7;
+    t7 = C104 * t12;
+    t12 = C103 * t10;
+    t10 = t7 - t12;
+    t7 = C104 * t1;
+    t12 = C103 * t13;
+    t1 = t7 - t12;
+    t13 = t0 + t6;
+    t7 = t5 + t9;
+    t12 = t8 + t14;
+    t0 = t2 - t3;
+    t6 = t4 + t1;
+    t5 = t11 - t10;
+    t9 = t4 - t1;
+    t4 = t11 + t10;
+    t1 = t8 - t14;
+    t11 = t2 + t3;
+    re[175] = t13;
+    im[175] = t7;
+    re[31] = t12;
+    im[31] = t0;
+    re[67] = t6;
+    im[67] = t5;
+    re[103] = t9;
+    im[103] = t4;
+    re[139] = t1;
+    im[139] = t11;
+    t10 = re[55];
+    t8 = im[55];
+    t14 = re[91];
+    t2 = im[91];
+    t3 = re[127];
+    t13 = im[127];
+    t7 = re[163];
+    t12 = im[163];
+    t0 = re[19];
+    t6 = im[19];
+    t5 = t14 + t0;
+    t9 = t2 + t6;
+    t4 = t3 + t7;
+    t1 = t13 + t12;
+    t11 = t14 - t0;
+    t14 = t2 - t6;
+    t0 = t3 - t7;
+    t2 = t13 - t12;
+    t6 = t5 + t4;
+    t3 = t9 + t1;
+    t7 = t5 - t4;
+    t13 = C101 * t7;
+    t12 = t9 - t1;
+    t5 = C101 * t12;
+    t4 = C102 * t6;
+    t7 = t10 - t4;
+    t9 = C102 * t3;
+    t1 = t8 - t9;
+    t12 = t7 + t13;
+    t4 = t1 + t5;
+    t9 = t7 - t13;
+    t7 = t1 - t5;
+    t13 = C103 * t11;
+    t1 = C104 * t0;
+    t5 = t13 + t1;
+    t13 = C103 * t14;
+    t1 = C104 * t2;
+    t13 = t13 + t1;
+    t1 = C104 * t11;
+    t11 = C103 * t0;
+    t0 = t1 - t11;
+    t1 = C104 * t14;
+    t11 = C103 * t2;
+    t14 = t1 - t11;
+    t2 = t10 + t6;
+    t1 = t8 + t3;
+    t11 = t12 + t13;
+    t10 = t4 - t5;
+    t6 = t9 + t14;
+    t8 = t7 - t0;
+    t3 = t9 - t14;
+    t9 = t7 + t0;
+    t14 = t12 - t13;
+    t7 = t4 + t5;
+    re[55] = t2;
+    im[55] = t1;
+    re[91] = t11;
+    im[91] = t10;
+    re[127] = t6;
+    im[127] = t8;
+    re[163] = t3;
+    im[163] = t9;
+    re[19] = t14;
+    im[19] = t7;
+    t0 = re[115];
+    t12 = im[115];
+    t13 = re[151];
+    t4 = im[151];
+    t5 = re[7];
+    t2 = im[7];
+    t1 = re[43];
+    t11 = im[43];
+    t10 = re[79];
+    t6 = im[79];
+    t8 = t13 + t10;
+    t3 = t4 + t6;
+    t9 = t5 + t1;
+    t14 = t2 + t11;
+    t7 = t13 - t10;
+    t13 = t4 - t6;
+    t10 = t5 - t1;
+    t4 = t2 - t11;
+    t6 = t8 + t9;
+    t5 = t3 + t14;
+    t1 = t8 - t9;
+    t2 = C101 * t1;
+    t11 = t3 - t14;
+    t8 = C101 * t11;
+    t9 = C102 * t6;
+    t1 = t0 - t9;
+    t3 = C102 * t5;
+    t14 = t12 - t3;
+    t11 = t1 + t2;
+    t9 = t14 + t8;
+    t3 = t1 - t2;
+    t1 = t14 - t8;
+    t2 = C103 * t7;
+    t14 = C104 * t10;
+    t8 = t2 + t14;
+    t2 = C103 * t13;
+    t14 = C104 * t4;
+    t2 = t2 + t14;
+    t14 = C104 * t7;
+    t7 = C103 * t10;
+    t10 = t14 - t7;
+    t14 = C104 * t13;
+    t7 = C103 * t4;
+    t13 = t14 - t7;
+    t4 = t0 + t6;
+    t14 = t12 + t5;
+    t7 = t11 + t2;
+    t0 = t9 - t8;
+    t6 = t3 + t13;
+    t12 = t1 - t10;
+    t5 = t3 - t13;
+    t3 = t1 + t10;
+    t13 = t11 - t2;
+    t1 = t9 + t8;
+    re[115] = t4;
+    im[115] = t14;
+    re[151] = t7;
+    im[151] = t0;
+    re[7] = t6;
+    im[7] = t12;
+    re[43] = t5;
+    im[43] = t3;
+    re[79] = t13;
+    im[79] = t1;
+    t10 = re[0];
+    t11 = im[0];
+    t2 = re[45];
+    t9 = im[45];
+    t8 = re[90];
+    t4 = im[90];
+    t14 = re[135];
+    t7 = im[135];
+    t0 = t10 + t8;
+    t6 = t11 + t4;
+    t12 = t2 + t14;
+    t5 = t9 + t7;
+    t3 = t10 - t8;
+    t13 = t11 - t4;
+    t1 = t2 - t14;
+    t10 = t9 - t7;
+    t8 = t0 + t12;
+    t11 = t6 + t5;
+    t4 = t3 + t10;
+    t2 = t13 - t1;
+    t14 = t0 - t12;
+    t9 = t6 - t5;
+    t7 = t3 - t10;
+    t0 = t13 + t1;
+    t12 = (-C105) * t8;
+    t6 = (-C106) * t11;
+    t5 = t12 + t6;
+    t3 = 0.07256106269182623 * t5;
+    y[539] = t3;
+    t10 = 0.07225232704692253 * t5;
+    y[540] = t10;
+    t13 = C106 * t8;
+    t1 = (-C105) * t11;
+    t12 = t13 + t1;
+    t6 = 0.038067478102163245 * t12;
+    y[179] = t6;
+    t3 = (-0.03865835992204059) * t12;
+    y[180] = t3;
+    t5 = (-C107) * t4;
+    t10 = (-C108) * t2;
+    t8 = t5 + t10;
+    t11 = 0.07634133969483003 * t8;
+    y[449] = t11;
+    t13 = 0.02600882290369695 * t8;
+    y[630] = t13;
+    t1 = C108 * t4;
+    t6 = (-C107) * t2;
+    t12 = t1 + t6;
+    t3 = 0.0005948867419687272 * t12;
+    y[89] = t3;
+    t5 = (-0.07256989822004814) * t12;
+    y[270] = t5;
+    t10 = C109 * t14;
+    t11 = C110 * t9;
+    t8 = t10 + t11;
+    y[0] = 0;
+    t13 = (-0.07455064005974621) * t8;
+    y[359] = t13;
+    t4 = (-C110) * t14;
+    t2 = C109 * t9;
+    t1 = t4 + t2;
+    t6 = 0.07452056147476713 * t1;
+    y[360] = t6;
+    t3 = 0.00012831502283879977 * t1;
+    y[719] = t3;
+    t12 = C111 * t7;
+    t5 = C112 * t0;
+    t10 = t12 + t5;
+    t11 = 0.0006858251109706325 * t10;
+    y[90] = t11;
+    t8 = (-0.07244348493003379) * t10;
+    y[269] = t8;
+    t13 = (-C112) * t7;
+    t14 = C111 * t0;
+    t9 = t13 + t14;
+    t4 = 0.07643673051777489 * t9;
+    y[450] = t4;
+    t2 = 0.02655548754157034 * t9;
+    y[629] = t2;
+    t6 = re[96];
+    t1 = im[96];
+    t3 = re[141];
+    t12 = im[141];
+    t5 = re[6];
+    t11 = im[6];
+    t10 = re[51];
+    t8 = im[51];
+    t7 = t6 + t5;
+    t0 = t1 + t11;
+    t13 = t3 + t10;
+    t14 = t12 + t8;
+    t4 = t6 - t5;
+    t9 = t1 - t11;
+    t2 = t3 - t10;
+    t6 = t12 - t8;
+    t5 = t7 + t13;
+    t1 = t0 + t14;
+    t11 = t4 + t6;
+    t3 = t9 - t2;
+    t10 = t7 - t13;
+    t12 = t0 - t14;
+    t8 = t4 - t6;
+    t7 = t9 + t2;
+    t13 = C113 * t5;
+    t0 = C114 * t1;
+    t14 = t13 + t0;
+    t4 = 0.0008904224612424559 * t14;
+    y[92] = t4;
+    t6 = (-0.07217823591153531) * t14;
+    y[267] = t6;
+    t9 = (-C114) * t5;
+    t2 = C113 * t1;
+    t13 = t9 + t2;
+    t0 = 0.07662874054739717 * t13;
+    y[452] = t0;
+    t4 = 0.027659053756716335 * t13;
+    y[627] = t4;
+    t14 = (-C115) * t11;
+    t6 = (-C116) * t3;
+    t5 = t14 + t6;
+    t1 = 0.07315722926378804 * t5;
+    y[537] = t1;
+    t9 = 0.07161384860400806 * t5;
+    y[542] = t9;
+    t2 = C116 * t11;
+    t0 = (-C115) * t3;
+    t13 = t2 + t0;
+    t4 = 0.03688166728156738 * t13;
+    y[177] = t4;
+    t14 = (-0.03983635585871724) * t13;
+    y[182] = t14;
+    t6 = (-C117) * t10;
+    t1 = (-C118) * t12;
+    t5 = t6 + t1;
+    t9 = 0.07615249922661345 * t5;
+    y[447] = t9;
+    t11 = 0.02492643432648059 * t5;
+    y[632] = t11;
+    t3 = C118 * t10;
+    t2 = (-C117) * t12;
+    t0 = t3 + t2;
+    t4 = 0.00043428713575801746 * t0;
+    y[87] = t4;
+    t13 = (-0.07281087793701063) * t0;
+    y[272] = t13;
+    t14 = C119 * t8;
+    t6 = C120 * t7;
+    t1 = t14 + t6;
+    y[2] = 0;
+    t9 = (-0.07461077435802718) * t1;
+    y[357] = t9;
+    t5 = (-C120) * t8;
+    t11 = C119 * t7;
+    t10 = t5 + t11;
+    t12 = 0.07446049988566894 * t10;
+    y[362] = t12;
+    t3 = 0.00020042753244037563 * t10;
+    y[717] = t3;
+}
+
+/**
+ *  Part 5 of ApplyWindowedIMDCT_W75_360().
+ * 
+ *  @param {Number[]} X 
+ *    - The input block (360 points).
+ *  @param {Number[]} y 
+ *    - The array that would contain the output block (720 points).
+ *  @param {Number[]} re 
+ *    - The scratch buffer (real part, 180 points).
+ *  @param {Number[]} im 
+ *    - The scratch buffer (imaginary part, 180 points).
+ */
+function ApplyWindowedIMDCT_W75_360_Part5(X, y, re, im) {
+    let t0, t1, t10, t11, t12, t13, t14, t2, t3, t4, t5, t6, t7, t8, t9;
+    const C0 = 0.6930873625456359;
+    const C1 = 0.7208535967029188;
+    const C2 = 0.36447049987914965;
+    const C3 = 0.9312149347588036;
+    const C4 = 0.9998072404820648;
+    const C5 = 0.0196336924606283;
+    const C6 = 0.916187957117136;
+    const C7 = 0.40074883310314097;
+    const C8 = 0.9126559225690792;
+    const C9 = 0.40872872054650483;
+    const C10 = 0.68677041740185;
+    const C11 = 0.7268744002795041;
+    const C12 = 0.3563303417745256;
+    const C13 = 0.9343600417027955;
+    const C14 = 0.9995978367717061;
+    const C15 = 0.02835779824537842;
+    const C16 = 0.9993123098159769;
+    const C17 = 0.037079744474000476;
+    const C18 = 0.9090543857390279;
+    const C19 = 0.4166774817153415;
+    const C20 = 0.6804011720318391;
+    const C21 = 0.7328398495562994;
+    const C22 = 0.34816304773478646;
+    const C23 = 0.9374339935120898;
+    const C24 = 0.3399692397309942;
+    const C25 = 0.9404365560933549;
+    const C26 = 0.9989506813588601;
+    const C27 = 0.04579886693652077;
+    const C28 = 0.9053836208979552;
+    const C29 = 0.4245945112807131;
+    const C30 = 0.6739801114782978;
+    const C31 = 0.7387494902412463;
+    const C32 = 0.6675077247298474;
+    const C33 = 0.7446028722923262;
+    const C34 = 0.3317495417533521;
+    const C35 = 0.9433675007898252;
+    const C36 = 0.9985129789397631;
+    const C37 = 0.05451450163800632;
+    const C38 = 0.9016439075888161;
+    const C39 = 0.4324792063301662;
+    const C40 = 0.8978355306052577;
+    const C41 = 0.44033096641364594;
+    const C42 = 0.6609845046837974;
+    const C43 = 0.750399549951834;
+    const C44 = 0.3235045797636848;
+    const C45 = 0.9462266043987146;
+    const C46 = 0.9979992358914197;
+    const C47 = 0.06322598484913067;
+    const C48 = 0.9974094913373519;
+    const C49 = 0.07193265315671939;
+    const C50 = 0.8939587799699321;
+    const C51 = 0.44814919358922256;
+    const C52 = 0.6544109481086103;
+    const C53 = 0.7561390817803227;
+    const C54 = 0.31523498164776964;
+    const C55 = 0.949013649188214;
+    const C56 = 0.3069413771675201;
+    const C57 = 0.9517284229140717;
+    const C58 = 0.996743790188891;
+    const C59 = 0.08063384351427165;
+    const C60 = 0.8900139509124098;
+    const C61 = 0.4559332924686272;
+    const C62 = 0.6477875556060698;
+    const C63 = 0.7618210306902226;
+    const C64 = 0.6411148315731583;
+    const C65 = 0.7674449639791253;
+    const C66 = 0.2986243979130275;
+    const C67 = 0.9543707188357582;
+    const C68 = 0.9960021831417567;
+    const C69 = 0.08932889329245366;
+    const C70 = 0.8860013438466962;
+    const C71 = 0.46368267026259297;
+    const C72 = 0.881921264348355;
+    const C73 = 0.47139673682599764;
+    const C74 = 0.6343932841636455;
+    const C75 = 0.773010453362737;
+    const C76 = 0.29028467725446233;
+    const C77 = 0.9569403357322088;
+    const C78 = 0.9951847266721969;
+    const C79 = 0.0980171403295606;
+    const C80 = 0.9942914830326867;
+    const C81 = 0.10669792298194263;
+    const C82 = 0.8777740231312368;
+    const C83 = 0.47907490470280634;
+    const C84 = 0.6276234252493902;
+    const C85 = 0.7785170750074935;
+    const C86 = 0.28192285029384145;
+    const C87 = 0.9594370779171484;
+    const C88 = 0.27353955381666206;
+    const C89 = 0.9618607552539928;
+    const C90 = 0.9933225202471875;
+    const C91 = 0.1153705801743918;
+    const C92 = 0.8735599360238168;
+    const C93 = 0.4867165891708081;
+    const C94 = 0.6208057703813592;
+    const C95 = 0.7839644095628366;
+    const C96 = 0.6139408387503664;
+    const C97 = 0.78935204219315;
+    const C98 = 0.265135426243408;
+    const C99 = 0.9642111831703293;
+    const C100 = 0.992277912105967;
+    const C101 = 0.12403445145048532;
+    const C102 = 0.8692793239451436;
+    const C103 = 0.4943212082861446;
+    const C104 = 0.8649325128804005;
+    const C105 = 0.5018881829276276;
+    const C106 = 0.6070291531475343;
+    const C107 = 0.7946795626093497;
+    const C108 = 0.256711107580932;
+    const C109 = 0.966488182671972;
+    const C110 = 0.9911577381599795;
+    const C111 = 0.13268887702288198;
+    const C112 = 0.9899620837148079;
+    const C113 = 0.14133319782356749;
+    const C114 = 0.860519833856079;
+    const C115 = 0.5094169368408418;
+    const C116 = 0.6000712399244809;
+    const C117 = 0.7999465651001297;
+    const C118 = 0.24826723937371628;
+    const C119 = 0.9686915803565931;
+    const C120 = 0.23980446465501654;
+    const C121 = 0.9708212084269281;
+    const C122 = 0.9886910398241674;
+    const C123 = 0.149966755554045;
+    const C124 = 0.8560416229147715;
+    const C125 = 0.5169068966820275;
+    const C126 = 0.5930676289532372;
+    const C127 = 0.8051526485628582;
+    const C128 = 0.5860188535858938;
+    const C129 = 0.8102974165341235;
+    const C130 = 0.23132342789789254;
+    const C131 = 0.9728769047035543;
+    const C132 = 0.9873447032829712;
+    const C133 = 0.15858889273546717;
+    const C134 = 0.851498221089579;
+    const C135 = 0.5243574920617445;
+    const C136 = 0.8468899743781412;
+    const C137 = 0.5317681555883085;
+    const C138 = 0.5789254506139857;
+    const C139 = 0.8153804772199257;
+    const C140 = 0.22282477496612907;
+    const C141 = 0.9748585126372411;
+    const C142 = 0.9859231766199597;
+    const C143 = 0.16719895275870564;
+    const C144 = 0.9844265680898916;
+    const C145 = 0.1757962799343545;
+    const C146 = 0.8422172337162865;
+    const C147 = 0.5391383229110002;
+    const C148 = 0.5717879602276122;
+    const C149 = 0.8204014435255136;
+    const C150 = 0.21430915306505077;
+    const C151 = 0.9767658813208724;
+    const C152 = 0.2057772106922349;
+    const C153 = 0.9785988655009383;
+    const C154 = 0.9828549916653012;
+    const C155 = 0.18438021954266337;
+    const C156 = 0.8374803549513079;
+    const C157 = 0.5464674327630434;
+    const C158 = 0.5646069259743004;
+    const C159 = 0.8253599330848638;
+    const C160 = 0.557382894717611;
+    const C161 = 0.8302555682897986;
+    const C162 = 0.19722959758812594;
+    const C163 = 0.9803573255885968;
+    const C164 = 0.9812085670278176;
+    const C165 = 0.19295011788339703;
+    const C166 = 0.8326796988148626;
+    const C167 = 0.553754927004347;
+    const C168 = 0.8278156308955021;
+    const C169 = 0.5610002506640098;
+    const C170 = 0.5501164165954934;
+    const C171 = 0.8350879763187431;
+    const C172 = 0.18866696468655522;
+    const C173 = 0.9820411276703039;
+    const C174 = 0.9794874195590514;
+    const C175 = 0.20150532232561713;
+    const C176 = 0.977691680331046;
+    const C177 = 0.2100451813573825;
+    const C178 = 0.8228885216108303;
+    const C179 = 0.5682028519825839;
+    const C180 = 0.5428080449783895;
+    const C181 = 0.8398567891651163;
+    const C182 = 0.1800899640651698;
+    const C183 = 0.9836501435180122;
+    const C184 = 0.17149924889577414;
+    const C185 = 0.9851842505989351;
+    const C186 = 0.9758214860962962;
+    const C187 = 0.21856904463536458;
+    const C188 = 0.8178987461792955;
+    const C189 = 0.5753621824540925;
+    const C190 = 0.5354583364270938;
+    const C191 = 0.8445616436653568;
+    const C192 = 0.528067850650368;
+    const C193 = 0.8492021815265789;
+    const C194 = 0.16289547339458874;
+    const C195 = 0.986643332084879;
+    const C196 = 0.9738769792773336;
+    const C197 = 0.22707626303437323;
+    const C198 = 0.8128466845916152;
+    const C199 = 0.5824776968678022;
+    t2 = re[12];
+    t4 = im[12];
+    t0 = re[57];
+    t13 = im[57];
+    t14 = re[102];
+    t6 = im[102];
+    t1 = re[147];
+    t9 = im[147];
+    t8 = t2 + t14;
+    t7 = t4 + t6;
+    t5 = t0 + t1;
+    t11 = t13 + t9;
+    t12 = t2 - t14;
+    t10 = t4 - t6;
+    t3 = t0 - t1;
+    t2 = t13 - t9;
+    t14 = t8 + t5;
+    t4 = t7 + t11;
+    t6 = t12 + t2;
+    t0 = t10 - t3;
+    t1 = t8 - t5;
+    t13 = t7 - t11;
+    t9 = t12 - t2;
+    t8 = t10 + t3;
+    t5 = C0 * t14;
+    t7 = C1 * t4;
+    t11 = t5 + t7;
+    y[4] = 0;
+    t12 = (-0.0746705385692672) * t11;
+    y[355] = t12;
+    t2 = (-C1) * t14;
+    t10 = C0 * t4;
+    t3 = t2 + t10;
+    t5 = 0.0744009037835185 * t3;
+    y[364] = t5;
+    t7 = 0.0002839913808099415 * t3;
+    y[715] = t7;
+    t11 = C2 * t6;
+    t12 = C3 * t0;
+    t14 = t11 + t12;
+    t4 = 0.001126420177114152 * t14;
+    y[94] = t4;
+    t2 = (-0.07189555032362745) * t14;
+    y[265] = t2;
+    t10 = (-C3) * t6;
+    t5 = C2 * t0;
+    t3 = t10 + t5;
+    t7 = 0.07682175494009395 * t3;
+    y[454] = t7;
+    t11 = 0.02877541433401703 * t3;
+    y[625] = t11;
+    t12 = (-C4) * t1;
+    t4 = (-C5) * t13;
+    t14 = t12 + t4;
+    t2 = 0.07372511469768803 * t14;
+    y[535] = t2;
+    t6 = 0.07094747087527041 * t14;
+    y[544] = t6;
+    t0 = C5 * t1;
+    t10 = (-C4) * t13;
+    t5 = t0 + t10;
+    t7 = 0.03569218332318732 * t5;
+    y[175] = t7;
+    t3 = (-0.041007537677709524) * t5;
+    y[184] = t3;
+    t11 = (-C6) * t9;
+    t12 = (-C7) * t8;
+    t4 = t11 + t12;
+    t2 = 0.07596722926088151 * t4;
+    y[445] = t2;
+    t14 = 0.023859207739252954 * t4;
+    y[634] = t14;
+    t6 = C7 * t9;
+    t1 = (-C6) * t8;
+    t13 = t6 + t1;
+    t0 = 0.0002998948177058382 * t13;
+    y[85] = t0;
+    t10 = (-0.07303676015017009) * t13;
+    y[274] = t10;
+    t7 = re[128];
+    t5 = im[128];
+    t3 = re[173];
+    t11 = im[173];
+    t12 = re[38];
+    t2 = im[38];
+    t4 = re[83];
+    t14 = im[83];
+    t9 = t7 + t12;
+    t8 = t5 + t2;
+    t6 = t3 + t4;
+    t1 = t11 + t14;
+    t0 = t7 - t12;
+    t13 = t5 - t2;
+    t10 = t3 - t4;
+    t7 = t11 - t14;
+    t12 = t9 + t6;
+    t5 = t8 + t1;
+    t2 = t0 + t7;
+    t3 = t13 - t10;
+    t4 = t9 - t6;
+    t11 = t8 - t1;
+    t14 = t0 - t7;
+    t9 = t13 + t10;
+    t6 = (-C8) * t12;
+    t8 = (-C9) * t5;
+    t1 = t6 + t8;
+    t0 = 0.07581464632180492 * t1;
+    y[443] = t0;
+    t7 = 0.022808210591671367 * t1;
+    y[636] = t7;
+    t13 = C9 * t12;
+    t10 = (-C8) * t5;
+    t6 = t13 + t10;
+    y[83] = 0;
+    t8 = (-0.07327813061310468) * t6;
+    y[276] = t8;
+    t0 = C10 * t2;
+    t1 = C11 * t3;
+    t7 = t0 + t1;
+    y[6] = 0;
+    t12 = (-0.07472961231384904) * t7;
+    y[353] = t12;
+    t5 = (-C11) * t2;
+    t13 = C10 * t3;
+    t10 = t5 + t13;
+    t6 = 0.07434208988296852 * t10;
+    y[366] = t6;
+    t8 = 0.0003841335513603814 * t10;
+    y[713] = t8;
+    t0 = C12 * t4;
+    t1 = C13 * t11;
+    t7 = t0 + t1;
+    t12 = 0.0013951437018800152 * t7;
+    y[96] = t12;
+    t2 = (-0.07159449802127518) * t7;
+    y[263] = t2;
+    t3 = (-C13) * t4;
+    t5 = C12 * t11;
+    t13 = t3 + t5;
+    t6 = 0.07701480239856939 * t13;
+    y[456] = t6;
+    t10 = 0.02990332649322146 * t13;
+    y[623] = t10;
+    t8 = (-C14) * t14;
+    t0 = (-C15) * t9;
+    t1 = t8 + t0;
+    t12 = 0.07426485204615321 * t1;
+    y[533] = t12;
+    t7 = 0.07025377921076166 * t1;
+    y[546] = t7;
+    t2 = C15 * t14;
+    t4 = (-C14) * t9;
+    t11 = t2 + t4;
+    t3 = 0.03450067624018114 * t11;
+    y[173] = t3;
+    t5 = (-0.04217005188954833) * t11;
+    y[186] = t5;
+    t6 = re[44];
+    t13 = im[44];
+    t10 = re[89];
+    t8 = im[89];
+    t0 = re[134];
+    t12 = im[134];
+    t1 = re[179];
+    t7 = im[179];
+    t14 = t6 + t0;
+    t9 = t13 + t12;
+    t2 = t10 + t1;
+    t4 = t8 + t7;
+    t3 = t6 - t0;
+    t11 = t13 - t12;
+    t5 = t10 - t1;
+    t6 = t8 - t7;
+    t0 = t14 + t2;
+    t13 = t9 + t4;
+    t12 = t3 + t6;
+    t10 = t11 - t5;
+    t1 = t14 - t2;
+    t8 = t9 - t4;
+    t7 = t3 - t6;
+    t14 = t11 + t5;
+    t2 = (-C16) * t0;
+    t9 = (-C17) * t13;
+    t4 = t2 + t9;
+    t3 = 0.07477620946977974 * t4;
+    y[531] = t3;
+    t6 = 0.06953296335829233 * t4;
+    y[548] = t6;
+    t11 = C17 * t0;
+    t5 = (-C16) * t13;
+    t2 = t11 + t5;
+    t9 = 0.03330865582833472 * t2;
+    y[171] = t9;
+    t3 = (-0.043322682886716854) * t2;
+    y[188] = t3;
+    t4 = (-C18) * t12;
+    t6 = (-C19) * t10;
+    t0 = t4 + t6;
+    t13 = 0.07562514791656519 * t0;
+    y[441] = t13;
+    t11 = 0.02177426790135979 * t0;
+    y[638] = t11;
+    t5 = C19 * t12;
+    t9 = (-C18) * t10;
+    t2 = t5 + t9;
+    y[81] = 0;
+    t3 = (-0.07346174795829588) * t2;
+    y[278] = t3;
+    t4 = C20 * t1;
+    t6 = C21 * t8;
+    t13 = t4 + t6;
+    y[8] = 0;
+    t0 = (-0.07478763968520208) * t13;
+    y[351] = t0;
+    t11 = (-C21) * t1;
+    t12 = C20 * t8;
+    t10 = t11 + t12;
+    t5 = 0.07428440821157253 * t10;
+    y[368] = t5;
+    t9 = 0.0005022724154049494 * t10;
+    y[711] = t9;
+    t2 = C22 * t7;
+    t3 = C23 * t14;
+    t4 = t2 + t3;
+    t6 = 0.0016976417542155023 * t4;
+    y[98] = t6;
+    t13 = (-0.07127424888219953) * t4;
+    y[261] = t13;
+    t0 = (-C23) * t7;
+    t1 = C22 * t14;
+    t8 = t0 + t1;
+    t11 = 0.07720681608342408 * t8;
+    y[458] = t11;
+    t12 = 0.031041726260868836 * t8;
+    y[621] = t12;
+    t5 = re[140];
+    t10 = im[140];
+    t9 = re[5];
+    t2 = im[5];
+    t3 = re[50];
+    t6 = im[50];
+    t4 = re[95];
+    t13 = im[95];
+    t7 = t5 + t3;
+    t14 = t10 + t6;
+    t0 = t9 + t4;
+    t1 = t2 + t13;
+    t11 = t5 - t3;
+    t8 = t10 - t6;
+    t12 = t9 - t4;
+    t5 = t2 - t13;
+    t3 = t7 + t0;
+    t10 = t14 + t1;
+    t6 = t11 + t5;
+    t9 = t8 - t12;
+    t4 = t7 - t0;
+    t2 = t14 - t1;
+    t13 = t11 - t5;
+    t7 = t8 + t12;
+    t0 = C24 * t3;
+    t14 = C25 * t10;
+    t1 = t0 + t14;
+    t11 = 0.0020347072928291257 * t1;
+    y[100] = t11;
+    t5 = (-0.07093433826861917) * t1;
+    y[259] = t5;
+    t8 = (-C25) * t3;
+    t12 = C24 * t10;
+    t0 = t8 + t12;
+    t14 = 0.07739634901064964 * t0;
+    y[460] = t14;
+    t11 = 0.032189767200842816 * t0;
+    y[619] = t11;
+    t1 = (-C26) * t6;
+    t5 = (-C27) * t9;
+    t3 = t1 + t5;
+    t10 = 0.07525864895163345 * t3;
+    y[529] = t10;
+    t8 = 0.06878508710053848 * t3;
+    y[550] = t8;
+    t12 = C27 * t6;
+    t14 = (-C26) * t9;
+    t0 = t12 + t14;
+    t11 = 0.03211724980597228 * t0;
+    y[169] = t11;
+    t1 = (-0.04446489243213255) * t0;
+    y[190] = t1;
+    t5 = (-C28) * t4;
+    t10 = (-C29) * t2;
+    t3 = t5 + t10;
+    t8 = 0.07544569193026901 * t3;
+    y[439] = t8;
+    t6 = 0.02075805547774038 * t3;
+    y[640] = t6;
+    t9 = C29 * t4;
+    t12 = (-C28) * t2;
+    t14 = t9 + t12;
+    y[79] = 0;
+    t11 = (-0.07363648491275424) * t14;
+    y[280] = t11;
+    t0 = C30 * t13;
+    t1 = C31 * t7;
+    t5 = t0 + t1;
+    y[10] = 0;
+    t10 = (-0.07484429201598877) * t5;
+    y[349] = t10;
+    t8 = (-C31) * t13;
+    t3 = C30 * t7;
+    t6 = t8 + t3;
+    t4 = 0.07422817967693168 * t6;
+    y[370] = t4;
+    t2 = 0.0006397848555590884 * t6;
+    y[709] = t2;
+    t9 = re[76];
+    t12 = im[76];
+    t14 = re[121];
+    t11 = im[121];
+    t0 = re[166];
+    t1 = im[166];
+    t5 = re[31];
+    t10 = im[31];
+    t13 = t9 + t0;
+    t7 = t12 + t1;
+    t8 = t14 + t5;
+    t3 = t11 + t10;
+    t4 = t9 - t0;
+    t6 = t12 - t1;
+    t2 = t14 - t5;
+    t9 = t11 - t10;
+    t0 = t13 + t8;
+    t12 = t7 + t3;
+    t1 = t4 + t9;
+    t14 = t6 - t2;
+    t5 = t13 - t8;
+    t11 = t7 - t3;
+    t10 = t4 - t9;
+    t13 = t6 + t2;
+    t8 = C32 * t0;
+    t7 = C33 * t12;
+    t3 = t8 + t7;
+    y[12] = 0;
+    t4 = (-0.07489920785476051) * t3;
+    y[347] = t4;
+    t9 = (-C33) * t0;
+    t6 = C32 * t12;
+    t2 = t9 + t6;
+    t8 = 0.07417375583368668 * t2;
+    y[372] = t8;
+    t7 = 0.0007979837397111069 * t2;
+    y[707] = t7;
+    t3 = C34 * t1;
+    t4 = C35 * t14;
+    t0 = t3 + t4;
+    t12 = 0.0024068981659060083 * t0;
+    y[102] = t12;
+    t9 = (-0.07057379992151286) * t0;
+    y[257] = t9;
+    t6 = (-C35) * t1;
+    t8 = C34 * t14;
+    t2 = t6 + t8;
+    t7 = 0.07758254548835453 * t2;
+    y[462] = t7;
+    t3 = 0.033346035987584 * t2;
+    y[617] = t3;
+    t4 = (-C36) * t5;
+    t12 = (-C37) * t11;
+    t0 = t4 + t12;
+    t9 = 0.07571198972050501 * t0;
+    y[527] = t9;
+    t1 = 0.0680104978428295 * t0;
+    y[552] = t1;
+    t14 = C37 * t5;
+    t6 = (-C36) * t11;
+    t8 = t14 + t6;
+    t7 = 0.0309286123492606 * t8;
+    y[167] = t7;
+    t2 = (-0.04559496117904212) * t8;
+    y[192] = t2;
+    t3 = (-C38) * t10;
+    t4 = (-C39) * t13;
+    t12 = t3 + t4;
+    t9 = 0.07527606842734347 * t12;
+    y[437] = t9;
+    t0 = 0.019760759384634594 * t12;
+    y[642] = t0;
+    t1 = C39 * t10;
+    t5 = (-C38) * t13;
+    t11 = t1 + t5;
+    y[77] = 0;
+    t14 = (-0.07380241385637434) * t11;
+    y[282] = t14;
+    t6 = re[172];
+    t7 = im[172];
+    t8 = re[37];
+    t2 = im[37];
+    t3 = re[82];
+    t4 = im[82];
+    t9 = re[127];
+    t12 = im[127];
+    t0 = t6 + t3;
+    t10 = t7 + t4;
+    t13 = t8 + t9;
+    t1 = t2 + t12;
+    t5 = t6 - t3;
+    t11 = t7 - t4;
+    t14 = t8 - t9;
+    t6 = t2 - t12;
+    t3 = t0 + t13;
+    t7 = t10 + t1;
+    t4 = t5 + t6;
+    t8 = t11 - t14;
+    t9 = t0 - t13;
+    t2 = t10 - t1;
+    t12 = t5 - t6;
+    t0 = t11 + t14;
+    t13 = (-C40) * t3;
+    t10 = (-C41) * t7;
+    t1 = t13 + t10;
+    t5 = 0.07511619859431522 * t1;
+    y[435] = t5;
+    t6 = 0.018783265486367183 * t1;
+    y[644] = t6;
+    t11 = C41 * t3;
+    t14 = (-C40) * t7;
+    t13 = t11 + t14;
+    y[75] = 0;
+    t10 = (-0.07395948756086279) * t13;
+    y[284] = t10;
+    t5 = C42 * t4;
+    t1 = C43 * t8;
+    t6 = t5 + t1;
+    y[14] = 0;
+    t3 = (-0.07495205222248426) * t6;
+    y[345] = t3;
+    t7 = (-C43) * t4;
+    t11 = C42 * t8;
+    t14 = t7 + t11;
+    t13 = 0.07412146019784352 * t14;
+    y[374] = t13;
+    t10 = 0.000977833493522871 * t14;
+    y[705] = t10;
+    t5 = C44 * t9;
+    t1 = C45 * t2;
+    t6 = t5 + t1;
+    t3 = 0.0028145556758956444 * t6;
+    y[104] = t3;
+    t4 = (-0.07019154559098635) * t6;
+    y[255] = t4;
+    t8 = (-C45) * t9;
+    t7 = C44 * t2;
+    t11 = t8 + t7;
+    t13 = 0.07776474091872976 * t11;
+    y[464] = t13;
+    t14 = 0.034509247345545814 * t11;
+    y[615] = t14;
+    t10 = (-C46) * t12;
+    t5 = (-C47) * t0;
+    t1 = t10 + t5;
+    t3 = 0.07613711365134428 * t1;
+    y[525] = t3;
+    t6 = 0.06720997326121436 * t1;
+    y[554] = t6;
+    t4 = C47 * t12;
+    t9 = (-C46) * t0;
+    t2 = t4 + t9;
+    t8 = 0.029743628280473965 * t2;
+    y[165] = t8;
+    t7 = (-0.04671160914268008) * t2;
+    y[194] = t7;
+    t13 = re[88];
+    t11 = im[88];
+    t14 = re[133];
+    t10 = im[133];
+    t5 = re[178];
+    t3 = im[178];
+    t1 = re[43];
+    t6 = im[43];
+    t12 = t13 + t5;
+    t0 = t11 + t3;
+    t4 = t14 + t1;
+    t9 = t10 + t6;
+    t8 = t13 - t5;
+    t2 = t11 - t3;
+    t7 = t14 - t1;
+    t13 = t10 - t6;
+    t5 = t12 + t4;
+    t11 = t0 + t9;
+    t3 = t8 + t13;
+    t14 = t2 - t7;
+    t1 = t12 - t4;
+    t10 = t0 - t9;
+    t6 = t8 - t13;
+    t12 = t2 + t7;
+    t4 = (-C48) * t5;
+    t0 = (-C49) * t11;
+    t9 = t4 + t0;
+    t8 = 0.07653423786690212 * t9;
+    y[523] = t8;
+    t13 = 0.06638406702686302 * t9;
+    y[556] = t13;
+    t2 = C49 * t5;
+    t7 = (-C48) * t11;
+    t4 = t2 + t7;
+    t0 = 0.028564578122477702 * t4;
+    y[163] = t0;
+    t8 = (-0.047812884649648266) * t4;
+    y[196] = t8;
+    t9 = (-C50) * t3;
+    t13 = (-C51) * t14;
+    t5 = t9 + t13;
+    t11 = 0.07496630414092705 * t5;
+    y[433] = t11;
+    t2 = 0.017826525775521376 * t5;
+    y[646] = t2;
+    t7 = C51 * t3;
+    t0 = (-C50) * t14;
+    t4 = t7 + t0;
+    y[73] = 0;
+    t8 = (-0.07410736889352079) * t4;
+    y[286] = t8;
+    t9 = C52 * t1;
+    t13 = C53 * t10;
+    t11 = t9 + t13;
+    y[16] = 0;
+    t5 = (-0.0750024847199091) * t11;
+    y[343] = t5;
+    t2 = (-C53) * t1;
+    t3 = C52 * t10;
+    t14 = t2 + t3;
+    t7 = 0.07407162011101821 * t14;
+    y[376] = t7;
+    t0 = 0.0011801616573000912 * t14;
+    y[703] = t0;
+    t4 = C54 * t6;
+    t8 = C55 * t12;
+    t9 = t4 + t8;
+    t13 = 0.0032578351613788224 * t9;
+    y[106] = t13;
+    t11 = (-0.06978698274465173) * t9;
+    y[253] = t11;
+    t5 = (-C55) * t6;
+    t1 = C54 * t12;
+    t10 = t5 + t1;
+    t2 = 0.07794177142410044 * t10;
+    y[466] = t2;
+    t3 = 0.035678446679014125 * t10;
+    y[613] = t3;
+    t7 = re[144];
+    t14 = im[144];
+    t0 = re[9];
+    t4 = im[9];
+    t8 = re[54];
+    t13 = im[54];
+    t9 = re[99];
+    t11 = im[99];
+    t6 = t7 + t8;
+    t12 = t14 + t13;
+    t5 = t0 + t9;
+    t1 = t4 + t11;
+    t2 = t7 - t8;
+    t10 = t14 - t13;
+    t3 = t0 - t9;
+    t7 = t4 - t11;
+    t8 = t6 + t5;
+    t14 = t12 + t1;
+    t13 = t2 + t7;
+    t0 = t10 - t3;
+    t9 = t6 - t5;
+    t4 = t12 - t1;
+    t11 = t2 - t7;
+    t6 = t10 + t3;
+    t5 = C56 * t8;
+    t12 = C57 * t14;
+    t1 = t5 + t12;
+    t2 = 0.0037367281520488786 * t1;
+    y[108] = t2;
+    t7 = (-0.06935991088229848) * t1;
+    y[251] = t7;
+    t10 = (-C57) * t8;
+    t3 = C56 * t14;
+    t5 = t10 + t3;
+    t12 = 0.07811209041394841 * t5;
+    y[468] = t12;
+    t2 = 0.03685254051423165 * t5;
+    y[611] = t2;
+    t1 = (-C58) * t13;
+    t7 = (-C59) * t0;
+    t8 = t1 + t7;
+    t14 = 0.07690288192773581 * t8;
+    y[521] = t14;
+    t10 = 0.06553374995687641 * t8;
+    y[558] = t10;
+    t3 = C59 * t13;
+    t12 = (-C58) * t0;
+    t5 = t3 + t12;
+    t2 = 0.02739198624153461 * t5;
+    y[161] = t2;
+    t1 = (-0.04889876535334858) * t5;
+    y[198] = t1;
+    t7 = (-C60) * t9;
+    t14 = (-C61) * t4;
+    t8 = t7 + t14;
+    t10 = 0.07482598399384086 * t8;
+    y[431] = t10;
+    t13 = 0.01689105598606925 * t8;
+    y[648] = t13;
+    t0 = C61 * t9;
+    t3 = (-C60) * t4;
+    t12 = t0 + t3;
+    y[71] = 0;
+    t2 = (-0.07424634143151193) * t12;
+    y[288] = t2;
+    t5 = C62 * t11;
+    t1 = C63 * t6;
+    t7 = t5 + t1;
+    y[18] = 0;
+    t14 = (-0.07505017829539895) * t7;
+    y[341] = t14;
+    t10 = (-C63) * t11;
+    t8 = C62 * t6;
+    t13 = t10 + t8;
+    t9 = 0.07402454839865644 * t13;
+    y[378] = t9;
+    t4 = 0.0014056274459970663 * t13;
+    y[701] = t4;
+    t0 = re[60];
+    t3 = im[60];
+    t12 = re[105];
+    t2 = im[105];
+    t5 = re[150];
+    t1 = im[150];
+    t7 = re[15];
+    t14 = im[15];
+    t11 = t0 + t5;
+    t6 = t3 + t1;
+    t10 = t12 + t7;
+    t8 = t2 + t14;
+    t9 = t0 - t5;
+    t13 = t3 - t1;
+    t4 = t12 - t7;
+    t0 = t2 - t14;
+    t5 = t11 + t10;
+    t3 = t6 + t8;
+    t1 = t9 + t0;
+    t12 = t13 - t4;
+    t7 = t11 - t10;
+    t2 = t6 - t8;
+    t14 = t9 - t0;
+    t11 = t13 + t4;
+    t10 = C64 * t5;
+    t6 = C65 * t3;
+    t8 = t10 + t6;
+    y[20] = 0;
+    t9 = (-0.07509479364736635) * t8;
+    y[339] = t9;
+    t0 = (-C65) * t5;
+    t13 = C64 * t3;
+    t4 = t0 + t13;
+    t10 = 0.07398056890126894 * t4;
+    y[380] = t10;
+    t6 = 0.0016551485214856972 * t4;
+    y[699] = t6;
+    t8 = C66 * t1;
+    t9 = C67 * t12;
+    t5 = t8 + t9;
+    t3 = 0.004251091028882468 * t5;
+    y[110] = t3;
+    t0 = (-0.06890962178717301) * t5;
+    y[249] = t0;
+    t13 = (-C67) * t1;
+    t10 = C66 * t12;
+    t4 = t13 + t10;
+    t6 = 0.07827477964699882 * t4;
+    y[470] = t6;
+    t8 = 0.03803025941062032 * t4;
+    y[609] = t8;
+    t9 = (-C68) * t7;
+    t3 = (-C69) * t2;
+    t5 = t9 + t3;
+    t0 = 0.07724297509017906 * t5;
+    y[519] = t0;
+    t1 = 0.06465935512789801 * t5;
+    y[560] = t1;
+    t12 = C69 * t7;
+    t13 = (-C68) * t2;
+    t10 = t12 + t13;
+    t6 = 0.026228131666691412 * t10;
+    y[159] = t6;
+    t4 = (-0.0499677992888239) * t10;
+    y[200] = t4;
+    t8 = (-C70) * t14;
+    t9 = (-C71) * t11;
+    t3 = t8 + t9;
+    t0 = 0.07469517305545602 * t3;
+    y[429] = t0;
+    t5 = 0.01597743799899386 * t3;
+    y[650] = t5;
+    t1 = C71 * t14;
+    t7 = (-C70) * t11;
+    t2 = t1 + t7;
+    y[69] = 0;
+    t12 = (-0.07437636634740691) * t2;
+    y[290] = t12;
+    t13 = re[156];
+    t6 = im[156];
+    t10 = re[21];
+    t4 = im[21];
+    t8 = re[66];
+    t9 = im[66];
+    t0 = re[111];
+    t3 = im[111];
+    t5 = t13 + t8;
+    t14 = t6 + t9;
+    t11 = t10 + t0;
+    t1 = t4 + t3;
+    t7 = t13 - t8;
+    t2 = t6 - t9;
+    t12 = t10 - t0;
+    t13 = t4 - t3;
+    t8 = t5 + t11;
+    t6 = t14 + t1;
+    t9 = t7 + t13;
+    t10 = t2 - t12;
+    t0 = t5 - t11;
+    t4 = t14 - t1;
+    t3 = t7 - t13;
+    t5 = t2 + t12;
+    t11 = (-C72) * t8;
+    t14 = (-C73) * t6;
+    t1 = t11 + t14;
+    t7 = 0.07457395540421297 * t1;
+    y[427] = t7;
+    t13 = 0.015086781910979527 * t1;
+    y[652] = t13;
+    t2 = C73 * t8;
+    t12 = (-C72) * t6;
+    t11 = t2 + t12;
+    y[67] = 0;
+    t14 = (-0.07449726282376734) * t11;
+    y[292] = t14;
+    t7 = C74 * t9;
+    t1 = C75 * t10;
+    t13 = t7 + t1;
+    y[22] = 0;
+    t8 = (-0.07513597558736292) * t13;
+    y[337] = t8;
+    t6 = (-C75) * t9;
+    t2 = C74 * t10;
+    t12 = t6 + t2;
+    t11 = 0.07394002023832033 * t12;
+    y[382] = t11;
+    t14 = 0.0019296043732207938 * t12;
+    y[697] = t14;
+    t7 = C76 * t0;
+    t1 = C77 * t4;
+    t13 = t7 + t1;
+    t8 = 0.004800668688217836 * t13;
+    y[112] = t8;
+    t9 = (-0.06843511489527315) * t13;
+    y[247] = t9;
+    t10 = (-C77) * t0;
+    t6 = C76 * t4;
+    t2 = t10 + t6;
+    t11 = 0.07842932782810454 * t2;
+    y[472] = t11;
+    t12 = 0.039210265632819354 * t2;
+    y[607] = t12;
+    t14 = (-C78) * t3;
+    t7 = (-C79) * t5;
+    t1 = t14 + t7;
+    t8 = 0.07755518221415482 * t1;
+    y[517] = t8;
+    t13 = 0.0637612778454389 * t1;
+    y[562] = t13;
+    t9 = C79 * t3;
+    t0 = (-C78) * t5;
+    t4 = t9 + t0;
+    t10 = 0.025074379332856854 * t4;
+    y[157] = t10;
+    t6 = (-0.05101891292299967) * t4;
+    y[202] = t6;
+    t11 = re[92];
+    t2 = im[92];
+    t12 = re[137];
+    t14 = im[137];
+    t7 = re[2];
+    t8 = im[2];
+    t1 = re[47];
+    t13 = im[47];
+    t3 = t11 + t7;
+    t5 = t2 + t8;
+    t9 = t12 + t1;
+    t0 = t14 + t13;
+    t10 = t11 - t7;
+    t4 = t2 - t8;
+    t6 = t12 - t1;
+    t11 = t14 - t13;
+    t7 = t3 + t9;
+    t2 = t5 + t0;
+    t8 = t10 + t11;
+    t12 = t4 - t6;
+    t1 = t3 - t9;
+    t14 = t5 - t0;
+    t13 = t10 - t11;
+    t3 = t4 + t6;
+    t9 = (-C80) * t7;
+    t5 = (-C81) * t2;
+    t0 = t9 + t5;
+    t10 = 0.07784000908910041 * t0;
+    y[515] = t10;
+    t11 = 0.06284016604564573 * t0;
+    y[564] = t11;
+    t4 = C81 * t7;
+    t6 = (-C80) * t2;
+    t9 = t4 + t6;
+    t5 = 0.02393267321582922 * t9;
+    y[155] = t5;
+    t10 = (-0.05205064136257923) * t9;
+    y[204] = t10;
+    t0 = (-C82) * t8;
+    t11 = (-C83) * t12;
+    t7 = t0 + t11;
+    t2 = 0.07446206884269224 * t7;
+    y[425] = t2;
+    t4 = 0.014220262010509356 * t7;
+    y[654] = t4;
+    t6 = C83 * t8;
+    t5 = (-C82) * t12;
+    t9 = t6 + t5;
+    y[65] = 0;
+    t10 = (-0.07460920226769635) * t9;
+    y[294] = t10;
+    t0 = C84 * t1;
+    t11 = C85 * t14;
+    t2 = t0 + t11;
+    y[24] = 0;
+    t7 = (-0.07517340029871654) * t2;
+    y[335] = t7;
+    t4 = (-C85) * t1;
+    t8 = C84 * t14;
+    t12 = t4 + t8;
+    t6 = 0.07390320955922502 * t12;
+    y[384] = t6;
+    t5 = 0.002229055261370192 * t12;
+    y[695] = t5;
+    t9 = C86 * t13;
+    t10 = C87 * t3;
+    t0 = t9 + t10;
+    t11 = 0.005385116887313331 * t0;
+    y[114] = t11;
+    t2 = (-0.06793559503952946) * t0;
+    y[245] = t2;
+    t7 = (-C87) * t13;
+    t1 = C86 * t3;
+    t14 = t7 + t1;
+    t4 = 0.07857505943811341 * t14;
+    y[474] = t4;
+    t8 = 0.04039134932676299 * t14;
+    y[605] = t8;
+    t6 = re[8];
+    t12 = im[8];
+    t5 = re[53];
+    t9 = im[53];
+    t10 = re[98];
+    t11 = im[98];
+    t0 = re[143];
+    t2 = im[143];
+    t13 = t6 + t10;
+    t3 = t12 + t11;
+    t7 = t5 + t0;
+    t1 = t9 + t2;
+    t4 = t6 - t10;
+    t14 = t12 - t11;
+    t8 = t5 - t0;
+    t6 = t9 - t2;
+    t10 = t13 + t7;
+    t12 = t3 + t1;
+    t11 = t4 + t6;
+    t5 = t14 - t8;
+    t0 = t13 - t7;
+    t9 = t3 - t1;
+    t2 = t4 - t6;
+    t13 = t14 + t8;
+    t7 = C88 * t10;
+    t3 = C89 * t12;
+    t1 = t7 + t3;
+    t4 = 0.006004019447140323 * t1;
+    y[116] = t4;
+    t6 = (-0.06741130369498281) * t1;
+    y[243] = t6;
+    t14 = (-C89) * t10;
+    t8 = C88 * t12;
+    t7 = t14 + t8;
+    t3 = 0.0787101603489525 * t7;
+    y[476] = t3;
+    t4 = 0.041572322439829716 * t7;
+    y[603] = t4;
+    t1 = (-C90) * t11;
+    t6 = (-C91) * t5;
+    t10 = t1 + t6;
+    t12 = 0.07809766918983464 * t10;
+    y[513] = t12;
+    t14 = 0.06189680526819404 * t10;
+    y[566] = t14;
+    t8 = C91 * t11;
+    t3 = (-C90) * t5;
+    t7 = t8 + t3;
+    t4 = 0.022804283234255183 * t7;
+    y[153] = t4;
+    t1 = (-0.05306231696686175) * t7;
+    y[206] = t1;
+    t6 = (-C92) * t0;
+    t12 = (-C93) * t9;
+    t10 = t6 + t12;
+    t14 = 0.07435931760665028 * t10;
+    y[423] = t14;
+    t11 = 0.013378002394316833 * t10;
+    y[656] = t11;
+    t5 = C93 * t0;
+    t8 = (-C92) * t9;
+    t3 = t5 + t8;
+    y[63] = 0;
+    t4 = (-0.07471229879950778) * t3;
+    y[296] = t4;
+    t7 = C94 * t2;
+    t1 = C95 * t13;
+    t6 = t7 + t1;
+    y[26] = 0;
+    t12 = (-0.07520672134166241) * t6;
+    y[333] = t12;
+    t14 = (-C95) * t2;
+    t10 = C94 * t13;
+    t11 = t14 + t10;
+    t0 = 0.07387046604939465 * t11;
+    y[386] = t0;
+    t9 = 0.00255366426502586 * t11;
+    y[693] = t9;
+    t5 = re[104];
+    t8 = im[104];
+    t3 = re[149];
+    t4 = im[149];
+    t7 = re[14];
+    t1 = im[14];
+    t6 = re[59];
+    t12 = im[59];
+    t2 = t5 + t7;
+    t13 = t8 + t1;
+    t14 = t3 + t6;
+    t10 = t4 + t12;
+    t0 = t5 - t7;
+    t11 = t8 - t1;
+    t9 = t3 - t6;
+    t5 = t4 - t12;
+    t7 = t2 + t14;
+    t8 = t13 + t10;
+    t1 = t0 + t5;
+    t3 = t11 - t9;
+    t6 = t2 - t14;
+    t4 = t13 - t10;
+    t12 = t0 - t5;
+    t2 = t11 + t9;
+    t14 = C96 * t7;
+    t13 = C97 * t8;
+    t10 = t14 + t13;
+    y[28] = 0;
+    t0 = (-0.07523562433528812) * t10;
+    y[331] = t0;
+    t5 = (-C97) * t7;
+    t11 = C96 * t8;
+    t9 = t5 + t11;
+    t14 = 0.07384208750361634 * t9;
+    y[388] = t14;
+    t13 = 0.0029040315795407093 * t9;
+    y[691] = t13;
+    t10 = C98 * t1;
+    t0 = C99 * t3;
+    t7 = t10 + t0;
+    t8 = 0.006656903764848652 * t7;
+    y[118] = t8;
+    t5 = (-0.0668621636659968) * t7;
+    y[241] = t5;
+    t11 = (-C99) * t1;
+    t14 = C98 * t3;
+    t9 = t11 + t14;
+    t13 = 0.07883322950726442 * t9;
+    y[478] = t13;
+    t10 = 0.04275189667372712 * t9;
+    y[601] = t10;
+    t0 = (-C100) * t6;
+    t8 = (-C101) * t4;
+    t7 = t0 + t8;
+    t5 = 0.07832839163125538 * t7;
+    y[511] = t5;
+    t1 = 0.06093217079840101 * t7;
+    y[568] = t1;
+    t3 = C101 * t6;
+    t11 = (-C100) * t4;
+    t14 = t3 + t11;
+    t13 = 0.021690646887164954 * t14;
+    y[151] = t13;
+    t9 = (-0.05405316343824382) * t14;
+    y[208] = t9;
+    t10 = (-C102) * t12;
+    t0 = (-C103) * t2;
+    t8 = t10 + t0;
+    t5 = 0.0742656761333236 * t8;
+    y[421] = t5;
+    t7 = 0.012560244466040787 * t8;
+    y[658] = t7;
+    t1 = C103 * t12;
+    t6 = (-C102) * t2;
+    t4 = t1 + t6;
+    y[61] = 0;
+    t3 = (-0.07480650341864636) * t4;
+    y[298] = t3;
+    t11 = re[40];
+    t13 = im[40];
+    t14 = re[85];
+    t9 = im[85];
+    t10 = re[130];
+    t0 = im[130];
+    t5 = re[175];
+    t8 = im[175];
+    t7 = t11 + t10;
+    t12 = t13 + t0;
+    t2 = t14 + t5;
+    t1 = t9 + t8;
+    t6 = t11 - t10;
+    t4 = t13 - t0;
+    t3 = t14 - t5;
+    t11 = t9 - t8;
+    t10 = t7 + t2;
+    t13 = t12 + t1;
+    t0 = t6 + t11;
+    t14 = t4 - t3;
+    t5 = t7 - t2;
+    t9 = t12 - t1;
+    t8 = t6 - t11;
+    t7 = t4 + t3;
+    t2 = (-C104) * t10;
+    t12 = (-C105) * t13;
+    t1 = t2 + t12;
+    t6 = 0.07418097507515262 * t1;
+    y[419] = t6;
+    t11 = 0.011767594897081788 * t1;
+    y[660] = t11;
+    t4 = C105 * t10;
+    t3 = (-C104) * t13;
+    t2 = t4 + t3;
+    y[59] = 0;
+    t12 = (-0.07489191871537453) * t2;
+    y[300] = t12;
+    t6 = C106 * t0;
+    t1 = C107 * t14;
+    t11 = t6 + t1;
+    y[30] = 0;
+    t10 = (-0.07525977943575472) * t11;
+    y[329] = t10;
+    t13 = (-C107) * t0;
+    t4 = C106 * t14;
+    t3 = t13 + t4;
+    t2 = 0.07381838742030912 * t3;
+    y[390] = t2;
+    t12 = 0.003280615794812773 * t3;
+    y[689] = t12;
+    t6 = C108 * t5;
+    t1 = C109 * t9;
+    t11 = t6 + t1;
+    t10 = 0.007343269434112685 * t11;
+    y[120] = t10;
+    t0 = (-0.06628739149209381) * t11;
+    y[239] = t0;
+    t14 = (-C109) * t5;
+    t13 = C108 * t9;
+    t4 = t14 + t13;
+    t2 = 0.078943755942419 * t4;
+    y[480] = t2;
+    t3 = 0.04392864819117198 * t4;
+    y[599] = t3;
+    t12 = (-C110) * t8;
+    t6 = (-C111) * t7;
+    t1 = t12 + t6;
+    t10 = 0.07853258704510427 * t1;
+    y[509] = t10;
+    t11 = 0.05994684933986933 * t1;
+    y[570] = t11;
+    t0 = C111 * t8;
+    t5 = (-C110) * t7;
+    t9 = t0 + t5;
+    t14 = 0.020593098975334338 * t9;
+    y[149] = t14;
+    t13 = (-0.05502256217993199) * t9;
+    y[210] = t13;
+    t2 = re[136];
+    t4 = im[136];
+    t3 = re[1];
+    t12 = im[1];
+    t6 = re[46];
+    t10 = im[46];
+    t1 = re[91];
+    t11 = im[91];
+    t8 = t2 + t6;
+    t7 = t4 + t10;
+    t0 = t3 + t1;
+    t5 = t12 + t11;
+    t14 = t2 - t6;
+    t9 = t4 - t10;
+    t13 = t3 - t1;
+    t2 = t12 - t11;
+    t6 = t8 + t0;
+    t4 = t7 + t5;
+    t10 = t14 + t2;
+    t3 = t9 - t13;
+    t1 = t8 - t0;
+    t12 = t7 - t5;
+    t11 = t14 - t2;
+    t8 = t9 + t13;
+    t0 = (-C112) * t6;
+    t7 = (-C113) * t4;
+    t5 = t0 + t7;
+    t14 = 0.07871072623375217 * t5;
+    y[507] = t14;
+    t2 = 0.058941354834138 * t5;
+    y[572] = t2;
+    t9 = C113 * t6;
+    t13 = (-C112) * t4;
+    t0 = t9 + t13;
+    t7 = 0.019514347494519975 * t0;
+    y[147] = t7;
+    t14 = (-0.05596890902062735) * t0;
+    y[212] = t14;
+    t5 = (-C114) * t10;
+    t2 = (-C115) * t3;
+    t6 = t5 + t2;
+    t4 = 0.07410494162131781 * t6;
+    y[417] = t4;
+    t9 = 0.011000747977745941 * t6;
+    y[662] = t9;
+    t13 = C115 * t10;
+    t7 = (-C114) * t3;
+    t0 = t13 + t7;
+    y[57] = 0;
+    t14 = (-0.07496875962665067) * t0;
+    y[302] = t14;
+    t5 = C116 * t1;
+    t2 = C117 * t12;
+    t4 = t5 + t2;
+    y[32] = 0;
+    t6 = (-0.07527885140656462) * t4;
+    y[327] = t6;
+    t9 = (-C117) * t1;
+    t10 = C116 * t12;
+    t3 = t9 + t10;
+    t13 = 0.073799685459482 * t3;
+    y[392] = t13;
+    t7 = 0.0036836583231711047 * t3;
+    y[687] = t7;
+    t0 = C118 * t11;
+    t14 = C119 * t8;
+    t5 = t0 + t14;
+    t2 = 0.00806262304799125 * t5;
+    y[122] = t2;
+    t4 = (-0.06568628740452798) * t5;
+    y[237] = t4;
+    t6 = (-C119) * t11;
+    t1 = C118 * t8;
+    t12 = t6 + t1;
+    t9 = 0.07904112455093797 * t12;
+    y[482] = t9;
+    t10 = 0.045101641160831665 * t12;
+    y[597] = t10;
+    t13 = re[52];
+    t3 = im[52];
+    t7 = re[97];
+    t0 = im[97];
+    t14 = re[142];
+    t2 = im[142];
+    t5 = re[7];
+    t4 = im[7];
+    t11 = t13 + t14;
+    t8 = t3 + t2;
+    t6 = t7 + t5;
+    t1 = t0 + t4;
+    t9 = t13 - t14;
+    t12 = t3 - t2;
+    t10 = t7 - t5;
+    t13 = t0 - t4;
+    t14 = t11 + t6;
+    t3 = t8 + t1;
+    t2 = t9 + t13;
+    t7 = t12 - t10;
+    t5 = t11 - t6;
+    t0 = t8 - t1;
+    t4 = t9 - t13;
+    t11 = t12 + t10;
+    t6 = C120 * t14;
+    t8 = C121 * t3;
+    t1 = t6 + t8;
+    t9 = 0.00881418212054679 * t1;
+    y[124] = t9;
+    t13 = (-0.06505898861211178) * t1;
+    y[235] = t13;
+    t12 = (-C121) * t14;
+    t10 = C120 * t3;
+    t6 = t12 + t10;
+    t8 = 0.07912400767771946 * t6;
+    y[484] = t8;
+    t9 = 0.0462694820152932 * t6;
+    y[595] = t9;
+    t1 = (-C122) * t2;
+    t13 = (-C123) * t7;
+    t14 = t1 + t13;
+    t3 = 0.0788640459127583 * t14;
+    y[505] = t3;
+    t12 = 0.05791691702580703 * t14;
+    y[574] = t12;
+    t10 = C123 * t2;
+    t8 = (-C122) * t7;
+    t6 = t10 + t8;
+    t9 = 0.018453847710442315 * t6;
+    y[145] = t9;
+    t1 = (-0.05689240942401537) * t6;
+    y[214] = t1;
+    t13 = (-C124) * t5;
+    t3 = (-C125) * t0;
+    t14 = t13 + t3;
+    t12 = 0.074037419382818 * t14;
+    y[415] = t12;
+    t2 = 0.010260231943808849 * t14;
+    y[664] = t2;
+    t7 = C125 * t5;
+    t10 = (-C124) * t0;
+    t8 = t7 + t10;
+    y[55] = 0;
+    t9 = (-0.07503713124886202) * t8;
+    y[304] = t9;
+    t6 = C126 * t4;
+    t1 = C127 * t11;
+    t13 = t6 + t1;
+    y[34] = 0;
+    t3 = (-0.0752925301001395) * t13;
+    y[325] = t3;
+    t12 = (-C127) * t4;
+    t14 = C126 * t11;
+    t2 = t12 + t14;
+    t5 = 0.07378627797693389 * t2;
+    y[394] = t5;
+    t0 = 0.004113242104958822 * t2;
+    y[685] = t0;
+    t7 = re[108];
+    t10 = im[108];
+    t8 = re[153];
+    t9 = im[153];
+    t6 = re[18];
+    t1 = im[18];
+    t13 = re[63];
+    t3 = im[63];
+    t4 = t7 + t6;
+    t11 = t10 + t1;
+    t12 = t8 + t13;
+    t14 = t9 + t3;
+    t5 = t7 - t6;
+    t2 = t10 - t1;
+    t0 = t8 - t13;
+    t7 = t9 - t3;
+    t6 = t4 + t12;
+    t10 = t11 + t14;
+    t1 = t5 + t7;
+    t8 = t2 - t0;
+    t13 = t4 - t12;
+    t9 = t11 - t14;
+    t3 = t5 - t7;
+    t4 = t2 + t0;
+    t12 = C128 * t6;
+    t11 = C129 * t10;
+    t14 = t12 + t11;
+    y[36] = 0;
+    t5 = (-0.07530050192675915) * t14;
+    y[323] = t5;
+    t7 = (-C129) * t6;
+    t2 = C128 * t10;
+    t0 = t7 + t2;
+    t12 = 0.07377846645642751 * t0;
+    y[396] = t12;
+    t11 = 0.004569478291400881 * t0;
+    y[683] = t11;
+    t14 = C130 * t1;
+    t5 = C131 * t8;
+    t6 = t14 + t5;
+    t10 = 0.009597393388131877 * t6;
+    y[126] = t10;
+    t7 = (-0.0644056743909316) * t6;
+    y[233] = t7;
+    t2 = (-C131) * t1;
+    t12 = C130 * t8;
+    t0 = t2 + t12;
+    t11 = 0.07919092994811297 * t0;
+    y[486] = t11;
+    t14 = 0.04743061873083486 * t0;
+    y[593] = t14;
+    t5 = (-C132) * t13;
+    t10 = (-C133) * t9;
+    t6 = t5 + t10;
+    t7 = 0.07899241569686438 * t6;
+    y[503] = t7;
+    t1 = 0.05687433380975956 * t6;
+    y[576] = t1;
+    t8 = C133 * t13;
+    t2 = (-C132) * t9;
+    t12 = t8 + t2;
+    t11 = 0.017415019803909308 * t12;
+    y[143] = t11;
+    t0 = (-0.0577914710627802) * t12;
+    y[216] = t0;
+    t14 = (-C134) * t3;
+    t5 = (-C135) * t4;
+    t10 = t14 + t5;
+    t7 = 0.07397825346062925 * t10;
+    y[413] = t7;
+    t6 = 0.009546221162544678 * t10;
+    y[666] = t6;
+    t1 = C135 * t3;
+    t13 = (-C134) * t4;
+    t9 = t1 + t13;
+    y[53] = 0;
+    t8 = (-0.0750971440345261) * t9;
+    y[306] = t8;
+    t2 = re[24];
+    t11 = im[24];
+    t12 = re[69];
+    t0 = im[69];
+    t14 = re[114];
+    t5 = im[114];
+    t7 = re[159];
+    t10 = im[159];
+    t6 = t2 + t14;
+    t3 = t11 + t5;
+    t4 = t12 + t7;
+    t1 = t0 + t10;
+    t13 = t2 - t14;
+    t9 = t11 - t5;
+    t8 = t12 - t7;
+    t2 = t0 - t10;
+    t14 = t6 + t4;
+    t11 = t3 + t1;
+    t5 = t13 + t2;
+    t12 = t9 - t8;
+    t7 = t6 - t4;
+    t0 = t3 - t1;
+    t10 = t13 - t2;
+    t6 = t9 + t8;
+    t4 = (-C136) * t14;
+    t3 = (-C137) * t11;
+    t1 = t4 + t3;
+    t13 = 0.07392721761500906 * t1;
+    y[411] = t13;
+    t2 = 0.008858817415260668 * t1;
+    y[668] = t2;
+    t9 = C137 * t14;
+    t8 = (-C136) * t11;
+    t4 = t9 + t8;
+    y[51] = 0;
+    t3 = (-0.07514898754187173) * t4;
+    y[308] = t3;
+    t13 = C138 * t5;
+    t1 = C139 * t12;
+    t2 = t13 + t1;
+    y[38] = 0;
+    t14 = (-0.07530245242836436) * t2;
+    y[321] = t14;
+    t11 = (-C139) * t5;
+    t9 = C138 * t12;
+    t8 = t11 + t9;
+    t4 = 0.07377655542946078 * t8;
+    y[398] = t4;
+    t3 = 0.005052872047437409 * t8;
+    y[681] = t3;
+    t13 = C140 * t7;
+    t1 = C141 * t0;
+    t2 = t13 + t1;
+    t14 = 0.010411689238175531 * t2;
+    y[128] = t14;
+    t5 = (-0.06372614899328394) * t2;
+    y[231] = t5;
+    t12 = (-C141) * t7;
+    t11 = C140 * t0;
+    t9 = t12 + t11;
+    t4 = 0.07924086912061755 * t9;
+    y[488] = t4;
+    t8 = 0.04858386684871984 * t9;
+    y[591] = t8;
+    t3 = (-C142) * t10;
+    t13 = (-C143) * t6;
+    t1 = t3 + t13;
+    t14 = 0.07909673955285182 * t1;
+    y[501] = t14;
+    t2 = 0.05581446591090588 * t1;
+    y[578] = t2;
+    t5 = C143 * t10;
+    t7 = (-C142) * t6;
+    t0 = t5 + t7;
+    t12 = 0.016397980292607583 * t0;
+    y[141] = t12;
+    t11 = (-0.05866627461180603) * t0;
+    y[218] = t11;
+    t4 = re[120];
+    t9 = im[120];
+    t8 = re[165];
+    t3 = im[165];
+    t13 = re[30];
+    t14 = im[30];
+    t1 = re[75];
+    t2 = im[75];
+    t10 = t4 + t13;
+    t6 = t9 + t14;
+    t5 = t8 + t1;
+    t7 = t3 + t2;
+    t12 = t4 - t13;
+    t0 = t9 - t14;
+    t11 = t8 - t1;
+    t4 = t3 - t2;
+    t13 = t10 + t5;
+    t9 = t6 + t7;
+    t14 = t12 + t4;
+    t8 = t0 - t11;
+    t1 = t10 - t5;
+    t3 = t6 - t7;
+    t2 = t12 - t4;
+    t10 = t0 + t11;
+    t5 = (-C144) * t13;
+    t6 = (-C145) * t9;
+    t7 = t5 + t6;
+    t12 = 0.07917742425593305 * t7;
+    y[499] = t12;
+    t4 = 0.0547386736643123 * t7;
+    y[580] = t4;
+    t0 = C145 * t13;
+    t11 = (-C144) * t9;
+    t5 = t0 + t11;
+    t6 = 0.015404851487337206 * t5;
+    y[139] = t6;
+    t12 = (-0.059515884248910744) * t5;
+    y[220] = t12;
+    t7 = (-C146) * t14;
+    t4 = (-C147) * t8;
+    t13 = t7 + t4;
+    t9 = 0.0738840539646149 * t13;
+    y[409] = t9;
+    t0 = 0.008198439078907925 * t13;
+    y[670] = t0;
+    t11 = C147 * t14;
+    t6 = (-C146) * t8;
+    t5 = t11 + t6;
+    y[49] = 0;
+    t12 = (-0.07519289017649554) * t5;
+    y[310] = t12;
+    t7 = C148 * t1;
+    t4 = C149 * t3;
+    t9 = t7 + t4;
+    y[40] = 0;
+    t13 = (-0.07529808938939887) * t9;
+    y[319] = t13;
+    t0 = (-C149) * t1;
+    t14 = C148 * t3;
+    t8 = t0 + t14;
+    t11 = 0.07378083030533994 * t8;
+    y[400] = t11;
+    t6 = 0.005563419649964133 * t8;
+    y[679] = t6;
+    t5 = C150 * t2;
+    t12 = C151 * t10;
+    t7 = t5 + t12;
+    t4 = 0.011255798390928823 * t7;
+    y[130] = t4;
+    t9 = (-0.06302004407934228) * t7;
+    y[229] = t9;
+    t13 = (-C151) * t2;
+    t1 = C150 * t10;
+    t3 = t13 + t1;
+    t0 = 0.07927355304937736 * t3;
+    y[490] = t0;
+    t14 = 0.04972839141369215 * t3;
+    y[589] = t14;
+    t11 = re[56];
+    t8 = im[56];
+    t6 = re[101];
+    t5 = im[101];
+    t12 = re[146];
+    t4 = im[146];
+    t7 = re[11];
+    t9 = im[11];
+    t2 = t11 + t12;
+    t10 = t8 + t4;
+    t13 = t6 + t7;
+    t1 = t5 + t9;
+    t0 = t11 - t12;
+    t3 = t8 - t4;
+    t14 = t6 - t7;
+    t11 = t5 - t9;
+    t12 = t2 + t13;
+    t8 = t10 + t1;
+    t4 = t0 + t11;
+    t6 = t3 - t14;
+    t7 = t2 - t13;
+    t5 = t10 - t1;
+    t9 = t0 - t11;
+    t2 = t3 + t14;
+    t13 = C152 * t12;
+    t10 = C153 * t8;
+    t1 = t13 + t10;
+    t0 = 0.012129720199284709 * t1;
+    y[132] = t0;
+    t11 = (-0.0622870096006031) * t1;
+    y[227] = t11;
+    t3 = (-C153) * t12;
+    t14 = C152 * t8;
+    t13 = t3 + t14;
+    t10 = 0.0792877978708678 * t13;
+    y[492] = t10;
+    t0 = 0.05086314591152052 * t13;
+    y[587] = t0;
+    t1 = (-C154) * t4;
+    t11 = (-C155) * t6;
+    t12 = t1 + t11;
+    t8 = 0.07923549255550565 * t12;
+    y[497] = t8;
+    t3 = 0.053648147946663574 * t12;
+    y[582] = t3;
+    t14 = C155 * t4;
+    t10 = (-C154) * t6;
+    t13 = t14 + t10;
+    t0 = 0.014436325447654757 * t13;
+    y[137] = t0;
+    t1 = (-0.06034004810135273) * t13;
+    y[222] = t1;
+    t11 = (-C156) * t7;
+    t8 = (-C157) * t5;
+    t12 = t11 + t8;
+    t3 = 0.07384850942488619 * t12;
+    y[407] = t3;
+    t4 = 0.0075651186862769355 * t12;
+    y[672] = t4;
+    t6 = C157 * t7;
+    t14 = (-C156) * t5;
+    t10 = t6 + t14;
+    y[47] = 0;
+    t0 = (-0.07522908178947471) * t10;
+    y[312] = t0;
+    t13 = C158 * t9;
+    t1 = C159 * t2;
+    t11 = t13 + t1;
+    y[42] = 0;
+    t8 = (-0.07528713607533286) * t11;
+    y[317] = t8;
+    t3 = (-C159) * t9;
+    t12 = C158 * t2;
+    t4 = t3 + t12;
+    t7 = 0.07379156447120827 * t4;
+    y[402] = t7;
+    t5 = 0.006101107904815549 * t4;
+    y[677] = t5;
+    t6 = re[152];
+    t14 = im[152];
+    t10 = re[17];
+    t0 = im[17];
+    t13 = re[62];
+    t1 = im[62];
+    t11 = re[107];
+    t8 = im[107];
+    t9 = t6 + t13;
+    t2 = t14 + t1;
+    t3 = t10 + t11;
+    t12 = t0 + t8;
+    t7 = t6 - t13;
+    t4 = t14 - t1;
+    t5 = t10 - t11;
+    t6 = t0 - t8;
+    t13 = t9 + t3;
+    t14 = t2 + t12;
+    t1 = t7 + t6;
+    t10 = t4 - t5;
+    t11 = t9 - t3;
+    t0 = t2 - t12;
+    t8 = t7 - t6;
+    t9 = t4 + t5;
+    t3 = C160 * t13;
+    t2 = C161 * t14;
+    t12 = t3 + t2;
+    y[44] = 0;
+    t7 = (-0.07526930436857467) * t12;
+    y[315] = t7;
+    t6 = (-C161) * t13;
+    t4 = C160 * t14;
+    t5 = t6 + t4;
+    t3 = 0.07380904609336382 * t5;
+    y[404] = t3;
+    t2 = 0.006666148096164151 * t5;
+    y[675] = t2;
+    t12 = C162 * t1;
+    t7 = C163 * t10;
+    t13 = t12 + t7;
+    t14 = 0.013031765120859037 * t13;
+    y[134] = t14;
+    t6 = (-0.0615277960611282) * t13;
+    y[225] = t6;
+    t4 = (-C163) * t1;
+    t3 = C162 * t10;
+    t5 = t4 + t3;
+    t2 = 0.07928247848482699 * t5;
+    y[494] = t2;
+    t12 = 0.051986770927596154 * t5;
+    y[585] = t12;
+    t7 = (-C164) * t11;
+    t14 = (-C165) * t0;
+    t13 = t7 + t14;
+    t6 = 0.07927218730124422 * t13;
+    y[495] = t6;
+    t1 = 0.05254388148070578 * t13;
+    y[584] = t1;
+    t10 = C165 * t11;
+    t4 = (-C164) * t0;
+    t3 = t10 + t4;
+    t2 = 0.013492984538424497 * t3;
+    y[135] = t2;
+    t5 = (-0.06113848930054078) * t3;
+    y[224] = t5;
+    t12 = (-C166) * t8;
+    t7 = (-C167) * t9;
+    t14 = t12 + t7;
+    t6 = 0.07382038068434472 * t14;
+    y[405] = t6;
+    t13 = 0.006958960986894562 * t14;
+    y[674] = t13;
+    t1 = C167 * t8;
+    t11 = (-C166) * t9;
+    t0 = t1 + t11;
+    y[45] = 0;
+    t10 = (-0.07525774730573473) * t0;
+    y[314] = t10;
+    t4 = re[68];
+    t2 = im[68];
+    t3 = re[113];
+    t5 = im[113];
+    t12 = re[158];
+    t7 = im[158];
+    t6 = re[23];
+    t14 = im[23];
+    t13 = t4 + t12;
+    t8 = t2 + t7;
+    t9 = t3 + t6;
+    t1 = t5 + t14;
+    t11 = t4 - t12;
+    t0 = t2 - t7;
+    t10 = t3 - t6;
+    t4 = t5 - t14;
+    t12 = t13 + t9;
+    t2 = t8 + t1;
+    t7 = t11 + t4;
+    t3 = t0 - t10;
+    t6 = t13 - t9;
+    t5 = t8 - t1;
+    t14 = t11 - t4;
+    t13 = t0 + t10;
+    t9 = (-C168) * t12;
+    t8 = (-C169) * t2;
+    t1 = t9 + t8;
+    t11 = 0.07379941994529313 * t1;
+    y[403] = t11;
+    t4 = 0.006380248502440559 * t1;
+    y[676] = t4;
+    t0 = C169 * t12;
+    t10 = (-C168) * t2;
+    t9 = t0 + t10;
+    y[43] = 0;
+    t8 = (-0.07527912224342473) * t9;
+    y[316] = t8;
+    t11 = C170 * t7;
+    t1 = C171 * t3;
+    t4 = t11 + t1;
+    y[46] = 0;
+    t12 = (-0.07524431766225147) * t4;
+    y[313] = t12;
+    t2 = (-C171) * t7;
+    t0 = C170 * t3;
+    t10 = t2 + t0;
+    t9 = 0.07383355618284335 * t10;
+    y[406] = t9;
+    t8 = 0.007258624754882618 * t10;
+    y[673] = t8;
+    t11 = C172 * t6;
+    t1 = C173 * t5;
+    t4 = t11 + t1;
+    t12 = 0.013961288678997456 * t4;
+    y[136] = t12;
+    t7 = (-0.060742536777194996) * t4;
+    y[223] = t7;
+    t3 = (-C173) * t6;
+    t2 = C172 * t5;
+    t0 = t3 + t2;
+    t9 = 0.07925654623502265 * t0;
+    y[496] = t9;
+    t10 = 0.05309766870993954 * t0;
+    y[583] = t10;
+    t8 = (-C174) * t14;
+    t11 = (-C175) * t13;
+    t1 = t8 + t11;
+    t12 = 0.07928765862449144 * t1;
+    y[493] = t12;
+    t4 = 0.051426496623277064 * t1;
+    y[586] = t4;
+    t7 = C175 * t14;
+    t6 = (-C174) * t13;
+    t5 = t7 + t6;
+    t3 = 0.012577110492092577 * t5;
+    y[133] = t3;
+    t2 = (-0.06191075522297103) * t5;
+    y[226] = t2;
+    t9 = re[4];
+    t0 = im[4];
+    t10 = re[49];
+    t8 = im[49];
+    t11 = re[94];
+    t12 = im[94];
+    t1 = re[139];
+    t4 = im[139];
+    t14 = t9 + t11;
+    t13 = t0 + t12;
+    t7 = t10 + t1;
+    t6 = t8 + t4;
+    t3 = t9 - t11;
+    t5 = t0 - t12;
+    t2 = t10 - t1;
+    t9 = t8 - t4;
+    t11 = t14 + t7;
+    t0 = t13 + t6;
+    t12 = t3 + t9;
+    t10 = t5 - t2;
+    t1 = t14 - t7;
+    t8 = t13 - t6;
+    t4 = t3 - t9;
+    t14 = t5 + t2;
+    t7 = (-C176) * t11;
+    t13 = (-C177) * t0;
+    t6 = t7 + t13;
+    t3 = 0.07928303866608047 * t6;
+    y[491] = t3;
+    t9 = 0.050297128855992426 * t6;
+    y[588] = t9;
+    t5 = C177 * t11;
+    t2 = (-C176) * t0;
+    t7 = t5 + t2;
+    t13 = 0.011689066002518803 * t7;
+    y[131] = t13;
+    t3 = (-0.06265689585313484) * t7;
+    y[228] = t3;
+    t6 = (-C178) * t12;
+    t9 = (-C179) * t10;
+    t11 = t6 + t9;
+    t0 = 0.07378534815077109 * t11;
+    y[401] = t0;
+    t5 = 0.005828892956762125 * t11;
+    y[678] = t5;
+    t2 = C179 * t12;
+    t13 = (-C178) * t10;
+    t7 = t2 + t13;
+    y[41] = 0;
+    t3 = (-0.07529347891946621) * t7;
+    y[318] = t3;
+    t6 = C180 * t1;
+    t9 = C181 * t8;
+    t0 = t6 + t9;
+    y[48] = 0;
+    t11 = (-0.07521191392388182) * t0;
+    y[311] = t11;
+    t5 = (-C181) * t1;
+    t12 = C180 * t8;
+    t10 = t5 + t12;
+    t2 = 0.07386536607987472 * t10;
+    y[408] = t2;
+    t13 = 0.007878320426860737 * t10;
+    y[671] = t13;
+    t7 = C182 * t4;
+    t3 = C183 * t14;
+    t6 = t7 + t3;
+    t9 = 0.01491758532673113 * t6;
+    y[138] = t9;
+    t0 = (-0.05993109228259522) * t6;
+    y[221] = t0;
+    t11 = (-C183) * t4;
+    t1 = C182 * t14;
+    t8 = t11 + t1;
+    t5 = 0.07920922261372015 * t8;
+    y[498] = t5;
+    t12 = 0.054195119903981286 * t8;
+    y[581] = t12;
+    t2 = re[100];
+    t10 = im[100];
+    t13 = re[145];
+    t7 = im[145];
+    t3 = re[10];
+    t9 = im[10];
+    t6 = re[55];
+    t0 = im[55];
+    t4 = t2 + t3;
+    t14 = t10 + t9;
+    t11 = t13 + t6;
+    t1 = t7 + t0;
+    t5 = t2 - t3;
+    t8 = t10 - t9;
+    t12 = t13 - t6;
+    t2 = t7 - t0;
+    t3 = t4 + t11;
+    t10 = t14 + t1;
+    t9 = t5 + t2;
+    t13 = t8 - t12;
+    t6 = t4 - t11;
+    t7 = t14 - t1;
+    t0 = t5 - t2;
+    t4 = t8 + t12;
+    t11 = C184 * t3;
+    t14 = C185 * t10;
+    t1 = t11 + t14;
+    t5 = 0.015898542092392835 * t1;
+    y[140] = t5;
+    t2 = (-0.05909416479402423) * t1;
+    y[219] = t2;
+    t8 = (-C185) * t3;
+    t12 = C184 * t10;
+    t11 = t8 + t12;
+    t14 = 0.07913993568537958 * t11;
+    y[500] = t14;
+    t5 = 0.055278474546151535 * t11;
+    y[579] = t5;
+    t1 = (-C186) * t9;
+    t2 = (-C187) * t13;
+    t3 = t1 + t2;
+    t10 = 0.07925944743120644 * t3;
+    y[489] = t10;
+    t8 = 0.049157257914493886 * t3;
+    y[590] = t8;
+    t12 = C187 * t9;
+    t14 = (-C186) * t13;
+    t11 = t12 + t14;
+    t5 = 0.01082989060848449 * t11;
+    y[129] = t5;
+    t1 = (-0.0633765184155293) * t11;
+    y[230] = t1;
+    t2 = (-C188) * t6;
+    t10 = (-C189) * t7;
+    t3 = t2 + t10;
+    t8 = 0.07377787855167459 * t3;
+    y[399] = t8;
+    t9 = 0.005304756981572133 * t3;
+    y[680] = t9;
+    t13 = C189 * t6;
+    t12 = (-C188) * t7;
+    t14 = t13 + t12;
+    y[39] = 0;
+    t5 = (-0.07530110196465468) * t14;
+    y[320] = t5;
+    t11 = C190 * t0;
+    t1 = C191 * t4;
+    t2 = t11 + t1;
+    y[50] = 0;
+    t10 = (-0.0751718910899392) * t2;
+    y[309] = t10;
+    t8 = (-C191) * t0;
+    t3 = C190 * t4;
+    t9 = t8 + t3;
+    t6 = 0.07390469329697484 * t9;
+    y[410] = t6;
+    t7 = 0.008525254162783965 * t9;
+    y[669] = t7;
+    t13 = re[16];
+    t12 = im[16];
+    t14 = re[61];
+    t5 = im[61];
+    t11 = re[106];
+    t1 = im[106];
+    t2 = re[151];
+    t10 = im[151];
+    t0 = t13 + t11;
+    t4 = t12 + t1;
+    t8 = t14 + t2;
+    t3 = t5 + t10;
+    t6 = t13 - t11;
+    t9 = t12 - t1;
+    t7 = t14 - t2;
+    t13 = t5 - t10;
+    t11 = t0 + t8;
+    t12 = t4 + t3;
+    t1 = t6 + t13;
+    t14 = t9 - t7;
+    t2 = t0 - t8;
+    t5 = t4 - t3;
+    t10 = t6 - t13;
+    t0 = t9 + t7;
+    t8 = C192 * t11;
+    t4 = C193 * t12;
+    t3 = t8 + t4;
+    y[52] = 0;
+    t6 = (-0.07512404916003154) * t3;
+    y[307] = t6;
+    t13 = (-C193) * t11;
+    t9 = C192 * t12;
+    t7 = t13 + t9;
+    t8 = 0.07395175869342371 * t7;
+    y[412] = t8;
+    t4 = 0.00919912980539764 * t7;
+    y[667] = t4;
+    t3 = C194 * t1;
+    t6 = C195 * t14;
+    t11 = t3 + t6;
+    t12 = 0.016903811785332918 * t11;
+    y[142] = t12;
+    t13 = (-0.0582318648569364) * t11;
+    y[217] = t13;
+    t9 = (-C195) * t1;
+    t8 = C194 * t14;
+    t7 = t9 + t8;
+    t4 = 0.07904754755085189 * t7;
+    y[502] = t4;
+    t3 = 0.056346430106878946 * t7;
+    y[577] = t3;
+    t6 = (-C196) * t2;
+    t12 = (-C197) * t5;
+    t11 = t6 + t12;
+    t13 = 0.07921804168631846 * t11;
+    y[487] = t13;
+    t1 = 0.0480083543162075 * t11;
+    y[592] = t1;
+    t14 = C197 * t2;
+    t9 = (-C196) * t5;
+    t8 = t14 + t9;
+    t4 = 0.01000057866679364 * t8;
+    y[127] = t4;
+    t7 = (-0.06406929688631251) * t8;
+    y[232] = t7;
+    t3 = (-C198) * t10;
+    t6 = (-C199) * t0;
+    t12 = t3 + t6;
+    t13 = 0.07377673045010832 * t12;
+    y[397] = t13;
+    t11 = 0.004807832252336169 * t12;
+    y[682] = t11;
+    t1 = C199 * t10;
+    t2 = (-C198) * t0;
+    t5 = t1 + t2;
+    y[37] = 0;
+    t14 = (-0.07530227378824429) * t5;
+    y[322] = t14;
+}
+
+/**
+ *  Part 6 of ApplyWindowedIMDCT_W75_360().
+ * 
+ *  @param {Number[]} X 
+ *    - The input block (360 points).
+ *  @param {Number[]} y 
+ *    - The array that would contain the output block (720 points).
+ *  @param {Number[]} re 
+ *    - The scratch buffer (real part, 180 points).
+ *  @param {Number[]} im 
+ *    - The scratch buffer (imaginary part, 180 points).
+ */
+function ApplyWindowedIMDCT_W75_360_Part6(X, y, re, im) {
+    let t0, t1, t10, t11, t12, t13, t14, t2, t3, t4, t5, t6, t7, t8, t9;
+    const C0 = 0.8077327215818395;
+    const C1 = 0.5895488533497412;
+    const C2 = 0.5206371504623173;
+    const C3 = 0.8537780493538577;
+    const C4 = 0.15427929277242886;
+    const C5 = 0.9880272768611397;
+    const C6 = 0.9718583079558811;
+    const C7 = 0.23556618869679022;
+    const C8 = 0.9697656258615752;
+    const C9 = 0.24403817508190642;
+    const C10 = 0.8025572465980509;
+    const C11 = 0.5965751134039663;
+    const C12 = 0.5131668017395302;
+    const C13 = 0.8582888986771422;
+    const C14 = 0.1456513631848078;
+    const C15 = 0.9893359795349642;
+    const C16 = 0.13701234168196802;
+    const C17 = 0.9905693404435773;
+    const C18 = 0.9675990923602598;
+    const C19 = 0.25249157701515795;
+    const C20 = 0.7973206537727071;
+    const C21 = 0.6035559419535714;
+    const C22 = 0.5056573733779846;
+    const C23 = 0.8627343859777918;
+    const C24 = 0.4981094372497241;
+    const C25 = 0.8671141727147372;
+    const C26 = 0.12836288615884434;
+    const C27 = 0.9917272656617703;
+    const C28 = 0.9653588724418489;
+    const C29 = 0.2609257507372589;
+    const C30 = 0.7920233418926261;
+    const C31 = 0.6104908073814348;
+    const C32 = 0.786665714368617;
+    const C33 = 0.6173791815707049;
+    const C34 = 0.490523568159308;
+    const C35 = 0.8714279253502614;
+    const C36 = 0.11970365530496252;
+    const C37 = 0.992809667009055;
+    const C38 = 0.9630451367077627;
+    const C39 = 0.26934005395322597;
+    const C40 = 0.9606580613579353;
+    const C41 = 0.2777338458812922;
+    const C42 = 0.7812481792047586;
+    const C43 = 0.6242205399450176;
+    const C44 = 0.4829003438000374;
+    const C45 = 0.8756753153753997;
+    const C46 = 0.11103530855427768;
+    const C47 = 0.9938164620563781;
+    const C48 = 0.10235850603495578;
+    const C49 = 0.9947475741323987;
+    const C50 = 0.9581978281773966;
+    const C51 = 0.28610648730170424;
+    const C52 = 0.7757711489673284;
+    const C53 = 0.6310143615084456;
+    const C54 = 0.47524034470996157;
+    const C55 = 0.8798560193349574;
+    const C56 = 0.4675441542276683;
+    const C57 = 0.8839697188521416;
+    const C58 = 0.09367390851910222;
+    const C59 = 0.9956029323293272;
+    const C60 = 0.9556646245224285;
+    const C61 = 0.2944573406054019;
+    const C62 = 0.7702350407533842;
+    const C63 = 0.6377601288851731;
+    const C64 = 0.7646402761590003;
+    const C65 = 0.6444573283588975;
+    const C66 = 0.45981235844785984;
+    const C67 = 0.8880161006528073;
+    const C68 = 0.08498217737244167;
+    const C69 = 0.9963824715083254;
+    const C70 = 0.953058643306297;
+    const C71 = 0.3027857698425746;
+    const C72 = 0.9503800829845611;
+    const C73 = 0.31109114077109096;
+    const C74 = 0.7589872812471619;
+    const C75 = 0.6511054499119491;
+    const C76 = 0.45204554617671966;
+    const C77 = 0.8919948565893142;
+    const C78 = 0.0762839745039523;
+    const C79 = 0.9970861323044666;
+    const C80 = 0.06757996231545906;
+    const C81 = 0.9977138611312569;
+    const C82 = 0.9476291475399599;
+    const C83 = 0.31937282090479924;
+    const C84 = 0.7532764865153176;
+    const C85 = 0.6577039872641327;
+    const C86 = 0.4442443088870726;
+    const C87 = 0.8959056836639933;
+    const C88 = 0.436409240673342;
+    const C89 = 0.8997482840522215;
+    const C90 = 0.05887080365118903;
+    const C91 = 0.9982656101847159;
+    const C92 = 0.944806046466878;
+    const C93 = 0.3276301795616935;
+    const C94 = 0.7475083268625968;
+    const C95 = 0.6642524379112817;
+    const C96 = 0.7416832415566892;
+    const C97 = 0.6707503031635259;
+    const C98 = 0.4285409382063071;
+    const C99 = 0.903522365125102;
+    const C100 = 0.05015716174729338;
+    const C101 = 0.9987413374470168;
+    const C102 = 0.9419109947553924;
+    const C103 = 0.33586258791194235;
+    const C104 = 0.9389442128748994;
+    const C105 = 0.3440694190257768;
+    const C106 = 0.7358016742003936;
+    const C107 = 0.6771970881832687;
+    const C108 = 0.4206400006876641;
+    const C109 = 0.9072276394717491;
+    const C110 = 0.04143970018133933;
+    const C111 = 0.9991410066896868;
+    const C112 = 0.03271908282177614;
+    const C113 = 0.9994645874763657;
+    const C114 = 0.9359059267573258;
+    const C115 = 0.3522500479212335;
+    const C116 = 0.7298640726978356;
+    const C117 = 0.6835923020228712;
+    const C118 = 0.41270702980439467;
+    const C119 = 0.9108638249211758;
+    const C120 = 0.4047426296829455;
+    const C121 = 0.9144306445637821;
+    const C122 = 0.023995973777378995;
+    const C123 = 0.9997120551651237;
+    const C124 = 0.9327963677799223;
+    const C125 = 0.3604038516117495;
+    const C126 = 0.7238708892203581;
+    const C127 = 0.6899354576620396;
+    const C128 = 0.7178225801720864;
+    const C129 = 0.6962260720449132;
+    const C130 = 0.3967474068432212;
+    const C131 = 0.9179278267724427;
+    const C132 = 0.015271037346674515;
+    const C133 = 0.9998833909103383;
+    const C134 = 0.9296157727476445;
+    const C135 = 0.368530209153605;
+    const C136 = 0.9263643838751181;
+    const C137 = 0.3766285016932107;
+    const C138 = 0.7117196061551713;
+    const C139 = 0.7024636661168517;
+    const C140 = 0.38872197015239557;
+    const C141 = 0.9213551052231925;
+    const C142 = 0.006544937967351858;
+    const C143 = 0.9999785816641292;
+    t9 = re[72];
+    t4 = im[72];
+    t8 = re[117];
+    t7 = im[117];
+    t3 = re[162];
+    t6 = im[162];
+    t13 = re[27];
+    t12 = im[27];
+    t11 = t9 + t3;
+    t10 = t4 + t6;
+    t0 = t8 + t13;
+    t1 = t7 + t12;
+    t2 = t9 - t3;
+    t5 = t4 - t6;
+    t14 = t8 - t13;
+    t9 = t7 - t12;
+    t3 = t11 + t0;
+    t4 = t10 + t1;
+    t6 = t2 + t9;
+    t8 = t5 - t14;
+    t13 = t11 - t0;
+    t7 = t10 - t1;
+    t12 = t2 - t9;
+    t11 = t5 + t14;
+    t0 = (-C0) * t3;
+    t10 = (-C1) * t4;
+    t1 = t0 + t10;
+    t2 = 0.07378162974538252 * t1;
+    y[395] = t2;
+    t9 = 0.004338010208852921 * t1;
+    y[684] = t9;
+    t5 = C1 * t3;
+    t14 = (-C0) * t4;
+    t0 = t5 + t14;
+    y[35] = 0;
+    t10 = (-0.07529727351818549) * t0;
+    y[324] = t10;
+    t2 = C2 * t6;
+    t1 = C3 * t8;
+    t9 = t2 + t1;
+    y[54] = 0;
+    t3 = (-0.07506814700296977) * t9;
+    y[305] = t3;
+    t4 = (-C3) * t6;
+    t5 = C2 * t8;
+    t14 = t4 + t5;
+    t0 = 0.0740068294923514 * t14;
+    y[414] = t0;
+    t10 = 0.00989986156716879 * t14;
+    y[665] = t10;
+    t2 = C4 * t13;
+    t1 = C5 * t7;
+    t9 = t2 + t1;
+    t3 = 0.01793167713832639 * t9;
+    y[144] = t3;
+    t6 = (-0.05734497793414243) * t9;
+    y[215] = t6;
+    t8 = (-C5) * t13;
+    t4 = C4 * t7;
+    t5 = t8 + t4;
+    t0 = 0.07893135423244699 * t5;
+    y[504] = t0;
+    t14 = 0.057397798367898024 * t5;
+    y[575] = t14;
+    t10 = (-C6) * t12;
+    t2 = (-C7) * t11;
+    t1 = t10 + t2;
+    t3 = 0.07915951523735842 * t1;
+    y[485] = t3;
+    t9 = 0.04685099768320636 * t1;
+    y[594] = t9;
+    t6 = C7 * t12;
+    t13 = (-C6) * t11;
+    t7 = t6 + t13;
+    t8 = 0.009201834299866771 * t7;
+    y[125] = t8;
+    t4 = (-0.06473562177238838) * t7;
+    y[234] = t4;
+    t0 = re[168];
+    t5 = im[168];
+    t14 = re[33];
+    t10 = im[33];
+    t2 = re[78];
+    t3 = im[78];
+    t1 = re[123];
+    t9 = im[123];
+    t12 = t0 + t2;
+    t11 = t5 + t3;
+    t6 = t14 + t1;
+    t13 = t10 + t9;
+    t8 = t0 - t2;
+    t7 = t5 - t3;
+    t4 = t14 - t1;
+    t0 = t10 - t9;
+    t2 = t12 + t6;
+    t5 = t11 + t13;
+    t3 = t8 + t0;
+    t14 = t7 - t4;
+    t1 = t12 - t6;
+    t10 = t11 - t13;
+    t9 = t8 - t0;
+    t12 = t7 + t4;
+    t6 = (-C8) * t2;
+    t11 = (-C9) * t5;
+    t13 = t6 + t11;
+    t8 = 0.07908447036354024 * t13;
+    y[483] = t8;
+    t0 = 0.045686310111039866 * t13;
+    y[596] = t0;
+    t7 = C9 * t2;
+    t4 = (-C8) * t5;
+    t6 = t7 + t4;
+    t11 = 0.008434424318712016 * t6;
+    y[123] = t11;
+    t8 = (-0.06537589246986183) * t6;
+    y[236] = t8;
+    t13 = (-C10) * t3;
+    t0 = (-C11) * t14;
+    t2 = t13 + t0;
+    t5 = 0.07379227712376644 * t2;
+    y[393] = t5;
+    t7 = 0.00389514461881248 * t2;
+    y[686] = t7;
+    t4 = C11 * t3;
+    t11 = (-C10) * t14;
+    t6 = t4 + t11;
+    y[33] = 0;
+    t8 = (-0.07528640898610062) * t6;
+    y[326] = t8;
+    t13 = C12 * t1;
+    t0 = C13 * t10;
+    t5 = t13 + t0;
+    y[56] = 0;
+    t2 = (-0.07500397558099361) * t5;
+    y[303] = t2;
+    t7 = (-C13) * t1;
+    t3 = C12 * t10;
+    t14 = t7 + t3;
+    t4 = 0.07407014778245119 * t14;
+    y[416] = t4;
+    t11 = 0.010627184958870271 * t14;
+    y[663] = t11;
+    t6 = C14 * t9;
+    t8 = C15 * t12;
+    t13 = t6 + t8;
+    t0 = 0.018981178489387872 * t13;
+    y[146] = t0;
+    t5 = (-0.05643381030579669) * t13;
+    y[213] = t5;
+    t2 = (-C15) * t9;
+    t1 = C14 * t12;
+    t10 = t2 + t1;
+    t7 = 0.07879064723850839 * t10;
+    y[506] = t7;
+    t3 = 0.058431520258171214 * t10;
+    y[573] = t3;
+    t4 = re[84];
+    t14 = im[84];
+    t11 = re[129];
+    t6 = im[129];
+    t8 = re[174];
+    t0 = im[174];
+    t13 = re[39];
+    t5 = im[39];
+    t9 = t4 + t8;
+    t12 = t14 + t0;
+    t2 = t11 + t13;
+    t1 = t6 + t5;
+    t7 = t4 - t8;
+    t10 = t14 - t0;
+    t3 = t11 - t13;
+    t4 = t6 - t5;
+    t8 = t9 + t2;
+    t14 = t12 + t1;
+    t0 = t7 + t4;
+    t11 = t10 - t3;
+    t13 = t9 - t2;
+    t6 = t12 - t1;
+    t5 = t7 - t4;
+    t9 = t10 + t3;
+    t2 = C16 * t8;
+    t12 = C17 * t14;
+    t1 = t2 + t12;
+    t7 = 0.02005153598606483 * t1;
+    y[148] = t7;
+    t4 = (-0.05549852471039634) * t1;
+    y[211] = t4;
+    t10 = (-C17) * t8;
+    t3 = C16 * t14;
+    t2 = t10 + t3;
+    t12 = 0.07862483745225313 * t2;
+    y[508] = t12;
+    t7 = 0.05944647194056285 * t2;
+    y[571] = t7;
+    t1 = (-C18) * t0;
+    t4 = (-C19) * t11;
+    t8 = t1 + t4;
+    t14 = 0.0789941020164104 * t8;
+    y[481] = t14;
+    t10 = 0.04451574105757036 * t8;
+    y[598] = t10;
+    t3 = C19 * t0;
+    t12 = (-C18) * t11;
+    t2 = t3 + t12;
+    t7 = 0.007698836753981549 * t2;
+    y[121] = t7;
+    t1 = (-0.06599019419307889) * t2;
+    y[238] = t1;
+    t4 = (-C20) * t13;
+    t14 = (-C21) * t6;
+    t8 = t4 + t14;
+    t10 = 0.07380836847924803 * t8;
+    y[391] = t10;
+    t0 = 0.003478890727204296 * t8;
+    y[688] = t0;
+    t11 = C21 * t13;
+    t3 = (-C20) * t6;
+    t12 = t11 + t3;
+    y[31] = 0;
+    t7 = (-0.07526999539513679) * t12;
+    y[328] = t7;
+    t2 = C22 * t5;
+    t1 = C23 * t9;
+    t4 = t2 + t1;
+    y[58] = 0;
+    t14 = (-0.07493137687072132) * t4;
+    y[301] = t14;
+    t10 = (-C23) * t5;
+    t8 = C22 * t9;
+    t0 = t10 + t8;
+    t13 = 0.07414191207430397 * t0;
+    y[418] = t13;
+    t6 = 0.011380873256119571 * t0;
+    y[661] = t6;
+    t11 = re[20];
+    t3 = im[20];
+    t12 = re[65];
+    t7 = im[65];
+    t2 = re[110];
+    t1 = im[110];
+    t4 = re[155];
+    t14 = im[155];
+    t5 = t11 + t2;
+    t9 = t3 + t1;
+    t10 = t12 + t4;
+    t8 = t7 + t14;
+    t13 = t11 - t2;
+    t0 = t3 - t1;
+    t6 = t12 - t4;
+    t11 = t7 - t14;
+    t2 = t5 + t10;
+    t3 = t9 + t8;
+    t1 = t13 + t11;
+    t12 = t0 - t6;
+    t4 = t5 - t10;
+    t7 = t9 - t8;
+    t14 = t13 - t11;
+    t5 = t0 + t6;
+    t10 = C24 * t2;
+    t9 = C25 * t3;
+    t8 = t10 + t9;
+    y[60] = 0;
+    t13 = (-0.07485027111278542) * t8;
+    y[299] = t13;
+    t11 = (-C25) * t2;
+    t0 = C24 * t3;
+    t6 = t11 + t0;
+    t10 = 0.07422225027327382 * t6;
+    y[420] = t10;
+    t9 = 0.012160671482139212 * t6;
+    y[659] = t9;
+    t8 = C26 * t1;
+    t13 = C27 * t12;
+    t2 = t8 + t13;
+    t3 = 0.02113986934740008 * t2;
+    y[150] = t3;
+    t11 = (-0.054540535915650216) * t2;
+    y[209] = t11;
+    t0 = (-C27) * t1;
+    t10 = C26 * t12;
+    t6 = t0 + t10;
+    t9 = 0.07843375404242915 * t6;
+    y[510] = t9;
+    t8 = 0.06044202805644682 * t6;
+    y[569] = t8;
+    t13 = (-C28) * t4;
+    t3 = (-C29) * t7;
+    t2 = t13 + t3;
+    t11 = 0.07889007024276715 * t2;
+    y[479] = t11;
+    t1 = 0.04334071171649066 * t2;
+    y[600] = t1;
+    t12 = C29 * t4;
+    t0 = (-C28) * t7;
+    t10 = t12 + t0;
+    t9 = 0.006995911514090678 * t10;
+    y[119] = t9;
+    t6 = (-0.06657805925722098) * t10;
+    y[240] = t6;
+    t8 = (-C30) * t14;
+    t13 = (-C31) * t5;
+    t3 = t8 + t13;
+    t11 = 0.07382960802169211 * t3;
+    y[389] = t11;
+    t2 = 0.0030890222459463205 * t3;
+    y[690] = t2;
+    t1 = C31 * t14;
+    t4 = (-C30) * t5;
+    t7 = t1 + t4;
+    y[29] = 0;
+    t12 = (-0.07524834147735497) * t7;
+    y[330] = t12;
+    t0 = re[116];
+    t9 = im[116];
+    t10 = re[161];
+    t6 = im[161];
+    t8 = re[26];
+    t13 = im[26];
+    t11 = re[71];
+    t3 = im[71];
+    t2 = t0 + t8;
+    t14 = t9 + t13;
+    t5 = t10 + t11;
+    t1 = t6 + t3;
+    t4 = t0 - t8;
+    t7 = t9 - t13;
+    t12 = t10 - t11;
+    t0 = t6 - t3;
+    t8 = t2 + t5;
+    t9 = t14 + t1;
+    t13 = t4 + t0;
+    t10 = t7 - t12;
+    t11 = t2 - t5;
+    t6 = t14 - t1;
+    t3 = t4 - t0;
+    t2 = t7 + t12;
+    t5 = (-C32) * t8;
+    t14 = (-C33) * t9;
+    t1 = t5 + t14;
+    t4 = 0.0738556887375873 * t1;
+    y[387] = t4;
+    t0 = 0.002725625043690865 * t1;
+    y[692] = t0;
+    t7 = C33 * t8;
+    t12 = (-C32) * t9;
+    t5 = t7 + t12;
+    y[27] = 0;
+    t14 = (-0.07522176897293187) * t5;
+    y[332] = t14;
+    t4 = C34 * t13;
+    t1 = C35 * t10;
+    t0 = t4 + t1;
+    y[62] = 0;
+    t8 = (-0.0747604873846722) * t0;
+    y[297] = t8;
+    t9 = (-C35) * t13;
+    t7 = C34 * t10;
+    t12 = t9 + t7;
+    t5 = 0.07431138760465847 * t12;
+    y[422] = t5;
+    t14 = 0.012966061461159185 * t12;
+    y[657] = t14;
+    t4 = C36 * t11;
+    t1 = C37 * t6;
+    t0 = t4 + t1;
+    t8 = 0.022245471494846798 * t0;
+    y[152] = t8;
+    t13 = (-0.05356040398594876) * t0;
+    y[207] = t13;
+    t10 = (-C37) * t11;
+    t9 = C36 * t6;
+    t7 = t10 + t9;
+    t5 = 0.07821641575885593 * t7;
+    y[512] = t5;
+    t12 = 0.06141711716448885 * t7;
+    y[567] = t12;
+    t14 = (-C38) * t3;
+    t4 = (-C39) * t2;
+    t1 = t14 + t4;
+    t8 = 0.07877322937044845 * t1;
+    y[477] = t8;
+    t0 = 0.04216237624301753 * t1;
+    y[602] = t0;
+    t13 = C39 * t3;
+    t11 = (-C38) * t2;
+    t6 = t13 + t11;
+    t10 = 0.00632622466030756 * t6;
+    y[117] = t10;
+    t9 = (-0.06713990188669226) * t6;
+    y[242] = t9;
+    t5 = re[32];
+    t7 = im[32];
+    t12 = re[77];
+    t14 = im[77];
+    t4 = re[122];
+    t8 = im[122];
+    t1 = re[167];
+    t0 = im[167];
+    t3 = t5 + t4;
+    t2 = t7 + t8;
+    t13 = t12 + t1;
+    t11 = t14 + t0;
+    t10 = t5 - t4;
+    t6 = t7 - t8;
+    t9 = t12 - t1;
+    t5 = t14 - t0;
+    t4 = t3 + t13;
+    t7 = t2 + t11;
+    t8 = t10 + t5;
+    t12 = t6 - t9;
+    t1 = t3 - t13;
+    t14 = t2 - t11;
+    t0 = t10 - t5;
+    t3 = t6 + t9;
+    t13 = (-C40) * t4;
+    t2 = (-C41) * t7;
+    t11 = t13 + t2;
+    t10 = 0.0786440057564167 * t11;
+    y[475] = t10;
+    t5 = 0.040982004156227624 * t11;
+    y[604] = t5;
+    t6 = C41 * t4;
+    t9 = (-C40) * t7;
+    t13 = t6 + t9;
+    t2 = 0.0056902696629836606 * t13;
+    y[115] = t2;
+    t10 = (-0.06767657432229467) * t13;
+    y[244] = t10;
+    t11 = (-C42) * t8;
+    t5 = (-C43) * t12;
+    t4 = t11 + t5;
+    t7 = 0.07388628536627204 * t4;
+    y[385] = t7;
+    t6 = 0.002388239070442009 * t4;
+    y[694] = t6;
+    t9 = C43 * t8;
+    t2 = (-C42) * t12;
+    t13 = t9 + t2;
+    y[25] = 0;
+    t10 = (-0.07519061931473928) * t13;
+    y[334] = t10;
+    t11 = C44 * t1;
+    t5 = C45 * t14;
+    t7 = t11 + t5;
+    y[64] = 0;
+    t4 = (-0.07466183533419639) * t7;
+    y[295] = t4;
+    t6 = (-C45) * t1;
+    t8 = C44 * t14;
+    t12 = t6 + t8;
+    t9 = 0.07440957660213073 * t12;
+    y[424] = t9;
+    t2 = 0.013796025469382255 * t12;
+    y[655] = t2;
+    t13 = C46 * t0;
+    t10 = C47 * t3;
+    t11 = t13 + t10;
+    t5 = 0.023366643389733904 * t11;
+    y[154] = t5;
+    t7 = (-0.052559051234607114) * t11;
+    y[205] = t7;
+    t4 = (-C47) * t0;
+    t1 = C46 * t3;
+    t14 = t4 + t1;
+    t6 = 0.07797231412824676 * t14;
+    y[514] = t6;
+    t8 = 0.0623711620920472 * t14;
+    y[565] = t8;
+    t9 = re[148];
+    t12 = im[148];
+    t2 = re[13];
+    t13 = im[13];
+    t10 = re[58];
+    t5 = im[58];
+    t11 = re[103];
+    t7 = im[103];
+    t0 = t9 + t10;
+    t3 = t12 + t5;
+    t4 = t2 + t11;
+    t1 = t13 + t7;
+    t6 = t9 - t10;
+    t14 = t12 - t5;
+    t8 = t2 - t11;
+    t9 = t13 - t7;
+    t10 = t0 + t4;
+    t12 = t3 + t1;
+    t5 = t6 + t9;
+    t2 = t14 - t8;
+    t11 = t0 - t4;
+    t13 = t3 - t1;
+    t7 = t6 - t9;
+    t0 = t14 + t8;
+    t4 = C48 * t10;
+    t3 = C49 * t12;
+    t1 = t4 + t3;
+    t6 = 0.024502010484116685 * t1;
+    y[156] = t6;
+    t9 = (-0.051537200432593716) * t1;
+    y[203] = t9;
+    t14 = (-C49) * t10;
+    t8 = C48 * t12;
+    t4 = t14 + t8;
+    t3 = 0.07770100053496265 * t4;
+    y[516] = t3;
+    t6 = 0.06330352026326927 * t4;
+    y[563] = t6;
+    t1 = (-C50) * t5;
+    t9 = (-C51) * t2;
+    t10 = t1 + t9;
+    t12 = 0.07850338675965945 * t10;
+    y[473] = t12;
+    t14 = 0.03980072930307692 * t10;
+    y[606] = t14;
+    t8 = C51 * t5;
+    t3 = (-C50) * t2;
+    t4 = t8 + t3;
+    t6 = 0.005088538798301135 * t4;
+    y[113] = t6;
+    t1 = (-0.06818849760819402) * t4;
+    y[246] = t1;
+    t9 = (-C52) * t11;
+    t12 = (-C53) * t13;
+    t10 = t9 + t12;
+    t14 = 0.0739211028647384 * t10;
+    y[383] = t14;
+    t5 = 0.0020762064534554383 * t10;
+    y[696] = t5;
+    t2 = C53 * t11;
+    t8 = (-C52) * t13;
+    t3 = t2 + t8;
+    y[23] = 0;
+    t6 = (-0.0751552038627071) * t3;
+    y[336] = t6;
+    t4 = C54 * t7;
+    t1 = C55 * t0;
+    t9 = t4 + t1;
+    y[66] = 0;
+    t12 = (-0.07455431330961315) * t9;
+    y[293] = t12;
+    t14 = (-C55) * t7;
+    t10 = C54 * t0;
+    t5 = t14 + t10;
+    t11 = 0.07451688988783449 * t5;
+    y[426] = t11;
+    t13 = 0.014650456311092089 * t5;
+    y[653] = t13;
+    t2 = re[64];
+    t8 = im[64];
+    t3 = re[109];
+    t6 = im[109];
+    t4 = re[154];
+    t1 = im[154];
+    t9 = re[19];
+    t12 = im[19];
+    t7 = t2 + t4;
+    t0 = t8 + t1;
+    t14 = t3 + t9;
+    t10 = t6 + t12;
+    t11 = t2 - t4;
+    t5 = t8 - t1;
+    t13 = t3 - t9;
+    t2 = t6 - t12;
+    t4 = t7 + t14;
+    t8 = t0 + t10;
+    t1 = t11 + t2;
+    t3 = t5 - t13;
+    t9 = t7 - t14;
+    t6 = t0 - t10;
+    t12 = t11 - t2;
+    t7 = t5 + t13;
+    t14 = C56 * t4;
+    t0 = C57 * t8;
+    t10 = t14 + t0;
+    y[68] = 0;
+    t11 = (-0.0744379272334968) * t10;
+    y[291] = t11;
+    t2 = (-C57) * t4;
+    t5 = C56 * t8;
+    t13 = t2 + t5;
+    t14 = 0.0746333994245822 * t13;
+    y[428] = t14;
+    t0 = 0.015529151731525307 * t13;
+    y[651] = t0;
+    t10 = C58 * t1;
+    t11 = C59 * t3;
+    t4 = t10 + t11;
+    t8 = 0.02564994813000861 * t4;
+    y[158] = t8;
+    t2 = (-0.050495641314265864) * t4;
+    y[201] = t2;
+    t5 = (-C59) * t1;
+    t14 = C58 * t3;
+    t13 = t5 + t14;
+    t0 = 0.07740250729577286 * t13;
+    y[518] = t0;
+    t10 = 0.06421324136700357 * t13;
+    y[561] = t10;
+    t11 = (-C60) * t9;
+    t8 = (-C61) * t6;
+    t4 = t11 + t8;
+    t2 = 0.07835306485128514 * t4;
+    y[471] = t2;
+    t1 = 0.03862009352798275 * t4;
+    y[608] = t1;
+    t3 = C61 * t9;
+    t5 = (-C60) * t6;
+    t14 = t3 + t5;
+    t0 = 0.004521478542881972 * t14;
+    y[111] = t0;
+    t13 = (-0.06867549650492617) * t14;
+    y[248] = t13;
+    t10 = (-C62) * t12;
+    t11 = (-C63) * t7;
+    t8 = t10 + t11;
+    t2 = 0.0739598233310438 * t8;
+    y[381] = t2;
+    t4 = 0.0017892804740102255 * t8;
+    y[698] = t4;
+    t1 = C63 * t12;
+    t9 = (-C62) * t7;
+    t6 = t1 + t9;
+    y[21] = 0;
+    t3 = (-0.07511585757430651) * t6;
+    y[338] = t3;
+    t5 = re[160];
+    t0 = im[160];
+    t14 = re[25];
+    t13 = im[25];
+    t10 = re[70];
+    t11 = im[70];
+    t2 = re[115];
+    t8 = im[115];
+    t4 = t5 + t10;
+    t12 = t0 + t11;
+    t7 = t14 + t2;
+    t1 = t13 + t8;
+    t9 = t5 - t10;
+    t6 = t0 - t11;
+    t3 = t14 - t2;
+    t5 = t13 - t8;
+    t10 = t4 + t7;
+    t0 = t12 + t1;
+    t11 = t9 + t5;
+    t14 = t6 - t3;
+    t2 = t4 - t7;
+    t13 = t12 - t1;
+    t8 = t9 - t5;
+    t4 = t6 + t3;
+    t7 = (-C64) * t10;
+    t12 = (-C65) * t0;
+    t1 = t7 + t12;
+    t9 = 0.07400212506510842 * t1;
+    y[379] = t9;
+    t5 = 0.0015273734490899057 * t1;
+    y[700] = t5;
+    t6 = C65 * t10;
+    t3 = (-C64) * t0;
+    t7 = t6 + t3;
+    y[19] = 0;
+    t12 = (-0.075072919198843) * t7;
+    y[340] = t12;
+    t9 = C66 * t11;
+    t1 = C67 * t14;
+    t5 = t9 + t1;
+    y[70] = 0;
+    t10 = (-0.0743124672610912) * t5;
+    y[289] = t10;
+    t0 = (-C67) * t11;
+    t6 = C66 * t14;
+    t3 = t0 + t6;
+    t7 = 0.07475940121913238 * t3;
+    y[430] = t7;
+    t12 = 0.01643140007008193 * t3;
+    y[649] = t12;
+    t9 = C68 * t2;
+    t1 = C69 * t13;
+    t5 = t9 + t1;
+    t10 = 0.026808971667655078 * t5;
+    y[160] = t10;
+    t11 = (-0.04943537917192268) * t5;
+    y[199] = t11;
+    t14 = (-C69) * t2;
+    t0 = C68 * t13;
+    t6 = t14 + t0;
+    t7 = 0.07707650387176249 * t6;
+    y[520] = t7;
+    t3 = 0.0650994518941004 * t6;
+    y[559] = t3;
+    t12 = (-C70) * t8;
+    t9 = (-C71) * t4;
+    t1 = t12 + t9;
+    t10 = 0.07819438677399508 * t1;
+    y[469] = t10;
+    t5 = 0.0374410809653893 * t1;
+    y[610] = t5;
+    t11 = C71 * t8;
+    t2 = (-C70) * t4;
+    t13 = t11 + t2;
+    t14 = 0.003989471102289299 * t13;
+    y[109] = t14;
+    t0 = (-0.06913776893770059) * t13;
+    y[250] = t0;
+    t7 = re[36];
+    t6 = im[36];
+    t3 = re[81];
+    t12 = im[81];
+    t9 = re[126];
+    t10 = im[126];
+    t1 = re[171];
+    t5 = im[171];
+    t8 = t7 + t9;
+    t4 = t6 + t10;
+    t11 = t3 + t1;
+    t2 = t12 + t5;
+    t14 = t7 - t9;
+    t13 = t6 - t10;
+    t0 = t3 - t1;
+    t7 = t12 - t5;
+    t9 = t8 + t11;
+    t6 = t4 + t2;
+    t10 = t14 + t7;
+    t3 = t13 - t0;
+    t1 = t8 - t11;
+    t12 = t4 - t2;
+    t5 = t14 - t7;
+    t8 = t13 + t0;
+    t11 = (-C72) * t9;
+    t4 = (-C73) * t6;
+    t2 = t11 + t4;
+    t14 = 0.07802784084844781 * t2;
+    y[467] = t14;
+    t7 = 0.03626495541946783 * t2;
+    y[612] = t7;
+    t13 = C73 * t9;
+    t0 = (-C72) * t6;
+    t11 = t13 + t0;
+    t4 = 0.003492818601842453 * t11;
+    y[107] = t4;
+    t14 = (-0.06957630232542114) * t11;
+    y[252] = t14;
+    t2 = (-C74) * t10;
+    t7 = (-C75) * t3;
+    t9 = t2 + t7;
+    t6 = 0.07404769515489659 * t9;
+    y[377] = t6;
+    t13 = 0.0012899360456039698 * t9;
+    y[702] = t13;
+    t0 = C75 * t10;
+    t4 = (-C74) * t3;
+    t11 = t0 + t4;
+    y[17] = 0;
+    t14 = (-0.07502671817041937) * t11;
+    y[342] = t14;
+    t2 = C76 * t1;
+    t7 = C77 * t12;
+    t6 = t2 + t7;
+    y[72] = 0;
+    t9 = (-0.07417793301083843) * t6;
+    y[287] = t9;
+    t13 = (-C77) * t1;
+    t10 = C76 * t12;
+    t3 = t13 + t10;
+    t0 = 0.07489499006050511 * t3;
+    y[432] = t0;
+    t4 = 0.0173560823152087 * t3;
+    y[647] = t4;
+    t11 = C78 * t5;
+    t14 = C79 * t8;
+    t2 = t11 + t14;
+    t7 = 0.02797728396717007 * t2;
+    y[162] = t7;
+    t6 = (-0.04835784909338468) * t2;
+    y[197] = t6;
+    t9 = (-C79) * t5;
+    t1 = C78 * t8;
+    t12 = t9 + t1;
+    t13 = 0.07672217418086602 * t12;
+    y[522] = t13;
+    t10 = 0.06596195100876791 * t12;
+    y[557] = t10;
+    t0 = re[132];
+    t3 = im[132];
+    t4 = re[177];
+    t11 = im[177];
+    t14 = re[42];
+    t7 = im[42];
+    t2 = re[87];
+    t6 = im[87];
+    t5 = t0 + t14;
+    t8 = t3 + t7;
+    t9 = t4 + t2;
+    t1 = t11 + t6;
+    t13 = t0 - t14;
+    t12 = t3 - t7;
+    t10 = t4 - t2;
+    t0 = t11 - t6;
+    t14 = t5 + t9;
+    t3 = t8 + t1;
+    t7 = t13 + t0;
+    t4 = t12 - t10;
+    t2 = t5 - t9;
+    t11 = t8 - t1;
+    t6 = t13 - t0;
+    t5 = t12 + t10;
+    t9 = C80 * t14;
+    t8 = C81 * t3;
+    t1 = t9 + t8;
+    t13 = 0.02915345280549821 * t1;
+    y[164] = t13;
+    t0 = (-0.04726409103525733) * t1;
+    y[195] = t0;
+    t12 = (-C81) * t14;
+    t10 = C80 * t3;
+    t9 = t12 + t10;
+    t8 = 0.07633919069356716 * t9;
+    y[524] = t8;
+    t13 = 0.06680008402605578 * t9;
+    y[555] = t13;
+    t1 = (-C82) * t7;
+    t0 = (-C83) * t4;
+    t14 = t1 + t0;
+    t3 = 0.07785396622111439 * t14;
+    y[465] = t3;
+    t12 = 0.035093195103053254 * t14;
+    y[614] = t12;
+    t10 = C83 * t7;
+    t8 = (-C82) * t4;
+    t9 = t10 + t8;
+    t13 = 0.0030317233148571673 * t9;
+    y[105] = t13;
+    t1 = (-0.06999210139522677) * t9;
+    y[254] = t1;
+    t0 = (-C84) * t2;
+    t3 = (-C85) * t11;
+    t14 = t0 + t3;
+    t12 = 0.07409618871715787 * t14;
+    y[375] = t12;
+    t7 = 0.0010762203215031797 * t14;
+    y[704] = t7;
+    t4 = C85 * t2;
+    t10 = (-C84) * t11;
+    t8 = t4 + t10;
+    y[15] = 0;
+    t13 = (-0.07497761560668637) * t8;
+    y[344] = t13;
+    t9 = C86 * t6;
+    t1 = C87 * t5;
+    t0 = t9 + t1;
+    y[74] = 0;
+    t3 = (-0.07403454077246585) * t0;
+    y[285] = t3;
+    t12 = (-C87) * t6;
+    t14 = C86 * t5;
+    t7 = t12 + t14;
+    t2 = 0.07504004884192814 * t7;
+    y[434] = t2;
+    t11 = 0.018302264227918173 * t7;
+    y[645] = t11;
+    t4 = re[48];
+    t10 = im[48];
+    t8 = re[93];
+    t13 = im[93];
+    t9 = re[138];
+    t1 = im[138];
+    t0 = re[3];
+    t3 = im[3];
+    t6 = t4 + t9;
+    t5 = t10 + t1;
+    t12 = t8 + t0;
+    t14 = t13 + t3;
+    t2 = t4 - t9;
+    t7 = t10 - t1;
+    t11 = t8 - t0;
+    t4 = t13 - t3;
+    t9 = t6 + t12;
+    t10 = t5 + t14;
+    t1 = t2 + t4;
+    t8 = t7 - t11;
+    t0 = t6 - t12;
+    t13 = t5 - t14;
+    t3 = t2 - t4;
+    t6 = t7 + t11;
+    t12 = C88 * t9;
+    t5 = C89 * t10;
+    t14 = t12 + t5;
+    y[76] = 0;
+    t2 = (-0.0738820686854372) * t14;
+    y[283] = t2;
+    t4 = (-C89) * t9;
+    t7 = C88 * t10;
+    t11 = t4 + t7;
+    t12 = 0.07519491067865303 * t11;
+    y[436] = t12;
+    t5 = 0.019269402875175413 * t11;
+    y[643] = t5;
+    t14 = C90 * t1;
+    t2 = C91 * t8;
+    t9 = t14 + t2;
+    t10 = 0.030335539013196404 * t9;
+    y[166] = t10;
+    t4 = (-0.046155076669294415) * t9;
+    y[193] = t4;
+    t7 = (-C91) * t1;
+    t12 = C90 * t8;
+    t11 = t7 + t12;
+    t5 = 0.07592809470006731 * t11;
+    y[526] = t5;
+    t14 = 0.0676133864780924 * t11;
+    y[553] = t14;
+    t2 = (-C92) * t0;
+    t10 = (-C93) * t13;
+    t9 = t2 + t10;
+    t4 = 0.0776741671325514 * t9;
+    y[463] = t4;
+    t1 = 0.033926889543385 * t9;
+    y[616] = t1;
+    t8 = C93 * t0;
+    t7 = (-C92) * t13;
+    t12 = t8 + t7;
+    t5 = 0.0026062646773406016 * t12;
+    y[103] = t5;
+    t11 = (-0.07038547439326777) * t12;
+    y[256] = t11;
+    t14 = (-C94) * t3;
+    t2 = (-C95) * t6;
+    t10 = t14 + t2;
+    t4 = 0.07414729844179238 * t10;
+    y[373] = t4;
+    t9 = 0.000885182709137595 * t10;
+    y[706] = t9;
+    t1 = C95 * t3;
+    t0 = (-C94) * t6;
+    t13 = t1 + t0;
+    y[13] = 0;
+    t8 = (-0.07492593354452172) * t13;
+    y[346] = t8;
+    t7 = re[164];
+    t5 = im[164];
+    t12 = re[29];
+    t11 = im[29];
+    t14 = re[74];
+    t2 = im[74];
+    t4 = re[119];
+    t10 = im[119];
+    t9 = t7 + t14;
+    t3 = t5 + t2;
+    t6 = t12 + t4;
+    t1 = t11 + t10;
+    t0 = t7 - t14;
+    t13 = t5 - t2;
+    t8 = t12 - t4;
+    t7 = t11 - t10;
+    t14 = t9 + t6;
+    t5 = t3 + t1;
+    t2 = t0 + t7;
+    t12 = t13 - t8;
+    t4 = t9 - t6;
+    t11 = t3 - t1;
+    t10 = t0 - t7;
+    t9 = t13 + t8;
+    t6 = (-C96) * t14;
+    t3 = (-C97) * t5;
+    t1 = t6 + t3;
+    t0 = 0.0742006958638272 * t1;
+    y[371] = t0;
+    t7 = 0.0007162412227853556 * t1;
+    y[708] = t7;
+    t13 = C97 * t14;
+    t8 = (-C96) * t5;
+    t6 = t13 + t8;
+    y[11] = 0;
+    t3 = (-0.07487201421602685) * t6;
+    y[348] = t3;
+    t0 = C98 * t2;
+    t1 = C99 * t12;
+    t7 = t0 + t1;
+    y[78] = 0;
+    t14 = (-0.07372050726801713) * t7;
+    y[281] = t14;
+    t5 = (-C99) * t2;
+    t13 = C98 * t12;
+    t8 = t5 + t13;
+    t6 = 0.07535970330966202 * t8;
+    y[438] = t6;
+    t3 = 0.020256980411977373 * t8;
+    y[641] = t3;
+    t0 = C100 * t4;
+    t1 = C101 * t11;
+    t7 = t0 + t1;
+    t14 = 0.03152247059222997 * t7;
+    y[168] = t14;
+    t2 = (-0.045031547794885766) * t7;
+    y[191] = t2;
+    t12 = (-C101) * t4;
+    t5 = C100 * t11;
+    t13 = t12 + t5;
+    t6 = 0.07548893115038266 * t13;
+    y[528] = t6;
+    t8 = 0.06840111526676283 * t13;
+    y[551] = t8;
+    t3 = (-C102) * t10;
+    t0 = (-C103) * t9;
+    t1 = t3 + t0;
+    t14 = 0.07748989472063063 * t1;
+    y[461] = t14;
+    t7 = 0.0327669483767956 * t1;
+    y[618] = t7;
+    t2 = C103 * t10;
+    t4 = (-C102) * t9;
+    t11 = t2 + t4;
+    t12 = 0.0022163732028366626 * t11;
+    y[101] = t12;
+    t5 = (-0.07075673271981794) * t11;
+    y[258] = t5;
+    t6 = re[80];
+    t13 = im[80];
+    t8 = re[125];
+    t3 = im[125];
+    t0 = re[170];
+    t14 = im[170];
+    t1 = re[35];
+    t7 = im[35];
+    t10 = t6 + t0;
+    t9 = t13 + t14;
+    t2 = t8 + t1;
+    t4 = t3 + t7;
+    t12 = t6 - t0;
+    t11 = t13 - t14;
+    t5 = t8 - t1;
+    t6 = t3 - t7;
+    t0 = t10 + t2;
+    t13 = t9 + t4;
+    t14 = t12 + t6;
+    t8 = t11 - t5;
+    t1 = t10 - t2;
+    t3 = t9 - t4;
+    t7 = t12 - t6;
+    t10 = t11 + t5;
+    t2 = (-C104) * t0;
+    t9 = (-C105) * t13;
+    t4 = t2 + t9;
+    t12 = 0.07730191568708542 * t4;
+    y[459] = t12;
+    t6 = 0.03161467776349159 * t4;
+    y[620] = t6;
+    t11 = C105 * t0;
+    t5 = (-C104) * t13;
+    t2 = t11 + t5;
+    t9 = 0.0018618037564494532 * t2;
+    y[99] = t9;
+    t12 = (-0.07110684361286619) * t2;
+    y[260] = t12;
+    t4 = (-C106) * t14;
+    t6 = (-C107) * t8;
+    t0 = t4 + t6;
+    t13 = 0.07425606701298204 * t0;
+    y[369] = t13;
+    t11 = 0.0005686036444083812 * t0;
+    y[710] = t11;
+    t5 = C107 * t14;
+    t9 = (-C106) * t8;
+    t2 = t5 + t9;
+    y[9] = 0;
+    t12 = (-0.07481618376831468) * t2;
+    y[350] = t12;
+    t4 = C108 * t1;
+    t6 = C109 * t3;
+    t13 = t4 + t6;
+    y[80] = 0;
+    t0 = (-0.07355021895858266) * t13;
+    y[279] = t0;
+    t11 = (-C109) * t1;
+    t14 = C108 * t3;
+    t8 = t11 + t14;
+    t5 = 0.07553418105640151 * t8;
+    y[440] = t5;
+    t9 = 0.021263859082068726 * t8;
+    y[639] = t9;
+    t2 = C110 * t7;
+    t12 = C111 * t10;
+    t4 = t2 + t12;
+    t6 = 0.032712878842642595 * t4;
+    y[170] = t6;
+    t13 = (-0.04389508776629477) * t4;
+    y[189] = t13;
+    t0 = (-C111) * t7;
+    t1 = C110 * t10;
+    t3 = t0 + t1;
+    t11 = 0.07502108030330112 * t3;
+    y[530] = t11;
+    t14 = 0.06916232173276785 * t3;
+    y[549] = t14;
+    t5 = re[176];
+    t8 = im[176];
+    t9 = re[41];
+    t2 = im[41];
+    t12 = re[86];
+    t6 = im[86];
+    t4 = re[131];
+    t13 = im[131];
+    t7 = t5 + t12;
+    t10 = t8 + t6;
+    t0 = t9 + t4;
+    t1 = t2 + t13;
+    t11 = t5 - t12;
+    t3 = t8 - t6;
+    t14 = t9 - t4;
+    t5 = t2 - t13;
+    t12 = t7 + t0;
+    t8 = t10 + t1;
+    t6 = t11 + t5;
+    t9 = t3 - t14;
+    t4 = t7 - t0;
+    t2 = t10 - t1;
+    t13 = t11 - t5;
+    t7 = t3 + t14;
+    t0 = C112 * t12;
+    t10 = C113 * t8;
+    t1 = t0 + t10;
+    t11 = 0.033904596440883734 * t1;
+    y[172] = t11;
+    t5 = (-0.04274765608915604) * t1;
+    y[187] = t5;
+    t3 = (-C113) * t12;
+    t14 = C112 * t8;
+    t0 = t3 + t14;
+    t10 = 0.07452418927846975 * t0;
+    y[532] = t10;
+    t11 = 0.06989675119974971 * t0;
+    y[547] = t11;
+    t1 = (-C114) * t6;
+    t5 = (-C115) * t9;
+    t12 = t1 + t5;
+    t8 = 0.07711101011160705 * t12;
+    y[457] = t8;
+    t3 = 0.030471291315313755 * t12;
+    y[622] = t3;
+    t14 = C115 * t6;
+    t10 = (-C114) * t9;
+    t0 = t14 + t10;
+    t11 = 0.0015421103034191147 * t0;
+    y[97] = t11;
+    t1 = (-0.07143682147707409) * t0;
+    y[262] = t1;
+    t5 = (-C116) * t4;
+    t8 = (-C117) * t2;
+    t12 = t5 + t8;
+    t3 = 0.0743130633063656 * t12;
+    y[367] = t3;
+    t6 = 0.0004409171809484468 * t12;
+    y[712] = t6;
+    t9 = C117 * t4;
+    t14 = (-C116) * t2;
+    t10 = t9 + t14;
+    y[7] = 0;
+    t11 = (-0.07475880159390051) * t10;
+    y[352] = t11;
+    t0 = C118 * t13;
+    t1 = C119 * t7;
+    t5 = t0 + t1;
+    y[82] = 0;
+    t8 = (-0.0733709898052653) * t5;
+    y[277] = t8;
+    t3 = (-C119) * t13;
+    t12 = C118 * t7;
+    t6 = t3 + t12;
+    t4 = 0.07571869440906569 * t6;
+    y[442] = t4;
+    t2 = 0.022289008698053562 * t6;
+    y[637] = t2;
+    t9 = re[112];
+    t14 = im[112];
+    t10 = re[157];
+    t11 = im[157];
+    t0 = re[22];
+    t1 = im[22];
+    t5 = re[67];
+    t8 = im[67];
+    t13 = t9 + t0;
+    t7 = t14 + t1;
+    t3 = t10 + t5;
+    t12 = t11 + t8;
+    t4 = t9 - t0;
+    t6 = t14 - t1;
+    t2 = t10 - t5;
+    t9 = t11 - t8;
+    t0 = t13 + t3;
+    t14 = t7 + t12;
+    t1 = t4 + t9;
+    t10 = t6 - t2;
+    t5 = t13 - t3;
+    t11 = t7 - t12;
+    t8 = t4 - t9;
+    t13 = t6 + t2;
+    t3 = C120 * t0;
+    t7 = C121 * t14;
+    t12 = t3 + t7;
+    t4 = 0.00023509919043350854 * t12;
+    y[84] = t4;
+    t9 = (-0.07314539575615532) * t12;
+    y[275] = t9;
+    t6 = (-C121) * t0;
+    t2 = C120 * t14;
+    t3 = t6 + t2;
+    t7 = 0.07587723401076818 * t3;
+    y[444] = t7;
+    t4 = 0.023331619923463064 * t3;
+    y[635] = t4;
+    t12 = C122 * t1;
+    t9 = C123 * t10;
+    t0 = t12 + t9;
+    t14 = 0.03509657226994685 * t0;
+    y[174] = t14;
+    t6 = (-0.04158997495987726) * t0;
+    y[185] = t6;
+    t2 = (-C123) * t1;
+    t7 = C122 * t10;
+    t3 = t2 + t7;
+    t4 = 0.07399851067964641 * t3;
+    y[534] = t4;
+    t12 = 0.07060402737513881 * t3;
+    y[545] = t12;
+    t9 = (-C124) * t5;
+    t14 = (-C125) * t11;
+    t0 = t9 + t14;
+    t6 = 0.07691831583769149 * t0;
+    y[455] = t6;
+    t1 = 0.02933799848474425 * t0;
+    y[624] = t1;
+    t10 = C125 * t5;
+    t2 = (-C124) * t11;
+    t7 = t10 + t2;
+    t4 = 0.0012566211405111928 * t7;
+    y[95] = t4;
+    t3 = (-0.07174739522488442) * t7;
+    y[264] = t3;
+    t12 = (-C126) * t8;
+    t9 = (-C127) * t13;
+    t14 = t12 + t9;
+    t6 = 0.07437135293666741 * t14;
+    y[365] = t6;
+    t0 = 0.0003319606381975926 * t14;
+    y[714] = t0;
+    t1 = C127 * t8;
+    t5 = (-C126) * t13;
+    t11 = t1 + t5;
+    y[5] = 0;
+    t10 = (-0.07470020829507447) * t11;
+    y[354] = t10;
+    t2 = re[28];
+    t4 = im[28];
+    t7 = re[73];
+    t3 = im[73];
+    t12 = re[118];
+    t9 = im[118];
+    t6 = re[163];
+    t14 = im[163];
+    t0 = t2 + t12;
+    t8 = t4 + t9;
+    t13 = t7 + t6;
+    t1 = t3 + t14;
+    t5 = t2 - t12;
+    t11 = t4 - t9;
+    t10 = t7 - t6;
+    t2 = t3 - t14;
+    t12 = t0 + t13;
+    t4 = t8 + t1;
+    t9 = t5 + t2;
+    t7 = t11 - t10;
+    t6 = t0 - t13;
+    t3 = t8 - t1;
+    t14 = t5 - t2;
+    t0 = t11 + t10;
+    t13 = (-C128) * t12;
+    t8 = (-C129) * t4;
+    t1 = t13 + t8;
+    t5 = 0.07443059987513743 * t1;
+    y[363] = t5;
+    t2 = 0.00024046178754918768 * t1;
+    y[716] = t2;
+    t11 = C129 * t12;
+    t10 = (-C128) * t4;
+    t13 = t11 + t10;
+    y[3] = 0;
+    t8 = (-0.07464074674764669) * t13;
+    y[356] = t8;
+    t5 = C130 * t9;
+    t1 = C131 * t7;
+    t2 = t5 + t1;
+    t12 = 0.0003636133682961057 * t2;
+    y[86] = t12;
+    t4 = (-0.07292566451690818) * t2;
+    y[273] = t4;
+    t11 = (-C131) * t9;
+    t10 = C130 * t7;
+    t13 = t11 + t10;
+    t8 = 0.07605946082798594 * t13;
+    y[446] = t8;
+    t5 = 0.0243908300690247 * t13;
+    y[633] = t5;
+    t1 = C132 * t6;
+    t12 = C133 * t3;
+    t2 = t1 + t12;
+    t4 = 0.03628729419584379 * t2;
+    y[176] = t4;
+    t9 = (-0.04042290599658089) * t2;
+    y[183] = t9;
+    t7 = (-C133) * t6;
+    t11 = C132 * t3;
+    t10 = t7 + t11;
+    t8 = 0.07344473947163749 * t10;
+    y[536] = t8;
+    t13 = 0.07128406273528302 * t10;
+    y[543] = t13;
+    t5 = (-C134) * t14;
+    t1 = (-C135) * t0;
+    t12 = t5 + t1;
+    t4 = 0.07672513012950198 * t12;
+    y[453] = t4;
+    t2 = 0.028215773590490503 * t12;
+    y[626] = t2;
+    t9 = C135 * t14;
+    t6 = (-C134) * t0;
+    t3 = t9 + t6;
+    t7 = 0.001004420079138153 * t3;
+    y[93] = t7;
+    t11 = (-0.07203917486596162) * t3;
+    y[266] = t11;
+    t8 = re[124];
+    t10 = im[124];
+    t13 = re[169];
+    t5 = im[169];
+    t1 = re[34];
+    t4 = im[34];
+    t12 = re[79];
+    t2 = im[79];
+    t14 = t8 + t1;
+    t0 = t10 + t4;
+    t9 = t13 + t12;
+    t6 = t5 + t2;
+    t7 = t8 - t1;
+    t3 = t10 - t4;
+    t11 = t13 - t12;
+    t8 = t5 - t2;
+    t1 = t14 + t9;
+    t10 = t0 + t6;
+    t4 = t7 + t8;
+    t13 = t3 - t11;
+    t12 = t14 - t9;
+    t5 = t0 - t6;
+    t2 = t7 - t8;
+    t14 = t3 + t11;
+    t9 = (-C136) * t1;
+    t0 = (-C137) * t10;
+    t6 = t9 + t0;
+    t7 = 0.07653253220047196 * t6;
+    y[451] = t7;
+    t8 = 0.027105618559342022 * t6;
+    y[628] = t8;
+    t3 = C137 * t1;
+    t11 = (-C136) * t10;
+    t9 = t3 + t11;
+    t0 = 0.0007843288223699206 * t9;
+    y[91] = t0;
+    t7 = (-0.07231298479938665) * t9;
+    y[268] = t7;
+    t6 = (-C138) * t4;
+    t8 = (-C139) * t13;
+    t1 = t6 + t8;
+    t10 = 0.07449046842735706 * t1;
+    y[361] = t10;
+    t3 = 0.00016459314335602588 * t1;
+    y[718] = t3;
+    t11 = C139 * t4;
+    t0 = (-C138) * t13;
+    t9 = t11 + t0;
+    y[1] = 0;
+    t7 = (-0.07458075741560576) * t9;
+    y[358] = t7;
+    t6 = C140 * t12;
+    t8 = C141 * t5;
+    t10 = t6 + t8;
+    t1 = 0.0005109767988647399 * t10;
+    y[88] = t1;
+    t3 = (-0.07269232485002053) * t10;
+    y[271] = t3;
+    t4 = (-C141) * t12;
+    t13 = C140 * t5;
+    t11 = t4 + t13;
+    t0 = 0.07624660746123198 * t11;
+    y[448] = t0;
+    t9 = 0.025465730147811696 * t11;
+    y[631] = t9;
+    t7 = C142 * t2;
+    t6 = C143 * t14;
+    t8 = t7 + t6;
+    t1 = 0.037475094952612274 * t8;
+    y[178] = t1;
+    t10 = (-0.03924810154316684) * t8;
+    y[181] = t10;
+    t3 = (-C143) * t2;
+    t12 = C142 * t14;
+    t5 = t3 + t12;
+    t4 = 0.07286276255040021 * t5;
+    y[538] = t4;
+    t13 = 0.07193658763695611 * t5;
+    y[541] = t13;
+}
+
+//
+//  Public functions.
+//
+
+/**
+ *  Apply LD-MDCT transform (prebuilt for window W75_360).
+ * 
+ *  Note(s):
+ *    [1] X[k] = SUM(w[n] * x[n] * cos(PI / 360 * (n + 180.5) * (k + 0.5))), where
+ *        w[n] = sqrt(2 / 360) * W75_360[n].
+ *    [2] The size of all arrays will not be checked.
+ * 
+ *  @param {Number[]} x 
+ *    - The input block (720 points).
+ *  @param {Number[]} X 
+ *    - The array that would contain the output block (360 points).
+ *  @param {Number[]} re 
+ *    - The scratch buffer (real part, 180 points).
+ *  @param {Number[]} im 
+ *    - The scratch buffer (imaginary part, 180 points).
+ */
+function ApplyWindowedMDCT_W75_360(x, X, re, im) {
+    ApplyWindowedMDCT_W75_360_Part1(x, X, re, im);
+    ApplyWindowedMDCT_W75_360_Part2(x, X, re, im);
+    ApplyWindowedMDCT_W75_360_Part3(x, X, re, im);
+    ApplyWindowedMDCT_W75_360_Part4(x, X, re, im);
+    ApplyWindowedMDCT_W75_360_Part5(x, X, re, im);
+    ApplyWindowedMDCT_W75_360_Part6(x, X, re, im);
+}
+
+/**
+ *  Apply LD-IMDCT transform (prebuilt for window W75_360).
+ * 
+ *  Note(s):
+ *    [1] y[n] = w[n] * SUM(X[k] * cos(PI / 360 * (n + 180.5) * (k + 0.5))), where
+ *        w[n] = sqrt(2 / 360) * W75_360[719 - n].
+ *    [2] The size of all arrays will not be checked.
+ * 
+ *  @param {Number[]} X 
+ *    - The input block (360 points).
+ *  @param {Number[]} y 
+ *    - The array that would contain the output block (720 points).
+ *  @param {Number[]} re 
+ *    - The scratch buffer (real part, 180 points).
+ *  @param {Number[]} im 
+ *    - The scratch buffer (imaginary part, 180 points).
+ */
+function ApplyWindowedIMDCT_W75_360(X, y, re, im) {
+    ApplyWindowedIMDCT_W75_360_Part1(X, y, re, im);
+    ApplyWindowedIMDCT_W75_360_Part2(X, y, re, im);
+    ApplyWindowedIMDCT_W75_360_Part3(X, y, re, im);
+    ApplyWindowedIMDCT_W75_360_Part4(X, y, re, im);
+    ApplyWindowedIMDCT_W75_360_Part5(X, y, re, im);
+    ApplyWindowedIMDCT_W75_360_Part6(X, y, re, im);
+}
+
+//  Export public APIs.
+module.exports = {
+    "ApplyWindowedMDCT_W75_360": ApplyWindowedMDCT_W75_360,
+    "ApplyWindowedIMDCT_W75_360": ApplyWindowedIMDCT_W75_360
+};
\ No newline at end of file
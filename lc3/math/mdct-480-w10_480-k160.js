@@ -0,0 +1,12921 @@
+//
+//  Copyright 2021 - 2023 XiaoJSoft Studio. All rights reserved.
+//  Use of this source code is governed by a BSD-style license that can be
+//  found in the LICENSE.md file.
+//
+
+//
+//  Note(s):
+//    [1] This file is generated automatically by a MDCT compiler, which locates 
+//        at "./../../dev/mdct-generator/" directory.
+//        Do NOT modify this file manually.
+//
+
+//
+//  Private functions.
+//
+
+/**
+ *  Part 1 of ApplyWindowedIMDCT_W10_480_K160().
+ * 
+ *  @param {Number[]} X 
+ *    - The input block (480 points, only the first 160 points are used).
+ *  @param {Number[]} y 
+ *    - The array that would contain the output block (960 points).
+ *  @param {Number[]} re 
+ *    - The scratch buffer (real part, 240 points).
+ *  @param {Number[]} im 
+ *    - The scratch buffer (imaginary part, 240 points).
+ */
+function ApplyWindowedIMDCT_W10_480_K160_Part1(X, y, re, im) {
+    let t0, t1, t10, t11, t12, t13, t14, t2, t3, t4, t5, t6, t7, t8, t9;
+    const C0 = 0.9238795325112867;
+    const C1 = 0.3826834323650898;
+    const C2 = 0.9951847266721969;
+    const C3 = 0.0980171403295606;
+    const C4 = 0.881921264348355;
+    const C5 = 0.47139673682599764;
+    const C6 = 0.9569403357322088;
+    const C7 = 0.29028467725446233;
+    const C8 = 1.3065629648763766;
+    const C9 = 0.5411961001461969;
+    const C10 = 0.7071067811865476;
+    const C11 = 0.9807852804032304;
+    const C12 = 0.19509032201612825;
+    const C13 = 0.9510565162951535;
+    const C14 = 0.3090169943749474;
+    const C15 = 0.8910065241883679;
+    const C16 = 0.45399049973954675;
+    const C17 = 0.996917333733128;
+    const C18 = 0.07845909572784494;
+    const C19 = 0.916187957117136;
+    const C20 = 0.40074883310314097;
+    const C21 = 0.9312149347588036;
+    const C22 = 0.36447049987914965;
+    const C23 = 0.9998072404820648;
+    const C24 = 0.0196336924606283;
+    const C25 = 0.8724960070727972;
+    const C26 = 0.4886212414969549;
+    const C27 = 0.9624552364536473;
+    const C28 = 0.27144044986507426;
+    const C29 = 0.9930684569549263;
+    const C30 = 0.11753739745783764;
+    const C31 = 0.9844265680898916;
+    const C32 = 0.1757962799343545;
+    const C33 = 0.9767658813208724;
+    const C34 = 0.21430915306505077;
+    const C35 = 0.9876883405951378;
+    const C36 = 0.15643446504023087;
+    const C37 = 0.9723699203976766;
+    const C38 = 0.2334453638559054;
+    const C39 = 0.8997482840522215;
+    const C40 = 0.436409240673342;
+    const C41 = 0.9982656101847159;
+    const C42 = 0.05887080365118903;
+    const C43 = 0.944806046466878;
+    const C44 = 0.3276301795616935;
+    const C45 = 0.9381913359224842;
+    const C46 = 0.34611705707749296;
+    const C47 = 0.9992290362407229;
+    const C48 = 0.03925981575906861;
+    const C49 = 0.9081431738250813;
+    const C50 = 0.41865973753742813;
+    const C51 = 0.9675990923602598;
+    const C52 = 0.25249157701515795;
+    const C53 = 0.9905693404435773;
+    const C54 = 0.13701234168196802;
+    const C55 = 0.5590169943749475;
+    const C56 = 0.25;
+    const C57 = 0.5877852522924731;
+    t0 = X[0];
+    t1 = X[120];
+    t2 = C0 * t1;
+    t1 = (-C1) * t1;
+    t3 = X[119];
+    t4 = C0 * t3;
+    t3 = C1 * t3;
+    t5 = t2 + t4;
+    t6 = t1 + t3;
+    t2 = t2 - t4;
+    t4 = t1 - t3;
+    t1 = t0 + t5;
+    t3 = t0 + t4;
+    t7 = -t2;
+    t5 = t0 - t5;
+    t8 = -t6;
+    t0 = t0 - t4;
+    re[0] = t1;
+    im[0] = t6;
+    re[60] = t3;
+    im[60] = t7;
+    re[120] = t5;
+    im[120] = t8;
+    re[180] = t0;
+    im[180] = t2;
+    t4 = X[30];
+    t1 = C2 * t4;
+    t6 = (-C3) * t4;
+    t3 = X[150];
+    t7 = C4 * t3;
+    t5 = (-C5) * t3;
+    t8 = X[89];
+    t0 = C6 * t8;
+    t2 = C7 * t8;
+    t4 = t7 + t0;
+    t3 = t5 + t2;
+    t8 = t7 - t0;
+    t7 = t5 - t2;
+    t0 = t1 + t4;
+    t5 = t6 + t3;
+    t2 = t1 + t7;
+    t9 = t6 - t8;
+    t4 = t1 - t4;
+    t3 = t6 - t3;
+    t1 = t1 - t7;
+    t7 = t6 + t8;
+    t6 = t2 + t9;
+    t8 = C0 * t6;
+    t6 = t2 * (-C8);
+    t2 = t9 * C9;
+    t9 = t8 - t2;
+    t2 = t8 + t6;
+    t8 = t4 + t3;
+    t6 = t4 - t3;
+    t4 = C10 * t8;
+    t3 = (-C10) * t6;
+    t8 = t1 + t7;
+    t6 = C1 * t8;
+    t8 = t1 * (-C8);
+    t1 = t7 * (-C9);
+    t7 = t6 - t1;
+    t1 = t6 + t8;
+    re[15] = t0;
+    im[15] = t5;
+    re[75] = t9;
+    im[75] = t2;
+    re[135] = t4;
+    im[135] = t3;
+    re[195] = t7;
+    im[195] = t1;
+    t6 = X[60];
+    t8 = C11 * t6;
+    t0 = (-C12) * t6;
+    t5 = X[59];
+    t9 = C11 * t5;
+    t2 = C12 * t5;
+    t4 = t8 + t9;
+    t3 = t0 + t2;
+    t7 = t8 - t2;
+    t1 = t0 + t9;
+    t6 = t8 - t9;
+    t5 = t0 - t2;
+    t8 = t8 + t2;
+    t2 = t0 - t9;
+    t0 = t7 + t1;
+    t9 = t7 - t1;
+    t7 = C10 * t0;
+    t1 = (-C10) * t9;
+    t0 = -t6;
+    t9 = t8 - t2;
+    t6 = t8 + t2;
+    t8 = (-C10) * t9;
+    t2 = (-C10) * t6;
+    re[30] = t4;
+    im[30] = t3;
+    re[90] = t7;
+    im[90] = t1;
+    re[150] = t5;
+    im[150] = t0;
+    re[210] = t8;
+    im[210] = t2;
+    t9 = X[90];
+    t6 = C6 * t9;
+    t4 = (-C7) * t9;
+    t3 = X[149];
+    t7 = C4 * t3;
+    t1 = C5 * t3;
+    t5 = X[29];
+    t0 = C2 * t5;
+    t8 = C3 * t5;
+    t2 = t6 + t7;
+    t9 = t4 + t1;
+    t3 = t6 - t7;
+    t5 = t4 - t1;
+    t6 = t2 + t0;
+    t7 = t9 + t8;
+    t4 = t3 - t8;
+    t1 = t5 + t0;
+    t2 = t2 - t0;
+    t9 = t9 - t8;
+    t3 = t3 + t8;
+    t8 = t5 - t0;
+    t5 = t4 + t1;
+    t0 = C1 * t5;
+    t5 = t4 * (-C8);
+    t4 = t1 * (-C9);
+    t1 = t0 - t4;
+    t4 = t0 + t5;
+    t0 = t2 - t9;
+    t5 = t2 + t9;
+    t2 = (-C10) * t0;
+    t9 = (-C10) * t5;
+    t0 = t3 + t8;
+    t5 = (-C0) * t0;
+    t0 = t3 * C8;
+    t3 = t8 * (-C9);
+    t8 = t5 - t3;
+    t3 = t5 + t0;
+    re[45] = t6;
+    im[45] = t7;
+    re[105] = t1;
+    im[105] = t4;
+    re[165] = t2;
+    im[165] = t9;
+    re[225] = t8;
+    im[225] = t3;
+    t5 = re[0];
+    t0 = im[0];
+    t6 = re[15];
+    t7 = im[15];
+    t1 = re[30];
+    t4 = im[30];
+    t2 = re[45];
+    t9 = im[45];
+    t8 = t5 + t1;
+    t3 = t0 + t4;
+    t10 = t6 + t2;
+    t11 = t7 + t9;
+    t5 = t5 - t1;
+    t1 = t0 - t4;
+    t0 = t6 - t2;
+    t4 = t7 - t9;
+    t6 = t8 + t10;
+    t2 = t3 + t11;
+    t7 = t5 + t4;
+    t9 = t1 - t0;
+    t8 = t8 - t10;
+    t10 = t3 - t11;
+    t3 = t5 - t4;
+    t11 = t1 + t0;
+    re[0] = t6;
+    im[0] = t2;
+    re[15] = t7;
+    im[15] = t9;
+    re[30] = t8;
+    im[30] = t10;
+    re[45] = t3;
+    im[45] = t11;
+    t5 = re[60];
+    t4 = im[60];
+    t1 = re[75];
+    t0 = im[75];
+    t6 = re[90];
+    t2 = im[90];
+    t7 = re[105];
+    t9 = im[105];
+    t8 = t5 + t6;
+    t10 = t4 + t2;
+    t3 = t1 + t7;
+    t11 = t0 + t9;
+    t5 = t5 - t6;
+    t6 = t4 - t2;
+    t4 = t1 - t7;
+    t2 = t0 - t9;
+    t1 = t8 + t3;
+    t7 = t10 + t11;
+    t0 = t5 + t2;
+    t9 = t6 - t4;
+    t8 = t8 - t3;
+    t3 = t10 - t11;
+    t10 = t5 - t2;
+    t11 = t6 + t4;
+    re[60] = t1;
+    im[60] = t7;
+    re[75] = t0;
+    im[75] = t9;
+    re[90] = t8;
+    im[90] = t3;
+    re[105] = t10;
+    im[105] = t11;
+    t5 = re[120];
+    t2 = im[120];
+    t6 = re[135];
+    t4 = im[135];
+    t1 = re[150];
+    t7 = im[150];
+    t0 = re[165];
+    t9 = im[165];
+    t8 = t5 + t1;
+    t3 = t2 + t7;
+    t10 = t6 + t0;
+    t11 = t4 + t9;
+    t5 = t5 - t1;
+    t1 = t2 - t7;
+    t2 = t6 - t0;
+    t7 = t4 - t9;
+    t6 = t8 + t10;
+    t0 = t3 + t11;
+    t4 = t5 + t7;
+    t9 = t1 - t2;
+    t8 = t8 - t10;
+    t10 = t3 - t11;
+    t3 = t5 - t7;
+    t11 = t1 + t2;
+    re[120] = t6;
+    im[120] = t0;
+    re[135] = t4;
+    im[135] = t9;
+    re[150] = t8;
+    im[150] = t10;
+    re[165] = t3;
+    im[165] = t11;
+    t5 = re[180];
+    t7 = im[180];
+    t1 = re[195];
+    t2 = im[195];
+    t6 = re[210];
+    t0 = im[210];
+    t4 = re[225];
+    t9 = im[225];
+    t8 = t5 + t6;
+    t10 = t7 + t0;
+    t3 = t1 + t4;
+    t11 = t2 + t9;
+    t5 = t5 - t6;
+    t6 = t7 - t0;
+    t7 = t1 - t4;
+    t0 = t2 - t9;
+    t1 = t8 + t3;
+    t4 = t10 + t11;
+    t2 = t5 + t0;
+    t9 = t6 - t7;
+    t8 = t8 - t3;
+    t3 = t10 - t11;
+    t10 = t5 - t0;
+    t11 = t6 + t7;
+    re[180] = t1;
+    im[180] = t4;
+    re[195] = t2;
+    im[195] = t9;
+    re[210] = t8;
+    im[210] = t3;
+    re[225] = t10;
+    im[225] = t11;
+    t5 = X[96];
+    t0 = C13 * t5;
+    t6 = (-C14) * t5;
+    t7 = X[143];
+    t1 = C15 * t7;
+    t4 = C16 * t7;
+    t2 = X[23];
+    t9 = C17 * t2;
+    t8 = C18 * t2;
+    t3 = t0 + t1;
+    t10 = t6 + t4;
+    t11 = t0 - t1;
+    t5 = t6 - t4;
+    t7 = t3 + t9;
+    t2 = t10 + t8;
+    t0 = t11 - t8;
+    t1 = t5 + t9;
+    t6 = t3 - t9;
+    t4 = t10 - t8;
+    t3 = t11 + t8;
+    t10 = t5 - t9;
+    re[48] = t7;
+    im[48] = t2;
+    re[108] = t0;
+    im[108] = t1;
+    re[168] = t6;
+    im[168] = t4;
+    re[228] = t3;
+    im[228] = t10;
+    t11 = X[126];
+    t8 = C19 * t11;
+    t5 = (-C20) * t11;
+    t9 = X[113];
+    t7 = C21 * t9;
+    t2 = C22 * t9;
+    t0 = X[6];
+    t1 = C23 * t0;
+    t6 = (-C24) * t0;
+    t4 = t8 + t7;
+    t3 = t5 + t2;
+    t10 = t8 - t7;
+    t11 = t5 - t2;
+    t9 = t4 + t1;
+    t0 = t3 + t6;
+    t8 = t10 - t6;
+    t7 = t11 + t1;
+    t5 = t4 - t1;
+    t2 = t3 - t6;
+    t4 = t10 + t6;
+    t3 = t11 - t1;
+    t10 = t8 + t7;
+    t6 = C0 * t10;
+    t11 = t8 * (-C8);
+    t1 = t7 * C9;
+    t10 = t6 - t1;
+    t8 = t6 + t11;
+    t7 = t5 + t2;
+    t1 = t5 - t2;
+    t6 = C10 * t7;
+    t11 = (-C10) * t1;
+    t5 = t4 + t3;
+    t2 = C1 * t5;
+    t7 = t4 * (-C8);
+    t1 = t3 * (-C9);
+    t5 = t2 - t1;
+    t4 = t2 + t7;
+    re[63] = t9;
+    im[63] = t0;
+    re[123] = t10;
+    im[123] = t8;
+    re[183] = t6;
+    im[183] = t11;
+    re[3] = t5;
+    im[3] = t4;
+    t3 = X[156];
+    t1 = C25 * t3;
+    t2 = (-C26) * t3;
+    t7 = X[83];
+    t9 = C27 * t7;
+    t0 = C28 * t7;
+    t10 = X[36];
+    t8 = C29 * t10;
+    t6 = (-C30) * t10;
+    t11 = t1 + t9;
+    t5 = t2 + t0;
+    t4 = t1 - t9;
+    t3 = t2 - t0;
+    t7 = t11 + t8;
+    t10 = t5 + t6;
+    t1 = t4 - t6;
+    t9 = t3 + t8;
+    t2 = t11 - t8;
+    t0 = t5 - t6;
+    t11 = t4 + t6;
+    t5 = t3 - t8;
+    t4 = t1 + t9;
+    t6 = t1 - t9;
+    t3 = C10 * t4;
+    t8 = (-C10) * t6;
+    t1 = -t2;
+    t9 = t11 - t5;
+    t4 = t11 + t5;
+    t6 = (-C10) * t9;
+    t2 = (-C10) * t4;
+    re[78] = t7;
+    im[78] = t10;
+    re[138] = t3;
+    im[138] = t8;
+    re[198] = t0;
+    im[198] = t1;
+    re[18] = t6;
+    im[18] = t2;
+    t11 = X[53];
+    t5 = C31 * t11;
+    t9 = C32 * t11;
+    t4 = X[66];
+    t7 = C33 * t4;
+    t10 = (-C34) * t4;
+    t3 = -t5;
+    t8 = -t9;
+    t0 = t5 + t7;
+    t1 = t9 + t10;
+    t6 = t3 - t10;
+    t2 = t7 - t9;
+    t11 = t5 - t7;
+    t4 = t9 - t10;
+    t3 = t10 - t5;
+    t9 = t8 - t7;
+    t10 = t6 + t2;
+    t5 = C1 * t10;
+    t8 = t6 * (-C8);
+    t7 = t2 * (-C9);
+    t10 = t5 - t7;
+    t6 = t5 + t8;
+    t2 = t11 - t4;
+    t7 = t11 + t4;
+    t5 = (-C10) * t2;
+    t8 = (-C10) * t7;
+    t11 = t3 + t9;
+    t4 = (-C0) * t11;
+    t2 = t3 * C8;
+    t7 = t9 * (-C9);
+    t11 = t4 - t7;
+    t3 = t4 + t2;
+    re[93] = t0;
+    im[93] = t1;
+    re[153] = t10;
+    im[153] = t6;
+    re[213] = t5;
+    im[213] = t8;
+    re[33] = t11;
+    im[33] = t3;
+    t9 = re[48];
+    t7 = im[48];
+    t4 = re[63];
+    t2 = im[63];
+    t0 = re[78];
+    t1 = im[78];
+    t10 = re[93];
+    t6 = im[93];
+    t5 = t9 + t0;
+    t8 = t7 + t1;
+    t11 = t4 + t10;
+    t3 = t2 + t6;
+    t9 = t9 - t0;
+    t0 = t7 - t1;
+    t7 = t4 - t10;
+    t1 = t2 - t6;
+    t4 = t5 + t11;
+    t10 = t8 + t3;
+    t2 = t9 + t1;
+    t6 = t0 - t7;
+    t5 = t5 - t11;
+    t11 = t8 - t3;
+    t8 = t9 - t1;
+    t3 = t0 + t7;
+    re[48] = t4;
+    im[48] = t10;
+    re[63] = t2;
+    im[63] = t6;
+    re[78] = t5;
+    im[78] = t11;
+    re[93] = t8;
+    im[93] = t3;
+    t9 = re[108];
+    t1 = im[108];
+    t0 = re[123];
+    t7 = im[123];
+    t4 = re[138];
+    t10 = im[138];
+    t2 = re[153];
+    t6 = im[153];
+    t5 = t9 + t4;
+    t11 = t1 + t10;
+    t8 = t0 + t2;
+    t3 = t7 + t6;
+    t9 = t9 - t4;
+    t4 = t1 - t10;
+    t1 = t0 - t2;
+    t10 = t7 - t6;
+    t0 = t5 + t8;
+    t2 = t11 + t3;
+    t7 = t9 + t10;
+    t6 = t4 - t1;
+    t5 = t5 - t8;
+    t8 = t11 - t3;
+    t11 = t9 - t10;
+    t3 = t4 + t1;
+    re[108] = t0;
+    im[108] = t2;
+    re[123] = t7;
+    im[123] = t6;
+    re[138] = t5;
+    im[138] = t8;
+    re[153] = t11;
+    im[153] = t3;
+    t9 = re[168];
+    t10 = im[168];
+    t4 = re[183];
+    t1 = im[183];
+    t0 = re[198];
+    t2 = im[198];
+    t7 = re[213];
+    t6 = im[213];
+    t5 = t9 + t0;
+    t8 = t10 + t2;
+    t11 = t4 + t7;
+    t3 = t1 + t6;
+    t9 = t9 - t0;
+    t0 = t10 - t2;
+    t10 = t4 - t7;
+    t2 = t1 - t6;
+    t4 = t5 + t11;
+    t7 = t8 + t3;
+    t1 = t9 + t2;
+    t6 = t0 - t10;
+    t5 = t5 - t11;
+    t11 = t8 - t3;
+    t8 = t9 - t2;
+    t3 = t0 + t10;
+    re[168] = t4;
+    im[168] = t7;
+    re[183] = t1;
+    im[183] = t6;
+    re[198] = t5;
+    im[198] = t11;
+    re[213] = t8;
+    im[213] = t3;
+    t9 = re[228];
+    t2 = im[228];
+    t0 = re[3];
+    t10 = im[3];
+    t4 = re[18];
+    t7 = im[18];
+    t1 = re[33];
+    t6 = im[33];
+    t5 = t9 + t4;
+    t11 = t2 + t7;
+    t8 = t0 + t1;
+    t3 = t10 + t6;
+    t9 = t9 - t4;
+    t4 = t2 - t7;
+    t2 = t0 - t1;
+    t7 = t10 - t6;
+    t0 = t5 + t8;
+    t1 = t11 + t3;
+    t10 = t9 + t7;
+    t6 = t4 - t2;
+    t5 = t5 - t8;
+    t8 = t11 - t3;
+    t11 = t9 - t7;
+    t3 = t4 + t2;
+    re[228] = t0;
+    im[228] = t1;
+    re[3] = t10;
+    im[3] = t6;
+    re[18] = t5;
+    im[18] = t8;
+    re[33] = t11;
+    im[33] = t3;
+    t9 = X[47];
+    t7 = C35 * t9;
+    t4 = C36 * t9;
+    t2 = X[72];
+    t0 = C37 * t2;
+    t1 = (-C38) * t2;
+    t10 = -t7;
+    t6 = -t4;
+    t5 = t7 + t0;
+    t8 = t4 + t1;
+    t11 = t10 - t1;
+    t3 = t0 - t4;
+    t9 = t7 - t0;
+    t2 = t4 - t1;
+    t10 = t1 - t7;
+    t4 = t6 - t0;
+    re[96] = t5;
+    im[96] = t8;
+    re[156] = t11;
+    im[156] = t3;
+    re[216] = t9;
+    im[216] = t2;
+    re[36] = t10;
+    im[36] = t4;
+    t1 = X[137];
+    t7 = C39 * t1;
+    t6 = C40 * t1;
+    t0 = X[17];
+    t5 = C41 * t0;
+    t8 = C42 * t0;
+    t11 = X[102];
+    t3 = C43 * t11;
+    t9 = (-C44) * t11;
+    t2 = t7 + t3;
+    t10 = t6 + t9;
+    t4 = -t5;
+    t1 = -t8;
+    t0 = t7 - t3;
+    t11 = t6 - t9;
+    t7 = t5 + t2;
+    t3 = t8 + t10;
+    t6 = t11 - t5;
+    t9 = t1 - t0;
+    t1 = t5 - t2;
+    t5 = t8 - t10;
+    t2 = t4 - t11;
+    t10 = t0 - t8;
+    t4 = t6 + t9;
+    t11 = C0 * t4;
+    t0 = t6 * (-C8);
+    t8 = t9 * C9;
+    t4 = t11 - t8;
+    t6 = t11 + t0;
+    t9 = t1 + t5;
+    t8 = t1 - t5;
+    t11 = C10 * t9;
+    t0 = (-C10) * t8;
+    t1 = t2 + t10;
+    t5 = C1 * t1;
+    t9 = t2 * (-C8);
+    t8 = t10 * (-C9);
+    t1 = t5 - t8;
+    t2 = t5 + t9;
+    re[111] = t7;
+    im[111] = t3;
+    re[171] = t4;
+    im[171] = t6;
+    re[231] = t11;
+    im[231] = t0;
+    re[51] = t1;
+    im[51] = t2;
+    t10 = X[107];
+    t8 = C45 * t10;
+    t5 = C46 * t10;
+    t9 = X[12];
+    t7 = C47 * t9;
+    t3 = (-C48) * t9;
+    t4 = X[132];
+    t6 = C49 * t4;
+    t11 = (-C50) * t4;
+    t0 = t8 + t6;
+    t1 = t5 + t11;
+    t2 = -t7;
+    t10 = -t3;
+    t9 = t8 - t6;
+    t4 = t5 - t11;
+    t8 = t7 + t0;
+    t6 = t3 + t1;
+    t5 = t4 - t7;
+    t11 = t10 - t9;
+    t10 = t7 - t0;
+    t7 = t3 - t1;
+    t0 = t2 - t4;
+    t1 = t9 - t3;
+    t2 = t5 + t11;
+    t4 = t5 - t11;
+    t9 = C10 * t2;
+    t3 = (-C10) * t4;
+    t5 = -t10;
+    t11 = t0 - t1;
+    t2 = t0 + t1;
+    t4 = (-C10) * t11;
+    t10 = (-C10) * t2;
+    re[126] = t8;
+    im[126] = t6;
+    re[186] = t9;
+    im[186] = t3;
+    re[6] = t7;
+    im[6] = t5;
+    re[66] = t4;
+    im[66] = t10;
+    t0 = X[77];
+    t1 = C51 * t0;
+    t11 = C52 * t0;
+    t2 = X[42];
+    t8 = C53 * t2;
+    t6 = (-C54) * t2;
+    t9 = -t8;
+    t3 = -t6;
+    t7 = t8 + t1;
+    t5 = t6 + t11;
+    t4 = t11 - t8;
+    t10 = t3 - t1;
+    t0 = t8 - t1;
+    t2 = t6 - t11;
+    t3 = t9 - t11;
+    t8 = t1 - t6;
+    t9 = t4 + t10;
+    t11 = C1 * t9;
+    t1 = t4 * (-C8);
+    t6 = t10 * (-C9);
+    t9 = t11 - t6;
+    t4 = t11 + t1;
+    t10 = t0 - t2;
+    t6 = t0 + t2;
+    t11 = (-C10) * t10;
+    t1 = (-C10) * t6;
+    t0 = t3 + t8;
+    t2 = (-C0) * t0;
+    t10 = t3 * C8;
+    t6 = t8 * (-C9);
+    t0 = t2 - t6;
+    t3 = t2 + t10;
+    re[141] = t7;
+    im[141] = t5;
+    re[201] = t9;
+    im[201] = t4;
+    re[21] = t11;
+    im[21] = t1;
+    re[81] = t0;
+    im[81] = t3;
+    t8 = re[96];
+    t6 = im[96];
+    t2 = re[111];
+    t10 = im[111];
+    t7 = re[126];
+    t5 = im[126];
+    t9 = re[141];
+    t4 = im[141];
+    t11 = t8 + t7;
+    t1 = t6 + t5;
+    t0 = t2 + t9;
+    t3 = t10 + t4;
+    t8 = t8 - t7;
+    t7 = t6 - t5;
+    t6 = t2 - t9;
+    t5 = t10 - t4;
+    t2 = t11 + t0;
+    t9 = t1 + t3;
+    t10 = t8 + t5;
+    t4 = t7 - t6;
+    t11 = t11 - t0;
+    t0 = t1 - t3;
+    t1 = t8 - t5;
+    t3 = t7 + t6;
+    re[96] = t2;
+    im[96] = t9;
+    re[111] = t10;
+    im[111] = t4;
+    re[126] = t11;
+    im[126] = t0;
+    re[141] = t1;
+    im[141] = t3;
+    t8 = re[156];
+    t5 = im[156];
+    t7 = re[171];
+    t6 = im[171];
+    t2 = re[186];
+    t9 = im[186];
+    t10 = re[201];
+    t4 = im[201];
+    t11 = t8 + t2;
+    t0 = t5 + t9;
+    t1 = t7 + t10;
+    t3 = t6 + t4;
+    t8 = t8 - t2;
+    t2 = t5 - t9;
+    t5 = t7 - t10;
+    t9 = t6 - t4;
+    t7 = t11 + t1;
+    t10 = t0 + t3;
+    t6 = t8 + t9;
+    t4 = t2 - t5;
+    t11 = t11 - t1;
+    t1 = t0 - t3;
+    t0 = t8 - t9;
+    t3 = t2 + t5;
+    re[156] = t7;
+    im[156] = t10;
+    re[171] = t6;
+    im[171] = t4;
+    re[186] = t11;
+    im[186] = t1;
+    re[201] = t0;
+    im[201] = t3;
+    t8 = re[216];
+    t9 = im[216];
+    t2 = re[231];
+    t5 = im[231];
+    t7 = re[6];
+    t10 = im[6];
+    t6 = re[21];
+    t4 = im[21];
+    t11 = t8 + t7;
+    t1 = t9 + t10;
+    t0 = t2 + t6;
+    t3 = t5 + t4;
+    t8 = t8 - t7;
+    t7 = t9 - t10;
+    t9 = t2 - t6;
+    t10 = t5 - t4;
+    t2 = t11 + t0;
+    t6 = t1 + t3;
+    t5 = t8 + t10;
+    t4 = t7 - t9;
+    t11 = t11 - t0;
+    t0 = t1 - t3;
+    t1 = t8 - t10;
+    t3 = t7 + t9;
+    re[216] = t2;
+    im[216] = t6;
+    re[231] = t5;
+    im[231] = t4;
+    re[6] = t11;
+    im[6] = t0;
+    re[21] = t1;
+    im[21] = t3;
+    t8 = re[36];
+    t10 = im[36];
+    t7 = re[51];
+    t9 = im[51];
+    t2 = re[66];
+    t6 = im[66];
+    t5 = re[81];
+    t4 = im[81];
+    t11 = t8 + t2;
+    t0 = t10 + t6;
+    t1 = t7 + t5;
+    t3 = t9 + t4;
+    t8 = t8 - t2;
+    t2 = t10 - t6;
+    t10 = t7 - t5;
+    t6 = t9 - t4;
+    t7 = t11 + t1;
+    t5 = t0 + t3;
+    t9 = t8 + t6;
+    t4 = t2 - t10;
+    t11 = t11 - t1;
+    t1 = t0 - t3;
+    t0 = t8 - t6;
+    t3 = t2 + t10;
+    re[36] = t7;
+    im[36] = t5;
+    re[51] = t9;
+    im[51] = t4;
+    re[66] = t11;
+    im[66] = t1;
+    re[81] = t0;
+    im[81] = t3;
+    t8 = X[71];
+    t6 = C37 * t8;
+    t2 = C38 * t8;
+    t10 = X[48];
+    t7 = C35 * t10;
+    t5 = (-C36) * t10;
+    t9 = -t7;
+    t4 = -t5;
+    t11 = t7 + t6;
+    t1 = t5 + t2;
+    t0 = t2 - t7;
+    t3 = t4 - t6;
+    t8 = t7 - t6;
+    t10 = t5 - t2;
+    t4 = t9 - t2;
+    t7 = t6 - t5;
+    re[144] = t11;
+    im[144] = t1;
+    re[204] = t0;
+    im[204] = t3;
+    re[24] = t8;
+    im[24] = t10;
+    re[84] = t4;
+    im[84] = t7;
+    t9 = X[41];
+    t2 = C53 * t9;
+    t6 = C54 * t9;
+    t5 = X[78];
+    t11 = C51 * t5;
+    t1 = (-C52) * t5;
+    t0 = -t11;
+    t3 = -t1;
+    t8 = t11 + t2;
+    t10 = t1 + t6;
+    t4 = t6 - t11;
+    t7 = t3 - t2;
+    t9 = t11 - t2;
+    t5 = t1 - t6;
+    t3 = t0 - t6;
+    t11 = t2 - t1;
+    t0 = t4 + t7;
+    t6 = C0 * t0;
+    t2 = t4 * (-C8);
+    t1 = t7 * C9;
+    t0 = t6 - t1;
+    t4 = t6 + t2;
+    t7 = t9 + t5;
+    t1 = t9 - t5;
+    t6 = C10 * t7;
+    t2 = (-C10) * t1;
+    t9 = t3 + t11;
+    t5 = C1 * t9;
+    t7 = t3 * (-C8);
+    t1 = t11 * (-C9);
+    t9 = t5 - t1;
+    t3 = t5 + t7;
+    re[159] = t8;
+    im[159] = t10;
+    re[219] = t0;
+    im[219] = t4;
+    re[39] = t6;
+    im[39] = t2;
+    re[99] = t9;
+    im[99] = t3;
+    t11 = X[131];
+    t1 = C49 * t11;
+    t5 = C50 * t11;
+    t7 = X[11];
+    t8 = C47 * t7;
+    t10 = C48 * t7;
+    t0 = X[108];
+    t4 = C45 * t0;
+    t6 = (-C46) * t0;
+    t2 = t1 + t4;
+    t9 = t5 + t6;
+    t3 = t1 - t4;
+    t11 = t5 - t6;
+    t7 = t2 + t8;
+    t0 = t9 + t10;
+    t1 = t3 + t10;
+    t4 = t11 - t8;
+    t5 = t2 - t8;
+    t6 = t9 - t10;
+    t2 = t3 - t10;
+    t9 = t11 + t8;
+    t3 = t1 + t4;
+    t10 = t1 - t4;
+    t11 = C10 * t3;
+    t8 = (-C10) * t10;
+    t1 = -t5;
+    t4 = t2 - t9;
+    t3 = t2 + t9;
+    t10 = (-C10) * t4;
+    t5 = (-C10) * t3;
+    re[174] = t7;
+    im[174] = t0;
+    re[234] = t11;
+    im[234] = t8;
+    re[54] = t6;
+    im[54] = t1;
+    re[114] = t10;
+    im[114] = t5;
+    t2 = X[101];
+    t9 = C43 * t2;
+    t4 = C44 * t2;
+    t3 = X[18];
+    t7 = C41 * t3;
+    t0 = (-C42) * t3;
+    t11 = X[138];
+    t8 = C39 * t11;
+    t6 = (-C40) * t11;
+    t1 = t9 + t8;
+    t10 = t4 + t6;
+    t5 = t9 - t8;
+    t2 = t4 - t6;
+    t3 = t1 + t7;
+    t11 = t10 + t0;
+    t9 = t5 + t0;
+    t8 = t2 - t7;
+    t4 = t1 - t7;
+    t6 = t10 - t0;
+    t1 = t5 - t0;
+    t10 = t2 + t7;
+    t5 = t9 + t8;
+    t0 = C1 * t5;
+    t2 = t9 * (-C8);
+    t7 = t8 * (-C9);
+    t5 = t0 - t7;
+    t9 = t0 + t2;
+    t8 = t4 - t6;
+    t7 = t4 + t6;
+    t0 = (-C10) * t8;
+    t2 = (-C10) * t7;
+    t4 = t1 + t10;
+    t6 = (-C0) * t4;
+    t8 = t1 * C8;
+    t7 = t10 * (-C9);
+    t4 = t6 - t7;
+    t1 = t6 + t8;
+    re[189] = t3;
+    im[189] = t11;
+    re[9] = t5;
+    im[9] = t9;
+    re[69] = t0;
+    im[69] = t2;
+    re[129] = t4;
+    im[129] = t1;
+    t10 = re[144];
+    t7 = im[144];
+    t6 = re[159];
+    t8 = im[159];
+    t3 = re[174];
+    t11 = im[174];
+    t5 = re[189];
+    t9 = im[189];
+    t0 = t10 + t3;
+    t2 = t7 + t11;
+    t4 = t6 + t5;
+    t1 = t8 + t9;
+    t10 = t10 - t3;
+    t3 = t7 - t11;
+    t7 = t6 - t5;
+    t11 = t8 - t9;
+    t6 = t0 + t4;
+    t5 = t2 + t1;
+    t8 = t10 + t11;
+    t9 = t3 - t7;
+    t0 = t0 - t4;
+    t4 = t2 - t1;
+    t2 = t10 - t11;
+    t1 = t3 + t7;
+    re[144] = t6;
+    im[144] = t5;
+    re[159] = t8;
+    im[159] = t9;
+    re[174] = t0;
+    im[174] = t4;
+    re[189] = t2;
+    im[189] = t1;
+    t10 = re[204];
+    t11 = im[204];
+    t3 = re[219];
+    t7 = im[219];
+    t6 = re[234];
+    t5 = im[234];
+    t8 = re[9];
+    t9 = im[9];
+    t0 = t10 + t6;
+    t4 = t11 + t5;
+    t2 = t3 + t8;
+    t1 = t7 + t9;
+    t10 = t10 - t6;
+    t6 = t11 - t5;
+    t11 = t3 - t8;
+    t5 = t7 - t9;
+    t3 = t0 + t2;
+    t8 = t4 + t1;
+    t7 = t10 + t5;
+    t9 = t6 - t11;
+    t0 = t0 - t2;
+    t2 = t4 - t1;
+    t4 = t10 - t5;
+    t1 = t6 + t11;
+    re[204] = t3;
+    im[204] = t8;
+    re[219] = t7;
+    im[219] = t9;
+    re[234] = t0;
+    im[234] = t2;
+    re[9] = t4;
+    im[9] = t1;
+    t10 = re[24];
+    t5 = im[24];
+    t6 = re[39];
+    t11 = im[39];
+    t3 = re[54];
+    t8 = im[54];
+    t7 = re[69];
+    t9 = im[69];
+    t0 = t10 + t3;
+    t2 = t5 + t8;
+    t4 = t6 + t7;
+    t1 = t11 + t9;
+    t10 = t10 - t3;
+    t3 = t5 - t8;
+    t5 = t6 - t7;
+    t8 = t11 - t9;
+    t6 = t0 + t4;
+    t7 = t2 + t1;
+    t11 = t10 + t8;
+    t9 = t3 - t5;
+    t0 = t0 - t4;
+    t4 = t2 - t1;
+    t2 = t10 - t8;
+    t1 = t3 + t5;
+    re[24] = t6;
+    im[24] = t7;
+    re[39] = t11;
+    im[39] = t9;
+    re[54] = t0;
+    im[54] = t4;
+    re[69] = t2;
+    im[69] = t1;
+    t10 = re[84];
+    t8 = im[84];
+    t3 = re[99];
+    t5 = im[99];
+    t6 = re[114];
+    t7 = im[114];
+    t11 = re[129];
+    t9 = im[129];
+    t0 = t10 + t6;
+    t4 = t8 + t7;
+    t2 = t3 + t11;
+    t1 = t5 + t9;
+    t10 = t10 - t6;
+    t6 = t8 - t7;
+    t8 = t3 - t11;
+    t7 = t5 - t9;
+    t3 = t0 + t2;
+    t11 = t4 + t1;
+    t5 = t10 + t7;
+    t9 = t6 - t8;
+    t0 = t0 - t2;
+    t2 = t4 - t1;
+    t4 = t10 - t7;
+    t1 = t6 + t8;
+    re[84] = t3;
+    im[84] = t11;
+    re[99] = t5;
+    im[99] = t9;
+    re[114] = t0;
+    im[114] = t2;
+    re[129] = t4;
+    im[129] = t1;
+    t10 = X[95];
+    t7 = C13 * t10;
+    t6 = C14 * t10;
+    t8 = X[24];
+    t3 = C17 * t8;
+    t11 = (-C18) * t8;
+    t5 = X[144];
+    t9 = C15 * t5;
+    t0 = (-C16) * t5;
+    t2 = t7 + t9;
+    t4 = t6 + t0;
+    t1 = t7 - t9;
+    t10 = t6 - t0;
+    t8 = t2 + t3;
+    t5 = t4 + t11;
+    t7 = t1 + t11;
+    t9 = t10 - t3;
+    t6 = t2 - t3;
+    t0 = t4 - t11;
+    t2 = t1 - t11;
+    t4 = t10 + t3;
+    re[192] = t8;
+    im[192] = t5;
+    re[12] = t7;
+    im[12] = t9;
+    re[72] = t6;
+    im[72] = t0;
+    re[132] = t2;
+    im[132] = t4;
+    t1 = X[65];
+    t11 = C33 * t1;
+    t10 = C34 * t1;
+    t3 = X[54];
+    t8 = C31 * t3;
+    t5 = (-C32) * t3;
+    t7 = t11 + t8;
+    t9 = t10 + t5;
+    t6 = t11 + t5;
+    t0 = t10 - t8;
+    t2 = t11 - t8;
+    t4 = t10 - t5;
+    t1 = t11 - t5;
+    t3 = t10 + t8;
+    t11 = t6 + t0;
+    t5 = C0 * t11;
+    t10 = t6 * (-C8);
+    t8 = t0 * C9;
+    t11 = t5 - t8;
+    t6 = t5 + t10;
+    t0 = t2 + t4;
+    t8 = t2 - t4;
+    t5 = C10 * t0;
+    t10 = (-C10) * t8;
+    t2 = t1 + t3;
+    t4 = C1 * t2;
+    t0 = t1 * (-C8);
+    t8 = t3 * (-C9);
+    t2 = t4 - t8;
+    t1 = t4 + t0;
+    re[207] = t7;
+    im[207] = t9;
+    re[27] = t11;
+    im[27] = t6;
+    re[87] = t5;
+    im[87] = t10;
+    re[147] = t2;
+    im[147] = t1;
+    t3 = X[35];
+    t8 = C29 * t3;
+    t4 = C30 * t3;
+    t0 = X[84];
+    t7 = C27 * t0;
+    t9 = (-C28) * t0;
+    t11 = X[155];
+    t6 = C25 * t11;
+    t5 = C26 * t11;
+    t10 = t7 + t6;
+    t2 = t9 + t5;
+    t1 = t7 - t6;
+    t3 = t9 - t5;
+    t0 = t8 + t10;
+    t11 = t4 + t2;
+    t7 = t8 + t3;
+    t6 = t4 - t1;
+    t9 = t8 - t10;
+    t5 = t4 - t2;
+    t10 = t8 - t3;
+    t2 = t4 + t1;
+    t8 = t7 + t6;
+    t3 = t7 - t6;
+    t4 = C10 * t8;
+    t1 = (-C10) * t3;
+    t7 = -t9;
+    t6 = t10 - t2;
+    t8 = t10 + t2;
+    t3 = (-C10) * t6;
+    t9 = (-C10) * t8;
+    re[222] = t0;
+    im[222] = t11;
+    re[42] = t4;
+    im[42] = t1;
+    re[102] = t5;
+    im[102] = t7;
+    re[162] = t3;
+    im[162] = t9;
+    t10 = X[5];
+    t2 = C23 * t10;
+    t6 = C24 * t10;
+    t8 = X[114];
+    t0 = C21 * t8;
+    t11 = (-C22) * t8;
+    t4 = X[125];
+    t1 = C19 * t4;
+    t5 = C20 * t4;
+    t7 = t0 + t1;
+    t3 = t11 + t5;
+    t9 = t0 - t1;
+    t10 = t11 - t5;
+    t8 = t2 + t7;
+    t4 = t6 + t3;
+    t0 = t2 + t10;
+    t1 = t6 - t9;
+    t11 = t2 - t7;
+    t5 = t6 - t3;
+    t7 = t2 - t10;
+    t3 = t6 + t9;
+    t2 = t0 + t1;
+    t10 = C1 * t2;
+    t6 = t0 * (-C8);
+    t9 = t1 * (-C9);
+    t2 = t10 - t9;
+    t0 = t10 + t6;
+    t1 = t11 - t5;
+    t9 = t11 + t5;
+    t10 = (-C10) * t1;
+    t6 = (-C10) * t9;
+    t11 = t7 + t3;
+    t5 = (-C0) * t11;
+    t1 = t7 * C8;
+    t9 = t3 * (-C9);
+    t11 = t5 - t9;
+    t7 = t5 + t1;
+    re[237] = t8;
+    im[237] = t4;
+    re[57] = t2;
+    im[57] = t0;
+    re[117] = t10;
+    im[117] = t6;
+    re[177] = t11;
+    im[177] = t7;
+    t3 = re[192];
+    t9 = im[192];
+    t5 = re[207];
+    t1 = im[207];
+    t8 = re[222];
+    t4 = im[222];
+    t2 = re[237];
+    t0 = im[237];
+    t10 = t3 + t8;
+    t6 = t9 + t4;
+    t11 = t5 + t2;
+    t7 = t1 + t0;
+    t3 = t3 - t8;
+    t8 = t9 - t4;
+    t9 = t5 - t2;
+    t4 = t1 - t0;
+    t5 = t10 + t11;
+    t2 = t6 + t7;
+    t1 = t3 + t4;
+    t0 = t8 - t9;
+    t10 = t10 - t11;
+    t11 = t6 - t7;
+    t6 = t3 - t4;
+    t7 = t8 + t9;
+    re[192] = t5;
+    im[192] = t2;
+    re[207] = t1;
+    im[207] = t0;
+    re[222] = t10;
+    im[222] = t11;
+    re[237] = t6;
+    im[237] = t7;
+    t3 = re[12];
+    t4 = im[12];
+    t8 = re[27];
+    t9 = im[27];
+    t5 = re[42];
+    t2 = im[42];
+    t1 = re[57];
+    t0 = im[57];
+    t10 = t3 + t5;
+    t11 = t4 + t2;
+    t6 = t8 + t1;
+    t7 = t9 + t0;
+    t3 = t3 - t5;
+    t5 = t4 - t2;
+    t4 = t8 - t1;
+    t2 = t9 - t0;
+    t8 = t10 + t6;
+    t1 = t11 + t7;
+    t9 = t3 + t2;
+    t0 = t5 - t4;
+    t10 = t10 - t6;
+    t6 = t11 - t7;
+    t11 = t3 - t2;
+    t7 = t5 + t4;
+    re[12] = t8;
+    im[12] = t1;
+    re[27] = t9;
+    im[27] = t0;
+    re[42] = t10;
+    im[42] = t6;
+    re[57] = t11;
+    im[57] = t7;
+    t3 = re[72];
+    t2 = im[72];
+    t5 = re[87];
+    t4 = im[87];
+    t8 = re[102];
+    t1 = im[102];
+    t9 = re[117];
+    t0 = im[117];
+    t10 = t3 + t8;
+    t6 = t2 + t1;
+    t11 = t5 + t9;
+    t7 = t4 + t0;
+    t3 = t3 - t8;
+    t8 = t2 - t1;
+    t2 = t5 - t9;
+    t1 = t4 - t0;
+    t5 = t10 + t11;
+    t9 = t6 + t7;
+    t4 = t3 + t1;
+    t0 = t8 - t2;
+    t10 = t10 - t11;
+    t11 = t6 - t7;
+    t6 = t3 - t1;
+    t7 = t8 + t2;
+    re[72] = t5;
+    im[72] = t9;
+    re[87] = t4;
+    im[87] = t0;
+    re[102] = t10;
+    im[102] = t11;
+    re[117] = t6;
+    im[117] = t7;
+    t3 = re[132];
+    t1 = im[132];
+    t8 = re[147];
+    t2 = im[147];
+    t5 = re[162];
+    t9 = im[162];
+    t4 = re[177];
+    t0 = im[177];
+    t10 = t3 + t5;
+    t11 = t1 + t9;
+    t6 = t8 + t4;
+    t7 = t2 + t0;
+    t3 = t3 - t5;
+    t5 = t1 - t9;
+    t1 = t8 - t4;
+    t9 = t2 - t0;
+    t8 = t10 + t6;
+    t4 = t11 + t7;
+    t2 = t3 + t9;
+    t0 = t5 - t1;
+    t10 = t10 - t6;
+    t6 = t11 - t7;
+    t11 = t3 - t9;
+    t7 = t5 + t1;
+    re[132] = t8;
+    im[132] = t4;
+    re[147] = t2;
+    im[147] = t0;
+    re[162] = t10;
+    im[162] = t6;
+    re[177] = t11;
+    im[177] = t7;
+    t3 = re[0];
+    t9 = im[0];
+    t5 = re[48];
+    t1 = im[48];
+    t8 = re[96];
+    t4 = im[96];
+    t2 = re[144];
+    t0 = im[144];
+    t10 = re[192];
+    t6 = im[192];
+    t11 = t5 + t10;
+    t7 = t1 + t6;
+    t12 = t8 + t2;
+    t13 = t4 + t0;
+    t5 = t5 - t10;
+    t10 = t1 - t6;
+    t1 = t8 - t2;
+    t6 = t4 - t0;
+    t8 = t11 + t12;
+    t2 = t7 + t13;
+    t4 = t11 - t12;
+    t0 = C55 * t4;
+    t11 = t7 - t13;
+    t12 = C55 * t11;
+    t4 = C56 * t8;
+    t7 = t3 - t4;
+    t13 = C56 * t2;
+    t11 = t9 - t13;
+    t4 = t7 + t0;
+    t13 = t11 + t12;
+    t7 = t7 - t0;
+    t0 = t11 - t12;
+    t11 = C13 * t5;
+    t12 = C57 * t1;
+    t11 = t11 + t12;
+    t12 = C13 * t10;
+    t14 = C57 * t6;
+    t12 = t12 + t14;
+    t14 = C57 * t5;
+    t5 = C13 * t1;
+    t1 = t14 - t5;
+    t14 = C57 * t10;
+    t5 = C13 * t6;
+    t10 = t14 - t5;
+    t6 = t3 + t8;
+    t14 = t9 + t2;
+    t5 = t4 + t12;
+    t3 = t13 - t11;
+    t8 = t7 + t10;
+    t9 = t0 - t1;
+    t2 = t7 - t10;
+    t7 = t0 + t1;
+    t10 = t4 - t12;
+    t0 = t13 + t11;
+    re[0] = t6;
+    im[0] = t14;
+    re[48] = t5;
+    im[48] = t3;
+    re[96] = t8;
+    im[96] = t9;
+    re[144] = t2;
+    im[144] = t7;
+    re[192] = t10;
+    im[192] = t0;
+    t1 = re[60];
+    t4 = im[60];
+    t12 = re[108];
+    t13 = im[108];
+    t11 = re[156];
+    t6 = im[156];
+    t14 = re[204];
+    t5 = im[204];
+    t3 = re[12];
+    t8 = im[12];
+    t9 = t12 + t3;
+    t2 = t13 + t8;
+    t7 = t11 + t14;
+    t10 = t6 + t5;
+    t0 = t12 - t3;
+    t12 = t13 - t8;
+    t3 = t11 - t14;
+    t13 = t6 - t5;
+    t8 = t9 + t7;
+    t11 = t2 + t10;
+    t14 = t9 - t7;
+    t6 = C55 * t14;
+    t5 = t2 - t10;
+    t9 = C55 * t5;
+    t7 = C56 * t8;
+    t14 = t1 - t7;
+    t2 = C56 * t11;
+    t10 = t4 - t2;
+    t5 = t14 + t6;
+    t7 = t10 + t9;
+    t2 = t14 - t6;
+    t14 = t10 - t9;
+    t6 = C13 * t0;
+    t10 = C57 * t3;
+    t9 = t6 + t10;
+    t6 = C13 * t12;
+    t10 = C57 * t13;
+    t6 = t6 + t10;
+    t10 = C57 * t0;
+    t0 = C13 * t3;
+    t3 = t10 - t0;
+    t10 = C57 * t12;
+    t0 = C13 * t13;
+    t12 = t10 - t0;
+    t13 = t1 + t8;
+    t10 = t4 + t11;
+    t0 = t5 + t6;
+    t1 = t7 - t9;
+    t8 = t2 + t12;
+    t4 = t14 - t3;
+    t11 = t2 - t12;
+    t2 = t14 + t3;
+    t12 = t5 - t6;
+    t14 = t7 + t9;
+    re[60] = t13;
+    im[60] = t10;
+    re[108] = t0;
+    im[108] = t1;
+    re[156] = t8;
+    im[156] = t4;
+    re[204] = t11;
+    im[204] = t2;
+    re[12] = t12;
+    im[12] = t14;
+    t3 = re[120];
+    t5 = im[120];
+    t6 = re[168];
+    t7 = im[168];
+    t9 = re[216];
+    t13 = im[216];
+    t10 = re[24];
+    t0 = im[24];
+    t1 = re[72];
+    t8 = im[72];
+    t4 = t6 + t1;
+    t11 = t7 + t8;
+    t2 = t9 + t10;
+    t12 = t13 + t0;
+    t14 = t6 - t1;
+    t6 = t7 - t8;
+    t1 = t9 - t10;
+    t7 = t13 - t0;
+    t8 = t4 + t2;
+    t9 = t11 + t12;
+    t10 = t4 - t2;
+    t13 = C55 * t10;
+    t0 = t11 - t12;
+    t4 = C55 * t0;
+    t2 = C56 * t8;
+    t10 = t3 - t2;
+    t11 = C56 * t9;
+    t12 = t5 - t11;
+    t0 = t10 + t13;
+    t2 = t12 + t4;
+    t11 = t10 - t13;
+    t10 = t12 - t4;
+    t13 = C13 * t14;
+    t12 = C57 * t1;
+    t4 = t13 + t12;
+    t13 = C13 * t6;
+    t12 = C57 * t7;
+    t13 = t13 + t12;
+    t12 = C57 * t14;
+    t14 = C13 * t1;
+    t1 = t12 - t14;
+    t12 = C57 * t6;
+    t14 = C13 * t7;
+    t6 = t12 - t14;
+    t7 = t3 + t8;
+    t12 = t5 + t9;
+    t14 = t0 + t13;
+    t3 = t2 - t4;
+    t8 = t11 + t6;
+    t5 = t10 - t1;
+    t9 = t11 - t6;
+    t11 = t10 + t1;
+    t6 = t0 - t13;
+    t10 = t2 + t4;
+    re[120] = t7;
+    im[120] = t12;
+    re[168] = t14;
+    im[168] = t3;
+    re[216] = t8;
+    im[216] = t5;
+    re[24] = t9;
+    im[24] = t11;
+    re[72] = t6;
+    im[72] = t10;
+    t1 = re[180];
+    t0 = im[180];
+    t13 = re[228];
+    t2 = im[228];
+    t4 = re[36];
+    t7 = im[36];
+    t12 = re[84];
+    t14 = im[84];
+    t3 = re[132];
+    t8 = im[132];
+    t5 = t13 + t3;
+    t9 = t2 + t8;
+    t11 = t4 + t12;
+    t6 = t7 + t14;
+    t10 = t13 - t3;
+    t13 = t2 - t8;
+    t3 = t4 - t12;
+    t2 = t7 - t14;
+    t8 = t5 + t11;
+    t4 = t9 + t6;
+    t12 = t5 - t11;
+    t7 = C55 * t12;
+    t14 = t9 - t6;
+    t5 = C55 * t14;
+    t11 = C56 * t8;
+    t12 = t1 - t11;
+    t9 = C56 * t4;
+    t6 = t0 - t9;
+    t14 = t12 + t7;
+    t11 = t6 + t5;
+    t9 = t12 - t7;
+    t12 = t6 - t5;
+    t7 = C13 * t10;
+    t6 = C57 * t3;
+    t5 = t7 + t6;
+    t7 = C13 * t13;
+    t6 = C57 * t2;
+    t7 = t7 + t6;
+    t6 = C57 * t10;
+    t10 = C13 * t3;
+    t3 = t6 - t10;
+    t6 = C57 * t13;
+    t10 = C13 * t2;
+    t13 = t6 - t10;
+    t2 = t1 + t8;
+    t6 = t0 + t4;
+    t10 = t14 + t7;
+    t1 = t11 - t5;
+    t8 = t9 + t13;
+    t0 = t12 - t3;
+    t4 = t9 - t13;
+    t9 = t12 + t3;
+    t13 = t14 - t7;
+    t12 = t11 + t5;
+    re[180] = t2;
+    im[180] = t6;
+    re[228] = t10;
+    im[228] = t1;
+    re[36] = t8;
+    im[36] = t0;
+    re[84] = t4;
+    im[84] = t9;
+    re[132] = t13;
+    im[132] = t12;
+    t3 = re[15];
+    t14 = im[15];
+    t7 = re[63];
+    t11 = im[63];
+    t5 = re[111];
+    t2 = im[111];
+    t6 = re[159];
+    t10 = im[159];
+    t1 = re[207];
+    t8 = im[207];
+    t0 = t7 + t1;
+    t4 = t11 + t8;
+    t9 = t5 + t6;
+    t13 = t2 + t10;
+    t12 = t7 - t1;
+    t7 = t11 - t8;
+    t1 = t5 - t6;
+    t11 = t2 - t10;
+    t8 = t0 + t9;
+    t5 = t4 + t13;
+    t6 = t0 - t9;
+    t2 = C55 * t6;
+    t10 = t4 - t13;
+    t0 = C55 * t10;
+    t9 = C56 * t8;
+    t6 = t3 - t9;
+    t4 = C56 * t5;
+    t13 = t14 - t4;
+    t10 = t6 + t2;
+    t9 = t13 + t0;
+    t4 = t6 - t2;
+    t6 = t13 - t0;
+    t2 = C13 * t12;
+    t13 = C57 * t1;
+    t0 = t2 + t13;
+    t2 = C13 * t7;
+    t13 = C57 * t11;
+    t2 = t2 + t13;
+    t13 = C57 * t12;
+    t12 = C13 * t1;
+    t1 = t13 - t12;
+    t13 = C57 * t7;
+    t12 = C13 * t11;
+    t7 = t13 - t12;
+    t11 = t3 + t8;
+    t13 = t14 + t5;
+    t12 = t10 + t2;
+    t3 = t9 - t0;
+    t8 = t4 + t7;
+    t14 = t6 - t1;
+    t5 = t4 - t7;
+    t4 = t6 + t1;
+    t7 = t10 - t2;
+    t6 = t9 + t0;
+    re[15] = t11;
+    im[15] = t13;
+    re[63] = t12;
+    im[63] = t3;
+    re[111] = t8;
+    im[111] = t14;
+    re[159] = t5;
+    im[159] = t4;
+    re[207] = t7;
+    im[207] = t6;
+    t1 = re[75];
+    t10 = im[75];
+    t2 = re[123];
+    t9 = im[123];
+    t0 = re[171];
+    t11 = im[171];
+    t13 = re[219];
+    t12 = im[219];
+    t3 = re[27];
+    t8 = im[27];
+    t14 = t2 + t3;
+    t5 = t9 + t8;
+    t4 = t0 + t13;
+    t7 = t11 + t12;
+    t6 = t2 - t3;
+    t2 = t9 - t8;
+    t3 = t0 - t13;
+    t9 = t11 - t12;
+    t8 = t14 + t4;
+    t0 = t5 + t7;
+    t13 = t14 - t4;
+    t11 = C55 * t13;
+    t12 = t5 - t7;
+    t14 = C55 * t12;
+    t4 = C56 * t8;
+    t13 = t1 - t4;
+    t5 = C56 * t0;
+    t7 = t10 - t5;
+    t12 = t13 + t11;
+    t4 = t7 + t14;
+    t5 = t13 - t11;
+    t13 = t7 - t14;
+    t11 = C13 * t6;
+    t7 = C57 * t3;
+    t14 = t11 + t7;
+    t11 = C13 * t2;
+    t7 = C57 * t9;
+    t11 = t11 + t7;
+    t7 = C57 * t6;
+    t6 = C13 * t3;
+    t3 = t7 - t6;
+    t7 = C57 * t2;
+    t6 = C13 * t9;
+    t2 = t7 - t6;
+    t9 = t1 + t8;
+    t7 = t10 + t0;
+    t6 = t12 + t11;
+    t1 = t4 - t14;
+    t8 = t5 + t2;
+    t10 = t13 - t3;
+    t0 = t5 - t2;
+    t5 = t13 + t3;
+    t2 = t12 - t11;
+    t13 = t4 + t14;
+    re[75] = t9;
+    im[75] = t7;
+    re[123] = t6;
+    im[123] = t1;
+    re[171] = t8;
+    im[171] = t10;
+    re[219] = t0;
+    im[219] = t5;
+    re[27] = t2;
+    im[27] = t13;
+    t3 = re[135];
+    t12 = im[135];
+    t11 = re[183];
+    t4 = im[183];
+    t14 = re[231];
+    t9 = im[231];
+    t7 = re[39];
+    t6 = im[39];
+    t1 = re[87];
+    t8 = im[87];
+    t10 = t11 + t1;
+    t0 = t4 + t8;
+    t5 = t14 + t7;
+    t2 = t9 + t6;
+    t13 = t11 - t1;
+    t11 = t4 - t8;
+    t1 = t14 - t7;
+    t4 = t9 - t6;
+    t8 = t10 + t5;
+    t14 = t0 + t2;
+    t7 = t10 - t5;
+    t9 = C55 * t7;
+    t6 = t0 - t2;
+    t10 = C55 * t6;
+    t5 = C56 * t8;
+    t7 = t3 - t5;
+    t0 = C56 * t14;
+    t2 = t12 - t0;
+    t6 = t7 + t9;
+    t5 = t2 + t10;
+    t0 = t7 - t9;
+    t7 = t2 - t10;
+    t9 = C13 * t13;
+    t2 = C57 * t1;
+    t10 = t9 + t2;
+    t9 = C13 * t11;
+    t2 = C57 * t4;
+    t9 = t9 + t2;
+    t2 = C57 * t13;
+    t13 = C13 * t1;
+    t1 = t2 - t13;
+    t2 = C57 * t11;
+    t13 = C13 * t4;
+    t11 = t2 - t13;
+    t4 = t3 + t8;
+    t2 = t12 + t14;
+    t13 = t6 + t9;
+    t3 = t5 - t10;
+    t8 = t0 + t11;
+    t12 = t7 - t1;
+    t14 = t0 - t11;
+    t0 = t7 + t1;
+    t11 = t6 - t9;
+    t7 = t5 + t10;
+    re[135] = t4;
+    im[135] = t2;
+    re[183] = t13;
+    im[183] = t3;
+    re[231] = t8;
+    im[231] = t12;
+    re[39] = t14;
+    im[39] = t0;
+    re[87] = t11;
+    im[87] = t7;
+    t1 = re[195];
+    t6 = im[195];
+    t9 = re[3];
+    t5 = im[3];
+    t10 = re[51];
+    t4 = im[51];
+    t2 = re[99];
+    t13 = im[99];
+    t3 = re[147];
+    t8 = im[147];
+    t12 = t9 + t3;
+    t14 = t5 + t8;
+    t0 = t10 + t2;
+    t11 = t4 + t13;
+    t7 = t9 - t3;
+    t9 = t5 - t8;
+    t3 = t10 - t2;
+    t5 = t4 - t13;
+    t8 = t12 + t0;
+    t10 = t14 + t11;
+    t2 = t12 - t0;
+    t4 = C55 * t2;
+    t13 = t14 - t11;
+    t12 = C55 * t13;
+    t0 = C56 * t8;
+    t2 = t1 - t0;
+    t14 = C56 * t10;
+    t11 = t6 - t14;
+    t13 = t2 + t4;
+    t0 = t11 + t12;
+    t14 = t2 - t4;
+    t2 = t11 - t12;
+    t4 = C13 * t7;
+    t11 = C57 * t3;
+    t12 = t4 + t11;
+    t4 = C13 * t9;
+    t11 = C57 * t5;
+    t4 = t4 + t11;
+    t11 = C57 * t7;
+    t7 = C13 * t3;
+    t3 = t11 - t7;
+    t11 = C57 * t9;
+    t7 = C13 * t5;
+    t9 = t11 - t7;
+    t5 = t1 + t8;
+    t11 = t6 + t10;
+    t7 = t13 + t4;
+    t1 = t0 - t12;
+    t8 = t14 + t9;
+    t6 = t2 - t3;
+    t10 = t14 - t9;
+    t14 = t2 + t3;
+    t9 = t13 - t4;
+    t2 = t0 + t12;
+    re[195] = t5;
+    im[195] = t11;
+    re[3] = t7;
+    im[3] = t1;
+    re[51] = t8;
+    im[51] = t6;
+    re[99] = t10;
+    im[99] = t14;
+    re[147] = t9;
+    im[147] = t2;
+    t3 = re[30];
+    t13 = im[30];
+    t4 = re[78];
+    t0 = im[78];
+    t12 = re[126];
+    t5 = im[126];
+    t11 = re[174];
+    t7 = im[174];
+    t1 = re[222];
+    t8 = im[222];
+    t6 = t4 + t1;
+    t10 = t0 + t8;
+    t14 = t12 + t11;
+    t9 = t5 + t7;
+    t2 = t4 - t1;
+    t4 = t0 - t8;
+    t1 = t12 - t11;
+    t0 = t5 - t7;
+    t8 = t6 + t14;
+    t12 = t10 + t9;
+    t11 = t6 - t14;
+    t5 = C55 * t11;
+    t7 = t10 - t9;
+    t6 = C55 * t7;
+    t14 = C56 * t8;
+    t11 = t3 - t14;
+    t10 = C56 * t12;
+    t9 = t13 - t10;
+    t7 = t11 + t5;
+    t14 = t9 + t6;
+    t10 = t11 - t5;
+    t11 = t9 - t6;
+    t5 = C13 * t2;
+    t9 = C57 * t1;
+    t6 = t5 + t9;
+    t5 = C13 * t4;
+    t9 = C57 * t0;
+    t5 = t5 + t9;
+    t9 = C57 * t2;
+    t2 = C13 * t1;
+    t1 = t9 - t2;
+    t9 = C57 * t4;
+    t2 = C13 * t0;
+    t4 = t9 - t2;
+    t0 = t3 + t8;
+    t9 = t13 + t12;
+    t2 = t7 + t5;
+    t3 = t14 - t6;
+    t8 = t10 + t4;
+    t13 = t11 - t1;
+    t12 = t10 - t4;
+    t10 = t11 + t1;
+    t4 = t7 - t5;
+    t11 = t14 + t6;
+    re[30] = t0;
+    im[30] = t9;
+    re[78] = t2;
+    im[78] = t3;
+    re[126] = t8;
+    im[126] = t13;
+    re[174] = t12;
+    im[174] = t10;
+    re[222] = t4;
+    im[222] = t11;
+}
+
+/**
+ *  Part 2 of ApplyWindowedIMDCT_W10_480_K160().
+ * 
+ *  @param {Number[]} X 
+ *    - The input block (480 points, only the first 160 points are used).
+ *  @param {Number[]} y 
+ *    - The array that would contain the output block (960 points).
+ *  @param {Number[]} re 
+ *    - The scratch buffer (real part, 240 points).
+ *  @param {Number[]} im 
+ *    - The scratch buffer (imaginary part, 240 points).
+ */
+function ApplyWindowedIMDCT_W10_480_K160_Part2(X, y, re, im) {
+    let t0, t1, t10, t11, t12, t13, t14, t2, t3, t4, t5, t6, t7, t8, t9;
+    const C0 = 0.5590169943749475;
+    const C1 = 0.25;
+    const C2 = 0.9510565162951535;
+    const C3 = 0.5877852522924731;
+    const C4 = 0.9238795325112867;
+    const C5 = 1.3065629648763766;
+    const C6 = 0.5411961001461969;
+    const C7 = 0.7071067811865476;
+    const C8 = 0.3826834323650898;
+    t1 = re[90];
+    t7 = im[90];
+    t5 = re[138];
+    t14 = im[138];
+    t6 = re[186];
+    t0 = im[186];
+    t9 = re[234];
+    t2 = im[234];
+    t3 = re[42];
+    t8 = im[42];
+    t13 = t5 + t3;
+    t12 = t14 + t8;
+    t10 = t6 + t9;
+    t4 = t0 + t2;
+    t11 = t5 - t3;
+    t5 = t14 - t8;
+    t3 = t6 - t9;
+    t14 = t0 - t2;
+    t8 = t13 + t10;
+    t6 = t12 + t4;
+    t9 = t13 - t10;
+    t0 = C0 * t9;
+    t2 = t12 - t4;
+    t13 = C0 * t2;
+    t10 = C1 * t8;
+    t9 = t1 - t10;
+    t12 = C1 * t6;
+    t4 = t7 - t12;
+    t2 = t9 + t0;
+    t10 = t4 + t13;
+    t12 = t9 - t0;
+    t9 = t4 - t13;
+    t0 = C2 * t11;
+    t4 = C3 * t3;
+    t13 = t0 + t4;
+    t0 = C2 * t5;
+    t4 = C3 * t14;
+    t0 = t0 + t4;
+    t4 = C3 * t11;
+    t11 = C2 * t3;
+    t3 = t4 - t11;
+    t4 = C3 * t5;
+    t11 = C2 * t14;
+    t5 = t4 - t11;
+    t14 = t1 + t8;
+    t4 = t7 + t6;
+    t11 = t2 + t0;
+    t1 = t10 - t13;
+    t8 = t12 + t5;
+    t7 = t9 - t3;
+    t6 = t12 - t5;
+    t12 = t9 + t3;
+    t5 = t2 - t0;
+    t9 = t10 + t13;
+    re[90] = t14;
+    im[90] = t4;
+    re[138] = t11;
+    im[138] = t1;
+    re[186] = t8;
+    im[186] = t7;
+    re[234] = t6;
+    im[234] = t12;
+    re[42] = t5;
+    im[42] = t9;
+    t3 = re[150];
+    t2 = im[150];
+    t0 = re[198];
+    t10 = im[198];
+    t13 = re[6];
+    t14 = im[6];
+    t4 = re[54];
+    t11 = im[54];
+    t1 = re[102];
+    t8 = im[102];
+    t7 = t0 + t1;
+    t6 = t10 + t8;
+    t12 = t13 + t4;
+    t5 = t14 + t11;
+    t9 = t0 - t1;
+    t0 = t10 - t8;
+    t1 = t13 - t4;
+    t10 = t14 - t11;
+    t8 = t7 + t12;
+    t13 = t6 + t5;
+    t4 = t7 - t12;
+    t14 = C0 * t4;
+    t11 = t6 - t5;
+    t7 = C0 * t11;
+    t12 = C1 * t8;
+    t4 = t3 - t12;
+    t6 = C1 * t13;
+    t5 = t2 - t6;
+    t11 = t4 + t14;
+    t12 = t5 + t7;
+    t6 = t4 - t14;
+    t4 = t5 - t7;
+    t14 = C2 * t9;
+    t5 = C3 * t1;
+    t7 = t14 + t5;
+    t14 = C2 * t0;
+    t5 = C3 * t10;
+    t14 = t14 + t5;
+    t5 = C3 * t9;
+    t9 = C2 * t1;
+    t1 = t5 - t9;
+    t5 = C3 * t0;
+    t9 = C2 * t10;
+    t0 = t5 - t9;
+    t10 = t3 + t8;
+    t5 = t2 + t13;
+    t9 = t11 + t14;
+    t3 = t12 - t7;
+    t8 = t6 + t0;
+    t2 = t4 - t1;
+    t13 = t6 - t0;
+    t6 = t4 + t1;
+    t0 = t11 - t14;
+    t4 = t12 + t7;
+    re[150] = t10;
+    im[150] = t5;
+    re[198] = t9;
+    im[198] = t3;
+    re[6] = t8;
+    im[6] = t2;
+    re[54] = t13;
+    im[54] = t6;
+    re[102] = t0;
+    im[102] = t4;
+    t1 = re[210];
+    t11 = im[210];
+    t14 = re[18];
+    t12 = im[18];
+    t7 = re[66];
+    t10 = im[66];
+    t5 = re[114];
+    t9 = im[114];
+    t3 = re[162];
+    t8 = im[162];
+    t2 = t14 + t3;
+    t13 = t12 + t8;
+    t6 = t7 + t5;
+    t0 = t10 + t9;
+    t4 = t14 - t3;
+    t14 = t12 - t8;
+    t3 = t7 - t5;
+    t12 = t10 - t9;
+    t8 = t2 + t6;
+    t7 = t13 + t0;
+    t5 = t2 - t6;
+    t10 = C0 * t5;
+    t9 = t13 - t0;
+    t2 = C0 * t9;
+    t6 = C1 * t8;
+    t5 = t1 - t6;
+    t13 = C1 * t7;
+    t0 = t11 - t13;
+    t9 = t5 + t10;
+    t6 = t0 + t2;
+    t13 = t5 - t10;
+    t5 = t0 - t2;
+    t10 = C2 * t4;
+    t0 = C3 * t3;
+    t2 = t10 + t0;
+    t10 = C2 * t14;
+    t0 = C3 * t12;
+    t10 = t10 + t0;
+    t0 = C3 * t4;
+    t4 = C2 * t3;
+    t3 = t0 - t4;
+    t0 = C3 * t14;
+    t4 = C2 * t12;
+    t14 = t0 - t4;
+    t12 = t1 + t8;
+    t0 = t11 + t7;
+    t4 = t9 + t10;
+    t1 = t6 - t2;
+    t8 = t13 + t14;
+    t11 = t5 - t3;
+    t7 = t13 - t14;
+    t13 = t5 + t3;
+    t14 = t9 - t10;
+    t5 = t6 + t2;
+    re[210] = t12;
+    im[210] = t0;
+    re[18] = t4;
+    im[18] = t1;
+    re[66] = t8;
+    im[66] = t11;
+    re[114] = t7;
+    im[114] = t13;
+    re[162] = t14;
+    im[162] = t5;
+    t3 = re[45];
+    t9 = im[45];
+    t10 = re[93];
+    t6 = im[93];
+    t2 = re[141];
+    t12 = im[141];
+    t0 = re[189];
+    t4 = im[189];
+    t1 = re[237];
+    t8 = im[237];
+    t11 = t10 + t1;
+    t7 = t6 + t8;
+    t13 = t2 + t0;
+    t14 = t12 + t4;
+    t5 = t10 - t1;
+    t10 = t6 - t8;
+    t1 = t2 - t0;
+    t6 = t12 - t4;
+    t8 = t11 + t13;
+    t2 = t7 + t14;
+    t0 = t11 - t13;
+    t12 = C0 * t0;
+    t4 = t7 - t14;
+    t11 = C0 * t4;
+    t13 = C1 * t8;
+    t0 = t3 - t13;
+    t7 = C1 * t2;
+    t14 = t9 - t7;
+    t4 = t0 + t12;
+    t13 = t14 + t11;
+    t7 = t0 - t12;
+    t0 = t14 - t11;
+    t12 = C2 * t5;
+    t14 = C3 * t1;
+    t11 = t12 + t14;
+    t12 = C2 * t10;
+    t14 = C3 * t6;
+    t12 = t12 + t14;
+    t14 = C3 * t5;
+    t5 = C2 * t1;
+    t1 = t14 - t5;
+    t14 = C3 * t10;
+    t5 = C2 * t6;
+    t10 = t14 - t5;
+    t6 = t3 + t8;
+    t14 = t9 + t2;
+    t5 = t4 + t12;
+    t3 = t13 - t11;
+    t8 = t7 + t10;
+    t9 = t0 - t1;
+    t2 = t7 - t10;
+    t7 = t0 + t1;
+    t10 = t4 - t12;
+    t0 = t13 + t11;
+    re[45] = t6;
+    im[45] = t14;
+    re[93] = t5;
+    im[93] = t3;
+    re[141] = t8;
+    im[141] = t9;
+    re[189] = t2;
+    im[189] = t7;
+    re[237] = t10;
+    im[237] = t0;
+    t1 = re[105];
+    t4 = im[105];
+    t12 = re[153];
+    t13 = im[153];
+    t11 = re[201];
+    t6 = im[201];
+    t14 = re[9];
+    t5 = im[9];
+    t3 = re[57];
+    t8 = im[57];
+    t9 = t12 + t3;
+    t2 = t13 + t8;
+    t7 = t11 + t14;
+    t10 = t6 + t5;
+    t0 = t12 - t3;
+    t12 = t13 - t8;
+    t3 = t11 - t14;
+    t13 = t6 - t5;
+    t8 = t9 + t7;
+    t11 = t2 + t10;
+    t14 = t9 - t7;
+    t6 = C0 * t14;
+    t5 = t2 - t10;
+    t9 = C0 * t5;
+    t7 = C1 * t8;
+    t14 = t1 - t7;
+    t2 = C1 * t11;
+    t10 = t4 - t2;
+    t5 = t14 + t6;
+    t7 = t10 + t9;
+    t2 = t14 - t6;
+    t14 = t10 - t9;
+    t6 = C2 * t0;
+    t10 = C3 * t3;
+    t9 = t6 + t10;
+    t6 = C2 * t12;
+    t10 = C3 * t13;
+    t6 = t6 + t10;
+    t10 = C3 * t0;
+    t0 = C2 * t3;
+    t3 = t10 - t0;
+    t10 = C3 * t12;
+    t0 = C2 * t13;
+    t12 = t10 - t0;
+    t13 = t1 + t8;
+    t10 = t4 + t11;
+    t0 = t5 + t6;
+    t1 = t7 - t9;
+    t8 = t2 + t12;
+    t4 = t14 - t3;
+    t11 = t2 - t12;
+    t2 = t14 + t3;
+    t12 = t5 - t6;
+    t14 = t7 + t9;
+    re[105] = t13;
+    im[105] = t10;
+    re[153] = t0;
+    im[153] = t1;
+    re[201] = t8;
+    im[201] = t4;
+    re[9] = t11;
+    im[9] = t2;
+    re[57] = t12;
+    im[57] = t14;
+    t3 = re[165];
+    t5 = im[165];
+    t6 = re[213];
+    t7 = im[213];
+    t9 = re[21];
+    t13 = im[21];
+    t10 = re[69];
+    t0 = im[69];
+    t1 = re[117];
+    t8 = im[117];
+    t4 = t6 + t1;
+    t11 = t7 + t8;
+    t2 = t9 + t10;
+    t12 = t13 + t0;
+    t14 = t6 - t1;
+    t6 = t7 - t8;
+    t1 = t9 - t10;
+    t7 = t13 - t0;
+    t8 = t4 + t2;
+    t9 = t11 + t12;
+    t10 = t4 - t2;
+    t13 = C0 * t10;
+    t0 = t11 - t12;
+    t4 = C0 * t0;
+    t2 = C1 * t8;
+    t10 = t3 - t2;
+    t11 = C1 * t9;
+    t12 = t5 - t11;
+    t0 = t10 + t13;
+    t2 = t12 + t4;
+    t11 = t10 - t13;
+    t10 = t12 - t4;
+    t13 = C2 * t14;
+    t12 = C3 * t1;
+    t4 = t13 + t12;
+    t13 = C2 * t6;
+    t12 = C3 * t7;
+    t13 = t13 + t12;
+    t12 = C3 * t14;
+    t14 = C2 * t1;
+    t1 = t12 - t14;
+    t12 = C3 * t6;
+    t14 = C2 * t7;
+    t6 = t12 - t14;
+    t7 = t3 + t8;
+    t12 = t5 + t9;
+    t14 = t0 + t13;
+    t3 = t2 - t4;
+    t8 = t11 + t6;
+    t5 = t10 - t1;
+    t9 = t11 - t6;
+    t11 = t10 + t1;
+    t6 = t0 - t13;
+    t10 = t2 + t4;
+    re[165] = t7;
+    im[165] = t12;
+    re[213] = t14;
+    im[213] = t3;
+    re[21] = t8;
+    im[21] = t5;
+    re[69] = t9;
+    im[69] = t11;
+    re[117] = t6;
+    im[117] = t10;
+    t1 = re[225];
+    t0 = im[225];
+    t13 = re[33];
+    t2 = im[33];
+    t4 = re[81];
+    t7 = im[81];
+    t12 = re[129];
+    t14 = im[129];
+    t3 = re[177];
+    t8 = im[177];
+    t5 = t13 + t3;
+    t9 = t2 + t8;
+    t11 = t4 + t12;
+    t6 = t7 + t14;
+    t10 = t13 - t3;
+    t13 = t2 - t8;
+    t3 = t4 - t12;
+    t2 = t7 - t14;
+    t8 = t5 + t11;
+    t4 = t9 + t6;
+    t12 = t5 - t11;
+    t7 = C0 * t12;
+    t14 = t9 - t6;
+    t5 = C0 * t14;
+    t11 = C1 * t8;
+    t12 = t1 - t11;
+    t9 = C1 * t4;
+    t6 = t0 - t9;
+    t14 = t12 + t7;
+    t11 = t6 + t5;
+    t9 = t12 - t7;
+    t12 = t6 - t5;
+    t7 = C2 * t10;
+    t6 = C3 * t3;
+    t5 = t7 + t6;
+    t7 = C2 * t13;
+    t6 = C3 * t2;
+    t7 = t7 + t6;
+    t6 = C3 * t10;
+    t10 = C2 * t3;
+    t3 = t6 - t10;
+    t6 = C3 * t13;
+    t10 = C2 * t2;
+    t13 = t6 - t10;
+    t2 = t1 + t8;
+    t6 = t0 + t4;
+    t10 = t14 + t7;
+    t1 = t11 - t5;
+    t8 = t9 + t13;
+    t0 = t12 - t3;
+    t4 = t9 - t13;
+    t9 = t12 + t3;
+    t13 = t14 - t7;
+    t12 = t11 + t5;
+    re[225] = t2;
+    im[225] = t6;
+    re[33] = t10;
+    im[33] = t1;
+    re[81] = t8;
+    im[81] = t0;
+    re[129] = t4;
+    im[129] = t9;
+    re[177] = t13;
+    im[177] = t12;
+    t3 = X[79];
+    t14 = 0.9659258262890683 * t3;
+    t7 = 0.25881904510252074 * t3;
+    t11 = X[40];
+    t5 = 0.9914448613738104 * t11;
+    t2 = (-0.13052619222005157) * t11;
+    t6 = -t14;
+    t10 = -t7;
+    t1 = t14 + t5;
+    t8 = t7 + t2;
+    t0 = t6 - t2;
+    t4 = t5 - t7;
+    t9 = t14 - t5;
+    t13 = t7 - t2;
+    t12 = t2 - t14;
+    t3 = t10 - t5;
+    re[80] = t1;
+    im[80] = t8;
+    re[140] = t0;
+    im[140] = t4;
+    re[200] = t9;
+    im[200] = t13;
+    re[20] = t12;
+    im[20] = t3;
+    t11 = X[49];
+    t6 = 0.986643332084879 * t11;
+    t7 = 0.16289547339458874 * t11;
+    t2 = X[70];
+    t14 = 0.9738769792773336 * t2;
+    t10 = (-0.22707626303437323) * t2;
+    t5 = -t6;
+    t1 = -t7;
+    t8 = t6 + t14;
+    t0 = t7 + t10;
+    t4 = t5 - t10;
+    t9 = t14 - t7;
+    t13 = t6 - t14;
+    t12 = t7 - t10;
+    t3 = t10 - t6;
+    t11 = t1 - t14;
+    t2 = t4 + t9;
+    t5 = C4 * t2;
+    t7 = t4 * (-C5);
+    t10 = t9 * C6;
+    t6 = t5 - t10;
+    t1 = t5 + t7;
+    t14 = t13 + t12;
+    t2 = t13 - t12;
+    t4 = C7 * t14;
+    t9 = (-C7) * t2;
+    t10 = t3 + t11;
+    t5 = C8 * t10;
+    t7 = t3 * (-C5);
+    t13 = t11 * (-C6);
+    t12 = t5 - t13;
+    t14 = t5 + t7;
+    re[95] = t8;
+    im[95] = t0;
+    re[155] = t6;
+    im[155] = t1;
+    re[215] = t4;
+    im[215] = t9;
+    re[35] = t12;
+    im[35] = t14;
+    t2 = X[139];
+    t10 = 0.8968727415326883 * t2;
+    t3 = 0.4422886902190013 * t2;
+    t11 = X[19];
+    t13 = 0.9978589232386035 * t11;
+    t5 = 0.06540312923014306 * t11;
+    t7 = X[100];
+    t8 = 0.9469301294951057 * t7;
+    t0 = (-0.3214394653031616) * t7;
+    t6 = t10 + t8;
+    t1 = t3 + t0;
+    t4 = -t13;
+    t9 = -t5;
+    t12 = t10 - t8;
+    t14 = t3 - t0;
+    t2 = t13 + t6;
+    t11 = t5 + t1;
+    t7 = t14 - t13;
+    t10 = t9 - t12;
+    t8 = t13 - t6;
+    t3 = t5 - t1;
+    t0 = t4 - t14;
+    t9 = t12 - t5;
+    t13 = t7 + t10;
+    t6 = t7 - t10;
+    t1 = C7 * t13;
+    t4 = (-C7) * t6;
+    t14 = -t8;
+    t12 = t0 - t9;
+    t5 = t0 + t9;
+    t7 = (-C7) * t12;
+    t10 = (-C7) * t5;
+    re[110] = t2;
+    im[110] = t11;
+    re[170] = t1;
+    im[170] = t4;
+    re[230] = t3;
+    im[230] = t14;
+    re[50] = t7;
+    im[50] = t10;
+    t13 = X[109];
+    t6 = 0.9359059267573258 * t13;
+    t8 = 0.3522500479212335 * t13;
+    t0 = X[10];
+    t9 = 0.9994645874763657 * t0;
+    t12 = (-0.03271908282177614) * t0;
+    t5 = X[130];
+    t2 = 0.9108638249211758 * t5;
+    t11 = (-0.41270702980439467) * t5;
+    t1 = t6 + t2;
+    t4 = t8 + t11;
+    t3 = -t9;
+    t14 = -t12;
+    t7 = t6 - t2;
+    t10 = t8 - t11;
+    t13 = t9 + t1;
+    t0 = t12 + t4;
+    t5 = t10 - t9;
+    t6 = t14 - t7;
+    t2 = t9 - t1;
+    t8 = t12 - t4;
+    t11 = t3 - t10;
+    t14 = t7 - t12;
+    t9 = t5 + t6;
+    t1 = C8 * t9;
+    t4 = t5 * (-C5);
+    t3 = t6 * (-C6);
+    t10 = t1 - t3;
+    t7 = t1 + t4;
+    t12 = t2 - t8;
+    t9 = t2 + t8;
+    t5 = (-C7) * t12;
+    t6 = (-C7) * t9;
+    t3 = t11 + t14;
+    t1 = (-C4) * t3;
+    t4 = t11 * C5;
+    t2 = t14 * (-C6);
+    t8 = t1 - t2;
+    t12 = t1 + t4;
+    re[125] = t13;
+    im[125] = t0;
+    re[185] = t10;
+    im[185] = t7;
+    re[5] = t5;
+    im[5] = t6;
+    re[65] = t8;
+    im[65] = t12;
+    t9 = re[80];
+    t3 = im[80];
+    t11 = re[95];
+    t14 = im[95];
+    t2 = re[110];
+    t1 = im[110];
+    t4 = re[125];
+    t13 = im[125];
+    t0 = t9 + t2;
+    t10 = t3 + t1;
+    t7 = t11 + t4;
+    t5 = t14 + t13;
+    t6 = t9 - t2;
+    t8 = t3 - t1;
+    t12 = t11 - t4;
+    t9 = t14 - t13;
+    t2 = t0 + t7;
+    t3 = t10 + t5;
+    t1 = t6 + t9;
+    t11 = t8 - t12;
+    t4 = t0 - t7;
+    t14 = t10 - t5;
+    t13 = t6 - t9;
+    t0 = t8 + t12;
+    re[80] = t2;
+    im[80] = t3;
+    re[95] = t1;
+    im[95] = t11;
+    re[110] = t4;
+    im[110] = t14;
+    re[125] = t13;
+    im[125] = t0;
+    t7 = re[140];
+    t10 = im[140];
+    t5 = re[155];
+    t6 = im[155];
+    t9 = re[170];
+    t8 = im[170];
+    t12 = re[185];
+    t2 = im[185];
+    t3 = t7 + t9;
+    t1 = t10 + t8;
+    t11 = t5 + t12;
+    t4 = t6 + t2;
+    t14 = t7 - t9;
+    t13 = t10 - t8;
+    t0 = t5 - t12;
+    t7 = t6 - t2;
+    t9 = t3 + t11;
+    t10 = t1 + t4;
+    t8 = t14 + t7;
+    t5 = t13 - t0;
+    t12 = t3 - t11;
+    t6 = t1 - t4;
+    t2 = t14 - t7;
+    t3 = t13 + t0;
+    re[140] = t9;
+    im[140] = t10;
+    re[155] = t8;
+    im[155] = t5;
+    re[170] = t12;
+    im[170] = t6;
+    re[185] = t2;
+    im[185] = t3;
+    t11 = re[200];
+    t1 = im[200];
+    t4 = re[215];
+    t14 = im[215];
+    t7 = re[230];
+    t13 = im[230];
+    t0 = re[5];
+    t9 = im[5];
+    t10 = t11 + t7;
+    t8 = t1 + t13;
+    t5 = t4 + t0;
+    t12 = t14 + t9;
+    t6 = t11 - t7;
+    t2 = t1 - t13;
+    t3 = t4 - t0;
+    t11 = t14 - t9;
+    t7 = t10 + t5;
+    t1 = t8 + t12;
+    t13 = t6 + t11;
+    t4 = t2 - t3;
+    t0 = t10 - t5;
+    t14 = t8 - t12;
+    t9 = t6 - t11;
+    t10 = t2 + t3;
+    re[200] = t7;
+    im[200] = t1;
+    re[215] = t13;
+    im[215] = t4;
+    re[230] = t0;
+    im[230] = t14;
+    re[5] = t9;
+    im[5] = t10;
+    t5 = re[20];
+    t8 = im[20];
+    t12 = re[35];
+    t6 = im[35];
+    t11 = re[50];
+    t2 = im[50];
+    t3 = re[65];
+    t7 = im[65];
+    t1 = t5 + t11;
+    t13 = t8 + t2;
+    t4 = t12 + t3;
+    t0 = t6 + t7;
+    t14 = t5 - t11;
+    t9 = t8 - t2;
+    t10 = t12 - t3;
+    t5 = t6 - t7;
+    t11 = t1 + t4;
+    t8 = t13 + t0;
+    t2 = t14 + t5;
+    t12 = t9 - t10;
+    t3 = t1 - t4;
+    t6 = t13 - t0;
+    t7 = t14 - t5;
+    t1 = t9 + t10;
+    re[20] = t11;
+    im[20] = t8;
+    re[35] = t2;
+    im[35] = t12;
+    re[50] = t3;
+    im[50] = t6;
+    re[65] = t7;
+    im[65] = t1;
+    t4 = X[103];
+    t13 = 0.9426414910921784 * t4;
+    t0 = 0.33380685923377096 * t4;
+    t14 = X[16];
+    t5 = 0.9986295347545738 * t14;
+    t9 = (-0.05233595624294383) * t14;
+    t10 = X[136];
+    t11 = 0.9025852843498606 * t10;
+    t8 = (-0.4305110968082951) * t10;
+    t2 = t13 + t11;
+    t12 = t0 + t8;
+    t3 = -t5;
+    t6 = -t9;
+    t7 = t13 - t11;
+    t1 = t0 - t8;
+    t4 = t5 + t2;
+    t14 = t9 + t12;
+    t10 = t1 - t5;
+    t13 = t6 - t7;
+    t11 = t5 - t2;
+    t0 = t9 - t12;
+    t8 = t3 - t1;
+    t6 = t7 - t9;
+    re[128] = t4;
+    im[128] = t14;
+    re[188] = t10;
+    im[188] = t13;
+    re[8] = t11;
+    im[8] = t0;
+    re[68] = t8;
+    im[68] = t6;
+    t5 = X[73];
+    t2 = 0.9708212084269281 * t5;
+    t12 = 0.23980446465501654 * t5;
+    t3 = X[46];
+    t1 = 0.9886910398241674 * t3;
+    t7 = (-0.149966755554045) * t3;
+    t9 = -t1;
+    t4 = -t7;
+    t14 = t1 + t2;
+    t10 = t7 + t12;
+    t13 = t12 - t1;
+    t11 = t4 - t2;
+    t0 = t1 - t2;
+    t8 = t7 - t12;
+    t6 = t9 - t12;
+    t5 = t2 - t7;
+    t3 = t13 + t11;
+    t4 = C4 * t3;
+    t1 = t13 * (-C5);
+    t9 = t11 * C6;
+    t12 = t4 - t9;
+    t2 = t4 + t1;
+    t7 = t0 + t8;
+    t3 = t0 - t8;
+    t13 = C7 * t7;
+    t11 = (-C7) * t3;
+    t9 = t6 + t5;
+    t4 = C8 * t9;
+    t1 = t6 * (-C5);
+    t0 = t5 * (-C6);
+    t8 = t4 - t0;
+    t7 = t4 + t1;
+    re[143] = t14;
+    im[143] = t10;
+    re[203] = t12;
+    im[203] = t2;
+    re[23] = t13;
+    im[23] = t11;
+    re[83] = t8;
+    im[83] = t7;
+    t3 = X[43];
+    t9 = 0.9896513868196702 * t3;
+    t6 = 0.1434926219911793 * t3;
+    t5 = X[76];
+    t0 = 0.9692309097067544 * t5;
+    t4 = (-0.24615329302899303) * t5;
+    t1 = -t0;
+    t14 = -t4;
+    t10 = t0 + t9;
+    t12 = t4 + t6;
+    t2 = t6 - t0;
+    t13 = t14 - t9;
+    t11 = t0 - t9;
+    t8 = t4 - t6;
+    t7 = t1 - t6;
+    t3 = t9 - t4;
+    t5 = t2 + t13;
+    t14 = t2 - t13;
+    t0 = C7 * t5;
+    t1 = (-C7) * t14;
+    t6 = -t11;
+    t9 = t7 - t3;
+    t4 = t7 + t3;
+    t2 = (-C7) * t9;
+    t13 = (-C7) * t4;
+    re[158] = t10;
+    im[158] = t12;
+    re[218] = t0;
+    im[218] = t1;
+    re[38] = t8;
+    im[38] = t6;
+    re[98] = t2;
+    im[98] = t13;
+    t5 = X[133];
+    t14 = 0.9053836208979552 * t5;
+    t11 = 0.4245945112807131 * t5;
+    t7 = X[13];
+    t3 = 0.9989506813588601 * t7;
+    t9 = 0.04579886693652077 * t7;
+    t4 = X[106];
+    t10 = 0.9404365560933549 * t4;
+    t12 = (-0.3399692397309942) * t4;
+    t0 = t14 + t10;
+    t1 = t11 + t12;
+    t8 = t14 - t10;
+    t6 = t11 - t12;
+    t2 = t0 + t3;
+    t13 = t1 + t9;
+    t5 = t8 + t9;
+    t7 = t6 - t3;
+    t4 = t0 - t3;
+    t14 = t1 - t9;
+    t10 = t8 - t9;
+    t11 = t6 + t3;
+    t12 = t5 + t7;
+    t0 = C8 * t12;
+    t1 = t5 * (-C5);
+    t8 = t7 * (-C6);
+    t9 = t0 - t8;
+    t6 = t0 + t1;
+    t3 = t4 - t14;
+    t12 = t4 + t14;
+    t5 = (-C7) * t3;
+    t7 = (-C7) * t12;
+    t8 = t10 + t11;
+    t0 = (-C4) * t8;
+    t1 = t10 * C5;
+    t4 = t11 * (-C6);
+    t14 = t0 - t4;
+    t3 = t0 + t1;
+    re[173] = t2;
+    im[173] = t13;
+    re[233] = t9;
+    im[233] = t6;
+    re[53] = t5;
+    im[53] = t7;
+    re[113] = t14;
+    im[113] = t3;
+    t12 = re[128];
+    t8 = im[128];
+    t10 = re[143];
+    t11 = im[143];
+    t4 = re[158];
+    t0 = im[158];
+    t1 = re[173];
+    t2 = im[173];
+    t13 = t12 + t4;
+    t9 = t8 + t0;
+    t6 = t10 + t1;
+    t5 = t11 + t2;
+    t7 = t12 - t4;
+    t14 = t8 - t0;
+    t3 = t10 - t1;
+    t12 = t11 - t2;
+    t4 = t13 + t6;
+    t8 = t9 + t5;
+    t0 = t7 + t12;
+    t10 = t14 - t3;
+    t1 = t13 - t6;
+    t11 = t9 - t5;
+    t2 = t7 - t12;
+    t13 = t14 + t3;
+    re[128] = t4;
+    im[128] = t8;
+    re[143] = t0;
+    im[143] = t10;
+    re[158] = t1;
+    im[158] = t11;
+    re[173] = t2;
+    im[173] = t13;
+    t6 = re[188];
+    t9 = im[188];
+    t5 = re[203];
+    t7 = im[203];
+    t12 = re[218];
+    t14 = im[218];
+    t3 = re[233];
+    t4 = im[233];
+    t8 = t6 + t12;
+    t0 = t9 + t14;
+    t10 = t5 + t3;
+    t1 = t7 + t4;
+    t11 = t6 - t12;
+    t2 = t9 - t14;
+    t13 = t5 - t3;
+    t6 = t7 - t4;
+    t12 = t8 + t10;
+    t9 = t0 + t1;
+    t14 = t11 + t6;
+    t5 = t2 - t13;
+    t3 = t8 - t10;
+    t7 = t0 - t1;
+    t4 = t11 - t6;
+    t8 = t2 + t13;
+    re[188] = t12;
+    im[188] = t9;
+    re[203] = t14;
+    im[203] = t5;
+    re[218] = t3;
+    im[218] = t7;
+    re[233] = t4;
+    im[233] = t8;
+    t10 = re[8];
+    t0 = im[8];
+    t1 = re[23];
+    t11 = im[23];
+    t6 = re[38];
+    t2 = im[38];
+    t13 = re[53];
+    t12 = im[53];
+    t9 = t10 + t6;
+    t14 = t0 + t2;
+    t5 = t1 + t13;
+    t3 = t11 + t12;
+    t7 = t10 - t6;
+    t4 = t0 - t2;
+    t8 = t1 - t13;
+    t10 = t11 - t12;
+    t6 = t9 + t5;
+    t0 = t14 + t3;
+    t2 = t7 + t10;
+    t1 = t4 - t8;
+    t13 = t9 - t5;
+    t11 = t14 - t3;
+    t12 = t7 - t10;
+    t9 = t4 + t8;
+    re[8] = t6;
+    im[8] = t0;
+    re[23] = t2;
+    im[23] = t1;
+    re[38] = t13;
+    im[38] = t11;
+    re[53] = t12;
+    im[53] = t9;
+    t5 = re[68];
+    t14 = im[68];
+    t3 = re[83];
+    t7 = im[83];
+    t10 = re[98];
+    t4 = im[98];
+    t8 = re[113];
+    t6 = im[113];
+    t0 = t5 + t10;
+    t2 = t14 + t4;
+    t1 = t3 + t8;
+    t13 = t7 + t6;
+    t11 = t5 - t10;
+    t12 = t14 - t4;
+    t9 = t3 - t8;
+    t5 = t7 - t6;
+    t10 = t0 + t1;
+    t14 = t2 + t13;
+    t4 = t11 + t5;
+    t3 = t12 - t9;
+    t8 = t0 - t1;
+    t7 = t2 - t13;
+    t6 = t11 - t5;
+    t0 = t12 + t9;
+    re[68] = t10;
+    im[68] = t14;
+    re[83] = t4;
+    im[83] = t3;
+    re[98] = t8;
+    im[98] = t7;
+    re[113] = t6;
+    im[113] = t0;
+    t1 = X[127];
+    t2 = 0.9135454576426009 * t1;
+    t13 = 0.40673664307580015 * t1;
+    t11 = X[7];
+    t5 = 0.9996573249755573 * t11;
+    t12 = 0.02617694830787315 * t11;
+    t9 = X[112];
+    t10 = 0.9335804264972017 * t9;
+    t14 = (-0.35836794954530027) * t9;
+    t4 = t2 + t10;
+    t3 = t13 + t14;
+    t8 = t2 - t10;
+    t7 = t13 - t14;
+    t6 = t4 + t5;
+    t0 = t3 + t12;
+    t1 = t8 + t12;
+    t11 = t7 - t5;
+    t9 = t4 - t5;
+    t2 = t3 - t12;
+    t10 = t8 - t12;
+    t13 = t7 + t5;
+    re[176] = t6;
+    im[176] = t0;
+    re[236] = t1;
+    im[236] = t11;
+    re[56] = t9;
+    im[56] = t2;
+    re[116] = t10;
+    im[116] = t13;
+    t14 = X[97];
+    t4 = 0.949013649188214 * t14;
+    t3 = 0.31523498164776964 * t14;
+    t8 = X[22];
+    t12 = 0.9974094913373519 * t8;
+    t7 = (-0.07193265315671939) * t8;
+    t5 = X[142];
+    t6 = 0.8939587799699321 * t5;
+    t0 = (-0.44814919358922256) * t5;
+    t1 = t4 + t6;
+    t11 = t3 + t0;
+    t9 = t4 - t6;
+    t2 = t3 - t0;
+    t10 = t1 + t12;
+    t13 = t11 + t7;
+    t14 = t9 + t7;
+    t8 = t2 - t12;
+    t5 = t1 - t12;
+    t4 = t11 - t7;
+    t6 = t9 - t7;
+    t3 = t2 + t12;
+    t0 = t14 + t8;
+    t1 = C4 * t0;
+    t11 = t14 * (-C5);
+    t9 = t8 * C6;
+    t7 = t1 - t9;
+    t2 = t1 + t11;
+    t12 = t5 + t4;
+    t0 = t5 - t4;
+    t14 = C7 * t12;
+    t8 = (-C7) * t0;
+    t9 = t6 + t3;
+    t1 = C8 * t9;
+    t11 = t6 * (-C5);
+    t5 = t3 * (-C6);
+    t4 = t1 - t5;
+    t12 = t1 + t11;
+    re[191] = t10;
+    im[191] = t13;
+    re[11] = t7;
+    im[11] = t2;
+    re[71] = t14;
+    im[71] = t8;
+    re[131] = t4;
+    im[131] = t12;
+    t0 = X[67];
+    t9 = 0.9753423205085127 * t0;
+    t6 = 0.22069743502150108 * t0;
+    t3 = X[52];
+    t5 = 0.9855560590580777 * t3;
+    t1 = (-0.1693495038490246) * t3;
+    t11 = t9 + t5;
+    t10 = t6 + t1;
+    t13 = t9 + t1;
+    t7 = t6 - t5;
+    t2 = t9 - t5;
+    t14 = t6 - t1;
+    t8 = t9 - t1;
+    t4 = t6 + t5;
+    t12 = t13 + t7;
+    t0 = t13 - t7;
+    t3 = C7 * t12;
+    t9 = (-C7) * t0;
+    t1 = -t2;
+    t6 = t8 - t4;
+    t5 = t8 + t4;
+    t13 = (-C7) * t6;
+    t7 = (-C7) * t5;
+    re[206] = t11;
+    im[206] = t10;
+    re[26] = t3;
+    im[26] = t9;
+    re[86] = t14;
+    im[86] = t1;
+    re[146] = t13;
+    im[146] = t7;
+    t12 = X[37];
+    t0 = 0.992277912105967 * t12;
+    t2 = 0.12403445145048532 * t12;
+    t8 = X[82];
+    t4 = 0.9642111831703293 * t8;
+    t6 = (-0.265135426243408) * t8;
+    t5 = X[157];
+    t11 = 0.8692793239451436 * t5;
+    t10 = 0.4943212082861446 * t5;
+    t3 = t4 + t11;
+    t9 = t6 + t10;
+    t14 = t4 - t11;
+    t1 = t6 - t10;
+    t13 = t0 + t3;
+    t7 = t2 + t9;
+    t12 = t0 + t1;
+    t8 = t2 - t14;
+    t5 = t0 - t3;
+    t4 = t2 - t9;
+    t11 = t0 - t1;
+    t6 = t2 + t14;
+    t10 = t12 + t8;
+    t3 = C8 * t10;
+    t9 = t12 * (-C5);
+    t0 = t8 * (-C6);
+    t1 = t3 - t0;
+    t2 = t3 + t9;
+    t14 = t5 - t4;
+    t10 = t5 + t4;
+    t12 = (-C7) * t14;
+    t8 = (-C7) * t10;
+    t0 = t11 + t6;
+    t3 = (-C4) * t0;
+    t9 = t11 * C5;
+    t5 = t6 * (-C6);
+    t4 = t3 - t5;
+    t14 = t3 + t9;
+    re[221] = t13;
+    im[221] = t7;
+    re[41] = t1;
+    im[41] = t2;
+    re[101] = t12;
+    im[101] = t8;
+    re[161] = t4;
+    im[161] = t14;
+    t10 = re[176];
+    t0 = im[176];
+    t11 = re[191];
+    t6 = im[191];
+    t5 = re[206];
+    t3 = im[206];
+    t9 = re[221];
+    t13 = im[221];
+    t7 = t10 + t5;
+    t1 = t0 + t3;
+    t2 = t11 + t9;
+    t12 = t6 + t13;
+    t8 = t10 - t5;
+    t4 = t0 - t3;
+    t14 = t11 - t9;
+    t10 = t6 - t13;
+    t5 = t7 + t2;
+    t0 = t1 + t12;
+    t3 = t8 + t10;
+    t11 = t4 - t14;
+    t9 = t7 - t2;
+    t6 = t1 - t12;
+    t13 = t8 - t10;
+    t7 = t4 + t14;
+    re[176] = t5;
+    im[176] = t0;
+    re[191] = t3;
+    im[191] = t11;
+    re[206] = t9;
+    im[206] = t6;
+    re[221] = t13;
+    im[221] = t7;
+    t2 = re[236];
+    t1 = im[236];
+    t12 = re[11];
+    t8 = im[11];
+    t10 = re[26];
+    t4 = im[26];
+    t14 = re[41];
+    t5 = im[41];
+    t0 = t2 + t10;
+    t3 = t1 + t4;
+    t11 = t12 + t14;
+    t9 = t8 + t5;
+    t6 = t2 - t10;
+    t13 = t1 - t4;
+    t7 = t12 - t14;
+    t2 = t8 - t5;
+    t10 = t0 + t11;
+    t1 = t3 + t9;
+    t4 = t6 + t2;
+    t12 = t13 - t7;
+    t14 = t0 - t11;
+    t8 = t3 - t9;
+    t5 = t6 - t2;
+    t0 = t13 + t7;
+    re[236] = t10;
+    im[236] = t1;
+    re[11] = t4;
+    im[11] = t12;
+    re[26] = t14;
+    im[26] = t8;
+    re[41] = t5;
+    im[41] = t0;
+    t11 = re[56];
+    t3 = im[56];
+    t9 = re[71];
+    t6 = im[71];
+    t2 = re[86];
+    t13 = im[86];
+    t7 = re[101];
+    t10 = im[101];
+    t1 = t11 + t2;
+    t4 = t3 + t13;
+    t12 = t9 + t7;
+    t14 = t6 + t10;
+    t8 = t11 - t2;
+    t5 = t3 - t13;
+    t0 = t9 - t7;
+    t11 = t6 - t10;
+    t2 = t1 + t12;
+    t3 = t4 + t14;
+    t13 = t8 + t11;
+    t9 = t5 - t0;
+    t7 = t1 - t12;
+    t6 = t4 - t14;
+    t10 = t8 - t11;
+    t1 = t5 + t0;
+    re[56] = t2;
+    im[56] = t3;
+    re[71] = t13;
+    im[71] = t9;
+    re[86] = t7;
+    im[86] = t6;
+    re[101] = t10;
+    im[101] = t1;
+    t12 = re[116];
+    t4 = im[116];
+    t14 = re[131];
+    t8 = im[131];
+    t11 = re[146];
+    t5 = im[146];
+    t0 = re[161];
+    t2 = im[161];
+    t3 = t12 + t11;
+    t13 = t4 + t5;
+    t9 = t14 + t0;
+    t7 = t8 + t2;
+    t6 = t12 - t11;
+    t10 = t4 - t5;
+    t1 = t14 - t0;
+    t12 = t8 - t2;
+    t11 = t3 + t9;
+    t4 = t13 + t7;
+    t5 = t6 + t12;
+    t14 = t10 - t1;
+    t0 = t3 - t9;
+    t8 = t13 - t7;
+    t2 = t6 - t12;
+    t3 = t10 + t1;
+    re[116] = t11;
+    im[116] = t4;
+    re[131] = t5;
+    im[131] = t14;
+    re[146] = t0;
+    im[146] = t8;
+    re[161] = t2;
+    im[161] = t3;
+    t9 = X[31];
+    t13 = 0.9945218953682733 * t9;
+    t7 = 0.10452846326765346 * t9;
+    t6 = X[88];
+    t12 = 0.958819734868193 * t6;
+    t10 = (-0.2840153447039226) * t6;
+    t1 = X[151];
+    t11 = 0.8788171126619654 * t1;
+    t4 = 0.4771587602596084 * t1;
+    t5 = t12 + t11;
+    t14 = t10 + t4;
+    t0 = t12 - t11;
+    t8 = t10 - t4;
+    t2 = t13 + t5;
+    t3 = t7 + t14;
+    t9 = t13 + t8;
+    t6 = t7 - t0;
+    t1 = t13 - t5;
+    t12 = t7 - t14;
+    t11 = t13 - t8;
+    t10 = t7 + t0;
+    re[224] = t2;
+    im[224] = t3;
+    re[44] = t9;
+    im[44] = t6;
+    re[104] = t1;
+    im[104] = t12;
+    re[164] = t11;
+    im[164] = t10;
+    t4 = X[1];
+    t5 = 0.9999785816641292 * t4;
+    t14 = 0.006544937967351858 * t4;
+    t13 = X[118];
+    t8 = 0.9263643838751181 * t13;
+    t7 = (-0.3766285016932107) * t13;
+    t0 = X[121];
+    t2 = 0.9213551052231925 * t0;
+    t3 = 0.38872197015239557 * t0;
+    t9 = t8 + t2;
+    t6 = t7 + t3;
+    t1 = t8 - t2;
+    t12 = t7 - t3;
+    t11 = t5 + t9;
+    t10 = t14 + t6;
+    t4 = t5 + t12;
+    t13 = t14 - t1;
+    t0 = t5 - t9;
+    t8 = t14 - t6;
+    t2 = t5 - t12;
+    t7 = t14 + t1;
+    t3 = t4 + t13;
+    t9 = C4 * t3;
+    t6 = t4 * (-C5);
+    t5 = t13 * C6;
+    t12 = t9 - t5;
+    t14 = t9 + t6;
+    t1 = t0 + t8;
+    t3 = t0 - t8;
+    t4 = C7 * t1;
+    t13 = (-C7) * t3;
+    t5 = t2 + t7;
+    t9 = C8 * t5;
+    t6 = t2 * (-C5);
+    t0 = t7 * (-C6);
+    t8 = t9 - t0;
+    t1 = t9 + t6;
+    re[239] = t11;
+    im[239] = t10;
+    re[59] = t12;
+    im[59] = t14;
+    re[119] = t4;
+    im[119] = t13;
+    re[179] = t8;
+    im[179] = t1;
+    t3 = X[28];
+    t5 = 0.9958049275746618 * t3;
+    t2 = (-0.09150161866340238) * t3;
+    t7 = X[148];
+    t0 = 0.8849876374630419 * t7;
+    t9 = (-0.4656145203251114) * t7;
+    t6 = X[91];
+    t11 = 0.9550199444571866 * t6;
+    t10 = 0.296541574975571 * t6;
+    t12 = t0 + t11;
+    t14 = t9 + t10;
+    t4 = t0 - t11;
+    t13 = t9 - t10;
+    t8 = t5 + t12;
+    t1 = t2 + t14;
+    t3 = t5 + t13;
+    t7 = t2 - t4;
+    t6 = t5 - t12;
+    t0 = t2 - t14;
+    t11 = t5 - t13;
+    t9 = t2 + t4;
+    t10 = t3 + t7;
+    t12 = t3 - t7;
+    t14 = C7 * t10;
+    t5 = (-C7) * t12;
+    t13 = -t6;
+    t2 = t11 - t9;
+    t4 = t11 + t9;
+    t3 = (-C7) * t2;
+    t7 = (-C7) * t4;
+    re[14] = t8;
+    im[14] = t1;
+    re[74] = t14;
+    im[74] = t5;
+    re[134] = t0;
+    im[134] = t13;
+    re[194] = t3;
+    im[194] = t7;
+    t10 = X[58];
+    t12 = 0.9820411276703039 * t10;
+    t6 = (-0.18866696468655522) * t10;
+    t11 = X[61];
+    t9 = 0.9794874195590514 * t11;
+    t2 = 0.20150532232561713 * t11;
+    t4 = t12 + t9;
+    t8 = t6 + t2;
+    t1 = t12 - t2;
+    t14 = t6 + t9;
+    t5 = t12 - t9;
+    t0 = t6 - t2;
+    t13 = t12 + t2;
+    t3 = t6 - t9;
+    t7 = t1 + t14;
+    t10 = C8 * t7;
+    t11 = t1 * (-C5);
+    t12 = t14 * (-C6);
+    t2 = t10 - t12;
+    t6 = t10 + t11;
+    t9 = t5 - t0;
+    t7 = t5 + t0;
+    t1 = (-C7) * t9;
+    t14 = (-C7) * t7;
+    t12 = t13 + t3;
+    t10 = (-C4) * t12;
+    t11 = t13 * C5;
+    t5 = t3 * (-C6);
+    t0 = t10 - t5;
+    t9 = t10 + t11;
+    re[29] = t4;
+    im[29] = t8;
+    re[89] = t2;
+    im[89] = t6;
+    re[149] = t1;
+    im[149] = t14;
+    re[209] = t0;
+    im[209] = t9;
+    t7 = re[224];
+    t12 = im[224];
+    t13 = re[239];
+    t3 = im[239];
+    t5 = re[14];
+    t10 = im[14];
+    t11 = re[29];
+    t4 = im[29];
+    t8 = t7 + t5;
+    t2 = t12 + t10;
+    t6 = t13 + t11;
+    t1 = t3 + t4;
+    t14 = t7 - t5;
+    t0 = t12 - t10;
+    t9 = t13 - t11;
+    t7 = t3 - t4;
+    t5 = t8 + t6;
+    t12 = t2 + t1;
+    t10 = t14 + t7;
+    t13 = t0 - t9;
+    t11 = t8 - t6;
+    t3 = t2 - t1;
+    t4 = t14 - t7;
+    t8 = t0 + t9;
+    re[224] = t5;
+    im[224] = t12;
+    re[239] = t10;
+    im[239] = t13;
+    re[14] = t11;
+    im[14] = t3;
+    re[29] = t4;
+    im[29] = t8;
+    t6 = re[44];
+    t2 = im[44];
+    t1 = re[59];
+    t14 = im[59];
+    t7 = re[74];
+    t0 = im[74];
+    t9 = re[89];
+    t5 = im[89];
+    t12 = t6 + t7;
+    t10 = t2 + t0;
+    t13 = t1 + t9;
+    t11 = t14 + t5;
+    t3 = t6 - t7;
+    t4 = t2 - t0;
+    t8 = t1 - t9;
+    t6 = t14 - t5;
+    t7 = t12 + t13;
+    t2 = t10 + t11;
+    t0 = t3 + t6;
+    t1 = t4 - t8;
+    t9 = t12 - t13;
+    t14 = t10 - t11;
+    t5 = t3 - t6;
+    t12 = t4 + t8;
+    re[44] = t7;
+    im[44] = t2;
+    re[59] = t0;
+    im[59] = t1;
+    re[74] = t9;
+    im[74] = t14;
+    re[89] = t5;
+    im[89] = t12;
+    t13 = re[104];
+    t10 = im[104];
+    t11 = re[119];
+    t3 = im[119];
+    t6 = re[134];
+    t4 = im[134];
+    t8 = re[149];
+    t7 = im[149];
+    t2 = t13 + t6;
+    t0 = t10 + t4;
+    t1 = t11 + t8;
+    t9 = t3 + t7;
+    t14 = t13 - t6;
+    t5 = t10 - t4;
+    t12 = t11 - t8;
+    t13 = t3 - t7;
+    t6 = t2 + t1;
+    t10 = t0 + t9;
+    t4 = t14 + t13;
+    t11 = t5 - t12;
+    t8 = t2 - t1;
+    t3 = t0 - t9;
+    t7 = t14 - t13;
+    t2 = t5 + t12;
+    re[104] = t6;
+    im[104] = t10;
+    re[119] = t4;
+    im[119] = t11;
+    re[134] = t8;
+    im[134] = t3;
+    re[149] = t7;
+    im[149] = t2;
+    t1 = re[164];
+    t0 = im[164];
+    t9 = re[179];
+    t14 = im[179];
+    t13 = re[194];
+    t5 = im[194];
+    t12 = re[209];
+    t6 = im[209];
+    t10 = t1 + t13;
+    t4 = t0 + t5;
+    t11 = t9 + t12;
+    t8 = t14 + t6;
+    t3 = t1 - t13;
+    t7 = t0 - t5;
+    t2 = t9 - t12;
+    t1 = t14 - t6;
+    t13 = t10 + t11;
+    t0 = t4 + t8;
+    t5 = t3 + t1;
+    t9 = t7 - t2;
+    t12 = t10 - t11;
+    t14 = t4 - t8;
+    t6 = t3 - t1;
+    t10 = t7 + t2;
+    re[164] = t13;
+    im[164] = t0;
+    re[179] = t5;
+    im[179] = t9;
+    re[194] = t12;
+    im[194] = t14;
+    re[209] = t6;
+    im[209] = t10;
+    t11 = X[64];
+    t4 = 0.9781476007338057 * t11;
+    t8 = (-0.20791169081775931) * t11;
+    t3 = X[55];
+    t1 = 0.9832549075639546 * t3;
+    t7 = 0.18223552549214747 * t3;
+    t2 = t4 + t1;
+    t13 = t8 + t7;
+    t0 = t4 - t7;
+    t5 = t8 + t1;
+    t9 = t4 - t1;
+    t12 = t8 - t7;
+    t14 = t4 + t7;
+    t6 = t8 - t1;
+    re[32] = t2;
+    im[32] = t13;
+    re[92] = t0;
+    im[92] = t5;
+    re[152] = t9;
+    im[152] = t12;
+    re[212] = t14;
+    im[212] = t6;
+    t10 = X[94];
+    t11 = 0.953058643306297 * t10;
+    t3 = (-0.3027857698425746) * t10;
+    t4 = X[145];
+    t7 = 0.8880161006528073 * t4;
+    t8 = 0.45981235844785984 * t4;
+    t1 = X[25];
+    t2 = 0.9963824715083254 * t1;
+    t13 = 0.08498217737244167 * t1;
+    t0 = t11 + t7;
+    t5 = t3 + t8;
+    t9 = t11 - t7;
+    t12 = t3 - t8;
+    t14 = t0 + t2;
+    t6 = t5 + t13;
+    t10 = t9 - t13;
+    t4 = t12 + t2;
+    t1 = t0 - t2;
+    t11 = t5 - t13;
+    t7 = t9 + t13;
+    t3 = t12 - t2;
+    t8 = t10 + t4;
+    t0 = C4 * t8;
+    t5 = t10 * (-C5);
+    t9 = t4 * C6;
+    t13 = t0 - t9;
+    t12 = t0 + t5;
+    t2 = t1 + t11;
+    t8 = t1 - t11;
+    t10 = C7 * t2;
+    t4 = (-C7) * t8;
+    t9 = t7 + t3;
+    t0 = C8 * t9;
+    t5 = t7 * (-C5);
+    t1 = t3 * (-C6);
+    t11 = t0 - t1;
+    t2 = t0 + t5;
+    re[47] = t14;
+    im[47] = t6;
+    re[107] = t13;
+    im[107] = t12;
+    re[167] = t10;
+    im[167] = t4;
+    re[227] = t11;
+    im[227] = t2;
+    t8 = X[124];
+    t9 = 0.9187912101488983 * t8;
+    t7 = (-0.39474385638426723) * t8;
+    t3 = X[115];
+    t1 = 0.9288095528719242 * t3;
+    t0 = 0.3705574375098362 * t3;
+    t5 = X[4];
+    t14 = 0.999914327574007 * t5;
+    t6 = (-0.01308959557134444) * t5;
+    t13 = t9 + t1;
+    t12 = t7 + t0;
+    t10 = t9 - t1;
+    t4 = t7 - t0;
+    t11 = t13 + t14;
+    t2 = t12 + t6;
+    t8 = t10 - t6;
+    t3 = t4 + t14;
+    t5 = t13 - t14;
+    t9 = t12 - t6;
+    t1 = t10 + t6;
+    t7 = t4 - t14;
+    t0 = t8 + t3;
+    t13 = t8 - t3;
+    t12 = C7 * t0;
+    t10 = (-C7) * t13;
+    t6 = -t5;
+    t4 = t1 - t7;
+    t14 = t1 + t7;
+    t8 = (-C7) * t4;
+    t3 = (-C7) * t14;
+    re[62] = t11;
+    im[62] = t2;
+    re[122] = t12;
+    im[122] = t10;
+    re[182] = t9;
+    im[182] = t6;
+    re[2] = t8;
+    im[2] = t3;
+    t0 = X[154];
+    t13 = 0.8756753153753997 * t0;
+    t5 = (-0.4829003438000374) * t0;
+    t1 = X[85];
+    t7 = 0.9606580613579353 * t1;
+    t4 = 0.2777338458812922 * t1;
+    t14 = X[34];
+    t11 = 0.9938164620563781 * t14;
+    t2 = (-0.11103530855427768) * t14;
+    t12 = t13 + t7;
+    t10 = t5 + t4;
+    t9 = t13 - t7;
+    t6 = t5 - t4;
+    t8 = t12 + t11;
+    t3 = t10 + t2;
+    t0 = t9 - t2;
+    t1 = t6 + t11;
+    t14 = t12 - t11;
+    t13 = t10 - t2;
+    t7 = t9 + t2;
+    t5 = t6 - t11;
+    t4 = t0 + t1;
+    t12 = C8 * t4;
+    t10 = t0 * (-C5);
+    t9 = t1 * (-C6);
+    t2 = t12 - t9;
+    t6 = t12 + t10;
+    t11 = t14 - t13;
+    t4 = t14 + t13;
+    t0 = (-C7) * t11;
+    t1 = (-C7) * t4;
+    t9 = t7 + t5;
+    t12 = (-C4) * t9;
+    t10 = t7 * C5;
+    t14 = t5 * (-C6);
+    t13 = t12 - t14;
+    t11 = t12 + t10;
+    re[77] = t8;
+    im[77] = t3;
+    re[137] = t2;
+    im[137] = t6;
+    re[197] = t0;
+    im[197] = t1;
+    re[17] = t13;
+    im[17] = t11;
+    t4 = re[32];
+    t9 = im[32];
+    t7 = re[47];
+    t5 = im[47];
+    t14 = re[62];
+    t12 = im[62];
+    t10 = re[77];
+    t8 = im[77];
+    t3 = t4 + t14;
+    t2 = t9 + t12;
+    t6 = t7 + t10;
+    t0 = t5 + t8;
+    t1 = t4 - t14;
+    t13 = t9 - t12;
+    t11 = t7 - t10;
+    t4 = t5 - t8;
+    t14 = t3 + t6;
+    t9 = t2 + t0;
+    t12 = t1 + t4;
+    t7 = t13 - t11;
+    t10 = t3 - t6;
+    t5 = t2 - t0;
+    t8 = t1 - t4;
+    t3 = t13 + t11;
+    re[32] = t14;
+    im[32] = t9;
+    re[47] = t12;
+    im[47] = t7;
+    re[62] = t10;
+    im[62] = t5;
+    re[77] = t8;
+    im[77] = t3;
+    t6 = re[92];
+    t2 = im[92];
+    t0 = re[107];
+    t1 = im[107];
+    t4 = re[122];
+    t13 = im[122];
+    t11 = re[137];
+    t14 = im[137];
+    t9 = t6 + t4;
+    t12 = t2 + t13;
+    t7 = t0 + t11;
+    t10 = t1 + t14;
+    t5 = t6 - t4;
+    t8 = t2 - t13;
+    t3 = t0 - t11;
+    t6 = t1 - t14;
+    t4 = t9 + t7;
+    t2 = t12 + t10;
+    t13 = t5 + t6;
+    t0 = t8 - t3;
+    t11 = t9 - t7;
+    t1 = t12 - t10;
+    t14 = t5 - t6;
+    t9 = t8 + t3;
+    re[92] = t4;
+    im[92] = t2;
+    re[107] = t13;
+    im[107] = t0;
+    re[122] = t11;
+    im[122] = t1;
+    re[137] = t14;
+    im[137] = t9;
+    t7 = re[152];
+    t12 = im[152];
+    t10 = re[167];
+    t5 = im[167];
+    t6 = re[182];
+    t8 = im[182];
+    t3 = re[197];
+    t4 = im[197];
+    t2 = t7 + t6;
+    t13 = t12 + t8;
+    t0 = t10 + t3;
+    t11 = t5 + t4;
+    t1 = t7 - t6;
+    t14 = t12 - t8;
+    t9 = t10 - t3;
+    t7 = t5 - t4;
+    t6 = t2 + t0;
+    t12 = t13 + t11;
+    t8 = t1 + t7;
+    t10 = t14 - t9;
+    t3 = t2 - t0;
+    t5 = t13 - t11;
+    t4 = t1 - t7;
+    t2 = t14 + t9;
+    re[152] = t6;
+    im[152] = t12;
+    re[167] = t8;
+    im[167] = t10;
+    re[182] = t3;
+    im[182] = t5;
+    re[197] = t4;
+    im[197] = t2;
+    t0 = re[212];
+    t13 = im[212];
+    t11 = re[227];
+    t1 = im[227];
+    t7 = re[2];
+    t14 = im[2];
+    t9 = re[17];
+    t6 = im[17];
+    t12 = t0 + t7;
+    t8 = t13 + t14;
+    t10 = t11 + t9;
+    t3 = t1 + t6;
+    t5 = t0 - t7;
+    t4 = t13 - t14;
+    t2 = t11 - t9;
+    t0 = t1 - t6;
+    t7 = t12 + t10;
+    t13 = t8 + t3;
+    t14 = t5 + t0;
+    t11 = t4 - t2;
+    t9 = t12 - t10;
+    t1 = t8 - t3;
+    t6 = t5 - t0;
+    t12 = t4 + t2;
+    re[212] = t7;
+    im[212] = t13;
+    re[227] = t14;
+    im[227] = t11;
+    re[2] = t9;
+    im[2] = t1;
+    re[17] = t6;
+    im[17] = t12;
+    t10 = re[80];
+    t8 = im[80];
+    t3 = re[128];
+    t5 = im[128];
+    t0 = re[176];
+    t4 = im[176];
+    t2 = re[224];
+    t7 = im[224];
+    t13 = re[32];
+    t14 = im[32];
+    t11 = t3 + t13;
+    t9 = t5 + t14;
+    t1 = t0 + t2;
+    t6 = t4 + t7;
+    t12 = t3 - t13;
+    t3 = t5 - t14;
+    t13 = t0 - t2;
+    t5 = t4 - t7;
+    t14 = t11 + t1;
+    t0 = t9 + t6;
+    t2 = t11 - t1;
+    t4 = C0 * t2;
+    t7 = t9 - t6;
+    t11 = C0 * t7;
+    t1 = C1 * t14;
+    t2 = t10 - t1;
+    t9 = C1 * t0;
+    t6 = t8 - t9;
+    t7 = t2 + t4;
+    t1 = t6 + t11;
+    t9 = t2 - t4;
+    t2 = t6 - t11;
+    t4 = C2 * t12;
+    t6 = C3 * t13;
+    t11 = t4 + t6;
+    t4 = C2 * t3;
+    t6 = C3 * t5;
+    t4 = t4 + t6;
+    t6 = C3 * t12;
+    t12 = C2 * t13;
+    t13 = t6 - t12;
+    t6 = C3 * t3;
+    t12 = C2 * t5;
+    t3 = t6 - t12;
+    t5 = t10 + t14;
+    t6 = t8 + t0;
+    t12 = t7 + t4;
+    t10 = t1 - t11;
+    t14 = t9 + t3;
+    t8 = t2 - t13;
+    t0 = t9 - t3;
+    t9 = t2 + t13;
+    t3 = t7 - t4;
+    t2 = t1 + t11;
+    re[80] = t5;
+    im[80] = t6;
+    re[128] = t12;
+    im[128] = t10;
+    re[176] = t14;
+    im[176] = t8;
+    re[224] = t0;
+    im[224] = t9;
+    re[32] = t3;
+    im[32] = t2;
+    t13 = re[140];
+    t7 = im[140];
+    t4 = re[188];
+    t1 = im[188];
+    t11 = re[236];
+    t5 = im[236];
+    t6 = re[44];
+    t12 = im[44];
+    t10 = re[92];
+    t14 = im[92];
+    t8 = t4 + t10;
+    t0 = t1 + t14;
+    t9 = t11 + t6;
+    t3 = t5 + t12;
+    t2 = t4 - t10;
+    t4 = t1 - t14;
+    t10 = t11 - t6;
+    t1 = t5 - t12;
+    t14 = t8 + t9;
+    t11 = t0 + t3;
+    t6 = t8 - t9;
+    t5 = C0 * t6;
+    t12 = t0 - t3;
+    t8 = C0 * t12;
+    t9 = C1 * t14;
+    t6 = t13 - t9;
+    t0 = C1 * t11;
+    t3 = t7 - t0;
+    t12 = t6 + t5;
+    t9 = t3 + t8;
+    t0 = t6 - t5;
+    t6 = t3 - t8;
+    t5 = C2 * t2;
+    t3 = C3 * t10;
+    t8 = t5 + t3;
+    t5 = C2 * t4;
+    t3 = C3 * t1;
+    t5 = t5 + t3;
+    t3 = C3 * t2;
+    t2 = C2 * t10;
+    t10 = t3 - t2;
+    t3 = C3 * t4;
+    t2 = C2 * t1;
+    t4 = t3 - t2;
+    t1 = t13 + t14;
+    t3 = t7 + t11;
+    t2 = t12 + t5;
+    t13 = t9 - t8;
+    t14 = t0 + t4;
+    t7 = t6 - t10;
+    t11 = t0 - t4;
+    t0 = t6 + t10;
+    t4 = t12 - t5;
+    t6 = t9 + t8;
+    re[140] = t1;
+    im[140] = t3;
+    re[188] = t2;
+    im[188] = t13;
+    re[236] = t14;
+    im[236] = t7;
+    re[44] = t11;
+    im[44] = t0;
+    re[92] = t4;
+    im[92] = t6;
+}
+
+/**
+ *  Part 3 of ApplyWindowedIMDCT_W10_480_K160().
+ * 
+ *  @param {Number[]} X 
+ *    - The input block (480 points, only the first 160 points are used).
+ *  @param {Number[]} y 
+ *    - The array that would contain the output block (960 points).
+ *  @param {Number[]} re 
+ *    - The scratch buffer (real part, 240 points).
+ *  @param {Number[]} im 
+ *    - The scratch buffer (imaginary part, 240 points).
+ */
+function ApplyWindowedIMDCT_W10_480_K160_Part3(X, y, re, im) {
+    let t0, t1, t10, t11, t12, t13, t14, t2, t3, t4, t5, t6, t7, t8, t9;
+    const C0 = 0.5590169943749475;
+    const C1 = 0.25;
+    const C2 = 0.9510565162951535;
+    const C3 = 0.5877852522924731;
+    const C4 = 0.9238795325112867;
+    const C5 = 1.3065629648763766;
+    const C6 = 0.5411961001461969;
+    const C7 = 0.7071067811865476;
+    const C8 = 0.3826834323650898;
+    t10 = re[200];
+    t12 = im[200];
+    t5 = re[8];
+    t9 = im[8];
+    t8 = re[56];
+    t1 = im[56];
+    t3 = re[104];
+    t2 = im[104];
+    t13 = re[152];
+    t14 = im[152];
+    t7 = t5 + t13;
+    t11 = t9 + t14;
+    t0 = t8 + t3;
+    t4 = t1 + t2;
+    t6 = t5 - t13;
+    t5 = t9 - t14;
+    t13 = t8 - t3;
+    t9 = t1 - t2;
+    t14 = t7 + t0;
+    t8 = t11 + t4;
+    t3 = t7 - t0;
+    t1 = C0 * t3;
+    t2 = t11 - t4;
+    t7 = C0 * t2;
+    t0 = C1 * t14;
+    t3 = t10 - t0;
+    t11 = C1 * t8;
+    t4 = t12 - t11;
+    t2 = t3 + t1;
+    t0 = t4 + t7;
+    t11 = t3 - t1;
+    t3 = t4 - t7;
+    t1 = C2 * t6;
+    t4 = C3 * t13;
+    t7 = t1 + t4;
+    t1 = C2 * t5;
+    t4 = C3 * t9;
+    t1 = t1 + t4;
+    t4 = C3 * t6;
+    t6 = C2 * t13;
+    t13 = t4 - t6;
+    t4 = C3 * t5;
+    t6 = C2 * t9;
+    t5 = t4 - t6;
+    t9 = t10 + t14;
+    t4 = t12 + t8;
+    t6 = t2 + t1;
+    t10 = t0 - t7;
+    t14 = t11 + t5;
+    t12 = t3 - t13;
+    t8 = t11 - t5;
+    t11 = t3 + t13;
+    t5 = t2 - t1;
+    t3 = t0 + t7;
+    re[200] = t9;
+    im[200] = t4;
+    re[8] = t6;
+    im[8] = t10;
+    re[56] = t14;
+    im[56] = t12;
+    re[104] = t8;
+    im[104] = t11;
+    re[152] = t5;
+    im[152] = t3;
+    t13 = re[20];
+    t2 = im[20];
+    t1 = re[68];
+    t0 = im[68];
+    t7 = re[116];
+    t9 = im[116];
+    t4 = re[164];
+    t6 = im[164];
+    t10 = re[212];
+    t14 = im[212];
+    t12 = t1 + t10;
+    t8 = t0 + t14;
+    t11 = t7 + t4;
+    t5 = t9 + t6;
+    t3 = t1 - t10;
+    t1 = t0 - t14;
+    t10 = t7 - t4;
+    t0 = t9 - t6;
+    t14 = t12 + t11;
+    t7 = t8 + t5;
+    t4 = t12 - t11;
+    t9 = C0 * t4;
+    t6 = t8 - t5;
+    t12 = C0 * t6;
+    t11 = C1 * t14;
+    t4 = t13 - t11;
+    t8 = C1 * t7;
+    t5 = t2 - t8;
+    t6 = t4 + t9;
+    t11 = t5 + t12;
+    t8 = t4 - t9;
+    t4 = t5 - t12;
+    t9 = C2 * t3;
+    t5 = C3 * t10;
+    t12 = t9 + t5;
+    t9 = C2 * t1;
+    t5 = C3 * t0;
+    t9 = t9 + t5;
+    t5 = C3 * t3;
+    t3 = C2 * t10;
+    t10 = t5 - t3;
+    t5 = C3 * t1;
+    t3 = C2 * t0;
+    t1 = t5 - t3;
+    t0 = t13 + t14;
+    t5 = t2 + t7;
+    t3 = t6 + t9;
+    t13 = t11 - t12;
+    t14 = t8 + t1;
+    t2 = t4 - t10;
+    t7 = t8 - t1;
+    t8 = t4 + t10;
+    t1 = t6 - t9;
+    t4 = t11 + t12;
+    re[20] = t0;
+    im[20] = t5;
+    re[68] = t3;
+    im[68] = t13;
+    re[116] = t14;
+    im[116] = t2;
+    re[164] = t7;
+    im[164] = t8;
+    re[212] = t1;
+    im[212] = t4;
+    t10 = re[95];
+    t6 = im[95];
+    t9 = re[143];
+    t11 = im[143];
+    t12 = re[191];
+    t0 = im[191];
+    t5 = re[239];
+    t3 = im[239];
+    t13 = re[47];
+    t14 = im[47];
+    t2 = t9 + t13;
+    t7 = t11 + t14;
+    t8 = t12 + t5;
+    t1 = t0 + t3;
+    t4 = t9 - t13;
+    t9 = t11 - t14;
+    t13 = t12 - t5;
+    t11 = t0 - t3;
+    t14 = t2 + t8;
+    t12 = t7 + t1;
+    t5 = t2 - t8;
+    t0 = C0 * t5;
+    t3 = t7 - t1;
+    t2 = C0 * t3;
+    t8 = C1 * t14;
+    t5 = t10 - t8;
+    t7 = C1 * t12;
+    t1 = t6 - t7;
+    t3 = t5 + t0;
+    t8 = t1 + t2;
+    t7 = t5 - t0;
+    t5 = t1 - t2;
+    t0 = C2 * t4;
+    t1 = C3 * t13;
+    t2 = t0 + t1;
+    t0 = C2 * t9;
+    t1 = C3 * t11;
+    t0 = t0 + t1;
+    t1 = C3 * t4;
+    t4 = C2 * t13;
+    t13 = t1 - t4;
+    t1 = C3 * t9;
+    t4 = C2 * t11;
+    t9 = t1 - t4;
+    t11 = t10 + t14;
+    t1 = t6 + t12;
+    t4 = t3 + t0;
+    t10 = t8 - t2;
+    t14 = t7 + t9;
+    t6 = t5 - t13;
+    t12 = t7 - t9;
+    t7 = t5 + t13;
+    t9 = t3 - t0;
+    t5 = t8 + t2;
+    re[95] = t11;
+    im[95] = t1;
+    re[143] = t4;
+    im[143] = t10;
+    re[191] = t14;
+    im[191] = t6;
+    re[239] = t12;
+    im[239] = t7;
+    re[47] = t9;
+    im[47] = t5;
+    t13 = re[155];
+    t3 = im[155];
+    t0 = re[203];
+    t8 = im[203];
+    t2 = re[11];
+    t11 = im[11];
+    t1 = re[59];
+    t4 = im[59];
+    t10 = re[107];
+    t14 = im[107];
+    t6 = t0 + t10;
+    t12 = t8 + t14;
+    t7 = t2 + t1;
+    t9 = t11 + t4;
+    t5 = t0 - t10;
+    t0 = t8 - t14;
+    t10 = t2 - t1;
+    t8 = t11 - t4;
+    t14 = t6 + t7;
+    t2 = t12 + t9;
+    t1 = t6 - t7;
+    t11 = C0 * t1;
+    t4 = t12 - t9;
+    t6 = C0 * t4;
+    t7 = C1 * t14;
+    t1 = t13 - t7;
+    t12 = C1 * t2;
+    t9 = t3 - t12;
+    t4 = t1 + t11;
+    t7 = t9 + t6;
+    t12 = t1 - t11;
+    t1 = t9 - t6;
+    t11 = C2 * t5;
+    t9 = C3 * t10;
+    t6 = t11 + t9;
+    t11 = C2 * t0;
+    t9 = C3 * t8;
+    t11 = t11 + t9;
+    t9 = C3 * t5;
+    t5 = C2 * t10;
+    t10 = t9 - t5;
+    t9 = C3 * t0;
+    t5 = C2 * t8;
+    t0 = t9 - t5;
+    t8 = t13 + t14;
+    t9 = t3 + t2;
+    t5 = t4 + t11;
+    t13 = t7 - t6;
+    t14 = t12 + t0;
+    t3 = t1 - t10;
+    t2 = t12 - t0;
+    t12 = t1 + t10;
+    t0 = t4 - t11;
+    t1 = t7 + t6;
+    re[155] = t8;
+    im[155] = t9;
+    re[203] = t5;
+    im[203] = t13;
+    re[11] = t14;
+    im[11] = t3;
+    re[59] = t2;
+    im[59] = t12;
+    re[107] = t0;
+    im[107] = t1;
+    t10 = re[215];
+    t4 = im[215];
+    t11 = re[23];
+    t7 = im[23];
+    t6 = re[71];
+    t8 = im[71];
+    t9 = re[119];
+    t5 = im[119];
+    t13 = re[167];
+    t14 = im[167];
+    t3 = t11 + t13;
+    t2 = t7 + t14;
+    t12 = t6 + t9;
+    t0 = t8 + t5;
+    t1 = t11 - t13;
+    t11 = t7 - t14;
+    t13 = t6 - t9;
+    t7 = t8 - t5;
+    t14 = t3 + t12;
+    t6 = t2 + t0;
+    t9 = t3 - t12;
+    t8 = C0 * t9;
+    t5 = t2 - t0;
+    t3 = C0 * t5;
+    t12 = C1 * t14;
+    t9 = t10 - t12;
+    t2 = C1 * t6;
+    t0 = t4 - t2;
+    t5 = t9 + t8;
+    t12 = t0 + t3;
+    t2 = t9 - t8;
+    t9 = t0 - t3;
+    t8 = C2 * t1;
+    t0 = C3 * t13;
+    t3 = t8 + t0;
+    t8 = C2 * t11;
+    t0 = C3 * t7;
+    t8 = t8 + t0;
+    t0 = C3 * t1;
+    t1 = C2 * t13;
+    t13 = t0 - t1;
+    t0 = C3 * t11;
+    t1 = C2 * t7;
+    t11 = t0 - t1;
+    t7 = t10 + t14;
+    t0 = t4 + t6;
+    t1 = t5 + t8;
+    t10 = t12 - t3;
+    t14 = t2 + t11;
+    t4 = t9 - t13;
+    t6 = t2 - t11;
+    t2 = t9 + t13;
+    t11 = t5 - t8;
+    t9 = t12 + t3;
+    re[215] = t7;
+    im[215] = t0;
+    re[23] = t1;
+    im[23] = t10;
+    re[71] = t14;
+    im[71] = t4;
+    re[119] = t6;
+    im[119] = t2;
+    re[167] = t11;
+    im[167] = t9;
+    t13 = re[35];
+    t5 = im[35];
+    t8 = re[83];
+    t12 = im[83];
+    t3 = re[131];
+    t7 = im[131];
+    t0 = re[179];
+    t1 = im[179];
+    t10 = re[227];
+    t14 = im[227];
+    t4 = t8 + t10;
+    t6 = t12 + t14;
+    t2 = t3 + t0;
+    t11 = t7 + t1;
+    t9 = t8 - t10;
+    t8 = t12 - t14;
+    t10 = t3 - t0;
+    t12 = t7 - t1;
+    t14 = t4 + t2;
+    t3 = t6 + t11;
+    t0 = t4 - t2;
+    t7 = C0 * t0;
+    t1 = t6 - t11;
+    t4 = C0 * t1;
+    t2 = C1 * t14;
+    t0 = t13 - t2;
+    t6 = C1 * t3;
+    t11 = t5 - t6;
+    t1 = t0 + t7;
+    t2 = t11 + t4;
+    t6 = t0 - t7;
+    t0 = t11 - t4;
+    t7 = C2 * t9;
+    t11 = C3 * t10;
+    t4 = t7 + t11;
+    t7 = C2 * t8;
+    t11 = C3 * t12;
+    t7 = t7 + t11;
+    t11 = C3 * t9;
+    t9 = C2 * t10;
+    t10 = t11 - t9;
+    t11 = C3 * t8;
+    t9 = C2 * t12;
+    t8 = t11 - t9;
+    t12 = t13 + t14;
+    t11 = t5 + t3;
+    t9 = t1 + t7;
+    t13 = t2 - t4;
+    t14 = t6 + t8;
+    t5 = t0 - t10;
+    t3 = t6 - t8;
+    t6 = t0 + t10;
+    t8 = t1 - t7;
+    t0 = t2 + t4;
+    re[35] = t12;
+    im[35] = t11;
+    re[83] = t9;
+    im[83] = t13;
+    re[131] = t14;
+    im[131] = t5;
+    re[179] = t3;
+    im[179] = t6;
+    re[227] = t8;
+    im[227] = t0;
+    t10 = re[110];
+    t1 = im[110];
+    t7 = re[158];
+    t2 = im[158];
+    t4 = re[206];
+    t12 = im[206];
+    t11 = re[14];
+    t9 = im[14];
+    t13 = re[62];
+    t14 = im[62];
+    t5 = t7 + t13;
+    t3 = t2 + t14;
+    t6 = t4 + t11;
+    t8 = t12 + t9;
+    t0 = t7 - t13;
+    t7 = t2 - t14;
+    t13 = t4 - t11;
+    t2 = t12 - t9;
+    t14 = t5 + t6;
+    t4 = t3 + t8;
+    t11 = t5 - t6;
+    t12 = C0 * t11;
+    t9 = t3 - t8;
+    t5 = C0 * t9;
+    t6 = C1 * t14;
+    t11 = t10 - t6;
+    t3 = C1 * t4;
+    t8 = t1 - t3;
+    t9 = t11 + t12;
+    t6 = t8 + t5;
+    t3 = t11 - t12;
+    t11 = t8 - t5;
+    t12 = C2 * t0;
+    t8 = C3 * t13;
+    t5 = t12 + t8;
+    t12 = C2 * t7;
+    t8 = C3 * t2;
+    t12 = t12 + t8;
+    t8 = C3 * t0;
+    t0 = C2 * t13;
+    t13 = t8 - t0;
+    t8 = C3 * t7;
+    t0 = C2 * t2;
+    t7 = t8 - t0;
+    t2 = t10 + t14;
+    t8 = t1 + t4;
+    t0 = t9 + t12;
+    t10 = t6 - t5;
+    t14 = t3 + t7;
+    t1 = t11 - t13;
+    t4 = t3 - t7;
+    t3 = t11 + t13;
+    t7 = t9 - t12;
+    t11 = t6 + t5;
+    re[110] = t2;
+    im[110] = t8;
+    re[158] = t0;
+    im[158] = t10;
+    re[206] = t14;
+    im[206] = t1;
+    re[14] = t4;
+    im[14] = t3;
+    re[62] = t7;
+    im[62] = t11;
+    t13 = re[170];
+    t9 = im[170];
+    t12 = re[218];
+    t6 = im[218];
+    t5 = re[26];
+    t2 = im[26];
+    t8 = re[74];
+    t0 = im[74];
+    t10 = re[122];
+    t14 = im[122];
+    t1 = t12 + t10;
+    t4 = t6 + t14;
+    t3 = t5 + t8;
+    t7 = t2 + t0;
+    t11 = t12 - t10;
+    t12 = t6 - t14;
+    t10 = t5 - t8;
+    t6 = t2 - t0;
+    t14 = t1 + t3;
+    t5 = t4 + t7;
+    t8 = t1 - t3;
+    t2 = C0 * t8;
+    t0 = t4 - t7;
+    t1 = C0 * t0;
+    t3 = C1 * t14;
+    t8 = t13 - t3;
+    t4 = C1 * t5;
+    t7 = t9 - t4;
+    t0 = t8 + t2;
+    t3 = t7 + t1;
+    t4 = t8 - t2;
+    t8 = t7 - t1;
+    t2 = C2 * t11;
+    t7 = C3 * t10;
+    t1 = t2 + t7;
+    t2 = C2 * t12;
+    t7 = C3 * t6;
+    t2 = t2 + t7;
+    t7 = C3 * t11;
+    t11 = C2 * t10;
+    t10 = t7 - t11;
+    t7 = C3 * t12;
+    t11 = C2 * t6;
+    t12 = t7 - t11;
+    t6 = t13 + t14;
+    t7 = t9 + t5;
+    t11 = t0 + t2;
+    t13 = t3 - t1;
+    t14 = t4 + t12;
+    t9 = t8 - t10;
+    t5 = t4 - t12;
+    t4 = t8 + t10;
+    t12 = t0 - t2;
+    t8 = t3 + t1;
+    re[170] = t6;
+    im[170] = t7;
+    re[218] = t11;
+    im[218] = t13;
+    re[26] = t14;
+    im[26] = t9;
+    re[74] = t5;
+    im[74] = t4;
+    re[122] = t12;
+    im[122] = t8;
+    t10 = re[230];
+    t0 = im[230];
+    t2 = re[38];
+    t3 = im[38];
+    t1 = re[86];
+    t6 = im[86];
+    t7 = re[134];
+    t11 = im[134];
+    t13 = re[182];
+    t14 = im[182];
+    t9 = t2 + t13;
+    t5 = t3 + t14;
+    t4 = t1 + t7;
+    t12 = t6 + t11;
+    t8 = t2 - t13;
+    t2 = t3 - t14;
+    t13 = t1 - t7;
+    t3 = t6 - t11;
+    t14 = t9 + t4;
+    t1 = t5 + t12;
+    t7 = t9 - t4;
+    t6 = C0 * t7;
+    t11 = t5 - t12;
+    t9 = C0 * t11;
+    t4 = C1 * t14;
+    t7 = t10 - t4;
+    t5 = C1 * t1;
+    t12 = t0 - t5;
+    t11 = t7 + t6;
+    t4 = t12 + t9;
+    t5 = t7 - t6;
+    t7 = t12 - t9;
+    t6 = C2 * t8;
+    t12 = C3 * t13;
+    t9 = t6 + t12;
+    t6 = C2 * t2;
+    t12 = C3 * t3;
+    t6 = t6 + t12;
+    t12 = C3 * t8;
+    t8 = C2 * t13;
+    t13 = t12 - t8;
+    t12 = C3 * t2;
+    t8 = C2 * t3;
+    t2 = t12 - t8;
+    t3 = t10 + t14;
+    t12 = t0 + t1;
+    t8 = t11 + t6;
+    t10 = t4 - t9;
+    t14 = t5 + t2;
+    t0 = t7 - t13;
+    t1 = t5 - t2;
+    t5 = t7 + t13;
+    t2 = t11 - t6;
+    t7 = t4 + t9;
+    re[230] = t3;
+    im[230] = t12;
+    re[38] = t8;
+    im[38] = t10;
+    re[86] = t14;
+    im[86] = t0;
+    re[134] = t1;
+    im[134] = t5;
+    re[182] = t2;
+    im[182] = t7;
+    t13 = re[50];
+    t11 = im[50];
+    t6 = re[98];
+    t4 = im[98];
+    t9 = re[146];
+    t3 = im[146];
+    t12 = re[194];
+    t8 = im[194];
+    t10 = re[2];
+    t14 = im[2];
+    t0 = t6 + t10;
+    t1 = t4 + t14;
+    t5 = t9 + t12;
+    t2 = t3 + t8;
+    t7 = t6 - t10;
+    t6 = t4 - t14;
+    t10 = t9 - t12;
+    t4 = t3 - t8;
+    t14 = t0 + t5;
+    t9 = t1 + t2;
+    t12 = t0 - t5;
+    t3 = C0 * t12;
+    t8 = t1 - t2;
+    t0 = C0 * t8;
+    t5 = C1 * t14;
+    t12 = t13 - t5;
+    t1 = C1 * t9;
+    t2 = t11 - t1;
+    t8 = t12 + t3;
+    t5 = t2 + t0;
+    t1 = t12 - t3;
+    t12 = t2 - t0;
+    t3 = C2 * t7;
+    t2 = C3 * t10;
+    t0 = t3 + t2;
+    t3 = C2 * t6;
+    t2 = C3 * t4;
+    t3 = t3 + t2;
+    t2 = C3 * t7;
+    t7 = C2 * t10;
+    t10 = t2 - t7;
+    t2 = C3 * t6;
+    t7 = C2 * t4;
+    t6 = t2 - t7;
+    t4 = t13 + t14;
+    t2 = t11 + t9;
+    t7 = t8 + t3;
+    t13 = t5 - t0;
+    t14 = t1 + t6;
+    t11 = t12 - t10;
+    t9 = t1 - t6;
+    t1 = t12 + t10;
+    t6 = t8 - t3;
+    t12 = t5 + t0;
+    re[50] = t4;
+    im[50] = t2;
+    re[98] = t7;
+    im[98] = t13;
+    re[146] = t14;
+    im[146] = t11;
+    re[194] = t9;
+    im[194] = t1;
+    re[2] = t6;
+    im[2] = t12;
+    t10 = re[125];
+    t8 = im[125];
+    t3 = re[173];
+    t5 = im[173];
+    t0 = re[221];
+    t4 = im[221];
+    t2 = re[29];
+    t7 = im[29];
+    t13 = re[77];
+    t14 = im[77];
+    t11 = t3 + t13;
+    t9 = t5 + t14;
+    t1 = t0 + t2;
+    t6 = t4 + t7;
+    t12 = t3 - t13;
+    t3 = t5 - t14;
+    t13 = t0 - t2;
+    t5 = t4 - t7;
+    t14 = t11 + t1;
+    t0 = t9 + t6;
+    t2 = t11 - t1;
+    t4 = C0 * t2;
+    t7 = t9 - t6;
+    t11 = C0 * t7;
+    t1 = C1 * t14;
+    t2 = t10 - t1;
+    t9 = C1 * t0;
+    t6 = t8 - t9;
+    t7 = t2 + t4;
+    t1 = t6 + t11;
+    t9 = t2 - t4;
+    t2 = t6 - t11;
+    t4 = C2 * t12;
+    t6 = C3 * t13;
+    t11 = t4 + t6;
+    t4 = C2 * t3;
+    t6 = C3 * t5;
+    t4 = t4 + t6;
+    t6 = C3 * t12;
+    t12 = C2 * t13;
+    t13 = t6 - t12;
+    t6 = C3 * t3;
+    t12 = C2 * t5;
+    t3 = t6 - t12;
+    t5 = t10 + t14;
+    t6 = t8 + t0;
+    t12 = t7 + t4;
+    t10 = t1 - t11;
+    t14 = t9 + t3;
+    t8 = t2 - t13;
+    t0 = t9 - t3;
+    t9 = t2 + t13;
+    t3 = t7 - t4;
+    t2 = t1 + t11;
+    re[125] = t5;
+    im[125] = t6;
+    re[173] = t12;
+    im[173] = t10;
+    re[221] = t14;
+    im[221] = t8;
+    re[29] = t0;
+    im[29] = t9;
+    re[77] = t3;
+    im[77] = t2;
+    t13 = re[185];
+    t7 = im[185];
+    t4 = re[233];
+    t1 = im[233];
+    t11 = re[41];
+    t5 = im[41];
+    t6 = re[89];
+    t12 = im[89];
+    t10 = re[137];
+    t14 = im[137];
+    t8 = t4 + t10;
+    t0 = t1 + t14;
+    t9 = t11 + t6;
+    t3 = t5 + t12;
+    t2 = t4 - t10;
+    t4 = t1 - t14;
+    t10 = t11 - t6;
+    t1 = t5 - t12;
+    t14 = t8 + t9;
+    t11 = t0 + t3;
+    t6 = t8 - t9;
+    t5 = C0 * t6;
+    t12 = t0 - t3;
+    t8 = C0 * t12;
+    t9 = C1 * t14;
+    t6 = t13 - t9;
+    t0 = C1 * t11;
+    t3 = t7 - t0;
+    t12 = t6 + t5;
+    t9 = t3 + t8;
+    t0 = t6 - t5;
+    t6 = t3 - t8;
+    t5 = C2 * t2;
+    t3 = C3 * t10;
+    t8 = t5 + t3;
+    t5 = C2 * t4;
+    t3 = C3 * t1;
+    t5 = t5 + t3;
+    t3 = C3 * t2;
+    t2 = C2 * t10;
+    t10 = t3 - t2;
+    t3 = C3 * t4;
+    t2 = C2 * t1;
+    t4 = t3 - t2;
+    t1 = t13 + t14;
+    t3 = t7 + t11;
+    t2 = t12 + t5;
+    t13 = t9 - t8;
+    t14 = t0 + t4;
+    t7 = t6 - t10;
+    t11 = t0 - t4;
+    t0 = t6 + t10;
+    t4 = t12 - t5;
+    t6 = t9 + t8;
+    re[185] = t1;
+    im[185] = t3;
+    re[233] = t2;
+    im[233] = t13;
+    re[41] = t14;
+    im[41] = t7;
+    re[89] = t11;
+    im[89] = t0;
+    re[137] = t4;
+    im[137] = t6;
+    t10 = re[5];
+    t12 = im[5];
+    t5 = re[53];
+    t9 = im[53];
+    t8 = re[101];
+    t1 = im[101];
+    t3 = re[149];
+    t2 = im[149];
+    t13 = re[197];
+    t14 = im[197];
+    t7 = t5 + t13;
+    t11 = t9 + t14;
+    t0 = t8 + t3;
+    t4 = t1 + t2;
+    t6 = t5 - t13;
+    t5 = t9 - t14;
+    t13 = t8 - t3;
+    t9 = t1 - t2;
+    t14 = t7 + t0;
+    t8 = t11 + t4;
+    t3 = t7 - t0;
+    t1 = C0 * t3;
+    t2 = t11 - t4;
+    t7 = C0 * t2;
+    t0 = C1 * t14;
+    t3 = t10 - t0;
+    t11 = C1 * t8;
+    t4 = t12 - t11;
+    t2 = t3 + t1;
+    t0 = t4 + t7;
+    t11 = t3 - t1;
+    t3 = t4 - t7;
+    t1 = C2 * t6;
+    t4 = C3 * t13;
+    t7 = t1 + t4;
+    t1 = C2 * t5;
+    t4 = C3 * t9;
+    t1 = t1 + t4;
+    t4 = C3 * t6;
+    t6 = C2 * t13;
+    t13 = t4 - t6;
+    t4 = C3 * t5;
+    t6 = C2 * t9;
+    t5 = t4 - t6;
+    t9 = t10 + t14;
+    t4 = t12 + t8;
+    t6 = t2 + t1;
+    t10 = t0 - t7;
+    t14 = t11 + t5;
+    t12 = t3 - t13;
+    t8 = t11 - t5;
+    t11 = t3 + t13;
+    t5 = t2 - t1;
+    t3 = t0 + t7;
+    re[5] = t9;
+    im[5] = t4;
+    re[53] = t6;
+    im[53] = t10;
+    re[101] = t14;
+    im[101] = t12;
+    re[149] = t8;
+    im[149] = t11;
+    re[197] = t5;
+    im[197] = t3;
+    t13 = re[65];
+    t2 = im[65];
+    t1 = re[113];
+    t0 = im[113];
+    t7 = re[161];
+    t9 = im[161];
+    t4 = re[209];
+    t6 = im[209];
+    t10 = re[17];
+    t14 = im[17];
+    t12 = t1 + t10;
+    t8 = t0 + t14;
+    t11 = t7 + t4;
+    t5 = t9 + t6;
+    t3 = t1 - t10;
+    t1 = t0 - t14;
+    t10 = t7 - t4;
+    t0 = t9 - t6;
+    t14 = t12 + t11;
+    t7 = t8 + t5;
+    t4 = t12 - t11;
+    t9 = C0 * t4;
+    t6 = t8 - t5;
+    t12 = C0 * t6;
+    t11 = C1 * t14;
+    t4 = t13 - t11;
+    t8 = C1 * t7;
+    t5 = t2 - t8;
+    t6 = t4 + t9;
+    t11 = t5 + t12;
+    t8 = t4 - t9;
+    t4 = t5 - t12;
+    t9 = C2 * t3;
+    t5 = C3 * t10;
+    t12 = t9 + t5;
+    t9 = C2 * t1;
+    t5 = C3 * t0;
+    t9 = t9 + t5;
+    t5 = C3 * t3;
+    t3 = C2 * t10;
+    t10 = t5 - t3;
+    t5 = C3 * t1;
+    t3 = C2 * t0;
+    t1 = t5 - t3;
+    t0 = t13 + t14;
+    t5 = t2 + t7;
+    t3 = t6 + t9;
+    t13 = t11 - t12;
+    t14 = t8 + t1;
+    t2 = t4 - t10;
+    t7 = t8 - t1;
+    t8 = t4 + t10;
+    t1 = t6 - t9;
+    t4 = t11 + t12;
+    re[65] = t0;
+    im[65] = t5;
+    re[113] = t3;
+    im[113] = t13;
+    re[161] = t14;
+    im[161] = t2;
+    re[209] = t7;
+    im[209] = t8;
+    re[17] = t1;
+    im[17] = t4;
+    t10 = X[159];
+    t6 = 0.8660254037844387 * t10;
+    t9 = 0.49999999999999994 * t10;
+    t11 = X[39];
+    t12 = 0.9914448613738104 * t11;
+    t0 = 0.13052619222005157 * t11;
+    t5 = X[80];
+    t3 = 0.9659258262890683 * t5;
+    t13 = (-0.25881904510252074) * t5;
+    t14 = t6 + t3;
+    t2 = t9 + t13;
+    t7 = t6 - t3;
+    t8 = t9 - t13;
+    t1 = t14 + t12;
+    t4 = t2 + t0;
+    t10 = t7 + t0;
+    t11 = t8 - t12;
+    t5 = t14 - t12;
+    t6 = t2 - t0;
+    t3 = t7 - t0;
+    t9 = t8 + t12;
+    re[160] = t1;
+    im[160] = t4;
+    re[220] = t10;
+    im[220] = t11;
+    re[40] = t5;
+    im[40] = t6;
+    re[100] = t3;
+    im[100] = t9;
+    t13 = X[129];
+    t14 = 0.9108638249211758 * t13;
+    t2 = 0.41270702980439467 * t13;
+    t7 = X[9];
+    t0 = 0.9994645874763657 * t7;
+    t8 = 0.03271908282177614 * t7;
+    t12 = X[110];
+    t1 = 0.9359059267573258 * t12;
+    t4 = (-0.3522500479212335) * t12;
+    t10 = t14 + t1;
+    t11 = t2 + t4;
+    t5 = t14 - t1;
+    t6 = t2 - t4;
+    t3 = t10 + t0;
+    t9 = t11 + t8;
+    t13 = t5 + t8;
+    t7 = t6 - t0;
+    t12 = t10 - t0;
+    t14 = t11 - t8;
+    t1 = t5 - t8;
+    t2 = t6 + t0;
+    t4 = t13 + t7;
+    t10 = C4 * t4;
+    t11 = t13 * (-C5);
+    t5 = t7 * C6;
+    t8 = t10 - t5;
+    t6 = t10 + t11;
+    t0 = t12 + t14;
+    t4 = t12 - t14;
+    t13 = C7 * t0;
+    t7 = (-C7) * t4;
+    t5 = t1 + t2;
+    t10 = C8 * t5;
+    t11 = t1 * (-C5);
+    t12 = t2 * (-C6);
+    t14 = t10 - t12;
+    t0 = t10 + t11;
+    re[175] = t3;
+    im[175] = t9;
+    re[235] = t8;
+    im[235] = t6;
+    re[55] = t13;
+    im[55] = t7;
+    re[115] = t14;
+    im[115] = t0;
+    t4 = X[99];
+    t5 = 0.9469301294951057 * t4;
+    t1 = 0.3214394653031616 * t4;
+    t2 = X[20];
+    t12 = 0.9978589232386035 * t2;
+    t10 = (-0.06540312923014306) * t2;
+    t11 = X[140];
+    t3 = 0.8968727415326883 * t11;
+    t9 = (-0.4422886902190013) * t11;
+    t8 = t5 + t3;
+    t6 = t1 + t9;
+    t13 = t5 - t3;
+    t7 = t1 - t9;
+    t14 = t8 + t12;
+    t0 = t6 + t10;
+    t4 = t13 + t10;
+    t2 = t7 - t12;
+    t11 = t8 - t12;
+    t5 = t6 - t10;
+    t3 = t13 - t10;
+    t1 = t7 + t12;
+    t9 = t4 + t2;
+    t8 = t4 - t2;
+    t6 = C7 * t9;
+    t13 = (-C7) * t8;
+    t10 = -t11;
+    t7 = t3 - t1;
+    t12 = t3 + t1;
+    t4 = (-C7) * t7;
+    t2 = (-C7) * t12;
+    re[190] = t14;
+    im[190] = t0;
+    re[10] = t6;
+    im[10] = t13;
+    re[70] = t5;
+    im[70] = t10;
+    re[130] = t4;
+    im[130] = t2;
+    t9 = X[69];
+    t8 = 0.9738769792773336 * t9;
+    t11 = 0.22707626303437323 * t9;
+    t3 = X[50];
+    t1 = 0.986643332084879 * t3;
+    t7 = (-0.16289547339458874) * t3;
+    t12 = t8 + t1;
+    t14 = t11 + t7;
+    t0 = t8 + t7;
+    t6 = t11 - t1;
+    t13 = t8 - t1;
+    t5 = t11 - t7;
+    t10 = t8 - t7;
+    t4 = t11 + t1;
+    t2 = t0 + t6;
+    t9 = C8 * t2;
+    t3 = t0 * (-C5);
+    t8 = t6 * (-C6);
+    t7 = t9 - t8;
+    t11 = t9 + t3;
+    t1 = t13 - t5;
+    t2 = t13 + t5;
+    t0 = (-C7) * t1;
+    t6 = (-C7) * t2;
+    t8 = t10 + t4;
+    t9 = (-C4) * t8;
+    t3 = t10 * C5;
+    t13 = t4 * (-C6);
+    t5 = t9 - t13;
+    t1 = t9 + t3;
+    re[205] = t12;
+    im[205] = t14;
+    re[25] = t7;
+    im[25] = t11;
+    re[85] = t0;
+    im[85] = t6;
+    re[145] = t5;
+    im[145] = t1;
+    t2 = re[160];
+    t8 = im[160];
+    t10 = re[175];
+    t4 = im[175];
+    t13 = re[190];
+    t9 = im[190];
+    t3 = re[205];
+    t12 = im[205];
+    t14 = t2 + t13;
+    t7 = t8 + t9;
+    t11 = t10 + t3;
+    t0 = t4 + t12;
+    t6 = t2 - t13;
+    t5 = t8 - t9;
+    t1 = t10 - t3;
+    t2 = t4 - t12;
+    t13 = t14 + t11;
+    t8 = t7 + t0;
+    t9 = t6 + t2;
+    t10 = t5 - t1;
+    t3 = t14 - t11;
+    t4 = t7 - t0;
+    t12 = t6 - t2;
+    t14 = t5 + t1;
+    re[160] = t13;
+    im[160] = t8;
+    re[175] = t9;
+    im[175] = t10;
+    re[190] = t3;
+    im[190] = t4;
+    re[205] = t12;
+    im[205] = t14;
+    t11 = re[220];
+    t7 = im[220];
+    t0 = re[235];
+    t6 = im[235];
+    t2 = re[10];
+    t5 = im[10];
+    t1 = re[25];
+    t13 = im[25];
+    t8 = t11 + t2;
+    t9 = t7 + t5;
+    t10 = t0 + t1;
+    t3 = t6 + t13;
+    t4 = t11 - t2;
+    t12 = t7 - t5;
+    t14 = t0 - t1;
+    t11 = t6 - t13;
+    t2 = t8 + t10;
+    t7 = t9 + t3;
+    t5 = t4 + t11;
+    t0 = t12 - t14;
+    t1 = t8 - t10;
+    t6 = t9 - t3;
+    t13 = t4 - t11;
+    t8 = t12 + t14;
+    re[220] = t2;
+    im[220] = t7;
+    re[235] = t5;
+    im[235] = t0;
+    re[10] = t1;
+    im[10] = t6;
+    re[25] = t13;
+    im[25] = t8;
+    t10 = re[40];
+    t9 = im[40];
+    t3 = re[55];
+    t4 = im[55];
+    t11 = re[70];
+    t12 = im[70];
+    t14 = re[85];
+    t2 = im[85];
+    t7 = t10 + t11;
+    t5 = t9 + t12;
+    t0 = t3 + t14;
+    t1 = t4 + t2;
+    t6 = t10 - t11;
+    t13 = t9 - t12;
+    t8 = t3 - t14;
+    t10 = t4 - t2;
+    t11 = t7 + t0;
+    t9 = t5 + t1;
+    t12 = t6 + t10;
+    t3 = t13 - t8;
+    t14 = t7 - t0;
+    t4 = t5 - t1;
+    t2 = t6 - t10;
+    t7 = t13 + t8;
+    re[40] = t11;
+    im[40] = t9;
+    re[55] = t12;
+    im[55] = t3;
+    re[70] = t14;
+    im[70] = t4;
+    re[85] = t2;
+    im[85] = t7;
+    t0 = re[100];
+    t5 = im[100];
+    t1 = re[115];
+    t6 = im[115];
+    t10 = re[130];
+    t13 = im[130];
+    t8 = re[145];
+    t11 = im[145];
+    t9 = t0 + t10;
+    t12 = t5 + t13;
+    t3 = t1 + t8;
+    t14 = t6 + t11;
+    t4 = t0 - t10;
+    t2 = t5 - t13;
+    t7 = t1 - t8;
+    t0 = t6 - t11;
+    t10 = t9 + t3;
+    t5 = t12 + t14;
+    t13 = t4 + t0;
+    t1 = t2 - t7;
+    t8 = t9 - t3;
+    t6 = t12 - t14;
+    t11 = t4 - t0;
+    t9 = t2 + t7;
+    re[100] = t10;
+    im[100] = t5;
+    re[115] = t13;
+    im[115] = t1;
+    re[130] = t8;
+    im[130] = t6;
+    re[145] = t11;
+    im[145] = t9;
+    t3 = X[63];
+    t12 = 0.9781476007338057 * t3;
+    t14 = 0.20791169081775931 * t3;
+    t4 = X[56];
+    t0 = 0.9832549075639546 * t4;
+    t2 = (-0.18223552549214747) * t4;
+    t7 = t12 + t0;
+    t10 = t14 + t2;
+    t5 = t12 + t2;
+    t13 = t14 - t0;
+    t1 = t12 - t0;
+    t8 = t14 - t2;
+    t6 = t12 - t2;
+    t11 = t14 + t0;
+    re[208] = t7;
+    im[208] = t10;
+    re[28] = t5;
+    im[28] = t13;
+    re[88] = t1;
+    im[88] = t8;
+    re[148] = t6;
+    im[148] = t11;
+    t9 = X[33];
+    t3 = 0.9938164620563781 * t9;
+    t4 = 0.11103530855427768 * t9;
+    t12 = X[86];
+    t2 = 0.9606580613579353 * t12;
+    t14 = (-0.2777338458812922) * t12;
+    t0 = X[153];
+    t7 = 0.8756753153753997 * t0;
+    t10 = 0.4829003438000374 * t0;
+    t5 = t2 + t7;
+    t13 = t14 + t10;
+    t1 = t2 - t7;
+    t8 = t14 - t10;
+    t6 = t3 + t5;
+    t11 = t4 + t13;
+    t9 = t3 + t8;
+    t12 = t4 - t1;
+    t0 = t3 - t5;
+    t2 = t4 - t13;
+    t7 = t3 - t8;
+    t14 = t4 + t1;
+    t10 = t9 + t12;
+    t5 = C4 * t10;
+    t13 = t9 * (-C5);
+    t3 = t12 * C6;
+    t8 = t5 - t3;
+    t4 = t5 + t13;
+    t1 = t0 + t2;
+    t10 = t0 - t2;
+    t9 = C7 * t1;
+    t12 = (-C7) * t10;
+    t3 = t7 + t14;
+    t5 = C8 * t3;
+    t13 = t7 * (-C5);
+    t0 = t14 * (-C6);
+    t2 = t5 - t0;
+    t1 = t5 + t13;
+    re[223] = t6;
+    im[223] = t11;
+    re[43] = t8;
+    im[43] = t4;
+    re[103] = t9;
+    im[103] = t12;
+    re[163] = t2;
+    im[163] = t1;
+    t10 = X[3];
+    t3 = 0.999914327574007 * t10;
+    t7 = 0.01308959557134444 * t10;
+    t14 = X[116];
+    t0 = 0.9288095528719242 * t14;
+    t5 = (-0.3705574375098362) * t14;
+    t13 = X[123];
+    t6 = 0.9187912101488983 * t13;
+    t11 = 0.39474385638426723 * t13;
+    t8 = t0 + t6;
+    t4 = t5 + t11;
+    t9 = t0 - t6;
+    t12 = t5 - t11;
+    t2 = t3 + t8;
+    t1 = t7 + t4;
+    t10 = t3 + t12;
+    t14 = t7 - t9;
+    t13 = t3 - t8;
+    t0 = t7 - t4;
+    t6 = t3 - t12;
+    t5 = t7 + t9;
+    t11 = t10 + t14;
+    t8 = t10 - t14;
+    t4 = C7 * t11;
+    t3 = (-C7) * t8;
+    t12 = -t13;
+    t7 = t6 - t5;
+    t9 = t6 + t5;
+    t10 = (-C7) * t7;
+    t14 = (-C7) * t9;
+    re[238] = t2;
+    im[238] = t1;
+    re[58] = t4;
+    im[58] = t3;
+    re[118] = t0;
+    im[118] = t12;
+    re[178] = t10;
+    im[178] = t14;
+    t11 = X[26];
+    t8 = 0.9963824715083254 * t11;
+    t13 = (-0.08498217737244167) * t11;
+    t6 = X[146];
+    t5 = 0.8880161006528073 * t6;
+    t7 = (-0.45981235844785984) * t6;
+    t9 = X[93];
+    t2 = 0.953058643306297 * t9;
+    t1 = 0.3027857698425746 * t9;
+    t4 = t5 + t2;
+    t3 = t7 + t1;
+    t0 = t5 - t2;
+    t12 = t7 - t1;
+    t10 = t8 + t4;
+    t14 = t13 + t3;
+    t11 = t8 + t12;
+    t6 = t13 - t0;
+    t9 = t8 - t4;
+    t5 = t13 - t3;
+    t2 = t8 - t12;
+    t7 = t13 + t0;
+    t1 = t11 + t6;
+    t4 = C8 * t1;
+    t3 = t11 * (-C5);
+    t8 = t6 * (-C6);
+    t12 = t4 - t8;
+    t13 = t4 + t3;
+    t0 = t9 - t5;
+    t1 = t9 + t5;
+    t11 = (-C7) * t0;
+    t6 = (-C7) * t1;
+    t8 = t2 + t7;
+    t4 = (-C4) * t8;
+    t3 = t2 * C5;
+    t9 = t7 * (-C6);
+    t5 = t4 - t9;
+    t0 = t4 + t3;
+    re[13] = t10;
+    im[13] = t14;
+    re[73] = t12;
+    im[73] = t13;
+    re[133] = t11;
+    im[133] = t6;
+    re[193] = t5;
+    im[193] = t0;
+    t1 = re[208];
+    t8 = im[208];
+    t2 = re[223];
+    t7 = im[223];
+    t9 = re[238];
+    t4 = im[238];
+    t3 = re[13];
+    t10 = im[13];
+    t14 = t1 + t9;
+    t12 = t8 + t4;
+    t13 = t2 + t3;
+    t11 = t7 + t10;
+    t6 = t1 - t9;
+    t5 = t8 - t4;
+    t0 = t2 - t3;
+    t1 = t7 - t10;
+    t9 = t14 + t13;
+    t8 = t12 + t11;
+    t4 = t6 + t1;
+    t2 = t5 - t0;
+    t3 = t14 - t13;
+    t7 = t12 - t11;
+    t10 = t6 - t1;
+    t14 = t5 + t0;
+    re[208] = t9;
+    im[208] = t8;
+    re[223] = t4;
+    im[223] = t2;
+    re[238] = t3;
+    im[238] = t7;
+    re[13] = t10;
+    im[13] = t14;
+    t13 = re[28];
+    t12 = im[28];
+    t11 = re[43];
+    t6 = im[43];
+    t1 = re[58];
+    t5 = im[58];
+    t0 = re[73];
+    t9 = im[73];
+    t8 = t13 + t1;
+    t4 = t12 + t5;
+    t2 = t11 + t0;
+    t3 = t6 + t9;
+    t7 = t13 - t1;
+    t10 = t12 - t5;
+    t14 = t11 - t0;
+    t13 = t6 - t9;
+    t1 = t8 + t2;
+    t12 = t4 + t3;
+    t5 = t7 + t13;
+    t11 = t10 - t14;
+    t0 = t8 - t2;
+    t6 = t4 - t3;
+    t9 = t7 - t13;
+    t8 = t10 + t14;
+    re[28] = t1;
+    im[28] = t12;
+    re[43] = t5;
+    im[43] = t11;
+    re[58] = t0;
+    im[58] = t6;
+    re[73] = t9;
+    im[73] = t8;
+    t2 = re[88];
+    t4 = im[88];
+    t3 = re[103];
+    t7 = im[103];
+    t13 = re[118];
+    t10 = im[118];
+    t14 = re[133];
+    t1 = im[133];
+    t12 = t2 + t13;
+    t5 = t4 + t10;
+    t11 = t3 + t14;
+    t0 = t7 + t1;
+    t6 = t2 - t13;
+    t9 = t4 - t10;
+    t8 = t3 - t14;
+    t2 = t7 - t1;
+    t13 = t12 + t11;
+    t4 = t5 + t0;
+    t10 = t6 + t2;
+    t3 = t9 - t8;
+    t14 = t12 - t11;
+    t7 = t5 - t0;
+    t1 = t6 - t2;
+    t12 = t9 + t8;
+    re[88] = t13;
+    im[88] = t4;
+    re[103] = t10;
+    im[103] = t3;
+    re[118] = t14;
+    im[118] = t7;
+    re[133] = t1;
+    im[133] = t12;
+    t11 = re[148];
+    t5 = im[148];
+    t0 = re[163];
+    t6 = im[163];
+    t2 = re[178];
+    t9 = im[178];
+    t8 = re[193];
+    t13 = im[193];
+    t4 = t11 + t2;
+    t10 = t5 + t9;
+    t3 = t0 + t8;
+    t14 = t6 + t13;
+    t7 = t11 - t2;
+    t1 = t5 - t9;
+    t12 = t0 - t8;
+    t11 = t6 - t13;
+    t2 = t4 + t3;
+    t5 = t10 + t14;
+    t9 = t7 + t11;
+    t0 = t1 - t12;
+    t8 = t4 - t3;
+    t6 = t10 - t14;
+    t13 = t7 - t11;
+    t4 = t1 + t12;
+    re[148] = t2;
+    im[148] = t5;
+    re[163] = t9;
+    im[163] = t0;
+    re[178] = t8;
+    im[178] = t6;
+    re[193] = t13;
+    im[193] = t4;
+    t3 = X[32];
+    t10 = 0.9945218953682733 * t3;
+    t14 = (-0.10452846326765346) * t3;
+    t7 = X[152];
+    t11 = 0.8788171126619654 * t7;
+    t1 = (-0.4771587602596084) * t7;
+    t12 = X[87];
+    t2 = 0.958819734868193 * t12;
+    t5 = 0.2840153447039226 * t12;
+    t9 = t11 + t2;
+    t0 = t1 + t5;
+    t8 = t11 - t2;
+    t6 = t1 - t5;
+    t13 = t10 + t9;
+    t4 = t14 + t0;
+    t3 = t10 + t6;
+    t7 = t14 - t8;
+    t12 = t10 - t9;
+    t11 = t14 - t0;
+    t2 = t10 - t6;
+    t1 = t14 + t8;
+    re[16] = t13;
+    im[16] = t4;
+    re[76] = t3;
+    im[76] = t7;
+    re[136] = t12;
+    im[136] = t11;
+    re[196] = t2;
+    im[196] = t1;
+    t5 = X[62];
+    t9 = 0.9794874195590514 * t5;
+    t0 = (-0.20150532232561713) * t5;
+    t10 = X[57];
+    t6 = 0.9820411276703039 * t10;
+    t14 = 0.18866696468655522 * t10;
+    t8 = t9 + t6;
+    t13 = t0 + t14;
+    t4 = t9 - t14;
+    t3 = t0 + t6;
+    t7 = t9 - t6;
+    t12 = t0 - t14;
+    t11 = t9 + t14;
+    t2 = t0 - t6;
+    t1 = t4 + t3;
+    t5 = C4 * t1;
+    t10 = t4 * (-C5);
+    t9 = t3 * C6;
+    t14 = t5 - t9;
+    t0 = t5 + t10;
+    t6 = t7 + t12;
+    t1 = t7 - t12;
+    t4 = C7 * t6;
+    t3 = (-C7) * t1;
+    t9 = t11 + t2;
+    t5 = C8 * t9;
+    t10 = t11 * (-C5);
+    t7 = t2 * (-C6);
+    t12 = t5 - t7;
+    t6 = t5 + t10;
+    re[31] = t8;
+    im[31] = t13;
+    re[91] = t14;
+    im[91] = t0;
+    re[151] = t4;
+    im[151] = t3;
+    re[211] = t12;
+    im[211] = t6;
+    t1 = X[92];
+    t9 = 0.9550199444571866 * t1;
+    t11 = (-0.296541574975571) * t1;
+    t2 = X[147];
+    t7 = 0.8849876374630419 * t2;
+    t5 = 0.4656145203251114 * t2;
+    t10 = X[27];
+    t8 = 0.9958049275746618 * t10;
+    t13 = 0.09150161866340238 * t10;
+    t14 = t9 + t7;
+    t0 = t11 + t5;
+    t4 = t9 - t7;
+    t3 = t11 - t5;
+    t12 = t14 + t8;
+    t6 = t0 + t13;
+    t1 = t4 - t13;
+    t2 = t3 + t8;
+    t10 = t14 - t8;
+    t9 = t0 - t13;
+    t7 = t4 + t13;
+    t11 = t3 - t8;
+    t5 = t1 + t2;
+    t14 = t1 - t2;
+    t0 = C7 * t5;
+    t4 = (-C7) * t14;
+    t13 = -t10;
+    t3 = t7 - t11;
+    t8 = t7 + t11;
+    t1 = (-C7) * t3;
+    t2 = (-C7) * t8;
+    re[46] = t12;
+    im[46] = t6;
+    re[106] = t0;
+    im[106] = t4;
+    re[166] = t9;
+    im[166] = t13;
+    re[226] = t1;
+    im[226] = t2;
+    t5 = X[122];
+    t14 = 0.9213551052231925 * t5;
+    t10 = (-0.38872197015239557) * t5;
+    t7 = X[117];
+    t11 = 0.9263643838751181 * t7;
+    t3 = 0.3766285016932107 * t7;
+    t8 = X[2];
+    t12 = 0.9999785816641292 * t8;
+    t6 = (-0.006544937967351858) * t8;
+    t0 = t14 + t11;
+    t4 = t10 + t3;
+    t9 = t14 - t11;
+    t13 = t10 - t3;
+    t1 = t0 + t12;
+    t2 = t4 + t6;
+    t5 = t9 - t6;
+    t7 = t13 + t12;
+    t8 = t0 - t12;
+    t14 = t4 - t6;
+    t11 = t9 + t6;
+    t10 = t13 - t12;
+    t3 = t5 + t7;
+    t0 = C8 * t3;
+    t4 = t5 * (-C5);
+    t9 = t7 * (-C6);
+    t6 = t0 - t9;
+    t13 = t0 + t4;
+    t12 = t8 - t14;
+    t3 = t8 + t14;
+    t5 = (-C7) * t12;
+    t7 = (-C7) * t3;
+    t9 = t11 + t10;
+    t0 = (-C4) * t9;
+    t4 = t11 * C5;
+    t8 = t10 * (-C6);
+    t14 = t0 - t8;
+    t12 = t0 + t4;
+    re[61] = t1;
+    im[61] = t2;
+    re[121] = t6;
+    im[121] = t13;
+    re[181] = t5;
+    im[181] = t7;
+    re[1] = t14;
+    im[1] = t12;
+    t3 = re[16];
+    t9 = im[16];
+    t11 = re[31];
+    t10 = im[31];
+    t8 = re[46];
+    t0 = im[46];
+    t4 = re[61];
+    t1 = im[61];
+    t2 = t3 + t8;
+    t6 = t9 + t0;
+    t13 = t11 + t4;
+    t5 = t10 + t1;
+    t7 = t3 - t8;
+    t14 = t9 - t0;
+    t12 = t11 - t4;
+    t3 = t10 - t1;
+    t8 = t2 + t13;
+    t9 = t6 + t5;
+    t0 = t7 + t3;
+    t11 = t14 - t12;
+    t4 = t2 - t13;
+    t10 = t6 - t5;
+    t1 = t7 - t3;
+    t2 = t14 + t12;
+    re[16] = t8;
+    im[16] = t9;
+    re[31] = t0;
+    im[31] = t11;
+    re[46] = t4;
+    im[46] = t10;
+    re[61] = t1;
+    im[61] = t2;
+    t13 = re[76];
+    t6 = im[76];
+    t5 = re[91];
+    t7 = im[91];
+    t3 = re[106];
+    t14 = im[106];
+    t12 = re[121];
+    t8 = im[121];
+    t9 = t13 + t3;
+    t0 = t6 + t14;
+    t11 = t5 + t12;
+    t4 = t7 + t8;
+    t10 = t13 - t3;
+    t1 = t6 - t14;
+    t2 = t5 - t12;
+    t13 = t7 - t8;
+    t3 = t9 + t11;
+    t6 = t0 + t4;
+    t14 = t10 + t13;
+    t5 = t1 - t2;
+    t12 = t9 - t11;
+    t7 = t0 - t4;
+    t8 = t10 - t13;
+    t9 = t1 + t2;
+    re[76] = t3;
+    im[76] = t6;
+    re[91] = t14;
+    im[91] = t5;
+    re[106] = t12;
+    im[106] = t7;
+    re[121] = t8;
+    im[121] = t9;
+    t11 = re[136];
+    t0 = im[136];
+    t4 = re[151];
+    t10 = im[151];
+    t13 = re[166];
+    t1 = im[166];
+    t2 = re[181];
+    t3 = im[181];
+    t6 = t11 + t13;
+    t14 = t0 + t1;
+    t5 = t4 + t2;
+    t12 = t10 + t3;
+    t7 = t11 - t13;
+    t8 = t0 - t1;
+    t9 = t4 - t2;
+    t11 = t10 - t3;
+    t13 = t6 + t5;
+    t0 = t14 + t12;
+    t1 = t7 + t11;
+    t4 = t8 - t9;
+    t2 = t6 - t5;
+    t10 = t14 - t12;
+    t3 = t7 - t11;
+    t6 = t8 + t9;
+    re[136] = t13;
+    im[136] = t0;
+    re[151] = t1;
+    im[151] = t4;
+    re[166] = t2;
+    im[166] = t10;
+    re[181] = t3;
+    im[181] = t6;
+    t5 = re[196];
+    t14 = im[196];
+    t12 = re[211];
+    t7 = im[211];
+    t11 = re[226];
+    t8 = im[226];
+    t9 = re[1];
+    t13 = im[1];
+    t0 = t5 + t11;
+    t1 = t14 + t8;
+    t4 = t12 + t9;
+    t2 = t7 + t13;
+    t10 = t5 - t11;
+    t3 = t14 - t8;
+    t6 = t12 - t9;
+    t5 = t7 - t13;
+    t11 = t0 + t4;
+    t14 = t1 + t2;
+    t8 = t10 + t5;
+    t12 = t3 - t6;
+    t9 = t0 - t4;
+    t7 = t1 - t2;
+    t13 = t10 - t5;
+    t0 = t3 + t6;
+    re[196] = t11;
+    im[196] = t14;
+    re[211] = t8;
+    im[211] = t12;
+    re[226] = t9;
+    im[226] = t7;
+    re[1] = t13;
+    im[1] = t0;
+}
+
+/**
+ *  Part 4 of ApplyWindowedIMDCT_W10_480_K160().
+ * 
+ *  @param {Number[]} X 
+ *    - The input block (480 points, only the first 160 points are used).
+ *  @param {Number[]} y 
+ *    - The array that would contain the output block (960 points).
+ *  @param {Number[]} re 
+ *    - The scratch buffer (real part, 240 points).
+ *  @param {Number[]} im 
+ *    - The scratch buffer (imaginary part, 240 points).
+ */
+function ApplyWindowedIMDCT_W10_480_K160_Part4(X, y, re, im) {
+    let t0, t1, t10, t11, t12, t13, t14, t2, t3, t4, t5, t6, t7, t8, t9;
+    const C0 = 0.9238795325112867;
+    const C1 = 1.3065629648763766;
+    const C2 = 0.5411961001461969;
+    const C3 = 0.7071067811865476;
+    const C4 = 0.3826834323650898;
+    const C5 = 0.5590169943749475;
+    const C6 = 0.25;
+    const C7 = 0.9510565162951535;
+    const C8 = 0.5877852522924731;
+    const C9 = 0.5;
+    const C10 = 0.8660254037844386;
+    const C11 = 0.9999986613495281;
+    const C12 = 0.0016362454436240478;
+    const C13 = 0.498582300553759;
+    const C14 = 0.8668423672009352;
+    const C15 = 0.8652061217573113;
+    const C16 = 0.501416360795769;
+    const C17 = 0.8619058515047743;
+    const C18 = 0.507068341687617;
+    const C19 = 0.9999665339174011;
+    const C20 = 0.008181139603937128;
+    const C21 = 0.49289819222978404;
+    const C22 = 0.8700869911087115;
+    const C23 = 0.4871929697877464;
+    const C24 = 0.8732943433856628;
+    const C25 = 0.8585686600742043;
+    const C26 = 0.5126986014593617;
+    const C27 = 0.999891571247108;
+    const C28 = 0.014725683311458524;
+    const C29 = 0.9997737765498004;
+    const C30 = 0.02126959621971774;
+    const C31 = 0.4814668776203871;
+    const C32 = 0.8764642866394929;
+    const C33 = 0.8551946904197751;
+    const C34 = 0.5183068989294132;
+    const C35 = 0.8517840870711173;
+    const C36 = 0.5238929938569739;
+    const C37 = 0.9996131548714108;
+    const C38 = 0.027812598009265603;
+    const C39 = 0.4757201610144368;
+    const C40 = 0.8795966850803829;
+    const C41 = 0.4699530661401083;
+    const C42 = 0.8826914045268092;
+    const C43 = 0.8483369961271269;
+    const C44 = 0.529456646952329;
+    const C45 = 0.9994097130924373;
+    const C46 = 0.034354408399682276;
+    t4 = X[128];
+    t1 = 0.9135454576426009 * t4;
+    t2 = (-0.40673664307580015) * t4;
+    t10 = X[111];
+    t5 = 0.9335804264972017 * t10;
+    t3 = 0.35836794954530027 * t10;
+    t6 = X[8];
+    t11 = 0.9996573249755573 * t6;
+    t14 = (-0.02617694830787315) * t6;
+    t8 = t1 + t5;
+    t12 = t2 + t3;
+    t9 = t1 - t5;
+    t7 = t2 - t3;
+    t13 = t8 + t11;
+    t0 = t12 + t14;
+    t4 = t9 - t14;
+    t10 = t7 + t11;
+    t6 = t8 - t11;
+    t1 = t12 - t14;
+    t5 = t9 + t14;
+    t2 = t7 - t11;
+    re[64] = t13;
+    im[64] = t0;
+    re[124] = t4;
+    im[124] = t10;
+    re[184] = t6;
+    im[184] = t1;
+    re[4] = t5;
+    im[4] = t2;
+    t3 = X[158];
+    t8 = 0.8692793239451436 * t3;
+    t12 = (-0.4943212082861446) * t3;
+    t9 = X[81];
+    t14 = 0.9642111831703293 * t9;
+    t7 = 0.265135426243408 * t9;
+    t11 = X[38];
+    t13 = 0.992277912105967 * t11;
+    t0 = (-0.12403445145048532) * t11;
+    t4 = t8 + t14;
+    t10 = t12 + t7;
+    t6 = t8 - t14;
+    t1 = t12 - t7;
+    t5 = t4 + t13;
+    t2 = t10 + t0;
+    t3 = t6 - t0;
+    t9 = t1 + t13;
+    t11 = t4 - t13;
+    t8 = t10 - t0;
+    t14 = t6 + t0;
+    t12 = t1 - t13;
+    t7 = t3 + t9;
+    t4 = C0 * t7;
+    t10 = t3 * (-C1);
+    t6 = t9 * C2;
+    t0 = t4 - t6;
+    t1 = t4 + t10;
+    t13 = t11 + t8;
+    t7 = t11 - t8;
+    t3 = C3 * t13;
+    t9 = (-C3) * t7;
+    t6 = t14 + t12;
+    t4 = C4 * t6;
+    t10 = t14 * (-C1);
+    t11 = t12 * (-C2);
+    t8 = t4 - t11;
+    t13 = t4 + t10;
+    re[79] = t5;
+    im[79] = t2;
+    re[139] = t0;
+    im[139] = t1;
+    re[199] = t3;
+    im[199] = t9;
+    re[19] = t8;
+    im[19] = t13;
+    t7 = X[51];
+    t6 = 0.9855560590580777 * t7;
+    t14 = 0.1693495038490246 * t7;
+    t12 = X[68];
+    t11 = 0.9753423205085127 * t12;
+    t4 = (-0.22069743502150108) * t12;
+    t10 = -t6;
+    t5 = -t14;
+    t2 = t6 + t11;
+    t0 = t14 + t4;
+    t1 = t10 - t4;
+    t3 = t11 - t14;
+    t9 = t6 - t11;
+    t8 = t14 - t4;
+    t13 = t4 - t6;
+    t7 = t5 - t11;
+    t12 = t1 + t3;
+    t10 = t1 - t3;
+    t14 = C3 * t12;
+    t4 = (-C3) * t10;
+    t6 = -t9;
+    t5 = t13 - t7;
+    t11 = t13 + t7;
+    t1 = (-C3) * t5;
+    t3 = (-C3) * t11;
+    re[94] = t2;
+    im[94] = t0;
+    re[154] = t14;
+    im[154] = t4;
+    re[214] = t8;
+    im[214] = t6;
+    re[34] = t1;
+    im[34] = t3;
+    t12 = X[141];
+    t10 = 0.8939587799699321 * t12;
+    t9 = 0.44814919358922256 * t12;
+    t13 = X[21];
+    t7 = 0.9974094913373519 * t13;
+    t5 = 0.07193265315671939 * t13;
+    t11 = X[98];
+    t2 = 0.949013649188214 * t11;
+    t0 = (-0.31523498164776964) * t11;
+    t14 = t10 + t2;
+    t4 = t9 + t0;
+    t8 = -t7;
+    t6 = -t5;
+    t1 = t10 - t2;
+    t3 = t9 - t0;
+    t12 = t7 + t14;
+    t13 = t5 + t4;
+    t11 = t3 - t7;
+    t10 = t6 - t1;
+    t2 = t7 - t14;
+    t9 = t5 - t4;
+    t0 = t8 - t3;
+    t6 = t1 - t5;
+    t7 = t11 + t10;
+    t14 = C4 * t7;
+    t4 = t11 * (-C1);
+    t8 = t10 * (-C2);
+    t3 = t14 - t8;
+    t1 = t14 + t4;
+    t5 = t2 - t9;
+    t7 = t2 + t9;
+    t11 = (-C3) * t5;
+    t10 = (-C3) * t7;
+    t8 = t0 + t6;
+    t14 = (-C0) * t8;
+    t4 = t0 * C1;
+    t2 = t6 * (-C2);
+    t9 = t14 - t2;
+    t5 = t14 + t4;
+    re[109] = t12;
+    im[109] = t13;
+    re[169] = t3;
+    im[169] = t1;
+    re[229] = t11;
+    im[229] = t10;
+    re[49] = t9;
+    im[49] = t5;
+    t7 = re[64];
+    t8 = im[64];
+    t0 = re[79];
+    t6 = im[79];
+    t2 = re[94];
+    t14 = im[94];
+    t4 = re[109];
+    t12 = im[109];
+    t13 = t7 + t2;
+    t3 = t8 + t14;
+    t1 = t0 + t4;
+    t11 = t6 + t12;
+    t10 = t7 - t2;
+    t9 = t8 - t14;
+    t5 = t0 - t4;
+    t7 = t6 - t12;
+    t2 = t13 + t1;
+    t8 = t3 + t11;
+    t14 = t10 + t7;
+    t0 = t9 - t5;
+    t4 = t13 - t1;
+    t6 = t3 - t11;
+    t12 = t10 - t7;
+    t13 = t9 + t5;
+    re[64] = t2;
+    im[64] = t8;
+    re[79] = t14;
+    im[79] = t0;
+    re[94] = t4;
+    im[94] = t6;
+    re[109] = t12;
+    im[109] = t13;
+    t1 = re[124];
+    t3 = im[124];
+    t11 = re[139];
+    t10 = im[139];
+    t7 = re[154];
+    t9 = im[154];
+    t5 = re[169];
+    t2 = im[169];
+    t8 = t1 + t7;
+    t14 = t3 + t9;
+    t0 = t11 + t5;
+    t4 = t10 + t2;
+    t6 = t1 - t7;
+    t12 = t3 - t9;
+    t13 = t11 - t5;
+    t1 = t10 - t2;
+    t7 = t8 + t0;
+    t3 = t14 + t4;
+    t9 = t6 + t1;
+    t11 = t12 - t13;
+    t5 = t8 - t0;
+    t10 = t14 - t4;
+    t2 = t6 - t1;
+    t8 = t12 + t13;
+    re[124] = t7;
+    im[124] = t3;
+    re[139] = t9;
+    im[139] = t11;
+    re[154] = t5;
+    im[154] = t10;
+    re[169] = t2;
+    im[169] = t8;
+    t0 = re[184];
+    t14 = im[184];
+    t4 = re[199];
+    t6 = im[199];
+    t1 = re[214];
+    t12 = im[214];
+    t13 = re[229];
+    t7 = im[229];
+    t3 = t0 + t1;
+    t9 = t14 + t12;
+    t11 = t4 + t13;
+    t5 = t6 + t7;
+    t10 = t0 - t1;
+    t2 = t14 - t12;
+    t8 = t4 - t13;
+    t0 = t6 - t7;
+    t1 = t3 + t11;
+    t14 = t9 + t5;
+    t12 = t10 + t0;
+    t4 = t2 - t8;
+    t13 = t3 - t11;
+    t6 = t9 - t5;
+    t7 = t10 - t0;
+    t3 = t2 + t8;
+    re[184] = t1;
+    im[184] = t14;
+    re[199] = t12;
+    im[199] = t4;
+    re[214] = t13;
+    im[214] = t6;
+    re[229] = t7;
+    im[229] = t3;
+    t11 = re[4];
+    t9 = im[4];
+    t5 = re[19];
+    t10 = im[19];
+    t0 = re[34];
+    t2 = im[34];
+    t8 = re[49];
+    t1 = im[49];
+    t14 = t11 + t0;
+    t12 = t9 + t2;
+    t4 = t5 + t8;
+    t13 = t10 + t1;
+    t6 = t11 - t0;
+    t7 = t9 - t2;
+    t3 = t5 - t8;
+    t11 = t10 - t1;
+    t0 = t14 + t4;
+    t9 = t12 + t13;
+    t2 = t6 + t11;
+    t5 = t7 - t3;
+    t8 = t14 - t4;
+    t10 = t12 - t13;
+    t1 = t6 - t11;
+    t14 = t7 + t3;
+    re[4] = t0;
+    im[4] = t9;
+    re[19] = t2;
+    im[19] = t5;
+    re[34] = t8;
+    im[34] = t10;
+    re[49] = t1;
+    im[49] = t14;
+    t4 = X[135];
+    t12 = 0.9025852843498606 * t4;
+    t13 = 0.4305110968082951 * t4;
+    t6 = X[15];
+    t11 = 0.9986295347545738 * t6;
+    t7 = 0.05233595624294383 * t6;
+    t3 = X[104];
+    t0 = 0.9426414910921784 * t3;
+    t9 = (-0.33380685923377096) * t3;
+    t2 = t12 + t0;
+    t5 = t13 + t9;
+    t8 = -t11;
+    t10 = -t7;
+    t1 = t12 - t0;
+    t14 = t13 - t9;
+    t4 = t11 + t2;
+    t6 = t7 + t5;
+    t3 = t14 - t11;
+    t12 = t10 - t1;
+    t0 = t11 - t2;
+    t13 = t7 - t5;
+    t9 = t8 - t14;
+    t10 = t1 - t7;
+    re[112] = t4;
+    im[112] = t6;
+    re[172] = t3;
+    im[172] = t12;
+    re[232] = t0;
+    im[232] = t13;
+    re[52] = t9;
+    im[52] = t10;
+    t11 = X[105];
+    t2 = 0.9404365560933549 * t11;
+    t5 = 0.3399692397309942 * t11;
+    t8 = X[14];
+    t14 = 0.9989506813588601 * t8;
+    t1 = (-0.04579886693652077) * t8;
+    t7 = X[134];
+    t4 = 0.9053836208979552 * t7;
+    t6 = (-0.4245945112807131) * t7;
+    t3 = t2 + t4;
+    t12 = t5 + t6;
+    t0 = -t14;
+    t13 = -t1;
+    t9 = t2 - t4;
+    t10 = t5 - t6;
+    t11 = t14 + t3;
+    t8 = t1 + t12;
+    t7 = t10 - t14;
+    t2 = t13 - t9;
+    t4 = t14 - t3;
+    t5 = t1 - t12;
+    t6 = t0 - t10;
+    t13 = t9 - t1;
+    t14 = t7 + t2;
+    t3 = C0 * t14;
+    t12 = t7 * (-C1);
+    t0 = t2 * C2;
+    t10 = t3 - t0;
+    t9 = t3 + t12;
+    t1 = t4 + t5;
+    t14 = t4 - t5;
+    t7 = C3 * t1;
+    t2 = (-C3) * t14;
+    t0 = t6 + t13;
+    t3 = C4 * t0;
+    t12 = t6 * (-C1);
+    t4 = t13 * (-C2);
+    t5 = t3 - t4;
+    t1 = t3 + t12;
+    re[127] = t11;
+    im[127] = t8;
+    re[187] = t10;
+    im[187] = t9;
+    re[7] = t7;
+    im[7] = t2;
+    re[67] = t5;
+    im[67] = t1;
+    t14 = X[75];
+    t0 = 0.9692309097067544 * t14;
+    t6 = 0.24615329302899303 * t14;
+    t13 = X[44];
+    t4 = 0.9896513868196702 * t13;
+    t3 = (-0.1434926219911793) * t13;
+    t12 = -t4;
+    t11 = -t3;
+    t8 = t4 + t0;
+    t10 = t3 + t6;
+    t9 = t6 - t4;
+    t7 = t11 - t0;
+    t2 = t4 - t0;
+    t5 = t3 - t6;
+    t1 = t12 - t6;
+    t14 = t0 - t3;
+    t13 = t9 + t7;
+    t11 = t9 - t7;
+    t4 = C3 * t13;
+    t12 = (-C3) * t11;
+    t6 = -t2;
+    t0 = t1 - t14;
+    t3 = t1 + t14;
+    t9 = (-C3) * t0;
+    t7 = (-C3) * t3;
+    re[142] = t8;
+    im[142] = t10;
+    re[202] = t4;
+    im[202] = t12;
+    re[22] = t5;
+    im[22] = t6;
+    re[82] = t9;
+    im[82] = t7;
+    t13 = X[45];
+    t11 = 0.9886910398241674 * t13;
+    t2 = 0.149966755554045 * t13;
+    t1 = X[74];
+    t14 = 0.9708212084269281 * t1;
+    t0 = (-0.23980446465501654) * t1;
+    t3 = -t14;
+    t8 = -t0;
+    t10 = t14 + t11;
+    t4 = t0 + t2;
+    t12 = t2 - t14;
+    t5 = t8 - t11;
+    t6 = t14 - t11;
+    t9 = t0 - t2;
+    t7 = t3 - t2;
+    t13 = t11 - t0;
+    t1 = t12 + t5;
+    t8 = C4 * t1;
+    t14 = t12 * (-C1);
+    t3 = t5 * (-C2);
+    t2 = t8 - t3;
+    t11 = t8 + t14;
+    t0 = t6 - t9;
+    t1 = t6 + t9;
+    t12 = (-C3) * t0;
+    t5 = (-C3) * t1;
+    t3 = t7 + t13;
+    t8 = (-C0) * t3;
+    t14 = t7 * C1;
+    t6 = t13 * (-C2);
+    t9 = t8 - t6;
+    t0 = t8 + t14;
+    re[157] = t10;
+    im[157] = t4;
+    re[217] = t2;
+    im[217] = t11;
+    re[37] = t12;
+    im[37] = t5;
+    re[97] = t9;
+    im[97] = t0;
+    t1 = re[112];
+    t3 = im[112];
+    t7 = re[127];
+    t13 = im[127];
+    t6 = re[142];
+    t8 = im[142];
+    t14 = re[157];
+    t10 = im[157];
+    t4 = t1 + t6;
+    t2 = t3 + t8;
+    t11 = t7 + t14;
+    t12 = t13 + t10;
+    t5 = t1 - t6;
+    t9 = t3 - t8;
+    t0 = t7 - t14;
+    t1 = t13 - t10;
+    t6 = t4 + t11;
+    t3 = t2 + t12;
+    t8 = t5 + t1;
+    t7 = t9 - t0;
+    t14 = t4 - t11;
+    t13 = t2 - t12;
+    t10 = t5 - t1;
+    t4 = t9 + t0;
+    re[112] = t6;
+    im[112] = t3;
+    re[127] = t8;
+    im[127] = t7;
+    re[142] = t14;
+    im[142] = t13;
+    re[157] = t10;
+    im[157] = t4;
+    t11 = re[172];
+    t2 = im[172];
+    t12 = re[187];
+    t5 = im[187];
+    t1 = re[202];
+    t9 = im[202];
+    t0 = re[217];
+    t6 = im[217];
+    t3 = t11 + t1;
+    t8 = t2 + t9;
+    t7 = t12 + t0;
+    t14 = t5 + t6;
+    t13 = t11 - t1;
+    t10 = t2 - t9;
+    t4 = t12 - t0;
+    t11 = t5 - t6;
+    t1 = t3 + t7;
+    t2 = t8 + t14;
+    t9 = t13 + t11;
+    t12 = t10 - t4;
+    t0 = t3 - t7;
+    t5 = t8 - t14;
+    t6 = t13 - t11;
+    t3 = t10 + t4;
+    re[172] = t1;
+    im[172] = t2;
+    re[187] = t9;
+    im[187] = t12;
+    re[202] = t0;
+    im[202] = t5;
+    re[217] = t6;
+    im[217] = t3;
+    t7 = re[232];
+    t8 = im[232];
+    t14 = re[7];
+    t13 = im[7];
+    t11 = re[22];
+    t10 = im[22];
+    t4 = re[37];
+    t1 = im[37];
+    t2 = t7 + t11;
+    t9 = t8 + t10;
+    t12 = t14 + t4;
+    t0 = t13 + t1;
+    t5 = t7 - t11;
+    t6 = t8 - t10;
+    t3 = t14 - t4;
+    t7 = t13 - t1;
+    t11 = t2 + t12;
+    t8 = t9 + t0;
+    t10 = t5 + t7;
+    t14 = t6 - t3;
+    t4 = t2 - t12;
+    t13 = t9 - t0;
+    t1 = t5 - t7;
+    t2 = t6 + t3;
+    re[232] = t11;
+    im[232] = t8;
+    re[7] = t10;
+    im[7] = t14;
+    re[22] = t4;
+    im[22] = t13;
+    re[37] = t1;
+    im[37] = t2;
+    t12 = re[52];
+    t9 = im[52];
+    t0 = re[67];
+    t5 = im[67];
+    t7 = re[82];
+    t6 = im[82];
+    t3 = re[97];
+    t11 = im[97];
+    t8 = t12 + t7;
+    t10 = t9 + t6;
+    t14 = t0 + t3;
+    t4 = t5 + t11;
+    t13 = t12 - t7;
+    t1 = t9 - t6;
+    t2 = t0 - t3;
+    t12 = t5 - t11;
+    t7 = t8 + t14;
+    t9 = t10 + t4;
+    t6 = t13 + t12;
+    t0 = t1 - t2;
+    t3 = t8 - t14;
+    t5 = t10 - t4;
+    t11 = t13 - t12;
+    t8 = t1 + t2;
+    re[52] = t7;
+    im[52] = t9;
+    re[67] = t6;
+    im[67] = t0;
+    re[82] = t3;
+    im[82] = t5;
+    re[97] = t11;
+    im[97] = t8;
+    t14 = re[160];
+    t10 = im[160];
+    t4 = re[208];
+    t13 = im[208];
+    t12 = re[16];
+    t1 = im[16];
+    t2 = re[64];
+    t7 = im[64];
+    t9 = re[112];
+    t6 = im[112];
+    t0 = t4 + t9;
+    t3 = t13 + t6;
+    t5 = t12 + t2;
+    t11 = t1 + t7;
+    t8 = t4 - t9;
+    t4 = t13 - t6;
+    t9 = t12 - t2;
+    t13 = t1 - t7;
+    t6 = t0 + t5;
+    t12 = t3 + t11;
+    t2 = t0 - t5;
+    t1 = C5 * t2;
+    t7 = t3 - t11;
+    t0 = C5 * t7;
+    t5 = C6 * t6;
+    t2 = t14 - t5;
+    t3 = C6 * t12;
+    t11 = t10 - t3;
+    t7 = t2 + t1;
+    t5 = t11 + t0;
+    t3 = t2 - t1;
+    t2 = t11 - t0;
+    t1 = C7 * t8;
+    t11 = C8 * t9;
+    t0 = t1 + t11;
+    t1 = C7 * t4;
+    t11 = C8 * t13;
+    t1 = t1 + t11;
+    t11 = C8 * t8;
+    t8 = C7 * t9;
+    t9 = t11 - t8;
+    t11 = C8 * t4;
+    t8 = C7 * t13;
+    t4 = t11 - t8;
+    t13 = t14 + t6;
+    t11 = t10 + t12;
+    t8 = t7 + t1;
+    t14 = t5 - t0;
+    t6 = t3 + t4;
+    t10 = t2 - t9;
+    t12 = t3 - t4;
+    t3 = t2 + t9;
+    t4 = t7 - t1;
+    t2 = t5 + t0;
+    re[160] = t13;
+    im[160] = t11;
+    re[208] = t8;
+    im[208] = t14;
+    re[16] = t6;
+    im[16] = t10;
+    re[64] = t12;
+    im[64] = t3;
+    re[112] = t4;
+    im[112] = t2;
+    t9 = re[220];
+    t7 = im[220];
+    t1 = re[28];
+    t5 = im[28];
+    t0 = re[76];
+    t13 = im[76];
+    t11 = re[124];
+    t8 = im[124];
+    t14 = re[172];
+    t6 = im[172];
+    t10 = t1 + t14;
+    t12 = t5 + t6;
+    t3 = t0 + t11;
+    t4 = t13 + t8;
+    t2 = t1 - t14;
+    t1 = t5 - t6;
+    t14 = t0 - t11;
+    t5 = t13 - t8;
+    t6 = t10 + t3;
+    t0 = t12 + t4;
+    t11 = t10 - t3;
+    t13 = C5 * t11;
+    t8 = t12 - t4;
+    t10 = C5 * t8;
+    t3 = C6 * t6;
+    t11 = t9 - t3;
+    t12 = C6 * t0;
+    t4 = t7 - t12;
+    t8 = t11 + t13;
+    t3 = t4 + t10;
+    t12 = t11 - t13;
+    t11 = t4 - t10;
+    t13 = C7 * t2;
+    t4 = C8 * t14;
+    t10 = t13 + t4;
+    t13 = C7 * t1;
+    t4 = C8 * t5;
+    t13 = t13 + t4;
+    t4 = C8 * t2;
+    t2 = C7 * t14;
+    t14 = t4 - t2;
+    t4 = C8 * t1;
+    t2 = C7 * t5;
+    t1 = t4 - t2;
+    t5 = t9 + t6;
+    t4 = t7 + t0;
+    t2 = t8 + t13;
+    t9 = t3 - t10;
+    t6 = t12 + t1;
+    t7 = t11 - t14;
+    t0 = t12 - t1;
+    t12 = t11 + t14;
+    t1 = t8 - t13;
+    t11 = t3 + t10;
+    re[220] = t5;
+    im[220] = t4;
+    re[28] = t2;
+    im[28] = t9;
+    re[76] = t6;
+    im[76] = t7;
+    re[124] = t0;
+    im[124] = t12;
+    re[172] = t1;
+    im[172] = t11;
+    t14 = re[40];
+    t8 = im[40];
+    t13 = re[88];
+    t3 = im[88];
+    t10 = re[136];
+    t5 = im[136];
+    t4 = re[184];
+    t2 = im[184];
+    t9 = re[232];
+    t6 = im[232];
+    t7 = t13 + t9;
+    t0 = t3 + t6;
+    t12 = t10 + t4;
+    t1 = t5 + t2;
+    t11 = t13 - t9;
+    t13 = t3 - t6;
+    t9 = t10 - t4;
+    t3 = t5 - t2;
+    t6 = t7 + t12;
+    t10 = t0 + t1;
+    t4 = t7 - t12;
+    t5 = C5 * t4;
+    t2 = t0 - t1;
+    t7 = C5 * t2;
+    t12 = C6 * t6;
+    t4 = t14 - t12;
+    t0 = C6 * t10;
+    t1 = t8 - t0;
+    t2 = t4 + t5;
+    t12 = t1 + t7;
+    t0 = t4 - t5;
+    t4 = t1 - t7;
+    t5 = C7 * t11;
+    t1 = C8 * t9;
+    t7 = t5 + t1;
+    t5 = C7 * t13;
+    t1 = C8 * t3;
+    t5 = t5 + t1;
+    t1 = C8 * t11;
+    t11 = C7 * t9;
+    t9 = t1 - t11;
+    t1 = C8 * t13;
+    t11 = C7 * t3;
+    t13 = t1 - t11;
+    t3 = t14 + t6;
+    t1 = t8 + t10;
+    t11 = t2 + t5;
+    t14 = t12 - t7;
+    t6 = t0 + t13;
+    t8 = t4 - t9;
+    t10 = t0 - t13;
+    t0 = t4 + t9;
+    t13 = t2 - t5;
+    t4 = t12 + t7;
+    re[40] = t3;
+    im[40] = t1;
+    re[88] = t11;
+    im[88] = t14;
+    re[136] = t6;
+    im[136] = t8;
+    re[184] = t10;
+    im[184] = t0;
+    re[232] = t13;
+    im[232] = t4;
+    t9 = re[100];
+    t2 = im[100];
+    t5 = re[148];
+    t12 = im[148];
+    t7 = re[196];
+    t3 = im[196];
+    t1 = re[4];
+    t11 = im[4];
+    t14 = re[52];
+    t6 = im[52];
+    t8 = t5 + t14;
+    t10 = t12 + t6;
+    t0 = t7 + t1;
+    t13 = t3 + t11;
+    t4 = t5 - t14;
+    t5 = t12 - t6;
+    t14 = t7 - t1;
+    t12 = t3 - t11;
+    t6 = t8 + t0;
+    t7 = t10 + t13;
+    t1 = t8 - t0;
+    t3 = C5 * t1;
+    t11 = t10 - t13;
+    t8 = C5 * t11;
+    t0 = C6 * t6;
+    t1 = t9 - t0;
+    t10 = C6 * t7;
+    t13 = t2 - t10;
+    t11 = t1 + t3;
+    t0 = t13 + t8;
+    t10 = t1 - t3;
+    t1 = t13 - t8;
+    t3 = C7 * t4;
+    t13 = C8 * t14;
+    t8 = t3 + t13;
+    t3 = C7 * t5;
+    t13 = C8 * t12;
+    t3 = t3 + t13;
+    t13 = C8 * t4;
+    t4 = C7 * t14;
+    t14 = t13 - t4;
+    t13 = C8 * t5;
+    t4 = C7 * t12;
+    t5 = t13 - t4;
+    t12 = t9 + t6;
+    t13 = t2 + t7;
+    t4 = t11 + t3;
+    t9 = t0 - t8;
+    t6 = t10 + t5;
+    t2 = t1 - t14;
+    t7 = t10 - t5;
+    t10 = t1 + t14;
+    t5 = t11 - t3;
+    t1 = t0 + t8;
+    re[100] = t12;
+    im[100] = t13;
+    re[148] = t4;
+    im[148] = t9;
+    re[196] = t6;
+    im[196] = t2;
+    re[4] = t7;
+    im[4] = t10;
+    re[52] = t5;
+    im[52] = t1;
+    t14 = re[175];
+    t11 = im[175];
+    t3 = re[223];
+    t0 = im[223];
+    t8 = re[31];
+    t12 = im[31];
+    t13 = re[79];
+    t4 = im[79];
+    t9 = re[127];
+    t6 = im[127];
+    t2 = t3 + t9;
+    t7 = t0 + t6;
+    t10 = t8 + t13;
+    t5 = t12 + t4;
+    t1 = t3 - t9;
+    t3 = t0 - t6;
+    t9 = t8 - t13;
+    t0 = t12 - t4;
+    t6 = t2 + t10;
+    t8 = t7 + t5;
+    t13 = t2 - t10;
+    t12 = C5 * t13;
+    t4 = t7 - t5;
+    t2 = C5 * t4;
+    t10 = C6 * t6;
+    t13 = t14 - t10;
+    t7 = C6 * t8;
+    t5 = t11 - t7;
+    t4 = t13 + t12;
+    t10 = t5 + t2;
+    t7 = t13 - t12;
+    t13 = t5 - t2;
+    t12 = C7 * t1;
+    t5 = C8 * t9;
+    t2 = t12 + t5;
+    t12 = C7 * t3;
+    t5 = C8 * t0;
+    t12 = t12 + t5;
+    t5 = C8 * t1;
+    t1 = C7 * t9;
+    t9 = t5 - t1;
+    t5 = C8 * t3;
+    t1 = C7 * t0;
+    t3 = t5 - t1;
+    t0 = t14 + t6;
+    t5 = t11 + t8;
+    t1 = t4 + t12;
+    t14 = t10 - t2;
+    t6 = t7 + t3;
+    t11 = t13 - t9;
+    t8 = t7 - t3;
+    t7 = t13 + t9;
+    t3 = t4 - t12;
+    t13 = t10 + t2;
+    re[175] = t0;
+    im[175] = t5;
+    re[223] = t1;
+    im[223] = t14;
+    re[31] = t6;
+    im[31] = t11;
+    re[79] = t8;
+    im[79] = t7;
+    re[127] = t3;
+    im[127] = t13;
+    t9 = re[235];
+    t4 = im[235];
+    t12 = re[43];
+    t10 = im[43];
+    t2 = re[91];
+    t0 = im[91];
+    t5 = re[139];
+    t1 = im[139];
+    t14 = re[187];
+    t6 = im[187];
+    t11 = t12 + t14;
+    t8 = t10 + t6;
+    t7 = t2 + t5;
+    t3 = t0 + t1;
+    t13 = t12 - t14;
+    t12 = t10 - t6;
+    t14 = t2 - t5;
+    t10 = t0 - t1;
+    t6 = t11 + t7;
+    t2 = t8 + t3;
+    t5 = t11 - t7;
+    t0 = C5 * t5;
+    t1 = t8 - t3;
+    t11 = C5 * t1;
+    t7 = C6 * t6;
+    t5 = t9 - t7;
+    t8 = C6 * t2;
+    t3 = t4 - t8;
+    t1 = t5 + t0;
+    t7 = t3 + t11;
+    t8 = t5 - t0;
+    t5 = t3 - t11;
+    t0 = C7 * t13;
+    t3 = C8 * t14;
+    t11 = t0 + t3;
+    t0 = C7 * t12;
+    t3 = C8 * t10;
+    t0 = t0 + t3;
+    t3 = C8 * t13;
+    t13 = C7 * t14;
+    t14 = t3 - t13;
+    t3 = C8 * t12;
+    t13 = C7 * t10;
+    t12 = t3 - t13;
+    t10 = t9 + t6;
+    t3 = t4 + t2;
+    t13 = t1 + t0;
+    t9 = t7 - t11;
+    t6 = t8 + t12;
+    t4 = t5 - t14;
+    t2 = t8 - t12;
+    t8 = t5 + t14;
+    t12 = t1 - t0;
+    t5 = t7 + t11;
+    re[235] = t10;
+    im[235] = t3;
+    re[43] = t13;
+    im[43] = t9;
+    re[91] = t6;
+    im[91] = t4;
+    re[139] = t2;
+    im[139] = t8;
+    re[187] = t12;
+    im[187] = t5;
+    t14 = re[55];
+    t1 = im[55];
+    t0 = re[103];
+    t7 = im[103];
+    t11 = re[151];
+    t10 = im[151];
+    t3 = re[199];
+    t13 = im[199];
+    t9 = re[7];
+    t6 = im[7];
+    t4 = t0 + t9;
+    t2 = t7 + t6;
+    t8 = t11 + t3;
+    t12 = t10 + t13;
+    t5 = t0 - t9;
+    t0 = t7 - t6;
+    t9 = t11 - t3;
+    t7 = t10 - t13;
+    t6 = t4 + t8;
+    t11 = t2 + t12;
+    t3 = t4 - t8;
+    t10 = C5 * t3;
+    t13 = t2 - t12;
+    t4 = C5 * t13;
+    t8 = C6 * t6;
+    t3 = t14 - t8;
+    t2 = C6 * t11;
+    t12 = t1 - t2;
+    t13 = t3 + t10;
+    t8 = t12 + t4;
+    t2 = t3 - t10;
+    t3 = t12 - t4;
+    t10 = C7 * t5;
+    t12 = C8 * t9;
+    t4 = t10 + t12;
+    t10 = C7 * t0;
+    t12 = C8 * t7;
+    t10 = t10 + t12;
+    t12 = C8 * t5;
+    t5 = C7 * t9;
+    t9 = t12 - t5;
+    t12 = C8 * t0;
+    t5 = C7 * t7;
+    t0 = t12 - t5;
+    t7 = t14 + t6;
+    t12 = t1 + t11;
+    t5 = t13 + t10;
+    t14 = t8 - t4;
+    t6 = t2 + t0;
+    t1 = t3 - t9;
+    t11 = t2 - t0;
+    t2 = t3 + t9;
+    t0 = t13 - t10;
+    t3 = t8 + t4;
+    re[55] = t7;
+    im[55] = t12;
+    re[103] = t5;
+    im[103] = t14;
+    re[151] = t6;
+    im[151] = t1;
+    re[199] = t11;
+    im[199] = t2;
+    re[7] = t0;
+    im[7] = t3;
+    t9 = re[115];
+    t13 = im[115];
+    t10 = re[163];
+    t8 = im[163];
+    t4 = re[211];
+    t7 = im[211];
+    t12 = re[19];
+    t5 = im[19];
+    t14 = re[67];
+    t6 = im[67];
+    t1 = t10 + t14;
+    t11 = t8 + t6;
+    t2 = t4 + t12;
+    t0 = t7 + t5;
+    t3 = t10 - t14;
+    t10 = t8 - t6;
+    t14 = t4 - t12;
+    t8 = t7 - t5;
+    t6 = t1 + t2;
+    t4 = t11 + t0;
+    t12 = t1 - t2;
+    t7 = C5 * t12;
+    t5 = t11 - t0;
+    t1 = C5 * t5;
+    t2 = C6 * t6;
+    t12 = t9 - t2;
+    t11 = C6 * t4;
+    t0 = t13 - t11;
+    t5 = t12 + t7;
+    t2 = t0 + t1;
+    t11 = t12 - t7;
+    t12 = t0 - t1;
+    t7 = C7 * t3;
+    t0 = C8 * t14;
+    t1 = t7 + t0;
+    t7 = C7 * t10;
+    t0 = C8 * t8;
+    t7 = t7 + t0;
+    t0 = C8 * t3;
+    t3 = C7 * t14;
+    t14 = t0 - t3;
+    t0 = C8 * t10;
+    t3 = C7 * t8;
+    t10 = t0 - t3;
+    t8 = t9 + t6;
+    t0 = t13 + t4;
+    t3 = t5 + t7;
+    t9 = t2 - t1;
+    t6 = t11 + t10;
+    t13 = t12 - t14;
+    t4 = t11 - t10;
+    t11 = t12 + t14;
+    t10 = t5 - t7;
+    t12 = t2 + t1;
+    re[115] = t8;
+    im[115] = t0;
+    re[163] = t3;
+    im[163] = t9;
+    re[211] = t6;
+    im[211] = t13;
+    re[19] = t4;
+    im[19] = t11;
+    re[67] = t10;
+    im[67] = t12;
+    t14 = re[190];
+    t5 = im[190];
+    t7 = re[238];
+    t2 = im[238];
+    t1 = re[46];
+    t8 = im[46];
+    t0 = re[94];
+    t3 = im[94];
+    t9 = re[142];
+    t6 = im[142];
+    t13 = t7 + t9;
+    t4 = t2 + t6;
+    t11 = t1 + t0;
+    t10 = t8 + t3;
+    t12 = t7 - t9;
+    t7 = t2 - t6;
+    t9 = t1 - t0;
+    t2 = t8 - t3;
+    t6 = t13 + t11;
+    t1 = t4 + t10;
+    t0 = t13 - t11;
+    t8 = C5 * t0;
+    t3 = t4 - t10;
+    t13 = C5 * t3;
+    t11 = C6 * t6;
+    t0 = t14 - t11;
+    t4 = C6 * t1;
+    t10 = t5 - t4;
+    t3 = t0 + t8;
+    t11 = t10 + t13;
+    t4 = t0 - t8;
+    t0 = t10 - t13;
+    t8 = C7 * t12;
+    t10 = C8 * t9;
+    t13 = t8 + t10;
+    t8 = C7 * t7;
+    t10 = C8 * t2;
+    t8 = t8 + t10;
+    t10 = C8 * t12;
+    t12 = C7 * t9;
+    t9 = t10 - t12;
+    t10 = C8 * t7;
+    t12 = C7 * t2;
+    t7 = t10 - t12;
+    t2 = t14 + t6;
+    t10 = t5 + t1;
+    t12 = t3 + t8;
+    t14 = t11 - t13;
+    t6 = t4 + t7;
+    t5 = t0 - t9;
+    t1 = t4 - t7;
+    t4 = t0 + t9;
+    t7 = t3 - t8;
+    t0 = t11 + t13;
+    re[190] = t2;
+    im[190] = t10;
+    re[238] = t12;
+    im[238] = t14;
+    re[46] = t6;
+    im[46] = t5;
+    re[94] = t1;
+    im[94] = t4;
+    re[142] = t7;
+    im[142] = t0;
+    t9 = re[10];
+    t3 = im[10];
+    t8 = re[58];
+    t11 = im[58];
+    t13 = re[106];
+    t2 = im[106];
+    t10 = re[154];
+    t12 = im[154];
+    t14 = re[202];
+    t6 = im[202];
+    t5 = t8 + t14;
+    t1 = t11 + t6;
+    t4 = t13 + t10;
+    t7 = t2 + t12;
+    t0 = t8 - t14;
+    t8 = t11 - t6;
+    t14 = t13 - t10;
+    t11 = t2 - t12;
+    t6 = t5 + t4;
+    t13 = t1 + t7;
+    t10 = t5 - t4;
+    t2 = C5 * t10;
+    t12 = t1 - t7;
+    t5 = C5 * t12;
+    t4 = C6 * t6;
+    t10 = t9 - t4;
+    t1 = C6 * t13;
+    t7 = t3 - t1;
+    t12 = t10 + t2;
+    t4 = t7 + t5;
+    t1 = t10 - t2;
+    t10 = t7 - t5;
+    t2 = C7 * t0;
+    t7 = C8 * t14;
+    t5 = t2 + t7;
+    t2 = C7 * t8;
+    t7 = C8 * t11;
+    t2 = t2 + t7;
+    t7 = C8 * t0;
+    t0 = C7 * t14;
+    t14 = t7 - t0;
+    t7 = C8 * t8;
+    t0 = C7 * t11;
+    t8 = t7 - t0;
+    t11 = t9 + t6;
+    t7 = t3 + t13;
+    t0 = t12 + t2;
+    t9 = t4 - t5;
+    t6 = t1 + t8;
+    t3 = t10 - t14;
+    t13 = t1 - t8;
+    t1 = t10 + t14;
+    t8 = t12 - t2;
+    t10 = t4 + t5;
+    re[10] = t11;
+    im[10] = t7;
+    re[58] = t0;
+    im[58] = t9;
+    re[106] = t6;
+    im[106] = t3;
+    re[154] = t13;
+    im[154] = t1;
+    re[202] = t8;
+    im[202] = t10;
+    t14 = re[70];
+    t12 = im[70];
+    t2 = re[118];
+    t4 = im[118];
+    t5 = re[166];
+    t11 = im[166];
+    t7 = re[214];
+    t0 = im[214];
+    t9 = re[22];
+    t6 = im[22];
+    t3 = t2 + t9;
+    t13 = t4 + t6;
+    t1 = t5 + t7;
+    t8 = t11 + t0;
+    t10 = t2 - t9;
+    t2 = t4 - t6;
+    t9 = t5 - t7;
+    t4 = t11 - t0;
+    t6 = t3 + t1;
+    t5 = t13 + t8;
+    t7 = t3 - t1;
+    t11 = C5 * t7;
+    t0 = t13 - t8;
+    t3 = C5 * t0;
+    t1 = C6 * t6;
+    t7 = t14 - t1;
+    t13 = C6 * t5;
+    t8 = t12 - t13;
+    t0 = t7 + t11;
+    t1 = t8 + t3;
+    t13 = t7 - t11;
+    t7 = t8 - t3;
+    t11 = C7 * t10;
+    t8 = C8 * t9;
+    t3 = t11 + t8;
+    t11 = C7 * t2;
+    t8 = C8 * t4;
+    t11 = t11 + t8;
+    t8 = C8 * t10;
+    t10 = C7 * t9;
+    t9 = t8 - t10;
+    t8 = C8 * t2;
+    t10 = C7 * t4;
+    t2 = t8 - t10;
+    t4 = t14 + t6;
+    t8 = t12 + t5;
+    t10 = t0 + t11;
+    t14 = t1 - t3;
+    t6 = t13 + t2;
+    t12 = t7 - t9;
+    t5 = t13 - t2;
+    t13 = t7 + t9;
+    t2 = t0 - t11;
+    t7 = t1 + t3;
+    re[70] = t4;
+    im[70] = t8;
+    re[118] = t10;
+    im[118] = t14;
+    re[166] = t6;
+    im[166] = t12;
+    re[214] = t5;
+    im[214] = t13;
+    re[22] = t2;
+    im[22] = t7;
+    t9 = re[130];
+    t0 = im[130];
+    t11 = re[178];
+    t1 = im[178];
+    t3 = re[226];
+    t4 = im[226];
+    t8 = re[34];
+    t10 = im[34];
+    t14 = re[82];
+    t6 = im[82];
+    t12 = t11 + t14;
+    t5 = t1 + t6;
+    t13 = t3 + t8;
+    t2 = t4 + t10;
+    t7 = t11 - t14;
+    t11 = t1 - t6;
+    t14 = t3 - t8;
+    t1 = t4 - t10;
+    t6 = t12 + t13;
+    t3 = t5 + t2;
+    t8 = t12 - t13;
+    t4 = C5 * t8;
+    t10 = t5 - t2;
+    t12 = C5 * t10;
+    t13 = C6 * t6;
+    t8 = t9 - t13;
+    t5 = C6 * t3;
+    t2 = t0 - t5;
+    t10 = t8 + t4;
+    t13 = t2 + t12;
+    t5 = t8 - t4;
+    t8 = t2 - t12;
+    t4 = C7 * t7;
+    t2 = C8 * t14;
+    t12 = t4 + t2;
+    t4 = C7 * t11;
+    t2 = C8 * t1;
+    t4 = t4 + t2;
+    t2 = C8 * t7;
+    t7 = C7 * t14;
+    t14 = t2 - t7;
+    t2 = C8 * t11;
+    t7 = C7 * t1;
+    t11 = t2 - t7;
+    t1 = t9 + t6;
+    t2 = t0 + t3;
+    t7 = t10 + t4;
+    t9 = t13 - t12;
+    t6 = t5 + t11;
+    t0 = t8 - t14;
+    t3 = t5 - t11;
+    t5 = t8 + t14;
+    t11 = t10 - t4;
+    t8 = t13 + t12;
+    re[130] = t1;
+    im[130] = t2;
+    re[178] = t7;
+    im[178] = t9;
+    re[226] = t6;
+    im[226] = t0;
+    re[34] = t3;
+    im[34] = t5;
+    re[82] = t11;
+    im[82] = t8;
+    t14 = re[205];
+    t10 = im[205];
+    t4 = re[13];
+    t13 = im[13];
+    t12 = re[61];
+    t1 = im[61];
+    t2 = re[109];
+    t7 = im[109];
+    t9 = re[157];
+    t6 = im[157];
+    t0 = t4 + t9;
+    t3 = t13 + t6;
+    t5 = t12 + t2;
+    t11 = t1 + t7;
+    t8 = t4 - t9;
+    t4 = t13 - t6;
+    t9 = t12 - t2;
+    t13 = t1 - t7;
+    t6 = t0 + t5;
+    t12 = t3 + t11;
+    t2 = t0 - t5;
+    t1 = C5 * t2;
+    t7 = t3 - t11;
+    t0 = C5 * t7;
+    t5 = C6 * t6;
+    t2 = t14 - t5;
+    t3 = C6 * t12;
+    t11 = t10 - t3;
+    t7 = t2 + t1;
+    t5 = t11 + t0;
+    t3 = t2 - t1;
+    t2 = t11 - t0;
+    t1 = C7 * t8;
+    t11 = C8 * t9;
+    t0 = t1 + t11;
+    t1 = C7 * t4;
+    t11 = C8 * t13;
+    t1 = t1 + t11;
+    t11 = C8 * t8;
+    t8 = C7 * t9;
+    t9 = t11 - t8;
+    t11 = C8 * t4;
+    t8 = C7 * t13;
+    t4 = t11 - t8;
+    t13 = t14 + t6;
+    t11 = t10 + t12;
+    t8 = t7 + t1;
+    t14 = t5 - t0;
+    t6 = t3 + t4;
+    t10 = t2 - t9;
+    t12 = t3 - t4;
+    t3 = t2 + t9;
+    t4 = t7 - t1;
+    t2 = t5 + t0;
+    re[205] = t13;
+    im[205] = t11;
+    re[13] = t8;
+    im[13] = t14;
+    re[61] = t6;
+    im[61] = t10;
+    re[109] = t12;
+    im[109] = t3;
+    re[157] = t4;
+    im[157] = t2;
+    t9 = re[25];
+    t7 = im[25];
+    t1 = re[73];
+    t5 = im[73];
+    t0 = re[121];
+    t13 = im[121];
+    t11 = re[169];
+    t8 = im[169];
+    t14 = re[217];
+    t6 = im[217];
+    t10 = t1 + t14;
+    t12 = t5 + t6;
+    t3 = t0 + t11;
+    t4 = t13 + t8;
+    t2 = t1 - t14;
+    t1 = t5 - t6;
+    t14 = t0 - t11;
+    t5 = t13 - t8;
+    t6 = t10 + t3;
+    t0 = t12 + t4;
+    t11 = t10 - t3;
+    t13 = C5 * t11;
+    t8 = t12 - t4;
+    t10 = C5 * t8;
+    t3 = C6 * t6;
+    t11 = t9 - t3;
+    t12 = C6 * t0;
+    t4 = t7 - t12;
+    t8 = t11 + t13;
+    t3 = t4 + t10;
+    t12 = t11 - t13;
+    t11 = t4 - t10;
+    t13 = C7 * t2;
+    t4 = C8 * t14;
+    t10 = t13 + t4;
+    t13 = C7 * t1;
+    t4 = C8 * t5;
+    t13 = t13 + t4;
+    t4 = C8 * t2;
+    t2 = C7 * t14;
+    t14 = t4 - t2;
+    t4 = C8 * t1;
+    t2 = C7 * t5;
+    t1 = t4 - t2;
+    t5 = t9 + t6;
+    t4 = t7 + t0;
+    t2 = t8 + t13;
+    t9 = t3 - t10;
+    t6 = t12 + t1;
+    t7 = t11 - t14;
+    t0 = t12 - t1;
+    t12 = t11 + t14;
+    t1 = t8 - t13;
+    t11 = t3 + t10;
+    re[25] = t5;
+    im[25] = t4;
+    re[73] = t2;
+    im[73] = t9;
+    re[121] = t6;
+    im[121] = t7;
+    re[169] = t0;
+    im[169] = t12;
+    re[217] = t1;
+    im[217] = t11;
+    t14 = re[85];
+    t8 = im[85];
+    t13 = re[133];
+    t3 = im[133];
+    t10 = re[181];
+    t5 = im[181];
+    t4 = re[229];
+    t2 = im[229];
+    t9 = re[37];
+    t6 = im[37];
+    t7 = t13 + t9;
+    t0 = t3 + t6;
+    t12 = t10 + t4;
+    t1 = t5 + t2;
+    t11 = t13 - t9;
+    t13 = t3 - t6;
+    t9 = t10 - t4;
+    t3 = t5 - t2;
+    t6 = t7 + t12;
+    t10 = t0 + t1;
+    t4 = t7 - t12;
+    t5 = C5 * t4;
+    t2 = t0 - t1;
+    t7 = C5 * t2;
+    t12 = C6 * t6;
+    t4 = t14 - t12;
+    t0 = C6 * t10;
+    t1 = t8 - t0;
+    t2 = t4 + t5;
+    t12 = t1 + t7;
+    t0 = t4 - t5;
+    t4 = t1 - t7;
+    t5 = C7 * t11;
+    t1 = C8 * t9;
+    t7 = t5 + t1;
+    t5 = C7 * t13;
+    t1 = C8 * t3;
+    t5 = t5 + t1;
+    t1 = C8 * t11;
+    t11 = C7 * t9;
+    t9 = t1 - t11;
+    t1 = C8 * t13;
+    t11 = C7 * t3;
+    t13 = t1 - t11;
+    t3 = t14 + t6;
+    t1 = t8 + t10;
+    t11 = t2 + t5;
+    t14 = t12 - t7;
+    t6 = t0 + t13;
+    t8 = t4 - t9;
+    t10 = t0 - t13;
+    t0 = t4 + t9;
+    t13 = t2 - t5;
+    t4 = t12 + t7;
+    re[85] = t3;
+    im[85] = t1;
+    re[133] = t11;
+    im[133] = t14;
+    re[181] = t6;
+    im[181] = t8;
+    re[229] = t10;
+    im[229] = t0;
+    re[37] = t13;
+    im[37] = t4;
+    t9 = re[145];
+    t2 = im[145];
+    t5 = re[193];
+    t12 = im[193];
+    t7 = re[1];
+    t3 = im[1];
+    t1 = re[49];
+    t11 = im[49];
+    t14 = re[97];
+    t6 = im[97];
+    t8 = t5 + t14;
+    t10 = t12 + t6;
+    t0 = t7 + t1;
+    t13 = t3 + t11;
+    t4 = t5 - t14;
+    t5 = t12 - t6;
+    t14 = t7 - t1;
+    t12 = t3 - t11;
+    t6 = t8 + t0;
+    t7 = t10 + t13;
+    t1 = t8 - t0;
+    t3 = C5 * t1;
+    t11 = t10 - t13;
+    t8 = C5 * t11;
+    t0 = C6 * t6;
+    t1 = t9 - t0;
+    t10 = C6 * t7;
+    t13 = t2 - t10;
+    t11 = t1 + t3;
+    t0 = t13 + t8;
+    t10 = t1 - t3;
+    t1 = t13 - t8;
+    t3 = C7 * t4;
+    t13 = C8 * t14;
+    t8 = t3 + t13;
+    t3 = C7 * t5;
+    t13 = C8 * t12;
+    t3 = t3 + t13;
+    t13 = C8 * t4;
+    t4 = C7 * t14;
+    t14 = t13 - t4;
+    t13 = C8 * t5;
+    t4 = C7 * t12;
+    t5 = t13 - t4;
+    t12 = t9 + t6;
+    t13 = t2 + t7;
+    t4 = t11 + t3;
+    t9 = t0 - t8;
+    t6 = t10 + t5;
+    t2 = t1 - t14;
+    t7 = t10 - t5;
+    t10 = t1 + t14;
+    t5 = t11 - t3;
+    t1 = t0 + t8;
+    re[145] = t12;
+    im[145] = t13;
+    re[193] = t4;
+    im[193] = t9;
+    re[1] = t6;
+    im[1] = t2;
+    re[49] = t7;
+    im[49] = t10;
+    re[97] = t5;
+    im[97] = t1;
+    t14 = re[0];
+    t11 = im[0];
+    t3 = re[80];
+    t0 = im[80];
+    t8 = re[160];
+    t12 = im[160];
+    t13 = t3 + t8;
+    t4 = t0 + t12;
+    t9 = C9 * t13;
+    t6 = t14 - t9;
+    t2 = C9 * t4;
+    t7 = t11 - t2;
+    t10 = t3 - t8;
+    t5 = C10 * t10;
+    t1 = t0 - t12;
+    t9 = C10 * t1;
+    t2 = t14 + t13;
+    t3 = t11 + t4;
+    t8 = t6 + t9;
+    t10 = t7 - t5;
+    t0 = t6 - t9;
+    t12 = t7 + t5;
+    t1 = (-C11) * t2;
+    t14 = (-C12) * t3;
+    t13 = t1 + t14;
+    t11 = 0.0567432827310587 * t13;
+    y[719] = t11;
+    t4 = 0.05619993399963794 * t13;
+    y[720] = t4;
+    t6 = C12 * t2;
+    t9 = (-C11) * t3;
+    t7 = t6 + t9;
+    t5 = 0.03645468738771164 * t7;
+    y[239] = t5;
+    t1 = (-0.037324517362488444) * t7;
+    y[240] = t1;
+    t14 = C13 * t8;
+    t11 = C14 * t10;
+    t13 = t14 + t11;
+    y[80] = 0;
+    t4 = (-0.06522570433233141) * t13;
+    y[399] = t4;
+    t2 = (-C14) * t8;
+    t3 = C13 * t10;
+    t6 = t2 + t3;
+    t9 = 0.06388074623827882 * t6;
+    y[560] = t9;
+    t5 = (-0.006213011038741749) * t6;
+    y[879] = t5;
+    t7 = (-C15) * t0;
+    t1 = (-C16) * t12;
+    t14 = t7 + t1;
+    t11 = 0.06388338863652754 * t14;
+    y[559] = t11;
+    t13 = (-0.0061292399876755185) * t14;
+    y[880] = t13;
+    t4 = C16 * t0;
+    t8 = (-C15) * t12;
+    t10 = t4 + t8;
+    y[79] = 0;
+    t2 = (-0.06522300641209615) * t10;
+    y[400] = t2;
+    t3 = re[108];
+    t9 = im[108];
+    t6 = re[188];
+    t5 = im[188];
+    t7 = re[28];
+    t1 = im[28];
+    t11 = t6 + t7;
+    t14 = t5 + t1;
+    t13 = C9 * t11;
+    t0 = t3 - t13;
+    t12 = C9 * t14;
+    t4 = t9 - t12;
+    t8 = t6 - t7;
+    t10 = C10 * t8;
+    t2 = t5 - t1;
+    t13 = C10 * t2;
+    t12 = t3 + t11;
+    t6 = t9 + t14;
+    t7 = t0 + t13;
+    t8 = t4 - t10;
+    t5 = t0 - t13;
+    t1 = t4 + t10;
+    t2 = (-C17) * t12;
+    t3 = (-C18) * t6;
+    t11 = t2 + t3;
+    t9 = 0.06388821873047874 * t11;
+    y[557] = t9;
+    t14 = (-0.005953289064914111) * t11;
+    y[882] = t14;
+    t0 = C18 * t12;
+    t13 = (-C17) * t6;
+    t4 = t0 + t13;
+    y[77] = 0;
+    t10 = (-0.06521807540517484) * t4;
+    y[402] = t10;
+    t2 = (-C19) * t7;
+    t3 = (-C20) * t8;
+    t9 = t2 + t3;
+    t11 = 0.057786933794756926 * t9;
+    y[717] = t11;
+    t14 = 0.055071571653496555 * t9;
+    y[722] = t14;
+    t12 = C20 * t7;
+    t6 = (-C19) * t8;
+    t0 = t12 + t6;
+    t13 = 0.0346948631711804 * t0;
+    y[237] = t13;
+    t4 = (-0.03903937923994008) * t0;
+    y[242] = t4;
+    t10 = C21 * t5;
+    t2 = C22 * t1;
+    t3 = t10 + t2;
+    y[82] = 0;
+    t11 = (-0.06523163211317352) * t3;
+    y[397] = t11;
+    t9 = (-C22) * t5;
+    t14 = C21 * t1;
+    t7 = t9 + t14;
+    t8 = 0.06387494121621416 * t7;
+    y[562] = t8;
+    t12 = (-0.006371533022392319) * t7;
+    y[877] = t12;
+    t6 = re[216];
+    t13 = im[216];
+    t0 = re[56];
+    t4 = im[56];
+    t10 = re[136];
+    t2 = im[136];
+    t3 = t0 + t10;
+    t11 = t4 + t2;
+    t5 = C9 * t3;
+    t1 = t6 - t5;
+    t9 = C9 * t11;
+    t14 = t13 - t9;
+    t8 = t0 - t10;
+    t7 = C10 * t8;
+    t12 = t4 - t2;
+    t5 = C10 * t12;
+    t9 = t6 + t3;
+    t0 = t13 + t11;
+    t10 = t1 + t5;
+    t8 = t14 - t7;
+    t4 = t1 - t5;
+    t2 = t14 + t7;
+    t12 = C23 * t9;
+    t6 = C24 * t0;
+    t3 = t12 + t6;
+    y[84] = 0;
+    t13 = (-0.0652382282295469) * t3;
+    y[395] = t13;
+    t11 = (-C24) * t9;
+    t1 = C23 * t0;
+    t5 = t11 + t1;
+    t14 = 0.06386848293926461 * t5;
+    y[564] = t14;
+    t7 = (-0.006517457804168838) * t5;
+    y[875] = t7;
+    t12 = (-C25) * t10;
+    t6 = (-C26) * t8;
+    t3 = t12 + t6;
+    t13 = 0.06389241433934915 * t3;
+    y[555] = t13;
+    t9 = (-0.005766978299216103) * t3;
+    y[884] = t9;
+    t0 = C26 * t10;
+    t11 = (-C25) * t8;
+    t1 = t0 + t11;
+    y[75] = 0;
+    t14 = (-0.06521379274441592) * t1;
+    y[404] = t14;
+    t5 = (-C27) * t4;
+    t7 = (-C28) * t2;
+    t12 = t5 + t7;
+    t6 = 0.05877163873142865 * t12;
+    y[715] = t6;
+    t13 = 0.05388991267917035 * t12;
+    y[724] = t13;
+    t3 = C28 * t4;
+    t9 = (-C27) * t2;
+    t10 = t3 + t9;
+    t8 = 0.032913357533032775 * t10;
+    y[235] = t8;
+    t0 = (-0.040716385571083216) * t10;
+    y[244] = t0;
+    t11 = re[84];
+    t1 = im[84];
+    t14 = re[164];
+    t5 = im[164];
+    t7 = re[4];
+    t6 = im[4];
+    t12 = t14 + t7;
+    t13 = t5 + t6;
+    t4 = C9 * t12;
+    t2 = t11 - t4;
+    t3 = C9 * t13;
+    t9 = t1 - t3;
+    t8 = t14 - t7;
+    t10 = C10 * t8;
+    t0 = t5 - t6;
+    t4 = C10 * t0;
+    t3 = t11 + t12;
+    t14 = t1 + t13;
+    t7 = t2 + t4;
+    t8 = t9 - t10;
+    t5 = t2 - t4;
+    t6 = t9 + t10;
+    t0 = (-C29) * t3;
+    t11 = (-C30) * t14;
+    t12 = t0 + t11;
+    t1 = 0.05969556670068119 * t12;
+    y[713] = t1;
+    t13 = 0.05265764361408573 * t12;
+    y[726] = t13;
+    t2 = C30 * t3;
+    t4 = (-C29) * t14;
+    t9 = t2 + t4;
+    t10 = 0.031117245495375336 * t9;
+    y[233] = t10;
+    t0 = (-0.0423499764361958) * t9;
+    y[246] = t0;
+    t11 = C31 * t7;
+    t1 = C32 * t8;
+    t12 = t11 + t1;
+    y[86] = 0;
+    t13 = (-0.06524546624665062) * t12;
+    y[393] = t13;
+    t3 = (-C32) * t7;
+    t14 = C31 * t8;
+    t2 = t3 + t14;
+    t4 = 0.0638613976780427 * t2;
+    y[566] = t4;
+    t10 = (-0.006649807866197572) * t2;
+    y[873] = t10;
+    t9 = (-C33) * t5;
+    t0 = (-C34) * t6;
+    t11 = t9 + t0;
+    t1 = 0.06389599747119415 * t11;
+    y[553] = t1;
+    t12 = (-0.005571375328374209) * t11;
+    y[886] = t12;
+    t13 = C34 * t5;
+    t7 = (-C33) * t6;
+    t8 = t13 + t7;
+    y[73] = 0;
+    t3 = (-0.06521013571382306) * t8;
+    y[406] = t3;
+    t14 = re[207];
+    t4 = im[207];
+    t2 = re[47];
+    t10 = im[47];
+    t9 = re[127];
+    t0 = im[127];
+    t1 = t2 + t9;
+    t11 = t10 + t0;
+    t12 = C9 * t1;
+    t5 = t14 - t12;
+    t6 = C9 * t11;
+    t13 = t4 - t6;
+    t7 = t2 - t9;
+    t8 = C10 * t7;
+    t3 = t10 - t0;
+    t12 = C10 * t3;
+    t6 = t14 + t1;
+    t2 = t4 + t11;
+    t9 = t5 + t12;
+    t7 = t13 - t8;
+    t10 = t5 - t12;
+    t0 = t13 + t8;
+    t3 = (-C35) * t6;
+    t14 = (-C36) * t2;
+    t1 = t3 + t14;
+    t4 = 0.06389906155872181 * t1;
+    y[551] = t4;
+    t11 = (-0.005367462631492221) * t1;
+    y[888] = t11;
+    t5 = C36 * t6;
+    t12 = (-C35) * t2;
+    t13 = t5 + t12;
+    y[71] = 0;
+    t8 = (-0.06520700875767307) * t13;
+    y[408] = t8;
+    t3 = (-C37) * t9;
+    t14 = (-C38) * t7;
+    t4 = t3 + t14;
+    t1 = 0.060557288918556856 * t4;
+    y[711] = t1;
+    t11 = 0.051377800648534894 * t4;
+    y[728] = t11;
+    t6 = C38 * t9;
+    t2 = (-C37) * t7;
+    t5 = t6 + t2;
+    t12 = 0.02931342966143716 * t5;
+    y[231] = t12;
+    t13 = (-0.04393537373799463) * t5;
+    y[248] = t13;
+    t8 = C39 * t10;
+    t3 = C40 * t0;
+    t14 = t8 + t3;
+    y[88] = 0;
+    t1 = (-0.06525329218524087) * t14;
+    y[391] = t1;
+    t4 = (-C40) * t10;
+    t11 = C39 * t0;
+    t9 = t4 + t11;
+    t7 = 0.06385373867173391 * t9;
+    y[568] = t7;
+    t6 = (-0.006767643514685339) * t9;
+    y[871] = t6;
+    t2 = re[75];
+    t12 = im[75];
+    t5 = re[155];
+    t13 = im[155];
+    t8 = re[235];
+    t3 = im[235];
+    t14 = t5 + t8;
+    t1 = t13 + t3;
+    t10 = C9 * t14;
+    t0 = t2 - t10;
+    t4 = C9 * t1;
+    t11 = t12 - t4;
+    t7 = t5 - t8;
+    t9 = C10 * t7;
+    t6 = t13 - t3;
+    t10 = C10 * t6;
+    t4 = t2 + t14;
+    t5 = t12 + t1;
+    t8 = t0 + t10;
+    t7 = t11 - t9;
+    t13 = t0 - t10;
+    t3 = t11 + t9;
+    t6 = C41 * t4;
+    t2 = C42 * t5;
+    t14 = t6 + t2;
+    y[90] = 0;
+    t12 = (-0.06526165367401689) * t14;
+    y[389] = t12;
+    t1 = (-C42) * t4;
+    t0 = C41 * t5;
+    t10 = t1 + t0;
+    t11 = 0.06384555756860284 * t10;
+    y[570] = t11;
+    t9 = (-0.006870303371576403) * t10;
+    y[869] = t9;
+    t6 = (-C43) * t8;
+    t2 = (-C44) * t7;
+    t14 = t6 + t2;
+    t12 = 0.06390164712913438 * t14;
+    y[549] = t12;
+    t4 = (-0.005156238730818343) * t14;
+    y[890] = t4;
+    t5 = C44 * t8;
+    t1 = (-C43) * t7;
+    t0 = t5 + t1;
+    y[69] = 0;
+    t11 = (-0.06520437037008672) * t0;
+    y[410] = t11;
+    t10 = (-C45) * t13;
+    t9 = (-C46) * t3;
+    t6 = t10 + t9;
+    t2 = 0.061355936833779226 * t6;
+    y[709] = t2;
+    t12 = 0.05005367438834188 * t6;
+    y[730] = t12;
+    t14 = C46 * t13;
+    t4 = (-C45) * t3;
+    t8 = t14 + t4;
+    t7 = 0.027509626239848872 * t8;
+    y[229] = t7;
+    t5 = (-0.04546762605662681) * t8;
+    y[250] = t5;
+}
+
+/**
+ *  Part 5 of ApplyWindowedIMDCT_W10_480_K160().
+ * 
+ *  @param {Number[]} X 
+ *    - The input block (480 points, only the first 160 points are used).
+ *  @param {Number[]} y 
+ *    - The array that would contain the output block (960 points).
+ *  @param {Number[]} re 
+ *    - The scratch buffer (real part, 240 points).
+ *  @param {Number[]} im 
+ *    - The scratch buffer (imaginary part, 240 points).
+ */
+function ApplyWindowedIMDCT_W10_480_K160_Part5(X, y, re, im) {
+    let t0, t1, t10, t11, t12, t13, t14, t2, t3, t4, t5, t6, t7, t8, t9;
+    const C0 = 0.5;
+    const C1 = 0.8660254037844386;
+    const C2 = 0.9991634599276488;
+    const C3 = 0.04089474716158345;
+    const C4 = 0.46416584004055156;
+    const C5 = 0.8857483124112905;
+    const C6 = 0.8448535652497071;
+    const C7 = 0.5349976198870972;
+    const C8 = 0.841333943657443;
+    const C9 = 0.5405156753044398;
+    const C10 = 0.9988744059257111;
+    const C11 = 0.0474333341286245;
+    const C12 = 0.45835873062127125;
+    const C13 = 0.8887672777860675;
+    const C14 = 0.45253198663950756;
+    const C15 = 0.8917481713287112;
+    const C16 = 0.8377782821192093;
+    const C17 = 0.5460105768292282;
+    const C18 = 0.9985425634687357;
+    const C19 = 0.05396988920950189;
+    const C20 = 0.998167946771749;
+    const C21 = 0.06050413239995127;
+    const C22 = 0.44668585769357955;
+    const C23 = 0.8946908653476636;
+    const C24 = 0.8341867329477124;
+    const C25 = 0.5514820890781694;
+    const C26 = 0.8305594499929649;
+    const C27 = 0.5569299776698895;
+    const C28 = 0.9977505718820835;
+    const C29 = 0.06703578379474202;
+    const C30 = 0.44082059421219394;
+    const C31 = 0.8975952337877069;
+    const C32 = 0.43493644744371707;
+    const C33 = 0.9004611522353636;
+    const C34 = 0.8268965886356963;
+    const C35 = 0.562354009234973;
+    const C36 = 0.9972904566786902;
+    const C37 = 0.07356456359966743;
+    const C38 = 0.9967876208713732;
+    const C39 = 0.08009019214353008;
+    const C40 = 0.42903366944541266;
+    const C41 = 0.9032884979242259;
+    const C42 = 0.8231983057806959;
+    const C43 = 0.5677539514259605;
+    const C44 = 0.8194647598500926;
+    const C45 = 0.5731295729273007;
+    const C46 = 0.9962420859999448;
+    const C47 = 0.08661238989012217;
+    const C48 = 0.42311251307264414;
+    const C49 = 0.9060771497402148;
+    const C50 = 0.41717323196804335;
+    const C51 = 0.9088269882267676;
+    const C52 = 0.8156961107765678;
+    const C53 = 0.57848064346526;
+    const C54 = 0.9956538754333033;
+    const C55 = 0.0931308774501998;
+    const C56 = 0.9950230143684317;
+    const C57 = 0.09964537559345106;
+    const C58 = 0.41121608055064524;
+    const C59 = 0.9115378955899558;
+    const C60 = 0.8118925199965048;
+    const C61 = 0.5838069338177863;
+    const C62 = 0.8080541504430732;
+    const C63 = 0.5891082158243282;
+    const C64 = 0.9943495298293181;
+    const C65 = 0.10615560526045748;
+    const C66 = 0.40524131400498986;
+    const C67 = 0.9142097557035307;
+    const C68 = 0.3992491882701903;
+    const C69 = 0.9168424541138974;
+    const C70 = 0.8041811665392496;
+    const C71 = 0.5943842623956086;
+    const C72 = 0.9936334506657989;
+    const C73 = 0.1126612875746478;
+    const C74 = 0.9928748075523219;
+    const C75 = 0.11916214385424433;
+    const C76 = 0.3932399600289696;
+    const C77 = 0.9194358780450186;
+    const C78 = 0.8002737341907743;
+    const C79 = 0.5996348475233523;
+    const C80 = 0.796332020779044;
+    const C81 = 0.6048597462899679;
+    const C82 = 0.9920736329866334;
+    const C83 = 0.12565789562420054;
+    const C84 = 0.38721388669666557;
+    const C85 = 0.9219899164032446;
+    const C86 = 0.38117122641020335;
+    const C87 = 0.9245044597820724;
+    const C88 = 0.7923561951539422;
+    const C89 = 0.6100587348781819;
+    const C90 = 0.9912299612883853;
+    const C91 = 0.13214826462813015;
+    const C92 = 0.9903438285976649;
+    const C93 = 0.1386329728402267;
+    const C94 = 0.375112238017038;
+    const C95 = 0.9269794004668329;
+    const C96 = 0.7883464276266063;
+    const C97 = 0.6152315905806268;
+    const C98 = 0.7843028899621314;
+    const C99 = 0.6203780918093811;
+    const C100 = 0.9894152728734475;
+    const C101 = 0.1451117424771731;
+    const C102 = 0.36903718106406647;
+    const C103 = 0.9294146324393044;
+    const C104 = 0.3629463157865092;
+    const C105 = 0.9318100513822544;
+    const C106 = 0.7802257553722132;
+    const C107 = 0.6254980181054608;
+    const C108 = 0.98844433389197;
+    const C109 = 0.15158429601004111;
+    const C110 = 0.9874310532450267;
+    const C111 = 0.15805035617617982;
+    const C112 = 0.35683990309676283;
+    const C113 = 0.9341655546839077;
+    const C114 = 0.7761151985077279;
+    const C115 = 0.6305911501482637;
+    const C116 = 0.7719713954512504;
+    const C117 = 0.6356572697649648;
+    const C118 = 0.9863754743381881;
+    const C119 = 0.16450964599109233;
+    const C120 = 0.35071820457322317;
+    const C121 = 0.9364810414423427;
+    const C122 = 0.34458148244908043;
+    const C123 = 0.9387564124698132;
+    const C124 = 0.7677945237095121;
+    const C125 = 0.6406961599398607;
+    const C126 = 0.9852776423889412;
+    const C127 = 0.17096188876030122;
+    const C128 = 0.9841376044247531;
+    const C129 = 0.17740680809120096;
+    const C130 = 0.33842999960108583;
+    const C131 = 0.9409915702969974;
+    const C132 = 0.7635847622057964;
+    const C133 = 0.6457076048236673;
+    const C134 = 0.7593422912722755;
+    const C135 = 0.6506913897427649;
+    const C136 = 0.9829554092810556;
+    const C137 = 0.18384412790489776;
+    const C138 = 0.33226401953829077;
+    const C139 = 0.9431864191771733;
+    const C140 = 0.3260838063907591;
+    const C141 = 0.9453408650903197;
+    const C142 = 0.7550672926422838;
+    const C143 = 0.655647301208395;
+    const C144 = 0.9817311075991542;
+    const C145 = 0.1902735724480359;
+    const C146 = 0.980464751824058;
+    const C147 = 0.19669486630460994;
+    const C148 = 0.31988962489825296;
+    const C149 = 0.9474548157471442;
+    const C150 = 0.7507599494425343;
+    const C151 = 0.660575126925805;
+    const C152 = 0.7464204461852738;
+    const C153 = 0.6654746558033422;
+    const C154 = 0.9791563962022337;
+    const C155 = 0.2031077344077629;
+    const C156 = 0.3136817403988915;
+    const C157 = 0.9495281805930367;
+    const C158 = 0.3074604188177852;
+    const C159 = 0.9515608708119476;
+    const C160 = 0.7420489687603788;
+    const C161 = 0.6703456779614965;
+    const C162 = 0.9778060967792817;
+    const C163 = 0.20951190205156878;
+    const C164 = 0.9764139113975349;
+    const C165 = 0.21590709490280058;
+    const C166 = 0.30122592665564446;
+    const C167 = 0.9535527993301935;
+    const C168 = 0.737645704427393;
+    const C169 = 0.6751879847418903;
+    const C170 = 0.7332108418075048;
+    const C171 = 0.6800013687162181;
+    const C172 = 0.9749798996935817;
+    const C173 = 0.2222930390126813;
+    const C174 = 0.2949785309773635;
+    const C175 = 0.9555038808201862;
+    const C176 = 0.28871849940058025;
+    const C177 = 0.9574140317040883;
+    const C178 = 0.728744570875469;
+    const C179 = 0.6847856236951303;
+    const C180 = 0.9735041230957107;
+    const C181 = 0.22866946082861941;
+    const C182 = 0.9719866448212794;
+    const C183 = 0.23503608720592667;
+    const C184 = 0.2824461000842125;
+    const C185 = 0.9592831701573936;
+    const C186 = 0.724247082951467;
+    const C187 = 0.6895405447370668;
+    const C188 = 0.7197185706929127;
+    const C189 = 0.6942659281570361;
+    const C190 = 0.9704275298740068;
+    const C191 = 0.2413926454195189;
+    const C192 = 0.27616160171697074;
+    const C193 = 0.9611112161124317;
+    t1 = re[183];
+    t0 = im[183];
+    t11 = re[23];
+    t10 = im[23];
+    t9 = re[103];
+    t2 = im[103];
+    t6 = t11 + t9;
+    t12 = t10 + t2;
+    t13 = C0 * t6;
+    t3 = t1 - t13;
+    t14 = C0 * t12;
+    t4 = t0 - t14;
+    t7 = t11 - t9;
+    t8 = C1 * t7;
+    t5 = t10 - t2;
+    t13 = C1 * t5;
+    t14 = t1 + t6;
+    t11 = t0 + t12;
+    t9 = t3 + t13;
+    t7 = t4 - t8;
+    t10 = t3 - t13;
+    t2 = t4 + t8;
+    t5 = (-C2) * t14;
+    t1 = (-C3) * t11;
+    t6 = t5 + t1;
+    t0 = 0.062091117254326235 * t6;
+    y[707] = t0;
+    t12 = 0.048688863681974705 * t6;
+    y[732] = t12;
+    t3 = C3 * t14;
+    t13 = (-C2) * t11;
+    t4 = t3 + t13;
+    t8 = 0.025713379431564674 * t4;
+    y[227] = t8;
+    t5 = (-0.04694248661658992) * t4;
+    y[252] = t5;
+    t1 = C4 * t9;
+    t0 = C5 * t7;
+    t6 = t1 + t0;
+    y[92] = 0;
+    t12 = (-0.0652704756805466) * t6;
+    y[387] = t12;
+    t14 = (-C5) * t9;
+    t11 = C4 * t7;
+    t3 = t14 + t11;
+    t13 = 0.06383692815507565 * t3;
+    y[572] = t13;
+    t8 = (-0.006957168833277857) * t3;
+    y[867] = t8;
+    t4 = (-C6) * t10;
+    t5 = (-C7) * t2;
+    t1 = t4 + t5;
+    t0 = 0.06390387378480732 * t1;
+    y[547] = t0;
+    t6 = (-0.004938814307956446) * t1;
+    y[892] = t6;
+    t12 = C7 * t10;
+    t9 = (-C6) * t2;
+    t7 = t12 + t9;
+    y[67] = 0;
+    t14 = (-0.0652020984001327) * t7;
+    y[412] = t14;
+    t11 = re[51];
+    t13 = im[51];
+    t3 = re[131];
+    t8 = im[131];
+    t4 = re[211];
+    t5 = im[211];
+    t0 = t3 + t4;
+    t1 = t8 + t5;
+    t6 = C0 * t0;
+    t10 = t11 - t6;
+    t2 = C0 * t1;
+    t12 = t13 - t2;
+    t9 = t3 - t4;
+    t7 = C1 * t9;
+    t14 = t8 - t5;
+    t6 = C1 * t14;
+    t2 = t11 + t0;
+    t3 = t13 + t1;
+    t4 = t10 + t6;
+    t9 = t12 - t7;
+    t8 = t10 - t6;
+    t5 = t12 + t7;
+    t14 = (-C8) * t2;
+    t11 = (-C9) * t3;
+    t0 = t14 + t11;
+    t13 = 0.06390582811752152 * t0;
+    y[545] = t13;
+    t1 = (-0.004716377931516046) * t0;
+    y[894] = t1;
+    t10 = C9 * t2;
+    t6 = (-C8) * t3;
+    t12 = t10 + t6;
+    y[65] = 0;
+    t7 = (-0.06520010442559714) * t12;
+    y[414] = t7;
+    t14 = (-C10) * t4;
+    t11 = (-C11) * t9;
+    t13 = t14 + t11;
+    t0 = 0.0627627062181664 * t13;
+    y[705] = t0;
+    t1 = 0.04728713705877805 * t13;
+    y[734] = t1;
+    t2 = C11 * t4;
+    t3 = (-C10) * t9;
+    t10 = t2 + t3;
+    t6 = 0.02393234998677991 * t10;
+    y[225] = t6;
+    t12 = (-0.04835633349131633) * t10;
+    y[254] = t12;
+    t7 = C12 * t8;
+    t14 = C13 * t5;
+    t11 = t7 + t14;
+    y[94] = 0;
+    t0 = (-0.06527966152120607) * t11;
+    y[385] = t0;
+    t13 = (-C13) * t8;
+    t1 = C12 * t5;
+    t4 = t13 + t1;
+    t9 = 0.06382794532893109 * t4;
+    y[574] = t9;
+    t2 = (-0.007027464603568059) * t4;
+    y[865] = t2;
+    t3 = re[174];
+    t6 = im[174];
+    t10 = re[14];
+    t12 = im[14];
+    t7 = re[94];
+    t14 = im[94];
+    t11 = t10 + t7;
+    t0 = t12 + t14;
+    t8 = C0 * t11;
+    t5 = t3 - t8;
+    t13 = C0 * t0;
+    t1 = t6 - t13;
+    t9 = t10 - t7;
+    t4 = C1 * t9;
+    t2 = t12 - t14;
+    t8 = C1 * t2;
+    t13 = t3 + t11;
+    t10 = t6 + t0;
+    t7 = t5 + t8;
+    t9 = t1 - t4;
+    t12 = t5 - t8;
+    t14 = t1 + t4;
+    t2 = C14 * t13;
+    t3 = C15 * t10;
+    t11 = t2 + t3;
+    y[96] = 0;
+    t6 = (-0.06528912567514392) * t11;
+    y[383] = t6;
+    t0 = (-C15) * t13;
+    t5 = C14 * t10;
+    t8 = t0 + t5;
+    t1 = 0.06381869298416643 * t8;
+    y[576] = t1;
+    t4 = (-0.007080482030554512) * t8;
+    y[863] = t4;
+    t2 = (-C16) * t7;
+    t3 = (-C17) * t9;
+    t11 = t2 + t3;
+    t6 = 0.06390765994078162 * t11;
+    y[543] = t6;
+    t13 = (-0.0044900766713811035) * t11;
+    y[896] = t13;
+    t10 = C17 * t7;
+    t0 = (-C16) * t9;
+    t5 = t10 + t0;
+    y[63] = 0;
+    t1 = (-0.06519823555623225) * t5;
+    y[416] = t1;
+    t8 = (-C18) * t12;
+    t4 = (-C19) * t14;
+    t2 = t8 + t4;
+    t3 = 0.06337102837607919 * t2;
+    y[703] = t3;
+    t6 = 0.04585225338316315 * t2;
+    y[736] = t6;
+    t11 = C19 * t12;
+    t13 = (-C18) * t14;
+    t7 = t11 + t13;
+    t9 = 0.022174305731326876 * t7;
+    y[223] = t9;
+    t10 = (-0.049706070145883165) * t7;
+    y[256] = t10;
+    t0 = re[42];
+    t5 = im[42];
+    t1 = re[122];
+    t8 = im[122];
+    t4 = re[202];
+    t3 = im[202];
+    t2 = t1 + t4;
+    t6 = t8 + t3;
+    t12 = C0 * t2;
+    t14 = t0 - t12;
+    t11 = C0 * t6;
+    t13 = t5 - t11;
+    t9 = t1 - t4;
+    t7 = C1 * t9;
+    t10 = t8 - t3;
+    t12 = C1 * t10;
+    t11 = t0 + t2;
+    t1 = t5 + t6;
+    t4 = t14 + t12;
+    t9 = t13 - t7;
+    t8 = t14 - t12;
+    t3 = t13 + t7;
+    t10 = (-C20) * t11;
+    t0 = (-C21) * t1;
+    t2 = t10 + t0;
+    t5 = 0.06391653084346428 * t2;
+    y[701] = t5;
+    t6 = 0.04438809399288695 * t2;
+    y[738] = t6;
+    t14 = C21 * t11;
+    t12 = (-C20) * t1;
+    t13 = t14 + t12;
+    t7 = 0.02044703037611674 * t13;
+    y[221] = t7;
+    t10 = (-0.050989343718260305) * t13;
+    y[258] = t10;
+    t0 = C22 * t4;
+    t5 = C23 * t9;
+    t2 = t0 + t5;
+    y[98] = 0;
+    t6 = (-0.06529873681880845) * t2;
+    y[381] = t6;
+    t11 = (-C23) * t4;
+    t1 = C22 * t9;
+    t14 = t11 + t1;
+    t12 = 0.06380929968413282 * t14;
+    y[578] = t12;
+    t7 = (-0.007115524149486865) * t14;
+    y[861] = t7;
+    t13 = (-C24) * t8;
+    t10 = (-C25) * t3;
+    t0 = t13 + t10;
+    t5 = 0.06390948422644374 * t0;
+    y[541] = t5;
+    t2 = (-0.004260902338958278) * t0;
+    y[898] = t2;
+    t6 = C25 * t8;
+    t4 = (-C24) * t3;
+    t9 = t6 + t4;
+    y[61] = 0;
+    t11 = (-0.06519637448337647) * t9;
+    y[418] = t11;
+    t1 = re[150];
+    t12 = im[150];
+    t14 = re[230];
+    t7 = im[230];
+    t13 = re[70];
+    t10 = im[70];
+    t5 = t14 + t13;
+    t0 = t7 + t10;
+    t2 = C0 * t5;
+    t8 = t1 - t2;
+    t3 = C0 * t0;
+    t6 = t12 - t3;
+    t4 = t14 - t13;
+    t9 = C1 * t4;
+    t11 = t7 - t10;
+    t2 = C1 * t11;
+    t3 = t1 + t5;
+    t14 = t12 + t0;
+    t13 = t8 + t2;
+    t4 = t6 - t9;
+    t7 = t8 - t2;
+    t10 = t6 + t9;
+    t11 = (-C26) * t3;
+    t1 = (-C27) * t14;
+    t5 = t11 + t1;
+    t12 = 0.06391147058784913 * t5;
+    y[539] = t12;
+    t0 = (-0.004029906321403751) * t5;
+    y[900] = t0;
+    t8 = C27 * t3;
+    t2 = (-C26) * t14;
+    t6 = t8 + t2;
+    y[59] = 0;
+    t9 = (-0.06519434818730074) * t6;
+    y[420] = t9;
+    t11 = (-C28) * t13;
+    t1 = (-C29) * t4;
+    t12 = t11 + t1;
+    t5 = 0.06440024074112252 * t12;
+    y[699] = t5;
+    t0 = 0.042898717811937714 * t12;
+    y[740] = t0;
+    t3 = C29 * t13;
+    t14 = (-C28) * t4;
+    t8 = t3 + t14;
+    t2 = 0.018758124542946664 * t8;
+    y[219] = t2;
+    t6 = (-0.05220426409168448) * t8;
+    y[260] = t6;
+    t9 = C30 * t7;
+    t11 = C31 * t10;
+    t1 = t9 + t11;
+    y[100] = 0;
+    t5 = (-0.06530837587776828) * t1;
+    y[379] = t5;
+    t12 = (-C31) * t7;
+    t0 = C30 * t10;
+    t13 = t12 + t0;
+    t4 = 0.06379988187832196 * t13;
+    y[580] = t4;
+    t3 = (-0.007132088987455223) * t13;
+    y[859] = t3;
+    t14 = re[18];
+    t2 = im[18];
+    t8 = re[98];
+    t6 = im[98];
+    t9 = re[178];
+    t11 = im[178];
+    t1 = t8 + t9;
+    t5 = t6 + t11;
+    t7 = C0 * t1;
+    t10 = t14 - t7;
+    t12 = C0 * t5;
+    t0 = t2 - t12;
+    t4 = t8 - t9;
+    t13 = C1 * t4;
+    t3 = t6 - t11;
+    t7 = C1 * t3;
+    t12 = t14 + t1;
+    t8 = t2 + t5;
+    t9 = t10 + t7;
+    t4 = t0 - t13;
+    t6 = t10 - t7;
+    t11 = t0 + t13;
+    t3 = C32 * t12;
+    t14 = C33 * t8;
+    t1 = t3 + t14;
+    y[102] = 0;
+    t2 = (-0.06531792458769385) * t1;
+    y[377] = t2;
+    t5 = (-C33) * t12;
+    t10 = C32 * t8;
+    t7 = t5 + t10;
+    t0 = 0.06379055508832998 * t7;
+    y[582] = t0;
+    t13 = (-0.007129758433364301) * t7;
+    y[857] = t13;
+    t3 = (-C34) * t9;
+    t14 = (-C35) * t4;
+    t1 = t3 + t14;
+    t2 = 0.06391374403022049 * t1;
+    y[537] = t2;
+    t12 = (-0.003798281081887221) * t1;
+    y[902] = t12;
+    t8 = C35 * t9;
+    t5 = (-C34) * t4;
+    t10 = t8 + t5;
+    y[57] = 0;
+    t0 = (-0.06519202919322843) * t10;
+    y[422] = t0;
+    t7 = (-C36) * t6;
+    t13 = (-C37) * t11;
+    t3 = t7 + t13;
+    t14 = 0.06482389829314764 * t3;
+    y[697] = t14;
+    t2 = 0.041388190121589154 * t3;
+    y[742] = t2;
+    t1 = C37 * t6;
+    t12 = (-C36) * t11;
+    t9 = t1 + t12;
+    t4 = 0.017114937252602207 * t9;
+    y[217] = t4;
+    t8 = (-0.0533493122258349) * t9;
+    y[262] = t8;
+    t5 = re[141];
+    t10 = im[141];
+    t0 = re[221];
+    t7 = im[221];
+    t13 = re[61];
+    t14 = im[61];
+    t3 = t0 + t13;
+    t2 = t7 + t14;
+    t6 = C0 * t3;
+    t11 = t5 - t6;
+    t1 = C0 * t2;
+    t12 = t10 - t1;
+    t4 = t0 - t13;
+    t9 = C1 * t4;
+    t8 = t7 - t14;
+    t6 = C1 * t8;
+    t1 = t5 + t3;
+    t0 = t10 + t2;
+    t13 = t11 + t6;
+    t4 = t12 - t9;
+    t7 = t11 - t6;
+    t14 = t12 + t9;
+    t8 = (-C38) * t1;
+    t5 = (-C39) * t0;
+    t3 = t8 + t5;
+    t10 = 0.06518919423924516 * t3;
+    y[695] = t10;
+    t2 = 0.03986069334723713 * t3;
+    y[744] = t2;
+    t11 = C39 * t1;
+    t6 = (-C38) * t0;
+    t12 = t11 + t6;
+    t9 = 0.01552465912360012 * t12;
+    y[215] = t9;
+    t8 = (-0.05442378957776079) * t12;
+    y[264] = t8;
+    t5 = C40 * t13;
+    t10 = C41 * t4;
+    t3 = t5 + t10;
+    y[104] = 0;
+    t2 = (-0.0653272164205366) * t3;
+    y[375] = t2;
+    t1 = (-C41) * t13;
+    t0 = C40 * t4;
+    t11 = t1 + t0;
+    t6 = 0.06378148182289317 * t11;
+    y[584] = t6;
+    t9 = (-0.007107865754189401) * t11;
+    y[855] = t9;
+    t12 = (-C42) * t7;
+    t8 = (-C43) * t14;
+    t5 = t12 + t8;
+    t10 = 0.06391650428469409 * t5;
+    y[535] = t10;
+    t3 = (-0.00356723377083791) * t5;
+    y[904] = t3;
+    t2 = C43 * t7;
+    t13 = (-C42) * t14;
+    t4 = t2 + t13;
+    y[55] = 0;
+    t1 = (-0.06518921385480789) * t4;
+    y[424] = t1;
+    t0 = re[9];
+    t6 = im[9];
+    t11 = re[89];
+    t9 = im[89];
+    t12 = re[169];
+    t8 = im[169];
+    t10 = t11 + t12;
+    t5 = t9 + t8;
+    t3 = C0 * t10;
+    t7 = t0 - t3;
+    t14 = C0 * t5;
+    t2 = t6 - t14;
+    t13 = t11 - t12;
+    t4 = C1 * t13;
+    t1 = t9 - t8;
+    t3 = C1 * t1;
+    t14 = t0 + t10;
+    t11 = t6 + t5;
+    t12 = t7 + t3;
+    t13 = t2 - t4;
+    t9 = t7 - t3;
+    t8 = t2 + t4;
+    t1 = (-C44) * t14;
+    t0 = (-C45) * t11;
+    t10 = t1 + t0;
+    t6 = 0.06391987476523325 * t10;
+    y[533] = t6;
+    t5 = (-0.003337666561289256) * t10;
+    y[906] = t5;
+    t7 = C45 * t14;
+    t3 = (-C44) * t11;
+    t2 = t7 + t3;
+    y[53] = 0;
+    t4 = (-0.06518577644230557) * t2;
+    y[426] = t4;
+    t1 = (-C46) * t12;
+    t0 = (-C47) * t13;
+    t6 = t1 + t0;
+    t10 = 0.06549826140010584 * t6;
+    y[693] = t10;
+    t5 = 0.03832033405423618 * t6;
+    y[746] = t5;
+    t14 = C47 * t12;
+    t11 = (-C46) * t13;
+    t7 = t14 + t11;
+    t3 = 0.013993950130755195 * t7;
+    y[213] = t3;
+    t2 = (-0.055427636479400355) * t7;
+    y[266] = t2;
+    t4 = C48 * t9;
+    t1 = C49 * t8;
+    t0 = t4 + t1;
+    y[106] = 0;
+    t10 = (-0.06533612118976226) * t0;
+    y[373] = t10;
+    t6 = (-C49) * t9;
+    t5 = C48 * t8;
+    t12 = t6 + t5;
+    t13 = 0.06377278893806684 * t12;
+    y[586] = t13;
+    t14 = (-0.007065752991958113) * t12;
+    y[853] = t14;
+    t11 = re[117];
+    t3 = im[117];
+    t7 = re[197];
+    t2 = im[197];
+    t4 = re[37];
+    t1 = im[37];
+    t0 = t7 + t4;
+    t10 = t2 + t1;
+    t9 = C0 * t0;
+    t8 = t11 - t9;
+    t6 = C0 * t10;
+    t5 = t3 - t6;
+    t13 = t7 - t4;
+    t12 = C1 * t13;
+    t14 = t2 - t1;
+    t9 = C1 * t14;
+    t6 = t11 + t0;
+    t7 = t3 + t10;
+    t4 = t8 + t9;
+    t13 = t5 - t12;
+    t2 = t8 - t9;
+    t1 = t5 + t12;
+    t14 = C50 * t6;
+    t11 = C51 * t7;
+    t0 = t14 + t11;
+    y[108] = 0;
+    t3 = (-0.06534446475572682) * t0;
+    y[371] = t3;
+    t10 = (-C51) * t6;
+    t8 = C50 * t7;
+    t9 = t10 + t8;
+    t5 = 0.06376464605292369 * t9;
+    y[588] = t5;
+    t12 = (-0.007003056530207578) * t9;
+    y[851] = t12;
+    t14 = (-C52) * t4;
+    t11 = (-C53) * t13;
+    t0 = t14 + t11;
+    t3 = 0.06392405017998871 * t0;
+    y[531] = t3;
+    t6 = (-0.003110581081497253) * t0;
+    y[908] = t6;
+    t7 = C53 * t4;
+    t10 = (-C52) * t13;
+    t8 = t7 + t10;
+    y[51] = 0;
+    t5 = (-0.06518151861364742) * t8;
+    y[428] = t5;
+    t9 = (-C54) * t2;
+    t12 = (-C55) * t1;
+    t14 = t9 + t12;
+    t11 = 0.06575363870072876 * t14;
+    y[691] = t11;
+    t3 = 0.03677105102748792 * t14;
+    y[748] = t3;
+    t0 = C55 * t2;
+    t6 = (-C54) * t1;
+    t4 = t0 + t6;
+    t13 = 0.01252924252967493 * t4;
+    y[211] = t13;
+    t7 = (-0.05636118887867944) * t4;
+    y[268] = t7;
+    t10 = re[225];
+    t8 = im[225];
+    t5 = re[65];
+    t9 = im[65];
+    t12 = re[145];
+    t11 = im[145];
+    t14 = t5 + t12;
+    t3 = t9 + t11;
+    t2 = C0 * t14;
+    t1 = t10 - t2;
+    t0 = C0 * t3;
+    t6 = t8 - t0;
+    t13 = t5 - t12;
+    t4 = C1 * t13;
+    t7 = t9 - t11;
+    t2 = C1 * t7;
+    t0 = t10 + t14;
+    t5 = t8 + t3;
+    t12 = t1 + t2;
+    t13 = t6 - t4;
+    t9 = t1 - t2;
+    t11 = t6 + t4;
+    t7 = (-C56) * t0;
+    t10 = (-C57) * t5;
+    t14 = t7 + t10;
+    t8 = 0.06595802496235868 * t14;
+    y[689] = t8;
+    t3 = 0.0352169718013232 * t14;
+    y[750] = t3;
+    t1 = C57 * t0;
+    t2 = (-C56) * t5;
+    t6 = t1 + t2;
+    t4 = 0.011136259783419419 * t6;
+    y[209] = t4;
+    t7 = (-0.0572255054946812) * t6;
+    y[270] = t7;
+    t10 = C58 * t12;
+    t8 = C59 * t13;
+    t14 = t10 + t8;
+    y[110] = 0;
+    t3 = (-0.06535210541705072) * t14;
+    y[369] = t3;
+    t0 = (-C59) * t12;
+    t5 = C58 * t13;
+    t1 = t0 + t5;
+    t2 = 0.06375719098989517 * t1;
+    y[590] = t2;
+    t4 = (-0.006919324745364981) * t1;
+    y[849] = t4;
+    t6 = (-C60) * t9;
+    t7 = (-C61) * t11;
+    t10 = t6 + t7;
+    t8 = 0.06392915612314413 * t10;
+    y[529] = t8;
+    t14 = (-0.0028871141740734983) * t10;
+    y[910] = t14;
+    t3 = C61 * t9;
+    t12 = (-C60) * t11;
+    t13 = t3 + t12;
+    y[49] = 0;
+    t0 = (-0.06517631264583852) * t13;
+    y[430] = t0;
+    t5 = re[48];
+    t2 = im[48];
+    t1 = re[128];
+    t4 = im[128];
+    t6 = re[208];
+    t7 = im[208];
+    t8 = t1 + t6;
+    t10 = t4 + t7;
+    t14 = C0 * t8;
+    t9 = t5 - t14;
+    t11 = C0 * t10;
+    t3 = t2 - t11;
+    t12 = t1 - t6;
+    t13 = C1 * t12;
+    t0 = t4 - t7;
+    t14 = C1 * t0;
+    t11 = t5 + t8;
+    t1 = t2 + t10;
+    t6 = t9 + t14;
+    t12 = t3 - t13;
+    t4 = t9 - t14;
+    t7 = t3 + t13;
+    t0 = (-C62) * t11;
+    t5 = (-C63) * t1;
+    t8 = t0 + t5;
+    t2 = 0.06393537465311024 * t8;
+    y[527] = t2;
+    t10 = (-0.00266821145861729) * t8;
+    y[912] = t10;
+    t9 = C63 * t11;
+    t14 = (-C62) * t1;
+    t3 = t9 + t14;
+    y[47] = 0;
+    t13 = (-0.06516997341883836) * t3;
+    y[432] = t13;
+    t0 = (-C64) * t6;
+    t5 = (-C65) * t12;
+    t2 = t0 + t5;
+    t8 = 0.06611442465083006 * t2;
+    y[687] = t8;
+    t10 = 0.033662098281655395 * t2;
+    y[752] = t10;
+    t11 = C65 * t6;
+    t1 = (-C64) * t12;
+    t9 = t11 + t1;
+    t14 = 0.009820082785519772 * t9;
+    y[207] = t14;
+    t3 = (-0.05802216528489968) * t9;
+    y[272] = t3;
+    t13 = C66 * t4;
+    t0 = C67 * t7;
+    t5 = t13 + t0;
+    y[112] = 0;
+    t8 = (-0.06535885699030752) * t5;
+    y[367] = t8;
+    t2 = (-C67) * t4;
+    t10 = C66 * t7;
+    t6 = t2 + t10;
+    t12 = 0.06375060486881785 * t6;
+    y[592] = t12;
+    t11 = (-0.006813949450594331) * t6;
+    y[847] = t11;
+    t1 = re[156];
+    t14 = im[156];
+    t9 = re[236];
+    t3 = im[236];
+    t13 = re[76];
+    t0 = im[76];
+    t5 = t9 + t13;
+    t8 = t3 + t0;
+    t4 = C0 * t5;
+    t7 = t1 - t4;
+    t2 = C0 * t8;
+    t10 = t14 - t2;
+    t12 = t9 - t13;
+    t6 = C1 * t12;
+    t11 = t3 - t0;
+    t4 = C1 * t11;
+    t2 = t1 + t5;
+    t9 = t14 + t8;
+    t13 = t7 + t4;
+    t12 = t10 - t6;
+    t3 = t7 - t4;
+    t0 = t10 + t6;
+    t11 = C68 * t2;
+    t1 = C69 * t9;
+    t5 = t11 + t1;
+    y[114] = 0;
+    t14 = (-0.06536456410857705) * t5;
+    y[365] = t14;
+    t8 = (-C69) * t2;
+    t7 = C68 * t9;
+    t4 = t8 + t7;
+    t10 = 0.0637450386687413 * t4;
+    y[594] = t10;
+    t6 = (-0.00668637682480584) * t4;
+    y[845] = t6;
+    t11 = (-C70) * t13;
+    t1 = (-C71) * t12;
+    t5 = t11 + t1;
+    t14 = 0.06394282983321359 * t5;
+    y[525] = t14;
+    t2 = (-0.0024546596113903703) * t5;
+    y[914] = t2;
+    t9 = C71 * t13;
+    t8 = (-C70) * t12;
+    t7 = t9 + t8;
+    y[45] = 0;
+    t10 = (-0.06516237516442214) * t7;
+    y[434] = t10;
+    t4 = (-C72) * t3;
+    t6 = (-C73) * t0;
+    t11 = t4 + t6;
+    t1 = 0.06622623693787076 * t11;
+    y[685] = t1;
+    t14 = 0.03211007605914631 * t11;
+    y[754] = t14;
+    t5 = C73 * t3;
+    t2 = (-C72) * t0;
+    t13 = t5 + t2;
+    t12 = 0.008585211463928835 * t13;
+    y[205] = t12;
+    t9 = (-0.058753072097790196) * t13;
+    y[274] = t9;
+    t8 = re[24];
+    t7 = im[24];
+    t10 = re[104];
+    t4 = im[104];
+    t6 = re[184];
+    t1 = im[184];
+    t11 = t10 + t6;
+    t14 = t4 + t1;
+    t3 = C0 * t11;
+    t0 = t8 - t3;
+    t5 = C0 * t14;
+    t2 = t7 - t5;
+    t12 = t10 - t6;
+    t13 = C1 * t12;
+    t9 = t4 - t1;
+    t3 = C1 * t9;
+    t5 = t8 + t11;
+    t10 = t7 + t14;
+    t6 = t0 + t3;
+    t12 = t2 - t13;
+    t4 = t0 - t3;
+    t1 = t2 + t13;
+    t9 = (-C74) * t5;
+    t8 = (-C75) * t10;
+    t11 = t9 + t8;
+    t7 = 0.06629703045209251 * t11;
+    y[683] = t7;
+    t14 = 0.030564726251030808 * t11;
+    y[756] = t14;
+    t0 = C75 * t5;
+    t3 = (-C74) * t10;
+    t2 = t0 + t3;
+    t13 = 0.00743521332628011 * t2;
+    y[203] = t13;
+    t9 = (-0.059420631359614104) * t2;
+    y[276] = t9;
+    t8 = C76 * t6;
+    t7 = C77 * t12;
+    t11 = t8 + t7;
+    y[116] = 0;
+    t14 = (-0.06536903649107367) * t11;
+    y[363] = t14;
+    t5 = (-C77) * t6;
+    t10 = C76 * t12;
+    t0 = t5 + t10;
+    t3 = 0.06374067739602733 * t0;
+    y[596] = t3;
+    t13 = (-0.006536104773879254) * t0;
+    y[843] = t13;
+    t2 = (-C78) * t4;
+    t9 = (-C79) * t1;
+    t8 = t2 + t9;
+    t7 = 0.06395166168229635 * t8;
+    y[523] = t7;
+    t11 = (-0.0022473617120944145) * t8;
+    y[916] = t11;
+    t14 = C79 * t4;
+    t6 = (-C78) * t1;
+    t12 = t14 + t6;
+    y[43] = 0;
+    t5 = (-0.06515337611344846) * t12;
+    y[436] = t5;
+    t10 = re[132];
+    t3 = im[132];
+    t0 = re[212];
+    t13 = im[212];
+    t2 = re[52];
+    t9 = im[52];
+    t7 = t0 + t2;
+    t8 = t13 + t9;
+    t11 = C0 * t7;
+    t4 = t10 - t11;
+    t1 = C0 * t8;
+    t14 = t3 - t1;
+    t6 = t0 - t2;
+    t12 = C1 * t6;
+    t5 = t13 - t9;
+    t11 = C1 * t5;
+    t1 = t10 + t7;
+    t0 = t3 + t8;
+    t2 = t4 + t11;
+    t6 = t14 - t12;
+    t13 = t4 - t11;
+    t9 = t14 + t12;
+    t5 = (-C80) * t1;
+    t10 = (-C81) * t0;
+    t7 = t5 + t10;
+    t3 = 0.0639619833894649 * t7;
+    y[521] = t3;
+    t8 = (-0.002047155958016181) * t7;
+    y[918] = t8;
+    t4 = C81 * t1;
+    t11 = (-C80) * t0;
+    t14 = t4 + t11;
+    y[41] = 0;
+    t12 = (-0.06514286214822022) * t14;
+    y[438] = t12;
+    t5 = (-C82) * t2;
+    t10 = (-C83) * t6;
+    t3 = t5 + t10;
+    t7 = 0.06633051386661427 * t3;
+    y[681] = t7;
+    t8 = 0.029029664721005044 * t3;
+    y[758] = t8;
+    t1 = C83 * t2;
+    t0 = (-C82) * t6;
+    t4 = t1 + t0;
+    t11 = 0.006372760106669814 * t4;
+    y[201] = t11;
+    t14 = (-0.06002769080651903) * t4;
+    y[278] = t14;
+    t12 = C84 * t13;
+    t5 = C85 * t9;
+    t10 = t12 + t5;
+    y[118] = 0;
+    t7 = (-0.06537212303587102) * t10;
+    y[361] = t7;
+    t3 = (-C85) * t13;
+    t8 = C84 * t9;
+    t2 = t3 + t8;
+    t6 = 0.0637376678799361 * t2;
+    y[598] = t6;
+    t1 = (-0.006362675543032619) * t2;
+    y[841] = t1;
+    t0 = re[15];
+    t11 = im[15];
+    t4 = re[95];
+    t14 = im[95];
+    t12 = re[175];
+    t5 = im[175];
+    t10 = t4 + t12;
+    t7 = t14 + t5;
+    t13 = C0 * t10;
+    t9 = t0 - t13;
+    t3 = C0 * t7;
+    t8 = t11 - t3;
+    t6 = t4 - t12;
+    t2 = C1 * t6;
+    t1 = t14 - t5;
+    t13 = C1 * t1;
+    t3 = t0 + t10;
+    t4 = t11 + t7;
+    t12 = t9 + t13;
+    t6 = t8 - t2;
+    t14 = t9 - t13;
+    t5 = t8 + t2;
+    t1 = C86 * t3;
+    t0 = C87 * t4;
+    t10 = t1 + t0;
+    y[120] = 0;
+    t11 = (-0.06537363179168738) * t10;
+    y[359] = t11;
+    t7 = (-C87) * t3;
+    t9 = C86 * t4;
+    t13 = t7 + t9;
+    t8 = 0.06373619688047501 * t13;
+    y[600] = t8;
+    t2 = (-0.006165496315677645) * t13;
+    y[839] = t2;
+    t1 = (-C88) * t12;
+    t0 = (-C89) * t6;
+    t10 = t1 + t0;
+    t11 = 0.06397390823714251 * t10;
+    y[519] = t11;
+    t3 = (-0.001854765852225621) * t10;
+    y[920] = t3;
+    t4 = C89 * t12;
+    t7 = (-C88) * t6;
+    t9 = t4 + t7;
+    y[39] = 0;
+    t8 = (-0.06513071940550207) * t9;
+    y[440] = t8;
+    t13 = (-C90) * t14;
+    t2 = (-C91) * t5;
+    t1 = t13 + t2;
+    t0 = 0.06633038015089819 * t1;
+    y[679] = t0;
+    t11 = 0.027508326665627986 * t1;
+    y[760] = t11;
+    t10 = C91 * t14;
+    t3 = (-C90) * t5;
+    t12 = t10 + t3;
+    t6 = 0.00539962122791882 * t12;
+    y[199] = t6;
+    t4 = (-0.06057755304458336) * t12;
+    y[280] = t4;
+    t7 = re[123];
+    t9 = im[123];
+    t8 = re[203];
+    t13 = im[203];
+    t2 = re[43];
+    t0 = im[43];
+    t1 = t8 + t2;
+    t11 = t13 + t0;
+    t14 = C0 * t1;
+    t5 = t7 - t14;
+    t10 = C0 * t11;
+    t3 = t9 - t10;
+    t6 = t8 - t2;
+    t12 = C1 * t6;
+    t4 = t13 - t0;
+    t14 = C1 * t4;
+    t10 = t7 + t1;
+    t8 = t9 + t11;
+    t2 = t5 + t14;
+    t6 = t3 - t12;
+    t13 = t5 - t14;
+    t0 = t3 + t12;
+    t4 = (-C92) * t10;
+    t7 = (-C93) * t8;
+    t1 = t4 + t7;
+    t9 = 0.06630050370812882 * t1;
+    y[677] = t9;
+    t11 = 0.026004067883560328 * t1;
+    y[762] = t11;
+    t5 = C93 * t10;
+    t14 = (-C92) * t8;
+    t3 = t5 + t14;
+    t12 = 0.00451656564222036 * t3;
+    y[197] = t12;
+    t4 = (-0.06107370774936289) * t3;
+    y[282] = t4;
+    t7 = C94 * t2;
+    t9 = C95 * t6;
+    t1 = t7 + t9;
+    y[122] = 0;
+    t11 = (-0.06537339617357284) * t1;
+    y[357] = t11;
+    t10 = (-C95) * t2;
+    t8 = C94 * t6;
+    t5 = t10 + t8;
+    t14 = 0.0637364265978129 * t5;
+    y[602] = t14;
+    t12 = (-0.00594393213174328) * t5;
+    y[837] = t12;
+    t3 = (-C96) * t13;
+    t4 = (-C97) * t0;
+    t7 = t3 + t4;
+    t9 = 0.06398752739483611 * t7;
+    y[517] = t9;
+    t1 = (-0.0016708514507894514) * t7;
+    y[922] = t1;
+    t11 = C97 * t13;
+    t2 = (-C96) * t0;
+    t6 = t11 + t2;
+    y[37] = 0;
+    t10 = (-0.0651168569298854) * t6;
+    y[442] = t10;
+    t8 = re[231];
+    t14 = im[231];
+    t5 = re[71];
+    t12 = im[71];
+    t3 = re[151];
+    t4 = im[151];
+    t9 = t5 + t3;
+    t7 = t12 + t4;
+    t1 = C0 * t9;
+    t13 = t8 - t1;
+    t0 = C0 * t7;
+    t11 = t14 - t0;
+    t2 = t5 - t3;
+    t6 = C1 * t2;
+    t10 = t12 - t4;
+    t1 = C1 * t10;
+    t0 = t8 + t9;
+    t5 = t14 + t7;
+    t3 = t13 + t1;
+    t2 = t11 - t6;
+    t12 = t13 - t1;
+    t4 = t11 + t6;
+    t10 = (-C98) * t0;
+    t8 = (-C99) * t5;
+    t9 = t10 + t8;
+    t14 = 0.06400290890259969 * t9;
+    y[515] = t14;
+    t7 = (-0.0014959568039040413) * t9;
+    y[924] = t7;
+    t13 = C99 * t0;
+    t1 = (-C98) * t5;
+    t11 = t13 + t1;
+    y[35] = 0;
+    t6 = (-0.06510120771241108) * t11;
+    y[444] = t6;
+    t10 = (-C100) * t3;
+    t8 = (-C101) * t2;
+    t14 = t10 + t8;
+    t9 = 0.06624490555084939 * t14;
+    y[675] = t9;
+    t7 = 0.024519826061939143 * t14;
+    y[764] = t7;
+    t0 = C101 * t3;
+    t5 = (-C100) * t2;
+    t13 = t0 + t5;
+    t1 = 0.003723341607873698 * t13;
+    y[195] = t1;
+    t11 = (-0.06151976433786564) * t13;
+    y[284] = t11;
+    t6 = C102 * t12;
+    t10 = C103 * t4;
+    t8 = t6 + t10;
+    y[124] = 0;
+    t9 = (-0.06537124410479743) * t8;
+    y[355] = t9;
+    t14 = (-C103) * t12;
+    t7 = C102 * t4;
+    t3 = t14 + t7;
+    t2 = 0.06373852484721008 * t3;
+    y[604] = t2;
+    t0 = (-0.00569735860189269) * t3;
+    y[835] = t0;
+    t5 = re[99];
+    t1 = im[99];
+    t13 = re[179];
+    t11 = im[179];
+    t6 = re[19];
+    t10 = im[19];
+    t8 = t13 + t6;
+    t9 = t11 + t10;
+    t12 = C0 * t8;
+    t4 = t5 - t12;
+    t14 = C0 * t9;
+    t7 = t1 - t14;
+    t2 = t13 - t6;
+    t3 = C1 * t2;
+    t0 = t11 - t10;
+    t12 = C1 * t0;
+    t14 = t5 + t8;
+    t13 = t1 + t9;
+    t6 = t4 + t12;
+    t2 = t7 - t3;
+    t11 = t4 - t12;
+    t10 = t7 + t3;
+    t0 = C104 * t14;
+    t5 = C105 * t13;
+    t8 = t0 + t5;
+    y[126] = 0;
+    t1 = (-0.0653670123272699) * t8;
+    y[353] = t1;
+    t9 = (-C105) * t14;
+    t4 = C104 * t13;
+    t12 = t9 + t4;
+    t7 = 0.0637426511985222 * t12;
+    y[606] = t7;
+    t3 = (-0.005425237731170207) * t12;
+    y[833] = t3;
+    t0 = (-C106) * t6;
+    t5 = (-C107) * t2;
+    t8 = t0 + t5;
+    t1 = 0.0640201095261462 * t8;
+    y[513] = t1;
+    t14 = (-0.001330599200485381) * t8;
+    y[926] = t14;
+    t13 = C107 * t6;
+    t9 = (-C106) * t2;
+    t4 = t13 + t9;
+    y[33] = 0;
+    t7 = (-0.06508371662446119) * t4;
+    y[446] = t7;
+    t12 = (-C108) * t11;
+    t3 = (-C109) * t10;
+    t0 = t12 + t3;
+    t5 = 0.06616745322775633 * t0;
+    y[673] = t5;
+    t1 = 0.023058291641532877 * t0;
+    y[766] = t1;
+    t8 = C109 * t11;
+    t14 = (-C108) * t10;
+    t6 = t8 + t14;
+    t2 = 0.0030186925647621736 * t6;
+    y[193] = t2;
+    t13 = (-0.061919577878109915) * t6;
+    y[286] = t13;
+    t9 = re[222];
+    t4 = im[222];
+    t7 = re[62];
+    t12 = im[62];
+    t3 = re[142];
+    t5 = im[142];
+    t0 = t7 + t3;
+    t1 = t12 + t5;
+    t11 = C0 * t0;
+    t10 = t9 - t11;
+    t8 = C0 * t1;
+    t14 = t4 - t8;
+    t2 = t7 - t3;
+    t6 = C1 * t2;
+    t13 = t12 - t5;
+    t11 = C1 * t13;
+    t8 = t9 + t0;
+    t7 = t4 + t1;
+    t3 = t10 + t11;
+    t2 = t14 - t6;
+    t12 = t10 - t11;
+    t5 = t14 + t6;
+    t13 = (-C110) * t8;
+    t9 = (-C111) * t7;
+    t0 = t13 + t9;
+    t4 = 0.06607195888287949 * t0;
+    y[671] = t4;
+    t1 = 0.021622346992802383 * t0;
+    y[768] = t1;
+    t10 = C111 * t8;
+    t11 = (-C110) * t7;
+    t14 = t10 + t11;
+    t6 = 0.0024003719606811033 * t14;
+    y[191] = t6;
+    t13 = (-0.06227702433516376) * t14;
+    y[288] = t13;
+    t9 = C112 * t3;
+    t4 = C113 * t2;
+    t0 = t9 + t4;
+    y[128] = 0;
+    t1 = (-0.06536052072088393) * t0;
+    y[351] = t1;
+    t8 = (-C113) * t3;
+    t7 = C112 * t2;
+    t10 = t8 + t7;
+    t11 = 0.06374898211812038 * t10;
+    y[608] = t11;
+    t6 = (-0.005126942408932225) * t10;
+    y[831] = t6;
+    t14 = (-C114) * t12;
+    t13 = (-C115) * t5;
+    t9 = t14 + t13;
+    t4 = 0.06403917383826517 * t9;
+    y[511] = t4;
+    t0 = (-0.0011752351076776114) * t9;
+    y[928] = t0;
+    t1 = C115 * t12;
+    t3 = (-C114) * t5;
+    t2 = t1 + t3;
+    y[31] = 0;
+    t8 = (-0.06506434135440026) * t2;
+    y[448] = t8;
+    t7 = re[90];
+    t11 = im[90];
+    t10 = re[170];
+    t6 = im[170];
+    t14 = re[10];
+    t13 = im[10];
+    t4 = t10 + t14;
+    t9 = t6 + t13;
+    t0 = C0 * t4;
+    t12 = t7 - t0;
+    t5 = C0 * t9;
+    t1 = t11 - t5;
+    t3 = t10 - t14;
+    t2 = C1 * t3;
+    t8 = t6 - t13;
+    t0 = C1 * t8;
+    t5 = t7 + t4;
+    t10 = t11 + t9;
+    t14 = t12 + t0;
+    t3 = t1 - t2;
+    t6 = t12 - t0;
+    t13 = t1 + t2;
+    t8 = (-C116) * t5;
+    t7 = (-C117) * t10;
+    t4 = t8 + t7;
+    t11 = 0.06406012827340767 * t4;
+    y[509] = t11;
+    t9 = (-0.0010301210199474054) * t4;
+    y[930] = t9;
+    t12 = C117 * t5;
+    t0 = (-C116) * t10;
+    t1 = t12 + t0;
+    y[29] = 0;
+    t2 = (-0.06504305843540302) * t1;
+    y[450] = t2;
+    t8 = (-C118) * t14;
+    t7 = (-C119) * t3;
+    t11 = t8 + t7;
+    t4 = 0.06596210937435924 * t11;
+    y[669] = t4;
+    t9 = 0.02021441367069516 * t11;
+    y[770] = t9;
+    t5 = C119 * t14;
+    t10 = (-C118) * t3;
+    t12 = t5 + t10;
+    t0 = 0.0018651955361572374 * t12;
+    y[189] = t0;
+    t1 = (-0.0625959792930312) * t12;
+    y[290] = t1;
+    t2 = C120 * t6;
+    t8 = C121 * t13;
+    t7 = t2 + t8;
+    y[130] = 0;
+    t4 = (-0.0653516164427228) * t7;
+    y[349] = t4;
+    t11 = (-C121) * t6;
+    t9 = C120 * t13;
+    t14 = t11 + t9;
+    t3 = 0.06375766803440165 * t14;
+    y[610] = t3;
+    t5 = (-0.004801715457604423) * t14;
+    y[829] = t5;
+    t10 = re[198];
+    t0 = im[198];
+    t12 = re[38];
+    t1 = im[38];
+    t2 = re[118];
+    t8 = im[118];
+    t7 = t12 + t2;
+    t4 = t1 + t8;
+    t6 = C0 * t7;
+    t13 = t10 - t6;
+    t11 = C0 * t4;
+    t9 = t0 - t11;
+    t3 = t12 - t2;
+    t14 = C1 * t3;
+    t5 = t1 - t8;
+    t6 = C1 * t5;
+    t11 = t10 + t7;
+    t12 = t0 + t4;
+    t2 = t13 + t6;
+    t3 = t9 - t14;
+    t1 = t13 - t6;
+    t8 = t9 + t14;
+    t5 = C122 * t11;
+    t10 = C123 * t12;
+    t7 = t5 + t10;
+    y[132] = 0;
+    t0 = (-0.0653401287509749) * t7;
+    y[347] = t0;
+    t4 = (-C123) * t11;
+    t13 = C122 * t12;
+    t6 = t4 + t13;
+    t9 = 0.06376887750782857 * t6;
+    y[612] = t9;
+    t14 = (-0.004448763503311272) * t6;
+    y[827] = t14;
+    t5 = (-C124) * t2;
+    t10 = (-C125) * t3;
+    t7 = t5 + t10;
+    t0 = 0.06408295505704935 * t7;
+    y[507] = t0;
+    t11 = (-0.0008954747285975453) * t7;
+    y[932] = t11;
+    t12 = C125 * t2;
+    t4 = (-C124) * t3;
+    t13 = t12 + t4;
+    y[27] = 0;
+    t9 = (-0.06501988965641992) * t13;
+    y[452] = t9;
+    t6 = (-C126) * t1;
+    t14 = (-C127) * t8;
+    t5 = t6 + t14;
+    t10 = 0.06584130684089498 * t5;
+    y[667] = t10;
+    t0 = 0.01883654300751599 * t5;
+    y[772] = t0;
+    t7 = C127 * t1;
+    t11 = (-C126) * t8;
+    t2 = t7 + t11;
+    t3 = 0.0014091575986145222 * t2;
+    y[187] = t3;
+    t12 = (-0.06288032859008362) * t2;
+    y[292] = t12;
+    t4 = re[66];
+    t13 = im[66];
+    t9 = re[146];
+    t6 = im[146];
+    t14 = re[226];
+    t10 = im[226];
+    t5 = t9 + t14;
+    t0 = t6 + t10;
+    t1 = C0 * t5;
+    t8 = t4 - t1;
+    t7 = C0 * t0;
+    t11 = t13 - t7;
+    t3 = t9 - t14;
+    t2 = C1 * t3;
+    t12 = t6 - t10;
+    t1 = C1 * t12;
+    t7 = t4 + t5;
+    t9 = t13 + t0;
+    t14 = t8 + t1;
+    t3 = t11 - t2;
+    t6 = t8 - t1;
+    t10 = t11 + t2;
+    t12 = (-C128) * t7;
+    t4 = (-C129) * t9;
+    t5 = t12 + t4;
+    t13 = 0.06571287246697802 * t5;
+    y[665] = t13;
+    t0 = 0.01749077410928325 * t5;
+    y[774] = t0;
+    t8 = C129 * t7;
+    t1 = (-C128) * t9;
+    t11 = t8 + t1;
+    t2 = 0.0010277140855204658 * t11;
+    y[185] = t2;
+    t12 = (-0.0631336144045856) * t11;
+    y[294] = t12;
+    t4 = C130 * t14;
+    t13 = C131 * t3;
+    t5 = t4 + t13;
+    y[134] = 0;
+    t0 = (-0.06532588779890161) * t5;
+    y[345] = t0;
+    t7 = (-C131) * t14;
+    t9 = C130 * t3;
+    t8 = t7 + t9;
+    t1 = 0.06378277903383849 * t8;
+    y[614] = t1;
+    t2 = (-0.004067503560849907) * t8;
+    y[825] = t2;
+    t11 = (-C132) * t6;
+    t12 = (-C133) * t10;
+    t4 = t11 + t12;
+    t13 = 0.06410766352919622 * t4;
+    y[505] = t13;
+    t5 = (-0.0007715436614991194) * t4;
+    y[934] = t5;
+    t0 = C133 * t6;
+    t14 = (-C132) * t10;
+    t3 = t0 + t14;
+    y[25] = 0;
+    t7 = (-0.06499482959270636) * t3;
+    y[454] = t7;
+    t9 = re[189];
+    t1 = im[189];
+    t8 = re[29];
+    t2 = im[29];
+    t11 = re[109];
+    t12 = im[109];
+    t13 = t8 + t11;
+    t4 = t2 + t12;
+    t5 = C0 * t13;
+    t6 = t9 - t5;
+    t10 = C0 * t4;
+    t0 = t1 - t10;
+    t14 = t8 - t11;
+    t3 = C1 * t14;
+    t7 = t2 - t12;
+    t5 = C1 * t7;
+    t10 = t9 + t13;
+    t8 = t1 + t4;
+    t11 = t6 + t5;
+    t14 = t0 - t3;
+    t2 = t6 - t5;
+    t12 = t0 + t3;
+    t7 = (-C134) * t10;
+    t9 = (-C135) * t8;
+    t13 = t7 + t9;
+    t1 = 0.06413419581871597 * t13;
+    y[503] = t1;
+    t4 = (-0.0006582956154213542) * t13;
+    y[936] = t4;
+    t6 = C135 * t10;
+    t5 = (-C134) * t8;
+    t0 = t6 + t5;
+    y[23] = 0;
+    t3 = (-0.0649679412593605) * t0;
+    y[456] = t3;
+    t7 = (-C136) * t11;
+    t9 = (-C137) * t14;
+    t1 = t7 + t9;
+    t13 = 0.0655797703210621 * t1;
+    y[663] = t13;
+    t4 = 0.016178875664066894 * t1;
+    y[776] = t4;
+    t10 = C137 * t11;
+    t8 = (-C136) * t14;
+    t6 = t10 + t8;
+    t5 = 0.0007155716786729976 * t6;
+    y[183] = t5;
+    t0 = (-0.06335931798947163) * t6;
+    y[296] = t0;
+    t3 = C138 * t2;
+    t7 = C139 * t12;
+    t9 = t3 + t7;
+    y[136] = 0;
+    t13 = (-0.0653087503961194) * t9;
+    y[343] = t13;
+    t1 = (-C139) * t2;
+    t4 = C138 * t12;
+    t11 = t1 + t4;
+    t14 = 0.0637995160127003 * t11;
+    y[616] = t14;
+    t10 = (-0.003657164990575806) * t11;
+    y[823] = t10;
+    t8 = re[57];
+    t5 = im[57];
+    t6 = re[137];
+    t0 = im[137];
+    t3 = re[217];
+    t7 = im[217];
+    t9 = t6 + t3;
+    t13 = t0 + t7;
+    t2 = C0 * t9;
+    t12 = t8 - t2;
+    t1 = C0 * t13;
+    t4 = t5 - t1;
+    t14 = t6 - t3;
+    t11 = C1 * t14;
+    t10 = t0 - t7;
+    t2 = C1 * t10;
+    t1 = t8 + t9;
+    t6 = t5 + t13;
+    t3 = t12 + t2;
+    t14 = t4 - t11;
+    t0 = t12 - t2;
+    t7 = t4 + t11;
+    t10 = C140 * t1;
+    t8 = C141 * t6;
+    t9 = t10 + t8;
+    y[138] = 0;
+    t5 = (-0.06528850451382125) * t9;
+    y[341] = t5;
+    t13 = (-C141) * t1;
+    t12 = C140 * t6;
+    t2 = t13 + t12;
+    t4 = 0.06381930016155603 * t2;
+    y[618] = t4;
+    t11 = (-0.0032167884525350523) * t2;
+    y[821] = t11;
+    t10 = (-C142) * t3;
+    t8 = (-C143) * t14;
+    t9 = t10 + t8;
+    t5 = 0.06416253018347054 * t9;
+    y[501] = t5;
+    t1 = (-0.0005555527399948405) * t9;
+    y[938] = t1;
+    t6 = C143 * t3;
+    t13 = (-C142) * t14;
+    t12 = t6 + t13;
+    y[21] = 0;
+    t4 = (-0.06493925122267198) * t12;
+    y[458] = t4;
+    t2 = (-C144) * t0;
+    t11 = (-C145) * t7;
+    t10 = t2 + t11;
+    t8 = 0.06544799289503121 * t10;
+    y[661] = t8;
+    t5 = 0.01490230639662058 * t10;
+    y[778] = t5;
+    t9 = C145 * t0;
+    t1 = (-C144) * t7;
+    t3 = t9 + t1;
+    t14 = 0.000436235085823156 * t3;
+    y[181] = t14;
+    t6 = (-0.06356445131066212) * t3;
+    y[298] = t6;
+    t13 = re[165];
+    t12 = im[165];
+    t4 = re[5];
+    t2 = im[5];
+    t11 = re[85];
+    t8 = im[85];
+    t10 = t4 + t11;
+    t5 = t2 + t8;
+    t0 = C0 * t10;
+    t7 = t13 - t0;
+    t9 = C0 * t5;
+    t1 = t12 - t9;
+    t14 = t4 - t11;
+    t3 = C1 * t14;
+    t6 = t2 - t8;
+    t0 = C1 * t6;
+    t9 = t13 + t10;
+    t4 = t12 + t5;
+    t11 = t7 + t0;
+    t14 = t1 - t3;
+    t2 = t7 - t0;
+    t8 = t1 + t3;
+    t6 = (-C146) * t9;
+    t13 = (-C147) * t4;
+    t10 = t6 + t13;
+    t12 = 0.06533827026114206 * t10;
+    y[659] = t12;
+    t5 = 0.013662384018374446 * t10;
+    y[780] = t5;
+    t7 = C147 * t9;
+    t0 = (-C146) * t4;
+    t1 = t7 + t0;
+    y[179] = 0;
+    t3 = (-0.06377069135766003) * t1;
+    y[300] = t3;
+    t6 = C148 * t11;
+    t13 = C149 * t14;
+    t12 = t6 + t13;
+    y[140] = 0;
+    t10 = (-0.06526501441298868) * t12;
+    y[339] = t10;
+    t5 = (-C149) * t11;
+    t9 = C148 * t14;
+    t4 = t5 + t9;
+    t7 = 0.06384226992275727 * t4;
+    y[620] = t7;
+    t0 = (-0.0027455938395023523) * t4;
+    y[819] = t0;
+    t1 = (-C150) * t2;
+    t3 = (-C151) * t8;
+    t6 = t1 + t3;
+    t13 = 0.0641925571027167 * t6;
+    y[499] = t13;
+    t12 = (-0.0004632014029183742) * t6;
+    y[940] = t12;
+    t10 = C151 * t2;
+    t11 = (-C150) * t8;
+    t14 = t10 + t11;
+    y[19] = 0;
+    t5 = (-0.06490887502735625) * t14;
+    y[460] = t5;
+    t9 = re[33];
+    t7 = im[33];
+    t4 = re[113];
+    t0 = im[113];
+    t1 = re[193];
+    t3 = im[193];
+    t13 = t4 + t1;
+    t6 = t0 + t3;
+    t12 = C0 * t13;
+    t2 = t9 - t12;
+    t8 = C0 * t6;
+    t10 = t7 - t8;
+    t11 = t4 - t1;
+    t14 = C1 * t11;
+    t5 = t0 - t3;
+    t12 = C1 * t5;
+    t8 = t9 + t13;
+    t4 = t7 + t6;
+    t1 = t2 + t12;
+    t11 = t10 - t14;
+    t0 = t2 - t12;
+    t3 = t10 + t14;
+    t5 = (-C152) * t8;
+    t9 = (-C153) * t4;
+    t13 = t5 + t9;
+    t7 = 0.06422421661268282 * t13;
+    y[497] = t7;
+    t6 = (-0.00038106307763214714) * t13;
+    y[942] = t6;
+    t2 = C153 * t8;
+    t12 = (-C152) * t4;
+    t10 = t2 + t12;
+    y[17] = 0;
+    t14 = (-0.06487687801308026) * t10;
+    y[462] = t14;
+    t5 = (-C154) * t1;
+    t9 = (-C155) * t11;
+    t7 = t5 + t9;
+    t13 = 0.0651897066068586 * t7;
+    y[657] = t13;
+    t6 = 0.012460150293088338 * t7;
+    y[782] = t6;
+    t8 = C155 * t1;
+    t4 = (-C154) * t11;
+    t2 = t8 + t4;
+    y[177] = 0;
+    t12 = (-0.06391602115644883) * t2;
+    y[302] = t12;
+    t10 = C156 * t0;
+    t14 = C157 * t3;
+    t5 = t10 + t14;
+    y[142] = 0;
+    t9 = (-0.06523805981020489) * t5;
+    y[337] = t9;
+    t13 = (-C157) * t0;
+    t7 = C156 * t3;
+    t6 = t13 + t7;
+    t1 = 0.06386864782289088 * t6;
+    y[622] = t1;
+    t11 = (-0.002242835474330392) * t6;
+    y[817] = t11;
+    t8 = re[96];
+    t4 = im[96];
+    t2 = re[176];
+    t12 = im[176];
+    t10 = re[16];
+    t14 = im[16];
+    t5 = t2 + t10;
+    t9 = t12 + t14;
+    t0 = C0 * t5;
+    t3 = t8 - t0;
+    t13 = C0 * t9;
+    t7 = t4 - t13;
+    t1 = t2 - t10;
+    t6 = C1 * t1;
+    t11 = t12 - t14;
+    t0 = C1 * t11;
+    t13 = t8 + t5;
+    t2 = t4 + t9;
+    t10 = t3 + t0;
+    t1 = t7 - t6;
+    t12 = t3 - t0;
+    t14 = t7 + t6;
+    t11 = C158 * t13;
+    t8 = C159 * t2;
+    t5 = t11 + t8;
+    y[144] = 0;
+    t4 = (-0.06520746352510629) * t5;
+    y[335] = t4;
+    t9 = (-C159) * t13;
+    t3 = C158 * t2;
+    t0 = t9 + t3;
+    t7 = 0.0638986159162963 * t0;
+    y[624] = t7;
+    t6 = (-0.0017076145448912225) * t0;
+    y[815] = t6;
+    t11 = (-C160) * t10;
+    t8 = (-C161) * t1;
+    t5 = t11 + t8;
+    t4 = 0.06425739375479943 * t5;
+    y[495] = t4;
+    t13 = (-0.0003087071048978949) * t5;
+    y[944] = t13;
+    t2 = C161 * t10;
+    t9 = (-C160) * t1;
+    t3 = t2 + t9;
+    y[15] = 0;
+    t7 = (-0.06484338102112107) * t3;
+    y[464] = t7;
+    t0 = (-C162) * t12;
+    t6 = (-C163) * t14;
+    t11 = t0 + t6;
+    t8 = 0.06505152284234923 * t11;
+    y[655] = t8;
+    t4 = 0.01129663648549895 * t11;
+    y[784] = t4;
+    t5 = C163 * t12;
+    t13 = (-C162) * t14;
+    t10 = t5 + t13;
+    y[175] = 0;
+    t1 = (-0.06405179286524129) * t10;
+    y[304] = t1;
+    t2 = re[204];
+    t9 = im[204];
+    t3 = re[44];
+    t7 = im[44];
+    t0 = re[124];
+    t6 = im[124];
+    t8 = t3 + t0;
+    t11 = t7 + t6;
+    t4 = C0 * t8;
+    t12 = t2 - t4;
+    t14 = C0 * t11;
+    t5 = t9 - t14;
+    t13 = t3 - t0;
+    t10 = C1 * t13;
+    t1 = t7 - t6;
+    t4 = C1 * t1;
+    t14 = t2 + t8;
+    t3 = t9 + t11;
+    t0 = t12 + t4;
+    t13 = t5 - t10;
+    t7 = t12 - t4;
+    t6 = t5 + t10;
+    t1 = (-C164) * t14;
+    t2 = (-C165) * t3;
+    t8 = t1 + t2;
+    t9 = 0.06492324901137009 * t8;
+    y[653] = t9;
+    t11 = 0.01017252894936793 * t8;
+    y[786] = t11;
+    t12 = C165 * t14;
+    t4 = (-C164) * t3;
+    t5 = t12 + t4;
+    y[173] = 0;
+    t10 = (-0.06417834489362895) * t5;
+    y[306] = t10;
+    t1 = C166 * t0;
+    t2 = C167 * t13;
+    t9 = t1 + t2;
+    y[146] = 0;
+    t8 = (-0.06517299262362998) * t9;
+    y[333] = t8;
+    t11 = (-C167) * t0;
+    t14 = C166 * t13;
+    t3 = t11 + t14;
+    t12 = 0.06393241278222266 * t3;
+    y[626] = t12;
+    t4 = (-0.0011391351213317518) * t3;
+    y[813] = t4;
+    t5 = (-C168) * t7;
+    t10 = (-C169) * t6;
+    t1 = t5 + t10;
+    t2 = 0.0642919664626169 * t1;
+    y[493] = t2;
+    t9 = (-0.0002456946508096601) * t1;
+    y[946] = t9;
+    t8 = C169 * t7;
+    t0 = (-C168) * t6;
+    t13 = t8 + t0;
+    y[13] = 0;
+    t11 = (-0.06480851179267332) * t13;
+    y[466] = t11;
+    t14 = re[72];
+    t12 = im[72];
+    t3 = re[152];
+    t4 = im[152];
+    t5 = re[232];
+    t10 = im[232];
+    t2 = t3 + t5;
+    t1 = t4 + t10;
+    t9 = C0 * t2;
+    t7 = t14 - t9;
+    t6 = C0 * t1;
+    t8 = t12 - t6;
+    t0 = t3 - t5;
+    t13 = C1 * t0;
+    t11 = t4 - t10;
+    t9 = C1 * t11;
+    t6 = t14 + t2;
+    t3 = t12 + t1;
+    t5 = t7 + t9;
+    t0 = t8 - t13;
+    t4 = t7 - t9;
+    t10 = t8 + t13;
+    t11 = (-C170) * t6;
+    t14 = (-C171) * t3;
+    t2 = t11 + t14;
+    t12 = 0.06432778749320836 * t2;
+    y[491] = t12;
+    t1 = (-0.00019155824848469372) * t2;
+    y[948] = t1;
+    t7 = C171 * t6;
+    t9 = (-C170) * t3;
+    t8 = t7 + t9;
+    y[11] = 0;
+    t13 = (-0.06477242306999255) * t8;
+    y[468] = t13;
+    t11 = (-C172) * t5;
+    t14 = (-C173) * t0;
+    t12 = t11 + t14;
+    t2 = 0.06480444102585917 * t12;
+    y[651] = t2;
+    t1 = 0.009088201941194599 * t12;
+    y[788] = t1;
+    t6 = C173 * t5;
+    t3 = (-C172) * t0;
+    t7 = t6 + t3;
+    y[171] = 0;
+    t9 = (-0.06429600503774152) * t7;
+    y[308] = t9;
+    t8 = C174 * t4;
+    t13 = C175 * t10;
+    t11 = t8 + t13;
+    y[148] = 0;
+    t14 = (-0.06513442995190928) * t11;
+    y[331] = t14;
+    t2 = (-C175) * t4;
+    t12 = C174 * t10;
+    t1 = t2 + t12;
+    t5 = 0.06397026380276978 * t1;
+    y[628] = t5;
+    t0 = (-0.0005364356720218564) * t1;
+    y[811] = t0;
+    t6 = re[180];
+    t3 = im[180];
+    t7 = re[20];
+    t9 = im[20];
+    t8 = re[100];
+    t13 = im[100];
+    t11 = t7 + t8;
+    t14 = t9 + t13;
+    t4 = C0 * t11;
+    t10 = t6 - t4;
+    t2 = C0 * t14;
+    t12 = t3 - t2;
+    t5 = t7 - t8;
+    t1 = C1 * t5;
+    t0 = t9 - t13;
+    t4 = C1 * t0;
+    t2 = t6 + t11;
+    t7 = t3 + t14;
+    t8 = t10 + t4;
+    t5 = t12 - t1;
+    t9 = t10 - t4;
+    t13 = t12 + t1;
+    t0 = C176 * t2;
+    t6 = C177 * t7;
+    t11 = t0 + t6;
+    y[150] = 0;
+    t3 = (-0.06509149341879758) * t11;
+    y[329] = t3;
+    t14 = (-C177) * t2;
+    t10 = C176 * t7;
+    t4 = t14 + t10;
+    t12 = 0.06401246073520547 * t4;
+    y[630] = t12;
+    t1 = 0.00010136342815123706 * t4;
+    y[809] = t1;
+    t0 = (-C178) * t8;
+    t6 = (-C179) * t5;
+    t11 = t0 + t6;
+    t3 = 0.06436471177753121 * t11;
+    y[489] = t3;
+    t2 = (-0.00014569399935573593) * t11;
+    y[950] = t2;
+    t7 = C179 * t8;
+    t14 = (-C178) * t5;
+    t10 = t7 + t14;
+    y[9] = 0;
+    t12 = (-0.06473526489279159) * t10;
+    y[470] = t12;
+    t4 = (-C180) * t9;
+    t1 = (-C181) * t13;
+    t0 = t4 + t1;
+    t6 = 0.06469463715336674 * t0;
+    y[649] = t6;
+    t3 = 0.00804400171606616 * t0;
+    y[790] = t3;
+    t11 = C181 * t9;
+    t2 = (-C180) * t13;
+    t8 = t11 + t2;
+    y[169] = 0;
+    t5 = (-0.06440513232633274) * t8;
+    y[310] = t5;
+    t7 = re[63];
+    t14 = im[63];
+    t10 = re[143];
+    t12 = im[143];
+    t4 = re[223];
+    t1 = im[223];
+    t6 = t10 + t4;
+    t0 = t12 + t1;
+    t3 = C0 * t6;
+    t9 = t7 - t3;
+    t13 = C0 * t0;
+    t11 = t14 - t13;
+    t2 = t10 - t4;
+    t8 = C1 * t2;
+    t5 = t12 - t1;
+    t3 = C1 * t5;
+    t13 = t7 + t6;
+    t10 = t14 + t0;
+    t4 = t9 + t3;
+    t2 = t11 - t8;
+    t12 = t9 - t3;
+    t1 = t11 + t8;
+    t5 = (-C182) * t13;
+    t7 = (-C183) * t10;
+    t6 = t5 + t7;
+    t14 = 0.06459337021269107 * t6;
+    y[647] = t14;
+    t0 = 0.007040125278386572 * t6;
+    y[792] = t0;
+    t9 = C183 * t13;
+    t3 = (-C182) * t10;
+    t11 = t9 + t3;
+    y[167] = 0;
+    t8 = (-0.0645061041550672) * t11;
+    y[312] = t8;
+    t5 = C184 * t4;
+    t7 = C185 * t2;
+    t14 = t5 + t7;
+    y[152] = 0;
+    t6 = (-0.06504395779307387) * t14;
+    y[327] = t6;
+    t0 = (-C185) * t4;
+    t13 = C184 * t2;
+    t10 = t0 + t13;
+    t9 = 0.06405924251906994 * t10;
+    y[632] = t9;
+    t3 = 0.0007749045844854548 * t10;
+    y[807] = t3;
+    t11 = (-C186) * t12;
+    t8 = (-C187) * t1;
+    t5 = t11 + t8;
+    t7 = 0.06440257081976378 * t5;
+    y[487] = t7;
+    t14 = (-0.00010744127641315864) * t5;
+    y[952] = t14;
+    t6 = C187 * t12;
+    t4 = (-C186) * t1;
+    t2 = t6 + t4;
+    y[7] = 0;
+    t0 = (-0.06469721027639481) * t2;
+    y[472] = t0;
+    t13 = re[171];
+    t9 = im[171];
+    t10 = re[11];
+    t3 = im[11];
+    t11 = re[91];
+    t8 = im[91];
+    t7 = t10 + t11;
+    t5 = t3 + t8;
+    t14 = C0 * t7;
+    t12 = t13 - t14;
+    t1 = C0 * t5;
+    t6 = t9 - t1;
+    t4 = t10 - t11;
+    t2 = C1 * t4;
+    t0 = t3 - t8;
+    t14 = C1 * t0;
+    t1 = t13 + t7;
+    t10 = t9 + t5;
+    t11 = t12 + t14;
+    t4 = t6 - t2;
+    t3 = t12 - t14;
+    t8 = t6 + t2;
+    t0 = (-C188) * t1;
+    t13 = (-C189) * t10;
+    t7 = t0 + t13;
+    t9 = 0.06444118770571218 * t7;
+    y[485] = t9;
+    t5 = (-7.618525494244105e-05) * t7;
+    y[954] = t5;
+    t12 = C189 * t1;
+    t14 = (-C188) * t10;
+    t6 = t12 + t14;
+    y[5] = 0;
+    t2 = (-0.06465843996691767) * t6;
+    y[474] = t2;
+    t0 = (-C190) * t11;
+    t13 = (-C191) * t4;
+    t9 = t0 + t13;
+    t7 = 0.06450015372569924 * t9;
+    y[645] = t7;
+    t5 = 0.00607659065620141 * t9;
+    y[794] = t5;
+    t1 = C191 * t11;
+    t10 = (-C190) * t4;
+    t12 = t1 + t10;
+    y[165] = 0;
+    t14 = (-0.06459932924169938) * t12;
+    y[314] = t14;
+    t6 = C192 * t3;
+    t2 = C193 * t8;
+    t0 = t6 + t2;
+    y[154] = 0;
+    t13 = (-0.06499145894164488) * t0;
+    y[325] = t13;
+    t7 = (-C193) * t3;
+    t9 = C192 * t8;
+    t5 = t7 + t9;
+    t11 = 0.06411098834398946 * t5;
+    y[634] = t11;
+    t4 = 0.0014850580646897857 * t5;
+    y[805] = t4;
+}
+
+/**
+ *  Part 6 of ApplyWindowedIMDCT_W10_480_K160().
+ * 
+ *  @param {Number[]} X 
+ *    - The input block (480 points, only the first 160 points are used).
+ *  @param {Number[]} y 
+ *    - The array that would contain the output block (960 points).
+ *  @param {Number[]} re 
+ *    - The scratch buffer (real part, 240 points).
+ *  @param {Number[]} im 
+ *    - The scratch buffer (imaginary part, 240 points).
+ */
+function ApplyWindowedIMDCT_W10_480_K160_Part6(X, y, re, im) {
+    let t0, t1, t10, t11, t12, t13, t14, t2, t3, t4, t5, t6, t7, t8, t9;
+    const C0 = 0.5;
+    const C1 = 0.8660254037844386;
+    const C2 = 0.26986527350584855;
+    const C3 = 0.9628980912617978;
+    const C4 = 0.7151592280861994;
+    const C5 = 0.6989615715353394;
+    const C6 = 0.968826845041188;
+    const C7 = 0.2477388631755984;
+    const C8 = 0.9671846588908337;
+    const C9 = 0.2540744686233185;
+    const C10 = 0.26355738516459076;
+    const C11 = 0.9646437190617081;
+    const C12 = 0.7105692504383896;
+    const C13 = 0.7036272737262429;
+    const C14 = 0.705948834368849;
+    const C15 = 0.7082628348665934;
+    const C16 = 0.965501041768733;
+    const C17 = 0.26039919036642817;
+    const C18 = 0.2572382069021396;
+    const C19 = 0.9663480247352773;
+    const C20 = 0.25090800941106;
+    const C21 = 0.9680109352757227;
+    const C22 = 0.7012981778008244;
+    const C23 = 0.7128680563843799;
+    const C24 = 0.9637760657954398;
+    const C25 = 0.26671275747489837;
+    const C26 = 0.9620098048631839;
+    const C27 = 0.27301489949652735;
+    const C28 = 0.24456706385594387;
+    const C29 = 0.9696323794494915;
+    const C30 = 0.6966174799529641;
+    const C31 = 0.71744274100724;
+    const C32 = 0.6919069413307858;
+    const C33 = 0.7219866927709101;
+    const C34 = 0.9602023346327048;
+    const C35 = 0.27930534646852595;
+    const C36 = 0.2382156418617946;
+    const C37 = 0.9712122877993118;
+    const C38 = 0.23185401550239113;
+    const C39 = 0.9727505926471682;
+    const C40 = 0.6871667637180859;
+    const C41 = 0.7264997170276203;
+    const C42 = 0.9583537325300114;
+    const C43 = 0.2855838289290823;
+    const C44 = 0.9564640777430654;
+    const C45 = 0.29185007792890405;
+    const C46 = 0.22548245728863364;
+    const C47 = 0.974247228097201;
+    const C48 = 0.6823971501682968;
+    const C49 = 0.7309816204544317;
+    const C50 = 0.6775983049957887;
+    const C51 = 0.7354322110615187;
+    const C52 = 0.9545334512183885;
+    const C53 = 0.2981038250427398;
+    const C54 = 0.2191012401568698;
+    const C55 = 0.9757021300385286;
+    const C56 = 0.21271063745720314;
+    const C57 = 0.9771152361479941;
+    const C58 = 0.6727704337671168;
+    const C59 = 0.7398512982003922;
+    const C60 = 0.9525619356575953;
+    const C61 = 0.3043448023808773;
+    const C62 = 0.9505496155138509;
+    const C63 = 0.310572742600619;
+    const C64 = 0.20631092294178383;
+    const C65 = 0.978486485892835;
+    const C66 = 0.6679137432922161;
+    const C67 = 0.744238692572067;
+    const C68 = 0.6630284416155423;
+    const C69 = 0.7485942062351708;
+    const C70 = 0.9484965769882525;
+    const C71 = 0.31678737891773395;
+    const C72 = 0.1999023707530817;
+    const C73 = 0.9798158205332763;
+    const C74 = 0.19348525541214334;
+    const C75 = 0.9811031831250461;
+    const C76 = 0.6581147380071596;
+    const C77 = 0.7529176526139945;
+    const C78 = 0.9464029080261377;
+    const C79 = 0.3229884451178864;
+    const C80 = 0.9442686983133165;
+    const C81 = 0.3291756755680389;
+    const C82 = 0.187059851806832;
+    const C83 = 0.9823485185218157;
+    const C84 = 0.6531728429537768;
+    const C85 = 0.7572088465064846;
+    const C86 = 0.6482029681497297;
+    const C87 = 0.7614676040921771;
+    const C88 = 0.9420940392722298;
+    const C89 = 0.33534880522783184;
+    const C90 = 0.18062643518005275;
+    const C91 = 0.9835517733775615;
+    const C92 = 0.1741852811179619;
+    const C93 = 0.9847128961488504;
+    const C94 = 0.6432053264879141;
+    const C95 = 0.7656937429400713;
+    const C96 = 0.9398790240580331;
+    const C97 = 0.34150756966093626;
+    const C98 = 0.937623747554606;
+    const C99 = 0.34765170504638193;
+    const C100 = 0.1677366655381615;
+    const C101 = 0.9858318370970471;
+    const C102 = 0.6381801320506653;
+    const C103 = 0.7698870820164444;
+    const C104 = 0.6331276001005878;
+    const C105 = 0.7740474416926073;
+    const C106 = 0.9353283063704877;
+    const C107 = 0.35378094818985806;
+    const C108 = 0.16128086467788047;
+    const C109 = 0.9869085482904458;
+    const C110 = 0.15481815508214103;
+    const C111 = 0.9879429836063224;
+    const C112 = 0.6280479470713343;
+    const C113 = 0.7781746437525978;
+    const C114 = 0.932992798834739;
+    const C115 = 0.3598950365349881;
+    const C116 = 0.9306173249927291;
+    const C117 = 0.36599370817457677;
+    const C118 = 0.14834881359191268;
+    const C119 = 0.9889350987329107;
+    const C120 = 0.6229413905583339;
+    const C121 = 0.7822685114008164;
+    const C122 = 0.6178081493094721;
+    const C123 = 0.7863288692695983;
+    const C124 = 0.9282019866018515;
+    const C125 = 0.3720767018618288;
+    const C126 = 0.14187311733225325;
+    const C127 = 0.989884851171301;
+    const C128 = 0.1353913437004377;
+    const C129 = 0.9907922002372597;
+    const C130 = 0.6126484432157191;
+    const C131 = 0.7903555434267263;
+    const C132 = 0.925746887127164;
+    const C133 = 0.3781437570215405;
+    const C134 = 0.9232521317369569;
+    const C135 = 0.38419461376126157;
+    const C136 = 0.1289037703540754;
+    const C137 = 0.9916571070629725;
+    const C138 = 0.607462493301711;
+    const C139 = 0.7943483613828815;
+    const C140 = 0.6022505217162819;
+    const C141 = 0.7983071520990315;
+    const C142 = 0.9207178272982477;
+    const C143 = 0.390229012882428;
+    const C144 = 0.1224106751992162;
+    const C145 = 0.99247953459871;
+    const C146 = 0.11591233637844581;
+    const C147 = 0.9932594476144136;
+    const C148 = 0.597012751722948;
+    const C149 = 0.8022317459937581;
+    const C150 = 0.9181440823722039;
+    const C151 = 0.3962466958914656;
+    const C152 = 0.9155310072094921;
+    const C153 = 0.40224740501086254;
+    const C154 = 0.10940903225897118;
+    const C155 = 0.9939968127012055;
+    const C156 = 0.5917494076903429;
+    const C157 = 0.806121974950521;
+    const C158 = 0.5864607150826073;
+    const C159 = 0.8099776723248592;
+    const C160 = 0.9128787137455552;
+    const C161 = 0.40823088319021217;
+    const C162 = 0.1029010414206961;
+    const C163 = 0.9946915982728195;
+    const C164 = 0.09638864264428781;
+    const C165 = 0.9953437745669542;
+    const C166 = 0.5811469004497304;
+    const C167 = 0.81379867295153;
+    const C168 = 0.9101873155958178;
+    const C169 = 0.4141968741172237;
+    const C170 = 0.9074569280508187;
+    const C171 = 0.42014512222870243;
+    const C172 = 0.08987211489923495;
+    const C173 = 0.9959533136465477;
+    const C174 = 0.5758081914178453;
+    const C175 = 0.8175848131515837;
+    const C176 = 0.5704448166794782;
+    const C177 = 0.8213359307393756;
+    const C178 = 0.9046876680712731;
+    const C179 = 0.4260753727214963;
+    const C180 = 0.08335173733189745;
+    const C181 = 0.9965201894009746;
+    const C182 = 0.07682778925354876;
+    const C183 = 0.9970443775471642;
+    const C184 = 0.5650570059837524;
+    const C185 = 0.8250518650295129;
+    const C186 = 0.9018796542830616;
+    const C187 = 0.43198737156341177;
+    const C188 = 0.8990330069721493;
+    const C189 = 0.43788086550409505;
+    const C190 = 0.07030055012841117;
+    const C191 = 0.9975258556306411;
+    const C192 = 0.559644990126546;
+    const C193 = 0.8287324568437381;
+    t1 = re[39];
+    t10 = im[39];
+    t12 = re[119];
+    t14 = im[119];
+    t6 = re[199];
+    t2 = im[199];
+    t0 = t12 + t6;
+    t13 = t14 + t2;
+    t3 = C0 * t0;
+    t8 = t1 - t3;
+    t7 = C0 * t13;
+    t9 = t10 - t7;
+    t11 = t12 - t6;
+    t5 = C1 * t11;
+    t4 = t14 - t2;
+    t3 = C1 * t4;
+    t7 = t1 + t0;
+    t12 = t10 + t13;
+    t6 = t8 + t3;
+    t11 = t9 - t5;
+    t14 = t8 - t3;
+    t2 = t9 + t5;
+    t4 = C2 * t7;
+    t1 = C3 * t12;
+    t0 = t4 + t1;
+    y[156] = 0;
+    t10 = (-0.06493373810629584) * t0;
+    y[323] = t10;
+    t13 = (-C3) * t7;
+    t8 = C2 * t12;
+    t3 = t13 + t8;
+    t9 = 0.06416797782141968 * t3;
+    y[636] = t9;
+    t5 = 0.002232707993710948 * t3;
+    y[803] = t5;
+    t4 = (-C4) * t6;
+    t1 = (-C5) * t11;
+    t0 = t4 + t1;
+    t10 = 0.06448036651285986 * t0;
+    y[483] = t10;
+    t7 = (-5.118263960998581e-05) * t0;
+    y[956] = t7;
+    t12 = C5 * t6;
+    t13 = (-C4) * t11;
+    t8 = t12 + t13;
+    y[3] = 0;
+    t9 = (-0.0646191529608578) * t8;
+    y[476] = t9;
+    t3 = (-C6) * t14;
+    t5 = (-C7) * t2;
+    t4 = t3 + t5;
+    t1 = 0.0644145257260093 * t4;
+    y[643] = t1;
+    t10 = 0.005153232970672424 * t4;
+    y[796] = t10;
+    t0 = C7 * t14;
+    t7 = (-C6) * t2;
+    t6 = t0 + t7;
+    y[163] = 0;
+    t11 = (-0.06468520290578261) * t6;
+    y[316] = t11;
+    t12 = re[147];
+    t13 = im[147];
+    t8 = re[227];
+    t9 = im[227];
+    t3 = re[67];
+    t5 = im[67];
+    t1 = t8 + t3;
+    t4 = t9 + t5;
+    t10 = C0 * t1;
+    t14 = t12 - t10;
+    t2 = C0 * t4;
+    t0 = t13 - t2;
+    t7 = t8 - t3;
+    t6 = C1 * t7;
+    t11 = t9 - t5;
+    t10 = C1 * t11;
+    t2 = t12 + t1;
+    t8 = t13 + t4;
+    t3 = t14 + t10;
+    t7 = t0 - t6;
+    t9 = t14 - t10;
+    t5 = t0 + t6;
+    t11 = (-C8) * t2;
+    t12 = (-C9) * t8;
+    t1 = t11 + t12;
+    t13 = 0.06433600442796719 * t1;
+    y[641] = t13;
+    t4 = 0.004269736803378256 * t1;
+    y[798] = t4;
+    t14 = C9 * t2;
+    t10 = (-C8) * t8;
+    t0 = t14 + t10;
+    y[161] = 0;
+    t6 = (-0.06476415039624987) * t0;
+    y[318] = t6;
+    t11 = C10 * t3;
+    t12 = C11 * t7;
+    t13 = t11 + t12;
+    y[158] = 0;
+    t1 = (-0.06487040458155936) * t13;
+    y[321] = t1;
+    t4 = (-C11) * t3;
+    t2 = C10 * t7;
+    t8 = t4 + t2;
+    t14 = 0.06423062556096837 * t8;
+    y[638] = t14;
+    t10 = 0.003018411452977106 * t8;
+    y[801] = t10;
+    t0 = (-C12) * t9;
+    t6 = (-C13) * t5;
+    t11 = t0 + t6;
+    t12 = 0.0645199171333313 * t11;
+    y[481] = t12;
+    t13 = (-2.9821318216822157e-05) * t11;
+    y[958] = t13;
+    t1 = C13 * t9;
+    t3 = (-C12) * t5;
+    t7 = t1 + t3;
+    y[1] = 0;
+    t4 = (-0.0645795415089606) * t7;
+    y[478] = t4;
+    t2 = re[30];
+    t14 = im[30];
+    t8 = re[110];
+    t10 = im[110];
+    t0 = re[190];
+    t6 = im[190];
+    t12 = t8 + t0;
+    t11 = t10 + t6;
+    t13 = C0 * t12;
+    t9 = t2 - t13;
+    t5 = C0 * t11;
+    t1 = t14 - t5;
+    t3 = t8 - t0;
+    t7 = C1 * t3;
+    t4 = t10 - t6;
+    t13 = C1 * t4;
+    t5 = t2 + t12;
+    t8 = t14 + t11;
+    t0 = t9 + t13;
+    t3 = t1 - t7;
+    t10 = t9 - t13;
+    t6 = t1 + t7;
+    t4 = C14 * t5;
+    t2 = C15 * t8;
+    t12 = t4 + t2;
+    y[0] = 0;
+    t14 = (-0.06455965713043095) * t12;
+    y[479] = t14;
+    t11 = (-C15) * t5;
+    t9 = C14 * t8;
+    t13 = t11 + t9;
+    t1 = 0.06453978927193926 * t13;
+    y[480] = t1;
+    t7 = (-1.5188757220070019e-05) * t13;
+    y[959] = t7;
+    t4 = (-C16) * t0;
+    t2 = (-C17) * t3;
+    t12 = t4 + t2;
+    t14 = 0.06426416257419922 * t12;
+    y[639] = t14;
+    t5 = 0.0034257402094298017 * t12;
+    y[800] = t5;
+    t8 = C17 * t0;
+    t11 = (-C16) * t3;
+    t9 = t8 + t11;
+    y[159] = 0;
+    t1 = (-0.06483655119376752) * t9;
+    y[320] = t1;
+    t13 = C18 * t10;
+    t7 = C19 * t6;
+    t4 = t13 + t7;
+    y[160] = 0;
+    t2 = (-0.06480112891438235) * t4;
+    y[319] = t2;
+    t14 = (-C19) * t10;
+    t12 = C18 * t6;
+    t5 = t14 + t12;
+    t0 = 0.06429929133135662 * t5;
+    y[640] = t0;
+    t3 = 0.0038427993091844884 * t5;
+    y[799] = t3;
+    t8 = re[138];
+    t11 = im[138];
+    t9 = re[218];
+    t1 = im[218];
+    t13 = re[58];
+    t7 = im[58];
+    t4 = t9 + t13;
+    t2 = t1 + t7;
+    t10 = C0 * t4;
+    t6 = t8 - t10;
+    t14 = C0 * t2;
+    t12 = t11 - t14;
+    t0 = t9 - t13;
+    t5 = C1 * t0;
+    t3 = t1 - t7;
+    t10 = C1 * t3;
+    t14 = t8 + t4;
+    t9 = t11 + t2;
+    t13 = t6 + t10;
+    t0 = t12 - t5;
+    t1 = t6 - t10;
+    t7 = t12 + t5;
+    t3 = C20 * t14;
+    t8 = C21 * t9;
+    t4 = t3 + t8;
+    y[162] = 0;
+    t11 = (-0.06472549954869128) * t4;
+    y[317] = t11;
+    t2 = (-C21) * t14;
+    t6 = C20 * t9;
+    t10 = t2 + t6;
+    t12 = 0.06437442268842114 * t10;
+    y[642] = t12;
+    t5 = 0.0047065095125265214 * t10;
+    y[797] = t5;
+    t3 = C22 * t13;
+    t8 = C23 * t0;
+    t4 = t3 + t8;
+    y[2] = 0;
+    t11 = (-0.06459935208992905) * t4;
+    y[477] = t11;
+    t14 = (-C23) * t13;
+    t9 = C22 * t0;
+    t2 = t14 + t9;
+    t6 = 0.06450013091255516 * t2;
+    y[482] = t6;
+    t12 = (-4.042704922643029e-05) * t2;
+    y[957] = t12;
+    t10 = (-C24) * t1;
+    t5 = (-C25) * t7;
+    t3 = t10 + t5;
+    t8 = 0.06419855597372343 * t3;
+    y[637] = t8;
+    t4 = 0.0026207874522626764 * t3;
+    y[802] = t4;
+    t11 = C25 * t1;
+    t13 = (-C24) * t7;
+    t0 = t11 + t13;
+    y[157] = 0;
+    t14 = (-0.06490280978238966) * t0;
+    y[322] = t14;
+    t9 = re[6];
+    t6 = im[6];
+    t2 = re[86];
+    t12 = im[86];
+    t10 = re[166];
+    t5 = im[166];
+    t8 = t2 + t10;
+    t3 = t12 + t5;
+    t4 = C0 * t8;
+    t1 = t9 - t4;
+    t7 = C0 * t3;
+    t11 = t6 - t7;
+    t13 = t2 - t10;
+    t0 = C1 * t13;
+    t14 = t12 - t5;
+    t4 = C1 * t14;
+    t7 = t9 + t8;
+    t2 = t6 + t3;
+    t10 = t1 + t4;
+    t13 = t11 - t0;
+    t12 = t1 - t4;
+    t5 = t11 + t0;
+    t14 = (-C26) * t7;
+    t9 = (-C27) * t2;
+    t8 = t14 + t9;
+    t6 = 0.06413878463163647 * t8;
+    y[635] = t6;
+    t3 = 0.0018541787857695319 * t8;
+    y[804] = t3;
+    t1 = C27 * t7;
+    t4 = (-C26) * t2;
+    t11 = t1 + t4;
+    y[155] = 0;
+    t0 = (-0.06496329312438288) * t11;
+    y[324] = t0;
+    t14 = C28 * t10;
+    t9 = C29 * t13;
+    t6 = t14 + t9;
+    y[164] = 0;
+    t8 = (-0.06464314388636223) * t6;
+    y[315] = t8;
+    t3 = (-C29) * t10;
+    t7 = C28 * t13;
+    t2 = t3 + t7;
+    t1 = 0.06445643599870936 * t2;
+    y[644] = t1;
+    t4 = 0.0056098920624594786 * t2;
+    y[795] = t4;
+    t11 = C30 * t12;
+    t0 = C31 * t5;
+    t14 = t11 + t0;
+    y[4] = 0;
+    t9 = (-0.06463883663466444) * t14;
+    y[475] = t9;
+    t6 = (-C31) * t12;
+    t8 = C30 * t5;
+    t10 = t6 + t8;
+    t13 = 0.06446073109601995 * t10;
+    y[484] = t13;
+    t3 = (-6.291769062519899e-05) * t10;
+    y[955] = t3;
+    t7 = re[114];
+    t1 = im[114];
+    t2 = re[194];
+    t4 = im[194];
+    t11 = re[34];
+    t0 = im[34];
+    t14 = t2 + t11;
+    t9 = t4 + t0;
+    t12 = C0 * t14;
+    t5 = t7 - t12;
+    t6 = C0 * t9;
+    t8 = t1 - t6;
+    t13 = t2 - t11;
+    t10 = C1 * t13;
+    t3 = t4 - t0;
+    t12 = C1 * t3;
+    t6 = t7 + t14;
+    t2 = t1 + t9;
+    t11 = t5 + t12;
+    t13 = t8 - t10;
+    t4 = t5 - t12;
+    t0 = t8 + t10;
+    t3 = C32 * t6;
+    t7 = C33 * t2;
+    t14 = t3 + t7;
+    y[6] = 0;
+    t1 = (-0.06467788109512218) * t14;
+    y[473] = t1;
+    t9 = (-C33) * t6;
+    t5 = C32 * t2;
+    t12 = t9 + t5;
+    t8 = 0.06442181772372418 * t12;
+    y[486] = t8;
+    t10 = (-9.096405236126472e-05) * t12;
+    y[953] = t10;
+    t3 = (-C34) * t11;
+    t7 = (-C35) * t13;
+    t14 = t3 + t7;
+    t1 = 0.06408446011643425 * t14;
+    y[633] = t1;
+    t6 = 0.0011253587763649148 * t14;
+    y[806] = t6;
+    t2 = C35 * t11;
+    t9 = (-C34) * t13;
+    t5 = t2 + t9;
+    y[153] = 0;
+    t8 = (-0.06501836262794915) * t5;
+    y[326] = t8;
+    t12 = C36 * t4;
+    t10 = C37 * t0;
+    t3 = t12 + t10;
+    y[166] = 0;
+    t7 = (-0.0645536397502237) * t3;
+    y[313] = t7;
+    t1 = (-C37) * t4;
+    t14 = C36 * t0;
+    t6 = t1 + t14;
+    t11 = 0.06454580536107146 * t6;
+    y[646] = t11;
+    t13 = 0.006553301740878292 * t6;
+    y[793] = t13;
+    t2 = re[237];
+    t9 = im[237];
+    t5 = re[77];
+    t8 = im[77];
+    t12 = re[157];
+    t10 = im[157];
+    t3 = t5 + t12;
+    t7 = t8 + t10;
+    t4 = C0 * t3;
+    t0 = t2 - t4;
+    t1 = C0 * t7;
+    t14 = t9 - t1;
+    t11 = t5 - t12;
+    t6 = C1 * t11;
+    t13 = t8 - t10;
+    t4 = C1 * t13;
+    t1 = t2 + t3;
+    t5 = t9 + t7;
+    t12 = t0 + t4;
+    t11 = t14 - t6;
+    t8 = t0 - t4;
+    t10 = t14 + t6;
+    t13 = C38 * t1;
+    t2 = C39 * t5;
+    t3 = t13 + t2;
+    y[168] = 0;
+    t9 = (-0.06445659980160325) * t3;
+    y[311] = t9;
+    t7 = (-C39) * t1;
+    t0 = C38 * t5;
+    t4 = t7 + t0;
+    t14 = 0.06464297960940578 * t4;
+    y[648] = t14;
+    t6 = 0.007536996945517365 * t4;
+    y[791] = t6;
+    t13 = C40 * t12;
+    t2 = C41 * t11;
+    t3 = t13 + t2;
+    y[8] = 0;
+    t9 = (-0.06471632366710349) * t3;
+    y[471] = t9;
+    t1 = (-C41) * t12;
+    t5 = C40 * t11;
+    t7 = t1 + t5;
+    t0 = 0.06438355009316855 * t7;
+    y[488] = t0;
+    t14 = (-0.00012565194800517364) * t7;
+    y[951] = t14;
+    t4 = (-C42) * t8;
+    t6 = (-C43) * t10;
+    t13 = t4 + t6;
+    t2 = 0.06403524354835045 * t13;
+    y[631] = t2;
+    t3 = 0.0004336255177722955 * t13;
+    y[808] = t3;
+    t9 = C43 * t8;
+    t12 = (-C42) * t10;
+    t11 = t9 + t12;
+    y[151] = 0;
+    t1 = (-0.0650683348072313) * t11;
+    y[328] = t1;
+    t5 = re[105];
+    t0 = im[105];
+    t7 = re[185];
+    t14 = im[185];
+    t4 = re[25];
+    t6 = im[25];
+    t2 = t7 + t4;
+    t13 = t14 + t6;
+    t3 = C0 * t2;
+    t8 = t5 - t3;
+    t10 = C0 * t13;
+    t9 = t0 - t10;
+    t12 = t7 - t4;
+    t11 = C1 * t12;
+    t1 = t14 - t6;
+    t3 = C1 * t1;
+    t10 = t5 + t2;
+    t7 = t0 + t13;
+    t4 = t8 + t3;
+    t12 = t9 - t11;
+    t14 = t8 - t3;
+    t6 = t9 + t11;
+    t1 = (-C44) * t10;
+    t5 = (-C45) * t7;
+    t2 = t1 + t5;
+    t0 = 0.06399077843587136 * t2;
+    y[629] = t0;
+    t13 = (-0.00022193928773926063) * t2;
+    y[810] = t13;
+    t8 = C45 * t10;
+    t3 = (-C44) * t7;
+    t9 = t8 + t3;
+    y[149] = 0;
+    t11 = (-0.06511354867861638) * t9;
+    y[330] = t11;
+    t1 = C46 * t4;
+    t5 = C47 * t12;
+    t0 = t1 + t5;
+    y[170] = 0;
+    t2 = (-0.0643515937571604) * t0;
+    y[309] = t2;
+    t13 = (-C47) * t4;
+    t10 = C46 * t12;
+    t7 = t13 + t10;
+    t8 = 0.06474846112421331 * t7;
+    y[650] = t8;
+    t3 = 0.008561055072937852 * t7;
+    y[789] = t3;
+    t9 = C48 * t14;
+    t11 = C49 * t6;
+    t1 = t9 + t11;
+    y[10] = 0;
+    t5 = (-0.06475394777693201) * t1;
+    y[469] = t5;
+    t0 = (-C49) * t14;
+    t2 = C48 * t6;
+    t4 = t0 + t2;
+    t12 = 0.06434614119621296 * t4;
+    y[490] = t12;
+    t13 = (-0.00016764253061409248) * t4;
+    y[949] = t13;
+    t10 = re[213];
+    t8 = im[213];
+    t7 = re[53];
+    t3 = im[53];
+    t9 = re[133];
+    t11 = im[133];
+    t1 = t7 + t9;
+    t5 = t3 + t11;
+    t14 = C0 * t1;
+    t6 = t10 - t14;
+    t0 = C0 * t5;
+    t2 = t8 - t0;
+    t12 = t7 - t9;
+    t4 = C1 * t12;
+    t13 = t3 - t11;
+    t14 = C1 * t13;
+    t0 = t10 + t1;
+    t7 = t8 + t5;
+    t9 = t6 + t14;
+    t12 = t2 - t4;
+    t3 = t6 - t14;
+    t11 = t2 + t4;
+    t13 = C50 * t0;
+    t10 = C51 * t7;
+    t1 = t13 + t10;
+    y[12] = 0;
+    t8 = (-0.06479059426312715) * t1;
+    y[467] = t8;
+    t5 = (-C51) * t0;
+    t6 = C50 * t7;
+    t14 = t5 + t6;
+    t2 = 0.06430974609902519 * t14;
+    y[492] = t2;
+    t4 = (-0.0002175619268598817) * t14;
+    y[947] = t4;
+    t13 = (-C52) * t9;
+    t10 = (-C53) * t12;
+    t1 = t13 + t10;
+    t8 = 0.06395080704108534 * t1;
+    y[627] = t8;
+    t0 = (-0.0008421036493568433) * t1;
+    y[812] = t0;
+    t7 = C53 * t9;
+    t5 = (-C52) * t12;
+    t6 = t7 + t5;
+    y[147] = 0;
+    t2 = (-0.06515424682584199) * t6;
+    y[332] = t2;
+    t14 = C54 * t3;
+    t4 = C55 * t11;
+    t13 = t14 + t4;
+    y[172] = 0;
+    t10 = (-0.0642382469821764) * t13;
+    y[307] = t10;
+    t8 = (-C55) * t3;
+    t1 = C54 * t11;
+    t0 = t8 + t1;
+    t9 = 0.06486270815924904 * t0;
+    y[652] = t9;
+    t12 = 0.009625348123172246 * t0;
+    y[787] = t12;
+    t7 = re[81];
+    t5 = im[81];
+    t6 = re[161];
+    t2 = im[161];
+    t14 = re[1];
+    t4 = im[1];
+    t13 = t6 + t14;
+    t10 = t2 + t4;
+    t3 = C0 * t13;
+    t11 = t7 - t3;
+    t8 = C0 * t10;
+    t1 = t5 - t8;
+    t9 = t6 - t14;
+    t0 = C1 * t9;
+    t12 = t2 - t4;
+    t3 = C1 * t12;
+    t8 = t7 + t13;
+    t6 = t5 + t10;
+    t14 = t11 + t3;
+    t9 = t1 - t0;
+    t2 = t11 - t3;
+    t4 = t1 + t0;
+    t12 = C56 * t8;
+    t7 = C57 * t6;
+    t13 = t12 + t7;
+    y[174] = 0;
+    t5 = (-0.0641161879820326) * t13;
+    y[305] = t5;
+    t10 = (-C57) * t8;
+    t11 = C56 * t6;
+    t3 = t10 + t11;
+    t1 = 0.0649861883216497 * t3;
+    y[654] = t1;
+    t0 = 0.01072961494190447 * t3;
+    y[785] = t0;
+    t12 = C58 * t14;
+    t7 = C59 * t9;
+    t13 = t12 + t7;
+    y[14] = 0;
+    t5 = (-0.06482608933539362) * t13;
+    y[465] = t5;
+    t8 = (-C59) * t14;
+    t6 = C58 * t9;
+    t10 = t8 + t6;
+    t11 = 0.06427453374689003 * t10;
+    y[494] = t11;
+    t1 = (-0.000276071014598291) * t10;
+    y[945] = t1;
+    t3 = (-C60) * t2;
+    t0 = (-C61) * t4;
+    t12 = t3 + t0;
+    t7 = 0.06391499826051626 * t12;
+    y[625] = t7;
+    t13 = (-0.0014275697895049036) * t12;
+    y[814] = t13;
+    t5 = C61 * t2;
+    t14 = (-C60) * t4;
+    t9 = t5 + t14;
+    y[145] = 0;
+    t8 = (-0.06519074990322953) * t9;
+    y[334] = t8;
+    t6 = re[144];
+    t11 = im[144];
+    t10 = re[224];
+    t1 = im[224];
+    t3 = re[64];
+    t0 = im[64];
+    t7 = t10 + t3;
+    t12 = t1 + t0;
+    t13 = C0 * t7;
+    t2 = t6 - t13;
+    t4 = C0 * t12;
+    t5 = t11 - t4;
+    t14 = t10 - t3;
+    t9 = C1 * t14;
+    t8 = t1 - t0;
+    t13 = C1 * t8;
+    t4 = t6 + t7;
+    t10 = t11 + t12;
+    t3 = t2 + t13;
+    t14 = t5 - t9;
+    t1 = t2 - t13;
+    t0 = t5 + t9;
+    t8 = (-C62) * t4;
+    t6 = (-C63) * t10;
+    t7 = t8 + t6;
+    t11 = 0.06388315384228209 * t7;
+    y[623] = t11;
+    t12 = (-0.001979314939273731) * t7;
+    y[816] = t12;
+    t2 = C63 * t4;
+    t13 = (-C62) * t10;
+    t5 = t2 + t13;
+    y[143] = 0;
+    t9 = (-0.06522324613079593) * t5;
+    y[336] = t9;
+    t8 = C64 * t3;
+    t6 = C65 * t14;
+    t11 = t8 + t6;
+    y[176] = 0;
+    t7 = (-0.06398506143007344) * t11;
+    y[303] = t7;
+    t12 = (-C65) * t3;
+    t4 = C64 * t14;
+    t10 = t12 + t4;
+    t2 = 0.0651193665137016 * t10;
+    y[656] = t2;
+    t13 = 0.011873482107928959 * t10;
+    y[783] = t13;
+    t5 = C66 * t1;
+    t9 = C67 * t0;
+    t8 = t5 + t9;
+    y[16] = 0;
+    t6 = (-0.06486029536102422) * t8;
+    y[463] = t6;
+    t11 = (-C67) * t1;
+    t7 = C66 * t0;
+    t3 = t11 + t7;
+    t14 = 0.06424063664024714 * t3;
+    y[496] = t14;
+    t12 = (-0.00034370201507132975) * t3;
+    y[943] = t12;
+    t4 = re[12];
+    t2 = im[12];
+    t10 = re[92];
+    t13 = im[92];
+    t5 = re[172];
+    t9 = im[172];
+    t8 = t10 + t5;
+    t6 = t13 + t9;
+    t1 = C0 * t8;
+    t0 = t4 - t1;
+    t11 = C0 * t6;
+    t7 = t2 - t11;
+    t14 = t10 - t5;
+    t3 = C1 * t14;
+    t12 = t13 - t9;
+    t1 = C1 * t12;
+    t11 = t4 + t8;
+    t10 = t2 + t6;
+    t5 = t0 + t1;
+    t14 = t7 - t3;
+    t13 = t0 - t1;
+    t9 = t7 + t3;
+    t12 = C68 * t11;
+    t4 = C69 * t10;
+    t8 = t12 + t4;
+    y[18] = 0;
+    t2 = (-0.06489304922604013) * t8;
+    y[461] = t2;
+    t6 = (-C69) * t11;
+    t0 = C68 * t10;
+    t1 = t6 + t0;
+    t7 = 0.06420821207141977 * t1;
+    y[498] = t7;
+    t3 = (-0.00042089128352338934) * t1;
+    y[941] = t3;
+    t12 = (-C70) * t5;
+    t4 = (-C71) * t14;
+    t8 = t12 + t4;
+    t2 = 0.06385500498660353 * t8;
+    y[621] = t2;
+    t11 = (-0.002498200628933956) * t8;
+    y[818] = t11;
+    t10 = C71 * t5;
+    t6 = (-C70) * t14;
+    t0 = t10 + t6;
+    y[141] = 0;
+    t7 = (-0.06525199814080057) * t0;
+    y[338] = t7;
+    t1 = C72 * t13;
+    t3 = C73 * t9;
+    t12 = t1 + t3;
+    y[178] = 0;
+    t4 = (-0.06384456751145744) * t12;
+    y[301] = t4;
+    t2 = (-C73) * t13;
+    t8 = C72 * t9;
+    t11 = t2 + t8;
+    t5 = 0.06526266570634885 * t11;
+    y[658] = t5;
+    t14 = 0.013056471420713447 * t11;
+    y[781] = t14;
+    t10 = re[120];
+    t6 = im[120];
+    t0 = re[200];
+    t7 = im[200];
+    t1 = re[40];
+    t3 = im[40];
+    t12 = t0 + t1;
+    t4 = t7 + t3;
+    t13 = C0 * t12;
+    t9 = t10 - t13;
+    t2 = C0 * t4;
+    t8 = t6 - t2;
+    t5 = t0 - t1;
+    t11 = C1 * t5;
+    t14 = t7 - t3;
+    t13 = C1 * t14;
+    t2 = t10 + t12;
+    t0 = t6 + t4;
+    t1 = t9 + t13;
+    t5 = t8 - t11;
+    t7 = t9 - t13;
+    t3 = t8 + t11;
+    t14 = C74 * t2;
+    t10 = C75 * t0;
+    t12 = t14 + t10;
+    t6 = 0.0002262105086283927 * t12;
+    y[180] = t6;
+    t4 = (-0.06366896226091003) * t12;
+    y[299] = t4;
+    t9 = (-C75) * t2;
+    t13 = C74 * t0;
+    t8 = t9 + t13;
+    t11 = 0.06539193914565526 * t8;
+    y[660] = t11;
+    t14 = 0.014277679024727883 * t8;
+    y[779] = t14;
+    t10 = C76 * t1;
+    t6 = C77 * t5;
+    t12 = t10 + t6;
+    y[20] = 0;
+    t4 = (-0.06492425733125114) * t12;
+    y[459] = t4;
+    t2 = (-C77) * t1;
+    t0 = C76 * t5;
+    t9 = t2 + t0;
+    t13 = 0.06417734815829848 * t9;
+    y[500] = t13;
+    t11 = (-0.0005080981582550777) * t9;
+    y[939] = t11;
+    t8 = (-C78) * t7;
+    t14 = (-C79) * t3;
+    t10 = t8 + t14;
+    t6 = 0.06383035680828042 * t10;
+    y[619] = t6;
+    t12 = (-0.002985074088911769) * t10;
+    y[820] = t12;
+    t4 = C79 * t7;
+    t1 = (-C78) * t3;
+    t5 = t4 + t1;
+    y[139] = 0;
+    t2 = (-0.06527719528784062) * t5;
+    y[340] = t2;
+    t0 = re[228];
+    t13 = im[228];
+    t9 = re[68];
+    t11 = im[68];
+    t8 = re[148];
+    t14 = im[148];
+    t6 = t9 + t8;
+    t10 = t11 + t14;
+    t12 = C0 * t6;
+    t7 = t0 - t12;
+    t3 = C0 * t10;
+    t4 = t13 - t3;
+    t1 = t9 - t8;
+    t5 = C1 * t1;
+    t2 = t11 - t14;
+    t12 = C1 * t2;
+    t3 = t0 + t6;
+    t9 = t13 + t10;
+    t8 = t7 + t12;
+    t1 = t4 - t5;
+    t11 = t7 - t12;
+    t14 = t4 + t5;
+    t2 = (-C80) * t3;
+    t0 = (-C81) * t9;
+    t6 = t2 + t0;
+    t13 = 0.06380899891895385 * t6;
+    y[617] = t13;
+    t10 = (-0.003440762383926833) * t6;
+    y[822] = t10;
+    t7 = C81 * t3;
+    t12 = (-C80) * t9;
+    t4 = t7 + t12;
+    y[137] = 0;
+    t5 = (-0.06529904460590116) * t4;
+    y[342] = t5;
+    t2 = C82 * t8;
+    t0 = C83 * t1;
+    t13 = t2 + t0;
+    t6 = 0.0005772987765440853 * t13;
+    y[182] = t6;
+    t10 = (-0.06346367948109186) * t13;
+    y[297] = t10;
+    t3 = (-C83) * t8;
+    t9 = C82 * t1;
+    t7 = t3 + t9;
+    t12 = 0.06551302642791178 * t7;
+    y[662] = t12;
+    t4 = 0.015536072435597533 * t7;
+    y[777] = t4;
+    t5 = C84 * t11;
+    t2 = C85 * t14;
+    t0 = t5 + t2;
+    y[22] = 0;
+    t6 = (-0.06495379436282869) * t0;
+    y[457] = t6;
+    t13 = (-C85) * t11;
+    t10 = C84 * t14;
+    t8 = t13 + t10;
+    t1 = 0.06414816420718814 * t8;
+    y[502] = t1;
+    t3 = (-0.0006056365353395344) * t8;
+    y[937] = t3;
+    t9 = re[111];
+    t12 = im[111];
+    t7 = re[191];
+    t4 = im[191];
+    t5 = re[31];
+    t2 = im[31];
+    t0 = t7 + t5;
+    t6 = t4 + t2;
+    t11 = C0 * t0;
+    t14 = t9 - t11;
+    t13 = C0 * t6;
+    t10 = t12 - t13;
+    t1 = t7 - t5;
+    t8 = C1 * t1;
+    t3 = t4 - t2;
+    t11 = C1 * t3;
+    t13 = t9 + t0;
+    t7 = t12 + t6;
+    t5 = t14 + t11;
+    t1 = t10 - t8;
+    t4 = t14 - t11;
+    t2 = t10 + t8;
+    t3 = C86 * t13;
+    t9 = C87 * t7;
+    t0 = t3 + t9;
+    y[24] = 0;
+    t12 = (-0.064981595028927) * t0;
+    y[455] = t12;
+    t6 = (-C87) * t13;
+    t14 = C86 * t7;
+    t11 = t6 + t14;
+    t10 = 0.06412072010254359 * t11;
+    y[504] = t10;
+    t8 = (-0.0007136104450472506) * t11;
+    y[935] = t8;
+    t3 = (-C88) * t5;
+    t9 = (-C89) * t1;
+    t0 = t3 + t9;
+    t12 = 0.06379076791189792 * t0;
+    y[615] = t12;
+    t13 = (-0.003866006755833699) * t0;
+    y[824] = t13;
+    t7 = C89 * t5;
+    t6 = (-C88) * t1;
+    t14 = t7 + t6;
+    y[135] = 0;
+    t10 = (-0.06531770666911066) * t14;
+    y[344] = t10;
+    t11 = C90 * t4;
+    t8 = C91 * t2;
+    t3 = t11 + t8;
+    t9 = 0.0008626305010526697 * t3;
+    y[184] = t9;
+    t12 = (-0.0632497783386208) * t3;
+    y[295] = t12;
+    t0 = (-C91) * t4;
+    t13 = C90 * t2;
+    t5 = t0 + t13;
+    t1 = 0.06564684176583985 * t5;
+    y[664] = t1;
+    t7 = 0.016830469510486154 * t5;
+    y[775] = t7;
+    t6 = re[219];
+    t14 = im[219];
+    t10 = re[59];
+    t11 = im[59];
+    t8 = re[139];
+    t9 = im[139];
+    t3 = t10 + t8;
+    t12 = t11 + t9;
+    t4 = C0 * t3;
+    t2 = t6 - t4;
+    t0 = C0 * t12;
+    t13 = t14 - t0;
+    t1 = t10 - t8;
+    t5 = C1 * t1;
+    t7 = t11 - t9;
+    t4 = C1 * t7;
+    t0 = t6 + t3;
+    t10 = t14 + t12;
+    t8 = t2 + t4;
+    t1 = t13 - t5;
+    t11 = t2 - t4;
+    t9 = t13 + t5;
+    t7 = C92 * t0;
+    t6 = C93 * t10;
+    t3 = t7 + t6;
+    t14 = 0.0012089492947579118 * t3;
+    y[186] = t14;
+    t12 = (-0.06301069127326117) * t3;
+    y[293] = t12;
+    t2 = (-C93) * t0;
+    t4 = C92 * t10;
+    t13 = t2 + t4;
+    t5 = 0.06577792843462159 * t13;
+    y[666] = t5;
+    t7 = 0.018159508900208607 * t13;
+    y[773] = t7;
+    t6 = C94 * t8;
+    t14 = C95 * t1;
+    t3 = t6 + t14;
+    y[26] = 0;
+    t12 = (-0.06500757656773257) * t3;
+    y[453] = t12;
+    t0 = (-C95) * t8;
+    t10 = C94 * t1;
+    t2 = t0 + t10;
+    t4 = 0.06409509301312502 * t2;
+    y[506] = t4;
+    t5 = (-0.000832178836739828) * t2;
+    y[933] = t5;
+    t13 = (-C96) * t11;
+    t7 = (-C97) * t9;
+    t6 = t13 + t7;
+    t14 = 0.063775459014178 * t6;
+    y[613] = t14;
+    t3 = (-0.004261695189175274) * t6;
+    y[826] = t3;
+    t12 = C97 * t11;
+    t8 = (-C96) * t9;
+    t1 = t12 + t8;
+    y[133] = 0;
+    t0 = (-0.06533338577367775) * t1;
+    y[346] = t0;
+    t10 = re[87];
+    t4 = im[87];
+    t2 = re[167];
+    t5 = im[167];
+    t13 = re[7];
+    t7 = im[7];
+    t14 = t2 + t13;
+    t6 = t5 + t7;
+    t3 = C0 * t14;
+    t11 = t10 - t3;
+    t9 = C0 * t6;
+    t12 = t4 - t9;
+    t8 = t2 - t13;
+    t1 = C1 * t8;
+    t0 = t5 - t7;
+    t3 = C1 * t0;
+    t9 = t10 + t14;
+    t2 = t4 + t6;
+    t13 = t11 + t3;
+    t8 = t12 - t1;
+    t5 = t11 - t3;
+    t7 = t12 + t1;
+    t0 = (-C98) * t9;
+    t10 = (-C99) * t2;
+    t14 = t0 + t10;
+    t4 = 0.06376293712973247 * t14;
+    y[611] = t4;
+    t6 = (-0.00462872956186059) * t14;
+    y[828] = t6;
+    t11 = C99 * t9;
+    t3 = (-C98) * t2;
+    t12 = t11 + t3;
+    y[131] = 0;
+    t1 = (-0.06534621606575527) * t12;
+    y[348] = t1;
+    t0 = C100 * t13;
+    t10 = C101 * t8;
+    t4 = t0 + t10;
+    t14 = 0.0016272859579925193 * t4;
+    y[188] = t14;
+    t6 = (-0.06274226638221903) * t4;
+    y[291] = t6;
+    t9 = (-C101) * t13;
+    t2 = C100 * t8;
+    t11 = t9 + t2;
+    t3 = 0.06590293451154614 * t11;
+    y[668] = t3;
+    t12 = 0.019521580713750934 * t11;
+    y[771] = t12;
+    t1 = C102 * t5;
+    t0 = C103 * t7;
+    t10 = t1 + t0;
+    y[28] = 0;
+    t14 = (-0.06503169044637187) * t10;
+    y[451] = t14;
+    t4 = (-C103) * t5;
+    t6 = C102 * t7;
+    t13 = t4 + t6;
+    t8 = 0.06407132642665489 * t13;
+    y[508] = t8;
+    t9 = (-0.0009614862925791448) * t13;
+    y[931] = t9;
+    t2 = re[195];
+    t3 = im[195];
+    t11 = re[35];
+    t12 = im[35];
+    t1 = re[115];
+    t0 = im[115];
+    t10 = t11 + t1;
+    t14 = t12 + t0;
+    t5 = C0 * t10;
+    t7 = t2 - t5;
+    t4 = C0 * t14;
+    t6 = t3 - t4;
+    t8 = t11 - t1;
+    t13 = C1 * t8;
+    t9 = t12 - t0;
+    t5 = C1 * t9;
+    t4 = t2 + t10;
+    t11 = t3 + t14;
+    t1 = t7 + t5;
+    t8 = t6 - t13;
+    t12 = t7 - t5;
+    t0 = t6 + t13;
+    t9 = C104 * t4;
+    t2 = C105 * t11;
+    t10 = t9 + t2;
+    y[30] = 0;
+    t3 = (-0.06505392268033405) * t10;
+    y[449] = t3;
+    t14 = (-C105) * t4;
+    t7 = C104 * t11;
+    t5 = t14 + t7;
+    t6 = 0.0640494299958065 * t5;
+    y[510] = t6;
+    t13 = (-0.0011014045273434368) * t5;
+    y[929] = t13;
+    t9 = (-C106) * t1;
+    t2 = (-C107) * t8;
+    t10 = t9 + t2;
+    t3 = 0.06375299801573686 * t10;
+    y[609] = t3;
+    t4 = (-0.004967734229580542) * t10;
+    y[830] = t4;
+    t11 = C107 * t1;
+    t14 = (-C106) * t8;
+    t7 = t11 + t14;
+    y[129] = 0;
+    t6 = (-0.0653564035629848) * t7;
+    y[350] = t6;
+    t5 = C108 * t12;
+    t13 = C109 * t0;
+    t9 = t5 + t13;
+    t2 = 0.0021224418341173794 * t9;
+    y[190] = t2;
+    t3 = (-0.062441089406128296) * t9;
+    y[289] = t3;
+    t10 = (-C109) * t12;
+    t4 = C108 * t0;
+    t1 = t10 + t4;
+    t8 = 0.06601864913882413 * t1;
+    y[670] = t8;
+    t11 = 0.02091472784034726 * t1;
+    y[769] = t11;
+    t14 = re[78];
+    t7 = im[78];
+    t6 = re[158];
+    t5 = im[158];
+    t13 = re[238];
+    t2 = im[238];
+    t9 = t6 + t13;
+    t3 = t5 + t2;
+    t12 = C0 * t9;
+    t0 = t14 - t12;
+    t10 = C0 * t3;
+    t4 = t7 - t10;
+    t8 = t6 - t13;
+    t1 = C1 * t8;
+    t11 = t5 - t2;
+    t12 = C1 * t11;
+    t10 = t14 + t9;
+    t6 = t7 + t3;
+    t13 = t0 + t12;
+    t8 = t4 - t1;
+    t5 = t0 - t12;
+    t2 = t4 + t1;
+    t11 = C110 * t10;
+    t14 = C111 * t6;
+    t9 = t11 + t14;
+    t7 = 0.002698791969717943 * t9;
+    y[192] = t7;
+    t3 = (-0.06210336217290626) * t9;
+    y[287] = t3;
+    t0 = (-C111) * t10;
+    t12 = C110 * t6;
+    t4 = t0 + t12;
+    t1 = 0.0661217651490672 * t4;
+    y[672] = t1;
+    t11 = 0.02233693399813748 * t4;
+    y[767] = t11;
+    t14 = C112 * t13;
+    t7 = C113 * t8;
+    t9 = t14 + t7;
+    y[32] = 0;
+    t3 = (-0.06507424547097974) * t9;
+    y[447] = t3;
+    t10 = (-C113) * t13;
+    t6 = C112 * t8;
+    t0 = t10 + t6;
+    t12 = 0.0640294272566682 * t0;
+    y[512] = t12;
+    t1 = (-0.00125166170487896) * t0;
+    y[927] = t1;
+    t4 = (-C114) * t5;
+    t11 = (-C115) * t2;
+    t14 = t4 + t11;
+    t7 = 0.06374551513006745 * t14;
+    y[607] = t7;
+    t9 = (-0.005279387997380958) * t14;
+    y[832] = t9;
+    t3 = C115 * t5;
+    t13 = (-C114) * t2;
+    t8 = t3 + t13;
+    y[127] = 0;
+    t10 = (-0.06536407554578434) * t8;
+    y[352] = t10;
+    t6 = re[186];
+    t12 = im[186];
+    t0 = re[26];
+    t1 = im[26];
+    t4 = re[106];
+    t11 = im[106];
+    t7 = t0 + t4;
+    t14 = t1 + t11;
+    t9 = C0 * t7;
+    t5 = t6 - t9;
+    t2 = C0 * t14;
+    t3 = t12 - t2;
+    t13 = t0 - t4;
+    t8 = C1 * t13;
+    t10 = t1 - t11;
+    t9 = C1 * t10;
+    t2 = t6 + t7;
+    t0 = t12 + t14;
+    t4 = t5 + t9;
+    t13 = t3 - t8;
+    t1 = t5 - t9;
+    t11 = t3 + t8;
+    t10 = (-C116) * t2;
+    t6 = (-C117) * t0;
+    t7 = t10 + t6;
+    t12 = 0.06374030925537781 * t7;
+    y[605] = t12;
+    t14 = (-0.0055645048346550955) * t7;
+    y[834] = t14;
+    t5 = C117 * t2;
+    t9 = (-C116) * t0;
+    t3 = t5 + t9;
+    y[125] = 0;
+    t8 = (-0.06536941403865437) * t3;
+    y[354] = t8;
+    t10 = C118 * t4;
+    t6 = C119 * t13;
+    t12 = t10 + t6;
+    t7 = 0.0033599706942228093 * t12;
+    y[194] = t7;
+    t14 = (-0.061725202011645934) * t12;
+    y[285] = t14;
+    t2 = (-C119) * t4;
+    t0 = C118 * t13;
+    t5 = t2 + t0;
+    t9 = 0.06620871500902986 * t5;
+    y[674] = t9;
+    t3 = 0.023786028235371508 * t5;
+    y[765] = t3;
+    t8 = C120 * t1;
+    t10 = C121 * t11;
+    t6 = t8 + t10;
+    y[34] = 0;
+    t7 = (-0.06509268040129385) * t6;
+    y[445] = t7;
+    t12 = (-C121) * t1;
+    t14 = C120 * t11;
+    t4 = t12 + t14;
+    t13 = 0.06401129345080475 * t4;
+    y[514] = t13;
+    t2 = (-0.0014120709607033427) * t4;
+    y[925] = t2;
+    t0 = re[54];
+    t9 = im[54];
+    t5 = re[134];
+    t3 = im[134];
+    t8 = re[214];
+    t10 = im[214];
+    t6 = t5 + t8;
+    t7 = t3 + t10;
+    t1 = C0 * t6;
+    t11 = t0 - t1;
+    t12 = C0 * t7;
+    t14 = t9 - t12;
+    t13 = t5 - t8;
+    t4 = C1 * t13;
+    t2 = t3 - t10;
+    t1 = C1 * t2;
+    t12 = t0 + t6;
+    t5 = t9 + t7;
+    t8 = t11 + t1;
+    t13 = t14 - t4;
+    t3 = t11 - t1;
+    t10 = t14 + t4;
+    t2 = C122 * t12;
+    t0 = C123 * t5;
+    t6 = t2 + t0;
+    y[36] = 0;
+    t9 = (-0.06510924061437842) * t6;
+    y[443] = t9;
+    t7 = (-C123) * t12;
+    t11 = C122 * t5;
+    t1 = t7 + t11;
+    t14 = 0.06399501249514679 * t1;
+    y[516] = t14;
+    t4 = (-0.0015822605146506958) * t1;
+    y[923] = t4;
+    t2 = (-C124) * t8;
+    t0 = (-C125) * t13;
+    t6 = t2 + t0;
+    t9 = 0.06373721193577314 * t6;
+    y[603] = t9;
+    t12 = (-0.005823786352090389) * t6;
+    y[836] = t12;
+    t5 = C125 * t8;
+    t7 = (-C124) * t13;
+    t11 = t5 + t7;
+    y[123] = 0;
+    t14 = (-0.06537259067537095) * t11;
+    y[356] = t14;
+    t1 = C126 * t3;
+    t4 = C127 * t10;
+    t2 = t1 + t4;
+    t0 = 0.004108711258476244 * t2;
+    y[196] = t0;
+    t9 = (-0.061302768645727056) * t2;
+    y[283] = t9;
+    t6 = (-C127) * t3;
+    t12 = C126 * t10;
+    t8 = t6 + t12;
+    t13 = 0.06627569639906315 * t8;
+    y[676] = t13;
+    t5 = 0.025259254532999657 * t8;
+    y[763] = t5;
+    t7 = re[162];
+    t11 = im[162];
+    t14 = re[2];
+    t1 = im[2];
+    t4 = re[82];
+    t0 = im[82];
+    t2 = t14 + t4;
+    t9 = t1 + t0;
+    t3 = C0 * t2;
+    t10 = t7 - t3;
+    t6 = C0 * t9;
+    t12 = t11 - t6;
+    t13 = t14 - t4;
+    t8 = C1 * t13;
+    t5 = t1 - t0;
+    t3 = C1 * t5;
+    t6 = t7 + t2;
+    t14 = t11 + t9;
+    t4 = t10 + t3;
+    t13 = t12 - t8;
+    t1 = t10 - t3;
+    t0 = t12 + t8;
+    t5 = C128 * t6;
+    t7 = C129 * t14;
+    t2 = t5 + t7;
+    t11 = 0.004946773340143956 * t2;
+    y[198] = t11;
+    t9 = (-0.06083212068839759) * t2;
+    y[281] = t9;
+    t10 = (-C129) * t6;
+    t3 = C128 * t14;
+    t12 = t10 + t3;
+    t8 = 0.06631893477331191 * t12;
+    y[678] = t8;
+    t5 = 0.02675384811682817 * t12;
+    y[761] = t5;
+    t7 = C130 * t4;
+    t11 = C131 * t13;
+    t2 = t7 + t11;
+    y[38] = 0;
+    t9 = (-0.06512399073581787) * t2;
+    y[441] = t9;
+    t6 = (-C131) * t4;
+    t14 = C130 * t13;
+    t10 = t6 + t14;
+    t3 = 0.0639805180792617 * t10;
+    y[518] = t3;
+    t8 = (-0.0017617321668600802) * t10;
+    y[921] = t8;
+    t12 = (-C132) * t1;
+    t5 = (-C133) * t0;
+    t7 = t12 + t5;
+    t11 = 0.06373607267574667 * t7;
+    y[601] = t11;
+    t2 = (-0.0060577880678891185) * t7;
+    y[838] = t2;
+    t9 = C133 * t1;
+    t4 = (-C132) * t0;
+    t13 = t9 + t4;
+    y[121] = 0;
+    t6 = (-0.06537375918758478) * t13;
+    y[358] = t6;
+    t14 = re[45];
+    t3 = im[45];
+    t10 = re[125];
+    t8 = im[125];
+    t12 = re[205];
+    t5 = im[205];
+    t11 = t10 + t12;
+    t7 = t8 + t5;
+    t2 = C0 * t11;
+    t1 = t14 - t2;
+    t0 = C0 * t7;
+    t9 = t3 - t0;
+    t4 = t10 - t12;
+    t13 = C1 * t4;
+    t6 = t8 - t5;
+    t2 = C1 * t6;
+    t0 = t14 + t11;
+    t10 = t3 + t7;
+    t12 = t1 + t2;
+    t4 = t9 - t13;
+    t8 = t1 - t2;
+    t5 = t9 + t13;
+    t6 = (-C134) * t0;
+    t14 = (-C135) * t10;
+    t11 = t6 + t14;
+    t3 = 0.06373671261707498 * t11;
+    y[599] = t3;
+    t7 = (-0.00626707518983094) * t11;
+    y[840] = t7;
+    t1 = C135 * t0;
+    t2 = (-C134) * t10;
+    t9 = t1 + t2;
+    y[119] = 0;
+    t13 = (-0.06537310280967362) * t9;
+    y[360] = t13;
+    t6 = C136 * t12;
+    t14 = C137 * t4;
+    t3 = t6 + t14;
+    t11 = 0.005874914882993542 * t3;
+    y[200] = t11;
+    t7 = (-0.060309534865694944) * t3;
+    y[279] = t7;
+    t0 = (-C137) * t12;
+    t10 = C136 * t4;
+    t1 = t0 + t10;
+    t2 = 0.06633445460906878 * t1;
+    y[680] = t2;
+    t9 = 0.02826705866069585 * t1;
+    y[759] = t9;
+    t13 = C138 * t8;
+    t6 = C139 * t5;
+    t14 = t13 + t6;
+    y[40] = 0;
+    t11 = (-0.06513698056812472) * t14;
+    y[439] = t11;
+    t3 = (-C139) * t8;
+    t7 = C138 * t5;
+    t12 = t3 + t7;
+    t4 = 0.06396775887253293 * t12;
+    y[520] = t4;
+    t0 = (-0.0019499585127337403) * t12;
+    y[919] = t0;
+    t10 = re[153];
+    t2 = im[153];
+    t1 = re[233];
+    t9 = im[233];
+    t13 = re[73];
+    t6 = im[73];
+    t14 = t1 + t13;
+    t11 = t9 + t6;
+    t8 = C0 * t14;
+    t5 = t10 - t8;
+    t3 = C0 * t11;
+    t7 = t2 - t3;
+    t4 = t1 - t13;
+    t12 = C1 * t4;
+    t0 = t9 - t6;
+    t8 = C1 * t0;
+    t3 = t10 + t14;
+    t1 = t2 + t11;
+    t13 = t5 + t8;
+    t4 = t7 - t12;
+    t9 = t5 - t8;
+    t6 = t7 + t12;
+    t0 = C140 * t3;
+    t10 = C141 * t1;
+    t14 = t0 + t10;
+    y[42] = 0;
+    t2 = (-0.06514830258601771) * t14;
+    y[437] = t2;
+    t11 = (-C141) * t3;
+    t5 = C140 * t1;
+    t8 = t11 + t5;
+    t7 = 0.06395664201941807 * t8;
+    y[522] = t7;
+    t12 = (-0.002146342084224539) * t8;
+    y[917] = t12;
+    t0 = (-C142) * t13;
+    t10 = (-C143) * t4;
+    t14 = t0 + t10;
+    t2 = 0.06373897609694043 * t14;
+    y[597] = t2;
+    t3 = (-0.006452302836340159) * t14;
+    y[842] = t3;
+    t1 = C143 * t13;
+    t11 = (-C142) * t4;
+    t5 = t1 + t11;
+    y[117] = 0;
+    t7 = (-0.0653707812991786) * t5;
+    y[362] = t7;
+    t8 = C144 * t9;
+    t12 = C145 * t6;
+    t0 = t8 + t12;
+    t10 = 0.006892880337578761 * t0;
+    y[202] = t10;
+    t2 = (-0.05973152439328069) * t0;
+    y[277] = t2;
+    t14 = (-C145) * t9;
+    t3 = C144 * t6;
+    t13 = t14 + t3;
+    t4 = 0.06631822500252159 * t13;
+    y[682] = t4;
+    t1 = 0.02979567062694908 * t13;
+    y[757] = t1;
+    t11 = re[21];
+    t5 = im[21];
+    t7 = re[101];
+    t8 = im[101];
+    t12 = re[181];
+    t10 = im[181];
+    t0 = t7 + t12;
+    t2 = t8 + t10;
+    t9 = C0 * t0;
+    t6 = t11 - t9;
+    t14 = C0 * t2;
+    t3 = t5 - t14;
+    t4 = t7 - t12;
+    t13 = C1 * t4;
+    t1 = t8 - t10;
+    t9 = C1 * t1;
+    t14 = t11 + t0;
+    t7 = t5 + t2;
+    t12 = t6 + t9;
+    t4 = t3 - t13;
+    t8 = t6 - t9;
+    t10 = t3 + t13;
+    t1 = C146 * t14;
+    t11 = C147 * t7;
+    t0 = t1 + t11;
+    t5 = 0.007999393194151353 * t0;
+    y[204] = t5;
+    t2 = (-0.059094601384874317) * t0;
+    y[275] = t2;
+    t6 = (-C147) * t14;
+    t9 = C146 * t7;
+    t3 = t6 + t9;
+    t13 = 0.06626654744040716 * t3;
+    y[684] = t13;
+    t1 = 0.03133630944747369 * t3;
+    y[755] = t1;
+    t11 = C148 * t12;
+    t5 = C149 * t4;
+    t0 = t11 + t5;
+    y[44] = 0;
+    t2 = (-0.06515803546751704) * t0;
+    y[435] = t2;
+    t14 = (-C149) * t12;
+    t7 = C148 * t4;
+    t6 = t14 + t7;
+    t9 = 0.06394708859422037 * t6;
+    y[524] = t9;
+    t13 = (-0.002350185942897436) * t6;
+    y[915] = t13;
+    t3 = (-C150) * t8;
+    t1 = (-C151) * t10;
+    t11 = t3 + t1;
+    t5 = 0.06374267795104448 * t11;
+    y[595] = t5;
+    t0 = (-0.006614088359731265) * t11;
+    y[844] = t0;
+    t2 = C151 * t8;
+    t12 = (-C150) * t10;
+    t4 = t2 + t12;
+    y[115] = 0;
+    t14 = (-0.06536698489302159) * t4;
+    y[364] = t14;
+    t7 = re[129];
+    t9 = im[129];
+    t6 = re[209];
+    t13 = im[209];
+    t3 = re[49];
+    t1 = im[49];
+    t5 = t6 + t3;
+    t11 = t13 + t1;
+    t0 = C0 * t5;
+    t8 = t7 - t0;
+    t10 = C0 * t11;
+    t2 = t9 - t10;
+    t12 = t6 - t3;
+    t4 = C1 * t12;
+    t14 = t13 - t1;
+    t0 = C1 * t14;
+    t10 = t7 + t5;
+    t6 = t9 + t11;
+    t3 = t8 + t0;
+    t12 = t2 - t4;
+    t13 = t8 - t0;
+    t1 = t2 + t4;
+    t14 = (-C152) * t10;
+    t7 = (-C153) * t6;
+    t5 = t14 + t7;
+    t9 = 0.06374766977168722 * t5;
+    y[593] = t9;
+    t11 = (-0.006752951917176866) * t5;
+    y[846] = t11;
+    t8 = C153 * t10;
+    t0 = (-C152) * t6;
+    t2 = t8 + t0;
+    y[113] = 0;
+    t4 = (-0.06536186627040039) * t2;
+    y[366] = t4;
+    t14 = C154 * t3;
+    t7 = C155 * t12;
+    t9 = t14 + t7;
+    t5 = 0.009192221304956522 * t9;
+    y[206] = t5;
+    t11 = (-0.05839568485751641) * t9;
+    y[273] = t11;
+    t10 = (-C155) * t3;
+    t6 = C154 * t12;
+    t8 = t10 + t6;
+    t0 = 0.06617571199292888 * t8;
+    y[686] = t0;
+    t2 = 0.032885483701619124 * t8;
+    y[753] = t2;
+    t4 = C156 * t13;
+    t14 = C157 * t1;
+    t7 = t4 + t14;
+    y[46] = 0;
+    t5 = (-0.06516632732810197) * t7;
+    y[433] = t5;
+    t9 = (-C157) * t13;
+    t11 = C156 * t1;
+    t3 = t9 + t11;
+    t12 = 0.06393895187138858 * t3;
+    y[526] = t12;
+    t10 = (-0.0025607313781491553) * t3;
+    y[913] = t10;
+    t6 = re[192];
+    t0 = im[192];
+    t8 = re[32];
+    t2 = im[32];
+    t4 = re[112];
+    t14 = im[112];
+    t7 = t8 + t4;
+    t5 = t2 + t14;
+    t13 = C0 * t7;
+    t1 = t6 - t13;
+    t9 = C0 * t5;
+    t11 = t0 - t9;
+    t12 = t8 - t4;
+    t3 = C1 * t12;
+    t10 = t2 - t14;
+    t13 = C1 * t10;
+    t9 = t6 + t7;
+    t8 = t0 + t5;
+    t4 = t1 + t13;
+    t12 = t11 - t3;
+    t2 = t1 - t13;
+    t14 = t11 + t3;
+    t10 = C158 * t9;
+    t6 = C159 * t8;
+    t7 = t10 + t6;
+    y[48] = 0;
+    t0 = (-0.0651732710663119) * t7;
+    y[431] = t0;
+    t5 = (-C159) * t9;
+    t1 = C158 * t8;
+    t13 = t5 + t1;
+    t11 = 0.06393213964091513 * t13;
+    y[528] = t11;
+    t3 = (-0.0027770603351207086) * t13;
+    y[911] = t3;
+    t10 = (-C160) * t4;
+    t6 = (-C161) * t12;
+    t7 = t10 + t6;
+    t0 = 0.06375375853090137 * t7;
+    y[591] = t0;
+    t9 = (-0.006869357953162704) * t7;
+    y[848] = t9;
+    t8 = C161 * t4;
+    t5 = (-C160) * t12;
+    t1 = t8 + t5;
+    y[111] = 0;
+    t11 = (-0.06535562392995367) * t1;
+    y[368] = t11;
+    t13 = C162 * t2;
+    t3 = C163 * t14;
+    t10 = t13 + t3;
+    t6 = 0.010468257099355354 * t10;
+    y[208] = t6;
+    t0 = (-0.05763217601515571) * t10;
+    y[271] = t0;
+    t7 = (-C163) * t2;
+    t9 = C162 * t14;
+    t4 = t7 + t9;
+    t12 = 0.06604203723121735 * t4;
+    y[688] = t12;
+    t8 = 0.03443938653167817 * t4;
+    y[751] = t8;
+    t5 = re[60];
+    t1 = im[60];
+    t11 = re[140];
+    t13 = im[140];
+    t3 = re[220];
+    t6 = im[220];
+    t10 = t11 + t3;
+    t0 = t13 + t6;
+    t2 = C0 * t10;
+    t14 = t5 - t2;
+    t7 = C0 * t0;
+    t9 = t1 - t7;
+    t12 = t11 - t3;
+    t4 = C1 * t12;
+    t8 = t13 - t6;
+    t2 = C1 * t8;
+    t7 = t5 + t10;
+    t11 = t1 + t0;
+    t3 = t14 + t2;
+    t12 = t9 - t4;
+    t13 = t14 - t2;
+    t6 = t9 + t4;
+    t8 = C164 * t7;
+    t5 = C165 * t11;
+    t10 = t8 + t5;
+    t1 = 0.011823449188095525 * t10;
+    y[210] = t1;
+    t0 = (-0.05680190137652522) * t10;
+    y[269] = t0;
+    t14 = (-C165) * t7;
+    t2 = C164 * t11;
+    t9 = t14 + t2;
+    t4 = 0.06586204827489513 * t9;
+    y[690] = t4;
+    t8 = 0.03599432697935784 * t9;
+    y[749] = t8;
+    t5 = C166 * t3;
+    t1 = C167 * t12;
+    t10 = t5 + t1;
+    y[50] = 0;
+    t0 = (-0.06517903307994174) * t10;
+    y[429] = t0;
+    t7 = (-C167) * t3;
+    t11 = C166 * t12;
+    t14 = t7 + t11;
+    t2 = 0.06392648785624468 * t14;
+    y[530] = t2;
+    t4 = (-0.0029983489972161405) * t14;
+    y[909] = t4;
+    t9 = (-C168) * t13;
+    t8 = (-C169) * t6;
+    t5 = t9 + t8;
+    t1 = 0.06376080812550963 * t5;
+    y[589] = t1;
+    t10 = (-0.0069638454177599575) * t5;
+    y[850] = t10;
+    t0 = C169 * t13;
+    t3 = (-C168) * t6;
+    t12 = t0 + t3;
+    y[109] = 0;
+    t7 = (-0.065348398007516) * t12;
+    y[370] = t7;
+    t11 = re[168];
+    t2 = im[168];
+    t14 = re[8];
+    t4 = im[8];
+    t9 = re[88];
+    t8 = im[88];
+    t1 = t14 + t9;
+    t5 = t4 + t8;
+    t10 = C0 * t1;
+    t13 = t11 - t10;
+    t6 = C0 * t5;
+    t0 = t2 - t6;
+    t3 = t14 - t9;
+    t12 = C1 * t3;
+    t7 = t4 - t8;
+    t10 = C1 * t7;
+    t6 = t11 + t1;
+    t14 = t2 + t5;
+    t9 = t13 + t10;
+    t3 = t0 - t12;
+    t4 = t13 - t10;
+    t8 = t0 + t12;
+    t7 = (-C170) * t6;
+    t11 = (-C171) * t14;
+    t1 = t7 + t11;
+    t2 = 0.06376861909256175 * t1;
+    y[587] = t2;
+    t5 = (-0.007036978103218968) * t1;
+    y[852] = t5;
+    t13 = C171 * t6;
+    t10 = (-C170) * t14;
+    t0 = t13 + t10;
+    y[107] = 0;
+    t12 = (-0.06534039353461056) * t0;
+    y[372] = t12;
+    t7 = C172 * t9;
+    t11 = C173 * t3;
+    t2 = t7 + t11;
+    t1 = 0.013252961052902145 * t2;
+    y[212] = t1;
+    t5 = (-0.05590313564763854) * t2;
+    y[267] = t5;
+    t6 = (-C173) * t9;
+    t14 = C172 * t3;
+    t13 = t6 + t14;
+    t10 = 0.06563252203272879 * t13;
+    y[692] = t10;
+    t0 = 0.037546543945018315 * t13;
+    y[747] = t0;
+    t12 = C174 * t4;
+    t7 = C175 * t8;
+    t11 = t12 + t7;
+    y[52] = 0;
+    t1 = (-0.06518373563426666) * t11;
+    y[427] = t1;
+    t2 = (-C175) * t4;
+    t5 = C174 * t8;
+    t9 = t2 + t5;
+    t3 = 0.06392187600362498 * t9;
+    y[532] = t3;
+    t6 = (-0.0032237589325984635) * t9;
+    y[907] = t6;
+    t14 = re[36];
+    t10 = im[36];
+    t13 = re[116];
+    t0 = im[116];
+    t12 = re[196];
+    t7 = im[196];
+    t11 = t13 + t12;
+    t1 = t0 + t7;
+    t4 = C0 * t11;
+    t8 = t14 - t4;
+    t2 = C0 * t1;
+    t5 = t10 - t2;
+    t3 = t13 - t12;
+    t9 = C1 * t3;
+    t6 = t0 - t7;
+    t4 = C1 * t6;
+    t2 = t14 + t11;
+    t13 = t10 + t1;
+    t12 = t8 + t4;
+    t3 = t5 - t9;
+    t0 = t8 - t4;
+    t7 = t5 + t9;
+    t6 = C176 * t2;
+    t14 = C177 * t13;
+    t11 = t6 + t14;
+    y[54] = 0;
+    t10 = (-0.065187570450821) * t11;
+    y[425] = t10;
+    t1 = (-C177) * t2;
+    t8 = C176 * t13;
+    t4 = t1 + t8;
+    t5 = 0.06391811564460889 * t4;
+    y[534] = t5;
+    t9 = (-0.003452223749770549) * t4;
+    y[905] = t9;
+    t6 = (-C178) * t12;
+    t14 = (-C179) * t3;
+    t11 = t6 + t14;
+    t10 = 0.06377706421929838 * t11;
+    y[585] = t10;
+    t2 = (-0.007089347087212765) * t11;
+    y[854] = t2;
+    t13 = C179 * t12;
+    t1 = (-C178) * t3;
+    t8 = t13 + t1;
+    y[105] = 0;
+    t5 = (-0.0653317413974955) * t8;
+    y[374] = t5;
+    t4 = C180 * t0;
+    t9 = C181 * t7;
+    t6 = t4 + t9;
+    t14 = 0.014751444591647385 * t6;
+    y[214] = t14;
+    t10 = (-0.05493452772666063) * t6;
+    y[265] = t10;
+    t11 = (-C181) * t0;
+    t2 = C180 * t7;
+    t12 = t11 + t2;
+    t3 = 0.06535061848860482 * t12;
+    y[694] = t3;
+    t13 = 0.039091852988859394 * t12;
+    y[745] = t13;
+    t1 = re[159];
+    t8 = im[159];
+    t5 = re[239];
+    t4 = im[239];
+    t9 = re[79];
+    t14 = im[79];
+    t6 = t5 + t9;
+    t10 = t4 + t14;
+    t0 = C0 * t6;
+    t7 = t1 - t0;
+    t11 = C0 * t10;
+    t2 = t8 - t11;
+    t3 = t5 - t9;
+    t12 = C1 * t3;
+    t13 = t4 - t14;
+    t0 = C1 * t13;
+    t11 = t1 + t6;
+    t5 = t8 + t10;
+    t9 = t7 + t0;
+    t3 = t2 - t12;
+    t4 = t7 - t0;
+    t14 = t2 + t12;
+    t13 = C182 * t11;
+    t1 = C183 * t5;
+    t6 = t13 + t1;
+    t8 = 0.016312759798310757 * t6;
+    y[216] = t8;
+    t10 = (-0.05389537209194186) * t6;
+    y[263] = t10;
+    t7 = (-C183) * t11;
+    t0 = C182 * t5;
+    t2 = t7 + t0;
+    t12 = 0.06501374318100199 * t2;
+    y[696] = t12;
+    t13 = 0.0406262824335368 * t2;
+    y[743] = t13;
+    t1 = C184 * t9;
+    t8 = C185 * t3;
+    t6 = t1 + t8;
+    y[56] = 0;
+    t10 = (-0.0651906732319496) * t6;
+    y[423] = t10;
+    t11 = (-C185) * t9;
+    t5 = C184 * t3;
+    t7 = t11 + t5;
+    t0 = 0.06391507343146448 * t7;
+    y[536] = t0;
+    t12 = (-0.0036826411595666368) * t7;
+    y[903] = t12;
+    t2 = (-C186) * t4;
+    t13 = (-C187) * t14;
+    t1 = t2 + t13;
+    t8 = 0.06378595726136826 * t1;
+    y[583] = t8;
+    t6 = (-0.007121292166469594) * t1;
+    y[856] = t6;
+    t10 = C187 * t4;
+    t9 = (-C186) * t14;
+    t3 = t10 + t9;
+    y[103] = 0;
+    t11 = (-0.06532263284210665) * t3;
+    y[376] = t11;
+    t5 = re[27];
+    t0 = im[27];
+    t7 = re[107];
+    t12 = im[107];
+    t2 = re[187];
+    t13 = im[187];
+    t8 = t7 + t2;
+    t1 = t12 + t13;
+    t6 = C0 * t8;
+    t4 = t5 - t6;
+    t14 = C0 * t1;
+    t10 = t0 - t14;
+    t9 = t7 - t2;
+    t3 = C1 * t9;
+    t11 = t12 - t13;
+    t6 = C1 * t11;
+    t14 = t5 + t8;
+    t7 = t0 + t1;
+    t2 = t4 + t6;
+    t9 = t10 - t3;
+    t12 = t4 - t6;
+    t13 = t10 + t3;
+    t11 = (-C188) * t14;
+    t5 = (-C189) * t7;
+    t8 = t11 + t5;
+    t0 = 0.06379518584601195 * t8;
+    y[581] = t0;
+    t1 = (-0.0071333021455818576) * t8;
+    y[858] = t1;
+    t4 = C189 * t14;
+    t6 = (-C188) * t7;
+    t10 = t4 + t6;
+    y[101] = 0;
+    t3 = (-0.06531318329762556) * t10;
+    y[378] = t3;
+    t11 = C190 * t2;
+    t5 = C191 * t9;
+    t0 = t11 + t5;
+    t8 = 0.017930354041316373 * t0;
+    y[218] = t8;
+    t1 = (-0.05278557016376946) * t0;
+    y[261] = t1;
+    t14 = (-C191) * t2;
+    t7 = C190 * t9;
+    t4 = t14 + t7;
+    t6 = 0.06461949818589519 * t4;
+    y[698] = t6;
+    t10 = 0.04214582765550592 * t4;
+    y[741] = t10;
+    t3 = C192 * t12;
+    t11 = C193 * t13;
+    t5 = t3 + t11;
+    y[58] = 0;
+    t8 = (-0.06519322000115729) * t5;
+    y[421] = t8;
+    t0 = (-C193) * t12;
+    t1 = C192 * t13;
+    t2 = t0 + t1;
+    t9 = 0.0639125765929755 * t2;
+    y[538] = t9;
+    t14 = (-0.003914112644701813) * t2;
+    y[901] = t14;
+}
+
+/**
+ *  Part 7 of ApplyWindowedIMDCT_W10_480_K160().
+ * 
+ *  @param {Number[]} X 
+ *    - The input block (480 points, only the first 160 points are used).
+ *  @param {Number[]} y 
+ *    - The array that would contain the output block (960 points).
+ *  @param {Number[]} re 
+ *    - The scratch buffer (real part, 240 points).
+ *  @param {Number[]} im 
+ *    - The scratch buffer (imaginary part, 240 points).
+ */
+function ApplyWindowedIMDCT_W10_480_K160_Part7(X, y, re, im) {
+    let t0, t1, t10, t11, t12, t13, t14, t2, t3, t4, t5, t6, t7, t8, t9;
+    const C0 = 0.5;
+    const C1 = 0.8660254037844386;
+    const C2 = 0.5542090009406057;
+    const C3 = 0.8323775485177478;
+    const C4 = 0.8961478480794324;
+    const C5 = 0.4437556020858809;
+    const C6 = 0.0637702995616845;
+    const C7 = 0.9979646030264866;
+    const C8 = 0.057237317287568625;
+    const C9 = 0.9983606009402225;
+    const C10 = 0.5487492712856159;
+    const C11 = 0.8359869839079467;
+    const C12 = 0.8932243011955153;
+    const C13 = 0.44961132965460654;
+    const C14 = 0.8902624915554164;
+    const C15 = 0.45544779737039254;
+    const C16 = 0.05070188315728074;
+    const C17 = 0.9987138324086161;
+    const C18 = 0.5432660350382235;
+    const C19 = 0.8395606083981357;
+    const C20 = 0.5377595270820199;
+    const C21 = 0.8430982689061355;
+    const C22 = 0.8872625460332028;
+    const C23 = 0.4612647552183872;
+    const C24 = 0.04416427712706736;
+    const C25 = 0.9990242823004072;
+    const C26 = 0.037624779246211985;
+    const C27 = 0.9992919373169553;
+    const C28 = 0.5322299832974788;
+    const C29 = 0.8465998138903442;
+    const C30 = 0.8842245931365562;
+    const C31 = 0.4670619540194766;
+    const C32 = 0.8811487630012675;
+    const C33 = 0.4728391454409586;
+    const C34 = 0.03108366964503869;
+    const C35 = 0.9995167859928107;
+    const C36 = 0.5266776405518521;
+    const C37 = 0.8500650933562288;
+    const C38 = 0.5211027366890234;
+    const C39 = 0.8534939588627505;
+    const C40 = 0.8780351873856628;
+    const C41 = 0.4785960820071808;
+    const C42 = 0.024541228522912288;
+    const C43 = 0.9996988186962042;
+    const C44 = 0.01799773613623551;
+    const C45 = 0.9998380276294608;
+    const C46 = 0.5155055105193195;
+    const C47 = 0.8568862635287228;
+    const C48 = 0.8748839996649582;
+    const C49 = 0.4843325171101413;
+    const C50 = 0.8716953348255482;
+    const C51 = 0.4900482050200525;
+    const C52 = 0.01145347278644378;
+    const C53 = 0.9999344068293331;
+    const C54 = 0.5098862018092806;
+    const C55 = 0.8602418620391045;
+    const C56 = 0.5042450512713892;
+    const C57 = 0.8635606106512236;
+    const C58 = 0.8684693294592216;
+    const C59 = 0.49574290089586764;
+    const C60 = 0.00490871880799799;
+    const C61 = 0.9999879521672569;
+    t7 = re[135];
+    t6 = im[135];
+    t4 = re[215];
+    t10 = im[215];
+    t3 = re[55];
+    t11 = im[55];
+    t5 = t4 + t3;
+    t8 = t10 + t11;
+    t12 = C0 * t5;
+    t13 = t7 - t12;
+    t0 = C0 * t8;
+    t1 = t6 - t0;
+    t9 = t4 - t3;
+    t2 = C1 * t9;
+    t14 = t10 - t11;
+    t12 = C1 * t14;
+    t0 = t7 + t5;
+    t4 = t6 + t8;
+    t3 = t13 + t12;
+    t9 = t1 - t2;
+    t10 = t13 - t12;
+    t11 = t1 + t2;
+    t14 = C2 * t0;
+    t7 = C3 * t4;
+    t5 = t14 + t7;
+    y[60] = 0;
+    t6 = (-0.06519537224889435) * t5;
+    y[419] = t6;
+    t8 = (-C3) * t0;
+    t13 = C2 * t4;
+    t12 = t8 + t13;
+    t1 = 0.06391046669324492 * t12;
+    y[540] = t1;
+    t2 = (-0.00414557911234842) * t12;
+    y[899] = t2;
+    t14 = (-C4) * t3;
+    t7 = (-C5) * t9;
+    t5 = t14 + t7;
+    t6 = 0.06380456147299418 * t5;
+    y[579] = t6;
+    t0 = (-0.007126113859786178) * t5;
+    y[860] = t0;
+    t4 = C5 * t3;
+    t8 = (-C4) * t9;
+    t13 = t4 + t8;
+    y[99] = 0;
+    t1 = (-0.06530358598938484) * t13;
+    y[380] = t1;
+    t12 = C6 * t10;
+    t2 = C7 * t11;
+    t14 = t12 + t2;
+    t7 = 0.019597325760166824 * t14;
+    y[220] = t7;
+    t6 = (-0.05160544713305959) * t14;
+    y[259] = t6;
+    t5 = (-C7) * t10;
+    t0 = C6 * t11;
+    t3 = t5 + t0;
+    t9 = 0.064166020687882 * t3;
+    y[700] = t9;
+    t4 = 0.04364628566097206 * t3;
+    y[739] = t4;
+    t8 = re[3];
+    t13 = im[3];
+    t1 = re[83];
+    t12 = im[83];
+    t2 = re[163];
+    t7 = im[163];
+    t14 = t1 + t2;
+    t6 = t12 + t7;
+    t10 = C0 * t14;
+    t11 = t8 - t10;
+    t5 = C0 * t6;
+    t0 = t13 - t5;
+    t9 = t1 - t2;
+    t3 = C1 * t9;
+    t4 = t12 - t7;
+    t10 = C1 * t4;
+    t5 = t8 + t14;
+    t1 = t13 + t6;
+    t2 = t11 + t10;
+    t9 = t0 - t3;
+    t12 = t11 - t10;
+    t7 = t0 + t3;
+    t4 = C8 * t5;
+    t8 = C9 * t1;
+    t14 = t4 + t8;
+    t13 = 0.021306338484103477 * t14;
+    y[222] = t13;
+    t6 = (-0.05035612752637894) * t14;
+    y[257] = t6;
+    t11 = (-C9) * t5;
+    t10 = C8 * t1;
+    t0 = t11 + t10;
+    t3 = 0.06365161549822701 * t0;
+    y[702] = t3;
+    t4 = 0.04512355795413753 * t0;
+    y[737] = t4;
+    t8 = C10 * t2;
+    t13 = C11 * t9;
+    t14 = t8 + t13;
+    y[62] = 0;
+    t6 = (-0.06519729623737117) * t14;
+    y[417] = t6;
+    t5 = (-C11) * t2;
+    t1 = C10 * t9;
+    t11 = t5 + t1;
+    t10 = 0.06390858067942896 * t11;
+    y[542] = t10;
+    t3 = (-0.004375801329143805) * t11;
+    y[897] = t3;
+    t0 = (-C12) * t12;
+    t4 = (-C13) * t7;
+    t8 = t0 + t4;
+    t13 = 0.06381399902660753 * t8;
+    y[577] = t13;
+    t14 = (-0.007100273596993801) * t8;
+    y[862] = t14;
+    t6 = C13 * t12;
+    t2 = (-C12) * t7;
+    t9 = t6 + t2;
+    y[97] = 0;
+    t5 = (-0.06529392813839101) * t9;
+    y[382] = t5;
+    t1 = re[126];
+    t10 = im[126];
+    t11 = re[206];
+    t3 = im[206];
+    t0 = re[46];
+    t4 = im[46];
+    t13 = t11 + t0;
+    t8 = t3 + t4;
+    t14 = C0 * t13;
+    t12 = t1 - t14;
+    t7 = C0 * t8;
+    t6 = t10 - t7;
+    t2 = t11 - t0;
+    t9 = C1 * t2;
+    t5 = t3 - t4;
+    t14 = C1 * t5;
+    t7 = t1 + t13;
+    t11 = t10 + t8;
+    t0 = t12 + t14;
+    t2 = t6 - t9;
+    t3 = t12 - t14;
+    t4 = t6 + t9;
+    t5 = (-C14) * t7;
+    t1 = (-C15) * t11;
+    t13 = t5 + t1;
+    t10 = 0.06382332027598772 * t13;
+    y[575] = t10;
+    t8 = (-0.007056159883489285) * t13;
+    y[864] = t8;
+    t12 = C15 * t7;
+    t14 = (-C14) * t11;
+    t6 = t12 + t14;
+    y[95] = 0;
+    t9 = (-0.06528439211010925) * t6;
+    y[384] = t9;
+    t5 = C16 * t0;
+    t1 = C17 * t2;
+    t10 = t5 + t1;
+    t13 = 0.023049975094085177 * t10;
+    y[224] = t13;
+    t8 = (-0.04903936486333267) * t10;
+    y[255] = t8;
+    t7 = (-C17) * t0;
+    t11 = C16 * t2;
+    t12 = t7 + t11;
+    t14 = 0.06307476894193742 * t12;
+    y[704] = t14;
+    t6 = 0.04657358866856538 * t12;
+    y[735] = t6;
+    t9 = C18 * t3;
+    t5 = C19 * t4;
+    t1 = t9 + t5;
+    y[64] = 0;
+    t13 = (-0.06519914488456442) * t1;
+    y[415] = t13;
+    t10 = (-C19) * t3;
+    t8 = C18 * t4;
+    t0 = t10 + t8;
+    t2 = 0.06390676862470789 * t0;
+    y[544] = t2;
+    t7 = (-0.004603664429274723) * t0;
+    y[895] = t7;
+    t11 = re[234];
+    t14 = im[234];
+    t12 = re[74];
+    t6 = im[74];
+    t9 = re[154];
+    t5 = im[154];
+    t1 = t12 + t9;
+    t13 = t6 + t5;
+    t3 = C0 * t1;
+    t4 = t11 - t3;
+    t10 = C0 * t13;
+    t8 = t14 - t10;
+    t2 = t12 - t9;
+    t0 = C1 * t2;
+    t7 = t6 - t5;
+    t3 = C1 * t7;
+    t10 = t11 + t1;
+    t12 = t14 + t13;
+    t9 = t4 + t3;
+    t2 = t8 - t0;
+    t6 = t4 - t3;
+    t5 = t8 + t0;
+    t7 = C20 * t10;
+    t11 = C21 * t12;
+    t1 = t7 + t11;
+    y[66] = 0;
+    t14 = (-0.065201058182397) * t1;
+    y[413] = t14;
+    t13 = (-C21) * t10;
+    t4 = C20 * t12;
+    t3 = t13 + t4;
+    t8 = 0.06390489330726203 * t3;
+    y[546] = t8;
+    t0 = (-0.004828163617283523) * t3;
+    y[893] = t0;
+    t7 = (-C22) * t9;
+    t11 = (-C23) * t2;
+    t1 = t7 + t11;
+    t14 = 0.06383246193490441 * t1;
+    y[573] = t14;
+    t10 = (-0.0069944183140304966) * t1;
+    y[866] = t10;
+    t12 = C23 * t9;
+    t13 = (-C22) * t2;
+    t4 = t12 + t13;
+    y[93] = 0;
+    t8 = (-0.06527504251544898) * t4;
+    y[386] = t8;
+    t3 = C24 * t6;
+    t0 = C25 * t5;
+    t7 = t3 + t0;
+    t11 = 0.024820480698015124 * t7;
+    y[226] = t11;
+    t14 = (-0.04765724470703279) * t7;
+    y[253] = t14;
+    t1 = (-C25) * t6;
+    t10 = C24 * t5;
+    t9 = t1 + t10;
+    t2 = 0.06243485865874562 * t9;
+    y[706] = t2;
+    t12 = 0.0479923553379481 * t9;
+    y[733] = t12;
+    t13 = re[102];
+    t4 = im[102];
+    t8 = re[182];
+    t3 = im[182];
+    t0 = re[22];
+    t11 = im[22];
+    t7 = t8 + t0;
+    t14 = t3 + t11;
+    t6 = C0 * t7;
+    t5 = t13 - t6;
+    t1 = C0 * t14;
+    t10 = t4 - t1;
+    t2 = t8 - t0;
+    t9 = C1 * t2;
+    t12 = t3 - t11;
+    t6 = C1 * t12;
+    t1 = t13 + t7;
+    t8 = t4 + t14;
+    t0 = t5 + t6;
+    t2 = t10 - t9;
+    t3 = t5 - t6;
+    t11 = t10 + t9;
+    t12 = C26 * t1;
+    t13 = C27 * t8;
+    t7 = t12 + t13;
+    t4 = 0.02661009304738782 * t7;
+    y[228] = t4;
+    t14 = (-0.04621244968025226) * t7;
+    y[251] = t14;
+    t5 = (-C27) * t1;
+    t6 = C26 * t8;
+    t10 = t5 + t6;
+    t9 = 0.061731500412022404 * t10;
+    y[708] = t9;
+    t12 = 0.049376107323254634 * t10;
+    y[731] = t12;
+    t13 = C28 * t0;
+    t4 = C29 * t2;
+    t7 = t13 + t4;
+    y[68] = 0;
+    t14 = (-0.06520317390295996) * t7;
+    y[411] = t14;
+    t1 = (-C29) * t0;
+    t8 = C28 * t2;
+    t5 = t1 + t8;
+    t6 = 0.06390281971346669 * t5;
+    y[548] = t6;
+    t9 = (-0.005048247514688653) * t5;
+    y[891] = t9;
+    t10 = (-C30) * t3;
+    t12 = (-C31) * t11;
+    t13 = t10 + t12;
+    t4 = 0.06384127617852932 * t13;
+    y[571] = t4;
+    t7 = (-0.006915743100063547) * t13;
+    y[868] = t7;
+    t14 = C31 * t3;
+    t0 = (-C30) * t11;
+    t2 = t14 + t0;
+    y[91] = 0;
+    t1 = (-0.06526603031892354) * t2;
+    y[388] = t1;
+    t8 = re[210];
+    t6 = im[210];
+    t5 = re[50];
+    t9 = im[50];
+    t10 = re[130];
+    t12 = im[130];
+    t4 = t5 + t10;
+    t13 = t9 + t12;
+    t7 = C0 * t4;
+    t3 = t8 - t7;
+    t11 = C0 * t13;
+    t14 = t6 - t11;
+    t0 = t5 - t10;
+    t2 = C1 * t0;
+    t1 = t9 - t12;
+    t7 = C1 * t1;
+    t11 = t8 + t4;
+    t5 = t6 + t13;
+    t10 = t3 + t7;
+    t0 = t14 - t2;
+    t9 = t3 - t7;
+    t12 = t14 + t2;
+    t1 = (-C32) * t11;
+    t8 = (-C33) * t5;
+    t4 = t1 + t8;
+    t6 = 0.0638496916804613 * t4;
+    y[569] = t6;
+    t13 = (-0.006820884210795256) * t4;
+    y[870] = t13;
+    t3 = C33 * t11;
+    t7 = (-C32) * t5;
+    t14 = t3 + t7;
+    y[89] = 0;
+    t2 = (-0.06525742814106196) * t14;
+    y[390] = t2;
+    t1 = C34 * t10;
+    t8 = C35 * t0;
+    t6 = t1 + t8;
+    t4 = 0.02841105565325448 * t6;
+    y[230] = t4;
+    t13 = (-0.0447084089204744) * t6;
+    y[249] = t13;
+    t11 = (-C35) * t10;
+    t5 = C34 * t0;
+    t3 = t11 + t5;
+    t7 = 0.060964555912742815 * t3;
+    y[710] = t7;
+    t14 = 0.05072104285218912 * t3;
+    y[729] = t14;
+    t2 = C36 * t9;
+    t1 = C37 * t12;
+    t8 = t2 + t1;
+    y[70] = 0;
+    t4 = (-0.06520562062851128) * t8;
+    y[409] = t4;
+    t6 = (-C37) * t9;
+    t13 = C36 * t12;
+    t10 = t6 + t13;
+    t0 = 0.06390042187321478 * t10;
+    y[550] = t0;
+    t11 = (-0.005262715635805177) * t10;
+    y[889] = t11;
+    t5 = re[93];
+    t7 = im[93];
+    t3 = re[173];
+    t14 = im[173];
+    t2 = re[13];
+    t1 = im[13];
+    t8 = t3 + t2;
+    t4 = t14 + t1;
+    t9 = C0 * t8;
+    t12 = t5 - t9;
+    t6 = C0 * t4;
+    t13 = t7 - t6;
+    t0 = t3 - t2;
+    t10 = C1 * t0;
+    t11 = t14 - t1;
+    t9 = C1 * t11;
+    t6 = t5 + t8;
+    t3 = t7 + t4;
+    t2 = t12 + t9;
+    t0 = t13 - t10;
+    t14 = t12 - t9;
+    t1 = t13 + t10;
+    t11 = C38 * t6;
+    t5 = C39 * t3;
+    t8 = t11 + t5;
+    y[72] = 0;
+    t7 = (-0.06520849030508319) * t8;
+    y[407] = t7;
+    t4 = (-C39) * t6;
+    t12 = C38 * t3;
+    t9 = t4 + t12;
+    t13 = 0.06389760976174391 * t9;
+    y[552] = t13;
+    t10 = (-0.005470414012410816) * t9;
+    y[887] = t10;
+    t11 = (-C40) * t2;
+    t5 = (-C41) * t0;
+    t8 = t11 + t5;
+    t7 = 0.0638576174456411 * t8;
+    y[567] = t7;
+    t6 = (-0.006710565627511057) * t8;
+    y[872] = t6;
+    t3 = C41 * t2;
+    t4 = (-C40) * t0;
+    t12 = t3 + t4;
+    y[87] = 0;
+    t13 = (-0.06524932863669004) * t12;
+    y[392] = t13;
+    t9 = C42 * t14;
+    t10 = C43 * t1;
+    t11 = t9 + t10;
+    t5 = 0.0302158355175465 * t11;
+    y[232] = t5;
+    t7 = (-0.04314901382665701) * t11;
+    y[247] = t7;
+    t8 = (-C43) * t14;
+    t6 = C42 * t1;
+    t2 = t8 + t6;
+    t0 = 0.0601342793375864 * t2;
+    y[712] = t0;
+    t3 = 0.05202344363968648 * t2;
+    y[727] = t3;
+    t4 = re[201];
+    t12 = im[201];
+    t13 = re[41];
+    t9 = im[41];
+    t10 = re[121];
+    t5 = im[121];
+    t11 = t13 + t10;
+    t7 = t9 + t5;
+    t14 = C0 * t11;
+    t1 = t4 - t14;
+    t8 = C0 * t7;
+    t6 = t12 - t8;
+    t0 = t13 - t10;
+    t2 = C1 * t0;
+    t3 = t9 - t5;
+    t14 = C1 * t3;
+    t8 = t4 + t11;
+    t13 = t12 + t7;
+    t10 = t1 + t14;
+    t0 = t6 - t2;
+    t9 = t1 - t14;
+    t5 = t6 + t2;
+    t3 = C44 * t8;
+    t4 = C45 * t13;
+    t11 = t3 + t4;
+    t12 = 0.03201671445207391 * t11;
+    y[234] = t12;
+    t7 = (-0.04153890356165323) * t11;
+    y[245] = t7;
+    t1 = (-C45) * t8;
+    t14 = C44 * t13;
+    t6 = t1 + t14;
+    t2 = 0.059241318192135656 * t6;
+    y[714] = t2;
+    t3 = 0.05327989747267351 * t6;
+    y[725] = t3;
+    t4 = C46 * t10;
+    t12 = C47 * t0;
+    t11 = t4 + t12;
+    y[74] = 0;
+    t7 = (-0.06521187027677731) * t11;
+    y[405] = t7;
+    t8 = (-C47) * t10;
+    t13 = C46 * t0;
+    t1 = t8 + t13;
+    t14 = 0.06389429790898767 * t1;
+    y[554] = t14;
+    t2 = (-0.005670289327193386) * t1;
+    y[885] = t2;
+    t6 = (-C48) * t9;
+    t3 = (-C49) * t5;
+    t4 = t6 + t3;
+    t12 = 0.06386500273552757 * t4;
+    y[565] = t12;
+    t11 = (-0.006585380010483377) * t4;
+    y[874] = t11;
+    t7 = C49 * t9;
+    t10 = (-C48) * t5;
+    t0 = t7 + t10;
+    y[85] = 0;
+    t8 = (-0.06524178326463587) * t0;
+    y[394] = t8;
+    t13 = re[69];
+    t14 = im[69];
+    t1 = re[149];
+    t2 = im[149];
+    t6 = re[229];
+    t3 = im[229];
+    t12 = t1 + t6;
+    t4 = t2 + t3;
+    t11 = C0 * t12;
+    t9 = t13 - t11;
+    t5 = C0 * t4;
+    t7 = t14 - t5;
+    t10 = t1 - t6;
+    t0 = C1 * t10;
+    t8 = t2 - t3;
+    t11 = C1 * t8;
+    t5 = t13 + t12;
+    t1 = t14 + t4;
+    t6 = t9 + t11;
+    t10 = t7 - t0;
+    t2 = t9 - t11;
+    t3 = t7 + t0;
+    t8 = (-C50) * t5;
+    t13 = (-C51) * t1;
+    t12 = t8 + t13;
+    t14 = 0.06387177041854285 * t12;
+    y[563] = t14;
+    t4 = (-0.006446110398363828) * t12;
+    y[876] = t4;
+    t9 = C51 * t5;
+    t11 = (-C50) * t1;
+    t7 = t9 + t11;
+    y[83] = 0;
+    t0 = (-0.06523487041870103) * t7;
+    y[396] = t0;
+    t8 = C52 * t6;
+    t13 = C53 * t10;
+    t14 = t8 + t13;
+    t12 = 0.03380639052821035 * t14;
+    y[236] = t12;
+    t4 = (-0.03988296034010127) * t14;
+    y[243] = t4;
+    t5 = (-C53) * t6;
+    t1 = C52 * t10;
+    t9 = t5 + t1;
+    t11 = 0.05828679646399605 * t9;
+    y[716] = t11;
+    t7 = 0.054487232921376444 * t9;
+    y[723] = t7;
+    t0 = C54 * t2;
+    t8 = C55 * t3;
+    t13 = t0 + t8;
+    y[76] = 0;
+    t12 = (-0.06521584229853827) * t13;
+    y[403] = t12;
+    t14 = (-C55) * t2;
+    t4 = C54 * t3;
+    t6 = t14 + t4;
+    t10 = 0.06389040637691885 * t6;
+    y[556] = t10;
+    t5 = (-0.005861380284618081) * t6;
+    y[883] = t5;
+    t1 = re[177];
+    t11 = im[177];
+    t9 = re[17];
+    t7 = im[17];
+    t0 = re[97];
+    t8 = im[97];
+    t13 = t9 + t0;
+    t12 = t7 + t8;
+    t2 = C0 * t13;
+    t3 = t1 - t2;
+    t14 = C0 * t12;
+    t4 = t11 - t14;
+    t10 = t9 - t0;
+    t6 = C1 * t10;
+    t5 = t7 - t8;
+    t2 = C1 * t5;
+    t14 = t1 + t13;
+    t9 = t11 + t12;
+    t0 = t3 + t2;
+    t10 = t4 - t6;
+    t7 = t3 - t2;
+    t8 = t4 + t6;
+    t5 = C56 * t14;
+    t1 = C57 * t9;
+    t13 = t5 + t1;
+    y[78] = 0;
+    t11 = (-0.06522043507348492) * t13;
+    y[401] = t11;
+    t12 = (-C57) * t14;
+    t3 = C56 * t9;
+    t2 = t12 + t3;
+    t4 = 0.06388590726161235 * t2;
+    y[558] = t4;
+    t6 = (-0.00604264983245425) * t2;
+    y[881] = t6;
+    t5 = (-C58) * t0;
+    t1 = (-C59) * t10;
+    t13 = t5 + t1;
+    t11 = 0.06387791227672637 * t13;
+    y[561] = t11;
+    t14 = (-0.006293781659289501) * t13;
+    y[878] = t14;
+    t9 = C59 * t0;
+    t12 = (-C58) * t10;
+    t3 = t9 + t12;
+    y[81] = 0;
+    t4 = (-0.06522859808905766) * t3;
+    y[398] = t4;
+    t2 = C60 * t7;
+    t6 = C61 * t8;
+    t5 = t2 + t6;
+    t1 = 0.03557789088350688 * t5;
+    y[238] = t1;
+    t11 = (-0.03818632213439032) * t5;
+    y[241] = t11;
+    t13 = (-C61) * t7;
+    t14 = C60 * t8;
+    t0 = t13 + t14;
+    t10 = 0.057272384837089046 * t0;
+    y[718] = t10;
+    t9 = 0.05564256004817251 * t0;
+    y[721] = t9;
+}
+
+//
+//  Public functions.
+//
+
+/**
+ *  Apply LD-IMDCT transform (prebuilt for window W10_480, input pruned).
+ * 
+ *  Note(s):
+ *    [1] y[n] = w[n] * SUM(X[k] * cos(PI / 480 * (n + 240.5) * (k + 0.5))), where
+ *        w[n] = sqrt(2 / 480) * W10_480[959 - n].
+ *    [2] X[k] shall be zero for all k >= 160 (not checked).
+ *    [3] The size of all arrays will not be checked.
+ * 
+ *  @param {Number[]} X 
+ *    - The input block (480 points, only the first 160 points are used).
+ *  @param {Number[]} y 
+ *    - The array that would contain the output block (960 points).
+ *  @param {Number[]} re 
+ *    - The scratch buffer (real part, 240 points).
+ *  @param {Number[]} im 
+ *    - The scratch buffer (imaginary part, 240 points).
+ */
+function ApplyWindowedIMDCT_W10_480_K160(X, y, re, im) {
+    ApplyWindowedIMDCT_W10_480_K160_Part1(X, y, re, im);
+    ApplyWindowedIMDCT_W10_480_K160_Part2(X, y, re, im);
+    ApplyWindowedIMDCT_W10_480_K160_Part3(X, y, re, im);
+    ApplyWindowedIMDCT_W10_480_K160_Part4(X, y, re, im);
+    ApplyWindowedIMDCT_W10_480_K160_Part5(X, y, re, im);
+    ApplyWindowedIMDCT_W10_480_K160_Part6(X, y, re, im);
+    ApplyWindowedIMDCT_W10_480_K160_Part7(X, y, re, im);
+}
+
+//  Export public APIs.
+module.exports = {
+    "ApplyWindowedIMDCT_W10_480_K160": ApplyWindowedIMDCT_W10_480_K160
+};
\ No newline at end of file
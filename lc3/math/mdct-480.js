@@ -0,0 +1,29678 @@
+//
+//  Copyright 2021 - 2023 XiaoJSoft Studio. All rights reserved.
+//  Use of this source code is governed by a BSD-style license that can be
+//  found in the LICENSE.md file.
+//
+
+//
+//  Note(s):
+//    [1] This file is generated automatically by a MDCT compiler, which locates 
+//        at "./../../dev/mdct-generator/" directory.
+//        Do NOT modify this file manually.
+//
+
+//
+//  Private functions.
+//
+
+/**
+ *  Part 1 of ApplyWindowedMDCT_W10_480().
+ * 
+ *  @param {Number[]} x 
+ *    - The input block (960 points).
+ *  @param {Number[]} X 
+ *    - The array that would contain the output block (480 points).
+ *  @param {Number[]} re 
+ *    - The scratch buffer (real part, 240 points).
+ *  @param {Number[]} im 
+ *    - The scratch buffer (imaginary part, 240 points).
+ */
+function ApplyWindowedMDCT_W10_480_Part1(x, X, re, im) {
+    let t0, t1, t10, t11, t2, t3, t4, t5, t6, t7, t8, t9;
+    const C0 = 0.3826834323650898;
+    const C1 = 0.9238795325112867;
+    const C2 = 0.7071067811865476;
+    const C3 = 0.9951847266721969;
+    const C4 = 0.0980171403295606;
+    const C5 = 0.47139673682599764;
+    const C6 = 0.881921264348355;
+    const C7 = 0.6343932841636455;
+    const C8 = 0.773010453362737;
+    const C9 = 0.29028467725446233;
+    const C10 = 0.9569403357322088;
+    const C11 = 1.3065629648763766;
+    const C12 = 0.5411961001461969;
+    const C13 = 0.19509032201612825;
+    const C14 = 0.9807852804032304;
+    const C15 = 0.5555702330196022;
+    const C16 = 0.8314696123025452;
+    const C17 = 0.07845909572784494;
+    const C18 = 0.996917333733128;
+    const C19 = 0.9998072404820648;
+    const C20 = 0.0196336924606283;
+    const C21 = 0.9930684569549263;
+    const C22 = 0.11753739745783764;
+    const C23 = 0.1757962799343545;
+    const C24 = 0.9844265680898916;
+    const C25 = 0.5877852522924731;
+    const C26 = 0.8090169943749475;
+    const C27 = 0.5224985647159488;
+    const C28 = 0.8526401643540922;
+    const C29 = 0.15643446504023087;
+    const C30 = 0.9876883405951378;
+    const C31 = 0.2334453638559054;
+    const C32 = 0.9723699203976766;
+    const C33 = 0.6642524379112817;
+    const C34 = 0.7475083268625968;
+    const C35 = 0.436409240673342;
+    const C36 = 0.8997482840522215;
+    const C37 = 0.05887080365118903;
+    const C38 = 0.9982656101847159;
+    const C39 = 0.3276301795616935;
+    const C40 = 0.944806046466878;
+    const C41 = 0.6788007455329417;
+    const C42 = 0.7343225094356856;
+    const C43 = 0.34611705707749296;
+    const C44 = 0.9381913359224842;
+    const C45 = 0.9992290362407229;
+    const C46 = 0.03925981575906861;
+    const C47 = 0.41865973753742813;
+    const C48 = 0.9081431738250813;
+    const C49 = 0.6035559419535714;
+    const C50 = 0.7973206537727071;
+    const C51 = 0.25249157701515795;
+    const C52 = 0.9675990923602598;
+    const C53 = 0.9905693404435773;
+    const C54 = 0.13701234168196802;
+    const C55 = 0.5056573733779846;
+    const C56 = 0.8627343859777918;
+    t0 = x[719];
+    t0 = 0.037324517362488444 * t0;
+    t1 = x[720];
+    t1 = 0.03645468738771164 * t1;
+    t0 = t0 + t1;
+    t1 = x[239];
+    t1 = 0.05619993399963794 * t1;
+    t2 = x[240];
+    t2 = 0.0567432827310587 * t2;
+    t1 = t1 - t2;
+    t2 = -t0;
+    t3 = x[599];
+    t4 = x[119];
+    t4 = (-0.00626707518983094) * t4;
+    t5 = x[360];
+    t5 = 0.06373671261707498 * t5;
+    t4 = t4 - t5;
+    t5 = (-0.06039687166261355) * t3;
+    t6 = C0 * t4;
+    t5 = t5 + t6;
+    t6 = 0.025017203367561795 * t3;
+    t3 = C1 * t4;
+    t4 = t6 + t3;
+    t6 = x[0];
+    t3 = (-1.5188757220070019e-05) * t6;
+    t6 = x[479];
+    t6 = 0.06453978927193926 * t6;
+    t3 = t3 - t6;
+    t6 = x[480];
+    t7 = C2 * t3;
+    t8 = (-0.045650571348006166) * t6;
+    t7 = t7 + t8;
+    t8 = (-0.7071067811865475) * t3;
+    t3 = (-0.04565057134800617) * t6;
+    t6 = t8 + t3;
+    t8 = x[120];
+    t3 = (-0.006165496315677645) * t8;
+    t8 = x[359];
+    t8 = 0.06373619688047501 * t8;
+    t3 = t3 - t8;
+    t8 = x[600];
+    t9 = C0 * t3;
+    t10 = (-0.060397360378269135) * t8;
+    t9 = t9 + t10;
+    t10 = (-C1) * t3;
+    t3 = (-0.02501740580021448) * t8;
+    t8 = t10 + t3;
+    t10 = t7 - t0;
+    t3 = t1 + t6;
+    t0 = t5 + t9;
+    t11 = t4 + t8;
+    t2 = t2 - t7;
+    t7 = t1 - t6;
+    t1 = t5 - t9;
+    t6 = t4 - t8;
+    t5 = t10 + t0;
+    t9 = t3 + t11;
+    t4 = t2 + t6;
+    t8 = t7 - t1;
+    t10 = t10 - t0;
+    t0 = t3 - t11;
+    t3 = t2 - t6;
+    t11 = t7 + t1;
+    re[0] = t5;
+    im[0] = t9;
+    re[60] = t4;
+    im[60] = t8;
+    re[120] = t10;
+    im[120] = t0;
+    re[180] = t3;
+    im[180] = t11;
+    t2 = x[689];
+    t6 = 0.0572255054946812 * t2;
+    t7 = x[750];
+    t1 = 0.011136259783419419 * t7;
+    t5 = t6 + t1;
+    t9 = x[209];
+    t4 = 0.0352169718013232 * t9;
+    t8 = x[270];
+    t10 = 0.06595802496235868 * t8;
+    t0 = t4 - t10;
+    t3 = (-C3) * t5;
+    t11 = C4 * t0;
+    t2 = t3 + t11;
+    t7 = C4 * t5;
+    t6 = C3 * t0;
+    t1 = t7 + t6;
+    t9 = x[569];
+    t8 = x[89];
+    t4 = (-0.006820884210795256) * t8;
+    t10 = x[390];
+    t3 = 0.0638496916804613 * t10;
+    t11 = t4 - t3;
+    t5 = (-0.05755191353428729) * t9;
+    t0 = C5 * t11;
+    t7 = t5 + t0;
+    t6 = 0.030762138679353637 * t9;
+    t8 = C6 * t11;
+    t10 = t6 + t8;
+    t4 = x[30];
+    t3 = (-0.0011014045273434368) * t4;
+    t5 = x[449];
+    t0 = 0.0640494299958065 * t5;
+    t9 = t3 - t0;
+    t11 = x[510];
+    t6 = C7 * t9;
+    t8 = (-0.05028736226414947) * t11;
+    t4 = t6 + t8;
+    t5 = (-C8) * t9;
+    t3 = (-0.041269771656904986) * t11;
+    t0 = t5 + t3;
+    t6 = x[150];
+    t8 = 0.00010136342815123706 * t6;
+    t9 = x[329];
+    t11 = 0.06401246073520547 * t9;
+    t5 = t8 - t11;
+    t3 = x[630];
+    t6 = C9 * t5;
+    t9 = (-0.06228867556549502) * t3;
+    t8 = t6 + t9;
+    t11 = (-C10) * t5;
+    t6 = (-0.018895063159086616) * t3;
+    t9 = t11 + t6;
+    t5 = t2 + t4;
+    t3 = t1 + t0;
+    t11 = t7 + t8;
+    t6 = t10 + t9;
+    t2 = t2 - t4;
+    t4 = t1 - t0;
+    t1 = t7 - t8;
+    t0 = t10 - t9;
+    t7 = t5 + t11;
+    t8 = t3 + t6;
+    t10 = t2 + t0;
+    t9 = t4 - t1;
+    t5 = t5 - t11;
+    t11 = t3 - t6;
+    t3 = t2 - t0;
+    t6 = t4 + t1;
+    t2 = t10 + t9;
+    t0 = C1 * t2;
+    t4 = t10 * (-C11);
+    t1 = t9 * C12;
+    t2 = t0 - t1;
+    t10 = t0 + t4;
+    t9 = t5 + t11;
+    t1 = t5 - t11;
+    t0 = C2 * t9;
+    t4 = (-C2) * t1;
+    t5 = t3 + t6;
+    t11 = C0 * t5;
+    t9 = t3 * (-C11);
+    t1 = t6 * (-C12);
+    t5 = t11 - t1;
+    t3 = t11 + t9;
+    re[15] = t7;
+    im[15] = t8;
+    re[75] = t2;
+    im[75] = t10;
+    re[135] = t0;
+    im[135] = t4;
+    re[195] = t5;
+    im[195] = t3;
+    t6 = x[659];
+    t1 = x[179];
+    t11 = 0.013662384018374446 * t1;
+    t9 = x[300];
+    t7 = 0.06533827026114206 * t9;
+    t8 = t11 - t7;
+    t2 = (-0.06254535540473045) * t6;
+    t10 = C13 * t8;
+    t0 = t2 + t10;
+    t4 = 0.012441044712157023 * t6;
+    t5 = C14 * t8;
+    t3 = t4 + t5;
+    t1 = x[539];
+    t9 = x[59];
+    t11 = (-0.004029906321403751) * t9;
+    t7 = x[420];
+    t2 = 0.06391147058784913 * t7;
+    t10 = t11 - t2;
+    t6 = (-0.05420711941161209) * t1;
+    t8 = C15 * t10;
+    t4 = t6 + t8;
+    t5 = 0.03622003921397975 * t1;
+    t9 = C16 * t10;
+    t7 = t5 + t9;
+    t11 = x[60];
+    t2 = (-0.00414557911234842) * t11;
+    t6 = x[419];
+    t8 = 0.06391046669324492 * t6;
+    t1 = t2 - t8;
+    t10 = x[540];
+    t5 = C15 * t1;
+    t9 = (-0.054207970887708304) * t10;
+    t11 = t5 + t9;
+    t6 = (-C16) * t1;
+    t2 = (-0.03622060815211794) * t10;
+    t8 = t6 + t2;
+    t5 = x[180];
+    t9 = 0.014277679024727883 * t5;
+    t1 = x[299];
+    t10 = 0.06539193914565526 * t1;
+    t6 = t9 - t10;
+    t2 = x[660];
+    t5 = 0.06366896226091003 * t2;
+    t1 = x[779];
+    t9 = 0.0002262105086283927 * t1;
+    t10 = t5 + t9;
+    t2 = C13 * t6;
+    t1 = (-C14) * t10;
+    t5 = t2 + t1;
+    t9 = (-C14) * t6;
+    t2 = (-C13) * t10;
+    t1 = t9 + t2;
+    t6 = t0 + t11;
+    t10 = t3 + t8;
+    t9 = t4 + t5;
+    t2 = t7 + t1;
+    t0 = t0 - t11;
+    t11 = t3 - t8;
+    t3 = t4 - t5;
+    t8 = t7 - t1;
+    t4 = t6 + t9;
+    t5 = t10 + t2;
+    t7 = t0 + t8;
+    t1 = t11 - t3;
+    t6 = t6 - t9;
+    t9 = t10 - t2;
+    t10 = t0 - t8;
+    t2 = t11 + t3;
+    t0 = t7 + t1;
+    t8 = t7 - t1;
+    t11 = C2 * t0;
+    t3 = (-C2) * t8;
+    t7 = -t6;
+    t1 = t10 - t2;
+    t0 = t10 + t2;
+    t8 = (-C2) * t1;
+    t6 = (-C2) * t0;
+    re[30] = t4;
+    im[30] = t5;
+    re[90] = t11;
+    im[90] = t3;
+    re[150] = t9;
+    im[150] = t7;
+    re[210] = t8;
+    im[210] = t6;
+    t10 = x[629];
+    t2 = x[149];
+    t1 = (-0.00022193928773926063) * t2;
+    t0 = x[330];
+    t4 = 0.06399077843587136 * t0;
+    t5 = t1 - t4;
+    t11 = (-0.06230978113323068) * t10;
+    t3 = C9 * t5;
+    t9 = t11 + t3;
+    t7 = 0.018901465463064877 * t10;
+    t8 = C10 * t5;
+    t6 = t7 + t8;
+    t2 = x[509];
+    t0 = x[29];
+    t1 = (-0.0010301210199474054) * t0;
+    t4 = x[450];
+    t11 = 0.06406012827340767 * t4;
+    t3 = t1 - t11;
+    t10 = (-0.05027896408924988) * t2;
+    t5 = C7 * t3;
+    t7 = t10 + t5;
+    t8 = 0.041262879452883226 * t2;
+    t0 = C8 * t3;
+    t4 = t8 + t0;
+    t1 = x[90];
+    t11 = (-0.006870303371576403) * t1;
+    t10 = x[389];
+    t5 = 0.06384555756860284 * t10;
+    t2 = t11 - t5;
+    t3 = x[570];
+    t8 = C5 * t2;
+    t0 = (-0.05755564012165344) * t3;
+    t1 = t8 + t0;
+    t10 = (-C6) * t2;
+    t11 = (-0.030764130581799942) * t3;
+    t5 = t10 + t11;
+    t8 = x[210];
+    t0 = 0.03599432697935784 * t8;
+    t2 = x[269];
+    t3 = 0.06586204827489513 * t2;
+    t10 = t0 - t3;
+    t11 = x[690];
+    t8 = 0.05680190137652522 * t11;
+    t2 = x[749];
+    t0 = 0.011823449188095525 * t2;
+    t3 = t8 + t0;
+    t11 = C4 * t10;
+    t2 = (-C3) * t3;
+    t8 = t11 + t2;
+    t0 = (-C3) * t10;
+    t11 = (-C4) * t3;
+    t2 = t0 + t11;
+    t10 = t9 + t1;
+    t3 = t6 + t5;
+    t0 = t7 + t8;
+    t11 = t4 + t2;
+    t9 = t9 - t1;
+    t1 = t6 - t5;
+    t6 = t7 - t8;
+    t5 = t4 - t2;
+    t7 = t10 + t0;
+    t8 = t3 + t11;
+    t4 = t9 + t5;
+    t2 = t1 - t6;
+    t10 = t10 - t0;
+    t0 = t3 - t11;
+    t3 = t9 - t5;
+    t11 = t1 + t6;
+    t9 = t4 + t2;
+    t5 = C0 * t9;
+    t1 = t4 * (-C11);
+    t6 = t2 * (-C12);
+    t9 = t5 - t6;
+    t4 = t5 + t1;
+    t2 = t10 - t0;
+    t6 = t10 + t0;
+    t5 = (-C2) * t2;
+    t1 = (-C2) * t6;
+    t10 = t3 + t11;
+    t0 = (-C1) * t10;
+    t2 = t3 * C11;
+    t6 = t11 * (-C12);
+    t10 = t0 - t6;
+    t3 = t0 + t2;
+    re[45] = t7;
+    im[45] = t8;
+    re[105] = t9;
+    im[105] = t4;
+    re[165] = t5;
+    im[165] = t1;
+    re[225] = t10;
+    im[225] = t3;
+    t11 = re[0];
+    t6 = im[0];
+    t0 = re[15];
+    t2 = im[15];
+    t7 = re[30];
+    t8 = im[30];
+    t9 = re[45];
+    t4 = im[45];
+    t5 = t11 + t7;
+    t1 = t6 + t8;
+    t10 = t0 + t9;
+    t3 = t2 + t4;
+    t11 = t11 - t7;
+    t7 = t6 - t8;
+    t6 = t0 - t9;
+    t8 = t2 - t4;
+    t0 = t5 + t10;
+    t9 = t1 + t3;
+    t2 = t11 + t8;
+    t4 = t7 - t6;
+    t5 = t5 - t10;
+    t10 = t1 - t3;
+    t1 = t11 - t8;
+    t3 = t7 + t6;
+    re[0] = t0;
+    im[0] = t9;
+    re[15] = t2;
+    im[15] = t4;
+    re[30] = t5;
+    im[30] = t10;
+    re[45] = t1;
+    im[45] = t3;
+    t11 = re[60];
+    t8 = im[60];
+    t7 = re[75];
+    t6 = im[75];
+    t0 = re[90];
+    t9 = im[90];
+    t2 = re[105];
+    t4 = im[105];
+    t5 = t11 + t0;
+    t10 = t8 + t9;
+    t1 = t7 + t2;
+    t3 = t6 + t4;
+    t11 = t11 - t0;
+    t0 = t8 - t9;
+    t8 = t7 - t2;
+    t9 = t6 - t4;
+    t7 = t5 + t1;
+    t2 = t10 + t3;
+    t6 = t11 + t9;
+    t4 = t0 - t8;
+    t5 = t5 - t1;
+    t1 = t10 - t3;
+    t10 = t11 - t9;
+    t3 = t0 + t8;
+    re[60] = t7;
+    im[60] = t2;
+    re[75] = t6;
+    im[75] = t4;
+    re[90] = t5;
+    im[90] = t1;
+    re[105] = t10;
+    im[105] = t3;
+    t11 = re[120];
+    t9 = im[120];
+    t0 = re[135];
+    t8 = im[135];
+    t7 = re[150];
+    t2 = im[150];
+    t6 = re[165];
+    t4 = im[165];
+    t5 = t11 + t7;
+    t1 = t9 + t2;
+    t10 = t0 + t6;
+    t3 = t8 + t4;
+    t11 = t11 - t7;
+    t7 = t9 - t2;
+    t9 = t0 - t6;
+    t2 = t8 - t4;
+    t0 = t5 + t10;
+    t6 = t1 + t3;
+    t8 = t11 + t2;
+    t4 = t7 - t9;
+    t5 = t5 - t10;
+    t10 = t1 - t3;
+    t1 = t11 - t2;
+    t3 = t7 + t9;
+    re[120] = t0;
+    im[120] = t6;
+    re[135] = t8;
+    im[135] = t4;
+    re[150] = t5;
+    im[150] = t10;
+    re[165] = t1;
+    im[165] = t3;
+    t11 = re[180];
+    t2 = im[180];
+    t7 = re[195];
+    t9 = im[195];
+    t0 = re[210];
+    t6 = im[210];
+    t8 = re[225];
+    t4 = im[225];
+    t5 = t11 + t0;
+    t10 = t2 + t6;
+    t1 = t7 + t8;
+    t3 = t9 + t4;
+    t11 = t11 - t0;
+    t0 = t2 - t6;
+    t2 = t7 - t8;
+    t6 = t9 - t4;
+    t7 = t5 + t1;
+    t8 = t10 + t3;
+    t9 = t11 + t6;
+    t4 = t0 - t2;
+    t5 = t5 - t1;
+    t1 = t10 - t3;
+    t10 = t11 - t6;
+    t3 = t0 + t2;
+    re[180] = t7;
+    im[180] = t8;
+    re[195] = t9;
+    im[195] = t4;
+    re[210] = t5;
+    im[210] = t1;
+    re[225] = t10;
+    im[225] = t3;
+    t11 = x[623];
+    t6 = x[143];
+    t0 = (-0.001979314939273731) * t6;
+    t2 = x[336];
+    t7 = 0.06388315384228209 * t2;
+    t8 = t0 - t7;
+    t9 = (-0.06203099324661613) * t11;
+    t4 = 0.3090169943749474 * t8;
+    t5 = t9 + t4;
+    t1 = 0.020155091482715975 * t11;
+    t10 = 0.9510565162951535 * t8;
+    t3 = t1 + t10;
+    t6 = x[503];
+    t2 = x[23];
+    t0 = (-0.0006582956154213542) * t2;
+    t7 = x[456];
+    t9 = 0.06413419581871597 * t7;
+    t4 = t0 - t9;
+    t11 = (-0.04940201010637012) * t6;
+    t8 = 0.6494480483301837 * t4;
+    t1 = t11 + t8;
+    t10 = 0.042193302654921695 * t6;
+    t2 = 0.7604059656000309 * t4;
+    t7 = t10 + t2;
+    t0 = x[96];
+    t9 = (-0.007080482030554512) * t0;
+    t11 = x[383];
+    t8 = 0.06381869298416643 * t11;
+    t6 = t9 - t8;
+    t4 = x[576];
+    t10 = 0.45399049973954675 * t6;
+    t2 = (-0.05817303693510751) * t4;
+    t0 = t10 + t2;
+    t11 = (-0.8910065241883679) * t6;
+    t9 = (-0.029640642792816658) * t4;
+    t8 = t11 + t9;
+    t10 = x[216];
+    t2 = 0.0406262824335368 * t10;
+    t6 = x[263];
+    t4 = 0.06501374318100199 * t6;
+    t11 = t2 - t4;
+    t9 = x[696];
+    t10 = 0.05389537209194186 * t9;
+    t6 = x[743];
+    t2 = 0.016312759798310757 * t6;
+    t4 = t10 + t2;
+    t9 = C17 * t11;
+    t6 = (-C18) * t4;
+    t10 = t9 + t6;
+    t2 = (-C18) * t11;
+    t9 = (-C17) * t4;
+    t6 = t2 + t9;
+    t11 = t5 + t0;
+    t4 = t3 + t8;
+    t2 = t1 + t10;
+    t9 = t7 + t6;
+    t5 = t5 - t0;
+    t0 = t3 - t8;
+    t3 = t1 - t10;
+    t8 = t7 - t6;
+    t1 = t11 + t2;
+    t10 = t4 + t9;
+    t7 = t5 + t8;
+    t6 = t0 - t3;
+    t11 = t11 - t2;
+    t2 = t4 - t9;
+    t4 = t5 - t8;
+    t9 = t0 + t3;
+    re[48] = t1;
+    im[48] = t10;
+    re[108] = t7;
+    im[108] = t6;
+    re[168] = t11;
+    im[168] = t2;
+    re[228] = t4;
+    im[228] = t9;
+    t5 = x[593];
+    t8 = x[113];
+    t0 = (-0.006752951917176866) * t8;
+    t3 = x[366];
+    t1 = 0.06374766977168722 * t3;
+    t10 = t0 - t1;
+    t7 = (-0.059883754731641564) * t5;
+    t6 = 0.40074883310314097 * t10;
+    t11 = t7 + t6;
+    t2 = 0.026193691637306504 * t5;
+    t4 = 0.916187957117136 * t10;
+    t9 = t2 + t4;
+    t8 = x[6];
+    t3 = (-9.096405236126472e-05) * t8;
+    t0 = x[473];
+    t1 = 0.06442181772372418 * t0;
+    t7 = t3 - t1;
+    t6 = x[486];
+    t5 = 0.6930873625456359 * t7;
+    t10 = (-0.046623283214542545) * t6;
+    t2 = t5 + t10;
+    t4 = (-0.7208535967029188) * t7;
+    t8 = (-0.04482742202325848) * t6;
+    t0 = t4 + t8;
+    t3 = x[126];
+    t1 = (-0.005425237731170207) * t3;
+    t5 = x[353];
+    t10 = 0.0637426511985222 * t5;
+    t7 = t1 - t10;
+    t6 = x[606];
+    t4 = 0.36447049987914965 * t7;
+    t8 = (-0.06087073811971654) * t6;
+    t3 = t4 + t8;
+    t5 = (-0.9312149347588036) * t7;
+    t1 = (-0.023824347658526594) * t6;
+    t10 = t5 + t1;
+    t4 = x[713];
+    t8 = 0.0423499764361958 * t4;
+    t7 = x[726];
+    t6 = 0.031117245495375336 * t7;
+    t5 = t8 + t6;
+    t1 = x[233];
+    t4 = 0.05265764361408573 * t1;
+    t7 = x[246];
+    t8 = 0.05969556670068119 * t7;
+    t6 = t4 - t8;
+    t1 = (-C19) * t5;
+    t7 = C20 * t6;
+    t4 = t1 + t7;
+    t8 = C20 * t5;
+    t1 = C19 * t6;
+    t7 = t8 + t1;
+    t5 = t11 + t3;
+    t6 = t9 + t10;
+    t8 = t2 + t4;
+    t1 = t0 + t7;
+    t11 = t11 - t3;
+    t3 = t9 - t10;
+    t9 = t2 - t4;
+    t10 = t0 - t7;
+    t2 = t5 + t8;
+    t4 = t6 + t1;
+    t0 = t11 + t10;
+    t7 = t3 - t9;
+    t5 = t5 - t8;
+    t8 = t6 - t1;
+    t6 = t11 - t10;
+    t1 = t3 + t9;
+    t11 = t0 + t7;
+    t10 = C1 * t11;
+    t3 = t0 * (-C11);
+    t9 = t7 * C12;
+    t11 = t10 - t9;
+    t0 = t10 + t3;
+    t7 = t5 + t8;
+    t9 = t5 - t8;
+    t10 = C2 * t7;
+    t3 = (-C2) * t9;
+    t5 = t6 + t1;
+    t8 = C0 * t5;
+    t7 = t6 * (-C11);
+    t9 = t1 * (-C12);
+    t5 = t8 - t9;
+    t6 = t8 + t7;
+    re[63] = t2;
+    im[63] = t4;
+    re[123] = t11;
+    im[123] = t0;
+    re[183] = t10;
+    im[183] = t3;
+    re[3] = t5;
+    im[3] = t6;
+    t1 = x[563];
+    t9 = x[83];
+    t8 = (-0.006446110398363828) * t9;
+    t7 = x[396];
+    t2 = 0.06387177041854285 * t7;
+    t4 = t8 - t2;
+    t11 = (-0.056917163962227985) * t1;
+    t0 = 0.4886212414969549 * t4;
+    t10 = t11 + t0;
+    t3 = 0.031875143372878674 * t1;
+    t5 = 0.8724960070727972 * t4;
+    t6 = t3 + t5;
+    t9 = x[36];
+    t7 = (-0.0015822605146506958) * t9;
+    t8 = x[443];
+    t2 = 0.06399501249514679 * t8;
+    t11 = t7 - t2;
+    t0 = x[516];
+    t1 = 0.619093949309834 * t11;
+    t4 = (-0.05113138901125961) * t0;
+    t3 = t1 + t4;
+    t5 = (-0.785316930880745) * t11;
+    t9 = (-0.04030873690851978) * t0;
+    t8 = t5 + t9;
+    t7 = x[156];
+    t2 = 0.002232707993710948 * t7;
+    t1 = x[323];
+    t4 = 0.06416797782141968 * t1;
+    t11 = t2 - t4;
+    t0 = x[636];
+    t5 = 0.27144044986507426 * t11;
+    t9 = (-0.062495816262914165) * t0;
+    t7 = t5 + t9;
+    t1 = (-0.9624552364536473) * t11;
+    t2 = (-0.017625643082993858) * t0;
+    t4 = t1 + t2;
+    t5 = x[683];
+    t9 = 0.059420631359614104 * t5;
+    t11 = x[756];
+    t0 = 0.00743521332628011 * t11;
+    t1 = t9 + t0;
+    t2 = x[203];
+    t5 = 0.030564726251030808 * t2;
+    t11 = x[276];
+    t9 = 0.06629703045209251 * t11;
+    t0 = t5 - t9;
+    t2 = (-C21) * t1;
+    t11 = C22 * t0;
+    t5 = t2 + t11;
+    t9 = C22 * t1;
+    t2 = C21 * t0;
+    t11 = t9 + t2;
+    t1 = t10 + t7;
+    t0 = t6 + t4;
+    t9 = t3 + t5;
+    t2 = t8 + t11;
+    t10 = t10 - t7;
+    t7 = t6 - t4;
+    t6 = t3 - t5;
+    t4 = t8 - t11;
+    t3 = t1 + t9;
+    t5 = t0 + t2;
+    t8 = t10 + t4;
+    t11 = t7 - t6;
+    t1 = t1 - t9;
+    t9 = t0 - t2;
+    t0 = t10 - t4;
+    t2 = t7 + t6;
+    t10 = t8 + t11;
+    t4 = t8 - t11;
+    t7 = C2 * t10;
+    t6 = (-C2) * t4;
+    t8 = -t1;
+    t11 = t0 - t2;
+    t10 = t0 + t2;
+    t4 = (-C2) * t11;
+    t1 = (-C2) * t10;
+    re[78] = t3;
+    im[78] = t5;
+    re[138] = t7;
+    im[138] = t6;
+    re[198] = t9;
+    im[198] = t8;
+    re[18] = t4;
+    im[18] = t1;
+    t0 = x[533];
+    t2 = x[53];
+    t11 = (-0.003337666561289256) * t2;
+    t10 = x[426];
+    t3 = 0.06391987476523325 * t10;
+    t5 = t11 - t3;
+    t7 = (-0.053478505090598906) * t0;
+    t6 = 0.5717879602276122 * t5;
+    t9 = t7 + t6;
+    t8 = 0.03727244214779904 * t0;
+    t4 = 0.8204014435255136 * t5;
+    t1 = t8 + t4;
+    t2 = x[66];
+    t10 = (-0.004828163617283523) * t2;
+    t11 = x[413];
+    t3 = 0.06390489330726203 * t11;
+    t7 = t10 - t3;
+    t6 = x[546];
+    t0 = 0.5391383229110002 * t7;
+    t5 = (-0.054913454857753057) * t6;
+    t8 = t0 + t5;
+    t4 = (-0.8422172337162865) * t7;
+    t2 = (-0.035152389160480066) * t6;
+    t11 = t4 + t2;
+    t10 = x[186];
+    t3 = 0.018159508900208607 * t10;
+    t0 = x[293];
+    t5 = 0.06577792843462159 * t0;
+    t7 = t3 - t5;
+    t6 = x[666];
+    t4 = 0.06301069127326117 * t6;
+    t2 = x[773];
+    t10 = 0.0012089492947579118 * t2;
+    t0 = t4 + t10;
+    t3 = C23 * t7;
+    t5 = (-C24) * t0;
+    t6 = t3 + t5;
+    t2 = (-C24) * t7;
+    t4 = (-C23) * t0;
+    t10 = t2 + t4;
+    t3 = x[653];
+    t5 = x[173];
+    t7 = 0.01017252894936793 * t5;
+    t0 = x[306];
+    t2 = 0.06492324901137009 * t0;
+    t4 = t7 - t2;
+    t5 = (-0.06268721761174038) * t3;
+    t0 = 0.21430915306505077 * t4;
+    t7 = t5 + t0;
+    t2 = 0.013754006739270346 * t3;
+    t5 = 0.9767658813208724 * t4;
+    t0 = t2 + t5;
+    t3 = t9 + t6;
+    t4 = t1 + t10;
+    t2 = t8 + t7;
+    t5 = t11 + t0;
+    t9 = t9 - t6;
+    t6 = t1 - t10;
+    t1 = t8 - t7;
+    t10 = t11 - t0;
+    t8 = t3 + t2;
+    t7 = t4 + t5;
+    t11 = t9 + t10;
+    t0 = t6 - t1;
+    t3 = t3 - t2;
+    t2 = t4 - t5;
+    t4 = t9 - t10;
+    t5 = t6 + t1;
+    t9 = t11 + t0;
+    t10 = C0 * t9;
+    t6 = t11 * (-C11);
+    t1 = t0 * (-C12);
+    t9 = t10 - t1;
+    t11 = t10 + t6;
+    t0 = t3 - t2;
+    t1 = t3 + t2;
+    t10 = (-C2) * t0;
+    t6 = (-C2) * t1;
+    t3 = t4 + t5;
+    t2 = (-C1) * t3;
+    t0 = t4 * C11;
+    t1 = t5 * (-C12);
+    t3 = t2 - t1;
+    t4 = t2 + t0;
+    re[93] = t8;
+    im[93] = t7;
+    re[153] = t9;
+    im[153] = t11;
+    re[213] = t10;
+    im[213] = t6;
+    re[33] = t3;
+    im[33] = t4;
+    t5 = re[48];
+    t1 = im[48];
+    t2 = re[63];
+    t0 = im[63];
+    t8 = re[78];
+    t7 = im[78];
+    t9 = re[93];
+    t11 = im[93];
+    t10 = t5 + t8;
+    t6 = t1 + t7;
+    t3 = t2 + t9;
+    t4 = t0 + t11;
+    t5 = t5 - t8;
+    t8 = t1 - t7;
+    t1 = t2 - t9;
+    t7 = t0 - t11;
+    t2 = t10 + t3;
+    t9 = t6 + t4;
+    t0 = t5 + t7;
+    t11 = t8 - t1;
+    t10 = t10 - t3;
+    t3 = t6 - t4;
+    t6 = t5 - t7;
+    t4 = t8 + t1;
+    re[48] = t2;
+    im[48] = t9;
+    re[63] = t0;
+    im[63] = t11;
+    re[78] = t10;
+    im[78] = t3;
+    re[93] = t6;
+    im[93] = t4;
+    t5 = re[108];
+    t7 = im[108];
+    t8 = re[123];
+    t1 = im[123];
+    t2 = re[138];
+    t9 = im[138];
+    t0 = re[153];
+    t11 = im[153];
+    t10 = t5 + t2;
+    t3 = t7 + t9;
+    t6 = t8 + t0;
+    t4 = t1 + t11;
+    t5 = t5 - t2;
+    t2 = t7 - t9;
+    t7 = t8 - t0;
+    t9 = t1 - t11;
+    t8 = t10 + t6;
+    t0 = t3 + t4;
+    t1 = t5 + t9;
+    t11 = t2 - t7;
+    t10 = t10 - t6;
+    t6 = t3 - t4;
+    t3 = t5 - t9;
+    t4 = t2 + t7;
+    re[108] = t8;
+    im[108] = t0;
+    re[123] = t1;
+    im[123] = t11;
+    re[138] = t10;
+    im[138] = t6;
+    re[153] = t3;
+    im[153] = t4;
+    t5 = re[168];
+    t9 = im[168];
+    t2 = re[183];
+    t7 = im[183];
+    t8 = re[198];
+    t0 = im[198];
+    t1 = re[213];
+    t11 = im[213];
+    t10 = t5 + t8;
+    t6 = t9 + t0;
+    t3 = t2 + t1;
+    t4 = t7 + t11;
+    t5 = t5 - t8;
+    t8 = t9 - t0;
+    t9 = t2 - t1;
+    t0 = t7 - t11;
+    t2 = t10 + t3;
+    t1 = t6 + t4;
+    t7 = t5 + t0;
+    t11 = t8 - t9;
+    t10 = t10 - t3;
+    t3 = t6 - t4;
+    t6 = t5 - t0;
+    t4 = t8 + t9;
+    re[168] = t2;
+    im[168] = t1;
+    re[183] = t7;
+    im[183] = t11;
+    re[198] = t10;
+    im[198] = t3;
+    re[213] = t6;
+    im[213] = t4;
+    t5 = re[228];
+    t0 = im[228];
+    t8 = re[3];
+    t9 = im[3];
+    t2 = re[18];
+    t1 = im[18];
+    t7 = re[33];
+    t11 = im[33];
+    t10 = t5 + t2;
+    t3 = t0 + t1;
+    t6 = t8 + t7;
+    t4 = t9 + t11;
+    t5 = t5 - t2;
+    t2 = t0 - t1;
+    t0 = t8 - t7;
+    t1 = t9 - t11;
+    t8 = t10 + t6;
+    t7 = t3 + t4;
+    t9 = t5 + t1;
+    t11 = t2 - t0;
+    t10 = t10 - t6;
+    t6 = t3 - t4;
+    t3 = t5 - t1;
+    t4 = t2 + t0;
+    re[228] = t8;
+    im[228] = t7;
+    re[3] = t9;
+    im[3] = t11;
+    re[18] = t10;
+    im[18] = t6;
+    re[33] = t3;
+    im[33] = t4;
+    t5 = x[527];
+    t1 = x[47];
+    t2 = (-0.00266821145861729) * t1;
+    t0 = x[432];
+    t8 = 0.06393537465311024 * t0;
+    t7 = t2 - t8;
+    t9 = (-0.05272361601880383) * t5;
+    t11 = C25 * t7;
+    t10 = t9 + t11;
+    t6 = 0.03830594926788567 * t5;
+    t3 = C26 * t7;
+    t4 = t6 + t3;
+    t1 = x[72];
+    t0 = (-0.005470414012410816) * t1;
+    t2 = x[407];
+    t8 = 0.06389760976174391 * t2;
+    t9 = t0 - t8;
+    t11 = x[552];
+    t5 = C27 * t9;
+    t7 = (-0.055599377891008356) * t11;
+    t6 = t5 + t7;
+    t3 = (-C28) * t9;
+    t1 = (-0.034071342591699826) * t11;
+    t2 = t3 + t1;
+    t0 = x[192];
+    t8 = 0.02233693399813748 * t0;
+    t5 = x[287];
+    t7 = 0.0661217651490672 * t5;
+    t9 = t8 - t7;
+    t11 = x[672];
+    t3 = 0.06210336217290626 * t11;
+    t1 = x[767];
+    t0 = 0.002698791969717943 * t1;
+    t5 = t3 + t0;
+    t8 = C29 * t9;
+    t7 = (-C30) * t5;
+    t11 = t8 + t7;
+    t1 = (-C30) * t9;
+    t3 = (-C29) * t5;
+    t0 = t1 + t3;
+    t8 = x[647];
+    t7 = x[167];
+    t9 = 0.007040125278386572 * t7;
+    t5 = x[312];
+    t1 = 0.06459337021269107 * t5;
+    t3 = t9 - t1;
+    t7 = (-0.06272379536242693) * t8;
+    t5 = C31 * t3;
+    t9 = t7 + t5;
+    t1 = 0.015058650955406594 * t8;
+    t7 = C32 * t3;
+    t5 = t1 + t7;
+    t8 = t10 + t11;
+    t3 = t4 + t0;
+    t1 = t6 + t9;
+    t7 = t2 + t5;
+    t10 = t10 - t11;
+    t11 = t4 - t0;
+    t4 = t6 - t9;
+    t0 = t2 - t5;
+    t6 = t8 + t1;
+    t9 = t3 + t7;
+    t2 = t10 + t0;
+    t5 = t11 - t4;
+    t8 = t8 - t1;
+    t1 = t3 - t7;
+    t3 = t10 - t0;
+    t7 = t11 + t4;
+    re[96] = t6;
+    im[96] = t9;
+    re[156] = t2;
+    im[156] = t5;
+    re[216] = t8;
+    im[216] = t1;
+    re[36] = t3;
+    im[36] = t7;
+    t10 = x[497];
+    t0 = x[17];
+    t11 = (-0.00038106307763214714) * t0;
+    t4 = x[462];
+    t6 = 0.06422421661268282 * t4;
+    t9 = t11 - t6;
+    t2 = (-0.04849600653562642) * t10;
+    t5 = C33 * t9;
+    t8 = t2 + t5;
+    t1 = 0.04309462438426139 * t10;
+    t3 = C34 * t9;
+    t7 = t1 + t3;
+    t0 = x[102];
+    t4 = (-0.007129758433364301) * t0;
+    t11 = x[377];
+    t6 = 0.06379055508832998 * t11;
+    t2 = t4 - t6;
+    t5 = x[582];
+    t10 = C35 * t2;
+    t9 = (-0.05876969056562995) * t5;
+    t1 = t10 + t9;
+    t3 = (-C36) * t2;
+    t0 = (-0.028505345871674092) * t5;
+    t11 = t3 + t0;
+    t4 = x[222];
+    t6 = 0.04512355795413753 * t4;
+    t10 = x[257];
+    t9 = 0.06365161549822701 * t10;
+    t2 = t6 - t9;
+    t5 = x[702];
+    t3 = 0.05035612752637894 * t5;
+    t0 = x[737];
+    t4 = 0.021306338484103477 * t0;
+    t10 = t3 + t4;
+    t6 = C37 * t2;
+    t9 = (-C38) * t10;
+    t5 = t6 + t9;
+    t0 = (-C38) * t2;
+    t3 = (-C37) * t10;
+    t4 = t0 + t3;
+    t6 = x[617];
+    t9 = x[137];
+    t2 = (-0.003440762383926833) * t9;
+    t10 = x[342];
+    t0 = 0.06380899891895385 * t10;
+    t3 = t2 - t0;
+    t9 = (-0.061694932172165796) * t6;
+    t10 = C39 * t3;
+    t2 = t9 + t10;
+    t0 = 0.02139393770943843 * t6;
+    t9 = C40 * t3;
+    t10 = t0 + t9;
+    t6 = t8 + t5;
+    t3 = t7 + t4;
+    t0 = t1 + t2;
+    t9 = t11 + t10;
+    t8 = t8 - t5;
+    t5 = t7 - t4;
+    t7 = t1 - t2;
+    t4 = t11 - t10;
+    t1 = t6 + t0;
+    t2 = t3 + t9;
+    t11 = t8 + t4;
+    t10 = t5 - t7;
+    t6 = t6 - t0;
+    t0 = t3 - t9;
+    t3 = t8 - t4;
+    t9 = t5 + t7;
+    t8 = t11 + t10;
+    t4 = C1 * t8;
+    t5 = t11 * (-C11);
+    t7 = t10 * C12;
+    t8 = t4 - t7;
+    t11 = t4 + t5;
+    t10 = t6 + t0;
+    t7 = t6 - t0;
+    t4 = C2 * t10;
+    t5 = (-C2) * t7;
+    t6 = t3 + t9;
+    t0 = C0 * t6;
+    t10 = t3 * (-C11);
+    t7 = t9 * (-C12);
+    t6 = t0 - t7;
+    t3 = t0 + t10;
+    re[111] = t1;
+    im[111] = t2;
+    re[171] = t8;
+    im[171] = t11;
+    re[231] = t4;
+    im[231] = t5;
+    re[51] = t6;
+    im[51] = t3;
+    t9 = x[12];
+    t7 = (-0.0002175619268598817) * t9;
+    t0 = x[467];
+    t10 = 0.06430974609902519 * t0;
+    t1 = t7 - t10;
+    t2 = x[492];
+    t8 = C41 * t1;
+    t11 = (-0.047577191767128865) * t2;
+    t4 = t8 + t11;
+    t5 = (-C42) * t1;
+    t6 = (-0.04397990368933304) * t2;
+    t3 = t5 + t6;
+    t9 = x[132];
+    t0 = (-0.004448763503311272) * t9;
+    t7 = x[347];
+    t10 = 0.06376887750782857 * t7;
+    t8 = t0 - t10;
+    t11 = x[612];
+    t1 = C43 * t8;
+    t2 = (-0.061301542682224264) * t11;
+    t5 = t1 + t2;
+    t6 = (-C44) * t8;
+    t9 = (-0.02261533307235192) * t11;
+    t7 = t6 + t9;
+    t0 = x[707];
+    t10 = 0.04694248661658992 * t0;
+    t1 = x[732];
+    t2 = 0.025713379431564674 * t1;
+    t8 = t10 + t2;
+    t11 = x[227];
+    t6 = 0.048688863681974705 * t11;
+    t9 = x[252];
+    t0 = 0.062091117254326235 * t9;
+    t1 = t6 - t0;
+    t10 = (-C45) * t8;
+    t2 = C46 * t1;
+    t11 = t10 + t2;
+    t9 = C46 * t8;
+    t6 = C45 * t1;
+    t0 = t9 + t6;
+    t10 = x[587];
+    t2 = x[107];
+    t8 = (-0.007036978103218968) * t2;
+    t1 = x[372];
+    t9 = 0.06376861909256175 * t1;
+    t6 = t8 - t9;
+    t2 = (-0.05933843236350105) * t10;
+    t1 = C47 * t6;
+    t8 = t2 + t1;
+    t9 = 0.027355392007792325 * t10;
+    t2 = C48 * t6;
+    t1 = t9 + t2;
+    t10 = t4 + t11;
+    t6 = t3 + t0;
+    t9 = t5 + t8;
+    t2 = t7 + t1;
+    t4 = t4 - t11;
+    t11 = t3 - t0;
+    t3 = t5 - t8;
+    t0 = t7 - t1;
+    t5 = t10 + t9;
+    t8 = t6 + t2;
+    t7 = t4 + t0;
+    t1 = t11 - t3;
+    t10 = t10 - t9;
+    t9 = t6 - t2;
+    t6 = t4 - t0;
+    t2 = t11 + t3;
+    t4 = t7 + t1;
+    t0 = t7 - t1;
+    t11 = C2 * t4;
+    t3 = (-C2) * t0;
+    t7 = -t10;
+    t1 = t6 - t2;
+    t4 = t6 + t2;
+    t0 = (-C2) * t1;
+    t10 = (-C2) * t4;
+    re[126] = t5;
+    im[126] = t8;
+    re[186] = t11;
+    im[186] = t3;
+    re[6] = t9;
+    im[6] = t7;
+    re[66] = t0;
+    im[66] = t10;
+    t6 = x[42];
+    t2 = (-0.002146342084224539) * t6;
+    t1 = x[437];
+    t4 = 0.06395664201941807 * t1;
+    t5 = t2 - t4;
+    t8 = x[522];
+    t11 = C49 * t5;
+    t3 = (-0.051944087210065784) * t8;
+    t9 = t11 + t3;
+    t7 = (-C50) * t5;
+    t0 = (-0.03932064513398021) * t8;
+    t10 = t7 + t0;
+    t6 = x[162];
+    t1 = 0.0047065095125265214 * t6;
+    t2 = x[317];
+    t4 = 0.06437442268842114 * t2;
+    t11 = t1 - t4;
+    t3 = x[642];
+    t5 = C51 * t11;
+    t8 = (-0.06262833461587808) * t3;
+    t7 = t5 + t8;
+    t0 = (-C52) * t11;
+    t6 = (-0.016342643454142956) * t3;
+    t2 = t0 + t6;
+    t1 = x[677];
+    t4 = 0.06107370774936289 * t1;
+    t5 = x[762];
+    t8 = 0.00451656564222036 * t5;
+    t11 = t4 + t8;
+    t3 = x[197];
+    t0 = 0.026004067883560328 * t3;
+    t6 = x[282];
+    t1 = 0.06630050370812882 * t6;
+    t5 = t0 - t1;
+    t4 = (-C53) * t11;
+    t8 = C54 * t5;
+    t3 = t4 + t8;
+    t6 = C54 * t11;
+    t0 = C53 * t5;
+    t1 = t6 + t0;
+    t4 = x[557];
+    t8 = x[77];
+    t11 = (-0.005953289064914111) * t8;
+    t5 = x[402];
+    t6 = 0.06388821873047874 * t5;
+    t0 = t11 - t6;
+    t8 = (-0.05626587623933684) * t4;
+    t5 = C55 * t0;
+    t11 = t8 + t5;
+    t6 = 0.03297800070614804 * t4;
+    t8 = C56 * t0;
+    t5 = t6 + t8;
+    t4 = t9 + t3;
+    t0 = t10 + t1;
+    t6 = t7 + t11;
+    t8 = t2 + t5;
+    t9 = t9 - t3;
+    t3 = t10 - t1;
+    t10 = t7 - t11;
+    t1 = t2 - t5;
+    t7 = t4 + t6;
+    t11 = t0 + t8;
+    t2 = t9 + t1;
+    t5 = t3 - t10;
+    t4 = t4 - t6;
+    t6 = t0 - t8;
+    t0 = t9 - t1;
+    t8 = t3 + t10;
+    t9 = t2 + t5;
+    t1 = C0 * t9;
+    t3 = t2 * (-C11);
+    t10 = t5 * (-C12);
+    t9 = t1 - t10;
+    t2 = t1 + t3;
+    t5 = t4 - t6;
+    t10 = t4 + t6;
+    t1 = (-C2) * t5;
+    t3 = (-C2) * t10;
+    t4 = t0 + t8;
+    t6 = (-C1) * t4;
+    t5 = t0 * C11;
+    t10 = t8 * (-C12);
+    t4 = t6 - t10;
+    t0 = t6 + t5;
+    re[141] = t7;
+    im[141] = t11;
+    re[201] = t9;
+    im[201] = t2;
+    re[21] = t1;
+    im[21] = t3;
+    re[81] = t4;
+    im[81] = t0;
+    t8 = re[96];
+    t10 = im[96];
+    t6 = re[111];
+    t5 = im[111];
+    t7 = re[126];
+    t11 = im[126];
+    t9 = re[141];
+    t2 = im[141];
+    t1 = t8 + t7;
+    t3 = t10 + t11;
+    t4 = t6 + t9;
+    t0 = t5 + t2;
+    t8 = t8 - t7;
+    t7 = t10 - t11;
+    t10 = t6 - t9;
+    t11 = t5 - t2;
+    t6 = t1 + t4;
+    t9 = t3 + t0;
+    t5 = t8 + t11;
+    t2 = t7 - t10;
+    t1 = t1 - t4;
+    t4 = t3 - t0;
+    t3 = t8 - t11;
+    t0 = t7 + t10;
+    re[96] = t6;
+    im[96] = t9;
+    re[111] = t5;
+    im[111] = t2;
+    re[126] = t1;
+    im[126] = t4;
+    re[141] = t3;
+    im[141] = t0;
+    t8 = re[156];
+    t11 = im[156];
+    t7 = re[171];
+    t10 = im[171];
+    t6 = re[186];
+    t9 = im[186];
+    t5 = re[201];
+    t2 = im[201];
+    t1 = t8 + t6;
+    t4 = t11 + t9;
+    t3 = t7 + t5;
+    t0 = t10 + t2;
+    t8 = t8 - t6;
+    t6 = t11 - t9;
+    t11 = t7 - t5;
+    t9 = t10 - t2;
+    t7 = t1 + t3;
+    t5 = t4 + t0;
+    t10 = t8 + t9;
+    t2 = t6 - t11;
+    t1 = t1 - t3;
+    t3 = t4 - t0;
+    t4 = t8 - t9;
+    t0 = t6 + t11;
+    re[156] = t7;
+    im[156] = t5;
+    re[171] = t10;
+    im[171] = t2;
+    re[186] = t1;
+    im[186] = t3;
+    re[201] = t4;
+    im[201] = t0;
+    t8 = re[216];
+    t9 = im[216];
+    t6 = re[231];
+    t11 = im[231];
+    t7 = re[6];
+    t5 = im[6];
+    t10 = re[21];
+    t2 = im[21];
+    t1 = t8 + t7;
+    t3 = t9 + t5;
+    t4 = t6 + t10;
+    t0 = t11 + t2;
+    t8 = t8 - t7;
+    t7 = t9 - t5;
+    t9 = t6 - t10;
+    t5 = t11 - t2;
+    t6 = t1 + t4;
+    t10 = t3 + t0;
+    t11 = t8 + t5;
+    t2 = t7 - t9;
+    t1 = t1 - t4;
+    t4 = t3 - t0;
+    t3 = t8 - t5;
+    t0 = t7 + t9;
+    re[216] = t6;
+    im[216] = t10;
+    re[231] = t11;
+    im[231] = t2;
+    re[6] = t1;
+    im[6] = t4;
+    re[21] = t3;
+    im[21] = t0;
+    t8 = re[36];
+    t5 = im[36];
+    t7 = re[51];
+    t9 = im[51];
+    t6 = re[66];
+    t10 = im[66];
+    t11 = re[81];
+    t2 = im[81];
+    t1 = t8 + t6;
+    t4 = t5 + t10;
+    t3 = t7 + t11;
+    t0 = t9 + t2;
+    t8 = t8 - t6;
+    t6 = t5 - t10;
+    t5 = t7 - t11;
+    t10 = t9 - t2;
+    t7 = t1 + t3;
+    t11 = t4 + t0;
+    t9 = t8 + t10;
+    t2 = t6 - t5;
+    t1 = t1 - t3;
+    t3 = t4 - t0;
+    t4 = t8 - t10;
+    t0 = t6 + t5;
+    re[36] = t7;
+    im[36] = t11;
+    re[51] = t9;
+    im[51] = t2;
+    re[66] = t1;
+    im[66] = t3;
+    re[81] = t4;
+    im[81] = t0;
+    t8 = x[48];
+    t10 = (-0.0027770603351207086) * t8;
+    t6 = x[431];
+    t5 = 0.06393213964091513 * t6;
+    t7 = t10 - t5;
+    t11 = x[528];
+    t9 = C25 * t7;
+    t2 = (-0.05272628387165138) * t11;
+    t1 = t9 + t2;
+    t3 = (-C26) * t7;
+    t4 = (-0.03830788757643788) * t11;
+    t0 = t3 + t4;
+    t8 = x[168];
+    t6 = 0.007536996945517365 * t8;
+    t10 = x[311];
+    t5 = 0.06464297960940578 * t10;
+    t9 = t6 - t5;
+    t2 = x[648];
+    t7 = C31 * t9;
+    t11 = (-0.06267565881818984) * t2;
+    t3 = t7 + t11;
+    t4 = (-C32) * t9;
+    t8 = (-0.015047094393599749) * t2;
+    t10 = t4 + t8;
+    t6 = x[671];
+    t5 = 0.06227702433516376 * t6;
+    t7 = x[768];
+    t11 = 0.0024003719606811033 * t7;
+    t9 = t5 + t11;
+    t2 = x[191];
+    t4 = 0.021622346992802383 * t2;
+    t8 = x[288];
+    t6 = 0.06607195888287949 * t8;
+    t7 = t4 - t6;
+    t5 = (-C30) * t9;
+    t11 = C29 * t7;
+    t2 = t5 + t11;
+    t8 = C29 * t9;
+    t4 = C30 * t7;
+    t6 = t8 + t4;
+    t5 = x[551];
+    t11 = x[71];
+    t9 = (-0.005367462631492221) * t11;
+    t7 = x[408];
+    t8 = 0.06389906155872181 * t7;
+    t4 = t9 - t8;
+    t11 = (-0.055598114664181096) * t5;
+    t7 = C27 * t4;
+    t9 = t11 + t7;
+    t8 = 0.03407056848530449 * t5;
+    t11 = C28 * t4;
+    t7 = t8 + t11;
+    t5 = t1 + t2;
+    t4 = t0 + t6;
+    t8 = t3 + t9;
+    t11 = t10 + t7;
+    t1 = t1 - t2;
+    t2 = t0 - t6;
+    t0 = t3 - t9;
+    t6 = t10 - t7;
+    t3 = t5 + t8;
+    t9 = t4 + t11;
+    t10 = t1 + t6;
+    t7 = t2 - t0;
+    t5 = t5 - t8;
+    t8 = t4 - t11;
+    t4 = t1 - t6;
+    t11 = t2 + t0;
+    re[144] = t3;
+    im[144] = t9;
+    re[204] = t10;
+    im[204] = t7;
+    re[24] = t5;
+    im[24] = t8;
+    re[84] = t4;
+    im[84] = t11;
+    t1 = x[78];
+    t6 = (-0.00604264983245425) * t1;
+    t2 = x[401];
+    t0 = 0.06388590726161235 * t2;
+    t3 = t6 - t0;
+    t9 = x[558];
+    t10 = C55 * t3;
+    t7 = (-0.05626791200632745) * t9;
+    t5 = t10 + t7;
+    t8 = (-C56) * t3;
+    t4 = (-0.032979193889827764) * t9;
+    t11 = t8 + t4;
+    t1 = x[198];
+    t2 = 0.02675384811682817 * t1;
+    t6 = x[281];
+    t0 = 0.06631893477331191 * t6;
+    t10 = t2 - t0;
+    t7 = x[678];
+    t3 = 0.06083212068839759 * t7;
+    t9 = x[761];
+    t8 = 0.004946773340143956 * t9;
+    t4 = t3 + t8;
+    t1 = C54 * t10;
+    t6 = (-C53) * t4;
+    t2 = t1 + t6;
+    t0 = (-C53) * t10;
+    t7 = (-C54) * t4;
+    t9 = t0 + t7;
+    t3 = x[641];
+    t8 = x[161];
+    t1 = 0.004269736803378256 * t8;
+    t6 = x[318];
+    t10 = 0.06433600442796719 * t6;
+    t4 = t1 - t10;
+    t0 = (-0.06266573314089473) * t3;
+    t7 = C51 * t4;
+    t8 = t0 + t7;
+    t6 = 0.016352402467596 * t3;
+    t1 = C52 * t4;
+    t10 = t6 + t1;
+    t0 = x[521];
+    t7 = x[41];
+    t3 = (-0.002047155958016181) * t7;
+    t4 = x[438];
+    t6 = 0.0639619833894649 * t4;
+    t1 = t3 - t6;
+    t7 = (-0.051939749436644284) * t0;
+    t4 = C49 * t1;
+    t3 = t7 + t4;
+    t6 = 0.03931736152542071 * t0;
+    t7 = C50 * t1;
+    t4 = t6 + t7;
+    t0 = t5 + t8;
+    t1 = t11 + t10;
+    t6 = t2 + t3;
+    t7 = t9 + t4;
+    t5 = t5 - t8;
+    t8 = t11 - t10;
+    t11 = t2 - t3;
+    t10 = t9 - t4;
+    t2 = t0 + t6;
+    t3 = t1 + t7;
+    t9 = t5 + t10;
+    t4 = t8 - t11;
+    t0 = t0 - t6;
+    t6 = t1 - t7;
+    t1 = t5 - t10;
+    t7 = t8 + t11;
+    t5 = t9 + t4;
+    t10 = C1 * t5;
+    t8 = t9 * (-C11);
+    t11 = t4 * C12;
+    t5 = t10 - t11;
+    t9 = t10 + t8;
+    t4 = t0 + t6;
+    t11 = t0 - t6;
+    t10 = C2 * t4;
+    t8 = (-C2) * t11;
+    t0 = t1 + t7;
+    t6 = C0 * t0;
+    t4 = t1 * (-C11);
+    t11 = t7 * (-C12);
+    t0 = t6 - t11;
+    t1 = t6 + t4;
+    re[159] = t2;
+    im[159] = t3;
+    re[219] = t5;
+    im[219] = t9;
+    re[39] = t10;
+    im[39] = t8;
+    re[99] = t0;
+    im[99] = t1;
+    t7 = x[108];
+    t11 = (-0.007003056530207578) * t7;
+    t6 = x[371];
+    t4 = 0.06376464605292369 * t6;
+    t2 = t11 - t4;
+    t3 = x[588];
+    t5 = C47 * t2;
+    t9 = (-0.05934212961516692) * t3;
+    t10 = t5 + t9;
+    t8 = (-C48) * t2;
+    t0 = (-0.02735709646415631) * t3;
+    t1 = t8 + t0;
+    t7 = x[228];
+    t6 = 0.049376107323254634 * t7;
+    t11 = x[251];
+    t4 = 0.061731500412022404 * t11;
+    t5 = t6 - t4;
+    t9 = x[708];
+    t2 = 0.04621244968025226 * t9;
+    t3 = x[731];
+    t8 = 0.02661009304738782 * t3;
+    t0 = t2 + t8;
+    t7 = C46 * t5;
+    t11 = (-C45) * t0;
+    t6 = t7 + t11;
+    t4 = (-C45) * t5;
+    t9 = (-C46) * t0;
+    t3 = t4 + t9;
+    t2 = x[611];
+    t8 = x[131];
+    t7 = (-0.00462872956186059) * t8;
+    t11 = x[348];
+    t5 = 0.06376293712973247 * t11;
+    t0 = t7 - t5;
+    t4 = (-0.061307253748210236) * t2;
+    t9 = C43 * t0;
+    t8 = t4 + t9;
+    t11 = 0.022617439995829207 * t2;
+    t7 = C44 * t0;
+    t5 = t11 + t7;
+    t4 = x[491];
+    t9 = x[11];
+    t2 = (-0.00019155824848469372) * t9;
+    t0 = x[468];
+    t11 = 0.06432778749320836 * t0;
+    t7 = t2 - t11;
+    t9 = (-0.04756384825098682) * t4;
+    t0 = C41 * t7;
+    t2 = t9 + t0;
+    t11 = 0.04396756906988605 * t4;
+    t9 = C42 * t7;
+    t0 = t11 + t9;
+    t4 = t10 + t8;
+    t7 = t1 + t5;
+    t11 = t6 + t2;
+    t9 = t3 + t0;
+    t10 = t10 - t8;
+    t8 = t1 - t5;
+    t1 = t6 - t2;
+    t5 = t3 - t0;
+    t6 = t4 + t11;
+    t2 = t7 + t9;
+    t3 = t10 + t5;
+    t0 = t8 - t1;
+    t4 = t4 - t11;
+    t11 = t7 - t9;
+    t7 = t10 - t5;
+    t9 = t8 + t1;
+    t10 = t3 + t0;
+    t5 = t3 - t0;
+    t8 = C2 * t10;
+    t1 = (-C2) * t5;
+    t3 = -t4;
+    t0 = t7 - t9;
+    t10 = t7 + t9;
+    t5 = (-C2) * t0;
+    t4 = (-C2) * t10;
+    re[174] = t6;
+    im[174] = t2;
+    re[234] = t8;
+    im[234] = t1;
+    re[54] = t11;
+    im[54] = t3;
+    re[114] = t5;
+    im[114] = t4;
+    t7 = x[138];
+    t9 = (-0.0032167884525350523) * t7;
+    t0 = x[341];
+    t10 = 0.06381930016155603 * t0;
+    t6 = t9 - t10;
+    t2 = x[618];
+    t8 = C39 * t6;
+    t1 = (-0.061684973829438376) * t2;
+    t11 = t8 + t1;
+    t3 = (-C40) * t6;
+    t5 = (-0.02139048445717769) * t2;
+    t4 = t3 + t5;
+    t7 = x[701];
+    t0 = 0.050989343718260305 * t7;
+    t9 = x[738];
+    t10 = 0.02044703037611674 * t9;
+    t8 = t0 + t10;
+    t1 = x[221];
+    t6 = 0.04438809399288695 * t1;
+    t2 = x[258];
+    t3 = 0.06391653084346428 * t2;
+    t5 = t6 - t3;
+    t7 = (-C38) * t8;
+    t9 = C37 * t5;
+    t0 = t7 + t9;
+    t10 = C37 * t8;
+    t1 = C38 * t5;
+    t2 = t10 + t1;
+    t6 = x[581];
+    t3 = x[101];
+    t7 = (-0.0071333021455818576) * t3;
+    t9 = x[378];
+    t8 = 0.06379518584601195 * t9;
+    t5 = t7 - t8;
+    t10 = (-0.05876542459802681) * t6;
+    t1 = C35 * t5;
+    t3 = t10 + t1;
+    t9 = 0.028503276728875575 * t6;
+    t7 = C36 * t5;
+    t8 = t9 + t7;
+    t10 = x[18];
+    t1 = (-0.00042089128352338934) * t10;
+    t6 = x[461];
+    t5 = 0.06420821207141977 * t6;
+    t9 = t1 - t5;
+    t7 = x[498];
+    t10 = C33 * t9;
+    t6 = (-0.04850809465196939) * t7;
+    t1 = t10 + t6;
+    t5 = (-C34) * t9;
+    t10 = (-0.04310536615189397) * t7;
+    t6 = t5 + t10;
+    t9 = t11 + t3;
+    t7 = t4 + t8;
+    t5 = t0 + t1;
+    t10 = t2 + t6;
+    t11 = t11 - t3;
+    t3 = t4 - t8;
+    t4 = t0 - t1;
+    t8 = t2 - t6;
+    t0 = t9 + t5;
+    t1 = t7 + t10;
+    t2 = t11 + t8;
+    t6 = t3 - t4;
+    t9 = t9 - t5;
+    t5 = t7 - t10;
+    t7 = t11 - t8;
+    t10 = t3 + t4;
+    t11 = t2 + t6;
+    t8 = C0 * t11;
+    t3 = t2 * (-C11);
+    t4 = t6 * (-C12);
+    t11 = t8 - t4;
+    t2 = t8 + t3;
+    t6 = t9 - t5;
+    t4 = t9 + t5;
+    t8 = (-C2) * t6;
+    t3 = (-C2) * t4;
+    t9 = t7 + t10;
+    t5 = (-C1) * t9;
+    t6 = t7 * C11;
+    t4 = t10 * (-C12);
+    t9 = t5 - t4;
+    t7 = t5 + t6;
+    re[189] = t0;
+    im[189] = t1;
+    re[9] = t11;
+    im[9] = t2;
+    re[69] = t8;
+    im[69] = t3;
+    re[129] = t9;
+    im[129] = t7;
+    t10 = re[144];
+    t4 = im[144];
+    t5 = re[159];
+    t6 = im[159];
+    t0 = re[174];
+    t1 = im[174];
+    t11 = re[189];
+    t2 = im[189];
+    t8 = t10 + t0;
+    t3 = t4 + t1;
+    t9 = t5 + t11;
+    t7 = t6 + t2;
+    t10 = t10 - t0;
+    t0 = t4 - t1;
+    t4 = t5 - t11;
+    t1 = t6 - t2;
+    t5 = t8 + t9;
+    t11 = t3 + t7;
+    t6 = t10 + t1;
+    t2 = t0 - t4;
+    t8 = t8 - t9;
+    t9 = t3 - t7;
+    t3 = t10 - t1;
+    t7 = t0 + t4;
+    re[144] = t5;
+    im[144] = t11;
+    re[159] = t6;
+    im[159] = t2;
+    re[174] = t8;
+    im[174] = t9;
+    re[189] = t3;
+    im[189] = t7;
+    t10 = re[204];
+    t1 = im[204];
+    t0 = re[219];
+    t4 = im[219];
+    t5 = re[234];
+    t11 = im[234];
+    t6 = re[9];
+    t2 = im[9];
+    t8 = t10 + t5;
+    t9 = t1 + t11;
+    t3 = t0 + t6;
+    t7 = t4 + t2;
+    t10 = t10 - t5;
+    t5 = t1 - t11;
+    t1 = t0 - t6;
+    t11 = t4 - t2;
+    t0 = t8 + t3;
+    t6 = t9 + t7;
+    t4 = t10 + t11;
+    t2 = t5 - t1;
+    t8 = t8 - t3;
+    t3 = t9 - t7;
+    t9 = t10 - t11;
+    t7 = t5 + t1;
+    re[204] = t0;
+    im[204] = t6;
+    re[219] = t4;
+    im[219] = t2;
+    re[234] = t8;
+    im[234] = t3;
+    re[9] = t9;
+    im[9] = t7;
+    t10 = re[24];
+    t11 = im[24];
+    t5 = re[39];
+    t1 = im[39];
+    t0 = re[54];
+    t6 = im[54];
+    t4 = re[69];
+    t2 = im[69];
+    t8 = t10 + t0;
+    t3 = t11 + t6;
+    t9 = t5 + t4;
+    t7 = t1 + t2;
+    t10 = t10 - t0;
+    t0 = t11 - t6;
+    t11 = t5 - t4;
+    t6 = t1 - t2;
+    t5 = t8 + t9;
+    t4 = t3 + t7;
+    t1 = t10 + t6;
+    t2 = t0 - t11;
+    t8 = t8 - t9;
+    t9 = t3 - t7;
+    t3 = t10 - t6;
+    t7 = t0 + t11;
+    re[24] = t5;
+    im[24] = t4;
+    re[39] = t1;
+    im[39] = t2;
+    re[54] = t8;
+    im[54] = t9;
+    re[69] = t3;
+    im[69] = t7;
+    t10 = re[84];
+    t6 = im[84];
+    t0 = re[99];
+    t11 = im[99];
+    t5 = re[114];
+    t4 = im[114];
+    t1 = re[129];
+    t2 = im[129];
+    t8 = t10 + t5;
+    t9 = t6 + t4;
+    t3 = t0 + t1;
+    t7 = t11 + t2;
+    t10 = t10 - t5;
+    t5 = t6 - t4;
+    t6 = t0 - t1;
+    t4 = t11 - t2;
+    t0 = t8 + t3;
+    t1 = t9 + t7;
+    t11 = t10 + t4;
+    t2 = t5 - t6;
+    t8 = t8 - t3;
+    t3 = t9 - t7;
+    t9 = t10 - t4;
+    t7 = t5 + t6;
+    re[84] = t0;
+    im[84] = t1;
+    re[99] = t11;
+    im[99] = t2;
+    re[114] = t8;
+    im[114] = t3;
+    re[129] = t9;
+    im[129] = t7;
+}
+
+/**
+ *  Part 2 of ApplyWindowedMDCT_W10_480().
+ * 
+ *  @param {Number[]} x 
+ *    - The input block (960 points).
+ *  @param {Number[]} X 
+ *    - The array that would contain the output block (480 points).
+ *  @param {Number[]} re 
+ *    - The scratch buffer (real part, 240 points).
+ *  @param {Number[]} im 
+ *    - The scratch buffer (imaginary part, 240 points).
+ */
+function ApplyWindowedMDCT_W10_480_Part2(x, X, re, im) {
+    let t0, t1, t10, t11, t12, t13, t14, t2, t3, t4, t5, t6, t7, t8, t9;
+    const C0 = 0.9510565162951535;
+    const C1 = 0.996917333733128;
+    const C2 = 0.07845909572784494;
+    const C3 = 0.9844265680898916;
+    const C4 = 0.1757962799343545;
+    const C5 = 0.9238795325112867;
+    const C6 = 1.3065629648763766;
+    const C7 = 0.5411961001461969;
+    const C8 = 0.7071067811865476;
+    const C9 = 0.3826834323650898;
+    const C10 = 0.11753739745783764;
+    const C11 = 0.9930684569549263;
+    const C12 = 0.0196336924606283;
+    const C13 = 0.9998072404820648;
+    const C14 = 0.5590169943749475;
+    const C15 = 0.25;
+    const C16 = 0.5877852522924731;
+    t10 = x[144];
+    t4 = (-0.0017076145448912225) * t10;
+    t5 = x[335];
+    t6 = 0.0638986159162963 * t5;
+    t0 = t4 - t6;
+    t1 = x[624];
+    t11 = 0.3090169943749474 * t0;
+    t2 = (-0.062015983096630874) * t1;
+    t8 = t11 + t2;
+    t3 = (-C0) * t0;
+    t9 = (-0.020150214389342357) * t1;
+    t7 = t3 + t9;
+    t10 = x[695];
+    t5 = 0.05442378957776079 * t10;
+    t4 = x[744];
+    t6 = 0.01552465912360012 * t4;
+    t11 = t5 + t6;
+    t2 = x[215];
+    t0 = 0.03986069334723713 * t2;
+    t1 = x[264];
+    t3 = 0.06518919423924516 * t1;
+    t9 = t0 - t3;
+    t10 = (-C1) * t11;
+    t4 = C2 * t9;
+    t5 = t10 + t4;
+    t6 = C2 * t11;
+    t2 = C1 * t9;
+    t1 = t6 + t2;
+    t0 = x[575];
+    t3 = x[95];
+    t10 = (-0.007056159883489285) * t3;
+    t4 = x[384];
+    t11 = 0.06382332027598772 * t4;
+    t9 = t10 - t11;
+    t6 = (-0.05816881929777895) * t0;
+    t2 = 0.45399049973954675 * t9;
+    t3 = t6 + t2;
+    t4 = 0.02963849379926102 * t0;
+    t10 = 0.8910065241883679 * t9;
+    t11 = t4 + t10;
+    t6 = x[24];
+    t2 = (-0.0007136104450472506) * t6;
+    t0 = x[455];
+    t9 = 0.06412072010254359 * t0;
+    t4 = t2 - t9;
+    t10 = x[504];
+    t6 = 0.6494480483301837 * t4;
+    t0 = (-0.04941239251420141) * t10;
+    t2 = t6 + t0;
+    t9 = (-0.7604059656000309) * t4;
+    t6 = (-0.04220217006891901) * t10;
+    t0 = t9 + t6;
+    t4 = t8 + t3;
+    t10 = t7 + t11;
+    t9 = t5 + t2;
+    t6 = t1 + t0;
+    t8 = t8 - t3;
+    t3 = t7 - t11;
+    t7 = t5 - t2;
+    t11 = t1 - t0;
+    t5 = t4 + t9;
+    t2 = t10 + t6;
+    t1 = t8 + t11;
+    t0 = t3 - t7;
+    t4 = t4 - t9;
+    t9 = t10 - t6;
+    t10 = t8 - t11;
+    t6 = t3 + t7;
+    re[192] = t5;
+    im[192] = t2;
+    re[12] = t1;
+    im[12] = t0;
+    re[72] = t4;
+    im[72] = t9;
+    re[132] = t10;
+    im[132] = t6;
+    t8 = x[174];
+    t11 = 0.01072961494190447 * t8;
+    t3 = x[305];
+    t7 = 0.0649861883216497 * t3;
+    t5 = t11 - t7;
+    t2 = x[654];
+    t1 = 0.21430915306505077 * t5;
+    t0 = (-0.0626265048612048) * t2;
+    t4 = t1 + t0;
+    t9 = (-0.9767658813208724) * t5;
+    t10 = (-0.013740685944188993) * t2;
+    t6 = t9 + t10;
+    t8 = x[665];
+    t3 = 0.0631336144045856 * t8;
+    t11 = x[774];
+    t7 = 0.0010277140855204658 * t11;
+    t1 = t3 + t7;
+    t0 = x[185];
+    t5 = 0.01749077410928325 * t0;
+    t2 = x[294];
+    t9 = 0.06571287246697802 * t2;
+    t10 = t5 - t9;
+    t8 = (-C3) * t1;
+    t11 = C4 * t10;
+    t3 = t8 + t11;
+    t7 = C4 * t1;
+    t0 = C3 * t10;
+    t2 = t7 + t0;
+    t5 = x[545];
+    t9 = x[65];
+    t8 = (-0.004716377931516046) * t9;
+    t11 = x[414];
+    t1 = 0.06390582811752152 * t11;
+    t10 = t8 - t1;
+    t7 = (-0.054912651587339434) * t5;
+    t0 = 0.5391383229110002 * t10;
+    t9 = t7 + t0;
+    t11 = 0.03515187495363852 * t5;
+    t8 = 0.8422172337162865 * t10;
+    t1 = t11 + t8;
+    t7 = x[54];
+    t0 = (-0.003452223749770549) * t7;
+    t5 = x[425];
+    t10 = 0.06391811564460889 * t5;
+    t11 = t0 - t10;
+    t8 = x[534];
+    t7 = 0.5717879602276122 * t11;
+    t5 = (-0.053479976897774666) * t8;
+    t0 = t7 + t5;
+    t10 = (-0.8204014435255136) * t11;
+    t7 = (-0.037273467940268715) * t8;
+    t5 = t10 + t7;
+    t11 = t4 + t9;
+    t8 = t6 + t1;
+    t10 = t3 + t0;
+    t7 = t2 + t5;
+    t4 = t4 - t9;
+    t9 = t6 - t1;
+    t6 = t3 - t0;
+    t1 = t2 - t5;
+    t3 = t11 + t10;
+    t0 = t8 + t7;
+    t2 = t4 + t1;
+    t5 = t9 - t6;
+    t11 = t11 - t10;
+    t10 = t8 - t7;
+    t8 = t4 - t1;
+    t7 = t9 + t6;
+    t4 = t2 + t5;
+    t1 = C5 * t4;
+    t9 = t2 * (-C6);
+    t6 = t5 * C7;
+    t4 = t1 - t6;
+    t2 = t1 + t9;
+    t5 = t11 + t10;
+    t6 = t11 - t10;
+    t1 = C8 * t5;
+    t9 = (-C8) * t6;
+    t11 = t8 + t7;
+    t10 = C9 * t11;
+    t5 = t8 * (-C6);
+    t6 = t7 * (-C7);
+    t11 = t10 - t6;
+    t8 = t10 + t5;
+    re[207] = t3;
+    im[207] = t0;
+    re[27] = t4;
+    im[27] = t2;
+    re[87] = t1;
+    im[87] = t9;
+    re[147] = t11;
+    im[147] = t8;
+    t7 = x[204];
+    t6 = 0.03133630944747369 * t7;
+    t10 = x[275];
+    t5 = 0.06626654744040716 * t10;
+    t3 = t6 - t5;
+    t0 = x[684];
+    t4 = 0.059094601384874317 * t0;
+    t2 = x[755];
+    t1 = 0.007999393194151353 * t2;
+    t9 = t4 + t1;
+    t11 = C10 * t3;
+    t8 = (-C11) * t9;
+    t7 = t11 + t8;
+    t10 = (-C11) * t3;
+    t6 = (-C10) * t9;
+    t5 = t10 + t6;
+    t0 = x[635];
+    t2 = x[155];
+    t4 = 0.0018541787857695319 * t2;
+    t1 = x[324];
+    t11 = 0.06413878463163647 * t1;
+    t8 = t4 - t11;
+    t3 = (-0.06252426164483553) * t0;
+    t9 = 0.27144044986507426 * t8;
+    t10 = t3 + t9;
+    t6 = 0.017633665510399178 * t0;
+    t2 = 0.9624552364536473 * t8;
+    t1 = t6 + t2;
+    t4 = x[515];
+    t11 = x[35];
+    t3 = (-0.0014959568039040413) * t11;
+    t9 = x[444];
+    t0 = 0.06400290890259969 * t9;
+    t8 = t3 - t0;
+    t6 = (-0.05112508063734055) * t4;
+    t2 = 0.619093949309834 * t8;
+    t11 = t6 + t2;
+    t9 = 0.0403037637875164 * t4;
+    t3 = 0.785316930880745 * t8;
+    t0 = t9 + t3;
+    t6 = x[84];
+    t2 = (-0.006517457804168838) * t6;
+    t4 = x[395];
+    t8 = 0.06386848293926461 * t4;
+    t9 = t2 - t8;
+    t3 = x[564];
+    t6 = 0.4886212414969549 * t9;
+    t4 = (-0.05692009363878351) * t3;
+    t2 = t6 + t4;
+    t8 = (-0.8724960070727972) * t9;
+    t6 = (-0.0318767840705829) * t3;
+    t4 = t8 + t6;
+    t9 = t7 + t11;
+    t3 = t5 + t0;
+    t8 = t10 + t2;
+    t6 = t1 + t4;
+    t7 = t7 - t11;
+    t11 = t5 - t0;
+    t5 = t10 - t2;
+    t0 = t1 - t4;
+    t10 = t9 + t8;
+    t2 = t3 + t6;
+    t1 = t7 + t0;
+    t4 = t11 - t5;
+    t9 = t9 - t8;
+    t8 = t3 - t6;
+    t3 = t7 - t0;
+    t6 = t11 + t5;
+    t7 = t1 + t4;
+    t0 = t1 - t4;
+    t11 = C8 * t7;
+    t5 = (-C8) * t0;
+    t1 = -t9;
+    t4 = t3 - t6;
+    t7 = t3 + t6;
+    t0 = (-C8) * t4;
+    t9 = (-C8) * t7;
+    re[222] = t10;
+    im[222] = t2;
+    re[42] = t11;
+    im[42] = t5;
+    re[102] = t8;
+    im[102] = t1;
+    re[162] = t0;
+    im[162] = t9;
+    t3 = x[234];
+    t6 = 0.05327989747267351 * t3;
+    t4 = x[245];
+    t7 = 0.059241318192135656 * t4;
+    t10 = t6 - t7;
+    t2 = x[714];
+    t11 = 0.04153890356165323 * t2;
+    t5 = x[725];
+    t8 = 0.03201671445207391 * t5;
+    t1 = t11 + t8;
+    t0 = C12 * t10;
+    t9 = (-C13) * t1;
+    t3 = t0 + t9;
+    t4 = (-C13) * t10;
+    t6 = (-C12) * t1;
+    t7 = t4 + t6;
+    t2 = x[605];
+    t5 = x[125];
+    t11 = (-0.0055645048346550955) * t5;
+    t8 = x[354];
+    t0 = 0.06374030925537781 * t8;
+    t9 = t11 - t0;
+    t10 = (-0.06087297462922675) * t2;
+    t1 = 0.36447049987914965 * t9;
+    t4 = t10 + t1;
+    t6 = 0.023825223011475462 * t2;
+    t5 = 0.9312149347588036 * t9;
+    t8 = t6 + t5;
+    t11 = x[485];
+    t0 = x[5];
+    t10 = (-7.618525494244105e-05) * t0;
+    t1 = x[474];
+    t2 = 0.06444118770571218 * t1;
+    t9 = t10 - t2;
+    t6 = (-0.04660926900735236) * t11;
+    t5 = 0.6930873625456359 * t9;
+    t0 = t6 + t5;
+    t1 = 0.044813947622986294 * t11;
+    t10 = 0.7208535967029188 * t9;
+    t2 = t1 + t10;
+    t6 = x[114];
+    t5 = (-0.00668637682480584) * t6;
+    t11 = x[365];
+    t9 = 0.0637450386687413 * t11;
+    t1 = t5 - t9;
+    t10 = x[594];
+    t6 = 0.40074883310314097 * t1;
+    t11 = (-0.059886226458489275) * t10;
+    t5 = t6 + t11;
+    t9 = (-0.916187957117136) * t1;
+    t6 = (-0.026194772792807703) * t10;
+    t11 = t9 + t6;
+    t1 = t3 + t0;
+    t10 = t7 + t2;
+    t9 = t4 + t5;
+    t6 = t8 + t11;
+    t3 = t3 - t0;
+    t0 = t7 - t2;
+    t7 = t4 - t5;
+    t2 = t8 - t11;
+    t4 = t1 + t9;
+    t5 = t10 + t6;
+    t8 = t3 + t2;
+    t11 = t0 - t7;
+    t1 = t1 - t9;
+    t9 = t10 - t6;
+    t10 = t3 - t2;
+    t6 = t0 + t7;
+    t3 = t8 + t11;
+    t2 = C9 * t3;
+    t0 = t8 * (-C6);
+    t7 = t11 * (-C7);
+    t3 = t2 - t7;
+    t8 = t2 + t0;
+    t11 = t1 - t9;
+    t7 = t1 + t9;
+    t2 = (-C8) * t11;
+    t0 = (-C8) * t7;
+    t1 = t10 + t6;
+    t9 = (-C5) * t1;
+    t11 = t10 * C6;
+    t7 = t6 * (-C7);
+    t1 = t9 - t7;
+    t10 = t9 + t11;
+    re[237] = t4;
+    im[237] = t5;
+    re[57] = t3;
+    im[57] = t8;
+    re[117] = t2;
+    im[117] = t0;
+    re[177] = t1;
+    im[177] = t10;
+    t6 = re[192];
+    t7 = im[192];
+    t9 = re[207];
+    t11 = im[207];
+    t4 = re[222];
+    t5 = im[222];
+    t3 = re[237];
+    t8 = im[237];
+    t2 = t6 + t4;
+    t0 = t7 + t5;
+    t1 = t9 + t3;
+    t10 = t11 + t8;
+    t6 = t6 - t4;
+    t4 = t7 - t5;
+    t7 = t9 - t3;
+    t5 = t11 - t8;
+    t9 = t2 + t1;
+    t3 = t0 + t10;
+    t11 = t6 + t5;
+    t8 = t4 - t7;
+    t2 = t2 - t1;
+    t1 = t0 - t10;
+    t0 = t6 - t5;
+    t10 = t4 + t7;
+    re[192] = t9;
+    im[192] = t3;
+    re[207] = t11;
+    im[207] = t8;
+    re[222] = t2;
+    im[222] = t1;
+    re[237] = t0;
+    im[237] = t10;
+    t6 = re[12];
+    t5 = im[12];
+    t4 = re[27];
+    t7 = im[27];
+    t9 = re[42];
+    t3 = im[42];
+    t11 = re[57];
+    t8 = im[57];
+    t2 = t6 + t9;
+    t1 = t5 + t3;
+    t0 = t4 + t11;
+    t10 = t7 + t8;
+    t6 = t6 - t9;
+    t9 = t5 - t3;
+    t5 = t4 - t11;
+    t3 = t7 - t8;
+    t4 = t2 + t0;
+    t11 = t1 + t10;
+    t7 = t6 + t3;
+    t8 = t9 - t5;
+    t2 = t2 - t0;
+    t0 = t1 - t10;
+    t1 = t6 - t3;
+    t10 = t9 + t5;
+    re[12] = t4;
+    im[12] = t11;
+    re[27] = t7;
+    im[27] = t8;
+    re[42] = t2;
+    im[42] = t0;
+    re[57] = t1;
+    im[57] = t10;
+    t6 = re[72];
+    t3 = im[72];
+    t9 = re[87];
+    t5 = im[87];
+    t4 = re[102];
+    t11 = im[102];
+    t7 = re[117];
+    t8 = im[117];
+    t2 = t6 + t4;
+    t0 = t3 + t11;
+    t1 = t9 + t7;
+    t10 = t5 + t8;
+    t6 = t6 - t4;
+    t4 = t3 - t11;
+    t3 = t9 - t7;
+    t11 = t5 - t8;
+    t9 = t2 + t1;
+    t7 = t0 + t10;
+    t5 = t6 + t11;
+    t8 = t4 - t3;
+    t2 = t2 - t1;
+    t1 = t0 - t10;
+    t0 = t6 - t11;
+    t10 = t4 + t3;
+    re[72] = t9;
+    im[72] = t7;
+    re[87] = t5;
+    im[87] = t8;
+    re[102] = t2;
+    im[102] = t1;
+    re[117] = t0;
+    im[117] = t10;
+    t6 = re[132];
+    t11 = im[132];
+    t4 = re[147];
+    t3 = im[147];
+    t9 = re[162];
+    t7 = im[162];
+    t5 = re[177];
+    t8 = im[177];
+    t2 = t6 + t9;
+    t1 = t11 + t7;
+    t0 = t4 + t5;
+    t10 = t3 + t8;
+    t6 = t6 - t9;
+    t9 = t11 - t7;
+    t11 = t4 - t5;
+    t7 = t3 - t8;
+    t4 = t2 + t0;
+    t5 = t1 + t10;
+    t3 = t6 + t7;
+    t8 = t9 - t11;
+    t2 = t2 - t0;
+    t0 = t1 - t10;
+    t1 = t6 - t7;
+    t10 = t9 + t11;
+    re[132] = t4;
+    im[132] = t5;
+    re[147] = t3;
+    im[147] = t8;
+    re[162] = t2;
+    im[162] = t0;
+    re[177] = t1;
+    im[177] = t10;
+    t6 = re[0];
+    t7 = im[0];
+    t9 = re[48];
+    t11 = im[48];
+    t4 = re[96];
+    t5 = im[96];
+    t3 = re[144];
+    t8 = im[144];
+    t2 = re[192];
+    t0 = im[192];
+    t1 = t9 + t2;
+    t10 = t11 + t0;
+    t12 = t4 + t3;
+    t13 = t5 + t8;
+    t9 = t9 - t2;
+    t2 = t11 - t0;
+    t11 = t4 - t3;
+    t0 = t5 - t8;
+    t4 = t1 + t12;
+    t3 = t10 + t13;
+    t5 = t1 - t12;
+    t8 = C14 * t5;
+    t1 = t10 - t13;
+    t12 = C14 * t1;
+    t5 = C15 * t4;
+    t10 = t6 - t5;
+    t13 = C15 * t3;
+    t1 = t7 - t13;
+    t5 = t10 + t8;
+    t13 = t1 + t12;
+    t10 = t10 - t8;
+    t8 = t1 - t12;
+    t1 = C0 * t9;
+    t12 = C16 * t11;
+    t1 = t1 + t12;
+    t12 = C0 * t2;
+    t14 = C16 * t0;
+    t12 = t12 + t14;
+    t14 = C16 * t9;
+    t9 = C0 * t11;
+    t11 = t14 - t9;
+    t14 = C16 * t2;
+    t9 = C0 * t0;
+    t2 = t14 - t9;
+    t0 = t6 + t4;
+    t14 = t7 + t3;
+    t9 = t5 + t12;
+    t6 = t13 - t1;
+    t4 = t10 + t2;
+    t7 = t8 - t11;
+    t3 = t10 - t2;
+    t10 = t8 + t11;
+    t2 = t5 - t12;
+    t8 = t13 + t1;
+    re[0] = t0;
+    im[0] = t14;
+    re[48] = t9;
+    im[48] = t6;
+    re[96] = t4;
+    im[96] = t7;
+    re[144] = t3;
+    im[144] = t10;
+    re[192] = t2;
+    im[192] = t8;
+    t11 = re[60];
+    t5 = im[60];
+    t12 = re[108];
+    t13 = im[108];
+    t1 = re[156];
+    t0 = im[156];
+    t14 = re[204];
+    t9 = im[204];
+    t6 = re[12];
+    t4 = im[12];
+    t7 = t12 + t6;
+    t3 = t13 + t4;
+    t10 = t1 + t14;
+    t2 = t0 + t9;
+    t8 = t12 - t6;
+    t12 = t13 - t4;
+    t6 = t1 - t14;
+    t13 = t0 - t9;
+    t4 = t7 + t10;
+    t1 = t3 + t2;
+    t14 = t7 - t10;
+    t0 = C14 * t14;
+    t9 = t3 - t2;
+    t7 = C14 * t9;
+    t10 = C15 * t4;
+    t14 = t11 - t10;
+    t3 = C15 * t1;
+    t2 = t5 - t3;
+    t9 = t14 + t0;
+    t10 = t2 + t7;
+    t3 = t14 - t0;
+    t14 = t2 - t7;
+    t0 = C0 * t8;
+    t2 = C16 * t6;
+    t7 = t0 + t2;
+    t0 = C0 * t12;
+    t2 = C16 * t13;
+    t0 = t0 + t2;
+    t2 = C16 * t8;
+    t8 = C0 * t6;
+    t6 = t2 - t8;
+    t2 = C16 * t12;
+    t8 = C0 * t13;
+    t12 = t2 - t8;
+    t13 = t11 + t4;
+    t2 = t5 + t1;
+    t8 = t9 + t0;
+    t11 = t10 - t7;
+    t4 = t3 + t12;
+    t5 = t14 - t6;
+    t1 = t3 - t12;
+    t3 = t14 + t6;
+    t12 = t9 - t0;
+    t14 = t10 + t7;
+    re[60] = t13;
+    im[60] = t2;
+    re[108] = t8;
+    im[108] = t11;
+    re[156] = t4;
+    im[156] = t5;
+    re[204] = t1;
+    im[204] = t3;
+    re[12] = t12;
+    im[12] = t14;
+    t6 = re[120];
+    t9 = im[120];
+    t0 = re[168];
+    t10 = im[168];
+    t7 = re[216];
+    t13 = im[216];
+    t2 = re[24];
+    t8 = im[24];
+    t11 = re[72];
+    t4 = im[72];
+    t5 = t0 + t11;
+    t1 = t10 + t4;
+    t3 = t7 + t2;
+    t12 = t13 + t8;
+    t14 = t0 - t11;
+    t0 = t10 - t4;
+    t11 = t7 - t2;
+    t10 = t13 - t8;
+    t4 = t5 + t3;
+    t7 = t1 + t12;
+    t2 = t5 - t3;
+    t13 = C14 * t2;
+    t8 = t1 - t12;
+    t5 = C14 * t8;
+    t3 = C15 * t4;
+    t2 = t6 - t3;
+    t1 = C15 * t7;
+    t12 = t9 - t1;
+    t8 = t2 + t13;
+    t3 = t12 + t5;
+    t1 = t2 - t13;
+    t2 = t12 - t5;
+    t13 = C0 * t14;
+    t12 = C16 * t11;
+    t5 = t13 + t12;
+    t13 = C0 * t0;
+    t12 = C16 * t10;
+    t13 = t13 + t12;
+    t12 = C16 * t14;
+    t14 = C0 * t11;
+    t11 = t12 - t14;
+    t12 = C16 * t0;
+    t14 = C0 * t10;
+    t0 = t12 - t14;
+    t10 = t6 + t4;
+    t12 = t9 + t7;
+    t14 = t8 + t13;
+    t6 = t3 - t5;
+    t4 = t1 + t0;
+    t9 = t2 - t11;
+    t7 = t1 - t0;
+    t1 = t2 + t11;
+    t0 = t8 - t13;
+    t2 = t3 + t5;
+    re[120] = t10;
+    im[120] = t12;
+    re[168] = t14;
+    im[168] = t6;
+    re[216] = t4;
+    im[216] = t9;
+    re[24] = t7;
+    im[24] = t1;
+    re[72] = t0;
+    im[72] = t2;
+    t11 = re[180];
+    t8 = im[180];
+    t13 = re[228];
+    t3 = im[228];
+    t5 = re[36];
+    t10 = im[36];
+    t12 = re[84];
+    t14 = im[84];
+    t6 = re[132];
+    t4 = im[132];
+    t9 = t13 + t6;
+    t7 = t3 + t4;
+    t1 = t5 + t12;
+    t0 = t10 + t14;
+    t2 = t13 - t6;
+    t13 = t3 - t4;
+    t6 = t5 - t12;
+    t3 = t10 - t14;
+    t4 = t9 + t1;
+    t5 = t7 + t0;
+    t12 = t9 - t1;
+    t10 = C14 * t12;
+    t14 = t7 - t0;
+    t9 = C14 * t14;
+    t1 = C15 * t4;
+    t12 = t11 - t1;
+    t7 = C15 * t5;
+    t0 = t8 - t7;
+    t14 = t12 + t10;
+    t1 = t0 + t9;
+    t7 = t12 - t10;
+    t12 = t0 - t9;
+    t10 = C0 * t2;
+    t0 = C16 * t6;
+    t9 = t10 + t0;
+    t10 = C0 * t13;
+    t0 = C16 * t3;
+    t10 = t10 + t0;
+    t0 = C16 * t2;
+    t2 = C0 * t6;
+    t6 = t0 - t2;
+    t0 = C16 * t13;
+    t2 = C0 * t3;
+    t13 = t0 - t2;
+    t3 = t11 + t4;
+    t0 = t8 + t5;
+    t2 = t14 + t10;
+    t11 = t1 - t9;
+    t4 = t7 + t13;
+    t8 = t12 - t6;
+    t5 = t7 - t13;
+    t7 = t12 + t6;
+    t13 = t14 - t10;
+    t12 = t1 + t9;
+    re[180] = t3;
+    im[180] = t0;
+    re[228] = t2;
+    im[228] = t11;
+    re[36] = t4;
+    im[36] = t8;
+    re[84] = t5;
+    im[84] = t7;
+    re[132] = t13;
+    im[132] = t12;
+    t6 = re[15];
+    t14 = im[15];
+    t10 = re[63];
+    t1 = im[63];
+    t9 = re[111];
+    t3 = im[111];
+    t0 = re[159];
+    t2 = im[159];
+    t11 = re[207];
+    t4 = im[207];
+    t8 = t10 + t11;
+    t5 = t1 + t4;
+    t7 = t9 + t0;
+    t13 = t3 + t2;
+    t12 = t10 - t11;
+    t10 = t1 - t4;
+    t11 = t9 - t0;
+    t1 = t3 - t2;
+    t4 = t8 + t7;
+    t9 = t5 + t13;
+    t0 = t8 - t7;
+    t3 = C14 * t0;
+    t2 = t5 - t13;
+    t8 = C14 * t2;
+    t7 = C15 * t4;
+    t0 = t6 - t7;
+    t5 = C15 * t9;
+    t13 = t14 - t5;
+    t2 = t0 + t3;
+    t7 = t13 + t8;
+    t5 = t0 - t3;
+    t0 = t13 - t8;
+    t3 = C0 * t12;
+    t13 = C16 * t11;
+    t8 = t3 + t13;
+    t3 = C0 * t10;
+    t13 = C16 * t1;
+    t3 = t3 + t13;
+    t13 = C16 * t12;
+    t12 = C0 * t11;
+    t11 = t13 - t12;
+    t13 = C16 * t10;
+    t12 = C0 * t1;
+    t10 = t13 - t12;
+    t1 = t6 + t4;
+    t13 = t14 + t9;
+    t12 = t2 + t3;
+    t6 = t7 - t8;
+    t4 = t5 + t10;
+    t14 = t0 - t11;
+    t9 = t5 - t10;
+    t5 = t0 + t11;
+    t10 = t2 - t3;
+    t0 = t7 + t8;
+    re[15] = t1;
+    im[15] = t13;
+    re[63] = t12;
+    im[63] = t6;
+    re[111] = t4;
+    im[111] = t14;
+    re[159] = t9;
+    im[159] = t5;
+    re[207] = t10;
+    im[207] = t0;
+    t11 = re[75];
+    t2 = im[75];
+    t3 = re[123];
+    t7 = im[123];
+    t8 = re[171];
+    t1 = im[171];
+    t13 = re[219];
+    t12 = im[219];
+    t6 = re[27];
+    t4 = im[27];
+    t14 = t3 + t6;
+    t9 = t7 + t4;
+    t5 = t8 + t13;
+    t10 = t1 + t12;
+    t0 = t3 - t6;
+    t3 = t7 - t4;
+    t6 = t8 - t13;
+    t7 = t1 - t12;
+    t4 = t14 + t5;
+    t8 = t9 + t10;
+    t13 = t14 - t5;
+    t1 = C14 * t13;
+    t12 = t9 - t10;
+    t14 = C14 * t12;
+    t5 = C15 * t4;
+    t13 = t11 - t5;
+    t9 = C15 * t8;
+    t10 = t2 - t9;
+    t12 = t13 + t1;
+    t5 = t10 + t14;
+    t9 = t13 - t1;
+    t13 = t10 - t14;
+    t1 = C0 * t0;
+    t10 = C16 * t6;
+    t14 = t1 + t10;
+    t1 = C0 * t3;
+    t10 = C16 * t7;
+    t1 = t1 + t10;
+    t10 = C16 * t0;
+    t0 = C0 * t6;
+    t6 = t10 - t0;
+    t10 = C16 * t3;
+    t0 = C0 * t7;
+    t3 = t10 - t0;
+    t7 = t11 + t4;
+    t10 = t2 + t8;
+    t0 = t12 + t1;
+    t11 = t5 - t14;
+    t4 = t9 + t3;
+    t2 = t13 - t6;
+    t8 = t9 - t3;
+    t9 = t13 + t6;
+    t3 = t12 - t1;
+    t13 = t5 + t14;
+    re[75] = t7;
+    im[75] = t10;
+    re[123] = t0;
+    im[123] = t11;
+    re[171] = t4;
+    im[171] = t2;
+    re[219] = t8;
+    im[219] = t9;
+    re[27] = t3;
+    im[27] = t13;
+    t6 = re[135];
+    t12 = im[135];
+    t1 = re[183];
+    t5 = im[183];
+    t14 = re[231];
+    t7 = im[231];
+    t10 = re[39];
+    t0 = im[39];
+    t11 = re[87];
+    t4 = im[87];
+    t2 = t1 + t11;
+    t8 = t5 + t4;
+    t9 = t14 + t10;
+    t3 = t7 + t0;
+    t13 = t1 - t11;
+    t1 = t5 - t4;
+    t11 = t14 - t10;
+    t5 = t7 - t0;
+    t4 = t2 + t9;
+    t14 = t8 + t3;
+    t10 = t2 - t9;
+    t7 = C14 * t10;
+    t0 = t8 - t3;
+    t2 = C14 * t0;
+    t9 = C15 * t4;
+    t10 = t6 - t9;
+    t8 = C15 * t14;
+    t3 = t12 - t8;
+    t0 = t10 + t7;
+    t9 = t3 + t2;
+    t8 = t10 - t7;
+    t10 = t3 - t2;
+    t7 = C0 * t13;
+    t3 = C16 * t11;
+    t2 = t7 + t3;
+    t7 = C0 * t1;
+    t3 = C16 * t5;
+    t7 = t7 + t3;
+    t3 = C16 * t13;
+    t13 = C0 * t11;
+    t11 = t3 - t13;
+    t3 = C16 * t1;
+    t13 = C0 * t5;
+    t1 = t3 - t13;
+    t5 = t6 + t4;
+    t3 = t12 + t14;
+    t13 = t0 + t7;
+    t6 = t9 - t2;
+    t4 = t8 + t1;
+    t12 = t10 - t11;
+    t14 = t8 - t1;
+    t8 = t10 + t11;
+    t1 = t0 - t7;
+    t10 = t9 + t2;
+    re[135] = t5;
+    im[135] = t3;
+    re[183] = t13;
+    im[183] = t6;
+    re[231] = t4;
+    im[231] = t12;
+    re[39] = t14;
+    im[39] = t8;
+    re[87] = t1;
+    im[87] = t10;
+    t11 = re[195];
+    t0 = im[195];
+    t7 = re[3];
+    t9 = im[3];
+    t2 = re[51];
+    t5 = im[51];
+    t3 = re[99];
+    t13 = im[99];
+    t6 = re[147];
+    t4 = im[147];
+    t12 = t7 + t6;
+    t14 = t9 + t4;
+    t8 = t2 + t3;
+    t1 = t5 + t13;
+    t10 = t7 - t6;
+    t7 = t9 - t4;
+    t6 = t2 - t3;
+    t9 = t5 - t13;
+    t4 = t12 + t8;
+    t2 = t14 + t1;
+    t3 = t12 - t8;
+    t5 = C14 * t3;
+    t13 = t14 - t1;
+    t12 = C14 * t13;
+    t8 = C15 * t4;
+    t3 = t11 - t8;
+    t14 = C15 * t2;
+    t1 = t0 - t14;
+    t13 = t3 + t5;
+    t8 = t1 + t12;
+    t14 = t3 - t5;
+    t3 = t1 - t12;
+    t5 = C0 * t10;
+    t1 = C16 * t6;
+    t12 = t5 + t1;
+    t5 = C0 * t7;
+    t1 = C16 * t9;
+    t5 = t5 + t1;
+    t1 = C16 * t10;
+    t10 = C0 * t6;
+    t6 = t1 - t10;
+    t1 = C16 * t7;
+    t10 = C0 * t9;
+    t7 = t1 - t10;
+    t9 = t11 + t4;
+    t1 = t0 + t2;
+    t10 = t13 + t5;
+    t11 = t8 - t12;
+    t4 = t14 + t7;
+    t0 = t3 - t6;
+    t2 = t14 - t7;
+    t14 = t3 + t6;
+    t7 = t13 - t5;
+    t3 = t8 + t12;
+    re[195] = t9;
+    im[195] = t1;
+    re[3] = t10;
+    im[3] = t11;
+    re[51] = t4;
+    im[51] = t0;
+    re[99] = t2;
+    im[99] = t14;
+    re[147] = t7;
+    im[147] = t3;
+    t6 = re[30];
+    t13 = im[30];
+    t5 = re[78];
+    t8 = im[78];
+    t12 = re[126];
+    t9 = im[126];
+    t1 = re[174];
+    t10 = im[174];
+    t11 = re[222];
+    t4 = im[222];
+    t0 = t5 + t11;
+    t2 = t8 + t4;
+    t14 = t12 + t1;
+    t7 = t9 + t10;
+    t3 = t5 - t11;
+    t5 = t8 - t4;
+    t11 = t12 - t1;
+    t8 = t9 - t10;
+    t4 = t0 + t14;
+    t12 = t2 + t7;
+    t1 = t0 - t14;
+    t9 = C14 * t1;
+    t10 = t2 - t7;
+    t0 = C14 * t10;
+    t14 = C15 * t4;
+    t1 = t6 - t14;
+    t2 = C15 * t12;
+    t7 = t13 - t2;
+    t10 = t1 + t9;
+    t14 = t7 + t0;
+    t2 = t1 - t9;
+    t1 = t7 - t0;
+    t9 = C0 * t3;
+    t7 = C16 * t11;
+    t0 = t9 + t7;
+    t9 = C0 * t5;
+    t7 = C16 * t8;
+    t9 = t9 + t7;
+    t7 = C16 * t3;
+    t3 = C0 * t11;
+    t11 = t7 - t3;
+    t7 = C16 * t5;
+    t3 = C0 * t8;
+    t5 = t7 - t3;
+    t8 = t6 + t4;
+    t7 = t13 + t12;
+    t3 = t10 + t9;
+    t6 = t14 - t0;
+    t4 = t2 + t5;
+    t13 = t1 - t11;
+    t12 = t2 - t5;
+    t2 = t1 + t11;
+    t5 = t10 - t9;
+    t1 = t14 + t0;
+    re[30] = t8;
+    im[30] = t7;
+    re[78] = t3;
+    im[78] = t6;
+    re[126] = t4;
+    im[126] = t13;
+    re[174] = t12;
+    im[174] = t2;
+    re[222] = t5;
+    im[222] = t1;
+    t11 = re[90];
+    t10 = im[90];
+    t9 = re[138];
+    t14 = im[138];
+    t0 = re[186];
+    t8 = im[186];
+    t7 = re[234];
+    t3 = im[234];
+    t6 = re[42];
+    t4 = im[42];
+    t13 = t9 + t6;
+    t12 = t14 + t4;
+    t2 = t0 + t7;
+    t5 = t8 + t3;
+    t1 = t9 - t6;
+    t9 = t14 - t4;
+    t6 = t0 - t7;
+    t14 = t8 - t3;
+    t4 = t13 + t2;
+    t0 = t12 + t5;
+    t7 = t13 - t2;
+    t8 = C14 * t7;
+    t3 = t12 - t5;
+    t13 = C14 * t3;
+    t2 = C15 * t4;
+    t7 = t11 - t2;
+    t12 = C15 * t0;
+    t5 = t10 - t12;
+    t3 = t7 + t8;
+    t2 = t5 + t13;
+    t12 = t7 - t8;
+    t7 = t5 - t13;
+    t8 = C0 * t1;
+    t5 = C16 * t6;
+    t13 = t8 + t5;
+    t8 = C0 * t9;
+    t5 = C16 * t14;
+    t8 = t8 + t5;
+    t5 = C16 * t1;
+    t1 = C0 * t6;
+    t6 = t5 - t1;
+    t5 = C16 * t9;
+    t1 = C0 * t14;
+    t9 = t5 - t1;
+    t14 = t11 + t4;
+    t5 = t10 + t0;
+    t1 = t3 + t8;
+    t11 = t2 - t13;
+    t4 = t12 + t9;
+    t10 = t7 - t6;
+    t0 = t12 - t9;
+    t12 = t7 + t6;
+    t9 = t3 - t8;
+    t7 = t2 + t13;
+    re[90] = t14;
+    im[90] = t5;
+    re[138] = t1;
+    im[138] = t11;
+    re[186] = t4;
+    im[186] = t10;
+    re[234] = t0;
+    im[234] = t12;
+    re[42] = t9;
+    im[42] = t7;
+    t6 = re[150];
+    t3 = im[150];
+    t8 = re[198];
+    t2 = im[198];
+    t13 = re[6];
+    t14 = im[6];
+    t5 = re[54];
+    t1 = im[54];
+    t11 = re[102];
+    t4 = im[102];
+    t10 = t8 + t11;
+    t0 = t2 + t4;
+    t12 = t13 + t5;
+    t9 = t14 + t1;
+    t7 = t8 - t11;
+    t8 = t2 - t4;
+    t11 = t13 - t5;
+    t2 = t14 - t1;
+    t4 = t10 + t12;
+    t13 = t0 + t9;
+    t5 = t10 - t12;
+    t14 = C14 * t5;
+    t1 = t0 - t9;
+    t10 = C14 * t1;
+    t12 = C15 * t4;
+    t5 = t6 - t12;
+    t0 = C15 * t13;
+    t9 = t3 - t0;
+    t1 = t5 + t14;
+    t12 = t9 + t10;
+    t0 = t5 - t14;
+    t5 = t9 - t10;
+    t14 = C0 * t7;
+    t9 = C16 * t11;
+    t10 = t14 + t9;
+    t14 = C0 * t8;
+    t9 = C16 * t2;
+    t14 = t14 + t9;
+    t9 = C16 * t7;
+    t7 = C0 * t11;
+    t11 = t9 - t7;
+    t9 = C16 * t8;
+    t7 = C0 * t2;
+    t8 = t9 - t7;
+    t2 = t6 + t4;
+    t9 = t3 + t13;
+    t7 = t1 + t14;
+    t6 = t12 - t10;
+    t4 = t0 + t8;
+    t3 = t5 - t11;
+    t13 = t0 - t8;
+    t0 = t5 + t11;
+    t8 = t1 - t14;
+    t5 = t12 + t10;
+    re[150] = t2;
+    im[150] = t9;
+    re[198] = t7;
+    im[198] = t6;
+    re[6] = t4;
+    im[6] = t3;
+    re[54] = t13;
+    im[54] = t0;
+    re[102] = t8;
+    im[102] = t5;
+    t11 = re[210];
+    t1 = im[210];
+    t14 = re[18];
+    t12 = im[18];
+    t10 = re[66];
+    t2 = im[66];
+    t9 = re[114];
+    t7 = im[114];
+    t6 = re[162];
+    t4 = im[162];
+    t3 = t14 + t6;
+    t13 = t12 + t4;
+    t0 = t10 + t9;
+    t8 = t2 + t7;
+    t5 = t14 - t6;
+    t14 = t12 - t4;
+    t6 = t10 - t9;
+    t12 = t2 - t7;
+    t4 = t3 + t0;
+    t10 = t13 + t8;
+    t9 = t3 - t0;
+    t2 = C14 * t9;
+    t7 = t13 - t8;
+    t3 = C14 * t7;
+    t0 = C15 * t4;
+    t9 = t11 - t0;
+    t13 = C15 * t10;
+    t8 = t1 - t13;
+    t7 = t9 + t2;
+    t0 = t8 + t3;
+    t13 = t9 - t2;
+    t9 = t8 - t3;
+    t2 = C0 * t5;
+    t8 = C16 * t6;
+    t3 = t2 + t8;
+    t2 = C0 * t14;
+    t8 = C16 * t12;
+    t2 = t2 + t8;
+    t8 = C16 * t5;
+    t5 = C0 * t6;
+    t6 = t8 - t5;
+    t8 = C16 * t14;
+    t5 = C0 * t12;
+    t14 = t8 - t5;
+    t12 = t11 + t4;
+    t8 = t1 + t10;
+    t5 = t7 + t2;
+    t11 = t0 - t3;
+    t4 = t13 + t14;
+    t1 = t9 - t6;
+    t10 = t13 - t14;
+    t13 = t9 + t6;
+    t14 = t7 - t2;
+    t9 = t0 + t3;
+    re[210] = t12;
+    im[210] = t8;
+    re[18] = t5;
+    im[18] = t11;
+    re[66] = t4;
+    im[66] = t1;
+    re[114] = t10;
+    im[114] = t13;
+    re[162] = t14;
+    im[162] = t9;
+    t6 = re[45];
+    t7 = im[45];
+    t2 = re[93];
+    t0 = im[93];
+    t3 = re[141];
+    t12 = im[141];
+    t8 = re[189];
+    t5 = im[189];
+    t11 = re[237];
+    t4 = im[237];
+    t1 = t2 + t11;
+    t10 = t0 + t4;
+    t13 = t3 + t8;
+    t14 = t12 + t5;
+    t9 = t2 - t11;
+    t2 = t0 - t4;
+    t11 = t3 - t8;
+    t0 = t12 - t5;
+    t4 = t1 + t13;
+    t3 = t10 + t14;
+    t8 = t1 - t13;
+    t12 = C14 * t8;
+    t5 = t10 - t14;
+    t1 = C14 * t5;
+    t13 = C15 * t4;
+    t8 = t6 - t13;
+    t10 = C15 * t3;
+    t14 = t7 - t10;
+    t5 = t8 + t12;
+    t13 = t14 + t1;
+    t10 = t8 - t12;
+    t8 = t14 - t1;
+    t12 = C0 * t9;
+    t14 = C16 * t11;
+    t1 = t12 + t14;
+    t12 = C0 * t2;
+    t14 = C16 * t0;
+    t12 = t12 + t14;
+    t14 = C16 * t9;
+    t9 = C0 * t11;
+    t11 = t14 - t9;
+    t14 = C16 * t2;
+    t9 = C0 * t0;
+    t2 = t14 - t9;
+    t0 = t6 + t4;
+    t14 = t7 + t3;
+    t9 = t5 + t12;
+    t6 = t13 - t1;
+    t4 = t10 + t2;
+    t7 = t8 - t11;
+    t3 = t10 - t2;
+    t10 = t8 + t11;
+    t2 = t5 - t12;
+    t8 = t13 + t1;
+    re[45] = t0;
+    im[45] = t14;
+    re[93] = t9;
+    im[93] = t6;
+    re[141] = t4;
+    im[141] = t7;
+    re[189] = t3;
+    im[189] = t10;
+    re[237] = t2;
+    im[237] = t8;
+    t11 = re[105];
+    t5 = im[105];
+    t12 = re[153];
+    t13 = im[153];
+    t1 = re[201];
+    t0 = im[201];
+    t14 = re[9];
+    t9 = im[9];
+    t6 = re[57];
+    t4 = im[57];
+    t7 = t12 + t6;
+    t3 = t13 + t4;
+    t10 = t1 + t14;
+    t2 = t0 + t9;
+    t8 = t12 - t6;
+    t12 = t13 - t4;
+    t6 = t1 - t14;
+    t13 = t0 - t9;
+    t4 = t7 + t10;
+    t1 = t3 + t2;
+    t14 = t7 - t10;
+    t0 = C14 * t14;
+    t9 = t3 - t2;
+    t7 = C14 * t9;
+    t10 = C15 * t4;
+    t14 = t11 - t10;
+    t3 = C15 * t1;
+    t2 = t5 - t3;
+    t9 = t14 + t0;
+    t10 = t2 + t7;
+    t3 = t14 - t0;
+    t14 = t2 - t7;
+    t0 = C0 * t8;
+    t2 = C16 * t6;
+    t7 = t0 + t2;
+    t0 = C0 * t12;
+    t2 = C16 * t13;
+    t0 = t0 + t2;
+    t2 = C16 * t8;
+    t8 = C0 * t6;
+    t6 = t2 - t8;
+    t2 = C16 * t12;
+    t8 = C0 * t13;
+    t12 = t2 - t8;
+    t13 = t11 + t4;
+    t2 = t5 + t1;
+    t8 = t9 + t0;
+    t11 = t10 - t7;
+    t4 = t3 + t12;
+    t5 = t14 - t6;
+    t1 = t3 - t12;
+    t3 = t14 + t6;
+    t12 = t9 - t0;
+    t14 = t10 + t7;
+    re[105] = t13;
+    im[105] = t2;
+    re[153] = t8;
+    im[153] = t11;
+    re[201] = t4;
+    im[201] = t5;
+    re[9] = t1;
+    im[9] = t3;
+    re[57] = t12;
+    im[57] = t14;
+    t6 = re[165];
+    t9 = im[165];
+    t0 = re[213];
+    t10 = im[213];
+    t7 = re[21];
+    t13 = im[21];
+    t2 = re[69];
+    t8 = im[69];
+    t11 = re[117];
+    t4 = im[117];
+    t5 = t0 + t11;
+    t1 = t10 + t4;
+    t3 = t7 + t2;
+    t12 = t13 + t8;
+    t14 = t0 - t11;
+    t0 = t10 - t4;
+    t11 = t7 - t2;
+    t10 = t13 - t8;
+    t4 = t5 + t3;
+    t7 = t1 + t12;
+    t2 = t5 - t3;
+    t13 = C14 * t2;
+    t8 = t1 - t12;
+    t5 = C14 * t8;
+    t3 = C15 * t4;
+    t2 = t6 - t3;
+    t1 = C15 * t7;
+    t12 = t9 - t1;
+    t8 = t2 + t13;
+    t3 = t12 + t5;
+    t1 = t2 - t13;
+    t2 = t12 - t5;
+    t13 = C0 * t14;
+    t12 = C16 * t11;
+    t5 = t13 + t12;
+    t13 = C0 * t0;
+    t12 = C16 * t10;
+    t13 = t13 + t12;
+    t12 = C16 * t14;
+    t14 = C0 * t11;
+    t11 = t12 - t14;
+    t12 = C16 * t0;
+    t14 = C0 * t10;
+    t0 = t12 - t14;
+    t10 = t6 + t4;
+    t12 = t9 + t7;
+    t14 = t8 + t13;
+    t6 = t3 - t5;
+    t4 = t1 + t0;
+    t9 = t2 - t11;
+    t7 = t1 - t0;
+    t1 = t2 + t11;
+    t0 = t8 - t13;
+    t2 = t3 + t5;
+    re[165] = t10;
+    im[165] = t12;
+    re[213] = t14;
+    im[213] = t6;
+    re[21] = t4;
+    im[21] = t9;
+    re[69] = t7;
+    im[69] = t1;
+    re[117] = t0;
+    im[117] = t2;
+    t11 = re[225];
+    t8 = im[225];
+    t13 = re[33];
+    t3 = im[33];
+    t5 = re[81];
+    t10 = im[81];
+    t12 = re[129];
+    t14 = im[129];
+    t6 = re[177];
+    t4 = im[177];
+    t9 = t13 + t6;
+    t7 = t3 + t4;
+    t1 = t5 + t12;
+    t0 = t10 + t14;
+    t2 = t13 - t6;
+    t13 = t3 - t4;
+    t6 = t5 - t12;
+    t3 = t10 - t14;
+    t4 = t9 + t1;
+    t5 = t7 + t0;
+    t12 = t9 - t1;
+    t10 = C14 * t12;
+    t14 = t7 - t0;
+    t9 = C14 * t14;
+    t1 = C15 * t4;
+    t12 = t11 - t1;
+    t7 = C15 * t5;
+    t0 = t8 - t7;
+    t14 = t12 + t10;
+    t1 = t0 + t9;
+    t7 = t12 - t10;
+    t12 = t0 - t9;
+    t10 = C0 * t2;
+    t0 = C16 * t6;
+    t9 = t10 + t0;
+    t10 = C0 * t13;
+    t0 = C16 * t3;
+    t10 = t10 + t0;
+    t0 = C16 * t2;
+    t2 = C0 * t6;
+    t6 = t0 - t2;
+    t0 = C16 * t13;
+    t2 = C0 * t3;
+    t13 = t0 - t2;
+    t3 = t11 + t4;
+    t0 = t8 + t5;
+    t2 = t14 + t10;
+    t11 = t1 - t9;
+    t4 = t7 + t13;
+    t8 = t12 - t6;
+    t5 = t7 - t13;
+    t7 = t12 + t6;
+    t13 = t14 - t10;
+    t12 = t1 + t9;
+    re[225] = t3;
+    im[225] = t0;
+    re[33] = t2;
+    im[33] = t11;
+    re[81] = t4;
+    im[81] = t8;
+    re[129] = t5;
+    im[129] = t7;
+    re[177] = t13;
+    im[177] = t12;
+}
+
+/**
+ *  Part 3 of ApplyWindowedMDCT_W10_480().
+ * 
+ *  @param {Number[]} x 
+ *    - The input block (960 points).
+ *  @param {Number[]} X 
+ *    - The array that would contain the output block (480 points).
+ *  @param {Number[]} re 
+ *    - The scratch buffer (real part, 240 points).
+ *  @param {Number[]} im 
+ *    - The scratch buffer (imaginary part, 240 points).
+ */
+function ApplyWindowedMDCT_W10_480_Part3(x, X, re, im) {
+    let t0, t1, t10, t11, t12, t13, t14, t2, t3, t4, t5, t6, t7, t8, t9;
+    const C0 = 0.9914448613738104;
+    const C1 = 0.13052619222005157;
+    const C2 = 0.16289547339458874;
+    const C3 = 0.986643332084879;
+    const C4 = 0.9238795325112867;
+    const C5 = 1.3065629648763766;
+    const C6 = 0.5411961001461969;
+    const C7 = 0.7071067811865476;
+    const C8 = 0.3826834323650898;
+    const C9 = 0.06540312923014306;
+    const C10 = 0.9978589232386035;
+    const C11 = 0.9994645874763657;
+    const C12 = 0.03271908282177614;
+    const C13 = 0.9986295347545738;
+    const C14 = 0.05233595624294383;
+    const C15 = 0.9886910398241674;
+    const C16 = 0.149966755554045;
+    const C17 = 0.1434926219911793;
+    const C18 = 0.9896513868196702;
+    const C19 = 0.04579886693652077;
+    const C20 = 0.9989506813588601;
+    const C21 = 0.02617694830787315;
+    const C22 = 0.9996573249755573;
+    const C23 = 0.9974094913373519;
+    const C24 = 0.07193265315671939;
+    const C25 = 0.9855560590580777;
+    const C26 = 0.1693495038490246;
+    const C27 = 0.12403445145048532;
+    const C28 = 0.992277912105967;
+    const C29 = 0.10452846326765346;
+    const C30 = 0.9945218953682733;
+    const C31 = 0.006544937967351858;
+    const C32 = 0.9999785816641292;
+    const C33 = 0.9958049275746618;
+    const C34 = 0.09150161866340238;
+    const C35 = 0.9820411276703039;
+    const C36 = 0.18866696468655522;
+    t6 = x[559];
+    t14 = x[79];
+    t10 = (-0.0061292399876755185) * t14;
+    t1 = x[400];
+    t9 = 0.06388338863652754 * t1;
+    t3 = t10 - t9;
+    t0 = (-0.0564847804640706) * t6;
+    t2 = 0.49999999999999994 * t3;
+    t11 = t0 + t2;
+    t4 = 0.03261150320604807 * t6;
+    t8 = 0.8660254037844387 * t3;
+    t5 = t4 + t8;
+    t7 = x[40];
+    t13 = (-0.0019499585127337403) * t7;
+    t12 = x[439];
+    t14 = 0.06396775887253293 * t12;
+    t1 = t13 - t14;
+    t10 = x[520];
+    t9 = 0.6087614290087207 * t1;
+    t0 = (-0.051676641110207026) * t10;
+    t2 = t9 + t0;
+    t6 = (-0.7933533402912352) * t1;
+    t3 = (-0.039652881371964877) * t10;
+    t4 = t6 + t3;
+    t8 = x[160];
+    t7 = 0.0038427993091844884 * t8;
+    t12 = x[319];
+    t13 = 0.06429929133135662 * t12;
+    t14 = t7 - t13;
+    t9 = x[640];
+    t0 = 0.25881904510252074 * t14;
+    t1 = (-0.0625930839910892) * t9;
+    t10 = t0 + t1;
+    t6 = (-0.9659258262890683) * t14;
+    t3 = (-0.016771766307185784) * t9;
+    t8 = t6 + t3;
+    t12 = x[679];
+    t7 = 0.06057755304458336 * t12;
+    t13 = x[760];
+    t0 = 0.00539962122791882 * t13;
+    t1 = t7 + t0;
+    t14 = x[199];
+    t9 = 0.027508326665627986 * t14;
+    t6 = x[280];
+    t3 = 0.06633038015089819 * t6;
+    t12 = t9 - t3;
+    t13 = (-C0) * t1;
+    t7 = C1 * t12;
+    t0 = t13 + t7;
+    t14 = C1 * t1;
+    t6 = C0 * t12;
+    t9 = t14 + t6;
+    t3 = t11 + t10;
+    t13 = t5 + t8;
+    t7 = t2 + t0;
+    t1 = t4 + t9;
+    t12 = t11 - t10;
+    t14 = t5 - t8;
+    t6 = t2 - t0;
+    t11 = t4 - t9;
+    t10 = t3 + t7;
+    t5 = t13 + t1;
+    t8 = t12 + t11;
+    t2 = t14 - t6;
+    t0 = t3 - t7;
+    t4 = t13 - t1;
+    t9 = t12 - t11;
+    t3 = t14 + t6;
+    re[80] = t10;
+    im[80] = t5;
+    re[140] = t8;
+    im[140] = t2;
+    re[200] = t0;
+    im[200] = t4;
+    re[20] = t9;
+    im[20] = t3;
+    t7 = x[529];
+    t13 = x[49];
+    t1 = (-0.0028871141740734983) * t13;
+    t12 = x[430];
+    t11 = 0.06392915612314413 * t12;
+    t14 = t1 - t11;
+    t6 = (-0.052978349648076406) * t7;
+    t10 = 0.5824776968678022 * t14;
+    t5 = t6 + t10;
+    t8 = 0.03796374848028383 * t7;
+    t2 = 0.8128466845916152 * t14;
+    t0 = t8 + t2;
+    t4 = x[70];
+    t9 = (-0.005262715635805177) * t4;
+    t3 = x[409];
+    t13 = 0.06390042187321478 * t3;
+    t12 = t9 - t13;
+    t1 = x[550];
+    t11 = 0.528067850650368 * t12;
+    t6 = (-0.05537275528552627) * t1;
+    t10 = t11 + t6;
+    t7 = (-0.8492021815265789) * t12;
+    t14 = (-0.03443299193562125) * t1;
+    t8 = t7 + t14;
+    t2 = x[190];
+    t4 = 0.02091472784034726 * t2;
+    t3 = x[289];
+    t9 = 0.06601864913882413 * t3;
+    t13 = t4 - t9;
+    t11 = x[670];
+    t6 = 0.062441089406128296 * t11;
+    t12 = x[769];
+    t1 = 0.0021224418341173794 * t12;
+    t7 = t6 + t1;
+    t14 = C2 * t13;
+    t2 = (-C3) * t7;
+    t3 = t14 + t2;
+    t4 = (-C3) * t13;
+    t9 = (-C2) * t7;
+    t11 = t4 + t9;
+    t12 = x[649];
+    t6 = x[169];
+    t1 = 0.00804400171606616 * t6;
+    t14 = x[310];
+    t2 = 0.06469463715336674 * t14;
+    t13 = t1 - t2;
+    t7 = (-0.06272267571992589) * t12;
+    t4 = 0.22707626303437323 * t13;
+    t9 = t7 + t4;
+    t6 = 0.014624876768897947 * t12;
+    t14 = 0.9738769792773336 * t13;
+    t1 = t6 + t14;
+    t2 = t5 + t3;
+    t7 = t0 + t11;
+    t4 = t10 + t9;
+    t12 = t8 + t1;
+    t13 = t5 - t3;
+    t6 = t0 - t11;
+    t14 = t10 - t9;
+    t5 = t8 - t1;
+    t3 = t2 + t4;
+    t0 = t7 + t12;
+    t11 = t13 + t5;
+    t10 = t6 - t14;
+    t9 = t2 - t4;
+    t8 = t7 - t12;
+    t1 = t13 - t5;
+    t2 = t6 + t14;
+    t4 = t11 + t10;
+    t7 = C4 * t4;
+    t12 = t11 * (-C5);
+    t13 = t10 * C6;
+    t5 = t7 - t13;
+    t6 = t7 + t12;
+    t14 = t9 + t8;
+    t4 = t9 - t8;
+    t11 = C7 * t14;
+    t10 = (-C7) * t4;
+    t13 = t1 + t2;
+    t7 = C8 * t13;
+    t12 = t1 * (-C5);
+    t9 = t2 * (-C6);
+    t8 = t7 - t9;
+    t14 = t7 + t12;
+    re[95] = t3;
+    im[95] = t0;
+    re[155] = t5;
+    im[155] = t6;
+    re[215] = t11;
+    im[215] = t10;
+    re[35] = t8;
+    im[35] = t14;
+    t4 = x[499];
+    t13 = x[19];
+    t1 = (-0.0004632014029183742) * t13;
+    t2 = x[460];
+    t9 = 0.0641925571027167 * t2;
+    t7 = t1 - t9;
+    t12 = (-0.04880107610424452) * t4;
+    t3 = 0.6593458151000688 * t7;
+    t0 = t12 + t3;
+    t5 = 0.04279739511214071 * t4;
+    t6 = 0.7518398074789774 * t7;
+    t11 = t5 + t6;
+    t10 = x[100];
+    t8 = (-0.007132088987455223) * t10;
+    t14 = x[379];
+    t13 = 0.06379988187832196 * t14;
+    t2 = t8 - t13;
+    t1 = x[580];
+    t9 = 0.4422886902190013 * t2;
+    t12 = (-0.05857330211854132) * t1;
+    t3 = t9 + t12;
+    t4 = (-0.8968727415326883) * t2;
+    t7 = (-0.028885156027308352) * t1;
+    t5 = t4 + t7;
+    t6 = x[220];
+    t10 = 0.04364628566097206 * t6;
+    t14 = x[259];
+    t8 = 0.064166020687882 * t14;
+    t13 = t10 - t8;
+    t9 = x[700];
+    t12 = 0.05160544713305959 * t9;
+    t2 = x[739];
+    t1 = 0.019597325760166824 * t2;
+    t4 = t12 + t1;
+    t7 = C9 * t13;
+    t6 = (-C10) * t4;
+    t14 = t7 + t6;
+    t10 = (-C10) * t13;
+    t8 = (-C9) * t4;
+    t9 = t10 + t8;
+    t2 = x[619];
+    t12 = x[139];
+    t1 = (-0.002985074088911769) * t12;
+    t7 = x[340];
+    t6 = 0.06383035680828042 * t7;
+    t13 = t1 - t6;
+    t4 = (-0.06181294298699223) * t2;
+    t10 = 0.3214394653031616 * t13;
+    t8 = t4 + t10;
+    t12 = 0.02098266674981355 * t2;
+    t7 = 0.9469301294951057 * t13;
+    t1 = t12 + t7;
+    t6 = t0 + t14;
+    t4 = t11 + t9;
+    t10 = t3 + t8;
+    t2 = t5 + t1;
+    t13 = t0 - t14;
+    t12 = t11 - t9;
+    t7 = t3 - t8;
+    t0 = t5 - t1;
+    t14 = t6 + t10;
+    t11 = t4 + t2;
+    t9 = t13 + t0;
+    t3 = t12 - t7;
+    t8 = t6 - t10;
+    t5 = t4 - t2;
+    t1 = t13 - t0;
+    t6 = t12 + t7;
+    t10 = t9 + t3;
+    t4 = t9 - t3;
+    t2 = C7 * t10;
+    t13 = (-C7) * t4;
+    t0 = -t8;
+    t12 = t1 - t6;
+    t7 = t1 + t6;
+    t9 = (-C7) * t12;
+    t3 = (-C7) * t7;
+    re[110] = t14;
+    im[110] = t11;
+    re[170] = t2;
+    im[170] = t13;
+    re[230] = t5;
+    im[230] = t0;
+    re[50] = t9;
+    im[50] = t3;
+    t10 = x[10];
+    t4 = (-0.00016764253061409248) * t10;
+    t8 = x[469];
+    t1 = 0.06434614119621296 * t8;
+    t6 = t4 - t1;
+    t12 = x[490];
+    t7 = 0.6835923020228712 * t6;
+    t14 = (-0.04726158004773456) * t12;
+    t11 = t7 + t14;
+    t2 = (-0.7298640726978356) * t6;
+    t13 = (-0.04426530022590174) * t12;
+    t5 = t2 + t13;
+    t0 = x[130];
+    t9 = (-0.004801715457604423) * t0;
+    t3 = x[349];
+    t10 = 0.06375766803440165 * t3;
+    t8 = t9 - t10;
+    t4 = x[610];
+    t1 = 0.3522500479212335 * t8;
+    t7 = (-0.06116296515191577) * t4;
+    t14 = t1 + t7;
+    t6 = (-0.9359059267573258) * t8;
+    t12 = (-0.023020110023679177) * t4;
+    t2 = t6 + t12;
+    t13 = x[709];
+    t0 = 0.04546762605662681 * t13;
+    t3 = x[730];
+    t9 = 0.027509626239848872 * t3;
+    t10 = t0 + t9;
+    t1 = x[229];
+    t7 = 0.05005367438834188 * t1;
+    t8 = x[250];
+    t4 = 0.061355936833779226 * t8;
+    t6 = t7 - t4;
+    t12 = (-C11) * t10;
+    t13 = C12 * t6;
+    t3 = t12 + t13;
+    t0 = C12 * t10;
+    t9 = C11 * t6;
+    t1 = t0 + t9;
+    t8 = x[589];
+    t7 = x[109];
+    t4 = (-0.0069638454177599575) * t7;
+    t12 = x[370];
+    t13 = 0.06376080812550963 * t12;
+    t10 = t4 - t13;
+    t6 = (-0.05952349176159737) * t8;
+    t0 = 0.41270702980439467 * t10;
+    t9 = t6 + t0;
+    t7 = 0.02696974324415735 * t8;
+    t12 = 0.9108638249211758 * t10;
+    t4 = t7 + t12;
+    t13 = t11 + t3;
+    t6 = t5 + t1;
+    t0 = t14 + t9;
+    t8 = t2 + t4;
+    t10 = t11 - t3;
+    t7 = t5 - t1;
+    t12 = t14 - t9;
+    t11 = t2 - t4;
+    t3 = t13 + t0;
+    t5 = t6 + t8;
+    t1 = t10 + t11;
+    t14 = t7 - t12;
+    t9 = t13 - t0;
+    t2 = t6 - t8;
+    t4 = t10 - t11;
+    t13 = t7 + t12;
+    t0 = t1 + t14;
+    t6 = C8 * t0;
+    t8 = t1 * (-C5);
+    t10 = t14 * (-C6);
+    t11 = t6 - t10;
+    t7 = t6 + t8;
+    t12 = t9 - t2;
+    t0 = t9 + t2;
+    t1 = (-C7) * t12;
+    t14 = (-C7) * t0;
+    t10 = t4 + t13;
+    t6 = (-C4) * t10;
+    t8 = t4 * C5;
+    t9 = t13 * (-C6);
+    t2 = t6 - t9;
+    t12 = t6 + t8;
+    re[125] = t3;
+    im[125] = t5;
+    re[185] = t11;
+    im[185] = t7;
+    re[5] = t1;
+    im[5] = t14;
+    re[65] = t2;
+    im[65] = t12;
+    t0 = re[80];
+    t10 = im[80];
+    t4 = re[95];
+    t13 = im[95];
+    t9 = re[110];
+    t6 = im[110];
+    t8 = re[125];
+    t3 = im[125];
+    t5 = t0 + t9;
+    t11 = t10 + t6;
+    t7 = t4 + t8;
+    t1 = t13 + t3;
+    t14 = t0 - t9;
+    t2 = t10 - t6;
+    t12 = t4 - t8;
+    t0 = t13 - t3;
+    t9 = t5 + t7;
+    t10 = t11 + t1;
+    t6 = t14 + t0;
+    t4 = t2 - t12;
+    t8 = t5 - t7;
+    t13 = t11 - t1;
+    t3 = t14 - t0;
+    t5 = t2 + t12;
+    re[80] = t9;
+    im[80] = t10;
+    re[95] = t6;
+    im[95] = t4;
+    re[110] = t8;
+    im[110] = t13;
+    re[125] = t3;
+    im[125] = t5;
+    t7 = re[140];
+    t11 = im[140];
+    t1 = re[155];
+    t14 = im[155];
+    t0 = re[170];
+    t2 = im[170];
+    t12 = re[185];
+    t9 = im[185];
+    t10 = t7 + t0;
+    t6 = t11 + t2;
+    t4 = t1 + t12;
+    t8 = t14 + t9;
+    t13 = t7 - t0;
+    t3 = t11 - t2;
+    t5 = t1 - t12;
+    t7 = t14 - t9;
+    t0 = t10 + t4;
+    t11 = t6 + t8;
+    t2 = t13 + t7;
+    t1 = t3 - t5;
+    t12 = t10 - t4;
+    t14 = t6 - t8;
+    t9 = t13 - t7;
+    t10 = t3 + t5;
+    re[140] = t0;
+    im[140] = t11;
+    re[155] = t2;
+    im[155] = t1;
+    re[170] = t12;
+    im[170] = t14;
+    re[185] = t9;
+    im[185] = t10;
+    t4 = re[200];
+    t6 = im[200];
+    t8 = re[215];
+    t13 = im[215];
+    t7 = re[230];
+    t3 = im[230];
+    t5 = re[5];
+    t0 = im[5];
+    t11 = t4 + t7;
+    t2 = t6 + t3;
+    t1 = t8 + t5;
+    t12 = t13 + t0;
+    t14 = t4 - t7;
+    t9 = t6 - t3;
+    t10 = t8 - t5;
+    t4 = t13 - t0;
+    t7 = t11 + t1;
+    t6 = t2 + t12;
+    t3 = t14 + t4;
+    t8 = t9 - t10;
+    t5 = t11 - t1;
+    t13 = t2 - t12;
+    t0 = t14 - t4;
+    t11 = t9 + t10;
+    re[200] = t7;
+    im[200] = t6;
+    re[215] = t3;
+    im[215] = t8;
+    re[230] = t5;
+    im[230] = t13;
+    re[5] = t0;
+    im[5] = t11;
+    t1 = re[20];
+    t2 = im[20];
+    t12 = re[35];
+    t14 = im[35];
+    t4 = re[50];
+    t9 = im[50];
+    t10 = re[65];
+    t7 = im[65];
+    t6 = t1 + t4;
+    t3 = t2 + t9;
+    t8 = t12 + t10;
+    t5 = t14 + t7;
+    t13 = t1 - t4;
+    t0 = t2 - t9;
+    t11 = t12 - t10;
+    t1 = t14 - t7;
+    t4 = t6 + t8;
+    t2 = t3 + t5;
+    t9 = t13 + t1;
+    t12 = t0 - t11;
+    t10 = t6 - t8;
+    t14 = t3 - t5;
+    t7 = t13 - t1;
+    t6 = t0 + t11;
+    re[20] = t4;
+    im[20] = t2;
+    re[35] = t9;
+    im[35] = t12;
+    re[50] = t10;
+    im[50] = t14;
+    re[65] = t7;
+    im[65] = t6;
+    t8 = x[16];
+    t3 = (-0.00034370201507132975) * t8;
+    t5 = x[463];
+    t13 = 0.06424063664024714 * t5;
+    t1 = t3 - t13;
+    t0 = x[496];
+    t11 = 0.6691306063588582 * t1;
+    t4 = (-0.04820059287648059) * t0;
+    t2 = t11 + t4;
+    t9 = (-0.7431448254773942) * t1;
+    t12 = (-0.04340000876353678) * t0;
+    t10 = t9 + t12;
+    t14 = x[136];
+    t7 = (-0.003657164990575806) * t14;
+    t6 = x[343];
+    t8 = 0.0637995160127003 * t6;
+    t5 = t7 - t8;
+    t3 = x[616];
+    t13 = 0.33380685923377096 * t5;
+    t11 = (-0.06156273785476489) * t3;
+    t4 = t13 + t11;
+    t1 = (-0.9426414910921784) * t5;
+    t0 = (-0.021800508850210912) * t3;
+    t9 = t1 + t0;
+    t12 = x[703];
+    t14 = 0.049706070145883165 * t12;
+    t6 = x[736];
+    t7 = 0.022174305731326876 * t6;
+    t8 = t14 + t7;
+    t13 = x[223];
+    t11 = 0.04585225338316315 * t13;
+    t5 = x[256];
+    t3 = 0.06337102837607919 * t5;
+    t1 = t11 - t3;
+    t0 = (-C13) * t8;
+    t12 = C14 * t1;
+    t6 = t0 + t12;
+    t14 = C14 * t8;
+    t7 = C13 * t1;
+    t13 = t14 + t7;
+    t5 = x[583];
+    t11 = x[103];
+    t3 = (-0.007121292166469594) * t11;
+    t0 = x[376];
+    t12 = 0.06378595726136826 * t0;
+    t8 = t3 - t12;
+    t1 = (-0.05895924713827438) * t5;
+    t14 = 0.4305110968082951 * t8;
+    t7 = t1 + t14;
+    t11 = 0.028122118311260894 * t5;
+    t0 = 0.9025852843498606 * t8;
+    t3 = t11 + t0;
+    t12 = t2 + t6;
+    t1 = t10 + t13;
+    t14 = t4 + t7;
+    t5 = t9 + t3;
+    t8 = t2 - t6;
+    t11 = t10 - t13;
+    t0 = t4 - t7;
+    t2 = t9 - t3;
+    t6 = t12 + t14;
+    t10 = t1 + t5;
+    t13 = t8 + t2;
+    t4 = t11 - t0;
+    t7 = t12 - t14;
+    t9 = t1 - t5;
+    t3 = t8 - t2;
+    t12 = t11 + t0;
+    re[128] = t6;
+    im[128] = t10;
+    re[188] = t13;
+    im[188] = t4;
+    re[8] = t7;
+    im[8] = t9;
+    re[68] = t3;
+    im[68] = t12;
+    t14 = x[46];
+    t1 = (-0.0025607313781491553) * t14;
+    t5 = x[433];
+    t8 = 0.06393895187138858 * t5;
+    t2 = t1 - t8;
+    t11 = x[526];
+    t0 = 0.5930676289532372 * t2;
+    t6 = (-0.05246884104533547) * t11;
+    t10 = t0 + t6;
+    t13 = (-0.8051526485628582) * t2;
+    t4 = (-0.03864803923606798) * t11;
+    t7 = t13 + t4;
+    t9 = x[166];
+    t3 = 0.006553301740878292 * t9;
+    t12 = x[313];
+    t14 = 0.06454580536107146 * t12;
+    t5 = t3 - t14;
+    t1 = x[646];
+    t8 = 0.23980446465501654 * t5;
+    t0 = (-0.06267004255066876) * t1;
+    t6 = t8 + t0;
+    t2 = (-0.9708212084269281) * t5;
+    t11 = (-0.015480251021835189) * t1;
+    t13 = t2 + t11;
+    t4 = x[673];
+    t9 = 0.061919577878109915 * t4;
+    t12 = x[766];
+    t3 = 0.0030186925647621736 * t12;
+    t14 = t9 + t3;
+    t8 = x[193];
+    t0 = 0.023058291641532877 * t8;
+    t5 = x[286];
+    t1 = 0.06616745322775633 * t5;
+    t2 = t0 - t1;
+    t11 = (-C15) * t14;
+    t4 = C16 * t2;
+    t12 = t11 + t4;
+    t9 = C16 * t14;
+    t3 = C15 * t2;
+    t8 = t9 + t3;
+    t5 = x[553];
+    t0 = x[73];
+    t1 = (-0.005571375328374209) * t0;
+    t11 = x[406];
+    t4 = 0.06389599747119415 * t11;
+    t14 = t1 - t4;
+    t2 = (-0.055822590406953594) * t5;
+    t9 = 0.5169068966820275 * t14;
+    t3 = t2 + t9;
+    t0 = 0.03370756888404613 * t5;
+    t11 = 0.8560416229147715 * t14;
+    t1 = t0 + t11;
+    t4 = t10 + t12;
+    t2 = t7 + t8;
+    t9 = t6 + t3;
+    t5 = t13 + t1;
+    t14 = t10 - t12;
+    t0 = t7 - t8;
+    t11 = t6 - t3;
+    t10 = t13 - t1;
+    t12 = t4 + t9;
+    t7 = t2 + t5;
+    t8 = t14 + t10;
+    t6 = t0 - t11;
+    t3 = t4 - t9;
+    t13 = t2 - t5;
+    t1 = t14 - t10;
+    t4 = t0 + t11;
+    t9 = t8 + t6;
+    t2 = C4 * t9;
+    t5 = t8 * (-C5);
+    t14 = t6 * C6;
+    t10 = t2 - t14;
+    t0 = t2 + t5;
+    t11 = t3 + t13;
+    t9 = t3 - t13;
+    t8 = C7 * t11;
+    t6 = (-C7) * t9;
+    t14 = t1 + t4;
+    t2 = C8 * t14;
+    t5 = t1 * (-C5);
+    t3 = t4 * (-C6);
+    t13 = t2 - t3;
+    t11 = t2 + t5;
+    re[143] = t12;
+    im[143] = t7;
+    re[203] = t10;
+    im[203] = t0;
+    re[23] = t8;
+    im[23] = t6;
+    re[83] = t13;
+    im[83] = t11;
+    t9 = x[76];
+    t14 = (-0.005861380284618081) * t9;
+    t1 = x[403];
+    t4 = 0.06389040637691885 * t1;
+    t3 = t14 - t4;
+    t2 = x[556];
+    t5 = 0.5112930860770522 * t3;
+    t12 = (-0.056046913002831426) * t2;
+    t7 = t5 + t12;
+    t10 = (-0.8594064115014527) * t3;
+    t0 = (-0.03334440926993399) * t2;
+    t8 = t10 + t0;
+    t6 = x[196];
+    t13 = 0.025259254532999657 * t6;
+    t11 = x[283];
+    t9 = 0.06627569639906315 * t11;
+    t1 = t13 - t9;
+    t14 = x[676];
+    t4 = 0.061302768645727056 * t14;
+    t5 = x[763];
+    t12 = 0.004108711258476244 * t5;
+    t3 = t4 + t12;
+    t2 = C17 * t1;
+    t10 = (-C18) * t3;
+    t0 = t2 + t10;
+    t6 = (-C18) * t1;
+    t11 = (-C17) * t3;
+    t13 = t6 + t11;
+    t9 = x[643];
+    t14 = x[163];
+    t5 = 0.005153232970672424 * t14;
+    t4 = x[316];
+    t12 = 0.0644145257260093 * t4;
+    t2 = t5 - t12;
+    t10 = (-0.06269489805693768) * t9;
+    t1 = 0.24615329302899303 * t2;
+    t3 = t10 + t1;
+    t6 = 0.015922475705506978 * t9;
+    t11 = 0.9692309097067544 * t2;
+    t14 = t6 + t11;
+    t4 = x[523];
+    t5 = x[43];
+    t12 = (-0.0022473617120944145) * t5;
+    t10 = x[436];
+    t1 = 0.06395166168229635 * t10;
+    t9 = t12 - t1;
+    t2 = (-0.05220439102059526) * t4;
+    t6 = 0.598324600570659 * t9;
+    t11 = t2 + t6;
+    t5 = 0.03898286773890896 * t4;
+    t10 = 0.8012538126910607 * t9;
+    t12 = t5 + t10;
+    t1 = t7 + t3;
+    t2 = t8 + t14;
+    t6 = t0 + t11;
+    t4 = t13 + t12;
+    t9 = t7 - t3;
+    t5 = t8 - t14;
+    t10 = t0 - t11;
+    t7 = t13 - t12;
+    t3 = t1 + t6;
+    t8 = t2 + t4;
+    t14 = t9 + t7;
+    t0 = t5 - t10;
+    t11 = t1 - t6;
+    t13 = t2 - t4;
+    t12 = t9 - t7;
+    t1 = t5 + t10;
+    t6 = t14 + t0;
+    t2 = t14 - t0;
+    t4 = C7 * t6;
+    t9 = (-C7) * t2;
+    t7 = -t11;
+    t5 = t12 - t1;
+    t10 = t12 + t1;
+    t14 = (-C7) * t5;
+    t0 = (-C7) * t10;
+    re[158] = t3;
+    im[158] = t8;
+    re[218] = t4;
+    im[218] = t9;
+    re[38] = t13;
+    im[38] = t7;
+    re[98] = t14;
+    im[98] = t0;
+    t6 = x[106];
+    t2 = (-0.007065752991958113) * t6;
+    t11 = x[373];
+    t12 = 0.06377278893806684 * t11;
+    t1 = t2 - t12;
+    t5 = x[586];
+    t10 = 0.4245945112807131 * t1;
+    t3 = (-0.05915425397821457) * t5;
+    t8 = t10 + t3;
+    t4 = (-0.9053836208979552) * t1;
+    t9 = (-0.02774135844554455) * t5;
+    t13 = t4 + t9;
+    t7 = x[226];
+    t14 = 0.0479923553379481 * t7;
+    t0 = x[253];
+    t6 = 0.06243485865874562 * t0;
+    t11 = t14 - t6;
+    t2 = x[706];
+    t12 = 0.04765724470703279 * t2;
+    t10 = x[733];
+    t3 = 0.024820480698015124 * t10;
+    t1 = t12 + t3;
+    t5 = C19 * t11;
+    t4 = (-C20) * t1;
+    t9 = t5 + t4;
+    t7 = (-C20) * t11;
+    t0 = (-C19) * t1;
+    t14 = t7 + t0;
+    t6 = x[613];
+    t2 = x[133];
+    t10 = (-0.004261695189175274) * t2;
+    t12 = x[346];
+    t3 = 0.063775459014178 * t12;
+    t5 = t10 - t3;
+    t4 = (-0.06144190431491609) * t6;
+    t11 = 0.3399692397309942 * t5;
+    t1 = t4 + t11;
+    t7 = 0.022211341490528978 * t6;
+    t0 = 0.9404365560933549 * t5;
+    t2 = t7 + t0;
+    t12 = x[493];
+    t10 = x[13];
+    t3 = (-0.0002456946508096601) * t10;
+    t4 = x[466];
+    t11 = 0.0642919664626169 * t4;
+    t6 = t3 - t11;
+    t5 = (-0.047877255050131205) * t12;
+    t7 = 0.6739801114782978 * t6;
+    t0 = t5 + t7;
+    t10 = 0.043679648002768544 * t12;
+    t4 = 0.7387494902412463 * t6;
+    t3 = t10 + t4;
+    t11 = t8 + t1;
+    t5 = t13 + t2;
+    t7 = t9 + t0;
+    t12 = t14 + t3;
+    t6 = t8 - t1;
+    t10 = t13 - t2;
+    t4 = t9 - t0;
+    t8 = t14 - t3;
+    t1 = t11 + t7;
+    t13 = t5 + t12;
+    t2 = t6 + t8;
+    t9 = t10 - t4;
+    t0 = t11 - t7;
+    t14 = t5 - t12;
+    t3 = t6 - t8;
+    t11 = t10 + t4;
+    t7 = t2 + t9;
+    t5 = C8 * t7;
+    t12 = t2 * (-C5);
+    t6 = t9 * (-C6);
+    t8 = t5 - t6;
+    t10 = t5 + t12;
+    t4 = t0 - t14;
+    t7 = t0 + t14;
+    t2 = (-C7) * t4;
+    t9 = (-C7) * t7;
+    t6 = t3 + t11;
+    t5 = (-C4) * t6;
+    t12 = t3 * C5;
+    t0 = t11 * (-C6);
+    t14 = t5 - t0;
+    t4 = t5 + t12;
+    re[173] = t1;
+    im[173] = t13;
+    re[233] = t8;
+    im[233] = t10;
+    re[53] = t2;
+    im[53] = t9;
+    re[113] = t14;
+    im[113] = t4;
+    t7 = re[128];
+    t6 = im[128];
+    t3 = re[143];
+    t11 = im[143];
+    t0 = re[158];
+    t5 = im[158];
+    t12 = re[173];
+    t1 = im[173];
+    t13 = t7 + t0;
+    t8 = t6 + t5;
+    t10 = t3 + t12;
+    t2 = t11 + t1;
+    t9 = t7 - t0;
+    t14 = t6 - t5;
+    t4 = t3 - t12;
+    t7 = t11 - t1;
+    t0 = t13 + t10;
+    t6 = t8 + t2;
+    t5 = t9 + t7;
+    t3 = t14 - t4;
+    t12 = t13 - t10;
+    t11 = t8 - t2;
+    t1 = t9 - t7;
+    t13 = t14 + t4;
+    re[128] = t0;
+    im[128] = t6;
+    re[143] = t5;
+    im[143] = t3;
+    re[158] = t12;
+    im[158] = t11;
+    re[173] = t1;
+    im[173] = t13;
+    t10 = re[188];
+    t8 = im[188];
+    t2 = re[203];
+    t9 = im[203];
+    t7 = re[218];
+    t14 = im[218];
+    t4 = re[233];
+    t0 = im[233];
+    t6 = t10 + t7;
+    t5 = t8 + t14;
+    t3 = t2 + t4;
+    t12 = t9 + t0;
+    t11 = t10 - t7;
+    t1 = t8 - t14;
+    t13 = t2 - t4;
+    t10 = t9 - t0;
+    t7 = t6 + t3;
+    t8 = t5 + t12;
+    t14 = t11 + t10;
+    t2 = t1 - t13;
+    t4 = t6 - t3;
+    t9 = t5 - t12;
+    t0 = t11 - t10;
+    t6 = t1 + t13;
+    re[188] = t7;
+    im[188] = t8;
+    re[203] = t14;
+    im[203] = t2;
+    re[218] = t4;
+    im[218] = t9;
+    re[233] = t0;
+    im[233] = t6;
+    t3 = re[8];
+    t5 = im[8];
+    t12 = re[23];
+    t11 = im[23];
+    t10 = re[38];
+    t1 = im[38];
+    t13 = re[53];
+    t7 = im[53];
+    t8 = t3 + t10;
+    t14 = t5 + t1;
+    t2 = t12 + t13;
+    t4 = t11 + t7;
+    t9 = t3 - t10;
+    t0 = t5 - t1;
+    t6 = t12 - t13;
+    t3 = t11 - t7;
+    t10 = t8 + t2;
+    t5 = t14 + t4;
+    t1 = t9 + t3;
+    t12 = t0 - t6;
+    t13 = t8 - t2;
+    t11 = t14 - t4;
+    t7 = t9 - t3;
+    t8 = t0 + t6;
+    re[8] = t10;
+    im[8] = t5;
+    re[23] = t1;
+    im[23] = t12;
+    re[38] = t13;
+    im[38] = t11;
+    re[53] = t7;
+    im[53] = t8;
+    t2 = re[68];
+    t14 = im[68];
+    t4 = re[83];
+    t9 = im[83];
+    t3 = re[98];
+    t0 = im[98];
+    t6 = re[113];
+    t10 = im[113];
+    t5 = t2 + t3;
+    t1 = t14 + t0;
+    t12 = t4 + t6;
+    t13 = t9 + t10;
+    t11 = t2 - t3;
+    t7 = t14 - t0;
+    t8 = t4 - t6;
+    t2 = t9 - t10;
+    t3 = t5 + t12;
+    t14 = t1 + t13;
+    t0 = t11 + t2;
+    t4 = t7 - t8;
+    t6 = t5 - t12;
+    t9 = t1 - t13;
+    t10 = t11 - t2;
+    t5 = t7 + t8;
+    re[68] = t3;
+    im[68] = t14;
+    re[83] = t0;
+    im[83] = t4;
+    re[98] = t6;
+    im[98] = t9;
+    re[113] = t10;
+    im[113] = t5;
+    t12 = x[112];
+    t1 = (-0.006813949450594331) * t12;
+    t13 = x[367];
+    t11 = 0.06375060486881785 * t13;
+    t2 = t1 - t11;
+    t7 = x[592];
+    t8 = 0.40673664307580015 * t2;
+    t3 = (-0.05970828692020779) * t7;
+    t14 = t8 + t3;
+    t0 = (-0.9135454576426009) * t2;
+    t4 = (-0.026583842087508976) * t7;
+    t6 = t0 + t4;
+    t9 = x[232];
+    t10 = 0.05202344363968648 * t9;
+    t5 = x[247];
+    t12 = 0.0601342793375864 * t5;
+    t13 = t10 - t12;
+    t1 = x[712];
+    t11 = 0.04314901382665701 * t1;
+    t8 = x[727];
+    t3 = 0.0302158355175465 * t8;
+    t2 = t11 + t3;
+    t7 = C21 * t13;
+    t0 = (-C22) * t2;
+    t4 = t7 + t0;
+    t9 = (-C22) * t13;
+    t5 = (-C21) * t2;
+    t10 = t9 + t5;
+    t12 = x[607];
+    t1 = x[127];
+    t8 = (-0.005279387997380958) * t1;
+    t11 = x[352];
+    t3 = 0.06374551513006745 * t11;
+    t7 = t8 - t3;
+    t0 = (-0.06102262152562866) * t12;
+    t13 = 0.35836794954530027 * t7;
+    t2 = t0 + t13;
+    t9 = 0.023424389727266837 * t12;
+    t5 = 0.9335804264972017 * t7;
+    t1 = t9 + t5;
+    t11 = x[487];
+    t8 = x[7];
+    t3 = (-0.00010744127641315864) * t8;
+    t0 = x[472];
+    t13 = 0.06440257081976378 * t0;
+    t12 = t3 - t13;
+    t7 = (-0.046929698210489604) * t11;
+    t9 = 0.6883545756937539 * t12;
+    t5 = t7 + t9;
+    t8 = 0.04453462072837733 * t11;
+    t0 = 0.7253743710122876 * t12;
+    t3 = t8 + t0;
+    t13 = t14 + t2;
+    t7 = t6 + t1;
+    t9 = t4 + t5;
+    t11 = t10 + t3;
+    t12 = t14 - t2;
+    t8 = t6 - t1;
+    t0 = t4 - t5;
+    t14 = t10 - t3;
+    t2 = t13 + t9;
+    t6 = t7 + t11;
+    t1 = t12 + t14;
+    t4 = t8 - t0;
+    t5 = t13 - t9;
+    t10 = t7 - t11;
+    t3 = t12 - t14;
+    t13 = t8 + t0;
+    re[176] = t2;
+    im[176] = t6;
+    re[236] = t1;
+    im[236] = t4;
+    re[56] = t5;
+    im[56] = t10;
+    re[116] = t3;
+    im[116] = t13;
+    t9 = x[142];
+    t7 = (-0.002242835474330392) * t9;
+    t11 = x[337];
+    t12 = 0.06386864782289088 * t11;
+    t14 = t7 - t12;
+    t8 = x[622];
+    t0 = 0.31523498164776964 * t14;
+    t2 = (-0.0619118092064415) * t8;
+    t6 = t0 + t2;
+    t1 = (-0.949013649188214) * t14;
+    t4 = (-0.020565318587006037) * t8;
+    t5 = t1 + t4;
+    t10 = x[697];
+    t3 = 0.0533493122258349 * t10;
+    t13 = x[742];
+    t9 = 0.017114937252602207 * t13;
+    t11 = t3 + t9;
+    t7 = x[217];
+    t12 = 0.041388190121589154 * t7;
+    t0 = x[262];
+    t2 = 0.06482389829314764 * t0;
+    t14 = t12 - t2;
+    t8 = (-C23) * t11;
+    t1 = C24 * t14;
+    t4 = t8 + t1;
+    t10 = C24 * t11;
+    t13 = C23 * t14;
+    t3 = t10 + t13;
+    t9 = x[577];
+    t7 = x[97];
+    t0 = (-0.007100273596993801) * t7;
+    t12 = x[382];
+    t2 = 0.06381399902660753 * t12;
+    t8 = t0 - t2;
+    t1 = (-0.05837008033804045) * t9;
+    t11 = 0.44814919358922256 * t8;
+    t14 = t1 + t11;
+    t10 = 0.02926142124149258 * t9;
+    t13 = 0.8939587799699321 * t8;
+    t7 = t10 + t13;
+    t12 = x[22];
+    t0 = (-0.0006056365353395344) * t12;
+    t2 = x[457];
+    t1 = 0.06414816420718814 * t2;
+    t11 = t0 - t1;
+    t9 = x[502];
+    t8 = 0.6544109481086103 * t11;
+    t10 = (-0.049114102427657194) * t9;
+    t13 = t8 + t10;
+    t12 = (-0.7561390817803227) * t11;
+    t2 = (-0.04250647415223043) * t9;
+    t0 = t12 + t2;
+    t1 = t6 + t14;
+    t8 = t5 + t7;
+    t10 = t4 + t13;
+    t11 = t3 + t0;
+    t9 = t6 - t14;
+    t12 = t5 - t7;
+    t2 = t4 - t13;
+    t6 = t3 - t0;
+    t14 = t1 + t10;
+    t5 = t8 + t11;
+    t7 = t9 + t6;
+    t4 = t12 - t2;
+    t13 = t1 - t10;
+    t3 = t8 - t11;
+    t0 = t9 - t6;
+    t1 = t12 + t2;
+    t10 = t7 + t4;
+    t8 = C4 * t10;
+    t11 = t7 * (-C5);
+    t9 = t4 * C6;
+    t6 = t8 - t9;
+    t12 = t8 + t11;
+    t2 = t13 + t3;
+    t10 = t13 - t3;
+    t7 = C7 * t2;
+    t4 = (-C7) * t10;
+    t9 = t0 + t1;
+    t8 = C8 * t9;
+    t11 = t0 * (-C5);
+    t13 = t1 * (-C6);
+    t3 = t8 - t13;
+    t2 = t8 + t11;
+    re[191] = t14;
+    im[191] = t5;
+    re[11] = t6;
+    im[11] = t12;
+    re[71] = t7;
+    im[71] = t4;
+    re[131] = t3;
+    im[131] = t2;
+    t10 = x[172];
+    t9 = 0.009625348123172246 * t10;
+    t0 = x[307];
+    t1 = 0.06486270815924904 * t0;
+    t13 = t9 - t1;
+    t8 = x[652];
+    t11 = 0.22069743502150108 * t13;
+    t14 = (-0.06265428087699489) * t8;
+    t5 = t11 + t14;
+    t6 = (-0.9753423205085127) * t13;
+    t12 = (-0.014177216339244013) * t8;
+    t7 = t6 + t12;
+    t4 = x[667];
+    t3 = 0.06288032859008362 * t4;
+    t2 = x[772];
+    t10 = 0.0014091575986145222 * t2;
+    t0 = t3 + t10;
+    t9 = x[187];
+    t1 = 0.01883654300751599 * t9;
+    t11 = x[292];
+    t14 = 0.06584130684089498 * t11;
+    t13 = t1 - t14;
+    t8 = (-C25) * t0;
+    t6 = C26 * t13;
+    t12 = t8 + t6;
+    t4 = C26 * t0;
+    t2 = C25 * t13;
+    t3 = t4 + t2;
+    t10 = x[547];
+    t9 = x[67];
+    t11 = (-0.004938814307956446) * t9;
+    t1 = x[412];
+    t14 = 0.06390387378480732 * t1;
+    t8 = t11 - t14;
+    t6 = (-0.05514322865047236) * t10;
+    t0 = 0.5336145159156115 * t8;
+    t13 = t6 + t0;
+    t4 = 0.034792786174468876 * t10;
+    t2 = 0.8457278217039733 * t8;
+    t9 = t4 + t2;
+    t1 = x[52];
+    t11 = (-0.0032237589325984635) * t1;
+    t14 = x[427];
+    t6 = 0.06392187600362498 * t14;
+    t0 = t11 - t6;
+    t10 = x[532];
+    t8 = 0.5771451900372336 * t0;
+    t4 = (-0.053231747239615275) * t10;
+    t2 = t8 + t4;
+    t1 = (-0.8166415551616789) * t0;
+    t14 = (-0.03762047948997563) * t10;
+    t11 = t1 + t14;
+    t6 = t5 + t13;
+    t8 = t7 + t9;
+    t4 = t12 + t2;
+    t0 = t3 + t11;
+    t10 = t5 - t13;
+    t1 = t7 - t9;
+    t14 = t12 - t2;
+    t5 = t3 - t11;
+    t13 = t6 + t4;
+    t7 = t8 + t0;
+    t9 = t10 + t5;
+    t12 = t1 - t14;
+    t2 = t6 - t4;
+    t3 = t8 - t0;
+    t11 = t10 - t5;
+    t6 = t1 + t14;
+    t4 = t9 + t12;
+    t8 = t9 - t12;
+    t0 = C7 * t4;
+    t10 = (-C7) * t8;
+    t5 = -t2;
+    t1 = t11 - t6;
+    t14 = t11 + t6;
+    t9 = (-C7) * t1;
+    t12 = (-C7) * t14;
+    re[206] = t13;
+    im[206] = t7;
+    re[26] = t0;
+    im[26] = t10;
+    re[86] = t3;
+    im[86] = t5;
+    re[146] = t9;
+    im[146] = t12;
+    t4 = x[202];
+    t8 = 0.02979567062694908 * t4;
+    t2 = x[277];
+    t11 = 0.06631822500252159 * t2;
+    t6 = t8 - t11;
+    t1 = x[682];
+    t14 = 0.05973152439328069 * t1;
+    t13 = x[757];
+    t7 = 0.006892880337578761 * t13;
+    t0 = t14 + t7;
+    t10 = C27 * t6;
+    t3 = (-C28) * t0;
+    t5 = t10 + t3;
+    t9 = (-C28) * t6;
+    t12 = (-C27) * t0;
+    t4 = t9 + t12;
+    t2 = x[637];
+    t8 = x[157];
+    t11 = 0.0026207874522626764 * t8;
+    t1 = x[322];
+    t13 = 0.06419855597372343 * t1;
+    t14 = t11 - t13;
+    t7 = (-0.06258001501135675) * t2;
+    t10 = 0.265135426243408 * t14;
+    t3 = t7 + t10;
+    t6 = 0.017208034136048714 * t2;
+    t0 = 0.9642111831703293 * t14;
+    t9 = t6 + t0;
+    t12 = x[517];
+    t8 = x[37];
+    t1 = (-0.0016708514507894514) * t8;
+    t11 = x[442];
+    t13 = 0.06398752739483611 * t11;
+    t7 = t1 - t13;
+    t10 = (-0.05140012399880422) * t12;
+    t2 = 0.6139408387503664 * t7;
+    t14 = t10 + t2;
+    t6 = 0.03997789776032146 * t12;
+    t0 = 0.78935204219315 * t7;
+    t8 = t6 + t0;
+    t11 = x[82];
+    t1 = (-0.006371533022392319) * t11;
+    t13 = x[397];
+    t10 = 0.06387494121621416 * t13;
+    t2 = t1 - t10;
+    t12 = x[562];
+    t7 = 0.4943212082861446 * t2;
+    t6 = (-0.0567045090631778) * t12;
+    t0 = t7 + t6;
+    t11 = (-0.8692793239451436) * t2;
+    t13 = (-0.03224537920466121) * t12;
+    t1 = t11 + t13;
+    t10 = t5 + t14;
+    t7 = t4 + t8;
+    t6 = t3 + t0;
+    t2 = t9 + t1;
+    t12 = t5 - t14;
+    t11 = t4 - t8;
+    t13 = t3 - t0;
+    t5 = t9 - t1;
+    t14 = t10 + t6;
+    t4 = t7 + t2;
+    t8 = t12 + t5;
+    t3 = t11 - t13;
+    t0 = t10 - t6;
+    t9 = t7 - t2;
+    t1 = t12 - t5;
+    t10 = t11 + t13;
+    t6 = t8 + t3;
+    t7 = C8 * t6;
+    t2 = t8 * (-C5);
+    t12 = t3 * (-C6);
+    t5 = t7 - t12;
+    t11 = t7 + t2;
+    t13 = t0 - t9;
+    t6 = t0 + t9;
+    t8 = (-C7) * t13;
+    t3 = (-C7) * t6;
+    t12 = t1 + t10;
+    t7 = (-C4) * t12;
+    t2 = t1 * C5;
+    t0 = t10 * (-C6);
+    t9 = t7 - t0;
+    t13 = t7 + t2;
+    re[221] = t14;
+    im[221] = t4;
+    re[41] = t5;
+    im[41] = t11;
+    re[101] = t8;
+    im[101] = t3;
+    re[161] = t9;
+    im[161] = t13;
+    t6 = re[176];
+    t12 = im[176];
+    t1 = re[191];
+    t10 = im[191];
+    t0 = re[206];
+    t7 = im[206];
+    t2 = re[221];
+    t14 = im[221];
+    t4 = t6 + t0;
+    t5 = t12 + t7;
+    t11 = t1 + t2;
+    t8 = t10 + t14;
+    t3 = t6 - t0;
+    t9 = t12 - t7;
+    t13 = t1 - t2;
+    t6 = t10 - t14;
+    t0 = t4 + t11;
+    t12 = t5 + t8;
+    t7 = t3 + t6;
+    t1 = t9 - t13;
+    t2 = t4 - t11;
+    t10 = t5 - t8;
+    t14 = t3 - t6;
+    t4 = t9 + t13;
+    re[176] = t0;
+    im[176] = t12;
+    re[191] = t7;
+    im[191] = t1;
+    re[206] = t2;
+    im[206] = t10;
+    re[221] = t14;
+    im[221] = t4;
+    t11 = re[236];
+    t5 = im[236];
+    t8 = re[11];
+    t3 = im[11];
+    t6 = re[26];
+    t9 = im[26];
+    t13 = re[41];
+    t0 = im[41];
+    t12 = t11 + t6;
+    t7 = t5 + t9;
+    t1 = t8 + t13;
+    t2 = t3 + t0;
+    t10 = t11 - t6;
+    t14 = t5 - t9;
+    t4 = t8 - t13;
+    t11 = t3 - t0;
+    t6 = t12 + t1;
+    t5 = t7 + t2;
+    t9 = t10 + t11;
+    t8 = t14 - t4;
+    t13 = t12 - t1;
+    t3 = t7 - t2;
+    t0 = t10 - t11;
+    t12 = t14 + t4;
+    re[236] = t6;
+    im[236] = t5;
+    re[11] = t9;
+    im[11] = t8;
+    re[26] = t13;
+    im[26] = t3;
+    re[41] = t0;
+    im[41] = t12;
+    t1 = re[56];
+    t7 = im[56];
+    t2 = re[71];
+    t10 = im[71];
+    t11 = re[86];
+    t14 = im[86];
+    t4 = re[101];
+    t6 = im[101];
+    t5 = t1 + t11;
+    t9 = t7 + t14;
+    t8 = t2 + t4;
+    t13 = t10 + t6;
+    t3 = t1 - t11;
+    t0 = t7 - t14;
+    t12 = t2 - t4;
+    t1 = t10 - t6;
+    t11 = t5 + t8;
+    t7 = t9 + t13;
+    t14 = t3 + t1;
+    t2 = t0 - t12;
+    t4 = t5 - t8;
+    t10 = t9 - t13;
+    t6 = t3 - t1;
+    t5 = t0 + t12;
+    re[56] = t11;
+    im[56] = t7;
+    re[71] = t14;
+    im[71] = t2;
+    re[86] = t4;
+    im[86] = t10;
+    re[101] = t6;
+    im[101] = t5;
+    t8 = re[116];
+    t9 = im[116];
+    t13 = re[131];
+    t3 = im[131];
+    t1 = re[146];
+    t0 = im[146];
+    t12 = re[161];
+    t11 = im[161];
+    t7 = t8 + t1;
+    t14 = t9 + t0;
+    t2 = t13 + t12;
+    t4 = t3 + t11;
+    t10 = t8 - t1;
+    t6 = t9 - t0;
+    t5 = t13 - t12;
+    t8 = t3 - t11;
+    t1 = t7 + t2;
+    t9 = t14 + t4;
+    t0 = t10 + t8;
+    t13 = t6 - t5;
+    t12 = t7 - t2;
+    t3 = t14 - t4;
+    t11 = t10 - t8;
+    t7 = t6 + t5;
+    re[116] = t1;
+    im[116] = t9;
+    re[131] = t0;
+    im[131] = t13;
+    re[146] = t12;
+    im[146] = t3;
+    re[161] = t11;
+    im[161] = t7;
+    t2 = x[208];
+    t14 = 0.03443938653167817 * t2;
+    t4 = x[271];
+    t10 = 0.06604203723121735 * t4;
+    t8 = t14 - t10;
+    t6 = x[688];
+    t5 = 0.05763217601515571 * t6;
+    t1 = x[751];
+    t9 = 0.010468257099355354 * t1;
+    t0 = t5 + t9;
+    t13 = C29 * t8;
+    t12 = (-C30) * t0;
+    t3 = t13 + t12;
+    t11 = (-C30) * t8;
+    t7 = (-C29) * t0;
+    t2 = t11 + t7;
+    t4 = x[631];
+    t14 = x[151];
+    t10 = 0.0004336255177722955 * t14;
+    t6 = x[328];
+    t1 = 0.06403524354835045 * t6;
+    t5 = t10 - t1;
+    t9 = (-0.062388803528184336) * t4;
+    t13 = 0.2840153447039226 * t5;
+    t12 = t9 + t13;
+    t8 = 0.01848040553958604 * t4;
+    t0 = 0.958819734868193 * t5;
+    t11 = t8 + t0;
+    t7 = x[511];
+    t14 = x[31];
+    t6 = (-0.0011752351076776114) * t14;
+    t10 = x[448];
+    t1 = 0.06403917383826517 * t10;
+    t9 = t6 - t1;
+    t13 = (-0.05056449011842994) * t7;
+    t4 = 0.6293203910498375 * t9;
+    t5 = t13 + t4;
+    t8 = 0.040946316744551285 * t7;
+    t0 = 0.7771459614569709 * t9;
+    t14 = t8 + t0;
+    t10 = x[88];
+    t6 = (-0.006767643514685339) * t10;
+    t1 = x[391];
+    t13 = 0.06385373867173391 * t1;
+    t4 = t6 - t13;
+    t7 = x[568];
+    t9 = 0.4771587602596084 * t4;
+    t8 = (-0.05734570982992097) * t7;
+    t0 = t9 + t8;
+    t10 = (-0.8788171126619654) * t4;
+    t1 = (-0.031136180001967526) * t7;
+    t6 = t10 + t1;
+    t13 = t3 + t5;
+    t9 = t2 + t14;
+    t8 = t12 + t0;
+    t4 = t11 + t6;
+    t7 = t3 - t5;
+    t10 = t2 - t14;
+    t1 = t12 - t0;
+    t3 = t11 - t6;
+    t5 = t13 + t8;
+    t2 = t9 + t4;
+    t14 = t7 + t3;
+    t12 = t10 - t1;
+    t0 = t13 - t8;
+    t11 = t9 - t4;
+    t6 = t7 - t3;
+    t13 = t10 + t1;
+    re[224] = t5;
+    im[224] = t2;
+    re[44] = t14;
+    im[44] = t12;
+    re[104] = t0;
+    im[104] = t11;
+    re[164] = t6;
+    im[164] = t13;
+    t8 = x[238];
+    t9 = 0.05564256004817251 * t8;
+    t4 = x[241];
+    t7 = 0.057272384837089046 * t4;
+    t3 = t9 - t7;
+    t10 = x[718];
+    t1 = 0.03818632213439032 * t10;
+    t5 = x[721];
+    t2 = 0.03557789088350688 * t5;
+    t14 = t1 + t2;
+    t12 = C31 * t3;
+    t0 = (-C32) * t14;
+    t11 = t12 + t0;
+    t6 = (-C32) * t3;
+    t13 = (-C31) * t14;
+    t8 = t6 + t13;
+    t4 = x[601];
+    t9 = x[121];
+    t7 = (-0.0060577880678891185) * t9;
+    t10 = x[358];
+    t5 = 0.06373607267574667 * t10;
+    t1 = t7 - t5;
+    t2 = (-0.06055992215140732) * t4;
+    t12 = 0.3766285016932107 * t1;
+    t0 = t2 + t12;
+    t3 = 0.024621620972872824 * t4;
+    t14 = 0.9263643838751181 * t1;
+    t6 = t3 + t14;
+    t13 = x[481];
+    t9 = x[1];
+    t10 = (-2.9821318216822157e-05) * t9;
+    t7 = x[478];
+    t5 = 0.0645199171333313 * t7;
+    t2 = t10 - t5;
+    t12 = (-0.045962525848438976) * t13;
+    t4 = 0.7024636661168517 * t2;
+    t1 = t12 + t4;
+    t3 = 0.04536478148452987 * t13;
+    t14 = 0.7117196061551713 * t2;
+    t9 = t3 + t14;
+    t7 = x[118];
+    t10 = (-0.006362675543032619) * t7;
+    t5 = x[361];
+    t12 = 0.0637376678799361 * t5;
+    t4 = t10 - t12;
+    t13 = x[598];
+    t2 = 0.38872197015239557 * t4;
+    t3 = (-0.06023093929837843) * t13;
+    t14 = t2 + t3;
+    t7 = (-0.9213551052231925) * t4;
+    t5 = (-0.025411580459548586) * t13;
+    t10 = t7 + t5;
+    t12 = t11 + t1;
+    t2 = t8 + t9;
+    t3 = t0 + t14;
+    t4 = t6 + t10;
+    t13 = t11 - t1;
+    t7 = t8 - t9;
+    t5 = t0 - t14;
+    t11 = t6 - t10;
+    t1 = t12 + t3;
+    t8 = t2 + t4;
+    t9 = t13 + t11;
+    t0 = t7 - t5;
+    t14 = t12 - t3;
+    t6 = t2 - t4;
+    t10 = t13 - t11;
+    t12 = t7 + t5;
+    t3 = t9 + t0;
+    t2 = C4 * t3;
+    t4 = t9 * (-C5);
+    t13 = t0 * C6;
+    t11 = t2 - t13;
+    t7 = t2 + t4;
+    t5 = t14 + t6;
+    t3 = t14 - t6;
+    t9 = C7 * t5;
+    t0 = (-C7) * t3;
+    t13 = t10 + t12;
+    t2 = C8 * t13;
+    t4 = t10 * (-C5);
+    t14 = t12 * (-C6);
+    t6 = t2 - t14;
+    t5 = t2 + t4;
+    re[239] = t1;
+    im[239] = t8;
+    re[59] = t11;
+    im[59] = t7;
+    re[119] = t9;
+    im[119] = t0;
+    re[179] = t6;
+    im[179] = t5;
+    t3 = x[691];
+    t13 = 0.05636118887867944 * t3;
+    t10 = x[748];
+    t12 = 0.01252924252967493 * t10;
+    t14 = t13 + t12;
+    t2 = x[211];
+    t4 = 0.03677105102748792 * t2;
+    t1 = x[268];
+    t8 = 0.06575363870072876 * t1;
+    t11 = t4 - t8;
+    t7 = (-C33) * t14;
+    t9 = C34 * t11;
+    t0 = t7 + t9;
+    t6 = C34 * t14;
+    t5 = C33 * t11;
+    t3 = t6 + t5;
+    t10 = x[571];
+    t13 = x[91];
+    t12 = (-0.006915743100063547) * t13;
+    t2 = x[388];
+    t1 = 0.06384127617852932 * t2;
+    t4 = t12 - t1;
+    t8 = (-0.057759629978535405) * t10;
+    t7 = 0.4656145203251114 * t4;
+    t9 = t8 + t7;
+    t14 = 0.030388811400469763 * t10;
+    t11 = 0.8849876374630419 * t4;
+    t6 = t14 + t11;
+    t5 = x[28];
+    t13 = (-0.0009614862925791448) * t5;
+    t2 = x[451];
+    t12 = 0.06407132642665489 * t2;
+    t1 = t13 - t12;
+    t8 = x[508];
+    t7 = 0.6394390019805847 * t1;
+    t10 = (-0.04999908402562265) * t8;
+    t4 = t7 + t10;
+    t14 = (-0.7688418320734596) * t1;
+    t11 = (-0.04158379923613836) * t8;
+    t5 = t14 + t11;
+    t2 = x[148];
+    t13 = (-0.0005364356720218564) * t2;
+    t12 = x[331];
+    t7 = 0.06397026380276978 * t12;
+    t10 = t13 - t7;
+    t1 = x[628];
+    t8 = 0.296541574975571 * t10;
+    t14 = (-0.062204679674922915) * t1;
+    t11 = t8 + t14;
+    t2 = (-0.9550199444571866) * t10;
+    t12 = (-0.019315066443075183) * t1;
+    t13 = t2 + t12;
+    t7 = t0 + t4;
+    t8 = t3 + t5;
+    t14 = t9 + t11;
+    t10 = t6 + t13;
+    t1 = t0 - t4;
+    t2 = t3 - t5;
+    t12 = t9 - t11;
+    t0 = t6 - t13;
+    t4 = t7 + t14;
+    t3 = t8 + t10;
+    t5 = t1 + t0;
+    t9 = t2 - t12;
+    t11 = t7 - t14;
+    t6 = t8 - t10;
+    t13 = t1 - t0;
+    t7 = t2 + t12;
+    t14 = t5 + t9;
+    t8 = t5 - t9;
+    t10 = C7 * t14;
+    t1 = (-C7) * t8;
+    t0 = -t11;
+    t2 = t13 - t7;
+    t12 = t13 + t7;
+    t5 = (-C7) * t2;
+    t9 = (-C7) * t12;
+    re[14] = t4;
+    im[14] = t3;
+    re[74] = t10;
+    im[74] = t1;
+    re[134] = t6;
+    im[134] = t0;
+    re[194] = t5;
+    im[194] = t9;
+    t14 = x[661];
+    t8 = 0.06356445131066212 * t14;
+    t11 = x[778];
+    t13 = 0.000436235085823156 * t11;
+    t7 = t8 + t13;
+    t2 = x[181];
+    t12 = 0.01490230639662058 * t2;
+    t4 = x[298];
+    t3 = 0.06544799289503121 * t4;
+    t10 = t12 - t3;
+    t1 = (-C35) * t7;
+    t6 = C36 * t10;
+    t0 = t1 + t6;
+    t5 = C36 * t7;
+    t9 = C35 * t10;
+    t14 = t5 + t9;
+    t11 = x[541];
+    t8 = x[61];
+    t13 = (-0.004260902338958278) * t8;
+    t2 = x[418];
+    t4 = 0.06390948422644374 * t2;
+    t12 = t13 - t4;
+    t3 = (-0.054444708430641794) * t11;
+    t1 = 0.5501164165954934 * t12;
+    t6 = t3 + t1;
+    t7 = 0.035865595905812925 * t11;
+    t10 = 0.8350879763187431 * t12;
+    t5 = t7 + t10;
+    t9 = x[58];
+    t8 = (-0.003914112644701813) * t9;
+    t2 = x[421];
+    t13 = 0.0639125765929755 * t2;
+    t4 = t8 - t13;
+    t3 = x[538];
+    t1 = 0.5610002506640098 * t4;
+    t11 = (-0.05396796654536729) * t3;
+    t12 = t1 + t11;
+    t7 = (-0.8278156308955021) * t4;
+    t10 = (-0.03657341276224318) * t3;
+    t9 = t7 + t10;
+    t2 = x[178];
+    t8 = 0.013056471420713447 * t2;
+    t13 = x[301];
+    t1 = 0.06526266570634885 * t13;
+    t11 = t8 - t1;
+    t4 = x[658];
+    t3 = 0.20150532232561713 * t11;
+    t7 = (-0.0625349506846611) * t4;
+    t10 = t3 + t7;
+    t2 = (-0.9794874195590514) * t11;
+    t13 = (-0.012865020155135855) * t4;
+    t8 = t2 + t13;
+    t1 = t0 + t12;
+    t3 = t14 + t9;
+    t7 = t6 + t10;
+    t11 = t5 + t8;
+    t4 = t0 - t12;
+    t2 = t14 - t9;
+    t13 = t6 - t10;
+    t0 = t5 - t8;
+    t12 = t1 + t7;
+    t14 = t3 + t11;
+    t9 = t4 + t0;
+    t6 = t2 - t13;
+    t10 = t1 - t7;
+    t5 = t3 - t11;
+    t8 = t4 - t0;
+    t1 = t2 + t13;
+    t7 = t9 + t6;
+    t3 = C8 * t7;
+    t11 = t9 * (-C5);
+    t4 = t6 * (-C6);
+    t0 = t3 - t4;
+    t2 = t3 + t11;
+    t13 = t10 - t5;
+    t7 = t10 + t5;
+    t9 = (-C7) * t13;
+    t6 = (-C7) * t7;
+    t4 = t8 + t1;
+    t3 = (-C4) * t4;
+    t11 = t8 * C5;
+    t10 = t1 * (-C6);
+    t5 = t3 - t10;
+    t13 = t3 + t11;
+    re[29] = t12;
+    im[29] = t14;
+    re[89] = t0;
+    im[89] = t2;
+    re[149] = t9;
+    im[149] = t6;
+    re[209] = t5;
+    im[209] = t13;
+    t7 = re[224];
+    t4 = im[224];
+    t8 = re[239];
+    t1 = im[239];
+    t10 = re[14];
+    t3 = im[14];
+    t11 = re[29];
+    t12 = im[29];
+    t14 = t7 + t10;
+    t0 = t4 + t3;
+    t2 = t8 + t11;
+    t9 = t1 + t12;
+    t6 = t7 - t10;
+    t5 = t4 - t3;
+    t13 = t8 - t11;
+    t7 = t1 - t12;
+    t10 = t14 + t2;
+    t4 = t0 + t9;
+    t3 = t6 + t7;
+    t8 = t5 - t13;
+    t11 = t14 - t2;
+    t1 = t0 - t9;
+    t12 = t6 - t7;
+    t14 = t5 + t13;
+    re[224] = t10;
+    im[224] = t4;
+    re[239] = t3;
+    im[239] = t8;
+    re[14] = t11;
+    im[14] = t1;
+    re[29] = t12;
+    im[29] = t14;
+    t2 = re[44];
+    t0 = im[44];
+    t9 = re[59];
+    t6 = im[59];
+    t7 = re[74];
+    t5 = im[74];
+    t13 = re[89];
+    t10 = im[89];
+    t4 = t2 + t7;
+    t3 = t0 + t5;
+    t8 = t9 + t13;
+    t11 = t6 + t10;
+    t1 = t2 - t7;
+    t12 = t0 - t5;
+    t14 = t9 - t13;
+    t2 = t6 - t10;
+    t7 = t4 + t8;
+    t0 = t3 + t11;
+    t5 = t1 + t2;
+    t9 = t12 - t14;
+    t13 = t4 - t8;
+    t6 = t3 - t11;
+    t10 = t1 - t2;
+    t4 = t12 + t14;
+    re[44] = t7;
+    im[44] = t0;
+    re[59] = t5;
+    im[59] = t9;
+    re[74] = t13;
+    im[74] = t6;
+    re[89] = t10;
+    im[89] = t4;
+    t8 = re[104];
+    t3 = im[104];
+    t11 = re[119];
+    t1 = im[119];
+    t2 = re[134];
+    t12 = im[134];
+    t14 = re[149];
+    t7 = im[149];
+    t0 = t8 + t2;
+    t5 = t3 + t12;
+    t9 = t11 + t14;
+    t13 = t1 + t7;
+    t6 = t8 - t2;
+    t10 = t3 - t12;
+    t4 = t11 - t14;
+    t8 = t1 - t7;
+    t2 = t0 + t9;
+    t3 = t5 + t13;
+    t12 = t6 + t8;
+    t11 = t10 - t4;
+    t14 = t0 - t9;
+    t1 = t5 - t13;
+    t7 = t6 - t8;
+    t0 = t10 + t4;
+    re[104] = t2;
+    im[104] = t3;
+    re[119] = t12;
+    im[119] = t11;
+    re[134] = t14;
+    im[134] = t1;
+    re[149] = t7;
+    im[149] = t0;
+    t9 = re[164];
+    t5 = im[164];
+    t13 = re[179];
+    t6 = im[179];
+    t8 = re[194];
+    t10 = im[194];
+    t4 = re[209];
+    t2 = im[209];
+    t3 = t9 + t8;
+    t12 = t5 + t10;
+    t11 = t13 + t4;
+    t14 = t6 + t2;
+    t1 = t9 - t8;
+    t7 = t5 - t10;
+    t0 = t13 - t4;
+    t9 = t6 - t2;
+    t8 = t3 + t11;
+    t5 = t12 + t14;
+    t10 = t1 + t9;
+    t13 = t7 - t0;
+    t4 = t3 - t11;
+    t6 = t12 - t14;
+    t2 = t1 - t9;
+    t3 = t7 + t0;
+    re[164] = t8;
+    im[164] = t5;
+    re[179] = t10;
+    im[179] = t13;
+    re[194] = t4;
+    im[194] = t6;
+    re[209] = t2;
+    im[209] = t3;
+}
+
+/**
+ *  Part 4 of ApplyWindowedMDCT_W10_480().
+ * 
+ *  @param {Number[]} x 
+ *    - The input block (960 points).
+ *  @param {Number[]} X 
+ *    - The array that would contain the output block (480 points).
+ *  @param {Number[]} re 
+ *    - The scratch buffer (real part, 240 points).
+ *  @param {Number[]} im 
+ *    - The scratch buffer (imaginary part, 240 points).
+ */
+function ApplyWindowedMDCT_W10_480_Part4(x, X, re, im) {
+    let t0, t1, t10, t11, t12, t13, t14, t2, t3, t4, t5, t6, t7, t8, t9;
+    const C0 = 0.18223552549214747;
+    const C1 = 0.9832549075639546;
+    const C2 = 0.08498217737244167;
+    const C3 = 0.9963824715083254;
+    const C4 = 0.9238795325112867;
+    const C5 = 1.3065629648763766;
+    const C6 = 0.5411961001461969;
+    const C7 = 0.7071067811865476;
+    const C8 = 0.3826834323650898;
+    const C9 = 0.999914327574007;
+    const C10 = 0.01308959557134444;
+    const C11 = 0.9938164620563781;
+    const C12 = 0.11103530855427768;
+    const C13 = 0.5590169943749475;
+    const C14 = 0.25;
+    const C15 = 0.9510565162951535;
+    const C16 = 0.5877852522924731;
+    t11 = x[655];
+    t12 = x[175];
+    t14 = 0.01129663648549895 * t12;
+    t1 = x[304];
+    t9 = 0.06505152284234923 * t1;
+    t7 = t14 - t9;
+    t0 = (-0.06265210751383446) * t11;
+    t8 = 0.20791169081775931 * t7;
+    t5 = t0 + t8;
+    t10 = 0.013317116554521209 * t11;
+    t13 = 0.9781476007338057 * t7;
+    t4 = t10 + t13;
+    t6 = x[535];
+    t2 = x[55];
+    t3 = (-0.00356723377083791) * t2;
+    t12 = x[424];
+    t1 = 0.06391650428469409 * t12;
+    t14 = t3 - t1;
+    t9 = (-0.05372413835342832) * t6;
+    t0 = 0.5664062369248328 * t14;
+    t8 = t9 + t0;
+    t11 = 0.03692357730758991 * t6;
+    t7 = 0.8241261886220156 * t14;
+    t10 = t11 + t7;
+    t13 = x[64];
+    t2 = (-0.004603664429274723) * t13;
+    t12 = x[415];
+    t3 = 0.06390676862470789 * t12;
+    t1 = t2 - t3;
+    t9 = x[544];
+    t0 = 0.544639035015027 * t1;
+    t6 = (-0.05468060386989363) * t9;
+    t14 = t0 + t6;
+    t11 = (-0.838670567945424) * t1;
+    t7 = (-0.0355099993537341) * t9;
+    t13 = t11 + t7;
+    t12 = x[184];
+    t2 = 0.016830469510486154 * t12;
+    t3 = x[295];
+    t0 = 0.06564684176583985 * t3;
+    t6 = t2 - t0;
+    t1 = x[664];
+    t9 = 0.0632497783386208 * t1;
+    t11 = x[775];
+    t7 = 0.0008626305010526697 * t11;
+    t12 = t9 + t7;
+    t3 = C0 * t6;
+    t2 = (-C1) * t12;
+    t0 = t3 + t2;
+    t1 = (-C1) * t6;
+    t11 = (-C0) * t12;
+    t9 = t1 + t11;
+    t7 = t5 + t14;
+    t3 = t4 + t13;
+    t2 = t8 + t0;
+    t6 = t10 + t9;
+    t12 = t5 - t14;
+    t1 = t4 - t13;
+    t11 = t8 - t0;
+    t5 = t10 - t9;
+    t14 = t7 + t2;
+    t4 = t3 + t6;
+    t13 = t12 + t5;
+    t8 = t1 - t11;
+    t0 = t7 - t2;
+    t10 = t3 - t6;
+    t9 = t12 - t5;
+    t7 = t1 + t11;
+    re[32] = t14;
+    im[32] = t4;
+    re[92] = t13;
+    im[92] = t8;
+    re[152] = t0;
+    im[152] = t10;
+    re[212] = t9;
+    im[212] = t7;
+    t2 = x[625];
+    t3 = x[145];
+    t6 = (-0.0014275697895049036) * t3;
+    t12 = x[334];
+    t5 = 0.06391499826051626 * t12;
+    t1 = t6 - t5;
+    t11 = (-0.06213060765889204) * t2;
+    t14 = 0.3027857698425746 * t1;
+    t4 = t11 + t14;
+    t13 = 0.019738831396064097 * t2;
+    t8 = 0.953058643306297 * t1;
+    t0 = t13 + t8;
+    t10 = x[505];
+    t9 = x[25];
+    t7 = (-0.0007715436614991194) * t9;
+    t3 = x[454];
+    t12 = 0.06410766352919622 * t3;
+    t6 = t7 - t12;
+    t5 = (-0.049697664448674156) * t10;
+    t11 = 0.6444573283588975 * t6;
+    t14 = t5 + t11;
+    t2 = 0.04188639423645735 * t10;
+    t1 = 0.7646402761590003 * t6;
+    t13 = t2 + t1;
+    t8 = x[94];
+    t9 = (-0.007027464603568059) * t8;
+    t3 = x[385];
+    t7 = 0.06382794532893109 * t3;
+    t12 = t9 - t7;
+    t5 = x[574];
+    t11 = 0.45981235844785984 * t12;
+    t10 = (-0.05796939047599652) * t5;
+    t6 = t11 + t10;
+    t2 = (-0.8880161006528073) * t12;
+    t1 = (-0.030016395122743768) * t5;
+    t8 = t2 + t1;
+    t3 = x[214];
+    t9 = 0.039091852988859394 * t3;
+    t7 = x[265];
+    t11 = 0.06535061848860482 * t7;
+    t10 = t9 - t11;
+    t12 = x[694];
+    t5 = 0.05493452772666063 * t12;
+    t2 = x[745];
+    t1 = 0.014751444591647385 * t2;
+    t3 = t5 + t1;
+    t7 = C2 * t10;
+    t9 = (-C3) * t3;
+    t11 = t7 + t9;
+    t12 = (-C3) * t10;
+    t2 = (-C2) * t3;
+    t5 = t12 + t2;
+    t1 = t4 + t6;
+    t7 = t0 + t8;
+    t9 = t14 + t11;
+    t10 = t13 + t5;
+    t3 = t4 - t6;
+    t12 = t0 - t8;
+    t2 = t14 - t11;
+    t4 = t13 - t5;
+    t6 = t1 + t9;
+    t0 = t7 + t10;
+    t8 = t3 + t4;
+    t14 = t12 - t2;
+    t11 = t1 - t9;
+    t13 = t7 - t10;
+    t5 = t3 - t4;
+    t1 = t12 + t2;
+    t9 = t8 + t14;
+    t7 = C4 * t9;
+    t10 = t8 * (-C5);
+    t3 = t14 * C6;
+    t4 = t7 - t3;
+    t12 = t7 + t10;
+    t2 = t11 + t13;
+    t9 = t11 - t13;
+    t8 = C7 * t2;
+    t14 = (-C7) * t9;
+    t3 = t5 + t1;
+    t7 = C8 * t3;
+    t10 = t5 * (-C5);
+    t11 = t1 * (-C6);
+    t13 = t7 - t11;
+    t2 = t7 + t10;
+    re[47] = t6;
+    im[47] = t0;
+    re[107] = t4;
+    im[107] = t12;
+    re[167] = t8;
+    im[167] = t14;
+    re[227] = t13;
+    im[227] = t2;
+    t9 = x[595];
+    t3 = x[115];
+    t5 = (-0.006614088359731265) * t3;
+    t1 = x[364];
+    t11 = 0.06374267795104448 * t1;
+    t7 = t5 - t11;
+    t10 = (-0.06005861115364406) * t9;
+    t6 = 0.39474385638426723 * t7;
+    t0 = t10 + t6;
+    t4 = 0.02580321569688348 * t9;
+    t12 = 0.9187912101488983 * t7;
+    t8 = t4 + t12;
+    t14 = x[4];
+    t13 = (-6.291769062519899e-05) * t14;
+    t2 = x[475];
+    t3 = 0.06446073109601995 * t2;
+    t1 = t13 - t3;
+    t5 = x[484];
+    t11 = 0.6977904598416801 * t1;
+    t10 = (-0.04630092430211888) * t5;
+    t6 = t11 + t10;
+    t9 = (-0.7163019434246544) * t1;
+    t7 = (-0.04510436353893373) * t5;
+    t4 = t9 + t7;
+    t12 = x[124];
+    t14 = (-0.00569735860189269) * t12;
+    t2 = x[355];
+    t13 = 0.06373852484721008 * t2;
+    t3 = t14 - t13;
+    t11 = x[604];
+    t10 = 0.3705574375098362 * t3;
+    t1 = (-0.06071743600765831) * t11;
+    t5 = t10 + t1;
+    t9 = (-0.9288095528719242) * t3;
+    t7 = (-0.024223800702303722) * t11;
+    t12 = t9 + t7;
+    t2 = x[715];
+    t14 = 0.040716385571083216 * t2;
+    t13 = x[724];
+    t10 = 0.032913357533032775 * t13;
+    t1 = t14 + t10;
+    t3 = x[235];
+    t11 = 0.05388991267917035 * t3;
+    t9 = x[244];
+    t7 = 0.05877163873142865 * t9;
+    t2 = t11 - t7;
+    t13 = (-C9) * t1;
+    t14 = C10 * t2;
+    t10 = t13 + t14;
+    t3 = C10 * t1;
+    t9 = C9 * t2;
+    t11 = t3 + t9;
+    t7 = t0 + t5;
+    t13 = t8 + t12;
+    t14 = t6 + t10;
+    t1 = t4 + t11;
+    t2 = t0 - t5;
+    t3 = t8 - t12;
+    t9 = t6 - t10;
+    t0 = t4 - t11;
+    t5 = t7 + t14;
+    t8 = t13 + t1;
+    t12 = t2 + t0;
+    t6 = t3 - t9;
+    t10 = t7 - t14;
+    t4 = t13 - t1;
+    t11 = t2 - t0;
+    t7 = t3 + t9;
+    t14 = t12 + t6;
+    t13 = t12 - t6;
+    t1 = C7 * t14;
+    t2 = (-C7) * t13;
+    t0 = -t10;
+    t3 = t11 - t7;
+    t9 = t11 + t7;
+    t12 = (-C7) * t3;
+    t6 = (-C7) * t9;
+    re[62] = t5;
+    im[62] = t8;
+    re[122] = t1;
+    im[122] = t2;
+    re[182] = t4;
+    im[182] = t0;
+    re[2] = t12;
+    im[2] = t6;
+    t14 = x[565];
+    t13 = x[85];
+    t10 = (-0.006585380010483377) * t13;
+    t11 = x[394];
+    t7 = 0.06386500273552757 * t11;
+    t3 = t10 - t7;
+    t9 = (-0.05713061913591348) * t14;
+    t5 = 0.4829003438000374 * t3;
+    t8 = t9 + t5;
+    t1 = 0.03150527956862018 * t14;
+    t2 = 0.8756753153753997 * t3;
+    t4 = t1 + t2;
+    t0 = x[34];
+    t12 = (-0.0014120709607033427) * t0;
+    t6 = x[445];
+    t13 = 0.06401129345080475 * t6;
+    t11 = t12 - t13;
+    t10 = x[514];
+    t7 = 0.6242205399450176 * t11;
+    t9 = (-0.050853538043068094) * t10;
+    t5 = t7 + t9;
+    t14 = (-0.7812481792047586) * t11;
+    t3 = (-0.04063218810656411) * t10;
+    t1 = t14 + t3;
+    t2 = x[154];
+    t0 = 0.0014850580646897857 * t2;
+    t6 = x[325];
+    t12 = 0.06411098834398946 * t6;
+    t13 = t0 - t12;
+    t7 = x[634];
+    t9 = 0.2777338458812922 * t13;
+    t11 = (-0.06243456895170441) * t7;
+    t10 = t9 + t11;
+    t14 = (-0.9606580613579353) * t13;
+    t3 = (-0.018050327841299126) * t7;
+    t2 = t14 + t3;
+    t6 = x[685];
+    t0 = 0.058753072097790196 * t6;
+    t12 = x[754];
+    t9 = 0.008585211463928835 * t12;
+    t11 = t0 + t9;
+    t13 = x[205];
+    t7 = 0.03211007605914631 * t13;
+    t14 = x[274];
+    t3 = 0.06622623693787076 * t14;
+    t6 = t7 - t3;
+    t12 = (-C11) * t11;
+    t0 = C12 * t6;
+    t9 = t12 + t0;
+    t13 = C12 * t11;
+    t14 = C11 * t6;
+    t7 = t13 + t14;
+    t3 = t8 + t10;
+    t12 = t4 + t2;
+    t0 = t5 + t9;
+    t11 = t1 + t7;
+    t6 = t8 - t10;
+    t13 = t4 - t2;
+    t14 = t5 - t9;
+    t8 = t1 - t7;
+    t10 = t3 + t0;
+    t4 = t12 + t11;
+    t2 = t6 + t8;
+    t5 = t13 - t14;
+    t9 = t3 - t0;
+    t1 = t12 - t11;
+    t7 = t6 - t8;
+    t3 = t13 + t14;
+    t0 = t2 + t5;
+    t12 = C8 * t0;
+    t11 = t2 * (-C5);
+    t6 = t5 * (-C6);
+    t8 = t12 - t6;
+    t13 = t12 + t11;
+    t14 = t9 - t1;
+    t0 = t9 + t1;
+    t2 = (-C7) * t14;
+    t5 = (-C7) * t0;
+    t6 = t7 + t3;
+    t12 = (-C4) * t6;
+    t11 = t7 * C5;
+    t9 = t3 * (-C6);
+    t1 = t12 - t9;
+    t14 = t12 + t11;
+    re[77] = t10;
+    im[77] = t4;
+    re[137] = t8;
+    im[137] = t13;
+    re[197] = t2;
+    im[197] = t5;
+    re[17] = t1;
+    im[17] = t14;
+    t0 = re[32];
+    t6 = im[32];
+    t7 = re[47];
+    t3 = im[47];
+    t9 = re[62];
+    t12 = im[62];
+    t11 = re[77];
+    t10 = im[77];
+    t4 = t0 + t9;
+    t8 = t6 + t12;
+    t13 = t7 + t11;
+    t2 = t3 + t10;
+    t5 = t0 - t9;
+    t1 = t6 - t12;
+    t14 = t7 - t11;
+    t0 = t3 - t10;
+    t9 = t4 + t13;
+    t6 = t8 + t2;
+    t12 = t5 + t0;
+    t7 = t1 - t14;
+    t11 = t4 - t13;
+    t3 = t8 - t2;
+    t10 = t5 - t0;
+    t4 = t1 + t14;
+    re[32] = t9;
+    im[32] = t6;
+    re[47] = t12;
+    im[47] = t7;
+    re[62] = t11;
+    im[62] = t3;
+    re[77] = t10;
+    im[77] = t4;
+    t13 = re[92];
+    t8 = im[92];
+    t2 = re[107];
+    t5 = im[107];
+    t0 = re[122];
+    t1 = im[122];
+    t14 = re[137];
+    t9 = im[137];
+    t6 = t13 + t0;
+    t12 = t8 + t1;
+    t7 = t2 + t14;
+    t11 = t5 + t9;
+    t3 = t13 - t0;
+    t10 = t8 - t1;
+    t4 = t2 - t14;
+    t13 = t5 - t9;
+    t0 = t6 + t7;
+    t8 = t12 + t11;
+    t1 = t3 + t13;
+    t2 = t10 - t4;
+    t14 = t6 - t7;
+    t5 = t12 - t11;
+    t9 = t3 - t13;
+    t6 = t10 + t4;
+    re[92] = t0;
+    im[92] = t8;
+    re[107] = t1;
+    im[107] = t2;
+    re[122] = t14;
+    im[122] = t5;
+    re[137] = t9;
+    im[137] = t6;
+    t7 = re[152];
+    t12 = im[152];
+    t11 = re[167];
+    t3 = im[167];
+    t13 = re[182];
+    t10 = im[182];
+    t4 = re[197];
+    t0 = im[197];
+    t8 = t7 + t13;
+    t1 = t12 + t10;
+    t2 = t11 + t4;
+    t14 = t3 + t0;
+    t5 = t7 - t13;
+    t9 = t12 - t10;
+    t6 = t11 - t4;
+    t7 = t3 - t0;
+    t13 = t8 + t2;
+    t12 = t1 + t14;
+    t10 = t5 + t7;
+    t11 = t9 - t6;
+    t4 = t8 - t2;
+    t3 = t1 - t14;
+    t0 = t5 - t7;
+    t8 = t9 + t6;
+    re[152] = t13;
+    im[152] = t12;
+    re[167] = t10;
+    im[167] = t11;
+    re[182] = t4;
+    im[182] = t3;
+    re[197] = t0;
+    im[197] = t8;
+    t2 = re[212];
+    t1 = im[212];
+    t14 = re[227];
+    t5 = im[227];
+    t7 = re[2];
+    t9 = im[2];
+    t6 = re[17];
+    t13 = im[17];
+    t12 = t2 + t7;
+    t10 = t1 + t9;
+    t11 = t14 + t6;
+    t4 = t5 + t13;
+    t3 = t2 - t7;
+    t0 = t1 - t9;
+    t8 = t14 - t6;
+    t2 = t5 - t13;
+    t7 = t12 + t11;
+    t1 = t10 + t4;
+    t9 = t3 + t2;
+    t14 = t0 - t8;
+    t6 = t12 - t11;
+    t5 = t10 - t4;
+    t13 = t3 - t2;
+    t12 = t0 + t8;
+    re[212] = t7;
+    im[212] = t1;
+    re[227] = t9;
+    im[227] = t14;
+    re[2] = t6;
+    im[2] = t5;
+    re[17] = t13;
+    im[17] = t12;
+    t11 = re[80];
+    t10 = im[80];
+    t4 = re[128];
+    t3 = im[128];
+    t2 = re[176];
+    t0 = im[176];
+    t8 = re[224];
+    t7 = im[224];
+    t1 = re[32];
+    t9 = im[32];
+    t14 = t4 + t1;
+    t6 = t3 + t9;
+    t5 = t2 + t8;
+    t13 = t0 + t7;
+    t12 = t4 - t1;
+    t4 = t3 - t9;
+    t1 = t2 - t8;
+    t3 = t0 - t7;
+    t9 = t14 + t5;
+    t2 = t6 + t13;
+    t8 = t14 - t5;
+    t0 = C13 * t8;
+    t7 = t6 - t13;
+    t14 = C13 * t7;
+    t5 = C14 * t9;
+    t8 = t11 - t5;
+    t6 = C14 * t2;
+    t13 = t10 - t6;
+    t7 = t8 + t0;
+    t5 = t13 + t14;
+    t6 = t8 - t0;
+    t8 = t13 - t14;
+    t0 = C15 * t12;
+    t13 = C16 * t1;
+    t14 = t0 + t13;
+    t0 = C15 * t4;
+    t13 = C16 * t3;
+    t0 = t0 + t13;
+    t13 = C16 * t12;
+    t12 = C15 * t1;
+    t1 = t13 - t12;
+    t13 = C16 * t4;
+    t12 = C15 * t3;
+    t4 = t13 - t12;
+    t3 = t11 + t9;
+    t13 = t10 + t2;
+    t12 = t7 + t0;
+    t11 = t5 - t14;
+    t9 = t6 + t4;
+    t10 = t8 - t1;
+    t2 = t6 - t4;
+    t6 = t8 + t1;
+    t4 = t7 - t0;
+    t8 = t5 + t14;
+    re[80] = t3;
+    im[80] = t13;
+    re[128] = t12;
+    im[128] = t11;
+    re[176] = t9;
+    im[176] = t10;
+    re[224] = t2;
+    im[224] = t6;
+    re[32] = t4;
+    im[32] = t8;
+    t1 = re[140];
+    t7 = im[140];
+    t0 = re[188];
+    t5 = im[188];
+    t14 = re[236];
+    t3 = im[236];
+    t13 = re[44];
+    t12 = im[44];
+    t11 = re[92];
+    t9 = im[92];
+    t10 = t0 + t11;
+    t2 = t5 + t9;
+    t6 = t14 + t13;
+    t4 = t3 + t12;
+    t8 = t0 - t11;
+    t0 = t5 - t9;
+    t11 = t14 - t13;
+    t5 = t3 - t12;
+    t9 = t10 + t6;
+    t14 = t2 + t4;
+    t13 = t10 - t6;
+    t3 = C13 * t13;
+    t12 = t2 - t4;
+    t10 = C13 * t12;
+    t6 = C14 * t9;
+    t13 = t1 - t6;
+    t2 = C14 * t14;
+    t4 = t7 - t2;
+    t12 = t13 + t3;
+    t6 = t4 + t10;
+    t2 = t13 - t3;
+    t13 = t4 - t10;
+    t3 = C15 * t8;
+    t4 = C16 * t11;
+    t10 = t3 + t4;
+    t3 = C15 * t0;
+    t4 = C16 * t5;
+    t3 = t3 + t4;
+    t4 = C16 * t8;
+    t8 = C15 * t11;
+    t11 = t4 - t8;
+    t4 = C16 * t0;
+    t8 = C15 * t5;
+    t0 = t4 - t8;
+    t5 = t1 + t9;
+    t4 = t7 + t14;
+    t8 = t12 + t3;
+    t1 = t6 - t10;
+    t9 = t2 + t0;
+    t7 = t13 - t11;
+    t14 = t2 - t0;
+    t2 = t13 + t11;
+    t0 = t12 - t3;
+    t13 = t6 + t10;
+    re[140] = t5;
+    im[140] = t4;
+    re[188] = t8;
+    im[188] = t1;
+    re[236] = t9;
+    im[236] = t7;
+    re[44] = t14;
+    im[44] = t2;
+    re[92] = t0;
+    im[92] = t13;
+    t11 = re[200];
+    t12 = im[200];
+    t3 = re[8];
+    t6 = im[8];
+    t10 = re[56];
+    t5 = im[56];
+    t4 = re[104];
+    t8 = im[104];
+    t1 = re[152];
+    t9 = im[152];
+    t7 = t3 + t1;
+    t14 = t6 + t9;
+    t2 = t10 + t4;
+    t0 = t5 + t8;
+    t13 = t3 - t1;
+    t3 = t6 - t9;
+    t1 = t10 - t4;
+    t6 = t5 - t8;
+    t9 = t7 + t2;
+    t10 = t14 + t0;
+    t4 = t7 - t2;
+    t5 = C13 * t4;
+    t8 = t14 - t0;
+    t7 = C13 * t8;
+    t2 = C14 * t9;
+    t4 = t11 - t2;
+    t14 = C14 * t10;
+    t0 = t12 - t14;
+    t8 = t4 + t5;
+    t2 = t0 + t7;
+    t14 = t4 - t5;
+    t4 = t0 - t7;
+    t5 = C15 * t13;
+    t0 = C16 * t1;
+    t7 = t5 + t0;
+    t5 = C15 * t3;
+    t0 = C16 * t6;
+    t5 = t5 + t0;
+    t0 = C16 * t13;
+    t13 = C15 * t1;
+    t1 = t0 - t13;
+    t0 = C16 * t3;
+    t13 = C15 * t6;
+    t3 = t0 - t13;
+    t6 = t11 + t9;
+    t0 = t12 + t10;
+    t13 = t8 + t5;
+    t11 = t2 - t7;
+    t9 = t14 + t3;
+    t12 = t4 - t1;
+    t10 = t14 - t3;
+    t14 = t4 + t1;
+    t3 = t8 - t5;
+    t4 = t2 + t7;
+    re[200] = t6;
+    im[200] = t0;
+    re[8] = t13;
+    im[8] = t11;
+    re[56] = t9;
+    im[56] = t12;
+    re[104] = t10;
+    im[104] = t14;
+    re[152] = t3;
+    im[152] = t4;
+    t1 = re[20];
+    t8 = im[20];
+    t5 = re[68];
+    t2 = im[68];
+    t7 = re[116];
+    t6 = im[116];
+    t0 = re[164];
+    t13 = im[164];
+    t11 = re[212];
+    t9 = im[212];
+    t12 = t5 + t11;
+    t10 = t2 + t9;
+    t14 = t7 + t0;
+    t3 = t6 + t13;
+    t4 = t5 - t11;
+    t5 = t2 - t9;
+    t11 = t7 - t0;
+    t2 = t6 - t13;
+    t9 = t12 + t14;
+    t7 = t10 + t3;
+    t0 = t12 - t14;
+    t6 = C13 * t0;
+    t13 = t10 - t3;
+    t12 = C13 * t13;
+    t14 = C14 * t9;
+    t0 = t1 - t14;
+    t10 = C14 * t7;
+    t3 = t8 - t10;
+    t13 = t0 + t6;
+    t14 = t3 + t12;
+    t10 = t0 - t6;
+    t0 = t3 - t12;
+    t6 = C15 * t4;
+    t3 = C16 * t11;
+    t12 = t6 + t3;
+    t6 = C15 * t5;
+    t3 = C16 * t2;
+    t6 = t6 + t3;
+    t3 = C16 * t4;
+    t4 = C15 * t11;
+    t11 = t3 - t4;
+    t3 = C16 * t5;
+    t4 = C15 * t2;
+    t5 = t3 - t4;
+    t2 = t1 + t9;
+    t3 = t8 + t7;
+    t4 = t13 + t6;
+    t1 = t14 - t12;
+    t9 = t10 + t5;
+    t8 = t0 - t11;
+    t7 = t10 - t5;
+    t10 = t0 + t11;
+    t5 = t13 - t6;
+    t0 = t14 + t12;
+    re[20] = t2;
+    im[20] = t3;
+    re[68] = t4;
+    im[68] = t1;
+    re[116] = t9;
+    im[116] = t8;
+    re[164] = t7;
+    im[164] = t10;
+    re[212] = t5;
+    im[212] = t0;
+    t11 = re[95];
+    t13 = im[95];
+    t6 = re[143];
+    t14 = im[143];
+    t12 = re[191];
+    t2 = im[191];
+    t3 = re[239];
+    t4 = im[239];
+    t1 = re[47];
+    t9 = im[47];
+    t8 = t6 + t1;
+    t7 = t14 + t9;
+    t10 = t12 + t3;
+    t5 = t2 + t4;
+    t0 = t6 - t1;
+    t6 = t14 - t9;
+    t1 = t12 - t3;
+    t14 = t2 - t4;
+    t9 = t8 + t10;
+    t12 = t7 + t5;
+    t3 = t8 - t10;
+    t2 = C13 * t3;
+    t4 = t7 - t5;
+    t8 = C13 * t4;
+    t10 = C14 * t9;
+    t3 = t11 - t10;
+    t7 = C14 * t12;
+    t5 = t13 - t7;
+    t4 = t3 + t2;
+    t10 = t5 + t8;
+    t7 = t3 - t2;
+    t3 = t5 - t8;
+    t2 = C15 * t0;
+    t5 = C16 * t1;
+    t8 = t2 + t5;
+    t2 = C15 * t6;
+    t5 = C16 * t14;
+    t2 = t2 + t5;
+    t5 = C16 * t0;
+    t0 = C15 * t1;
+    t1 = t5 - t0;
+    t5 = C16 * t6;
+    t0 = C15 * t14;
+    t6 = t5 - t0;
+    t14 = t11 + t9;
+    t5 = t13 + t12;
+    t0 = t4 + t2;
+    t11 = t10 - t8;
+    t9 = t7 + t6;
+    t13 = t3 - t1;
+    t12 = t7 - t6;
+    t7 = t3 + t1;
+    t6 = t4 - t2;
+    t3 = t10 + t8;
+    re[95] = t14;
+    im[95] = t5;
+    re[143] = t0;
+    im[143] = t11;
+    re[191] = t9;
+    im[191] = t13;
+    re[239] = t12;
+    im[239] = t7;
+    re[47] = t6;
+    im[47] = t3;
+    t1 = re[155];
+    t4 = im[155];
+    t2 = re[203];
+    t10 = im[203];
+    t8 = re[11];
+    t14 = im[11];
+    t5 = re[59];
+    t0 = im[59];
+    t11 = re[107];
+    t9 = im[107];
+    t13 = t2 + t11;
+    t12 = t10 + t9;
+    t7 = t8 + t5;
+    t6 = t14 + t0;
+    t3 = t2 - t11;
+    t2 = t10 - t9;
+    t11 = t8 - t5;
+    t10 = t14 - t0;
+    t9 = t13 + t7;
+    t8 = t12 + t6;
+    t5 = t13 - t7;
+    t14 = C13 * t5;
+    t0 = t12 - t6;
+    t13 = C13 * t0;
+    t7 = C14 * t9;
+    t5 = t1 - t7;
+    t12 = C14 * t8;
+    t6 = t4 - t12;
+    t0 = t5 + t14;
+    t7 = t6 + t13;
+    t12 = t5 - t14;
+    t5 = t6 - t13;
+    t14 = C15 * t3;
+    t6 = C16 * t11;
+    t13 = t14 + t6;
+    t14 = C15 * t2;
+    t6 = C16 * t10;
+    t14 = t14 + t6;
+    t6 = C16 * t3;
+    t3 = C15 * t11;
+    t11 = t6 - t3;
+    t6 = C16 * t2;
+    t3 = C15 * t10;
+    t2 = t6 - t3;
+    t10 = t1 + t9;
+    t6 = t4 + t8;
+    t3 = t0 + t14;
+    t1 = t7 - t13;
+    t9 = t12 + t2;
+    t4 = t5 - t11;
+    t8 = t12 - t2;
+    t12 = t5 + t11;
+    t2 = t0 - t14;
+    t5 = t7 + t13;
+    re[155] = t10;
+    im[155] = t6;
+    re[203] = t3;
+    im[203] = t1;
+    re[11] = t9;
+    im[11] = t4;
+    re[59] = t8;
+    im[59] = t12;
+    re[107] = t2;
+    im[107] = t5;
+    t11 = re[215];
+    t0 = im[215];
+    t14 = re[23];
+    t7 = im[23];
+    t13 = re[71];
+    t10 = im[71];
+    t6 = re[119];
+    t3 = im[119];
+    t1 = re[167];
+    t9 = im[167];
+    t4 = t14 + t1;
+    t8 = t7 + t9;
+    t12 = t13 + t6;
+    t2 = t10 + t3;
+    t5 = t14 - t1;
+    t14 = t7 - t9;
+    t1 = t13 - t6;
+    t7 = t10 - t3;
+    t9 = t4 + t12;
+    t13 = t8 + t2;
+    t6 = t4 - t12;
+    t10 = C13 * t6;
+    t3 = t8 - t2;
+    t4 = C13 * t3;
+    t12 = C14 * t9;
+    t6 = t11 - t12;
+    t8 = C14 * t13;
+    t2 = t0 - t8;
+    t3 = t6 + t10;
+    t12 = t2 + t4;
+    t8 = t6 - t10;
+    t6 = t2 - t4;
+    t10 = C15 * t5;
+    t2 = C16 * t1;
+    t4 = t10 + t2;
+    t10 = C15 * t14;
+    t2 = C16 * t7;
+    t10 = t10 + t2;
+    t2 = C16 * t5;
+    t5 = C15 * t1;
+    t1 = t2 - t5;
+    t2 = C16 * t14;
+    t5 = C15 * t7;
+    t14 = t2 - t5;
+    t7 = t11 + t9;
+    t2 = t0 + t13;
+    t5 = t3 + t10;
+    t11 = t12 - t4;
+    t9 = t8 + t14;
+    t0 = t6 - t1;
+    t13 = t8 - t14;
+    t8 = t6 + t1;
+    t14 = t3 - t10;
+    t6 = t12 + t4;
+    re[215] = t7;
+    im[215] = t2;
+    re[23] = t5;
+    im[23] = t11;
+    re[71] = t9;
+    im[71] = t0;
+    re[119] = t13;
+    im[119] = t8;
+    re[167] = t14;
+    im[167] = t6;
+    t1 = re[35];
+    t3 = im[35];
+    t10 = re[83];
+    t12 = im[83];
+    t4 = re[131];
+    t7 = im[131];
+    t2 = re[179];
+    t5 = im[179];
+    t11 = re[227];
+    t9 = im[227];
+    t0 = t10 + t11;
+    t13 = t12 + t9;
+    t8 = t4 + t2;
+    t14 = t7 + t5;
+    t6 = t10 - t11;
+    t10 = t12 - t9;
+    t11 = t4 - t2;
+    t12 = t7 - t5;
+    t9 = t0 + t8;
+    t4 = t13 + t14;
+    t2 = t0 - t8;
+    t7 = C13 * t2;
+    t5 = t13 - t14;
+    t0 = C13 * t5;
+    t8 = C14 * t9;
+    t2 = t1 - t8;
+    t13 = C14 * t4;
+    t14 = t3 - t13;
+    t5 = t2 + t7;
+    t8 = t14 + t0;
+    t13 = t2 - t7;
+    t2 = t14 - t0;
+    t7 = C15 * t6;
+    t14 = C16 * t11;
+    t0 = t7 + t14;
+    t7 = C15 * t10;
+    t14 = C16 * t12;
+    t7 = t7 + t14;
+    t14 = C16 * t6;
+    t6 = C15 * t11;
+    t11 = t14 - t6;
+    t14 = C16 * t10;
+    t6 = C15 * t12;
+    t10 = t14 - t6;
+    t12 = t1 + t9;
+    t14 = t3 + t4;
+    t6 = t5 + t7;
+    t1 = t8 - t0;
+    t9 = t13 + t10;
+    t3 = t2 - t11;
+    t4 = t13 - t10;
+    t13 = t2 + t11;
+    t10 = t5 - t7;
+    t2 = t8 + t0;
+    re[35] = t12;
+    im[35] = t14;
+    re[83] = t6;
+    im[83] = t1;
+    re[131] = t9;
+    im[131] = t3;
+    re[179] = t4;
+    im[179] = t13;
+    re[227] = t10;
+    im[227] = t2;
+    t11 = re[110];
+    t5 = im[110];
+    t7 = re[158];
+    t8 = im[158];
+    t0 = re[206];
+    t12 = im[206];
+    t14 = re[14];
+    t6 = im[14];
+    t1 = re[62];
+    t9 = im[62];
+    t3 = t7 + t1;
+    t4 = t8 + t9;
+    t13 = t0 + t14;
+    t10 = t12 + t6;
+    t2 = t7 - t1;
+    t7 = t8 - t9;
+    t1 = t0 - t14;
+    t8 = t12 - t6;
+    t9 = t3 + t13;
+    t0 = t4 + t10;
+    t14 = t3 - t13;
+    t12 = C13 * t14;
+    t6 = t4 - t10;
+    t3 = C13 * t6;
+    t13 = C14 * t9;
+    t14 = t11 - t13;
+    t4 = C14 * t0;
+    t10 = t5 - t4;
+    t6 = t14 + t12;
+    t13 = t10 + t3;
+    t4 = t14 - t12;
+    t14 = t10 - t3;
+    t12 = C15 * t2;
+    t10 = C16 * t1;
+    t3 = t12 + t10;
+    t12 = C15 * t7;
+    t10 = C16 * t8;
+    t12 = t12 + t10;
+    t10 = C16 * t2;
+    t2 = C15 * t1;
+    t1 = t10 - t2;
+    t10 = C16 * t7;
+    t2 = C15 * t8;
+    t7 = t10 - t2;
+    t8 = t11 + t9;
+    t10 = t5 + t0;
+    t2 = t6 + t12;
+    t11 = t13 - t3;
+    t9 = t4 + t7;
+    t5 = t14 - t1;
+    t0 = t4 - t7;
+    t4 = t14 + t1;
+    t7 = t6 - t12;
+    t14 = t13 + t3;
+    re[110] = t8;
+    im[110] = t10;
+    re[158] = t2;
+    im[158] = t11;
+    re[206] = t9;
+    im[206] = t5;
+    re[14] = t0;
+    im[14] = t4;
+    re[62] = t7;
+    im[62] = t14;
+    t1 = re[170];
+    t6 = im[170];
+    t12 = re[218];
+    t13 = im[218];
+    t3 = re[26];
+    t8 = im[26];
+    t10 = re[74];
+    t2 = im[74];
+    t11 = re[122];
+    t9 = im[122];
+    t5 = t12 + t11;
+    t0 = t13 + t9;
+    t4 = t3 + t10;
+    t7 = t8 + t2;
+    t14 = t12 - t11;
+    t12 = t13 - t9;
+    t11 = t3 - t10;
+    t13 = t8 - t2;
+    t9 = t5 + t4;
+    t3 = t0 + t7;
+    t10 = t5 - t4;
+    t8 = C13 * t10;
+    t2 = t0 - t7;
+    t5 = C13 * t2;
+    t4 = C14 * t9;
+    t10 = t1 - t4;
+    t0 = C14 * t3;
+    t7 = t6 - t0;
+    t2 = t10 + t8;
+    t4 = t7 + t5;
+    t0 = t10 - t8;
+    t10 = t7 - t5;
+    t8 = C15 * t14;
+    t7 = C16 * t11;
+    t5 = t8 + t7;
+    t8 = C15 * t12;
+    t7 = C16 * t13;
+    t8 = t8 + t7;
+    t7 = C16 * t14;
+    t14 = C15 * t11;
+    t11 = t7 - t14;
+    t7 = C16 * t12;
+    t14 = C15 * t13;
+    t12 = t7 - t14;
+    t13 = t1 + t9;
+    t7 = t6 + t3;
+    t14 = t2 + t8;
+    t1 = t4 - t5;
+    t9 = t0 + t12;
+    t6 = t10 - t11;
+    t3 = t0 - t12;
+    t0 = t10 + t11;
+    t12 = t2 - t8;
+    t10 = t4 + t5;
+    re[170] = t13;
+    im[170] = t7;
+    re[218] = t14;
+    im[218] = t1;
+    re[26] = t9;
+    im[26] = t6;
+    re[74] = t3;
+    im[74] = t0;
+    re[122] = t12;
+    im[122] = t10;
+    t11 = re[230];
+    t2 = im[230];
+    t8 = re[38];
+    t4 = im[38];
+    t5 = re[86];
+    t13 = im[86];
+    t7 = re[134];
+    t14 = im[134];
+    t1 = re[182];
+    t9 = im[182];
+    t6 = t8 + t1;
+    t3 = t4 + t9;
+    t0 = t5 + t7;
+    t12 = t13 + t14;
+    t10 = t8 - t1;
+    t8 = t4 - t9;
+    t1 = t5 - t7;
+    t4 = t13 - t14;
+    t9 = t6 + t0;
+    t5 = t3 + t12;
+    t7 = t6 - t0;
+    t13 = C13 * t7;
+    t14 = t3 - t12;
+    t6 = C13 * t14;
+    t0 = C14 * t9;
+    t7 = t11 - t0;
+    t3 = C14 * t5;
+    t12 = t2 - t3;
+    t14 = t7 + t13;
+    t0 = t12 + t6;
+    t3 = t7 - t13;
+    t7 = t12 - t6;
+    t13 = C15 * t10;
+    t12 = C16 * t1;
+    t6 = t13 + t12;
+    t13 = C15 * t8;
+    t12 = C16 * t4;
+    t13 = t13 + t12;
+    t12 = C16 * t10;
+    t10 = C15 * t1;
+    t1 = t12 - t10;
+    t12 = C16 * t8;
+    t10 = C15 * t4;
+    t8 = t12 - t10;
+    t4 = t11 + t9;
+    t12 = t2 + t5;
+    t10 = t14 + t13;
+    t11 = t0 - t6;
+    t9 = t3 + t8;
+    t2 = t7 - t1;
+    t5 = t3 - t8;
+    t3 = t7 + t1;
+    t8 = t14 - t13;
+    t7 = t0 + t6;
+    re[230] = t4;
+    im[230] = t12;
+    re[38] = t10;
+    im[38] = t11;
+    re[86] = t9;
+    im[86] = t2;
+    re[134] = t5;
+    im[134] = t3;
+    re[182] = t8;
+    im[182] = t7;
+    t1 = re[50];
+    t14 = im[50];
+    t13 = re[98];
+    t0 = im[98];
+    t6 = re[146];
+    t4 = im[146];
+    t12 = re[194];
+    t10 = im[194];
+    t11 = re[2];
+    t9 = im[2];
+    t2 = t13 + t11;
+    t5 = t0 + t9;
+    t3 = t6 + t12;
+    t8 = t4 + t10;
+    t7 = t13 - t11;
+    t13 = t0 - t9;
+    t11 = t6 - t12;
+    t0 = t4 - t10;
+    t9 = t2 + t3;
+    t6 = t5 + t8;
+    t12 = t2 - t3;
+    t4 = C13 * t12;
+    t10 = t5 - t8;
+    t2 = C13 * t10;
+    t3 = C14 * t9;
+    t12 = t1 - t3;
+    t5 = C14 * t6;
+    t8 = t14 - t5;
+    t10 = t12 + t4;
+    t3 = t8 + t2;
+    t5 = t12 - t4;
+    t12 = t8 - t2;
+    t4 = C15 * t7;
+    t8 = C16 * t11;
+    t2 = t4 + t8;
+    t4 = C15 * t13;
+    t8 = C16 * t0;
+    t4 = t4 + t8;
+    t8 = C16 * t7;
+    t7 = C15 * t11;
+    t11 = t8 - t7;
+    t8 = C16 * t13;
+    t7 = C15 * t0;
+    t13 = t8 - t7;
+    t0 = t1 + t9;
+    t8 = t14 + t6;
+    t7 = t10 + t4;
+    t1 = t3 - t2;
+    t9 = t5 + t13;
+    t14 = t12 - t11;
+    t6 = t5 - t13;
+    t5 = t12 + t11;
+    t13 = t10 - t4;
+    t12 = t3 + t2;
+    re[50] = t0;
+    im[50] = t8;
+    re[98] = t7;
+    im[98] = t1;
+    re[146] = t9;
+    im[146] = t14;
+    re[194] = t6;
+    im[194] = t5;
+    re[2] = t13;
+    im[2] = t12;
+    t11 = re[125];
+    t10 = im[125];
+    t4 = re[173];
+    t3 = im[173];
+    t2 = re[221];
+    t0 = im[221];
+    t8 = re[29];
+    t7 = im[29];
+    t1 = re[77];
+    t9 = im[77];
+    t14 = t4 + t1;
+    t6 = t3 + t9;
+    t5 = t2 + t8;
+    t13 = t0 + t7;
+    t12 = t4 - t1;
+    t4 = t3 - t9;
+    t1 = t2 - t8;
+    t3 = t0 - t7;
+    t9 = t14 + t5;
+    t2 = t6 + t13;
+    t8 = t14 - t5;
+    t0 = C13 * t8;
+    t7 = t6 - t13;
+    t14 = C13 * t7;
+    t5 = C14 * t9;
+    t8 = t11 - t5;
+    t6 = C14 * t2;
+    t13 = t10 - t6;
+    t7 = t8 + t0;
+    t5 = t13 + t14;
+    t6 = t8 - t0;
+    t8 = t13 - t14;
+    t0 = C15 * t12;
+    t13 = C16 * t1;
+    t14 = t0 + t13;
+    t0 = C15 * t4;
+    t13 = C16 * t3;
+    t0 = t0 + t13;
+    t13 = C16 * t12;
+    t12 = C15 * t1;
+    t1 = t13 - t12;
+    t13 = C16 * t4;
+    t12 = C15 * t3;
+    t4 = t13 - t12;
+    t3 = t11 + t9;
+    t13 = t10 + t2;
+    t12 = t7 + t0;
+    t11 = t5 - t14;
+    t9 = t6 + t4;
+    t10 = t8 - t1;
+    t2 = t6 - t4;
+    t6 = t8 + t1;
+    t4 = t7 - t0;
+    t8 = t5 + t14;
+    re[125] = t3;
+    im[125] = t13;
+    re[173] = t12;
+    im[173] = t11;
+    re[221] = t9;
+    im[221] = t10;
+    re[29] = t2;
+    im[29] = t6;
+    re[77] = t4;
+    im[77] = t8;
+    t1 = re[185];
+    t7 = im[185];
+    t0 = re[233];
+    t5 = im[233];
+    t14 = re[41];
+    t3 = im[41];
+    t13 = re[89];
+    t12 = im[89];
+    t11 = re[137];
+    t9 = im[137];
+    t10 = t0 + t11;
+    t2 = t5 + t9;
+    t6 = t14 + t13;
+    t4 = t3 + t12;
+    t8 = t0 - t11;
+    t0 = t5 - t9;
+    t11 = t14 - t13;
+    t5 = t3 - t12;
+    t9 = t10 + t6;
+    t14 = t2 + t4;
+    t13 = t10 - t6;
+    t3 = C13 * t13;
+    t12 = t2 - t4;
+    t10 = C13 * t12;
+    t6 = C14 * t9;
+    t13 = t1 - t6;
+    t2 = C14 * t14;
+    t4 = t7 - t2;
+    t12 = t13 + t3;
+    t6 = t4 + t10;
+    t2 = t13 - t3;
+    t13 = t4 - t10;
+    t3 = C15 * t8;
+    t4 = C16 * t11;
+    t10 = t3 + t4;
+    t3 = C15 * t0;
+    t4 = C16 * t5;
+    t3 = t3 + t4;
+    t4 = C16 * t8;
+    t8 = C15 * t11;
+    t11 = t4 - t8;
+    t4 = C16 * t0;
+    t8 = C15 * t5;
+    t0 = t4 - t8;
+    t5 = t1 + t9;
+    t4 = t7 + t14;
+    t8 = t12 + t3;
+    t1 = t6 - t10;
+    t9 = t2 + t0;
+    t7 = t13 - t11;
+    t14 = t2 - t0;
+    t2 = t13 + t11;
+    t0 = t12 - t3;
+    t13 = t6 + t10;
+    re[185] = t5;
+    im[185] = t4;
+    re[233] = t8;
+    im[233] = t1;
+    re[41] = t9;
+    im[41] = t7;
+    re[89] = t14;
+    im[89] = t2;
+    re[137] = t0;
+    im[137] = t13;
+    t11 = re[5];
+    t12 = im[5];
+    t3 = re[53];
+    t6 = im[53];
+    t10 = re[101];
+    t5 = im[101];
+    t4 = re[149];
+    t8 = im[149];
+    t1 = re[197];
+    t9 = im[197];
+    t7 = t3 + t1;
+    t14 = t6 + t9;
+    t2 = t10 + t4;
+    t0 = t5 + t8;
+    t13 = t3 - t1;
+    t3 = t6 - t9;
+    t1 = t10 - t4;
+    t6 = t5 - t8;
+    t9 = t7 + t2;
+    t10 = t14 + t0;
+    t4 = t7 - t2;
+    t5 = C13 * t4;
+    t8 = t14 - t0;
+    t7 = C13 * t8;
+    t2 = C14 * t9;
+    t4 = t11 - t2;
+    t14 = C14 * t10;
+    t0 = t12 - t14;
+    t8 = t4 + t5;
+    t2 = t0 + t7;
+    t14 = t4 - t5;
+    t4 = t0 - t7;
+    t5 = C15 * t13;
+    t0 = C16 * t1;
+    t7 = t5 + t0;
+    t5 = C15 * t3;
+    t0 = C16 * t6;
+    t5 = t5 + t0;
+    t0 = C16 * t13;
+    t13 = C15 * t1;
+    t1 = t0 - t13;
+    t0 = C16 * t3;
+    t13 = C15 * t6;
+    t3 = t0 - t13;
+    t6 = t11 + t9;
+    t0 = t12 + t10;
+    t13 = t8 + t5;
+    t11 = t2 - t7;
+    t9 = t14 + t3;
+    t12 = t4 - t1;
+    t10 = t14 - t3;
+    t14 = t4 + t1;
+    t3 = t8 - t5;
+    t4 = t2 + t7;
+    re[5] = t6;
+    im[5] = t0;
+    re[53] = t13;
+    im[53] = t11;
+    re[101] = t9;
+    im[101] = t12;
+    re[149] = t10;
+    im[149] = t14;
+    re[197] = t3;
+    im[197] = t4;
+    t1 = re[65];
+    t8 = im[65];
+    t5 = re[113];
+    t2 = im[113];
+    t7 = re[161];
+    t6 = im[161];
+    t0 = re[209];
+    t13 = im[209];
+    t11 = re[17];
+    t9 = im[17];
+    t12 = t5 + t11;
+    t10 = t2 + t9;
+    t14 = t7 + t0;
+    t3 = t6 + t13;
+    t4 = t5 - t11;
+    t5 = t2 - t9;
+    t11 = t7 - t0;
+    t2 = t6 - t13;
+    t9 = t12 + t14;
+    t7 = t10 + t3;
+    t0 = t12 - t14;
+    t6 = C13 * t0;
+    t13 = t10 - t3;
+    t12 = C13 * t13;
+    t14 = C14 * t9;
+    t0 = t1 - t14;
+    t10 = C14 * t7;
+    t3 = t8 - t10;
+    t13 = t0 + t6;
+    t14 = t3 + t12;
+    t10 = t0 - t6;
+    t0 = t3 - t12;
+    t6 = C15 * t4;
+    t3 = C16 * t11;
+    t12 = t6 + t3;
+    t6 = C15 * t5;
+    t3 = C16 * t2;
+    t6 = t6 + t3;
+    t3 = C16 * t4;
+    t4 = C15 * t11;
+    t11 = t3 - t4;
+    t3 = C16 * t5;
+    t4 = C15 * t2;
+    t5 = t3 - t4;
+    t2 = t1 + t9;
+    t3 = t8 + t7;
+    t4 = t13 + t6;
+    t1 = t14 - t12;
+    t9 = t10 + t5;
+    t8 = t0 - t11;
+    t7 = t10 - t5;
+    t10 = t0 + t11;
+    t5 = t13 - t6;
+    t0 = t14 + t12;
+    re[65] = t2;
+    im[65] = t3;
+    re[113] = t4;
+    im[113] = t1;
+    re[161] = t9;
+    im[161] = t8;
+    re[209] = t7;
+    im[209] = t10;
+    re[17] = t5;
+    im[17] = t0;
+}
+
+/**
+ *  Part 5 of ApplyWindowedMDCT_W10_480().
+ * 
+ *  @param {Number[]} x 
+ *    - The input block (960 points).
+ *  @param {Number[]} X 
+ *    - The array that would contain the output block (480 points).
+ *  @param {Number[]} re 
+ *    - The scratch buffer (real part, 240 points).
+ *  @param {Number[]} im 
+ *    - The scratch buffer (imaginary part, 240 points).
+ */
+function ApplyWindowedMDCT_W10_480_Part5(x, X, re, im) {
+    let t0, t1, t10, t11, t12, t13, t14, t2, t3, t4, t5, t6, t7, t8, t9;
+    const C0 = 0.13052619222005157;
+    const C1 = 0.9914448613738104;
+    const C2 = 0.03271908282177614;
+    const C3 = 0.9994645874763657;
+    const C4 = 0.9238795325112867;
+    const C5 = 1.3065629648763766;
+    const C6 = 0.5411961001461969;
+    const C7 = 0.7071067811865476;
+    const C8 = 0.3826834323650898;
+    const C9 = 0.9978589232386035;
+    const C10 = 0.06540312923014306;
+    const C11 = 0.986643332084879;
+    const C12 = 0.16289547339458874;
+    const C13 = 0.9832549075639546;
+    const C14 = 0.18223552549214747;
+    const C15 = 0.11103530855427768;
+    const C16 = 0.9938164620563781;
+    const C17 = 0.01308959557134444;
+    const C18 = 0.999914327574007;
+    const C19 = 0.9963824715083254;
+    const C20 = 0.08498217737244167;
+    const C21 = 0.9945218953682733;
+    const C22 = 0.10452846326765346;
+    const C23 = 0.18866696468655522;
+    const C24 = 0.9820411276703039;
+    const C25 = 0.09150161866340238;
+    const C26 = 0.9958049275746618;
+    const C27 = 0.9999785816641292;
+    const C28 = 0.006544937967351858;
+    const C29 = 0.9996573249755573;
+    const C30 = 0.02617694830787315;
+    const C31 = 0.992277912105967;
+    const C32 = 0.12403445145048532;
+    const C33 = 0.1693495038490246;
+    const C34 = 0.9855560590580777;
+    const C35 = 0.07193265315671939;
+    const C36 = 0.9974094913373519;
+    t11 = x[80];
+    t13 = (-0.006213011038741749) * t11;
+    t6 = x[399];
+    t14 = 0.06388074623827882 * t6;
+    t12 = t13 - t14;
+    t2 = x[560];
+    t3 = 0.49999999999999994 * t12;
+    t4 = (-0.056487116931531724) * t2;
+    t1 = t3 + t4;
+    t9 = (-0.8660254037844387) * t12;
+    t8 = (-0.0326128521661657) * t2;
+    t7 = t9 + t8;
+    t10 = x[200];
+    t5 = 0.02826705866069585 * t10;
+    t0 = x[279];
+    t11 = 0.06633445460906878 * t0;
+    t6 = t5 - t11;
+    t13 = x[680];
+    t14 = 0.060309534865694944 * t13;
+    t3 = x[759];
+    t4 = 0.005874914882993542 * t3;
+    t12 = t14 + t4;
+    t2 = C0 * t6;
+    t9 = (-C1) * t12;
+    t8 = t2 + t9;
+    t10 = (-C1) * t6;
+    t0 = (-C0) * t12;
+    t5 = t10 + t0;
+    t11 = x[639];
+    t13 = x[159];
+    t3 = 0.0034257402094298017 * t13;
+    t14 = x[320];
+    t4 = 0.06426416257419922 * t14;
+    t2 = t3 - t4;
+    t9 = (-0.06262729928557337) * t11;
+    t6 = 0.25881904510252074 * t2;
+    t12 = t9 + t6;
+    t10 = 0.01678093426771161 * t11;
+    t0 = 0.9659258262890683 * t2;
+    t13 = t10 + t0;
+    t14 = x[519];
+    t3 = x[39];
+    t4 = (-0.001854765852225621) * t3;
+    t9 = x[440];
+    t6 = 0.06397390823714251 * t9;
+    t11 = t4 - t6;
+    t2 = (-0.051671673795926236) * t14;
+    t10 = 0.6087614290087207 * t11;
+    t0 = t2 + t10;
+    t3 = 0.03964906981765945 * t14;
+    t9 = 0.7933533402912352 * t11;
+    t4 = t3 + t9;
+    t6 = t1 + t12;
+    t2 = t7 + t13;
+    t10 = t8 + t0;
+    t14 = t5 + t4;
+    t11 = t1 - t12;
+    t3 = t7 - t13;
+    t9 = t8 - t0;
+    t1 = t5 - t4;
+    t12 = t6 + t10;
+    t7 = t2 + t14;
+    t13 = t11 + t1;
+    t8 = t3 - t9;
+    t0 = t6 - t10;
+    t5 = t2 - t14;
+    t4 = t11 - t1;
+    t6 = t3 + t9;
+    re[160] = t12;
+    im[160] = t7;
+    re[220] = t13;
+    im[220] = t8;
+    re[40] = t0;
+    im[40] = t5;
+    re[100] = t4;
+    im[100] = t6;
+    t10 = x[110];
+    t2 = (-0.006919324745364981) * t10;
+    t14 = x[369];
+    t11 = 0.06375719098989517 * t14;
+    t1 = t2 - t11;
+    t3 = x[590];
+    t9 = 0.41270702980439467 * t1;
+    t12 = (-0.05952686870682671) * t3;
+    t7 = t9 + t12;
+    t13 = (-0.9108638249211758) * t1;
+    t8 = (-0.026971273318134693) * t3;
+    t0 = t13 + t8;
+    t5 = x[230];
+    t4 = 0.05072104285218912 * t5;
+    t6 = x[249];
+    t10 = 0.060964555912742815 * t6;
+    t14 = t4 - t10;
+    t2 = x[710];
+    t11 = 0.0447084089204744 * t2;
+    t9 = x[729];
+    t12 = 0.02841105565325448 * t9;
+    t1 = t11 + t12;
+    t3 = C2 * t14;
+    t13 = (-C3) * t1;
+    t8 = t3 + t13;
+    t5 = (-C3) * t14;
+    t6 = (-C2) * t1;
+    t4 = t5 + t6;
+    t10 = x[609];
+    t2 = x[129];
+    t9 = (-0.004967734229580542) * t2;
+    t11 = x[350];
+    t12 = 0.06375299801573686 * t11;
+    t3 = t9 - t12;
+    t13 = (-0.06116744544614108) * t10;
+    t14 = 0.3522500479212335 * t3;
+    t1 = t13 + t14;
+    t5 = 0.023021796287020873 * t10;
+    t6 = 0.9359059267573258 * t3;
+    t2 = t5 + t6;
+    t11 = x[489];
+    t9 = x[9];
+    t12 = (-0.00014569399935573593) * t9;
+    t13 = x[470];
+    t14 = 0.06436471177753121 * t13;
+    t10 = t12 - t14;
+    t3 = (-0.04724794408182609) * t11;
+    t5 = 0.6835923020228712 * t10;
+    t6 = t3 + t5;
+    t9 = 0.04425252875012376 * t11;
+    t13 = 0.7298640726978356 * t10;
+    t12 = t9 + t13;
+    t14 = t7 + t1;
+    t3 = t0 + t2;
+    t5 = t8 + t6;
+    t11 = t4 + t12;
+    t10 = t7 - t1;
+    t9 = t0 - t2;
+    t13 = t8 - t6;
+    t7 = t4 - t12;
+    t1 = t14 + t5;
+    t0 = t3 + t11;
+    t2 = t10 + t7;
+    t8 = t9 - t13;
+    t6 = t14 - t5;
+    t4 = t3 - t11;
+    t12 = t10 - t7;
+    t14 = t9 + t13;
+    t5 = t2 + t8;
+    t3 = C4 * t5;
+    t11 = t2 * (-C5);
+    t10 = t8 * C6;
+    t7 = t3 - t10;
+    t9 = t3 + t11;
+    t13 = t6 + t4;
+    t5 = t6 - t4;
+    t2 = C7 * t13;
+    t8 = (-C7) * t5;
+    t10 = t12 + t14;
+    t3 = C8 * t10;
+    t11 = t12 * (-C5);
+    t6 = t14 * (-C6);
+    t4 = t3 - t6;
+    t13 = t3 + t11;
+    re[175] = t1;
+    im[175] = t0;
+    re[235] = t7;
+    im[235] = t9;
+    re[55] = t2;
+    im[55] = t8;
+    re[115] = t4;
+    im[115] = t13;
+    t5 = x[140];
+    t10 = (-0.0027455938395023523) * t5;
+    t12 = x[339];
+    t14 = 0.06384226992275727 * t12;
+    t6 = t10 - t14;
+    t3 = x[620];
+    t11 = 0.3214394653031616 * t6;
+    t1 = (-0.06180140854959131) * t3;
+    t0 = t11 + t1;
+    t7 = (-0.9469301294951057) * t6;
+    t9 = (-0.020978751335914217) * t3;
+    t2 = t7 + t9;
+    t8 = x[699];
+    t4 = 0.05220426409168448 * t8;
+    t13 = x[740];
+    t5 = 0.018758124542946664 * t13;
+    t12 = t4 + t5;
+    t10 = x[219];
+    t14 = 0.042898717811937714 * t10;
+    t11 = x[260];
+    t1 = 0.06440024074112252 * t11;
+    t6 = t14 - t1;
+    t3 = (-C9) * t12;
+    t7 = C10 * t6;
+    t9 = t3 + t7;
+    t8 = C10 * t12;
+    t13 = C9 * t6;
+    t4 = t8 + t13;
+    t5 = x[579];
+    t10 = x[99];
+    t11 = (-0.007126113859786178) * t10;
+    t14 = x[380];
+    t1 = 0.06380456147299418 * t14;
+    t3 = t11 - t1;
+    t7 = (-0.05856900619821523) * t5;
+    t12 = 0.4422886902190013 * t3;
+    t6 = t7 + t12;
+    t8 = 0.028883037513848943 * t5;
+    t13 = 0.8968727415326883 * t3;
+    t10 = t8 + t13;
+    t14 = x[20];
+    t11 = (-0.0005080981582550777) * t14;
+    t1 = x[459];
+    t7 = 0.06417734815829848 * t1;
+    t12 = t11 - t7;
+    t5 = x[500];
+    t3 = 0.6593458151000688 * t12;
+    t8 = (-0.04881264113264344) * t5;
+    t13 = t3 + t8;
+    t14 = (-0.7518398074789774) * t12;
+    t1 = (-0.0428075373698404) * t5;
+    t11 = t14 + t1;
+    t7 = t0 + t6;
+    t3 = t2 + t10;
+    t8 = t9 + t13;
+    t12 = t4 + t11;
+    t5 = t0 - t6;
+    t14 = t2 - t10;
+    t1 = t9 - t13;
+    t0 = t4 - t11;
+    t6 = t7 + t8;
+    t2 = t3 + t12;
+    t10 = t5 + t0;
+    t9 = t14 - t1;
+    t13 = t7 - t8;
+    t4 = t3 - t12;
+    t11 = t5 - t0;
+    t7 = t14 + t1;
+    t8 = t10 + t9;
+    t3 = t10 - t9;
+    t12 = C7 * t8;
+    t5 = (-C7) * t3;
+    t0 = -t13;
+    t14 = t11 - t7;
+    t1 = t11 + t7;
+    t10 = (-C7) * t14;
+    t9 = (-C7) * t1;
+    re[190] = t6;
+    im[190] = t2;
+    re[10] = t12;
+    im[10] = t5;
+    re[70] = t4;
+    im[70] = t0;
+    re[130] = t10;
+    im[130] = t9;
+    t8 = x[170];
+    t3 = 0.008561055072937852 * t8;
+    t13 = x[309];
+    t11 = 0.06474846112421331 * t13;
+    t7 = t3 - t11;
+    t14 = x[650];
+    t1 = 0.22707626303437323 * t7;
+    t6 = (-0.0626705357399055) * t14;
+    t2 = t1 + t6;
+    t12 = (-0.9738769792773336) * t7;
+    t5 = (-0.014612719430682085) * t14;
+    t4 = t12 + t5;
+    t0 = x[669];
+    t10 = 0.0625959792930312 * t0;
+    t9 = x[770];
+    t8 = 0.0018651955361572374 * t9;
+    t13 = t10 + t8;
+    t3 = x[189];
+    t11 = 0.02021441367069516 * t3;
+    t1 = x[290];
+    t6 = 0.06596210937435924 * t1;
+    t7 = t11 - t6;
+    t14 = (-C11) * t13;
+    t12 = C12 * t7;
+    t5 = t14 + t12;
+    t0 = C12 * t13;
+    t9 = C11 * t7;
+    t10 = t0 + t9;
+    t8 = x[549];
+    t3 = x[69];
+    t1 = (-0.005156238730818343) * t3;
+    t11 = x[410];
+    t6 = 0.06390164712913438 * t11;
+    t14 = t1 - t6;
+    t12 = (-0.05537169356334467) * t8;
+    t13 = 0.528067850650368 * t14;
+    t7 = t12 + t13;
+    t0 = 0.034432331714342235 * t8;
+    t9 = 0.8492021815265789 * t14;
+    t3 = t0 + t9;
+    t11 = x[50];
+    t1 = (-0.0029983489972161405) * t11;
+    t6 = x[429];
+    t12 = 0.06392648785624468 * t6;
+    t13 = t1 - t12;
+    t8 = x[530];
+    t14 = 0.5824776968678022 * t13;
+    t0 = (-0.052980560943917863) * t8;
+    t9 = t14 + t0;
+    t11 = (-0.8128466845916152) * t13;
+    t6 = (-0.03796533307247476) * t8;
+    t1 = t11 + t6;
+    t12 = t2 + t7;
+    t14 = t4 + t3;
+    t0 = t5 + t9;
+    t13 = t10 + t1;
+    t8 = t2 - t7;
+    t11 = t4 - t3;
+    t6 = t5 - t9;
+    t2 = t10 - t1;
+    t7 = t12 + t0;
+    t4 = t14 + t13;
+    t3 = t8 + t2;
+    t5 = t11 - t6;
+    t9 = t12 - t0;
+    t10 = t14 - t13;
+    t1 = t8 - t2;
+    t12 = t11 + t6;
+    t0 = t3 + t5;
+    t14 = C8 * t0;
+    t13 = t3 * (-C5);
+    t8 = t5 * (-C6);
+    t2 = t14 - t8;
+    t11 = t14 + t13;
+    t6 = t9 - t10;
+    t0 = t9 + t10;
+    t3 = (-C7) * t6;
+    t5 = (-C7) * t0;
+    t8 = t1 + t12;
+    t14 = (-C4) * t8;
+    t13 = t1 * C5;
+    t9 = t12 * (-C6);
+    t10 = t14 - t9;
+    t6 = t14 + t13;
+    re[205] = t7;
+    im[205] = t4;
+    re[25] = t2;
+    im[25] = t11;
+    re[85] = t3;
+    im[85] = t5;
+    re[145] = t10;
+    im[145] = t6;
+    t0 = re[160];
+    t8 = im[160];
+    t1 = re[175];
+    t12 = im[175];
+    t9 = re[190];
+    t14 = im[190];
+    t13 = re[205];
+    t7 = im[205];
+    t4 = t0 + t9;
+    t2 = t8 + t14;
+    t11 = t1 + t13;
+    t3 = t12 + t7;
+    t5 = t0 - t9;
+    t10 = t8 - t14;
+    t6 = t1 - t13;
+    t0 = t12 - t7;
+    t9 = t4 + t11;
+    t8 = t2 + t3;
+    t14 = t5 + t0;
+    t1 = t10 - t6;
+    t13 = t4 - t11;
+    t12 = t2 - t3;
+    t7 = t5 - t0;
+    t4 = t10 + t6;
+    re[160] = t9;
+    im[160] = t8;
+    re[175] = t14;
+    im[175] = t1;
+    re[190] = t13;
+    im[190] = t12;
+    re[205] = t7;
+    im[205] = t4;
+    t11 = re[220];
+    t2 = im[220];
+    t3 = re[235];
+    t5 = im[235];
+    t0 = re[10];
+    t10 = im[10];
+    t6 = re[25];
+    t9 = im[25];
+    t8 = t11 + t0;
+    t14 = t2 + t10;
+    t1 = t3 + t6;
+    t13 = t5 + t9;
+    t12 = t11 - t0;
+    t7 = t2 - t10;
+    t4 = t3 - t6;
+    t11 = t5 - t9;
+    t0 = t8 + t1;
+    t2 = t14 + t13;
+    t10 = t12 + t11;
+    t3 = t7 - t4;
+    t6 = t8 - t1;
+    t5 = t14 - t13;
+    t9 = t12 - t11;
+    t8 = t7 + t4;
+    re[220] = t0;
+    im[220] = t2;
+    re[235] = t10;
+    im[235] = t3;
+    re[10] = t6;
+    im[10] = t5;
+    re[25] = t9;
+    im[25] = t8;
+    t1 = re[40];
+    t14 = im[40];
+    t13 = re[55];
+    t12 = im[55];
+    t11 = re[70];
+    t7 = im[70];
+    t4 = re[85];
+    t0 = im[85];
+    t2 = t1 + t11;
+    t10 = t14 + t7;
+    t3 = t13 + t4;
+    t6 = t12 + t0;
+    t5 = t1 - t11;
+    t9 = t14 - t7;
+    t8 = t13 - t4;
+    t1 = t12 - t0;
+    t11 = t2 + t3;
+    t14 = t10 + t6;
+    t7 = t5 + t1;
+    t13 = t9 - t8;
+    t4 = t2 - t3;
+    t12 = t10 - t6;
+    t0 = t5 - t1;
+    t2 = t9 + t8;
+    re[40] = t11;
+    im[40] = t14;
+    re[55] = t7;
+    im[55] = t13;
+    re[70] = t4;
+    im[70] = t12;
+    re[85] = t0;
+    im[85] = t2;
+    t3 = re[100];
+    t10 = im[100];
+    t6 = re[115];
+    t5 = im[115];
+    t1 = re[130];
+    t9 = im[130];
+    t8 = re[145];
+    t11 = im[145];
+    t14 = t3 + t1;
+    t7 = t10 + t9;
+    t13 = t6 + t8;
+    t4 = t5 + t11;
+    t12 = t3 - t1;
+    t0 = t10 - t9;
+    t2 = t6 - t8;
+    t3 = t5 - t11;
+    t1 = t14 + t13;
+    t10 = t7 + t4;
+    t9 = t12 + t3;
+    t6 = t0 - t2;
+    t8 = t14 - t13;
+    t5 = t7 - t4;
+    t11 = t12 - t3;
+    t14 = t0 + t2;
+    re[100] = t1;
+    im[100] = t10;
+    re[115] = t9;
+    im[115] = t6;
+    re[130] = t8;
+    im[130] = t5;
+    re[145] = t11;
+    im[145] = t14;
+    t13 = x[176];
+    t7 = 0.011873482107928959 * t13;
+    t4 = x[303];
+    t12 = 0.0651193665137016 * t4;
+    t3 = t7 - t12;
+    t0 = x[656];
+    t2 = 0.20791169081775931 * t3;
+    t1 = (-0.06258683432063152) * t0;
+    t10 = t2 + t1;
+    t9 = (-0.9781476007338057) * t3;
+    t6 = (-0.013303242309004766) * t0;
+    t8 = t9 + t6;
+    t5 = x[663];
+    t11 = 0.06335931798947163 * t5;
+    t14 = x[776];
+    t13 = 0.0007155716786729976 * t14;
+    t4 = t11 + t13;
+    t7 = x[183];
+    t12 = 0.016178875664066894 * t7;
+    t2 = x[296];
+    t1 = 0.0655797703210621 * t2;
+    t3 = t12 - t1;
+    t0 = (-C13) * t4;
+    t9 = C14 * t3;
+    t6 = t0 + t9;
+    t5 = C14 * t4;
+    t14 = C13 * t3;
+    t11 = t5 + t14;
+    t13 = x[543];
+    t7 = x[63];
+    t2 = (-0.0044900766713811035) * t7;
+    t12 = x[416];
+    t1 = 0.06390765994078162 * t12;
+    t0 = t2 - t1;
+    t9 = (-0.05467984124298484) * t13;
+    t4 = 0.544639035015027 * t0;
+    t3 = t9 + t4;
+    t5 = 0.03550950409802875 * t13;
+    t14 = 0.838670567945424 * t0;
+    t7 = t5 + t14;
+    t12 = x[56];
+    t2 = (-0.0036826411595666368) * t12;
+    t1 = x[423];
+    t9 = 0.06391507343146448 * t1;
+    t4 = t2 - t9;
+    t13 = x[536];
+    t0 = 0.5664062369248328 * t4;
+    t5 = (-0.05372534106434988) * t13;
+    t14 = t0 + t5;
+    t12 = (-0.8241261886220156) * t4;
+    t1 = (-0.036924403907905) * t13;
+    t2 = t12 + t1;
+    t9 = t10 + t3;
+    t0 = t8 + t7;
+    t5 = t6 + t14;
+    t4 = t11 + t2;
+    t13 = t10 - t3;
+    t12 = t8 - t7;
+    t1 = t6 - t14;
+    t10 = t11 - t2;
+    t3 = t9 + t5;
+    t8 = t0 + t4;
+    t7 = t13 + t10;
+    t6 = t12 - t1;
+    t14 = t9 - t5;
+    t11 = t0 - t4;
+    t2 = t13 - t10;
+    t9 = t12 + t1;
+    re[208] = t3;
+    im[208] = t8;
+    re[28] = t7;
+    im[28] = t6;
+    re[88] = t14;
+    im[88] = t11;
+    re[148] = t2;
+    im[148] = t9;
+    t5 = x[206];
+    t0 = 0.032885483701619124 * t5;
+    t4 = x[273];
+    t13 = 0.06617571199292888 * t4;
+    t10 = t0 - t13;
+    t12 = x[686];
+    t1 = 0.05839568485751641 * t12;
+    t3 = x[753];
+    t8 = 0.009192221304956522 * t3;
+    t7 = t1 + t8;
+    t6 = C15 * t10;
+    t14 = (-C16) * t7;
+    t11 = t6 + t14;
+    t2 = (-C16) * t10;
+    t9 = (-C15) * t7;
+    t5 = t2 + t9;
+    t4 = x[633];
+    t0 = x[153];
+    t13 = 0.0011253587763649148 * t0;
+    t12 = x[326];
+    t3 = 0.06408446011643425 * t12;
+    t1 = t13 - t3;
+    t8 = (-0.06246041419483286) * t4;
+    t6 = 0.2777338458812922 * t1;
+    t14 = t8 + t6;
+    t10 = 0.018057799905564796 * t4;
+    t7 = 0.9606580613579353 * t1;
+    t2 = t10 + t7;
+    t9 = x[513];
+    t0 = x[33];
+    t12 = (-0.001330599200485381) * t0;
+    t13 = x[446];
+    t3 = 0.0640201095261462 * t13;
+    t8 = t12 - t3;
+    t6 = (-0.05084653510873879) * t9;
+    t4 = 0.6242205399450176 * t8;
+    t1 = t6 + t4;
+    t10 = 0.04062659273294968 * t9;
+    t7 = 0.7812481792047586 * t8;
+    t0 = t10 + t7;
+    t13 = x[86];
+    t12 = (-0.006649807866197572) * t13;
+    t3 = x[393];
+    t6 = 0.0638613976780427 * t3;
+    t4 = t12 - t6;
+    t9 = x[566];
+    t8 = 0.4829003438000374 * t4;
+    t10 = (-0.057133844232350774) * t9;
+    t7 = t8 + t10;
+    t13 = (-0.8756753153753997) * t4;
+    t3 = (-0.03150705808190132) * t9;
+    t12 = t13 + t3;
+    t6 = t11 + t1;
+    t8 = t5 + t0;
+    t10 = t14 + t7;
+    t4 = t2 + t12;
+    t9 = t11 - t1;
+    t13 = t5 - t0;
+    t3 = t14 - t7;
+    t11 = t2 - t12;
+    t1 = t6 + t10;
+    t5 = t8 + t4;
+    t0 = t9 + t11;
+    t14 = t13 - t3;
+    t7 = t6 - t10;
+    t2 = t8 - t4;
+    t12 = t9 - t11;
+    t6 = t13 + t3;
+    t10 = t0 + t14;
+    t8 = C4 * t10;
+    t4 = t0 * (-C5);
+    t9 = t14 * C6;
+    t11 = t8 - t9;
+    t13 = t8 + t4;
+    t3 = t7 + t2;
+    t10 = t7 - t2;
+    t0 = C7 * t3;
+    t14 = (-C7) * t10;
+    t9 = t12 + t6;
+    t8 = C8 * t9;
+    t4 = t12 * (-C5);
+    t7 = t6 * (-C6);
+    t2 = t8 - t7;
+    t3 = t8 + t4;
+    re[223] = t1;
+    im[223] = t5;
+    re[43] = t11;
+    im[43] = t13;
+    re[103] = t0;
+    im[103] = t14;
+    re[163] = t2;
+    im[163] = t3;
+    t10 = x[236];
+    t9 = 0.054487232921376444 * t10;
+    t12 = x[243];
+    t6 = 0.05828679646399605 * t12;
+    t7 = t9 - t6;
+    t8 = x[716];
+    t4 = 0.03988296034010127 * t8;
+    t1 = x[723];
+    t5 = 0.03380639052821035 * t1;
+    t11 = t4 + t5;
+    t13 = C17 * t7;
+    t0 = (-C18) * t11;
+    t14 = t13 + t0;
+    t2 = (-C18) * t7;
+    t3 = (-C17) * t11;
+    t10 = t2 + t3;
+    t12 = x[603];
+    t9 = x[123];
+    t6 = (-0.005823786352090389) * t9;
+    t8 = x[356];
+    t1 = 0.06373721193577314 * t8;
+    t4 = t6 - t1;
+    t5 = (-0.060718686715270614) * t12;
+    t13 = 0.3705574375098362 * t4;
+    t0 = t5 + t13;
+    t7 = 0.02422429968404487 * t12;
+    t11 = 0.9288095528719242 * t4;
+    t2 = t7 + t11;
+    t3 = x[483];
+    t9 = x[3];
+    t8 = (-5.118263960998581e-05) * t9;
+    t6 = x[476];
+    t1 = 0.06448036651285986 * t6;
+    t5 = t8 - t1;
+    t13 = (-0.04628682484831745) * t3;
+    t12 = 0.6977904598416801 * t5;
+    t4 = t13 + t12;
+    t7 = 0.045090628459136826 * t3;
+    t11 = 0.7163019434246544 * t5;
+    t9 = t7 + t11;
+    t6 = x[116];
+    t8 = (-0.006536104773879254) * t6;
+    t1 = x[363];
+    t13 = 0.06374067739602733 * t1;
+    t12 = t8 - t13;
+    t3 = x[596];
+    t5 = 0.39474385638426723 * t12;
+    t7 = (-0.060060496143901076) * t3;
+    t11 = t5 + t7;
+    t6 = (-0.9187912101488983) * t12;
+    t1 = (-0.02580402555261031) * t3;
+    t8 = t6 + t1;
+    t13 = t14 + t4;
+    t5 = t10 + t9;
+    t7 = t0 + t11;
+    t12 = t2 + t8;
+    t3 = t14 - t4;
+    t6 = t10 - t9;
+    t1 = t0 - t11;
+    t14 = t2 - t8;
+    t4 = t13 + t7;
+    t10 = t5 + t12;
+    t9 = t3 + t14;
+    t0 = t6 - t1;
+    t11 = t13 - t7;
+    t2 = t5 - t12;
+    t8 = t3 - t14;
+    t13 = t6 + t1;
+    t7 = t9 + t0;
+    t5 = t9 - t0;
+    t12 = C7 * t7;
+    t3 = (-C7) * t5;
+    t14 = -t11;
+    t6 = t8 - t13;
+    t1 = t8 + t13;
+    t9 = (-C7) * t6;
+    t0 = (-C7) * t1;
+    re[238] = t4;
+    im[238] = t10;
+    re[58] = t12;
+    im[58] = t3;
+    re[118] = t2;
+    im[118] = t14;
+    re[178] = t9;
+    im[178] = t0;
+    t7 = x[693];
+    t5 = 0.055427636479400355 * t7;
+    t11 = x[746];
+    t8 = 0.013993950130755195 * t11;
+    t13 = t5 + t8;
+    t6 = x[213];
+    t1 = 0.03832033405423618 * t6;
+    t4 = x[266];
+    t10 = 0.06549826140010584 * t4;
+    t12 = t1 - t10;
+    t3 = (-C19) * t13;
+    t2 = C20 * t12;
+    t14 = t3 + t2;
+    t9 = C20 * t13;
+    t0 = C19 * t12;
+    t7 = t9 + t0;
+    t11 = x[573];
+    t5 = x[93];
+    t8 = (-0.0069944183140304966) * t5;
+    t6 = x[386];
+    t4 = 0.06383246193490441 * t6;
+    t1 = t8 - t4;
+    t10 = (-0.05796528872451522) * t11;
+    t3 = 0.45981235844785984 * t1;
+    t2 = t10 + t3;
+    t13 = 0.030014271246812916 * t11;
+    t12 = 0.8880161006528073 * t1;
+    t9 = t13 + t12;
+    t0 = x[26];
+    t5 = (-0.000832178836739828) * t0;
+    t6 = x[453];
+    t8 = 0.06409509301312502 * t6;
+    t4 = t5 - t8;
+    t10 = x[506];
+    t3 = 0.6444573283588975 * t4;
+    t11 = (-0.04970741129917839) * t10;
+    t1 = t3 + t11;
+    t13 = (-0.7646402761590003) * t4;
+    t12 = (-0.041894609117927396) * t10;
+    t0 = t13 + t12;
+    t6 = x[146];
+    t5 = (-0.0011391351213317518) * t6;
+    t8 = x[333];
+    t3 = 0.06393241278222266 * t8;
+    t11 = t5 - t3;
+    t4 = x[626];
+    t10 = 0.3027857698425746 * t11;
+    t13 = (-0.062113683930088086) * t4;
+    t12 = t10 + t13;
+    t6 = (-0.953058643306297) * t11;
+    t8 = (-0.019733454744490238) * t4;
+    t5 = t6 + t8;
+    t3 = t14 + t1;
+    t10 = t7 + t0;
+    t13 = t2 + t12;
+    t11 = t9 + t5;
+    t4 = t14 - t1;
+    t6 = t7 - t0;
+    t8 = t2 - t12;
+    t14 = t9 - t5;
+    t1 = t3 + t13;
+    t7 = t10 + t11;
+    t0 = t4 + t14;
+    t2 = t6 - t8;
+    t12 = t3 - t13;
+    t9 = t10 - t11;
+    t5 = t4 - t14;
+    t3 = t6 + t8;
+    t13 = t0 + t2;
+    t10 = C8 * t13;
+    t11 = t0 * (-C5);
+    t4 = t2 * (-C6);
+    t14 = t10 - t4;
+    t6 = t10 + t11;
+    t8 = t12 - t9;
+    t13 = t12 + t9;
+    t0 = (-C7) * t8;
+    t2 = (-C7) * t13;
+    t4 = t5 + t3;
+    t10 = (-C4) * t4;
+    t11 = t5 * C5;
+    t12 = t3 * (-C6);
+    t9 = t10 - t12;
+    t8 = t10 + t11;
+    re[13] = t1;
+    im[13] = t7;
+    re[73] = t14;
+    im[73] = t6;
+    re[133] = t0;
+    im[133] = t2;
+    re[193] = t9;
+    im[193] = t8;
+    t13 = re[208];
+    t4 = im[208];
+    t5 = re[223];
+    t3 = im[223];
+    t12 = re[238];
+    t10 = im[238];
+    t11 = re[13];
+    t1 = im[13];
+    t7 = t13 + t12;
+    t14 = t4 + t10;
+    t6 = t5 + t11;
+    t0 = t3 + t1;
+    t2 = t13 - t12;
+    t9 = t4 - t10;
+    t8 = t5 - t11;
+    t13 = t3 - t1;
+    t12 = t7 + t6;
+    t4 = t14 + t0;
+    t10 = t2 + t13;
+    t5 = t9 - t8;
+    t11 = t7 - t6;
+    t3 = t14 - t0;
+    t1 = t2 - t13;
+    t7 = t9 + t8;
+    re[208] = t12;
+    im[208] = t4;
+    re[223] = t10;
+    im[223] = t5;
+    re[238] = t11;
+    im[238] = t3;
+    re[13] = t1;
+    im[13] = t7;
+    t6 = re[28];
+    t14 = im[28];
+    t0 = re[43];
+    t2 = im[43];
+    t13 = re[58];
+    t9 = im[58];
+    t8 = re[73];
+    t12 = im[73];
+    t4 = t6 + t13;
+    t10 = t14 + t9;
+    t5 = t0 + t8;
+    t11 = t2 + t12;
+    t3 = t6 - t13;
+    t1 = t14 - t9;
+    t7 = t0 - t8;
+    t6 = t2 - t12;
+    t13 = t4 + t5;
+    t14 = t10 + t11;
+    t9 = t3 + t6;
+    t0 = t1 - t7;
+    t8 = t4 - t5;
+    t2 = t10 - t11;
+    t12 = t3 - t6;
+    t4 = t1 + t7;
+    re[28] = t13;
+    im[28] = t14;
+    re[43] = t9;
+    im[43] = t0;
+    re[58] = t8;
+    im[58] = t2;
+    re[73] = t12;
+    im[73] = t4;
+    t5 = re[88];
+    t10 = im[88];
+    t11 = re[103];
+    t3 = im[103];
+    t6 = re[118];
+    t1 = im[118];
+    t7 = re[133];
+    t13 = im[133];
+    t14 = t5 + t6;
+    t9 = t10 + t1;
+    t0 = t11 + t7;
+    t8 = t3 + t13;
+    t2 = t5 - t6;
+    t12 = t10 - t1;
+    t4 = t11 - t7;
+    t5 = t3 - t13;
+    t6 = t14 + t0;
+    t10 = t9 + t8;
+    t1 = t2 + t5;
+    t11 = t12 - t4;
+    t7 = t14 - t0;
+    t3 = t9 - t8;
+    t13 = t2 - t5;
+    t14 = t12 + t4;
+    re[88] = t6;
+    im[88] = t10;
+    re[103] = t1;
+    im[103] = t11;
+    re[118] = t7;
+    im[118] = t3;
+    re[133] = t13;
+    im[133] = t14;
+    t0 = re[148];
+    t9 = im[148];
+    t8 = re[163];
+    t2 = im[163];
+    t5 = re[178];
+    t12 = im[178];
+    t4 = re[193];
+    t6 = im[193];
+    t10 = t0 + t5;
+    t1 = t9 + t12;
+    t11 = t8 + t4;
+    t7 = t2 + t6;
+    t3 = t0 - t5;
+    t13 = t9 - t12;
+    t14 = t8 - t4;
+    t0 = t2 - t6;
+    t5 = t10 + t11;
+    t9 = t1 + t7;
+    t12 = t3 + t0;
+    t8 = t13 - t14;
+    t4 = t10 - t11;
+    t2 = t1 - t7;
+    t6 = t3 - t0;
+    t10 = t13 + t14;
+    re[148] = t5;
+    im[148] = t9;
+    re[163] = t12;
+    im[163] = t8;
+    re[178] = t4;
+    im[178] = t2;
+    re[193] = t6;
+    im[193] = t10;
+    t11 = x[687];
+    t1 = 0.05802216528489968 * t11;
+    t7 = x[752];
+    t3 = 0.009820082785519772 * t7;
+    t0 = t1 + t3;
+    t13 = x[207];
+    t14 = 0.033662098281655395 * t13;
+    t5 = x[272];
+    t9 = 0.06611442465083006 * t5;
+    t12 = t14 - t9;
+    t8 = (-C21) * t0;
+    t4 = C22 * t12;
+    t2 = t8 + t4;
+    t6 = C22 * t0;
+    t10 = C21 * t12;
+    t11 = t6 + t10;
+    t7 = x[567];
+    t1 = x[87];
+    t3 = (-0.006710565627511057) * t1;
+    t13 = x[392];
+    t5 = 0.0638576174456411 * t13;
+    t14 = t3 - t5;
+    t9 = (-0.05734222659562764) * t7;
+    t8 = 0.4771587602596084 * t14;
+    t4 = t9 + t8;
+    t0 = 0.031134288760054786 * t7;
+    t12 = 0.8788171126619654 * t14;
+    t6 = t0 + t12;
+    t10 = x[32];
+    t1 = (-0.00125166170487896) * t10;
+    t13 = x[447];
+    t3 = 0.0640294272566682 * t13;
+    t5 = t1 - t3;
+    t9 = x[512];
+    t8 = 0.6293203910498375 * t5;
+    t7 = (-0.05057218706263149) * t9;
+    t14 = t8 + t7;
+    t0 = (-0.7771459614569709) * t5;
+    t12 = (-0.040952549607070086) * t9;
+    t10 = t0 + t12;
+    t13 = x[152];
+    t1 = 0.0007749045844854548 * t13;
+    t3 = x[327];
+    t8 = 0.06405924251906994 * t3;
+    t7 = t1 - t8;
+    t5 = x[632];
+    t9 = 0.2840153447039226 * t7;
+    t0 = (-0.062365430365933026) * t5;
+    t12 = t9 + t0;
+    t13 = (-0.958819734868193) * t7;
+    t3 = (-0.018473482093507267) * t5;
+    t1 = t13 + t3;
+    t8 = t2 + t14;
+    t9 = t11 + t10;
+    t0 = t4 + t12;
+    t7 = t6 + t1;
+    t5 = t2 - t14;
+    t13 = t11 - t10;
+    t3 = t4 - t12;
+    t2 = t6 - t1;
+    t14 = t8 + t0;
+    t11 = t9 + t7;
+    t10 = t5 + t2;
+    t4 = t13 - t3;
+    t12 = t8 - t0;
+    t6 = t9 - t7;
+    t1 = t5 - t2;
+    t8 = t13 + t3;
+    re[16] = t14;
+    im[16] = t11;
+    re[76] = t10;
+    im[76] = t4;
+    re[136] = t12;
+    im[136] = t6;
+    re[196] = t1;
+    im[196] = t8;
+    t0 = x[657];
+    t9 = x[177];
+    t7 = 0.012460150293088338 * t9;
+    t5 = x[302];
+    t2 = 0.0651897066068586 * t5;
+    t13 = t7 - t2;
+    t3 = (-0.0626049386310118) * t0;
+    t14 = 0.20150532232561713 * t13;
+    t11 = t3 + t14;
+    t10 = 0.012879418444901185 * t0;
+    t4 = 0.9794874195590514 * t13;
+    t12 = t10 + t4;
+    t6 = x[537];
+    t1 = x[57];
+    t8 = (-0.003798281081887221) * t1;
+    t9 = x[422];
+    t5 = 0.06391374403022049 * t9;
+    t7 = t8 - t5;
+    t2 = (-0.053966980775950385) * t6;
+    t3 = 0.5610002506640098 * t7;
+    t14 = t2 + t3;
+    t0 = 0.0365727447186966 * t6;
+    t13 = 0.8278156308955021 * t7;
+    t10 = t0 + t13;
+    t4 = x[62];
+    t1 = (-0.004375801329143805) * t4;
+    t9 = x[417];
+    t8 = 0.06390858067942896 * t9;
+    t5 = t1 - t8;
+    t2 = x[542];
+    t3 = 0.5501164165954934 * t5;
+    t6 = (-0.05444547817631989) * t2;
+    t7 = t3 + t6;
+    t0 = (-0.8350879763187431) * t5;
+    t13 = (-0.03586610297781747) * t2;
+    t4 = t0 + t13;
+    t9 = x[182];
+    t1 = 0.015536072435597533 * t9;
+    t8 = x[297];
+    t3 = 0.06551302642791178 * t8;
+    t6 = t1 - t3;
+    t5 = x[662];
+    t2 = 0.06346367948109186 * t5;
+    t0 = x[777];
+    t13 = 0.0005772987765440853 * t0;
+    t9 = t2 + t13;
+    t8 = C23 * t6;
+    t1 = (-C24) * t9;
+    t3 = t8 + t1;
+    t5 = (-C24) * t6;
+    t0 = (-C23) * t9;
+    t2 = t5 + t0;
+    t13 = t11 + t7;
+    t8 = t12 + t4;
+    t1 = t14 + t3;
+    t6 = t10 + t2;
+    t9 = t11 - t7;
+    t5 = t12 - t4;
+    t0 = t14 - t3;
+    t11 = t10 - t2;
+    t7 = t13 + t1;
+    t12 = t8 + t6;
+    t4 = t9 + t11;
+    t14 = t5 - t0;
+    t3 = t13 - t1;
+    t10 = t8 - t6;
+    t2 = t9 - t11;
+    t13 = t5 + t0;
+    t1 = t4 + t14;
+    t8 = C4 * t1;
+    t6 = t4 * (-C5);
+    t9 = t14 * C6;
+    t11 = t8 - t9;
+    t5 = t8 + t6;
+    t0 = t3 + t10;
+    t1 = t3 - t10;
+    t4 = C7 * t0;
+    t14 = (-C7) * t1;
+    t9 = t2 + t13;
+    t8 = C8 * t9;
+    t6 = t2 * (-C5);
+    t3 = t13 * (-C6);
+    t10 = t8 - t3;
+    t0 = t8 + t6;
+    re[31] = t7;
+    im[31] = t12;
+    re[91] = t11;
+    im[91] = t5;
+    re[151] = t4;
+    im[151] = t14;
+    re[211] = t10;
+    im[211] = t0;
+    t1 = x[627];
+    t9 = x[147];
+    t2 = (-0.0008421036493568433) * t9;
+    t13 = x[332];
+    t3 = 0.06395080704108534 * t13;
+    t8 = t2 - t3;
+    t6 = (-0.06222360518476545) * t1;
+    t7 = 0.296541574975571 * t8;
+    t12 = t6 + t7;
+    t11 = 0.01932094297008228 * t1;
+    t5 = 0.9550199444571866 * t8;
+    t4 = t11 + t5;
+    t14 = x[507];
+    t10 = x[27];
+    t0 = (-0.0008954747285975453) * t10;
+    t9 = x[452];
+    t13 = 0.06408295505704935 * t9;
+    t2 = t0 - t13;
+    t3 = (-0.049990011084656075) * t14;
+    t6 = 0.6394390019805847 * t2;
+    t7 = t3 + t6;
+    t1 = 0.04157625335078889 * t14;
+    t8 = 0.7688418320734596 * t2;
+    t11 = t1 + t8;
+    t5 = x[92];
+    t10 = (-0.006957168833277857) * t5;
+    t9 = x[387];
+    t0 = 0.06383692815507565 * t9;
+    t13 = t10 - t0;
+    t3 = x[572];
+    t6 = 0.4656145203251114 * t13;
+    t14 = (-0.057763564068615866) * t3;
+    t2 = t6 + t14;
+    t1 = (-0.8849876374630419) * t13;
+    t8 = (-0.030390881225389556) * t3;
+    t5 = t1 + t8;
+    t9 = x[212];
+    t10 = 0.037546543945018315 * t9;
+    t0 = x[267];
+    t6 = 0.06563252203272879 * t0;
+    t14 = t10 - t6;
+    t13 = x[692];
+    t3 = 0.05590313564763854 * t13;
+    t1 = x[747];
+    t8 = 0.013252961052902145 * t1;
+    t9 = t3 + t8;
+    t0 = C25 * t14;
+    t10 = (-C26) * t9;
+    t6 = t0 + t10;
+    t13 = (-C26) * t14;
+    t1 = (-C25) * t9;
+    t3 = t13 + t1;
+    t8 = t12 + t2;
+    t0 = t4 + t5;
+    t10 = t7 + t6;
+    t14 = t11 + t3;
+    t9 = t12 - t2;
+    t13 = t4 - t5;
+    t1 = t7 - t6;
+    t12 = t11 - t3;
+    t2 = t8 + t10;
+    t4 = t0 + t14;
+    t5 = t9 + t12;
+    t7 = t13 - t1;
+    t6 = t8 - t10;
+    t11 = t0 - t14;
+    t3 = t9 - t12;
+    t8 = t13 + t1;
+    t10 = t5 + t7;
+    t0 = t5 - t7;
+    t14 = C7 * t10;
+    t9 = (-C7) * t0;
+    t12 = -t6;
+    t13 = t3 - t8;
+    t1 = t3 + t8;
+    t5 = (-C7) * t13;
+    t7 = (-C7) * t1;
+    re[46] = t2;
+    im[46] = t4;
+    re[106] = t14;
+    im[106] = t9;
+    re[166] = t11;
+    im[166] = t12;
+    re[226] = t5;
+    im[226] = t7;
+    t10 = x[597];
+    t0 = x[117];
+    t6 = (-0.006452302836340159) * t0;
+    t3 = x[362];
+    t8 = 0.06373897609694043 * t3;
+    t13 = t6 - t8;
+    t1 = (-0.060229703082427005) * t10;
+    t2 = 0.38872197015239557 * t13;
+    t4 = t1 + t2;
+    t14 = 0.02541105889701808 * t10;
+    t9 = 0.9213551052231925 * t13;
+    t11 = t14 + t9;
+    t12 = x[2];
+    t5 = (-4.042704922643029e-05) * t12;
+    t7 = x[477];
+    t0 = 0.06450013091255516 * t7;
+    t3 = t5 - t0;
+    t6 = x[482];
+    t8 = 0.7024636661168517 * t3;
+    t1 = (-0.045976625427323545) * t6;
+    t2 = t8 + t1;
+    t10 = (-0.7117196061551713) * t3;
+    t13 = (-0.045378697697864866) * t6;
+    t14 = t10 + t13;
+    t9 = x[122];
+    t12 = (-0.00594393213174328) * t9;
+    t7 = x[357];
+    t5 = 0.0637364265978129 * t7;
+    t0 = t12 - t5;
+    t8 = x[602];
+    t1 = 0.3766285016932107 * t0;
+    t3 = (-0.0605595858681558) * t8;
+    t6 = t1 + t3;
+    t10 = (-0.9263643838751181) * t0;
+    t13 = (-0.024621484251449412) * t8;
+    t9 = t10 + t13;
+    t7 = x[717];
+    t12 = 0.03903937923994008 * t7;
+    t5 = x[722];
+    t1 = 0.0346948631711804 * t5;
+    t3 = t12 + t1;
+    t0 = x[237];
+    t8 = 0.055071571653496555 * t0;
+    t10 = x[242];
+    t13 = 0.057786933794756926 * t10;
+    t7 = t8 - t13;
+    t5 = (-C27) * t3;
+    t12 = C28 * t7;
+    t1 = t5 + t12;
+    t0 = C28 * t3;
+    t10 = C27 * t7;
+    t8 = t0 + t10;
+    t13 = t4 + t6;
+    t5 = t11 + t9;
+    t12 = t2 + t1;
+    t3 = t14 + t8;
+    t7 = t4 - t6;
+    t0 = t11 - t9;
+    t10 = t2 - t1;
+    t4 = t14 - t8;
+    t6 = t13 + t12;
+    t11 = t5 + t3;
+    t9 = t7 + t4;
+    t2 = t0 - t10;
+    t1 = t13 - t12;
+    t14 = t5 - t3;
+    t8 = t7 - t4;
+    t13 = t0 + t10;
+    t12 = t9 + t2;
+    t5 = C8 * t12;
+    t3 = t9 * (-C5);
+    t7 = t2 * (-C6);
+    t4 = t5 - t7;
+    t0 = t5 + t3;
+    t10 = t1 - t14;
+    t12 = t1 + t14;
+    t9 = (-C7) * t10;
+    t2 = (-C7) * t12;
+    t7 = t8 + t13;
+    t5 = (-C4) * t7;
+    t3 = t8 * C5;
+    t1 = t13 * (-C6);
+    t14 = t5 - t1;
+    t10 = t5 + t3;
+    re[61] = t6;
+    im[61] = t11;
+    re[121] = t4;
+    im[121] = t0;
+    re[181] = t9;
+    im[181] = t2;
+    re[1] = t14;
+    im[1] = t10;
+    t12 = re[16];
+    t7 = im[16];
+    t8 = re[31];
+    t13 = im[31];
+    t1 = re[46];
+    t5 = im[46];
+    t3 = re[61];
+    t6 = im[61];
+    t11 = t12 + t1;
+    t4 = t7 + t5;
+    t0 = t8 + t3;
+    t9 = t13 + t6;
+    t2 = t12 - t1;
+    t14 = t7 - t5;
+    t10 = t8 - t3;
+    t12 = t13 - t6;
+    t1 = t11 + t0;
+    t7 = t4 + t9;
+    t5 = t2 + t12;
+    t8 = t14 - t10;
+    t3 = t11 - t0;
+    t13 = t4 - t9;
+    t6 = t2 - t12;
+    t11 = t14 + t10;
+    re[16] = t1;
+    im[16] = t7;
+    re[31] = t5;
+    im[31] = t8;
+    re[46] = t3;
+    im[46] = t13;
+    re[61] = t6;
+    im[61] = t11;
+    t0 = re[76];
+    t4 = im[76];
+    t9 = re[91];
+    t2 = im[91];
+    t12 = re[106];
+    t14 = im[106];
+    t10 = re[121];
+    t1 = im[121];
+    t7 = t0 + t12;
+    t5 = t4 + t14;
+    t8 = t9 + t10;
+    t3 = t2 + t1;
+    t13 = t0 - t12;
+    t6 = t4 - t14;
+    t11 = t9 - t10;
+    t0 = t2 - t1;
+    t12 = t7 + t8;
+    t4 = t5 + t3;
+    t14 = t13 + t0;
+    t9 = t6 - t11;
+    t10 = t7 - t8;
+    t2 = t5 - t3;
+    t1 = t13 - t0;
+    t7 = t6 + t11;
+    re[76] = t12;
+    im[76] = t4;
+    re[91] = t14;
+    im[91] = t9;
+    re[106] = t10;
+    im[106] = t2;
+    re[121] = t1;
+    im[121] = t7;
+    t8 = re[136];
+    t5 = im[136];
+    t3 = re[151];
+    t13 = im[151];
+    t0 = re[166];
+    t6 = im[166];
+    t11 = re[181];
+    t12 = im[181];
+    t4 = t8 + t0;
+    t14 = t5 + t6;
+    t9 = t3 + t11;
+    t10 = t13 + t12;
+    t2 = t8 - t0;
+    t1 = t5 - t6;
+    t7 = t3 - t11;
+    t8 = t13 - t12;
+    t0 = t4 + t9;
+    t5 = t14 + t10;
+    t6 = t2 + t8;
+    t3 = t1 - t7;
+    t11 = t4 - t9;
+    t13 = t14 - t10;
+    t12 = t2 - t8;
+    t4 = t1 + t7;
+    re[136] = t0;
+    im[136] = t5;
+    re[151] = t6;
+    im[151] = t3;
+    re[166] = t11;
+    im[166] = t13;
+    re[181] = t12;
+    im[181] = t4;
+    t9 = re[196];
+    t14 = im[196];
+    t10 = re[211];
+    t2 = im[211];
+    t8 = re[226];
+    t1 = im[226];
+    t7 = re[1];
+    t0 = im[1];
+    t5 = t9 + t8;
+    t6 = t14 + t1;
+    t3 = t10 + t7;
+    t11 = t2 + t0;
+    t13 = t9 - t8;
+    t12 = t14 - t1;
+    t4 = t10 - t7;
+    t9 = t2 - t0;
+    t8 = t5 + t3;
+    t14 = t6 + t11;
+    t1 = t13 + t9;
+    t10 = t12 - t4;
+    t7 = t5 - t3;
+    t2 = t6 - t11;
+    t0 = t13 - t9;
+    t5 = t12 + t4;
+    re[196] = t8;
+    im[196] = t14;
+    re[211] = t1;
+    im[211] = t10;
+    re[226] = t7;
+    im[226] = t2;
+    re[1] = t0;
+    im[1] = t5;
+    t3 = x[591];
+    t6 = x[111];
+    t11 = (-0.006869357953162704) * t6;
+    t13 = x[368];
+    t9 = 0.06375375853090137 * t13;
+    t12 = t11 - t9;
+    t4 = (-0.05970533337260724) * t3;
+    t8 = 0.40673664307580015 * t12;
+    t14 = t4 + t8;
+    t1 = 0.02658252708339379 * t3;
+    t10 = 0.9135454576426009 * t12;
+    t7 = t1 + t10;
+    t2 = x[8];
+    t0 = (-0.00012565194800517364) * t2;
+    t5 = x[471];
+    t6 = 0.06438355009316855 * t5;
+    t13 = t0 - t6;
+    t11 = x[488];
+    t9 = 0.6883545756937539 * t13;
+    t4 = (-0.04694356257425282) * t11;
+    t8 = t9 + t4;
+    t3 = (-0.7253743710122876) * t13;
+    t12 = (-0.04454777751832867) * t11;
+    t1 = t3 + t12;
+    t10 = x[128];
+    t2 = (-0.005126942408932225) * t10;
+    t5 = x[351];
+    t0 = 0.06374898211812038 * t5;
+    t6 = t2 - t0;
+    t9 = x[608];
+    t4 = 0.35836794954530027 * t6;
+    t13 = (-0.06101930281068201) * t9;
+    t11 = t4 + t13;
+    t3 = (-0.9335804264972017) * t6;
+    t12 = (-0.023423115791956283) * t9;
+    t10 = t3 + t12;
+    t5 = x[711];
+    t2 = 0.04393537373799463 * t5;
+    t0 = x[728];
+    t4 = 0.02931342966143716 * t0;
+    t13 = t2 + t4;
+    t6 = x[231];
+    t9 = 0.051377800648534894 * t6;
+    t3 = x[248];
+    t12 = 0.060557288918556856 * t3;
+    t5 = t9 - t12;
+    t0 = (-C29) * t13;
+    t2 = C30 * t5;
+    t4 = t0 + t2;
+    t6 = C30 * t13;
+    t3 = C29 * t5;
+    t9 = t6 + t3;
+    t12 = t14 + t11;
+    t0 = t7 + t10;
+    t2 = t8 + t4;
+    t13 = t1 + t9;
+    t5 = t14 - t11;
+    t6 = t7 - t10;
+    t3 = t8 - t4;
+    t14 = t1 - t9;
+    t11 = t12 + t2;
+    t7 = t0 + t13;
+    t10 = t5 + t14;
+    t8 = t6 - t3;
+    t4 = t12 - t2;
+    t1 = t0 - t13;
+    t9 = t5 - t14;
+    t12 = t6 + t3;
+    re[64] = t11;
+    im[64] = t7;
+    re[124] = t10;
+    im[124] = t8;
+    re[184] = t4;
+    im[184] = t1;
+    re[4] = t9;
+    im[4] = t12;
+    t2 = x[561];
+    t0 = x[81];
+    t13 = (-0.006293781659289501) * t0;
+    t5 = x[398];
+    t14 = 0.06387791227672637 * t5;
+    t6 = t13 - t14;
+    t3 = (-0.05670187164874553) * t2;
+    t11 = 0.4943212082861446 * t6;
+    t7 = t3 + t11;
+    t10 = 0.03224387942219429 * t2;
+    t8 = 0.8692793239451436 * t6;
+    t4 = t10 + t8;
+    t1 = x[38];
+    t9 = (-0.0017617321668600802) * t1;
+    t12 = x[441];
+    t0 = 0.0639805180792617 * t12;
+    t5 = t9 - t0;
+    t13 = x[518];
+    t14 = 0.6139408387503664 * t5;
+    t3 = (-0.05140575508308562) * t13;
+    t11 = t14 + t3;
+    t2 = (-0.78935204219315) * t5;
+    t6 = (-0.039982277495119116) * t13;
+    t10 = t2 + t6;
+    t8 = x[158];
+    t1 = 0.003018411452977106 * t8;
+    t12 = x[321];
+    t9 = 0.06423062556096837 * t12;
+    t0 = t1 - t9;
+    t14 = x[638];
+    t3 = 0.265135426243408 * t0;
+    t5 = (-0.0625487695543233) * t14;
+    t13 = t3 + t5;
+    t2 = (-0.9642111831703293) * t0;
+    t6 = (-0.01719944236931407) * t14;
+    t8 = t2 + t6;
+    t12 = x[681];
+    t1 = 0.06002769080651903 * t12;
+    t9 = x[758];
+    t3 = 0.006372760106669814 * t9;
+    t5 = t1 + t3;
+    t0 = x[201];
+    t14 = 0.029029664721005044 * t0;
+    t2 = x[278];
+    t6 = 0.06633051386661427 * t2;
+    t12 = t14 - t6;
+    t9 = (-C31) * t5;
+    t1 = C32 * t12;
+    t3 = t9 + t1;
+    t0 = C32 * t5;
+    t2 = C31 * t12;
+    t14 = t0 + t2;
+    t6 = t7 + t13;
+    t9 = t4 + t8;
+    t1 = t11 + t3;
+    t5 = t10 + t14;
+    t12 = t7 - t13;
+    t0 = t4 - t8;
+    t2 = t11 - t3;
+    t7 = t10 - t14;
+    t13 = t6 + t1;
+    t4 = t9 + t5;
+    t8 = t12 + t7;
+    t11 = t0 - t2;
+    t3 = t6 - t1;
+    t10 = t9 - t5;
+    t14 = t12 - t7;
+    t6 = t0 + t2;
+    t1 = t8 + t11;
+    t9 = C4 * t1;
+    t5 = t8 * (-C5);
+    t12 = t11 * C6;
+    t7 = t9 - t12;
+    t0 = t9 + t5;
+    t2 = t3 + t10;
+    t1 = t3 - t10;
+    t8 = C7 * t2;
+    t11 = (-C7) * t1;
+    t12 = t14 + t6;
+    t9 = C8 * t12;
+    t5 = t14 * (-C5);
+    t3 = t6 * (-C6);
+    t10 = t9 - t3;
+    t2 = t9 + t5;
+    re[79] = t13;
+    im[79] = t4;
+    re[139] = t7;
+    im[139] = t0;
+    re[199] = t8;
+    im[199] = t11;
+    re[19] = t10;
+    im[19] = t2;
+    t1 = x[531];
+    t12 = x[51];
+    t14 = (-0.003110581081497253) * t12;
+    t6 = x[428];
+    t3 = 0.06392405017998871 * t6;
+    t9 = t14 - t3;
+    t5 = (-0.053229936728448946) * t1;
+    t13 = 0.5771451900372336 * t9;
+    t4 = t5 + t13;
+    t7 = 0.03761919994718902 * t1;
+    t0 = 0.8166415551616789 * t9;
+    t8 = t7 + t0;
+    t11 = x[68];
+    t10 = (-0.005048247514688653) * t11;
+    t2 = x[411];
+    t12 = 0.06390281971346669 * t2;
+    t6 = t10 - t12;
+    t14 = x[548];
+    t3 = 0.5336145159156115 * t6;
+    t5 = (-0.05514413823313569) * t14;
+    t13 = t3 + t5;
+    t1 = (-0.8457278217039733) * t6;
+    t9 = (-0.03479336007838941) * t14;
+    t7 = t1 + t9;
+    t0 = x[188];
+    t11 = 0.019521580713750934 * t0;
+    t2 = x[291];
+    t10 = 0.06590293451154614 * t2;
+    t12 = t11 - t10;
+    t3 = x[668];
+    t5 = 0.06274226638221903 * t3;
+    t6 = x[771];
+    t14 = 0.0016272859579925193 * t6;
+    t1 = t5 + t14;
+    t9 = C33 * t12;
+    t0 = (-C34) * t1;
+    t2 = t9 + t0;
+    t11 = (-C34) * t12;
+    t10 = (-C33) * t1;
+    t3 = t11 + t10;
+    t6 = x[651];
+    t5 = x[171];
+    t14 = 0.009088201941194599 * t5;
+    t9 = x[308];
+    t0 = 0.06480444102585917 * t9;
+    t12 = t14 - t0;
+    t1 = (-0.06271061475293783) * t6;
+    t11 = 0.22069743502150108 * t12;
+    t10 = t1 + t11;
+    t5 = 0.014189963393959065 * t6;
+    t9 = 0.9753423205085127 * t12;
+    t14 = t5 + t9;
+    t0 = t4 + t2;
+    t1 = t8 + t3;
+    t11 = t13 + t10;
+    t6 = t7 + t14;
+    t12 = t4 - t2;
+    t5 = t8 - t3;
+    t9 = t13 - t10;
+    t4 = t7 - t14;
+    t2 = t0 + t11;
+    t8 = t1 + t6;
+    t3 = t12 + t4;
+    t13 = t5 - t9;
+    t10 = t0 - t11;
+    t7 = t1 - t6;
+    t14 = t12 - t4;
+    t0 = t5 + t9;
+    t11 = t3 + t13;
+    t1 = t3 - t13;
+    t6 = C7 * t11;
+    t12 = (-C7) * t1;
+    t4 = -t10;
+    t5 = t14 - t0;
+    t9 = t14 + t0;
+    t3 = (-C7) * t5;
+    t13 = (-C7) * t9;
+    re[94] = t2;
+    im[94] = t8;
+    re[154] = t6;
+    im[154] = t12;
+    re[214] = t7;
+    im[214] = t4;
+    re[34] = t3;
+    im[34] = t13;
+    t11 = x[501];
+    t1 = x[21];
+    t10 = (-0.0005555527399948405) * t1;
+    t14 = x[458];
+    t0 = 0.06416253018347054 * t14;
+    t5 = t10 - t0;
+    t9 = (-0.049103105791012895) * t11;
+    t2 = 0.6544109481086103 * t5;
+    t8 = t9 + t2;
+    t6 = 0.042496956962092006 * t11;
+    t12 = 0.7561390817803227 * t5;
+    t7 = t6 + t12;
+    t4 = x[98];
+    t3 = (-0.007115524149486865) * t4;
+    t13 = x[381];
+    t1 = 0.06380929968413282 * t13;
+    t14 = t3 - t1;
+    t10 = x[578];
+    t0 = 0.44814919358922256 * t14;
+    t9 = (-0.05837437910011969) * t10;
+    t2 = t0 + t9;
+    t11 = (-0.8939587799699321) * t14;
+    t5 = (-0.02926357624774388) * t10;
+    t6 = t11 + t5;
+    t12 = x[218];
+    t4 = 0.04214582765550592 * t12;
+    t13 = x[261];
+    t3 = 0.06461949818589519 * t13;
+    t1 = t4 - t3;
+    t0 = x[698];
+    t9 = 0.05278557016376946 * t0;
+    t14 = x[741];
+    t10 = 0.017930354041316373 * t14;
+    t11 = t9 + t10;
+    t5 = C35 * t1;
+    t12 = (-C36) * t11;
+    t13 = t5 + t12;
+    t4 = (-C36) * t1;
+    t3 = (-C35) * t11;
+    t0 = t4 + t3;
+    t14 = x[621];
+    t9 = x[141];
+    t10 = (-0.002498200628933956) * t9;
+    t5 = x[338];
+    t12 = 0.06385500498660353 * t5;
+    t1 = t10 - t12;
+    t11 = (-0.061925036872423705) * t14;
+    t4 = 0.31523498164776964 * t1;
+    t3 = t11 + t4;
+    t9 = 0.020569712436395566 * t14;
+    t5 = 0.949013649188214 * t1;
+    t10 = t9 + t5;
+    t12 = t8 + t13;
+    t11 = t7 + t0;
+    t4 = t2 + t3;
+    t14 = t6 + t10;
+    t1 = t8 - t13;
+    t9 = t7 - t0;
+    t5 = t2 - t3;
+    t8 = t6 - t10;
+    t13 = t12 + t4;
+    t7 = t11 + t14;
+    t0 = t1 + t8;
+    t2 = t9 - t5;
+    t3 = t12 - t4;
+    t6 = t11 - t14;
+    t10 = t1 - t8;
+    t12 = t9 + t5;
+    t4 = t0 + t2;
+    t11 = C8 * t4;
+    t14 = t0 * (-C5);
+    t1 = t2 * (-C6);
+    t8 = t11 - t1;
+    t9 = t11 + t14;
+    t5 = t3 - t6;
+    t4 = t3 + t6;
+    t0 = (-C7) * t5;
+    t2 = (-C7) * t4;
+    t1 = t10 + t12;
+    t11 = (-C4) * t1;
+    t14 = t10 * C5;
+    t3 = t12 * (-C6);
+    t6 = t11 - t3;
+    t5 = t11 + t14;
+    re[109] = t13;
+    im[109] = t7;
+    re[169] = t8;
+    im[169] = t9;
+    re[229] = t0;
+    im[229] = t2;
+    re[49] = t6;
+    im[49] = t5;
+    t4 = re[64];
+    t1 = im[64];
+    t10 = re[79];
+    t12 = im[79];
+    t3 = re[94];
+    t11 = im[94];
+    t14 = re[109];
+    t13 = im[109];
+    t7 = t4 + t3;
+    t8 = t1 + t11;
+    t9 = t10 + t14;
+    t0 = t12 + t13;
+    t2 = t4 - t3;
+    t6 = t1 - t11;
+    t5 = t10 - t14;
+    t4 = t12 - t13;
+    t3 = t7 + t9;
+    t1 = t8 + t0;
+    t11 = t2 + t4;
+    t10 = t6 - t5;
+    t14 = t7 - t9;
+    t12 = t8 - t0;
+    t13 = t2 - t4;
+    t7 = t6 + t5;
+    re[64] = t3;
+    im[64] = t1;
+    re[79] = t11;
+    im[79] = t10;
+    re[94] = t14;
+    im[94] = t12;
+    re[109] = t13;
+    im[109] = t7;
+    t9 = re[124];
+    t8 = im[124];
+    t0 = re[139];
+    t2 = im[139];
+    t4 = re[154];
+    t6 = im[154];
+    t5 = re[169];
+    t3 = im[169];
+    t1 = t9 + t4;
+    t11 = t8 + t6;
+    t10 = t0 + t5;
+    t14 = t2 + t3;
+    t12 = t9 - t4;
+    t13 = t8 - t6;
+    t7 = t0 - t5;
+    t9 = t2 - t3;
+    t4 = t1 + t10;
+    t8 = t11 + t14;
+    t6 = t12 + t9;
+    t0 = t13 - t7;
+    t5 = t1 - t10;
+    t2 = t11 - t14;
+    t3 = t12 - t9;
+    t1 = t13 + t7;
+    re[124] = t4;
+    im[124] = t8;
+    re[139] = t6;
+    im[139] = t0;
+    re[154] = t5;
+    im[154] = t2;
+    re[169] = t3;
+    im[169] = t1;
+    t10 = re[184];
+    t11 = im[184];
+    t14 = re[199];
+    t12 = im[199];
+    t9 = re[214];
+    t13 = im[214];
+    t7 = re[229];
+    t4 = im[229];
+    t8 = t10 + t9;
+    t6 = t11 + t13;
+    t0 = t14 + t7;
+    t5 = t12 + t4;
+    t2 = t10 - t9;
+    t3 = t11 - t13;
+    t1 = t14 - t7;
+    t10 = t12 - t4;
+    t9 = t8 + t0;
+    t11 = t6 + t5;
+    t13 = t2 + t10;
+    t14 = t3 - t1;
+    t7 = t8 - t0;
+    t12 = t6 - t5;
+    t4 = t2 - t10;
+    t8 = t3 + t1;
+    re[184] = t9;
+    im[184] = t11;
+    re[199] = t13;
+    im[199] = t14;
+    re[214] = t7;
+    im[214] = t12;
+    re[229] = t4;
+    im[229] = t8;
+    t0 = re[4];
+    t6 = im[4];
+    t5 = re[19];
+    t2 = im[19];
+    t10 = re[34];
+    t3 = im[34];
+    t1 = re[49];
+    t9 = im[49];
+    t11 = t0 + t10;
+    t13 = t6 + t3;
+    t14 = t5 + t1;
+    t7 = t2 + t9;
+    t12 = t0 - t10;
+    t4 = t6 - t3;
+    t8 = t5 - t1;
+    t0 = t2 - t9;
+    t10 = t11 + t14;
+    t6 = t13 + t7;
+    t3 = t12 + t0;
+    t5 = t4 - t8;
+    t1 = t11 - t14;
+    t2 = t13 - t7;
+    t9 = t12 - t0;
+    t11 = t4 + t8;
+    re[4] = t10;
+    im[4] = t6;
+    re[19] = t3;
+    im[19] = t5;
+    re[34] = t1;
+    im[34] = t2;
+    re[49] = t9;
+    im[49] = t11;
+}
+
+/**
+ *  Part 6 of ApplyWindowedMDCT_W10_480().
+ * 
+ *  @param {Number[]} x 
+ *    - The input block (960 points).
+ *  @param {Number[]} X 
+ *    - The array that would contain the output block (480 points).
+ *  @param {Number[]} re 
+ *    - The scratch buffer (real part, 240 points).
+ *  @param {Number[]} im 
+ *    - The scratch buffer (imaginary part, 240 points).
+ */
+function ApplyWindowedMDCT_W10_480_Part6(x, X, re, im) {
+    let t0, t1, t10, t11, t12, t13, t14, t2, t3, t4, t5, t6, t7, t8, t9;
+    const C0 = 0.05233595624294383;
+    const C1 = 0.9986295347545738;
+    const C2 = 0.9989506813588601;
+    const C3 = 0.04579886693652077;
+    const C4 = 0.9238795325112867;
+    const C5 = 1.3065629648763766;
+    const C6 = 0.5411961001461969;
+    const C7 = 0.7071067811865476;
+    const C8 = 0.3826834323650898;
+    const C9 = 0.9896513868196702;
+    const C10 = 0.1434926219911793;
+    const C11 = 0.149966755554045;
+    const C12 = 0.9886910398241674;
+    const C13 = 0.5590169943749475;
+    const C14 = 0.25;
+    const C15 = 0.9510565162951535;
+    const C16 = 0.5877852522924731;
+    const C17 = 0.5;
+    const C18 = 0.8660254037844386;
+    const C19 = 0.9999986613495281;
+    const C20 = 0.0016362454436240478;
+    const C21 = 0.498582300553759;
+    const C22 = 0.8668423672009352;
+    const C23 = 0.8652061217573113;
+    const C24 = 0.501416360795769;
+    const C25 = 0.8619058515047743;
+    const C26 = 0.507068341687617;
+    const C27 = 0.9999665339174011;
+    const C28 = 0.008181139603937128;
+    const C29 = 0.49289819222978404;
+    const C30 = 0.8700869911087115;
+    const C31 = 0.4871929697877464;
+    const C32 = 0.8732943433856628;
+    const C33 = 0.8585686600742043;
+    const C34 = 0.5126986014593617;
+    const C35 = 0.999891571247108;
+    const C36 = 0.014725683311458524;
+    const C37 = 0.9997737765498004;
+    const C38 = 0.02126959621971774;
+    const C39 = 0.4814668776203871;
+    const C40 = 0.8764642866394929;
+    const C41 = 0.8551946904197751;
+    const C42 = 0.5183068989294132;
+    const C43 = 0.8517840870711173;
+    const C44 = 0.5238929938569739;
+    const C45 = 0.9996131548714108;
+    const C46 = 0.027812598009265603;
+    const C47 = 0.4757201610144368;
+    const C48 = 0.8795966850803829;
+    const C49 = 0.4699530661401083;
+    const C50 = 0.8826914045268092;
+    const C51 = 0.8483369961271269;
+    const C52 = 0.529456646952329;
+    const C53 = 0.9994097130924373;
+    const C54 = 0.034354408399682276;
+    const C55 = 0.9991634599276488;
+    const C56 = 0.04089474716158345;
+    const C57 = 0.46416584004055156;
+    const C58 = 0.8857483124112905;
+    const C59 = 0.8448535652497071;
+    const C60 = 0.5349976198870972;
+    const C61 = 0.841333943657443;
+    const C62 = 0.5405156753044398;
+    const C63 = 0.9988744059257111;
+    const C64 = 0.0474333341286245;
+    const C65 = 0.45835873062127125;
+    const C66 = 0.8887672777860675;
+    const C67 = 0.45253198663950756;
+    const C68 = 0.8917481713287112;
+    const C69 = 0.8377782821192093;
+    const C70 = 0.5460105768292282;
+    const C71 = 0.9985425634687357;
+    const C72 = 0.05396988920950189;
+    const C73 = 0.998167946771749;
+    const C74 = 0.06050413239995127;
+    const C75 = 0.44668585769357955;
+    const C76 = 0.8946908653476636;
+    const C77 = 0.8341867329477124;
+    const C78 = 0.5514820890781694;
+    t14 = x[495];
+    t13 = x[15];
+    t7 = (-0.0003087071048978949) * t13;
+    t12 = x[464];
+    t0 = 0.06425739375479943 * t12;
+    t4 = t7 - t0;
+    t8 = (-0.04818802307230519) * t14;
+    t10 = 0.6691306063588582 * t4;
+    t6 = t8 + t10;
+    t3 = 0.04338869086102122 * t14;
+    t5 = 0.7431448254773942 * t4;
+    t1 = t3 + t5;
+    t2 = x[104];
+    t9 = (-0.007107865754189401) * t2;
+    t11 = x[375];
+    t13 = 0.06378148182289317 * t11;
+    t12 = t9 - t13;
+    t7 = x[584];
+    t0 = 0.4305110968082951 * t12;
+    t8 = (-0.058963384208714914) * t7;
+    t10 = t0 + t8;
+    t14 = (-0.9025852843498606) * t12;
+    t4 = (-0.028124091592638074) * t7;
+    t3 = t14 + t4;
+    t5 = x[224];
+    t2 = 0.04657358866856538 * t5;
+    t11 = x[255];
+    t9 = 0.06307476894193742 * t11;
+    t13 = t2 - t9;
+    t0 = x[704];
+    t8 = 0.04903936486333267 * t0;
+    t12 = x[735];
+    t7 = 0.023049975094085177 * t12;
+    t14 = t8 + t7;
+    t4 = C0 * t13;
+    t5 = (-C1) * t14;
+    t11 = t4 + t5;
+    t2 = (-C1) * t13;
+    t9 = (-C0) * t14;
+    t0 = t2 + t9;
+    t12 = x[615];
+    t8 = x[135];
+    t7 = (-0.003866006755833699) * t8;
+    t4 = x[344];
+    t5 = 0.06379076791189792 * t4;
+    t13 = t7 - t5;
+    t14 = (-0.061571180409292) * t12;
+    t2 = 0.33380685923377096 * t13;
+    t9 = t14 + t2;
+    t8 = 0.021803498515568565 * t12;
+    t4 = 0.9426414910921784 * t13;
+    t7 = t8 + t4;
+    t5 = t6 + t11;
+    t14 = t1 + t0;
+    t2 = t10 + t9;
+    t12 = t3 + t7;
+    t13 = t6 - t11;
+    t8 = t1 - t0;
+    t4 = t10 - t9;
+    t6 = t3 - t7;
+    t11 = t5 + t2;
+    t1 = t14 + t12;
+    t0 = t13 + t6;
+    t10 = t8 - t4;
+    t9 = t5 - t2;
+    t3 = t14 - t12;
+    t7 = t13 - t6;
+    t5 = t8 + t4;
+    re[112] = t11;
+    im[112] = t1;
+    re[172] = t0;
+    im[172] = t10;
+    re[232] = t9;
+    im[232] = t3;
+    re[52] = t7;
+    im[52] = t5;
+    t2 = x[14];
+    t14 = (-0.000276071014598291) * t2;
+    t12 = x[465];
+    t13 = 0.06427453374689003 * t12;
+    t6 = t14 - t13;
+    t8 = x[494];
+    t4 = 0.6739801114782978 * t6;
+    t11 = (-0.04789024045085553) * t8;
+    t1 = t4 + t11;
+    t0 = (-0.7387494902412463) * t6;
+    t10 = (-0.043691494916970684) * t8;
+    t9 = t0 + t10;
+    t3 = x[134];
+    t7 = (-0.004067503560849907) * t3;
+    t5 = x[345];
+    t2 = 0.06378277903383849 * t5;
+    t12 = t7 - t2;
+    t14 = x[614];
+    t13 = 0.3399692397309942 * t12;
+    t4 = (-0.06143485294533994) * t14;
+    t11 = t13 + t4;
+    t6 = (-0.9404365560933549) * t12;
+    t8 = (-0.02220879240974481) * t14;
+    t0 = t6 + t8;
+    t10 = x[705];
+    t3 = 0.04835633349131633 * t10;
+    t5 = x[734];
+    t7 = 0.02393234998677991 * t5;
+    t2 = t3 + t7;
+    t13 = x[225];
+    t4 = 0.04728713705877805 * t13;
+    t12 = x[254];
+    t14 = 0.0627627062181664 * t12;
+    t6 = t4 - t14;
+    t8 = (-C2) * t2;
+    t10 = C3 * t6;
+    t5 = t8 + t10;
+    t3 = C3 * t2;
+    t7 = C2 * t6;
+    t13 = t3 + t7;
+    t12 = x[585];
+    t4 = x[105];
+    t14 = (-0.007089347087212765) * t4;
+    t8 = x[374];
+    t10 = 0.06377706421929838 * t8;
+    t2 = t14 - t10;
+    t6 = (-0.05915028858603331) * t12;
+    t3 = 0.4245945112807131 * t2;
+    t7 = t6 + t3;
+    t4 = 0.027739498809787533 * t12;
+    t8 = 0.9053836208979552 * t2;
+    t14 = t4 + t8;
+    t10 = t1 + t5;
+    t6 = t9 + t13;
+    t3 = t11 + t7;
+    t12 = t0 + t14;
+    t2 = t1 - t5;
+    t4 = t9 - t13;
+    t8 = t11 - t7;
+    t1 = t0 - t14;
+    t5 = t10 + t3;
+    t9 = t6 + t12;
+    t13 = t2 + t1;
+    t11 = t4 - t8;
+    t7 = t10 - t3;
+    t0 = t6 - t12;
+    t14 = t2 - t1;
+    t10 = t4 + t8;
+    t3 = t13 + t11;
+    t6 = C4 * t3;
+    t12 = t13 * (-C5);
+    t2 = t11 * C6;
+    t1 = t6 - t2;
+    t4 = t6 + t12;
+    t8 = t7 + t0;
+    t3 = t7 - t0;
+    t13 = C7 * t8;
+    t11 = (-C7) * t3;
+    t2 = t14 + t10;
+    t6 = C8 * t2;
+    t12 = t14 * (-C5);
+    t7 = t10 * (-C6);
+    t0 = t6 - t7;
+    t8 = t6 + t12;
+    re[127] = t5;
+    im[127] = t9;
+    re[187] = t1;
+    im[187] = t4;
+    re[7] = t13;
+    im[7] = t11;
+    re[67] = t0;
+    im[67] = t8;
+    t3 = x[44];
+    t2 = (-0.002350185942897436) * t3;
+    t14 = x[435];
+    t10 = 0.06394708859422037 * t14;
+    t7 = t2 - t10;
+    t6 = x[524];
+    t12 = 0.598324600570659 * t7;
+    t5 = (-0.052208124345807384) * t6;
+    t9 = t12 + t5;
+    t1 = (-0.8012538126910607) * t7;
+    t4 = (-0.03898565554507096) * t6;
+    t13 = t1 + t4;
+    t11 = x[164];
+    t0 = 0.0056098920624594786 * t11;
+    t8 = x[315];
+    t3 = 0.06445643599870936 * t8;
+    t14 = t0 - t3;
+    t2 = x[644];
+    t10 = 0.24615329302899303 * t14;
+    t12 = (-0.06265413315528348) * t2;
+    t5 = t10 + t12;
+    t7 = (-0.9692309097067544) * t14;
+    t6 = (-0.015912122739375083) * t2;
+    t1 = t7 + t6;
+    t4 = x[675];
+    t11 = 0.06151976433786564 * t4;
+    t8 = x[764];
+    t0 = 0.003723341607873698 * t8;
+    t3 = t11 + t0;
+    t10 = x[195];
+    t12 = 0.024519826061939143 * t10;
+    t14 = x[284];
+    t2 = 0.06624490555084939 * t14;
+    t7 = t12 - t2;
+    t6 = (-C9) * t3;
+    t4 = C10 * t7;
+    t8 = t6 + t4;
+    t11 = C10 * t3;
+    t0 = C9 * t7;
+    t10 = t11 + t0;
+    t14 = x[555];
+    t12 = x[75];
+    t2 = (-0.005766978299216103) * t12;
+    t6 = x[404];
+    t4 = 0.06389241433934915 * t6;
+    t3 = t2 - t4;
+    t7 = (-0.056045151602877964) * t14;
+    t11 = 0.5112930860770522 * t3;
+    t0 = t7 + t11;
+    t12 = 0.03334336134708169 * t14;
+    t6 = 0.8594064115014527 * t3;
+    t2 = t12 + t6;
+    t4 = t9 + t8;
+    t7 = t13 + t10;
+    t11 = t5 + t0;
+    t14 = t1 + t2;
+    t3 = t9 - t8;
+    t12 = t13 - t10;
+    t6 = t5 - t0;
+    t9 = t1 - t2;
+    t8 = t4 + t11;
+    t13 = t7 + t14;
+    t10 = t3 + t9;
+    t5 = t12 - t6;
+    t0 = t4 - t11;
+    t1 = t7 - t14;
+    t2 = t3 - t9;
+    t4 = t12 + t6;
+    t11 = t10 + t5;
+    t7 = t10 - t5;
+    t14 = C7 * t11;
+    t3 = (-C7) * t7;
+    t9 = -t0;
+    t12 = t2 - t4;
+    t6 = t2 + t4;
+    t10 = (-C7) * t12;
+    t5 = (-C7) * t6;
+    re[142] = t8;
+    im[142] = t13;
+    re[202] = t14;
+    im[202] = t3;
+    re[22] = t1;
+    im[22] = t9;
+    re[82] = t10;
+    im[82] = t5;
+    t11 = x[74];
+    t7 = (-0.005670289327193386) * t11;
+    t0 = x[405];
+    t2 = 0.06389429790898767 * t0;
+    t4 = t7 - t2;
+    t12 = x[554];
+    t6 = 0.5169068966820275 * t4;
+    t8 = (-0.05582407526504) * t12;
+    t13 = t6 + t8;
+    t14 = (-0.8560416229147715) * t4;
+    t3 = (-0.033708465491599914) * t12;
+    t1 = t14 + t3;
+    t9 = x[194];
+    t10 = 0.023786028235371508 * t9;
+    t5 = x[285];
+    t11 = 0.06620871500902986 * t5;
+    t0 = t10 - t11;
+    t7 = x[674];
+    t2 = 0.061725202011645934 * t7;
+    t6 = x[765];
+    t8 = 0.0033599706942228093 * t6;
+    t4 = t2 + t8;
+    t12 = C11 * t0;
+    t14 = (-C12) * t4;
+    t3 = t12 + t14;
+    t9 = (-C12) * t0;
+    t5 = (-C11) * t4;
+    t10 = t9 + t5;
+    t11 = x[645];
+    t7 = x[165];
+    t6 = 0.00607659065620141 * t7;
+    t2 = x[314];
+    t8 = 0.06450015372569924 * t2;
+    t12 = t6 - t8;
+    t14 = (-0.06271439887799558) * t11;
+    t0 = 0.23980446465501654 * t12;
+    t4 = t14 + t0;
+    t9 = 0.015491207565878875 * t11;
+    t5 = 0.9708212084269281 * t12;
+    t7 = t9 + t5;
+    t2 = x[525];
+    t6 = x[45];
+    t8 = (-0.0024546596113903703) * t6;
+    t14 = x[434];
+    t0 = 0.06394282983321359 * t14;
+    t11 = t8 - t0;
+    t12 = (-0.052465658950281095) * t2;
+    t9 = 0.5930676289532372 * t11;
+    t5 = t12 + t9;
+    t6 = 0.03864569533572514 * t2;
+    t14 = 0.8051526485628582 * t11;
+    t8 = t6 + t14;
+    t0 = t13 + t4;
+    t12 = t1 + t7;
+    t9 = t3 + t5;
+    t2 = t10 + t8;
+    t11 = t13 - t4;
+    t6 = t1 - t7;
+    t14 = t3 - t5;
+    t13 = t10 - t8;
+    t4 = t0 + t9;
+    t1 = t12 + t2;
+    t7 = t11 + t13;
+    t3 = t6 - t14;
+    t5 = t0 - t9;
+    t10 = t12 - t2;
+    t8 = t11 - t13;
+    t0 = t6 + t14;
+    t9 = t7 + t3;
+    t12 = C8 * t9;
+    t2 = t7 * (-C5);
+    t11 = t3 * (-C6);
+    t13 = t12 - t11;
+    t6 = t12 + t2;
+    t14 = t5 - t10;
+    t9 = t5 + t10;
+    t7 = (-C7) * t14;
+    t3 = (-C7) * t9;
+    t11 = t8 + t0;
+    t12 = (-C4) * t11;
+    t2 = t8 * C5;
+    t5 = t0 * (-C6);
+    t10 = t12 - t5;
+    t14 = t12 + t2;
+    re[157] = t4;
+    im[157] = t1;
+    re[217] = t13;
+    im[217] = t6;
+    re[37] = t7;
+    im[37] = t3;
+    re[97] = t10;
+    im[97] = t14;
+    t9 = re[112];
+    t11 = im[112];
+    t8 = re[127];
+    t0 = im[127];
+    t5 = re[142];
+    t12 = im[142];
+    t2 = re[157];
+    t4 = im[157];
+    t1 = t9 + t5;
+    t13 = t11 + t12;
+    t6 = t8 + t2;
+    t7 = t0 + t4;
+    t3 = t9 - t5;
+    t10 = t11 - t12;
+    t14 = t8 - t2;
+    t9 = t0 - t4;
+    t5 = t1 + t6;
+    t11 = t13 + t7;
+    t12 = t3 + t9;
+    t8 = t10 - t14;
+    t2 = t1 - t6;
+    t0 = t13 - t7;
+    t4 = t3 - t9;
+    t1 = t10 + t14;
+    re[112] = t5;
+    im[112] = t11;
+    re[127] = t12;
+    im[127] = t8;
+    re[142] = t2;
+    im[142] = t0;
+    re[157] = t4;
+    im[157] = t1;
+    t6 = re[172];
+    t13 = im[172];
+    t7 = re[187];
+    t3 = im[187];
+    t9 = re[202];
+    t10 = im[202];
+    t14 = re[217];
+    t5 = im[217];
+    t11 = t6 + t9;
+    t12 = t13 + t10;
+    t8 = t7 + t14;
+    t2 = t3 + t5;
+    t0 = t6 - t9;
+    t4 = t13 - t10;
+    t1 = t7 - t14;
+    t6 = t3 - t5;
+    t9 = t11 + t8;
+    t13 = t12 + t2;
+    t10 = t0 + t6;
+    t7 = t4 - t1;
+    t14 = t11 - t8;
+    t3 = t12 - t2;
+    t5 = t0 - t6;
+    t11 = t4 + t1;
+    re[172] = t9;
+    im[172] = t13;
+    re[187] = t10;
+    im[187] = t7;
+    re[202] = t14;
+    im[202] = t3;
+    re[217] = t5;
+    im[217] = t11;
+    t8 = re[232];
+    t12 = im[232];
+    t2 = re[7];
+    t0 = im[7];
+    t6 = re[22];
+    t4 = im[22];
+    t1 = re[37];
+    t9 = im[37];
+    t13 = t8 + t6;
+    t10 = t12 + t4;
+    t7 = t2 + t1;
+    t14 = t0 + t9;
+    t3 = t8 - t6;
+    t5 = t12 - t4;
+    t11 = t2 - t1;
+    t8 = t0 - t9;
+    t6 = t13 + t7;
+    t12 = t10 + t14;
+    t4 = t3 + t8;
+    t2 = t5 - t11;
+    t1 = t13 - t7;
+    t0 = t10 - t14;
+    t9 = t3 - t8;
+    t13 = t5 + t11;
+    re[232] = t6;
+    im[232] = t12;
+    re[7] = t4;
+    im[7] = t2;
+    re[22] = t1;
+    im[22] = t0;
+    re[37] = t9;
+    im[37] = t13;
+    t7 = re[52];
+    t10 = im[52];
+    t14 = re[67];
+    t3 = im[67];
+    t8 = re[82];
+    t5 = im[82];
+    t11 = re[97];
+    t6 = im[97];
+    t12 = t7 + t8;
+    t4 = t10 + t5;
+    t2 = t14 + t11;
+    t1 = t3 + t6;
+    t0 = t7 - t8;
+    t9 = t10 - t5;
+    t13 = t14 - t11;
+    t7 = t3 - t6;
+    t8 = t12 + t2;
+    t10 = t4 + t1;
+    t5 = t0 + t7;
+    t14 = t9 - t13;
+    t11 = t12 - t2;
+    t3 = t4 - t1;
+    t6 = t0 - t7;
+    t12 = t9 + t13;
+    re[52] = t8;
+    im[52] = t10;
+    re[67] = t5;
+    im[67] = t14;
+    re[82] = t11;
+    im[82] = t3;
+    re[97] = t6;
+    im[97] = t12;
+    t2 = re[160];
+    t4 = im[160];
+    t1 = re[208];
+    t0 = im[208];
+    t7 = re[16];
+    t9 = im[16];
+    t13 = re[64];
+    t8 = im[64];
+    t10 = re[112];
+    t5 = im[112];
+    t14 = t1 + t10;
+    t11 = t0 + t5;
+    t3 = t7 + t13;
+    t6 = t9 + t8;
+    t12 = t1 - t10;
+    t1 = t0 - t5;
+    t10 = t7 - t13;
+    t0 = t9 - t8;
+    t5 = t14 + t3;
+    t7 = t11 + t6;
+    t13 = t14 - t3;
+    t9 = C13 * t13;
+    t8 = t11 - t6;
+    t14 = C13 * t8;
+    t3 = C14 * t5;
+    t13 = t2 - t3;
+    t11 = C14 * t7;
+    t6 = t4 - t11;
+    t8 = t13 + t9;
+    t3 = t6 + t14;
+    t11 = t13 - t9;
+    t13 = t6 - t14;
+    t9 = C15 * t12;
+    t6 = C16 * t10;
+    t14 = t9 + t6;
+    t9 = C15 * t1;
+    t6 = C16 * t0;
+    t9 = t9 + t6;
+    t6 = C16 * t12;
+    t12 = C15 * t10;
+    t10 = t6 - t12;
+    t6 = C16 * t1;
+    t12 = C15 * t0;
+    t1 = t6 - t12;
+    t0 = t2 + t5;
+    t6 = t4 + t7;
+    t12 = t8 + t9;
+    t2 = t3 - t14;
+    t5 = t11 + t1;
+    t4 = t13 - t10;
+    t7 = t11 - t1;
+    t11 = t13 + t10;
+    t1 = t8 - t9;
+    t13 = t3 + t14;
+    re[160] = t0;
+    im[160] = t6;
+    re[208] = t12;
+    im[208] = t2;
+    re[16] = t5;
+    im[16] = t4;
+    re[64] = t7;
+    im[64] = t11;
+    re[112] = t1;
+    im[112] = t13;
+    t10 = re[220];
+    t8 = im[220];
+    t9 = re[28];
+    t3 = im[28];
+    t14 = re[76];
+    t0 = im[76];
+    t6 = re[124];
+    t12 = im[124];
+    t2 = re[172];
+    t5 = im[172];
+    t4 = t9 + t2;
+    t7 = t3 + t5;
+    t11 = t14 + t6;
+    t1 = t0 + t12;
+    t13 = t9 - t2;
+    t9 = t3 - t5;
+    t2 = t14 - t6;
+    t3 = t0 - t12;
+    t5 = t4 + t11;
+    t14 = t7 + t1;
+    t6 = t4 - t11;
+    t0 = C13 * t6;
+    t12 = t7 - t1;
+    t4 = C13 * t12;
+    t11 = C14 * t5;
+    t6 = t10 - t11;
+    t7 = C14 * t14;
+    t1 = t8 - t7;
+    t12 = t6 + t0;
+    t11 = t1 + t4;
+    t7 = t6 - t0;
+    t6 = t1 - t4;
+    t0 = C15 * t13;
+    t1 = C16 * t2;
+    t4 = t0 + t1;
+    t0 = C15 * t9;
+    t1 = C16 * t3;
+    t0 = t0 + t1;
+    t1 = C16 * t13;
+    t13 = C15 * t2;
+    t2 = t1 - t13;
+    t1 = C16 * t9;
+    t13 = C15 * t3;
+    t9 = t1 - t13;
+    t3 = t10 + t5;
+    t1 = t8 + t14;
+    t13 = t12 + t0;
+    t10 = t11 - t4;
+    t5 = t7 + t9;
+    t8 = t6 - t2;
+    t14 = t7 - t9;
+    t7 = t6 + t2;
+    t9 = t12 - t0;
+    t6 = t11 + t4;
+    re[220] = t3;
+    im[220] = t1;
+    re[28] = t13;
+    im[28] = t10;
+    re[76] = t5;
+    im[76] = t8;
+    re[124] = t14;
+    im[124] = t7;
+    re[172] = t9;
+    im[172] = t6;
+    t2 = re[40];
+    t12 = im[40];
+    t0 = re[88];
+    t11 = im[88];
+    t4 = re[136];
+    t3 = im[136];
+    t1 = re[184];
+    t13 = im[184];
+    t10 = re[232];
+    t5 = im[232];
+    t8 = t0 + t10;
+    t14 = t11 + t5;
+    t7 = t4 + t1;
+    t9 = t3 + t13;
+    t6 = t0 - t10;
+    t0 = t11 - t5;
+    t10 = t4 - t1;
+    t11 = t3 - t13;
+    t5 = t8 + t7;
+    t4 = t14 + t9;
+    t1 = t8 - t7;
+    t3 = C13 * t1;
+    t13 = t14 - t9;
+    t8 = C13 * t13;
+    t7 = C14 * t5;
+    t1 = t2 - t7;
+    t14 = C14 * t4;
+    t9 = t12 - t14;
+    t13 = t1 + t3;
+    t7 = t9 + t8;
+    t14 = t1 - t3;
+    t1 = t9 - t8;
+    t3 = C15 * t6;
+    t9 = C16 * t10;
+    t8 = t3 + t9;
+    t3 = C15 * t0;
+    t9 = C16 * t11;
+    t3 = t3 + t9;
+    t9 = C16 * t6;
+    t6 = C15 * t10;
+    t10 = t9 - t6;
+    t9 = C16 * t0;
+    t6 = C15 * t11;
+    t0 = t9 - t6;
+    t11 = t2 + t5;
+    t9 = t12 + t4;
+    t6 = t13 + t3;
+    t2 = t7 - t8;
+    t5 = t14 + t0;
+    t12 = t1 - t10;
+    t4 = t14 - t0;
+    t14 = t1 + t10;
+    t0 = t13 - t3;
+    t1 = t7 + t8;
+    re[40] = t11;
+    im[40] = t9;
+    re[88] = t6;
+    im[88] = t2;
+    re[136] = t5;
+    im[136] = t12;
+    re[184] = t4;
+    im[184] = t14;
+    re[232] = t0;
+    im[232] = t1;
+    t10 = re[100];
+    t13 = im[100];
+    t3 = re[148];
+    t7 = im[148];
+    t8 = re[196];
+    t11 = im[196];
+    t9 = re[4];
+    t6 = im[4];
+    t2 = re[52];
+    t5 = im[52];
+    t12 = t3 + t2;
+    t4 = t7 + t5;
+    t14 = t8 + t9;
+    t0 = t11 + t6;
+    t1 = t3 - t2;
+    t3 = t7 - t5;
+    t2 = t8 - t9;
+    t7 = t11 - t6;
+    t5 = t12 + t14;
+    t8 = t4 + t0;
+    t9 = t12 - t14;
+    t11 = C13 * t9;
+    t6 = t4 - t0;
+    t12 = C13 * t6;
+    t14 = C14 * t5;
+    t9 = t10 - t14;
+    t4 = C14 * t8;
+    t0 = t13 - t4;
+    t6 = t9 + t11;
+    t14 = t0 + t12;
+    t4 = t9 - t11;
+    t9 = t0 - t12;
+    t11 = C15 * t1;
+    t0 = C16 * t2;
+    t12 = t11 + t0;
+    t11 = C15 * t3;
+    t0 = C16 * t7;
+    t11 = t11 + t0;
+    t0 = C16 * t1;
+    t1 = C15 * t2;
+    t2 = t0 - t1;
+    t0 = C16 * t3;
+    t1 = C15 * t7;
+    t3 = t0 - t1;
+    t7 = t10 + t5;
+    t0 = t13 + t8;
+    t1 = t6 + t11;
+    t10 = t14 - t12;
+    t5 = t4 + t3;
+    t13 = t9 - t2;
+    t8 = t4 - t3;
+    t4 = t9 + t2;
+    t3 = t6 - t11;
+    t9 = t14 + t12;
+    re[100] = t7;
+    im[100] = t0;
+    re[148] = t1;
+    im[148] = t10;
+    re[196] = t5;
+    im[196] = t13;
+    re[4] = t8;
+    im[4] = t4;
+    re[52] = t3;
+    im[52] = t9;
+    t2 = re[175];
+    t6 = im[175];
+    t11 = re[223];
+    t14 = im[223];
+    t12 = re[31];
+    t7 = im[31];
+    t0 = re[79];
+    t1 = im[79];
+    t10 = re[127];
+    t5 = im[127];
+    t13 = t11 + t10;
+    t8 = t14 + t5;
+    t4 = t12 + t0;
+    t3 = t7 + t1;
+    t9 = t11 - t10;
+    t11 = t14 - t5;
+    t10 = t12 - t0;
+    t14 = t7 - t1;
+    t5 = t13 + t4;
+    t12 = t8 + t3;
+    t0 = t13 - t4;
+    t7 = C13 * t0;
+    t1 = t8 - t3;
+    t13 = C13 * t1;
+    t4 = C14 * t5;
+    t0 = t2 - t4;
+    t8 = C14 * t12;
+    t3 = t6 - t8;
+    t1 = t0 + t7;
+    t4 = t3 + t13;
+    t8 = t0 - t7;
+    t0 = t3 - t13;
+    t7 = C15 * t9;
+    t3 = C16 * t10;
+    t13 = t7 + t3;
+    t7 = C15 * t11;
+    t3 = C16 * t14;
+    t7 = t7 + t3;
+    t3 = C16 * t9;
+    t9 = C15 * t10;
+    t10 = t3 - t9;
+    t3 = C16 * t11;
+    t9 = C15 * t14;
+    t11 = t3 - t9;
+    t14 = t2 + t5;
+    t3 = t6 + t12;
+    t9 = t1 + t7;
+    t2 = t4 - t13;
+    t5 = t8 + t11;
+    t6 = t0 - t10;
+    t12 = t8 - t11;
+    t8 = t0 + t10;
+    t11 = t1 - t7;
+    t0 = t4 + t13;
+    re[175] = t14;
+    im[175] = t3;
+    re[223] = t9;
+    im[223] = t2;
+    re[31] = t5;
+    im[31] = t6;
+    re[79] = t12;
+    im[79] = t8;
+    re[127] = t11;
+    im[127] = t0;
+    t10 = re[235];
+    t1 = im[235];
+    t7 = re[43];
+    t4 = im[43];
+    t13 = re[91];
+    t14 = im[91];
+    t3 = re[139];
+    t9 = im[139];
+    t2 = re[187];
+    t5 = im[187];
+    t6 = t7 + t2;
+    t12 = t4 + t5;
+    t8 = t13 + t3;
+    t11 = t14 + t9;
+    t0 = t7 - t2;
+    t7 = t4 - t5;
+    t2 = t13 - t3;
+    t4 = t14 - t9;
+    t5 = t6 + t8;
+    t13 = t12 + t11;
+    t3 = t6 - t8;
+    t14 = C13 * t3;
+    t9 = t12 - t11;
+    t6 = C13 * t9;
+    t8 = C14 * t5;
+    t3 = t10 - t8;
+    t12 = C14 * t13;
+    t11 = t1 - t12;
+    t9 = t3 + t14;
+    t8 = t11 + t6;
+    t12 = t3 - t14;
+    t3 = t11 - t6;
+    t14 = C15 * t0;
+    t11 = C16 * t2;
+    t6 = t14 + t11;
+    t14 = C15 * t7;
+    t11 = C16 * t4;
+    t14 = t14 + t11;
+    t11 = C16 * t0;
+    t0 = C15 * t2;
+    t2 = t11 - t0;
+    t11 = C16 * t7;
+    t0 = C15 * t4;
+    t7 = t11 - t0;
+    t4 = t10 + t5;
+    t11 = t1 + t13;
+    t0 = t9 + t14;
+    t10 = t8 - t6;
+    t5 = t12 + t7;
+    t1 = t3 - t2;
+    t13 = t12 - t7;
+    t12 = t3 + t2;
+    t7 = t9 - t14;
+    t3 = t8 + t6;
+    re[235] = t4;
+    im[235] = t11;
+    re[43] = t0;
+    im[43] = t10;
+    re[91] = t5;
+    im[91] = t1;
+    re[139] = t13;
+    im[139] = t12;
+    re[187] = t7;
+    im[187] = t3;
+    t2 = re[55];
+    t9 = im[55];
+    t14 = re[103];
+    t8 = im[103];
+    t6 = re[151];
+    t4 = im[151];
+    t11 = re[199];
+    t0 = im[199];
+    t10 = re[7];
+    t5 = im[7];
+    t1 = t14 + t10;
+    t13 = t8 + t5;
+    t12 = t6 + t11;
+    t7 = t4 + t0;
+    t3 = t14 - t10;
+    t14 = t8 - t5;
+    t10 = t6 - t11;
+    t8 = t4 - t0;
+    t5 = t1 + t12;
+    t6 = t13 + t7;
+    t11 = t1 - t12;
+    t4 = C13 * t11;
+    t0 = t13 - t7;
+    t1 = C13 * t0;
+    t12 = C14 * t5;
+    t11 = t2 - t12;
+    t13 = C14 * t6;
+    t7 = t9 - t13;
+    t0 = t11 + t4;
+    t12 = t7 + t1;
+    t13 = t11 - t4;
+    t11 = t7 - t1;
+    t4 = C15 * t3;
+    t7 = C16 * t10;
+    t1 = t4 + t7;
+    t4 = C15 * t14;
+    t7 = C16 * t8;
+    t4 = t4 + t7;
+    t7 = C16 * t3;
+    t3 = C15 * t10;
+    t10 = t7 - t3;
+    t7 = C16 * t14;
+    t3 = C15 * t8;
+    t14 = t7 - t3;
+    t8 = t2 + t5;
+    t7 = t9 + t6;
+    t3 = t0 + t4;
+    t2 = t12 - t1;
+    t5 = t13 + t14;
+    t9 = t11 - t10;
+    t6 = t13 - t14;
+    t13 = t11 + t10;
+    t14 = t0 - t4;
+    t11 = t12 + t1;
+    re[55] = t8;
+    im[55] = t7;
+    re[103] = t3;
+    im[103] = t2;
+    re[151] = t5;
+    im[151] = t9;
+    re[199] = t6;
+    im[199] = t13;
+    re[7] = t14;
+    im[7] = t11;
+    t10 = re[115];
+    t0 = im[115];
+    t4 = re[163];
+    t12 = im[163];
+    t1 = re[211];
+    t8 = im[211];
+    t7 = re[19];
+    t3 = im[19];
+    t2 = re[67];
+    t5 = im[67];
+    t9 = t4 + t2;
+    t6 = t12 + t5;
+    t13 = t1 + t7;
+    t14 = t8 + t3;
+    t11 = t4 - t2;
+    t4 = t12 - t5;
+    t2 = t1 - t7;
+    t12 = t8 - t3;
+    t5 = t9 + t13;
+    t1 = t6 + t14;
+    t7 = t9 - t13;
+    t8 = C13 * t7;
+    t3 = t6 - t14;
+    t9 = C13 * t3;
+    t13 = C14 * t5;
+    t7 = t10 - t13;
+    t6 = C14 * t1;
+    t14 = t0 - t6;
+    t3 = t7 + t8;
+    t13 = t14 + t9;
+    t6 = t7 - t8;
+    t7 = t14 - t9;
+    t8 = C15 * t11;
+    t14 = C16 * t2;
+    t9 = t8 + t14;
+    t8 = C15 * t4;
+    t14 = C16 * t12;
+    t8 = t8 + t14;
+    t14 = C16 * t11;
+    t11 = C15 * t2;
+    t2 = t14 - t11;
+    t14 = C16 * t4;
+    t11 = C15 * t12;
+    t4 = t14 - t11;
+    t12 = t10 + t5;
+    t14 = t0 + t1;
+    t11 = t3 + t8;
+    t10 = t13 - t9;
+    t5 = t6 + t4;
+    t0 = t7 - t2;
+    t1 = t6 - t4;
+    t6 = t7 + t2;
+    t4 = t3 - t8;
+    t7 = t13 + t9;
+    re[115] = t12;
+    im[115] = t14;
+    re[163] = t11;
+    im[163] = t10;
+    re[211] = t5;
+    im[211] = t0;
+    re[19] = t1;
+    im[19] = t6;
+    re[67] = t4;
+    im[67] = t7;
+    t2 = re[190];
+    t3 = im[190];
+    t8 = re[238];
+    t13 = im[238];
+    t9 = re[46];
+    t12 = im[46];
+    t14 = re[94];
+    t11 = im[94];
+    t10 = re[142];
+    t5 = im[142];
+    t0 = t8 + t10;
+    t1 = t13 + t5;
+    t6 = t9 + t14;
+    t4 = t12 + t11;
+    t7 = t8 - t10;
+    t8 = t13 - t5;
+    t10 = t9 - t14;
+    t13 = t12 - t11;
+    t5 = t0 + t6;
+    t9 = t1 + t4;
+    t14 = t0 - t6;
+    t12 = C13 * t14;
+    t11 = t1 - t4;
+    t0 = C13 * t11;
+    t6 = C14 * t5;
+    t14 = t2 - t6;
+    t1 = C14 * t9;
+    t4 = t3 - t1;
+    t11 = t14 + t12;
+    t6 = t4 + t0;
+    t1 = t14 - t12;
+    t14 = t4 - t0;
+    t12 = C15 * t7;
+    t4 = C16 * t10;
+    t0 = t12 + t4;
+    t12 = C15 * t8;
+    t4 = C16 * t13;
+    t12 = t12 + t4;
+    t4 = C16 * t7;
+    t7 = C15 * t10;
+    t10 = t4 - t7;
+    t4 = C16 * t8;
+    t7 = C15 * t13;
+    t8 = t4 - t7;
+    t13 = t2 + t5;
+    t4 = t3 + t9;
+    t7 = t11 + t12;
+    t2 = t6 - t0;
+    t5 = t1 + t8;
+    t3 = t14 - t10;
+    t9 = t1 - t8;
+    t1 = t14 + t10;
+    t8 = t11 - t12;
+    t14 = t6 + t0;
+    re[190] = t13;
+    im[190] = t4;
+    re[238] = t7;
+    im[238] = t2;
+    re[46] = t5;
+    im[46] = t3;
+    re[94] = t9;
+    im[94] = t1;
+    re[142] = t8;
+    im[142] = t14;
+    t10 = re[10];
+    t11 = im[10];
+    t12 = re[58];
+    t6 = im[58];
+    t0 = re[106];
+    t13 = im[106];
+    t4 = re[154];
+    t7 = im[154];
+    t2 = re[202];
+    t5 = im[202];
+    t3 = t12 + t2;
+    t9 = t6 + t5;
+    t1 = t0 + t4;
+    t8 = t13 + t7;
+    t14 = t12 - t2;
+    t12 = t6 - t5;
+    t2 = t0 - t4;
+    t6 = t13 - t7;
+    t5 = t3 + t1;
+    t0 = t9 + t8;
+    t4 = t3 - t1;
+    t13 = C13 * t4;
+    t7 = t9 - t8;
+    t3 = C13 * t7;
+    t1 = C14 * t5;
+    t4 = t10 - t1;
+    t9 = C14 * t0;
+    t8 = t11 - t9;
+    t7 = t4 + t13;
+    t1 = t8 + t3;
+    t9 = t4 - t13;
+    t4 = t8 - t3;
+    t13 = C15 * t14;
+    t8 = C16 * t2;
+    t3 = t13 + t8;
+    t13 = C15 * t12;
+    t8 = C16 * t6;
+    t13 = t13 + t8;
+    t8 = C16 * t14;
+    t14 = C15 * t2;
+    t2 = t8 - t14;
+    t8 = C16 * t12;
+    t14 = C15 * t6;
+    t12 = t8 - t14;
+    t6 = t10 + t5;
+    t8 = t11 + t0;
+    t14 = t7 + t13;
+    t10 = t1 - t3;
+    t5 = t9 + t12;
+    t11 = t4 - t2;
+    t0 = t9 - t12;
+    t9 = t4 + t2;
+    t12 = t7 - t13;
+    t4 = t1 + t3;
+    re[10] = t6;
+    im[10] = t8;
+    re[58] = t14;
+    im[58] = t10;
+    re[106] = t5;
+    im[106] = t11;
+    re[154] = t0;
+    im[154] = t9;
+    re[202] = t12;
+    im[202] = t4;
+    t2 = re[70];
+    t7 = im[70];
+    t13 = re[118];
+    t1 = im[118];
+    t3 = re[166];
+    t6 = im[166];
+    t8 = re[214];
+    t14 = im[214];
+    t10 = re[22];
+    t5 = im[22];
+    t11 = t13 + t10;
+    t0 = t1 + t5;
+    t9 = t3 + t8;
+    t12 = t6 + t14;
+    t4 = t13 - t10;
+    t13 = t1 - t5;
+    t10 = t3 - t8;
+    t1 = t6 - t14;
+    t5 = t11 + t9;
+    t3 = t0 + t12;
+    t8 = t11 - t9;
+    t6 = C13 * t8;
+    t14 = t0 - t12;
+    t11 = C13 * t14;
+    t9 = C14 * t5;
+    t8 = t2 - t9;
+    t0 = C14 * t3;
+    t12 = t7 - t0;
+    t14 = t8 + t6;
+    t9 = t12 + t11;
+    t0 = t8 - t6;
+    t8 = t12 - t11;
+    t6 = C15 * t4;
+    t12 = C16 * t10;
+    t11 = t6 + t12;
+    t6 = C15 * t13;
+    t12 = C16 * t1;
+    t6 = t6 + t12;
+    t12 = C16 * t4;
+    t4 = C15 * t10;
+    t10 = t12 - t4;
+    t12 = C16 * t13;
+    t4 = C15 * t1;
+    t13 = t12 - t4;
+    t1 = t2 + t5;
+    t12 = t7 + t3;
+    t4 = t14 + t6;
+    t2 = t9 - t11;
+    t5 = t0 + t13;
+    t7 = t8 - t10;
+    t3 = t0 - t13;
+    t0 = t8 + t10;
+    t13 = t14 - t6;
+    t8 = t9 + t11;
+    re[70] = t1;
+    im[70] = t12;
+    re[118] = t4;
+    im[118] = t2;
+    re[166] = t5;
+    im[166] = t7;
+    re[214] = t3;
+    im[214] = t0;
+    re[22] = t13;
+    im[22] = t8;
+    t10 = re[130];
+    t14 = im[130];
+    t6 = re[178];
+    t9 = im[178];
+    t11 = re[226];
+    t1 = im[226];
+    t12 = re[34];
+    t4 = im[34];
+    t2 = re[82];
+    t5 = im[82];
+    t7 = t6 + t2;
+    t3 = t9 + t5;
+    t0 = t11 + t12;
+    t13 = t1 + t4;
+    t8 = t6 - t2;
+    t6 = t9 - t5;
+    t2 = t11 - t12;
+    t9 = t1 - t4;
+    t5 = t7 + t0;
+    t11 = t3 + t13;
+    t12 = t7 - t0;
+    t1 = C13 * t12;
+    t4 = t3 - t13;
+    t7 = C13 * t4;
+    t0 = C14 * t5;
+    t12 = t10 - t0;
+    t3 = C14 * t11;
+    t13 = t14 - t3;
+    t4 = t12 + t1;
+    t0 = t13 + t7;
+    t3 = t12 - t1;
+    t12 = t13 - t7;
+    t1 = C15 * t8;
+    t13 = C16 * t2;
+    t7 = t1 + t13;
+    t1 = C15 * t6;
+    t13 = C16 * t9;
+    t1 = t1 + t13;
+    t13 = C16 * t8;
+    t8 = C15 * t2;
+    t2 = t13 - t8;
+    t13 = C16 * t6;
+    t8 = C15 * t9;
+    t6 = t13 - t8;
+    t9 = t10 + t5;
+    t13 = t14 + t11;
+    t8 = t4 + t1;
+    t10 = t0 - t7;
+    t5 = t3 + t6;
+    t14 = t12 - t2;
+    t11 = t3 - t6;
+    t3 = t12 + t2;
+    t6 = t4 - t1;
+    t12 = t0 + t7;
+    re[130] = t9;
+    im[130] = t13;
+    re[178] = t8;
+    im[178] = t10;
+    re[226] = t5;
+    im[226] = t14;
+    re[34] = t11;
+    im[34] = t3;
+    re[82] = t6;
+    im[82] = t12;
+    t2 = re[205];
+    t4 = im[205];
+    t1 = re[13];
+    t0 = im[13];
+    t7 = re[61];
+    t9 = im[61];
+    t13 = re[109];
+    t8 = im[109];
+    t10 = re[157];
+    t5 = im[157];
+    t14 = t1 + t10;
+    t11 = t0 + t5;
+    t3 = t7 + t13;
+    t6 = t9 + t8;
+    t12 = t1 - t10;
+    t1 = t0 - t5;
+    t10 = t7 - t13;
+    t0 = t9 - t8;
+    t5 = t14 + t3;
+    t7 = t11 + t6;
+    t13 = t14 - t3;
+    t9 = C13 * t13;
+    t8 = t11 - t6;
+    t14 = C13 * t8;
+    t3 = C14 * t5;
+    t13 = t2 - t3;
+    t11 = C14 * t7;
+    t6 = t4 - t11;
+    t8 = t13 + t9;
+    t3 = t6 + t14;
+    t11 = t13 - t9;
+    t13 = t6 - t14;
+    t9 = C15 * t12;
+    t6 = C16 * t10;
+    t14 = t9 + t6;
+    t9 = C15 * t1;
+    t6 = C16 * t0;
+    t9 = t9 + t6;
+    t6 = C16 * t12;
+    t12 = C15 * t10;
+    t10 = t6 - t12;
+    t6 = C16 * t1;
+    t12 = C15 * t0;
+    t1 = t6 - t12;
+    t0 = t2 + t5;
+    t6 = t4 + t7;
+    t12 = t8 + t9;
+    t2 = t3 - t14;
+    t5 = t11 + t1;
+    t4 = t13 - t10;
+    t7 = t11 - t1;
+    t11 = t13 + t10;
+    t1 = t8 - t9;
+    t13 = t3 + t14;
+    re[205] = t0;
+    im[205] = t6;
+    re[13] = t12;
+    im[13] = t2;
+    re[61] = t5;
+    im[61] = t4;
+    re[109] = t7;
+    im[109] = t11;
+    re[157] = t1;
+    im[157] = t13;
+    t10 = re[25];
+    t8 = im[25];
+    t9 = re[73];
+    t3 = im[73];
+    t14 = re[121];
+    t0 = im[121];
+    t6 = re[169];
+    t12 = im[169];
+    t2 = re[217];
+    t5 = im[217];
+    t4 = t9 + t2;
+    t7 = t3 + t5;
+    t11 = t14 + t6;
+    t1 = t0 + t12;
+    t13 = t9 - t2;
+    t9 = t3 - t5;
+    t2 = t14 - t6;
+    t3 = t0 - t12;
+    t5 = t4 + t11;
+    t14 = t7 + t1;
+    t6 = t4 - t11;
+    t0 = C13 * t6;
+    t12 = t7 - t1;
+    t4 = C13 * t12;
+    t11 = C14 * t5;
+    t6 = t10 - t11;
+    t7 = C14 * t14;
+    t1 = t8 - t7;
+    t12 = t6 + t0;
+    t11 = t1 + t4;
+    t7 = t6 - t0;
+    t6 = t1 - t4;
+    t0 = C15 * t13;
+    t1 = C16 * t2;
+    t4 = t0 + t1;
+    t0 = C15 * t9;
+    t1 = C16 * t3;
+    t0 = t0 + t1;
+    t1 = C16 * t13;
+    t13 = C15 * t2;
+    t2 = t1 - t13;
+    t1 = C16 * t9;
+    t13 = C15 * t3;
+    t9 = t1 - t13;
+    t3 = t10 + t5;
+    t1 = t8 + t14;
+    t13 = t12 + t0;
+    t10 = t11 - t4;
+    t5 = t7 + t9;
+    t8 = t6 - t2;
+    t14 = t7 - t9;
+    t7 = t6 + t2;
+    t9 = t12 - t0;
+    t6 = t11 + t4;
+    re[25] = t3;
+    im[25] = t1;
+    re[73] = t13;
+    im[73] = t10;
+    re[121] = t5;
+    im[121] = t8;
+    re[169] = t14;
+    im[169] = t7;
+    re[217] = t9;
+    im[217] = t6;
+    t2 = re[85];
+    t12 = im[85];
+    t0 = re[133];
+    t11 = im[133];
+    t4 = re[181];
+    t3 = im[181];
+    t1 = re[229];
+    t13 = im[229];
+    t10 = re[37];
+    t5 = im[37];
+    t8 = t0 + t10;
+    t14 = t11 + t5;
+    t7 = t4 + t1;
+    t9 = t3 + t13;
+    t6 = t0 - t10;
+    t0 = t11 - t5;
+    t10 = t4 - t1;
+    t11 = t3 - t13;
+    t5 = t8 + t7;
+    t4 = t14 + t9;
+    t1 = t8 - t7;
+    t3 = C13 * t1;
+    t13 = t14 - t9;
+    t8 = C13 * t13;
+    t7 = C14 * t5;
+    t1 = t2 - t7;
+    t14 = C14 * t4;
+    t9 = t12 - t14;
+    t13 = t1 + t3;
+    t7 = t9 + t8;
+    t14 = t1 - t3;
+    t1 = t9 - t8;
+    t3 = C15 * t6;
+    t9 = C16 * t10;
+    t8 = t3 + t9;
+    t3 = C15 * t0;
+    t9 = C16 * t11;
+    t3 = t3 + t9;
+    t9 = C16 * t6;
+    t6 = C15 * t10;
+    t10 = t9 - t6;
+    t9 = C16 * t0;
+    t6 = C15 * t11;
+    t0 = t9 - t6;
+    t11 = t2 + t5;
+    t9 = t12 + t4;
+    t6 = t13 + t3;
+    t2 = t7 - t8;
+    t5 = t14 + t0;
+    t12 = t1 - t10;
+    t4 = t14 - t0;
+    t14 = t1 + t10;
+    t0 = t13 - t3;
+    t1 = t7 + t8;
+    re[85] = t11;
+    im[85] = t9;
+    re[133] = t6;
+    im[133] = t2;
+    re[181] = t5;
+    im[181] = t12;
+    re[229] = t4;
+    im[229] = t14;
+    re[37] = t0;
+    im[37] = t1;
+    t10 = re[145];
+    t13 = im[145];
+    t3 = re[193];
+    t7 = im[193];
+    t8 = re[1];
+    t11 = im[1];
+    t9 = re[49];
+    t6 = im[49];
+    t2 = re[97];
+    t5 = im[97];
+    t12 = t3 + t2;
+    t4 = t7 + t5;
+    t14 = t8 + t9;
+    t0 = t11 + t6;
+    t1 = t3 - t2;
+    t3 = t7 - t5;
+    t2 = t8 - t9;
+    t7 = t11 - t6;
+    t5 = t12 + t14;
+    t8 = t4 + t0;
+    t9 = t12 - t14;
+    t11 = C13 * t9;
+    t6 = t4 - t0;
+    t12 = C13 * t6;
+    t14 = C14 * t5;
+    t9 = t10 - t14;
+    t4 = C14 * t8;
+    t0 = t13 - t4;
+    t6 = t9 + t11;
+    t14 = t0 + t12;
+    t4 = t9 - t11;
+    t9 = t0 - t12;
+    t11 = C15 * t1;
+    t0 = C16 * t2;
+    t12 = t11 + t0;
+    t11 = C15 * t3;
+    t0 = C16 * t7;
+    t11 = t11 + t0;
+    t0 = C16 * t1;
+    t1 = C15 * t2;
+    t2 = t0 - t1;
+    t0 = C16 * t3;
+    t1 = C15 * t7;
+    t3 = t0 - t1;
+    t7 = t10 + t5;
+    t0 = t13 + t8;
+    t1 = t6 + t11;
+    t10 = t14 - t12;
+    t5 = t4 + t3;
+    t13 = t9 - t2;
+    t8 = t4 - t3;
+    t4 = t9 + t2;
+    t3 = t6 - t11;
+    t9 = t14 + t12;
+    re[145] = t7;
+    im[145] = t0;
+    re[193] = t1;
+    im[193] = t10;
+    re[1] = t5;
+    im[1] = t13;
+    re[49] = t8;
+    im[49] = t4;
+    re[97] = t3;
+    im[97] = t9;
+    t2 = re[0];
+    t6 = im[0];
+    t11 = re[80];
+    t14 = im[80];
+    t12 = re[160];
+    t7 = im[160];
+    t0 = t11 + t12;
+    t1 = t14 + t7;
+    t10 = C17 * t0;
+    t5 = t2 - t10;
+    t13 = C17 * t1;
+    t8 = t6 - t13;
+    t4 = t11 - t12;
+    t3 = C18 * t4;
+    t9 = t14 - t7;
+    t10 = C18 * t9;
+    t13 = t2 + t0;
+    t11 = t6 + t1;
+    t12 = t5 + t10;
+    t4 = t8 - t3;
+    t14 = t5 - t10;
+    t7 = t8 + t3;
+    t9 = C19 * t13;
+    t2 = C20 * t11;
+    t0 = t9 + t2;
+    t6 = C20 * t13;
+    t1 = (-C19) * t11;
+    t5 = t6 + t1;
+    X[0] = t0;
+    X[479] = t5;
+    t10 = C21 * t12;
+    t8 = C22 * t4;
+    t3 = t10 + t8;
+    t9 = C22 * t12;
+    t2 = (-C21) * t4;
+    t13 = t9 + t2;
+    X[320] = t3;
+    X[159] = t13;
+    t11 = C23 * t14;
+    t6 = C24 * t7;
+    t1 = t11 + t6;
+    t0 = C24 * t14;
+    t5 = (-C23) * t7;
+    t10 = t0 + t5;
+    X[160] = t1;
+    X[319] = t10;
+    t8 = re[108];
+    t12 = im[108];
+    t4 = re[188];
+    t9 = im[188];
+    t2 = re[28];
+    t3 = im[28];
+    t13 = t4 + t2;
+    t11 = t9 + t3;
+    t6 = C17 * t13;
+    t14 = t8 - t6;
+    t7 = C17 * t11;
+    t0 = t12 - t7;
+    t5 = t4 - t2;
+    t1 = C18 * t5;
+    t10 = t9 - t3;
+    t6 = C18 * t10;
+    t7 = t8 + t13;
+    t4 = t12 + t11;
+    t2 = t14 + t6;
+    t5 = t0 - t1;
+    t9 = t14 - t6;
+    t3 = t0 + t1;
+    t10 = C25 * t7;
+    t8 = C26 * t4;
+    t13 = t10 + t8;
+    t12 = C26 * t7;
+    t11 = (-C25) * t4;
+    t14 = t12 + t11;
+    X[162] = t13;
+    X[317] = t14;
+    t6 = C27 * t2;
+    t0 = C28 * t5;
+    t1 = t6 + t0;
+    t10 = C28 * t2;
+    t8 = (-C27) * t5;
+    t7 = t10 + t8;
+    X[2] = t1;
+    X[477] = t7;
+    t4 = C29 * t9;
+    t12 = C30 * t3;
+    t11 = t4 + t12;
+    t13 = C30 * t9;
+    t14 = (-C29) * t3;
+    t6 = t13 + t14;
+    X[322] = t11;
+    X[157] = t6;
+    t0 = re[216];
+    t2 = im[216];
+    t5 = re[56];
+    t10 = im[56];
+    t8 = re[136];
+    t1 = im[136];
+    t7 = t5 + t8;
+    t4 = t10 + t1;
+    t12 = C17 * t7;
+    t9 = t0 - t12;
+    t3 = C17 * t4;
+    t13 = t2 - t3;
+    t14 = t5 - t8;
+    t11 = C18 * t14;
+    t6 = t10 - t1;
+    t12 = C18 * t6;
+    t3 = t0 + t7;
+    t5 = t2 + t4;
+    t8 = t9 + t12;
+    t14 = t13 - t11;
+    t10 = t9 - t12;
+    t1 = t13 + t11;
+    t6 = C31 * t3;
+    t0 = C32 * t5;
+    t7 = t6 + t0;
+    t2 = C32 * t3;
+    t4 = (-C31) * t5;
+    t9 = t2 + t4;
+    X[324] = t7;
+    X[155] = t9;
+    t12 = C33 * t8;
+    t13 = C34 * t14;
+    t11 = t12 + t13;
+    t6 = C34 * t8;
+    t0 = (-C33) * t14;
+    t3 = t6 + t0;
+    X[164] = t11;
+    X[315] = t3;
+    t5 = C35 * t10;
+    t2 = C36 * t1;
+    t4 = t5 + t2;
+    t7 = C36 * t10;
+    t9 = (-C35) * t1;
+    t12 = t7 + t9;
+    X[4] = t4;
+    X[475] = t12;
+    t13 = re[84];
+    t8 = im[84];
+    t14 = re[164];
+    t6 = im[164];
+    t0 = re[4];
+    t11 = im[4];
+    t3 = t14 + t0;
+    t5 = t6 + t11;
+    t2 = C17 * t3;
+    t10 = t13 - t2;
+    t1 = C17 * t5;
+    t7 = t8 - t1;
+    t9 = t14 - t0;
+    t4 = C18 * t9;
+    t12 = t6 - t11;
+    t2 = C18 * t12;
+    t1 = t13 + t3;
+    t14 = t8 + t5;
+    t0 = t10 + t2;
+    t9 = t7 - t4;
+    t6 = t10 - t2;
+    t11 = t7 + t4;
+    t12 = C37 * t1;
+    t13 = C38 * t14;
+    t3 = t12 + t13;
+    t8 = C38 * t1;
+    t5 = (-C37) * t14;
+    t10 = t8 + t5;
+    X[6] = t3;
+    X[473] = t10;
+    t2 = C39 * t0;
+    t7 = C40 * t9;
+    t4 = t2 + t7;
+    t12 = C40 * t0;
+    t13 = (-C39) * t9;
+    t1 = t12 + t13;
+    X[326] = t4;
+    X[153] = t1;
+    t14 = C41 * t6;
+    t8 = C42 * t11;
+    t5 = t14 + t8;
+    t3 = C42 * t6;
+    t10 = (-C41) * t11;
+    t2 = t3 + t10;
+    X[166] = t5;
+    X[313] = t2;
+    t7 = re[207];
+    t0 = im[207];
+    t9 = re[47];
+    t12 = im[47];
+    t13 = re[127];
+    t4 = im[127];
+    t1 = t9 + t13;
+    t14 = t12 + t4;
+    t8 = C17 * t1;
+    t6 = t7 - t8;
+    t11 = C17 * t14;
+    t3 = t0 - t11;
+    t10 = t9 - t13;
+    t5 = C18 * t10;
+    t2 = t12 - t4;
+    t8 = C18 * t2;
+    t11 = t7 + t1;
+    t9 = t0 + t14;
+    t13 = t6 + t8;
+    t10 = t3 - t5;
+    t12 = t6 - t8;
+    t4 = t3 + t5;
+    t2 = C43 * t11;
+    t7 = C44 * t9;
+    t1 = t2 + t7;
+    t0 = C44 * t11;
+    t14 = (-C43) * t9;
+    t6 = t0 + t14;
+    X[168] = t1;
+    X[311] = t6;
+    t8 = C45 * t13;
+    t3 = C46 * t10;
+    t5 = t8 + t3;
+    t2 = C46 * t13;
+    t7 = (-C45) * t10;
+    t11 = t2 + t7;
+    X[8] = t5;
+    X[471] = t11;
+    t9 = C47 * t12;
+    t0 = C48 * t4;
+    t14 = t9 + t0;
+    t1 = C48 * t12;
+    t6 = (-C47) * t4;
+    t8 = t1 + t6;
+    X[328] = t14;
+    X[151] = t8;
+    t3 = re[75];
+    t13 = im[75];
+    t10 = re[155];
+    t2 = im[155];
+    t7 = re[235];
+    t5 = im[235];
+    t11 = t10 + t7;
+    t9 = t2 + t5;
+    t0 = C17 * t11;
+    t12 = t3 - t0;
+    t4 = C17 * t9;
+    t1 = t13 - t4;
+    t6 = t10 - t7;
+    t14 = C18 * t6;
+    t8 = t2 - t5;
+    t0 = C18 * t8;
+    t4 = t3 + t11;
+    t10 = t13 + t9;
+    t7 = t12 + t0;
+    t6 = t1 - t14;
+    t2 = t12 - t0;
+    t5 = t1 + t14;
+    t8 = C49 * t4;
+    t3 = C50 * t10;
+    t11 = t8 + t3;
+    t13 = C50 * t4;
+    t9 = (-C49) * t10;
+    t12 = t13 + t9;
+    X[330] = t11;
+    X[149] = t12;
+    t0 = C51 * t7;
+    t1 = C52 * t6;
+    t14 = t0 + t1;
+    t8 = C52 * t7;
+    t3 = (-C51) * t6;
+    t4 = t8 + t3;
+    X[170] = t14;
+    X[309] = t4;
+    t10 = C53 * t2;
+    t13 = C54 * t5;
+    t9 = t10 + t13;
+    t11 = C54 * t2;
+    t12 = (-C53) * t5;
+    t0 = t11 + t12;
+    X[10] = t9;
+    X[469] = t0;
+    t1 = re[183];
+    t7 = im[183];
+    t6 = re[23];
+    t8 = im[23];
+    t3 = re[103];
+    t14 = im[103];
+    t4 = t6 + t3;
+    t10 = t8 + t14;
+    t13 = C17 * t4;
+    t2 = t1 - t13;
+    t5 = C17 * t10;
+    t11 = t7 - t5;
+    t12 = t6 - t3;
+    t9 = C18 * t12;
+    t0 = t8 - t14;
+    t13 = C18 * t0;
+    t5 = t1 + t4;
+    t6 = t7 + t10;
+    t3 = t2 + t13;
+    t12 = t11 - t9;
+    t8 = t2 - t13;
+    t14 = t11 + t9;
+    t0 = C55 * t5;
+    t1 = C56 * t6;
+    t4 = t0 + t1;
+    t7 = C56 * t5;
+    t10 = (-C55) * t6;
+    t2 = t7 + t10;
+    X[12] = t4;
+    X[467] = t2;
+    t13 = C57 * t3;
+    t11 = C58 * t12;
+    t9 = t13 + t11;
+    t0 = C58 * t3;
+    t1 = (-C57) * t12;
+    t5 = t0 + t1;
+    X[332] = t9;
+    X[147] = t5;
+    t6 = C59 * t8;
+    t7 = C60 * t14;
+    t10 = t6 + t7;
+    t4 = C60 * t8;
+    t2 = (-C59) * t14;
+    t13 = t4 + t2;
+    X[172] = t10;
+    X[307] = t13;
+    t11 = re[51];
+    t3 = im[51];
+    t12 = re[131];
+    t0 = im[131];
+    t1 = re[211];
+    t9 = im[211];
+    t5 = t12 + t1;
+    t6 = t0 + t9;
+    t7 = C17 * t5;
+    t8 = t11 - t7;
+    t14 = C17 * t6;
+    t4 = t3 - t14;
+    t2 = t12 - t1;
+    t10 = C18 * t2;
+    t13 = t0 - t9;
+    t7 = C18 * t13;
+    t14 = t11 + t5;
+    t12 = t3 + t6;
+    t1 = t8 + t7;
+    t2 = t4 - t10;
+    t0 = t8 - t7;
+    t9 = t4 + t10;
+    t13 = C61 * t14;
+    t11 = C62 * t12;
+    t5 = t13 + t11;
+    t3 = C62 * t14;
+    t6 = (-C61) * t12;
+    t8 = t3 + t6;
+    X[174] = t5;
+    X[305] = t8;
+    t7 = C63 * t1;
+    t4 = C64 * t2;
+    t10 = t7 + t4;
+    t13 = C64 * t1;
+    t11 = (-C63) * t2;
+    t14 = t13 + t11;
+    X[14] = t10;
+    X[465] = t14;
+    t12 = C65 * t0;
+    t3 = C66 * t9;
+    t6 = t12 + t3;
+    t5 = C66 * t0;
+    t8 = (-C65) * t9;
+    t7 = t5 + t8;
+    X[334] = t6;
+    X[145] = t7;
+    t4 = re[174];
+    t1 = im[174];
+    t2 = re[14];
+    t13 = im[14];
+    t11 = re[94];
+    t10 = im[94];
+    t14 = t2 + t11;
+    t12 = t13 + t10;
+    t3 = C17 * t14;
+    t0 = t4 - t3;
+    t9 = C17 * t12;
+    t5 = t1 - t9;
+    t8 = t2 - t11;
+    t6 = C18 * t8;
+    t7 = t13 - t10;
+    t3 = C18 * t7;
+    t9 = t4 + t14;
+    t2 = t1 + t12;
+    t11 = t0 + t3;
+    t8 = t5 - t6;
+    t13 = t0 - t3;
+    t10 = t5 + t6;
+    t7 = C67 * t9;
+    t4 = C68 * t2;
+    t14 = t7 + t4;
+    t1 = C68 * t9;
+    t12 = (-C67) * t2;
+    t0 = t1 + t12;
+    X[336] = t14;
+    X[143] = t0;
+    t3 = C69 * t11;
+    t5 = C70 * t8;
+    t6 = t3 + t5;
+    t7 = C70 * t11;
+    t4 = (-C69) * t8;
+    t9 = t7 + t4;
+    X[176] = t6;
+    X[303] = t9;
+    t2 = C71 * t13;
+    t1 = C72 * t10;
+    t12 = t2 + t1;
+    t14 = C72 * t13;
+    t0 = (-C71) * t10;
+    t3 = t14 + t0;
+    X[16] = t12;
+    X[463] = t3;
+    t5 = re[42];
+    t11 = im[42];
+    t8 = re[122];
+    t7 = im[122];
+    t4 = re[202];
+    t6 = im[202];
+    t9 = t8 + t4;
+    t2 = t7 + t6;
+    t1 = C17 * t9;
+    t13 = t5 - t1;
+    t10 = C17 * t2;
+    t14 = t11 - t10;
+    t0 = t8 - t4;
+    t12 = C18 * t0;
+    t3 = t7 - t6;
+    t1 = C18 * t3;
+    t10 = t5 + t9;
+    t8 = t11 + t2;
+    t4 = t13 + t1;
+    t0 = t14 - t12;
+    t7 = t13 - t1;
+    t6 = t14 + t12;
+    t3 = C73 * t10;
+    t5 = C74 * t8;
+    t9 = t3 + t5;
+    t11 = C74 * t10;
+    t2 = (-C73) * t8;
+    t13 = t11 + t2;
+    X[18] = t9;
+    X[461] = t13;
+    t1 = C75 * t4;
+    t14 = C76 * t0;
+    t12 = t1 + t14;
+    t3 = C76 * t4;
+    t5 = (-C75) * t0;
+    t10 = t3 + t5;
+    X[338] = t12;
+    X[141] = t10;
+    t8 = C77 * t7;
+    t11 = C78 * t6;
+    t2 = t8 + t11;
+    t9 = C78 * t7;
+    t13 = (-C77) * t6;
+    t1 = t9 + t13;
+    X[178] = t2;
+    X[301] = t1;
+}
+
+/**
+ *  Part 7 of ApplyWindowedMDCT_W10_480().
+ * 
+ *  @param {Number[]} x 
+ *    - The input block (960 points).
+ *  @param {Number[]} X 
+ *    - The array that would contain the output block (480 points).
+ *  @param {Number[]} re 
+ *    - The scratch buffer (real part, 240 points).
+ *  @param {Number[]} im 
+ *    - The scratch buffer (imaginary part, 240 points).
+ */
+function ApplyWindowedMDCT_W10_480_Part7(x, X, re, im) {
+    let t0, t1, t10, t11, t12, t13, t14, t2, t3, t4, t5, t6, t7, t8, t9;
+    const C0 = 0.5;
+    const C1 = 0.8660254037844386;
+    const C2 = 0.8305594499929649;
+    const C3 = 0.5569299776698895;
+    const C4 = 0.9977505718820835;
+    const C5 = 0.06703578379474202;
+    const C6 = 0.44082059421219394;
+    const C7 = 0.8975952337877069;
+    const C8 = 0.43493644744371707;
+    const C9 = 0.9004611522353636;
+    const C10 = 0.8268965886356963;
+    const C11 = 0.562354009234973;
+    const C12 = 0.9972904566786902;
+    const C13 = 0.07356456359966743;
+    const C14 = 0.9967876208713732;
+    const C15 = 0.08009019214353008;
+    const C16 = 0.42903366944541266;
+    const C17 = 0.9032884979242259;
+    const C18 = 0.8231983057806959;
+    const C19 = 0.5677539514259605;
+    const C20 = 0.8194647598500926;
+    const C21 = 0.5731295729273007;
+    const C22 = 0.9962420859999448;
+    const C23 = 0.08661238989012217;
+    const C24 = 0.42311251307264414;
+    const C25 = 0.9060771497402148;
+    const C26 = 0.41717323196804335;
+    const C27 = 0.9088269882267676;
+    const C28 = 0.8156961107765678;
+    const C29 = 0.57848064346526;
+    const C30 = 0.9956538754333033;
+    const C31 = 0.0931308774501998;
+    const C32 = 0.9950230143684317;
+    const C33 = 0.09964537559345106;
+    const C34 = 0.41121608055064524;
+    const C35 = 0.9115378955899558;
+    const C36 = 0.8118925199965048;
+    const C37 = 0.5838069338177863;
+    const C38 = 0.8080541504430732;
+    const C39 = 0.5891082158243282;
+    const C40 = 0.9943495298293181;
+    const C41 = 0.10615560526045748;
+    const C42 = 0.40524131400498986;
+    const C43 = 0.9142097557035307;
+    const C44 = 0.3992491882701903;
+    const C45 = 0.9168424541138974;
+    const C46 = 0.8041811665392496;
+    const C47 = 0.5943842623956086;
+    const C48 = 0.9936334506657989;
+    const C49 = 0.1126612875746478;
+    const C50 = 0.9928748075523219;
+    const C51 = 0.11916214385424433;
+    const C52 = 0.3932399600289696;
+    const C53 = 0.9194358780450186;
+    const C54 = 0.8002737341907743;
+    const C55 = 0.5996348475233523;
+    const C56 = 0.796332020779044;
+    const C57 = 0.6048597462899679;
+    const C58 = 0.9920736329866334;
+    const C59 = 0.12565789562420054;
+    const C60 = 0.38721388669666557;
+    const C61 = 0.9219899164032446;
+    const C62 = 0.38117122641020335;
+    const C63 = 0.9245044597820724;
+    const C64 = 0.7923561951539422;
+    const C65 = 0.6100587348781819;
+    const C66 = 0.9912299612883853;
+    const C67 = 0.13214826462813015;
+    const C68 = 0.9903438285976649;
+    const C69 = 0.1386329728402267;
+    const C70 = 0.375112238017038;
+    const C71 = 0.9269794004668329;
+    const C72 = 0.7883464276266063;
+    const C73 = 0.6152315905806268;
+    const C74 = 0.7843028899621314;
+    const C75 = 0.6203780918093811;
+    const C76 = 0.9894152728734475;
+    const C77 = 0.1451117424771731;
+    const C78 = 0.36903718106406647;
+    const C79 = 0.9294146324393044;
+    const C80 = 0.3629463157865092;
+    const C81 = 0.9318100513822544;
+    const C82 = 0.7802257553722132;
+    const C83 = 0.6254980181054608;
+    const C84 = 0.98844433389197;
+    const C85 = 0.15158429601004111;
+    const C86 = 0.9874310532450267;
+    const C87 = 0.15805035617617982;
+    const C88 = 0.35683990309676283;
+    const C89 = 0.9341655546839077;
+    const C90 = 0.7761151985077279;
+    const C91 = 0.6305911501482637;
+    const C92 = 0.7719713954512504;
+    const C93 = 0.6356572697649648;
+    const C94 = 0.9863754743381881;
+    const C95 = 0.16450964599109233;
+    const C96 = 0.35071820457322317;
+    const C97 = 0.9364810414423427;
+    const C98 = 0.34458148244908043;
+    const C99 = 0.9387564124698132;
+    const C100 = 0.7677945237095121;
+    const C101 = 0.6406961599398607;
+    const C102 = 0.9852776423889412;
+    const C103 = 0.17096188876030122;
+    const C104 = 0.9841376044247531;
+    const C105 = 0.17740680809120096;
+    const C106 = 0.33842999960108583;
+    const C107 = 0.9409915702969974;
+    const C108 = 0.7635847622057964;
+    const C109 = 0.6457076048236673;
+    const C110 = 0.7593422912722755;
+    const C111 = 0.6506913897427649;
+    const C112 = 0.9829554092810556;
+    const C113 = 0.18384412790489776;
+    const C114 = 0.33226401953829077;
+    const C115 = 0.9431864191771733;
+    const C116 = 0.3260838063907591;
+    const C117 = 0.9453408650903197;
+    const C118 = 0.7550672926422838;
+    const C119 = 0.655647301208395;
+    const C120 = 0.9817311075991542;
+    const C121 = 0.1902735724480359;
+    const C122 = 0.980464751824058;
+    const C123 = 0.19669486630460994;
+    const C124 = 0.31988962489825296;
+    const C125 = 0.9474548157471442;
+    const C126 = 0.7507599494425343;
+    const C127 = 0.660575126925805;
+    const C128 = 0.7464204461852738;
+    const C129 = 0.6654746558033422;
+    const C130 = 0.9791563962022337;
+    const C131 = 0.2031077344077629;
+    const C132 = 0.3136817403988915;
+    const C133 = 0.9495281805930367;
+    const C134 = 0.3074604188177852;
+    const C135 = 0.9515608708119476;
+    const C136 = 0.7420489687603788;
+    const C137 = 0.6703456779614965;
+    const C138 = 0.9778060967792817;
+    const C139 = 0.20951190205156878;
+    const C140 = 0.9764139113975349;
+    const C141 = 0.21590709490280058;
+    const C142 = 0.30122592665564446;
+    const C143 = 0.9535527993301935;
+    const C144 = 0.737645704427393;
+    const C145 = 0.6751879847418903;
+    const C146 = 0.7332108418075048;
+    const C147 = 0.6800013687162181;
+    const C148 = 0.9749798996935817;
+    const C149 = 0.2222930390126813;
+    const C150 = 0.2949785309773635;
+    const C151 = 0.9555038808201862;
+    const C152 = 0.28871849940058025;
+    const C153 = 0.9574140317040883;
+    const C154 = 0.728744570875469;
+    const C155 = 0.6847856236951303;
+    const C156 = 0.9735041230957107;
+    const C157 = 0.22866946082861941;
+    const C158 = 0.9719866448212794;
+    const C159 = 0.23503608720592667;
+    const C160 = 0.2824461000842125;
+    const C161 = 0.9592831701573936;
+    const C162 = 0.724247082951467;
+    const C163 = 0.6895405447370668;
+    const C164 = 0.7197185706929127;
+    const C165 = 0.6942659281570361;
+    const C166 = 0.9704275298740068;
+    const C167 = 0.2413926454195189;
+    const C168 = 0.27616160171697074;
+    const C169 = 0.9611112161124317;
+    const C170 = 0.26986527350584855;
+    const C171 = 0.9628980912617978;
+    const C172 = 0.7151592280861994;
+    const C173 = 0.6989615715353394;
+    const C174 = 0.968826845041188;
+    const C175 = 0.2477388631755984;
+    const C176 = 0.9671846588908337;
+    const C177 = 0.2540744686233185;
+    const C178 = 0.26355738516459076;
+    const C179 = 0.9646437190617081;
+    const C180 = 0.7105692504383896;
+    const C181 = 0.7036272737262429;
+    const C182 = 0.705948834368849;
+    const C183 = 0.7082628348665934;
+    const C184 = 0.965501041768733;
+    const C185 = 0.26039919036642817;
+    const C186 = 0.2572382069021396;
+    const C187 = 0.9663480247352773;
+    const C188 = 0.25090800941106;
+    const C189 = 0.9680109352757227;
+    const C190 = 0.7012981778008244;
+    const C191 = 0.7128680563843799;
+    const C192 = 0.9637760657954398;
+    const C193 = 0.26671275747489837;
+    const C194 = 0.9620098048631839;
+    const C195 = 0.27301489949652735;
+    const C196 = 0.24456706385594387;
+    const C197 = 0.9696323794494915;
+    const C198 = 0.6966174799529641;
+    const C199 = 0.71744274100724;
+    const C200 = 0.6919069413307858;
+    const C201 = 0.7219866927709101;
+    const C202 = 0.9602023346327048;
+    const C203 = 0.27930534646852595;
+    const C204 = 0.2382156418617946;
+    const C205 = 0.9712122877993118;
+    const C206 = 0.23185401550239113;
+    const C207 = 0.9727505926471682;
+    const C208 = 0.6871667637180859;
+    const C209 = 0.7264997170276203;
+    const C210 = 0.9583537325300114;
+    const C211 = 0.2855838289290823;
+    const C212 = 0.9564640777430654;
+    const C213 = 0.29185007792890405;
+    const C214 = 0.22548245728863364;
+    const C215 = 0.974247228097201;
+    const C216 = 0.6823971501682968;
+    const C217 = 0.7309816204544317;
+    const C218 = 0.6775983049957887;
+    const C219 = 0.7354322110615187;
+    const C220 = 0.9545334512183885;
+    const C221 = 0.2981038250427398;
+    const C222 = 0.2191012401568698;
+    const C223 = 0.9757021300385286;
+    const C224 = 0.21271063745720314;
+    const C225 = 0.9771152361479941;
+    const C226 = 0.6727704337671168;
+    const C227 = 0.7398512982003922;
+    const C228 = 0.9525619356575953;
+    const C229 = 0.3043448023808773;
+    const C230 = 0.9505496155138509;
+    const C231 = 0.310572742600619;
+    const C232 = 0.20631092294178383;
+    const C233 = 0.978486485892835;
+    const C234 = 0.6679137432922161;
+    const C235 = 0.744238692572067;
+    const C236 = 0.6630284416155423;
+    const C237 = 0.7485942062351708;
+    const C238 = 0.9484965769882525;
+    const C239 = 0.31678737891773395;
+    const C240 = 0.1999023707530817;
+    const C241 = 0.9798158205332763;
+    const C242 = 0.19348525541214334;
+    const C243 = 0.9811031831250461;
+    const C244 = 0.6581147380071596;
+    const C245 = 0.7529176526139945;
+    const C246 = 0.9464029080261377;
+    const C247 = 0.3229884451178864;
+    const C248 = 0.9442686983133165;
+    const C249 = 0.3291756755680389;
+    const C250 = 0.187059851806832;
+    const C251 = 0.9823485185218157;
+    const C252 = 0.6531728429537768;
+    const C253 = 0.7572088465064846;
+    const C254 = 0.6482029681497297;
+    const C255 = 0.7614676040921771;
+    const C256 = 0.9420940392722298;
+    const C257 = 0.33534880522783184;
+    const C258 = 0.18062643518005275;
+    const C259 = 0.9835517733775615;
+    t14 = re[150];
+    t4 = im[150];
+    t0 = re[230];
+    t3 = im[230];
+    t5 = re[70];
+    t12 = im[70];
+    t10 = t0 + t5;
+    t8 = t3 + t12;
+    t11 = C0 * t10;
+    t7 = t14 - t11;
+    t6 = C0 * t8;
+    t9 = t4 - t6;
+    t13 = t0 - t5;
+    t2 = C1 * t13;
+    t1 = t3 - t12;
+    t11 = C1 * t1;
+    t6 = t14 + t10;
+    t0 = t4 + t8;
+    t5 = t7 + t11;
+    t13 = t9 - t2;
+    t3 = t7 - t11;
+    t12 = t9 + t2;
+    t1 = C2 * t6;
+    t14 = C3 * t0;
+    t10 = t1 + t14;
+    t4 = C3 * t6;
+    t8 = (-C2) * t0;
+    t7 = t4 + t8;
+    X[180] = t10;
+    X[299] = t7;
+    t11 = C4 * t5;
+    t9 = C5 * t13;
+    t2 = t11 + t9;
+    t1 = C5 * t5;
+    t14 = (-C4) * t13;
+    t6 = t1 + t14;
+    X[20] = t2;
+    X[459] = t6;
+    t0 = C6 * t3;
+    t4 = C7 * t12;
+    t8 = t0 + t4;
+    t10 = C7 * t3;
+    t7 = (-C6) * t12;
+    t11 = t10 + t7;
+    X[340] = t8;
+    X[139] = t11;
+    t9 = re[18];
+    t5 = im[18];
+    t13 = re[98];
+    t1 = im[98];
+    t14 = re[178];
+    t2 = im[178];
+    t6 = t13 + t14;
+    t0 = t1 + t2;
+    t4 = C0 * t6;
+    t3 = t9 - t4;
+    t12 = C0 * t0;
+    t10 = t5 - t12;
+    t7 = t13 - t14;
+    t8 = C1 * t7;
+    t11 = t1 - t2;
+    t4 = C1 * t11;
+    t12 = t9 + t6;
+    t13 = t5 + t0;
+    t14 = t3 + t4;
+    t7 = t10 - t8;
+    t1 = t3 - t4;
+    t2 = t10 + t8;
+    t11 = C8 * t12;
+    t9 = C9 * t13;
+    t6 = t11 + t9;
+    t5 = C9 * t12;
+    t0 = (-C8) * t13;
+    t3 = t5 + t0;
+    X[342] = t6;
+    X[137] = t3;
+    t4 = C10 * t14;
+    t10 = C11 * t7;
+    t8 = t4 + t10;
+    t11 = C11 * t14;
+    t9 = (-C10) * t7;
+    t12 = t11 + t9;
+    X[182] = t8;
+    X[297] = t12;
+    t13 = C12 * t1;
+    t5 = C13 * t2;
+    t0 = t13 + t5;
+    t6 = C13 * t1;
+    t3 = (-C12) * t2;
+    t4 = t6 + t3;
+    X[22] = t0;
+    X[457] = t4;
+    t10 = re[141];
+    t14 = im[141];
+    t7 = re[221];
+    t11 = im[221];
+    t9 = re[61];
+    t8 = im[61];
+    t12 = t7 + t9;
+    t13 = t11 + t8;
+    t5 = C0 * t12;
+    t1 = t10 - t5;
+    t2 = C0 * t13;
+    t6 = t14 - t2;
+    t3 = t7 - t9;
+    t0 = C1 * t3;
+    t4 = t11 - t8;
+    t5 = C1 * t4;
+    t2 = t10 + t12;
+    t7 = t14 + t13;
+    t9 = t1 + t5;
+    t3 = t6 - t0;
+    t11 = t1 - t5;
+    t8 = t6 + t0;
+    t4 = C14 * t2;
+    t10 = C15 * t7;
+    t12 = t4 + t10;
+    t14 = C15 * t2;
+    t13 = (-C14) * t7;
+    t1 = t14 + t13;
+    X[24] = t12;
+    X[455] = t1;
+    t5 = C16 * t9;
+    t6 = C17 * t3;
+    t0 = t5 + t6;
+    t4 = C17 * t9;
+    t10 = (-C16) * t3;
+    t2 = t4 + t10;
+    X[344] = t0;
+    X[135] = t2;
+    t7 = C18 * t11;
+    t14 = C19 * t8;
+    t13 = t7 + t14;
+    t12 = C19 * t11;
+    t1 = (-C18) * t8;
+    t5 = t12 + t1;
+    X[184] = t13;
+    X[295] = t5;
+    t6 = re[9];
+    t9 = im[9];
+    t3 = re[89];
+    t4 = im[89];
+    t10 = re[169];
+    t0 = im[169];
+    t2 = t3 + t10;
+    t7 = t4 + t0;
+    t14 = C0 * t2;
+    t11 = t6 - t14;
+    t8 = C0 * t7;
+    t12 = t9 - t8;
+    t1 = t3 - t10;
+    t13 = C1 * t1;
+    t5 = t4 - t0;
+    t14 = C1 * t5;
+    t8 = t6 + t2;
+    t3 = t9 + t7;
+    t10 = t11 + t14;
+    t1 = t12 - t13;
+    t4 = t11 - t14;
+    t0 = t12 + t13;
+    t5 = C20 * t8;
+    t6 = C21 * t3;
+    t2 = t5 + t6;
+    t9 = C21 * t8;
+    t7 = (-C20) * t3;
+    t11 = t9 + t7;
+    X[186] = t2;
+    X[293] = t11;
+    t14 = C22 * t10;
+    t12 = C23 * t1;
+    t13 = t14 + t12;
+    t5 = C23 * t10;
+    t6 = (-C22) * t1;
+    t8 = t5 + t6;
+    X[26] = t13;
+    X[453] = t8;
+    t3 = C24 * t4;
+    t9 = C25 * t0;
+    t7 = t3 + t9;
+    t2 = C25 * t4;
+    t11 = (-C24) * t0;
+    t14 = t2 + t11;
+    X[346] = t7;
+    X[133] = t14;
+    t12 = re[117];
+    t10 = im[117];
+    t1 = re[197];
+    t5 = im[197];
+    t6 = re[37];
+    t13 = im[37];
+    t8 = t1 + t6;
+    t3 = t5 + t13;
+    t9 = C0 * t8;
+    t4 = t12 - t9;
+    t0 = C0 * t3;
+    t2 = t10 - t0;
+    t11 = t1 - t6;
+    t7 = C1 * t11;
+    t14 = t5 - t13;
+    t9 = C1 * t14;
+    t0 = t12 + t8;
+    t1 = t10 + t3;
+    t6 = t4 + t9;
+    t11 = t2 - t7;
+    t5 = t4 - t9;
+    t13 = t2 + t7;
+    t14 = C26 * t0;
+    t12 = C27 * t1;
+    t8 = t14 + t12;
+    t10 = C27 * t0;
+    t3 = (-C26) * t1;
+    t4 = t10 + t3;
+    X[348] = t8;
+    X[131] = t4;
+    t9 = C28 * t6;
+    t2 = C29 * t11;
+    t7 = t9 + t2;
+    t14 = C29 * t6;
+    t12 = (-C28) * t11;
+    t0 = t14 + t12;
+    X[188] = t7;
+    X[291] = t0;
+    t1 = C30 * t5;
+    t10 = C31 * t13;
+    t3 = t1 + t10;
+    t8 = C31 * t5;
+    t4 = (-C30) * t13;
+    t9 = t8 + t4;
+    X[28] = t3;
+    X[451] = t9;
+    t2 = re[225];
+    t6 = im[225];
+    t11 = re[65];
+    t14 = im[65];
+    t12 = re[145];
+    t7 = im[145];
+    t0 = t11 + t12;
+    t1 = t14 + t7;
+    t10 = C0 * t0;
+    t5 = t2 - t10;
+    t13 = C0 * t1;
+    t8 = t6 - t13;
+    t4 = t11 - t12;
+    t3 = C1 * t4;
+    t9 = t14 - t7;
+    t10 = C1 * t9;
+    t13 = t2 + t0;
+    t11 = t6 + t1;
+    t12 = t5 + t10;
+    t4 = t8 - t3;
+    t14 = t5 - t10;
+    t7 = t8 + t3;
+    t9 = C32 * t13;
+    t2 = C33 * t11;
+    t0 = t9 + t2;
+    t6 = C33 * t13;
+    t1 = (-C32) * t11;
+    t5 = t6 + t1;
+    X[30] = t0;
+    X[449] = t5;
+    t10 = C34 * t12;
+    t8 = C35 * t4;
+    t3 = t10 + t8;
+    t9 = C35 * t12;
+    t2 = (-C34) * t4;
+    t13 = t9 + t2;
+    X[350] = t3;
+    X[129] = t13;
+    t11 = C36 * t14;
+    t6 = C37 * t7;
+    t1 = t11 + t6;
+    t0 = C37 * t14;
+    t5 = (-C36) * t7;
+    t10 = t0 + t5;
+    X[190] = t1;
+    X[289] = t10;
+    t8 = re[48];
+    t12 = im[48];
+    t4 = re[128];
+    t9 = im[128];
+    t2 = re[208];
+    t3 = im[208];
+    t13 = t4 + t2;
+    t11 = t9 + t3;
+    t6 = C0 * t13;
+    t14 = t8 - t6;
+    t7 = C0 * t11;
+    t0 = t12 - t7;
+    t5 = t4 - t2;
+    t1 = C1 * t5;
+    t10 = t9 - t3;
+    t6 = C1 * t10;
+    t7 = t8 + t13;
+    t4 = t12 + t11;
+    t2 = t14 + t6;
+    t5 = t0 - t1;
+    t9 = t14 - t6;
+    t3 = t0 + t1;
+    t10 = C38 * t7;
+    t8 = C39 * t4;
+    t13 = t10 + t8;
+    t12 = C39 * t7;
+    t11 = (-C38) * t4;
+    t14 = t12 + t11;
+    X[192] = t13;
+    X[287] = t14;
+    t6 = C40 * t2;
+    t0 = C41 * t5;
+    t1 = t6 + t0;
+    t10 = C41 * t2;
+    t8 = (-C40) * t5;
+    t7 = t10 + t8;
+    X[32] = t1;
+    X[447] = t7;
+    t4 = C42 * t9;
+    t12 = C43 * t3;
+    t11 = t4 + t12;
+    t13 = C43 * t9;
+    t14 = (-C42) * t3;
+    t6 = t13 + t14;
+    X[352] = t11;
+    X[127] = t6;
+    t0 = re[156];
+    t2 = im[156];
+    t5 = re[236];
+    t10 = im[236];
+    t8 = re[76];
+    t1 = im[76];
+    t7 = t5 + t8;
+    t4 = t10 + t1;
+    t12 = C0 * t7;
+    t9 = t0 - t12;
+    t3 = C0 * t4;
+    t13 = t2 - t3;
+    t14 = t5 - t8;
+    t11 = C1 * t14;
+    t6 = t10 - t1;
+    t12 = C1 * t6;
+    t3 = t0 + t7;
+    t5 = t2 + t4;
+    t8 = t9 + t12;
+    t14 = t13 - t11;
+    t10 = t9 - t12;
+    t1 = t13 + t11;
+    t6 = C44 * t3;
+    t0 = C45 * t5;
+    t7 = t6 + t0;
+    t2 = C45 * t3;
+    t4 = (-C44) * t5;
+    t9 = t2 + t4;
+    X[354] = t7;
+    X[125] = t9;
+    t12 = C46 * t8;
+    t13 = C47 * t14;
+    t11 = t12 + t13;
+    t6 = C47 * t8;
+    t0 = (-C46) * t14;
+    t3 = t6 + t0;
+    X[194] = t11;
+    X[285] = t3;
+    t5 = C48 * t10;
+    t2 = C49 * t1;
+    t4 = t5 + t2;
+    t7 = C49 * t10;
+    t9 = (-C48) * t1;
+    t12 = t7 + t9;
+    X[34] = t4;
+    X[445] = t12;
+    t13 = re[24];
+    t8 = im[24];
+    t14 = re[104];
+    t6 = im[104];
+    t0 = re[184];
+    t11 = im[184];
+    t3 = t14 + t0;
+    t5 = t6 + t11;
+    t2 = C0 * t3;
+    t10 = t13 - t2;
+    t1 = C0 * t5;
+    t7 = t8 - t1;
+    t9 = t14 - t0;
+    t4 = C1 * t9;
+    t12 = t6 - t11;
+    t2 = C1 * t12;
+    t1 = t13 + t3;
+    t14 = t8 + t5;
+    t0 = t10 + t2;
+    t9 = t7 - t4;
+    t6 = t10 - t2;
+    t11 = t7 + t4;
+    t12 = C50 * t1;
+    t13 = C51 * t14;
+    t3 = t12 + t13;
+    t8 = C51 * t1;
+    t5 = (-C50) * t14;
+    t10 = t8 + t5;
+    X[36] = t3;
+    X[443] = t10;
+    t2 = C52 * t0;
+    t7 = C53 * t9;
+    t4 = t2 + t7;
+    t12 = C53 * t0;
+    t13 = (-C52) * t9;
+    t1 = t12 + t13;
+    X[356] = t4;
+    X[123] = t1;
+    t14 = C54 * t6;
+    t8 = C55 * t11;
+    t5 = t14 + t8;
+    t3 = C55 * t6;
+    t10 = (-C54) * t11;
+    t2 = t3 + t10;
+    X[196] = t5;
+    X[283] = t2;
+    t7 = re[132];
+    t0 = im[132];
+    t9 = re[212];
+    t12 = im[212];
+    t13 = re[52];
+    t4 = im[52];
+    t1 = t9 + t13;
+    t14 = t12 + t4;
+    t8 = C0 * t1;
+    t6 = t7 - t8;
+    t11 = C0 * t14;
+    t3 = t0 - t11;
+    t10 = t9 - t13;
+    t5 = C1 * t10;
+    t2 = t12 - t4;
+    t8 = C1 * t2;
+    t11 = t7 + t1;
+    t9 = t0 + t14;
+    t13 = t6 + t8;
+    t10 = t3 - t5;
+    t12 = t6 - t8;
+    t4 = t3 + t5;
+    t2 = C56 * t11;
+    t7 = C57 * t9;
+    t1 = t2 + t7;
+    t0 = C57 * t11;
+    t14 = (-C56) * t9;
+    t6 = t0 + t14;
+    X[198] = t1;
+    X[281] = t6;
+    t8 = C58 * t13;
+    t3 = C59 * t10;
+    t5 = t8 + t3;
+    t2 = C59 * t13;
+    t7 = (-C58) * t10;
+    t11 = t2 + t7;
+    X[38] = t5;
+    X[441] = t11;
+    t9 = C60 * t12;
+    t0 = C61 * t4;
+    t14 = t9 + t0;
+    t1 = C61 * t12;
+    t6 = (-C60) * t4;
+    t8 = t1 + t6;
+    X[358] = t14;
+    X[121] = t8;
+    t3 = re[15];
+    t13 = im[15];
+    t10 = re[95];
+    t2 = im[95];
+    t7 = re[175];
+    t5 = im[175];
+    t11 = t10 + t7;
+    t9 = t2 + t5;
+    t0 = C0 * t11;
+    t12 = t3 - t0;
+    t4 = C0 * t9;
+    t1 = t13 - t4;
+    t6 = t10 - t7;
+    t14 = C1 * t6;
+    t8 = t2 - t5;
+    t0 = C1 * t8;
+    t4 = t3 + t11;
+    t10 = t13 + t9;
+    t7 = t12 + t0;
+    t6 = t1 - t14;
+    t2 = t12 - t0;
+    t5 = t1 + t14;
+    t8 = C62 * t4;
+    t3 = C63 * t10;
+    t11 = t8 + t3;
+    t13 = C63 * t4;
+    t9 = (-C62) * t10;
+    t12 = t13 + t9;
+    X[360] = t11;
+    X[119] = t12;
+    t0 = C64 * t7;
+    t1 = C65 * t6;
+    t14 = t0 + t1;
+    t8 = C65 * t7;
+    t3 = (-C64) * t6;
+    t4 = t8 + t3;
+    X[200] = t14;
+    X[279] = t4;
+    t10 = C66 * t2;
+    t13 = C67 * t5;
+    t9 = t10 + t13;
+    t11 = C67 * t2;
+    t12 = (-C66) * t5;
+    t0 = t11 + t12;
+    X[40] = t9;
+    X[439] = t0;
+    t1 = re[123];
+    t7 = im[123];
+    t6 = re[203];
+    t8 = im[203];
+    t3 = re[43];
+    t14 = im[43];
+    t4 = t6 + t3;
+    t10 = t8 + t14;
+    t13 = C0 * t4;
+    t2 = t1 - t13;
+    t5 = C0 * t10;
+    t11 = t7 - t5;
+    t12 = t6 - t3;
+    t9 = C1 * t12;
+    t0 = t8 - t14;
+    t13 = C1 * t0;
+    t5 = t1 + t4;
+    t6 = t7 + t10;
+    t3 = t2 + t13;
+    t12 = t11 - t9;
+    t8 = t2 - t13;
+    t14 = t11 + t9;
+    t0 = C68 * t5;
+    t1 = C69 * t6;
+    t4 = t0 + t1;
+    t7 = C69 * t5;
+    t10 = (-C68) * t6;
+    t2 = t7 + t10;
+    X[42] = t4;
+    X[437] = t2;
+    t13 = C70 * t3;
+    t11 = C71 * t12;
+    t9 = t13 + t11;
+    t0 = C71 * t3;
+    t1 = (-C70) * t12;
+    t5 = t0 + t1;
+    X[362] = t9;
+    X[117] = t5;
+    t6 = C72 * t8;
+    t7 = C73 * t14;
+    t10 = t6 + t7;
+    t4 = C73 * t8;
+    t2 = (-C72) * t14;
+    t13 = t4 + t2;
+    X[202] = t10;
+    X[277] = t13;
+    t11 = re[231];
+    t3 = im[231];
+    t12 = re[71];
+    t0 = im[71];
+    t1 = re[151];
+    t9 = im[151];
+    t5 = t12 + t1;
+    t6 = t0 + t9;
+    t7 = C0 * t5;
+    t8 = t11 - t7;
+    t14 = C0 * t6;
+    t4 = t3 - t14;
+    t2 = t12 - t1;
+    t10 = C1 * t2;
+    t13 = t0 - t9;
+    t7 = C1 * t13;
+    t14 = t11 + t5;
+    t12 = t3 + t6;
+    t1 = t8 + t7;
+    t2 = t4 - t10;
+    t0 = t8 - t7;
+    t9 = t4 + t10;
+    t13 = C74 * t14;
+    t11 = C75 * t12;
+    t5 = t13 + t11;
+    t3 = C75 * t14;
+    t6 = (-C74) * t12;
+    t8 = t3 + t6;
+    X[204] = t5;
+    X[275] = t8;
+    t7 = C76 * t1;
+    t4 = C77 * t2;
+    t10 = t7 + t4;
+    t13 = C77 * t1;
+    t11 = (-C76) * t2;
+    t14 = t13 + t11;
+    X[44] = t10;
+    X[435] = t14;
+    t12 = C78 * t0;
+    t3 = C79 * t9;
+    t6 = t12 + t3;
+    t5 = C79 * t0;
+    t8 = (-C78) * t9;
+    t7 = t5 + t8;
+    X[364] = t6;
+    X[115] = t7;
+    t4 = re[99];
+    t1 = im[99];
+    t2 = re[179];
+    t13 = im[179];
+    t11 = re[19];
+    t10 = im[19];
+    t14 = t2 + t11;
+    t12 = t13 + t10;
+    t3 = C0 * t14;
+    t0 = t4 - t3;
+    t9 = C0 * t12;
+    t5 = t1 - t9;
+    t8 = t2 - t11;
+    t6 = C1 * t8;
+    t7 = t13 - t10;
+    t3 = C1 * t7;
+    t9 = t4 + t14;
+    t2 = t1 + t12;
+    t11 = t0 + t3;
+    t8 = t5 - t6;
+    t13 = t0 - t3;
+    t10 = t5 + t6;
+    t7 = C80 * t9;
+    t4 = C81 * t2;
+    t14 = t7 + t4;
+    t1 = C81 * t9;
+    t12 = (-C80) * t2;
+    t0 = t1 + t12;
+    X[366] = t14;
+    X[113] = t0;
+    t3 = C82 * t11;
+    t5 = C83 * t8;
+    t6 = t3 + t5;
+    t7 = C83 * t11;
+    t4 = (-C82) * t8;
+    t9 = t7 + t4;
+    X[206] = t6;
+    X[273] = t9;
+    t2 = C84 * t13;
+    t1 = C85 * t10;
+    t12 = t2 + t1;
+    t14 = C85 * t13;
+    t0 = (-C84) * t10;
+    t3 = t14 + t0;
+    X[46] = t12;
+    X[433] = t3;
+    t5 = re[222];
+    t11 = im[222];
+    t8 = re[62];
+    t7 = im[62];
+    t4 = re[142];
+    t6 = im[142];
+    t9 = t8 + t4;
+    t2 = t7 + t6;
+    t1 = C0 * t9;
+    t13 = t5 - t1;
+    t10 = C0 * t2;
+    t14 = t11 - t10;
+    t0 = t8 - t4;
+    t12 = C1 * t0;
+    t3 = t7 - t6;
+    t1 = C1 * t3;
+    t10 = t5 + t9;
+    t8 = t11 + t2;
+    t4 = t13 + t1;
+    t0 = t14 - t12;
+    t7 = t13 - t1;
+    t6 = t14 + t12;
+    t3 = C86 * t10;
+    t5 = C87 * t8;
+    t9 = t3 + t5;
+    t11 = C87 * t10;
+    t2 = (-C86) * t8;
+    t13 = t11 + t2;
+    X[48] = t9;
+    X[431] = t13;
+    t1 = C88 * t4;
+    t14 = C89 * t0;
+    t12 = t1 + t14;
+    t3 = C89 * t4;
+    t5 = (-C88) * t0;
+    t10 = t3 + t5;
+    X[368] = t12;
+    X[111] = t10;
+    t8 = C90 * t7;
+    t11 = C91 * t6;
+    t2 = t8 + t11;
+    t9 = C91 * t7;
+    t13 = (-C90) * t6;
+    t1 = t9 + t13;
+    X[208] = t2;
+    X[271] = t1;
+    t14 = re[90];
+    t4 = im[90];
+    t0 = re[170];
+    t3 = im[170];
+    t5 = re[10];
+    t12 = im[10];
+    t10 = t0 + t5;
+    t8 = t3 + t12;
+    t11 = C0 * t10;
+    t7 = t14 - t11;
+    t6 = C0 * t8;
+    t9 = t4 - t6;
+    t13 = t0 - t5;
+    t2 = C1 * t13;
+    t1 = t3 - t12;
+    t11 = C1 * t1;
+    t6 = t14 + t10;
+    t0 = t4 + t8;
+    t5 = t7 + t11;
+    t13 = t9 - t2;
+    t3 = t7 - t11;
+    t12 = t9 + t2;
+    t1 = C92 * t6;
+    t14 = C93 * t0;
+    t10 = t1 + t14;
+    t4 = C93 * t6;
+    t8 = (-C92) * t0;
+    t7 = t4 + t8;
+    X[210] = t10;
+    X[269] = t7;
+    t11 = C94 * t5;
+    t9 = C95 * t13;
+    t2 = t11 + t9;
+    t1 = C95 * t5;
+    t14 = (-C94) * t13;
+    t6 = t1 + t14;
+    X[50] = t2;
+    X[429] = t6;
+    t0 = C96 * t3;
+    t4 = C97 * t12;
+    t8 = t0 + t4;
+    t10 = C97 * t3;
+    t7 = (-C96) * t12;
+    t11 = t10 + t7;
+    X[370] = t8;
+    X[109] = t11;
+    t9 = re[198];
+    t5 = im[198];
+    t13 = re[38];
+    t1 = im[38];
+    t14 = re[118];
+    t2 = im[118];
+    t6 = t13 + t14;
+    t0 = t1 + t2;
+    t4 = C0 * t6;
+    t3 = t9 - t4;
+    t12 = C0 * t0;
+    t10 = t5 - t12;
+    t7 = t13 - t14;
+    t8 = C1 * t7;
+    t11 = t1 - t2;
+    t4 = C1 * t11;
+    t12 = t9 + t6;
+    t13 = t5 + t0;
+    t14 = t3 + t4;
+    t7 = t10 - t8;
+    t1 = t3 - t4;
+    t2 = t10 + t8;
+    t11 = C98 * t12;
+    t9 = C99 * t13;
+    t6 = t11 + t9;
+    t5 = C99 * t12;
+    t0 = (-C98) * t13;
+    t3 = t5 + t0;
+    X[372] = t6;
+    X[107] = t3;
+    t4 = C100 * t14;
+    t10 = C101 * t7;
+    t8 = t4 + t10;
+    t11 = C101 * t14;
+    t9 = (-C100) * t7;
+    t12 = t11 + t9;
+    X[212] = t8;
+    X[267] = t12;
+    t13 = C102 * t1;
+    t5 = C103 * t2;
+    t0 = t13 + t5;
+    t6 = C103 * t1;
+    t3 = (-C102) * t2;
+    t4 = t6 + t3;
+    X[52] = t0;
+    X[427] = t4;
+    t10 = re[66];
+    t14 = im[66];
+    t7 = re[146];
+    t11 = im[146];
+    t9 = re[226];
+    t8 = im[226];
+    t12 = t7 + t9;
+    t13 = t11 + t8;
+    t5 = C0 * t12;
+    t1 = t10 - t5;
+    t2 = C0 * t13;
+    t6 = t14 - t2;
+    t3 = t7 - t9;
+    t0 = C1 * t3;
+    t4 = t11 - t8;
+    t5 = C1 * t4;
+    t2 = t10 + t12;
+    t7 = t14 + t13;
+    t9 = t1 + t5;
+    t3 = t6 - t0;
+    t11 = t1 - t5;
+    t8 = t6 + t0;
+    t4 = C104 * t2;
+    t10 = C105 * t7;
+    t12 = t4 + t10;
+    t14 = C105 * t2;
+    t13 = (-C104) * t7;
+    t1 = t14 + t13;
+    X[54] = t12;
+    X[425] = t1;
+    t5 = C106 * t9;
+    t6 = C107 * t3;
+    t0 = t5 + t6;
+    t4 = C107 * t9;
+    t10 = (-C106) * t3;
+    t2 = t4 + t10;
+    X[374] = t0;
+    X[105] = t2;
+    t7 = C108 * t11;
+    t14 = C109 * t8;
+    t13 = t7 + t14;
+    t12 = C109 * t11;
+    t1 = (-C108) * t8;
+    t5 = t12 + t1;
+    X[214] = t13;
+    X[265] = t5;
+    t6 = re[189];
+    t9 = im[189];
+    t3 = re[29];
+    t4 = im[29];
+    t10 = re[109];
+    t0 = im[109];
+    t2 = t3 + t10;
+    t7 = t4 + t0;
+    t14 = C0 * t2;
+    t11 = t6 - t14;
+    t8 = C0 * t7;
+    t12 = t9 - t8;
+    t1 = t3 - t10;
+    t13 = C1 * t1;
+    t5 = t4 - t0;
+    t14 = C1 * t5;
+    t8 = t6 + t2;
+    t3 = t9 + t7;
+    t10 = t11 + t14;
+    t1 = t12 - t13;
+    t4 = t11 - t14;
+    t0 = t12 + t13;
+    t5 = C110 * t8;
+    t6 = C111 * t3;
+    t2 = t5 + t6;
+    t9 = C111 * t8;
+    t7 = (-C110) * t3;
+    t11 = t9 + t7;
+    X[216] = t2;
+    X[263] = t11;
+    t14 = C112 * t10;
+    t12 = C113 * t1;
+    t13 = t14 + t12;
+    t5 = C113 * t10;
+    t6 = (-C112) * t1;
+    t8 = t5 + t6;
+    X[56] = t13;
+    X[423] = t8;
+    t3 = C114 * t4;
+    t9 = C115 * t0;
+    t7 = t3 + t9;
+    t2 = C115 * t4;
+    t11 = (-C114) * t0;
+    t14 = t2 + t11;
+    X[376] = t7;
+    X[103] = t14;
+    t12 = re[57];
+    t10 = im[57];
+    t1 = re[137];
+    t5 = im[137];
+    t6 = re[217];
+    t13 = im[217];
+    t8 = t1 + t6;
+    t3 = t5 + t13;
+    t9 = C0 * t8;
+    t4 = t12 - t9;
+    t0 = C0 * t3;
+    t2 = t10 - t0;
+    t11 = t1 - t6;
+    t7 = C1 * t11;
+    t14 = t5 - t13;
+    t9 = C1 * t14;
+    t0 = t12 + t8;
+    t1 = t10 + t3;
+    t6 = t4 + t9;
+    t11 = t2 - t7;
+    t5 = t4 - t9;
+    t13 = t2 + t7;
+    t14 = C116 * t0;
+    t12 = C117 * t1;
+    t8 = t14 + t12;
+    t10 = C117 * t0;
+    t3 = (-C116) * t1;
+    t4 = t10 + t3;
+    X[378] = t8;
+    X[101] = t4;
+    t9 = C118 * t6;
+    t2 = C119 * t11;
+    t7 = t9 + t2;
+    t14 = C119 * t6;
+    t12 = (-C118) * t11;
+    t0 = t14 + t12;
+    X[218] = t7;
+    X[261] = t0;
+    t1 = C120 * t5;
+    t10 = C121 * t13;
+    t3 = t1 + t10;
+    t8 = C121 * t5;
+    t4 = (-C120) * t13;
+    t9 = t8 + t4;
+    X[58] = t3;
+    X[421] = t9;
+    t2 = re[165];
+    t6 = im[165];
+    t11 = re[5];
+    t14 = im[5];
+    t12 = re[85];
+    t7 = im[85];
+    t0 = t11 + t12;
+    t1 = t14 + t7;
+    t10 = C0 * t0;
+    t5 = t2 - t10;
+    t13 = C0 * t1;
+    t8 = t6 - t13;
+    t4 = t11 - t12;
+    t3 = C1 * t4;
+    t9 = t14 - t7;
+    t10 = C1 * t9;
+    t13 = t2 + t0;
+    t11 = t6 + t1;
+    t12 = t5 + t10;
+    t4 = t8 - t3;
+    t14 = t5 - t10;
+    t7 = t8 + t3;
+    t9 = C122 * t13;
+    t2 = C123 * t11;
+    t0 = t9 + t2;
+    t6 = C123 * t13;
+    t1 = (-C122) * t11;
+    t5 = t6 + t1;
+    X[60] = t0;
+    X[419] = t5;
+    t10 = C124 * t12;
+    t8 = C125 * t4;
+    t3 = t10 + t8;
+    t9 = C125 * t12;
+    t2 = (-C124) * t4;
+    t13 = t9 + t2;
+    X[380] = t3;
+    X[99] = t13;
+    t11 = C126 * t14;
+    t6 = C127 * t7;
+    t1 = t11 + t6;
+    t0 = C127 * t14;
+    t5 = (-C126) * t7;
+    t10 = t0 + t5;
+    X[220] = t1;
+    X[259] = t10;
+    t8 = re[33];
+    t12 = im[33];
+    t4 = re[113];
+    t9 = im[113];
+    t2 = re[193];
+    t3 = im[193];
+    t13 = t4 + t2;
+    t11 = t9 + t3;
+    t6 = C0 * t13;
+    t14 = t8 - t6;
+    t7 = C0 * t11;
+    t0 = t12 - t7;
+    t5 = t4 - t2;
+    t1 = C1 * t5;
+    t10 = t9 - t3;
+    t6 = C1 * t10;
+    t7 = t8 + t13;
+    t4 = t12 + t11;
+    t2 = t14 + t6;
+    t5 = t0 - t1;
+    t9 = t14 - t6;
+    t3 = t0 + t1;
+    t10 = C128 * t7;
+    t8 = C129 * t4;
+    t13 = t10 + t8;
+    t12 = C129 * t7;
+    t11 = (-C128) * t4;
+    t14 = t12 + t11;
+    X[222] = t13;
+    X[257] = t14;
+    t6 = C130 * t2;
+    t0 = C131 * t5;
+    t1 = t6 + t0;
+    t10 = C131 * t2;
+    t8 = (-C130) * t5;
+    t7 = t10 + t8;
+    X[62] = t1;
+    X[417] = t7;
+    t4 = C132 * t9;
+    t12 = C133 * t3;
+    t11 = t4 + t12;
+    t13 = C133 * t9;
+    t14 = (-C132) * t3;
+    t6 = t13 + t14;
+    X[382] = t11;
+    X[97] = t6;
+    t0 = re[96];
+    t2 = im[96];
+    t5 = re[176];
+    t10 = im[176];
+    t8 = re[16];
+    t1 = im[16];
+    t7 = t5 + t8;
+    t4 = t10 + t1;
+    t12 = C0 * t7;
+    t9 = t0 - t12;
+    t3 = C0 * t4;
+    t13 = t2 - t3;
+    t14 = t5 - t8;
+    t11 = C1 * t14;
+    t6 = t10 - t1;
+    t12 = C1 * t6;
+    t3 = t0 + t7;
+    t5 = t2 + t4;
+    t8 = t9 + t12;
+    t14 = t13 - t11;
+    t10 = t9 - t12;
+    t1 = t13 + t11;
+    t6 = C134 * t3;
+    t0 = C135 * t5;
+    t7 = t6 + t0;
+    t2 = C135 * t3;
+    t4 = (-C134) * t5;
+    t9 = t2 + t4;
+    X[384] = t7;
+    X[95] = t9;
+    t12 = C136 * t8;
+    t13 = C137 * t14;
+    t11 = t12 + t13;
+    t6 = C137 * t8;
+    t0 = (-C136) * t14;
+    t3 = t6 + t0;
+    X[224] = t11;
+    X[255] = t3;
+    t5 = C138 * t10;
+    t2 = C139 * t1;
+    t4 = t5 + t2;
+    t7 = C139 * t10;
+    t9 = (-C138) * t1;
+    t12 = t7 + t9;
+    X[64] = t4;
+    X[415] = t12;
+    t13 = re[204];
+    t8 = im[204];
+    t14 = re[44];
+    t6 = im[44];
+    t0 = re[124];
+    t11 = im[124];
+    t3 = t14 + t0;
+    t5 = t6 + t11;
+    t2 = C0 * t3;
+    t10 = t13 - t2;
+    t1 = C0 * t5;
+    t7 = t8 - t1;
+    t9 = t14 - t0;
+    t4 = C1 * t9;
+    t12 = t6 - t11;
+    t2 = C1 * t12;
+    t1 = t13 + t3;
+    t14 = t8 + t5;
+    t0 = t10 + t2;
+    t9 = t7 - t4;
+    t6 = t10 - t2;
+    t11 = t7 + t4;
+    t12 = C140 * t1;
+    t13 = C141 * t14;
+    t3 = t12 + t13;
+    t8 = C141 * t1;
+    t5 = (-C140) * t14;
+    t10 = t8 + t5;
+    X[66] = t3;
+    X[413] = t10;
+    t2 = C142 * t0;
+    t7 = C143 * t9;
+    t4 = t2 + t7;
+    t12 = C143 * t0;
+    t13 = (-C142) * t9;
+    t1 = t12 + t13;
+    X[386] = t4;
+    X[93] = t1;
+    t14 = C144 * t6;
+    t8 = C145 * t11;
+    t5 = t14 + t8;
+    t3 = C145 * t6;
+    t10 = (-C144) * t11;
+    t2 = t3 + t10;
+    X[226] = t5;
+    X[253] = t2;
+    t7 = re[72];
+    t0 = im[72];
+    t9 = re[152];
+    t12 = im[152];
+    t13 = re[232];
+    t4 = im[232];
+    t1 = t9 + t13;
+    t14 = t12 + t4;
+    t8 = C0 * t1;
+    t6 = t7 - t8;
+    t11 = C0 * t14;
+    t3 = t0 - t11;
+    t10 = t9 - t13;
+    t5 = C1 * t10;
+    t2 = t12 - t4;
+    t8 = C1 * t2;
+    t11 = t7 + t1;
+    t9 = t0 + t14;
+    t13 = t6 + t8;
+    t10 = t3 - t5;
+    t12 = t6 - t8;
+    t4 = t3 + t5;
+    t2 = C146 * t11;
+    t7 = C147 * t9;
+    t1 = t2 + t7;
+    t0 = C147 * t11;
+    t14 = (-C146) * t9;
+    t6 = t0 + t14;
+    X[228] = t1;
+    X[251] = t6;
+    t8 = C148 * t13;
+    t3 = C149 * t10;
+    t5 = t8 + t3;
+    t2 = C149 * t13;
+    t7 = (-C148) * t10;
+    t11 = t2 + t7;
+    X[68] = t5;
+    X[411] = t11;
+    t9 = C150 * t12;
+    t0 = C151 * t4;
+    t14 = t9 + t0;
+    t1 = C151 * t12;
+    t6 = (-C150) * t4;
+    t8 = t1 + t6;
+    X[388] = t14;
+    X[91] = t8;
+    t3 = re[180];
+    t13 = im[180];
+    t10 = re[20];
+    t2 = im[20];
+    t7 = re[100];
+    t5 = im[100];
+    t11 = t10 + t7;
+    t9 = t2 + t5;
+    t0 = C0 * t11;
+    t12 = t3 - t0;
+    t4 = C0 * t9;
+    t1 = t13 - t4;
+    t6 = t10 - t7;
+    t14 = C1 * t6;
+    t8 = t2 - t5;
+    t0 = C1 * t8;
+    t4 = t3 + t11;
+    t10 = t13 + t9;
+    t7 = t12 + t0;
+    t6 = t1 - t14;
+    t2 = t12 - t0;
+    t5 = t1 + t14;
+    t8 = C152 * t4;
+    t3 = C153 * t10;
+    t11 = t8 + t3;
+    t13 = C153 * t4;
+    t9 = (-C152) * t10;
+    t12 = t13 + t9;
+    X[390] = t11;
+    X[89] = t12;
+    t0 = C154 * t7;
+    t1 = C155 * t6;
+    t14 = t0 + t1;
+    t8 = C155 * t7;
+    t3 = (-C154) * t6;
+    t4 = t8 + t3;
+    X[230] = t14;
+    X[249] = t4;
+    t10 = C156 * t2;
+    t13 = C157 * t5;
+    t9 = t10 + t13;
+    t11 = C157 * t2;
+    t12 = (-C156) * t5;
+    t0 = t11 + t12;
+    X[70] = t9;
+    X[409] = t0;
+    t1 = re[63];
+    t7 = im[63];
+    t6 = re[143];
+    t8 = im[143];
+    t3 = re[223];
+    t14 = im[223];
+    t4 = t6 + t3;
+    t10 = t8 + t14;
+    t13 = C0 * t4;
+    t2 = t1 - t13;
+    t5 = C0 * t10;
+    t11 = t7 - t5;
+    t12 = t6 - t3;
+    t9 = C1 * t12;
+    t0 = t8 - t14;
+    t13 = C1 * t0;
+    t5 = t1 + t4;
+    t6 = t7 + t10;
+    t3 = t2 + t13;
+    t12 = t11 - t9;
+    t8 = t2 - t13;
+    t14 = t11 + t9;
+    t0 = C158 * t5;
+    t1 = C159 * t6;
+    t4 = t0 + t1;
+    t7 = C159 * t5;
+    t10 = (-C158) * t6;
+    t2 = t7 + t10;
+    X[72] = t4;
+    X[407] = t2;
+    t13 = C160 * t3;
+    t11 = C161 * t12;
+    t9 = t13 + t11;
+    t0 = C161 * t3;
+    t1 = (-C160) * t12;
+    t5 = t0 + t1;
+    X[392] = t9;
+    X[87] = t5;
+    t6 = C162 * t8;
+    t7 = C163 * t14;
+    t10 = t6 + t7;
+    t4 = C163 * t8;
+    t2 = (-C162) * t14;
+    t13 = t4 + t2;
+    X[232] = t10;
+    X[247] = t13;
+    t11 = re[171];
+    t3 = im[171];
+    t12 = re[11];
+    t0 = im[11];
+    t1 = re[91];
+    t9 = im[91];
+    t5 = t12 + t1;
+    t6 = t0 + t9;
+    t7 = C0 * t5;
+    t8 = t11 - t7;
+    t14 = C0 * t6;
+    t4 = t3 - t14;
+    t2 = t12 - t1;
+    t10 = C1 * t2;
+    t13 = t0 - t9;
+    t7 = C1 * t13;
+    t14 = t11 + t5;
+    t12 = t3 + t6;
+    t1 = t8 + t7;
+    t2 = t4 - t10;
+    t0 = t8 - t7;
+    t9 = t4 + t10;
+    t13 = C164 * t14;
+    t11 = C165 * t12;
+    t5 = t13 + t11;
+    t3 = C165 * t14;
+    t6 = (-C164) * t12;
+    t8 = t3 + t6;
+    X[234] = t5;
+    X[245] = t8;
+    t7 = C166 * t1;
+    t4 = C167 * t2;
+    t10 = t7 + t4;
+    t13 = C167 * t1;
+    t11 = (-C166) * t2;
+    t14 = t13 + t11;
+    X[74] = t10;
+    X[405] = t14;
+    t12 = C168 * t0;
+    t3 = C169 * t9;
+    t6 = t12 + t3;
+    t5 = C169 * t0;
+    t8 = (-C168) * t9;
+    t7 = t5 + t8;
+    X[394] = t6;
+    X[85] = t7;
+    t4 = re[39];
+    t1 = im[39];
+    t2 = re[119];
+    t13 = im[119];
+    t11 = re[199];
+    t10 = im[199];
+    t14 = t2 + t11;
+    t12 = t13 + t10;
+    t3 = C0 * t14;
+    t0 = t4 - t3;
+    t9 = C0 * t12;
+    t5 = t1 - t9;
+    t8 = t2 - t11;
+    t6 = C1 * t8;
+    t7 = t13 - t10;
+    t3 = C1 * t7;
+    t9 = t4 + t14;
+    t2 = t1 + t12;
+    t11 = t0 + t3;
+    t8 = t5 - t6;
+    t13 = t0 - t3;
+    t10 = t5 + t6;
+    t7 = C170 * t9;
+    t4 = C171 * t2;
+    t14 = t7 + t4;
+    t1 = C171 * t9;
+    t12 = (-C170) * t2;
+    t0 = t1 + t12;
+    X[396] = t14;
+    X[83] = t0;
+    t3 = C172 * t11;
+    t5 = C173 * t8;
+    t6 = t3 + t5;
+    t7 = C173 * t11;
+    t4 = (-C172) * t8;
+    t9 = t7 + t4;
+    X[236] = t6;
+    X[243] = t9;
+    t2 = C174 * t13;
+    t1 = C175 * t10;
+    t12 = t2 + t1;
+    t14 = C175 * t13;
+    t0 = (-C174) * t10;
+    t3 = t14 + t0;
+    X[76] = t12;
+    X[403] = t3;
+    t5 = re[147];
+    t11 = im[147];
+    t8 = re[227];
+    t7 = im[227];
+    t4 = re[67];
+    t6 = im[67];
+    t9 = t8 + t4;
+    t2 = t7 + t6;
+    t1 = C0 * t9;
+    t13 = t5 - t1;
+    t10 = C0 * t2;
+    t14 = t11 - t10;
+    t0 = t8 - t4;
+    t12 = C1 * t0;
+    t3 = t7 - t6;
+    t1 = C1 * t3;
+    t10 = t5 + t9;
+    t8 = t11 + t2;
+    t4 = t13 + t1;
+    t0 = t14 - t12;
+    t7 = t13 - t1;
+    t6 = t14 + t12;
+    t3 = C176 * t10;
+    t5 = C177 * t8;
+    t9 = t3 + t5;
+    t11 = C177 * t10;
+    t2 = (-C176) * t8;
+    t13 = t11 + t2;
+    X[78] = t9;
+    X[401] = t13;
+    t1 = C178 * t4;
+    t14 = C179 * t0;
+    t12 = t1 + t14;
+    t3 = C179 * t4;
+    t5 = (-C178) * t0;
+    t10 = t3 + t5;
+    X[398] = t12;
+    X[81] = t10;
+    t8 = C180 * t7;
+    t11 = C181 * t6;
+    t2 = t8 + t11;
+    t9 = C181 * t7;
+    t13 = (-C180) * t6;
+    t1 = t9 + t13;
+    X[238] = t2;
+    X[241] = t1;
+    t14 = re[30];
+    t4 = im[30];
+    t0 = re[110];
+    t3 = im[110];
+    t5 = re[190];
+    t12 = im[190];
+    t10 = t0 + t5;
+    t8 = t3 + t12;
+    t11 = C0 * t10;
+    t7 = t14 - t11;
+    t6 = C0 * t8;
+    t9 = t4 - t6;
+    t13 = t0 - t5;
+    t2 = C1 * t13;
+    t1 = t3 - t12;
+    t11 = C1 * t1;
+    t6 = t14 + t10;
+    t0 = t4 + t8;
+    t5 = t7 + t11;
+    t13 = t9 - t2;
+    t3 = t7 - t11;
+    t12 = t9 + t2;
+    t1 = C182 * t6;
+    t14 = C183 * t0;
+    t10 = t1 + t14;
+    t4 = C183 * t6;
+    t8 = (-C182) * t0;
+    t7 = t4 + t8;
+    X[240] = t10;
+    X[239] = t7;
+    t11 = C184 * t5;
+    t9 = C185 * t13;
+    t2 = t11 + t9;
+    t1 = C185 * t5;
+    t14 = (-C184) * t13;
+    t6 = t1 + t14;
+    X[80] = t2;
+    X[399] = t6;
+    t0 = C186 * t3;
+    t4 = C187 * t12;
+    t8 = t0 + t4;
+    t10 = C187 * t3;
+    t7 = (-C186) * t12;
+    t11 = t10 + t7;
+    X[400] = t8;
+    X[79] = t11;
+    t9 = re[138];
+    t5 = im[138];
+    t13 = re[218];
+    t1 = im[218];
+    t14 = re[58];
+    t2 = im[58];
+    t6 = t13 + t14;
+    t0 = t1 + t2;
+    t4 = C0 * t6;
+    t3 = t9 - t4;
+    t12 = C0 * t0;
+    t10 = t5 - t12;
+    t7 = t13 - t14;
+    t8 = C1 * t7;
+    t11 = t1 - t2;
+    t4 = C1 * t11;
+    t12 = t9 + t6;
+    t13 = t5 + t0;
+    t14 = t3 + t4;
+    t7 = t10 - t8;
+    t1 = t3 - t4;
+    t2 = t10 + t8;
+    t11 = C188 * t12;
+    t9 = C189 * t13;
+    t6 = t11 + t9;
+    t5 = C189 * t12;
+    t0 = (-C188) * t13;
+    t3 = t5 + t0;
+    X[402] = t6;
+    X[77] = t3;
+    t4 = C190 * t14;
+    t10 = C191 * t7;
+    t8 = t4 + t10;
+    t11 = C191 * t14;
+    t9 = (-C190) * t7;
+    t12 = t11 + t9;
+    X[242] = t8;
+    X[237] = t12;
+    t13 = C192 * t1;
+    t5 = C193 * t2;
+    t0 = t13 + t5;
+    t6 = C193 * t1;
+    t3 = (-C192) * t2;
+    t4 = t6 + t3;
+    X[82] = t0;
+    X[397] = t4;
+    t10 = re[6];
+    t14 = im[6];
+    t7 = re[86];
+    t11 = im[86];
+    t9 = re[166];
+    t8 = im[166];
+    t12 = t7 + t9;
+    t13 = t11 + t8;
+    t5 = C0 * t12;
+    t1 = t10 - t5;
+    t2 = C0 * t13;
+    t6 = t14 - t2;
+    t3 = t7 - t9;
+    t0 = C1 * t3;
+    t4 = t11 - t8;
+    t5 = C1 * t4;
+    t2 = t10 + t12;
+    t7 = t14 + t13;
+    t9 = t1 + t5;
+    t3 = t6 - t0;
+    t11 = t1 - t5;
+    t8 = t6 + t0;
+    t4 = C194 * t2;
+    t10 = C195 * t7;
+    t12 = t4 + t10;
+    t14 = C195 * t2;
+    t13 = (-C194) * t7;
+    t1 = t14 + t13;
+    X[84] = t12;
+    X[395] = t1;
+    t5 = C196 * t9;
+    t6 = C197 * t3;
+    t0 = t5 + t6;
+    t4 = C197 * t9;
+    t10 = (-C196) * t3;
+    t2 = t4 + t10;
+    X[404] = t0;
+    X[75] = t2;
+    t7 = C198 * t11;
+    t14 = C199 * t8;
+    t13 = t7 + t14;
+    t12 = C199 * t11;
+    t1 = (-C198) * t8;
+    t5 = t12 + t1;
+    X[244] = t13;
+    X[235] = t5;
+    t6 = re[114];
+    t9 = im[114];
+    t3 = re[194];
+    t4 = im[194];
+    t10 = re[34];
+    t0 = im[34];
+    t2 = t3 + t10;
+    t7 = t4 + t0;
+    t14 = C0 * t2;
+    t11 = t6 - t14;
+    t8 = C0 * t7;
+    t12 = t9 - t8;
+    t1 = t3 - t10;
+    t13 = C1 * t1;
+    t5 = t4 - t0;
+    t14 = C1 * t5;
+    t8 = t6 + t2;
+    t3 = t9 + t7;
+    t10 = t11 + t14;
+    t1 = t12 - t13;
+    t4 = t11 - t14;
+    t0 = t12 + t13;
+    t5 = C200 * t8;
+    t6 = C201 * t3;
+    t2 = t5 + t6;
+    t9 = C201 * t8;
+    t7 = (-C200) * t3;
+    t11 = t9 + t7;
+    X[246] = t2;
+    X[233] = t11;
+    t14 = C202 * t10;
+    t12 = C203 * t1;
+    t13 = t14 + t12;
+    t5 = C203 * t10;
+    t6 = (-C202) * t1;
+    t8 = t5 + t6;
+    X[86] = t13;
+    X[393] = t8;
+    t3 = C204 * t4;
+    t9 = C205 * t0;
+    t7 = t3 + t9;
+    t2 = C205 * t4;
+    t11 = (-C204) * t0;
+    t14 = t2 + t11;
+    X[406] = t7;
+    X[73] = t14;
+    t12 = re[237];
+    t10 = im[237];
+    t1 = re[77];
+    t5 = im[77];
+    t6 = re[157];
+    t13 = im[157];
+    t8 = t1 + t6;
+    t3 = t5 + t13;
+    t9 = C0 * t8;
+    t4 = t12 - t9;
+    t0 = C0 * t3;
+    t2 = t10 - t0;
+    t11 = t1 - t6;
+    t7 = C1 * t11;
+    t14 = t5 - t13;
+    t9 = C1 * t14;
+    t0 = t12 + t8;
+    t1 = t10 + t3;
+    t6 = t4 + t9;
+    t11 = t2 - t7;
+    t5 = t4 - t9;
+    t13 = t2 + t7;
+    t14 = C206 * t0;
+    t12 = C207 * t1;
+    t8 = t14 + t12;
+    t10 = C207 * t0;
+    t3 = (-C206) * t1;
+    t4 = t10 + t3;
+    X[408] = t8;
+    X[71] = t4;
+    t9 = C208 * t6;
+    t2 = C209 * t11;
+    t7 = t9 + t2;
+    t14 = C209 * t6;
+    t12 = (-C208) * t11;
+    t0 = t14 + t12;
+    X[248] = t7;
+    X[231] = t0;
+    t1 = C210 * t5;
+    t10 = C211 * t13;
+    t3 = t1 + t10;
+    t8 = C211 * t5;
+    t4 = (-C210) * t13;
+    t9 = t8 + t4;
+    X[88] = t3;
+    X[391] = t9;
+    t2 = re[105];
+    t6 = im[105];
+    t11 = re[185];
+    t14 = im[185];
+    t12 = re[25];
+    t7 = im[25];
+    t0 = t11 + t12;
+    t1 = t14 + t7;
+    t10 = C0 * t0;
+    t5 = t2 - t10;
+    t13 = C0 * t1;
+    t8 = t6 - t13;
+    t4 = t11 - t12;
+    t3 = C1 * t4;
+    t9 = t14 - t7;
+    t10 = C1 * t9;
+    t13 = t2 + t0;
+    t11 = t6 + t1;
+    t12 = t5 + t10;
+    t4 = t8 - t3;
+    t14 = t5 - t10;
+    t7 = t8 + t3;
+    t9 = C212 * t13;
+    t2 = C213 * t11;
+    t0 = t9 + t2;
+    t6 = C213 * t13;
+    t1 = (-C212) * t11;
+    t5 = t6 + t1;
+    X[90] = t0;
+    X[389] = t5;
+    t10 = C214 * t12;
+    t8 = C215 * t4;
+    t3 = t10 + t8;
+    t9 = C215 * t12;
+    t2 = (-C214) * t4;
+    t13 = t9 + t2;
+    X[410] = t3;
+    X[69] = t13;
+    t11 = C216 * t14;
+    t6 = C217 * t7;
+    t1 = t11 + t6;
+    t0 = C217 * t14;
+    t5 = (-C216) * t7;
+    t10 = t0 + t5;
+    X[250] = t1;
+    X[229] = t10;
+    t8 = re[213];
+    t12 = im[213];
+    t4 = re[53];
+    t9 = im[53];
+    t2 = re[133];
+    t3 = im[133];
+    t13 = t4 + t2;
+    t11 = t9 + t3;
+    t6 = C0 * t13;
+    t14 = t8 - t6;
+    t7 = C0 * t11;
+    t0 = t12 - t7;
+    t5 = t4 - t2;
+    t1 = C1 * t5;
+    t10 = t9 - t3;
+    t6 = C1 * t10;
+    t7 = t8 + t13;
+    t4 = t12 + t11;
+    t2 = t14 + t6;
+    t5 = t0 - t1;
+    t9 = t14 - t6;
+    t3 = t0 + t1;
+    t10 = C218 * t7;
+    t8 = C219 * t4;
+    t13 = t10 + t8;
+    t12 = C219 * t7;
+    t11 = (-C218) * t4;
+    t14 = t12 + t11;
+    X[252] = t13;
+    X[227] = t14;
+    t6 = C220 * t2;
+    t0 = C221 * t5;
+    t1 = t6 + t0;
+    t10 = C221 * t2;
+    t8 = (-C220) * t5;
+    t7 = t10 + t8;
+    X[92] = t1;
+    X[387] = t7;
+    t4 = C222 * t9;
+    t12 = C223 * t3;
+    t11 = t4 + t12;
+    t13 = C223 * t9;
+    t14 = (-C222) * t3;
+    t6 = t13 + t14;
+    X[412] = t11;
+    X[67] = t6;
+    t0 = re[81];
+    t2 = im[81];
+    t5 = re[161];
+    t10 = im[161];
+    t8 = re[1];
+    t1 = im[1];
+    t7 = t5 + t8;
+    t4 = t10 + t1;
+    t12 = C0 * t7;
+    t9 = t0 - t12;
+    t3 = C0 * t4;
+    t13 = t2 - t3;
+    t14 = t5 - t8;
+    t11 = C1 * t14;
+    t6 = t10 - t1;
+    t12 = C1 * t6;
+    t3 = t0 + t7;
+    t5 = t2 + t4;
+    t8 = t9 + t12;
+    t14 = t13 - t11;
+    t10 = t9 - t12;
+    t1 = t13 + t11;
+    t6 = C224 * t3;
+    t0 = C225 * t5;
+    t7 = t6 + t0;
+    t2 = C225 * t3;
+    t4 = (-C224) * t5;
+    t9 = t2 + t4;
+    X[414] = t7;
+    X[65] = t9;
+    t12 = C226 * t8;
+    t13 = C227 * t14;
+    t11 = t12 + t13;
+    t6 = C227 * t8;
+    t0 = (-C226) * t14;
+    t3 = t6 + t0;
+    X[254] = t11;
+    X[225] = t3;
+    t5 = C228 * t10;
+    t2 = C229 * t1;
+    t4 = t5 + t2;
+    t7 = C229 * t10;
+    t9 = (-C228) * t1;
+    t12 = t7 + t9;
+    X[94] = t4;
+    X[385] = t12;
+    t13 = re[144];
+    t8 = im[144];
+    t14 = re[224];
+    t6 = im[224];
+    t0 = re[64];
+    t11 = im[64];
+    t3 = t14 + t0;
+    t5 = t6 + t11;
+    t2 = C0 * t3;
+    t10 = t13 - t2;
+    t1 = C0 * t5;
+    t7 = t8 - t1;
+    t9 = t14 - t0;
+    t4 = C1 * t9;
+    t12 = t6 - t11;
+    t2 = C1 * t12;
+    t1 = t13 + t3;
+    t14 = t8 + t5;
+    t0 = t10 + t2;
+    t9 = t7 - t4;
+    t6 = t10 - t2;
+    t11 = t7 + t4;
+    t12 = C230 * t1;
+    t13 = C231 * t14;
+    t3 = t12 + t13;
+    t8 = C231 * t1;
+    t5 = (-C230) * t14;
+    t10 = t8 + t5;
+    X[96] = t3;
+    X[383] = t10;
+    t2 = C232 * t0;
+    t7 = C233 * t9;
+    t4 = t2 + t7;
+    t12 = C233 * t0;
+    t13 = (-C232) * t9;
+    t1 = t12 + t13;
+    X[416] = t4;
+    X[63] = t1;
+    t14 = C234 * t6;
+    t8 = C235 * t11;
+    t5 = t14 + t8;
+    t3 = C235 * t6;
+    t10 = (-C234) * t11;
+    t2 = t3 + t10;
+    X[256] = t5;
+    X[223] = t2;
+    t7 = re[12];
+    t0 = im[12];
+    t9 = re[92];
+    t12 = im[92];
+    t13 = re[172];
+    t4 = im[172];
+    t1 = t9 + t13;
+    t14 = t12 + t4;
+    t8 = C0 * t1;
+    t6 = t7 - t8;
+    t11 = C0 * t14;
+    t3 = t0 - t11;
+    t10 = t9 - t13;
+    t5 = C1 * t10;
+    t2 = t12 - t4;
+    t8 = C1 * t2;
+    t11 = t7 + t1;
+    t9 = t0 + t14;
+    t13 = t6 + t8;
+    t10 = t3 - t5;
+    t12 = t6 - t8;
+    t4 = t3 + t5;
+    t2 = C236 * t11;
+    t7 = C237 * t9;
+    t1 = t2 + t7;
+    t0 = C237 * t11;
+    t14 = (-C236) * t9;
+    t6 = t0 + t14;
+    X[258] = t1;
+    X[221] = t6;
+    t8 = C238 * t13;
+    t3 = C239 * t10;
+    t5 = t8 + t3;
+    t2 = C239 * t13;
+    t7 = (-C238) * t10;
+    t11 = t2 + t7;
+    X[98] = t5;
+    X[381] = t11;
+    t9 = C240 * t12;
+    t0 = C241 * t4;
+    t14 = t9 + t0;
+    t1 = C241 * t12;
+    t6 = (-C240) * t4;
+    t8 = t1 + t6;
+    X[418] = t14;
+    X[61] = t8;
+    t3 = re[120];
+    t13 = im[120];
+    t10 = re[200];
+    t2 = im[200];
+    t7 = re[40];
+    t5 = im[40];
+    t11 = t10 + t7;
+    t9 = t2 + t5;
+    t0 = C0 * t11;
+    t12 = t3 - t0;
+    t4 = C0 * t9;
+    t1 = t13 - t4;
+    t6 = t10 - t7;
+    t14 = C1 * t6;
+    t8 = t2 - t5;
+    t0 = C1 * t8;
+    t4 = t3 + t11;
+    t10 = t13 + t9;
+    t7 = t12 + t0;
+    t6 = t1 - t14;
+    t2 = t12 - t0;
+    t5 = t1 + t14;
+    t8 = C242 * t4;
+    t3 = C243 * t10;
+    t11 = t8 + t3;
+    t13 = C243 * t4;
+    t9 = (-C242) * t10;
+    t12 = t13 + t9;
+    X[420] = t11;
+    X[59] = t12;
+    t0 = C244 * t7;
+    t1 = C245 * t6;
+    t14 = t0 + t1;
+    t8 = C245 * t7;
+    t3 = (-C244) * t6;
+    t4 = t8 + t3;
+    X[260] = t14;
+    X[219] = t4;
+    t10 = C246 * t2;
+    t13 = C247 * t5;
+    t9 = t10 + t13;
+    t11 = C247 * t2;
+    t12 = (-C246) * t5;
+    t0 = t11 + t12;
+    X[100] = t9;
+    X[379] = t0;
+    t1 = re[228];
+    t7 = im[228];
+    t6 = re[68];
+    t8 = im[68];
+    t3 = re[148];
+    t14 = im[148];
+    t4 = t6 + t3;
+    t10 = t8 + t14;
+    t13 = C0 * t4;
+    t2 = t1 - t13;
+    t5 = C0 * t10;
+    t11 = t7 - t5;
+    t12 = t6 - t3;
+    t9 = C1 * t12;
+    t0 = t8 - t14;
+    t13 = C1 * t0;
+    t5 = t1 + t4;
+    t6 = t7 + t10;
+    t3 = t2 + t13;
+    t12 = t11 - t9;
+    t8 = t2 - t13;
+    t14 = t11 + t9;
+    t0 = C248 * t5;
+    t1 = C249 * t6;
+    t4 = t0 + t1;
+    t7 = C249 * t5;
+    t10 = (-C248) * t6;
+    t2 = t7 + t10;
+    X[102] = t4;
+    X[377] = t2;
+    t13 = C250 * t3;
+    t11 = C251 * t12;
+    t9 = t13 + t11;
+    t0 = C251 * t3;
+    t1 = (-C250) * t12;
+    t5 = t0 + t1;
+    X[422] = t9;
+    X[57] = t5;
+    t6 = C252 * t8;
+    t7 = C253 * t14;
+    t10 = t6 + t7;
+    t4 = C253 * t8;
+    t2 = (-C252) * t14;
+    t13 = t4 + t2;
+    X[262] = t10;
+    X[217] = t13;
+    t11 = re[111];
+    t3 = im[111];
+    t12 = re[191];
+    t0 = im[191];
+    t1 = re[31];
+    t9 = im[31];
+    t5 = t12 + t1;
+    t6 = t0 + t9;
+    t7 = C0 * t5;
+    t8 = t11 - t7;
+    t14 = C0 * t6;
+    t4 = t3 - t14;
+    t2 = t12 - t1;
+    t10 = C1 * t2;
+    t13 = t0 - t9;
+    t7 = C1 * t13;
+    t14 = t11 + t5;
+    t12 = t3 + t6;
+    t1 = t8 + t7;
+    t2 = t4 - t10;
+    t0 = t8 - t7;
+    t9 = t4 + t10;
+    t13 = C254 * t14;
+    t11 = C255 * t12;
+    t5 = t13 + t11;
+    t3 = C255 * t14;
+    t6 = (-C254) * t12;
+    t8 = t3 + t6;
+    X[264] = t5;
+    X[215] = t8;
+    t7 = C256 * t1;
+    t4 = C257 * t2;
+    t10 = t7 + t4;
+    t13 = C257 * t1;
+    t11 = (-C256) * t2;
+    t14 = t13 + t11;
+    X[104] = t10;
+    X[375] = t14;
+    t12 = C258 * t0;
+    t3 = C259 * t9;
+    t6 = t12 + t3;
+    t5 = C259 * t0;
+    t8 = (-C258) * t9;
+    t7 = t5 + t8;
+    X[424] = t6;
+    X[55] = t7;
+}
+
+/**
+ *  Part 8 of ApplyWindowedMDCT_W10_480().
+ * 
+ *  @param {Number[]} x 
+ *    - The input block (960 points).
+ *  @param {Number[]} X 
+ *    - The array that would contain the output block (480 points).
+ *  @param {Number[]} re 
+ *    - The scratch buffer (real part, 240 points).
+ *  @param {Number[]} im 
+ *    - The scratch buffer (imaginary part, 240 points).
+ */
+function ApplyWindowedMDCT_W10_480_Part8(x, X, re, im) {
+    let t0, t1, t10, t11, t12, t13, t14, t2, t3, t4, t5, t6, t7, t8, t9;
+    const C0 = 0.5;
+    const C1 = 0.8660254037844386;
+    const C2 = 0.1741852811179619;
+    const C3 = 0.9847128961488504;
+    const C4 = 0.6432053264879141;
+    const C5 = 0.7656937429400713;
+    const C6 = 0.9398790240580331;
+    const C7 = 0.34150756966093626;
+    const C8 = 0.937623747554606;
+    const C9 = 0.34765170504638193;
+    const C10 = 0.1677366655381615;
+    const C11 = 0.9858318370970471;
+    const C12 = 0.6381801320506653;
+    const C13 = 0.7698870820164444;
+    const C14 = 0.6331276001005878;
+    const C15 = 0.7740474416926073;
+    const C16 = 0.9353283063704877;
+    const C17 = 0.35378094818985806;
+    const C18 = 0.16128086467788047;
+    const C19 = 0.9869085482904458;
+    const C20 = 0.15481815508214103;
+    const C21 = 0.9879429836063224;
+    const C22 = 0.6280479470713343;
+    const C23 = 0.7781746437525978;
+    const C24 = 0.932992798834739;
+    const C25 = 0.3598950365349881;
+    const C26 = 0.9306173249927291;
+    const C27 = 0.36599370817457677;
+    const C28 = 0.14834881359191268;
+    const C29 = 0.9889350987329107;
+    const C30 = 0.6229413905583339;
+    const C31 = 0.7822685114008164;
+    const C32 = 0.6178081493094721;
+    const C33 = 0.7863288692695983;
+    const C34 = 0.9282019866018515;
+    const C35 = 0.3720767018618288;
+    const C36 = 0.14187311733225325;
+    const C37 = 0.989884851171301;
+    const C38 = 0.1353913437004377;
+    const C39 = 0.9907922002372597;
+    const C40 = 0.6126484432157191;
+    const C41 = 0.7903555434267263;
+    const C42 = 0.925746887127164;
+    const C43 = 0.3781437570215405;
+    const C44 = 0.9232521317369569;
+    const C45 = 0.38419461376126157;
+    const C46 = 0.1289037703540754;
+    const C47 = 0.9916571070629725;
+    const C48 = 0.607462493301711;
+    const C49 = 0.7943483613828815;
+    const C50 = 0.6022505217162819;
+    const C51 = 0.7983071520990315;
+    const C52 = 0.9207178272982477;
+    const C53 = 0.390229012882428;
+    const C54 = 0.1224106751992162;
+    const C55 = 0.99247953459871;
+    const C56 = 0.11591233637844581;
+    const C57 = 0.9932594476144136;
+    const C58 = 0.597012751722948;
+    const C59 = 0.8022317459937581;
+    const C60 = 0.9181440823722039;
+    const C61 = 0.3962466958914656;
+    const C62 = 0.9155310072094921;
+    const C63 = 0.40224740501086254;
+    const C64 = 0.10940903225897118;
+    const C65 = 0.9939968127012055;
+    const C66 = 0.5917494076903429;
+    const C67 = 0.806121974950521;
+    const C68 = 0.5864607150826073;
+    const C69 = 0.8099776723248592;
+    const C70 = 0.9128787137455552;
+    const C71 = 0.40823088319021217;
+    const C72 = 0.1029010414206961;
+    const C73 = 0.9946915982728195;
+    const C74 = 0.09638864264428781;
+    const C75 = 0.9953437745669542;
+    const C76 = 0.5811469004497304;
+    const C77 = 0.81379867295153;
+    const C78 = 0.9101873155958178;
+    const C79 = 0.4141968741172237;
+    const C80 = 0.9074569280508187;
+    const C81 = 0.42014512222870243;
+    const C82 = 0.08987211489923495;
+    const C83 = 0.9959533136465477;
+    const C84 = 0.5758081914178453;
+    const C85 = 0.8175848131515837;
+    const C86 = 0.5704448166794782;
+    const C87 = 0.8213359307393756;
+    const C88 = 0.9046876680712731;
+    const C89 = 0.4260753727214963;
+    const C90 = 0.08335173733189745;
+    const C91 = 0.9965201894009746;
+    const C92 = 0.07682778925354876;
+    const C93 = 0.9970443775471642;
+    const C94 = 0.5650570059837524;
+    const C95 = 0.8250518650295129;
+    const C96 = 0.9018796542830616;
+    const C97 = 0.43198737156341177;
+    const C98 = 0.8990330069721493;
+    const C99 = 0.43788086550409505;
+    const C100 = 0.07030055012841117;
+    const C101 = 0.9975258556306411;
+    const C102 = 0.559644990126546;
+    const C103 = 0.8287324568437381;
+    const C104 = 0.5542090009406057;
+    const C105 = 0.8323775485177478;
+    const C106 = 0.8961478480794324;
+    const C107 = 0.4437556020858809;
+    const C108 = 0.0637702995616845;
+    const C109 = 0.9979646030264866;
+    const C110 = 0.057237317287568625;
+    const C111 = 0.9983606009402225;
+    const C112 = 0.5487492712856159;
+    const C113 = 0.8359869839079467;
+    const C114 = 0.8932243011955153;
+    const C115 = 0.44961132965460654;
+    const C116 = 0.8902624915554164;
+    const C117 = 0.45544779737039254;
+    const C118 = 0.05070188315728074;
+    const C119 = 0.9987138324086161;
+    const C120 = 0.5432660350382235;
+    const C121 = 0.8395606083981357;
+    const C122 = 0.5377595270820199;
+    const C123 = 0.8430982689061355;
+    const C124 = 0.8872625460332028;
+    const C125 = 0.4612647552183872;
+    const C126 = 0.04416427712706736;
+    const C127 = 0.9990242823004072;
+    const C128 = 0.037624779246211985;
+    const C129 = 0.9992919373169553;
+    const C130 = 0.5322299832974788;
+    const C131 = 0.8465998138903442;
+    const C132 = 0.8842245931365562;
+    const C133 = 0.4670619540194766;
+    const C134 = 0.8811487630012675;
+    const C135 = 0.4728391454409586;
+    const C136 = 0.03108366964503869;
+    const C137 = 0.9995167859928107;
+    const C138 = 0.5266776405518521;
+    const C139 = 0.8500650933562288;
+    const C140 = 0.5211027366890234;
+    const C141 = 0.8534939588627505;
+    const C142 = 0.8780351873856628;
+    const C143 = 0.4785960820071808;
+    const C144 = 0.024541228522912288;
+    const C145 = 0.9996988186962042;
+    const C146 = 0.01799773613623551;
+    const C147 = 0.9998380276294608;
+    const C148 = 0.5155055105193195;
+    const C149 = 0.8568862635287228;
+    const C150 = 0.8748839996649582;
+    const C151 = 0.4843325171101413;
+    const C152 = 0.8716953348255482;
+    const C153 = 0.4900482050200525;
+    const C154 = 0.01145347278644378;
+    const C155 = 0.9999344068293331;
+    const C156 = 0.5098862018092806;
+    const C157 = 0.8602418620391045;
+    const C158 = 0.5042450512713892;
+    const C159 = 0.8635606106512236;
+    const C160 = 0.8684693294592216;
+    const C161 = 0.49574290089586764;
+    const C162 = 0.00490871880799799;
+    const C163 = 0.9999879521672569;
+    t4 = re[219];
+    t1 = im[219];
+    t2 = re[59];
+    t13 = im[59];
+    t11 = re[139];
+    t10 = im[139];
+    t14 = t2 + t11;
+    t12 = t13 + t10;
+    t3 = C0 * t14;
+    t0 = t4 - t3;
+    t9 = C0 * t12;
+    t5 = t1 - t9;
+    t8 = t2 - t11;
+    t6 = C1 * t8;
+    t7 = t13 - t10;
+    t3 = C1 * t7;
+    t9 = t4 + t14;
+    t2 = t1 + t12;
+    t11 = t0 + t3;
+    t8 = t5 - t6;
+    t13 = t0 - t3;
+    t10 = t5 + t6;
+    t7 = C2 * t9;
+    t4 = C3 * t2;
+    t14 = t7 + t4;
+    t1 = C3 * t9;
+    t12 = (-C2) * t2;
+    t0 = t1 + t12;
+    X[426] = t14;
+    X[53] = t0;
+    t3 = C4 * t11;
+    t5 = C5 * t8;
+    t6 = t3 + t5;
+    t7 = C5 * t11;
+    t4 = (-C4) * t8;
+    t9 = t7 + t4;
+    X[266] = t6;
+    X[213] = t9;
+    t2 = C6 * t13;
+    t1 = C7 * t10;
+    t12 = t2 + t1;
+    t14 = C7 * t13;
+    t0 = (-C6) * t10;
+    t3 = t14 + t0;
+    X[106] = t12;
+    X[373] = t3;
+    t5 = re[87];
+    t11 = im[87];
+    t8 = re[167];
+    t7 = im[167];
+    t4 = re[7];
+    t6 = im[7];
+    t9 = t8 + t4;
+    t2 = t7 + t6;
+    t1 = C0 * t9;
+    t13 = t5 - t1;
+    t10 = C0 * t2;
+    t14 = t11 - t10;
+    t0 = t8 - t4;
+    t12 = C1 * t0;
+    t3 = t7 - t6;
+    t1 = C1 * t3;
+    t10 = t5 + t9;
+    t8 = t11 + t2;
+    t4 = t13 + t1;
+    t0 = t14 - t12;
+    t7 = t13 - t1;
+    t6 = t14 + t12;
+    t3 = C8 * t10;
+    t5 = C9 * t8;
+    t9 = t3 + t5;
+    t11 = C9 * t10;
+    t2 = (-C8) * t8;
+    t13 = t11 + t2;
+    X[108] = t9;
+    X[371] = t13;
+    t1 = C10 * t4;
+    t14 = C11 * t0;
+    t12 = t1 + t14;
+    t3 = C11 * t4;
+    t5 = (-C10) * t0;
+    t10 = t3 + t5;
+    X[428] = t12;
+    X[51] = t10;
+    t8 = C12 * t7;
+    t11 = C13 * t6;
+    t2 = t8 + t11;
+    t9 = C13 * t7;
+    t13 = (-C12) * t6;
+    t1 = t9 + t13;
+    X[268] = t2;
+    X[211] = t1;
+    t14 = re[195];
+    t4 = im[195];
+    t0 = re[35];
+    t3 = im[35];
+    t5 = re[115];
+    t12 = im[115];
+    t10 = t0 + t5;
+    t8 = t3 + t12;
+    t11 = C0 * t10;
+    t7 = t14 - t11;
+    t6 = C0 * t8;
+    t9 = t4 - t6;
+    t13 = t0 - t5;
+    t2 = C1 * t13;
+    t1 = t3 - t12;
+    t11 = C1 * t1;
+    t6 = t14 + t10;
+    t0 = t4 + t8;
+    t5 = t7 + t11;
+    t13 = t9 - t2;
+    t3 = t7 - t11;
+    t12 = t9 + t2;
+    t1 = C14 * t6;
+    t14 = C15 * t0;
+    t10 = t1 + t14;
+    t4 = C15 * t6;
+    t8 = (-C14) * t0;
+    t7 = t4 + t8;
+    X[270] = t10;
+    X[209] = t7;
+    t11 = C16 * t5;
+    t9 = C17 * t13;
+    t2 = t11 + t9;
+    t1 = C17 * t5;
+    t14 = (-C16) * t13;
+    t6 = t1 + t14;
+    X[110] = t2;
+    X[369] = t6;
+    t0 = C18 * t3;
+    t4 = C19 * t12;
+    t8 = t0 + t4;
+    t10 = C19 * t3;
+    t7 = (-C18) * t12;
+    t11 = t10 + t7;
+    X[430] = t8;
+    X[49] = t11;
+    t9 = re[78];
+    t5 = im[78];
+    t13 = re[158];
+    t1 = im[158];
+    t14 = re[238];
+    t2 = im[238];
+    t6 = t13 + t14;
+    t0 = t1 + t2;
+    t4 = C0 * t6;
+    t3 = t9 - t4;
+    t12 = C0 * t0;
+    t10 = t5 - t12;
+    t7 = t13 - t14;
+    t8 = C1 * t7;
+    t11 = t1 - t2;
+    t4 = C1 * t11;
+    t12 = t9 + t6;
+    t13 = t5 + t0;
+    t14 = t3 + t4;
+    t7 = t10 - t8;
+    t1 = t3 - t4;
+    t2 = t10 + t8;
+    t11 = C20 * t12;
+    t9 = C21 * t13;
+    t6 = t11 + t9;
+    t5 = C21 * t12;
+    t0 = (-C20) * t13;
+    t3 = t5 + t0;
+    X[432] = t6;
+    X[47] = t3;
+    t4 = C22 * t14;
+    t10 = C23 * t7;
+    t8 = t4 + t10;
+    t11 = C23 * t14;
+    t9 = (-C22) * t7;
+    t12 = t11 + t9;
+    X[272] = t8;
+    X[207] = t12;
+    t13 = C24 * t1;
+    t5 = C25 * t2;
+    t0 = t13 + t5;
+    t6 = C25 * t1;
+    t3 = (-C24) * t2;
+    t4 = t6 + t3;
+    X[112] = t0;
+    X[367] = t4;
+    t10 = re[186];
+    t14 = im[186];
+    t7 = re[26];
+    t11 = im[26];
+    t9 = re[106];
+    t8 = im[106];
+    t12 = t7 + t9;
+    t13 = t11 + t8;
+    t5 = C0 * t12;
+    t1 = t10 - t5;
+    t2 = C0 * t13;
+    t6 = t14 - t2;
+    t3 = t7 - t9;
+    t0 = C1 * t3;
+    t4 = t11 - t8;
+    t5 = C1 * t4;
+    t2 = t10 + t12;
+    t7 = t14 + t13;
+    t9 = t1 + t5;
+    t3 = t6 - t0;
+    t11 = t1 - t5;
+    t8 = t6 + t0;
+    t4 = C26 * t2;
+    t10 = C27 * t7;
+    t12 = t4 + t10;
+    t14 = C27 * t2;
+    t13 = (-C26) * t7;
+    t1 = t14 + t13;
+    X[114] = t12;
+    X[365] = t1;
+    t5 = C28 * t9;
+    t6 = C29 * t3;
+    t0 = t5 + t6;
+    t4 = C29 * t9;
+    t10 = (-C28) * t3;
+    t2 = t4 + t10;
+    X[434] = t0;
+    X[45] = t2;
+    t7 = C30 * t11;
+    t14 = C31 * t8;
+    t13 = t7 + t14;
+    t12 = C31 * t11;
+    t1 = (-C30) * t8;
+    t5 = t12 + t1;
+    X[274] = t13;
+    X[205] = t5;
+    t6 = re[54];
+    t9 = im[54];
+    t3 = re[134];
+    t4 = im[134];
+    t10 = re[214];
+    t0 = im[214];
+    t2 = t3 + t10;
+    t7 = t4 + t0;
+    t14 = C0 * t2;
+    t11 = t6 - t14;
+    t8 = C0 * t7;
+    t12 = t9 - t8;
+    t1 = t3 - t10;
+    t13 = C1 * t1;
+    t5 = t4 - t0;
+    t14 = C1 * t5;
+    t8 = t6 + t2;
+    t3 = t9 + t7;
+    t10 = t11 + t14;
+    t1 = t12 - t13;
+    t4 = t11 - t14;
+    t0 = t12 + t13;
+    t5 = C32 * t8;
+    t6 = C33 * t3;
+    t2 = t5 + t6;
+    t9 = C33 * t8;
+    t7 = (-C32) * t3;
+    t11 = t9 + t7;
+    X[276] = t2;
+    X[203] = t11;
+    t14 = C34 * t10;
+    t12 = C35 * t1;
+    t13 = t14 + t12;
+    t5 = C35 * t10;
+    t6 = (-C34) * t1;
+    t8 = t5 + t6;
+    X[116] = t13;
+    X[363] = t8;
+    t3 = C36 * t4;
+    t9 = C37 * t0;
+    t7 = t3 + t9;
+    t2 = C37 * t4;
+    t11 = (-C36) * t0;
+    t14 = t2 + t11;
+    X[436] = t7;
+    X[43] = t14;
+    t12 = re[162];
+    t10 = im[162];
+    t1 = re[2];
+    t5 = im[2];
+    t6 = re[82];
+    t13 = im[82];
+    t8 = t1 + t6;
+    t3 = t5 + t13;
+    t9 = C0 * t8;
+    t4 = t12 - t9;
+    t0 = C0 * t3;
+    t2 = t10 - t0;
+    t11 = t1 - t6;
+    t7 = C1 * t11;
+    t14 = t5 - t13;
+    t9 = C1 * t14;
+    t0 = t12 + t8;
+    t1 = t10 + t3;
+    t6 = t4 + t9;
+    t11 = t2 - t7;
+    t5 = t4 - t9;
+    t13 = t2 + t7;
+    t14 = C38 * t0;
+    t12 = C39 * t1;
+    t8 = t14 + t12;
+    t10 = C39 * t0;
+    t3 = (-C38) * t1;
+    t4 = t10 + t3;
+    X[438] = t8;
+    X[41] = t4;
+    t9 = C40 * t6;
+    t2 = C41 * t11;
+    t7 = t9 + t2;
+    t14 = C41 * t6;
+    t12 = (-C40) * t11;
+    t0 = t14 + t12;
+    X[278] = t7;
+    X[201] = t0;
+    t1 = C42 * t5;
+    t10 = C43 * t13;
+    t3 = t1 + t10;
+    t8 = C43 * t5;
+    t4 = (-C42) * t13;
+    t9 = t8 + t4;
+    X[118] = t3;
+    X[361] = t9;
+    t2 = re[45];
+    t6 = im[45];
+    t11 = re[125];
+    t14 = im[125];
+    t12 = re[205];
+    t7 = im[205];
+    t0 = t11 + t12;
+    t1 = t14 + t7;
+    t10 = C0 * t0;
+    t5 = t2 - t10;
+    t13 = C0 * t1;
+    t8 = t6 - t13;
+    t4 = t11 - t12;
+    t3 = C1 * t4;
+    t9 = t14 - t7;
+    t10 = C1 * t9;
+    t13 = t2 + t0;
+    t11 = t6 + t1;
+    t12 = t5 + t10;
+    t4 = t8 - t3;
+    t14 = t5 - t10;
+    t7 = t8 + t3;
+    t9 = C44 * t13;
+    t2 = C45 * t11;
+    t0 = t9 + t2;
+    t6 = C45 * t13;
+    t1 = (-C44) * t11;
+    t5 = t6 + t1;
+    X[120] = t0;
+    X[359] = t5;
+    t10 = C46 * t12;
+    t8 = C47 * t4;
+    t3 = t10 + t8;
+    t9 = C47 * t12;
+    t2 = (-C46) * t4;
+    t13 = t9 + t2;
+    X[440] = t3;
+    X[39] = t13;
+    t11 = C48 * t14;
+    t6 = C49 * t7;
+    t1 = t11 + t6;
+    t0 = C49 * t14;
+    t5 = (-C48) * t7;
+    t10 = t0 + t5;
+    X[280] = t1;
+    X[199] = t10;
+    t8 = re[153];
+    t12 = im[153];
+    t4 = re[233];
+    t9 = im[233];
+    t2 = re[73];
+    t3 = im[73];
+    t13 = t4 + t2;
+    t11 = t9 + t3;
+    t6 = C0 * t13;
+    t14 = t8 - t6;
+    t7 = C0 * t11;
+    t0 = t12 - t7;
+    t5 = t4 - t2;
+    t1 = C1 * t5;
+    t10 = t9 - t3;
+    t6 = C1 * t10;
+    t7 = t8 + t13;
+    t4 = t12 + t11;
+    t2 = t14 + t6;
+    t5 = t0 - t1;
+    t9 = t14 - t6;
+    t3 = t0 + t1;
+    t10 = C50 * t7;
+    t8 = C51 * t4;
+    t13 = t10 + t8;
+    t12 = C51 * t7;
+    t11 = (-C50) * t4;
+    t14 = t12 + t11;
+    X[282] = t13;
+    X[197] = t14;
+    t6 = C52 * t2;
+    t0 = C53 * t5;
+    t1 = t6 + t0;
+    t10 = C53 * t2;
+    t8 = (-C52) * t5;
+    t7 = t10 + t8;
+    X[122] = t1;
+    X[357] = t7;
+    t4 = C54 * t9;
+    t12 = C55 * t3;
+    t11 = t4 + t12;
+    t13 = C55 * t9;
+    t14 = (-C54) * t3;
+    t6 = t13 + t14;
+    X[442] = t11;
+    X[37] = t6;
+    t0 = re[21];
+    t2 = im[21];
+    t5 = re[101];
+    t10 = im[101];
+    t8 = re[181];
+    t1 = im[181];
+    t7 = t5 + t8;
+    t4 = t10 + t1;
+    t12 = C0 * t7;
+    t9 = t0 - t12;
+    t3 = C0 * t4;
+    t13 = t2 - t3;
+    t14 = t5 - t8;
+    t11 = C1 * t14;
+    t6 = t10 - t1;
+    t12 = C1 * t6;
+    t3 = t0 + t7;
+    t5 = t2 + t4;
+    t8 = t9 + t12;
+    t14 = t13 - t11;
+    t10 = t9 - t12;
+    t1 = t13 + t11;
+    t6 = C56 * t3;
+    t0 = C57 * t5;
+    t7 = t6 + t0;
+    t2 = C57 * t3;
+    t4 = (-C56) * t5;
+    t9 = t2 + t4;
+    X[444] = t7;
+    X[35] = t9;
+    t12 = C58 * t8;
+    t13 = C59 * t14;
+    t11 = t12 + t13;
+    t6 = C59 * t8;
+    t0 = (-C58) * t14;
+    t3 = t6 + t0;
+    X[284] = t11;
+    X[195] = t3;
+    t5 = C60 * t10;
+    t2 = C61 * t1;
+    t4 = t5 + t2;
+    t7 = C61 * t10;
+    t9 = (-C60) * t1;
+    t12 = t7 + t9;
+    X[124] = t4;
+    X[355] = t12;
+    t13 = re[129];
+    t8 = im[129];
+    t14 = re[209];
+    t6 = im[209];
+    t0 = re[49];
+    t11 = im[49];
+    t3 = t14 + t0;
+    t5 = t6 + t11;
+    t2 = C0 * t3;
+    t10 = t13 - t2;
+    t1 = C0 * t5;
+    t7 = t8 - t1;
+    t9 = t14 - t0;
+    t4 = C1 * t9;
+    t12 = t6 - t11;
+    t2 = C1 * t12;
+    t1 = t13 + t3;
+    t14 = t8 + t5;
+    t0 = t10 + t2;
+    t9 = t7 - t4;
+    t6 = t10 - t2;
+    t11 = t7 + t4;
+    t12 = C62 * t1;
+    t13 = C63 * t14;
+    t3 = t12 + t13;
+    t8 = C63 * t1;
+    t5 = (-C62) * t14;
+    t10 = t8 + t5;
+    X[126] = t3;
+    X[353] = t10;
+    t2 = C64 * t0;
+    t7 = C65 * t9;
+    t4 = t2 + t7;
+    t12 = C65 * t0;
+    t13 = (-C64) * t9;
+    t1 = t12 + t13;
+    X[446] = t4;
+    X[33] = t1;
+    t14 = C66 * t6;
+    t8 = C67 * t11;
+    t5 = t14 + t8;
+    t3 = C67 * t6;
+    t10 = (-C66) * t11;
+    t2 = t3 + t10;
+    X[286] = t5;
+    X[193] = t2;
+    t7 = re[192];
+    t0 = im[192];
+    t9 = re[32];
+    t12 = im[32];
+    t13 = re[112];
+    t4 = im[112];
+    t1 = t9 + t13;
+    t14 = t12 + t4;
+    t8 = C0 * t1;
+    t6 = t7 - t8;
+    t11 = C0 * t14;
+    t3 = t0 - t11;
+    t10 = t9 - t13;
+    t5 = C1 * t10;
+    t2 = t12 - t4;
+    t8 = C1 * t2;
+    t11 = t7 + t1;
+    t9 = t0 + t14;
+    t13 = t6 + t8;
+    t10 = t3 - t5;
+    t12 = t6 - t8;
+    t4 = t3 + t5;
+    t2 = C68 * t11;
+    t7 = C69 * t9;
+    t1 = t2 + t7;
+    t0 = C69 * t11;
+    t14 = (-C68) * t9;
+    t6 = t0 + t14;
+    X[288] = t1;
+    X[191] = t6;
+    t8 = C70 * t13;
+    t3 = C71 * t10;
+    t5 = t8 + t3;
+    t2 = C71 * t13;
+    t7 = (-C70) * t10;
+    t11 = t2 + t7;
+    X[128] = t5;
+    X[351] = t11;
+    t9 = C72 * t12;
+    t0 = C73 * t4;
+    t14 = t9 + t0;
+    t1 = C73 * t12;
+    t6 = (-C72) * t4;
+    t8 = t1 + t6;
+    X[448] = t14;
+    X[31] = t8;
+    t3 = re[60];
+    t13 = im[60];
+    t10 = re[140];
+    t2 = im[140];
+    t7 = re[220];
+    t5 = im[220];
+    t11 = t10 + t7;
+    t9 = t2 + t5;
+    t0 = C0 * t11;
+    t12 = t3 - t0;
+    t4 = C0 * t9;
+    t1 = t13 - t4;
+    t6 = t10 - t7;
+    t14 = C1 * t6;
+    t8 = t2 - t5;
+    t0 = C1 * t8;
+    t4 = t3 + t11;
+    t10 = t13 + t9;
+    t7 = t12 + t0;
+    t6 = t1 - t14;
+    t2 = t12 - t0;
+    t5 = t1 + t14;
+    t8 = C74 * t4;
+    t3 = C75 * t10;
+    t11 = t8 + t3;
+    t13 = C75 * t4;
+    t9 = (-C74) * t10;
+    t12 = t13 + t9;
+    X[450] = t11;
+    X[29] = t12;
+    t0 = C76 * t7;
+    t1 = C77 * t6;
+    t14 = t0 + t1;
+    t8 = C77 * t7;
+    t3 = (-C76) * t6;
+    t4 = t8 + t3;
+    X[290] = t14;
+    X[189] = t4;
+    t10 = C78 * t2;
+    t13 = C79 * t5;
+    t9 = t10 + t13;
+    t11 = C79 * t2;
+    t12 = (-C78) * t5;
+    t0 = t11 + t12;
+    X[130] = t9;
+    X[349] = t0;
+    t1 = re[168];
+    t7 = im[168];
+    t6 = re[8];
+    t8 = im[8];
+    t3 = re[88];
+    t14 = im[88];
+    t4 = t6 + t3;
+    t10 = t8 + t14;
+    t13 = C0 * t4;
+    t2 = t1 - t13;
+    t5 = C0 * t10;
+    t11 = t7 - t5;
+    t12 = t6 - t3;
+    t9 = C1 * t12;
+    t0 = t8 - t14;
+    t13 = C1 * t0;
+    t5 = t1 + t4;
+    t6 = t7 + t10;
+    t3 = t2 + t13;
+    t12 = t11 - t9;
+    t8 = t2 - t13;
+    t14 = t11 + t9;
+    t0 = C80 * t5;
+    t1 = C81 * t6;
+    t4 = t0 + t1;
+    t7 = C81 * t5;
+    t10 = (-C80) * t6;
+    t2 = t7 + t10;
+    X[132] = t4;
+    X[347] = t2;
+    t13 = C82 * t3;
+    t11 = C83 * t12;
+    t9 = t13 + t11;
+    t0 = C83 * t3;
+    t1 = (-C82) * t12;
+    t5 = t0 + t1;
+    X[452] = t9;
+    X[27] = t5;
+    t6 = C84 * t8;
+    t7 = C85 * t14;
+    t10 = t6 + t7;
+    t4 = C85 * t8;
+    t2 = (-C84) * t14;
+    t13 = t4 + t2;
+    X[292] = t10;
+    X[187] = t13;
+    t11 = re[36];
+    t3 = im[36];
+    t12 = re[116];
+    t0 = im[116];
+    t1 = re[196];
+    t9 = im[196];
+    t5 = t12 + t1;
+    t6 = t0 + t9;
+    t7 = C0 * t5;
+    t8 = t11 - t7;
+    t14 = C0 * t6;
+    t4 = t3 - t14;
+    t2 = t12 - t1;
+    t10 = C1 * t2;
+    t13 = t0 - t9;
+    t7 = C1 * t13;
+    t14 = t11 + t5;
+    t12 = t3 + t6;
+    t1 = t8 + t7;
+    t2 = t4 - t10;
+    t0 = t8 - t7;
+    t9 = t4 + t10;
+    t13 = C86 * t14;
+    t11 = C87 * t12;
+    t5 = t13 + t11;
+    t3 = C87 * t14;
+    t6 = (-C86) * t12;
+    t8 = t3 + t6;
+    X[294] = t5;
+    X[185] = t8;
+    t7 = C88 * t1;
+    t4 = C89 * t2;
+    t10 = t7 + t4;
+    t13 = C89 * t1;
+    t11 = (-C88) * t2;
+    t14 = t13 + t11;
+    X[134] = t10;
+    X[345] = t14;
+    t12 = C90 * t0;
+    t3 = C91 * t9;
+    t6 = t12 + t3;
+    t5 = C91 * t0;
+    t8 = (-C90) * t9;
+    t7 = t5 + t8;
+    X[454] = t6;
+    X[25] = t7;
+    t4 = re[159];
+    t1 = im[159];
+    t2 = re[239];
+    t13 = im[239];
+    t11 = re[79];
+    t10 = im[79];
+    t14 = t2 + t11;
+    t12 = t13 + t10;
+    t3 = C0 * t14;
+    t0 = t4 - t3;
+    t9 = C0 * t12;
+    t5 = t1 - t9;
+    t8 = t2 - t11;
+    t6 = C1 * t8;
+    t7 = t13 - t10;
+    t3 = C1 * t7;
+    t9 = t4 + t14;
+    t2 = t1 + t12;
+    t11 = t0 + t3;
+    t8 = t5 - t6;
+    t13 = t0 - t3;
+    t10 = t5 + t6;
+    t7 = C92 * t9;
+    t4 = C93 * t2;
+    t14 = t7 + t4;
+    t1 = C93 * t9;
+    t12 = (-C92) * t2;
+    t0 = t1 + t12;
+    X[456] = t14;
+    X[23] = t0;
+    t3 = C94 * t11;
+    t5 = C95 * t8;
+    t6 = t3 + t5;
+    t7 = C95 * t11;
+    t4 = (-C94) * t8;
+    t9 = t7 + t4;
+    X[296] = t6;
+    X[183] = t9;
+    t2 = C96 * t13;
+    t1 = C97 * t10;
+    t12 = t2 + t1;
+    t14 = C97 * t13;
+    t0 = (-C96) * t10;
+    t3 = t14 + t0;
+    X[136] = t12;
+    X[343] = t3;
+    t5 = re[27];
+    t11 = im[27];
+    t8 = re[107];
+    t7 = im[107];
+    t4 = re[187];
+    t6 = im[187];
+    t9 = t8 + t4;
+    t2 = t7 + t6;
+    t1 = C0 * t9;
+    t13 = t5 - t1;
+    t10 = C0 * t2;
+    t14 = t11 - t10;
+    t0 = t8 - t4;
+    t12 = C1 * t0;
+    t3 = t7 - t6;
+    t1 = C1 * t3;
+    t10 = t5 + t9;
+    t8 = t11 + t2;
+    t4 = t13 + t1;
+    t0 = t14 - t12;
+    t7 = t13 - t1;
+    t6 = t14 + t12;
+    t3 = C98 * t10;
+    t5 = C99 * t8;
+    t9 = t3 + t5;
+    t11 = C99 * t10;
+    t2 = (-C98) * t8;
+    t13 = t11 + t2;
+    X[138] = t9;
+    X[341] = t13;
+    t1 = C100 * t4;
+    t14 = C101 * t0;
+    t12 = t1 + t14;
+    t3 = C101 * t4;
+    t5 = (-C100) * t0;
+    t10 = t3 + t5;
+    X[458] = t12;
+    X[21] = t10;
+    t8 = C102 * t7;
+    t11 = C103 * t6;
+    t2 = t8 + t11;
+    t9 = C103 * t7;
+    t13 = (-C102) * t6;
+    t1 = t9 + t13;
+    X[298] = t2;
+    X[181] = t1;
+    t14 = re[135];
+    t4 = im[135];
+    t0 = re[215];
+    t3 = im[215];
+    t5 = re[55];
+    t12 = im[55];
+    t10 = t0 + t5;
+    t8 = t3 + t12;
+    t11 = C0 * t10;
+    t7 = t14 - t11;
+    t6 = C0 * t8;
+    t9 = t4 - t6;
+    t13 = t0 - t5;
+    t2 = C1 * t13;
+    t1 = t3 - t12;
+    t11 = C1 * t1;
+    t6 = t14 + t10;
+    t0 = t4 + t8;
+    t5 = t7 + t11;
+    t13 = t9 - t2;
+    t3 = t7 - t11;
+    t12 = t9 + t2;
+    t1 = C104 * t6;
+    t14 = C105 * t0;
+    t10 = t1 + t14;
+    t4 = C105 * t6;
+    t8 = (-C104) * t0;
+    t7 = t4 + t8;
+    X[300] = t10;
+    X[179] = t7;
+    t11 = C106 * t5;
+    t9 = C107 * t13;
+    t2 = t11 + t9;
+    t1 = C107 * t5;
+    t14 = (-C106) * t13;
+    t6 = t1 + t14;
+    X[140] = t2;
+    X[339] = t6;
+    t0 = C108 * t3;
+    t4 = C109 * t12;
+    t8 = t0 + t4;
+    t10 = C109 * t3;
+    t7 = (-C108) * t12;
+    t11 = t10 + t7;
+    X[460] = t8;
+    X[19] = t11;
+    t9 = re[3];
+    t5 = im[3];
+    t13 = re[83];
+    t1 = im[83];
+    t14 = re[163];
+    t2 = im[163];
+    t6 = t13 + t14;
+    t0 = t1 + t2;
+    t4 = C0 * t6;
+    t3 = t9 - t4;
+    t12 = C0 * t0;
+    t10 = t5 - t12;
+    t7 = t13 - t14;
+    t8 = C1 * t7;
+    t11 = t1 - t2;
+    t4 = C1 * t11;
+    t12 = t9 + t6;
+    t13 = t5 + t0;
+    t14 = t3 + t4;
+    t7 = t10 - t8;
+    t1 = t3 - t4;
+    t2 = t10 + t8;
+    t11 = C110 * t12;
+    t9 = C111 * t13;
+    t6 = t11 + t9;
+    t5 = C111 * t12;
+    t0 = (-C110) * t13;
+    t3 = t5 + t0;
+    X[462] = t6;
+    X[17] = t3;
+    t4 = C112 * t14;
+    t10 = C113 * t7;
+    t8 = t4 + t10;
+    t11 = C113 * t14;
+    t9 = (-C112) * t7;
+    t12 = t11 + t9;
+    X[302] = t8;
+    X[177] = t12;
+    t13 = C114 * t1;
+    t5 = C115 * t2;
+    t0 = t13 + t5;
+    t6 = C115 * t1;
+    t3 = (-C114) * t2;
+    t4 = t6 + t3;
+    X[142] = t0;
+    X[337] = t4;
+    t10 = re[126];
+    t14 = im[126];
+    t7 = re[206];
+    t11 = im[206];
+    t9 = re[46];
+    t8 = im[46];
+    t12 = t7 + t9;
+    t13 = t11 + t8;
+    t5 = C0 * t12;
+    t1 = t10 - t5;
+    t2 = C0 * t13;
+    t6 = t14 - t2;
+    t3 = t7 - t9;
+    t0 = C1 * t3;
+    t4 = t11 - t8;
+    t5 = C1 * t4;
+    t2 = t10 + t12;
+    t7 = t14 + t13;
+    t9 = t1 + t5;
+    t3 = t6 - t0;
+    t11 = t1 - t5;
+    t8 = t6 + t0;
+    t4 = C116 * t2;
+    t10 = C117 * t7;
+    t12 = t4 + t10;
+    t14 = C117 * t2;
+    t13 = (-C116) * t7;
+    t1 = t14 + t13;
+    X[144] = t12;
+    X[335] = t1;
+    t5 = C118 * t9;
+    t6 = C119 * t3;
+    t0 = t5 + t6;
+    t4 = C119 * t9;
+    t10 = (-C118) * t3;
+    t2 = t4 + t10;
+    X[464] = t0;
+    X[15] = t2;
+    t7 = C120 * t11;
+    t14 = C121 * t8;
+    t13 = t7 + t14;
+    t12 = C121 * t11;
+    t1 = (-C120) * t8;
+    t5 = t12 + t1;
+    X[304] = t13;
+    X[175] = t5;
+    t6 = re[234];
+    t9 = im[234];
+    t3 = re[74];
+    t4 = im[74];
+    t10 = re[154];
+    t0 = im[154];
+    t2 = t3 + t10;
+    t7 = t4 + t0;
+    t14 = C0 * t2;
+    t11 = t6 - t14;
+    t8 = C0 * t7;
+    t12 = t9 - t8;
+    t1 = t3 - t10;
+    t13 = C1 * t1;
+    t5 = t4 - t0;
+    t14 = C1 * t5;
+    t8 = t6 + t2;
+    t3 = t9 + t7;
+    t10 = t11 + t14;
+    t1 = t12 - t13;
+    t4 = t11 - t14;
+    t0 = t12 + t13;
+    t5 = C122 * t8;
+    t6 = C123 * t3;
+    t2 = t5 + t6;
+    t9 = C123 * t8;
+    t7 = (-C122) * t3;
+    t11 = t9 + t7;
+    X[306] = t2;
+    X[173] = t11;
+    t14 = C124 * t10;
+    t12 = C125 * t1;
+    t13 = t14 + t12;
+    t5 = C125 * t10;
+    t6 = (-C124) * t1;
+    t8 = t5 + t6;
+    X[146] = t13;
+    X[333] = t8;
+    t3 = C126 * t4;
+    t9 = C127 * t0;
+    t7 = t3 + t9;
+    t2 = C127 * t4;
+    t11 = (-C126) * t0;
+    t14 = t2 + t11;
+    X[466] = t7;
+    X[13] = t14;
+    t12 = re[102];
+    t10 = im[102];
+    t1 = re[182];
+    t5 = im[182];
+    t6 = re[22];
+    t13 = im[22];
+    t8 = t1 + t6;
+    t3 = t5 + t13;
+    t9 = C0 * t8;
+    t4 = t12 - t9;
+    t0 = C0 * t3;
+    t2 = t10 - t0;
+    t11 = t1 - t6;
+    t7 = C1 * t11;
+    t14 = t5 - t13;
+    t9 = C1 * t14;
+    t0 = t12 + t8;
+    t1 = t10 + t3;
+    t6 = t4 + t9;
+    t11 = t2 - t7;
+    t5 = t4 - t9;
+    t13 = t2 + t7;
+    t14 = C128 * t0;
+    t12 = C129 * t1;
+    t8 = t14 + t12;
+    t10 = C129 * t0;
+    t3 = (-C128) * t1;
+    t4 = t10 + t3;
+    X[468] = t8;
+    X[11] = t4;
+    t9 = C130 * t6;
+    t2 = C131 * t11;
+    t7 = t9 + t2;
+    t14 = C131 * t6;
+    t12 = (-C130) * t11;
+    t0 = t14 + t12;
+    X[308] = t7;
+    X[171] = t0;
+    t1 = C132 * t5;
+    t10 = C133 * t13;
+    t3 = t1 + t10;
+    t8 = C133 * t5;
+    t4 = (-C132) * t13;
+    t9 = t8 + t4;
+    X[148] = t3;
+    X[331] = t9;
+    t2 = re[210];
+    t6 = im[210];
+    t11 = re[50];
+    t14 = im[50];
+    t12 = re[130];
+    t7 = im[130];
+    t0 = t11 + t12;
+    t1 = t14 + t7;
+    t10 = C0 * t0;
+    t5 = t2 - t10;
+    t13 = C0 * t1;
+    t8 = t6 - t13;
+    t4 = t11 - t12;
+    t3 = C1 * t4;
+    t9 = t14 - t7;
+    t10 = C1 * t9;
+    t13 = t2 + t0;
+    t11 = t6 + t1;
+    t12 = t5 + t10;
+    t4 = t8 - t3;
+    t14 = t5 - t10;
+    t7 = t8 + t3;
+    t9 = C134 * t13;
+    t2 = C135 * t11;
+    t0 = t9 + t2;
+    t6 = C135 * t13;
+    t1 = (-C134) * t11;
+    t5 = t6 + t1;
+    X[150] = t0;
+    X[329] = t5;
+    t10 = C136 * t12;
+    t8 = C137 * t4;
+    t3 = t10 + t8;
+    t9 = C137 * t12;
+    t2 = (-C136) * t4;
+    t13 = t9 + t2;
+    X[470] = t3;
+    X[9] = t13;
+    t11 = C138 * t14;
+    t6 = C139 * t7;
+    t1 = t11 + t6;
+    t0 = C139 * t14;
+    t5 = (-C138) * t7;
+    t10 = t0 + t5;
+    X[310] = t1;
+    X[169] = t10;
+    t8 = re[93];
+    t12 = im[93];
+    t4 = re[173];
+    t9 = im[173];
+    t2 = re[13];
+    t3 = im[13];
+    t13 = t4 + t2;
+    t11 = t9 + t3;
+    t6 = C0 * t13;
+    t14 = t8 - t6;
+    t7 = C0 * t11;
+    t0 = t12 - t7;
+    t5 = t4 - t2;
+    t1 = C1 * t5;
+    t10 = t9 - t3;
+    t6 = C1 * t10;
+    t7 = t8 + t13;
+    t4 = t12 + t11;
+    t2 = t14 + t6;
+    t5 = t0 - t1;
+    t9 = t14 - t6;
+    t3 = t0 + t1;
+    t10 = C140 * t7;
+    t8 = C141 * t4;
+    t13 = t10 + t8;
+    t12 = C141 * t7;
+    t11 = (-C140) * t4;
+    t14 = t12 + t11;
+    X[312] = t13;
+    X[167] = t14;
+    t6 = C142 * t2;
+    t0 = C143 * t5;
+    t1 = t6 + t0;
+    t10 = C143 * t2;
+    t8 = (-C142) * t5;
+    t7 = t10 + t8;
+    X[152] = t1;
+    X[327] = t7;
+    t4 = C144 * t9;
+    t12 = C145 * t3;
+    t11 = t4 + t12;
+    t13 = C145 * t9;
+    t14 = (-C144) * t3;
+    t6 = t13 + t14;
+    X[472] = t11;
+    X[7] = t6;
+    t0 = re[201];
+    t2 = im[201];
+    t5 = re[41];
+    t10 = im[41];
+    t8 = re[121];
+    t1 = im[121];
+    t7 = t5 + t8;
+    t4 = t10 + t1;
+    t12 = C0 * t7;
+    t9 = t0 - t12;
+    t3 = C0 * t4;
+    t13 = t2 - t3;
+    t14 = t5 - t8;
+    t11 = C1 * t14;
+    t6 = t10 - t1;
+    t12 = C1 * t6;
+    t3 = t0 + t7;
+    t5 = t2 + t4;
+    t8 = t9 + t12;
+    t14 = t13 - t11;
+    t10 = t9 - t12;
+    t1 = t13 + t11;
+    t6 = C146 * t3;
+    t0 = C147 * t5;
+    t7 = t6 + t0;
+    t2 = C147 * t3;
+    t4 = (-C146) * t5;
+    t9 = t2 + t4;
+    X[474] = t7;
+    X[5] = t9;
+    t12 = C148 * t8;
+    t13 = C149 * t14;
+    t11 = t12 + t13;
+    t6 = C149 * t8;
+    t0 = (-C148) * t14;
+    t3 = t6 + t0;
+    X[314] = t11;
+    X[165] = t3;
+    t5 = C150 * t10;
+    t2 = C151 * t1;
+    t4 = t5 + t2;
+    t7 = C151 * t10;
+    t9 = (-C150) * t1;
+    t12 = t7 + t9;
+    X[154] = t4;
+    X[325] = t12;
+    t13 = re[69];
+    t8 = im[69];
+    t14 = re[149];
+    t6 = im[149];
+    t0 = re[229];
+    t11 = im[229];
+    t3 = t14 + t0;
+    t5 = t6 + t11;
+    t2 = C0 * t3;
+    t10 = t13 - t2;
+    t1 = C0 * t5;
+    t7 = t8 - t1;
+    t9 = t14 - t0;
+    t4 = C1 * t9;
+    t12 = t6 - t11;
+    t2 = C1 * t12;
+    t1 = t13 + t3;
+    t14 = t8 + t5;
+    t0 = t10 + t2;
+    t9 = t7 - t4;
+    t6 = t10 - t2;
+    t11 = t7 + t4;
+    t12 = C152 * t1;
+    t13 = C153 * t14;
+    t3 = t12 + t13;
+    t8 = C153 * t1;
+    t5 = (-C152) * t14;
+    t10 = t8 + t5;
+    X[156] = t3;
+    X[323] = t10;
+    t2 = C154 * t0;
+    t7 = C155 * t9;
+    t4 = t2 + t7;
+    t12 = C155 * t0;
+    t13 = (-C154) * t9;
+    t1 = t12 + t13;
+    X[476] = t4;
+    X[3] = t1;
+    t14 = C156 * t6;
+    t8 = C157 * t11;
+    t5 = t14 + t8;
+    t3 = C157 * t6;
+    t10 = (-C156) * t11;
+    t2 = t3 + t10;
+    X[316] = t5;
+    X[163] = t2;
+    t7 = re[177];
+    t0 = im[177];
+    t9 = re[17];
+    t12 = im[17];
+    t13 = re[97];
+    t4 = im[97];
+    t1 = t9 + t13;
+    t14 = t12 + t4;
+    t8 = C0 * t1;
+    t6 = t7 - t8;
+    t11 = C0 * t14;
+    t3 = t0 - t11;
+    t10 = t9 - t13;
+    t5 = C1 * t10;
+    t2 = t12 - t4;
+    t8 = C1 * t2;
+    t11 = t7 + t1;
+    t9 = t0 + t14;
+    t13 = t6 + t8;
+    t10 = t3 - t5;
+    t12 = t6 - t8;
+    t4 = t3 + t5;
+    t2 = C158 * t11;
+    t7 = C159 * t9;
+    t1 = t2 + t7;
+    t0 = C159 * t11;
+    t14 = (-C158) * t9;
+    t6 = t0 + t14;
+    X[318] = t1;
+    X[161] = t6;
+    t8 = C160 * t13;
+    t3 = C161 * t10;
+    t5 = t8 + t3;
+    t2 = C161 * t13;
+    t7 = (-C160) * t10;
+    t11 = t2 + t7;
+    X[158] = t5;
+    X[321] = t11;
+    t9 = C162 * t12;
+    t0 = C163 * t4;
+    t14 = t9 + t0;
+    t1 = C163 * t12;
+    t6 = (-C162) * t4;
+    t8 = t1 + t6;
+    X[478] = t14;
+    X[1] = t8;
+}
+
+/**
+ *  Part 1 of ApplyWindowedIMDCT_W10_480().
+ * 
+ *  @param {Number[]} X 
+ *    - The input block (480 points).
+ *  @param {Number[]} y 
+ *    - The array that would contain the output block (960 points).
+ *  @param {Number[]} re 
+ *    - The scratch buffer (real part, 240 points).
+ *  @param {Number[]} im 
+ *    - The scratch buffer (imaginary part, 240 points).
+ */
+function ApplyWindowedIMDCT_W10_480_Part1(X, y, re, im) {
+    let t0, t1, t10, t11, t2, t3, t4, t5, t6, t7, t8, t9;
+    const C0 = 0.9238795325112867;
+    const C1 = 0.3826834323650898;
+    const C2 = 0.7071067811865476;
+    const C3 = 0.7071067811865475;
+    const C4 = 0.9951847266721969;
+    const C5 = 0.0980171403295606;
+    const C6 = 0.881921264348355;
+    const C7 = 0.47139673682599764;
+    const C8 = 0.6343932841636455;
+    const C9 = 0.773010453362737;
+    const C10 = 0.29028467725446233;
+    const C11 = 0.9569403357322088;
+    const C12 = 1.3065629648763766;
+    const C13 = 0.5411961001461969;
+    const C14 = 0.9807852804032304;
+    const C15 = 0.19509032201612825;
+    const C16 = 0.8314696123025452;
+    const C17 = 0.5555702330196022;
+    const C18 = 0.9510565162951535;
+    const C19 = 0.3090169943749474;
+    const C20 = 0.7604059656000309;
+    const C21 = 0.6494480483301837;
+    const C22 = 0.45399049973954675;
+    const C23 = 0.8910065241883679;
+    const C24 = 0.07845909572784494;
+    const C25 = 0.996917333733128;
+    const C26 = 0.916187957117136;
+    const C27 = 0.40074883310314097;
+    const C28 = 0.6930873625456359;
+    const C29 = 0.7208535967029188;
+    const C30 = 0.36447049987914965;
+    const C31 = 0.9312149347588036;
+    const C32 = 0.9998072404820648;
+    const C33 = 0.0196336924606283;
+    const C34 = 0.8724960070727972;
+    const C35 = 0.4886212414969549;
+    const C36 = 0.619093949309834;
+    const C37 = 0.785316930880745;
+    const C38 = 0.27144044986507426;
+    const C39 = 0.9624552364536473;
+    const C40 = 0.9930684569549263;
+    const C41 = 0.11753739745783764;
+    const C42 = 0.8204014435255136;
+    const C43 = 0.5717879602276122;
+    const C44 = 0.5391383229110002;
+    const C45 = 0.8422172337162865;
+    const C46 = 0.1757962799343545;
+    const C47 = 0.9844265680898916;
+    const C48 = 0.9767658813208724;
+    const C49 = 0.21430915306505077;
+    const C50 = 0.8090169943749475;
+    const C51 = 0.5877852522924731;
+    const C52 = 0.5224985647159488;
+    const C53 = 0.8526401643540922;
+    const C54 = 0.15643446504023087;
+    const C55 = 0.9876883405951378;
+    const C56 = 0.9723699203976766;
+    const C57 = 0.2334453638559054;
+    const C58 = 0.7475083268625968;
+    const C59 = 0.6642524379112817;
+    const C60 = 0.436409240673342;
+    const C61 = 0.8997482840522215;
+    const C62 = 0.05887080365118903;
+    const C63 = 0.9982656101847159;
+    const C64 = 0.944806046466878;
+    const C65 = 0.3276301795616935;
+    const C66 = 0.6788007455329417;
+    const C67 = 0.7343225094356856;
+    const C68 = 0.34611705707749296;
+    const C69 = 0.9381913359224842;
+    const C70 = 0.9992290362407229;
+    const C71 = 0.03925981575906861;
+    const C72 = 0.9081431738250813;
+    const C73 = 0.41865973753742813;
+    const C74 = 0.6035559419535714;
+    const C75 = 0.7973206537727071;
+    const C76 = 0.25249157701515795;
+    const C77 = 0.9675990923602598;
+    const C78 = 0.9905693404435773;
+    const C79 = 0.13701234168196802;
+    const C80 = 0.8627343859777918;
+    const C81 = 0.5056573733779846;
+    t0 = X[0];
+    t1 = X[479];
+    t2 = X[120];
+    t3 = X[359];
+    t4 = C0 * t2;
+    t5 = C1 * t3;
+    t4 = t4 + t5;
+    t5 = (-C1) * t2;
+    t2 = C0 * t3;
+    t3 = t5 + t2;
+    t5 = X[240];
+    t2 = X[239];
+    t6 = C2 * t5;
+    t7 = C3 * t2;
+    t6 = t6 + t7;
+    t7 = (-C3) * t5;
+    t5 = C2 * t2;
+    t2 = t7 + t5;
+    t7 = X[360];
+    t5 = X[119];
+    t8 = C1 * t7;
+    t9 = C0 * t5;
+    t8 = t8 + t9;
+    t9 = (-C0) * t7;
+    t7 = C1 * t5;
+    t5 = t9 + t7;
+    t9 = t0 + t6;
+    t7 = t1 + t2;
+    t10 = t4 + t8;
+    t11 = t3 + t5;
+    t0 = t0 - t6;
+    t6 = t1 - t2;
+    t1 = t4 - t8;
+    t2 = t3 - t5;
+    t4 = t9 + t10;
+    t8 = t7 + t11;
+    t3 = t0 + t2;
+    t5 = t6 - t1;
+    t9 = t9 - t10;
+    t10 = t7 - t11;
+    t7 = t0 - t2;
+    t11 = t6 + t1;
+    re[0] = t4;
+    im[0] = t8;
+    re[60] = t3;
+    im[60] = t5;
+    re[120] = t9;
+    im[120] = t10;
+    re[180] = t7;
+    im[180] = t11;
+    t0 = X[30];
+    t2 = X[449];
+    t6 = C4 * t0;
+    t1 = C5 * t2;
+    t4 = t6 + t1;
+    t8 = (-C5) * t0;
+    t3 = C4 * t2;
+    t5 = t8 + t3;
+    t9 = X[150];
+    t10 = X[329];
+    t7 = C6 * t9;
+    t11 = C7 * t10;
+    t6 = t7 + t11;
+    t1 = (-C7) * t9;
+    t0 = C6 * t10;
+    t2 = t1 + t0;
+    t8 = X[270];
+    t3 = X[209];
+    t7 = C8 * t8;
+    t11 = C9 * t3;
+    t9 = t7 + t11;
+    t10 = (-C9) * t8;
+    t1 = C8 * t3;
+    t0 = t10 + t1;
+    t7 = X[390];
+    t11 = X[89];
+    t8 = C10 * t7;
+    t3 = C11 * t11;
+    t10 = t8 + t3;
+    t1 = (-C11) * t7;
+    t8 = C10 * t11;
+    t3 = t1 + t8;
+    t7 = t4 + t9;
+    t11 = t5 + t0;
+    t1 = t6 + t10;
+    t8 = t2 + t3;
+    t4 = t4 - t9;
+    t9 = t5 - t0;
+    t5 = t6 - t10;
+    t0 = t2 - t3;
+    t6 = t7 + t1;
+    t10 = t11 + t8;
+    t2 = t4 + t0;
+    t3 = t9 - t5;
+    t7 = t7 - t1;
+    t1 = t11 - t8;
+    t11 = t4 - t0;
+    t8 = t9 + t5;
+    t4 = t2 + t3;
+    t0 = C0 * t4;
+    t9 = t2 * (-C12);
+    t5 = t3 * C13;
+    t4 = t0 - t5;
+    t2 = t0 + t9;
+    t3 = t7 + t1;
+    t5 = t7 - t1;
+    t0 = C2 * t3;
+    t9 = (-C2) * t5;
+    t7 = t11 + t8;
+    t1 = C1 * t7;
+    t3 = t11 * (-C12);
+    t5 = t8 * (-C13);
+    t7 = t1 - t5;
+    t11 = t1 + t3;
+    re[15] = t6;
+    im[15] = t10;
+    re[75] = t4;
+    im[75] = t2;
+    re[135] = t0;
+    im[135] = t9;
+    re[195] = t7;
+    im[195] = t11;
+    t8 = X[60];
+    t5 = X[419];
+    t1 = C14 * t8;
+    t3 = C15 * t5;
+    t6 = t1 + t3;
+    t10 = (-C15) * t8;
+    t4 = C14 * t5;
+    t2 = t10 + t4;
+    t0 = X[180];
+    t9 = X[299];
+    t7 = C16 * t0;
+    t11 = C17 * t9;
+    t1 = t7 + t11;
+    t3 = (-C17) * t0;
+    t8 = C16 * t9;
+    t5 = t3 + t8;
+    t10 = X[300];
+    t4 = X[179];
+    t7 = C17 * t10;
+    t11 = C16 * t4;
+    t0 = t7 + t11;
+    t9 = (-C16) * t10;
+    t3 = C17 * t4;
+    t8 = t9 + t3;
+    t7 = X[420];
+    t11 = X[59];
+    t10 = C15 * t7;
+    t4 = C14 * t11;
+    t9 = t10 + t4;
+    t3 = (-C14) * t7;
+    t10 = C15 * t11;
+    t4 = t3 + t10;
+    t7 = t6 + t0;
+    t11 = t2 + t8;
+    t3 = t1 + t9;
+    t10 = t5 + t4;
+    t6 = t6 - t0;
+    t0 = t2 - t8;
+    t2 = t1 - t9;
+    t8 = t5 - t4;
+    t1 = t7 + t3;
+    t9 = t11 + t10;
+    t5 = t6 + t8;
+    t4 = t0 - t2;
+    t7 = t7 - t3;
+    t3 = t11 - t10;
+    t11 = t6 - t8;
+    t10 = t0 + t2;
+    t6 = t5 + t4;
+    t8 = t5 - t4;
+    t0 = C2 * t6;
+    t2 = (-C2) * t8;
+    t5 = -t7;
+    t4 = t11 - t10;
+    t6 = t11 + t10;
+    t8 = (-C2) * t4;
+    t7 = (-C2) * t6;
+    re[30] = t1;
+    im[30] = t9;
+    re[90] = t0;
+    im[90] = t2;
+    re[150] = t3;
+    im[150] = t5;
+    re[210] = t8;
+    im[210] = t7;
+    t11 = X[90];
+    t10 = X[389];
+    t4 = C11 * t11;
+    t6 = C10 * t10;
+    t1 = t4 + t6;
+    t9 = (-C10) * t11;
+    t0 = C11 * t10;
+    t2 = t9 + t0;
+    t3 = X[210];
+    t5 = X[269];
+    t8 = C9 * t3;
+    t7 = C8 * t5;
+    t4 = t8 + t7;
+    t6 = (-C8) * t3;
+    t11 = C9 * t5;
+    t10 = t6 + t11;
+    t9 = X[330];
+    t0 = X[149];
+    t8 = C7 * t9;
+    t7 = C6 * t0;
+    t3 = t8 + t7;
+    t5 = (-C6) * t9;
+    t6 = C7 * t0;
+    t11 = t5 + t6;
+    t8 = X[450];
+    t7 = X[29];
+    t9 = C5 * t8;
+    t0 = C4 * t7;
+    t5 = t9 + t0;
+    t6 = (-C4) * t8;
+    t9 = C5 * t7;
+    t0 = t6 + t9;
+    t8 = t1 + t3;
+    t7 = t2 + t11;
+    t6 = t4 + t5;
+    t9 = t10 + t0;
+    t1 = t1 - t3;
+    t3 = t2 - t11;
+    t2 = t4 - t5;
+    t11 = t10 - t0;
+    t4 = t8 + t6;
+    t5 = t7 + t9;
+    t10 = t1 + t11;
+    t0 = t3 - t2;
+    t8 = t8 - t6;
+    t6 = t7 - t9;
+    t7 = t1 - t11;
+    t9 = t3 + t2;
+    t1 = t10 + t0;
+    t11 = C1 * t1;
+    t3 = t10 * (-C12);
+    t2 = t0 * (-C13);
+    t1 = t11 - t2;
+    t10 = t11 + t3;
+    t0 = t8 - t6;
+    t2 = t8 + t6;
+    t11 = (-C2) * t0;
+    t3 = (-C2) * t2;
+    t8 = t7 + t9;
+    t6 = (-C0) * t8;
+    t0 = t7 * C12;
+    t2 = t9 * (-C13);
+    t8 = t6 - t2;
+    t7 = t6 + t0;
+    re[45] = t4;
+    im[45] = t5;
+    re[105] = t1;
+    im[105] = t10;
+    re[165] = t11;
+    im[165] = t3;
+    re[225] = t8;
+    im[225] = t7;
+    t9 = re[0];
+    t2 = im[0];
+    t6 = re[15];
+    t0 = im[15];
+    t4 = re[30];
+    t5 = im[30];
+    t1 = re[45];
+    t10 = im[45];
+    t11 = t9 + t4;
+    t3 = t2 + t5;
+    t8 = t6 + t1;
+    t7 = t0 + t10;
+    t9 = t9 - t4;
+    t4 = t2 - t5;
+    t2 = t6 - t1;
+    t5 = t0 - t10;
+    t6 = t11 + t8;
+    t1 = t3 + t7;
+    t0 = t9 + t5;
+    t10 = t4 - t2;
+    t11 = t11 - t8;
+    t8 = t3 - t7;
+    t3 = t9 - t5;
+    t7 = t4 + t2;
+    re[0] = t6;
+    im[0] = t1;
+    re[15] = t0;
+    im[15] = t10;
+    re[30] = t11;
+    im[30] = t8;
+    re[45] = t3;
+    im[45] = t7;
+    t9 = re[60];
+    t5 = im[60];
+    t4 = re[75];
+    t2 = im[75];
+    t6 = re[90];
+    t1 = im[90];
+    t0 = re[105];
+    t10 = im[105];
+    t11 = t9 + t6;
+    t8 = t5 + t1;
+    t3 = t4 + t0;
+    t7 = t2 + t10;
+    t9 = t9 - t6;
+    t6 = t5 - t1;
+    t5 = t4 - t0;
+    t1 = t2 - t10;
+    t4 = t11 + t3;
+    t0 = t8 + t7;
+    t2 = t9 + t1;
+    t10 = t6 - t5;
+    t11 = t11 - t3;
+    t3 = t8 - t7;
+    t8 = t9 - t1;
+    t7 = t6 + t5;
+    re[60] = t4;
+    im[60] = t0;
+    re[75] = t2;
+    im[75] = t10;
+    re[90] = t11;
+    im[90] = t3;
+    re[105] = t8;
+    im[105] = t7;
+    t9 = re[120];
+    t1 = im[120];
+    t6 = re[135];
+    t5 = im[135];
+    t4 = re[150];
+    t0 = im[150];
+    t2 = re[165];
+    t10 = im[165];
+    t11 = t9 + t4;
+    t3 = t1 + t0;
+    t8 = t6 + t2;
+    t7 = t5 + t10;
+    t9 = t9 - t4;
+    t4 = t1 - t0;
+    t1 = t6 - t2;
+    t0 = t5 - t10;
+    t6 = t11 + t8;
+    t2 = t3 + t7;
+    t5 = t9 + t0;
+    t10 = t4 - t1;
+    t11 = t11 - t8;
+    t8 = t3 - t7;
+    t3 = t9 - t0;
+    t7 = t4 + t1;
+    re[120] = t6;
+    im[120] = t2;
+    re[135] = t5;
+    im[135] = t10;
+    re[150] = t11;
+    im[150] = t8;
+    re[165] = t3;
+    im[165] = t7;
+    t9 = re[180];
+    t0 = im[180];
+    t4 = re[195];
+    t1 = im[195];
+    t6 = re[210];
+    t2 = im[210];
+    t5 = re[225];
+    t10 = im[225];
+    t11 = t9 + t6;
+    t8 = t0 + t2;
+    t3 = t4 + t5;
+    t7 = t1 + t10;
+    t9 = t9 - t6;
+    t6 = t0 - t2;
+    t0 = t4 - t5;
+    t2 = t1 - t10;
+    t4 = t11 + t3;
+    t5 = t8 + t7;
+    t1 = t9 + t2;
+    t10 = t6 - t0;
+    t11 = t11 - t3;
+    t3 = t8 - t7;
+    t8 = t9 - t2;
+    t7 = t6 + t0;
+    re[180] = t4;
+    im[180] = t5;
+    re[195] = t1;
+    im[195] = t10;
+    re[210] = t11;
+    im[210] = t3;
+    re[225] = t8;
+    im[225] = t7;
+    t9 = X[96];
+    t2 = X[383];
+    t6 = C18 * t9;
+    t0 = C19 * t2;
+    t4 = t6 + t0;
+    t5 = (-C19) * t9;
+    t1 = C18 * t2;
+    t10 = t5 + t1;
+    t11 = X[216];
+    t3 = X[263];
+    t8 = C20 * t11;
+    t7 = C21 * t3;
+    t6 = t8 + t7;
+    t0 = (-C21) * t11;
+    t9 = C20 * t3;
+    t2 = t0 + t9;
+    t5 = X[336];
+    t1 = X[143];
+    t8 = C22 * t5;
+    t7 = C23 * t1;
+    t11 = t8 + t7;
+    t3 = (-C23) * t5;
+    t0 = C22 * t1;
+    t9 = t3 + t0;
+    t8 = X[456];
+    t7 = X[23];
+    t5 = C24 * t8;
+    t1 = C25 * t7;
+    t3 = t5 + t1;
+    t0 = (-C25) * t8;
+    t5 = C24 * t7;
+    t1 = t0 + t5;
+    t8 = t4 + t11;
+    t7 = t10 + t9;
+    t0 = t6 + t3;
+    t5 = t2 + t1;
+    t4 = t4 - t11;
+    t11 = t10 - t9;
+    t10 = t6 - t3;
+    t9 = t2 - t1;
+    t6 = t8 + t0;
+    t3 = t7 + t5;
+    t2 = t4 + t9;
+    t1 = t11 - t10;
+    t8 = t8 - t0;
+    t0 = t7 - t5;
+    t7 = t4 - t9;
+    t5 = t11 + t10;
+    re[48] = t6;
+    im[48] = t3;
+    re[108] = t2;
+    im[108] = t1;
+    re[168] = t8;
+    im[168] = t0;
+    re[228] = t7;
+    im[228] = t5;
+    t4 = X[126];
+    t9 = X[353];
+    t11 = C26 * t4;
+    t10 = C27 * t9;
+    t6 = t11 + t10;
+    t3 = (-C27) * t4;
+    t2 = C26 * t9;
+    t1 = t3 + t2;
+    t8 = X[246];
+    t0 = X[233];
+    t7 = C28 * t8;
+    t5 = C29 * t0;
+    t11 = t7 + t5;
+    t10 = (-C29) * t8;
+    t4 = C28 * t0;
+    t9 = t10 + t4;
+    t3 = X[366];
+    t2 = X[113];
+    t7 = C30 * t3;
+    t5 = C31 * t2;
+    t8 = t7 + t5;
+    t0 = (-C31) * t3;
+    t10 = C30 * t2;
+    t4 = t0 + t10;
+    t7 = X[6];
+    t5 = X[473];
+    t3 = C32 * t7;
+    t2 = C33 * t5;
+    t0 = t3 + t2;
+    t10 = (-C33) * t7;
+    t3 = C32 * t5;
+    t2 = t10 + t3;
+    t7 = t6 + t8;
+    t5 = t1 + t4;
+    t10 = t11 + t0;
+    t3 = t9 + t2;
+    t6 = t6 - t8;
+    t8 = t1 - t4;
+    t1 = t11 - t0;
+    t4 = t9 - t2;
+    t11 = t7 + t10;
+    t0 = t5 + t3;
+    t9 = t6 + t4;
+    t2 = t8 - t1;
+    t7 = t7 - t10;
+    t10 = t5 - t3;
+    t5 = t6 - t4;
+    t3 = t8 + t1;
+    t6 = t9 + t2;
+    t4 = C0 * t6;
+    t8 = t9 * (-C12);
+    t1 = t2 * C13;
+    t6 = t4 - t1;
+    t9 = t4 + t8;
+    t2 = t7 + t10;
+    t1 = t7 - t10;
+    t4 = C2 * t2;
+    t8 = (-C2) * t1;
+    t7 = t5 + t3;
+    t10 = C1 * t7;
+    t2 = t5 * (-C12);
+    t1 = t3 * (-C13);
+    t7 = t10 - t1;
+    t5 = t10 + t2;
+    re[63] = t11;
+    im[63] = t0;
+    re[123] = t6;
+    im[123] = t9;
+    re[183] = t4;
+    im[183] = t8;
+    re[3] = t7;
+    im[3] = t5;
+    t3 = X[156];
+    t1 = X[323];
+    t10 = C34 * t3;
+    t2 = C35 * t1;
+    t11 = t10 + t2;
+    t0 = (-C35) * t3;
+    t6 = C34 * t1;
+    t9 = t0 + t6;
+    t4 = X[276];
+    t8 = X[203];
+    t7 = C36 * t4;
+    t5 = C37 * t8;
+    t10 = t7 + t5;
+    t2 = (-C37) * t4;
+    t3 = C36 * t8;
+    t1 = t2 + t3;
+    t0 = X[396];
+    t6 = X[83];
+    t7 = C38 * t0;
+    t5 = C39 * t6;
+    t4 = t7 + t5;
+    t8 = (-C39) * t0;
+    t2 = C38 * t6;
+    t3 = t8 + t2;
+    t7 = X[36];
+    t5 = X[443];
+    t0 = C40 * t7;
+    t6 = C41 * t5;
+    t8 = t0 + t6;
+    t2 = (-C41) * t7;
+    t0 = C40 * t5;
+    t6 = t2 + t0;
+    t7 = t11 + t4;
+    t5 = t9 + t3;
+    t2 = t10 + t8;
+    t0 = t1 + t6;
+    t11 = t11 - t4;
+    t4 = t9 - t3;
+    t9 = t10 - t8;
+    t3 = t1 - t6;
+    t10 = t7 + t2;
+    t8 = t5 + t0;
+    t1 = t11 + t3;
+    t6 = t4 - t9;
+    t7 = t7 - t2;
+    t2 = t5 - t0;
+    t5 = t11 - t3;
+    t0 = t4 + t9;
+    t11 = t1 + t6;
+    t3 = t1 - t6;
+    t4 = C2 * t11;
+    t9 = (-C2) * t3;
+    t1 = -t7;
+    t6 = t5 - t0;
+    t11 = t5 + t0;
+    t3 = (-C2) * t6;
+    t7 = (-C2) * t11;
+    re[78] = t10;
+    im[78] = t8;
+    re[138] = t4;
+    im[138] = t9;
+    re[198] = t2;
+    im[198] = t1;
+    re[18] = t3;
+    im[18] = t7;
+    t5 = X[186];
+    t0 = X[293];
+    t6 = C42 * t5;
+    t11 = C43 * t0;
+    t10 = t6 + t11;
+    t8 = (-C43) * t5;
+    t4 = C42 * t0;
+    t9 = t8 + t4;
+    t2 = X[306];
+    t1 = X[173];
+    t3 = C44 * t2;
+    t7 = C45 * t1;
+    t6 = t3 + t7;
+    t11 = (-C45) * t2;
+    t5 = C44 * t1;
+    t0 = t11 + t5;
+    t8 = X[426];
+    t4 = X[53];
+    t3 = C46 * t8;
+    t7 = C47 * t4;
+    t2 = t3 + t7;
+    t1 = (-C47) * t8;
+    t11 = C46 * t4;
+    t5 = t1 + t11;
+    t3 = X[66];
+    t7 = X[413];
+    t8 = C48 * t3;
+    t4 = C49 * t7;
+    t1 = t8 + t4;
+    t11 = (-C49) * t3;
+    t8 = C48 * t7;
+    t4 = t11 + t8;
+    t3 = t10 + t2;
+    t7 = t9 + t5;
+    t11 = t6 + t1;
+    t8 = t0 + t4;
+    t10 = t10 - t2;
+    t2 = t9 - t5;
+    t9 = t6 - t1;
+    t5 = t0 - t4;
+    t6 = t3 + t11;
+    t1 = t7 + t8;
+    t0 = t10 + t5;
+    t4 = t2 - t9;
+    t3 = t3 - t11;
+    t11 = t7 - t8;
+    t7 = t10 - t5;
+    t8 = t2 + t9;
+    t10 = t0 + t4;
+    t5 = C1 * t10;
+    t2 = t0 * (-C12);
+    t9 = t4 * (-C13);
+    t10 = t5 - t9;
+    t0 = t5 + t2;
+    t4 = t3 - t11;
+    t9 = t3 + t11;
+    t5 = (-C2) * t4;
+    t2 = (-C2) * t9;
+    t3 = t7 + t8;
+    t11 = (-C0) * t3;
+    t4 = t7 * C12;
+    t9 = t8 * (-C13);
+    t3 = t11 - t9;
+    t7 = t11 + t4;
+    re[93] = t6;
+    im[93] = t1;
+    re[153] = t10;
+    im[153] = t0;
+    re[213] = t5;
+    im[213] = t2;
+    re[33] = t3;
+    im[33] = t7;
+    t8 = re[48];
+    t9 = im[48];
+    t11 = re[63];
+    t4 = im[63];
+    t6 = re[78];
+    t1 = im[78];
+    t10 = re[93];
+    t0 = im[93];
+    t5 = t8 + t6;
+    t2 = t9 + t1;
+    t3 = t11 + t10;
+    t7 = t4 + t0;
+    t8 = t8 - t6;
+    t6 = t9 - t1;
+    t9 = t11 - t10;
+    t1 = t4 - t0;
+    t11 = t5 + t3;
+    t10 = t2 + t7;
+    t4 = t8 + t1;
+    t0 = t6 - t9;
+    t5 = t5 - t3;
+    t3 = t2 - t7;
+    t2 = t8 - t1;
+    t7 = t6 + t9;
+    re[48] = t11;
+    im[48] = t10;
+    re[63] = t4;
+    im[63] = t0;
+    re[78] = t5;
+    im[78] = t3;
+    re[93] = t2;
+    im[93] = t7;
+    t8 = re[108];
+    t1 = im[108];
+    t6 = re[123];
+    t9 = im[123];
+    t11 = re[138];
+    t10 = im[138];
+    t4 = re[153];
+    t0 = im[153];
+    t5 = t8 + t11;
+    t3 = t1 + t10;
+    t2 = t6 + t4;
+    t7 = t9 + t0;
+    t8 = t8 - t11;
+    t11 = t1 - t10;
+    t1 = t6 - t4;
+    t10 = t9 - t0;
+    t6 = t5 + t2;
+    t4 = t3 + t7;
+    t9 = t8 + t10;
+    t0 = t11 - t1;
+    t5 = t5 - t2;
+    t2 = t3 - t7;
+    t3 = t8 - t10;
+    t7 = t11 + t1;
+    re[108] = t6;
+    im[108] = t4;
+    re[123] = t9;
+    im[123] = t0;
+    re[138] = t5;
+    im[138] = t2;
+    re[153] = t3;
+    im[153] = t7;
+    t8 = re[168];
+    t10 = im[168];
+    t11 = re[183];
+    t1 = im[183];
+    t6 = re[198];
+    t4 = im[198];
+    t9 = re[213];
+    t0 = im[213];
+    t5 = t8 + t6;
+    t2 = t10 + t4;
+    t3 = t11 + t9;
+    t7 = t1 + t0;
+    t8 = t8 - t6;
+    t6 = t10 - t4;
+    t10 = t11 - t9;
+    t4 = t1 - t0;
+    t11 = t5 + t3;
+    t9 = t2 + t7;
+    t1 = t8 + t4;
+    t0 = t6 - t10;
+    t5 = t5 - t3;
+    t3 = t2 - t7;
+    t2 = t8 - t4;
+    t7 = t6 + t10;
+    re[168] = t11;
+    im[168] = t9;
+    re[183] = t1;
+    im[183] = t0;
+    re[198] = t5;
+    im[198] = t3;
+    re[213] = t2;
+    im[213] = t7;
+    t8 = re[228];
+    t4 = im[228];
+    t6 = re[3];
+    t10 = im[3];
+    t11 = re[18];
+    t9 = im[18];
+    t1 = re[33];
+    t0 = im[33];
+    t5 = t8 + t11;
+    t3 = t4 + t9;
+    t2 = t6 + t1;
+    t7 = t10 + t0;
+    t8 = t8 - t11;
+    t11 = t4 - t9;
+    t4 = t6 - t1;
+    t9 = t10 - t0;
+    t6 = t5 + t2;
+    t1 = t3 + t7;
+    t10 = t8 + t9;
+    t0 = t11 - t4;
+    t5 = t5 - t2;
+    t2 = t3 - t7;
+    t3 = t8 - t9;
+    t7 = t11 + t4;
+    re[228] = t6;
+    im[228] = t1;
+    re[3] = t10;
+    im[3] = t0;
+    re[18] = t5;
+    im[18] = t2;
+    re[33] = t3;
+    im[33] = t7;
+    t8 = X[192];
+    t9 = X[287];
+    t11 = C50 * t8;
+    t4 = C51 * t9;
+    t6 = t11 + t4;
+    t1 = (-C51) * t8;
+    t10 = C50 * t9;
+    t0 = t1 + t10;
+    t5 = X[312];
+    t2 = X[167];
+    t3 = C52 * t5;
+    t7 = C53 * t2;
+    t11 = t3 + t7;
+    t4 = (-C53) * t5;
+    t8 = C52 * t2;
+    t9 = t4 + t8;
+    t1 = X[432];
+    t10 = X[47];
+    t3 = C54 * t1;
+    t7 = C55 * t10;
+    t5 = t3 + t7;
+    t2 = (-C55) * t1;
+    t4 = C54 * t10;
+    t8 = t2 + t4;
+    t3 = X[72];
+    t7 = X[407];
+    t1 = C56 * t3;
+    t10 = C57 * t7;
+    t2 = t1 + t10;
+    t4 = (-C57) * t3;
+    t1 = C56 * t7;
+    t10 = t4 + t1;
+    t3 = t6 + t5;
+    t7 = t0 + t8;
+    t4 = t11 + t2;
+    t1 = t9 + t10;
+    t6 = t6 - t5;
+    t5 = t0 - t8;
+    t0 = t11 - t2;
+    t8 = t9 - t10;
+    t11 = t3 + t4;
+    t2 = t7 + t1;
+    t9 = t6 + t8;
+    t10 = t5 - t0;
+    t3 = t3 - t4;
+    t4 = t7 - t1;
+    t7 = t6 - t8;
+    t1 = t5 + t0;
+    re[96] = t11;
+    im[96] = t2;
+    re[156] = t9;
+    im[156] = t10;
+    re[216] = t3;
+    im[216] = t4;
+    re[36] = t7;
+    im[36] = t1;
+    t6 = X[222];
+    t8 = X[257];
+    t5 = C58 * t6;
+    t0 = C59 * t8;
+    t11 = t5 + t0;
+    t2 = (-C59) * t6;
+    t9 = C58 * t8;
+    t10 = t2 + t9;
+    t3 = X[342];
+    t4 = X[137];
+    t7 = C60 * t3;
+    t1 = C61 * t4;
+    t5 = t7 + t1;
+    t0 = (-C61) * t3;
+    t6 = C60 * t4;
+    t8 = t0 + t6;
+    t2 = X[462];
+    t9 = X[17];
+    t7 = C62 * t2;
+    t1 = C63 * t9;
+    t3 = t7 + t1;
+    t4 = (-C63) * t2;
+    t0 = C62 * t9;
+    t6 = t4 + t0;
+    t7 = X[102];
+    t1 = X[377];
+    t2 = C64 * t7;
+    t9 = C65 * t1;
+    t4 = t2 + t9;
+    t0 = (-C65) * t7;
+    t2 = C64 * t1;
+    t9 = t0 + t2;
+    t7 = t11 + t3;
+    t1 = t10 + t6;
+    t0 = t5 + t4;
+    t2 = t8 + t9;
+    t11 = t11 - t3;
+    t3 = t10 - t6;
+    t10 = t5 - t4;
+    t6 = t8 - t9;
+    t5 = t7 + t0;
+    t4 = t1 + t2;
+    t8 = t11 + t6;
+    t9 = t3 - t10;
+    t7 = t7 - t0;
+    t0 = t1 - t2;
+    t1 = t11 - t6;
+    t2 = t3 + t10;
+    t11 = t8 + t9;
+    t6 = C0 * t11;
+    t3 = t8 * (-C12);
+    t10 = t9 * C13;
+    t11 = t6 - t10;
+    t8 = t6 + t3;
+    t9 = t7 + t0;
+    t10 = t7 - t0;
+    t6 = C2 * t9;
+    t3 = (-C2) * t10;
+    t7 = t1 + t2;
+    t0 = C1 * t7;
+    t9 = t1 * (-C12);
+    t10 = t2 * (-C13);
+    t7 = t0 - t10;
+    t1 = t0 + t9;
+    re[111] = t5;
+    im[111] = t4;
+    re[171] = t11;
+    im[171] = t8;
+    re[231] = t6;
+    im[231] = t3;
+    re[51] = t7;
+    im[51] = t1;
+    t2 = X[252];
+    t10 = X[227];
+    t0 = C66 * t2;
+    t9 = C67 * t10;
+    t5 = t0 + t9;
+    t4 = (-C67) * t2;
+    t11 = C66 * t10;
+    t8 = t4 + t11;
+    t6 = X[372];
+    t3 = X[107];
+    t7 = C68 * t6;
+    t1 = C69 * t3;
+    t0 = t7 + t1;
+    t9 = (-C69) * t6;
+    t2 = C68 * t3;
+    t10 = t9 + t2;
+    t4 = X[12];
+    t11 = X[467];
+    t7 = C70 * t4;
+    t1 = C71 * t11;
+    t6 = t7 + t1;
+    t3 = (-C71) * t4;
+    t9 = C70 * t11;
+    t2 = t3 + t9;
+    t7 = X[132];
+    t1 = X[347];
+    t4 = C72 * t7;
+    t11 = C73 * t1;
+    t3 = t4 + t11;
+    t9 = (-C73) * t7;
+    t4 = C72 * t1;
+    t11 = t9 + t4;
+    t7 = t5 + t6;
+    t1 = t8 + t2;
+    t9 = t0 + t3;
+    t4 = t10 + t11;
+    t5 = t5 - t6;
+    t6 = t8 - t2;
+    t8 = t0 - t3;
+    t2 = t10 - t11;
+    t0 = t7 + t9;
+    t3 = t1 + t4;
+    t10 = t5 + t2;
+    t11 = t6 - t8;
+    t7 = t7 - t9;
+    t9 = t1 - t4;
+    t1 = t5 - t2;
+    t4 = t6 + t8;
+    t5 = t10 + t11;
+    t2 = t10 - t11;
+    t6 = C2 * t5;
+    t8 = (-C2) * t2;
+    t10 = -t7;
+    t11 = t1 - t4;
+    t5 = t1 + t4;
+    t2 = (-C2) * t11;
+    t7 = (-C2) * t5;
+    re[126] = t0;
+    im[126] = t3;
+    re[186] = t6;
+    im[186] = t8;
+    re[6] = t9;
+    im[6] = t10;
+    re[66] = t2;
+    im[66] = t7;
+    t1 = X[282];
+    t4 = X[197];
+    t11 = C74 * t1;
+    t5 = C75 * t4;
+    t0 = t11 + t5;
+    t3 = (-C75) * t1;
+    t6 = C74 * t4;
+    t8 = t3 + t6;
+    t9 = X[402];
+    t10 = X[77];
+    t2 = C76 * t9;
+    t7 = C77 * t10;
+    t11 = t2 + t7;
+    t5 = (-C77) * t9;
+    t1 = C76 * t10;
+    t4 = t5 + t1;
+    t3 = X[42];
+    t6 = X[437];
+    t2 = C78 * t3;
+    t7 = C79 * t6;
+    t9 = t2 + t7;
+    t10 = (-C79) * t3;
+    t5 = C78 * t6;
+    t1 = t10 + t5;
+    t2 = X[162];
+    t7 = X[317];
+    t3 = C80 * t2;
+    t6 = C81 * t7;
+    t10 = t3 + t6;
+    t5 = (-C81) * t2;
+    t3 = C80 * t7;
+    t6 = t5 + t3;
+    t2 = t0 + t9;
+    t7 = t8 + t1;
+    t5 = t11 + t10;
+    t3 = t4 + t6;
+    t0 = t0 - t9;
+    t9 = t8 - t1;
+    t8 = t11 - t10;
+    t1 = t4 - t6;
+    t11 = t2 + t5;
+    t10 = t7 + t3;
+    t4 = t0 + t1;
+    t6 = t9 - t8;
+    t2 = t2 - t5;
+    t5 = t7 - t3;
+    t7 = t0 - t1;
+    t3 = t9 + t8;
+    t0 = t4 + t6;
+    t1 = C1 * t0;
+    t9 = t4 * (-C12);
+    t8 = t6 * (-C13);
+    t0 = t1 - t8;
+    t4 = t1 + t9;
+    t6 = t2 - t5;
+    t8 = t2 + t5;
+    t1 = (-C2) * t6;
+    t9 = (-C2) * t8;
+    t2 = t7 + t3;
+    t5 = (-C0) * t2;
+    t6 = t7 * C12;
+    t8 = t3 * (-C13);
+    t2 = t5 - t8;
+    t7 = t5 + t6;
+    re[141] = t11;
+    im[141] = t10;
+    re[201] = t0;
+    im[201] = t4;
+    re[21] = t1;
+    im[21] = t9;
+    re[81] = t2;
+    im[81] = t7;
+    t3 = re[96];
+    t8 = im[96];
+    t5 = re[111];
+    t6 = im[111];
+    t11 = re[126];
+    t10 = im[126];
+    t0 = re[141];
+    t4 = im[141];
+    t1 = t3 + t11;
+    t9 = t8 + t10;
+    t2 = t5 + t0;
+    t7 = t6 + t4;
+    t3 = t3 - t11;
+    t11 = t8 - t10;
+    t8 = t5 - t0;
+    t10 = t6 - t4;
+    t5 = t1 + t2;
+    t0 = t9 + t7;
+    t6 = t3 + t10;
+    t4 = t11 - t8;
+    t1 = t1 - t2;
+    t2 = t9 - t7;
+    t9 = t3 - t10;
+    t7 = t11 + t8;
+    re[96] = t5;
+    im[96] = t0;
+    re[111] = t6;
+    im[111] = t4;
+    re[126] = t1;
+    im[126] = t2;
+    re[141] = t9;
+    im[141] = t7;
+    t3 = re[156];
+    t10 = im[156];
+    t11 = re[171];
+    t8 = im[171];
+    t5 = re[186];
+    t0 = im[186];
+    t6 = re[201];
+    t4 = im[201];
+    t1 = t3 + t5;
+    t2 = t10 + t0;
+    t9 = t11 + t6;
+    t7 = t8 + t4;
+    t3 = t3 - t5;
+    t5 = t10 - t0;
+    t10 = t11 - t6;
+    t0 = t8 - t4;
+    t11 = t1 + t9;
+    t6 = t2 + t7;
+    t8 = t3 + t0;
+    t4 = t5 - t10;
+    t1 = t1 - t9;
+    t9 = t2 - t7;
+    t2 = t3 - t0;
+    t7 = t5 + t10;
+    re[156] = t11;
+    im[156] = t6;
+    re[171] = t8;
+    im[171] = t4;
+    re[186] = t1;
+    im[186] = t9;
+    re[201] = t2;
+    im[201] = t7;
+    t3 = re[216];
+    t0 = im[216];
+    t5 = re[231];
+    t10 = im[231];
+    t11 = re[6];
+    t6 = im[6];
+    t8 = re[21];
+    t4 = im[21];
+    t1 = t3 + t11;
+    t9 = t0 + t6;
+    t2 = t5 + t8;
+    t7 = t10 + t4;
+    t3 = t3 - t11;
+    t11 = t0 - t6;
+    t0 = t5 - t8;
+    t6 = t10 - t4;
+    t5 = t1 + t2;
+    t8 = t9 + t7;
+    t10 = t3 + t6;
+    t4 = t11 - t0;
+    t1 = t1 - t2;
+    t2 = t9 - t7;
+    t9 = t3 - t6;
+    t7 = t11 + t0;
+    re[216] = t5;
+    im[216] = t8;
+    re[231] = t10;
+    im[231] = t4;
+    re[6] = t1;
+    im[6] = t2;
+    re[21] = t9;
+    im[21] = t7;
+    t3 = re[36];
+    t6 = im[36];
+    t11 = re[51];
+    t0 = im[51];
+    t5 = re[66];
+    t8 = im[66];
+    t10 = re[81];
+    t4 = im[81];
+    t1 = t3 + t5;
+    t2 = t6 + t8;
+    t9 = t11 + t10;
+    t7 = t0 + t4;
+    t3 = t3 - t5;
+    t5 = t6 - t8;
+    t6 = t11 - t10;
+    t8 = t0 - t4;
+    t11 = t1 + t9;
+    t10 = t2 + t7;
+    t0 = t3 + t8;
+    t4 = t5 - t6;
+    t1 = t1 - t9;
+    t9 = t2 - t7;
+    t2 = t3 - t8;
+    t7 = t5 + t6;
+    re[36] = t11;
+    im[36] = t10;
+    re[51] = t0;
+    im[51] = t4;
+    re[66] = t1;
+    im[66] = t9;
+    re[81] = t2;
+    im[81] = t7;
+    t3 = X[288];
+    t8 = X[191];
+    t5 = C51 * t3;
+    t6 = C50 * t8;
+    t11 = t5 + t6;
+    t10 = (-C50) * t3;
+    t0 = C51 * t8;
+    t4 = t10 + t0;
+    t1 = X[408];
+    t9 = X[71];
+    t2 = C57 * t1;
+    t7 = C56 * t9;
+    t5 = t2 + t7;
+    t6 = (-C56) * t1;
+    t3 = C57 * t9;
+    t8 = t6 + t3;
+    t10 = X[48];
+    t0 = X[431];
+    t2 = C55 * t10;
+    t7 = C54 * t0;
+    t1 = t2 + t7;
+    t9 = (-C54) * t10;
+    t6 = C55 * t0;
+    t3 = t9 + t6;
+    t2 = X[168];
+    t7 = X[311];
+    t10 = C53 * t2;
+    t0 = C52 * t7;
+    t9 = t10 + t0;
+    t6 = (-C52) * t2;
+    t10 = C53 * t7;
+    t0 = t6 + t10;
+    t2 = t11 + t1;
+    t7 = t4 + t3;
+    t6 = t5 + t9;
+    t10 = t8 + t0;
+    t11 = t11 - t1;
+    t1 = t4 - t3;
+    t4 = t5 - t9;
+    t3 = t8 - t0;
+    t5 = t2 + t6;
+    t9 = t7 + t10;
+    t8 = t11 + t3;
+    t0 = t1 - t4;
+    t2 = t2 - t6;
+    t6 = t7 - t10;
+    t7 = t11 - t3;
+    t10 = t1 + t4;
+    re[144] = t5;
+    im[144] = t9;
+    re[204] = t8;
+    im[204] = t0;
+    re[24] = t2;
+    im[24] = t6;
+    re[84] = t7;
+    im[84] = t10;
+    t11 = X[318];
+    t3 = X[161];
+    t1 = C81 * t11;
+    t4 = C80 * t3;
+    t5 = t1 + t4;
+    t9 = (-C80) * t11;
+    t8 = C81 * t3;
+    t0 = t9 + t8;
+    t2 = X[438];
+    t6 = X[41];
+    t7 = C79 * t2;
+    t10 = C78 * t6;
+    t1 = t7 + t10;
+    t4 = (-C78) * t2;
+    t11 = C79 * t6;
+    t3 = t4 + t11;
+    t9 = X[78];
+    t8 = X[401];
+    t7 = C77 * t9;
+    t10 = C76 * t8;
+    t2 = t7 + t10;
+    t6 = (-C76) * t9;
+    t4 = C77 * t8;
+    t11 = t6 + t4;
+    t7 = X[198];
+    t10 = X[281];
+    t9 = C75 * t7;
+    t8 = C74 * t10;
+    t6 = t9 + t8;
+    t4 = (-C74) * t7;
+    t9 = C75 * t10;
+    t8 = t4 + t9;
+    t7 = t5 + t2;
+    t10 = t0 + t11;
+    t4 = t1 + t6;
+    t9 = t3 + t8;
+    t5 = t5 - t2;
+    t2 = t0 - t11;
+    t0 = t1 - t6;
+    t11 = t3 - t8;
+    t1 = t7 + t4;
+    t6 = t10 + t9;
+    t3 = t5 + t11;
+    t8 = t2 - t0;
+    t7 = t7 - t4;
+    t4 = t10 - t9;
+    t10 = t5 - t11;
+    t9 = t2 + t0;
+    t5 = t3 + t8;
+    t11 = C0 * t5;
+    t2 = t3 * (-C12);
+    t0 = t8 * C13;
+    t5 = t11 - t0;
+    t3 = t11 + t2;
+    t8 = t7 + t4;
+    t0 = t7 - t4;
+    t11 = C2 * t8;
+    t2 = (-C2) * t0;
+    t7 = t10 + t9;
+    t4 = C1 * t7;
+    t8 = t10 * (-C12);
+    t0 = t9 * (-C13);
+    t7 = t4 - t0;
+    t10 = t4 + t8;
+    re[159] = t1;
+    im[159] = t6;
+    re[219] = t5;
+    im[219] = t3;
+    re[39] = t11;
+    im[39] = t2;
+    re[99] = t7;
+    im[99] = t10;
+    t9 = X[348];
+    t0 = X[131];
+    t4 = C73 * t9;
+    t8 = C72 * t0;
+    t1 = t4 + t8;
+    t6 = (-C72) * t9;
+    t5 = C73 * t0;
+    t3 = t6 + t5;
+    t11 = X[468];
+    t2 = X[11];
+    t7 = C71 * t11;
+    t10 = C70 * t2;
+    t4 = t7 + t10;
+    t8 = (-C70) * t11;
+    t9 = C71 * t2;
+    t0 = t8 + t9;
+    t6 = X[108];
+    t5 = X[371];
+    t7 = C69 * t6;
+    t10 = C68 * t5;
+    t11 = t7 + t10;
+    t2 = (-C68) * t6;
+    t8 = C69 * t5;
+    t9 = t2 + t8;
+    t7 = X[228];
+    t10 = X[251];
+    t6 = C67 * t7;
+    t5 = C66 * t10;
+    t2 = t6 + t5;
+    t8 = (-C66) * t7;
+    t6 = C67 * t10;
+    t5 = t8 + t6;
+    t7 = t1 + t11;
+    t10 = t3 + t9;
+    t8 = t4 + t2;
+    t6 = t0 + t5;
+    t1 = t1 - t11;
+    t11 = t3 - t9;
+    t3 = t4 - t2;
+    t9 = t0 - t5;
+    t4 = t7 + t8;
+    t2 = t10 + t6;
+    t0 = t1 + t9;
+    t5 = t11 - t3;
+    t7 = t7 - t8;
+    t8 = t10 - t6;
+    t10 = t1 - t9;
+    t6 = t11 + t3;
+    t1 = t0 + t5;
+    t9 = t0 - t5;
+    t11 = C2 * t1;
+    t3 = (-C2) * t9;
+    t0 = -t7;
+    t5 = t10 - t6;
+    t1 = t10 + t6;
+    t9 = (-C2) * t5;
+    t7 = (-C2) * t1;
+    re[174] = t4;
+    im[174] = t2;
+    re[234] = t11;
+    im[234] = t3;
+    re[54] = t8;
+    im[54] = t0;
+    re[114] = t9;
+    im[114] = t7;
+    t10 = X[378];
+    t6 = X[101];
+    t5 = C65 * t10;
+    t1 = C64 * t6;
+    t4 = t5 + t1;
+    t2 = (-C64) * t10;
+    t11 = C65 * t6;
+    t3 = t2 + t11;
+    t8 = X[18];
+    t0 = X[461];
+    t9 = C63 * t8;
+    t7 = C62 * t0;
+    t5 = t9 + t7;
+    t1 = (-C62) * t8;
+    t10 = C63 * t0;
+    t6 = t1 + t10;
+    t2 = X[138];
+    t11 = X[341];
+    t9 = C61 * t2;
+    t7 = C60 * t11;
+    t8 = t9 + t7;
+    t0 = (-C60) * t2;
+    t1 = C61 * t11;
+    t10 = t0 + t1;
+    t9 = X[258];
+    t7 = X[221];
+    t2 = C59 * t9;
+    t11 = C58 * t7;
+    t0 = t2 + t11;
+    t1 = (-C58) * t9;
+    t2 = C59 * t7;
+    t11 = t1 + t2;
+    t9 = t4 + t8;
+    t7 = t3 + t10;
+    t1 = t5 + t0;
+    t2 = t6 + t11;
+    t4 = t4 - t8;
+    t8 = t3 - t10;
+    t3 = t5 - t0;
+    t10 = t6 - t11;
+    t5 = t9 + t1;
+    t0 = t7 + t2;
+    t6 = t4 + t10;
+    t11 = t8 - t3;
+    t9 = t9 - t1;
+    t1 = t7 - t2;
+    t7 = t4 - t10;
+    t2 = t8 + t3;
+    t4 = t6 + t11;
+    t10 = C1 * t4;
+    t8 = t6 * (-C12);
+    t3 = t11 * (-C13);
+    t4 = t10 - t3;
+    t6 = t10 + t8;
+    t11 = t9 - t1;
+    t3 = t9 + t1;
+    t10 = (-C2) * t11;
+    t8 = (-C2) * t3;
+    t9 = t7 + t2;
+    t1 = (-C0) * t9;
+    t11 = t7 * C12;
+    t3 = t2 * (-C13);
+    t9 = t1 - t3;
+    t7 = t1 + t11;
+    re[189] = t5;
+    im[189] = t0;
+    re[9] = t4;
+    im[9] = t6;
+    re[69] = t10;
+    im[69] = t8;
+    re[129] = t9;
+    im[129] = t7;
+    t2 = re[144];
+    t3 = im[144];
+    t1 = re[159];
+    t11 = im[159];
+    t5 = re[174];
+    t0 = im[174];
+    t4 = re[189];
+    t6 = im[189];
+    t10 = t2 + t5;
+    t8 = t3 + t0;
+    t9 = t1 + t4;
+    t7 = t11 + t6;
+    t2 = t2 - t5;
+    t5 = t3 - t0;
+    t3 = t1 - t4;
+    t0 = t11 - t6;
+    t1 = t10 + t9;
+    t4 = t8 + t7;
+    t11 = t2 + t0;
+    t6 = t5 - t3;
+    t10 = t10 - t9;
+    t9 = t8 - t7;
+    t8 = t2 - t0;
+    t7 = t5 + t3;
+    re[144] = t1;
+    im[144] = t4;
+    re[159] = t11;
+    im[159] = t6;
+    re[174] = t10;
+    im[174] = t9;
+    re[189] = t8;
+    im[189] = t7;
+    t2 = re[204];
+    t0 = im[204];
+    t5 = re[219];
+    t3 = im[219];
+    t1 = re[234];
+    t4 = im[234];
+    t11 = re[9];
+    t6 = im[9];
+    t10 = t2 + t1;
+    t9 = t0 + t4;
+    t8 = t5 + t11;
+    t7 = t3 + t6;
+    t2 = t2 - t1;
+    t1 = t0 - t4;
+    t0 = t5 - t11;
+    t4 = t3 - t6;
+    t5 = t10 + t8;
+    t11 = t9 + t7;
+    t3 = t2 + t4;
+    t6 = t1 - t0;
+    t10 = t10 - t8;
+    t8 = t9 - t7;
+    t9 = t2 - t4;
+    t7 = t1 + t0;
+    re[204] = t5;
+    im[204] = t11;
+    re[219] = t3;
+    im[219] = t6;
+    re[234] = t10;
+    im[234] = t8;
+    re[9] = t9;
+    im[9] = t7;
+    t2 = re[24];
+    t4 = im[24];
+    t1 = re[39];
+    t0 = im[39];
+    t5 = re[54];
+    t11 = im[54];
+    t3 = re[69];
+    t6 = im[69];
+    t10 = t2 + t5;
+    t8 = t4 + t11;
+    t9 = t1 + t3;
+    t7 = t0 + t6;
+    t2 = t2 - t5;
+    t5 = t4 - t11;
+    t4 = t1 - t3;
+    t11 = t0 - t6;
+    t1 = t10 + t9;
+    t3 = t8 + t7;
+    t0 = t2 + t11;
+    t6 = t5 - t4;
+    t10 = t10 - t9;
+    t9 = t8 - t7;
+    t8 = t2 - t11;
+    t7 = t5 + t4;
+    re[24] = t1;
+    im[24] = t3;
+    re[39] = t0;
+    im[39] = t6;
+    re[54] = t10;
+    im[54] = t9;
+    re[69] = t8;
+    im[69] = t7;
+    t2 = re[84];
+    t11 = im[84];
+    t5 = re[99];
+    t4 = im[99];
+    t1 = re[114];
+    t3 = im[114];
+    t0 = re[129];
+    t6 = im[129];
+    t10 = t2 + t1;
+    t9 = t11 + t3;
+    t8 = t5 + t0;
+    t7 = t4 + t6;
+    t2 = t2 - t1;
+    t1 = t11 - t3;
+    t11 = t5 - t0;
+    t3 = t4 - t6;
+    t5 = t10 + t8;
+    t0 = t9 + t7;
+    t4 = t2 + t3;
+    t6 = t1 - t11;
+    t10 = t10 - t8;
+    t8 = t9 - t7;
+    t9 = t2 - t3;
+    t7 = t1 + t11;
+    re[84] = t5;
+    im[84] = t0;
+    re[99] = t4;
+    im[99] = t6;
+    re[114] = t10;
+    im[114] = t8;
+    re[129] = t9;
+    im[129] = t7;
+    t2 = X[384];
+    t3 = X[95];
+    t1 = C19 * t2;
+    t11 = C18 * t3;
+    t5 = t1 + t11;
+    t0 = (-C18) * t2;
+    t4 = C19 * t3;
+    t6 = t0 + t4;
+    t10 = X[24];
+    t8 = X[455];
+    t9 = C25 * t10;
+    t7 = C24 * t8;
+    t1 = t9 + t7;
+    t11 = (-C24) * t10;
+    t2 = C25 * t8;
+    t3 = t11 + t2;
+    t0 = X[144];
+    t4 = X[335];
+    t9 = C23 * t0;
+    t7 = C22 * t4;
+    t10 = t9 + t7;
+    t8 = (-C22) * t0;
+    t11 = C23 * t4;
+    t2 = t8 + t11;
+    t9 = X[264];
+    t7 = X[215];
+    t0 = C21 * t9;
+    t4 = C20 * t7;
+    t8 = t0 + t4;
+    t11 = (-C20) * t9;
+    t0 = C21 * t7;
+    t4 = t11 + t0;
+    t9 = t5 + t10;
+    t7 = t6 + t2;
+    t11 = t1 + t8;
+    t0 = t3 + t4;
+    t5 = t5 - t10;
+    t10 = t6 - t2;
+    t6 = t1 - t8;
+    t2 = t3 - t4;
+    t1 = t9 + t11;
+    t8 = t7 + t0;
+    t3 = t5 + t2;
+    t4 = t10 - t6;
+    t9 = t9 - t11;
+    t11 = t7 - t0;
+    t7 = t5 - t2;
+    t0 = t10 + t6;
+    re[192] = t1;
+    im[192] = t8;
+    re[12] = t3;
+    im[12] = t4;
+    re[72] = t9;
+    im[72] = t11;
+    re[132] = t7;
+    im[132] = t0;
+    t5 = X[414];
+    t2 = X[65];
+    t10 = C49 * t5;
+    t6 = C48 * t2;
+    t1 = t10 + t6;
+    t8 = (-C48) * t5;
+    t3 = C49 * t2;
+    t4 = t8 + t3;
+    t9 = X[54];
+    t11 = X[425];
+    t7 = C47 * t9;
+    t0 = C46 * t11;
+    t10 = t7 + t0;
+    t6 = (-C46) * t9;
+    t5 = C47 * t11;
+    t2 = t6 + t5;
+    t8 = X[174];
+    t3 = X[305];
+    t7 = C45 * t8;
+    t0 = C44 * t3;
+    t9 = t7 + t0;
+    t11 = (-C44) * t8;
+    t6 = C45 * t3;
+    t5 = t11 + t6;
+    t7 = X[294];
+    t0 = X[185];
+    t8 = C43 * t7;
+    t3 = C42 * t0;
+    t11 = t8 + t3;
+    t6 = (-C42) * t7;
+    t8 = C43 * t0;
+    t3 = t6 + t8;
+    t7 = t1 + t9;
+    t0 = t4 + t5;
+    t6 = t10 + t11;
+    t8 = t2 + t3;
+    t1 = t1 - t9;
+    t9 = t4 - t5;
+    t4 = t10 - t11;
+    t5 = t2 - t3;
+    t10 = t7 + t6;
+    t11 = t0 + t8;
+    t2 = t1 + t5;
+    t3 = t9 - t4;
+    t7 = t7 - t6;
+    t6 = t0 - t8;
+    t0 = t1 - t5;
+    t8 = t9 + t4;
+    t1 = t2 + t3;
+    t5 = C0 * t1;
+    t9 = t2 * (-C12);
+    t4 = t3 * C13;
+    t1 = t5 - t4;
+    t2 = t5 + t9;
+    t3 = t7 + t6;
+    t4 = t7 - t6;
+    t5 = C2 * t3;
+    t9 = (-C2) * t4;
+    t7 = t0 + t8;
+    t6 = C1 * t7;
+    t3 = t0 * (-C12);
+    t4 = t8 * (-C13);
+    t7 = t6 - t4;
+    t0 = t6 + t3;
+    re[207] = t10;
+    im[207] = t11;
+    re[27] = t1;
+    im[27] = t2;
+    re[87] = t5;
+    im[87] = t9;
+    re[147] = t7;
+    im[147] = t0;
+    t8 = X[444];
+    t4 = X[35];
+    t6 = C41 * t8;
+    t3 = C40 * t4;
+    t10 = t6 + t3;
+    t11 = (-C40) * t8;
+    t1 = C41 * t4;
+    t2 = t11 + t1;
+    t5 = X[84];
+    t9 = X[395];
+    t7 = C39 * t5;
+    t0 = C38 * t9;
+    t6 = t7 + t0;
+    t3 = (-C38) * t5;
+    t8 = C39 * t9;
+    t4 = t3 + t8;
+    t11 = X[204];
+    t1 = X[275];
+    t7 = C37 * t11;
+    t0 = C36 * t1;
+    t5 = t7 + t0;
+    t9 = (-C36) * t11;
+    t3 = C37 * t1;
+    t8 = t9 + t3;
+    t7 = X[324];
+    t0 = X[155];
+    t11 = C35 * t7;
+    t1 = C34 * t0;
+    t9 = t11 + t1;
+    t3 = (-C34) * t7;
+    t11 = C35 * t0;
+    t1 = t3 + t11;
+    t7 = t10 + t5;
+    t0 = t2 + t8;
+    t3 = t6 + t9;
+    t11 = t4 + t1;
+    t10 = t10 - t5;
+    t5 = t2 - t8;
+    t2 = t6 - t9;
+    t8 = t4 - t1;
+    t6 = t7 + t3;
+    t9 = t0 + t11;
+    t4 = t10 + t8;
+    t1 = t5 - t2;
+    t7 = t7 - t3;
+    t3 = t0 - t11;
+    t0 = t10 - t8;
+    t11 = t5 + t2;
+    t10 = t4 + t1;
+    t8 = t4 - t1;
+    t5 = C2 * t10;
+    t2 = (-C2) * t8;
+    t4 = -t7;
+    t1 = t0 - t11;
+    t10 = t0 + t11;
+    t8 = (-C2) * t1;
+    t7 = (-C2) * t10;
+    re[222] = t6;
+    im[222] = t9;
+    re[42] = t5;
+    im[42] = t2;
+    re[102] = t3;
+    im[102] = t4;
+    re[162] = t8;
+    im[162] = t7;
+    t0 = X[474];
+    t11 = X[5];
+    t1 = C33 * t0;
+    t10 = C32 * t11;
+    t6 = t1 + t10;
+    t9 = (-C32) * t0;
+    t5 = C33 * t11;
+    t2 = t9 + t5;
+    t3 = X[114];
+    t4 = X[365];
+    t8 = C31 * t3;
+    t7 = C30 * t4;
+    t1 = t8 + t7;
+    t10 = (-C30) * t3;
+    t0 = C31 * t4;
+    t11 = t10 + t0;
+    t9 = X[234];
+    t5 = X[245];
+    t8 = C29 * t9;
+    t7 = C28 * t5;
+    t3 = t8 + t7;
+    t4 = (-C28) * t9;
+    t10 = C29 * t5;
+    t0 = t4 + t10;
+    t8 = X[354];
+    t7 = X[125];
+    t9 = C27 * t8;
+    t5 = C26 * t7;
+    t4 = t9 + t5;
+    t10 = (-C26) * t8;
+    t9 = C27 * t7;
+    t5 = t10 + t9;
+    t8 = t6 + t3;
+    t7 = t2 + t0;
+    t10 = t1 + t4;
+    t9 = t11 + t5;
+    t6 = t6 - t3;
+    t3 = t2 - t0;
+    t2 = t1 - t4;
+    t0 = t11 - t5;
+    t1 = t8 + t10;
+    t4 = t7 + t9;
+    t11 = t6 + t0;
+    t5 = t3 - t2;
+    t8 = t8 - t10;
+    t10 = t7 - t9;
+    t7 = t6 - t0;
+    t9 = t3 + t2;
+    t6 = t11 + t5;
+    t0 = C1 * t6;
+    t3 = t11 * (-C12);
+    t2 = t5 * (-C13);
+    t6 = t0 - t2;
+    t11 = t0 + t3;
+    t5 = t8 - t10;
+    t2 = t8 + t10;
+    t0 = (-C2) * t5;
+    t3 = (-C2) * t2;
+    t8 = t7 + t9;
+    t10 = (-C0) * t8;
+    t5 = t7 * C12;
+    t2 = t9 * (-C13);
+    t8 = t10 - t2;
+    t7 = t10 + t5;
+    re[237] = t1;
+    im[237] = t4;
+    re[57] = t6;
+    im[57] = t11;
+    re[117] = t0;
+    im[117] = t3;
+    re[177] = t8;
+    im[177] = t7;
+    t9 = re[192];
+    t2 = im[192];
+    t10 = re[207];
+    t5 = im[207];
+    t1 = re[222];
+    t4 = im[222];
+    t6 = re[237];
+    t11 = im[237];
+    t0 = t9 + t1;
+    t3 = t2 + t4;
+    t8 = t10 + t6;
+    t7 = t5 + t11;
+    t9 = t9 - t1;
+    t1 = t2 - t4;
+    t2 = t10 - t6;
+    t4 = t5 - t11;
+    t10 = t0 + t8;
+    t6 = t3 + t7;
+    t5 = t9 + t4;
+    t11 = t1 - t2;
+    t0 = t0 - t8;
+    t8 = t3 - t7;
+    t3 = t9 - t4;
+    t7 = t1 + t2;
+    re[192] = t10;
+    im[192] = t6;
+    re[207] = t5;
+    im[207] = t11;
+    re[222] = t0;
+    im[222] = t8;
+    re[237] = t3;
+    im[237] = t7;
+    t9 = re[12];
+    t4 = im[12];
+    t1 = re[27];
+    t2 = im[27];
+    t10 = re[42];
+    t6 = im[42];
+    t5 = re[57];
+    t11 = im[57];
+    t0 = t9 + t10;
+    t8 = t4 + t6;
+    t3 = t1 + t5;
+    t7 = t2 + t11;
+    t9 = t9 - t10;
+    t10 = t4 - t6;
+    t4 = t1 - t5;
+    t6 = t2 - t11;
+    t1 = t0 + t3;
+    t5 = t8 + t7;
+    t2 = t9 + t6;
+    t11 = t10 - t4;
+    t0 = t0 - t3;
+    t3 = t8 - t7;
+    t8 = t9 - t6;
+    t7 = t10 + t4;
+    re[12] = t1;
+    im[12] = t5;
+    re[27] = t2;
+    im[27] = t11;
+    re[42] = t0;
+    im[42] = t3;
+    re[57] = t8;
+    im[57] = t7;
+    t9 = re[72];
+    t6 = im[72];
+    t10 = re[87];
+    t4 = im[87];
+    t1 = re[102];
+    t5 = im[102];
+    t2 = re[117];
+    t11 = im[117];
+    t0 = t9 + t1;
+    t3 = t6 + t5;
+    t8 = t10 + t2;
+    t7 = t4 + t11;
+    t9 = t9 - t1;
+    t1 = t6 - t5;
+    t6 = t10 - t2;
+    t5 = t4 - t11;
+    t10 = t0 + t8;
+    t2 = t3 + t7;
+    t4 = t9 + t5;
+    t11 = t1 - t6;
+    t0 = t0 - t8;
+    t8 = t3 - t7;
+    t3 = t9 - t5;
+    t7 = t1 + t6;
+    re[72] = t10;
+    im[72] = t2;
+    re[87] = t4;
+    im[87] = t11;
+    re[102] = t0;
+    im[102] = t8;
+    re[117] = t3;
+    im[117] = t7;
+    t9 = re[132];
+    t5 = im[132];
+    t1 = re[147];
+    t6 = im[147];
+    t10 = re[162];
+    t2 = im[162];
+    t4 = re[177];
+    t11 = im[177];
+    t0 = t9 + t10;
+    t8 = t5 + t2;
+    t3 = t1 + t4;
+    t7 = t6 + t11;
+    t9 = t9 - t10;
+    t10 = t5 - t2;
+    t5 = t1 - t4;
+    t2 = t6 - t11;
+    t1 = t0 + t3;
+    t4 = t8 + t7;
+    t6 = t9 + t2;
+    t11 = t10 - t5;
+    t0 = t0 - t3;
+    t3 = t8 - t7;
+    t8 = t9 - t2;
+    t7 = t10 + t5;
+    re[132] = t1;
+    im[132] = t4;
+    re[147] = t6;
+    im[147] = t11;
+    re[162] = t0;
+    im[162] = t3;
+    re[177] = t8;
+    im[177] = t7;
+}
+
+/**
+ *  Part 2 of ApplyWindowedIMDCT_W10_480().
+ * 
+ *  @param {Number[]} X 
+ *    - The input block (480 points).
+ *  @param {Number[]} y 
+ *    - The array that would contain the output block (960 points).
+ *  @param {Number[]} re 
+ *    - The scratch buffer (real part, 240 points).
+ *  @param {Number[]} im 
+ *    - The scratch buffer (imaginary part, 240 points).
+ */
+function ApplyWindowedIMDCT_W10_480_Part2(X, y, re, im) {
+    let t0, t1, t10, t11, t12, t13, t14, t2, t3, t4, t5, t6, t7, t8, t9;
+    const C0 = 0.5590169943749475;
+    const C1 = 0.25;
+    const C2 = 0.9510565162951535;
+    const C3 = 0.5877852522924731;
+    t9 = re[0];
+    t2 = im[0];
+    t10 = re[48];
+    t5 = im[48];
+    t1 = re[96];
+    t4 = im[96];
+    t6 = re[144];
+    t11 = im[144];
+    t0 = re[192];
+    t3 = im[192];
+    t8 = t10 + t0;
+    t7 = t5 + t3;
+    t12 = t1 + t6;
+    t13 = t4 + t11;
+    t10 = t10 - t0;
+    t0 = t5 - t3;
+    t5 = t1 - t6;
+    t3 = t4 - t11;
+    t1 = t8 + t12;
+    t6 = t7 + t13;
+    t4 = t8 - t12;
+    t11 = C0 * t4;
+    t8 = t7 - t13;
+    t12 = C0 * t8;
+    t4 = C1 * t1;
+    t7 = t9 - t4;
+    t13 = C1 * t6;
+    t8 = t2 - t13;
+    t4 = t7 + t11;
+    t13 = t8 + t12;
+    t7 = t7 - t11;
+    t11 = t8 - t12;
+    t8 = C2 * t10;
+    t12 = C3 * t5;
+    t8 = t8 + t12;
+    t12 = C2 * t0;
+    t14 = C3 * t3;
+    t12 = t12 + t14;
+    t14 = C3 * t10;
+    t10 = C2 * t5;
+    t5 = t14 - t10;
+    t14 = C3 * t0;
+    t10 = C2 * t3;
+    t0 = t14 - t10;
+    t3 = t9 + t1;
+    t14 = t2 + t6;
+    t10 = t4 + t12;
+    t9 = t13 - t8;
+    t1 = t7 + t0;
+    t2 = t11 - t5;
+    t6 = t7 - t0;
+    t7 = t11 + t5;
+    t0 = t4 - t12;
+    t11 = t13 + t8;
+    re[0] = t3;
+    im[0] = t14;
+    re[48] = t10;
+    im[48] = t9;
+    re[96] = t1;
+    im[96] = t2;
+    re[144] = t6;
+    im[144] = t7;
+    re[192] = t0;
+    im[192] = t11;
+    t5 = re[60];
+    t4 = im[60];
+    t12 = re[108];
+    t13 = im[108];
+    t8 = re[156];
+    t3 = im[156];
+    t14 = re[204];
+    t10 = im[204];
+    t9 = re[12];
+    t1 = im[12];
+    t2 = t12 + t9;
+    t6 = t13 + t1;
+    t7 = t8 + t14;
+    t0 = t3 + t10;
+    t11 = t12 - t9;
+    t12 = t13 - t1;
+    t9 = t8 - t14;
+    t13 = t3 - t10;
+    t1 = t2 + t7;
+    t8 = t6 + t0;
+    t14 = t2 - t7;
+    t3 = C0 * t14;
+    t10 = t6 - t0;
+    t2 = C0 * t10;
+    t7 = C1 * t1;
+    t14 = t5 - t7;
+    t6 = C1 * t8;
+    t0 = t4 - t6;
+    t10 = t14 + t3;
+    t7 = t0 + t2;
+    t6 = t14 - t3;
+    t14 = t0 - t2;
+    t3 = C2 * t11;
+    t0 = C3 * t9;
+    t2 = t3 + t0;
+    t3 = C2 * t12;
+    t0 = C3 * t13;
+    t3 = t3 + t0;
+    t0 = C3 * t11;
+    t11 = C2 * t9;
+    t9 = t0 - t11;
+    t0 = C3 * t12;
+    t11 = C2 * t13;
+    t12 = t0 - t11;
+    t13 = t5 + t1;
+    t0 = t4 + t8;
+    t11 = t10 + t3;
+    t5 = t7 - t2;
+    t1 = t6 + t12;
+    t4 = t14 - t9;
+    t8 = t6 - t12;
+    t6 = t14 + t9;
+    t12 = t10 - t3;
+    t14 = t7 + t2;
+    re[60] = t13;
+    im[60] = t0;
+    re[108] = t11;
+    im[108] = t5;
+    re[156] = t1;
+    im[156] = t4;
+    re[204] = t8;
+    im[204] = t6;
+    re[12] = t12;
+    im[12] = t14;
+    t9 = re[120];
+    t10 = im[120];
+    t3 = re[168];
+    t7 = im[168];
+    t2 = re[216];
+    t13 = im[216];
+    t0 = re[24];
+    t11 = im[24];
+    t5 = re[72];
+    t1 = im[72];
+    t4 = t3 + t5;
+    t8 = t7 + t1;
+    t6 = t2 + t0;
+    t12 = t13 + t11;
+    t14 = t3 - t5;
+    t3 = t7 - t1;
+    t5 = t2 - t0;
+    t7 = t13 - t11;
+    t1 = t4 + t6;
+    t2 = t8 + t12;
+    t0 = t4 - t6;
+    t13 = C0 * t0;
+    t11 = t8 - t12;
+    t4 = C0 * t11;
+    t6 = C1 * t1;
+    t0 = t9 - t6;
+    t8 = C1 * t2;
+    t12 = t10 - t8;
+    t11 = t0 + t13;
+    t6 = t12 + t4;
+    t8 = t0 - t13;
+    t0 = t12 - t4;
+    t13 = C2 * t14;
+    t12 = C3 * t5;
+    t4 = t13 + t12;
+    t13 = C2 * t3;
+    t12 = C3 * t7;
+    t13 = t13 + t12;
+    t12 = C3 * t14;
+    t14 = C2 * t5;
+    t5 = t12 - t14;
+    t12 = C3 * t3;
+    t14 = C2 * t7;
+    t3 = t12 - t14;
+    t7 = t9 + t1;
+    t12 = t10 + t2;
+    t14 = t11 + t13;
+    t9 = t6 - t4;
+    t1 = t8 + t3;
+    t10 = t0 - t5;
+    t2 = t8 - t3;
+    t8 = t0 + t5;
+    t3 = t11 - t13;
+    t0 = t6 + t4;
+    re[120] = t7;
+    im[120] = t12;
+    re[168] = t14;
+    im[168] = t9;
+    re[216] = t1;
+    im[216] = t10;
+    re[24] = t2;
+    im[24] = t8;
+    re[72] = t3;
+    im[72] = t0;
+    t5 = re[180];
+    t11 = im[180];
+    t13 = re[228];
+    t6 = im[228];
+    t4 = re[36];
+    t7 = im[36];
+    t12 = re[84];
+    t14 = im[84];
+    t9 = re[132];
+    t1 = im[132];
+    t10 = t13 + t9;
+    t2 = t6 + t1;
+    t8 = t4 + t12;
+    t3 = t7 + t14;
+    t0 = t13 - t9;
+    t13 = t6 - t1;
+    t9 = t4 - t12;
+    t6 = t7 - t14;
+    t1 = t10 + t8;
+    t4 = t2 + t3;
+    t12 = t10 - t8;
+    t7 = C0 * t12;
+    t14 = t2 - t3;
+    t10 = C0 * t14;
+    t8 = C1 * t1;
+    t12 = t5 - t8;
+    t2 = C1 * t4;
+    t3 = t11 - t2;
+    t14 = t12 + t7;
+    t8 = t3 + t10;
+    t2 = t12 - t7;
+    t12 = t3 - t10;
+    t7 = C2 * t0;
+    t3 = C3 * t9;
+    t10 = t7 + t3;
+    t7 = C2 * t13;
+    t3 = C3 * t6;
+    t7 = t7 + t3;
+    t3 = C3 * t0;
+    t0 = C2 * t9;
+    t9 = t3 - t0;
+    t3 = C3 * t13;
+    t0 = C2 * t6;
+    t13 = t3 - t0;
+    t6 = t5 + t1;
+    t3 = t11 + t4;
+    t0 = t14 + t7;
+    t5 = t8 - t10;
+    t1 = t2 + t13;
+    t11 = t12 - t9;
+    t4 = t2 - t13;
+    t2 = t12 + t9;
+    t13 = t14 - t7;
+    t12 = t8 + t10;
+    re[180] = t6;
+    im[180] = t3;
+    re[228] = t0;
+    im[228] = t5;
+    re[36] = t1;
+    im[36] = t11;
+    re[84] = t4;
+    im[84] = t2;
+    re[132] = t13;
+    im[132] = t12;
+    t9 = re[15];
+    t14 = im[15];
+    t7 = re[63];
+    t8 = im[63];
+    t10 = re[111];
+    t6 = im[111];
+    t3 = re[159];
+    t0 = im[159];
+    t5 = re[207];
+    t1 = im[207];
+    t11 = t7 + t5;
+    t4 = t8 + t1;
+    t2 = t10 + t3;
+    t13 = t6 + t0;
+    t12 = t7 - t5;
+    t7 = t8 - t1;
+    t5 = t10 - t3;
+    t8 = t6 - t0;
+    t1 = t11 + t2;
+    t10 = t4 + t13;
+    t3 = t11 - t2;
+    t6 = C0 * t3;
+    t0 = t4 - t13;
+    t11 = C0 * t0;
+    t2 = C1 * t1;
+    t3 = t9 - t2;
+    t4 = C1 * t10;
+    t13 = t14 - t4;
+    t0 = t3 + t6;
+    t2 = t13 + t11;
+    t4 = t3 - t6;
+    t3 = t13 - t11;
+    t6 = C2 * t12;
+    t13 = C3 * t5;
+    t11 = t6 + t13;
+    t6 = C2 * t7;
+    t13 = C3 * t8;
+    t6 = t6 + t13;
+    t13 = C3 * t12;
+    t12 = C2 * t5;
+    t5 = t13 - t12;
+    t13 = C3 * t7;
+    t12 = C2 * t8;
+    t7 = t13 - t12;
+    t8 = t9 + t1;
+    t13 = t14 + t10;
+    t12 = t0 + t6;
+    t9 = t2 - t11;
+    t1 = t4 + t7;
+    t14 = t3 - t5;
+    t10 = t4 - t7;
+    t4 = t3 + t5;
+    t7 = t0 - t6;
+    t3 = t2 + t11;
+    re[15] = t8;
+    im[15] = t13;
+    re[63] = t12;
+    im[63] = t9;
+    re[111] = t1;
+    im[111] = t14;
+    re[159] = t10;
+    im[159] = t4;
+    re[207] = t7;
+    im[207] = t3;
+    t5 = re[75];
+    t0 = im[75];
+    t6 = re[123];
+    t2 = im[123];
+    t11 = re[171];
+    t8 = im[171];
+    t13 = re[219];
+    t12 = im[219];
+    t9 = re[27];
+    t1 = im[27];
+    t14 = t6 + t9;
+    t10 = t2 + t1;
+    t4 = t11 + t13;
+    t7 = t8 + t12;
+    t3 = t6 - t9;
+    t6 = t2 - t1;
+    t9 = t11 - t13;
+    t2 = t8 - t12;
+    t1 = t14 + t4;
+    t11 = t10 + t7;
+    t13 = t14 - t4;
+    t8 = C0 * t13;
+    t12 = t10 - t7;
+    t14 = C0 * t12;
+    t4 = C1 * t1;
+    t13 = t5 - t4;
+    t10 = C1 * t11;
+    t7 = t0 - t10;
+    t12 = t13 + t8;
+    t4 = t7 + t14;
+    t10 = t13 - t8;
+    t13 = t7 - t14;
+    t8 = C2 * t3;
+    t7 = C3 * t9;
+    t14 = t8 + t7;
+    t8 = C2 * t6;
+    t7 = C3 * t2;
+    t8 = t8 + t7;
+    t7 = C3 * t3;
+    t3 = C2 * t9;
+    t9 = t7 - t3;
+    t7 = C3 * t6;
+    t3 = C2 * t2;
+    t6 = t7 - t3;
+    t2 = t5 + t1;
+    t7 = t0 + t11;
+    t3 = t12 + t8;
+    t5 = t4 - t14;
+    t1 = t10 + t6;
+    t0 = t13 - t9;
+    t11 = t10 - t6;
+    t10 = t13 + t9;
+    t6 = t12 - t8;
+    t13 = t4 + t14;
+    re[75] = t2;
+    im[75] = t7;
+    re[123] = t3;
+    im[123] = t5;
+    re[171] = t1;
+    im[171] = t0;
+    re[219] = t11;
+    im[219] = t10;
+    re[27] = t6;
+    im[27] = t13;
+    t9 = re[135];
+    t12 = im[135];
+    t8 = re[183];
+    t4 = im[183];
+    t14 = re[231];
+    t2 = im[231];
+    t7 = re[39];
+    t3 = im[39];
+    t5 = re[87];
+    t1 = im[87];
+    t0 = t8 + t5;
+    t11 = t4 + t1;
+    t10 = t14 + t7;
+    t6 = t2 + t3;
+    t13 = t8 - t5;
+    t8 = t4 - t1;
+    t5 = t14 - t7;
+    t4 = t2 - t3;
+    t1 = t0 + t10;
+    t14 = t11 + t6;
+    t7 = t0 - t10;
+    t2 = C0 * t7;
+    t3 = t11 - t6;
+    t0 = C0 * t3;
+    t10 = C1 * t1;
+    t7 = t9 - t10;
+    t11 = C1 * t14;
+    t6 = t12 - t11;
+    t3 = t7 + t2;
+    t10 = t6 + t0;
+    t11 = t7 - t2;
+    t7 = t6 - t0;
+    t2 = C2 * t13;
+    t6 = C3 * t5;
+    t0 = t2 + t6;
+    t2 = C2 * t8;
+    t6 = C3 * t4;
+    t2 = t2 + t6;
+    t6 = C3 * t13;
+    t13 = C2 * t5;
+    t5 = t6 - t13;
+    t6 = C3 * t8;
+    t13 = C2 * t4;
+    t8 = t6 - t13;
+    t4 = t9 + t1;
+    t6 = t12 + t14;
+    t13 = t3 + t2;
+    t9 = t10 - t0;
+    t1 = t11 + t8;
+    t12 = t7 - t5;
+    t14 = t11 - t8;
+    t11 = t7 + t5;
+    t8 = t3 - t2;
+    t7 = t10 + t0;
+    re[135] = t4;
+    im[135] = t6;
+    re[183] = t13;
+    im[183] = t9;
+    re[231] = t1;
+    im[231] = t12;
+    re[39] = t14;
+    im[39] = t11;
+    re[87] = t8;
+    im[87] = t7;
+    t5 = re[195];
+    t3 = im[195];
+    t2 = re[3];
+    t10 = im[3];
+    t0 = re[51];
+    t4 = im[51];
+    t6 = re[99];
+    t13 = im[99];
+    t9 = re[147];
+    t1 = im[147];
+    t12 = t2 + t9;
+    t14 = t10 + t1;
+    t11 = t0 + t6;
+    t8 = t4 + t13;
+    t7 = t2 - t9;
+    t2 = t10 - t1;
+    t9 = t0 - t6;
+    t10 = t4 - t13;
+    t1 = t12 + t11;
+    t0 = t14 + t8;
+    t6 = t12 - t11;
+    t4 = C0 * t6;
+    t13 = t14 - t8;
+    t12 = C0 * t13;
+    t11 = C1 * t1;
+    t6 = t5 - t11;
+    t14 = C1 * t0;
+    t8 = t3 - t14;
+    t13 = t6 + t4;
+    t11 = t8 + t12;
+    t14 = t6 - t4;
+    t6 = t8 - t12;
+    t4 = C2 * t7;
+    t8 = C3 * t9;
+    t12 = t4 + t8;
+    t4 = C2 * t2;
+    t8 = C3 * t10;
+    t4 = t4 + t8;
+    t8 = C3 * t7;
+    t7 = C2 * t9;
+    t9 = t8 - t7;
+    t8 = C3 * t2;
+    t7 = C2 * t10;
+    t2 = t8 - t7;
+    t10 = t5 + t1;
+    t8 = t3 + t0;
+    t7 = t13 + t4;
+    t5 = t11 - t12;
+    t1 = t14 + t2;
+    t3 = t6 - t9;
+    t0 = t14 - t2;
+    t14 = t6 + t9;
+    t2 = t13 - t4;
+    t6 = t11 + t12;
+    re[195] = t10;
+    im[195] = t8;
+    re[3] = t7;
+    im[3] = t5;
+    re[51] = t1;
+    im[51] = t3;
+    re[99] = t0;
+    im[99] = t14;
+    re[147] = t2;
+    im[147] = t6;
+    t9 = re[30];
+    t13 = im[30];
+    t4 = re[78];
+    t11 = im[78];
+    t12 = re[126];
+    t10 = im[126];
+    t8 = re[174];
+    t7 = im[174];
+    t5 = re[222];
+    t1 = im[222];
+    t3 = t4 + t5;
+    t0 = t11 + t1;
+    t14 = t12 + t8;
+    t2 = t10 + t7;
+    t6 = t4 - t5;
+    t4 = t11 - t1;
+    t5 = t12 - t8;
+    t11 = t10 - t7;
+    t1 = t3 + t14;
+    t12 = t0 + t2;
+    t8 = t3 - t14;
+    t10 = C0 * t8;
+    t7 = t0 - t2;
+    t3 = C0 * t7;
+    t14 = C1 * t1;
+    t8 = t9 - t14;
+    t0 = C1 * t12;
+    t2 = t13 - t0;
+    t7 = t8 + t10;
+    t14 = t2 + t3;
+    t0 = t8 - t10;
+    t8 = t2 - t3;
+    t10 = C2 * t6;
+    t2 = C3 * t5;
+    t3 = t10 + t2;
+    t10 = C2 * t4;
+    t2 = C3 * t11;
+    t10 = t10 + t2;
+    t2 = C3 * t6;
+    t6 = C2 * t5;
+    t5 = t2 - t6;
+    t2 = C3 * t4;
+    t6 = C2 * t11;
+    t4 = t2 - t6;
+    t11 = t9 + t1;
+    t2 = t13 + t12;
+    t6 = t7 + t10;
+    t9 = t14 - t3;
+    t1 = t0 + t4;
+    t13 = t8 - t5;
+    t12 = t0 - t4;
+    t0 = t8 + t5;
+    t4 = t7 - t10;
+    t8 = t14 + t3;
+    re[30] = t11;
+    im[30] = t2;
+    re[78] = t6;
+    im[78] = t9;
+    re[126] = t1;
+    im[126] = t13;
+    re[174] = t12;
+    im[174] = t0;
+    re[222] = t4;
+    im[222] = t8;
+    t5 = re[90];
+    t7 = im[90];
+    t10 = re[138];
+    t14 = im[138];
+    t3 = re[186];
+    t11 = im[186];
+    t2 = re[234];
+    t6 = im[234];
+    t9 = re[42];
+    t1 = im[42];
+    t13 = t10 + t9;
+    t12 = t14 + t1;
+    t0 = t3 + t2;
+    t4 = t11 + t6;
+    t8 = t10 - t9;
+    t10 = t14 - t1;
+    t9 = t3 - t2;
+    t14 = t11 - t6;
+    t1 = t13 + t0;
+    t3 = t12 + t4;
+    t2 = t13 - t0;
+    t11 = C0 * t2;
+    t6 = t12 - t4;
+    t13 = C0 * t6;
+    t0 = C1 * t1;
+    t2 = t5 - t0;
+    t12 = C1 * t3;
+    t4 = t7 - t12;
+    t6 = t2 + t11;
+    t0 = t4 + t13;
+    t12 = t2 - t11;
+    t2 = t4 - t13;
+    t11 = C2 * t8;
+    t4 = C3 * t9;
+    t13 = t11 + t4;
+    t11 = C2 * t10;
+    t4 = C3 * t14;
+    t11 = t11 + t4;
+    t4 = C3 * t8;
+    t8 = C2 * t9;
+    t9 = t4 - t8;
+    t4 = C3 * t10;
+    t8 = C2 * t14;
+    t10 = t4 - t8;
+    t14 = t5 + t1;
+    t4 = t7 + t3;
+    t8 = t6 + t11;
+    t5 = t0 - t13;
+    t1 = t12 + t10;
+    t7 = t2 - t9;
+    t3 = t12 - t10;
+    t12 = t2 + t9;
+    t10 = t6 - t11;
+    t2 = t0 + t13;
+    re[90] = t14;
+    im[90] = t4;
+    re[138] = t8;
+    im[138] = t5;
+    re[186] = t1;
+    im[186] = t7;
+    re[234] = t3;
+    im[234] = t12;
+    re[42] = t10;
+    im[42] = t2;
+    t9 = re[150];
+    t6 = im[150];
+    t11 = re[198];
+    t0 = im[198];
+    t13 = re[6];
+    t14 = im[6];
+    t4 = re[54];
+    t8 = im[54];
+    t5 = re[102];
+    t1 = im[102];
+    t7 = t11 + t5;
+    t3 = t0 + t1;
+    t12 = t13 + t4;
+    t10 = t14 + t8;
+    t2 = t11 - t5;
+    t11 = t0 - t1;
+    t5 = t13 - t4;
+    t0 = t14 - t8;
+    t1 = t7 + t12;
+    t13 = t3 + t10;
+    t4 = t7 - t12;
+    t14 = C0 * t4;
+    t8 = t3 - t10;
+    t7 = C0 * t8;
+    t12 = C1 * t1;
+    t4 = t9 - t12;
+    t3 = C1 * t13;
+    t10 = t6 - t3;
+    t8 = t4 + t14;
+    t12 = t10 + t7;
+    t3 = t4 - t14;
+    t4 = t10 - t7;
+    t14 = C2 * t2;
+    t10 = C3 * t5;
+    t7 = t14 + t10;
+    t14 = C2 * t11;
+    t10 = C3 * t0;
+    t14 = t14 + t10;
+    t10 = C3 * t2;
+    t2 = C2 * t5;
+    t5 = t10 - t2;
+    t10 = C3 * t11;
+    t2 = C2 * t0;
+    t11 = t10 - t2;
+    t0 = t9 + t1;
+    t10 = t6 + t13;
+    t2 = t8 + t14;
+    t9 = t12 - t7;
+    t1 = t3 + t11;
+    t6 = t4 - t5;
+    t13 = t3 - t11;
+    t3 = t4 + t5;
+    t11 = t8 - t14;
+    t4 = t12 + t7;
+    re[150] = t0;
+    im[150] = t10;
+    re[198] = t2;
+    im[198] = t9;
+    re[6] = t1;
+    im[6] = t6;
+    re[54] = t13;
+    im[54] = t3;
+    re[102] = t11;
+    im[102] = t4;
+    t5 = re[210];
+    t8 = im[210];
+    t14 = re[18];
+    t12 = im[18];
+    t7 = re[66];
+    t0 = im[66];
+    t10 = re[114];
+    t2 = im[114];
+    t9 = re[162];
+    t1 = im[162];
+    t6 = t14 + t9;
+    t13 = t12 + t1;
+    t3 = t7 + t10;
+    t11 = t0 + t2;
+    t4 = t14 - t9;
+    t14 = t12 - t1;
+    t9 = t7 - t10;
+    t12 = t0 - t2;
+    t1 = t6 + t3;
+    t7 = t13 + t11;
+    t10 = t6 - t3;
+    t0 = C0 * t10;
+    t2 = t13 - t11;
+    t6 = C0 * t2;
+    t3 = C1 * t1;
+    t10 = t5 - t3;
+    t13 = C1 * t7;
+    t11 = t8 - t13;
+    t2 = t10 + t0;
+    t3 = t11 + t6;
+    t13 = t10 - t0;
+    t10 = t11 - t6;
+    t0 = C2 * t4;
+    t11 = C3 * t9;
+    t6 = t0 + t11;
+    t0 = C2 * t14;
+    t11 = C3 * t12;
+    t0 = t0 + t11;
+    t11 = C3 * t4;
+    t4 = C2 * t9;
+    t9 = t11 - t4;
+    t11 = C3 * t14;
+    t4 = C2 * t12;
+    t14 = t11 - t4;
+    t12 = t5 + t1;
+    t11 = t8 + t7;
+    t4 = t2 + t0;
+    t5 = t3 - t6;
+    t1 = t13 + t14;
+    t8 = t10 - t9;
+    t7 = t13 - t14;
+    t13 = t10 + t9;
+    t14 = t2 - t0;
+    t10 = t3 + t6;
+    re[210] = t12;
+    im[210] = t11;
+    re[18] = t4;
+    im[18] = t5;
+    re[66] = t1;
+    im[66] = t8;
+    re[114] = t7;
+    im[114] = t13;
+    re[162] = t14;
+    im[162] = t10;
+    t9 = re[45];
+    t2 = im[45];
+    t0 = re[93];
+    t3 = im[93];
+    t6 = re[141];
+    t12 = im[141];
+    t11 = re[189];
+    t4 = im[189];
+    t5 = re[237];
+    t1 = im[237];
+    t8 = t0 + t5;
+    t7 = t3 + t1;
+    t13 = t6 + t11;
+    t14 = t12 + t4;
+    t10 = t0 - t5;
+    t0 = t3 - t1;
+    t5 = t6 - t11;
+    t3 = t12 - t4;
+    t1 = t8 + t13;
+    t6 = t7 + t14;
+    t11 = t8 - t13;
+    t12 = C0 * t11;
+    t4 = t7 - t14;
+    t8 = C0 * t4;
+    t13 = C1 * t1;
+    t11 = t9 - t13;
+    t7 = C1 * t6;
+    t14 = t2 - t7;
+    t4 = t11 + t12;
+    t13 = t14 + t8;
+    t7 = t11 - t12;
+    t11 = t14 - t8;
+    t12 = C2 * t10;
+    t14 = C3 * t5;
+    t8 = t12 + t14;
+    t12 = C2 * t0;
+    t14 = C3 * t3;
+    t12 = t12 + t14;
+    t14 = C3 * t10;
+    t10 = C2 * t5;
+    t5 = t14 - t10;
+    t14 = C3 * t0;
+    t10 = C2 * t3;
+    t0 = t14 - t10;
+    t3 = t9 + t1;
+    t14 = t2 + t6;
+    t10 = t4 + t12;
+    t9 = t13 - t8;
+    t1 = t7 + t0;
+    t2 = t11 - t5;
+    t6 = t7 - t0;
+    t7 = t11 + t5;
+    t0 = t4 - t12;
+    t11 = t13 + t8;
+    re[45] = t3;
+    im[45] = t14;
+    re[93] = t10;
+    im[93] = t9;
+    re[141] = t1;
+    im[141] = t2;
+    re[189] = t6;
+    im[189] = t7;
+    re[237] = t0;
+    im[237] = t11;
+    t5 = re[105];
+    t4 = im[105];
+    t12 = re[153];
+    t13 = im[153];
+    t8 = re[201];
+    t3 = im[201];
+    t14 = re[9];
+    t10 = im[9];
+    t9 = re[57];
+    t1 = im[57];
+    t2 = t12 + t9;
+    t6 = t13 + t1;
+    t7 = t8 + t14;
+    t0 = t3 + t10;
+    t11 = t12 - t9;
+    t12 = t13 - t1;
+    t9 = t8 - t14;
+    t13 = t3 - t10;
+    t1 = t2 + t7;
+    t8 = t6 + t0;
+    t14 = t2 - t7;
+    t3 = C0 * t14;
+    t10 = t6 - t0;
+    t2 = C0 * t10;
+    t7 = C1 * t1;
+    t14 = t5 - t7;
+    t6 = C1 * t8;
+    t0 = t4 - t6;
+    t10 = t14 + t3;
+    t7 = t0 + t2;
+    t6 = t14 - t3;
+    t14 = t0 - t2;
+    t3 = C2 * t11;
+    t0 = C3 * t9;
+    t2 = t3 + t0;
+    t3 = C2 * t12;
+    t0 = C3 * t13;
+    t3 = t3 + t0;
+    t0 = C3 * t11;
+    t11 = C2 * t9;
+    t9 = t0 - t11;
+    t0 = C3 * t12;
+    t11 = C2 * t13;
+    t12 = t0 - t11;
+    t13 = t5 + t1;
+    t0 = t4 + t8;
+    t11 = t10 + t3;
+    t5 = t7 - t2;
+    t1 = t6 + t12;
+    t4 = t14 - t9;
+    t8 = t6 - t12;
+    t6 = t14 + t9;
+    t12 = t10 - t3;
+    t14 = t7 + t2;
+    re[105] = t13;
+    im[105] = t0;
+    re[153] = t11;
+    im[153] = t5;
+    re[201] = t1;
+    im[201] = t4;
+    re[9] = t8;
+    im[9] = t6;
+    re[57] = t12;
+    im[57] = t14;
+    t9 = re[165];
+    t10 = im[165];
+    t3 = re[213];
+    t7 = im[213];
+    t2 = re[21];
+    t13 = im[21];
+    t0 = re[69];
+    t11 = im[69];
+    t5 = re[117];
+    t1 = im[117];
+    t4 = t3 + t5;
+    t8 = t7 + t1;
+    t6 = t2 + t0;
+    t12 = t13 + t11;
+    t14 = t3 - t5;
+    t3 = t7 - t1;
+    t5 = t2 - t0;
+    t7 = t13 - t11;
+    t1 = t4 + t6;
+    t2 = t8 + t12;
+    t0 = t4 - t6;
+    t13 = C0 * t0;
+    t11 = t8 - t12;
+    t4 = C0 * t11;
+    t6 = C1 * t1;
+    t0 = t9 - t6;
+    t8 = C1 * t2;
+    t12 = t10 - t8;
+    t11 = t0 + t13;
+    t6 = t12 + t4;
+    t8 = t0 - t13;
+    t0 = t12 - t4;
+    t13 = C2 * t14;
+    t12 = C3 * t5;
+    t4 = t13 + t12;
+    t13 = C2 * t3;
+    t12 = C3 * t7;
+    t13 = t13 + t12;
+    t12 = C3 * t14;
+    t14 = C2 * t5;
+    t5 = t12 - t14;
+    t12 = C3 * t3;
+    t14 = C2 * t7;
+    t3 = t12 - t14;
+    t7 = t9 + t1;
+    t12 = t10 + t2;
+    t14 = t11 + t13;
+    t9 = t6 - t4;
+    t1 = t8 + t3;
+    t10 = t0 - t5;
+    t2 = t8 - t3;
+    t8 = t0 + t5;
+    t3 = t11 - t13;
+    t0 = t6 + t4;
+    re[165] = t7;
+    im[165] = t12;
+    re[213] = t14;
+    im[213] = t9;
+    re[21] = t1;
+    im[21] = t10;
+    re[69] = t2;
+    im[69] = t8;
+    re[117] = t3;
+    im[117] = t0;
+    t5 = re[225];
+    t11 = im[225];
+    t13 = re[33];
+    t6 = im[33];
+    t4 = re[81];
+    t7 = im[81];
+    t12 = re[129];
+    t14 = im[129];
+    t9 = re[177];
+    t1 = im[177];
+    t10 = t13 + t9;
+    t2 = t6 + t1;
+    t8 = t4 + t12;
+    t3 = t7 + t14;
+    t0 = t13 - t9;
+    t13 = t6 - t1;
+    t9 = t4 - t12;
+    t6 = t7 - t14;
+    t1 = t10 + t8;
+    t4 = t2 + t3;
+    t12 = t10 - t8;
+    t7 = C0 * t12;
+    t14 = t2 - t3;
+    t10 = C0 * t14;
+    t8 = C1 * t1;
+    t12 = t5 - t8;
+    t2 = C1 * t4;
+    t3 = t11 - t2;
+    t14 = t12 + t7;
+    t8 = t3 + t10;
+    t2 = t12 - t7;
+    t12 = t3 - t10;
+    t7 = C2 * t0;
+    t3 = C3 * t9;
+    t10 = t7 + t3;
+    t7 = C2 * t13;
+    t3 = C3 * t6;
+    t7 = t7 + t3;
+    t3 = C3 * t0;
+    t0 = C2 * t9;
+    t9 = t3 - t0;
+    t3 = C3 * t13;
+    t0 = C2 * t6;
+    t13 = t3 - t0;
+    t6 = t5 + t1;
+    t3 = t11 + t4;
+    t0 = t14 + t7;
+    t5 = t8 - t10;
+    t1 = t2 + t13;
+    t11 = t12 - t9;
+    t4 = t2 - t13;
+    t2 = t12 + t9;
+    t13 = t14 - t7;
+    t12 = t8 + t10;
+    re[225] = t6;
+    im[225] = t3;
+    re[33] = t0;
+    im[33] = t5;
+    re[81] = t1;
+    im[81] = t11;
+    re[129] = t4;
+    im[129] = t2;
+    re[177] = t13;
+    im[177] = t12;
+}
+
+/**
+ *  Part 3 of ApplyWindowedIMDCT_W10_480().
+ * 
+ *  @param {Number[]} X 
+ *    - The input block (480 points).
+ *  @param {Number[]} y 
+ *    - The array that would contain the output block (960 points).
+ *  @param {Number[]} re 
+ *    - The scratch buffer (real part, 240 points).
+ *  @param {Number[]} im 
+ *    - The scratch buffer (imaginary part, 240 points).
+ */
+function ApplyWindowedIMDCT_W10_480_Part3(X, y, re, im) {
+    let t0, t1, t10, t11, t12, t13, t14, t2, t3, t4, t5, t6, t7, t8, t9;
+    const C0 = 0.8660254037844387;
+    const C1 = 0.49999999999999994;
+    const C2 = 0.6087614290087207;
+    const C3 = 0.7933533402912352;
+    const C4 = 0.25881904510252074;
+    const C5 = 0.9659258262890683;
+    const C6 = 0.9914448613738104;
+    const C7 = 0.13052619222005157;
+    const C8 = 0.8128466845916152;
+    const C9 = 0.5824776968678022;
+    const C10 = 0.528067850650368;
+    const C11 = 0.8492021815265789;
+    const C12 = 0.16289547339458874;
+    const C13 = 0.986643332084879;
+    const C14 = 0.9738769792773336;
+    const C15 = 0.22707626303437323;
+    const C16 = 0.9238795325112867;
+    const C17 = 1.3065629648763766;
+    const C18 = 0.5411961001461969;
+    const C19 = 0.7071067811865476;
+    const C20 = 0.3826834323650898;
+    const C21 = 0.7518398074789774;
+    const C22 = 0.6593458151000688;
+    const C23 = 0.4422886902190013;
+    const C24 = 0.8968727415326883;
+    const C25 = 0.06540312923014306;
+    const C26 = 0.9978589232386035;
+    const C27 = 0.9469301294951057;
+    const C28 = 0.3214394653031616;
+    const C29 = 0.6835923020228712;
+    const C30 = 0.7298640726978356;
+    const C31 = 0.3522500479212335;
+    const C32 = 0.9359059267573258;
+    const C33 = 0.9994645874763657;
+    const C34 = 0.03271908282177614;
+    const C35 = 0.9108638249211758;
+    const C36 = 0.41270702980439467;
+    const C37 = 0.6691306063588582;
+    const C38 = 0.7431448254773942;
+    const C39 = 0.33380685923377096;
+    const C40 = 0.9426414910921784;
+    const C41 = 0.9986295347545738;
+    const C42 = 0.05233595624294383;
+    const C43 = 0.9025852843498606;
+    const C44 = 0.4305110968082951;
+    const C45 = 0.5930676289532372;
+    const C46 = 0.8051526485628582;
+    const C47 = 0.23980446465501654;
+    const C48 = 0.9708212084269281;
+    const C49 = 0.9886910398241674;
+    const C50 = 0.149966755554045;
+    const C51 = 0.8560416229147715;
+    const C52 = 0.5169068966820275;
+    const C53 = 0.5112930860770522;
+    const C54 = 0.8594064115014527;
+    const C55 = 0.1434926219911793;
+    const C56 = 0.9896513868196702;
+    const C57 = 0.9692309097067544;
+    const C58 = 0.24615329302899303;
+    const C59 = 0.8012538126910607;
+    const C60 = 0.598324600570659;
+    const C61 = 0.4245945112807131;
+    const C62 = 0.9053836208979552;
+    const C63 = 0.04579886693652077;
+    const C64 = 0.9989506813588601;
+    const C65 = 0.9404365560933549;
+    const C66 = 0.3399692397309942;
+    const C67 = 0.7387494902412463;
+    const C68 = 0.6739801114782978;
+    const C69 = 0.40673664307580015;
+    const C70 = 0.9135454576426009;
+    const C71 = 0.02617694830787315;
+    const C72 = 0.9996573249755573;
+    const C73 = 0.9335804264972017;
+    const C74 = 0.35836794954530027;
+    const C75 = 0.7253743710122876;
+    const C76 = 0.6883545756937539;
+    const C77 = 0.31523498164776964;
+    const C78 = 0.949013649188214;
+    const C79 = 0.9974094913373519;
+    const C80 = 0.07193265315671939;
+    const C81 = 0.8939587799699321;
+    const C82 = 0.44814919358922256;
+    const C83 = 0.6544109481086103;
+    const C84 = 0.7561390817803227;
+    const C85 = 0.22069743502150108;
+    const C86 = 0.9753423205085127;
+    const C87 = 0.9855560590580777;
+    const C88 = 0.1693495038490246;
+    const C89 = 0.8457278217039733;
+    const C90 = 0.5336145159156115;
+    const C91 = 0.5771451900372336;
+    const C92 = 0.8166415551616789;
+    const C93 = 0.12403445145048532;
+    const C94 = 0.992277912105967;
+    const C95 = 0.9642111831703293;
+    const C96 = 0.265135426243408;
+    const C97 = 0.78935204219315;
+    const C98 = 0.6139408387503664;
+    const C99 = 0.4943212082861446;
+    const C100 = 0.8692793239451436;
+    const C101 = 0.10452846326765346;
+    const C102 = 0.9945218953682733;
+    const C103 = 0.958819734868193;
+    const C104 = 0.2840153447039226;
+    const C105 = 0.7771459614569709;
+    const C106 = 0.6293203910498375;
+    const C107 = 0.4771587602596084;
+    const C108 = 0.8788171126619654;
+    const C109 = 0.006544937967351858;
+    const C110 = 0.9999785816641292;
+    const C111 = 0.9263643838751181;
+    const C112 = 0.3766285016932107;
+    const C113 = 0.7117196061551713;
+    const C114 = 0.7024636661168517;
+    const C115 = 0.38872197015239557;
+    const C116 = 0.9213551052231925;
+    const C117 = 0.9958049275746618;
+    const C118 = 0.09150161866340238;
+    const C119 = 0.8849876374630419;
+    const C120 = 0.4656145203251114;
+    const C121 = 0.6394390019805847;
+    const C122 = 0.7688418320734596;
+    const C123 = 0.296541574975571;
+    const C124 = 0.9550199444571866;
+    const C125 = 0.9820411276703039;
+    const C126 = 0.18866696468655522;
+    const C127 = 0.8350879763187431;
+    const C128 = 0.5501164165954934;
+    const C129 = 0.5610002506640098;
+    const C130 = 0.8278156308955021;
+    const C131 = 0.20150532232561713;
+    const C132 = 0.9794874195590514;
+    const C133 = 0.9781476007338057;
+    const C134 = 0.20791169081775931;
+    const C135 = 0.8241261886220156;
+    const C136 = 0.5664062369248328;
+    const C137 = 0.544639035015027;
+    const C138 = 0.838670567945424;
+    const C139 = 0.18223552549214747;
+    const C140 = 0.9832549075639546;
+    const C141 = 0.953058643306297;
+    const C142 = 0.3027857698425746;
+    const C143 = 0.7646402761590003;
+    const C144 = 0.6444573283588975;
+    const C145 = 0.45981235844785984;
+    const C146 = 0.8880161006528073;
+    const C147 = 0.08498217737244167;
+    const C148 = 0.9963824715083254;
+    const C149 = 0.9187912101488983;
+    const C150 = 0.39474385638426723;
+    const C151 = 0.6977904598416801;
+    const C152 = 0.7163019434246544;
+    const C153 = 0.3705574375098362;
+    const C154 = 0.9288095528719242;
+    const C155 = 0.999914327574007;
+    const C156 = 0.01308959557134444;
+    const C157 = 0.8756753153753997;
+    const C158 = 0.4829003438000374;
+    const C159 = 0.6242205399450176;
+    const C160 = 0.7812481792047586;
+    const C161 = 0.2777338458812922;
+    const C162 = 0.9606580613579353;
+    const C163 = 0.9938164620563781;
+    const C164 = 0.11103530855427768;
+    t9 = X[160];
+    t14 = X[319];
+    t7 = C0 * t9;
+    t8 = C1 * t14;
+    t10 = t7 + t8;
+    t6 = (-C1) * t9;
+    t3 = C0 * t14;
+    t0 = t6 + t3;
+    t5 = X[280];
+    t1 = X[199];
+    t11 = C2 * t5;
+    t4 = C3 * t1;
+    t2 = t11 + t4;
+    t13 = (-C3) * t5;
+    t12 = C2 * t1;
+    t7 = t13 + t12;
+    t8 = X[400];
+    t9 = X[79];
+    t14 = C4 * t8;
+    t6 = C5 * t9;
+    t3 = t14 + t6;
+    t11 = (-C5) * t8;
+    t4 = C4 * t9;
+    t5 = t11 + t4;
+    t1 = X[40];
+    t13 = X[439];
+    t12 = C6 * t1;
+    t14 = C7 * t13;
+    t6 = t12 + t14;
+    t8 = (-C7) * t1;
+    t9 = C6 * t13;
+    t11 = t8 + t9;
+    t4 = t10 + t3;
+    t12 = t0 + t5;
+    t14 = t2 + t6;
+    t1 = t7 + t11;
+    t13 = t10 - t3;
+    t8 = t0 - t5;
+    t9 = t2 - t6;
+    t10 = t7 - t11;
+    t3 = t4 + t14;
+    t0 = t12 + t1;
+    t5 = t13 + t10;
+    t2 = t8 - t9;
+    t6 = t4 - t14;
+    t7 = t12 - t1;
+    t11 = t13 - t10;
+    t4 = t8 + t9;
+    re[80] = t3;
+    im[80] = t0;
+    re[140] = t5;
+    im[140] = t2;
+    re[200] = t6;
+    im[200] = t7;
+    re[20] = t11;
+    im[20] = t4;
+    t14 = X[190];
+    t12 = X[289];
+    t1 = C8 * t14;
+    t13 = C9 * t12;
+    t10 = t1 + t13;
+    t8 = (-C9) * t14;
+    t9 = C8 * t12;
+    t3 = t8 + t9;
+    t0 = X[310];
+    t5 = X[169];
+    t2 = C10 * t0;
+    t6 = C11 * t5;
+    t7 = t2 + t6;
+    t11 = (-C11) * t0;
+    t4 = C10 * t5;
+    t1 = t11 + t4;
+    t13 = X[430];
+    t14 = X[49];
+    t12 = C12 * t13;
+    t8 = C13 * t14;
+    t9 = t12 + t8;
+    t2 = (-C13) * t13;
+    t6 = C12 * t14;
+    t0 = t2 + t6;
+    t5 = X[70];
+    t11 = X[409];
+    t4 = C14 * t5;
+    t12 = C15 * t11;
+    t8 = t4 + t12;
+    t13 = (-C15) * t5;
+    t14 = C14 * t11;
+    t2 = t13 + t14;
+    t6 = t10 + t9;
+    t4 = t3 + t0;
+    t12 = t7 + t8;
+    t5 = t1 + t2;
+    t11 = t10 - t9;
+    t13 = t3 - t0;
+    t14 = t7 - t8;
+    t10 = t1 - t2;
+    t9 = t6 + t12;
+    t3 = t4 + t5;
+    t0 = t11 + t10;
+    t7 = t13 - t14;
+    t8 = t6 - t12;
+    t1 = t4 - t5;
+    t2 = t11 - t10;
+    t6 = t13 + t14;
+    t12 = t0 + t7;
+    t4 = C16 * t12;
+    t5 = t0 * (-C17);
+    t11 = t7 * C18;
+    t10 = t4 - t11;
+    t13 = t4 + t5;
+    t14 = t8 + t1;
+    t12 = t8 - t1;
+    t0 = C19 * t14;
+    t7 = (-C19) * t12;
+    t11 = t2 + t6;
+    t4 = C20 * t11;
+    t5 = t2 * (-C17);
+    t8 = t6 * (-C18);
+    t1 = t4 - t8;
+    t14 = t4 + t5;
+    re[95] = t9;
+    im[95] = t3;
+    re[155] = t10;
+    im[155] = t13;
+    re[215] = t0;
+    im[215] = t7;
+    re[35] = t1;
+    im[35] = t14;
+    t12 = X[220];
+    t11 = X[259];
+    t2 = C21 * t12;
+    t6 = C22 * t11;
+    t8 = t2 + t6;
+    t4 = (-C22) * t12;
+    t5 = C21 * t11;
+    t9 = t4 + t5;
+    t3 = X[340];
+    t10 = X[139];
+    t13 = C23 * t3;
+    t0 = C24 * t10;
+    t7 = t13 + t0;
+    t1 = (-C24) * t3;
+    t14 = C23 * t10;
+    t2 = t1 + t14;
+    t6 = X[460];
+    t12 = X[19];
+    t11 = C25 * t6;
+    t4 = C26 * t12;
+    t5 = t11 + t4;
+    t13 = (-C26) * t6;
+    t0 = C25 * t12;
+    t3 = t13 + t0;
+    t10 = X[100];
+    t1 = X[379];
+    t14 = C27 * t10;
+    t11 = C28 * t1;
+    t4 = t14 + t11;
+    t6 = (-C28) * t10;
+    t12 = C27 * t1;
+    t13 = t6 + t12;
+    t0 = t8 + t5;
+    t14 = t9 + t3;
+    t11 = t7 + t4;
+    t10 = t2 + t13;
+    t1 = t8 - t5;
+    t6 = t9 - t3;
+    t12 = t7 - t4;
+    t8 = t2 - t13;
+    t5 = t0 + t11;
+    t9 = t14 + t10;
+    t3 = t1 + t8;
+    t7 = t6 - t12;
+    t4 = t0 - t11;
+    t2 = t14 - t10;
+    t13 = t1 - t8;
+    t0 = t6 + t12;
+    t11 = t3 + t7;
+    t14 = t3 - t7;
+    t10 = C19 * t11;
+    t1 = (-C19) * t14;
+    t8 = -t4;
+    t6 = t13 - t0;
+    t12 = t13 + t0;
+    t3 = (-C19) * t6;
+    t7 = (-C19) * t12;
+    re[110] = t5;
+    im[110] = t9;
+    re[170] = t10;
+    im[170] = t1;
+    re[230] = t2;
+    im[230] = t8;
+    re[50] = t3;
+    im[50] = t7;
+    t11 = X[250];
+    t14 = X[229];
+    t4 = C29 * t11;
+    t13 = C30 * t14;
+    t0 = t4 + t13;
+    t6 = (-C30) * t11;
+    t12 = C29 * t14;
+    t5 = t6 + t12;
+    t9 = X[370];
+    t10 = X[109];
+    t1 = C31 * t9;
+    t2 = C32 * t10;
+    t8 = t1 + t2;
+    t3 = (-C32) * t9;
+    t7 = C31 * t10;
+    t4 = t3 + t7;
+    t13 = X[10];
+    t11 = X[469];
+    t14 = C33 * t13;
+    t6 = C34 * t11;
+    t12 = t14 + t6;
+    t1 = (-C34) * t13;
+    t2 = C33 * t11;
+    t9 = t1 + t2;
+    t10 = X[130];
+    t3 = X[349];
+    t7 = C35 * t10;
+    t14 = C36 * t3;
+    t6 = t7 + t14;
+    t13 = (-C36) * t10;
+    t11 = C35 * t3;
+    t1 = t13 + t11;
+    t2 = t0 + t12;
+    t7 = t5 + t9;
+    t14 = t8 + t6;
+    t10 = t4 + t1;
+    t3 = t0 - t12;
+    t13 = t5 - t9;
+    t11 = t8 - t6;
+    t0 = t4 - t1;
+    t12 = t2 + t14;
+    t5 = t7 + t10;
+    t9 = t3 + t0;
+    t8 = t13 - t11;
+    t6 = t2 - t14;
+    t4 = t7 - t10;
+    t1 = t3 - t0;
+    t2 = t13 + t11;
+    t14 = t9 + t8;
+    t7 = C20 * t14;
+    t10 = t9 * (-C17);
+    t3 = t8 * (-C18);
+    t0 = t7 - t3;
+    t13 = t7 + t10;
+    t11 = t6 - t4;
+    t14 = t6 + t4;
+    t9 = (-C19) * t11;
+    t8 = (-C19) * t14;
+    t3 = t1 + t2;
+    t7 = (-C16) * t3;
+    t10 = t1 * C17;
+    t6 = t2 * (-C18);
+    t4 = t7 - t6;
+    t11 = t7 + t10;
+    re[125] = t12;
+    im[125] = t5;
+    re[185] = t0;
+    im[185] = t13;
+    re[5] = t9;
+    im[5] = t8;
+    re[65] = t4;
+    im[65] = t11;
+    t14 = re[80];
+    t3 = im[80];
+    t1 = re[95];
+    t2 = im[95];
+    t6 = re[110];
+    t7 = im[110];
+    t10 = re[125];
+    t12 = im[125];
+    t5 = t14 + t6;
+    t0 = t3 + t7;
+    t13 = t1 + t10;
+    t9 = t2 + t12;
+    t8 = t14 - t6;
+    t4 = t3 - t7;
+    t11 = t1 - t10;
+    t14 = t2 - t12;
+    t6 = t5 + t13;
+    t3 = t0 + t9;
+    t7 = t8 + t14;
+    t1 = t4 - t11;
+    t10 = t5 - t13;
+    t2 = t0 - t9;
+    t12 = t8 - t14;
+    t5 = t4 + t11;
+    re[80] = t6;
+    im[80] = t3;
+    re[95] = t7;
+    im[95] = t1;
+    re[110] = t10;
+    im[110] = t2;
+    re[125] = t12;
+    im[125] = t5;
+    t13 = re[140];
+    t0 = im[140];
+    t9 = re[155];
+    t8 = im[155];
+    t14 = re[170];
+    t4 = im[170];
+    t11 = re[185];
+    t6 = im[185];
+    t3 = t13 + t14;
+    t7 = t0 + t4;
+    t1 = t9 + t11;
+    t10 = t8 + t6;
+    t2 = t13 - t14;
+    t12 = t0 - t4;
+    t5 = t9 - t11;
+    t13 = t8 - t6;
+    t14 = t3 + t1;
+    t0 = t7 + t10;
+    t4 = t2 + t13;
+    t9 = t12 - t5;
+    t11 = t3 - t1;
+    t8 = t7 - t10;
+    t6 = t2 - t13;
+    t3 = t12 + t5;
+    re[140] = t14;
+    im[140] = t0;
+    re[155] = t4;
+    im[155] = t9;
+    re[170] = t11;
+    im[170] = t8;
+    re[185] = t6;
+    im[185] = t3;
+    t1 = re[200];
+    t7 = im[200];
+    t10 = re[215];
+    t2 = im[215];
+    t13 = re[230];
+    t12 = im[230];
+    t5 = re[5];
+    t14 = im[5];
+    t0 = t1 + t13;
+    t4 = t7 + t12;
+    t9 = t10 + t5;
+    t11 = t2 + t14;
+    t8 = t1 - t13;
+    t6 = t7 - t12;
+    t3 = t10 - t5;
+    t1 = t2 - t14;
+    t13 = t0 + t9;
+    t7 = t4 + t11;
+    t12 = t8 + t1;
+    t10 = t6 - t3;
+    t5 = t0 - t9;
+    t2 = t4 - t11;
+    t14 = t8 - t1;
+    t0 = t6 + t3;
+    re[200] = t13;
+    im[200] = t7;
+    re[215] = t12;
+    im[215] = t10;
+    re[230] = t5;
+    im[230] = t2;
+    re[5] = t14;
+    im[5] = t0;
+    t9 = re[20];
+    t4 = im[20];
+    t11 = re[35];
+    t8 = im[35];
+    t1 = re[50];
+    t6 = im[50];
+    t3 = re[65];
+    t13 = im[65];
+    t7 = t9 + t1;
+    t12 = t4 + t6;
+    t10 = t11 + t3;
+    t5 = t8 + t13;
+    t2 = t9 - t1;
+    t14 = t4 - t6;
+    t0 = t11 - t3;
+    t9 = t8 - t13;
+    t1 = t7 + t10;
+    t4 = t12 + t5;
+    t6 = t2 + t9;
+    t11 = t14 - t0;
+    t3 = t7 - t10;
+    t8 = t12 - t5;
+    t13 = t2 - t9;
+    t7 = t14 + t0;
+    re[20] = t1;
+    im[20] = t4;
+    re[35] = t6;
+    im[35] = t11;
+    re[50] = t3;
+    im[50] = t8;
+    re[65] = t13;
+    im[65] = t7;
+    t10 = X[256];
+    t12 = X[223];
+    t5 = C37 * t10;
+    t2 = C38 * t12;
+    t9 = t5 + t2;
+    t14 = (-C38) * t10;
+    t0 = C37 * t12;
+    t1 = t14 + t0;
+    t4 = X[376];
+    t6 = X[103];
+    t11 = C39 * t4;
+    t3 = C40 * t6;
+    t8 = t11 + t3;
+    t13 = (-C40) * t4;
+    t7 = C39 * t6;
+    t5 = t13 + t7;
+    t2 = X[16];
+    t10 = X[463];
+    t12 = C41 * t2;
+    t14 = C42 * t10;
+    t0 = t12 + t14;
+    t11 = (-C42) * t2;
+    t3 = C41 * t10;
+    t4 = t11 + t3;
+    t6 = X[136];
+    t13 = X[343];
+    t7 = C43 * t6;
+    t12 = C44 * t13;
+    t14 = t7 + t12;
+    t2 = (-C44) * t6;
+    t10 = C43 * t13;
+    t11 = t2 + t10;
+    t3 = t9 + t0;
+    t7 = t1 + t4;
+    t12 = t8 + t14;
+    t6 = t5 + t11;
+    t13 = t9 - t0;
+    t2 = t1 - t4;
+    t10 = t8 - t14;
+    t9 = t5 - t11;
+    t0 = t3 + t12;
+    t1 = t7 + t6;
+    t4 = t13 + t9;
+    t8 = t2 - t10;
+    t14 = t3 - t12;
+    t5 = t7 - t6;
+    t11 = t13 - t9;
+    t3 = t2 + t10;
+    re[128] = t0;
+    im[128] = t1;
+    re[188] = t4;
+    im[188] = t8;
+    re[8] = t14;
+    im[8] = t5;
+    re[68] = t11;
+    im[68] = t3;
+    t12 = X[286];
+    t7 = X[193];
+    t6 = C45 * t12;
+    t13 = C46 * t7;
+    t9 = t6 + t13;
+    t2 = (-C46) * t12;
+    t10 = C45 * t7;
+    t0 = t2 + t10;
+    t1 = X[406];
+    t4 = X[73];
+    t8 = C47 * t1;
+    t14 = C48 * t4;
+    t5 = t8 + t14;
+    t11 = (-C48) * t1;
+    t3 = C47 * t4;
+    t6 = t11 + t3;
+    t13 = X[46];
+    t12 = X[433];
+    t7 = C49 * t13;
+    t2 = C50 * t12;
+    t10 = t7 + t2;
+    t8 = (-C50) * t13;
+    t14 = C49 * t12;
+    t1 = t8 + t14;
+    t4 = X[166];
+    t11 = X[313];
+    t3 = C51 * t4;
+    t7 = C52 * t11;
+    t2 = t3 + t7;
+    t13 = (-C52) * t4;
+    t12 = C51 * t11;
+    t8 = t13 + t12;
+    t14 = t9 + t10;
+    t3 = t0 + t1;
+    t7 = t5 + t2;
+    t4 = t6 + t8;
+    t11 = t9 - t10;
+    t13 = t0 - t1;
+    t12 = t5 - t2;
+    t9 = t6 - t8;
+    t10 = t14 + t7;
+    t0 = t3 + t4;
+    t1 = t11 + t9;
+    t5 = t13 - t12;
+    t2 = t14 - t7;
+    t6 = t3 - t4;
+    t8 = t11 - t9;
+    t14 = t13 + t12;
+    t7 = t1 + t5;
+    t3 = C16 * t7;
+    t4 = t1 * (-C17);
+    t11 = t5 * C18;
+    t9 = t3 - t11;
+    t13 = t3 + t4;
+    t12 = t2 + t6;
+    t7 = t2 - t6;
+    t1 = C19 * t12;
+    t5 = (-C19) * t7;
+    t11 = t8 + t14;
+    t3 = C20 * t11;
+    t4 = t8 * (-C17);
+    t2 = t14 * (-C18);
+    t6 = t3 - t2;
+    t12 = t3 + t4;
+    re[143] = t10;
+    im[143] = t0;
+    re[203] = t9;
+    im[203] = t13;
+    re[23] = t1;
+    im[23] = t5;
+    re[83] = t6;
+    im[83] = t12;
+    t7 = X[316];
+    t11 = X[163];
+    t8 = C53 * t7;
+    t14 = C54 * t11;
+    t2 = t8 + t14;
+    t3 = (-C54) * t7;
+    t4 = C53 * t11;
+    t10 = t3 + t4;
+    t0 = X[436];
+    t9 = X[43];
+    t13 = C55 * t0;
+    t1 = C56 * t9;
+    t5 = t13 + t1;
+    t6 = (-C56) * t0;
+    t12 = C55 * t9;
+    t8 = t6 + t12;
+    t14 = X[76];
+    t7 = X[403];
+    t11 = C57 * t14;
+    t3 = C58 * t7;
+    t4 = t11 + t3;
+    t13 = (-C58) * t14;
+    t1 = C57 * t7;
+    t0 = t13 + t1;
+    t9 = X[196];
+    t6 = X[283];
+    t12 = C59 * t9;
+    t11 = C60 * t6;
+    t3 = t12 + t11;
+    t14 = (-C60) * t9;
+    t7 = C59 * t6;
+    t13 = t14 + t7;
+    t1 = t2 + t4;
+    t12 = t10 + t0;
+    t11 = t5 + t3;
+    t9 = t8 + t13;
+    t6 = t2 - t4;
+    t14 = t10 - t0;
+    t7 = t5 - t3;
+    t2 = t8 - t13;
+    t4 = t1 + t11;
+    t10 = t12 + t9;
+    t0 = t6 + t2;
+    t5 = t14 - t7;
+    t3 = t1 - t11;
+    t8 = t12 - t9;
+    t13 = t6 - t2;
+    t1 = t14 + t7;
+    t11 = t0 + t5;
+    t12 = t0 - t5;
+    t9 = C19 * t11;
+    t6 = (-C19) * t12;
+    t2 = -t3;
+    t14 = t13 - t1;
+    t7 = t13 + t1;
+    t0 = (-C19) * t14;
+    t5 = (-C19) * t7;
+    re[158] = t4;
+    im[158] = t10;
+    re[218] = t9;
+    im[218] = t6;
+    re[38] = t8;
+    im[38] = t2;
+    re[98] = t0;
+    im[98] = t5;
+    t11 = X[346];
+    t12 = X[133];
+    t3 = C61 * t11;
+    t13 = C62 * t12;
+    t1 = t3 + t13;
+    t14 = (-C62) * t11;
+    t7 = C61 * t12;
+    t4 = t14 + t7;
+    t10 = X[466];
+    t9 = X[13];
+    t6 = C63 * t10;
+    t8 = C64 * t9;
+    t2 = t6 + t8;
+    t0 = (-C64) * t10;
+    t5 = C63 * t9;
+    t3 = t0 + t5;
+    t13 = X[106];
+    t11 = X[373];
+    t12 = C65 * t13;
+    t14 = C66 * t11;
+    t7 = t12 + t14;
+    t6 = (-C66) * t13;
+    t8 = C65 * t11;
+    t10 = t6 + t8;
+    t9 = X[226];
+    t0 = X[253];
+    t5 = C67 * t9;
+    t12 = C68 * t0;
+    t14 = t5 + t12;
+    t13 = (-C68) * t9;
+    t11 = C67 * t0;
+    t6 = t13 + t11;
+    t8 = t1 + t7;
+    t5 = t4 + t10;
+    t12 = t2 + t14;
+    t9 = t3 + t6;
+    t0 = t1 - t7;
+    t13 = t4 - t10;
+    t11 = t2 - t14;
+    t1 = t3 - t6;
+    t7 = t8 + t12;
+    t4 = t5 + t9;
+    t10 = t0 + t1;
+    t2 = t13 - t11;
+    t14 = t8 - t12;
+    t3 = t5 - t9;
+    t6 = t0 - t1;
+    t8 = t13 + t11;
+    t12 = t10 + t2;
+    t5 = C20 * t12;
+    t9 = t10 * (-C17);
+    t0 = t2 * (-C18);
+    t1 = t5 - t0;
+    t13 = t5 + t9;
+    t11 = t14 - t3;
+    t12 = t14 + t3;
+    t10 = (-C19) * t11;
+    t2 = (-C19) * t12;
+    t0 = t6 + t8;
+    t5 = (-C16) * t0;
+    t9 = t6 * C17;
+    t14 = t8 * (-C18);
+    t3 = t5 - t14;
+    t11 = t5 + t9;
+    re[173] = t7;
+    im[173] = t4;
+    re[233] = t1;
+    im[233] = t13;
+    re[53] = t10;
+    im[53] = t2;
+    re[113] = t3;
+    im[113] = t11;
+    t12 = re[128];
+    t0 = im[128];
+    t6 = re[143];
+    t8 = im[143];
+    t14 = re[158];
+    t5 = im[158];
+    t9 = re[173];
+    t7 = im[173];
+    t4 = t12 + t14;
+    t1 = t0 + t5;
+    t13 = t6 + t9;
+    t10 = t8 + t7;
+    t2 = t12 - t14;
+    t3 = t0 - t5;
+    t11 = t6 - t9;
+    t12 = t8 - t7;
+    t14 = t4 + t13;
+    t0 = t1 + t10;
+    t5 = t2 + t12;
+    t6 = t3 - t11;
+    t9 = t4 - t13;
+    t8 = t1 - t10;
+    t7 = t2 - t12;
+    t4 = t3 + t11;
+    re[128] = t14;
+    im[128] = t0;
+    re[143] = t5;
+    im[143] = t6;
+    re[158] = t9;
+    im[158] = t8;
+    re[173] = t7;
+    im[173] = t4;
+    t13 = re[188];
+    t1 = im[188];
+    t10 = re[203];
+    t2 = im[203];
+    t12 = re[218];
+    t3 = im[218];
+    t11 = re[233];
+    t14 = im[233];
+    t0 = t13 + t12;
+    t5 = t1 + t3;
+    t6 = t10 + t11;
+    t9 = t2 + t14;
+    t8 = t13 - t12;
+    t7 = t1 - t3;
+    t4 = t10 - t11;
+    t13 = t2 - t14;
+    t12 = t0 + t6;
+    t1 = t5 + t9;
+    t3 = t8 + t13;
+    t10 = t7 - t4;
+    t11 = t0 - t6;
+    t2 = t5 - t9;
+    t14 = t8 - t13;
+    t0 = t7 + t4;
+    re[188] = t12;
+    im[188] = t1;
+    re[203] = t3;
+    im[203] = t10;
+    re[218] = t11;
+    im[218] = t2;
+    re[233] = t14;
+    im[233] = t0;
+    t6 = re[8];
+    t5 = im[8];
+    t9 = re[23];
+    t8 = im[23];
+    t13 = re[38];
+    t7 = im[38];
+    t4 = re[53];
+    t12 = im[53];
+    t1 = t6 + t13;
+    t3 = t5 + t7;
+    t10 = t9 + t4;
+    t11 = t8 + t12;
+    t2 = t6 - t13;
+    t14 = t5 - t7;
+    t0 = t9 - t4;
+    t6 = t8 - t12;
+    t13 = t1 + t10;
+    t5 = t3 + t11;
+    t7 = t2 + t6;
+    t9 = t14 - t0;
+    t4 = t1 - t10;
+    t8 = t3 - t11;
+    t12 = t2 - t6;
+    t1 = t14 + t0;
+    re[8] = t13;
+    im[8] = t5;
+    re[23] = t7;
+    im[23] = t9;
+    re[38] = t4;
+    im[38] = t8;
+    re[53] = t12;
+    im[53] = t1;
+    t10 = re[68];
+    t3 = im[68];
+    t11 = re[83];
+    t2 = im[83];
+    t6 = re[98];
+    t14 = im[98];
+    t0 = re[113];
+    t13 = im[113];
+    t5 = t10 + t6;
+    t7 = t3 + t14;
+    t9 = t11 + t0;
+    t4 = t2 + t13;
+    t8 = t10 - t6;
+    t12 = t3 - t14;
+    t1 = t11 - t0;
+    t10 = t2 - t13;
+    t6 = t5 + t9;
+    t3 = t7 + t4;
+    t14 = t8 + t10;
+    t11 = t12 - t1;
+    t0 = t5 - t9;
+    t2 = t7 - t4;
+    t13 = t8 - t10;
+    t5 = t12 + t1;
+    re[68] = t6;
+    im[68] = t3;
+    re[83] = t14;
+    im[83] = t11;
+    re[98] = t0;
+    im[98] = t2;
+    re[113] = t13;
+    im[113] = t5;
+    t9 = X[352];
+    t7 = X[127];
+    t4 = C69 * t9;
+    t8 = C70 * t7;
+    t10 = t4 + t8;
+    t12 = (-C70) * t9;
+    t1 = C69 * t7;
+    t6 = t12 + t1;
+    t3 = X[472];
+    t14 = X[7];
+    t11 = C71 * t3;
+    t0 = C72 * t14;
+    t2 = t11 + t0;
+    t13 = (-C72) * t3;
+    t5 = C71 * t14;
+    t4 = t13 + t5;
+    t8 = X[112];
+    t9 = X[367];
+    t7 = C73 * t8;
+    t12 = C74 * t9;
+    t1 = t7 + t12;
+    t11 = (-C74) * t8;
+    t0 = C73 * t9;
+    t3 = t11 + t0;
+    t14 = X[232];
+    t13 = X[247];
+    t5 = C75 * t14;
+    t7 = C76 * t13;
+    t12 = t5 + t7;
+    t8 = (-C76) * t14;
+    t9 = C75 * t13;
+    t11 = t8 + t9;
+    t0 = t10 + t1;
+    t5 = t6 + t3;
+    t7 = t2 + t12;
+    t14 = t4 + t11;
+    t13 = t10 - t1;
+    t8 = t6 - t3;
+    t9 = t2 - t12;
+    t10 = t4 - t11;
+    t1 = t0 + t7;
+    t6 = t5 + t14;
+    t3 = t13 + t10;
+    t2 = t8 - t9;
+    t12 = t0 - t7;
+    t4 = t5 - t14;
+    t11 = t13 - t10;
+    t0 = t8 + t9;
+    re[176] = t1;
+    im[176] = t6;
+    re[236] = t3;
+    im[236] = t2;
+    re[56] = t12;
+    im[56] = t4;
+    re[116] = t11;
+    im[116] = t0;
+    t7 = X[382];
+    t5 = X[97];
+    t14 = C77 * t7;
+    t13 = C78 * t5;
+    t10 = t14 + t13;
+    t8 = (-C78) * t7;
+    t9 = C77 * t5;
+    t1 = t8 + t9;
+    t6 = X[22];
+    t3 = X[457];
+    t2 = C79 * t6;
+    t12 = C80 * t3;
+    t4 = t2 + t12;
+    t11 = (-C80) * t6;
+    t0 = C79 * t3;
+    t14 = t11 + t0;
+    t13 = X[142];
+    t7 = X[337];
+    t5 = C81 * t13;
+    t8 = C82 * t7;
+    t9 = t5 + t8;
+    t2 = (-C82) * t13;
+    t12 = C81 * t7;
+    t6 = t2 + t12;
+    t3 = X[262];
+    t11 = X[217];
+    t0 = C83 * t3;
+    t5 = C84 * t11;
+    t8 = t0 + t5;
+    t13 = (-C84) * t3;
+    t7 = C83 * t11;
+    t2 = t13 + t7;
+    t12 = t10 + t9;
+    t0 = t1 + t6;
+    t5 = t4 + t8;
+    t3 = t14 + t2;
+    t11 = t10 - t9;
+    t13 = t1 - t6;
+    t7 = t4 - t8;
+    t10 = t14 - t2;
+    t9 = t12 + t5;
+    t1 = t0 + t3;
+    t6 = t11 + t10;
+    t4 = t13 - t7;
+    t8 = t12 - t5;
+    t14 = t0 - t3;
+    t2 = t11 - t10;
+    t12 = t13 + t7;
+    t5 = t6 + t4;
+    t0 = C16 * t5;
+    t3 = t6 * (-C17);
+    t11 = t4 * C18;
+    t10 = t0 - t11;
+    t13 = t0 + t3;
+    t7 = t8 + t14;
+    t5 = t8 - t14;
+    t6 = C19 * t7;
+    t4 = (-C19) * t5;
+    t11 = t2 + t12;
+    t0 = C20 * t11;
+    t3 = t2 * (-C17);
+    t8 = t12 * (-C18);
+    t14 = t0 - t8;
+    t7 = t0 + t3;
+    re[191] = t9;
+    im[191] = t1;
+    re[11] = t10;
+    im[11] = t13;
+    re[71] = t6;
+    im[71] = t4;
+    re[131] = t14;
+    im[131] = t7;
+    t5 = X[412];
+    t11 = X[67];
+    t2 = C85 * t5;
+    t12 = C86 * t11;
+    t8 = t2 + t12;
+    t0 = (-C86) * t5;
+    t3 = C85 * t11;
+    t9 = t0 + t3;
+    t1 = X[52];
+    t10 = X[427];
+    t13 = C87 * t1;
+    t6 = C88 * t10;
+    t4 = t13 + t6;
+    t14 = (-C88) * t1;
+    t7 = C87 * t10;
+    t2 = t14 + t7;
+    t12 = X[172];
+    t5 = X[307];
+    t11 = C89 * t12;
+    t0 = C90 * t5;
+    t3 = t11 + t0;
+    t13 = (-C90) * t12;
+    t6 = C89 * t5;
+    t1 = t13 + t6;
+    t10 = X[292];
+    t14 = X[187];
+    t7 = C91 * t10;
+    t11 = C92 * t14;
+    t0 = t7 + t11;
+    t12 = (-C92) * t10;
+    t5 = C91 * t14;
+    t13 = t12 + t5;
+    t6 = t8 + t3;
+    t7 = t9 + t1;
+    t11 = t4 + t0;
+    t10 = t2 + t13;
+    t14 = t8 - t3;
+    t12 = t9 - t1;
+    t5 = t4 - t0;
+    t8 = t2 - t13;
+    t3 = t6 + t11;
+    t9 = t7 + t10;
+    t1 = t14 + t8;
+    t4 = t12 - t5;
+    t0 = t6 - t11;
+    t2 = t7 - t10;
+    t13 = t14 - t8;
+    t6 = t12 + t5;
+    t11 = t1 + t4;
+    t7 = t1 - t4;
+    t10 = C19 * t11;
+    t14 = (-C19) * t7;
+    t8 = -t0;
+    t12 = t13 - t6;
+    t5 = t13 + t6;
+    t1 = (-C19) * t12;
+    t4 = (-C19) * t5;
+    re[206] = t3;
+    im[206] = t9;
+    re[26] = t10;
+    im[26] = t14;
+    re[86] = t2;
+    im[86] = t8;
+    re[146] = t1;
+    im[146] = t4;
+    t11 = X[442];
+    t7 = X[37];
+    t0 = C93 * t11;
+    t13 = C94 * t7;
+    t6 = t0 + t13;
+    t12 = (-C94) * t11;
+    t5 = C93 * t7;
+    t3 = t12 + t5;
+    t9 = X[82];
+    t10 = X[397];
+    t14 = C95 * t9;
+    t2 = C96 * t10;
+    t8 = t14 + t2;
+    t1 = (-C96) * t9;
+    t4 = C95 * t10;
+    t0 = t1 + t4;
+    t13 = X[202];
+    t11 = X[277];
+    t7 = C97 * t13;
+    t12 = C98 * t11;
+    t5 = t7 + t12;
+    t14 = (-C98) * t13;
+    t2 = C97 * t11;
+    t9 = t14 + t2;
+    t10 = X[322];
+    t1 = X[157];
+    t4 = C99 * t10;
+    t7 = C100 * t1;
+    t12 = t4 + t7;
+    t13 = (-C100) * t10;
+    t11 = C99 * t1;
+    t14 = t13 + t11;
+    t2 = t6 + t5;
+    t4 = t3 + t9;
+    t7 = t8 + t12;
+    t10 = t0 + t14;
+    t1 = t6 - t5;
+    t13 = t3 - t9;
+    t11 = t8 - t12;
+    t6 = t0 - t14;
+    t5 = t2 + t7;
+    t3 = t4 + t10;
+    t9 = t1 + t6;
+    t8 = t13 - t11;
+    t12 = t2 - t7;
+    t0 = t4 - t10;
+    t14 = t1 - t6;
+    t2 = t13 + t11;
+    t7 = t9 + t8;
+    t4 = C20 * t7;
+    t10 = t9 * (-C17);
+    t1 = t8 * (-C18);
+    t6 = t4 - t1;
+    t13 = t4 + t10;
+    t11 = t12 - t0;
+    t7 = t12 + t0;
+    t9 = (-C19) * t11;
+    t8 = (-C19) * t7;
+    t1 = t14 + t2;
+    t4 = (-C16) * t1;
+    t10 = t14 * C17;
+    t12 = t2 * (-C18);
+    t0 = t4 - t12;
+    t11 = t4 + t10;
+    re[221] = t5;
+    im[221] = t3;
+    re[41] = t6;
+    im[41] = t13;
+    re[101] = t9;
+    im[101] = t8;
+    re[161] = t0;
+    im[161] = t11;
+    t7 = re[176];
+    t1 = im[176];
+    t14 = re[191];
+    t2 = im[191];
+    t12 = re[206];
+    t4 = im[206];
+    t10 = re[221];
+    t5 = im[221];
+    t3 = t7 + t12;
+    t6 = t1 + t4;
+    t13 = t14 + t10;
+    t9 = t2 + t5;
+    t8 = t7 - t12;
+    t0 = t1 - t4;
+    t11 = t14 - t10;
+    t7 = t2 - t5;
+    t12 = t3 + t13;
+    t1 = t6 + t9;
+    t4 = t8 + t7;
+    t14 = t0 - t11;
+    t10 = t3 - t13;
+    t2 = t6 - t9;
+    t5 = t8 - t7;
+    t3 = t0 + t11;
+    re[176] = t12;
+    im[176] = t1;
+    re[191] = t4;
+    im[191] = t14;
+    re[206] = t10;
+    im[206] = t2;
+    re[221] = t5;
+    im[221] = t3;
+    t13 = re[236];
+    t6 = im[236];
+    t9 = re[11];
+    t8 = im[11];
+    t7 = re[26];
+    t0 = im[26];
+    t11 = re[41];
+    t12 = im[41];
+    t1 = t13 + t7;
+    t4 = t6 + t0;
+    t14 = t9 + t11;
+    t10 = t8 + t12;
+    t2 = t13 - t7;
+    t5 = t6 - t0;
+    t3 = t9 - t11;
+    t13 = t8 - t12;
+    t7 = t1 + t14;
+    t6 = t4 + t10;
+    t0 = t2 + t13;
+    t9 = t5 - t3;
+    t11 = t1 - t14;
+    t8 = t4 - t10;
+    t12 = t2 - t13;
+    t1 = t5 + t3;
+    re[236] = t7;
+    im[236] = t6;
+    re[11] = t0;
+    im[11] = t9;
+    re[26] = t11;
+    im[26] = t8;
+    re[41] = t12;
+    im[41] = t1;
+    t14 = re[56];
+    t4 = im[56];
+    t10 = re[71];
+    t2 = im[71];
+    t13 = re[86];
+    t5 = im[86];
+    t3 = re[101];
+    t7 = im[101];
+    t6 = t14 + t13;
+    t0 = t4 + t5;
+    t9 = t10 + t3;
+    t11 = t2 + t7;
+    t8 = t14 - t13;
+    t12 = t4 - t5;
+    t1 = t10 - t3;
+    t14 = t2 - t7;
+    t13 = t6 + t9;
+    t4 = t0 + t11;
+    t5 = t8 + t14;
+    t10 = t12 - t1;
+    t3 = t6 - t9;
+    t2 = t0 - t11;
+    t7 = t8 - t14;
+    t6 = t12 + t1;
+    re[56] = t13;
+    im[56] = t4;
+    re[71] = t5;
+    im[71] = t10;
+    re[86] = t3;
+    im[86] = t2;
+    re[101] = t7;
+    im[101] = t6;
+    t9 = re[116];
+    t0 = im[116];
+    t11 = re[131];
+    t8 = im[131];
+    t14 = re[146];
+    t12 = im[146];
+    t1 = re[161];
+    t13 = im[161];
+    t4 = t9 + t14;
+    t5 = t0 + t12;
+    t10 = t11 + t1;
+    t3 = t8 + t13;
+    t2 = t9 - t14;
+    t7 = t0 - t12;
+    t6 = t11 - t1;
+    t9 = t8 - t13;
+    t14 = t4 + t10;
+    t0 = t5 + t3;
+    t12 = t2 + t9;
+    t11 = t7 - t6;
+    t1 = t4 - t10;
+    t8 = t5 - t3;
+    t13 = t2 - t9;
+    t4 = t7 + t6;
+    re[116] = t14;
+    im[116] = t0;
+    re[131] = t12;
+    im[131] = t11;
+    re[146] = t1;
+    im[146] = t8;
+    re[161] = t13;
+    im[161] = t4;
+    t10 = X[448];
+    t5 = X[31];
+    t3 = C101 * t10;
+    t2 = C102 * t5;
+    t9 = t3 + t2;
+    t7 = (-C102) * t10;
+    t6 = C101 * t5;
+    t14 = t7 + t6;
+    t0 = X[88];
+    t12 = X[391];
+    t11 = C103 * t0;
+    t1 = C104 * t12;
+    t8 = t11 + t1;
+    t13 = (-C104) * t0;
+    t4 = C103 * t12;
+    t3 = t13 + t4;
+    t2 = X[208];
+    t10 = X[271];
+    t5 = C105 * t2;
+    t7 = C106 * t10;
+    t6 = t5 + t7;
+    t11 = (-C106) * t2;
+    t1 = C105 * t10;
+    t0 = t11 + t1;
+    t12 = X[328];
+    t13 = X[151];
+    t4 = C107 * t12;
+    t5 = C108 * t13;
+    t7 = t4 + t5;
+    t2 = (-C108) * t12;
+    t10 = C107 * t13;
+    t11 = t2 + t10;
+    t1 = t9 + t6;
+    t4 = t14 + t0;
+    t5 = t8 + t7;
+    t12 = t3 + t11;
+    t13 = t9 - t6;
+    t2 = t14 - t0;
+    t10 = t8 - t7;
+    t9 = t3 - t11;
+    t6 = t1 + t5;
+    t14 = t4 + t12;
+    t0 = t13 + t9;
+    t8 = t2 - t10;
+    t7 = t1 - t5;
+    t3 = t4 - t12;
+    t11 = t13 - t9;
+    t1 = t2 + t10;
+    re[224] = t6;
+    im[224] = t14;
+    re[44] = t0;
+    im[44] = t8;
+    re[104] = t7;
+    im[104] = t3;
+    re[164] = t11;
+    im[164] = t1;
+    t5 = X[478];
+    t4 = X[1];
+    t12 = C109 * t5;
+    t13 = C110 * t4;
+    t9 = t12 + t13;
+    t2 = (-C110) * t5;
+    t10 = C109 * t4;
+    t6 = t2 + t10;
+    t14 = X[118];
+    t0 = X[361];
+    t8 = C111 * t14;
+    t7 = C112 * t0;
+    t3 = t8 + t7;
+    t11 = (-C112) * t14;
+    t1 = C111 * t0;
+    t12 = t11 + t1;
+    t13 = X[238];
+    t5 = X[241];
+    t4 = C113 * t13;
+    t2 = C114 * t5;
+    t10 = t4 + t2;
+    t8 = (-C114) * t13;
+    t7 = C113 * t5;
+    t14 = t8 + t7;
+    t0 = X[358];
+    t11 = X[121];
+    t1 = C115 * t0;
+    t4 = C116 * t11;
+    t2 = t1 + t4;
+    t13 = (-C116) * t0;
+    t5 = C115 * t11;
+    t8 = t13 + t5;
+    t7 = t9 + t10;
+    t1 = t6 + t14;
+    t4 = t3 + t2;
+    t0 = t12 + t8;
+    t11 = t9 - t10;
+    t13 = t6 - t14;
+    t5 = t3 - t2;
+    t9 = t12 - t8;
+    t10 = t7 + t4;
+    t6 = t1 + t0;
+    t14 = t11 + t9;
+    t3 = t13 - t5;
+    t2 = t7 - t4;
+    t12 = t1 - t0;
+    t8 = t11 - t9;
+    t7 = t13 + t5;
+    t4 = t14 + t3;
+    t1 = C16 * t4;
+    t0 = t14 * (-C17);
+    t11 = t3 * C18;
+    t9 = t1 - t11;
+    t13 = t1 + t0;
+    t5 = t2 + t12;
+    t4 = t2 - t12;
+    t14 = C19 * t5;
+    t3 = (-C19) * t4;
+    t11 = t8 + t7;
+    t1 = C20 * t11;
+    t0 = t8 * (-C17);
+    t2 = t7 * (-C18);
+    t12 = t1 - t2;
+    t5 = t1 + t0;
+    re[239] = t10;
+    im[239] = t6;
+    re[59] = t9;
+    im[59] = t13;
+    re[119] = t14;
+    im[119] = t3;
+    re[179] = t12;
+    im[179] = t5;
+    t4 = X[28];
+    t11 = X[451];
+    t8 = C117 * t4;
+    t7 = C118 * t11;
+    t2 = t8 + t7;
+    t1 = (-C118) * t4;
+    t0 = C117 * t11;
+    t10 = t1 + t0;
+    t6 = X[148];
+    t9 = X[331];
+    t13 = C119 * t6;
+    t14 = C120 * t9;
+    t3 = t13 + t14;
+    t12 = (-C120) * t6;
+    t5 = C119 * t9;
+    t8 = t12 + t5;
+    t7 = X[268];
+    t4 = X[211];
+    t11 = C121 * t7;
+    t1 = C122 * t4;
+    t0 = t11 + t1;
+    t13 = (-C122) * t7;
+    t14 = C121 * t4;
+    t6 = t13 + t14;
+    t9 = X[388];
+    t12 = X[91];
+    t5 = C123 * t9;
+    t11 = C124 * t12;
+    t1 = t5 + t11;
+    t7 = (-C124) * t9;
+    t4 = C123 * t12;
+    t13 = t7 + t4;
+    t14 = t2 + t0;
+    t5 = t10 + t6;
+    t11 = t3 + t1;
+    t9 = t8 + t13;
+    t12 = t2 - t0;
+    t7 = t10 - t6;
+    t4 = t3 - t1;
+    t2 = t8 - t13;
+    t0 = t14 + t11;
+    t10 = t5 + t9;
+    t6 = t12 + t2;
+    t3 = t7 - t4;
+    t1 = t14 - t11;
+    t8 = t5 - t9;
+    t13 = t12 - t2;
+    t14 = t7 + t4;
+    t11 = t6 + t3;
+    t5 = t6 - t3;
+    t9 = C19 * t11;
+    t12 = (-C19) * t5;
+    t2 = -t1;
+    t7 = t13 - t14;
+    t4 = t13 + t14;
+    t6 = (-C19) * t7;
+    t3 = (-C19) * t4;
+    re[14] = t0;
+    im[14] = t10;
+    re[74] = t9;
+    im[74] = t12;
+    re[134] = t8;
+    im[134] = t2;
+    re[194] = t6;
+    im[194] = t3;
+    t11 = X[58];
+    t5 = X[421];
+    t1 = C125 * t11;
+    t13 = C126 * t5;
+    t14 = t1 + t13;
+    t7 = (-C126) * t11;
+    t4 = C125 * t5;
+    t0 = t7 + t4;
+    t10 = X[178];
+    t9 = X[301];
+    t12 = C127 * t10;
+    t8 = C128 * t9;
+    t2 = t12 + t8;
+    t6 = (-C128) * t10;
+    t3 = C127 * t9;
+    t1 = t6 + t3;
+    t13 = X[298];
+    t11 = X[181];
+    t5 = C129 * t13;
+    t7 = C130 * t11;
+    t4 = t5 + t7;
+    t12 = (-C130) * t13;
+    t8 = C129 * t11;
+    t10 = t12 + t8;
+    t9 = X[418];
+    t6 = X[61];
+    t3 = C131 * t9;
+    t5 = C132 * t6;
+    t7 = t3 + t5;
+    t13 = (-C132) * t9;
+    t11 = C131 * t6;
+    t12 = t13 + t11;
+    t8 = t14 + t4;
+    t3 = t0 + t10;
+    t5 = t2 + t7;
+    t9 = t1 + t12;
+    t6 = t14 - t4;
+    t13 = t0 - t10;
+    t11 = t2 - t7;
+    t14 = t1 - t12;
+    t4 = t8 + t5;
+    t0 = t3 + t9;
+    t10 = t6 + t14;
+    t2 = t13 - t11;
+    t7 = t8 - t5;
+    t1 = t3 - t9;
+    t12 = t6 - t14;
+    t8 = t13 + t11;
+    t5 = t10 + t2;
+    t3 = C20 * t5;
+    t9 = t10 * (-C17);
+    t6 = t2 * (-C18);
+    t14 = t3 - t6;
+    t13 = t3 + t9;
+    t11 = t7 - t1;
+    t5 = t7 + t1;
+    t10 = (-C19) * t11;
+    t2 = (-C19) * t5;
+    t6 = t12 + t8;
+    t3 = (-C16) * t6;
+    t9 = t12 * C17;
+    t7 = t8 * (-C18);
+    t1 = t3 - t7;
+    t11 = t3 + t9;
+    re[29] = t4;
+    im[29] = t0;
+    re[89] = t14;
+    im[89] = t13;
+    re[149] = t10;
+    im[149] = t2;
+    re[209] = t1;
+    im[209] = t11;
+    t5 = re[224];
+    t6 = im[224];
+    t12 = re[239];
+    t8 = im[239];
+    t7 = re[14];
+    t3 = im[14];
+    t9 = re[29];
+    t4 = im[29];
+    t0 = t5 + t7;
+    t14 = t6 + t3;
+    t13 = t12 + t9;
+    t10 = t8 + t4;
+    t2 = t5 - t7;
+    t1 = t6 - t3;
+    t11 = t12 - t9;
+    t5 = t8 - t4;
+    t7 = t0 + t13;
+    t6 = t14 + t10;
+    t3 = t2 + t5;
+    t12 = t1 - t11;
+    t9 = t0 - t13;
+    t8 = t14 - t10;
+    t4 = t2 - t5;
+    t0 = t1 + t11;
+    re[224] = t7;
+    im[224] = t6;
+    re[239] = t3;
+    im[239] = t12;
+    re[14] = t9;
+    im[14] = t8;
+    re[29] = t4;
+    im[29] = t0;
+    t13 = re[44];
+    t14 = im[44];
+    t10 = re[59];
+    t2 = im[59];
+    t5 = re[74];
+    t1 = im[74];
+    t11 = re[89];
+    t7 = im[89];
+    t6 = t13 + t5;
+    t3 = t14 + t1;
+    t12 = t10 + t11;
+    t9 = t2 + t7;
+    t8 = t13 - t5;
+    t4 = t14 - t1;
+    t0 = t10 - t11;
+    t13 = t2 - t7;
+    t5 = t6 + t12;
+    t14 = t3 + t9;
+    t1 = t8 + t13;
+    t10 = t4 - t0;
+    t11 = t6 - t12;
+    t2 = t3 - t9;
+    t7 = t8 - t13;
+    t6 = t4 + t0;
+    re[44] = t5;
+    im[44] = t14;
+    re[59] = t1;
+    im[59] = t10;
+    re[74] = t11;
+    im[74] = t2;
+    re[89] = t7;
+    im[89] = t6;
+    t12 = re[104];
+    t3 = im[104];
+    t9 = re[119];
+    t8 = im[119];
+    t13 = re[134];
+    t4 = im[134];
+    t0 = re[149];
+    t5 = im[149];
+    t14 = t12 + t13;
+    t1 = t3 + t4;
+    t10 = t9 + t0;
+    t11 = t8 + t5;
+    t2 = t12 - t13;
+    t7 = t3 - t4;
+    t6 = t9 - t0;
+    t12 = t8 - t5;
+    t13 = t14 + t10;
+    t3 = t1 + t11;
+    t4 = t2 + t12;
+    t9 = t7 - t6;
+    t0 = t14 - t10;
+    t8 = t1 - t11;
+    t5 = t2 - t12;
+    t14 = t7 + t6;
+    re[104] = t13;
+    im[104] = t3;
+    re[119] = t4;
+    im[119] = t9;
+    re[134] = t0;
+    im[134] = t8;
+    re[149] = t5;
+    im[149] = t14;
+    t10 = re[164];
+    t1 = im[164];
+    t11 = re[179];
+    t2 = im[179];
+    t12 = re[194];
+    t7 = im[194];
+    t6 = re[209];
+    t13 = im[209];
+    t3 = t10 + t12;
+    t4 = t1 + t7;
+    t9 = t11 + t6;
+    t0 = t2 + t13;
+    t8 = t10 - t12;
+    t5 = t1 - t7;
+    t14 = t11 - t6;
+    t10 = t2 - t13;
+    t12 = t3 + t9;
+    t1 = t4 + t0;
+    t7 = t8 + t10;
+    t11 = t5 - t14;
+    t6 = t3 - t9;
+    t2 = t4 - t0;
+    t13 = t8 - t10;
+    t3 = t5 + t14;
+    re[164] = t12;
+    im[164] = t1;
+    re[179] = t7;
+    im[179] = t11;
+    re[194] = t6;
+    im[194] = t2;
+    re[209] = t13;
+    im[209] = t3;
+    t9 = X[64];
+    t4 = X[415];
+    t0 = C133 * t9;
+    t8 = C134 * t4;
+    t10 = t0 + t8;
+    t5 = (-C134) * t9;
+    t14 = C133 * t4;
+    t12 = t5 + t14;
+    t1 = X[184];
+    t7 = X[295];
+    t11 = C135 * t1;
+    t6 = C136 * t7;
+    t2 = t11 + t6;
+    t13 = (-C136) * t1;
+    t3 = C135 * t7;
+    t0 = t13 + t3;
+    t8 = X[304];
+    t9 = X[175];
+    t4 = C137 * t8;
+    t5 = C138 * t9;
+    t14 = t4 + t5;
+    t11 = (-C138) * t8;
+    t6 = C137 * t9;
+    t1 = t11 + t6;
+    t7 = X[424];
+    t13 = X[55];
+    t3 = C139 * t7;
+    t4 = C140 * t13;
+    t5 = t3 + t4;
+    t8 = (-C140) * t7;
+    t9 = C139 * t13;
+    t11 = t8 + t9;
+    t6 = t10 + t14;
+    t3 = t12 + t1;
+    t4 = t2 + t5;
+    t7 = t0 + t11;
+    t13 = t10 - t14;
+    t8 = t12 - t1;
+    t9 = t2 - t5;
+    t10 = t0 - t11;
+    t14 = t6 + t4;
+    t12 = t3 + t7;
+    t1 = t13 + t10;
+    t2 = t8 - t9;
+    t5 = t6 - t4;
+    t0 = t3 - t7;
+    t11 = t13 - t10;
+    t6 = t8 + t9;
+    re[32] = t14;
+    im[32] = t12;
+    re[92] = t1;
+    im[92] = t2;
+    re[152] = t5;
+    im[152] = t0;
+    re[212] = t11;
+    im[212] = t6;
+    t4 = X[94];
+    t3 = X[385];
+    t7 = C141 * t4;
+    t13 = C142 * t3;
+    t10 = t7 + t13;
+    t8 = (-C142) * t4;
+    t9 = C141 * t3;
+    t14 = t8 + t9;
+    t12 = X[214];
+    t1 = X[265];
+    t2 = C143 * t12;
+    t5 = C144 * t1;
+    t0 = t2 + t5;
+    t11 = (-C144) * t12;
+    t6 = C143 * t1;
+    t7 = t11 + t6;
+    t13 = X[334];
+    t4 = X[145];
+    t3 = C145 * t13;
+    t8 = C146 * t4;
+    t9 = t3 + t8;
+    t2 = (-C146) * t13;
+    t5 = C145 * t4;
+    t12 = t2 + t5;
+    t1 = X[454];
+    t11 = X[25];
+    t6 = C147 * t1;
+    t3 = C148 * t11;
+    t8 = t6 + t3;
+    t13 = (-C148) * t1;
+    t4 = C147 * t11;
+    t2 = t13 + t4;
+    t5 = t10 + t9;
+    t6 = t14 + t12;
+    t3 = t0 + t8;
+    t1 = t7 + t2;
+    t11 = t10 - t9;
+    t13 = t14 - t12;
+    t4 = t0 - t8;
+    t10 = t7 - t2;
+    t9 = t5 + t3;
+    t14 = t6 + t1;
+    t12 = t11 + t10;
+    t0 = t13 - t4;
+    t8 = t5 - t3;
+    t7 = t6 - t1;
+    t2 = t11 - t10;
+    t5 = t13 + t4;
+    t3 = t12 + t0;
+    t6 = C16 * t3;
+    t1 = t12 * (-C17);
+    t11 = t0 * C18;
+    t10 = t6 - t11;
+    t13 = t6 + t1;
+    t4 = t8 + t7;
+    t3 = t8 - t7;
+    t12 = C19 * t4;
+    t0 = (-C19) * t3;
+    t11 = t2 + t5;
+    t6 = C20 * t11;
+    t1 = t2 * (-C17);
+    t8 = t5 * (-C18);
+    t7 = t6 - t8;
+    t4 = t6 + t1;
+    re[47] = t9;
+    im[47] = t14;
+    re[107] = t10;
+    im[107] = t13;
+    re[167] = t12;
+    im[167] = t0;
+    re[227] = t7;
+    im[227] = t4;
+    t3 = X[124];
+    t11 = X[355];
+    t2 = C149 * t3;
+    t5 = C150 * t11;
+    t8 = t2 + t5;
+    t6 = (-C150) * t3;
+    t1 = C149 * t11;
+    t9 = t6 + t1;
+    t14 = X[244];
+    t10 = X[235];
+    t13 = C151 * t14;
+    t12 = C152 * t10;
+    t0 = t13 + t12;
+    t7 = (-C152) * t14;
+    t4 = C151 * t10;
+    t2 = t7 + t4;
+    t5 = X[364];
+    t3 = X[115];
+    t11 = C153 * t5;
+    t6 = C154 * t3;
+    t1 = t11 + t6;
+    t13 = (-C154) * t5;
+    t12 = C153 * t3;
+    t14 = t13 + t12;
+    t10 = X[4];
+    t7 = X[475];
+    t4 = C155 * t10;
+    t11 = C156 * t7;
+    t6 = t4 + t11;
+    t5 = (-C156) * t10;
+    t3 = C155 * t7;
+    t13 = t5 + t3;
+    t12 = t8 + t1;
+    t4 = t9 + t14;
+    t11 = t0 + t6;
+    t10 = t2 + t13;
+    t7 = t8 - t1;
+    t5 = t9 - t14;
+    t3 = t0 - t6;
+    t8 = t2 - t13;
+    t1 = t12 + t11;
+    t9 = t4 + t10;
+    t14 = t7 + t8;
+    t0 = t5 - t3;
+    t6 = t12 - t11;
+    t2 = t4 - t10;
+    t13 = t7 - t8;
+    t12 = t5 + t3;
+    t11 = t14 + t0;
+    t4 = t14 - t0;
+    t10 = C19 * t11;
+    t7 = (-C19) * t4;
+    t8 = -t6;
+    t5 = t13 - t12;
+    t3 = t13 + t12;
+    t14 = (-C19) * t5;
+    t0 = (-C19) * t3;
+    re[62] = t1;
+    im[62] = t9;
+    re[122] = t10;
+    im[122] = t7;
+    re[182] = t2;
+    im[182] = t8;
+    re[2] = t14;
+    im[2] = t0;
+    t11 = X[154];
+    t4 = X[325];
+    t6 = C157 * t11;
+    t13 = C158 * t4;
+    t12 = t6 + t13;
+    t5 = (-C158) * t11;
+    t3 = C157 * t4;
+    t1 = t5 + t3;
+    t9 = X[274];
+    t10 = X[205];
+    t7 = C159 * t9;
+    t2 = C160 * t10;
+    t8 = t7 + t2;
+    t14 = (-C160) * t9;
+    t0 = C159 * t10;
+    t6 = t14 + t0;
+    t13 = X[394];
+    t11 = X[85];
+    t4 = C161 * t13;
+    t5 = C162 * t11;
+    t3 = t4 + t5;
+    t7 = (-C162) * t13;
+    t2 = C161 * t11;
+    t9 = t7 + t2;
+    t10 = X[34];
+    t14 = X[445];
+    t0 = C163 * t10;
+    t4 = C164 * t14;
+    t5 = t0 + t4;
+    t13 = (-C164) * t10;
+    t11 = C163 * t14;
+    t7 = t13 + t11;
+    t2 = t12 + t3;
+    t0 = t1 + t9;
+    t4 = t8 + t5;
+    t10 = t6 + t7;
+    t14 = t12 - t3;
+    t13 = t1 - t9;
+    t11 = t8 - t5;
+    t12 = t6 - t7;
+    t3 = t2 + t4;
+    t1 = t0 + t10;
+    t9 = t14 + t12;
+    t8 = t13 - t11;
+    t5 = t2 - t4;
+    t6 = t0 - t10;
+    t7 = t14 - t12;
+    t2 = t13 + t11;
+    t4 = t9 + t8;
+    t0 = C20 * t4;
+    t10 = t9 * (-C17);
+    t14 = t8 * (-C18);
+    t12 = t0 - t14;
+    t13 = t0 + t10;
+    t11 = t5 - t6;
+    t4 = t5 + t6;
+    t9 = (-C19) * t11;
+    t8 = (-C19) * t4;
+    t14 = t7 + t2;
+    t0 = (-C16) * t14;
+    t10 = t7 * C17;
+    t5 = t2 * (-C18);
+    t6 = t0 - t5;
+    t11 = t0 + t10;
+    re[77] = t3;
+    im[77] = t1;
+    re[137] = t12;
+    im[137] = t13;
+    re[197] = t9;
+    im[197] = t8;
+    re[17] = t6;
+    im[17] = t11;
+    t4 = re[32];
+    t14 = im[32];
+    t7 = re[47];
+    t2 = im[47];
+    t5 = re[62];
+    t0 = im[62];
+    t10 = re[77];
+    t3 = im[77];
+    t1 = t4 + t5;
+    t12 = t14 + t0;
+    t13 = t7 + t10;
+    t9 = t2 + t3;
+    t8 = t4 - t5;
+    t6 = t14 - t0;
+    t11 = t7 - t10;
+    t4 = t2 - t3;
+    t5 = t1 + t13;
+    t14 = t12 + t9;
+    t0 = t8 + t4;
+    t7 = t6 - t11;
+    t10 = t1 - t13;
+    t2 = t12 - t9;
+    t3 = t8 - t4;
+    t1 = t6 + t11;
+    re[32] = t5;
+    im[32] = t14;
+    re[47] = t0;
+    im[47] = t7;
+    re[62] = t10;
+    im[62] = t2;
+    re[77] = t3;
+    im[77] = t1;
+    t13 = re[92];
+    t12 = im[92];
+    t9 = re[107];
+    t8 = im[107];
+    t4 = re[122];
+    t6 = im[122];
+    t11 = re[137];
+    t5 = im[137];
+    t14 = t13 + t4;
+    t0 = t12 + t6;
+    t7 = t9 + t11;
+    t10 = t8 + t5;
+    t2 = t13 - t4;
+    t3 = t12 - t6;
+    t1 = t9 - t11;
+    t13 = t8 - t5;
+    t4 = t14 + t7;
+    t12 = t0 + t10;
+    t6 = t2 + t13;
+    t9 = t3 - t1;
+    t11 = t14 - t7;
+    t8 = t0 - t10;
+    t5 = t2 - t13;
+    t14 = t3 + t1;
+    re[92] = t4;
+    im[92] = t12;
+    re[107] = t6;
+    im[107] = t9;
+    re[122] = t11;
+    im[122] = t8;
+    re[137] = t5;
+    im[137] = t14;
+    t7 = re[152];
+    t0 = im[152];
+    t10 = re[167];
+    t2 = im[167];
+    t13 = re[182];
+    t3 = im[182];
+    t1 = re[197];
+    t4 = im[197];
+    t12 = t7 + t13;
+    t6 = t0 + t3;
+    t9 = t10 + t1;
+    t11 = t2 + t4;
+    t8 = t7 - t13;
+    t5 = t0 - t3;
+    t14 = t10 - t1;
+    t7 = t2 - t4;
+    t13 = t12 + t9;
+    t0 = t6 + t11;
+    t3 = t8 + t7;
+    t10 = t5 - t14;
+    t1 = t12 - t9;
+    t2 = t6 - t11;
+    t4 = t8 - t7;
+    t12 = t5 + t14;
+    re[152] = t13;
+    im[152] = t0;
+    re[167] = t3;
+    im[167] = t10;
+    re[182] = t1;
+    im[182] = t2;
+    re[197] = t4;
+    im[197] = t12;
+    t9 = re[212];
+    t6 = im[212];
+    t11 = re[227];
+    t8 = im[227];
+    t7 = re[2];
+    t5 = im[2];
+    t14 = re[17];
+    t13 = im[17];
+    t0 = t9 + t7;
+    t3 = t6 + t5;
+    t10 = t11 + t14;
+    t1 = t8 + t13;
+    t2 = t9 - t7;
+    t4 = t6 - t5;
+    t12 = t11 - t14;
+    t9 = t8 - t13;
+    t7 = t0 + t10;
+    t6 = t3 + t1;
+    t5 = t2 + t9;
+    t11 = t4 - t12;
+    t14 = t0 - t10;
+    t8 = t3 - t1;
+    t13 = t2 - t9;
+    t0 = t4 + t12;
+    re[212] = t7;
+    im[212] = t6;
+    re[227] = t5;
+    im[227] = t11;
+    re[2] = t14;
+    im[2] = t8;
+    re[17] = t13;
+    im[17] = t0;
+}
+
+/**
+ *  Part 4 of ApplyWindowedIMDCT_W10_480().
+ * 
+ *  @param {Number[]} X 
+ *    - The input block (480 points).
+ *  @param {Number[]} y 
+ *    - The array that would contain the output block (960 points).
+ *  @param {Number[]} re 
+ *    - The scratch buffer (real part, 240 points).
+ *  @param {Number[]} im 
+ *    - The scratch buffer (imaginary part, 240 points).
+ */
+function ApplyWindowedIMDCT_W10_480_Part4(X, y, re, im) {
+    let t0, t1, t10, t11, t12, t13, t14, t2, t3, t4, t5, t6, t7, t8, t9;
+    const C0 = 0.5590169943749475;
+    const C1 = 0.25;
+    const C2 = 0.9510565162951535;
+    const C3 = 0.5877852522924731;
+    t10 = re[80];
+    t3 = im[80];
+    t1 = re[128];
+    t2 = im[128];
+    t9 = re[176];
+    t4 = im[176];
+    t12 = re[224];
+    t7 = im[224];
+    t6 = re[32];
+    t5 = im[32];
+    t11 = t1 + t6;
+    t14 = t2 + t5;
+    t8 = t9 + t12;
+    t13 = t4 + t7;
+    t0 = t1 - t6;
+    t1 = t2 - t5;
+    t6 = t9 - t12;
+    t2 = t4 - t7;
+    t5 = t11 + t8;
+    t9 = t14 + t13;
+    t12 = t11 - t8;
+    t4 = C0 * t12;
+    t7 = t14 - t13;
+    t11 = C0 * t7;
+    t8 = C1 * t5;
+    t12 = t10 - t8;
+    t14 = C1 * t9;
+    t13 = t3 - t14;
+    t7 = t12 + t4;
+    t8 = t13 + t11;
+    t14 = t12 - t4;
+    t12 = t13 - t11;
+    t4 = C2 * t0;
+    t13 = C3 * t6;
+    t11 = t4 + t13;
+    t4 = C2 * t1;
+    t13 = C3 * t2;
+    t4 = t4 + t13;
+    t13 = C3 * t0;
+    t0 = C2 * t6;
+    t6 = t13 - t0;
+    t13 = C3 * t1;
+    t0 = C2 * t2;
+    t1 = t13 - t0;
+    t2 = t10 + t5;
+    t13 = t3 + t9;
+    t0 = t7 + t4;
+    t10 = t8 - t11;
+    t5 = t14 + t1;
+    t3 = t12 - t6;
+    t9 = t14 - t1;
+    t14 = t12 + t6;
+    t1 = t7 - t4;
+    t12 = t8 + t11;
+    re[80] = t2;
+    im[80] = t13;
+    re[128] = t0;
+    im[128] = t10;
+    re[176] = t5;
+    im[176] = t3;
+    re[224] = t9;
+    im[224] = t14;
+    re[32] = t1;
+    im[32] = t12;
+    t6 = re[140];
+    t7 = im[140];
+    t4 = re[188];
+    t8 = im[188];
+    t11 = re[236];
+    t2 = im[236];
+    t13 = re[44];
+    t0 = im[44];
+    t10 = re[92];
+    t5 = im[92];
+    t3 = t4 + t10;
+    t9 = t8 + t5;
+    t14 = t11 + t13;
+    t1 = t2 + t0;
+    t12 = t4 - t10;
+    t4 = t8 - t5;
+    t10 = t11 - t13;
+    t8 = t2 - t0;
+    t5 = t3 + t14;
+    t11 = t9 + t1;
+    t13 = t3 - t14;
+    t2 = C0 * t13;
+    t0 = t9 - t1;
+    t3 = C0 * t0;
+    t14 = C1 * t5;
+    t13 = t6 - t14;
+    t9 = C1 * t11;
+    t1 = t7 - t9;
+    t0 = t13 + t2;
+    t14 = t1 + t3;
+    t9 = t13 - t2;
+    t13 = t1 - t3;
+    t2 = C2 * t12;
+    t1 = C3 * t10;
+    t3 = t2 + t1;
+    t2 = C2 * t4;
+    t1 = C3 * t8;
+    t2 = t2 + t1;
+    t1 = C3 * t12;
+    t12 = C2 * t10;
+    t10 = t1 - t12;
+    t1 = C3 * t4;
+    t12 = C2 * t8;
+    t4 = t1 - t12;
+    t8 = t6 + t5;
+    t1 = t7 + t11;
+    t12 = t0 + t2;
+    t6 = t14 - t3;
+    t5 = t9 + t4;
+    t7 = t13 - t10;
+    t11 = t9 - t4;
+    t9 = t13 + t10;
+    t4 = t0 - t2;
+    t13 = t14 + t3;
+    re[140] = t8;
+    im[140] = t1;
+    re[188] = t12;
+    im[188] = t6;
+    re[236] = t5;
+    im[236] = t7;
+    re[44] = t11;
+    im[44] = t9;
+    re[92] = t4;
+    im[92] = t13;
+    t10 = re[200];
+    t0 = im[200];
+    t2 = re[8];
+    t14 = im[8];
+    t3 = re[56];
+    t8 = im[56];
+    t1 = re[104];
+    t12 = im[104];
+    t6 = re[152];
+    t5 = im[152];
+    t7 = t2 + t6;
+    t11 = t14 + t5;
+    t9 = t3 + t1;
+    t4 = t8 + t12;
+    t13 = t2 - t6;
+    t2 = t14 - t5;
+    t6 = t3 - t1;
+    t14 = t8 - t12;
+    t5 = t7 + t9;
+    t3 = t11 + t4;
+    t1 = t7 - t9;
+    t8 = C0 * t1;
+    t12 = t11 - t4;
+    t7 = C0 * t12;
+    t9 = C1 * t5;
+    t1 = t10 - t9;
+    t11 = C1 * t3;
+    t4 = t0 - t11;
+    t12 = t1 + t8;
+    t9 = t4 + t7;
+    t11 = t1 - t8;
+    t1 = t4 - t7;
+    t8 = C2 * t13;
+    t4 = C3 * t6;
+    t7 = t8 + t4;
+    t8 = C2 * t2;
+    t4 = C3 * t14;
+    t8 = t8 + t4;
+    t4 = C3 * t13;
+    t13 = C2 * t6;
+    t6 = t4 - t13;
+    t4 = C3 * t2;
+    t13 = C2 * t14;
+    t2 = t4 - t13;
+    t14 = t10 + t5;
+    t4 = t0 + t3;
+    t13 = t12 + t8;
+    t10 = t9 - t7;
+    t5 = t11 + t2;
+    t0 = t1 - t6;
+    t3 = t11 - t2;
+    t11 = t1 + t6;
+    t2 = t12 - t8;
+    t1 = t9 + t7;
+    re[200] = t14;
+    im[200] = t4;
+    re[8] = t13;
+    im[8] = t10;
+    re[56] = t5;
+    im[56] = t0;
+    re[104] = t3;
+    im[104] = t11;
+    re[152] = t2;
+    im[152] = t1;
+    t6 = re[20];
+    t12 = im[20];
+    t8 = re[68];
+    t9 = im[68];
+    t7 = re[116];
+    t14 = im[116];
+    t4 = re[164];
+    t13 = im[164];
+    t10 = re[212];
+    t5 = im[212];
+    t0 = t8 + t10;
+    t3 = t9 + t5;
+    t11 = t7 + t4;
+    t2 = t14 + t13;
+    t1 = t8 - t10;
+    t8 = t9 - t5;
+    t10 = t7 - t4;
+    t9 = t14 - t13;
+    t5 = t0 + t11;
+    t7 = t3 + t2;
+    t4 = t0 - t11;
+    t14 = C0 * t4;
+    t13 = t3 - t2;
+    t0 = C0 * t13;
+    t11 = C1 * t5;
+    t4 = t6 - t11;
+    t3 = C1 * t7;
+    t2 = t12 - t3;
+    t13 = t4 + t14;
+    t11 = t2 + t0;
+    t3 = t4 - t14;
+    t4 = t2 - t0;
+    t14 = C2 * t1;
+    t2 = C3 * t10;
+    t0 = t14 + t2;
+    t14 = C2 * t8;
+    t2 = C3 * t9;
+    t14 = t14 + t2;
+    t2 = C3 * t1;
+    t1 = C2 * t10;
+    t10 = t2 - t1;
+    t2 = C3 * t8;
+    t1 = C2 * t9;
+    t8 = t2 - t1;
+    t9 = t6 + t5;
+    t2 = t12 + t7;
+    t1 = t13 + t14;
+    t6 = t11 - t0;
+    t5 = t3 + t8;
+    t12 = t4 - t10;
+    t7 = t3 - t8;
+    t3 = t4 + t10;
+    t8 = t13 - t14;
+    t4 = t11 + t0;
+    re[20] = t9;
+    im[20] = t2;
+    re[68] = t1;
+    im[68] = t6;
+    re[116] = t5;
+    im[116] = t12;
+    re[164] = t7;
+    im[164] = t3;
+    re[212] = t8;
+    im[212] = t4;
+    t10 = re[95];
+    t13 = im[95];
+    t14 = re[143];
+    t11 = im[143];
+    t0 = re[191];
+    t9 = im[191];
+    t2 = re[239];
+    t1 = im[239];
+    t6 = re[47];
+    t5 = im[47];
+    t12 = t14 + t6;
+    t7 = t11 + t5;
+    t3 = t0 + t2;
+    t8 = t9 + t1;
+    t4 = t14 - t6;
+    t14 = t11 - t5;
+    t6 = t0 - t2;
+    t11 = t9 - t1;
+    t5 = t12 + t3;
+    t0 = t7 + t8;
+    t2 = t12 - t3;
+    t9 = C0 * t2;
+    t1 = t7 - t8;
+    t12 = C0 * t1;
+    t3 = C1 * t5;
+    t2 = t10 - t3;
+    t7 = C1 * t0;
+    t8 = t13 - t7;
+    t1 = t2 + t9;
+    t3 = t8 + t12;
+    t7 = t2 - t9;
+    t2 = t8 - t12;
+    t9 = C2 * t4;
+    t8 = C3 * t6;
+    t12 = t9 + t8;
+    t9 = C2 * t14;
+    t8 = C3 * t11;
+    t9 = t9 + t8;
+    t8 = C3 * t4;
+    t4 = C2 * t6;
+    t6 = t8 - t4;
+    t8 = C3 * t14;
+    t4 = C2 * t11;
+    t14 = t8 - t4;
+    t11 = t10 + t5;
+    t8 = t13 + t0;
+    t4 = t1 + t9;
+    t10 = t3 - t12;
+    t5 = t7 + t14;
+    t13 = t2 - t6;
+    t0 = t7 - t14;
+    t7 = t2 + t6;
+    t14 = t1 - t9;
+    t2 = t3 + t12;
+    re[95] = t11;
+    im[95] = t8;
+    re[143] = t4;
+    im[143] = t10;
+    re[191] = t5;
+    im[191] = t13;
+    re[239] = t0;
+    im[239] = t7;
+    re[47] = t14;
+    im[47] = t2;
+    t6 = re[155];
+    t1 = im[155];
+    t9 = re[203];
+    t3 = im[203];
+    t12 = re[11];
+    t11 = im[11];
+    t8 = re[59];
+    t4 = im[59];
+    t10 = re[107];
+    t5 = im[107];
+    t13 = t9 + t10;
+    t0 = t3 + t5;
+    t7 = t12 + t8;
+    t14 = t11 + t4;
+    t2 = t9 - t10;
+    t9 = t3 - t5;
+    t10 = t12 - t8;
+    t3 = t11 - t4;
+    t5 = t13 + t7;
+    t12 = t0 + t14;
+    t8 = t13 - t7;
+    t11 = C0 * t8;
+    t4 = t0 - t14;
+    t13 = C0 * t4;
+    t7 = C1 * t5;
+    t8 = t6 - t7;
+    t0 = C1 * t12;
+    t14 = t1 - t0;
+    t4 = t8 + t11;
+    t7 = t14 + t13;
+    t0 = t8 - t11;
+    t8 = t14 - t13;
+    t11 = C2 * t2;
+    t14 = C3 * t10;
+    t13 = t11 + t14;
+    t11 = C2 * t9;
+    t14 = C3 * t3;
+    t11 = t11 + t14;
+    t14 = C3 * t2;
+    t2 = C2 * t10;
+    t10 = t14 - t2;
+    t14 = C3 * t9;
+    t2 = C2 * t3;
+    t9 = t14 - t2;
+    t3 = t6 + t5;
+    t14 = t1 + t12;
+    t2 = t4 + t11;
+    t6 = t7 - t13;
+    t5 = t0 + t9;
+    t1 = t8 - t10;
+    t12 = t0 - t9;
+    t0 = t8 + t10;
+    t9 = t4 - t11;
+    t8 = t7 + t13;
+    re[155] = t3;
+    im[155] = t14;
+    re[203] = t2;
+    im[203] = t6;
+    re[11] = t5;
+    im[11] = t1;
+    re[59] = t12;
+    im[59] = t0;
+    re[107] = t9;
+    im[107] = t8;
+    t10 = re[215];
+    t4 = im[215];
+    t11 = re[23];
+    t7 = im[23];
+    t13 = re[71];
+    t3 = im[71];
+    t14 = re[119];
+    t2 = im[119];
+    t6 = re[167];
+    t5 = im[167];
+    t1 = t11 + t6;
+    t12 = t7 + t5;
+    t0 = t13 + t14;
+    t9 = t3 + t2;
+    t8 = t11 - t6;
+    t11 = t7 - t5;
+    t6 = t13 - t14;
+    t7 = t3 - t2;
+    t5 = t1 + t0;
+    t13 = t12 + t9;
+    t14 = t1 - t0;
+    t3 = C0 * t14;
+    t2 = t12 - t9;
+    t1 = C0 * t2;
+    t0 = C1 * t5;
+    t14 = t10 - t0;
+    t12 = C1 * t13;
+    t9 = t4 - t12;
+    t2 = t14 + t3;
+    t0 = t9 + t1;
+    t12 = t14 - t3;
+    t14 = t9 - t1;
+    t3 = C2 * t8;
+    t9 = C3 * t6;
+    t1 = t3 + t9;
+    t3 = C2 * t11;
+    t9 = C3 * t7;
+    t3 = t3 + t9;
+    t9 = C3 * t8;
+    t8 = C2 * t6;
+    t6 = t9 - t8;
+    t9 = C3 * t11;
+    t8 = C2 * t7;
+    t11 = t9 - t8;
+    t7 = t10 + t5;
+    t9 = t4 + t13;
+    t8 = t2 + t3;
+    t10 = t0 - t1;
+    t5 = t12 + t11;
+    t4 = t14 - t6;
+    t13 = t12 - t11;
+    t12 = t14 + t6;
+    t11 = t2 - t3;
+    t14 = t0 + t1;
+    re[215] = t7;
+    im[215] = t9;
+    re[23] = t8;
+    im[23] = t10;
+    re[71] = t5;
+    im[71] = t4;
+    re[119] = t13;
+    im[119] = t12;
+    re[167] = t11;
+    im[167] = t14;
+    t6 = re[35];
+    t2 = im[35];
+    t3 = re[83];
+    t0 = im[83];
+    t1 = re[131];
+    t7 = im[131];
+    t9 = re[179];
+    t8 = im[179];
+    t10 = re[227];
+    t5 = im[227];
+    t4 = t3 + t10;
+    t13 = t0 + t5;
+    t12 = t1 + t9;
+    t11 = t7 + t8;
+    t14 = t3 - t10;
+    t3 = t0 - t5;
+    t10 = t1 - t9;
+    t0 = t7 - t8;
+    t5 = t4 + t12;
+    t1 = t13 + t11;
+    t9 = t4 - t12;
+    t7 = C0 * t9;
+    t8 = t13 - t11;
+    t4 = C0 * t8;
+    t12 = C1 * t5;
+    t9 = t6 - t12;
+    t13 = C1 * t1;
+    t11 = t2 - t13;
+    t8 = t9 + t7;
+    t12 = t11 + t4;
+    t13 = t9 - t7;
+    t9 = t11 - t4;
+    t7 = C2 * t14;
+    t11 = C3 * t10;
+    t4 = t7 + t11;
+    t7 = C2 * t3;
+    t11 = C3 * t0;
+    t7 = t7 + t11;
+    t11 = C3 * t14;
+    t14 = C2 * t10;
+    t10 = t11 - t14;
+    t11 = C3 * t3;
+    t14 = C2 * t0;
+    t3 = t11 - t14;
+    t0 = t6 + t5;
+    t11 = t2 + t1;
+    t14 = t8 + t7;
+    t6 = t12 - t4;
+    t5 = t13 + t3;
+    t2 = t9 - t10;
+    t1 = t13 - t3;
+    t13 = t9 + t10;
+    t3 = t8 - t7;
+    t9 = t12 + t4;
+    re[35] = t0;
+    im[35] = t11;
+    re[83] = t14;
+    im[83] = t6;
+    re[131] = t5;
+    im[131] = t2;
+    re[179] = t1;
+    im[179] = t13;
+    re[227] = t3;
+    im[227] = t9;
+    t10 = re[110];
+    t8 = im[110];
+    t7 = re[158];
+    t12 = im[158];
+    t4 = re[206];
+    t0 = im[206];
+    t11 = re[14];
+    t14 = im[14];
+    t6 = re[62];
+    t5 = im[62];
+    t2 = t7 + t6;
+    t1 = t12 + t5;
+    t13 = t4 + t11;
+    t3 = t0 + t14;
+    t9 = t7 - t6;
+    t7 = t12 - t5;
+    t6 = t4 - t11;
+    t12 = t0 - t14;
+    t5 = t2 + t13;
+    t4 = t1 + t3;
+    t11 = t2 - t13;
+    t0 = C0 * t11;
+    t14 = t1 - t3;
+    t2 = C0 * t14;
+    t13 = C1 * t5;
+    t11 = t10 - t13;
+    t1 = C1 * t4;
+    t3 = t8 - t1;
+    t14 = t11 + t0;
+    t13 = t3 + t2;
+    t1 = t11 - t0;
+    t11 = t3 - t2;
+    t0 = C2 * t9;
+    t3 = C3 * t6;
+    t2 = t0 + t3;
+    t0 = C2 * t7;
+    t3 = C3 * t12;
+    t0 = t0 + t3;
+    t3 = C3 * t9;
+    t9 = C2 * t6;
+    t6 = t3 - t9;
+    t3 = C3 * t7;
+    t9 = C2 * t12;
+    t7 = t3 - t9;
+    t12 = t10 + t5;
+    t3 = t8 + t4;
+    t9 = t14 + t0;
+    t10 = t13 - t2;
+    t5 = t1 + t7;
+    t8 = t11 - t6;
+    t4 = t1 - t7;
+    t1 = t11 + t6;
+    t7 = t14 - t0;
+    t11 = t13 + t2;
+    re[110] = t12;
+    im[110] = t3;
+    re[158] = t9;
+    im[158] = t10;
+    re[206] = t5;
+    im[206] = t8;
+    re[14] = t4;
+    im[14] = t1;
+    re[62] = t7;
+    im[62] = t11;
+    t6 = re[170];
+    t14 = im[170];
+    t0 = re[218];
+    t13 = im[218];
+    t2 = re[26];
+    t12 = im[26];
+    t3 = re[74];
+    t9 = im[74];
+    t10 = re[122];
+    t5 = im[122];
+    t8 = t0 + t10;
+    t4 = t13 + t5;
+    t1 = t2 + t3;
+    t7 = t12 + t9;
+    t11 = t0 - t10;
+    t0 = t13 - t5;
+    t10 = t2 - t3;
+    t13 = t12 - t9;
+    t5 = t8 + t1;
+    t2 = t4 + t7;
+    t3 = t8 - t1;
+    t12 = C0 * t3;
+    t9 = t4 - t7;
+    t8 = C0 * t9;
+    t1 = C1 * t5;
+    t3 = t6 - t1;
+    t4 = C1 * t2;
+    t7 = t14 - t4;
+    t9 = t3 + t12;
+    t1 = t7 + t8;
+    t4 = t3 - t12;
+    t3 = t7 - t8;
+    t12 = C2 * t11;
+    t7 = C3 * t10;
+    t8 = t12 + t7;
+    t12 = C2 * t0;
+    t7 = C3 * t13;
+    t12 = t12 + t7;
+    t7 = C3 * t11;
+    t11 = C2 * t10;
+    t10 = t7 - t11;
+    t7 = C3 * t0;
+    t11 = C2 * t13;
+    t0 = t7 - t11;
+    t13 = t6 + t5;
+    t7 = t14 + t2;
+    t11 = t9 + t12;
+    t6 = t1 - t8;
+    t5 = t4 + t0;
+    t14 = t3 - t10;
+    t2 = t4 - t0;
+    t4 = t3 + t10;
+    t0 = t9 - t12;
+    t3 = t1 + t8;
+    re[170] = t13;
+    im[170] = t7;
+    re[218] = t11;
+    im[218] = t6;
+    re[26] = t5;
+    im[26] = t14;
+    re[74] = t2;
+    im[74] = t4;
+    re[122] = t0;
+    im[122] = t3;
+    t10 = re[230];
+    t9 = im[230];
+    t12 = re[38];
+    t1 = im[38];
+    t8 = re[86];
+    t13 = im[86];
+    t7 = re[134];
+    t11 = im[134];
+    t6 = re[182];
+    t5 = im[182];
+    t14 = t12 + t6;
+    t2 = t1 + t5;
+    t4 = t8 + t7;
+    t0 = t13 + t11;
+    t3 = t12 - t6;
+    t12 = t1 - t5;
+    t6 = t8 - t7;
+    t1 = t13 - t11;
+    t5 = t14 + t4;
+    t8 = t2 + t0;
+    t7 = t14 - t4;
+    t13 = C0 * t7;
+    t11 = t2 - t0;
+    t14 = C0 * t11;
+    t4 = C1 * t5;
+    t7 = t10 - t4;
+    t2 = C1 * t8;
+    t0 = t9 - t2;
+    t11 = t7 + t13;
+    t4 = t0 + t14;
+    t2 = t7 - t13;
+    t7 = t0 - t14;
+    t13 = C2 * t3;
+    t0 = C3 * t6;
+    t14 = t13 + t0;
+    t13 = C2 * t12;
+    t0 = C3 * t1;
+    t13 = t13 + t0;
+    t0 = C3 * t3;
+    t3 = C2 * t6;
+    t6 = t0 - t3;
+    t0 = C3 * t12;
+    t3 = C2 * t1;
+    t12 = t0 - t3;
+    t1 = t10 + t5;
+    t0 = t9 + t8;
+    t3 = t11 + t13;
+    t10 = t4 - t14;
+    t5 = t2 + t12;
+    t9 = t7 - t6;
+    t8 = t2 - t12;
+    t2 = t7 + t6;
+    t12 = t11 - t13;
+    t7 = t4 + t14;
+    re[230] = t1;
+    im[230] = t0;
+    re[38] = t3;
+    im[38] = t10;
+    re[86] = t5;
+    im[86] = t9;
+    re[134] = t8;
+    im[134] = t2;
+    re[182] = t12;
+    im[182] = t7;
+    t6 = re[50];
+    t11 = im[50];
+    t13 = re[98];
+    t4 = im[98];
+    t14 = re[146];
+    t1 = im[146];
+    t0 = re[194];
+    t3 = im[194];
+    t10 = re[2];
+    t5 = im[2];
+    t9 = t13 + t10;
+    t8 = t4 + t5;
+    t2 = t14 + t0;
+    t12 = t1 + t3;
+    t7 = t13 - t10;
+    t13 = t4 - t5;
+    t10 = t14 - t0;
+    t4 = t1 - t3;
+    t5 = t9 + t2;
+    t14 = t8 + t12;
+    t0 = t9 - t2;
+    t1 = C0 * t0;
+    t3 = t8 - t12;
+    t9 = C0 * t3;
+    t2 = C1 * t5;
+    t0 = t6 - t2;
+    t8 = C1 * t14;
+    t12 = t11 - t8;
+    t3 = t0 + t1;
+    t2 = t12 + t9;
+    t8 = t0 - t1;
+    t0 = t12 - t9;
+    t1 = C2 * t7;
+    t12 = C3 * t10;
+    t9 = t1 + t12;
+    t1 = C2 * t13;
+    t12 = C3 * t4;
+    t1 = t1 + t12;
+    t12 = C3 * t7;
+    t7 = C2 * t10;
+    t10 = t12 - t7;
+    t12 = C3 * t13;
+    t7 = C2 * t4;
+    t13 = t12 - t7;
+    t4 = t6 + t5;
+    t12 = t11 + t14;
+    t7 = t3 + t1;
+    t6 = t2 - t9;
+    t5 = t8 + t13;
+    t11 = t0 - t10;
+    t14 = t8 - t13;
+    t8 = t0 + t10;
+    t13 = t3 - t1;
+    t0 = t2 + t9;
+    re[50] = t4;
+    im[50] = t12;
+    re[98] = t7;
+    im[98] = t6;
+    re[146] = t5;
+    im[146] = t11;
+    re[194] = t14;
+    im[194] = t8;
+    re[2] = t13;
+    im[2] = t0;
+    t10 = re[125];
+    t3 = im[125];
+    t1 = re[173];
+    t2 = im[173];
+    t9 = re[221];
+    t4 = im[221];
+    t12 = re[29];
+    t7 = im[29];
+    t6 = re[77];
+    t5 = im[77];
+    t11 = t1 + t6;
+    t14 = t2 + t5;
+    t8 = t9 + t12;
+    t13 = t4 + t7;
+    t0 = t1 - t6;
+    t1 = t2 - t5;
+    t6 = t9 - t12;
+    t2 = t4 - t7;
+    t5 = t11 + t8;
+    t9 = t14 + t13;
+    t12 = t11 - t8;
+    t4 = C0 * t12;
+    t7 = t14 - t13;
+    t11 = C0 * t7;
+    t8 = C1 * t5;
+    t12 = t10 - t8;
+    t14 = C1 * t9;
+    t13 = t3 - t14;
+    t7 = t12 + t4;
+    t8 = t13 + t11;
+    t14 = t12 - t4;
+    t12 = t13 - t11;
+    t4 = C2 * t0;
+    t13 = C3 * t6;
+    t11 = t4 + t13;
+    t4 = C2 * t1;
+    t13 = C3 * t2;
+    t4 = t4 + t13;
+    t13 = C3 * t0;
+    t0 = C2 * t6;
+    t6 = t13 - t0;
+    t13 = C3 * t1;
+    t0 = C2 * t2;
+    t1 = t13 - t0;
+    t2 = t10 + t5;
+    t13 = t3 + t9;
+    t0 = t7 + t4;
+    t10 = t8 - t11;
+    t5 = t14 + t1;
+    t3 = t12 - t6;
+    t9 = t14 - t1;
+    t14 = t12 + t6;
+    t1 = t7 - t4;
+    t12 = t8 + t11;
+    re[125] = t2;
+    im[125] = t13;
+    re[173] = t0;
+    im[173] = t10;
+    re[221] = t5;
+    im[221] = t3;
+    re[29] = t9;
+    im[29] = t14;
+    re[77] = t1;
+    im[77] = t12;
+    t6 = re[185];
+    t7 = im[185];
+    t4 = re[233];
+    t8 = im[233];
+    t11 = re[41];
+    t2 = im[41];
+    t13 = re[89];
+    t0 = im[89];
+    t10 = re[137];
+    t5 = im[137];
+    t3 = t4 + t10;
+    t9 = t8 + t5;
+    t14 = t11 + t13;
+    t1 = t2 + t0;
+    t12 = t4 - t10;
+    t4 = t8 - t5;
+    t10 = t11 - t13;
+    t8 = t2 - t0;
+    t5 = t3 + t14;
+    t11 = t9 + t1;
+    t13 = t3 - t14;
+    t2 = C0 * t13;
+    t0 = t9 - t1;
+    t3 = C0 * t0;
+    t14 = C1 * t5;
+    t13 = t6 - t14;
+    t9 = C1 * t11;
+    t1 = t7 - t9;
+    t0 = t13 + t2;
+    t14 = t1 + t3;
+    t9 = t13 - t2;
+    t13 = t1 - t3;
+    t2 = C2 * t12;
+    t1 = C3 * t10;
+    t3 = t2 + t1;
+    t2 = C2 * t4;
+    t1 = C3 * t8;
+    t2 = t2 + t1;
+    t1 = C3 * t12;
+    t12 = C2 * t10;
+    t10 = t1 - t12;
+    t1 = C3 * t4;
+    t12 = C2 * t8;
+    t4 = t1 - t12;
+    t8 = t6 + t5;
+    t1 = t7 + t11;
+    t12 = t0 + t2;
+    t6 = t14 - t3;
+    t5 = t9 + t4;
+    t7 = t13 - t10;
+    t11 = t9 - t4;
+    t9 = t13 + t10;
+    t4 = t0 - t2;
+    t13 = t14 + t3;
+    re[185] = t8;
+    im[185] = t1;
+    re[233] = t12;
+    im[233] = t6;
+    re[41] = t5;
+    im[41] = t7;
+    re[89] = t11;
+    im[89] = t9;
+    re[137] = t4;
+    im[137] = t13;
+    t10 = re[5];
+    t0 = im[5];
+    t2 = re[53];
+    t14 = im[53];
+    t3 = re[101];
+    t8 = im[101];
+    t1 = re[149];
+    t12 = im[149];
+    t6 = re[197];
+    t5 = im[197];
+    t7 = t2 + t6;
+    t11 = t14 + t5;
+    t9 = t3 + t1;
+    t4 = t8 + t12;
+    t13 = t2 - t6;
+    t2 = t14 - t5;
+    t6 = t3 - t1;
+    t14 = t8 - t12;
+    t5 = t7 + t9;
+    t3 = t11 + t4;
+    t1 = t7 - t9;
+    t8 = C0 * t1;
+    t12 = t11 - t4;
+    t7 = C0 * t12;
+    t9 = C1 * t5;
+    t1 = t10 - t9;
+    t11 = C1 * t3;
+    t4 = t0 - t11;
+    t12 = t1 + t8;
+    t9 = t4 + t7;
+    t11 = t1 - t8;
+    t1 = t4 - t7;
+    t8 = C2 * t13;
+    t4 = C3 * t6;
+    t7 = t8 + t4;
+    t8 = C2 * t2;
+    t4 = C3 * t14;
+    t8 = t8 + t4;
+    t4 = C3 * t13;
+    t13 = C2 * t6;
+    t6 = t4 - t13;
+    t4 = C3 * t2;
+    t13 = C2 * t14;
+    t2 = t4 - t13;
+    t14 = t10 + t5;
+    t4 = t0 + t3;
+    t13 = t12 + t8;
+    t10 = t9 - t7;
+    t5 = t11 + t2;
+    t0 = t1 - t6;
+    t3 = t11 - t2;
+    t11 = t1 + t6;
+    t2 = t12 - t8;
+    t1 = t9 + t7;
+    re[5] = t14;
+    im[5] = t4;
+    re[53] = t13;
+    im[53] = t10;
+    re[101] = t5;
+    im[101] = t0;
+    re[149] = t3;
+    im[149] = t11;
+    re[197] = t2;
+    im[197] = t1;
+    t6 = re[65];
+    t12 = im[65];
+    t8 = re[113];
+    t9 = im[113];
+    t7 = re[161];
+    t14 = im[161];
+    t4 = re[209];
+    t13 = im[209];
+    t10 = re[17];
+    t5 = im[17];
+    t0 = t8 + t10;
+    t3 = t9 + t5;
+    t11 = t7 + t4;
+    t2 = t14 + t13;
+    t1 = t8 - t10;
+    t8 = t9 - t5;
+    t10 = t7 - t4;
+    t9 = t14 - t13;
+    t5 = t0 + t11;
+    t7 = t3 + t2;
+    t4 = t0 - t11;
+    t14 = C0 * t4;
+    t13 = t3 - t2;
+    t0 = C0 * t13;
+    t11 = C1 * t5;
+    t4 = t6 - t11;
+    t3 = C1 * t7;
+    t2 = t12 - t3;
+    t13 = t4 + t14;
+    t11 = t2 + t0;
+    t3 = t4 - t14;
+    t4 = t2 - t0;
+    t14 = C2 * t1;
+    t2 = C3 * t10;
+    t0 = t14 + t2;
+    t14 = C2 * t8;
+    t2 = C3 * t9;
+    t14 = t14 + t2;
+    t2 = C3 * t1;
+    t1 = C2 * t10;
+    t10 = t2 - t1;
+    t2 = C3 * t8;
+    t1 = C2 * t9;
+    t8 = t2 - t1;
+    t9 = t6 + t5;
+    t2 = t12 + t7;
+    t1 = t13 + t14;
+    t6 = t11 - t0;
+    t5 = t3 + t8;
+    t12 = t4 - t10;
+    t7 = t3 - t8;
+    t3 = t4 + t10;
+    t8 = t13 - t14;
+    t4 = t11 + t0;
+    re[65] = t9;
+    im[65] = t2;
+    re[113] = t1;
+    im[113] = t6;
+    re[161] = t5;
+    im[161] = t12;
+    re[209] = t7;
+    im[209] = t3;
+    re[17] = t8;
+    im[17] = t4;
+}
+
+/**
+ *  Part 5 of ApplyWindowedIMDCT_W10_480().
+ * 
+ *  @param {Number[]} X 
+ *    - The input block (480 points).
+ *  @param {Number[]} y 
+ *    - The array that would contain the output block (960 points).
+ *  @param {Number[]} re 
+ *    - The scratch buffer (real part, 240 points).
+ *  @param {Number[]} im 
+ *    - The scratch buffer (imaginary part, 240 points).
+ */
+function ApplyWindowedIMDCT_W10_480_Part5(X, y, re, im) {
+    let t0, t1, t10, t11, t12, t13, t14, t2, t3, t4, t5, t6, t7, t8, t9;
+    const C0 = 0.49999999999999994;
+    const C1 = 0.8660254037844387;
+    const C2 = 0.13052619222005157;
+    const C3 = 0.9914448613738104;
+    const C4 = 0.9659258262890683;
+    const C5 = 0.25881904510252074;
+    const C6 = 0.7933533402912352;
+    const C7 = 0.6087614290087207;
+    const C8 = 0.41270702980439467;
+    const C9 = 0.9108638249211758;
+    const C10 = 0.03271908282177614;
+    const C11 = 0.9994645874763657;
+    const C12 = 0.9359059267573258;
+    const C13 = 0.3522500479212335;
+    const C14 = 0.7298640726978356;
+    const C15 = 0.6835923020228712;
+    const C16 = 0.9238795325112867;
+    const C17 = 1.3065629648763766;
+    const C18 = 0.5411961001461969;
+    const C19 = 0.7071067811865476;
+    const C20 = 0.3826834323650898;
+    const C21 = 0.3214394653031616;
+    const C22 = 0.9469301294951057;
+    const C23 = 0.9978589232386035;
+    const C24 = 0.06540312923014306;
+    const C25 = 0.8968727415326883;
+    const C26 = 0.4422886902190013;
+    const C27 = 0.6593458151000688;
+    const C28 = 0.7518398074789774;
+    const C29 = 0.22707626303437323;
+    const C30 = 0.9738769792773336;
+    const C31 = 0.986643332084879;
+    const C32 = 0.16289547339458874;
+    const C33 = 0.8492021815265789;
+    const C34 = 0.528067850650368;
+    const C35 = 0.5824776968678022;
+    const C36 = 0.8128466845916152;
+    const C37 = 0.20791169081775931;
+    const C38 = 0.9781476007338057;
+    const C39 = 0.9832549075639546;
+    const C40 = 0.18223552549214747;
+    const C41 = 0.838670567945424;
+    const C42 = 0.544639035015027;
+    const C43 = 0.5664062369248328;
+    const C44 = 0.8241261886220156;
+    const C45 = 0.11103530855427768;
+    const C46 = 0.9938164620563781;
+    const C47 = 0.9606580613579353;
+    const C48 = 0.2777338458812922;
+    const C49 = 0.7812481792047586;
+    const C50 = 0.6242205399450176;
+    const C51 = 0.4829003438000374;
+    const C52 = 0.8756753153753997;
+    const C53 = 0.01308959557134444;
+    const C54 = 0.999914327574007;
+    const C55 = 0.9288095528719242;
+    const C56 = 0.3705574375098362;
+    const C57 = 0.7163019434246544;
+    const C58 = 0.6977904598416801;
+    const C59 = 0.39474385638426723;
+    const C60 = 0.9187912101488983;
+    const C61 = 0.9963824715083254;
+    const C62 = 0.08498217737244167;
+    const C63 = 0.8880161006528073;
+    const C64 = 0.45981235844785984;
+    const C65 = 0.6444573283588975;
+    const C66 = 0.7646402761590003;
+    const C67 = 0.3027857698425746;
+    const C68 = 0.953058643306297;
+    const C69 = 0.9945218953682733;
+    const C70 = 0.10452846326765346;
+    const C71 = 0.8788171126619654;
+    const C72 = 0.4771587602596084;
+    const C73 = 0.6293203910498375;
+    const C74 = 0.7771459614569709;
+    const C75 = 0.2840153447039226;
+    const C76 = 0.958819734868193;
+    const C77 = 0.9794874195590514;
+    const C78 = 0.20150532232561713;
+    const C79 = 0.8278156308955021;
+    const C80 = 0.5610002506640098;
+    const C81 = 0.5501164165954934;
+    const C82 = 0.8350879763187431;
+    const C83 = 0.18866696468655522;
+    const C84 = 0.9820411276703039;
+    const C85 = 0.9550199444571866;
+    const C86 = 0.296541574975571;
+    const C87 = 0.7688418320734596;
+    const C88 = 0.6394390019805847;
+    const C89 = 0.4656145203251114;
+    const C90 = 0.8849876374630419;
+    const C91 = 0.09150161866340238;
+    const C92 = 0.9958049275746618;
+    const C93 = 0.9213551052231925;
+    const C94 = 0.38872197015239557;
+    const C95 = 0.7024636661168517;
+    const C96 = 0.7117196061551713;
+    const C97 = 0.3766285016932107;
+    const C98 = 0.9263643838751181;
+    const C99 = 0.9999785816641292;
+    const C100 = 0.006544937967351858;
+    const C101 = 0.9135454576426009;
+    const C102 = 0.40673664307580015;
+    const C103 = 0.6883545756937539;
+    const C104 = 0.7253743710122876;
+    const C105 = 0.35836794954530027;
+    const C106 = 0.9335804264972017;
+    const C107 = 0.9996573249755573;
+    const C108 = 0.02617694830787315;
+    const C109 = 0.8692793239451436;
+    const C110 = 0.4943212082861446;
+    const C111 = 0.6139408387503664;
+    const C112 = 0.78935204219315;
+    const C113 = 0.265135426243408;
+    const C114 = 0.9642111831703293;
+    const C115 = 0.992277912105967;
+    const C116 = 0.12403445145048532;
+    const C117 = 0.8166415551616789;
+    const C118 = 0.5771451900372336;
+    const C119 = 0.5336145159156115;
+    const C120 = 0.8457278217039733;
+    const C121 = 0.1693495038490246;
+    const C122 = 0.9855560590580777;
+    const C123 = 0.9753423205085127;
+    const C124 = 0.22069743502150108;
+    const C125 = 0.7561390817803227;
+    const C126 = 0.6544109481086103;
+    const C127 = 0.44814919358922256;
+    const C128 = 0.8939587799699321;
+    const C129 = 0.07193265315671939;
+    const C130 = 0.9974094913373519;
+    const C131 = 0.949013649188214;
+    const C132 = 0.31523498164776964;
+    const C133 = 0.7431448254773942;
+    const C134 = 0.6691306063588582;
+    const C135 = 0.4305110968082951;
+    const C136 = 0.9025852843498606;
+    const C137 = 0.05233595624294383;
+    const C138 = 0.9986295347545738;
+    const C139 = 0.9426414910921784;
+    const C140 = 0.33380685923377096;
+    const C141 = 0.6739801114782978;
+    const C142 = 0.7387494902412463;
+    const C143 = 0.3399692397309942;
+    const C144 = 0.9404365560933549;
+    const C145 = 0.9989506813588601;
+    const C146 = 0.04579886693652077;
+    const C147 = 0.9053836208979552;
+    const C148 = 0.4245945112807131;
+    const C149 = 0.598324600570659;
+    const C150 = 0.8012538126910607;
+    const C151 = 0.24615329302899303;
+    const C152 = 0.9692309097067544;
+    const C153 = 0.9896513868196702;
+    const C154 = 0.1434926219911793;
+    const C155 = 0.8594064115014527;
+    const C156 = 0.5112930860770522;
+    const C157 = 0.5169068966820275;
+    const C158 = 0.8560416229147715;
+    const C159 = 0.149966755554045;
+    const C160 = 0.9886910398241674;
+    const C161 = 0.9708212084269281;
+    const C162 = 0.23980446465501654;
+    const C163 = 0.8051526485628582;
+    const C164 = 0.5930676289532372;
+    t10 = X[320];
+    t13 = X[159];
+    t14 = C0 * t10;
+    t11 = C1 * t13;
+    t0 = t14 + t11;
+    t9 = (-C1) * t10;
+    t2 = C0 * t13;
+    t1 = t9 + t2;
+    t6 = X[440];
+    t5 = X[39];
+    t12 = C2 * t6;
+    t7 = C3 * t5;
+    t3 = t12 + t7;
+    t8 = (-C3) * t6;
+    t4 = C2 * t5;
+    t14 = t8 + t4;
+    t11 = X[80];
+    t10 = X[399];
+    t13 = C4 * t11;
+    t9 = C5 * t10;
+    t2 = t13 + t9;
+    t12 = (-C5) * t11;
+    t7 = C4 * t10;
+    t6 = t12 + t7;
+    t5 = X[200];
+    t8 = X[279];
+    t4 = C6 * t5;
+    t13 = C7 * t8;
+    t9 = t4 + t13;
+    t11 = (-C7) * t5;
+    t10 = C6 * t8;
+    t12 = t11 + t10;
+    t7 = t0 + t2;
+    t4 = t1 + t6;
+    t13 = t3 + t9;
+    t5 = t14 + t12;
+    t8 = t0 - t2;
+    t11 = t1 - t6;
+    t10 = t3 - t9;
+    t0 = t14 - t12;
+    t2 = t7 + t13;
+    t1 = t4 + t5;
+    t6 = t8 + t0;
+    t3 = t11 - t10;
+    t9 = t7 - t13;
+    t14 = t4 - t5;
+    t12 = t8 - t0;
+    t7 = t11 + t10;
+    re[160] = t2;
+    im[160] = t1;
+    re[220] = t6;
+    im[220] = t3;
+    re[40] = t9;
+    im[40] = t14;
+    re[100] = t12;
+    im[100] = t7;
+    t13 = X[350];
+    t4 = X[129];
+    t5 = C8 * t13;
+    t8 = C9 * t4;
+    t0 = t5 + t8;
+    t11 = (-C9) * t13;
+    t10 = C8 * t4;
+    t2 = t11 + t10;
+    t1 = X[470];
+    t6 = X[9];
+    t3 = C10 * t1;
+    t9 = C11 * t6;
+    t14 = t3 + t9;
+    t12 = (-C11) * t1;
+    t7 = C10 * t6;
+    t5 = t12 + t7;
+    t8 = X[110];
+    t13 = X[369];
+    t4 = C12 * t8;
+    t11 = C13 * t13;
+    t10 = t4 + t11;
+    t3 = (-C13) * t8;
+    t9 = C12 * t13;
+    t1 = t3 + t9;
+    t6 = X[230];
+    t12 = X[249];
+    t7 = C14 * t6;
+    t4 = C15 * t12;
+    t11 = t7 + t4;
+    t8 = (-C15) * t6;
+    t13 = C14 * t12;
+    t3 = t8 + t13;
+    t9 = t0 + t10;
+    t7 = t2 + t1;
+    t4 = t14 + t11;
+    t6 = t5 + t3;
+    t12 = t0 - t10;
+    t8 = t2 - t1;
+    t13 = t14 - t11;
+    t0 = t5 - t3;
+    t10 = t9 + t4;
+    t2 = t7 + t6;
+    t1 = t12 + t0;
+    t14 = t8 - t13;
+    t11 = t9 - t4;
+    t5 = t7 - t6;
+    t3 = t12 - t0;
+    t9 = t8 + t13;
+    t4 = t1 + t14;
+    t7 = C16 * t4;
+    t6 = t1 * (-C17);
+    t12 = t14 * C18;
+    t0 = t7 - t12;
+    t8 = t7 + t6;
+    t13 = t11 + t5;
+    t4 = t11 - t5;
+    t1 = C19 * t13;
+    t14 = (-C19) * t4;
+    t12 = t3 + t9;
+    t7 = C20 * t12;
+    t6 = t3 * (-C17);
+    t11 = t9 * (-C18);
+    t5 = t7 - t11;
+    t13 = t7 + t6;
+    re[175] = t10;
+    im[175] = t2;
+    re[235] = t0;
+    im[235] = t8;
+    re[55] = t1;
+    im[55] = t14;
+    re[115] = t5;
+    im[115] = t13;
+    t4 = X[380];
+    t12 = X[99];
+    t3 = C21 * t4;
+    t9 = C22 * t12;
+    t11 = t3 + t9;
+    t7 = (-C22) * t4;
+    t6 = C21 * t12;
+    t10 = t7 + t6;
+    t2 = X[20];
+    t0 = X[459];
+    t8 = C23 * t2;
+    t1 = C24 * t0;
+    t14 = t8 + t1;
+    t5 = (-C24) * t2;
+    t13 = C23 * t0;
+    t3 = t5 + t13;
+    t9 = X[140];
+    t4 = X[339];
+    t12 = C25 * t9;
+    t7 = C26 * t4;
+    t6 = t12 + t7;
+    t8 = (-C26) * t9;
+    t1 = C25 * t4;
+    t2 = t8 + t1;
+    t0 = X[260];
+    t5 = X[219];
+    t13 = C27 * t0;
+    t12 = C28 * t5;
+    t7 = t13 + t12;
+    t9 = (-C28) * t0;
+    t4 = C27 * t5;
+    t8 = t9 + t4;
+    t1 = t11 + t6;
+    t13 = t10 + t2;
+    t12 = t14 + t7;
+    t0 = t3 + t8;
+    t5 = t11 - t6;
+    t9 = t10 - t2;
+    t4 = t14 - t7;
+    t11 = t3 - t8;
+    t6 = t1 + t12;
+    t10 = t13 + t0;
+    t2 = t5 + t11;
+    t14 = t9 - t4;
+    t7 = t1 - t12;
+    t3 = t13 - t0;
+    t8 = t5 - t11;
+    t1 = t9 + t4;
+    t12 = t2 + t14;
+    t13 = t2 - t14;
+    t0 = C19 * t12;
+    t5 = (-C19) * t13;
+    t11 = -t7;
+    t9 = t8 - t1;
+    t4 = t8 + t1;
+    t2 = (-C19) * t9;
+    t14 = (-C19) * t4;
+    re[190] = t6;
+    im[190] = t10;
+    re[10] = t0;
+    im[10] = t5;
+    re[70] = t3;
+    im[70] = t11;
+    re[130] = t2;
+    im[130] = t14;
+    t12 = X[410];
+    t13 = X[69];
+    t7 = C29 * t12;
+    t8 = C30 * t13;
+    t1 = t7 + t8;
+    t9 = (-C30) * t12;
+    t4 = C29 * t13;
+    t6 = t9 + t4;
+    t10 = X[50];
+    t0 = X[429];
+    t5 = C31 * t10;
+    t3 = C32 * t0;
+    t11 = t5 + t3;
+    t2 = (-C32) * t10;
+    t14 = C31 * t0;
+    t7 = t2 + t14;
+    t8 = X[170];
+    t12 = X[309];
+    t13 = C33 * t8;
+    t9 = C34 * t12;
+    t4 = t13 + t9;
+    t5 = (-C34) * t8;
+    t3 = C33 * t12;
+    t10 = t5 + t3;
+    t0 = X[290];
+    t2 = X[189];
+    t14 = C35 * t0;
+    t13 = C36 * t2;
+    t9 = t14 + t13;
+    t8 = (-C36) * t0;
+    t12 = C35 * t2;
+    t5 = t8 + t12;
+    t3 = t1 + t4;
+    t14 = t6 + t10;
+    t13 = t11 + t9;
+    t0 = t7 + t5;
+    t2 = t1 - t4;
+    t8 = t6 - t10;
+    t12 = t11 - t9;
+    t1 = t7 - t5;
+    t4 = t3 + t13;
+    t6 = t14 + t0;
+    t10 = t2 + t1;
+    t11 = t8 - t12;
+    t9 = t3 - t13;
+    t7 = t14 - t0;
+    t5 = t2 - t1;
+    t3 = t8 + t12;
+    t13 = t10 + t11;
+    t14 = C20 * t13;
+    t0 = t10 * (-C17);
+    t2 = t11 * (-C18);
+    t1 = t14 - t2;
+    t8 = t14 + t0;
+    t12 = t9 - t7;
+    t13 = t9 + t7;
+    t10 = (-C19) * t12;
+    t11 = (-C19) * t13;
+    t2 = t5 + t3;
+    t14 = (-C16) * t2;
+    t0 = t5 * C17;
+    t9 = t3 * (-C18);
+    t7 = t14 - t9;
+    t12 = t14 + t0;
+    re[205] = t4;
+    im[205] = t6;
+    re[25] = t1;
+    im[25] = t8;
+    re[85] = t10;
+    im[85] = t11;
+    re[145] = t7;
+    im[145] = t12;
+    t13 = re[160];
+    t2 = im[160];
+    t5 = re[175];
+    t3 = im[175];
+    t9 = re[190];
+    t14 = im[190];
+    t0 = re[205];
+    t4 = im[205];
+    t6 = t13 + t9;
+    t1 = t2 + t14;
+    t8 = t5 + t0;
+    t10 = t3 + t4;
+    t11 = t13 - t9;
+    t7 = t2 - t14;
+    t12 = t5 - t0;
+    t13 = t3 - t4;
+    t9 = t6 + t8;
+    t2 = t1 + t10;
+    t14 = t11 + t13;
+    t5 = t7 - t12;
+    t0 = t6 - t8;
+    t3 = t1 - t10;
+    t4 = t11 - t13;
+    t6 = t7 + t12;
+    re[160] = t9;
+    im[160] = t2;
+    re[175] = t14;
+    im[175] = t5;
+    re[190] = t0;
+    im[190] = t3;
+    re[205] = t4;
+    im[205] = t6;
+    t8 = re[220];
+    t1 = im[220];
+    t10 = re[235];
+    t11 = im[235];
+    t13 = re[10];
+    t7 = im[10];
+    t12 = re[25];
+    t9 = im[25];
+    t2 = t8 + t13;
+    t14 = t1 + t7;
+    t5 = t10 + t12;
+    t0 = t11 + t9;
+    t3 = t8 - t13;
+    t4 = t1 - t7;
+    t6 = t10 - t12;
+    t8 = t11 - t9;
+    t13 = t2 + t5;
+    t1 = t14 + t0;
+    t7 = t3 + t8;
+    t10 = t4 - t6;
+    t12 = t2 - t5;
+    t11 = t14 - t0;
+    t9 = t3 - t8;
+    t2 = t4 + t6;
+    re[220] = t13;
+    im[220] = t1;
+    re[235] = t7;
+    im[235] = t10;
+    re[10] = t12;
+    im[10] = t11;
+    re[25] = t9;
+    im[25] = t2;
+    t5 = re[40];
+    t14 = im[40];
+    t0 = re[55];
+    t3 = im[55];
+    t8 = re[70];
+    t4 = im[70];
+    t6 = re[85];
+    t13 = im[85];
+    t1 = t5 + t8;
+    t7 = t14 + t4;
+    t10 = t0 + t6;
+    t12 = t3 + t13;
+    t11 = t5 - t8;
+    t9 = t14 - t4;
+    t2 = t0 - t6;
+    t5 = t3 - t13;
+    t8 = t1 + t10;
+    t14 = t7 + t12;
+    t4 = t11 + t5;
+    t0 = t9 - t2;
+    t6 = t1 - t10;
+    t3 = t7 - t12;
+    t13 = t11 - t5;
+    t1 = t9 + t2;
+    re[40] = t8;
+    im[40] = t14;
+    re[55] = t4;
+    im[55] = t0;
+    re[70] = t6;
+    im[70] = t3;
+    re[85] = t13;
+    im[85] = t1;
+    t10 = re[100];
+    t7 = im[100];
+    t12 = re[115];
+    t11 = im[115];
+    t5 = re[130];
+    t9 = im[130];
+    t2 = re[145];
+    t8 = im[145];
+    t14 = t10 + t5;
+    t4 = t7 + t9;
+    t0 = t12 + t2;
+    t6 = t11 + t8;
+    t3 = t10 - t5;
+    t13 = t7 - t9;
+    t1 = t12 - t2;
+    t10 = t11 - t8;
+    t5 = t14 + t0;
+    t7 = t4 + t6;
+    t9 = t3 + t10;
+    t12 = t13 - t1;
+    t2 = t14 - t0;
+    t11 = t4 - t6;
+    t8 = t3 - t10;
+    t14 = t13 + t1;
+    re[100] = t5;
+    im[100] = t7;
+    re[115] = t9;
+    im[115] = t12;
+    re[130] = t2;
+    im[130] = t11;
+    re[145] = t8;
+    im[145] = t14;
+    t0 = X[416];
+    t4 = X[63];
+    t6 = C37 * t0;
+    t3 = C38 * t4;
+    t10 = t6 + t3;
+    t13 = (-C38) * t0;
+    t1 = C37 * t4;
+    t5 = t13 + t1;
+    t7 = X[56];
+    t9 = X[423];
+    t12 = C39 * t7;
+    t2 = C40 * t9;
+    t11 = t12 + t2;
+    t8 = (-C40) * t7;
+    t14 = C39 * t9;
+    t6 = t8 + t14;
+    t3 = X[176];
+    t0 = X[303];
+    t4 = C41 * t3;
+    t13 = C42 * t0;
+    t1 = t4 + t13;
+    t12 = (-C42) * t3;
+    t2 = C41 * t0;
+    t7 = t12 + t2;
+    t9 = X[296];
+    t8 = X[183];
+    t14 = C43 * t9;
+    t4 = C44 * t8;
+    t13 = t14 + t4;
+    t3 = (-C44) * t9;
+    t0 = C43 * t8;
+    t12 = t3 + t0;
+    t2 = t10 + t1;
+    t14 = t5 + t7;
+    t4 = t11 + t13;
+    t9 = t6 + t12;
+    t8 = t10 - t1;
+    t3 = t5 - t7;
+    t0 = t11 - t13;
+    t10 = t6 - t12;
+    t1 = t2 + t4;
+    t5 = t14 + t9;
+    t7 = t8 + t10;
+    t11 = t3 - t0;
+    t13 = t2 - t4;
+    t6 = t14 - t9;
+    t12 = t8 - t10;
+    t2 = t3 + t0;
+    re[208] = t1;
+    im[208] = t5;
+    re[28] = t7;
+    im[28] = t11;
+    re[88] = t13;
+    im[88] = t6;
+    re[148] = t12;
+    im[148] = t2;
+    t4 = X[446];
+    t14 = X[33];
+    t9 = C45 * t4;
+    t8 = C46 * t14;
+    t10 = t9 + t8;
+    t3 = (-C46) * t4;
+    t0 = C45 * t14;
+    t1 = t3 + t0;
+    t5 = X[86];
+    t7 = X[393];
+    t11 = C47 * t5;
+    t13 = C48 * t7;
+    t6 = t11 + t13;
+    t12 = (-C48) * t5;
+    t2 = C47 * t7;
+    t9 = t12 + t2;
+    t8 = X[206];
+    t4 = X[273];
+    t14 = C49 * t8;
+    t3 = C50 * t4;
+    t0 = t14 + t3;
+    t11 = (-C50) * t8;
+    t13 = C49 * t4;
+    t5 = t11 + t13;
+    t7 = X[326];
+    t12 = X[153];
+    t2 = C51 * t7;
+    t14 = C52 * t12;
+    t3 = t2 + t14;
+    t8 = (-C52) * t7;
+    t4 = C51 * t12;
+    t11 = t8 + t4;
+    t13 = t10 + t0;
+    t2 = t1 + t5;
+    t14 = t6 + t3;
+    t7 = t9 + t11;
+    t12 = t10 - t0;
+    t8 = t1 - t5;
+    t4 = t6 - t3;
+    t10 = t9 - t11;
+    t0 = t13 + t14;
+    t1 = t2 + t7;
+    t5 = t12 + t10;
+    t6 = t8 - t4;
+    t3 = t13 - t14;
+    t9 = t2 - t7;
+    t11 = t12 - t10;
+    t13 = t8 + t4;
+    t14 = t5 + t6;
+    t2 = C16 * t14;
+    t7 = t5 * (-C17);
+    t12 = t6 * C18;
+    t10 = t2 - t12;
+    t8 = t2 + t7;
+    t4 = t3 + t9;
+    t14 = t3 - t9;
+    t5 = C19 * t4;
+    t6 = (-C19) * t14;
+    t12 = t11 + t13;
+    t2 = C20 * t12;
+    t7 = t11 * (-C17);
+    t3 = t13 * (-C18);
+    t9 = t2 - t3;
+    t4 = t2 + t7;
+    re[223] = t0;
+    im[223] = t1;
+    re[43] = t10;
+    im[43] = t8;
+    re[103] = t5;
+    im[103] = t6;
+    re[163] = t9;
+    im[163] = t4;
+    t14 = X[476];
+    t12 = X[3];
+    t11 = C53 * t14;
+    t13 = C54 * t12;
+    t3 = t11 + t13;
+    t2 = (-C54) * t14;
+    t7 = C53 * t12;
+    t0 = t2 + t7;
+    t1 = X[116];
+    t10 = X[363];
+    t8 = C55 * t1;
+    t5 = C56 * t10;
+    t6 = t8 + t5;
+    t9 = (-C56) * t1;
+    t4 = C55 * t10;
+    t11 = t9 + t4;
+    t13 = X[236];
+    t14 = X[243];
+    t12 = C57 * t13;
+    t2 = C58 * t14;
+    t7 = t12 + t2;
+    t8 = (-C58) * t13;
+    t5 = C57 * t14;
+    t1 = t8 + t5;
+    t10 = X[356];
+    t9 = X[123];
+    t4 = C59 * t10;
+    t12 = C60 * t9;
+    t2 = t4 + t12;
+    t13 = (-C60) * t10;
+    t14 = C59 * t9;
+    t8 = t13 + t14;
+    t5 = t3 + t7;
+    t4 = t0 + t1;
+    t12 = t6 + t2;
+    t10 = t11 + t8;
+    t9 = t3 - t7;
+    t13 = t0 - t1;
+    t14 = t6 - t2;
+    t3 = t11 - t8;
+    t7 = t5 + t12;
+    t0 = t4 + t10;
+    t1 = t9 + t3;
+    t6 = t13 - t14;
+    t2 = t5 - t12;
+    t11 = t4 - t10;
+    t8 = t9 - t3;
+    t5 = t13 + t14;
+    t12 = t1 + t6;
+    t4 = t1 - t6;
+    t10 = C19 * t12;
+    t9 = (-C19) * t4;
+    t3 = -t2;
+    t13 = t8 - t5;
+    t14 = t8 + t5;
+    t1 = (-C19) * t13;
+    t6 = (-C19) * t14;
+    re[238] = t7;
+    im[238] = t0;
+    re[58] = t10;
+    im[58] = t9;
+    re[118] = t11;
+    im[118] = t3;
+    re[178] = t1;
+    im[178] = t6;
+    t12 = X[26];
+    t4 = X[453];
+    t2 = C61 * t12;
+    t8 = C62 * t4;
+    t5 = t2 + t8;
+    t13 = (-C62) * t12;
+    t14 = C61 * t4;
+    t7 = t13 + t14;
+    t0 = X[146];
+    t10 = X[333];
+    t9 = C63 * t0;
+    t11 = C64 * t10;
+    t3 = t9 + t11;
+    t1 = (-C64) * t0;
+    t6 = C63 * t10;
+    t2 = t1 + t6;
+    t8 = X[266];
+    t12 = X[213];
+    t4 = C65 * t8;
+    t13 = C66 * t12;
+    t14 = t4 + t13;
+    t9 = (-C66) * t8;
+    t11 = C65 * t12;
+    t0 = t9 + t11;
+    t10 = X[386];
+    t1 = X[93];
+    t6 = C67 * t10;
+    t4 = C68 * t1;
+    t13 = t6 + t4;
+    t8 = (-C68) * t10;
+    t12 = C67 * t1;
+    t9 = t8 + t12;
+    t11 = t5 + t14;
+    t6 = t7 + t0;
+    t4 = t3 + t13;
+    t10 = t2 + t9;
+    t1 = t5 - t14;
+    t8 = t7 - t0;
+    t12 = t3 - t13;
+    t5 = t2 - t9;
+    t14 = t11 + t4;
+    t7 = t6 + t10;
+    t0 = t1 + t5;
+    t3 = t8 - t12;
+    t13 = t11 - t4;
+    t2 = t6 - t10;
+    t9 = t1 - t5;
+    t11 = t8 + t12;
+    t4 = t0 + t3;
+    t6 = C20 * t4;
+    t10 = t0 * (-C17);
+    t1 = t3 * (-C18);
+    t5 = t6 - t1;
+    t8 = t6 + t10;
+    t12 = t13 - t2;
+    t4 = t13 + t2;
+    t0 = (-C19) * t12;
+    t3 = (-C19) * t4;
+    t1 = t9 + t11;
+    t6 = (-C16) * t1;
+    t10 = t9 * C17;
+    t13 = t11 * (-C18);
+    t2 = t6 - t13;
+    t12 = t6 + t10;
+    re[13] = t14;
+    im[13] = t7;
+    re[73] = t5;
+    im[73] = t8;
+    re[133] = t0;
+    im[133] = t3;
+    re[193] = t2;
+    im[193] = t12;
+    t4 = re[208];
+    t1 = im[208];
+    t9 = re[223];
+    t11 = im[223];
+    t13 = re[238];
+    t6 = im[238];
+    t10 = re[13];
+    t14 = im[13];
+    t7 = t4 + t13;
+    t5 = t1 + t6;
+    t8 = t9 + t10;
+    t0 = t11 + t14;
+    t3 = t4 - t13;
+    t2 = t1 - t6;
+    t12 = t9 - t10;
+    t4 = t11 - t14;
+    t13 = t7 + t8;
+    t1 = t5 + t0;
+    t6 = t3 + t4;
+    t9 = t2 - t12;
+    t10 = t7 - t8;
+    t11 = t5 - t0;
+    t14 = t3 - t4;
+    t7 = t2 + t12;
+    re[208] = t13;
+    im[208] = t1;
+    re[223] = t6;
+    im[223] = t9;
+    re[238] = t10;
+    im[238] = t11;
+    re[13] = t14;
+    im[13] = t7;
+    t8 = re[28];
+    t5 = im[28];
+    t0 = re[43];
+    t3 = im[43];
+    t4 = re[58];
+    t2 = im[58];
+    t12 = re[73];
+    t13 = im[73];
+    t1 = t8 + t4;
+    t6 = t5 + t2;
+    t9 = t0 + t12;
+    t10 = t3 + t13;
+    t11 = t8 - t4;
+    t14 = t5 - t2;
+    t7 = t0 - t12;
+    t8 = t3 - t13;
+    t4 = t1 + t9;
+    t5 = t6 + t10;
+    t2 = t11 + t8;
+    t0 = t14 - t7;
+    t12 = t1 - t9;
+    t3 = t6 - t10;
+    t13 = t11 - t8;
+    t1 = t14 + t7;
+    re[28] = t4;
+    im[28] = t5;
+    re[43] = t2;
+    im[43] = t0;
+    re[58] = t12;
+    im[58] = t3;
+    re[73] = t13;
+    im[73] = t1;
+    t9 = re[88];
+    t6 = im[88];
+    t10 = re[103];
+    t11 = im[103];
+    t8 = re[118];
+    t14 = im[118];
+    t7 = re[133];
+    t4 = im[133];
+    t5 = t9 + t8;
+    t2 = t6 + t14;
+    t0 = t10 + t7;
+    t12 = t11 + t4;
+    t3 = t9 - t8;
+    t13 = t6 - t14;
+    t1 = t10 - t7;
+    t9 = t11 - t4;
+    t8 = t5 + t0;
+    t6 = t2 + t12;
+    t14 = t3 + t9;
+    t10 = t13 - t1;
+    t7 = t5 - t0;
+    t11 = t2 - t12;
+    t4 = t3 - t9;
+    t5 = t13 + t1;
+    re[88] = t8;
+    im[88] = t6;
+    re[103] = t14;
+    im[103] = t10;
+    re[118] = t7;
+    im[118] = t11;
+    re[133] = t4;
+    im[133] = t5;
+    t0 = re[148];
+    t2 = im[148];
+    t12 = re[163];
+    t3 = im[163];
+    t9 = re[178];
+    t13 = im[178];
+    t1 = re[193];
+    t8 = im[193];
+    t6 = t0 + t9;
+    t14 = t2 + t13;
+    t10 = t12 + t1;
+    t7 = t3 + t8;
+    t11 = t0 - t9;
+    t4 = t2 - t13;
+    t5 = t12 - t1;
+    t0 = t3 - t8;
+    t9 = t6 + t10;
+    t2 = t14 + t7;
+    t13 = t11 + t0;
+    t12 = t4 - t5;
+    t1 = t6 - t10;
+    t3 = t14 - t7;
+    t8 = t11 - t0;
+    t6 = t4 + t5;
+    re[148] = t9;
+    im[148] = t2;
+    re[163] = t13;
+    im[163] = t12;
+    re[178] = t1;
+    im[178] = t3;
+    re[193] = t8;
+    im[193] = t6;
+    t10 = X[32];
+    t14 = X[447];
+    t7 = C69 * t10;
+    t11 = C70 * t14;
+    t0 = t7 + t11;
+    t4 = (-C70) * t10;
+    t5 = C69 * t14;
+    t9 = t4 + t5;
+    t2 = X[152];
+    t13 = X[327];
+    t12 = C71 * t2;
+    t1 = C72 * t13;
+    t3 = t12 + t1;
+    t8 = (-C72) * t2;
+    t6 = C71 * t13;
+    t7 = t8 + t6;
+    t11 = X[272];
+    t10 = X[207];
+    t14 = C73 * t11;
+    t4 = C74 * t10;
+    t5 = t14 + t4;
+    t12 = (-C74) * t11;
+    t1 = C73 * t10;
+    t2 = t12 + t1;
+    t13 = X[392];
+    t8 = X[87];
+    t6 = C75 * t13;
+    t14 = C76 * t8;
+    t4 = t6 + t14;
+    t11 = (-C76) * t13;
+    t10 = C75 * t8;
+    t12 = t11 + t10;
+    t1 = t0 + t5;
+    t6 = t9 + t2;
+    t14 = t3 + t4;
+    t13 = t7 + t12;
+    t8 = t0 - t5;
+    t11 = t9 - t2;
+    t10 = t3 - t4;
+    t0 = t7 - t12;
+    t5 = t1 + t14;
+    t9 = t6 + t13;
+    t2 = t8 + t0;
+    t3 = t11 - t10;
+    t4 = t1 - t14;
+    t7 = t6 - t13;
+    t12 = t8 - t0;
+    t1 = t11 + t10;
+    re[16] = t5;
+    im[16] = t9;
+    re[76] = t2;
+    im[76] = t3;
+    re[136] = t4;
+    im[136] = t7;
+    re[196] = t12;
+    im[196] = t1;
+    t14 = X[62];
+    t6 = X[417];
+    t13 = C77 * t14;
+    t8 = C78 * t6;
+    t0 = t13 + t8;
+    t11 = (-C78) * t14;
+    t10 = C77 * t6;
+    t5 = t11 + t10;
+    t9 = X[182];
+    t2 = X[297];
+    t3 = C79 * t9;
+    t4 = C80 * t2;
+    t7 = t3 + t4;
+    t12 = (-C80) * t9;
+    t1 = C79 * t2;
+    t13 = t12 + t1;
+    t8 = X[302];
+    t14 = X[177];
+    t6 = C81 * t8;
+    t11 = C82 * t14;
+    t10 = t6 + t11;
+    t3 = (-C82) * t8;
+    t4 = C81 * t14;
+    t9 = t3 + t4;
+    t2 = X[422];
+    t12 = X[57];
+    t1 = C83 * t2;
+    t6 = C84 * t12;
+    t11 = t1 + t6;
+    t8 = (-C84) * t2;
+    t14 = C83 * t12;
+    t3 = t8 + t14;
+    t4 = t0 + t10;
+    t1 = t5 + t9;
+    t6 = t7 + t11;
+    t2 = t13 + t3;
+    t12 = t0 - t10;
+    t8 = t5 - t9;
+    t14 = t7 - t11;
+    t0 = t13 - t3;
+    t10 = t4 + t6;
+    t5 = t1 + t2;
+    t9 = t12 + t0;
+    t7 = t8 - t14;
+    t11 = t4 - t6;
+    t13 = t1 - t2;
+    t3 = t12 - t0;
+    t4 = t8 + t14;
+    t6 = t9 + t7;
+    t1 = C16 * t6;
+    t2 = t9 * (-C17);
+    t12 = t7 * C18;
+    t0 = t1 - t12;
+    t8 = t1 + t2;
+    t14 = t11 + t13;
+    t6 = t11 - t13;
+    t9 = C19 * t14;
+    t7 = (-C19) * t6;
+    t12 = t3 + t4;
+    t1 = C20 * t12;
+    t2 = t3 * (-C17);
+    t11 = t4 * (-C18);
+    t13 = t1 - t11;
+    t14 = t1 + t2;
+    re[31] = t10;
+    im[31] = t5;
+    re[91] = t0;
+    im[91] = t8;
+    re[151] = t9;
+    im[151] = t7;
+    re[211] = t13;
+    im[211] = t14;
+    t6 = X[92];
+    t12 = X[387];
+    t3 = C85 * t6;
+    t4 = C86 * t12;
+    t11 = t3 + t4;
+    t1 = (-C86) * t6;
+    t2 = C85 * t12;
+    t10 = t1 + t2;
+    t5 = X[212];
+    t0 = X[267];
+    t8 = C87 * t5;
+    t9 = C88 * t0;
+    t7 = t8 + t9;
+    t13 = (-C88) * t5;
+    t14 = C87 * t0;
+    t3 = t13 + t14;
+    t4 = X[332];
+    t6 = X[147];
+    t12 = C89 * t4;
+    t1 = C90 * t6;
+    t2 = t12 + t1;
+    t8 = (-C90) * t4;
+    t9 = C89 * t6;
+    t5 = t8 + t9;
+    t0 = X[452];
+    t13 = X[27];
+    t14 = C91 * t0;
+    t12 = C92 * t13;
+    t1 = t14 + t12;
+    t4 = (-C92) * t0;
+    t6 = C91 * t13;
+    t8 = t4 + t6;
+    t9 = t11 + t2;
+    t14 = t10 + t5;
+    t12 = t7 + t1;
+    t0 = t3 + t8;
+    t13 = t11 - t2;
+    t4 = t10 - t5;
+    t6 = t7 - t1;
+    t11 = t3 - t8;
+    t2 = t9 + t12;
+    t10 = t14 + t0;
+    t5 = t13 + t11;
+    t7 = t4 - t6;
+    t1 = t9 - t12;
+    t3 = t14 - t0;
+    t8 = t13 - t11;
+    t9 = t4 + t6;
+    t12 = t5 + t7;
+    t14 = t5 - t7;
+    t0 = C19 * t12;
+    t13 = (-C19) * t14;
+    t11 = -t1;
+    t4 = t8 - t9;
+    t6 = t8 + t9;
+    t5 = (-C19) * t4;
+    t7 = (-C19) * t6;
+    re[46] = t2;
+    im[46] = t10;
+    re[106] = t0;
+    im[106] = t13;
+    re[166] = t3;
+    im[166] = t11;
+    re[226] = t5;
+    im[226] = t7;
+    t12 = X[122];
+    t14 = X[357];
+    t1 = C93 * t12;
+    t8 = C94 * t14;
+    t9 = t1 + t8;
+    t4 = (-C94) * t12;
+    t6 = C93 * t14;
+    t2 = t4 + t6;
+    t10 = X[242];
+    t0 = X[237];
+    t13 = C95 * t10;
+    t3 = C96 * t0;
+    t11 = t13 + t3;
+    t5 = (-C96) * t10;
+    t7 = C95 * t0;
+    t1 = t5 + t7;
+    t8 = X[362];
+    t12 = X[117];
+    t14 = C97 * t8;
+    t4 = C98 * t12;
+    t6 = t14 + t4;
+    t13 = (-C98) * t8;
+    t3 = C97 * t12;
+    t10 = t13 + t3;
+    t0 = X[2];
+    t5 = X[477];
+    t7 = C99 * t0;
+    t14 = C100 * t5;
+    t4 = t7 + t14;
+    t8 = (-C100) * t0;
+    t12 = C99 * t5;
+    t13 = t8 + t12;
+    t3 = t9 + t6;
+    t7 = t2 + t10;
+    t14 = t11 + t4;
+    t0 = t1 + t13;
+    t5 = t9 - t6;
+    t8 = t2 - t10;
+    t12 = t11 - t4;
+    t9 = t1 - t13;
+    t6 = t3 + t14;
+    t2 = t7 + t0;
+    t10 = t5 + t9;
+    t11 = t8 - t12;
+    t4 = t3 - t14;
+    t1 = t7 - t0;
+    t13 = t5 - t9;
+    t3 = t8 + t12;
+    t14 = t10 + t11;
+    t7 = C20 * t14;
+    t0 = t10 * (-C17);
+    t5 = t11 * (-C18);
+    t9 = t7 - t5;
+    t8 = t7 + t0;
+    t12 = t4 - t1;
+    t14 = t4 + t1;
+    t10 = (-C19) * t12;
+    t11 = (-C19) * t14;
+    t5 = t13 + t3;
+    t7 = (-C16) * t5;
+    t0 = t13 * C17;
+    t4 = t3 * (-C18);
+    t1 = t7 - t4;
+    t12 = t7 + t0;
+    re[61] = t6;
+    im[61] = t2;
+    re[121] = t9;
+    im[121] = t8;
+    re[181] = t10;
+    im[181] = t11;
+    re[1] = t1;
+    im[1] = t12;
+    t14 = re[16];
+    t5 = im[16];
+    t13 = re[31];
+    t3 = im[31];
+    t4 = re[46];
+    t7 = im[46];
+    t0 = re[61];
+    t6 = im[61];
+    t2 = t14 + t4;
+    t9 = t5 + t7;
+    t8 = t13 + t0;
+    t10 = t3 + t6;
+    t11 = t14 - t4;
+    t1 = t5 - t7;
+    t12 = t13 - t0;
+    t14 = t3 - t6;
+    t4 = t2 + t8;
+    t5 = t9 + t10;
+    t7 = t11 + t14;
+    t13 = t1 - t12;
+    t0 = t2 - t8;
+    t3 = t9 - t10;
+    t6 = t11 - t14;
+    t2 = t1 + t12;
+    re[16] = t4;
+    im[16] = t5;
+    re[31] = t7;
+    im[31] = t13;
+    re[46] = t0;
+    im[46] = t3;
+    re[61] = t6;
+    im[61] = t2;
+    t8 = re[76];
+    t9 = im[76];
+    t10 = re[91];
+    t11 = im[91];
+    t14 = re[106];
+    t1 = im[106];
+    t12 = re[121];
+    t4 = im[121];
+    t5 = t8 + t14;
+    t7 = t9 + t1;
+    t13 = t10 + t12;
+    t0 = t11 + t4;
+    t3 = t8 - t14;
+    t6 = t9 - t1;
+    t2 = t10 - t12;
+    t8 = t11 - t4;
+    t14 = t5 + t13;
+    t9 = t7 + t0;
+    t1 = t3 + t8;
+    t10 = t6 - t2;
+    t12 = t5 - t13;
+    t11 = t7 - t0;
+    t4 = t3 - t8;
+    t5 = t6 + t2;
+    re[76] = t14;
+    im[76] = t9;
+    re[91] = t1;
+    im[91] = t10;
+    re[106] = t12;
+    im[106] = t11;
+    re[121] = t4;
+    im[121] = t5;
+    t13 = re[136];
+    t7 = im[136];
+    t0 = re[151];
+    t3 = im[151];
+    t8 = re[166];
+    t6 = im[166];
+    t2 = re[181];
+    t14 = im[181];
+    t9 = t13 + t8;
+    t1 = t7 + t6;
+    t10 = t0 + t2;
+    t12 = t3 + t14;
+    t11 = t13 - t8;
+    t4 = t7 - t6;
+    t5 = t0 - t2;
+    t13 = t3 - t14;
+    t8 = t9 + t10;
+    t7 = t1 + t12;
+    t6 = t11 + t13;
+    t0 = t4 - t5;
+    t2 = t9 - t10;
+    t3 = t1 - t12;
+    t14 = t11 - t13;
+    t9 = t4 + t5;
+    re[136] = t8;
+    im[136] = t7;
+    re[151] = t6;
+    im[151] = t0;
+    re[166] = t2;
+    im[166] = t3;
+    re[181] = t14;
+    im[181] = t9;
+    t10 = re[196];
+    t1 = im[196];
+    t12 = re[211];
+    t11 = im[211];
+    t13 = re[226];
+    t4 = im[226];
+    t5 = re[1];
+    t8 = im[1];
+    t7 = t10 + t13;
+    t6 = t1 + t4;
+    t0 = t12 + t5;
+    t2 = t11 + t8;
+    t3 = t10 - t13;
+    t14 = t1 - t4;
+    t9 = t12 - t5;
+    t10 = t11 - t8;
+    t13 = t7 + t0;
+    t1 = t6 + t2;
+    t4 = t3 + t10;
+    t12 = t14 - t9;
+    t5 = t7 - t0;
+    t11 = t6 - t2;
+    t8 = t3 - t10;
+    t7 = t14 + t9;
+    re[196] = t13;
+    im[196] = t1;
+    re[211] = t4;
+    im[211] = t12;
+    re[226] = t5;
+    im[226] = t11;
+    re[1] = t8;
+    im[1] = t7;
+    t0 = X[128];
+    t6 = X[351];
+    t2 = C101 * t0;
+    t3 = C102 * t6;
+    t10 = t2 + t3;
+    t14 = (-C102) * t0;
+    t9 = C101 * t6;
+    t13 = t14 + t9;
+    t1 = X[248];
+    t4 = X[231];
+    t12 = C103 * t1;
+    t5 = C104 * t4;
+    t11 = t12 + t5;
+    t8 = (-C104) * t1;
+    t7 = C103 * t4;
+    t2 = t8 + t7;
+    t3 = X[368];
+    t0 = X[111];
+    t6 = C105 * t3;
+    t14 = C106 * t0;
+    t9 = t6 + t14;
+    t12 = (-C106) * t3;
+    t5 = C105 * t0;
+    t1 = t12 + t5;
+    t4 = X[8];
+    t8 = X[471];
+    t7 = C107 * t4;
+    t6 = C108 * t8;
+    t14 = t7 + t6;
+    t3 = (-C108) * t4;
+    t0 = C107 * t8;
+    t12 = t3 + t0;
+    t5 = t10 + t9;
+    t7 = t13 + t1;
+    t6 = t11 + t14;
+    t4 = t2 + t12;
+    t8 = t10 - t9;
+    t3 = t13 - t1;
+    t0 = t11 - t14;
+    t10 = t2 - t12;
+    t9 = t5 + t6;
+    t13 = t7 + t4;
+    t1 = t8 + t10;
+    t11 = t3 - t0;
+    t14 = t5 - t6;
+    t2 = t7 - t4;
+    t12 = t8 - t10;
+    t5 = t3 + t0;
+    re[64] = t9;
+    im[64] = t13;
+    re[124] = t1;
+    im[124] = t11;
+    re[184] = t14;
+    im[184] = t2;
+    re[4] = t12;
+    im[4] = t5;
+    t6 = X[158];
+    t7 = X[321];
+    t4 = C109 * t6;
+    t8 = C110 * t7;
+    t10 = t4 + t8;
+    t3 = (-C110) * t6;
+    t0 = C109 * t7;
+    t9 = t3 + t0;
+    t13 = X[278];
+    t1 = X[201];
+    t11 = C111 * t13;
+    t14 = C112 * t1;
+    t2 = t11 + t14;
+    t12 = (-C112) * t13;
+    t5 = C111 * t1;
+    t4 = t12 + t5;
+    t8 = X[398];
+    t6 = X[81];
+    t7 = C113 * t8;
+    t3 = C114 * t6;
+    t0 = t7 + t3;
+    t11 = (-C114) * t8;
+    t14 = C113 * t6;
+    t13 = t11 + t14;
+    t1 = X[38];
+    t12 = X[441];
+    t5 = C115 * t1;
+    t7 = C116 * t12;
+    t3 = t5 + t7;
+    t8 = (-C116) * t1;
+    t6 = C115 * t12;
+    t11 = t8 + t6;
+    t14 = t10 + t0;
+    t5 = t9 + t13;
+    t7 = t2 + t3;
+    t1 = t4 + t11;
+    t12 = t10 - t0;
+    t8 = t9 - t13;
+    t6 = t2 - t3;
+    t10 = t4 - t11;
+    t0 = t14 + t7;
+    t9 = t5 + t1;
+    t13 = t12 + t10;
+    t2 = t8 - t6;
+    t3 = t14 - t7;
+    t4 = t5 - t1;
+    t11 = t12 - t10;
+    t14 = t8 + t6;
+    t7 = t13 + t2;
+    t5 = C16 * t7;
+    t1 = t13 * (-C17);
+    t12 = t2 * C18;
+    t10 = t5 - t12;
+    t8 = t5 + t1;
+    t6 = t3 + t4;
+    t7 = t3 - t4;
+    t13 = C19 * t6;
+    t2 = (-C19) * t7;
+    t12 = t11 + t14;
+    t5 = C20 * t12;
+    t1 = t11 * (-C17);
+    t3 = t14 * (-C18);
+    t4 = t5 - t3;
+    t6 = t5 + t1;
+    re[79] = t0;
+    im[79] = t9;
+    re[139] = t10;
+    im[139] = t8;
+    re[199] = t13;
+    im[199] = t2;
+    re[19] = t4;
+    im[19] = t6;
+    t7 = X[188];
+    t12 = X[291];
+    t11 = C117 * t7;
+    t14 = C118 * t12;
+    t3 = t11 + t14;
+    t5 = (-C118) * t7;
+    t1 = C117 * t12;
+    t0 = t5 + t1;
+    t9 = X[308];
+    t10 = X[171];
+    t8 = C119 * t9;
+    t13 = C120 * t10;
+    t2 = t8 + t13;
+    t4 = (-C120) * t9;
+    t6 = C119 * t10;
+    t11 = t4 + t6;
+    t14 = X[428];
+    t7 = X[51];
+    t12 = C121 * t14;
+    t5 = C122 * t7;
+    t1 = t12 + t5;
+    t8 = (-C122) * t14;
+    t13 = C121 * t7;
+    t9 = t8 + t13;
+    t10 = X[68];
+    t4 = X[411];
+    t6 = C123 * t10;
+    t12 = C124 * t4;
+    t5 = t6 + t12;
+    t14 = (-C124) * t10;
+    t7 = C123 * t4;
+    t8 = t14 + t7;
+    t13 = t3 + t1;
+    t6 = t0 + t9;
+    t12 = t2 + t5;
+    t10 = t11 + t8;
+    t4 = t3 - t1;
+    t14 = t0 - t9;
+    t7 = t2 - t5;
+    t3 = t11 - t8;
+    t1 = t13 + t12;
+    t0 = t6 + t10;
+    t9 = t4 + t3;
+    t2 = t14 - t7;
+    t5 = t13 - t12;
+    t11 = t6 - t10;
+    t8 = t4 - t3;
+    t13 = t14 + t7;
+    t12 = t9 + t2;
+    t6 = t9 - t2;
+    t10 = C19 * t12;
+    t4 = (-C19) * t6;
+    t3 = -t5;
+    t14 = t8 - t13;
+    t7 = t8 + t13;
+    t9 = (-C19) * t14;
+    t2 = (-C19) * t7;
+    re[94] = t1;
+    im[94] = t0;
+    re[154] = t10;
+    im[154] = t4;
+    re[214] = t11;
+    im[214] = t3;
+    re[34] = t9;
+    im[34] = t2;
+    t12 = X[218];
+    t6 = X[261];
+    t5 = C125 * t12;
+    t8 = C126 * t6;
+    t13 = t5 + t8;
+    t14 = (-C126) * t12;
+    t7 = C125 * t6;
+    t1 = t14 + t7;
+    t0 = X[338];
+    t10 = X[141];
+    t4 = C127 * t0;
+    t11 = C128 * t10;
+    t3 = t4 + t11;
+    t9 = (-C128) * t0;
+    t2 = C127 * t10;
+    t5 = t9 + t2;
+    t8 = X[458];
+    t12 = X[21];
+    t6 = C129 * t8;
+    t14 = C130 * t12;
+    t7 = t6 + t14;
+    t4 = (-C130) * t8;
+    t11 = C129 * t12;
+    t0 = t4 + t11;
+    t10 = X[98];
+    t9 = X[381];
+    t2 = C131 * t10;
+    t6 = C132 * t9;
+    t14 = t2 + t6;
+    t8 = (-C132) * t10;
+    t12 = C131 * t9;
+    t4 = t8 + t12;
+    t11 = t13 + t7;
+    t2 = t1 + t0;
+    t6 = t3 + t14;
+    t10 = t5 + t4;
+    t9 = t13 - t7;
+    t8 = t1 - t0;
+    t12 = t3 - t14;
+    t13 = t5 - t4;
+    t7 = t11 + t6;
+    t1 = t2 + t10;
+    t0 = t9 + t13;
+    t3 = t8 - t12;
+    t14 = t11 - t6;
+    t5 = t2 - t10;
+    t4 = t9 - t13;
+    t11 = t8 + t12;
+    t6 = t0 + t3;
+    t2 = C20 * t6;
+    t10 = t0 * (-C17);
+    t9 = t3 * (-C18);
+    t13 = t2 - t9;
+    t8 = t2 + t10;
+    t12 = t14 - t5;
+    t6 = t14 + t5;
+    t0 = (-C19) * t12;
+    t3 = (-C19) * t6;
+    t9 = t4 + t11;
+    t2 = (-C16) * t9;
+    t10 = t4 * C17;
+    t14 = t11 * (-C18);
+    t5 = t2 - t14;
+    t12 = t2 + t10;
+    re[109] = t7;
+    im[109] = t1;
+    re[169] = t13;
+    im[169] = t8;
+    re[229] = t0;
+    im[229] = t3;
+    re[49] = t5;
+    im[49] = t12;
+    t6 = re[64];
+    t9 = im[64];
+    t4 = re[79];
+    t11 = im[79];
+    t14 = re[94];
+    t2 = im[94];
+    t10 = re[109];
+    t7 = im[109];
+    t1 = t6 + t14;
+    t13 = t9 + t2;
+    t8 = t4 + t10;
+    t0 = t11 + t7;
+    t3 = t6 - t14;
+    t5 = t9 - t2;
+    t12 = t4 - t10;
+    t6 = t11 - t7;
+    t14 = t1 + t8;
+    t9 = t13 + t0;
+    t2 = t3 + t6;
+    t4 = t5 - t12;
+    t10 = t1 - t8;
+    t11 = t13 - t0;
+    t7 = t3 - t6;
+    t1 = t5 + t12;
+    re[64] = t14;
+    im[64] = t9;
+    re[79] = t2;
+    im[79] = t4;
+    re[94] = t10;
+    im[94] = t11;
+    re[109] = t7;
+    im[109] = t1;
+    t8 = re[124];
+    t13 = im[124];
+    t0 = re[139];
+    t3 = im[139];
+    t6 = re[154];
+    t5 = im[154];
+    t12 = re[169];
+    t14 = im[169];
+    t9 = t8 + t6;
+    t2 = t13 + t5;
+    t4 = t0 + t12;
+    t10 = t3 + t14;
+    t11 = t8 - t6;
+    t7 = t13 - t5;
+    t1 = t0 - t12;
+    t8 = t3 - t14;
+    t6 = t9 + t4;
+    t13 = t2 + t10;
+    t5 = t11 + t8;
+    t0 = t7 - t1;
+    t12 = t9 - t4;
+    t3 = t2 - t10;
+    t14 = t11 - t8;
+    t9 = t7 + t1;
+    re[124] = t6;
+    im[124] = t13;
+    re[139] = t5;
+    im[139] = t0;
+    re[154] = t12;
+    im[154] = t3;
+    re[169] = t14;
+    im[169] = t9;
+    t4 = re[184];
+    t2 = im[184];
+    t10 = re[199];
+    t11 = im[199];
+    t8 = re[214];
+    t7 = im[214];
+    t1 = re[229];
+    t6 = im[229];
+    t13 = t4 + t8;
+    t5 = t2 + t7;
+    t0 = t10 + t1;
+    t12 = t11 + t6;
+    t3 = t4 - t8;
+    t14 = t2 - t7;
+    t9 = t10 - t1;
+    t4 = t11 - t6;
+    t8 = t13 + t0;
+    t2 = t5 + t12;
+    t7 = t3 + t4;
+    t10 = t14 - t9;
+    t1 = t13 - t0;
+    t11 = t5 - t12;
+    t6 = t3 - t4;
+    t13 = t14 + t9;
+    re[184] = t8;
+    im[184] = t2;
+    re[199] = t7;
+    im[199] = t10;
+    re[214] = t1;
+    im[214] = t11;
+    re[229] = t6;
+    im[229] = t13;
+    t0 = re[4];
+    t5 = im[4];
+    t12 = re[19];
+    t3 = im[19];
+    t4 = re[34];
+    t14 = im[34];
+    t9 = re[49];
+    t8 = im[49];
+    t2 = t0 + t4;
+    t7 = t5 + t14;
+    t10 = t12 + t9;
+    t1 = t3 + t8;
+    t11 = t0 - t4;
+    t6 = t5 - t14;
+    t13 = t12 - t9;
+    t0 = t3 - t8;
+    t4 = t2 + t10;
+    t5 = t7 + t1;
+    t14 = t11 + t0;
+    t12 = t6 - t13;
+    t9 = t2 - t10;
+    t3 = t7 - t1;
+    t8 = t11 - t0;
+    t2 = t6 + t13;
+    re[4] = t4;
+    im[4] = t5;
+    re[19] = t14;
+    im[19] = t12;
+    re[34] = t9;
+    im[34] = t3;
+    re[49] = t8;
+    im[49] = t2;
+    t10 = X[224];
+    t7 = X[255];
+    t1 = C133 * t10;
+    t11 = C134 * t7;
+    t0 = t1 + t11;
+    t6 = (-C134) * t10;
+    t13 = C133 * t7;
+    t4 = t6 + t13;
+    t5 = X[344];
+    t14 = X[135];
+    t12 = C135 * t5;
+    t9 = C136 * t14;
+    t3 = t12 + t9;
+    t8 = (-C136) * t5;
+    t2 = C135 * t14;
+    t1 = t8 + t2;
+    t11 = X[464];
+    t10 = X[15];
+    t7 = C137 * t11;
+    t6 = C138 * t10;
+    t13 = t7 + t6;
+    t12 = (-C138) * t11;
+    t9 = C137 * t10;
+    t5 = t12 + t9;
+    t14 = X[104];
+    t8 = X[375];
+    t2 = C139 * t14;
+    t7 = C140 * t8;
+    t6 = t2 + t7;
+    t11 = (-C140) * t14;
+    t10 = C139 * t8;
+    t12 = t11 + t10;
+    t9 = t0 + t13;
+    t2 = t4 + t5;
+    t7 = t3 + t6;
+    t14 = t1 + t12;
+    t8 = t0 - t13;
+    t11 = t4 - t5;
+    t10 = t3 - t6;
+    t0 = t1 - t12;
+    t13 = t9 + t7;
+    t4 = t2 + t14;
+    t5 = t8 + t0;
+    t3 = t11 - t10;
+    t6 = t9 - t7;
+    t1 = t2 - t14;
+    t12 = t8 - t0;
+    t9 = t11 + t10;
+    re[112] = t13;
+    im[112] = t4;
+    re[172] = t5;
+    im[172] = t3;
+    re[232] = t6;
+    im[232] = t1;
+    re[52] = t12;
+    im[52] = t9;
+    t7 = X[254];
+    t2 = X[225];
+    t14 = C141 * t7;
+    t8 = C142 * t2;
+    t0 = t14 + t8;
+    t11 = (-C142) * t7;
+    t10 = C141 * t2;
+    t13 = t11 + t10;
+    t4 = X[374];
+    t5 = X[105];
+    t3 = C143 * t4;
+    t6 = C144 * t5;
+    t1 = t3 + t6;
+    t12 = (-C144) * t4;
+    t9 = C143 * t5;
+    t14 = t12 + t9;
+    t8 = X[14];
+    t7 = X[465];
+    t2 = C145 * t8;
+    t11 = C146 * t7;
+    t10 = t2 + t11;
+    t3 = (-C146) * t8;
+    t6 = C145 * t7;
+    t4 = t3 + t6;
+    t5 = X[134];
+    t12 = X[345];
+    t9 = C147 * t5;
+    t2 = C148 * t12;
+    t11 = t9 + t2;
+    t8 = (-C148) * t5;
+    t7 = C147 * t12;
+    t3 = t8 + t7;
+    t6 = t0 + t10;
+    t9 = t13 + t4;
+    t2 = t1 + t11;
+    t5 = t14 + t3;
+    t12 = t0 - t10;
+    t8 = t13 - t4;
+    t7 = t1 - t11;
+    t0 = t14 - t3;
+    t10 = t6 + t2;
+    t13 = t9 + t5;
+    t4 = t12 + t0;
+    t1 = t8 - t7;
+    t11 = t6 - t2;
+    t14 = t9 - t5;
+    t3 = t12 - t0;
+    t6 = t8 + t7;
+    t2 = t4 + t1;
+    t9 = C16 * t2;
+    t5 = t4 * (-C17);
+    t12 = t1 * C18;
+    t0 = t9 - t12;
+    t8 = t9 + t5;
+    t7 = t11 + t14;
+    t2 = t11 - t14;
+    t4 = C19 * t7;
+    t1 = (-C19) * t2;
+    t12 = t3 + t6;
+    t9 = C20 * t12;
+    t5 = t3 * (-C17);
+    t11 = t6 * (-C18);
+    t14 = t9 - t11;
+    t7 = t9 + t5;
+    re[127] = t10;
+    im[127] = t13;
+    re[187] = t0;
+    im[187] = t8;
+    re[7] = t4;
+    im[7] = t1;
+    re[67] = t14;
+    im[67] = t7;
+    t2 = X[284];
+    t12 = X[195];
+    t3 = C149 * t2;
+    t6 = C150 * t12;
+    t11 = t3 + t6;
+    t9 = (-C150) * t2;
+    t5 = C149 * t12;
+    t10 = t9 + t5;
+    t13 = X[404];
+    t0 = X[75];
+    t8 = C151 * t13;
+    t4 = C152 * t0;
+    t1 = t8 + t4;
+    t14 = (-C152) * t13;
+    t7 = C151 * t0;
+    t3 = t14 + t7;
+    t6 = X[44];
+    t2 = X[435];
+    t12 = C153 * t6;
+    t9 = C154 * t2;
+    t5 = t12 + t9;
+    t8 = (-C154) * t6;
+    t4 = C153 * t2;
+    t13 = t8 + t4;
+    t0 = X[164];
+    t14 = X[315];
+    t7 = C155 * t0;
+    t12 = C156 * t14;
+    t9 = t7 + t12;
+    t6 = (-C156) * t0;
+    t2 = C155 * t14;
+    t8 = t6 + t2;
+    t4 = t11 + t5;
+    t7 = t10 + t13;
+    t12 = t1 + t9;
+    t0 = t3 + t8;
+    t14 = t11 - t5;
+    t6 = t10 - t13;
+    t2 = t1 - t9;
+    t11 = t3 - t8;
+    t5 = t4 + t12;
+    t10 = t7 + t0;
+    t13 = t14 + t11;
+    t1 = t6 - t2;
+    t9 = t4 - t12;
+    t3 = t7 - t0;
+    t8 = t14 - t11;
+    t4 = t6 + t2;
+    t12 = t13 + t1;
+    t7 = t13 - t1;
+    t0 = C19 * t12;
+    t14 = (-C19) * t7;
+    t11 = -t9;
+    t6 = t8 - t4;
+    t2 = t8 + t4;
+    t13 = (-C19) * t6;
+    t1 = (-C19) * t2;
+    re[142] = t5;
+    im[142] = t10;
+    re[202] = t0;
+    im[202] = t14;
+    re[22] = t3;
+    im[22] = t11;
+    re[82] = t13;
+    im[82] = t1;
+    t12 = X[314];
+    t7 = X[165];
+    t9 = C157 * t12;
+    t8 = C158 * t7;
+    t4 = t9 + t8;
+    t6 = (-C158) * t12;
+    t2 = C157 * t7;
+    t5 = t6 + t2;
+    t10 = X[434];
+    t0 = X[45];
+    t14 = C159 * t10;
+    t3 = C160 * t0;
+    t11 = t14 + t3;
+    t13 = (-C160) * t10;
+    t1 = C159 * t0;
+    t9 = t13 + t1;
+    t8 = X[74];
+    t12 = X[405];
+    t7 = C161 * t8;
+    t6 = C162 * t12;
+    t2 = t7 + t6;
+    t14 = (-C162) * t8;
+    t3 = C161 * t12;
+    t10 = t14 + t3;
+    t0 = X[194];
+    t13 = X[285];
+    t1 = C163 * t0;
+    t7 = C164 * t13;
+    t6 = t1 + t7;
+    t8 = (-C164) * t0;
+    t12 = C163 * t13;
+    t14 = t8 + t12;
+    t3 = t4 + t2;
+    t1 = t5 + t10;
+    t7 = t11 + t6;
+    t0 = t9 + t14;
+    t13 = t4 - t2;
+    t8 = t5 - t10;
+    t12 = t11 - t6;
+    t4 = t9 - t14;
+    t2 = t3 + t7;
+    t5 = t1 + t0;
+    t10 = t13 + t4;
+    t11 = t8 - t12;
+    t6 = t3 - t7;
+    t9 = t1 - t0;
+    t14 = t13 - t4;
+    t3 = t8 + t12;
+    t7 = t10 + t11;
+    t1 = C20 * t7;
+    t0 = t10 * (-C17);
+    t13 = t11 * (-C18);
+    t4 = t1 - t13;
+    t8 = t1 + t0;
+    t12 = t6 - t9;
+    t7 = t6 + t9;
+    t10 = (-C19) * t12;
+    t11 = (-C19) * t7;
+    t13 = t14 + t3;
+    t1 = (-C16) * t13;
+    t0 = t14 * C17;
+    t6 = t3 * (-C18);
+    t9 = t1 - t6;
+    t12 = t1 + t0;
+    re[157] = t2;
+    im[157] = t5;
+    re[217] = t4;
+    im[217] = t8;
+    re[37] = t10;
+    im[37] = t11;
+    re[97] = t9;
+    im[97] = t12;
+    t7 = re[112];
+    t13 = im[112];
+    t14 = re[127];
+    t3 = im[127];
+    t6 = re[142];
+    t1 = im[142];
+    t0 = re[157];
+    t2 = im[157];
+    t5 = t7 + t6;
+    t4 = t13 + t1;
+    t8 = t14 + t0;
+    t10 = t3 + t2;
+    t11 = t7 - t6;
+    t9 = t13 - t1;
+    t12 = t14 - t0;
+    t7 = t3 - t2;
+    t6 = t5 + t8;
+    t13 = t4 + t10;
+    t1 = t11 + t7;
+    t14 = t9 - t12;
+    t0 = t5 - t8;
+    t3 = t4 - t10;
+    t2 = t11 - t7;
+    t5 = t9 + t12;
+    re[112] = t6;
+    im[112] = t13;
+    re[127] = t1;
+    im[127] = t14;
+    re[142] = t0;
+    im[142] = t3;
+    re[157] = t2;
+    im[157] = t5;
+    t8 = re[172];
+    t4 = im[172];
+    t10 = re[187];
+    t11 = im[187];
+    t7 = re[202];
+    t9 = im[202];
+    t12 = re[217];
+    t6 = im[217];
+    t13 = t8 + t7;
+    t1 = t4 + t9;
+    t14 = t10 + t12;
+    t0 = t11 + t6;
+    t3 = t8 - t7;
+    t2 = t4 - t9;
+    t5 = t10 - t12;
+    t8 = t11 - t6;
+    t7 = t13 + t14;
+    t4 = t1 + t0;
+    t9 = t3 + t8;
+    t10 = t2 - t5;
+    t12 = t13 - t14;
+    t11 = t1 - t0;
+    t6 = t3 - t8;
+    t13 = t2 + t5;
+    re[172] = t7;
+    im[172] = t4;
+    re[187] = t9;
+    im[187] = t10;
+    re[202] = t12;
+    im[202] = t11;
+    re[217] = t6;
+    im[217] = t13;
+    t14 = re[232];
+    t1 = im[232];
+    t0 = re[7];
+    t3 = im[7];
+    t8 = re[22];
+    t2 = im[22];
+    t5 = re[37];
+    t7 = im[37];
+    t4 = t14 + t8;
+    t9 = t1 + t2;
+    t10 = t0 + t5;
+    t12 = t3 + t7;
+    t11 = t14 - t8;
+    t6 = t1 - t2;
+    t13 = t0 - t5;
+    t14 = t3 - t7;
+    t8 = t4 + t10;
+    t1 = t9 + t12;
+    t2 = t11 + t14;
+    t0 = t6 - t13;
+    t5 = t4 - t10;
+    t3 = t9 - t12;
+    t7 = t11 - t14;
+    t4 = t6 + t13;
+    re[232] = t8;
+    im[232] = t1;
+    re[7] = t2;
+    im[7] = t0;
+    re[22] = t5;
+    im[22] = t3;
+    re[37] = t7;
+    im[37] = t4;
+    t10 = re[52];
+    t9 = im[52];
+    t12 = re[67];
+    t11 = im[67];
+    t14 = re[82];
+    t6 = im[82];
+    t13 = re[97];
+    t8 = im[97];
+    t1 = t10 + t14;
+    t2 = t9 + t6;
+    t0 = t12 + t13;
+    t5 = t11 + t8;
+    t3 = t10 - t14;
+    t7 = t9 - t6;
+    t4 = t12 - t13;
+    t10 = t11 - t8;
+    t14 = t1 + t0;
+    t9 = t2 + t5;
+    t6 = t3 + t10;
+    t12 = t7 - t4;
+    t13 = t1 - t0;
+    t11 = t2 - t5;
+    t8 = t3 - t10;
+    t1 = t7 + t4;
+    re[52] = t14;
+    im[52] = t9;
+    re[67] = t6;
+    im[67] = t12;
+    re[82] = t13;
+    im[82] = t11;
+    re[97] = t8;
+    im[97] = t1;
+}
+
+/**
+ *  Part 6 of ApplyWindowedIMDCT_W10_480().
+ * 
+ *  @param {Number[]} X 
+ *    - The input block (480 points).
+ *  @param {Number[]} y 
+ *    - The array that would contain the output block (960 points).
+ *  @param {Number[]} re 
+ *    - The scratch buffer (real part, 240 points).
+ *  @param {Number[]} im 
+ *    - The scratch buffer (imaginary part, 240 points).
+ */
+function ApplyWindowedIMDCT_W10_480_Part6(X, y, re, im) {
+    let t0, t1, t10, t11, t12, t13, t14, t2, t3, t4, t5, t6, t7, t8, t9;
+    const C0 = 0.5590169943749475;
+    const C1 = 0.25;
+    const C2 = 0.9510565162951535;
+    const C3 = 0.5877852522924731;
+    const C4 = 0.5;
+    const C5 = 0.8660254037844386;
+    const C6 = 0.9999986613495281;
+    const C7 = 0.0016362454436240478;
+    const C8 = 0.498582300553759;
+    const C9 = 0.8668423672009352;
+    const C10 = 0.8652061217573113;
+    const C11 = 0.501416360795769;
+    const C12 = 0.8619058515047743;
+    const C13 = 0.507068341687617;
+    const C14 = 0.9999665339174011;
+    const C15 = 0.008181139603937128;
+    const C16 = 0.49289819222978404;
+    const C17 = 0.8700869911087115;
+    const C18 = 0.4871929697877464;
+    const C19 = 0.8732943433856628;
+    const C20 = 0.8585686600742043;
+    const C21 = 0.5126986014593617;
+    const C22 = 0.999891571247108;
+    const C23 = 0.014725683311458524;
+    const C24 = 0.9997737765498004;
+    const C25 = 0.02126959621971774;
+    const C26 = 0.4814668776203871;
+    const C27 = 0.8764642866394929;
+    const C28 = 0.8551946904197751;
+    const C29 = 0.5183068989294132;
+    const C30 = 0.8517840870711173;
+    const C31 = 0.5238929938569739;
+    const C32 = 0.9996131548714108;
+    const C33 = 0.027812598009265603;
+    const C34 = 0.4757201610144368;
+    const C35 = 0.8795966850803829;
+    const C36 = 0.4699530661401083;
+    const C37 = 0.8826914045268092;
+    const C38 = 0.8483369961271269;
+    const C39 = 0.529456646952329;
+    const C40 = 0.9994097130924373;
+    const C41 = 0.034354408399682276;
+    const C42 = 0.9991634599276488;
+    const C43 = 0.04089474716158345;
+    const C44 = 0.46416584004055156;
+    const C45 = 0.8857483124112905;
+    const C46 = 0.8448535652497071;
+    const C47 = 0.5349976198870972;
+    const C48 = 0.841333943657443;
+    const C49 = 0.5405156753044398;
+    const C50 = 0.9988744059257111;
+    const C51 = 0.0474333341286245;
+    const C52 = 0.45835873062127125;
+    const C53 = 0.8887672777860675;
+    const C54 = 0.45253198663950756;
+    const C55 = 0.8917481713287112;
+    const C56 = 0.8377782821192093;
+    const C57 = 0.5460105768292282;
+    const C58 = 0.9985425634687357;
+    const C59 = 0.05396988920950189;
+    const C60 = 0.998167946771749;
+    const C61 = 0.06050413239995127;
+    const C62 = 0.44668585769357955;
+    const C63 = 0.8946908653476636;
+    const C64 = 0.8341867329477124;
+    const C65 = 0.5514820890781694;
+    const C66 = 0.8305594499929649;
+    const C67 = 0.5569299776698895;
+    const C68 = 0.9977505718820835;
+    const C69 = 0.06703578379474202;
+    const C70 = 0.44082059421219394;
+    const C71 = 0.8975952337877069;
+    const C72 = 0.43493644744371707;
+    const C73 = 0.9004611522353636;
+    const C74 = 0.8268965886356963;
+    const C75 = 0.562354009234973;
+    const C76 = 0.9972904566786902;
+    const C77 = 0.07356456359966743;
+    const C78 = 0.9967876208713732;
+    const C79 = 0.08009019214353008;
+    const C80 = 0.42903366944541266;
+    const C81 = 0.9032884979242259;
+    const C82 = 0.8231983057806959;
+    const C83 = 0.5677539514259605;
+    const C84 = 0.8194647598500926;
+    const C85 = 0.5731295729273007;
+    const C86 = 0.9962420859999448;
+    const C87 = 0.08661238989012217;
+    const C88 = 0.42311251307264414;
+    const C89 = 0.9060771497402148;
+    const C90 = 0.41717323196804335;
+    const C91 = 0.9088269882267676;
+    const C92 = 0.8156961107765678;
+    const C93 = 0.57848064346526;
+    const C94 = 0.9956538754333033;
+    const C95 = 0.0931308774501998;
+    t0 = re[160];
+    t2 = im[160];
+    t5 = re[208];
+    t3 = im[208];
+    t10 = re[16];
+    t7 = im[16];
+    t4 = re[64];
+    t14 = im[64];
+    t9 = re[112];
+    t6 = im[112];
+    t12 = t5 + t9;
+    t13 = t3 + t6;
+    t11 = t10 + t4;
+    t8 = t7 + t14;
+    t1 = t5 - t9;
+    t5 = t3 - t6;
+    t9 = t10 - t4;
+    t3 = t7 - t14;
+    t6 = t12 + t11;
+    t10 = t13 + t8;
+    t4 = t12 - t11;
+    t7 = C0 * t4;
+    t14 = t13 - t8;
+    t12 = C0 * t14;
+    t11 = C1 * t6;
+    t4 = t0 - t11;
+    t13 = C1 * t10;
+    t8 = t2 - t13;
+    t14 = t4 + t7;
+    t11 = t8 + t12;
+    t13 = t4 - t7;
+    t4 = t8 - t12;
+    t7 = C2 * t1;
+    t8 = C3 * t9;
+    t12 = t7 + t8;
+    t7 = C2 * t5;
+    t8 = C3 * t3;
+    t7 = t7 + t8;
+    t8 = C3 * t1;
+    t1 = C2 * t9;
+    t9 = t8 - t1;
+    t8 = C3 * t5;
+    t1 = C2 * t3;
+    t5 = t8 - t1;
+    t3 = t0 + t6;
+    t8 = t2 + t10;
+    t1 = t14 + t7;
+    t0 = t11 - t12;
+    t6 = t13 + t5;
+    t2 = t4 - t9;
+    t10 = t13 - t5;
+    t13 = t4 + t9;
+    t5 = t14 - t7;
+    t4 = t11 + t12;
+    re[160] = t3;
+    im[160] = t8;
+    re[208] = t1;
+    im[208] = t0;
+    re[16] = t6;
+    im[16] = t2;
+    re[64] = t10;
+    im[64] = t13;
+    re[112] = t5;
+    im[112] = t4;
+    t9 = re[220];
+    t14 = im[220];
+    t7 = re[28];
+    t11 = im[28];
+    t12 = re[76];
+    t3 = im[76];
+    t8 = re[124];
+    t1 = im[124];
+    t0 = re[172];
+    t6 = im[172];
+    t2 = t7 + t0;
+    t10 = t11 + t6;
+    t13 = t12 + t8;
+    t5 = t3 + t1;
+    t4 = t7 - t0;
+    t7 = t11 - t6;
+    t0 = t12 - t8;
+    t11 = t3 - t1;
+    t6 = t2 + t13;
+    t12 = t10 + t5;
+    t8 = t2 - t13;
+    t3 = C0 * t8;
+    t1 = t10 - t5;
+    t2 = C0 * t1;
+    t13 = C1 * t6;
+    t8 = t9 - t13;
+    t10 = C1 * t12;
+    t5 = t14 - t10;
+    t1 = t8 + t3;
+    t13 = t5 + t2;
+    t10 = t8 - t3;
+    t8 = t5 - t2;
+    t3 = C2 * t4;
+    t5 = C3 * t0;
+    t2 = t3 + t5;
+    t3 = C2 * t7;
+    t5 = C3 * t11;
+    t3 = t3 + t5;
+    t5 = C3 * t4;
+    t4 = C2 * t0;
+    t0 = t5 - t4;
+    t5 = C3 * t7;
+    t4 = C2 * t11;
+    t7 = t5 - t4;
+    t11 = t9 + t6;
+    t5 = t14 + t12;
+    t4 = t1 + t3;
+    t9 = t13 - t2;
+    t6 = t10 + t7;
+    t14 = t8 - t0;
+    t12 = t10 - t7;
+    t10 = t8 + t0;
+    t7 = t1 - t3;
+    t8 = t13 + t2;
+    re[220] = t11;
+    im[220] = t5;
+    re[28] = t4;
+    im[28] = t9;
+    re[76] = t6;
+    im[76] = t14;
+    re[124] = t12;
+    im[124] = t10;
+    re[172] = t7;
+    im[172] = t8;
+    t0 = re[40];
+    t1 = im[40];
+    t3 = re[88];
+    t13 = im[88];
+    t2 = re[136];
+    t11 = im[136];
+    t5 = re[184];
+    t4 = im[184];
+    t9 = re[232];
+    t6 = im[232];
+    t14 = t3 + t9;
+    t12 = t13 + t6;
+    t10 = t2 + t5;
+    t7 = t11 + t4;
+    t8 = t3 - t9;
+    t3 = t13 - t6;
+    t9 = t2 - t5;
+    t13 = t11 - t4;
+    t6 = t14 + t10;
+    t2 = t12 + t7;
+    t5 = t14 - t10;
+    t11 = C0 * t5;
+    t4 = t12 - t7;
+    t14 = C0 * t4;
+    t10 = C1 * t6;
+    t5 = t0 - t10;
+    t12 = C1 * t2;
+    t7 = t1 - t12;
+    t4 = t5 + t11;
+    t10 = t7 + t14;
+    t12 = t5 - t11;
+    t5 = t7 - t14;
+    t11 = C2 * t8;
+    t7 = C3 * t9;
+    t14 = t11 + t7;
+    t11 = C2 * t3;
+    t7 = C3 * t13;
+    t11 = t11 + t7;
+    t7 = C3 * t8;
+    t8 = C2 * t9;
+    t9 = t7 - t8;
+    t7 = C3 * t3;
+    t8 = C2 * t13;
+    t3 = t7 - t8;
+    t13 = t0 + t6;
+    t7 = t1 + t2;
+    t8 = t4 + t11;
+    t0 = t10 - t14;
+    t6 = t12 + t3;
+    t1 = t5 - t9;
+    t2 = t12 - t3;
+    t12 = t5 + t9;
+    t3 = t4 - t11;
+    t5 = t10 + t14;
+    re[40] = t13;
+    im[40] = t7;
+    re[88] = t8;
+    im[88] = t0;
+    re[136] = t6;
+    im[136] = t1;
+    re[184] = t2;
+    im[184] = t12;
+    re[232] = t3;
+    im[232] = t5;
+    t9 = re[100];
+    t4 = im[100];
+    t11 = re[148];
+    t10 = im[148];
+    t14 = re[196];
+    t13 = im[196];
+    t7 = re[4];
+    t8 = im[4];
+    t0 = re[52];
+    t6 = im[52];
+    t1 = t11 + t0;
+    t2 = t10 + t6;
+    t12 = t14 + t7;
+    t3 = t13 + t8;
+    t5 = t11 - t0;
+    t11 = t10 - t6;
+    t0 = t14 - t7;
+    t10 = t13 - t8;
+    t6 = t1 + t12;
+    t14 = t2 + t3;
+    t7 = t1 - t12;
+    t13 = C0 * t7;
+    t8 = t2 - t3;
+    t1 = C0 * t8;
+    t12 = C1 * t6;
+    t7 = t9 - t12;
+    t2 = C1 * t14;
+    t3 = t4 - t2;
+    t8 = t7 + t13;
+    t12 = t3 + t1;
+    t2 = t7 - t13;
+    t7 = t3 - t1;
+    t13 = C2 * t5;
+    t3 = C3 * t0;
+    t1 = t13 + t3;
+    t13 = C2 * t11;
+    t3 = C3 * t10;
+    t13 = t13 + t3;
+    t3 = C3 * t5;
+    t5 = C2 * t0;
+    t0 = t3 - t5;
+    t3 = C3 * t11;
+    t5 = C2 * t10;
+    t11 = t3 - t5;
+    t10 = t9 + t6;
+    t3 = t4 + t14;
+    t5 = t8 + t13;
+    t9 = t12 - t1;
+    t6 = t2 + t11;
+    t4 = t7 - t0;
+    t14 = t2 - t11;
+    t2 = t7 + t0;
+    t11 = t8 - t13;
+    t7 = t12 + t1;
+    re[100] = t10;
+    im[100] = t3;
+    re[148] = t5;
+    im[148] = t9;
+    re[196] = t6;
+    im[196] = t4;
+    re[4] = t14;
+    im[4] = t2;
+    re[52] = t11;
+    im[52] = t7;
+    t0 = re[175];
+    t8 = im[175];
+    t13 = re[223];
+    t12 = im[223];
+    t1 = re[31];
+    t10 = im[31];
+    t3 = re[79];
+    t5 = im[79];
+    t9 = re[127];
+    t6 = im[127];
+    t4 = t13 + t9;
+    t14 = t12 + t6;
+    t2 = t1 + t3;
+    t11 = t10 + t5;
+    t7 = t13 - t9;
+    t13 = t12 - t6;
+    t9 = t1 - t3;
+    t12 = t10 - t5;
+    t6 = t4 + t2;
+    t1 = t14 + t11;
+    t3 = t4 - t2;
+    t10 = C0 * t3;
+    t5 = t14 - t11;
+    t4 = C0 * t5;
+    t2 = C1 * t6;
+    t3 = t0 - t2;
+    t14 = C1 * t1;
+    t11 = t8 - t14;
+    t5 = t3 + t10;
+    t2 = t11 + t4;
+    t14 = t3 - t10;
+    t3 = t11 - t4;
+    t10 = C2 * t7;
+    t11 = C3 * t9;
+    t4 = t10 + t11;
+    t10 = C2 * t13;
+    t11 = C3 * t12;
+    t10 = t10 + t11;
+    t11 = C3 * t7;
+    t7 = C2 * t9;
+    t9 = t11 - t7;
+    t11 = C3 * t13;
+    t7 = C2 * t12;
+    t13 = t11 - t7;
+    t12 = t0 + t6;
+    t11 = t8 + t1;
+    t7 = t5 + t10;
+    t0 = t2 - t4;
+    t6 = t14 + t13;
+    t8 = t3 - t9;
+    t1 = t14 - t13;
+    t14 = t3 + t9;
+    t13 = t5 - t10;
+    t3 = t2 + t4;
+    re[175] = t12;
+    im[175] = t11;
+    re[223] = t7;
+    im[223] = t0;
+    re[31] = t6;
+    im[31] = t8;
+    re[79] = t1;
+    im[79] = t14;
+    re[127] = t13;
+    im[127] = t3;
+    t9 = re[235];
+    t5 = im[235];
+    t10 = re[43];
+    t2 = im[43];
+    t4 = re[91];
+    t12 = im[91];
+    t11 = re[139];
+    t7 = im[139];
+    t0 = re[187];
+    t6 = im[187];
+    t8 = t10 + t0;
+    t1 = t2 + t6;
+    t14 = t4 + t11;
+    t13 = t12 + t7;
+    t3 = t10 - t0;
+    t10 = t2 - t6;
+    t0 = t4 - t11;
+    t2 = t12 - t7;
+    t6 = t8 + t14;
+    t4 = t1 + t13;
+    t11 = t8 - t14;
+    t12 = C0 * t11;
+    t7 = t1 - t13;
+    t8 = C0 * t7;
+    t14 = C1 * t6;
+    t11 = t9 - t14;
+    t1 = C1 * t4;
+    t13 = t5 - t1;
+    t7 = t11 + t12;
+    t14 = t13 + t8;
+    t1 = t11 - t12;
+    t11 = t13 - t8;
+    t12 = C2 * t3;
+    t13 = C3 * t0;
+    t8 = t12 + t13;
+    t12 = C2 * t10;
+    t13 = C3 * t2;
+    t12 = t12 + t13;
+    t13 = C3 * t3;
+    t3 = C2 * t0;
+    t0 = t13 - t3;
+    t13 = C3 * t10;
+    t3 = C2 * t2;
+    t10 = t13 - t3;
+    t2 = t9 + t6;
+    t13 = t5 + t4;
+    t3 = t7 + t12;
+    t9 = t14 - t8;
+    t6 = t1 + t10;
+    t5 = t11 - t0;
+    t4 = t1 - t10;
+    t1 = t11 + t0;
+    t10 = t7 - t12;
+    t11 = t14 + t8;
+    re[235] = t2;
+    im[235] = t13;
+    re[43] = t3;
+    im[43] = t9;
+    re[91] = t6;
+    im[91] = t5;
+    re[139] = t4;
+    im[139] = t1;
+    re[187] = t10;
+    im[187] = t11;
+    t0 = re[55];
+    t7 = im[55];
+    t12 = re[103];
+    t14 = im[103];
+    t8 = re[151];
+    t2 = im[151];
+    t13 = re[199];
+    t3 = im[199];
+    t9 = re[7];
+    t6 = im[7];
+    t5 = t12 + t9;
+    t4 = t14 + t6;
+    t1 = t8 + t13;
+    t10 = t2 + t3;
+    t11 = t12 - t9;
+    t12 = t14 - t6;
+    t9 = t8 - t13;
+    t14 = t2 - t3;
+    t6 = t5 + t1;
+    t8 = t4 + t10;
+    t13 = t5 - t1;
+    t2 = C0 * t13;
+    t3 = t4 - t10;
+    t5 = C0 * t3;
+    t1 = C1 * t6;
+    t13 = t0 - t1;
+    t4 = C1 * t8;
+    t10 = t7 - t4;
+    t3 = t13 + t2;
+    t1 = t10 + t5;
+    t4 = t13 - t2;
+    t13 = t10 - t5;
+    t2 = C2 * t11;
+    t10 = C3 * t9;
+    t5 = t2 + t10;
+    t2 = C2 * t12;
+    t10 = C3 * t14;
+    t2 = t2 + t10;
+    t10 = C3 * t11;
+    t11 = C2 * t9;
+    t9 = t10 - t11;
+    t10 = C3 * t12;
+    t11 = C2 * t14;
+    t12 = t10 - t11;
+    t14 = t0 + t6;
+    t10 = t7 + t8;
+    t11 = t3 + t2;
+    t0 = t1 - t5;
+    t6 = t4 + t12;
+    t7 = t13 - t9;
+    t8 = t4 - t12;
+    t4 = t13 + t9;
+    t12 = t3 - t2;
+    t13 = t1 + t5;
+    re[55] = t14;
+    im[55] = t10;
+    re[103] = t11;
+    im[103] = t0;
+    re[151] = t6;
+    im[151] = t7;
+    re[199] = t8;
+    im[199] = t4;
+    re[7] = t12;
+    im[7] = t13;
+    t9 = re[115];
+    t3 = im[115];
+    t2 = re[163];
+    t1 = im[163];
+    t5 = re[211];
+    t14 = im[211];
+    t10 = re[19];
+    t11 = im[19];
+    t0 = re[67];
+    t6 = im[67];
+    t7 = t2 + t0;
+    t8 = t1 + t6;
+    t4 = t5 + t10;
+    t12 = t14 + t11;
+    t13 = t2 - t0;
+    t2 = t1 - t6;
+    t0 = t5 - t10;
+    t1 = t14 - t11;
+    t6 = t7 + t4;
+    t5 = t8 + t12;
+    t10 = t7 - t4;
+    t14 = C0 * t10;
+    t11 = t8 - t12;
+    t7 = C0 * t11;
+    t4 = C1 * t6;
+    t10 = t9 - t4;
+    t8 = C1 * t5;
+    t12 = t3 - t8;
+    t11 = t10 + t14;
+    t4 = t12 + t7;
+    t8 = t10 - t14;
+    t10 = t12 - t7;
+    t14 = C2 * t13;
+    t12 = C3 * t0;
+    t7 = t14 + t12;
+    t14 = C2 * t2;
+    t12 = C3 * t1;
+    t14 = t14 + t12;
+    t12 = C3 * t13;
+    t13 = C2 * t0;
+    t0 = t12 - t13;
+    t12 = C3 * t2;
+    t13 = C2 * t1;
+    t2 = t12 - t13;
+    t1 = t9 + t6;
+    t12 = t3 + t5;
+    t13 = t11 + t14;
+    t9 = t4 - t7;
+    t6 = t8 + t2;
+    t3 = t10 - t0;
+    t5 = t8 - t2;
+    t8 = t10 + t0;
+    t2 = t11 - t14;
+    t10 = t4 + t7;
+    re[115] = t1;
+    im[115] = t12;
+    re[163] = t13;
+    im[163] = t9;
+    re[211] = t6;
+    im[211] = t3;
+    re[19] = t5;
+    im[19] = t8;
+    re[67] = t2;
+    im[67] = t10;
+    t0 = re[190];
+    t11 = im[190];
+    t14 = re[238];
+    t4 = im[238];
+    t7 = re[46];
+    t1 = im[46];
+    t12 = re[94];
+    t13 = im[94];
+    t9 = re[142];
+    t6 = im[142];
+    t3 = t14 + t9;
+    t5 = t4 + t6;
+    t8 = t7 + t12;
+    t2 = t1 + t13;
+    t10 = t14 - t9;
+    t14 = t4 - t6;
+    t9 = t7 - t12;
+    t4 = t1 - t13;
+    t6 = t3 + t8;
+    t7 = t5 + t2;
+    t12 = t3 - t8;
+    t1 = C0 * t12;
+    t13 = t5 - t2;
+    t3 = C0 * t13;
+    t8 = C1 * t6;
+    t12 = t0 - t8;
+    t5 = C1 * t7;
+    t2 = t11 - t5;
+    t13 = t12 + t1;
+    t8 = t2 + t3;
+    t5 = t12 - t1;
+    t12 = t2 - t3;
+    t1 = C2 * t10;
+    t2 = C3 * t9;
+    t3 = t1 + t2;
+    t1 = C2 * t14;
+    t2 = C3 * t4;
+    t1 = t1 + t2;
+    t2 = C3 * t10;
+    t10 = C2 * t9;
+    t9 = t2 - t10;
+    t2 = C3 * t14;
+    t10 = C2 * t4;
+    t14 = t2 - t10;
+    t4 = t0 + t6;
+    t2 = t11 + t7;
+    t10 = t13 + t1;
+    t0 = t8 - t3;
+    t6 = t5 + t14;
+    t11 = t12 - t9;
+    t7 = t5 - t14;
+    t5 = t12 + t9;
+    t14 = t13 - t1;
+    t12 = t8 + t3;
+    re[190] = t4;
+    im[190] = t2;
+    re[238] = t10;
+    im[238] = t0;
+    re[46] = t6;
+    im[46] = t11;
+    re[94] = t7;
+    im[94] = t5;
+    re[142] = t14;
+    im[142] = t12;
+    t9 = re[10];
+    t13 = im[10];
+    t1 = re[58];
+    t8 = im[58];
+    t3 = re[106];
+    t4 = im[106];
+    t2 = re[154];
+    t10 = im[154];
+    t0 = re[202];
+    t6 = im[202];
+    t11 = t1 + t0;
+    t7 = t8 + t6;
+    t5 = t3 + t2;
+    t14 = t4 + t10;
+    t12 = t1 - t0;
+    t1 = t8 - t6;
+    t0 = t3 - t2;
+    t8 = t4 - t10;
+    t6 = t11 + t5;
+    t3 = t7 + t14;
+    t2 = t11 - t5;
+    t4 = C0 * t2;
+    t10 = t7 - t14;
+    t11 = C0 * t10;
+    t5 = C1 * t6;
+    t2 = t9 - t5;
+    t7 = C1 * t3;
+    t14 = t13 - t7;
+    t10 = t2 + t4;
+    t5 = t14 + t11;
+    t7 = t2 - t4;
+    t2 = t14 - t11;
+    t4 = C2 * t12;
+    t14 = C3 * t0;
+    t11 = t4 + t14;
+    t4 = C2 * t1;
+    t14 = C3 * t8;
+    t4 = t4 + t14;
+    t14 = C3 * t12;
+    t12 = C2 * t0;
+    t0 = t14 - t12;
+    t14 = C3 * t1;
+    t12 = C2 * t8;
+    t1 = t14 - t12;
+    t8 = t9 + t6;
+    t14 = t13 + t3;
+    t12 = t10 + t4;
+    t9 = t5 - t11;
+    t6 = t7 + t1;
+    t13 = t2 - t0;
+    t3 = t7 - t1;
+    t7 = t2 + t0;
+    t1 = t10 - t4;
+    t2 = t5 + t11;
+    re[10] = t8;
+    im[10] = t14;
+    re[58] = t12;
+    im[58] = t9;
+    re[106] = t6;
+    im[106] = t13;
+    re[154] = t3;
+    im[154] = t7;
+    re[202] = t1;
+    im[202] = t2;
+    t0 = re[70];
+    t10 = im[70];
+    t4 = re[118];
+    t5 = im[118];
+    t11 = re[166];
+    t8 = im[166];
+    t14 = re[214];
+    t12 = im[214];
+    t9 = re[22];
+    t6 = im[22];
+    t13 = t4 + t9;
+    t3 = t5 + t6;
+    t7 = t11 + t14;
+    t1 = t8 + t12;
+    t2 = t4 - t9;
+    t4 = t5 - t6;
+    t9 = t11 - t14;
+    t5 = t8 - t12;
+    t6 = t13 + t7;
+    t11 = t3 + t1;
+    t14 = t13 - t7;
+    t8 = C0 * t14;
+    t12 = t3 - t1;
+    t13 = C0 * t12;
+    t7 = C1 * t6;
+    t14 = t0 - t7;
+    t3 = C1 * t11;
+    t1 = t10 - t3;
+    t12 = t14 + t8;
+    t7 = t1 + t13;
+    t3 = t14 - t8;
+    t14 = t1 - t13;
+    t8 = C2 * t2;
+    t1 = C3 * t9;
+    t13 = t8 + t1;
+    t8 = C2 * t4;
+    t1 = C3 * t5;
+    t8 = t8 + t1;
+    t1 = C3 * t2;
+    t2 = C2 * t9;
+    t9 = t1 - t2;
+    t1 = C3 * t4;
+    t2 = C2 * t5;
+    t4 = t1 - t2;
+    t5 = t0 + t6;
+    t1 = t10 + t11;
+    t2 = t12 + t8;
+    t0 = t7 - t13;
+    t6 = t3 + t4;
+    t10 = t14 - t9;
+    t11 = t3 - t4;
+    t3 = t14 + t9;
+    t4 = t12 - t8;
+    t14 = t7 + t13;
+    re[70] = t5;
+    im[70] = t1;
+    re[118] = t2;
+    im[118] = t0;
+    re[166] = t6;
+    im[166] = t10;
+    re[214] = t11;
+    im[214] = t3;
+    re[22] = t4;
+    im[22] = t14;
+    t9 = re[130];
+    t12 = im[130];
+    t8 = re[178];
+    t7 = im[178];
+    t13 = re[226];
+    t5 = im[226];
+    t1 = re[34];
+    t2 = im[34];
+    t0 = re[82];
+    t6 = im[82];
+    t10 = t8 + t0;
+    t11 = t7 + t6;
+    t3 = t13 + t1;
+    t4 = t5 + t2;
+    t14 = t8 - t0;
+    t8 = t7 - t6;
+    t0 = t13 - t1;
+    t7 = t5 - t2;
+    t6 = t10 + t3;
+    t13 = t11 + t4;
+    t1 = t10 - t3;
+    t5 = C0 * t1;
+    t2 = t11 - t4;
+    t10 = C0 * t2;
+    t3 = C1 * t6;
+    t1 = t9 - t3;
+    t11 = C1 * t13;
+    t4 = t12 - t11;
+    t2 = t1 + t5;
+    t3 = t4 + t10;
+    t11 = t1 - t5;
+    t1 = t4 - t10;
+    t5 = C2 * t14;
+    t4 = C3 * t0;
+    t10 = t5 + t4;
+    t5 = C2 * t8;
+    t4 = C3 * t7;
+    t5 = t5 + t4;
+    t4 = C3 * t14;
+    t14 = C2 * t0;
+    t0 = t4 - t14;
+    t4 = C3 * t8;
+    t14 = C2 * t7;
+    t8 = t4 - t14;
+    t7 = t9 + t6;
+    t4 = t12 + t13;
+    t14 = t2 + t5;
+    t9 = t3 - t10;
+    t6 = t11 + t8;
+    t12 = t1 - t0;
+    t13 = t11 - t8;
+    t11 = t1 + t0;
+    t8 = t2 - t5;
+    t1 = t3 + t10;
+    re[130] = t7;
+    im[130] = t4;
+    re[178] = t14;
+    im[178] = t9;
+    re[226] = t6;
+    im[226] = t12;
+    re[34] = t13;
+    im[34] = t11;
+    re[82] = t8;
+    im[82] = t1;
+    t0 = re[205];
+    t2 = im[205];
+    t5 = re[13];
+    t3 = im[13];
+    t10 = re[61];
+    t7 = im[61];
+    t4 = re[109];
+    t14 = im[109];
+    t9 = re[157];
+    t6 = im[157];
+    t12 = t5 + t9;
+    t13 = t3 + t6;
+    t11 = t10 + t4;
+    t8 = t7 + t14;
+    t1 = t5 - t9;
+    t5 = t3 - t6;
+    t9 = t10 - t4;
+    t3 = t7 - t14;
+    t6 = t12 + t11;
+    t10 = t13 + t8;
+    t4 = t12 - t11;
+    t7 = C0 * t4;
+    t14 = t13 - t8;
+    t12 = C0 * t14;
+    t11 = C1 * t6;
+    t4 = t0 - t11;
+    t13 = C1 * t10;
+    t8 = t2 - t13;
+    t14 = t4 + t7;
+    t11 = t8 + t12;
+    t13 = t4 - t7;
+    t4 = t8 - t12;
+    t7 = C2 * t1;
+    t8 = C3 * t9;
+    t12 = t7 + t8;
+    t7 = C2 * t5;
+    t8 = C3 * t3;
+    t7 = t7 + t8;
+    t8 = C3 * t1;
+    t1 = C2 * t9;
+    t9 = t8 - t1;
+    t8 = C3 * t5;
+    t1 = C2 * t3;
+    t5 = t8 - t1;
+    t3 = t0 + t6;
+    t8 = t2 + t10;
+    t1 = t14 + t7;
+    t0 = t11 - t12;
+    t6 = t13 + t5;
+    t2 = t4 - t9;
+    t10 = t13 - t5;
+    t13 = t4 + t9;
+    t5 = t14 - t7;
+    t4 = t11 + t12;
+    re[205] = t3;
+    im[205] = t8;
+    re[13] = t1;
+    im[13] = t0;
+    re[61] = t6;
+    im[61] = t2;
+    re[109] = t10;
+    im[109] = t13;
+    re[157] = t5;
+    im[157] = t4;
+    t9 = re[25];
+    t14 = im[25];
+    t7 = re[73];
+    t11 = im[73];
+    t12 = re[121];
+    t3 = im[121];
+    t8 = re[169];
+    t1 = im[169];
+    t0 = re[217];
+    t6 = im[217];
+    t2 = t7 + t0;
+    t10 = t11 + t6;
+    t13 = t12 + t8;
+    t5 = t3 + t1;
+    t4 = t7 - t0;
+    t7 = t11 - t6;
+    t0 = t12 - t8;
+    t11 = t3 - t1;
+    t6 = t2 + t13;
+    t12 = t10 + t5;
+    t8 = t2 - t13;
+    t3 = C0 * t8;
+    t1 = t10 - t5;
+    t2 = C0 * t1;
+    t13 = C1 * t6;
+    t8 = t9 - t13;
+    t10 = C1 * t12;
+    t5 = t14 - t10;
+    t1 = t8 + t3;
+    t13 = t5 + t2;
+    t10 = t8 - t3;
+    t8 = t5 - t2;
+    t3 = C2 * t4;
+    t5 = C3 * t0;
+    t2 = t3 + t5;
+    t3 = C2 * t7;
+    t5 = C3 * t11;
+    t3 = t3 + t5;
+    t5 = C3 * t4;
+    t4 = C2 * t0;
+    t0 = t5 - t4;
+    t5 = C3 * t7;
+    t4 = C2 * t11;
+    t7 = t5 - t4;
+    t11 = t9 + t6;
+    t5 = t14 + t12;
+    t4 = t1 + t3;
+    t9 = t13 - t2;
+    t6 = t10 + t7;
+    t14 = t8 - t0;
+    t12 = t10 - t7;
+    t10 = t8 + t0;
+    t7 = t1 - t3;
+    t8 = t13 + t2;
+    re[25] = t11;
+    im[25] = t5;
+    re[73] = t4;
+    im[73] = t9;
+    re[121] = t6;
+    im[121] = t14;
+    re[169] = t12;
+    im[169] = t10;
+    re[217] = t7;
+    im[217] = t8;
+    t0 = re[85];
+    t1 = im[85];
+    t3 = re[133];
+    t13 = im[133];
+    t2 = re[181];
+    t11 = im[181];
+    t5 = re[229];
+    t4 = im[229];
+    t9 = re[37];
+    t6 = im[37];
+    t14 = t3 + t9;
+    t12 = t13 + t6;
+    t10 = t2 + t5;
+    t7 = t11 + t4;
+    t8 = t3 - t9;
+    t3 = t13 - t6;
+    t9 = t2 - t5;
+    t13 = t11 - t4;
+    t6 = t14 + t10;
+    t2 = t12 + t7;
+    t5 = t14 - t10;
+    t11 = C0 * t5;
+    t4 = t12 - t7;
+    t14 = C0 * t4;
+    t10 = C1 * t6;
+    t5 = t0 - t10;
+    t12 = C1 * t2;
+    t7 = t1 - t12;
+    t4 = t5 + t11;
+    t10 = t7 + t14;
+    t12 = t5 - t11;
+    t5 = t7 - t14;
+    t11 = C2 * t8;
+    t7 = C3 * t9;
+    t14 = t11 + t7;
+    t11 = C2 * t3;
+    t7 = C3 * t13;
+    t11 = t11 + t7;
+    t7 = C3 * t8;
+    t8 = C2 * t9;
+    t9 = t7 - t8;
+    t7 = C3 * t3;
+    t8 = C2 * t13;
+    t3 = t7 - t8;
+    t13 = t0 + t6;
+    t7 = t1 + t2;
+    t8 = t4 + t11;
+    t0 = t10 - t14;
+    t6 = t12 + t3;
+    t1 = t5 - t9;
+    t2 = t12 - t3;
+    t12 = t5 + t9;
+    t3 = t4 - t11;
+    t5 = t10 + t14;
+    re[85] = t13;
+    im[85] = t7;
+    re[133] = t8;
+    im[133] = t0;
+    re[181] = t6;
+    im[181] = t1;
+    re[229] = t2;
+    im[229] = t12;
+    re[37] = t3;
+    im[37] = t5;
+    t9 = re[145];
+    t4 = im[145];
+    t11 = re[193];
+    t10 = im[193];
+    t14 = re[1];
+    t13 = im[1];
+    t7 = re[49];
+    t8 = im[49];
+    t0 = re[97];
+    t6 = im[97];
+    t1 = t11 + t0;
+    t2 = t10 + t6;
+    t12 = t14 + t7;
+    t3 = t13 + t8;
+    t5 = t11 - t0;
+    t11 = t10 - t6;
+    t0 = t14 - t7;
+    t10 = t13 - t8;
+    t6 = t1 + t12;
+    t14 = t2 + t3;
+    t7 = t1 - t12;
+    t13 = C0 * t7;
+    t8 = t2 - t3;
+    t1 = C0 * t8;
+    t12 = C1 * t6;
+    t7 = t9 - t12;
+    t2 = C1 * t14;
+    t3 = t4 - t2;
+    t8 = t7 + t13;
+    t12 = t3 + t1;
+    t2 = t7 - t13;
+    t7 = t3 - t1;
+    t13 = C2 * t5;
+    t3 = C3 * t0;
+    t1 = t13 + t3;
+    t13 = C2 * t11;
+    t3 = C3 * t10;
+    t13 = t13 + t3;
+    t3 = C3 * t5;
+    t5 = C2 * t0;
+    t0 = t3 - t5;
+    t3 = C3 * t11;
+    t5 = C2 * t10;
+    t11 = t3 - t5;
+    t10 = t9 + t6;
+    t3 = t4 + t14;
+    t5 = t8 + t13;
+    t9 = t12 - t1;
+    t6 = t2 + t11;
+    t4 = t7 - t0;
+    t14 = t2 - t11;
+    t2 = t7 + t0;
+    t11 = t8 - t13;
+    t7 = t12 + t1;
+    re[145] = t10;
+    im[145] = t3;
+    re[193] = t5;
+    im[193] = t9;
+    re[1] = t6;
+    im[1] = t4;
+    re[49] = t14;
+    im[49] = t2;
+    re[97] = t11;
+    im[97] = t7;
+    t0 = re[0];
+    t8 = im[0];
+    t13 = re[80];
+    t12 = im[80];
+    t1 = re[160];
+    t10 = im[160];
+    t3 = t13 + t1;
+    t5 = t12 + t10;
+    t9 = C4 * t3;
+    t6 = t0 - t9;
+    t4 = C4 * t5;
+    t14 = t8 - t4;
+    t2 = t13 - t1;
+    t11 = C5 * t2;
+    t7 = t12 - t10;
+    t9 = C5 * t7;
+    t4 = t0 + t3;
+    t13 = t8 + t5;
+    t1 = t6 + t9;
+    t2 = t14 - t11;
+    t12 = t6 - t9;
+    t10 = t14 + t11;
+    t7 = (-C6) * t4;
+    t0 = (-C7) * t13;
+    t3 = t7 + t0;
+    t8 = 0.0567432827310587 * t3;
+    y[719] = t8;
+    t5 = 0.05619993399963794 * t3;
+    y[720] = t5;
+    t6 = C7 * t4;
+    t9 = (-C6) * t13;
+    t14 = t6 + t9;
+    t11 = 0.03645468738771164 * t14;
+    y[239] = t11;
+    t7 = (-0.037324517362488444) * t14;
+    y[240] = t7;
+    t0 = C8 * t1;
+    t8 = C9 * t2;
+    t3 = t0 + t8;
+    y[80] = 0;
+    t5 = (-0.06522570433233141) * t3;
+    y[399] = t5;
+    t4 = (-C9) * t1;
+    t13 = C8 * t2;
+    t6 = t4 + t13;
+    t9 = 0.06388074623827882 * t6;
+    y[560] = t9;
+    t11 = (-0.006213011038741749) * t6;
+    y[879] = t11;
+    t14 = (-C10) * t12;
+    t7 = (-C11) * t10;
+    t0 = t14 + t7;
+    t8 = 0.06388338863652754 * t0;
+    y[559] = t8;
+    t3 = (-0.0061292399876755185) * t0;
+    y[880] = t3;
+    t5 = C11 * t12;
+    t1 = (-C10) * t10;
+    t2 = t5 + t1;
+    y[79] = 0;
+    t4 = (-0.06522300641209615) * t2;
+    y[400] = t4;
+    t13 = re[108];
+    t9 = im[108];
+    t6 = re[188];
+    t11 = im[188];
+    t14 = re[28];
+    t7 = im[28];
+    t8 = t6 + t14;
+    t0 = t11 + t7;
+    t3 = C4 * t8;
+    t12 = t13 - t3;
+    t10 = C4 * t0;
+    t5 = t9 - t10;
+    t1 = t6 - t14;
+    t2 = C5 * t1;
+    t4 = t11 - t7;
+    t3 = C5 * t4;
+    t10 = t13 + t8;
+    t6 = t9 + t0;
+    t14 = t12 + t3;
+    t1 = t5 - t2;
+    t11 = t12 - t3;
+    t7 = t5 + t2;
+    t4 = (-C12) * t10;
+    t13 = (-C13) * t6;
+    t8 = t4 + t13;
+    t9 = 0.06388821873047874 * t8;
+    y[557] = t9;
+    t0 = (-0.005953289064914111) * t8;
+    y[882] = t0;
+    t12 = C13 * t10;
+    t3 = (-C12) * t6;
+    t5 = t12 + t3;
+    y[77] = 0;
+    t2 = (-0.06521807540517484) * t5;
+    y[402] = t2;
+    t4 = (-C14) * t14;
+    t13 = (-C15) * t1;
+    t9 = t4 + t13;
+    t8 = 0.057786933794756926 * t9;
+    y[717] = t8;
+    t0 = 0.055071571653496555 * t9;
+    y[722] = t0;
+    t10 = C15 * t14;
+    t6 = (-C14) * t1;
+    t12 = t10 + t6;
+    t3 = 0.0346948631711804 * t12;
+    y[237] = t3;
+    t5 = (-0.03903937923994008) * t12;
+    y[242] = t5;
+    t2 = C16 * t11;
+    t4 = C17 * t7;
+    t13 = t2 + t4;
+    y[82] = 0;
+    t8 = (-0.06523163211317352) * t13;
+    y[397] = t8;
+    t9 = (-C17) * t11;
+    t0 = C16 * t7;
+    t14 = t9 + t0;
+    t1 = 0.06387494121621416 * t14;
+    y[562] = t1;
+    t10 = (-0.006371533022392319) * t14;
+    y[877] = t10;
+    t6 = re[216];
+    t3 = im[216];
+    t12 = re[56];
+    t5 = im[56];
+    t2 = re[136];
+    t4 = im[136];
+    t13 = t12 + t2;
+    t8 = t5 + t4;
+    t11 = C4 * t13;
+    t7 = t6 - t11;
+    t9 = C4 * t8;
+    t0 = t3 - t9;
+    t1 = t12 - t2;
+    t14 = C5 * t1;
+    t10 = t5 - t4;
+    t11 = C5 * t10;
+    t9 = t6 + t13;
+    t12 = t3 + t8;
+    t2 = t7 + t11;
+    t1 = t0 - t14;
+    t5 = t7 - t11;
+    t4 = t0 + t14;
+    t10 = C18 * t9;
+    t6 = C19 * t12;
+    t13 = t10 + t6;
+    y[84] = 0;
+    t3 = (-0.0652382282295469) * t13;
+    y[395] = t3;
+    t8 = (-C19) * t9;
+    t7 = C18 * t12;
+    t11 = t8 + t7;
+    t0 = 0.06386848293926461 * t11;
+    y[564] = t0;
+    t14 = (-0.006517457804168838) * t11;
+    y[875] = t14;
+    t10 = (-C20) * t2;
+    t6 = (-C21) * t1;
+    t13 = t10 + t6;
+    t3 = 0.06389241433934915 * t13;
+    y[555] = t3;
+    t9 = (-0.005766978299216103) * t13;
+    y[884] = t9;
+    t12 = C21 * t2;
+    t8 = (-C20) * t1;
+    t7 = t12 + t8;
+    y[75] = 0;
+    t0 = (-0.06521379274441592) * t7;
+    y[404] = t0;
+    t11 = (-C22) * t5;
+    t14 = (-C23) * t4;
+    t10 = t11 + t14;
+    t6 = 0.05877163873142865 * t10;
+    y[715] = t6;
+    t3 = 0.05388991267917035 * t10;
+    y[724] = t3;
+    t13 = C23 * t5;
+    t9 = (-C22) * t4;
+    t2 = t13 + t9;
+    t1 = 0.032913357533032775 * t2;
+    y[235] = t1;
+    t12 = (-0.040716385571083216) * t2;
+    y[244] = t12;
+    t8 = re[84];
+    t7 = im[84];
+    t0 = re[164];
+    t11 = im[164];
+    t14 = re[4];
+    t6 = im[4];
+    t10 = t0 + t14;
+    t3 = t11 + t6;
+    t5 = C4 * t10;
+    t4 = t8 - t5;
+    t13 = C4 * t3;
+    t9 = t7 - t13;
+    t1 = t0 - t14;
+    t2 = C5 * t1;
+    t12 = t11 - t6;
+    t5 = C5 * t12;
+    t13 = t8 + t10;
+    t0 = t7 + t3;
+    t14 = t4 + t5;
+    t1 = t9 - t2;
+    t11 = t4 - t5;
+    t6 = t9 + t2;
+    t12 = (-C24) * t13;
+    t8 = (-C25) * t0;
+    t10 = t12 + t8;
+    t7 = 0.05969556670068119 * t10;
+    y[713] = t7;
+    t3 = 0.05265764361408573 * t10;
+    y[726] = t3;
+    t4 = C25 * t13;
+    t5 = (-C24) * t0;
+    t9 = t4 + t5;
+    t2 = 0.031117245495375336 * t9;
+    y[233] = t2;
+    t12 = (-0.0423499764361958) * t9;
+    y[246] = t12;
+    t8 = C26 * t14;
+    t7 = C27 * t1;
+    t10 = t8 + t7;
+    y[86] = 0;
+    t3 = (-0.06524546624665062) * t10;
+    y[393] = t3;
+    t13 = (-C27) * t14;
+    t0 = C26 * t1;
+    t4 = t13 + t0;
+    t5 = 0.0638613976780427 * t4;
+    y[566] = t5;
+    t2 = (-0.006649807866197572) * t4;
+    y[873] = t2;
+    t9 = (-C28) * t11;
+    t12 = (-C29) * t6;
+    t8 = t9 + t12;
+    t7 = 0.06389599747119415 * t8;
+    y[553] = t7;
+    t10 = (-0.005571375328374209) * t8;
+    y[886] = t10;
+    t3 = C29 * t11;
+    t14 = (-C28) * t6;
+    t1 = t3 + t14;
+    y[73] = 0;
+    t13 = (-0.06521013571382306) * t1;
+    y[406] = t13;
+    t0 = re[207];
+    t5 = im[207];
+    t4 = re[47];
+    t2 = im[47];
+    t9 = re[127];
+    t12 = im[127];
+    t7 = t4 + t9;
+    t8 = t2 + t12;
+    t10 = C4 * t7;
+    t11 = t0 - t10;
+    t6 = C4 * t8;
+    t3 = t5 - t6;
+    t14 = t4 - t9;
+    t1 = C5 * t14;
+    t13 = t2 - t12;
+    t10 = C5 * t13;
+    t6 = t0 + t7;
+    t4 = t5 + t8;
+    t9 = t11 + t10;
+    t14 = t3 - t1;
+    t2 = t11 - t10;
+    t12 = t3 + t1;
+    t13 = (-C30) * t6;
+    t0 = (-C31) * t4;
+    t7 = t13 + t0;
+    t5 = 0.06389906155872181 * t7;
+    y[551] = t5;
+    t8 = (-0.005367462631492221) * t7;
+    y[888] = t8;
+    t11 = C31 * t6;
+    t10 = (-C30) * t4;
+    t3 = t11 + t10;
+    y[71] = 0;
+    t1 = (-0.06520700875767307) * t3;
+    y[408] = t1;
+    t13 = (-C32) * t9;
+    t0 = (-C33) * t14;
+    t5 = t13 + t0;
+    t7 = 0.060557288918556856 * t5;
+    y[711] = t7;
+    t8 = 0.051377800648534894 * t5;
+    y[728] = t8;
+    t6 = C33 * t9;
+    t4 = (-C32) * t14;
+    t11 = t6 + t4;
+    t10 = 0.02931342966143716 * t11;
+    y[231] = t10;
+    t3 = (-0.04393537373799463) * t11;
+    y[248] = t3;
+    t1 = C34 * t2;
+    t13 = C35 * t12;
+    t0 = t1 + t13;
+    y[88] = 0;
+    t7 = (-0.06525329218524087) * t0;
+    y[391] = t7;
+    t5 = (-C35) * t2;
+    t8 = C34 * t12;
+    t9 = t5 + t8;
+    t14 = 0.06385373867173391 * t9;
+    y[568] = t14;
+    t6 = (-0.006767643514685339) * t9;
+    y[871] = t6;
+    t4 = re[75];
+    t10 = im[75];
+    t11 = re[155];
+    t3 = im[155];
+    t1 = re[235];
+    t13 = im[235];
+    t0 = t11 + t1;
+    t7 = t3 + t13;
+    t2 = C4 * t0;
+    t12 = t4 - t2;
+    t5 = C4 * t7;
+    t8 = t10 - t5;
+    t14 = t11 - t1;
+    t9 = C5 * t14;
+    t6 = t3 - t13;
+    t2 = C5 * t6;
+    t5 = t4 + t0;
+    t11 = t10 + t7;
+    t1 = t12 + t2;
+    t14 = t8 - t9;
+    t3 = t12 - t2;
+    t13 = t8 + t9;
+    t6 = C36 * t5;
+    t4 = C37 * t11;
+    t0 = t6 + t4;
+    y[90] = 0;
+    t10 = (-0.06526165367401689) * t0;
+    y[389] = t10;
+    t7 = (-C37) * t5;
+    t12 = C36 * t11;
+    t2 = t7 + t12;
+    t8 = 0.06384555756860284 * t2;
+    y[570] = t8;
+    t9 = (-0.006870303371576403) * t2;
+    y[869] = t9;
+    t6 = (-C38) * t1;
+    t4 = (-C39) * t14;
+    t0 = t6 + t4;
+    t10 = 0.06390164712913438 * t0;
+    y[549] = t10;
+    t5 = (-0.005156238730818343) * t0;
+    y[890] = t5;
+    t11 = C39 * t1;
+    t7 = (-C38) * t14;
+    t12 = t11 + t7;
+    y[69] = 0;
+    t8 = (-0.06520437037008672) * t12;
+    y[410] = t8;
+    t2 = (-C40) * t3;
+    t9 = (-C41) * t13;
+    t6 = t2 + t9;
+    t4 = 0.061355936833779226 * t6;
+    y[709] = t4;
+    t10 = 0.05005367438834188 * t6;
+    y[730] = t10;
+    t0 = C41 * t3;
+    t5 = (-C40) * t13;
+    t1 = t0 + t5;
+    t14 = 0.027509626239848872 * t1;
+    y[229] = t14;
+    t11 = (-0.04546762605662681) * t1;
+    y[250] = t11;
+    t7 = re[183];
+    t12 = im[183];
+    t8 = re[23];
+    t2 = im[23];
+    t9 = re[103];
+    t4 = im[103];
+    t6 = t8 + t9;
+    t10 = t2 + t4;
+    t3 = C4 * t6;
+    t13 = t7 - t3;
+    t0 = C4 * t10;
+    t5 = t12 - t0;
+    t14 = t8 - t9;
+    t1 = C5 * t14;
+    t11 = t2 - t4;
+    t3 = C5 * t11;
+    t0 = t7 + t6;
+    t8 = t12 + t10;
+    t9 = t13 + t3;
+    t14 = t5 - t1;
+    t2 = t13 - t3;
+    t4 = t5 + t1;
+    t11 = (-C42) * t0;
+    t7 = (-C43) * t8;
+    t6 = t11 + t7;
+    t12 = 0.062091117254326235 * t6;
+    y[707] = t12;
+    t10 = 0.048688863681974705 * t6;
+    y[732] = t10;
+    t13 = C43 * t0;
+    t3 = (-C42) * t8;
+    t5 = t13 + t3;
+    t1 = 0.025713379431564674 * t5;
+    y[227] = t1;
+    t11 = (-0.04694248661658992) * t5;
+    y[252] = t11;
+    t7 = C44 * t9;
+    t12 = C45 * t14;
+    t6 = t7 + t12;
+    y[92] = 0;
+    t10 = (-0.0652704756805466) * t6;
+    y[387] = t10;
+    t0 = (-C45) * t9;
+    t8 = C44 * t14;
+    t13 = t0 + t8;
+    t3 = 0.06383692815507565 * t13;
+    y[572] = t3;
+    t1 = (-0.006957168833277857) * t13;
+    y[867] = t1;
+    t5 = (-C46) * t2;
+    t11 = (-C47) * t4;
+    t7 = t5 + t11;
+    t12 = 0.06390387378480732 * t7;
+    y[547] = t12;
+    t6 = (-0.004938814307956446) * t7;
+    y[892] = t6;
+    t10 = C47 * t2;
+    t9 = (-C46) * t4;
+    t14 = t10 + t9;
+    y[67] = 0;
+    t0 = (-0.0652020984001327) * t14;
+    y[412] = t0;
+    t8 = re[51];
+    t3 = im[51];
+    t13 = re[131];
+    t1 = im[131];
+    t5 = re[211];
+    t11 = im[211];
+    t12 = t13 + t5;
+    t7 = t1 + t11;
+    t6 = C4 * t12;
+    t2 = t8 - t6;
+    t4 = C4 * t7;
+    t10 = t3 - t4;
+    t9 = t13 - t5;
+    t14 = C5 * t9;
+    t0 = t1 - t11;
+    t6 = C5 * t0;
+    t4 = t8 + t12;
+    t13 = t3 + t7;
+    t5 = t2 + t6;
+    t9 = t10 - t14;
+    t1 = t2 - t6;
+    t11 = t10 + t14;
+    t0 = (-C48) * t4;
+    t8 = (-C49) * t13;
+    t12 = t0 + t8;
+    t3 = 0.06390582811752152 * t12;
+    y[545] = t3;
+    t7 = (-0.004716377931516046) * t12;
+    y[894] = t7;
+    t2 = C49 * t4;
+    t6 = (-C48) * t13;
+    t10 = t2 + t6;
+    y[65] = 0;
+    t14 = (-0.06520010442559714) * t10;
+    y[414] = t14;
+    t0 = (-C50) * t5;
+    t8 = (-C51) * t9;
+    t3 = t0 + t8;
+    t12 = 0.0627627062181664 * t3;
+    y[705] = t12;
+    t7 = 0.04728713705877805 * t3;
+    y[734] = t7;
+    t4 = C51 * t5;
+    t13 = (-C50) * t9;
+    t2 = t4 + t13;
+    t6 = 0.02393234998677991 * t2;
+    y[225] = t6;
+    t10 = (-0.04835633349131633) * t2;
+    y[254] = t10;
+    t14 = C52 * t1;
+    t0 = C53 * t11;
+    t8 = t14 + t0;
+    y[94] = 0;
+    t12 = (-0.06527966152120607) * t8;
+    y[385] = t12;
+    t3 = (-C53) * t1;
+    t7 = C52 * t11;
+    t5 = t3 + t7;
+    t9 = 0.06382794532893109 * t5;
+    y[574] = t9;
+    t4 = (-0.007027464603568059) * t5;
+    y[865] = t4;
+    t13 = re[174];
+    t6 = im[174];
+    t2 = re[14];
+    t10 = im[14];
+    t14 = re[94];
+    t0 = im[94];
+    t8 = t2 + t14;
+    t12 = t10 + t0;
+    t1 = C4 * t8;
+    t11 = t13 - t1;
+    t3 = C4 * t12;
+    t7 = t6 - t3;
+    t9 = t2 - t14;
+    t5 = C5 * t9;
+    t4 = t10 - t0;
+    t1 = C5 * t4;
+    t3 = t13 + t8;
+    t2 = t6 + t12;
+    t14 = t11 + t1;
+    t9 = t7 - t5;
+    t10 = t11 - t1;
+    t0 = t7 + t5;
+    t4 = C54 * t3;
+    t13 = C55 * t2;
+    t8 = t4 + t13;
+    y[96] = 0;
+    t6 = (-0.06528912567514392) * t8;
+    y[383] = t6;
+    t12 = (-C55) * t3;
+    t11 = C54 * t2;
+    t1 = t12 + t11;
+    t7 = 0.06381869298416643 * t1;
+    y[576] = t7;
+    t5 = (-0.007080482030554512) * t1;
+    y[863] = t5;
+    t4 = (-C56) * t14;
+    t13 = (-C57) * t9;
+    t8 = t4 + t13;
+    t6 = 0.06390765994078162 * t8;
+    y[543] = t6;
+    t3 = (-0.0044900766713811035) * t8;
+    y[896] = t3;
+    t2 = C57 * t14;
+    t12 = (-C56) * t9;
+    t11 = t2 + t12;
+    y[63] = 0;
+    t7 = (-0.06519823555623225) * t11;
+    y[416] = t7;
+    t1 = (-C58) * t10;
+    t5 = (-C59) * t0;
+    t4 = t1 + t5;
+    t13 = 0.06337102837607919 * t4;
+    y[703] = t13;
+    t6 = 0.04585225338316315 * t4;
+    y[736] = t6;
+    t8 = C59 * t10;
+    t3 = (-C58) * t0;
+    t14 = t8 + t3;
+    t9 = 0.022174305731326876 * t14;
+    y[223] = t9;
+    t2 = (-0.049706070145883165) * t14;
+    y[256] = t2;
+    t12 = re[42];
+    t11 = im[42];
+    t7 = re[122];
+    t1 = im[122];
+    t5 = re[202];
+    t13 = im[202];
+    t4 = t7 + t5;
+    t6 = t1 + t13;
+    t10 = C4 * t4;
+    t0 = t12 - t10;
+    t8 = C4 * t6;
+    t3 = t11 - t8;
+    t9 = t7 - t5;
+    t14 = C5 * t9;
+    t2 = t1 - t13;
+    t10 = C5 * t2;
+    t8 = t12 + t4;
+    t7 = t11 + t6;
+    t5 = t0 + t10;
+    t9 = t3 - t14;
+    t1 = t0 - t10;
+    t13 = t3 + t14;
+    t2 = (-C60) * t8;
+    t12 = (-C61) * t7;
+    t4 = t2 + t12;
+    t11 = 0.06391653084346428 * t4;
+    y[701] = t11;
+    t6 = 0.04438809399288695 * t4;
+    y[738] = t6;
+    t0 = C61 * t8;
+    t10 = (-C60) * t7;
+    t3 = t0 + t10;
+    t14 = 0.02044703037611674 * t3;
+    y[221] = t14;
+    t2 = (-0.050989343718260305) * t3;
+    y[258] = t2;
+    t12 = C62 * t5;
+    t11 = C63 * t9;
+    t4 = t12 + t11;
+    y[98] = 0;
+    t6 = (-0.06529873681880845) * t4;
+    y[381] = t6;
+    t8 = (-C63) * t5;
+    t7 = C62 * t9;
+    t0 = t8 + t7;
+    t10 = 0.06380929968413282 * t0;
+    y[578] = t10;
+    t14 = (-0.007115524149486865) * t0;
+    y[861] = t14;
+    t3 = (-C64) * t1;
+    t2 = (-C65) * t13;
+    t12 = t3 + t2;
+    t11 = 0.06390948422644374 * t12;
+    y[541] = t11;
+    t4 = (-0.004260902338958278) * t12;
+    y[898] = t4;
+    t6 = C65 * t1;
+    t5 = (-C64) * t13;
+    t9 = t6 + t5;
+    y[61] = 0;
+    t8 = (-0.06519637448337647) * t9;
+    y[418] = t8;
+    t7 = re[150];
+    t10 = im[150];
+    t0 = re[230];
+    t14 = im[230];
+    t3 = re[70];
+    t2 = im[70];
+    t11 = t0 + t3;
+    t12 = t14 + t2;
+    t4 = C4 * t11;
+    t1 = t7 - t4;
+    t13 = C4 * t12;
+    t6 = t10 - t13;
+    t5 = t0 - t3;
+    t9 = C5 * t5;
+    t8 = t14 - t2;
+    t4 = C5 * t8;
+    t13 = t7 + t11;
+    t0 = t10 + t12;
+    t3 = t1 + t4;
+    t5 = t6 - t9;
+    t14 = t1 - t4;
+    t2 = t6 + t9;
+    t8 = (-C66) * t13;
+    t7 = (-C67) * t0;
+    t11 = t8 + t7;
+    t10 = 0.06391147058784913 * t11;
+    y[539] = t10;
+    t12 = (-0.004029906321403751) * t11;
+    y[900] = t12;
+    t1 = C67 * t13;
+    t4 = (-C66) * t0;
+    t6 = t1 + t4;
+    y[59] = 0;
+    t9 = (-0.06519434818730074) * t6;
+    y[420] = t9;
+    t8 = (-C68) * t3;
+    t7 = (-C69) * t5;
+    t10 = t8 + t7;
+    t11 = 0.06440024074112252 * t10;
+    y[699] = t11;
+    t12 = 0.042898717811937714 * t10;
+    y[740] = t12;
+    t13 = C69 * t3;
+    t0 = (-C68) * t5;
+    t1 = t13 + t0;
+    t4 = 0.018758124542946664 * t1;
+    y[219] = t4;
+    t6 = (-0.05220426409168448) * t1;
+    y[260] = t6;
+    t9 = C70 * t14;
+    t8 = C71 * t2;
+    t7 = t9 + t8;
+    y[100] = 0;
+    t11 = (-0.06530837587776828) * t7;
+    y[379] = t11;
+    t10 = (-C71) * t14;
+    t12 = C70 * t2;
+    t3 = t10 + t12;
+    t5 = 0.06379988187832196 * t3;
+    y[580] = t5;
+    t13 = (-0.007132088987455223) * t3;
+    y[859] = t13;
+    t0 = re[18];
+    t4 = im[18];
+    t1 = re[98];
+    t6 = im[98];
+    t9 = re[178];
+    t8 = im[178];
+    t7 = t1 + t9;
+    t11 = t6 + t8;
+    t14 = C4 * t7;
+    t2 = t0 - t14;
+    t10 = C4 * t11;
+    t12 = t4 - t10;
+    t5 = t1 - t9;
+    t3 = C5 * t5;
+    t13 = t6 - t8;
+    t14 = C5 * t13;
+    t10 = t0 + t7;
+    t1 = t4 + t11;
+    t9 = t2 + t14;
+    t5 = t12 - t3;
+    t6 = t2 - t14;
+    t8 = t12 + t3;
+    t13 = C72 * t10;
+    t0 = C73 * t1;
+    t7 = t13 + t0;
+    y[102] = 0;
+    t4 = (-0.06531792458769385) * t7;
+    y[377] = t4;
+    t11 = (-C73) * t10;
+    t2 = C72 * t1;
+    t14 = t11 + t2;
+    t12 = 0.06379055508832998 * t14;
+    y[582] = t12;
+    t3 = (-0.007129758433364301) * t14;
+    y[857] = t3;
+    t13 = (-C74) * t9;
+    t0 = (-C75) * t5;
+    t7 = t13 + t0;
+    t4 = 0.06391374403022049 * t7;
+    y[537] = t4;
+    t10 = (-0.003798281081887221) * t7;
+    y[902] = t10;
+    t1 = C75 * t9;
+    t11 = (-C74) * t5;
+    t2 = t1 + t11;
+    y[57] = 0;
+    t12 = (-0.06519202919322843) * t2;
+    y[422] = t12;
+    t14 = (-C76) * t6;
+    t3 = (-C77) * t8;
+    t13 = t14 + t3;
+    t0 = 0.06482389829314764 * t13;
+    y[697] = t0;
+    t4 = 0.041388190121589154 * t13;
+    y[742] = t4;
+    t7 = C77 * t6;
+    t10 = (-C76) * t8;
+    t9 = t7 + t10;
+    t5 = 0.017114937252602207 * t9;
+    y[217] = t5;
+    t1 = (-0.0533493122258349) * t9;
+    y[262] = t1;
+    t11 = re[141];
+    t2 = im[141];
+    t12 = re[221];
+    t14 = im[221];
+    t3 = re[61];
+    t0 = im[61];
+    t13 = t12 + t3;
+    t4 = t14 + t0;
+    t6 = C4 * t13;
+    t8 = t11 - t6;
+    t7 = C4 * t4;
+    t10 = t2 - t7;
+    t5 = t12 - t3;
+    t9 = C5 * t5;
+    t1 = t14 - t0;
+    t6 = C5 * t1;
+    t7 = t11 + t13;
+    t12 = t2 + t4;
+    t3 = t8 + t6;
+    t5 = t10 - t9;
+    t14 = t8 - t6;
+    t0 = t10 + t9;
+    t1 = (-C78) * t7;
+    t11 = (-C79) * t12;
+    t13 = t1 + t11;
+    t2 = 0.06518919423924516 * t13;
+    y[695] = t2;
+    t4 = 0.03986069334723713 * t13;
+    y[744] = t4;
+    t8 = C79 * t7;
+    t6 = (-C78) * t12;
+    t10 = t8 + t6;
+    t9 = 0.01552465912360012 * t10;
+    y[215] = t9;
+    t1 = (-0.05442378957776079) * t10;
+    y[264] = t1;
+    t11 = C80 * t3;
+    t2 = C81 * t5;
+    t13 = t11 + t2;
+    y[104] = 0;
+    t4 = (-0.0653272164205366) * t13;
+    y[375] = t4;
+    t7 = (-C81) * t3;
+    t12 = C80 * t5;
+    t8 = t7 + t12;
+    t6 = 0.06378148182289317 * t8;
+    y[584] = t6;
+    t9 = (-0.007107865754189401) * t8;
+    y[855] = t9;
+    t10 = (-C82) * t14;
+    t1 = (-C83) * t0;
+    t11 = t10 + t1;
+    t2 = 0.06391650428469409 * t11;
+    y[535] = t2;
+    t13 = (-0.00356723377083791) * t11;
+    y[904] = t13;
+    t4 = C83 * t14;
+    t3 = (-C82) * t0;
+    t5 = t4 + t3;
+    y[55] = 0;
+    t7 = (-0.06518921385480789) * t5;
+    y[424] = t7;
+    t12 = re[9];
+    t6 = im[9];
+    t8 = re[89];
+    t9 = im[89];
+    t10 = re[169];
+    t1 = im[169];
+    t2 = t8 + t10;
+    t11 = t9 + t1;
+    t13 = C4 * t2;
+    t14 = t12 - t13;
+    t0 = C4 * t11;
+    t4 = t6 - t0;
+    t3 = t8 - t10;
+    t5 = C5 * t3;
+    t7 = t9 - t1;
+    t13 = C5 * t7;
+    t0 = t12 + t2;
+    t8 = t6 + t11;
+    t10 = t14 + t13;
+    t3 = t4 - t5;
+    t9 = t14 - t13;
+    t1 = t4 + t5;
+    t7 = (-C84) * t0;
+    t12 = (-C85) * t8;
+    t2 = t7 + t12;
+    t6 = 0.06391987476523325 * t2;
+    y[533] = t6;
+    t11 = (-0.003337666561289256) * t2;
+    y[906] = t11;
+    t14 = C85 * t0;
+    t13 = (-C84) * t8;
+    t4 = t14 + t13;
+    y[53] = 0;
+    t5 = (-0.06518577644230557) * t4;
+    y[426] = t5;
+    t7 = (-C86) * t10;
+    t12 = (-C87) * t3;
+    t6 = t7 + t12;
+    t2 = 0.06549826140010584 * t6;
+    y[693] = t2;
+    t11 = 0.03832033405423618 * t6;
+    y[746] = t11;
+    t0 = C87 * t10;
+    t8 = (-C86) * t3;
+    t14 = t0 + t8;
+    t13 = 0.013993950130755195 * t14;
+    y[213] = t13;
+    t4 = (-0.055427636479400355) * t14;
+    y[266] = t4;
+    t5 = C88 * t9;
+    t7 = C89 * t1;
+    t12 = t5 + t7;
+    y[106] = 0;
+    t2 = (-0.06533612118976226) * t12;
+    y[373] = t2;
+    t6 = (-C89) * t9;
+    t11 = C88 * t1;
+    t10 = t6 + t11;
+    t3 = 0.06377278893806684 * t10;
+    y[586] = t3;
+    t0 = (-0.007065752991958113) * t10;
+    y[853] = t0;
+    t8 = re[117];
+    t13 = im[117];
+    t14 = re[197];
+    t4 = im[197];
+    t5 = re[37];
+    t7 = im[37];
+    t12 = t14 + t5;
+    t2 = t4 + t7;
+    t9 = C4 * t12;
+    t1 = t8 - t9;
+    t6 = C4 * t2;
+    t11 = t13 - t6;
+    t3 = t14 - t5;
+    t10 = C5 * t3;
+    t0 = t4 - t7;
+    t9 = C5 * t0;
+    t6 = t8 + t12;
+    t14 = t13 + t2;
+    t5 = t1 + t9;
+    t3 = t11 - t10;
+    t4 = t1 - t9;
+    t7 = t11 + t10;
+    t0 = C90 * t6;
+    t8 = C91 * t14;
+    t12 = t0 + t8;
+    y[108] = 0;
+    t13 = (-0.06534446475572682) * t12;
+    y[371] = t13;
+    t2 = (-C91) * t6;
+    t1 = C90 * t14;
+    t9 = t2 + t1;
+    t11 = 0.06376464605292369 * t9;
+    y[588] = t11;
+    t10 = (-0.007003056530207578) * t9;
+    y[851] = t10;
+    t0 = (-C92) * t5;
+    t8 = (-C93) * t3;
+    t12 = t0 + t8;
+    t13 = 0.06392405017998871 * t12;
+    y[531] = t13;
+    t6 = (-0.003110581081497253) * t12;
+    y[908] = t6;
+    t14 = C93 * t5;
+    t2 = (-C92) * t3;
+    t1 = t14 + t2;
+    y[51] = 0;
+    t11 = (-0.06518151861364742) * t1;
+    y[428] = t11;
+    t9 = (-C94) * t4;
+    t10 = (-C95) * t7;
+    t0 = t9 + t10;
+    t8 = 0.06575363870072876 * t0;
+    y[691] = t8;
+    t13 = 0.03677105102748792 * t0;
+    y[748] = t13;
+    t12 = C95 * t4;
+    t6 = (-C94) * t7;
+    t5 = t12 + t6;
+    t3 = 0.01252924252967493 * t5;
+    y[211] = t3;
+    t14 = (-0.05636118887867944) * t5;
+    y[268] = t14;
+}
+
+/**
+ *  Part 7 of ApplyWindowedIMDCT_W10_480().
+ * 
+ *  @param {Number[]} X 
+ *    - The input block (480 points).
+ *  @param {Number[]} y 
+ *    - The array that would contain the output block (960 points).
+ *  @param {Number[]} re 
+ *    - The scratch buffer (real part, 240 points).
+ *  @param {Number[]} im 
+ *    - The scratch buffer (imaginary part, 240 points).
+ */
+function ApplyWindowedIMDCT_W10_480_Part7(X, y, re, im) {
+    let t0, t1, t10, t11, t12, t13, t14, t2, t3, t4, t5, t6, t7, t8, t9;
+    const C0 = 0.5;
+    const C1 = 0.8660254037844386;
+    const C2 = 0.9950230143684317;
+    const C3 = 0.09964537559345106;
+    const C4 = 0.41121608055064524;
+    const C5 = 0.9115378955899558;
+    const C6 = 0.8118925199965048;
+    const C7 = 0.5838069338177863;
+    const C8 = 0.8080541504430732;
+    const C9 = 0.5891082158243282;
+    const C10 = 0.9943495298293181;
+    const C11 = 0.10615560526045748;
+    const C12 = 0.40524131400498986;
+    const C13 = 0.9142097557035307;
+    const C14 = 0.3992491882701903;
+    const C15 = 0.9168424541138974;
+    const C16 = 0.8041811665392496;
+    const C17 = 0.5943842623956086;
+    const C18 = 0.9936334506657989;
+    const C19 = 0.1126612875746478;
+    const C20 = 0.9928748075523219;
+    const C21 = 0.11916214385424433;
+    const C22 = 0.3932399600289696;
+    const C23 = 0.9194358780450186;
+    const C24 = 0.8002737341907743;
+    const C25 = 0.5996348475233523;
+    const C26 = 0.796332020779044;
+    const C27 = 0.6048597462899679;
+    const C28 = 0.9920736329866334;
+    const C29 = 0.12565789562420054;
+    const C30 = 0.38721388669666557;
+    const C31 = 0.9219899164032446;
+    const C32 = 0.38117122641020335;
+    const C33 = 0.9245044597820724;
+    const C34 = 0.7923561951539422;
+    const C35 = 0.6100587348781819;
+    const C36 = 0.9912299612883853;
+    const C37 = 0.13214826462813015;
+    const C38 = 0.9903438285976649;
+    const C39 = 0.1386329728402267;
+    const C40 = 0.375112238017038;
+    const C41 = 0.9269794004668329;
+    const C42 = 0.7883464276266063;
+    const C43 = 0.6152315905806268;
+    const C44 = 0.7843028899621314;
+    const C45 = 0.6203780918093811;
+    const C46 = 0.9894152728734475;
+    const C47 = 0.1451117424771731;
+    const C48 = 0.36903718106406647;
+    const C49 = 0.9294146324393044;
+    const C50 = 0.3629463157865092;
+    const C51 = 0.9318100513822544;
+    const C52 = 0.7802257553722132;
+    const C53 = 0.6254980181054608;
+    const C54 = 0.98844433389197;
+    const C55 = 0.15158429601004111;
+    const C56 = 0.9874310532450267;
+    const C57 = 0.15805035617617982;
+    const C58 = 0.35683990309676283;
+    const C59 = 0.9341655546839077;
+    const C60 = 0.7761151985077279;
+    const C61 = 0.6305911501482637;
+    const C62 = 0.7719713954512504;
+    const C63 = 0.6356572697649648;
+    const C64 = 0.9863754743381881;
+    const C65 = 0.16450964599109233;
+    const C66 = 0.35071820457322317;
+    const C67 = 0.9364810414423427;
+    const C68 = 0.34458148244908043;
+    const C69 = 0.9387564124698132;
+    const C70 = 0.7677945237095121;
+    const C71 = 0.6406961599398607;
+    const C72 = 0.9852776423889412;
+    const C73 = 0.17096188876030122;
+    const C74 = 0.9841376044247531;
+    const C75 = 0.17740680809120096;
+    const C76 = 0.33842999960108583;
+    const C77 = 0.9409915702969974;
+    const C78 = 0.7635847622057964;
+    const C79 = 0.6457076048236673;
+    const C80 = 0.7593422912722755;
+    const C81 = 0.6506913897427649;
+    const C82 = 0.9829554092810556;
+    const C83 = 0.18384412790489776;
+    const C84 = 0.33226401953829077;
+    const C85 = 0.9431864191771733;
+    const C86 = 0.3260838063907591;
+    const C87 = 0.9453408650903197;
+    const C88 = 0.7550672926422838;
+    const C89 = 0.655647301208395;
+    const C90 = 0.9817311075991542;
+    const C91 = 0.1902735724480359;
+    const C92 = 0.980464751824058;
+    const C93 = 0.19669486630460994;
+    const C94 = 0.31988962489825296;
+    const C95 = 0.9474548157471442;
+    const C96 = 0.7507599494425343;
+    const C97 = 0.660575126925805;
+    const C98 = 0.7464204461852738;
+    const C99 = 0.6654746558033422;
+    const C100 = 0.9791563962022337;
+    const C101 = 0.2031077344077629;
+    const C102 = 0.3136817403988915;
+    const C103 = 0.9495281805930367;
+    const C104 = 0.3074604188177852;
+    const C105 = 0.9515608708119476;
+    const C106 = 0.7420489687603788;
+    const C107 = 0.6703456779614965;
+    const C108 = 0.9778060967792817;
+    const C109 = 0.20951190205156878;
+    const C110 = 0.9764139113975349;
+    const C111 = 0.21590709490280058;
+    const C112 = 0.30122592665564446;
+    const C113 = 0.9535527993301935;
+    const C114 = 0.737645704427393;
+    const C115 = 0.6751879847418903;
+    const C116 = 0.7332108418075048;
+    const C117 = 0.6800013687162181;
+    const C118 = 0.9749798996935817;
+    const C119 = 0.2222930390126813;
+    const C120 = 0.2949785309773635;
+    const C121 = 0.9555038808201862;
+    const C122 = 0.28871849940058025;
+    const C123 = 0.9574140317040883;
+    const C124 = 0.728744570875469;
+    const C125 = 0.6847856236951303;
+    const C126 = 0.9735041230957107;
+    const C127 = 0.22866946082861941;
+    const C128 = 0.9719866448212794;
+    const C129 = 0.23503608720592667;
+    const C130 = 0.2824461000842125;
+    const C131 = 0.9592831701573936;
+    const C132 = 0.724247082951467;
+    const C133 = 0.6895405447370668;
+    const C134 = 0.7197185706929127;
+    const C135 = 0.6942659281570361;
+    const C136 = 0.9704275298740068;
+    const C137 = 0.2413926454195189;
+    const C138 = 0.27616160171697074;
+    const C139 = 0.9611112161124317;
+    const C140 = 0.26986527350584855;
+    const C141 = 0.9628980912617978;
+    const C142 = 0.7151592280861994;
+    const C143 = 0.6989615715353394;
+    const C144 = 0.968826845041188;
+    const C145 = 0.2477388631755984;
+    const C146 = 0.9671846588908337;
+    const C147 = 0.2540744686233185;
+    const C148 = 0.26355738516459076;
+    const C149 = 0.9646437190617081;
+    const C150 = 0.7105692504383896;
+    const C151 = 0.7036272737262429;
+    const C152 = 0.705948834368849;
+    const C153 = 0.7082628348665934;
+    const C154 = 0.965501041768733;
+    const C155 = 0.26039919036642817;
+    const C156 = 0.2572382069021396;
+    const C157 = 0.9663480247352773;
+    const C158 = 0.25090800941106;
+    const C159 = 0.9680109352757227;
+    const C160 = 0.7012981778008244;
+    const C161 = 0.7128680563843799;
+    const C162 = 0.9637760657954398;
+    const C163 = 0.26671275747489837;
+    const C164 = 0.9620098048631839;
+    const C165 = 0.27301489949652735;
+    const C166 = 0.24456706385594387;
+    const C167 = 0.9696323794494915;
+    const C168 = 0.6966174799529641;
+    const C169 = 0.71744274100724;
+    const C170 = 0.6919069413307858;
+    const C171 = 0.7219866927709101;
+    const C172 = 0.9602023346327048;
+    const C173 = 0.27930534646852595;
+    const C174 = 0.2382156418617946;
+    const C175 = 0.9712122877993118;
+    const C176 = 0.23185401550239113;
+    const C177 = 0.9727505926471682;
+    const C178 = 0.6871667637180859;
+    const C179 = 0.7264997170276203;
+    const C180 = 0.9583537325300114;
+    const C181 = 0.2855838289290823;
+    const C182 = 0.9564640777430654;
+    const C183 = 0.29185007792890405;
+    const C184 = 0.22548245728863364;
+    const C185 = 0.974247228097201;
+    const C186 = 0.6823971501682968;
+    const C187 = 0.7309816204544317;
+    const C188 = 0.6775983049957887;
+    const C189 = 0.7354322110615187;
+    const C190 = 0.9545334512183885;
+    const C191 = 0.2981038250427398;
+    const C192 = 0.2191012401568698;
+    const C193 = 0.9757021300385286;
+    t2 = re[225];
+    t1 = im[225];
+    t11 = re[65];
+    t9 = im[65];
+    t10 = re[145];
+    t8 = im[145];
+    t0 = t11 + t10;
+    t13 = t9 + t8;
+    t4 = C0 * t0;
+    t7 = t2 - t4;
+    t12 = C0 * t13;
+    t6 = t1 - t12;
+    t3 = t11 - t10;
+    t5 = C1 * t3;
+    t14 = t9 - t8;
+    t4 = C1 * t14;
+    t12 = t2 + t0;
+    t11 = t1 + t13;
+    t10 = t7 + t4;
+    t3 = t6 - t5;
+    t9 = t7 - t4;
+    t8 = t6 + t5;
+    t14 = (-C2) * t12;
+    t2 = (-C3) * t11;
+    t0 = t14 + t2;
+    t1 = 0.06595802496235868 * t0;
+    y[689] = t1;
+    t13 = 0.0352169718013232 * t0;
+    y[750] = t13;
+    t7 = C3 * t12;
+    t4 = (-C2) * t11;
+    t6 = t7 + t4;
+    t5 = 0.011136259783419419 * t6;
+    y[209] = t5;
+    t14 = (-0.0572255054946812) * t6;
+    y[270] = t14;
+    t2 = C4 * t10;
+    t1 = C5 * t3;
+    t0 = t2 + t1;
+    y[110] = 0;
+    t13 = (-0.06535210541705072) * t0;
+    y[369] = t13;
+    t12 = (-C5) * t10;
+    t11 = C4 * t3;
+    t7 = t12 + t11;
+    t4 = 0.06375719098989517 * t7;
+    y[590] = t4;
+    t5 = (-0.006919324745364981) * t7;
+    y[849] = t5;
+    t6 = (-C6) * t9;
+    t14 = (-C7) * t8;
+    t2 = t6 + t14;
+    t1 = 0.06392915612314413 * t2;
+    y[529] = t1;
+    t0 = (-0.0028871141740734983) * t2;
+    y[910] = t0;
+    t13 = C7 * t9;
+    t10 = (-C6) * t8;
+    t3 = t13 + t10;
+    y[49] = 0;
+    t12 = (-0.06517631264583852) * t3;
+    y[430] = t12;
+    t11 = re[48];
+    t4 = im[48];
+    t7 = re[128];
+    t5 = im[128];
+    t6 = re[208];
+    t14 = im[208];
+    t1 = t7 + t6;
+    t2 = t5 + t14;
+    t0 = C0 * t1;
+    t9 = t11 - t0;
+    t8 = C0 * t2;
+    t13 = t4 - t8;
+    t10 = t7 - t6;
+    t3 = C1 * t10;
+    t12 = t5 - t14;
+    t0 = C1 * t12;
+    t8 = t11 + t1;
+    t7 = t4 + t2;
+    t6 = t9 + t0;
+    t10 = t13 - t3;
+    t5 = t9 - t0;
+    t14 = t13 + t3;
+    t12 = (-C8) * t8;
+    t11 = (-C9) * t7;
+    t1 = t12 + t11;
+    t4 = 0.06393537465311024 * t1;
+    y[527] = t4;
+    t2 = (-0.00266821145861729) * t1;
+    y[912] = t2;
+    t9 = C9 * t8;
+    t0 = (-C8) * t7;
+    t13 = t9 + t0;
+    y[47] = 0;
+    t3 = (-0.06516997341883836) * t13;
+    y[432] = t3;
+    t12 = (-C10) * t6;
+    t11 = (-C11) * t10;
+    t4 = t12 + t11;
+    t1 = 0.06611442465083006 * t4;
+    y[687] = t1;
+    t2 = 0.033662098281655395 * t4;
+    y[752] = t2;
+    t8 = C11 * t6;
+    t7 = (-C10) * t10;
+    t9 = t8 + t7;
+    t0 = 0.009820082785519772 * t9;
+    y[207] = t0;
+    t13 = (-0.05802216528489968) * t9;
+    y[272] = t13;
+    t3 = C12 * t5;
+    t12 = C13 * t14;
+    t11 = t3 + t12;
+    y[112] = 0;
+    t1 = (-0.06535885699030752) * t11;
+    y[367] = t1;
+    t4 = (-C13) * t5;
+    t2 = C12 * t14;
+    t6 = t4 + t2;
+    t10 = 0.06375060486881785 * t6;
+    y[592] = t10;
+    t8 = (-0.006813949450594331) * t6;
+    y[847] = t8;
+    t7 = re[156];
+    t0 = im[156];
+    t9 = re[236];
+    t13 = im[236];
+    t3 = re[76];
+    t12 = im[76];
+    t11 = t9 + t3;
+    t1 = t13 + t12;
+    t5 = C0 * t11;
+    t14 = t7 - t5;
+    t4 = C0 * t1;
+    t2 = t0 - t4;
+    t10 = t9 - t3;
+    t6 = C1 * t10;
+    t8 = t13 - t12;
+    t5 = C1 * t8;
+    t4 = t7 + t11;
+    t9 = t0 + t1;
+    t3 = t14 + t5;
+    t10 = t2 - t6;
+    t13 = t14 - t5;
+    t12 = t2 + t6;
+    t8 = C14 * t4;
+    t7 = C15 * t9;
+    t11 = t8 + t7;
+    y[114] = 0;
+    t0 = (-0.06536456410857705) * t11;
+    y[365] = t0;
+    t1 = (-C15) * t4;
+    t14 = C14 * t9;
+    t5 = t1 + t14;
+    t2 = 0.0637450386687413 * t5;
+    y[594] = t2;
+    t6 = (-0.00668637682480584) * t5;
+    y[845] = t6;
+    t8 = (-C16) * t3;
+    t7 = (-C17) * t10;
+    t11 = t8 + t7;
+    t0 = 0.06394282983321359 * t11;
+    y[525] = t0;
+    t4 = (-0.0024546596113903703) * t11;
+    y[914] = t4;
+    t9 = C17 * t3;
+    t1 = (-C16) * t10;
+    t14 = t9 + t1;
+    y[45] = 0;
+    t2 = (-0.06516237516442214) * t14;
+    y[434] = t2;
+    t5 = (-C18) * t13;
+    t6 = (-C19) * t12;
+    t8 = t5 + t6;
+    t7 = 0.06622623693787076 * t8;
+    y[685] = t7;
+    t0 = 0.03211007605914631 * t8;
+    y[754] = t0;
+    t11 = C19 * t13;
+    t4 = (-C18) * t12;
+    t3 = t11 + t4;
+    t10 = 0.008585211463928835 * t3;
+    y[205] = t10;
+    t9 = (-0.058753072097790196) * t3;
+    y[274] = t9;
+    t1 = re[24];
+    t14 = im[24];
+    t2 = re[104];
+    t5 = im[104];
+    t6 = re[184];
+    t7 = im[184];
+    t8 = t2 + t6;
+    t0 = t5 + t7;
+    t13 = C0 * t8;
+    t12 = t1 - t13;
+    t11 = C0 * t0;
+    t4 = t14 - t11;
+    t10 = t2 - t6;
+    t3 = C1 * t10;
+    t9 = t5 - t7;
+    t13 = C1 * t9;
+    t11 = t1 + t8;
+    t2 = t14 + t0;
+    t6 = t12 + t13;
+    t10 = t4 - t3;
+    t5 = t12 - t13;
+    t7 = t4 + t3;
+    t9 = (-C20) * t11;
+    t1 = (-C21) * t2;
+    t8 = t9 + t1;
+    t14 = 0.06629703045209251 * t8;
+    y[683] = t14;
+    t0 = 0.030564726251030808 * t8;
+    y[756] = t0;
+    t12 = C21 * t11;
+    t13 = (-C20) * t2;
+    t4 = t12 + t13;
+    t3 = 0.00743521332628011 * t4;
+    y[203] = t3;
+    t9 = (-0.059420631359614104) * t4;
+    y[276] = t9;
+    t1 = C22 * t6;
+    t14 = C23 * t10;
+    t8 = t1 + t14;
+    y[116] = 0;
+    t0 = (-0.06536903649107367) * t8;
+    y[363] = t0;
+    t11 = (-C23) * t6;
+    t2 = C22 * t10;
+    t12 = t11 + t2;
+    t13 = 0.06374067739602733 * t12;
+    y[596] = t13;
+    t3 = (-0.006536104773879254) * t12;
+    y[843] = t3;
+    t4 = (-C24) * t5;
+    t9 = (-C25) * t7;
+    t1 = t4 + t9;
+    t14 = 0.06395166168229635 * t1;
+    y[523] = t14;
+    t8 = (-0.0022473617120944145) * t1;
+    y[916] = t8;
+    t0 = C25 * t5;
+    t6 = (-C24) * t7;
+    t10 = t0 + t6;
+    y[43] = 0;
+    t11 = (-0.06515337611344846) * t10;
+    y[436] = t11;
+    t2 = re[132];
+    t13 = im[132];
+    t12 = re[212];
+    t3 = im[212];
+    t4 = re[52];
+    t9 = im[52];
+    t14 = t12 + t4;
+    t1 = t3 + t9;
+    t8 = C0 * t14;
+    t5 = t2 - t8;
+    t7 = C0 * t1;
+    t0 = t13 - t7;
+    t6 = t12 - t4;
+    t10 = C1 * t6;
+    t11 = t3 - t9;
+    t8 = C1 * t11;
+    t7 = t2 + t14;
+    t12 = t13 + t1;
+    t4 = t5 + t8;
+    t6 = t0 - t10;
+    t3 = t5 - t8;
+    t9 = t0 + t10;
+    t11 = (-C26) * t7;
+    t2 = (-C27) * t12;
+    t14 = t11 + t2;
+    t13 = 0.0639619833894649 * t14;
+    y[521] = t13;
+    t1 = (-0.002047155958016181) * t14;
+    y[918] = t1;
+    t5 = C27 * t7;
+    t8 = (-C26) * t12;
+    t0 = t5 + t8;
+    y[41] = 0;
+    t10 = (-0.06514286214822022) * t0;
+    y[438] = t10;
+    t11 = (-C28) * t4;
+    t2 = (-C29) * t6;
+    t13 = t11 + t2;
+    t14 = 0.06633051386661427 * t13;
+    y[681] = t14;
+    t1 = 0.029029664721005044 * t13;
+    y[758] = t1;
+    t7 = C29 * t4;
+    t12 = (-C28) * t6;
+    t5 = t7 + t12;
+    t8 = 0.006372760106669814 * t5;
+    y[201] = t8;
+    t0 = (-0.06002769080651903) * t5;
+    y[278] = t0;
+    t10 = C30 * t3;
+    t11 = C31 * t9;
+    t2 = t10 + t11;
+    y[118] = 0;
+    t14 = (-0.06537212303587102) * t2;
+    y[361] = t14;
+    t13 = (-C31) * t3;
+    t1 = C30 * t9;
+    t4 = t13 + t1;
+    t6 = 0.0637376678799361 * t4;
+    y[598] = t6;
+    t7 = (-0.006362675543032619) * t4;
+    y[841] = t7;
+    t12 = re[15];
+    t8 = im[15];
+    t5 = re[95];
+    t0 = im[95];
+    t10 = re[175];
+    t11 = im[175];
+    t2 = t5 + t10;
+    t14 = t0 + t11;
+    t3 = C0 * t2;
+    t9 = t12 - t3;
+    t13 = C0 * t14;
+    t1 = t8 - t13;
+    t6 = t5 - t10;
+    t4 = C1 * t6;
+    t7 = t0 - t11;
+    t3 = C1 * t7;
+    t13 = t12 + t2;
+    t5 = t8 + t14;
+    t10 = t9 + t3;
+    t6 = t1 - t4;
+    t0 = t9 - t3;
+    t11 = t1 + t4;
+    t7 = C32 * t13;
+    t12 = C33 * t5;
+    t2 = t7 + t12;
+    y[120] = 0;
+    t8 = (-0.06537363179168738) * t2;
+    y[359] = t8;
+    t14 = (-C33) * t13;
+    t9 = C32 * t5;
+    t3 = t14 + t9;
+    t1 = 0.06373619688047501 * t3;
+    y[600] = t1;
+    t4 = (-0.006165496315677645) * t3;
+    y[839] = t4;
+    t7 = (-C34) * t10;
+    t12 = (-C35) * t6;
+    t2 = t7 + t12;
+    t8 = 0.06397390823714251 * t2;
+    y[519] = t8;
+    t13 = (-0.001854765852225621) * t2;
+    y[920] = t13;
+    t5 = C35 * t10;
+    t14 = (-C34) * t6;
+    t9 = t5 + t14;
+    y[39] = 0;
+    t1 = (-0.06513071940550207) * t9;
+    y[440] = t1;
+    t3 = (-C36) * t0;
+    t4 = (-C37) * t11;
+    t7 = t3 + t4;
+    t12 = 0.06633038015089819 * t7;
+    y[679] = t12;
+    t8 = 0.027508326665627986 * t7;
+    y[760] = t8;
+    t2 = C37 * t0;
+    t13 = (-C36) * t11;
+    t10 = t2 + t13;
+    t6 = 0.00539962122791882 * t10;
+    y[199] = t6;
+    t5 = (-0.06057755304458336) * t10;
+    y[280] = t5;
+    t14 = re[123];
+    t9 = im[123];
+    t1 = re[203];
+    t3 = im[203];
+    t4 = re[43];
+    t12 = im[43];
+    t7 = t1 + t4;
+    t8 = t3 + t12;
+    t0 = C0 * t7;
+    t11 = t14 - t0;
+    t2 = C0 * t8;
+    t13 = t9 - t2;
+    t6 = t1 - t4;
+    t10 = C1 * t6;
+    t5 = t3 - t12;
+    t0 = C1 * t5;
+    t2 = t14 + t7;
+    t1 = t9 + t8;
+    t4 = t11 + t0;
+    t6 = t13 - t10;
+    t3 = t11 - t0;
+    t12 = t13 + t10;
+    t5 = (-C38) * t2;
+    t14 = (-C39) * t1;
+    t7 = t5 + t14;
+    t9 = 0.06630050370812882 * t7;
+    y[677] = t9;
+    t8 = 0.026004067883560328 * t7;
+    y[762] = t8;
+    t11 = C39 * t2;
+    t0 = (-C38) * t1;
+    t13 = t11 + t0;
+    t10 = 0.00451656564222036 * t13;
+    y[197] = t10;
+    t5 = (-0.06107370774936289) * t13;
+    y[282] = t5;
+    t14 = C40 * t4;
+    t9 = C41 * t6;
+    t7 = t14 + t9;
+    y[122] = 0;
+    t8 = (-0.06537339617357284) * t7;
+    y[357] = t8;
+    t2 = (-C41) * t4;
+    t1 = C40 * t6;
+    t11 = t2 + t1;
+    t0 = 0.0637364265978129 * t11;
+    y[602] = t0;
+    t10 = (-0.00594393213174328) * t11;
+    y[837] = t10;
+    t13 = (-C42) * t3;
+    t5 = (-C43) * t12;
+    t14 = t13 + t5;
+    t9 = 0.06398752739483611 * t14;
+    y[517] = t9;
+    t7 = (-0.0016708514507894514) * t14;
+    y[922] = t7;
+    t8 = C43 * t3;
+    t4 = (-C42) * t12;
+    t6 = t8 + t4;
+    y[37] = 0;
+    t2 = (-0.0651168569298854) * t6;
+    y[442] = t2;
+    t1 = re[231];
+    t0 = im[231];
+    t11 = re[71];
+    t10 = im[71];
+    t13 = re[151];
+    t5 = im[151];
+    t9 = t11 + t13;
+    t14 = t10 + t5;
+    t7 = C0 * t9;
+    t3 = t1 - t7;
+    t12 = C0 * t14;
+    t8 = t0 - t12;
+    t4 = t11 - t13;
+    t6 = C1 * t4;
+    t2 = t10 - t5;
+    t7 = C1 * t2;
+    t12 = t1 + t9;
+    t11 = t0 + t14;
+    t13 = t3 + t7;
+    t4 = t8 - t6;
+    t10 = t3 - t7;
+    t5 = t8 + t6;
+    t2 = (-C44) * t12;
+    t1 = (-C45) * t11;
+    t9 = t2 + t1;
+    t0 = 0.06400290890259969 * t9;
+    y[515] = t0;
+    t14 = (-0.0014959568039040413) * t9;
+    y[924] = t14;
+    t3 = C45 * t12;
+    t7 = (-C44) * t11;
+    t8 = t3 + t7;
+    y[35] = 0;
+    t6 = (-0.06510120771241108) * t8;
+    y[444] = t6;
+    t2 = (-C46) * t13;
+    t1 = (-C47) * t4;
+    t0 = t2 + t1;
+    t9 = 0.06624490555084939 * t0;
+    y[675] = t9;
+    t14 = 0.024519826061939143 * t0;
+    y[764] = t14;
+    t12 = C47 * t13;
+    t11 = (-C46) * t4;
+    t3 = t12 + t11;
+    t7 = 0.003723341607873698 * t3;
+    y[195] = t7;
+    t8 = (-0.06151976433786564) * t3;
+    y[284] = t8;
+    t6 = C48 * t10;
+    t2 = C49 * t5;
+    t1 = t6 + t2;
+    y[124] = 0;
+    t9 = (-0.06537124410479743) * t1;
+    y[355] = t9;
+    t0 = (-C49) * t10;
+    t14 = C48 * t5;
+    t13 = t0 + t14;
+    t4 = 0.06373852484721008 * t13;
+    y[604] = t4;
+    t12 = (-0.00569735860189269) * t13;
+    y[835] = t12;
+    t11 = re[99];
+    t7 = im[99];
+    t3 = re[179];
+    t8 = im[179];
+    t6 = re[19];
+    t2 = im[19];
+    t1 = t3 + t6;
+    t9 = t8 + t2;
+    t10 = C0 * t1;
+    t5 = t11 - t10;
+    t0 = C0 * t9;
+    t14 = t7 - t0;
+    t4 = t3 - t6;
+    t13 = C1 * t4;
+    t12 = t8 - t2;
+    t10 = C1 * t12;
+    t0 = t11 + t1;
+    t3 = t7 + t9;
+    t6 = t5 + t10;
+    t4 = t14 - t13;
+    t8 = t5 - t10;
+    t2 = t14 + t13;
+    t12 = C50 * t0;
+    t11 = C51 * t3;
+    t1 = t12 + t11;
+    y[126] = 0;
+    t7 = (-0.0653670123272699) * t1;
+    y[353] = t7;
+    t9 = (-C51) * t0;
+    t5 = C50 * t3;
+    t10 = t9 + t5;
+    t14 = 0.0637426511985222 * t10;
+    y[606] = t14;
+    t13 = (-0.005425237731170207) * t10;
+    y[833] = t13;
+    t12 = (-C52) * t6;
+    t11 = (-C53) * t4;
+    t1 = t12 + t11;
+    t7 = 0.0640201095261462 * t1;
+    y[513] = t7;
+    t0 = (-0.001330599200485381) * t1;
+    y[926] = t0;
+    t3 = C53 * t6;
+    t9 = (-C52) * t4;
+    t5 = t3 + t9;
+    y[33] = 0;
+    t14 = (-0.06508371662446119) * t5;
+    y[446] = t14;
+    t10 = (-C54) * t8;
+    t13 = (-C55) * t2;
+    t12 = t10 + t13;
+    t11 = 0.06616745322775633 * t12;
+    y[673] = t11;
+    t7 = 0.023058291641532877 * t12;
+    y[766] = t7;
+    t1 = C55 * t8;
+    t0 = (-C54) * t2;
+    t6 = t1 + t0;
+    t4 = 0.0030186925647621736 * t6;
+    y[193] = t4;
+    t3 = (-0.061919577878109915) * t6;
+    y[286] = t3;
+    t9 = re[222];
+    t5 = im[222];
+    t14 = re[62];
+    t10 = im[62];
+    t13 = re[142];
+    t11 = im[142];
+    t12 = t14 + t13;
+    t7 = t10 + t11;
+    t8 = C0 * t12;
+    t2 = t9 - t8;
+    t1 = C0 * t7;
+    t0 = t5 - t1;
+    t4 = t14 - t13;
+    t6 = C1 * t4;
+    t3 = t10 - t11;
+    t8 = C1 * t3;
+    t1 = t9 + t12;
+    t14 = t5 + t7;
+    t13 = t2 + t8;
+    t4 = t0 - t6;
+    t10 = t2 - t8;
+    t11 = t0 + t6;
+    t3 = (-C56) * t1;
+    t9 = (-C57) * t14;
+    t12 = t3 + t9;
+    t5 = 0.06607195888287949 * t12;
+    y[671] = t5;
+    t7 = 0.021622346992802383 * t12;
+    y[768] = t7;
+    t2 = C57 * t1;
+    t8 = (-C56) * t14;
+    t0 = t2 + t8;
+    t6 = 0.0024003719606811033 * t0;
+    y[191] = t6;
+    t3 = (-0.06227702433516376) * t0;
+    y[288] = t3;
+    t9 = C58 * t13;
+    t5 = C59 * t4;
+    t12 = t9 + t5;
+    y[128] = 0;
+    t7 = (-0.06536052072088393) * t12;
+    y[351] = t7;
+    t1 = (-C59) * t13;
+    t14 = C58 * t4;
+    t2 = t1 + t14;
+    t8 = 0.06374898211812038 * t2;
+    y[608] = t8;
+    t6 = (-0.005126942408932225) * t2;
+    y[831] = t6;
+    t0 = (-C60) * t10;
+    t3 = (-C61) * t11;
+    t9 = t0 + t3;
+    t5 = 0.06403917383826517 * t9;
+    y[511] = t5;
+    t12 = (-0.0011752351076776114) * t9;
+    y[928] = t12;
+    t7 = C61 * t10;
+    t13 = (-C60) * t11;
+    t4 = t7 + t13;
+    y[31] = 0;
+    t1 = (-0.06506434135440026) * t4;
+    y[448] = t1;
+    t14 = re[90];
+    t8 = im[90];
+    t2 = re[170];
+    t6 = im[170];
+    t0 = re[10];
+    t3 = im[10];
+    t5 = t2 + t0;
+    t9 = t6 + t3;
+    t12 = C0 * t5;
+    t10 = t14 - t12;
+    t11 = C0 * t9;
+    t7 = t8 - t11;
+    t13 = t2 - t0;
+    t4 = C1 * t13;
+    t1 = t6 - t3;
+    t12 = C1 * t1;
+    t11 = t14 + t5;
+    t2 = t8 + t9;
+    t0 = t10 + t12;
+    t13 = t7 - t4;
+    t6 = t10 - t12;
+    t3 = t7 + t4;
+    t1 = (-C62) * t11;
+    t14 = (-C63) * t2;
+    t5 = t1 + t14;
+    t8 = 0.06406012827340767 * t5;
+    y[509] = t8;
+    t9 = (-0.0010301210199474054) * t5;
+    y[930] = t9;
+    t10 = C63 * t11;
+    t12 = (-C62) * t2;
+    t7 = t10 + t12;
+    y[29] = 0;
+    t4 = (-0.06504305843540302) * t7;
+    y[450] = t4;
+    t1 = (-C64) * t0;
+    t14 = (-C65) * t13;
+    t8 = t1 + t14;
+    t5 = 0.06596210937435924 * t8;
+    y[669] = t5;
+    t9 = 0.02021441367069516 * t8;
+    y[770] = t9;
+    t11 = C65 * t0;
+    t2 = (-C64) * t13;
+    t10 = t11 + t2;
+    t12 = 0.0018651955361572374 * t10;
+    y[189] = t12;
+    t7 = (-0.0625959792930312) * t10;
+    y[290] = t7;
+    t4 = C66 * t6;
+    t1 = C67 * t3;
+    t14 = t4 + t1;
+    y[130] = 0;
+    t5 = (-0.0653516164427228) * t14;
+    y[349] = t5;
+    t8 = (-C67) * t6;
+    t9 = C66 * t3;
+    t0 = t8 + t9;
+    t13 = 0.06375766803440165 * t0;
+    y[610] = t13;
+    t11 = (-0.004801715457604423) * t0;
+    y[829] = t11;
+    t2 = re[198];
+    t12 = im[198];
+    t10 = re[38];
+    t7 = im[38];
+    t4 = re[118];
+    t1 = im[118];
+    t14 = t10 + t4;
+    t5 = t7 + t1;
+    t6 = C0 * t14;
+    t3 = t2 - t6;
+    t8 = C0 * t5;
+    t9 = t12 - t8;
+    t13 = t10 - t4;
+    t0 = C1 * t13;
+    t11 = t7 - t1;
+    t6 = C1 * t11;
+    t8 = t2 + t14;
+    t10 = t12 + t5;
+    t4 = t3 + t6;
+    t13 = t9 - t0;
+    t7 = t3 - t6;
+    t1 = t9 + t0;
+    t11 = C68 * t8;
+    t2 = C69 * t10;
+    t14 = t11 + t2;
+    y[132] = 0;
+    t12 = (-0.0653401287509749) * t14;
+    y[347] = t12;
+    t5 = (-C69) * t8;
+    t3 = C68 * t10;
+    t6 = t5 + t3;
+    t9 = 0.06376887750782857 * t6;
+    y[612] = t9;
+    t0 = (-0.004448763503311272) * t6;
+    y[827] = t0;
+    t11 = (-C70) * t4;
+    t2 = (-C71) * t13;
+    t14 = t11 + t2;
+    t12 = 0.06408295505704935 * t14;
+    y[507] = t12;
+    t8 = (-0.0008954747285975453) * t14;
+    y[932] = t8;
+    t10 = C71 * t4;
+    t5 = (-C70) * t13;
+    t3 = t10 + t5;
+    y[27] = 0;
+    t9 = (-0.06501988965641992) * t3;
+    y[452] = t9;
+    t6 = (-C72) * t7;
+    t0 = (-C73) * t1;
+    t11 = t6 + t0;
+    t2 = 0.06584130684089498 * t11;
+    y[667] = t2;
+    t12 = 0.01883654300751599 * t11;
+    y[772] = t12;
+    t14 = C73 * t7;
+    t8 = (-C72) * t1;
+    t4 = t14 + t8;
+    t13 = 0.0014091575986145222 * t4;
+    y[187] = t13;
+    t10 = (-0.06288032859008362) * t4;
+    y[292] = t10;
+    t5 = re[66];
+    t3 = im[66];
+    t9 = re[146];
+    t6 = im[146];
+    t0 = re[226];
+    t2 = im[226];
+    t11 = t9 + t0;
+    t12 = t6 + t2;
+    t7 = C0 * t11;
+    t1 = t5 - t7;
+    t14 = C0 * t12;
+    t8 = t3 - t14;
+    t13 = t9 - t0;
+    t4 = C1 * t13;
+    t10 = t6 - t2;
+    t7 = C1 * t10;
+    t14 = t5 + t11;
+    t9 = t3 + t12;
+    t0 = t1 + t7;
+    t13 = t8 - t4;
+    t6 = t1 - t7;
+    t2 = t8 + t4;
+    t10 = (-C74) * t14;
+    t5 = (-C75) * t9;
+    t11 = t10 + t5;
+    t3 = 0.06571287246697802 * t11;
+    y[665] = t3;
+    t12 = 0.01749077410928325 * t11;
+    y[774] = t12;
+    t1 = C75 * t14;
+    t7 = (-C74) * t9;
+    t8 = t1 + t7;
+    t4 = 0.0010277140855204658 * t8;
+    y[185] = t4;
+    t10 = (-0.0631336144045856) * t8;
+    y[294] = t10;
+    t5 = C76 * t0;
+    t3 = C77 * t13;
+    t11 = t5 + t3;
+    y[134] = 0;
+    t12 = (-0.06532588779890161) * t11;
+    y[345] = t12;
+    t14 = (-C77) * t0;
+    t9 = C76 * t13;
+    t1 = t14 + t9;
+    t7 = 0.06378277903383849 * t1;
+    y[614] = t7;
+    t4 = (-0.004067503560849907) * t1;
+    y[825] = t4;
+    t8 = (-C78) * t6;
+    t10 = (-C79) * t2;
+    t5 = t8 + t10;
+    t3 = 0.06410766352919622 * t5;
+    y[505] = t3;
+    t11 = (-0.0007715436614991194) * t5;
+    y[934] = t11;
+    t12 = C79 * t6;
+    t0 = (-C78) * t2;
+    t13 = t12 + t0;
+    y[25] = 0;
+    t14 = (-0.06499482959270636) * t13;
+    y[454] = t14;
+    t9 = re[189];
+    t7 = im[189];
+    t1 = re[29];
+    t4 = im[29];
+    t8 = re[109];
+    t10 = im[109];
+    t3 = t1 + t8;
+    t5 = t4 + t10;
+    t11 = C0 * t3;
+    t6 = t9 - t11;
+    t2 = C0 * t5;
+    t12 = t7 - t2;
+    t0 = t1 - t8;
+    t13 = C1 * t0;
+    t14 = t4 - t10;
+    t11 = C1 * t14;
+    t2 = t9 + t3;
+    t1 = t7 + t5;
+    t8 = t6 + t11;
+    t0 = t12 - t13;
+    t4 = t6 - t11;
+    t10 = t12 + t13;
+    t14 = (-C80) * t2;
+    t9 = (-C81) * t1;
+    t3 = t14 + t9;
+    t7 = 0.06413419581871597 * t3;
+    y[503] = t7;
+    t5 = (-0.0006582956154213542) * t3;
+    y[936] = t5;
+    t6 = C81 * t2;
+    t11 = (-C80) * t1;
+    t12 = t6 + t11;
+    y[23] = 0;
+    t13 = (-0.0649679412593605) * t12;
+    y[456] = t13;
+    t14 = (-C82) * t8;
+    t9 = (-C83) * t0;
+    t7 = t14 + t9;
+    t3 = 0.0655797703210621 * t7;
+    y[663] = t3;
+    t5 = 0.016178875664066894 * t7;
+    y[776] = t5;
+    t2 = C83 * t8;
+    t1 = (-C82) * t0;
+    t6 = t2 + t1;
+    t11 = 0.0007155716786729976 * t6;
+    y[183] = t11;
+    t12 = (-0.06335931798947163) * t6;
+    y[296] = t12;
+    t13 = C84 * t4;
+    t14 = C85 * t10;
+    t9 = t13 + t14;
+    y[136] = 0;
+    t3 = (-0.0653087503961194) * t9;
+    y[343] = t3;
+    t7 = (-C85) * t4;
+    t5 = C84 * t10;
+    t8 = t7 + t5;
+    t0 = 0.0637995160127003 * t8;
+    y[616] = t0;
+    t2 = (-0.003657164990575806) * t8;
+    y[823] = t2;
+    t1 = re[57];
+    t11 = im[57];
+    t6 = re[137];
+    t12 = im[137];
+    t13 = re[217];
+    t14 = im[217];
+    t9 = t6 + t13;
+    t3 = t12 + t14;
+    t4 = C0 * t9;
+    t10 = t1 - t4;
+    t7 = C0 * t3;
+    t5 = t11 - t7;
+    t0 = t6 - t13;
+    t8 = C1 * t0;
+    t2 = t12 - t14;
+    t4 = C1 * t2;
+    t7 = t1 + t9;
+    t6 = t11 + t3;
+    t13 = t10 + t4;
+    t0 = t5 - t8;
+    t12 = t10 - t4;
+    t14 = t5 + t8;
+    t2 = C86 * t7;
+    t1 = C87 * t6;
+    t9 = t2 + t1;
+    y[138] = 0;
+    t11 = (-0.06528850451382125) * t9;
+    y[341] = t11;
+    t3 = (-C87) * t7;
+    t10 = C86 * t6;
+    t4 = t3 + t10;
+    t5 = 0.06381930016155603 * t4;
+    y[618] = t5;
+    t8 = (-0.0032167884525350523) * t4;
+    y[821] = t8;
+    t2 = (-C88) * t13;
+    t1 = (-C89) * t0;
+    t9 = t2 + t1;
+    t11 = 0.06416253018347054 * t9;
+    y[501] = t11;
+    t7 = (-0.0005555527399948405) * t9;
+    y[938] = t7;
+    t6 = C89 * t13;
+    t3 = (-C88) * t0;
+    t10 = t6 + t3;
+    y[21] = 0;
+    t5 = (-0.06493925122267198) * t10;
+    y[458] = t5;
+    t4 = (-C90) * t12;
+    t8 = (-C91) * t14;
+    t2 = t4 + t8;
+    t1 = 0.06544799289503121 * t2;
+    y[661] = t1;
+    t11 = 0.01490230639662058 * t2;
+    y[778] = t11;
+    t9 = C91 * t12;
+    t7 = (-C90) * t14;
+    t13 = t9 + t7;
+    t0 = 0.000436235085823156 * t13;
+    y[181] = t0;
+    t6 = (-0.06356445131066212) * t13;
+    y[298] = t6;
+    t3 = re[165];
+    t10 = im[165];
+    t5 = re[5];
+    t4 = im[5];
+    t8 = re[85];
+    t1 = im[85];
+    t2 = t5 + t8;
+    t11 = t4 + t1;
+    t12 = C0 * t2;
+    t14 = t3 - t12;
+    t9 = C0 * t11;
+    t7 = t10 - t9;
+    t0 = t5 - t8;
+    t13 = C1 * t0;
+    t6 = t4 - t1;
+    t12 = C1 * t6;
+    t9 = t3 + t2;
+    t5 = t10 + t11;
+    t8 = t14 + t12;
+    t0 = t7 - t13;
+    t4 = t14 - t12;
+    t1 = t7 + t13;
+    t6 = (-C92) * t9;
+    t3 = (-C93) * t5;
+    t2 = t6 + t3;
+    t10 = 0.06533827026114206 * t2;
+    y[659] = t10;
+    t11 = 0.013662384018374446 * t2;
+    y[780] = t11;
+    t14 = C93 * t9;
+    t12 = (-C92) * t5;
+    t7 = t14 + t12;
+    y[179] = 0;
+    t13 = (-0.06377069135766003) * t7;
+    y[300] = t13;
+    t6 = C94 * t8;
+    t3 = C95 * t0;
+    t10 = t6 + t3;
+    y[140] = 0;
+    t2 = (-0.06526501441298868) * t10;
+    y[339] = t2;
+    t11 = (-C95) * t8;
+    t9 = C94 * t0;
+    t5 = t11 + t9;
+    t14 = 0.06384226992275727 * t5;
+    y[620] = t14;
+    t12 = (-0.0027455938395023523) * t5;
+    y[819] = t12;
+    t7 = (-C96) * t4;
+    t13 = (-C97) * t1;
+    t6 = t7 + t13;
+    t3 = 0.0641925571027167 * t6;
+    y[499] = t3;
+    t10 = (-0.0004632014029183742) * t6;
+    y[940] = t10;
+    t2 = C97 * t4;
+    t8 = (-C96) * t1;
+    t0 = t2 + t8;
+    y[19] = 0;
+    t11 = (-0.06490887502735625) * t0;
+    y[460] = t11;
+    t9 = re[33];
+    t14 = im[33];
+    t5 = re[113];
+    t12 = im[113];
+    t7 = re[193];
+    t13 = im[193];
+    t3 = t5 + t7;
+    t6 = t12 + t13;
+    t10 = C0 * t3;
+    t4 = t9 - t10;
+    t1 = C0 * t6;
+    t2 = t14 - t1;
+    t8 = t5 - t7;
+    t0 = C1 * t8;
+    t11 = t12 - t13;
+    t10 = C1 * t11;
+    t1 = t9 + t3;
+    t5 = t14 + t6;
+    t7 = t4 + t10;
+    t8 = t2 - t0;
+    t12 = t4 - t10;
+    t13 = t2 + t0;
+    t11 = (-C98) * t1;
+    t9 = (-C99) * t5;
+    t3 = t11 + t9;
+    t14 = 0.06422421661268282 * t3;
+    y[497] = t14;
+    t6 = (-0.00038106307763214714) * t3;
+    y[942] = t6;
+    t4 = C99 * t1;
+    t10 = (-C98) * t5;
+    t2 = t4 + t10;
+    y[17] = 0;
+    t0 = (-0.06487687801308026) * t2;
+    y[462] = t0;
+    t11 = (-C100) * t7;
+    t9 = (-C101) * t8;
+    t14 = t11 + t9;
+    t3 = 0.0651897066068586 * t14;
+    y[657] = t3;
+    t6 = 0.012460150293088338 * t14;
+    y[782] = t6;
+    t1 = C101 * t7;
+    t5 = (-C100) * t8;
+    t4 = t1 + t5;
+    y[177] = 0;
+    t10 = (-0.06391602115644883) * t4;
+    y[302] = t10;
+    t2 = C102 * t12;
+    t0 = C103 * t13;
+    t11 = t2 + t0;
+    y[142] = 0;
+    t9 = (-0.06523805981020489) * t11;
+    y[337] = t9;
+    t3 = (-C103) * t12;
+    t14 = C102 * t13;
+    t6 = t3 + t14;
+    t7 = 0.06386864782289088 * t6;
+    y[622] = t7;
+    t8 = (-0.002242835474330392) * t6;
+    y[817] = t8;
+    t1 = re[96];
+    t5 = im[96];
+    t4 = re[176];
+    t10 = im[176];
+    t2 = re[16];
+    t0 = im[16];
+    t11 = t4 + t2;
+    t9 = t10 + t0;
+    t12 = C0 * t11;
+    t13 = t1 - t12;
+    t3 = C0 * t9;
+    t14 = t5 - t3;
+    t7 = t4 - t2;
+    t6 = C1 * t7;
+    t8 = t10 - t0;
+    t12 = C1 * t8;
+    t3 = t1 + t11;
+    t4 = t5 + t9;
+    t2 = t13 + t12;
+    t7 = t14 - t6;
+    t10 = t13 - t12;
+    t0 = t14 + t6;
+    t8 = C104 * t3;
+    t1 = C105 * t4;
+    t11 = t8 + t1;
+    y[144] = 0;
+    t5 = (-0.06520746352510629) * t11;
+    y[335] = t5;
+    t9 = (-C105) * t3;
+    t13 = C104 * t4;
+    t12 = t9 + t13;
+    t14 = 0.0638986159162963 * t12;
+    y[624] = t14;
+    t6 = (-0.0017076145448912225) * t12;
+    y[815] = t6;
+    t8 = (-C106) * t2;
+    t1 = (-C107) * t7;
+    t11 = t8 + t1;
+    t5 = 0.06425739375479943 * t11;
+    y[495] = t5;
+    t3 = (-0.0003087071048978949) * t11;
+    y[944] = t3;
+    t4 = C107 * t2;
+    t9 = (-C106) * t7;
+    t13 = t4 + t9;
+    y[15] = 0;
+    t14 = (-0.06484338102112107) * t13;
+    y[464] = t14;
+    t12 = (-C108) * t10;
+    t6 = (-C109) * t0;
+    t8 = t12 + t6;
+    t1 = 0.06505152284234923 * t8;
+    y[655] = t1;
+    t5 = 0.01129663648549895 * t8;
+    y[784] = t5;
+    t11 = C109 * t10;
+    t3 = (-C108) * t0;
+    t2 = t11 + t3;
+    y[175] = 0;
+    t7 = (-0.06405179286524129) * t2;
+    y[304] = t7;
+    t4 = re[204];
+    t9 = im[204];
+    t13 = re[44];
+    t14 = im[44];
+    t12 = re[124];
+    t6 = im[124];
+    t1 = t13 + t12;
+    t8 = t14 + t6;
+    t5 = C0 * t1;
+    t10 = t4 - t5;
+    t0 = C0 * t8;
+    t11 = t9 - t0;
+    t3 = t13 - t12;
+    t2 = C1 * t3;
+    t7 = t14 - t6;
+    t5 = C1 * t7;
+    t0 = t4 + t1;
+    t13 = t9 + t8;
+    t12 = t10 + t5;
+    t3 = t11 - t2;
+    t14 = t10 - t5;
+    t6 = t11 + t2;
+    t7 = (-C110) * t0;
+    t4 = (-C111) * t13;
+    t1 = t7 + t4;
+    t9 = 0.06492324901137009 * t1;
+    y[653] = t9;
+    t8 = 0.01017252894936793 * t1;
+    y[786] = t8;
+    t10 = C111 * t0;
+    t5 = (-C110) * t13;
+    t11 = t10 + t5;
+    y[173] = 0;
+    t2 = (-0.06417834489362895) * t11;
+    y[306] = t2;
+    t7 = C112 * t12;
+    t4 = C113 * t3;
+    t9 = t7 + t4;
+    y[146] = 0;
+    t1 = (-0.06517299262362998) * t9;
+    y[333] = t1;
+    t8 = (-C113) * t12;
+    t0 = C112 * t3;
+    t13 = t8 + t0;
+    t10 = 0.06393241278222266 * t13;
+    y[626] = t10;
+    t5 = (-0.0011391351213317518) * t13;
+    y[813] = t5;
+    t11 = (-C114) * t14;
+    t2 = (-C115) * t6;
+    t7 = t11 + t2;
+    t4 = 0.0642919664626169 * t7;
+    y[493] = t4;
+    t9 = (-0.0002456946508096601) * t7;
+    y[946] = t9;
+    t1 = C115 * t14;
+    t12 = (-C114) * t6;
+    t3 = t1 + t12;
+    y[13] = 0;
+    t8 = (-0.06480851179267332) * t3;
+    y[466] = t8;
+    t0 = re[72];
+    t10 = im[72];
+    t13 = re[152];
+    t5 = im[152];
+    t11 = re[232];
+    t2 = im[232];
+    t4 = t13 + t11;
+    t7 = t5 + t2;
+    t9 = C0 * t4;
+    t14 = t0 - t9;
+    t6 = C0 * t7;
+    t1 = t10 - t6;
+    t12 = t13 - t11;
+    t3 = C1 * t12;
+    t8 = t5 - t2;
+    t9 = C1 * t8;
+    t6 = t0 + t4;
+    t13 = t10 + t7;
+    t11 = t14 + t9;
+    t12 = t1 - t3;
+    t5 = t14 - t9;
+    t2 = t1 + t3;
+    t8 = (-C116) * t6;
+    t0 = (-C117) * t13;
+    t4 = t8 + t0;
+    t10 = 0.06432778749320836 * t4;
+    y[491] = t10;
+    t7 = (-0.00019155824848469372) * t4;
+    y[948] = t7;
+    t14 = C117 * t6;
+    t9 = (-C116) * t13;
+    t1 = t14 + t9;
+    y[11] = 0;
+    t3 = (-0.06477242306999255) * t1;
+    y[468] = t3;
+    t8 = (-C118) * t11;
+    t0 = (-C119) * t12;
+    t10 = t8 + t0;
+    t4 = 0.06480444102585917 * t10;
+    y[651] = t4;
+    t7 = 0.009088201941194599 * t10;
+    y[788] = t7;
+    t6 = C119 * t11;
+    t13 = (-C118) * t12;
+    t14 = t6 + t13;
+    y[171] = 0;
+    t9 = (-0.06429600503774152) * t14;
+    y[308] = t9;
+    t1 = C120 * t5;
+    t3 = C121 * t2;
+    t8 = t1 + t3;
+    y[148] = 0;
+    t0 = (-0.06513442995190928) * t8;
+    y[331] = t0;
+    t4 = (-C121) * t5;
+    t10 = C120 * t2;
+    t7 = t4 + t10;
+    t11 = 0.06397026380276978 * t7;
+    y[628] = t11;
+    t12 = (-0.0005364356720218564) * t7;
+    y[811] = t12;
+    t6 = re[180];
+    t13 = im[180];
+    t14 = re[20];
+    t9 = im[20];
+    t1 = re[100];
+    t3 = im[100];
+    t8 = t14 + t1;
+    t0 = t9 + t3;
+    t5 = C0 * t8;
+    t2 = t6 - t5;
+    t4 = C0 * t0;
+    t10 = t13 - t4;
+    t11 = t14 - t1;
+    t7 = C1 * t11;
+    t12 = t9 - t3;
+    t5 = C1 * t12;
+    t4 = t6 + t8;
+    t14 = t13 + t0;
+    t1 = t2 + t5;
+    t11 = t10 - t7;
+    t9 = t2 - t5;
+    t3 = t10 + t7;
+    t12 = C122 * t4;
+    t6 = C123 * t14;
+    t8 = t12 + t6;
+    y[150] = 0;
+    t13 = (-0.06509149341879758) * t8;
+    y[329] = t13;
+    t0 = (-C123) * t4;
+    t2 = C122 * t14;
+    t5 = t0 + t2;
+    t10 = 0.06401246073520547 * t5;
+    y[630] = t10;
+    t7 = 0.00010136342815123706 * t5;
+    y[809] = t7;
+    t12 = (-C124) * t1;
+    t6 = (-C125) * t11;
+    t8 = t12 + t6;
+    t13 = 0.06436471177753121 * t8;
+    y[489] = t13;
+    t4 = (-0.00014569399935573593) * t8;
+    y[950] = t4;
+    t14 = C125 * t1;
+    t0 = (-C124) * t11;
+    t2 = t14 + t0;
+    y[9] = 0;
+    t10 = (-0.06473526489279159) * t2;
+    y[470] = t10;
+    t5 = (-C126) * t9;
+    t7 = (-C127) * t3;
+    t12 = t5 + t7;
+    t6 = 0.06469463715336674 * t12;
+    y[649] = t6;
+    t13 = 0.00804400171606616 * t12;
+    y[790] = t13;
+    t8 = C127 * t9;
+    t4 = (-C126) * t3;
+    t1 = t8 + t4;
+    y[169] = 0;
+    t11 = (-0.06440513232633274) * t1;
+    y[310] = t11;
+    t14 = re[63];
+    t0 = im[63];
+    t2 = re[143];
+    t10 = im[143];
+    t5 = re[223];
+    t7 = im[223];
+    t6 = t2 + t5;
+    t12 = t10 + t7;
+    t13 = C0 * t6;
+    t9 = t14 - t13;
+    t3 = C0 * t12;
+    t8 = t0 - t3;
+    t4 = t2 - t5;
+    t1 = C1 * t4;
+    t11 = t10 - t7;
+    t13 = C1 * t11;
+    t3 = t14 + t6;
+    t2 = t0 + t12;
+    t5 = t9 + t13;
+    t4 = t8 - t1;
+    t10 = t9 - t13;
+    t7 = t8 + t1;
+    t11 = (-C128) * t3;
+    t14 = (-C129) * t2;
+    t6 = t11 + t14;
+    t0 = 0.06459337021269107 * t6;
+    y[647] = t0;
+    t12 = 0.007040125278386572 * t6;
+    y[792] = t12;
+    t9 = C129 * t3;
+    t13 = (-C128) * t2;
+    t8 = t9 + t13;
+    y[167] = 0;
+    t1 = (-0.0645061041550672) * t8;
+    y[312] = t1;
+    t11 = C130 * t5;
+    t14 = C131 * t4;
+    t0 = t11 + t14;
+    y[152] = 0;
+    t6 = (-0.06504395779307387) * t0;
+    y[327] = t6;
+    t12 = (-C131) * t5;
+    t3 = C130 * t4;
+    t2 = t12 + t3;
+    t9 = 0.06405924251906994 * t2;
+    y[632] = t9;
+    t13 = 0.0007749045844854548 * t2;
+    y[807] = t13;
+    t8 = (-C132) * t10;
+    t1 = (-C133) * t7;
+    t11 = t8 + t1;
+    t14 = 0.06440257081976378 * t11;
+    y[487] = t14;
+    t0 = (-0.00010744127641315864) * t11;
+    y[952] = t0;
+    t6 = C133 * t10;
+    t5 = (-C132) * t7;
+    t4 = t6 + t5;
+    y[7] = 0;
+    t12 = (-0.06469721027639481) * t4;
+    y[472] = t12;
+    t3 = re[171];
+    t9 = im[171];
+    t2 = re[11];
+    t13 = im[11];
+    t8 = re[91];
+    t1 = im[91];
+    t14 = t2 + t8;
+    t11 = t13 + t1;
+    t0 = C0 * t14;
+    t10 = t3 - t0;
+    t7 = C0 * t11;
+    t6 = t9 - t7;
+    t5 = t2 - t8;
+    t4 = C1 * t5;
+    t12 = t13 - t1;
+    t0 = C1 * t12;
+    t7 = t3 + t14;
+    t2 = t9 + t11;
+    t8 = t10 + t0;
+    t5 = t6 - t4;
+    t13 = t10 - t0;
+    t1 = t6 + t4;
+    t12 = (-C134) * t7;
+    t3 = (-C135) * t2;
+    t14 = t12 + t3;
+    t9 = 0.06444118770571218 * t14;
+    y[485] = t9;
+    t11 = (-7.618525494244105e-05) * t14;
+    y[954] = t11;
+    t10 = C135 * t7;
+    t0 = (-C134) * t2;
+    t6 = t10 + t0;
+    y[5] = 0;
+    t4 = (-0.06465843996691767) * t6;
+    y[474] = t4;
+    t12 = (-C136) * t8;
+    t3 = (-C137) * t5;
+    t9 = t12 + t3;
+    t14 = 0.06450015372569924 * t9;
+    y[645] = t14;
+    t11 = 0.00607659065620141 * t9;
+    y[794] = t11;
+    t7 = C137 * t8;
+    t2 = (-C136) * t5;
+    t10 = t7 + t2;
+    y[165] = 0;
+    t0 = (-0.06459932924169938) * t10;
+    y[314] = t0;
+    t6 = C138 * t13;
+    t4 = C139 * t1;
+    t12 = t6 + t4;
+    y[154] = 0;
+    t3 = (-0.06499145894164488) * t12;
+    y[325] = t3;
+    t14 = (-C139) * t13;
+    t9 = C138 * t1;
+    t11 = t14 + t9;
+    t8 = 0.06411098834398946 * t11;
+    y[634] = t8;
+    t5 = 0.0014850580646897857 * t11;
+    y[805] = t5;
+    t7 = re[39];
+    t2 = im[39];
+    t10 = re[119];
+    t0 = im[119];
+    t6 = re[199];
+    t4 = im[199];
+    t12 = t10 + t6;
+    t3 = t0 + t4;
+    t13 = C0 * t12;
+    t1 = t7 - t13;
+    t14 = C0 * t3;
+    t9 = t2 - t14;
+    t8 = t10 - t6;
+    t11 = C1 * t8;
+    t5 = t0 - t4;
+    t13 = C1 * t5;
+    t14 = t7 + t12;
+    t10 = t2 + t3;
+    t6 = t1 + t13;
+    t8 = t9 - t11;
+    t0 = t1 - t13;
+    t4 = t9 + t11;
+    t5 = C140 * t14;
+    t7 = C141 * t10;
+    t12 = t5 + t7;
+    y[156] = 0;
+    t2 = (-0.06493373810629584) * t12;
+    y[323] = t2;
+    t3 = (-C141) * t14;
+    t1 = C140 * t10;
+    t13 = t3 + t1;
+    t9 = 0.06416797782141968 * t13;
+    y[636] = t9;
+    t11 = 0.002232707993710948 * t13;
+    y[803] = t11;
+    t5 = (-C142) * t6;
+    t7 = (-C143) * t8;
+    t12 = t5 + t7;
+    t2 = 0.06448036651285986 * t12;
+    y[483] = t2;
+    t14 = (-5.118263960998581e-05) * t12;
+    y[956] = t14;
+    t10 = C143 * t6;
+    t3 = (-C142) * t8;
+    t1 = t10 + t3;
+    y[3] = 0;
+    t9 = (-0.0646191529608578) * t1;
+    y[476] = t9;
+    t13 = (-C144) * t0;
+    t11 = (-C145) * t4;
+    t5 = t13 + t11;
+    t7 = 0.0644145257260093 * t5;
+    y[643] = t7;
+    t2 = 0.005153232970672424 * t5;
+    y[796] = t2;
+    t12 = C145 * t0;
+    t14 = (-C144) * t4;
+    t6 = t12 + t14;
+    y[163] = 0;
+    t8 = (-0.06468520290578261) * t6;
+    y[316] = t8;
+    t10 = re[147];
+    t3 = im[147];
+    t1 = re[227];
+    t9 = im[227];
+    t13 = re[67];
+    t11 = im[67];
+    t7 = t1 + t13;
+    t5 = t9 + t11;
+    t2 = C0 * t7;
+    t0 = t10 - t2;
+    t4 = C0 * t5;
+    t12 = t3 - t4;
+    t14 = t1 - t13;
+    t6 = C1 * t14;
+    t8 = t9 - t11;
+    t2 = C1 * t8;
+    t4 = t10 + t7;
+    t1 = t3 + t5;
+    t13 = t0 + t2;
+    t14 = t12 - t6;
+    t9 = t0 - t2;
+    t11 = t12 + t6;
+    t8 = (-C146) * t4;
+    t10 = (-C147) * t1;
+    t7 = t8 + t10;
+    t3 = 0.06433600442796719 * t7;
+    y[641] = t3;
+    t5 = 0.004269736803378256 * t7;
+    y[798] = t5;
+    t0 = C147 * t4;
+    t2 = (-C146) * t1;
+    t12 = t0 + t2;
+    y[161] = 0;
+    t6 = (-0.06476415039624987) * t12;
+    y[318] = t6;
+    t8 = C148 * t13;
+    t10 = C149 * t14;
+    t3 = t8 + t10;
+    y[158] = 0;
+    t7 = (-0.06487040458155936) * t3;
+    y[321] = t7;
+    t5 = (-C149) * t13;
+    t4 = C148 * t14;
+    t1 = t5 + t4;
+    t0 = 0.06423062556096837 * t1;
+    y[638] = t0;
+    t2 = 0.003018411452977106 * t1;
+    y[801] = t2;
+    t12 = (-C150) * t9;
+    t6 = (-C151) * t11;
+    t8 = t12 + t6;
+    t10 = 0.0645199171333313 * t8;
+    y[481] = t10;
+    t3 = (-2.9821318216822157e-05) * t8;
+    y[958] = t3;
+    t7 = C151 * t9;
+    t13 = (-C150) * t11;
+    t14 = t7 + t13;
+    y[1] = 0;
+    t5 = (-0.0645795415089606) * t14;
+    y[478] = t5;
+    t4 = re[30];
+    t0 = im[30];
+    t1 = re[110];
+    t2 = im[110];
+    t12 = re[190];
+    t6 = im[190];
+    t10 = t1 + t12;
+    t8 = t2 + t6;
+    t3 = C0 * t10;
+    t9 = t4 - t3;
+    t11 = C0 * t8;
+    t7 = t0 - t11;
+    t13 = t1 - t12;
+    t14 = C1 * t13;
+    t5 = t2 - t6;
+    t3 = C1 * t5;
+    t11 = t4 + t10;
+    t1 = t0 + t8;
+    t12 = t9 + t3;
+    t13 = t7 - t14;
+    t2 = t9 - t3;
+    t6 = t7 + t14;
+    t5 = C152 * t11;
+    t4 = C153 * t1;
+    t10 = t5 + t4;
+    y[0] = 0;
+    t0 = (-0.06455965713043095) * t10;
+    y[479] = t0;
+    t8 = (-C153) * t11;
+    t9 = C152 * t1;
+    t3 = t8 + t9;
+    t7 = 0.06453978927193926 * t3;
+    y[480] = t7;
+    t14 = (-1.5188757220070019e-05) * t3;
+    y[959] = t14;
+    t5 = (-C154) * t12;
+    t4 = (-C155) * t13;
+    t10 = t5 + t4;
+    t0 = 0.06426416257419922 * t10;
+    y[639] = t0;
+    t11 = 0.0034257402094298017 * t10;
+    y[800] = t11;
+    t1 = C155 * t12;
+    t8 = (-C154) * t13;
+    t9 = t1 + t8;
+    y[159] = 0;
+    t7 = (-0.06483655119376752) * t9;
+    y[320] = t7;
+    t3 = C156 * t2;
+    t14 = C157 * t6;
+    t5 = t3 + t14;
+    y[160] = 0;
+    t4 = (-0.06480112891438235) * t5;
+    y[319] = t4;
+    t0 = (-C157) * t2;
+    t10 = C156 * t6;
+    t11 = t0 + t10;
+    t12 = 0.06429929133135662 * t11;
+    y[640] = t12;
+    t13 = 0.0038427993091844884 * t11;
+    y[799] = t13;
+    t1 = re[138];
+    t8 = im[138];
+    t9 = re[218];
+    t7 = im[218];
+    t3 = re[58];
+    t14 = im[58];
+    t5 = t9 + t3;
+    t4 = t7 + t14;
+    t2 = C0 * t5;
+    t6 = t1 - t2;
+    t0 = C0 * t4;
+    t10 = t8 - t0;
+    t12 = t9 - t3;
+    t11 = C1 * t12;
+    t13 = t7 - t14;
+    t2 = C1 * t13;
+    t0 = t1 + t5;
+    t9 = t8 + t4;
+    t3 = t6 + t2;
+    t12 = t10 - t11;
+    t7 = t6 - t2;
+    t14 = t10 + t11;
+    t13 = C158 * t0;
+    t1 = C159 * t9;
+    t5 = t13 + t1;
+    y[162] = 0;
+    t8 = (-0.06472549954869128) * t5;
+    y[317] = t8;
+    t4 = (-C159) * t0;
+    t6 = C158 * t9;
+    t2 = t4 + t6;
+    t10 = 0.06437442268842114 * t2;
+    y[642] = t10;
+    t11 = 0.0047065095125265214 * t2;
+    y[797] = t11;
+    t13 = C160 * t3;
+    t1 = C161 * t12;
+    t5 = t13 + t1;
+    y[2] = 0;
+    t8 = (-0.06459935208992905) * t5;
+    y[477] = t8;
+    t0 = (-C161) * t3;
+    t9 = C160 * t12;
+    t4 = t0 + t9;
+    t6 = 0.06450013091255516 * t4;
+    y[482] = t6;
+    t10 = (-4.042704922643029e-05) * t4;
+    y[957] = t10;
+    t2 = (-C162) * t7;
+    t11 = (-C163) * t14;
+    t13 = t2 + t11;
+    t1 = 0.06419855597372343 * t13;
+    y[637] = t1;
+    t5 = 0.0026207874522626764 * t13;
+    y[802] = t5;
+    t8 = C163 * t7;
+    t3 = (-C162) * t14;
+    t12 = t8 + t3;
+    y[157] = 0;
+    t0 = (-0.06490280978238966) * t12;
+    y[322] = t0;
+    t9 = re[6];
+    t6 = im[6];
+    t4 = re[86];
+    t10 = im[86];
+    t2 = re[166];
+    t11 = im[166];
+    t1 = t4 + t2;
+    t13 = t10 + t11;
+    t5 = C0 * t1;
+    t7 = t9 - t5;
+    t14 = C0 * t13;
+    t8 = t6 - t14;
+    t3 = t4 - t2;
+    t12 = C1 * t3;
+    t0 = t10 - t11;
+    t5 = C1 * t0;
+    t14 = t9 + t1;
+    t4 = t6 + t13;
+    t2 = t7 + t5;
+    t3 = t8 - t12;
+    t10 = t7 - t5;
+    t11 = t8 + t12;
+    t0 = (-C164) * t14;
+    t9 = (-C165) * t4;
+    t1 = t0 + t9;
+    t6 = 0.06413878463163647 * t1;
+    y[635] = t6;
+    t13 = 0.0018541787857695319 * t1;
+    y[804] = t13;
+    t7 = C165 * t14;
+    t5 = (-C164) * t4;
+    t8 = t7 + t5;
+    y[155] = 0;
+    t12 = (-0.06496329312438288) * t8;
+    y[324] = t12;
+    t0 = C166 * t2;
+    t9 = C167 * t3;
+    t6 = t0 + t9;
+    y[164] = 0;
+    t1 = (-0.06464314388636223) * t6;
+    y[315] = t1;
+    t13 = (-C167) * t2;
+    t14 = C166 * t3;
+    t4 = t13 + t14;
+    t7 = 0.06445643599870936 * t4;
+    y[644] = t7;
+    t5 = 0.0056098920624594786 * t4;
+    y[795] = t5;
+    t8 = C168 * t10;
+    t12 = C169 * t11;
+    t0 = t8 + t12;
+    y[4] = 0;
+    t9 = (-0.06463883663466444) * t0;
+    y[475] = t9;
+    t6 = (-C169) * t10;
+    t1 = C168 * t11;
+    t2 = t6 + t1;
+    t3 = 0.06446073109601995 * t2;
+    y[484] = t3;
+    t13 = (-6.291769062519899e-05) * t2;
+    y[955] = t13;
+    t14 = re[114];
+    t7 = im[114];
+    t4 = re[194];
+    t5 = im[194];
+    t8 = re[34];
+    t12 = im[34];
+    t0 = t4 + t8;
+    t9 = t5 + t12;
+    t10 = C0 * t0;
+    t11 = t14 - t10;
+    t6 = C0 * t9;
+    t1 = t7 - t6;
+    t3 = t4 - t8;
+    t2 = C1 * t3;
+    t13 = t5 - t12;
+    t10 = C1 * t13;
+    t6 = t14 + t0;
+    t4 = t7 + t9;
+    t8 = t11 + t10;
+    t3 = t1 - t2;
+    t5 = t11 - t10;
+    t12 = t1 + t2;
+    t13 = C170 * t6;
+    t14 = C171 * t4;
+    t0 = t13 + t14;
+    y[6] = 0;
+    t7 = (-0.06467788109512218) * t0;
+    y[473] = t7;
+    t9 = (-C171) * t6;
+    t11 = C170 * t4;
+    t10 = t9 + t11;
+    t1 = 0.06442181772372418 * t10;
+    y[486] = t1;
+    t2 = (-9.096405236126472e-05) * t10;
+    y[953] = t2;
+    t13 = (-C172) * t8;
+    t14 = (-C173) * t3;
+    t0 = t13 + t14;
+    t7 = 0.06408446011643425 * t0;
+    y[633] = t7;
+    t6 = 0.0011253587763649148 * t0;
+    y[806] = t6;
+    t4 = C173 * t8;
+    t9 = (-C172) * t3;
+    t11 = t4 + t9;
+    y[153] = 0;
+    t1 = (-0.06501836262794915) * t11;
+    y[326] = t1;
+    t10 = C174 * t5;
+    t2 = C175 * t12;
+    t13 = t10 + t2;
+    y[166] = 0;
+    t14 = (-0.0645536397502237) * t13;
+    y[313] = t14;
+    t7 = (-C175) * t5;
+    t0 = C174 * t12;
+    t6 = t7 + t0;
+    t8 = 0.06454580536107146 * t6;
+    y[646] = t8;
+    t3 = 0.006553301740878292 * t6;
+    y[793] = t3;
+    t4 = re[237];
+    t9 = im[237];
+    t11 = re[77];
+    t1 = im[77];
+    t10 = re[157];
+    t2 = im[157];
+    t13 = t11 + t10;
+    t14 = t1 + t2;
+    t5 = C0 * t13;
+    t12 = t4 - t5;
+    t7 = C0 * t14;
+    t0 = t9 - t7;
+    t8 = t11 - t10;
+    t6 = C1 * t8;
+    t3 = t1 - t2;
+    t5 = C1 * t3;
+    t7 = t4 + t13;
+    t11 = t9 + t14;
+    t10 = t12 + t5;
+    t8 = t0 - t6;
+    t1 = t12 - t5;
+    t2 = t0 + t6;
+    t3 = C176 * t7;
+    t4 = C177 * t11;
+    t13 = t3 + t4;
+    y[168] = 0;
+    t9 = (-0.06445659980160325) * t13;
+    y[311] = t9;
+    t14 = (-C177) * t7;
+    t12 = C176 * t11;
+    t5 = t14 + t12;
+    t0 = 0.06464297960940578 * t5;
+    y[648] = t0;
+    t6 = 0.007536996945517365 * t5;
+    y[791] = t6;
+    t3 = C178 * t10;
+    t4 = C179 * t8;
+    t13 = t3 + t4;
+    y[8] = 0;
+    t9 = (-0.06471632366710349) * t13;
+    y[471] = t9;
+    t7 = (-C179) * t10;
+    t11 = C178 * t8;
+    t14 = t7 + t11;
+    t12 = 0.06438355009316855 * t14;
+    y[488] = t12;
+    t0 = (-0.00012565194800517364) * t14;
+    y[951] = t0;
+    t5 = (-C180) * t1;
+    t6 = (-C181) * t2;
+    t3 = t5 + t6;
+    t4 = 0.06403524354835045 * t3;
+    y[631] = t4;
+    t13 = 0.0004336255177722955 * t3;
+    y[808] = t13;
+    t9 = C181 * t1;
+    t10 = (-C180) * t2;
+    t8 = t9 + t10;
+    y[151] = 0;
+    t7 = (-0.0650683348072313) * t8;
+    y[328] = t7;
+    t11 = re[105];
+    t12 = im[105];
+    t14 = re[185];
+    t0 = im[185];
+    t5 = re[25];
+    t6 = im[25];
+    t4 = t14 + t5;
+    t3 = t0 + t6;
+    t13 = C0 * t4;
+    t1 = t11 - t13;
+    t2 = C0 * t3;
+    t9 = t12 - t2;
+    t10 = t14 - t5;
+    t8 = C1 * t10;
+    t7 = t0 - t6;
+    t13 = C1 * t7;
+    t2 = t11 + t4;
+    t14 = t12 + t3;
+    t5 = t1 + t13;
+    t10 = t9 - t8;
+    t0 = t1 - t13;
+    t6 = t9 + t8;
+    t7 = (-C182) * t2;
+    t11 = (-C183) * t14;
+    t4 = t7 + t11;
+    t12 = 0.06399077843587136 * t4;
+    y[629] = t12;
+    t3 = (-0.00022193928773926063) * t4;
+    y[810] = t3;
+    t1 = C183 * t2;
+    t13 = (-C182) * t14;
+    t9 = t1 + t13;
+    y[149] = 0;
+    t8 = (-0.06511354867861638) * t9;
+    y[330] = t8;
+    t7 = C184 * t5;
+    t11 = C185 * t10;
+    t12 = t7 + t11;
+    y[170] = 0;
+    t4 = (-0.0643515937571604) * t12;
+    y[309] = t4;
+    t3 = (-C185) * t5;
+    t2 = C184 * t10;
+    t14 = t3 + t2;
+    t1 = 0.06474846112421331 * t14;
+    y[650] = t1;
+    t13 = 0.008561055072937852 * t14;
+    y[789] = t13;
+    t9 = C186 * t0;
+    t8 = C187 * t6;
+    t7 = t9 + t8;
+    y[10] = 0;
+    t11 = (-0.06475394777693201) * t7;
+    y[469] = t11;
+    t12 = (-C187) * t0;
+    t4 = C186 * t6;
+    t5 = t12 + t4;
+    t10 = 0.06434614119621296 * t5;
+    y[490] = t10;
+    t3 = (-0.00016764253061409248) * t5;
+    y[949] = t3;
+    t2 = re[213];
+    t1 = im[213];
+    t14 = re[53];
+    t13 = im[53];
+    t9 = re[133];
+    t8 = im[133];
+    t7 = t14 + t9;
+    t11 = t13 + t8;
+    t0 = C0 * t7;
+    t6 = t2 - t0;
+    t12 = C0 * t11;
+    t4 = t1 - t12;
+    t10 = t14 - t9;
+    t5 = C1 * t10;
+    t3 = t13 - t8;
+    t0 = C1 * t3;
+    t12 = t2 + t7;
+    t14 = t1 + t11;
+    t9 = t6 + t0;
+    t10 = t4 - t5;
+    t13 = t6 - t0;
+    t8 = t4 + t5;
+    t3 = C188 * t12;
+    t2 = C189 * t14;
+    t7 = t3 + t2;
+    y[12] = 0;
+    t1 = (-0.06479059426312715) * t7;
+    y[467] = t1;
+    t11 = (-C189) * t12;
+    t6 = C188 * t14;
+    t0 = t11 + t6;
+    t4 = 0.06430974609902519 * t0;
+    y[492] = t4;
+    t5 = (-0.0002175619268598817) * t0;
+    y[947] = t5;
+    t3 = (-C190) * t9;
+    t2 = (-C191) * t10;
+    t7 = t3 + t2;
+    t1 = 0.06395080704108534 * t7;
+    y[627] = t1;
+    t12 = (-0.0008421036493568433) * t7;
+    y[812] = t12;
+    t14 = C191 * t9;
+    t11 = (-C190) * t10;
+    t6 = t14 + t11;
+    y[147] = 0;
+    t4 = (-0.06515424682584199) * t6;
+    y[332] = t4;
+    t0 = C192 * t13;
+    t5 = C193 * t8;
+    t3 = t0 + t5;
+    y[172] = 0;
+    t2 = (-0.0642382469821764) * t3;
+    y[307] = t2;
+    t1 = (-C193) * t13;
+    t7 = C192 * t8;
+    t12 = t1 + t7;
+    t9 = 0.06486270815924904 * t12;
+    y[652] = t9;
+    t10 = 0.009625348123172246 * t12;
+    y[787] = t10;
+}
+
+/**
+ *  Part 8 of ApplyWindowedIMDCT_W10_480().
+ * 
+ *  @param {Number[]} X 
+ *    - The input block (480 points).
+ *  @param {Number[]} y 
+ *    - The array that would contain the output block (960 points).
+ *  @param {Number[]} re 
+ *    - The scratch buffer (real part, 240 points).
+ *  @param {Number[]} im 
+ *    - The scratch buffer (imaginary part, 240 points).
+ */
+function ApplyWindowedIMDCT_W10_480_Part8(X, y, re, im) {
+    let t0, t1, t10, t11, t12, t13, t14, t2, t3, t4, t5, t6, t7, t8, t9;
+    const C0 = 0.5;
+    const C1 = 0.8660254037844386;
+    const C2 = 0.21271063745720314;
+    const C3 = 0.9771152361479941;
+    const C4 = 0.6727704337671168;
+    const C5 = 0.7398512982003922;
+    const C6 = 0.9525619356575953;
+    const C7 = 0.3043448023808773;
+    const C8 = 0.9505496155138509;
+    const C9 = 0.310572742600619;
+    const C10 = 0.20631092294178383;
+    const C11 = 0.978486485892835;
+    const C12 = 0.6679137432922161;
+    const C13 = 0.744238692572067;
+    const C14 = 0.6630284416155423;
+    const C15 = 0.7485942062351708;
+    const C16 = 0.9484965769882525;
+    const C17 = 0.31678737891773395;
+    const C18 = 0.1999023707530817;
+    const C19 = 0.9798158205332763;
+    const C20 = 0.19348525541214334;
+    const C21 = 0.9811031831250461;
+    const C22 = 0.6581147380071596;
+    const C23 = 0.7529176526139945;
+    const C24 = 0.9464029080261377;
+    const C25 = 0.3229884451178864;
+    const C26 = 0.9442686983133165;
+    const C27 = 0.3291756755680389;
+    const C28 = 0.187059851806832;
+    const C29 = 0.9823485185218157;
+    const C30 = 0.6531728429537768;
+    const C31 = 0.7572088465064846;
+    const C32 = 0.6482029681497297;
+    const C33 = 0.7614676040921771;
+    const C34 = 0.9420940392722298;
+    const C35 = 0.33534880522783184;
+    const C36 = 0.18062643518005275;
+    const C37 = 0.9835517733775615;
+    const C38 = 0.1741852811179619;
+    const C39 = 0.9847128961488504;
+    const C40 = 0.6432053264879141;
+    const C41 = 0.7656937429400713;
+    const C42 = 0.9398790240580331;
+    const C43 = 0.34150756966093626;
+    const C44 = 0.937623747554606;
+    const C45 = 0.34765170504638193;
+    const C46 = 0.1677366655381615;
+    const C47 = 0.9858318370970471;
+    const C48 = 0.6381801320506653;
+    const C49 = 0.7698870820164444;
+    const C50 = 0.6331276001005878;
+    const C51 = 0.7740474416926073;
+    const C52 = 0.9353283063704877;
+    const C53 = 0.35378094818985806;
+    const C54 = 0.16128086467788047;
+    const C55 = 0.9869085482904458;
+    const C56 = 0.15481815508214103;
+    const C57 = 0.9879429836063224;
+    const C58 = 0.6280479470713343;
+    const C59 = 0.7781746437525978;
+    const C60 = 0.932992798834739;
+    const C61 = 0.3598950365349881;
+    const C62 = 0.9306173249927291;
+    const C63 = 0.36599370817457677;
+    const C64 = 0.14834881359191268;
+    const C65 = 0.9889350987329107;
+    const C66 = 0.6229413905583339;
+    const C67 = 0.7822685114008164;
+    const C68 = 0.6178081493094721;
+    const C69 = 0.7863288692695983;
+    const C70 = 0.9282019866018515;
+    const C71 = 0.3720767018618288;
+    const C72 = 0.14187311733225325;
+    const C73 = 0.989884851171301;
+    const C74 = 0.1353913437004377;
+    const C75 = 0.9907922002372597;
+    const C76 = 0.6126484432157191;
+    const C77 = 0.7903555434267263;
+    const C78 = 0.925746887127164;
+    const C79 = 0.3781437570215405;
+    const C80 = 0.9232521317369569;
+    const C81 = 0.38419461376126157;
+    const C82 = 0.1289037703540754;
+    const C83 = 0.9916571070629725;
+    const C84 = 0.607462493301711;
+    const C85 = 0.7943483613828815;
+    const C86 = 0.6022505217162819;
+    const C87 = 0.7983071520990315;
+    const C88 = 0.9207178272982477;
+    const C89 = 0.390229012882428;
+    const C90 = 0.1224106751992162;
+    const C91 = 0.99247953459871;
+    const C92 = 0.11591233637844581;
+    const C93 = 0.9932594476144136;
+    const C94 = 0.597012751722948;
+    const C95 = 0.8022317459937581;
+    const C96 = 0.9181440823722039;
+    const C97 = 0.3962466958914656;
+    const C98 = 0.9155310072094921;
+    const C99 = 0.40224740501086254;
+    const C100 = 0.10940903225897118;
+    const C101 = 0.9939968127012055;
+    const C102 = 0.5917494076903429;
+    const C103 = 0.806121974950521;
+    const C104 = 0.5864607150826073;
+    const C105 = 0.8099776723248592;
+    const C106 = 0.9128787137455552;
+    const C107 = 0.40823088319021217;
+    const C108 = 0.1029010414206961;
+    const C109 = 0.9946915982728195;
+    const C110 = 0.09638864264428781;
+    const C111 = 0.9953437745669542;
+    const C112 = 0.5811469004497304;
+    const C113 = 0.81379867295153;
+    const C114 = 0.9101873155958178;
+    const C115 = 0.4141968741172237;
+    const C116 = 0.9074569280508187;
+    const C117 = 0.42014512222870243;
+    const C118 = 0.08987211489923495;
+    const C119 = 0.9959533136465477;
+    const C120 = 0.5758081914178453;
+    const C121 = 0.8175848131515837;
+    const C122 = 0.5704448166794782;
+    const C123 = 0.8213359307393756;
+    const C124 = 0.9046876680712731;
+    const C125 = 0.4260753727214963;
+    const C126 = 0.08335173733189745;
+    const C127 = 0.9965201894009746;
+    const C128 = 0.07682778925354876;
+    const C129 = 0.9970443775471642;
+    const C130 = 0.5650570059837524;
+    const C131 = 0.8250518650295129;
+    const C132 = 0.9018796542830616;
+    const C133 = 0.43198737156341177;
+    const C134 = 0.8990330069721493;
+    const C135 = 0.43788086550409505;
+    const C136 = 0.07030055012841117;
+    const C137 = 0.9975258556306411;
+    const C138 = 0.559644990126546;
+    const C139 = 0.8287324568437381;
+    const C140 = 0.5542090009406057;
+    const C141 = 0.8323775485177478;
+    const C142 = 0.8961478480794324;
+    const C143 = 0.4437556020858809;
+    const C144 = 0.0637702995616845;
+    const C145 = 0.9979646030264866;
+    const C146 = 0.057237317287568625;
+    const C147 = 0.9983606009402225;
+    const C148 = 0.5487492712856159;
+    const C149 = 0.8359869839079467;
+    const C150 = 0.8932243011955153;
+    const C151 = 0.44961132965460654;
+    const C152 = 0.8902624915554164;
+    const C153 = 0.45544779737039254;
+    const C154 = 0.05070188315728074;
+    const C155 = 0.9987138324086161;
+    const C156 = 0.5432660350382235;
+    const C157 = 0.8395606083981357;
+    const C158 = 0.5377595270820199;
+    const C159 = 0.8430982689061355;
+    const C160 = 0.8872625460332028;
+    const C161 = 0.4612647552183872;
+    const C162 = 0.04416427712706736;
+    const C163 = 0.9990242823004072;
+    const C164 = 0.037624779246211985;
+    const C165 = 0.9992919373169553;
+    const C166 = 0.5322299832974788;
+    const C167 = 0.8465998138903442;
+    const C168 = 0.8842245931365562;
+    const C169 = 0.4670619540194766;
+    const C170 = 0.8811487630012675;
+    const C171 = 0.4728391454409586;
+    const C172 = 0.03108366964503869;
+    const C173 = 0.9995167859928107;
+    const C174 = 0.5266776405518521;
+    const C175 = 0.8500650933562288;
+    const C176 = 0.5211027366890234;
+    const C177 = 0.8534939588627505;
+    const C178 = 0.8780351873856628;
+    const C179 = 0.4785960820071808;
+    const C180 = 0.024541228522912288;
+    const C181 = 0.9996988186962042;
+    const C182 = 0.01799773613623551;
+    const C183 = 0.9998380276294608;
+    const C184 = 0.5155055105193195;
+    const C185 = 0.8568862635287228;
+    const C186 = 0.8748839996649582;
+    const C187 = 0.4843325171101413;
+    const C188 = 0.8716953348255482;
+    const C189 = 0.4900482050200525;
+    const C190 = 0.01145347278644378;
+    const C191 = 0.9999344068293331;
+    const C192 = 0.5098862018092806;
+    const C193 = 0.8602418620391045;
+    t14 = re[81];
+    t11 = im[81];
+    t6 = re[161];
+    t4 = im[161];
+    t0 = re[1];
+    t5 = im[1];
+    t3 = t6 + t0;
+    t2 = t4 + t5;
+    t13 = C0 * t3;
+    t8 = t14 - t13;
+    t1 = C0 * t2;
+    t7 = t11 - t1;
+    t9 = t6 - t0;
+    t12 = C1 * t9;
+    t10 = t4 - t5;
+    t13 = C1 * t10;
+    t1 = t14 + t3;
+    t6 = t11 + t2;
+    t0 = t8 + t13;
+    t9 = t7 - t12;
+    t4 = t8 - t13;
+    t5 = t7 + t12;
+    t10 = C2 * t1;
+    t14 = C3 * t6;
+    t3 = t10 + t14;
+    y[174] = 0;
+    t11 = (-0.0641161879820326) * t3;
+    y[305] = t11;
+    t2 = (-C3) * t1;
+    t8 = C2 * t6;
+    t13 = t2 + t8;
+    t7 = 0.0649861883216497 * t13;
+    y[654] = t7;
+    t12 = 0.01072961494190447 * t13;
+    y[785] = t12;
+    t10 = C4 * t0;
+    t14 = C5 * t9;
+    t3 = t10 + t14;
+    y[14] = 0;
+    t11 = (-0.06482608933539362) * t3;
+    y[465] = t11;
+    t1 = (-C5) * t0;
+    t6 = C4 * t9;
+    t2 = t1 + t6;
+    t8 = 0.06427453374689003 * t2;
+    y[494] = t8;
+    t7 = (-0.000276071014598291) * t2;
+    y[945] = t7;
+    t13 = (-C6) * t4;
+    t12 = (-C7) * t5;
+    t10 = t13 + t12;
+    t14 = 0.06391499826051626 * t10;
+    y[625] = t14;
+    t3 = (-0.0014275697895049036) * t10;
+    y[814] = t3;
+    t11 = C7 * t4;
+    t0 = (-C6) * t5;
+    t9 = t11 + t0;
+    y[145] = 0;
+    t1 = (-0.06519074990322953) * t9;
+    y[334] = t1;
+    t6 = re[144];
+    t8 = im[144];
+    t2 = re[224];
+    t7 = im[224];
+    t13 = re[64];
+    t12 = im[64];
+    t14 = t2 + t13;
+    t10 = t7 + t12;
+    t3 = C0 * t14;
+    t4 = t6 - t3;
+    t5 = C0 * t10;
+    t11 = t8 - t5;
+    t0 = t2 - t13;
+    t9 = C1 * t0;
+    t1 = t7 - t12;
+    t3 = C1 * t1;
+    t5 = t6 + t14;
+    t2 = t8 + t10;
+    t13 = t4 + t3;
+    t0 = t11 - t9;
+    t7 = t4 - t3;
+    t12 = t11 + t9;
+    t1 = (-C8) * t5;
+    t6 = (-C9) * t2;
+    t14 = t1 + t6;
+    t8 = 0.06388315384228209 * t14;
+    y[623] = t8;
+    t10 = (-0.001979314939273731) * t14;
+    y[816] = t10;
+    t4 = C9 * t5;
+    t3 = (-C8) * t2;
+    t11 = t4 + t3;
+    y[143] = 0;
+    t9 = (-0.06522324613079593) * t11;
+    y[336] = t9;
+    t1 = C10 * t13;
+    t6 = C11 * t0;
+    t8 = t1 + t6;
+    y[176] = 0;
+    t14 = (-0.06398506143007344) * t8;
+    y[303] = t14;
+    t10 = (-C11) * t13;
+    t5 = C10 * t0;
+    t2 = t10 + t5;
+    t4 = 0.0651193665137016 * t2;
+    y[656] = t4;
+    t3 = 0.011873482107928959 * t2;
+    y[783] = t3;
+    t11 = C12 * t7;
+    t9 = C13 * t12;
+    t1 = t11 + t9;
+    y[16] = 0;
+    t6 = (-0.06486029536102422) * t1;
+    y[463] = t6;
+    t8 = (-C13) * t7;
+    t14 = C12 * t12;
+    t13 = t8 + t14;
+    t0 = 0.06424063664024714 * t13;
+    y[496] = t0;
+    t10 = (-0.00034370201507132975) * t13;
+    y[943] = t10;
+    t5 = re[12];
+    t4 = im[12];
+    t2 = re[92];
+    t3 = im[92];
+    t11 = re[172];
+    t9 = im[172];
+    t1 = t2 + t11;
+    t6 = t3 + t9;
+    t7 = C0 * t1;
+    t12 = t5 - t7;
+    t8 = C0 * t6;
+    t14 = t4 - t8;
+    t0 = t2 - t11;
+    t13 = C1 * t0;
+    t10 = t3 - t9;
+    t7 = C1 * t10;
+    t8 = t5 + t1;
+    t2 = t4 + t6;
+    t11 = t12 + t7;
+    t0 = t14 - t13;
+    t3 = t12 - t7;
+    t9 = t14 + t13;
+    t10 = C14 * t8;
+    t5 = C15 * t2;
+    t1 = t10 + t5;
+    y[18] = 0;
+    t4 = (-0.06489304922604013) * t1;
+    y[461] = t4;
+    t6 = (-C15) * t8;
+    t12 = C14 * t2;
+    t7 = t6 + t12;
+    t14 = 0.06420821207141977 * t7;
+    y[498] = t14;
+    t13 = (-0.00042089128352338934) * t7;
+    y[941] = t13;
+    t10 = (-C16) * t11;
+    t5 = (-C17) * t0;
+    t1 = t10 + t5;
+    t4 = 0.06385500498660353 * t1;
+    y[621] = t4;
+    t8 = (-0.002498200628933956) * t1;
+    y[818] = t8;
+    t2 = C17 * t11;
+    t6 = (-C16) * t0;
+    t12 = t2 + t6;
+    y[141] = 0;
+    t14 = (-0.06525199814080057) * t12;
+    y[338] = t14;
+    t7 = C18 * t3;
+    t13 = C19 * t9;
+    t10 = t7 + t13;
+    y[178] = 0;
+    t5 = (-0.06384456751145744) * t10;
+    y[301] = t5;
+    t4 = (-C19) * t3;
+    t1 = C18 * t9;
+    t8 = t4 + t1;
+    t11 = 0.06526266570634885 * t8;
+    y[658] = t11;
+    t0 = 0.013056471420713447 * t8;
+    y[781] = t0;
+    t2 = re[120];
+    t6 = im[120];
+    t12 = re[200];
+    t14 = im[200];
+    t7 = re[40];
+    t13 = im[40];
+    t10 = t12 + t7;
+    t5 = t14 + t13;
+    t3 = C0 * t10;
+    t9 = t2 - t3;
+    t4 = C0 * t5;
+    t1 = t6 - t4;
+    t11 = t12 - t7;
+    t8 = C1 * t11;
+    t0 = t14 - t13;
+    t3 = C1 * t0;
+    t4 = t2 + t10;
+    t12 = t6 + t5;
+    t7 = t9 + t3;
+    t11 = t1 - t8;
+    t14 = t9 - t3;
+    t13 = t1 + t8;
+    t0 = C20 * t4;
+    t2 = C21 * t12;
+    t10 = t0 + t2;
+    t6 = 0.0002262105086283927 * t10;
+    y[180] = t6;
+    t5 = (-0.06366896226091003) * t10;
+    y[299] = t5;
+    t9 = (-C21) * t4;
+    t3 = C20 * t12;
+    t1 = t9 + t3;
+    t8 = 0.06539193914565526 * t1;
+    y[660] = t8;
+    t0 = 0.014277679024727883 * t1;
+    y[779] = t0;
+    t2 = C22 * t7;
+    t6 = C23 * t11;
+    t10 = t2 + t6;
+    y[20] = 0;
+    t5 = (-0.06492425733125114) * t10;
+    y[459] = t5;
+    t4 = (-C23) * t7;
+    t12 = C22 * t11;
+    t9 = t4 + t12;
+    t3 = 0.06417734815829848 * t9;
+    y[500] = t3;
+    t8 = (-0.0005080981582550777) * t9;
+    y[939] = t8;
+    t1 = (-C24) * t14;
+    t0 = (-C25) * t13;
+    t2 = t1 + t0;
+    t6 = 0.06383035680828042 * t2;
+    y[619] = t6;
+    t10 = (-0.002985074088911769) * t2;
+    y[820] = t10;
+    t5 = C25 * t14;
+    t7 = (-C24) * t13;
+    t11 = t5 + t7;
+    y[139] = 0;
+    t4 = (-0.06527719528784062) * t11;
+    y[340] = t4;
+    t12 = re[228];
+    t3 = im[228];
+    t9 = re[68];
+    t8 = im[68];
+    t1 = re[148];
+    t0 = im[148];
+    t6 = t9 + t1;
+    t2 = t8 + t0;
+    t10 = C0 * t6;
+    t14 = t12 - t10;
+    t13 = C0 * t2;
+    t5 = t3 - t13;
+    t7 = t9 - t1;
+    t11 = C1 * t7;
+    t4 = t8 - t0;
+    t10 = C1 * t4;
+    t13 = t12 + t6;
+    t9 = t3 + t2;
+    t1 = t14 + t10;
+    t7 = t5 - t11;
+    t8 = t14 - t10;
+    t0 = t5 + t11;
+    t4 = (-C26) * t13;
+    t12 = (-C27) * t9;
+    t6 = t4 + t12;
+    t3 = 0.06380899891895385 * t6;
+    y[617] = t3;
+    t2 = (-0.003440762383926833) * t6;
+    y[822] = t2;
+    t14 = C27 * t13;
+    t10 = (-C26) * t9;
+    t5 = t14 + t10;
+    y[137] = 0;
+    t11 = (-0.06529904460590116) * t5;
+    y[342] = t11;
+    t4 = C28 * t1;
+    t12 = C29 * t7;
+    t3 = t4 + t12;
+    t6 = 0.0005772987765440853 * t3;
+    y[182] = t6;
+    t2 = (-0.06346367948109186) * t3;
+    y[297] = t2;
+    t13 = (-C29) * t1;
+    t9 = C28 * t7;
+    t14 = t13 + t9;
+    t10 = 0.06551302642791178 * t14;
+    y[662] = t10;
+    t5 = 0.015536072435597533 * t14;
+    y[777] = t5;
+    t11 = C30 * t8;
+    t4 = C31 * t0;
+    t12 = t11 + t4;
+    y[22] = 0;
+    t6 = (-0.06495379436282869) * t12;
+    y[457] = t6;
+    t3 = (-C31) * t8;
+    t2 = C30 * t0;
+    t1 = t3 + t2;
+    t7 = 0.06414816420718814 * t1;
+    y[502] = t7;
+    t13 = (-0.0006056365353395344) * t1;
+    y[937] = t13;
+    t9 = re[111];
+    t10 = im[111];
+    t14 = re[191];
+    t5 = im[191];
+    t11 = re[31];
+    t4 = im[31];
+    t12 = t14 + t11;
+    t6 = t5 + t4;
+    t8 = C0 * t12;
+    t0 = t9 - t8;
+    t3 = C0 * t6;
+    t2 = t10 - t3;
+    t7 = t14 - t11;
+    t1 = C1 * t7;
+    t13 = t5 - t4;
+    t8 = C1 * t13;
+    t3 = t9 + t12;
+    t14 = t10 + t6;
+    t11 = t0 + t8;
+    t7 = t2 - t1;
+    t5 = t0 - t8;
+    t4 = t2 + t1;
+    t13 = C32 * t3;
+    t9 = C33 * t14;
+    t12 = t13 + t9;
+    y[24] = 0;
+    t10 = (-0.064981595028927) * t12;
+    y[455] = t10;
+    t6 = (-C33) * t3;
+    t0 = C32 * t14;
+    t8 = t6 + t0;
+    t2 = 0.06412072010254359 * t8;
+    y[504] = t2;
+    t1 = (-0.0007136104450472506) * t8;
+    y[935] = t1;
+    t13 = (-C34) * t11;
+    t9 = (-C35) * t7;
+    t12 = t13 + t9;
+    t10 = 0.06379076791189792 * t12;
+    y[615] = t10;
+    t3 = (-0.003866006755833699) * t12;
+    y[824] = t3;
+    t14 = C35 * t11;
+    t6 = (-C34) * t7;
+    t0 = t14 + t6;
+    y[135] = 0;
+    t2 = (-0.06531770666911066) * t0;
+    y[344] = t2;
+    t8 = C36 * t5;
+    t1 = C37 * t4;
+    t13 = t8 + t1;
+    t9 = 0.0008626305010526697 * t13;
+    y[184] = t9;
+    t10 = (-0.0632497783386208) * t13;
+    y[295] = t10;
+    t12 = (-C37) * t5;
+    t3 = C36 * t4;
+    t11 = t12 + t3;
+    t7 = 0.06564684176583985 * t11;
+    y[664] = t7;
+    t14 = 0.016830469510486154 * t11;
+    y[775] = t14;
+    t6 = re[219];
+    t0 = im[219];
+    t2 = re[59];
+    t8 = im[59];
+    t1 = re[139];
+    t9 = im[139];
+    t13 = t2 + t1;
+    t10 = t8 + t9;
+    t5 = C0 * t13;
+    t4 = t6 - t5;
+    t12 = C0 * t10;
+    t3 = t0 - t12;
+    t7 = t2 - t1;
+    t11 = C1 * t7;
+    t14 = t8 - t9;
+    t5 = C1 * t14;
+    t12 = t6 + t13;
+    t2 = t0 + t10;
+    t1 = t4 + t5;
+    t7 = t3 - t11;
+    t8 = t4 - t5;
+    t9 = t3 + t11;
+    t14 = C38 * t12;
+    t6 = C39 * t2;
+    t13 = t14 + t6;
+    t0 = 0.0012089492947579118 * t13;
+    y[186] = t0;
+    t10 = (-0.06301069127326117) * t13;
+    y[293] = t10;
+    t4 = (-C39) * t12;
+    t5 = C38 * t2;
+    t3 = t4 + t5;
+    t11 = 0.06577792843462159 * t3;
+    y[666] = t11;
+    t14 = 0.018159508900208607 * t3;
+    y[773] = t14;
+    t6 = C40 * t1;
+    t0 = C41 * t7;
+    t13 = t6 + t0;
+    y[26] = 0;
+    t10 = (-0.06500757656773257) * t13;
+    y[453] = t10;
+    t12 = (-C41) * t1;
+    t2 = C40 * t7;
+    t4 = t12 + t2;
+    t5 = 0.06409509301312502 * t4;
+    y[506] = t5;
+    t11 = (-0.000832178836739828) * t4;
+    y[933] = t11;
+    t3 = (-C42) * t8;
+    t14 = (-C43) * t9;
+    t6 = t3 + t14;
+    t0 = 0.063775459014178 * t6;
+    y[613] = t0;
+    t13 = (-0.004261695189175274) * t6;
+    y[826] = t13;
+    t10 = C43 * t8;
+    t1 = (-C42) * t9;
+    t7 = t10 + t1;
+    y[133] = 0;
+    t12 = (-0.06533338577367775) * t7;
+    y[346] = t12;
+    t2 = re[87];
+    t5 = im[87];
+    t4 = re[167];
+    t11 = im[167];
+    t3 = re[7];
+    t14 = im[7];
+    t0 = t4 + t3;
+    t6 = t11 + t14;
+    t13 = C0 * t0;
+    t8 = t2 - t13;
+    t9 = C0 * t6;
+    t10 = t5 - t9;
+    t1 = t4 - t3;
+    t7 = C1 * t1;
+    t12 = t11 - t14;
+    t13 = C1 * t12;
+    t9 = t2 + t0;
+    t4 = t5 + t6;
+    t3 = t8 + t13;
+    t1 = t10 - t7;
+    t11 = t8 - t13;
+    t14 = t10 + t7;
+    t12 = (-C44) * t9;
+    t2 = (-C45) * t4;
+    t0 = t12 + t2;
+    t5 = 0.06376293712973247 * t0;
+    y[611] = t5;
+    t6 = (-0.00462872956186059) * t0;
+    y[828] = t6;
+    t8 = C45 * t9;
+    t13 = (-C44) * t4;
+    t10 = t8 + t13;
+    y[131] = 0;
+    t7 = (-0.06534621606575527) * t10;
+    y[348] = t7;
+    t12 = C46 * t3;
+    t2 = C47 * t1;
+    t5 = t12 + t2;
+    t0 = 0.0016272859579925193 * t5;
+    y[188] = t0;
+    t6 = (-0.06274226638221903) * t5;
+    y[291] = t6;
+    t9 = (-C47) * t3;
+    t4 = C46 * t1;
+    t8 = t9 + t4;
+    t13 = 0.06590293451154614 * t8;
+    y[668] = t13;
+    t10 = 0.019521580713750934 * t8;
+    y[771] = t10;
+    t7 = C48 * t11;
+    t12 = C49 * t14;
+    t2 = t7 + t12;
+    y[28] = 0;
+    t0 = (-0.06503169044637187) * t2;
+    y[451] = t0;
+    t5 = (-C49) * t11;
+    t6 = C48 * t14;
+    t3 = t5 + t6;
+    t1 = 0.06407132642665489 * t3;
+    y[508] = t1;
+    t9 = (-0.0009614862925791448) * t3;
+    y[931] = t9;
+    t4 = re[195];
+    t13 = im[195];
+    t8 = re[35];
+    t10 = im[35];
+    t7 = re[115];
+    t12 = im[115];
+    t2 = t8 + t7;
+    t0 = t10 + t12;
+    t11 = C0 * t2;
+    t14 = t4 - t11;
+    t5 = C0 * t0;
+    t6 = t13 - t5;
+    t1 = t8 - t7;
+    t3 = C1 * t1;
+    t9 = t10 - t12;
+    t11 = C1 * t9;
+    t5 = t4 + t2;
+    t8 = t13 + t0;
+    t7 = t14 + t11;
+    t1 = t6 - t3;
+    t10 = t14 - t11;
+    t12 = t6 + t3;
+    t9 = C50 * t5;
+    t4 = C51 * t8;
+    t2 = t9 + t4;
+    y[30] = 0;
+    t13 = (-0.06505392268033405) * t2;
+    y[449] = t13;
+    t0 = (-C51) * t5;
+    t14 = C50 * t8;
+    t11 = t0 + t14;
+    t6 = 0.0640494299958065 * t11;
+    y[510] = t6;
+    t3 = (-0.0011014045273434368) * t11;
+    y[929] = t3;
+    t9 = (-C52) * t7;
+    t4 = (-C53) * t1;
+    t2 = t9 + t4;
+    t13 = 0.06375299801573686 * t2;
+    y[609] = t13;
+    t5 = (-0.004967734229580542) * t2;
+    y[830] = t5;
+    t8 = C53 * t7;
+    t0 = (-C52) * t1;
+    t14 = t8 + t0;
+    y[129] = 0;
+    t6 = (-0.0653564035629848) * t14;
+    y[350] = t6;
+    t11 = C54 * t10;
+    t3 = C55 * t12;
+    t9 = t11 + t3;
+    t4 = 0.0021224418341173794 * t9;
+    y[190] = t4;
+    t13 = (-0.062441089406128296) * t9;
+    y[289] = t13;
+    t2 = (-C55) * t10;
+    t5 = C54 * t12;
+    t7 = t2 + t5;
+    t1 = 0.06601864913882413 * t7;
+    y[670] = t1;
+    t8 = 0.02091472784034726 * t7;
+    y[769] = t8;
+    t0 = re[78];
+    t14 = im[78];
+    t6 = re[158];
+    t11 = im[158];
+    t3 = re[238];
+    t4 = im[238];
+    t9 = t6 + t3;
+    t13 = t11 + t4;
+    t10 = C0 * t9;
+    t12 = t0 - t10;
+    t2 = C0 * t13;
+    t5 = t14 - t2;
+    t1 = t6 - t3;
+    t7 = C1 * t1;
+    t8 = t11 - t4;
+    t10 = C1 * t8;
+    t2 = t0 + t9;
+    t6 = t14 + t13;
+    t3 = t12 + t10;
+    t1 = t5 - t7;
+    t11 = t12 - t10;
+    t4 = t5 + t7;
+    t8 = C56 * t2;
+    t0 = C57 * t6;
+    t9 = t8 + t0;
+    t14 = 0.002698791969717943 * t9;
+    y[192] = t14;
+    t13 = (-0.06210336217290626) * t9;
+    y[287] = t13;
+    t12 = (-C57) * t2;
+    t10 = C56 * t6;
+    t5 = t12 + t10;
+    t7 = 0.0661217651490672 * t5;
+    y[672] = t7;
+    t8 = 0.02233693399813748 * t5;
+    y[767] = t8;
+    t0 = C58 * t3;
+    t14 = C59 * t1;
+    t9 = t0 + t14;
+    y[32] = 0;
+    t13 = (-0.06507424547097974) * t9;
+    y[447] = t13;
+    t2 = (-C59) * t3;
+    t6 = C58 * t1;
+    t12 = t2 + t6;
+    t10 = 0.0640294272566682 * t12;
+    y[512] = t10;
+    t7 = (-0.00125166170487896) * t12;
+    y[927] = t7;
+    t5 = (-C60) * t11;
+    t8 = (-C61) * t4;
+    t0 = t5 + t8;
+    t14 = 0.06374551513006745 * t0;
+    y[607] = t14;
+    t9 = (-0.005279387997380958) * t0;
+    y[832] = t9;
+    t13 = C61 * t11;
+    t3 = (-C60) * t4;
+    t1 = t13 + t3;
+    y[127] = 0;
+    t2 = (-0.06536407554578434) * t1;
+    y[352] = t2;
+    t6 = re[186];
+    t10 = im[186];
+    t12 = re[26];
+    t7 = im[26];
+    t5 = re[106];
+    t8 = im[106];
+    t14 = t12 + t5;
+    t0 = t7 + t8;
+    t9 = C0 * t14;
+    t11 = t6 - t9;
+    t4 = C0 * t0;
+    t13 = t10 - t4;
+    t3 = t12 - t5;
+    t1 = C1 * t3;
+    t2 = t7 - t8;
+    t9 = C1 * t2;
+    t4 = t6 + t14;
+    t12 = t10 + t0;
+    t5 = t11 + t9;
+    t3 = t13 - t1;
+    t7 = t11 - t9;
+    t8 = t13 + t1;
+    t2 = (-C62) * t4;
+    t6 = (-C63) * t12;
+    t14 = t2 + t6;
+    t10 = 0.06374030925537781 * t14;
+    y[605] = t10;
+    t0 = (-0.0055645048346550955) * t14;
+    y[834] = t0;
+    t11 = C63 * t4;
+    t9 = (-C62) * t12;
+    t13 = t11 + t9;
+    y[125] = 0;
+    t1 = (-0.06536941403865437) * t13;
+    y[354] = t1;
+    t2 = C64 * t5;
+    t6 = C65 * t3;
+    t10 = t2 + t6;
+    t14 = 0.0033599706942228093 * t10;
+    y[194] = t14;
+    t0 = (-0.061725202011645934) * t10;
+    y[285] = t0;
+    t4 = (-C65) * t5;
+    t12 = C64 * t3;
+    t11 = t4 + t12;
+    t9 = 0.06620871500902986 * t11;
+    y[674] = t9;
+    t13 = 0.023786028235371508 * t11;
+    y[765] = t13;
+    t1 = C66 * t7;
+    t2 = C67 * t8;
+    t6 = t1 + t2;
+    y[34] = 0;
+    t14 = (-0.06509268040129385) * t6;
+    y[445] = t14;
+    t10 = (-C67) * t7;
+    t0 = C66 * t8;
+    t5 = t10 + t0;
+    t3 = 0.06401129345080475 * t5;
+    y[514] = t3;
+    t4 = (-0.0014120709607033427) * t5;
+    y[925] = t4;
+    t12 = re[54];
+    t9 = im[54];
+    t11 = re[134];
+    t13 = im[134];
+    t1 = re[214];
+    t2 = im[214];
+    t6 = t11 + t1;
+    t14 = t13 + t2;
+    t7 = C0 * t6;
+    t8 = t12 - t7;
+    t10 = C0 * t14;
+    t0 = t9 - t10;
+    t3 = t11 - t1;
+    t5 = C1 * t3;
+    t4 = t13 - t2;
+    t7 = C1 * t4;
+    t10 = t12 + t6;
+    t11 = t9 + t14;
+    t1 = t8 + t7;
+    t3 = t0 - t5;
+    t13 = t8 - t7;
+    t2 = t0 + t5;
+    t4 = C68 * t10;
+    t12 = C69 * t11;
+    t6 = t4 + t12;
+    y[36] = 0;
+    t9 = (-0.06510924061437842) * t6;
+    y[443] = t9;
+    t14 = (-C69) * t10;
+    t8 = C68 * t11;
+    t7 = t14 + t8;
+    t0 = 0.06399501249514679 * t7;
+    y[516] = t0;
+    t5 = (-0.0015822605146506958) * t7;
+    y[923] = t5;
+    t4 = (-C70) * t1;
+    t12 = (-C71) * t3;
+    t6 = t4 + t12;
+    t9 = 0.06373721193577314 * t6;
+    y[603] = t9;
+    t10 = (-0.005823786352090389) * t6;
+    y[836] = t10;
+    t11 = C71 * t1;
+    t14 = (-C70) * t3;
+    t8 = t11 + t14;
+    y[123] = 0;
+    t0 = (-0.06537259067537095) * t8;
+    y[356] = t0;
+    t7 = C72 * t13;
+    t5 = C73 * t2;
+    t4 = t7 + t5;
+    t12 = 0.004108711258476244 * t4;
+    y[196] = t12;
+    t9 = (-0.061302768645727056) * t4;
+    y[283] = t9;
+    t6 = (-C73) * t13;
+    t10 = C72 * t2;
+    t1 = t6 + t10;
+    t3 = 0.06627569639906315 * t1;
+    y[676] = t3;
+    t11 = 0.025259254532999657 * t1;
+    y[763] = t11;
+    t14 = re[162];
+    t8 = im[162];
+    t0 = re[2];
+    t7 = im[2];
+    t5 = re[82];
+    t12 = im[82];
+    t4 = t0 + t5;
+    t9 = t7 + t12;
+    t13 = C0 * t4;
+    t2 = t14 - t13;
+    t6 = C0 * t9;
+    t10 = t8 - t6;
+    t3 = t0 - t5;
+    t1 = C1 * t3;
+    t11 = t7 - t12;
+    t13 = C1 * t11;
+    t6 = t14 + t4;
+    t0 = t8 + t9;
+    t5 = t2 + t13;
+    t3 = t10 - t1;
+    t7 = t2 - t13;
+    t12 = t10 + t1;
+    t11 = C74 * t6;
+    t14 = C75 * t0;
+    t4 = t11 + t14;
+    t8 = 0.004946773340143956 * t4;
+    y[198] = t8;
+    t9 = (-0.06083212068839759) * t4;
+    y[281] = t9;
+    t2 = (-C75) * t6;
+    t13 = C74 * t0;
+    t10 = t2 + t13;
+    t1 = 0.06631893477331191 * t10;
+    y[678] = t1;
+    t11 = 0.02675384811682817 * t10;
+    y[761] = t11;
+    t14 = C76 * t5;
+    t8 = C77 * t3;
+    t4 = t14 + t8;
+    y[38] = 0;
+    t9 = (-0.06512399073581787) * t4;
+    y[441] = t9;
+    t6 = (-C77) * t5;
+    t0 = C76 * t3;
+    t2 = t6 + t0;
+    t13 = 0.0639805180792617 * t2;
+    y[518] = t13;
+    t1 = (-0.0017617321668600802) * t2;
+    y[921] = t1;
+    t10 = (-C78) * t7;
+    t11 = (-C79) * t12;
+    t14 = t10 + t11;
+    t8 = 0.06373607267574667 * t14;
+    y[601] = t8;
+    t4 = (-0.0060577880678891185) * t14;
+    y[838] = t4;
+    t9 = C79 * t7;
+    t5 = (-C78) * t12;
+    t3 = t9 + t5;
+    y[121] = 0;
+    t6 = (-0.06537375918758478) * t3;
+    y[358] = t6;
+    t0 = re[45];
+    t13 = im[45];
+    t2 = re[125];
+    t1 = im[125];
+    t10 = re[205];
+    t11 = im[205];
+    t8 = t2 + t10;
+    t14 = t1 + t11;
+    t4 = C0 * t8;
+    t7 = t0 - t4;
+    t12 = C0 * t14;
+    t9 = t13 - t12;
+    t5 = t2 - t10;
+    t3 = C1 * t5;
+    t6 = t1 - t11;
+    t4 = C1 * t6;
+    t12 = t0 + t8;
+    t2 = t13 + t14;
+    t10 = t7 + t4;
+    t5 = t9 - t3;
+    t1 = t7 - t4;
+    t11 = t9 + t3;
+    t6 = (-C80) * t12;
+    t0 = (-C81) * t2;
+    t8 = t6 + t0;
+    t13 = 0.06373671261707498 * t8;
+    y[599] = t13;
+    t14 = (-0.00626707518983094) * t8;
+    y[840] = t14;
+    t7 = C81 * t12;
+    t4 = (-C80) * t2;
+    t9 = t7 + t4;
+    y[119] = 0;
+    t3 = (-0.06537310280967362) * t9;
+    y[360] = t3;
+    t6 = C82 * t10;
+    t0 = C83 * t5;
+    t13 = t6 + t0;
+    t8 = 0.005874914882993542 * t13;
+    y[200] = t8;
+    t14 = (-0.060309534865694944) * t13;
+    y[279] = t14;
+    t12 = (-C83) * t10;
+    t2 = C82 * t5;
+    t7 = t12 + t2;
+    t4 = 0.06633445460906878 * t7;
+    y[680] = t4;
+    t9 = 0.02826705866069585 * t7;
+    y[759] = t9;
+    t3 = C84 * t1;
+    t6 = C85 * t11;
+    t0 = t3 + t6;
+    y[40] = 0;
+    t8 = (-0.06513698056812472) * t0;
+    y[439] = t8;
+    t13 = (-C85) * t1;
+    t14 = C84 * t11;
+    t10 = t13 + t14;
+    t5 = 0.06396775887253293 * t10;
+    y[520] = t5;
+    t12 = (-0.0019499585127337403) * t10;
+    y[919] = t12;
+    t2 = re[153];
+    t4 = im[153];
+    t7 = re[233];
+    t9 = im[233];
+    t3 = re[73];
+    t6 = im[73];
+    t0 = t7 + t3;
+    t8 = t9 + t6;
+    t1 = C0 * t0;
+    t11 = t2 - t1;
+    t13 = C0 * t8;
+    t14 = t4 - t13;
+    t5 = t7 - t3;
+    t10 = C1 * t5;
+    t12 = t9 - t6;
+    t1 = C1 * t12;
+    t13 = t2 + t0;
+    t7 = t4 + t8;
+    t3 = t11 + t1;
+    t5 = t14 - t10;
+    t9 = t11 - t1;
+    t6 = t14 + t10;
+    t12 = C86 * t13;
+    t2 = C87 * t7;
+    t0 = t12 + t2;
+    y[42] = 0;
+    t4 = (-0.06514830258601771) * t0;
+    y[437] = t4;
+    t8 = (-C87) * t13;
+    t11 = C86 * t7;
+    t1 = t8 + t11;
+    t14 = 0.06395664201941807 * t1;
+    y[522] = t14;
+    t10 = (-0.002146342084224539) * t1;
+    y[917] = t10;
+    t12 = (-C88) * t3;
+    t2 = (-C89) * t5;
+    t0 = t12 + t2;
+    t4 = 0.06373897609694043 * t0;
+    y[597] = t4;
+    t13 = (-0.006452302836340159) * t0;
+    y[842] = t13;
+    t7 = C89 * t3;
+    t8 = (-C88) * t5;
+    t11 = t7 + t8;
+    y[117] = 0;
+    t14 = (-0.0653707812991786) * t11;
+    y[362] = t14;
+    t1 = C90 * t9;
+    t10 = C91 * t6;
+    t12 = t1 + t10;
+    t2 = 0.006892880337578761 * t12;
+    y[202] = t2;
+    t4 = (-0.05973152439328069) * t12;
+    y[277] = t4;
+    t0 = (-C91) * t9;
+    t13 = C90 * t6;
+    t3 = t0 + t13;
+    t5 = 0.06631822500252159 * t3;
+    y[682] = t5;
+    t7 = 0.02979567062694908 * t3;
+    y[757] = t7;
+    t8 = re[21];
+    t11 = im[21];
+    t14 = re[101];
+    t1 = im[101];
+    t10 = re[181];
+    t2 = im[181];
+    t12 = t14 + t10;
+    t4 = t1 + t2;
+    t9 = C0 * t12;
+    t6 = t8 - t9;
+    t0 = C0 * t4;
+    t13 = t11 - t0;
+    t5 = t14 - t10;
+    t3 = C1 * t5;
+    t7 = t1 - t2;
+    t9 = C1 * t7;
+    t0 = t8 + t12;
+    t14 = t11 + t4;
+    t10 = t6 + t9;
+    t5 = t13 - t3;
+    t1 = t6 - t9;
+    t2 = t13 + t3;
+    t7 = C92 * t0;
+    t8 = C93 * t14;
+    t12 = t7 + t8;
+    t11 = 0.007999393194151353 * t12;
+    y[204] = t11;
+    t4 = (-0.059094601384874317) * t12;
+    y[275] = t4;
+    t6 = (-C93) * t0;
+    t9 = C92 * t14;
+    t13 = t6 + t9;
+    t3 = 0.06626654744040716 * t13;
+    y[684] = t3;
+    t7 = 0.03133630944747369 * t13;
+    y[755] = t7;
+    t8 = C94 * t10;
+    t11 = C95 * t5;
+    t12 = t8 + t11;
+    y[44] = 0;
+    t4 = (-0.06515803546751704) * t12;
+    y[435] = t4;
+    t0 = (-C95) * t10;
+    t14 = C94 * t5;
+    t6 = t0 + t14;
+    t9 = 0.06394708859422037 * t6;
+    y[524] = t9;
+    t3 = (-0.002350185942897436) * t6;
+    y[915] = t3;
+    t13 = (-C96) * t1;
+    t7 = (-C97) * t2;
+    t8 = t13 + t7;
+    t11 = 0.06374267795104448 * t8;
+    y[595] = t11;
+    t12 = (-0.006614088359731265) * t8;
+    y[844] = t12;
+    t4 = C97 * t1;
+    t10 = (-C96) * t2;
+    t5 = t4 + t10;
+    y[115] = 0;
+    t0 = (-0.06536698489302159) * t5;
+    y[364] = t0;
+    t14 = re[129];
+    t9 = im[129];
+    t6 = re[209];
+    t3 = im[209];
+    t13 = re[49];
+    t7 = im[49];
+    t11 = t6 + t13;
+    t8 = t3 + t7;
+    t12 = C0 * t11;
+    t1 = t14 - t12;
+    t2 = C0 * t8;
+    t4 = t9 - t2;
+    t10 = t6 - t13;
+    t5 = C1 * t10;
+    t0 = t3 - t7;
+    t12 = C1 * t0;
+    t2 = t14 + t11;
+    t6 = t9 + t8;
+    t13 = t1 + t12;
+    t10 = t4 - t5;
+    t3 = t1 - t12;
+    t7 = t4 + t5;
+    t0 = (-C98) * t2;
+    t14 = (-C99) * t6;
+    t11 = t0 + t14;
+    t9 = 0.06374766977168722 * t11;
+    y[593] = t9;
+    t8 = (-0.006752951917176866) * t11;
+    y[846] = t8;
+    t1 = C99 * t2;
+    t12 = (-C98) * t6;
+    t4 = t1 + t12;
+    y[113] = 0;
+    t5 = (-0.06536186627040039) * t4;
+    y[366] = t5;
+    t0 = C100 * t13;
+    t14 = C101 * t10;
+    t9 = t0 + t14;
+    t11 = 0.009192221304956522 * t9;
+    y[206] = t11;
+    t8 = (-0.05839568485751641) * t9;
+    y[273] = t8;
+    t2 = (-C101) * t13;
+    t6 = C100 * t10;
+    t1 = t2 + t6;
+    t12 = 0.06617571199292888 * t1;
+    y[686] = t12;
+    t4 = 0.032885483701619124 * t1;
+    y[753] = t4;
+    t5 = C102 * t3;
+    t0 = C103 * t7;
+    t14 = t5 + t0;
+    y[46] = 0;
+    t11 = (-0.06516632732810197) * t14;
+    y[433] = t11;
+    t9 = (-C103) * t3;
+    t8 = C102 * t7;
+    t13 = t9 + t8;
+    t10 = 0.06393895187138858 * t13;
+    y[526] = t10;
+    t2 = (-0.0025607313781491553) * t13;
+    y[913] = t2;
+    t6 = re[192];
+    t12 = im[192];
+    t1 = re[32];
+    t4 = im[32];
+    t5 = re[112];
+    t0 = im[112];
+    t14 = t1 + t5;
+    t11 = t4 + t0;
+    t3 = C0 * t14;
+    t7 = t6 - t3;
+    t9 = C0 * t11;
+    t8 = t12 - t9;
+    t10 = t1 - t5;
+    t13 = C1 * t10;
+    t2 = t4 - t0;
+    t3 = C1 * t2;
+    t9 = t6 + t14;
+    t1 = t12 + t11;
+    t5 = t7 + t3;
+    t10 = t8 - t13;
+    t4 = t7 - t3;
+    t0 = t8 + t13;
+    t2 = C104 * t9;
+    t6 = C105 * t1;
+    t14 = t2 + t6;
+    y[48] = 0;
+    t12 = (-0.0651732710663119) * t14;
+    y[431] = t12;
+    t11 = (-C105) * t9;
+    t7 = C104 * t1;
+    t3 = t11 + t7;
+    t8 = 0.06393213964091513 * t3;
+    y[528] = t8;
+    t13 = (-0.0027770603351207086) * t3;
+    y[911] = t13;
+    t2 = (-C106) * t5;
+    t6 = (-C107) * t10;
+    t14 = t2 + t6;
+    t12 = 0.06375375853090137 * t14;
+    y[591] = t12;
+    t9 = (-0.006869357953162704) * t14;
+    y[848] = t9;
+    t1 = C107 * t5;
+    t11 = (-C106) * t10;
+    t7 = t1 + t11;
+    y[111] = 0;
+    t8 = (-0.06535562392995367) * t7;
+    y[368] = t8;
+    t3 = C108 * t4;
+    t13 = C109 * t0;
+    t2 = t3 + t13;
+    t6 = 0.010468257099355354 * t2;
+    y[208] = t6;
+    t12 = (-0.05763217601515571) * t2;
+    y[271] = t12;
+    t14 = (-C109) * t4;
+    t9 = C108 * t0;
+    t5 = t14 + t9;
+    t10 = 0.06604203723121735 * t5;
+    y[688] = t10;
+    t1 = 0.03443938653167817 * t5;
+    y[751] = t1;
+    t11 = re[60];
+    t7 = im[60];
+    t8 = re[140];
+    t3 = im[140];
+    t13 = re[220];
+    t6 = im[220];
+    t2 = t8 + t13;
+    t12 = t3 + t6;
+    t4 = C0 * t2;
+    t0 = t11 - t4;
+    t14 = C0 * t12;
+    t9 = t7 - t14;
+    t10 = t8 - t13;
+    t5 = C1 * t10;
+    t1 = t3 - t6;
+    t4 = C1 * t1;
+    t14 = t11 + t2;
+    t8 = t7 + t12;
+    t13 = t0 + t4;
+    t10 = t9 - t5;
+    t3 = t0 - t4;
+    t6 = t9 + t5;
+    t1 = C110 * t14;
+    t11 = C111 * t8;
+    t2 = t1 + t11;
+    t7 = 0.011823449188095525 * t2;
+    y[210] = t7;
+    t12 = (-0.05680190137652522) * t2;
+    y[269] = t12;
+    t0 = (-C111) * t14;
+    t4 = C110 * t8;
+    t9 = t0 + t4;
+    t5 = 0.06586204827489513 * t9;
+    y[690] = t5;
+    t1 = 0.03599432697935784 * t9;
+    y[749] = t1;
+    t11 = C112 * t13;
+    t7 = C113 * t10;
+    t2 = t11 + t7;
+    y[50] = 0;
+    t12 = (-0.06517903307994174) * t2;
+    y[429] = t12;
+    t14 = (-C113) * t13;
+    t8 = C112 * t10;
+    t0 = t14 + t8;
+    t4 = 0.06392648785624468 * t0;
+    y[530] = t4;
+    t5 = (-0.0029983489972161405) * t0;
+    y[909] = t5;
+    t9 = (-C114) * t3;
+    t1 = (-C115) * t6;
+    t11 = t9 + t1;
+    t7 = 0.06376080812550963 * t11;
+    y[589] = t7;
+    t2 = (-0.0069638454177599575) * t11;
+    y[850] = t2;
+    t12 = C115 * t3;
+    t13 = (-C114) * t6;
+    t10 = t12 + t13;
+    y[109] = 0;
+    t14 = (-0.065348398007516) * t10;
+    y[370] = t14;
+    t8 = re[168];
+    t4 = im[168];
+    t0 = re[8];
+    t5 = im[8];
+    t9 = re[88];
+    t1 = im[88];
+    t7 = t0 + t9;
+    t11 = t5 + t1;
+    t2 = C0 * t7;
+    t3 = t8 - t2;
+    t6 = C0 * t11;
+    t12 = t4 - t6;
+    t13 = t0 - t9;
+    t10 = C1 * t13;
+    t14 = t5 - t1;
+    t2 = C1 * t14;
+    t6 = t8 + t7;
+    t0 = t4 + t11;
+    t9 = t3 + t2;
+    t13 = t12 - t10;
+    t5 = t3 - t2;
+    t1 = t12 + t10;
+    t14 = (-C116) * t6;
+    t8 = (-C117) * t0;
+    t7 = t14 + t8;
+    t4 = 0.06376861909256175 * t7;
+    y[587] = t4;
+    t11 = (-0.007036978103218968) * t7;
+    y[852] = t11;
+    t3 = C117 * t6;
+    t2 = (-C116) * t0;
+    t12 = t3 + t2;
+    y[107] = 0;
+    t10 = (-0.06534039353461056) * t12;
+    y[372] = t10;
+    t14 = C118 * t9;
+    t8 = C119 * t13;
+    t4 = t14 + t8;
+    t7 = 0.013252961052902145 * t4;
+    y[212] = t7;
+    t11 = (-0.05590313564763854) * t4;
+    y[267] = t11;
+    t6 = (-C119) * t9;
+    t0 = C118 * t13;
+    t3 = t6 + t0;
+    t2 = 0.06563252203272879 * t3;
+    y[692] = t2;
+    t12 = 0.037546543945018315 * t3;
+    y[747] = t12;
+    t10 = C120 * t5;
+    t14 = C121 * t1;
+    t8 = t10 + t14;
+    y[52] = 0;
+    t7 = (-0.06518373563426666) * t8;
+    y[427] = t7;
+    t4 = (-C121) * t5;
+    t11 = C120 * t1;
+    t9 = t4 + t11;
+    t13 = 0.06392187600362498 * t9;
+    y[532] = t13;
+    t6 = (-0.0032237589325984635) * t9;
+    y[907] = t6;
+    t0 = re[36];
+    t2 = im[36];
+    t3 = re[116];
+    t12 = im[116];
+    t10 = re[196];
+    t14 = im[196];
+    t8 = t3 + t10;
+    t7 = t12 + t14;
+    t5 = C0 * t8;
+    t1 = t0 - t5;
+    t4 = C0 * t7;
+    t11 = t2 - t4;
+    t13 = t3 - t10;
+    t9 = C1 * t13;
+    t6 = t12 - t14;
+    t5 = C1 * t6;
+    t4 = t0 + t8;
+    t3 = t2 + t7;
+    t10 = t1 + t5;
+    t13 = t11 - t9;
+    t12 = t1 - t5;
+    t14 = t11 + t9;
+    t6 = C122 * t4;
+    t0 = C123 * t3;
+    t8 = t6 + t0;
+    y[54] = 0;
+    t2 = (-0.065187570450821) * t8;
+    y[425] = t2;
+    t7 = (-C123) * t4;
+    t1 = C122 * t3;
+    t5 = t7 + t1;
+    t11 = 0.06391811564460889 * t5;
+    y[534] = t11;
+    t9 = (-0.003452223749770549) * t5;
+    y[905] = t9;
+    t6 = (-C124) * t10;
+    t0 = (-C125) * t13;
+    t8 = t6 + t0;
+    t2 = 0.06377706421929838 * t8;
+    y[585] = t2;
+    t4 = (-0.007089347087212765) * t8;
+    y[854] = t4;
+    t3 = C125 * t10;
+    t7 = (-C124) * t13;
+    t1 = t3 + t7;
+    y[105] = 0;
+    t11 = (-0.0653317413974955) * t1;
+    y[374] = t11;
+    t5 = C126 * t12;
+    t9 = C127 * t14;
+    t6 = t5 + t9;
+    t0 = 0.014751444591647385 * t6;
+    y[214] = t0;
+    t2 = (-0.05493452772666063) * t6;
+    y[265] = t2;
+    t8 = (-C127) * t12;
+    t4 = C126 * t14;
+    t10 = t8 + t4;
+    t13 = 0.06535061848860482 * t10;
+    y[694] = t13;
+    t3 = 0.039091852988859394 * t10;
+    y[745] = t3;
+    t7 = re[159];
+    t1 = im[159];
+    t11 = re[239];
+    t5 = im[239];
+    t9 = re[79];
+    t0 = im[79];
+    t6 = t11 + t9;
+    t2 = t5 + t0;
+    t12 = C0 * t6;
+    t14 = t7 - t12;
+    t8 = C0 * t2;
+    t4 = t1 - t8;
+    t13 = t11 - t9;
+    t10 = C1 * t13;
+    t3 = t5 - t0;
+    t12 = C1 * t3;
+    t8 = t7 + t6;
+    t11 = t1 + t2;
+    t9 = t14 + t12;
+    t13 = t4 - t10;
+    t5 = t14 - t12;
+    t0 = t4 + t10;
+    t3 = C128 * t8;
+    t7 = C129 * t11;
+    t6 = t3 + t7;
+    t1 = 0.016312759798310757 * t6;
+    y[216] = t1;
+    t2 = (-0.05389537209194186) * t6;
+    y[263] = t2;
+    t14 = (-C129) * t8;
+    t12 = C128 * t11;
+    t4 = t14 + t12;
+    t10 = 0.06501374318100199 * t4;
+    y[696] = t10;
+    t3 = 0.0406262824335368 * t4;
+    y[743] = t3;
+    t7 = C130 * t9;
+    t1 = C131 * t13;
+    t6 = t7 + t1;
+    y[56] = 0;
+    t2 = (-0.0651906732319496) * t6;
+    y[423] = t2;
+    t8 = (-C131) * t9;
+    t11 = C130 * t13;
+    t14 = t8 + t11;
+    t12 = 0.06391507343146448 * t14;
+    y[536] = t12;
+    t10 = (-0.0036826411595666368) * t14;
+    y[903] = t10;
+    t4 = (-C132) * t5;
+    t3 = (-C133) * t0;
+    t7 = t4 + t3;
+    t1 = 0.06378595726136826 * t7;
+    y[583] = t1;
+    t6 = (-0.007121292166469594) * t7;
+    y[856] = t6;
+    t2 = C133 * t5;
+    t9 = (-C132) * t0;
+    t13 = t2 + t9;
+    y[103] = 0;
+    t8 = (-0.06532263284210665) * t13;
+    y[376] = t8;
+    t11 = re[27];
+    t12 = im[27];
+    t14 = re[107];
+    t10 = im[107];
+    t4 = re[187];
+    t3 = im[187];
+    t1 = t14 + t4;
+    t7 = t10 + t3;
+    t6 = C0 * t1;
+    t5 = t11 - t6;
+    t0 = C0 * t7;
+    t2 = t12 - t0;
+    t9 = t14 - t4;
+    t13 = C1 * t9;
+    t8 = t10 - t3;
+    t6 = C1 * t8;
+    t0 = t11 + t1;
+    t14 = t12 + t7;
+    t4 = t5 + t6;
+    t9 = t2 - t13;
+    t10 = t5 - t6;
+    t3 = t2 + t13;
+    t8 = (-C134) * t0;
+    t11 = (-C135) * t14;
+    t1 = t8 + t11;
+    t12 = 0.06379518584601195 * t1;
+    y[581] = t12;
+    t7 = (-0.0071333021455818576) * t1;
+    y[858] = t7;
+    t5 = C135 * t0;
+    t6 = (-C134) * t14;
+    t2 = t5 + t6;
+    y[101] = 0;
+    t13 = (-0.06531318329762556) * t2;
+    y[378] = t13;
+    t8 = C136 * t4;
+    t11 = C137 * t9;
+    t12 = t8 + t11;
+    t1 = 0.017930354041316373 * t12;
+    y[218] = t1;
+    t7 = (-0.05278557016376946) * t12;
+    y[261] = t7;
+    t0 = (-C137) * t4;
+    t14 = C136 * t9;
+    t5 = t0 + t14;
+    t6 = 0.06461949818589519 * t5;
+    y[698] = t6;
+    t2 = 0.04214582765550592 * t5;
+    y[741] = t2;
+    t13 = C138 * t10;
+    t8 = C139 * t3;
+    t11 = t13 + t8;
+    y[58] = 0;
+    t1 = (-0.06519322000115729) * t11;
+    y[421] = t1;
+    t12 = (-C139) * t10;
+    t7 = C138 * t3;
+    t4 = t12 + t7;
+    t9 = 0.0639125765929755 * t4;
+    y[538] = t9;
+    t0 = (-0.003914112644701813) * t4;
+    y[901] = t0;
+    t14 = re[135];
+    t6 = im[135];
+    t5 = re[215];
+    t2 = im[215];
+    t13 = re[55];
+    t8 = im[55];
+    t11 = t5 + t13;
+    t1 = t2 + t8;
+    t10 = C0 * t11;
+    t3 = t14 - t10;
+    t12 = C0 * t1;
+    t7 = t6 - t12;
+    t9 = t5 - t13;
+    t4 = C1 * t9;
+    t0 = t2 - t8;
+    t10 = C1 * t0;
+    t12 = t14 + t11;
+    t5 = t6 + t1;
+    t13 = t3 + t10;
+    t9 = t7 - t4;
+    t2 = t3 - t10;
+    t8 = t7 + t4;
+    t0 = C140 * t12;
+    t14 = C141 * t5;
+    t11 = t0 + t14;
+    y[60] = 0;
+    t6 = (-0.06519537224889435) * t11;
+    y[419] = t6;
+    t1 = (-C141) * t12;
+    t3 = C140 * t5;
+    t10 = t1 + t3;
+    t7 = 0.06391046669324492 * t10;
+    y[540] = t7;
+    t4 = (-0.00414557911234842) * t10;
+    y[899] = t4;
+    t0 = (-C142) * t13;
+    t14 = (-C143) * t9;
+    t11 = t0 + t14;
+    t6 = 0.06380456147299418 * t11;
+    y[579] = t6;
+    t12 = (-0.007126113859786178) * t11;
+    y[860] = t12;
+    t5 = C143 * t13;
+    t1 = (-C142) * t9;
+    t3 = t5 + t1;
+    y[99] = 0;
+    t7 = (-0.06530358598938484) * t3;
+    y[380] = t7;
+    t10 = C144 * t2;
+    t4 = C145 * t8;
+    t0 = t10 + t4;
+    t14 = 0.019597325760166824 * t0;
+    y[220] = t14;
+    t6 = (-0.05160544713305959) * t0;
+    y[259] = t6;
+    t11 = (-C145) * t2;
+    t12 = C144 * t8;
+    t13 = t11 + t12;
+    t9 = 0.064166020687882 * t13;
+    y[700] = t9;
+    t5 = 0.04364628566097206 * t13;
+    y[739] = t5;
+    t1 = re[3];
+    t3 = im[3];
+    t7 = re[83];
+    t10 = im[83];
+    t4 = re[163];
+    t14 = im[163];
+    t0 = t7 + t4;
+    t6 = t10 + t14;
+    t2 = C0 * t0;
+    t8 = t1 - t2;
+    t11 = C0 * t6;
+    t12 = t3 - t11;
+    t9 = t7 - t4;
+    t13 = C1 * t9;
+    t5 = t10 - t14;
+    t2 = C1 * t5;
+    t11 = t1 + t0;
+    t7 = t3 + t6;
+    t4 = t8 + t2;
+    t9 = t12 - t13;
+    t10 = t8 - t2;
+    t14 = t12 + t13;
+    t5 = C146 * t11;
+    t1 = C147 * t7;
+    t0 = t5 + t1;
+    t3 = 0.021306338484103477 * t0;
+    y[222] = t3;
+    t6 = (-0.05035612752637894) * t0;
+    y[257] = t6;
+    t8 = (-C147) * t11;
+    t2 = C146 * t7;
+    t12 = t8 + t2;
+    t13 = 0.06365161549822701 * t12;
+    y[702] = t13;
+    t5 = 0.04512355795413753 * t12;
+    y[737] = t5;
+    t1 = C148 * t4;
+    t3 = C149 * t9;
+    t0 = t1 + t3;
+    y[62] = 0;
+    t6 = (-0.06519729623737117) * t0;
+    y[417] = t6;
+    t11 = (-C149) * t4;
+    t7 = C148 * t9;
+    t8 = t11 + t7;
+    t2 = 0.06390858067942896 * t8;
+    y[542] = t2;
+    t13 = (-0.004375801329143805) * t8;
+    y[897] = t13;
+    t12 = (-C150) * t10;
+    t5 = (-C151) * t14;
+    t1 = t12 + t5;
+    t3 = 0.06381399902660753 * t1;
+    y[577] = t3;
+    t0 = (-0.007100273596993801) * t1;
+    y[862] = t0;
+    t6 = C151 * t10;
+    t4 = (-C150) * t14;
+    t9 = t6 + t4;
+    y[97] = 0;
+    t11 = (-0.06529392813839101) * t9;
+    y[382] = t11;
+    t7 = re[126];
+    t2 = im[126];
+    t8 = re[206];
+    t13 = im[206];
+    t12 = re[46];
+    t5 = im[46];
+    t3 = t8 + t12;
+    t1 = t13 + t5;
+    t0 = C0 * t3;
+    t10 = t7 - t0;
+    t14 = C0 * t1;
+    t6 = t2 - t14;
+    t4 = t8 - t12;
+    t9 = C1 * t4;
+    t11 = t13 - t5;
+    t0 = C1 * t11;
+    t14 = t7 + t3;
+    t8 = t2 + t1;
+    t12 = t10 + t0;
+    t4 = t6 - t9;
+    t13 = t10 - t0;
+    t5 = t6 + t9;
+    t11 = (-C152) * t14;
+    t7 = (-C153) * t8;
+    t3 = t11 + t7;
+    t2 = 0.06382332027598772 * t3;
+    y[575] = t2;
+    t1 = (-0.007056159883489285) * t3;
+    y[864] = t1;
+    t10 = C153 * t14;
+    t0 = (-C152) * t8;
+    t6 = t10 + t0;
+    y[95] = 0;
+    t9 = (-0.06528439211010925) * t6;
+    y[384] = t9;
+    t11 = C154 * t12;
+    t7 = C155 * t4;
+    t2 = t11 + t7;
+    t3 = 0.023049975094085177 * t2;
+    y[224] = t3;
+    t1 = (-0.04903936486333267) * t2;
+    y[255] = t1;
+    t14 = (-C155) * t12;
+    t8 = C154 * t4;
+    t10 = t14 + t8;
+    t0 = 0.06307476894193742 * t10;
+    y[704] = t0;
+    t6 = 0.04657358866856538 * t10;
+    y[735] = t6;
+    t9 = C156 * t13;
+    t11 = C157 * t5;
+    t7 = t9 + t11;
+    y[64] = 0;
+    t3 = (-0.06519914488456442) * t7;
+    y[415] = t3;
+    t2 = (-C157) * t13;
+    t1 = C156 * t5;
+    t12 = t2 + t1;
+    t4 = 0.06390676862470789 * t12;
+    y[544] = t4;
+    t14 = (-0.004603664429274723) * t12;
+    y[895] = t14;
+    t8 = re[234];
+    t0 = im[234];
+    t10 = re[74];
+    t6 = im[74];
+    t9 = re[154];
+    t11 = im[154];
+    t7 = t10 + t9;
+    t3 = t6 + t11;
+    t13 = C0 * t7;
+    t5 = t8 - t13;
+    t2 = C0 * t3;
+    t1 = t0 - t2;
+    t4 = t10 - t9;
+    t12 = C1 * t4;
+    t14 = t6 - t11;
+    t13 = C1 * t14;
+    t2 = t8 + t7;
+    t10 = t0 + t3;
+    t9 = t5 + t13;
+    t4 = t1 - t12;
+    t6 = t5 - t13;
+    t11 = t1 + t12;
+    t14 = C158 * t2;
+    t8 = C159 * t10;
+    t7 = t14 + t8;
+    y[66] = 0;
+    t0 = (-0.065201058182397) * t7;
+    y[413] = t0;
+    t3 = (-C159) * t2;
+    t5 = C158 * t10;
+    t13 = t3 + t5;
+    t1 = 0.06390489330726203 * t13;
+    y[546] = t1;
+    t12 = (-0.004828163617283523) * t13;
+    y[893] = t12;
+    t14 = (-C160) * t9;
+    t8 = (-C161) * t4;
+    t7 = t14 + t8;
+    t0 = 0.06383246193490441 * t7;
+    y[573] = t0;
+    t2 = (-0.0069944183140304966) * t7;
+    y[866] = t2;
+    t10 = C161 * t9;
+    t3 = (-C160) * t4;
+    t5 = t10 + t3;
+    y[93] = 0;
+    t1 = (-0.06527504251544898) * t5;
+    y[386] = t1;
+    t13 = C162 * t6;
+    t12 = C163 * t11;
+    t14 = t13 + t12;
+    t8 = 0.024820480698015124 * t14;
+    y[226] = t8;
+    t0 = (-0.04765724470703279) * t14;
+    y[253] = t0;
+    t7 = (-C163) * t6;
+    t2 = C162 * t11;
+    t9 = t7 + t2;
+    t4 = 0.06243485865874562 * t9;
+    y[706] = t4;
+    t10 = 0.0479923553379481 * t9;
+    y[733] = t10;
+    t3 = re[102];
+    t5 = im[102];
+    t1 = re[182];
+    t13 = im[182];
+    t12 = re[22];
+    t8 = im[22];
+    t14 = t1 + t12;
+    t0 = t13 + t8;
+    t6 = C0 * t14;
+    t11 = t3 - t6;
+    t7 = C0 * t0;
+    t2 = t5 - t7;
+    t4 = t1 - t12;
+    t9 = C1 * t4;
+    t10 = t13 - t8;
+    t6 = C1 * t10;
+    t7 = t3 + t14;
+    t1 = t5 + t0;
+    t12 = t11 + t6;
+    t4 = t2 - t9;
+    t13 = t11 - t6;
+    t8 = t2 + t9;
+    t10 = C164 * t7;
+    t3 = C165 * t1;
+    t14 = t10 + t3;
+    t5 = 0.02661009304738782 * t14;
+    y[228] = t5;
+    t0 = (-0.04621244968025226) * t14;
+    y[251] = t0;
+    t11 = (-C165) * t7;
+    t6 = C164 * t1;
+    t2 = t11 + t6;
+    t9 = 0.061731500412022404 * t2;
+    y[708] = t9;
+    t10 = 0.049376107323254634 * t2;
+    y[731] = t10;
+    t3 = C166 * t12;
+    t5 = C167 * t4;
+    t14 = t3 + t5;
+    y[68] = 0;
+    t0 = (-0.06520317390295996) * t14;
+    y[411] = t0;
+    t7 = (-C167) * t12;
+    t1 = C166 * t4;
+    t11 = t7 + t1;
+    t6 = 0.06390281971346669 * t11;
+    y[548] = t6;
+    t9 = (-0.005048247514688653) * t11;
+    y[891] = t9;
+    t2 = (-C168) * t13;
+    t10 = (-C169) * t8;
+    t3 = t2 + t10;
+    t5 = 0.06384127617852932 * t3;
+    y[571] = t5;
+    t14 = (-0.006915743100063547) * t3;
+    y[868] = t14;
+    t0 = C169 * t13;
+    t12 = (-C168) * t8;
+    t4 = t0 + t12;
+    y[91] = 0;
+    t7 = (-0.06526603031892354) * t4;
+    y[388] = t7;
+    t1 = re[210];
+    t6 = im[210];
+    t11 = re[50];
+    t9 = im[50];
+    t2 = re[130];
+    t10 = im[130];
+    t5 = t11 + t2;
+    t3 = t9 + t10;
+    t14 = C0 * t5;
+    t13 = t1 - t14;
+    t8 = C0 * t3;
+    t0 = t6 - t8;
+    t12 = t11 - t2;
+    t4 = C1 * t12;
+    t7 = t9 - t10;
+    t14 = C1 * t7;
+    t8 = t1 + t5;
+    t11 = t6 + t3;
+    t2 = t13 + t14;
+    t12 = t0 - t4;
+    t9 = t13 - t14;
+    t10 = t0 + t4;
+    t7 = (-C170) * t8;
+    t1 = (-C171) * t11;
+    t5 = t7 + t1;
+    t6 = 0.0638496916804613 * t5;
+    y[569] = t6;
+    t3 = (-0.006820884210795256) * t5;
+    y[870] = t3;
+    t13 = C171 * t8;
+    t14 = (-C170) * t11;
+    t0 = t13 + t14;
+    y[89] = 0;
+    t4 = (-0.06525742814106196) * t0;
+    y[390] = t4;
+    t7 = C172 * t2;
+    t1 = C173 * t12;
+    t6 = t7 + t1;
+    t5 = 0.02841105565325448 * t6;
+    y[230] = t5;
+    t3 = (-0.0447084089204744) * t6;
+    y[249] = t3;
+    t8 = (-C173) * t2;
+    t11 = C172 * t12;
+    t13 = t8 + t11;
+    t14 = 0.060964555912742815 * t13;
+    y[710] = t14;
+    t0 = 0.05072104285218912 * t13;
+    y[729] = t0;
+    t4 = C174 * t9;
+    t7 = C175 * t10;
+    t1 = t4 + t7;
+    y[70] = 0;
+    t5 = (-0.06520562062851128) * t1;
+    y[409] = t5;
+    t6 = (-C175) * t9;
+    t3 = C174 * t10;
+    t2 = t6 + t3;
+    t12 = 0.06390042187321478 * t2;
+    y[550] = t12;
+    t8 = (-0.005262715635805177) * t2;
+    y[889] = t8;
+    t11 = re[93];
+    t14 = im[93];
+    t13 = re[173];
+    t0 = im[173];
+    t4 = re[13];
+    t7 = im[13];
+    t1 = t13 + t4;
+    t5 = t0 + t7;
+    t9 = C0 * t1;
+    t10 = t11 - t9;
+    t6 = C0 * t5;
+    t3 = t14 - t6;
+    t12 = t13 - t4;
+    t2 = C1 * t12;
+    t8 = t0 - t7;
+    t9 = C1 * t8;
+    t6 = t11 + t1;
+    t13 = t14 + t5;
+    t4 = t10 + t9;
+    t12 = t3 - t2;
+    t0 = t10 - t9;
+    t7 = t3 + t2;
+    t8 = C176 * t6;
+    t11 = C177 * t13;
+    t1 = t8 + t11;
+    y[72] = 0;
+    t14 = (-0.06520849030508319) * t1;
+    y[407] = t14;
+    t5 = (-C177) * t6;
+    t10 = C176 * t13;
+    t9 = t5 + t10;
+    t3 = 0.06389760976174391 * t9;
+    y[552] = t3;
+    t2 = (-0.005470414012410816) * t9;
+    y[887] = t2;
+    t8 = (-C178) * t4;
+    t11 = (-C179) * t12;
+    t1 = t8 + t11;
+    t14 = 0.0638576174456411 * t1;
+    y[567] = t14;
+    t6 = (-0.006710565627511057) * t1;
+    y[872] = t6;
+    t13 = C179 * t4;
+    t5 = (-C178) * t12;
+    t10 = t13 + t5;
+    y[87] = 0;
+    t3 = (-0.06524932863669004) * t10;
+    y[392] = t3;
+    t9 = C180 * t0;
+    t2 = C181 * t7;
+    t8 = t9 + t2;
+    t11 = 0.0302158355175465 * t8;
+    y[232] = t11;
+    t14 = (-0.04314901382665701) * t8;
+    y[247] = t14;
+    t1 = (-C181) * t0;
+    t6 = C180 * t7;
+    t4 = t1 + t6;
+    t12 = 0.0601342793375864 * t4;
+    y[712] = t12;
+    t13 = 0.05202344363968648 * t4;
+    y[727] = t13;
+    t5 = re[201];
+    t10 = im[201];
+    t3 = re[41];
+    t9 = im[41];
+    t2 = re[121];
+    t11 = im[121];
+    t8 = t3 + t2;
+    t14 = t9 + t11;
+    t0 = C0 * t8;
+    t7 = t5 - t0;
+    t1 = C0 * t14;
+    t6 = t10 - t1;
+    t12 = t3 - t2;
+    t4 = C1 * t12;
+    t13 = t9 - t11;
+    t0 = C1 * t13;
+    t1 = t5 + t8;
+    t3 = t10 + t14;
+    t2 = t7 + t0;
+    t12 = t6 - t4;
+    t9 = t7 - t0;
+    t11 = t6 + t4;
+    t13 = C182 * t1;
+    t5 = C183 * t3;
+    t8 = t13 + t5;
+    t10 = 0.03201671445207391 * t8;
+    y[234] = t10;
+    t14 = (-0.04153890356165323) * t8;
+    y[245] = t14;
+    t7 = (-C183) * t1;
+    t0 = C182 * t3;
+    t6 = t7 + t0;
+    t4 = 0.059241318192135656 * t6;
+    y[714] = t4;
+    t13 = 0.05327989747267351 * t6;
+    y[725] = t13;
+    t5 = C184 * t2;
+    t10 = C185 * t12;
+    t8 = t5 + t10;
+    y[74] = 0;
+    t14 = (-0.06521187027677731) * t8;
+    y[405] = t14;
+    t1 = (-C185) * t2;
+    t3 = C184 * t12;
+    t7 = t1 + t3;
+    t0 = 0.06389429790898767 * t7;
+    y[554] = t0;
+    t4 = (-0.005670289327193386) * t7;
+    y[885] = t4;
+    t6 = (-C186) * t9;
+    t13 = (-C187) * t11;
+    t5 = t6 + t13;
+    t10 = 0.06386500273552757 * t5;
+    y[565] = t10;
+    t8 = (-0.006585380010483377) * t5;
+    y[874] = t8;
+    t14 = C187 * t9;
+    t2 = (-C186) * t11;
+    t12 = t14 + t2;
+    y[85] = 0;
+    t1 = (-0.06524178326463587) * t12;
+    y[394] = t1;
+    t3 = re[69];
+    t0 = im[69];
+    t7 = re[149];
+    t4 = im[149];
+    t6 = re[229];
+    t13 = im[229];
+    t10 = t7 + t6;
+    t5 = t4 + t13;
+    t8 = C0 * t10;
+    t9 = t3 - t8;
+    t11 = C0 * t5;
+    t14 = t0 - t11;
+    t2 = t7 - t6;
+    t12 = C1 * t2;
+    t1 = t4 - t13;
+    t8 = C1 * t1;
+    t11 = t3 + t10;
+    t7 = t0 + t5;
+    t6 = t9 + t8;
+    t2 = t14 - t12;
+    t4 = t9 - t8;
+    t13 = t14 + t12;
+    t1 = (-C188) * t11;
+    t3 = (-C189) * t7;
+    t10 = t1 + t3;
+    t0 = 0.06387177041854285 * t10;
+    y[563] = t0;
+    t5 = (-0.006446110398363828) * t10;
+    y[876] = t5;
+    t9 = C189 * t11;
+    t8 = (-C188) * t7;
+    t14 = t9 + t8;
+    y[83] = 0;
+    t12 = (-0.06523487041870103) * t14;
+    y[396] = t12;
+    t1 = C190 * t6;
+    t3 = C191 * t2;
+    t0 = t1 + t3;
+    t10 = 0.03380639052821035 * t0;
+    y[236] = t10;
+    t5 = (-0.03988296034010127) * t0;
+    y[243] = t5;
+    t11 = (-C191) * t6;
+    t7 = C190 * t2;
+    t9 = t11 + t7;
+    t8 = 0.05828679646399605 * t9;
+    y[716] = t8;
+    t14 = 0.054487232921376444 * t9;
+    y[723] = t14;
+    t12 = C192 * t4;
+    t1 = C193 * t13;
+    t3 = t12 + t1;
+    y[76] = 0;
+    t10 = (-0.06521584229853827) * t3;
+    y[403] = t10;
+    t0 = (-C193) * t4;
+    t5 = C192 * t13;
+    t6 = t0 + t5;
+    t2 = 0.06389040637691885 * t6;
+    y[556] = t2;
+    t11 = (-0.005861380284618081) * t6;
+    y[883] = t11;
+}
+
+/**
+ *  Part 9 of ApplyWindowedIMDCT_W10_480().
+ * 
+ *  @param {Number[]} X 
+ *    - The input block (480 points).
+ *  @param {Number[]} y 
+ *    - The array that would contain the output block (960 points).
+ *  @param {Number[]} re 
+ *    - The scratch buffer (real part, 240 points).
+ *  @param {Number[]} im 
+ *    - The scratch buffer (imaginary part, 240 points).
+ */
+function ApplyWindowedIMDCT_W10_480_Part9(X, y, re, im) {
+    let t0, t1, t10, t11, t12, t13, t14, t2, t3, t4, t5, t6, t7, t8, t9;
+    const C0 = 0.5;
+    const C1 = 0.8660254037844386;
+    const C2 = 0.5042450512713892;
+    const C3 = 0.8635606106512236;
+    const C4 = 0.8684693294592216;
+    const C5 = 0.49574290089586764;
+    const C6 = 0.00490871880799799;
+    const C7 = 0.9999879521672569;
+    t7 = re[177];
+    t8 = im[177];
+    t9 = re[17];
+    t14 = im[17];
+    t12 = re[97];
+    t1 = im[97];
+    t3 = t9 + t12;
+    t10 = t14 + t1;
+    t4 = C0 * t3;
+    t13 = t7 - t4;
+    t0 = C0 * t10;
+    t5 = t8 - t0;
+    t2 = t9 - t12;
+    t6 = C1 * t2;
+    t11 = t14 - t1;
+    t4 = C1 * t11;
+    t0 = t7 + t3;
+    t9 = t8 + t10;
+    t12 = t13 + t4;
+    t2 = t5 - t6;
+    t14 = t13 - t4;
+    t1 = t5 + t6;
+    t11 = C2 * t0;
+    t7 = C3 * t9;
+    t3 = t11 + t7;
+    y[78] = 0;
+    t8 = (-0.06522043507348492) * t3;
+    y[401] = t8;
+    t10 = (-C3) * t0;
+    t13 = C2 * t9;
+    t4 = t10 + t13;
+    t5 = 0.06388590726161235 * t4;
+    y[558] = t5;
+    t6 = (-0.00604264983245425) * t4;
+    y[881] = t6;
+    t11 = (-C4) * t12;
+    t7 = (-C5) * t2;
+    t3 = t11 + t7;
+    t8 = 0.06387791227672637 * t3;
+    y[561] = t8;
+    t0 = (-0.006293781659289501) * t3;
+    y[878] = t0;
+    t9 = C5 * t12;
+    t10 = (-C4) * t2;
+    t13 = t9 + t10;
+    y[81] = 0;
+    t5 = (-0.06522859808905766) * t13;
+    y[398] = t5;
+    t4 = C6 * t14;
+    t6 = C7 * t1;
+    t11 = t4 + t6;
+    t7 = 0.03557789088350688 * t11;
+    y[238] = t7;
+    t8 = (-0.03818632213439032) * t11;
+    y[241] = t8;
+    t3 = (-C7) * t14;
+    t0 = C6 * t1;
+    t12 = t3 + t0;
+    t2 = 0.057272384837089046 * t12;
+    y[718] = t2;
+    t9 = 0.05564256004817251 * t12;
+    y[721] = t9;
+}
+
+//
+//  Public functions.
+//
+
+/**
+ *  Apply LD-MDCT transform (prebuilt for window W10_480).
+ * 
+ *  Note(s):
+ *    [1] X[k] = SUM(w[n] * x[n] * cos(PI / 480 * (n + 240.5) * (k + 0.5))), where
+ *        w[n] = sqrt(2 / 480) * W10_480[n].
+ *    [2] The size of all arrays will not be checked.
+ * 
+ *  @param {Number[]} x 
+ *    - The input block (960 points).
+ *  @param {Number[]} X 
+ *    - The array that would contain the output block (480 points).
+ *  @param {Number[]} re 
+ *    - The scratch buffer (real part, 240 points).
+ *  @param {Number[]} im 
+ *    - The scratch buffer (imaginary part, 240 points).
+ */
+function ApplyWindowedMDCT_W10_480(x, X, re, im) {
+    ApplyWindowedMDCT_W10_480_Part1(x, X, re, im);
+    ApplyWindowedMDCT_W10_480_Part2(x, X, re, im);
+    ApplyWindowedMDCT_W10_480_Part3(x, X, re, im);
+    ApplyWindowedMDCT_W10_480_Part4(x, X, re, im);
+    ApplyWindowedMDCT_W10_480_Part5(x, X, re, im);
+    ApplyWindowedMDCT_W10_480_Part6(x, X, re, im);
+    ApplyWindowedMDCT_W10_480_Part7(x, X, re, im);
+    ApplyWindowedMDCT_W10_480_Part8(x, X, re, im);
+}
+
+/**
+ *  Apply LD-IMDCT transform (prebuilt for window W10_480).
+ * 
+ *  Note(s):
+ *    [1] y[n] = w[n] * SUM(X[k] * cos(PI / 480 * (n + 240.5) * (k + 0.5))), where
+ *        w[n] = sqrt(2 / 480) * W10_480[959 - n].
+ *    [2] The size of all arrays will not be checked.
+ * 
+ *  @param {Number[]} X 
+ *    - The input block (480 points).
+ *  @param {Number[]} y 
+ *    - The array that would contain the output block (960 points).
+ *  @param {Number[]} re 
+ *    - The scratch buffer (real part, 240 points).
+ *  @param {Number[]} im 
+ *    - The scratch buffer (imaginary part, 240 points).
+ */
+function ApplyWindowedIMDCT_W10_480(X, y, re, im) {
+    ApplyWindowedIMDCT_W10_480_Part1(X, y, re, im);
+    ApplyWindowedIMDCT_W10_480_Part2(X, y, re, im);
+    ApplyWindowedIMDCT_W10_480_Part3(X, y, re, im);
+    ApplyWindowedIMDCT_W10_480_Part4(X, y, re, im);
+    ApplyWindowedIMDCT_W10_480_Part5(X, y, re, im);
+    ApplyWindowedIMDCT_W10_480_Part6(X, y, re, im);
+    ApplyWindowedIMDCT_W10_480_Part7(X, y, re, im);
+    ApplyWindowedIMDCT_W10_480_Part8(X, y, re, im);
+    ApplyWindowedIMDCT_W10_480_Part9(X, y, re, im);
+}
+
+//  Export public APIs.
+module.exports = {
+    "ApplyWindowedMDCT_W10_480": ApplyWindowedMDCT_W10_480,
+    "ApplyWindowedIMDCT_W10_480": ApplyWindowedIMDCT_W10_480
+};
\ No newline at end of file
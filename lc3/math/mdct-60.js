@@ -0,0 +1,2997 @@
+//
+//  Copyright 2021 - 2023 XiaoJSoft Studio. All rights reserved.
+//  Use of this source code is governed by a BSD-style license that can be
+//  found in the LICENSE.md file.
+//
+
+//
+//  Note(s):
+//    [1] This file is generated automatically by a MDCT compiler, which locates 
+//        at "./../../dev/mdct-generator/" directory.
+//        Do NOT modify this file manually.
+//
+
+//
+//  Public functions.
+//
+
+/**
+ *  Apply LD-MDCT transform (prebuilt for window W75_60).
+ * 
+ *  Note(s):
+ *    [1] X[k] = SUM(w[n] * x[n] * cos(PI / 60 * (n + 30.5) * (k + 0.5))), where
+ *        w[n] = sqrt(2 / 60) * W75_60[n].
+ *    [2] The size of all arrays will not be checked.
+ * 
+ *  @param {Number[]} x 
+ *    - The input block (120 points).
+ *  @param {Number[]} X 
+ *    - The array that would contain the output block (60 points).
+ *  @param {Number[]} re 
+ *    - The scratch buffer (real part, 30 points).
+ *  @param {Number[]} im 
+ *    - The scratch buffer (imaginary part, 30 points).
+ */
+function ApplyWindowedMDCT_W75_60(x, X, re, im) {
+    let t0, t1, t10, t11, t12, t13, t14, t2, t3, t4, t5, t6, t7, t8, t9;
+    const C0 = 0.9510565162951535;
+    const C1 = 0.3090169943749474;
+    const C2 = 0.5877852522924731;
+    const C3 = 0.8090169943749475;
+    const C4 = 0.5590169943749475;
+    const C5 = 0.25;
+    const C6 = 0.49999999999999994;
+    const C7 = 0.8660254037844387;
+    const C8 = 0.6691306063588582;
+    const C9 = 0.7431448254773942;
+    const C10 = 0.40673664307580015;
+    const C11 = 0.9135454576426009;
+    const C12 = 0.10452846326765346;
+    const C13 = 0.9945218953682733;
+    const C14 = 0.9781476007338057;
+    const C15 = 0.20791169081775931;
+    const C16 = 0.5;
+    const C17 = 0.8660254037844386;
+    const C18 = 0.45399049973954675;
+    const C19 = 0.8910065241883679;
+    const C20 = 0.15643446504023087;
+    const C21 = 0.9876883405951378;
+    const C22 = 0.25881904510252074;
+    const C23 = 0.9659258262890683;
+    const C24 = 0.9986295347545738;
+    const C25 = 0.05233595624294383;
+    const C26 = 0.9335804264972017;
+    const C27 = 0.35836794954530027;
+    const C28 = 0.6293203910498375;
+    const C29 = 0.7771459614569709;
+    const C30 = 0.544639035015027;
+    const C31 = 0.838670567945424;
+    const C32 = 0.999914327574007;
+    const C33 = 0.01308959557134444;
+    const C34 = 0.6977904598416801;
+    const C35 = 0.7163019434246544;
+    const C36 = 0.6593458151000688;
+    const C37 = 0.7518398074789774;
+    const C38 = 0.9978589232386035;
+    const C39 = 0.06540312923014306;
+    const C40 = 0.9930684569549263;
+    const C41 = 0.11753739745783764;
+    const C42 = 0.619093949309834;
+    const C43 = 0.785316930880745;
+    const C44 = 0.5771451900372336;
+    const C45 = 0.8166415551616789;
+    const C46 = 0.9855560590580777;
+    const C47 = 0.1693495038490246;
+    const C48 = 0.9753423205085127;
+    const C49 = 0.22069743502150108;
+    const C50 = 0.5336145159156115;
+    const C51 = 0.8457278217039733;
+    const C52 = 0.4886212414969549;
+    const C53 = 0.8724960070727972;
+    const C54 = 0.9624552364536473;
+    const C55 = 0.27144044986507426;
+    const C56 = 0.9469301294951057;
+    const C57 = 0.3214394653031616;
+    const C58 = 0.4422886902190013;
+    const C59 = 0.8968727415326883;
+    const C60 = 0.39474385638426723;
+    const C61 = 0.9187912101488983;
+    const C62 = 0.9288095528719242;
+    const C63 = 0.3705574375098362;
+    const C64 = 0.9081431738250813;
+    const C65 = 0.41865973753742813;
+    const C66 = 0.34611705707749296;
+    const C67 = 0.9381913359224842;
+    const C68 = 0.296541574975571;
+    const C69 = 0.9550199444571866;
+    const C70 = 0.8849876374630419;
+    const C71 = 0.4656145203251114;
+    const C72 = 0.8594064115014527;
+    const C73 = 0.5112930860770522;
+    const C74 = 0.24615329302899303;
+    const C75 = 0.9692309097067544;
+    const C76 = 0.19509032201612825;
+    const C77 = 0.9807852804032304;
+    const C78 = 0.8314696123025452;
+    const C79 = 0.5555702330196022;
+    const C80 = 0.8012538126910607;
+    const C81 = 0.598324600570659;
+    const C82 = 0.1434926219911793;
+    const C83 = 0.9896513868196702;
+    const C84 = 0.09150161866340238;
+    const C85 = 0.9958049275746618;
+    const C86 = 0.7688418320734596;
+    const C87 = 0.6394390019805847;
+    const C88 = 0.7343225094356856;
+    const C89 = 0.6788007455329417;
+    const C90 = 0.03925981575906861;
+    const C91 = 0.9992290362407229;
+    t0 = x[89];
+    t0 = 0.0982976711328055 * t0;
+    t1 = x[90];
+    t1 = 0.08961357286597628 * t1;
+    t0 = t0 + t1;
+    t1 = x[29];
+    t1 = 0.17501560311188089 * t1;
+    t2 = x[30];
+    t2 = 0.1795521666768575 * t2;
+    t1 = t1 - t2;
+    t2 = -t0;
+    t3 = x[77];
+    t3 = 0.17169091623594895 * t3;
+    t4 = x[102];
+    t4 = 0.007157471297881811 * t4;
+    t3 = t3 + t4;
+    t4 = x[17];
+    t4 = 0.08524478525982011 * t4;
+    t5 = x[42];
+    t5 = 0.19059363737433666 * t5;
+    t4 = t4 - t5;
+    t5 = (-C0) * t3;
+    t6 = C1 * t4;
+    t5 = t5 + t6;
+    t6 = C1 * t3;
+    t3 = C0 * t4;
+    t4 = t6 + t3;
+    t6 = x[65];
+    t3 = x[5];
+    t3 = 0.00928005057681454 * t3;
+    t7 = x[54];
+    t7 = 0.18076208847396763 * t7;
+    t3 = t3 - t7;
+    t7 = (-0.14918633311605745) * t6;
+    t8 = C2 * t3;
+    t7 = t7 + t8;
+    t8 = 0.10839021560599026 * t6;
+    t6 = C3 * t3;
+    t3 = t8 + t6;
+    t8 = x[6];
+    t6 = 0.012683361002319041 * t8;
+    t8 = x[53];
+    t8 = 0.18071605760518256 * t8;
+    t6 = t6 - t8;
+    t8 = x[66];
+    t9 = C2 * t6;
+    t10 = (-0.14922433292977172) * t8;
+    t9 = t9 + t10;
+    t10 = (-C3) * t6;
+    t6 = (-0.10841782408670995) * t8;
+    t8 = t10 + t6;
+    t10 = x[18];
+    t6 = 0.09387697006672642 * t10;
+    t10 = x[41];
+    t10 = 0.19182978437059417 * t10;
+    t6 = t6 - t10;
+    t10 = x[78];
+    t10 = 0.1685085390983906 * t10;
+    t11 = x[101];
+    t11 = 0.010741469529411594 * t11;
+    t10 = t10 + t11;
+    t11 = C1 * t6;
+    t12 = (-C0) * t10;
+    t11 = t11 + t12;
+    t12 = (-C0) * t6;
+    t6 = (-C1) * t10;
+    t10 = t12 + t6;
+    t12 = t5 + t11;
+    t6 = t4 + t10;
+    t13 = t7 + t9;
+    t14 = t3 + t8;
+    t5 = t5 - t11;
+    t11 = t4 - t10;
+    t4 = t7 - t9;
+    t10 = t3 - t8;
+    t7 = t12 + t13;
+    t9 = t6 + t14;
+    t3 = t12 - t13;
+    t8 = C4 * t3;
+    t12 = t6 - t14;
+    t13 = C4 * t12;
+    t3 = C5 * t7;
+    t6 = t2 - t3;
+    t14 = C5 * t9;
+    t12 = t1 - t14;
+    t2 = t6 + t8;
+    t3 = t12 + t13;
+    t14 = t6 - t8;
+    t6 = t12 - t13;
+    t8 = C0 * t5;
+    t12 = C2 * t4;
+    t13 = t8 + t12;
+    t8 = C0 * t11;
+    t12 = C2 * t10;
+    t8 = t8 + t12;
+    t12 = C2 * t5;
+    t5 = C0 * t4;
+    t4 = t12 - t5;
+    t12 = C2 * t11;
+    t5 = C0 * t10;
+    t11 = t12 - t5;
+    t10 = t7 - t0;
+    t12 = t1 + t9;
+    t5 = t2 + t8;
+    t7 = t3 - t13;
+    t0 = t14 + t11;
+    t1 = t6 - t4;
+    t9 = t14 - t11;
+    t14 = t6 + t4;
+    t11 = t2 - t8;
+    t6 = t3 + t13;
+    re[0] = t10;
+    im[0] = t12;
+    re[6] = t5;
+    im[6] = t7;
+    re[12] = t0;
+    im[12] = t1;
+    re[18] = t9;
+    im[18] = t14;
+    re[24] = t11;
+    im[24] = t6;
+    t4 = x[69];
+    t2 = x[9];
+    t8 = 0.026486684544218566 * t2;
+    t3 = x[50];
+    t13 = 0.1814760310014786 * t3;
+    t10 = t8 - t13;
+    t12 = (-0.15907066790129484) * t4;
+    t5 = C6 * t10;
+    t7 = t12 + t5;
+    t0 = 0.09183949293298613 * t4;
+    t1 = C7 * t10;
+    t9 = t0 + t1;
+    t14 = x[2];
+    t11 = 0.0025139620716803624 * t14;
+    t6 = x[57];
+    t2 = 0.1815286107416681 * t6;
+    t3 = t11 - t2;
+    t8 = x[62];
+    t13 = C8 * t3;
+    t12 = (-0.13646055066125046) * t8;
+    t5 = t13 + t12;
+    t4 = (-C9) * t3;
+    t10 = (-0.12286963170250019) * t8;
+    t0 = t4 + t10;
+    t1 = x[14];
+    t14 = 0.060399898930011374 * t1;
+    t6 = x[45];
+    t11 = 0.18642008548431918 * t6;
+    t2 = t14 - t11;
+    t13 = x[74];
+    t12 = 0.1784907616084507 * t13;
+    t3 = x[105];
+    t8 = 0.0009779866716855938 * t3;
+    t4 = t12 + t8;
+    t10 = C10 * t2;
+    t1 = (-C11) * t4;
+    t6 = t10 + t1;
+    t14 = (-C11) * t2;
+    t11 = (-C10) * t4;
+    t13 = t14 + t11;
+    t3 = x[26];
+    t12 = 0.1578378803598341 * t3;
+    t8 = x[33];
+    t10 = 0.189403363756341 * t8;
+    t1 = t12 - t10;
+    t2 = x[86];
+    t4 = 0.12304348287400062 * t2;
+    t14 = x[93];
+    t11 = 0.06353660962653118 * t14;
+    t3 = t4 + t11;
+    t8 = C12 * t1;
+    t12 = (-C13) * t3;
+    t10 = t8 + t12;
+    t2 = (-C13) * t1;
+    t14 = (-C12) * t3;
+    t4 = t2 + t14;
+    t11 = x[81];
+    t8 = 0.1556703732653049 * t11;
+    t12 = x[98];
+    t1 = 0.026013269889367942 * t12;
+    t3 = t8 + t1;
+    t2 = x[21];
+    t14 = 0.11970860196080667 * t2;
+    t11 = x[38];
+    t12 = 0.19412377916603285 * t11;
+    t8 = t14 - t12;
+    t1 = (-C14) * t3;
+    t2 = C15 * t8;
+    t11 = t1 + t2;
+    t14 = C15 * t3;
+    t12 = C14 * t8;
+    t1 = t14 + t12;
+    t2 = t5 + t11;
+    t3 = t0 + t1;
+    t8 = t6 + t10;
+    t14 = t13 + t4;
+    t12 = t5 - t11;
+    t5 = t0 - t1;
+    t11 = t6 - t10;
+    t0 = t13 - t4;
+    t1 = t2 + t8;
+    t6 = t3 + t14;
+    t10 = t2 - t8;
+    t13 = C4 * t10;
+    t4 = t3 - t14;
+    t2 = C4 * t4;
+    t8 = C5 * t1;
+    t10 = t7 - t8;
+    t3 = C5 * t6;
+    t14 = t9 - t3;
+    t4 = t10 + t13;
+    t8 = t14 + t2;
+    t3 = t10 - t13;
+    t10 = t14 - t2;
+    t13 = C0 * t12;
+    t14 = C2 * t11;
+    t2 = t13 + t14;
+    t13 = C0 * t5;
+    t14 = C2 * t0;
+    t13 = t13 + t14;
+    t14 = C2 * t12;
+    t12 = C0 * t11;
+    t11 = t14 - t12;
+    t14 = C2 * t5;
+    t12 = C0 * t0;
+    t5 = t14 - t12;
+    t0 = t7 + t1;
+    t14 = t9 + t6;
+    t12 = t4 + t13;
+    t7 = t8 - t2;
+    t1 = t3 + t5;
+    t9 = t10 - t11;
+    t6 = t3 - t5;
+    t3 = t10 + t11;
+    t5 = t4 - t13;
+    t10 = t8 + t2;
+    re[10] = t0;
+    im[10] = t14;
+    re[16] = t12;
+    im[16] = t7;
+    re[22] = t1;
+    im[22] = t9;
+    re[28] = t6;
+    im[28] = t3;
+    re[4] = t5;
+    im[4] = t10;
+    t11 = x[10];
+    t4 = 0.03226289873076736 * t11;
+    t13 = x[49];
+    t8 = 0.1820829867240179 * t13;
+    t2 = t4 - t8;
+    t0 = x[70];
+    t14 = C6 * t2;
+    t12 = (-0.15854042147955094) * t0;
+    t7 = t14 + t12;
+    t1 = (-C7) * t2;
+    t9 = (-0.09153335501865544) * t0;
+    t6 = t1 + t9;
+    t3 = x[22];
+    t5 = 0.1280243755933322 * t3;
+    t10 = x[37];
+    t11 = 0.1941906114953003 * t10;
+    t13 = t5 - t11;
+    t4 = x[82];
+    t8 = 0.15023687820426296 * t4;
+    t14 = x[97];
+    t12 = 0.03248398647858071 * t14;
+    t2 = t8 + t12;
+    t0 = C15 * t13;
+    t1 = (-C14) * t2;
+    t9 = t0 + t1;
+    t3 = (-C14) * t13;
+    t10 = (-C15) * t2;
+    t5 = t3 + t10;
+    t11 = x[85];
+    t4 = 0.13058723471072306 * t11;
+    t14 = x[94];
+    t8 = 0.05517331833427295 * t14;
+    t12 = t4 + t8;
+    t0 = x[25];
+    t1 = 0.15102971789307787 * t0;
+    t13 = x[34];
+    t2 = 0.1914469104538762 * t13;
+    t3 = t1 - t2;
+    t10 = (-C13) * t12;
+    t11 = C12 * t3;
+    t14 = t10 + t11;
+    t4 = C12 * t12;
+    t8 = C13 * t3;
+    t0 = t4 + t8;
+    t13 = x[73];
+    t1 = x[13];
+    t2 = 0.05270936860113942 * t1;
+    t10 = x[46];
+    t11 = 0.1851314261879037 * t10;
+    t12 = t2 - t11;
+    t3 = (-0.16448593240915163) * t13;
+    t4 = C10 * t12;
+    t8 = t3 + t4;
+    t1 = 0.0732338554382753 * t13;
+    t10 = C11 * t12;
+    t2 = t1 + t10;
+    t11 = x[61];
+    t3 = x[1];
+    t4 = 0.001310044879130404 * t3;
+    t13 = x[58];
+    t12 = 0.18192406790224108 * t13;
+    t1 = t4 - t12;
+    t10 = (-0.13616391975079972) * t11;
+    t3 = C8 * t1;
+    t13 = t10 + t3;
+    t4 = 0.12260254403106659 * t11;
+    t12 = C9 * t1;
+    t10 = t4 + t12;
+    t3 = t9 + t13;
+    t11 = t5 + t10;
+    t1 = t14 + t8;
+    t4 = t0 + t2;
+    t12 = t9 - t13;
+    t9 = t5 - t10;
+    t13 = t14 - t8;
+    t5 = t0 - t2;
+    t10 = t3 + t1;
+    t14 = t11 + t4;
+    t8 = t3 - t1;
+    t0 = C4 * t8;
+    t2 = t11 - t4;
+    t3 = C4 * t2;
+    t1 = C5 * t10;
+    t8 = t7 - t1;
+    t11 = C5 * t14;
+    t4 = t6 - t11;
+    t2 = t8 + t0;
+    t1 = t4 + t3;
+    t11 = t8 - t0;
+    t8 = t4 - t3;
+    t0 = C0 * t12;
+    t4 = C2 * t13;
+    t3 = t0 + t4;
+    t0 = C0 * t9;
+    t4 = C2 * t5;
+    t0 = t0 + t4;
+    t4 = C2 * t12;
+    t12 = C0 * t13;
+    t13 = t4 - t12;
+    t4 = C2 * t9;
+    t12 = C0 * t5;
+    t9 = t4 - t12;
+    t5 = t7 + t10;
+    t4 = t6 + t14;
+    t12 = t2 + t0;
+    t7 = t1 - t3;
+    t10 = t11 + t9;
+    t6 = t8 - t13;
+    t14 = t11 - t9;
+    t11 = t8 + t13;
+    t9 = t2 - t0;
+    t8 = t1 + t3;
+    re[20] = t5;
+    im[20] = t4;
+    re[26] = t12;
+    im[26] = t7;
+    re[2] = t10;
+    im[2] = t6;
+    re[8] = t14;
+    im[8] = t11;
+    re[14] = t9;
+    im[14] = t8;
+    t13 = re[0];
+    t2 = im[0];
+    t0 = re[10];
+    t1 = im[10];
+    t3 = re[20];
+    t5 = im[20];
+    t4 = t0 + t3;
+    t12 = t1 + t5;
+    t7 = C16 * t4;
+    t10 = t13 - t7;
+    t6 = C16 * t12;
+    t14 = t2 - t6;
+    t11 = t0 - t3;
+    t9 = C17 * t11;
+    t8 = t1 - t5;
+    t7 = C17 * t8;
+    t6 = t13 + t4;
+    t0 = t2 + t12;
+    t3 = t10 + t7;
+    t11 = t14 - t9;
+    t1 = t10 - t7;
+    t5 = t14 + t9;
+    re[0] = t6;
+    im[0] = t0;
+    re[10] = t3;
+    im[10] = t11;
+    re[20] = t1;
+    im[20] = t5;
+    t8 = re[6];
+    t13 = im[6];
+    t4 = re[16];
+    t2 = im[16];
+    t12 = re[26];
+    t10 = im[26];
+    t7 = t4 + t12;
+    t14 = t2 + t10;
+    t9 = C16 * t7;
+    t6 = t8 - t9;
+    t0 = C16 * t14;
+    t3 = t13 - t0;
+    t11 = t4 - t12;
+    t1 = C17 * t11;
+    t5 = t2 - t10;
+    t9 = C17 * t5;
+    t0 = t8 + t7;
+    t4 = t13 + t14;
+    t12 = t6 + t9;
+    t11 = t3 - t1;
+    t2 = t6 - t9;
+    t10 = t3 + t1;
+    re[6] = t0;
+    im[6] = t4;
+    re[16] = t12;
+    im[16] = t11;
+    re[26] = t2;
+    im[26] = t10;
+    t5 = re[12];
+    t8 = im[12];
+    t7 = re[22];
+    t13 = im[22];
+    t14 = re[2];
+    t6 = im[2];
+    t9 = t7 + t14;
+    t3 = t13 + t6;
+    t1 = C16 * t9;
+    t0 = t5 - t1;
+    t4 = C16 * t3;
+    t12 = t8 - t4;
+    t11 = t7 - t14;
+    t2 = C17 * t11;
+    t10 = t13 - t6;
+    t1 = C17 * t10;
+    t4 = t5 + t9;
+    t7 = t8 + t3;
+    t14 = t0 + t1;
+    t11 = t12 - t2;
+    t13 = t0 - t1;
+    t6 = t12 + t2;
+    re[12] = t4;
+    im[12] = t7;
+    re[22] = t14;
+    im[22] = t11;
+    re[2] = t13;
+    im[2] = t6;
+    t10 = re[18];
+    t5 = im[18];
+    t9 = re[28];
+    t8 = im[28];
+    t3 = re[8];
+    t0 = im[8];
+    t1 = t9 + t3;
+    t12 = t8 + t0;
+    t2 = C16 * t1;
+    t4 = t10 - t2;
+    t7 = C16 * t12;
+    t14 = t5 - t7;
+    t11 = t9 - t3;
+    t13 = C17 * t11;
+    t6 = t8 - t0;
+    t2 = C17 * t6;
+    t7 = t10 + t1;
+    t9 = t5 + t12;
+    t3 = t4 + t2;
+    t11 = t14 - t13;
+    t8 = t4 - t2;
+    t0 = t14 + t13;
+    re[18] = t7;
+    im[18] = t9;
+    re[28] = t3;
+    im[28] = t11;
+    re[8] = t8;
+    im[8] = t0;
+    t6 = re[24];
+    t10 = im[24];
+    t1 = re[4];
+    t5 = im[4];
+    t12 = re[14];
+    t4 = im[14];
+    t2 = t1 + t12;
+    t14 = t5 + t4;
+    t13 = C16 * t2;
+    t7 = t6 - t13;
+    t9 = C16 * t14;
+    t3 = t10 - t9;
+    t11 = t1 - t12;
+    t8 = C17 * t11;
+    t0 = t5 - t4;
+    t13 = C17 * t0;
+    t9 = t6 + t2;
+    t1 = t10 + t14;
+    t12 = t7 + t13;
+    t11 = t3 - t8;
+    t5 = t7 - t13;
+    t4 = t3 + t8;
+    re[24] = t9;
+    im[24] = t1;
+    re[4] = t12;
+    im[4] = t11;
+    re[14] = t5;
+    im[14] = t4;
+    t0 = x[0];
+    t6 = 0.0005387049616190917 * t0;
+    t2 = x[59];
+    t10 = 0.182353566065058 * t2;
+    t14 = t6 - t10;
+    t7 = x[60];
+    t13 = 0.7071067811865476 * t14;
+    t3 = (-0.12925563534711715) * t7;
+    t8 = t13 + t3;
+    t9 = (-0.7071067811865475) * t14;
+    t1 = (-0.12925563534711718) * t7;
+    t12 = t9 + t1;
+    t11 = x[12];
+    t5 = 0.04541872724633372 * t11;
+    t4 = x[47];
+    t0 = 0.1839023308974143 * t4;
+    t2 = t5 - t0;
+    t6 = x[72];
+    t10 = C18 * t2;
+    t13 = (-0.16149995124049388) * t6;
+    t3 = t10 + t13;
+    t14 = (-C19) * t2;
+    t7 = (-0.08228833524914096) * t6;
+    t9 = t14 + t7;
+    t1 = x[24];
+    t11 = 0.14375329174588652 * t1;
+    t4 = x[35];
+    t5 = 0.1929009183481501 * t4;
+    t0 = t11 - t5;
+    t10 = x[84];
+    t13 = 0.13766647316940633 * t10;
+    t2 = x[95];
+    t6 = 0.047145662898518244 * t2;
+    t14 = t13 + t6;
+    t7 = C20 * t0;
+    t1 = (-C21) * t14;
+    t4 = t7 + t1;
+    t11 = (-C21) * t0;
+    t5 = (-C20) * t14;
+    t10 = t11 + t5;
+    t2 = x[83];
+    t13 = 0.144228442730173 * t2;
+    t6 = x[96];
+    t7 = 0.03955313022448558 * t6;
+    t1 = t13 + t7;
+    t0 = x[23];
+    t14 = 0.1360617101761793 * t0;
+    t11 = x[36];
+    t5 = 0.19380134918645378 * t11;
+    t2 = t14 - t5;
+    t6 = (-C21) * t1;
+    t13 = C20 * t2;
+    t7 = t6 + t13;
+    t0 = C20 * t1;
+    t11 = C21 * t2;
+    t14 = t0 + t11;
+    t5 = x[71];
+    t6 = x[11];
+    t13 = 0.03858576756782317 * t6;
+    t1 = x[48];
+    t2 = 0.18288866940224452 * t1;
+    t0 = t13 - t2;
+    t11 = (-0.16239506564303915) * t5;
+    t6 = C18 * t0;
+    t1 = t11 + t6;
+    t13 = 0.08274441881744679 * t5;
+    t2 = C19 * t0;
+    t11 = t13 + t2;
+    t6 = t3 + t1;
+    t5 = t9 + t11;
+    t0 = t4 + t7;
+    t13 = t10 + t14;
+    t2 = t3 - t1;
+    t3 = t9 - t11;
+    t1 = t4 - t7;
+    t9 = t10 - t14;
+    t11 = t6 + t0;
+    t4 = t5 + t13;
+    t7 = t6 - t0;
+    t10 = C4 * t7;
+    t14 = t5 - t13;
+    t6 = C4 * t14;
+    t0 = C5 * t11;
+    t7 = t8 - t0;
+    t5 = C5 * t4;
+    t13 = t12 - t5;
+    t14 = t7 + t10;
+    t0 = t13 + t6;
+    t5 = t7 - t10;
+    t7 = t13 - t6;
+    t10 = C0 * t2;
+    t13 = C2 * t1;
+    t6 = t10 + t13;
+    t10 = C0 * t3;
+    t13 = C2 * t9;
+    t10 = t10 + t13;
+    t13 = C2 * t2;
+    t2 = C0 * t1;
+    t1 = t13 - t2;
+    t13 = C2 * t3;
+    t2 = C0 * t9;
+    t3 = t13 - t2;
+    t9 = t8 + t11;
+    t13 = t12 + t4;
+    t2 = t14 + t10;
+    t8 = t0 - t6;
+    t11 = t5 + t3;
+    t12 = t7 - t1;
+    t4 = t5 - t3;
+    t5 = t7 + t1;
+    t3 = t14 - t10;
+    t7 = t0 + t6;
+    re[15] = t9;
+    im[15] = t13;
+    re[21] = t2;
+    im[21] = t8;
+    re[27] = t11;
+    im[27] = t12;
+    re[3] = t4;
+    im[3] = t5;
+    re[9] = t3;
+    im[9] = t7;
+    t1 = x[20];
+    t14 = 0.11119248930087926 * t1;
+    t10 = x[39];
+    t0 = 0.19366466358128057 * t10;
+    t6 = t14 - t0;
+    t9 = x[80];
+    t13 = 0.16051971504837198 * t9;
+    t2 = x[99];
+    t8 = 0.020202234291642814 * t2;
+    t11 = t13 + t8;
+    t12 = C22 * t6;
+    t4 = (-C23) * t11;
+    t5 = t12 + t4;
+    t3 = (-C23) * t6;
+    t7 = (-C22) * t11;
+    t1 = t3 + t7;
+    t10 = x[87];
+    t14 = 0.11509745355399177 * t10;
+    t0 = x[92];
+    t9 = 0.07213342204735264 * t0;
+    t2 = t14 + t9;
+    t13 = x[27];
+    t8 = 0.16413006955700235 * t13;
+    t12 = x[32];
+    t4 = 0.18674670109216623 * t12;
+    t6 = t8 - t4;
+    t11 = (-C24) * t2;
+    t3 = C25 * t6;
+    t7 = t11 + t3;
+    t10 = C25 * t2;
+    t0 = C24 * t6;
+    t14 = t10 + t0;
+    t9 = x[75];
+    t13 = 0.17663089758011127 * t9;
+    t12 = x[104];
+    t8 = 0.0023182580612160957 * t12;
+    t4 = t13 + t8;
+    t11 = x[15];
+    t3 = 0.06843146028419504 * t11;
+    t2 = x[44];
+    t6 = 0.18781930003974687 * t2;
+    t10 = t3 - t6;
+    t0 = (-C26) * t4;
+    t9 = C27 * t10;
+    t12 = t0 + t9;
+    t13 = C27 * t4;
+    t8 = C26 * t10;
+    t11 = t13 + t8;
+    t2 = x[63];
+    t3 = x[3];
+    t6 = 0.004216615754145715 * t3;
+    t0 = x[56];
+    t9 = 0.1811889683247694 * t0;
+    t4 = t6 - t9;
+    t10 = (-0.14297153751362085) * t2;
+    t13 = C28 * t4;
+    t8 = t10 + t13;
+    t3 = 0.11577606827987118 * t2;
+    t0 = C29 * t4;
+    t6 = t3 + t0;
+    t9 = x[8];
+    t10 = 0.021288985314161225 * t9;
+    t13 = x[51];
+    t2 = 0.18105577745893833 * t13;
+    t4 = t10 - t2;
+    t3 = x[68];
+    t0 = C30 * t4;
+    t9 = (-0.1544037201713758) * t3;
+    t13 = t0 + t9;
+    t10 = (-C31) * t4;
+    t2 = (-0.10027094829723505) * t3;
+    t0 = t10 + t2;
+    t9 = t7 + t13;
+    t4 = t14 + t0;
+    t3 = t12 + t8;
+    t10 = t11 + t6;
+    t2 = t7 - t13;
+    t7 = t14 - t0;
+    t13 = t12 - t8;
+    t14 = t11 - t6;
+    t0 = t9 + t3;
+    t12 = t4 + t10;
+    t8 = t9 - t3;
+    t11 = C4 * t8;
+    t6 = t4 - t10;
+    t9 = C4 * t6;
+    t3 = C5 * t0;
+    t8 = t5 - t3;
+    t4 = C5 * t12;
+    t10 = t1 - t4;
+    t6 = t8 + t11;
+    t3 = t10 + t9;
+    t4 = t8 - t11;
+    t8 = t10 - t9;
+    t11 = C0 * t2;
+    t10 = C2 * t13;
+    t9 = t11 + t10;
+    t11 = C0 * t7;
+    t10 = C2 * t14;
+    t11 = t11 + t10;
+    t10 = C2 * t2;
+    t2 = C0 * t13;
+    t13 = t10 - t2;
+    t10 = C2 * t7;
+    t2 = C0 * t14;
+    t7 = t10 - t2;
+    t14 = t5 + t0;
+    t10 = t1 + t12;
+    t2 = t6 + t11;
+    t5 = t3 - t9;
+    t0 = t4 + t7;
+    t1 = t8 - t13;
+    t12 = t4 - t7;
+    t4 = t8 + t13;
+    t7 = t6 - t11;
+    t8 = t3 + t9;
+    re[25] = t14;
+    im[25] = t10;
+    re[1] = t2;
+    im[1] = t5;
+    re[7] = t0;
+    im[7] = t1;
+    re[13] = t12;
+    im[13] = t4;
+    re[19] = t7;
+    im[19] = t8;
+    t13 = x[79];
+    t6 = 0.1647928020435337 * t13;
+    t11 = x[100];
+    t3 = 0.015098811535528705 * t11;
+    t9 = t6 + t3;
+    t14 = x[19];
+    t10 = 0.10255375335014265 * t14;
+    t2 = x[40];
+    t5 = 0.19287792394501402 * t2;
+    t0 = t10 - t5;
+    t1 = (-C23) * t9;
+    t12 = C22 * t0;
+    t4 = t1 + t12;
+    t7 = C22 * t9;
+    t8 = C23 * t0;
+    t13 = t7 + t8;
+    t11 = x[67];
+    t6 = x[7];
+    t3 = 0.016685167796922855 * t6;
+    t14 = x[52];
+    t2 = 0.18080783992826 * t14;
+    t10 = t3 - t2;
+    t5 = (-0.15461545035476834) * t11;
+    t1 = C30 * t10;
+    t12 = t5 + t1;
+    t9 = 0.10040844748603928 * t11;
+    t0 = C31 * t10;
+    t7 = t9 + t0;
+    t8 = x[4];
+    t6 = 0.006463787641779946 * t8;
+    t14 = x[55];
+    t3 = 0.18092651120355077 * t14;
+    t2 = t6 - t3;
+    t5 = x[64];
+    t1 = C28 * t2;
+    t11 = (-0.14317893607507218) * t5;
+    t10 = t1 + t11;
+    t9 = (-C29) * t2;
+    t0 = (-0.11594401632344206) * t5;
+    t8 = t9 + t0;
+    t14 = x[16];
+    t6 = 0.076737393282048 * t14;
+    t3 = x[43];
+    t1 = 0.18923398933022872 * t3;
+    t11 = t6 - t1;
+    t2 = x[76];
+    t5 = 0.1743820319847075 * t2;
+    t9 = x[103];
+    t0 = 0.004356751500885387 * t9;
+    t14 = t5 + t0;
+    t3 = C27 * t11;
+    t6 = (-C26) * t14;
+    t1 = t3 + t6;
+    t2 = (-C26) * t11;
+    t9 = (-C27) * t14;
+    t5 = t2 + t9;
+    t0 = x[28];
+    t3 = 0.16986839509084428 * t0;
+    t6 = x[31];
+    t11 = 0.18346566514736667 * t6;
+    t14 = t3 - t11;
+    t2 = x[88];
+    t9 = 0.10682029613194247 * t2;
+    t0 = x[91];
+    t6 = 0.08085951859910284 * t0;
+    t3 = t9 + t6;
+    t11 = C25 * t14;
+    t2 = (-C24) * t3;
+    t0 = t11 + t2;
+    t9 = (-C24) * t14;
+    t6 = (-C25) * t3;
+    t11 = t9 + t6;
+    t2 = t12 + t0;
+    t14 = t7 + t11;
+    t3 = t10 + t1;
+    t9 = t8 + t5;
+    t6 = t12 - t0;
+    t12 = t7 - t11;
+    t0 = t10 - t1;
+    t7 = t8 - t5;
+    t11 = t2 + t3;
+    t10 = t14 + t9;
+    t1 = t2 - t3;
+    t8 = C4 * t1;
+    t5 = t14 - t9;
+    t2 = C4 * t5;
+    t3 = C5 * t11;
+    t1 = t4 - t3;
+    t14 = C5 * t10;
+    t9 = t13 - t14;
+    t5 = t1 + t8;
+    t3 = t9 + t2;
+    t14 = t1 - t8;
+    t1 = t9 - t2;
+    t8 = C0 * t6;
+    t9 = C2 * t0;
+    t2 = t8 + t9;
+    t8 = C0 * t12;
+    t9 = C2 * t7;
+    t8 = t8 + t9;
+    t9 = C2 * t6;
+    t6 = C0 * t0;
+    t0 = t9 - t6;
+    t9 = C2 * t12;
+    t6 = C0 * t7;
+    t12 = t9 - t6;
+    t7 = t4 + t11;
+    t9 = t13 + t10;
+    t6 = t5 + t8;
+    t4 = t3 - t2;
+    t11 = t14 + t12;
+    t13 = t1 - t0;
+    t10 = t14 - t12;
+    t14 = t1 + t0;
+    t12 = t5 - t8;
+    t1 = t3 + t2;
+    re[5] = t7;
+    im[5] = t9;
+    re[11] = t6;
+    im[11] = t4;
+    re[17] = t11;
+    im[17] = t13;
+    re[23] = t10;
+    im[23] = t14;
+    re[29] = t12;
+    im[29] = t1;
+    t0 = re[15];
+    t5 = im[15];
+    t8 = re[25];
+    t3 = im[25];
+    t2 = re[5];
+    t7 = im[5];
+    t9 = t8 + t2;
+    t6 = t3 + t7;
+    t4 = C16 * t9;
+    t11 = t0 - t4;
+    t13 = C16 * t6;
+    t10 = t5 - t13;
+    t14 = t8 - t2;
+    t12 = C17 * t14;
+    t1 = t3 - t7;
+    t4 = C17 * t1;
+    t13 = t0 + t9;
+    t8 = t5 + t6;
+    t2 = t11 + t4;
+    t14 = t10 - t12;
+    t3 = t11 - t4;
+    t7 = t10 + t12;
+    re[15] = t13;
+    im[15] = t8;
+    re[25] = t2;
+    im[25] = t14;
+    re[5] = t3;
+    im[5] = t7;
+    t1 = re[21];
+    t0 = im[21];
+    t9 = re[1];
+    t5 = im[1];
+    t6 = re[11];
+    t11 = im[11];
+    t4 = t9 + t6;
+    t10 = t5 + t11;
+    t12 = C16 * t4;
+    t13 = t1 - t12;
+    t8 = C16 * t10;
+    t2 = t0 - t8;
+    t14 = t9 - t6;
+    t3 = C17 * t14;
+    t7 = t5 - t11;
+    t12 = C17 * t7;
+    t8 = t1 + t4;
+    t9 = t0 + t10;
+    t6 = t13 + t12;
+    t14 = t2 - t3;
+    t5 = t13 - t12;
+    t11 = t2 + t3;
+    re[21] = t8;
+    im[21] = t9;
+    re[1] = t6;
+    im[1] = t14;
+    re[11] = t5;
+    im[11] = t11;
+    t7 = re[27];
+    t1 = im[27];
+    t4 = re[7];
+    t0 = im[7];
+    t10 = re[17];
+    t13 = im[17];
+    t12 = t4 + t10;
+    t2 = t0 + t13;
+    t3 = C16 * t12;
+    t8 = t7 - t3;
+    t9 = C16 * t2;
+    t6 = t1 - t9;
+    t14 = t4 - t10;
+    t5 = C17 * t14;
+    t11 = t0 - t13;
+    t3 = C17 * t11;
+    t9 = t7 + t12;
+    t4 = t1 + t2;
+    t10 = t8 + t3;
+    t14 = t6 - t5;
+    t0 = t8 - t3;
+    t13 = t6 + t5;
+    re[27] = t9;
+    im[27] = t4;
+    re[7] = t10;
+    im[7] = t14;
+    re[17] = t0;
+    im[17] = t13;
+    t11 = re[3];
+    t7 = im[3];
+    t12 = re[13];
+    t1 = im[13];
+    t2 = re[23];
+    t8 = im[23];
+    t3 = t12 + t2;
+    t6 = t1 + t8;
+    t5 = C16 * t3;
+    t9 = t11 - t5;
+    t4 = C16 * t6;
+    t10 = t7 - t4;
+    t14 = t12 - t2;
+    t0 = C17 * t14;
+    t13 = t1 - t8;
+    t5 = C17 * t13;
+    t4 = t11 + t3;
+    t12 = t7 + t6;
+    t2 = t9 + t5;
+    t14 = t10 - t0;
+    t1 = t9 - t5;
+    t8 = t10 + t0;
+    re[3] = t4;
+    im[3] = t12;
+    re[13] = t2;
+    im[13] = t14;
+    re[23] = t1;
+    im[23] = t8;
+    t13 = re[9];
+    t11 = im[9];
+    t3 = re[19];
+    t7 = im[19];
+    t6 = re[29];
+    t9 = im[29];
+    t5 = t3 + t6;
+    t10 = t7 + t9;
+    t0 = C16 * t5;
+    t4 = t13 - t0;
+    t12 = C16 * t10;
+    t2 = t11 - t12;
+    t14 = t3 - t6;
+    t1 = C17 * t14;
+    t8 = t7 - t9;
+    t0 = C17 * t8;
+    t12 = t13 + t5;
+    t3 = t11 + t10;
+    t6 = t4 + t0;
+    t14 = t2 - t1;
+    t7 = t4 - t0;
+    t9 = t2 + t1;
+    re[9] = t12;
+    im[9] = t3;
+    re[19] = t6;
+    im[19] = t14;
+    re[29] = t7;
+    im[29] = t9;
+    t8 = re[0];
+    t13 = im[0];
+    t5 = re[15];
+    t11 = im[15];
+    t10 = t8 - t5;
+    t4 = t13 - t11;
+    t0 = t8 + t5;
+    t2 = t13 + t11;
+    t1 = C32 * t0;
+    t12 = C33 * t2;
+    t3 = t1 + t12;
+    t6 = C33 * t0;
+    t14 = (-C32) * t2;
+    t7 = t6 + t14;
+    X[0] = t3;
+    X[59] = t7;
+    t9 = C34 * t10;
+    t8 = C35 * t4;
+    t5 = t9 + t8;
+    t13 = C35 * t10;
+    t11 = (-C34) * t4;
+    t1 = t13 + t11;
+    X[30] = t5;
+    X[29] = t1;
+    t12 = re[16];
+    t0 = im[16];
+    t2 = re[1];
+    t6 = im[1];
+    t14 = t12 - t2;
+    t3 = t0 - t6;
+    t7 = t12 + t2;
+    t9 = t0 + t6;
+    t8 = C36 * t7;
+    t10 = C37 * t9;
+    t4 = t8 + t10;
+    t13 = C37 * t7;
+    t11 = (-C36) * t9;
+    t5 = t13 + t11;
+    X[32] = t4;
+    X[27] = t5;
+    t1 = C38 * t14;
+    t12 = C39 * t3;
+    t2 = t1 + t12;
+    t0 = C39 * t14;
+    t6 = (-C38) * t3;
+    t8 = t0 + t6;
+    X[2] = t2;
+    X[57] = t8;
+    t10 = re[2];
+    t7 = im[2];
+    t9 = re[17];
+    t13 = im[17];
+    t11 = t10 - t9;
+    t4 = t7 - t13;
+    t5 = t10 + t9;
+    t1 = t7 + t13;
+    t12 = C40 * t5;
+    t14 = C41 * t1;
+    t3 = t12 + t14;
+    t0 = C41 * t5;
+    t6 = (-C40) * t1;
+    t2 = t0 + t6;
+    X[4] = t3;
+    X[55] = t2;
+    t8 = C42 * t11;
+    t10 = C43 * t4;
+    t9 = t8 + t10;
+    t7 = C43 * t11;
+    t13 = (-C42) * t4;
+    t12 = t7 + t13;
+    X[34] = t9;
+    X[25] = t12;
+    t14 = re[18];
+    t5 = im[18];
+    t1 = re[3];
+    t0 = im[3];
+    t6 = t14 - t1;
+    t3 = t5 - t0;
+    t2 = t14 + t1;
+    t8 = t5 + t0;
+    t10 = C44 * t2;
+    t11 = C45 * t8;
+    t4 = t10 + t11;
+    t7 = C45 * t2;
+    t13 = (-C44) * t8;
+    t9 = t7 + t13;
+    X[36] = t4;
+    X[23] = t9;
+    t12 = C46 * t6;
+    t14 = C47 * t3;
+    t1 = t12 + t14;
+    t5 = C47 * t6;
+    t0 = (-C46) * t3;
+    t10 = t5 + t0;
+    X[6] = t1;
+    X[53] = t10;
+    t11 = re[4];
+    t2 = im[4];
+    t8 = re[19];
+    t7 = im[19];
+    t13 = t11 - t8;
+    t4 = t2 - t7;
+    t9 = t11 + t8;
+    t12 = t2 + t7;
+    t14 = C48 * t9;
+    t6 = C49 * t12;
+    t3 = t14 + t6;
+    t5 = C49 * t9;
+    t0 = (-C48) * t12;
+    t1 = t5 + t0;
+    X[8] = t3;
+    X[51] = t1;
+    t10 = C50 * t13;
+    t11 = C51 * t4;
+    t8 = t10 + t11;
+    t2 = C51 * t13;
+    t7 = (-C50) * t4;
+    t14 = t2 + t7;
+    X[38] = t8;
+    X[21] = t14;
+    t6 = re[20];
+    t9 = im[20];
+    t12 = re[5];
+    t5 = im[5];
+    t0 = t6 - t12;
+    t3 = t9 - t5;
+    t1 = t6 + t12;
+    t10 = t9 + t5;
+    t11 = C52 * t1;
+    t13 = C53 * t10;
+    t4 = t11 + t13;
+    t2 = C53 * t1;
+    t7 = (-C52) * t10;
+    t8 = t2 + t7;
+    X[40] = t4;
+    X[19] = t8;
+    t14 = C54 * t0;
+    t6 = C55 * t3;
+    t12 = t14 + t6;
+    t9 = C55 * t0;
+    t5 = (-C54) * t3;
+    t11 = t9 + t5;
+    X[10] = t12;
+    X[49] = t11;
+    t13 = re[6];
+    t1 = im[6];
+    t10 = re[21];
+    t2 = im[21];
+    t7 = t13 - t10;
+    t4 = t1 - t2;
+    t8 = t13 + t10;
+    t14 = t1 + t2;
+    t6 = C56 * t8;
+    t0 = C57 * t14;
+    t3 = t6 + t0;
+    t9 = C57 * t8;
+    t5 = (-C56) * t14;
+    t12 = t9 + t5;
+    X[12] = t3;
+    X[47] = t12;
+    t11 = C58 * t7;
+    t13 = C59 * t4;
+    t10 = t11 + t13;
+    t1 = C59 * t7;
+    t2 = (-C58) * t4;
+    t6 = t1 + t2;
+    X[42] = t10;
+    X[17] = t6;
+    t0 = re[22];
+    t8 = im[22];
+    t14 = re[7];
+    t9 = im[7];
+    t5 = t0 - t14;
+    t3 = t8 - t9;
+    t12 = t0 + t14;
+    t11 = t8 + t9;
+    t13 = C60 * t12;
+    t7 = C61 * t11;
+    t4 = t13 + t7;
+    t1 = C61 * t12;
+    t2 = (-C60) * t11;
+    t10 = t1 + t2;
+    X[44] = t4;
+    X[15] = t10;
+    t6 = C62 * t5;
+    t0 = C63 * t3;
+    t14 = t6 + t0;
+    t8 = C63 * t5;
+    t9 = (-C62) * t3;
+    t13 = t8 + t9;
+    X[14] = t14;
+    X[45] = t13;
+    t7 = re[8];
+    t12 = im[8];
+    t11 = re[23];
+    t1 = im[23];
+    t2 = t7 - t11;
+    t4 = t12 - t1;
+    t10 = t7 + t11;
+    t6 = t12 + t1;
+    t0 = C64 * t10;
+    t5 = C65 * t6;
+    t3 = t0 + t5;
+    t8 = C65 * t10;
+    t9 = (-C64) * t6;
+    t14 = t8 + t9;
+    X[16] = t3;
+    X[43] = t14;
+    t13 = C66 * t2;
+    t7 = C67 * t4;
+    t11 = t13 + t7;
+    t12 = C67 * t2;
+    t1 = (-C66) * t4;
+    t0 = t12 + t1;
+    X[46] = t11;
+    X[13] = t0;
+    t5 = re[24];
+    t10 = im[24];
+    t6 = re[9];
+    t8 = im[9];
+    t9 = t5 - t6;
+    t3 = t10 - t8;
+    t14 = t5 + t6;
+    t13 = t10 + t8;
+    t7 = C68 * t14;
+    t2 = C69 * t13;
+    t4 = t7 + t2;
+    t12 = C69 * t14;
+    t1 = (-C68) * t13;
+    t11 = t12 + t1;
+    X[48] = t4;
+    X[11] = t11;
+    t0 = C70 * t9;
+    t5 = C71 * t3;
+    t6 = t0 + t5;
+    t10 = C71 * t9;
+    t8 = (-C70) * t3;
+    t7 = t10 + t8;
+    X[18] = t6;
+    X[41] = t7;
+    t2 = re[10];
+    t14 = im[10];
+    t13 = re[25];
+    t12 = im[25];
+    t1 = t2 - t13;
+    t4 = t14 - t12;
+    t11 = t2 + t13;
+    t0 = t14 + t12;
+    t5 = C72 * t11;
+    t9 = C73 * t0;
+    t3 = t5 + t9;
+    t10 = C73 * t11;
+    t8 = (-C72) * t0;
+    t6 = t10 + t8;
+    X[20] = t3;
+    X[39] = t6;
+    t7 = C74 * t1;
+    t2 = C75 * t4;
+    t13 = t7 + t2;
+    t14 = C75 * t1;
+    t12 = (-C74) * t4;
+    t5 = t14 + t12;
+    X[50] = t13;
+    X[9] = t5;
+    t9 = re[26];
+    t11 = im[26];
+    t0 = re[11];
+    t10 = im[11];
+    t8 = t9 - t0;
+    t3 = t11 - t10;
+    t6 = t9 + t0;
+    t7 = t11 + t10;
+    t2 = C76 * t6;
+    t1 = C77 * t7;
+    t4 = t2 + t1;
+    t14 = C77 * t6;
+    t12 = (-C76) * t7;
+    t13 = t14 + t12;
+    X[52] = t4;
+    X[7] = t13;
+    t5 = C78 * t8;
+    t9 = C79 * t3;
+    t0 = t5 + t9;
+    t11 = C79 * t8;
+    t10 = (-C78) * t3;
+    t2 = t11 + t10;
+    X[22] = t0;
+    X[37] = t2;
+    t1 = re[12];
+    t6 = im[12];
+    t7 = re[27];
+    t14 = im[27];
+    t12 = t1 - t7;
+    t4 = t6 - t14;
+    t13 = t1 + t7;
+    t5 = t6 + t14;
+    t9 = C80 * t13;
+    t8 = C81 * t5;
+    t3 = t9 + t8;
+    t11 = C81 * t13;
+    t10 = (-C80) * t5;
+    t0 = t11 + t10;
+    X[24] = t3;
+    X[35] = t0;
+    t2 = C82 * t12;
+    t1 = C83 * t4;
+    t7 = t2 + t1;
+    t6 = C83 * t12;
+    t14 = (-C82) * t4;
+    t9 = t6 + t14;
+    X[54] = t7;
+    X[5] = t9;
+    t8 = re[28];
+    t13 = im[28];
+    t5 = re[13];
+    t11 = im[13];
+    t10 = t8 - t5;
+    t3 = t13 - t11;
+    t0 = t8 + t5;
+    t2 = t13 + t11;
+    t1 = C84 * t0;
+    t12 = C85 * t2;
+    t4 = t1 + t12;
+    t6 = C85 * t0;
+    t14 = (-C84) * t2;
+    t7 = t6 + t14;
+    X[56] = t4;
+    X[3] = t7;
+    t9 = C86 * t10;
+    t8 = C87 * t3;
+    t5 = t9 + t8;
+    t13 = C87 * t10;
+    t11 = (-C86) * t3;
+    t1 = t13 + t11;
+    X[26] = t5;
+    X[33] = t1;
+    t12 = re[14];
+    t0 = im[14];
+    t2 = re[29];
+    t6 = im[29];
+    t14 = t12 - t2;
+    t4 = t0 - t6;
+    t7 = t12 + t2;
+    t9 = t0 + t6;
+    t8 = C88 * t7;
+    t10 = C89 * t9;
+    t3 = t8 + t10;
+    t13 = C89 * t7;
+    t11 = (-C88) * t9;
+    t5 = t13 + t11;
+    X[28] = t3;
+    X[31] = t5;
+    t1 = C90 * t14;
+    t12 = C91 * t4;
+    t2 = t1 + t12;
+    t0 = C91 * t14;
+    t6 = (-C90) * t4;
+    t8 = t0 + t6;
+    X[58] = t2;
+    X[1] = t8;
+}
+
+/**
+ *  Apply LD-IMDCT transform (prebuilt for window W75_60).
+ * 
+ *  Note(s):
+ *    [1] y[n] = w[n] * SUM(X[k] * cos(PI / 60 * (n + 30.5) * (k + 0.5))), where
+ *        w[n] = sqrt(2 / 60) * W75_60[119 - n].
+ *    [2] The size of all arrays will not be checked.
+ * 
+ *  @param {Number[]} X 
+ *    - The input block (60 points).
+ *  @param {Number[]} y 
+ *    - The array that would contain the output block (120 points).
+ *  @param {Number[]} re 
+ *    - The scratch buffer (real part, 30 points).
+ *  @param {Number[]} im 
+ *    - The scratch buffer (imaginary part, 30 points).
+ */
+function ApplyWindowedIMDCT_W75_60(X, y, re, im) {
+    let t0, t1, t10, t11, t12, t13, t14, t2, t3, t4, t5, t6, t7, t8, t9;
+    const C0 = 0.9510565162951535;
+    const C1 = 0.3090169943749474;
+    const C2 = 0.8090169943749475;
+    const C3 = 0.5877852522924731;
+    const C4 = 0.5590169943749475;
+    const C5 = 0.25;
+    const C6 = 0.8660254037844387;
+    const C7 = 0.49999999999999994;
+    const C8 = 0.6691306063588582;
+    const C9 = 0.7431448254773942;
+    const C10 = 0.40673664307580015;
+    const C11 = 0.9135454576426009;
+    const C12 = 0.10452846326765346;
+    const C13 = 0.9945218953682733;
+    const C14 = 0.9781476007338057;
+    const C15 = 0.20791169081775931;
+    const C16 = 0.5;
+    const C17 = 0.8660254037844386;
+    const C18 = 0.7071067811865476;
+    const C19 = 0.7071067811865475;
+    const C20 = 0.45399049973954675;
+    const C21 = 0.8910065241883679;
+    const C22 = 0.15643446504023087;
+    const C23 = 0.9876883405951378;
+    const C24 = 0.25881904510252074;
+    const C25 = 0.9659258262890683;
+    const C26 = 0.9986295347545738;
+    const C27 = 0.05233595624294383;
+    const C28 = 0.9335804264972017;
+    const C29 = 0.35836794954530027;
+    const C30 = 0.7771459614569709;
+    const C31 = 0.6293203910498375;
+    const C32 = 0.544639035015027;
+    const C33 = 0.838670567945424;
+    const C34 = 0.999914327574007;
+    const C35 = 0.01308959557134444;
+    const C36 = 0.6977904598416801;
+    const C37 = 0.7163019434246544;
+    const C38 = 0.6593458151000688;
+    const C39 = 0.7518398074789774;
+    const C40 = 0.9978589232386035;
+    const C41 = 0.06540312923014306;
+    const C42 = 0.9930684569549263;
+    const C43 = 0.11753739745783764;
+    const C44 = 0.619093949309834;
+    const C45 = 0.785316930880745;
+    const C46 = 0.5771451900372336;
+    const C47 = 0.8166415551616789;
+    const C48 = 0.9855560590580777;
+    const C49 = 0.1693495038490246;
+    const C50 = 0.9753423205085127;
+    const C51 = 0.22069743502150108;
+    const C52 = 0.5336145159156115;
+    const C53 = 0.8457278217039733;
+    const C54 = 0.4886212414969549;
+    const C55 = 0.8724960070727972;
+    const C56 = 0.9624552364536473;
+    const C57 = 0.27144044986507426;
+    const C58 = 0.9469301294951057;
+    const C59 = 0.3214394653031616;
+    const C60 = 0.4422886902190013;
+    const C61 = 0.8968727415326883;
+    const C62 = 0.39474385638426723;
+    const C63 = 0.9187912101488983;
+    const C64 = 0.9288095528719242;
+    const C65 = 0.3705574375098362;
+    const C66 = 0.9081431738250813;
+    const C67 = 0.41865973753742813;
+    const C68 = 0.34611705707749296;
+    const C69 = 0.9381913359224842;
+    const C70 = 0.296541574975571;
+    const C71 = 0.9550199444571866;
+    const C72 = 0.8849876374630419;
+    const C73 = 0.4656145203251114;
+    const C74 = 0.8594064115014527;
+    const C75 = 0.5112930860770522;
+    const C76 = 0.24615329302899303;
+    const C77 = 0.9692309097067544;
+    const C78 = 0.19509032201612825;
+    const C79 = 0.9807852804032304;
+    const C80 = 0.8314696123025452;
+    const C81 = 0.5555702330196022;
+    const C82 = 0.8012538126910607;
+    const C83 = 0.598324600570659;
+    const C84 = 0.1434926219911793;
+    const C85 = 0.9896513868196702;
+    const C86 = 0.09150161866340238;
+    const C87 = 0.9958049275746618;
+    const C88 = 0.7688418320734596;
+    const C89 = 0.6394390019805847;
+    const C90 = 0.7343225094356856;
+    const C91 = 0.6788007455329417;
+    const C92 = 0.03925981575906861;
+    const C93 = 0.9992290362407229;
+    t0 = X[0];
+    t1 = X[59];
+    t2 = X[12];
+    t3 = X[47];
+    t4 = C0 * t2;
+    t5 = C1 * t3;
+    t4 = t4 + t5;
+    t5 = (-C1) * t2;
+    t2 = C0 * t3;
+    t3 = t5 + t2;
+    t5 = X[24];
+    t2 = X[35];
+    t6 = C2 * t5;
+    t7 = C3 * t2;
+    t6 = t6 + t7;
+    t7 = (-C3) * t5;
+    t5 = C2 * t2;
+    t2 = t7 + t5;
+    t7 = X[36];
+    t5 = X[23];
+    t8 = C3 * t7;
+    t9 = C2 * t5;
+    t8 = t8 + t9;
+    t9 = (-C2) * t7;
+    t7 = C3 * t5;
+    t5 = t9 + t7;
+    t9 = X[48];
+    t7 = X[11];
+    t10 = C1 * t9;
+    t11 = C0 * t7;
+    t10 = t10 + t11;
+    t11 = (-C0) * t9;
+    t9 = C1 * t7;
+    t7 = t11 + t9;
+    t11 = t4 + t10;
+    t9 = t3 + t7;
+    t12 = t6 + t8;
+    t13 = t2 + t5;
+    t4 = t4 - t10;
+    t10 = t3 - t7;
+    t3 = t6 - t8;
+    t7 = t2 - t5;
+    t6 = t11 + t12;
+    t8 = t9 + t13;
+    t2 = t11 - t12;
+    t5 = C4 * t2;
+    t11 = t9 - t13;
+    t12 = C4 * t11;
+    t2 = C5 * t6;
+    t9 = t0 - t2;
+    t13 = C5 * t8;
+    t11 = t1 - t13;
+    t2 = t9 + t5;
+    t13 = t11 + t12;
+    t9 = t9 - t5;
+    t5 = t11 - t12;
+    t11 = C0 * t4;
+    t12 = C3 * t3;
+    t11 = t11 + t12;
+    t12 = C0 * t10;
+    t14 = C3 * t7;
+    t12 = t12 + t14;
+    t14 = C3 * t4;
+    t4 = C0 * t3;
+    t3 = t14 - t4;
+    t14 = C3 * t10;
+    t4 = C0 * t7;
+    t10 = t14 - t4;
+    t7 = t0 + t6;
+    t14 = t1 + t8;
+    t4 = t2 + t12;
+    t0 = t13 - t11;
+    t6 = t9 + t10;
+    t1 = t5 - t3;
+    t8 = t9 - t10;
+    t9 = t5 + t3;
+    t10 = t2 - t12;
+    t5 = t13 + t11;
+    re[0] = t7;
+    im[0] = t14;
+    re[6] = t4;
+    im[6] = t0;
+    re[12] = t6;
+    im[12] = t1;
+    re[18] = t8;
+    im[18] = t9;
+    re[24] = t10;
+    im[24] = t5;
+    t3 = X[20];
+    t2 = X[39];
+    t12 = C6 * t3;
+    t13 = C7 * t2;
+    t11 = t12 + t13;
+    t7 = (-C7) * t3;
+    t14 = C6 * t2;
+    t4 = t7 + t14;
+    t0 = X[32];
+    t6 = X[27];
+    t1 = C8 * t0;
+    t8 = C9 * t6;
+    t9 = t1 + t8;
+    t10 = (-C9) * t0;
+    t5 = C8 * t6;
+    t12 = t10 + t5;
+    t13 = X[44];
+    t3 = X[15];
+    t2 = C10 * t13;
+    t7 = C11 * t3;
+    t14 = t2 + t7;
+    t1 = (-C11) * t13;
+    t8 = C10 * t3;
+    t0 = t1 + t8;
+    t6 = X[56];
+    t10 = X[3];
+    t5 = C12 * t6;
+    t2 = C13 * t10;
+    t7 = t5 + t2;
+    t13 = (-C13) * t6;
+    t3 = C12 * t10;
+    t1 = t13 + t3;
+    t8 = X[8];
+    t5 = X[51];
+    t2 = C14 * t8;
+    t6 = C15 * t5;
+    t10 = t2 + t6;
+    t13 = (-C15) * t8;
+    t3 = C14 * t5;
+    t2 = t13 + t3;
+    t6 = t9 + t10;
+    t8 = t12 + t2;
+    t5 = t14 + t7;
+    t13 = t0 + t1;
+    t3 = t9 - t10;
+    t9 = t12 - t2;
+    t10 = t14 - t7;
+    t12 = t0 - t1;
+    t2 = t6 + t5;
+    t14 = t8 + t13;
+    t7 = t6 - t5;
+    t0 = C4 * t7;
+    t1 = t8 - t13;
+    t6 = C4 * t1;
+    t5 = C5 * t2;
+    t7 = t11 - t5;
+    t8 = C5 * t14;
+    t13 = t4 - t8;
+    t1 = t7 + t0;
+    t5 = t13 + t6;
+    t8 = t7 - t0;
+    t7 = t13 - t6;
+    t0 = C0 * t3;
+    t13 = C3 * t10;
+    t6 = t0 + t13;
+    t0 = C0 * t9;
+    t13 = C3 * t12;
+    t0 = t0 + t13;
+    t13 = C3 * t3;
+    t3 = C0 * t10;
+    t10 = t13 - t3;
+    t13 = C3 * t9;
+    t3 = C0 * t12;
+    t9 = t13 - t3;
+    t12 = t11 + t2;
+    t13 = t4 + t14;
+    t3 = t1 + t0;
+    t11 = t5 - t6;
+    t2 = t8 + t9;
+    t4 = t7 - t10;
+    t14 = t8 - t9;
+    t8 = t7 + t10;
+    t9 = t1 - t0;
+    t7 = t5 + t6;
+    re[10] = t12;
+    im[10] = t13;
+    re[16] = t3;
+    im[16] = t11;
+    re[22] = t2;
+    im[22] = t4;
+    re[28] = t14;
+    im[28] = t8;
+    re[4] = t9;
+    im[4] = t7;
+    t10 = X[40];
+    t1 = X[19];
+    t0 = C7 * t10;
+    t5 = C6 * t1;
+    t6 = t0 + t5;
+    t12 = (-C6) * t10;
+    t13 = C7 * t1;
+    t3 = t12 + t13;
+    t11 = X[52];
+    t2 = X[7];
+    t4 = C15 * t11;
+    t14 = C14 * t2;
+    t8 = t4 + t14;
+    t9 = (-C14) * t11;
+    t7 = C15 * t2;
+    t0 = t9 + t7;
+    t5 = X[4];
+    t10 = X[55];
+    t1 = C13 * t5;
+    t12 = C12 * t10;
+    t13 = t1 + t12;
+    t4 = (-C12) * t5;
+    t14 = C13 * t10;
+    t11 = t4 + t14;
+    t2 = X[16];
+    t9 = X[43];
+    t7 = C11 * t2;
+    t1 = C10 * t9;
+    t12 = t7 + t1;
+    t5 = (-C10) * t2;
+    t10 = C11 * t9;
+    t4 = t5 + t10;
+    t14 = X[28];
+    t7 = X[31];
+    t1 = C9 * t14;
+    t2 = C8 * t7;
+    t9 = t1 + t2;
+    t5 = (-C8) * t14;
+    t10 = C9 * t7;
+    t1 = t5 + t10;
+    t2 = t8 + t9;
+    t14 = t0 + t1;
+    t7 = t13 + t12;
+    t5 = t11 + t4;
+    t10 = t8 - t9;
+    t8 = t0 - t1;
+    t9 = t13 - t12;
+    t0 = t11 - t4;
+    t1 = t2 + t7;
+    t13 = t14 + t5;
+    t12 = t2 - t7;
+    t11 = C4 * t12;
+    t4 = t14 - t5;
+    t2 = C4 * t4;
+    t7 = C5 * t1;
+    t12 = t6 - t7;
+    t14 = C5 * t13;
+    t5 = t3 - t14;
+    t4 = t12 + t11;
+    t7 = t5 + t2;
+    t14 = t12 - t11;
+    t12 = t5 - t2;
+    t11 = C0 * t10;
+    t5 = C3 * t9;
+    t2 = t11 + t5;
+    t11 = C0 * t8;
+    t5 = C3 * t0;
+    t11 = t11 + t5;
+    t5 = C3 * t10;
+    t10 = C0 * t9;
+    t9 = t5 - t10;
+    t5 = C3 * t8;
+    t10 = C0 * t0;
+    t8 = t5 - t10;
+    t0 = t6 + t1;
+    t5 = t3 + t13;
+    t10 = t4 + t11;
+    t6 = t7 - t2;
+    t1 = t14 + t8;
+    t3 = t12 - t9;
+    t13 = t14 - t8;
+    t14 = t12 + t9;
+    t8 = t4 - t11;
+    t12 = t7 + t2;
+    re[20] = t0;
+    im[20] = t5;
+    re[26] = t10;
+    im[26] = t6;
+    re[2] = t1;
+    im[2] = t3;
+    re[8] = t13;
+    im[8] = t14;
+    re[14] = t8;
+    im[14] = t12;
+    t9 = re[0];
+    t4 = im[0];
+    t11 = re[10];
+    t7 = im[10];
+    t2 = re[20];
+    t0 = im[20];
+    t5 = t11 + t2;
+    t10 = t7 + t0;
+    t6 = C16 * t5;
+    t1 = t9 - t6;
+    t3 = C16 * t10;
+    t13 = t4 - t3;
+    t14 = t11 - t2;
+    t8 = C17 * t14;
+    t12 = t7 - t0;
+    t6 = C17 * t12;
+    t3 = t9 + t5;
+    t11 = t4 + t10;
+    t2 = t1 + t6;
+    t14 = t13 - t8;
+    t7 = t1 - t6;
+    t0 = t13 + t8;
+    re[0] = t3;
+    im[0] = t11;
+    re[10] = t2;
+    im[10] = t14;
+    re[20] = t7;
+    im[20] = t0;
+    t12 = re[6];
+    t9 = im[6];
+    t5 = re[16];
+    t4 = im[16];
+    t10 = re[26];
+    t1 = im[26];
+    t6 = t5 + t10;
+    t13 = t4 + t1;
+    t8 = C16 * t6;
+    t3 = t12 - t8;
+    t11 = C16 * t13;
+    t2 = t9 - t11;
+    t14 = t5 - t10;
+    t7 = C17 * t14;
+    t0 = t4 - t1;
+    t8 = C17 * t0;
+    t11 = t12 + t6;
+    t5 = t9 + t13;
+    t10 = t3 + t8;
+    t14 = t2 - t7;
+    t4 = t3 - t8;
+    t1 = t2 + t7;
+    re[6] = t11;
+    im[6] = t5;
+    re[16] = t10;
+    im[16] = t14;
+    re[26] = t4;
+    im[26] = t1;
+    t0 = re[12];
+    t12 = im[12];
+    t6 = re[22];
+    t9 = im[22];
+    t13 = re[2];
+    t3 = im[2];
+    t8 = t6 + t13;
+    t2 = t9 + t3;
+    t7 = C16 * t8;
+    t11 = t0 - t7;
+    t5 = C16 * t2;
+    t10 = t12 - t5;
+    t14 = t6 - t13;
+    t4 = C17 * t14;
+    t1 = t9 - t3;
+    t7 = C17 * t1;
+    t5 = t0 + t8;
+    t6 = t12 + t2;
+    t13 = t11 + t7;
+    t14 = t10 - t4;
+    t9 = t11 - t7;
+    t3 = t10 + t4;
+    re[12] = t5;
+    im[12] = t6;
+    re[22] = t13;
+    im[22] = t14;
+    re[2] = t9;
+    im[2] = t3;
+    t1 = re[18];
+    t0 = im[18];
+    t8 = re[28];
+    t12 = im[28];
+    t2 = re[8];
+    t11 = im[8];
+    t7 = t8 + t2;
+    t10 = t12 + t11;
+    t4 = C16 * t7;
+    t5 = t1 - t4;
+    t6 = C16 * t10;
+    t13 = t0 - t6;
+    t14 = t8 - t2;
+    t9 = C17 * t14;
+    t3 = t12 - t11;
+    t4 = C17 * t3;
+    t6 = t1 + t7;
+    t8 = t0 + t10;
+    t2 = t5 + t4;
+    t14 = t13 - t9;
+    t12 = t5 - t4;
+    t11 = t13 + t9;
+    re[18] = t6;
+    im[18] = t8;
+    re[28] = t2;
+    im[28] = t14;
+    re[8] = t12;
+    im[8] = t11;
+    t3 = re[24];
+    t1 = im[24];
+    t7 = re[4];
+    t0 = im[4];
+    t10 = re[14];
+    t5 = im[14];
+    t4 = t7 + t10;
+    t13 = t0 + t5;
+    t9 = C16 * t4;
+    t6 = t3 - t9;
+    t8 = C16 * t13;
+    t2 = t1 - t8;
+    t14 = t7 - t10;
+    t12 = C17 * t14;
+    t11 = t0 - t5;
+    t9 = C17 * t11;
+    t8 = t3 + t4;
+    t7 = t1 + t13;
+    t10 = t6 + t9;
+    t14 = t2 - t12;
+    t0 = t6 - t9;
+    t5 = t2 + t12;
+    re[24] = t8;
+    im[24] = t7;
+    re[4] = t10;
+    im[4] = t14;
+    re[14] = t0;
+    im[14] = t5;
+    t11 = X[30];
+    t3 = X[29];
+    t4 = C18 * t11;
+    t1 = C19 * t3;
+    t13 = t4 + t1;
+    t6 = (-C19) * t11;
+    t9 = C18 * t3;
+    t2 = t6 + t9;
+    t12 = X[42];
+    t8 = X[17];
+    t7 = C20 * t12;
+    t10 = C21 * t8;
+    t14 = t7 + t10;
+    t0 = (-C21) * t12;
+    t5 = C20 * t8;
+    t4 = t0 + t5;
+    t1 = X[54];
+    t11 = X[5];
+    t3 = C22 * t1;
+    t6 = C23 * t11;
+    t9 = t3 + t6;
+    t7 = (-C23) * t1;
+    t10 = C22 * t11;
+    t12 = t7 + t10;
+    t8 = X[6];
+    t0 = X[53];
+    t5 = C23 * t8;
+    t3 = C22 * t0;
+    t6 = t5 + t3;
+    t1 = (-C22) * t8;
+    t11 = C23 * t0;
+    t7 = t1 + t11;
+    t10 = X[18];
+    t5 = X[41];
+    t3 = C21 * t10;
+    t8 = C20 * t5;
+    t0 = t3 + t8;
+    t1 = (-C20) * t10;
+    t11 = C21 * t5;
+    t3 = t1 + t11;
+    t8 = t14 + t0;
+    t10 = t4 + t3;
+    t5 = t9 + t6;
+    t1 = t12 + t7;
+    t11 = t14 - t0;
+    t14 = t4 - t3;
+    t0 = t9 - t6;
+    t4 = t12 - t7;
+    t3 = t8 + t5;
+    t9 = t10 + t1;
+    t6 = t8 - t5;
+    t12 = C4 * t6;
+    t7 = t10 - t1;
+    t8 = C4 * t7;
+    t5 = C5 * t3;
+    t6 = t13 - t5;
+    t10 = C5 * t9;
+    t1 = t2 - t10;
+    t7 = t6 + t12;
+    t5 = t1 + t8;
+    t10 = t6 - t12;
+    t6 = t1 - t8;
+    t12 = C0 * t11;
+    t1 = C3 * t0;
+    t8 = t12 + t1;
+    t12 = C0 * t14;
+    t1 = C3 * t4;
+    t12 = t12 + t1;
+    t1 = C3 * t11;
+    t11 = C0 * t0;
+    t0 = t1 - t11;
+    t1 = C3 * t14;
+    t11 = C0 * t4;
+    t14 = t1 - t11;
+    t4 = t13 + t3;
+    t1 = t2 + t9;
+    t11 = t7 + t12;
+    t13 = t5 - t8;
+    t3 = t10 + t14;
+    t2 = t6 - t0;
+    t9 = t10 - t14;
+    t10 = t6 + t0;
+    t14 = t7 - t12;
+    t6 = t5 + t8;
+    re[15] = t4;
+    im[15] = t1;
+    re[21] = t11;
+    im[21] = t13;
+    re[27] = t3;
+    im[27] = t2;
+    re[3] = t9;
+    im[3] = t10;
+    re[9] = t14;
+    im[9] = t6;
+    t0 = X[50];
+    t7 = X[9];
+    t12 = C24 * t0;
+    t5 = C25 * t7;
+    t8 = t12 + t5;
+    t4 = (-C25) * t0;
+    t1 = C24 * t7;
+    t11 = t4 + t1;
+    t13 = X[2];
+    t3 = X[57];
+    t2 = C26 * t13;
+    t9 = C27 * t3;
+    t10 = t2 + t9;
+    t14 = (-C27) * t13;
+    t6 = C26 * t3;
+    t12 = t14 + t6;
+    t5 = X[14];
+    t0 = X[45];
+    t7 = C28 * t5;
+    t4 = C29 * t0;
+    t1 = t7 + t4;
+    t2 = (-C29) * t5;
+    t9 = C28 * t0;
+    t13 = t2 + t9;
+    t3 = X[26];
+    t14 = X[33];
+    t6 = C30 * t3;
+    t7 = C31 * t14;
+    t4 = t6 + t7;
+    t5 = (-C31) * t3;
+    t0 = C30 * t14;
+    t2 = t5 + t0;
+    t9 = X[38];
+    t6 = X[21];
+    t7 = C32 * t9;
+    t3 = C33 * t6;
+    t14 = t7 + t3;
+    t5 = (-C33) * t9;
+    t0 = C32 * t6;
+    t7 = t5 + t0;
+    t3 = t10 + t14;
+    t9 = t12 + t7;
+    t6 = t1 + t4;
+    t5 = t13 + t2;
+    t0 = t10 - t14;
+    t10 = t12 - t7;
+    t14 = t1 - t4;
+    t12 = t13 - t2;
+    t7 = t3 + t6;
+    t1 = t9 + t5;
+    t4 = t3 - t6;
+    t13 = C4 * t4;
+    t2 = t9 - t5;
+    t3 = C4 * t2;
+    t6 = C5 * t7;
+    t4 = t8 - t6;
+    t9 = C5 * t1;
+    t5 = t11 - t9;
+    t2 = t4 + t13;
+    t6 = t5 + t3;
+    t9 = t4 - t13;
+    t4 = t5 - t3;
+    t13 = C0 * t0;
+    t5 = C3 * t14;
+    t3 = t13 + t5;
+    t13 = C0 * t10;
+    t5 = C3 * t12;
+    t13 = t13 + t5;
+    t5 = C3 * t0;
+    t0 = C0 * t14;
+    t14 = t5 - t0;
+    t5 = C3 * t10;
+    t0 = C0 * t12;
+    t10 = t5 - t0;
+    t12 = t8 + t7;
+    t5 = t11 + t1;
+    t0 = t2 + t13;
+    t8 = t6 - t3;
+    t7 = t9 + t10;
+    t11 = t4 - t14;
+    t1 = t9 - t10;
+    t9 = t4 + t14;
+    t10 = t2 - t13;
+    t4 = t6 + t3;
+    re[25] = t12;
+    im[25] = t5;
+    re[1] = t0;
+    im[1] = t8;
+    re[7] = t7;
+    im[7] = t11;
+    re[13] = t1;
+    im[13] = t9;
+    re[19] = t10;
+    im[19] = t4;
+    t14 = X[10];
+    t2 = X[49];
+    t13 = C25 * t14;
+    t6 = C24 * t2;
+    t3 = t13 + t6;
+    t12 = (-C24) * t14;
+    t5 = C25 * t2;
+    t0 = t12 + t5;
+    t8 = X[22];
+    t7 = X[37];
+    t11 = C33 * t8;
+    t1 = C32 * t7;
+    t9 = t11 + t1;
+    t10 = (-C32) * t8;
+    t4 = C33 * t7;
+    t13 = t10 + t4;
+    t6 = X[34];
+    t14 = X[25];
+    t2 = C31 * t6;
+    t12 = C30 * t14;
+    t5 = t2 + t12;
+    t11 = (-C30) * t6;
+    t1 = C31 * t14;
+    t8 = t11 + t1;
+    t7 = X[46];
+    t10 = X[13];
+    t4 = C29 * t7;
+    t2 = C28 * t10;
+    t12 = t4 + t2;
+    t6 = (-C28) * t7;
+    t14 = C29 * t10;
+    t11 = t6 + t14;
+    t1 = X[58];
+    t4 = X[1];
+    t2 = C27 * t1;
+    t7 = C26 * t4;
+    t10 = t2 + t7;
+    t6 = (-C26) * t1;
+    t14 = C27 * t4;
+    t2 = t6 + t14;
+    t7 = t9 + t10;
+    t1 = t13 + t2;
+    t4 = t5 + t12;
+    t6 = t8 + t11;
+    t14 = t9 - t10;
+    t9 = t13 - t2;
+    t10 = t5 - t12;
+    t13 = t8 - t11;
+    t2 = t7 + t4;
+    t5 = t1 + t6;
+    t12 = t7 - t4;
+    t8 = C4 * t12;
+    t11 = t1 - t6;
+    t7 = C4 * t11;
+    t4 = C5 * t2;
+    t12 = t3 - t4;
+    t1 = C5 * t5;
+    t6 = t0 - t1;
+    t11 = t12 + t8;
+    t4 = t6 + t7;
+    t1 = t12 - t8;
+    t12 = t6 - t7;
+    t8 = C0 * t14;
+    t6 = C3 * t10;
+    t7 = t8 + t6;
+    t8 = C0 * t9;
+    t6 = C3 * t13;
+    t8 = t8 + t6;
+    t6 = C3 * t14;
+    t14 = C0 * t10;
+    t10 = t6 - t14;
+    t6 = C3 * t9;
+    t14 = C0 * t13;
+    t9 = t6 - t14;
+    t13 = t3 + t2;
+    t6 = t0 + t5;
+    t14 = t11 + t8;
+    t3 = t4 - t7;
+    t2 = t1 + t9;
+    t0 = t12 - t10;
+    t5 = t1 - t9;
+    t1 = t12 + t10;
+    t9 = t11 - t8;
+    t12 = t4 + t7;
+    re[5] = t13;
+    im[5] = t6;
+    re[11] = t14;
+    im[11] = t3;
+    re[17] = t2;
+    im[17] = t0;
+    re[23] = t5;
+    im[23] = t1;
+    re[29] = t9;
+    im[29] = t12;
+    t10 = re[15];
+    t11 = im[15];
+    t8 = re[25];
+    t4 = im[25];
+    t7 = re[5];
+    t13 = im[5];
+    t6 = t8 + t7;
+    t14 = t4 + t13;
+    t3 = C16 * t6;
+    t2 = t10 - t3;
+    t0 = C16 * t14;
+    t5 = t11 - t0;
+    t1 = t8 - t7;
+    t9 = C17 * t1;
+    t12 = t4 - t13;
+    t3 = C17 * t12;
+    t0 = t10 + t6;
+    t8 = t11 + t14;
+    t7 = t2 + t3;
+    t1 = t5 - t9;
+    t4 = t2 - t3;
+    t13 = t5 + t9;
+    re[15] = t0;
+    im[15] = t8;
+    re[25] = t7;
+    im[25] = t1;
+    re[5] = t4;
+    im[5] = t13;
+    t12 = re[21];
+    t10 = im[21];
+    t6 = re[1];
+    t11 = im[1];
+    t14 = re[11];
+    t2 = im[11];
+    t3 = t6 + t14;
+    t5 = t11 + t2;
+    t9 = C16 * t3;
+    t0 = t12 - t9;
+    t8 = C16 * t5;
+    t7 = t10 - t8;
+    t1 = t6 - t14;
+    t4 = C17 * t1;
+    t13 = t11 - t2;
+    t9 = C17 * t13;
+    t8 = t12 + t3;
+    t6 = t10 + t5;
+    t14 = t0 + t9;
+    t1 = t7 - t4;
+    t11 = t0 - t9;
+    t2 = t7 + t4;
+    re[21] = t8;
+    im[21] = t6;
+    re[1] = t14;
+    im[1] = t1;
+    re[11] = t11;
+    im[11] = t2;
+    t13 = re[27];
+    t12 = im[27];
+    t3 = re[7];
+    t10 = im[7];
+    t5 = re[17];
+    t0 = im[17];
+    t9 = t3 + t5;
+    t7 = t10 + t0;
+    t4 = C16 * t9;
+    t8 = t13 - t4;
+    t6 = C16 * t7;
+    t14 = t12 - t6;
+    t1 = t3 - t5;
+    t11 = C17 * t1;
+    t2 = t10 - t0;
+    t4 = C17 * t2;
+    t6 = t13 + t9;
+    t3 = t12 + t7;
+    t5 = t8 + t4;
+    t1 = t14 - t11;
+    t10 = t8 - t4;
+    t0 = t14 + t11;
+    re[27] = t6;
+    im[27] = t3;
+    re[7] = t5;
+    im[7] = t1;
+    re[17] = t10;
+    im[17] = t0;
+    t2 = re[3];
+    t13 = im[3];
+    t9 = re[13];
+    t12 = im[13];
+    t7 = re[23];
+    t8 = im[23];
+    t4 = t9 + t7;
+    t14 = t12 + t8;
+    t11 = C16 * t4;
+    t6 = t2 - t11;
+    t3 = C16 * t14;
+    t5 = t13 - t3;
+    t1 = t9 - t7;
+    t10 = C17 * t1;
+    t0 = t12 - t8;
+    t11 = C17 * t0;
+    t3 = t2 + t4;
+    t9 = t13 + t14;
+    t7 = t6 + t11;
+    t1 = t5 - t10;
+    t12 = t6 - t11;
+    t8 = t5 + t10;
+    re[3] = t3;
+    im[3] = t9;
+    re[13] = t7;
+    im[13] = t1;
+    re[23] = t12;
+    im[23] = t8;
+    t0 = re[9];
+    t2 = im[9];
+    t4 = re[19];
+    t13 = im[19];
+    t14 = re[29];
+    t6 = im[29];
+    t11 = t4 + t14;
+    t5 = t13 + t6;
+    t10 = C16 * t11;
+    t3 = t0 - t10;
+    t9 = C16 * t5;
+    t7 = t2 - t9;
+    t1 = t4 - t14;
+    t12 = C17 * t1;
+    t8 = t13 - t6;
+    t10 = C17 * t8;
+    t9 = t0 + t11;
+    t4 = t2 + t5;
+    t14 = t3 + t10;
+    t1 = t7 - t12;
+    t13 = t3 - t10;
+    t6 = t7 + t12;
+    re[9] = t9;
+    im[9] = t4;
+    re[19] = t14;
+    im[19] = t1;
+    re[29] = t13;
+    im[29] = t6;
+    t8 = re[0];
+    t0 = im[0];
+    t11 = re[15];
+    t2 = im[15];
+    t5 = t8 - t11;
+    t3 = t0 - t2;
+    t10 = t8 + t11;
+    t7 = t0 + t2;
+    t12 = (-C34) * t10;
+    t9 = (-C35) * t7;
+    t4 = t12 + t9;
+    t14 = 0.1795521666768575 * t4;
+    y[89] = t14;
+    t1 = 0.17501560311188089 * t4;
+    y[90] = t1;
+    t13 = C35 * t10;
+    t6 = (-C34) * t7;
+    t8 = t13 + t6;
+    t11 = 0.08961357286597628 * t8;
+    y[29] = t11;
+    t0 = (-0.0982976711328055) * t8;
+    y[30] = t0;
+    t2 = C36 * t5;
+    t12 = C37 * t3;
+    t9 = t2 + t12;
+    y[0] = 0;
+    t14 = (-0.18279507252104432) * t9;
+    y[59] = t14;
+    t4 = (-C37) * t5;
+    t1 = C36 * t3;
+    t10 = t4 + t1;
+    t7 = 0.182353566065058 * t10;
+    y[60] = t7;
+    t13 = 0.0005387049616190917 * t10;
+    y[119] = t13;
+    t6 = re[16];
+    t11 = im[16];
+    t8 = re[1];
+    t0 = im[1];
+    t2 = t6 - t8;
+    t12 = t11 - t0;
+    t9 = t6 + t8;
+    t14 = t11 + t0;
+    t5 = C38 * t9;
+    t3 = C39 * t14;
+    t4 = t5 + t3;
+    y[2] = 0;
+    t1 = (-0.18362578326988763) * t4;
+    y[57] = t1;
+    t7 = (-C39) * t9;
+    t10 = C38 * t14;
+    t13 = t7 + t10;
+    t6 = 0.1815286107416681 * t13;
+    y[62] = t6;
+    t8 = 0.0025139620716803624 * t13;
+    y[117] = t8;
+    t11 = (-C40) * t2;
+    t0 = (-C41) * t12;
+    t5 = t11 + t0;
+    t3 = 0.18674670109216623 * t5;
+    y[87] = t3;
+    t4 = 0.16413006955700235 * t5;
+    y[92] = t4;
+    t1 = C41 * t2;
+    t9 = (-C40) * t12;
+    t14 = t1 + t9;
+    t7 = 0.07213342204735264 * t14;
+    y[27] = t7;
+    t10 = (-0.11509745355399177) * t14;
+    y[32] = t10;
+    t6 = re[2];
+    t13 = im[2];
+    t8 = re[17];
+    t11 = im[17];
+    t0 = t6 - t8;
+    t3 = t13 - t11;
+    t5 = t6 + t8;
+    t4 = t13 + t11;
+    t2 = (-C42) * t5;
+    t12 = (-C43) * t4;
+    t1 = t2 + t12;
+    t9 = 0.1914469104538762 * t1;
+    y[85] = t9;
+    t7 = 0.15102971789307787 * t1;
+    y[94] = t7;
+    t14 = C43 * t5;
+    t10 = (-C42) * t4;
+    t6 = t14 + t10;
+    t8 = 0.05517331833427295 * t6;
+    y[25] = t8;
+    t13 = (-0.13058723471072306) * t6;
+    y[34] = t13;
+    t11 = C44 * t0;
+    t2 = C45 * t3;
+    t12 = t11 + t2;
+    y[4] = 0;
+    t9 = (-0.18423686562900543) * t12;
+    y[55] = t9;
+    t1 = (-C45) * t0;
+    t7 = C44 * t3;
+    t5 = t1 + t7;
+    t4 = 0.18092651120355077 * t5;
+    y[64] = t4;
+    t14 = 0.006463787641779946 * t5;
+    y[115] = t14;
+    t10 = re[18];
+    t8 = im[18];
+    t6 = re[3];
+    t13 = im[3];
+    t11 = t10 - t6;
+    t2 = t8 - t13;
+    t12 = t10 + t6;
+    t9 = t8 + t13;
+    t0 = C46 * t12;
+    t3 = C47 * t9;
+    t1 = t0 + t3;
+    y[6] = 0;
+    t7 = (-0.18445141939825818) * t1;
+    y[53] = t7;
+    t4 = (-C47) * t12;
+    t5 = C46 * t9;
+    t14 = t4 + t5;
+    t10 = 0.18071605760518256 * t14;
+    y[66] = t10;
+    t6 = 0.012683361002319041 * t14;
+    y[113] = t6;
+    t8 = (-C48) * t11;
+    t13 = (-C49) * t2;
+    t0 = t8 + t13;
+    t3 = 0.19380134918645378 * t0;
+    y[83] = t3;
+    t1 = 0.1360617101761793 * t0;
+    y[96] = t1;
+    t7 = C49 * t11;
+    t12 = (-C48) * t2;
+    t9 = t7 + t12;
+    t4 = 0.03955313022448558 * t9;
+    y[23] = t4;
+    t5 = (-0.144228442730173) * t9;
+    y[36] = t5;
+    t10 = re[4];
+    t14 = im[4];
+    t6 = re[19];
+    t8 = im[19];
+    t13 = t10 - t6;
+    t3 = t14 - t8;
+    t0 = t10 + t6;
+    t1 = t14 + t8;
+    t11 = (-C50) * t0;
+    t2 = (-C51) * t1;
+    t7 = t11 + t2;
+    t12 = 0.19412377916603285 * t7;
+    y[81] = t12;
+    t4 = 0.11970860196080667 * t7;
+    y[98] = t4;
+    t9 = C51 * t0;
+    t5 = (-C50) * t1;
+    t10 = t9 + t5;
+    t6 = 0.026013269889367942 * t10;
+    y[21] = t6;
+    t14 = (-0.1556703732653049) * t10;
+    y[38] = t14;
+    t8 = C52 * t13;
+    t11 = C53 * t3;
+    t2 = t8 + t11;
+    y[8] = 0;
+    t12 = (-0.18410532820966186) * t2;
+    y[51] = t12;
+    t7 = (-C53) * t13;
+    t4 = C52 * t3;
+    t0 = t7 + t4;
+    t1 = 0.18105577745893833 * t0;
+    y[68] = t1;
+    t9 = 0.021288985314161225 * t0;
+    y[111] = t9;
+    t5 = re[20];
+    t6 = im[20];
+    t10 = re[5];
+    t14 = im[5];
+    t8 = t5 - t10;
+    t11 = t6 - t14;
+    t2 = t5 + t10;
+    t12 = t6 + t14;
+    t13 = C54 * t2;
+    t3 = C55 * t12;
+    t7 = t13 + t3;
+    y[10] = 0;
+    t4 = (-0.1830667100373109) * t7;
+    y[49] = t4;
+    t1 = (-C55) * t2;
+    t0 = C54 * t12;
+    t9 = t1 + t0;
+    t5 = 0.1820829867240179 * t9;
+    y[70] = t5;
+    t10 = 0.03226289873076736 * t9;
+    y[109] = t10;
+    t6 = (-C56) * t8;
+    t14 = (-C57) * t11;
+    t13 = t6 + t14;
+    t3 = 0.19287792394501402 * t13;
+    y[79] = t3;
+    t7 = 0.10255375335014265 * t13;
+    y[100] = t7;
+    t4 = C57 * t8;
+    t2 = (-C56) * t11;
+    t12 = t4 + t2;
+    t1 = 0.015098811535528705 * t12;
+    y[19] = t1;
+    t0 = (-0.1647928020435337) * t12;
+    y[40] = t0;
+    t5 = re[6];
+    t9 = im[6];
+    t10 = re[21];
+    t6 = im[21];
+    t14 = t5 - t10;
+    t3 = t9 - t6;
+    t13 = t5 + t10;
+    t7 = t9 + t6;
+    t8 = (-C58) * t13;
+    t11 = (-C59) * t7;
+    t4 = t8 + t11;
+    t2 = 0.19059363737433666 * t4;
+    y[77] = t2;
+    t1 = 0.08524478525982011 * t4;
+    y[102] = t1;
+    t12 = C59 * t13;
+    t0 = (-C58) * t7;
+    t5 = t12 + t0;
+    t10 = 0.007157471297881811 * t5;
+    y[17] = t10;
+    t9 = (-0.17169091623594895) * t5;
+    y[42] = t9;
+    t6 = C60 * t14;
+    t8 = C61 * t3;
+    t11 = t6 + t8;
+    y[12] = 0;
+    t2 = (-0.1812556326538762) * t11;
+    y[47] = t2;
+    t4 = (-C61) * t14;
+    t1 = C60 * t3;
+    t13 = t4 + t1;
+    t7 = 0.1839023308974143 * t13;
+    y[72] = t7;
+    t12 = 0.04541872724633372 * t13;
+    y[107] = t12;
+    t0 = re[22];
+    t10 = im[22];
+    t5 = re[7];
+    t9 = im[7];
+    t6 = t0 - t5;
+    t8 = t10 - t9;
+    t11 = t0 + t5;
+    t2 = t10 + t9;
+    t14 = C62 * t11;
+    t3 = C63 * t2;
+    t4 = t14 + t3;
+    t1 = 0.0009779866716855938 * t4;
+    y[14] = t1;
+    t7 = (-0.1784907616084507) * t4;
+    y[45] = t7;
+    t13 = (-C63) * t11;
+    t12 = C62 * t2;
+    t0 = t13 + t12;
+    t5 = 0.18642008548431918 * t0;
+    y[74] = t5;
+    t10 = 0.060399898930011374 * t0;
+    y[105] = t10;
+    t9 = (-C64) * t6;
+    t14 = (-C65) * t8;
+    t3 = t9 + t14;
+    t1 = 0.18781930003974687 * t3;
+    y[75] = t1;
+    t4 = 0.06843146028419504 * t3;
+    y[104] = t4;
+    t7 = C65 * t6;
+    t11 = (-C64) * t8;
+    t2 = t7 + t11;
+    t13 = 0.0023182580612160957 * t2;
+    y[15] = t13;
+    t12 = (-0.17663089758011127) * t2;
+    y[44] = t12;
+    t5 = re[8];
+    t0 = im[8];
+    t10 = re[23];
+    t9 = im[23];
+    t14 = t5 - t10;
+    t1 = t0 - t9;
+    t3 = t5 + t10;
+    t4 = t0 + t9;
+    t6 = (-C66) * t3;
+    t8 = (-C67) * t4;
+    t7 = t6 + t8;
+    t11 = 0.1851314261879037 * t7;
+    y[73] = t11;
+    t13 = 0.05270936860113942 * t7;
+    y[106] = t13;
+    t2 = C67 * t3;
+    t12 = (-C66) * t4;
+    t5 = t2 + t12;
+    y[13] = 0;
+    t10 = (-0.18005226891895088) * t5;
+    y[46] = t10;
+    t0 = C68 * t14;
+    t9 = C69 * t1;
+    t6 = t0 + t9;
+    t8 = 0.004356751500885387 * t6;
+    y[16] = t8;
+    t11 = (-0.1743820319847075) * t6;
+    y[43] = t11;
+    t7 = (-C69) * t14;
+    t13 = C68 * t1;
+    t3 = t7 + t13;
+    t4 = 0.18923398933022872 * t3;
+    y[76] = t4;
+    t2 = 0.076737393282048 * t3;
+    y[103] = t2;
+    t12 = re[24];
+    t5 = im[24];
+    t10 = re[9];
+    t0 = im[9];
+    t9 = t12 - t10;
+    t8 = t5 - t0;
+    t6 = t12 + t10;
+    t11 = t5 + t0;
+    t14 = C70 * t6;
+    t1 = C71 * t11;
+    t7 = t14 + t1;
+    t13 = 0.010741469529411594 * t7;
+    y[18] = t13;
+    t4 = (-0.1685085390983906) * t7;
+    y[41] = t4;
+    t3 = (-C71) * t6;
+    t2 = C70 * t11;
+    t12 = t3 + t2;
+    t10 = 0.19182978437059417 * t12;
+    y[78] = t10;
+    t5 = 0.09387697006672642 * t12;
+    y[101] = t5;
+    t0 = (-C72) * t9;
+    t14 = (-C73) * t8;
+    t1 = t0 + t14;
+    t13 = 0.18288866940224452 * t1;
+    y[71] = t13;
+    t7 = 0.03858576756782317 * t1;
+    y[108] = t7;
+    t4 = C73 * t9;
+    t6 = (-C72) * t8;
+    t11 = t4 + t6;
+    y[11] = 0;
+    t3 = (-0.1822602430335372) * t11;
+    y[48] = t3;
+    t2 = re[10];
+    t10 = im[10];
+    t12 = re[25];
+    t5 = im[25];
+    t0 = t2 - t12;
+    t14 = t10 - t5;
+    t13 = t2 + t12;
+    t1 = t10 + t5;
+    t7 = (-C74) * t13;
+    t9 = (-C75) * t1;
+    t8 = t7 + t9;
+    t4 = 0.1814760310014786 * t8;
+    y[69] = t4;
+    t6 = 0.026486684544218566 * t8;
+    y[110] = t6;
+    t11 = C75 * t13;
+    t3 = (-C74) * t1;
+    t2 = t11 + t3;
+    y[9] = 0;
+    t12 = (-0.18367898586597228) * t2;
+    y[50] = t12;
+    t10 = C76 * t0;
+    t5 = C77 * t14;
+    t7 = t10 + t5;
+    t9 = 0.020202234291642814 * t7;
+    y[20] = t9;
+    t4 = (-0.16051971504837198) * t7;
+    y[39] = t4;
+    t8 = (-C77) * t0;
+    t6 = C76 * t14;
+    t13 = t8 + t6;
+    t1 = 0.19366466358128057 * t13;
+    y[80] = t1;
+    t11 = 0.11119248930087926 * t13;
+    y[99] = t11;
+    t3 = re[26];
+    t2 = im[26];
+    t12 = re[11];
+    t10 = im[11];
+    t5 = t3 - t12;
+    t9 = t2 - t10;
+    t7 = t3 + t12;
+    t4 = t2 + t10;
+    t0 = C78 * t7;
+    t14 = C79 * t4;
+    t8 = t0 + t14;
+    t6 = 0.03248398647858071 * t8;
+    y[22] = t6;
+    t1 = (-0.15023687820426296) * t8;
+    y[37] = t1;
+    t13 = (-C79) * t7;
+    t11 = C78 * t4;
+    t3 = t13 + t11;
+    t12 = 0.1941906114953003 * t3;
+    y[82] = t12;
+    t2 = 0.1280243755933322 * t3;
+    y[97] = t2;
+    t10 = (-C80) * t5;
+    t0 = (-C81) * t9;
+    t14 = t10 + t0;
+    t6 = 0.18080783992826 * t14;
+    y[67] = t6;
+    t8 = 0.016685167796922855 * t14;
+    y[112] = t8;
+    t1 = C81 * t5;
+    t7 = (-C80) * t9;
+    t4 = t1 + t7;
+    y[7] = 0;
+    t13 = (-0.18435778750832454) * t4;
+    y[52] = t13;
+    t11 = re[12];
+    t12 = im[12];
+    t3 = re[27];
+    t2 = im[27];
+    t10 = t11 - t3;
+    t0 = t12 - t2;
+    t6 = t11 + t3;
+    t14 = t12 + t2;
+    t8 = (-C82) * t6;
+    t5 = (-C83) * t14;
+    t9 = t8 + t5;
+    t1 = 0.18076208847396763 * t9;
+    y[65] = t1;
+    t7 = 0.00928005057681454 * t9;
+    y[114] = t7;
+    t4 = C83 * t6;
+    t13 = (-C82) * t14;
+    t11 = t4 + t13;
+    y[5] = 0;
+    t3 = (-0.184404449045375) * t11;
+    y[54] = t3;
+    t12 = C84 * t10;
+    t2 = C85 * t0;
+    t8 = t12 + t2;
+    t5 = 0.047145662898518244 * t8;
+    y[24] = t5;
+    t1 = (-0.13766647316940633) * t8;
+    y[35] = t1;
+    t9 = (-C85) * t10;
+    t7 = C84 * t0;
+    t6 = t9 + t7;
+    t14 = 0.1929009183481501 * t6;
+    y[84] = t14;
+    t4 = 0.14375329174588652 * t6;
+    y[95] = t4;
+    t13 = re[28];
+    t11 = im[28];
+    t3 = re[13];
+    t12 = im[13];
+    t2 = t13 - t3;
+    t5 = t11 - t12;
+    t8 = t13 + t3;
+    t1 = t11 + t12;
+    t10 = C86 * t8;
+    t0 = C87 * t1;
+    t9 = t10 + t0;
+    t7 = 0.06353660962653118 * t9;
+    y[26] = t7;
+    t14 = (-0.12304348287400062) * t9;
+    y[33] = t14;
+    t6 = (-C87) * t8;
+    t4 = C86 * t1;
+    t13 = t6 + t4;
+    t3 = 0.189403363756341 * t13;
+    y[86] = t3;
+    t11 = 0.1578378803598341 * t13;
+    y[93] = t11;
+    t12 = (-C88) * t2;
+    t10 = (-C89) * t5;
+    t0 = t12 + t10;
+    t7 = 0.1811889683247694 * t0;
+    y[63] = t7;
+    t9 = 0.004216615754145715 * t0;
+    y[116] = t9;
+    t14 = C89 * t2;
+    t8 = (-C88) * t5;
+    t1 = t14 + t8;
+    y[3] = 0;
+    t6 = (-0.18396999354610546) * t1;
+    y[56] = t6;
+    t4 = re[14];
+    t3 = im[14];
+    t13 = re[29];
+    t11 = im[29];
+    t12 = t4 - t13;
+    t10 = t3 - t11;
+    t7 = t4 + t13;
+    t0 = t3 + t11;
+    t9 = (-C90) * t7;
+    t2 = (-C91) * t0;
+    t5 = t9 + t2;
+    t14 = 0.18192406790224108 * t5;
+    y[61] = t14;
+    t8 = 0.001310044879130404 * t5;
+    y[118] = t8;
+    t1 = C91 * t7;
+    t6 = (-C90) * t0;
+    t4 = t1 + t6;
+    y[1] = 0;
+    t13 = (-0.18322662700817216) * t4;
+    y[58] = t13;
+    t3 = C92 * t12;
+    t11 = C93 * t10;
+    t9 = t3 + t11;
+    t2 = 0.08085951859910284 * t9;
+    y[28] = t2;
+    t14 = (-0.10682029613194247) * t9;
+    y[31] = t14;
+    t5 = (-C93) * t12;
+    t8 = C92 * t10;
+    t7 = t5 + t8;
+    t0 = 0.18346566514736667 * t7;
+    y[88] = t0;
+    t1 = 0.16986839509084428 * t7;
+    y[91] = t1;
+}
+
+//  Export public APIs.
+module.exports = {
+    "ApplyWindowedMDCT_W75_60": ApplyWindowedMDCT_W75_60,
+    "ApplyWindowedIMDCT_W75_60": ApplyWindowedIMDCT_W75_60
+};
\ No newline at end of file
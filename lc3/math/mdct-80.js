@@ -0,0 +1,3570 @@
+//
+//  Copyright 2021 - 2023 XiaoJSoft Studio. All rights reserved.
+//  Use of this source code is governed by a BSD-style license that can be
+//  found in the LICENSE.md file.
+//
+
+//
+//  Note(s):
+//    [1] This file is generated automatically by a MDCT compiler, which locates 
+//        at "./../../dev/mdct-generator/" directory.
+//        Do NOT modify this file manually.
+//
+
+//
+//  Public functions.
+//
+
+/**
+ *  Apply LD-MDCT transform (prebuilt for window W10_80).
+ * 
+ *  Note(s):
+ *    [1] X[k] = SUM(w[n] * x[n] * cos(PI / 80 * (n + 40.5) * (k + 0.5))), where
+ *        w[n] = sqrt(2 / 80) * W10_80[n].
+ *    [2] The size of all arrays will not be checked.
+ * 
+ *  @param {Number[]} x 
+ *    - The input block (160 points).
+ *  @param {Number[]} X 
+ *    - The array that would contain the output block (80 points).
+ *  @param {Number[]} re 
+ *    - The scratch buffer (real part, 40 points).
+ *  @param {Number[]} im 
+ *    - The scratch buffer (imaginary part, 40 points).
+ */
+function ApplyWindowedMDCT_W10_80(x, X, re, im) {
+    let t0, t1, t10, t11, t12, t13, t14, t15, t16, t17, t18, t19, t2, t3, t4, t5, t6, t7, t8, t9;
+    const C0 = 0.19509032201612825;
+    const C1 = 0.9807852804032304;
+    const C2 = 0.3826834323650898;
+    const C3 = 0.9238795325112867;
+    const C4 = 0.5555702330196022;
+    const C5 = 0.8314696123025452;
+    const C6 = 0.7071067811865476;
+    const C7 = 0.3090169943749474;
+    const C8 = 0.9510565162951535;
+    const C9 = 0.4886212414969549;
+    const C10 = 0.8724960070727972;
+    const C11 = 0.6494480483301837;
+    const C12 = 0.7604059656000309;
+    const C13 = 0.619093949309834;
+    const C14 = 0.785316930880745;
+    const C15 = 0.45399049973954675;
+    const C16 = 0.8910065241883679;
+    const C17 = 0.27144044986507426;
+    const C18 = 0.9624552364536473;
+    const C19 = 0.07845909572784494;
+    const C20 = 0.996917333733128;
+    const C21 = 0.9930684569549263;
+    const C22 = 0.11753739745783764;
+    const C23 = 0.5877852522924731;
+    const C24 = 0.8090169943749475;
+    const C25 = 0.6788007455329417;
+    const C26 = 0.7343225094356856;
+    const C27 = 0.5224985647159488;
+    const C28 = 0.8526401643540922;
+    const C29 = 0.34611705707749296;
+    const C30 = 0.9381913359224842;
+    const C31 = 0.15643446504023087;
+    const C32 = 0.9876883405951378;
+    const C33 = 0.9992290362407229;
+    const C34 = 0.03925981575906861;
+    const C35 = 0.2334453638559054;
+    const C36 = 0.9723699203976766;
+    const C37 = 0.41865973753742813;
+    const C38 = 0.9081431738250813;
+    const C39 = 0.5590169943749475;
+    const C40 = 0.25;
+    const C41 = 0.999951808959328;
+    const C42 = 0.009817319337149617;
+    const C43 = 0.8032075314806449;
+    const C44 = 0.5956993044924334;
+    const C45 = 0.2996652769962566;
+    const C46 = 0.9540444024062804;
+    const C47 = 0.9479769653775104;
+    const C48 = 0.3183389280525497;
+    const C49 = 0.5798145481265136;
+    const C50 = 0.8147484825274894;
+    const C51 = 0.5473806568087966;
+    const C52 = 0.8368837533084093;
+    const C53 = 0.9987954562051724;
+    const C54 = 0.049067674327418015;
+    const C55 = 0.7792012426405167;
+    const C56 = 0.6267738216194696;
+    const C57 = 0.26197863846333747;
+    const C58 = 0.9650736723115474;
+    const C59 = 0.9347481818282924;
+    const C60 = 0.3553109012804161;
+    const C61 = 0.9200780843345949;
+    const C62 = 0.3917350108519559;
+    const C63 = 0.5141027441932217;
+    const C64 = 0.8577286100002721;
+    const C65 = 0.9960990332516871;
+    const C66 = 0.08824237052036951;
+    const C67 = 0.7539934819618695;
+    const C68 = 0.6568818989430413;
+    const C69 = 0.22388804785849836;
+    const C70 = 0.974614868564045;
+    const C71 = 0.18545223811159092;
+    const C72 = 0.9826532793307118;
+    const C73 = 0.9039892931234433;
+    const C74 = 0.4275550934302821;
+    const C75 = 0.4800321224090111;
+    const C76 = 0.8772509113449243;
+    const C77 = 0.991866697787626;
+    const C78 = 0.1272810033739132;
+    const C79 = 0.7276231179845748;
+    const C80 = 0.6859771119901928;
+    const C81 = 0.7001308118985237;
+    const C82 = 0.7140145980512682;
+    const C83 = 0.14673047445536175;
+    const C84 = 0.989176509964781;
+    const C85 = 0.8865066159447464;
+    const C86 = 0.4627159170443501;
+    const C87 = 0.4452213258854682;
+    const C88 = 0.895420555368697;
+    const C89 = 0.9861049757675088;
+    const C90 = 0.16612337814576547;
+    const C91 = 0.9788227513490724;
+    const C92 = 0.2047096027093796;
+    const C93 = 0.6715589548470183;
+    const C94 = 0.7409511253549591;
+    const C95 = 0.10778246304275935;
+    const C96 = 0.9941745021174282;
+    const C97 = 0.8676570098195441;
+    const C98 = 0.4971632662526543;
+    const C99 = 0.4097240303476953;
+    const C100 = 0.9122095257974677;
+    const C101 = 0.37359497005251635;
+    const C102 = 0.927591935255724;
+    const C103 = 0.970031253194544;
+    const C104 = 0.24298017990326387;
+    const C105 = 0.641951602562703;
+    const C106 = 0.7667451597285615;
+    const C107 = 0.06866825888437376;
+    const C108 = 0.9976395492470157;
+    const C109 = 0.8474695394742344;
+    const C110 = 0.5308440257395095;
+    const C111 = 0.8259753325248732;
+    const C112 = 0.5637062622150166;
+    const C113 = 0.33688985339222005;
+    const C114 = 0.9415440651830208;
+    const C115 = 0.9597440371568574;
+    const C116 = 0.2808760992712921;
+    const C117 = 0.6113544074368165;
+    const C118 = 0.7913569286406602;
+    const C119 = 0.02944817324796316;
+    const C120 = 0.9995663085020212;
+    t0 = x[119];
+    t0 = 0.09666273325384828 * t0;
+    t1 = x[120];
+    t1 = 0.08389809845214641 * t1;
+    t0 = t0 + t1;
+    t1 = x[39];
+    t1 = 0.13418561361414183 * t1;
+    t2 = x[40];
+    t2 = 0.14216525558046025 * t2;
+    t1 = t1 - t2;
+    t2 = -t0;
+    t3 = x[109];
+    t4 = x[29];
+    t4 = 0.029799508325242533 * t4;
+    t5 = x[50];
+    t5 = 0.15959492397100342 * t5;
+    t4 = t4 - t5;
+    t5 = (-0.15363666587877006) * t3;
+    t6 = C0 * t4;
+    t5 = t5 + t6;
+    t6 = 0.030560232926263677 * t3;
+    t3 = C1 * t4;
+    t4 = t6 + t3;
+    t6 = x[99];
+    t3 = x[19];
+    t3 = (-0.015909267416101474) * t3;
+    t7 = x[60];
+    t7 = 0.1561299466768942 * t7;
+    t3 = t3 - t7;
+    t7 = (-0.14793438929804176) * t6;
+    t8 = C2 * t3;
+    t7 = t7 + t8;
+    t8 = 0.06127643038863015 * t6;
+    t6 = C3 * t3;
+    t3 = t8 + t6;
+    t8 = x[89];
+    t6 = x[9];
+    t6 = (-0.0091621537650263) * t6;
+    t9 = x[70];
+    t9 = 0.15655764735454158 * t9;
+    t6 = t6 - t9;
+    t9 = (-0.13277371408430685) * t8;
+    t10 = C4 * t6;
+    t9 = t9 + t10;
+    t10 = 0.08871655942833857 * t8;
+    t8 = C5 * t6;
+    t6 = t10 + t8;
+    t10 = x[0];
+    t8 = (-0.00011192165058231297) * t10;
+    t10 = x[79];
+    t10 = 0.15796817854693496 * t10;
+    t8 = t8 - t10;
+    t10 = x[80];
+    t11 = C6 * t8;
+    t12 = (-0.11190652251783334) * t10;
+    t11 = t11 + t12;
+    t12 = (-0.7071067811865475) * t8;
+    t8 = (-0.11190652251783335) * t10;
+    t10 = t12 + t8;
+    t12 = x[10];
+    t8 = (-0.010858639707756983) * t12;
+    t12 = x[69];
+    t12 = 0.15654228402108358 * t12;
+    t8 = t8 - t12;
+    t12 = x[90];
+    t13 = C4 * t8;
+    t14 = (-0.13278674472875335) * t12;
+    t13 = t13 + t14;
+    t14 = (-C5) * t8;
+    t8 = (-0.08872526622659606) * t12;
+    t12 = t14 + t8;
+    t14 = x[20];
+    t8 = (-0.014414377050633673) * t14;
+    t14 = x[59];
+    t14 = 0.15612253787644678 * t14;
+    t8 = t8 - t14;
+    t14 = x[100];
+    t15 = C2 * t8;
+    t16 = (-0.1479414095296145) * t14;
+    t15 = t15 + t16;
+    t16 = (-C3) * t8;
+    t8 = (-0.06127933826375857) * t14;
+    t14 = t16 + t8;
+    t16 = x[30];
+    t8 = 0.03883999236386311 * t16;
+    t16 = x[49];
+    t16 = 0.16055513915487243 * t16;
+    t8 = t8 - t16;
+    t16 = x[110];
+    t16 = 0.15532737668361812 * t16;
+    t17 = x[129];
+    t17 = 0.0015806239461963042 * t17;
+    t16 = t16 + t17;
+    t17 = C0 * t8;
+    t18 = (-C1) * t16;
+    t17 = t17 + t18;
+    t18 = (-C1) * t8;
+    t8 = (-C0) * t16;
+    t16 = t18 + t8;
+    t18 = t11 - t0;
+    t8 = t1 + t10;
+    t0 = t7 + t15;
+    t19 = t3 + t14;
+    t2 = t2 - t11;
+    t11 = t1 - t10;
+    t1 = t7 - t15;
+    t10 = t3 - t14;
+    t7 = t18 + t0;
+    t15 = t8 + t19;
+    t3 = t2 + t10;
+    t14 = t11 - t1;
+    t18 = t18 - t0;
+    t0 = t8 - t19;
+    t8 = t2 - t10;
+    t19 = t11 + t1;
+    t2 = t5 + t13;
+    t10 = t4 + t12;
+    t11 = t9 + t17;
+    t1 = t6 + t16;
+    t5 = t5 - t13;
+    t13 = t4 - t12;
+    t4 = t9 - t17;
+    t12 = t6 - t16;
+    t9 = t2 + t11;
+    t17 = t10 + t1;
+    t6 = t5 + t12;
+    t16 = t13 - t4;
+    t2 = t2 - t11;
+    t11 = t10 - t1;
+    t10 = t5 - t12;
+    t1 = t13 + t4;
+    t5 = t6 + t16;
+    t12 = t6 - t16;
+    t13 = C6 * t5;
+    t4 = (-C6) * t12;
+    t6 = t10 - t1;
+    t16 = t10 + t1;
+    t5 = (-C6) * t6;
+    t12 = (-C6) * t16;
+    t10 = t7 - t9;
+    t1 = t15 - t17;
+    t6 = t7 + t9;
+    t16 = t15 + t17;
+    t7 = t3 - t13;
+    t9 = t14 - t4;
+    t15 = t3 + t13;
+    t17 = t14 + t4;
+    t3 = t18 - t11;
+    t13 = t0 + t2;
+    t14 = t18 + t11;
+    t4 = t0 - t2;
+    t18 = t8 - t5;
+    t11 = t19 - t12;
+    t0 = t8 + t5;
+    t2 = t19 + t12;
+    re[0] = t6;
+    im[0] = t16;
+    re[5] = t15;
+    im[5] = t17;
+    re[10] = t14;
+    im[10] = t4;
+    re[15] = t0;
+    im[15] = t2;
+    re[20] = t10;
+    im[20] = t1;
+    re[25] = t7;
+    im[25] = t9;
+    re[30] = t3;
+    im[30] = t13;
+    re[35] = t18;
+    im[35] = t11;
+    t8 = x[103];
+    t5 = x[23];
+    t19 = (-0.006424740791871616) * t5;
+    t12 = x[56];
+    t6 = 0.15639631745730917 * t12;
+    t16 = t19 - t6;
+    t15 = (-0.15202668000075498) * t8;
+    t17 = C7 * t16;
+    t14 = t15 + t17;
+    t4 = 0.04939646268514256 * t8;
+    t0 = C8 * t16;
+    t2 = t4 + t0;
+    t10 = x[93];
+    t1 = x[13];
+    t7 = (-0.015318553056048427) * t1;
+    t9 = x[66];
+    t3 = 0.15647181233545088 * t9;
+    t13 = t7 - t3;
+    t18 = (-0.1394014669559625) * t10;
+    t11 = C9 * t13;
+    t5 = t18 + t11;
+    t12 = 0.07806857257609887 * t10;
+    t19 = C10 * t13;
+    t6 = t12 + t19;
+    t15 = x[83];
+    t17 = x[3];
+    t8 = (-0.0013019059697089003) * t17;
+    t16 = x[76];
+    t4 = 0.15718347876838412 * t16;
+    t0 = t8 - t4;
+    t1 = (-0.12094241258022385) * t15;
+    t9 = C11 * t0;
+    t7 = t1 + t9;
+    t3 = 0.10329457863812298 * t15;
+    t18 = C12 * t0;
+    t11 = t3 + t18;
+    t10 = x[6];
+    t13 = (-0.004428626713515163) * t10;
+    t12 = x[73];
+    t19 = 0.15671139538996476 * t12;
+    t17 = t13 - t19;
+    t16 = x[86];
+    t8 = C13 * t17;
+    t4 = (-0.1252807635536876) * t16;
+    t1 = t8 + t4;
+    t9 = (-C14) * t17;
+    t15 = (-0.09876339046201209) * t16;
+    t0 = t9 + t15;
+    t3 = x[16];
+    t18 = (-0.01744379180388242) * t3;
+    t10 = x[63];
+    t12 = 0.15629441712314787 * t10;
+    t13 = t18 - t12;
+    t19 = x[96];
+    t8 = C15 * t13;
+    t4 = (-0.14252052961788203) * t19;
+    t17 = t8 + t4;
+    t16 = (-C16) * t13;
+    t9 = (-0.0726178369157354) * t19;
+    t15 = t16 + t9;
+    t3 = x[26];
+    t10 = 0.007889466146396002 * t3;
+    t18 = x[53];
+    t12 = 0.15737286494156086 * t18;
+    t8 = t10 - t12;
+    t4 = x[106];
+    t13 = C17 * t8;
+    t19 = (-0.15289408958956283) * t4;
+    t16 = t13 + t19;
+    t9 = (-C18) * t8;
+    t3 = (-0.04312059292525929) * t4;
+    t18 = t9 + t3;
+    t10 = x[36];
+    t12 = 0.10415941412713003 * t10;
+    t13 = x[43];
+    t19 = 0.15802082872576895 * t13;
+    t8 = t12 - t19;
+    t4 = x[116];
+    t9 = 0.12859113334157854 * t4;
+    t3 = x[123];
+    t10 = 0.044930384658902804 * t3;
+    t13 = t9 + t10;
+    t12 = C19 * t8;
+    t19 = (-C20) * t13;
+    t4 = t12 + t19;
+    t3 = (-C20) * t8;
+    t9 = (-C19) * t13;
+    t10 = t3 + t9;
+    t12 = x[113];
+    t19 = 0.14738670767240072 * t12;
+    t8 = x[126];
+    t13 = 0.014993410396791937 * t8;
+    t3 = t19 + t13;
+    t9 = x[33];
+    t12 = 0.07017275641407882 * t9;
+    t8 = x[46];
+    t19 = 0.16248324860908755 * t8;
+    t13 = t12 - t19;
+    t9 = (-C21) * t3;
+    t8 = C22 * t13;
+    t12 = t9 + t8;
+    t19 = C22 * t3;
+    t9 = C21 * t13;
+    t8 = t19 + t9;
+    t3 = t14 + t17;
+    t13 = t2 + t15;
+    t19 = t7 + t4;
+    t9 = t11 + t10;
+    t14 = t14 - t17;
+    t17 = t2 - t15;
+    t2 = t7 - t4;
+    t15 = t11 - t10;
+    t7 = t3 + t19;
+    t4 = t13 + t9;
+    t11 = t14 + t15;
+    t10 = t17 - t2;
+    t3 = t3 - t19;
+    t19 = t13 - t9;
+    t13 = t14 - t15;
+    t9 = t17 + t2;
+    t14 = t5 + t16;
+    t15 = t6 + t18;
+    t17 = t1 + t12;
+    t2 = t0 + t8;
+    t5 = t5 - t16;
+    t16 = t6 - t18;
+    t6 = t1 - t12;
+    t18 = t0 - t8;
+    t1 = t14 + t17;
+    t12 = t15 + t2;
+    t0 = t5 + t18;
+    t8 = t16 - t6;
+    t14 = t14 - t17;
+    t17 = t15 - t2;
+    t15 = t5 - t18;
+    t2 = t16 + t6;
+    t5 = t0 + t8;
+    t18 = t0 - t8;
+    t16 = C6 * t5;
+    t6 = (-C6) * t18;
+    t0 = t15 - t2;
+    t8 = t15 + t2;
+    t5 = (-C6) * t0;
+    t18 = (-C6) * t8;
+    t15 = t7 - t1;
+    t2 = t4 - t12;
+    t0 = t7 + t1;
+    t8 = t4 + t12;
+    t7 = t11 - t16;
+    t1 = t10 - t6;
+    t4 = t11 + t16;
+    t12 = t10 + t6;
+    t11 = t3 - t17;
+    t16 = t19 + t14;
+    t10 = t3 + t17;
+    t6 = t19 - t14;
+    t3 = t13 - t5;
+    t17 = t9 - t18;
+    t19 = t13 + t5;
+    t14 = t9 + t18;
+    re[8] = t0;
+    im[8] = t8;
+    re[13] = t4;
+    im[13] = t12;
+    re[18] = t10;
+    im[18] = t6;
+    re[23] = t19;
+    im[23] = t14;
+    re[28] = t15;
+    im[28] = t2;
+    re[33] = t7;
+    im[33] = t1;
+    re[38] = t11;
+    im[38] = t16;
+    re[3] = t3;
+    im[3] = t17;
+    t13 = x[87];
+    t5 = x[7];
+    t9 = (-0.005884211448476822) * t5;
+    t18 = x[72];
+    t0 = 0.15663241580473444 * t18;
+    t8 = t9 - t0;
+    t4 = (-0.12912668655119056) * t13;
+    t12 = C23 * t8;
+    t10 = t4 + t12;
+    t6 = 0.09381602927985783 * t13;
+    t19 = C24 * t8;
+    t14 = t6 + t19;
+    t15 = x[2];
+    t2 = (-0.0007154966391789613) * t15;
+    t7 = x[77];
+    t1 = 0.15741871596135812 * t7;
+    t11 = t2 - t1;
+    t16 = x[82];
+    t3 = C25 * t11;
+    t17 = (-0.1166193144428807) * t16;
+    t5 = t3 + t17;
+    t18 = (-C26) * t11;
+    t9 = (-0.10780178541469752) * t16;
+    t0 = t18 + t9;
+    t4 = x[12];
+    t12 = (-0.014008424338699877) * t4;
+    t13 = x[67];
+    t8 = 0.15650616949335203 * t13;
+    t6 = t12 - t8;
+    t19 = x[92];
+    t15 = C27 * t6;
+    t7 = (-0.13619912989920668) * t19;
+    t2 = t15 + t7;
+    t1 = (-C28) * t6;
+    t3 = (-0.08346293414620683) * t19;
+    t17 = t1 + t3;
+    t11 = x[22];
+    t16 = (-0.00971876726953771) * t11;
+    t18 = x[57];
+    t9 = 0.15624483061184172 * t18;
+    t4 = t16 - t9;
+    t13 = x[102];
+    t12 = C29 * t4;
+    t8 = (-0.150115580184094) * t13;
+    t15 = t12 + t8;
+    t7 = (-C30) * t4;
+    t6 = (-0.05538056134755427) * t13;
+    t19 = t7 + t6;
+    t1 = x[32];
+    t3 = 0.059160560443338166 * t1;
+    t11 = x[47];
+    t18 = 0.16222349904739322 * t11;
+    t16 = t3 - t18;
+    t9 = x[112];
+    t12 = 0.15094710208915332 * t9;
+    t8 = x[127];
+    t4 = 0.008668493404903221 * t8;
+    t13 = t12 + t4;
+    t7 = C31 * t16;
+    t6 = (-C32) * t13;
+    t1 = t7 + t6;
+    t11 = (-C32) * t16;
+    t3 = (-C31) * t13;
+    t18 = t11 + t3;
+    t9 = x[117];
+    t8 = 0.11928984083002875 * t9;
+    t12 = x[122];
+    t4 = 0.0575394552950557 * t12;
+    t7 = t8 + t4;
+    t6 = x[37];
+    t16 = 0.11495791137224536 * t6;
+    t13 = x[42];
+    t11 = 0.15412363927939443 * t13;
+    t3 = t16 - t11;
+    t9 = (-C33) * t7;
+    t12 = C34 * t3;
+    t8 = t9 + t12;
+    t4 = C34 * t7;
+    t6 = C33 * t3;
+    t13 = t4 + t6;
+    t16 = x[107];
+    t11 = x[27];
+    t9 = 0.014309890259083354 * t11;
+    t12 = x[52];
+    t7 = 0.15793834823672137 * t12;
+    t3 = t9 - t7;
+    t4 = (-0.15391605826791788) * t16;
+    t6 = C35 * t3;
+    t11 = t4 + t6;
+    t12 = 0.03695197627146456 * t16;
+    t9 = C36 * t3;
+    t7 = t12 + t9;
+    t4 = x[97];
+    t6 = x[17];
+    t16 = (-0.017389520617964793) * t6;
+    t3 = x[62];
+    t12 = 0.15622664545694537 * t3;
+    t9 = t16 - t12;
+    t6 = (-0.14532462935001655) * t4;
+    t3 = C37 * t9;
+    t16 = t6 + t3;
+    t12 = 0.06699557177216721 * t4;
+    t6 = C38 * t9;
+    t3 = t12 + t6;
+    t4 = t10 + t1;
+    t9 = t14 + t18;
+    t12 = t2 + t11;
+    t6 = t17 + t7;
+    t10 = t10 - t1;
+    t1 = t14 - t18;
+    t14 = t2 - t11;
+    t18 = t17 - t7;
+    t2 = t4 + t12;
+    t11 = t9 + t6;
+    t17 = t10 + t18;
+    t7 = t1 - t14;
+    t4 = t4 - t12;
+    t12 = t9 - t6;
+    t9 = t10 - t18;
+    t6 = t1 + t14;
+    t10 = t5 + t8;
+    t18 = t0 + t13;
+    t1 = t15 + t16;
+    t14 = t19 + t3;
+    t5 = t5 - t8;
+    t8 = t0 - t13;
+    t0 = t15 - t16;
+    t13 = t19 - t3;
+    t15 = t10 + t1;
+    t16 = t18 + t14;
+    t19 = t5 + t13;
+    t3 = t8 - t0;
+    t10 = t10 - t1;
+    t1 = t18 - t14;
+    t18 = t5 - t13;
+    t14 = t8 + t0;
+    t5 = t19 + t3;
+    t13 = t19 - t3;
+    t8 = C6 * t5;
+    t0 = (-C6) * t13;
+    t19 = t18 - t14;
+    t3 = t18 + t14;
+    t5 = (-C6) * t19;
+    t13 = (-C6) * t3;
+    t18 = t2 - t15;
+    t14 = t11 - t16;
+    t19 = t2 + t15;
+    t3 = t11 + t16;
+    t2 = t17 - t8;
+    t15 = t7 - t0;
+    t11 = t17 + t8;
+    t16 = t7 + t0;
+    t17 = t4 - t1;
+    t8 = t12 + t10;
+    t7 = t4 + t1;
+    t0 = t12 - t10;
+    t4 = t9 - t5;
+    t1 = t6 - t13;
+    t12 = t9 + t5;
+    t10 = t6 + t13;
+    re[16] = t19;
+    im[16] = t3;
+    re[21] = t11;
+    im[21] = t16;
+    re[26] = t7;
+    im[26] = t0;
+    re[31] = t12;
+    im[31] = t10;
+    re[36] = t18;
+    im[36] = t14;
+    re[1] = t2;
+    im[1] = t15;
+    re[6] = t17;
+    im[6] = t8;
+    re[11] = t4;
+    im[11] = t1;
+    t9 = x[8];
+    t5 = (-0.007481582533385487) * t9;
+    t6 = x[71];
+    t13 = 0.15658421481756118 * t6;
+    t19 = t5 - t13;
+    t3 = x[88];
+    t11 = C23 * t19;
+    t16 = (-0.1291664353455977) * t3;
+    t7 = t11 + t16;
+    t0 = (-C24) * t19;
+    t12 = (-0.09384490846943157) * t3;
+    t10 = t0 + t12;
+    t18 = x[18];
+    t14 = (-0.016889284512954593) * t18;
+    t2 = x[61];
+    t15 = 0.15616830960944622 * t2;
+    t17 = t14 - t15;
+    t8 = x[98];
+    t4 = C37 * t17;
+    t1 = (-0.14537891459800856) * t8;
+    t9 = t4 + t1;
+    t6 = (-C38) * t17;
+    t5 = (-0.06702059761427177) * t8;
+    t13 = t6 + t5;
+    t11 = x[28];
+    t16 = 0.021612760900660985 * t11;
+    t19 = x[51];
+    t3 = 0.15866857219030792 * t19;
+    t0 = t16 - t3;
+    t12 = x[108];
+    t18 = C35 * t0;
+    t2 = (-0.1532077063174506) * t12;
+    t14 = t18 + t2;
+    t15 = (-C36) * t0;
+    t4 = (-0.03678191601420439) * t12;
+    t1 = t15 + t4;
+    t17 = x[38];
+    t8 = 0.12504836448919263 * t17;
+    t6 = x[41];
+    t5 = 0.14883810273591877 * t6;
+    t11 = t8 - t5;
+    t19 = x[118];
+    t16 = 0.10857017400397721 * t19;
+    t3 = x[121];
+    t18 = 0.07069761626753265 * t3;
+    t2 = t16 + t18;
+    t0 = C34 * t11;
+    t12 = (-C33) * t2;
+    t15 = t0 + t12;
+    t4 = (-C33) * t11;
+    t17 = (-C34) * t2;
+    t6 = t4 + t17;
+    t8 = x[111];
+    t5 = 0.15350995059510428 * t8;
+    t19 = x[128];
+    t3 = 0.004271385525508252 * t19;
+    t16 = t5 + t3;
+    t18 = x[31];
+    t0 = 0.04866411823441746 * t18;
+    t12 = x[48];
+    t11 = 0.16150182247894337 * t12;
+    t2 = t0 - t11;
+    t4 = (-C32) * t16;
+    t17 = C31 * t2;
+    t8 = t4 + t17;
+    t19 = C31 * t16;
+    t5 = C32 * t2;
+    t3 = t19 + t5;
+    t18 = x[101];
+    t12 = x[21];
+    t0 = (-0.012365481978009343) * t12;
+    t11 = x[58];
+    t4 = 0.1561572121508254 * t11;
+    t17 = t0 - t4;
+    t16 = (-0.15019980873767236) * t18;
+    t2 = C29 * t17;
+    t19 = t16 + t2;
+    t5 = 0.05541163490149812 * t18;
+    t12 = C30 * t17;
+    t11 = t5 + t12;
+    t0 = x[91];
+    t4 = x[11];
+    t16 = (-0.012498345006756617) * t4;
+    t2 = x[68];
+    t18 = 0.15652789169528872 * t2;
+    t17 = t16 - t18;
+    t5 = (-0.1361802288268723) * t0;
+    t12 = C27 * t17;
+    t4 = t5 + t12;
+    t2 = 0.08345135155418364 * t0;
+    t16 = C28 * t17;
+    t18 = t2 + t16;
+    t5 = x[81];
+    t12 = x[1];
+    t0 = (-0.00033175419007782557) * t12;
+    t17 = x[78];
+    t2 = 0.1576837042991903 * t17;
+    t16 = t0 - t2;
+    t12 = (-0.11642333503948767) * t5;
+    t17 = C25 * t16;
+    t0 = t12 + t17;
+    t2 = 0.10762062391764016 * t5;
+    t12 = C26 * t16;
+    t17 = t2 + t12;
+    t5 = t7 + t8;
+    t16 = t10 + t3;
+    t2 = t14 + t4;
+    t12 = t1 + t18;
+    t7 = t7 - t8;
+    t8 = t10 - t3;
+    t10 = t14 - t4;
+    t3 = t1 - t18;
+    t14 = t5 + t2;
+    t4 = t16 + t12;
+    t1 = t7 + t3;
+    t18 = t8 - t10;
+    t5 = t5 - t2;
+    t2 = t16 - t12;
+    t16 = t7 - t3;
+    t12 = t8 + t10;
+    t7 = t9 + t19;
+    t3 = t13 + t11;
+    t8 = t15 + t0;
+    t10 = t6 + t17;
+    t9 = t9 - t19;
+    t19 = t13 - t11;
+    t13 = t15 - t0;
+    t11 = t6 - t17;
+    t15 = t7 + t8;
+    t0 = t3 + t10;
+    t6 = t9 + t11;
+    t17 = t19 - t13;
+    t7 = t7 - t8;
+    t8 = t3 - t10;
+    t3 = t9 - t11;
+    t10 = t19 + t13;
+    t9 = t6 + t17;
+    t11 = t6 - t17;
+    t19 = C6 * t9;
+    t13 = (-C6) * t11;
+    t6 = t3 - t10;
+    t17 = t3 + t10;
+    t9 = (-C6) * t6;
+    t11 = (-C6) * t17;
+    t3 = t14 - t15;
+    t10 = t4 - t0;
+    t6 = t14 + t15;
+    t17 = t4 + t0;
+    t14 = t1 - t19;
+    t15 = t18 - t13;
+    t4 = t1 + t19;
+    t0 = t18 + t13;
+    t1 = t5 - t8;
+    t19 = t2 + t7;
+    t18 = t5 + t8;
+    t13 = t2 - t7;
+    t5 = t16 - t9;
+    t8 = t12 - t11;
+    t2 = t16 + t9;
+    t7 = t12 + t11;
+    re[24] = t6;
+    im[24] = t17;
+    re[29] = t4;
+    im[29] = t0;
+    re[34] = t18;
+    im[34] = t13;
+    re[39] = t2;
+    im[39] = t7;
+    re[4] = t3;
+    im[4] = t10;
+    re[9] = t14;
+    im[9] = t15;
+    re[14] = t1;
+    im[14] = t19;
+    re[19] = t5;
+    im[19] = t8;
+    t16 = x[24];
+    t9 = (-0.002429150261123753) * t16;
+    t12 = x[55];
+    t11 = 0.15662400684622813 * t12;
+    t6 = t9 - t11;
+    t17 = x[104];
+    t4 = C7 * t6;
+    t0 = (-0.151805673894694) * t17;
+    t18 = t4 + t0;
+    t13 = (-C8) * t6;
+    t2 = (-0.04932465344829561) * t17;
+    t7 = t13 + t2;
+    t3 = x[34];
+    t10 = 0.08150352389146673 * t3;
+    t14 = x[45];
+    t15 = 0.1620250139602121 * t14;
+    t1 = t10 - t15;
+    t19 = x[114];
+    t5 = 0.14258715791581017 * t19;
+    t8 = x[125];
+    t16 = 0.023278916757886927 * t8;
+    t12 = t5 + t16;
+    t9 = C22 * t1;
+    t11 = (-C21) * t12;
+    t4 = t9 + t11;
+    t0 = (-C21) * t1;
+    t6 = (-C22) * t12;
+    t17 = t0 + t6;
+    t13 = x[115];
+    t2 = 0.13635716095680167 * t13;
+    t3 = x[124];
+    t14 = 0.033365340990259666 * t3;
+    t10 = t2 + t14;
+    t15 = x[35];
+    t19 = 0.0929181804081584 * t15;
+    t8 = x[44];
+    t5 = 0.16060581690627343 * t8;
+    t16 = t19 - t5;
+    t9 = (-C20) * t10;
+    t11 = C19 * t16;
+    t1 = t9 + t11;
+    t12 = C19 * t10;
+    t0 = C20 * t16;
+    t6 = t12 + t0;
+    t13 = x[105];
+    t3 = x[25];
+    t2 = 0.002324519265439871 * t3;
+    t14 = x[54];
+    t15 = 0.15694295355898114 * t14;
+    t8 = t2 - t15;
+    t19 = (-0.15331290998227964) * t13;
+    t5 = C17 * t8;
+    t9 = t19 + t5;
+    t11 = 0.0432387124922852 * t13;
+    t10 = C18 * t8;
+    t16 = t11 + t10;
+    t12 = x[95];
+    t0 = x[15];
+    t3 = (-0.017088418123905845) * t0;
+    t14 = x[64];
+    t2 = 0.15636245601683701 * t14;
+    t15 = t3 - t2;
+    t19 = (-0.14245851384113983) * t12;
+    t5 = C15 * t15;
+    t13 = t19 + t5;
+    t8 = 0.07258623829921508 * t12;
+    t11 = C16 * t15;
+    t10 = t8 + t11;
+    t0 = x[85];
+    t14 = x[5];
+    t3 = (-0.0031618374037639444) * t14;
+    t2 = x[74];
+    t19 = 0.1568278715072539 * t2;
+    t5 = t3 - t19;
+    t12 = (-0.12518771748496577) * t0;
+    t15 = C13 * t5;
+    t8 = t12 + t15;
+    t11 = 0.09869003885594375 * t0;
+    t14 = C14 * t5;
+    t2 = t11 + t14;
+    t3 = x[4];
+    t19 = (-0.0021151101200055688) * t3;
+    t12 = x[75];
+    t15 = 0.1569852617974348 * t12;
+    t0 = t19 - t15;
+    t5 = x[84];
+    t11 = C11 * t0;
+    t14 = (-0.12109512015548585) * t5;
+    t3 = t11 + t14;
+    t12 = (-C12) * t0;
+    t19 = (-0.1034250032286782) * t5;
+    t15 = t12 + t19;
+    t11 = x[14];
+    t14 = (-0.016364174061938876) * t11;
+    t0 = x[65];
+    t5 = 0.15642324976703487 * t0;
+    t12 = t14 - t5;
+    t19 = x[94];
+    t11 = C9 * t12;
+    t0 = (-0.13944474500629347) * t19;
+    t14 = t11 + t0;
+    t5 = (-C10) * t12;
+    t11 = (-0.0780928094488305) * t19;
+    t0 = t5 + t11;
+    t12 = t18 + t13;
+    t19 = t7 + t10;
+    t5 = t1 + t3;
+    t11 = t6 + t15;
+    t18 = t18 - t13;
+    t13 = t7 - t10;
+    t7 = t1 - t3;
+    t10 = t6 - t15;
+    t1 = t12 + t5;
+    t3 = t19 + t11;
+    t6 = t18 + t10;
+    t15 = t13 - t7;
+    t12 = t12 - t5;
+    t5 = t19 - t11;
+    t19 = t18 - t10;
+    t11 = t13 + t7;
+    t18 = t4 + t8;
+    t10 = t17 + t2;
+    t13 = t9 + t14;
+    t7 = t16 + t0;
+    t4 = t4 - t8;
+    t8 = t17 - t2;
+    t17 = t9 - t14;
+    t2 = t16 - t0;
+    t9 = t18 + t13;
+    t14 = t10 + t7;
+    t16 = t4 + t2;
+    t0 = t8 - t17;
+    t18 = t18 - t13;
+    t13 = t10 - t7;
+    t10 = t4 - t2;
+    t7 = t8 + t17;
+    t4 = t16 + t0;
+    t2 = t16 - t0;
+    t8 = C6 * t4;
+    t17 = (-C6) * t2;
+    t16 = t10 - t7;
+    t0 = t10 + t7;
+    t4 = (-C6) * t16;
+    t2 = (-C6) * t0;
+    t10 = t1 - t9;
+    t7 = t3 - t14;
+    t16 = t1 + t9;
+    t0 = t3 + t14;
+    t1 = t6 - t8;
+    t9 = t15 - t17;
+    t3 = t6 + t8;
+    t14 = t15 + t17;
+    t6 = t12 - t13;
+    t8 = t5 + t18;
+    t15 = t12 + t13;
+    t17 = t5 - t18;
+    t12 = t19 - t4;
+    t13 = t11 - t2;
+    t5 = t19 + t4;
+    t18 = t11 + t2;
+    re[32] = t16;
+    im[32] = t0;
+    re[37] = t3;
+    im[37] = t14;
+    re[2] = t15;
+    im[2] = t17;
+    re[7] = t5;
+    im[7] = t18;
+    re[12] = t10;
+    im[12] = t7;
+    re[17] = t1;
+    im[17] = t9;
+    re[22] = t6;
+    im[22] = t8;
+    re[27] = t12;
+    im[27] = t13;
+    t19 = re[0];
+    t4 = im[0];
+    t11 = re[8];
+    t2 = im[8];
+    t16 = re[16];
+    t0 = im[16];
+    t3 = re[24];
+    t14 = im[24];
+    t15 = re[32];
+    t17 = im[32];
+    t5 = t11 + t15;
+    t18 = t2 + t17;
+    t10 = t16 + t3;
+    t7 = t0 + t14;
+    t1 = t11 - t15;
+    t9 = t2 - t17;
+    t6 = t16 - t3;
+    t8 = t0 - t14;
+    t12 = t5 + t10;
+    t13 = t18 + t7;
+    t11 = t5 - t10;
+    t15 = C39 * t11;
+    t2 = t18 - t7;
+    t17 = C39 * t2;
+    t16 = C40 * t12;
+    t3 = t19 - t16;
+    t0 = C40 * t13;
+    t14 = t4 - t0;
+    t5 = t3 + t15;
+    t10 = t14 + t17;
+    t11 = t3 - t15;
+    t18 = t14 - t17;
+    t7 = C8 * t1;
+    t2 = C23 * t6;
+    t16 = t7 + t2;
+    t0 = C8 * t9;
+    t3 = C23 * t8;
+    t15 = t0 + t3;
+    t14 = C23 * t1;
+    t17 = C8 * t6;
+    t7 = t14 - t17;
+    t2 = C23 * t9;
+    t0 = C8 * t8;
+    t3 = t2 - t0;
+    t1 = t19 + t12;
+    t6 = t4 + t13;
+    t14 = t5 + t15;
+    t17 = t10 - t16;
+    t9 = t11 + t3;
+    t8 = t18 - t7;
+    t2 = t11 - t3;
+    t0 = t18 + t7;
+    t19 = t5 - t15;
+    t12 = t10 + t16;
+    t4 = C41 * t1;
+    t13 = C42 * t6;
+    t11 = t4 + t13;
+    t3 = C42 * t1;
+    t18 = (-C41) * t6;
+    t7 = t3 + t18;
+    X[0] = t11;
+    X[79] = t7;
+    t5 = C43 * t14;
+    t15 = C44 * t17;
+    t10 = t5 + t15;
+    t16 = C44 * t14;
+    t4 = (-C43) * t17;
+    t13 = t16 + t4;
+    X[32] = t10;
+    X[47] = t13;
+    t1 = C45 * t9;
+    t6 = C46 * t8;
+    t3 = t1 + t6;
+    t18 = C46 * t9;
+    t11 = (-C45) * t8;
+    t7 = t18 + t11;
+    X[64] = t3;
+    X[15] = t7;
+    t5 = C47 * t2;
+    t15 = C48 * t0;
+    t14 = t5 + t15;
+    t17 = C48 * t2;
+    t16 = (-C47) * t0;
+    t4 = t17 + t16;
+    X[16] = t14;
+    X[63] = t4;
+    t10 = C49 * t19;
+    t13 = C50 * t12;
+    t1 = t10 + t13;
+    t6 = C50 * t19;
+    t9 = (-C49) * t12;
+    t8 = t6 + t9;
+    X[48] = t1;
+    X[31] = t8;
+    t18 = re[5];
+    t11 = im[5];
+    t3 = re[13];
+    t7 = im[13];
+    t5 = re[21];
+    t15 = im[21];
+    t2 = re[29];
+    t0 = im[29];
+    t17 = re[37];
+    t16 = im[37];
+    t14 = t3 + t17;
+    t4 = t7 + t16;
+    t10 = t5 + t2;
+    t13 = t15 + t0;
+    t19 = t3 - t17;
+    t12 = t7 - t16;
+    t6 = t5 - t2;
+    t9 = t15 - t0;
+    t1 = t14 + t10;
+    t8 = t4 + t13;
+    t3 = t14 - t10;
+    t17 = C39 * t3;
+    t7 = t4 - t13;
+    t16 = C39 * t7;
+    t5 = C40 * t1;
+    t2 = t18 - t5;
+    t15 = C40 * t8;
+    t0 = t11 - t15;
+    t14 = t2 + t17;
+    t10 = t0 + t16;
+    t3 = t2 - t17;
+    t4 = t0 - t16;
+    t13 = C8 * t19;
+    t7 = C23 * t6;
+    t5 = t13 + t7;
+    t15 = C8 * t12;
+    t2 = C23 * t9;
+    t17 = t15 + t2;
+    t0 = C23 * t19;
+    t16 = C8 * t6;
+    t13 = t0 - t16;
+    t7 = C23 * t12;
+    t15 = C8 * t9;
+    t2 = t7 - t15;
+    t19 = t18 + t1;
+    t6 = t11 + t8;
+    t0 = t14 + t17;
+    t16 = t10 - t5;
+    t12 = t3 + t2;
+    t9 = t4 - t13;
+    t7 = t3 - t2;
+    t15 = t4 + t13;
+    t18 = t14 - t17;
+    t1 = t10 + t5;
+    t11 = C51 * t19;
+    t8 = C52 * t6;
+    t3 = t11 + t8;
+    t2 = C52 * t19;
+    t4 = (-C51) * t6;
+    t13 = t2 + t4;
+    X[50] = t3;
+    X[29] = t13;
+    t14 = C53 * t0;
+    t17 = C54 * t16;
+    t10 = t14 + t17;
+    t5 = C54 * t0;
+    t11 = (-C53) * t16;
+    t8 = t5 + t11;
+    X[2] = t10;
+    X[77] = t8;
+    t19 = C55 * t12;
+    t6 = C56 * t9;
+    t2 = t19 + t6;
+    t4 = C56 * t12;
+    t3 = (-C55) * t9;
+    t13 = t4 + t3;
+    X[34] = t2;
+    X[45] = t13;
+    t14 = C57 * t7;
+    t17 = C58 * t15;
+    t0 = t14 + t17;
+    t16 = C58 * t7;
+    t5 = (-C57) * t15;
+    t11 = t16 + t5;
+    X[66] = t0;
+    X[13] = t11;
+    t10 = C59 * t18;
+    t8 = C60 * t1;
+    t19 = t10 + t8;
+    t6 = C60 * t18;
+    t12 = (-C59) * t1;
+    t9 = t6 + t12;
+    X[18] = t19;
+    X[61] = t9;
+    t4 = re[10];
+    t3 = im[10];
+    t2 = re[18];
+    t13 = im[18];
+    t14 = re[26];
+    t17 = im[26];
+    t7 = re[34];
+    t15 = im[34];
+    t16 = re[2];
+    t5 = im[2];
+    t0 = t2 + t16;
+    t11 = t13 + t5;
+    t10 = t14 + t7;
+    t8 = t17 + t15;
+    t18 = t2 - t16;
+    t1 = t13 - t5;
+    t6 = t14 - t7;
+    t12 = t17 - t15;
+    t19 = t0 + t10;
+    t9 = t11 + t8;
+    t2 = t0 - t10;
+    t16 = C39 * t2;
+    t13 = t11 - t8;
+    t5 = C39 * t13;
+    t14 = C40 * t19;
+    t7 = t4 - t14;
+    t17 = C40 * t9;
+    t15 = t3 - t17;
+    t0 = t7 + t16;
+    t10 = t15 + t5;
+    t2 = t7 - t16;
+    t11 = t15 - t5;
+    t8 = C8 * t18;
+    t13 = C23 * t6;
+    t14 = t8 + t13;
+    t17 = C8 * t1;
+    t7 = C23 * t12;
+    t16 = t17 + t7;
+    t15 = C23 * t18;
+    t5 = C8 * t6;
+    t8 = t15 - t5;
+    t13 = C23 * t1;
+    t17 = C8 * t12;
+    t7 = t13 - t17;
+    t18 = t4 + t19;
+    t6 = t3 + t9;
+    t15 = t0 + t16;
+    t5 = t10 - t14;
+    t1 = t2 + t7;
+    t12 = t11 - t8;
+    t13 = t2 - t7;
+    t17 = t11 + t8;
+    t4 = t0 - t16;
+    t19 = t10 + t14;
+    t3 = C61 * t18;
+    t9 = C62 * t6;
+    t2 = t3 + t9;
+    t7 = C62 * t18;
+    t11 = (-C61) * t6;
+    t8 = t7 + t11;
+    X[20] = t2;
+    X[59] = t8;
+    t0 = C63 * t15;
+    t16 = C64 * t5;
+    t10 = t0 + t16;
+    t14 = C64 * t15;
+    t3 = (-C63) * t5;
+    t9 = t14 + t3;
+    X[52] = t10;
+    X[27] = t9;
+    t18 = C65 * t1;
+    t6 = C66 * t12;
+    t7 = t18 + t6;
+    t11 = C66 * t1;
+    t2 = (-C65) * t12;
+    t8 = t11 + t2;
+    X[4] = t7;
+    X[75] = t8;
+    t0 = C67 * t13;
+    t16 = C68 * t17;
+    t15 = t0 + t16;
+    t5 = C68 * t13;
+    t14 = (-C67) * t17;
+    t3 = t5 + t14;
+    X[36] = t15;
+    X[43] = t3;
+    t10 = C69 * t4;
+    t9 = C70 * t19;
+    t18 = t10 + t9;
+    t6 = C70 * t4;
+    t1 = (-C69) * t19;
+    t12 = t6 + t1;
+    X[68] = t18;
+    X[11] = t12;
+    t11 = re[15];
+    t2 = im[15];
+    t7 = re[23];
+    t8 = im[23];
+    t0 = re[31];
+    t16 = im[31];
+    t13 = re[39];
+    t17 = im[39];
+    t5 = re[7];
+    t14 = im[7];
+    t15 = t7 + t5;
+    t3 = t8 + t14;
+    t10 = t0 + t13;
+    t9 = t16 + t17;
+    t4 = t7 - t5;
+    t19 = t8 - t14;
+    t6 = t0 - t13;
+    t1 = t16 - t17;
+    t18 = t15 + t10;
+    t12 = t3 + t9;
+    t7 = t15 - t10;
+    t5 = C39 * t7;
+    t8 = t3 - t9;
+    t14 = C39 * t8;
+    t0 = C40 * t18;
+    t13 = t11 - t0;
+    t16 = C40 * t12;
+    t17 = t2 - t16;
+    t15 = t13 + t5;
+    t10 = t17 + t14;
+    t7 = t13 - t5;
+    t3 = t17 - t14;
+    t9 = C8 * t4;
+    t8 = C23 * t6;
+    t0 = t9 + t8;
+    t16 = C8 * t19;
+    t13 = C23 * t1;
+    t5 = t16 + t13;
+    t17 = C23 * t4;
+    t14 = C8 * t6;
+    t9 = t17 - t14;
+    t8 = C23 * t19;
+    t16 = C8 * t1;
+    t13 = t8 - t16;
+    t4 = t11 + t18;
+    t6 = t2 + t12;
+    t17 = t15 + t5;
+    t14 = t10 - t0;
+    t19 = t7 + t13;
+    t1 = t3 - t9;
+    t8 = t7 - t13;
+    t16 = t3 + t9;
+    t11 = t15 - t5;
+    t18 = t10 + t0;
+    t2 = C71 * t4;
+    t12 = C72 * t6;
+    t7 = t2 + t12;
+    t13 = C72 * t4;
+    t3 = (-C71) * t6;
+    t9 = t13 + t3;
+    X[70] = t7;
+    X[9] = t9;
+    t15 = C73 * t17;
+    t5 = C74 * t14;
+    t10 = t15 + t5;
+    t0 = C74 * t17;
+    t2 = (-C73) * t14;
+    t12 = t0 + t2;
+    X[22] = t10;
+    X[57] = t12;
+    t4 = C75 * t19;
+    t6 = C76 * t1;
+    t13 = t4 + t6;
+    t3 = C76 * t19;
+    t7 = (-C75) * t1;
+    t9 = t3 + t7;
+    X[54] = t13;
+    X[25] = t9;
+    t15 = C77 * t8;
+    t5 = C78 * t16;
+    t17 = t15 + t5;
+    t14 = C78 * t8;
+    t0 = (-C77) * t16;
+    t2 = t14 + t0;
+    X[6] = t17;
+    X[73] = t2;
+    t10 = C79 * t11;
+    t12 = C80 * t18;
+    t4 = t10 + t12;
+    t6 = C80 * t11;
+    t19 = (-C79) * t18;
+    t1 = t6 + t19;
+    X[38] = t4;
+    X[41] = t1;
+    t3 = re[20];
+    t7 = im[20];
+    t13 = re[28];
+    t9 = im[28];
+    t15 = re[36];
+    t5 = im[36];
+    t8 = re[4];
+    t16 = im[4];
+    t14 = re[12];
+    t0 = im[12];
+    t17 = t13 + t14;
+    t2 = t9 + t0;
+    t10 = t15 + t8;
+    t12 = t5 + t16;
+    t11 = t13 - t14;
+    t18 = t9 - t0;
+    t6 = t15 - t8;
+    t19 = t5 - t16;
+    t4 = t17 + t10;
+    t1 = t2 + t12;
+    t13 = t17 - t10;
+    t14 = C39 * t13;
+    t9 = t2 - t12;
+    t0 = C39 * t9;
+    t15 = C40 * t4;
+    t8 = t3 - t15;
+    t5 = C40 * t1;
+    t16 = t7 - t5;
+    t17 = t8 + t14;
+    t10 = t16 + t0;
+    t13 = t8 - t14;
+    t2 = t16 - t0;
+    t12 = C8 * t11;
+    t9 = C23 * t6;
+    t15 = t12 + t9;
+    t5 = C8 * t18;
+    t8 = C23 * t19;
+    t14 = t5 + t8;
+    t16 = C23 * t11;
+    t0 = C8 * t6;
+    t12 = t16 - t0;
+    t9 = C23 * t18;
+    t5 = C8 * t19;
+    t8 = t9 - t5;
+    t11 = t3 + t4;
+    t6 = t7 + t1;
+    t16 = t17 + t14;
+    t0 = t10 - t15;
+    t18 = t13 + t8;
+    t19 = t2 - t12;
+    t9 = t13 - t8;
+    t5 = t2 + t12;
+    t3 = t17 - t14;
+    t4 = t10 + t15;
+    t7 = C81 * t11;
+    t1 = C82 * t6;
+    t13 = t7 + t1;
+    t8 = C82 * t11;
+    t2 = (-C81) * t6;
+    t12 = t8 + t2;
+    X[40] = t13;
+    X[39] = t12;
+    t17 = C83 * t16;
+    t14 = C84 * t0;
+    t10 = t17 + t14;
+    t15 = C84 * t16;
+    t7 = (-C83) * t0;
+    t1 = t15 + t7;
+    X[72] = t10;
+    X[7] = t1;
+    t11 = C85 * t18;
+    t6 = C86 * t19;
+    t8 = t11 + t6;
+    t2 = C86 * t18;
+    t13 = (-C85) * t19;
+    t12 = t2 + t13;
+    X[24] = t8;
+    X[55] = t12;
+    t17 = C87 * t9;
+    t14 = C88 * t5;
+    t16 = t17 + t14;
+    t0 = C88 * t9;
+    t15 = (-C87) * t5;
+    t7 = t0 + t15;
+    X[56] = t16;
+    X[23] = t7;
+    t10 = C89 * t3;
+    t1 = C90 * t4;
+    t11 = t10 + t1;
+    t6 = C90 * t3;
+    t18 = (-C89) * t4;
+    t19 = t6 + t18;
+    X[8] = t11;
+    X[71] = t19;
+    t2 = re[25];
+    t13 = im[25];
+    t8 = re[33];
+    t12 = im[33];
+    t17 = re[1];
+    t14 = im[1];
+    t9 = re[9];
+    t5 = im[9];
+    t0 = re[17];
+    t15 = im[17];
+    t16 = t8 + t0;
+    t7 = t12 + t15;
+    t10 = t17 + t9;
+    t1 = t14 + t5;
+    t3 = t8 - t0;
+    t4 = t12 - t15;
+    t6 = t17 - t9;
+    t18 = t14 - t5;
+    t11 = t16 + t10;
+    t19 = t7 + t1;
+    t8 = t16 - t10;
+    t0 = C39 * t8;
+    t12 = t7 - t1;
+    t15 = C39 * t12;
+    t17 = C40 * t11;
+    t9 = t2 - t17;
+    t14 = C40 * t19;
+    t5 = t13 - t14;
+    t16 = t9 + t0;
+    t10 = t5 + t15;
+    t8 = t9 - t0;
+    t7 = t5 - t15;
+    t1 = C8 * t3;
+    t12 = C23 * t6;
+    t17 = t1 + t12;
+    t14 = C8 * t4;
+    t9 = C23 * t18;
+    t0 = t14 + t9;
+    t5 = C23 * t3;
+    t15 = C8 * t6;
+    t1 = t5 - t15;
+    t12 = C23 * t4;
+    t14 = C8 * t18;
+    t9 = t12 - t14;
+    t3 = t2 + t11;
+    t6 = t13 + t19;
+    t5 = t16 + t0;
+    t15 = t10 - t17;
+    t4 = t8 + t9;
+    t18 = t7 - t1;
+    t12 = t8 - t9;
+    t14 = t7 + t1;
+    t2 = t16 - t0;
+    t11 = t10 + t17;
+    t13 = C91 * t3;
+    t19 = C92 * t6;
+    t8 = t13 + t19;
+    t9 = C92 * t3;
+    t7 = (-C91) * t6;
+    t1 = t9 + t7;
+    X[10] = t8;
+    X[69] = t1;
+    t16 = C93 * t5;
+    t0 = C94 * t15;
+    t10 = t16 + t0;
+    t17 = C94 * t5;
+    t13 = (-C93) * t15;
+    t19 = t17 + t13;
+    X[42] = t10;
+    X[37] = t19;
+    t3 = C95 * t4;
+    t6 = C96 * t18;
+    t9 = t3 + t6;
+    t7 = C96 * t4;
+    t8 = (-C95) * t18;
+    t1 = t7 + t8;
+    X[74] = t9;
+    X[5] = t1;
+    t16 = C97 * t12;
+    t0 = C98 * t14;
+    t5 = t16 + t0;
+    t15 = C98 * t12;
+    t17 = (-C97) * t14;
+    t13 = t15 + t17;
+    X[26] = t5;
+    X[53] = t13;
+    t10 = C99 * t2;
+    t19 = C100 * t11;
+    t3 = t10 + t19;
+    t6 = C100 * t2;
+    t4 = (-C99) * t11;
+    t18 = t6 + t4;
+    X[58] = t3;
+    X[21] = t18;
+    t7 = re[30];
+    t8 = im[30];
+    t9 = re[38];
+    t1 = im[38];
+    t16 = re[6];
+    t0 = im[6];
+    t12 = re[14];
+    t14 = im[14];
+    t15 = re[22];
+    t17 = im[22];
+    t5 = t9 + t15;
+    t13 = t1 + t17;
+    t10 = t16 + t12;
+    t19 = t0 + t14;
+    t2 = t9 - t15;
+    t11 = t1 - t17;
+    t6 = t16 - t12;
+    t4 = t0 - t14;
+    t3 = t5 + t10;
+    t18 = t13 + t19;
+    t9 = t5 - t10;
+    t15 = C39 * t9;
+    t1 = t13 - t19;
+    t17 = C39 * t1;
+    t16 = C40 * t3;
+    t12 = t7 - t16;
+    t0 = C40 * t18;
+    t14 = t8 - t0;
+    t5 = t12 + t15;
+    t10 = t14 + t17;
+    t9 = t12 - t15;
+    t13 = t14 - t17;
+    t19 = C8 * t2;
+    t1 = C23 * t6;
+    t16 = t19 + t1;
+    t0 = C8 * t11;
+    t12 = C23 * t4;
+    t15 = t0 + t12;
+    t14 = C23 * t2;
+    t17 = C8 * t6;
+    t19 = t14 - t17;
+    t1 = C23 * t11;
+    t0 = C8 * t4;
+    t12 = t1 - t0;
+    t2 = t7 + t3;
+    t6 = t8 + t18;
+    t14 = t5 + t15;
+    t17 = t10 - t16;
+    t11 = t9 + t12;
+    t4 = t13 - t19;
+    t1 = t9 - t12;
+    t0 = t13 + t19;
+    t7 = t5 - t15;
+    t3 = t10 + t16;
+    t8 = C101 * t2;
+    t18 = C102 * t6;
+    t9 = t8 + t18;
+    t12 = C102 * t2;
+    t13 = (-C101) * t6;
+    t19 = t12 + t13;
+    X[60] = t9;
+    X[19] = t19;
+    t5 = C103 * t14;
+    t15 = C104 * t17;
+    t10 = t5 + t15;
+    t16 = C104 * t14;
+    t8 = (-C103) * t17;
+    t18 = t16 + t8;
+    X[12] = t10;
+    X[67] = t18;
+    t2 = C105 * t11;
+    t6 = C106 * t4;
+    t12 = t2 + t6;
+    t13 = C106 * t11;
+    t9 = (-C105) * t4;
+    t19 = t13 + t9;
+    X[44] = t12;
+    X[35] = t19;
+    t5 = C107 * t1;
+    t15 = C108 * t0;
+    t14 = t5 + t15;
+    t17 = C108 * t1;
+    t16 = (-C107) * t0;
+    t8 = t17 + t16;
+    X[76] = t14;
+    X[3] = t8;
+    t10 = C109 * t7;
+    t18 = C110 * t3;
+    t2 = t10 + t18;
+    t6 = C110 * t7;
+    t11 = (-C109) * t3;
+    t4 = t6 + t11;
+    X[28] = t2;
+    X[51] = t4;
+    t13 = re[35];
+    t9 = im[35];
+    t12 = re[3];
+    t19 = im[3];
+    t5 = re[11];
+    t15 = im[11];
+    t1 = re[19];
+    t0 = im[19];
+    t17 = re[27];
+    t16 = im[27];
+    t14 = t12 + t17;
+    t8 = t19 + t16;
+    t10 = t5 + t1;
+    t18 = t15 + t0;
+    t7 = t12 - t17;
+    t3 = t19 - t16;
+    t6 = t5 - t1;
+    t11 = t15 - t0;
+    t2 = t14 + t10;
+    t4 = t8 + t18;
+    t12 = t14 - t10;
+    t17 = C39 * t12;
+    t19 = t8 - t18;
+    t16 = C39 * t19;
+    t5 = C40 * t2;
+    t1 = t13 - t5;
+    t15 = C40 * t4;
+    t0 = t9 - t15;
+    t14 = t1 + t17;
+    t10 = t0 + t16;
+    t12 = t1 - t17;
+    t8 = t0 - t16;
+    t18 = C8 * t7;
+    t19 = C23 * t6;
+    t5 = t18 + t19;
+    t15 = C8 * t3;
+    t1 = C23 * t11;
+    t17 = t15 + t1;
+    t0 = C23 * t7;
+    t16 = C8 * t6;
+    t18 = t0 - t16;
+    t19 = C23 * t3;
+    t15 = C8 * t11;
+    t1 = t19 - t15;
+    t7 = t13 + t2;
+    t6 = t9 + t4;
+    t0 = t14 + t17;
+    t16 = t10 - t5;
+    t3 = t12 + t1;
+    t11 = t8 - t18;
+    t19 = t12 - t1;
+    t15 = t8 + t18;
+    t13 = t14 - t17;
+    t2 = t10 + t5;
+    t9 = C111 * t7;
+    t4 = C112 * t6;
+    t12 = t9 + t4;
+    t1 = C112 * t7;
+    t8 = (-C111) * t6;
+    t18 = t1 + t8;
+    X[30] = t12;
+    X[49] = t18;
+    t14 = C113 * t0;
+    t17 = C114 * t16;
+    t10 = t14 + t17;
+    t5 = C114 * t0;
+    t9 = (-C113) * t16;
+    t4 = t5 + t9;
+    X[62] = t10;
+    X[17] = t4;
+    t7 = C115 * t3;
+    t6 = C116 * t11;
+    t1 = t7 + t6;
+    t8 = C116 * t3;
+    t12 = (-C115) * t11;
+    t18 = t8 + t12;
+    X[14] = t1;
+    X[65] = t18;
+    t14 = C117 * t19;
+    t17 = C118 * t15;
+    t0 = t14 + t17;
+    t16 = C118 * t19;
+    t5 = (-C117) * t15;
+    t9 = t16 + t5;
+    X[46] = t0;
+    X[33] = t9;
+    t10 = C119 * t13;
+    t4 = C120 * t2;
+    t7 = t10 + t4;
+    t6 = C120 * t13;
+    t3 = (-C119) * t2;
+    t11 = t6 + t3;
+    X[78] = t7;
+    X[1] = t11;
+}
+
+/**
+ *  Apply LD-IMDCT transform (prebuilt for window W10_80).
+ * 
+ *  Note(s):
+ *    [1] y[n] = w[n] * SUM(X[k] * cos(PI / 80 * (n + 40.5) * (k + 0.5))), where
+ *        w[n] = sqrt(2 / 80) * W10_80[159 - n].
+ *    [2] The size of all arrays will not be checked.
+ * 
+ *  @param {Number[]} X 
+ *    - The input block (80 points).
+ *  @param {Number[]} y 
+ *    - The array that would contain the output block (160 points).
+ *  @param {Number[]} re 
+ *    - The scratch buffer (real part, 40 points).
+ *  @param {Number[]} im 
+ *    - The scratch buffer (imaginary part, 40 points).
+ */
+function ApplyWindowedIMDCT_W10_80(X, y, re, im) {
+    let t0, t1, t10, t11, t12, t13, t14, t15, t16, t17, t18, t19, t2, t3, t4, t5, t6, t7, t8, t9;
+    const C0 = 0.9807852804032304;
+    const C1 = 0.19509032201612825;
+    const C2 = 0.9238795325112867;
+    const C3 = 0.3826834323650898;
+    const C4 = 0.8314696123025452;
+    const C5 = 0.5555702330196022;
+    const C6 = 0.7071067811865476;
+    const C7 = 0.7071067811865475;
+    const C8 = 0.9510565162951535;
+    const C9 = 0.3090169943749474;
+    const C10 = 0.8724960070727972;
+    const C11 = 0.4886212414969549;
+    const C12 = 0.7604059656000309;
+    const C13 = 0.6494480483301837;
+    const C14 = 0.619093949309834;
+    const C15 = 0.785316930880745;
+    const C16 = 0.45399049973954675;
+    const C17 = 0.8910065241883679;
+    const C18 = 0.27144044986507426;
+    const C19 = 0.9624552364536473;
+    const C20 = 0.07845909572784494;
+    const C21 = 0.996917333733128;
+    const C22 = 0.9930684569549263;
+    const C23 = 0.11753739745783764;
+    const C24 = 0.8090169943749475;
+    const C25 = 0.5877852522924731;
+    const C26 = 0.6788007455329417;
+    const C27 = 0.7343225094356856;
+    const C28 = 0.5224985647159488;
+    const C29 = 0.8526401643540922;
+    const C30 = 0.34611705707749296;
+    const C31 = 0.9381913359224842;
+    const C32 = 0.15643446504023087;
+    const C33 = 0.9876883405951378;
+    const C34 = 0.9992290362407229;
+    const C35 = 0.03925981575906861;
+    const C36 = 0.9723699203976766;
+    const C37 = 0.2334453638559054;
+    const C38 = 0.9081431738250813;
+    const C39 = 0.41865973753742813;
+    const C40 = 0.5590169943749475;
+    const C41 = 0.25;
+    const C42 = 0.999951808959328;
+    const C43 = 0.009817319337149617;
+    const C44 = 0.8032075314806449;
+    const C45 = 0.5956993044924334;
+    const C46 = 0.2996652769962566;
+    const C47 = 0.9540444024062804;
+    const C48 = 0.9479769653775104;
+    const C49 = 0.3183389280525497;
+    const C50 = 0.5798145481265136;
+    const C51 = 0.8147484825274894;
+    const C52 = 0.5473806568087966;
+    const C53 = 0.8368837533084093;
+    const C54 = 0.9987954562051724;
+    const C55 = 0.049067674327418015;
+    const C56 = 0.7792012426405167;
+    const C57 = 0.6267738216194696;
+    const C58 = 0.26197863846333747;
+    const C59 = 0.9650736723115474;
+    const C60 = 0.9347481818282924;
+    const C61 = 0.3553109012804161;
+    const C62 = 0.9200780843345949;
+    const C63 = 0.3917350108519559;
+    const C64 = 0.5141027441932217;
+    const C65 = 0.8577286100002721;
+    const C66 = 0.9960990332516871;
+    const C67 = 0.08824237052036951;
+    const C68 = 0.7539934819618695;
+    const C69 = 0.6568818989430413;
+    const C70 = 0.22388804785849836;
+    const C71 = 0.974614868564045;
+    const C72 = 0.18545223811159092;
+    const C73 = 0.9826532793307118;
+    const C74 = 0.9039892931234433;
+    const C75 = 0.4275550934302821;
+    const C76 = 0.4800321224090111;
+    const C77 = 0.8772509113449243;
+    const C78 = 0.991866697787626;
+    const C79 = 0.1272810033739132;
+    const C80 = 0.7276231179845748;
+    const C81 = 0.6859771119901928;
+    const C82 = 0.7001308118985237;
+    const C83 = 0.7140145980512682;
+    const C84 = 0.14673047445536175;
+    const C85 = 0.989176509964781;
+    const C86 = 0.8865066159447464;
+    const C87 = 0.4627159170443501;
+    const C88 = 0.4452213258854682;
+    const C89 = 0.895420555368697;
+    const C90 = 0.9861049757675088;
+    const C91 = 0.16612337814576547;
+    const C92 = 0.9788227513490724;
+    const C93 = 0.2047096027093796;
+    const C94 = 0.6715589548470183;
+    const C95 = 0.7409511253549591;
+    const C96 = 0.10778246304275935;
+    const C97 = 0.9941745021174282;
+    const C98 = 0.8676570098195441;
+    const C99 = 0.4971632662526543;
+    const C100 = 0.4097240303476953;
+    const C101 = 0.9122095257974677;
+    const C102 = 0.37359497005251635;
+    const C103 = 0.927591935255724;
+    const C104 = 0.970031253194544;
+    const C105 = 0.24298017990326387;
+    const C106 = 0.641951602562703;
+    const C107 = 0.7667451597285615;
+    const C108 = 0.06866825888437376;
+    const C109 = 0.9976395492470157;
+    const C110 = 0.8474695394742344;
+    const C111 = 0.5308440257395095;
+    const C112 = 0.8259753325248732;
+    const C113 = 0.5637062622150166;
+    const C114 = 0.33688985339222005;
+    const C115 = 0.9415440651830208;
+    const C116 = 0.9597440371568574;
+    const C117 = 0.2808760992712921;
+    const C118 = 0.6113544074368165;
+    const C119 = 0.7913569286406602;
+    const C120 = 0.02944817324796316;
+    const C121 = 0.9995663085020212;
+    t0 = X[0];
+    t1 = X[79];
+    t2 = X[10];
+    t3 = X[69];
+    t4 = C0 * t2;
+    t5 = C1 * t3;
+    t4 = t4 + t5;
+    t5 = (-C1) * t2;
+    t2 = C0 * t3;
+    t3 = t5 + t2;
+    t5 = X[20];
+    t2 = X[59];
+    t6 = C2 * t5;
+    t7 = C3 * t2;
+    t6 = t6 + t7;
+    t7 = (-C3) * t5;
+    t5 = C2 * t2;
+    t2 = t7 + t5;
+    t7 = X[30];
+    t5 = X[49];
+    t8 = C4 * t7;
+    t9 = C5 * t5;
+    t8 = t8 + t9;
+    t9 = (-C5) * t7;
+    t7 = C4 * t5;
+    t5 = t9 + t7;
+    t9 = X[40];
+    t7 = X[39];
+    t10 = C6 * t9;
+    t11 = C7 * t7;
+    t10 = t10 + t11;
+    t11 = (-C7) * t9;
+    t9 = C6 * t7;
+    t7 = t11 + t9;
+    t11 = X[50];
+    t9 = X[29];
+    t12 = C5 * t11;
+    t13 = C4 * t9;
+    t12 = t12 + t13;
+    t13 = (-C4) * t11;
+    t11 = C5 * t9;
+    t9 = t13 + t11;
+    t13 = X[60];
+    t11 = X[19];
+    t14 = C3 * t13;
+    t15 = C2 * t11;
+    t14 = t14 + t15;
+    t15 = (-C2) * t13;
+    t13 = C3 * t11;
+    t11 = t15 + t13;
+    t15 = X[70];
+    t13 = X[9];
+    t16 = C1 * t15;
+    t17 = C0 * t13;
+    t16 = t16 + t17;
+    t17 = (-C0) * t15;
+    t15 = C1 * t13;
+    t13 = t17 + t15;
+    t17 = t0 + t10;
+    t15 = t1 + t7;
+    t18 = t6 + t14;
+    t19 = t2 + t11;
+    t0 = t0 - t10;
+    t10 = t1 - t7;
+    t1 = t6 - t14;
+    t7 = t2 - t11;
+    t6 = t17 + t18;
+    t14 = t15 + t19;
+    t2 = t0 + t7;
+    t11 = t10 - t1;
+    t17 = t17 - t18;
+    t18 = t15 - t19;
+    t15 = t0 - t7;
+    t19 = t10 + t1;
+    t0 = t4 + t12;
+    t7 = t3 + t9;
+    t10 = t8 + t16;
+    t1 = t5 + t13;
+    t4 = t4 - t12;
+    t12 = t3 - t9;
+    t3 = t8 - t16;
+    t9 = t5 - t13;
+    t8 = t0 + t10;
+    t16 = t7 + t1;
+    t5 = t4 + t9;
+    t13 = t12 - t3;
+    t0 = t0 - t10;
+    t10 = t7 - t1;
+    t7 = t4 - t9;
+    t1 = t12 + t3;
+    t4 = t5 + t13;
+    t9 = t5 - t13;
+    t12 = C6 * t4;
+    t3 = (-C6) * t9;
+    t5 = t7 - t1;
+    t13 = t7 + t1;
+    t4 = (-C6) * t5;
+    t9 = (-C6) * t13;
+    t7 = t6 - t8;
+    t1 = t14 - t16;
+    t5 = t6 + t8;
+    t13 = t14 + t16;
+    t6 = t2 - t12;
+    t8 = t11 - t3;
+    t14 = t2 + t12;
+    t16 = t11 + t3;
+    t2 = t17 - t10;
+    t12 = t18 + t0;
+    t11 = t17 + t10;
+    t3 = t18 - t0;
+    t17 = t15 - t4;
+    t10 = t19 - t9;
+    t18 = t15 + t4;
+    t0 = t19 + t9;
+    re[0] = t5;
+    im[0] = t13;
+    re[5] = t14;
+    im[5] = t16;
+    re[10] = t11;
+    im[10] = t3;
+    re[15] = t18;
+    im[15] = t0;
+    re[20] = t7;
+    im[20] = t1;
+    re[25] = t6;
+    im[25] = t8;
+    re[30] = t2;
+    im[30] = t12;
+    re[35] = t17;
+    im[35] = t10;
+    t15 = X[16];
+    t4 = X[63];
+    t19 = C8 * t15;
+    t9 = C9 * t4;
+    t5 = t19 + t9;
+    t13 = (-C9) * t15;
+    t14 = C8 * t4;
+    t16 = t13 + t14;
+    t11 = X[26];
+    t3 = X[53];
+    t18 = C10 * t11;
+    t0 = C11 * t3;
+    t7 = t18 + t0;
+    t1 = (-C11) * t11;
+    t6 = C10 * t3;
+    t8 = t1 + t6;
+    t2 = X[36];
+    t12 = X[43];
+    t17 = C12 * t2;
+    t10 = C13 * t12;
+    t19 = t17 + t10;
+    t9 = (-C13) * t2;
+    t15 = C12 * t12;
+    t4 = t9 + t15;
+    t13 = X[46];
+    t14 = X[33];
+    t18 = C14 * t13;
+    t0 = C15 * t14;
+    t11 = t18 + t0;
+    t3 = (-C15) * t13;
+    t1 = C14 * t14;
+    t6 = t3 + t1;
+    t17 = X[56];
+    t10 = X[23];
+    t2 = C16 * t17;
+    t12 = C17 * t10;
+    t9 = t2 + t12;
+    t15 = (-C17) * t17;
+    t18 = C16 * t10;
+    t0 = t15 + t18;
+    t13 = X[66];
+    t14 = X[13];
+    t3 = C18 * t13;
+    t1 = C19 * t14;
+    t2 = t3 + t1;
+    t12 = (-C19) * t13;
+    t17 = C18 * t14;
+    t10 = t12 + t17;
+    t15 = X[76];
+    t18 = X[3];
+    t3 = C20 * t15;
+    t1 = C21 * t18;
+    t13 = t3 + t1;
+    t14 = (-C21) * t15;
+    t12 = C20 * t18;
+    t17 = t14 + t12;
+    t3 = X[6];
+    t1 = X[73];
+    t15 = C22 * t3;
+    t18 = C23 * t1;
+    t14 = t15 + t18;
+    t12 = (-C23) * t3;
+    t15 = C22 * t1;
+    t18 = t12 + t15;
+    t3 = t5 + t9;
+    t1 = t16 + t0;
+    t12 = t19 + t13;
+    t15 = t4 + t17;
+    t5 = t5 - t9;
+    t9 = t16 - t0;
+    t16 = t19 - t13;
+    t0 = t4 - t17;
+    t19 = t3 + t12;
+    t13 = t1 + t15;
+    t4 = t5 + t0;
+    t17 = t9 - t16;
+    t3 = t3 - t12;
+    t12 = t1 - t15;
+    t1 = t5 - t0;
+    t15 = t9 + t16;
+    t5 = t7 + t2;
+    t0 = t8 + t10;
+    t9 = t11 + t14;
+    t16 = t6 + t18;
+    t7 = t7 - t2;
+    t2 = t8 - t10;
+    t8 = t11 - t14;
+    t10 = t6 - t18;
+    t11 = t5 + t9;
+    t14 = t0 + t16;
+    t6 = t7 + t10;
+    t18 = t2 - t8;
+    t5 = t5 - t9;
+    t9 = t0 - t16;
+    t0 = t7 - t10;
+    t16 = t2 + t8;
+    t7 = t6 + t18;
+    t10 = t6 - t18;
+    t2 = C6 * t7;
+    t8 = (-C6) * t10;
+    t6 = t0 - t16;
+    t18 = t0 + t16;
+    t7 = (-C6) * t6;
+    t10 = (-C6) * t18;
+    t0 = t19 - t11;
+    t16 = t13 - t14;
+    t6 = t19 + t11;
+    t18 = t13 + t14;
+    t19 = t4 - t2;
+    t11 = t17 - t8;
+    t13 = t4 + t2;
+    t14 = t17 + t8;
+    t4 = t3 - t9;
+    t2 = t12 + t5;
+    t17 = t3 + t9;
+    t8 = t12 - t5;
+    t3 = t1 - t7;
+    t9 = t15 - t10;
+    t12 = t1 + t7;
+    t5 = t15 + t10;
+    re[8] = t6;
+    im[8] = t18;
+    re[13] = t13;
+    im[13] = t14;
+    re[18] = t17;
+    im[18] = t8;
+    re[23] = t12;
+    im[23] = t5;
+    re[28] = t0;
+    im[28] = t16;
+    re[33] = t19;
+    im[33] = t11;
+    re[38] = t4;
+    im[38] = t2;
+    re[3] = t3;
+    im[3] = t9;
+    t1 = X[32];
+    t7 = X[47];
+    t15 = C24 * t1;
+    t10 = C25 * t7;
+    t6 = t15 + t10;
+    t18 = (-C25) * t1;
+    t13 = C24 * t7;
+    t14 = t18 + t13;
+    t17 = X[42];
+    t8 = X[37];
+    t12 = C26 * t17;
+    t5 = C27 * t8;
+    t0 = t12 + t5;
+    t16 = (-C27) * t17;
+    t19 = C26 * t8;
+    t11 = t16 + t19;
+    t4 = X[52];
+    t2 = X[27];
+    t3 = C28 * t4;
+    t9 = C29 * t2;
+    t15 = t3 + t9;
+    t10 = (-C29) * t4;
+    t1 = C28 * t2;
+    t7 = t10 + t1;
+    t18 = X[62];
+    t13 = X[17];
+    t12 = C30 * t18;
+    t5 = C31 * t13;
+    t17 = t12 + t5;
+    t8 = (-C31) * t18;
+    t16 = C30 * t13;
+    t19 = t8 + t16;
+    t3 = X[72];
+    t9 = X[7];
+    t4 = C32 * t3;
+    t2 = C33 * t9;
+    t10 = t4 + t2;
+    t1 = (-C33) * t3;
+    t12 = C32 * t9;
+    t5 = t1 + t12;
+    t18 = X[2];
+    t13 = X[77];
+    t8 = C34 * t18;
+    t16 = C35 * t13;
+    t4 = t8 + t16;
+    t2 = (-C35) * t18;
+    t3 = C34 * t13;
+    t9 = t2 + t3;
+    t1 = X[12];
+    t12 = X[67];
+    t8 = C36 * t1;
+    t16 = C37 * t12;
+    t18 = t8 + t16;
+    t13 = (-C37) * t1;
+    t2 = C36 * t12;
+    t3 = t13 + t2;
+    t8 = X[22];
+    t16 = X[57];
+    t1 = C38 * t8;
+    t12 = C39 * t16;
+    t13 = t1 + t12;
+    t2 = (-C39) * t8;
+    t1 = C38 * t16;
+    t12 = t2 + t1;
+    t8 = t6 + t10;
+    t16 = t14 + t5;
+    t2 = t15 + t18;
+    t1 = t7 + t3;
+    t6 = t6 - t10;
+    t10 = t14 - t5;
+    t14 = t15 - t18;
+    t5 = t7 - t3;
+    t15 = t8 + t2;
+    t18 = t16 + t1;
+    t7 = t6 + t5;
+    t3 = t10 - t14;
+    t8 = t8 - t2;
+    t2 = t16 - t1;
+    t16 = t6 - t5;
+    t1 = t10 + t14;
+    t6 = t0 + t4;
+    t5 = t11 + t9;
+    t10 = t17 + t13;
+    t14 = t19 + t12;
+    t0 = t0 - t4;
+    t4 = t11 - t9;
+    t11 = t17 - t13;
+    t9 = t19 - t12;
+    t17 = t6 + t10;
+    t13 = t5 + t14;
+    t19 = t0 + t9;
+    t12 = t4 - t11;
+    t6 = t6 - t10;
+    t10 = t5 - t14;
+    t5 = t0 - t9;
+    t14 = t4 + t11;
+    t0 = t19 + t12;
+    t9 = t19 - t12;
+    t4 = C6 * t0;
+    t11 = (-C6) * t9;
+    t19 = t5 - t14;
+    t12 = t5 + t14;
+    t0 = (-C6) * t19;
+    t9 = (-C6) * t12;
+    t5 = t15 - t17;
+    t14 = t18 - t13;
+    t19 = t15 + t17;
+    t12 = t18 + t13;
+    t15 = t7 - t4;
+    t17 = t3 - t11;
+    t18 = t7 + t4;
+    t13 = t3 + t11;
+    t7 = t8 - t10;
+    t4 = t2 + t6;
+    t3 = t8 + t10;
+    t11 = t2 - t6;
+    t8 = t16 - t0;
+    t10 = t1 - t9;
+    t2 = t16 + t0;
+    t6 = t1 + t9;
+    re[16] = t19;
+    im[16] = t12;
+    re[21] = t18;
+    im[21] = t13;
+    re[26] = t3;
+    im[26] = t11;
+    re[31] = t2;
+    im[31] = t6;
+    re[36] = t5;
+    im[36] = t14;
+    re[1] = t15;
+    im[1] = t17;
+    re[6] = t7;
+    im[6] = t4;
+    re[11] = t8;
+    im[11] = t10;
+    t16 = X[48];
+    t0 = X[31];
+    t1 = C25 * t16;
+    t9 = C24 * t0;
+    t19 = t1 + t9;
+    t12 = (-C24) * t16;
+    t18 = C25 * t0;
+    t13 = t12 + t18;
+    t3 = X[58];
+    t11 = X[21];
+    t2 = C39 * t3;
+    t6 = C38 * t11;
+    t5 = t2 + t6;
+    t14 = (-C38) * t3;
+    t15 = C39 * t11;
+    t17 = t14 + t15;
+    t7 = X[68];
+    t4 = X[11];
+    t8 = C37 * t7;
+    t10 = C36 * t4;
+    t1 = t8 + t10;
+    t9 = (-C36) * t7;
+    t16 = C37 * t4;
+    t0 = t9 + t16;
+    t12 = X[78];
+    t18 = X[1];
+    t2 = C35 * t12;
+    t6 = C34 * t18;
+    t3 = t2 + t6;
+    t11 = (-C34) * t12;
+    t14 = C35 * t18;
+    t15 = t11 + t14;
+    t8 = X[8];
+    t10 = X[71];
+    t7 = C33 * t8;
+    t4 = C32 * t10;
+    t9 = t7 + t4;
+    t16 = (-C32) * t8;
+    t2 = C33 * t10;
+    t6 = t16 + t2;
+    t12 = X[18];
+    t18 = X[61];
+    t11 = C31 * t12;
+    t14 = C30 * t18;
+    t7 = t11 + t14;
+    t4 = (-C30) * t12;
+    t8 = C31 * t18;
+    t10 = t4 + t8;
+    t16 = X[28];
+    t2 = X[51];
+    t11 = C29 * t16;
+    t14 = C28 * t2;
+    t12 = t11 + t14;
+    t18 = (-C28) * t16;
+    t4 = C29 * t2;
+    t8 = t18 + t4;
+    t11 = X[38];
+    t14 = X[41];
+    t16 = C27 * t11;
+    t2 = C26 * t14;
+    t18 = t16 + t2;
+    t4 = (-C26) * t11;
+    t16 = C27 * t14;
+    t2 = t4 + t16;
+    t11 = t19 + t9;
+    t14 = t13 + t6;
+    t4 = t1 + t12;
+    t16 = t0 + t8;
+    t19 = t19 - t9;
+    t9 = t13 - t6;
+    t13 = t1 - t12;
+    t6 = t0 - t8;
+    t1 = t11 + t4;
+    t12 = t14 + t16;
+    t0 = t19 + t6;
+    t8 = t9 - t13;
+    t11 = t11 - t4;
+    t4 = t14 - t16;
+    t14 = t19 - t6;
+    t16 = t9 + t13;
+    t19 = t5 + t7;
+    t6 = t17 + t10;
+    t9 = t3 + t18;
+    t13 = t15 + t2;
+    t5 = t5 - t7;
+    t7 = t17 - t10;
+    t17 = t3 - t18;
+    t10 = t15 - t2;
+    t3 = t19 + t9;
+    t18 = t6 + t13;
+    t15 = t5 + t10;
+    t2 = t7 - t17;
+    t19 = t19 - t9;
+    t9 = t6 - t13;
+    t6 = t5 - t10;
+    t13 = t7 + t17;
+    t5 = t15 + t2;
+    t10 = t15 - t2;
+    t7 = C6 * t5;
+    t17 = (-C6) * t10;
+    t15 = t6 - t13;
+    t2 = t6 + t13;
+    t5 = (-C6) * t15;
+    t10 = (-C6) * t2;
+    t6 = t1 - t3;
+    t13 = t12 - t18;
+    t15 = t1 + t3;
+    t2 = t12 + t18;
+    t1 = t0 - t7;
+    t3 = t8 - t17;
+    t12 = t0 + t7;
+    t18 = t8 + t17;
+    t0 = t11 - t9;
+    t7 = t4 + t19;
+    t8 = t11 + t9;
+    t17 = t4 - t19;
+    t11 = t14 - t5;
+    t9 = t16 - t10;
+    t4 = t14 + t5;
+    t19 = t16 + t10;
+    re[24] = t15;
+    im[24] = t2;
+    re[29] = t12;
+    im[29] = t18;
+    re[34] = t8;
+    im[34] = t17;
+    re[39] = t4;
+    im[39] = t19;
+    re[4] = t6;
+    im[4] = t13;
+    re[9] = t1;
+    im[9] = t3;
+    re[14] = t0;
+    im[14] = t7;
+    re[19] = t11;
+    im[19] = t9;
+    t14 = X[64];
+    t5 = X[15];
+    t16 = C9 * t14;
+    t10 = C8 * t5;
+    t15 = t16 + t10;
+    t2 = (-C8) * t14;
+    t12 = C9 * t5;
+    t18 = t2 + t12;
+    t8 = X[74];
+    t17 = X[5];
+    t4 = C23 * t8;
+    t19 = C22 * t17;
+    t6 = t4 + t19;
+    t13 = (-C22) * t8;
+    t1 = C23 * t17;
+    t3 = t13 + t1;
+    t0 = X[4];
+    t7 = X[75];
+    t11 = C21 * t0;
+    t9 = C20 * t7;
+    t16 = t11 + t9;
+    t10 = (-C20) * t0;
+    t14 = C21 * t7;
+    t5 = t10 + t14;
+    t2 = X[14];
+    t12 = X[65];
+    t4 = C19 * t2;
+    t19 = C18 * t12;
+    t8 = t4 + t19;
+    t17 = (-C18) * t2;
+    t13 = C19 * t12;
+    t1 = t17 + t13;
+    t11 = X[24];
+    t9 = X[55];
+    t0 = C17 * t11;
+    t7 = C16 * t9;
+    t10 = t0 + t7;
+    t14 = (-C16) * t11;
+    t4 = C17 * t9;
+    t19 = t14 + t4;
+    t2 = X[34];
+    t12 = X[45];
+    t17 = C15 * t2;
+    t13 = C14 * t12;
+    t0 = t17 + t13;
+    t7 = (-C14) * t2;
+    t11 = C15 * t12;
+    t9 = t7 + t11;
+    t14 = X[44];
+    t4 = X[35];
+    t17 = C13 * t14;
+    t13 = C12 * t4;
+    t2 = t17 + t13;
+    t12 = (-C12) * t14;
+    t7 = C13 * t4;
+    t11 = t12 + t7;
+    t17 = X[54];
+    t13 = X[25];
+    t14 = C11 * t17;
+    t4 = C10 * t13;
+    t12 = t14 + t4;
+    t7 = (-C10) * t17;
+    t14 = C11 * t13;
+    t4 = t7 + t14;
+    t17 = t15 + t10;
+    t13 = t18 + t19;
+    t7 = t16 + t2;
+    t14 = t5 + t11;
+    t15 = t15 - t10;
+    t10 = t18 - t19;
+    t18 = t16 - t2;
+    t19 = t5 - t11;
+    t16 = t17 + t7;
+    t2 = t13 + t14;
+    t5 = t15 + t19;
+    t11 = t10 - t18;
+    t17 = t17 - t7;
+    t7 = t13 - t14;
+    t13 = t15 - t19;
+    t14 = t10 + t18;
+    t15 = t6 + t0;
+    t19 = t3 + t9;
+    t10 = t8 + t12;
+    t18 = t1 + t4;
+    t6 = t6 - t0;
+    t0 = t3 - t9;
+    t3 = t8 - t12;
+    t9 = t1 - t4;
+    t8 = t15 + t10;
+    t12 = t19 + t18;
+    t1 = t6 + t9;
+    t4 = t0 - t3;
+    t15 = t15 - t10;
+    t10 = t19 - t18;
+    t19 = t6 - t9;
+    t18 = t0 + t3;
+    t6 = t1 + t4;
+    t9 = t1 - t4;
+    t0 = C6 * t6;
+    t3 = (-C6) * t9;
+    t1 = t19 - t18;
+    t4 = t19 + t18;
+    t6 = (-C6) * t1;
+    t9 = (-C6) * t4;
+    t19 = t16 - t8;
+    t18 = t2 - t12;
+    t1 = t16 + t8;
+    t4 = t2 + t12;
+    t16 = t5 - t0;
+    t8 = t11 - t3;
+    t2 = t5 + t0;
+    t12 = t11 + t3;
+    t5 = t17 - t10;
+    t0 = t7 + t15;
+    t11 = t17 + t10;
+    t3 = t7 - t15;
+    t17 = t13 - t6;
+    t10 = t14 - t9;
+    t7 = t13 + t6;
+    t15 = t14 + t9;
+    re[32] = t1;
+    im[32] = t4;
+    re[37] = t2;
+    im[37] = t12;
+    re[2] = t11;
+    im[2] = t3;
+    re[7] = t7;
+    im[7] = t15;
+    re[12] = t19;
+    im[12] = t18;
+    re[17] = t16;
+    im[17] = t8;
+    re[22] = t5;
+    im[22] = t0;
+    re[27] = t17;
+    im[27] = t10;
+    t13 = re[0];
+    t6 = im[0];
+    t14 = re[8];
+    t9 = im[8];
+    t1 = re[16];
+    t4 = im[16];
+    t2 = re[24];
+    t12 = im[24];
+    t11 = re[32];
+    t3 = im[32];
+    t7 = t14 + t11;
+    t15 = t9 + t3;
+    t19 = t1 + t2;
+    t18 = t4 + t12;
+    t16 = t14 - t11;
+    t8 = t9 - t3;
+    t5 = t1 - t2;
+    t0 = t4 - t12;
+    t17 = t7 + t19;
+    t10 = t15 + t18;
+    t14 = t7 - t19;
+    t11 = C40 * t14;
+    t9 = t15 - t18;
+    t3 = C40 * t9;
+    t1 = C41 * t17;
+    t2 = t13 - t1;
+    t4 = C41 * t10;
+    t12 = t6 - t4;
+    t7 = t2 + t11;
+    t19 = t12 + t3;
+    t14 = t2 - t11;
+    t15 = t12 - t3;
+    t18 = C8 * t16;
+    t9 = C25 * t5;
+    t1 = t18 + t9;
+    t4 = C8 * t8;
+    t2 = C25 * t0;
+    t11 = t4 + t2;
+    t12 = C25 * t16;
+    t3 = C8 * t5;
+    t18 = t12 - t3;
+    t9 = C25 * t8;
+    t4 = C8 * t0;
+    t2 = t9 - t4;
+    t16 = t13 + t17;
+    t5 = t6 + t10;
+    t12 = t7 + t11;
+    t3 = t19 - t1;
+    t8 = t14 + t2;
+    t0 = t15 - t18;
+    t9 = t14 - t2;
+    t4 = t15 + t18;
+    t13 = t7 - t11;
+    t17 = t19 + t1;
+    t6 = (-C42) * t16;
+    t10 = (-C43) * t5;
+    t14 = t6 + t10;
+    t2 = 0.14216525558046025 * t14;
+    y[119] = t2;
+    t15 = 0.13418561361414183 * t14;
+    y[120] = t15;
+    t18 = C43 * t16;
+    t7 = (-C42) * t5;
+    t11 = t18 + t7;
+    t19 = 0.08389809845214641 * t11;
+    y[39] = t19;
+    t1 = (-0.09666273325384828) * t11;
+    y[40] = t1;
+    t6 = (-C44) * t12;
+    t10 = (-C45) * t3;
+    t2 = t6 + t10;
+    t14 = 0.15663241580473444 * t2;
+    y[87] = t14;
+    t15 = (-0.005884211448476822) * t2;
+    y[152] = t15;
+    t16 = C45 * t12;
+    t5 = (-C44) * t3;
+    t18 = t16 + t5;
+    y[7] = 0;
+    t7 = (-0.1596093622865794) * t18;
+    y[72] = t7;
+    t19 = C46 * t8;
+    t11 = C47 * t0;
+    t1 = t19 + t11;
+    y[24] = 0;
+    t6 = (-0.159617931525304) * t1;
+    y[55] = t6;
+    t10 = (-C47) * t8;
+    t14 = C46 * t0;
+    t2 = t10 + t14;
+    t15 = 0.15662400684622813 * t2;
+    y[104] = t15;
+    t12 = (-0.002429150261123753) * t2;
+    y[135] = t12;
+    t3 = (-C48) * t9;
+    t16 = (-C49) * t4;
+    t5 = t3 + t16;
+    t18 = 0.15639631745730917 * t5;
+    y[103] = t18;
+    t7 = (-0.006424740791871616) * t5;
+    y[136] = t7;
+    t19 = C49 * t9;
+    t11 = (-C48) * t4;
+    t1 = t19 + t11;
+    y[23] = 0;
+    t6 = (-0.15985031109715314) * t1;
+    y[56] = t6;
+    t8 = C50 * t13;
+    t0 = C51 * t17;
+    t10 = t8 + t0;
+    y[8] = 0;
+    t14 = (-0.15965849449849032) * t10;
+    y[71] = t14;
+    t15 = (-C51) * t13;
+    t2 = C50 * t17;
+    t12 = t15 + t2;
+    t3 = 0.15658421481756118 * t12;
+    y[88] = t3;
+    t16 = (-0.007481582533385487) * t12;
+    y[151] = t16;
+    t18 = re[5];
+    t5 = im[5];
+    t7 = re[13];
+    t9 = im[13];
+    t4 = re[21];
+    t19 = im[21];
+    t11 = re[29];
+    t1 = im[29];
+    t6 = re[37];
+    t8 = im[37];
+    t0 = t7 + t6;
+    t10 = t9 + t8;
+    t14 = t4 + t11;
+    t13 = t19 + t1;
+    t17 = t7 - t6;
+    t15 = t9 - t8;
+    t2 = t4 - t11;
+    t3 = t19 - t1;
+    t12 = t0 + t14;
+    t16 = t10 + t13;
+    t7 = t0 - t14;
+    t6 = C40 * t7;
+    t9 = t10 - t13;
+    t8 = C40 * t9;
+    t4 = C41 * t12;
+    t11 = t18 - t4;
+    t19 = C41 * t16;
+    t1 = t5 - t19;
+    t0 = t11 + t6;
+    t14 = t1 + t8;
+    t7 = t11 - t6;
+    t10 = t1 - t8;
+    t13 = C8 * t17;
+    t9 = C25 * t2;
+    t4 = t13 + t9;
+    t19 = C8 * t15;
+    t11 = C25 * t3;
+    t6 = t19 + t11;
+    t1 = C25 * t17;
+    t8 = C8 * t2;
+    t13 = t1 - t8;
+    t9 = C25 * t15;
+    t19 = C8 * t3;
+    t11 = t9 - t19;
+    t17 = t18 + t12;
+    t2 = t5 + t16;
+    t1 = t0 + t6;
+    t8 = t14 - t4;
+    t15 = t7 + t11;
+    t3 = t10 - t13;
+    t9 = t7 - t11;
+    t19 = t10 + t13;
+    t18 = t0 - t6;
+    t12 = t14 + t4;
+    t5 = C52 * t17;
+    t16 = C53 * t2;
+    t7 = t5 + t16;
+    y[10] = 0;
+    t11 = (-0.1597012599907698) * t7;
+    y[69] = t11;
+    t10 = (-C53) * t17;
+    t13 = C52 * t2;
+    t0 = t10 + t13;
+    t6 = 0.15654228402108358 * t0;
+    y[90] = t6;
+    t14 = (-0.010858639707756983) * t0;
+    y[149] = t14;
+    t4 = (-C54) * t1;
+    t5 = (-C55) * t8;
+    t16 = t4 + t5;
+    t7 = 0.15412363927939443 * t16;
+    y[117] = t7;
+    t11 = 0.11495791137224536 * t16;
+    y[122] = t11;
+    t17 = C55 * t1;
+    t2 = (-C54) * t8;
+    t10 = t17 + t2;
+    t13 = 0.0575394552950557 * t10;
+    y[37] = t13;
+    t6 = (-0.11928984083002875) * t10;
+    y[42] = t6;
+    t0 = (-C56) * t15;
+    t14 = (-C57) * t3;
+    t4 = t0 + t14;
+    t5 = 0.1568278715072539 * t4;
+    y[85] = t5;
+    t7 = (-0.0031618374037639444) * t4;
+    y[154] = t7;
+    t16 = C57 * t15;
+    t11 = (-C56) * t3;
+    t1 = t16 + t11;
+    y[5] = 0;
+    t8 = (-0.15941043999212628) * t1;
+    y[74] = t8;
+    t17 = C58 * t9;
+    t2 = C59 * t19;
+    t13 = t17 + t2;
+    y[26] = 0;
+    t10 = (-0.15885839029036894) * t13;
+    y[53] = t10;
+    t6 = (-C59) * t9;
+    t0 = C58 * t19;
+    t14 = t6 + t0;
+    t5 = 0.15737286494156086 * t14;
+    y[106] = t5;
+    t4 = 0.007889466146396002 * t14;
+    y[133] = t4;
+    t7 = (-C60) * t18;
+    t15 = (-C61) * t12;
+    t3 = t7 + t15;
+    t16 = 0.1561572121508254 * t3;
+    y[101] = t16;
+    t11 = (-0.012365481978009343) * t3;
+    y[138] = t11;
+    t1 = C61 * t18;
+    t8 = (-C60) * t12;
+    t17 = t1 + t8;
+    y[21] = 0;
+    t2 = (-0.16009507121485747) * t17;
+    y[58] = t2;
+    t13 = re[10];
+    t10 = im[10];
+    t9 = re[18];
+    t19 = im[18];
+    t6 = re[26];
+    t0 = im[26];
+    t5 = re[34];
+    t14 = im[34];
+    t4 = re[2];
+    t7 = im[2];
+    t15 = t9 + t4;
+    t16 = t19 + t7;
+    t3 = t6 + t5;
+    t11 = t0 + t14;
+    t18 = t9 - t4;
+    t12 = t19 - t7;
+    t1 = t6 - t5;
+    t8 = t0 - t14;
+    t17 = t15 + t3;
+    t2 = t16 + t11;
+    t9 = t15 - t3;
+    t4 = C40 * t9;
+    t19 = t16 - t11;
+    t7 = C40 * t19;
+    t6 = C41 * t17;
+    t5 = t13 - t6;
+    t0 = C41 * t2;
+    t14 = t10 - t0;
+    t15 = t5 + t4;
+    t3 = t14 + t7;
+    t9 = t5 - t4;
+    t16 = t14 - t7;
+    t11 = C8 * t18;
+    t19 = C25 * t1;
+    t6 = t11 + t19;
+    t0 = C8 * t12;
+    t5 = C25 * t8;
+    t4 = t0 + t5;
+    t14 = C25 * t18;
+    t7 = C8 * t1;
+    t11 = t14 - t7;
+    t19 = C25 * t12;
+    t0 = C8 * t8;
+    t5 = t19 - t0;
+    t18 = t13 + t17;
+    t1 = t10 + t2;
+    t14 = t15 + t4;
+    t7 = t3 - t6;
+    t12 = t9 + t5;
+    t8 = t16 - t11;
+    t19 = t9 - t5;
+    t0 = t16 + t11;
+    t13 = t15 - t4;
+    t17 = t3 + t6;
+    t10 = (-C62) * t18;
+    t2 = (-C63) * t1;
+    t9 = t10 + t2;
+    t5 = 0.1561299466768942 * t9;
+    y[99] = t5;
+    t16 = (-0.015909267416101474) * t9;
+    y[140] = t16;
+    t11 = C63 * t18;
+    t15 = (-C62) * t1;
+    t4 = t11 + t15;
+    y[19] = 0;
+    t3 = (-0.160123029131219) * t4;
+    y[60] = t3;
+    t6 = C64 * t14;
+    t10 = C65 * t7;
+    t2 = t6 + t10;
+    y[12] = 0;
+    t5 = (-0.15973811180051878) * t2;
+    y[67] = t5;
+    t9 = (-C65) * t14;
+    t16 = C64 * t7;
+    t18 = t9 + t16;
+    t1 = 0.15650616949335203 * t18;
+    y[92] = t1;
+    t11 = (-0.014008424338699877) * t18;
+    y[147] = t11;
+    t15 = (-C66) * t12;
+    t4 = (-C67) * t8;
+    t3 = t15 + t4;
+    t6 = 0.16060581690627343 * t3;
+    y[115] = t6;
+    t10 = 0.0929181804081584 * t3;
+    y[124] = t10;
+    t2 = C67 * t12;
+    t5 = (-C66) * t8;
+    t14 = t2 + t5;
+    t7 = 0.033365340990259666 * t14;
+    y[35] = t7;
+    t9 = (-0.13635716095680167) * t14;
+    y[44] = t9;
+    t16 = (-C68) * t19;
+    t1 = (-C69) * t0;
+    t18 = t16 + t1;
+    t11 = 0.15718347876838412 * t18;
+    y[83] = t11;
+    t15 = (-0.0013019059697089003) * t18;
+    y[156] = t15;
+    t4 = C69 * t19;
+    t6 = (-C68) * t0;
+    t3 = t4 + t6;
+    y[3] = 0;
+    t10 = (-0.1590497945196801) * t3;
+    y[76] = t10;
+    t12 = C70 * t13;
+    t8 = C71 * t17;
+    t2 = t12 + t8;
+    y[28] = 0;
+    t5 = (-0.15756113296346336) * t2;
+    y[51] = t5;
+    t7 = (-C71) * t13;
+    t14 = C70 * t17;
+    t9 = t7 + t14;
+    t16 = 0.15866857219030792 * t9;
+    y[108] = t16;
+    t1 = 0.021612760900660985 * t9;
+    y[131] = t1;
+    t11 = re[15];
+    t18 = im[15];
+    t15 = re[23];
+    t19 = im[23];
+    t0 = re[31];
+    t4 = im[31];
+    t6 = re[39];
+    t3 = im[39];
+    t10 = re[7];
+    t12 = im[7];
+    t8 = t15 + t10;
+    t2 = t19 + t12;
+    t5 = t0 + t6;
+    t13 = t4 + t3;
+    t17 = t15 - t10;
+    t7 = t19 - t12;
+    t14 = t0 - t6;
+    t16 = t4 - t3;
+    t9 = t8 + t5;
+    t1 = t2 + t13;
+    t15 = t8 - t5;
+    t10 = C40 * t15;
+    t19 = t2 - t13;
+    t12 = C40 * t19;
+    t0 = C41 * t9;
+    t6 = t11 - t0;
+    t4 = C41 * t1;
+    t3 = t18 - t4;
+    t8 = t6 + t10;
+    t5 = t3 + t12;
+    t15 = t6 - t10;
+    t2 = t3 - t12;
+    t13 = C8 * t17;
+    t19 = C25 * t14;
+    t0 = t13 + t19;
+    t4 = C8 * t7;
+    t6 = C25 * t16;
+    t10 = t4 + t6;
+    t3 = C25 * t17;
+    t12 = C8 * t14;
+    t13 = t3 - t12;
+    t19 = C25 * t7;
+    t4 = C8 * t16;
+    t6 = t19 - t4;
+    t17 = t11 + t9;
+    t14 = t18 + t1;
+    t3 = t8 + t10;
+    t12 = t5 - t0;
+    t7 = t15 + t6;
+    t16 = t2 - t13;
+    t19 = t15 - t6;
+    t4 = t2 + t13;
+    t11 = t8 - t10;
+    t9 = t5 + t0;
+    t18 = C72 * t17;
+    t1 = C73 * t14;
+    t15 = t18 + t1;
+    t6 = 0.0015806239461963042 * t15;
+    y[30] = t6;
+    t2 = (-0.15532737668361812) * t15;
+    y[49] = t2;
+    t13 = (-C73) * t17;
+    t8 = C72 * t14;
+    t10 = t13 + t8;
+    t5 = 0.16055513915487243 * t10;
+    y[110] = t5;
+    t0 = 0.03883999236386311 * t10;
+    y[129] = t0;
+    t18 = (-C74) * t3;
+    t1 = (-C75) * t12;
+    t6 = t18 + t1;
+    t15 = 0.15622664545694537 * t6;
+    y[97] = t15;
+    t2 = (-0.017389520617964793) * t6;
+    y[142] = t2;
+    t17 = C75 * t3;
+    t14 = (-C74) * t12;
+    t13 = t17 + t14;
+    y[17] = 0;
+    t8 = (-0.16002391862718304) * t13;
+    y[62] = t8;
+    t5 = C76 * t7;
+    t10 = C77 * t16;
+    t0 = t5 + t10;
+    y[14] = 0;
+    t18 = (-0.1598227887301481) * t0;
+    y[65] = t18;
+    t1 = (-C77) * t7;
+    t15 = C76 * t16;
+    t6 = t1 + t15;
+    t2 = 0.15642324976703487 * t6;
+    y[94] = t2;
+    t3 = (-0.016364174061938876) * t6;
+    y[145] = t3;
+    t12 = (-C78) * t19;
+    t17 = (-C79) * t4;
+    t14 = t12 + t17;
+    t13 = 0.16248324860908755 * t14;
+    y[113] = t13;
+    t8 = 0.07017275641407882 * t14;
+    y[126] = t8;
+    t5 = C79 * t19;
+    t10 = (-C78) * t4;
+    t0 = t5 + t10;
+    t18 = 0.014993410396791937 * t0;
+    y[33] = t18;
+    t7 = (-0.14738670767240072) * t0;
+    y[46] = t7;
+    t16 = (-C80) * t11;
+    t1 = (-C81) * t9;
+    t15 = t16 + t1;
+    t2 = 0.1576837042991903 * t15;
+    y[81] = t2;
+    t6 = (-0.00033175419007782557) * t15;
+    y[158] = t6;
+    t3 = C81 * t11;
+    t12 = (-C80) * t9;
+    t17 = t3 + t12;
+    y[1] = 0;
+    t13 = (-0.15854523529308265) * t17;
+    y[78] = t13;
+    t14 = re[20];
+    t8 = im[20];
+    t19 = re[28];
+    t4 = im[28];
+    t5 = re[36];
+    t10 = im[36];
+    t18 = re[4];
+    t0 = im[4];
+    t7 = re[12];
+    t16 = im[12];
+    t1 = t19 + t7;
+    t2 = t4 + t16;
+    t15 = t5 + t18;
+    t6 = t10 + t0;
+    t11 = t19 - t7;
+    t9 = t4 - t16;
+    t3 = t5 - t18;
+    t12 = t10 - t0;
+    t17 = t1 + t15;
+    t13 = t2 + t6;
+    t19 = t1 - t15;
+    t7 = C40 * t19;
+    t4 = t2 - t6;
+    t16 = C40 * t4;
+    t5 = C41 * t17;
+    t18 = t14 - t5;
+    t10 = C41 * t13;
+    t0 = t8 - t10;
+    t1 = t18 + t7;
+    t15 = t0 + t16;
+    t19 = t18 - t7;
+    t2 = t0 - t16;
+    t6 = C8 * t11;
+    t4 = C25 * t3;
+    t5 = t6 + t4;
+    t10 = C8 * t9;
+    t18 = C25 * t12;
+    t7 = t10 + t18;
+    t0 = C25 * t11;
+    t16 = C8 * t3;
+    t6 = t0 - t16;
+    t4 = C25 * t9;
+    t10 = C8 * t12;
+    t18 = t4 - t10;
+    t11 = t14 + t17;
+    t3 = t8 + t13;
+    t0 = t1 + t7;
+    t16 = t15 - t5;
+    t9 = t19 + t18;
+    t12 = t2 - t6;
+    t4 = t19 - t18;
+    t10 = t2 + t6;
+    t14 = t1 - t7;
+    t17 = t15 + t5;
+    t8 = C82 * t11;
+    t13 = C83 * t3;
+    t19 = t8 + t13;
+    y[0] = 0;
+    t18 = (-0.15825972186273007) * t19;
+    y[79] = t18;
+    t2 = (-C83) * t11;
+    t6 = C82 * t3;
+    t1 = t2 + t6;
+    t7 = 0.15796817854693496 * t1;
+    y[80] = t7;
+    t15 = (-0.00011192165058231297) * t1;
+    y[159] = t15;
+    t5 = C84 * t0;
+    t8 = C85 * t16;
+    t13 = t5 + t8;
+    t19 = 0.008668493404903221 * t13;
+    y[32] = t19;
+    t18 = (-0.15094710208915332) * t13;
+    y[47] = t18;
+    t11 = (-C85) * t0;
+    t3 = C84 * t16;
+    t2 = t11 + t3;
+    t6 = 0.16222349904739322 * t2;
+    y[112] = t6;
+    t7 = 0.059160560443338166 * t2;
+    y[127] = t7;
+    t1 = (-C86) * t9;
+    t15 = (-C87) * t12;
+    t5 = t1 + t15;
+    t8 = 0.15636245601683701 * t5;
+    y[95] = t8;
+    t19 = (-0.017088418123905845) * t5;
+    y[144] = t19;
+    t13 = C87 * t9;
+    t18 = (-C86) * t12;
+    t0 = t13 + t18;
+    y[15] = 0;
+    t16 = (-0.159884927858309) * t0;
+    y[64] = t16;
+    t11 = C88 * t4;
+    t3 = C89 * t10;
+    t6 = t11 + t3;
+    y[16] = 0;
+    t2 = (-0.15995452979169403) * t6;
+    y[63] = t2;
+    t7 = (-C89) * t4;
+    t1 = C88 * t10;
+    t15 = t7 + t1;
+    t8 = 0.15629441712314787 * t15;
+    y[96] = t8;
+    t5 = (-0.01744379180388242) * t15;
+    y[143] = t5;
+    t19 = (-C90) * t14;
+    t9 = (-C91) * t17;
+    t12 = t19 + t9;
+    t13 = 0.16150182247894337 * t12;
+    y[111] = t13;
+    t18 = 0.04866411823441746 * t12;
+    y[128] = t18;
+    t0 = C91 * t14;
+    t16 = (-C90) * t17;
+    t11 = t0 + t16;
+    t3 = 0.004271385525508252 * t11;
+    y[31] = t3;
+    t6 = (-0.15350995059510428) * t11;
+    y[48] = t6;
+    t2 = re[25];
+    t4 = im[25];
+    t10 = re[33];
+    t7 = im[33];
+    t1 = re[1];
+    t8 = im[1];
+    t15 = re[9];
+    t5 = im[9];
+    t19 = re[17];
+    t9 = im[17];
+    t13 = t10 + t19;
+    t12 = t7 + t9;
+    t18 = t1 + t15;
+    t14 = t8 + t5;
+    t17 = t10 - t19;
+    t0 = t7 - t9;
+    t16 = t1 - t15;
+    t3 = t8 - t5;
+    t11 = t13 + t18;
+    t6 = t12 + t14;
+    t10 = t13 - t18;
+    t19 = C40 * t10;
+    t7 = t12 - t14;
+    t9 = C40 * t7;
+    t1 = C41 * t11;
+    t15 = t2 - t1;
+    t8 = C41 * t6;
+    t5 = t4 - t8;
+    t13 = t15 + t19;
+    t18 = t5 + t9;
+    t10 = t15 - t19;
+    t12 = t5 - t9;
+    t14 = C8 * t17;
+    t7 = C25 * t16;
+    t1 = t14 + t7;
+    t8 = C8 * t0;
+    t15 = C25 * t3;
+    t19 = t8 + t15;
+    t5 = C25 * t17;
+    t9 = C8 * t16;
+    t14 = t5 - t9;
+    t7 = C25 * t0;
+    t8 = C8 * t3;
+    t15 = t7 - t8;
+    t17 = t2 + t11;
+    t16 = t4 + t6;
+    t5 = t13 + t19;
+    t9 = t18 - t1;
+    t0 = t10 + t15;
+    t3 = t12 - t14;
+    t7 = t10 - t15;
+    t8 = t12 + t14;
+    t2 = t13 - t19;
+    t11 = t18 + t1;
+    t4 = (-C92) * t17;
+    t6 = (-C93) * t16;
+    t10 = t4 + t6;
+    t15 = 0.15959492397100342 * t10;
+    y[109] = t15;
+    t12 = 0.029799508325242533 * t10;
+    y[130] = t12;
+    t14 = C93 * t17;
+    t13 = (-C92) * t16;
+    t19 = t14 + t13;
+    y[29] = 0;
+    t18 = (-0.1566465861065996) * t19;
+    y[50] = t18;
+    t1 = C94 * t5;
+    t4 = C95 * t9;
+    t6 = t1 + t4;
+    y[2] = 0;
+    t15 = (-0.15881211993964434) * t6;
+    y[77] = t15;
+    t10 = (-C95) * t5;
+    t12 = C94 * t9;
+    t17 = t10 + t12;
+    t16 = 0.15741871596135812 * t17;
+    y[82] = t16;
+    t14 = (-0.0007154966391789613) * t17;
+    y[157] = t14;
+    t13 = C96 * t0;
+    t19 = C97 * t3;
+    t18 = t13 + t19;
+    t1 = 0.023278916757886927 * t18;
+    y[34] = t1;
+    t4 = (-0.14258715791581017) * t18;
+    y[45] = t4;
+    t6 = (-C97) * t0;
+    t15 = C96 * t3;
+    t5 = t6 + t15;
+    t9 = 0.1620250139602121 * t5;
+    y[114] = t9;
+    t10 = 0.08150352389146673 * t5;
+    y[125] = t10;
+    t12 = (-C98) * t7;
+    t16 = (-C99) * t8;
+    t17 = t12 + t16;
+    t14 = 0.15647181233545088 * t17;
+    y[93] = t14;
+    t13 = (-0.015318553056048427) * t17;
+    y[146] = t13;
+    t19 = C99 * t7;
+    t1 = (-C98) * t8;
+    t18 = t19 + t1;
+    y[13] = 0;
+    t4 = (-0.1597731861531963) * t18;
+    y[66] = t4;
+    t0 = C100 * t2;
+    t3 = C101 * t11;
+    t6 = t0 + t3;
+    y[18] = 0;
+    t15 = (-0.16008369471707354) * t6;
+    y[61] = t15;
+    t9 = (-C101) * t2;
+    t5 = C100 * t11;
+    t10 = t9 + t5;
+    t12 = 0.15616830960944622 * t10;
+    y[98] = t12;
+    t16 = (-0.016889284512954593) * t10;
+    y[141] = t16;
+    t14 = re[30];
+    t17 = im[30];
+    t13 = re[38];
+    t7 = im[38];
+    t8 = re[6];
+    t19 = im[6];
+    t1 = re[14];
+    t18 = im[14];
+    t4 = re[22];
+    t0 = im[22];
+    t3 = t13 + t4;
+    t6 = t7 + t0;
+    t15 = t8 + t1;
+    t2 = t19 + t18;
+    t11 = t13 - t4;
+    t9 = t7 - t0;
+    t5 = t8 - t1;
+    t12 = t19 - t18;
+    t10 = t3 + t15;
+    t16 = t6 + t2;
+    t13 = t3 - t15;
+    t4 = C40 * t13;
+    t7 = t6 - t2;
+    t0 = C40 * t7;
+    t8 = C41 * t10;
+    t1 = t14 - t8;
+    t19 = C41 * t16;
+    t18 = t17 - t19;
+    t3 = t1 + t4;
+    t15 = t18 + t0;
+    t13 = t1 - t4;
+    t6 = t18 - t0;
+    t2 = C8 * t11;
+    t7 = C25 * t5;
+    t8 = t2 + t7;
+    t19 = C8 * t9;
+    t1 = C25 * t12;
+    t4 = t19 + t1;
+    t18 = C25 * t11;
+    t0 = C8 * t5;
+    t2 = t18 - t0;
+    t7 = C25 * t9;
+    t19 = C8 * t12;
+    t1 = t7 - t19;
+    t11 = t14 + t10;
+    t5 = t17 + t16;
+    t18 = t3 + t4;
+    t0 = t15 - t8;
+    t9 = t13 + t1;
+    t12 = t6 - t2;
+    t7 = t13 - t1;
+    t19 = t6 + t2;
+    t14 = t3 - t4;
+    t10 = t15 + t8;
+    t17 = C102 * t11;
+    t16 = C103 * t5;
+    t13 = t17 + t16;
+    y[20] = 0;
+    t1 = (-0.16013062777511758) * t13;
+    y[59] = t1;
+    t6 = (-C103) * t11;
+    t2 = C102 * t5;
+    t3 = t6 + t2;
+    t4 = 0.15612253787644678 * t3;
+    y[100] = t4;
+    t15 = (-0.014414377050633673) * t3;
+    y[139] = t15;
+    t8 = (-C104) * t18;
+    t17 = (-C105) * t0;
+    t16 = t8 + t17;
+    t13 = 0.15793834823672137 * t16;
+    y[107] = t13;
+    t1 = 0.014309890259083354 * t16;
+    y[132] = t1;
+    t11 = C105 * t18;
+    t5 = (-C104) * t0;
+    t6 = t11 + t5;
+    y[27] = 0;
+    t2 = (-0.1582896128717863) * t6;
+    y[52] = t2;
+    t4 = C106 * t9;
+    t3 = C107 * t12;
+    t15 = t4 + t3;
+    y[4] = 0;
+    t8 = (-0.15925061826669198) * t15;
+    y[75] = t8;
+    t17 = (-C107) * t9;
+    t13 = C106 * t12;
+    t16 = t17 + t13;
+    t1 = 0.1569852617974348 * t16;
+    y[84] = t1;
+    t18 = (-0.0021151101200055688) * t16;
+    y[155] = t18;
+    t0 = C108 * t7;
+    t11 = C109 * t19;
+    t5 = t0 + t11;
+    t6 = 0.044930384658902804 * t5;
+    y[36] = t6;
+    t2 = (-0.12859113334157854) * t5;
+    y[43] = t2;
+    t4 = (-C109) * t7;
+    t3 = C108 * t19;
+    t15 = t4 + t3;
+    t8 = 0.15802082872576895 * t15;
+    y[116] = t8;
+    t9 = 0.10415941412713003 * t15;
+    y[123] = t9;
+    t12 = (-C110) * t14;
+    t17 = (-C111) * t10;
+    t13 = t12 + t17;
+    t1 = 0.15652789169528872 * t13;
+    y[91] = t1;
+    t16 = (-0.012498345006756617) * t13;
+    y[148] = t16;
+    t18 = C111 * t14;
+    t0 = (-C110) * t10;
+    t11 = t18 + t0;
+    y[11] = 0;
+    t6 = (-0.15971594409938933) * t11;
+    y[68] = t6;
+    t5 = re[35];
+    t2 = im[35];
+    t7 = re[3];
+    t19 = im[3];
+    t4 = re[11];
+    t3 = im[11];
+    t8 = re[19];
+    t15 = im[19];
+    t9 = re[27];
+    t12 = im[27];
+    t17 = t7 + t9;
+    t1 = t19 + t12;
+    t13 = t4 + t8;
+    t16 = t3 + t15;
+    t14 = t7 - t9;
+    t10 = t19 - t12;
+    t18 = t4 - t8;
+    t0 = t3 - t15;
+    t11 = t17 + t13;
+    t6 = t1 + t16;
+    t7 = t17 - t13;
+    t9 = C40 * t7;
+    t19 = t1 - t16;
+    t12 = C40 * t19;
+    t4 = C41 * t11;
+    t8 = t5 - t4;
+    t3 = C41 * t6;
+    t15 = t2 - t3;
+    t17 = t8 + t9;
+    t13 = t15 + t12;
+    t7 = t8 - t9;
+    t1 = t15 - t12;
+    t16 = C8 * t14;
+    t19 = C25 * t18;
+    t4 = t16 + t19;
+    t3 = C8 * t10;
+    t8 = C25 * t0;
+    t9 = t3 + t8;
+    t15 = C25 * t14;
+    t12 = C8 * t18;
+    t16 = t15 - t12;
+    t19 = C25 * t10;
+    t3 = C8 * t0;
+    t8 = t19 - t3;
+    t14 = t5 + t11;
+    t18 = t2 + t6;
+    t15 = t17 + t9;
+    t12 = t13 - t4;
+    t10 = t7 + t8;
+    t0 = t1 - t16;
+    t19 = t7 - t8;
+    t3 = t1 + t16;
+    t5 = t17 - t9;
+    t11 = t13 + t4;
+    t2 = (-C112) * t14;
+    t6 = (-C113) * t18;
+    t7 = t2 + t6;
+    t8 = 0.15655764735454158 * t7;
+    y[89] = t8;
+    t1 = (-0.0091621537650263) * t7;
+    y[150] = t1;
+    t16 = C113 * t14;
+    t17 = (-C112) * t18;
+    t9 = t16 + t17;
+    y[9] = 0;
+    t13 = (-0.15968558816794706) * t9;
+    y[70] = t13;
+    t4 = C114 * t15;
+    t2 = C115 * t12;
+    t6 = t4 + t2;
+    y[22] = 0;
+    t8 = (-0.16000529362860896) * t6;
+    y[57] = t8;
+    t7 = (-C115) * t15;
+    t1 = C114 * t12;
+    t14 = t7 + t1;
+    t18 = 0.15624483061184172 * t14;
+    y[102] = t18;
+    t16 = (-0.00971876726953771) * t14;
+    y[137] = t16;
+    t17 = (-C116) * t10;
+    t9 = (-C117) * t0;
+    t13 = t17 + t9;
+    t4 = 0.15694295355898114 * t13;
+    y[105] = t4;
+    t2 = 0.002324519265439871 * t13;
+    y[134] = t2;
+    t6 = C117 * t10;
+    t8 = (-C116) * t0;
+    t15 = t6 + t8;
+    y[25] = 0;
+    t12 = (-0.1592935485988842) * t15;
+    y[54] = t12;
+    t7 = C118 * t19;
+    t1 = C119 * t3;
+    t18 = t7 + t1;
+    y[6] = 0;
+    t14 = (-0.1595289221807345) * t18;
+    y[73] = t14;
+    t16 = (-C119) * t19;
+    t17 = C118 * t3;
+    t9 = t16 + t17;
+    t4 = 0.15671139538996476 * t9;
+    y[86] = t4;
+    t13 = (-0.004428626713515163) * t9;
+    y[153] = t13;
+    t2 = C120 * t5;
+    t10 = C121 * t11;
+    t0 = t2 + t10;
+    t6 = 0.07069761626753265 * t0;
+    y[38] = t6;
+    t8 = (-0.10857017400397721) * t0;
+    y[41] = t8;
+    t15 = (-C121) * t5;
+    t12 = C120 * t11;
+    t7 = t15 + t12;
+    t1 = 0.14883810273591877 * t7;
+    y[118] = t1;
+    t18 = 0.12504836448919263 * t7;
+    y[121] = t18;
+}
+
+//  Export public APIs.
+module.exports = {
+    "ApplyWindowedMDCT_W10_80": ApplyWindowedMDCT_W10_80,
+    "ApplyWindowedIMDCT_W10_80": ApplyWindowedIMDCT_W10_80
+};
\ No newline at end of file
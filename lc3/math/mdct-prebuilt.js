@@ -0,0 +1,638 @@
+//
+//  Copyright 2021 - 2023 XiaoJSoft Studio. All rights reserved.
+//  Use of this source code is governed by a BSD-style license that can be
+//  found in the LICENSE.md file.
+//
+
+//
+//  Note(s):
+//    [1] This file is generated automatically by a MDCT compiler, which locates 
+//        at "./../../dev/mdct-generator/" directory.
+//        Do NOT modify this file manually.
+//
+
+//
+//  Imports.
+//
+
+//  Imported modules.
+const Lc3TblW75_60 = 
+    require("./../tables/w75_60");
+const Lc3TblW10_80 = 
+    require("./../tables/w10_80");
+const Lc3TblW75_120 = 
+    require("./../tables/w75_120");
+const Lc3TblW10_160 = 
+    require("./../tables/w10_160");
+const Lc3TblW75_180 = 
+    require("./../tables/w75_180");
+const Lc3TblW10_240 = 
+    require("./../tables/w10_240");
+const Lc3TblW75_240 = 
+    require("./../tables/w75_240");
+const Lc3TblW10_320 = 
+    require("./../tables/w10_320");
+const Lc3TblW75_360 = 
+    require("./../tables/w75_360");
+const Lc3TblW10_480 = 
+    require("./../tables/w10_480");
+
+//
+//  Globals.
+//
+
+//  Prebuilt windowed MDCT kernels (null if not loaded yet).
+let g_PrebuiltWindowedKernel_W75_60 = null;
+let g_PrebuiltWindowedKernel_W10_80 = null;
+let g_PrebuiltWindowedKernel_W75_120 = null;
+let g_PrebuiltWindowedKernel_W10_160 = null;
+let g_PrebuiltWindowedKernel_W75_180 = null;
+let g_PrebuiltWindowedKernel_W10_240 = null;
+let g_PrebuiltWindowedKernel_W75_240 = null;
+let g_PrebuiltWindowedKernel_W10_320 = null;
+let g_PrebuiltWindowedKernel_W75_360 = null;
+let g_PrebuiltWindowedKernel_W10_480 = null;
+
+//
+//  Private functions.
+//
+
+/**
+ *  Load the prebuilt windowed MDCT kernels (window W75_60).
+ * 
+ *  @returns {?Object}
+ *    - The kernel descriptor (null if the kernel module is not bundled).
+ */
+function LoadPrebuiltWindowedKernel_W75_60() {
+    if (g_PrebuiltWindowedKernel_W75_60 === null) {
+        let Lc3Mdct60 = null;
+        try {
+            Lc3Mdct60 = require("./mdct-60");
+        } catch (error) {
+            //  Not bundled (see "browser/modules-unrolled.json").
+            return null;
+        }
+        g_PrebuiltWindowedKernel_W75_60 = {
+            "forward": Lc3Mdct60.ApplyWindowedMDCT_W75_60,
+            "inverse": Lc3Mdct60.ApplyWindowedIMDCT_W75_60,
+            "inversePruned": []
+        };
+    }
+    return g_PrebuiltWindowedKernel_W75_60;
+}
+
+/**
+ *  Load the prebuilt windowed MDCT kernels (window W10_80).
+ * 
+ *  @returns {?Object}
+ *    - The kernel descriptor (null if the kernel module is not bundled).
+ */
+function LoadPrebuiltWindowedKernel_W10_80() {
+    if (g_PrebuiltWindowedKernel_W10_80 === null) {
+        let Lc3Mdct80 = null;
+        try {
+            Lc3Mdct80 = require("./mdct-80");
+        } catch (error) {
+            //  Not bundled (see "browser/modules-unrolled.json").
+            return null;
+        }
+        g_PrebuiltWindowedKernel_W10_80 = {
+            "forward": Lc3Mdct80.ApplyWindowedMDCT_W10_80,
+            "inverse": Lc3Mdct80.ApplyWindowedIMDCT_W10_80,
+            "inversePruned": []
+        };
+    }
+    return g_PrebuiltWindowedKernel_W10_80;
+}
+
+/**
+ *  Load the prebuilt input-pruned IMDCT kernel (window W75_120, nonzero-bin
+ *  count 60).
+ * 
+ *  @returns {Function}
+ *    - The IMDCT function.
+ */
+function LoadPrebuiltPrunedKernel_W75_120_K60() {
+    const Lc3Mdct120W75_120K60 = 
+        require("./mdct-120-w75_120-k60");
+    return Lc3Mdct120W75_120K60.ApplyWindowedIMDCT_W75_120_K60;
+}
+
+/**
+ *  Load the prebuilt windowed MDCT kernels (window W75_120).
+ * 
+ *  @returns {?Object}
+ *    - The kernel descriptor (null if the kernel module is not bundled).
+ */
+function LoadPrebuiltWindowedKernel_W75_120() {
+    if (g_PrebuiltWindowedKernel_W75_120 === null) {
+        let Lc3Mdct120 = null;
+        try {
+            Lc3Mdct120 = require("./mdct-120");
+        } catch (error) {
+            //  Not bundled (see "browser/modules-unrolled.json").
+            return null;
+        }
+        g_PrebuiltWindowedKernel_W75_120 = {
+            "forward": Lc3Mdct120.ApplyWindowedMDCT_W75_120,
+            "inverse": Lc3Mdct120.ApplyWindowedIMDCT_W75_120,
+            "inversePruned": [
+                {
+                    "count": 60,
+                    "loadInverse": LoadPrebuiltPrunedKernel_W75_120_K60
+                }
+            ]
+        };
+    }
+    return g_PrebuiltWindowedKernel_W75_120;
+}
+
+/**
+ *  Load the prebuilt input-pruned IMDCT kernel (window W10_160, nonzero-bin
+ *  count 80).
+ * 
+ *  @returns {Function}
+ *    - The IMDCT function.
+ */
+function LoadPrebuiltPrunedKernel_W10_160_K80() {
+    const Lc3Mdct160W10_160K80 = 
+        require("./mdct-160-w10_160-k80");
+    return Lc3Mdct160W10_160K80.ApplyWindowedIMDCT_W10_160_K80;
+}
+
+/**
+ *  Load the prebuilt windowed MDCT kernels (window W10_160).
+ * 
+ *  @returns {?Object}
+ *    - The kernel descriptor (null if the kernel module is not bundled).
+ */
+function LoadPrebuiltWindowedKernel_W10_160() {
+    if (g_PrebuiltWindowedKernel_W10_160 === null) {
+        let Lc3Mdct160 = null;
+        try {
+            Lc3Mdct160 = require("./mdct-160");
+        } catch (error) {
+            //  Not bundled (see "browser/modules-unrolled.json").
+            return null;
+        }
+        g_PrebuiltWindowedKernel_W10_160 = {
+            "forward": Lc3Mdct160.ApplyWindowedMDCT_W10_160,
+            "inverse": Lc3Mdct160.ApplyWindowedIMDCT_W10_160,
+            "inversePruned": [
+                {
+                    "count": 80,
+                    "loadInverse": LoadPrebuiltPrunedKernel_W10_160_K80
+                }
+            ]
+        };
+    }
+    return g_PrebuiltWindowedKernel_W10_160;
+}
+
+/**
+ *  Load the prebuilt input-pruned IMDCT kernel (window W75_180, nonzero-bin
+ *  count 60).
+ * 
+ *  @returns {Function}
+ *    - The IMDCT function.
+ */
+function LoadPrebuiltPrunedKernel_W75_180_K60() {
+    const Lc3Mdct180W75_180K60 = 
+        require("./mdct-180-w75_180-k60");
+    return Lc3Mdct180W75_180K60.ApplyWindowedIMDCT_W75_180_K60;
+}
+
+/**
+ *  Load the prebuilt input-pruned IMDCT kernel (window W75_180, nonzero-bin
+ *  count 120).
+ * 
+ *  @returns {Function}
+ *    - The IMDCT function.
+ */
+function LoadPrebuiltPrunedKernel_W75_180_K120() {
+    const Lc3Mdct180W75_180K120 = 
+        require("./mdct-180-w75_180-k120");
+    return Lc3Mdct180W75_180K120.ApplyWindowedIMDCT_W75_180_K120;
+}
+
+/**
+ *  Load the prebuilt windowed MDCT kernels (window W75_180).
+ * 
+ *  @returns {?Object}
+ *    - The kernel descriptor (null if the kernel module is not bundled).
+ */
+function LoadPrebuiltWindowedKernel_W75_180() {
+    if (g_PrebuiltWindowedKernel_W75_180 === null) {
+        let Lc3Mdct180 = null;
+        try {
+            Lc3Mdct180 = require("./mdct-180");
+        } catch (error) {
+            //  Not bundled (see "browser/modules-unrolled.json").
+            return null;
+        }
+        g_PrebuiltWindowedKernel_W75_180 = {
+            "forward": Lc3Mdct180.ApplyWindowedMDCT_W75_180,
+            "inverse": Lc3Mdct180.ApplyWindowedIMDCT_W75_180,
+            "inversePruned": [
+                {
+                    "count": 60,
+                    "loadInverse": LoadPrebuiltPrunedKernel_W75_180_K60
+                },
+                {
+                    "count": 120,
+                    "loadInverse": LoadPrebuiltPrunedKernel_W75_180_K120
+                }
+            ]
+        };
+    }
+    return g_PrebuiltWindowedKernel_W75_180;
+}
+
+/**
+ *  Load the prebuilt input-pruned IMDCT kernel (window W10_240, nonzero-bin
+ *  count 80).
+ * 
+ *  @returns {Function}
+ *    - The IMDCT function.
+ */
+function LoadPrebuiltPrunedKernel_W10_240_K80() {
+    const Lc3Mdct240W10_240K80 = 
+        require("./mdct-240-w10_240-k80");
+    return Lc3Mdct240W10_240K80.ApplyWindowedIMDCT_W10_240_K80;
+}
+
+/**
+ *  Load the prebuilt input-pruned IMDCT kernel (window W10_240, nonzero-bin
+ *  count 160).
+ * 
+ *  @returns {Function}
+ *    - The IMDCT function.
+ */
+function LoadPrebuiltPrunedKernel_W10_240_K160() {
+    const Lc3Mdct240W10_240K160 = 
+        require("./mdct-240-w10_240-k160");
+    return Lc3Mdct240W10_240K160.ApplyWindowedIMDCT_W10_240_K160;
+}
+
+/**
+ *  Load the prebuilt windowed MDCT kernels (window W10_240).
+ * 
+ *  @returns {?Object}
+ *    - The kernel descriptor (null if the kernel module is not bundled).
+ */
+function LoadPrebuiltWindowedKernel_W10_240() {
+    if (g_PrebuiltWindowedKernel_W10_240 === null) {
+        let Lc3Mdct240 = null;
+        try {
+            Lc3Mdct240 = require("./mdct-240");
+        } catch (error) {
+            //  Not bundled (see "browser/modules-unrolled.json").
+            return null;
+        }
+        g_PrebuiltWindowedKernel_W10_240 = {
+            "forward": Lc3Mdct240.ApplyWindowedMDCT_W10_240,
+            "inverse": Lc3Mdct240.ApplyWindowedIMDCT_W10_240,
+            "inversePruned": [
+                {
+                    "count": 80,
+                    "loadInverse": LoadPrebuiltPrunedKernel_W10_240_K80
+                },
+                {
+                    "count": 160,
+                    "loadInverse": LoadPrebuiltPrunedKernel_W10_240_K160
+                }
+            ]
+        };
+    }
+    return g_PrebuiltWindowedKernel_W10_240;
+}
+
+/**
+ *  Load the prebuilt input-pruned IMDCT kernel (window W75_240, nonzero-bin
+ *  count 60).
+ * 
+ *  @returns {Function}
+ *    - The IMDCT function.
+ */
+function LoadPrebuiltPrunedKernel_W75_240_K60() {
+    const Lc3Mdct240W75_240K60 = 
+        require("./mdct-240-w75_240-k60");
+    return Lc3Mdct240W75_240K60.ApplyWindowedIMDCT_W75_240_K60;
+}
+
+/**
+ *  Load the prebuilt input-pruned IMDCT kernel (window W75_240, nonzero-bin
+ *  count 120).
+ * 
+ *  @returns {Function}
+ *    - The IMDCT function.
+ */
+function LoadPrebuiltPrunedKernel_W75_240_K120() {
+    const Lc3Mdct240W75_240K120 = 
+        require("./mdct-240-w75_240-k120");
+    return Lc3Mdct240W75_240K120.ApplyWindowedIMDCT_W75_240_K120;
+}
+
+/**
+ *  Load the prebuilt windowed MDCT kernels (window W75_240).
+ * 
+ *  @returns {?Object}
+ *    - The kernel descriptor (null if the kernel module is not bundled).
+ */
+function LoadPrebuiltWindowedKernel_W75_240() {
+    if (g_PrebuiltWindowedKernel_W75_240 === null) {
+        let Lc3Mdct240 = null;
+        try {
+            Lc3Mdct240 = require("./mdct-240");
+        } catch (error) {
+            //  Not bundled (see "browser/modules-unrolled.json").
+            return null;
+        }
+        g_PrebuiltWindowedKernel_W75_240 = {
+            "forward": Lc3Mdct240.ApplyWindowedMDCT_W75_240,
+            "inverse": Lc3Mdct240.ApplyWindowedIMDCT_W75_240,
+            "inversePruned": [
+                {
+                    "count": 60,
+                    "loadInverse": LoadPrebuiltPrunedKernel_W75_240_K60
+                },
+                {
+                    "count": 120,
+                    "loadInverse": LoadPrebuiltPrunedKernel_W75_240_K120
+                }
+            ]
+        };
+    }
+    return g_PrebuiltWindowedKernel_W75_240;
+}
+
+/**
+ *  Load the prebuilt input-pruned IMDCT kernel (window W10_320, nonzero-bin
+ *  count 80).
+ * 
+ *  @returns {Function}
+ *    - The IMDCT function.
+ */
+function LoadPrebuiltPrunedKernel_W10_320_K80() {
+    const Lc3Mdct320W10_320K80 = 
+        require("./mdct-320-w10_320-k80");
+    return Lc3Mdct320W10_320K80.ApplyWindowedIMDCT_W10_320_K80;
+}
+
+/**
+ *  Load the prebuilt input-pruned IMDCT kernel (window W10_320, nonzero-bin
+ *  count 160).
+ * 
+ *  @returns {Function}
+ *    - The IMDCT function.
+ */
+function LoadPrebuiltPrunedKernel_W10_320_K160() {
+    const Lc3Mdct320W10_320K160 = 
+        require("./mdct-320-w10_320-k160");
+    return Lc3Mdct320W10_320K160.ApplyWindowedIMDCT_W10_320_K160;
+}
+
+/**
+ *  Load the prebuilt windowed MDCT kernels (window W10_320).
+ * 
+ *  @returns {?Object}
+ *    - The kernel descriptor (null if the kernel module is not bundled).
+ */
+function LoadPrebuiltWindowedKernel_W10_320() {
+    if (g_PrebuiltWindowedKernel_W10_320 === null) {
+        let Lc3Mdct320 = null;
+        try {
+            Lc3Mdct320 = require("./mdct-320");
+        } catch (error) {
+            //  Not bundled (see "browser/modules-unrolled.json").
+            return null;
+        }
+        g_PrebuiltWindowedKernel_W10_320 = {
+            "forward": Lc3Mdct320.ApplyWindowedMDCT_W10_320,
+            "inverse": Lc3Mdct320.ApplyWindowedIMDCT_W10_320,
+            "inversePruned": [
+                {
+                    "count": 80,
+                    "loadInverse": LoadPrebuiltPrunedKernel_W10_320_K80
+                },
+                {
+                    "count": 160,
+                    "loadInverse": LoadPrebuiltPrunedKernel_W10_320_K160
+                }
+            ]
+        };
+    }
+    return g_PrebuiltWindowedKernel_W10_320;
+}
+
+/**
+ *  Load the prebuilt input-pruned IMDCT kernel (window W75_360, nonzero-bin
+ *  count 60).
+ * 
+ *  @returns {Function}
+ *    - The IMDCT function.
+ */
+function LoadPrebuiltPrunedKernel_W75_360_K60() {
+    const Lc3Mdct360W75_360K60 = 
+        require("./mdct-360-w75_360-k60");
+    return Lc3Mdct360W75_360K60.ApplyWindowedIMDCT_W75_360_K60;
+}
+
+/**
+ *  Load the prebuilt input-pruned IMDCT kernel (window W75_360, nonzero-bin
+ *  count 120).
+ * 
+ *  @returns {Function}
+ *    - The IMDCT function.
+ */
+function LoadPrebuiltPrunedKernel_W75_360_K120() {
+    const Lc3Mdct360W75_360K120 = 
+        require("./mdct-360-w75_360-k120");
+    return Lc3Mdct360W75_360K120.ApplyWindowedIMDCT_W75_360_K120;
+}
+
+/**
+ *  Load the prebuilt windowed MDCT kernels (window W75_360).
+ * 
+ *  @returns {?Object}
+ *    - The kernel descriptor (null if the kernel module is not bundled).
+ */
+function LoadPrebuiltWindowedKernel_W75_360() {
+    if (g_PrebuiltWindowedKernel_W75_360 === null) {
+        let Lc3Mdct360 = null;
+        try {
+            Lc3Mdct360 = require("./mdct-360");
+        } catch (error) {
+            //  Not bundled (see "browser/modules-unrolled.json").
+            return null;
+        }
+        g_PrebuiltWindowedKernel_W75_360 = {
+            "forward": Lc3Mdct360.ApplyWindowedMDCT_W75_360,
+            "inverse": Lc3Mdct360.ApplyWindowedIMDCT_W75_360,
+            "inversePruned": [
+                {
+                    "count": 60,
+                    "loadInverse": LoadPrebuiltPrunedKernel_W75_360_K60
+                },
+                {
+                    "count": 120,
+                    "loadInverse": LoadPrebuiltPrunedKernel_W75_360_K120
+                }
+            ]
+        };
+    }
+    return g_PrebuiltWindowedKernel_W75_360;
+}
+
+/**
+ *  Load the prebuilt input-pruned IMDCT kernel (window W10_480, nonzero-bin
+ *  count 80).
+ * 
+ *  @returns {Function}
+ *    - The IMDCT function.
+ */
+function LoadPrebuiltPrunedKernel_W10_480_K80() {
+    const Lc3Mdct480W10_480K80 = 
+        require("./mdct-480-w10_480-k80");
+    return Lc3Mdct480W10_480K80.ApplyWindowedIMDCT_W10_480_K80;
+}
+
+/**
+ *  Load the prebuilt input-pruned IMDCT kernel (window W10_480, nonzero-bin
+ *  count 160).
+ * 
+ *  @returns {Function}
+ *    - The IMDCT function.
+ */
+function LoadPrebuiltPrunedKernel_W10_480_K160() {
+    const Lc3Mdct480W10_480K160 = 
+        require("./mdct-480-w10_480-k160");
+    return Lc3Mdct480W10_480K160.ApplyWindowedIMDCT_W10_480_K160;
+}
+
+/**
+ *  Load the prebuilt windowed MDCT kernels (window W10_480).
+ * 
+ *  @returns {?Object}
+ *    - The kernel descriptor (null if the kernel module is not bundled).
+ */
+function LoadPrebuiltWindowedKernel_W10_480() {
+    if (g_PrebuiltWindowedKernel_W10_480 === null) {
+        let Lc3Mdct480 = null;
+        try {
+            Lc3Mdct480 = require("./mdct-480");
+        } catch (error) {
+            //  Not bundled (see "browser/modules-unrolled.json").
+            return null;
+        }
+        g_PrebuiltWindowedKernel_W10_480 = {
+            "forward": Lc3Mdct480.ApplyWindowedMDCT_W10_480,
+            "inverse": Lc3Mdct480.ApplyWindowedIMDCT_W10_480,
+            "inversePruned": [
+                {
+                    "count": 80,
+                    "loadInverse": LoadPrebuiltPrunedKernel_W10_480_K80
+                },
+                {
+                    "count": 160,
+                    "loadInverse": LoadPrebuiltPrunedKernel_W10_480_K160
+                }
+            ]
+        };
+    }
+    return g_PrebuiltWindowedKernel_W10_480;
+}
+
+//
+//  Public functions.
+//
+
+/**
+ *  Find the prebuilt MDCT kernels of specific unit size.
+ * 
+ *  Note(s):
+ *    [1] The returned object contains following fields:
+ *          - "forward": The MDCT function, which has signature
+ *            (x, w, X, re, im).
+ *          - "inverse": The IMDCT function, which has signature
+ *            (X, w, y, re, im).
+ *    [2] The kernel module is loaded on the first lookup.
+ *    [3] The returned object shall not be modified.
+ * 
+ *  @param {Number} M
+ *    - The unit size.
+ *  @returns {?Object}
+ *    - The prebuilt kernels (null if not available).
+ */
+function FindPrebuiltMDCT(M) {
+    switch (M) {
+    default:
+        return null;
+    }
+}
+
+/**
+ *  Find the prebuilt windowed MDCT kernels of specific window table.
+ * 
+ *  Note(s):
+ *    [1] The returned object contains following fields:
+ *          - "forward": The MDCT function (with window W and gain
+ *            sqrt(2 / M) baked), which has signature (x, X, re, im).
+ *          - "inverse": The IMDCT function (with flipped window W and
+ *            gain sqrt(2 / M) baked), which has signature (X, y, re, im).
+ *          - "inversePruned": The input-pruned IMDCT kernels (in
+ *            ascending order of "count"), each one is an object that
+ *            contains following fields:
+ *              - "count": The nonzero-bin count (X[k] shall be zero
+ *                for all k >= count).
+ *              - "loadInverse": The loader of the IMDCT function
+ *                (same signature as "inverse"), which loads the
+ *                kernel module on its first call.
+ *    [2] The window table is matched by identity (not by value).
+ *    [3] The kernel module is loaded on the first lookup.
+ *    [4] The returned object shall not be modified.
+ * 
+ *  @param {Number[]} W
+ *    - The window table.
+ *  @returns {?Object}
+ *    - The prebuilt kernels (null if not available).
+ */
+function FindPrebuiltWindowedMDCT(W) {
+    if (W === Lc3TblW75_60.W75_60) {
+        return LoadPrebuiltWindowedKernel_W75_60();
+    }
+    if (W === Lc3TblW10_80.W10_80) {
+        return LoadPrebuiltWindowedKernel_W10_80();
+    }
+    if (W === Lc3TblW75_120.W75_120) {
+        return LoadPrebuiltWindowedKernel_W75_120();
+    }
+    if (W === Lc3TblW10_160.W10_160) {
+        return LoadPrebuiltWindowedKernel_W10_160();
+    }
+    if (W === Lc3TblW75_180.W75_180) {
+        return LoadPrebuiltWindowedKernel_W75_180();
+    }
+    if (W === Lc3TblW10_240.W10_240) {
+        return LoadPrebuiltWindowedKernel_W10_240();
+    }
+    if (W === Lc3TblW75_240.W75_240) {
+        return LoadPrebuiltWindowedKernel_W75_240();
+    }
+    if (W === Lc3TblW10_320.W10_320) {
+        return LoadPrebuiltWindowedKernel_W10_320();
+    }
+    if (W === Lc3TblW75_360.W75_360) {
+        return LoadPrebuiltWindowedKernel_W75_360();
+    }
+    if (W === Lc3TblW10_480.W10_480) {
+        return LoadPrebuiltWindowedKernel_W10_480();
+    }
+    return null;
+}
+
+//  Export public APIs.
+module.exports = {
+    "FindPrebuiltMDCT": FindPrebuiltMDCT,
+    "FindPrebuiltWindowedMDCT": FindPrebuiltWindowedMDCT
+};
\ No newline at end of file
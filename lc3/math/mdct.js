@@ -11,6 +11,10 @@
 //  Imported modules.
 const Lc3FFT = 
     require("./fft");
+const Lc3MdctPrebuilt = 
+    require("./mdct-prebuilt");
+const Lc3Unrolled = 
+    require("./unrolled");
 const Lc3UInt = 
     require("./../common/uint");
 const Lc3Error = 
@@ -25,6 +29,14 @@ const FFT =
 //  Imported functions.
 const IsUInt32 = 
     Lc3UInt.IsUInt32;
+const FindPrebuiltMDCT = 
+    Lc3MdctPrebuilt.FindPrebuiltMDCT;
+const EnableUnrolledKernels = 
+    Lc3Unrolled.EnableUnrolledKernels;
+const DisableUnrolledKernels = 
+    Lc3Unrolled.DisableUnrolledKernels;
+const IsUnrolledKernelsEnabled = 
+    Lc3Unrolled.IsUnrolledKernelsEnabled;
 
 //
 //  Development Notes:
@@ -40,6 +52,12 @@ const IsUInt32 =
 /**
  *  MDCT transformer.
  * 
+ *  Note(s):
+ *    [1] The prebuilt unrolled kernel is used only if it was enabled (by 
+ *        EnableUnrolledKernels()) when the transformer was created, and 
+ *        it is only prebuilt for unit sizes that have no prebuilt windowed 
+ *        kernel (see FindPrebuiltMDCT()).
+ * 
  *  @constructor
  *  @throws {LC3IllegalParameterError}
  *    - Unit size is not an unsigned 32-bit integer, or 
@@ -91,6 +109,19 @@ function MDCT(M, C = 1, W = null) {
         }
     }
 
+    //  Prebuilt kernel (with the gain constant applied to the window sequence
+    //  and its scratch buffers).
+    let prebuilt = (IsUnrolledKernelsEnabled() ? FindPrebuiltMDCT(M) : null);
+    let prebuilt_w = null, prebuilt_s1 = null, prebuilt_s2 = null;
+    if (prebuilt !== null) {
+        prebuilt_w = new Array(N);
+        for (let n = 0; n < N; ++n) {
+            prebuilt_w[n] = C * W[n];
+        }
+        prebuilt_s1 = new Array(M >>> 1);
+        prebuilt_s2 = new Array(M >>> 1);
+    }
+
     //  Derive constants.
     let C_div_2 = C * 0.5;
     let PI_div_2 = Math.PI * 0.5;
@@ -149,6 +180,12 @@ function MDCT(M, C = 1, W = null) {
             );
         }
 
+        //  Use the prebuilt kernel if available.
+        if (prebuilt !== null) {
+            prebuilt.forward(x, prebuilt_w, X, prebuilt_s1, prebuilt_s2);
+            return;
+        }
+
         //  z[0...M]:
         for (let n = 0, u = 0; n < M; ++n, u += 2) {
             let x1 = x[u], x2 = x[u + 1];
@@ -227,6 +264,12 @@ function MDCT(M, C = 1, W = null) {
 /**
  *  IMDCT transformer.
  * 
+ *  Note(s):
+ *    [1] The prebuilt unrolled kernel is used only if it was enabled (by 
+ *        EnableUnrolledKernels()) when the transformer was created, and 
+ *        it is only prebuilt for unit sizes that have no prebuilt windowed 
+ *        kernel (see FindPrebuiltMDCT()).
+ * 
  *  @constructor
  *  @throws {LC3IllegalParameterError}
  *    - Unit size is not an unsigned 32-bit integer, or 
@@ -274,6 +317,19 @@ function MDCT(M, C = 1, W = null) {
         }
     }
 
+    //  Prebuilt kernel (with all gain factors applied to the window sequence
+    //  and its scratch buffers).
+    let prebuilt = (IsUnrolledKernelsEnabled() ? FindPrebuiltMDCT(M) : null);
+    let prebuilt_w = null, prebuilt_s1 = null, prebuilt_s2 = null;
+    if (prebuilt !== null) {
+        prebuilt_w = new Array(N);
+        for (let n = 0; n < N; ++n) {
+            prebuilt_w[n] = G_static * G_dynamic[n] / M;
+        }
+        prebuilt_s1 = new Array(M >>> 1);
+        prebuilt_s2 = new Array(M >>> 1);
+    }
+
     //  Derive constants.
     let N_sub_1 = N - 1;
     let M_sub_1 = M - 1;
@@ -349,6 +405,12 @@ function MDCT(M, C = 1, W = null) {
             );
         }
 
+        //  Use the prebuilt kernel if available.
+        if (prebuilt !== null) {
+            prebuilt.inverse(X, prebuilt_w, Y, prebuilt_s1, prebuilt_s2);
+            return;
+        }
+
         //  Xp[0...N - 1]:
         let Xp_factor = (((M & 1) != 0) ? 1 : -1);
         for (let k1 = 0, k2 = N_sub_1; k1 < M; ++k1, --k2) {
@@ -395,8 +457,12 @@ function MDCT(M, C = 1, W = null) {
     };
 }
 
-//  Export public APIs.
+//  Export public APIs (the unrolled kernel switches are re-exported, see the 
+//  "unrolled" module).
 module.exports = {
     "MDCT": MDCT,
-    "IMDCT": IMDCT
+    "IMDCT": IMDCT,
+    "EnableUnrolledKernels": EnableUnrolledKernels,
+    "DisableUnrolledKernels": DisableUnrolledKernels,
+    "IsUnrolledKernelsEnabled": IsUnrolledKernelsEnabled
 };
\ No newline at end of file
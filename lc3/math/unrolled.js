@@ -0,0 +1,73 @@
+//
+//  Copyright 2021 - 2023 XiaoJSoft Studio. All rights reserved.
+//  Use of this source code is governed by a BSD-style license that can be
+//  found in the LICENSE.md file.
+//
+
+//
+//  Globals.
+//
+
+/**
+ *  Whether the prebuilt unrolled kernels are used (see 
+ *  EnableUnrolledKernels()).
+ * 
+ *  @type {Boolean}
+ */
+let g_UnrolledKernelsEnabled = false;
+
+//
+//  Public functions.
+//
+
+/**
+ *  Use the prebuilt unrolled kernels in transformers created afterwards, 
+ *  i.e. the MDCT kernels of MDCT (and IMDCT) transformers (and the LD-MDCT 
+ *  modules of the encoder and the decoder), and the real-data FFT kernels 
+ *  (used by the LTPF module of the encoder) of FFT transformers.
+ * 
+ *  Note(s):
+ *    [1] The unrolled kernels are not used by default. Each one is tens of 
+ *        thousands of lines, which costs load time when it is first used, 
+ *        and it runs unoptimized for its first thousand (or more) calls. 
+ *        Once optimized, the codec takes about 10% less time per frame 
+ *        with it (48kHz, 10ms, Node.js 20), which pays back the warm-up 
+ *        cost only after several minutes of audio, so enable it for 
+ *        long-running streams only.
+ *    [2] Transformers created before are not affected.
+ *    [3] The unrolled kernels are only bundled by the unrolled browser 
+ *        bundle (i.e. "lc3-unrolled.js"), the generic transforms are still 
+ *        used with the default browser bundle.
+ *    [4] The switches are kept in this module (and re-exported by the MDCT 
+ *        module), so that the FFT module (which is imported by the MDCT 
+ *        module) can also read them.
+ */
+function EnableUnrolledKernels() {
+    g_UnrolledKernelsEnabled = true;
+}
+
+/**
+ *  Stop using the prebuilt unrolled kernels in transformers created 
+ *  afterwards (see EnableUnrolledKernels()).
+ */
+function DisableUnrolledKernels() {
+    g_UnrolledKernelsEnabled = false;
+}
+
+/**
+ *  Get whether the prebuilt unrolled kernels are used (see 
+ *  EnableUnrolledKernels()).
+ * 
+ *  @returns {Boolean}
+ *    - True if used.
+ */
+function IsUnrolledKernelsEnabled() {
+    return g_UnrolledKernelsEnabled;
+}
+
+//  Export public APIs.
+module.exports = {
+    "EnableUnrolledKernels": EnableUnrolledKernels,
+    "DisableUnrolledKernels": DisableUnrolledKernels,
+    "IsUnrolledKernelsEnabled": IsUnrolledKernelsEnabled
+};
\ No newline at end of file
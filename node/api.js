@@ -23,6 +23,8 @@ const Lc3MathFftTfmCore =
     require("./../lc3/math/fft-tfm-core");
 const Lc3MathFft = 
     require("./../lc3/math/fft");
+const Lc3MathMdct = 
+    require("./../lc3/math/mdct");
 const Lc3Error = 
     require("./../lc3/error");
 const Lc3NodeWorker = 
@@ -59,6 +61,10 @@ const SetCustomTransformer =
     Lc3MathFft.SetCustomTransformer;
 const UnsetCustomTransformer = 
     Lc3MathFft.UnsetCustomTransformer;
+const EnableUnrolledKernels = 
+    Lc3MathMdct.EnableUnrolledKernels;
+const DisableUnrolledKernels = 
+    Lc3MathMdct.DisableUnrolledKernels;
 
 //  Export public APIs.
 module.exports = {
@@ -100,6 +106,12 @@ module.exports = {
                 SetCustomTransformer,
             "UnsetCustomTransformer": 
                 UnsetCustomTransformer
+        },
+        "MDCT": {
+            "EnableUnrolledKernels": 
+                EnableUnrolledKernels,
+            "DisableUnrolledKernels": 
+                DisableUnrolledKernels
         }
     },
     "Worker": {
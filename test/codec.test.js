@@ -0,0 +1,288 @@
+//
+//  Copyright 2021 - 2023 XiaoJSoft Studio. All rights reserved.
+//  Use of this source code is governed by a BSD-style license that can be
+//  found in the LICENSE.md file.
+//
+
+//
+//  Imports.
+//
+
+//  Imported modules.
+const NodeTest = 
+    require("node:test");
+const NodeAssert = 
+    require("node:assert");
+const NodeCrypto = 
+    require("node:crypto");
+const NodeFs = 
+    require("node:fs");
+const NodePath = 
+    require("node:path");
+const Lc3Fs = 
+    require("./../lc3/common/fs");
+const Lc3Nms = 
+    require("./../lc3/common/nms");
+const Lc3EcEncoder = 
+    require("./../lc3/encoder/encoder");
+const Lc3DcDecoder = 
+    require("./../lc3/decoder/decoder");
+const Lc3DcBec = 
+    require("./../lc3/decoder/bec");
+const Lc3Mdct = 
+    require("./../lc3/math/mdct");
+
+//  Imported classes.
+const LC3SampleRate = 
+    Lc3Fs.LC3SampleRate;
+const LC3FrameDuration = 
+    Lc3Nms.LC3FrameDuration;
+const LC3Encoder = 
+    Lc3EcEncoder.LC3Encoder;
+const LC3Decoder = 
+    Lc3DcDecoder.LC3Decoder;
+const LC3BEC = 
+    Lc3DcBec.LC3BEC;
+
+//  Imported functions.
+const EnableUnrolledKernels = 
+    Lc3Mdct.EnableUnrolledKernels;
+const DisableUnrolledKernels = 
+    Lc3Mdct.DisableUnrolledKernels;
+const describe = 
+    NodeTest.describe;
+const it = 
+    NodeTest.it;
+
+//
+//  Constants.
+//
+
+/**
+ *  Path of the baseline file (the SHA-256 digests of the encoded frames and 
+ *  the decoded samples of each case).
+ * 
+ *  Note(s):
+ *    [1] Run with environment variable "LC3_UPDATE_BASELINE=1" to rewrite 
+ *        the baseline file (instead of comparing with it).
+ * 
+ *  @type {String}
+ */
+const BASELINE_PATH = NodePath.join(__dirname, "codec-baseline.json");
+
+/**
+ *  Frame count of each case.
+ * 
+ *  @type {Number}
+ */
+const FRAME_COUNT = 50;
+
+/**
+ *  Interval of the lost frames (decoded by packet loss concealment).
+ * 
+ *  @type {Number}
+ */
+const LOSS_INTERVAL = 17;
+
+/**
+ *  Frame durations to be tested.
+ * 
+ *  @type {Array<InstanceType<typeof LC3FrameDuration>>}
+ */
+const DURATIONS = [
+    LC3FrameDuration.NMS_10000US, 
+    LC3FrameDuration.NMS_07500US
+];
+
+/**
+ *  Sample rates to be tested.
+ * 
+ *  @type {Array<InstanceType<typeof LC3SampleRate>>}
+ */
+const SAMPLE_RATES = [
+    LC3SampleRate.FS_08000, 
+    LC3SampleRate.FS_16000, 
+    LC3SampleRate.FS_24000, 
+    LC3SampleRate.FS_32000, 
+    LC3SampleRate.FS_44100, 
+    LC3SampleRate.FS_48000
+];
+
+/**
+ *  Encoded frame sizes (in bytes) to be tested.
+ * 
+ *  @type {Number[]}
+ */
+const FRAME_BYTES = [30, 120];
+
+/**
+ *  Signals to be tested, "full" is two tones and white noise, "voice" is 
+ *  two low tones only, so that the encoder detects a narrow bandwidth (and 
+ *  the decoder uses an input-pruned IMDCT kernel if the unrolled kernels 
+ *  are enabled, e.g. at 44.1kHz and 48kHz).
+ * 
+ *  @type {String[]}
+ */
+const SIGNALS = ["full", "voice"];
+
+//
+//  Private functions.
+//
+
+/**
+ *  Generate the test signal.
+ * 
+ *  @param {String} signal 
+ *    - The signal name (see SIGNALS).
+ *  @param {Number} fs 
+ *    - The sample rate.
+ *  @param {Number} count 
+ *    - The sample count.
+ *  @returns {Int16Array}
+ *    - The samples.
+ */
+function GenerateSignal(signal, fs, count) {
+    let xs = new Int16Array(count);
+    let seed = 12345;
+    for (let n = 0; n < count; ++n) {
+        let t = n / fs;
+        let x = 0;
+        if (signal == "full") {
+            seed = ((seed * 1103515245 + 12345) & 0x7FFFFFFF);
+            x = 6000 * Math.sin(2 * Math.PI * 440 * t) + 
+                3000 * Math.sin(2 * Math.PI * 3100 * t + 0.3) + 
+                4000 * (seed / 0x7FFFFFFF - 0.5);
+        } else {
+            x = 6000 * Math.sin(2 * Math.PI * 300 * t) + 
+                3000 * Math.sin(2 * Math.PI * 1500 * t + 0.3);
+        }
+        xs[n] = Math.round(x);
+    }
+    return xs;
+}
+
+/**
+ *  Encode and decode one case.
+ * 
+ *  @param {InstanceType<typeof LC3FrameDuration>} Nms 
+ *    - The frame duration.
+ *  @param {InstanceType<typeof LC3SampleRate>} Fs 
+ *    - The sample rate.
+ *  @param {Number} nbytes 
+ *    - The encoded frame size.
+ *  @param {String} signal 
+ *    - The signal name.
+ *  @param {Boolean} [unrolled]
+ *    - True if the prebuilt unrolled MDCT kernels shall be used (see 
+ *      EnableUnrolledKernels()).
+ *  @returns {Object}
+ *    - The SHA-256 digests of the encoded frames ("bitstream") and the 
+ *      decoded samples ("pcm").
+ */
+function RunCase(Nms, Fs, nbytes, signal, unrolled = false) {
+    if (unrolled) {
+        EnableUnrolledKernels();
+    }
+    let encoder = new LC3Encoder(Nms, Fs);
+    let decoder = new LC3Decoder(Nms, Fs);
+    DisableUnrolledKernels();
+    let NF = encoder.getFrameSize();
+    let xs = GenerateSignal(signal, Fs.getSampleRate(), FRAME_COUNT * NF);
+    let bytes = new Uint8Array(nbytes);
+    let ys = new Int16Array(NF);
+    let bec = new LC3BEC(false);
+    let h_bitstream = NodeCrypto.createHash("sha256");
+    let h_pcm = NodeCrypto.createHash("sha256");
+    for (let f = 0; f < FRAME_COUNT; ++f) {
+        encoder.encode(xs.subarray(f * NF, (f + 1) * NF), nbytes, bytes);
+        h_bitstream.update(bytes);
+        if (f % LOSS_INTERVAL == LOSS_INTERVAL - 1) {
+            bec.mark();
+        } else {
+            bec.clear();
+        }
+        decoder.decode(bytes, bec, ys);
+        h_pcm.update(ys);
+    }
+    return {
+        "bitstream": h_bitstream.digest("hex"),
+        "pcm": h_pcm.digest("hex")
+    };
+}
+
+/**
+ *  Get the name of one case.
+ * 
+ *  @param {InstanceType<typeof LC3FrameDuration>} Nms 
+ *    - The frame duration.
+ *  @param {InstanceType<typeof LC3SampleRate>} Fs 
+ *    - The sample rate.
+ *  @param {Number} nbytes 
+ *    - The encoded frame size.
+ *  @param {String} signal 
+ *    - The signal name.
+ *  @returns {String}
+ *    - The case name.
+ */
+function GetCaseName(Nms, Fs, nbytes, signal) {
+    return (
+        Nms.toMicroseconds().toString() + "us-" + 
+        Fs.getSampleRate().toString() + "hz-" + 
+        nbytes.toString() + "b-" + 
+        signal
+    );
+}
+
+//
+//  Tests.
+//
+
+if (process.env["LC3_UPDATE_BASELINE"] == "1") {
+    let baseline = {};
+    for (let Nms of DURATIONS) {
+        for (let Fs of SAMPLE_RATES) {
+            for (let nbytes of FRAME_BYTES) {
+                for (let signal of SIGNALS) {
+                    baseline[GetCaseName(Nms, Fs, nbytes, signal)] = 
+                        RunCase(Nms, Fs, nbytes, signal);
+                }
+            }
+        }
+    }
+    NodeFs.writeFileSync(
+        BASELINE_PATH, 
+        JSON.stringify(baseline, null, 4) + "\n"
+    );
+} else {
+    let baseline = JSON.parse(NodeFs.readFileSync(BASELINE_PATH, "utf-8"));
+    for (let unrolled of [false, true]) {
+        let title = (
+            "Codec (bit-exact regression" + 
+            (unrolled ? ", unrolled MDCT kernels" : "") + 
+            ")"
+        );
+        describe(title, function() {
+            for (let Nms of DURATIONS) {
+                for (let Fs of SAMPLE_RATES) {
+                    for (let nbytes of FRAME_BYTES) {
+                        for (let signal of SIGNALS) {
+                            let name = GetCaseName(Nms, Fs, nbytes, signal);
+                            it(name, function() {
+                                NodeAssert.deepStrictEqual(
+                                    RunCase(
+                                        Nms, 
+                                        Fs, 
+                                        nbytes, 
+                                        signal, 
+                                        unrolled
+                                    ), 
+                                    baseline[name]
+                                );
+                            });
+                        }
+                    }
+                }
+            }
+        });
+    }
+}
\ No newline at end of file
@@ -0,0 +1,407 @@
+//
+//  Copyright 2021 - 2023 XiaoJSoft Studio. All rights reserved.
+//  Use of this source code is governed by a BSD-style license that can be
+//  found in the LICENSE.md file.
+//
+
+//
+//  Imports.
+//
+
+//  Imported modules.
+const NodeTest = 
+    require("node:test");
+const NodeAssert = 
+    require("node:assert");
+const Lc3Fft = 
+    require("./../lc3/math/fft");
+const Lc3FftMxPrebuilt = 
+    require("./../lc3/math/fft-mx-prebuilt");
+const Lc3FftTfmBluestein = 
+    require("./../lc3/math/fft-tfm-bluestein");
+const Lc3Unrolled = 
+    require("./../lc3/math/unrolled");
+const Lc3Error = 
+    require("./../lc3/error");
+
+//  Imported classes.
+const FFT = 
+    Lc3Fft.FFT;
+const FFTBluesteinTransformer = 
+    Lc3FftTfmBluestein.FFTBluesteinTransformer;
+const LC3IllegalParameterError = 
+    Lc3Error.LC3IllegalParameterError;
+
+//  Imported functions.
+const FindPrebuiltMixedRadixFFT = 
+    Lc3FftMxPrebuilt.FindPrebuiltMixedRadixFFT;
+const FindPrebuiltMixedRadixIRFFT = 
+    Lc3FftMxPrebuilt.FindPrebuiltMixedRadixIRFFT;
+const FindPrebuiltMixedRadixPairedRFFT = 
+    Lc3FftMxPrebuilt.FindPrebuiltMixedRadixPairedRFFT;
+const EnableUnrolledKernels = 
+    Lc3Unrolled.EnableUnrolledKernels;
+const DisableUnrolledKernels = 
+    Lc3Unrolled.DisableUnrolledKernels;
+const describe = 
+    NodeTest.describe;
+const it = 
+    NodeTest.it;
+
+//
+//  Constants.
+//
+
+/**
+ *  Block sizes to be tested (all prebuilt sizes, a Bluestein size and a 
+ *  non-prebuilt power-of-two size).
+ * 
+ *  @type {Number[]}
+ */
+const SIZES = [
+    60, 64, 80, 97, 120, 128, 160, 180, 240, 256, 320, 360, 480, 512, 1024, 
+    2048
+];
+
+/**
+ *  Block sizes that have a prebuilt permuted-order kernel.
+ * 
+ *  @type {Number[]}
+ */
+const PERMUTED_SIZES = [64, 128];
+
+/**
+ *  Block sizes that have prebuilt unrolled real-data kernels (the LTPF 
+ *  correlation sizes, see FindBestCorrelationSize()).
+ * 
+ *  @type {Number[]}
+ */
+const UNROLLED_REAL_SIZES = [160, 180];
+
+/**
+ *  Block sizes of the Bluestein transformer to be tested, as (N, whether 
+ *  the padded size M has a prebuilt kernel) pairs.
+ * 
+ *  @type {Array<[Number, Boolean]>}
+ */
+const BLUESTEIN_SIZES = [
+    [17, true],         //  M = 64.
+    [97, true],         //  M = 256.
+    [300, true],        //  M = 1024.
+    [600, false]        //  M = 2048.
+];
+
+//
+//  Private functions.
+//
+
+/**
+ *  Get a pseudo-random sequence (uniformly distributed within [-1, 1)).
+ * 
+ *  @param {Number} N 
+ *    - The sequence size.
+ *  @param {Number} seed 
+ *    - The seed.
+ *  @returns {Number[]}
+ *    - The sequence.
+ */
+function RandomSequence(N, seed) {
+    let s = (seed >>> 0) || 1;
+    let x = new Array(N);
+    for (let n = 0; n < N; ++n) {
+        //  Xorshift32.
+        s ^= (s << 13);
+        s >>>= 0;
+        s ^= (s >>> 17);
+        s ^= (s << 5);
+        s >>>= 0;
+        x[n] = s / 2147483648 - 1;
+    }
+    return x;
+}
+
+/**
+ *  Apply the (naive) discrete Fourier transform.
+ * 
+ *  @param {Number[]} x_re 
+ *    - The real part of each point.
+ *  @param {Number[]} x_im 
+ *    - The imaginary part of each point.
+ *  @returns {Number[][]}
+ *    - The real part and the imaginary part of each output.
+ */
+function NaiveDFT(x_re, x_im) {
+    let N = x_re.length;
+    let y_re = new Array(N), y_im = new Array(N);
+    for (let k = 0; k < N; ++k) {
+        let s_re = 0, s_im = 0;
+        for (let n = 0; n < N; ++n) {
+            let phi = -2 * Math.PI * ((n * k) % N) / N;
+            let c = Math.cos(phi), s = Math.sin(phi);
+            s_re += x_re[n] * c - x_im[n] * s;
+            s_im += x_re[n] * s + x_im[n] * c;
+        }
+        y_re[k] = s_re;
+        y_im[k] = s_im;
+    }
+    return [y_re, y_im];
+}
+
+/**
+ *  Assert that two sequences are (nearly) equal.
+ * 
+ *  @param {Number[]} actual 
+ *    - The actual sequence.
+ *  @param {Number[]} expected 
+ *    - The expected sequence.
+ *  @param {Number} tolerance 
+ *    - The maximum absolute error.
+ *  @param {Number} [count]
+ *    - The count of the (leading) elements to be compared.
+ */
+function AssertClose(actual, expected, tolerance, count = expected.length) {
+    for (let n = 0; n < count; ++n) {
+        let err = Math.abs(actual[n] - expected[n]);
+        if (!(err <= tolerance)) {
+            NodeAssert.fail(
+                "Element " + n.toString() + " differs (" + 
+                actual[n].toString() + " vs. " + expected[n].toString() + 
+                ")."
+            );
+        }
+    }
+}
+
+//
+//  Tests.
+//
+
+describe("FFT", function() {
+    for (let N of SIZES) {
+        describe("N=" + N.toString(), function() {
+            let fft = new FFT(N);
+            let x_re = RandomSequence(N, N);
+            let x_im = RandomSequence(N, N + 1);
+            let X = NaiveDFT(x_re, x_im);
+            let tolerance = 1e-12 * N;
+
+            it("transform() matches the DFT", function() {
+                let y_re = x_re.slice(), y_im = x_im.slice();
+                fft.transform(y_re, y_im);
+                AssertClose(y_re, X[0], tolerance);
+                AssertClose(y_im, X[1], tolerance);
+            });
+
+            it("transformPermuted() matches the DFT", function() {
+                let R = fft.getPermutedOutputIndexes();
+                let natural = X[0].map(function(_, k) {
+                    return k;
+                });
+                if (PERMUTED_SIZES.indexOf(N) >= 0) {
+                    //  The outputs are permuted.
+                    NodeAssert.notDeepStrictEqual(R, natural);
+                    NodeAssert.deepStrictEqual(
+                        R.slice().sort(function(a, b) {
+                            return a - b;
+                        }), 
+                        natural
+                    );
+                } else {
+                    //  Without a permuted-order kernel, the outputs are in 
+                    //  natural order.
+                    NodeAssert.deepStrictEqual(R, natural);
+                }
+                let y_re = x_re.slice(), y_im = x_im.slice();
+                fft.transformPermuted(y_re, y_im);
+                let z_re = new Array(N), z_im = new Array(N);
+                for (let k = 0; k < N; ++k) {
+                    z_re[k] = y_re[R[k]];
+                    z_im[k] = y_im[R[k]];
+                }
+                AssertClose(z_re, X[0], tolerance);
+                AssertClose(z_im, X[1], tolerance);
+            });
+
+            it("transformInverse() reverses transform()", function() {
+                let y_re = X[0].slice(), y_im = X[1].slice();
+                fft.transformInverse(y_re, y_im);
+                AssertClose(y_re, x_re, 1e-12);
+                AssertClose(y_im, x_im, 1e-12);
+
+                y_re = x_re.slice();
+                y_im = x_im.slice();
+                fft.transform(y_re, y_im);
+                fft.transformInverse(y_re, y_im);
+                AssertClose(y_re, x_re, 1e-12);
+                AssertClose(y_im, x_im, 1e-12);
+            });
+
+            //  Spectra of the real part and the imaginary part (as two real 
+            //  signals).
+            let zeros = new Array(N).fill(0);
+            let X1 = NaiveDFT(x_re, zeros);
+            let X2 = NaiveDFT(x_im, zeros);
+            let H = (N >>> 1) + 1;
+
+            it("transformReal() matches the DFT", function() {
+                let y_re = new Array(N), y_im = new Array(N);
+                fft.transformReal(x_re, y_re, y_im);
+                AssertClose(y_re, X1[0], tolerance, H);
+                AssertClose(y_im, X1[1], tolerance, H);
+            });
+
+            it("transformInverseReal() reverses transformReal()", function() {
+                //  The inputs above the first (floor(N / 2) + 1) ones shall 
+                //  be ignored.
+                let y_re = X1[0].slice(), y_im = X1[1].slice();
+                for (let k = H; k < N; ++k) {
+                    y_re[k] = NaN;
+                    y_im[k] = NaN;
+                }
+                let y = new Array(N);
+                fft.transformInverseReal(y_re, y_im, y);
+                AssertClose(y, x_re, 1e-12);
+            });
+
+            it("transformPairedReal() matches the DFTs", function() {
+                let y_re = x_re.slice(), y_im = x_im.slice();
+                fft.transformPairedReal(y_re, y_im);
+                let z1_re = new Array(H), z1_im = new Array(H);
+                let z2_re = new Array(H), z2_im = new Array(H);
+                for (let k = 0; k < H; ++k) {
+                    z1_re[k] = y_re[k];
+                    z1_im[k] = y_im[k];
+                    if (k == 0 || 2 * k == N) {
+                        //  Both outputs are real, the one of the second 
+                        //  signal is stored at the imaginary part.
+                        z1_im[k] = 0;
+                        z2_re[k] = y_im[k];
+                        z2_im[k] = 0;
+                    } else {
+                        //  Conjugate of the output of the second signal.
+                        z2_re[k] = y_re[N - k];
+                        z2_im[k] = -y_im[N - k];
+                    }
+                }
+                AssertClose(z1_re, X1[0], tolerance, H);
+                AssertClose(z1_im, X1[1], tolerance, H);
+                AssertClose(z2_re, X2[0], tolerance, H);
+                AssertClose(z2_im, X2[1], tolerance, H);
+            });
+        });
+    }
+
+    it("rejects incorrect block sizes", function() {
+        let fft = new FFT(60);
+        NodeAssert.throws(function() {
+            fft.transform(new Array(59), new Array(60));
+        }, LC3IllegalParameterError);
+        NodeAssert.throws(function() {
+            fft.transformPermuted(new Array(60), new Array(61));
+        }, LC3IllegalParameterError);
+        NodeAssert.throws(function() {
+            fft.transformInverse(new Array(61), new Array(61));
+        }, LC3IllegalParameterError);
+        NodeAssert.throws(function() {
+            fft.transformReal(new Array(60), new Array(60), new Array(59));
+        }, LC3IllegalParameterError);
+        NodeAssert.throws(function() {
+            fft.transformInverseReal(
+                new Array(60), new Array(60), new Array(61)
+            );
+        }, LC3IllegalParameterError);
+        NodeAssert.throws(function() {
+            fft.transformPairedReal(new Array(60), new Array(59));
+        }, LC3IllegalParameterError);
+    });
+});
+
+describe("FFT (unrolled real-data kernels)", function() {
+    for (let N of UNROLLED_REAL_SIZES) {
+        describe("N=" + N.toString(), function() {
+            let fft = null;
+            EnableUnrolledKernels();
+            try {
+                fft = new FFT(N);
+            } finally {
+                DisableUnrolledKernels();
+            }
+            let x = RandomSequence(N, N);
+            let x2 = RandomSequence(N, N + 1);
+            let zeros = new Array(N).fill(0);
+            let X = NaiveDFT(x, zeros);
+            let X2 = NaiveDFT(x2, zeros);
+            let H = (N >>> 1) + 1;
+
+            it("are only looked up if enabled", function() {
+                NodeAssert.strictEqual(FindPrebuiltMixedRadixIRFFT(N), null);
+                NodeAssert.strictEqual(
+                    FindPrebuiltMixedRadixPairedRFFT(N), 
+                    null
+                );
+                EnableUnrolledKernels();
+                try {
+                    NodeAssert.notStrictEqual(
+                        FindPrebuiltMixedRadixIRFFT(N), 
+                        null
+                    );
+                    NodeAssert.notStrictEqual(
+                        FindPrebuiltMixedRadixPairedRFFT(N), 
+                        null
+                    );
+                } finally {
+                    DisableUnrolledKernels();
+                }
+            });
+
+            it("transformPairedReal() matches the DFTs", function() {
+                let y_re = x.slice(), y_im = x2.slice();
+                fft.transformPairedReal(y_re, y_im);
+                let z2_re = new Array(H), z2_im = new Array(H);
+                for (let k = 0; k < H; ++k) {
+                    if (k == 0 || 2 * k == N) {
+                        z2_re[k] = y_im[k];
+                        z2_im[k] = 0;
+                        y_im[k] = 0;
+                    } else {
+                        z2_re[k] = y_re[N - k];
+                        z2_im[k] = -y_im[N - k];
+                    }
+                }
+                AssertClose(y_re, X[0], 1e-12 * N, H);
+                AssertClose(y_im, X[1], 1e-12 * N, H);
+                AssertClose(z2_re, X2[0], 1e-12 * N, H);
+                AssertClose(z2_im, X2[1], 1e-12 * N, H);
+            });
+
+            it("transformInverseReal() reverses the DFT", function() {
+                let y_re = X[0].slice(), y_im = X[1].slice();
+                let y = new Array(N);
+                fft.transformInverseReal(y_re, y_im, y);
+                AssertClose(y, x, 1e-12);
+            });
+        });
+    }
+});
+
+describe("FFTBluesteinTransformer", function() {
+    for (let [N, prebuilt] of BLUESTEIN_SIZES) {
+        it("N=" + N.toString() + " matches the DFT", function() {
+            let M = 1;
+            while (M < 2 * N - 1) {
+                M *= 2;
+            }
+            NodeAssert.strictEqual(
+                FindPrebuiltMixedRadixFFT(M) !== null, 
+                prebuilt
+            );
+            let tfm = new FFTBluesteinTransformer(N);
+            let x_re = RandomSequence(N, N);
+            let x_im = RandomSequence(N, N + 1);
+            let X = NaiveDFT(x_re, x_im);
+            tfm.transform(x_re, x_im);
+            AssertClose(x_re, X[0], 1e-12 * M);
+            AssertClose(x_im, X[1], 1e-12 * M);
+        });
+    }
+});
\ No newline at end of file
@@ -0,0 +1,282 @@
+//
+//  Copyright 2021 - 2023 XiaoJSoft Studio. All rights reserved.
+//  Use of this source code is governed by a BSD-style license that can be
+//  found in the LICENSE.md file.
+//
+
+//
+//  Imports.
+//
+
+//  Imported modules.
+const NodeTest = 
+    require("node:test");
+const NodeAssert = 
+    require("node:assert");
+const Lc3Fs = 
+    require("./../lc3/common/fs");
+const Lc3Nms = 
+    require("./../lc3/common/nms");
+const Lc3TblNF = 
+    require("./../lc3/tables/nf");
+const Lc3TblW = 
+    require("./../lc3/tables/w");
+const Lc3Mdct = 
+    require("./../lc3/math/mdct");
+const Lc3MdctPrebuilt = 
+    require("./../lc3/math/mdct-prebuilt");
+const Lc3EcLdMdct = 
+    require("./../lc3/encoder/ld-mdct");
+const Lc3DcLdMdct = 
+    require("./../lc3/decoder/ld-mdct");
+
+//  Imported classes.
+const LC3SampleRate = 
+    Lc3Fs.LC3SampleRate;
+const LC3FrameDuration = 
+    Lc3Nms.LC3FrameDuration;
+const LC3MDCTAnalyzer = 
+    Lc3EcLdMdct.LC3MDCTAnalyzer;
+const LC3MDCTSynthesizer = 
+    Lc3DcLdMdct.LC3MDCTSynthesizer;
+
+//  Imported constants.
+const NF_TBL = 
+    Lc3TblNF.NF_TBL;
+const W_TBL = 
+    Lc3TblW.W_TBL;
+
+//  Imported functions.
+const EnableUnrolledKernels = 
+    Lc3Mdct.EnableUnrolledKernels;
+const DisableUnrolledKernels = 
+    Lc3Mdct.DisableUnrolledKernels;
+const FindPrebuiltMDCT = 
+    Lc3MdctPrebuilt.FindPrebuiltMDCT;
+const FindPrebuiltWindowedMDCT = 
+    Lc3MdctPrebuilt.FindPrebuiltWindowedMDCT;
+const describe = 
+    NodeTest.describe;
+const it = 
+    NodeTest.it;
+
+//
+//  Constants.
+//
+
+/**
+ *  Frame durations to be tested.
+ * 
+ *  @type {Array<InstanceType<typeof LC3FrameDuration>>}
+ */
+const DURATIONS = [
+    LC3FrameDuration.NMS_10000US, 
+    LC3FrameDuration.NMS_07500US
+];
+
+/**
+ *  Sample rates to be tested.
+ * 
+ *  @type {Array<InstanceType<typeof LC3SampleRate>>}
+ */
+const SAMPLE_RATES = [
+    LC3SampleRate.FS_08000, 
+    LC3SampleRate.FS_16000, 
+    LC3SampleRate.FS_24000, 
+    LC3SampleRate.FS_32000, 
+    LC3SampleRate.FS_44100, 
+    LC3SampleRate.FS_48000
+];
+
+/**
+ *  Frame count of each case.
+ * 
+ *  @type {Number}
+ */
+const FRAME_COUNT = 4;
+
+//
+//  Private functions.
+//
+
+/**
+ *  Get a pseudo-random sequence (uniformly distributed within [-A, A)).
+ * 
+ *  @param {Number} N 
+ *    - The sequence size.
+ *  @param {Number} A 
+ *    - The amplitude.
+ *  @param {Number} seed 
+ *    - The seed.
+ *  @returns {Number[]}
+ *    - The sequence.
+ */
+function RandomSequence(N, A, seed) {
+    let s = (seed >>> 0) || 1;
+    let x = new Array(N);
+    for (let n = 0; n < N; ++n) {
+        //  Xorshift32.
+        s ^= (s << 13);
+        s >>>= 0;
+        s ^= (s >>> 17);
+        s ^= (s << 5);
+        s >>>= 0;
+        x[n] = A * (s / 2147483648 - 1);
+    }
+    return x;
+}
+
+/**
+ *  Assert that two sequences are (nearly) equal.
+ * 
+ *  @param {Number[]} actual 
+ *    - The actual sequence.
+ *  @param {Number[]} expected 
+ *    - The expected sequence.
+ *  @param {Number} tolerance 
+ *    - The maximum absolute error.
+ */
+function AssertClose(actual, expected, tolerance) {
+    NodeAssert.strictEqual(actual.length, expected.length);
+    for (let n = 0; n < expected.length; ++n) {
+        let err = Math.abs(actual[n] - expected[n]);
+        if (!(err <= tolerance)) {
+            NodeAssert.fail(
+                "Element " + n.toString() + " differs (" + 
+                actual[n].toString() + " vs. " + expected[n].toString() + 
+                ")."
+            );
+        }
+    }
+}
+
+/**
+ *  Create a LD-MDCT module with (or without) the prebuilt unrolled kernels.
+ * 
+ *  @param {Function} ctor 
+ *    - The module constructor.
+ *  @param {Boolean} unrolled 
+ *    - True if the unrolled kernels shall be used.
+ *  @param {InstanceType<typeof LC3FrameDuration>} Nms 
+ *    - The frame duration.
+ *  @param {InstanceType<typeof LC3SampleRate>} Fs 
+ *    - The sample rate.
+ *  @returns {Object}
+ *    - The module.
+ */
+function CreateModule(ctor, unrolled, Nms, Fs) {
+    if (unrolled) {
+        EnableUnrolledKernels();
+    }
+    try {
+        return new ctor(Nms, Fs);
+    } finally {
+        DisableUnrolledKernels();
+    }
+}
+
+//
+//  Tests.
+//
+
+describe("LD-MDCT kernel dispatch", function() {
+    for (let Nms of DURATIONS) {
+        for (let Fs of SAMPLE_RATES) {
+            let index_Nms = Nms.getInternalIndex();
+            let index_Fs = Fs.getInternalIndex();
+            let NF = NF_TBL[index_Nms][index_Fs];
+            let W = W_TBL[index_Nms][index_Fs];
+            let name = (
+                Nms.toMicroseconds().toString() + "us-" + 
+                Fs.getSampleRate().toString() + "hz"
+            );
+
+            describe(name, function() {
+                it("has a windowed kernel only", function() {
+                    NodeAssert.notStrictEqual(
+                        FindPrebuiltWindowedMDCT(W), 
+                        null
+                    );
+                    NodeAssert.strictEqual(FindPrebuiltMDCT(NF), null);
+                });
+
+                //  The generic transformers compute their twiddle factors at 
+                //  runtime, so both may differ in rounding (the tolerances 
+                //  scale with the input amplitude and the frame size).
+                it("analyzer matches the generic MDCT", function() {
+                    let a0 = CreateModule(LC3MDCTAnalyzer, false, Nms, Fs);
+                    let a1 = CreateModule(LC3MDCTAnalyzer, true, Nms, Fs);
+                    for (let f = 0; f < FRAME_COUNT; ++f) {
+                        let xs = RandomSequence(NF, 32768, NF + f).map(
+                            Math.round
+                        );
+                        a0.update(xs);
+                        a1.update(xs);
+                        AssertClose(
+                            a1.getSpectralCoefficients(), 
+                            a0.getSpectralCoefficients(), 
+                            1e-12 * 32768 * NF
+                        );
+                    }
+                });
+
+                it("synthesizer matches the generic IMDCT", function() {
+                    let s0 = CreateModule(LC3MDCTSynthesizer, false, Nms, Fs);
+                    let s1 = CreateModule(LC3MDCTSynthesizer, true, Nms, Fs);
+                    for (let f = 0; f < FRAME_COUNT; ++f) {
+                        let X = RandomSequence(NF, 1000, NF + f);
+                        AssertClose(
+                            s1.update(X), 
+                            s0.update(X), 
+                            1e-12 * 1000 * NF
+                        );
+                    }
+                });
+
+                it("pruned IMDCT kernels match the full one", function() {
+                    //  Each pruned kernel is tested with the spectra that 
+                    //  fill all its nonzero bins (and one bin less).
+                    let prebuilt = FindPrebuiltWindowedMDCT(W);
+                    let s1 = new Array(NF >>> 1), s2 = new Array(NF >>> 1);
+                    for (let pruned of prebuilt.inversePruned) {
+                        NodeAssert.ok(pruned.count < NF);
+                        let fn = pruned.loadInverse();
+                        NodeAssert.strictEqual(pruned.loadInverse(), fn);
+                        for (let nz of [pruned.count - 1, pruned.count]) {
+                            let X = RandomSequence(NF, 1000, nz);
+                            X.fill(0, nz);
+                            let y0 = new Array(NF << 1);
+                            let y1 = new Array(NF << 1);
+                            prebuilt.inverse(X, y0, s1, s2);
+                            fn(X, y1, s1, s2);
+                            AssertClose(y1, y0, 1e-12 * 1000 * NF);
+                        }
+                    }
+                });
+
+                it("pruned synthesizer matches the generic IMDCT", function() {
+                    //  Change the nonzero-bin count frame by frame (so that 
+                    //  each kernel is switched to and from).
+                    let s0 = CreateModule(LC3MDCTSynthesizer, false, Nms, Fs);
+                    let s1 = CreateModule(LC3MDCTSynthesizer, true, Nms, Fs);
+                    let prebuilt = FindPrebuiltWindowedMDCT(W);
+                    let counts = [];
+                    for (let pruned of prebuilt.inversePruned) {
+                        counts.push(pruned.count, pruned.count + 1, NF);
+                    }
+                    counts.push(1, NF);
+                    for (let f = 0; f < counts.length; ++f) {
+                        let NZ = counts[f];
+                        let X = RandomSequence(NF, 1000, NF + f);
+                        X.fill(0, NZ);
+                        AssertClose(
+                            s1.update(X, NZ), 
+                            s0.update(X, NZ), 
+                            1e-12 * 1000 * NF
+                        );
+                    }
+                });
+            });
+        }
+    }
+});
\ No newline at end of file
@@ -0,0 +1,87 @@
+//
+//  Copyright 2021 - 2023 XiaoJSoft Studio. All rights reserved.
+//  Use of this source code is governed by a BSD-style license that can be
+//  found in the LICENSE.md file.
+//
+
+//
+//  Imports.
+//
+
+//  Imported modules.
+const NodeTest = 
+    require("node:test");
+const NodeAssert = 
+    require("node:assert");
+const Lc3ScratchArena = 
+    require("./../lc3/common/scratch_arena");
+const Lc3Error = 
+    require("./../lc3/error");
+
+//  Imported classes.
+const LC3ScratchArena = 
+    Lc3ScratchArena.LC3ScratchArena;
+const LC3IllegalParameterError = 
+    Lc3Error.LC3IllegalParameterError;
+
+//  Imported functions.
+const describe = 
+    NodeTest.describe;
+const it = 
+    NodeTest.it;
+
+//
+//  Tests.
+//
+
+describe("LC3ScratchArena", function() {
+    it("allocates disjoint views of one storage", function() {
+        let arena = new LC3ScratchArena(16);
+        let a = arena.allocate(4);
+        let b = arena.allocate(12);
+        NodeAssert.ok(a instanceof Float64Array);
+        NodeAssert.strictEqual(a.length, 4);
+        NodeAssert.strictEqual(b.length, 12);
+        NodeAssert.strictEqual(a.buffer, b.buffer);
+        NodeAssert.strictEqual(b.byteOffset, a.byteOffset + 4 * 8);
+        a.fill(1);
+        b.fill(2);
+        NodeAssert.deepStrictEqual(Array.from(a), [1, 1, 1, 1]);
+        NodeAssert.strictEqual(arena.getAllocatedSize(), 16);
+    });
+
+    it("allocates a new storage once exhausted", function() {
+        let arena = new LC3ScratchArena(8);
+        let a = arena.allocate(6);
+        a.fill(1);
+        let b = arena.allocate(4);
+        let c = arena.allocate(20);
+        NodeAssert.notStrictEqual(a.buffer, b.buffer);
+        NodeAssert.notStrictEqual(b.buffer, c.buffer);
+        NodeAssert.strictEqual(c.length, 20);
+        b.fill(2);
+        c.fill(3);
+        NodeAssert.deepStrictEqual(Array.from(a), [1, 1, 1, 1, 1, 1]);
+        NodeAssert.strictEqual(arena.getAllocatedSize(), 30);
+    });
+
+    it("works without an initial capacity", function() {
+        let arena = new LC3ScratchArena();
+        NodeAssert.strictEqual(arena.allocate(0).length, 0);
+        NodeAssert.strictEqual(arena.allocate(5).length, 5);
+        NodeAssert.strictEqual(arena.getAllocatedSize(), 5);
+    });
+
+    it("rejects illegal sizes", function() {
+        NodeAssert.throws(function() {
+            new LC3ScratchArena(-1);
+        }, LC3IllegalParameterError);
+        NodeAssert.throws(function() {
+            new LC3ScratchArena(1.5);
+        }, LC3IllegalParameterError);
+        let arena = new LC3ScratchArena(4);
+        NodeAssert.throws(function() {
+            arena.allocate(-2);
+        }, LC3IllegalParameterError);
+    });
+});
\ No newline at end of file